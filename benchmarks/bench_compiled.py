@@ -0,0 +1,123 @@
+'''Benchmark the compiled build against the pure python build
+
+Runs the same workloads in two processes, one importing the compiled
+modules of utils/compiled.py and one importing their python source
+(GENIE_PARSER_PURE=1):
+    * Common.convert_intf_name over a mix of interface names
+    * ShowIpRoute.cli on a synthetic 'show ip route' output
+    * ShowArp.cli on a synthetic 'show arp' output
+    * cli() of every golden output of the compiled iosxe modules
+
+Build the compiled modules first with 'make compile_inplace'.
+
+Usage:
+    python benchmarks/bench_compiled.py --routes 20000 --repeat 3
+'''
+
+import os
+import sys
+import json
+import runpy
+import pathlib
+import argparse
+import importlib
+import subprocess
+from unittest.mock import Mock
+
+from bench_distributor import build_table, timed
+
+INTERFACES = ['Gi0/0/1', 'GigabitEthernet0/0/1', 'Te1/1/2', 'Fa0/1',
+              'Po10', 'Vl100', 'Lo0', 'Tu1', 'Hu1/0/3', 'mgmt0']
+
+
+def goldens():
+    '''(parser class, output, arguments) of the goldens of the compiled
+    iosxe modules'''
+    from genie.libs import parser
+    from genie.libs.parser.utils import compiled
+
+    modules = [importlib.import_module(name) for name in compiled.MODULES
+               if '.iosxe.' in name]
+    root = pathlib.Path(parser.__file__).parent / 'iosxe' / 'tests'
+    for folder in sorted(root.iterdir()):
+        cls = next((getattr(module, folder.name) for module in modules
+                    if folder.name in vars(module)), None)
+        if cls is None:
+            continue
+        for output in sorted((folder / 'cli' / 'equal').glob(
+                '[!.]*_output.txt')):
+            arguments = pathlib.Path(str(output).replace('_output.txt',
+                                                         '_arguments.json'))
+            kwargs = json.loads(arguments.read_text()) \
+                if arguments.exists() else {}
+            yield cls, output.read_text(), kwargs
+
+
+def run_goldens(cases):
+    for cls, output, kwargs in cases:
+        try:
+            cls(device=Mock()).cli(output=output, **kwargs)
+        except Exception:
+            pass
+
+
+def worker(args):
+    from genie.libs.parser.utils import compiled
+    from genie.libs.parser.utils.common import Common
+    from genie.libs.parser.iosxe.show_arp import ShowArp
+    from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+    from bench_records import arp
+
+    names = INTERFACES * (args.names // len(INTERFACES))
+    table = build_table(args.routes)
+    arp_table = arp(args.routes)
+    cases = list(goldens())
+    times = {
+        'convert_intf_name': timed(
+            lambda: [Common.convert_intf_name(name) for name in names],
+            repeat=args.repeat)[1],
+        'ShowIpRoute.cli': timed(ShowIpRoute(device=Mock()).cli,
+                                 output=table, repeat=args.repeat)[1],
+        'ShowArp.cli': timed(ShowArp(device=Mock()).cli, output=arp_table,
+                             repeat=args.repeat)[1],
+        'goldens ({})'.format(len(cases)): timed(run_goldens, cases,
+                                                 repeat=args.repeat)[1],
+    }
+    print(json.dumps({'compiled': all(compiled.status().values()),
+                      'times': times}))
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--routes', type=int, default=20000)
+    my_parser.add_argument('--names', type=int, default=200000)
+    my_parser.add_argument('--repeat', type=int, default=3)
+    my_parser.add_argument('--worker', action='store_true',
+                           help=argparse.SUPPRESS)
+    args = my_parser.parse_args()
+    if args.worker:
+        return worker(args)
+
+    results = {}
+    for build, pure in (('pure', '1'), ('compiled', '')):
+        env = dict(os.environ, GENIE_PARSER_PURE=pure)
+        output = subprocess.check_output(
+            [sys.executable, __file__, '--worker'] + sys.argv[1:], env=env,
+            cwd=os.path.dirname(os.path.abspath(__file__)))
+        results[build] = json.loads(output.decode().splitlines()[-1])
+    if not results['compiled']['compiled']:
+        sys.exit('The modules are not compiled, build them with '
+                 'make compile_inplace')
+
+    print('{} routes and arp entries, {} names, best of {}'.format(
+        args.routes, args.names, args.repeat))
+    print('{:<28}{:>10}{:>10}{:>10}'.format('workload', 'pure', 'compiled',
+                                            'speedup'))
+    for name, pure_time in results['pure']['times'].items():
+        compiled_time = results['compiled']['times'][name]
+        print('{:<28}{:>9.3f}s{:>9.3f}s{:>9.2f}x'.format(
+            name, pure_time, compiled_time, pure_time / compiled_time))
+
+
+if __name__ == '__main__':
+    main()
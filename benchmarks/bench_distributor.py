@@ -0,0 +1,110 @@
+'''Benchmark the schema validation of the distributor parsers
+
+Builds a synthetic 'show ip route' output and compares:
+    * a ShowIpRoute parse, validated once
+    * a ShowIpRouteDistributor parse delegating to ShowIpRoute
+    * the former distributor, calling ShowIpRoute().parse() and validating
+      the result a second time in its own parse()
+
+Usage:
+    python benchmarks/bench_distributor.py --routes 20000
+'''
+
+import gc
+import time
+import argparse
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Schema
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute, \
+    ShowIpRouteDistributor
+
+HEADER = '''\
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+       D - EIGRP, EX - EIGRP external, O - OSPF, IA - OSPF inter area
+
+Gateway of last resort is 192.168.0.1 to network 0.0.0.0
+'''
+
+# B        10.0.1.0/24 [20/0] via 192.168.0.1, 1w2d
+ROUTE = 'B        {}.{}.{}.0/24 [20/0] via 192.168.{}.1, 1w2d'
+
+
+def build_table(routes):
+    '''show ip route output of distinct /24 routes'''
+    lines = [HEADER]
+    for i in range(routes):
+        lines.append(ROUTE.format(10 + i // 65536, i // 256 % 256, i % 256,
+                                  i % 4))
+    return '\n'.join(lines)
+
+
+class FormerShowIpRouteDistributor(MetaParser):
+    '''ShowIpRouteDistributor before the delegation'''
+    def cli(self, output=None):
+        parser = ShowIpRoute(self.device)
+        self.schema = parser.schema
+        return parser.parse(output=output)
+
+
+def timed(func, *args, repeat=1, **kwargs):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def validations(parser_cls, output):
+    '''number of validations of the whole result in a parse'''
+    count = []
+    validate = Schema.validate
+
+    def counting(schema, data, *args, **kwargs):
+        if schema.schema is ShowIpRoute.schema:
+            count.append(1)
+        return validate(schema, data, *args, **kwargs)
+
+    with patch.object(Schema, 'validate', counting):
+        parser_cls(device=Mock()).parse(output=output)
+    return len(count)
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--routes', type=int, default=20000)
+    my_parser.add_argument('--repeat', type=int, default=3)
+    args = my_parser.parse_args()
+    repeat = args.repeat
+
+    output = build_table(args.routes)
+    print('show ip route: {} routes, best of {}'.format(args.routes, repeat))
+
+    direct, direct_time = timed(ShowIpRoute(device=Mock()).parse,
+                                output=output, repeat=repeat)
+    _, validate_time = timed(Schema(ShowIpRoute.schema).validate, direct,
+                             repeat=repeat)
+    delegated, delegated_time = timed(
+        ShowIpRouteDistributor(device=Mock()).parse, output=output,
+        repeat=repeat)
+    former, former_time = timed(
+        FormerShowIpRouteDistributor(device=Mock()).parse, output=output,
+        repeat=repeat)
+
+    assert delegated == direct == former, 'distributor result differs'
+    print('{:<32}{:>10.3f}s'.format('schema validation', validate_time))
+    print('{:<32}{:>10.3f}s'.format('ShowIpRoute parse', direct_time))
+    print('{:<32}{:>10.3f}s  {} validation'.format(
+        'distributor, delegated', delegated_time,
+        validations(ShowIpRouteDistributor, output)))
+    print('{:<32}{:>10.3f}s  {} validations'.format(
+        'distributor, former', former_time,
+        validations(FormerShowIpRouteDistributor, output)))
+
+
+if __name__ == '__main__':
+    main()
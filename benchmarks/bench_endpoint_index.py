@@ -0,0 +1,137 @@
+'''Benchmark the fleet wide endpoint index
+
+Spreads --endpoints endpoints over --devices switches. Each switch gives the
+parsed 'show mac address-table' and 'show device-tracking database' of its
+endpoints, and the benchmark times:
+    * the first update of every switch
+    * the update of every switch again, --churn of its endpoints moved to
+      another port or gone
+    * MAC -> location and IP -> MAC lookups
+and the memory of the index against that of the parsed outputs it holds.
+
+Usage:
+    python benchmarks/bench_endpoint_index.py --endpoints 2000000 --devices 400
+'''
+
+import gc
+import time
+import random
+import socket
+import argparse
+import tracemalloc
+
+from genie.libs.parser.utils.endpoint_index import EndpointIndex
+
+from bench_distributor import timed
+
+
+def mac(value):
+    digits = '{:012x}'.format(value)
+    return '{}.{}.{}'.format(digits[:4], digits[4:8], digits[8:])
+
+
+def endpoints(device, count, rand, churn=0.0):
+    '''(mac, interface, vlan, ip) of the endpoints of a switch'''
+    result = []
+    for i in range(count):
+        endpoint = device * count + i
+        port = endpoint % 48 + 1
+        if churn and rand.random() < churn:
+            if rand.random() < 0.5:
+                continue
+            port = rand.randrange(1, 49)
+        result.append((mac(0x5000_0000_0000 + endpoint),
+                       'GigabitEthernet1/0/{}'.format(port),
+                       100 + port % 8,
+                       socket.inet_ntoa((0x0a000000 + endpoint).to_bytes(
+                           4, 'big'))))
+    return result
+
+
+def outputs(entries):
+    '''parsed show mac address-table and show device-tracking database'''
+    vlans = {}
+    for address, interface, vlan, _ in entries:
+        vlan_dict = vlans.setdefault(str(vlan), {'vlan': vlan,
+                                                 'mac_addresses': {}})
+        vlan_dict['mac_addresses'][address] = {
+            'mac_address': address,
+            'interfaces': {interface: {'interface': interface,
+                                       'entry_type': 'dynamic'}}}
+    tracking = {'device': {
+        i: {'dev_code': 'ARP', 'network_layer_address': ip,
+            'link_layer_address': address, 'interface': interface,
+            'vlan_id': vlan, 'pref_level_code': 5, 'age': '10s',
+            'state': 'REACHABLE'}
+        for i, (address, interface, vlan, ip) in enumerate(entries, 1)}}
+    return {'mac_table': {'vlans': vlans}}, tracking
+
+
+def update_all(index, devices, per_device, rand, churn=0.0):
+    '''time of the updates only, the outputs are built in between'''
+    elapsed = 0.0
+    for device in range(devices):
+        mac_table, tracking = outputs(endpoints(device, per_device, rand,
+                                                churn))
+        start = time.perf_counter()
+        index.update('switch{}'.format(device), mac_table)
+        index.update('switch{}'.format(device), tracking)
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--endpoints', type=int, default=2000000)
+    my_parser.add_argument('--devices', type=int, default=400)
+    my_parser.add_argument('--churn', type=float, default=0.01)
+    my_parser.add_argument('--lookups', type=int, default=200000)
+    args = my_parser.parse_args()
+
+    per_device = args.endpoints // args.devices
+    total = per_device * args.devices
+    rand = random.Random(1)
+
+    gc.collect()
+    tracemalloc.start()
+    mac_table, tracking = outputs(endpoints(0, per_device, rand))
+    parsed_mb = tracemalloc.get_traced_memory()[0] * args.devices / 1e6
+    del mac_table, tracking
+    tracemalloc.stop()
+
+    index = EndpointIndex()
+    gc.collect()
+    tracemalloc.start()
+    first = update_all(index, args.devices, per_device, rand)
+    index_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+    # the same without tracemalloc
+    index = EndpointIndex()
+    first = update_all(index, args.devices, per_device, rand)
+    print('{} endpoints on {} devices, {} entries per update'.format(
+        total, args.devices, per_device))
+    print('{:<28}{:>9.1f}MB'.format('parsed outputs', parsed_mb))
+    print('{:<28}{:>9.1f}MB  {:.0f} bytes per endpoint'.format(
+        'index', index_mb, index_mb * 1e6 / total))
+    print('{:<28}{:>9.3f}s  {:.0f} entries/s'.format(
+        'first updates', first, 2 * total / first))
+
+    again = update_all(index, args.devices, per_device, rand, args.churn)
+    print('{:<28}{:>9.3f}s  {:.0f} entries/s, {:.1%} churn'.format(
+        'updates again', again, 2 * total / again, args.churn))
+
+    macs = [mac(0x5000_0000_0000 + rand.randrange(total))
+            for _ in range(args.lookups)]
+    ips = [socket.inet_ntoa((0x0a000000 + rand.randrange(total)).to_bytes(
+        4, 'big')) for _ in range(args.lookups)]
+    found, locate_time = timed(lambda: sum(1 for address in macs
+                                           if index.locate(address)))
+    print('{:<28}{:>9.3f}s  {:.0f} lookups/s, {} found'.format(
+        'MAC -> location', locate_time, args.lookups / locate_time, found))
+    found, macs_time = timed(lambda: sum(1 for ip in ips if index.macs(ip)))
+    print('{:<28}{:>9.3f}s  {:.0f} lookups/s, {} found'.format(
+        'IP -> MAC', macs_time, args.lookups / macs_time, found))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+'''Benchmark Junos '| display json' / '| display xml' parsing against cli
+
+Builds a synthetic 'show route' output in the three formats and times the
+cli(), json() and xml() methods of ShowRoute on their own (extract) and
+parser.parse() with the matching context, which includes the schema
+validation. Each context is timed in its own process, as the schema
+validation gets slower with the number of outputs validated in a process.
+
+The three results are compared before the timings are printed.
+
+Usage:
+    python benchmarks/bench_junos_structured.py --entries 50000
+'''
+
+import json
+import time
+import argparse
+from unittest.mock import Mock
+from concurrent.futures import ProcessPoolExecutor
+
+from genie.libs.parser.junos.show_route import ShowRoute
+
+CLI_HEADER = '''\
+inet.0: {entries} destinations, {entries} routes ({entries} active, 0 holddown, 0 hidden)
++ = Active Route, - = Last Active, * = Both
+'''
+
+XML_ROUTE = '''\
+            <rt junos:style="brief">
+                <rt-destination>{prefix}</rt-destination>
+                <rt-entry>
+                    <active-tag>*</active-tag>
+                    <protocol-name>OSPF</protocol-name>
+                    <preference>10</preference>
+                    <preference2>10</preference2>
+                    <age junos:seconds="268356">3w0d 04:39:36</age>
+                    <metric>1200</metric>
+                    <nh>
+                        <to>{next_hop}</to>
+                        <via>ge-0/0/1.0</via>
+                    </nh>
+                </rt-entry>
+            </rt>'''
+
+
+def ip(i, first=10):
+    return '{}.{}.{}.{}'.format(first, i >> 16 & 255, i >> 8 & 255, i & 255)
+
+
+def data(value, **attributes):
+    element = {'data': value}
+    if attributes:
+        element['attributes'] = attributes
+    return [element]
+
+
+def build(entries):
+    cli = [CLI_HEADER.format(entries=entries)]
+    xml = ['<rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R1/junos">',
+           '    <route-information>',
+           '        <route-table>',
+           '            <table-name>inet.0</table-name>',
+           '            <destination-count>{}</destination-count>'.format(entries),
+           '            <total-route-count>{}</total-route-count>'.format(entries),
+           '            <active-route-count>{}</active-route-count>'.format(entries),
+           '            <holddown-route-count>0</holddown-route-count>',
+           '            <hidden-route-count>0</hidden-route-count>']
+    rts = []
+    for i in range(entries):
+        prefix = ip(i) + '/32'
+        next_hop = ip(i % 64, first=192)
+        cli.append('{:<19}*[OSPF/10/10] 3w0d 04:39:36, metric 1200'.format(
+            prefix))
+        cli.append('                    >  to {} via ge-0/0/1.0'.format(
+            next_hop))
+        xml.append(XML_ROUTE.format(prefix=prefix, next_hop=next_hop))
+        rts.append({
+            'attributes': {'junos:style': 'brief'},
+            'rt-destination': data(prefix),
+            'rt-entry': [{
+                'active-tag': data('*'),
+                'protocol-name': data('OSPF'),
+                'preference': data('10'),
+                'preference2': data('10'),
+                'age': data('3w0d 04:39:36', **{'junos:seconds': '268356'}),
+                'metric': data('1200'),
+                'nh': [{'to': data(next_hop),
+                        'via': data('ge-0/0/1.0')}],
+            }],
+        })
+    xml += ['        </route-table>', '    </route-information>',
+            '</rpc-reply>']
+    doc = {'route-information': [{'route-table': [{
+        'table-name': data('inet.0'),
+        'destination-count': data(str(entries)),
+        'total-route-count': data(str(entries)),
+        'active-route-count': data(str(entries)),
+        'holddown-route-count': data('0'),
+        'hidden-route-count': data('0'),
+        'rt': rts}]}]}
+    return '\n'.join(cli), json.dumps(doc), '\n'.join(xml)
+
+
+def timed(context, output):
+    device = Mock(**{'execute.return_value': output})
+    parser = ShowRoute(device=device, context=context)
+    start = time.perf_counter()
+    result = getattr(parser, context)(output=output)
+    extract_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parser.parse()
+    return comparable(result), extract_time, time.perf_counter() - start
+
+
+def comparable(result):
+    # the cli does not print the table name nor the attributes
+    for route_table in result['route-information']['route-table']:
+        route_table.pop('table-name', None)
+        for rt in route_table['rt']:
+            rt.pop('@junos:style', None)
+            rt['rt-entry']['age'].pop('@junos:seconds', None)
+    result.pop('@xmlns:junos', None)
+    return result
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--entries', type=int, default=50000)
+    args = my_parser.parse_args()
+
+    outputs = dict(zip(('cli', 'json', 'xml'), build(args.entries)))
+    timings = {}
+    results = {}
+    for context, output in outputs.items():
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result, extract_time, parse_time = pool.submit(
+                timed, context, output).result()
+        results[context] = result
+        timings[context] = (extract_time, parse_time)
+
+    for context in ('json', 'xml'):
+        assert results[context] == results['cli'], \
+            '{}: result differs from cli'.format(context)
+
+    row = '{:<10}{:>10}{:>10}{:>10}{:>10}{:>10}'
+    print(row.format('', 'cli', 'json', 'speedup', 'xml', 'speedup'))
+    for index, name in enumerate(('extract', 'parse')):
+        cli_time = timings['cli'][index]
+        json_time = timings['json'][index]
+        xml_time = timings['xml'][index]
+        print(row.format(name, '{:.3f}s'.format(cli_time),
+                         '{:.3f}s'.format(json_time),
+                         '{:.1f}x'.format(cli_time / json_time),
+                         '{:.3f}s'.format(xml_time),
+                         '{:.1f}x'.format(cli_time / xml_time)))
+
+
+if __name__ == '__main__':
+    main()
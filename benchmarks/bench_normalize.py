@@ -0,0 +1,96 @@
+'''Benchmark the typed values of the parser results
+
+Parses a synthetic 'show ip route' with aged routes and times:
+    * the parse, and the normalized parse
+    * the conversion of the route ages of --cycles consumer cycles, with the
+      memoized converters against the same converters without their cache
+
+Usage:
+    python benchmarks/bench_normalize.py --routes 20000 --cycles 20
+'''
+
+import random
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.utils import normalize
+from genie.libs.parser.utils.normalize import to_seconds
+
+from bench_distributor import HEADER, timed
+
+# B        10.0.1.0/24 [20/0] via 192.168.0.1, 1w2d
+ROUTE = 'B        {}.{}.{}.0/24 [20/0] via 192.168.{}.1, {}'
+
+
+def age(rand):
+    if rand.random() < 0.5:
+        return '{:02d}:{:02d}:{:02d}'.format(rand.randrange(24),
+                                             rand.randrange(60),
+                                             rand.randrange(60))
+    return '{}w{}d'.format(rand.randrange(10), rand.randrange(7))
+
+
+def build_table(routes):
+    '''show ip route output of distinct /24 routes, ages of the last day or
+    weeks'''
+    rand = random.Random(1)
+    lines = [HEADER]
+    for i in range(routes):
+        lines.append(ROUTE.format(10 + i // 65536, i // 256 % 256, i % 256,
+                                  i % 4, age(rand)))
+    return '\n'.join(lines)
+
+
+def ages(parsed):
+    return [hop['updated'] for route in parsed['vrf']['default'][
+                'address_family']['ipv4']['routes'].values()
+            for hop in route['next_hop']['next_hop_list'].values()]
+
+
+def convert(values, cycles, converter):
+    total = 0
+    for _ in range(cycles):
+        for value in values:
+            total += converter(value)
+    return total
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--routes', type=int, default=20000)
+    my_parser.add_argument('--cycles', type=int, default=20)
+    my_parser.add_argument('--repeat', type=int, default=3)
+    args = my_parser.parse_args()
+
+    output = build_table(args.routes)
+    parser = ShowIpRoute(device=Mock())
+    parsed, parse_time = timed(parser.parse, output=output,
+                               repeat=args.repeat)
+    _, normalized_time = timed(normalize.parse, parser, output=output,
+                               repeat=args.repeat)
+    values = ages(parsed)
+    print('{} routes, {} distinct ages, best of {}'.format(
+        args.routes, len(set(values)), args.repeat))
+    print('{:<32}{:>9.3f}s'.format('parse', parse_time))
+    print('{:<32}{:>9.3f}s  {:+.1%}'.format(
+        'normalize.parse', normalized_time,
+        normalized_time / parse_time - 1))
+
+    conversions = len(values) * args.cycles
+    uncached, uncached_time = timed(convert, values, args.cycles,
+                                    to_seconds.__wrapped__,
+                                    repeat=args.repeat)
+    to_seconds.cache_clear()
+    cached, cached_time = timed(convert, values, args.cycles, to_seconds,
+                                repeat=args.repeat)
+    assert cached == uncached
+    print('{:<32}{:>9.3f}s  {:.0f} conversions/s'.format(
+        'ages, uncached', uncached_time, conversions / uncached_time))
+    print('{:<32}{:>9.3f}s  {:.0f} conversions/s, {:.1f}x'.format(
+        'ages, memoized', cached_time, conversions / cached_time,
+        uncached_time / cached_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+'''Benchmark NX-OS '| json' parsing against the cli regex parsing
+
+Builds synthetic outputs of the same tables in both formats and times the
+cli() and json() methods on their own (extract) and parser.parse() with
+context='cli' and context='json', which includes the schema validation:
+    * show ip arp vrf all           (ShowIpArp)
+    * show mac address-table        (ShowMacAddressTable)
+    * show ip route vrf all         (ShowIpRoute)
+
+Both results are compared before the timings are printed.
+
+Usage:
+    python benchmarks/bench_nxos_json.py --entries 50000
+'''
+
+import json
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.nxos.show_arp import ShowIpArp
+from genie.libs.parser.nxos.show_fdb import ShowMacAddressTable
+from genie.libs.parser.nxos.show_routing import ShowIpRoute
+
+ARP_HEADER = '''\
+IP ARP Table for all contexts
+Total number of entries: {entries}
+Address         Age       MAC Address     Interface       Flags'''
+
+MAC_HEADER = '''\
+Legend:
+    * - primary entry, G - Gateway MAC, (R) - Routed MAC, O - Overlay MAC
+   VLAN     MAC Address      Type      age     Secure NTFY Ports
+---------+-----------------+--------+---------+------+----+------------------'''
+
+ROUTE_HEADER = '''\
+IP Route Table for VRF "default"
+'*' denotes best ucast next-hop
+'**' denotes best mcast next-hop
+'[x/y]' denotes [preference/metric]
+'%<string>' in via output denotes VRF <string>
+'''
+
+
+def ip(i, first=10):
+    return '{}.{}.{}.{}'.format(first, i >> 16 & 255, i >> 8 & 255, i & 255)
+
+
+def mac(i):
+    return '0000.{:04x}.{:04x}'.format(i >> 16 & 0xffff, i & 0xffff)
+
+
+def build_arp(entries):
+    cli = [ARP_HEADER.format(entries=entries)]
+    rows = []
+    for i in range(entries):
+        intf = 'Vlan{}'.format(i % 4000 + 1)
+        cli.append('{:<16}00:10:42  {}  {}'.format(ip(i), mac(i), intf))
+        rows.append({'intf-out': intf, 'ip-addr-out': ip(i),
+                     'time-stamp': '00:10:42', 'mac': mac(i)})
+    doc = {'TABLE_vrf': {'ROW_vrf': {'vrf-name-out': 'default',
+                                     'cnt-total': entries,
+                                     'TABLE_adj': {'ROW_adj': rows}}}}
+    return '\n'.join(cli), json.dumps(doc)
+
+
+def build_mac(entries):
+    cli = [MAC_HEADER]
+    rows = []
+    for i in range(entries):
+        vlan = str(i % 4000 + 1)
+        port = 'Eth1/{}'.format(i % 48 + 1)
+        cli.append('* {:<8} {}   dynamic  0         F      F    {}'.format(
+            vlan, mac(i), port))
+        rows.append({'disp_mac_addr': mac(i), 'disp_type': '*',
+                     'disp_vlan': vlan, 'disp_is_static': 'disabled',
+                     'disp_age': '0', 'disp_is_secure': 'disabled',
+                     'disp_is_ntfy': 'disabled', 'disp_port': port})
+    doc = {'TABLE_mac_address': {'ROW_mac_address': rows}}
+    return '\n'.join(cli), json.dumps(doc)
+
+
+def build_route(entries):
+    cli = [ROUTE_HEADER]
+    rows = []
+    for i in range(entries):
+        prefix = ip(i) + '/32'
+        next_hop = ip(i % 64, first=192)
+        cli.append('{}, ubest/mbest: 1/0'.format(prefix))
+        cli.append('    *via {}, Eth1/1, [110/41], 01:01:18, ospf-1, intra'
+                   .format(next_hop))
+        rows.append({'ipprefix': prefix, 'ucast-nhops': '1',
+                     'mcast-nhops': '0', 'attached': 'false',
+                     'TABLE_path': {'ROW_path': {
+                         'ipnexthop': next_hop, 'ifname': 'Eth1/1',
+                         'uptime': 'PT1H1M18S', 'pref': '110', 'metric': '41',
+                         'clientname': 'ospf-1', 'type': 'intra',
+                         'ubest': 'true', 'mbest': 'false'}}})
+    doc = {'TABLE_vrf': {'ROW_vrf': {
+        'vrf-name-out': 'default', 'TABLE_addrf': {'ROW_addrf': {
+            'addrf': 'ipv4', 'TABLE_prefix': {'ROW_prefix': rows}}}}}}
+    return '\n'.join(cli), json.dumps(doc)
+
+
+def timed(parser_cls, context, output, **kwargs):
+    device = Mock(**{'execute.return_value': output})
+    parser = parser_cls(device=device, context=context)
+    start = time.perf_counter()
+    result = getattr(parser, context)(output=output, **kwargs)
+    extract_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parser.parse(**kwargs)
+    return result, extract_time, time.perf_counter() - start
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--entries', type=int, default=50000)
+    args = my_parser.parse_args()
+
+    benchmarks = [
+        ('show ip arp vrf all', ShowIpArp, build_arp, {'vrf': 'all'}),
+        ('show mac address-table', ShowMacAddressTable, build_mac, {}),
+        ('show ip route vrf all', ShowIpRoute, build_route, {'vrf': 'all'}),
+    ]
+
+    row = '{:<26}{:<9}{:>10}{:>10}{:>10}'
+    print(row.format('command', '', 'cli', 'json', 'speedup'))
+    for command, parser_cls, build, kwargs in benchmarks:
+        cli_output, json_output = build(args.entries)
+        cli_result, cli_extract, cli_parse = timed(
+            parser_cls, 'cli', cli_output, **kwargs)
+        json_result, json_extract, json_parse = timed(
+            parser_cls, 'json', json_output, **kwargs)
+        assert cli_result == json_result, \
+            '{}: json result differs from cli'.format(command)
+        for name, cli_time, json_time in (
+                ('extract', cli_extract, json_extract),
+                ('parse', cli_parse, json_parse)):
+            print(row.format(command, name, '{:.3f}s'.format(cli_time),
+                             '{:.3f}s'.format(json_time),
+                             '{:.1f}x'.format(cli_time / json_time)))
+            command = ''
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+'''Benchmark the command planner against one execution per request
+
+Simulates a job asking a replay device, with a constant latency per
+command, for:
+    * 'show interfaces' and 'show interfaces <interface>' of --interfaces
+      interfaces
+    * 'show ip interface' and 'show ip interface <interface>' of the same
+      interfaces
+    * 'show ip route' and 'show ip route <protocol>' of bgp, ospf and static
+and compares the device round trips and wall time of parsing every request
+on its own with those of the planned executions.
+
+Usage:
+    python benchmarks/bench_planner.py --interfaces 48 --latency 0.2
+'''
+
+import re
+import time
+import pathlib
+import argparse
+
+from genie.libs import parser as _parser
+from genie.libs.parser.utils.replay import ReplayDevice
+from genie.libs.parser.utils.planner import plan_commands
+
+from bench_distributor import HEADER
+
+# GigabitEthernet1/0/1 is administratively down, line protocol is down
+INTERFACE_HEADER = re.compile(r'^\S+ is (up|down|administratively down),')
+
+GOLDENS = pathlib.Path(_parser.__file__).parent / 'iosxe' / 'tests'
+
+PROTOCOLS = {'bgp': 'B        10.{}.{}.0/24 [20/0] via 192.168.0.1, 1w2d',
+             'ospf': 'O IA     10.{}.{}.0/24 [110/2] via 192.168.0.2, '
+                     '00:01:02, GigabitEthernet1',
+             'static': 'S        10.{}.{}.0/24 [1/0] via 192.168.0.3'}
+
+
+def section(golden, name):
+    lines = (GOLDENS / golden).read_text().splitlines()
+    start = next(i for i, line in enumerate(lines)
+                 if line.startswith(name + ' is '))
+    end = next((i for i, line in enumerate(lines)
+                if i > start and INTERFACE_HEADER.match(line)), len(lines))
+    return '\n'.join(lines[start:end])
+
+
+def outputs(interfaces, routes):
+    '''command -> output of every command of the job'''
+    interface = section('ShowInterfaces/cli/equal/golden_output_output.txt',
+                        'GigabitEthernet1/0/1')
+    ip_interface = section(
+        'ShowIpInterface/cli/equal/golden_output_output.txt', 'Vlan211')
+    names = ['GigabitEthernet1/0/{}'.format(i + 1)
+             for i in range(interfaces)]
+    result = {}
+    for command, template, old in (
+            ('show interfaces', interface, 'GigabitEthernet1/0/1'),
+            ('show ip interface', ip_interface, 'Vlan211')):
+        sections = [template.replace(old, name) for name in names]
+        result[command] = '\n'.join(sections)
+        for name, text in zip(names, sections):
+            result['{} {}'.format(command, name)] = text
+
+    lines = {protocol: [line.format(n, i % 256)
+                        for i in range(routes // len(PROTOCOLS))]
+             for n, (protocol, line) in enumerate(PROTOCOLS.items())}
+    result['show ip route'] = HEADER + '\n'.join(
+        line for protocol_lines in lines.values() for line in protocol_lines)
+    for protocol, protocol_lines in lines.items():
+        result['show ip route ' + protocol] = HEADER + '\n'.join(
+            protocol_lines)
+    return result, names
+
+
+def requests(names):
+    job = []
+    for command in ('show interfaces', 'show ip interface'):
+        job.append((command, {}))
+        job.extend((command + ' {interface}', {'interface': name})
+                   for name in names)
+    job.append(('show ip route', {}))
+    job.extend(('show ip route {protocol}', {'protocol': protocol})
+               for protocol in PROTOCOLS)
+    return job
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--interfaces', type=int, default=48)
+    my_parser.add_argument('--routes', type=int, default=3000)
+    my_parser.add_argument('--latency', type=float, default=0.2,
+                           help='latency of a command, in seconds')
+    args = my_parser.parse_args()
+
+    job_outputs, names = outputs(args.interfaces, args.routes)
+    job = requests(names)
+
+    device = ReplayDevice('R1', job_outputs, latency=args.latency,
+                          os='iosxe')
+    start = time.perf_counter()
+    separate = [device.parse(command.format(**kwargs))
+                for command, kwargs in job]
+    separate_time = time.perf_counter() - start
+    separate_executes = device.executes
+
+    device = ReplayDevice('R1', job_outputs, latency=args.latency,
+                          os='iosxe')
+    start = time.perf_counter()
+    plan = plan_commands(device, job)
+    plan_time = time.perf_counter() - start
+    results = plan.run()
+    planned_time = time.perf_counter() - start
+
+    assert all('parsed' in result for result in results), \
+        [r['error'] for r in results if 'error' in r]
+    assert [result['parsed'] for result in results] == separate, \
+        'planned results differ'
+
+    print('{} requests: {} interfaces, {} routes, latency {}s'.format(
+        len(job), args.interfaces, args.routes, args.latency))
+    print('{:<24}{:>12}{:>10}'.format('', 'executions', 'wall'))
+    print('{:<24}{:>12}{:>9.2f}s'.format('one per request',
+                                         separate_executes, separate_time))
+    print('{:<24}{:>12}{:>9.2f}s  planned in {:.3f}s'.format(
+        'planned', device.executes, planned_time, plan_time))
+
+
+if __name__ == '__main__':
+    main()
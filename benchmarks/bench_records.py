@@ -0,0 +1,162 @@
+'''Benchmark the record representation of the row-heavy parsers results
+
+Builds synthetic outputs of the row-heavy parsers and compares, for each,
+the result of parse() and the result packed in records:
+    * the parse time, and the time packing the result in records
+    * the memory held by the result, each object counted once
+
+The results are validated by the compiled validators, see
+--validation for the other modes.
+
+Usage:
+    python benchmarks/bench_records.py --rows 100000
+'''
+
+import sys
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.iosxe.show_device_tracking import \
+    ShowDeviceTrackingDatabase
+from genie.libs.parser.iosxe.show_mac_address import \
+    ShowMacAddressTableDynamic
+from genie.libs.parser.iosxe.show_wireless import ShowWirelessClientSummary
+from genie.libs.parser.linux.ps import Ps
+from genie.libs.parser.utils import records, schema_compiler
+
+from bench_distributor import timed
+
+
+def _ip(i):
+    return '10.{}.{}.{}'.format(i // 65536 % 256, i // 256 % 256, i % 256)
+
+
+def _mac(i):
+    return '58bf.{:04x}.{:04x}'.format(i // 65536, i % 65536)
+
+
+def arp(rows):
+    lines = ['Protocol  Address          Age (min)  Hardware Addr   Type   '
+             'Interface']
+    for i in range(rows):
+        lines.append('Internet  {:<15} {:>4}   {}  ARPA   Vlan{}'.format(
+            _ip(i), i % 240, _mac(i), 100 + i % 16))
+    return '\n'.join(lines)
+
+
+def device_tracking(rows):
+    lines = ['    Network Layer Address       Link Layer Address    '
+             'Interface  vlan  prlvl age    state     Time left']
+    for i in range(rows):
+        lines.append('ARP {:<27} {}        Gi1/0/{:<4} {:<5} 0005  '
+                     '{}mn   REACHABLE  {} s'.format(_ip(i), _mac(i),
+                                                     1 + i % 48,
+                                                     100 + i % 16,
+                                                     i % 240, i % 300))
+    return '\n'.join(lines)
+
+
+def mac_address(rows):
+    lines = ['Vlan    Mac Address       Type        Ports',
+             '----    -----------       --------    -----']
+    for i in range(rows):
+        lines.append('{:<6} {}    DYNAMIC     Gi1/0/{}'.format(
+            100 + i % 16, _mac(i), 1 + i % 48))
+    return '\n'.join(lines)
+
+
+def wireless_clients(rows):
+    lines = ['Number of Clients: {}'.format(rows), '',
+             'MAC Address    AP Name                                        '
+             'Type ID   State             Protocol Method     Role',
+             '-' * 121]
+    for i in range(rows):
+        lines.append('{} b80-{}-cap{:<37} WLAN 17   Run               11ac'
+                     '     Dot1x      Local'.format(_mac(i), i % 100,
+                                                    i % 20))
+    lines.extend(['', 'Number of Excluded Clients: 0'])
+    return '\n'.join(lines)
+
+
+def ps(rows):
+    lines = ['        UID        PID  PPID  C STIME TTY          TIME CMD']
+    for i in range(rows):
+        lines.append('        root {:>9} {:>5}  0  2019 ?        00:00:07 '
+                     '/usr/sbin/worker --id {}'.format(2 + i, 1 + i % 64, i))
+    return '\n'.join(lines)
+
+
+PARSERS = [
+    (ShowArp, arp, {}),
+    (ShowDeviceTrackingDatabase, device_tracking, {}),
+    (ShowMacAddressTableDynamic, mac_address, {'vlan_id': '100'}),
+    (ShowWirelessClientSummary, wireless_clients, {}),
+    (Ps, ps, {}),
+]
+
+
+def footprint(result):
+    '''bytes held by result, each object counted once'''
+    seen = set()
+    size = 0
+    stack = [result]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, records.Record):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return size
+
+
+def _records(result):
+    if isinstance(result, records.Record):
+        yield result
+    elif isinstance(result, dict):
+        for value in result.values():
+            yield from _records(value)
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--rows', type=int, default=100000)
+    my_parser.add_argument('--repeat', type=int, default=3)
+    my_parser.add_argument('--validation', default='compiled',
+                           choices=schema_compiler.MODES)
+    args = my_parser.parse_args()
+
+    print('{} rows, best of {}, {} validation'.format(
+        args.rows, args.repeat, args.validation))
+    print('{:<28}{:>10}{:>10}{:>10}{:>12}{:>12}'.format(
+        'parser', 'parse', 'pack', 'rows', 'dicts', 'records'))
+    for parser_cls, build, kwargs in PARSERS:
+        output = build(args.rows)
+        device = Mock()
+        device.execute.return_value = output
+        parser = parser_cls(device=device)
+        with schema_compiler.mode(args.validation):
+            result, parse_time = timed(parser.parse, repeat=args.repeat,
+                                       **kwargs)
+            copies = [parser.parse(**kwargs) for _ in range(args.repeat)]
+        dict_size = footprint(result)
+        packed, pack_time = timed(lambda: records.pack(parser.schema,
+                                                       copies.pop()),
+                                  repeat=args.repeat)
+        assert packed == result, 'packed result differs'
+        record_size = footprint(packed)
+        rows = sum(1 for _ in _records(packed))
+        print('{:<28}{:>9.3f}s{:>9.3f}s{:>10}{:>9.1f} MB{:>9.1f} MB'.format(
+            parser_cls.__name__, parse_time, pack_time, rows,
+            dict_size / 2 ** 20, record_size / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+'''Benchmark the regex engines on the parser goldens
+
+For every installed engine (re, regex, re2), measures:
+    * parsers: time of the cli methods of the parsers compiling their
+      patterns with regex_engine, over all their golden outputs
+    * patterns: every pattern of these modules matched against every line
+      of their golden outputs, the raw matching throughput
+    * adversarial: one line making a nested quantifier backtrack
+
+The parsed results and the matches are compared with the re ones.
+
+Every parser module compiles its patterns with regex_engine, the benchmark
+runs the modules given with --module (default: the routing, arp and
+interface modules, 529 patterns):
+
+Usage:
+    python benchmarks/bench_regex_engine.py --repeat 5
+    python benchmarks/bench_regex_engine.py --module genie.libs.parser.nxos.show_bgp
+'''
+
+import re
+import time
+import argparse
+import importlib
+
+from genie.libs.parser.utils import regex_engine
+from genie.libs.parser.utils.regex_audit import extract_file
+
+# the golden loader of the conformance test
+from genie.libs.parser.utils.tests.test_regex_engine import _goldens
+
+DEFAULT_MODULES = [
+    'genie.libs.parser.iosxe.show_routing',
+    'genie.libs.parser.iosxe.show_arp',
+    'genie.libs.parser.iosxe.show_interface',
+    'genie.libs.parser.nxos.show_routing',
+    'genie.libs.parser.iosxr.show_routing',
+]
+
+ADVERSARIAL_PATTERN = r'^\[(?P<route_preference>[\d\/]+)+\]+ via'
+ADVERSARIAL_LINE = '[' + '1' * 22 + '!'
+
+
+def run_parsers(goldens):
+    results = []
+    for cls, output, arguments in goldens:
+        try:
+            results.append(cls(device=None).cli(output=output, **arguments))
+        except Exception as e:
+            results.append(repr(e))
+    return results
+
+
+def run_patterns(patterns, lines):
+    compiled = [regex_engine.compile(pattern, flags)
+                for pattern, flags in patterns]
+    results = []
+    for line in lines:
+        for p in compiled:
+            m = p.match(line)
+            results.append(m.groupdict() if m else None)
+    return results
+
+
+def measure(func, repeat):
+    result = func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--module', action='append', dest='modules',
+                        help='parser module to run, can be repeated')
+    args = parser.parse_args()
+    modules = args.modules or DEFAULT_MODULES
+
+    goldens = [g for module in modules for g in _goldens(module)]
+    patterns = []
+    lines = []
+    for module in modules:
+        path = importlib.import_module(module).__file__
+        patterns.extend({(site.pattern, site.flags)
+                         for site in extract_file(path)})
+    for _, output, _ in goldens:
+        lines.extend(line.strip() for line in output.splitlines())
+    print('{} goldens, {} lines, {} patterns'.format(len(goldens), len(lines),
+                                                     len(patterns)))
+
+    expected = {}
+    for engine in regex_engine.available_engines():
+        regex_engine.set_engine(engine)
+        parsed, parse_time = measure(lambda: run_parsers(goldens),
+                                     args.repeat)
+        matches, match_time = measure(lambda: run_patterns(patterns, lines),
+                                      args.repeat)
+        start = time.perf_counter()
+        regex_engine.compile(ADVERSARIAL_PATTERN).match(ADVERSARIAL_LINE)
+        adversarial = time.perf_counter() - start
+
+        expected.setdefault('parsed', parsed)
+        expected.setdefault('matches', matches)
+        fallback = sum(isinstance(regex_engine.compile(p, f), re.Pattern)
+                       for p, f in patterns) if engine != 're' else 0
+        print('{:<6} parsers {:>7.3f}s {:>9.0f} lines/s   patterns {:>7.3f}s '
+              '{:>10.0f} matches/s   adversarial {:>8.4f}s   re fallback '
+              '{}/{}   identical {}'.format(
+                  engine, parse_time, len(lines) / parse_time, match_time,
+                  len(lines) * len(patterns) / match_time, adversarial,
+                  fallback, len(patterns),
+                  parsed == expected['parsed'] and
+                  matches == expected['matches']))
+    regex_engine.set_engine('re')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+'''Load test of the parser stack with replay devices
+
+Simulates devices answering 'show ip route', 'show arp', 'show version' and
+'show clock' with recorded outputs after a lognormal latency, and parses
+every command of every device concurrently, either on asyncio with
+AsyncReplayDevice.aparse or on a thread pool with ReplayDevice.parse.
+Reports the wall time, the throughput and the distribution of the
+per-parse times, from the start of the parse to its result.
+
+Usage:
+    python benchmarks/bench_replay.py --devices 1000 --mode asyncio
+'''
+
+import time
+import pathlib
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from genie.libs import parser as _parser
+from genie.libs.parser.utils import schema_compiler
+from genie.libs.parser.utils.bulk import BulkRecord
+from genie.libs.parser.utils.replay import Latency, ReplayDevice, \
+    AsyncReplayDevice, replay_devices, summarize
+
+from bench_distributor import build_table
+from bench_records import arp
+
+COMMANDS = ['show ip route', 'show arp', 'show version', 'show clock']
+
+CLOCK_OUTPUT = '18:56:04.554 EST Mon Oct 17 2016'
+
+
+def recordings(routes):
+    version = (pathlib.Path(_parser.__file__).parent / 'iosxe' / 'tests' /
+               'ShowVersion' / 'cli' / 'equal' /
+               'golden_output_c3850_output.txt').read_text()
+    tokens = {'os': 'iosxe'}
+    return [BulkRecord(tokens, 'show ip route', build_table(routes)),
+            BulkRecord(tokens, 'show arp', arp(routes)),
+            BulkRecord(tokens, 'show version', version),
+            BulkRecord(tokens, 'show clock', CLOCK_OUTPUT)]
+
+
+def run_threads(devices, workers):
+    def parse(device, command):
+        try:
+            device.parse(command)
+        except Exception:
+            pass
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for device in devices:
+            for command in COMMANDS:
+                executor.submit(parse, device, command)
+
+
+def run_asyncio(devices, workers):
+    async def run():
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=workers))
+        await asyncio.gather(*(device.aparse(command)
+                               for device in devices
+                               for command in COMMANDS),
+                             return_exceptions=True)
+    asyncio.run(run())
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--devices', type=int, default=1000)
+    my_parser.add_argument('--routes', type=int, default=200)
+    my_parser.add_argument('--latency', type=float, default=0.2,
+                           help='mean latency of a command, in seconds')
+    my_parser.add_argument('--jitter', type=float, default=0.1)
+    my_parser.add_argument('--workers', type=int, default=64,
+                           help='threads running the parsers')
+    my_parser.add_argument('--mode', choices=('asyncio', 'threads'),
+                           default='asyncio')
+    my_parser.add_argument('--seed', type=int, default=1)
+    my_parser.add_argument('--validation', default='generic',
+                           choices=schema_compiler.MODES)
+    args = my_parser.parse_args()
+
+    device_class = AsyncReplayDevice if args.mode == 'asyncio' \
+        else ReplayDevice
+    latency = Latency(args.latency, args.jitter, 'lognormal', seed=args.seed)
+    devices = replay_devices(recordings(args.routes), count=args.devices,
+                             latency=latency, device_class=device_class)
+
+    start = time.perf_counter()
+    with schema_compiler.mode(args.validation):
+        (run_asyncio if args.mode == 'asyncio' else run_threads)(
+            devices, args.workers)
+    wall = time.perf_counter() - start
+
+    summary = summarize(timing for device in devices
+                        for timing in device.timings)
+    print('{} devices x {} commands, {} routes/arp entries, latency {}s '
+          '+/- {}s, {} workers, {}, {} validation'.format(
+              args.devices, len(COMMANDS), args.routes, args.latency,
+              args.jitter, args.workers, args.mode, args.validation))
+    print('{} parses, {} errors in {:.2f}s: {:.0f} parses/s'.format(
+        summary['count'], summary['errors'], wall, summary['count'] / wall))
+    print('parse time: mean {mean:.3f}s  p50 {p50:.3f}s  p95 {p95:.3f}s  '
+          'p99 {p99:.3f}s  max {max:.3f}s'.format(**summary))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+'''Benchmark the longest prefix match index of parsed routing tables
+
+Builds the parsed 'show ip route' of a synthetic full table, /8 to /32
+prefixes weighted towards /24 like an internet table, and times:
+    * the build of the RouteIndex from the parsed dict
+    * longest prefix matches of random addresses, against the walk of the
+      parsed routes dict from /32 down to /0
+    * covered queries of random /16
+    * the diff of two snapshots, --churn of the routes changed
+and the memory of the index against that of the parsed dict. The index of
+a parsed --parse routes table checks the extraction of a real parse.
+
+Usage:
+    python benchmarks/bench_route_index.py --routes 900000 --lookups 100000
+'''
+
+import gc
+import random
+import socket
+import argparse
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.utils.route_index import RouteIndex, diff
+
+from bench_distributor import build_table, timed
+
+# share of each prefix length in a full table
+LENGTHS = {8: 1, 12: 2, 16: 10, 18: 6, 19: 12, 20: 22, 21: 28, 22: 60,
+           23: 60, 24: 500, 28: 2, 32: 1}
+
+
+def full_table(routes, seed=1):
+    '''parsed show ip route of distinct prefixes'''
+    rand = random.Random(seed)
+    lengths = rand.choices(list(LENGTHS), weights=list(LENGTHS.values()),
+                           k=routes * 2)
+    prefixes = {}
+    for length in lengths:
+        network = rand.getrandbits(length) << (32 - length)
+        prefix = '{}/{}'.format(
+            socket.inet_ntoa(network.to_bytes(4, 'big')), length)
+        if prefix not in prefixes:
+            prefixes[prefix] = {
+                'route': prefix, 'active': True, 'source_protocol': 'bgp',
+                'next_hop': {'next_hop_list': {1: {
+                    'index': 1,
+                    'next_hop': '192.168.{}.1'.format(len(prefixes) % 64)}}}}
+            if len(prefixes) == routes:
+                break
+    return {'vrf': {'default': {'address_family': {'ipv4': {
+        'routes': prefixes}}}}}
+
+
+def walk(routes, address):
+    '''longest prefix match over the parsed routes dict'''
+    value = int.from_bytes(socket.inet_aton(address), 'big')
+    for length in range(32, -1, -1):
+        network = value >> (32 - length) << (32 - length)
+        prefix = '{}/{}'.format(
+            socket.inet_ntoa(network.to_bytes(4, 'big')), length)
+        if prefix in routes:
+            return prefix
+
+
+def size(func):
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 1e6
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--routes', type=int, default=900000)
+    my_parser.add_argument('--lookups', type=int, default=100000)
+    my_parser.add_argument('--churn', type=float, default=0.01)
+    my_parser.add_argument('--parse', type=int, default=5000)
+    my_parser.add_argument('--repeat', type=int, default=3)
+    args = my_parser.parse_args()
+
+    parsed, parsed_mb = size(lambda: full_table(args.routes))
+    routes = parsed['vrf']['default']['address_family']['ipv4']['routes']
+    index, index_mb = size(lambda: RouteIndex.from_parsed(parsed))
+    print('{} routes, best of {}'.format(len(index), args.repeat))
+    print('{:<28}{:>9.1f}MB'.format('parsed dict', parsed_mb))
+    print('{:<28}{:>9.1f}MB  {:.1f} bytes per route'.format(
+        'index', index_mb, index_mb * 1e6 / len(index)))
+
+    _, build_time = timed(RouteIndex.from_parsed, parsed, repeat=args.repeat)
+    print('{:<28}{:>9.3f}s  {:.0f} routes/s'.format(
+        'build', build_time, len(index) / build_time))
+
+    rand = random.Random(2)
+    addresses = [socket.inet_ntoa(rand.getrandbits(32).to_bytes(4, 'big'))
+                 for _ in range(args.lookups)]
+    found, index_time = timed(
+        lambda: [index.lookup(address) for address in addresses],
+        repeat=args.repeat)
+    walked, walk_time = timed(
+        lambda: [walk(routes, address) for address in addresses],
+        repeat=args.repeat)
+    assert [route and route.prefix for route in found] == walked, \
+        'lookups differ'
+    print('{:<28}{:>9.3f}s  {:.0f} lookups/s'.format(
+        'lookup, dict walk', walk_time, args.lookups / walk_time))
+    print('{:<28}{:>9.3f}s  {:.0f} lookups/s, {:.1f}x'.format(
+        'lookup, index', index_time, args.lookups / index_time,
+        walk_time / index_time))
+
+    supernets = ['{}.{}.0.0/16'.format(rand.randrange(256),
+                                       rand.randrange(256))
+                 for _ in range(1000)]
+    covered, covered_time = timed(
+        lambda: sum(len(index.covered(prefix)) for prefix in supernets),
+        repeat=args.repeat)
+    print('{:<28}{:>9.3f}s  1000 /16, {} routes'.format(
+        'covered', covered_time, covered))
+
+    changed = dict(routes)
+    for prefix in rand.sample(sorted(routes), int(len(routes) * args.churn)):
+        route = dict(changed.pop(prefix))
+        if rand.random() < 0.5:
+            route['source_protocol'] = 'ospf'
+            changed[prefix] = route
+    other = RouteIndex.from_parsed({'vrf': {'default': {'address_family': {
+        'ipv4': {'routes': changed}}}}})
+    result, diff_time = timed(diff, index, other, repeat=args.repeat)
+    print('{:<28}{:>9.3f}s  {} removed, {} changed'.format(
+        'diff', diff_time, len(result.removed), len(result.changed)))
+
+    table = ShowIpRoute(device=Mock()).parse(
+        output=build_table(args.parse))
+    parsed_index = RouteIndex.from_parsed(table)
+    assert len(parsed_index) == args.parse
+    assert parsed_index.lookup('10.0.1.7').prefix == '10.0.1.0/24'
+
+
+if __name__ == '__main__':
+    main()
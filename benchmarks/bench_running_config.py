@@ -0,0 +1,84 @@
+'''Benchmark section level incremental parsing of running configurations
+
+Builds a synthetic 'show running-config | section ^interface' output and
+compares:
+    * a full ShowRunInterface parse
+    * a first (cold) IncrementalConfigParser parse
+    * an IncrementalConfigParser parse after a few stanzas changed
+
+Usage:
+    python benchmarks/bench_running_config.py --interfaces 10000 --changes 5
+'''
+
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_run import ShowRunInterface
+from genie.libs.parser.utils.running_config import IncrementalConfigParser
+
+STANZA = '''\
+interface GigabitEthernet{slot}/0/{port}
+ description {description}
+ switchport access vlan {vlan}
+ switchport mode access
+ load-interval 30
+ authentication control-direction in
+ authentication host-mode multi-auth
+ authentication port-control auto
+ dot1x pae authenticator
+ spanning-tree portfast
+!'''
+
+
+def build_config(interfaces, description='access port'):
+    return '\n'.join(
+        STANZA.format(slot=i // 48 + 1, port=i % 48 + 1,
+                      vlan=i % 4000 + 1, description=description)
+        for i in range(interfaces))
+
+
+def change_config(config, changes):
+    stanzas = config.split('\n!')
+    step = max(len(stanzas) // changes, 1)
+    for i in range(0, step * changes, step):
+        stanzas[i] = stanzas[i].replace('access port', 'changed port')
+    return '\n!'.join(stanzas)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--interfaces', type=int, default=10000)
+    my_parser.add_argument('--changes', type=int, default=5)
+    args = my_parser.parse_args()
+
+    config = build_config(args.interfaces)
+    changed = change_config(config, args.changes)
+    print('config: {} lines, {} interfaces, {} changed'.format(
+        len(changed.splitlines()), args.interfaces, args.changes))
+
+    full, full_time = timed(ShowRunInterface(device=Mock()).parse,
+                            output=changed)
+
+    incremental = IncrementalConfigParser(ShowRunInterface)
+    _, cold_time = timed(incremental.parse, output=config)
+    result, warm_time = timed(incremental.parse, output=changed)
+
+    assert result == full, 'incremental result differs from full parse'
+
+    print('{:<28}{:>10.3f}s'.format('full parse', full_time))
+    print('{:<28}{:>10.3f}s'.format('incremental, cold', cold_time))
+    print('{:<28}{:>10.3f}s  {}'.format('incremental, warm', warm_time,
+                                        incremental.stats))
+    print('{:<28}{:>10.1f}x'.format('speedup (warm vs full)',
+                                    full_time / warm_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+'''Benchmark the compiled schema validation
+
+Builds a synthetic 'show ip route' output and compares, on its ShowIpRoute
+result:
+    * the validation by the schema engine
+    * the validation by the compiled validator
+    * the parses in the generic, compiled and sampled modes
+
+Usage:
+    python benchmarks/bench_schema_compiler.py --routes 100000
+'''
+
+import argparse
+from unittest.mock import Mock
+
+from genie.metaparser.util.schemaengine import Schema
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.utils import schema_compiler
+
+from bench_distributor import build_table, timed
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--routes', type=int, default=100000)
+    my_parser.add_argument('--repeat', type=int, default=3)
+    my_parser.add_argument('--sample-rate', type=int, default=100)
+    args = my_parser.parse_args()
+    repeat = args.repeat
+
+    output = build_table(args.routes)
+    result = ShowIpRoute(device=Mock()).cli(output=output)
+    print('show ip route: {} routes, best of {}'.format(args.routes, repeat))
+
+    schema = ShowIpRoute.schema
+    generic, generic_time = timed(Schema(schema).validate, result,
+                                  repeat=repeat)
+    _, compile_time = timed(schema_compiler.compile_schema, schema)
+    compiled, compiled_time = timed(schema_compiler.validate, schema, result,
+                                    repeat=repeat)
+    assert compiled == generic, 'compiled validation differs'
+    print('{:<32}{:>10.3f}s'.format('validation, generic', generic_time))
+    print('{:<32}{:>10.3f}s  compiled in {:.3f}s'.format(
+        'validation, compiled', compiled_time, compile_time))
+
+    parsed = None
+    for name in ('generic', 'compiled',
+                 'sampled:{}'.format(args.sample_rate)):
+        with schema_compiler.mode(name):
+            parser = ShowIpRoute(device=Mock())
+            result, parse_time = timed(parser.parse, output=output,
+                                       repeat=repeat)
+        assert parsed is None or result == parsed, 'parse differs'
+        parsed = result
+        print('{:<32}{:>10.3f}s'.format('parse, ' + name, parse_time))
+
+
+if __name__ == '__main__':
+    main()
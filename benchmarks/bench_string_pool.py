@@ -0,0 +1,87 @@
+'''Benchmark the interning of the parser results strings
+
+Builds a synthetic 'show ip route' output of OSPF routes over a few next
+hops and interfaces and compares the ShowIpRoute results parsed with and
+without the string pool:
+    * the parse time
+    * the memory held by the result, each object counted once
+    * the number of distinct strings in the result
+
+The results are parsed by cli(): the schema validation copies the dicts of
+the result but keeps its strings, so it does not change the comparison.
+
+Usage:
+    python benchmarks/bench_string_pool.py --routes 1000000
+'''
+
+import sys
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.utils import string_pool
+
+from bench_distributor import HEADER, timed
+
+# O        10.0.1.0/24 [110/2] via 192.168.0.1, 00:10:01, GigabitEthernet0/0/0
+ROUTE = 'O        {}.{}.{}.0/24 [110/2] via 192.168.{}.1, 00:10:01, ' \
+        'GigabitEthernet0/0/{}'
+
+
+def build_table(routes, next_hops=8):
+    '''show ip route output of distinct /24 OSPF routes'''
+    lines = [HEADER]
+    for i in range(routes):
+        lines.append(ROUTE.format(10 + i // 65536, i // 256 % 256, i % 256,
+                                  i % next_hops, i % next_hops))
+    return '\n'.join(lines)
+
+
+def footprint(result):
+    '''bytes held by result and number of distinct strings, each object
+    counted once'''
+    seen = set()
+    size = strings = 0
+    stack = [result]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if obj.__class__ is str:
+            strings += 1
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return size, strings
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--routes', type=int, default=1000000)
+    my_parser.add_argument('--repeat', type=int, default=1)
+    args = my_parser.parse_args()
+
+    output = build_table(args.routes)
+    print('show ip route: {} routes, best of {}'.format(args.routes,
+                                                        args.repeat))
+    parsed = None
+    for enabled in (False, True):
+        with string_pool.pooled(enabled):
+            parser = ShowIpRoute(device=Mock())
+            result, parse_time = timed(parser.cli, output=output,
+                                       repeat=args.repeat)
+        assert parsed is None or result == parsed, 'results differ'
+        parsed = result
+        size, strings = footprint(result)
+        print('{:<12}{:>10.3f}s{:>10.1f} MB{:>12} strings'.format(
+            'pooled' if enabled else 'default', parse_time, size / 2 ** 20,
+            strings))
+        del result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+'''Benchmark the session transcript splitter
+
+Builds a synthetic iosxe session log repeating 'sh ip ro', 'sh arp',
+'sh clock' and 'terminal length 0', with a --More-- pager prompt and its
+backspaces every 24 lines, and times:
+    * the split of the log into (command, output) pairs
+    * the parse of every command in this process
+    * the parse of every command over the worker pool
+
+Usage:
+    python benchmarks/bench_transcript.py --blocks 200 --routes 500
+'''
+
+import os
+import argparse
+
+from genie.libs.parser.utils.transcript import iter_commands, \
+    iter_parse_transcript
+
+from bench_distributor import build_table, timed
+from bench_records import arp
+
+PAGER = ' --More-- ' + '\b' * 10 + ' ' * 10 + '\b' * 10
+
+CLOCK_OUTPUT = '18:56:04.554 EST Mon Oct 17 2016'
+
+
+def paged(output, page=24):
+    lines = output.splitlines()
+    for i in range(page, len(lines), page):
+        lines[i] = PAGER + lines[i]
+    return '\n'.join(lines)
+
+
+def build_transcript(blocks, routes):
+    block = '\n'.join([
+        'router1#terminal length 0',
+        'router1#sh ip ro',
+        paged(build_table(routes)),
+        'router1#sh arp',
+        paged(arp(routes)),
+        'router1#sh clock',
+        CLOCK_OUTPUT,
+    ])
+    return '\n'.join([block] * blocks + ['router1#', ''])
+
+
+def parse_all(transcript, processes):
+    results = list(iter_parse_transcript(transcript, 'iosxe',
+                                         processes=processes))
+    return sum(1 for result in results if 'parsed' in result)
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--blocks', type=int, default=200)
+    my_parser.add_argument('--routes', type=int, default=500,
+                           help='routes and arp entries per command')
+    my_parser.add_argument('--processes', type=int, default=os.cpu_count())
+    my_parser.add_argument('--repeat', type=int, default=3)
+    args = my_parser.parse_args()
+
+    transcript = build_transcript(args.blocks, args.routes)
+    size = len(transcript) / 1e6
+    lines = transcript.split('\n')
+    print('{} blocks, {} routes/arp entries per command, {:.1f}MB, {} lines,'
+          ' best of {}'.format(args.blocks, args.routes, size, len(lines),
+                               args.repeat))
+
+    commands, split_time = timed(lambda: list(iter_commands(lines)),
+                                 repeat=args.repeat)
+    print('{:<28}{:>9.3f}s  {:.0f}MB/s, {} commands'.format(
+        'split', split_time, size / split_time, len(commands)))
+
+    parsed, serial_time = timed(parse_all, transcript, 0, repeat=args.repeat)
+    print('{:<28}{:>9.3f}s  {} parsed'.format('parse, in process',
+                                              serial_time, parsed))
+    parsed, pool_time = timed(parse_all, transcript, args.processes,
+                              repeat=args.repeat)
+    print('{:<28}{:>9.3f}s  {} parsed, {:.2f}x'.format(
+        'parse, {} processes'.format(args.processes), pool_time, parsed,
+        serial_time / pool_time))
+
+
+if __name__ == '__main__':
+    main()
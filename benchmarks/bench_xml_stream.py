@@ -0,0 +1,123 @@
+'''Benchmark the streamed NX-OS '| xml' parsing
+
+Builds a synthetic 'show bgp vrf all all summary | xml' reply with many
+neighbors and measures, for the reply:
+    * ET.fromstring: time and peak memory of loading the whole tree, which
+      is what the xml methods did before XmlStream
+    * XmlStream: time and peak memory of walking the records
+    * ShowBgpVrfAllAllSummary.xml(): time of the complete xml method
+
+Peak memory is measured with tracemalloc in a second run and excludes the
+reply string.
+
+Usage:
+    python benchmarks/bench_xml_stream.py --neighbors 20000
+'''
+
+import time
+import argparse
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+from genie.libs.parser.utils.xml_stream import XmlStream, XML_END
+from genie.libs.parser.nxos.show_bgp_vrf import ShowBgpVrfAllAllSummary
+
+HEADER = '''\
+<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0" xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp">
+ <nf:data><show><bgp><vrf><all><all><summary><__readonly__>
+  <TABLE_vrf><ROW_vrf>
+   <vrf-name-out>default</vrf-name-out>
+   <vrf-router-id>10.106.0.6</vrf-router-id>
+   <vrf-local-as>333</vrf-local-as>
+   <TABLE_af><ROW_af><af-id>1</af-id><TABLE_saf><ROW_saf>
+    <safi>1</safi>
+    <af-name>IPv4 Unicast</af-name>
+    <tableversion>7</tableversion>
+    <configuredpeers>{neighbors}</configuredpeers>
+    <capablepeers>{neighbors}</capablepeers>
+    <totalnetworks>5</totalnetworks>
+    <totalpaths>10</totalpaths>
+    <memoryused>1820</memoryused>
+    <dampening>false</dampening>
+    <TABLE_neighbor>
+'''
+
+NEIGHBOR = '''\
+     <ROW_neighbor>
+      <neighborid>{neighbor}</neighborid>
+      <neighborversion>4</neighborversion>
+      <msgrecvd>5471</msgrecvd>
+      <msgsent>5459</msgsent>
+      <neighbortableversion>7</neighbortableversion>
+      <inq>0</inq>
+      <outq>0</outq>
+      <neighboras>{remote_as}</neighboras>
+      <time>3d18h</time>
+      <state>Established</state>
+      <prefixreceived>5</prefixreceived>
+     </ROW_neighbor>
+'''
+
+FOOTER = '''\
+    </TABLE_neighbor>
+   </ROW_saf></TABLE_saf></ROW_af></TABLE_af>
+  </ROW_vrf></TABLE_vrf>
+ </__readonly__></summary></all></all></vrf></bgp></show></nf:data>
+</nf:rpc-reply>
+]]>]]>
+'''
+
+
+def build(neighbors):
+    rows = [NEIGHBOR.format(
+                neighbor='10.{}.{}.{}'.format(i >> 16 & 255, i >> 8 & 255,
+                                              i & 255),
+                remote_as=65000 + i % 500)
+            for i in range(neighbors)]
+    return HEADER.format(neighbors=neighbors) + ''.join(rows) + FOOTER
+
+
+def measure(func):
+    # timed without tracemalloc, which slows down allocations
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--neighbors', type=int, default=20000)
+    args = parser.parse_args()
+
+    output = build(args.neighbors)
+    print('reply: {} neighbors, {:.1f} MB'.format(
+        args.neighbors, len(output) / 1e6))
+
+    _, elapsed, peak = measure(
+        lambda: ET.fromstring(output.replace(XML_END, '')))
+    print('{:<28}{:>8.3f}s {:>8.1f} MB'.format('ET.fromstring', elapsed,
+                                              peak / 1e6))
+
+    records, elapsed, peak = measure(lambda: sum(
+        1 for _ in XmlStream(output, records=['ROW_vrf', 'ROW_saf',
+                                              'ROW_neighbor'])))
+    print('{:<28}{:>8.3f}s {:>8.1f} MB'.format('XmlStream', elapsed,
+                                              peak / 1e6))
+
+    parsed, elapsed, peak = measure(
+        lambda: ShowBgpVrfAllAllSummary(device=None).xml(output=output))
+    print('{:<28}{:>8.3f}s {:>8.1f} MB'.format('ShowBgpVrfAllAllSummary.xml',
+                                              elapsed, peak / 1e6))
+
+    assert len(parsed['vrf']['default']['neighbor']) == args.neighbors
+    assert records == args.neighbors + 3
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,7 @@ See:
 
 import os
 import re
+import ast
 import sys
 
 from setuptools import setup, find_namespace_packages
@@ -40,6 +41,33 @@ def build_version_range(version):
 
     return version_range
 
+def find_compiled_modules(*paths):
+    '''reads a file and returns the defined MODULES list'''
+    for node in ast.parse(read(*paths)).body:
+        if isinstance(node, ast.Assign) and \
+                any(getattr(target, 'id', None) == 'MODULES'
+                    for target in node.targets):
+            return ast.literal_eval(node.value)
+    raise RuntimeError("Unable to find MODULES list.")
+
+def compiled_extensions(*paths):
+    '''Cython extensions of the modules of the compiled build, built from
+    their python source'''
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        sys.exit("GENIE_PARSER_COMPILE needs Cython, install it with: "
+                 "pip install 'genie.libs.parser[compiled]'")
+    from setuptools import Extension
+
+    extensions = [Extension(name,
+                            [os.path.join('src', *name.split('.')) + '.py'])
+                  for name in find_compiled_modules(*paths)]
+    return cythonize(extensions,
+                     build_dir = os.path.join('__build__', 'cython'),
+                     compiler_directives = {'language_level': 3,
+                                            'binding': True})
+
 def version_info(*paths):
     '''returns the result of find_version() and build_version_range() tuple'''
 
@@ -52,6 +80,12 @@ version, version_range = version_info('src', 'genie', 'libs', 'parser', '__init_
 # generate package dependencies
 install_requires = ['xmltodict']
 
+# compiled build of the hottest modules, see utils/compiled.py
+ext_modules = []
+if os.environ.get('GENIE_PARSER_COMPILE'):
+    ext_modules = compiled_extensions('src', 'genie', 'libs', 'parser',
+                                      'utils', 'compiled.py')
+
 # launch setup
 setup(
     name = 'genie.libs.parser',
@@ -112,6 +146,10 @@ setup(
 
     # console entry point
     entry_points = {
+        'console_scripts': [
+            'genie_bulk_parse = genie.libs.parser.utils.bulk:main',
+            'genie_regex_audit = genie.libs.parser.utils.regex_audit:main',
+        ],
     },
 
     # package dependencies
@@ -124,10 +162,12 @@ setup(
                 'restview',
                 'Sphinx',
                 'sphinx-rtd-theme'],
+        # build requirement of GENIE_PARSER_COMPILE, see utils/compiled.py
+        'compiled': ['cython'],
     },
 
     # external modules
-    ext_modules = [],
+    ext_modules = ext_modules,
 
     # any data files placed outside this package.
     # See: http://docs.python.org/3.4/distutils/setupscript.html
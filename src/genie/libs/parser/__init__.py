@@ -22,3 +22,8 @@ from .base import tcl_invoke_ats_cmd,\
 from genie import abstract
 abstract.declare_package(feature='parser')
 
+
+# validation mode of the parser results, see utils/schema_compiler.py
+import os
+if os.environ.get('GENIE_SCHEMA_VALIDATION'):
+    from .utils import schema_compiler
@@ -7,14 +7,14 @@ AIREOS parsers for the following commands:
     * ping {addr} {repeat count} {packet size}
     * ping {addr} {interface-name} {repeat count} {packet size}
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, SchemaTypeError, Schema)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class PingSchema(MetaParser):
     """ Schema for
         * ping {addr}
@@ -84,10 +84,10 @@ class Ping(PingSchema):
         # Send count=10, Receive count=10 from 10.25.10.1, Packet size = 84
         # Send count=3, Receive count=3 from 10.25.10.1
 
-        p1 = re.compile(r'Send count=+(?P<send_count>\d+), Receive ' \
-                        r'count=+(?P<rec_count>\d+) +from ' \
-                        r'+(?P<addr>\d+\.\d+\.\d+\.\d+)(, Packet +size = ' \
-                        r'+(?P<packet_size>\d+))?')
+        p1 = regex_engine.compile(r'Send count=+(?P<send_count>\d+), Receive ' \
+                                  r'count=+(?P<rec_count>\d+) +from ' \
+                                  r'+(?P<addr>\d+\.\d+\.\d+\.\d+)(, Packet +size = ' \
+                                  r'+(?P<packet_size>\d+))?')
         
         ping_dict = {}
         stat_dict = {}
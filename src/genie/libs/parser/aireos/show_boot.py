@@ -6,7 +6,6 @@ AireOS parser for the following command:
 """
 
 # Python
-import re
 import logging
 
 # Metaparser
@@ -14,6 +13,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, SchemaTypeError, Schema)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 log = logging.getLogger(__name__)
 
 class ShowBootSchema(MetaParser):
@@ -51,9 +53,9 @@ class ShowBoot(ShowBootSchema):
         # Backup Boot Image................................ 8.2.170.0
         # Primary Boot Image............................... 8.10.151.0 (default)
         # Backup Boot Image................................ 8.2.170.0 (active)
-        p1 = re.compile(r'^(?P<pri_bk>[P|p]rimary|[B|b]ackup) +[B|b]oot '
-                        r'+[I|i]mage\.+ +(?P<version_num>[\d\.]+)(( '
-                        r'+\((?P<default>default)\)?|)( +\((?P<status>active)\))?)?$')
+        p1 = regex_engine.compile(r'^(?P<pri_bk>[P|p]rimary|[B|b]ackup) +[B|b]oot '
+                                  r'+[I|i]mage\.+ +(?P<version_num>[\d\.]+)(( '
+                                  r'+\((?P<default>default)\)?|)( +\((?P<status>active)\))?)?$')
 
         for line in out.splitlines():
             line = line.strip()
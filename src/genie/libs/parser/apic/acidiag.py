@@ -1,10 +1,12 @@
 """ Parsers for 'acidiag' commands """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class AcidiagFnvreadSchema(MetaParser):
     """ Schema for 'acidiag fnvread' """
 
@@ -32,7 +34,7 @@ class AcidiagFnvread(AcidiagFnvreadSchema):
             output = self.device.execute(self.cli_command[0])
 
         # 201        1       hw_spine1_II23      FDO221425X6     10.0.152.65/32   spine         active   0
-        p1 = re.compile(r'^(?P<id>\d+) +(?P<pod_id>\d+) +(?P<name>\S+) +(?P<serial_number>\S+) +(?P<ip_address>\S+) +(?P<role>\S+) +(?P<state>\S+) +(?P<last_upd_msg_id>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<id>\d+) +(?P<pod_id>\d+) +(?P<name>\S+) +(?P<serial_number>\S+) +(?P<ip_address>\S+) +(?P<role>\S+) +(?P<state>\S+) +(?P<last_upd_msg_id>\d+)$')
 
         ret_dict = {}
 
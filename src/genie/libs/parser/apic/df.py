@@ -1,9 +1,11 @@
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class DfSchema(MetaParser):
 
@@ -38,7 +40,7 @@ class Df(DfSchema):
 
         # Filesystem                  1K-blocks    Used Available Use% Mounted on
         # /dev/mapper/vg_ifc0-scratch  41153760 6944104  32096120  18% /home
-        p1 = re.compile(r'(?P<filesystem>\S+)\s+(?P<blocks>\d+)\s+(?P<used>\d+)\s+(?P<available>\d+)\s+(?P<use_percentage>\d+)%\s+(?P<mounted_on>\S+)$')
+        p1 = regex_engine.compile(r'(?P<filesystem>\S+)\s+(?P<blocks>\d+)\s+(?P<used>\d+)\s+(?P<available>\d+)\s+(?P<use_percentage>\d+)%\s+(?P<mounted_on>\S+)$')
 
         df_dict = {}
 
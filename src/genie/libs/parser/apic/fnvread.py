@@ -1,9 +1,11 @@
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class FnvReadSchema(MetaParser):
     """Schema for fnvread"""
@@ -42,7 +44,7 @@ class FnvRead(FnvReadSchema):
 
         #         id               address  disabled    active  occupied permanent              model  nodeRole  nodeType  fabricId     podId
         #     101(1)      10.0.32.64/32(1)     NO(1)    YES(1)    YES(1)    YES(1)N9K-C93240YC-FX2(1)      2(1)      0(1)      1(1)      1(1)
-        p1 = re.compile(r'(?P<node>\d+){0}(?P<address>\S+){0}(?P<disabled>\S+){0}(?P<active>\S+){0}(?P<occupied>\S+){0}(?P<permanent>\S+){0}(?P<model>\S+){0}(?P<node_role>\S+){0}(?P<node_type>\S+){0}(?P<fabric_id>\S+){0}(?P<pod>\S+){0}'.format(r'\(\d+\)\s*'))
+        p1 = regex_engine.compile(r'(?P<node>\d+){0}(?P<address>\S+){0}(?P<disabled>\S+){0}(?P<active>\S+){0}(?P<occupied>\S+){0}(?P<permanent>\S+){0}(?P<model>\S+){0}(?P<node_role>\S+){0}(?P<node_type>\S+){0}(?P<fabric_id>\S+){0}(?P<pod>\S+){0}'.format(r'\(\d+\)\s*'))
 
         fnv_dict = {}
 
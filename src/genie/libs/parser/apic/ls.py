@@ -1,9 +1,11 @@
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class LsSchema(MetaParser):
     schema = {
@@ -42,12 +44,12 @@ class Ls(LsSchema):
             out = output
 
         # total 426296
-        p0 = re.compile(r'^\s*total\s+(?P<total>\d+)')
+        p0 = regex_engine.compile(r'^\s*total\s+(?P<total>\d+)')
 
         # file mode, number of links, owner name, group name, number of bytes in the file
         # lrwxrwxrwx 1 root  root          12 Mar 23 23:36 aci -> /.aci/viewfs
         # lrwxrwxrwx 1 root  root          12 Mar 23  2009 nonaci
-        p1 = re.compile(r'(?P<mode>\S+)\s+(?P<links>\d+)\s+(?P<user>\S+)\s+(?P<group>\S+)\s+(?P<size>\d+)\s+(?P<month>\w+)\s+(?P<day>\d+)\s+(?:(?:(?P<hour>\d+):(?P<minute>\d+))|(?P<year>\d+))\s+(?P<filename>.*?)$')
+        p1 = regex_engine.compile(r'(?P<mode>\S+)\s+(?P<links>\d+)\s+(?P<user>\S+)\s+(?P<group>\S+)\s+(?P<size>\d+)\s+(?P<month>\w+)\s+(?P<day>\d+)\s+(?:(?:(?P<hour>\d+):(?P<minute>\d+))|(?P<year>\d+))\s+(?P<filename>.*?)$')
 
         ls_dict = {}
 
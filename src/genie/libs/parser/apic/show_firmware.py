@@ -1,10 +1,12 @@
 """ Parsers for NXOS ACI """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowFirmwareUpgradeStatusSchema(MetaParser):
     """ Schema for
@@ -66,7 +68,7 @@ class ShowFirmwareUpgradeStatus(ShowFirmwareUpgradeStatusSchema):
         #  1           112         n9000-15.0(0.138)     n9000-15.0(0.144)     upgrade in progress        45                    downloaded                 100                 
         #  1           113         n9000-15.0(0.138)     n9000-15.0(0.144)     upgrade in progress        45                    downloaded       
 
-        p1 = re.compile(r"^\s*(?P<pod>\d+)  +(?P<node>\d+)  +(?P<current_firmware>\S+)  +(?:(?P<target_firmware>\S+)?  +)?(?P<status>\w+(?: \w+)*\w)  +(?P<upgrade_progress_percentage>\d+|-)(?: *(?:(?P<download_status>\S+) *(?P<download_progress_percentage>\d+)?)?)")
+        p1 = regex_engine.compile(r"^\s*(?P<pod>\d+)  +(?P<node>\d+)  +(?P<current_firmware>\S+)  +(?:(?P<target_firmware>\S+)?  +)?(?P<status>\w+(?: \w+)*\w)  +(?P<upgrade_progress_percentage>\d+|-)(?: *(?:(?P<download_status>\S+) *(?P<download_progress_percentage>\d+)?)?)")
 
         ret_dict = {}
 
@@ -116,7 +118,7 @@ class ShowFirmwareUpgradeStatusControllerGroup(ShowFirmwareUpgradeStatusSchema):
         # ----------  ----------  --------------------  --------------------  -------------------------  --------------------  ------------------------------
 
         # 1           1           apic-5.0(1k)          apic-5.0(1k)          success                    100                   2020-11-17T18:43:57.000+00:00
-        p1 = re.compile(r"^(?P<pod>\d+)  +(?P<node>\d+)  +(?P<current_firmware>\S+)  +(?:(?P<target_firmware>\S+)  +)?(?P<status>\w+(?: \w+)*\w)  +(?P<upgrade_progress_percentage>\d+|-)  +(?P<last_firmware_install_date>\S+)")
+        p1 = regex_engine.compile(r"^(?P<pod>\d+)  +(?P<node>\d+)  +(?P<current_firmware>\S+)  +(?:(?P<target_firmware>\S+)  +)?(?P<status>\w+(?: \w+)*\w)  +(?P<upgrade_progress_percentage>\d+|-)  +(?P<last_firmware_install_date>\S+)")
 
         ret_dict = {}
 
@@ -181,7 +183,7 @@ class ShowFirmwareRepository(ShowFirmwareRepositorySchema):
         #  aci-catalog-dk10.121.8.2.bin                catalog     70.8(2)        0.129
         #  aci-apic-dk9.5.0.1k.bin                   controller  5.0(1k)        6266.102
         #  aci-catalog-dk10.121.7.4.bin                catalog     70.7(4)        0.128
-        p1 = re.compile(r"^(?P<name>\S+) +(?P<type>\S+) +(?P<version>\S+) +(?P<size>[\d\.]+)$")
+        p1 = regex_engine.compile(r"^(?P<name>\S+) +(?P<type>\S+) +(?P<version>\S+) +(?P<size>[\d\.]+)$")
 
         ret_dict = {}
 
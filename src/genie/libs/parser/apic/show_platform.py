@@ -1,8 +1,10 @@
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowVersionSchema(MetaParser):
     """Schema for show version"""
@@ -48,7 +50,7 @@ class ShowVersion(ShowVersionSchema):
         #  leaf        1           101         msl-ifav205-leaf1         n9000-15.1(2e)       
         #  spine       1           201         msl-ifav205-spine1        n9000-15.1(2e)       
         #  spine       1           202         msl-ifav205-spine2        n9000-14.2(2e)       
-        p1 = re.compile(r"^(?P<role>\S+)  +(?P<pod>\d+)  +(?P<node>\d+)  +(?:(?P<name>\S+)  +)?(?P<version>\S+)")
+        p1 = regex_engine.compile(r"^(?P<role>\S+)  +(?P<pod>\d+)  +(?P<node>\d+)  +(?:(?P<name>\S+)  +)?(?P<version>\S+)")
 
         version_dict = {}
 
@@ -4,13 +4,13 @@ Parser for the following show commands:
     * show arp
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Schema for 'show arp'
 # =============================================
@@ -57,7 +57,7 @@ class ShowArp(ShowArpSchema):
         # outside 10.10.1.1 aa11.bbff.ee55 -
         # outside 10.10.1.1 aa11.bbff.ee55 alias
         # outside 10.10.1.1/1 aa11.bbff.ee55 -
-        p1 = re.compile(r'^(?P<name>\S+) +(?P<ip>\d+.\d+.\d+.\d+)'
+        p1 = regex_engine.compile(r'^(?P<name>\S+) +(?P<ip>\d+.\d+.\d+.\d+)'
             r'(\/(?P<prefix_length>[0-9]+))? +(?P<link_layer_address>\S+.\S+.\S+) '
             r'+(?P<age>\S+)$')
 
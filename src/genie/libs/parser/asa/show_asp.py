@@ -4,11 +4,13 @@ Parser for the following show command(s):
     * show asp drop
 """
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                                 Any, \
                                                 Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # =============================================
@@ -53,16 +55,16 @@ class ShowAspDrop(ShowAspDropSchema):
         # Regular expression patterns
         # -----------------------------------------------
         # Frame drop:
-        p0 = re.compile(r'^Frame drop:$')
+        p0 = regex_engine.compile(r'^Frame drop:$')
 
         #   Reverse-path verify failed (rpf-violated)                                   23
-        p1 = re.compile(r'^.*\((?P<drop>\S+)\)\s+(?P<counts>\d+)$')
+        p1 = regex_engine.compile(r'^.*\((?P<drop>\S+)\)\s+(?P<counts>\d+)$')
 
         # Last clearing: 10:43:33 EDT Mar 27 2019 by genie
-        p2 = re.compile(r'^Last\s+clearing:\s+(?P<last_clearing>[\s\S]+)$')
+        p2 = regex_engine.compile(r'^Last\s+clearing:\s+(?P<last_clearing>[\s\S]+)$')
 
         # Flow drop:
-        p3 = re.compile(r'^Flow drop:$')
+        p3 = regex_engine.compile(r'^Flow drop:$')
 
         # -----------------------------------------------
         # Parse the output
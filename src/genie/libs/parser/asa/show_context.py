@@ -5,12 +5,14 @@ Parser for the following show commands:
     * show context detail
 '''
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                                 Any, \
                                                 Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Schema for 'show context'
 # =============================================
@@ -51,13 +53,13 @@ class ShowContext(ShowContextSchema):
         # pod1             default              Vlan100,Vlan200      Routed       disk0:/pod-context/pod1
         # pod2             111                  Vlan300,Vlan400      Routed       disk0:/pod-context/pod2
         # *admin            default              Vlan1000,Vlan1001,   Routed       disk0:/pod-context/admin.cfg
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<context_name>\S+)\s+(?P<class>\S+)\s+(?P<interface>\S+)\s+'
             r'(?P<mode>(?!Contexts:)\S+)\s+(?P<url>\S+)$')
 
         # Vlan1030,Vlan1031,
         # Vlan1082,Vlan1083...
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<interface>\S+)$')
 
         for line in out.splitlines():
@@ -153,32 +155,32 @@ class ShowContextDetail(ShowContextDetailSchema):
 
         # Context "pod1", has been created
         # Context "null", is a system resource
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Context +\"(?P<context_name>\S+)\",*\s(?P<condition>.*)$')
 
         # Config URL: disk0:/pod-context/pod1
         # Config URL: ... null ...
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^Config\s*URL:\s*(?P<url>.*)$')
 
         # Real Interfaces: Vlan100, Vlan200
         # Real Interfaces:
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Real\s*Interfaces:\s*(?P<real_interfaces>.*)$')
 
         # Mapped Interfaces: Vlan100, Vlan200
         # Mapped Interfaces:
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Mapped\s*Interfaces:\s*(?P<mapped_interfaces>.*)$')
 
         #  Vlan993, Vlan994, Vlan995, Vlan996, Vlan997, Vlan998, Vlan999
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^(?P<interfaces>(\S+,)?\s*(\S+,)?\s*(\S+,)?\s*(\S+,)?\s*(\S+,)?\s*(\S+,)'
             r'?\s*(\S+,)?\s*(\S+,)?\s*(\S+,)?\s*(\S+,)?\s*(\S+,)?\s*(\S+,)?\s*(\S+)'
             r'?\s*)$')
         
         # Class: default, Flags: 0x00000111, ID: 1
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Class: *(?P<class>\S+),\s*Flags:\s*(?P<flags>\S+),\s*ID:\s*(?P<id>\d+)$')
 
         for line in out.splitlines():
@@ -3,11 +3,13 @@ show_crypto_ikev2_sa.py
 Parser for the following command:
     * show crypto ikev2 sa
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Schema, Any, Optional)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowCryptoIkev2SaSchema(MetaParser):
     """Schema for
@@ -68,7 +70,7 @@ class ShowCryptoIkev2Sa(ShowCryptoIkev2SaSchema):
         child_sa_index = 0
 
         # Session-id:1, Status:UP-ACTIVE, IKE count:1, CHILD count:1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Session-id:(?P<session_id>[\d+]),\s+'
             r'Status:(?P<status>[A-Za-z\-]{1,}),\s+'
             r'IKE\scount:(?P<ike_count>[\d+]),\s+'
@@ -76,14 +78,14 @@ class ShowCryptoIkev2Sa(ShowCryptoIkev2SaSchema):
         )
 
         # 3752379 2001:db8:2:1::1/500 2001:db8:2:1::2/500 READY INITIATOR
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<tunnel_id>\d+)\s+(?P<local>\S+)\s+'
             r'(?P<remote>\S+)\s+(?P<status>\w+)\s+(?P<role>\w+)$'
         )
 
         # Encr: 3DES, Hash: SHA96, DH Grp:2, Auth sign: PSK, Auth verify: PSK
         # Encr: AES-CBC, keysize: 256, Hash: SHA512, DH Grp:19, Auth sign: PSK, Auth verify: PSK
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Encr:\s+(?P<encr>\S+),( +keysize:\s+(?P<keysize>\d+),)?'
             r' +Hash:\s+(?P<hash>\S+),\s+DH\sGrp:(?P<dh_group>\d+),\s+'
             r'Auth\ssign:\s+(?P<auth_sign>\S+),\s+Auth\sverify:\s+'
@@ -91,25 +93,25 @@ class ShowCryptoIkev2Sa(ShowCryptoIkev2SaSchema):
         )
 
         # Life/Active Time: 43200/53 sec
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Life\/Active\sTime:\s+'
             r'(?P<life_time>\d+)\/(?P<active_time>\d+)\s+sec$'
         )
 
         # Child sa: local selector  2001:db8:1:1::/0 -
         # 2001:db8:1:1:ffff:ffff:ffff:ffff/65535
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Child\ssa:\slocal\sselector\s+(?P<local_selector>.*)$'
         )
 
         # remote selector 2001:db8:3:1::/0 -
         # 2001:db8:3:1:ffff:ffff:ffff:ffff/65535
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^remote\sselector\s+(?P<remote_selector>.*)$'
         )
 
         # ESP spi in/out: 0x295bd35a/0x5755a09f
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^ESP\sspi\sin\/out:\s+(?P<esp_in>\S+)\/(?P<esp_out>\S+)$'
         )
 
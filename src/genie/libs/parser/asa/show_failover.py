@@ -4,12 +4,14 @@ ASA parsers for for the following commands:
     * show failover interface
 '''
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 from genie import parsergen
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowFailoverSchema(MetaParser):
     '''Schema for:
@@ -132,73 +134,73 @@ class ShowFailover(ShowFailoverSchema):
 
         # Failover On
         # Failover Off
-        p1 = re.compile(r'^Failover\s(?P<status>On|Off)$')
+        p1 = regex_engine.compile(r'^Failover\s(?P<status>On|Off)$')
 
         # Failover unit Secondary
         # Failover unit Primary
-        p2 = re.compile(r'^Failover +unit\s(?P<is_primary>Primary|Secondary)$')
+        p2 = regex_engine.compile(r'^Failover +unit\s(?P<is_primary>Primary|Secondary)$')
 
         # Failover LAN Interface: folink GigabitEthernet0/1 (up)
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Failover +LAN +Interface:\s(?P<name>[A-Za-z0-9\-\_]+)\s+'
             r'(?P<interface>(Lo\S*|Fa\S*|Gi\S*|Ten\S*|\S*(SL|VL)\S*|Se\S*|VoIP\S*|Configured))'
             r'( +\((?P<status>[A-Za-z0-0_\-\s]+)\))?$'
         )
 
         # Reconnect timeout 0:00:00
-        p4 = re.compile(r'^Reconnect +timeout\s+(?P<timeout>\S+)$')
+        p4 = regex_engine.compile(r'^Reconnect +timeout\s+(?P<timeout>\S+)$')
 
         # Unit Poll frequency 1 seconds, holdtime 15 seconds
         # Unit Poll frequency 300 milliseconds, holdtime 999 milliseconds
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Unit +Poll +frequency\s+(?P<poll>\d+)\s+(?P<poll_unit>seconds|milliseconds),'
             r' +holdtime\s+(?P<holdtime>\d+)\s+(?P<holdtime_unit>seconds|milliseconds)$'
         )
 
         # Interface Poll frequency 800 milliseconds, holdtime 5 seconds
         # Interface Poll frequency 5 seconds, holdtime 25 seconds
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Interface +Poll +frequency\s+(?P<poll>\d+)\s+(?P<poll_unit>seconds|milliseconds),'
             r' +holdtime\s+(?P<holdtime>\d+)\s+(?P<holdtime_unit>seconds|milliseconds)$'
         )
 
         # Interface Policy 1
-        p7 = re.compile(r'^Interface +Policy\s+(?P<policy>\d+)$')
+        p7 = regex_engine.compile(r'^Interface +Policy\s+(?P<policy>\d+)$')
 
         # Monitored Interfaces 1 of 311 maximum
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Monitored +Interfaces\s+(?P<monitored>\d+) +of\s+(?P<max>\d+) +maximum$'
         )
 
         # Version: Ours 9.14(1), Mate 9.14(1)
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^Version: +Ours\s+(?P<ours>[A-Za-z0-9\.\(\)]+),'
             r' +Mate\s+(?P<mate>[A-Za-z0-9\.\(\)]+)$'
         )
 
         # Serial Number: Ours 9AW2PSRETDT, Mate 9ASGGBEE416
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^Serial +Number: +Ours\s+(?P<ours>[A-Za-z0-9]+),'
             r' +Mate\s+(?P<mate>[A-Za-z0-9]+)$'
         )
 
         # Last Failover at: 20:37:30 UTC Apr 11 2021
-        p11 = re.compile(r'^Last +Failover +at:\s+(?P<failover>.*)$')
+        p11 = regex_engine.compile(r'^Last +Failover +at:\s+(?P<failover>.*)$')
 
         # This host: Primary - Active
         # Other host: Secondary - Standby Ready
         # Other host: Secondary - Failed
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^(?P<which>This|Other) +host:\s+(?P<is_primary>\w+)\s+\-\s+(?P<state>.*)$'
         )
 
         # Active time: 1106 (sec)
-        p13 = re.compile(r'^Active +time:\s+(?P<active_time>\d+)\s+\(sec\)$')
+        p13 = regex_engine.compile(r'^Active +time:\s+(?P<active_time>\d+)\s+\(sec\)$')
 
         # Interface management (192.168.253.14): Normal (Waiting)
         # Interface outside (0.0.0.0/fe80::e8f:c5ff:fe5f:d01): Unknown (Waiting)
         # Interface outside (0.0.0.0/fe80::ecd:e9ff:fe5c:5301): Normal (Not-Monitored)
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r'^Interface\s+(?P<interface>\w+)\s+\((?P<ipv4>[0-9\.]+)'
             r'(\/(?P<ipv6>[A-Za-z0-9:]+))?\):\s+(?P<state>\w+)\s+'
             r'\((?P<monitored_state>[A-Za-z0-9\-_]+)\)$'
@@ -207,21 +209,21 @@ class ShowFailover(ShowFailoverSchema):
         # slot 0: ASAv hw/sw rev (/9.14(1)) status (Up Sys)
         # slot 1: IPS5515 hw/sw rev (N/A/7.1(4)E4) status (Up/Up)
         # slot 0: ASA5515 hw/sw rev (1.0/9.2(2)4) status (Up Sys)
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r'^slot\s+(?P<slot>\d+):\s+(?P<model>[A-Za-z0-9\-_]+) +hw\/sw +rev\s+'
             r'\((?P<version>\S+)\) +status\s+\((?P<status>[A-Za-z0-9_\-\s\/]+)\)$'
         )
 
         #         Recv Q:         0       0       0
-        p16_1 = re.compile(r'^Recv +Q:\s+(?P<curr>\d+)\s+(?P<max>\d+)\s+(?P<total>\d+)$')
+        p16_1 = regex_engine.compile(r'^Recv +Q:\s+(?P<curr>\d+)\s+(?P<max>\d+)\s+(?P<total>\d+)$')
 
         # Xmit Q:         0       0       0
-        p16_2 = re.compile(r'^Xmit +Q:\s+(?P<curr>\d+)\s+(?P<max>\d+)\s+(?P<total>\d+)$')
+        p16_2 = regex_engine.compile(r'^Xmit +Q:\s+(?P<curr>\d+)\s+(?P<max>\d+)\s+(?P<total>\d+)$')
 
         # Stateful Failover Logical Update Statistics
         # Link : foupdateif GigabitEthernet0/3 (administratively down)
-        p17_1 = re.compile(r'^Stateful +Failover +Logical +Update +Statistics$')
-        p17_2 = re.compile(
+        p17_1 = regex_engine.compile(r'^Stateful +Failover +Logical +Update +Statistics$')
+        p17_2 = regex_engine.compile(
             r'^Link\s+:\s+(?P<name>[A-Za-z0-9]+)\s+'
             r'(?P<interface>(Lo\S*|Fa\S*|Gi\S*|Ten\S*|\S*(SL|VL)\S*|Se\S*|VoIP\S*|Configured))'
             r'( +\((?P<status>[A-Za-z0-0_\-\s]+)\))?$'
@@ -527,16 +529,16 @@ class ShowFailoverInterface(ShowFailoverInterfaceSchema):
             out = output
 
         # interface folink GigabitEthernet0/1
-        p1 = re.compile(r'^interface\s+(?P<name>\w+)\s+(?P<interface>[A-Za-z]+\s*[\.\d\/]+)$')
+        p1 = regex_engine.compile(r'^interface\s+(?P<name>\w+)\s+(?P<interface>[A-Za-z]+\s*[\.\d\/]+)$')
 
         # System IP Address: 2001:db8:cafe:ffee::a/127
-        p2 = re.compile(r'^System +IP +Address:\s+(?P<ip>\S+)$')
+        p2 = regex_engine.compile(r'^System +IP +Address:\s+(?P<ip>\S+)$')
 
         # My IP Address    : 2001:db8:cafe:ffee::a
-        p3 = re.compile(r'^My +IP +Address\s+:\s+(?P<ip>\S+)$')
+        p3 = regex_engine.compile(r'^My +IP +Address\s+:\s+(?P<ip>\S+)$')
 
         # Other IP Address : 2001:db8:cafe:ffee::b
-        p4 = re.compile(r'^Other +IP +Address\s+:\s+(?P<ip>\S+)$')
+        p4 = regex_engine.compile(r'^Other +IP +Address\s+:\s+(?P<ip>\S+)$')
 
         parsed_dict = {}
 
@@ -6,13 +6,13 @@ Parser for the following show commands:
     * show interface details
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =============================================
 # Schema for 'show interface summary'
@@ -65,19 +65,19 @@ class ShowInterfaceSummary(ShowInterfaceSummarySchema):
         # Interface Vlan100 "pod10", is up, line protocol is up
         # Interface GigabitEthernet0/5 "", is administratively down, line protocol is up
         # Interface "nlp_int_tap", is up, line protocol is up
-        p1 = re.compile(r'^Interface +((?P<interface>\S+) +)?"(?P<name>\S*)", +is +'
+        p1 = regex_engine.compile(r'^Interface +((?P<interface>\S+) +)?"(?P<name>\S*)", +is +'
             r'(?P<link_status>[\w\s]+), +line +protocol +is +(?P<line_protocol>\w+)$')
 
         # MAC address aa11.bbff.ee55, MTU 1500
-        p2 = re.compile(r'^MAC address +(?P<mac_address>[\w\.]+), +MTU +(?P<mtu>\d+)$')
+        p2 = regex_engine.compile(r'^MAC address +(?P<mac_address>[\w\.]+), +MTU +(?P<mtu>\d+)$')
 
         # IP address 10.10.10.1, subnet mask 255.255.255.0
-        p3 = re.compile(r'^IP +address +(?P<ip>[a-z0-9\.]+)'
+        p3 = regex_engine.compile(r'^IP +address +(?P<ip>[a-z0-9\.]+)'
             r'(\/(?P<prefix_length>[0-9]+))?, +subnet +mask '
             r'+(?P<subnet>[\w\.]+)$')
 
         # Available but not configured via nameif
-        p4 = re.compile(r'^(?P<interface_state>Available) +but +'
+        p4 = regex_engine.compile(r'^(?P<interface_state>Available) +but +'
             r'(?P<config_status>not +configured) +via +(?P<config_issue>\S*)$')
 
         for line in output.splitlines():
@@ -212,9 +212,9 @@ class ShowInterfaceIpBrief(ShowInterfaceIpBriefSchema):
         # GigabitEthernet0/3 10.10.1.1  YES DHCP   admin down            down
         # GigabitEthernet0/6 unassigned YES unset  administratively down up
         # Management0/0      10.10.1.1  YES CONFIG up
-        p1 = re.compile(r'^(?P<interface>\S+) *(?P<ip>unassigned|\d+.\d+.\d+.\d+)?'
-                        r'(\/(?P<prefix_length>[0-9]+))? *(?P<check>\w+) *(?P<method>\w+) *'
-                        r'(?P<link_status>\S* ?\S*?) *(?P<line_protocol>\w+)?$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+) *(?P<ip>unassigned|\d+.\d+.\d+.\d+)?'
+                                  r'(\/(?P<prefix_length>[0-9]+))? *(?P<check>\w+) *(?P<method>\w+) *'
+                                  r'(?P<link_status>\S* ?\S*?) *(?P<line_protocol>\w+)?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -327,52 +327,52 @@ class ShowInterfaceDetail(ShowInterfaceDetailSchema):
         ret_dict = {}
 
         # Interface Vlan300 "admin-out", is up, line protocol is up
-        p1 = re.compile(r'^Interface +(?P<interface>\S+) +"(?P<name>\S*)", +is +'
+        p1 = regex_engine.compile(r'^Interface +(?P<interface>\S+) +"(?P<name>\S*)", +is +'
             r'(?P<link_status>[\w\s]+), +line +protocol +is +(?P<line_protocol>\w+)$')
 
         # MAC address aa11.bbff.ee55, MTU 1500
-        p2 = re.compile(r'^MAC address +(?P<mac_address>[\w\.]+), +MTU +(?P<mtu>\d+)$')
+        p2 = regex_engine.compile(r'^MAC address +(?P<mac_address>[\w\.]+), +MTU +(?P<mtu>\d+)$')
 
         # IP address 10.10.10.1, subnet mask 255.255.255.0
-        p3 = re.compile(r'^IP +address +(?P<ip>[a-z0-9\.]+)'
-                        r'(\/(?P<prefix_length>[0-9]+))?, +subnet +mask '
-                        r'+(?P<subnet>[\w\.]+)$')
+        p3 = regex_engine.compile(r'^IP +address +(?P<ip>[a-z0-9\.]+)'
+                                  r'(\/(?P<prefix_length>[0-9]+))?, +subnet +mask '
+                                  r'+(?P<subnet>[\w\.]+)$')
 
         # Available but not configured via nameif
-        p4 = re.compile(r'^(?P<interface_state>Available) +but +'
+        p4 = regex_engine.compile(r'^(?P<interface_state>Available) +but +'
             r'(?P<config_status>not +configured) +via +(?P<config_issue>\S*)$')
 
         # 889007666 packets input, 785740327549 bytes
-        p5 = re.compile(r'^(?P<packets_input>\d+) +packets +input, '
+        p5 = regex_engine.compile(r'^(?P<packets_input>\d+) +packets +input, '
             r'+(?P<bytes_input>[\d]+) +bytes$')
 
         # 621453837 packets output, 428046938178 bytes
-        p6 = re.compile(r'^(?P<packets_output>\d+) +packets +output, '
+        p6 = regex_engine.compile(r'^(?P<packets_output>\d+) +packets +output, '
             r'+(?P<bytes_output>[\d]+) +bytes$')
 
         # 2988535 packets dropped
-        p7 = re.compile(r'^(?P<packets_dropped>\d+) +packets +dropped$')
+        p7 = regex_engine.compile(r'^(?P<packets_dropped>\d+) +packets +dropped$')
 
         # Interface number is 5
-        p8 = re.compile(r'^Interface +number +is +(?P<interface_number>\d+)$')
+        p8 = regex_engine.compile(r'^Interface +number +is +(?P<interface_number>\d+)$')
 
         # Interface config status is active
         # Interface config status is not active
-        p9 = re.compile(r'^Interface +config +status +is '
+        p9 = regex_engine.compile(r'^Interface +config +status +is '
             r'+(?P<interface_config_status>[\S\s]+)$')
 
         # Interface state is active
         # Interface state is not active
-        p10 = re.compile(r'^Interface +state +is +(?P<interface_state>[\w\ ]+)$')
+        p10 = regex_engine.compile(r'^Interface +state +is +(?P<interface_state>[\w\ ]+)$')
 
         # Interface vlan config status is active
         # Interface vlan config status is not active
-        p11 = re.compile(r'^Interface +vlan +config +status +is '
+        p11 = regex_engine.compile(r'^Interface +vlan +config +status +is '
             r'+(?P<interface_vlan_config_status>[\S\s]+)$')
 
         # Interface vlan state is UP
         # Interface vlan state is DOWN (down in system space)
-        p12 = re.compile(r'^Interface +vlan +state +is +'
+        p12 = regex_engine.compile(r'^Interface +vlan +state +is +'
             r'(?P<interface_vlan_state>\w+)+([\S\s]+)?$')
 
         for line in out.splitlines():
@@ -4,13 +4,13 @@ Parser for the following show commands:
     * show inventory
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Schema for 'show inventory'
 # =============================================
@@ -49,13 +49,13 @@ class ShowInventory(ShowInventorySchema):
 
         # Name: "Chassis", DESCR: "ASA 5555-X with SW, 8 GE Data, 1 GE Mgmt"
         # Name: "power supply 1", DESCR: "ASA 5545-X/5555-X AC Power Supply"
-        p1 = re.compile(r'^Name:\s+"(?P<name>.+)",\s+DESCR:\s+"(?P<description>.+)"$')
+        p1 = regex_engine.compile(r'^Name:\s+"(?P<name>.+)",\s+DESCR:\s+"(?P<description>.+)"$')
 
         # PID: ASA5555, VID: V01, SN: AAAAA11111
         # PID: AAA-AAA-AAA, VID: N/A, SN: AAA111
         # PID: N/A, VID: N/A, SN: AAAAA11111
         # PID: N/A, VID: , SN: AAAAA11111
-        p2 = re.compile(r'^PID:\s+(?P<pid>.+),\s+VID:\s?(?P<vid>.+),\s+SN:\s+(?P<sn>.+)$')
+        p2 = regex_engine.compile(r'^PID:\s+(?P<pid>.+),\s+VID:\s?(?P<vid>.+),\s+SN:\s+(?P<sn>.+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4,15 +4,15 @@ Parser for the following show commands:
     * show ip local pool {pool}
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Schema, 
                                                 Any,
                                                 Optional)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Schema for 'show ip local pool {pool}'
 # =============================================
@@ -58,18 +58,18 @@ class ShowIpLocalPool(ShowIpLocalPoolSchema):
         address_type = None
 
         # 192.168.1.144   192.168.1.147   255.255.255.252     2        0        2
-        p1 = re.compile(r'^(?P<begin>\S+) +(?P<end>\S+) +'
-                        r'(?P<mask>\S+) +(?P<free>\d+) +'
-                        r'(?P<held>\d+) +(?P<in_use>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<begin>\S+) +(?P<end>\S+) +'
+                                  r'(?P<mask>\S+) +(?P<free>\d+) +'
+                                  r'(?P<held>\d+) +(?P<in_use>\d+)$')
 
         # Available Addresses:
-        p2 = re.compile(r'^Available +Addresses:$')
+        p2 = regex_engine.compile(r'^Available +Addresses:$')
 
         # In Use Addresses:
-        p3 = re.compile(r'^In +Use +Addresses:$')
+        p3 = regex_engine.compile(r'^In +Use +Addresses:$')
 
         # 192.168.1.145
-        p4 = re.compile(r'^(?P<ip_address>\S+)$')
+        p4 = regex_engine.compile(r'^(?P<ip_address>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4,11 +4,13 @@ Parser for the following show commands:
     * show resource usage
 """
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                                 Any, \
                                                 Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # =============================================
@@ -59,9 +61,9 @@ class ShowResourceUsage(ShowResourceUsageSchema):
         # SSH                         1            5          5             0 System
         # Syslogs [rate]             18          861        N/A             0 System
 
-        p = re.compile(r'^^(?P<resource>[\s\S]+)\s+(?P<current>\d+)\s+'
-                       r'(?P<peak>\d+)\s+(?P<limit>\d+|N\/A)\s+'
-                       r'(?P<denied>\d+)\s+(?P<context>\S+)$$')
+        p = regex_engine.compile(r'^^(?P<resource>[\s\S]+)\s+(?P<current>\d+)\s+'
+                                 r'(?P<peak>\d+)\s+(?P<limit>\d+|N\/A)\s+'
+                                 r'(?P<denied>\d+)\s+(?P<context>\S+)$$')
 
         # --------------------------------------------------------
         # Parse the output
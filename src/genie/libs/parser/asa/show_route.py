@@ -10,6 +10,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 from netaddr import IPAddress, INET_ATON
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =============================================
 # Schema for 'show route'
@@ -162,43 +165,43 @@ class ShowRoute(ShowRouteSchema):
         # D 10.0.0.0 255.255.255.0 [90/30720] via 192.168.1.1, 0:19:52, inside
 
         # [110/11] via 10.20.192.3, 1w1d, wan3 [110/11] via 10.20.192.4, 1w1d, wan4
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'\[(?P<route_preference>[\d\/]+)\]\svia\s+(?P<next_hop>\S+),\s(?P<date>\S+),\s+(?P<context_name>\S+)')
 
         # O E2
-        p3 = re.compile(r'^(?P<protocol>\S+)\s(?P<code>[A-Z].+?)')
+        p3 = regex_engine.compile(r'^(?P<protocol>\S+)\s(?P<code>[A-Z].+?)')
 
         # [20/0] via 172.25.141.2, 7w0d
-        p4 = re.compile(r'\[(?P<route_preference>[\d\/]+)\]\svia\s+(?P<next_hop>\S+),\s(?P<date>\S+)')
+        p4 = regex_engine.compile(r'\[(?P<route_preference>[\d\/]+)\]\svia\s+(?P<next_hop>\S+),\s(?P<date>\S+)')
 
         # L 10.10.1.5 255.255.255.255 is directly connected, pod2500
-        p5 = re.compile(r'^(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s(?:.*),\s(?P<context_name>\S+)')
+        p5 = regex_engine.compile(r'^(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s(?:.*),\s(?P<context_name>\S+)')
 
         # SI 10.121.0.0 255.0.0.0 [1/0] is directly connected, gig3
-        p5_1 = re.compile(
+        p5_1 = regex_engine.compile(
             r'^(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s(\[(?P<route_preference>[\d\/]+)\])?\s(?:.*),\s(?P<context_name>\S+)')
 
         # S 0.0.0.1 0.0.0.0 [10/5]
-        p6 = re.compile(r'^(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s\[(?P<route_preference>[\d\/]+)\]')
+        p6 = regex_engine.compile(r'^(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s\[(?P<route_preference>[\d\/]+)\]')
 
         # via 10.16.255.1, outside via 10.16.255.2, pod1001 via 10.16.255.3, pod1002
-        p7 = re.compile(r'via\s+(?P<next_hop>\S+),\s+(?P<context_name>\S+)')
+        p7 = regex_engine.compile(r'via\s+(?P<next_hop>\S+),\s+(?P<context_name>\S+)')
 
         # D 10.0.0.0 255.255.255.0 [90/30720] via 192.168.1.1, 0:19:52, inside
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s\[(?P<route_preference>[\d\/]+)\]'
             r'\svia\s+(?P<next_hop>\S+),\s(?P<date>\S+),\s+(?P<context_name>\S+)')
 
         # B 10.122.3.0 255.255.255.0 [20/0]
-        p9 = re.compile(r'(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s\[(?P<route_preference>[\d\/]+)\]')
+        p9 = regex_engine.compile(r'(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)\s\[(?P<route_preference>[\d\/]+)\]')
 
         # [170/345856] via 10.9.193.99, 2w1d, esavpn [170/345856] via 10.9.193.98, 2w1d, esavpn
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'\[(?P<route_preference>[\d\/]+)\]\svia\s+(?P<next_hop>\S+),\s(?P<date>\S+),'
             r'\s(?P<context_name>\S+)')
 
         # D EX 10.121.67.0 255.255.255.0
-        p11 = re.compile(r'^(?:\S+)\s(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)')
+        p11 = regex_engine.compile(r'^(?:\S+)\s(?P<code>\S+)\s(?P<network>\S+)\s(?P<subnet>\S+)')
 
         if not clean_lines:
             return
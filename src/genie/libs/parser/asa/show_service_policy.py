@@ -4,15 +4,15 @@ Parser for the following show commands:
     * show service-policy
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Schema, 
                                                 Any,
                                                 Optional)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Schema for 'show service-policy'
 # =============================================
@@ -71,24 +71,24 @@ class ShowServicePolicy(ShowServicePolicySchema):
         inspect_index = 0
 
         # Service-policy: global_policy
-        p1 = re.compile(r'Service-policy: +(?P<service_policy>\S+)$')
+        p1 = regex_engine.compile(r'Service-policy: +(?P<service_policy>\S+)$')
 
         # Class-map: inspection_default
-        p2 = re.compile(r'^Class-map: (?P<class_map>\S+)$')
+        p2 = regex_engine.compile(r'^Class-map: (?P<class_map>\S+)$')
 
         # Inspect: ip-options _default_ip_options_map, packet 0, lock fail 0, drop 0, reset-drop 0, 
         # 5-min-pkt-rate 0 pkts/sec, v6-fail-close 0 sctp-drop-override 0
-        p3 = re.compile(r'^Inspect: +(((?P<inspect_3>\S+ +\S+) +(?P<map_3>\S+))|'
-                        r'((?P<inspect_2>\S+) +(?P<map_2>\S+))|(?P<inspect_1>\S+)) *, +'
-                        r'packet +(?P<packet>\d+), +lock +fail +(?P<lock_fail>\d+), +'
-                        r'drop +(?P<drop>\d+), +reset-drop +(?P<reset_drop>\d+), +'
-                        r'5-min-pkt-rate +(?P<five_minute_pkt_rate>\d+) +pkts\/sec, +'
-                        r'v6-fail-close +(?P<v6_fail_close>\d+) +sctp-drop-override +'
-                        r'(?P<sctp_drop_override>\d+)$')
+        p3 = regex_engine.compile(r'^Inspect: +(((?P<inspect_3>\S+ +\S+) +(?P<map_3>\S+))|'
+                                  r'((?P<inspect_2>\S+) +(?P<map_2>\S+))|(?P<inspect_1>\S+)) *, +'
+                                  r'packet +(?P<packet>\d+), +lock +fail +(?P<lock_fail>\d+), +'
+                                  r'drop +(?P<drop>\d+), +reset-drop +(?P<reset_drop>\d+), +'
+                                  r'5-min-pkt-rate +(?P<five_minute_pkt_rate>\d+) +pkts\/sec, +'
+                                  r'v6-fail-close +(?P<v6_fail_close>\d+) +sctp-drop-override +'
+                                  r'(?P<sctp_drop_override>\d+)$')
 
         # tcp-proxy: bytes in buffer 0, bytes dropped 0
-        p4 = re.compile(r'^tcp-proxy: +bytes +in +buffer +(?P<bytes_in_buffer>\d+), +'
-                        r'bytes +dropped +(?P<bytes_dropped>\d+)$')
+        p4 = regex_engine.compile(r'^tcp-proxy: +bytes +in +buffer +(?P<bytes_in_buffer>\d+), +'
+                                  r'bytes +dropped +(?P<bytes_dropped>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -114,13 +114,13 @@ class ShowServicePolicy(ShowServicePolicySchema):
 
             # Inspect: ip-options _default_ip_options_map, packet 0, lock fail 0, drop 0, reset-drop 0, 
             # 5-min-pkt-rate 0 pkts/sec, v6-fail-close 0 sctp-drop-override 0
-            p3 = re.compile(r'^Inspect: +(((?P<inspect_3>\S+ +\S+) +(?P<map_3>\S+))|'
-                        r'((?P<inspect_2>\S+) +(?P<map_2>\S+))|(?P<inspect_1>\S+)) *, +'
-                        r'packet +(?P<packet>\d+), +lock +fail +(?P<lock_fail>\d+), +'
-                        r'drop +(?P<drop>\d+), +reset-drop +(?P<reset_drop>\d+), +'
-                        r'5-min-pkt-rate +(?P<five_minute_pkt_rate>\d+) +pkts\/sec, +'
-                        r'v6-fail-close +(?P<v6_fail_close>\d+) +sctp-drop-override +'
-                        r'(?P<sctp_drop_override>\d+)$')
+            p3 = regex_engine.compile(r'^Inspect: +(((?P<inspect_3>\S+ +\S+) +(?P<map_3>\S+))|'
+                                  r'((?P<inspect_2>\S+) +(?P<map_2>\S+))|(?P<inspect_1>\S+)) *, +'
+                                  r'packet +(?P<packet>\d+), +lock +fail +(?P<lock_fail>\d+), +'
+                                  r'drop +(?P<drop>\d+), +reset-drop +(?P<reset_drop>\d+), +'
+                                  r'5-min-pkt-rate +(?P<five_minute_pkt_rate>\d+) +pkts\/sec, +'
+                                  r'v6-fail-close +(?P<v6_fail_close>\d+) +sctp-drop-override +'
+                                  r'(?P<sctp_drop_override>\d+)$')
             m = p3.match(line)
             if m:
                 group = m.groupdict()
@@ -4,13 +4,13 @@ Parser for the following show commands:
     * show traffic
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Schema for 'show traffic'
 # =============================================
@@ -67,39 +67,39 @@ class ShowTraffic(ShowTrafficSchema):
         ret_dict = {}
 
         # GigabitEthernet0/0:
-        p1 = re.compile(r'^(?P<name>\S+):$')
+        p1 = regex_engine.compile(r'^(?P<name>\S+):$')
 
         # received (in 1618693.940 secs):
         # transmitted (in 1618693.940 secs):
-        p2 = re.compile(r'^(?P<queue>\S+).+?(?P<duration>\d+\.\d+)\s+\S+')
+        p2 = regex_engine.compile(r'^(?P<queue>\S+).+?(?P<duration>\d+\.\d+)\s+\S+')
 
         # 415466249 packets       29074806307 bytes
-        p3 = re.compile(r'(?P<packets>\d+)\s+packets\s+(?P<bytes>\d+)\s+\S*')
+        p3 = regex_engine.compile(r'(?P<packets>\d+)\s+packets\s+(?P<bytes>\d+)\s+\S*')
 
         # 1 pkts/sec      17001 bytes/sec
-        p4 = re.compile(r'(?P<packets_sec>\d+)\s+pkts\/sec\s+(?P<bytes_sec>\d+)\s+bytes\/sec$')
+        p4 = regex_engine.compile(r'(?P<packets_sec>\d+)\s+pkts\/sec\s+(?P<bytes_sec>\d+)\s+bytes\/sec$')
 
         # 1 minute input rate 9452 pkts/sec,  661142 bytes/sec
-        p5 = re.compile(r'^1 minute input rate\s+(?P<packets_input_1_minute>\d+)\s+pkts\/sec,\s+'
+        p5 = regex_engine.compile(r'^1 minute input rate\s+(?P<packets_input_1_minute>\d+)\s+pkts\/sec,\s+'
             r'(?P<bytes_input_1_minute>\d+)\s+bytes\/sec$')
 
         # 1 minute output rate 206 pkts/sec,  41887 bytes/sec    
-        p6 = re.compile(r'^1 minute output rate\s+(?P<packets_output_1_minute>\d+)\s+pkts\/sec,\s+'
+        p6 = regex_engine.compile(r'^1 minute output rate\s+(?P<packets_output_1_minute>\d+)\s+pkts\/sec,\s+'
             r'(?P<bytes_output_1_minute>\d+)\s+bytes\/sec$')
 
         # 1 minute drop rate, 0 pkts/sec    
-        p7 = re.compile(r'^1 minute drop rate,\s+(?P<packets_drop_rate_1_minute>\d+)\s+pkts\/sec$')
+        p7 = regex_engine.compile(r'^1 minute drop rate,\s+(?P<packets_drop_rate_1_minute>\d+)\s+pkts\/sec$')
         
         # 5 minute input rate 11309 pkts/sec,  790978 bytes/sec
-        p8 = re.compile(r'^5 minute input rate\s+(?P<packets_input_5_minute>\d+)\s+pkts\/sec,\s+'
+        p8 = regex_engine.compile(r'^5 minute input rate\s+(?P<packets_input_5_minute>\d+)\s+pkts\/sec,\s+'
             r'(?P<bytes_input_5_minute>\d+)\s+bytes\/sec$')
         
         # 5 minute output rate 0 pkts/sec,  0 bytes/sec
-        p9 = re.compile(r'^5 minute output rate\s+(?P<packets_output_5_minute>\d+)\s+pkts\/sec,\s+'
+        p9 = regex_engine.compile(r'^5 minute output rate\s+(?P<packets_output_5_minute>\d+)\s+pkts\/sec,\s+'
             r'(?P<bytes_output_5_minute>\d+)\s+bytes\/sec$')
         
         # 5 minute drop rate, 0 pkts/sec
-        p10 = re.compile(r'^5 minute drop rate,\s+(?P<packets_drop_rate_5_minute>\d+)\s+pkts\/sec$')
+        p10 = regex_engine.compile(r'^5 minute drop rate,\s+(?P<packets_drop_rate_5_minute>\d+)\s+pkts\/sec$')
 
 
 
@@ -4,13 +4,13 @@ Parser for the following show commands:
     * show version
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =============================================
 # Schema for 'show version'
@@ -99,47 +99,47 @@ class ShowVersion(ShowVersionSchema):
 
         # Cisco Adaptive Security Appliance Software Version 9.8(4)10
         # Cisco Adaptive Security Appliance Software Version 9.14(2)15 <context>
-        p0 = re.compile(r'^.+ Software Version (?P<asa_version>\S+)( +(?P<context>\S+))?$')
+        p0 = regex_engine.compile(r'^.+ Software Version (?P<asa_version>\S+)( +(?P<context>\S+))?$')
 
         # Firepower Extensible Operating System Version 2.2(2.121)
-        p1 = re.compile(r'^.+System Version (?P<firepower_version>\S+)$')
+        p1 = regex_engine.compile(r'^.+System Version (?P<firepower_version>\S+)$')
 
         # Device Manager Version 7.8(2)
-        p2 = re.compile(r'^.+Manager Version (?P<asdm_version>\S+)$')
+        p2 = regex_engine.compile(r'^.+Manager Version (?P<asdm_version>\S+)$')
 
         # Compiled on Tue 20-Aug-19 12:46 PDT by builders
         # Compiled on Thu 20-Jan-12 04:05 by builders
-        p3 = re.compile(r'^Compiled on (?P<compiled_date>.+) by (?P<compiled_by>\w+)$')
+        p3 = regex_engine.compile(r'^Compiled on (?P<compiled_date>.+) by (?P<compiled_by>\w+)$')
 
         # System image file is "boot:/asa984-10-smp-k8.bin"
-        p4 = re.compile(r'^System image.+"(?P<system_image>\S+)"$')
+        p4 = regex_engine.compile(r'^System image.+"(?P<system_image>\S+)"$')
 
         # Config file at boot was "startup-config"
-        p5 = re.compile(r'^Config file.+"(?P<boot_config_file>\S+)"$')
+        p5 = regex_engine.compile(r'^Config file.+"(?P<boot_config_file>\S+)"$')
 
         # ciscoasa up 1 day 12 hours
-        p6 = re.compile(r'^(?P<hostname>\S+) up (?P<uptime>.+)$')
+        p6 = regex_engine.compile(r'^(?P<hostname>\S+) up (?P<uptime>.+)$')
 
         # Hardware:   ASAv, 2048 MB RAM, CPU Xeon E5 series 3491 MHz
         # Hardware:   FPR9K-SM-24, 230696 MB RAM, CPU Xeon E5 series 2200 MHz, 2 CPUs (48 cores)
         # Hardware:   ASA5555, 16384 MB RAM, CPU Lynnfield 2800 MHz, 1 CPU (8 cores)
-        p7 = re.compile(r'^Hardware:\s+(?P<platform>\S+),\s+(?P<mem_size>[\w\s]+) RAM,'
-                        r'\s+CPU (?P<processor_type>[\s\w]+),? ?(?P<cpu_count>\d+)?\s?(\w+|)? ?\(?(?P<core_count>\d+)?( cores\))?$')
+        p7 = regex_engine.compile(r'^Hardware:\s+(?P<platform>\S+),\s+(?P<mem_size>[\w\s]+) RAM,'
+                                  r'\s+CPU (?P<processor_type>[\s\w]+),? ?(?P<cpu_count>\d+)?\s?(\w+|)? ?\(?(?P<core_count>\d+)?( cores\))?$')
 
         # SSP Slot Number: 1
-        p7_1 = re.compile(r'^SSP Slot Number: (?P<ssp_slot_number>\d+)$')
+        p7_1 = regex_engine.compile(r'^SSP Slot Number: (?P<ssp_slot_number>\d+)$')
 
         # Model Id:   ASAv10
-        p8 = re.compile(r'^Model Id:\s*(?P<asa_model>\S+)$')
+        p8 = regex_engine.compile(r'^Model Id:\s*(?P<asa_model>\S+)$')
 
         # Internal ATA Compact Flash, 8192MB
         # Slot 1: ATA Compact Flash, 8192MB
-        p9 = re.compile(r'^(?P<disk_name>\S+|Slot \d+):? '
-                        r'(?P<type_of_disk>[\w\s]+), '
-                        r'(?P<disk_size>\S+)$')
+        p9 = regex_engine.compile(r'^(?P<disk_name>\S+|Slot \d+):? '
+                                  r'(?P<type_of_disk>[\w\s]+), '
+                                  r'(?P<disk_size>\S+)$')
 
         # BIOS Flash Firmware Hub @ 0x0, 0KB
-        p10 = re.compile(r'^BIOS Flash (?P<bios_flash>.+)$')
+        p10 = regex_engine.compile(r'^BIOS Flash (?P<bios_flash>.+)$')
 
         # 0: Ext: Management0/0       : address is 5001.0003.0000, irq 11
         # 1: Ext: GigabitEthernet0/0  : address is 5001.0003.0001, irq 11
@@ -149,143 +149,143 @@ class ShowVersion(ShowVersionSchema):
         # 5: Ext: GigabitEthernet0/4  : address is 5001.0003.0005, irq 11
         # 6: Ext: GigabitEthernet0/5  : address is 5001.0003.0006, irq 10
         # 7: Ext: GigabitEthernet0/6  : address is 5001.0003.0007, irq 10
-        p11 = re.compile(r'^(?P<intf_number>\d+): '
-                         r'Ext: (?P<interface>[\w\/\.\-]+)\s*: address is '
-                         r'(?P<mac_addr>[\w\.]+), '
-                         r'irq (?P<intf_irq>\d+)$')
+        p11 = regex_engine.compile(r'^(?P<intf_number>\d+): '
+                                   r'Ext: (?P<interface>[\w\/\.\-]+)\s*: address is '
+                                   r'(?P<mac_addr>[\w\.]+), '
+                                   r'irq (?P<intf_irq>\d+)$')
 
         # 5: Int: Not used            : irq 11
         # 6: Int: Not used            : irq 5
-        p11_1 = re.compile(r'^(?P<intf_number>\d+): Int: (?P<interface>[\w ]+)\s*: '
-                           r'irq (?P<intf_irq>\d{1,2})$')
+        p11_1 = regex_engine.compile(r'^(?P<intf_number>\d+): Int: (?P<interface>[\w ]+)\s*: '
+                                     r'irq (?P<intf_irq>\d{1,2})$')
 
         # License mode: Smart Licensing
-        p12 = re.compile(r'^License mode: (?P<license_mode>.+)$')
+        p12 = regex_engine.compile(r'^License mode: (?P<license_mode>.+)$')
 
         # ASAv Platform License State: Unlicensed
-        p13 = re.compile(r'^.+License State: (?P<license_state>.+)$')
+        p13 = regex_engine.compile(r'^.+License State: (?P<license_state>.+)$')
 
         # No active entitlement: no feature tier and no throughput level configured
-        p14 = re.compile(r'^.+entitlement: (?P<entitlement>.+)$')
+        p14 = regex_engine.compile(r'^.+entitlement: (?P<entitlement>.+)$')
 
         # *Memory resource allocation is more than the permitted limit.
-        p15 = re.compile(r'^(?P<mem_allocation>\*Memory.+)$')
+        p15 = regex_engine.compile(r'^(?P<mem_allocation>\*Memory.+)$')
 
         # Maximum VLANs                     : 50
         # Maximum VLANs                     : 150       perpetual
-        p16 = re.compile(r'^Maximum [Vv][Ll][Aa][Nn][Ss]\s*: (?P<max_vlans>\d+)(\s+(?P<time_remaining>\S+))?$')
+        p16 = regex_engine.compile(r'^Maximum [Vv][Ll][Aa][Nn][Ss]\s*: (?P<max_vlans>\d+)(\s+(?P<time_remaining>\S+))?$')
 
         # Inside Hosts                      : Unlimited
         # Inside Hosts                      : Unlimited      perpetual
-        p17 = re.compile(r'^Inside [Hh]osts\s*: (?P<inside_hosts>\S+)(\s+(?P<time_remaining>\S+))?$')
+        p17 = regex_engine.compile(r'^Inside [Hh]osts\s*: (?P<inside_hosts>\S+)(\s+(?P<time_remaining>\S+))?$')
 
         # Failover                          : Active/Standby
         # Failover                          : Active/Active     perpetual
-        p18 = re.compile(r'^Failover\s*: (?P<failover>\S+)(\s+(?P<time_remaining>\S+))?$')
+        p18 = regex_engine.compile(r'^Failover\s*: (?P<failover>\S+)(\s+(?P<time_remaining>\S+))?$')
 
         # Encryption-DES                    : Enabled
         # VPN-DES                           : Enabled        perpetual
-        p19 = re.compile(r'^(Encryption|VPN)-DES\s*: (?P<crypto_des>\S+)(\s+(?P<time_remaining>\S+))?$')
+        p19 = regex_engine.compile(r'^(Encryption|VPN)-DES\s*: (?P<crypto_des>\S+)(\s+(?P<time_remaining>\S+))?$')
 
         # Encryption-3DES-AES                    : Enabled
         # VPN-3DES-AES                           : Enabled        perpetual
-        p20 = re.compile(r'^(Encryption|VPN)-3DES-AES\s*: (?P<crypto_3des_aes>\S+)(\s+(?P<time_remaining>\S+))?$')
+        p20 = regex_engine.compile(r'^(Encryption|VPN)-3DES-AES\s*: (?P<crypto_3des_aes>\S+)(\s+(?P<time_remaining>\S+))?$')
 
         # Security Contexts                 : 10        perpetual
-        p21 = re.compile(r'^Security Contexts\s*: (?P<security_contexts>\d+)(\s+(?P<time_remaining>\S+))?$')
+        p21 = regex_engine.compile(r'^Security Contexts\s*: (?P<security_contexts>\d+)(\s+(?P<time_remaining>\S+))?$')
 
         # Carrier                           : Disabled
-        p22 = re.compile(r'^Carrier\s*: (?P<carrier>\S+)$')
+        p22 = regex_engine.compile(r'^Carrier\s*: (?P<carrier>\S+)$')
 
         # AnyConnect Premium Peers          : 2
         # AnyConnect Premium Peers          : 2              perpetual
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r'^Any[Cc]onnect Premium Peers\s*: (?P<anyconnect_premium_peers>\d+)(\s+(?P<time_remaining>\S+))?$')
 
         # AnyConnect Essentials             : Disabled
         # AnyConnect Essentials             : Disabled       perpetual
-        p24 = re.compile(r'^Any[Cc]onnect Essentials\s*: (?P<anyconnect_essentials>\S+)(\s+(?P<time_remaining>\S+))?$')
+        p24 = regex_engine.compile(r'^Any[Cc]onnect Essentials\s*: (?P<anyconnect_essentials>\S+)(\s+(?P<time_remaining>\S+))?$')
 
         # Other VPN Peers                   : 250
         # Other VPN Peers                   : 750            perpetual
-        p25 = re.compile(r'^Other VPN Peers\s*: (?P<other_vpn_peers>\d+)(\s+(?P<time_remaining>\S+))?$')
+        p25 = regex_engine.compile(r'^Other VPN Peers\s*: (?P<other_vpn_peers>\d+)(\s+(?P<time_remaining>\S+))?$')
 
         # Total VPN Peers                   : 250
         # Total VPN Peers                   : 750            perpetual
-        p26 = re.compile(r'^Total VPN Peers\s*: (?P<total_vpn_peers>\d+)(\s+(?P<time_remaining>\S+))?$')
+        p26 = regex_engine.compile(r'^Total VPN Peers\s*: (?P<total_vpn_peers>\d+)(\s+(?P<time_remaining>\S+))?$')
 
         # AnyConnect for Mobile             : Disabled
-        p27 = re.compile(r'^Any[Cc]onnect for Mobile\s*: (?P<anyconnect_for_mobile>\S+)(\s+(?P<time_remaining>.+))?$')
+        p27 = regex_engine.compile(r'^Any[Cc]onnect for Mobile\s*: (?P<anyconnect_for_mobile>\S+)(\s+(?P<time_remaining>.+))?$')
 
         # AnyConnect for Cisco VPN Phone    : Disabled
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r'^Any[Cc]onnect for Cisco VPN Phone\s*: (?P<anyconnect_for_cisco_vpn_phone>\S+)'
             r'(\s+(?P<time_remaining>.+))?$')
 
         # Advanced Endpoint Assessment      : Disabled
         # Advanced Endpoint Assessment      : Disabled       perpetual
-        p29 = re.compile(
+        p29 = regex_engine.compile(
             r'^Advanced Endpoint Assessment\s*: (?P<advanced_endpoint_assessment>\S+)(\s+(?P<time_remaining>.+))?$')
 
         # Shared License                    : Disabled
-        p30 = re.compile(r'^Shared License\s*: (?P<shared_license>\S+)(\s+(?P<time_remaining>.+))?$')
+        p30 = regex_engine.compile(r'^Shared License\s*: (?P<shared_license>\S+)(\s+(?P<time_remaining>.+))?$')
 
         # Total TLS Proxy Sessions          : 2 
-        p31 = re.compile(r'^Total TLS Proxy Sessions\s*: (?P<total_tls_proxy_sessions>\d+)$')
+        p31 = regex_engine.compile(r'^Total TLS Proxy Sessions\s*: (?P<total_tls_proxy_sessions>\d+)$')
 
         # Botnet Traffic Filter             : Enabled
-        p32 = re.compile(r'^Botnet Traffic Filter\s*: (?P<botnet_traffic_filter>\S+)(\s+(?P<time_remaining>.+))?$')
+        p32 = regex_engine.compile(r'^Botnet Traffic Filter\s*: (?P<botnet_traffic_filter>\S+)(\s+(?P<time_remaining>.+))?$')
 
         # Cluster                           : Disabled
-        p33 = re.compile(r'^Cluster\s*: (?P<cluster>\S+)$')
+        p33 = regex_engine.compile(r'^Cluster\s*: (?P<cluster>\S+)$')
 
         # Serial Number: 9A5BHB00D2D
-        p34 = re.compile(r'^Serial.+: (?P<serial_number>\S+)$')
+        p34 = regex_engine.compile(r'^Serial.+: (?P<serial_number>\S+)$')
 
         # Image type          : Release
-        p35 = re.compile(r'^Image type\s*: (?P<image_type>\S+)$')
+        p35 = regex_engine.compile(r'^Image type\s*: (?P<image_type>\S+)$')
 
         # Key version         : A
-        p36 = re.compile(r'^Key version\s*: (?P<key_version>\S+)$')
+        p36 = regex_engine.compile(r'^Key version\s*: (?P<key_version>\S+)$')
 
         # Configuration last modified by enable_15 at 20:39:39.869 UTC Mon Jun 7 2021
-        p37 = re.compile(r'^Configuration last.+by (?P<last_modified_by>\S+) at '
-                         r'(?P<last_modified_date>[\d:\.]+.+)$')
+        p37 = regex_engine.compile(r'^Configuration last.+by (?P<last_modified_by>\S+) at '
+                                   r'(?P<last_modified_date>[\d:\.]+.+)$')
 
         # Configuration has not been modified since last system restart.
-        p37_1 = re.compile(r'^(?P<last_modified_date>Configuration has not been modified since last system restart.+)$')
+        p37_1 = regex_engine.compile(r'^(?P<last_modified_date>Configuration has not been modified since last system restart.+)$')
 
         # Encryption hardware device : Cisco ASA-55x0 on-board accelerator (revision 0x0)
-        p38 = re.compile(r'^\s*Encryption.+:\s+(?P<encryption_device>.+)$')
+        p38 = regex_engine.compile(r'^\s*Encryption.+:\s+(?P<encryption_device>.+)$')
 
         # Boot microcode   : CN1000-MC-BOOT-2.00 
-        p39 = re.compile(r'^\s*Boot [Mm]icrocode\s+:\s+(?P<boot_microcode>.+)$')
+        p39 = regex_engine.compile(r'^\s*Boot [Mm]icrocode\s+:\s+(?P<boot_microcode>.+)$')
 
         # SSL/IKE microcode: CNLite-MC-SSLm-PLUS-2.03
-        p40 = re.compile(r'^\s*SSL.+\s*:\s*(?P<ssl_ike_microcode>.+)$')
+        p40 = regex_engine.compile(r'^\s*SSL.+\s*:\s*(?P<ssl_ike_microcode>.+)$')
 
         # IPsec microcode  : CNlite-MC-IPSECm-MAIN-2.06
-        p41 = re.compile(r'^\s*[Ii][Pp][Ss][Ee][Cc].+\s*:\s+(?P<ipsec_microcode>.+)$')
+        p41 = regex_engine.compile(r'^\s*[Ii][Pp][Ss][Ee][Cc].+\s*:\s+(?P<ipsec_microcode>.+)$')
 
         # GTP/GPRS                          : Enabled        perpetual
-        p42 = re.compile(r'^\s*GTP.+: (?P<gtp_gprs>\S+)\s+(?P<time_remaining>\S+)$')
+        p42 = regex_engine.compile(r'^\s*GTP.+: (?P<gtp_gprs>\S+)\s+(?P<time_remaining>\S+)$')
 
         # Maximum Physical Interfaces       : Unlimited      perpetual
-        p43 = re.compile(
+        p43 = regex_engine.compile(
             r'^[Mm]aximum [Pp]hysical [Ii]nterfaces\s*: (?P<max_physical_interfaces>\S+)\s+(?P<time_remaining>\S+)$')
 
         # Shared AnyConnect Premium Peers : 12000          perpetual
-        p44 = re.compile(
+        p44 = regex_engine.compile(
             r'^\s*Shared [Aa]ny[Cc]onnect.+: (?P<shared_anyconnect_premium_peers>\d+)\s+(?P<time_remaining>\S+)$')
 
         # UC Phone Proxy Sessions           : 12             62 days
-        p45 = re.compile(r'^UC Phone.+: (?P<uc_phone_proxy_sessions>\d+)\s+(?P<time_remaining>.+)$')
+        p45 = regex_engine.compile(r'^UC Phone.+: (?P<uc_phone_proxy_sessions>\d+)\s+(?P<time_remaining>.+)$')
 
         # Total UC Proxy Sessions           : 12             62 days
-        p46 = re.compile(r'^Total UC Proxy.+: (?P<total_uc_proxy_sessions>\d+)\s+(?P<time_remaining>.+)$')
+        p46 = regex_engine.compile(r'^Total UC Proxy.+: (?P<total_uc_proxy_sessions>\d+)\s+(?P<time_remaining>.+)$')
 
         # Intercompany Media Engine         : Disabled       perpetual
-        p47 = re.compile(r'^Intercompany.+: (?P<intercompany_media_engine>\S+)\s+(?P<time_remaining>.+)$')
+        p47 = regex_engine.compile(r'^Intercompany.+: (?P<intercompany_media_engine>\S+)\s+(?P<time_remaining>.+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4,15 +4,15 @@ Parser for the following show commands:
     * show vpn load-balancing
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Schema, 
                                                 Any,
                                                 Optional)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =============================================
 # Schema for 'show vpn load-balancing'
@@ -77,20 +77,20 @@ class ShowVPNLoadBalancing(ShowVPNLoadBalancingSchema):
         peers_index = 0
         total_license_load_index = 0
         # Enabled    Master   n/a        Enabled          1     cluster1
-        p1 = re.compile(r'^(?P<status>\S+) +(?P<role>\S+) +'
-                        r'(?P<failover>\S+) +(?P<encryption>\S+) +'
-                        r'(?P<peers>\d+) +(?P<cluster_ip>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<status>\S+) +(?P<role>\S+) +'
+                                  r'(?P<failover>\S+) +(?P<encryption>\S+) +'
+                                  r'(?P<peers>\d+) +(?P<cluster_ip>\S+)$')
 
         # Master    5  ASA-VASA                               4  10.246.0.1*
         # Backup    5  ASA-VASA                               4  10.246.0.2
-        p2 = re.compile(r'^(?P<role>\S+) +(?P<pri>\d+) +(?P<model>\S+) +'
-                        r'(?P<version>\d+) +(?P<public_ip>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<role>\S+) +(?P<pri>\d+) +(?P<model>\S+) +'
+                                  r'(?P<version>\d+) +(?P<public_ip>\S+)$')
         
         # 250       0      0%           250       2      1%  10.246.0.1*
         # 0       0      0%             0       0      0%  10.246.0.2
-        p3 = re.compile(r'^(?P<limit_1>\d+) +(?P<used_1>\d+) +(?P<load_1>\d+)'
-                        r'\% +(?P<limit_2>\d+) +(?P<used_2>\d+) +(?P<load_2>\d+)% +'
-                        r'(?P<public_ip>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<limit_1>\d+) +(?P<used_1>\d+) +(?P<load_1>\d+)'
+                                  r'\% +(?P<limit_2>\d+) +(?P<used_2>\d+) +(?P<load_2>\d+)% +'
+                                  r'(?P<public_ip>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
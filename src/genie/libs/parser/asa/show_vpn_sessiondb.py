@@ -10,12 +10,14 @@ Parser for the following show commands:
 """
 
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                                 Any, \
                                                 Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # =============================================
@@ -163,34 +165,34 @@ class ShowVPNSessionDBSummary(ShowVPNSessionDBSummarySchema):
         # AnyConnect Client            :    127 :        432 :         205 :        0
         # Clientless VPN               :   2    :     125    :            6
         # Site-to-Site VPN             :     29 :         59 :          29
-        p1 = re.compile(r'^(?P<name>(Load Balancing\(Encryption\))|(Site-to-Site VPN)|'
-                        r'(IKEv1 +IPsec\/L2TP +IPsec)|(AnyConnect Client)|'
-                        r'(Clientless VPN)) +: +(?P<active>\d+) *: '
-                        r'+(?P<cumulative>\d+) *: +(?P<peak_concurrent>\d+)'
-                        r'( *: +(?P<inactive>\d+))?$')
+        p1 = regex_engine.compile(r'^(?P<name>(Load Balancing\(Encryption\))|(Site-to-Site VPN)|'
+                                  r'(IKEv1 +IPsec\/L2TP +IPsec)|(AnyConnect Client)|'
+                                  r'(Clientless VPN)) +: +(?P<active>\d+) *: '
+                                  r'+(?P<cumulative>\d+) *: +(?P<peak_concurrent>\d+)'
+                                  r'( *: +(?P<inactive>\d+))?$')
 
         # Device Total VPN Capacity    :    250
-        p4 = re.compile(r'^Device +Total +VPN +Capacity +: +'
-                        r'(?P<device_total_vpn_capacity>\d+)$')
+        p4 = regex_engine.compile(r'^Device +Total +VPN +Capacity +: +'
+                                  r'(?P<device_total_vpn_capacity>\d+)$')
 
         # Device Load                  :     1%
-        p5 = re.compile(r'^Device +Load +: +(?P<device_load>\d+)\%$')
+        p5 = regex_engine.compile(r'^Device +Load +: +(?P<device_load>\d+)\%$')
 
         # SSL/TLS/DTLS               :    127 :        432 :         205 :        0
         # Browser                    :   2    :     125    :            6
         # IKEv2 IPsec                :     29 :         59 :          29
-        p7 = re.compile(r'^(?P<name>(SSL/TLS/DTLS)|(Browser)|(IKEv2 IPsec)) +:'
-                        r' +(?P<active>\d+) *: +(?P<cumulative>\d+) *:'
-                        r' +(?P<peak_concurrent>\d+)( *: +(?P<inactive>\d+))?$')
+        p7 = regex_engine.compile(r'^(?P<name>(SSL/TLS/DTLS)|(Browser)|(IKEv2 IPsec)) +:'
+                                  r' +(?P<active>\d+) *: +(?P<cumulative>\d+) *:'
+                                  r' +(?P<peak_concurrent>\d+)( *: +(?P<inactive>\d+))?$')
 
         # Total Active and Inactive    :    127             Total Cumulative :    432
-        p2_4 = re.compile(r'^Total +Active +and +Inactive +: +'
-                          r'(?P<total_active_and_inactive>\d+) +Total +Cumulative +: +'
-                          r'(?P<total_cumulative>\d+)$')
+        p2_4 = regex_engine.compile(r'^Total +Active +and +Inactive +: +'
+                                    r'(?P<total_active_and_inactive>\d+) +Total +Cumulative +: +'
+                                    r'(?P<total_cumulative>\d+)$')
 
         # Device Total VPN Capacity    :   5000
-        p2_6 = re.compile(r'^Device\s+Total\s+VPN\s+Capacity\s+:'
-                          r'\s+(?P<device_total_vpn_capacity>\d+)$')
+        p2_6 = regex_engine.compile(r'^Device\s+Total\s+VPN\s+Capacity\s+:'
+                                    r'\s+(?P<device_total_vpn_capacity>\d+)$')
 
         # -------------------------------------------------------------------
         # tunnels
@@ -200,10 +202,10 @@ class ShowVPNSessionDBSummary(ShowVPNSessionDBSummarySchema):
         # SSL-Tunnel                   :    125 :       1577 :             204
         # DTLS-Tunnel                  :    124 :       1508 :             202
         # Totals                       :    376 :       3517
-        p2_5 = re.compile(r'^(?P<name>(Totals|DTLS-Tunnel|SSL-Tunnel|'
-                          r'AnyConnect-Parent|Clientless)) +: +(?P<active>\d+)'
-                          r' *: +(?P<cumulative>\d+)( *: +(?P<peak_concurrent>\d+))?'
-                          r'( *: (?P<inactive>\d+))?$')
+        p2_5 = regex_engine.compile(r'^(?P<name>(Totals|DTLS-Tunnel|SSL-Tunnel|'
+                                    r'AnyConnect-Parent|Clientless)) +: +(?P<active>\d+)'
+                                    r' *: +(?P<cumulative>\d+)( *: +(?P<peak_concurrent>\d+))?'
+                                    r'( *: (?P<inactive>\d+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -403,101 +405,101 @@ class ShowVpnSessiondbSuper(ShowVpnSessiondbSuperSchema):
         # --------------------------------------------------------------------
 
         # Session Type: SSL VPN Client
-        p1 = re.compile(r'^Session\s+Type:\s+(?P<session_type>[\s\S]+)$')
+        p1 = regex_engine.compile(r'^Session\s+Type:\s+(?P<session_type>[\s\S]+)$')
 
         # Username : lee
         # Username : lee Index : 1
-        p2 = re.compile(r'^Username\s+:\s+(?P<username>\S+)'
-                        r'(\s+Index\s+:\s+(?P<index>\d+))?$')
+        p2 = regex_engine.compile(r'^Username\s+:\s+(?P<username>\S+)'
+                                  r'(\s+Index\s+:\s+(?P<index>\d+))?$')
 
         # Index : 1 IP Addr : 192.168.16.232
         # Index : 62535
-        p3 = re.compile(r'^Index\s+:\s+(?P<index>\d+)(\s+'
-                        r'IP\s+Addr\s+:\s+(?P<ip_addr>\S+))?$')
+        p3 = regex_engine.compile(r'^Index\s+:\s+(?P<index>\d+)(\s+'
+                                  r'IP\s+Addr\s+:\s+(?P<ip_addr>\S+))?$')
 
         # Protocol : SSL VPN Client Encryption : 3DES
         # Protocol : AnyConnect-Parent SSL-Tunnel DTLS-Tunnel
-        p4 = re.compile(r'^Protocol\s+:\s(?P<protocol>[-\w\s]+)(\s+'
-                        r'VPN\s+Client\s+Encryption\s+:'
-                        r'\s+(?P<vpn_client_encryption>\S+))?$')
+        p4 = regex_engine.compile(r'^Protocol\s+:\s(?P<protocol>[-\w\s]+)(\s+'
+                                  r'VPN\s+Client\s+Encryption\s+:'
+                                  r'\s+(?P<vpn_client_encryption>\S+))?$')
 
         # Hashing : SHA1 Auth Mode : userPassword
-        p5 = re.compile(r'^Hashing\s+:\s+(?P<hashing>\S+)\s+'
-                        r'Auth\s+Mode\s+:\s+(?P<auth_mode>\S+)$')
+        p5 = regex_engine.compile(r'^Hashing\s+:\s+(?P<hashing>\S+)\s+'
+                                  r'Auth\s+Mode\s+:\s+(?P<auth_mode>\S+)$')
 
         # Hashing : AnyConnect-Parent: (1)none
-        p5_1 = re.compile(r'^Hashing\s+:\s+(?P<protocol>\S+):\s+(?P<hashing>\S+)$')
+        p5_1 = regex_engine.compile(r'^Hashing\s+:\s+(?P<protocol>\S+):\s+(?P<hashing>\S+)$')
 
         # TCP Dst Port : 443 TCP Src Port : 54230
-        p6 = re.compile(r'^TCP\s+Dst\s+Port\s+:\s+(?P<dst_port>\d+)\s+'
-                        r'TCP\s+Src\s+Port\s+:\s+(?P<src_port>\d+)$')
+        p6 = regex_engine.compile(r'^TCP\s+Dst\s+Port\s+:\s+(?P<dst_port>\d+)\s+'
+                                  r'TCP\s+Src\s+Port\s+:\s+(?P<src_port>\d+)$')
 
         # Bytes Tx : 20178 Bytes Rx : 8662
         # Pkts Tx : 27 Pkts Rx : 19
-        p7 = re.compile(r'^(?P<type>Bytes|Pkts)\s+Tx\s+:\s+(?P<tx>\d+)\s+'
-                        r'(?P<type2>Bytes|Pkts)\s+Rx\s+:\s+(?P<rx>\d+)$')
+        p7 = regex_engine.compile(r'^(?P<type>Bytes|Pkts)\s+Tx\s+:\s+(?P<tx>\d+)\s+'
+                                  r'(?P<type2>Bytes|Pkts)\s+Rx\s+:\s+(?P<rx>\d+)$')
 
         # Client Ver : Cisco STC 10.4.0.117
-        p9 = re.compile(r'^Client\s+Ver\s+:\s+(?P<client_version>[\s\S]+)$')
+        p9 = regex_engine.compile(r'^Client\s+Ver\s+:\s+(?P<client_version>[\s\S]+)$')
 
         # Client Type : Internet Explorer
-        p10 = re.compile(r'^Client\s+Type\s+:\s+(?P<client_type>[\s\S]+)$')
+        p10 = regex_engine.compile(r'^Client\s+Type\s+:\s+(?P<client_type>[\s\S]+)$')
 
         # Group : DfltGrpPolicy
-        p11 = re.compile(r'^Group\s+:\s+(?P<group>\S+)$')
+        p11 = regex_engine.compile(r'^Group\s+:\s+(?P<group>\S+)$')
 
         # Login Time : 14:32:03 UTC Wed Mar 20 2007
-        p12 = re.compile(r'^Login\s+Time\s+:\s+(?P<login_time>[\s\S]+)$')
+        p12 = regex_engine.compile(r'^Login\s+Time\s+:\s+(?P<login_time>[\s\S]+)$')
 
         # Duration : 0h:00m:04s
         # Duration : 2d 4h:21m:44s
-        p13 = re.compile(r'^Duration\s+:\s+(?P<duration>[\s\S]+)$')
+        p13 = regex_engine.compile(r'^Duration\s+:\s+(?P<duration>[\s\S]+)$')
 
         # Inactivity : 0h:00m:04s
         # Inactivity : 1d 9h:13m:24s
-        p14 = re.compile(r'^Inactivity\s+:\s+(?P<inactivity>[\s\S]+)$')
+        p14 = regex_engine.compile(r'^Inactivity\s+:\s+(?P<inactivity>[\s\S]+)$')
 
         # Filter Name :
-        p15 = re.compile(r'^Filter\s+Name\s+:\s+(?P<filter_name>\S+)$')
+        p15 = regex_engine.compile(r'^Filter\s+Name\s+:\s+(?P<filter_name>\S+)$')
 
         # Assigned IP : 192.168.246.2 Public IP : 10.139.1.3
-        p16 = re.compile(r'^Assigned\s+IP\s+:\s+(?P<assigned_ip>\S+)\s+'
-                         r'Public\s+IP\s+:\s+(?P<public_ip>\S+)$')
+        p16 = regex_engine.compile(r'^Assigned\s+IP\s+:\s+(?P<assigned_ip>\S+)\s+'
+                                   r'Public\s+IP\s+:\s+(?P<public_ip>\S+)$')
 
         # License : AnyConnect Premium
-        p17 = re.compile(r'^License\s+:\s+(?P<license>[\s\S]+)$')
+        p17 = regex_engine.compile(r'^License\s+:\s+(?P<license>[\s\S]+)$')
 
         # Encryption : RC4 AES128 Hashing : SHA1
-        p18 = re.compile(r'^Encryption\s+:\s+(?P<encryption>[\s\S]+)\s+'
-                         r'Hashing\s+:\s+(?P<hashing>\S+)$')
+        p18 = regex_engine.compile(r'^Encryption\s+:\s+(?P<encryption>[\s\S]+)\s+'
+                                   r'Hashing\s+:\s+(?P<hashing>\S+)$')
 
         # Encryption : AnyConnect-Parent: (1)none
         # Encryption   : Clientless: (1)AES128  Hashing      : Clientless: (1)SHA256
-        p18_1 = re.compile(r'^Encryption\s+:\s+(?P<protocol>\S+):'
-                           r'\s+(?P<encryption>\S+)(\s+Hashing\s+:'
-                           r'\s+(?P<protocol2>\S+):\s+(?P<hashing>\S+))?$')
+        p18_1 = regex_engine.compile(r'^Encryption\s+:\s+(?P<protocol>\S+):'
+                                     r'\s+(?P<encryption>\S+)(\s+Hashing\s+:'
+                                     r'\s+(?P<protocol2>\S+):\s+(?P<hashing>\S+))?$')
 
         # Group Policy : EngPolicy Tunnel Group : EngGroup
         # Group Policy : GroupPolicy_Employee
         # Tunnel Group : Employee
-        p19 = re.compile(r'^(Group\s+Policy\s+:\s+(?P<group_policy>\S+))?'
-                         r'(\s*Tunnel\s+Group\s+:\s+(?P<tunnel_group>\S+))?$')
+        p19 = regex_engine.compile(r'^(Group\s+Policy\s+:\s+(?P<group_policy>\S+))?'
+                                   r'(\s*Tunnel\s+Group\s+:\s+(?P<tunnel_group>\S+))?$')
 
         # NAC Result : Unknown
-        p20 = re.compile(r'^NAC\s+Result\s+:\s+(?P<nac_result>\S+)$')
+        p20 = regex_engine.compile(r'^NAC\s+Result\s+:\s+(?P<nac_result>\S+)$')
 
         # VLAN Mapping : N/A VLAN : none
-        p21 = re.compile(r'^VLAN\s+Mapping\s+:\s+(?P<vlan_mapping>\S+)\s+'
-                         r'VLAN\s+:\s+(?P<vlan>\S+)$')
+        p21 = regex_engine.compile(r'^VLAN\s+Mapping\s+:\s+(?P<vlan_mapping>\S+)\s+'
+                                   r'VLAN\s+:\s+(?P<vlan>\S+)$')
 
         # Audt Sess ID : 0adc27fd093260005381
-        p22 = re.compile(r'^Audt\s+Sess\s+ID\s+:\s+(?P<audt_sess_id>\S+)$')
+        p22 = regex_engine.compile(r'^Audt\s+Sess\s+ID\s+:\s+(?P<audt_sess_id>\S+)$')
 
         # Security Grp : none
-        p23 = re.compile(r'^Security\s+Grp\s+:\s+(?P<security_group>\S+)$')
+        p23 = regex_engine.compile(r'^Security\s+Grp\s+:\s+(?P<security_group>\S+)$')
 
         # Public IP    : 10.229.20.77
-        p24 = re.compile(r'^Public\s+IP\s+:\s+(?P<public_ip>\S+)$')
+        p24 = regex_engine.compile(r'^Public\s+IP\s+:\s+(?P<public_ip>\S+)$')
 
         # Encryption   : AnyConnect-Parent: (1)none  SSL-Tunnel: (1)AES256
         # Encryption   : AnyConnect-Parent: (1)none  SSL-Tunnel: (1)AES256  DTLS-Tunnel: (1)AES256
@@ -505,9 +507,9 @@ class ShowVpnSessiondbSuper(ShowVpnSessiondbSuperSchema):
         # Hashing      : AnyConnect-Parent: (1)none  SSL-Tunnel: (1)SHA1  DTLS-Tunnel: (1)SHA1
         # Encryption   : AnyConnect-Parent: (1)none  DTLS-Tunnel: (1)AES256
         # Hashing      : AnyConnect-Parent: (1)none  DTLS-Tunnel: (1)SHA1
-        p25 = re.compile(r'^(?P<name>Encryption|Hashing)\s+:\s+(?P<protocol>\S+):\s+(?P<value>\S+)'
-                         r'(\s+SSL-Tunnel:\s+(?P<ssl_tunnel>\S+))?'
-                         r'(\s+DTLS-Tunnel:\s+(?P<dtls_tunnel>\S+))?$')
+        p25 = regex_engine.compile(r'^(?P<name>Encryption|Hashing)\s+:\s+(?P<protocol>\S+):\s+(?P<value>\S+)'
+                                   r'(\s+SSL-Tunnel:\s+(?P<ssl_tunnel>\S+))?'
+                                   r'(\s+DTLS-Tunnel:\s+(?P<dtls_tunnel>\S+))?$')
 
         for line in output.splitlines():
             line = line.strip()
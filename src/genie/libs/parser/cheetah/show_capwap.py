@@ -1,8 +1,10 @@
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ====================
 # Schema for:
 #  * 'show capwap client rcb'
@@ -65,94 +67,94 @@ class ShowCapwapClientRcb(ShowCapwapClientRcbSchema):
         capwap_client_rcb_dict = {}
         
         # AdminState                         : ADMIN_ENABLED
-        p1 = re.compile(r"^AdminState\s+:\s+(?P<admin_state>.*)$")
+        p1 = regex_engine.compile(r"^AdminState\s+:\s+(?P<admin_state>.*)$")
         
         # OperationState                     : UP
-        p2 = re.compile(r"^OperationState\s+:\s+(?P<operation_state>.*)$")
+        p2 = regex_engine.compile(r"^OperationState\s+:\s+(?P<operation_state>.*)$")
         
         # Name                               : AP188B.4500.5EE8
-        p3 = re.compile(r"^Name\s+:\s+(?P<name>.*)$")
+        p3 = regex_engine.compile(r"^Name\s+:\s+(?P<name>.*)$")
         
         # SwVer                              : 17.7.0.59
-        p4 = re.compile(r"^SwVer\s+:\s+(?P<swver>.*)$")
+        p4 = regex_engine.compile(r"^SwVer\s+:\s+(?P<swver>.*)$")
         
         # HwVer                              : 1.0.0.0
-        p5 = re.compile(r"^HwVer\s+:\s+(?P<hwver>.*)$")
+        p5 = regex_engine.compile(r"^HwVer\s+:\s+(?P<hwver>.*)$")
         
         # MwarApMgrIp                        : 9.4.62.51
-        p6 = re.compile(r"^MwarApMgrIp\s+:\s+(?P<mwar_ap_mgr_ip>.*)$")
+        p6 = regex_engine.compile(r"^MwarApMgrIp\s+:\s+(?P<mwar_ap_mgr_ip>.*)$")
         
         # MwarName                           : vidya-ewlc-5
-        p7 = re.compile(r"^MwarName\s+:\s+(?P<mwar_name>.*)$")
+        p7 = regex_engine.compile(r"^MwarName\s+:\s+(?P<mwar_name>.*)$")
         
         # MwarHwVer                          : 0.0.0.0
-        p8 = re.compile(r"^MwarHwVer\s+:\s+(?P<mwar_hw_ver>.*)$")
+        p8 = regex_engine.compile(r"^MwarHwVer\s+:\s+(?P<mwar_hw_ver>.*)$")
         
         # Location                           : default location
-        p9 = re.compile(r"^Location\s+:\s+(?P<location>.*)$")
+        p9 = regex_engine.compile(r"^Location\s+:\s+(?P<location>.*)$")
         
         # ApMode                             : FlexConnect
-        p10 = re.compile(r"^ApMode\s+:\s+(?P<ap_mode>.*)$")    
+        p10 = regex_engine.compile(r"^ApMode\s+:\s+(?P<ap_mode>.*)$")    
         
         # ApSubMode                          : Not Configured
-        p11 = re.compile(r"^ApSubMode\s+:\s+(?P<ap_sub_mode>.*)$")  
+        p11 = regex_engine.compile(r"^ApSubMode\s+:\s+(?P<ap_sub_mode>.*)$")  
         
         # CAPWAP Path MTU                    : 1485
-        p12 = re.compile(r"^CAPWAP\s+Path\s+MTU\s+:\s+(?P<capwap_path_mtu>.*)$")
+        p12 = regex_engine.compile(r"^CAPWAP\s+Path\s+MTU\s+:\s+(?P<capwap_path_mtu>.*)$")
         
         # Software Initiated Reload Reason   : Controller Reload command
-        p13 = re.compile(r"^Software\s+Initiated\s+Reload\s+Reason\s+:\s+(?P<software_initiated_reload_reason>.*)$")
+        p13 = regex_engine.compile(r"^Software\s+Initiated\s+Reload\s+Reason\s+:\s+(?P<software_initiated_reload_reason>.*)$")
         
         # Active Window Size                 : 1
-        p14 = re.compile(r"^Active\s+Window\s+Size\s+:\s+(?P<active_window_size>.*)$")
+        p14 = regex_engine.compile(r"^Active\s+Window\s+Size\s+:\s+(?P<active_window_size>.*)$")
         
         # OOB Image Download         : Enabled
-        p15 = re.compile(r"^OOB\s+Image\s+Download\s+:\s+(?P<oob_image_download>.*)$")
+        p15 = regex_engine.compile(r"^OOB\s+Image\s+Download\s+:\s+(?P<oob_image_download>.*)$")
         
         # CAPWAP UDP-Lite                    : Enabled
-        p16 = re.compile(r"^CAPWAP\s+UDP-Lite\s+:\s+(?P<capwap_udp_lite>.*)$")
+        p16 = regex_engine.compile(r"^CAPWAP\s+UDP-Lite\s+:\s+(?P<capwap_udp_lite>.*)$")
         
         # IP Prefer-mode                     : IPv4
-        p17 = re.compile(r"^IP\s+Prefer-mode\s+:\s+(?P<ip_prefer_mode>.*)$")
+        p17 = regex_engine.compile(r"^IP\s+Prefer-mode\s+:\s+(?P<ip_prefer_mode>.*)$")
         
         # AP Link DTLS Encryption            : ON
-        p18 = re.compile(r"^AP\s+Link\s+DTLS\s+Encryption\s+:\s+(?P<ap_link_dtls_encryption>.*)$")
+        p18 = regex_engine.compile(r"^AP\s+Link\s+DTLS\s+Encryption\s+:\s+(?P<ap_link_dtls_encryption>.*)$")
         
         # AP TCP MSS Adjust                  : Enabled
-        p19 = re.compile(r"^AP\s+TCP\s+MSS\s+Adjust\s+:\s+(?P<ap_tcp_mss_adjust>.*)$")
+        p19 = regex_engine.compile(r"^AP\s+TCP\s+MSS\s+Adjust\s+:\s+(?P<ap_tcp_mss_adjust>.*)$")
         
         # AP TCP MSS size                    : 600
-        p20 = re.compile(r"^AP\s+TCP\s+MSS\s+size\s+:\s+(?P<ap_tcp_mss_size>.*)$")
+        p20 = regex_engine.compile(r"^AP\s+TCP\s+MSS\s+size\s+:\s+(?P<ap_tcp_mss_size>.*)$")
         
         # LinkAuditing                       : disabled
-        p21 = re.compile(r"^LinkAuditing\s+:\s+(?P<linkauditing>.*)$")
+        p21 = regex_engine.compile(r"^LinkAuditing\s+:\s+(?P<linkauditing>.*)$")
         
         # AP Group Name                      : default-group
-        p22 = re.compile(r"^AP\s+Group\s+Name\s+:\s+(?P<ap_group_name>.*)$")
+        p22 = regex_engine.compile(r"^AP\s+Group\s+Name\s+:\s+(?P<ap_group_name>.*)$")
         
         # Controller Last Sent: No value set
-        p23 = re.compile(r"^Controller\s+Last\s+Sent:\s+(?P<controller_last_sent>.*)$")
+        p23 = regex_engine.compile(r"^Controller\s+Last\s+Sent:\s+(?P<controller_last_sent>.*)$")
                
         # AP Inline Tagging Mode            : Enabled
-        p24 = re.compile(r"^AP\s+Inline\s+Tagging\s+Mode\s+:\s+(?P<ap_inline_tagging_mode>.*)$")
+        p24 = regex_engine.compile(r"^AP\s+Inline\s+Tagging\s+Mode\s+:\s+(?P<ap_inline_tagging_mode>.*)$")
         
         # AP Sgacl Enforcement              : Enabled
-        p25 = re.compile(r"^AP\s+Sgacl\s+Enforcement\s+:\s+(?P<ap_sgacl_enforcement>.*)$")
+        p25 = regex_engine.compile(r"^AP\s+Sgacl\s+Enforcement\s+:\s+(?P<ap_sgacl_enforcement>.*)$")
         
         # AP Override Status                : Disabled
-        p26 = re.compile(r"^AP\s+Override\s+Status\s+:\s+(?P<ap_override_status>.*)$")
+        p26 = regex_engine.compile(r"^AP\s+Override\s+Status\s+:\s+(?P<ap_override_status>.*)$")
         
         # Total Flash Writes Since Boot      : 377
-        p27 = re.compile(r"^Total\s+Flash\s+Writes\s+Since\s+Boot\s+:\s+(?P<total_flash_writes_since_boot>.*)$")
+        p27 = regex_engine.compile(r"^Total\s+Flash\s+Writes\s+Since\s+Boot\s+:\s+(?P<total_flash_writes_since_boot>.*)$")
         
         # BLE Module Admin State             : Disabled
-        p28 = re.compile(r"^BLE\s+Module\s+Admin\s+State\s+:\s+(?P<ble_module_admin_state>.*)$")
+        p28 = regex_engine.compile(r"^BLE\s+Module\s+Admin\s+State\s+:\s+(?P<ble_module_admin_state>.*)$")
         
         # Hyperlocation Admin State          : Disabled
-        p29 = re.compile(r"^Hyperlocation\s+Admin\s+State\s+:\s+(?P<hyperlocation_admin_state>.*)$")
+        p29 = regex_engine.compile(r"^Hyperlocation\s+Admin\s+State\s+:\s+(?P<hyperlocation_admin_state>.*)$")
 
         # Flex Group Name                    : FP1
-        p30 =  re.compile(r"^Flex\s+Group\s+Name\s+:\s+(?P<flex_group_name>.*)$")
+        p30 =  regex_engine.compile(r"^Flex\s+Group\s+Name\s+:\s+(?P<flex_group_name>.*)$")
 
         controller_last = {}
         capwap_disconnect = {"capwap_disconnect_reason":{}}
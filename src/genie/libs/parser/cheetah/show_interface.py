@@ -5,11 +5,13 @@ CHEETAH parsers for the following show commands:
 
 """
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowInterfacesWiredSchema(MetaParser):
 
     """
@@ -83,51 +85,51 @@ class ShowInterfacesWired(ShowInterfacesWiredSchema):
 
         # wired0    Link encap:Ethernet  HWaddr 5C:5A:C7:52:01:DC eMac Status: UP
         # wired0    Link encap:Ethernet  HWaddr D4:C9:3C:E6:B8:48
-        p1 = re.compile(r'^(?P<name>\w+)\s+Link encap:Ethernet\s+HWaddr (?P<mac_address>[\w:]+)(?: eMac Status: (?P<status>\w+))?$')
+        p1 = regex_engine.compile(r'^(?P<name>\w+)\s+Link encap:Ethernet\s+HWaddr (?P<mac_address>[\w:]+)(?: eMac Status: (?P<status>\w+))?$')
 
         # inet addr: 9.2.46.109  Bcast: 9.2.46.255  Mask: 255.255.255.0
-        p1_1 = re.compile(r'^inet +addr: (?P<ip_address>[0-9\.]+|unassigned)\s+Bcast:\s+(?P<broadcast_address>[0-9\.]+)\s+Mask:\s+(?P<netmask>[0-9\.]+)$')
+        p1_1 = regex_engine.compile(r'^inet +addr: (?P<ip_address>[0-9\.]+|unassigned)\s+Bcast:\s+(?P<broadcast_address>[0-9\.]+)\s+Mask:\s+(?P<netmask>[0-9\.]+)$')
 
         # UP BROADCAST RUNNING PROMISC MULTICAST  MTU:2400  Metric:1
-        p1_2 = re.compile(r'^(?P<attributes>[\w\s]+)?\s+MTU:(?P<mtu>\d+)\s+Metric:(?P<metric>\d+)$')
+        p1_2 = regex_engine.compile(r'^(?P<attributes>[\w\s]+)?\s+MTU:(?P<mtu>\d+)\s+Metric:(?P<metric>\d+)$')
 
         # collisions:0 txqueuelen:80
-        p1_3 = re.compile(r'^collisions:(?P<collisions>\d+) txqueuelen:(?P<txqueuelen>\d+)$')
+        p1_3 = regex_engine.compile(r'^collisions:(?P<collisions>\d+) txqueuelen:(?P<txqueuelen>\d+)$')
 
         # full Duplex, 1000 Mb/s
-        p1_4 = re.compile(r'^(?P<duplex>\w+) Duplex, (?P<speed>\d+) Mb\/s$')
+        p1_4 = regex_engine.compile(r'^(?P<duplex>\w+) Duplex, (?P<speed>\d+) Mb\/s$')
 
         # 5 minute input rate 25514 bits/sec, 20 packets/sec
         # 5 minute input rate n/a bits/sec, n/a packets/sec
-        p1_5 = re.compile(r'^(?P<load_interval>[\w\s]+) input rate (?P<input_rate_bps>\d+|n\/a) bits\/sec,'
-                          r'\s+(?P<input_pps>\d+|n\/a) packets\/sec$')
+        p1_5 = regex_engine.compile(r'^(?P<load_interval>[\w\s]+) input rate (?P<input_rate_bps>\d+|n\/a) bits\/sec,'
+                                    r'\s+(?P<input_pps>\d+|n\/a) packets\/sec$')
 
         # 5 minute output rate 4911 bits/sec, 1 packets/sec
         # 5 minute output rate n/a bits/sec, n/a packets/sec
-        p1_6 = re.compile(r'^(?P<load_interval>[\w\s]+) output rate (?P<output_rate_bps>\d+|n\/a) bits\/sec, '
-                          r'(?P<output_pps>\d+|n\/a) packets\/sec$')
+        p1_6 = regex_engine.compile(r'^(?P<load_interval>[\w\s]+) output rate (?P<output_rate_bps>\d+|n\/a) bits\/sec, '
+                                    r'(?P<output_pps>\d+|n\/a) packets\/sec$')
 
         # ID         :               0             TYPE       :               0
-        p1_7 = re.compile(r'^ID\s+:\s+(?P<id>\d+)\s+TYPE\s+:\s+(?P<type>\d+)$')
+        p1_7 = regex_engine.compile(r'^ID\s+:\s+(?P<id>\d+)\s+TYPE\s+:\s+(?P<type>\d+)$')
 
         # RX PKTS    :       216610184/14          TX PKTS    :         8818878/1
-        p1_8 = re.compile(r'^RX PKTS\s+:\s+(?P<rx_pkts_cumulative_total>\d+)\/(?P<rx_pkts_last_5_sec>\d+)\s+'
-                          r'TX PKTS\s+:\s+(?P<tx_pkts_cumulative_total>\d+)\/(?P<tx_pkts_last_5_sec>\d+)$')
+        p1_8 = regex_engine.compile(r'^RX PKTS\s+:\s+(?P<rx_pkts_cumulative_total>\d+)\/(?P<rx_pkts_last_5_sec>\d+)\s+'
+                                    r'TX PKTS\s+:\s+(?P<tx_pkts_cumulative_total>\d+)\/(?P<tx_pkts_last_5_sec>\d+)$')
 
         # RX OCTETS  :       349752895/54141       TX OCTETS  :        61400488/1453
-        p1_9 = re.compile(r'^RX OCTETS\s+:\s+(?P<rx_oct_cumulative_total>\d+)\/(?P<rx_oct_last_5_sec>\d+)\s+'
-                          r'TX OCTETS\s+:\s+(?P<tx_oct_cumulative_total>\d+)\/(?P<tx_oct_last_5_sec>\d+)$')
+        p1_9 = regex_engine.compile(r'^RX OCTETS\s+:\s+(?P<rx_oct_cumulative_total>\d+)\/(?P<rx_oct_last_5_sec>\d+)\s+'
+                                    r'TX OCTETS\s+:\s+(?P<tx_oct_cumulative_total>\d+)\/(?P<tx_oct_last_5_sec>\d+)$')
 
         # RX ERR     :              52/0           TX ERR     :               0/0
-        p1_10 = re.compile(r'^RX ERR\s+:\s+(?P<rx_err_cumulative_total>\d+)\/(?P<rx_err_last_5_sec>\d+)\s+'
-                           r'TX ERR\s+:\s+(?P<tx_err_cumulative_total>\d+)\/(?P<tx_err_last_5_sec>\d+)$')
+        p1_10 = regex_engine.compile(r'^RX ERR\s+:\s+(?P<rx_err_cumulative_total>\d+)\/(?P<rx_err_last_5_sec>\d+)\s+'
+                                     r'TX ERR\s+:\s+(?P<tx_err_cumulative_total>\d+)\/(?P<tx_err_last_5_sec>\d+)$')
 
         # RX BYTES   :     35331894561/1232        TX BYTES   :      1854544178/68
-        p1_11 = re.compile(r'^RX BYTES\s+:\s+(?P<rx_byt_cumulative_total>\d+)\/(?P<rx_byt_last_5_sec>\d+)\s+'
-                           r'TX BYTES\s+:\s+(?P<tx_byt_cumulative_total>\d+)\/(?P<tx_byt_last_5_sec>\d+)$')
+        p1_11 = regex_engine.compile(r'^RX BYTES\s+:\s+(?P<rx_byt_cumulative_total>\d+)\/(?P<rx_byt_last_5_sec>\d+)\s+'
+                                     r'TX BYTES\s+:\s+(?P<tx_byt_cumulative_total>\d+)\/(?P<tx_byt_last_5_sec>\d+)$')
 
         # RX DROPS   :               0/0
-        p1_12 = re.compile(r'^RX DROPS\s+:\s+(?P<rx_drop_cumulative_total>\d+)\/(?P<rx_drop_last_5_sec>\d+)$')
+        p1_12 = regex_engine.compile(r'^RX DROPS\s+:\s+(?P<rx_drop_cumulative_total>\d+)\/(?P<rx_drop_last_5_sec>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -384,117 +386,117 @@ class ShowInterfacesDot11radio(ShowInterfacesDot11radioSchema):
         ret_dict = {}
 
         # Dot11Radio0 is UP, line protocol is UP
-        p1 = re.compile(r'^(?P<name>\w+) is (?P<admin_state>\w+), line protocol is (?P<protocol_state>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<name>\w+) is (?P<admin_state>\w+), line protocol is (?P<protocol_state>\w+)$')
 
         # Hardware is 802.11 2.4G Radio, channel is 1
-        p1_1 = re.compile(r'^Hardware is (?P<hardware>.*?), channel is (?P<channel>\d+)$')
+        p1_1 = regex_engine.compile(r'^Hardware is (?P<hardware>.*?), channel is (?P<channel>\d+)$')
 
         # Radio MAC is 5C:5A:C7:CB:7C:A0
-        p1_2 = re.compile(r'^Radio MAC is (?P<radio_mac_address>[\w:]+)$')
+        p1_2 = regex_engine.compile(r'^Radio MAC is (?P<radio_mac_address>[\w:]+)$')
 
         # Dot11Radio0     Link encap:Ethernet  HWaddr 5C:5A:C7:CB:7C:A0
-        p1_3 = re.compile(r'^(?P<name>\w+)\s+Link encap:Ethernet\s+HWaddr (?P<mac_address>[\w:]+)$')
+        p1_3 = regex_engine.compile(r'^(?P<name>\w+)\s+Link encap:Ethernet\s+HWaddr (?P<mac_address>[\w:]+)$')
 
         # UP BROADCAST RUNNING MULTICAST  MTU:1500  Metric:1
-        p1_4 = re.compile(r'^(?P<attributes>[\w\s]+)?\s+MTU:(?P<mtu>\d+)\s+Metric:(?P<metric>\d+)$')
+        p1_4 = regex_engine.compile(r'^(?P<attributes>[\w\s]+)?\s+MTU:(?P<mtu>\d+)\s+Metric:(?P<metric>\d+)$')
 
         # RX packets:26749820 errors:0 dropped:0 overruns:0 frame:0
-        p1_5 = re.compile(r'^RX packets:(?P<packets>\d+) errors:(?P<error>\d+) dropped:(?P<drop>\d+) overruns:(?P<overrun>\d+) frame:(?P<frame>\d+)$')
+        p1_5 = regex_engine.compile(r'^RX packets:(?P<packets>\d+) errors:(?P<error>\d+) dropped:(?P<drop>\d+) overruns:(?P<overrun>\d+) frame:(?P<frame>\d+)$')
 
         # TX packets:0 errors:0 dropped:0 overruns:0 carrier:0
-        p1_6 = re.compile(r'^TX packets:(?P<packets>\d+) errors:(?P<error>\d+) dropped:(?P<drop>\d+) overruns:(?P<overrun>\d+) carrier:(?P<carrier>\d+)$')
+        p1_6 = regex_engine.compile(r'^TX packets:(?P<packets>\d+) errors:(?P<error>\d+) dropped:(?P<drop>\d+) overruns:(?P<overrun>\d+) carrier:(?P<carrier>\d+)$')
 
         # collisions:0 txqueuelen:1000
-        p1_7 = re.compile(r'^collisions:(?P<collisions>\d+) txqueuelen:(?P<txqueuelen>\d+)$')
+        p1_7 = regex_engine.compile(r'^collisions:(?P<collisions>\d+) txqueuelen:(?P<txqueuelen>\d+)$')
 
         # RX bytes:3849651069 (3.5 GiB)  TX bytes:0 (0.0 B)
-        p1_8 = re.compile(r'^RX bytes:(?P<rx_bytes>\d+) \([\d.\s\w]+\)\s+TX bytes:(?P<tx_bytes>\d+) \([\d.\s\w]+\)$')
+        p1_8 = regex_engine.compile(r'^RX bytes:(?P<rx_bytes>\d+) \([\d.\s\w]+\)\s+TX bytes:(?P<tx_bytes>\d+) \([\d.\s\w]+\)$')
 
         # Interrupt:65 Memory:f8000000-f8200000
-        p1_9 = re.compile(r'^Interrupt:(?P<interrupt>\d+) Memory:(?P<memory>[\w-]+)$')
+        p1_9 = regex_engine.compile(r'^Interrupt:(?P<interrupt>\d+) Memory:(?P<memory>[\w-]+)$')
 
         # ML_TYPE: NON_ML	DOT11 Statistics (Cumulative Total/Last 5 Seconds):
-        p1_10 = re.compile(r'^(ML_TYPE: (?P<ml_type>[\w_]+)\s+)?DOT11 Statistics \(Cumulative Total\/Last 5 Seconds\):$')
+        p1_10 = regex_engine.compile(r'^(ML_TYPE: (?P<ml_type>[\w_]+)\s+)?DOT11 Statistics \(Cumulative Total\/Last 5 Seconds\):$')
 
         # Host Rx K Bytes:             0/0        Host Tx K Bytes:             0/0
-        p1_11 = re.compile(r'^Host Rx K Bytes:\s+(?P<host_rx_cumulative>\d+)\/(?P<host_rx_last_5sec>\d+)'
-                           r'\s+Host Tx K Bytes:\s+(?P<host_tx_cumulative>\d+)\/(?P<host_tx_last_5sec>\d+)$')
+        p1_11 = regex_engine.compile(r'^Host Rx K Bytes:\s+(?P<host_rx_cumulative>\d+)\/(?P<host_rx_last_5sec>\d+)'
+                                     r'\s+Host Tx K Bytes:\s+(?P<host_tx_cumulative>\d+)\/(?P<host_tx_last_5sec>\d+)$')
 
         # Unicasts Rx:                 0/0        Unicasts Tx:                 0/0
-        p1_12 = re.compile(r'^Unicasts Rx:\s+(?P<unicasts_rx_cumulative>\d+)\/(?P<unicasts_rx_last_5sec>\d+)'
-                           r'\s+Unicasts Tx:\s+(?P<unicasts_tx_cumulative>\d+)\/(?P<unicasts_tx_last_5sec>\d+)$')
+        p1_12 = regex_engine.compile(r'^Unicasts Rx:\s+(?P<unicasts_rx_cumulative>\d+)\/(?P<unicasts_rx_last_5sec>\d+)'
+                                     r'\s+Unicasts Tx:\s+(?P<unicasts_tx_cumulative>\d+)\/(?P<unicasts_tx_last_5sec>\d+)$')
 
         # Broadcasts Rx:               0/0        Broadcasts Tx:               0/0
-        p1_13 = re.compile(r'^Broadcasts Rx:\s+(?P<broadcasts_rx_cumulative>\d+)\/(?P<broadcasts_rx_last_5sec>\d+)'
-                           r'\s+Broadcasts Tx:\s+(?P<broadcasts_tx_cumulative>\d+)\/(?P<broadcasts_tx_last_5sec>\d+)$')
+        p1_13 = regex_engine.compile(r'^Broadcasts Rx:\s+(?P<broadcasts_rx_cumulative>\d+)\/(?P<broadcasts_rx_last_5sec>\d+)'
+                                     r'\s+Broadcasts Tx:\s+(?P<broadcasts_tx_cumulative>\d+)\/(?P<broadcasts_tx_last_5sec>\d+)$')
 
         # Beacons Rx:           42662813/2219     Beacons Tx:                  0/0
-        p1_14 = re.compile(r'^Beacons Rx:\s+(?P<beacons_rx_cumulative>\d+)\/(?P<beacons_rx_last_5sec>\d+)'
-                           r'\s+Beacons Tx:\s+(?P<beacons_tx_cumulative>\d+)\/(?P<beacons_tx_last_5sec>\d+)$')
+        p1_14 = regex_engine.compile(r'^Beacons Rx:\s+(?P<beacons_rx_cumulative>\d+)\/(?P<beacons_rx_last_5sec>\d+)'
+                                     r'\s+Beacons Tx:\s+(?P<beacons_tx_cumulative>\d+)\/(?P<beacons_tx_last_5sec>\d+)$')
 
         # Probes Rx:              208124/16       Probes Tx:                   0/0
-        p1_15 = re.compile(r'^Probes Rx:\s+(?P<probes_rx_cumulative>\d+)\/(?P<probes_rx_last_5sec>\d+)'
-                           r'\s+Probes Tx:\s+(?P<probes_tx_cumulative>\d+)\/(?P<probes_tx_last_5sec>\d+)$')
+        p1_15 = regex_engine.compile(r'^Probes Rx:\s+(?P<probes_rx_cumulative>\d+)\/(?P<probes_rx_last_5sec>\d+)'
+                                     r'\s+Probes Tx:\s+(?P<probes_tx_cumulative>\d+)\/(?P<probes_tx_last_5sec>\d+)$')
 
         # Multicasts Rx:               0/0        Multicasts Tx:               0/0
-        p1_16 = re.compile(r'^Multicasts Rx:\s+(?P<multicasts_rx_cumulative>\d+)\/(?P<multicasts_rx_last_5sec>\d+)'
-                           r'\s+Multicasts Tx:\s+(?P<multicasts_tx_cumulative>\d+)\/(?P<multicasts_tx_last_5sec>\d+)$')
+        p1_16 = regex_engine.compile(r'^Multicasts Rx:\s+(?P<multicasts_rx_cumulative>\d+)\/(?P<multicasts_rx_last_5sec>\d+)'
+                                     r'\s+Multicasts Tx:\s+(?P<multicasts_tx_cumulative>\d+)\/(?P<multicasts_tx_last_5sec>\d+)$')
 
         # Mgmt Packets Rx:      42870937/2235     Mgmt Packets Tx:             0/0
-        p1_17 = re.compile(r'^Mgmt Packets Rx:\s+(?P<mgmt_rx_pkts_cumulative>\d+)\/(?P<mgmt_rx_pkts_last_5sec>\d+)'
-                           r'\s+Mgmt Packets Tx:\s+(?P<mgmt_tx_pkts_cumulative>\d+)\/(?P<mgmt_tx_pkts_last_5sec>\d+)$')
+        p1_17 = regex_engine.compile(r'^Mgmt Packets Rx:\s+(?P<mgmt_rx_pkts_cumulative>\d+)\/(?P<mgmt_rx_pkts_last_5sec>\d+)'
+                                     r'\s+Mgmt Packets Tx:\s+(?P<mgmt_tx_pkts_cumulative>\d+)\/(?P<mgmt_tx_pkts_last_5sec>\d+)$')
 
         # Ctrl Frames Rx:          93989/15       Ctrl Frames Tx:              0/0
-        p1_18 = re.compile(r'^Ctrl Frames Rx:\s+(?P<ctrl_frame_rx_cumulative>\d+)\/(?P<ctrl_frame_rx_last_5sec>\d+)'
-                           r'\s+Ctrl Frames Tx:\s+(?P<ctrl_frame_tx_cumulative>\d+)\/(?P<ctrl_frame_tx_last_5sec>\d+)$')
+        p1_18 = regex_engine.compile(r'^Ctrl Frames Rx:\s+(?P<ctrl_frame_rx_cumulative>\d+)\/(?P<ctrl_frame_rx_last_5sec>\d+)'
+                                     r'\s+Ctrl Frames Tx:\s+(?P<ctrl_frame_tx_cumulative>\d+)\/(?P<ctrl_frame_tx_last_5sec>\d+)$')
 
         # RTS received:            12523/2        RTS transmitted:             0/0
-        p1_19 = re.compile(r'^RTS received:\s+(?P<rts_received_rx_cumulative>\d+)\/(?P<rts_received_rx_last_5sec>\d+)'
-                           r'\s+RTS transmitted:\s+(?P<rts_received_tx_cumulative>\d+)\/(?P<rts_received_tx_last_5sec>\d+)$')
+        p1_19 = regex_engine.compile(r'^RTS received:\s+(?P<rts_received_rx_cumulative>\d+)\/(?P<rts_received_rx_last_5sec>\d+)'
+                                     r'\s+RTS transmitted:\s+(?P<rts_received_tx_cumulative>\d+)\/(?P<rts_received_tx_last_5sec>\d+)$')
 
         # Duplicate frames:            0/0        CTS not received:            0/0
-        p1_20 = re.compile(r'^Duplicate frames:\s+(?P<duplicate_frames_rx_cumulative>\d+)\/(?P<duplicate_frames_rx_last_5sec>\d+)'
-                           r'\s+CTS not received:\s+(?P<cts_not_received_cumulative>\d+)\/(?P<cts_not_received_last_5sec>\d+)$')
+        p1_20 = regex_engine.compile(r'^Duplicate frames:\s+(?P<duplicate_frames_rx_cumulative>\d+)\/(?P<duplicate_frames_rx_last_5sec>\d+)'
+                                     r'\s+CTS not received:\s+(?P<cts_not_received_cumulative>\d+)\/(?P<cts_not_received_last_5sec>\d+)$')
 
         # MIC errors:                  0/0        WEP errors:                  0/0
-        p1_21 = re.compile(r'^MIC errors:\s+(?P<mic_err_cumulative>\d+)\/(?P<mic_err_last_5sec>\d+)'
-                           r'\s+WEP errors:\s+(?P<wep_err_cumulative>\d+)\/(?P<wep_err_last_5sec>\d+)$')
+        p1_21 = regex_engine.compile(r'^MIC errors:\s+(?P<mic_err_cumulative>\d+)\/(?P<mic_err_last_5sec>\d+)'
+                                     r'\s+WEP errors:\s+(?P<wep_err_cumulative>\d+)\/(?P<wep_err_last_5sec>\d+)$')
 
         # FCS errors:            5300255/231      Retries:                     0/0
-        p1_22 = re.compile(r'^FCS errors:\s+(?P<fcs_errors_rx_cumulative>\d+)\/(?P<fcs_errors_rx_last_5sec>\d+)'
-                           r'\s+Retries:\s+(?P<retries_tx_cumulative>\d+)\/(?P<retries_tx_last_5sec>\d+)$')
+        p1_22 = regex_engine.compile(r'^FCS errors:\s+(?P<fcs_errors_rx_cumulative>\d+)\/(?P<fcs_errors_rx_last_5sec>\d+)'
+                                     r'\s+Retries:\s+(?P<retries_tx_cumulative>\d+)\/(?P<retries_tx_last_5sec>\d+)$')
 
         # Key Index errors:            0/0        Tx Failures:                 0/0
-        p1_23 = re.compile(r'^Key Index errors:\s+(?P<key_index_err_rx_cumulative>\d+)\/(?P<key_index_err_rx_last_5sec>\d+)'
-                           r'\s+Tx Failures:\s+(?P<tx_failures_cumulative>\d+)\/(?P<tx_failures_last_5sec>\d+)$')
+        p1_23 = regex_engine.compile(r'^Key Index errors:\s+(?P<key_index_err_rx_cumulative>\d+)\/(?P<key_index_err_rx_last_5sec>\d+)'
+                                     r'\s+Tx Failures:\s+(?P<tx_failures_cumulative>\d+)\/(?P<tx_failures_last_5sec>\d+)$')
 
         #  Tx Drops:                    0/0
-        p1_24 = re.compile(r'^Tx Drops:\s+(?P<tx_drops_cumulative>\d+)\/(?P<tx_drops_last_5sec>\d+)$')
+        p1_24 = regex_engine.compile(r'^Tx Drops:\s+(?P<tx_drops_cumulative>\d+)\/(?P<tx_drops_last_5sec>\d+)$')
 
         # Beacons missed: 0-30s 31-60s 61-90s 90s+
-        p1_25 = re.compile(r'^Beacons missed: (?P<beacon_missed>[\w\s\-+]+)$')
+        p1_25 = regex_engine.compile(r'^Beacons missed: (?P<beacon_missed>[\w\s\-+]+)$')
 
         # 0      0      0    0
-        p1_26 = re.compile(r'^(?P<values>[\d\s]+)$')
+        p1_26 = regex_engine.compile(r'^(?P<values>[\d\s]+)$')
 
         # Vap RX statistics:
-        p1_27 = re.compile(r'^Vap RX statistics:$')
+        p1_27 = regex_engine.compile(r'^Vap RX statistics:$')
 
         # Vap TX statistics:
-        p1_28 = re.compile(r'^Vap TX statistics:$')
+        p1_28 = regex_engine.compile(r'^Vap TX statistics:$')
 
         # vap         ssid  MGMT DATA [BK  BE  VI VO] Bytes(Data)
         # 1 JEY_OPEN_WGB 944/0  0/0 0/0 0/0 0/0 0/0         0/0
-        p1_29 = re.compile(r'^(?P<vap_id>\d+)\s+(?P<ssid>[\w_]+)\s+(?P<mgmt>[\d\/]+)\s+'
-                           r'(?P<data>[\d\/]+)\s+(?P<bk>[\d\/]+)\s+(?P<be>[\d\/]+)\s+'
-                           r'(?P<vi>[\d\/]+)\s+(?P<vo>[\d\/]+)\s+(?P<data_bytes>[\d\/]+)$')
+        p1_29 = regex_engine.compile(r'^(?P<vap_id>\d+)\s+(?P<ssid>[\w_]+)\s+(?P<mgmt>[\d\/]+)\s+'
+                                     r'(?P<data>[\d\/]+)\s+(?P<bk>[\d\/]+)\s+(?P<be>[\d\/]+)\s+'
+                                     r'(?P<vi>[\d\/]+)\s+(?P<vo>[\d\/]+)\s+(?P<data_bytes>[\d\/]+)$')
 
         # vap         ssid  MGMT      Beacon     DATA [BK  BE  VI VO] Bytes(Data) QosRetries AMDPU-SubFrameRetries
         # 1   JEY_OPEN_WGB 813/0 23654269/48 181306/0 0/0 0/0 0/0 0/0         0/0        0/0                   0/0
-        p1_30 = re.compile(r'^(?P<vap_id>\d+)\s+(?P<ssid>[\w_]+)\s+(?P<mgmt>[\d\/]+)\s+(?P<beacon>[\d\/]+)\s+'
-                           r'(?P<data>[\d\/]+)\s+(?P<bk>[\d\/]+)\s+(?P<be>[\d\/]+)\s+(?P<vi>[\d\/]+)\s+'
-                           r'(?P<vo>[\d\/]+)\s+(?P<data_bytes>[\d\/]+)\s+(?P<qos_retries>[\d\/]+)?\s+'
-                           r'(?P<amdpu_subframe_retries>[\d\/]+)$')
+        p1_30 = regex_engine.compile(r'^(?P<vap_id>\d+)\s+(?P<ssid>[\w_]+)\s+(?P<mgmt>[\d\/]+)\s+(?P<beacon>[\d\/]+)\s+'
+                                     r'(?P<data>[\d\/]+)\s+(?P<bk>[\d\/]+)\s+(?P<be>[\d\/]+)\s+(?P<vi>[\d\/]+)\s+'
+                                     r'(?P<vo>[\d\/]+)\s+(?P<data_bytes>[\d\/]+)\s+(?P<qos_retries>[\d\/]+)?\s+'
+                                     r'(?P<amdpu_subframe_retries>[\d\/]+)$')
 
         for line in output.splitlines():
             line = line.strip()
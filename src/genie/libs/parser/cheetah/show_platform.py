@@ -5,11 +5,13 @@ CHEETAH parsers for the following show commands:
 
 """
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowVersionSchema(MetaParser):
 
@@ -71,54 +73,54 @@ class ShowVersion(ShowVersionSchema):
 
         ret_dict = {}
         # Cisco AP Software, (ap3g3), [lnx15:/6885/label/ci_barbados]
-        p0 = re.compile(r'Cisco AP Software.*?')
+        p0 = regex_engine.compile(r'Cisco AP Software.*?')
         # BOOTLDR: U-Boot boot loader Version 2013.01-ge1c49d93a (Jul 28 2023 - 09:08:14)
-        p1 = re.compile(r'BOOTLDR:\s+U\-Boot\s+boot\s+loader\s+Version\s+(?P<bootloader_version>\S+)\s+\((?P<bootloader_timestamp>.*?)\)$')
+        p1 = regex_engine.compile(r'BOOTLDR:\s+U\-Boot\s+boot\s+loader\s+Version\s+(?P<bootloader_version>\S+)\s+\((?P<bootloader_timestamp>.*?)\)$')
         # AP5C5A.C752.01DC uptime is 0 days, 8 hours, 24 minutes
-        p1_1 = re.compile(r'.*?\s+uptime\s+is\s+(?P<uptime>.*?)$')
+        p1_1 = regex_engine.compile(r'.*?\s+uptime\s+is\s+(?P<uptime>.*?)$')
         # Last reload time   : Tue Jan 23 19:26:02 UTC 2024
-        p1_2 = re.compile(r'Last\s+reload\s+time\s+:\s+(?P<last_reload_time>.*?)$')
+        p1_2 = regex_engine.compile(r'Last\s+reload\s+time\s+:\s+(?P<last_reload_time>.*?)$')
         # Last reload reason : Image Upgrade
-        p1_3 = re.compile(r'Last\s+reload\s+reason\s+:\s+(?P<last_reload_reason>.*?)$')
+        p1_3 = regex_engine.compile(r'Last\s+reload\s+reason\s+:\s+(?P<last_reload_reason>.*?)$')
         # cisco AIR-AP4800-D-K9 ARMv7 Processor rev 1 (v7l) with 1028320/528608K bytes of memory.
-        p1_4 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +(?P<processor_type>\w+) +(.*?)with +(?P<main_mem>[0-9]+)\/[0-9]+[kK]')
+        p1_4 = regex_engine.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +(?P<processor_type>\w+) +(.*?)with +(?P<main_mem>[0-9]+)\/[0-9]+[kK]')
         # Processor board ID FGL2325A4YP
-        p1_5 = re.compile(r'Processor\s+board\s+ID\s+(?P<processor_board_id>\S+)$')
+        p1_5 = regex_engine.compile(r'Processor\s+board\s+ID\s+(?P<processor_board_id>\S+)$')
         # AP Running Image     : 17.15.0.10
-        p1_6 = re.compile(r'AP\s+Running\s+Image\s+:\s+(?P<ap_running_image>\S+)$')
+        p1_6 = regex_engine.compile(r'AP\s+Running\s+Image\s+:\s+(?P<ap_running_image>\S+)$')
         # Primary Boot Image   : 17.15.0.10
-        p1_7 = re.compile(r'Primary\s+Boot\s+Image\s+:\s+(?P<primary_boot_image>\S+)$')
+        p1_7 = regex_engine.compile(r'Primary\s+Boot\s+Image\s+:\s+(?P<primary_boot_image>\S+)$')
         # Backup Boot Image    : 17.15.0.8
-        p1_8 = re.compile(r'Backup\s+Boot\s+Image\s+:\s+(?P<backup_boot_image>\S+)$')
+        p1_8 = regex_engine.compile(r'Backup\s+Boot\s+Image\s+:\s+(?P<backup_boot_image>\S+)$')
         # Primary Boot Image Hash: 8084019f7d71c36ca841f23b8089b7f3e3008cf360da0b49c30c1b468b7e090fef649c1ac7f7dff564f023a795f47ede202024fe7e2a1ae229d69e9ece865ddc
-        p1_9 = re.compile(r'Primary\s+Boot\s+Image\s+Hash:\s+(?P<primary_boot_image_hash>\S+)$')
+        p1_9 = regex_engine.compile(r'Primary\s+Boot\s+Image\s+Hash:\s+(?P<primary_boot_image_hash>\S+)$')
         # Backup  Boot Image Hash: 6b563a9e688f24196d72661309291367bb52e49683e3f6b98feba06ccf22ea03a2ec0b194c5e41f7166138bc3a0fe0d7a9aa1d005295fb29669253eea08a64ba
-        p1_10 = re.compile(r'Backup\s+Boot\s+Image\s+Hash:\s+(?P<backup_boot_image_hash>\S+)$')
+        p1_10 = regex_engine.compile(r'Backup\s+Boot\s+Image\s+Hash:\s+(?P<backup_boot_image_hash>\S+)$')
         # 1 Multigigabit Ethernet interfaces
         # 1 Gigabit Ethernet interfaces
-        p1_11 = re.compile(r'^(?P<number_of_ports>\d+) (?P<interface>.+) Ethernet interfaces$')
+        p1_11 = regex_engine.compile(r'^(?P<number_of_ports>\d+) (?P<interface>.+) Ethernet interfaces$')
         # 3 802.11 Radios
-        p1_12 = re.compile(r'(?P<number_of_ports>\d+) 802.11 Radios$')
+        p1_12 = regex_engine.compile(r'(?P<number_of_ports>\d+) 802.11 Radios$')
         # Radio Driver version : 9.0.5.5-W8964
-        p1_13 = re.compile(r'Radio\s+Driver\s+version\s+:\s+(?P<radio_driver_version>.+)$')
+        p1_13 = regex_engine.compile(r'Radio\s+Driver\s+version\s+:\s+(?P<radio_driver_version>.+)$')
         # Radio FW version : 9.1.8.1
-        p1_14 = re.compile(r'Radio\s+FW\s+version\s+:\s+(?P<radio_fw_version>.+)$')
+        p1_14 = regex_engine.compile(r'Radio\s+FW\s+version\s+:\s+(?P<radio_fw_version>.+)$')
         # NSS FW version : 2.4.32
-        p1_15 = re.compile(r'NSS\s+FW\s+version\s+:\s+(?P<nss_fw_version>.+)$')
+        p1_15 = regex_engine.compile(r'NSS\s+FW\s+version\s+:\s+(?P<nss_fw_version>.+)$')
         # Base ethernet MAC Address            : 5C:5A:C7:52:01:DC
-        p1_16 = re.compile(r'Base\s+ethernet\s+MAC\s+Address\s+:\s+(?P<base_ethernet_mac>\S+)$')
+        p1_16 = regex_engine.compile(r'Base\s+ethernet\s+MAC\s+Address\s+:\s+(?P<base_ethernet_mac>\S+)$')
         # Part Number                          : 73-018776-02
-        p1_17 = re.compile(r'Part\s+Number\s+:\s+(?P<part_number>\S+)$')
+        p1_17 = regex_engine.compile(r'Part\s+Number\s+:\s+(?P<part_number>\S+)$')
         # PCB Serial Number                    : FOC23206BHY
-        p1_18 = re.compile(r'PCB\s+Serial\s+Number\s+:\s+(?P<pcb_serial_number>\S+)$')
+        p1_18 = regex_engine.compile(r'PCB\s+Serial\s+Number\s+:\s+(?P<pcb_serial_number>\S+)$')
         # Top Assembly Part Number             : 068-100533-01
-        p1_19 = re.compile(r'Top\s+Assembly\s+Part\s+Number\s+:\s+(?P<top_assembly_part_number>\S+)$')
+        p1_19 = regex_engine.compile(r'Top\s+Assembly\s+Part\s+Number\s+:\s+(?P<top_assembly_part_number>\S+)$')
         # Top Assembly Serial Number           : FGL2325A4YP
-        p1_20 = re.compile(r'Top\s+Assembly\s+Serial\s+Number\s+:\s+(?P<top_assembly_serial_number>\S+)$')
+        p1_20 = regex_engine.compile(r'Top\s+Assembly\s+Serial\s+Number\s+:\s+(?P<top_assembly_serial_number>\S+)$')
         # Top Revision Number                  : A0
-        p1_21 = re.compile(r'Top\s+Revision\s+Number\s+:\s+(?P<top_revision_number>\S+)$')
+        p1_21 = regex_engine.compile(r'Top\s+Revision\s+Number\s+:\s+(?P<top_revision_number>\S+)$')
         # Product/Model Number                 : AIR-AP4800-D-K9
-        p1_22 = re.compile(r'Product/Model\s+Number\s+:\s+(?P<model_number>\S+)\s*$')
+        p1_22 = regex_engine.compile(r'Product/Model\s+Number\s+:\s+(?P<model_number>\S+)\s*$')
 
         for line in output.splitlines():
             line = line.strip()
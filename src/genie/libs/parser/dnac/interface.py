@@ -26,6 +26,8 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.dnac_pager import iter_pages, map_paths, \
+    timestamp, Lookup, DEFAULT_PAGE_SIZE, DEFAULT_MAX_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -93,36 +95,85 @@ class Interface(InterfaceSchema):
     cli_command = ['/dna/intent/api/v1/interface', 
                    '/dna/intent/api/v1/interface/{interface}']
 
-    def cli(self,interface="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
+    device_path = '/dna/intent/api/v1/network-device'
+    device_interface_path = '/dna/intent/api/v1/interface/network-device/' \
+                            '{device_id}'
+
+    def cli(self, interface="", output=None, page_size=None,
+            max_workers=DEFAULT_MAX_WORKERS, since=None):
+        """
+        Args:
+            interface (`str`): id of an interface
+            output (`list`): records of the interfaces, not collected
+            page_size (`int`): collect the inventory page by page (limit),
+                               max_workers pages at once, and merge each
+                               page as it arrives
+            max_workers (`int`): requests at once when paginated
+            since (`str` or `datetime`): only the interfaces with a
+                                         lastUpdated after it (incremental)
+        """
+        since = timestamp(since) if since is not None else None
+        # get device by id
+        hostnames = Lookup(self.device,
+                           '/dna/intent/api/v1/network-device/{key}',
+                           'hostname')
+
+        if output is not None:
+            pages = [self._named(output, hostnames, since)]
+        elif interface:
+            cmd = self.cli_command[1].format(interface=interface)
             out = self.device.get(cmd).json()['response']
-
+            pages = [self._named(out, hostnames, since)]
+        elif since is not None:
+            pages = self._changed(hostnames, since,
+                                  page_size or DEFAULT_PAGE_SIZE, max_workers)
+        elif page_size:
+            pages = iter_pages(
+                self.device, self.cli_command[0], page_size=page_size,
+                max_workers=max_workers,
+                process=lambda records: self._named(records, hostnames))
         else:
-            out = output
-
-        # get device by id
-        cmd = '/dna/intent/api/v1/network-device/{device_id}'
-
-        result_dict={}
-        id_to_hostname = {}
-        for intf_dict in out:
-            device_id = intf_dict['deviceId']
-            if device_id not in id_to_hostname:
-                device_id_cmd = cmd.format(device_id=device_id)
-                device_info = self.device.get(device_id_cmd).json()['response']
-                hostname = device_info['hostname']
-                id_to_hostname[device_id] = hostname
-            else:
-                hostname = id_to_hostname[device_id]
-
-            host_info = result_dict.setdefault('hostname', {}).setdefault(hostname, {}).setdefault('interfaces', {})
-            # remove None values
-            host_info[intf_dict['portName']] = {k: v 
-                                                for k, v in intf_dict.items() 
-                                                if v is not None}
+            out = self.device.get(self.cli_command[0]).json()['response']
+            pages = [self._named(out, hostnames)]
+
+        result_dict = {}
+        for page in pages:
+            for hostname, intf_dict in page:
+                host_info = result_dict.setdefault('hostname', {})\
+                                       .setdefault(hostname, {})\
+                                       .setdefault('interfaces', {})
+                # remove None values
+                host_info[intf_dict['portName']] = {k: v
+                                                    for k, v in intf_dict.items()
+                                                    if v is not None}
 
         return result_dict
+
+    @staticmethod
+    def _named(records, hostnames, since=None):
+        '''(hostname, record) of the records updated after since'''
+        return [(hostnames[intf_dict['deviceId']], intf_dict)
+                for intf_dict in records
+                if since is None or intf_dict['lastUpdated'] > since]
+
+    def _changed(self, hostnames, since, page_size, max_workers):
+        '''pages of the interfaces updated after since
+
+        The interfaces of a device are updated by its inventory collection,
+        which sets the lastUpdated of the device: only the interfaces of the
+        devices collected after since are requested.
+        '''
+        paths = []
+        for devices in iter_pages(self.device, self.device_path,
+                                  page_size=page_size,
+                                  max_workers=max_workers):
+            for device_info in devices:
+                hostnames.values[device_info['id']] = device_info['hostname']
+                if device_info['lastUpdated'] > since:
+                    paths.append(self.device_interface_path.format(
+                        device_id=device_info['id']))
+
+        return map_paths(
+            self.device, paths, max_workers=max_workers,
+            process=lambda path, records: self._named(records, hostnames,
+                                                      since))
@@ -6,11 +6,13 @@ Check Point Gaia parsers for the following show commands:
 
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowArpSchema(MetaParser):
     schema = {
@@ -45,7 +47,7 @@ class ShowArpDynamic(ShowArpSchema):
         10.1.1.1                50:00:00:ff:06:07
         '''
 
-        p1 = re.compile(r'^^(?P<ip_address>[\d+\.*]+)\s+(?P<mac_address>[\w\w\:]+)$')
+        p1 = regex_engine.compile(r'^^(?P<ip_address>[\d+\.*]+)\s+(?P<mac_address>[\w\w\:]+)$')
 
         # intial variables
         ret_dict = {}
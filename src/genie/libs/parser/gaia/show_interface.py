@@ -6,12 +6,14 @@ Check Point Gaia parsers for the following show commands:
 
 """
 
-import re
 from collections import defaultdict
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowInterfaceSchema(MetaParser):
     schema = {
@@ -112,25 +114,25 @@ class ShowInterface(ShowInterfaceSchema):
             state on
         '''
 
-        p0 = re.compile(r'^Interface (?P<interface_name>(?!.*:).*)$') # Does not match alias interfaces (eth1:1)  
-        p1 = re.compile(r'^state (?P<state>.*)$')
-        p2 = re.compile(r'^mac-addr (?P<mac_addr>.*)$')
-        p3 = re.compile(r'^type (?P<type>.*)$')
-        p4 = re.compile(r'^link-state (?P<link_state>.*)$')
-        p5 = re.compile(r'^mtu (?P<mtu>.*)$')
-        p6 = re.compile(r'^auto-negotiation (?P<auto_negotiation>.*)$')
-        p7 = re.compile(r'^speed (?P<speed>.*)$')
-        p8 = re.compile(r'^ipv6-autoconfig (?P<ipv6_autoconfig>.*)$')
-        p9 = re.compile(r'^duplex (?P<duplex>.*)$')
-        p10 = re.compile(r'^monitor-mode (?P<monitor_mode>.*)$')
-        p11 = re.compile(r'^link-speed (?P<link_speed>.*)$')
-        p12 = re.compile(r'^comments\s*(?P<comments>.*)$')
-        p13 = re.compile(r'^ipv4-address (?P<ipv4_address>.*)$')
-        p14 = re.compile(r'^ipv6-address (?P<ipv6_address>.*)$')
-        p15 = re.compile(r'^ipv6-local-link-address (?P<ipv6_local_link_address>.*)$')
-        p16 = re.compile(r'^TX bytes:(?P<tx_bytes>\d+) packets:(?P<tx_packets>\d+) errors:(?P<tx_errors>\d+) dropped:(?P<tx_dropped>\d+) overruns:(?P<tx_overruns>\d+) carrier:(?P<tx_carrier>\d+)$')
-        p17 = re.compile(r'^RX bytes:(?P<rx_bytes>\d+) packets:(?P<rx_packets>\d+) errors:(?P<rx_errors>\d+) dropped:(?P<rx_dropped>\d+) overruns:(?P<rx_overruns>\d+) frame:(?P<rx_frame>\d+)$')
-        p18 = re.compile(r'^Interface (?P<alias_name>\w+[:]\.?\d+)') # Matches alias interfaces (eth1:1)
+        p0 = regex_engine.compile(r'^Interface (?P<interface_name>(?!.*:).*)$') # Does not match alias interfaces (eth1:1)  
+        p1 = regex_engine.compile(r'^state (?P<state>.*)$')
+        p2 = regex_engine.compile(r'^mac-addr (?P<mac_addr>.*)$')
+        p3 = regex_engine.compile(r'^type (?P<type>.*)$')
+        p4 = regex_engine.compile(r'^link-state (?P<link_state>.*)$')
+        p5 = regex_engine.compile(r'^mtu (?P<mtu>.*)$')
+        p6 = regex_engine.compile(r'^auto-negotiation (?P<auto_negotiation>.*)$')
+        p7 = regex_engine.compile(r'^speed (?P<speed>.*)$')
+        p8 = regex_engine.compile(r'^ipv6-autoconfig (?P<ipv6_autoconfig>.*)$')
+        p9 = regex_engine.compile(r'^duplex (?P<duplex>.*)$')
+        p10 = regex_engine.compile(r'^monitor-mode (?P<monitor_mode>.*)$')
+        p11 = regex_engine.compile(r'^link-speed (?P<link_speed>.*)$')
+        p12 = regex_engine.compile(r'^comments\s*(?P<comments>.*)$')
+        p13 = regex_engine.compile(r'^ipv4-address (?P<ipv4_address>.*)$')
+        p14 = regex_engine.compile(r'^ipv6-address (?P<ipv6_address>.*)$')
+        p15 = regex_engine.compile(r'^ipv6-local-link-address (?P<ipv6_local_link_address>.*)$')
+        p16 = regex_engine.compile(r'^TX bytes:(?P<tx_bytes>\d+) packets:(?P<tx_packets>\d+) errors:(?P<tx_errors>\d+) dropped:(?P<tx_dropped>\d+) overruns:(?P<tx_overruns>\d+) carrier:(?P<tx_carrier>\d+)$')
+        p17 = regex_engine.compile(r'^RX bytes:(?P<rx_bytes>\d+) packets:(?P<rx_packets>\d+) errors:(?P<rx_errors>\d+) dropped:(?P<rx_dropped>\d+) overruns:(?P<rx_overruns>\d+) frame:(?P<rx_frame>\d+)$')
+        p18 = regex_engine.compile(r'^Interface (?P<alias_name>\w+[:]\.?\d+)') # Matches alias interfaces (eth1:1)
 
         for line in out.splitlines():
             line = line.strip()       
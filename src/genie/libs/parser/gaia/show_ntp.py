@@ -7,11 +7,13 @@ Check Point Gaia parsers for the following show commands:
 
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowNtpActiveSchema(MetaParser):
     schema = {
@@ -85,10 +87,10 @@ class ShowNtpCurrent(ShowNtpCurrentSchema):
             # something is wrong
             return ret_dict
 
-        p0  = re.compile(r'^The NTP service is inactive')
-        p1  = re.compile(r'^primary and secondary servers are not synchronized')
-        p2  = re.compile(r'^No server has yet to be synchronized') 
-        p3  = re.compile(r'^(?P<ip_address>(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)(\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)){3})')
+        p0  = regex_engine.compile(r'^The NTP service is inactive')
+        p1  = regex_engine.compile(r'^primary and secondary servers are not synchronized')
+        p2  = regex_engine.compile(r'^No server has yet to be synchronized') 
+        p3  = regex_engine.compile(r'^(?P<ip_address>(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)(\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)){3})')
 
         for line in out.splitlines():
             
@@ -132,7 +134,7 @@ class ShowNtpServers(ShowNtpServersSchema):
         172.16.121.123          Primary           4
         '''
 
-        p1 = re.compile(r'^(?P<ip_address>.*)\s+(?P<type>\w+)\s+(?P<version>\d)$')
+        p1 = regex_engine.compile(r'^(?P<ip_address>.*)\s+(?P<type>\w+)\s+(?P<version>\d)$')
 
         for line in out.splitlines():
             if 'ip_address' not in ret_dict:
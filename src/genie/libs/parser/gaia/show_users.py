@@ -5,11 +5,13 @@ Check Point Gaia parsers for the following show commands:
 
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowUsersSchema(MetaParser):
     schema = {
@@ -45,7 +47,7 @@ class ShowUsers(ShowUsersSchema):
         user7730         0         0         /home/user7730   /bin/bash        n/a                                       
         '''
 
-        p0 = re.compile(r'^(?P<username>[A-z0-9_-]{1,30})\s+(?P<uid>\d+)\s+(?P<gid>\d+)\s+(?P<home>\S+)\s+(?P<shell>\S+)\s+(?P<name>\S{1,30}\s?\S{1,30})([\ t]+(?P<privileges>\w+.*))?')
+        p0 = regex_engine.compile(r'^(?P<username>[A-z0-9_-]{1,30})\s+(?P<uid>\d+)\s+(?P<gid>\d+)\s+(?P<home>\S+)\s+(?P<shell>\S+)\s+(?P<name>\S{1,30}\s?\S{1,30})([\ t]+(?P<privileges>\w+.*))?')
         
         for line in out.splitlines():
             line = line.strip()
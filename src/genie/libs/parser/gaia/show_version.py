@@ -1,7 +1,9 @@
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 class ShowVersionSchema(MetaParser):
     schema = {
@@ -45,10 +47,10 @@ class ShowVersion(ShowVersionSchema):
         OS edition 64-bit
         '''
 
-        p_version = re.compile(r'^Product version Check Point Gaia (?P<version>.*)$')
-        p_build = re.compile(r'^OS build (?P<build>.*)$')
-        p_kernel = re.compile(r'^OS kernel version (?P<kernel>.*)$')
-        p_edition = re.compile(r'^OS edition (?P<edition>.*)$')
+        p_version = regex_engine.compile(r'^Product version Check Point Gaia (?P<version>.*)$')
+        p_build = regex_engine.compile(r'^OS build (?P<build>.*)$')
+        p_kernel = regex_engine.compile(r'^OS kernel version (?P<kernel>.*)$')
+        p_edition = regex_engine.compile(r'^OS edition (?P<edition>.*)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -15,7 +15,6 @@ HVPR parsers for the following display commands:
     """
 
 # Python
-import re
 import logging
 
 # Metaparser
@@ -24,6 +23,9 @@ from genie.metaparser.util.schemaengine import (
     Any,
     Optional
 )
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 # Logger
 logger = logging.getLogger(__name__)
 
@@ -99,28 +101,28 @@ class DisplayBgpPeer(DisplayBgpPeerSchema):
         ret_dict = {}
 
         # BGP local router ID : 3.3.3.3
-        p1 = re.compile(r'^BGP local router ID : (?P<local_router_id>[a-zA-Z0-9.:]+)$')
+        p1 = regex_engine.compile(r'^BGP local router ID : (?P<local_router_id>[a-zA-Z0-9.:]+)$')
 
         # Local AS number : 64666
-        p2 = re.compile(r'^Local AS number : (?P<local_as>[0-9.]+)$')
+        p2 = regex_engine.compile(r'^Local AS number : (?P<local_as>[0-9.]+)$')
 
         # Address Family:Ipv4 Unicast
-        p3 = re.compile(r'^Address Family:(?P<address_family>.+)$')
+        p3 = regex_engine.compile(r'^Address Family:(?P<address_family>.+)$')
 
         # Peer of IPv4-family for vpn instance :
-        p4 = re.compile(r'^Peer of (?P<address_family>\S+) for vpn instance :$')
+        p4 = regex_engine.compile(r'^Peer of (?P<address_family>\S+) for vpn instance :$')
 
         # VPN-Instance mobile, Router ID 1.1.1.1:
-        p5 = re.compile(r'^VPN-Instance (?P<vrf>\S+), Router ID [a-zA-Z0-9.:]+:$')
+        p5 = regex_engine.compile(r'^VPN-Instance (?P<vrf>\S+), Router ID [a-zA-Z0-9.:]+:$')
 
         # 10.10.10.10                              65000        0        0     0 1272h18m     Connect        0        0
         # 20.20.20.20                              65000   232782   279631     0 0646h36m Established        1        7
-        p6 = re.compile(r'^(?P<peer_address>[a-zA-Z0-9.:]+)\s+(?P<remote_as>[0-9.]+)\s+(?P<messages_received>\d+)\s+'
-                        r'(?P<messages_sent>\d+)\s+(?P<out_queue>\d+)\s+(?P<up_down_time>\S+)\s+(?P<state>\S+)\s+(?P<prefixes_received>\d+)\s+(?P<prefixes_advertised>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<peer_address>[a-zA-Z0-9.:]+)\s+(?P<remote_as>[0-9.]+)\s+(?P<messages_received>\d+)\s+'
+                                  r'(?P<messages_sent>\d+)\s+(?P<out_queue>\d+)\s+(?P<up_down_time>\S+)\s+(?P<state>\S+)\s+(?P<prefixes_received>\d+)\s+(?P<prefixes_advertised>\d+)$')
 
         # 5.5.5.5                          4       65000        0        0     0 00:08:50     Connect        0
         # 172.16.100.1                     4       65000       46       60     0 00:07:09 Established        1
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^(?P<peer_address>[a-zA-Z0-9.:]+)\s+(?P<bgp_version>\d+)\s+(?P<remote_as>[0-9.]+)\s+(?P<messages_received>\d+)\s+'
             r'(?P<messages_sent>\d+)\s+(?P<out_queue>\d+)\s+(?P<up_down_time>\S+)\s+(?P<state>\S+)\s+(?P<prefixes_received>\d+)$')
 
@@ -356,53 +358,53 @@ class DisplayBgpPeerVerbose(DisplayBgpPeerVerboseSchema):
         ret_dict = {}
 
         # IPv4-family for VPN instance:   mobile
-        p1 = re.compile(r'^IPv[46]-family for VPN instance:\s+(?P<vrf>.+)$')
+        p1 = regex_engine.compile(r'^IPv[46]-family for VPN instance:\s+(?P<vrf>.+)$')
 
         # BGP Peer is 30.30.30.30,  remote AS 65000
-        p2 = re.compile(r'^BGP Peer is (?P<peer_address>[a-zA-Z0-9.:]+),\s+remote AS (?P<remote_as>[0-9.]+)$')
+        p2 = regex_engine.compile(r'^BGP Peer is (?P<peer_address>[a-zA-Z0-9.:]+),\s+remote AS (?P<remote_as>[0-9.]+)$')
 
         # Type: EBGP link
-        p3 = re.compile(r'^Type: (?P<peer_type>.+)$')
+        p3 = regex_engine.compile(r'^Type: (?P<peer_type>.+)$')
 
         # Peer's description: "TEST"
-        p4 = re.compile(r'^Peer\'s description: "(?P<description>[^"]+)"')
+        p4 = regex_engine.compile(r'^Peer\'s description: "(?P<description>[^"]+)"')
 
         # BGP version 4, Remote router ID 1.1.1.1
-        p5 = re.compile(r'^BGP version (?P<bgp_version>\d+), Remote router ID (?P<remote_router_id>[a-zA-Z0-9.:]+)$')
+        p5 = regex_engine.compile(r'^BGP version (?P<bgp_version>\d+), Remote router ID (?P<remote_router_id>[a-zA-Z0-9.:]+)$')
 
         # Update-group ID: 1
-        p6 = re.compile(r'^Update-group ID: (?P<update_group_id>\d+)')
+        p6 = regex_engine.compile(r'^Update-group ID: (?P<update_group_id>\d+)')
 
         # BGP current state: Established, Up for 26d05h20m49s
-        p7 = re.compile(r'^BGP current state: (?P<current_state>[^,]+), Up for (?P<up_time>[A-z0-9]+)$')
+        p7 = regex_engine.compile(r'^BGP current state: (?P<current_state>[^,]+), Up for (?P<up_time>[A-z0-9]+)$')
 
         # BGP current state: Idle(Admin)
-        p7_1 = re.compile(r'^BGP current state: (?P<current_state>[^,]+)$')
+        p7_1 = regex_engine.compile(r'^BGP current state: (?P<current_state>[^,]+)$')
 
         # BGP last state: Established
-        p8 = re.compile(r'^BGP last state: (?P<last_state>.*)$')
+        p8 = regex_engine.compile(r'^BGP last state: (?P<last_state>.*)$')
 
         # BGP Peer Up count: 3
-        p9 = re.compile(r'^BGP Peer Up count: (?P<peer_up_count>\d+)$')
+        p9 = regex_engine.compile(r'^BGP Peer Up count: (?P<peer_up_count>\d+)$')
 
         # Received total routes: 40
-        p10 = re.compile(r'^Received total routes: (?P<prefixes_received>\d+)')
+        p10 = regex_engine.compile(r'^Received total routes: (?P<prefixes_received>\d+)')
 
         # Received active routes total: 24
-        p11 = re.compile(r'^Received active routes total: (?P<prefixes_active>\d+)')
+        p11 = regex_engine.compile(r'^Received active routes total: (?P<prefixes_active>\d+)')
         # Advertised total routes: 16
-        p12 = re.compile(r'^Advertised total routes: (?P<prefixes_advertised>\d+)')
+        p12 = regex_engine.compile(r'^Advertised total routes: (?P<prefixes_advertised>\d+)')
         # Port: Local - 49801        Remote - 179
-        p13 = re.compile(r'^Port: Local - (?P<local_port>\d+)\s+Remote - (?P<remote_port>\d+)$')
+        p13 = regex_engine.compile(r'^Port: Local - (?P<local_port>\d+)\s+Remote - (?P<remote_port>\d+)$')
 
         # Peer supports bgp multi-protocol extension
         # Peer supports bgp route refresh capability
         # Peer supports bgp 4-byte-as capability
-        p14 = re.compile(r'^Peer supports bgp (?P<capability_name>.*)$')
+        p14 = regex_engine.compile(r'^Peer supports bgp (?P<capability_name>.*)$')
 
         # Address family VPNv4 Unicast: advertised and received
         # Address family IPv4 Unicast: advertised
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^Address family (?P<address_family>[^:]+): (?P<negotiation_state>(?:advertised and received)|advertised|received)$")
 
         # Received: Total 238538 messages
@@ -412,16 +414,16 @@ class DisplayBgpPeerVerbose(DisplayBgpPeerVerboseSchema):
         #  KeepAlive messages             237824
         #  Notification messages          0
         #  Refresh messages               0
-        p16_1 = re.compile(r'^Received: Total (?P<total_received>\d+) messages$')
-        p16_2 = re.compile(r'^Sent: Total (?P<total_sent>\d+) messages$')
-        p16_3 = re.compile(r'^(?P<message_type>[A-z]+) messages\s+(?P<message_count>\d+)$')
+        p16_1 = regex_engine.compile(r'^Received: Total (?P<total_received>\d+) messages$')
+        p16_2 = regex_engine.compile(r'^Sent: Total (?P<total_sent>\d+) messages$')
+        p16_3 = regex_engine.compile(r'^(?P<message_type>[A-z]+) messages\s+(?P<message_count>\d+)$')
 
         #  Minimum route advertisement interval is 30 seconds
-        p17 = re.compile(r'^Minimum route advertisement interval is (?P<route_update_interval>\d+) seconds$')
+        p17 = regex_engine.compile(r'^Minimum route advertisement interval is (?P<route_update_interval>\d+) seconds$')
 
         # Import route policy is: FROM_RRVPN
         # Export route policy is: KEEP_MED
-        p18 = re.compile(r'(?P<route_policy_direction>Import|Export) route policy is: (?P<route_policy_name>\S+)$')
+        p18 = regex_engine.compile(r'(?P<route_policy_direction>Import|Export) route policy is: (?P<route_policy_name>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
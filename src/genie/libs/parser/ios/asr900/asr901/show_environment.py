@@ -2,6 +2,9 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ==============================
 # Schema for 'show environment'
 # ==============================
@@ -54,9 +57,6 @@ class ShowEnvironmentSchema(MetaParser):
         }
     }
 
-# Python (this imports the Python re module for RegEx)
-import re
-
 # ==============================
 # Parser for 'show environment ASR901'
 # ==============================
@@ -120,31 +120,31 @@ class ShowEnvironment(ShowEnvironmentSchema):
         env_dic = {}
 
         #12AV  Supply: +11.970 V Normal
-        p1 = re.compile(r'^\s*(?P<ps>[0-9]*\.?[0-9]*.V)+\s*Supply: +(?P<volt>[+-]?([0-9]*[.])?[0-9]+)+\sV\s+(?P<status>.*$)')
+        p1 = regex_engine.compile(r'^\s*(?P<ps>[0-9]*\.?[0-9]*.V)+\s*Supply: +(?P<volt>[+-]?([0-9]*[.])?[0-9]+)+\sV\s+(?P<status>.*$)')
 
         #Fan 1 Operation: Normal, is running at 13   percent speed 
-        p2 = re.compile(r'Fan\s+(?P<fan>\d)+\sOperation:\s+(?P<status>.*), is running at\s+(?P<speed>\d*)')
+        p2 = regex_engine.compile(r'Fan\s+(?P<fan>\d)+\sOperation:\s+(?P<status>.*), is running at\s+(?P<speed>\d*)')
 
         #Fan 2 Operation: Failed
-        p3 = re.compile(r'Fan\s+(?P<fan>\d)+\sOperation:\s+(?P<status>Failed$)')
+        p3 = regex_engine.compile(r'Fan\s+(?P<fan>\d)+\sOperation:\s+(?P<status>Failed$)')
 
         #Board temperature,  temperature = 41 (C), Normal
-        p4 = re.compile(r'(?P<sensor>[a-zA-Z]*) temperature,  temperature = +(?P<temp>[0-9]*).*,(?P<status>.*$)')
+        p4 = regex_engine.compile(r'(?P<sensor>[a-zA-Z]*) temperature,  temperature = +(?P<temp>[0-9]*).*,(?P<status>.*$)')
 
         #Board Temperature: Normal
-        p5 = re.compile(r'Board Temperature: (?P<board_temperature>[a-zA-Z]*)$')
+        p5 = regex_engine.compile(r'Board Temperature: (?P<board_temperature>[a-zA-Z]*)$')
 
         #Board temperature, temperature warning: Enabled        
-        p6 = re.compile(r'^\s*(?P<sensor>[a-zA-Z]*) temperature, temperature warning: (?P<temperature_warning>[a-zA-Z]*)')
+        p6 = regex_engine.compile(r'^\s*(?P<sensor>[a-zA-Z]*) temperature, temperature warning: (?P<temperature_warning>[a-zA-Z]*)')
 
         #Threshold: 80 (high) -40 (low) DegC
-        p7 = re.compile(r'\s*Threshold:\s(?P<high_warning>[0-9]*)\s\(high\)\s(?P<low_warning>-[0-9]*)\s\(low\) DegC$')
+        p7 = regex_engine.compile(r'\s*Threshold:\s(?P<high_warning>[0-9]*)\s\(high\)\s(?P<low_warning>-[0-9]*)\s\(low\) DegC$')
 
         # 270  :  12AV Power supply      : "failed  " at 08:53:24 CDT Thu Apr 15 2021.
-        p8 = re.compile(r'^\s*(?P<SeqNum>[0-9]*)\s*:\s*(?P<event>[A-Za-z0-9\s]*)\s:\s\"(?P<state>[A-Za-z0-9\s]*)\" at (?P<time>[A-Za-z0-9\s\:]*)\.$')
+        p8 = regex_engine.compile(r'^\s*(?P<SeqNum>[0-9]*)\s*:\s*(?P<event>[A-Za-z0-9\s]*)\s:\s\"(?P<state>[A-Za-z0-9\s]*)\" at (?P<time>[A-Za-z0-9\s\:]*)\.$')
 
         # ALARM CONTACT 1 is not asserted
-        p9 = re.compile(r'^ALARM CONTACT (?P<alarm_contact>[0-9]) is (?P<alarm_assert_status>[A-Za-z\s]*)$')
+        p9 = regex_engine.compile(r'^ALARM CONTACT (?P<alarm_contact>[0-9]) is (?P<alarm_assert_status>[A-Za-z\s]*)$')
 
         sensor_warning = ""
         temp_warning_status = ""
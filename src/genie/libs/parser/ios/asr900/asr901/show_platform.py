@@ -5,9 +5,6 @@
     * show inventory
 
 """
-# python
-import re
-
 # genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -16,6 +13,9 @@ from genie.metaparser.util.schemaengine import Schema, \
 from genie.libs.parser.iosxe.show_platform import \
     ShowInventorySchema as ShowInventorySchema_iosxe
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowInventory(ShowInventorySchema_iosxe):
     """
@@ -35,13 +35,13 @@ class ShowInventory(ShowInventorySchema_iosxe):
         other_dir = {}
 
         # NAME: "GigabitEthernet 0/10", DESCR: "1000BASE-BX10D SFP"
-        p1 = re.compile(r'NAME\:\s*\"(?P<name>\S+\s+(?P<subslot>\d+\/\d+)?)\"\,\s*DESCR:\s*\"(?P<description>.+)\"')
+        p1 = regex_engine.compile(r'NAME\:\s*\"(?P<name>\S+\s+(?P<subslot>\d+\/\d+)?)\"\,\s*DESCR:\s*\"(?P<description>.+)\"')
 
         # NAME: "A901-12C-F-D Chassis", DESCR: "A901-12C-F-D Chassis"
-        p1_1 = re.compile(r'NAME\:\s*\"(?P<name>.+(?P<subslot>\d+\/\d+)?)\"\,\s*DESCR:\s*\"(?P<description>.+)\"')
+        p1_1 = regex_engine.compile(r'NAME\:\s*\"(?P<name>.+(?P<subslot>\d+\/\d+)?)\"\,\s*DESCR:\s*\"(?P<description>.+)\"')
 
         # PID: A901-12C-F-D      , VID: V01 , SN: CAT9991U99B
-        p2 = re.compile(r'PID:\s*(?P<pid>.+)\s*\,\s*VID:\s*(?P<vid>.*)\,\s*SN:\s*(?P<sn>.+)')
+        p2 = regex_engine.compile(r'PID:\s*(?P<pid>.+)\s*\,\s*VID:\s*(?P<vid>.*)\,\s*SN:\s*(?P<sn>.+)')
 
         for line in output.splitlines():
             line = line.strip()
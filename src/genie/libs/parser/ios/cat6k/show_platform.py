@@ -2,11 +2,13 @@
  cat6k implementation of show_platform.py
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowVersionSchema(MetaParser):
     """
@@ -89,122 +91,122 @@ class ShowVersion(ShowVersionSchema):
         version_dict = {}
 
         # IOS (tm) s72033_rp Software (s72033_rp-ADVENTERPRISEK9_WAN-M), Version 12.2(18)SXF7, RELEASE SOFTWARE (fc1)
-        p1 = re.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
-                        r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
-                        r' +(?P<version>\S+), +RELEASE SOFTWARE .*$')
+        p1 = regex_engine.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
+                                  r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
+                                  r' +(?P<version>\S+), +RELEASE SOFTWARE .*$')
         
         # Cisco IOS Software, s72033_rp Software (s72033_rp-ADVENTERPRISEK9_DBG-M), Version 15.4(0.10)S, EARLY DEPLOYMENT ENGINEERING WEEKLY BUILD, synced to  BLD_DARLING_122S_040709_1301
-        p1_1 = re.compile(r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware(.+)?\, '
-                        r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
-                        r'+Experimental)? +[Vv]ersion '
-                        r'+(?P<version>[a-zA-Z0-9\.\:\(\)]+) *,?.*')
+        p1_1 = regex_engine.compile(r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware(.+)?\, '
+                                  r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
+                                  r'+Experimental)? +[Vv]ersion '
+                                  r'+(?P<version>[a-zA-Z0-9\.\:\(\)]+) *,?.*')
 
         # Technical Support: http://www.cisco.com/techsupport
-        p2 = re.compile(r'^Technical +Support: +http\:\/\/www'
-                        r'\.cisco\.com\/techsupport')
+        p2 = regex_engine.compile(r'^Technical +Support: +http\:\/\/www'
+                                  r'\.cisco\.com\/techsupport')
 
         # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-        p3 = re.compile(r'^Copyright +(.*)$')
+        p3 = regex_engine.compile(r'^Copyright +(.*)$')
 
         # Compiled Thu 23-Nov-06 06:26 by kellythw
-        p4 = re.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
-                        r'+(?P<compiled_by>\S+)$')
+        p4 = regex_engine.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
+                                  r'+(?P<compiled_by>\S+)$')
 
         # Image text-base: 0x40101040, data-base: 0x42D98000
-        p5 = re.compile(r'^Image text-base: (?P<text_base>\S+), '
-                        r'data-base: (?P<data_base>\S+)$')
+        p5 = regex_engine.compile(r'^Image text-base: (?P<text_base>\S+), '
+                                  r'data-base: (?P<data_base>\S+)$')
 
         # ROM: System Bootstrap, Version 12.2(17r)S4, RELEASE SOFTWARE (fc1)
-        p6 = re.compile(r'^ROM: +(?P<rom>.+) +(?P<rom_version>[\S\s]+)$')
+        p6 = regex_engine.compile(r'^ROM: +(?P<rom>.+) +(?P<rom_version>[\S\s]+)$')
 
         # BOOTLDR: s72033_rp Software (s72033_rp-ADVENTERPRISEK9_WAN-M), Version 12.2(18)SXF7, RELEASE SOFTWARE (fc1)
-        p7 = re.compile(r'^BOOTLDR: +(?P<bootldr_version>[\S\s]+)$')
+        p7 = regex_engine.compile(r'^BOOTLDR: +(?P<bootldr_version>[\S\s]+)$')
 
         # cat6k_tb1 uptime is 21 weeks, 5 days, 41 minutes
-        p8 = re.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
+        p8 = regex_engine.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
 
         # Uptime for this control processor is 22 weeks, 6 days, 1 hour, 57 minutes
-        p8_2 = re.compile(r'^Uptime for this control processor is (?P<uptime>.+)$')
+        p8_2 = regex_engine.compile(r'^Uptime for this control processor is (?P<uptime>.+)$')
 
         # System returned to ROM by  power cycle at 21:57:23 UTC Sat Aug 28 2010 (SP by power on)
-        p9 = re.compile(r'^System +returned +to +ROM +by '
-                        r'+(?P<returned_to_rom_by>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^System +returned +to +ROM +by '
+                                  r'+(?P<returned_to_rom_by>[\S\s]+)$')
 
         # System image file is "disk0:s72033-adventerprisek9_wan-mz.122-18.SXF7"
-        p10 = re.compile(r'^System +image +file +is '
-                         r'+\"(?P<system_image>.+)\"')
+        p10 = regex_engine.compile(r'^System +image +file +is '
+                                   r'+\"(?P<system_image>.+)\"')
 
         # cisco WS-C6503-E (R7000) processor (revision 1.4) with 983008K/65536K bytes of memory.
-        p11 = re.compile(r'^cisco +(?P<chassis>[\S]+) +\((?P<processor_type>[\S]+)\)'
-                         r' +processor \(.+\) +with +(?P<main_mem>\d+).+ +bytes +of +memory.$')
+        p11 = regex_engine.compile(r'^cisco +(?P<chassis>[\S]+) +\((?P<processor_type>[\S]+)\)'
+                                   r' +processor \(.+\) +with +(?P<main_mem>\d+).+ +bytes +of +memory.$')
 
         # Processor board ID FXS1821Q2H9
-        p12 = re.compile(r'^Processor +board +ID +(?P<processor_board_id>.+)$')
+        p12 = regex_engine.compile(r'^Processor +board +ID +(?P<processor_board_id>.+)$')
 
         # SR71000 CPU at 600Mhz, Implementation 0x504, Rev 1.2, 512KB L2 Cache
-        p13 = re.compile(r'^(?P<name>\S+) +(CPU|cpu|Cpu) +at '
-                         r'+(?P<speed>\S+)\, Implementation (?P<implementation>\S+), '
-                         r'Rev (?P<rev>\S+), +(?P<l2_cache>\S+) +L2 +[Cc]ache$')
+        p13 = regex_engine.compile(r'^(?P<name>\S+) +(CPU|cpu|Cpu) +at '
+                                   r'+(?P<speed>\S+)\, Implementation (?P<implementation>\S+), '
+                                   r'Rev (?P<rev>\S+), +(?P<l2_cache>\S+) +L2 +[Cc]ache$')
 
         # Last reset from s/w reset
-        p14 = re.compile(r'^Last reset from (?P<reset>\S+) reset$')
+        p14 = regex_engine.compile(r'^Last reset from (?P<reset>\S+) reset$')
 
         # SuperLAT software (copyright 1990 by Meridian Technology Corp).
-        p15 = re.compile(r'^(?P<software>SuperLAT software .+)$')
+        p15 = regex_engine.compile(r'^(?P<software>SuperLAT software .+)$')
 
         # X.25 software, Version 3.0.0.
-        p16 = re.compile(r'^(?P<software>X.25 software.+)$')
+        p16 = regex_engine.compile(r'^(?P<software>X.25 software.+)$')
 
         # Bridging software.
-        p17 = re.compile(r'^(?P<software>Bridging software.)$')
+        p17 = regex_engine.compile(r'^(?P<software>Bridging software.)$')
 
         # TN3270 Emulation software.
-        p18 = re.compile(r'^(?P<software>TN3270 Emulation software.)$')
+        p18 = regex_engine.compile(r'^(?P<software>TN3270 Emulation software.)$')
 
         # 1 Virtual Ethernet/IEEE 802.3 interface
         # 1 Virtual Ethernet/IEEE 802.3 interface(s)
-        p19 = re.compile(r'^(?P<interface>\d+) +Virtual '
-                         r'+Ethernet/IEEE 802.3 +interface(s|\(s\))?$')
+        p19 = regex_engine.compile(r'^(?P<interface>\d+) +Virtual '
+                                   r'+Ethernet/IEEE 802.3 +interface(s|\(s\))?$')
 
         # 50 Gigabit Ethernet/IEEE 802.3 interfaces
         # 98 Gigabit Ethernet/IEEE 802.3 interface(s)
-        p20 = re.compile(r'^(?P<interface>\d+) +Gigabit '
-                         r'+Ethernet/IEEE 802.3 +interface(s|\(s\))?$')
+        p20 = regex_engine.compile(r'^(?P<interface>\d+) +Gigabit '
+                                   r'+Ethernet/IEEE 802.3 +interface(s|\(s\))?$')
 
         # 1917K bytes of non-volatile configuration memory.
-        p21 = re.compile(r'^(?P<memory>\d+)K'
-                         r' +bytes +of +non-volatile +configuration +memory.$')
+        p21 = regex_engine.compile(r'^(?P<memory>\d+)K'
+                                   r' +bytes +of +non-volatile +configuration +memory.$')
 
         # 8192K bytes of packet buffer memory.
-        p22 = re.compile(r'^(?P<memory>\d+)K'
-                         r' +bytes +of +packet +buffer +memory.$')
+        p22 = regex_engine.compile(r'^(?P<memory>\d+)K'
+                                   r' +bytes +of +packet +buffer +memory.$')
 
         # 65536K bytes of Flash internal SIMM (Sector size 512K).
-        p23 = re.compile(r'^(?P<memory>\d+)K bytes of Flash internal '
-                         r'SIMM \(Sector size (?P<size>\d+)K\).$')
+        p23 = regex_engine.compile(r'^(?P<memory>\d+)K bytes of Flash internal '
+                                   r'SIMM \(Sector size (?P<size>\d+)K\).$')
 
         # Configuration register is 0x102
-        p30 = re.compile(r'^Configuration +register +is '
-                         r'+(?P<curr_config_register>[\S]+)')
+        p30 = regex_engine.compile(r'^Configuration +register +is '
+                                   r'+(?P<curr_config_register>[\S]+)')
         
         # 1 Enhanced FlexWAN controller (4 Serial).
-        p31 = re.compile(r'^(?P<counts>\d+) (?P<type>[\S\s]+) '
-                         r'controller \((?P<serial>\d+) Serial\).$')
+        p31 = regex_engine.compile(r'^(?P<counts>\d+) (?P<type>[\S\s]+) '
+                                   r'controller \((?P<serial>\d+) Serial\).$')
         
         # 1 Virtual Ethernet interface
-        p31_1 = re.compile(r'^(?P<interface>\d+) Virtual Ethernet interface$')
+        p31_1 = regex_engine.compile(r'^(?P<interface>\d+) Virtual Ethernet interface$')
 
         # 52 Gigabit Ethernet interfaces
-        p31_2 = re.compile(r'^(?P<interface>\d+) Gigabit Ethernet interfaces$')
+        p31_2 = regex_engine.compile(r'^(?P<interface>\d+) Gigabit Ethernet interfaces$')
 
         # 4 Serial interfaces
-        p31_3 = re.compile(r'^(?P<interface>\d+) Serial interfaces$')
+        p31_3 = regex_engine.compile(r'^(?P<interface>\d+) Serial interfaces$')
 
         # Last reload type: Normal Reload
-        p32_1 = re.compile(r'^Last reload type: (?P<type>[\S\s]+)$')
+        p32_1 = regex_engine.compile(r'^Last reload type: (?P<type>[\S\s]+)$')
 
         # Last reload reason: abort at PC 0x433A11BC
-        p32_2 = re.compile(r'^Last reload reason: (?P<reason>[\S\s]+)$')
+        p32_2 = regex_engine.compile(r'^Last reload reason: (?P<reason>[\S\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -481,7 +483,7 @@ class Dir(DirSchema):
             line = line.rstrip()
 
             # dir
-            p1 = re.compile(
+            p1 = regex_engine.compile(
                 r'^\s*[Dd]irectory +of +(?P<dir>.+)$')
             m = p1.match(line)
             if m:
@@ -494,9 +496,9 @@ class Dir(DirSchema):
                 continue
 
             # filename, index, permissions, size and last_modified_date
-            p2 = re.compile(r'\s*(?P<index>\d+) +(?P<permissions>\S+) +(?P<size>\d+) '
-                            r'+(?P<last_modified_date>\S+ +\d+ +\d+ +\d+\:\d+\:\d+ +\S+) '
-                            r'+(?P<filename>.+)$')
+            p2 = regex_engine.compile(r'\s*(?P<index>\d+) +(?P<permissions>\S+) +(?P<size>\d+) '
+                                      r'+(?P<last_modified_date>\S+ +\d+ +\d+ +\d+\:\d+\:\d+ +\S+) '
+                                      r'+(?P<filename>.+)$')
             m = p2.match(line)
             if m:
                 filename = m.groupdict()['filename']
@@ -510,7 +512,7 @@ class Dir(DirSchema):
                 continue
 
             # bytes_total and bytes_free
-            p3 = re.compile(
+            p3 = regex_engine.compile(
                 r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)')
             m = p3.match(line)
             if m:
@@ -578,83 +580,83 @@ class ShowRedundancy(ShowRedundancySchema):
         redundancy_dict = {}
 
         # Available system uptime = 21 weeks, 5 days, 1 hour, 3 minutes
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'Available +system +uptime += +(?P<available_system_uptime>[\S\s]+)$')
 
         # Switchovers system experienced = 0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'Switchovers +system +experienced += +(?P<switchovers_system_experienced>\d+)$')
 
         # Standby failures = 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'Standby +failures += +(?P<standby_failures>\d+)$')
 
         # Last switchover reason = none
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Last +switchover +reason += +(?P<last_switchover_reason>[\S\s]+)$')
 
         # Hardware Mode = Simplex
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Hardware +Mode += +(?P<hw_mode>\S+)$')
 
         # Configured Redundancy Mode = sso
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'Configured +Redundancy +Mode += +(?P<conf_red_mode>\S+)$')
 
         # Operating Redundancy Mode = sso
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Operating +Redundancy +Mode += +(?P<oper_red_mode>\S+)$')
 
         # Maintenance Mode = Disabled
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Maintenance +Mode += +(?P<maint_mode>\S+)$')
 
         # Communications = Down      Reason: Simplex mode
         # Communications = Up
-        p9 = re.compile(r'^Communications += +(?P<communications>\S+)'
-                        r'(\s+Reason: +(?P<communications_reason>[\S\s]+))?$')
+        p9 = regex_engine.compile(r'^Communications += +(?P<communications>\S+)'
+                                  r'(\s+Reason: +(?P<communications_reason>[\S\s]+))?$')
 
         # Active Location = slot 1
         # Standby Location = slot 5
-        p10 = re.compile(r'^\S+ +Location += +(?P<slot>[\S ]+)$')
+        p10 = regex_engine.compile(r'^\S+ +Location += +(?P<slot>[\S ]+)$')
 
         # Current Software state = ACTIVE
-        p11 = re.compile(r'^Current +Software +state += +(?P<curr_sw_state>[\S ]+)$')
+        p11 = regex_engine.compile(r'^Current +Software +state += +(?P<curr_sw_state>[\S ]+)$')
 
         # Uptime in current state = 21 weeks, 5 days, 1 hour, 2 minutes
-        p12 = re.compile(r'^Uptime +in +current +state += '
-                         r'+(?P<uptime_in_curr_state>[\S\s]+)$')
+        p12 = regex_engine.compile(r'^Uptime +in +current +state += '
+                                   r'+(?P<uptime_in_curr_state>[\S\s]+)$')
 
         # Image Version = Cisco Internetwork Operating System Software
-        p13 = re.compile(r'^Image +Version += +(?P<image_ver>.+)$')
+        p13 = regex_engine.compile(r'^Image +Version += +(?P<image_ver>.+)$')
 
         # BOOT = bootflash:/ecr.bin;
-        p14 = re.compile(r'^BOOT += +(?P<boot>.+)$')
+        p14 = regex_engine.compile(r'^BOOT += +(?P<boot>.+)$')
 
         # Configuration register = 0x102
-        p15 = re.compile(r'^Configuration +register = (?P<config_register>\S+)$')
+        p15 = regex_engine.compile(r'^Configuration +register = (?P<config_register>\S+)$')
 
         # Compiled Thu 31-Oct-19 17:43 by makale
-        p16 = re.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
-                         r'+(?P<compiled_by>\S+)$')
+        p16 = regex_engine.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
+                                   r'+(?P<compiled_by>\S+)$')
 
         # IOS (tm) s72033_rp Software (s72033_rp-ADVENTERPRISEK9_WAN-M), Version 12.2(18)SXF7, RELEASE SOFTWARE (fc1)
-        p17 = re.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
-                        r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
-                        r' +(?P<version>\S+), +RELEASE SOFTWARE .*$')
+        p17 = regex_engine.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
+                                  r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
+                                  r' +(?P<version>\S+), +RELEASE SOFTWARE .*$')
 
         # Technical Support: http://www.cisco.com/techsupport
-        p18 = re.compile(r'^Technical +Support: +http\:\/\/www'
-                        r'\.cisco\.com\/techsupport')
+        p18 = regex_engine.compile(r'^Technical +Support: +http\:\/\/www'
+                                  r'\.cisco\.com\/techsupport')
 
         # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-        p19 = re.compile(r'^Copyright +(.*)$')
+        p19 = regex_engine.compile(r'^Copyright +(.*)$')
 
         # CONFIG_FILE =
-        p20 = re.compile(r'^CONFIG_FILE = +(?P<config_file>\S+)$')
+        p20 = regex_engine.compile(r'^CONFIG_FILE = +(?P<config_file>\S+)$')
 
         # BOOTLDR =
-        p21 = re.compile(r'^BOOTLDR = +(?P<bootldr>\S+)$')
+        p21 = regex_engine.compile(r'^BOOTLDR = +(?P<bootldr>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -847,12 +849,12 @@ class ShowInventory(ShowInventorySchema):
         index = 0
 
         # NAME: "HundredGigE1/0/48", DESCR: "QSFP 100GE SR"
-        p1 = re.compile(r'^NAME: +\"(?P<name>.*)\",'
-                         r' +DESCR: +\"(?P<descr>.*)\"$')
+        p1 = regex_engine.compile(r'^NAME: +\"(?P<name>.*)\",'
+                                   r' +DESCR: +\"(?P<descr>.*)\"$')
 
         # PID: QSFP-100G-SR4-S     , VID: V03  , SN: AVF2243S10A
-        p2 = re.compile(r'^PID: +(?P<pid>\S+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
-                         r' +SN:(?: +(?P<sn>(\S+)))?$')
+        p2 = regex_engine.compile(r'^PID: +(?P<pid>\S+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
+                                   r' +SN:(?: +(?P<sn>(\S+)))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -974,35 +976,35 @@ class ShowModule(ShowModuleSchema):
 
         # 1    2  Catalyst 6000 supervisor 2 (Active)    WS-X6K-S2U-MSFC2   SAD0628035C
         # 2    0  Supervisor-Other                       unknown            unknown        
-        r1 = re.compile(r'(?P<mod>\d)\s+(?P<ports>\d+)\s+(?P<card_type>.+'
-                         r'(S|s)upervisor.+)\s+(?P<model>\S+)\s+'
-                         r'(?P<serial_number>\S+)')
+        r1 = regex_engine.compile(r'(?P<mod>\d)\s+(?P<ports>\d+)\s+(?P<card_type>.+'
+                                   r'(S|s)upervisor.+)\s+(?P<model>\S+)\s+'
+                                   r'(?P<serial_number>\S+)')
 
         # 6    1  1 port 10-Gigabit Ethernet Module      WS-X6502-10GE      SAD062003CM
         # 3   16  Pure SFM-mode 16 port 1000mb GBIC      WS-X6816-GBIC      SAL061218K3
-        r2 = re.compile(r'(?P<mod>\d)\s+(?P<ports>\d+)\s+(?P<card_type>.+\d+\s+'
-                         r'port.+)\s{2,}(?P<model>\S+)\s+(?P<serial_number>\S+)')
+        r2 = regex_engine.compile(r'(?P<mod>\d)\s+(?P<ports>\d+)\s+(?P<card_type>.+\d+\s+'
+                                   r'port.+)\s{2,}(?P<model>\S+)\s+(?P<serial_number>\S+)')
 
         # 5    0  Switching Fabric Module-136 (Active)   WS-X6500-SFM2      SAD061701YC
-        r3 = re.compile(r'(?P<mod>\d)\s+(?P<ports>\d+)\s+(?P<card_type>.+)\s{2,}'
-                        r'(?P<model>\S+)\s+(?P<serial_number>\S+)')
+        r3 = regex_engine.compile(r'(?P<mod>\d)\s+(?P<ports>\d+)\s+(?P<card_type>.+)\s{2,}'
+                                  r'(?P<model>\S+)\s+(?P<serial_number>\S+)')
 
         # 1  0001.64ff.1958 to 0001.64ff.1959   3.9   6.1(3)       7.5(0.6)HUB9 Ok 
         # 3  0005.74ff.1b9d to 0005.74ff.1bac   1.3   12.1(5r)E1   12.1(13)E3,  Ok
         # 1  0001.64ff.1958 to 0001.64ff.1959   3.9   6.1(3)       7.5(0.6)HUB9 Ok    
-        r4 = re.compile(r'(?P<mod>\d+)\s+(?P<mac_from>\S+)\s+to\s+(?P<mac_to>\S+)'
-                         r'\s+(?P<hw>\S+)\s+(?P<fw>\S+)\s+(?P<sw>[\d\.\(\)\w]+)\,'
-                         r'*\s+(?P<status>(Ok|Unknown))')
+        r4 = regex_engine.compile(r'(?P<mod>\d+)\s+(?P<mac_from>\S+)\s+to\s+(?P<mac_to>\S+)'
+                                   r'\s+(?P<hw>\S+)\s+(?P<fw>\S+)\s+(?P<sw>[\d\.\(\)\w]+)\,'
+                                   r'*\s+(?P<status>(Ok|Unknown))')
 
         # 1 Policy Feature Card 2       WS-F6K-PFC2     SAD062802AV      3.2    Ok     
         # 1 Cat6k MSFC 2 daughterboard  WS-F6K-MSFC2    SAD062803TX      2.5    Ok   
         # 6 Distributed Forwarding Card WS-F6K-DFC      SAL06261R0A      2.3    Ok     
         # 6 10GBASE-LR Serial 1310nm lo WS-G6488        SAD062201BN      1.1    Ok
-        r5 = re.compile(r'(?P<mod>\d+)\s+(?P<sub_mod>.+)\s+(?P<model>\S+)\s+'
-                         r'(?P<serial>\S+)\s+(?P<hw>\S+)\s+(?P<status>(Ok|Unknown))')
+        r5 = regex_engine.compile(r'(?P<mod>\d+)\s+(?P<sub_mod>.+)\s+(?P<model>\S+)\s+'
+                                   r'(?P<serial>\S+)\s+(?P<hw>\S+)\s+(?P<status>(Ok|Unknown))')
 
         # 1  Pass
-        r6 = re.compile(r'(?P<mod>\d+) +(?P<online_diag_status>\S+)$')
+        r6 = regex_engine.compile(r'(?P<mod>\d+) +(?P<online_diag_status>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
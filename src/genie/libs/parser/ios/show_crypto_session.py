@@ -1,10 +1,12 @@
 # Python
-import re
 import json
 # Genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowCryptoSessionSchema(MetaParser):
     ''' Schema for show crypto session detail
@@ -78,58 +80,58 @@ class ShowCryptoSessionSuperParser(ShowCryptoSessionSchema):
     def cli(self,detail_arg='',output=None):
 
         #Interface: Tunnel13
-        p1=re.compile(r'Interface+\:+\s+(?P<interface_name>[\w\W]+)')
+        p1=regex_engine.compile(r'Interface+\:+\s+(?P<interface_name>[\w\W]+)')
 
         #Uptime: 5d23h
-        p2=re.compile(r'Uptime+\:+\s+(?P<up_time>\w+)')
+        p2=regex_engine.compile(r'Uptime+\:+\s+(?P<up_time>\w+)')
 
         #Username: cisco
-        p3=re.compile(r'Username+\:+\s+(?P<user_name>[\w\W]+)')
+        p3=regex_engine.compile(r'Username+\:+\s+(?P<user_name>[\w\W]+)')
 
         #Profile: prof
-        p4=re.compile(r'Profile+\:+\s+(?P<profile>[\w\W]+)')
+        p4=regex_engine.compile(r'Profile+\:+\s+(?P<profile>[\w\W]+)')
 
         #Group: easy
-        p5=re.compile(r'Group+\:+\s+(?P<group>[\w\W]+)')
+        p5=regex_engine.compile(r'Group+\:+\s+(?P<group>[\w\W]+)')
 
         #Assigned address: 10.3.3.4
-        p6=re.compile(r'Assigned+\s+address+\:+\s+(?P<assigned_address>[\w\.]+)')
+        p6=regex_engine.compile(r'Assigned+\s+address+\:+\s+(?P<assigned_address>[\w\.]+)')
 
         #Session status: UP-ACTIVE
-        p7=re.compile(r'Session status+\:+\s+(?P<session_status>[\w-]+)')
+        p7=regex_engine.compile(r'Session status+\:+\s+(?P<session_status>[\w-]+)')
 
         #Peer: 11.0.1.2 port 500 fvrf: (none) ivrf: (none)
-        p8=re.compile(r'Peer+\:+\s+(?P<peer>[\d\.]+)+\s+port+\s+(?P<port>\d+)+\s+fvrf+\:+\s+\(*(?P<fvrf>\w+)+\)*\s+ivrf+\:+\s+\(*(?P<ivrf>\w+)+\)*')
+        p8=regex_engine.compile(r'Peer+\:+\s+(?P<peer>[\d\.]+)+\s+port+\s+(?P<port>\d+)+\s+fvrf+\:+\s+\(*(?P<fvrf>\w+)+\)*\s+ivrf+\:+\s+\(*(?P<ivrf>\w+)+\)*')
         
         #Peer: 11.0.1.2 port 500
-        p9=re.compile(r'Peer+\:+\s+(?P<peer>[\d\.]+)+\s+port+\s+(?P<port>\d+)')
+        p9=regex_engine.compile(r'Peer+\:+\s+(?P<peer>[\d\.]+)+\s+port+\s+(?P<port>\d+)')
         
         # Phase1_id: 11.0.1.2
-        p10=re.compile(r'\s*Phase1+\_+id+\:+\s+(?P<phase_id>[\d\.]+)')
+        p10=regex_engine.compile(r'\s*Phase1+\_+id+\:+\s+(?P<phase_id>[\d\.]+)')
 
         # Desc: (none)
-        p11=re.compile(r'\s*Desc+\:+\s+\(*(?P<desc>[\w\s]+)+\)*')
+        p11=regex_engine.compile(r'\s*Desc+\:+\s+\(*(?P<desc>[\w\s]+)+\)*')
 
         # Session ID: 0  
-        p12=re.compile(r'\s*Session+\s+ID+\:+\s+(?P<session_id>\d+)')
+        p12=regex_engine.compile(r'\s*Session+\s+ID+\:+\s+(?P<session_id>\d+)')
 
         #IKEv1 SA: local 11.0.1.1/500 remote 11.0.1.2/500 Active 
-        p13=re.compile(r'\s*IKE+(v1)*\s+SA+\:+\s+local+\s+(?P<local>[\d\.]+)+\/+(?P<local_port>\d+)+\s+remote+\s+(?P<remote>[\d\.]+)+\/+(?P<remote_port>\d+)+\s+(?P<conn_status>\w+)')
+        p13=regex_engine.compile(r'\s*IKE+(v1)*\s+SA+\:+\s+local+\s+(?P<local>[\d\.]+)+\/+(?P<local_port>\d+)+\s+remote+\s+(?P<remote>[\d\.]+)+\/+(?P<remote_port>\d+)+\s+(?P<conn_status>\w+)')
 
         #  Capabilities:(none) connid:1025 lifetime:03:04:13
-        p14=re.compile(r'\s*Capabilities+\:+\(*(?P<capabilities>\w+)+\)*\s+connid+\:+(?P<conn_id>\d+)+\s+lifetime+\:+(?P<lifetime>[\d\:]+)')
+        p14=regex_engine.compile(r'\s*Capabilities+\:+\(*(?P<capabilities>\w+)+\)*\s+connid+\:+(?P<conn_id>\d+)+\s+lifetime+\:+(?P<lifetime>[\d\:]+)')
 
         # IPSEC FLOW: permit 47 host 11.0.1.1 host 11.0.1.2 
-        p15=re.compile(r'\s*IPSEC+\s+FLOW+\:+\s+(?P<ipsec_flow>[\w\W]+)')
+        p15=regex_engine.compile(r'\s*IPSEC+\s+FLOW+\:+\s+(?P<ipsec_flow>[\w\W]+)')
 
         #Active SAs: 2, origin: crypto map
-        p16=re.compile(r'\s*Active+\s+SAs+\:+\s+(?P<active_sa>\d+)+\,+\s+origin+\:+\s+(?P<origin>[\w\s]+)')
+        p16=regex_engine.compile(r'\s*Active+\s+SAs+\:+\s+(?P<active_sa>\d+)+\,+\s+origin+\:+\s+(?P<origin>[\w\s]+)')
 
         #Inbound:  #pkts dec'ed 4172534851 drop 0 life (KB/Sec) KB Vol Rekey Disabled/2576
-        p17=re.compile(r'\s*Inbound+\:+\s+\#+pkts+\s+dec+\'+ed+\s+(?P<inbound_pkts_dec>\d+)+\s+drop+\s+(?P<inbound_drop>\d+)+\s+life+\s+\(+KB+\/+Sec+\)+\s+(?P<inbound_life_kb>[\w\s]+)+\/+(?P<inbound_life_secs>\w+)')
+        p17=regex_engine.compile(r'\s*Inbound+\:+\s+\#+pkts+\s+dec+\'+ed+\s+(?P<inbound_pkts_dec>\d+)+\s+drop+\s+(?P<inbound_drop>\d+)+\s+life+\s+\(+KB+\/+Sec+\)+\s+(?P<inbound_life_kb>[\w\s]+)+\/+(?P<inbound_life_secs>\w+)')
 
         #Outbound: #pkts enc'ed 4146702954 drop 0 life (KB/Sec) KB Vol Rekey Disabled/2576
-        p18=re.compile(r'\s*Outbound+\:+\s+\#+pkts+\s+enc+\'+ed+\s+(?P<outbound_pkts_enc>\d+)+\s+drop+\s+(?P<outbound_drop>\d+)+\s+life+\s+\(+KB+\/+Sec+\)+\s+(?P<outbound_life_kb>[\w\s]+)+\/+(?P<outbound_life_secs>\w+)')
+        p18=regex_engine.compile(r'\s*Outbound+\:+\s+\#+pkts+\s+enc+\'+ed+\s+(?P<outbound_pkts_enc>\d+)+\s+drop+\s+(?P<outbound_drop>\d+)+\s+life+\s+\(+KB+\/+Sec+\)+\s+(?P<outbound_life_kb>[\w\s]+)+\/+(?P<outbound_life_secs>\w+)')
 
         
         parsed_dict={}
@@ -4,11 +4,13 @@ Parser for following commands:
     * show key chain
 '''
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowKeyChainSchema(MetaParser):
     '''
@@ -47,10 +49,10 @@ class ShowKeyChain(ShowKeyChainSchema):
             output = self.device.execute(self.cli_command)
 
         # Key-chain hello:
-        p1 = re.compile(r'^Key\-chain\s+(?P<name>[A-Za-z0-9\-_]+):$')
+        p1 = regex_engine.compile(r'^Key\-chain\s+(?P<name>[A-Za-z0-9\-_]+):$')
 
         # key 1 -- text "cisco123"
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^key\s+(?P<id>\d+)\s+\-\-\s+text\s+'
             r'\"(?P<key_string>\S+)\"$'
         )
@@ -59,7 +61,7 @@ class ShowKeyChain(ShowKeyChainSchema):
         # accept lifetime (always valid) - (always valid) [valid now]
         # accept lifetime (always valid) - (always valid) [valid now]
         # accept lifetime (10:10:10 UTC Jan 1 2002) - (06:01:00 UTC Jan 1 2010)
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^accept\s+lifetime\s+\((?P<start>[A-Za-z0-9:\s\+\-_]+)\)\s+\-\s+'
             r'\((?P<end>[A-Za-z0-9:\s\+\-_]+)\)'
             r'(\s+\[(?P<is_valid>[A-Za-z0-9\s\-_]+)\])?$'
@@ -68,7 +70,7 @@ class ShowKeyChain(ShowKeyChainSchema):
         # send lifetime (11:11:11 UTC Mar 1 2001) - (infinite) [valid now]
         # send lifetime (10:10:10 UTC Jan 1 2002) - (06:01:00 UTC Jan 1 2010)
         # send lifetime (always valid) - (always valid) [valid now]
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^send\s+lifetime\s+\((?P<start>[A-Za-z0-9:\s\+\-_]+)\)\s+\-\s+'
             r'\((?P<end>[A-Za-z0-9:\s\+\-_]+)\)'
             r'(\s+\[(?P<is_valid>[A-Za-z0-9\s\-_]+)\])?$'
@@ -8,9 +8,6 @@ IOS parsers for the following show commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
@@ -19,6 +16,9 @@ from genie.libs.parser.iosxe.show_ntp import ShowNtpAssociationsDetail as ShowNt
                                              ShowNtpStatus as ShowNtpStatus_iosxe,\
                                              ShowNtpConfig as ShowNtpConfig_iosxe
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ==============================================
 #  Schema for show ntp associations
 # ==============================================
@@ -96,18 +96,18 @@ class ShowNtpAssociations(ShowNtpAssociationsSchema):
         # *~127.127.1.1     .LOCL.           0      6     16   377  0.000   0.000  1.204
         #  ~10.4.1.1        .INIT.          16      -   1024     0  0.000   0.000 15937.
         # +~10.16.2.2       127.127.1.1      8    137     64     1 15.917 556.786 7938.0
-        p1 = re.compile(r'^(?P<mode_code>[x\*\#\+\- ])?(?P<configured>[\~])? *(?P<remote>[\w\.\:]+) +'
-                        r'(?P<refid>[\w\.]+) +(?P<stratum>\d+) +'
-                        r'(?P<receive_time>[\d\-]+) +(?P<poll>\d+) +'
-                        r'(?P<reach>\d+) +(?P<delay>[\d\.]+) +'
-                        r'(?P<offset>[\d\.\-]+) +(?P<disp>[\d\.\-]+)$')
+        p1 = regex_engine.compile(r'^(?P<mode_code>[x\*\#\+\- ])?(?P<configured>[\~])? *(?P<remote>[\w\.\:]+) +'
+                                  r'(?P<refid>[\w\.]+) +(?P<stratum>\d+) +'
+                                  r'(?P<receive_time>[\d\-]+) +(?P<poll>\d+) +'
+                                  r'(?P<reach>\d+) +(?P<delay>[\d\.]+) +'
+                                  r'(?P<offset>[\d\.\-]+) +(?P<disp>[\d\.\-]+)$')
 
         # * sys.peer, # selected, + candidate, - outlyer, x falseticker, ~ configured
-        p2 = re.compile(r'^\* sys.peer, +\# selected, +\+ candidate, +- outlyer, '
+        p2 = regex_engine.compile(r'^\* sys.peer, +\# selected, +\+ candidate, +- outlyer, '
             r'+x falseticker, +~ configured$')
 
         # * master (synced), # master (unsynced), + selected, - candidate, ~ configured
-        p3 = re.compile(r'^\* master +\(synced\), +\# master \(unsynced\), +\+ '
+        p3 = regex_engine.compile(r'^\* master +\(synced\), +\# master \(unsynced\), +\+ '
             r'selected, +\- candidate, +~ configured$')
 
         for line in out.splitlines():
@@ -15,9 +15,6 @@
     * show processes cpu | include <WORD>
 
 """
-# python
-import re
-
 # genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -59,6 +56,9 @@ from genie.libs.parser.iosxe.show_platform_software import \
     ShowPlatformSoftwareStatusControl as ShowPlatformSoftwareStatusControl_iosxe, \
     ShowPlatformSoftwareSlotActiveMonitorMem as ShowPlatformSoftwareSlotActiveMonitorMem_iosxe
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowVersion(ShowVersion_iosxe):
     """Parser for show version
@@ -127,67 +127,67 @@ class ShowInventory(ShowInventorySchema_iosxe):
 
         # NAME: "CLK-7600 1", DESCR: "OSR-7600 Clock FRU 1"
         # NAME: "WS-C6504-E", DESCR: "Cisco Systems Cisco 6500 4-slot Chassis System"
-        r1 = re.compile(r'NAME\:\s*\"(?P<name>.+)\"\,\s*DESCR:\s*\"(?P<description>.+)\"')
+        r1 = regex_engine.compile(r'NAME\:\s*\"(?P<name>.+)\"\,\s*DESCR:\s*\"(?P<description>.+)\"')
 
         # CISCO3945-CHASSIS
         # Cisco Systems Cisco 6500 4-slot Chassis
         # IOSv chassis, Hw Serial#: 9K66Z7TOKAACDEQA24N7S, Hw Revision: 1.0
         # NAME: "Switch System", DESCR: "Cisco Systems, Inc. WS-C4948 1 slot switch "
-        r1_0 = re.compile(r'.*(?:CHASSIS|Chassis|chassis|WS-C\S+ +\d+ +slot +switch)')
+        r1_0 = regex_engine.compile(r'.*(?:CHASSIS|Chassis|chassis|WS-C\S+ +\d+ +slot +switch)')
 
         # 1
         # 2
         # 3
-        r1_1 = re.compile(r'(?P<slot>\d+)')
+        r1_1 = regex_engine.compile(r'(?P<slot>\d+)')
 
         # NAME: "Linecard(slot 1)"
-        r1_1_1 = re.compile(r'\S+\(slot +(?P<slot>\d+)\).*$')
+        r1_1_1 = regex_engine.compile(r'\S+\(slot +(?P<slot>\d+)\).*$')
 
         # Cisco Services Performance Engine 123 for Cisco 1234 ISR on Slot 0
-        r1_1_2 = re.compile(r'.* +on Slot +(?P<slot>\d+)$')
+        r1_1_2 = regex_engine.compile(r'.* +on Slot +(?P<slot>\d+)$')
 
         # msfc sub-module of 1
         # VS-F6K-PFC4 Policy Feature Card 4 EARL sub-module of 1
-        r1_2 = re.compile(r'.*module of (?P<slot>\d+).*')
+        r1_2 = regex_engine.compile(r'.*module of (?P<slot>\d+).*')
 
         # Switch 1 - Power Supply 1
-        r1_2_2 = re.compile(r'Switch +(?P<subslot>\d+).*')
+        r1_2_2 = regex_engine.compile(r'Switch +(?P<subslot>\d+).*')
 
         # Transceiver Te2/1
         # Transceiver Te2/15
         # Transceiver Te5/1
-        r1_3 = re.compile(r'Transceiver\s+Te(?P<slot>\d+)\/(?P<subslot>\d+)')
+        r1_3 = regex_engine.compile(r'Transceiver\s+Te(?P<slot>\d+)\/(?P<subslot>\d+)')
 
         # TenGigabitEthernet2 / 1 / 1
         # GigabitEthernet3 / 0 / 50
-        r1_3_2 = re.compile(r'(?:Ten)?GigabitEthernet(?P<subslot>[\d\s\/]+)$')
+        r1_3_2 = regex_engine.compile(r'(?:Ten)?GigabitEthernet(?P<subslot>[\d\s\/]+)$')
 
         # Enhanced High Speed WAN Interface Card-1 Port Gigabit Ethernet SFP/Cu on Slot 0 SubSlot 2
         # Two-Port Fast Ethernet High Speed WAN Interface Card on Slot 0 SubSlot 3
-        r1_3_3 = re.compile(r'.* +on Slot +(?P<slot>\d+) +SubSlot +(?P<subslot>\d+)$')
+        r1_3_3 = regex_engine.compile(r'.* +on Slot +(?P<slot>\d+) +SubSlot +(?P<subslot>\d+)$')
 
         # VS-SUP2T-10G 5 ports Supervisor Engine 2T 10GE w/ CTS Rev. 1.5
         # WS-SUP720-3BXL 2 ports Supervisor Engine 720 Rev. 5.6
-        r1_4 = re.compile(r'.*ports\s+Supervisor\s+Engine.*')
+        r1_4 = regex_engine.compile(r'.*ports\s+Supervisor\s+Engine.*')
 
         # WS-C3750X-48T-S
-        r1_4_2 = re.compile(r'WS-C.*')
+        r1_4_2 = regex_engine.compile(r'WS-C.*')
 
         # WS-X6824-SFP CEF720 24 port 1000mb SFP Rev. 1.0
         # WS-X6748-GE-TX CEF720 48 port 10/100/1000mb Ethernet Rev. 3.4
         # SM-ES2-16-P
-        r1_5 = re.compile(r'.*WS\-X.*|SM\-ES.*')
+        r1_5 = regex_engine.compile(r'.*WS\-X.*|SM\-ES.*')
 
         # NM-1T3/E3=
         # CISCO3845-MB
-        r1_5_2 = re.compile(r'NM\-.*|CISCO.*\-MB')
+        r1_5_2 = regex_engine.compile(r'NM\-.*|CISCO.*\-MB')
 
         # NAME: "IOSv"
-        r1_6 = re.compile(r'.*IOSv.*')
+        r1_6 = regex_engine.compile(r'.*IOSv.*')
 
         # PID: WS-C6504-E        ,                     VID: V01, SN: FXS1712Q1R8
         # PID: CLK-7600          ,                     VID:    , SN: FXS170802GL
-        r2 = re.compile(r'PID:\s*(?P<pid>.+)\s*\,\s*VID:\s*(?P<vid>.*)\,\s*SN:\s*(?P<sn>.+)')
+        r2 = regex_engine.compile(r'PID:\s*(?P<pid>.+)\s*\,\s*VID:\s*(?P<vid>.*)\,\s*SN:\s*(?P<sn>.+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1,7 +1,6 @@
 """ASR1K implementation of show_platform.py
 
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -12,6 +11,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowEnvironmentAllSchema(MetaParser):
     """Schema for show environment all
@@ -51,10 +53,10 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
         sensor_list = None
 
         # initial regexp pattern
-        p1 = re.compile(r'^Sensor +List: +(?P<sensor_list>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^Sensor +List: +(?P<sensor_list>[\w\s]+)$')
 
-        p2 = re.compile(r'^(?P<sensor_name>([\w\d\:]+( [\w]+( [\w]+)?)?)) +(?P<location>[\w\d]+)'
-                         r' +(?P<state>([\w]+ [\w]+ [\d%]+)|([\w]+)) +(?P<reading>[\w\d\s]+)$')
+        p2 = regex_engine.compile(r'^(?P<sensor_name>([\w\d\:]+( [\w]+( [\w]+)?)?)) +(?P<location>[\w\d]+)'
+                                   r' +(?P<state>([\w]+ [\w]+ [\d%]+)|([\w]+)) +(?P<reading>[\w\d\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -117,10 +119,10 @@ class ShowEnvironmentAllIncludeLocation(ShowEnvironmentAllIncludeLocationSchema)
         sensor_list = None
 
         # initial regexp pattern
-        p1 = re.compile(r'^Sensor +List: +(?P<sensor_list>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^Sensor +List: +(?P<sensor_list>[\w\s]+)$')
 
-        p2 = re.compile(r'^(?P<sensor_name>([\w\d\:]+( [\w]+( [\w]+)?)?)) +(?P<location>[\w\d]+)'
-                         r' +(?P<state>([\w]+ [\w]+ [\d%]+)|([\w]+)) +(?P<reading>[\w\d\s]+)$')
+        p2 = regex_engine.compile(r'^(?P<sensor_name>([\w\d\:]+( [\w]+( [\w]+)?)?)) +(?P<location>[\w\d]+)'
+                                   r' +(?P<state>([\w]+ [\w]+ [\d%]+)|([\w]+)) +(?P<reading>[\w\d\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -174,7 +176,7 @@ class ShowHwProgrammableAll(ShowHwProgrammableAllSchema):
         platform_dict = {}
 
         #R0                14111801                  18102401       
-        p1 = re.compile(r'^(?P<slot>\w+) +(?P<cpld_version>\d+|N\/A) +(?P<fpga_version>[\w\.\(\)\/]+)$')
+        p1 = regex_engine.compile(r'^(?P<slot>\w+) +(?P<cpld_version>\d+|N\/A) +(?P<fpga_version>[\w\.\(\)\/]+)$')
 
         for line in output.splitlines():
             line = line.strip()
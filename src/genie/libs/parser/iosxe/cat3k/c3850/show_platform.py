@@ -1,7 +1,6 @@
 """c3850 implementation of show_platform.py
 
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -12,6 +11,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowEnvironmentAllSchema(MetaParser):
     """Schema for show environment all"""
@@ -75,29 +77,29 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Switch +(?P<switch>\d+) +FAN +(?P<fan>\d+) +is +(?P<state>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^Switch +(?P<switch>\d+) +FAN +(?P<fan>\d+) +is +(?P<state>[\w\s]+)$')
 
         # Switch 1 FAN 1 direction is Front to Back
-        p1_1 = re.compile(r'^Switch +(?P<switch>\d+) +FAN +(?P<fan>\d+) '
-                           r'+direction +is +(?P<direction>[\w\s]+)$')
+        p1_1 = regex_engine.compile(r'^Switch +(?P<switch>\d+) +FAN +(?P<fan>\d+) '
+                                     r'+direction +is +(?P<direction>[\w\s]+)$')
 
-        p2 = re.compile(r'^FAN +PS\-(?P<ps>\d+) +is +(?P<state>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^FAN +PS\-(?P<ps>\d+) +is +(?P<state>[\w\s]+)$')
 
-        p3 = re.compile(r'^Switch +(?P<switch>\d+): +SYSTEM +TEMPERATURE +is +(?P<state>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^Switch +(?P<switch>\d+): +SYSTEM +TEMPERATURE +is +(?P<state>[\w\s]+)$')
 
-        p4 = re.compile(r'^(?P<type>\w+) +Temperature +Value: +(?P<temperature>\d+) +Degree +Celsius$')
+        p4 = regex_engine.compile(r'^(?P<type>\w+) +Temperature +Value: +(?P<temperature>\d+) +Degree +Celsius$')
 
-        p5 = re.compile(r'^Temperature +State: +(?P<state>\w+)$')
+        p5 = regex_engine.compile(r'^Temperature +State: +(?P<state>\w+)$')
 
-        p6 = re.compile(r'^(?P<color>\w+) +Threshold *: +(?P<temperature>\d+) +Degree +Celsius$')
+        p6 = regex_engine.compile(r'^(?P<color>\w+) +Threshold *: +(?P<temperature>\d+) +Degree +Celsius$')
 
-        p7 = re.compile(r'^(?P<sw>\d+)(?P<ps>\w+) *'
-                         r'((?P<pid>[\w\-]+) +'
-                         r'(?P<serial_number>\w+) +)?'
-                         r'(?P<status>(\w+|Not Present)) *'
-                         r'((?P<system_power>\w+) +'
-                         r'(?P<poe_power>[\w\/]+) +'
-                         r'(?P<watts>\w+))?$')
+        p7 = regex_engine.compile(r'^(?P<sw>\d+)(?P<ps>\w+) *'
+                                   r'((?P<pid>[\w\-]+) +'
+                                   r'(?P<serial_number>\w+) +)?'
+                                   r'(?P<status>(\w+|Not Present)) *'
+                                   r'((?P<system_power>\w+) +'
+                                   r'(?P<poe_power>[\w\/]+) +'
+                                   r'(?P<watts>\w+))?$')
 
         for line in out.splitlines():
             line = line.strip()
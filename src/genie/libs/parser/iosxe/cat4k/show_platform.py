@@ -1,11 +1,13 @@
 """cat4k implementation of show_platform.py
 
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowModuleSchema(MetaParser):
     """Schema for show module"""
@@ -48,26 +50,26 @@ class ShowModule(ShowModuleSchema):
 
         ret_dict = {}
         # Chassis Type : WS-C4507R+E
-        p1 = re.compile(r'^Chassis Type +: +(?P<chassis_type>.+)$')
+        p1 = regex_engine.compile(r'^Chassis Type +: +(?P<chassis_type>.+)$')
 
         # Power consumed by backplane : 40 Watts
-        p2 = re.compile(r'^Power consumed by backplane +: +(?P<power_consumed>.+)$')
+        p2 = regex_engine.compile(r'^Power consumed by backplane +: +(?P<power_consumed>.+)$')
 
         # 1    48  10/100/1000BaseT Premium POE E Series  WS-X4648-RJ45V+E   ABCDE123456
         # 3     6  Sup 7L-E 10GE (SFP+), 1000BaseX (SFP)  WS-X45-SUP7L-E     QWERT987654
-        p3 = re.compile(r'^(?P<mod>\d+) +(?P<port>\d+) +(?P<card_type>[\S\s]+) +(?P<model>\S+) +(?P<serial_number>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<mod>\d+) +(?P<port>\d+) +(?P<card_type>[\S\s]+) +(?P<model>\S+) +(?P<serial_number>\S+)$')
 
         # 3 555a.88ff.584c to 555a.88ff.5859 3.0 15.0(1r)SG10 03.06.07.E       Ok
-        p4 = re.compile(r'^(?P<mod>\d+) +(?P<mac_address_from>[\w\.]+) +to +(?P<mac_address_to>[\w\.]+) +(?P<hw_ver>[\w\.\(\)]+) +(?P<fw_ver>[\w\.\(\)]+) +(?P<sw_ver>[\w\.\(\)]+) +(?P<status>\w+)$')
+        p4 = regex_engine.compile(r'^(?P<mod>\d+) +(?P<mac_address_from>[\w\.]+) +to +(?P<mac_address_to>[\w\.]+) +(?P<hw_ver>[\w\.\(\)]+) +(?P<fw_ver>[\w\.\(\)]+) +(?P<sw_ver>[\w\.\(\)]+) +(?P<status>\w+)$')
 
         # 1 11a1.b2ff.ee55 to 11a1.b2ff.ee61 3.1                               Ok
-        p4_1 = re.compile(r'^(?P<mod>\d+) +(?P<mac_address_from>[\w\.]+) +to +(?P<mac_address_to>[\w\.]+) +(?P<hw_ver>[\w\.\(\)]+) +(?P<status>\w+)$')
+        p4_1 = regex_engine.compile(r'^(?P<mod>\d+) +(?P<mac_address_from>[\w\.]+) +to +(?P<mac_address_to>[\w\.]+) +(?P<hw_ver>[\w\.\(\)]+) +(?P<status>\w+)$')
 
         # 3   Active Supervisor   RPR                 Active
-        p5 = re.compile(r'^(?P<mod>\d+) +(?P<redundancy_role>[\S\s]+) +(?P<operating_mode>\S+) +(?P<redundancy_status>\S+)$')
+        p5 = regex_engine.compile(r'^(?P<mod>\d+) +(?P<redundancy_role>[\S\s]+) +(?P<operating_mode>\S+) +(?P<redundancy_status>\S+)$')
 
         # Power Supply:   bad/off (see 'show power')
-        p6 = re.compile(r'^Power Supply: +(?P<power_supply>.+)$')
+        p6 = regex_engine.compile(r'^Power Supply: +(?P<power_supply>.+)$')
 
 
         for line in out.splitlines():
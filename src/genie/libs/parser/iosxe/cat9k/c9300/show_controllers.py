@@ -2,13 +2,13 @@
 IOSXE C9300 parsers for the following show commands:
     * show controllers ethernet-controller {interface} phy detail
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowControllersEthernetControllersPhyDetailSchema(MetaParser):
 
@@ -49,11 +49,11 @@ class ShowControllersEthernetControllersPhyDetail(ShowControllersEthernetControl
         # Regex patterns
         # --------------------------------------------------------------
         # Gi1/0/1 (if_id: 75)
-        int_reg = re.compile(r'(?P<interface>[a-zA-Z]+\d+(?:\/\d+)+)\s\(if_id\:\s(?P<if_id>\d+)\)')
+        int_reg = regex_engine.compile(r'(?P<interface>[a-zA-Z]+\d+(?:\/\d+)+)\s\(if_id\:\s(?P<if_id>\d+)\)')
 
         #  0000 : 1140                  Control Register :  0001 0001 0100 0000
         #  0001 : 796d                    Control STATUS :  0111 1001 0110 1101
-        registers_reg = re.compile(
+        registers_reg = regex_engine.compile(
             r'(?P<register_number>\S{4})\s\:\s(?P<hex_bit_value>\S{4})\s+(?P<register_name>.*)\s\:\s+(?P<bits>.*)')
 
         # --------------------------------------------------------------
@@ -108,7 +108,7 @@ class ShowControllersEthernetControllerPortAsicStatisticsExceptionsSwitchAsicInR
               #output = self.device.execute(self.cli_command).format(switch_num=switch_num,asic_val=asic_val)
               output = self.device.execute(cmd)
               # RPF_UNICAST_FAIL                                                   6445519
-              p1 = re.compile(r"^(?P<rpf>\S+)\s+(?P<value>\d+)$")
+              p1 = regex_engine.compile(r"^(?P<rpf>\S+)\s+(?P<value>\d+)$")
 
               ret_dict = {}
 
@@ -4,11 +4,13 @@ IOSXE C9300 parsers for the following show commands:
 """
 
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ============================
 #  Schema for 'show idprom interface <interface>'
 # ============================
@@ -66,105 +68,105 @@ class ShowIdpromInterface(ShowIdpromInterfaceSchema):
         ret_dict = {}
 
         # General SFP Information
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^General SFP Information$')
 
         # Vendor Name           :   CISCO-EXCELIGHT
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r'^Vendor +Name\s+:\s+(?P<vendor_name>.*)$')
 
         # Vendor Part Number    :   SPP5101SR-C1 
-        p1_2 = re.compile(
+        p1_2 = regex_engine.compile(
             r'^Vendor +Part +Number\s+:\s+(?P<part_number>.*)$')
 
         # Vendor Revision       :   0x41 0x20 0x20 0x20
-        p1_3 = re.compile(
+        p1_3 = regex_engine.compile(
             r'^Vendor +Revision\s+\:\s+(?P<vendor_revision>[0-9a-fA-Fx ]+)$')
 
         # Vendor Serial Number  :   ECL1249000S 
-        p1_4 = re.compile(
+        p1_4 = regex_engine.compile(
             r'^Vendor +Serial +Number\s+:\s+(?P<serial_number>.*)$')
 
         # Identifier            :   SFP/SFP+
-        p1_5 = re.compile(
+        p1_5 = regex_engine.compile(
             r'^Identifier\s+:\s+(?P<product_identifier>.*)$')
 
         # Connector             :   LC connector
-        p1_6 = re.compile(
+        p1_6 = regex_engine.compile(
             r'^Connector\s+:\s+(?P<connector_type>[\w\s]+)$')
         
         # Extended ID Fields
-        p2 = re.compile(r'^Extended ID Fields$')
+        p2 = regex_engine.compile(r'^Extended ID Fields$')
 
         # Options               :   0x00 0x1A
-        p2_0 = re.compile(
+        p2_0 = regex_engine.compile(
             r'^Options\s+:\s+(?P<options>[\w\s]+)$')
         
         # BR, max               :   0x00
-        p2_1 = re.compile(
+        p2_1 = regex_engine.compile(
             r'^BR, max\s+:\s+(?P<br_max>[\w\s]+)$')
         
         # BR, min               :   0x00
-        p2_2 = re.compile(
+        p2_2 = regex_engine.compile(
             r'^BR, min\s+:\s+(?P<br_min>[\w\s]+)$')
         
         # Date code             :   161031
-        p2_3 = re.compile(
+        p2_3 = regex_engine.compile(
             r'^Date code\s+:\s+(?P<date_code>\d+)$')
         
         # Diag monitoring       :   Implemented
-        p2_4 = re.compile(
+        p2_4 = regex_engine.compile(
             r'^Diag monitoring\s+:\s+(?P<diag_monitoring>[\w\s]+)$')
         
         # Internally calibrated :   Yes
-        p2_5 = re.compile(
+        p2_5 = regex_engine.compile(
             r'^Internally calibrated\s+:\s+(?P<internally_calibrated>\w+)$')
         
         # Exeternally calibrated:   No
-        p2_6 = re.compile(
+        p2_6 = regex_engine.compile(
             r'^Exeternally calibrated\s*:\s+(?P<exeternally_calibrated>\w+)$')
         
         # Rx.Power measurement  :   Avg.Power
-        p2_7 = re.compile(
+        p2_7 = regex_engine.compile(
             r'^Rx.Power measurement\s+:\s+(?P<rx_power_measurement>.+)$')
         
         # Address Change        :   Not Required
-        p2_8 = re.compile(
+        p2_8 = regex_engine.compile(
             r'^Address Change\s+:\s+(?P<address_change>[\w\s]+)$')
         
         # CC_EXT                :   0x32
-        p2_9 = re.compile(
+        p2_9 = regex_engine.compile(
             r'^CC_EXT\s+:\s+(?P<cc_ext>\w+)$')
         
         # Other Information
-        p3 = re.compile(r'^Other Information$')
+        p3 = regex_engine.compile(r'^Other Information$')
         
         # Chk for link status   : 00
-        p3_0 = re.compile(
+        p3_0 = regex_engine.compile(
             r'^Chk for link status\s+:\s+(?P<chk_for_link_status>\w+)$')
         
         # Flow control Receive  : ON
-        p3_1 = re.compile(
+        p3_1 = regex_engine.compile(
             r'^Flow control Receive\s+:\s+(?P<flow_control_receive>[\w\s]+)$')
         
         # Flow control Send     : Off
-        p3_2 = re.compile(
+        p3_2 = regex_engine.compile(
             r'^Flow control Send\s+:\s+(?P<flow_control_send>[\w\s]+)$')
         
         # Administrative Speed  : 10000
-        p3_3 = re.compile(
+        p3_3 = regex_engine.compile(
             r'^Administrative Speed\s+:\s+(?P<administrative_speed>\w+)$')
         
         # Administrative Duplex : full
-        p3_4 = re.compile(
+        p3_4 = regex_engine.compile(
             r'^Administrative Duplex\s+:\s+(?P<administrative_duplex>[\w\s]+)$')
         
         # Operational Speed     : 10000
-        p3_5 = re.compile(
+        p3_5 = regex_engine.compile(
             r'^Operational Speed\s+:\s+(?P<operational_speed>\w+)$')
         
         # Operational Duplex    : full
-        p3_6 = re.compile(
+        p3_6 = regex_engine.compile(
             r'^Operational Duplex\s+:\s+(?P<operational_duplex>[\w\s]+)$')
         
         for line in output.splitlines():
@@ -367,17 +369,17 @@ class ShowIdpromTan(ShowIdpromTanSchema):
             output = self.device.execute(cmd)
 
         # Switch 01 ---------
-        p1 = re.compile(r"^Switch\s+(?P<switch_num>\d+)$")
+        p1 = regex_engine.compile(r"^Switch\s+(?P<switch_num>\d+)$")
         # Module 1 Idprom:
-        p1_startrek = re.compile(r"^Module\s+(?P<switch_num>\d+)\s+Idprom:$")
+        p1_startrek = regex_engine.compile(r"^Module\s+(?P<switch_num>\d+)\s+Idprom:$")
 
         # Top Assy. Part Number           : 68-101195-01
-        p2 = re.compile(r"^Top\s+Assy.\s+Part\s+Number\s+:\s+(?P<part_num>\d+-\d+-\d+)$")
+        p2 = regex_engine.compile(r"^Top\s+Assy.\s+Part\s+Number\s+:\s+(?P<part_num>\d+-\d+-\d+)$")
 
         # Top Assy. Revision Number       : 31
-        p3 = re.compile(r"^Top\s+Assy.\s+Revision\s+Number\s+:\s+(?P<revision_num>\w+)$")
+        p3 = regex_engine.compile(r"^Top\s+Assy.\s+Revision\s+Number\s+:\s+(?P<revision_num>\w+)$")
         # Top Assy. Revision      : 31
-        p3_startrek = re.compile(r"^Top\s+Assy.\s+Revision\s+:\s+(?P<revision_num>\w+)$")
+        p3_startrek = regex_engine.compile(r"^Top\s+Assy.\s+Revision\s+:\s+(?P<revision_num>\w+)$")
 
         ret_dict = {}
 
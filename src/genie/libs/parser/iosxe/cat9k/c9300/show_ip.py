@@ -6,14 +6,12 @@ IOSXE parsers for the following show commands:
     * show ip verify source interface {interface_name}
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -48,7 +46,7 @@ class ShowIpVerifySource(ShowIpVerifySourceSchema):
 
         # Gi1/0/3      ip trk       active       40.1.1.24                           10
         # Gi1/0/13   ip-mac       active       10.1.1.101       00:0A:00:0B:00:01  10
-        p1 = re.compile(r"^(?P<interface_name>\S+)\s+(?P<filter_type>ip\s?\S+)\s+(?P<filter_mode>\S+)(\s+(?P<ip_address>\S+)\s+(?P<mac_address>\S+)?\s+(?P<vlan>[\d,]*))?$")
+        p1 = regex_engine.compile(r"^(?P<interface_name>\S+)\s+(?P<filter_type>ip\s?\S+)\s+(?P<filter_mode>\S+)(\s+(?P<ip_address>\S+)\s+(?P<mac_address>\S+)?\s+(?P<vlan>[\d,]*))?$")
 
         ret_dict = {}
         index = 0
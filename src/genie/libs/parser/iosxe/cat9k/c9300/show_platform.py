@@ -6,12 +6,12 @@ IOSXE C9300 parsers for the following show commands:
     * 'test platform hardware fep switch {switch_num} {fep_slot} dump-statistics'
 """
 # Python
-import re
 import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, ListOf
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -60,13 +60,13 @@ class ShowInventory(ShowInventorySchema):
         # Regex patterns
         # --------------------------------------------------------------
         # NAME: "c93xx Stack", DESCR: "c93xx Stack"
-        p1 = re.compile(r'^NAME: +\"(?P<name>[\s\S]+)\",'
-                        r' +DESCR: +\"(?P<descr>[\s\S]+)\"$')
+        p1 = regex_engine.compile(r'^NAME: +\"(?P<name>[\s\S]+)\",'
+                                  r' +DESCR: +\"(?P<descr>[\s\S]+)\"$')
 
         # PID: C9300-48UXM       , VID: V02  , SN: FCW2242G0V3
         # PID: C9300-24T         , VID:      , SN:
-        p2 = re.compile(r'^PID: +(?P<pid>\S+) +, +VID:( +(?P<vid>\S+))? +,'
-                        r' +SN:( +(?P<sn>\S+))?$')
+        p2 = regex_engine.compile(r'^PID: +(?P<pid>\S+) +, +VID:( +(?P<vid>\S+))? +,'
+                                  r' +SN:( +(?P<sn>\S+))?$')
 
         # --------------------------------------------------------------
         # Build the parsed output
@@ -187,54 +187,54 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
         #  Sensor          Location        State               Reading       Range(min-max)
         #  PS1 Vout        2               GOOD               56125 mV          na
         #  PS1 Vin         2               GOOD              205000 mV        90 - 264
-        p0 = re.compile(r'^(?P<sensor>(\w+ \w+))\s+(?P<location>\d)\s+(?P<state>(\w+( \w+)?))\s+(?P<reading>(\w+ \w+))\s+(?P<min>[\w ]+)(( - )?(?P<max>[\w]+)?)$')
+        p0 = regex_engine.compile(r'^(?P<sensor>(\w+ \w+))\s+(?P<location>\d)\s+(?P<state>(\w+( \w+)?))\s+(?P<reading>(\w+ \w+))\s+(?P<min>[\w ]+)(( - )?(?P<max>[\w]+)?)$')
 
         # Switch 1 FAN 1 is OK
-        p1 = re.compile(r'^Switch +(?P<switch>\d+) +FAN +(?P<fan>\d+) +is +(?P<state>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^Switch +(?P<switch>\d+) +FAN +(?P<fan>\d+) +is +(?P<state>[\w\s]+)$')
 
         # Switch 1 FAN 1 direction is Front to Back
-        p1_1 = re.compile(r'^Switch +(?P<switch>\d+) +FAN +(?P<fan>\d+) +direction +is +(?P<direction>[\w\s]+)$')
+        p1_1 = regex_engine.compile(r'^Switch +(?P<switch>\d+) +FAN +(?P<fan>\d+) +direction +is +(?P<direction>[\w\s]+)$')
 
         # Switch   FAN     Speed   State
         # ----------------------------------
         # 1        1       14240     OK
-        p1_2 = re.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>[\w]+)$')
+        p1_2 = regex_engine.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>[\w]+)$')
         
         # Switch     FAN     Speed     State     Airflow direction
         # ---------------------------------------------------
         # 1        1    5440       OK     Front to Back
-        p1_2_3 = re.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>[\w]+)\s+(?P<direction>[\w\s]+)$')
+        p1_2_3 = regex_engine.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>[\w]+)\s+(?P<direction>[\w\s]+)$')
 
         # FAN PS-1 is OK
-        p2 = re.compile(r'^FAN +PS\-(?P<ps>\d+) +is +(?P<state>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^FAN +PS\-(?P<ps>\d+) +is +(?P<state>[\w\s]+)$')
 
         # Switch 1: SYSTEM TEMPERATURE is OK
-        p3 = re.compile(r'^Switch +(?P<switch>\d+): +SYSTEM +TEMPERATURE +is +(?P<state>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^Switch +(?P<switch>\d+): +SYSTEM +TEMPERATURE +is +(?P<state>[\w\s]+)$')
 
         # Inlet Temperature Value: 21 Degree Celsius
         # Outlet Temperature Value: 32 Degree Celsius
         # Hotspot Temperature Value: 49 Degree Celsius
-        p4 = re.compile(r'^(?P<type>\w+) +Temperature +Value: +(?P<temperature>\d+) +Degree +Celsius$')
+        p4 = regex_engine.compile(r'^(?P<type>\w+) +Temperature +Value: +(?P<temperature>\d+) +Degree +Celsius$')
 
         # Temperature State: GREEN
-        p5 = re.compile(r'^Temperature +State: +(?P<state>\w+)$')
+        p5 = regex_engine.compile(r'^Temperature +State: +(?P<state>\w+)$')
 
         # Yellow Threshold : 105 Degree Celsius
         # Red Threshold    : 125 Degree Celsius
-        p6 = re.compile(r'^(?P<color>\w+) +Threshold *: +(?P<temperature>\d+) +Degree +Celsius$')
+        p6 = regex_engine.compile(r'^(?P<color>\w+) +Threshold *: +(?P<temperature>\d+) +Degree +Celsius$')
 
         # SW  PID                 Serial#     Status           Sys Pwr  PoE Pwr  Watts
         # --  ------------------  ----------  ---------------  -------  -------  -----
         # 1A  PWR-C1-350WAC-P     DCC2337B0K5  OK              Good     n/a      350
         # 1A  PWR-C4-950WAC-R     APS222700VU  No Input Power  Bad      n/a      950
         # 1B  Not Present
-        p7 = re.compile(r'^(?P<sw>\d+)(?P<ps>\w+) *'
-                        r'((?P<pid>[\w\-]+) +'
-                        r'(?P<serial_number>\w+) +)?'
-                        r'(?P<status>(\w+|Not Present|No Input Power)) *'
-                        r'((?P<system_power>\w+) +'
-                        r'(?P<poe_power>[\w\/]+) +'
-                        r'(?P<watts>\w+))?$')
+        p7 = regex_engine.compile(r'^(?P<sw>\d+)(?P<ps>\w+) *'
+                                  r'((?P<pid>[\w\-]+) +'
+                                  r'(?P<serial_number>\w+) +)?'
+                                  r'(?P<status>(\w+|Not Present|No Input Power)) *'
+                                  r'((?P<system_power>\w+) +'
+                                  r'(?P<poe_power>[\w\/]+) +'
+                                  r'(?P<watts>\w+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -405,24 +405,24 @@ class ShowPlatformHardwareAuthenticationStatus(ShowPlatformHardwareAuthenticatio
 
         result_dict = {}
         # Switch 1:
-        p1 = re.compile(r'^Switch\s+(?P<switch>\d+):$')
+        p1 = regex_engine.compile(r'^Switch\s+(?P<switch>\d+):$')
 
         #    Mainboard Authentication:     Passed
-        p2 = re.compile(r'^Mainboard Authentication:\s+(?P<mainboard_authentication>\w+(\s\w+)?)$')
+        p2 = regex_engine.compile(r'^Mainboard Authentication:\s+(?P<mainboard_authentication>\w+(\s\w+)?)$')
 
         #    FRU Authentication:           Not Available
-        p3 = re.compile(r'^FRU Authentication:\s+(?P<fru_authentication>\w+(\s\w+)?)$')
+        p3 = regex_engine.compile(r'^FRU Authentication:\s+(?P<fru_authentication>\w+(\s\w+)?)$')
         #    Stack Cable A Authentication: Passed
-        p4 = re.compile(r'^Stack Cable A Authentication:\s+(?P<stack_cable_a_authentication>\w+(\s\w+)?)$')
+        p4 = regex_engine.compile(r'^Stack Cable A Authentication:\s+(?P<stack_cable_a_authentication>\w+(\s\w+)?)$')
         #    Stack Cable B Authentication: Passed
-        p5 = re.compile(r'^Stack Cable B Authentication:\s+(?P<stack_cable_b_authentication>\w+(\s\w+)?)$')
+        p5 = regex_engine.compile(r'^Stack Cable B Authentication:\s+(?P<stack_cable_b_authentication>\w+(\s\w+)?)$')
         # Stack Adapter A Authentication Passed
-        p6 = re.compile(r'^Stack Adapter A (Authentication:|Authenticatio)\s+(?P<stack_adapter_a_authentication>[\s\w]+)$')
+        p6 = regex_engine.compile(r'^Stack Adapter A (Authentication:|Authenticatio)\s+(?P<stack_adapter_a_authentication>[\s\w]+)$')
         # Stack Adapter B Authentication Passed
-        p7 = re.compile(r'^Stack Adapter B (Authentication:|Authenticatio)\s+(?P<stack_adapter_b_authentication>[\s\w]+)$')
+        p7 = regex_engine.compile(r'^Stack Adapter B (Authentication:|Authenticatio)\s+(?P<stack_adapter_b_authentication>[\s\w]+)$')
         # Rot Asic 0 Authentication Passed
         # Rot Asic 1 Authentication Passed
-        p8 = re.compile(r'^RoT Asic-(?P<asic_no>\d) Authentication:\s+(?P<rot_asic_authentication>[\s\w]+)$')
+        p8 = regex_engine.compile(r'^RoT Asic-(?P<asic_no>\d) Authentication:\s+(?P<rot_asic_authentication>[\s\w]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -519,13 +519,13 @@ class ShowLicenseAuthorization(ShowLicenseAuthorizationSchema):
         ret_dict = {}
 
         #Active: PID:C9300-24UX,SN:FCW2147L0C5
-        p1 = re.compile(r'^Active:\s+PID:(?P<pid>\S+)+SN:(?P<sn>\S+).*$') 
+        p1 = regex_engine.compile(r'^Active:\s+PID:(?P<pid>\S+)+SN:(?P<sn>\S+).*$') 
 
         #Status: NOT INSTALLED
-        p2 = re.compile(r'^Status:\s(?P<status>\S+\s+\S+).*$')
+        p2 = regex_engine.compile(r'^Status:\s(?P<status>\S+\s+\S+).*$')
 
         #No Purchase Information Available
-        p3 = re.compile(r'^(?P<purchased_licenses>\S+\s+Purchase+\s+\S+\s+\S+).*$')
+        p3 = regex_engine.compile(r'^(?P<purchased_licenses>\S+\s+Purchase+\s+\S+\s+\S+).*$')
 
         for line in output.splitlines():
             line=line.strip()
@@ -591,10 +591,10 @@ class ShowDiagnosticStatus(ShowDiagnosticStatusSchema):
         ret_dict = {}
 
         #1      C9300-24UX                        DiagThermalTest                 <HM>
-        p1 = re.compile(r'^(?P<card>\d)+\s+(?P<description>\S+)+\s+\S+\s+.(?P<run_by>\w+).*$')
+        p1 = regex_engine.compile(r'^(?P<card>\d)+\s+(?P<description>\S+)+\s+\S+\s+.(?P<run_by>\w+).*$')
 
         # DiagFanTest                     <HM>
-        p2 = re.compile(r"^(?P<current_running_test>\S+\s+)<HM>$")
+        p2 = regex_engine.compile(r"^(?P<current_running_test>\S+\s+)<HM>$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -655,13 +655,13 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicResourceAsicAllCppVbinAll(ShowPl
         ret_dict = {}
 
         #ASIC#0:
-        p1=re.compile(r'^(?P<asic>ASIC.*)$')
+        p1=regex_engine.compile(r'^(?P<asic>ASIC.*)$')
 
         #CPP Virtual Bin (CPP_VBIN) [0]
-        p2=re.compile(r'^(?P<cpp_virtual_bin>CPP.*)$')
+        p2=regex_engine.compile(r'^(?P<cpp_virtual_bin>CPP.*)$')
 
         #virtualBin0 = 0x1
-        p3=re.compile(r'^(?P<virtual>virtual+.*)$')
+        p3=regex_engine.compile(r'^(?P<virtual>virtual+.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -741,20 +741,20 @@ class ShowPlatformHardwareFedSwitchQosQueueStatsInterface(ShowPlatformHardwareFe
 
         # VOQ Stats For : HundredGigE1/0/5 [ 0x544 ]
         # VOQ Stats For : HundredGigE2/0/2.1 [ 0x550 ]
-        p1 = re.compile(r'^VOQ Stats For : (?P<interface>[\w\/\.]+)\s+.*$')
+        p1 = regex_engine.compile(r'^VOQ Stats For : (?P<interface>[\w\/\.]+)\s+.*$')
 
         # 0      | Enqueued |                        1194566957 |                       78841419162 |
         # | Dropped  |                                 0 |                                 0 |
         # | Total    |                        1194566957 |                       78841419162 |
         # |----------|-----------------------------------------------------------------------|
-        p2 = re.compile(r'^(?P<voq_id>\d+)?\s*\|\s+(?P<header>\w+)\s+\|\s+(?P<packets>\d+)\s+\|\s+(?P<bytes>\d+)\s+\|$')
+        p2 = regex_engine.compile(r'^(?P<voq_id>\d+)?\s*\|\s+(?P<header>\w+)\s+\|\s+(?P<packets>\d+)\s+\|\s+(?P<bytes>\d+)\s+\|$')
 
         # |   Slice  |         0 |         1 |         2 |         3 |         4 |         5 |
-        p3 = re.compile(r'^\|\s+Slice\s+\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|\s+(?P<slice2>\d+)\s\|'
-                    r'\s+(?P<slice3>\d+)\s\|\s+(?P<slice4>\d+)\s\|\s+(?P<slice5>\d+)\s\|$')
+        p3 = regex_engine.compile(r'^\|\s+Slice\s+\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|\s+(?P<slice2>\d+)\s\|'
+                              r'\s+(?P<slice3>\d+)\s\|\s+(?P<slice4>\d+)\s\|\s+(?P<slice5>\d+)\s\|$')
         
         # |SMS Bytes |         0 |         0 |         0 |         0 |         0 |         0 |
-        p4 = re.compile(r'^\|\s*(?P<slice_type>SMS Bytes|HBM Blocks|HBM Bytes)\s*\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|'
+        p4 = regex_engine.compile(r'^\|\s*(?P<slice_type>SMS Bytes|HBM Blocks|HBM Bytes)\s*\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|'
             r'\s+(?P<slice2>\d+)\s\|\s+(?P<slice3>\d+)\s\|\s+(?P<slice4>\d+)\s\|\s+(?P<slice5>\d+)\s\|$')
         
         ret_dict = {}
@@ -855,22 +855,22 @@ class ShowPlatformSoftwareFedMatmMactableVlan(ShowPlatformSoftwareFedMatmMactabl
             output = self.device.execute(cmd)
 
         # Total Mac number of addresses:: 34
-        p1 = re.compile(r"^Total Mac number of addresses::\s+(?P<total_mac_address>\d+)$")
+        p1 = regex_engine.compile(r"^Total Mac number of addresses::\s+(?P<total_mac_address>\d+)$")
 
         # Total number of secure addresses:: 0 
-        p2 = re.compile(r"^Total number of secure addresses::\s+(?P<total_secure_address>\d+)$")
+        p2 = regex_engine.compile(r"^Total number of secure addresses::\s+(?P<total_secure_address>\d+)$")
 
         # Total number of drop addresses:: 0
-        p3 = re.compile(r"^Total number of drop addresses::\s+(?P<total_drop_address>\d+)$")
+        p3 = regex_engine.compile(r"^Total number of drop addresses::\s+(?P<total_drop_address>\d+)$")
 
         # Total number of lisp local addresses:: 0
-        p4 = re.compile(r"^Total number of lisp local addresses::\s+(?P<total_lisp_local_address>\d+)$")
+        p4 = regex_engine.compile(r"^Total number of lisp local addresses::\s+(?P<total_lisp_local_address>\d+)$")
 
         # Total number of lisp remote addresses:: 0
-        p5 = re.compile(r"^Total number of lisp remote addresses::\s+(?P<total_lisp_remote_address>\d+)$")
+        p5 = regex_engine.compile(r"^Total number of lisp remote addresses::\s+(?P<total_lisp_remote_address>\d+)$")
 
         # MAT_LISP_REMOTE_ADDR 0x1000000  MAT_VPLS_ADDR        0x2000000  MAT_LISP_GW_ADDR     0x4000000
-        p6 = re.compile(r"(?P<key>[\w_\-]+)\s+(?P<value>[\w_\-]+)")
+        p6 = regex_engine.compile(r"(?P<key>[\w_\-]+)\s+(?P<value>[\w_\-]+)")
 
         ret_dict = {}
 
@@ -953,43 +953,43 @@ class TestPlatformHardwareFepSwitchDumpStatistics(TestPlatformHardwareFepSwitchD
         ret_dict = {}
 
         # Input voltage:   206.750V
-        p1 = re.compile(r'Input voltage:\s+(?P<input_voltage>\S+)\s*V')
+        p1 = regex_engine.compile(r'Input voltage:\s+(?P<input_voltage>\S+)\s*V')
         
         # Input current:   0.508A
-        p2 = re.compile(r'Input current:\s+(?P<input_current>\S+)\s*A')
+        p2 = regex_engine.compile(r'Input current:\s+(?P<input_current>\S+)\s*A')
         
         # Input power:     96.500W
-        p3 = re.compile(r'Input power:\s+(?P<input_power>\S+)\s*W')
+        p3 = regex_engine.compile(r'Input power:\s+(?P<input_power>\S+)\s*W')
         
         # Output voltage:  55.914V
-        p4 = re.compile(r'Output voltage:\s+(?P<output_voltage>\S+)\s*V')
+        p4 = regex_engine.compile(r'Output voltage:\s+(?P<output_voltage>\S+)\s*V')
         
         # Output current:  1.492A
-        p5 = re.compile(r'Output current:\s+(?P<output_current>\S+)\s*A')
+        p5 = regex_engine.compile(r'Output current:\s+(?P<output_current>\S+)\s*A')
         
         # Output power:    84.0W
-        p6 = re.compile(r'Output power:\s+(?P<output_power>\S+)\s*W')
+        p6 = regex_engine.compile(r'Output power:\s+(?P<output_power>\S+)\s*W')
         
         # Inlet temp:      35.625 degrees
-        p7 = re.compile(r'Inlet temp:\s+(?P<inlet_temp>\S+)\s*degrees')
+        p7 = regex_engine.compile(r'Inlet temp:\s+(?P<inlet_temp>\S+)\s*degrees')
         
         # Outlet temp:     45.500 degrees
-        p8 = re.compile(r'Outlet temp:\s+(?P<outlet_temp>\S+)\s*degrees')
+        p8 = regex_engine.compile(r'Outlet temp:\s+(?P<outlet_temp>\S+)\s*degrees')
         
         # Hot-spot temp:   57.0 degrees
-        p9 = re.compile(r'Hot-spot temp:\s+(?P<hot_spot_temp>\S+)\s*degrees')
+        p9 = regex_engine.compile(r'Hot-spot temp:\s+(?P<hot_spot_temp>\S+)\s*degrees')
         
         # Fan speed:       3248 RPM
-        p10 = re.compile(r'Fan speed:\s+(?P<fan_speed>\d+)\s*RPM')
+        p10 = regex_engine.compile(r'Fan speed:\s+(?P<fan_speed>\d+)\s*RPM')
         
         # Status word:     0x0
-        p11 = re.compile(r'Status word:\s+(?P<status_word>\S+)')
+        p11 = regex_engine.compile(r'Status word:\s+(?P<status_word>\S+)')
         
         # Status fans:     0x0
-        p12 = re.compile(r'Status fans:\s+(?P<status_fans>\S+)')
+        p12 = regex_engine.compile(r'Status fans:\s+(?P<status_fans>\S+)')
         
         # VOUT_MODE:       0x19
-        p13 = re.compile(r'VOUT_MODE:\s+(?P<vout_mode>\S+)')
+        p13 = regex_engine.compile(r'VOUT_MODE:\s+(?P<vout_mode>\S+)')
 
         # Extract information using regular expressions
         for line in output.splitlines():
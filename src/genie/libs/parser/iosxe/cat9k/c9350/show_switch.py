@@ -2,12 +2,12 @@
 IOSXE C9350 parsers for the following show commands: 
 show_switch.py
 '''
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowSwitchStackPortSummarySchema(MetaParser):
@@ -47,15 +47,15 @@ class ShowSwitchStackPortSummary(ShowSwitchStackPortSummarySchema):
         # initial regexp pattern
         # 1/1        OK           2/2         50cm           Yes       Yes           Yes       1                   No
         
-        p1 = re.compile(r"^(?P<stackport_id>\S+)"
-                        r" +(?P<port_status>\w+)"
-                        r" +(?P<neighbor>\S+)"
-                        r" +(?P<cable_length>\w+)"
-                        r" +(?P<link_ok>\w+)"
-                        r" +(?P<link_active>\w+)"
-                        r" +(?P<sync_ok>\w+)"
-                        r" +(?P<link_changes_count>\d+)"
-                        r" +(?P<in_loopback>\w+)$")
+        p1 = regex_engine.compile(r"^(?P<stackport_id>\S+)"
+                                  r" +(?P<port_status>\w+)"
+                                  r" +(?P<neighbor>\S+)"
+                                  r" +(?P<cable_length>\w+)"
+                                  r" +(?P<link_ok>\w+)"
+                                  r" +(?P<link_active>\w+)"
+                                  r" +(?P<sync_ok>\w+)"
+                                  r" +(?P<link_changes_count>\d+)"
+                                  r" +(?P<in_loopback>\w+)$")
         
         for line in output.splitlines():
            line = line.strip()
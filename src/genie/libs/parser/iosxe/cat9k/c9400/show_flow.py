@@ -4,14 +4,12 @@ IOSXE parsers for the following show commands:
     * show flow monitor 
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, ListOf, Optional, And
 
 # Common
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -55,34 +53,34 @@ class ShowFlowMonitor(ShowFlowMonitorSchema):
         ret_dict = {}
 
         # Flow Monitor v4_mon_sgt-output:
-        p1 = re.compile(r'^Flow\sMonitor\s(?P<flow_monitor_name>[\w\-]+)\:$')
+        p1 = regex_engine.compile(r'^Flow\sMonitor\s(?P<flow_monitor_name>[\w\-]+)\:$')
 
         # Description:       User defined
-        p2 = re.compile(r'^Description:\s+(?P<description>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^Description:\s+(?P<description>[\w\s]+)$')
 
         # Flow Record:       v4-rec_sgt-output
-        p3 = re.compile(r'^Flow\sRecord:\s+(?P<record_name>\S+)$')
+        p3 = regex_engine.compile(r'^Flow\sRecord:\s+(?P<record_name>\S+)$')
 
         # Flow Exporter:     StealthWatch_Exporter
-        p4 = re.compile(r'^Flow\sExporter:\s+(?P<exporter_name>\S+)$')
+        p4 = regex_engine.compile(r'^Flow\sExporter:\s+(?P<exporter_name>\S+)$')
 
         # Cache
-        p5 = re.compile(r'^(?P<cache>Cache)\:$')
+        p5 = regex_engine.compile(r'^(?P<cache>Cache)\:$')
 
         # Type:                 normal (Platform cache)
-        p6 = re.compile(r'^Type:\s+(?P<type>.*)$')
+        p6 = regex_engine.compile(r'^Type:\s+(?P<type>.*)$')
 
         # Status:               not allocated
-        p7 = re.compile(r'^Status:\s+(?P<status>[\w\s]+)$')
+        p7 = regex_engine.compile(r'^Status:\s+(?P<status>[\w\s]+)$')
 
         # Size:                 10000 entries
-        p8 = re.compile(r'^Size:\s+(?P<size>\d+)\sentries$')
+        p8 = regex_engine.compile(r'^Size:\s+(?P<size>\d+)\sentries$')
 
         # Inactive Timeout:     15 secs
-        p9 = re.compile(r'^Inactive\sTimeout:\s+(?P<inactive_timeout>\d+)\ssecs$')
+        p9 = regex_engine.compile(r'^Inactive\sTimeout:\s+(?P<inactive_timeout>\d+)\ssecs$')
 
         # Active Timeout:       60 secs
-        p10 = re.compile(r'^Active\sTimeout:\s+(?P<active_timeout>\d+)\ssecs$')
+        p10 = regex_engine.compile(r'^Active\sTimeout:\s+(?P<active_timeout>\d+)\ssecs$')
 
         for line in out.splitlines():
             line = line.strip()
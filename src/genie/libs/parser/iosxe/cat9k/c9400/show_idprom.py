@@ -2,9 +2,11 @@
 IOSXE parsers for the following show commands:
     * show idprom all 
 '''
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or 
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # ==========================
 # Schema for:
@@ -132,92 +134,92 @@ class ShowIdprom(ShowIdpromSchema):
         ret_dict = {}
         
         # Midplane Idprom:
-        p1 = re.compile(r'^Midplane +Idprom:$')
+        p1 = regex_engine.compile(r'^Midplane +Idprom:$')
         
         #Supervisor 1 Idprom:
-        p2 = re.compile(r'^Supervisor +(?P<number>\d+) +Idprom:$')
+        p2 = regex_engine.compile(r'^Supervisor +(?P<number>\d+) +Idprom:$')
         
         #Module 1 Idprom:
-        p3 = re.compile(r'^Module +(?P<number>\d+) +Idprom:$')
+        p3 = regex_engine.compile(r'^Module +(?P<number>\d+) +Idprom:$')
         
         #Fan Tray Idprom:
-        p4 = re.compile(r'^Fan +Tray +Idprom:$')
+        p4 = regex_engine.compile(r'^Fan +Tray +Idprom:$')
         
         #Power Supply 1 Idprom:
-        p5 = re.compile(r'^Power +Supply +(?P<number>\d+) +Idprom:$')
+        p5 = regex_engine.compile(r'^Power +Supply +(?P<number>\d+) +Idprom:$')
 
         #Controller Type          : 3232
-        p6 = re.compile(r'^Controller +Type *: +(?P<controller_type>\S[\S ]*)$')
+        p6 = regex_engine.compile(r'^Controller +Type *: +(?P<controller_type>\S[\S ]*)$')
         
         #Hardware Revision        : 1.0
-        p7 = re.compile(r'^Hardware +Revision *: +(?P<hardware_revision>\S[\S ]*)$')
+        p7 = regex_engine.compile(r'^Hardware +Revision *: +(?P<hardware_revision>\S[\S ]*)$')
         
         #Top Assy. Part Number    : 68-05859-01
-        p8 = re.compile(r'^Top +Assy\. +Part +Number *: +(?P<top_assy_part_number>\S[\S ]*)$')
+        p8 = regex_engine.compile(r'^Top +Assy\. +Part +Number *: +(?P<top_assy_part_number>\S[\S ]*)$')
         
         #Top Assy. Revision       : B0
-        p9 = re.compile(r'^Top +Assy\. +Revision *: +(?P<top_assy_revision>\S[\S ]*)$')
+        p9 = regex_engine.compile(r'^Top +Assy\. +Revision *: +(?P<top_assy_revision>\S[\S ]*)$')
         
         #Deviation Number         : 0
-        p10 = re.compile(r'^Deviation +Number *: +(?P<deviation_number>\d+)$')
+        p10 = regex_engine.compile(r'^Deviation +Number *: +(?P<deviation_number>\d+)$')
         
         #PCB Serial Number        : FXS22410260
-        p11 = re.compile(r'^PCB +Serial +Number *: +(?P<pcb_serial_number>\S[\S ]*)$')
+        p11 = regex_engine.compile(r'^PCB +Serial +Number *: +(?P<pcb_serial_number>\S[\S ]*)$')
         
         #Chassis Serial Number    : FXS2250Q63W
-        p12 = re.compile(r'^Chassis +Serial +Number *: +(?P<chassis_serial_number>\S[\S ]*)$')
+        p12 = regex_engine.compile(r'^Chassis +Serial +Number *: +(?P<chassis_serial_number>\S[\S ]*)$')
         
         #RMA Test History         : 00
-        p13 = re.compile(r'^RMA +Test +History *: +(?P<rma_test_history>\S[\S ]*)$')
+        p13 = regex_engine.compile(r'^RMA +Test +History *: +(?P<rma_test_history>\S[\S ]*)$')
         
         #RMA Number               : 0-0-0-0
-        p14 = re.compile(r'^RMA +Number *: +(?P<rma_number>\S[\S ]*)$')
+        p14 = regex_engine.compile(r'^RMA +Number *: +(?P<rma_number>\S[\S ]*)$')
         
         #RMA History              : 00
-        p15 = re.compile(r'^RMA +History *: +(?P<rma_history>\S[\S ]*)$')
+        p15 = regex_engine.compile(r'^RMA +History *: +(?P<rma_history>\S[\S ]*)$')
         
         #CLEI Code                : INM5T00ARA
-        p16 = re.compile(r'^CLEI +Code *: +(?P<clei_code>\S[\S ]*)$')
+        p16 = regex_engine.compile(r'^CLEI +Code *: +(?P<clei_code>\S[\S ]*)$')
 
         
         #ECI Number               : 472475
-        p17 = re.compile(r'^ECI +Number *: +(?P<eci_number>\S[\S ]*)$')
+        p17 = regex_engine.compile(r'^ECI +Number *: +(?P<eci_number>\S[\S ]*)$')
     
         #Product Identifier (PID) : C9404R  
-        p18= re.compile(r'^Product +Identifier +\(PID\) *: +(?P<pid>\S[\S ]*)$')
+        p18= regex_engine.compile(r'^Product +Identifier +\(PID\) *: +(?P<pid>\S[\S ]*)$')
         
         #Version Identifier (VID) : V01 
-        p19 = re.compile(r'^Version +Identifier +\(VID\) *: +(?P<vid>\S[\S ]*)$')
+        p19 = regex_engine.compile(r'^Version +Identifier +\(VID\) *: +(?P<vid>\S[\S ]*)$')
         
         #Chassis MAC Address      : 70ea.1aff.0300
-        p20 = re.compile(r'^Chassis +MAC +Address *: +(?P<chassis_mac_address>\S[\S ]*)$')
+        p20 = regex_engine.compile(r'^Chassis +MAC +Address *: +(?P<chassis_mac_address>\S[\S ]*)$')
         
         #Manufacturing Test Data  : 00 00 00 00 00 00 00 00
-        p21 = re.compile(r'^Manufacturing +Test +Data *: +(?P<manufacturing_test_data>\S[\S ]*)$')
+        p21 = regex_engine.compile(r'^Manufacturing +Test +Data *: +(?P<manufacturing_test_data>\S[\S ]*)$')
         
         #Base MAC Address         : D4 E8 80 38 58 C4 
-        p22 = re.compile(r'^Base +MAC +Address *: +(?P<base_mac_address>\S[\S ]*)$')
+        p22 = regex_engine.compile(r'^Base +MAC +Address *: +(?P<base_mac_address>\S[\S ]*)$')
         
         #Field Diagnostics Data   : 00 00 00 00 00 00 00 00 
-        p23 = re.compile(r'^Field +Diagnostics +Data *: +(?P<field_diagnostics_data>\S[\S ]*)$')
+        p23 = regex_engine.compile(r'^Field +Diagnostics +Data *: +(?P<field_diagnostics_data>\S[\S ]*)$')
         
         #Environment Monitor Data : 06 00 00 00 12 01 90 00 
-        p24 = re.compile(r'^Environment +Monitor +Data *: +(?P<environment_monitor_data>\S[\S ]*)$')
+        p24 = regex_engine.compile(r'^Environment +Monitor +Data *: +(?P<environment_monitor_data>\S[\S ]*)$')
         
         #Max Power Requirement    : 400 Watts
-        p25 = re.compile(r'^Max +Power +Requirement *: +(?P<max_power_requirement_watts>\d+) +Watts$')
+        p25 = regex_engine.compile(r'^Max +Power +Requirement *: +(?P<max_power_requirement_watts>\d+) +Watts$')
         
         #Typical Power Requirement: 288 Watts
-        p26 = re.compile(r'^Typical +Power +Requirement *: +(?P<typical_power_requirement_watts>\d+) +Watts$')
+        p26 = regex_engine.compile(r'^Typical +Power +Requirement *: +(?P<typical_power_requirement_watts>\d+) +Watts$')
         
         #Max Power Output at 220V : 3200 Watts
-        p27 = re.compile(r'^Max +Power +Output +at +220V *: +(?P<max_power_output_at_220v>\d+) +Watts$')
+        p27 = regex_engine.compile(r'^Max +Power +Output +at +220V *: +(?P<max_power_output_at_220v>\d+) +Watts$')
         
         #Max Power Output at 110V : 1570 Watts
-        p28 = re.compile(r'^Max +Power +Output +at +110V *: +(?P<max_power_output_at_110v>\d+) +Watts$')
+        p28 = regex_engine.compile(r'^Max +Power +Output +at +110V *: +(?P<max_power_output_at_110v>\d+) +Watts$')
         
         #Power Supply Type        : AC
-        p29 = re.compile(r'^Power +Supply +Type *: +(?P<power_supply_type>\S[\S ]*)$')
+        p29 = regex_engine.compile(r'^Power +Supply +Type *: +(?P<power_supply_type>\S[\S ]*)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -10,11 +10,13 @@ IOSXE C9400 parsers for the following show commands:
 '''
 
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowLoggingOnboardSwitchMessageDetailSchema(MetaParser):
     '''Schema for:
         'show logging onboard rp active message detail'
@@ -58,21 +60,21 @@ class ShowLoggingOnboardSwitchMessageDetail(ShowLoggingOnboardSwitchMessageDetai
         # regex pattern
 
         # ERROR MESSAGE SUMMARY INFORMATION
-        p1 = re.compile(r'^ERROR MESSAGE SUMMARY INFORMATION$')
+        p1 = regex_engine.compile(r'^ERROR MESSAGE SUMMARY INFORMATION$')
 
         # MM/DD/YYYY HH:MM:SS Facility-Sev-Name | Count | Persistence Flag
         # --------------------------------------------------------------------------------
         # 04/05/2023 06:57:30 %IOSXE-2-SPA_INSERTED :   168  : LAST :  SPA inserted in subslot 1/0
-        p2 = re.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s(?P<time>\d+:\d+:\d+)\s+(?P<facility_sev_name>.\w+.\w.\w+)\s.\s+(?P<count>\d+)\s+:\s+(?P<persistence_flag>\S+\s+\:+.*)$')
+        p2 = regex_engine.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s(?P<time>\d+:\d+:\d+)\s+(?P<facility_sev_name>.\w+.\w.\w+)\s.\s+(?P<count>\d+)\s+:\s+(?P<persistence_flag>\S+\s+\:+.*)$')
 
         # ERROR MESSAGE CONTINUOUS INFORMATION
-        p3 = re.compile(r'^ERROR MESSAGE CONTINUOUS INFORMATION$')
+        p3 = regex_engine.compile(r'^ERROR MESSAGE CONTINUOUS INFORMATION$')
 
         # MM/DD/YYYY HH:MM:SS Facility-Sev-Name
         # --------------------------------------------------------------------------------
         # 03/30/2023 02:32:41 %Unrecognized message ID 2504
         # 03/30/2023 03:16:41 %IOSXE-2-DIAGNOSTICS_PASSED : Diagnostics Thermal passed
-        p4= re.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s(?P<time>\d+:\d+:\d+)\s+(?P<con_facility_sev_name>%.*)$')
+        p4= regex_engine.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s(?P<time>\d+:\d+:\d+)\s+(?P<con_facility_sev_name>%.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -174,30 +176,30 @@ class ShowLoggingOnboardSwitchEnvironmentDetail(ShowLoggingOnboardSwitchEnvironm
         # regex pattern
 
         #ENVIRONMENT SUMMARY INFORMATION
-        p1 = re.compile(r'^^ENVIRONMENT SUMMARY INFORMATION$$')
+        p1 = regex_engine.compile(r'^^ENVIRONMENT SUMMARY INFORMATION$$')
 
 
         # MM/DD/YYYY HH:MM:SS   Ins count  Rem count  
         # 04/04/2023 10:36:47    27         0        
-        p2_1 = re.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s+(?P<time>(?:(?:([01]?\d|2[0-3]):)?([0-5]?\d):)?([0-5]?\d))\s+(?P<ins_count>\d+)\s+(?P<rem_count>\d+)$')
+        p2_1 = regex_engine.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s+(?P<time>(?:(?:([01]?\d|2[0-3]):)?([0-5]?\d):)?([0-5]?\d))\s+(?P<ins_count>\d+)\s+(?P<rem_count>\d+)$')
 
         #  VID    PID                  TAN          Serial No
         #  V01    C9407-FAN            C1           FXS222800XL
-        p2_2 = re.compile(r'(?P<vid>\w+)\s+(?P<pid>\w+\-\w+)\s+(?P<tan>\w+)\s+(?P<serial_no>\w+)')
+        p2_2 = regex_engine.compile(r'(?P<vid>\w+)\s+(?P<pid>\w+\-\w+)\s+(?P<tan>\w+)\s+(?P<serial_no>\w+)')
         # ENVIRONMENT CONTINUOUS INFORMATION
-        p3 = re.compile(r'^ENVIRONMENT CONTINUOUS INFORMATION$')
+        p3 = regex_engine.compile(r'^ENVIRONMENT CONTINUOUS INFORMATION$')
 
         # MM/DD/YYYY  HH:MM:SS   Device Name        IOS Version   F/W Ver   BIOSVer  RAM(KB)     Event  
         # ----------------------------------------------------------------------------------------------
         # 04/04/2023   03:27:36  obfl0:             17.06.04      386204    17.10.1r    0        Ins    
         # 04/05/2023   07:33:49  obfl0:             17.06.04      386204    17.10.1r    0        Ins     
-        p4_1= re.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s+(?P<time>(?:(?:([01]?\d|2[0-3]):)?([0-5]?\d):)?([0-5]?\d))\s+(?P<device_name>\w+)\:\s+(?P<ios_version>\d+.\d+.\d+)\s+(?P<fw_version>\d+)\s+(?P<bios_ver>\w+.\w+.\w+)\s+(?P<ram_size>\d+)\s+(?P<event>\w+)$')
+        p4_1= regex_engine.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s+(?P<time>(?:(?:([01]?\d|2[0-3]):)?([0-5]?\d):)?([0-5]?\d))\s+(?P<device_name>\w+)\:\s+(?P<ios_version>\d+.\d+.\d+)\s+(?P<fw_version>\d+)\s+(?P<bios_ver>\w+.\w+.\w+)\s+(?P<ram_size>\d+)\s+(?P<event>\w+)$')
 
         #  VID   PID           TAN   Serial No
         # --------------------------------------
         #  V01   C9407-FAN     C1    FXS222800XL
         #  V01   C9407-FAN     C1   FXS222800XL
-        p4_2= re.compile(r'(?P<vid>\w+)\s+(?P<pid>\w+\-\w+)\s+(?P<tan>\w+)\s+(?P<serial_no>\w+)')
+        p4_2= regex_engine.compile(r'(?P<vid>\w+)\s+(?P<pid>\w+\-\w+)\s+(?P<tan>\w+)\s+(?P<serial_no>\w+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -320,36 +322,36 @@ class ShowLoggingOnboardSwitchCounterDetail(ShowLoggingOnboardSwitchCounterDetai
         # regex pattern
 
         # COUNTER SUMMARY INFORMATION
-        p1 = re.compile(r'^COUNTER SUMMARY INFORMATION$')
+        p1 = regex_engine.compile(r'^COUNTER SUMMARY INFORMATION$')
 
         # ERROR TYPE | VID  |     PID    |      TAN    SNO         |  COUNT
         # -----------------------------------------------------------------
         # 1            ,V02,    C9400-SUP-1XL   ,A0  ,JAE22300GFU,     20
-        p2_1 = re.compile(r'^(?P<error_type>\d+).(?P<vid>\w+).(?P<pid>\w+\-\w+\-\w+)\s+.(?P<tan>\w+)\s+.(?P<sno>\w+).(?P<count>\d+)$')
+        p2_1 = regex_engine.compile(r'^(?P<error_type>\d+).(?P<vid>\w+).(?P<pid>\w+\-\w+\-\w+)\s+.(?P<tan>\w+)\s+.(?P<sno>\w+).(?P<count>\d+)$')
 
         # ERROR TYPE | VID  |     PID    |      TAN    SNO         |  COUNT
         # -----------------------------------------------------------------
         # 1            ,,    C9400-SUP-1XL   ,A0  ,JAE22300GFU,     20
-        p2_2 = re.compile(r'^(?P<error_type>\d+)..(?P<pid>\w+\-\w+\-\w+)\s+.(?P<tan>\w+)\s+.(?P<sno>\w+).(?P<count>\d+)$')
+        p2_2 = regex_engine.compile(r'^(?P<error_type>\d+)..(?P<pid>\w+\-\w+\-\w+)\s+.(?P<tan>\w+)\s+.(?P<sno>\w+).(?P<count>\d+)$')
 
         # ERROR TYPE | VID  |     PID    |      TAN    SNO         |  COUNT
         # -----------------------------------------------------------------
         # No historical data
-        p2_3= re.compile(r'^(?P<no_data>No historical data)$')
+        p2_3= regex_engine.compile(r'^(?P<no_data>No historical data)$')
         # COUNTER LOGGING CONTINUOUS INFORMATION
-        p3 = re.compile(r'^COUNTER LOGGING CONTINUOUS INFORMATION$')
+        p3 = regex_engine.compile(r'^COUNTER LOGGING CONTINUOUS INFORMATION$')
 
         # MM/DD/YYYY HH:MM:SS  | DEVNAME            | SLOT | TYP | COUNT  
         # --------------------------------------------------------------
         #  04/01/2023 09:04:24   obfl0:                3      1     20 
         #  04/03/2023 19:34:23   obfl0:                3      1     20
-        p4_1= re.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s(?P<time>\d+:\d+:\d+)\s(?P<devname>\w+)\:\s+(?P<slot>\d+)\s+(?P<typ>\d+)\s+(?P<count>\d+)$')
+        p4_1= regex_engine.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s(?P<time>\d+:\d+:\d+)\s(?P<devname>\w+)\:\s+(?P<slot>\d+)\s+(?P<typ>\d+)\s+(?P<count>\d+)$')
 
         # VID | PID                | TAN        | S.NO
         # ---------------------------------------------------
         # V02   C9400-SUP-1XL        A0           JAE22350Z2M
         # V02   C9400-SUP-1XL        A0           JAE22350Z2M
-        p4_2= re.compile(r'^(?P<vid>\w+)\s+(?P<pid>\w+\-\w+\-\w+)\s+(?P<tan>\w+)\s+(?P<serial_no>\w+)$')
+        p4_2= regex_engine.compile(r'^(?P<vid>\w+)\s+(?P<pid>\w+\-\w+\-\w+)\s+(?P<tan>\w+)\s+(?P<serial_no>\w+)$')
         for line in output.splitlines():
             line = line.strip()
 
@@ -483,22 +485,22 @@ class ShowLoggingOnboardSwitchClilogDetail(ShowLoggingOnboardSwitchClilogDetailS
         # regex pattern
 
         # CLI LOGGING SUMMARY INFORMATION
-        p1 = re.compile(r'^CLI LOGGING SUMMARY INFORMATION$')
+        p1 = regex_engine.compile(r'^CLI LOGGING SUMMARY INFORMATION$')
 
         # COUNT COMMAND
         # --------------------------------------------------------------------------------
         # No summary data to display
 
-        p2_1= re.compile(r'^(?P<no_sum_data>No summary data to display)$')
+        p2_1= regex_engine.compile(r'^(?P<no_sum_data>No summary data to display)$')
 
         # COUNT COMMAND
         # --------------------------------------------------
         #  1    show logging onboard RP active clilog detail
         #  1    show logging onboard RP active counter detail
-        p2_2 = re.compile(r'^(?P<count>\d+)\s+(?P<command>show.*)$')
+        p2_2 = regex_engine.compile(r'^(?P<count>\d+)\s+(?P<command>show.*)$')
 
         # COUNTER LOGGING CONTINUOUS INFORMATION
-        p3 = re.compile(r'^CLI LOGGING CONTINUOUS INFORMATION$')
+        p3 = regex_engine.compile(r'^CLI LOGGING CONTINUOUS INFORMATION$')
 
 
         # --------------------------------------------------------------------------------
@@ -506,13 +508,13 @@ class ShowLoggingOnboardSwitchClilogDetail(ShowLoggingOnboardSwitchClilogDetailS
         # --------------------------------------------------------------------------------
 
         # No continuous data
-        p4_1 = re.compile(r'^(?P<no_cont_data>No continuous data)$')
+        p4_1 = regex_engine.compile(r'^(?P<no_cont_data>No continuous data)$')
 
         # MM/DD/YYYY HH:MM:SS COMMAND
         # -----------------------------------------------------------------
         #  03/30/2023 02:41:08 show logging onboard RP active clilog detail
         #  03/30/2023 02:41:43 show logging onboard RP active counter detail
-        p4_2= re.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s(?P<time>\d+:\d+:\d+)\s(?P<command>show.*)$')
+        p4_2= regex_engine.compile(r'^(?P<date>\d{2}\/\d{2}\/\d{4})\s(?P<time>\d+:\d+:\d+)\s(?P<command>show.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -15,13 +15,13 @@ IOSXE C9400 parsers for the following show commands:
 '''
 
 # Python
-import re
 import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 log = logging.getLogger(__name__)
@@ -74,14 +74,14 @@ class ShowEnvironment(ShowEnvironmentSchema):
         ret_dict = {}
 
         # Number of Critical alarms:  0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Number +of +Critical +alarms: +(?P<critic_alarms>\d+)$')
 
         # Number of Major alarms:     0
-        p2 = re.compile(r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$')
+        p2 = regex_engine.compile(r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$')
 
         # Number of Minor alarms:     0
-        p3 = re.compile(r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$')
+        p3 = regex_engine.compile(r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$')
 
         # Slot        Sensor          Current State   Reading        Threshold(Minor,Major,Critical,Shutdown)
         # ----------  --------------  --------------- ------------   ---------------------------------------
@@ -90,7 +90,7 @@ class ShowEnvironment(ShowEnvironmentSchema):
         # R0          HotSwap: Volts  Normal          53   V DC   	na
         # R0          Temp:   outlet  Normal          39   Celsius	(63 ,73 ,103,105)(Celsius)
         # R0          Temp:    inlet  Normal          32   Celsius	(56 ,66 ,96 ,98 )(Celsius)
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'(?P<slot>\S+)\s+(?P<sensor_name>\S+(:\s+\S+)?)\s+(?P<state>\S+)\s+(?P<reading>\d+\s+\S+(\s+(AC|DC))?)\s+(\((?P<minor>\d+\s*),(?P<major>\d+\s*),(?P<critical>\d+\s*),(?P<shutdown>\d+\s*)\)\((?P<unit>\S+)\))?'
         )
 
@@ -225,24 +225,24 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
         ret_dict = {}
 
         # Number of Critical alarms:  0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Number +of +Critical +alarms: +(?P<critic_alarms>\d+)$')
 
         # Number of Major alarms:     0
-        p2 = re.compile(r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$')
+        p2 = regex_engine.compile(r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$')
 
         # Number of Minor alarms:     0
-        p3 = re.compile(r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$')
+        p3 = regex_engine.compile(r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$')
 
         # Sensor List:  Environmental Monitoring
-        p4 = re.compile(r'Sensor\s+List:\s+(?P<sensor_list>.+)')
+        p4 = regex_engine.compile(r'Sensor\s+List:\s+(?P<sensor_list>.+)')
 
         #  Sensor           Location          State          Reading           Threshold(Minor,Major,Critical,Shutdown)
         #  Temp: Coretemp   R0                Normal            48 Celsius          	(107,117,123,125)(Celsius)
         #  Temp: UADP       R0                Normal            56 Celsius          	(107,117,123,125)(Celsius)
         #  V1: VX1          R0                Normal            869 mV               	na
         #  Temp:    inlet   R0                Normal            32 Celsius          	(56 ,66 ,96 ,98 )(Celsius)
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'(?P<sensor_name>\S+(:\s+\S+)?)\s+(?P<slot>([A-Z][0-9]|\d/\d))\s+(?P<state>\S+)\s+(?P<reading>\d+\s+\S+(\s+(AC|DC))?)\s+(\((?P<minor>\d+\s*),(?P<major>\d+\s*),(?P<critical>\d+\s*),(?P<shutdown>\d+\s*)\)\((?P<unit>\S+)\))?'
         )
 
@@ -251,7 +251,7 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
         # ------  --------------------  ----  --------  ------------  -----------
         # PS1     C9400-PWR-3200AC      ac    3200 W    active        good  good
         # PS2     C9400-PWR-3200AC      ac    n.a.      faulty        good  good
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'(?P<ps_slot>PS\S+)\s+(?P<model_no>\S+)\s+(?P<type>\S+)\s+(?P<capacity>\S+(\s+\S+)?)\s+(?P<status>\S+)\s+(?P<fan_1_state>\S+)\s+(?P<fan_2_state>\S+)$'
         )
 
@@ -259,7 +259,7 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
         # PS Current Operating State    : Combined
         # Power supplies currently active    : 1
         # Power supplies currently available : 1
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'(PS|Power supplies)\s+(?P<ps_key>.+)\s+:\s+(?P<ps_value>\S+)')
 
         # Fantray : good
@@ -268,7 +268,7 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
         # Fantray beacon LED: off
         # Fantray status LED: green
         # SYSTEM : GREEN
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'(?P<fantray_key>((.+)?Fantray(.+)?)|SYSTEM)(\s+)?:\s+(?P<fantray_value>(\S+)|(\d+\s+Watts))'
         )
 
@@ -415,34 +415,34 @@ class ShowBoot(ShowBootSchema):
             output = self.device.execute(self.cli_command)
 
         # BOOT variable = flash:packages.conf;
-        p1 = re.compile(r'(^BOOT\s*variable)\s*=\s*(?P<boot_variable>.*);$')
+        p1 = regex_engine.compile(r'(^BOOT\s*variable)\s*=\s*(?P<boot_variable>.*);$')
         # MANUAL_BOOT variable = no
-        p2 = re.compile(r'(^MANUAL_BOOT\s*variable)\s*=\s*(?P<manual_boot>\w+)$')
+        p2 = regex_engine.compile(r'(^MANUAL_BOOT\s*variable)\s*=\s*(?P<manual_boot>\w+)$')
         # BAUD variable = 9600
-        p3 = re.compile(r'(^BAUD\s*variable)\s*=\s*(?P<baud_variable>\w+)$')
+        p3 = regex_engine.compile(r'(^BAUD\s*variable)\s*=\s*(?P<baud_variable>\w+)$')
         # ENABLE_BREAK variable = yes
-        p4 = re.compile(r'(^ENABLE_BREAK\s*variable)\s*=?\s*(?P<enable_break>.*)$')
+        p4 = regex_engine.compile(r'(^ENABLE_BREAK\s*variable)\s*=?\s*(?P<enable_break>.*)$')
         # BOOTMODE variable = yes
-        p5 = re.compile(r'(^BOOTMODE\s*variable)\s*=?\s*(?P<boot_mode>.*)$')
+        p5 = regex_engine.compile(r'(^BOOTMODE\s*variable)\s*=?\s*(?P<boot_mode>.*)$')
         # IPXE_TIMEOUT variable = 0
-        p6 = re.compile(r'(^IPXE_TIMEOUT\s*variable)\s*=?\s*(?P<ipxe_timeout>.*)$')
+        p6 = regex_engine.compile(r'(^IPXE_TIMEOUT\s*variable)\s*=?\s*(?P<ipxe_timeout>.*)$')
         # CONFIG_FILE variable = 0
-        p7 = re.compile(r'(^CONFIG_FILE\s*variable)\s*=\s*(?P<config_file>.*)$')
+        p7 = regex_engine.compile(r'(^CONFIG_FILE\s*variable)\s*=\s*(?P<config_file>.*)$')
 
         # Standby BOOT variable = flash:packages.conf;
-        p8 = re.compile(r'(^Standby\s*BOOT\s*variable)\s*=\s*(?P<standby_boot_variable>.*);$')
+        p8 = regex_engine.compile(r'(^Standby\s*BOOT\s*variable)\s*=\s*(?P<standby_boot_variable>.*);$')
         # Standby MANUAL_BOOT variable = no
-        p9 = re.compile(r'(^Standby\s*MANUAL_BOOT\s*variable)\s*=\s*(?P<standby_manual_boot>\w+)$')
+        p9 = regex_engine.compile(r'(^Standby\s*MANUAL_BOOT\s*variable)\s*=\s*(?P<standby_manual_boot>\w+)$')
         # Standby BAUD variable = 9600
-        p10 = re.compile(r'(^Standby\s*BAUD\s*variable)\s*=\s*(?P<standby_baud_variable>\w+)$')
+        p10 = regex_engine.compile(r'(^Standby\s*BAUD\s*variable)\s*=\s*(?P<standby_baud_variable>\w+)$')
         # Standby ENABLE_BREAK variable = yes
-        p11 = re.compile(r'(^Standby\s*ENABLE_BREAK\s*variable)\s*=?\s*(?P<standby_enable_break>.*)$')
+        p11 = regex_engine.compile(r'(^Standby\s*ENABLE_BREAK\s*variable)\s*=?\s*(?P<standby_enable_break>.*)$')
         # Standby BOOTMODE variable = yes
-        p12 = re.compile(r'(^Standby\s*BOOTMODE\s*variable)\s*=?\s*(?P<standby_boot_mode>.*)$')
+        p12 = regex_engine.compile(r'(^Standby\s*BOOTMODE\s*variable)\s*=?\s*(?P<standby_boot_mode>.*)$')
         # Standby IPXE_TIMEOUT variable = 0
-        p13 = re.compile(r'(^Standby\s*IPXE_TIMEOUT\s*variable)\s*=?\s*(?P<standby_ipxe_timeout>.*)$')
+        p13 = regex_engine.compile(r'(^Standby\s*IPXE_TIMEOUT\s*variable)\s*=?\s*(?P<standby_ipxe_timeout>.*)$')
         # Standby CONFIG_FILE variable = 0
-        p14 = re.compile(r'(^Standby\s*CONFIG_FILE\s*variable)\s*=\s*(?P<standby_config_file>.*)$')
+        p14 = regex_engine.compile(r'(^Standby\s*CONFIG_FILE\s*variable)\s*=\s*(?P<standby_config_file>.*)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -566,13 +566,13 @@ class ShowModule(ShowModuleSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<switch>\d+) *'
-                        r'(?P<port>\w+) +'
-                        r'(?P<model>[\w\-]+) +'
-                        r'(?P<serial_number>\w+) +'
-                        r'(?P<mac_address>[\w\.]+) +'
-                        r'(?P<hw_ver>\w+) +'
-                        r'(?P<sw_ver>[\w\.]+)$')
+        p1 = regex_engine.compile(r'^(?P<switch>\d+) *'
+                                  r'(?P<port>\w+) +'
+                                  r'(?P<model>[\w\-]+) +'
+                                  r'(?P<serial_number>\w+) +'
+                                  r'(?P<mac_address>[\w\.]+) +'
+                                  r'(?P<hw_ver>\w+) +'
+                                  r'(?P<sw_ver>[\w\.]+)$')
 
         # Chassis Type: C9500X-28C8D
 
@@ -581,23 +581,23 @@ class ShowModule(ShowModuleSchema):
         # 1   38   Cisco Catalyst 9500X-28C8D Switch           C9500X-28C8D     FDO25030SLN
         # 10  24   24-Port 10 Gigabit Ethernet (SFP+)          C9400-LC-24XS    JAE21500658
 
-        p2=re.compile(r'^(?P<mod>[\d]+)\s+(?P<ports>[\d]+)\s+(?P<card_type>.*)\s+(?P<model>\S+)\s+(?P<serial>\S+)$')
+        p2=regex_engine.compile(r'^(?P<mod>[\d]+)\s+(?P<ports>[\d]+)\s+(?P<card_type>.*)\s+(?P<model>\S+)\s+(?P<serial>\S+)$')
 
         # Mod MAC addresses                    Hw   Fw           Sw                 Status
         # ---+--------------------------------+----+------------+------------------+--------
         # 1   F87A.4125.1400 to F87A.4125.147D 0.2  17.7.0.41     BLD_POLARIS_DEV_LA ok
 
-        p3=re.compile(r'^(?P<mod_1>\d+)+\s+(?P<mac_address>[\w\.]+) .*(?P<hw>\d+.?\d+?) +(?P<fw>\S+) +(?P<sw>\S+) +(?P<status>\S+)$')
+        p3=regex_engine.compile(r'^(?P<mod_1>\d+)+\s+(?P<mac_address>[\w\.]+) .*(?P<hw>\d+.?\d+?) +(?P<fw>\S+) +(?P<sw>\S+) +(?P<status>\S+)$')
 
         #Mod Redundancy Role     Operating Mode  Configured Mode  Redundancy Status
         #---+-------------------+---------------+---------------+------------------
         #3   Active              sso             sso              Active
         #4   Standby             sso             sso              Standby Hot
 
-        p4=re.compile(r'^(?P<mod_2>\d+)+ *(?P<redundancy_role>\S+) *(?P<operating_redundancy_mode>\S+) *(?P<configured_redundancy_mode>\S+) *(?P<redundancy_status>.*)$')
+        p4=regex_engine.compile(r'^(?P<mod_2>\d+)+ *(?P<redundancy_role>\S+) *(?P<operating_redundancy_mode>\S+) *(?P<configured_redundancy_mode>\S+) *(?P<redundancy_status>.*)$')
 
         #Chassis MAC address range: 512 addresses from f87a.4125.1400 to f87a.4125.15ff
-        p5=re.compile(r'^Chassis MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$')
+        p5=regex_engine.compile(r'^Chassis MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -701,38 +701,38 @@ class ShowHardwareLed(ShowHardwareLedSchema):
         ret_dict = {}
 
         # SWITCH: C9404R
-        p1 = re.compile(r'^SWITCH:\s+(?P<switch>\S+)$')
+        p1 = regex_engine.compile(r'^SWITCH:\s+(?P<switch>\S+)$')
 
         # SYSTEM: GREEN
-        p2 = re.compile(r'^SYSTEM:\s+(?P<system>\w+)$')
+        p2 = regex_engine.compile(r'^SYSTEM:\s+(?P<system>\w+)$')
 
         # Line Card : 1
         # SUPERVISOR: ACTIVE
-        p3 = re.compile(r'^(Line Card :|SUPERVISOR:)\s+(?P<line_card_supervisor>\w+)$')
+        p3 = regex_engine.compile(r'^(Line Card :|SUPERVISOR:)\s+(?P<line_card_supervisor>\w+)$')
 
         # PORT STATUS: (48)
-        p4 = re.compile(r'^PORT STATUS:\s+\((?P<port_nums_in_status>\d+)\)+\s+(?P<led_ports>((\S+:[\w-]+\s*))+)$')
+        p4 = regex_engine.compile(r'^PORT STATUS:\s+\((?P<port_nums_in_status>\d+)\)+\s+(?P<led_ports>((\S+:[\w-]+\s*))+)$')
 
         # BEACON:     OFF
-        p5 = re.compile(r'^BEACON:\s+(?P<beacon>\w+)$')
+        p5 = regex_engine.compile(r'^BEACON:\s+(?P<beacon>\w+)$')
 
         # STATUS: GREEN
-        p6 = re.compile(r'^STATUS:\s+(?P<status>\w+)$')
+        p6 = regex_engine.compile(r'^STATUS:\s+(?P<status>\w+)$')
 
         # GROUP LED: UPLINK-G1:GREEN UPLINK-G2:BLACK UPLINK-G3:BLACK UPLINK-G4:BLACK
-        p7 = re.compile(r'^GROUP LED:\s+(?P<group_led>((\S+:\w+\s*))+)$')
+        p7 = regex_engine.compile(r'^GROUP LED:\s+(?P<group_led>((\S+:\w+\s*))+)$')
 
         # RJ45 CONSOLE: GREEN
-        p8 = re.compile(r'^RJ45 CONSOLE:\s+(?P<rj45_console>\w+)$')
+        p8 = regex_engine.compile(r'^RJ45 CONSOLE:\s+(?P<rj45_console>\w+)$')
 
         # FANTRAY STATUS: GREEN
-        p9 = re.compile(r'^FANTRAY STATUS:\s+(?P<fantray_status>\w+)$')
+        p9 = regex_engine.compile(r'^FANTRAY STATUS:\s+(?P<fantray_status>\w+)$')
 
         # FANTRAY BEACON: BLACK
-        p10 = re.compile(r'^FANTRAY BEACON:\s+(?P<fantray_beacon>\w+)$')
+        p10 = regex_engine.compile(r'^FANTRAY BEACON:\s+(?P<fantray_beacon>\w+)$')
 
         # POWER-SUPPLY 1 BEACON: OFF
-        p11 = re.compile(r'^POWER-SUPPLY\s+(?P<power_supply_num>\d+)\s+BEACON:\s+(?P<power_supply_status>\w+)$')
+        p11 = regex_engine.compile(r'^POWER-SUPPLY\s+(?P<power_supply_num>\d+)\s+BEACON:\s+(?P<power_supply_status>\w+)$')
 
 
         for line in output.splitlines():
@@ -861,22 +861,22 @@ class ShowPlatformHardwareChassisFantrayDetail(ShowPlatformHardwareChassisFantra
         ret_dict = {}
 
         # Row  Fan1   | Fan2   | Fan3   | Fan4   | Throttle | Interrupt Source | Temp | Press
-        p1 = re.compile(r'^\s*Row\s+(?P<header>.*)$')
+        p1 = regex_engine.compile(r'^\s*Row\s+(?P<header>.*)$')
 
         # 1    3450     3510     3480     3510     35%        0x0                28       102
-        p2 = re.compile(r'^\s*(?P<row>\d+)\s+(?P<fan_data>.*)\s+(?P<throttle>\S+)\s+(?P<interrupt_source>\S+)\s+(?P<temp>\S+)\s+(?P<press>\S+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<row>\d+)\s+(?P<fan_data>.*)\s+(?P<throttle>\S+)\s+(?P<interrupt_source>\S+)\s+(?P<temp>\S+)\s+(?P<press>\S+)$')
 
         # Fantray global interrupt source register
-        p3 = re.compile(r'^Fantray global interrupt source register = (?P<interrupt_source_register>\S+)$')
+        p3 = regex_engine.compile(r'^Fantray global interrupt source register = (?P<interrupt_source_register>\S+)$')
 
         # Fantray global version
-        p4 = re.compile(r'^Fantray global version: (?P<global_version>\d+)$')
+        p4 = regex_engine.compile(r'^Fantray global version: (?P<global_version>\d+)$')
 
         # Fantray beacon LED status
-        p5 = re.compile(r'^Fantray beacon LED status: (?P<beacon_led_status>\S+)$')
+        p5 = regex_engine.compile(r'^Fantray beacon LED status: (?P<beacon_led_status>\S+)$')
 
         # Fantray status LED
-        p6 = re.compile(r'^Fantray status LED: (?P<status_led>\S+)$')
+        p6 = regex_engine.compile(r'^Fantray status LED: (?P<status_led>\S+)$')
 
         headers = []  # Initialize headers list
 
@@ -967,22 +967,22 @@ class ShowPlatformHardwareChassisFantrayDetailSwitch(ShowPlatformHardwareChassis
         ret_dict = {}
 
         # Row  Fan1   | Fan2   | Fan3   | Fan4   | Throttle | Interrupt Source | Temp | Press
-        p1 = re.compile(r'^\s*Row\s+(?P<header>.*)$')
+        p1 = regex_engine.compile(r'^\s*Row\s+(?P<header>.*)$')
 
         # 1    3450     3510     3480     3510     35%        0x0                28       102
-        p2 = re.compile(r'^\s*(?P<row>\d+)\s+(?P<fan_data>.*?)\s+(?P<throttle>\S+)\s+(?P<interrupt_source>\S+)\s+(?P<temp>\S+)\s+(?P<press>\S+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<row>\d+)\s+(?P<fan_data>.*?)\s+(?P<throttle>\S+)\s+(?P<interrupt_source>\S+)\s+(?P<temp>\S+)\s+(?P<press>\S+)$')
 
         # Pattern for Fantray global interrupt source register
-        p3 = re.compile(r'^Fantray global interrupt source register = (?P<interrupt_source_register>\S+)$')
+        p3 = regex_engine.compile(r'^Fantray global interrupt source register = (?P<interrupt_source_register>\S+)$')
 
         # Pattern for Fantray global version
-        p4 = re.compile(r'^Fantray global version: (?P<global_version>\S+)$')
+        p4 = regex_engine.compile(r'^Fantray global version: (?P<global_version>\S+)$')
 
         # Pattern for Fantray beacon LED status
-        p5 = re.compile(r'^Fantray beacon LED status: (?P<beacon_led_status>\S+)$')
+        p5 = regex_engine.compile(r'^Fantray beacon LED status: (?P<beacon_led_status>\S+)$')
 
         # Pattern for Fantray status LED
-        p6 = re.compile(r'^Fantray status LED: (?P<status_led>\S+)$')
+        p6 = regex_engine.compile(r'^Fantray status LED: (?P<status_led>\S+)$')
 
         headers = []  # Initialize headers list
 
@@ -1069,22 +1069,22 @@ class ShowPlatformHardwareChassisFantrayDetail(ShowPlatformHardwareChassisFantra
         ret_dict = {}
 
         # Row  Fan1   | Fan2   | Fan3   | Fan4   | Throttle | Interrupt Source | Temp | Press
-        p1 = re.compile(r'^\s*Row\s+(?P<header>.*)$')
+        p1 = regex_engine.compile(r'^\s*Row\s+(?P<header>.*)$')
 
         # 1    3450     3510     3480     3510     35%        0x0                28       102
-        p2 = re.compile(r'^\s*(?P<row>\d+)\s+(?P<fan_data>.*)\s+(?P<throttle>\S+)\s+(?P<interrupt_source>\S+)\s+(?P<temp>\S+)\s+(?P<press>\S+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<row>\d+)\s+(?P<fan_data>.*)\s+(?P<throttle>\S+)\s+(?P<interrupt_source>\S+)\s+(?P<temp>\S+)\s+(?P<press>\S+)$')
 
         # Fantray global interrupt source register
-        p3 = re.compile(r'^Fantray global interrupt source register = (?P<interrupt_source_register>\S+)$')
+        p3 = regex_engine.compile(r'^Fantray global interrupt source register = (?P<interrupt_source_register>\S+)$')
 
         # Fantray global version
-        p4 = re.compile(r'^Fantray global version: (?P<global_version>\d+)$')
+        p4 = regex_engine.compile(r'^Fantray global version: (?P<global_version>\d+)$')
 
         # Fantray beacon LED status
-        p5 = re.compile(r'^Fantray beacon LED status: (?P<beacon_led_status>\S+)$')
+        p5 = regex_engine.compile(r'^Fantray beacon LED status: (?P<beacon_led_status>\S+)$')
 
         # Fantray status LED
-        p6 = re.compile(r'^Fantray status LED: (?P<status_led>\S+)$')
+        p6 = regex_engine.compile(r'^Fantray status LED: (?P<status_led>\S+)$')
 
         headers = []  # Initialize headers list
 
@@ -1175,22 +1175,22 @@ class ShowPlatformHardwareChassisFantrayDetailSwitch(ShowPlatformHardwareChassis
         ret_dict = {}
 
         # Row  Fan1   | Fan2   | Fan3   | Fan4   | Throttle | Interrupt Source | Temp | Press
-        p1 = re.compile(r'^\s*Row\s+(?P<header>.*)$')
+        p1 = regex_engine.compile(r'^\s*Row\s+(?P<header>.*)$')
 
         # 1    3450     3510     3480     3510     35%        0x0                28       102
-        p2 = re.compile(r'^\s*(?P<row>\d+)\s+(?P<fan_data>.*?)\s+(?P<throttle>\S+)\s+(?P<interrupt_source>\S+)\s+(?P<temp>\S+)\s+(?P<press>\S+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<row>\d+)\s+(?P<fan_data>.*?)\s+(?P<throttle>\S+)\s+(?P<interrupt_source>\S+)\s+(?P<temp>\S+)\s+(?P<press>\S+)$')
 
         # Pattern for Fantray global interrupt source register
-        p3 = re.compile(r'^Fantray global interrupt source register = (?P<interrupt_source_register>\S+)$')
+        p3 = regex_engine.compile(r'^Fantray global interrupt source register = (?P<interrupt_source_register>\S+)$')
 
         # Pattern for Fantray global version
-        p4 = re.compile(r'^Fantray global version: (?P<global_version>\S+)$')
+        p4 = regex_engine.compile(r'^Fantray global version: (?P<global_version>\S+)$')
 
         # Pattern for Fantray beacon LED status
-        p5 = re.compile(r'^Fantray beacon LED status: (?P<beacon_led_status>\S+)$')
+        p5 = regex_engine.compile(r'^Fantray beacon LED status: (?P<beacon_led_status>\S+)$')
 
         # Pattern for Fantray status LED
-        p6 = re.compile(r'^Fantray status LED: (?P<status_led>\S+)$')
+        p6 = regex_engine.compile(r'^Fantray status LED: (?P<status_led>\S+)$')
 
         headers = []  # Initialize headers list
 
@@ -1292,10 +1292,10 @@ class ShowPlatformHardwareChassisPowerSupplyDetailSwitchAll(ShowPlatformHardware
         ret_dict = {}
 
         # PS2       1.6       n.a       239       n.a       348       n.a       5.7       55        310       4151      3957      48
-        p1 = re.compile(r'^\s*(?P<slot>PS\d+)\s+(?P<current_a>\S+)\s+(?P<current_b>\S+)\s+(?P<voltage_a>\S+)\s+(?P<voltage_b>\S+)\s+(?P<power_a>\S+)\s+(?P<power_b>\S+)\s+(?P<current>\S+)\s+(?P<voltage>\S+)\s+(?P<power>\S+)\s+(?P<fan1_speed>\S+)\s+(?P<fan2_speed>\S+)\s+(?P<heatsink_temperature>\S+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<slot>PS\d+)\s+(?P<current_a>\S+)\s+(?P<current_b>\S+)\s+(?P<voltage_a>\S+)\s+(?P<voltage_b>\S+)\s+(?P<power_a>\S+)\s+(?P<power_b>\S+)\s+(?P<current>\S+)\s+(?P<voltage>\S+)\s+(?P<power>\S+)\s+(?P<fan1_speed>\S+)\s+(?P<fan2_speed>\S+)\s+(?P<heatsink_temperature>\S+)$')
 
         # PS2     REAL_TIME_FAULT   0x00 0x00 0x00  No Faults
-        p2 = re.compile(r'^(?P<slot>PS\d+)\s+(?P<reg_name>\S+)\s+(?P<reg_value>(?:0x[\dA-Fa-f]+\s*)+)\s+(?P<description>.+)$')
+        p2 = regex_engine.compile(r'^(?P<slot>PS\d+)\s+(?P<reg_name>\S+)\s+(?P<reg_value>(?:0x[\dA-Fa-f]+\s*)+)\s+(?P<description>.+)$')
 
         # Parse each line of the output
         for line in output.splitlines():
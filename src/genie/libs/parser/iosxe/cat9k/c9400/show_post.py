@@ -2,13 +2,13 @@
 IOSXE C9400 parsers for the following show commands:
      * show post
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowPostSchema(MetaParser):
     """
@@ -47,16 +47,16 @@ class ShowPost(ShowPostSchema):
         ret_dict={}
 
         # Switch 1
-        p1 = re.compile(r'^Switch\s+(?P<switch_num>\S+)$')
+        p1 = regex_engine.compile(r'^Switch\s+(?P<switch_num>\S+)$')
 
         # POST: PHY Loopback: loopback Test : End, Status Passed
         # POST: Thermal, Temperature Tests : End, Status Passed
         # POST: CRYPTO Tests : End, Status Passed
         # POST: MBIST Tests : End, Status Passed
-        p2 = re.compile(r'^POST.*:(?P<test>.+Tests*)\s+:\s+End, Status (?P<status>Passed|Failed)$')
+        p2 = regex_engine.compile(r'^POST.*:(?P<test>.+Tests*)\s+:\s+End, Status (?P<status>Passed|Failed)$')
 
         #POST: Module: 3 PHY Loopback: loopback Test: End, Status Passed
-        p3 = re.compile(r'^POST: Module:\s+(?P<module>\d+)\s+(?P<test>.+Tests*)\s*:\s+End, Status (?P<status>Passed|Failed)$')
+        p3 = regex_engine.compile(r'^POST: Module:\s+(?P<module>\d+)\s+(?P<test>.+Tests*)\s*:\s+End, Status (?P<status>Passed|Failed)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -5,14 +5,12 @@ IOSXE parsers for the following show commands:
 '''
 
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, ListOf, Optional, And, Default, Use
 
 # Common
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =================================================
@@ -56,34 +54,34 @@ class ShowFlowMonitor(ShowFlowMonitorSchema):
         ret_dict = {}
 
         # Flow Monitor v4_mon_sgt-output:
-        p1 = re.compile(r'^Flow\sMonitor\s(?P<flow_monitor>[\w\-]+)\:$')
+        p1 = regex_engine.compile(r'^Flow\sMonitor\s(?P<flow_monitor>[\w\-]+)\:$')
 
         # Description:       User defined
-        p2 = re.compile(r'^Description:\s+(?P<description>[\w\s\.]+)$')
+        p2 = regex_engine.compile(r'^Description:\s+(?P<description>[\w\s\.]+)$')
 
         # Flow Record:       v4-rec_sgt-output
-        p3 = re.compile(r'^Flow\sRecord:\s+(?P<flow_record>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Flow\sRecord:\s+(?P<flow_record>[\S\s]+)$')
 
         # Flow Exporter:     StealthWatch_Exporter
-        p4 = re.compile(r'^Flow\sExporter:\s+(?P<flow_exporter>\S+)$')
+        p4 = regex_engine.compile(r'^Flow\sExporter:\s+(?P<flow_exporter>\S+)$')
 
         # Cache
-        p5 = re.compile(r'^(?P<cache>Cache)\:$')
+        p5 = regex_engine.compile(r'^(?P<cache>Cache)\:$')
 
         # Type:                 normal (Platform cache)
-        p6 = re.compile(r'^Type:\s+(?P<type>.*)$')
+        p6 = regex_engine.compile(r'^Type:\s+(?P<type>.*)$')
 
         # Status:               not allocated
-        p7 = re.compile(r'^Status:\s+(?P<status>[\w\s]+)$')
+        p7 = regex_engine.compile(r'^Status:\s+(?P<status>[\w\s]+)$')
 
         # Size:                 10000 entries
-        p8 = re.compile(r'^Size:\s+(?P<size>\d+)\sentries$')
+        p8 = regex_engine.compile(r'^Size:\s+(?P<size>\d+)\sentries$')
 
         # Inactive Timeout:     15 secs
-        p9 = re.compile(r'^Inactive\sTimeout:\s+(?P<inactive_timeout>\d+)\ssecs$')
+        p9 = regex_engine.compile(r'^Inactive\sTimeout:\s+(?P<inactive_timeout>\d+)\ssecs$')
 
         # Active Timeout:       60 secs
-        p10 = re.compile(r'^Active\sTimeout:\s+(?P<active_timeout>\d+)\ssecs$')
+        p10 = regex_engine.compile(r'^Active\sTimeout:\s+(?P<active_timeout>\d+)\ssecs$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -8,7 +8,9 @@ IOSXE parser for 9500X for the following show commands:
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
-import re
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==========================
 # Schema for:
@@ -55,15 +57,15 @@ class ShowIdpromTan(ShowIdpromTanSchema):
             output = self.device.execute(self.cli_command[0])
 
         # Module 1 Idprom:
-        p1 = re.compile(r"^Module\s+(?P<module_num>\d+)\s+Idprom:$")
+        p1 = regex_engine.compile(r"^Module\s+(?P<module_num>\d+)\s+Idprom:$")
         # Power Supply 0 Idprom:
-        p2 = re.compile(r"^Power\s+Supply\s+(?P<power_supply_num>\d+)\s+Idprom:$")
+        p2 = regex_engine.compile(r"^Power\s+Supply\s+(?P<power_supply_num>\d+)\s+Idprom:$")
         # Fantray 1 Idprom:
-        p3 = re.compile(r"^Fantray\s+(?P<fantray_num>\d+)\s+Idprom:$")
+        p3 = regex_engine.compile(r"^Fantray\s+(?P<fantray_num>\d+)\s+Idprom:$")
         # Top Assy. Part Number           : 68-101195-01
-        p4 = re.compile(r"^Top\s+Assy.\s+Part\s+Number\s+:\s+(?P<part_num>\d+-\d+-\d+)$")
+        p4 = regex_engine.compile(r"^Top\s+Assy.\s+Part\s+Number\s+:\s+(?P<part_num>\d+-\d+-\d+)$")
         # Top Assy. Revision       : A0
-        p5 = re.compile(r"^Top\s+Assy.\s+Revision\s+:\s+(?P<revision_num>\w+)$")
+        p5 = regex_engine.compile(r"^Top\s+Assy.\s+Revision\s+:\s+(?P<revision_num>\w+)$")
 
         ret_dict = {}
 
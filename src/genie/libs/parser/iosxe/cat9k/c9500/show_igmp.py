@@ -6,12 +6,10 @@ IOSXE parsers for the following show commands:
     * show ip igmp snooping groups
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -52,10 +50,10 @@ class ShowIpIgmpSnoopingGroups(ShowIpIgmpSnoopingGroupsSchema):
         igmp_dict = {}
 
         # 12        224.0.1.40               I           v2          Po92
-        p1 = re.compile(r'^(?P<vlan_id>\d+) +(?P<group_ip>[\d\.]+) +(?P<type>\w+) +(?P<version>\w+) +(?P<port>[\S,\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<vlan_id>\d+) +(?P<group_ip>[\d\.]+) +(?P<type>\w+) +(?P<version>\w+) +(?P<port>[\S,\s]+)$')
 
         # 12        225.0.0.1                S                       Po92
-        p1_0 = re.compile(r'^(?P<vlan_id>\d+) +(?P<group_ip>[\d\.]+) +(?P<type>\w+) +(?P<port>[\S,\s]+)$')
+        p1_0 = regex_engine.compile(r'^(?P<vlan_id>\d+) +(?P<group_ip>[\d\.]+) +(?P<type>\w+) +(?P<port>[\S,\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5,15 +5,13 @@ IOSXE c9500 parsers for the following show commands:
    * show issu rollback-timer
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                                Default, Use
 
 # Genie Libs
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -66,38 +64,38 @@ class ShowIssuStateDetail(ShowIssuStateDetailSchema):
         # Compile regexp patterns
 
         # Finished local lock acquisition on R0
-        p0 = re.compile(r'^Finished +local +lock +acquisition'
-                         r' +on +(?P<slot>(\S+))$')
+        p0 = regex_engine.compile(r'^Finished +local +lock +acquisition'
+                                   r' +on +(?P<slot>(\S+))$')
 
         # No ISSU operation is in progress
-        p1 = re.compile(r'^No +ISSU +operation +is +in +progress$')
+        p1 = regex_engine.compile(r'^No +ISSU +operation +is +in +progress$')
 
         # Current ISSU Status: Disabled
-        p2 = re.compile(r'^Current +ISSU +Status: +(?P<current_status>(\S+))$')
+        p2 = regex_engine.compile(r'^Current +ISSU +Status: +(?P<current_status>(\S+))$')
         
         # Previous ISSU Operation: N/A
-        p3 = re.compile(r'^Previous +ISSU +Operation: +(?P<previous_operation>(\S+))$')
+        p3 = regex_engine.compile(r'^Previous +ISSU +Operation: +(?P<previous_operation>(\S+))$')
 
         # System Check                        Status
-        p4 = re.compile(r'^System +Check +Status$')
+        p4 = regex_engine.compile(r'^System +Check +Status$')
 
         # Platform ISSU Support               No
-        p5 = re.compile(r'^Platform +ISSU +Support +(?P<platform_issu_support>(\S+))$')
+        p5 = regex_engine.compile(r'^Platform +ISSU +Support +(?P<platform_issu_support>(\S+))$')
 
         # Standby Online                      No
-        p6 = re.compile(r'^Standby +Online +(?P<standby_online>(\S+))$')
+        p6 = regex_engine.compile(r'^Standby +Online +(?P<standby_online>(\S+))$')
 
         # Autoboot Enabled                    Yes
-        p7 = re.compile(r'^Autoboot +Enabled +(?P<autoboot_enabled>(\S+))$')
+        p7 = regex_engine.compile(r'^Autoboot +Enabled +(?P<autoboot_enabled>(\S+))$')
 
         # SSO Mode                            No
-        p8 = re.compile(r'^SSO +Mode +(?P<sso_mode>(\S+))$')
+        p8 = regex_engine.compile(r'^SSO +Mode +(?P<sso_mode>(\S+))$')
 
         # Install Boot                        No
-        p9 = re.compile(r'^Install +Boot +(?P<install_boot>(\S+))$')
+        p9 = regex_engine.compile(r'^Install +Boot +(?P<install_boot>(\S+))$')
 
         # Valid Boot Media                    Yes
-        p10 = re.compile(r'^Valid +Boot +Media +(?P<valid_boot_media>(\S+))$')
+        p10 = regex_engine.compile(r'^Valid +Boot +Media +(?P<valid_boot_media>(\S+))$')
 
         # Parse all lines
         for line in out.splitlines():
@@ -231,13 +229,13 @@ class ShowIssuRollbackTimer(ShowIssuRollbackTimerSchema):
         # Compile regexp patterns
 
         # Rollback: inactive, no ISSU operation is in progress
-        p1 = re.compile(r'^Rollback: +(?P<state>(\S+)), +(?P<reason>.*)$')
+        p1 = regex_engine.compile(r'^Rollback: +(?P<state>(\S+)), +(?P<reason>.*)$')
 
         # Rollback Process State = Not in progress
-        p2 = re.compile(r'Rollback\s+Process\s+State\s*=\s*(?P<state>.+)')
+        p2 = regex_engine.compile(r'Rollback\s+Process\s+State\s*=\s*(?P<state>.+)')
 
         # Configured Rollback Time = 00:45:00
-        p3 = re.compile(r'Configured\s+Rollback\s+Time\s*=\s*(?P<rollback_time>.+)')
+        p3 = regex_engine.compile(r'Configured\s+Rollback\s+Time\s*=\s*(?P<rollback_time>.+)')
 
         # Parse all lines
         for line in out.splitlines():
@@ -8,8 +8,8 @@ Copyright (c) 2023 by Cisco Systems, Inc.
 All rights reserved.
 '''
 
-import re
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any, Optional)
@@ -47,20 +47,20 @@ class ShowL2ProtocolTunnelSummary(ShowL2ProtocolTunnelSummarySchema):
             output = self.device.execute(self.cli_command)
 
         # COS for Encapsulated Packets: 5
-        p1 = re.compile(r"^COS[\S\s]+: (?P<cos>\d+)$")
+        p1 = regex_engine.compile(r"^COS[\S\s]+: (?P<cos>\d+)$")
 
         # Drop Threshold for Encapsulated Packets: 0
-        p2 = re.compile(r"^Drop[\S\s]+: (?P<drop>\d+)$")
+        p2 = regex_engine.compile(r"^Drop[\S\s]+: (?P<drop>\d+)$")
 
         # Tunnel: Rewrites the destination MAC address of L2 PDUs with Cisco proprietary multicast address
-        p3 = re.compile(r"^Tunnel: (?P<tunnel>[\w\W\s]+)$")
+        p3 = regex_engine.compile(r"^Tunnel: (?P<tunnel>[\w\W\s]+)$")
 
         # Forward: Transport L2 PDUs to peer device
-        p4 = re.compile(r"^Forward: (?P<forward>[\w\W\s]+)$")
+        p4 = regex_engine.compile(r"^Forward: (?P<forward>[\w\W\s]+)$")
 
         # Gi1/0/17            cdp lldp stp vtp    40/----/  40/  40     30/  20/  20/  20   up
-        p5 = re.compile(r"^((?P<port>\S+)\s+)?(?P<protocol>\S+ \S+ \S+( \S+)?)\s+(?P<shutdown_threshold>[\d\-]+\/[\s\d\-]+\/[\s\d\-]+(\/\s+[\d\-]+)?)"
-                        r"\s+(?P<drop_threshold>[\d\-]+\/[\s\d\-]+\/[\s\d\-]+(\/\s+[\d\-]+)?)(\s+(?P<status>\S+))?$")
+        p5 = regex_engine.compile(r"^((?P<port>\S+)\s+)?(?P<protocol>\S+ \S+ \S+( \S+)?)\s+(?P<shutdown_threshold>[\d\-]+\/[\s\d\-]+\/[\s\d\-]+(\/\s+[\d\-]+)?)"
+                                  r"\s+(?P<drop_threshold>[\d\-]+\/[\s\d\-]+\/[\s\d\-]+(\/\s+[\d\-]+)?)(\s+(?P<status>\S+))?$")
 
         ret_dict = {}
 
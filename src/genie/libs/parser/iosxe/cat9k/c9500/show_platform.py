@@ -34,6 +34,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, Default, Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ==========================
@@ -128,140 +129,140 @@ class ShowVersion(ShowVersionSchema):
         # version
         # Cisco IOS XE Software, Version 2019-10-31_17.49_makale
         # Cisco IOS XE Software, Version BLD_POLARIS_DEV_LATEST_20210302_012043
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r'^Cisco +([\S\s]+) +Software, +Version +(?P<xe_version>.*)$')
 
         # Cisco IOS Software [Amsterdam], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.2.20191101:003833 [HEAD-/nobackup/makale/puntject2/polaris 106]
         # Cisco IOS Software [Bengaluru], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.6.20210302:012459 [S2C-build-polaris_dev-132831-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20210302_012043 149]
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Cisco +IOS +Software +\[(?P<code_name>([\S]+))\], +(?P<platform>([\S\s]+)) '
             r'+Software +\((?P<image_id>.+)\),( +Experimental)? +Version +(?P<version>[\d\.:]+),? *'
             r'(?P<label>(\[.+?(?P<build_label>BLD_\S+)? \d+\])|.*)$')
 
         # 16.6.5
-        p1_1 = re.compile(r'^(?P<ver_short>\d+\.\d+).*')
+        p1_1 = regex_engine.compile(r'^(?P<ver_short>\d+\.\d+).*')
 
         # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-        p2 = re.compile(r'^Copyright +(.*)$')
+        p2 = regex_engine.compile(r'^Copyright +(.*)$')
 
         # Technical Support: http://www.cisco.com/techsupport
-        p3 = re.compile(r'^Technical +Support: +http\:\/\/www'
-                        r'\.cisco\.com\/techsupport')
+        p3 = regex_engine.compile(r'^Technical +Support: +http\:\/\/www'
+                                  r'\.cisco\.com\/techsupport')
 
         # ROM: IOS-XE ROMMON
-        p4 = re.compile(r'^ROM: +(?P<rom>.+)$')
+        p4 = regex_engine.compile(r'^ROM: +(?P<rom>.+)$')
 
         # BOOTLDR: System Bootstrap, Version 17.1.1[FC2], RELEASE SOFTWARE (P)
-        p5 = re.compile(r'^BOOTLDR: +(?P<bootldr_version>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^BOOTLDR: +(?P<bootldr_version>[\S\s]+)$')
 
         # SF2 uptime is 1 day, 18 hours, 48 minutes
-        p6 = re.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
+        p6 = regex_engine.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
 
         # Uptime for this control processor is 1 day, 18 hours, 49 minutes
-        p7 = re.compile(r'^Uptime +for +this +control +processor '
-                         r'+is +(?P<uptime_this_cp>.+)$')
+        p7 = regex_engine.compile(r'^Uptime +for +this +control +processor '
+                                   r'+is +(?P<uptime_this_cp>.+)$')
 
         # System returned to ROM by Reload Command
-        p8 = re.compile(r'^System +returned +to +ROM +by '
-                         r'+(?P<returned_to_rom_by>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^System +returned +to +ROM +by '
+                                   r'+(?P<returned_to_rom_by>[\S\s]+)$')
 
         # System image file is "harddisk:test-image-PE1-13113029"
-        p9 = re.compile(r'^System +image +file +is '
-                         r'+\"(?P<system_image>.+)\"')
+        p9 = regex_engine.compile(r'^System +image +file +is '
+                                   r'+\"(?P<system_image>.+)\"')
 
         # Last reload reason: Reload Command
-        p10 = re.compile(r'^Last +reload +reason\: '
-                         r'+(?P<last_reload_reason>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^Last +reload +reason\: '
+                                   r'+(?P<last_reload_reason>[\S\s]+)$')
 
         # AIR License Level: AIR DNA Advantage
-        p11 = re.compile(r'^AIR +License +Level: +(?P<license_level>.+)$')
+        p11 = regex_engine.compile(r'^AIR +License +Level: +(?P<license_level>.+)$')
 
         # SMU   CSCvz54210   17.03.03. C  cat9k_iosxe.17.03.03.CSCvz54210.SPA.smu.bin  
         # SMU   CSCwc80043   17.03.03. C  cat9k_iosxe.17.03.03.CSCwc80043.SPA.smu.bin  
         # SMU   CSCwh29778   17.03.03. C  cat9k_iosxe.17.03.03.CSCwh29778.SPA.smu.bin
-        p12_1 = re.compile(r'^(?P<type1>\w+) +(?P<defect_id>\S+) +(?P<sum_version>[\w.]+) +(?P<state>C|U) +(?P<file_name>\S+)$')
+        p12_1 = regex_engine.compile(r'^(?P<type1>\w+) +(?P<defect_id>\S+) +(?P<sum_version>[\w.]+) +(?P<state>C|U) +(?P<file_name>\S+)$')
 
         # Next reload AIR license Level: AIR DNA Advantage
-        p12 = re.compile(r'^Next +reload +AIR +license +Level: +(?P<next_reload_license_level>.+)$')
+        p12 = regex_engine.compile(r'^Next +reload +AIR +license +Level: +(?P<next_reload_license_level>.+)$')
 
         # Smart Licensing Status: UNREGISTERED/EVAL EXPIRED
-        p13 = re.compile(r'^Smart +Licensing +Status: +(?P<smart_licensing_status>.+)$')
+        p13 = regex_engine.compile(r'^Smart +Licensing +Status: +(?P<smart_licensing_status>.+)$')
 
 
         # cisco C9500X-60L4D (X86) processor (revision V00) with 5875522K/6147K bytes of memory.
         # cisco C9500-32QC (X86) processor with 1863083K/6147K bytes of memory.
-        p14 = re.compile(r'^cisco +(?P<chassis>[\S]+) \((?P<processor_type>[\S]+)\) +processor '
-                         r'+(?:(\(revision (?P<revision>\S+)\) +)?)?'
-                         r'with +(?P<main_mem>(?<!\S)\d+)+.+bytes +of +memory.$')
+        p14 = regex_engine.compile(r'^cisco +(?P<chassis>[\S]+) \((?P<processor_type>[\S]+)\) +processor '
+                                   r'+(?:(\(revision (?P<revision>\S+)\) +)?)?'
+                                   r'with +(?P<main_mem>(?<!\S)\d+)+.+bytes +of +memory.$')
 
         # Processor board ID CAT2242L6CG
-        p15 = re.compile(r'^Processor +board +ID '
-                         r'+(?P<processor_board_id>.+)$')
+        p15 = regex_engine.compile(r'^Processor +board +ID '
+                                   r'+(?P<processor_board_id>.+)$')
 
         # 44 Virtual Ethernet interfaces
-        p16 = re.compile(r'^(?P<virtual_ethernet_interfaces>\d+) +Virtual'
+        p16 = regex_engine.compile(r'^(?P<virtual_ethernet_interfaces>\d+) +Virtual'
             r' +Ethernet +interfaces$')
 
         # 32 Forty Gigabit Ethernet interfaces
-        p17 = re.compile(r'^(?P<forty_gigabit_ethernet_interfaces>\d+)'
+        p17 = regex_engine.compile(r'^(?P<forty_gigabit_ethernet_interfaces>\d+)'
             r' +Forty +Gigabit +Ethernet +interfaces$')
 
         # 16 Hundred Gigabit Ethernet interfaces
-        p18 = re.compile(r'^(?P<hundred_gigabit_ethernet_interfaces>\d+)'
+        p18 = regex_engine.compile(r'^(?P<hundred_gigabit_ethernet_interfaces>\d+)'
             r' +Hundred +Gigabit +Ethernet +interfaces$')
 
         # 32768K bytes of non-volatile configuration memory.
-        p19 = re.compile(r'^(?P<non_volatile_memory>\d+)K'
+        p19 = regex_engine.compile(r'^(?P<non_volatile_memory>\d+)K'
             r' +bytes +of +non-volatile +configuration +memory.$')
 
         # 16002848K bytes of physical memory.
-        p20 = re.compile(r'^(?P<physical_memory>\d+)K'
+        p20 = regex_engine.compile(r'^(?P<physical_memory>\d+)K'
             r' +bytes +of +physical +memory.$')
 
         # 11161600K bytes of Bootflash at bootflash:.
-        p21 = re.compile(r'^(?P<bootflash_size>\d+)K'
+        p21 = regex_engine.compile(r'^(?P<bootflash_size>\d+)K'
             r' +bytes +of +Bootflash +at +bootflash:.$')
 
         # 1638400K bytes of Crash Files at crashinfo:.
-        p22 = re.compile(r'^(?P<crash_size>\d+)K'
+        p22 = regex_engine.compile(r'^(?P<crash_size>\d+)K'
             r' +bytes +of +Crash +Files +at +crashinfo:.$')
 
         # Base Ethernet MAC Address          : 70:b3:17:ff:65:60
-        p23 = re.compile(r'^Base +Ethernet +MAC +Address +: '
-                         r'+(?P<mac_address>\S+)$')
+        p23 = regex_engine.compile(r'^Base +Ethernet +MAC +Address +: '
+                                   r'+(?P<mac_address>\S+)$')
 
         # Motherboard Assembly Number        : 47A7
-        p24 = re.compile(r'^Motherboard +Assembly +Number +: '
-                         r'+(?P<mb_assembly_num>\S+)$')
+        p24 = regex_engine.compile(r'^Motherboard +Assembly +Number +: '
+                                   r'+(?P<mb_assembly_num>\S+)$')
 
         # Motherboard Serial Number          : CAT2242L6CG
-        p25 = re.compile(r'^Motherboard +Serial +Number +: '
-                         r'+(?P<mb_sn>\S+)$')
+        p25 = regex_engine.compile(r'^Motherboard +Serial +Number +: '
+                                   r'+(?P<mb_sn>\S+)$')
 
         # Model Revision Number              : V02
-        p26 = re.compile(r'^Model +Revision +Number +: '
-                         r'+(?P<model_rev_num>\S+)$')
+        p26 = regex_engine.compile(r'^Model +Revision +Number +: '
+                                   r'+(?P<model_rev_num>\S+)$')
 
         # Motherboard Revision Number        : A4
-        p27 = re.compile(r'^Motherboard +Revision +Number +: '
-                         r'+(?P<mb_rev_num>\S+)$')
+        p27 = regex_engine.compile(r'^Motherboard +Revision +Number +: '
+                                   r'+(?P<mb_rev_num>\S+)$')
 
         # Model Number                       : C9500-32QC
-        p28 = re.compile(r'^Model +Number +: +(?P<model_num>\S+)$')
+        p28 = regex_engine.compile(r'^Model +Number +: +(?P<model_num>\S+)$')
 
         # System Serial Number               : CAT2242L6CG
-        p29 = re.compile(r'^System +Serial +Number +\: +(?P<system_sn>\S+)$')
+        p29 = regex_engine.compile(r'^System +Serial +Number +\: +(?P<system_sn>\S+)$')
 
         # Configuration register is 0x102
-        p30 = re.compile(r'^Configuration +register +is '
-                         r'+(?P<curr_config_register>[\S]+)')
+        p30 = regex_engine.compile(r'^Configuration +register +is '
+                                   r'+(?P<curr_config_register>[\S]+)')
 
         # Compiled Thu 31-Oct-19 17:43 by makale
-        p31 = re.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
-                         r'+(?P<compiled_by>\S+)$')
+        p31 = regex_engine.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
+                                   r'+(?P<compiled_by>\S+)$')
 
         # Cisco IOS-XE software, Copyright (c) 2005-2019 by cisco Systems, Inc.
-        p32 = re.compile(r'^Cisco +(?P<os>\S+) +software.*$')
+        p32 = regex_engine.compile(r'^Cisco +(?P<os>\S+) +software.*$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -589,61 +590,61 @@ class ShowRedundancy(ShowRedundancySchema):
         redundancy_dict = {}
 
         # Available system uptime = 1 day, 18 hours, 48 minutes
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'Available +system +uptime += +(?P<available_system_uptime>[\S\s]+)$')
 
         # Switchovers system experienced = 0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'Switchovers +system +experienced += +(?P<switchovers_system_experienced>\d+)$')
 
         # Standby failures = 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'Standby +failures += +(?P<standby_failures>\d+)$')
 
         # Last switchover reason = none
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Last +switchover +reason += +(?P<last_switchover_reason>[\S\s]+)$')
 
         # Hardware Mode = Simplex
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Hardware +Mode += +(?P<hw_mode>\S+)$')
 
         # Configured Redundancy Mode = Non-redundant
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'Configured +Redundancy +Mode += +(?P<conf_red_mode>\S+)$')
 
         # Operating Redundancy Mode = Non-redundant
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Operating +Redundancy +Mode += +(?P<oper_red_mode>\S+)$')
 
         # Maintenance Mode = Disabled
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Maintenance +Mode += +(?P<maint_mode>\S+)$')
 
         # Communications = Down      Reason: Failure
-        p9 = re.compile(r'^Communications += +(?P<communications>\S+)\s+Reason: +(?P<communications_reason>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^Communications += +(?P<communications>\S+)\s+Reason: +(?P<communications_reason>[\S\s]+)$')
 
         # Active Location = slot 1
-        p10 = re.compile(r'^Active +Location += +(?P<slot>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^Active +Location += +(?P<slot>[\S\s]+)$')
 
         # Current Software state = ACTIVE
-        p11 = re.compile(r'^Current +Software +state += +(?P<curr_sw_state>\S+)$')
+        p11 = regex_engine.compile(r'^Current +Software +state += +(?P<curr_sw_state>\S+)$')
 
         # Uptime in current state = 1 day, 18 hours, 48 minutes
-        p12 = re.compile(r'^Uptime +in +current +state += +(?P<uptime_in_curr_state>[\S\s]+)$')
+        p12 = regex_engine.compile(r'^Uptime +in +current +state += +(?P<uptime_in_curr_state>[\S\s]+)$')
 
         # Image Version = Cisco IOS Software [Amsterdam], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.2.20191101:003833 [HEAD-/nobackup/makale/puntject2/polaris 106]
-        p13 = re.compile(r'^Image +Version += +(?P<image_ver>.+)$')
+        p13 = regex_engine.compile(r'^Image +Version += +(?P<image_ver>.+)$')
 
         # BOOT = bootflash:/ecr.bin;
-        p14 = re.compile(r'^BOOT += +(?P<boot>.+)$')
+        p14 = regex_engine.compile(r'^BOOT += +(?P<boot>.+)$')
 
         # Configuration register = 0x102
-        p15 = re.compile(r'^Configuration +register = (?P<config_register>\S+)$')
+        p15 = regex_engine.compile(r'^Configuration +register = (?P<config_register>\S+)$')
 
         # Compiled Thu 31-Oct-19 17:43 by makale
-        p16 = re.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
-                         r'+(?P<compiled_by>\S+)$')
+        p16 = regex_engine.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
+                                   r'+(?P<compiled_by>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -824,12 +825,12 @@ class ShowInventory(ShowInventorySchema):
         index = 0
 
         # NAME: "HundredGigE1/0/48", DESCR: "QSFP 100GE SR"
-        p1 = re.compile(r'^NAME: +\"(?P<name>.*)\",'
-                         r' +DESCR: +\"(?P<descr>.*)\"$')
+        p1 = regex_engine.compile(r'^NAME: +\"(?P<name>.*)\",'
+                                   r' +DESCR: +\"(?P<descr>.*)\"$')
 
         # PID: QSFP-100G-SR4-S     , VID: V03  , SN: AVF2243S10A
-        p2 = re.compile(r'^PID: +(?P<pid>\S+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
-                         r' +SN:(?: +(?P<sn>(\S+)))?$')
+        p2 = regex_engine.compile(r'^PID: +(?P<pid>\S+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
+                                   r' +SN:(?: +(?P<sn>(\S+)))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -909,25 +910,25 @@ class ShowPlatform(ShowPlatformSchema):
         platform_dict = {}
 
         # Chassis type: C9500-32QC
-        p0 = re.compile(r'^Chassis +type: +(?P<chassis>\S+)$')
+        p0 = regex_engine.compile(r'^Chassis +type: +(?P<chassis>\S+)$')
 
         # Slot      Type                State                 Insert time (ago)
         # --------- ------------------- --------------------- -----------------
         # 1         C9500-32QC          ok                    1d18h
-        p1 = re.compile(r'^(?P<slot>[\w\d]+) +(?P<name>\S+) +'
-                         r'(?P<state>\w+(\, \w+)?) +(?P<insert_time>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<slot>[\w\d]+) +(?P<name>\S+) +'
+                                   r'(?P<state>\w+(\, \w+)?) +(?P<insert_time>\S+)$')
 
         # Slot      Type                State                 Insert time (ago)
         # --------- ------------------- --------------------- -----------------
         #  1/0      C9500-32QC          ok                    1d18h
-        p2 = re.compile(r'^(?P<slot>\S+)\/(?P<subslot>\d+) +(?P<name>\S+) +'
-                         r'(?P<state>\w+(\, \w+)?) +(?P<insert_time>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<slot>\S+)\/(?P<subslot>\d+) +(?P<name>\S+) +'
+                                   r'(?P<state>\w+(\, \w+)?) +(?P<insert_time>\S+)$')
 
         # Slot      CPLD Version        Firmware Version
         # --------- ------------------- ---------------------------------------
         # 1         19061022            17.1.1[FC2]
-        p3 = re.compile(r'^(?P<slot>\S+) +(?P<cpld_version>\d+) +'
-                         r'(?P<fireware_ver>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<slot>\S+) +(?P<cpld_version>\d+) +'
+                                   r'(?P<fireware_ver>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1036,9 +1037,9 @@ class ShowPlatformIfmMapping(ShowPlatformIfmMappingSchema):
         # TwentyFiveGigE1/0/1       0x8        1   0   1    20     0      16   4    1    1    NIF  Y
         # Interface                 IF_ID  Inst Asic Core IFG_ID Port SubPort Mac  First Serdes Last Serdes  Cntx LPN  GPN   Type Active
         # HundredGigE1/0/1          0x406    0   0    5      1    0      0     1    0            1            0    1    1    NIF    Y
-        p1 = re.compile(r'^(?P<interface>\S+) +(?P<ifId>\S+) +(?P<inst>\d+) +(?P<asic>\d+) +(?P<core>\d+) +'
-                        r'((?P<ifg_id>\d+)\s+)?(?P<port>\d+) +(?P<sbPort>\d+) +(?P<mac>\d+) +((?P<first_serdes>\d+)\s+'
-                        r'(?P<last_serdes>\d+)\s+)?(?P<cntx>\d+) +(?P<lpn>\d+) +(?P<gpn>\d+) +(?P<type>\w+) +(?P<act>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+) +(?P<ifId>\S+) +(?P<inst>\d+) +(?P<asic>\d+) +(?P<core>\d+) +'
+                                  r'((?P<ifg_id>\d+)\s+)?(?P<port>\d+) +(?P<sbPort>\d+) +(?P<mac>\d+) +((?P<first_serdes>\d+)\s+'
+                                  r'(?P<last_serdes>\d+)\s+)?(?P<cntx>\d+) +(?P<lpn>\d+) +(?P<gpn>\d+) +(?P<type>\w+) +(?P<act>\w+)$')
 
         # initial variables
         ret_dict = {}
@@ -1145,22 +1146,22 @@ class ShowPlatformSoftware(ShowPlatformSoftwareSchema):
         ret_dict = {}
 
         #Forwarding Manager Asynchronous Object Manager Statistics
-        p1 = re.compile(r'^Forwarding +Manager +Asynchronous +Object Manager*\s+(?P<statistics>(\S+))$')
+        p1 = regex_engine.compile(r'^Forwarding +Manager +Asynchronous +Object Manager*\s+(?P<statistics>(\S+))$')
 
         #Object update: Pending-issue: 0, Pending-acknowledgement: 0
-        p2 = re.compile(r'^Object +update:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
-                         r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
+        p2 = regex_engine.compile(r'^Object +update:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
+                                   r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
 
         #Batch begin:   Pending-issue: 0, Pending-acknowledgement: 0
-        p3 = re.compile(r'Batch +begin:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
-                         r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
+        p3 = regex_engine.compile(r'Batch +begin:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
+                                   r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
 
         #Batch end:     Pending-issue: 0, Pending-acknowledgement: 0
-        p4 = re.compile(r'Batch +end:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
-                         r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
+        p4 = regex_engine.compile(r'Batch +end:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
+                                   r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
 
         #Command:       Pending-acknowledgement: 0
-        p5 = re.compile(r'Command:\s+Pending-acknowledgement:\s+(?P<pending_ack>\d+)')
+        p5 = regex_engine.compile(r'Command:\s+Pending-acknowledgement:\s+(?P<pending_ack>\d+)')
 
         #Total-objects: 1231
         #Stale-objects: 0
@@ -1170,7 +1171,7 @@ class ShowPlatformSoftware(ShowPlatformSoftwareSchema):
         #Error-objects: 0
         #Number of bundles: 0
         #Paused-types: 5
-        p6 = re.compile(r'^(?P<key>[\S ]+): +(?P<value>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<key>[\S ]+): +(?P<value>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1271,14 +1272,14 @@ class ShowPlatformHardwareChassisFantrayDetail(ShowPlatformHardwareChassisFantra
         ret_dict = {}
 
         # Control Mode:   Auto, Monitor Mode:   Auto, Duty Cycle: 50.20%
-        p1 = re.compile(r'^Control Mode:\s+(?P<control_mode>\w+)\, Monitor Mode:\s+(?P<monitor_mode>\w+)\, Duty Cycle:\s+(?P<duty_cycle>\S+)')
+        p1 = regex_engine.compile(r'^Control Mode:\s+(?P<control_mode>\w+)\, Monitor Mode:\s+(?P<monitor_mode>\w+)\, Duty Cycle:\s+(?P<duty_cycle>\S+)')
 
         #  Fan tray-1:
-        p2 = re.compile(r'^(?P<fan_tray>\bFan \w+-\d+)')
+        p2 = regex_engine.compile(r'^(?P<fan_tray>\bFan \w+-\d+)')
 
         # FAN1 Inlet:  11062 RPM, Outlet:   9984 RPM
         # FAN2 Inlet:  11039 RPM, Outlet:  10007 RPM
-        p3 = re.compile(r'^(?P<fan>\bFAN\d+) Inlet:\s+(?P<inlet_rpm>\d+) +RPM\, +Outlet:\s+(?P<outlet_rpm>\d+) +RPM$')
+        p3 = regex_engine.compile(r'^(?P<fan>\bFAN\d+) Inlet:\s+(?P<inlet_rpm>\d+) +RPM\, +Outlet:\s+(?P<outlet_rpm>\d+) +RPM$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1350,37 +1351,37 @@ class ShowPlatformHardwareChassisPowerSupplyDetailAll(ShowPlatformHardwareChassi
         ret_dict = {}
 
         # PS1:
-        p1 = re.compile(r'^(?P<power_supply>.+)\:$')
+        p1 = regex_engine.compile(r'^(?P<power_supply>.+)\:$')
 
         # Input Voltage   :     231.0000 V
-        p2 = re.compile(r'^Input\s+Voltage\s+:\s+(?P<input_voltage_volt>\d+\.\d+) V$')
+        p2 = regex_engine.compile(r'^Input\s+Voltage\s+:\s+(?P<input_voltage_volt>\d+\.\d+) V$')
 
         # Output Voltage  :      11.9490 V
-        p3 = re.compile(r'^Output\s+Voltage\s+:\s+(?P<output_voltage_volt>\d+\.\d+) V$')
+        p3 = regex_engine.compile(r'^Output\s+Voltage\s+:\s+(?P<output_voltage_volt>\d+\.\d+) V$')
 
         # Input Power     :     165.0000 W
-        p4 = re.compile(r'^Input\s+Power\s+:\s+(?P<input_power_watt>\d+\.\d+) W$')
+        p4 = regex_engine.compile(r'^Input\s+Power\s+:\s+(?P<input_power_watt>\d+\.\d+) W$')
 
         # Output Power    :     150.0000 W
-        p5 = re.compile(r'^Output\s+(Power|power)\s+:\s+(?P<output_power_watt>\d+\.\d+) W$')
+        p5 = regex_engine.compile(r'^Output\s+(Power|power)\s+:\s+(?P<output_power_watt>\d+\.\d+) W$')
 
         # Input Current   :       0.7180 A
-        p6 = re.compile(r'^Input\s+Current\s+:\s+(?P<input_current_amp>\d+\.\d+) A$')
+        p6 = regex_engine.compile(r'^Input\s+Current\s+:\s+(?P<input_current_amp>\d+\.\d+) A$')
 
         # Output Current  :      12.4840 A
-        p7 = re.compile(r'^Output\s+Current\s+:\s+(?P<output_current_amp>\d+\.\d+) A$')
+        p7 = regex_engine.compile(r'^Output\s+Current\s+:\s+(?P<output_current_amp>\d+\.\d+) A$')
 
         # Temperature 1   :      30.7500 C
-        p8 = re.compile(r'^Temperature *1\s+:\s+(?P<temperature1_celsius>\d+\.\d+) C$')
+        p8 = regex_engine.compile(r'^Temperature *1\s+:\s+(?P<temperature1_celsius>\d+\.\d+) C$')
 
         # Temperature 2   :      33.0000 C
-        p9 = re.compile(r'^Temperature *2\s+:\s+(?P<temperature2_celsius>\d+\.\d+) C$')
+        p9 = regex_engine.compile(r'^Temperature *2\s+:\s+(?P<temperature2_celsius>\d+\.\d+) C$')
 
         # Temperature 3   :      33.5000 C
-        p10 = re.compile(r'^Temperature *3\s+:\s+(?P<temperature3_celsius>\d+\.\d+) C$')
+        p10 = regex_engine.compile(r'^Temperature *3\s+:\s+(?P<temperature3_celsius>\d+\.\d+) C$')
 
         # Fan Speed 1     :   10016.0000 RPM
-        p11= re.compile(r'^Fan\s+Speed\s+1\s+:\s+(?P<fan_speed_1_rpm>\d+\.\d+) RPM$')
+        p11= regex_engine.compile(r'^Fan\s+Speed\s+1\s+:\s+(?P<fan_speed_1_rpm>\d+\.\d+) RPM$')
 
         for line in output.splitlines():
             line=line.strip()
@@ -1505,14 +1506,14 @@ class ShowPlatformHardwareChassisFantrayDetailSwitch(ShowPlatformHardwareChassis
         ret_dict = {}
 
         # Control Mode:   Auto, Monitor Mode:   Auto, Duty Cycle: 50.20%
-        p1 = re.compile(r'^Control Mode:\s+(?P<control_mode>\w+)\, Monitor Mode:\s+(?P<monitor_mode>\w+)\, Duty Cycle:\s+(?P<duty_cycle>\S+)')
+        p1 = regex_engine.compile(r'^Control Mode:\s+(?P<control_mode>\w+)\, Monitor Mode:\s+(?P<monitor_mode>\w+)\, Duty Cycle:\s+(?P<duty_cycle>\S+)')
 
         #  Fan tray-1:
-        p2 = re.compile(r'^(?P<fan_tray>\bFan \w+-\d+)')
+        p2 = regex_engine.compile(r'^(?P<fan_tray>\bFan \w+-\d+)')
 
         # FAN1 Inlet:  11062 RPM, Outlet:   9984 RPM
         # FAN2 Inlet:  11039 RPM, Outlet:  10007 RPM
-        p3 = re.compile(r'^(?P<fan>\bFAN\d+) Inlet:\s+(?P<inlet_rpm>\d+) +RPM\, +Outlet:\s+(?P<outlet_rpm>\d+) +RPM$')
+        p3 = regex_engine.compile(r'^(?P<fan>\bFAN\d+) Inlet:\s+(?P<inlet_rpm>\d+) +RPM\, +Outlet:\s+(?P<outlet_rpm>\d+) +RPM$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1583,37 +1584,37 @@ class ShowPlatformHardwareChassisPowerSupplyDetailSwitchAll(ShowPlatformHardware
         ret_dict = {}
 
         # PS1:
-        p1 = re.compile(r'^(?P<power_supply>.+)\:$')
+        p1 = regex_engine.compile(r'^(?P<power_supply>.+)\:$')
 
         # Input Voltage   :     231.0000 V
-        p2 = re.compile(r'^Input\s+Voltage\s+:\s+(?P<input_voltage_volt>\d+\.\d+) V$')
+        p2 = regex_engine.compile(r'^Input\s+Voltage\s+:\s+(?P<input_voltage_volt>\d+\.\d+) V$')
 
         # Output Voltage  :      11.9490 V
-        p3 = re.compile(r'^Output\s+Voltage\s+:\s+(?P<output_voltage_volt>\d+\.\d+) V$')
+        p3 = regex_engine.compile(r'^Output\s+Voltage\s+:\s+(?P<output_voltage_volt>\d+\.\d+) V$')
 
         # Input Power     :     165.0000 W
-        p4 = re.compile(r'^Input\s+Power\s+:\s+(?P<input_power_watt>\d+\.\d+) W$')
+        p4 = regex_engine.compile(r'^Input\s+Power\s+:\s+(?P<input_power_watt>\d+\.\d+) W$')
 
         # Output Power    :     150.0000 W
-        p5 = re.compile(r'^Output\s+(Power|power)\s+:\s+(?P<output_power_watt>\d+\.\d+) W$')
+        p5 = regex_engine.compile(r'^Output\s+(Power|power)\s+:\s+(?P<output_power_watt>\d+\.\d+) W$')
 
         # Input Current   :       0.7180 A
-        p6 = re.compile(r'^Input\s+Current\s+:\s+(?P<input_current_amp>\d+\.\d+) A$')
+        p6 = regex_engine.compile(r'^Input\s+Current\s+:\s+(?P<input_current_amp>\d+\.\d+) A$')
 
         # Output Current  :      12.4840 A
-        p7 = re.compile(r'^Output\s+Current\s+:\s+(?P<output_current_amp>\d+\.\d+) A$')
+        p7 = regex_engine.compile(r'^Output\s+Current\s+:\s+(?P<output_current_amp>\d+\.\d+) A$')
 
         # Temperature 1   :      30.7500 C
-        p8 = re.compile(r'^Temperature *1\s+:\s+(?P<temperature1_celsius>\d+\.\d+) C$')
+        p8 = regex_engine.compile(r'^Temperature *1\s+:\s+(?P<temperature1_celsius>\d+\.\d+) C$')
 
         # Temperature 2   :      33.0000 C
-        p9 = re.compile(r'^Temperature *2\s+:\s+(?P<temperature2_celsius>\d+\.\d+) C$')
+        p9 = regex_engine.compile(r'^Temperature *2\s+:\s+(?P<temperature2_celsius>\d+\.\d+) C$')
 
         # Temperature 3   :      33.5000 C
-        p10 = re.compile(r'^Temperature *3\s+:\s+(?P<temperature3_celsius>\d+\.\d+) C$')
+        p10 = regex_engine.compile(r'^Temperature *3\s+:\s+(?P<temperature3_celsius>\d+\.\d+) C$')
 
         # Fan Speed 1     :   10016.0000 RPM
-        p11= re.compile(r'^Fan\s+Speed\s+1\s+:\s+(?P<fan_speed_1_rpm>\d+\.\d+) RPM$')
+        p11= regex_engine.compile(r'^Fan\s+Speed\s+1\s+:\s+(?P<fan_speed_1_rpm>\d+\.\d+) RPM$')
 
         for line in output.splitlines():
             line=line.strip()
@@ -1756,17 +1757,17 @@ class ShowPlatformFedTcamPbrNat(ShowPlatformFedTcamPbrNatSchema):
         ret_dict = {}
 
         # Printing entries for region NAT_1 (387) type 6 asic 0
-        p1 = re.compile(r'^Printing entries for region\s(?P<nat_r>\w+)\s\(\d+\)\stype\s\d+\sasic\s\d$')
+        p1 = regex_engine.compile(r'^Printing entries for region\s(?P<nat_r>\w+)\s\(\d+\)\stype\s\d+\sasic\s\d$')
 
         # TAQ-0 Index-576 (A:0,C:0) Valid StartF-1 StartA-1 SkipF-0 SkipA-0
-        p2 = re.compile(r'^TAQ-\d+\sIndex-(?P<index>\d+)\s\([A-Z]\:\d+,[A-Z]\:\d+\)\sValid\sStart[A-Z]-\d+\sStart[A-Z]-\d+\sSkip[A-Z]-\d+\sSkip[A-Z]-\d+$')
+        p2 = regex_engine.compile(r'^TAQ-\d+\sIndex-(?P<index>\d+)\s\([A-Z]\:\d+,[A-Z]\:\d+\)\sValid\sStart[A-Z]-\d+\sStart[A-Z]-\d+\sSkip[A-Z]-\d+\sSkip[A-Z]-\d+$')
 
         # Mask1 30fff000:0003ffff:00000000:0000ffff:00000000:00000000:ffffffff:ffffffff
-        p3 = re.compile(r'^Mask(?P<mask_name>\d+) +(?P<mask_id>\S+)$')
+        p3 = regex_engine.compile(r'^Mask(?P<mask_name>\d+) +(?P<mask_id>\S+)$')
         # Key1  10119000:00020014:00000000:00000028:00000000:00000000:0f000001:23000001
-        p4 = re.compile(r'^Key(?P<key_name>\d+) +(?P<key_id>\S+)$')
+        p4 = regex_engine.compile(r'^Key(?P<key_name>\d+) +(?P<key_id>\S+)$')
         # AD    10087000:000000ae:00000000
-        p5 = re.compile(r'^AD +(?P<ad>[\da-f:]+)$')
+        p5 = regex_engine.compile(r'^AD +(?P<ad>[\da-f:]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1883,12 +1884,12 @@ class ShowPlatformSoftwareFedSwitchActivePuntEntries(ShowPlatformSoftwareFedSwit
         ret_dict ={}
 
         #Punject Punt Entries
-        p1 = re.compile(r'^Punject Punt Entries$')
+        p1 = regex_engine.compile(r'^Punject Punt Entries$')
 
         # MIRROR   ARP   4    4    system-cpp-police-arp 1000     965      0           0         0           0
-        p2 = re.compile(r'^(?P<source>\w*)\s+(?P<name>((\w+\s)+\w*\S\w*\S*)|(\w*(\S\w*\S){1,}))\s+'
-                        r'(?P<pri>\d+)\s+(?P<tc>\d+)\s+(?P<policy>(\w+(-\w+)*))\s+(?P<cir_sw>\d+)\s+'
-                        r'(?P<cir_hw>\d+)\s+(?P<pkts_a>\d+)\s+(?P<bytes_a>\d+)\s+(?P<pkts_d>\d+)\s+(?P<bytes_d>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<source>\w*)\s+(?P<name>((\w+\s)+\w*\S\w*\S*)|(\w*(\S\w*\S){1,}))\s+'
+                                  r'(?P<pri>\d+)\s+(?P<tc>\d+)\s+(?P<policy>(\w+(-\w+)*))\s+(?P<cir_sw>\d+)\s+'
+                                  r'(?P<cir_hw>\d+)\s+(?P<pkts_a>\d+)\s+(?P<bytes_a>\d+)\s+(?P<pkts_d>\d+)\s+(?P<bytes_d>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1958,12 +1959,12 @@ class ShowPlatformSoftwareFedActiveIpRouteVrf(ShowPlatformSoftwareFedActiveIpRou
         ret_dict = {}
 
         # Number of npi_ipv4route entries = 19
-        p0 = re.compile(r'^Number of npi_ipv4route entries\s+=\s+(?P<number_entries>\d*)$')
+        p0 = regex_engine.compile(r'^Number of npi_ipv4route entries\s+=\s+(?P<number_entries>\d*)$')
 
         # 0x5b60bb7077c8      40.1.1.3            32                  PUSH_COUNTER        0x169
-        p1 = re.compile(r'^(?P<object_id>0x\w+)(?:\s*)'
-                        r'(?P<ipv4_address>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})(?:\s*)'
-                        r'(?P<mask_length>\d*)(?:\s*)(?P<parent_type>\w*)(?:\s*)(?P<parent_object_id>0x\w*)$')
+        p1 = regex_engine.compile(r'^(?P<object_id>0x\w+)(?:\s*)'
+                                  r'(?P<ipv4_address>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})(?:\s*)'
+                                  r'(?P<mask_length>\d*)(?:\s*)(?P<parent_type>\w*)(?:\s*)(?P<parent_object_id>0x\w*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2048,20 +2049,20 @@ class ShowPlatformHardwareFedSwitchQosQueueStatsInterface(ShowPlatformHardwareFe
 
         # VOQ Stats For : HundredGigE1/0/5 [ 0x544 ]
         # VOQ Stats For : HundredGigE2/0/2.1 [ 0x550 ]
-        p1 = re.compile(r'^VOQ Stats For : (?P<interface>[\w\/\.]+)\s+.*$')
+        p1 = regex_engine.compile(r'^VOQ Stats For : (?P<interface>[\w\/\.]+)\s+.*$')
 
         # 0      | Enqueued |                        1194566957 |                       78841419162 |
         # | Dropped  |                                 0 |                                 0 |
         # | Total    |                        1194566957 |                       78841419162 |
         # |----------|-----------------------------------------------------------------------|
-        p2 = re.compile(r'^(?P<voq_id>\d+)?\s*\|\s+(?P<header>\w+)\s+\|\s+(?P<packets>\d+)\s+\|\s+(?P<bytes>\d+)\s+\|$')
+        p2 = regex_engine.compile(r'^(?P<voq_id>\d+)?\s*\|\s+(?P<header>\w+)\s+\|\s+(?P<packets>\d+)\s+\|\s+(?P<bytes>\d+)\s+\|$')
 
         # |   Slice  |         0 |         1 |         2 |         3 |         4 |         5 |
-        p3 = re.compile(r'^\|\s+Slice\s+\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|\s+(?P<slice2>\d+)\s\|'
-                    r'\s+(?P<slice3>\d+)\s\|\s+(?P<slice4>\d+)\s\|\s+(?P<slice5>\d+)\s\|$')
+        p3 = regex_engine.compile(r'^\|\s+Slice\s+\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|\s+(?P<slice2>\d+)\s\|'
+                              r'\s+(?P<slice3>\d+)\s\|\s+(?P<slice4>\d+)\s\|\s+(?P<slice5>\d+)\s\|$')
 
         # |SMS Bytes |         0 |         0 |         0 |         0 |         0 |         0 |
-        p4 = re.compile(r'^\|\s*(?P<slice_type>SMS Bytes|HBM Blocks|HBM Bytes)\s*\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|'
+        p4 = regex_engine.compile(r'^\|\s*(?P<slice_type>SMS Bytes|HBM Blocks|HBM Bytes)\s*\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|'
             r'\s+(?P<slice2>\d+)\s\|\s+(?P<slice3>\d+)\s\|\s+(?P<slice4>\d+)\s\|\s+(?P<slice5>\d+)\s\|$')
 
         ret_dict = {}
@@ -2210,19 +2211,19 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
         #     Resource                        Used  Free   Used  Free   Used  Free   Used  Free   Used  Free   Used  Free
         # IPv4 LPTS TCAM entries                   35  8634     35  8634     35  8634     35  8634     35  8628     35  8634
         # IPv6 LPTS TCAM entries                   30  4538     30  4538     30  4538     30  4538     30  4532     30  4538
-        p1 = re.compile(r'(?P<resource>.+)\s+(?P<slice0_used>\d+)\s+(?P<slice0_free>\d+)\s+(?P<slice1_used>\d+)\s+'
-                        r'(?P<slice1_free>\d+)\s+(?P<slice2_used>\d+)\s+(?P<slice2_free>\d+)\s+(?P<slice3_used>\d+)\s+'
-                        r'(?P<slice3_free>\d+)\s+(?P<slice4_used>\d+)\s+(?P<slice4_free>\d+)\s+(?P<slice5_used>\d+)\s+(?P<slice5_free>\d+)$')
+        p1 = regex_engine.compile(r'(?P<resource>.+)\s+(?P<slice0_used>\d+)\s+(?P<slice0_free>\d+)\s+(?P<slice1_used>\d+)\s+'
+                                  r'(?P<slice1_free>\d+)\s+(?P<slice2_used>\d+)\s+(?P<slice2_free>\d+)\s+(?P<slice3_used>\d+)\s+'
+                                  r'(?P<slice3_free>\d+)\s+(?P<slice4_used>\d+)\s+(?P<slice4_free>\d+)\s+(?P<slice5_used>\d+)\s+(?P<slice5_free>\d+)$')
 
         # CAM Utilization for ASIC  [0]
-        p2 = re.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
+        p2 = regex_engine.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
 
         # CTS Cell Matrix/VPN
         # Label                  TCAM         O         512        1    0.20%        0        0        0        1
         # CTS Cell Matrix/VPN
         # Label                  TCAM         O        1024        1    0.10%        0        0        0        1
         # Mac Address Table      EM           I       16384       45    0.27%        0        0        0       45
-        p3 = re.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
+        p3 = regex_engine.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2362,39 +2363,39 @@ class ShowPlatformSoftwareFedSwitchActivePuntPacketCaptureDisplayFilterKeyBrief(
 
         # Total captured so far :  4096 packet(s)
         
-        p0 = re.compile(r"Total captured so far :\s+(?P<total_captured_so_far>\d+)\s+packet")
+        p0 = regex_engine.compile(r"Total captured so far :\s+(?P<total_captured_so_far>\d+)\s+packet")
         
         # Punt Packet Number: 3659
         
-        p1 = re.compile(r".+Punt Packet Number\s*:\s*(?P<punt_packet_number>[\d]+)\s*\,\s*Timestamp\s*\:\s*(?P<timestamp>[\d\/\s\:\.]+).+")
+        p1 = regex_engine.compile(r".+Punt Packet Number\s*:\s*(?P<punt_packet_number>[\d]+)\s*\,\s*Timestamp\s*\:\s*(?P<timestamp>[\d\/\s\:\.]+).+")
         
         # interface : phy: Port11lVlan101 [if-id: 0x50000000b0065], pal: Vlan101 [if-id: 0x000005ce]
         
-        p2 = re.compile(r"interface\s*:\s*phy\s*:\s*(?P<phy_val>[\w]+)\s+\[[\w\-\:]+\s*(?P<phy_if_id>[\w]+)\]\s*\,\s*pal\s*\:\s*(?P<pal_val>[\w]+)\s*\[[\w\-\:]+\s*(?P<pal_if_id>[\w]+)\]")
+        p2 = regex_engine.compile(r"interface\s*:\s*phy\s*:\s*(?P<phy_val>[\w]+)\s+\[[\w\-\:]+\s*(?P<phy_if_id>[\w]+)\]\s*\,\s*pal\s*\:\s*(?P<pal_val>[\w]+)\s*\[[\w\-\:]+\s*(?P<pal_if_id>[\w]+)\]")
         
         # misc info : cause: 7 [ARP request or response], sub-cause: 1, linktype: IP [1]
         
-        p3 = re.compile(r"misc info\s*\:\s*cause\s*\:\s*(?P<cause_number>[\d]+)\s*\[(?P<cause>[\w\s]+)\]\s*\,")
+        p3 = regex_engine.compile(r"misc info\s*\:\s*cause\s*\:\s*(?P<cause_number>[\d]+)\s*\[(?P<cause>[\w\s]+)\]\s*\,")
         
         # CE hdr : dest mac: 4e41.5000.0010, src mac: 4e41.5000.0111, ethertype: 0x7102
         
-        p4 = re.compile(r"CE\s*hdr\s*\:\s*dest mac\s*\:\s*(?P<dest_mac>[\w\.]+)\s*\,\s*src mac\s*\:\s*(?P<src_mac>[\w\.]+)\s*\,\s*ethertype\s*\:\s*(?P<ethertype>[\w]+)")
+        p4 = regex_engine.compile(r"CE\s*hdr\s*\:\s*dest mac\s*\:\s*(?P<dest_mac>[\w\.]+)\s*\,\s*src mac\s*\:\s*(?P<src_mac>[\w\.]+)\s*\,\s*ethertype\s*\:\s*(?P<ethertype>[\w]+)")
         
         # ether hdr : dest mac: ffff.ffff.ffff, src mac: 00a7.428a.7fbf
         
-        p5 = re.compile(r"ether\s*hdr\s*\:\s*dest mac\s*\:\s*(?P<dest_mac>[\w\.]+)\s*\,\s*src mac\s*\:\s*(?P<src_mac>[\w\.]+)")
+        p5 = regex_engine.compile(r"ether\s*hdr\s*\:\s*dest mac\s*\:\s*(?P<dest_mac>[\w\.]+)\s*\,\s*src mac\s*\:\s*(?P<src_mac>[\w\.]+)")
         
         # ether hdr : vlan: 101, ethertype: 0x8100
         
-        p6 = re.compile(r"ether\s*hdr\s*\:\s*vlan\s*\:\s*(?P<vlan>[\d]+)\s*\,\s*ethertype\s*\:\s*(?P<ethertype>[\w]+)")
+        p6 = regex_engine.compile(r"ether\s*hdr\s*\:\s*vlan\s*\:\s*(?P<vlan>[\d]+)\s*\,\s*ethertype\s*\:\s*(?P<ethertype>[\w]+)")
         
         # arp hdr : opcode: 2 (ARP Reply), src mac: 00a7.428a.7fbf dest mac: ffff.ffff.ffff
         
-        p7 = re.compile(r"arp\s*hdr\s*\:\s*opcode\s*\:\s*(?P<opcode>[\w\s\(\)]+)\s*\,\s*src mac\s*\:\s*(?P<src_mac>[\w\.]+)\s*dest mac\s*\:\s*(?P<dest_mac>[\w\.]+)")
+        p7 = regex_engine.compile(r"arp\s*hdr\s*\:\s*opcode\s*\:\s*(?P<opcode>[\w\s\(\)]+)\s*\,\s*src mac\s*\:\s*(?P<src_mac>[\w\.]+)\s*dest mac\s*\:\s*(?P<dest_mac>[\w\.]+)")
         
         # arp   hdr : src ip: 14.0.1.2, dest ip: 14.0.1.2
         
-        p8 = re.compile(r"arp\s*hdr\s*\:\s*src ip\s*\:\s*(?P<src_ip>[\d\.]+)\s*\,\s*dest ip\s*\:\s*(?P<dest_ip>[\d\.]+)")
+        p8 = regex_engine.compile(r"arp\s*hdr\s*\:\s*src ip\s*\:\s*(?P<src_ip>[\d\.]+)\s*\,\s*dest ip\s*\:\s*(?P<dest_ip>[\d\.]+)")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2550,19 +2551,19 @@ class ShowPlatformSoftwareFedSwitchActivePuntPacketcaptureStatus(ShowPlatformSof
         ret_dict = {}
 
         # punt packet capturing: disabled. buffer wrapping: disabled
-        p1 = re.compile(r'^punt\s+packet\s+capturing:\s+(?P<punt_packet_capturing>\w+)\.\s+buffer\s+wrapping:\s+(?P<buffer_wrapping>\w+)$')
+        p1 = regex_engine.compile(r'^punt\s+packet\s+capturing:\s+(?P<punt_packet_capturing>\w+)\.\s+buffer\s+wrapping:\s+(?P<buffer_wrapping>\w+)$')
 
         # Total captured so far :    13 packet(s)
-        p2 = re.compile(r'^total\s+captured\s+so\s+far\s+:\s+(?P<total_captured_so_far>(\d+)\s)+packet\(s\)$')
+        p2 = regex_engine.compile(r'^total\s+captured\s+so\s+far\s+:\s+(?P<total_captured_so_far>(\d+)\s)+packet\(s\)$')
 
         # Capture capacity      :  4096 packet(s)
-        p3 = re.compile(r'^capture\s+capacity\s+:\s+(?P<capture_capacity>(\d+)\s)+packet\(s\)$')
+        p3 = regex_engine.compile(r'^capture\s+capacity\s+:\s+(?P<capture_capacity>(\d+)\s)+packet\(s\)$')
 
         # Max. Meta header size :    88 byte(s)
-        p4 = re.compile(r'^max.\s+meta\s+header\s+size\s+:\s+(?P<max_meta_header_size_bytes>(\d+))\s+byte\(s\)$')
+        p4 = regex_engine.compile(r'^max.\s+meta\s+header\s+size\s+:\s+(?P<max_meta_header_size_bytes>(\d+))\s+byte\(s\)$')
 
         # Max. Packet data size :   128 byte(s)
-        p5 = re.compile(r'^max.\s+packet\s+data\s+size\s+:\s+(?P<max_packet_data_size_bytes>(\d+))\s+byte\(s\)$')
+        p5 = regex_engine.compile(r'^max.\s+packet\s+data\s+size\s+:\s+(?P<max_packet_data_size_bytes>(\d+))\s+byte\(s\)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2697,37 +2698,37 @@ class ShowPlatformSoftwareFedSwitchActivePuntPacketCaptureDisplayFilterIcmpBrief
         res_dict = {}
 
         # ------ Punt Packet Number: 41, Timestamp: 2024/06/25 16:07:00.656 ------
-        p1 = re.compile(r'^------\s+Punt\s+Packet\sNumber:\s+(?P<punt_packet_number>(\d+,))\s+Timestamp:\s+(?P<timestamp>(\d+\/\d+\/\d+\s+\d+:\d+:\d+.\d+\s+------))$')
+        p1 = regex_engine.compile(r'^------\s+Punt\s+Packet\sNumber:\s+(?P<punt_packet_number>(\d+,))\s+Timestamp:\s+(?P<timestamp>(\d+\/\d+\/\d+\s+\d+:\d+:\d+.\d+\s+------))$')
         
         # interface : phy: Vlan100 [if-id: 0x00000624], pal: Vlan100 [if-id: 0x00000624]
-        p2 = re.compile(r'^interface\s*:\s*phy\s*:\s*(?P<phy_val>[\w+]+)\s+\[[\w\-\:]+\s*(?P<phy_if_id>[\w+]+)\]\s*\,\s*pal\s*\:\s*(?P<pal_val>[\w+]+)\s*\[[\w\-\:]+\s*(?P<pal_if_id>(\w+\]))$')
+        p2 = regex_engine.compile(r'^interface\s*:\s*phy\s*:\s*(?P<phy_val>[\w+]+)\s+\[[\w\-\:]+\s*(?P<phy_if_id>[\w+]+)\]\s*\,\s*pal\s*\:\s*(?P<pal_val>[\w+]+)\s*\[[\w\-\:]+\s*(?P<pal_if_id>(\w+\]))$')
         
         # misc info : cause: 55 [For-us control], sub-cause: 0 [CPP_PUNT_SUBCAUSE_TRANSPORT_NONE], linktype: IP [1]
-        p3 = re.compile(r'^misc\s*info\s*\:\s*cause\s*\:\s*(?P<cause_number>(\d+)+)\s*\[(?P<cause>[\w+\-\s+\]]+)+,\s*sub-cause\s*:\s*(?P<sub_cause_num>(\d+)\s+\[(?P<sub_cause>(\w+\]))),\s+linktype\s*:\s*(?P<link_type>(\w+\s*\[(\d)\]))$')
+        p3 = regex_engine.compile(r'^misc\s*info\s*\:\s*cause\s*\:\s*(?P<cause_number>(\d+)+)\s*\[(?P<cause>[\w+\-\s+\]]+)+,\s*sub-cause\s*:\s*(?P<sub_cause_num>(\d+)\s+\[(?P<sub_cause>(\w+\]))),\s+linktype\s*:\s*(?P<link_type>(\w+\s*\[(\d)\]))$')
         
         # CE    hdr : dest mac: 4e41.5000.0111, src mac: 4e41.5000.0111, ethertype: 0x7106
-        p4 = re.compile(r'^CE\s*hdr\s*\:\s*dest mac\s*\:\s*(?P<dest_mac>[\w\.]+)\s*\,\s*src mac\s*\:\s*(?P<src_mac>[\w\.]+)\s*\,\s*ethertype\s*\:\s*(?P<ethertype>[\w]+)$')
+        p4 = regex_engine.compile(r'^CE\s*hdr\s*\:\s*dest mac\s*\:\s*(?P<dest_mac>[\w\.]+)\s*\,\s*src mac\s*\:\s*(?P<src_mac>[\w\.]+)\s*\,\s*ethertype\s*\:\s*(?P<ethertype>[\w]+)$')
         
         # meta  hdr : Nxt. Hdr: 0x1, Fwd. Hdr: 0x2, SSP: 0x119
-        p5 = re.compile(r'^meta\s*hdr\s*:\s+Nxt.\s*Hdr:\s*(?P<nxt_hdr>(\w*)),\s*Fwd.\s*Hdr:\s*(?P<fwd_hdr>(\w*)),\s*SSP:\s*(?P<ssp>(\w*))$')
+        p5 = regex_engine.compile(r'^meta\s*hdr\s*:\s+Nxt.\s*Hdr:\s*(?P<nxt_hdr>(\w*)),\s*Fwd.\s*Hdr:\s*(?P<fwd_hdr>(\w*)),\s*SSP:\s*(?P<ssp>(\w*))$')
         
         # meta  hdr : DSP: 0xffff, SLP: 0x122, DLP: 0xef
-        p6 = re.compile(r'^meta\s*hdr\s*:\s+DSP:\s*(?P<dsp>(\w*)),\s*SLP:\s*(?P<slp>(\w*)),\s*DLP:\s*(?P<dlp>(\w*))$')
+        p6 = regex_engine.compile(r'^meta\s*hdr\s*:\s+DSP:\s*(?P<dsp>(\w*)),\s*SLP:\s*(?P<slp>(\w*)),\s*DLP:\s*(?P<dlp>(\w*))$')
         
         # ether hdr : dest mac: 3c57.3104.7045, src mac: a0b4.39cd.70ff
-        p7 = re.compile(r'^ether\s*hdr\s*\:\s*dest mac\s*\:\s*(?P<dest_mac>[\w\.]+)\s*\,\s*src mac\s*\:\s*(?P<src_mac>[\w\.]+)$')
+        p7 = regex_engine.compile(r'^ether\s*hdr\s*\:\s*dest mac\s*\:\s*(?P<dest_mac>[\w\.]+)\s*\,\s*src mac\s*\:\s*(?P<src_mac>[\w\.]+)$')
         
         # ether hdr : vlan: 100, ethertype: 0x8100
-        p8 = re.compile(r'^ether\s*hdr\s*\:\s*vlan\s*\:\s*(?P<vlan>[\d]+)\s*\,\s*ethertype\s*\:\s*(?P<ether_type>[\w]+)$')
+        p8 = regex_engine.compile(r'^ether\s*hdr\s*\:\s*vlan\s*\:\s*(?P<vlan>[\d]+)\s*\,\s*ethertype\s*\:\s*(?P<ether_type>[\w]+)$')
        
         # ipv4  hdr : dest ip: 100.10.1.1, src ip: 1.0.0.3
-        p9 = re.compile(r'^ipv4\s*hdr\s*:\s*dest\s*ip:\s*(?P<dest_ip>(\d*\.\d*\.\d*\.\d*)),\s*src\s*ip:\s*(?P<src_ip>(\d*\.\d*\.\d*\.\d*))$')
+        p9 = regex_engine.compile(r'^ipv4\s*hdr\s*:\s*dest\s*ip:\s*(?P<dest_ip>(\d*\.\d*\.\d*\.\d*)),\s*src\s*ip:\s*(?P<src_ip>(\d*\.\d*\.\d*\.\d*))$')
        
         # ipv4  hdr : packet len: 100, ttl: 254, protocol: 1 (ICMP)
-        p10 = re.compile(r'^ipv4\s*hdr\s*:\s*packet\s*len:\s*(?P<packet_len>(\d*)),\s*ttl:\s*(?P<ttl>(\d*)),\s*protocol:\s*(?P<protocol>(\d*\s*\(\w*\)))$')
+        p10 = regex_engine.compile(r'^ipv4\s*hdr\s*:\s*packet\s*len:\s*(?P<packet_len>(\d*)),\s*ttl:\s*(?P<ttl>(\d*)),\s*protocol:\s*(?P<protocol>(\d*\s*\(\w*\)))$')
         
         # icmp  hdr : icmp type: 8, code: 0
-        p11 = re.compile(r'^icmp\s*hdr\s*:\s*icmp\s*type:\s*(?P<icmp_type>(\d*)),\s*code:\s*(?P<code>(\d*))$')
+        p11 = regex_engine.compile(r'^icmp\s*hdr\s*:\s*icmp\s*type:\s*(?P<icmp_type>(\d*)),\s*code:\s*(?P<code>(\d*))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2879,7 +2880,7 @@ class ShowPlatformSoftwareFedSwitchAclUsageIncludeAcl(ShowPlatformSoftwareFedSwi
         ret_dict = {}
 
         # PACL          IPV4          Egress          racl_permit_egress          2
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<feature_type>\w+)\s+(?P<acl_type>IPV[46])\s+(?P<dir>\w+)\s+(?P<name>\w+)\s+(?P<entries_used>\d+)$"
         )
 
@@ -2989,37 +2990,37 @@ class ShowPlatformSoftwareFedSwitchActivePuntPacketCapturedisplayFiltericmpv6Bri
         res_dict = {}
 
         #------ Punt Packet Number: 6, Timestamp: 2024/06/25 16:17:59.842 ------
-        p0 = re.compile(r".+\s*Punt Packet Number\s*:\s*(?P<punt_packet_number>[\d]+)\s*\,\s*Timestamp\s*\:\s*(?P<timestamp>[\d\/\s\:\.]+).+")
+        p0 = regex_engine.compile(r".+\s*Punt Packet Number\s*:\s*(?P<punt_packet_number>[\d]+)\s*\,\s*Timestamp\s*\:\s*(?P<timestamp>[\d\/\s\:\.]+).+")
 
         #interface : phy: Port-channel10 [if-id: 0x0000058a], pal: Port-channel10 [if-id: 0x0000058a]
-        p1 = re.compile(r"interface\s*:\s*phy\s*:\s*(?P<phy_val>[\w\-]+)\s*\[if-id:\s*(?P<phy_if_id>[\w]+)\]\s*,\s*pal\s*:\s*(?P<pal_val>[\w\-]+)\s*\[if-id:\s*(?P<pal_if_id>[\w]+)\]")
+        p1 = regex_engine.compile(r"interface\s*:\s*phy\s*:\s*(?P<phy_val>[\w\-]+)\s*\[if-id:\s*(?P<phy_if_id>[\w]+)\]\s*,\s*pal\s*:\s*(?P<pal_val>[\w\-]+)\s*\[if-id:\s*(?P<pal_if_id>[\w]+)\]")
 
         #misc info : cause: 58 [Layer2 bridge domain data packet], sub-cause: 11 [NONE], linktype: IPV6 [4]
-        p2 = re.compile(r"misc info : cause:\s*(?P<cause>\d+)\s*\[(?P<cause_description>[^\]]+)\],\s*sub-cause:\s*(?P<sub_cause>\d+)\s*\[(?P<sub_cause_description>[^\]]+)\],\s*linktype:\s*(?P<link_type>[A-Z0-9\s]+)\s*\[\d+\]")
+        p2 = regex_engine.compile(r"misc info : cause:\s*(?P<cause>\d+)\s*\[(?P<cause_description>[^\]]+)\],\s*sub-cause:\s*(?P<sub_cause>\d+)\s*\[(?P<sub_cause_description>[^\]]+)\],\s*linktype:\s*(?P<link_type>[A-Z0-9\s]+)\s*\[\d+\]")
 
         #CE    hdr : dest mac: f4bd.9eff.fff0, src mac: f4bd.9eff.fff1, ethertype: 0x7106
-        p3 = re.compile(r"CE\s+hdr\s*:\s*dest mac:\s*(?P<dest_mac>[0-9a-fA-F\.]+),\s*src mac:\s*(?P<src_mac>[0-9a-fA-F\.]+),\s*ethertype:\s*(?P<ethertype>0x[0-9a-fA-F]+)")
+        p3 = regex_engine.compile(r"CE\s+hdr\s*:\s*dest mac:\s*(?P<dest_mac>[0-9a-fA-F\.]+),\s*src mac:\s*(?P<src_mac>[0-9a-fA-F\.]+),\s*ethertype:\s*(?P<ethertype>0x[0-9a-fA-F]+)")
 
         #meta  hdr : Nxt. Hdr: 0x1, Fwd. Hdr: 0, SSP: 0x55f
-        p4=re.compile(r"meta\s+hdr\s*:\s*Nxt\. Hdr:\s*(?P<nxt_hdr>0x[0-9a-fA-F]+),\s*Fwd\. Hdr:\s*(?P<fwd_hdr>\d+),\s*SSP:\s*(?P<ssp>0x[0-9a-fA-F]+)")
+        p4=regex_engine.compile(r"meta\s+hdr\s*:\s*Nxt\. Hdr:\s*(?P<nxt_hdr>0x[0-9a-fA-F]+),\s*Fwd\. Hdr:\s*(?P<fwd_hdr>\d+),\s*SSP:\s*(?P<ssp>0x[0-9a-fA-F]+)")
 
         #meta  hdr : DSP: 0xffff, SLP: 0x800fb, DLP: 0xef
-        p5=re.compile(r"meta\s+hdr\s*:\s*D?SP:\s*(?P<dsp>0x[0-9a-fA-F]+),\s*SLP:\s*(?P<slp>0x[0-9a-fA-F]+),\s*D?LP:\s*(?P<dlp>0x[0-9a-fA-F]+)")
+        p5=regex_engine.compile(r"meta\s+hdr\s*:\s*D?SP:\s*(?P<dsp>0x[0-9a-fA-F]+),\s*SLP:\s*(?P<slp>0x[0-9a-fA-F]+),\s*D?LP:\s*(?P<dlp>0x[0-9a-fA-F]+)")
 
         #ether hdr : dest mac: 3333.0000.0016, src mac: a0b4.39cd.70ff
-        p6 = re.compile(r"ether\s+hdr\s*:\s*dest mac:\s*(?P<dest_mac>[0-9a-fA-F\.]+),\s*src mac:\s*(?P<src_mac>[0-9a-fA-F\.]+)")
+        p6 = regex_engine.compile(r"ether\s+hdr\s*:\s*dest mac:\s*(?P<dest_mac>[0-9a-fA-F\.]+),\s*src mac:\s*(?P<src_mac>[0-9a-fA-F\.]+)")
 
         #ether hdr : vlan: 100, ethertype: 0x8100
-        p7 = re.compile(r"ether\s+hdr\s*:\s*vlan:\s*(?P<vlan>\d+),\s*ethertype:\s*(?P<ether_type>0x[0-9a-fA-F]+)")
+        p7 = regex_engine.compile(r"ether\s+hdr\s*:\s*vlan:\s*(?P<vlan>\d+),\s*ethertype:\s*(?P<ether_type>0x[0-9a-fA-F]+)")
 
         #ipv6  hdr : dest ip: ff02::16
-        p8 = re.compile(r"ipv6\s+hdr\s*:\s*dest ip:\s*(?P<dest_ip>[a-fA-F0-9:]+)")
+        p8 = regex_engine.compile(r"ipv6\s+hdr\s*:\s*dest ip:\s*(?P<dest_ip>[a-fA-F0-9:]+)")
 
         #ipv6  hdr : src ip : fe80::a2b4:39ff:fecd:70ff
-        p9 = re.compile(r"ipv6\s+hdr\s*:\s*src ip\s*:\s*(?P<src_ip>[a-fA-F0-9:]+)")
+        p9 = regex_engine.compile(r"ipv6\s+hdr\s*:\s*src ip\s*:\s*(?P<src_ip>[a-fA-F0-9:]+)")
 
         #ipv6  hdr : payload len: 36, hop count: 1, next hdr: 0
-        p10 = re.compile(r"ipv6\s+hdr\s*:\s*payload len:\s*(?P<payload_len>\d+),\s*hop count:\s*(?P<hop_count>\d+),\s*next hdr:\s*(?P<next_hdr>\d+)")
+        p10 = regex_engine.compile(r"ipv6\s+hdr\s*:\s*payload len:\s*(?P<payload_len>\d+),\s*hop count:\s*(?P<hop_count>\d+),\s*next hdr:\s*(?P<next_hdr>\d+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3205,71 +3206,71 @@ class ShowPlatformSoftwareFedIpMfibVrfGroupDetail(ShowPlatformSoftwareFedIpMfibV
         index1 = 1
     
         # Mvrf: 2  ( 14.14.14.2, 225.0.0.1 ) Attrs:
-        p1 = re.compile(r'.* +\( +(?P<source_ip>[\w\:\.\*\/]+)+\, +(?P<group_ip>[\w\:\.\/]+)')
+        p1 = regex_engine.compile(r'.* +\( +(?P<source_ip>[\w\:\.\*\/]+)+\, +(?P<group_ip>[\w\:\.\/]+)')
     
         # Hw Flag                 : InHw
-        p2 = re.compile(r'Hw Flag +\: +(?P<hw_flag>\w+)')
+        p2 = regex_engine.compile(r'Hw Flag +\: +(?P<hw_flag>\w+)')
     
         # Mlist_hndl (Id)         : 0x118831561f8 ( 0x1fd2 )
-        p3 = re.compile(r'Mlist_hndl +\(Id\) +\: +(?P<mlist_handle>\S+)')
+        p3 = regex_engine.compile(r'Mlist_hndl +\(Id\) +\: +(?P<mlist_handle>\S+)')
     
         # Mlist Urid              : 0x1000000000001f91
-        p4 = re.compile(r'Mlist Urid +\: +(?P<mlist_urid>\S+)')
+        p4 = regex_engine.compile(r'Mlist Urid +\: +(?P<mlist_urid>\S+)')
     
         # Fset Urid (Hash)        : 0x3000000000000059 ( cad91c96 )
-        p5 = re.compile(r'Fset Urid +\(Hash\) +\: +(?P<fset_urid>\S+)')
+        p5 = regex_engine.compile(r'Fset Urid +\(Hash\) +\: +(?P<fset_urid>\S+)')
     
         # Fset Aux Urid           : 0x0
-        p6 = re.compile(r'Fset Aux Urid +\: +(?P<fset_aux_urid>\S+)')
+        p6 = regex_engine.compile(r'Fset Aux Urid +\: +(?P<fset_aux_urid>\S+)')
     
         # RPF Adjacency ID        : 0xf80054f1
-        p7 = re.compile(r'RPF Adjacency ID +\: +(?P<rpf_adjancency_id>\S+)')
+        p7 = regex_engine.compile(r'RPF Adjacency ID +\: +(?P<rpf_adjancency_id>\S+)')
     
         # CPU Credit              : 0
-        p8 = re.compile(r'CPU Credit +\: +(?P<cpu_credit>\d+)')
+        p8 = regex_engine.compile(r'CPU Credit +\: +(?P<cpu_credit>\d+)')
     
         # Total Packets           : 17918 ( 19 pps approx.)
-        p9 = re.compile(r'Total Packets +\: +(?P<total_packets>\d+)')
+        p9 = regex_engine.compile(r'Total Packets +\: +(?P<total_packets>\d+)')
     
         # npi_mroute_ent          : 0x118831bdc90
-        p10 = re.compile(r'npi_mroute_ent +\: +(?P<npi_mroute_ent>\S+)')
+        p10 = regex_engine.compile(r'npi_mroute_ent +\: +(?P<npi_mroute_ent>\S+)')
     
         # svi_fwd_ifs             : 0
-        p11 = re.compile(r'svi_fwd_ifs +\: +(?P<svi_fwd_ifs>\d+)')
+        p11 = regex_engine.compile(r'svi_fwd_ifs +\: +(?P<svi_fwd_ifs>\d+)')
     
         # OIF Details:
         #  AdjID          Interface          ParentIf        HwFlag      Flags      IntfType       MsgType
         #  0xf80054a1     Hu1/0/9            --------         ---        F NS       --------       NORMAL
         #  0xf80054f1     Hu1/0/23           --------         ---        A          --------       NORMAL
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'(?P<adj_id>\d\S+) +(?P<interface>[\w\:\.\/]+) +(?P<parent_if>\S+) +(?P<hw_flag>\S+) +(?P<flags>\D+) +(?P<intf_type>\S+) +(?P<msg_type>\w+)')
     
         # GID                   : 8276
-        p13 = re.compile(r'GID +\: +(?P<gid>\d+)')
+        p13 = regex_engine.compile(r'GID +\: +(?P<gid>\d+)')
     
         # MCID OID Asic[0]      : 2282
-        p14 = re.compile(r'MCID OID Asic\[0\] +\: +(?P<mcid_oid_asic>\d+)')
+        p14 = regex_engine.compile(r'MCID OID Asic\[0\] +\: +(?P<mcid_oid_asic>\d+)')
     
         # IP MCID OID         :2282 (cookie: urid:0x30::59)
-        p15 = re.compile(r'IP MCID OID +\:+(?P<ip_mcid_oid>\d+) +\(cookie\: +urid\:(?P<cookie_urid>\S+)\)')
+        p15 = regex_engine.compile(r'IP MCID OID +\:+(?P<ip_mcid_oid>\d+) +\(cookie\: +urid\:(?P<cookie_urid>\S+)\)')
     
         # RPF PORT OID        :2130
-        p16 = re.compile(r'RPF PORT OID  +\:+(?P<rpf_port_oid>\d+)')
+        p16 = regex_engine.compile(r'RPF PORT OID  +\:+(?P<rpf_port_oid>\d+)')
     
         # punt_on_rpf_fail    :1
-        p17 = re.compile(r'punt_on_rpf_fail  +\:+(?P<punt_on_rpf_fail>\d+)')
+        p17 = regex_engine.compile(r'punt_on_rpf_fail  +\:+(?P<punt_on_rpf_fail>\d+)')
     
         # punt_and_forward    :0
-        p18 = re.compile(r'punt_and_forward  +\:+(?P<punt_and_forward>\d+)')
+        p18 = regex_engine.compile(r'punt_and_forward  +\:+(?P<punt_and_forward>\d+)')
     
         # use_rpfid           :0
-        p19 = re.compile(r'use_rpfid  +\:+(?P<use_rpfid>\d+)')
+        p19 = regex_engine.compile(r'use_rpfid  +\:+(?P<use_rpfid>\d+)')
     
         # rpfid               :0
-        p20 = re.compile(r'rpfid  +\:+(?P<rpfid>\d+)')
+        p20 = regex_engine.compile(r'rpfid  +\:+(?P<rpfid>\d+)')
     
         # enable_rpf_check    :1
-        p21 = re.compile(r'enable_rpf_check  +\:+(?P<enable_rpf_check>\d+)')
+        p21 = regex_engine.compile(r'enable_rpf_check  +\:+(?P<enable_rpf_check>\d+)')
     
         ret_dict = {}
         for line in output.splitlines():
@@ -3529,129 +3530,129 @@ class ShowPlatformHardwareFedSwitchQosQueueConfig(
             output = self.device.execute(cmd)
 
         # Interface : HundredGigE2/0/34.100 (0x54C)
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^Interface\s+: (?P<interface>\S+) \((?P<interface_id>\S+)\)$"
         )
 
         # VOQ OID        : 2114(0x842)
-        p1 = re.compile(r"^VOQ OID\s+: (?P<voq_oid>\S+)\((?P<voq_id>\S+)\)$")
+        p1 = regex_engine.compile(r"^VOQ OID\s+: (?P<voq_oid>\S+)\((?P<voq_id>\S+)\)$")
 
         # VOQ Set Size   : 3
-        p2 = re.compile(r"^VOQ Set Size\s+: (?P<voq_set_size>\S+)$")
+        p2 = regex_engine.compile(r"^VOQ Set Size\s+: (?P<voq_set_size>\S+)$")
 
         # Base VOQ ID    : 28952
-        p3 = re.compile(r"^Base VOQ ID\s+: (?P<base_voq_id>\S+)$")
+        p3 = regex_engine.compile(r"^Base VOQ ID\s+: (?P<base_voq_id>\S+)$")
 
         # Base VSC IDs   : 728, 792, 856, 920, 984, 1048
-        p4 = re.compile(r"^Base VSC IDs\s+: (?P<base_vsc_ids>[\w\s\,]+)$")
+        p4 = regex_engine.compile(r"^Base VSC IDs\s+: (?P<base_vsc_ids>[\w\s\,]+)$")
 
         # VOQ State      : Active
-        p5 = re.compile(r"^VOQ State\s+: (?P<voq_state>\S+)$")
+        p5 = regex_engine.compile(r"^VOQ State\s+: (?P<voq_state>\S+)$")
 
         # VOQ Flush      : Flush not active
-        p6 = re.compile(r"^VOQ Flush\s+: (?P<voq_flush>.+)$")
+        p6 = regex_engine.compile(r"^VOQ Flush\s+: (?P<voq_flush>.+)$")
 
         # Is Empty       : Yes
-        p7 = re.compile(r"^Is Empty\s+: (?P<is_empty>.+)$")
+        p7 = regex_engine.compile(r"^Is Empty\s+: (?P<is_empty>.+)$")
 
         # Profile OID            : 433(0x1B1)
-        p8_1 = re.compile(
+        p8_1 = regex_engine.compile(
             r"^Profile OID\s+: (?P<profile_oid>\d+)\((?P<profile_id>\w+)\)$"
         )
 
         # Device ID              : 0
-        p9 = re.compile(r"^Device ID\s+: (?P<device_id>\d+)$")
+        p9 = regex_engine.compile(r"^Device ID\s+: (?P<device_id>\d+)$")
 
         # CGM Type               : Unicast
-        p10 = re.compile(r"^CGM Type\s+: (?P<cgm_type>\w+)$")
+        p10 = regex_engine.compile(r"^CGM Type\s+: (?P<cgm_type>\w+)$")
 
         # Profile reference count: 73
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^Profile reference count\s*: (?P<profile_reference_count>\d+)$"
         )
 
         # Is Reserved            : Yes
-        p12 = re.compile(r"^Is Reserved\s+: (?P<is_reserved>[\w\s]+)$")
+        p12 = regex_engine.compile(r"^Is Reserved\s+: (?P<is_reserved>[\w\s]+)$")
 
         # For speeds             : 10000000000
-        p13 = re.compile(r"^For speeds\s+: (?P<for_speeds>\d+)$")
+        p13 = regex_engine.compile(r"^For speeds\s+: (?P<for_speeds>\d+)$")
 
         # Associated VOQ Offsets : 0
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^Associated VOQ Offsets\s+: (?P<associated_voq_offsets>[\d, ]+)$"
         )
 
         # HBM Enabled            : Enabled
-        p15 = re.compile(r"^HBM Enabled\s+: (?P<hbm_enabled>\w+)$")
+        p15 = regex_engine.compile(r"^HBM Enabled\s+: (?P<hbm_enabled>\w+)$")
 
         # HBM Block Size         : 6144
-        p16 = re.compile(r"^HBM Block Size\s+: (?P<hgm_block_size>\w+)$")
+        p16 = regex_engine.compile(r"^HBM Block Size\s+: (?P<hgm_block_size>\w+)$")
 
         # RED Enabled            : Enabled
-        p17 = re.compile(r"^RED Enabled\s+: (?P<red_enabled>\w+)$")
+        p17 = regex_engine.compile(r"^RED Enabled\s+: (?P<red_enabled>\w+)$")
 
         # FCN Enabled            : Disabled
-        p18 = re.compile(r"^FCN Enabled\s+: (?P<fcn_enabled>\w+)$")
+        p18 = regex_engine.compile(r"^FCN Enabled\s+: (?P<fcn_enabled>\w+)$")
 
         # Queue User Config      :
-        p19 = re.compile(r"^Queue User Config\s+:$")
+        p19 = regex_engine.compile(r"^Queue User Config\s+:$")
 
         # Q-Limit(HBM Blocks)    : 4882
-        p19_1 = re.compile(
+        p19_1 = regex_engine.compile(
             r"^Q-Limit\(HBM Blocks\)\s+: (?P<q_limit_hbm_blocks>\d+)$"
         )
 
         # RED EMA Coefficient    : 1.000000
-        p19_2 = re.compile(
+        p19_2 = regex_engine.compile(
             r"^RED EMA Coefficient\s+: (?P<red_ema_coefficient>[\w\.]+)$"
         )
 
         # RED Green :
-        p19_3 = re.compile(r"^RED\s+(?P<red_flag>\w+)\s:$")
+        p19_3 = regex_engine.compile(r"^RED\s+(?P<red_flag>\w+)\s:$")
 
         # Minium(HBM BLOCKS)   : 0
-        p19_4 = re.compile(
+        p19_4 = regex_engine.compile(
             r"^Minium\(HBM BLOCKS\)\s*: (?P<minimun_hbm_blocks>\d+)$"
         )
 
         # Maximum(HBM BLOCKS)  : 1220
-        p19_5 = re.compile(
+        p19_5 = regex_engine.compile(
             r"^Maximum\(HBM BLOCKS\)\s*: (?P<maximum_hbm_blocks>\d+)$"
         )
 
         # Maximum Probability  : 0
-        p19_6 = re.compile(
+        p19_6 = regex_engine.compile(
             r"^Maximum Probability\s*: (?P<maximum_probability>\d+)$"
         )
 
         # Queue H/W Values       :
-        p20 = re.compile(r"^Queue H/W Values\s+:$")
+        p20 = regex_engine.compile(r"^Queue H/W Values\s+:$")
 
         # RED Action                     : Drop
-        p20_1 = re.compile(r"^RED Action\s+: (?P<red_action>\w+)$")
+        p20_1 = regex_engine.compile(r"^RED Action\s+: (?P<red_action>\w+)$")
 
         # RED Drop thresholds            : 0, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220
-        p20_2 = re.compile(
+        p20_2 = regex_engine.compile(
             r"^RED Drop thresholds\s+: (?P<red_drop_thresholds>[\w\s\,]+)$"
         )
 
         # RED Drop Probabilities[Green]  : 0.000000, 0.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000
-        p20_3 = re.compile(
+        p20_3 = regex_engine.compile(
             r"^RED Drop Probabilities\[(?P<red_flag>[\w]+)\]\s+: (?P<red_drop_probabilities>[\w\s\,\.]+)$"
         )
 
         # HBM Free Thresholds            : 10000, 20000, 40000, 60000, 124992, 250000, 500000, 1000000
-        p20_4 = re.compile(
+        p20_4 = regex_engine.compile(
             r"^HBM Free Thresholds\s+: (?P<hbm_free_thresholds>[\w\s\,\.]+)$"
         )
 
         # HBM VOQ Age Thresholds         : 1, 2, 3, 4, 5, 6, 7, 8, 10, 12, 16, 24, 32, 64, 128
-        p20_5 = re.compile(
+        p20_5 = regex_engine.compile(
             r"^HBM VOQ Age Thresholds\s+: (?P<hbm_voq_age_thresholds>[\w\s\,\.]+)$"
         )
 
         # HBM VOQ Thresholds             : 96, 992, 2000, 4000, 6000, 8000, 12000, 16000, 24000, 32000, 40000, 48000, 56000, 64000, 64512, 65536,
-        p20_6 = re.compile(
+        p20_6 = regex_engine.compile(
             r"^HBM VOQ Thresholds\s+: (?P<hbm_voq_thresholds>[\w\s\,\.]+)$"
         )
 
@@ -3,7 +3,6 @@
      *  show platform hardware fed switch active fwd-asic resource utilization
      *  show platform hardware fed active fwd-asic resource utilization
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -15,6 +14,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =======================================================================
@@ -64,7 +64,7 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicResourceUtilization(ShowPlatform
         # Resource              Slice Pair    Utilized   Total
         # Resource              Slice/IFG-id  Utilized   Total
         # Resource              Device        Utilized   Total
-        p1 = re.compile(r'^(?P<resource>Resource)(?:\s*)(?P<resource_type>Slice\sPair|Slice\/IFG-id|Slice|Device)(?:\s*)(?P<utilized>Utilized)(?:\s*)(?P<total>Total)$')
+        p1 = regex_engine.compile(r'^(?P<resource>Resource)(?:\s*)(?P<resource_type>Slice\sPair|Slice\/IFG-id|Slice|Device)(?:\s*)(?P<utilized>Utilized)(?:\s*)(?P<total>Total)$')
 
         # MAC Termination EM table              s-0          172     8224
         # MAC Termination EM table              s-1          172     8224
@@ -76,7 +76,7 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicResourceUtilization(ShowPlatform
         # Tunnel 0 Exact Match                  s-1          169     4128
         # Tunnel 0 Exact Match                  s-2          169     4128
         # Tunnel 0 Exact Match                  s-3          169     4128
-        p2 = re.compile(r'^(?P<resource_1>((\w*\s\w*){1,10}\b)|(\w*.*\w\b))(?:\s*)(?P<slice_1>s-\d*)(?:\s*)(?P<utilized_1>\d*)(?:\s*)(?P<total_1>\d*)$')
+        p2 = regex_engine.compile(r'^(?P<resource_1>((\w*\s\w*){1,10}\b)|(\w*.*\w\b))(?:\s*)(?P<slice_1>s-\d*)(?:\s*)(?P<utilized_1>\d*)(?:\s*)(?P<total_1>\d*)$')
 
         # Ingress Eth Narrow DB2 int_0 ACL IDs          p-1            0      127
         # Ingress Eth Narrow DB2 int_0 ACL IDs          p-2            0      127
@@ -86,14 +86,14 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicResourceUtilization(ShowPlatform
         # Ingress IPv4 int_0 OGACL IDs                  p-0            0      127
         # Ingress IPv4 int_0 OGACL IDs                  p-1            0      127
         # Ingress IPv4 int_0 OGACL IDs                  p-2            0      127
-        p3 = re.compile(r'^(?P<resource_2>((\w*\s\w*){1,10}\b)|(\w*.*\w\b))(?:\s*)(?P<slice_2>p-\d*)(?:\s*)(?P<utilized_2>\d*)(?:\s*)(?P<total_2>\d*)$')
+        p3 = regex_engine.compile(r'^(?P<resource_2>((\w*\s\w*){1,10}\b)|(\w*.*\w\b))(?:\s*)(?P<slice_2>p-\d*)(?:\s*)(?P<utilized_2>\d*)(?:\s*)(?P<total_2>\d*)$')
 
         # Qos Meter actions                   i-5/0          1        4
         # Qos Meter actions                   i-5/1          1        4
         # Qos Meter profiles                  i-0/0          1       16
         # Qos Meter profiles                  i-0/1          1       16
         # Qos Meter profiles                  i-1/0          1       16
-        p4 = re.compile(r'^(?P<resource_3>((\w*\s\w*){1,10}\b)|(\w*.*\w\b))(?:\s*)(?P<slice_3>i-\d*\/\d*)(?:\s*)(?P<utilized_3>\d*)(?:\s*)(?P<total_3>\d*)$')
+        p4 = regex_engine.compile(r'^(?P<resource_3>((\w*\s\w*){1,10}\b)|(\w*.*\w\b))(?:\s*)(?P<slice_3>i-\d*\/\d*)(?:\s*)(?P<utilized_3>\d*)(?:\s*)(?P<total_3>\d*)$')
 
         # AC Profiles                         d-0            2       15
         # Counter Bank                        d-0           92      108
@@ -101,7 +101,7 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicResourceUtilization(ShowPlatform
         # IPv6 VRF DIP EM Table               d-0           11   311285
         # LPM  Routes                         d-0            0      100
         # LPM IPv4 Routes                     d-0           51  2358465
-        p5 = re.compile(r'^(?P<resource_4>((\w*\s\w*){1,8}\b)|(\w*.*\w\b))(?:\s*)(?P<slice_4>d-\d*)(?:\s*)(?P<utilized_4>\d*)(?:\s*)(?P<total_4>\d*)$')
+        p5 = regex_engine.compile(r'^(?P<resource_4>((\w*\s\w*){1,8}\b)|(\w*.*\w\b))(?:\s*)(?P<slice_4>d-\d*)(?:\s*)(?P<utilized_4>\d*)(?:\s*)(?P<total_4>\d*)$')
 
         # loop to split lines of output
         for line in output.splitlines():
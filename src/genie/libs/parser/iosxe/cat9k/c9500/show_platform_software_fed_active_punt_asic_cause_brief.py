@@ -1,11 +1,13 @@
 # Python
-import re
 import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================================================
 # Schema for 'show  platform software fed {switch} active punt asic-cause brief'
 # =============================================================================
@@ -45,9 +47,9 @@ class ShowPlatformSoftwareFedActivePuntAsicCauseBrief(ShowPlatformSoftwareFedAct
 
         # UKNWN   UNKNOWN                       218          218          218          218
         # INMIR   ARP MIRROR                    368          368            0            0
-        p1 = re.compile(r'^(?P<source>\w+)(?:\s*)'
-                        r'(?P<cause_name>\w+(\s(\S{1,}))+|(\w+\s)+\w*\S\w*\S*|\w*\S\w*\S|\w+((\s\w+){1,}))(?:\s*)'
-                        r'(?P<rx_cur>\d+)(?:\s*)(?P<rx_delta>\d+)(?:\s*)(?P<drop_cur>\d+)(?:\s*)(?P<drop_delta>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<source>\w+)(?:\s*)'
+                                  r'(?P<cause_name>\w+(\s(\S{1,}))+|(\w+\s)+\w*\S\w*\S*|\w*\S\w*\S|\w+((\s\w+){1,}))(?:\s*)'
+                                  r'(?P<rx_cur>\d+)(?:\s*)(?P<rx_delta>\d+)(?:\s*)(?P<drop_cur>\d+)(?:\s*)(?P<drop_delta>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3,13 +3,13 @@
      *  show sdm prefer
      *  show sdm prefer custom
 """
-import re
 import logging
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =======================================================================
@@ -153,27 +153,27 @@ class ShowSdmPreferNew(ShowSdmPreferNewSchema):
             output = self.device.execute(cmd)
 
         # Showing SDM Template Info
-        p0 = re.compile(r'^Showing+\s+(?P<template_title>[\w]+)+\s+Template Info+$')
+        p0 = regex_engine.compile(r'^Showing+\s+(?P<template_title>[\w]+)+\s+Template Info+$')
 
         # "This is the Custom template"
-        p1 = re.compile(r'^This is the+\s+(?P<template_type>[\w]+)+\s+template+\.+$')
+        p1 = regex_engine.compile(r'^This is the+\s+(?P<template_type>[\w]+)+\s+template+\.+$')
 
         # Feature-Name                                        Reserved-Scale
-        p2 = re.compile(r'^Feature-Name(?:\s*)(?P<feature_name>\S*)$')
+        p2 = regex_engine.compile(r'^Feature-Name(?:\s*)(?P<feature_name>\S*)$')
 
         # Unicast MAC addresses                               262144
         # FIB Host Route                                      262144
         # OG/SGACL Hosts/Cells                                32768
-        p3 = re.compile(r'^(?P<feature>Unicast MAC addresses|FIB Host Route|OG\/SGACL Hosts\/Cells)(?:\s*)(?P<number_feature>\d*)$')
+        p3 = regex_engine.compile(r'^(?P<feature>Unicast MAC addresses|FIB Host Route|OG\/SGACL Hosts\/Cells)(?:\s*)(?P<number_feature>\d*)$')
 
         # Unicast MAC addresses*                              131072 (current) - 262144 (proposed)
         # FIB Host Route*                                     131072 (current) - 262144 (proposed)
         # OG/SGACL Hosts/Cells*                               32768  (current) - 32768  (proposed)
-        p3_1 = re.compile(r'^(?P<feature>Unicast MAC addresses|FIB Host Route|OG\/SGACL Hosts\/Cells)\S(?:\s*)'
-                            r'(?P<current_feature>\d*)(?:\s*\Scurrent\S)(?:\s*-\s*)(?P<proposed_feature>\d*)(?:\s*\Sproposed\S)$')
+        p3_1 = regex_engine.compile(r'^(?P<feature>Unicast MAC addresses|FIB Host Route|OG\/SGACL Hosts\/Cells)\S(?:\s*)'
+                                      r'(?P<current_feature>\d*)(?:\s*\Scurrent\S)(?:\s*-\s*)(?P<proposed_feature>\d*)(?:\s*\Sproposed\S)$')
 
         # Resource-Programmed: EM
-        p4 = re.compile(r'^Resource-Programmed:(?:\s*)(?P<em>\w*)$')
+        p4 = regex_engine.compile(r'^Resource-Programmed:(?:\s*)(?P<em>\w*)$')
 
         # L3 Multicast entries                                32768 (**)
         # L2 Multicast entries                                16384 (**)
@@ -191,26 +191,26 @@ class ShowSdmPreferNew(ShowSdmPreferNewSchema):
         # Max L3 adjacency                                    131072 (**)
         # Max L3 Interface                                    8192 (**)
         # Max MPLS TE TUNNEL                                  4096 (**)
-        p5 = re.compile(r'^(?P<type>L3 Multicast entries|L2 Multicast entries|Number of VLANs|'
-                        r'Overflow Unicast MAC addresses|Overflow L2 Multicast entries|Overflow L3 Multicast entries|'
-                        r'Ipv4\/Ipv6 shared unicast routes|Overflow shared unicast routes|STP Instances|Tunnels|VRF|'
-                        r'Max MPLS VPN Routes Per-Vrf label mode|Max MPLS VPN Routes Per-Prefix label mode|Max L3 adjacency|'
-                        r'Max L3 Interface|Max MPLS TE TUNNEL)(?:\s*)(?P<input_number>\d*)(?:\s*\S*)$')
+        p5 = regex_engine.compile(r'^(?P<type>L3 Multicast entries|L2 Multicast entries|Number of VLANs|'
+                                  r'Overflow Unicast MAC addresses|Overflow L2 Multicast entries|Overflow L3 Multicast entries|'
+                                  r'Ipv4\/Ipv6 shared unicast routes|Overflow shared unicast routes|STP Instances|Tunnels|VRF|'
+                                  r'Max MPLS VPN Routes Per-Vrf label mode|Max MPLS VPN Routes Per-Prefix label mode|Max L3 adjacency|'
+                                  r'Max L3 Interface|Max MPLS TE TUNNEL)(?:\s*)(?P<input_number>\d*)(?:\s*\S*)$')
 
         #L3 Multicast entries*                               32768  (current) - 32768  (proposed) (**)
         #L2 Multicast entries*                               16384  (current) - 16384  (proposed) (**)
-        p5_1 = re.compile(r'^(?P<type_1>L3 Multicast entries\S|L2 Multicast entries\S|Number of VLANs\S|'
-                        r'Overflow Unicast MAC addresses\S|Overflow L2 Multicast entries\S|Overflow L3 Multicast entries\S|'
-                        r'Ipv4\/Ipv6 shared unicast routes\S|Overflow shared unicast routes\S|STP Instances\S|Tunnels\S|VRF\S|'
-                        r'Max MPLS VPN Routes Per-Vrf label mode\S|Max MPLS VPN Routes Per-Prefix label mode\S|Max L3 adjacency\S|'
-                        r'Max L3 Interface\S|Max MPLS TE TUNNEL\S)(?:\s*)(?P<current_l>\d*)(?:\s*\Scurrent\S)(?:\s*-\s*)'
-                        r'(?P<proposed_l>\d*)(?:\s*\Sproposed\S)(?:\s*\S*)$')
+        p5_1 = regex_engine.compile(r'^(?P<type_1>L3 Multicast entries\S|L2 Multicast entries\S|Number of VLANs\S|'
+                                  r'Overflow Unicast MAC addresses\S|Overflow L2 Multicast entries\S|Overflow L3 Multicast entries\S|'
+                                  r'Ipv4\/Ipv6 shared unicast routes\S|Overflow shared unicast routes\S|STP Instances\S|Tunnels\S|VRF\S|'
+                                  r'Max MPLS VPN Routes Per-Vrf label mode\S|Max MPLS VPN Routes Per-Prefix label mode\S|Max L3 adjacency\S|'
+                                  r'Max L3 Interface\S|Max MPLS TE TUNNEL\S)(?:\s*)(?P<current_l>\d*)(?:\s*\Scurrent\S)(?:\s*-\s*)'
+                                  r'(?P<proposed_l>\d*)(?:\s*\Sproposed\S)(?:\s*\S*)$')
 
         #Resource scale information
-        p6 = re.compile(r'^Resource\s(?P<resource_scale>\w*)\sinformation$')
+        p6 = regex_engine.compile(r'^Resource\s(?P<resource_scale>\w*)\sinformation$')
 
         #EM                                                  622592
-        p7 = re.compile(r'^EM(?:\s*)(?P<em_number>\d*)$')
+        p7 = regex_engine.compile(r'^EM(?:\s*)(?P<em_number>\d*)$')
 
         # loop to split lines of output
         for line in output.splitlines():
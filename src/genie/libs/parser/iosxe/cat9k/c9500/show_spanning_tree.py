@@ -2,13 +2,13 @@
     supported commands:
         *  show spanning tree summary totals
 """
-import re
 import logging
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Optional, Any
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ===============================================================
@@ -58,49 +58,49 @@ class ShowSpanningTreeSummaryTotals(ShowSpanningTreeSummaryTotalsSchema):
             output = self.device.execute(self.cli_command)
         
         # Switch is in rapid-pvst mode
-        p1 = re.compile(r'^Switch is in (?P<mode>\S+) mode$')
+        p1 = regex_engine.compile(r'^Switch is in (?P<mode>\S+) mode$')
 
         # Root bridge for: none
-        p2 = re.compile(r'^Root bridge for:\s+(?P<root_bridge>.+)$')
+        p2 = regex_engine.compile(r'^Root bridge for:\s+(?P<root_bridge>.+)$')
 
         # Extended system ID                      is enabled
-        p3 = re.compile(r'^Extended system ID\s+is\s+(?P<extended_system_id>\S+)$')
+        p3 = regex_engine.compile(r'^Extended system ID\s+is\s+(?P<extended_system_id>\S+)$')
 
         # Portfast Default                        is disabled
-        p4 = re.compile(r'^Portfast Default\s+is\s+(?P<portfast>\S+)$')
+        p4 = regex_engine.compile(r'^Portfast Default\s+is\s+(?P<portfast>\S+)$')
 
         # Portfast Edge BPDU Guard Default        is disabled
-        p5 = re.compile(r'^Portfast Edge BPDU Guard Default\s+is\s+(?P<portfast_edge_bpdu_guard>\S+)$')
+        p5 = regex_engine.compile(r'^Portfast Edge BPDU Guard Default\s+is\s+(?P<portfast_edge_bpdu_guard>\S+)$')
 
         # Portfast Edge BPDU Filter Default       is disabled
-        p6 = re.compile(r'^^Portfast Edge BPDU Filter Default\s+is\s+(?P<portfast_edge_bpdu_filter>\S+)$')
+        p6 = regex_engine.compile(r'^^Portfast Edge BPDU Filter Default\s+is\s+(?P<portfast_edge_bpdu_filter>\S+)$')
 
         # Loopguard Default                       is disabled
-        p7 = re.compile(r'^Loopguard Default\s+is\s+(?P<loopguard>\S+)$')
+        p7 = regex_engine.compile(r'^Loopguard Default\s+is\s+(?P<loopguard>\S+)$')
 
         # PVST Simulation Default                 is enabled but inactive in rapid-pvst mode
-        p8 = re.compile(r'^PVST Simulation Default\s+is\s+(?P<pvst_simulation>\S+ but inactive in rapid-pvst mode)$')
+        p8 = regex_engine.compile(r'^PVST Simulation Default\s+is\s+(?P<pvst_simulation>\S+ but inactive in rapid-pvst mode)$')
 
         # Bridge Assurance                        is enabled
-        p9 = re.compile(r'^Bridge Assurance\s+is\s+(?P<bridge_assurance>\S+)$')
+        p9 = regex_engine.compile(r'^Bridge Assurance\s+is\s+(?P<bridge_assurance>\S+)$')
 
         # EtherChannel misconfig guard            is enabled
-        p10 = re.compile(r'^EtherChannel misconfig guard\s+is\s+(?P<etherchannel_misconfig_guard>\S+)$')
+        p10 = regex_engine.compile(r'^EtherChannel misconfig guard\s+is\s+(?P<etherchannel_misconfig_guard>\S+)$')
 
         # UplinkFast                              is disabled
-        p11 = re.compile(r'^UplinkFast\s+is\s+(?P<uplinkfast>\S+)$')
+        p11 = regex_engine.compile(r'^UplinkFast\s+is\s+(?P<uplinkfast>\S+)$')
 
         # BackboneFast                            is disabled
-        p12 = re.compile(r'^BackboneFast\s+is\s+(?P<backbonefast>\S+)$')
+        p12 = regex_engine.compile(r'^BackboneFast\s+is\s+(?P<backbonefast>\S+)$')
 
         # Configured Pathcost method used is long
-        p13 = re.compile(r'^Configured Pathcost method used is (?P<pathcost_method>\S+)$')
+        p13 = regex_engine.compile(r'^Configured Pathcost method used is (?P<pathcost_method>\S+)$')
 
         # Name                   Blocking Listening Learning Forwarding STP Active
-        p14 = re.compile(r'^Name\s+Blocking Listening Learning Forwarding STP Active$')
+        p14 = regex_engine.compile(r'^Name\s+Blocking Listening Learning Forwarding STP Active$')
 
         # 300 vlans                  300         0        0        600        900
-        p15 = re.compile(r'^(?P<spanning_tree_name>[\s\S]+)\s+(?P<blocking>\d+)\s+(?P<listening>\d+)\s+'
+        p15 = regex_engine.compile(r'^(?P<spanning_tree_name>[\s\S]+)\s+(?P<blocking>\d+)\s+(?P<listening>\d+)\s+'
             r'(?P<learning>\d+)\s+(?P<forwarding>\d+)\s+(?P<stp_active>\d+)$')
         
         ret_dict = {}
@@ -8,10 +8,10 @@ IOSXE c9500 parsers for the following show commands:
 """
 
 # Python
-import re
 import logging
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 log = logging.getLogger(__name__)
@@ -65,26 +65,26 @@ class ShowSystemIntegrityAllMeasurementNonce(ShowSystemIntegrityAllMeasurementNo
         ret_dict = {}
         # LOCATION FRU=fru-rp SLOT=0 BAY=0 CHASSIS=1 NODE=0
         # LOCATION FRU=fru-rp SLOT=0 BAY=0 CHASSIS=-1 NODE=0
-        p1 = re.compile(r"^LOCATION FRU=(?P<fru>\S+)\s+SLOT=(?P<slot>\d+)\s+BAY=(?P<bay>\d+)\s+CHASSIS=(?P<chassis>\S+)\s+NODE=(?P<node>\d+)$")
+        p1 = regex_engine.compile(r"^LOCATION FRU=(?P<fru>\S+)\s+SLOT=(?P<slot>\d+)\s+BAY=(?P<bay>\d+)\s+CHASSIS=(?P<chassis>\S+)\s+NODE=(?P<node>\d+)$")
         # Platform: C9500-32QC
-        p2 = re.compile(r"^Platform: +(?P<platform>\S+)$")
+        p2 = regex_engine.compile(r"^Platform: +(?P<platform>\S+)$")
         # MA1004R06.1604052017: 6243F41868F21144E7D5CE30683
         # 17.8.1r[FC1]: 48E0DD991BCD6274B842A42C0F9DEDCD8809E6187928F0
-        p3 = re.compile(r"^(?P<boot_hash>[\(\)\[\]\.\:A-Z0-9a-z]+)\s(?P<value>[0-9A-F]+)$")
+        p3 = regex_engine.compile(r"^(?P<boot_hash>[\(\)\[\]\.\:A-Z0-9a-z]+)\s(?P<value>[0-9A-F]+)$")
         # Version: BLD_POLARIS_DEV_LATEST_20220313_143357
-        p4 = re.compile(r"^Version: +(?P<version>.*\_\S+)$")
+        p4 = regex_engine.compile(r"^Version: +(?P<version>.*\_\S+)$")
         # cat9k_iosxe.BLD_POLARIS_DEV_LATEST_20220313_143357.SSA.bin: 452997E880E6CEF
         # cat9k-wlc.BLD_POLARIS_DEV_LATEST_20220313_143357.SSA.pkg: 9456F1B1CFB3A25C9
         # cat9k_iosxe.BLD_POLARIS_DEV_LATEST_20220313_143357.0.NODEFECT.SSA.smu.bin: 9D7CC2C73A688FAF294C4BB90CAA6FDB26B9B
-        p5 = re.compile(r"^(?P<hashes>(.*bin)|(.*pkg))\:\s(?P<value>\S+)$")
+        p5 = regex_engine.compile(r"^(?P<hashes>(.*bin)|(.*pkg))\:\s(?P<value>\S+)$")
         # PCR0: 6DEC62AF32505978BD553E7
-        p6 = re.compile(r"^PCR0: +(?P<pcr0>([0-9A-F])+)$")
+        p6 = regex_engine.compile(r"^PCR0: +(?P<pcr0>([0-9A-F])+)$")
         # PCR8: 6DEC62AF32505978BD553E7
-        p7 = re.compile(r"^PCR8: +(?P<pcr8>([0-9A-F])+)$")
+        p7 = regex_engine.compile(r"^PCR8: +(?P<pcr8>([0-9A-F])+)$")
         # Version: 1
-        p8 = re.compile(r"^Version: +(?P<version>\d)$")
+        p8 = regex_engine.compile(r"^Version: +(?P<version>\d)$")
         # Value: 922D10C26D9DFF33278B4EBD9935A968DD5641C51EF496251
-        p9 = re.compile(r"^(?P<value>([0-9A-F])+)$")
+        p9 = regex_engine.compile(r"^(?P<value>([0-9A-F])+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -291,25 +291,25 @@ class ShowSystemIntegrityAllComplianceNonce(ShowSystemIntegrityAllComplianceNonc
 
         # LOCATION FRU=fru-rp SLOT=0 BAY=0 CHASSIS=1 NODE=0
         # LOCATION FRU=fru-rp SLOT=0 BAY=0 CHASSIS=-1 NODE=0
-        p1 = re.compile(r"^LOCATION FRU=(?P<fru>\S+)\s+SLOT=(?P<slot>\d+)\s+BAY=(?P<bay>\d+)\s+CHASSIS=(?P<chassis>\S+)\s+NODE=(?P<node>\d+)$")
+        p1 = regex_engine.compile(r"^LOCATION FRU=(?P<fru>\S+)\s+SLOT=(?P<slot>\d+)\s+BAY=(?P<bay>\d+)\s+CHASSIS=(?P<chassis>\S+)\s+NODE=(?P<node>\d+)$")
         # secure_boot: true
-        p2 = re.compile(r"^secure_boot: +(?P<secure_boot>\S+)$")
+        p2 = regex_engine.compile(r"^secure_boot: +(?P<secure_boot>\S+)$")
         # tam_service: hardware
-        p3 = re.compile(r"^tam_service: +(?P<tam_service>\S+)$")
+        p3 = regex_engine.compile(r"^tam_service: +(?P<tam_service>\S+)$")
         # ldwm_envelope: false
-        p4 = re.compile(r"^ldwm_envelope: +(?P<ldwm_envelope>\S+)$")
+        p4 = regex_engine.compile(r"^ldwm_envelope: +(?P<ldwm_envelope>\S+)$")
         # num_btlstage: 2
-        p5 = re.compile(r"^num_btlstage: +(?P<num_btlstage>\S+)$")
+        p5 = regex_engine.compile(r"^num_btlstage: +(?P<num_btlstage>\S+)$")
         # bivlen: 64
-        p6 = re.compile(r"^bivlen: +(?P<bivlen>\S+)$")
+        p6 = regex_engine.compile(r"^bivlen: +(?P<bivlen>\S+)$")
         # register.pcr0.disabled: false
-        p7 = re.compile(r"^register.pcr0.disabled: +(?P<pcr0>\S+)$")
+        p7 = regex_engine.compile(r"^register.pcr0.disabled: +(?P<pcr0>\S+)$")
         # register.pcr8.disabled: false
-        p8 = re.compile(r"^register.pcr8.disabled: +(?P<pcr8>\S+)$")
+        p8 = regex_engine.compile(r"^register.pcr8.disabled: +(?P<pcr8>\S+)$")
         # Version: 1
-        p9 = re.compile(r"^Version: +(?P<version>\d)$")
+        p9 = regex_engine.compile(r"^Version: +(?P<version>\d)$")
         # Value: D44FF3858DF08BF062F40C4984AEEA74E8CECA6EAFF9BE0A653594E02F568261
-        p10 = re.compile(r"^(?P<value>([0-9A-F])+)$")
+        p10 = regex_engine.compile(r"^(?P<value>([0-9A-F])+)$")
         ret_dict = {}
 
         for line in output.splitlines():
@@ -453,19 +453,19 @@ class ShowSystemIntegrityAllTrustChainNonce(ShowSystemIntegrityTrustChainNonceSc
 
         # LOCATION FRU=fru-rp SLOT=0 BAY=0 CHASSIS=3 NODE=0
         # LOCATION FRU=fru-rp SLOT=0 BAY=0 CHASSIS=-1 NODE=0
-        p1 = re.compile(r"^LOCATION FRU=(?P<fru>\S+)\s+SLOT=(?P<slot>\d+)\s+BAY=(?P<bay>\d+)\s+CHASSIS=(?P<chassis>\S+)\s+NODE=(?P<node>\d+)$")
+        p1 = regex_engine.compile(r"^LOCATION FRU=(?P<fru>\S+)\s+SLOT=(?P<slot>\d+)\s+BAY=(?P<bay>\d+)\s+CHASSIS=(?P<chassis>\S+)\s+NODE=(?P<node>\d+)$")
         # Version: 1
-        p2 = re.compile(r"^Version: +(?P<version>\d)$")
+        p2 = regex_engine.compile(r"^Version: +(?P<version>\d)$")
         #   Value: 9DA0FB31FA0BF959BDE14FEE6E20D6CD837E8108E4D37E9088C67E8CD1E7A7C015C1
-        p3 = re.compile(r"^(?P<value>[A-F0-9]+)$")
+        p3 = regex_engine.compile(r"^(?P<value>[A-F0-9]+)$")
         # Certificate Name: CMCA CERTIFICATE
-        p4 = re.compile(r"^Certificate Name: +(?P<certificate_name>\S+\s\S+)$")
+        p4 = regex_engine.compile(r"^Certificate Name: +(?P<certificate_name>\S+\s\S+)$")
         # -----BEGIN CERTIFICATE-----
-        p5 = re.compile(r"^\-+BEGIN CERTIFICATE\-+$")
+        p5 = regex_engine.compile(r"^\-+BEGIN CERTIFICATE\-+$")
         # -----END CERTIFICATE-----
-        p6 = re.compile(r"^\-+END CERTIFICATE\-+$")
+        p6 = regex_engine.compile(r"^\-+END CERTIFICATE\-+$")
         # MIIDfTCCAmWgAwIBAgIEAfLTJTANBgkqhkiG9w0BAQsFADAnMQ4wDAYDVQQKEwVDaXNjbzEVMBMG
-        p7 = re.compile(r"^([a-zA-Z0-9/+=]+)$")
+        p7 = regex_engine.compile(r"^([a-zA-Z0-9/+=]+)$")
 
         certificate_name = ""
         certificate = ""
@@ -6,12 +6,14 @@ IOSXE c9606r parser for the following show command:
    * show ip nat translations
    * show platform hardware fed {switch} active fwd-asic resource tcam utilization
 '''
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 
 class ShowPlatformHardwareFedActiveTcamUtilizationSchema(MetaParser):
@@ -77,7 +79,7 @@ class ShowPlatformHardwareFedActiveTcamUtilization(ShowPlatformHardwareFedActive
 
         # initial regexp pattern
         # CAM Utilization for ASIC  [0]
-        p1 = re.compile(r'^CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
+        p1 = regex_engine.compile(r'^CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
 
         #CTS Cell Matrix/VPN
         #Label                  EM           O       16384        0    0.00%        0        0        0        0
@@ -85,7 +87,7 @@ class ShowPlatformHardwareFedActiveTcamUtilization(ShowPlatformHardwareFedActive
         #Label                  TCAM         O        1024        1    0.10%        0        0        0        1
         # Mac Address Table      EM           I       16384       44    0.27%        0        0        0       44
         # Mac Address Table      TCAM         I        1024       21    2.05%        0        0        0       21
-        p2 = re.compile(r'^(?P<table>.+?) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<table>.+?) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -167,19 +169,19 @@ class ShowPlatformTcamPbrNat(ShowPlatformTcamPbrNatSchema):
         ret_dict = {}
         
         # Printing entries for region NAT_1 (387) type 6 asic 0
-        p1 = re.compile(r'^Printing entries for region\s(?P<nat_r>\w+)\s\(\d+\)\stype\s\d\sasic\s\d$')
+        p1 = regex_engine.compile(r'^Printing entries for region\s(?P<nat_r>\w+)\s\(\d+\)\stype\s\d\sasic\s\d$')
         
         # TAQ-0 Index-576 (A:0,C:0) Valid StartF-1 StartA-1 SkipF-0 SkipA-0
-        p2 = re.compile(r'^TAQ-\d+\sIndex-(?P<index>\d+)\s\([A-Z]\:\d,[A-Z]\:\d\)\sValid\sStart[A-Z]-\d\sStart[A-Z]-\d\sSkip[A-Z]-\d\sSkip[A-Z]-\d$')
+        p2 = regex_engine.compile(r'^TAQ-\d+\sIndex-(?P<index>\d+)\s\([A-Z]\:\d,[A-Z]\:\d\)\sValid\sStart[A-Z]-\d\sStart[A-Z]-\d\sSkip[A-Z]-\d\sSkip[A-Z]-\d$')
       
         # Mask1 30fff000:0003ffff:00000000:0000ffff:00000000:00000000:ffffffff:ffffffff
-        p3 = re.compile(r'^(?P<mask_name>Mask\d+) +(?P<mask1>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<mask_name>Mask\d+) +(?P<mask1>\S+)$')
       
         # Key1  10119000:00020014:00000000:00000028:00000000:00000000:0f000001:23000001
-        p4 = re.compile(r'^(?P<key_name>Key\d+) +(?P<key1>\S+)$')
+        p4 = regex_engine.compile(r'^(?P<key_name>Key\d+) +(?P<key1>\S+)$')
       
         # AD    10087000:000000ae:00000000
-        p5 = re.compile(r'^AD +(?P<ad>[\da-f:]+)$')
+        p5 = regex_engine.compile(r'^AD +(?P<ad>[\da-f:]+)$')
       
         for line in output.splitlines():
             line = line.strip()
@@ -259,7 +261,7 @@ class ShowNatTranslations(ShowNatTranslationsSchema):
 
         # Pro Inside global      Inside local       Outside local      Outside global
         # --- 135.0.0.1          35.0.0.1           ---                ---
-        p1 = re.compile(r'^(?P<protocol>\S+) +(?P<inside_global>\S+) +(?P<inside_local>\S+) +(?P<outside_local>\S+) +(?P<outside_global>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<protocol>\S+) +(?P<inside_global>\S+) +(?P<inside_local>\S+) +(?P<outside_local>\S+) +(?P<outside_global>\S+)$')
         
         for line in output.splitlines(): 
             line = line.strip()
@@ -17,7 +17,6 @@ IOSXE c9500 parsers for the following show commands:
 '''
 
 # Python
-import re
 import logging
 import xmltodict
 
@@ -26,6 +25,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, Default, Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.libs.parser.iosxe.cat9k.c9500.show_platform import \
@@ -93,22 +93,22 @@ class ShowPlatformSoftwareObjectmanager(ShowPlatformSoftwareObjectmanagerSchema)
         ret_dict = {}
 
         #Forwarding Manager Asynchronous Object Manager Statistics
-        p1 = re.compile(r'^Forwarding +Manager +Asynchronous +Object Manager*\s+(?P<statistics>(\S+))$')
+        p1 = regex_engine.compile(r'^Forwarding +Manager +Asynchronous +Object Manager*\s+(?P<statistics>(\S+))$')
 
         #Object update: Pending-issue: 0, Pending-acknowledgement: 0
-        p2 = re.compile(r'^Object +update:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
-                         r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
+        p2 = regex_engine.compile(r'^Object +update:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
+                                   r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
 
         #Batch begin:   Pending-issue: 0, Pending-acknowledgement: 0
-        p3 = re.compile(r'Batch +begin:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
-                         r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
+        p3 = regex_engine.compile(r'Batch +begin:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
+                                   r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
 
         #Batch end:     Pending-issue: 0, Pending-acknowledgement: 0
-        p4 = re.compile(r'Batch +end:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
-                         r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
+        p4 = regex_engine.compile(r'Batch +end:\s+Pending-issue:\s+(?P<pending_issue>\d+), +'
+                                   r'Pending-acknowledgement:\s+(?P<pending_ack>\d+)$')
 
         #Command:       Pending-acknowledgement: 0
-        p5 = re.compile(r'Command:\s+Pending-acknowledgement:\s+(?P<pending_ack>\d+)')
+        p5 = regex_engine.compile(r'Command:\s+Pending-acknowledgement:\s+(?P<pending_ack>\d+)')
 
         #Total-objects: 1231
         #Stale-objects: 0
@@ -118,7 +118,7 @@ class ShowPlatformSoftwareObjectmanager(ShowPlatformSoftwareObjectmanagerSchema)
         #Error-objects: 0
         #Number of bundles: 0
         #Paused-types: 5
-        p6 = re.compile(r'^(?P<key>[\S ]+): +(?P<value>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<key>[\S ]+): +(?P<value>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -235,7 +235,7 @@ class ShowPlatformFedActiveIfmMapping(ShowPlatformFedActiveIfmMappingSchema):
         #Interface IF_ID Inst Asic Core Port SubPort Mac Cntx LPN GPN Type Active
         #FortyGigabitEthernet1/0/1 0x75 0 0 0 0 0 0 0 1 101 NIF N
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface>\S+)\s+(?P<ifId>\S+)\s+(?P<inst>\d+)\s+(?P<asic>\d+)\s+(?P<core>\d+)\s+(?P<ifgId>\d+)?\s+(?P<port>\d+)\s+(?P<sbPort>\d+)\s+(?P<mac>\d+)\s+(?P<first_serdes>\d+)?\s+(?P<last_serdes>\d+)?\s+(?P<cntx>\d+)\s+(?P<lpn>\d+)\s+(?P<gpn>\d+)\s+(?P<type>\w+)\s+(?P<act>\w+)$')
 
         for line in output.splitlines():
@@ -388,18 +388,18 @@ class ShowPlatformFedActiveTcamUtilization(ShowPlatformFedActiveTcamUtilizationS
         slice_dict = {}
 
         # Slice0       Slice1       Slice2       Slice3       Slice4       Slice5
-        p1 = re.compile(r'^(?P<slice_id0>(\w+))\s+(?P<slice_id1>(\w+))\s+(?P<slice_id2>(\w+))\s+(?P<slice_id3>(\w+))\s+(?P<slice_id4>(\w+))\s+(?P<slice_id5>(\w+))$')
+        p1 = regex_engine.compile(r'^(?P<slice_id0>(\w+))\s+(?P<slice_id1>(\w+))\s+(?P<slice_id2>(\w+))\s+(?P<slice_id3>(\w+))\s+(?P<slice_id4>(\w+))\s+(?P<slice_id5>(\w+))$')
 
         # Egress Wide TCAM entries
-        p2 = re.compile(r'^Egress +(?P<egress_wide_direction>([a-zA-Z]+)) +TCAM +entries\s+(?P<used0>(\d+))\s+(?P<free0>(\d+))\s+(?P<used1>(\d+))\s+(?P<free1>(\d+))\s+(?P<used2>(\d+))\s+(?P<free2>(\d+))\s+(?P<used3>(\d+))\s+(?P<free3>(\d+))\s+(?P<used4>(\d+))\s+(?P<free4>(\d+))\s+(?P<used5>(\d+))\s+(?P<free5>(\d+)).*$')
+        p2 = regex_engine.compile(r'^Egress +(?P<egress_wide_direction>([a-zA-Z]+)) +TCAM +entries\s+(?P<used0>(\d+))\s+(?P<free0>(\d+))\s+(?P<used1>(\d+))\s+(?P<free1>(\d+))\s+(?P<used2>(\d+))\s+(?P<free2>(\d+))\s+(?P<used3>(\d+))\s+(?P<free3>(\d+))\s+(?P<used4>(\d+))\s+(?P<free4>(\d+))\s+(?P<used5>(\d+))\s+(?P<free5>(\d+)).*$')
         
         # Ingress Wide TCAM entries
-        p3 = re.compile(r'^Ingress +(?P<ingress_wide_direction>([a-zA-Z]+)) +TCAM +entries\s+(?P<inw_used0>(\d+))\s+(?P<inw_free0>(\d+))\s+(?P<inw_used1>(\d+))\s+(?P<inw_free1>(\d+))\s+(?P<inw_used2>(\d+))\s+(?P<inw_free2>(\d+))\s+(?P<inw_used3>(\d+))\s+(?P<inw_free3>(\d+))\s+(?P<inw_used4>(\d+))\s+(?P<inw_free4>(\d+))\s+(?P<inw_used5>(\d+))\s+(?P<inw_free5>(\d+)).*$')
+        p3 = regex_engine.compile(r'^Ingress +(?P<ingress_wide_direction>([a-zA-Z]+)) +TCAM +entries\s+(?P<inw_used0>(\d+))\s+(?P<inw_free0>(\d+))\s+(?P<inw_used1>(\d+))\s+(?P<inw_free1>(\d+))\s+(?P<inw_used2>(\d+))\s+(?P<inw_free2>(\d+))\s+(?P<inw_used3>(\d+))\s+(?P<inw_free3>(\d+))\s+(?P<inw_used4>(\d+))\s+(?P<inw_free4>(\d+))\s+(?P<inw_used5>(\d+))\s+(?P<inw_free5>(\d+)).*$')
 
         # Ingress Narrow_Pool_0 TCAM entries       39 112712     39 112712      0     0      0     0      0     0      0     0
-        p4 = re.compile(r'(?P<resource>.+)\s+(?P<slice0_used>\d+)\s+(?P<slice0_free>\d+)\s+(?P<slice1_used>\d+)\s+'
-                        r'(?P<slice1_free>\d+)\s+(?P<slice2_used>\d+)\s+(?P<slice2_free>\d+)\s+(?P<slice3_used>\d+)\s+'
-                        r'(?P<slice3_free>\d+)\s+(?P<slice4_used>\d+)\s+(?P<slice4_free>\d+)\s+(?P<slice5_used>\d+)\s+(?P<slice5_free>\d+)$')
+        p4 = regex_engine.compile(r'(?P<resource>.+)\s+(?P<slice0_used>\d+)\s+(?P<slice0_free>\d+)\s+(?P<slice1_used>\d+)\s+'
+                                  r'(?P<slice1_free>\d+)\s+(?P<slice2_used>\d+)\s+(?P<slice2_free>\d+)\s+(?P<slice3_used>\d+)\s+'
+                                  r'(?P<slice3_free>\d+)\s+(?P<slice4_used>\d+)\s+(?P<slice4_free>\d+)\s+(?P<slice5_used>\d+)\s+(?P<slice5_free>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -531,7 +531,7 @@ class ShowPlatformSoftwareFedActiveAclInfoSummary(ShowPlatformSoftwareFedActiveA
 
         #CG id    ACL name                                    No of ACEs  Protocol  Ingress    Egress
         #CG id     ACL name                                    Feature    No of ACEs     Protocol    Ingress    Egress
-        p1 = re.compile(r'^(?P<cg_id>\S+)\s+(?P<acl_name>\S+)\s+(?P<feature>\S+)?\s+(?P<no_of_aces>\S+)\s+(?P<protocol>\S+)\s+(?P<direction_ingress>\w+)\s+(?P<direction_egress>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<cg_id>\S+)\s+(?P<acl_name>\S+)\s+(?P<feature>\S+)?\s+(?P<no_of_aces>\S+)\s+(?P<protocol>\S+)\s+(?P<direction_ingress>\w+)\s+(?P<direction_egress>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -642,7 +642,7 @@ class ShowPlatformFedActiveFnfRecordCountAsicNum(ShowPlatformFedActiveFnfRecordC
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<pattern>[\S ]+)= +(?P<value>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<pattern>[\S ]+)= +(?P<value>\d+)$')
 
         # Current flow count               = 0
         # Total flows learned              = 0
@@ -724,7 +724,7 @@ class ShowPlatformFedSwitchActiveIfmMapping(ShowPlatformFedSwitchActiveIfmMappin
         ret_dict = {}
 
         # HundredGigE1/0/21       0x4d6    0   0    0      0    0      0     1  0            1            0    1    1    NIF    Y
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface>\S+)\s+(?P<ifId>\S+)\s+(?P<inst>\d+)\s+(?P<asic>\d+)\s+(?P<core>\d+)\s+(?P<ifgId>\d+)?\s+(?P<port>\d+)\s+(?P<sbPort>\d+)\s+(?P<mac>\d+)\s+(?P<first_serdes>\d+)?\s+(?P<last_serdes>\d+)?\s+(?P<cntx>\d+)\s+(?P<lpn>\d+)\s+(?P<gpn>\d+)\s+(?P<type>\w+)\s+(?P<act>\w+)$')
 
         for line in output.splitlines():
@@ -816,7 +816,7 @@ class ShowPlatformSwitchStandbyTcamUtilization(ShowPlatformTcamUtilizationswitch
 
         # initial regexp pattern
         # CAM Utilization for ASIC  [0]
-        p1 = re.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
+        p1 = regex_engine.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
 
         #CTS Cell Matrix/VPN
         #Label                  EM           O       16384        0    0.00%        0        0        0        0
@@ -824,7 +824,7 @@ class ShowPlatformSwitchStandbyTcamUtilization(ShowPlatformTcamUtilizationswitch
         #Label                  TCAM         O        1024        1    0.10%        0        0        0        1
         # Mac Address Table      EM           I       16384       44    0.27%        0        0        0       44
         # Mac Address Table      TCAM         I        1024       21    2.05%        0        0        0       21
-        p2 = re.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<direction>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
+        p2 = regex_engine.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<direction>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -908,34 +908,34 @@ class ShowPlatformSoftwareBpCrimsonStatistics(ShowPlatformSoftwareBpCrimsonStati
         ret_dict = {}
 
         # BP Crimson Statistics
-        p1 = re.compile(r'^(?P<bp_crimson_statistics>BP Crimson Statistics)$')
+        p1 = regex_engine.compile(r'^(?P<bp_crimson_statistics>BP Crimson Statistics)$')
 
         # Initialized            : Yes
-        p2 = re.compile(r'^(?P<description>[\w\'\s]+)\:\s+(?P<value>\w+)$')
+        p2 = regex_engine.compile(r'^(?P<description>[\w\'\s]+)\:\s+(?P<value>\w+)$')
 
         # BP SVL Crimson Statistics
-        p3 = re.compile(r'^(?P<bp_svl_crimson_statistics>BP SVL Crimson Statistics)$')
+        p3 = regex_engine.compile(r'^(?P<bp_svl_crimson_statistics>BP SVL Crimson Statistics)$')
 
         # BP Remote DB Statistics
-        p4 = re.compile(r'^(?P<bp_remote_db_statistics>BP Remote DB Statistics)$')
+        p4 = regex_engine.compile(r'^(?P<bp_remote_db_statistics>BP Remote DB Statistics)$')
 
         # GET Requests
-        p5 = re.compile(r'^(?P<get_requests>GET Requests\:)$')
+        p5 = regex_engine.compile(r'^(?P<get_requests>GET Requests\:)$')
 
         # SET Requests
-        p6 = re.compile(r'^(?P<set_requests>SET Requests\:)$')
+        p6 = regex_engine.compile(r'^(?P<set_requests>SET Requests\:)$')
 
         # In Progress Requests
-        p7 = re.compile(r'^(?P<in_progress_requests>In Progress Requests\:)$')
+        p7 = regex_engine.compile(r'^(?P<in_progress_requests>In Progress Requests\:)$')
 
         # DBAL Response Time
-        p8 = re.compile(r'^(?P<dbal_response_time>DBAL Response Time\:)$')
+        p8 = regex_engine.compile(r'^(?P<dbal_response_time>DBAL Response Time\:)$')
 
         #MAX (ms)         : 115
-        p9 = re.compile(r'MAX .ms.\s+\:\s+(?P<MAX>\d+)')
+        p9 = regex_engine.compile(r'MAX .ms.\s+\:\s+(?P<MAX>\d+)')
 
         # Record Free Failures
-        p10 = re.compile(r'^(?P<record_free_failures>Record Free Failures\:)$')
+        p10 = regex_engine.compile(r'^(?P<record_free_failures>Record Free Failures\:)$')
 
         for line in output.splitlines():
             line=line.strip()
@@ -1047,12 +1047,12 @@ class ShowPlatformSoftwareMemorySwitchAllocCallsite(ShowPlatformSoftwareMemorySw
         parsed_dict = {}
 
         # The current tracekey is   : 1#2315ece11e07bc883d89421df58e37b6
-        p1 = re.compile(r'^The +current +tracekey +is\s*: +(?P<tracekey>[#\w\d+]*)$')
+        p1 = regex_engine.compile(r'^The +current +tracekey +is\s*: +(?P<tracekey>[#\w\d+]*)$')
 
         # callsite      thread    diff_byte               diff_call
         # ----------------------------------------------------------
         # 1617611779    31884     57424                   2
-        p2 = re.compile(r'^(?P<callsite>(\d\w+))\s+(?P<thread>(\d+))\s+(?P<diffbyte>(\d+))\s+(?P<diffcall>(\d+))$')
+        p2 = regex_engine.compile(r'^(?P<callsite>(\d\w+))\s+(?P<thread>(\d+))\s+(?P<diffbyte>(\d+))\s+(?P<diffcall>(\d+))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1122,13 +1122,13 @@ class ShowPlatformSoftwareMemorySwitchAllocBacktrace(ShowPlatformSoftwareMemoryS
         parsed_dict = {}
 
         # backtrace: 1#2315ece11e07bc883d89421df58e37b6
-        p1 = re.compile(r'^backtrace: +(?P<backtrace>[#\w\d+]*)')
+        p1 = regex_engine.compile(r'^backtrace: +(?P<backtrace>[#\w\d+]*)')
 
         #   callsite: 2150603778, thread_id: 31884
-        p2 = re.compile(r'^callsite: +(?P<callsite>\d\w+), +thread_id: +(?P<thread_id>\d+)$')
+        p2 = regex_engine.compile(r'^callsite: +(?P<callsite>\d\w+), +thread_id: +(?P<thread_id>\d+)$')
 
         #   allocs: 1, frees: 0, call_diff: 1
-        p3 = re.compile(r'^allocs: +(?P<allocs>(\d+)), +frees: +(?P<frees>(\d+)), +call_diff: +(?P<call_diff>(\d+))$')
+        p3 = regex_engine.compile(r'^allocs: +(?P<allocs>(\d+)), +frees: +(?P<frees>(\d+)), +call_diff: +(?P<call_diff>(\d+))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1197,10 +1197,10 @@ class ShowPlatformHardwareFedSwitchQosDscpcosCounters(ShowPlatformHardwareFedSwi
         parsed_dict = {}
 
         #               Frames        Bytes
-        p1 = re.compile(r'^(?P<heading>\AFrames[\s]+ +Bytes)$')
+        p1 = regex_engine.compile(r'^(?P<heading>\AFrames[\s]+ +Bytes)$')
 
         # Ingress DSCP0 0             0
-        p2 = re.compile(r'^(?P<traffictype>[\w\s]*) +(?P<frames>\d+) +(?P<bytes>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<traffictype>[\w\s]*) +(?P<frames>\d+) +(?P<bytes>\d+)$')
 
         for lines in output.splitlines():
             line = lines.strip()
@@ -1276,10 +1276,10 @@ class ShowPlatformSoftwareFedSwitchActiveAclUsage(ShowPlatformSoftwareFedSwitchA
             output = self.device.execute(cmd)
 
         # #####  ACE Software VMR max:196608 used:253
-        p1 = re.compile(r'^\#\#\#\#\#\s+ACE\sSoftware\sVMR\smax\:(?P<vmr_max>\d+)\sused\:(?P<used>\d+)$')
+        p1 = regex_engine.compile(r'^\#\#\#\#\#\s+ACE\sSoftware\sVMR\smax\:(?P<vmr_max>\d+)\sused\:(?P<used>\d+)$')
 
         #   RACL        IPV4     Ingress   PBR-DMVPN    92
-        p2 = re.compile(r'^(?P<feature_type>\S+)\s+(?P<acl_type>\S+)\s+(?P<direction>\S+)\s+(?P<name>\S+)\s+(?P<entries_used>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<feature_type>\S+)\s+(?P<acl_type>\S+)\s+(?P<direction>\S+)\s+(?P<name>\S+)\s+(?P<entries_used>\d+)$')
 
         # initial return dictionary
         ret_dict ={}
@@ -1368,7 +1368,7 @@ class ShowPlatformSwitchActiveTcamUtilization(ShowPlatformTcamUtilizationswitchA
 
         # initial regexp pattern
         # CAM Utilization for ASIC  [0]
-        p1 = re.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
+        p1 = regex_engine.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
 
         #CTS Cell Matrix/VPN
         #Label                  EM           O       16384        0    0.00%        0        0        0        0
@@ -1376,7 +1376,7 @@ class ShowPlatformSwitchActiveTcamUtilization(ShowPlatformTcamUtilizationswitchA
         #Label                  TCAM         O        1024        1    0.10%        0        0        0        1
         # Mac Address Table      EM           I       16384       44    0.27%        0        0        0       44
         # Mac Address Table      TCAM         I        1024       21    2.05%        0        0        0       21
-        p2 = re.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
+        p2 = regex_engine.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3,14 +3,12 @@ IOSXE parsers for the following show commands:
     * show hardware led
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -87,40 +85,40 @@ class ShowHardwareLed(ShowHardwareLedSchema):
             output = self.device.execute(self.cli_command)
 
         # Switch 1:
-        p0 = re.compile(r'^Switch\s+(?P<switch_num>\d+):$')
+        p0 = regex_engine.compile(r'^Switch\s+(?P<switch_num>\d+):$')
 
         # SWITCH: C9606R
-        p1 = re.compile(r'^SWITCH:\s+(?P<model>\S+)$')
+        p1 = regex_engine.compile(r'^SWITCH:\s+(?P<model>\S+)$')
 
         # SYSTEM: GREEN
-        p2 = re.compile(r'^SYSTEM:\s+(?P<system>\w+)$')
+        p2 = regex_engine.compile(r'^SYSTEM:\s+(?P<system>\w+)$')
 
         # Line Card : 1
-        p3 = re.compile(r'^Line\sCard\s*:\s+(?P<line_card>\d+)$')
+        p3 = regex_engine.compile(r'^Line\sCard\s*:\s+(?P<line_card>\d+)$')
 
         # PORT STATUS: (124) Hu1/0/1:GREEN Hu1/0/2:OFF Hu1/0/3:GREEN Hu1/0/4:OFF Hu1/0/5:OFF Hu1/0/6:GREEN Hu1/0/7:OFF Hu1/0/8:OFF Hu1/0/9:OFF Hu1/0/10:GREEN Hu1/0/11:GREEN Hu1/0/12:GREEN Hu1/0/13:GREEN Hu1/0/14:GREEN Fou1/0/15:GREEN Fou1/0/16:GREEN Fou1/0/17:GREEN Fou1/0/18:GREEN Fou1/0/19:GREEN Fou1/0/20:GREEN Fou1/0/21:GREEN Fou1/0/22:GREEN Hu1/0/23:GREEN Hu1/0/24:GREEN Hu1/0/25:OFF Hu1/0/26:GREEN Hu1/0/27:GREEN Hu1/0/28:GREEN Hu1/0/29:GREEN Hu1/0/30:GREEN Hu1/0/31:OFF Hu1/0/32:GREEN Hu1/0/33:GREEN Hu1/0/34:GREEN Hu1/0/35:GREEN Hu1/0/36:GREEN
-        p4 = re.compile(r'^PORT\sSTATUS:\s+\((?P<number_of_ports_in_status>\d+)\)\s+(?P<led_ports>((\S+:\w+\s*))+)$')
+        p4 = regex_engine.compile(r'^PORT\sSTATUS:\s+\((?P<number_of_ports_in_status>\d+)\)\s+(?P<led_ports>((\S+:\w+\s*))+)$')
         
         # BEACON: OFF
-        p5 = re.compile(r'^BEACON:\s+(?P<beacon>.+)$')
+        p5 = regex_engine.compile(r'^BEACON:\s+(?P<beacon>.+)$')
 
         # STATUS: GREEN
-        p6 = re.compile(r'^STATUS:\s+(?P<status>\w+)$')
+        p6 = regex_engine.compile(r'^STATUS:\s+(?P<status>\w+)$')
 
         # MODULE: slot 3
-        p7 = re.compile(r'^MODULE:\s*slot\s*(?P<supervisor>\d+)$')
+        p7 = regex_engine.compile(r'^MODULE:\s*slot\s*(?P<supervisor>\d+)$')
 
         # SUPERVISOR: ACTIVE
-        p8 = re.compile(r'^SUPERVISOR:\s*(?P<status>\w+)$')
+        p8 = regex_engine.compile(r'^SUPERVISOR:\s*(?P<status>\w+)$')
 
         # ACTIVE: GREEN
-        p9 = re.compile(r'^ACTIVE:\s+(?P<active>\w+)$')
+        p9 = regex_engine.compile(r'^ACTIVE:\s+(?P<active>\w+)$')
 
         # FANTRAY STATUS: GREEN
-        p10 = re.compile(r'^FANTRAY STATUS:\s+(?P<fantray_status>\w+)$')
+        p10 = regex_engine.compile(r'^FANTRAY STATUS:\s+(?P<fantray_status>\w+)$')
 
         # FANTRAY BEACON: OFF
-        p11 = re.compile(r'^FANTRAY BEACON:\s+(?P<fantray_beacon>\w+)$')
+        p11 = regex_engine.compile(r'^FANTRAY BEACON:\s+(?P<fantray_beacon>\w+)$')
 
         ret_dict = {}
         root_dict = {}
@@ -4,9 +4,11 @@ IOSXE parsers for the following show commands:
 
     * show idprom all eeprom
 '''
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 class ShowIdpromEepromSchema(MetaParser):
@@ -63,34 +65,34 @@ class ShowIdpromEeprom(ShowIdpromEepromSchema):
         ret_dict = {}
 
         # MIDPLANE EEPROM data:
-        p1 = re.compile(r'^MIDPLANE EEPROM data:$')
+        p1 = regex_engine.compile(r'^MIDPLANE EEPROM data:$')
 
         # Power/Fan Module P5 EEPROM data:
-        p2 = re.compile(r'^Power/Fan Module P(?P<number>\d+) EEPROM data:$')
+        p2 = regex_engine.compile(r'^Power/Fan Module P(?P<number>\d+) EEPROM data:$')
 
         # Slot R0 EEPROM data:
-        p3 = re.compile(r'^Slot R(?P<number>\d+) EEPROM data:$')
+        p3 = regex_engine.compile(r'^Slot R(?P<number>\d+) EEPROM data:$')
 
         # SPA EEPROM data for subslot 1/0:
-        p4 = re.compile(r'^SPA EEPROM data for subslot (?P<slot>\d+/\d+):$')
+        p4 = regex_engine.compile(r'^SPA EEPROM data for subslot (?P<slot>\d+/\d+):$')
 
         # Product Identifier (PID) : C9610R
-        p5 = re.compile(r'^Product Identifier \(PID\) *: +(?P<pid>\S+)$')
+        p5 = regex_engine.compile(r'^Product Identifier \(PID\) *: +(?P<pid>\S+)$')
 
         # Version Identifier (VID) : V00
-        p6 = re.compile(r'^Version Identifier \(VID\) *: +(?P<vid>\S+)$')
+        p6 = regex_engine.compile(r'^Version Identifier \(VID\) *: +(?P<vid>\S+)$')
 
         # PCB Serial Number        : FOC28101LZB
-        p7 = re.compile(r'^PCB Serial Number *: +(?P<pcb_serial_number>\S+)$')
+        p7 = regex_engine.compile(r'^PCB Serial Number *: +(?P<pcb_serial_number>\S+)$')
 
         # Top Assy. Revision       : 18
-        p8 = re.compile(r'^Top Assy\. Revision *: +(?P<top_assy_revision>\S+)$')
+        p8 = regex_engine.compile(r'^Top Assy\. Revision *: +(?P<top_assy_revision>\S+)$')
 
         # Hardware Revision        : 0.2
-        p9 = re.compile(r'^Hardware Revision *: +(?P<hardware_revision>\S+)$')
+        p9 = regex_engine.compile(r'^Hardware Revision *: +(?P<hardware_revision>\S+)$')
 
         # CLEI Code                :
-        p10 = re.compile(r'^CLEI Code *: +(?P<clei_code>\S+)$')
+        p10 = regex_engine.compile(r'^CLEI Code *: +(?P<clei_code>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
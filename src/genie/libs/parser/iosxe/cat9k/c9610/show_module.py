@@ -4,13 +4,15 @@ IOSXE parsers for the following show commands:
     * 'show module'
 '''
 
-import re
 import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 log = logging.getLogger(__name__)
 
@@ -76,16 +78,16 @@ class ShowModule(ShowModuleSchema):
 
 
         # Chassis Type: C9606R
-        p0 = re.compile(r'^Chassis Type: +(?P<chassis_type>\S+)$')
+        p0 = regex_engine.compile(r'^Chassis Type: +(?P<chassis_type>\S+)$')
 
         #initial regex pattern
-        p1=re.compile(r'^(?P<switch>\d+) *'
-                        r'(?P<port>\w+) +'
-                        r'(?P<model>[\w\-]+) +'
-                        r'(?P<serial_number>\w+) +'
-                        r'(?P<mac_address>[\w\.]+) +'
-                        r'(?P<hw_ver>\w+) +'
-                        r'(?P<sw_ver>[\w\.]+)$')
+        p1=regex_engine.compile(r'^(?P<switch>\d+) *'
+                                  r'(?P<port>\w+) +'
+                                  r'(?P<model>[\w\-]+) +'
+                                  r'(?P<serial_number>\w+) +'
+                                  r'(?P<mac_address>[\w\.]+) +'
+                                  r'(?P<hw_ver>\w+) +'
+                                  r'(?P<sw_ver>[\w\.]+)$')
 
         #Mod Ports Card Type                                   Model          Serial No.
         #---+-----+--------------------------------------+--------------+--------------
@@ -96,7 +98,7 @@ class ShowModule(ShowModuleSchema):
         #5   24   24-Port 40GE/12-Port 100GE                  C9600-LC-24C     FDO253115DY
         #6   24   24-Port 40GE/12-Port 100GE                  C9600-LC-24C     FDO241609F5
         
-        p2=re.compile(r'^(?P<mod>\d+) *(?P<ports>\d+) +(?P<card_type>.*) +(?P<model>\S+) +(?P<serial>\S+)$')
+        p2=regex_engine.compile(r'^(?P<mod>\d+) *(?P<ports>\d+) +(?P<card_type>.*) +(?P<model>\S+) +(?P<serial>\S+)$')
         
         #Mod MAC addresses                    Hw   Fw           Sw                 Status
         #---+--------------------------------+----+------------+------------------+--------
@@ -107,16 +109,16 @@ class ShowModule(ShowModuleSchema):
         #5   A478.0633.5D80 to A478.0633.5DFF 2.0  17.7.1r[FC3]  17.03.01           ok         
         #6   AC7A.5650.1A00 to AC7A.5650.1A7F 2.0  17.7.1r[FC3]  17.03.01           ok
         
-        p3=re.compile(r'^(?P<mod>\d+)\s+(?P<mac_address>[\w\.\s]*) .*(?P<hw>\d+.?\d+?)\s+(?P<fw>\S+)\s+(?P<sw>\S+)\s+(?P<status>\S+)$')
+        p3=regex_engine.compile(r'^(?P<mod>\d+)\s+(?P<mac_address>[\w\.\s]*) .*(?P<hw>\d+.?\d+?)\s+(?P<fw>\S+)\s+(?P<sw>\S+)\s+(?P<status>\S+)$')
     
         #Mod Redundancy Role     Operating Redundancy Mode Configured Redundancy Mode
         #---+-------------------+-------------------------+---------------------------
         #3   Standby             sso                       sso                       
         #4   Active              sso                       sso   
-        p4=re.compile(r'^(?P<mod>\d+)\s*(?P<redundancy_role>\S+) *(?P<operating_redundancy_mode>\S+) *(?P<configured_redundancy_mode>\S+)$')
+        p4=regex_engine.compile(r'^(?P<mod>\d+)\s*(?P<redundancy_role>\S+) *(?P<operating_redundancy_mode>\S+) *(?P<configured_redundancy_mode>\S+)$')
         
         # Chassis MAC address range: 64 addresses from 6cb2.ae4a.5540 to 6cb2.ae4a.557f
-        p5=re.compile(r'^Chassis MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$')
+        p5=regex_engine.compile(r'^Chassis MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$')
         
         ret_dict = {}
         for line in out.splitlines():
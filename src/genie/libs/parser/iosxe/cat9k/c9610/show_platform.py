@@ -12,8 +12,8 @@ IOSXE c9610 parsers for the following show commands:
     * show platform hardware fed switch {switch_var} qos queue config interface {interface}
 '''
 from genie.metaparser import MetaParser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
-import re
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
 from genie.libs.parser.iosxe.cat9k.c9600.show_platform import ShowPlatformFedActiveTcamUtilization as ShowPlatformFedActiveTcamUtilization_c9600
 
@@ -95,53 +95,53 @@ class ShowPlatformSoftwareFedActiveAclInfoDbDetail(ShowPlatformSoftwareFedActive
 
         # [CG ID: 8]    CG Name: racl_ingress
         # [Racl, CG ID: 8]    CG Name: racl_permitv6_egress
-        p1 = re.compile(r'^\[.*CG ID:\s+(?P<cg_id>\d+)\]\s+CG\s+Name:\s+(?P<cg_name>[\w\-]+)$')
+        p1 = regex_engine.compile(r'^\[.*CG ID:\s+(?P<cg_id>\d+)\]\s+CG\s+Name:\s+(?P<cg_name>[\w\-]+)$')
 
         # [Feature: Racl    Prot: IPv4
-        p2 = re.compile(r'^Feature:\s+(?P<feature>\w+)\s+Prot:\s+(?P<prot>\w+)$')
+        p2 = regex_engine.compile(r'^Feature:\s+(?P<feature>\w+)\s+Prot:\s+(?P<prot>\w+)$')
 
         # Region grp: 0x2c0603d8    Dir: Ingress
-        p3 = re.compile(r'^Region\s+grp:\s+(?P<region>0x[\da-fA-F]+)\s+Dir:\s+(?P<dir>\w+)$')
+        p3 = regex_engine.compile(r'^Region\s+grp:\s+(?P<region>0x[\da-fA-F]+)\s+Dir:\s+(?P<dir>\w+)$')
 
         # SDK-handle(asic: 0, OID: 0x44D)
-        p4 = re.compile(r'^SDK-handle\(asic:\s+(?P<asic>\d+),\s+OID:\s+(?P<oid>0x\w+)\)$')
+        p4 = regex_engine.compile(r'^SDK-handle\(asic:\s+(?P<asic>\d+),\s+OID:\s+(?P<oid>0x\w+)\)$')
 
         # Seq Num:10
-        p5 = re.compile(r'^Seq Num:+(?P<seq>[\d\w]+)$')
+        p5 = regex_engine.compile(r'^Seq Num:+(?P<seq>[\d\w]+)$')
 
         # ipv4_src: value = 0x00000000       mask = 0x00000000
-        p6 = re.compile(r'^ipv4_src:\s+value+\s=\s+(?P<ipv4_src_value>[\d\w]+)+\s+mask+\s=\s+(?P<ipv4_src_mask>[\d\w]+)$')
+        p6 = regex_engine.compile(r'^ipv4_src:\s+value+\s=\s+(?P<ipv4_src_value>[\d\w]+)+\s+mask+\s=\s+(?P<ipv4_src_mask>[\d\w]+)$')
 
         # ipv4_dst: value = 0x00000000       mask = 0x00000000
-        p7 = re.compile(r'^ipv4_dst:\s+value+\s=\s+(?P<ipv4_dst_value>[\d\w]+)+\s+mask+\s=\s+(?P<ipv4_dst_mask>[\d\w]+)$')
+        p7 = regex_engine.compile(r'^ipv4_dst:\s+value+\s=\s+(?P<ipv4_dst_value>[\d\w]+)+\s+mask+\s=\s+(?P<ipv4_dst_mask>[\d\w]+)$')
 
         # ipv6_src: value = 0x00001100.0x01000000.0x00000000.0x30000000
-        p7_1 = re.compile(r'^ipv6_src:\s+value+\s=\s+(?P<ipv6_src_value>[\S]+)$')
+        p7_1 = regex_engine.compile(r'^ipv6_src:\s+value+\s=\s+(?P<ipv6_src_value>[\S]+)$')
 
         # ipv6_dst: value = 0x00001100.0x00000000.0x00000000.0x3000000
-        p7_2 = re.compile(r'^ipv6_dst:\s+value+\s=\s+(?P<ipv6_dst_value>[\S]+)$')
+        p7_2 = regex_engine.compile(r'^ipv6_dst:\s+value+\s=\s+(?P<ipv6_dst_value>[\S]+)$')
 
         # mask = 0xffffffff.0xffffffff.0xffffffff.0xffffffff
-        p7_3 = re.compile(r'^mask+\s=\s+(?P<ipv6_mask>[\S]+)$')
+        p7_3 = regex_engine.compile(r'^mask+\s=\s+(?P<ipv6_mask>[\S]+)$')
 
         # proto    frag    tcp_flg    tcp_op    src_port    dst_port
-        p8_0=re.compile(r'^proto+\s+frag+\s+tcp_flg+\s+tcp_op+\s+src_port+\s+dst_port$')
+        p8_0=regex_engine.compile(r'^proto+\s+frag+\s+tcp_flg+\s+tcp_op+\s+src_port+\s+dst_port$')
 
         #  tos      ttl       cos      v4_opt    src_obj     dst_obj
-        p8_1 = re.compile(r'^tos+\s+ttl+\s+cos+\s+[v4_opt|ext_hdr]+\s+src_obj+\s+dst_obj$')
+        p8_1 = regex_engine.compile(r'^tos+\s+ttl+\s+cos+\s+[v4_opt|ext_hdr]+\s+src_obj+\s+dst_obj$')
 
         # V:  0x1       0x0      0x0         0x0        0x0          0x0
         # M:  0xff       0x0      0x0         0x0        0x0          0x0
-        p8 = re.compile(r'^(?P<type>[\w\_]+)+:\s+(?P<proto>[\w]+)+\s+(?P<frag>[\w]+)+\s+(?P<tcp_flg>[\w]+)+\s+(?P<tcp_op>[\w]+)+\s+(?P<src_port>[\w]+)+\s+(?P<dst_port>[\w]+)$')
+        p8 = regex_engine.compile(r'^(?P<type>[\w\_]+)+:\s+(?P<proto>[\w]+)+\s+(?P<frag>[\w]+)+\s+(?P<tcp_flg>[\w]+)+\s+(?P<tcp_op>[\w]+)+\s+(?P<src_port>[\w]+)+\s+(?P<dst_port>[\w]+)$')
         # V:  0x0       0x0      0x0         0x0        0x0          0x0
         # M:  0x0       0x0      0x0         0x0        0x0          0x0
-        p9 = re.compile(r'^(?P<type>[\w\_]+)+:\s+(?P<tos>[\w]+)+\s+(?P<ttl>[\w]+)+\s+(?P<cos>[\w]+)+\s+(?P<v4_opt>[\w]+)+\s+(?P<src_obj>[\w]+)+\s+(?P<dst_obj>[\w]+)$')
+        p9 = regex_engine.compile(r'^(?P<type>[\w\_]+)+:\s+(?P<tos>[\w]+)+\s+(?P<ttl>[\w]+)+\s+(?P<cos>[\w]+)+\s+(?P<v4_opt>[\w]+)+\s+(?P<src_obj>[\w]+)+\s+(?P<dst_obj>[\w]+)$')
 
         # Result  action: DENY    Logging: NO_LOG
-        p10 = re.compile(r'Result\s+action:\s+(?P<action>\S+)\s+Logging:\s+(?P<logging>\S+)$')
+        p10 = regex_engine.compile(r'Result\s+action:\s+(?P<action>\S+)\s+Logging:\s+(?P<logging>\S+)$')
 
         # Counter handle: (asic: 0 , OID: 0x577 (0))
-        p11 = re.compile(r'^Counter\s+handle:\s+\(asic:\s+(?P<asic>\d+)\s*,\s*OID:\s+(?P<oid>0x[\da-fA-F]+)\s*\(\d+\)\)$')
+        p11 = regex_engine.compile(r'^Counter\s+handle:\s+\(asic:\s+(?P<asic>\d+)\s*,\s*OID:\s+(?P<oid>0x[\da-fA-F]+)\s*\(\d+\)\)$')
 
         ret_dict = {}
 
@@ -347,24 +347,24 @@ class ShowPlatformHardwareFedSwitchQosQueueStatsInterface(ShowPlatformHardwareFe
 
         # VOQ Stats For : HundredGigE1/0/5 [ 0x544 ]
         # VOQ Stats For : HundredGigE2/0/2.1 [ 0x550 ]
-        p0 = re.compile(r'^VOQ Stats For : (?P<interface>[\w\/\.]+)\s+.*$')
+        p0 = regex_engine.compile(r'^VOQ Stats For : (?P<interface>[\w\/\.]+)\s+.*$')
 
         #          | Asic     |                                 0
         # |----------|-----------------------------------------------------------------------|
-        p1 = re.compile(r'^\|\s+Asic\s+\|\s+(?P<asic>\d+)$')
+        p1 = regex_engine.compile(r'^\|\s+Asic\s+\|\s+(?P<asic>\d+)$')
 
         # 0      | Enqueued |                        1194566957 |                       78841419162 |
         # | Dropped  |                                 0 |                                 0 |
         # | Total    |                        1194566957 |                       78841419162 |
         # |----------|-----------------------------------------------------------------------|
-        p2 = re.compile(r'^(?P<voq_id>\d+)?\s*\|\s+(?P<header>\w+)\s+\|\s+(?P<packets>\d+)\s+\|\s+(?P<bytes>\d+)\s+\|$')
+        p2 = regex_engine.compile(r'^(?P<voq_id>\d+)?\s*\|\s+(?P<header>\w+)\s+\|\s+(?P<packets>\d+)\s+\|\s+(?P<bytes>\d+)\s+\|$')
 
         # |   Slice  |         0 |         1 |         2 |         3 |         4 |         5 |
-        p3 = re.compile(r'^\|\s+Slice\s+\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|\s+(?P<slice2>\d+)\s\|'
-                    r'\s+(?P<slice3>\d+)\s\|\s+(?P<slice4>\d+)\s\|\s+(?P<slice5>\d+)\s\|$')
+        p3 = regex_engine.compile(r'^\|\s+Slice\s+\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|\s+(?P<slice2>\d+)\s\|'
+                              r'\s+(?P<slice3>\d+)\s\|\s+(?P<slice4>\d+)\s\|\s+(?P<slice5>\d+)\s\|$')
 
         # |SMS Bytes |         0 |         0 |         0 |         0 |         0 |         0 |
-        p4 = re.compile(r'^\|\s*(?P<slice_type>SMS Bytes|HBM Blocks|HBM Bytes)\s*\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|'
+        p4 = regex_engine.compile(r'^\|\s*(?P<slice_type>SMS Bytes|HBM Blocks|HBM Bytes)\s*\|\s+(?P<slice0>\d+)\s\|\s+(?P<slice1>\d+)\s\|'
             r'\s+(?P<slice2>\d+)\s\|\s+(?P<slice3>\d+)\s\|\s+(?P<slice4>\d+)\s\|\s+(?P<slice5>\d+)\s\|$')
 
         ret_dict = {}
@@ -627,74 +627,74 @@ class ShowPlatformHardwareFedQosSchedulerSdkInterface(ShowPlatformHardwareFedQos
             output = self.device.execute(cmd)
 
         # Interface              : HundredGigE1/0/5 (0x54A)
-        p1_0 = re.compile(r'^Interface\s+: (?P<interface>\S+) \((?P<interface_id>\S+)\)$')
+        p1_0 = regex_engine.compile(r'^Interface\s+: (?P<interface>\S+) \((?P<interface_id>\S+)\)$')
 
         # Priority Propagation  : Disabled
-        p1_1 = re.compile(r'^Priority Propagation\s+:\s*(?P<priority_propagation>\w+)$')
+        p1_1 = regex_engine.compile(r'^Priority Propagation\s+:\s*(?P<priority_propagation>\w+)$')
 
         # Sub-interface Q Mode  : Disabled - No Priority Propagation
-        p1_2 = re.compile(r'^Sub-interface Q Mode  : (?P<sub_interface_q_mode>.+)$')
+        p1_2 = regex_engine.compile(r'^Sub-interface Q Mode  : (?P<sub_interface_q_mode>.+)$')
 
         # Logical Port          : Enabled
-        p1_3 = re.compile(r'^Logical Port\s+: (?P<logical_port>\w+)$')
+        p1_3 = regex_engine.compile(r'^Logical Port\s+: (?P<logical_port>\w+)$')
 
         # TC Profile            : SDK OID    :   209
-        p1_4 = re.compile(r'^TC Profile\s+: SDK OID\s+:\s+(?P<sdk_oid>\d+)$')
+        p1_4 = regex_engine.compile(r'^TC Profile\s+: SDK OID\s+:\s+(?P<sdk_oid>\d+)$')
 
         # : TC         : TC0 | TC1 | TC2 | TC3 | TC4 | TC5 | TC6 | TC7
-        p1_5 = re.compile(r'^: TC         : (?P<tc>[\w\s\|]+)$')
+        p1_5 = regex_engine.compile(r'^: TC         : (?P<tc>[\w\s\|]+)$')
 
         # : VOQ Offset :   0 |   1 |   2 |   3 |   4 |   5 |   6 |   7
-        p1_6 = re.compile(r'^: VOQ Offset :\s+(?P<voq_offset>[\d\s\|]+)$')
+        p1_6 = regex_engine.compile(r'^: VOQ Offset :\s+(?P<voq_offset>[\d\s\|]+)$')
 
         # Interface Scheduler Configuration
-        p2_0 = re.compile(r'^Interface Scheduler Configuration$')
+        p2_0 = regex_engine.compile(r'^Interface Scheduler Configuration$')
 
         # | 755    | C-R   | 11000000512   | 11000000512   | PIR    | C(1   ) E(1   ) | 755    |
-        p2_1 = re.compile(r'^(?P<oid>\d+)\s+\|\s+(?P<ct_r>[\w\-]+)\s+\|\s+(?P<cir>\d+)\s+\|\s+(?P<eir_pir>\d+)\s+\|\s+(?P<is_eir>\w+)\s+\|\s+(?P<wfq_weights>.+)\s+\|\s+(?P<hw_id>\d+)$')
+        p2_1 = regex_engine.compile(r'^(?P<oid>\d+)\s+\|\s+(?P<ct_r>[\w\-]+)\s+\|\s+(?P<cir>\d+)\s+\|\s+(?P<eir_pir>\d+)\s+\|\s+(?P<is_eir>\w+)\s+\|\s+(?P<wfq_weights>.+)\s+\|\s+(?P<hw_id>\d+)$')
 
         # System Port - Scheduler Configuration
-        p3_0 = re.compile(r'^System Port - Scheduler Configuration$')
+        p3_0 = regex_engine.compile(r'^System Port - Scheduler Configuration$')
 
         # | 759    | P-CIR | 11000000512   | 12    | 11000000512   | 12       | 1       | 7       | OQPG-7  |      |      |
-        p3_1 = re.compile(r'^(?P<oid>\d+)\s+\|\s+(?P<c_pb>[\w\-\/]+)\s+\|\s+(?P<cir>\d+)\s+\|\s+(?P<burst>\d+)\s+\|\s+(?P<tx_cir>\d+)\s+\|\s+(?P<tx_burst>\d+)\s+\|\s+(?P<eir_wfq>\d+)\s+\|\s+(?P<act_wfq>\d+)\s+\|\s+(?P<pg_type>[\w\-]+)(\s+\|\s+(?P<child_type>\w+)\s+\|\s+(?P<child_oid>\d+))?$')
+        p3_1 = regex_engine.compile(r'^(?P<oid>\d+)\s+\|\s+(?P<c_pb>[\w\-\/]+)\s+\|\s+(?P<cir>\d+)\s+\|\s+(?P<burst>\d+)\s+\|\s+(?P<tx_cir>\d+)\s+\|\s+(?P<tx_burst>\d+)\s+\|\s+(?P<eir_wfq>\d+)\s+\|\s+(?P<act_wfq>\d+)\s+\|\s+(?P<pg_type>[\w\-]+)(\s+\|\s+(?P<child_type>\w+)\s+\|\s+(?P<child_oid>\d+))?$')
 
         # |        |       |     |       |     |          |         |         |         | OQHSE      | 760       |
-        p3_2 = re.compile(r'^(?P<child_type>\w+)\s+\|\s+(?P<child_oid>\d+)$')
+        p3_2 = regex_engine.compile(r'^(?P<child_type>\w+)\s+\|\s+(?P<child_oid>\d+)$')
 
         # OQHSE - Scheduler Configuration
-        p4_0 = re.compile(r'^OQHSE - Scheduler Configuration$')
+        p4_0 = regex_engine.compile(r'^OQHSE - Scheduler Configuration$')
 
         # | 760    | 2-I  | CIR   | UNLIMITED  | DEFLT | 7    | 7      | PARENT   |     | OQPG-7     | Sys-P SCH | 0   |
-        p4_1 = re.compile(r'^((?P<oid>\d+)\s+\|\s+(?P<mode>[\w\-]+)\s+\|\s+)?(?P<cep_ir>\w+)\s+\|\s+(?P<rate>\w+)\s+\|\s+(?P<burst>\w+)\s+\|\s+(?P<weight>\d+)\s+\|\s+(?P<hw_id>\d+)\s+\|\s+(?P<type>\w+)\s+\|\s+((?P<branch>\w+)\s+\|\s+(?P<lr_sp>\w+)\s+\|\s+(?P<wfq>\d+)\s+)?\|\s+(?P<link_point>[\w\-]+)\s+\|\s+(?P<hse_type>[\w\-\s]+)\|\s+(?P<hse_oid>\d+)$')
+        p4_1 = regex_engine.compile(r'^((?P<oid>\d+)\s+\|\s+(?P<mode>[\w\-]+)\s+\|\s+)?(?P<cep_ir>\w+)\s+\|\s+(?P<rate>\w+)\s+\|\s+(?P<burst>\w+)\s+\|\s+(?P<weight>\d+)\s+\|\s+(?P<hw_id>\d+)\s+\|\s+(?P<type>\w+)\s+\|\s+((?P<branch>\w+)\s+\|\s+(?P<lr_sp>\w+)\s+\|\s+(?P<wfq>\d+)\s+)?\|\s+(?P<link_point>[\w\-]+)\s+\|\s+(?P<hse_type>[\w\-\s]+)\|\s+(?P<hse_oid>\d+)$')
 
         # |    |      |   |     |       |        |     |    | Left   [SP( 0: 2) WFQ( 2: 2)]   |      |     |      |
-        p4_2 = re.compile(r'^(?P<branch>Left|Right)\s+\[(?P<load_balance_type1>\w+)\s*\(\s*(?P<s1>\d+):\s*(?P<c1>\d+)\)\s+(?P<load_balance_type2>\w+)\s*\(\s*(?P<s2>\d+):\s*(?P<c2>\d+)\)\]$')
+        p4_2 = regex_engine.compile(r'^(?P<branch>Left|Right)\s+\[(?P<load_balance_type1>\w+)\s*\(\s*(?P<s1>\d+):\s*(?P<c1>\d+)\)\s+(?P<load_balance_type2>\w+)\s*\(\s*(?P<s2>\d+):\s*(?P<c2>\d+)\)\]$')
 
         # |  |      |   |    |       |        |        |     :   0   0 255 255   0   0   0   0
-        p4_3 = re.compile(r'^:\s+(?P<weights>[\s\d]+)$')
+        p4_3 = regex_engine.compile(r'^:\s+(?P<weights>[\s\d]+)$')
 
         # |   |      |   |   |       |        |        |   |    SP-Link | 0          |   |   |
-        p4_4 = re.compile(r'^(?P<link>\S+)\s+\|\s*(?P<link_point>\d+)$')
+        p4_4 = regex_engine.compile(r'^(?P<link>\S+)\s+\|\s*(?P<link_point>\d+)$')
 
         # |  |      |     |   |       |        |  | CHILD        |         |  | CSTSE     | 763     |
-        p4_5 = re.compile(r'^CHILD\s*\|\s+\|\s+\|\s*(?P<hse_type>\w+)\s*\|\s*(?P<hse_oid>\d+)$')
+        p4_5 = regex_engine.compile(r'^CHILD\s*\|\s+\|\s+\|\s*(?P<hse_type>\w+)\s*\|\s*(?P<hse_oid>\d+)$')
 
         # CSTSE - Scheduler Configuration
-        p5_0 = re.compile(r'^CSTSE - Scheduler Configuration$')
+        p5_0 = regex_engine.compile(r'^CSTSE - Scheduler Configuration$')
 
         # SVCSE - Scheduler Configuration
-        p6_0 = re.compile(r'^SVCSE - Scheduler Configuration$')
+        p6_0 = regex_engine.compile(r'^SVCSE - Scheduler Configuration$')
 
         # | 772    | CIR      | 2000000000    | DEFLT | 0      | 55     | PARENT       | 0          | CSTSE     | 763     |        |
         # |        | PIR      | 2000000000    | DEFLT | 255    | 67     | PARENT       | 12         | CSTSE     | 1360    |        |
         # | 1026   | CIR      | UNLIMITED     | DEFLT | 255    | 8555   | PARENT       | 0          | OQHSE     | 2653    |        |
-        p6_1 = re.compile(r'^(?P<oid>\d+)?\s*\|*\s*(?P<cep_ir>(CIR|EIR|PIR))\s*\|\s*(?P<rate>\w+)\s*\|\s*(?P<burst>\w+)\s*\|'
-                          r'\s*(?P<weight>\d+)\s*\|\s*(?P<hw_id>\d+)\s*\|\s*(?P<type>\w+)\s*\|\s*(?P<link_point>\d+)\s*\|'
-                          r'\s*(?P<hse_type>\w+)\s*\|\s*(?P<hse_oid>\d+)(\s*\|\s+(?P<voq_id>\d+)\s*\|\s*(?P<in_device>\d+)\|\s*(?P<in_slice>\d+))?$')
+        p6_1 = regex_engine.compile(r'^(?P<oid>\d+)?\s*\|*\s*(?P<cep_ir>(CIR|EIR|PIR))\s*\|\s*(?P<rate>\w+)\s*\|\s*(?P<burst>\w+)\s*\|'
+                                    r'\s*(?P<weight>\d+)\s*\|\s*(?P<hw_id>\d+)\s*\|\s*(?P<type>\w+)\s*\|\s*(?P<link_point>\d+)\s*\|'
+                                    r'\s*(?P<hse_type>\w+)\s*\|\s*(?P<hse_oid>\d+)(\s*\|\s+(?P<voq_id>\d+)\s*\|\s*(?P<in_device>\d+)\|\s*(?P<in_slice>\d+))?$')
 
         # |    |   |   |       |    |    | CHILD   |    | VSC       | 327     | 327    | 0    | 0   |
-        p6_2 = re.compile(r'^CHILD\s*\|\s+\|\s*(?P<hse_type>\w+)\s*\|\s*(?P<hse_oid>\d+)\s*\|\s*(?P<voq_id>\d+)\s*\|\s*(?P<in_device>\d+)\s+\|\s*(?P<in_slice>\d+)$')
+        p6_2 = regex_engine.compile(r'^CHILD\s*\|\s+\|\s*(?P<hse_type>\w+)\s*\|\s*(?P<hse_oid>\d+)\s*\|\s*(?P<voq_id>\d+)\s*\|\s*(?P<in_device>\d+)\s+\|\s*(?P<in_slice>\d+)$')
 
         ret_dict = {}
         child_group = 0
@@ -722,7 +722,7 @@ class ShowPlatformHardwareFedQosSchedulerSdkInterface(ShowPlatformHardwareFedQos
                 continue
 
             # Logical Port          : Enabled
-            p1_3 = re.compile(r'^Logical Port\s+: (?P<logical_port>\w+)$')
+            p1_3 = regex_engine.compile(r'^Logical Port\s+: (?P<logical_port>\w+)$')
             m = p1_3.match(line)
             if m:
                 int_dict['logical_port'] = m.groupdict()['logical_port']
@@ -992,129 +992,129 @@ class ShowPlatformHardwareFedSwitchQosQueueConfig(
             output = self.device.execute(cmd)
 
         # Interface : HundredGigE2/0/34.100 (0x54C)
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^Interface\s+: (?P<interface>\S+) \((?P<interface_id>\S+)\)$"
         )
 
         # VOQ OID        : 2114(0x842)
-        p1 = re.compile(r"^VOQ OID\s+: (?P<voq_oid>\S+)\((?P<voq_id>\S+)\)$")
+        p1 = regex_engine.compile(r"^VOQ OID\s+: (?P<voq_oid>\S+)\((?P<voq_id>\S+)\)$")
 
         # VOQ Set Size   : 3
-        p2 = re.compile(r"^VOQ Set Size\s+: (?P<voq_set_size>\S+)$")
+        p2 = regex_engine.compile(r"^VOQ Set Size\s+: (?P<voq_set_size>\S+)$")
 
         # Base VOQ ID    : 28952
-        p3 = re.compile(r"^Base VOQ ID\s+: (?P<base_voq_id>\S+)$")
+        p3 = regex_engine.compile(r"^Base VOQ ID\s+: (?P<base_voq_id>\S+)$")
 
         # Base VSC IDs   : 728, 792, 856, 920, 984, 1048
-        p4 = re.compile(r"^Base VSC IDs\s+: (?P<base_vsc_ids>[\w\s\,]+)$")
+        p4 = regex_engine.compile(r"^Base VSC IDs\s+: (?P<base_vsc_ids>[\w\s\,]+)$")
 
         # VOQ State      : Active
-        p5 = re.compile(r"^VOQ State\s+: (?P<voq_state>\S+)$")
+        p5 = regex_engine.compile(r"^VOQ State\s+: (?P<voq_state>\S+)$")
 
         # VOQ Flush      : Flush not active
-        p6 = re.compile(r"^VOQ Flush\s+: (?P<voq_flush>.+)$")
+        p6 = regex_engine.compile(r"^VOQ Flush\s+: (?P<voq_flush>.+)$")
 
         # Is Empty       : Yes
-        p7 = re.compile(r"^Is Empty\s+: (?P<is_empty>.+)$")
+        p7 = regex_engine.compile(r"^Is Empty\s+: (?P<is_empty>.+)$")
 
         # Profile OID            : 433(0x1B1)
-        p8_1 = re.compile(
+        p8_1 = regex_engine.compile(
             r"^Profile OID\s+: (?P<profile_oid>\d+)\((?P<profile_id>\w+)\)$"
         )
 
         # Device ID              : 0
-        p9 = re.compile(r"^Device ID\s+: (?P<device_id>\d+)$")
+        p9 = regex_engine.compile(r"^Device ID\s+: (?P<device_id>\d+)$")
 
         # CGM Type               : Unicast
-        p10 = re.compile(r"^CGM Type\s+: (?P<cgm_type>\w+)$")
+        p10 = regex_engine.compile(r"^CGM Type\s+: (?P<cgm_type>\w+)$")
 
         # Profile reference count: 73
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^Profile reference count\s*: (?P<profile_reference_count>\d+)$"
         )
 
         # Is Reserved            : Yes
-        p12 = re.compile(r"^Is Reserved\s+: (?P<is_reserved>[\w\s]+)$")
+        p12 = regex_engine.compile(r"^Is Reserved\s+: (?P<is_reserved>[\w\s]+)$")
 
         # For speeds             : 10000000000
-        p13 = re.compile(r"^For speeds\s+: (?P<for_speeds>\d+)$")
+        p13 = regex_engine.compile(r"^For speeds\s+: (?P<for_speeds>\d+)$")
 
         # Associated VOQ Offsets : 0
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^Associated VOQ Offsets\s+: (?P<associated_voq_offsets>[\d, ]+)$"
         )
 
         # HBM Enabled            : Enabled
-        p15 = re.compile(r"^HBM Enabled\s+: (?P<hbm_enabled>\w+)$")
+        p15 = regex_engine.compile(r"^HBM Enabled\s+: (?P<hbm_enabled>\w+)$")
 
         # HBM Block Size         : 6144
-        p16 = re.compile(r"^HBM Block Size\s+: (?P<hgm_block_size>\w+)$")
+        p16 = regex_engine.compile(r"^HBM Block Size\s+: (?P<hgm_block_size>\w+)$")
 
         # RED Enabled            : Enabled
-        p17 = re.compile(r"^RED Enabled\s+: (?P<red_enabled>\w+)$")
+        p17 = regex_engine.compile(r"^RED Enabled\s+: (?P<red_enabled>\w+)$")
 
         # FCN Enabled            : Disabled
-        p18 = re.compile(r"^FCN Enabled\s+: (?P<fcn_enabled>\w+)$")
+        p18 = regex_engine.compile(r"^FCN Enabled\s+: (?P<fcn_enabled>\w+)$")
 
         # Queue User Config      :
-        p19 = re.compile(r"^Queue User Config\s+:$")
+        p19 = regex_engine.compile(r"^Queue User Config\s+:$")
 
         # Q-Limit(HBM Blocks)    : 4882
-        p19_1 = re.compile(
+        p19_1 = regex_engine.compile(
             r"^Q-Limit\(HBM Blocks\)\s+: (?P<q_limit_hbm_blocks>\d+)$"
         )
 
         # RED EMA Coefficient    : 1.000000
-        p19_2 = re.compile(
+        p19_2 = regex_engine.compile(
             r"^RED EMA Coefficient\s+: (?P<red_ema_coefficient>[\w\.]+)$"
         )
 
         # RED Green :
-        p19_3 = re.compile(r"^RED\s+(?P<red_flag>\w+)\s:$")
+        p19_3 = regex_engine.compile(r"^RED\s+(?P<red_flag>\w+)\s:$")
 
         # Minium(HBM BLOCKS)   : 0
-        p19_4 = re.compile(
+        p19_4 = regex_engine.compile(
             r"^Minium\(HBM BLOCKS\)\s*: (?P<minimun_hbm_blocks>\d+)$"
         )
 
         # Maximum(HBM BLOCKS)  : 1220
-        p19_5 = re.compile(
+        p19_5 = regex_engine.compile(
             r"^Maximum\(HBM BLOCKS\)\s*: (?P<maximum_hbm_blocks>\d+)$"
         )
 
         # Maximum Probability  : 0
-        p19_6 = re.compile(
+        p19_6 = regex_engine.compile(
             r"^Maximum Probability\s*: (?P<maximum_probability>\d+)$"
         )
 
         # Queue H/W Values       :
-        p20 = re.compile(r"^Queue H/W Values\s+:$")
+        p20 = regex_engine.compile(r"^Queue H/W Values\s+:$")
 
         # RED Action                     : Drop
-        p20_1 = re.compile(r"^RED Action\s+: (?P<red_action>\w+)$")
+        p20_1 = regex_engine.compile(r"^RED Action\s+: (?P<red_action>\w+)$")
 
         # RED Drop thresholds            : 0, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220
-        p20_2 = re.compile(
+        p20_2 = regex_engine.compile(
             r"^RED Drop thresholds\s+: (?P<red_drop_thresholds>[\w\s\,]+)$"
         )
 
         # RED Drop Probabilities[Green]  : 0.000000, 0.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000
-        p20_3 = re.compile(
+        p20_3 = regex_engine.compile(
             r"^RED Drop Probabilities\[(?P<red_flag>[\w]+)\]\s+: (?P<red_drop_probabilities>[\w\s\,\.]+)$"
         )
 
         # HBM Free Thresholds            : 10000, 20000, 40000, 60000, 124992, 250000, 500000, 1000000
-        p20_4 = re.compile(
+        p20_4 = regex_engine.compile(
             r"^HBM Free Thresholds\s+: (?P<hbm_free_thresholds>[\w\s\,\.]+)$"
         )
 
         # HBM VOQ Age Thresholds         : 1, 2, 3, 4, 5, 6, 7, 8, 10, 12, 16, 24, 32, 64, 128
-        p20_5 = re.compile(
+        p20_5 = regex_engine.compile(
             r"^HBM VOQ Age Thresholds\s+: (?P<hbm_voq_age_thresholds>[\w\s\,\.]+)$"
         )
 
         # HBM VOQ Thresholds             : 96, 992, 2000, 4000, 6000, 8000, 12000, 16000, 24000, 32000, 40000, 48000, 56000, 64000, 64512, 65536,
-        p20_6 = re.compile(
+        p20_6 = regex_engine.compile(
             r"^HBM VOQ Thresholds\s+: (?P<hbm_voq_thresholds>[\w\s\,\.]+)$"
         )
 
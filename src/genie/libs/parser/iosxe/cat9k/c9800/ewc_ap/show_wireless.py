@@ -1,8 +1,10 @@
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==========================================
 # Schema for:
@@ -31,10 +33,10 @@ class ShowWirelessEwcApPredownloadStatus(ShowWirelessEwcApPredownloadStatusSchem
             output = output
 
         # Predownload Status: None
-        p_predownload_status = re.compile(r"Predownload Status:\s+(?P<value>.*)$")
+        p_predownload_status = regex_engine.compile(r"Predownload Status:\s+(?P<value>.*)$")
 
         # Predownload Error: None
-        p_predownload_error = re.compile(r"Predownload Error:\s+(?P<value>.*)$")
+        p_predownload_error = regex_engine.compile(r"Predownload Error:\s+(?P<value>.*)$")
 
         return_dict = {}
 
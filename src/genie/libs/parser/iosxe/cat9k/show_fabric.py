@@ -1,6 +1,8 @@
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # ====================
@@ -48,10 +50,10 @@ class ShowFabricApSummary(ShowFabricApSummarySchema):
             output = self.device.execute(self.cli_command)
 
         # Number of Fabric AP : 2
-        p1 = re.compile(r"^Number\s+of\s+Fabric\s+AP\s:\s+(?P<fabric_ap_count>\d+)")
+        p1 = regex_engine.compile(r"^Number\s+of\s+Fabric\s+AP\s:\s+(?P<fabric_ap_count>\d+)")
 
         # AP0029.C2DE.65B0        2      1852I     0029.c2de.65b0  0029.c2df.d9e0  default location    US    112.201.2.152   Registered
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<ap_name>\S+)\s+(?P<slots>\d+)\s+(?P<ap_model>\S+)\s+(?P<ethernet_mac>\S+)\s+(?P<radio_mac>\S+)\s+(?P<location>.*)\s+(?P<country>\S+)\s+(?P<ip_address>\d+\.\d+\.\d+\.\d+)\s+(?P<state>(Registered))")
 
         fabric_ap_dict = {}
@@ -1,6 +1,8 @@
 # Metaparser
 from genie.metaparser import MetaParser
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # ====================
@@ -40,7 +42,7 @@ class ShowPlatformSoftCProcess(ShowPlatformSoftCProcessSchema):
 
         # Number of lines which match regexp = 1
 
-        p1 = re.compile(r"^Number\s+of\s+lines\s+which\s+match\s+regexp\s=\s+(?P<number_of_matching_lines>\d+)")
+        p1 = regex_engine.compile(r"^Number\s+of\s+lines\s+which\s+match\s+regexp\s=\s+(?P<number_of_matching_lines>\d+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -110,7 +112,7 @@ class ShowPlatformSoftIProcess(ShowPlatformSoftIProcessSchema):
         platform_software_ret_dict = {}
 
         # PID USER      PR  NI    VIRT    RES    SHR S  %CPU  %MEM     TIME+ COMMAND
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<pid>\S+)\s+(?P<user>\S+)\s+(?P<pr>\S+)\s+(?P<ni>\S+)\s+(?P<virt>\S+)\s+(?P<res>\S+)\s+(?P<shr>\S+)\s+(?P<s>\S+)\s+(?P<cpu>\S+)\s+(?P<mem>\S+)\s+(?P<time>\S+)\s+(?P<cmd>\S+)')
 
         for line in output.splitlines():
@@ -5,10 +5,10 @@ IOSXE parsers for the following show commands:
     * 'show controllers power inline'
 '''
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -40,9 +40,9 @@ class ShowControllersPowerInline(ShowControllersPowerInlineSchema):
 
         # Regular expressions for parsing
         # For PoE controller registers refer to /flash/poe_controller_regs_sw1*
-        p1 = re.compile(r'^For PoE controller registers refer to (?P<poe_controller_registers>\S+)$')
+        p1 = regex_engine.compile(r'^For PoE controller registers refer to (?P<poe_controller_registers>\S+)$')
         # For PoE firmware logs refer to /flash/poe_fw_logs_sw1*
-        p2 = re.compile(r'^For PoE firmware logs refer to (?P<poe_firmware_logs>\S+)$')
+        p2 = regex_engine.compile(r'^For PoE firmware logs refer to (?P<poe_firmware_logs>\S+)$')
 
         # Iterate over each line of the output
         for line in output.splitlines():
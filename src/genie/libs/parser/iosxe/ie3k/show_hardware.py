@@ -3,14 +3,12 @@ IOSXE parsers for the following show commands:
     * show hardware hardware-led-state
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowHardwareLedStateSchema(MetaParser):
@@ -44,34 +42,34 @@ class ShowHardwareLedState(ShowHardwareLedStateSchema):
         ret_dict = {}
         
         # SYSTEM: GREEN
-        p1 = re.compile(r'^SYSTEM:\s+(?P<system>\w+)$')
+        p1 = regex_engine.compile(r'^SYSTEM:\s+(?P<system>\w+)$')
 
         # EXPRESS-SETUP: BLACK
-        p2 = re.compile(r'^EXPRESS-SETUP:\s+(?P<express_setup>\w+)$')
+        p2 = regex_engine.compile(r'^EXPRESS-SETUP:\s+(?P<express_setup>\w+)$')
 
         # POE: BLACK
-        p3 = re.compile(r'^POE:\s+(?P<poe>\w+)$')
+        p3 = regex_engine.compile(r'^POE:\s+(?P<poe>\w+)$')
 
         # DC-A: GREEN
-        p4 = re.compile(r'^DC-A:\s+(?P<dc_a>\w+)$')
+        p4 = regex_engine.compile(r'^DC-A:\s+(?P<dc_a>\w+)$')
 
         # DC-B: BLACK
-        p5 = re.compile(r'^DC-B:\s+(?P<dc_b>\w+)$')
+        p5 = regex_engine.compile(r'^DC-B:\s+(?P<dc_b>\w+)$')
 
         # ALARM-OUT: GREEN
-        p6 = re.compile(r'^ALARM-OUT:\s+(?P<alarm_out>\w+)$')
+        p6 = regex_engine.compile(r'^ALARM-OUT:\s+(?P<alarm_out>\w+)$')
 
         # ALARM-IN1: GREEN
-        p7 = re.compile(r'^ALARM-IN1:\s+(?P<alarm_in1>\w+)$')
+        p7 = regex_engine.compile(r'^ALARM-IN1:\s+(?P<alarm_in1>\w+)$')
 
         # ALARM-IN2: GREEN
-        p8 = re.compile(r'^ALARM-IN2:\s+(?P<alarm_in2>\w+)$')
+        p8 = regex_engine.compile(r'^ALARM-IN2:\s+(?P<alarm_in2>\w+)$')
 
         # EIP-NET-LED: BLACK
-        p9 = re.compile(r'^EIP-NET-LED:\s+(?P<eip_net_led>\w+)$')
+        p9 = regex_engine.compile(r'^EIP-NET-LED:\s+(?P<eip_net_led>\w+)$')
 
         # Gi1/1 BLACK
-        p10 = re.compile(r'^(?P<interface>\S+)\s+(?P<led_state>\w+)$')
+        p10 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<led_state>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
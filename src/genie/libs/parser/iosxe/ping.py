@@ -9,13 +9,11 @@ IOSXE parsers for the following show commands:
     * ping mpls traffic-eng tunnel {tunnel_id}
     * ping mpls pseudowire <ip> <vc_id>
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 # unicon
 from unicon.eal.dialogs import Dialog, Statement
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, SchemaTypeError, Schema)
@@ -118,19 +116,19 @@ class Ping(PingSchema):
         ret_dict = {}
         result_per_line = []
         # Sending 10, 100-byte ICMP Echos to 10.229.1.1, timeout is 2 seconds:
-        p1 = re.compile(r'Sending +(?P<repeat>\d+), +(?P<data_bytes>\d+)-byte +ICMP +Echos +to +(?P<address>[\S\s]+), +timeout +is +(?P<timeout>\d+) +seconds:')
+        p1 = regex_engine.compile(r'Sending +(?P<repeat>\d+), +(?P<data_bytes>\d+)-byte +ICMP +Echos +to +(?P<address>[\S\s]+), +timeout +is +(?P<timeout>\d+) +seconds:')
 
         #Packet sent with a source address of 10.229.1.2
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'Packet +sent +with +a +source +address +of +(?P<source>[\S\s]+)')
 
         # !!!!!!!
         # !.UQM?&
-        p3 = re.compile(r'[!\.UQM\?&]+')
+        p3 = regex_engine.compile(r'[!\.UQM\?&]+')
 
         # Success rate is 100 percent (100/100), round-trip min/avg/max = 1/2/14 ms
         # Success rate is 0 percent (0/10)
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'Success +rate +is +(?P<success_percent>\d+) +percent +\((?P<received>\d+)\/(?P<send>\d+)\)(, +round-trip +min/avg/max *= *(?P<min>\d+)/(?P<avg>\d+)/(?P<max>\d+) +(?P<unit>\w+))?'
         )
 
@@ -274,18 +272,18 @@ class PingMpls(PingMplsSchema):
             out = output
         ret_dict = {}
         #Sending 5, 72-byte MPLS Echos to 4.4.4.4/32,
-        p1 = re.compile(r'Sending +(?P<repeat>\d+), +(?P<data_bytes>\d+)-byte +MPLS +Echos +to +(?P<address>[\S\s]+),')
+        p1 = regex_engine.compile(r'Sending +(?P<repeat>\d+), +(?P<data_bytes>\d+)-byte +MPLS +Echos +to +(?P<address>[\S\s]+),')
 
         #timeout is 2 seconds, send interval is 0 msec:
-        p2 = re.compile(r'timeout +is +(?P<timeout>\d+) +seconds\, +send +interval +is +(?P<interval>\d+) msec\:')
+        p2 = regex_engine.compile(r'timeout +is +(?P<timeout>\d+) +seconds\, +send +interval +is +(?P<interval>\d+) msec\:')
 
         #Success rate is 100 percent (5/5), round-trip min/avg/max = 1/173/656 ms
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'Success +rate +is +(?P<success_percent>\d+) +percent +\((?P<received>\d+)\/(?P<sent>\d+)\)(, +round-trip +min/avg/max *= *(?P<min>\d+)/(?P<avg>\d+)/(?P<max>\d+) +(?P<unit>\w+))?'
         )
 
         #Total Time Elapsed 869 ms
-        p4 = re.compile(r'Total +Time +Elapsed +(?P<elapsed_time>\d+) ms')
+        p4 = regex_engine.compile(r'Total +Time +Elapsed +(?P<elapsed_time>\d+) ms')
         for line in out.splitlines():
             line = line.strip()
             m1 = p1.match(line)
@@ -397,22 +395,22 @@ class PingIpv6(PingIpv6Schema):
                 output = self.device.execute(self.cli_command[0].format(addr=addr))
         
         # Output Interface: gigabitEthernet1/0/1
-        p1 = re.compile(r'^Output Interface:\s(?P<interface>[\w\/\.]+)$')
+        p1 = regex_engine.compile(r'^Output Interface:\s(?P<interface>[\w\/\.]+)$')
         
         # Sending 5, 100-byte ICMP Echos to FF08::10, timeout is 2 seconds:
-        p2 = re.compile(r'^Sending\s(?P<repeat>\d+),\s(?P<data_bytes>\d+)-byte ICMP Echos to\s(?P<address>[a-fA-F0-9:]+), timeout is\s(?P<timeout_secs>\d+)\sseconds:$')
+        p2 = regex_engine.compile(r'^Sending\s(?P<repeat>\d+),\s(?P<data_bytes>\d+)-byte ICMP Echos to\s(?P<address>[a-fA-F0-9:]+), timeout is\s(?P<timeout_secs>\d+)\sseconds:$')
         
         # Packet sent with a source address of 2012:AA:23::3
-        p3 = re.compile(r'^Packet sent with a source address of\s(?P<source>[a-fA-F0-9:]+)$')
+        p3 = regex_engine.compile(r'^Packet sent with a source address of\s(?P<source>[a-fA-F0-9:]+)$')
         
         # Reply to request 0 received from 2012:AA:1:0:200:23FF:FE53:B72A, 38 ms
-        p4 = re.compile(r'^Reply to request\s(?P<request>\d+)\sreceived from\s(?P<addr>[a-fA-F0-9:]+),\s(?P<rtt>\d+)\sms$')
+        p4 = regex_engine.compile(r'^Reply to request\s(?P<request>\d+)\sreceived from\s(?P<addr>[a-fA-F0-9:]+),\s(?P<rtt>\d+)\sms$')
 
         # Success rate is 100 percent (5/5), round-trip min/avg/max = 1/25/73 ms
-        p5 = re.compile(r'^Success rate is\s(?P<success_rate_percent>[\d\.]+)\spercent\s\((?P<received>\d+)/(?P<send>\d+)\)(, round\-trip min/avg/max =\s(?P<min_ms>\d+)/(?P<avg_ms>\d+)/(?P<max_ms>\d+)\sms)?$')
+        p5 = regex_engine.compile(r'^Success rate is\s(?P<success_rate_percent>[\d\.]+)\spercent\s\((?P<received>\d+)/(?P<send>\d+)\)(, round\-trip min/avg/max =\s(?P<min_ms>\d+)/(?P<avg_ms>\d+)/(?P<max_ms>\d+)\sms)?$')
 
         # 19 multicast replies and 0 errors.
-        p6 = re.compile(r'^(?P<multicast_replies>\d+)\smulticast replies and\s(?P<errors>\d+)\serrors\.$')
+        p6 = regex_engine.compile(r'^(?P<multicast_replies>\d+)\smulticast replies and\s(?P<errors>\d+)\serrors\.$')
         
         ret_dict = dict()
 
@@ -5,12 +5,10 @@ IOSXE parsers for the following show commands:
     * show isis node locators {level}
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, ListOf
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -64,22 +62,22 @@ class ShowIsisNodeLocators(ShowIsisNodeLocatorsSchema):
         host_dict = {}
         v6pfx_dict = {}
         # Tag 1:
-        p1 = re.compile(r"^Tag (?P<tag>\S+):$")
+        p1 = regex_engine.compile(r"^Tag (?P<tag>\S+):$")
  
         # ISIS level-1 node information for R1.00
-        p2 = re.compile(r"^ISIS\s+(?P<level>\S+)\s+node information for\s+(?P<host>\S+)$")
+        p2 = regex_engine.compile(r"^ISIS\s+(?P<level>\S+)\s+node information for\s+(?P<host>\S+)$")
 
         # (MT-2) FCCC:CCC1:A1::/48, Algorithm: 128
-        p3 = re.compile(r"\((?P<topology>MT-[2|0])\)\s+(?P<ipv6prefix>[0-9a-fA-F:/]+)\,\s+Algorithm:\s+(?P<pfx_algo>\d+)")
+        p3 = regex_engine.compile(r"\((?P<topology>MT-[2|0])\)\s+(?P<ipv6prefix>[0-9a-fA-F:/]+)\,\s+Algorithm:\s+(?P<pfx_algo>\d+)")
 
         #LSP 0, Index 1, Seq 0xB8
-        p4 = re.compile(r"LSP\s+(?P<lsp_id>\d+)\,\s+Index\s+(?P<lsp_index>\d+)\,\s+Seq\s+(?P<lsp_seq_no>[0-9a-fA-Fx]+)")
+        p4 = regex_engine.compile(r"LSP\s+(?P<lsp_id>\d+)\,\s+Index\s+(?P<lsp_index>\d+)\,\s+Seq\s+(?P<lsp_seq_no>[0-9a-fA-Fx]+)")
 
         #Metric: 0, Algoritm: 128
-        p5 = re.compile(r"Metric:\s+(?P<metric>\d+)\,\s+Algoritm:\s+(?P<algorithm>\d+)")
+        p5 = regex_engine.compile(r"Metric:\s+(?P<metric>\d+)\,\s+Algoritm:\s+(?P<algorithm>\d+)")
 
         #End SID: FCCC:CCC1:A1:: uN (PSP/USD)
-        p6 = re.compile(r"End SID:\s+(?P<srv6_end_sid>[0-9a-fA-F:/]+)\s+(?P<srv6_sid_behavior>[\w\W\s()/]+)")
+        p6 = regex_engine.compile(r"End SID:\s+(?P<srv6_end_sid>[0-9a-fA-F:/]+)\s+(?P<srv6_sid_behavior>[\w\W\s()/]+)")
 
         for line in output.splitlines():
             line = line.strip()
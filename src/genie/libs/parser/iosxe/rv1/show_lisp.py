@@ -1,12 +1,10 @@
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
                                                 ListOf,
                                                 Optional,
                                                 Or)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowLispInstanceIdServiceSchema(MetaParser):
@@ -197,122 +195,122 @@ class ShowLispInstanceIdService(ShowLispInstanceIdServiceSchema):
             'enabled': True}
 
         # Instance ID:                              4100
-        p1 = re.compile(r'Instance ID:\s+(?P<instance_id>\d+)$')
+        p1 = regex_engine.compile(r'Instance ID:\s+(?P<instance_id>\d+)$')
 
         # Router-lisp ID:                      0
-        p2 = re.compile(r'Router-lisp +ID *: +(?P<lisp_id>\d+)$')
+        p2 = regex_engine.compile(r'Router-lisp +ID *: +(?P<lisp_id>\d+)$')
 
         # Locator table:                       default
-        p3 = re.compile(r'Locator +table *: +(?P<locator_table>\S+)$')
+        p3 = regex_engine.compile(r'Locator +table *: +(?P<locator_table>\S+)$')
 
         # EID table:                                vrf red
-        p4 = re.compile(r'EID table:\s+(?P<eid_table>.*)$')
+        p4 = regex_engine.compile(r'EID table:\s+(?P<eid_table>.*)$')
 
         # Ingress Tunnel Router (ITR):         enabled
         # Egress Tunnel Router (ETR):          enabled
-        p5 = re.compile(r'(Ingress|Egress) +Tunnel +Router '
-                        r'+\((?P<type>(ITR|ETR))\) *: '
-                        r'+(?P<enabled>(enabled|disabled))$')
+        p5 = regex_engine.compile(r'(Ingress|Egress) +Tunnel +Router '
+                                  r'+\((?P<type>(ITR|ETR))\) *: '
+                                  r'+(?P<enabled>(enabled|disabled))$')
 
         # Proxy-ITR Router (PITR):             disabled
         # Proxy-ETR Router (PETR):             disabled
         # Proxy-ETR Router (PETR):             enabled RLOCs: 10.10.10.10
         # Proxy-ITR Router (PITR):             enabled RLOCs: 2001:10:10:10::10
-        p6 = re.compile(r'Proxy\-(ITR|ETR) +Router +\((?P<proxy_type>(PITR|PETR))\)'
-                        r'*: +(?P<proxy_itr_router>(enabled|disabled))'
-                        r'(?: +RLOCs: +(?P<proxy_itr_rloc>'
-                        r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|[a-fA-F\d\:]+))?$')
+        p6 = regex_engine.compile(r'Proxy\-(ITR|ETR) +Router +\((?P<proxy_type>(PITR|PETR))\)'
+                                  r'*: +(?P<proxy_itr_router>(enabled|disabled))'
+                                  r'(?: +RLOCs: +(?P<proxy_itr_rloc>'
+                                  r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|[a-fA-F\d\:]+))?$')
 
         # ITR local RLOC (last resort):             *** NOT FOUND ***
-        p7 = re.compile(r'^ITR +local +RLOC +\(last +resort\):\s+'
-                        r'(?P<local_rloc_last_resort>.*)$')
+        p7 = regex_engine.compile(r'^ITR +local +RLOC +\(last +resort\):\s+'
+                                  r'(?P<local_rloc_last_resort>.*)$')
 
         # ITR use proxy ETR RLOC(Encap IID):        1.1.1.1 (self), 66.66.66.66
-        p8 = re.compile(r'^ITR\s+use +proxy +ETR +RLOC\(Encap IID\) *'
-                        r': +(?P<use_proxy_etr_rloc_1>[\d.]+ *'
-                        r'(\(self\))?),? *(?P<use_proxy_etr_rloc_2>([\d.]+)|([a-fA-F\d\:]+))?$')
+        p8 = regex_engine.compile(r'^ITR\s+use +proxy +ETR +RLOC\(Encap IID\) *'
+                                  r': +(?P<use_proxy_etr_rloc_1>[\d.]+ *'
+                                  r'(\(self\))?),? *(?P<use_proxy_etr_rloc_2>([\d.]+)|([a-fA-F\d\:]+))?$')
 
         # ITR Solicit Map Request (SMR):       accept and process
-        p9 = re.compile(r'^ITR +Solicit +Map +Request +\(SMR\) *:'
-                        r'+(?P<solicit_map_request>.*)$')
+        p9 = regex_engine.compile(r'^ITR +Solicit +Map +Request +\(SMR\) *:'
+                                  r'+(?P<solicit_map_request>.*)$')
 
         # Max SMRs per map-cache entry:      8 more specifics
-        p10 = re.compile(r'^Max SMRs per map-cache entry:\s+(?P<max_smr_per_map_cache>.*)$')
+        p10 = regex_engine.compile(r'^Max SMRs per map-cache entry:\s+(?P<max_smr_per_map_cache>.*)$')
 
         # Multiple SMR suppression time:     20 secs
-        p11 = re.compile(r'^Multiple +SMR +suppression +time *: +'
-                        r'(?P<multiple_smr_supression_time>\d+) +secs$')
+        p11 = regex_engine.compile(r'^Multiple +SMR +suppression +time *: +'
+                                  r'(?P<multiple_smr_supression_time>\d+) +secs$')
 
         # ETR accept mapping data:             disabled, verify disabled
-        p12 = re.compile(r'^ETR +accept +mapping +data *: +(?P<accept_mapping_data>.*)$')
+        p12 = regex_engine.compile(r'^ETR +accept +mapping +data *: +(?P<accept_mapping_data>.*)$')
 
         # ETR map-cache TTL:                   1d00h
-        p13 = re.compile(r'^ETR +map-cache +TTL *: +(?P<map_cache_ttl>\S+)$')
+        p13 = regex_engine.compile(r'^ETR +map-cache +TTL *: +(?P<map_cache_ttl>\S+)$')
 
         # NAT-traversal Router (NAT-RTR):      disabled
-        p14 = re.compile(r'^NAT-traversal +Router +\(NAT\-RTR\) *: +'
-                         r'(?P<nat_traversal_router>(enabled|disabled))$')
+        p14 = regex_engine.compile(r'^NAT-traversal +Router +\(NAT\-RTR\) *: +'
+                                   r'(?P<nat_traversal_router>(enabled|disabled))$')
 
         # Mobility First-Hop Router:           disabled
-        p15 = re.compile(r'Mobility +First-Hop +Router *:'
-                         r' +(?P<mobility_first_hop_router>(enabled|disabled))$')
+        p15 = regex_engine.compile(r'Mobility +First-Hop +Router *:'
+                                   r' +(?P<mobility_first_hop_router>(enabled|disabled))$')
 
         # Map Server (MS):                     disabled
-        p16 = re.compile(r'Map +Server +\(MS\) *:'
-                        r' +(?P<enabled>(enabled|disabled))$')
+        p16 = regex_engine.compile(r'Map +Server +\(MS\) *:'
+                                  r' +(?P<enabled>(enabled|disabled))$')
 
         # Map Resolver (MR):                   disabled
-        p17 = re.compile(r'Map +Resolver +\(MR\) *:'
-                         r' +(?P<enabled>enabled|disabled)$')
+        p17 = regex_engine.compile(r'Map +Resolver +\(MR\) *:'
+                                   r' +(?P<enabled>enabled|disabled)$')
 
         # Delegated Database Tree (DDT):       disabled
-        p18 = re.compile(r'Delegated +Database +Tree +\(DDT\) *:'
-                         r' +(?P<delegated_database_tree>enabled|disabled)$')
+        p18 = regex_engine.compile(r'Delegated +Database +Tree +\(DDT\) *:'
+                                   r' +(?P<delegated_database_tree>enabled|disabled)$')
 
         # Mr-use-petr:                              enabled
-        p19 = re.compile(r'^Mr-use-petr:\s+(?P<role>enabled|disabled)$')
+        p19 = regex_engine.compile(r'^Mr-use-petr:\s+(?P<role>enabled|disabled)$')
 
         # Mr-use-petr locator set name:             RLOC1
-        p20 = re.compile(r'^Mr-use-petr locator set name:\s+(?P<locator_set>\S+)$')
+        p20 = regex_engine.compile(r'^Mr-use-petr locator set name:\s+(?P<locator_set>\S+)$')
 
         # First-Packet pETR:                        enabled
-        p21 = re.compile(r'^First-Packet pETR:\s+(?P<role>enabled|disabled)$')
+        p21 = regex_engine.compile(r'^First-Packet pETR:\s+(?P<role>enabled|disabled)$')
 
         # First-Packet pETR locator set name:       RLOC1
-        p22 = re.compile(r'^First-Packet pETR locator set name:\s+(?P<locator_set>\S+)$')
+        p22 = regex_engine.compile(r'^First-Packet pETR locator set name:\s+(?P<locator_set>\S+)$')
 
         # Multiple IP per MAC support:              disabled
-        p23 = re.compile(r'^Multiple IP per MAC support:\s+'
-                         r'(?P<multiple_ip_per_mac>disabled|enabled)$')
+        p23 = regex_engine.compile(r'^Multiple IP per MAC support:\s+'
+                                   r'(?P<multiple_ip_per_mac>disabled|enabled)$')
 
         # Multicast Flood Access-Tunnel:            disabled
-        p24 = re.compile(r'^Multicast Flood Access-Tunnel:\s+'
-                         r'(?P<mcast_flood_access_tunnel>disabled|enabled)$')
+        p24 = regex_engine.compile(r'^Multicast Flood Access-Tunnel:\s+'
+                                   r'(?P<mcast_flood_access_tunnel>disabled|enabled)$')
 
         # Publication-Subscription-EID:             disabled
-        p25_1 = re.compile(r'^Publication-Subscription-EID:\s+'
-                         r'(?P<pub_sub_eid>disabled|enabled)$')
+        p25_1 = regex_engine.compile(r'^Publication-Subscription-EID:\s+'
+                                   r'(?P<pub_sub_eid>disabled|enabled)$')
 
         # Publication-Subscription:                 enabled
-        p25 = re.compile(r'^Publication-Subscription:\s+(?P<role>enabled|disabled)$')
+        p25 = regex_engine.compile(r'^Publication-Subscription:\s+(?P<role>enabled|disabled)$')
 
         # Publisher(s):                           *** NOT FOUND ***
         # Publisher(s):                           2001:4:4:4::4
-        p26 = re.compile(r'^Publisher\(s\):\s+(?P<publishers>[\d.:]+)(?: +.*)?$')
+        p26 = regex_engine.compile(r'^Publisher\(s\):\s+(?P<publishers>[\d.:]+)(?: +.*)?$')
 
         #                                         2001:13:13:13::13
         #                                         199.199.199.199 *** ETR Map-Server not found ***
-        p26_1 = re.compile(r'^(?P<publisher>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-                           r'|([a-fA-F\d\:]+))( \*\*\* ETR Map-Server not found \*\*\*)?$')
+        p26_1 = regex_engine.compile(r'^(?P<publisher>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+                                     r'|([a-fA-F\d\:]+))( \*\*\* ETR Map-Server not found \*\*\*)?$')
 
         # Subscriber(s):                           *** NOT FOUND ***
-        p27 = re.compile(r'^Subscriber\(s\):\s+(?P<subscribers>.*)$')
+        p27 = regex_engine.compile(r'^Subscriber\(s\):\s+(?P<subscribers>.*)$')
 
         # Site Registration Limit:                  0
-        p28 = re.compile(r'Site Registration Limit:\s+(?P<site_registration_limit>\d+)$')
+        p28 = regex_engine.compile(r'Site Registration Limit:\s+(?P<site_registration_limit>\d+)$')
 
         # ITR Map-Resolver(s):                      *** NOT FOUND ***
-        p29_1 = re.compile(r'ITR Map-Resolver\(s\): +(?P<imr_not_found>\*\*\* NOT FOUND \*\*\*)$')
+        p29_1 = regex_engine.compile(r'ITR Map-Resolver\(s\): +(?P<imr_not_found>\*\*\* NOT FOUND \*\*\*)$')
 
         # ITR Map-Resolver(s):                      3800:3800:3800:3800:3800:3800:3800:3800
         # ITR Map-Resolver(s):                      3120:3120:3120:3120:3120:3120:3120:3120 *** not reachable ***
@@ -322,12 +320,12 @@ class ShowLispInstanceIdService(ShowLispInstanceIdServiceSchema):
         #                                           3120:3120:3120:3120:3120:3120:3120:3120 *** not reachable ***
         #                                           3130:3130:3130:3130:3130:3130:3130:3130 prefix-list site1list
         #                                           3140:3140:3140:3140:3140:3140:3140:3140 prefix-list site1list *** not reachable ***
-        p29_2 = re.compile(r'(ITR Map-Resolver\(s\):)? *(?P<imr_address>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-                           r'|([a-fA-F\d\:]+))( prefix-list (?P<imr_prefix_list>\w+))?'
-                           r'( (?P<imr_not_reachable>)\*\*\* not reachable \*\*\*)?$')
+        p29_2 = regex_engine.compile(r'(ITR Map-Resolver\(s\):)? *(?P<imr_address>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+                                     r'|([a-fA-F\d\:]+))( prefix-list (?P<imr_prefix_list>\w+))?'
+                                     r'( (?P<imr_not_reachable>)\*\*\* not reachable \*\*\*)?$')
 
         # ETR Map-Server(s) (last map-reg sent):    *** NOT FOUND ***
-        p31_1 = re.compile(r'ETR Map-Server\(s\): +(?P<ems_not_found>\*\*\* NOT FOUND \*\*\*)$')
+        p31_1 = regex_engine.compile(r'ETR Map-Server\(s\): +(?P<ems_not_found>\*\*\* NOT FOUND \*\*\*)$')
 
         # ETR Map-Server(s) (last map-reg sent):    3120:3120:3120:3120:3120:3120:3120:3120 (00:01:08, TCP)
         # ETR Map-Server(s) (last map-reg sent):    3130:3130:3130:3130:3130:3130:3130:3130 (00:00:09, UDP)
@@ -347,116 +345,116 @@ class ShowLispInstanceIdService(ShowLispInstanceIdServiceSchema):
         #                                           3120:3120:3120:3120:3120:3120:3120:3120 prefix-list site1list domain-id 1 (00:01:08, TCP)
         #                                           3130:3130:3130:3130:3130:3130:3130:3130 prefix-list site1list domain-id 1 (00:00:09, UDP)
         #                                           3140:3140:3140:3140:3140:3140:3140:3140 prefix-list site1list domain-id 1 (never)
-        p31_2 = re.compile(r'(ETR Map-Server\(s\) \(last map-reg sent\):)? *(?P<ems_address>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-                           r'|([a-fA-F\d\:]+))( prefix-list (?P<ems_prefix_list>\w+))?( domain-id (?P<ems_domain_id>\d+))?'
-                           r' \((?P<ems_last_map_reg_time>[\w:\d]+)(, (?P<ems_last_transport_state>TCP|UDP))?\)$')
+        p31_2 = regex_engine.compile(r'(ETR Map-Server\(s\) \(last map-reg sent\):)? *(?P<ems_address>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+                                     r'|([a-fA-F\d\:]+))( prefix-list (?P<ems_prefix_list>\w+))?( domain-id (?P<ems_domain_id>\d+))?'
+                                     r' \((?P<ems_last_map_reg_time>[\w:\d]+)(, (?P<ems_last_transport_state>TCP|UDP))?\)$')
 
         # xTR-ID:                              0x730E0861-0x12996F6D-0xEFEA2114-0xE1C951F7
-        p32 = re.compile(r'^xTR-ID *: +(?P<xtr_id>[a-fA-F0-9x-]+)$')
+        p32 = regex_engine.compile(r'^xTR-ID *: +(?P<xtr_id>[a-fA-F0-9x-]+)$')
 
         # site-ID:                             unspecified
-        p33 = re.compile(r'site-ID *: +(?P<site_id>\S+)$')
+        p33 = regex_engine.compile(r'site-ID *: +(?P<site_id>\S+)$')
 
         # RLOC-probe algorithm:              disabled
-        p34 = re.compile(r'RLOC\-probe +algorithm *: '
-                         r'+(?P<rloc_probe_algorithm>enabled|disabled)$')
+        p34 = regex_engine.compile(r'RLOC\-probe +algorithm *: '
+                                   r'+(?P<rloc_probe_algorithm>enabled|disabled)$')
 
         # RLOC-probe on route change:        N/A (periodic probing disabled)
-        p35 = re.compile(r'RLOC\-probe +on +route +change *: +(?P<rloc_probe_on_route_change>.*)$')
+        p35 = regex_engine.compile(r'RLOC\-probe +on +route +change *: +(?P<rloc_probe_on_route_change>.*)$')
 
         # RLOC-probe on member change:       disabled
-        p36 = re.compile(r'RLOC\-probe +on +member +change *:'
-                         r' +(?P<rloc_probe_member_change>enabled|disabled)$')
+        p36 = regex_engine.compile(r'RLOC\-probe +on +member +change *:'
+                                   r' +(?P<rloc_probe_member_change>enabled|disabled)$')
 
         # LSB reports:                       process
-        p37 = re.compile(r'LSB +reports *: +(?P<lsb_reports>\S+)$')
+        p37 = regex_engine.compile(r'LSB +reports *: +(?P<lsb_reports>\S+)$')
 
         # IPv4 RLOC minimum mask length:     /0
-        p38 = re.compile(r'IPv4 +RLOC +minimum +mask +length *:'
-                         r' +\/(?P<ipv4_rloc_min_mask_len>\d+)$')
+        p38 = regex_engine.compile(r'IPv4 +RLOC +minimum +mask +length *:'
+                                   r' +\/(?P<ipv4_rloc_min_mask_len>\d+)$')
 
         # IPv6 RLOC minimum mask length:     /0
-        p39 = re.compile(r'IPv6 +RLOC +minimum +mask +length *:'
-                         r' +\/(?P<ipv6_rloc_min_mask_len>\d+)$')
+        p39 = regex_engine.compile(r'IPv6 +RLOC +minimum +mask +length *:'
+                                   r' +\/(?P<ipv6_rloc_min_mask_len>\d+)$')
 
         # Static mappings configured:             1
-        p40 = re.compile(r'Static mappings configured:\s+(?P<static_mappings>\d+)$')
+        p40 = regex_engine.compile(r'Static mappings configured:\s+(?P<static_mappings>\d+)$')
 
         # Map-cache size/limit:                   2/4294967295
-        p41 = re.compile(r'Map-cache size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p41 = regex_engine.compile(r'Map-cache size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # Imported route count/limit:             0/5000
-        p42 = re.compile(r'Imported route count\/limit:\s+(?P<count>\d+)\/(?P<limit>\d+)$')
+        p42 = regex_engine.compile(r'Imported route count\/limit:\s+(?P<count>\d+)\/(?P<limit>\d+)$')
 
         # Map-cache activity check period:   60 secs
-        p43 = re.compile(r'Map-cache +activity +check +period *:'
-                         r' +(?P<activity_check_period>\d+) +secs$')
+        p43 = regex_engine.compile(r'Map-cache +activity +check +period *:'
+                                   r' +(?P<activity_check_period>\d+) +secs$')
 
         # Map-cache signal suppress:              disabled
-        p44 = re.compile(r'Map-cache signal suppress:\s+(?P<signal_supress>disabled|enabled)$')
+        p44 = regex_engine.compile(r'Map-cache signal suppress:\s+(?P<signal_supress>disabled|enabled)$')
 
         # Conservative-allocation:                disabled
-        p45 = re.compile(r'Conservative-allocation:\s+(?P<conservative_allocation>disabled|enabled)$')
+        p45 = regex_engine.compile(r'Conservative-allocation:\s+(?P<conservative_allocation>disabled|enabled)$')
 
         # Map-cache FIB updates:                  established
-        p46 = re.compile(r'Map-cache FIB updates:\s+(?P<fib_updates>\S+)$')
+        p46 = regex_engine.compile(r'Map-cache FIB updates:\s+(?P<fib_updates>\S+)$')
 
         # Persistent map-cache:              disabled
-        p47 = re.compile(r'Persistent +map\-cache *:'
-                         r' +(?P<persistent>enabled|disabled)$')
+        p47 = regex_engine.compile(r'Persistent +map\-cache *:'
+                                   r' +(?P<persistent>enabled|disabled)$')
 
         # Map-cache activity-tracking:            enabled
-        p48 = re.compile(r'Map-cache activity-tracking:\s+(?P<activity_tracking>\S+)$')
+        p48 = regex_engine.compile(r'Map-cache activity-tracking:\s+(?P<activity_tracking>\S+)$')
 
         # Total database mapping size:            2
-        p49 = re.compile(r'Total database mapping size:\s+(?P<total_database_mapping>\d+)')
+        p49 = regex_engine.compile(r'Total database mapping size:\s+(?P<total_database_mapping>\d+)')
 
         # static database size/limit:             0/4294967295
-        p50 = re.compile(r'static database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p50 = regex_engine.compile(r'static database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # dynamic database size/limit:            2/4294967295
-        p51 = re.compile(r'dynamic database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p51 = regex_engine.compile(r'dynamic database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # route-import database size/limit:       0/5000
-        p52 = re.compile(r'route-import database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p52 = regex_engine.compile(r'route-import database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # import-site-reg database size/limit:    0/4294967295
-        p53 = re.compile(r'import-site-reg database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p53 = regex_engine.compile(r'import-site-reg database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # dummy database size/limit:              0/4294967295
-        p54 = re.compile(r'dummy database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p54 = regex_engine.compile(r'dummy database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # import-publication database size/limit: 0/4294967295
-        p55 = re.compile(r'import-publication database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p55 = regex_engine.compile(r'import-publication database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # proxy database size:                    0
-        p56 = re.compile(r'proxy database size:\s+(?P<size>\d+)$')
+        p56 = regex_engine.compile(r'proxy database size:\s+(?P<size>\d+)$')
 
         # Inactive (deconfig/away) size:          0
-        p57 = re.compile(r'Inactive \(deconfig\/away\) size:\s+(?P<size>\d+)$')
+        p57 = regex_engine.compile(r'Inactive \(deconfig\/away\) size:\s+(?P<size>\d+)$')
 
         # Map-cache:                              0
-        p58 = re.compile(r'Map-cache:\s+(?P<map_cache>\d+)')
+        p58 = regex_engine.compile(r'Map-cache:\s+(?P<map_cache>\d+)')
 
         # RIB:                                    0
-        p59 = re.compile(r'RIB:\s+(?P<rib>\d+)')
+        p59 = regex_engine.compile(r'RIB:\s+(?P<rib>\d+)')
 
         # Database:                               0
-        p60 = re.compile(r'Database:\s+(?P<database>\d+)')
+        p60 = regex_engine.compile(r'Database:\s+(?P<database>\d+)')
 
         # Prefix-list:                            0
-        p61 = re.compile(r'Prefix-list:\s+(?P<prefix_list>\d+)')
+        p61 = regex_engine.compile(r'Prefix-list:\s+(?P<prefix_list>\d+)')
 
         #   Vlan100: 10.229.11.1 (Loopback0)
-        p62 = re.compile(r'Vlan(?P<vlans>(\d+))\: +(?P<address>([0-9\.\:]+)) +'
-                         r'\((?P<interface>(\S+))\)$')
+        p62 = regex_engine.compile(r'Vlan(?P<vlans>(\d+))\: +(?P<address>([0-9\.\:]+)) +'
+                                   r'\((?P<interface>(\S+))\)$')
 
         # Encapsulation type:                       vxlan
-        p63 = re.compile(r'Encapsulation type:\s+(?P<encapsulation_type>\S+)$')
+        p63 = regex_engine.compile(r'Encapsulation type:\s+(?P<encapsulation_type>\S+)$')
 
         # Ethernet Fast Detection:                  enabled
         # Ethernet Fast Detection:                  disabled
-        p64 = re.compile(r'^Ethernet Fast Detection:\s+(?P<eth_fast_detect>enabled|disabled)$')
+        p64 = regex_engine.compile(r'^Ethernet Fast Detection:\s+(?P<eth_fast_detect>enabled|disabled)$')
 
         count = 0
         publishers_parsing_finished = False
@@ -1199,7 +1197,7 @@ class ShowLispSubscriberSuperParser(ShowLispSubscriberSchema):
             out = self.device.expect(
                 [r'Instance ID:\s+\S+'],
                 timeout=2).match_output
-            p0 = re.compile(r'^Instance ID:\s+(?P<instance_id>\d+)$')
+            p0 = regex_engine.compile(r'^Instance ID:\s+(?P<instance_id>\d+)$')
             group = p0.match(out)
             instance_id = int(group['instance_id'])
         else:
@@ -1210,18 +1208,18 @@ class ShowLispSubscriberSuperParser(ShowLispSubscriberSchema):
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 193
         # Output for router lisp 2 instance-id 101
-        p1 = re.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>(\d+))'
-                        r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>(\d+))'
+                                  r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
         # Entries total 1
-        p2 = re.compile(r'^Entries\s+total\s+(?P<entries>\d+)$')
+        p2 = regex_engine.compile(r'^Entries\s+total\s+(?P<entries>\d+)$')
 
         # 66.66.66.66:54087         IID
         # 77.77.77.77:54123         IID
         # 100.110.110.110:45676     IID        200 , 10
         # 2001:10:10:10::10.49787   IID        -
-        p3 = re.compile(r'^(?P<subscriber_ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'
-                        r'|[a-fA-F\d\:]+):?\.?(?P<port>\d+)\s+(?P<type>\S+)'
-                        r'(\s+(?P<affinity_id_x>\d+))?(\s+,\s+(?P<affinity_id_y>\d+))?')
+        p3 = regex_engine.compile(r'^(?P<subscriber_ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'
+                                  r'|[a-fA-F\d\:]+):?\.?(?P<port>\d+)\s+(?P<type>\S+)'
+                                  r'(\s+(?P<affinity_id_x>\d+))?(\s+,\s+(?P<affinity_id_y>\d+))?')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6,13 +6,13 @@ IOSXE parsers for the following show commands:
 '''
 
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ======================================================
 # Schema for 'show monitor capture buffer detailed '
@@ -179,123 +179,123 @@ class ShowMonitorCaptureBufferDetailed(ShowMonitorCaptureBufferDetailedSchema):
         section_name = None
 
         # Frame 1: 1496 bytes on wire (11968 bits), 80 bytes captured (640 bits) on interface /tmp/epc_ws/wif_to_ts_pipe, id 0
-        p0 = re.compile(r'^Frame (?P<frame_num>\d+): +(?P<bytes_on_wire>\d+)[\s\w]+\((?P<bits_1>[\w\s]+)\)'
-                        r'\,\s+(?P<bytes_captured>\d+)[\s\w]+\((?P<bits_2>[\w\s]+)\).*$')
+        p0 = regex_engine.compile(r'^Frame (?P<frame_num>\d+): +(?P<bytes_on_wire>\d+)[\s\w]+\((?P<bits_1>[\w\s]+)\)'
+                                  r'\,\s+(?P<bytes_captured>\d+)[\s\w]+\((?P<bits_2>[\w\s]+)\).*$')
 
         # Frame Number: 1
         # Capture Length: 80 bytes (640 bits)
         # [Frame is marked: False]
         # Encapsulation type: Ethernet [1]
-        p1 = re.compile(r'^(?P<pattern>[a-zA-Z \[]+): +(?P<value>[\w\s\(\)\:\,\.\/\]\[]+)$')
+        p1 = regex_engine.compile(r'^(?P<pattern>[a-zA-Z \[]+): +(?P<value>[\w\s\(\)\:\,\.\/\]\[]+)$')
 
         # Internet Protocol Version 4, Src: 49.1.1.2, Dst: 91.4.1.1
-        p2 = re.compile(r'^Internet Protocol Version 4, Src:+\s+(?P<source_ipv4>[\d\.]+)+, Dst:+\s+(?P<destination_ipv4>[\.\d]+)$')
+        p2 = regex_engine.compile(r'^Internet Protocol Version 4, Src:+\s+(?P<source_ipv4>[\d\.]+)+, Dst:+\s+(?P<destination_ipv4>[\.\d]+)$')
 
         # Ethernet II, Src: fa:88:8e:78:00:02 (fa:88:8e:78:00:02), Dst: 00:a7:42:86:06:bf (00:a7:42:86:06:bf)
-        p3 = re.compile(r'^Ethernet II, Src:+\s+(?P<source_eth>[\:\w\)\( ]+)+, Dst:+\s+(?P<destination_eth>[\:\w\(\) ]+)$')
+        p3 = regex_engine.compile(r'^Ethernet II, Src:+\s+(?P<source_eth>[\:\w\)\( ]+)+, Dst:+\s+(?P<destination_eth>[\:\w\(\) ]+)$')
 
         # Transmission Control Protocol, Src Port: 0, Dst Port: 0, Seq: 1, Len: 942
-        p4 = re.compile(r'^Transmission Control Protocol, Src Port:+\s+(?P<tcp_source_port>[\d]+)+, Dst Port:+\s+(?P<tcp_destination_port>[\d]+)+, Seq:+\s+(?P<tcp_seq_num>[\d]+)+, Len:+\s+(?P<tcp_len>[\d]+)$')
+        p4 = regex_engine.compile(r'^Transmission Control Protocol, Src Port:+\s+(?P<tcp_source_port>[\d]+)+, Dst Port:+\s+(?P<tcp_destination_port>[\d]+)+, Seq:+\s+(?P<tcp_seq_num>[\d]+)+, Len:+\s+(?P<tcp_len>[\d]+)$')
 
         # User Datagram Protocol, Src Port: 65473, Dst Port: 4789
-        p5 = re.compile(r'^User Datagram Protocol, Src Port:+\s+(?P<udp_source_port>[\d]+)+, Dst Port:+\s+(?P<udp_destination_port>[\d]+)$')
+        p5 = regex_engine.compile(r'^User Datagram Protocol, Src Port:+\s+(?P<udp_source_port>[\d]+)+, Dst Port:+\s+(?P<udp_destination_port>[\d]+)$')
 
         # Internet Protocol Version 6, Src: 2000:10::10, Dst: 2000:14::20
-        p6 = re.compile(r'^Internet Protocol Version 6, Src:+\s+(?P<source_ipv6>[\d\:]+)+, Dst:+\s+(?P<destination_ipv6>[\:\d]+)$')
+        p6 = regex_engine.compile(r'^Internet Protocol Version 6, Src:+\s+(?P<source_ipv6>[\d\:]+)+, Dst:+\s+(?P<destination_ipv6>[\:\d]+)$')
 
         # VXLAN Network Identifier (VNI): 50000
-        p7 = re.compile(r'^VXLAN +Network +Identifier +\(VNI+\): +(?P<vxlan_id>(\d+))$')
+        p7 = regex_engine.compile(r'^VXLAN +Network +Identifier +\(VNI+\): +(?P<vxlan_id>(\d+))$')
 
         #     1010 00.. = Differentiated Services Codepoint: Class Selector 5 (40)
-        p8 = re.compile(r'^[\S\s]+\s+= Differentiated Services Codepoint: [\s\S]+ \((?P<dscp_value>\d+)\)$')
+        p8 = regex_engine.compile(r'^[\S\s]+\s+= Differentiated Services Codepoint: [\s\S]+ \((?P<dscp_value>\d+)\)$')
 
         # Cisco NetFlow/IPFIX
-        p9 = re.compile(r'^Cisco NetFlow\/IPFIX$')
+        p9 = regex_engine.compile(r'^Cisco NetFlow\/IPFIX$')
 
         # Version: 9
-        p10 = re.compile(r'^Version: (?P<version>\d+)$')
+        p10 = regex_engine.compile(r'^Version: (?P<version>\d+)$')
 
         # Count: 2
-        p11 = re.compile(r'^Count: (?P<count>\d+)$')
+        p11 = regex_engine.compile(r'^Count: (?P<count>\d+)$')
 
         # SysUptime: 589785.000000000 seconds
-        p12 = re.compile(r'^SysUptime: (?P<sys_uptime>.+)$')
+        p12 = regex_engine.compile(r'^SysUptime: (?P<sys_uptime>.+)$')
 
         # Timestamp: Jul  9, 2024 06:14:46.000000000 IST
-        p13 = re.compile(r'^Timestamp: (?P<timestamp>.+)$')
+        p13 = regex_engine.compile(r'^Timestamp: (?P<timestamp>.+)$')
 
         # CurrentSecs: 1720485886
-        p14 = re.compile(r'^CurrentSecs: (?P<current_secs>\d+)$')
+        p14 = regex_engine.compile(r'^CurrentSecs: (?P<current_secs>\d+)$')
 
         # FlowSequence: 24
-        p15 = re.compile(r'^FlowSequence: (?P<flow_sequence>\d+)$')
+        p15 = regex_engine.compile(r'^FlowSequence: (?P<flow_sequence>\d+)$')
 
         # SourceId: 16777217
-        p16 = re.compile(r'^SourceId: (?P<source_id>\d+)$')
+        p16 = regex_engine.compile(r'^SourceId: (?P<source_id>\d+)$')
 
         # FlowSet 1 [id=0] (Data Template): 257
         # FlowSet 2 [id=257] (46 flows)
-        p17 = re.compile(r'^FlowSet (?P<flowset_num>\d+) \[id=(?P<id>\d+)\].*$')
+        p17 = regex_engine.compile(r'^FlowSet (?P<flowset_num>\d+) \[id=(?P<id>\d+)\].*$')
 
         # FlowSet Id: Data Template (V9) (0)
-        p18 = re.compile(r'^FlowSet Id: (?P<flowset_id>.+)$')
+        p18 = regex_engine.compile(r'^FlowSet Id: (?P<flowset_id>.+)$')
 
         # FlowSet Length: 44
-        p19 = re.compile(r'^FlowSet Length: (?P<flowset_length>\d+)$')
+        p19 = regex_engine.compile(r'^FlowSet Length: (?P<flowset_length>\d+)$')
 
         # Template (Id = 257, Count = 9)
-        p20 = re.compile(r'^Template \(Id \= \d+\, Count \= \d+\)$')
+        p20 = regex_engine.compile(r'^Template \(Id \= \d+\, Count \= \d+\)$')
 
         # Template Id: 257
-        p21 = re.compile(r'^Template Id: (?P<template_id>\d+)$')
+        p21 = regex_engine.compile(r'^Template Id: (?P<template_id>\d+)$')
 
         # Field Count: 9
-        p22 = re.compile(r'^Field Count: (?P<field_count>\d+)$')
+        p22 = regex_engine.compile(r'^Field Count: (?P<field_count>\d+)$')
 
         # Field (1/9): IP_SRC_ADDR
-        p23 = re.compile(r'^Field \((?P<field_id>\d+)\/\d+\).*$')
+        p23 = regex_engine.compile(r'^Field \((?P<field_id>\d+)\/\d+\).*$')
 
         # Type: IP_SRC_ADDR (8)
-        p24 = re.compile(r'^Type: (?P<type>.+)$')
+        p24 = regex_engine.compile(r'^Type: (?P<type>.+)$')
 
         # Length: 4
-        p25 = re.compile(r'^Length: (?P<length>\d+)$')
+        p25 = regex_engine.compile(r'^Length: (?P<length>\d+)$')
 
         # [Template Frame: 7291]
-        p26 = re.compile(r'^\[Template Frame: (?P<template_frame>\d+)\]$')
+        p26 = regex_engine.compile(r'^\[Template Frame: (?P<template_frame>\d+)\]$')
 
         # Flow 5
-        p27 = re.compile(r'^Flow (?P<flow_id>\d+)$')
+        p27 = regex_engine.compile(r'^Flow (?P<flow_id>\d+)$')
 
         # SrcAddr: 6.6.6.8
-        p28 = re.compile(r'^SrcAddr: (?P<src_addr>[\d.]+)$')
+        p28 = regex_engine.compile(r'^SrcAddr: (?P<src_addr>[\d.]+)$')
 
         # DstAddr: 15.15.15.8
-        p29 = re.compile(r'^DstAddr: (?P<dst_addr>[\d.]+)$')
+        p29 = regex_engine.compile(r'^DstAddr: (?P<dst_addr>[\d.]+)$')
 
         # DstPort: 60
-        p30 = re.compile(r'^DstPort: (?P<dst_port>\d+)$')
+        p30 = regex_engine.compile(r'^DstPort: (?P<dst_port>\d+)$')
 
         # TCP Flags: 0x00
-        p31 = re.compile(r'^TCP Flags: (?P<tcp_flags>\w+)$')
+        p31 = regex_engine.compile(r'^TCP Flags: (?P<tcp_flags>\w+)$')
 
         # Octets: 2470
-        p32 = re.compile(r'^Octets: (?P<octets>\d+)$')
+        p32 = regex_engine.compile(r'^Octets: (?P<octets>\d+)$')
 
         # Packets: 5
-        p33 = re.compile(r'^Packets: (?P<packets>\d+)$')
+        p33 = regex_engine.compile(r'^Packets: (?P<packets>\d+)$')
 
         # IPVersion: 4
-        p34 = re.compile(r'^IPVersion: (?P<ipversion>\d+)$')
+        p34 = regex_engine.compile(r'^IPVersion: (?P<ipversion>\d+)$')
 
         # IP ToS: 0x00
-        p35 = re.compile(r'^IP ToS: (?P<ip_tos>\w+)$')
+        p35 = regex_engine.compile(r'^IP ToS: (?P<ip_tos>\w+)$')
 
         # Protocol: TCP (6)
-        p36 = re.compile(r'^Protocol: (?P<protocol>.+)$')
+        p36 = regex_engine.compile(r'^Protocol: (?P<protocol>.+)$')
 
         # Padding: 0000
-        p37 = re.compile(r'^Padding: (?P<padding>\d+)$')
+        p37 = regex_engine.compile(r'^Padding: (?P<padding>\d+)$')
 
         # loop to split lines of output
         for line in output.splitlines():
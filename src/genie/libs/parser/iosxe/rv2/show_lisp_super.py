@@ -1,12 +1,10 @@
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
                                                 ListOf,
                                                 Optional,
                                                 Or)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowLispPublicationPrefixSchema(MetaParser):
@@ -90,58 +88,58 @@ class ShowLispPublicationPrefixSuperParser(ShowLispPublicationPrefixSchema):
         count = 0
 
         # Publication Information for LISP 0 EID-table vrf red (IID 4100)
-        p1 = re.compile(r"^Publication\s+Information\s+for\s+LISP\s+"
-                        r"(?P<lisp_id>\d+)\s+EID-table\s+vrf\s+\S+\s+"
-                        r"\(IID\s+(?P<instance_id>\d+)\)$")
+        p1 = regex_engine.compile(r"^Publication\s+Information\s+for\s+LISP\s+"
+                                  r"(?P<lisp_id>\d+)\s+EID-table\s+vrf\s+\S+\s+"
+                                  r"\(IID\s+(?P<instance_id>\d+)\)$")
 
         # EID-prefix: 192.168.1.71/32
         # EID-prefix: 2001:172:168:1::/64
-        p2 = re.compile(r"^EID-prefix:\s+(?P<eid_prefixes>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}"
-                        r"|[a-fA-F\d\:]+\/\d{1,3})|([a-fA-F\d\:]+\/\d{1,3}))$")
+        p2 = regex_engine.compile(r"^EID-prefix:\s+(?P<eid_prefixes>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}"
+                                  r"|[a-fA-F\d\:]+\/\d{1,3})|([a-fA-F\d\:]+\/\d{1,3}))$")
 
         # First published:      03:05:56
-        p3 = re.compile(r"^First\s+published:\s+(?P<first_published>\S+)$")
+        p3 = regex_engine.compile(r"^First\s+published:\s+(?P<first_published>\S+)$")
 
         # Last published:      03:05:56
-        p4 = re.compile(r"^Last\s+published:\s+(?P<last_published>\S+)$")
+        p4 = regex_engine.compile(r"^Last\s+published:\s+(?P<last_published>\S+)$")
 
         # State:                complete
-        p5 = re.compile(r"^State:\s+(?P<state>\S+)$")
+        p5 = regex_engine.compile(r"^State:\s+(?P<state>\S+)$")
 
         # Exported to:          map-cache
         # Exported to:          local-eid, map-cache
-        p6 = re.compile(r"^Exported\s+to:\s+(?P<exported_to>[\s\S]+)$")
+        p6 = regex_engine.compile(r"^Exported\s+to:\s+(?P<exported_to>[\s\S]+)$")
 
         # Publisher 100.100.100.100:4342, last published 16:02:47, TTL never
         # Publisher 2001:13:13:13::13.4342, last published 00:03:35, TTL never, Expires: never
-        p7 = re.compile(r"^Publisher\s+(?P<publishers>((\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})?"
-                        r"|([a-fA-F\d\:]+)))?\.?\:?(?P<port>\d+),\s+last\s+published\s+"
-                        r"(?P<last_published>\S+),\s+TTL\s+(?P<ttl>\w+)")
+        p7 = regex_engine.compile(r"^Publisher\s+(?P<publishers>((\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})?"
+                                  r"|([a-fA-F\d\:]+)))?\.?\:?(?P<port>\d+),\s+last\s+published\s+"
+                                  r"(?P<last_published>\S+),\s+TTL\s+(?P<ttl>\w+)")
 
         # publisher epoch 1, entry epoch 1
-        p8 = re.compile(r"^publisher\s+epoch\s+(?P<publisher_epoch>\d+),"
-                        r"\s+entry\s+epoch\s+(?P<entry_epoch>\d+)")
+        p8 = regex_engine.compile(r"^publisher\s+epoch\s+(?P<publisher_epoch>\d+),"
+                                  r"\s+entry\s+epoch\s+(?P<entry_epoch>\d+)")
 
         # entry-state complete
-        p9 = re.compile(r"^entry-state\s+(?P<entry_state>\S+)")
+        p9 = regex_engine.compile(r"^entry-state\s+(?P<entry_state>\S+)")
 
         # routing table tag 101
-        p10 = re.compile(r"^routing\s+table\s+tag\s+(?P<routing_tag>\d+)")
+        p10 = regex_engine.compile(r"^routing\s+table\s+tag\s+(?P<routing_tag>\d+)")
 
         # xTR-ID 0x790800FF-0x426D6D8E-0xC6C5F60C-0xB4386D22
-        p11 = re.compile(r"^xTR-ID\s+(?P<xtr_id>\S+)")
+        p11 = regex_engine.compile(r"^xTR-ID\s+(?P<xtr_id>\S+)")
 
         # site-ID unspecified
-        p12 = re.compile(r"^site-ID\s+(?P<site_id>\S+)")
+        p12 = regex_engine.compile(r"^site-ID\s+(?P<site_id>\S+)")
 
         # Domain-ID unset
-        p13 = re.compile(r"^Domain-ID\s+(?P<domain_id>\S+)")
+        p13 = regex_engine.compile(r"^Domain-ID\s+(?P<domain_id>\S+)")
 
         # Multihoming-ID unspecified
-        p14 = re.compile(r"^Multihoming-ID\s+(?P<multihoming_id>\S+)")
+        p14 = regex_engine.compile(r"^Multihoming-ID\s+(?P<multihoming_id>\S+)")
 
         # Publication-mode  no-extranet
-        p14_1 = re.compile(r'^Publish-mode\s+(?P<publish_mode>.+\S)')
+        p14_1 = regex_engine.compile(r'^Publish-mode\s+(?P<publish_mode>.+\S)')
 
         # Merge Locator Information
         # * Indicates the selected rlocs used by consumers
@@ -151,43 +149,43 @@ class ShowLispPublicationPrefixSuperParser(ShowLispPublicationPrefixSchema):
         # 100.90.90.90    20/90   up        -          ext     100.77.77.77
         # 100::88:88:88   20/90   up        -          0       100.77.77.77
         # 100::88:88:88*  20/90   up        -          0       100.77.77.77
-        p15 = re.compile(r"^(?P<merged_locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))"
-                         r"(?P<selected>\*)?\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)"
-                         r"\s+(?P<encap_iid>\S+)\s+(?P<rdp_len>(\d+|\-|ext))\s+"
-                         r"(?P<src_add>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))$")
+        p15 = regex_engine.compile(r"^(?P<merged_locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))"
+                                   r"(?P<selected>\*)?\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)"
+                                   r"\s+(?P<encap_iid>\S+)\s+(?P<rdp_len>(\d+|\-|ext))\s+"
+                                   r"(?P<src_add>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))$")
 
         # Locator        Pri/Wgt  State     Encap-IID  RDP
         # 100.88.88.88   100/50   up        -          [-]
-        p16 = re.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                         r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)"
-                         r"\s+(?P<rdp>\[[ 0-9\-]+\])$")
+        p16 = regex_engine.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                   r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)"
+                                   r"\s+(?P<rdp>\[[ 0-9\-]+\])$")
 
         # Locator        Pri/Wgt  State     Encap-IID   Domain-ID/MH-ID   Metric
         # 100.88.88.88   100/50   up        -                   1/1       44
         # 2001:2:2:2::2   50/50   up        -                   1/1       44
         # 2001:2:2:2::2   50/50   up        -                   1/1       -
-        p17 = re.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                         r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)"
-                         r"\s+(?P<domain_id>\d+)\/(?P<multihoming_id>\d+)\s+(?P<metric>[\d-]+)$")
+        p17 = regex_engine.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                   r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)"
+                                   r"\s+(?P<domain_id>\d+)\/(?P<multihoming_id>\d+)\s+(?P<metric>[\d-]+)$")
 
         # Affinity-id: 20 , 20
-        p18 = re.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
+        p18 = regex_engine.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
 
         # Instance ID:                              4100
-        p19 = re.compile(r"^\s+Instance\s+ID:\s+(?P<inst_id>\S+)")
+        p19 = regex_engine.compile(r"^\s+Instance\s+ID:\s+(?P<inst_id>\S+)")
 
         # Publisher 100.100.100.100:4342
-        p20 = re.compile(r"^Publisher\s+(?P<publishers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
-                        r":(?P<port>\d+)$")
+        p20 = regex_engine.compile(r"^Publisher\s+(?P<publishers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
+                                  r":(?P<port>\d+)$")
 
         # Publisher 100::100:100:100.4342
-        p21 = re.compile(r"^Publisher\s+(?P<publishers>[a-fA-F\d\:]+)\.(?P<port>\d+)$")
+        p21 = regex_engine.compile(r"^Publisher\s+(?P<publishers>[a-fA-F\d\:]+)\.(?P<port>\d+)$")
 
         # last published 16:02:47, TTL never
-        p22 = re.compile(r"^last\s+published\s+(?P<last_published>\S+),\s+TTL\s+(?P<ttl>\w+)")
+        p22 = regex_engine.compile(r"^last\s+published\s+(?P<last_published>\S+),\s+TTL\s+(?P<ttl>\w+)")
 
         # SGT 100
-        p23 = re.compile(r"^SGT\s+(?P<sgt>\d+)$")
+        p23 = regex_engine.compile(r"^SGT\s+(?P<sgt>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
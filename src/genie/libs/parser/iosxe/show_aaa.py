@@ -12,7 +12,6 @@
      * show aaa dead-criteria radius server-name {server_name}
 """
 #python
-import re
 import logging
 logger = logging.getLogger(__name__)
 
@@ -20,6 +19,9 @@ logger = logging.getLogger(__name__)
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema,Any,Optional,Or,And,Default,Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==================================================
 # Schema for 'show AAA Server'
@@ -195,98 +197,98 @@ class ShowAAServers(ShowAAServersSchema):
         consedict = {}
 
         # RADIUS: id 9, priority 1, host 11.15.24.174, auth-port 1812, acct-port 1813, hostname ISE-RAD
-        p1a = re.compile(r'(^.*)\:\s+id\s+(?P<id>\d+)\,\s+priority\s+(?P<priority>(\d+))\,\s+host\s+(?P<host>(.*))\,\s+auth\-port\s+(?P<auth_port>(\d+))\,\s+acct\-port\s+(?P<acct_port>(\d+))\,\s*hostname\s*(?P<hostname>(.*))$')
+        p1a = regex_engine.compile(r'(^.*)\:\s+id\s+(?P<id>\d+)\,\s+priority\s+(?P<priority>(\d+))\,\s+host\s+(?P<host>(.*))\,\s+auth\-port\s+(?P<auth_port>(\d+))\,\s+acct\-port\s+(?P<acct_port>(\d+))\,\s*hostname\s*(?P<hostname>(.*))$')
 
         # RADIUS: id 9, priority 1, host 11.15.24.174, RADSEC-port 1812,hostname ISE-RAD
-        p1b = re.compile(r'(.*)\:\s+id\s+(?P<id>\d+)\,\s+priority\s+(?P<priority>(\d+))\,\s+host\s+(?P<host>(.*))\,\s*(RADSEC\-port\s*(?P<radsec_port>(\d+)))\,\s*hostname\s+(?P<hostname>(.*))$')
+        p1b = regex_engine.compile(r'(.*)\:\s+id\s+(?P<id>\d+)\,\s+priority\s+(?P<priority>(\d+))\,\s+host\s+(?P<host>(.*))\,\s*(RADSEC\-port\s*(?P<radsec_port>(\d+)))\,\s*hostname\s+(?P<hostname>(.*))$')
 
         # RADIUS: id 9, priority 1, host 11.15.24.174, auth-port 1812, acct-port 1813
-        p1c = re.compile(r'(^.*)\:\s+id\s+(?P<id>\d+)\,\s+priority\s+(?P<priority>(\d+))\,\s+host\s+(?P<host>(.*))\,\s+auth\-port\s+(?P<auth_port>(\d+))\,\s+acct\-port\s+(?P<acct_port>(\d+))$')
+        p1c = regex_engine.compile(r'(^.*)\:\s+id\s+(?P<id>\d+)\,\s+priority\s+(?P<priority>(\d+))\,\s+host\s+(?P<host>(.*))\,\s+auth\-port\s+(?P<auth_port>(\d+))\,\s+acct\-port\s+(?P<acct_port>(\d+))$')
 
         # State: current UP, duration 294173s, previous duration 0s
-        p2 = re.compile(r'(^\s*)(State)\:\s+current\s+(?P<current>(.*))\,\s+duration\s+(?P<duration>(.*))\,\s+previous\s+duration\s+(?P<previous_duration>(.*))')
+        p2 = regex_engine.compile(r'(^\s*)(State)\:\s+current\s+(?P<current>(.*))\,\s+duration\s+(?P<duration>(.*))\,\s+previous\s+duration\s+(?P<previous_duration>(.*))')
 
         # Dead: total time 0s, count 0
-        p3 = re.compile(r'((.*)Dead)\:\s+total\s+time\s+(?P<total_time>(.*))\,\s+count\s+(?P<count>(.*))$')
+        p3 = regex_engine.compile(r'((.*)Dead)\:\s+total\s+time\s+(?P<total_time>(.*))\,\s+count\s+(?P<count>(.*))$')
 
         # Platform State from SMD: current UP, duration 4406s, previous duration 0s
-        p4 = re.compile(r'(Platform)\s(State)\s+from\s*(.*)\:\s+current\s+(?P<current>(.*))\,\s+duration\s+(?P<duration>(.*))\,\s+previous\s+duration\s+(?P<previous_duration>(.*))$')
+        p4 = regex_engine.compile(r'(Platform)\s(State)\s+from\s*(.*)\:\s+current\s+(?P<current>(.*))\,\s+duration\s+(?P<duration>(.*))\,\s+previous\s+duration\s+(?P<previous_duration>(.*))$')
 
         # Platform State from WNCD (1) : current UP
-        p5 = re.compile(r'Platform\s(State)\s+from\s*(.*)\s+\((\d+)\)\s+\:\s+current\s+(?P<current>(\w+))$')
+        p5 = regex_engine.compile(r'Platform\s(State)\s+from\s*(.*)\s+\((\d+)\)\s+\:\s+current\s+(?P<current>(\w+))$')
 
         # Quarantined: No
-        p6 = re.compile(r'^Quarantined\:\s+(?P<quarantined>(No|Yes))$')
+        p6 = regex_engine.compile(r'^Quarantined\:\s+(?P<quarantined>(No|Yes))$')
 
         # Authen: request 0, timeouts 0, failover 0, retransmission 0
-        p7 = re.compile(r'^(.*)\:\s+request\s+(?P<request>\d+)\,\s+timeouts\s+(?P<timeout>\d+)\,\s+failover\s+'
-                        r'(?P<failover>\d+)\,\s+retransmission\s+(?P<retransmission>\d+)$')
+        p7 = regex_engine.compile(r'^(.*)\:\s+request\s+(?P<request>\d+)\,\s+timeouts\s+(?P<timeout>\d+)\,\s+failover\s+'
+                                  r'(?P<failover>\d+)\,\s+retransmission\s+(?P<retransmission>\d+)$')
 
         # Response: accept 0, reject 0, challenge 0
-        p8 = re.compile(r'(Response):\s+accept\s+(?P<accept>\d+)\,\s+reject\s+(?P<reject>\d+)\,\s+challenge\s+(?P<challenge>\d+)$')
+        p8 = regex_engine.compile(r'(Response):\s+accept\s+(?P<accept>\d+)\,\s+reject\s+(?P<reject>\d+)\,\s+challenge\s+(?P<challenge>\d+)$')
 
         # Request: start 0, interim 0, stop 0
-        p9 = re.compile(r'(.+)\:\s+start\s+(?P<start>\d+)\,\s+interim\s+(?P<interim>\d+)\,\s+stop\s+(?P<stop>\d+)$')
+        p9 = regex_engine.compile(r'(.+)\:\s+start\s+(?P<start>\d+)\,\s+interim\s+(?P<interim>\d+)\,\s+stop\s+(?P<stop>\d+)$')
 
         # Response: unexpected 0, server error 0, incorrect 0, time 0ms
-        p10 = re.compile(r'(Response):\s+unexpected\s+(?P<unexpected>\d+)\,\s+server\s+error\s+'
-                         r'(?P<server_error>\d+)\,\s+incorrect\s+(?P<incorrect>\d+)\,\s+time+\s+(?P<time>(.*))$')
+        p10 = regex_engine.compile(r'(Response):\s+unexpected\s+(?P<unexpected>\d+)\,\s+server\s+error\s+'
+                                   r'(?P<server_error>\d+)\,\s+incorrect\s+(?P<incorrect>\d+)\,\s+time+\s+(?P<time>(.*))$')
 
         # Transaction: success 0, failure 0
-        p11 = re.compile(r'(Transaction)\:\s+success\s+(?P<success>\d+)\,\s+failure\s+(?P<failure>\d+)$')
+        p11 = regex_engine.compile(r'(Transaction)\:\s+success\s+(?P<success>\d+)\,\s+failure\s+(?P<failure>\d+)$')
 
         # Throttled: transaction 0, timeout 0, failure 0
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'(Throttled)\:\s+transaction\s+(?P<transaction>\d+)\,\s+timeout\s+(?P<timeout>\d+)\,\s+failure\s+(?P<failure>\d+)$')
 
         # Malformed responses: 0
-        p13 = re.compile(r'Malformed\s+responses\:\s+(?P<malformed_responses>\d+)$')
+        p13 = regex_engine.compile(r'Malformed\s+responses\:\s+(?P<malformed_responses>\d+)$')
 
         # Bad authenticators: 0
-        p14 = re.compile(r'Bad\s+authenticators\:\s+(?P<bad_authenticators>\d+)$')
+        p14 = regex_engine.compile(r'Bad\s+authenticators\:\s+(?P<bad_authenticators>\d+)$')
 
         # Dot1x transactions:
-        p15 = re.compile(r'(.*)\s+(transactions)\:$')
+        p15 = regex_engine.compile(r'(.*)\s+(transactions)\:$')
 
         # Response: total responses: 0, avg response time: 0ms
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r'(Response)\:\s+total\s+responses\:\s+(?P<total_responses>\d+)\,\s+avg\s+response\s+time\:\s+(?P<avg_response_time>(\w+))$')
 
         # Transaction: timeouts 0, failover 0
-        p17 = re.compile(r'(Transaction)\:\s+timeouts\s+(?P<timeouts>\d+)\,\s+failover\s+(?P<failover>\d+)$')
+        p17 = regex_engine.compile(r'(Transaction)\:\s+timeouts\s+(?P<timeouts>\d+)\,\s+failover\s+(?P<failover>\d+)$')
 
         # Transaction: total 0, success 0, failure 0
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r'(Transaction)\:\s+total\s+(?P<total>\d+)\,\s+success\s+(?P<success>\d+)\,\s*failure\s*(?P<failure>\d+)$')
 
         # Elapsed time since counters last cleared: 1h13m
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r'(Elapsed)\s+time\s+since\s+counters\s+last\s+cleared\:\s+(?P<elapsed_time>(\w+))$')
 
         # Estimated Outstanding Access Transactions: 0
-        p20 = re.compile(r'(Estimated)\s+(.*)\s+(.*)\s+(Transactions)\:\s+(\d+)$')
+        p20 = regex_engine.compile(r'(Estimated)\s+(.*)\s+(.*)\s+(Transactions)\:\s+(\d+)$')
 
         # Maximum Throttled Transactions: access 0, accounting 0
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r'(Maximum)\s+(.+)\s+(Transactions)\:\s+(access)\s+(?P<access>\d+)\,\s+(accounting)\s+(?P<accounting>\d+)$')
 
         # Consecutive Timeouts: total 0
         # Consecutive Response Failures: total 0
-        p22 = re.compile(r'(Consecutive)\s+(.+\s*.*)\:\s+(total)\s+(?P<total>\d+)$')
+        p22 = regex_engine.compile(r'(Consecutive)\s+(.+\s*.*)\:\s+(total)\s+(?P<total>\d+)$')
 
         # SMD Platform : max 0, current 0 total 0
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r'(.+)\s+(Platform)\s*\:\s+(max)\s+(?P<max>\d+)\,\s+(current)\s+(?P<current>\d+)\s+(total)\s+(?P<total>\d+)$')
 
         # Requests per minute past 24 hours:
-        p24 = re.compile(r'(Requests)\s+(per)\s+(minute)\s+(past)\s+(\d+)\s+(hours)\:$')
+        p24 = regex_engine.compile(r'(Requests)\s+(per)\s+(minute)\s+(past)\s+(\d+)\s+(hours)\:$')
 
         # high - 1 hours, 13 minutes ago: 0
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r'(.+)\s+\-\s+(?P<hours>\d+)\s+hours\,\s+(?P<minutes>\d+)\s+minutes\s+ago\:\s*(?P<ago>\d+)$')
 
         # average: 0
-        p26 = re.compile(r'(average)\:\s*(?P<average>\d+)$')
+        p26 = regex_engine.compile(r'(average)\:\s*(?P<average>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -640,108 +642,108 @@ class ShowAAAUserAll(ShowAAAUserSchema):
         general = ''
 
         # Unique id 13 is currently in use.
-        p1 = re.compile(r'Unique\s+(id)\s+(\d+)\s+is\s+currently\s+in\s+use\.$')
+        p1 = regex_engine.compile(r'Unique\s+(id)\s+(\d+)\s+is\s+currently\s+in\s+use\.$')
 
         # No data for type 0
-        p2 = re.compile(r'(No)\s+(data)\s+for\s+(type)\s+(.*)$')
+        p2 = regex_engine.compile(r'(No)\s+(data)\s+for\s+(type)\s+(.*)$')
 
         # NET: Username=(n/a)
-        p3 = re.compile(r'(.*)\:\s+Username\=(?P<username>(.*))$')
+        p3 = regex_engine.compile(r'(.*)\:\s+Username\=(?P<username>(.*))$')
 
         # Session Id=0000137E Unique Id=00001388
-        p4 = re.compile(r'(Session)\s+Id\=(?P<session_id>(\w+))\s+(Unique)\s+(Id)\=(?P<unique_id>(\w+))')
+        p4 = regex_engine.compile(r'(Session)\s+Id\=(?P<session_id>(\w+))\s+(Unique)\s+(Id)\=(?P<unique_id>(\w+))')
 
         # Start Sent=0 Stop Only=N
-        p5 = re.compile(r'(Start)\s+(Sent)\=(?P<start_sent>\w+)\s+(Stop)\s+(Only)\=(?P<stop_only>\w+)')
+        p5 = regex_engine.compile(r'(Start)\s+(Sent)\=(?P<start_sent>\w+)\s+(Stop)\s+(Only)\=(?P<stop_only>\w+)')
 
         # stop_has_been_sent=N
-        p6 = re.compile(r'(stop)_(has)_(been)_(sent)\=(?P<stop_has_been_sent>\w+)')
+        p6 = regex_engine.compile(r'(stop)_(has)_(been)_(sent)\=(?P<stop_has_been_sent>\w+)')
 
         # Method List=0
-        p7 = re.compile(r'(Method)\s+(List)\=(?P<method_list>(.*))')
+        p7 = regex_engine.compile(r'(Method)\s+(List)\=(?P<method_list>(.*))')
 
         # Attribute list:
-        p8 = re.compile(r'^\s*(Attribute)\s+(list)\:')
+        p8 = regex_engine.compile(r'^\s*(Attribute)\s+(list)\:')
 
         # 7FB04002C9C8 0 00000001 session-id(408) 4 4990(137E)
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'(\w+)\s+(\d+)\s+(\d+)\s+(.*)\s+(\d+)\s+(.*)')
 
         # Accounting:
-        p10 = re.compile(r'(Accounting):')
+        p10 = regex_engine.compile(r'(Accounting):')
 
         # log=0x18001
-        p11 = re.compile(r'(log)\=(?P<log>\w+)')
+        p11 = regex_engine.compile(r'(log)\=(?P<log>\w+)')
 
         # Events recorded :
-        p12 = re.compile(r'(Events)\s+(recorded)\s+\:')
+        p12 = regex_engine.compile(r'(Events)\s+(recorded)\s+\:')
 
         # update method(s) :
-        p13 = re.compile(r'(update)\s+(method)\(s\)\s+\:')
+        p13 = regex_engine.compile(r'(update)\s+(method)\(s\)\s+\:')
 
         # NONE
-        p14 = re.compile(r'(NONE)')
+        p14 = regex_engine.compile(r'(NONE)')
 
         # update interval = 0
-        p15 = re.compile(r'(update)\s+(interval)\s+\=\s*(?P<update_interval>\d+)')
+        p15 = regex_engine.compile(r'(update)\s+(interval)\s+\=\s*(?P<update_interval>\d+)')
 
         # Outstanding Stop Records : 0
-        p16 = re.compile(r'(Outstanding)\s+(Stop)\s+(Records)\s+\:\s*(?P<outstanding_stop_records>(.*))')
+        p16 = regex_engine.compile(r'(Outstanding)\s+(Stop)\s+(Records)\s+\:\s*(?P<outstanding_stop_records>(.*))')
 
         # Dynamic attribute list:
-        p17 = re.compile(r'(Dynamic)\s+(attribute)\s+(list)\:')
+        p17 = regex_engine.compile(r'(Dynamic)\s+(attribute)\s+(list)\:')
 
         # Debg: No data available
-        p18 = re.compile(r'(\w+)\:\s+(No)\s+(data)\s+(available)')
+        p18 = regex_engine.compile(r'(\w+)\:\s+(No)\s+(data)\s+(available)')
 
         # Interface:
-        p19 = re.compile(r'(Interface)\:')
+        p19 = regex_engine.compile(r'(Interface)\:')
 
         # TTY Num = 0
-        p20 = re.compile(r'(TTY)\s+(Num)\s*\=\s*(?P<tty_num>(.*))')
+        p20 = regex_engine.compile(r'(TTY)\s+(Num)\s*\=\s*(?P<tty_num>(.*))')
 
         # Stop Received = 0
-        p21 = re.compile(r'(Stop)\s+(Received)\s*\=\s*(?P<stop_received>(.*))')
+        p21 = regex_engine.compile(r'(Stop)\s+(Received)\s*\=\s*(?P<stop_received>(.*))')
 
         # Byte/Packet Counts till Call Start:
-        p22 = re.compile(r'(Byte\/Packet)\s+(Counts)\s+(till)\s+(Call)\s+(Start)\:')
+        p22 = regex_engine.compile(r'(Byte\/Packet)\s+(Counts)\s+(till)\s+(Call)\s+(Start)\:')
 
         # Pre Paks  In = 0             Pre Paks  Out = 0
-        p23 = re.compile(r'(\w+)\s+(\w+)\s+(In)\s+\=\s+(\w+)\s+(\w+)\s+(\w+)\s+(Out)\s+\=\s+(\w+)')
+        p23 = regex_engine.compile(r'(\w+)\s+(\w+)\s+(In)\s+\=\s+(\w+)\s+(\w+)\s+(\w+)\s+(Out)\s+\=\s+(\w+)')
 
         # Byte/Packet Counts till Service Up:
-        p24 = re.compile(r'(Byte\/Packet)\s+(Counts)\s+(till)\s+(Service)\s+(Up)\:')
+        p24 = regex_engine.compile(r'(Byte\/Packet)\s+(Counts)\s+(till)\s+(Service)\s+(Up)\:')
 
         # Cumulative Byte/Packet Counts :
-        p25 = re.compile(r'(Cumulative)\s+(Byte\/Packet)\s+(Counts)\s+\:')
+        p25 = regex_engine.compile(r'(Cumulative)\s+(Byte\/Packet)\s+(Counts)\s+\:')
 
         #   Paks  In = 0             Paks  Out = 0
-        p26 = re.compile(r'(\w+)\s+(In)\s+\=\s+(\w+)\s+(\w+)\s+(Out)\s+\=\s+(\w+)')
+        p26 = regex_engine.compile(r'(\w+)\s+(In)\s+\=\s+(\w+)\s+(\w+)\s+(Out)\s+\=\s+(\w+)')
 
         # StartTime = 05:18:10 EDT Mar 22 2021
-        p27 = re.compile(r'(StartTime)\s+\=\s*(?P<starttime>\d+\:\d+\:\d+\s+\w+\s+\w+\s+\d+\s+\d+)')
+        p27 = regex_engine.compile(r'(StartTime)\s+\=\s*(?P<starttime>\d+\:\d+\:\d+\s+\w+\s+\w+\s+\d+\s+\d+)')
 
         # Component = Exec
-        p28 = re.compile(r'(Component)\s+\=\s*(?P<component>\w+)')
+        p28 = regex_engine.compile(r'(Component)\s+\=\s*(?P<component>\w+)')
 
         # Authen: service=LOGIN type=ASCII method=NONE
-        p29 = re.compile(
+        p29 = regex_engine.compile(
             r'(Authen)\:\s+service\=(?P<service>\w+)\s+type\=(?P<type>\w+)\s+method\=(?P<method>\w+)')
 
         # Service Profile: No Service Profile data.
-        p30 = re.compile(r'(\w+\s*\w*)\:\s+(No)\s+(\w+\s*\w*)\s+(data)\.')
+        p30 = regex_engine.compile(r'(\w+\s*\w*)\:\s+(No)\s+(\w+\s*\w*)\s+(data)\.')
 
         # General:
-        p31 = re.compile(r'(General)\:$')
+        p31 = regex_engine.compile(r'(General)\:$')
 
         # Unique Id = 00001388
-        p32 = re.compile(r'(Unique)\s+(Id)\s+=\s*(?P<unique_id>(.*))')
+        p32 = regex_engine.compile(r'(Unique)\s+(Id)\s+=\s*(?P<unique_id>(.*))')
 
         # Session Id = 0000137E
-        p33 = re.compile(r'(Session)\s+Id\s*\=\s*(?P<session_id>(.*))')
+        p33 = regex_engine.compile(r'(Session)\s+Id\s*\=\s*(?P<session_id>(.*))')
 
         # Attribute List:
-        p34 = re.compile(r'^\s*(Attribute)\s+(List)\:')
+        p34 = regex_engine.compile(r'^\s*(Attribute)\s+(List)\:')
 
         outs = iter(list(out.splitlines()))
         for line in outs:
@@ -1078,12 +1080,12 @@ class ShowAaaFqdnAll(ShowAaaFqdnAllSchema):
     def cli(self, output=None):
 
         # FQDN Name : fqdnname
-        p1 = re.compile(r'(^FQDN\s+Name)\s*:\s*(.*)')
+        p1 = regex_engine.compile(r'(^FQDN\s+Name)\s*:\s*(.*)')
         # Protocol  : RADIUS
         # IPv4s     : 11.15.24.213
         # IPv6s     :
         # Groups    : FQDNNAME radius
-        p2 = re.compile(r'(\w+)\s*:\s*(.*)')
+        p2 = regex_engine.compile(r'(\w+)\s*:\s*(.*)')
 
         ret_dict = {}
         fqdn_dict = {}
@@ -1164,16 +1166,16 @@ class ShowAAACacheGroup(ShowAAACacheGroupSchema):
         client_dict = {}
 
         # MAC ADDR:      000A.0A00.0500
-        mac_compile = re.compile(r'MAC ADDR:[\s\t]+(?P<macAddr>\w+\.\w+\.\w+)')
+        mac_compile = regex_engine.compile(r'MAC ADDR:[\s\t]+(?P<macAddr>\w+\.\w+\.\w+)')
         # Profile Name: regProfile
-        profile_compile = re.compile(r'Profile Name:[\s\t]+(?P<profile>[0-9A-Za-z\-\.]+)')
+        profile_compile = regex_engine.compile(r'Profile Name:[\s\t]+(?P<profile>[0-9A-Za-z\-\.]+)')
         # User Name:          test
         # User Name:        #ACSACL#-IP-legacy_TC5_permit_user_dot1x_103-63c4d37b
-        user_compile = re.compile(r'User Name:[\s\t]+(?P<user>.+)')
+        user_compile = regex_engine.compile(r'User Name:[\s\t]+(?P<user>.+)')
         # Timeout:            86400
-        timeout_compile = re.compile(r'Timeout:[\s\t]+(?P<timeout>\w+)')
+        timeout_compile = regex_engine.compile(r'Timeout:[\s\t]+(?P<timeout>\w+)')
         # Total number of Cache entries is 2
-        total_entries = re.compile(r'Total number of Cache entries is[\s\t]+(?P<count>[0-9]+)')
+        total_entries = regex_engine.compile(r'Total number of Cache entries is[\s\t]+(?P<count>[0-9]+)')
         for line in output.splitlines():
             line = line.strip()
 
@@ -1261,23 +1263,23 @@ class ShowAAACommonCriteraPolicy(ShowAAACommonCriteraPolicySchema):
             out = output
 
         # Policy name: enable_1
-        p1 = re.compile(r'^Policy name\: +(?P<policy_name>\S+\d+)$')
+        p1 = regex_engine.compile(r'^Policy name\: +(?P<policy_name>\S+\d+)$')
 
         # Minimum length: 10
         # Maximum length: 128
-        p2 = re.compile(r'^(?P<length_key>\S+) length\: +(?P<len>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<length_key>\S+) length\: +(?P<len>\d+)$')
 
         # Upper Count: 0
         # Lower Count: 0
         # Numeric Count: 0
         # Special Count: 0
-        p3 = re.compile(r'^(?P<count_key>\S+) Count\: +(?P<count>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<count_key>\S+) Count\: +(?P<count>\d+)$')
 
         # Number of character changes 4
-        p4 = re.compile(r'^Number of character changes +(?P<char_changes>\d+)$')
+        p4 = regex_engine.compile(r'^Number of character changes +(?P<char_changes>\d+)$')
 
         # Valid forever. User tied to this policy will not expire
-        p5 = re.compile(r'^Valid for +(?P<time>(.*))$')
+        p5 = regex_engine.compile(r'^Valid for +(?P<time>(.*))$')
 
         ret_dict = {}
         for line in out.splitlines():
@@ -1375,16 +1377,16 @@ class ShowAAAMethodList(ShowAAAMethodListSchema):
         # authen queue=AAA_ML_AUTHEN_LOGIN
         # author queue=AAA_ML_AUTHOR_SHELL
         # acct queue=AAA_ML_ACCT_AUTH_PROXY
-        p1 = re.compile(r'^(?P<type>\S+)\squeue=(?P<queue_type>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<type>\S+)\squeue=(?P<queue_type>\S+)$')
 
         # permanent lists
-        p2 = re.compile(r'^permanent\slists$')
+        p2 = regex_engine.compile(r'^permanent\slists$')
 
         # name= pvt_authen_0 valid=TRUE id=97000002 :state=DEAD : SERVER_GROUP  private_sg-0
-        p3 = re.compile(r'^name=\s*(?P<name>[\S\s]+)valid=\s*(?P<valid>\S+)\sid=\s*(?P<id>\d+)\s:state=\s*(?P<state>\S+)\s:(?P<method_list>[\S\s]*)$')
+        p3 = regex_engine.compile(r'^name=\s*(?P<name>[\S\s]+)valid=\s*(?P<valid>\S+)\sid=\s*(?P<id>\d+)\s:state=\s*(?P<state>\S+)\s:(?P<method_list>[\S\s]*)$')
 
         # name= pvt_authen_0 valid=TRUE id=97000002 :state=DEAD : SERVER_GROUP  private_sg-0
-        p4 = re.compile(r'^name=\s*(?P<name>[\S\s]+)valid=\s*(?P<valid>\S+)\sid=\s*(?P<id>\d+)\sAction=\s*(?P<action>\S+)\s:state=\s*(?P<state>\S+)\s:(?P<method_list>[\S\s]*)$')
+        p4 = regex_engine.compile(r'^name=\s*(?P<name>[\S\s]+)valid=\s*(?P<valid>\S+)\sid=\s*(?P<id>\d+)\sAction=\s*(?P<action>\S+)\s:state=\s*(?P<state>\S+)\s:(?P<method_list>[\S\s]*)$')
 
         ret_dict = {}
 
@@ -1507,31 +1509,31 @@ class ShowAaaDeadCriteriaRadius(ShowAaaDeadCriteriaRadiusSchema):
 
 
 	    # Address   : 11.19.12.66
-            p1 = re.compile(r"^Address\s+:\s+(?P<address>(\d{1,3}\.){3}\d{1,3})$")
+            p1 = regex_engine.compile(r"^Address\s+:\s+(?P<address>(\d{1,3}\.){3}\d{1,3})$")
 	    # Auth Port : 1645
-            p2 = re.compile(r"^Auth\s+Port\s+:\s+(?P<auth_port>\d+)$")
+            p2 = regex_engine.compile(r"^Auth\s+Port\s+:\s+(?P<auth_port>\d+)$")
 	    # Acct Port : 1646
-            p3 = re.compile(r"^Acct\s+Port\s+:\s+(?P<acct_port>\d+)$")
+            p3 = regex_engine.compile(r"^Acct\s+Port\s+:\s+(?P<acct_port>\d+)$")
 	    # Server Group  : radius
-            p4 = re.compile(r"^Server\s+Group\s+:\s+(?P<server_group>\w+)$")
+            p4 = regex_engine.compile(r"^Server\s+Group\s+:\s+(?P<server_group>\w+)$")
 	    # Configured Retransmits   : 3
-            p5 = re.compile(r"^Configured\s+Retransmits\s+:\s+(?P<conf_retransmits>\d+)$")
+            p5 = regex_engine.compile(r"^Configured\s+Retransmits\s+:\s+(?P<conf_retransmits>\d+)$")
 	    # Estimated Outstanding Access Transactions: 0
-            p6 = re.compile(r"^Estimated\s+Outstanding\s+Access\s+Transactions:\s+(?P<esti_outstand_access_transactions>\d+)$")
+            p6 = regex_engine.compile(r"^Estimated\s+Outstanding\s+Access\s+Transactions:\s+(?P<esti_outstand_access_transactions>\d+)$")
 	    # Configured Timeout       : 5
-            p7 = re.compile(r"^Configured\s+Timeout\s+:\s+(?P<conf_timeout>\d+)$")
+            p7 = regex_engine.compile(r"^Configured\s+Timeout\s+:\s+(?P<conf_timeout>\d+)$")
 	    # Estimated Outstanding Accounting Transactions: 0
-            p8 = re.compile(r"^Estimated\s+Outstanding\s+Accounting\s+Transactions:\s+(?P<esti_outstand_accounting_transactions>\d+)$")
+            p8 = regex_engine.compile(r"^Estimated\s+Outstanding\s+Accounting\s+Transactions:\s+(?P<esti_outstand_accounting_transactions>\d+)$")
 	    # Dead Detect Time         : 10s
-            p9 = re.compile(r"^Dead\s+Detect\s+Time\s+:\s+(?P<dead_detect_time_seconds>\d+)s*$")
+            p9 = regex_engine.compile(r"^Dead\s+Detect\s+Time\s+:\s+(?P<dead_detect_time_seconds>\d+)s*$")
 	    # Computed Retransmit Tries: 10
-            p10 = re.compile(r"^Computed\s+Retransmit\s+Tries:\s+(?P<computed_retransmit_tries>\d+)$")
+            p10 = regex_engine.compile(r"^Computed\s+Retransmit\s+Tries:\s+(?P<computed_retransmit_tries>\d+)$")
 	    # Max Computed Outstanding Transactions: 2
-            p11 = re.compile(r"^Max\s+Computed\s+Outstanding\s+Transactions:\s+(?P<max_computed_outstand_transaction>\d+)$")
+            p11 = regex_engine.compile(r"^Max\s+Computed\s+Outstanding\s+Transactions:\s+(?P<max_computed_outstand_transaction>\d+)$")
 	    # Max Computed Dead Detect Time: 20s
-            p12 = re.compile(r"^Max\s+Computed\s+Dead\s+Detect\s+Time:\s+(?P<max_computed_dead_detect_time_seconds>\d+)s*$")
+            p12 = regex_engine.compile(r"^Max\s+Computed\s+Dead\s+Detect\s+Time:\s+(?P<max_computed_dead_detect_time_seconds>\d+)s*$")
 	    # Max Computed Retransmits : 20
-            p13 = re.compile(r"^Max\s+Computed\s+Retransmits\s+:\s+(?P<max_computed_retransmit>\d+)$")
+            p13 = regex_engine.compile(r"^Max\s+Computed\s+Retransmits\s+:\s+(?P<max_computed_retransmit>\d+)$")
 
             ret_dict = {}
             for line in output.splitlines():
@@ -1653,19 +1655,19 @@ class ShowAaaSessions(ShowAaaSessionsSchema):
             output = self.device.execute(self.cli_command)
 
         # Total sessions since last reload: 6
-        p1 = re.compile(r"^Total\s+sessions\s+since\s+last\s+reload:\s+(?P<total_sessions>\d+)$")
+        p1 = regex_engine.compile(r"^Total\s+sessions\s+since\s+last\s+reload:\s+(?P<total_sessions>\d+)$")
         # Session Id: 4003
-        p2 = re.compile(r"^Session\s+Id:\s+(?P<session_id>\d+)$")
+        p2 = regex_engine.compile(r"^Session\s+Id:\s+(?P<session_id>\d+)$")
         # Unique Id: 13
-        p2_1 = re.compile(r"^\s+Unique\s+Id:\s+(?P<unique_id>\d+)$")
+        p2_1 = regex_engine.compile(r"^\s+Unique\s+Id:\s+(?P<unique_id>\d+)$")
         # User Name: *not available*
-        p2_2 = re.compile(r"^\s+User\s+Name:\s+(?P<username>\S+\s+\S+)$")
+        p2_2 = regex_engine.compile(r"^\s+User\s+Name:\s+(?P<username>\S+\s+\S+)$")
         # IP Address: 0.0.0.0
-        p2_3 = re.compile(r"^\s+IP\s+Address:\s+(?P<ip>(\d{1,3}\.){3}\d{1,3})$")
+        p2_3 = regex_engine.compile(r"^\s+IP\s+Address:\s+(?P<ip>(\d{1,3}\.){3}\d{1,3})$")
         # Idle Time: 0
-        p2_4 = re.compile(r"^\s+Idle\s+Time:\s+(?P<idle_time>\d+)$")
+        p2_4 = regex_engine.compile(r"^\s+Idle\s+Time:\s+(?P<idle_time>\d+)$")
         # CT Call Handle: 0
-        p2_5 = re.compile(r"^\s+CT\s+Call\s+Handle:\s+(?P<ct_call_handle>\d+)$")
+        p2_5 = regex_engine.compile(r"^\s+CT\s+Call\s+Handle:\s+(?P<ct_call_handle>\d+)$")
 
         ret_dict = {}
 
@@ -1775,21 +1777,21 @@ class ShowAaaMemory(ShowAaaMemorySchema):
             output = self.device.execute(self.cli_command)
 
         # AAA Acct Rec ch           :        252/10248      (  2%) [      3] Chunk
-        p1 = re.compile(r"^(?P<alloc_name>\S+(\s\S+)+)\s+:\s+(?P<in_use>\d+)/(?P<allocated>\d+)\s+\(\s+(?P<percentage>\d+)%\)\s+\[\s+(?P<count>\d+)\](\s+)?(?P<chunk>(\w+)?)$")
+        p1 = regex_engine.compile(r"^(?P<alloc_name>\S+(\s\S+)+)\s+:\s+(?P<in_use>\d+)/(?P<allocated>\d+)\s+\(\s+(?P<percentage>\d+)%\)\s+\[\s+(?P<count>\d+)\](\s+)?(?P<chunk>(\w+)?)$")
         # Total allocated: 0.398 Mb, 408 Kb, 418356 bytes
-        p2 = re.compile(r"^Total\s+allocated:\s+(?P<total_mb>\S+)\s+Mb,\s+(?P<total_kb>\d+)\s+Kb,\s+(?P<total_bytes>\d+)\s+bytes$")
+        p2 = regex_engine.compile(r"^Total\s+allocated:\s+(?P<total_mb>\S+)\s+Mb,\s+(?P<total_kb>\d+)\s+Kb,\s+(?P<total_bytes>\d+)\s+bytes$")
         # Authentication low-memory threshold      : 3%
-        p3 = re.compile(r"^Authentication\s+low-memory\s+threshold\s+:\s+(?P<auth_threshold>\d+)%$")
+        p3 = regex_engine.compile(r"^Authentication\s+low-memory\s+threshold\s+:\s+(?P<auth_threshold>\d+)%$")
         # Accounting low-memory threshold          : 2%
-        p3_1 = re.compile(r"^Accounting\s+low-memory\s+threshold\s+:\s+(?P<acc_threshold>\d+)%$")
+        p3_1 = regex_engine.compile(r"^Accounting\s+low-memory\s+threshold\s+:\s+(?P<acc_threshold>\d+)%$")
         # AAA Unique ID Failure                    : 0
-        p3_2 = re.compile(r"^AAA\s+Unique\s+ID\s+Failure\s+:\s+(?P<unique_id_failure>\d+)$")
+        p3_2 = regex_engine.compile(r"^AAA\s+Unique\s+ID\s+Failure\s+:\s+(?P<unique_id_failure>\d+)$")
         # Local server  Packet dropped             : 0
-        p3_3 = re.compile(r"^Local\s+server\s+Packet\s+dropped\s+:\s+(?P<local_server_pkt_drop>\d+)$")
+        p3_3 = regex_engine.compile(r"^Local\s+server\s+Packet\s+dropped\s+:\s+(?P<local_server_pkt_drop>\d+)$")
         # CoA  Packet dropped                      : 0
-        p3_4 = re.compile(r"^CoA\s+Packet\s+dropped\s+:\s+(?P<coa_pkt_drop>\d+)$")
+        p3_4 = regex_engine.compile(r"^CoA\s+Packet\s+dropped\s+:\s+(?P<coa_pkt_drop>\d+)$")
         # PoD  Packet dropped                      : 0
-        p3_5 = re.compile(r"^PoD\s+Packet\s+dropped\s+:\s+(?P<pod_pkt_drop>\d+)$")
+        p3_5 = regex_engine.compile(r"^PoD\s+Packet\s+dropped\s+:\s+(?P<pod_pkt_drop>\d+)$")
 
         ret_dict = {}
 
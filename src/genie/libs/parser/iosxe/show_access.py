@@ -1,7 +1,9 @@
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # ====================
 # Schema for:
@@ -54,13 +56,13 @@ class ShowAccessTunnelSummary(ShowAccessTunnelSummarySchema):
             output = self.device.execute(self.cli_command)
     		
     	# Number of AccessTunnel Data Tunnels       = 2 
-        p1 = re.compile(r"^\s+Number\s+of\s+AccessTunnel\s+Data\s+Tunnels\s+=\s+(?P<data_tunnels_count>\d+)")
+        p1 = regex_engine.compile(r"^\s+Number\s+of\s+AccessTunnel\s+Data\s+Tunnels\s+=\s+(?P<data_tunnels_count>\d+)")
     
         #Ac0     112.1.1.1        112.201.2.152       0       N/A          4789    
-        p2 = re.compile(r"^(?P<name>\S+)\s+(?P<rloc_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<ap_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<vrf_id>\S+)\s+(?P<src_port>\S+)\s+(?P<dst_port>\S+)")
+        p2 = regex_engine.compile(r"^(?P<name>\S+)\s+(?P<rloc_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<ap_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<vrf_id>\S+)\s+(?P<src_port>\S+)\s+(?P<dst_port>\S+)")
         
         #Ac0    0x00000069 0 days, 02:55:04           
-        p3 = re.compile(r"^(?P<name>\S+)\s+(?P<ifid>\S+)\s+(?P<up_time>.*\d+\:\d+\:\d+)") 
+        p3 = regex_engine.compile(r"^(?P<name>\S+)\s+(?P<ifid>\S+)\s+(?P<up_time>.*\d+\:\d+\:\d+)") 
                            
         access_tunnel_dict = {}
         access_tunnel_ret_dict = {}
@@ -8,9 +8,6 @@
      * show access-session mac {mac} details switch {mode} {rp_slot}
      * show access-session interface {interface} details switch {mode} {rp_slot}
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -22,6 +19,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # import iosxe parser
@@ -75,14 +73,14 @@ class ShowAccessSession(ShowAccessSessionSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^No sessions currently exist$')
-        p2 = re.compile(r'^Session +count \= +(?P<val>\d+)$')
-        p3 = re.compile(r'^(?P<intf>[\w\/\-\.]+) +'
-                         r'(?P<client>[\w\.]+) +'
-                         r'(?P<method>\w+) +'
-                         r'(?P<domain>\w+) +'
-                         r'(?P<status>\w+) +'
-                         r'(?P<session>\w+)$')
+        p1 = regex_engine.compile(r'^No sessions currently exist$')
+        p2 = regex_engine.compile(r'^Session +count \= +(?P<val>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<intf>[\w\/\-\.]+) +'
+                                   r'(?P<client>[\w\.]+) +'
+                                   r'(?P<method>\w+) +'
+                                   r'(?P<domain>\w+) +'
+                                   r'(?P<status>\w+) +'
+                                   r'(?P<session>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -197,12 +195,12 @@ class ShowAccessSessionBrief(ShowAccessSessionBriefSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<intf>[\w\/\-\.]+) +'
-                        r'(?P<mac>[\w\.]+) +'
-                        r'(?P<authc>[\w\:]+) +'
-                        r'(?P<authz>[\w\:+\s+\w+\-]+) +'
-                        r'(?P<flag>\w+) +'
-                        r'(?P<uptime>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<intf>[\w\/\-\.]+) +'
+                                  r'(?P<mac>[\w\.]+) +'
+                                  r'(?P<authc>[\w\:]+) +'
+                                  r'(?P<authz>[\w\:+\s+\w+\-]+) +'
+                                  r'(?P<flag>\w+) +'
+                                  r'(?P<uptime>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -267,15 +265,15 @@ class ShowAccessSessionEventLoggingMac(ShowAccessSessionEventLoggingMacSchema):
             output = self.device.execute(cmd)
 
         # Client-Mac :001b.0c18.918d
-        p1 = re.compile(r"^Client-Mac\s+:(?P<client_mac>\S+)$")
+        p1 = regex_engine.compile(r"^Client-Mac\s+:(?P<client_mac>\S+)$")
         # State      : EV_SESSION_AUTHZ_SUCCESS
-        p1_1 = re.compile(r"^State\s+:\s+(?P<state>\S+)$")
+        p1_1 = regex_engine.compile(r"^State\s+:\s+(?P<state>\S+)$")
         # Count      : 196
-        p1_2 = re.compile(r"^Count\s+:\s+(?P<count>\d+)$")
+        p1_2 = regex_engine.compile(r"^Count\s+:\s+(?P<count>\d+)$")
         # Id         : 3
-        p1_3 = re.compile(r"^Id\s+:\s+(?P<id>\d+)$")
+        p1_3 = regex_engine.compile(r"^Id\s+:\s+(?P<id>\d+)$")
         # Sep/29  12:14:51:777   RCL_CLIENT    RCL           EV_SESSION_START                         EV_PASS
-        p2 = re.compile(r"^(?P<timestamp>\S+\s+\S+)\s+(?P<src>\S+)\s+(?P<dest>\w+)\s+(?P<msg_type>\S+)\s+(?P<result>\S+)$")
+        p2 = regex_engine.compile(r"^(?P<timestamp>\S+\s+\S+)\s+(?P<src>\S+)\s+(?P<dest>\w+)\s+(?P<msg_type>\S+)\s+(?P<result>\S+)$")
 
         ret_dict = {}
 
@@ -414,13 +412,13 @@ class ShowAccessSessionMacDetails(ShowAccessSessionMacDetailsSchema):
             output = self.device.execute(cli)
         
         # Interface:  GigabitEthernet1/0/12
-        p1 = re.compile(r'^Interface:\s+(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<interface>\S+)$')
 
         # IIF-ID:  0x135C9B47
-        p2 = re.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
+        p2 = regex_engine.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
 
         # MAC Address:  000e.83e5.3398
-        p3 = re.compile(r'^MAC Address:\s+(?P<mac>\S+)$')
+        p3 = regex_engine.compile(r'^MAC Address:\s+(?P<mac>\S+)$')
 
         # IPv6 Address:  Unknown
         # IPv4 Address:  194.10.0.1
@@ -434,50 +432,50 @@ class ShowAccessSessionMacDetails(ShowAccessSessionMacDetailsSchema):
         # Acct Session ID:  0x00000004
         # Handle:  0x60000005
         # Current Policy:  POLICY_Gi1/0/12
-        p4 = re.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Status|Domain|Oper host mode|'
+        p4 = regex_engine.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Status|Domain|Oper host mode|'
             r'Oper control dir|Timeout action|Common Session ID|Acct Session ID|Handle|Current Policy|):\s+(?P<value>\S+)$')
 
         # Session timeout:  135s (server), Remaining: 82s
-        p5 = re.compile(r'^Session timeout:\s+(?P<server>\d+)s \(server\), Remaining: (?P<remaining>\d+)s$')
+        p5 = regex_engine.compile(r'^Session timeout:\s+(?P<server>\d+)s \(server\), Remaining: (?P<remaining>\d+)s$')
 
         # Local Policies:
-        p5_1 = re.compile(r'^Local Policies:$')
+        p5_1 = regex_engine.compile(r'^Local Policies:$')
 
         # URL Redirect ACL: IP-Adm-V6-Int-ACL-global
-        p5_2 = re.compile(r'^URL Redirect ACL:\s+(?P<url_redirect_acl_v6>[A-Za-z\-6]+)$')
+        p5_2 = regex_engine.compile(r'^URL Redirect ACL:\s+(?P<url_redirect_acl_v6>[A-Za-z\-6]+)$')
 
         # Preauth ACL: preauth_v6
-        p5_3 = re.compile(r'Preauth ACL:\s+(?P<preauth_acl_v6>[A-Za-z\_6]+)$')
+        p5_3 = regex_engine.compile(r'Preauth ACL:\s+(?P<preauth_acl_v6>[A-Za-z\_6]+)$')
 
         # URL Redirect ACL: IP-Adm-V4-Int-ACL-global
-        p5_4 = re.compile(r'^URL Redirect ACL:\s+(?P<url_redirect_acl_v4>[A-Za-z\-4]+)$')
+        p5_4 = regex_engine.compile(r'^URL Redirect ACL:\s+(?P<url_redirect_acl_v4>[A-Za-z\-4]+)$')
 
         # Preauth ACL: preauth_v4
-        p5_5 = re.compile(r'Preauth ACL:\s+(?P<preauth_acl_v4>[A-za-z\_4]+)$')
+        p5_5 = regex_engine.compile(r'Preauth ACL:\s+(?P<preauth_acl_v4>[A-za-z\_4]+)$')
 
         # Server Policies:
-        p6 = re.compile(r'^Server Policies:$')
+        p6 = regex_engine.compile(r'^Server Policies:$')
 
         # Filter-ID: Webauth_ACL
-        p6_1 = re.compile(r'^Filter-ID: (?P<filter_id>\w+)$')
+        p6_1 = regex_engine.compile(r'^Filter-ID: (?P<filter_id>\w+)$')
 
         # Session-Timeout: 135 sec
-        p7 = re.compile(r'^Session-Timeout: (?P<session_timeout>\d+) sec$')
+        p7 = regex_engine.compile(r'^Session-Timeout: (?P<session_timeout>\d+) sec$')
 
         # Vlan Group:  Vlan: 194
-        p8 = re.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
+        p8 = regex_engine.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
 
         # ACS ACL: xACSACLx-IP-legacy_TC9_permit_user_CP-7970G-SEP000E83E53398-63ced261
-        p9 = re.compile(r'^ACS ACL: (?P<acs_acl>\S+)$')
+        p9 = regex_engine.compile(r'^ACS ACL: (?P<acs_acl>\S+)$')
 
         # Method status list:
-        p10 = re.compile(r'^Method status list:$')
+        p10 = regex_engine.compile(r'^Method status list:$')
 
         # Method           State
-        p11 = re.compile(r'^Method           State$')
+        p11 = regex_engine.compile(r'^Method           State$')
 
         # dot1x           Authc Success
-        p12 = re.compile(r'^(?P<method>\S+)           (?P<state>[\S\s]+)$')
+        p12 = regex_engine.compile(r'^(?P<method>\S+)           (?P<state>[\S\s]+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -686,16 +684,16 @@ class ShowAccessSessionSessionIdDetails(ShowAccessSessionSessionIdDetailsSchema)
         ret_dict = {}
         method_status_dict = {}
         # Match Session ID line
-        p0 = re.compile(r'^Session id=(?P<session_id>\S+)$')
+        p0 = regex_engine.compile(r'^Session id=(?P<session_id>\S+)$')
 
         # Interface:  GigabitEthernet2/0/3
-        p1 = re.compile(r'^Interface:\s+(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<interface>\S+)$')
 
         # IIF-ID:  0x1210405D
-        p2 = re.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
+        p2 = regex_engine.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
 
         # MAC Address:  0055.6677.8855
-        p3 = re.compile(r'^MAC Address:\s+(?P<mac>\S+)$')
+        p3 = regex_engine.compile(r'^MAC Address:\s+(?P<mac>\S+)$')
 
         # IPv6 Address:  Unknown
         # IPv4 Address:  192.168.10.101
@@ -711,35 +709,35 @@ class ShowAccessSessionSessionIdDetails(ShowAccessSessionSessionIdDetailsSchema)
         # Acct Session ID:  0x0000003b
         # Handle:  0x31000022
         # Current Policy:  test_dot1x
-        p4 = re.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Device-type|Device-name|Status|Domain|'
+        p4 = regex_engine.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Device-type|Device-name|Status|Domain|'
             r'Oper host mode|Oper control dir|Timeout action|Common Session ID|Acct Session ID|Handle|Current Policy):\s+(?P<value>.+)$')
 
         # Session timeout:  50s (local), Remaining: 27s
-        p5 = re.compile(r'^Session timeout:\s+(?P<local>\d+)s \(local\), Remaining: (?P<remaining>\d+)s$')
+        p5 = regex_engine.compile(r'^Session timeout:\s+(?P<local>\d+)s \(local\), Remaining: (?P<remaining>\d+)s$')
 
         # Server Policies:
-        p6 = re.compile(r'^Server Policies:$')
+        p6 = regex_engine.compile(r'^Server Policies:$')
 
         # Vlan Group:  Vlan: 10 (server policies)
-        p7 = re.compile(r'^Vlan Group:\s+Vlan:\s*(?P<vlan_group>\d+)\s*$')
+        p7 = regex_engine.compile(r'^Vlan Group:\s+Vlan:\s*(?P<vlan_group>\d+)\s*$')
 
         # Resultant Policies:
-        p8 = re.compile(r'^Resultant Policies:$')
+        p8 = regex_engine.compile(r'^Resultant Policies:$')
 
         # Vlan Group:  Vlan: 10 (resultant policies)
-        p9 = re.compile(r'^Vlan Group:\s+Vlan:\s*(?P<vlan_group>\d+)\s*$')
+        p9 = regex_engine.compile(r'^Vlan Group:\s+Vlan:\s*(?P<vlan_group>\d+)\s*$')
 
         # Method status list:
-        p10 = re.compile(r'^Method status list:$')
+        p10 = regex_engine.compile(r'^Method status list:$')
 
         # Skip Method header line
-        p11 = re.compile(r'^Method           State$')
+        p11 = regex_engine.compile(r'^Method           State$')
 
         # dot1x           Authc Success
-        p12 = re.compile(r'^(?P<method>\S+)\s+(?P<state>[\S\s]+)$')
+        p12 = regex_engine.compile(r'^(?P<method>\S+)\s+(?P<state>[\S\s]+)$')
 
         # Simplified Table Output (Third type)
-        p13 = re.compile(r'^(?P<interface>\S+)\s+(?P<mac>\S+)\s+(?P<method>\S+)\s+(?P<domain>\S+)\s+(?P<status>\S+)\s+(?P<session_id>\S+)$')
+        p13 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<mac>\S+)\s+(?P<method>\S+)\s+(?P<domain>\S+)\s+(?P<status>\S+)\s+(?P<session_id>\S+)$')
 
         # Processing output line by line
         for line in output.splitlines():
@@ -923,13 +921,13 @@ class ShowAccessSessionMacDetailsMethod(ShowAccessSessionMacDetailsMethodSchema)
             output = self.device.execute(cmd)
 
         # Interface:  GigabitEthernet2/0/3
-        p1 = re.compile(r'^Interface:\s+(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<interface>\S+)$')
 
         # IIF-ID:  0x1D8DDC60
-        p2 = re.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
+        p2 = regex_engine.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
 
         # MAC Address:  001a.a136.c68a
-        p3 = re.compile(r'^MAC Address:\s+(?P<mac>\S+)$')
+        p3 = regex_engine.compile(r'^MAC Address:\s+(?P<mac>\S+)$')
 
         # IPv6 Address:  Unknown
         # IPv4 Address:  192.168.194.1
@@ -945,26 +943,26 @@ class ShowAccessSessionMacDetailsMethod(ShowAccessSessionMacDetailsMethodSchema)
         # Acct Session ID:  0x0000003c
         # Handle:  0xdb000020
         # Current Policy:  test_dot1x
-        p4 = re.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Device Type|Device Name|Status|Domain|Oper host mode|'
-                        r'Oper control dir|Timeout action|Common Session ID|Acct Session ID|Handle|Current Policy):\s+(?P<value>\S+)$')
+        p4 = regex_engine.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Device Type|Device Name|Status|Domain|Oper host mode|'
+                                  r'Oper control dir|Timeout action|Common Session ID|Acct Session ID|Handle|Current Policy):\s+(?P<value>\S+)$')
 
         # Session timeout:  50s (server), Remaining: 27s
-        p5 = re.compile(r'^Session timeout:\s+(?P<server>\d+)s \(server\), Remaining: (?P<remaining>\d+)s$')
+        p5 = regex_engine.compile(r'^Session timeout:\s+(?P<server>\d+)s \(server\), Remaining: (?P<remaining>\d+)s$')
 
         # Server Policies:
-        p6 = re.compile(r'^Server Policies:$')
+        p6 = regex_engine.compile(r'^Server Policies:$')
 
         # Vlan Group:  Vlan: 194
-        p7 = re.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
+        p7 = regex_engine.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
 
         # Method status list:
-        p8 = re.compile(r'^Method status list:$')
+        p8 = regex_engine.compile(r'^Method status list:$')
 
         # Method           State
-        p9 = re.compile(r'^Method           State$') 
+        p9 = regex_engine.compile(r'^Method           State$') 
 
         # dot1x           Authc Success
-        p10 = re.compile(r'^(?P<method>\S+)           (?P<state>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^(?P<method>\S+)           (?P<state>[\S\s]+)$')
 
         ret_dict = {}
 
@@ -1159,13 +1157,13 @@ class ShowAccessSessionDetails(ShowAccessSessionDetailsSchema):
 
         # Define regex patterns
         # Interface:  GigabitEthernet2/0/3
-        p1 = re.compile(r'^Interface:\s+(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<interface>\S+)$')
         
         # IIF-ID:  0x1D8DDC60
-        p2 = re.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
+        p2 = regex_engine.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
 
         # Match MAC Address
-        p3 = re.compile(r'^MAC Address:\s+(?P<mac>\S+)$')
+        p3 = regex_engine.compile(r'^MAC Address:\s+(?P<mac>\S+)$')
       
         # IPv6 Address:  Unknown
         # IPv4 Address:  192.168.10.101
@@ -1181,50 +1179,50 @@ class ShowAccessSessionDetails(ShowAccessSessionDetailsSchema):
         # Acct Session ID:  0x0000003b
         # Handle:  0x31000022
         # Current Policy:  test_dot1x
-        p4 = re.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Device-type|Device-name|Status|'
-                        r'Oper host mode|Oper control dir|Timeout action|Common Session ID|Acct Session ID|Handle|Current Policy):\s+(?P<value>.+)$')  # Match other session details
+        p4 = regex_engine.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Device-type|Device-name|Status|'
+                                  r'Oper host mode|Oper control dir|Timeout action|Common Session ID|Acct Session ID|Handle|Current Policy):\s+(?P<value>.+)$')  # Match other session details
         
         # Match domain (VOICE or DATA)
-        p5 = re.compile(r'^Domain:\s+(?P<domain>\S+)$')
+        p5 = regex_engine.compile(r'^Domain:\s+(?P<domain>\S+)$')
 
         # Match session timeout
-        p6 = re.compile(r'^Session timeout:\s+(?P<local>\d+)s \(local\), Remaining: (?P<remaining>\d+)s$')
+        p6 = regex_engine.compile(r'^Session timeout:\s+(?P<local>\d+)s \(local\), Remaining: (?P<remaining>\d+)s$')
 
          # Interface                MAC Address    Method  Domain  Status Fg  Session ID
-        p7 = re.compile(r'^(?P<interface>\S+)\s+(?P<mac_address>\S+)\s+(?P<method>\S+)\s+(?P<domain>\S+)\s+(?P<status_fg>\S+)\s+(?P<session_id>\S+)$')
+        p7 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<mac_address>\S+)\s+(?P<method>\S+)\s+(?P<domain>\S+)\s+(?P<status_fg>\S+)\s+(?P<session_id>\S+)$')
         
         # Server Policies (VLAN group)
-        p8 = re.compile(r'^Server Policies:$')
+        p8 = regex_engine.compile(r'^Server Policies:$')
 
         # Vlan Group:  Vlan: 194 (server policies)
-        p9 = re.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')  
+        p9 = regex_engine.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')  
 
         # Resultant Policies (VLAN group)
-        p10 = re.compile(r'^Resultant Policies:$')
+        p10 = regex_engine.compile(r'^Resultant Policies:$')
 
         # Vlan Group:  Vlan: 10 (resultant policies)
-        p11 = re.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
+        p11 = regex_engine.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
 
         # Method status list:
-        p12 = re.compile(r'^Method status list:$')
+        p12 = regex_engine.compile(r'^Method status list:$')
 
         #  Method       State
-        p13 = re.compile(r'^Method\s+State$')
+        p13 = regex_engine.compile(r'^Method\s+State$')
 
         # capture both method and state
-        p14 = re.compile(r'^(?P<method>\S+)\s+(?P<state>\S+\s\S+)$')
+        p14 = regex_engine.compile(r'^(?P<method>\S+)\s+(?P<state>\S+\s\S+)$')
 
         # AAA UID and VLAN ID
-        p15 = re.compile(r'^AAA UID:\s+(?P<aaa_uid>\S+)$')
+        p15 = regex_engine.compile(r'^AAA UID:\s+(?P<aaa_uid>\S+)$')
 
         #  VLAN ID
-        p16 = re.compile(r'^VLAN ID:\s+(?P<vlan_id>\d+)$')
+        p16 = regex_engine.compile(r'^VLAN ID:\s+(?P<vlan_id>\d+)$')
 
         # Runnable methods list:
-        p17 = re.compile(r'^Runnable methods list:$')
+        p17 = regex_engine.compile(r'^Runnable methods list:$')
         
         #   Handle  Priority  Name
-        p18 = re.compile(r'^(?P<handle>\d+)\s+(?P<priority>\d+)\s+(?P<name>\S+)$')
+        p18 = regex_engine.compile(r'^(?P<handle>\d+)\s+(?P<priority>\d+)\s+(?P<name>\S+)$')
 
         ret_dict = {}
         interface_dict = None
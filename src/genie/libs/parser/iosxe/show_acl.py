@@ -19,6 +19,7 @@ from genie.metaparser.util.schemaengine import (Schema,
                                                 ListOf)
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -247,14 +248,14 @@ class ShowAccessLists(ShowAccessListsSchema):
 
         # initial regexp pattern
         # Extended IP access list Gi2/0/24#v4#33476254
-        p_ip = re.compile(r'^(?P<acl_type>Extended|Standard|Role-based) +IP +access +list[s]? '
-                          r'+(?P<name>[\w\-\.#\/]+)( *\((?P<per_user>.*)\))?$')
-        p_ip_1 = re.compile(r'^ip +access-list +extended +(?P<name>[\w\-'
-                            r'\.#]+)( *\((?P<per_user>.*)\))?$')
-        p_ipv6 = re.compile(r'^(?P<acl_type>IPv6 ?(Role-based)?) +access +list +(?P<name>[\w\-\.#]+)'
-                            r'( *\((?P<per_user>.*)\))?.*$')
-        p_mac = re.compile(r'^(?P<acl_type>Extended) +MAC +access +list +(?P<name>[\w\-\.'
-                           r']+)( *\((?P<per_user>.*)\))?$')
+        p_ip = regex_engine.compile(r'^(?P<acl_type>Extended|Standard|Role-based) +IP +access +list[s]? '
+                                    r'+(?P<name>[\w\-\.#\/]+)( *\((?P<per_user>.*)\))?$')
+        p_ip_1 = regex_engine.compile(r'^ip +access-list +extended +(?P<name>[\w\-'
+                                      r'\.#]+)( *\((?P<per_user>.*)\))?$')
+        p_ipv6 = regex_engine.compile(r'^(?P<acl_type>IPv6 ?(Role-based)?) +access +list +(?P<name>[\w\-\.#]+)'
+                                      r'( *\((?P<per_user>.*)\))?.*$')
+        p_mac = regex_engine.compile(r'^(?P<acl_type>Extended) +MAC +access +list +(?P<name>[\w\-\.'
+                                     r']+)( *\((?P<per_user>.*)\))?$')
 
 
         # 10 permit 10.2.0.0, wildcard bits 0.0.255.255
@@ -267,11 +268,11 @@ class ShowAccessLists(ShowAccessListsSchema):
         # 10 permit 172.31.0.2 (1168716 matches)
         # 10 permit 172.31.0.0, wildcard bits 0.0.255.255 (8353358 matches)
         # 10 deny   10.4.1.2 log (18 matches)
-        p_ip_acl_standard = re.compile(r'^(?P<seq>\d+)? '
-                                       r'?(?P<actions_forwarding>permit|deny) '
-                                       r'+(?P<src>[\d\.]+|any)( (?P<log>log))?(?:, +wildcard '
-                                       r'+bits +(?P<wildcard_bits>any|\S+))'
-                                       r'?(?: +\((?P<matched_packets>\d+|\S+)+ matches\))?$')
+        p_ip_acl_standard = regex_engine.compile(r'^(?P<seq>\d+)? '
+                                                 r'?(?P<actions_forwarding>permit|deny) '
+                                                 r'+(?P<src>[\d\.]+|any)( (?P<log>log))?(?:, +wildcard '
+                                                 r'+bits +(?P<wildcard_bits>any|\S+))'
+                                                 r'?(?: +\((?P<matched_packets>\d+|\S+)+ matches\))?$')
 
         # 10 permit ip host 10.3.3.3 host 10.5.5.34
         # 20 permit icmp any any
@@ -298,7 +299,7 @@ class ShowAccessLists(ShowAccessListsSchema):
         # 20 permit tcp any eq 443 10.120.194.64 0.0.0.63
         # 10 permit icmp echo-reply (19 matches)
 
-        p_ip_acl = re.compile(
+        p_ip_acl = regex_engine.compile(
             r'^(?P<seq>\d+) +(?P<actions_forwarding>permit|deny) +(?P<protocol>\w+) '
             r'+(?P<src>(?:any|host +\d+.\d+.\d+.\d+|\d+.\d+.\d+.\d+ +\d+.\d+.\d+.\d+)?)?'
             r'(?: +(?P<src_operator>eq|gt|lt|neq|range) '
@@ -321,7 +322,7 @@ class ShowAccessLists(ShowAccessListsSchema):
         # permit tcp host 2001: DB8: 1: : 1 eq www any eq bgp sequence 30
         # permit udp any host 2001: DB8: 1: : 1 sequence 40
         # permit icmp (19 matches) sequence 10
-        p_ipv6_acl = re.compile(
+        p_ipv6_acl = regex_engine.compile(
             r'^(?P<actions_forwarding>permit|deny) +(?P<protocol>ahp|esp|hbh'
             r'|icmp|ipv6|pcp|sctp|tcp|udp) ?(?P<src>(?:any|(?:\w+)?(?::(?:\w+)?)'
             r'{2,7}(?:\/\d+)|(?:host|(?:\w+)?(?::(?:\w+)?){2,7}) '
@@ -334,7 +335,7 @@ class ShowAccessLists(ShowAccessListsSchema):
             r'+\w+))?(?: +(?P<msg_type>ttl-exceeded|unreachable|packet-too-big|echo-reply|echo|'
             r'router-advertisement|mld-query+))?(?P<left>.+)? +sequence +(?P<seq>\d+)$')
 
-        p_mac_acl = re.compile(
+        p_mac_acl = regex_engine.compile(
             r'^(?P<actions_forwarding>(deny|permit)) +(?P<src>(host *)?[\w\.]+) '
             r'+(?P<dst>(host *)?[\w\.]+)( *(?P<left>.*))?$')
             
@@ -344,7 +345,7 @@ class ShowAccessLists(ShowAccessListsSchema):
         # 110 permit udp object-group vpn-endpoints-dummydpd host 10.4.1.1 eq isakmp (122 matches)
         # 20 permit ip object-group GENIE any log-input
         # 10 deny ip any object-group GENIE log-input
-        p_ip_object_group = re.compile(
+        p_ip_object_group = regex_engine.compile(
             r'^(?P<seq>\d+) +(?P<actions_forwarding>permit|deny) +(?P<protocol>\w+) '
             r'+(?P<src>(?:any )?(?:object-group+)(?: '
             r'+\S+)?)(?: +(?P<src_operator>eq|gt|lt|neq|range) '
@@ -783,7 +784,7 @@ class ShowIpAccessListDumpReflexive(ShowIpAccessListDumpReflexiveSchema):
 
         # permit tcp host 80.0.0.15 eq www host 70.0.0.15 eq 2015 (time left 99)
         # permit udp host 80.0.1.3 eq 4003 host 70.0.1.3 eq 3003 (201 matches) (time left 56)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<seqnum>\d+)? ?(?P<actions_forwarding>permit|deny) +(?P<protocol>\w+) '
             r'+(?P<src>(?:any|host +\d+.\d+.\d+.\d+|\d+.\d+.\d+.\d+ +\d+.\d+.\d+.\d+)?)?(?: '
             r'+(?P<src_operator>eq|gt|lt|neq|range) +(?P<src_port>.*?(?=(?: +any| +host +\d+.\d+.\d+.\d+| +\d+.\d+.\d+.\d+ +\d+.\d+.\d+.\d+)|$)))? '
@@ -792,12 +793,12 @@ class ShowIpAccessListDumpReflexive(ShowIpAccessListDumpReflexiveSchema):
             r'?(\((?P<matchcount>\d+) (matches|match)\))? ?(\(time left (?P<timeleft>\d+)\))? ?(?P<left>.+)?$')
 
         # Name : R101  Interface Num : 181 (Vlan3110)  Direction : IN  sport/dport : 2015/80 Type : REFLECT  Threshold Count : 8  Active : Y
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<name>[\w\s]+): +(?P<value1>[\w\s]+)  +(?P<interface_num>[\w\s]+): +(?P<value2>[\.\)\(\w\s\-\/\ \\]+)  +(?P<direction>[\w\s]+): +(?P<value3>[\w\s]+) +(?P<sport_dport>[\w\s\/]+): +(?P<value4>[\w\s\/]+) +(?P<acl_type>[\w\s]+): +(?P<value5>[\w]+) +(?P<threshold_count>[\w\s+]+): +(?P<value6>[\d]+) +(?P<active>[\w\s]+): +(?P<value7>[\w\s]+)$')
 
         # Reflex Error Count:0
         # Evaluate Error Count:0
-        p3 = re.compile(r'^(?P<pattern8>[\w\s+]+):+(?P<value8>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<pattern8>[\w\s+]+):+(?P<value8>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -888,10 +889,10 @@ class ShowPlatformSoftwareFedSwitchActiveAcl(ShowPlatformSoftwareFedSwitchActive
             output = self.device.execute(self.cli_command)
 
         # Ingress IPv4 Forward             (0xb5000003):  2686698 frames
-        p1 = re.compile(r"^Ingress\s+IPv4\s+Forward\s+\((?P<asic_value>\S+)\):\s+(?P<counter>\d+)\s+frames$")
+        p1 = regex_engine.compile(r"^Ingress\s+IPv4\s+Forward\s+\((?P<asic_value>\S+)\):\s+(?P<counter>\d+)\s+frames$")
         
         # Ingress IPv4 Forward from CPU    (0xe5000004):          10 frames
-        p2 = re.compile(r"^Ingress\s+IPv4\s+Forward\s+from\s+CPU\s+\((?P<asic_value>\S+)\):\s+(?P<counter>\d+)\s+frames$")
+        p2 = regex_engine.compile(r"^Ingress\s+IPv4\s+Forward\s+from\s+CPU\s+\((?P<asic_value>\S+)\):\s+(?P<counter>\d+)\s+frames$")
 
         ret_dict = {}
 
@@ -945,16 +946,16 @@ class ShowObjectGroupName(ShowObjectGroupNameSchema):
         
         # V6-Network object group v6-net1
         # V6-Service object group v6-serv1
-        p1 = re.compile(r'^(?P<object_group>[\w\-]+)\s+object\s+group\s+(?:(?P<group_name>[\w\-]+))?$')
+        p1 = regex_engine.compile(r'^(?P<object_group>[\w\-]+)\s+object\s+group\s+(?:(?P<group_name>[\w\-]+))?$')
 
         # Ipv6
         # ipv4
         # tcp-udp
         # sctp        
-        p2 = re.compile(r'^(?P<services>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<services>\S+)$')
 
         # host 2040:1::3
-        p3 = re.compile(r'^host\s+(?P<address>[\w\:]+)$')
+        p3 = regex_engine.compile(r'^host\s+(?P<address>[\w\:]+)$')
 
         for line in out.splitlines():
             line = line.strip()
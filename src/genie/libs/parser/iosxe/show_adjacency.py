@@ -10,13 +10,13 @@ IOSXE parsers for the following show commands:
     * show adjacency vlan <id> prefix <prefix> link protocol <protocol> detail
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # Adjacency_source_dict
 adjacency_source_dict = {'AToM', 'link raw adjacency', 'ARP', 'P2P-ADJ', 'FR-MAP'
                          'ATM-PVC', 'ATM-SVC', 'ATM-TVC', 'NBMA', 'MPOA', 'ATM-BUNDLE'
@@ -85,46 +85,46 @@ class ShowAdjacencyInterfaceDetail(ShowAdjacencyInterfaceDetailSchema):
 
         # Protocol Interface Address
         # IPV6 Tunnel0 ABCD:2::2(4)
-        p1 = re.compile(r'^(?P<protocol>IP(V6)?)\s+(?P<interface>[\w\/\.\-\:]+?)\s+(?P<address>[\da-fA-F:.()/]+)$')
+        p1 = regex_engine.compile(r'^(?P<protocol>IP(V6)?)\s+(?P<interface>[\w\/\.\-\:]+?)\s+(?P<address>[\da-fA-F:.()/]+)$')
 
         # connectionid 1
-        p2 = re.compile(r'^connectionid (?P<connectionid>\d+)$')
+        p2 = regex_engine.compile(r'^connectionid (?P<connectionid>\d+)$')
 
         # 56 packets, 7494 bytes
-        p3 = re.compile(r'^(?P<packets>\d+) packets, (?P<bytes>\d+) bytes$')
+        p3 = regex_engine.compile(r'^(?P<packets>\d+) packets, (?P<bytes>\d+) bytes$')
 
         # epoch 0
-        p4 = re.compile(r'^epoch (?P<epoch>\d+)$')
+        p4 = regex_engine.compile(r'^epoch (?P<epoch>\d+)$')
 
         # sourced in sev-epoch 1
-        p5 = re.compile(r'^sourced in sev-epoch (?P<sourced_in_sev_epoch>\d+)$')
+        p5 = regex_engine.compile(r'^sourced in sev-epoch (?P<sourced_in_sev_epoch>\d+)$')
 
         # Encap length 48
-        p6 = re.compile(r'^Encap length (?P<encap_length>\d+)$')
+        p6 = regex_engine.compile(r'^Encap length (?P<encap_length>\d+)$')
 
         # L2 destination address byte offset 0
-        p7 = re.compile(r'L2 destination address byte offset (?P<byte_offset>\d+)$')
+        p7 = regex_engine.compile(r'L2 destination address byte offset (?P<byte_offset>\d+)$')
 
         # L2 destination address byte length 6
-        p8 = re.compile(r'L2 destination address byte length (?P<byte_length>\d+)$')
+        p8 = regex_engine.compile(r'L2 destination address byte length (?P<byte_length>\d+)$')
 
         # Link-type after encap: ipv6
-        p9 = re.compile(r'Link-type after encap: (?P<link_type_after_encap>ip(v6)?)$')
+        p9 = regex_engine.compile(r'Link-type after encap: (?P<link_type_after_encap>ip(v6)?)$')
 
         # Entire encap str is 3 lines, next 3 represent that
         # 60000000000011FFABCD000100000000
         # 0000000000000002ABCD000200000000
         # 000000000000000212B512B500000000
-        p10 = re.compile(r'^(?P<encap_str>[\dA-F]+)$')
+        p10 = regex_engine.compile(r'^(?P<encap_str>[\dA-F]+)$')
 
         # Tun endpt
-        p11 = re.compile(r'^.+$')
+        p11 = regex_engine.compile(r'^.+$')
 
         # Next chain element:
         # IPV6 adj out of Ethernet1/0, addr FE80::A8BB:CCFF:FE02:5710
-        p12 = re.compile(r'^(?P<protocol>IP(V6)?)'
-                        r' +adj out of (?P<outgoing_interface>[\w\/\.\-\:]+),'
-                        r' +addr (?P<outgoing_address>[\da-fA-F:.()/]+)$')
+        p12 = regex_engine.compile(r'^(?P<protocol>IP(V6)?)'
+                                  r' +adj out of (?P<outgoing_interface>[\w\/\.\-\:]+),'
+                                  r' +addr (?P<outgoing_address>[\da-fA-F:.()/]+)$')
 
         ret_dict = {}
         encapstr_len = 0
@@ -278,25 +278,25 @@ class ShowAdjacencyVlanLinkDetail(ShowAdjacencyVlanLinkDetailSchema):
 
         # Protocol Interface Address
         # IPV6 Vlan3 ABCD:2::2(7)
-        p1 = re.compile(r'^(?P<protocol>IP(V6)?)\s+(?P<interface>.+?)\s+(?P<address>[\da-fA-F:.()/]+)$')
+        p1 = regex_engine.compile(r'^(?P<protocol>IP(V6)?)\s+(?P<interface>.+?)\s+(?P<address>[\da-fA-F:.()/]+)$')
 
         # 0 packets, 0 bytes
-        p2 = re.compile(r'^(?P<packets>\d+) packets, (?P<bytes>\d+) bytes$')
+        p2 = regex_engine.compile(r'^(?P<packets>\d+) packets, (?P<bytes>\d+) bytes$')
 
         # epoch 0
-        p3 = re.compile(r'^epoch (?P<epoch>\d+)$')
+        p3 = regex_engine.compile(r'^epoch (?P<epoch>\d+)$')
 
         # sourced in sev-epoch 4
-        p4 = re.compile(r'^sourced in sev-epoch (?P<sourced_in_sev_epoch>\d+)$')
+        p4 = regex_engine.compile(r'^sourced in sev-epoch (?P<sourced_in_sev_epoch>\d+)$')
 
         # Encap length 14
-        p5 = re.compile(r'^Encap length (?P<encap_length>\d+)$')
+        p5 = regex_engine.compile(r'^Encap length (?P<encap_length>\d+)$')
 
         # AABBCC81F600AABBCC81F50086DD
-        p6 = re.compile(r'^(?P<encap_str>[\dA-F]+)$')
+        p6 = regex_engine.compile(r'^(?P<encap_str>[\dA-F]+)$')
 
         # VXLAN Transport Tunnel
-        p7 = re.compile(r'^.+$')
+        p7 = regex_engine.compile(r'^.+$')
 
         ret_dict = {}
         encapstr_len = 0
@@ -5,10 +5,12 @@ IOSXE parsers for the following show commands:
     * show facility-alarm status
 '''
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Schema for 'show alarm profile'
 # =============================================
@@ -40,12 +42,12 @@ class ShowAlarmProfile(ShowAlarmProfileSchema):
         else:
             out = output
         ret_dict = {}
-        p1= re.compile(r'alarm\sprofile\s(?P<profile>(\w+)):')
-        p2 = re.compile(r'Interfaces(?P<interfaces>(\s+[\w\-\s\,\/]+)?)')
-        p3 = re.compile(r'Alarms(?P<alarms>(\s+[\w\-\s\,]+)?)')
-        p4 = re.compile(r'Syslog(?P<syslog>(\s+[\w\-\s\,]+)?)')
-        p5 = re.compile(r'Notifies(?P<notifies>(\s+[\w\-\s\,]+)?)')
-        p6 = re.compile(r'Relay Major(?P<relay_major>(\s+[\w\-\s\,]+)?)')
+        p1= regex_engine.compile(r'alarm\sprofile\s(?P<profile>(\w+)):')
+        p2 = regex_engine.compile(r'Interfaces(?P<interfaces>(\s+[\w\-\s\,\/]+)?)')
+        p3 = regex_engine.compile(r'Alarms(?P<alarms>(\s+[\w\-\s\,]+)?)')
+        p4 = regex_engine.compile(r'Syslog(?P<syslog>(\s+[\w\-\s\,]+)?)')
+        p5 = regex_engine.compile(r'Notifies(?P<notifies>(\s+[\w\-\s\,]+)?)')
+        p6 = regex_engine.compile(r'Relay Major(?P<relay_major>(\s+[\w\-\s\,]+)?)')
 
         profile = ''
         for line in out.splitlines():
@@ -175,24 +177,24 @@ class ShowAlarmSettings(ShowAlarmSettingsSchema):
             out = output
         ret_dict = {}
 
-        pa = re.compile(r'Alarm(?P<alarm>((\s+\w+))?)')
-        pb = re.compile(r'Threshold(s)?(?P<threshold>([\w\:\s\d\-\+]+)?)')
-        pb1 = re.compile(r'MAX:\s+(?P<max_temp>(\+?\-?\d+C))\s+MIN:\s+(?P<min_temp>(\+?\-?\d+C))')
-        pc = re.compile(r'Relay(?P<relay>((\s+\w+)?))')
-        pd = re.compile(r'Notifies(?P<notifies>((\s+\w+)?))')
-        pe = re.compile(r'Syslog(?P<syslog>((\s+\w+)?))')
+        pa = regex_engine.compile(r'Alarm(?P<alarm>((\s+\w+))?)')
+        pb = regex_engine.compile(r'Threshold(s)?(?P<threshold>([\w\:\s\d\-\+]+)?)')
+        pb1 = regex_engine.compile(r'MAX:\s+(?P<max_temp>(\+?\-?\d+C))\s+MIN:\s+(?P<min_temp>(\+?\-?\d+C))')
+        pc = regex_engine.compile(r'Relay(?P<relay>((\s+\w+)?))')
+        pd = regex_engine.compile(r'Notifies(?P<notifies>((\s+\w+)?))')
+        pe = regex_engine.compile(r'Syslog(?P<syslog>((\s+\w+)?))')
         
-        p1= re.compile(r'Alarm relay mode:\s(?P<status>(\w+))')
-        p2 = re.compile(r'Power Supply')
-        p3 = re.compile(r'Temperature-Primary')
-        p4 = re.compile(r'Temperature-Secondary')
-        p5 = re.compile(r'SD-Card')
-        p6 = re.compile(r'Input-Alarm 1')
-        p7 = re.compile(r'Input-Alarm 2')
-        p8 = re.compile(r'Input-Alarm 3')
-        p9 = re.compile(r'Input-Alarm 4')
-        p10 = re.compile(r'PTP')
-        p11 = re.compile(r'DLR')
+        p1= regex_engine.compile(r'Alarm relay mode:\s(?P<status>(\w+))')
+        p2 = regex_engine.compile(r'Power Supply')
+        p3 = regex_engine.compile(r'Temperature-Primary')
+        p4 = regex_engine.compile(r'Temperature-Secondary')
+        p5 = regex_engine.compile(r'SD-Card')
+        p6 = regex_engine.compile(r'Input-Alarm 1')
+        p7 = regex_engine.compile(r'Input-Alarm 2')
+        p8 = regex_engine.compile(r'Input-Alarm 3')
+        p9 = regex_engine.compile(r'Input-Alarm 4')
+        p10 = regex_engine.compile(r'PTP')
+        p11 = regex_engine.compile(r'DLR')
         item = ''
 
         for line in out.splitlines():
@@ -317,18 +319,18 @@ class ShowFacilityAlarmStatus(ShowFacilityAlarmStatusSchema):
         ret_dict = {}
 
         #Source                 Severity Description                         Relay    Time
-        p1 = re.compile(r'Source\s+Severity\s+Description\s+Relay\s+Time')
+        p1 = regex_engine.compile(r'Source\s+Severity\s+Description\s+Relay\s+Time')
 
         #GigabitEthernet1/8       MAJOR    1 Link Fault                        MAJ      Mar 02 2023 10:19:20
-        p2 = re.compile(r'(?P<source>([\w\/\d\-\_]+))\s\s+(?P<severity>([A-Z]+))\s\s+(?P<description>([\w\s\d]+))\s\s+(?P<relay>([A-Z]+))\s\s+(?P<time>([\w\d\s\:]+))')
+        p2 = regex_engine.compile(r'(?P<source>([\w\/\d\-\_]+))\s\s+(?P<severity>([A-Z]+))\s\s+(?P<description>([\w\s\d]+))\s\s+(?P<relay>([A-Z]+))\s\s+(?P<time>([\w\d\s\:]+))')
         
         # Source                     Time                   Severity      Description [Index]
-        p3 = re.compile(r'^Source(\s+Time)\s+Severity\s+Description(\s+\[Index])$')
+        p3 = regex_engine.compile(r'^Source(\s+Time)\s+Severity\s+Description(\s+\[Index])$')
 
         # Power Supply Bay 0         Jan 23 2024 17:18:47   CRITICAL      Power Supply/FAN Module Missing [0]
         # TenGigabitEthernet0/0/0    Jan 21 2024 19:15:56   CRITICAL      Physical Port Link Down [1]
         # xcvr container 0/0/3       Jan 21 2024 19:15:56   CRITICAL      Transceiver Missing - Link Down [1]
-        p4 = re.compile(r'^(?P<source>([\w\/\d\-\_ ]+))\s\s+()?(?P<time>([\w\d\s\:]+))\s\s+(?P<severity>([A-Z]+))\s\s+(?P<description>([\w\s\d\/\/\-]+))\s+(\[(?P<index>(\d+))\])$')
+        p4 = regex_engine.compile(r'^(?P<source>([\w\/\d\-\_ ]+))\s\s+()?(?P<time>([\w\d\s\:]+))\s\s+(?P<severity>([A-Z]+))\s\s+(?P<description>([\w\s\d\/\/\-]+))\s+(\[(?P<index>(\d+))\])$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -1,8 +1,10 @@
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================
 # Schema for:
@@ -56,20 +58,20 @@ class ShowApSummary(ShowApSummarySchema):
 
 
         # Number of APs: 3
-        ap_neighbor_count_capture = re.compile(r"^Number\s+of\s+APs:\s+(?P<ap_neighbor_count>\d+)")
+        ap_neighbor_count_capture = regex_engine.compile(r"^Number\s+of\s+APs:\s+(?P<ap_neighbor_count>\d+)")
 
         # AP002C.C862.E708  2      AIR-AP1815I-A-K9      002c.c862.e708  002c.c88a.fd20  default location    US    9.4.57.241    Registered
         if "Country Code" not in out and "Regulatory Domain" not in out:
-            ap_neighbor_info_capture = re.compile(
-                                                r"^(?P<ap_name>\S+)\s+"
-                                                r"(?P<slots_count>\d+)\s+"
-                                                r"(?P<ap_model>\S+)\s+"
-                                                r"(?P<ethernet_mac>\S+)\s+"
-                                                r"(?P<radio_mac>\S+)\s+"
-                                                r"(?P<location>.*?)\s+"
-                                                r"(?P<country>\S+)\s+"
-                                                r"(?P<ap_ip_address>(?:\d{1,3}\.){3}\d{1,3}|(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,7}:|(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,5}(?::[0-9a-fA-F]{1,4}){1,2}|(?:[0-9a-fA-F]{1,4}:){1,4}(?::[0-9a-fA-F]{1,4}){1,3}|(?:[0-9a-fA-F]{1,4}:){1,3}(?::[0-9a-fA-F]{1,4}){1,4}|(?:[0-9a-fA-F]{1,4}:){1,2}(?::[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:(?:(?::[0-9a-fA-F]{1,4}){1,6})|:(?:(?::[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(?::[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+"
-                                                r"(?P<state>Registered)"
+            ap_neighbor_info_capture = regex_engine.compile(
+                                                          r"^(?P<ap_name>\S+)\s+"
+                                                          r"(?P<slots_count>\d+)\s+"
+                                                          r"(?P<ap_model>\S+)\s+"
+                                                          r"(?P<ethernet_mac>\S+)\s+"
+                                                          r"(?P<radio_mac>\S+)\s+"
+                                                          r"(?P<location>.*?)\s+"
+                                                          r"(?P<country>\S+)\s+"
+                                                          r"(?P<ap_ip_address>(?:\d{1,3}\.){3}\d{1,3}|(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,7}:|(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,5}(?::[0-9a-fA-F]{1,4}){1,2}|(?:[0-9a-fA-F]{1,4}:){1,4}(?::[0-9a-fA-F]{1,4}){1,3}|(?:[0-9a-fA-F]{1,4}:){1,3}(?::[0-9a-fA-F]{1,4}){1,4}|(?:[0-9a-fA-F]{1,4}:){1,2}(?::[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:(?:(?::[0-9a-fA-F]{1,4}){1,6})|:(?:(?::[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(?::[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+"
+                                                          r"(?P<state>Registered)"
         # regex changed for ap_ip_address to handle ipv4 and ipv6 address
     )
         else:
@@ -81,18 +83,18 @@ class ShowApSummary(ShowApSummarySchema):
             # ---------------------------------------------------------------------------------------------------------------------------------------------------------------------
             # APF8B7.E2C4.1120                 2     AIR-AP1852I-B-K9     f8b7.e2c4.1120 f8b7.e2c4.9b60 US   -B   20.20.13.142                              Registered   default location
             #AP002A.1087.CA0A                 2     AIR-AP2802E-D-K9     002a.1087.ca0a 00a2.eefd.9f20 IN   -D   2001:9:3:13:c822:82c8:32da:484d           Registered   default location
-            ap_neighbor_info_capture = re.compile(
-                                                r"^(?P<ap_name>\S+)\s+"
-                                                r"(?P<slots_count>\d+)\s+"
-                                                r"(?P<ap_model>\S+)\s+"
-                                                r"(?P<ethernet_mac>\S+)\s+"
-                                                r"(?P<radio_mac>\S+)\s+"
-                                                r"(?P<country>.*?)\s+"
-                                                r"(?P<regulatory_domain>\S+)\s+"
-                                                r"(?P<ap_ip_address>(?:\d{1,3}\.){3}\d{1,3}|(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,7}:|(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,5}(?::[0-9a-fA-F]{1,4}){1,2}|(?:[0-9a-fA-F]{1,4}:){1,4}(?::[0-9a-fA-F]{1,4}){1,3}|(?:[0-9a-fA-F]{1,4}:){1,3}(?::[0-9a-fA-F]{1,4}){1,4}|(?:[0-9a-fA-F]{1,4}:){1,2}(?::[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:(?:(?::[0-9a-fA-F]{1,4}){1,6})|:(?:(?::[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(?::[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+"
-                                                r"(?P<state>Registered)\s+"
-                                                r"(?P<location>.*)"
-                                            )
+            ap_neighbor_info_capture = regex_engine.compile(
+                                                          r"^(?P<ap_name>\S+)\s+"
+                                                          r"(?P<slots_count>\d+)\s+"
+                                                          r"(?P<ap_model>\S+)\s+"
+                                                          r"(?P<ethernet_mac>\S+)\s+"
+                                                          r"(?P<radio_mac>\S+)\s+"
+                                                          r"(?P<country>.*?)\s+"
+                                                          r"(?P<regulatory_domain>\S+)\s+"
+                                                          r"(?P<ap_ip_address>(?:\d{1,3}\.){3}\d{1,3}|(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,7}:|(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,5}(?::[0-9a-fA-F]{1,4}){1,2}|(?:[0-9a-fA-F]{1,4}:){1,4}(?::[0-9a-fA-F]{1,4}){1,3}|(?:[0-9a-fA-F]{1,4}:){1,3}(?::[0-9a-fA-F]{1,4}){1,4}|(?:[0-9a-fA-F]{1,4}:){1,2}(?::[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:(?:(?::[0-9a-fA-F]{1,4}){1,6})|:(?:(?::[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(?::[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+"
+                                                          r"(?P<state>Registered)\s+"
+                                                          r"(?P<location>.*)"
+                                                      )
             # regex changed for ap_ip_address to handle ipv4 and ipv6 address
 
         remove_lines = ('AP Name', '----')
@@ -211,9 +213,9 @@ class ShowApRfProfileSummary(ShowApRfProfileSummarySchema):
 
 
         # Number of RF-profiles: 14
-        rf_profile_count_capture = re.compile(r"^Number\s+of\s+RF-profiles:\s+(?P<rf_profile_count>\d+)")
+        rf_profile_count_capture = regex_engine.compile(r"^Number\s+of\s+RF-profiles:\s+(?P<rf_profile_count>\d+)")
         # Custom-RF_a                      5 GHz    Custom-RF_a_Desc                     Up
-        rf_profile_info_capture = re.compile(
+        rf_profile_info_capture = regex_engine.compile(
             r"^(?P<rf_profile_name>\S+)\s+(?P<band>\S+\s+\S+)\s+(?P<description>.*)(?P<state>(Up|Down))")
         # RF Profile Name                  Band     Description                          State
         # ------------------------------------------------------------------------------------
@@ -298,7 +300,7 @@ class ShowApDot11DualBandSummary(ShowApDot11DualBandSummarySchema):
         ret_dict = {}
 
         # aa-test-4800                 64d8.14ff.fd0d  0     Enabled       Down           20     *1/8 (23 dBm)   Local   All        (6)*
-        ap_info_capture = re.compile(
+        ap_info_capture = regex_engine.compile(
             r"^(?P<ap_name>\S+)\s+(?P<ap_mac_address>\S+)\s+(?P<slot_id>\d+)\s+(?P<admin_state>(Enabled|Disabled))\s+(?P<oper_state>\S+)\s+(?P<width>\d+)\s+(?P<tx_pwr>(N\/A|\*.*m\)))\s+(?P<mode>\S+)\s+(?P<subband>\S+)\s+(?P<channel>\S+)$")
 
         ap_index = 0
@@ -455,74 +457,74 @@ class ShowApDot115GhzChannel(ShowApDot115GhzChannelSchema):
         #         Unused Channel List                      : 165,169,173
 
 
-        lead_auto_chan_assn_capture = re.compile(r"^(Leader|Local)\s+Automatic\s+Channel\s+Assignment$") #changed regex to handle Local or Leader Automatic Channel Assigment key
+        lead_auto_chan_assn_capture = regex_engine.compile(r"^(Leader|Local)\s+Automatic\s+Channel\s+Assignment$") #changed regex to handle Local or Leader Automatic Channel Assigment key
         #   Channel Assignment Mode                    : AUTO
-        chan_assn_mode_capture = re.compile(r"^Channel\s+Assignment\s+Mode\s+:\s+(?P<chan_assn_mode>\S+)")
+        chan_assn_mode_capture = regex_engine.compile(r"^Channel\s+Assignment\s+Mode\s+:\s+(?P<chan_assn_mode>\S+)")
         #   Channel Update Interval                    : 12 Hours
-        chan_update_int_capture = re.compile(r"^Channel\s+Update\s+Interval\s+:\s+(?P<chan_upd_int>.*)$")
+        chan_update_int_capture = regex_engine.compile(r"^Channel\s+Update\s+Interval\s+:\s+(?P<chan_upd_int>.*)$")
         #   Anchor time (Hour of the day)              : 7
-        anchor_time_capture = re.compile(
+        anchor_time_capture = regex_engine.compile(
             r"^Anchor\s+time\s+\(Hour\s+of\s+the\s+day\)\s+:\s+(?P<anchor_time_hour>\d+)$")
         #   Channel Update Contribution
-        chan_upd_cont_capture = re.compile(r"^Channel\s+Update\s+Contribution$")
+        chan_upd_cont_capture = regex_engine.compile(r"^Channel\s+Update\s+Contribution$")
         #     Noise                                    : Enable
-        channel_noise_capture = re.compile(r"^Noise\s+:\s+(?P<channel_noise>(Enable|Disable))$")
+        channel_noise_capture = regex_engine.compile(r"^Noise\s+:\s+(?P<channel_noise>(Enable|Disable))$")
         #     Interference                             : Enable
-        channel_interference_capture = re.compile(r"^Interference\s+:\s+(?P<channel_interference>(Enable|Disable))$")
+        channel_interference_capture = regex_engine.compile(r"^Interference\s+:\s+(?P<channel_interference>(Enable|Disable))$")
         #     Load                                     : Disable
-        channel_load_capture = re.compile(r"^Load\s+:\s+(?P<channel_load>(Enable|Disable))$")
+        channel_load_capture = regex_engine.compile(r"^Load\s+:\s+(?P<channel_load>(Enable|Disable))$")
         #     Device Aware                             : Disable
-        device_aware_capture = re.compile(r"^Device\s+Aware\s+:\s+(?P<device_aware>(Enable|Disable))$")
+        device_aware_capture = regex_engine.compile(r"^Device\s+Aware\s+:\s+(?P<device_aware>(Enable|Disable))$")
         #   CleanAir Event-driven RRM option           : Disabled
-        clean_air_capture = re.compile(
+        clean_air_capture = regex_engine.compile(
             r"^CleanAir\s+Event-driven\s+RRM\s+option\s+:\s+(?P<clean_air>(Enabled|Disabled))$")
         #   Channel Assignment Leader                  : sj-00a-ewlc1 (10.7.5.133)
         #   Channel Assignment Leader                  : vidya-ewlc-5 (9.4.62.51) (2001:9:4:62::51) 
-        chan_assn_leader_capture = re.compile(r'^Channel\s+Assignment\s+Leader\s+:\s+(?P<wlc_leader_name>\S+)\s+((?P<wlc_leader_ip>\(\d+\.\d+\.\d+\.\d+\))|(?P<wlc_leader_ipv4>\(\d+\.\d+\.\d+\.\d+\))\s+(?P<wlc_leader_ipv6>\(\d+\:\d+\:\d+\:\d+\::\d+\)))$')
+        chan_assn_leader_capture = regex_engine.compile(r'^Channel\s+Assignment\s+Leader\s+:\s+(?P<wlc_leader_name>\S+)\s+((?P<wlc_leader_ip>\(\d+\.\d+\.\d+\.\d+\))|(?P<wlc_leader_ipv4>\(\d+\.\d+\.\d+\.\d+\))\s+(?P<wlc_leader_ipv6>\(\d+\:\d+\:\d+\:\d+\::\d+\)))$')
         #   Last Run                                   : 15995 seconds ago
-        last_run_capture = re.compile(r"^Last\s+Run\s+:\s+(?P<last_run_seconds>\d+)\s+seconds\s+ago$")
+        last_run_capture = regex_engine.compile(r"^Last\s+Run\s+:\s+(?P<last_run_seconds>\d+)\s+seconds\s+ago$")
         #   DCA Sensitivity Level                      : MEDIUM : 15 dB
-        dca_sensitivity_capture = re.compile(
+        dca_sensitivity_capture = regex_engine.compile(
             r"^DCA\s+Sensitivity\s+Level\s+:\s+(?P<dca_level>\S+)\s+:\s+(?P<dca_db>\d+)\s+dB$")
         #   DCA 802.11n/ac Channel Width               : 80 MHz
         #   DCA 802.11n/ac Channel Width               : best 
-        dca_chan_width_capture = re.compile(r"^DCA\s+802\.11n\/ac\s+Channel\s+Width\s+:\s+((?P<chan_width>(\d+\S+|\S+)))")
+        dca_chan_width_capture = regex_engine.compile(r"^DCA\s+802\.11n\/ac\s+Channel\s+Width\s+:\s+((?P<chan_width>(\d+\S+|\S+)))")
         #   DBS Max Channel Width                      : 80 MHz
-        dbs_max_chan_width_capture = re.compile(
+        dbs_max_chan_width_capture = regex_engine.compile(
             r"^DBS\s+Max\s+Channel\s+Width\s+:\s+(?P<max_chan_width>\d+)\s+MHz$")
         #   DCA Minimum Energy Limit                   : -95 dBm
-        dca_min_energy_capture = re.compile(
+        dca_min_energy_capture = regex_engine.compile(
             r"^DCA\s+Minimum\s+Energy\s+Limit\s+:\s+(?P<dca_min_energy_dbm>\S+)\s+dBm$")
         #   Channel Energy Levels
-        chan_energy_levels_capture = re.compile(r"^Channel\s+Energy\s+Levels$")
+        chan_energy_levels_capture = regex_engine.compile(r"^Channel\s+Energy\s+Levels$")
         #     Minimum                                  : -94 dBm
-        chan_energy_min_capture = re.compile(r"^Minimum\s+:\s+(?P<chan_energy_min_dbm>\S+)\s+dBm")
+        chan_energy_min_capture = regex_engine.compile(r"^Minimum\s+:\s+(?P<chan_energy_min_dbm>\S+)\s+dBm")
         #     Average                                  : -82 dBm
-        chan_energy_average_capture = re.compile(r"^Average\s+:\s+(?P<chan_energy_average_dbm>\S+)\s+dBm")
+        chan_energy_average_capture = regex_engine.compile(r"^Average\s+:\s+(?P<chan_energy_average_dbm>\S+)\s+dBm")
         #     Maximum                                  : -81 dBm
-        chan_energy_max_capture = re.compile(r"^Maximum\s+:\s+(?P<chan_energy_max_dbm>\S+)\s+dBm")
+        chan_energy_max_capture = regex_engine.compile(r"^Maximum\s+:\s+(?P<chan_energy_max_dbm>\S+)\s+dBm")
         #   Channel Dwell Times
-        chan_dwell_times_capture = re.compile(r"^Channel\s+Dwell\s+Times$")
+        chan_dwell_times_capture = regex_engine.compile(r"^Channel\s+Dwell\s+Times$")
         #     Minimum                                  : 4 hours 9 minutes 54 seconds
         #     Minimum                                  : 2 days 2 hours 52 minutes 25 seconds 
-        chan_dwell_minimum_capture = re.compile(r"^Minimum\s+:\s+((?P<chan_dwell_min_days>\d+)\s+(day|days)\s+)?((?P<chan_dwell_min_hours>\d+)\s+(hour|hours)\s+)?((?P<chan_dwell_min_minutes>\d+)\s+(minute|minutes)\s+)?(?P<chan_dwell_min_seconds>\d+)\s+(second|seconds)$")
+        chan_dwell_minimum_capture = regex_engine.compile(r"^Minimum\s+:\s+((?P<chan_dwell_min_days>\d+)\s+(day|days)\s+)?((?P<chan_dwell_min_hours>\d+)\s+(hour|hours)\s+)?((?P<chan_dwell_min_minutes>\d+)\s+(minute|minutes)\s+)?(?P<chan_dwell_min_seconds>\d+)\s+(second|seconds)$")
         #     Average                                  : 4 hours 24 minutes 54 seconds
         #     Average                                  : 3 days 11 hours 58 minutes 52 seconds 
-        chan_dwell_average_capture = re.compile(  r"^Average\s+:\s+((?P<chan_dwell_average_days>\d+)\s+(day|days)\s+)?((?P<chan_dwell_average_hours>\d+)\s+(hour|hours)\s+)?((?P<chan_dwell_average_minutes>\d+)\s+(minute|minutes)\s+)?(?P<chan_dwell_average_second>\d+)\s+(second|seconds)$")
+        chan_dwell_average_capture = regex_engine.compile(  r"^Average\s+:\s+((?P<chan_dwell_average_days>\d+)\s+(day|days)\s+)?((?P<chan_dwell_average_hours>\d+)\s+(hour|hours)\s+)?((?P<chan_dwell_average_minutes>\d+)\s+(minute|minutes)\s+)?(?P<chan_dwell_average_second>\d+)\s+(second|seconds)$")
         #     Maximum                                  : 4 hours 26 minutes 35 seconds
         #     Maximum                                  : 3 days 23 hours 13 minutes 12 seconds 
-        chan_dwell_max_capture = re.compile(r"^Maximum\s+:\s+((?P<chan_dwell_max_days>\d+)\s+(day|days)\s+)?((?P<chan_dwell_max_hours>\d+)\s+(hour|hours)\s+)?((?P<chan_dwell_max_minutes>\d+)\s+(minute|minutes)\s+)?(?P<chan_dwell_max_seconds>\d+)\s+(second|seconds)$")
+        chan_dwell_max_capture = regex_engine.compile(r"^Maximum\s+:\s+((?P<chan_dwell_max_days>\d+)\s+(day|days)\s+)?((?P<chan_dwell_max_hours>\d+)\s+(hour|hours)\s+)?((?P<chan_dwell_max_minutes>\d+)\s+(minute|minutes)\s+)?(?P<chan_dwell_max_seconds>\d+)\s+(second|seconds)$")
 
         # 802.11a 5 GHz Auto-RF Channel List
-        channel_list_capture = re.compile(r"^802.11a\s+5\s+GHz\s+Auto-RF\s+Channel\s+List$")
+        channel_list_capture = regex_engine.compile(r"^802.11a\s+5\s+GHz\s+Auto-RF\s+Channel\s+List$")
         # Allowed Channel List             : 36,40,44,48,52,56,60,64,100,104,108,112,116,120,124,128,132,136,140,144,149,153,157,161
-        allowed_channel_list_capture = re.compile(r"^Allowed\s+Channel\s+List\s+:\s+(?P<allowed_channel_list>\S+)$")
+        allowed_channel_list_capture = regex_engine.compile(r"^Allowed\s+Channel\s+List\s+:\s+(?P<allowed_channel_list>\S+)$")
         # Unused Channel List              : 52,56,60,64,100,104,108,112,116,120,124,128,132,136,140,144,165,169,173 
-        unused_channel_list_capture = re.compile(r"^Unused\s+Channel\s+List\s+:\s+(?P<unused_channel_list>\S+)$") 
+        unused_channel_list_capture = regex_engine.compile(r"^Unused\s+Channel\s+List\s+:\s+(?P<unused_channel_list>\S+)$") 
         # Zero Wait DFS                    : Disabled 
-        zero_wait_capture = re.compile(r"^Zero\s+Wait\s+DFS\s+:\s+(?P<zero_wait>(Enabled|Disabled))$") 
+        zero_wait_capture = regex_engine.compile(r"^Zero\s+Wait\s+DFS\s+:\s+(?P<zero_wait>(Enabled|Disabled))$") 
         # DCA Aggressive Remaining Cycle   : 6(60 minutes)
-        dca_aggressive_capture = re.compile(r"^DCA\s+Aggressive\s+Remaining\s+Cycle\s+:\s+(?P<dca_aggressive>\S+\s+\w+\S)") 
+        dca_aggressive_capture = regex_engine.compile(r"^DCA\s+Aggressive\s+Remaining\s+Cycle\s+:\s+(?P<dca_aggressive>\S+\s+\w+\S)") 
 
 
         def change_data_type(value):
@@ -871,19 +873,19 @@ class ShowApDot115GhzSummary(ShowApDot115GhzSummarySchema):
 
         # AP Name                       Mac Address     Slot    Admin State    Oper State    Width  Txpwr           Channel
         # AP Name                       Mac Address     Slot    Admin State    Oper State    Width  Txpwr           Channel     Mode
-        ap_header_capture = re.compile(
+        ap_header_capture = regex_engine.compile(
             r"^AP\s+Name\s+Mac\s+Address\s+Slot\s+Admin\s+State\s+Oper\s+State\s+Width\s+Txpwr\s+Channel$")
         # ---------------------------------------------------------------------------------------------------------------------------------
-        delimiter_capture = re.compile(
+        delimiter_capture = regex_engine.compile(
             r"^---------------------------------------------------------------------------------------------------------------------------------$")
 
 
         # ab22-cap10                   5c50.15ff.8fe4 1       Enabled        Up            20     *6/8 (9 dBm)    (132)*
         # BHS-A-204 				   00a7.42ff.d4d0 1 	  Enabled 		 Up 		   20 	   3/7 (12 dBm)   (124)   Local
-        p1 = re.compile(r"^(?P<ap_name>\S+)\s+(?P<mac_address>\S+)\s+"
-                                       r"(?P<slot>\d+)\s+(?P<admin_state>(Enabled|Disabled))\s+(?P<oper_state>\S+)\s+"
-                                       r"(?P<width>\d+)\s+(?P<tx_pwr>(\*\d\/\d.*dBm\))|(\d\/\d.*dBm\)))\s+"
-                                       r"(?P<channel>\S+)\s*(?P<mode>\S+|^.{0}$)?$")
+        p1 = regex_engine.compile(r"^(?P<ap_name>\S+)\s+(?P<mac_address>\S+)\s+"
+                                                 r"(?P<slot>\d+)\s+(?P<admin_state>(Enabled|Disabled))\s+(?P<oper_state>\S+)\s+"
+                                                 r"(?P<width>\d+)\s+(?P<tx_pwr>(\*\d\/\d.*dBm\))|(\d\/\d.*dBm\)))\s+"
+                                                 r"(?P<channel>\S+)\s*(?P<mode>\S+|^.{0}$)?$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -999,9 +1001,9 @@ class ShowApRfProfileSummary(ShowApRfProfileSummarySchema):
 
 
         # Number of RF-profiles: 14
-        rf_profile_count_capture = re.compile(r"^Number\s+of\s+RF-profiles:\s+(?P<rf_profile_count>\d+)")
+        rf_profile_count_capture = regex_engine.compile(r"^Number\s+of\s+RF-profiles:\s+(?P<rf_profile_count>\d+)")
         # Custom-RF_a                      5 GHz    Custom-RF_a_Desc                     Up
-        rf_profile_info_capture = re.compile(
+        rf_profile_info_capture = regex_engine.compile(
             r"^(?P<rf_profile_name>\S+)\s+(?P<band>\S+\s+\S+)\s+(?P<description>.*)(?P<state>(Up|Down))")
         # RF Profile Name                  Band     Description                          State
         # ------------------------------------------------------------------------------------
@@ -1104,11 +1106,11 @@ class ShowApLedBrightnessLevelSummary(ShowApLedBrightnessLevelSummarySchema):
         # b822-cap16                    8
 
         # AP Name                           LED Brightness level
-        ap_header_capture = re.compile(r"^AP\s+Name\s+LED\s+Brightness\s+level$")
+        ap_header_capture = regex_engine.compile(r"^AP\s+Name\s+LED\s+Brightness\s+level$")
         # --------------------------------------------------------
-        delimiter_capture = re.compile(r"^--------------------------------------------------------$")
+        delimiter_capture = regex_engine.compile(r"^--------------------------------------------------------$")
         # jain-farallon                  8
-        ap_info_capture = re.compile(r"^(?P<ap_name>\S+)\s+(?P<led_brightness_level>\d+)$")
+        ap_info_capture = regex_engine.compile(r"^(?P<ap_name>\S+)\s+(?P<led_brightness_level>\d+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1197,14 +1199,14 @@ class ShowApCdpNeighbor(ShowApCdpNeighborSchema):
         #
 
 
-        neighbor_count_capture = re.compile(r"^Number\s+of\s+neighbors:\s+(?P<neighbor_count>\d+)$")
+        neighbor_count_capture = regex_engine.compile(r"^Number\s+of\s+neighbors:\s+(?P<neighbor_count>\d+)$")
         # 0221-cap22                   10.8.33.106                              a02-21-sd-sw1.cisco.com TenGigabitEthernet3/0/47
-        neighbor_info_capture = re.compile(
+        neighbor_info_capture = regex_engine.compile(
             r"^(?P<ap_name>\S+)\s+(?P<ap_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<neighbor_name>\S+)\s+(?P<neighbor_port>\S+)$")
         # Neighbor IP Count: 1
-        neighbor_ip_count_capture = re.compile(r"^Neighbor\s+IP\s+Count:\s+(?P<neighbor_ip_count>\d+)$")
+        neighbor_ip_count_capture = regex_engine.compile(r"^Neighbor\s+IP\s+Count:\s+(?P<neighbor_ip_count>\d+)$")
         # 10.8.32.1
-        neighbor_ip_capture = re.compile(r"^(?P<neighbor_ip>\d+\.\d+\.\d+\.\d+)$")
+        neighbor_ip_capture = regex_engine.compile(r"^(?P<neighbor_ip>\d+\.\d+\.\d+\.\d+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1526,376 +1528,376 @@ class ShowApConfigGeneral(ShowApConfigGeneralSchema):
      
 
         # Cisco AP Name   : bg-1-cap1
-        cisco_ap_name_capture = re.compile(r"^Cisco\s+AP\s+Name\s+:\s+(?P<cisco_ap_name>.*)$")
+        cisco_ap_name_capture = regex_engine.compile(r"^Cisco\s+AP\s+Name\s+:\s+(?P<cisco_ap_name>.*)$")
         
         # Cisco AP Identifier                             : 70b3.d2ff.59b6
-        cisco_ap_identifier_capture = re.compile(r"^Cisco\s+AP\s+Identifier\s+:\s+(?P<cisco_ap_identifier>.*)$")
+        cisco_ap_identifier_capture = regex_engine.compile(r"^Cisco\s+AP\s+Identifier\s+:\s+(?P<cisco_ap_identifier>.*)$")
         
         # Country Code                                    : IN
-        country_code_capture = re.compile(r"^Country\s+Code\s+:\s+(?P<country_code>.*)$")
+        country_code_capture = regex_engine.compile(r"^Country\s+Code\s+:\s+(?P<country_code>.*)$")
         
         # Regulatory Domain Allowed by Country            : 802.11bg:-A   802.11a:-DN
-        regulatory_domain_allowed_by_country_capture = re.compile(
+        regulatory_domain_allowed_by_country_capture = regex_engine.compile(
             r"^Regulatory\s+Domain\s+Allowed\s+by\s+Country\s+:\s+(?P<regulatory_domain_allowed_by_country>.*)$")
         
         # AP Country Code                                 : IN  - India
-        ap_country_code_capture = re.compile(r"^AP\s+Country\s+Code\s+:\s+(?P<ap_country_code>.*)$")
+        ap_country_code_capture = regex_engine.compile(r"^AP\s+Country\s+Code\s+:\s+(?P<ap_country_code>.*)$")
         
         # Slot 0                                        : -A
-        slot_0_capture = re.compile(r"^Slot\s+0\s+:\s+(?P<slot_0>.*)$")
+        slot_0_capture = regex_engine.compile(r"^Slot\s+0\s+:\s+(?P<slot_0>.*)$")
         
         # Slot 1                                        : -D
-        slot_1_capture = re.compile(r"^Slot\s+1\s+:\s+(?P<slot_1>.*)$")
+        slot_1_capture = regex_engine.compile(r"^Slot\s+1\s+:\s+(?P<slot_1>.*)$")
         
         # MAC Address                                     : 70b3.17ff.bdcc
-        mac_address_capture = re.compile(r"^MAC\s+Address\s+:\s+(?P<mac_address>.*)$")
+        mac_address_capture = regex_engine.compile(r"^MAC\s+Address\s+:\s+(?P<mac_address>.*)$")
         
         # IP Address Configuration                        : DHCP
-        ip_address_configuration_capture = re.compile(
+        ip_address_configuration_capture = regex_engine.compile(
             r"^IP\s+Address\s+Configuration\s+:\s+(?P<ip_address_configuration>.*)$")
         
         # IP Address                                      : 10.10.5.14
-        ip_address_capture = re.compile(r"^IP\s+Address\s+:\s+(?P<ip_address>.*)$")
+        ip_address_capture = regex_engine.compile(r"^IP\s+Address\s+:\s+(?P<ip_address>.*)$")
         
         # IP Netmask                                      : 255.255.254.0
-        ip_netmask_capture = re.compile(r"^IP\s+Netmask\s+:\s+(?P<ip_netmask>.*)$")
+        ip_netmask_capture = regex_engine.compile(r"^IP\s+Netmask\s+:\s+(?P<ip_netmask>.*)$")
         
         # Gateway IP Address                              : 10.10.5.1
-        gateway_ip_address_capture = re.compile(r"^Gateway\s+IP\s+Address\s+:\s+(?P<gateway_ip_address>.*)$")
+        gateway_ip_address_capture = regex_engine.compile(r"^Gateway\s+IP\s+Address\s+:\s+(?P<gateway_ip_address>.*)$")
         
         # Fallback IP Address Being Used                  :
-        fallback_ip_address_being_used_capture = re.compile(
+        fallback_ip_address_being_used_capture = regex_engine.compile(
             r"^Fallback\s+IP\s+Address\s+Being\s+Used\s+:\s+(?P<fallback_ip_address_being_used>.*)$")
         
         # Domain                                          :
-        domain_capture = re.compile(r"^Domain\s+:\s+(?P<domain>.*)$")
+        domain_capture = regex_engine.compile(r"^Domain\s+:\s+(?P<domain>.*)$")
         
         # Name Server                                     :
-        name_server_capture = re.compile(r"^Name\s+Server\s+:\s+(?P<name_server>.*)$")
+        name_server_capture = regex_engine.compile(r"^Name\s+Server\s+:\s+(?P<name_server>.*)$")
         
         # CAPWAP Path MTU                                 : 1485
-        capwap_path_mtu_capture = re.compile(r"^CAPWAP\s+Path\s+MTU\s+:\s+(?P<capwap_path_mtu>.*)$")
+        capwap_path_mtu_capture = regex_engine.compile(r"^CAPWAP\s+Path\s+MTU\s+:\s+(?P<capwap_path_mtu>.*)$")
         
         # Capwap Active Window Size                       : 1
-        capwap_active_window_size_capture = re.compile(
+        capwap_active_window_size_capture = regex_engine.compile(
             r"^Capwap\s+Active\s+Window\s+Size\s+:\s+(?P<capwap_active_window_size>.*)$")
         
         # Telnet State                                    : Disabled
-        telnet_state_capture = re.compile(r"^Telnet\s+State\s+:\s+(?P<telnet_state>.*)$")
+        telnet_state_capture = regex_engine.compile(r"^Telnet\s+State\s+:\s+(?P<telnet_state>.*)$")
         
         # CPU Type                                        :  ARMv7 Processor rev 1 (v7l)
-        cpu_type_capture = re.compile(r"^CPU\s+Type\s+:\s+(?P<cpu_type>.*)$")
+        cpu_type_capture = regex_engine.compile(r"^CPU\s+Type\s+:\s+(?P<cpu_type>.*)$")
         
         # Memory Type                                     : DDR3
-        memory_type_capture = re.compile(r"^Memory\s+Type\s+:\s+(?P<memory_type>.*)$")
+        memory_type_capture = regex_engine.compile(r"^Memory\s+Type\s+:\s+(?P<memory_type>.*)$")
         
         # Memory Size                                     : 1028096 KB
-        memory_size_capture = re.compile(r"^Memory\s+Size\s+:\s+(?P<memory_size>\d+)\s+KB$")
+        memory_size_capture = regex_engine.compile(r"^Memory\s+Size\s+:\s+(?P<memory_size>\d+)\s+KB$")
         
         # SSH State                                       : Enabled
-        ssh_state_capture = re.compile(r"^SSH\s+State\s+:\s+(?P<ssh_state>.*)$")
+        ssh_state_capture = regex_engine.compile(r"^SSH\s+State\s+:\s+(?P<ssh_state>.*)$")
         
         # Cisco AP Location                               : default location
-        cisco_ap_location_capture = re.compile(r"^Cisco\s+AP\s+Location\s+:\s+(?P<cisco_ap_location>.*)$")
+        cisco_ap_location_capture = regex_engine.compile(r"^Cisco\s+AP\s+Location\s+:\s+(?P<cisco_ap_location>.*)$")
         
         # Site Tag Name                                   : b8
-        site_tag_name_capture = re.compile(r"^Site\s+Tag\s+Name\s+:\s+(?P<site_tag_name>.*)$")
+        site_tag_name_capture = regex_engine.compile(r"^Site\s+Tag\s+Name\s+:\s+(?P<site_tag_name>.*)$")
         
         # RF Tag Name                                     : Custom-RF
-        rf_tag_name_capture = re.compile(r"^RF\s+Tag\s+Name\s+:\s+(?P<rf_tag_name>.*)$")
+        rf_tag_name_capture = regex_engine.compile(r"^RF\s+Tag\s+Name\s+:\s+(?P<rf_tag_name>.*)$")
         
         # Policy Tag Name                                 : b1_policy_tag
-        policy_tag_name_capture = re.compile(r"^Policy\s+Tag\s+Name\s+:\s+(?P<policy_tag_name>.*)$")
+        policy_tag_name_capture = regex_engine.compile(r"^Policy\s+Tag\s+Name\s+:\s+(?P<policy_tag_name>.*)$")
         
         # AP join Profile                                 : APG_b18
-        ap_join_profile_capture = re.compile(r"^AP\s+join\s+Profile\s+:\s+(?P<ap_join_profile>.*)$")
+        ap_join_profile_capture = regex_engine.compile(r"^AP\s+join\s+Profile\s+:\s+(?P<ap_join_profile>.*)$")
         
         # Flex Profile                                    : default-flex-profile
-        flex_profile_capture = re.compile(r"^Flex\s+Profile\s+:\s+(?P<flex_profile>.*)$")
+        flex_profile_capture = regex_engine.compile(r"^Flex\s+Profile\s+:\s+(?P<flex_profile>.*)$")
         
         # AP Filter name                                  : b8
-        ap_filter_name_capture = re.compile(r"^AP\s+Filter\s+name\s+:\s+(?P<ap_filter_name>.*)$")
+        ap_filter_name_capture = regex_engine.compile(r"^AP\s+Filter\s+name\s+:\s+(?P<ap_filter_name>.*)$")
         
         # Primary Cisco Controller Name                   : b7-wl-ewlc1
-        primary_cisco_controller_name_capture = re.compile(
+        primary_cisco_controller_name_capture = regex_engine.compile(
             r"^Primary\s+Cisco\s+Controller\s+Name\s+:\s+(?P<primary_cisco_controller_name>.*)$")
         
         # Primary Cisco Controller IP Address             : 10.6.4.17
-        primary_cisco_controller_ip_address_capture = re.compile(
+        primary_cisco_controller_ip_address_capture = regex_engine.compile(
             r"^Primary\s+Cisco\s+Controller\s+IP\s+Address\s+:\s+(?P<primary_cisco_controller_ip_address>.*)$")
         
         # Secondary Cisco Controller Name                 : b8-wl-wlc3
-        secondary_cisco_controller_name_capture = re.compile(
+        secondary_cisco_controller_name_capture = regex_engine.compile(
             r"^Secondary\s+Cisco\s+Controller\s+Name\s+:\s+(?P<secondary_cisco_controller_name>.*)$")
         
         # Secondary Cisco Controller IP Address           : 10.6.7.16
-        secondary_cisco_controller_ip_address_capture = re.compile(
+        secondary_cisco_controller_ip_address_capture = regex_engine.compile(
             r"^Secondary\s+Cisco\s+Controller\s+IP\s+Address\s+:\s+(?P<secondary_cisco_controller_ip_address>.*)$")
         
         # Tertiary Cisco Controller Name                  : b3-wl-wlc3
-        tertiary_cisco_controller_name_capture = re.compile(
+        tertiary_cisco_controller_name_capture = regex_engine.compile(
             r"^Tertiary\s+Cisco\s+Controller\s+Name\s+:\s+(?P<tertiary_cisco_controller_name>.*)$")
         
         # Tertiary Cisco Controller IP Address            : 10.6.4.17
-        tertiary_cisco_controller_ip_address_capture = re.compile(
+        tertiary_cisco_controller_ip_address_capture = regex_engine.compile(
             r"^Tertiary\s+Cisco\s+Controller\s+IP\s+Address\s+:\s+(?P<tertiary_cisco_controller_ip_address>.*)$")
         
         # Administrative State                            : Enabled
-        administrative_state_capture = re.compile(r"^Administrative\s+State\s+:\s+(?P<administrative_state>.*)$")
+        administrative_state_capture = regex_engine.compile(r"^Administrative\s+State\s+:\s+(?P<administrative_state>.*)$")
         
         # Operation State                                 : Registered
-        operation_state_capture = re.compile(r"^Operation\s+State\s+:\s+(?P<operation_state>.*)$")
+        operation_state_capture = regex_engine.compile(r"^Operation\s+State\s+:\s+(?P<operation_state>.*)$")
         
         # NAT External IP Address                         : 10.10.5.12
-        nat_external_ip_address_capture = re.compile(
+        nat_external_ip_address_capture = regex_engine.compile(
             r"^NAT\s+External\s+IP\s+Address\s+:\s+(?P<nat_external_ip_address>.*)$")
         
         # AP Certificate type                             : Manufacturer Installed Certificate
-        ap_certificate_type_capture = re.compile(r"^AP\s+Certificate\s+type\s+:\s+(?P<ap_certificate_type>.*)$")
+        ap_certificate_type_capture = regex_engine.compile(r"^AP\s+Certificate\s+type\s+:\s+(?P<ap_certificate_type>.*)$")
         
         # AP Mode                                         : Local
-        ap_mode_capture = re.compile(r"^AP\s+Mode\s+:\s+(?P<ap_mode>.*)$")
+        ap_mode_capture = regex_engine.compile(r"^AP\s+Mode\s+:\s+(?P<ap_mode>.*)$")
         
         # AP VLAN tagging state                           : Disabled
-        ap_vlan_tagging_state_capture = re.compile(r"^AP\s+VLAN\s+tagging\s+state\s+:\s+(?P<ap_vlan_tagging_state>.*)$")
+        ap_vlan_tagging_state_capture = regex_engine.compile(r"^AP\s+VLAN\s+tagging\s+state\s+:\s+(?P<ap_vlan_tagging_state>.*)$")
         
         # AP VLAN tag                                     : 0
-        ap_vlan_tag_capture = re.compile(r"^AP\s+VLAN\s+tag\s+:\s+(?P<ap_vlan_tag>.*)$")
+        ap_vlan_tag_capture = regex_engine.compile(r"^AP\s+VLAN\s+tag\s+:\s+(?P<ap_vlan_tag>.*)$")
         
         # CAPWAP Preferred mode                           : IPv4
-        capwap_preferred_mode_capture = re.compile(r"^CAPWAP\s+Preferred\s+mode\s+:\s+(?P<capwap_preferred_mode>.*)$")
+        capwap_preferred_mode_capture = regex_engine.compile(r"^CAPWAP\s+Preferred\s+mode\s+:\s+(?P<capwap_preferred_mode>.*)$")
         
         # CAPWAP UDP-Lite                                 : Not Configured
-        capwap_udp_lite_capture = re.compile(r"^CAPWAP\s+UDP-Lite\s+:\s+(?P<capwap_udp_lite>.*)$")
+        capwap_udp_lite_capture = regex_engine.compile(r"^CAPWAP\s+UDP-Lite\s+:\s+(?P<capwap_udp_lite>.*)$")
         
         # AP Submode                                      : Not Configured
-        ap_submode_capture = re.compile(r"^AP\s+Submode\s+:\s+(?P<ap_submode>.*)$")
+        ap_submode_capture = regex_engine.compile(r"^AP\s+Submode\s+:\s+(?P<ap_submode>.*)$")
         
         # Office Extend Mode                              : Disabled
-        office_extend_mode_capture = re.compile(r"^Office\s+Extend\s+Mode\s+:\s+(?P<office_extend_mode>.*)$")
+        office_extend_mode_capture = regex_engine.compile(r"^Office\s+Extend\s+Mode\s+:\s+(?P<office_extend_mode>.*)$")
         
         # Dhcp Server                                     : Disabled
-        dhcp_server_capture = re.compile(r"^Dhcp\s+Server\s+:\s+(?P<dhcp_server>.*)$")
+        dhcp_server_capture = regex_engine.compile(r"^Dhcp\s+Server\s+:\s+(?P<dhcp_server>.*)$")
         
         # Remote AP Debug                                 : Disabled
-        remote_ap_debug_capture = re.compile(r"^Remote\s+AP\s+Debug\s+:\s+(?P<remote_ap_debug>.*)$")
+        remote_ap_debug_capture = regex_engine.compile(r"^Remote\s+AP\s+Debug\s+:\s+(?P<remote_ap_debug>.*)$")
         
         # Logging Trap Severity Level                     : information
-        logging_trap_severity_level_capture = re.compile(
+        logging_trap_severity_level_capture = regex_engine.compile(
             r"^Logging\s+Trap\s+Severity\s+Level\s+:\s+(?P<logging_trap_severity_level>.*)$")
         
         # Logging Syslog facility                         : kern
-        logging_syslog_facility_capture = re.compile(
+        logging_syslog_facility_capture = regex_engine.compile(
             r"^Logging\s+Syslog\s+facility\s+:\s+(?P<logging_syslog_facility>.*)$")
         
         # Software Version                                : 10.145.1.9
-        software_version_capture = re.compile(r"^Software\s+Version\s+:\s+(?P<software_version>.*)$")
+        software_version_capture = regex_engine.compile(r"^Software\s+Version\s+:\s+(?P<software_version>.*)$")
         
         # Boot Version                                    : 10.4.2.4
-        boot_version_capture = re.compile(r"^Boot\s+Version\s+:\s+(?P<boot_version>.*)$")
+        boot_version_capture = regex_engine.compile(r"^Boot\s+Version\s+:\s+(?P<boot_version>.*)$")
         
         # Mini IOS Version                                : 0.0.0.0
-        mini_ios_version_capture = re.compile(r"^Mini\s+IOS\s+Version\s+:\s+(?P<mini_ios_version>.*)$")
+        mini_ios_version_capture = regex_engine.compile(r"^Mini\s+IOS\s+Version\s+:\s+(?P<mini_ios_version>.*)$")
         
         # Stats Reporting Period                          : 0
-        stats_reporting_period_capture = re.compile(
+        stats_reporting_period_capture = regex_engine.compile(
             r"^Stats\s+Reporting\s+Period\s+:\s+(?P<stats_reporting_period>.*)$")
         
         # LED State                                       : Enabled
-        led_state_capture = re.compile(r"^LED\s+State\s+:\s+(?P<led_state>.*)$")
+        led_state_capture = regex_engine.compile(r"^LED\s+State\s+:\s+(?P<led_state>.*)$")
         
         # LED Flash State                                 : Enabled
-        led_flash_state_capture = re.compile(r"^LED\s+Flash\s+State\s+:\s+(?P<led_flash_state>.*)$")
+        led_flash_state_capture = regex_engine.compile(r"^LED\s+Flash\s+State\s+:\s+(?P<led_flash_state>.*)$")
         
         # LED Flash Timer                                 : 0
-        led_flash_timer_capture = re.compile(r"^LED\s+Flash\s+Timer\s+:\s+(?P<led_flash_timer>.*)$")
+        led_flash_timer_capture = regex_engine.compile(r"^LED\s+Flash\s+Timer\s+:\s+(?P<led_flash_timer>.*)$")
         
         # MDNS Group Id                                   : 0
-        mdns_group_id_capture = re.compile(r"^MDNS\s+Group\s+Id\s+:\s+(?P<mdns_group_id>.*)$")
+        mdns_group_id_capture = regex_engine.compile(r"^MDNS\s+Group\s+Id\s+:\s+(?P<mdns_group_id>.*)$")
         
         # MDNS Rule Name                                  :
-        mdns_rule_name_capture = re.compile(r"^MDNS\s+Rule\s+Name\s+:\s+(?P<mdns_rule_name>.*)$")
+        mdns_rule_name_capture = regex_engine.compile(r"^MDNS\s+Rule\s+Name\s+:\s+(?P<mdns_rule_name>.*)$")
         
         # PoE Pre-Standard Switch                         : Disabled
-        poe_pre_standard_switch_capture = re.compile(
+        poe_pre_standard_switch_capture = regex_engine.compile(
             r"^PoE\s+Pre-Standard\s+Switch\s+:\s+(?P<poe_pre_standard_switch>.*)$")
         
         # PoE Power Injector MAC Address                  : Disabled
-        poe_power_injector_mac_address_capture = re.compile(
+        poe_power_injector_mac_address_capture = regex_engine.compile(
             r"^PoE\s+Power\s+Injector\s+MAC\s+Address\s+:\s+(?P<poe_power_injector_mac_address>.*)$")
         
         # Power Type/Mode                                 : PoE/Full Power
-        power_type_mode_capture = re.compile(r"^Power\s+Type/Mode\s+:\s+(?P<power_type_mode>.*)$")
+        power_type_mode_capture = regex_engine.compile(r"^Power\s+Type/Mode\s+:\s+(?P<power_type_mode>.*)$")
         
         # Number of Slots                                 : 3
-        number_of_slots_capture = re.compile(r"^Number\s+of\s+Slots\s+:\s+(?P<number_of_slots>.*)$")
+        number_of_slots_capture = regex_engine.compile(r"^Number\s+of\s+Slots\s+:\s+(?P<number_of_slots>.*)$")
         
         # AP Model                                        : AIR-AP4800-D-K9
-        ap_model_capture = re.compile(r"^AP\s+Model\s+:\s+(?P<ap_model>.*)$")
+        ap_model_capture = regex_engine.compile(r"^AP\s+Model\s+:\s+(?P<ap_model>.*)$")
         
         # IOS Version                                     : 10.145.1.9
-        ios_version_capture = re.compile(r"^IOS\s+Version\s+:\s+(?P<ios_version>.*)$")
+        ios_version_capture = regex_engine.compile(r"^IOS\s+Version\s+:\s+(?P<ios_version>.*)$")
         
         # Reset Button                                    : Disabled
-        reset_button_capture = re.compile(r"^Reset\s+Button\s+:\s+(?P<reset_button>.*)$")
+        reset_button_capture = regex_engine.compile(r"^Reset\s+Button\s+:\s+(?P<reset_button>.*)$")
         
         # AP Serial Number                                : FGL2102AZZZ
-        ap_serial_number_capture = re.compile(r"^AP\s+Serial\s+Number\s+:\s+(?P<ap_serial_number>.*)$")
+        ap_serial_number_capture = regex_engine.compile(r"^AP\s+Serial\s+Number\s+:\s+(?P<ap_serial_number>.*)$")
         
         # Management Frame Validation                     : Capable
-        management_frame_validation_capture = re.compile(
+        management_frame_validation_capture = regex_engine.compile(
             r"^Management\s+Frame\s+Validation\s+:\s+(?P<management_frame_validation>.*)$")
         
         # Management Frame Protection                     : Capable
-        management_frame_protection_capture = re.compile(
+        management_frame_protection_capture = regex_engine.compile(
             r"^Management\s+Frame\s+Protection\s+:\s+(?P<management_frame_protection>.*)$")
         
         # AP User Name                                    : admin
-        ap_user_name_capture = re.compile(r"^AP\s+User\s+Name\s+:\s+(?P<ap_user_name>.*)$")
+        ap_user_name_capture = regex_engine.compile(r"^AP\s+User\s+Name\s+:\s+(?P<ap_user_name>.*)$")
         
         # AP 802.1X User Mode                             : Global
-        ap_802_1x_user_mode_capture = re.compile(r"^AP\s+802.1X\s+User\s+Mode\s+:\s+(?P<ap_802_1x_user_mode>.*)$")
+        ap_802_1x_user_mode_capture = regex_engine.compile(r"^AP\s+802.1X\s+User\s+Mode\s+:\s+(?P<ap_802_1x_user_mode>.*)$")
         
         # AP 802.1X User Name                             : Not Configured
-        ap_802_1x_user_name_capture = re.compile(r"^AP\s+802.1X\s+User\s+Name\s+:\s+(?P<ap_802_1x_user_name>.*)$")
+        ap_802_1x_user_name_capture = regex_engine.compile(r"^AP\s+802.1X\s+User\s+Name\s+:\s+(?P<ap_802_1x_user_name>.*)$")
         
         # Cisco AP System Logging Host                    : 10.16.19.6
-        cisco_ap_system_logging_host_capture = re.compile(
+        cisco_ap_system_logging_host_capture = regex_engine.compile(
             r"^Cisco\s+AP\s+System\s+Logging\s+Host\s+:\s+(?P<cisco_ap_system_logging_host>.*)$")
         
         # Cisco AP Secured Logging TLS mode               : Disabled
-        cisco_ap_secured_logging_tls_mode_capture = re.compile(
+        cisco_ap_secured_logging_tls_mode_capture = regex_engine.compile(
             r"^Cisco\s+AP\s+Secured\s+Logging\s+TLS\s+mode\s+:\s+(?P<cisco_ap_secured_logging_tls_mode>.*)$")
         
         # AP Up Time                                      : 3 days 9 hours 44 minutes 18 seconds
-        ap_up_time_capture = re.compile(r"^AP\s+Up\s+Time\s+:\s+(?P<ap_up_time>.*)$")
+        ap_up_time_capture = regex_engine.compile(r"^AP\s+Up\s+Time\s+:\s+(?P<ap_up_time>.*)$")
         
         # AP CAPWAP Up Time                               : 3 days 9 hours 37 minutes 20 seconds
-        ap_capwap_up_time_capture = re.compile(r"^AP\s+CAPWAP\s+Up\s+Time\s+:\s+(?P<ap_capwap_up_time>.*)$")
+        ap_capwap_up_time_capture = regex_engine.compile(r"^AP\s+CAPWAP\s+Up\s+Time\s+:\s+(?P<ap_capwap_up_time>.*)$")
         
         # Join Date and Time                              : 08/14/2020 19:48:09
-        join_date_and_time_capture = re.compile(r"^Join\s+Date\s+and\s+Time\s+:\s+(?P<join_date_and_time>.*)$")
+        join_date_and_time_capture = regex_engine.compile(r"^Join\s+Date\s+and\s+Time\s+:\s+(?P<join_date_and_time>.*)$")
         
         # Join Taken Time                                 : 6 minutes 57 seconds
-        join_taken_time_capture = re.compile(r"^Join\s+Taken\s+Time\s+:\s+(?P<join_taken_time>.*)$")
+        join_taken_time_capture = regex_engine.compile(r"^Join\s+Taken\s+Time\s+:\s+(?P<join_taken_time>.*)$")
         
         # Join Priority                                   : 1
-        join_priority_capture = re.compile(r"^Join\s+Priority\s+:\s+(?P<join_priority>.*)$")
+        join_priority_capture = regex_engine.compile(r"^Join\s+Priority\s+:\s+(?P<join_priority>.*)$")
         
         # AP Link Latency                                 : Disable
-        ap_link_latency_capture = re.compile(r"^AP\s+Link\s+Latency\s+:\s+(?P<ap_link_latency>.*)$")
+        ap_link_latency_capture = regex_engine.compile(r"^AP\s+Link\s+Latency\s+:\s+(?P<ap_link_latency>.*)$")
         
         # AP Lag Configuration Status                     : Disabled
-        ap_lag_configuration_status_capture = re.compile(
+        ap_lag_configuration_status_capture = regex_engine.compile(
             r"^AP\s+Lag\s+Configuration\s+Status\s+:\s+(?P<ap_lag_configuration_status>.*)$")
         
         # Lag Support for AP                              : Yes
-        lag_support_for_ap_capture = re.compile(r"^Lag\s+Support\s+for\s+AP\s+:\s+(?P<lag_support_for_ap>.*)$")
+        lag_support_for_ap_capture = regex_engine.compile(r"^Lag\s+Support\s+for\s+AP\s+:\s+(?P<lag_support_for_ap>.*)$")
         
         # Rogue Detection                                 : Enabled
-        rogue_detection_capture = re.compile(r"^Rogue\s+Detection\s+:\s+(?P<rogue_detection>.*)$")
+        rogue_detection_capture = regex_engine.compile(r"^Rogue\s+Detection\s+:\s+(?P<rogue_detection>.*)$")
         
         # Rogue Containment auto-rate                     : Disabled
-        rogue_containment_auto_rate_capture = re.compile(
+        rogue_containment_auto_rate_capture = regex_engine.compile(
             r"^Rogue\s+Containment\s+auto-rate\s+:\s+(?P<rogue_containment_auto_rate>.*)$")
         
         # Rogue Containment of standalone flexconnect APs : Disabled
-        rogue_containment_of_standalone_flexconnect_aps_capture = re.compile(
+        rogue_containment_of_standalone_flexconnect_aps_capture = regex_engine.compile(
             r"^Rogue\s+Containment\s+of\s+standalone\s+flexconnect\s+APs\s+:\s+(?P<rogue_containment_of_standalone_flexconnect_aps>.*)$")
         
         # Rogue Detection Report Interval                 : 10
-        rogue_detection_report_interval_capture = re.compile(
+        rogue_detection_report_interval_capture = regex_engine.compile(
             r"^Rogue\s+Detection\s+Report\s+Interval\s+:\s+(?P<rogue_detection_report_interval>.*)$")
         
         # Rogue AP minimum RSSI                           : -70
-        rogue_ap_minimum_rssi_capture = re.compile(r"^Rogue\s+AP\s+minimum\s+RSSI\s+:\s+(?P<rogue_ap_minimum_rssi>.*)$")
+        rogue_ap_minimum_rssi_capture = regex_engine.compile(r"^Rogue\s+AP\s+minimum\s+RSSI\s+:\s+(?P<rogue_ap_minimum_rssi>.*)$")
         
         # Rogue AP minimum transient time                 : 0
-        rogue_ap_minimum_transient_time_capture = re.compile(
+        rogue_ap_minimum_transient_time_capture = regex_engine.compile(
             r"^Rogue\s+AP\s+minimum\s+transient\s+time\s+:\s+(?P<rogue_ap_minimum_transient_time>.*)$")
         
         # AP TCP MSS Adjust                               : Enabled
-        ap_tcp_mss_adjust_capture = re.compile(r"^AP\s+TCP\s+MSS\s+Adjust\s+:\s+(?P<ap_tcp_mss_adjust>.*)$")
+        ap_tcp_mss_adjust_capture = regex_engine.compile(r"^AP\s+TCP\s+MSS\s+Adjust\s+:\s+(?P<ap_tcp_mss_adjust>.*)$")
         
         # AP TCP MSS Size                                 : 1250
-        ap_tcp_mss_size_capture = re.compile(r"^AP\s+TCP\s+MSS\s+Size\s+:\s+(?P<ap_tcp_mss_size>.*)$")
+        ap_tcp_mss_size_capture = regex_engine.compile(r"^AP\s+TCP\s+MSS\s+Size\s+:\s+(?P<ap_tcp_mss_size>.*)$")
         
         # AP IPv6 TCP MSS Adjust                          : Enabled
-        ap_ipv6_tcp_mss_adjust_capture = re.compile(
+        ap_ipv6_tcp_mss_adjust_capture = regex_engine.compile(
             r"^AP\s+IPv6\s+TCP\s+MSS\s+Adjust\s+:\s+(?P<ap_ipv6_tcp_mss_adjust>.*)$")
         
         # AP IPv6 TCP MSS Size                            : 1250
-        ap_ipv6_tcp_mss_size_capture = re.compile(r"^AP\s+IPv6\s+TCP\s+MSS\s+Size\s+:\s+(?P<ap_ipv6_tcp_mss_size>.*)$")
+        ap_ipv6_tcp_mss_size_capture = regex_engine.compile(r"^AP\s+IPv6\s+TCP\s+MSS\s+Size\s+:\s+(?P<ap_ipv6_tcp_mss_size>.*)$")
         
         # Hyperlocation Admin Status                      : Disabled
-        hyperlocation_admin_status_capture = re.compile(
+        hyperlocation_admin_status_capture = regex_engine.compile(
             r"^Hyperlocation\s+Admin\s+Status\s+:\s+(?P<hyperlocation_admin_status>.*)$")
         
         # Retransmit count                                : 5
-        retransmit_count_capture = re.compile(r"^Retransmit\s+count\s+:\s+(?P<retransmit_count>.*)$")
+        retransmit_count_capture = regex_engine.compile(r"^Retransmit\s+count\s+:\s+(?P<retransmit_count>.*)$")
         
         # Retransmit interval                             : 3
-        retransmit_interval_capture = re.compile(r"^Retransmit\s+interval\s+:\s+(?P<retransmit_interval>.*)$")
+        retransmit_interval_capture = regex_engine.compile(r"^Retransmit\s+interval\s+:\s+(?P<retransmit_interval>.*)$")
         
         # Fabric status                                   : Disabled
-        fabric_status_capture = re.compile(r"^Fabric\s+status\s+:\s+(?P<fabric_status>.*)$")
+        fabric_status_capture = regex_engine.compile(r"^Fabric\s+status\s+:\s+(?P<fabric_status>.*)$")
         
         # FIPS status                                     : Disabled
-        fips_status_capture = re.compile(r"^FIPS\s+status\s+:\s+(?P<fips_status>.*)$")
+        fips_status_capture = regex_engine.compile(r"^FIPS\s+status\s+:\s+(?P<fips_status>.*)$")
         
         # WLANCC status                                   : Disabled
-        wlancc_status_capture = re.compile(r"^WLANCC\s+status\s+:\s+(?P<wlancc_status>.*)$")
+        wlancc_status_capture = regex_engine.compile(r"^WLANCC\s+status\s+:\s+(?P<wlancc_status>.*)$")
         
         # USB Module Type                                 : USB Module
-        usb_module_type_capture = re.compile(r"^USB\s+Module\s+Type\s+:\s+(?P<usb_module_type>.*)$")
+        usb_module_type_capture = regex_engine.compile(r"^USB\s+Module\s+Type\s+:\s+(?P<usb_module_type>.*)$")
         
         # USB Module State                                : Enabled
-        usb_module_state_capture = re.compile(r"^USB\s+Module\s+State\s+:\s+(?P<usb_module_state>.*)$")
+        usb_module_state_capture = regex_engine.compile(r"^USB\s+Module\s+State\s+:\s+(?P<usb_module_state>.*)$")
         
         # USB Operational State                           : Disabled
-        usb_operational_state_capture = re.compile(r"^USB\s+Operational\s+State\s+:\s+(?P<usb_operational_state>.*)$")
+        usb_operational_state_capture = regex_engine.compile(r"^USB\s+Operational\s+State\s+:\s+(?P<usb_operational_state>.*)$")
         
         # USB Override                                    : Disabled
-        usb_override_capture = re.compile(r"^USB\s+Override\s+:\s+(?P<usb_override>.*)$")
+        usb_override_capture = regex_engine.compile(r"^USB\s+Override\s+:\s+(?P<usb_override>.*)$")
         
         # GAS rate limit Admin status                     : Disabled
-        gas_rate_limit_admin_status_capture = re.compile(
+        gas_rate_limit_admin_status_capture = regex_engine.compile(
             r"^GAS\s+rate\s+limit\s+Admin\s+status\s+:\s+(?P<gas_rate_limit_admin_status>.*)$")
         
         # WPA3 Capability                                 : Enabled
-        wpa3_capability_capture = re.compile(r"^WPA3\s+Capability\s+:\s+(?P<wpa3_capability>.*)$")
+        wpa3_capability_capture = regex_engine.compile(r"^WPA3\s+Capability\s+:\s+(?P<wpa3_capability>.*)$")
         
         # EWC-AP Capability                               : Disabled
-        ewc_ap_capability_capture = re.compile(r"^EWC-AP\s+Capability\s+:\s+(?P<ewc_ap_capability>.*)$")
+        ewc_ap_capability_capture = regex_engine.compile(r"^EWC-AP\s+Capability\s+:\s+(?P<ewc_ap_capability>.*)$")
         
         # AWIPS Capability                                : Enabled
-        awips_capability_capture = re.compile(r"^AWIPS\s+Capability\s+:\s+(?P<awips_capability>.*)$")
+        awips_capability_capture = regex_engine.compile(r"^AWIPS\s+Capability\s+:\s+(?P<awips_capability>.*)$")
         
         # Proxy Hostname                                  : Not Configured
-        proxy_hostname_capture = re.compile(r"^Proxy\s+Hostname\s+:\s+(?P<proxy_hostname>.*)$")
+        proxy_hostname_capture = regex_engine.compile(r"^Proxy\s+Hostname\s+:\s+(?P<proxy_hostname>.*)$")
         
         # Proxy Port                                      : Not Configured
-        proxy_port_capture = re.compile(r"^Proxy\s+Port\s+:\s+(?P<proxy_port>.*)$")
+        proxy_port_capture = regex_engine.compile(r"^Proxy\s+Port\s+:\s+(?P<proxy_port>.*)$")
         
         # Proxy NO_PROXY list                             : Not Configured
-        proxy_no_proxy_list_capture = re.compile(r"^Proxy\s+NO_PROXY\s+list\s+:\s+(?P<proxy_no_proxy_list>.*)$")
+        proxy_no_proxy_list_capture = regex_engine.compile(r"^Proxy\s+NO_PROXY\s+list\s+:\s+(?P<proxy_no_proxy_list>.*)$")
         
         # GRPC server status                              : Disabled
-        grpc_server_status_capture = re.compile(r"^GRPC\s+server\s+status\s+:\s+(?P<grpc_server_status>.*)$")
+        grpc_server_status_capture = regex_engine.compile(r"^GRPC\s+server\s+status\s+:\s+(?P<grpc_server_status>.*)$")
         
         # Unencrypted Data Keep Alive                     : Enabled
-        unencrypted_data_keep_alive_capture = re.compile(
+        unencrypted_data_keep_alive_capture = regex_engine.compile(
             r"^Unencrypted\s+Data\s+Keep\s+Alive\s+:\s+(?P<unencrypted_data_keep_alive>.*)$")
         
         # Local DHCP Server                               : Disabled
-        local_dhcp_server_capture = re.compile(r"^Local\s+DHCP\s+Server\s+:\s+(?P<local_dhcp_server>.*)$")
+        local_dhcp_server_capture = regex_engine.compile(r"^Local\s+DHCP\s+Server\s+:\s+(?P<local_dhcp_server>.*)$")
         
         # Traffic Distribution Statistics Capability      : Enabled
-        traffic_distribution_statistics_capability_capture = re.compile(
+        traffic_distribution_statistics_capability_capture = regex_engine.compile(
             r"^Traffic\s+Distribution\s+Statistics\s+Capability\s+:\s+(?P<traffic_distribution_statistics_capability>.*)$")
         
         # Dual DFS Statistics                             : Disabled
-        dual_dfs_statistics_capture = re.compile(r"^Dual\s+DFS\s+Statistics\s+:\s+(?P<dual_dfs_statistics>.*)$")
+        dual_dfs_statistics_capture = regex_engine.compile(r"^Dual\s+DFS\s+Statistics\s+:\s+(?P<dual_dfs_statistics>.*)$")
 
         remove_lines = ('====', 'AP Regulatory')
 
@@ -2869,10 +2871,10 @@ class ShowApTagSummary(ShowApTagSummarySchema):
         # ...OUTPUT OMITTED..
 
         # Number of APs: 20
-        ap_number_capture = re.compile(r"^Number of APs: (?P<number_of_aps>\d+)$")
+        ap_number_capture = regex_engine.compile(r"^Number of APs: (?P<number_of_aps>\d+)$")
 
         # b25a-13-cap10         3c41.0fff.3f83   default-site-tag-fabric           PT_Fabri_B25_B25-1_fe778      Standard                          No               Static
-        ap_info_capture = re.compile(
+        ap_info_capture = regex_engine.compile(
             r"^(?P<ap_name>\S+)\s+(?P<ap_mac>\S{4}\.\S{4}\.\S{4})\s+(?P<site_tag_name>\S+)\s+(?P<policy_tag_name>\S+)\s+(?P<rf_tag_name>\S+)\s+(?P<misconfigured>\S+)\s+(?P<tag_source>\S+)$"
         )
 
@@ -2936,7 +2938,7 @@ class ShowApStatus(ShowApStatusSchema):
             output = self.device.execute(self.cli_command)
 
         # AP002C.C862.E708                    Enabled    Local             US
-        p1 = re.compile(r"^(?P<ap_name>\S+)\s+(?P<status>\S+)\s+(?P<mode>\S+)\s+(?P<country>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<ap_name>\S+)\s+(?P<status>\S+)\s+(?P<mode>\S+)\s+(?P<country>\S+)$")
 
         ap_dict = {}
         ret_dict = {}
@@ -2991,7 +2993,7 @@ class ShowApBleSummary(ShowApBleSummarySchema):
             output = self.device.execute(self.cli_command)
         ret_dict = {}
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             # AP Name       AP Model            AP Ethernet MAC         BLE Interface State     BLE Admin State         BLE mode                BLE MAC                 BLE Profile         Scan State
             # AP3-02        AIR-AP4800-B-K9     4001.7ab2.c3e4          Close                   Up                      Base (Native)           2471.891b.c302          No Advertisement    Enabled
             r'(?P<ap_name>(^[\w_\-]+))\s+(?P<ap_model>([A-Z0-9\-]+))\s+(?P<eth_mac>(([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}))\s+(?P<intf_state>([a-zA-Z]+\s*[a-zA-Z]+))\s+(?P<admin_state>(Up|Down|Not Configured))\s+(?P<ble_mode>((Base|Advanced)\s\((Native|IOx)\)|Unknown))\s+(?P<ble_mac>(([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}|Unknown))\s+(?P<ble_profile>([\w\s\-\.]*|Unknown))\s+(?P<scan_state>(Enabled|Disabled|Not Configured))$'
@@ -3000,7 +3002,7 @@ class ShowApBleSummary(ShowApBleSummarySchema):
         for line in output.splitlines():
             line = line.strip()
             # AP3-02        AIR-AP4800-B-K9     4001.7ab2.c3e4          Close                   Up                      Base (Native)           2471.891b.c302          No Advertisement    Enabled
-            m = re.match(p1, line)
+            m = regex_engine.match(p1, line)
             if m:
                 rgx_dict = m.groupdict()
                 ap_name_dict = ret_dict.setdefault(rgx_dict['ap_name'], {})
@@ -3082,24 +3084,24 @@ class ShowApImage(ShowApImageSchema):
             AP501C.B0BC.1448                  17.13.0.44             17.13.0.30                 None                  0.0.0.0             N/A                 0           N/A
             AP4001.7AB2.C1B6                  17.13.0.44             17.13.0.30                 None                  0.0.0.0             N/A                 0           N/A
             APF4DB.E651.2280                  17.13.0.44             17.13.0.30                 None                  0.0.0.0             N/A                 0           N/A"""
-        total_number_of_aps = re.compile(r"^Total\s+number\sof\s+APs\s+:\s+(?P<total_number_of_ap>\d+)")
+        total_number_of_aps = regex_engine.compile(r"^Total\s+number\sof\s+APs\s+:\s+(?P<total_number_of_ap>\d+)")
 
-        ap_image_info_capture = re.compile(
+        ap_image_info_capture = regex_engine.compile(
             r"^(?P<ap_name>\S+)\s+(?P<primary_image>\d+\.\d+\.\d+\.\d+)\s+(?P<backup_image>\d+\.\d+\.\d+\.\d+)\s+"
             r"(?P<predownload_status>\S+)\s+(?P<predownload_version>\d+\.\d+\.\d+\.\d+)\s+(?P<next_retry_time>\S+)\s+"
             r"(?P<retry_count>\d+)\s+(?P<method>.*)")
 
         remove_lines = ('AP Name', '----')
 
-        initiated_aps = re.compile(r"^Initiated\s+:\s+(?P<initiated>\d+)")
-        downloading_aps = re.compile(r"^Downloading\s+:\s+(?P<downloading>\d+)")
-        predownloading_aps = re.compile(r"^Predownloading\s+:\s+(?P<predownloading>\d+)")
-        completed_downloading_aps = re.compile(r"^Completed\s+downloading\s+:\s+(?P<completed_downloading>\d+)")
-        completed_predownloading_aps = re.compile(
+        initiated_aps = regex_engine.compile(r"^Initiated\s+:\s+(?P<initiated>\d+)")
+        downloading_aps = regex_engine.compile(r"^Downloading\s+:\s+(?P<downloading>\d+)")
+        predownloading_aps = regex_engine.compile(r"^Predownloading\s+:\s+(?P<predownloading>\d+)")
+        completed_downloading_aps = regex_engine.compile(r"^Completed\s+downloading\s+:\s+(?P<completed_downloading>\d+)")
+        completed_predownloading_aps = regex_engine.compile(
             r"^Completed\s+predownloading\s+:\s+(?P<completed_predownloading>\d+)")
-        not_supported_aps = re.compile(r"^Not\s+Supported\s+:\s+(?P<not_supported>\d+)")
-        failed_to_predownload_aps = re.compile(r"^Failed\s+to\s+Predownload\s+:\s+(?P<failed_to_predownload>\d+)")
-        predownload_in_progress = re.compile(r"^Predownload\s+in\s+progress\s+:\s+(?P<predownload_in_progress>\S+)")
+        not_supported_aps = regex_engine.compile(r"^Not\s+Supported\s+:\s+(?P<not_supported>\d+)")
+        failed_to_predownload_aps = regex_engine.compile(r"^Failed\s+to\s+Predownload\s+:\s+(?P<failed_to_predownload>\d+)")
+        predownload_in_progress = regex_engine.compile(r"^Predownload\s+in\s+progress\s+:\s+(?P<predownload_in_progress>\S+)")
 
         # Remove unwanted lines from raw text
         def filter_lines(raw_output, remove_lines):
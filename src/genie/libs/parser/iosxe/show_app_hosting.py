@@ -6,7 +6,6 @@ IOSXE parsers for the following show commands:
     * show app-hosting resource
     * show app-hosting detail appid {appid}
 '''
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -14,6 +13,7 @@ import genie.parsergen as pg
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ===========================================
@@ -69,16 +69,16 @@ class ShowApphostingInfra(ShowApphostingInfraSchema):
             out = output
 
         # IOX version: 10.49.0.0
-        p1 = re.compile(r"IOX version: (?P<iox_version>.*)$")
+        p1 = regex_engine.compile(r"IOX version: (?P<iox_version>.*)$")
 
         # App signature verification: enabled
-        p2 = re.compile(r"App signature verification: (?P<app_signature_verification>\w+)$")
+        p2 = regex_engine.compile(r"App signature verification: (?P<app_signature_verification>\w+)$")
 
         # Internal working directory: /vol/usb1/iox
-        p3 = re.compile(r"Internal working directory: (?P<internal_working_directory>.*)$")
+        p3 = regex_engine.compile(r"Internal working directory: (?P<internal_working_directory>.*)$")
 
-        p4 = re.compile(r'^\s*(?P<appge_port_number>[0-9])'
-                        r'\s*(?P<appge_interface_name>\w+\/[0-9]\/[0-9])')
+        p4 = regex_engine.compile(r'^\s*(?P<appge_port_number>[0-9])'
+                                  r'\s*(?P<appge_interface_name>\w+\/[0-9]\/[0-9])')
 
         if out:
             appge_dict = {}
@@ -205,7 +205,7 @@ class ShowAppHostingResource(ShowAppHostingResourceSchema):
         # VCPU:
         # Memory:
         # Storage space:
-        p1 = re.compile(r'^(?P<resource_name>CPU|VCPU|Memory|Storage space):$')
+        p1 = regex_engine.compile(r'^(?P<resource_name>CPU|VCPU|Memory|Storage space):$')
 
         # Quota: 25(Percentage)
         # Available: 25(Percentage)
@@ -214,8 +214,8 @@ class ShowAppHostingResource(ShowAppHostingResourceSchema):
         # Available: 2048(MB)
         # Total: 3904(MB)
         # Available: 3485(MB)
-        p2 = re.compile(r'^(?P<resource_type>Quota|Available|Count|Total)'
-                        r':\s+(?P<resouce_value>\d+)(\((?P<metric>\w+)\))?$')
+        p2 = regex_engine.compile(r'^(?P<resource_type>Quota|Available|Count|Total)'
+                                  r':\s+(?P<resouce_value>\d+)(\((?P<metric>\w+)\))?$')
 
         ret_dict = {}
 
@@ -294,144 +294,144 @@ class ShowAppHostingDetail(ShowAppHostingDetailSchema):
         ret_dict = {}
 
         # Process not enabled
-        p0_rgx = re.compile(r'.*process for the command is not responding.*')
+        p0_rgx = regex_engine.compile(r'.*process for the command is not responding.*')
 
         # State                  : RUNNING
-        p1_rgx = re.compile(r'State\s+:\s+(?P<state>(\w+))$')
+        p1_rgx = regex_engine.compile(r'State\s+:\s+(?P<state>(\w+))$')
 
         # Owner                  : iox
-        p2_rgx = re.compile(r'Owner\s+:\s+(?P<owner>(\w+))$')
+        p2_rgx = regex_engine.compile(r'Owner\s+:\s+(?P<owner>(\w+))$')
 
         # App id                   : Wireshark
-        p3_rgx = re.compile(r'App\sid\s+:\s+(?P<app_id>(\w+))$')
+        p3_rgx = regex_engine.compile(r'App\sid\s+:\s+(?P<app_id>(\w+))$')
 
         # Author                    : Cisco Systems, Inc
-        p4_rgx = re.compile(r'Author\s+:\s+(?P<author>([\w\s,-]+))$')
+        p4_rgx = regex_engine.compile(r'Author\s+:\s+(?P<author>([\w\s,-]+))$')
 
         # Type                     : vm
-        p5_rgx = re.compile(r'Type\s+:\s+(?P<type>(\w+))$')
+        p5_rgx = regex_engine.compile(r'Type\s+:\s+(?P<type>(\w+))$')
 
         # Name                     : Wireshark
-        p6_rgx = re.compile(r'Name\s+:\s+(?P<name>(\w+))$')
+        p6_rgx = regex_engine.compile(r'Name\s+:\s+(?P<name>(\w+))$')
 
         # Version                    : 3.4
         # Version                    : 3.3.0
-        p7_rgx = re.compile(r'Version\s+:\s+(?P<version>([\d.]+))$')
+        p7_rgx = regex_engine.compile(r'Version\s+:\s+(?P<version>([\d.]+))$')
 
         # Activated Profile Name   : custom
         # Activated profile name   : custom
-        p8_rgx = re.compile(r'Activated\s[Pp]rofile\s[Nn]ame\s+:\s+(?P<p_name>(\w+))$')
+        p8_rgx = regex_engine.compile(r'Activated\s[Pp]rofile\s[Nn]ame\s+:\s+(?P<p_name>(\w+))$')
 
         # Description          : Cisco Systems Guest Shell XE for x86_64
         # Description              : Ubuntu based Wireshark
-        p9_rgx = re.compile(r'Description\s+:\s+(?P<desc>([\w ]*))$')
+        p9_rgx = regex_engine.compile(r'Description\s+:\s+(?P<desc>([\w ]*))$')
 
         # Path                 : /guestshell/:guestshell.tar
-        p10_rgx = re.compile(r'Path\s+:\s+(?P<path>([\/\w:.]+))$')
+        p10_rgx = regex_engine.compile(r'Path\s+:\s+(?P<path>([\/\w:.]+))$')
 
         # Memory                   : 1900 MB
         # Memory               : 256 GB
-        p11_rgx = re.compile(r'Memory\s+:\s+(?P<memory>(\d+ [KMG]B))$')
+        p11_rgx = regex_engine.compile(r'Memory\s+:\s+(?P<memory>(\d+ [KMG]B))$')
         # Disk                 : 1 MB
         # Disk                 : 10 MB
-        p12_rgx = re.compile(r'Disk\s+:\s+(?P<disk>(\d+ [KMG]B))$')
+        p12_rgx = regex_engine.compile(r'Disk\s+:\s+(?P<disk>(\d+ [KMG]B))$')
 
         # CPU                  : 800 units
-        p13_rgx = re.compile(r'CPU\s+:\s+(?P<cpu>(\d+\s+units))$')
+        p13_rgx = regex_engine.compile(r'CPU\s+:\s+(?P<cpu>(\d+\s+units))$')
 
         # CPU-percent          : 100 %
-        p14_rgx = re.compile(r'CPU-percent\s+:\s+(?P<cpu_p>(\d+\s+%))$')
+        p14_rgx = regex_engine.compile(r'CPU-percent\s+:\s+(?P<cpu_p>(\d+\s+%))$')
 
         # VCPU                  : 8
-        p15_rgx = re.compile(r'VCPU\s+:\s+(?P<vcpu>(\d+))$')
+        p15_rgx = regex_engine.compile(r'VCPU\s+:\s+(?P<vcpu>(\d+))$')
 
         for line in output.splitlines():
             line = line.strip()
 
             # app-hosting process not enabled
-            m = re.match(p0_rgx, line)
+            m = regex_engine.match(p0_rgx, line)
             if m:
                 ret_dict = {}
                 return
 
             # State
-            m = re.match(p1_rgx, line)
+            m = regex_engine.match(p1_rgx, line)
             if m:
                 ret_dict.update({'state': m.groupdict()['state']})
                 continue
 
             # Owner
-            m = re.match(p2_rgx, line)
+            m = regex_engine.match(p2_rgx, line)
             if m:
                 ret_dict.update({'owner': m.groupdict()['owner']})
                 continue
 
             # App id
-            m = re.match(p3_rgx, line)
+            m = regex_engine.match(p3_rgx, line)
             if m:
                 ret_dict.update({'app_id': m.groupdict()['app_id']})
                 continue
 
             app_dict = ret_dict.setdefault('application', {})
             # Author
-            m = re.match(p4_rgx, line)
+            m = regex_engine.match(p4_rgx, line)
             if m:
                 app_dict.update({'author': m.groupdict()['author']})
                 continue
             # Type
-            m = re.match(p5_rgx, line)
+            m = regex_engine.match(p5_rgx, line)
             if m:
                 app_dict.update({'type': m.groupdict()['type']})
                 continue
             # Name
-            m = re.match(p6_rgx, line)
+            m = regex_engine.match(p6_rgx, line)
             if m:
                 app_dict.update({'name': m.groupdict()['name']})
                 continue
             # Version
-            m = re.match(p7_rgx, line)
+            m = regex_engine.match(p7_rgx, line)
             if m:
                 app_dict.update({'version': m.groupdict()['version']})
                 continue
             # Activated profile name
-            m = re.match(p8_rgx, line)
+            m = regex_engine.match(p8_rgx, line)
             if m:
                 app_dict.update({'p_name': m.groupdict()['p_name']})
                 continue
             # Description
-            m = re.match(p9_rgx, line)
+            m = regex_engine.match(p9_rgx, line)
             if m:
                 app_dict.update({'desc': m.groupdict()['desc']})
                 continue
             # Path
-            m = re.match(p10_rgx, line)
+            m = regex_engine.match(p10_rgx, line)
             if m:
                 app_dict.update({'path': m.groupdict()['path']})
                 continue
 
             res_dict = ret_dict.setdefault('resource_reservation', {})
             # Memory
-            m = re.match(p11_rgx, line)
+            m = regex_engine.match(p11_rgx, line)
             if m:
                 res_dict.update({'memory': m.groupdict()['memory']})
                 continue
             # Disk
-            m = re.match(p12_rgx, line)
+            m = regex_engine.match(p12_rgx, line)
             if m:
                 res_dict.update({'disk': m.groupdict()['disk']})
                 continue
             # CPU
-            m = re.match(p13_rgx, line)
+            m = regex_engine.match(p13_rgx, line)
             if m:
                 res_dict.update({'cpu': m.groupdict()['cpu']})
                 continue
             # CPU-percent
-            m = re.match(p14_rgx, line)
+            m = regex_engine.match(p14_rgx, line)
             if m:
                 res_dict.update({'cpu_p': m.groupdict()['cpu_p']})
                 continue
             # VCPU
-            m = re.match(p15_rgx, line)
+            m = regex_engine.match(p15_rgx, line)
             if m:
                 res_dict.update({'vcpu': int(m.groupdict()['vcpu'])})
                 continue
@@ -497,88 +497,88 @@ class ShowAppHostingDetailAppid(ShowAppHostingDetailAppidSchema):
             output = self.device.execute(self.cli_command.format(appid=appid))
 
         # App id                 : thousandeyes_enterprise_agent
-        p1 = re.compile(r'^App id\s+: (?P<app_id>.+)$')
+        p1 = regex_engine.compile(r'^App id\s+: (?P<app_id>.+)$')
 
         # Owner                  : iox
-        p2 = re.compile(r'^Owner\s+: (?P<owner>.+)$')
+        p2 = regex_engine.compile(r'^Owner\s+: (?P<owner>.+)$')
 
         # State                  : RUNNING
-        p3 = re.compile(r'^State\s+: (?P<state>.+)$')
+        p3 = regex_engine.compile(r'^State\s+: (?P<state>.+)$')
 
         # Application
-        p4 = re.compile(r'^Application$')
+        p4 = regex_engine.compile(r'^Application$')
 
         # Type                 : docker
-        p4_1 = re.compile(r'^Type\s+: (?P<type>.+)$')
+        p4_1 = regex_engine.compile(r'^Type\s+: (?P<type>.+)$')
 
         # Name                 : ThousandEyes Enterprise Agent
-        p4_2 = re.compile(r'^Name\s+: (?P<application>.+)$')
+        p4_2 = regex_engine.compile(r'^Name\s+: (?P<application>.+)$')
 
         # Version              : 4.3.0
-        p4_3 = re.compile(r'^Version\s+: (?P<version>.+)$')
+        p4_3 = regex_engine.compile(r'^Version\s+: (?P<version>.+)$')
 
         # Description          :
-        p4_4 = re.compile(r'^Description\s+: (?P<description>.+)$')
+        p4_4 = regex_engine.compile(r'^Description\s+: (?P<description>.+)$')
 
         # Author               : ThousandEyes <support@thousandeyes.com>
-        p4_5 = re.compile(r'^Author\s+: (?P<author>.+)$')
+        p4_5 = regex_engine.compile(r'^Author\s+: (?P<author>.+)$')
 
         # Path                 : flash:thousandeyes-enterprise-agent-4.3.0.cisco.tar
-        p4_6 = re.compile(r'^Path\s+: (?P<path>.+)$')
+        p4_6 = regex_engine.compile(r'^Path\s+: (?P<path>.+)$')
 
         # URL Path             :
-        p4_7 = re.compile(r'^URL Path\s+: (?P<url_path>.+)$')
+        p4_7 = regex_engine.compile(r'^URL Path\s+: (?P<url_path>.+)$')
 
         # Activated profile name : custom
-        p5 = re.compile(r'^Activated profile name : (?P<activated_profile_name>.+)$')
+        p5 = regex_engine.compile(r'^Activated profile name : (?P<activated_profile_name>.+)$')
 
         # Resource reservation
-        p6 = re.compile(r'^Resource reservation$')
+        p6 = regex_engine.compile(r'^Resource reservation$')
 
         # Memory               : 500 MB
-        p6_1 = re.compile(r'^Memory\s+: (?P<memory>.+)$')
+        p6_1 = regex_engine.compile(r'^Memory\s+: (?P<memory>.+)$')
 
         # Disk                 : 1 MB
-        p6_2 = re.compile(r'^Disk\s+: (?P<disk>.+)$')
+        p6_2 = regex_engine.compile(r'^Disk\s+: (?P<disk>.+)$')
 
         # CPU                  : 1850 units
-        p6_3 = re.compile(r'^CPU\s+: (?P<cpu>\d+) units$')
+        p6_3 = regex_engine.compile(r'^CPU\s+: (?P<cpu>\d+) units$')
 
         # VCPU                 : 1
-        p6_4 = re.compile(r'^VCPU\s+: (?P<vcpu>\d+)$')
+        p6_4 = regex_engine.compile(r'^VCPU\s+: (?P<vcpu>\d+)$')
 
         # Attached devices
-        p7 = re.compile(r'^Attached devices$')
+        p7 = regex_engine.compile(r'^Attached devices$')
 
         # Type              Name               Alias
         # ---------------------------------------------
         # serial/shell     iox_console_shell   serial0
-        p7_1 = re.compile(r'^(?P<type>\w+\/\w+)\s+(?P<name>\S+)\s+(?P<alias>\w+)$')
+        p7_1 = regex_engine.compile(r'^(?P<type>\w+\/\w+)\s+(?P<name>\S+)\s+(?P<alias>\w+)$')
 
         # Network interfaces
-        p8 = re.compile(r'^Network interfaces$')
+        p8 = regex_engine.compile(r'^Network interfaces$')
 
         # ---------------------------------------
         # eth0:
-        p8_1 = re.compile(r'^(?P<network_interface>[\w\.\/]+):$')
+        p8_1 = regex_engine.compile(r'^(?P<network_interface>[\w\.\/]+):$')
 
         # MAC address         : 52:54:dd:d:38:3d
-        p8_2 = re.compile(r'^MAC address\s+: (?P<mac_address>[a-f0-9\:]+)$')
+        p8_2 = regex_engine.compile(r'^MAC address\s+: (?P<mac_address>[a-f0-9\:]+)$')
 
         # Network name        : mgmt-bridge-v21
-        p8_3 = re.compile(r'^Network name\s+: (?P<network_name>.+)$')
+        p8_3 = regex_engine.compile(r'^Network name\s+: (?P<network_name>.+)$')
 
         # Application health information
-        p9 = re.compile(r'^Application health information$')
+        p9 = regex_engine.compile(r'^Application health information$')
 
         # Status               : 0
-        p9_1 = re.compile(r'^Status\s+: (?P<status>\w+)$')
+        p9_1 = regex_engine.compile(r'^Status\s+: (?P<status>\w+)$')
 
         # Last probe error     :
-        p9_2 = re.compile(r'^Last probe error\s+: (?P<last_probe_error>.+)$')
+        p9_2 = regex_engine.compile(r'^Last probe error\s+: (?P<last_probe_error>.+)$')
 
         # Last probe output    :
-        p9_3 = re.compile(r'^Last probe output\s+: (?P<last_probe_output>.+)$')
+        p9_3 = regex_engine.compile(r'^Last probe output\s+: (?P<last_probe_output>.+)$')
 
         ret_dict = {}
 
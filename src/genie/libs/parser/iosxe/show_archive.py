@@ -8,13 +8,13 @@ IOSXE parsers for the following show commands:
     * show archive config incremental-diffs <fileA>
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =============================================
 # Parser for 'show archive'
@@ -49,16 +49,16 @@ class ShowArchive(ShowArchiveSchema):
             output = self.device.execute(self.cli_command)
 
         # The maximum archive configurations allowed is 10.
-        p1 = re.compile(r'^The +maximum +archive +configurations +allowed +is +(?P<max>\d+)\.$')
+        p1 = regex_engine.compile(r'^The +maximum +archive +configurations +allowed +is +(?P<max>\d+)\.$')
 
         # There are currently 1 archive configurations saved.
-        p2 = re.compile(r'^There +are +currently +(?P<total>\d+) +archive +configurations +saved\.$')
+        p2 = regex_engine.compile(r'^There +are +currently +(?P<total>\d+) +archive +configurations +saved\.$')
 
         # 1        bootflash:uncfgIntfgigabitethernet0_0_0-Sep-27-15-04-18.414-PDT-0 <- Most Recent
-        p3 = re.compile(r'^(?P<num>[0-9]+) +(?P<file>\S+)(?P<recent> +\<\- +Most +Recent)?$')
+        p3 = regex_engine.compile(r'^(?P<num>[0-9]+) +(?P<file>\S+)(?P<recent> +\<\- +Most +Recent)?$')
 
         # Archive feature not enabled
-        p4 = re.compile(r'^(?P<error>Archive feature not enabled)$')
+        p4 = regex_engine.compile(r'^(?P<error>Archive feature not enabled)$')
         
         # initial variables
         ret_dict = {}
@@ -150,29 +150,29 @@ class ShowArchiveConfigDifferences(ShowArchiveConfigDifferencesSchema):
         contextual_found = False
         
         # !Contextual Config Diffs:
-        p1 = re.compile(r'^\s*!Contextual +Config +Diffs:$')
+        p1 = regex_engine.compile(r'^\s*!Contextual +Config +Diffs:$')
         
         # +hostname Router
         # -hostname Test4
-        p2 = re.compile(r'^\s*(?P<line_info>(\+|\-)[\w\W]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<line_info>(\+|\-)[\w\W]+)$')
         
         # !List of commands:
-        p3 = re.compile(r'^\s*!List +of +(C|c)ommands:$')
+        p3 = regex_engine.compile(r'^\s*!List +of +(C|c)ommands:$')
         
         # Load for five secs: 16%/0%; one minute: 30%; five minutes: 23%
-        p4 = re.compile(r'^Load +for +five +secs: +\d+%\/\d+%; +one +minute:' \
+        p4 = regex_engine.compile(r'^Load +for +five +secs: +\d+%\/\d+%; +one +minute:' \
             r' +\d+%; +five +minutes: +\d+%$')
         
         # Time source is NTP, 19:16:19.992 EST Thu Sep 15 2016
         # Time source is NTP, *02:20:46.845 EST Thu May 16 2019
-        p5 = re.compile(r'^Time +source +is +\w+, +\*?\d+:\d+:\d+\.\d+ +\w+ +' \
+        p5 = regex_engine.compile(r'^Time +source +is +\w+, +\*?\d+:\d+:\d+\.\d+ +\w+ +' \
             r'\w+ +\w+ +\d+ +\d+$')
         
         # test#show archive config incremental-diffs bootflash:A.cfg
-        p6 = re.compile(r'^(test#|Device#|Router#)')
+        p6 = regex_engine.compile(r'^(test#|Device#|Router#)')
         
         # hostname Router3
-        p7 = re.compile(r'^\s*(?P<line_info>([\w\W]+))$')
+        p7 = regex_engine.compile(r'^\s*(?P<line_info>([\w\W]+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -275,7 +275,7 @@ class ShowArchiveLogConfig(ShowArchiveLogConfigSchema):
         
         #idx   sess           user@line      Logged command 
         #610     1        console@console  |  logging enable 
-        p1 = re.compile(r'^(?P<idx>\d+)\s+(?P<sess>\d+)\s+(?P<userline>[\w\@]+)\s+\|(\s+)?(?P<logged_command>[\w(\-)?\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<idx>\d+)\s+(?P<sess>\d+)\s+(?P<userline>[\w\@]+)\s+\|(\s+)?(?P<logged_command>[\w(\-)?\s]+)$')
         
         for line in output.splitlines():     
             line = line.strip()
@@ -329,23 +329,23 @@ class ShowArchiveLogStatistics(ShowArchiveLogStatisticsSchema):
          
         #Config Log Session Info:
         #Config Log log-queue Info:
-        p1  =  re.compile(r'^Config Log (?P<log>[\s\w(\-)?]+\:)$')
+        p1  =  regex_engine.compile(r'^Config Log (?P<log>[\s\w(\-)?]+\:)$')
 
         #Number of sessions being tracked: 1
         #Number of entries in the log-queue: 472
-        p2 = re.compile(r'^Number of [\w\s(\-)?]+: +(?P<num_entries_in_log>[\d]+)$')
+        p2 = regex_engine.compile(r'^Number of [\w\s(\-)?]+: +(?P<num_entries_in_log>[\d]+)$')
 
         #Memory being held: 3934 bytes
         #Memory being held by the log-queue: 186617 bytes
-        p3 = re.compile(r'^Memory being [\w\s(\-)?]+\: (?P<memory_held_bytes>[\d]+)[\w\s]+$')
+        p3 = regex_engine.compile(r'^Memory being [\w\s(\-)?]+\: (?P<memory_held_bytes>[\d]+)[\w\s]+$')
 
         #Total memory allocated for session tracking: 11793 bytes
         #Total memory allocated for log entries: 186617 bytes
-        p4 = re.compile(r'^Total memory allocated for [\w\s]+: +(?P<memory_allocated_bytes>[\d]+)[\w\s]+$')
+        p4 = regex_engine.compile(r'^Total memory allocated for [\w\s]+: +(?P<memory_allocated_bytes>[\d]+)[\w\s]+$')
         
         #Total memory freed from session tracking: 7859 bytes
         #Total memory freed from log entries: 0 bytes
-        p5 = re.compile(r'^Total memory freed from [\w\s]+: +(?P<memory_free_bytes>[\d]+)[\w\s]+$')
+        p5 = regex_engine.compile(r'^Total memory freed from [\w\s]+: +(?P<memory_free_bytes>[\d]+)[\w\s]+$')
         
         for line in output.splitlines():
             line=line.strip()
@@ -15,7 +15,6 @@ IOSXE parsers for the following show commands:
 
 # Python
 from ast import Or
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -23,6 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import regex_engine, string_pool
 
 
 # =============================================
@@ -94,11 +94,13 @@ class ShowArp(ShowArpSchema):
         # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
         # Internet  192.168.111.111         0   aabb.0111.0111  802.1Q Vlan111
         # Internet 192.168.1.203 3 0015.0100.0001 ARPA Vlan201 pv 203
-        p1 = re.compile(r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
-                         r'(?P<mac>[\w\.]+) +(?P<type>[\w\.]+)'
-                         r'( +(?P<interface>[\w\.\/\-]+)(\s+pv\s+(?P<private_vlan>\d+))?)?$')
+        p1 = regex_engine.compile(r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
+                                   r'(?P<mac>[\w\.]+) +(?P<type>[\w\.]+)'
+                                   r'( +(?P<interface>[\w\.\/\-]+)(\s+pv\s+(?P<private_vlan>\d+))?)?$')
         # initial variables
         ret_dict = {}
+        # share the repeated values of the entries, see utils/string_pool.py
+        pool = string_pool.is_enabled()
 
         for line in out.splitlines():
             line = line.strip()
@@ -110,6 +112,8 @@ class ShowArp(ShowArpSchema):
             m = p1.match(line)
             if m:
                 group = m.groupdict()
+                if pool:
+                    string_pool.intern_values(group)
                 address = group['address']
                 interface = group['interface']
                 if interface:
@@ -184,7 +188,7 @@ class ShowIpArpSummary(ShowIpArpSummarySchema):
             out = output
 
         # 40 IP ARP entries, with 0 of them incomplete
-        p1 = re.compile(r'^(?P<total_entries>\w+) +IP +ARP +entries, +with '
+        p1 = regex_engine.compile(r'^(?P<total_entries>\w+) +IP +ARP +entries, +with '
             r'+(?P<incomp_entries>\w+) +of +them +incomplete$')
 
         # initial variables
@@ -405,123 +409,123 @@ class ShowIpTraffic(ShowIpTrafficSchema):
             out = output
 
         # ARP statistics:
-        p1 = re.compile(r'^ARP +statistics:')
+        p1 = regex_engine.compile(r'^ARP +statistics:')
 
         # Rcvd: 2020 requests, 764 replies, 0 reverse, 0 other
-        p2 = re.compile(r'^Rcvd: +(?P<arp_in_requests>\d+) +requests,'
+        p2 = regex_engine.compile(r'^Rcvd: +(?P<arp_in_requests>\d+) +requests,'
             r' +(?P<arp_in_replies>\d+) +replies, +(?P<arp_in_reverse>\d+)'
             r' +reverse, +(?P<arp_in_other>\d+) +other$')
 
         # Sent: 29 requests, 126 replies (2 proxy), 0 reverse
-        p3 = re.compile(r'^Sent: +(?P<arp_out_requests>\d+) +requests,'
+        p3 = regex_engine.compile(r'^Sent: +(?P<arp_out_requests>\d+) +requests,'
             r' +(?P<arp_out_replies>\d+) +replies +\((?P<arp_out_proxy>[\w]+)'
             r' +proxy\), +(?P<arp_out_reverse>\d+) +reverse$')
 
         # Drop due to input queue full: 0
-        p4 = re.compile(r'^Drop +due +to +input +queue +full:'
+        p4 = regex_engine.compile(r'^Drop +due +to +input +queue +full:'
             r' +(?P<arp_drops>\w+)$')
 
         # IP statistics:
-        p5 = re.compile(r'^IP +statistics:')
+        p5 = regex_engine.compile(r'^IP +statistics:')
 
         # Rcvd:  17780 total, 110596 local destination
-        p6 = re.compile(r'^Rcvd: +(?P<ip_rcvd_total>\d+) +total,'
+        p6 = regex_engine.compile(r'^Rcvd: +(?P<ip_rcvd_total>\d+) +total,'
             r' +(?P<ip_rcvd_local_destination>\d+)'
             r' +local +destination$')
 
         # 0 format errors, 0 checksum errors, 0 bad hop count
-        p7 = re.compile(r'^(?P<ip_rcvd_format_errors>\d+) +format +errors,'
+        p7 = regex_engine.compile(r'^(?P<ip_rcvd_format_errors>\d+) +format +errors,'
             r' +(?P<ip_rcvd_checksum_errors>\d+)'
             r' +checksum +errors, +(?P<ip_rcvd_bad_hop>\d+) +bad +hop +count$')
 
         # 0 unknown protocol, 5 not a gateway
-        p8 = re.compile(r'^(?P<ip_rcvd_unknwn_protocol>\d+) +unknown +protocol,'
+        p8 = regex_engine.compile(r'^(?P<ip_rcvd_unknwn_protocol>\d+) +unknown +protocol,'
             r' +(?P<ip_rcvd_not_gateway>\d+)'
             r' +not +a +gateway$')
 
         # 0 security failures, 0 bad options, 12717 with options
-        p9 = re.compile(r'^(?P<ip_rcvd_sec_failures>\d+) +security +failures,'
+        p9 = regex_engine.compile(r'^(?P<ip_rcvd_sec_failures>\d+) +security +failures,'
             r' +(?P<ip_rcvd_bad_optns>\d+)'
             r' +bad options, +(?P<ip_rcvd_with_optns>\d+) +with +options$')
 
         # Opts:  0 end, 0 nop, 0 basic security, 0 loose source route
-        p10 = re.compile(r'^Opts: +(?P<ip_opts_end>\d+) +end,'
+        p10 = regex_engine.compile(r'^Opts: +(?P<ip_opts_end>\d+) +end,'
             r' +(?P<ip_opts_nop>\d+)'
             r' +nop, +(?P<ip_opts_basic_security>\d+) +basic +security, '
             r'+(?P<ip_opts_loose_src_route>\d+) +loose +source +route$')
 
         # 0 timestamp, 0 extended security, 0 record route
-        p11 = re.compile(r'^(?P<ip_opts_timestamp>\d+) +timestamp,'
+        p11 = regex_engine.compile(r'^(?P<ip_opts_timestamp>\d+) +timestamp,'
             r' +(?P<ip_opts_extended_security>\d+)'
             r' +extended +security, +(?P<ip_opts_record_route>\d+)'
             r' +record +route$')
 
         # 0 stream ID, 0 strict source route, 12717 alert, 0 cipso, 0 ump
-        p12 = re.compile(r'^(?P<ip_opts_strm_id>\d+) +stream +ID,'
+        p12 = regex_engine.compile(r'^(?P<ip_opts_strm_id>\d+) +stream +ID,'
             r' +(?P<ip_opts_strct_src_route>\d+)'
             r' +strict +source +route, +(?P<ip_opts_alert>\d+) +alert, '
             r'+(?P<ip_opts_cipso>\d+) +cipso, +(?P<ip_opts_ump>\d+) +ump$')
 
         # 0 other, 0 ignored
-        p13 = re.compile(r'^(?P<ip_opts_other>\d+) +other'
+        p13 = regex_engine.compile(r'^(?P<ip_opts_other>\d+) +other'
             r'(, +(?P<ip_opts_ignored>\d+) +ignored)?$')
 
         # Frags: 0 reassembled, 0 timeouts, 0 couldn't reassemble
-        p14 = re.compile(r'^Frags: +(?P<ip_frags_reassembled>\d+) +reassembled,'
+        p14 = regex_engine.compile(r'^Frags: +(?P<ip_frags_reassembled>\d+) +reassembled,'
             r' +(?P<ip_frags_timeouts>\d+)'
             r' +timeouts, +(?P<ip_frags_no_reassembled>\d+)'
             r' +couldn\'t +reassemble$')
 
         # 1 fragmented, 5 fragments, 0 couldn't fragment
         # 0 fragmented, 0 couldn't fragment
-        p15 = re.compile(r'^(?P<ip_frags_fragmented>\d+) +fragmented,'
+        p15 = regex_engine.compile(r'^(?P<ip_frags_fragmented>\d+) +fragmented,'
             r'( +(?P<ip_frags_fragments>\d+) +fragments,)?'
             r' +(?P<ip_frags_no_fragmented>\d+)'
             r' +couldn\'t +fragment$')
 
         # 0 invalid hole
-        p16 = re.compile(r'^(?P<ip_frags_invalid_hole>\d+) +invalid hole$')
+        p16 = regex_engine.compile(r'^(?P<ip_frags_invalid_hole>\d+) +invalid hole$')
 
         # Bcast: 33324 received, 5 sent
-        p17 = re.compile(r'^Bcast: +(?P<ip_bcast_received>\d+) +received,'
+        p17 = regex_engine.compile(r'^Bcast: +(?P<ip_bcast_received>\d+) +received,'
             r' +(?P<ip_bcast_sent>\d+) +sent$')
 
         # Mcast: 144833 received, 66274 sent
-        p18 = re.compile(r'^Mcast: +(?P<ip_mcast_received>\d+) +received,'
+        p18 = regex_engine.compile(r'^Mcast: +(?P<ip_mcast_received>\d+) +received,'
             r' +(?P<ip_mcast_sent>\d+) +sent$')
 
         # Sent:  85543 generated, 1654728 forwarded
-        p19 = re.compile(r'^Sent: +(?P<ip_sent_generated>\d+) +generated,'
+        p19 = regex_engine.compile(r'^Sent: +(?P<ip_sent_generated>\d+) +generated,'
             r' +(?P<ip_sent_forwarded>\d+) +forwarded$')
 
         # Drop:  8 encapsulation failed, 0 unresolved, 20 no adjacency
-        p20 = re.compile(r'^Drop: +(?P<ip_drop_encap_failed>\d+) +encapsulation'
+        p20 = regex_engine.compile(r'^Drop: +(?P<ip_drop_encap_failed>\d+) +encapsulation'
             r' +failed, +(?P<ip_drop_unresolved>\d+)'
             r' +unresolved, +(?P<ip_drop_no_adj>\d+) +no +adjacency$')
 
         # 19 no route, 0 unicast RPF, 0 forced drop, 0 unsupported-addr
         # 0 no route, 0 unicast RPF, 0 forced drop
-        p21 = re.compile(r'^(?P<ip_drop_no_route>\d+) +no +route,'
+        p21 = regex_engine.compile(r'^(?P<ip_drop_no_route>\d+) +no +route,'
             r' +(?P<ip_drop_unicast_rpf>\d+)'
             r' +unicast +RPF, +(?P<ip_drop_forced_drop>\d+) +forced +drop'
             r'(, +(?P<ip_drop_unsupp_address>\d+) +unsupported-addr)?$')
 
         # 0 options denied, 0 source IP address zero
-        p22 = re.compile(r'^(?P<ip_drop_opts_denied>\d+) +options +denied(,'
+        p22 = regex_engine.compile(r'^(?P<ip_drop_opts_denied>\d+) +options +denied(,'
             r' +(?P<ip_drop_src_ip>\d+) +source +IP +address +zero)?$')
 
         # ICMP statistics:
-        p23 = re.compile(r'^ICMP +statistics:')
+        p23 = regex_engine.compile(r'^ICMP +statistics:')
 
         # Rcvd: 0 format errors, 0 checksum errors, 0 redirects, 0 unreachable
-        p24 = re.compile(r'^Rcvd: +(?P<icmp_received_format_errors>\d+) +format '
+        p24 = regex_engine.compile(r'^Rcvd: +(?P<icmp_received_format_errors>\d+) +format '
             r'+errors, +(?P<icmp_received_checksum_errors>\d+) +checksum +errors, '
             r'+(?P<icmp_received_redirects>\d+) +redirects, '
             r'+(?P<icmp_received_unreachable>\d+) +unreachable$')
 
         # 284 echo, 9 echo reply, 0 mask requests, 0 mask replies, 0 quench
         # 43838 echo, 713 echo reply, 0 mask requests, 0 mask replies, 0 quench
-        p25 = re.compile(r'^(?P<icmp_received_echo>\d+) +echo,'
+        p25 = regex_engine.compile(r'^(?P<icmp_received_echo>\d+) +echo,'
             r' +(?P<icmp_received_echo_reply>\d+)'
             r' +echo +reply, +(?P<icmp_received_mask_requests>\d+) +mask'
             r' +requests, +(?P<icmp_received_mask_replies>\d+) +mask +replies, '
@@ -529,193 +533,193 @@ class ShowIpTraffic(ShowIpTrafficSchema):
 
         # 0 parameter, 0 timestamp, 0 timestamp replies, 0 info request, 0 other
         # 0 parameter, 0 timestamp, 0 info request, 0 other
-        p26 = re.compile(r'^(?P<icmp_received_parameter>\d+) +parameter,'
+        p26 = regex_engine.compile(r'^(?P<icmp_received_parameter>\d+) +parameter,'
             r' +(?P<icmp_received_timestamp>\d+)'
             r' +timestamp(, +(?P<icmp_received_timestamp_replies>\d+) +timestamp'
             r' +replies)?, +(?P<icmp_received_info_request>\d+) +info +request,'
             r' +(?P<icmp_received_other>\d+) +other$')
 
         # 0 irdp solicitations, 0 irdp advertisements
-        p27 = re.compile(r'^(?P<icmp_received_irdp_solicitations>\d+) '
+        p27 = regex_engine.compile(r'^(?P<icmp_received_irdp_solicitations>\d+) '
             r'+irdp +solicitations, +(?P<icmp_received_irdp_advertisements>\d+)'
             r' +irdp +advertisements$')
 
         # 0 time exceeded, 0 info replies
-        p28 = re.compile(r'^(?P<icmp_received_time_exceeded>\d+) '
+        p28 = regex_engine.compile(r'^(?P<icmp_received_time_exceeded>\d+) '
             r'+time +exceeded, +(?P<icmp_received_info_replies>\d+)'
             r' +info +replies$')
 
         # Sent: 0 redirects, 14 unreachable, 9 echo, 134 echo reply
-        p29 = re.compile(r'^Sent: +(?P<icmp_sent_redirects>\d+) +redirects, '
+        p29 = regex_engine.compile(r'^Sent: +(?P<icmp_sent_redirects>\d+) +redirects, '
             r'+(?P<icmp_sent_unreachable>\d+) +unreachable,'
             r' +(?P<icmp_sent_echo>\d+) +echo, +(?P<icmp_sent_echo_reply>\d+) '
             r'+echo +reply$')
 
         # 0 mask requests, 0 mask replies, 0 quench, 0 timestamp, 0 timestamp replies
         # 0 mask requests, 0 mask replies, 0 quench, 0 timestamp
-        p30 = re.compile(r'^(?P<icmp_sent_mask_requests>\d+) +mask +requests, '
+        p30 = regex_engine.compile(r'^(?P<icmp_sent_mask_requests>\d+) +mask +requests, '
             r'+(?P<icmp_sent_mask_replies>\d+)'
             r' +mask +replies, +(?P<icmp_sent_quench>\d+) +quench, '
             r'+(?P<icmp_sent_timestamp>\d+) +timestamp'
             r'(, +(?P<icmp_sent_timestamp_replies>\d+) +timestamp +replies)?$')
 
         # 0 info reply, 0 time exceeded, 0 parameter problem
-        p31 = re.compile(r'^(?P<icmp_sent_info_reply>\d+) +info +reply, '
+        p31 = regex_engine.compile(r'^(?P<icmp_sent_info_reply>\d+) +info +reply, '
             r'+(?P<icmp_sent_time_exceeded>\d+) +time +exceeded, '
             r'+(?P<icmp_sent_parameter_problem>\d+) +parameter +problem$')
 
         # 0 irdp solicitations, 0 irdp advertisements
-        p32 = re.compile(r'^(?P<icmp_sent_irdp_solicitations>\d+) +irdp '
+        p32 = regex_engine.compile(r'^(?P<icmp_sent_irdp_solicitations>\d+) +irdp '
             r'+solicitations, +(?P<icmp_sent_irdp_advertisements>\d+)'
             r' +irdp +advertisements$')
 
         # UDP statistics:
-        p33 = re.compile(r'^UDP +statistics:')
+        p33 = regex_engine.compile(r'^UDP +statistics:')
 
         # Rcvd: 62515 total, 0 checksum errors, 15906 no port 0 finput
         # Rcvd: 682217 total, 0 checksum errors, 289579 no port
-        p34 = re.compile(r'^Rcvd: +(?P<udp_received_total>\d+) +total,'
+        p34 = regex_engine.compile(r'^Rcvd: +(?P<udp_received_total>\d+) +total,'
             r' +(?P<udp_received_udp_checksum_errors>\d+) +checksum +errors,'
             r' +(?P<udp_received_no_port>\d+) +no port( +(?P<udp_received_finput>\d+) '
             r'+finput)?$')
 
         # Sent: 41486 total, 0 forwarded broadcasts
-        p35 = re.compile(r'^Sent: +(?P<udp_sent_total>\d+) +total, '
+        p35 = regex_engine.compile(r'^Sent: +(?P<udp_sent_total>\d+) +total, '
             r'+(?P<udp_sent_fwd_broadcasts>\d+) +forwarded +broadcasts$')
 
         # OSPF statistics:
-        p36 = re.compile(r'^OSPF +statistics:')
+        p36 = regex_engine.compile(r'^OSPF +statistics:')
 
         # Last clearing of OSPF traffic counters never
-        p37 = re.compile(r'^Last +clearing +of +OSPF +traffic +counters '
+        p37 = regex_engine.compile(r'^Last +clearing +of +OSPF +traffic +counters '
             r'+(?P<ospf_traffic_cntrs_clear>\w+)$')
 
         # Rcvd: 16222 total, 0 checksum errors
-        p38 = re.compile(r'^Rcvd: +(?P<ospf_received_total>\d+) +total, '
+        p38 = regex_engine.compile(r'^Rcvd: +(?P<ospf_received_total>\d+) +total, '
             r'+(?P<ospf_received_checksum_errors>\d+) +checksum errors$')
 
         # 15153 hello, 20 database desc, 2 link state req
-        p39 = re.compile(r'^(?P<ospf_received_hello>\d+) +hello, '
+        p39 = regex_engine.compile(r'^(?P<ospf_received_hello>\d+) +hello, '
             r'+(?P<ospf_received_database_desc>\d+)'
             r' +database +desc, +(?P<ospf_received_link_state_req>\d+) '
             r'+link +state +req$')
 
         # 359 link state updates, 688 link state acks
-        p40 = re.compile(r'^(?P<ospf_received_lnk_st_updates>\d+) +link '
+        p40 = regex_engine.compile(r'^(?P<ospf_received_lnk_st_updates>\d+) +link '
             r'+state +updates, +(?P<ospf_received_lnk_st_acks>\d+) +link '
             r'+state +acks$')
 
         # Sent: 9456 total
-        p41 = re.compile(r'^Sent: +(?P<sent_total>\d+) +total$')
+        p41 = regex_engine.compile(r'^Sent: +(?P<sent_total>\d+) +total$')
 
         # 8887 hello, 30 database desc, 8 link state req
-        p42 = re.compile(r'^(?P<ospf_sent_hello>\d+) +hello, '
+        p42 = regex_engine.compile(r'^(?P<ospf_sent_hello>\d+) +hello, '
             r'+(?P<ospf_sent_database_desc>\d+)'
             r' +database +desc, +(?P<ospf_sent_lnk_st_acks>\d+) +link +state '
             r'+req$')
 
         # 299 link state updates, 239 link state acks
-        p43 = re.compile(r'^(?P<ospf_sent_lnk_st_updates>\d+) +link '
+        p43 = regex_engine.compile(r'^(?P<ospf_sent_lnk_st_updates>\d+) +link '
             r'+state +updates, +(?P<ospf_sent_lnk_st_acks>\d+) +link '
             r'+state +acks$')
 
         # PIMv2 statistics: Sent/Received
-        p44 = re.compile(r'^PIMv2 +statistics: +Sent/Received')
+        p44 = regex_engine.compile(r'^PIMv2 +statistics: +Sent/Received')
 
         # Total: 7458/8859, 0 checksum errors, 0 format errors
-        p45 = re.compile(r'^Total: +(?P<pimv2_total>[\d\/]+), '
+        p45 = regex_engine.compile(r'^Total: +(?P<pimv2_total>[\d\/]+), '
             r'+(?P<pimv2_checksum_errors>\d+) +checksum +errors, '
             r'+(?P<pimv2_format_errors>\d+) +format +errors$')
 
         # Registers: 1/1 (0 non-rp, 0 non-sm-group), Register Stops: 1/1,  Hellos: 5011/5008
-        p46 = re.compile(r'^Registers: +(?P<pimv2_registers>[\d\/]+) +'
+        p46 = regex_engine.compile(r'^Registers: +(?P<pimv2_registers>[\d\/]+) +'
             r'\((?P<pimv2_non_rp>\d+) +non-rp, +(?P<pimv2_non_sm_group>\d+) '
             r'+non-sm-group\), +Register +Stops:'
             r' +(?P<pimv2_registers_stops>[\d\/]+),'
             r' +Hellos: +(?P<pimv2_hellos>[\d\/]+)$')
 
         # Join/Prunes: 5/712, Asserts: 0/697, grafts: 0/2
-        p47 = re.compile(r'^Join/Prunes: +(?P<pimv2_join_prunes>[\d\/]+), '
+        p47 = regex_engine.compile(r'^Join/Prunes: +(?P<pimv2_join_prunes>[\d\/]+), '
             r'+Asserts: +(?P<pimv2_asserts>[\d\/]+), +grafts: '
             r'+(?P<pimv2_grafts>[\d\/]+)$')
 
         # Bootstraps: 2088/2438, Candidate_RP_Advertisements: 350/0
-        p48 = re.compile(r'^Bootstraps: +(?P<pimv2_bootstraps>[\d\/]+), '
+        p48 = regex_engine.compile(r'^Bootstraps: +(?P<pimv2_bootstraps>[\d\/]+), '
             r'+Candidate_RP_Advertisements:'
             r' +(?P<pimv2_candidate_rp_advs>[\d\/]+)$')
 
         # Queue drops: 0
-        p49 = re.compile(r'^Queue drops: +(?P<pimv2_queue_drops>[\d]+)$')
+        p49 = regex_engine.compile(r'^Queue drops: +(?P<pimv2_queue_drops>[\d]+)$')
 
         # State-Refresh: 0/0
-        p50 = re.compile(r'^State-Refresh: +(?P<pimv2_state_refresh>[\d\/]+)$')
+        p50 = regex_engine.compile(r'^State-Refresh: +(?P<pimv2_state_refresh>[\d\/]+)$')
 
         # IGMP statistics: Sent/Received
-        p51 = re.compile(r'^IGMP +statistics: +Sent/Received')
+        p51 = regex_engine.compile(r'^IGMP +statistics: +Sent/Received')
 
         # Total: 2832/4946, Format errors: 0/0, Checksum errors: 0/0
-        p52 = re.compile(r'^Total: +(?P<igmp_total>[\d\/]+),'
+        p52 = regex_engine.compile(r'^Total: +(?P<igmp_total>[\d\/]+),'
             r' +Format +errors: +(?P<igmp_format_errors>[\d\/]+),'
             r' +Checksum +errors: +(?P<igmp_checksum_errors>[\d\/]+)$')
 
         # Host Queries: 2475/1414, Host Reports: 357/3525, Host Leaves: 0/5
-        p53 = re.compile(r'^Host +Queries: +(?P<igmp_host_queries>[\d\/]+),'
+        p53 = regex_engine.compile(r'^Host +Queries: +(?P<igmp_host_queries>[\d\/]+),'
             r' +Host +Reports: +(?P<igmp_host_reports>[\d\/]+),'
             r' +Host +Leaves: +(?P<igmp_host_leaves>[\d\/]+)$')
 
         # DVMRP: 0/0, PIM: 0/0
-        p54 = re.compile(r'^DVMRP: +(?P<igmp_dvmrp>[\d\/]+), '
+        p54 = regex_engine.compile(r'^DVMRP: +(?P<igmp_dvmrp>[\d\/]+), '
             r'+PIM: +(?P<igmp_pim>[\d\/]+)$')
 
         # Queue drops: 0
-        p55 = re.compile(r'^Queue drops: +(?P<igmp_queue_drops>[\d]+)$')
+        p55 = regex_engine.compile(r'^Queue drops: +(?P<igmp_queue_drops>[\d]+)$')
 
         # TCP statistics:
-        p56 = re.compile(r'^TCP +statistics:')
+        p56 = regex_engine.compile(r'^TCP +statistics:')
 
         # Rcvd: 15396 total, 0 checksum errors, 0 no port
-        p57 = re.compile(r'^Rcvd: +(?P<tcp_received_total>\d+) +total,'
+        p57 = regex_engine.compile(r'^Rcvd: +(?P<tcp_received_total>\d+) +total,'
             r' +(?P<tcp_received_checksum_errors>\d+) +checksum +errors,'
             r' +(?P<tcp_received_no_port>\d+) +no +port$')
 
         # Sent: 19552 total
-        p58 = re.compile(r'^Sent: +(?P<tcp_sent_total>\d+) +total$')
+        p58 = regex_engine.compile(r'^Sent: +(?P<tcp_sent_total>\d+) +total$')
 
         # EIGRP-IPv4 statistics:
-        p59 = re.compile(r'^EIGRP-IPv4 +statistics:')
+        p59 = regex_engine.compile(r'^EIGRP-IPv4 +statistics:')
 
         # IP-EIGRP statistics:
-        p59_1 = re.compile(r'^IP-EIGRP +statistics:')
+        p59_1 = regex_engine.compile(r'^IP-EIGRP +statistics:')
 
         # Rcvd: 4612 total
-        p60 = re.compile(r'^Rcvd: +(?P<eigrp_ipv4_received_total>\d+) +total$')
+        p60 = regex_engine.compile(r'^Rcvd: +(?P<eigrp_ipv4_received_total>\d+) +total$')
 
         # Sent: 4611 total
-        p61 = re.compile(r'^Sent: +(?P<eigrp_ipv4_sent_total>\d+) +total$')
+        p61 = regex_engine.compile(r'^Sent: +(?P<eigrp_ipv4_sent_total>\d+) +total$')
 
         # BGP statistics:
-        p62 = re.compile(r'^BGP +statistics:')
+        p62 = regex_engine.compile(r'^BGP +statistics:')
 
         # Rcvd: 2185 total, 6 opens, 0 notifications, 12 updates
-        p63 = re.compile(r'^Rcvd: +(?P<bgp_received_total>\d+) +total,'
+        p63 = regex_engine.compile(r'^Rcvd: +(?P<bgp_received_total>\d+) +total,'
             r' +(?P<bgp_received_opens>\d+) +opens,'
             r' +(?P<bgp_received_notifications>\d+) +notifications,'
             r' +(?P<bgp_received_updates>\d+) +updates$')
 
         # 2167 keepalives, 0 route-refresh, 0 unrecognized
-        p64 = re.compile(r'^(?P<bgp_received_keepalives>\d+) +keepalives, '
+        p64 = regex_engine.compile(r'^(?P<bgp_received_keepalives>\d+) +keepalives, '
             r'+(?P<bgp_received_route_refresh>\d+)'
             r' +route-refresh, +(?P<bgp_received_unrecognized>\d+)'
             r' +unrecognized$')
 
         # Sent: 2304 total, 6 opens, 2 notifications, 0 updates
-        p65 = re.compile(r'^Sent: +(?P<bgp_sent_total>\d+) +total,'
+        p65 = regex_engine.compile(r'^Sent: +(?P<bgp_sent_total>\d+) +total,'
             r' +(?P<bgp_sent_opens>\d+) +opens,'
             r' +(?P<bgp_sent_notifications>\d+) +notifications,'
             r' +(?P<bgp_sent_updates>\d+) +updates$')
 
         # 2296 keepalives, 0 route-refresh
-        p66 = re.compile(r'^(?P<bgp_sent_keepalives>\d+) +keepalives, '
+        p66 = regex_engine.compile(r'^(?P<bgp_sent_keepalives>\d+) +keepalives, '
             r'+(?P<bgp_sent_route_refresh>\d+) +route-refresh$')
 
         # initial variables
@@ -1232,11 +1236,11 @@ class ShowArpApplication(ShowArpApplicationSchema):
         ret_dict = {}
         
         # Number of clients registered: 16
-        p1 = re.compile(r'^\s*Number +of +clients +registered: +' \
-                r'(?P<num_of_clients>\d+)$')
+        p1 = regex_engine.compile(r'^\s*Number +of +clients +registered: +' \
+                          r'(?P<num_of_clients>\d+)$')
 
         # ASR1000-RP SPA Ether215 10024
-        p2 = re.compile(r'^(?P<application_name>[\w\W]{0,20})(?P<id>\d+)\s+(?P<num_of_subblocks>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<application_name>[\w\W]{0,20})(?P<id>\d+)\s+(?P<num_of_subblocks>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1297,23 +1301,23 @@ class ShowArpSummary(ShowArpSummarySchema):
         ret_dict = {}
 
         # Total number of entries in the ARP table: 1233
-        p1 = re.compile(r'^Total +number +of +entries +in +the +ARP +table: +' \
-                r'(?P<arp_table_entries>\d+)\.$')
+        p1 = regex_engine.compile(r'^Total +number +of +entries +in +the +ARP +table: +' \
+                          r'(?P<arp_table_entries>\d+)\.$')
         
         # Total number of Dynamic ARP entries: 1123
-        p2 = re.compile(r'^Total +number +of +(?P<entry_name>[\S\s]+): +' \
-                r'(?P<num_of_entries>\d+)\.$')
+        p2 = regex_engine.compile(r'^Total +number +of +(?P<entry_name>[\S\s]+): +' \
+                          r'(?P<num_of_entries>\d+)\.$')
 
         # GigabitEthernet0/0/4  4
-        p3 = re.compile(r'^(?P<interface_name>[\w\/\.]+) +(?P<entry_count>\d+)')
+        p3 = regex_engine.compile(r'^(?P<interface_name>[\w\/\.]+) +(?P<entry_count>\d+)')
 
         # Learn ARP Entry Threshold is 409600 and Permit Threshold is 486400.
-        p4 = re.compile(r'^Learn +ARP +Entry +Threshold +is +' \
+        p4 = regex_engine.compile(r'^Learn +ARP +Entry +Threshold +is +' \
             r'(?P<arp_entry_threshold>\d+) +and +Permit +Threshold +is +' \
             r'(?P<permit_threshold>\d+).?$')
 
         # Maximum limit of Learn ARP entry : 512000.
-        p5 = re.compile(r'^(?P<maximum_entries_name>[\w\W]+) +: +' \
+        p5 = regex_engine.compile(r'^(?P<maximum_entries_name>[\w\W]+) +: +' \
             r'(?P<maximum_entries>\d+).$')
 
         for line in out.splitlines():
@@ -1390,26 +1394,26 @@ class ShowIpArpInspectionVlan(ShowIpArpInspectionVlanSchema):
         ret_dict = {}
         
         #Source Mac Validation : Disabled
-        p1 = re.compile(r'^Source\s+Mac\s+Validation\s+:\s+(?P<src_mac_validation>\S+)')
+        p1 = regex_engine.compile(r'^Source\s+Mac\s+Validation\s+:\s+(?P<src_mac_validation>\S+)')
         
         #Destination Mac Validation : Disabled
-        p2 = re.compile(r'^Destination\s+Mac\s+Validation\s+:\s+(?P<dst_mac_validation>\S+)')
+        p2 = regex_engine.compile(r'^Destination\s+Mac\s+Validation\s+:\s+(?P<dst_mac_validation>\S+)')
         
         #IP Address Validation : Disabled
-        p3 = re.compile(r'^IP\s+Address\s+Validation\s+:\s+(?P<ip_address_validation>\S+)')
+        p3 = regex_engine.compile(r'^IP\s+Address\s+Validation\s+:\s+(?P<ip_address_validation>\S+)')
         
         #Vlan Configuration Operation ACL Match Static ACL
         #10 Enabled Active
-        p4 = re.compile(r'^(?P<vlan_num>\d+) +'
-                r'(?P<configuration>[a-zA-Z]+) +'
-                r'(?P<operation>[a-zA-Z]+$)')
+        p4 = regex_engine.compile(r'^(?P<vlan_num>\d+) +'
+                          r'(?P<configuration>[a-zA-Z]+) +'
+                          r'(?P<operation>[a-zA-Z]+$)')
 
         #Vlan ACL Logging DHCP Logging Probe Logging
         #10 Deny Deny Off        
-        p5 = re.compile(r'^(?P<vlan>\d+) +'
-                r'(?P<acl_logging>[a-zA-Z-]+) +'
-                r'(?P<dhcp_logging>[a-zA-Z]+) +'
-                r'(?P<probe_logging>[a-zA-Z]+$)')
+        p5 = regex_engine.compile(r'^(?P<vlan>\d+) +'
+                          r'(?P<acl_logging>[a-zA-Z-]+) +'
+                          r'(?P<dhcp_logging>[a-zA-Z]+) +'
+                          r'(?P<probe_logging>[a-zA-Z]+$)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1476,24 +1480,24 @@ class ShowAdjacencySummary(ShowAdjacencySummarySchema):
         if output is None:
             output = self.device.execute(self.cli_command)
         # 60004 complete adjacencies
-        p1 = re.compile(r'^(?P<complete_adjacencies>\d+) +complete adjacencies$')
+        p1 = regex_engine.compile(r'^(?P<complete_adjacencies>\d+) +complete adjacencies$')
          
         # 0 incomplete adjacencies
-        p2 = re.compile(r'^(?P<incomplete_adjacencies>\d+) +incomplete adjacencies$')
+        p2 = regex_engine.compile(r'^(?P<incomplete_adjacencies>\d+) +incomplete adjacencies$')
          
         # complete adjacencies of linktype IPV6 / Ip
-        p3 = re.compile(r'^\d+ complete adjacencies of linktype +(?P<complete_adj_linktype>\S+)$')
+        p3 = regex_engine.compile(r'^\d+ complete adjacencies of linktype +(?P<complete_adj_linktype>\S+)$')
         #incomplete adjacencies of linktype IPV6 / IP
-        p4 = re.compile(r'^\d+ incomplete adjacencies of linktype +(?P<incomplete_adj_linktype>\S+)$')
+        p4 = regex_engine.compile(r'^\d+ incomplete adjacencies of linktype +(?P<incomplete_adj_linktype>\S+)$')
          
         #Database epoch:        0 (60004 entries at this epoch)
-        p5_1 = re.compile(r'^Database epoch: +(?P<database_epoch>\d+) +\((?P<epoch_entries>\d+) entries at this epoch\)$')
+        p5_1 = regex_engine.compile(r'^Database epoch: +(?P<database_epoch>\d+) +\((?P<epoch_entries>\d+) entries at this epoch\)$')
         #Database epoch:        0
-        p5_2 = re.compile(r'^Database epoch: +(?P<database_epoch>\d+)$')
+        p5_2 = regex_engine.compile(r'^Database epoch: +(?P<database_epoch>\d+)$')
         # Summary events epoch is 5
-        p6 = re.compile(r'^Summary events epoch is +(?P<summary_events_epoch>\d+)$')
+        p6 = regex_engine.compile(r'^Summary events epoch is +(?P<summary_events_epoch>\d+)$')
         # Summary events queue contains 0 events (high water mark 389 events)
-        p7 = re.compile(r'^Summary\s+events\s+queue\s+contains\s+(?P<summary_events_queue>\d+) events +\(high water mark (?P<hwm_events>\d+) events\)$')
+        p7 = regex_engine.compile(r'^Summary\s+events\s+queue\s+contains\s+(?P<summary_events_queue>\d+) events +\(high water mark (?P<hwm_events>\d+) events\)$')
         ret_dict = {}
         for line in output.splitlines():
             line = line.strip()
@@ -1575,10 +1579,10 @@ class ShowIpArpInspectionStatisticsVlan(ShowIpArpInspectionStatisticsVlanSchema)
         ret_dict = {}
 
         # Regular expression for the first two sections of the output
-        p1 = re.compile(r"^\s*(?P<var_1>\d+)\s+(?P<var_2>\d+)\s+(?P<var_3>\d+)\s+(?P<var_4>\d+)\s+(?P<var_5>\d+)$")
+        p1 = regex_engine.compile(r"^\s*(?P<var_1>\d+)\s+(?P<var_2>\d+)\s+(?P<var_3>\d+)\s+(?P<var_4>\d+)\s+(?P<var_5>\d+)$")
 
         # Regular expression for the third section of the output
-        p2 = re.compile(r"^\s*(?P<var_6>\d+)\s+(?P<var_7>\d+)\s+(?P<var_8>\d+)\s+(?P<var_9>\d+)$")
+        p2 = regex_engine.compile(r"^\s*(?P<var_6>\d+)\s+(?P<var_7>\d+)\s+(?P<var_8>\d+)\s+(?P<var_9>\d+)$")
         
         # This variable is used to parse the first two sections in the output
         flag = True
@@ -1649,7 +1653,7 @@ class ShowIpArpInspectionInterfaces(ShowIpArpInspectionInterfacesSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         #  Gi1/0/1          Untrusted               15                 1
-        p1 = re.compile(r"^\s+(?P<interface>\S+)\s+(?P<state>\w+)\s+(?P<rate>\d+)\s+(?P<interval>\d+)$")
+        p1 = regex_engine.compile(r"^\s+(?P<interface>\S+)\s+(?P<state>\w+)\s+(?P<rate>\d+)\s+(?P<interval>\d+)$")
 
         ret_dict = {}
         for line in output.splitlines():
@@ -1702,13 +1706,13 @@ class ShowIpArpInspectionLog(ShowIpArpInspectionLogSchema):
             output = self.device.execute(self.cli_command)
 
         # Total Log Buffer Size : 100
-        p1 = re.compile(r"^Total\s+Log\s+Buffer\s+Size\s+:\s+(?P<buffer_size>\d+)$")
+        p1 = regex_engine.compile(r"^Total\s+Log\s+Buffer\s+Size\s+:\s+(?P<buffer_size>\d+)$")
 
         # Syslog rate : 10 entries per 120 seconds.
-        p2 = re.compile(r"^Syslog\s+rate\s+:\s+(?P<syslog_rate>\S+\s+\S+\s+\S+\s+\S+\s+\S+)\.$")
+        p2 = regex_engine.compile(r"^Syslog\s+rate\s+:\s+(?P<syslog_rate>\S+\s+\S+\s+\S+\s+\S+\s+\S+)\.$")
 
         # Gi1/0/37    10    5006.0484.c213  10.1.1.60                1  DHCP Permit   16:35:37 UTC Fri Aug 26 2022
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<interface>\S+)\s+(?P<vlan_id>\d+)\s+(?P<send_mac_addr>\S+)\s+(?P<sender_ip>(\d{1,3}\.){3}\d{1,3})\s+(?P<no_pkts>\d+)\s+(?P<reason>\S+\s+\S+)\s+(?P<time_range>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
 
         ret_dict = {}
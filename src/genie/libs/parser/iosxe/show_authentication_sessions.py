@@ -20,6 +20,7 @@ from genie.metaparser.util.schemaengine import Schema, \
     Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 '''
@@ -91,26 +92,26 @@ class ShowAuthenticationSessions(ShowAuthenticationSessionsSchema):
         # initial regexp pattern
 
         # Interface  MAC Address     Method   Domain   Status         Session ID
-        p1 = re.compile(r'^Interface +MAC +Address +Method +Domain +Status +Session +ID')
+        p1 = regex_engine.compile(r'^Interface +MAC +Address +Method +Domain +Status +Session +ID')
 
         # Interface Identifier Method Domain Status Fg Session ID
-        p2 = re.compile(r'^Interface +Identifier +Method +Domain +Status +Fg +Session +ID')
+        p2 = regex_engine.compile(r'^Interface +Identifier +Method +Domain +Status +Fg +Session +ID')
 
         # Matching patterns
         # Gi1/48     0015.63ff.a727  dot1x    DATA     Authz Success  0A3462B1000000102983C05C
         # Gi1/5      000f.23ff.69c5  mab      DATA     Authz Success  0A3462B10000000D24F80B58
         # Gi1/5      0014.bfff.30ca  dot1x    DATA     Authz Success  0A3462B10000000E29811B94
         # Gi1/0/7    0014.bfff.30ca  N/A      DATA     Authz Success  0A3462B10000000E29811B94
-        p4 = re.compile(r'^(?P<interface>\S+) +'
-                        r'(?P<client>\w+\.\w+\.\w+) +'
-                        r'(?P<method>[\w/]+) +'
-                        r'(?P<domain>\w+) +'
-                        r'(?P<status>\w+(?: +\w+)?) +'
-                        r'(?P<session>\w+)$')
+        p4 = regex_engine.compile(r'^(?P<interface>\S+) +'
+                                  r'(?P<client>\w+\.\w+\.\w+) +'
+                                  r'(?P<method>[\w/]+) +'
+                                  r'(?P<domain>\w+) +'
+                                  r'(?P<status>\w+(?: +\w+)?) +'
+                                  r'(?P<session>\w+)$')
 
         # *Session count = 2*
-        p5 = re.compile(r'(?:\*)?Session +[Cc]ount +\= '
-                        r'+(?P<session_count>\d+)(?:\*)?$')
+        p5 = regex_engine.compile(r'(?:\*)?Session +[Cc]ount +\= '
+                                  r'+(?P<session_count>\d+)(?:\*)?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -280,42 +281,42 @@ class ShowAuthenticationSessionsDetailsSuperParser(ShowAuthenticationSessionsDet
         # Authorized By:  Guest Vlan
         # Status:  Authz Success
         # *ACS ACL:* *xGENIEx-Test_ACL_CiscoPhones-e23431ede2*
-        p1 = re.compile(r'(?:\*)?(?P<argument>[\w\s\-]+)\:(?:\*)? '
-                        r'+(?:\*)?(?P<value>[\w\s\-\.\./]+|\S+)(?:\*)?$')
+        p1 = regex_engine.compile(r'(?:\*)?(?P<argument>[\w\s\-]+)\:(?:\*)? '
+                                  r'+(?:\*)?(?P<value>[\w\s\-\.\./]+|\S+)(?:\*)?$')
 
         # Local Policies:
-        p2 = re.compile(r'^Local +Policies:')
+        p2 = regex_engine.compile(r'^Local +Policies:')
 
         # Template: CRITICAL_VLAN (priority 150)
         # Service Template: DEFAULT_LINKSEC_POLICY_SHOULD_SECURE (priority 150)
-        p3 = re.compile(r'^(?P<template_type>Service|Interface)?\s*Template: +(?P<template>\w+)\s*(\(priority +(?P<priority>[0-9]+)\))?$')
+        p3 = regex_engine.compile(r'^(?P<template_type>Service|Interface)?\s*Template: +(?P<template>\w+)\s*(\(priority +(?P<priority>[0-9]+)\))?$')
 
         # Vlan Group:  Vlan: 130
-        p4 = re.compile(r'^Vlan +Group: +(?P<vlan_name>\w+): +(?P<vlan_value>[0-9]+)$')
+        p4 = regex_engine.compile(r'^Vlan +Group: +(?P<vlan_name>\w+): +(?P<vlan_value>[0-9]+)$')
 
         # Method status list:
-        p5 = re.compile(r'^Method +status +list:')
+        p5 = regex_engine.compile(r'^Method +status +list:')
 
         # dot1x            Authc Failed
-        p6 = re.compile(r'^(?P<method>[dot1x|mab|webauth]\w+) +(?P<state>(\w+\s\w+)|(\w+))$')
+        p6 = regex_engine.compile(r'^(?P<method>[dot1x|mab|webauth]\w+) +(?P<state>(\w+\s\w+)|(\w+))$')
 
         # Runnable methods list:
-        p7 = re.compile(r'^Runnable +methods +list:')
+        p7 = regex_engine.compile(r'^Runnable +methods +list:')
 
         # For IOS output as this line will determine the index
-        p8 = re.compile(r'^-+$')
+        p8 = regex_engine.compile(r'^-+$')
 
         # Session timeout:  43200s(local), Remaining: 31799s
         # Session timeout:  N/A
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^Session +timeout: +(?P<value>\S+)(?:\s*\((?P<name>\w+)\), +Remaining: +(?P<remaining>[\S]+))?')
 
         #   Security Policy:  Should Secure
         #   Security Status:  Link Unsecure
-        p10 = re.compile(r'^Security +(?P<security_name>\S+): +(?P<policy_status>[\S ]+)$')
+        p10 = regex_engine.compile(r'^Security +(?P<security_name>\S+): +(?P<policy_status>[\S ]+)$')
         
         # *      Security Policy:  None      Security Status:  Link Unsecured*
-        p10_1 = re.compile(r'(.*)\s+ Security +(?P<security_name>\w+):(\s+)* +'
+        p10_1 = regex_engine.compile(r'(.*)\s+ Security +(?P<security_name>\w+):(\s+)* +'
                 r'(?P<policy_status>\w+(\s\w+)?)(\s+)+ Security +(?P<security_name2>\w+):(\s+)* '
                 r'+(?P<policy_status2>\w+(\s\w+)?)')
 
@@ -325,20 +326,20 @@ class ShowAuthenticationSessionsDetailsSuperParser(ShowAuthenticationSessionsDet
         # IPv6 Address: fe80::204:61ff:fe9d:f156
         # IPv6 Address: fe80::204:61ff
         # IPv6 Address: fe9d:f156::1
-        p11 = re.compile(r'^IPv6 +Address\: +(?P<ipv6>\S+?)$')
+        p11 = regex_engine.compile(r'^IPv6 +Address\: +(?P<ipv6>\S+?)$')
 
         # 1555:10::5ced:6cc3:825b:39da
         # 1555:10::225:1ff:fe00:5
-        p11_1 = re.compile(r'^(?P<address>[\w\:]+)$')
+        p11_1 = regex_engine.compile(r'^(?P<address>[\w\:]+)$')
 
         # Server Policies:
-        p12 = re.compile(r'^Server +Policies\:$')
+        p12 = regex_engine.compile(r'^Server +Policies\:$')
 
         # Restart timeout:  60s, Remaining: 44s
-        p13 = re.compile(r'(Restart\s*timeout)\s*:\s*(?P<timeout>\w+)s(\s*,\s*Remaining\s*:\s*(?P<remaining>\w+)s)?')
+        p13 = regex_engine.compile(r'(Restart\s*timeout)\s*:\s*(?P<timeout>\w+)s(\s*,\s*Remaining\s*:\s*(?P<remaining>\w+)s)?')
 
         # Unauth timeout:  10s, Remaining: 5s
-        p14 = re.compile(r'(Unauth\s*timeout)\s*:\s*(?P<timeout>\w+)s(\s*,\s*Remaining\s*:\s*(?P<remaining>\w+)s)?')
+        p14 = regex_engine.compile(r'(Unauth\s*timeout)\s*:\s*(?P<timeout>\w+)s(\s*,\s*Remaining\s*:\s*(?P<remaining>\w+)s)?')
 
         # initial return dictionary
         ret_dict = {}
@@ -647,7 +648,7 @@ class AuthenticationDisplayConfigMode(AuthenticationDisplayConfigModeSchema):
         if not output:
             output = self.device.execute(self.cli_command)
 
-        p1 = re.compile(r'^Current\sconfiguration\smode\sis\s(?P<current_config_mode>\S+)$')
+        p1 = regex_engine.compile(r'^Current\sconfiguration\smode\sis\s(?P<current_config_mode>\S+)$')
 
         ret_dict = {}
 
@@ -734,7 +735,7 @@ class ShowAccessSessionsInfo(ShowAccessSessionsInfoSchema):
         # initial regexp pattern
 
         #Interface    MAC Address    M:D:S    Vlan     IPv4        Policy               User-Role
-        p1 = re.compile(r'^Interface +MAC +Address +M:D:S +Vlan +IPv4 +Policy +User-Role')
+        p1 = regex_engine.compile(r'^Interface +MAC +Address +M:D:S +Vlan +IPv4 +Policy +User-Role')
 
         # Matching patterns
         #Gi3/0/11     0015.0100.0001 D1x:D:AZ  UA        200.1.0.1 Dot1x                UA
@@ -743,18 +744,18 @@ class ShowAccessSessionsInfo(ShowAccessSessionsInfoSchema):
         #Gi3/0/3      2894.0feb.9280 D1x:D:AZ 1001  101.100.100.98 Dot1x                USERABCD
         #Gi3/0/3      34db.fde5.34ab D1x:V:AZ  UA       UA         Dot1x                CP-6941-..
 
-        p2 = re.compile(r'^(?P<interface>\S+) +'
-                            r'(?P<client>\w+\.\w+\.\w+) +'
-                            r'(?P<mds>[\w/]+\:\w+\:\w+) +'
-                            r'(?P<vlan>\w+) +'
-                            r'(?P<ipv4>[\w\.]+) +'
-                            r'(?P<policy>\S+) +'
-                            r'(?P<role>.*)$')
+        p2 = regex_engine.compile(r'^(?P<interface>\S+) +'
+                                      r'(?P<client>\w+\.\w+\.\w+) +'
+                                      r'(?P<mds>[\w/]+\:\w+\:\w+) +'
+                                      r'(?P<vlan>\w+) +'
+                                      r'(?P<ipv4>[\w\.]+) +'
+                                      r'(?P<policy>\S+) +'
+                                      r'(?P<role>.*)$')
 
         # *Session count = 2* 
 
-        p3 = re.compile(r'(?:\*)?Session +[Cc]ount +\= '
-                        r'+(?P<session_count>\d+)(?:\*)?$')
+        p3 = regex_engine.compile(r'(?:\*)?Session +[Cc]ount +\= '
+                                  r'+(?P<session_count>\d+)(?:\*)?$')
 
         for line in show_output.splitlines():
             line = line.strip()
@@ -840,10 +841,10 @@ class ShowSessions(ShowSessionsSchema):
         parsed_dict = {}
 
         # Gi2/0/3 001a.a136.c68a dot1x VOICE Auth 2300130B0000002ABD0A2AF1
-        p1 = re.compile(r'^(?P<interface>\S+)\s+(?P<mac_address>\S+)\s+(?P<method>\S+)\s+(?P<domain>\S+)\s+(?P<status>\S+)\s+(?P<session_id>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<mac_address>\S+)\s+(?P<method>\S+)\s+(?P<domain>\S+)\s+(?P<status>\S+)\s+(?P<session_id>\S+)$')
 
         # Session count = 2
-        p2 = re.compile(r'^Session count\s+=\s+(?P<session_count>\d+)$')
+        p2 = regex_engine.compile(r'^Session count\s+=\s+(?P<session_count>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -946,13 +947,13 @@ class ShowAuthenticationMacDetails(ShowAuthenticationMacDetailsSchema):
             output = self.device.execute(cli)
 
         # Interface:  GigabitEthernet2/0/3
-        p1 = re.compile(r'^Interface:\s+(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<interface>\S+)$')
 
         # IIF-ID:  0x1D8DDC60
-        p2 = re.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
+        p2 = regex_engine.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
 
         # MAC Address:  001a.a136.c68a
-        p3 = re.compile(r'^MAC Address:\s+(?P<mac>\S+)$')
+        p3 = regex_engine.compile(r'^MAC Address:\s+(?P<mac>\S+)$')
 
         # IPv6 Address:  Unknown
         # IPv4 Address:  192.168.194.1
@@ -968,26 +969,26 @@ class ShowAuthenticationMacDetails(ShowAuthenticationMacDetailsSchema):
         # Acct Session ID:  0x0000003c
         # Handle:  0xdb000020
         # Current Policy:  test_dot1x
-        p4 = re.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Device Type|Device Name|Status|Domain|Oper host mode|'
-                        r'Oper control dir|Timeout action|Common Session ID|Acct Session ID|Handle|Current Policy):\s+(?P<value>\S+)$')
+        p4 = regex_engine.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Device Type|Device Name|Status|Domain|Oper host mode|'
+                                  r'Oper control dir|Timeout action|Common Session ID|Acct Session ID|Handle|Current Policy):\s+(?P<value>\S+)$')
 
         # Session timeout:  50s (server), Remaining: 27s
-        p5 = re.compile(r'^Session timeout:\s+(?P<server>\d+)s \(server\), Remaining: (?P<remaining>\d+)s$')
+        p5 = regex_engine.compile(r'^Session timeout:\s+(?P<server>\d+)s \(server\), Remaining: (?P<remaining>\d+)s$')
 
         # regex for server policies
-        p6 = re.compile(r'^Server Policies:$')
+        p6 = regex_engine.compile(r'^Server Policies:$')
 
         #Vlan Group:  Vlan: 194
-        p7 = re.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
+        p7 = regex_engine.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
 
         # Method status list:
-        p8 = re.compile(r'^Method status list:$')
+        p8 = regex_engine.compile(r'^Method status list:$')
 
         # Method           States
-        p9 = re.compile(r'^Method           States$') 
+        p9 = regex_engine.compile(r'^Method           States$') 
 
         # dot1x           Authc Success
-        p10 = re.compile(r'^(?P<method>\S+)           (?P<state>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^(?P<method>\S+)           (?P<state>[\S\s]+)$')
 
         ret_dict = {}
 
@@ -1170,64 +1171,64 @@ class ShowAuthenticationSessionInterface(ShowAuthenticationSessionInterfaceSchem
         ret_dict = {}
 
         # Interface:  GigabitEthernet2/0/3
-        p1 = re.compile(r'^Interface:\s+(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<interface>\S+)$')
 
         # IIF-ID:  0x1D8DDC60
-        p2 = re.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
+        p2 = regex_engine.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
 
         # MAC Address:  001a.a136.c68a
-        p3 = re.compile(r'^MAC Address:\s+(?P<mac_address>\S+)$')
+        p3 = regex_engine.compile(r'^MAC Address:\s+(?P<mac_address>\S+)$')
 
         # IPv6 Address:  Unknown
-        p4 = re.compile(r'^IPv6 Address:\s+(?P<ipv6_address>\S+)$')
+        p4 = regex_engine.compile(r'^IPv6 Address:\s+(?P<ipv6_address>\S+)$')
 
         # IPv4 Address:  192.168.194.1
-        p5 = re.compile(r'^IPv4 Address:\s+(?P<ipv4_address>\S+)$')
+        p5 = regex_engine.compile(r'^IPv4 Address:\s+(?P<ipv4_address>\S+)$')
 
         # User-Name:  CP-7961G-GE-SEP001AA136C68A
-        p6 = re.compile(r'^User-Name:\s+(?P<user_name>\S+)$')
+        p6 = regex_engine.compile(r'^User-Name:\s+(?P<user_name>\S+)$')
 
         # Device-type:  Cisco-IP-Phone-7961
-        p7 = re.compile(r'^Device-type:\s+(?P<device_type>[\S\s]+)$')
+        p7 = regex_engine.compile(r'^Device-type:\s+(?P<device_type>[\S\s]+)$')
 
         # Device-name:  Cisco IP Phone 7961
-        p8 = re.compile(r'^Device-name:\s+(?P<device_name>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^Device-name:\s+(?P<device_name>[\S\s]+)$')
 
         # Status:  Authorized
-        p9 = re.compile(r'^Status:\s+(?P<status>\S+)$')
+        p9 = regex_engine.compile(r'^Status:\s+(?P<status>\S+)$')
 
         # Domain:  VOICE
-        p10 = re.compile(r'^Domain:\s+(?P<domain>\S+)$')
+        p10 = regex_engine.compile(r'^Domain:\s+(?P<domain>\S+)$')
 
         # Oper host mode:  multi-domain
-        p11 = re.compile(r'^Oper host mode:\s+(?P<oper_host_mode>\S+)$')
+        p11 = regex_engine.compile(r'^Oper host mode:\s+(?P<oper_host_mode>\S+)$')
 
         # Oper control dir:  both
-        p12 = re.compile(r'^Oper control dir:\s+(?P<oper_control_dir>\S+)$')
+        p12 = regex_engine.compile(r'^Oper control dir:\s+(?P<oper_control_dir>\S+)$')
 
         # Session timeout:  50s (local), Remaining: 14s
-        p13 = re.compile(r'^Session timeout:\s+(?P<timeout>\S+)\s*\((?P<type>\w+)\), Remaining: (?P<remaining>\S+)$')
+        p13 = regex_engine.compile(r'^Session timeout:\s+(?P<timeout>\S+)\s*\((?P<type>\w+)\), Remaining: (?P<remaining>\S+)$')
 
         # Timeout action:  Reauthenticate
-        p14 = re.compile(r'^Timeout action:\s+(?P<timeout_action>\S+)$')
+        p14 = regex_engine.compile(r'^Timeout action:\s+(?P<timeout_action>\S+)$')
 
         # Common Session ID:  2300130B0000002ABD0A2AF1
-        p15 = re.compile(r'^Common Session ID:\s+(?P<common_session_id>\S+)$')
+        p15 = regex_engine.compile(r'^Common Session ID:\s+(?P<common_session_id>\S+)$')
 
         # Acct Session ID:  0x00000020
-        p16 = re.compile(r'^Acct Session ID:\s+(?P<acct_session_id>\S+)$')
+        p16 = regex_engine.compile(r'^Acct Session ID:\s+(?P<acct_session_id>\S+)$')
 
         # Handle:  0xdb000020
-        p17 = re.compile(r'^Handle:\s+(?P<handle>\S+)$')
+        p17 = regex_engine.compile(r'^Handle:\s+(?P<handle>\S+)$')
 
         # Current Policy:  test_dot1x
-        p18 = re.compile(r'^Current Policy:\s+(?P<current_policy>\S+)$')
+        p18 = regex_engine.compile(r'^Current Policy:\s+(?P<current_policy>\S+)$')
 
         # Vlan Group:  Vlan: 194
-        p19 = re.compile(r'^Vlan Group:\s+Vlan:\s+(?P<vlan>\S+)$')
+        p19 = regex_engine.compile(r'^Vlan Group:\s+Vlan:\s+(?P<vlan>\S+)$')
 
         # dot1x           Authc Success
-        p20 = re.compile(r'^(?P<method>\S+)\s+(?P<state>\S+)$')
+        p20 = regex_engine.compile(r'^(?P<method>\S+)\s+(?P<state>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1443,19 +1444,19 @@ class ShowAuthenticationSessionsSessionId(ShowAuthenticationSessionsSessionIdSch
             output = self.device.execute(cmd)
 
         # Session id=2300130B0000002CBD0A520E
-        p1 = re.compile(r'^Session id=(?P<session_id>\S+)$')
+        p1 = regex_engine.compile(r'^Session id=(?P<session_id>\S+)$')
 
         # Interface:  GigabitEthernet2/0/3
-        p2 = re.compile(r'^Interface:\s+(?P<interface>\S+)$')
+        p2 = regex_engine.compile(r'^Interface:\s+(?P<interface>\S+)$')
 
         # IIF-ID:  0x1210405D
-        p3 = re.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
+        p3 = regex_engine.compile(r'^IIF-ID:\s+(?P<iif_id>\S+)$')
 
         # MAC Address:  0055.6677.8855
-        p4 = re.compile(r'^MAC Address:\s+(?P<mac_address>\S+)$')
+        p4 = regex_engine.compile(r'^MAC Address:\s+(?P<mac_address>\S+)$')
 
         # Domain:  DATA
-        p5 = re.compile(r'^Domain:\s+(?P<domain>\S+)$')
+        p5 = regex_engine.compile(r'^Domain:\s+(?P<domain>\S+)$')
 
         # IPv6 Address:  Unknown
         # IPv4 Address:  192.168.10.101
@@ -1470,35 +1471,35 @@ class ShowAuthenticationSessionsSessionId(ShowAuthenticationSessionsSessionIdSch
         # Acct Session ID:  0x0000003b
         # Handle:  0x31000022
         # Current Policy:  test_dot1x
-        p6 = re.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Device-type|Device-name|Status|'
-                r'Oper host mode|Oper control dir|Timeout action|Common Session ID|Acct Session ID|Handle|Current Policy):\s+(?P<value>.+)$')
+        p6 = regex_engine.compile(r'^(?P<key_name>IPv6 Address|IPv4 Address|User-Name|Device-type|Device-name|Status|'
+                          r'Oper host mode|Oper control dir|Timeout action|Common Session ID|Acct Session ID|Handle|Current Policy):\s+(?P<value>.+)$')
 
         # Session timeout:  50s (local), Remaining: 27s
-        p7 = re.compile(r'^Session timeout:\s+(?P<local>\d+)s \(local\), Remaining: (?P<remaining>\d+)s$')
+        p7 = regex_engine.compile(r'^Session timeout:\s+(?P<local>\d+)s \(local\), Remaining: (?P<remaining>\d+)s$')
 
         # Server Policies:
-        p8 = re.compile(r'^Server Policies:$')
+        p8 = regex_engine.compile(r'^Server Policies:$')
 
         # Vlan Group:  Vlan: 10 (server policies)
-        p9 = re.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
+        p9 = regex_engine.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
 
         # Resultant Policies:
-        p10 = re.compile(r'^Resultant Policies:$')
+        p10 = regex_engine.compile(r'^Resultant Policies:$')
 
         # Vlan Group:  Vlan: 10 (resultant policies)
-        p11 = re.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
+        p11 = regex_engine.compile(r'^Vlan Group:  Vlan: (?P<vlan_group>\d+)$')
 
         # Method status list:
-        p12 = re.compile(r'^Method status list:$')
+        p12 = regex_engine.compile(r'^Method status list:$')
 
         # Skip Method header line
-        p13 = re.compile(r'^Method\s+State$')
+        p13 = regex_engine.compile(r'^Method\s+State$')
 
         # dot1x           Authc Success
-        p14 = re.compile(r'^(?P<method>\S+)\s+(?P<state>\S+\s\S+)$')
+        p14 = regex_engine.compile(r'^(?P<method>\S+)\s+(?P<state>\S+\s\S+)$')
 
         # Simplified Table Output (Third type)
-        p15 = re.compile(r'^(?P<interface>\S+)\s+(?P<mac_address>\S+)\s+(?P<method>\S+)\s+(?P<domain>\S+)\s+(?P<status_fg>\S+)\s+(?P<session_id>\S+)$')
+        p15 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<mac_address>\S+)\s+(?P<method>\S+)\s+(?P<domain>\S+)\s+(?P<status_fg>\S+)\s+(?P<session_id>\S+)$')
 
         ret_dict = {}
         session_id_dict = None
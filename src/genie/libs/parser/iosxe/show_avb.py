@@ -3,7 +3,7 @@ IOSXE parsers for the following show commands:
 
     * 'show avb domain'
 '''
-import re
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
@@ -58,19 +58,19 @@ class ShowAvbDomain(ShowAvbDomainSchema):
         ret_dict = {}
 
         # AVB Class-A
-        p1 = re.compile(r'^AVB\s+(?P<avb_class>[\w\s\-]+)$')
+        p1 = regex_engine.compile(r'^AVB\s+(?P<avb_class>[\w\s\-]+)$')
 
         # Priority Code Point     : 3
-        p2 = re.compile(r'^(?P<pattern>[\w\s]+)\s+:\s+(?P<value>[\d]+)$')
+        p2 = regex_engine.compile(r'^(?P<pattern>[\w\s]+)\s+:\s+(?P<value>[\d]+)$')
 
         # Tw1/0/1          up    156ns
-        p3 = re.compile(r'^(?P<interface>[\w\/\.]+)\s+(?P<state>\w+)\s+(?P<delay>[\w\/]+)$')
+        p3 = regex_engine.compile(r'^(?P<interface>[\w\/\.]+)\s+(?P<state>\w+)\s+(?P<delay>[\w\/]+)$')
 
         # Tw1/0/1          up      N/A                    Port is not asCapable
-        p4 = re.compile(r'^(?P<interface>[\w\/\.]+)\s+(?P<state>\w+)\s+(?P<delay>[\w\/]+)?\s+(?P<pcp>\d+)?\s+(?P<vid>\d+)?\s+(?P<information>[\w\s]+)?$')
+        p4 = regex_engine.compile(r'^(?P<interface>[\w\/\.]+)\s+(?P<state>\w+)\s+(?P<delay>[\w\/]+)?\s+(?P<pcp>\d+)?\s+(?P<vid>\d+)?\s+(?P<information>[\w\s]+)?$')
 
         # Class-  A        core             3    2
-        p5 = re.compile(r'^Class-\s+(?P<class>[\w\-\s]+)\s+(?P<state>\w+)\s+(?P<pcp>[\w\/]+)\s+(?P<vid>\d+)$')
+        p5 = regex_engine.compile(r'^Class-\s+(?P<class>[\w\-\s]+)\s+(?P<state>\w+)\s+(?P<pcp>[\w\/]+)\s+(?P<vid>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
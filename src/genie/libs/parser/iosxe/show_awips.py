@@ -4,11 +4,13 @@ IOSXE parsers for the following show commands:
     * show awips status {mac_address}
 '''
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =====================================
 # Schema for:
@@ -40,7 +42,7 @@ class ShowAwipsStatus(ShowAwipsStatusSchema):
             output = self.device.execute(self.cli_command.format(mac_address=mac_address))
 
         ret_dict = {}
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             # 1416.9d57.b280  ENABLED               CONFIG_NOT_ENABLED                  21965
             r'(?P<radio_mac>(([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}))\s+(?P<awips_status>(\w+))\s+(?P<forensic_status>(\w+))\s+(?P<alarm_message_count>\d+)\s*')
 
@@ -8,14 +8,14 @@ Copyright (c) 2022 by Cisco Systems, Inc.
 All rights reserved.
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or, Schema
 from genie.parsergen import oper_fill_tabular
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================================
 #  schema for show nve peers
@@ -142,75 +142,75 @@ class ShowBdDatapath(ShowBdDatapathSchema):
 
         res_dict = {}
         # BD id                  : 2450
-        p1 = re.compile(r'^\s*BD id[ :]*(?P<bd_id>[\d]+)\s*$')
+        p1 = regex_engine.compile(r'^\s*BD id[ :]*(?P<bd_id>[\d]+)\s*$')
         # State enabled          : Yes
-        p2 = re.compile(r'^\s*State enabled[ :]*(?P<state_enabled>[a-zA-Z]+)\s*$')
+        p2 = regex_engine.compile(r'^\s*State enabled[ :]*(?P<state_enabled>[a-zA-Z]+)\s*$')
         # Aging timeout (sec)    : 1800
-        p3 = re.compile(r'^\s*Aging timeout[ :a-zA-Z\(\)]*(?P<aging_timeout>[\d]+)\s*$')
+        p3 = regex_engine.compile(r'^\s*Aging timeout[ :a-zA-Z\(\)]*(?P<aging_timeout>[\d]+)\s*$')
         # Aging active entry     : Yes
-        p4 = re.compile(r'^\s*Aging active entry[ :]*(?P<aging_active_entry>[a-zA-Z]+)\s*$')
+        p4 = regex_engine.compile(r'^\s*Aging active entry[ :]*(?P<aging_active_entry>[a-zA-Z]+)\s*$')
         # Max mac limit          : 65536
-        p5 = re.compile(r'^\s*Max mac limit[ :]*(?P<max_mac_limit>[\d]+)\s*$')
+        p5 = regex_engine.compile(r'^\s*Max mac limit[ :]*(?P<max_mac_limit>[\d]+)\s*$')
         # Unkwn mac limit flood  : Yes
-        p6 = re.compile(r'^\s*Unkwn mac limit flood[ :]*(?P<unkwn_mac_limit_flood>[a-zA-Z]+)\s*$')
+        p6 = regex_engine.compile(r'^\s*Unkwn mac limit flood[ :]*(?P<unkwn_mac_limit_flood>[a-zA-Z]+)\s*$')
         # mac_learn_enabled      : Yes
-        p7 = re.compile(r'^\s*mac_learn_enabled[ :]*(?P<mac_learn_enabled>[a-zA-Z]+)\s*$')
+        p7 = regex_engine.compile(r'^\s*mac_learn_enabled[ :]*(?P<mac_learn_enabled>[a-zA-Z]+)\s*$')
         # mac_learn_controled    : Yes
-        p8 = re.compile(r'^\s*mac_learn_controled[ :]*(?P<mac_learn_controled>[a-zA-Z]+)\s*$')
+        p8 = regex_engine.compile(r'^\s*mac_learn_controled[ :]*(?P<mac_learn_controled>[a-zA-Z]+)\s*$')
         # Unknown unicast olist  : Yes
-        p9 = re.compile(r'^\s*Unknown unicast olist[ :]*(?P<unknown_unicast_olist>[a-zA-Z]+)\s*$')
+        p9 = regex_engine.compile(r'^\s*Unknown unicast olist[ :]*(?P<unknown_unicast_olist>[a-zA-Z]+)\s*$')
         # otv_aed_enabled : No
-        p10 = re.compile(r'^\s*otv_aed_enabled[ :]*(?P<otv_aed_enabled>[a-zA-Z]+)\s*$')
+        p10 = regex_engine.compile(r'^\s*otv_aed_enabled[ :]*(?P<otv_aed_enabled>[a-zA-Z]+)\s*$')
         # otv_enabled : No
-        p11 = re.compile(r'^\s*otv_enabled[ :]*(?P<otv_enabled>[a-zA-Z]+)\s*$')
+        p11 = regex_engine.compile(r'^\s*otv_enabled[ :]*(?P<otv_enabled>[a-zA-Z]+)\s*$')
         # mcast_snooping_enabled : No
-        p12 = re.compile(r'^\s*mcast_snooping_enabled[ :]*(?P<mcast_snooping_enabled>[a-zA-Z]+)\s*$')
+        p12 = regex_engine.compile(r'^\s*mcast_snooping_enabled[ :]*(?P<mcast_snooping_enabled>[a-zA-Z]+)\s*$')
         # Feature : evpn
-        p13 = re.compile(r'^\s*Feature[ :]*(?P<feature>[a-zA-Z]+)\s*$')
+        p13 = regex_engine.compile(r'^\s*Feature[ :]*(?P<feature>[a-zA-Z]+)\s*$')
         # SISF snoop protocols   : arp, ndp, dhcpv4, dhcpv6
-        p14 = re.compile(r'^\s*SISF snoop protocols[ :]*(?P<sisf_snoop_protocols>[\D\d]+)\s*$')
+        p14 = regex_engine.compile(r'^\s*SISF snoop protocols[ :]*(?P<sisf_snoop_protocols>[\D\d]+)\s*$')
         # Mac learned            : 2
-        p15 = re.compile(r'^\s*Mac learned[ :]*(?P<mac_learned>[\d]+)\s*$')
+        p15 = regex_engine.compile(r'^\s*Mac learned[ :]*(?P<mac_learned>[\d]+)\s*$')
         # BDI outer vtag         : 00000000
-        p16 = re.compile(r'^\s*BDI outer vtag[ :]*(?P<bdi_outer_vtag>[\d]+)\s*$')
+        p16 = regex_engine.compile(r'^\s*BDI outer vtag[ :]*(?P<bdi_outer_vtag>[\d]+)\s*$')
         # BDI inner vtag         : 00000000
-        p17 = re.compile(r'^\s*BDI inner vtag[ :]*(?P<bdi_inner_vtag>[\d]+)\s*$')
+        p17 = regex_engine.compile(r'^\s*BDI inner vtag[ :]*(?P<bdi_inner_vtag>[\d]+)\s*$')
         # Total bridged                pkts : 58379711   bytes: 5370933172
-        p18 = re.compile(r'^\s*Total bridged(?P<bridged>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p18 = regex_engine.compile(r'^\s*Total bridged(?P<bridged>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total unknown unicast        pkts : 0          bytes: 0
-        p19 = re.compile(r'^\s*Total unknown unicast(?P<unknown_unicast>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p19 = regex_engine.compile(r'^\s*Total unknown unicast(?P<unknown_unicast>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total broadcasted            pkts : 34         bytes: 4012
-        p20 = re.compile(r'^\s*Total broadcasted(?P<broadcasted>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p20 = regex_engine.compile(r'^\s*Total broadcasted(?P<broadcasted>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total to BDI                 pkts : 0          bytes: 0
-        p21 = re.compile(r'^\s*Total to BDI(?P<to_bdi>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p21 = regex_engine.compile(r'^\s*Total to BDI(?P<to_bdi>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total injected               pkts : 0          bytes: 0
-        p22 = re.compile(r'^\s*Total injected(?P<injected>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p22 = regex_engine.compile(r'^\s*Total injected(?P<injected>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total mac-sec violation drop pkts : 0          bytes: 0
-        p23 = re.compile(r'^\s*Total mac-sec violation drop pkts(?P<violation_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p23 = regex_engine.compile(r'^\s*Total mac-sec violation drop pkts(?P<violation_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total mac-sec move drop      pkts : 0          bytes: 0
-        p24 = re.compile(r'^\s*Total mac-sec move drop(?P<move_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p24 = regex_engine.compile(r'^\s*Total mac-sec move drop(?P<move_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total mac-sec unknown drop   pkts : 0          bytes: 0
-        p25 = re.compile(r'^\s*Total mac-sec unknown drop(?P<unknown_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p25 = regex_engine.compile(r'^\s*Total mac-sec unknown drop(?P<unknown_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total source filter drop     pkts : 0          bytes: 0
-        p26 = re.compile(r'^\s*Total source filter drop(?P<source_filter_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p26 = regex_engine.compile(r'^\s*Total source filter drop(?P<source_filter_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total bfib policy drop       pkts : 0          bytes: 0
-        p27 = re.compile(r'^\s*Total bfib policy drop(?P<bfib_policy_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p27 = regex_engine.compile(r'^\s*Total bfib policy drop(?P<bfib_policy_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total replication start drop pkts : 0          bytes: 0
-        p28 = re.compile(r'^\s*Total replication start drop pkts(?P<replication_start_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p28 = regex_engine.compile(r'^\s*Total replication start drop pkts(?P<replication_start_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total recycle tail drop      pkts : 0          bytes: 0
-        p29 = re.compile(r'^\s*Total recycle tail drop(?P<recycle_tail_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p29 = regex_engine.compile(r'^\s*Total recycle tail drop(?P<recycle_tail_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total static MAC move drop   pkts : 0          bytes: 0
-        p30 = re.compile(r'^\s*Total static MAC move drop(?P<static_mac_move_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p30 = regex_engine.compile(r'^\s*Total static MAC move drop(?P<static_mac_move_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total BD disabled drop       pkts : 0          bytes: 0
-        p31 = re.compile(r'^\s*Total BD disabled drop(?P<bd_disabled_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p31 = regex_engine.compile(r'^\s*Total BD disabled drop(?P<bd_disabled_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total STP state drop         pkts : 0          bytes: 0
-        p32 = re.compile(r'^\s*Total STP state drop(?P<stp_state_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p32 = regex_engine.compile(r'^\s*Total STP state drop(?P<stp_state_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total UUF suppression drop   pkts : 0          bytes: 0
-        p33 = re.compile(r'^\s*Total UUF suppression drop(?P<uuf_suppression_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p33 = regex_engine.compile(r'^\s*Total UUF suppression drop(?P<uuf_suppression_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total sisf ctrl punt         pkts : 24         bytes: 1968
-        p34 = re.compile(r'^\s*Total sisf ctrl punt(?P<sisf_ctrl_punt>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p34 = regex_engine.compile(r'^\s*Total sisf ctrl punt(?P<sisf_ctrl_punt>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         # Total sisf ctrl drop         pkts : 0          bytes: 0
-        p35 = re.compile(r'^\s*Total sisf ctrl drop(?P<sisf_ctrl_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
+        p35 = regex_engine.compile(r'^\s*Total sisf ctrl drop(?P<sisf_ctrl_drop>)[\D]*(?P<pkts>[\d]+)[\D]*(?P<bytes>[\d]+)\s*$')
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
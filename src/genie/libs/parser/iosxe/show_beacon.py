@@ -2,13 +2,13 @@
 IOSXE parsers for the following show commands: 
 show_beacon_all.py
 '''
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any,Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowBeaconAllSchema(MetaParser):
     """
@@ -45,17 +45,17 @@ class ShowBeaconAll(ShowBeaconAllSchema):
         # 1                  OFF
         # *2                  OFF
 
-        p1_0 = re.compile(r'^\w+#\s+Beacon\s+Status$')
-        p1_1 = re.compile(r'^[*]?(?P<switch_number>\d+)\s+(?P<beacon_status>\w+)$')
+        p1_0 = regex_engine.compile(r'^\w+#\s+Beacon\s+Status$')
+        p1_1 = regex_engine.compile(r'^[*]?(?P<switch_number>\d+)\s+(?P<beacon_status>\w+)$')
 
         # Power-Supply#   Beacon Status
         # ---------------------------------
          # 1                  OFF
-        p2_0 = re.compile(r'Power-Supply#\s+Beacon\s+Status$')
-        p2_1 = re.compile(r'^(?P<power_supply>\d+)\s+(?P<power_supply_beacon_status>\w+)$')
+        p2_0 = regex_engine.compile(r'Power-Supply#\s+Beacon\s+Status$')
+        p2_1 = regex_engine.compile(r'^(?P<power_supply>\d+)\s+(?P<power_supply_beacon_status>\w+)$')
 
         #FANTRAY BEACON:     OFF
-        p3 = re.compile(r'^FANTRAY BEACON:\s+(?P<fantray_beacon_status>\w+)$')
+        p3 = regex_engine.compile(r'^FANTRAY BEACON:\s+(?P<fantray_beacon_status>\w+)$')
 
 
         for line in output.splitlines():
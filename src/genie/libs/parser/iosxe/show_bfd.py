@@ -5,7 +5,6 @@ IOSXE parser for the following show command
 '''
 
 # Python
-import re
 import pprint
 
 # Metaparser
@@ -15,6 +14,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 											Any
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ==============================================================
@@ -173,55 +173,55 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 
 		# 172.16.10.1	172.16.10.2		1/2		1		532 (3 )		Up 		Gig0/0/0
 		# 2001:DB8:B947:0:251:57EF:FF8D:E8CC      2001:DB8:B947:0:251:57EF:FF8D:E8CB          1/17         Up        Up        Gi2
-		p1 = re.compile(r'^(?P<our_address>[\w\.\:]+)\s+(?P<our_neighbor>[\w\.\:]+' \
+		p1 = regex_engine.compile(r'^(?P<our_address>[\w\.\:]+)\s+(?P<our_neighbor>[\w\.\:]+' \
 			r')\s+(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\S+)\s+(?P<holdown_timer>\d+)' \
 			r'\s+\((?P<holdown_timer_multiplier>\d+)\s+\)\s+(?P<state>\w+)' \
 			r'\s+(?P<interface>[\w\W]+)$')
 
 		# 172.16.1.1	172.16.1.3
 		# # 2001:DB8:B947:0:251:57EF:FF8D:E8CC 
-		p2 = re.compile(r'^(?P<our_address>[\w\.\:]+) +(?P<our_neighbor>'\
+		p2 = regex_engine.compile(r'^(?P<our_address>[\w\.\:]+) +(?P<our_neighbor>'\
 			r'[\w\.\:]+)$')
 
 		# 		5/2		1(RH)	150 (3)		Up 		Gig0/0/1
-		p3 = re.compile(r'^(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\S+)\s+' \
+		p3 = regex_engine.compile(r'^(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\S+)\s+' \
 			r'(?P<holdown_timer>\d+)\s+\((?P<holdown_timer_multiplier>\d+)\s+\)' \
 			r'\s+(?P<state>\w+)\s+(?P<interface>[\w\W]+)')
 
 		# 10.169.197.93 					4097/4097		Up 		Up 	Gi0/0/0
 		# 2001:DB8:B947:0:251:57EF:FF8D:E8CC                1/17         Up        Up        Gi2
-		p4 = re.compile(r'^(?P<our_neighbor>[\w\.\:]+)\s+(?P<ld_rd>\d+'\
+		p4 = regex_engine.compile(r'^(?P<our_neighbor>[\w\.\:]+)\s+(?P<ld_rd>\d+'\
 			r'\/\d+)\s+(?P<rh_rs>\S+)\s+(?P<state>\w+)\s+(?P<interface>'\
 			r'[\w\W]+)$')
 
 		# 5/2
-		p4_1 = re.compile(r'^(?P<ld>\d+)\/(?P<rd>\d+)$')
+		p4_1 = regex_engine.compile(r'^(?P<ld>\d+)\/(?P<rd>\d+)$')
 
 		# OurAddr: 10.186.213.12
-		p5 = re.compile(r'^OurAddr:\s+(?P<our_address>[\w\.\:]+)$')
+		p5 = regex_engine.compile(r'^OurAddr:\s+(?P<our_address>[\w\.\:]+)$')
 
 		# Session state is UP and using echo function with 500 ms interval.
-		p6 = re.compile(r'^\s*Session +state +is +(?P<state>\S+) +and +using'\
+		p6 = regex_engine.compile(r'^\s*Session +state +is +(?P<state>\S+) +and +using'\
 			r' +(?P<echo_function>\S+) +function +with +(?P<interval_in_ms>\d+)'\
 			r' +ms +interval\.$')
 		
 		# Session state is UP and not using echo function.
-		p7 = re.compile(r'^\s*Session +state +is +(?P<state>\S+) +and +not '\
+		p7 = regex_engine.compile(r'^\s*Session +state +is +(?P<state>\S+) +and +not '\
 			r'+using +echo +function\.$')
 
 		# Session Host: Software
-		p8 = re.compile(r'^\s*Session\s+Host:\s+(?P<session_host>\S+)$')
+		p8 = regex_engine.compile(r'^\s*Session\s+Host:\s+(?P<session_host>\S+)$')
 
 		# Handle: 1
-		p10 = re.compile(r'^\s*Handle: +(?P<handle>\d+)$')
+		p10 = regex_engine.compile(r'^\s*Handle: +(?P<handle>\d+)$')
 
 		# Local Diag: 0, Demand mode: 0, Poll bit: 0
-		p11 = re.compile(r'^\s*Local +Diag: +(?P<local_diag>\d+), +Demand +'\
+		p11 = regex_engine.compile(r'^\s*Local +Diag: +(?P<local_diag>\d+), +Demand +'\
 			r'mode: +(?P<demand_mode>\d+), +Poll +bit: +(?P<poll_bit>\d+)$')
 
 		# MinTxInt: 50000, MinRxInt: 50000, Multiplier: 3 Received MinRxInt: 50000, Received Multiplier: 3 Holddown (hits): 150(0), Hello (hits): 50(2223) Rx Count: 2212, Rx Count: 2212, Rx Interval (ms) 
 		# min/max/avg: 8/68/49 last: 0 ms ago Tx Count: 2222, Tx Interval (ms) min/max/avg: 40/60/49 last: 20 ms ago Elapsed time watermarks: 0 0 (last: 0) Registered protocols: CEF Stub
-		p12 = re.compile(r'^\s*MinTxInt:\s+(?P<min_tx_interface>\d+),\s+'\
+		p12 = regex_engine.compile(r'^\s*MinTxInt:\s+(?P<min_tx_interface>\d+),\s+'\
 			r'MinRxInt:\s+(?P<min_rx_interface>\d+),\s+Multiplier:\s+'\
 			r'(?P<multiplier>\d+)\s*Received\s+MinRxInt:\s+'\
 			r'(?P<received_min_rx_interface>\d+),\s+Received\s+Multiplier:\s'\
@@ -241,136 +241,136 @@ class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
 			r'Registered\s+protocols:\s+(?P<registered_protocols>[\w\W]+)$')
 		
 		# MinTxInt: 100000, MinRxInt: 100000, Multiplier: 6
-		p13 = re.compile(r'^\s*MinTxInt: +(?P<min_tx_interface>\d+), +MinRxInt' \
+		p13 = regex_engine.compile(r'^\s*MinTxInt: +(?P<min_tx_interface>\d+), +MinRxInt' \
 			r': +(?P<min_rx_interface>\d+), +Multiplier: +(?P<multiplier>\d+)$')
 
 		# Received MinRxInt: 100000, Received Multiplier: 6
-		p14 = re.compile(r'^\s*Received +MinRxInt:\s+'\
+		p14 = regex_engine.compile(r'^\s*Received +MinRxInt:\s+'\
 			r'(?P<received_min_rx_interface>\d+),\s+Received\s+Multiplier:'\
 			r'\s+(?P<received_multiplier>\d+)$')
 
 		# Holdown (hits): 1000(0), Hello (hits): 200(5995)
-		p15 = re.compile(r'^\s*Hold(d)?own +\(hits\): +' \
+		p15 = regex_engine.compile(r'^\s*Hold(d)?own +\(hits\): +' \
 			r'(?P<holddown>\d+)\((?P<holddown_hits>\d+)\), +Hello +\(hits\): +' \
 			r'(?P<hello>\d+)\((?P<hello_hits>\d+)\)$')
 
 		# Rx Count: 1940, Rx Interval (ms) min/max/avg: 1/1003/879 last: 182 ms ago
-		p16 = re.compile(r'^\s*Rx +Count: +(?P<count>\d+), +Rx +' \
+		p16 = regex_engine.compile(r'^\s*Rx +Count: +(?P<count>\d+), +Rx +' \
 			r'Interval +\(ms\) +min\/max\/avg: +(?P<min_int_ms>\d+)' \
 			r'\/(?P<max_int_ms>\d+)\/(?P<avg_int_ms>\d+) +' \
 			r'last: +(?P<last_ms_ago>\d+) +ms +ago$')
 
 		# Echo Rx Count: 20777, Echo Rx Interval (ms) min/max/avg: 1505/2003/1751 last: 721 ms ago
-		p16_1 = re.compile(r'^Echo Rx Count: +(?P<count>\d+), '
+		p16_1 = regex_engine.compile(r'^Echo Rx Count: +(?P<count>\d+), '
 						   r'+Echo Rx Interval \(ms\) min\/max\/avg: '
 						   r'+(?P<min_int_ms>\d+)\/(?P<max_int_ms>\d+)\/(?P<avg_int_ms>\d+)'
 						   r' +last: +(?P<last_ms_ago>\d+) ms ago$')
 
 		# Rx Count: 5052
-		p17 = re.compile(r'^\s*Rx +Count: +(?P<count>\d+)$')
+		p17 = regex_engine.compile(r'^\s*Rx +Count: +(?P<count>\d+)$')
 
 		# Tx Count: 1940, Tx Interval (ms) min/max/avg: 1/1003/879 last: 742 ms ago
-		p18 = re.compile(r'^\s*Tx +Count: +(?P<count>\d+), +Tx +Interval +' \
+		p18 = regex_engine.compile(r'^\s*Tx +Count: +(?P<count>\d+), +Tx +Interval +' \
 			r'\(ms\) +min\/max\/avg: +(?P<min_int_ms>\d+)\/(?P<max_int_ms>\d+)'\
 			r'\/(?P<avg_int_ms>\d+) +last: +(?P<last_ms_ago>\d+) +ms +ago$')
 
 		# Echo Tx Count: 20777, Echo Tx Interval (ms) min/max/avg: 1506/2003/1751 last: 722 ms ago
-		p18_1 = re.compile(r'^Echo Tx Count: +(?P<count>\d+), '
+		p18_1 = regex_engine.compile(r'^Echo Tx Count: +(?P<count>\d+), '
 						   r'+Echo Tx Interval \(ms\) min\/max\/avg: '
 						   r'+(?P<min_int_ms>\d+)\/(?P<max_int_ms>\d+)\/(?P<avg_int_ms>\d+) '
 						   r'+last: +(?P<last_ms_ago>\d+) ms ago$')
 
 		# Tx Count: 7490
-		p19 = re.compile(r'^\s*Tx +Count: +(?P<count>\d+)$')
+		p19 = regex_engine.compile(r'^\s*Tx +Count: +(?P<count>\d+)$')
 		
 		# Elapsed time watermarks: 0 0 (last: 0)
-		p20 = re.compile(r'^\s*Elapsed +time +watermarks: +' \
+		p20 = regex_engine.compile(r'^\s*Elapsed +time +watermarks: +' \
 			r'(?P<elapsed_time_watermarks>\d+ +\d+) +\(last: +' \
 			r'(?P<elapsed_time_watermarks_last>\d+)\)$')
 
 		# Registered protocols: OSPF CEF
-		p21 = re.compile(r'^\s*Registered +protocols: +' \
+		p21 = regex_engine.compile(r'^\s*Registered +protocols: +' \
 			r'(?P<registered_protocols>[\w\W]+)$')
 
 		# Uptime: 00:28:03
-		p22 = re.compile(r'^\s*Uptime: +(?P<up_time>\S+)$')
+		p22 = regex_engine.compile(r'^\s*Uptime: +(?P<up_time>\S+)$')
 		
 		# Last packet: Version: 1		- Diagnostic: 0
-		p23 = re.compile(r'^\s*Last\s+packet:\s+Version:\s+(?P<version>\d+)'\
+		p23 = regex_engine.compile(r'^\s*Last\s+packet:\s+Version:\s+(?P<version>\d+)'\
 			r'\s+\-\s+Diagnostic:\s+(?P<diagnostic>\d+)$')
 
 		# Last packet: Version: 0
-		p24 = re.compile(r'\s*Last\s+packet:\sVersion:\s+(?P<version>\d+)$')
+		p24 = regex_engine.compile(r'\s*Last\s+packet:\sVersion:\s+(?P<version>\d+)$')
 		
 		# - Diagnostic: 0
-		p25 = re.compile(r'\s*\-\s+Diagnostic:\s+(?P<diagnostic>\d+)$')
+		p25 = regex_engine.compile(r'\s*\-\s+Diagnostic:\s+(?P<diagnostic>\d+)$')
 		
 		# State bit: Up				- Demand bit: 0
-		p26 = re.compile(r'^\s*State +bit: +(?P<state_bit>\S+)\s+\-\s+' \
+		p26 = regex_engine.compile(r'^\s*State +bit: +(?P<state_bit>\S+)\s+\-\s+' \
 			r'Demand +bit:\s+(?P<demand_bit>\d+)$')
 
-		p27 = re.compile(r'^\s*I +Hear +You +bit: +(?P<i_hear_you_bit>\S+)'\
+		p27 = regex_engine.compile(r'^\s*I +Hear +You +bit: +(?P<i_hear_you_bit>\S+)'\
 			r'\s+\-\s+Demand +bit:\s+(?P<demand_bit>\d+)$')
 		# Poll bit: 0 				- Final bit: 0
-		p28 = re.compile(r'^\s*Poll\s+bit:\s+(?P<poll_bit>\d+)\s+\-\s+'\
+		p28 = regex_engine.compile(r'^\s*Poll\s+bit:\s+(?P<poll_bit>\d+)\s+\-\s+'\
 			r'Final\s+bit:\s+(?P<final_bit>\d+)$')
 		
 		# C bit: 0
-		p29 = re.compile(r'^\s*C +bit: +(?P<c_bit>\d+)$')
+		p29 = regex_engine.compile(r'^\s*C +bit: +(?P<c_bit>\d+)$')
 
 		# Multiplier: 6			- Length: 24
-		p30 = re.compile(r'^\s*Multiplier: +(?P<multiplier>\d+)\s+\-\s+' \
+		p30 = regex_engine.compile(r'^\s*Multiplier: +(?P<multiplier>\d+)\s+\-\s+' \
 			r'Length:\s+(?P<length>\d+)$')
 		
 		# My Discr.: 4097		- Your Discr.: 4097
-		p31 = re.compile(r'^\s*My +Discr\.: +(?P<my_discr>\d+)\s+\-\s+' \
+		p31 = regex_engine.compile(r'^\s*My +Discr\.: +(?P<my_discr>\d+)\s+\-\s+' \
 			r'Your +Discr\.:\s+(?P<your_discr>\d+)')
 		
 		# Min tx interval: 1000000	- Min rx interval: 1000000
-		p32 = re.compile(r'^\s*Min +tx +interval: +(?P<min_tx_interval>\d+)'\
+		p32 = regex_engine.compile(r'^\s*Min +tx +interval: +(?P<min_tx_interval>\d+)'\
 			r'\s+\-\s+Min +rx +interval:\s+(?P<min_rx_interval>\d+)$')
 
 		# Min Echo interval: 3000000
-		p33 = re.compile(r'^\s*Min\s+Echo\s+interval:\s+' \
+		p33 = regex_engine.compile(r'^\s*Min\s+Echo\s+interval:\s+' \
 			r'(?P<min_echo_interval>\d+)$')
 		
 		# Cleanup timer hits: 0
-		p34 = re.compile(r'^\s*Cleanup +timer +hits: +'\
+		p34 = regex_engine.compile(r'^\s*Cleanup +timer +hits: +'\
 			r'(?P<cleanup_timer_hits>\d+)$')
 
 		# SSO Cleanup Timer called: 0
-		p35 = re.compile(r'^\s*SSO +Cleanup +Timer +called: +'\
+		p35 = regex_engine.compile(r'^\s*SSO +Cleanup +Timer +called: +'\
 			r'(?P<sso_cleanup_timer_called>\d+)$')
 
 		# SSO Cleanup Action Taken: 0
-		p36 = re.compile(r'^\s*SSO +Cleanup +Action +Taken: +'\
+		p36 = regex_engine.compile(r'^\s*SSO +Cleanup +Action +Taken: +'\
 			r'(?P<sso_cleanup_action_taken>\d+)$')
 
 		# Pseudo pre-emptive process count: 239103 min/max/avg: 8/16/8 last: 0 ms ago
-		p37 = re.compile(r'^\s*Pseudo +pre-emptive +process +count: +'\
+		p37 = regex_engine.compile(r'^\s*Pseudo +pre-emptive +process +count: +'\
 			r'(?P<count>\d+) +min\/max\/avg: +(?P<min>\d+)\/(?P<max>\d+)'\
 			r'\/(?P<avg>\d+) +last: +(?P<last_ms_ago>\d+) +ms +ago$')
 
 		# IPC Tx Failure Count: 0
-		p38 = re.compile(r'^\s*IPC +Tx +Failure +Count: +'\
+		p38 = regex_engine.compile(r'^\s*IPC +Tx +Failure +Count: +'\
 			r'(?P<ipc_tx_failure_count>\d+)$')
 
 		# IPC Rx Failure Count: 0
-		p39 = re.compile(r'^\s*IPC +Rx +Failure +Count: +'\
+		p39 = regex_engine.compile(r'^\s*IPC +Rx +Failure +Count: +'\
 			r'(?P<ipc_rx_failure_count>\d+)$')
 
 		# Total Adjs Found: 1
-		p40 = re.compile(r'^\s*Total +Adjs +Found: +'\
+		p40 = regex_engine.compile(r'^\s*Total +Adjs +Found: +'\
 			r'(?P<total_adjs_found>\d+)$')
 
 		# Holddown - negotiated: 510000         adjusted: 0
-		p41 = re.compile(r'^\s*Hol(d)?down +\- +negotiated: +'\
+		p41 = regex_engine.compile(r'^\s*Hol(d)?down +\- +negotiated: +'\
 			r'(?P<holddown_negotiated>\d+) +adjusted: +'\
 			r'(?P<holddown_adjusted>\d+)$')
 		
 		# IPv4 Sessions
 		# IPv6 Sessions
-		p42 = re.compile(r'^IPv(4|6) +Sessions$')
+		p42 = regex_engine.compile(r'^IPv(4|6) +Sessions$')
 
 		for line in out.splitlines():
 			line = line.strip()
@@ -836,11 +836,11 @@ class ShowBfdSummaryHost(ShowBfdSummaryHostSchema):
 			out = output
 		
 		#sw 3 3 0
-		p1 = re.compile(r'Software +(?P<sw_session_configured>[\d]+) +(?P<sw_session_up>[\d]+) +(?P<sw_session_down>[\d]+)')
+		p1 = regex_engine.compile(r'Software +(?P<sw_session_configured>[\d]+) +(?P<sw_session_up>[\d]+) +(?P<sw_session_down>[\d]+)')
 		#hw 0 0 0
-		p2 = re.compile(r'Hardware +(?P<hw_session_configured>[\d]+) +(?P<hw_session_up>[\d]+) +(?P<hw_session_down>[\d]+)')
+		p2 = regex_engine.compile(r'Hardware +(?P<hw_session_configured>[\d]+) +(?P<hw_session_up>[\d]+) +(?P<hw_session_down>[\d]+)')
 		#Total 3 3 0
-		p3 = re.compile(r'Total +(?P<total_session_configured>[\d]+) +(?P<total_session_up>[\d]+) +(?P<total_session_down>[\d]+)')
+		p3 = regex_engine.compile(r'Total +(?P<total_session_configured>[\d]+) +(?P<total_session_up>[\d]+) +(?P<total_session_down>[\d]+)')
 		#initial return dictionary
 		ret_dict = {}
 		for line in out.splitlines():
@@ -933,22 +933,22 @@ class ShowBfdInternal(ShowBfdInternalSchema):
 
 
 		# Cleanup timer hits: 0
-		p01 = re.compile(r'^Cleanup +timer +hits: +(?P<cleanup_timer_hits>\d+)$')
+		p01 = regex_engine.compile(r'^Cleanup +timer +hits: +(?P<cleanup_timer_hits>\d+)$')
 
 		# Pseudo pre-emptive process count: 16552 min/max/avg: 5/17/6 last: 5ms ago
-		p02 = re.compile(r'^Pseudo pre-emptive process count:\s+(?P<pseudo_count>\d+)\s+min/max/avg:\s+(?P<min>\d+)/(?P<max>\d+)/(?P<avg>\d+)\s+last:\s+(?P<last>\d+)+\s+ms ago$')
+		p02 = regex_engine.compile(r'^Pseudo pre-emptive process count:\s+(?P<pseudo_count>\d+)\s+min/max/avg:\s+(?P<min>\d+)/(?P<max>\d+)/(?P<avg>\d+)\s+last:\s+(?P<last>\d+)+\s+ms ago$')
 
 		# Interrupt send count: 994 min/max/avg: 1/892/106 last: 256 ms ago
-		p03 = re.compile(r'^Interrupt +send +count: +(?P<interrupt_count>\d+)\s+min/max/avg:\s+(?P<min>\d+)/(?P<max>\d+)/(?P<avg>\d+)\s+last:\s+(?P<last>\d+)+\s+ms ago$')
+		p03 = regex_engine.compile(r'^Interrupt +send +count: +(?P<interrupt_count>\d+)\s+min/max/avg:\s+(?P<min>\d+)/(?P<max>\d+)/(?P<avg>\d+)\s+last:\s+(?P<last>\d+)+\s+ms ago$')
 
 		# Workload credits: 12 allocated, 7500 max
-		p04 = re.compile(r'^Workload +credits:\s+(?P<credits>\d+)\s+allocated,+\s+(?P<max>\d+)\s+max$')
+		p04 = regex_engine.compile(r'^Workload +credits:\s+(?P<credits>\d+)\s+allocated,+\s+(?P<max>\d+)\s+max$')
 
 		# IPv4 sessions
-		p05 = re.compile(r'^IPv4 +[Ss]essions$')
+		p05 = regex_engine.compile(r'^IPv4 +[Ss]essions$')
 
 		# 12.0.0.20                               1/1        Up             Up       Gi1/0/21
-		p06 = re.compile(r'^(?P<neigh_addr>[\w\.]+)\s+(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\w+)\s+(?P<state>\w+)\s+(?P<interface>[\w\W]+)$')
+		p06 = regex_engine.compile(r'^(?P<neigh_addr>[\w\.]+)\s+(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\w+)\s+(?P<state>\w+)\s+(?P<interface>[\w\W]+)$')
 
 
 		ret_dict = {}
@@ -60,15 +60,14 @@ IOSXE parsers for the following show commands:
     * show bgp l2vpn evpn evi {evi_id} route-type {route_type}
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.device_cache import cached_execute, cached_parse
+from genie.libs.parser.utils import regex_engine, string_pool
 
 
 # ============================================
@@ -177,25 +176,27 @@ class ShowBgpSuperParser(ShowBgpSchema):
         status_codes = ''
         prefix = ""
         origin_codes_info = origin_codes_data = ""
+        # share the repeated values of the paths, see utils/string_pool.py
+        pool = string_pool.is_enabled()
 
         # For address family: IPv4 Unicast
-        p1 = re.compile(r'^\s*For +address +family:'
-                        r' +(?P<address_family>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^\s*For +address +family:'
+                                  r' +(?P<address_family>[\S\s]+)$')
 
         # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                        r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                        r' +ID +is +(?P<local_router_id>(\S+))$')
+        p2 = regex_engine.compile(r'^\s*BGP +table +version +is'
+                                  r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                  r' +ID +is +(?P<local_router_id>(\S+))$')
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # *>   [5][65535:1][0][24][10.1.1.0]/17
         # *>  100:2051:VEID-2:Blk-1/136
         #  *>   [3][3001:1][*][*][1.1.1.1]/14
         # *m   [2][2.2.2.2:1][0][48][000C293B2157][0][*]/20
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
-                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-\*]+)'
-                          r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|\s)+)?'
+                                    r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
+                                    r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-\*]+)'
+                                    r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # * i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
@@ -204,11 +205,11 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # r>                    0.0.0.0                 0         32768 ?
         # *m                    0.0.0.0                 0         32768 ?
         # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
-                          r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                          r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
-                          r'(?P<termination>[\s\S]+)$')
+        p3_2 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
+                                    r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
+                                    r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                    r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
+                                    r'(?P<termination>[\s\S]+)$')
 
         # Network            Next Hop            Metric     LocPrf     Weight Path
         # *    10.36.3.0/24       10.36.3.254                0             0 65530 ?
@@ -218,26 +219,26 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
         # *>  100:2051:VEID-2:Blk-1/136
         # *>i10.1.1.0/24   0.0.0.0                   0    100      0 1234 60000 ?
-        p4 = re.compile(r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
-                        r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
-                        r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
-                        r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
-                        r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
-                        r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
-                        r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
+        p4 = regex_engine.compile(r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
+                                  r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
+                                  r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
+                                  r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
+                                  r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
+                                  r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
+                                  r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
 
         # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-        p5 = re.compile(r'^\s*AF-Private +Import +to +Address-Family:'
-                        r' +(?P<af_private_import_to_address_family>[\s\S]+),'
-                        r' +Pfx +Count/Limit:'
-                        r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$')
+        p5 = regex_engine.compile(r'^\s*AF-Private +Import +to +Address-Family:'
+                                  r' +(?P<af_private_import_to_address_family>[\s\S]+),'
+                                  r' +Pfx +Count/Limit:'
+                                  r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$')
 
         # Route Distinguisher: 200:1
         # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-        p6 = re.compile(r'^\s*Route +Distinguisher *: '
-                        r'+(?P<route_distinguisher>(\S+))'
-                        r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                        r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p6 = regex_engine.compile(r'^\s*Route +Distinguisher *: '
+                                  r'+(?P<route_distinguisher>(\S+))'
+                                  r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+                                  r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -302,8 +303,8 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
                 if m.groupdict()['termination']:
                     termination = m.groupdict()['termination']
-                    m3 = re.compile(r'(?: *(?P<path>[0-9\{\}\s]+))?'
-                                    r' +(?P<origin_codes>(i|e|\?|\|))$').match(termination)
+                    m3 = regex_engine.compile(r'(?: *(?P<path>[0-9\{\}\s]+))?'
+                                              r' +(?P<origin_codes>(i|e|\?|\|))$').match(termination)
                     if m3 and m3.groupdict()['path']:
                         path_info = m3.groupdict()['path']
                     if m3 and m3.groupdict()['origin_codes']:
@@ -359,6 +360,8 @@ class ShowBgpSuperParser(ShowBgpSchema):
                      af_dict['routes'][prefix]['index'][index]['path'] = path_info
                 if origin_codes_info:
                     af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_info
+                if pool:
+                    string_pool.intern_values(af_dict['routes'][prefix]['index'][index])
 
                 continue
 
@@ -389,8 +392,8 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
                 if m.groupdict()['path']:
                     path_1 = m.groupdict()['path']
-                    m3 = re.compile(r'(?: *(?P<path_inner>[0-9\{\}\s\,]+))?'
-                                    r' +(?P<origin_codes_inner>(i|e|\?|\|))$').match(path_1)
+                    m3 = regex_engine.compile(r'(?: *(?P<path_inner>[0-9\{\}\s\,]+))?'
+                                              r' +(?P<origin_codes_inner>(i|e|\?|\|))$').match(path_1)
                     if m3:
                         path_data = m3.groupdict()['path_inner']
                         origin_codes_data = m3.groupdict()['origin_codes_inner']
@@ -443,6 +446,8 @@ class ShowBgpSuperParser(ShowBgpSchema):
                     af_dict['routes'][prefix]['index'][index]['metric'] = metric
                 if origin_codes_data:
                     af_dict['routes'][prefix]['index'][index]['origin_codes'] = origin_codes_data
+                if pool:
+                    string_pool.intern_values(af_dict['routes'][prefix]['index'][index])
                 continue
 
             # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
@@ -792,24 +797,24 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         nlri_data = {}
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family:'
-                        r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
+        p1 = regex_engine.compile(r'^For +address +family:'
+                                  r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
 
         # Paths: (1 available, best #1, table default)
         # Paths: (1 available, best #1, table VRF1)
         # Paths: (1 available, best #1, no table)
         # Paths: (1 available, best #1, table default, RIB-failure(17))
-        p2 = re.compile(r'^Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
-                        r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
-                        r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)')
+        p2 = regex_engine.compile(r'^Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
+                                  r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
+                                  r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)')
 
         # Route Distinguisher: 100:100 (default for vrf VRF1)
         # Route Distinguisher: 65535:1 (default for vrf evpn1)
         # Route Distinguisher: 65109:3051
         # Route Distinguisher: 10.100.1.1:3014 (default for vrf vrf1)
-        p2_1 = re.compile(r'^Route +Distinguisher:'
-                          r' +(?P<route_distinguisher>[0-9.\:]+)'
-                          r'(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$')
+        p2_1 = regex_engine.compile(r'^Route +Distinguisher:'
+                                    r' +(?P<route_distinguisher>[0-9.\:]+)'
+                                    r'(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$')
 
         # BGP routing table entry for 10.4.1.1/32, version 4
         # BGP routing table entry for [100:100]2001:11:11::11/128, version 2
@@ -818,40 +823,40 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # BGP routing table entry for 2001:2:2:2::2/128, version 2
         # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
         # BGP routing table entry for 10.100.1.1:3014:0.0.0.0/0, version 74438
-        p3_1 = re.compile(r'^BGP +routing +table +entry +for +(\[[0-9]+\])?'
-                        r'((?P<route_distinguisher>((\[[0-9]+[\:][0-9]+\])'
-                        r'|[0-9]+])|([0-9.]+[:][0-9]+[:])))?(\[[0-9]+\])?'
-                        r'(\[[0-9]+\])?(?P<router_id>((\[[0-9]+[\.][0-9]+[\.]'
-                        r'[0-9]+[\.][0-9]+\][\/][0-9]+)|([0-9]+[\.][0-9]+[\.]'
-                        r'[0-9]+[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9]+'
-                        r'[\/][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                        r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][\:][0-9]+[\/][0-9]+)))\, +version '
-                        r'+(?P<prefix_table_version>[0-9]+)$')
+        p3_1 = regex_engine.compile(r'^BGP +routing +table +entry +for +(\[[0-9]+\])?'
+                                  r'((?P<route_distinguisher>((\[[0-9]+[\:][0-9]+\])'
+                                  r'|[0-9]+])|([0-9.]+[:][0-9]+[:])))?(\[[0-9]+\])?'
+                                  r'(\[[0-9]+\])?(?P<router_id>((\[[0-9]+[\.][0-9]+[\.]'
+                                  r'[0-9]+[\.][0-9]+\][\/][0-9]+)|([0-9]+[\.][0-9]+[\.]'
+                                  r'[0-9]+[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+                                  r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9]+'
+                                  r'[\/][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                  r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+                                  r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                  r'[a-zA-Z0-9]+[\:][\:][0-9]+[\/][0-9]+)))\, +version '
+                                  r'+(?P<prefix_table_version>[0-9]+)$')
 
         # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
-        p3_2 = re.compile(r'^BGP +routing +table +entry +for'
-                          r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
-                          r' +version +(?P<version>(\d+))$')
+        p3_2 = regex_engine.compile(r'^BGP +routing +table +entry +for'
+                                    r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
+                                    r' +version +(?P<version>(\d+))$')
 
         # BGP routing table entry for [route_type][rd][...][...][...], version 48
-        p3_3 = re.compile(r'^BGP +routing +table +entry +for'
-                          r' +(?P<router_id>(\[[0-9]\]\[[0-9\.]+[\:][0-9]+\](\[.+\])+[\/][0-9]+))\, +version '
-                          r'+(?P<prefix_table_version>[0-9]+)$')
+        p3_3 = regex_engine.compile(r'^BGP +routing +table +entry +for'
+                                    r' +(?P<router_id>(\[[0-9]\]\[[0-9\.]+[\:][0-9]+\](\[.+\])+[\/][0-9]+))\, +version '
+                                    r'+(?P<prefix_table_version>[0-9]+)$')
 
         # 10.1.1.2 from 10.1.1.2 (10.1.1.2)
         # 10.16.2.2 (metric 11) (via default) from 10.16.2.2 (10.16.2.2)
         # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
         # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
         # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
-        p4 = re.compile(r'^((?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                        r'(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
-                        r'( +\((?P<inaccessible>inaccessible)\)))?'
-                        r'( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
-                        r'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
-                        r' +\((?P<originator>[0-9\.]+)\))$')
+        p4 = regex_engine.compile(r'^((?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                  r'(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
+                                  r'( +\((?P<inaccessible>inaccessible)\)))?'
+                                  r'( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
+                                  r'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
+                                  r' +\((?P<originator>[0-9\.]+)\))$')
 
         # Origin incomplete, metric 0, localpref 100, valid, internal
         # Origin incomplete, metric 0, localpref 100, valid, internal, best
@@ -861,97 +866,97 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # Origin IGP, localpref 100, valid, external, multipath
         # Origin IGP, localpref 100, valid, external, multipath, best
         # Origin IGP, localpref 100, valid, external, multipath(oldest)
-        p5 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),(?: +metric '
-                        r'+(?P<metric>[0-9]+),?)?(?: +localpref '
-                        r'+(?P<locprf>[0-9]+),?)?(?: +weight '
-                        r'+(?P<weight>[0-9]+),?)?(?: +(?P<valid>valid?,))?(?: '
-                        r'+(?P<sourced>sourced?,))?(?: +(?P<state>(internal|'
-                        r'external|local)\,?))?(?: '
-                        r'+(?P<aggregate>atomic-aggregate?))?(\,)?(?: '
-                        r'+(?P<multipath>multipath(?:\(\w+\))?))?(\,)?(?: '
-                        r'+(?P<best>best))?$')
+        p5 = regex_engine.compile(r'^Origin +(?P<origin>[a-zA-Z]+),(?: +metric '
+                                  r'+(?P<metric>[0-9]+),?)?(?: +localpref '
+                                  r'+(?P<locprf>[0-9]+),?)?(?: +weight '
+                                  r'+(?P<weight>[0-9]+),?)?(?: +(?P<valid>valid?,))?(?: '
+                                  r'+(?P<sourced>sourced?,))?(?: +(?P<state>(internal|'
+                                  r'external|local)\,?))?(?: '
+                                  r'+(?P<aggregate>atomic-aggregate?))?(\,)?(?: '
+                                  r'+(?P<multipath>multipath(?:\(\w+\))?))?(\,)?(?: '
+                                  r'+(?P<best>best))?$')
 
         # Advertised to update-groups:
-        p6_1 = re.compile(r'^Advertised +to +update-groups *:$')
+        p6_1 = regex_engine.compile(r'^Advertised +to +update-groups *:$')
 
         # Not advertised to any peer
-        p6_2 = re.compile(r'^Not +advertised +to +any +peer$')
+        p6_2 = regex_engine.compile(r'^Not +advertised +to +any +peer$')
 
         # 3
         # 38         44         45
-        p6_3 = re.compile(r'(?P<group1>(\d+))'
-                          r'(?: +(?P<group2>(\d+)))?(?: +(?P<group3>(\d+)))?')
+        p6_3 = regex_engine.compile(r'(?P<group1>(\d+))'
+                                    r'(?: +(?P<group2>(\d+)))?(?: +(?P<group3>(\d+)))?')
 
         # Refresh Epoch 1
-        p7 = re.compile(r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$')
+        p7 = regex_engine.compile(r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$')
 
         # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7AFF.FCD2
-        p8 = re.compile(r'^Extended +Community\:'
-                        r' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
-                        r'(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$')
+        p8 = regex_engine.compile(r'^Extended +Community\:'
+                                  r' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
+                                  r'(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$')
 
         # Extended Community: SoO:65109:999 RT:65109:50
         # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
         # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
         # Extended Community: RT:1:1 RT:100:101 MVPN AS:100:0.0.0.0
-        p8_2 = re.compile(r'^Extended +Community *:'
-                          r' +(?P<ext_community>([a-zA-Z0-9\-\:\s\.]+))'
-                          r'(?: *, +(?P<recursive>(recursive-via-connected)))?$')
+        p8_2 = regex_engine.compile(r'^Extended +Community *:'
+                                    r' +(?P<ext_community>([a-zA-Z0-9\-\:\s\.]+))'
+                                    r'(?: *, +(?P<recursive>(recursive-via-connected)))?$')
 
-        p8_21 = re.compile(r'^(RT|Color|0x88|So0|Cost:pre-bestpath).*$')
+        p8_21 = regex_engine.compile(r'^(RT|Color|0x88|So0|Cost:pre-bestpath).*$')
 
         # Community: 62000:1
         # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
-        p8_3 = re.compile(r'^Community: +(?P<community>[\S+\s]+)$')
+        p8_3 = regex_engine.compile(r'^Community: +(?P<community>[\S+\s]+)$')
 
         # AGI version(0), VE Block Size(10) Label Base(16)
-        p8_4 = re.compile(r'^AGI +version\((?P<agi_version>(\d+))\),'
-                          r' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
-                          r' +Label +Base\((?P<label_base>(\d+))\)$')
+        p8_4 = regex_engine.compile(r'^AGI +version\((?P<agi_version>(\d+))\),'
+                                    r' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
+                                    r' +Label +Base\((?P<label_base>(\d+))\)$')
 
         # Originator: 192.168.165.220, Cluster list: 0.0.0.61
-        p8_5 = re.compile(r'^\s*Originator: +(?P<originator>(\S+)),'
-                          r' +Cluster +list: +(?P<cluster_list>(\S+))$')
+        p8_5 = regex_engine.compile(r'^\s*Originator: +(?P<originator>(\S+)),'
+                                    r' +Cluster +list: +(?P<cluster_list>(\S+))$')
         
-        p8_6 = re.compile(r'^\s*PMSI Attribute: Flags.*'
-                          r'Tunnel type:(?P<tun_type>.+),'
-                          r' length.+vni:(?P<vni>.+)'
-                          r' tunnel identifier: ((< Tunnel Endpoint: (?P<tun_endpoint>.+) >)|(?P<local>0000 0000))$')
+        p8_6 = regex_engine.compile(r'^\s*PMSI Attribute: Flags.*'
+                                    r'Tunnel type:(?P<tun_type>.+),'
+                                    r' length.+vni:(?P<vni>.+)'
+                                    r' tunnel identifier: ((< Tunnel Endpoint: (?P<tun_endpoint>.+) >)|(?P<local>0000 0000))$')
 
         # rx pathid: 0, tx pathid: 0
-        p9 = re.compile(r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
-                        r' +tx +pathid\:'
-                        r' +(?P<transfer_pathid>[0-9x]+)$')
+        p9 = regex_engine.compile(r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
+                                  r' +tx +pathid\:'
+                                  r' +(?P<transfer_pathid>[0-9x]+)$')
 
         # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
         # EVPN ESI: 00000000000000000000, Label1 2000101
-        p10 = re.compile(r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,\s+'
-                         r'(Gateway +Address\:\s+(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,\s+)?'
-                         r'(local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)\,\s+)?'
-                         r'[L|l]abel\d* +(?P<label>[0-9]+)$')
+        p10 = regex_engine.compile(r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,\s+'
+                                   r'(Gateway +Address\:\s+(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,\s+)?'
+                                   r'(local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)\,\s+)?'
+                                   r'[L|l]abel\d* +(?P<label>[0-9]+)$')
 
         # Local vxlan vtep:
         # Local irb vxlan vtep
-        p11 = re.compile(r'^Local\s+(irb\s+)?vxlan\s+vtep\:$')
+        p11 = regex_engine.compile(r'^Local\s+(irb\s+)?vxlan\s+vtep\:$')
 
         # bdi:BDI200
         # core-bdi:BDI200
-        p12 = re.compile(r'^(core-)?bdi\:(?P<bdi>[A-Z0-9]+)$')
+        p12 = regex_engine.compile(r'^(core-)?bdi\:(?P<bdi>[A-Z0-9]+)$')
 
         # vrf:evpn1, vni:30000
         # vrf:evpn1, l3-vni:30000
-        p13 = re.compile(r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
-                         r'\s+(.+-)?vni\:(?P<vni>[0-9]+)$')
+        p13 = regex_engine.compile(r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
+                                   r'\s+(.+-)?vni\:(?P<vni>[0-9]+)$')
 
         # local router mac:001E.7AFF.FCD2
-        p14 = re.compile(r'^local +router +mac\:'
-                         r'(?P<local_router_mac>[a-zA-Z0-9\.]+)$')
+        p14 = regex_engine.compile(r'^local +router +mac\:'
+                                   r'(?P<local_router_mac>[a-zA-Z0-9\.]+)$')
 
         # encap:8
-        p15 = re.compile(r'^encap\:(?P<encap>[0-9]+)$')
+        p15 = regex_engine.compile(r'^encap\:(?P<encap>[0-9]+)$')
 
         # vtep-ip:10.21.33.33
-        p16 = re.compile(r'^vtep-ip\:(?P<vtep_ip>[a-zA-Z0-9\.\:]+)$')
+        p16 = regex_engine.compile(r'^vtep-ip\:(?P<vtep_ip>[a-zA-Z0-9\.\:]+)$')
 
         # Local
         # 65530
@@ -964,21 +969,21 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 10.160.0.61), (received & used)
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 2001:db8:4::1), (received & used)
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 FE80:CD00:0:CDE:1257:0:211E:729C), (received & used)
-        p17 = re.compile(r'^(?P<route_info>[a-zA-Z0-9\-\.\{\}\s\(\)\/\:\[\]]+)'
-                       r'(\,)?(?: +\(aggregated +by +(?P<aggregated_by>[\w\s\.\:]'
-                       r'+)\)(\,))?(?: +(?P<route_status>[A-Za-z0-9\.\:\/\(\)\s'
-                       r'\[\]\-\&]+))?$')
+        p17 = regex_engine.compile(r'^(?P<route_info>[a-zA-Z0-9\-\.\{\}\s\(\)\/\:\[\]]+)'
+                                 r'(\,)?(?: +\(aggregated +by +(?P<aggregated_by>[\w\s\.\:]'
+                                 r'+)\)(\,))?(?: +(?P<route_status>[A-Za-z0-9\.\:\/\(\)\s'
+                                 r'\[\]\-\&]+))?$')
         
         # mpls labels in/out nolabel/64402
-        p18 = re.compile(r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$')
+        p18 = regex_engine.compile(r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$')
 
         # IGMP/MLD v1/v2/v3, exclude, max response time:
-        p19 = re.compile(r'^IGMP/MLD\s+(?P<version>v\d|v\d,\s*v\d)(,\s+(?P<filter_mode>\w+))?$')
+        p19 = regex_engine.compile(r'^IGMP/MLD\s+(?P<version>v\d|v\d,\s*v\d)(,\s+(?P<filter_mode>\w+))?$')
 
         # binding SID: 28 (color - 7) (state - UP)
-        p20 = re.compile(r'^binding +SID\:' r' +(?P<sid>([a-zA-Z0-9]+))'
-                 r'( +\(color[ ]{0,1}[-][ ]{0,1}(?P<color>[0-9]+)\))'
-                 r'(( +\(state +\- +(?P<state>[A-Za-z]+)\)))?$')
+        p20 = regex_engine.compile(r'^binding +SID\:' r' +(?P<sid>([a-zA-Z0-9]+))'
+                           r'( +\(color[ ]{0,1}[-][ ]{0,1}(?P<color>[0-9]+)\))'
+                           r'(( +\(state +\- +(?P<state>[A-Za-z]+)\)))?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1154,16 +1159,16 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 if prefixes.startswith('[6]'):
                     # BGP routing table entry for [6][7.7.7.7:11][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/27, version 27
                     # BGP routing table entry for [6][117901063:11][0][128][A0A:A0A:A0A:A0A:A0A:A0A:A0A:A0A][128][1300:6501:1300:6501:1300:6501:1300:6501][128][E000:1:E000:1:E000:1:E000:1]/63, version 33
-                    rt6_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                r'\[(?P<eti>[0-9]+)\]'
-                                                r'\[(?P<mcast_src_len>[0-9]+)\]'
-                                                r'(\[(?P<mcast_src>.+)\])?'
-                                                r'\[(?P<mcast_group_len>[0-9]+)\]'
-                                                r'\[(?P<mcast_group_addr>.+)\]'
-                                                r'\[(?P<orig_rtr_len>[0-9]+)\]'
-                                                r'\[(?P<orig_rtr_id>.+)\]'
-                                                r'\/(?P<subnet>[0-9]+)')
+                    rt6_prefix_re = regex_engine.compile(r'\[(?P<rt>[0-9])\]'
+                                                          r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                          r'\[(?P<eti>[0-9]+)\]'
+                                                          r'\[(?P<mcast_src_len>[0-9]+)\]'
+                                                          r'(\[(?P<mcast_src>.+)\])?'
+                                                          r'\[(?P<mcast_group_len>[0-9]+)\]'
+                                                          r'\[(?P<mcast_group_addr>.+)\]'
+                                                          r'\[(?P<orig_rtr_len>[0-9]+)\]'
+                                                          r'\[(?P<orig_rtr_id>.+)\]'
+                                                          r'\/(?P<subnet>[0-9]+)')
                     rt6_mo = rt6_prefix_re.match(prefixes)
                     if rt6_mo:
                         rt6_dict = rt6_mo.groupdict()
@@ -1180,12 +1185,12 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
                 elif prefixes.startswith('[3]'):
                     # BGP routing table entry for [3][40.0.0.3:164][0][32][40.0.0.3]/17, version 30
-                    rt3_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                r'\[(?P<eti>[0-9]+)\]'
-                                                r'\[(?P<ip_len>[0-9]+)\]'
-                                                r'(\[(?P<orig_rtr_id>.+)\])?'
-                                                r'\/(?P<subnet>[0-9]+)')
+                    rt3_prefix_re = regex_engine.compile(r'\[(?P<rt>[0-9])\]'
+                                                          r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                          r'\[(?P<eti>[0-9]+)\]'
+                                                          r'\[(?P<ip_len>[0-9]+)\]'
+                                                          r'(\[(?P<orig_rtr_id>.+)\])?'
+                                                          r'\/(?P<subnet>[0-9]+)')
                     rt3_mo = rt3_prefix_re.match(prefixes)
                     if rt3_mo:
                         rt3_dict = rt3_mo.groupdict()
@@ -1199,11 +1204,11 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         
                 elif prefixes.startswith('[1]'):
                     # BGP routing table entry for [1][2.2.2.2:1000][AAAABBBBCCCCDDDDEEEE][10000]/23, version 26
-                    rt1_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                r'\[(?P<esi>.+)\]'
-                                                r'\[(?P<eti>[0-9]+)\]'
-                                                r'\/(?P<subnet>[0-9]+)')
+                    rt1_prefix_re = regex_engine.compile(r'\[(?P<rt>[0-9])\]'
+                                                          r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                          r'\[(?P<esi>.+)\]'
+                                                          r'\[(?P<eti>[0-9]+)\]'
+                                                          r'\/(?P<subnet>[0-9]+)')
                     rt1_mo = rt1_prefix_re.match(prefixes)
                     if rt1_mo:
                         rt1_dict = rt1_mo.groupdict()
@@ -1216,14 +1221,14 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 elif prefixes.startswith('[2]'):
                     # BGP routing table entry for [2][2.2.2.2:1000][10000][48][022651BDC81C][32][0.0.0.0]/24, version 28
                     # BGP routing table entry for [2][22.2.2.2:1000][10000][48][022651BDC81C][128][1000::1]/36, version 36
-                    rt2_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                r'\[(?P<eti>[0-9]+)\]'
-                                                r'\[(?P<mac_len>[0-9]+)\]'
-                                                r'\[(?P<mac>.+)\]'
-                                                r'\[(?P<ip_len>[0-9]+)\]'
-                                                r'(\[(?P<ip_prefix>.+)\])?'
-                                                r'\/(?P<subnet>[0-9]+)')
+                    rt2_prefix_re = regex_engine.compile(r'\[(?P<rt>[0-9])\]'
+                                                          r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                          r'\[(?P<eti>[0-9]+)\]'
+                                                          r'\[(?P<mac_len>[0-9]+)\]'
+                                                          r'\[(?P<mac>.+)\]'
+                                                          r'\[(?P<ip_len>[0-9]+)\]'
+                                                          r'(\[(?P<ip_prefix>.+)\])?'
+                                                          r'\/(?P<subnet>[0-9]+)')
                     
                     rt2_mo = rt2_prefix_re.match(prefixes)
                     if rt2_mo:
@@ -1241,12 +1246,12 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
                 elif prefixes.startswith('[4]'):
                     # BGP routing table entry for [4][2.2.2.2:1000][AAAABBBBCCCCDDDDEEEE][32]/23, version 32
-                    rt4_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                r'\[(?P<esi>.+)\]'
-                                                r'\[(?P<ip_len>[0-9]+)\]'
-                                                r'(\[(?P<orig_rtr_id>.+)\])?'
-                                                r'\/(?P<subnet>[0-9]+)')
+                    rt4_prefix_re = regex_engine.compile(r'\[(?P<rt>[0-9])\]'
+                                                          r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                          r'\[(?P<esi>.+)\]'
+                                                          r'\[(?P<ip_len>[0-9]+)\]'
+                                                          r'(\[(?P<orig_rtr_id>.+)\])?'
+                                                          r'\/(?P<subnet>[0-9]+)')
                     
                     rt4_mo = rt4_prefix_re.match(prefixes)
                     if rt4_mo:
@@ -1262,12 +1267,12 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 elif prefixes.startswith('[5]'):
                     # BGP routing table entry for [5][100:100][4231][32][1.1.1.1]/17, version 37
                     # BGP routing table entry for [5][20.0.0.1:31000][0][32][250.250.250.22]/17, version 34
-                    rt5_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                r'\[(?P<eti>[0-9]+)\]'
-                                                r'\[(?P<ip_len>[0-9]+)\]'
-                                                r'(\[(?P<ip_prefix>.+)\])?'
-                                                r'\/(?P<subnet>[0-9]+)')
+                    rt5_prefix_re = regex_engine.compile(r'\[(?P<rt>[0-9])\]'
+                                                          r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                          r'\[(?P<eti>[0-9]+)\]'
+                                                          r'\[(?P<ip_len>[0-9]+)\]'
+                                                          r'(\[(?P<ip_prefix>.+)\])?'
+                                                          r'\/(?P<subnet>[0-9]+)')
                     
                     rt5_mo = rt5_prefix_re.match(prefixes)
                     if rt5_mo:
@@ -1283,17 +1288,17 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
                 elif prefixes.startswith('[7]'):
                     # BGP routing table entry for [7][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/37, version 29
-                    rt7_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                r'\[(?P<esi>.+)\]'
-                                                r'\[(?P<eti>[0-9]+)\]'
-                                                r'\[(?P<mcast_src_len>[0-9]+)\]'
-                                                r'(\[(?P<mcast_src>.+)\])?'
-                                                r'\[(?P<mcast_group_len>[0-9]+)\]'
-                                                r'\[(?P<mcast_group_addr>.+)\]'
-                                                r'\[(?P<orig_rtr_len>[0-9]+)\]'
-                                                r'\[(?P<orig_rtr_id>.+)\]'
-                                                r'\/(?P<subnet>[0-9]+)')
+                    rt7_prefix_re = regex_engine.compile(r'\[(?P<rt>[0-9])\]'
+                                                          r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                          r'\[(?P<esi>.+)\]'
+                                                          r'\[(?P<eti>[0-9]+)\]'
+                                                          r'\[(?P<mcast_src_len>[0-9]+)\]'
+                                                          r'(\[(?P<mcast_src>.+)\])?'
+                                                          r'\[(?P<mcast_group_len>[0-9]+)\]'
+                                                          r'\[(?P<mcast_group_addr>.+)\]'
+                                                          r'\[(?P<orig_rtr_len>[0-9]+)\]'
+                                                          r'\[(?P<orig_rtr_id>.+)\]'
+                                                          r'\/(?P<subnet>[0-9]+)')
 
                     rt7_mo = rt7_prefix_re.match(prefixes)
                     if rt7_mo:
@@ -1314,18 +1319,18 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
                 elif prefixes.startswith('[8]'):
                     # BGP routing table entry for [8][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1][4112]/41, version 31
-                    rt8_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                r'\[(?P<esi>.+)\]'
-                                                r'\[(?P<eti>[0-9]+)\]'
-                                                r'\[(?P<mcast_src_len>[0-9]+)\]'
-                                                r'(\[(?P<mcast_src>.+)\])?'
-                                                r'\[(?P<mcast_group_len>[0-9]+)\]'
-                                                r'\[(?P<mcast_group_addr>.+)\]'
-                                                r'\[(?P<orig_rtr_len>[0-9]+)\]'
-                                                r'\[(?P<orig_rtr_id>.+)\]'
-                                                r'\[(?P<max_resp_time>[0-9]+)\]'
-                                                r'\/(?P<subnet>[0-9]+)')
+                    rt8_prefix_re = regex_engine.compile(r'\[(?P<rt>[0-9])\]'
+                                                          r'\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                                                          r'\[(?P<esi>.+)\]'
+                                                          r'\[(?P<eti>[0-9]+)\]'
+                                                          r'\[(?P<mcast_src_len>[0-9]+)\]'
+                                                          r'(\[(?P<mcast_src>.+)\])?'
+                                                          r'\[(?P<mcast_group_len>[0-9]+)\]'
+                                                          r'\[(?P<mcast_group_addr>.+)\]'
+                                                          r'\[(?P<orig_rtr_len>[0-9]+)\]'
+                                                          r'\[(?P<orig_rtr_id>.+)\]'
+                                                          r'\[(?P<max_resp_time>[0-9]+)\]'
+                                                          r'\/(?P<subnet>[0-9]+)')
 
                     rt8_mo = rt8_prefix_re.match(prefixes)
                     if rt8_mo:
@@ -1945,8 +1950,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         show_vrf_output = None
         if ('rd' in cmd and 'summary' in cmd and
             output != '% RD does not match the default RD of any VRF'):
-            obj = ShowVrf(device=self.device)
-            show_vrf_output = obj.parse()
+            show_vrf_output = cached_parse(self.device, ShowVrf)
             # try:
             #     show_vrf_output = obj.parse()
             # except Exception:
@@ -1966,13 +1970,13 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                                      'show run | sec address-family ipv6 vrf']
                 
                 for command in commands_list:
-                    out_vrf = self.device.execute(command)
+                    out_vrf = cached_execute(self.device, command)
 
-                    rc1 = re.compile(r'address\-family\s+(?P<address_family>'
-                                      r'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)')
+                    rc1 = regex_engine.compile(r'address\-family\s+(?P<address_family>'
+                                                r'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)')
 
-                    rc2 = re.compile(r'neighbor\s+(?P<neighbor_address>\S+)\s+'
-                                r'remote\-as\s+(?P<remote_as>\S+)')
+                    rc2 = regex_engine.compile(r'neighbor\s+(?P<neighbor_address>\S+)\s+'
+                                          r'remote\-as\s+(?P<remote_as>\S+)')
 
                     flag_address_family = False            
 
@@ -1997,83 +2001,83 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                             continue
 
         # For address family: IPv4 Unicast
-        p1 = re.compile(r'^For address family: +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p1 = regex_engine.compile(r'^For address family: +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
 
         # BGP router identifier 192.168.111.1, local AS number 100
         # BGP router identifier 30.1.107.78, local AS number 304.304
-        p2 = re.compile(r'^BGP +router +identifier'
-                         r' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
-                         r' +number +(?P<local_as>[0-9\.]+)$')
+        p2 = regex_engine.compile(r'^BGP +router +identifier'
+                                   r' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
+                                   r' +number +(?P<local_as>[0-9\.]+)$')
 
         # BGP table version is 28, main routing table version 28
-        p3 = re.compile(r'^BGP +table +version +is'
-                         r' +(?P<bgp_table_version>[0-9]+),'
-                         r' +main +routing +table +version'
-                         r' +(?P<routing_table_version>[0-9]+)$')
+        p3 = regex_engine.compile(r'^BGP +table +version +is'
+                                   r' +(?P<bgp_table_version>[0-9]+),'
+                                   r' +main +routing +table +version'
+                                   r' +(?P<routing_table_version>[0-9]+)$')
 
         # 27 network entries using 6696 bytes of memory
-        p4 = re.compile(r'^(?P<networks>[0-9]+) +network +entries +using'
-                         r' +(?P<bytes>[0-9]+) +bytes +of +memory$')
+        p4 = regex_engine.compile(r'^(?P<networks>[0-9]+) +network +entries +using'
+                                   r' +(?P<bytes>[0-9]+) +bytes +of +memory$')
 
         # 27 path entries using 3672 bytes of memory
-        p5 = re.compile(r'^(?P<path>[0-9]+) +path +entries +using'
-                         r' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
+        p5 = regex_engine.compile(r'^(?P<path>[0-9]+) +path +entries +using'
+                                   r' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
 
         # 2 BGP rrinfo entries using 48 bytes of memory
         # 201 BGP AS-PATH entries using 4824 bytes of memory
-        p5_1 = re.compile(r'^(?P<num_entries>([0-9]+)) +BGP'
-                           r' +(?P<entries_type>(\S+)) +entries +using'
-                           r' +(?P<entries_byte>[0-9]+) +bytes +of +memory$')
+        p5_1 = regex_engine.compile(r'^(?P<num_entries>([0-9]+)) +BGP'
+                                     r' +(?P<entries_type>(\S+)) +entries +using'
+                                     r' +(?P<entries_byte>[0-9]+) +bytes +of +memory$')
 
         # 4 BGP extended community entries using 96 bytes of memory
-        p5_2 = re.compile(r'^(?P<num_community_entries>[0-9]+) +BGP +extended'
-                           r' +community +entries +using'
-                           r' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
+        p5_2 = regex_engine.compile(r'^(?P<num_community_entries>[0-9]+) +BGP +extended'
+                                     r' +community +entries +using'
+                                     r' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
 
         # 1/1 BGP path/bestpath attribute entries using 280 bytes of memory
-        p6 = re.compile(r'^(?P<attribute_entries>(\S+)) +BGP'
-                         r' +(?P<attribute_type>(\S+)) +attribute +entries'
-                         r' +using +(?P<bytes>[0-9]+) +bytes +of +memory$')
+        p6 = regex_engine.compile(r'^(?P<attribute_entries>(\S+)) +BGP'
+                                   r' +(?P<attribute_type>(\S+)) +attribute +entries'
+                                   r' +using +(?P<bytes>[0-9]+) +bytes +of +memory$')
 
         # 0 BGP route-map cache entries using 0 bytes of memory
         # 0 BGP filter-list cache entries using 0 bytes of memory
-        p6_1 = re.compile(r'^(?P<num_cache_entries>([0-9]+)) +BGP'
-                           r' +(?P<cache_type>(\S+)) +cache +entries +using'
-                           r' +(?P<cache_byte>[0-9]+) +bytes +of +memory$')
+        p6_1 = regex_engine.compile(r'^(?P<num_cache_entries>([0-9]+)) +BGP'
+                                     r' +(?P<cache_type>(\S+)) +cache +entries +using'
+                                     r' +(?P<cache_byte>[0-9]+) +bytes +of +memory$')
 
         # BGP using 10648 total bytes of memory
-        p7 = re.compile(r'^BGP +using +(?P<total_memory>[0-9]+) +total +bytes'
-                         r' +of +memory$')
+        p7 = regex_engine.compile(r'^BGP +using +(?P<total_memory>[0-9]+) +total +bytes'
+                                   r' +of +memory$')
 
         # BGP activity 47/20 prefixes, 66/39 paths, scan interval 60 secs
-        p8 = re.compile(r'^BGP +activity +(?P<activity_prefixes>(\S+))'
-                         r' +prefixes, +(?P<activity_paths>(\S+)) +paths, +scan'
-                         r' +interval +(?P<scan_interval>[0-9]+) +secs$')
+        p8 = regex_engine.compile(r'^BGP +activity +(?P<activity_prefixes>(\S+))'
+                                   r' +prefixes, +(?P<activity_paths>(\S+)) +paths, +scan'
+                                   r' +interval +(?P<scan_interval>[0-9]+) +secs$')
 
         # Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
         # 192.168.111.1       4          100       0       0        1    0    0 01:07:38 Idle
         # 192.168.4.1       4          100       0       0        1    0    0 never    Idle
         # 192.168.51.1       4          100       0       0        1    0    0 01:07:38 Idle
-        p9 = re.compile(r'^ *(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<version>[0-9]+)'
-                         r' +(?P<as>[0-9]+(\.\d+)?) +(?P<msg_rcvd>[0-9]+)'
-                         r' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
-                         r' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
-                         r' +(?P<up_down>[a-zA-Z0-9\:]+)'
-                         r' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
+        p9 = regex_engine.compile(r'^ *(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<version>[0-9]+)'
+                                   r' +(?P<as>[0-9]+(\.\d+)?) +(?P<msg_rcvd>[0-9]+)'
+                                   r' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
+                                   r' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
+                                   r' +(?P<up_down>[a-zA-Z0-9\:]+)'
+                                   r' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
 
         #  Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
         #  2001:DB8:20:4:6::6
         #           4          400      67      73       66    0    0 01:03:11        5
         #  *2001::100:1:2:1
         #                  4        65001       7       7      198    0    0 00:00:02        1
-        p10 = re.compile(r'^(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
+        p10 = regex_engine.compile(r'^(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
 
-        p11 = re.compile(r'^(?P<version>[0-9]+)'
-                          r' +(?P<as>[0-9]+(\.\d+)?) +(?P<msg_rcvd>[0-9]+)'
-                          r' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
-                          r' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
-                          r' +(?P<up_down>[a-zA-Z0-9\:]+)'
-                         r' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
+        p11 = regex_engine.compile(r'^(?P<version>[0-9]+)'
+                                    r' +(?P<as>[0-9]+(\.\d+)?) +(?P<msg_rcvd>[0-9]+)'
+                                    r' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
+                                    r' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
+                                    r' +(?P<up_down>[a-zA-Z0-9\:]+)'
+                                   r' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
 
         for line in output.splitlines():
 
@@ -2835,129 +2839,129 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
+        p1 = regex_engine.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
 
         # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-        p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
-                         r' +(?P<remote_as>([\d\.]+)), +(?P<link>[a-zA-Z]+) +link$')
+        p2_1 = regex_engine.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
+                                   r' +(?P<remote_as>([\d\.]+)), +(?P<link>[a-zA-Z]+) +link$')
 
         # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
         # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-        p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
-                           r' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>([\d\.]+)),'
-                           r' +(?P<link>[a-zA-Z]+) +link$')
+        p2_2 = regex_engine.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
+                                     r' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>([\d\.]+)),'
+                                     r' +(?P<link>[a-zA-Z]+) +link$')
 
         # IOS output
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
         # BGP neighbor is 10.4.11.2, remote AS 101.101, external link
         # BGP neighbor is 10.10.11.1, vrf CustA-VPN1, remote AS 4200000001, local AS 4200000101 no-prepend replace-as, external link
-        p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
-                           r'(?: +vrf +(?P<vrf>(\S+)),)?'
-                           r' +remote +AS +(?P<remote_as>([\d\.]+)),'
-                           r'( +local +AS +(?P<local_as>[\d\.]+))?(?P<no_prepend> no-prepend)?'
-                           r'(?P<replace_as> replace-as)?,? +(?P<link>(\S+)) +link$')
+        p2_3 = regex_engine.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
+                                     r'(?: +vrf +(?P<vrf>(\S+)),)?'
+                                     r' +remote +AS +(?P<remote_as>([\d\.]+)),'
+                                     r'( +local +AS +(?P<local_as>[\d\.]+))?(?P<no_prepend> no-prepend)?'
+                                     r'(?P<replace_as> replace-as)?,? +(?P<link>(\S+)) +link$')
 
         # Description: router22222222
-        p3 = re.compile(r'^Description: +(?P<description>(\S+))$')
+        p3 = regex_engine.compile(r'^Description: +(?P<description>(\S+))$')
 
         # Administratively shut down
-        p4 = re.compile(r'^Administratively shut down$')
+        p4 = regex_engine.compile(r'^Administratively shut down$')
 
         # BGP version 4, remote router ID 10.16.2.2
-        p5 = re.compile(r'^BGP +version +(?P<bgp_version>(\d+)), +remote'
-                         r' +router +ID +(?P<router_id>(\S+))$')
+        p5 = regex_engine.compile(r'^BGP +version +(?P<bgp_version>(\d+)), +remote'
+                                   r' +router +ID +(?P<router_id>(\S+))$')
 
         # BGP state = Established, up for 01:10:35
         # BGP state = Idle, down for 01:10:35
         # BGP state = Idle
         # BGP state = Established, up for 1w2d
         # Session state = Closing
-        p6 = re.compile(r'^(BGP|Session) +state += +(?P<session_state>(\S+))'
-                         r'(?:, +(?P<state>(up|down)) +for +(?P<time>(\S+)))?$')
+        p6 = regex_engine.compile(r'^(BGP|Session) +state += +(?P<session_state>(\S+))'
+                                   r'(?:, +(?P<state>(up|down)) +for +(?P<time>(\S+)))?$')
 
         # Last read 00:00:04, last write 00:00:09, hold time is 180, keepalive interval is 60 seconds
-        p7_1 = re.compile(r'^Last +read +(?P<last_read>(\S+)), +last +write'
-                           r' +(?P<last_write>(\S+)), +hold +time +is'
-                           r' +(?P<hold_time>(\d+)), +keepalive +interval +is'
-                           r' +(?P<keepalive>(\d+)) +seconds$')
+        p7_1 = regex_engine.compile(r'^Last +read +(?P<last_read>(\S+)), +last +write'
+                                     r' +(?P<last_write>(\S+)), +hold +time +is'
+                                     r' +(?P<hold_time>(\d+)), +keepalive +interval +is'
+                                     r' +(?P<keepalive>(\d+)) +seconds$')
 
         # Configured hold time is 90, keepalive interval is 30 seconds
-        p7_2 = re.compile(r'^Configured +hold +time +is (?P<holdtime>(\d+)),'
-                           r' +keepalive +interval +is +(?P<keepalive>(\d+))'
-                           r' +seconds$')
+        p7_2 = regex_engine.compile(r'^Configured +hold +time +is (?P<holdtime>(\d+)),'
+                                     r' +keepalive +interval +is +(?P<keepalive>(\d+))'
+                                     r' +seconds$')
 
         # Minimum holdtime from neighbor is 0 seconds
-        p7_3 = re.compile(r'^Minimum +holdtime +from +neighbor +is'
-                           r' +(?P<min_holdtime>(\d+)) +seconds$')
+        p7_3 = regex_engine.compile(r'^Minimum +holdtime +from +neighbor +is'
+                                     r' +(?P<min_holdtime>(\d+)) +seconds$')
 
         # Neighbor sessions:
-        p7_4 = re.compile(r'^Neighbor +sessions:+$')
+        p7_4 = regex_engine.compile(r'^Neighbor +sessions:+$')
 
         # Neighbor sessions:
         #  1 active, is not multisession capable (disabled)
-        p8 = re.compile(r'^(?P<sessions>(\d+)) active,(?: +is +not +multisession'
-                         r' +capable( +\(disabled\))?)?$')
+        p8 = regex_engine.compile(r'^(?P<sessions>(\d+)) active,(?: +is +not +multisession'
+                                   r' +capable( +\(disabled\))?)?$')
 
         # Neighbor capabilities:
-        p9 = re.compile(r'^Neighbor +capabilities:$')
+        p9 = regex_engine.compile(r'^Neighbor +capabilities:$')
 
         #  Route refresh: advertised and received(new)
-        p10 = re.compile(r'^Route +refresh: +(?P<route_refresh>(.*))$')
+        p10 = regex_engine.compile(r'^Route +refresh: +(?P<route_refresh>(.*))$')
 
         #  Four-octets ASN Capability: advertised and received
-        p11 = re.compile(r'^Four-octets +ASN +Capability: +(?P<cap>(.*))$')
+        p11 = regex_engine.compile(r'^Four-octets +ASN +Capability: +(?P<cap>(.*))$')
 
         # Address family VPNv4 Unicast: advertised and received
         # Address family VPNv6 Unicast: advertised and received
         # Address family link-state link-state: advertised
-        p12 = re.compile(r'^Address +family +(?P<af_type>([a-zA-Z0-9\s\-]+)) *:'
-                          r' +(?P<val>(.*))$')
+        p12 = regex_engine.compile(r'^Address +family +(?P<af_type>([a-zA-Z0-9\s\-]+)) *:'
+                                    r' +(?P<val>(.*))$')
 
         #  Graceful Restart Capability: received
-        p13 = re.compile(r'^Graceful +Restart +Capability: +(?P<gr>(.*))$')
+        p13 = regex_engine.compile(r'^Graceful +Restart +Capability: +(?P<gr>(.*))$')
 
         #   Remote Restart timer is 120 seconds
-        p14 = re.compile(r'^Remote +Restart +timer +is +(?P<timer>(\d+))'
-                          r' +seconds$')
+        p14 = regex_engine.compile(r'^Remote +Restart +timer +is +(?P<timer>(\d+))'
+                                    r' +seconds$')
 
         #   Address families advertised by peer:
         #    VPNv4 Unicast (was not preserved, VPNv6 Unicast (was not preserved
-        p15 = re.compile(r'^(?P<af_type1>([a-zA-Z0-9\s]+)) +\(was +not'
-                          r' +preserved, +(?P<af_type2>([a-zA-Z0-9\s]+))'
-                          r' +\(was +not +preserved$')
+        p15 = regex_engine.compile(r'^(?P<af_type1>([a-zA-Z0-9\s]+)) +\(was +not'
+                                    r' +preserved, +(?P<af_type2>([a-zA-Z0-9\s]+))'
+                                    r' +\(was +not +preserved$')
 
         # Address families advertised by peer before restart:
         #   IPv4 Unicast, VPNv4 Unicast, L2VPN Vpls
 
         #  Enhanced Refresh Capability: advertised
-        p16 = re.compile(r'^Enhanced +Refresh +Capability: +(?P<erc>(.*))$')
+        p16 = regex_engine.compile(r'^Enhanced +Refresh +Capability: +(?P<erc>(.*))$')
 
 
         #  Multisession Capability:
         #  Multisession Capability: advertised
-        p17 = re.compile(r'^Multisession +Capability: +(?P<multisession>(.*))$')
+        p17 = regex_engine.compile(r'^Multisession +Capability: +(?P<multisession>(.*))$')
 
         #  Stateful switchover support enabled: NO for session 1
-        p18 = re.compile(r'^Stateful +switchover +support +(?P<state>(\S+)):'
-                         ' +(?P<value>(.*))$')
+        p18 = regex_engine.compile(r'^Stateful +switchover +support +(?P<state>(\S+)):'
+                                   ' +(?P<value>(.*))$')
 
         # Message statistics:
         # Message statistics for 192.168.10.253 active:
         # Message statistics, state Established:
-        p19 = re.compile(r'^Message +statistics(( +for +(?P<state>[\w. ]+))|'
-                         r'(, +state +Established))?:$')
+        p19 = regex_engine.compile(r'^Message +statistics(( +for +(?P<state>[\w. ]+))|'
+                                   r'(, +state +Established))?:$')
 
         #  InQ depth is 0
         #  OutQ depth is 0
-        p20 = re.compile(r'^(?P<qtype>(InQ|OutQ)) +depth +is +(?P<val>(\d+))$')
+        p20 = regex_engine.compile(r'^(?P<qtype>(InQ|OutQ)) +depth +is +(?P<val>(\d+))$')
 
         # Prefix activity:               ----       ----
         # Local Policy Denied Prefixes:    --------    -------
         # Refresh activity:          ----   ----
-        p21 = re.compile(r'^(?P<table_type>(Prefix activity|'
-                          r'Local Policy Denied Prefixes|Refresh activity)) *:'
-                          r' +(.*)$')
+        p21 = regex_engine.compile(r'^(?P<table_type>(Prefix activity|'
+                                    r'Local Policy Denied Prefixes|Refresh activity)) *:'
+                                    r' +(.*)$')
 
         #  Opens:                  1          1
         #  Notifications:          0          0
@@ -2968,74 +2972,74 @@ class ShowBgpNeighborSuperParser(MetaParser):
         #  Prefixes Current:     403        201 (Consumes 27336 bytes)
         #  Used as bestpath:     n/a          0
         #  Used as multipath:    n/a          0
-        p22 = re.compile(r'^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
-                         r' +(?P<recv>(n/a|\d+))(?:\s+\(Consumes +(?P<bytes>(\d+))'
-                         r' +bytes\))?$')
+        p22 = regex_engine.compile(r'^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
+                                   r' +(?P<recv>(n/a|\d+))(?:\s+\(Consumes +(?P<bytes>(\d+))'
+                                   r' +bytes\))?$')
 
         # Do log neighbor state changes (via global configuration)
 
         # Default minimum time between advertisement runs is 0 seconds
-        p23 = re.compile(r'^Default +minimum +time +between +advertisement'
-                          r' +runs +is +(?P<time>(\d+)) +seconds$')
+        p23 = regex_engine.compile(r'^Default +minimum +time +between +advertisement'
+                                    r' +runs +is +(?P<time>(\d+)) +seconds$')
 
         # Address tracking is enabled, the RIB does have a route to 10.16.2.2
         # Address tracking is enabled, the RIB does not have a route to 10.16.2.2
-        p24 = re.compile(r'^Address +tracking +is +(?P<status>(\S+)), +the +RIB'
-                          r' +does( +(?P<rip_has_route>(not)+))? +have +a +route +to +(?P<route>(\S+))$')
+        p24 = regex_engine.compile(r'^Address +tracking +is +(?P<status>(\S+)), +the +RIB'
+                                    r' +does( +(?P<rip_has_route>(not)+))? +have +a +route +to +(?P<route>(\S+))$')
 
         # Connections established 1; dropped 0
-        p25 = re.compile(r'^Connections +established +(?P<established>(\d+));'
-                          r' +dropped +(?P<dropped>(\d+))$')
+        p25 = regex_engine.compile(r'^Connections +established +(?P<established>(\d+));'
+                                    r' +dropped +(?P<dropped>(\d+))$')
 
         # Last reset never
         # Last reset 01:05:09, due to Active open failed
-        p26 = re.compile(r'^Last +reset +(?P<reset>(\S+))(?:, +due +to'
-                          r' +(?P<reason>(.*)))?$')
+        p26 = regex_engine.compile(r'^Last +reset +(?P<reset>(\S+))(?:, +due +to'
+                                    r' +(?P<reason>(.*)))?$')
 
         # Transport(tcp) path-mtu-discovery is enabled
-        p27 = re.compile(r'^Transport\(tcp\) +path-mtu-discovery +is'
-                          r' +(?P<status>(\S+))$')
+        p27 = regex_engine.compile(r'^Transport\(tcp\) +path-mtu-discovery +is'
+                                    r' +(?P<status>(\S+))$')
 
         # Graceful-Restart is disabled
         # Graceful-Restart is enabled, restart-time 120 seconds, stalepath-time 360 seconds
-        p28 = re.compile(r'^Graceful-Restart +is +(?P<gr>(enabled|disabled))'
-                          r'(?:, +restart-time +(?P<restart>(\d+)) +seconds,'
-                          r' +stalepath-time +(?P<stalepath>(\d+)) +seconds)?$')
+        p28 = regex_engine.compile(r'^Graceful-Restart +is +(?P<gr>(enabled|disabled))'
+                                    r'(?:, +restart-time +(?P<restart>(\d+)) +seconds,'
+                                    r' +stalepath-time +(?P<stalepath>(\d+)) +seconds)?$')
 
         # Connection state is ESTAB, I/O status: 1, unread input bytes: 0
-        p29 = re.compile(r'^Connection +state +is +(?P<state>(\S+)), +I/O'
-                          r' +status: (?P<io>(\d+)), +unread +input +bytes:'
-                          r' +(?P<bytes>(\d+))$')
+        p29 = regex_engine.compile(r'^Connection +state +is +(?P<state>(\S+)), +I/O'
+                                    r' +status: (?P<io>(\d+)), +unread +input +bytes:'
+                                    r' +(?P<bytes>(\d+))$')
 
         # Connection is ECN Disabled, Mininum incoming TTL 0, Outgoing TTL 255
-        p30 = re.compile(r'^Connection +is +ECN +(?P<ecn_state>(\S+)),'
-                          r' +Mininum +incoming +TTL +(?P<incoming_ttl>(\d+)),'
-                          r' +Outgoing +TTL +(?P<outgoing_ttl>(\d+))$')
+        p30 = regex_engine.compile(r'^Connection +is +ECN +(?P<ecn_state>(\S+)),'
+                                    r' +Mininum +incoming +TTL +(?P<incoming_ttl>(\d+)),'
+                                    r' +Outgoing +TTL +(?P<outgoing_ttl>(\d+))$')
 
         # Local host: 10.64.4.4, Local port: 35281
-        p31 = re.compile(r'^Local +host: +(?P<local_host>(\S+)), +Local +port:'
-                          r' +(?P<local_port>(\d+))$')
+        p31 = regex_engine.compile(r'^Local +host: +(?P<local_host>(\S+)), +Local +port:'
+                                    r' +(?P<local_port>(\d+))$')
 
         # Foreign host: 10.16.2.2, Foreign port: 179
-        p32 = re.compile(r'^Foreign +host: +(?P<foreign_host>(\S+)), +Foreign'
-                          r' +port: +(?P<foreign_port>(\d+))$')
+        p32 = regex_engine.compile(r'^Foreign +host: +(?P<foreign_host>(\S+)), +Foreign'
+                                    r' +port: +(?P<foreign_port>(\d+))$')
 
         # Connection tableid (VRF): 0
-        p33 = re.compile(r'^Connection +tableid +\(VRF\): +(?P<val>(\d+))$')
+        p33 = regex_engine.compile(r'^Connection +tableid +\(VRF\): +(?P<val>(\d+))$')
 
         # Maximum output segment queue size: 50
-        p34 = re.compile(r'^Maximum +output +segment +queue +size:'
-                          r' +(?P<size>(\d+))$')
+        p34 = regex_engine.compile(r'^Maximum +output +segment +queue +size:'
+                                    r' +(?P<size>(\d+))$')
 
         # Enqueued packets for retransmit: 0, input: 0  mis-ordered: 0 (0 bytes)
-        p35 = re.compile(r'^Enqueued +packets +for +retransmit:'
-                          r' +(?P<retransmit>(\d+)), +input: +(?P<input>(\d+))'
-                          r' +mis-ordered: +(?P<misordered>(\d+))'
-                          r' +\((?P<bytes>(\d+)) +bytes+\)$')
+        p35 = regex_engine.compile(r'^Enqueued +packets +for +retransmit:'
+                                    r' +(?P<retransmit>(\d+)), +input: +(?P<input>(\d+))'
+                                    r' +mis-ordered: +(?P<misordered>(\d+))'
+                                    r' +\((?P<bytes>(\d+)) +bytes+\)$')
 
         # Event Timers (current time is 0x530449):
-        p36 = re.compile(r'^Event +Timers +\(+current +time +is'
-                          r' +(?P<time>(\S+))+\):$')
+        p36 = regex_engine.compile(r'^Event +Timers +\(+current +time +is'
+                                    r' +(?P<time>(\S+))+\):$')
 
         # Timer          Starts    Wakeups            Next
         # Retrans            86          0             0x0
@@ -3048,156 +3052,156 @@ class ShowBgpNeighborSuperParser(MetaParser):
         # DeadWait            0          0             0x0
         # Linger              0          0             0x0
         # ProcessQ            0          0             0x0
-        p37 = re.compile(r'^(?P<item>(\S+)) +(?P<starts>(\d+))'
-                          r' +(?P<wakeups>(\d+)) +(?P<next>0x[0-9a-f]+)$')
+        p37 = regex_engine.compile(r'^(?P<item>(\S+)) +(?P<starts>(\d+))'
+                                    r' +(?P<wakeups>(\d+)) +(?P<next>0x[0-9a-f]+)$')
 
         # iss:   55023811  snduna:   55027115  sndnxt:   55027115
-        p38 = re.compile(r'^iss: +(?P<iss>(\d+)) +snduna: +(?P<snduna>(\d+))'
-                          r' +sndnxt: +(?P<sndnxt>(\d+))$')
+        p38 = regex_engine.compile(r'^iss: +(?P<iss>(\d+)) +snduna: +(?P<snduna>(\d+))'
+                                    r' +sndnxt: +(?P<sndnxt>(\d+))$')
 
         # irs:  109992783  rcvnxt:  109995158
-        p39 = re.compile(r'^irs: +(?P<irs>(\d+)) +rcvnxt: +(?P<rcvnxt>(\d+))$')
+        p39 = regex_engine.compile(r'^irs: +(?P<irs>(\d+)) +rcvnxt: +(?P<rcvnxt>(\d+))$')
 
 
         # sndwnd:  16616  scale:      0  maxrcvwnd:  16384
-        p40 = re.compile(r'^sndwnd: +(?P<sndwnd>(\d+)) +scale: +(?P<scale>(\d+))'
-                          r' +maxrcvwnd: +(?P<maxrcvwnd>(\d+))$')
+        p40 = regex_engine.compile(r'^sndwnd: +(?P<sndwnd>(\d+)) +scale: +(?P<scale>(\d+))'
+                                    r' +maxrcvwnd: +(?P<maxrcvwnd>(\d+))$')
 
         # rcvwnd:  16327  scale:      0  delrcvwnd:     57
-        p41 = re.compile(r'^rcvwnd: +(?P<rcvwnd>(\d+)) +scale: +(?P<scale>(\d+))'
-                          r' +delrcvwnd: +(?P<delrcvwnd>(\d+))$')
+        p41 = regex_engine.compile(r'^rcvwnd: +(?P<rcvwnd>(\d+)) +scale: +(?P<scale>(\d+))'
+                                    r' +delrcvwnd: +(?P<delrcvwnd>(\d+))$')
 
         # SRTT: 1000 ms, RTTO: 1003 ms, RTV: 3 ms, KRTT: 0 ms
-        p42 = re.compile(r'^SRTT: +(?P<srtt>(\d+)) +ms, +RTTO: +(?P<rtto>(\d+))'
-                          r' +ms, +RTV: +(?P<rtv>(\d+)) +ms, +KRTT:'
-                          r' +(?P<krtt>(\d+)) +ms$')
+        p42 = regex_engine.compile(r'^SRTT: +(?P<srtt>(\d+)) +ms, +RTTO: +(?P<rtto>(\d+))'
+                                    r' +ms, +RTV: +(?P<rtv>(\d+)) +ms, +KRTT:'
+                                    r' +(?P<krtt>(\d+)) +ms$')
 
         # minRTT: 4 ms, maxRTT: 1000 ms, ACK hold: 200 ms
-        p43 = re.compile(r'^minRTT: +(?P<min_rtt>(\d+)) +ms, +maxRTT:'
-                          r' +(?P<max_rtt>(\d+)) +ms, +ACK +hold:'
-                          r' +(?P<ack_hold>(\d+)) +ms$')
+        p43 = regex_engine.compile(r'^minRTT: +(?P<min_rtt>(\d+)) +ms, +maxRTT:'
+                                    r' +(?P<max_rtt>(\d+)) +ms, +ACK +hold:'
+                                    r' +(?P<ack_hold>(\d+)) +ms$')
 
 
         # uptime: 4236258 ms, Sent idletime: 4349 ms, Receive idletime: 4549 ms
-        p44 = re.compile(r'^uptime: +(?P<uptime>(\d+)) +ms, +Sent +idletime:'
-                          r' +(?P<sent>(\d+)) +ms, +Receive +idletime:'
-                          r' +(?P<receive>(\d+)) +ms$')
+        p44 = regex_engine.compile(r'^uptime: +(?P<uptime>(\d+)) +ms, +Sent +idletime:'
+                                    r' +(?P<sent>(\d+)) +ms, +Receive +idletime:'
+                                    r' +(?P<receive>(\d+)) +ms$')
 
         # Status Flags: active open
-        p45 = re.compile(r'^Status +Flags: +(?P<flags>(.*))$')
+        p45 = regex_engine.compile(r'^Status +Flags: +(?P<flags>(.*))$')
 
         # Option Flags: nagle, path mtu capable
-        p46 = re.compile(r'^Option +Flags: +(?P<flags>(.*))$')
+        p46 = regex_engine.compile(r'^Option +Flags: +(?P<flags>(.*))$')
 
         # IP Precedence value : 6
-        p47 = re.compile(r'^IP +Precedence +value : +(?P<value>(\d+))$')
+        p47 = regex_engine.compile(r'^IP +Precedence +value : +(?P<value>(\d+))$')
 
         # Datagrams (max data segment is 536 bytes):
-        p48 = re.compile(r'^Datagrams +\(max +data +segment +is'
-                          r' +(?P<bytes>(\d+)) +bytes\):$')
+        p48 = regex_engine.compile(r'^Datagrams +\(max +data +segment +is'
+                                    r' +(?P<bytes>(\d+)) +bytes\):$')
 
         # Rcvd: 164 (out of order: 0), with data: 80, total data bytes: 2374
-        p49 = re.compile(r'^Rcvd: +(?P<received>(\d+)) +\(out +of +order:'
-                          r' +(?P<out_of_order>(\d+))\), +with +data:'
-                          r' (?P<with_data>(\d+)), +total +data +bytes:'
-                          r' (?P<total_data>(\d+))$')
+        p49 = regex_engine.compile(r'^Rcvd: +(?P<received>(\d+)) +\(out +of +order:'
+                                    r' +(?P<out_of_order>(\d+))\), +with +data:'
+                                    r' (?P<with_data>(\d+)), +total +data +bytes:'
+                                    r' (?P<total_data>(\d+))$')
 
         # Sent: 166 (retransmit: 0, fastretransmit: 0, partialack: 0, Second Congestion: 0), with data: 87, total data bytes: 3303
-        p50 = re.compile(r'^Sent: (?P<sent>(\d+)) +\(retransmit:'
-                          r' +(?P<retransmit>(\d+)), +fastretransmit:'
-                          r' +(?P<fastretransmit>(\d+)), +partialack:'
-                          r' +(?P<partialack>(\d+)), +Second +Congestion:'
-                          r' +(?P<second_congestion>(\d+))\), +with +data:'
-                          r' (?P<sent_with_data>(\d+)), +total +data +bytes:'
-                          r' +(?P<sent_total_data>(\d+))$')
+        p50 = regex_engine.compile(r'^Sent: (?P<sent>(\d+)) +\(retransmit:'
+                                    r' +(?P<retransmit>(\d+)), +fastretransmit:'
+                                    r' +(?P<fastretransmit>(\d+)), +partialack:'
+                                    r' +(?P<partialack>(\d+)), +Second +Congestion:'
+                                    r' +(?P<second_congestion>(\d+))\), +with +data:'
+                                    r' (?P<sent_with_data>(\d+)), +total +data +bytes:'
+                                    r' +(?P<sent_total_data>(\d+))$')
 
 
         # Packets received in fast path: 0, fast processed: 0, slow path: 0
-        p51 = re.compile(r'^Packets +received +in +fast +path: +(?P<rcv>(\d+)),'
-                          r' +fast +processed: +(?P<processed>(\d+)),'
-                          r' +slow +path: +(?P<path>(\d+))$')
+        p51 = regex_engine.compile(r'^Packets +received +in +fast +path: +(?P<rcv>(\d+)),'
+                                    r' +fast +processed: +(?P<processed>(\d+)),'
+                                    r' +slow +path: +(?P<path>(\d+))$')
 
         # fast lock acquisition failures: 0, slow path: 0
-        p52 = re.compile(r'^fast +lock +acquisition +failures:'
-                          r' +(?P<failures>(\d+)), +slow +path: +(?P<path>(\d+))$')
+        p52 = regex_engine.compile(r'^fast +lock +acquisition +failures:'
+                                    r' +(?P<failures>(\d+)), +slow +path: +(?P<path>(\d+))$')
 
 
         # TCP Semaphore      0x1286E7EC  FREE
-        p53 = re.compile(r'^TCP +Semaphore +(?P<semaphore>0x[0-9a-fA-F]+)'
-                          r' +(?P<status>(\S+))$')
+        p53 = regex_engine.compile(r'^TCP +Semaphore +(?P<semaphore>0x[0-9a-fA-F]+)'
+                                    r' +(?P<status>(\S+))$')
 
         # BGP table version 9431, neighbor version 9431/0
-        p54 = re.compile(r'^BGP +table +version +(?P<bgp_table_version>(\d+)),'
-                          r' +neighbor +version +(?P<nbr_version>(\S+))$')
+        p54 = regex_engine.compile(r'^BGP +table +version +(?P<bgp_table_version>(\d+)),'
+                                    r' +neighbor +version +(?P<nbr_version>(\S+))$')
 
         # Output queue size : 0
-        p55 = re.compile(r'^Output +queue +size *: +(?P<size>(\d+))$')
+        p55 = regex_engine.compile(r'^Output +queue +size *: +(?P<size>(\d+))$')
 
         # Index 38, Advertise bit 1
-        p56 = re.compile(r'^Index +(?P<index>(\d+)), +Advertise +bit'
-                        r' +(?P<adv_bit>(\d+))$')
+        p56 = regex_engine.compile(r'^Index +(?P<index>(\d+)), +Advertise +bit'
+                                  r' +(?P<adv_bit>(\d+))$')
 
         # Route-Reflector Client
-        p57 = re.compile(r'^Route-Reflector +Client$')
+        p57 = regex_engine.compile(r'^Route-Reflector +Client$')
 
         # 38 update-group member
-        p58 = re.compile(r'^(?P<num>(\d+)) +update-group +member$')
+        p58 = regex_engine.compile(r'^(?P<num>(\d+)) +update-group +member$')
 
         # Community attribute sent to this neighbor
-        p59 = re.compile(r'^Community +attribute +sent +to +this +neighbor$')
+        p59 = regex_engine.compile(r'^Community +attribute +sent +to +this +neighbor$')
 
         # Extended-community attribute sent to this neighbor
-        p60 = re.compile(r'^Extended-community +attribute +sent +to +this'
-                        r' +neighbor$')
+        p60 = regex_engine.compile(r'^Extended-community +attribute +sent +to +this'
+                                  r' +neighbor$')
 
         # Suppress LDP signaling protocol
-        p61 = re.compile(r'^Suppress +LDP +signaling +protocol$')
+        p61 = regex_engine.compile(r'^Suppress +LDP +signaling +protocol$')
 
         # Slow-peer detection is disabled
-        p62 = re.compile(r'^Slow-peer +detection +is'
-                          r' +(?P<state>(enabled|disabled))$')
+        p62 = regex_engine.compile(r'^Slow-peer +detection +is'
+                                    r' +(?P<state>(enabled|disabled))$')
 
         # Slow-peer split-update-group dynamic is disabled
-        p63 = re.compile(r'^Slow-peer +split-update-group +dynamic +is'
-                          r' +(?P<state>(enabled|disabled))$')
+        p63 = regex_engine.compile(r'^Slow-peer +split-update-group +dynamic +is'
+                                    r' +(?P<state>(enabled|disabled))$')
 
         # Number of NLRIs in the update sent: max 199, min 0
-        p64 = re.compile(r'^Number +of +NLRIs +in +the +update +sent: +max'
-                        r' +(?P<max>(\d+)), +min +(?P<min>(\d+))$')
+        p64 = regex_engine.compile(r'^Number +of +NLRIs +in +the +update +sent: +max'
+                                  r' +(?P<max>(\d+)), +min +(?P<min>(\d+))$')
 
         # Last detected as dynamic slow peer: never
-        p65 = re.compile(r'^Last +detected +as +dynamic +slow +peer:'
-                          r' +(?P<val>(\S+))$')
+        p65 = regex_engine.compile(r'^Last +detected +as +dynamic +slow +peer:'
+                                    r' +(?P<val>(\S+))$')
 
         # Dynamic slow peer recovered: never
-        p66 = re.compile(r'^Dynamic +slow +peer +recovered: +(?P<val>(\S+))$')
+        p66 = regex_engine.compile(r'^Dynamic +slow +peer +recovered: +(?P<val>(\S+))$')
 
         # Refresh Epoch: 3
-        p67 = re.compile(r'^Refresh +Epoch: +(?P<num>(\d+))$')
+        p67 = regex_engine.compile(r'^Refresh +Epoch: +(?P<num>(\d+))$')
 
         # Last Sent Refresh Start-of-rib: 02:41:38
         # Last Received Refresh Start-of-rib: 02:01:36
-        p68 = re.compile(r'^Last +(Sent|Received) +Refresh +Start-of-rib:'
-                          r' +(?P<val>(\S+))$')
+        p68 = regex_engine.compile(r'^Last +(Sent|Received) +Refresh +Start-of-rib:'
+                                    r' +(?P<val>(\S+))$')
 
         # Last Sent Refresh End-of-rib: 02:41:38
         # Last Received Refresh End-of-rib: 02:01:32
-        p69 = re.compile(r'^Last +(Sent|Received) +Refresh +End-of-rib:'
-                          r' +(?P<val>(\S+))$')
+        p69 = regex_engine.compile(r'^Last +(Sent|Received) +Refresh +End-of-rib:'
+                                    r' +(?P<val>(\S+))$')
 
         # Refresh-Out took 0 seconds
         # Refresh-In took 4 seconds
-        p70 = re.compile(r'^Refresh-(?P<type>(In|Out)) +took +(?P<val>(\d+))'
-                          r' +seconds$')
+        p70 = regex_engine.compile(r'^Refresh-(?P<type>(In|Out)) +took +(?P<val>(\d+))'
+                                    r' +seconds$')
 
         # SSO is disabled
-        p71 = re.compile(r'^SSO +is +(?P<state>(enabled|disabled))$')
+        p71 = regex_engine.compile(r'^SSO +is +(?P<state>(enabled|disabled))$')
 
         # No active TCP connection
-        p72 = re.compile(r'^No +active +TCP +connection$')
+        p72 = regex_engine.compile(r'^No +active +TCP +connection$')
 
         # Member of peer-group T2-ASN1.1 for session parameters
-        p73 = re.compile(r'^Member +of +peer-group +(?P<peer_group>(.*)) +for +session +parameters$')
+        p73 = regex_engine.compile(r'^Member +of +peer-group +(?P<peer_group>(.*)) +for +session +parameters$')
 
         for line in output.splitlines():
 
@@ -4279,50 +4283,50 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
 
     def cli(self, neighbor, address_family='', vrf='', output=None):
 
-        p1 = re.compile(r'^\s*For +address +family:'
-                            r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)?(?=[\d|\[])'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
-                            r'(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
-                            r'[\.][0-9]+[\/]?[0-9]*)|([a-zA-Z0-9]+[\:]'
-                            r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                            r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r' +(?P<next_hop>(([0-9]+[\.][0-9]+[\.][0-9]'
-                            r'+[\.][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
-                            r'[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            r'[a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])|'
-                            r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
-                            r'[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])))?'
-                            r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\.]+))?'
-                            r' +(?P<origin_codes>(i|e|\?|\|))$')
-
-        p4 = re.compile(r'^\s*Route +Distinguisher *: '
-                            r'+(?P<route_distinguisher>(\S+))'
-                            r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                            r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p1 = regex_engine.compile(r'^\s*For +address +family:'
+                                      r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+
+        p3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)?(?=[\d|\[])'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                      r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+
+        p3_2 = regex_engine.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
+                                      r'(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
+                                      r'[\.][0-9]+[\/]?[0-9]*)|([a-zA-Z0-9]+[\:]'
+                                      r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                      r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+                                      r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                      r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
+                                      r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                      r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+
+        p3_3 = regex_engine.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r' +(?P<next_hop>(([0-9]+[\.][0-9]+[\.][0-9]'
+                                      r'+[\.][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
+                                      r'[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                      r'[a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])|'
+                                      r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
+                                      r'[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])))?'
+                                      r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\.]+))?'
+                                      r' +(?P<origin_codes>(i|e|\?|\|))$')
+
+        p4 = regex_engine.compile(r'^\s*Route +Distinguisher *: '
+                                      r'+(?P<route_distinguisher>(\S+))'
+                                      r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+                                      r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         if not vrf:
             vrf = 'default'
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
         out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
-        bgp_neighbor_re = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
-                            r'(, +vrf +(?P<vrf>\S+))?, +remote AS '
-                            r'+(?P<remote_as_id>[0-9]+), '
-                            r'+(?P<internal_external_link>[a-z\s]+)$')
+        bgp_neighbor_re = regex_engine.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
+                                      r'(, +vrf +(?P<vrf>\S+))?, +remote AS '
+                                      r'+(?P<remote_as_id>[0-9]+), '
+                                      r'+(?P<internal_external_link>[a-z\s]+)$')
         for line in out_vrf.splitlines():
             line = line.strip()
             # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
@@ -4350,9 +4354,9 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         # For address family: IPv4 Unicast
 
         # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                         r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                         r' +ID +is +(?P<local_router_id>(\S+))$')
+        p2 = regex_engine.compile(r'^\s*BGP +table +version +is'
+                                   r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                   r' +ID +is +(?P<local_router_id>(\S+))$')
 
         # Status: s-suppressed, x-deleted, S-stale, d-dampened, h-history, *-valid, >-best
         # Path type: i-internal, e-external, c-confed, l-local, a-aggregate, r-redist, I-injected
@@ -4374,7 +4378,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         # r>i 0.0.0.0          10.250.6.1               0    300      0 65000 i
         # r>i 0.0.0.0          10.250.6.1               0    300      0 65000.1 i
         # r>i 0.0.0.0          10.250.6.1               0    300      0 65000.1 65000.1 i
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)'
+        p3_2 = regex_engine.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)'
             r'(?P<path_type>(i|e|c|l|a|r|I))?(\s+)?(?P<prefix>\S+) +(?P<next_hop>'
             r'[a-zA-Z0-9\.\:]+) +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\.]+) +'
             r'(?P<origin_codes>(i|e|\?|\&|\|))$')
@@ -4541,25 +4545,25 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
 
                     # Metric     LocPrf     Weight Path
                     #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                    m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                     r'(?P<space1>\s{4,10})'
-                                     r'(?P<localprf>[0-9]+)'
-                                     r'(?P<space2>\s{5,10})'
-                                     r'(?P<weight>[0-9]+)'
-                                     r'(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
+                    m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                               r'(?P<space1>\s{4,10})'
+                                               r'(?P<localprf>[0-9]+)'
+                                               r'(?P<space2>\s{5,10})'
+                                               r'(?P<weight>[0-9]+)'
+                                               r'(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
 
                     #    100        ---          0 10 20 30 40 50 60 70 80 90
                     #    ---        100          0 10 20 30 40 50 60 70 80 90
                     #    100        ---      32788 ---
                     #    ---        100      32788 ---
-                    m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                     r'(?P<space>\s{2,21})'
-                                     r'(?P<weight>[0-9]+)'
-                                     r'(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
+                    m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                               r'(?P<space>\s{2,21})'
+                                               r'(?P<weight>[0-9]+)'
+                                               r'(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
 
                     #    ---        ---      32788 200 33299 51178 47751 {27016}
-                    m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                     r' +(?P<path>[0-9\{\}\s\.]+)$').match(numbers)
+                    m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                               r' +(?P<path>[0-9\{\}\s\.]+)$').match(numbers)
 
                     if m1:
                         af_dict['advertised'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -4630,25 +4634,25 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{4,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{4,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 ---
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s\.]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s\.]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s\.]+)$').match(numbers)
 
                 if m1:
                     af_dict['advertised'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -4874,37 +4878,37 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
     '''
 
     def cli(self, neighbor, address_family='', output=None):
-        p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
-                        r'(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
-                        r'+(?P<remote_as_id>[0-9]+), '
-                        r'+(?P<internal_external_link>[a-z\s]+)$')
-        p1 = re.compile(r'^\s*For +address +family:'
-                            r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                            r' +ID +is +(?P<local_router_id>(\S+))$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                        r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
-                            r'(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
-                            r'[\.][0-9]+([\/][0-9]+)?)|([a-zA-Z0-9]+[\:]'
-                            r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                            r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_3 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            r' +(?P<origin_codes>(i|e|\?|\|))$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *: '
-                            r'+(?P<route_distinguisher>(\S+))'
-                            r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                            r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p = regex_engine.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
+                                  r'(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
+                                  r'+(?P<remote_as_id>[0-9]+), '
+                                  r'+(?P<internal_external_link>[a-z\s]+)$')
+        p1 = regex_engine.compile(r'^\s*For +address +family:'
+                                      r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p2 = regex_engine.compile(r'^\s*BGP +table +version +is'
+                                      r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                      r' +ID +is +(?P<local_router_id>(\S+))$')
+        p3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                  r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_2 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
+                                      r'(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
+                                      r'[\.][0-9]+([\/][0-9]+)?)|([a-zA-Z0-9]+[\:]'
+                                      r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                      r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+                                      r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                      r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
+                                      r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                      r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_3 = regex_engine.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                      r' +(?P<origin_codes>(i|e|\?|\|))$')
+        p4 = regex_engine.compile(r'^\s*Route +Distinguisher *: '
+                                      r'+(?P<route_distinguisher>(\S+))'
+                                      r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+                                      r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
         out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
@@ -5078,25 +5082,25 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
 
                     # Metric     LocPrf     Weight Path
                     #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                    m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                     r'(?P<space1>\s{5,10})'
-                                     r'(?P<localprf>[0-9]+)'
-                                     r'(?P<space2>\s{5,10})'
-                                     r'(?P<weight>[0-9]+)'
-                                     r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                    m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                               r'(?P<space1>\s{5,10})'
+                                               r'(?P<localprf>[0-9]+)'
+                                               r'(?P<space2>\s{5,10})'
+                                               r'(?P<weight>[0-9]+)'
+                                               r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                     #    100        ---          0 10 20 30 40 50 60 70 80 90
                     #    ---        100          0 10 20 30 40 50 60 70 80 90
                     #    100        ---      32788 ---
                     #    ---        100      32788 ---
-                    m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                     r'(?P<space>\s{2,21})'
-                                     r'(?P<weight>[0-9]+)'
-                                     r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                    m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                               r'(?P<space>\s{2,21})'
+                                               r'(?P<weight>[0-9]+)'
+                                               r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                     #    ---        ---      32788 200 33299 51178 47751 {27016}
-                    m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                     r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                    m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                               r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                     if m1:
                         af_dict['received_routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5160,25 +5164,25 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{5,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{5,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 ---
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['received_routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5416,10 +5420,10 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
             # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
             out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
             vrf='default'
-            p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
-                            r'(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
-                            r'+(?P<remote_as_id>[0-9]+), '
-                            r'+(?P<internal_external_link>[a-z\s]+)$')
+            p = regex_engine.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
+                                      r'(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
+                                      r'+(?P<remote_as_id>[0-9]+), '
+                                      r'+(?P<internal_external_link>[a-z\s]+)$')
             for line in out_vrf.splitlines():
                 line = line.strip()
                 # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
@@ -5443,35 +5447,35 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
             original_address_family = address_family
 
         # For address family: IPv4 Unicast
-        p1 = re.compile(r'^\s*For +address +family:'
-                         r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p1 = regex_engine.compile(r'^\s*For +address +family:'
+                                   r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
 
         # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                         r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                         r' +ID +is +(?P<local_router_id>(\S+))$')
+        p2 = regex_engine.compile(r'^\s*BGP +table +version +is'
+                                   r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                   r' +ID +is +(?P<local_router_id>(\S+))$')
 
         # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
         # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
         # *>i  2001:db8:400::/64          ::FFFF:192.168.51.1
         # r>i  2001:2:2:2::2/128
-        p3 = re.compile(r'^\s*(?P<status_codes>(b|s|x|S|d|h|r|\*|\>|\s)+)?'
-                         r'(?P<path_type>(i|e|c|l|a|r|I))? *'
-                         r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                         r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3 = regex_engine.compile(r'^\s*(?P<status_codes>(b|s|x|S|d|h|r|\*|\>|\s)+)?'
+                                   r'(?P<path_type>(i|e|c|l|a|r|I))? *'
+                                   r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                   r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
 
         # 4444        100          0 i
-        p4 = re.compile(r'^(?P<metric>(\d+)) +(?P<locprf>(\d+))'
-                         r' +(?P<weight>(\d+)) +(?P<origin_codes>(i|e|\?|\|))$')
+        p4 = regex_engine.compile(r'^(?P<metric>(\d+)) +(?P<locprf>(\d+))'
+                                   r' +(?P<weight>(\d+)) +(?P<origin_codes>(i|e|\?|\|))$')
 
         #                     0.0.0.0               100     32768 i
         #                     10.106.101.1            4444    100 0 3 10 20 30 40 50 60 70 80 90 i
         # *>i                 10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
-        p5 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                         r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                         r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                         r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))? +'
-                         r'(?P<origin_codes>(i|e|\?|\|))$')
+        p5 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                   r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                   r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))? +'
+                                   r'(?P<origin_codes>(i|e|\?|\|))$')
 
         # Network            Next Hop            Metric     LocPrf     Weight Path
         # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
@@ -5483,28 +5487,28 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
         # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
         # Condition placed to handle the situation of a long line that is
         # divided nto two lines while actually it is not another index.
-        p6 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|r|h|\*|\>|\s)+)'
-                         r'(?P<path_type>(i|e|c|l|a|r|I))? *'
-                         r'(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
-                         r'[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                         r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                         r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                         r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                         r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                         r'([a-zA-Z0-9\.\:]+)))'
-                         r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                         r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                         r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p6 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|r|h|\*|\>|\s)+)'
+                                   r'(?P<path_type>(i|e|c|l|a|r|I))? *'
+                                   r'(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
+                                   r'[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+                                   r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                   r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+                                   r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                                   r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+                                   r'([a-zA-Z0-9\.\:]+)))'
+                                   r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                   r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                   r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
 
         # Route Distinguisher: 200:1
         # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-        p7 = re.compile(r'^\s*Route +Distinguisher *: '
-                         r'+(?P<route_distinguisher>(\S+))'
-                         r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                         r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p7 = regex_engine.compile(r'^\s*Route +Distinguisher *: '
+                                   r'+(?P<route_distinguisher>(\S+))'
+                                   r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+                                   r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         # Total number of prefixes 32
-        p8 = re.compile(r'^Total number of prefixes (?P<total_num_of_prefixes>\d+)$')
+        p8 = regex_engine.compile(r'^Total number of prefixes (?P<total_num_of_prefixes>\d+)$')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -5642,25 +5646,25 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{4,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{4,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 ---
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5738,25 +5742,25 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{4,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{4,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 ---
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -5961,19 +5965,19 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
         cmd_vrfs = r'show vrf detail | inc \(VRF'
         out_vrf = self.device.execute(cmd_vrfs)
         vrf_dict = {'0':'default'}
-        p = re.compile(r'^\s*VRF +(?P<vrf_name>[0-9a-zA-Z]+)'
-                        r' +\(+VRF +Id += +(?P<vrf_id>[0-9]+)+\)+;'
-                        r' +default +(?P<other_data>.+)$')
-        p1 = re.compile(r'^\s*Global +cluster-id: +(?P<cluster_id>[0-9\.]+)'
-                        r' +\(+configured: +(?P<configured>[0-9\.]+)+\)$')
-        p3 = re.compile(r'^\s*all +\(+inter-cluster +and +intra-cluster+\):'
-                        r' +(?P<all_configured>[a-zA-Z]+)$')
-        p4 = re.compile(r'^\s*intra-cluster:\s+(?P<intra_cluster_configured>[a-zA-Z]+)'
-                        r' +(?P<intra_cluster_used>[a-zA-Z]+)$')
-        p5 = re.compile(r'^\s*(?P<cluster_ids>[0-9\.]+)'
-                    r' +(?P<num_neighbors>[0-9]+)'
-                    r' +(?P<client_to_client_ref_configured>[a-zA-Z]+)'
-                    r' +(?P<client_to_client_ref_used>[a-zA-Z]+)$')
+        p = regex_engine.compile(r'^\s*VRF +(?P<vrf_name>[0-9a-zA-Z]+)'
+                                  r' +\(+VRF +Id += +(?P<vrf_id>[0-9]+)+\)+;'
+                                  r' +default +(?P<other_data>.+)$')
+        p1 = regex_engine.compile(r'^\s*Global +cluster-id: +(?P<cluster_id>[0-9\.]+)'
+                                  r' +\(+configured: +(?P<configured>[0-9\.]+)+\)$')
+        p3 = regex_engine.compile(r'^\s*all +\(+inter-cluster +and +intra-cluster+\):'
+                                  r' +(?P<all_configured>[a-zA-Z]+)$')
+        p4 = regex_engine.compile(r'^\s*intra-cluster:\s+(?P<intra_cluster_configured>[a-zA-Z]+)'
+                                  r' +(?P<intra_cluster_used>[a-zA-Z]+)$')
+        p5 = regex_engine.compile(r'^\s*(?P<cluster_ids>[0-9\.]+)'
+                              r' +(?P<num_neighbors>[0-9]+)'
+                              r' +(?P<client_to_client_ref_configured>[a-zA-Z]+)'
+                              r' +(?P<client_to_client_ref_used>[a-zA-Z]+)$')
 
         for line in out_vrf.splitlines():
             if not line:
@@ -6125,13 +6129,13 @@ class ShowBgpAllNeighborsPolicy(ShowBgpAllNeighborsPolicySchema):
 
         # Neighbor: 10.4.6.6, Address-Family: VPNv4 Unicast (VRF1)
         # Neighbor: 10.251.15.5, Address-Family: VPNv4 Unicast (LABDR_HoC_AZS_Transit)
-        p1 = re.compile(r'^\s*Neighbor: +(?P<neighbor>[\S]+),'
-                        r' +Address-Family: +(?P<address_family>[\w\s\-\_]+)'
-                        r'( +\((?P<vrf>[\S]+)\))?$')
+        p1 = regex_engine.compile(r'^\s*Neighbor: +(?P<neighbor>[\S]+),'
+                                  r' +Address-Family: +(?P<address_family>[\w\s\-\_]+)'
+                                  r'( +\((?P<vrf>[\S]+)\))?$')
 
         # route-map test in
-        p2 = re.compile(r'^\s*route-map +(?P<route_map_name>\S+)'
-                            r' +(?P<route_map_direction>[a-zA-Z]+)$')
+        p2 = regex_engine.compile(r'^\s*route-map +(?P<route_map_name>\S+)'
+                                      r' +(?P<route_map_direction>[a-zA-Z]+)$')
 
         # Init dictionary
         policy_dict = {}
@@ -6227,68 +6231,68 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
             output = self.device.execute(self.cli_command.format(evi_id=evi_id, route_type=route_type))
 
         # BGP routing table entry for [3][172.11.1.22:99][0][32][172.11.1.1]/17, version 264
-        p1 = re.compile(r"^BGP\s+routing\s+table\s+entry\s+for\s+\[+\d+\]+\[+(?P<bgp_routing_table>(\d{1,3}\.){3}\d{1,3}\:\d+)+\]+\S+\s+version+\s(?P<version>\S+)$")
+        p1 = regex_engine.compile(r"^BGP\s+routing\s+table\s+entry\s+for\s+\[+\d+\]+\[+(?P<bgp_routing_table>(\d{1,3}\.){3}\d{1,3}\:\d+)+\]+\S+\s+version+\s(?P<version>\S+)$")
 
         # Paths: (1 available, best #1, table evi_99)
-        p2 = re.compile(r"^Paths:\s+\(1\s+available,\s+best\s+#1,\s+table\s+(?P<evi_num>\S+)\)$")
+        p2 = regex_engine.compile(r"^Paths:\s+\(1\s+available,\s+best\s+#1,\s+table\s+(?P<evi_num>\S+)\)$")
 
         # Not advertised to any peer
-        p3_1 = re.compile(r"^(?P<advertise>\S+\s+\S+)\s+to\s+any\s+peer$")
+        p3_1 = regex_engine.compile(r"^(?P<advertise>\S+\s+\S+)\s+to\s+any\s+peer$")
 
         # Advertised to update-groups:
-        p3_2 = re.compile(r"^(?P<advertise>\S+)\s+to\s+update-+groups:$")
+        p3_2 = regex_engine.compile(r"^(?P<advertise>\S+)\s+to\s+update-+groups:$")
 
         # Refresh Epoch 1
-        p4 = re.compile(r"^Refresh\s+(?P<refresh>\S+\s+\d+)$")
+        p4 = regex_engine.compile(r"^Refresh\s+(?P<refresh>\S+\s+\d+)$")
 
         # Local, imported path from [3][172.11.1.2:99][0][32][172.11.1.2]/17 (global)
-        p5 = re.compile(r"^Local,+\s+imported\s+path\s+from\s+(?P<import_path>\S+)+\s+\(+global\)$")
+        p5 = regex_engine.compile(r"^Local,+\s+imported\s+path\s+from\s+(?P<import_path>\S+)+\s+\(+global\)$")
 
         # 172.11.1.2 (metric 30) (via default) from 172.11.1.11 (172.11.1.11)
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^(?P<vtep_loopback>\S+)\s+\(+metric\s+\d+\)+\s+\(via\s+default+\)+\s+from+\s+(?P<dist_loopback>\S+)\s+\S+$")
 
         # 0.0.0.0 (via default) from 0.0.0.0 (172.11.1.22)
-        p6_1 = re.compile(r"^(?P<vtep_loopback>(\d{1,3}\.){3}\d{1,3})+\s+\(+via\s+default\)+\s+from\s+(?P<dist_loopback>(\d{1,3}\.){3}\d{1,3})\s+\S+$")
+        p6_1 = regex_engine.compile(r"^(?P<vtep_loopback>(\d{1,3}\.){3}\d{1,3})+\s+\(+via\s+default\)+\s+from\s+(?P<dist_loopback>(\d{1,3}\.){3}\d{1,3})\s+\S+$")
 
         #      Origin incomplete, metric 0, localpref 100, valid, internal, best
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Origin\s+(?P<origin>\w+),\s+metric\s+(?P<metric>\d+),\s+localpref\s+(?P<local_pref>\d+),\s+valid,\s+internal,\s+best$")
 
         # Community: 999:999
-        p7_1 = re.compile(r"^Community:\s+(?P<community>\S+)$")
+        p7_1 = regex_engine.compile(r"^Community:\s+(?P<community>\S+)$")
 
         #      Extended Community: RT:9999:99 ENCAP:8
-        p8 = re.compile(r"^Extended\s+Community:\s+(?P<extended_community>\S+)\s+ENCAP:(?P<encap>\d+)$")
+        p8 = regex_engine.compile(r"^Extended\s+Community:\s+(?P<extended_community>\S+)\s+ENCAP:(?P<encap>\d+)$")
 
         #      Originator: 172.11.2.1, Cluster list: 172.11.1.11
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^Originator:\s+(?P<originator>(\d{1,3}\.){3}\d{1,3}),\s+Cluster\s+list:\s+(?P<cluster_list>(\d{1,3}\.){3}\d{1,3})$")
 
         #      PMSI Attribute: Flags:0x0, Tunnel type:IR, length 4, vni:200199, tunnel identifier: < Tunnel Endpoint: 172.11.1.1 >
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"PMSI\s+Attribute:\s+Flags:(?P<pmsi_flags>\S+),\s+Tunnel\s+type:+(?P<tunnel_type>\w+),\s+length\s+(?P<length>\d+),\s+vni:+(?P<vni_id>\d+),\s+tunnel\s+identifier:\s+(?P<tunnel_id>.*)$")
 
         # Local irb vxlan vtep:
-        p11 = re.compile(r"^Local\s+irb\s+(?P<vxlan_vtep>\w+\s+\w+)$")
+        p11 = regex_engine.compile(r"^Local\s+irb\s+(?P<vxlan_vtep>\w+\s+\w+)$")
 
         #        vrf:not found, l3-vni:0
-        p12 = re.compile(r"^vrf:+(?P<vrf>\w+\s+\w+),\s+l3-vni:+(?P<l3_vni>\d+)$")
+        p12 = regex_engine.compile(r"^vrf:+(?P<vrf>\w+\s+\w+),\s+l3-vni:+(?P<l3_vni>\d+)$")
 
         #        local router mac:0000.0000.0000
-        p13 = re.compile(r"^local\s+router\s+mac:+(?P<local_router_mac>\S+)$")
+        p13 = regex_engine.compile(r"^local\s+router\s+mac:+(?P<local_router_mac>\S+)$")
 
         #        core-irb interface:(not found)
-        p14 = re.compile(r"^core-irb\s+interface:+(?P<core_irb_intf>\S+\s+\S+)$")
+        p14 = regex_engine.compile(r"^core-irb\s+interface:+(?P<core_irb_intf>\S+\s+\S+)$")
 
         #        vtep-ip:172.11.1.22
-        p15 = re.compile(r"^vtep-ip:+(?P<vtep_ip>\S+)$")
+        p15 = regex_engine.compile(r"^vtep-ip:+(?P<vtep_ip>\S+)$")
 
         #      rx pathid: 0, tx pathid: 0x0
-        p16 = re.compile(r"^rx\s+pathid:\s+(?P<rx_path_id>\S+),\s+tx\s+pathid:\s+(?P<tx_path_id>\S+)$")
+        p16 = regex_engine.compile(r"^rx\s+pathid:\s+(?P<rx_path_id>\S+),\s+tx\s+pathid:\s+(?P<tx_path_id>\S+)$")
 
         #      Updated on Jan 22 2023 07:59:46 UTC
-        p17 = re.compile(r"^Updated\s+on\s+(?P<date_time>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+        p17 = regex_engine.compile(r"^Updated\s+on\s+(?P<date_time>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
 
         ret_dict = {}
 
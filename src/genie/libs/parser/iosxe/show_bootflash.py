@@ -6,13 +6,13 @@ IOSXE parsers for the following show commands:
 
 # Python
 
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =================
@@ -50,9 +50,9 @@ class ShowBootflash(ShowBootflashSchema):
             out = output
 
         # 13755338752 bytes available (489017344 bytes used)
-        p1 = re.compile(r"(?P<bytes_available>\d+)\s+bytes available\s+\((?P<bytes_used>\d+)\s+bytes used\)")
+        p1 = regex_engine.compile(r"(?P<bytes_available>\d+)\s+bytes available\s+\((?P<bytes_used>\d+)\s+bytes used\)")
         #12         11 Oct 12 2020 07:27:04 +00:00 /bootflash/tracelogs/timestamp
-        p2 = re.compile(r"(?P<file_index>\d+)\s+(?P<file_length>\d+)\s+(?P<file_date>[a-zA-Z]+\s+\d+\s+\d+\s+[0-9:.]+\s+[0-9+:]+)\s+(?P<file_name>\S+)")
+        p2 = regex_engine.compile(r"(?P<file_index>\d+)\s+(?P<file_length>\d+)\s+(?P<file_date>[a-zA-Z]+\s+\d+\s+\d+\s+[0-9:.]+\s+[0-9+:]+)\s+(?P<file_name>\S+)")
 
         # initial variables
         ret_dict = {}
@@ -113,34 +113,34 @@ class ShowBootSystem(ShowBootSystemSchema):
 
         # BOOT variable = flash:packages.conf; 
         # Regexp has been updated to take care when boot variable is not set 
-        p1 = re.compile(r'(^BOOT variable ((\=\s+(?P<boot>\S+))|(does not exist))$)')
+        p1 = regex_engine.compile(r'(^BOOT variable ((\=\s+(?P<boot>\S+))|(does not exist))$)')
         
         # MANUAL_BOOT variable = no
-        p2 = re.compile(r'^MANUAL_BOOT variable\s+\=\s+(?P<manual>yes|no)$')
+        p2 = regex_engine.compile(r'^MANUAL_BOOT variable\s+\=\s+(?P<manual>yes|no)$')
 
         # Manual Boot = no
-        p2_1 = re.compile(r'^Manual\sBoot\s+\=\s+(?P<manual>yes|no)$')
+        p2_1 = regex_engine.compile(r'^Manual\sBoot\s+\=\s+(?P<manual>yes|no)$')
 
         # BAUD variable = 9600
-        p3 = re.compile(r'^BAUD variable\s+\=\s+(?P<baud>\d+)$')
+        p3 = regex_engine.compile(r'^BAUD variable\s+\=\s+(?P<baud>\d+)$')
 
         # IPXE_TIMEOUT variable = 0
-        p4 = re.compile(r'^IPXE_TIMEOUT variable\s+\=\s+(?P<ipxe>\d+)$')
+        p4 = regex_engine.compile(r'^IPXE_TIMEOUT variable\s+\=\s+(?P<ipxe>\d+)$')
 
         # iPXE Timeout = 0
-        p4_1 = re.compile(r'^iPXE\sTimeout\s+\=\s+(?P<ipxe>\d+)$')
+        p4_1 = regex_engine.compile(r'^iPXE\sTimeout\s+\=\s+(?P<ipxe>\d+)$')
 
         # BOOTMODE variable = yes
-        p5 = re.compile(r'^BOOTMODE variable\s+\=\s+(?P<boot_mode>yes|no)$')
+        p5 = regex_engine.compile(r'^BOOTMODE variable\s+\=\s+(?P<boot_mode>yes|no)$')
 
         # Boot Mode = DEVICE
-        p5_1 = re.compile(r'^Boot\sMode\s+\=\s+(?P<boot_mode>\S+)$')
+        p5_1 = regex_engine.compile(r'^Boot\sMode\s+\=\s+(?P<boot_mode>\S+)$')
 
         # Enable Break = yes
-        p6 = re.compile(r'^Enable Break\s+\=\s+(?P<enable>yes|no)$')
+        p6 = regex_engine.compile(r'^Enable Break\s+\=\s+(?P<enable>yes|no)$')
 
         # Config file         = flash:/config.text
-        p7 = re.compile(r'^Config file\s+\=\s+(?P<config>\S+)$')
+        p7 = regex_engine.compile(r'^Config file\s+\=\s+(?P<config>\S+)$')
         
         for line in output.splitlines():
             line=line.strip()
@@ -253,9 +253,9 @@ class ShowUSB(ShowUSBSchema):
             output = self.device.execute(self.cli_command)
 
         # 13755338752 bytes available (489017344 bytes used)
-        p1 = re.compile(r"(?P<bytes_available>\d+)\s+bytes available\s+\((?P<bytes_used>\d+)\s+bytes used\)")
+        p1 = regex_engine.compile(r"(?P<bytes_available>\d+)\s+bytes available\s+\((?P<bytes_used>\d+)\s+bytes used\)")
         #12         11 Oct 12 2020 07:27:04 +00:00 /vol/usb0/System Volume Information
-        p2 = re.compile(r"(?P<file_index>\d+)\s+(?P<file_length>\d+)\s+(?P<file_date>[a-zA-Z]+\s+\d+\s+\d+\s+[0-9:.]+\s+[0-9+:]+)\s+(?P<file_name>.*)")
+        p2 = regex_engine.compile(r"(?P<file_index>\d+)\s+(?P<file_length>\d+)\s+(?P<file_date>[a-zA-Z]+\s+\d+\s+\d+\s+[0-9:.]+\s+[0-9+:]+)\s+(?P<file_name>.*)")
 
         # initial variables
         ret_dict = {}
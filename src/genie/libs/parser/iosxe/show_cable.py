@@ -18,15 +18,13 @@ IOSXE parser for the following show command
     * show cable modem cable {cable_interface}
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, ListOf, \
         Optional, And, Default, Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =================================================
@@ -67,18 +65,18 @@ class ShowCableTdrInterface(ShowCableTdrIntSchema):
         tdr_dict = {}
 
         # TDR test last run on: January 09 16:19:29
-        p1 = re.compile(r'^TDR +test +last +run +on: +(?P<date>\w+ \d+) +(?P<time>\d+:\d+:\d+)$')
+        p1 = regex_engine.compile(r'^TDR +test +last +run +on: +(?P<date>\w+ \d+) +(?P<time>\d+:\d+:\d+)$')
 
         # Gi1/0/1   auto  Pair A     0    +/- 1  meters N/A         Open
-        p2 = re.compile(r'^(?P<interface>\w\w\d\/\d\/\d+)\s+(?P<speed>auto|100M|1000M|2500M)'
-                r'\s+Pair (?P<local_pair>A)     (?P<pair_length>\d+)\s+\+\/\- (?P<pair_tolerance>\d+)\s+meters '
-                r'(?P<pair_remote>N\/A|Pair A|Pair B|Pair C|Pair D)\s+(?P<pair_status>.*$)')
+        p2 = regex_engine.compile(r'^(?P<interface>\w\w\d\/\d\/\d+)\s+(?P<speed>auto|100M|1000M|2500M)'
+                          r'\s+Pair (?P<local_pair>A)     (?P<pair_length>\d+)\s+\+\/\- (?P<pair_tolerance>\d+)\s+meters '
+                          r'(?P<pair_remote>N\/A|Pair A|Pair B|Pair C|Pair D)\s+(?P<pair_status>.*$)')
 
         #                 Pair B     1    +/- 1  meters N/A         Open
         #                 Pair C     0    +/- 1  meters N/A         Open
         #                 Pair D     1    +/- 1  meters N/A         Open
-        p3 = re.compile(r'Pair +(?P<local_pair>B|C|D)\s+(?P<pair_length>\d+)\s+\+\/\- (?P<pair_tolerance>\d+)\s+meters'
-                r' +(?P<pair_remote>N\/A|Pair A|Pair B|Pair C|Pair D)\s+(?P<pair_status>.*$)')
+        p3 = regex_engine.compile(r'Pair +(?P<local_pair>B|C|D)\s+(?P<pair_length>\d+)\s+\+\/\- (?P<pair_tolerance>\d+)\s+meters'
+                          r' +(?P<pair_remote>N\/A|Pair A|Pair B|Pair C|Pair D)\s+(?P<pair_status>.*$)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -159,20 +157,20 @@ class ShowCableDiagnosticsTdrInt(ShowCableDiagnosticsTdrIntSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         # TDR test last run on: January 09 16:19:29
-        p1 = re.compile(r'^TDR +test +last +run +on: +(?P<date>\w+ \d+) +(?P<time>\d+:\d+:\d+)$')
+        p1 = regex_engine.compile(r'^TDR +test +last +run +on: +(?P<date>\w+ \d+) +(?P<time>\d+:\d+:\d+)$')
 
         # Gi1/0/1   auto  Pair A     0    +/- 1  meters N/A         Open
         # Gi2/7 0Mbps 1-2 46 +/-1m Unknown Open
         # Gi1/0/1     1000M Pair A     N/A                N/A         Not Completed
-        p2 = re.compile(r'^(?P<interface>[\w\/]+)\s+(?P<speed>\d+(auto|Mbps|M))((\s+)|(\s+\w+\s+))'
-                        r'(?P<local_pair>([\d\-]+)|A)\s+(?P<length>\d+|N/A)((\s+\+\/\-|\s)(?P<tolerance>\w+|))'
-                        r'\s+(?P<remote_pair>N/A|\w+)\s+(?P<status>.*$)')
+        p2 = regex_engine.compile(r'^(?P<interface>[\w\/]+)\s+(?P<speed>\d+(auto|Mbps|M))((\s+)|(\s+\w+\s+))'
+                                  r'(?P<local_pair>([\d\-]+)|A)\s+(?P<length>\d+|N/A)((\s+\+\/\-|\s)(?P<tolerance>\w+|))'
+                                  r'\s+(?P<remote_pair>N/A|\w+)\s+(?P<status>.*$)')
 
         #   Pair B     N/A                N/A         Not Completed      
         #   Pair C     N/A                N/A         Not Completed      
         #   Pair D     N/A                N/A         Not Completed 
         # 3-6 45 +/-1m Unknown Open 
-        p3 = re.compile(r'((\w+\s+)|)(?P<local_pair>((\w)|(\d\-\d)))\s+(?P<length>\d+|N/A)((\s+\+\/\-|\s)(?P<tolerance>\w+|))'
+        p3 = regex_engine.compile(r'((\w+\s+)|)(?P<local_pair>((\w)|(\d\-\d)))\s+(?P<length>\d+|N/A)((\s+\+\/\-|\s)(?P<tolerance>\w+|))'
             r'\s+(?P<remote_pair>N/A|\w+)\s+(?P<status>.*$)')
 
         # initial return dictionary
@@ -271,11 +269,11 @@ class ShowCableRpd(ShowCableRpdSchema):
         ret_dict = {}
 
         # 70b3.1791.4266  ---              Te1/1/0   online       Pri  Act N/A  LC9_RPD0_3x6_RACK4
-        p1 = re.compile(r'^(?P<rpd_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
-                        r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
-                        r'(?P<interface>Te\d(\/\d{1,2}){2})\s+'
-                        r'(?P<state>(\S)+)\s+(?P<role>(\S)+)\s+'
-                        r'(?P<ha>(\S)+)\s+(?P<auth>(\S)+)\s+(?P<name>(\S){1,80}$)')
+        p1 = regex_engine.compile(r'^(?P<rpd_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
+                                  r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+                                  r'(?P<interface>Te\d(\/\d{1,2}){2})\s+'
+                                  r'(?P<state>(\S)+)\s+(?P<role>(\S)+)\s+'
+                                  r'(?P<ha>(\S)+)\s+(?P<auth>(\S)+)\s+(?P<name>(\S){1,80}$)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -367,10 +365,10 @@ class ShowCableRpdIpv6(ShowCableRpdIpv6Schema):
         ret_dict = {}
 
         # 70b3.1791.4266  Te1/1/0   online       Pri  Act N/A  2002::C096:103
-        p1 = re.compile(r'^(?P<rpd_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
-                        r'(?P<interface>Te\d(\/\d{1,2}){2})\s+'
-                        r'(?P<state>(\S)+)\s+(?P<role>(\S)+)\s+'
-                        r'(?P<ha>(\S)+)\s+(?P<auth>(\S)+)\s+(?P<ipv6_address>-{3}|[a-fA-F\d\:]+$)')
+        p1 = regex_engine.compile(r'^(?P<rpd_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
+                                  r'(?P<interface>Te\d(\/\d{1,2}){2})\s+'
+                                  r'(?P<state>(\S)+)\s+(?P<role>(\S)+)\s+'
+                                  r'(?P<ha>(\S)+)\s+(?P<auth>(\S)+)\s+(?P<ipv6_address>-{3}|[a-fA-F\d\:]+$)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -448,71 +446,71 @@ class ShowCableRpdSpectrumCaptureCapabilities(ShowCableRpdSpectrumCaptureCapabil
         ret_dict = {}
 
         # RPD ID                         : 70b3.1791.423c
-        p1 = re.compile(r'^RPD\sID\s+:\s(?P<rpd_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}$)')
+        p1 = regex_engine.compile(r'^RPD\sID\s+:\s(?P<rpd_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}$)')
 
         # NumSacs                        : 1
-        p2 = re.compile(r'^NumSacs\s+:\s(?P<num_sac>\d+$)')
+        p2 = regex_engine.compile(r'^NumSacs\s+:\s(?P<num_sac>\d+$)')
 
         # SacIndex                       : 0
-        p3 = re.compile(r'^SacIndex\s+:\s(?P<sac_index>\d+$)')
+        p3 = regex_engine.compile(r'^SacIndex\s+:\s(?P<sac_index>\d+$)')
 
         # SacDescription                 : Wideband Spectrum Analysis Circuit, frequency range 0-204.8 MHz
-        p4 = re.compile(r'^SacDescription\s+:\s(?P<sac_description>.*$)')
+        p4 = regex_engine.compile(r'^SacDescription\s+:\s(?P<sac_description>.*$)')
 
         # MaxCaptureSpan                 : 409600000 Hz
-        p5 = re.compile(r'^MaxCaptureSpan\s+:\s(?P<max_capture_span_in_hz>\d+)\sHz$')
+        p5 = regex_engine.compile(r'^MaxCaptureSpan\s+:\s(?P<max_capture_span_in_hz>\d+)\sHz$')
 
         # MinimumCaptureFrequency        : 0 Hz
-        p6 = re.compile(r'^MinimumCaptureFrequency\s+:\s(?P<min_capture_freq_in_hz>\d+)\sHz$')
+        p6 = regex_engine.compile(r'^MinimumCaptureFrequency\s+:\s(?P<min_capture_freq_in_hz>\d+)\sHz$')
 
         # MaximumCaptureFrequency        : 409600000 Hz
-        p7 = re.compile(r'^MaximumCaptureFrequency\s+:\s(?P<max_capture_freq_in_hz>\d+)\sHz$')
+        p7 = regex_engine.compile(r'^MaximumCaptureFrequency\s+:\s(?P<max_capture_freq_in_hz>\d+)\sHz$')
 
         # SupportedTriggerModes          : |freeRunning|
-        p8 = re.compile(r'^SupportedTriggerModes\s+:\s(?P<supported_trigger_modes>\S+)$')
+        p8 = regex_engine.compile(r'^SupportedTriggerModes\s+:\s(?P<supported_trigger_modes>\S+)$')
 
         # SupportedOutputFormats         : |timeIQ|fftPower|fftIQ|fftAmplitude|
-        p9 = re.compile(r'^SupportedOutputFormats\s+:\s(?P<supported_output_formats>\S+)$')
+        p9 = regex_engine.compile(r'^SupportedOutputFormats\s+:\s(?P<supported_output_formats>\S+)$')
 
         # SupportedWindowFormats         : |hann|blackmanHarris|hamming|
-        p10 = re.compile(r'^SupportedWindowFormats\s+:\s(?P<supported_window_formats>\S+)$')
+        p10 = regex_engine.compile(r'^SupportedWindowFormats\s+:\s(?P<supported_window_formats>\S+)$')
 
         # SupportsAveraging              : Support
-        p11 = re.compile(r'^SupportsAveraging\s+:\s(?P<supports_averaging>(Not Support|Support)$)')
+        p11 = regex_engine.compile(r'^SupportsAveraging\s+:\s(?P<supports_averaging>(Not Support|Support)$)')
 
         # SupportedAggregationMethods    : None
-        p12 = re.compile(r'^SupportedAggregationMethods\s+:\s(?P<supported_aggregation_method>.*$)')
+        p12 = regex_engine.compile(r'^SupportedAggregationMethods\s+:\s(?P<supported_aggregation_method>.*$)')
 
         # SupportsSpectrumQualification  : Not Support
-        p13 = re.compile(r'^SupportsSpectrumQualification\s+:\s'
-                         r'(?P<supports_spectrum_qualification>(Not Support|Support)$)')
+        p13 = regex_engine.compile(r'^SupportsSpectrumQualification\s+:\s'
+                                   r'(?P<supports_spectrum_qualification>(Not Support|Support)$)')
 
         # MaxNumBins                     : 4096
-        p14 = re.compile(r'^MaxNumBins\s+:\s(?P<max_num_bins>\d+$)')
+        p14 = regex_engine.compile(r'^MaxNumBins\s+:\s(?P<max_num_bins>\d+$)')
 
         # MinNumBins                     : 256
-        p15 = re.compile(r'^MinNumBins\s+:\s(?P<min_num_bins>\d+$)')
+        p15 = regex_engine.compile(r'^MinNumBins\s+:\s(?P<min_num_bins>\d+$)')
 
         # MinRepeatPeriod                : 25000 us
-        p16 = re.compile(r'^MinRepeatPeriod\s+:\s(?P<min_repeat_period_in_us>\d+)\sus$')
+        p16 = regex_engine.compile(r'^MinRepeatPeriod\s+:\s(?P<min_repeat_period_in_us>\d+)\sus$')
 
         # SupportedTrigChanTypes         : |SC-QAM|OFDMA|
-        p17 = re.compile(r'^SupportedTrigChanTypes\s+:\s(?P<supported_trigger_channel_type>\S+)$')
+        p17 = regex_engine.compile(r'^SupportedTrigChanTypes\s+:\s(?P<supported_trigger_channel_type>\S+)$')
 
         # PwType                         : |PNM PW|
-        p18 = re.compile(r'^PwType\s+:\s(?P<pw_type>.*$)')
+        p18 = regex_engine.compile(r'^PwType\s+:\s(?P<pw_type>.*$)')
 
         # LowestCapturePort              : 0
-        p19 = re.compile(r'^LowestCapturePort\s+:\s(?P<lowest_capture_port>\d+$)')
+        p19 = regex_engine.compile(r'^LowestCapturePort\s+:\s(?P<lowest_capture_port>\d+$)')
 
         # HighestCapturePort             : 1
-        p20 = re.compile(r'^HighestCapturePort\s+:\s(?P<highest_capture_port>\d+$)')
+        p20 = regex_engine.compile(r'^HighestCapturePort\s+:\s(?P<highest_capture_port>\d+$)')
 
         # SupportsScanningCapture        : Not Support
-        p21 = re.compile(r'^SupportsScanningCapture\s+:\s(?P<supported_scanning_capture>(Not Support|Support)$)')
+        p21 = regex_engine.compile(r'^SupportsScanningCapture\s+:\s(?P<supported_scanning_capture>(Not Support|Support)$)')
 
         # MinScanningRepeatPeriod        : 0 ms
-        p22 = re.compile(r'^MinScanningRepeatPeriod\s+:\s(?P<min_scanning_repeat_period_in_ms>\d+)\sms$')
+        p22 = regex_engine.compile(r'^MinScanningRepeatPeriod\s+:\s(?P<min_scanning_repeat_period_in_ms>\d+)\sms$')
 
 
         for line in output.splitlines():
@@ -710,11 +708,11 @@ class ShowCableModem(ShowCableModemSchema):
         ret_dict = {}
 
         # 9058.515c.a3c0 101.115.1.18    C1/0/0/UB     w-online(pt)      1     10.00  416    0   N
-        p1 = re.compile(r'^(?P<cm_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
-                        r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
-                        r'(?P<interface>C\d(\/\d{1,2}){2}\/UB)\s+(?P<state>(\S)+)\s+'
-                        r'(?P<sid>(\d)+)\s+(?P<rx_power>(\S)+)\s+(?P<timing_offset>(\S)+)\s+'
-                        r'(?P<num_cpe>(\d){1,5})\s+(?P<dip>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<cm_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
+                                  r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+                                  r'(?P<interface>C\d(\/\d{1,2}){2}\/UB)\s+(?P<state>(\S)+)\s+'
+                                  r'(?P<sid>(\d)+)\s+(?P<rx_power>(\S)+)\s+(?P<timing_offset>(\S)+)\s+'
+                                  r'(?P<num_cpe>(\d){1,5})\s+(?P<dip>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -755,11 +753,11 @@ class ShowCableModemCable(ShowCableModemSchema):
         ret_dict = {}
 
         # 9058.515c.a3c0 101.115.1.18    C1/0/0/UB     w-online(pt)      1     10.00  416    0   N
-        p1 = re.compile(r'^(?P<cm_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
-                        r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
-                        r'(?P<interface>C\d(\/\d{1,2}){2}\/UB)\s+(?P<state>(\S)+)\s+'
-                        r'(?P<sid>(\d)+)\s+(?P<rx_power>(\S)+)\s+(?P<timing_offset>(\S)+)\s+'
-                        r'(?P<num_cpe>(\d){1,5})\s+(?P<dip>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<cm_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
+                                  r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+                                  r'(?P<interface>C\d(\/\d{1,2}){2}\/UB)\s+(?P<state>(\S)+)\s+'
+                                  r'(?P<sid>(\d)+)\s+(?P<rx_power>(\S)+)\s+(?P<timing_offset>(\S)+)\s+'
+                                  r'(?P<num_cpe>(\d){1,5})\s+(?P<dip>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -800,11 +798,11 @@ class ShowCableModemRpd(ShowCableModemSchema):
         ret_dict = {}
 
         # 9058.515c.a3c0 101.115.1.18    C1/0/0/UB     w-online(pt)      1     10.00  416    0   N CM
-        p1 = re.compile(r'^(?P<cm_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
-                        r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
-                        r'(?P<interface>C\d(\/\d{1,2}){2}\/UB)\s+(?P<state>(\S)+)\s+'
-                        r'(?P<sid>(\d)+)\s+(?P<rx_power>(\S)+)\s+(?P<timing_offset>(\S)+)\s+'
-                        r'(?P<num_cpe>(\d){1,5})\s+(?P<dip>\S+)\s+(?P<dev_class>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<cm_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
+                                  r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+                                  r'(?P<interface>C\d(\/\d{1,2}){2}\/UB)\s+(?P<state>(\S)+)\s+'
+                                  r'(?P<sid>(\d)+)\s+(?P<rx_power>(\S)+)\s+(?P<timing_offset>(\S)+)\s+'
+                                  r'(?P<num_cpe>(\d){1,5})\s+(?P<dip>\S+)\s+(?P<dev_class>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -846,11 +844,11 @@ class ShowCableModemRpdId(ShowCableModemSchema):
         ret_dict = {}
 
         # 9058.515c.a3c0 101.115.1.18    C1/0/0/UB     w-online(pt)      1     10.00  416    0   N CM
-        p1 = re.compile(r'^(?P<cm_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
-                        r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
-                        r'(?P<interface>C\d(\/\d{1,2}){2}\/UB)\s+(?P<state>(\S)+)\s+'
-                        r'(?P<sid>(\d)+)\s+(?P<rx_power>(\S)+)\s+(?P<timing_offset>(\S)+)\s+'
-                        r'(?P<num_cpe>(\d){1,5})\s+(?P<dip>\S+)\s+(?P<dev_class>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<cm_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
+                                  r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+                                  r'(?P<interface>C\d(\/\d{1,2}){2}\/UB)\s+(?P<state>(\S)+)\s+'
+                                  r'(?P<sid>(\d)+)\s+(?P<rx_power>(\S)+)\s+(?P<timing_offset>(\S)+)\s+'
+                                  r'(?P<num_cpe>(\d){1,5})\s+(?P<dip>\S+)\s+(?P<dev_class>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -892,11 +890,11 @@ class ShowCableModemRpdName(ShowCableModemSchema):
         ret_dict = {}
 
         # 9058.515c.a3c0 101.115.1.18    C1/0/0/UB     w-online(pt)      1     10.00  416    0   N CM
-        p1 = re.compile(r'^(?P<cm_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
-                        r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
-                        r'(?P<interface>C\d(\/\d{1,2}){2}\/UB)\s+(?P<state>(\S)+)\s+'
-                        r'(?P<sid>(\d)+)\s+(?P<rx_power>(\S)+)\s+(?P<timing_offset>(\S)+)\s+'
-                        r'(?P<num_cpe>(\d){1,5})\s+(?P<dip>\S+)\s+(?P<dev_class>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<cm_mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+'
+                                  r'(?P<ip_address>-{3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+                                  r'(?P<interface>C\d(\/\d{1,2}){2}\/UB)\s+(?P<state>(\S)+)\s+'
+                                  r'(?P<sid>(\d)+)\s+(?P<rx_power>(\S)+)\s+(?P<timing_offset>(\S)+)\s+'
+                                  r'(?P<num_cpe>(\d){1,5})\s+(?P<dip>\S+)\s+(?P<dev_class>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1,6 +1,7 @@
 import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -41,13 +42,13 @@ class ShowCallHomeVersion(ShowCallHomeVersionSchema):
 
         ret_dict = {}
         # Call-Home Version 3.0
-        p1 = re.compile(r'^Call-Home Version (?P<version>\S+)$')
+        p1 = regex_engine.compile(r'^Call-Home Version (?P<version>\S+)$')
 
         # call-home: UNKNOWN
-        p2 = re.compile(r'^call-home:\s(?P<comp_ver_call_home>\S+)$')
+        p2 = regex_engine.compile(r'^call-home:\s(?P<comp_ver_call_home>\S+)$')
 
         # eem-call-home: UNKNOWN
-        p3 = re.compile(r'^eem-call-home:\s(?P<comp_ver_eem_call_home>\S+)$')
+        p3 = regex_engine.compile(r'^eem-call-home:\s(?P<comp_ver_eem_call_home>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -119,13 +120,13 @@ class ShowCallHomeSmartLicensing(ShowCallHomeSmartLicensingSchema):
         ret_dict = {}
 
         # Smart-license messages: enabled
-        p1 = re.compile(r'^\s*Smart-license messages: (?P<msg>\S+)$')
+        p1 = regex_engine.compile(r'^\s*Smart-license messages: (?P<msg>\S+)$')
 
         # Profile: CiscoTAC-1 (status: ACTIVE)
-        p2 = re.compile(r'^\s*Profile: (?P<profile>[\w\S ]+) \(status: (?P<status>\S+)\)$')
+        p2 = regex_engine.compile(r'^\s*Profile: (?P<profile>[\w\S ]+) \(status: (?P<status>\S+)\)$')
 
         # Destination  URL(s):  https://tools.cisco.com/its/service/oddce/services/DDCEService
-        p3 = re.compile(r'^\s*Destination  URL\(s\):\s*(?P<url>\S+)$')
+        p3 = regex_engine.compile(r'^\s*Destination  URL\(s\):\s*(?P<url>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -218,41 +219,41 @@ class ShowCallHomeProfileAll(ShowCallHomeProfileAllSchema):
         ret_dict = {}
 
         # Profile Name: CiscoTAC-1
-        p1 = re.compile(r'^Profile Name: (?P<name>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^Profile Name: (?P<name>[\S\s]+)$')
 
         # Profile status: ACTIVE
-        p2 = re.compile(r'^Profile status: (?P<status>\S+)$')
+        p2 = regex_engine.compile(r'^Profile status: (?P<status>\S+)$')
 
         # Profile mode: Full Reporting
-        p3 = re.compile(r'^Profile mode: (?P<mode>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^Profile mode: (?P<mode>[\w\s]+)$')
 
         # Reporting Data: Smart Call Home, Smart Licensing
-        p4 = re.compile(r'^Reporting Data: (?P<reporting_data>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^Reporting Data: (?P<reporting_data>[\S\s]+)$')
 
         # Preferred Message Format: xml
-        p5 = re.compile(r'^Preferred Message Format: (?P<msg_format>[\w\s]+)$')
+        p5 = regex_engine.compile(r'^Preferred Message Format: (?P<msg_format>[\w\s]+)$')
 
         # Message Size Limit: 3145728 Bytes
-        p6 = re.compile(r'^Message Size Limit: (?P<size_limit>[\d]+) Bytes+$')
+        p6 = regex_engine.compile(r'^Message Size Limit: (?P<size_limit>[\d]+) Bytes+$')
 
         # Transport Method: http
-        p7 = re.compile(r'^Transport Method: (?P<method>.+)$')
+        p7 = regex_engine.compile(r'^Transport Method: (?P<method>.+)$')
 
         # HTTP  address: https://tools.cisco.com/its/service/oddce/services/DDCEService
-        p8 = re.compile(r'^HTTP  address: (?P<http_address>\S+)$')
+        p8 = regex_engine.compile(r'^HTTP  address: (?P<http_address>\S+)$')
 
         #Email address(es): shishir@cisco.com
-        p9 = re.compile(r'^Email address\(es\): (?P<email>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^Email address\(es\): (?P<email>[\S\s]+)$')
 
         #                Shisihir213@cisco.com
-        p10 = re.compile(r'^ *(?P<other_email>\S+\@\S+\.\S+)$')
+        p10 = regex_engine.compile(r'^ *(?P<other_email>\S+\@\S+\.\S+)$')
 
         # Other address(es): default
-        p11 = re.compile(r'^Other address\(es\): (?P<other_address>\S+)$')
+        p11 = regex_engine.compile(r'^Other address\(es\): (?P<other_address>\S+)$')
 
         # Periodic configuration info message is scheduled every 1 day of the month at 09:15
         # Periodic inventory info message is scheduled daily at 00:00
-        p12 = re.compile(r'^Periodic (?P<type>\S+) info message is scheduled (?P<frequency>[\w\s]+) at (?P<time>\S+)$')
+        p12 = regex_engine.compile(r'^Periodic (?P<type>\S+) info message is scheduled (?P<frequency>[\w\s]+) at (?P<time>\S+)$')
         
         # Alert-group               Severity
         # ------------------------  ------------
@@ -260,7 +261,7 @@ class ShowCallHomeProfileAll(ShowCallHomeProfileAllSchema):
         # diagnostic                minor       
         # environment               warning     
         # inventory                 normal      
-        p13 = re.compile(r'^(?P<group_pattern>(?!.*--)[\S]+) +(?P<severity>\S+) *$')
+        p13 = regex_engine.compile(r'^(?P<group_pattern>(?!.*--)[\S]+) +(?P<severity>\S+) *$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -396,9 +397,9 @@ class ShowCallHomeAlertGroup(ShowCallHomeAlertGroupSchema):
             # Execute command to get output from device  
             output = self.device.execute(self.cli_command)
         # Available alert groups:
-        p1 = re.compile(r'^Available alert groups:$')    
+        p1 = regex_engine.compile(r'^Available alert groups:$')    
         #     crash                    Enable  crash and traceback info          
-        p2 = re.compile(r'^(?P<Keyword>\w+) +(?P<State>\S+) +(?P<Description>(.*?))$')    
+        p2 = regex_engine.compile(r'^(?P<Keyword>\w+) +(?P<State>\S+) +(?P<Description>(.*?))$')    
         
         # initial variables
         ret_dict = {}
@@ -463,21 +464,21 @@ class ShowCallHomeDiagnosticSignature(ShowCallHomeDiagnosticSignatureSchema):
             # Execute command to get output from device  
             output = self.device.execute(self.cli_command)
         #  Diagnostic-signature: enabled                 
-        p1 = re.compile(r'^Diagnostic-signature: +(?P<Diagnostic_mode>\w+)$')
+        p1 = regex_engine.compile(r'^Diagnostic-signature: +(?P<Diagnostic_mode>\w+)$')
         # Profile: CiscoTAC-1 (status: INACTIVE)
-        p2 = re.compile(r'^(?P<profile>\S+): +(?P<name>\S+) +(?P<status>\S+): +(?P<type>(.*?)\))$')
+        p2 = regex_engine.compile(r'^(?P<profile>\S+): +(?P<name>\S+) +(?P<status>\S+): +(?P<type>(.*?)\))$')
         # Downloading  URL(s):  https://tools.cisco.com/its/service/oddce/services/DDCEService
-        p3 = re.compile(r'^(?P<Downloading>(\S+ +\S+)): +(?P<url>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<Downloading>(\S+ +\S+)): +(?P<url>\S+)$')
         # Environment variable:
         # if there is no value assign it to value "Not yet set up"
-        p4 = re.compile(r'^(?P<env>Environment variable):$')
+        p4 = regex_engine.compile(r'^(?P<env>Environment variable):$')
         # if there is a value assign it to that value
         # Environment variable: xxxx
-        p5 = re.compile(r'^(?P<env2>Environment variable): +(?P<var>\S+)$')
+        p5 = regex_engine.compile(r'^(?P<env2>Environment variable): +(?P<var>\S+)$')
         # Downloaded DSes:
-        p6 = re.compile(r'^(?P<DSes>Downloaded DSes):$')
+        p6 = regex_engine.compile(r'^(?P<DSes>Downloaded DSes):$')
         # xxxx    yyyyy      zzzzz      wwwww
-        p7 = re.compile(r'^(?P<id>\S+) +(?P<name>\S+) +(?P<status>\S+) + (?P<update>\S+)$')    
+        p7 = regex_engine.compile(r'^(?P<id>\S+) +(?P<name>\S+) +(?P<status>\S+) + (?P<update>\S+)$')    
 
         # initial variables
         ret_dict = {}
@@ -568,7 +569,7 @@ class ShowCallHomeEvents(ShowCallHomeEventsSchema):
             output = self.device.execute(self.cli_command)
         # CiscoTAC-1                      configuration  29    /31        normal        periodic            
         # CiscoTAC-1                      configuration  29    /31        normal        periodic            12:00:00
-        p1 = re.compile(r'^(?P<profile>\S+) +(?P<alert_group>\S+) +(?P<internal>\S+) +(?P<index>\S+) +(?P<severity>\S+) +(?P<subscription>\S+)( +(?P<time>\S+?))?$')
+        p1 = regex_engine.compile(r'^(?P<profile>\S+) +(?P<alert_group>\S+) +(?P<internal>\S+) +(?P<index>\S+) +(?P<severity>\S+) +(?P<subscription>\S+)( +(?P<time>\S+?))?$')
         ret_dict = {}
         counter = 0 #counter for events 
         for line in output[1:].splitlines():
@@ -683,89 +684,89 @@ class ShowCallHomeDetail(ShowCallHomeDetailSchema):
             # Execute command to get output from device  
             output = self.device.execute(self.cli_command)
         #   call home feature : enable
-        p1 = re.compile(r'^(?P<key>call home feature ): (?P<value>(.*?))$')
+        p1 = regex_engine.compile(r'^(?P<key>call home feature ): (?P<value>(.*?))$')
         #     call home message's from address: Not yet set up
-        p1_1 = re.compile(r'^(?P<key>call home message\'s from address): (?P<value>(.*?))$')
+        p1_1 = regex_engine.compile(r'^(?P<key>call home message\'s from address): (?P<value>(.*?))$')
         #     call home message's reply-to address: Not yet set up
-        p1_2 = re.compile(r'^(?P<key>call home message\'s reply-to address): (?P<value>(.*?))$')
+        p1_2 = regex_engine.compile(r'^(?P<key>call home message\'s reply-to address): (?P<value>(.*?))$')
         #     vrf for call-home messages: Not yet set up
-        p1_3 = re.compile(r'^(?P<key>vrf for call-home messages): (?P<value>(.*?))$')
+        p1_3 = regex_engine.compile(r'^(?P<key>vrf for call-home messages): (?P<value>(.*?))$')
         #     contact person's email address: sch-smart-licensing@cisco.com
-        p1_4 = re.compile(r'^(?P<key>contact person\'s email address): (?P<value>(.*?))$')
+        p1_4 = regex_engine.compile(r'^(?P<key>contact person\'s email address): (?P<value>(.*?))$')
         #     contact person's phone number: Not yet set up
-        p1_5 = re.compile(r'^(?P<key>contact person\'s phone number): (?P<value>(.*?))$')
+        p1_5 = regex_engine.compile(r'^(?P<key>contact person\'s phone number): (?P<value>(.*?))$')
         #     street address: Not yet set up
-        p1_6 = re.compile(r'^(?P<key>street address): (?P<value>(.*?))$')
+        p1_6 = regex_engine.compile(r'^(?P<key>street address): (?P<value>(.*?))$')
         #     customer ID: Not yet set up
-        p1_7 = re.compile(r'^(?P<key>customer ID): (?P<value>(.*?))$')
+        p1_7 = regex_engine.compile(r'^(?P<key>customer ID): (?P<value>(.*?))$')
         #     contract ID: Not yet set up
-        p1_8 = re.compile(r'^(?P<key>contract ID): (?P<value>(.*?))$')
+        p1_8 = regex_engine.compile(r'^(?P<key>contract ID): (?P<value>(.*?))$')
         #     site ID: Not yet set up
-        p1_9 = re.compile(r'^(?P<key>site ID): (?P<value>(.*?))$')
+        p1_9 = regex_engine.compile(r'^(?P<key>site ID): (?P<value>(.*?))$')
         #     source ip address: Not yet set up
-        p1_10 = re.compile(r'^(?P<key>source ip address): (?P<value>(.*?))$')
+        p1_10 = regex_engine.compile(r'^(?P<key>source ip address): (?P<value>(.*?))$')
         #     http secure: xxxxx
-        p1_11 = re.compile(r'^(?P<key>http secure): (?P<value>(.*?))$')
+        p1_11 = regex_engine.compile(r'^(?P<key>http secure): (?P<value>(.*?))$')
         #     source interface: Not yet set up
-        p1_12 = re.compile(r'^(?P<key>source interface): (?P<value>(.*?))$')
+        p1_12 = regex_engine.compile(r'^(?P<key>source interface): (?P<value>(.*?))$')
          #   Mail-server: Not yet set up
-        p1_13_1 = re.compile(r'^Mail-server: +(?P<addr>(.*?))$')
+        p1_13_1 = regex_engine.compile(r'^Mail-server: +(?P<addr>(.*?))$')
         #     http proxy: Not yet set up
-        p1_15 = re.compile(r'^(?P<key>http proxy): (?P<value>(.*?))$')
+        p1_15 = regex_engine.compile(r'^(?P<key>http proxy): (?P<value>(.*?))$')
         #       server identity check: enabled
-        p1_16 = re.compile(r'^(?P<key>server identity check): (?P<value>(.*?))$')
+        p1_16 = regex_engine.compile(r'^(?P<key>server identity check): (?P<value>(.*?))$')
         #     http resolve-hostname: default
-        p1_17 = re.compile(r'^(?P<key>http resolve-hostname): (?P<value>(.*?))$')
+        p1_17 = regex_engine.compile(r'^(?P<key>http resolve-hostname): (?P<value>(.*?))$')
         #     Diagnostic signature: enabled
-        p1_18 = re.compile(r'^(?P<Diagnostic>Diagnostic signature): (?P<Diagnostic_mode>(.*?))$')
+        p1_18 = regex_engine.compile(r'^(?P<Diagnostic>Diagnostic signature): (?P<Diagnostic_mode>(.*?))$')
         #     Profile: muskan (status: INACTIVE)
-        p1_19 = re.compile(r'^(?P<profile>Profile): +(?P<name>\S+) +(?P<status>\S+): +(?P<type>(.*?)\))$')
+        p1_19 = regex_engine.compile(r'^(?P<profile>Profile): +(?P<name>\S+) +(?P<status>\S+): +(?P<type>(.*?)\))$')
         #     Smart licensing messages: enabled
-        p1_20 = re.compile(r'^(?P<smart>Smart licensing messages): (?P<smart_mode>(.*?))$')
+        p1_20 = regex_engine.compile(r'^(?P<smart>Smart licensing messages): (?P<smart_mode>(.*?))$')
         #     aaa-authorization: disable
-        p1_21 = re.compile(r'^(?P<key>aaa-authorization): (?P<value>(.*?))$')
+        p1_21 = regex_engine.compile(r'^(?P<key>aaa-authorization): (?P<value>(.*?))$')
         #     aaa-authorization username: callhome (default)
-        p1_22 = re.compile(r'^(?P<key>aaa-authorization username): (?P<value>(.*?))$')
+        p1_22 = regex_engine.compile(r'^(?P<key>aaa-authorization username): (?P<value>(.*?))$')
         #     data-privacy: normal
-        p1_23 = re.compile(r'^(?P<key>data-privacy): (?P<value>(.*?))$')
+        p1_23 = regex_engine.compile(r'^(?P<key>data-privacy): (?P<value>(.*?))$')
         #     syslog throttling: enable
-        p1_24 = re.compile(r'^(?P<key>syslog throttling): (?P<value>(.*?))$')
+        p1_24 = regex_engine.compile(r'^(?P<key>syslog throttling): (?P<value>(.*?))$')
         #     Rate-limit: 20 message(s) per minute
-        p1_25 = re.compile(r'^(?P<key>Rate-limit): (?P<value>(.*?))$')
+        p1_25 = regex_engine.compile(r'^(?P<key>Rate-limit): (?P<value>(.*?))$')
         #     Snapshot command: Not yet set up
-        p1_26 = re.compile(r'^(?P<key>Snapshot command): (?P<value>(.*?))$')
+        p1_26 = regex_engine.compile(r'^(?P<key>Snapshot command): (?P<value>(.*?))$')
         #     Keyword                  State   Description
-        p2 = re.compile(r'^(?P<Keyword>\w+) +(?P<State>\w+) +(?P<Description>(\w+|\w+( +\w+)+))$')    
+        p2 = regex_engine.compile(r'^(?P<Keyword>\w+) +(?P<State>\w+) +(?P<Description>(\w+|\w+( +\w+)+))$')    
         # profile matches
-        p3 = re.compile(r'^(?P<profile_name>Profile Name): +(?P<profileName>(.*?))$')
+        p3 = regex_engine.compile(r'^(?P<profile_name>Profile Name): +(?P<profileName>(.*?))$')
         #     Profile status: INACTIVE
-        p4 = re.compile(r'^(?P<profile>Profile status): +(?P<name>(.*?))$')
+        p4 = regex_engine.compile(r'^(?P<profile>Profile status): +(?P<name>(.*?))$')
         #     Profile mode: Full Reporting
-        p5 = re.compile(r'^(?P<profile>Profile mode): +(?P<name>(.*?))$')
+        p5 = regex_engine.compile(r'^(?P<profile>Profile mode): +(?P<name>(.*?))$')
         #     Reporting Data: Smart Call Home, Smart Licensing
-        p6 = re.compile(r'^(?P<profile>Reporting Data): +(?P<name>(.*?))$')
+        p6 = regex_engine.compile(r'^(?P<profile>Reporting Data): +(?P<name>(.*?))$')
         #     Preferred Message Format: xml
-        p7 = re.compile(r'^(?P<profile>Preferred Message Format): +(?P<name>(.*?))$')
+        p7 = regex_engine.compile(r'^(?P<profile>Preferred Message Format): +(?P<name>(.*?))$')
         #     Message Size Limit: 3145728 Bytes
-        p8 = re.compile(r'^(?P<profile>Message Size Limit): +(?P<name>(.*?))$')
+        p8 = regex_engine.compile(r'^(?P<profile>Message Size Limit): +(?P<name>(.*?))$')
         #     Transport Method: http
-        p9 = re.compile(r'^(?P<profile>Transport Method): +(?P<name>(.*?))$')
+        p9 = regex_engine.compile(r'^(?P<profile>Transport Method): +(?P<name>(.*?))$')
         #     Email address(es): Not yet set up
-        p10 = re.compile(r'^(?P<profile>Email address(es)): +(?P<name>(.*?))$')
+        p10 = regex_engine.compile(r'^(?P<profile>Email address(es)): +(?P<name>(.*?))$')
         #     Other address(es): default
-        p11 = re.compile(r'^(?P<profile>Other address(es)): +(?P<name>(.*?))$')
+        p11 = regex_engine.compile(r'^(?P<profile>Other address(es)): +(?P<name>(.*?))$')
         #     HTTP  address: https://tools.cisco.com/its/service/oddce/services/DDCEService
-        p12 = re.compile(r'^(?P<profile>HTTP address): +(?P<name>(.*?))$')
+        p12 = regex_engine.compile(r'^(?P<profile>HTTP address): +(?P<name>(.*?))$')
         #     Periodic inventory info message is scheduled every 1 day of the month at 09:00
-        p13 = re.compile(r'^(?P<key>Periodic inventory info message is scheduled) +(?P<value>(.*?))$')
+        p13 = regex_engine.compile(r'^(?P<key>Periodic inventory info message is scheduled) +(?P<value>(.*?))$')
         #     Periodic configuration info message is scheduled every 1 day of the month at 09:15
-        p14 = re.compile(r'^(?P<key>Periodic configuration info message is scheduled) +(?P<value>(.*?))$')
+        p14 = regex_engine.compile(r'^(?P<key>Periodic configuration info message is scheduled) +(?P<value>(.*?))$')
         # N/A                       N/A
-        p15 = re.compile(r'^(?P<key>(?!.*--)[\S]+) +(?P<value>\S+) *$')
+        p15 = regex_engine.compile(r'^(?P<key>(?!.*--)[\S]+) +(?P<value>\S+) *$')
         #  Alert-group               Severity\r\n'
-        p16 = re.compile(r'^(?P<key>Alert-group) +(?P<value>Severity)$')
+        p16 = regex_engine.compile(r'^(?P<key>Alert-group) +(?P<value>Severity)$')
         #  Syslog-Pattern            Severity
-        p17 = re.compile(r'^(?P<key>Syslog-Pattern) +(?P<value>Severity)$')
+        p17 = regex_engine.compile(r'^(?P<key>Syslog-Pattern) +(?P<value>Severity)$')
         
         alert_flag = False
         syslog_flag = False
@@ -1104,13 +1105,13 @@ class ShowCallHomeStatistics(ShowCallHomeStatisticsSchema):
         ret_dict = {}
 
         # Total Success   0                    0                    0
-        p1 = re.compile(r'^Total (?P<msg_type>[-\w]+) *(?P<msg_total>\d+) +(?P<msg_email>\d+) +(?P<msg_http>\d+)$')
+        p1 = regex_engine.compile(r'^Total (?P<msg_type>[-\w]+) *(?P<msg_total>\d+) +(?P<msg_email>\d+) +(?P<msg_http>\d+)$')
         
         # Config      0                    0                    0
-        p2 = re.compile(r'^(?P<type>[-\w]+) *(?P<total>\d+) +(?P<email>\d+) +(?P<http>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<type>[-\w]+) *(?P<total>\d+) +(?P<email>\d+) +(?P<http>\d+)$')
         
         # Last call-home message sent time: n/a
-        p3 = re.compile(r'^Last call-home message sent time: (?P<time>.+) *$')
+        p3 = regex_engine.compile(r'^Last call-home message sent time: (?P<time>.+) *$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1190,7 +1191,7 @@ class ShowCallHomeMailServerStatus(ShowCallHomeMailServerStatusSchema):
         ret_dict = {}
 
         #     Mail-server[1]: Address: ott-ads-035 Priority: 1  Secure: none [Not Available]
-        p1 = re.compile(r'^(?P<mail_server_id>\S+):( +Address:\s(?P<address>\S+))*( +Priority: (?P<priority>\d+))*( +Secure: (?P<secure>.*))*$')
+        p1 = regex_engine.compile(r'^(?P<mail_server_id>\S+):( +Address:\s(?P<address>\S+))*( +Priority: (?P<priority>\d+))*( +Secure: (?P<secure>.*))*$')
         for line in output.splitlines():
             line = line.strip()
             if 'No mail server' in line:
@@ -1292,85 +1293,85 @@ class ShowCallHome(ShowCallHomeSchema):
         ret_dict = {}
 
         # call home feature : enable
-        p1 = re.compile(r'^call home feature : (?P<feature>\w+)$')
+        p1 = regex_engine.compile(r'^call home feature : (?P<feature>\w+)$')
 
         # call home message's from address: Not yet set up
-        p2 = re.compile(r'^call home message\'s from address: (?P<from>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^call home message\'s from address: (?P<from>[\w\s]+)$')
 
         # call home message's reply-to address: Not yet set up
-        p3 = re.compile(r'^call home message\'s reply-to address: (?P<reply_to>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^call home message\'s reply-to address: (?P<reply_to>[\w\s]+)$')
 
         # vrf for call-home messages: Not yet set up
-        p4 = re.compile(r'^vrf for call-home messages: (?P<vrf>[\w\s]+)$')
+        p4 = regex_engine.compile(r'^vrf for call-home messages: (?P<vrf>[\w\s]+)$')
 
         # contact person's email address: test@test.com
-        p5 = re.compile(r'^contact person\'s email address: (?P<email>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^contact person\'s email address: (?P<email>[\S\s]+)$')
 
         # contact person's phone number: Not yet set up
-        p6 = re.compile(r'^contact person\'s phone number: (?P<phone>[\w\s\@\.]+)$')
+        p6 = regex_engine.compile(r'^contact person\'s phone number: (?P<phone>[\w\s\@\.]+)$')
 
         #  street address: test
-        p7 = re.compile(r'^street address: (?P<street>[\w\s]+)$')
+        p7 = regex_engine.compile(r'^street address: (?P<street>[\w\s]+)$')
 
         # customer ID: Not yet set up
-        p8 = re.compile(r'^customer ID: (?P<customer_id>[\w\s]+)$')
+        p8 = regex_engine.compile(r'^customer ID: (?P<customer_id>[\w\s]+)$')
 
         # contract ID: Not yet set up
-        p9 = re.compile(r'^contract ID: (?P<contract_id>[\w\s]+)$')
+        p9 = regex_engine.compile(r'^contract ID: (?P<contract_id>[\w\s]+)$')
 
         # site ID: test
-        p10 = re.compile(r'^site ID: (?P<site_id>[\w\s]+)$')
+        p10 = regex_engine.compile(r'^site ID: (?P<site_id>[\w\s]+)$')
 
         # source ip address: Not yet set up
-        p11 = re.compile(r'^source ip address: (?P<ip_add>[\w\s]+)$')
+        p11 = regex_engine.compile(r'^source ip address: (?P<ip_add>[\w\s]+)$')
 
         # source interface: Not yet set up
-        p12 = re.compile(r'^source interface: (?P<interface>[\w\s]+)$')
+        p12 = regex_engine.compile(r'^source interface: (?P<interface>[\w\s]+)$')
 
         # Mail-server[1]: Address: test_add Priority: 1  Secure: none
-        p13 = re.compile(r'^(?P<mail_server_id>\S+): (Address: (?P<address>[\w\S]+)) (Priority: (?P<priority>\S+)) (Secure: (?P<secure>[\w\S]+))*')
+        p13 = regex_engine.compile(r'^(?P<mail_server_id>\S+): (Address: (?P<address>[\w\S]+)) (Priority: (?P<priority>\S+)) (Secure: (?P<secure>[\w\S]+))*')
 
         # http proxy: Not yet set up
-        p14 = re.compile(r'^http proxy: (?P<proxy>[\w\s]+)$')
+        p14 = regex_engine.compile(r'^http proxy: (?P<proxy>[\w\s]+)$')
 
         # server identity check: enabled
-        p15 = re.compile(r'^server identity check: (?P<identity_check>[\w\s]+)$')
+        p15 = regex_engine.compile(r'^server identity check: (?P<identity_check>[\w\s]+)$')
 
         # http resolve-hostname: default
-        p16 = re.compile(r'^http resolve-hostname: (?P<hostname>[\w\s]+)$')
+        p16 = regex_engine.compile(r'^http resolve-hostname: (?P<hostname>[\w\s]+)$')
 
         # Diagnostic signature: enabled
-        p17 = re.compile(r'^Diagnostic signature: (?P<signature>[\w\s]+)$')
+        p17 = regex_engine.compile(r'^Diagnostic signature: (?P<signature>[\w\s]+)$')
 
         # Profile: Test (status: ACTIVE)
-        p18 = re.compile(r'^Profile: (?P<profile>[\w\S]+) \(status: (?P<status>[\w\s]+)\)$')
+        p18 = regex_engine.compile(r'^Profile: (?P<profile>[\w\S]+) \(status: (?P<status>[\w\s]+)\)$')
 
         # Smart licensing messages: enabled
-        p19 = re.compile(r'^Smart licensing messages: (?P<smart_licensing>[\w\s]+)$')
+        p19 = regex_engine.compile(r'^Smart licensing messages: (?P<smart_licensing>[\w\s]+)$')
 
         # aaa-authorization: disable
-        p20 = re.compile(r'^aaa-authorization: (?P<aaa_auth>[\w\s]+)$')
+        p20 = regex_engine.compile(r'^aaa-authorization: (?P<aaa_auth>[\w\s]+)$')
 
         # aaa-authorization username: test
-        p21 = re.compile(r'^aaa-authorization username: (?P<username>[\S\s]+)$')
+        p21 = regex_engine.compile(r'^aaa-authorization username: (?P<username>[\S\s]+)$')
 
         # data-privacy: normal
-        p22 = re.compile(r'^data-privacy: (?P<privacy>[\w\s]+)$')
+        p22 = regex_engine.compile(r'^data-privacy: (?P<privacy>[\w\s]+)$')
 
         # syslog throttling: enable
-        p23 = re.compile(r'^syslog throttling: (?P<throttling>[\w\s]+)$')
+        p23 = regex_engine.compile(r'^syslog throttling: (?P<throttling>[\w\s]+)$')
 
         # Rate-limit: 1 message(s) per minute
-        p24 = re.compile(r'^Rate-limit: (?P<rate_limit>\d+) message\(s\) per minute$')
+        p24 = regex_engine.compile(r'^Rate-limit: (?P<rate_limit>\d+) message\(s\) per minute$')
 
         # Snapshot command: Not yet set up
-        p25 = re.compile(r'^Snapshot command: (?P<cmd>[\w\s]+)$')
+        p25 = regex_engine.compile(r'^Snapshot command: (?P<cmd>[\w\s]+)$')
 
         # configuration            Enable  configuration info
-        p26 = re.compile(r'^(?P<keyword>\w+) *(?P<state>\w+) *(?P<description>[\w\ ]+)$')
+        p26 = regex_engine.compile(r'^(?P<keyword>\w+) *(?P<state>\w+) *(?P<description>[\w\ ]+)$')
 
         # Profile Name: Test
-        p27 = re.compile(r'^Profile Name: (?P<name>[\S]+)$')
+        p27 = regex_engine.compile(r'^Profile Name: (?P<name>[\S]+)$')
 
         # Inititalizing a variable : name
         name = ""
@@ -9,10 +9,8 @@ IOSXE parsers for the following show commands:
 
 '''
 
-# Python
-import re
-
 # Metaparser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
@@ -69,29 +67,29 @@ class ShowCdpNeighbors(ShowCdpNeighborsSchema):
         # Specifically for situations when Platform and Port Id are concatenated        
         # RX-SWV.cisco.com Fas 0/1            167         T S       WS-C3524-XFas 0/13
         # C2950-1          Fas 0/0            148         S I       WS-C2950T-Fas 0/15
-        p1 = re.compile(r'^(?P<device_id>\S+) +'
-                        r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSsHIrPDCM\s]+)( +'
-                        r'(?P<platform>\S+))?'
-                        r'(\s+(?P<port_id>(Fa|Gi|GE).\s*\d*\/*\d*))?$')
+        p1 = regex_engine.compile(r'^(?P<device_id>\S+) +'
+                                  r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+                                  r'(?P<hold_time>\d+) +(?P<capability>[RTBSsHIrPDCM\s]+)( +'
+                                  r'(?P<platform>\S+))?'
+                                  r'(\s+(?P<port_id>(Fa|Gi|GE).\s*\d*\/*\d*))?$')
 
         # No platform
         # R5.cisco.com Gig 0/0 125 R B Gig 0/0
         # SEP08000F8BA7FD  Gig 1/0/7         179              H P   Mitel 532 Port 1
-        p2 = re.compile(r'^(?P<device_id>\S+) +'
-                        r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +'
-                        r'(?P<capability>[RTBSsHIrPDCM\s]+)'
-                        r'(?: +(?P<platform>[\w\-]+ (\d+)?))?( +'
-                        r'(?P<port_id>[a-zA-Z0-9\/]+( [a-zA-Z0-9\/\s]+)?))?$')
+        p2 = regex_engine.compile(r'^(?P<device_id>\S+) +'
+                                  r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+                                  r'(?P<hold_time>\d+) +'
+                                  r'(?P<capability>[RTBSsHIrPDCM\s]+)'
+                                  r'(?: +(?P<platform>[\w\-]+ (\d+)?))?( +'
+                                  r'(?P<port_id>[a-zA-Z0-9\/]+( [a-zA-Z0-9\/\s]+)?))?$')
 
         # device6 Gig 0 157 R S I C887VA-W-W Gi 0
         # SEP08000FA9B170  Gig 1/0/9         158              H P   Mitel 532 Port 1
-        p3 = re.compile(r'^(?P<device_id>\S+) +'
-                        r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSsHIrPDCM\s]+)( +'
-                        r'(?P<platform>\S+(?: \d+)?))?( '
-                        r'(?P<port_id>[\s\S]+))?$')
+        p3 = regex_engine.compile(r'^(?P<device_id>\S+) +'
+                                  r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+                                  r'(?P<hold_time>\d+) +(?P<capability>[RTBSsHIrPDCM\s]+)( +'
+                                  r'(?P<platform>\S+(?: \d+)?))?( '
+                                  r'(?P<port_id>[\s\S]+))?$')
 
         # p4 and p5 for two-line output, where device id is on a separate line
         # bgp-n93-d(FDO24140U7J)
@@ -108,13 +106,13 @@ class ShowCdpNeighbors(ShowCdpNeighborsSchema):
         #                Multilink3        165              R I   ASR1002   Multilink1
         # R4.cisco.com
         #                Ser 0/1/0:0       160             R S I  ISR4451-X Ser 0/1/0:0
-        p4 = re.compile(r'^(?P<device_id>\S+)$')
-        p5 = re.compile(r'(?P<local_interface>[a-zA-Z]+[\s]*[\d/.]+(:\d+)?)?\s+'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSsHIrPDCM\s]+)( +'
-                        r'(?P<platform>VMware ES|\S+))?( (?P<port_id>[\.a-zA-Z0-9/\s]+(:\d+)?))?$')
+        p4 = regex_engine.compile(r'^(?P<device_id>\S+)$')
+        p5 = regex_engine.compile(r'(?P<local_interface>[a-zA-Z]+[\s]*[\d/.]+(:\d+)?)?\s+'
+                                  r'(?P<hold_time>\d+) +(?P<capability>[RTBSsHIrPDCM\s]+)( +'
+                                  r'(?P<platform>VMware ES|\S+))?( (?P<port_id>[\.a-zA-Z0-9/\s]+(:\d+)?))?$')
 
         # Total cdp entries displayed : 13
-        p6 = re.compile(r'^Total cdp entries displayed :\s+(?P<total_entries>\d+)$')
+        p6 = regex_engine.compile(r'^Total cdp entries displayed :\s+(?P<total_entries>\d+)$')
         device_id_index = 0
         parsed_dict = {}
 
@@ -252,7 +250,7 @@ class ShowCdpNeighborsDetail(ShowCdpNeighborsDetailSchema):
 
         # Device ID: R7(9QBDKB58F76)
         # Device ID:
-        deviceid_re = re.compile(r'Device\s+ID:\s*(?P<device_id>\S+)?')
+        deviceid_re = regex_engine.compile(r'Device\s+ID:\s*(?P<device_id>\S+)?')
 
         # Platform: N9K-9000v,  Capabilities: Router Switch CVTA phone port
         # Platform: N9K_9000v,  Capabilities: Router Switch Two-port phone port
@@ -261,9 +259,9 @@ class ShowCdpNeighborsDetail(ShowCdpNeighborsDetailSchema):
         # Platform: Meraki MV21 Cloud Managed Indoor HD Dom
         # Platform: Mitel 5320e,DN 2142      ,  Capabilities: Host Phone
         # Platform: "CTS-CODEC-SX80",  Capabilities: Host Phone
-        platf_cap_re = re.compile(r'Platform:\s+(?P<platform>[\w +(\-|\_\/:)\"]+'
-                                  r'(?:,[\w ]+)?)(\,\s*Capabilities:\s+'
-                                  r'(?P<capabilities>[\w\s\-]+))?$')
+        platf_cap_re = regex_engine.compile(r'Platform:\s+(?P<platform>[\w +(\-|\_\/:)\"]+'
+                                            r'(?:,[\w ]+)?)(\,\s*Capabilities:\s+'
+                                            r'(?P<capabilities>[\w\s\-]+))?$')
 
         # Interface: GigabitEthernet0/0,  Port ID (outgoing port): mgmt0
         # Interface: Ethernet0/1,  Port ID (outgoing port): Ethernet0/1
@@ -273,64 +271,64 @@ class ShowCdpNeighborsDetail(ShowCdpNeighborsDetailSchema):
         # Interface: Serial0/0/0:1,  Port ID (outgoing port): Serial1/4:1
         # Interface: FastEthernet0/0.1,  Port ID (outgoing port): GigabitEthernet7/27
         # Interface: GigabitEthernet0/5, Port ID (outgoing port):
-        interface_port_re = re.compile(r'^Interface:\s*'
-                                       r'(?P<interface>[\w\s\-\/\/\:\.]+)\s*\,'
-                                       r'*\s*Port\s*ID\s*[\(\w\)\s\:]+:\s*'
-                                       r'(?P<port_id>[\S\s]+)?$')
+        interface_port_re = regex_engine.compile(r'^Interface:\s*'
+                                                 r'(?P<interface>[\w\s\-\/\/\:\.]+)\s*\,'
+                                                 r'*\s*Port\s*ID\s*[\(\w\)\s\:]+:\s*'
+                                                 r'(?P<port_id>[\S\s]+)?$')
 
         # Native VLAN: 42
-        native_vlan_re = re.compile(r'^Native\s*VLAN\s*:\s*'
-                                    r'(?P<native_vlan>\d+)')
+        native_vlan_re = regex_engine.compile(r'^Native\s*VLAN\s*:\s*'
+                                              r'(?P<native_vlan>\d+)')
 
         # VTP Management Domain: 'Accounting Group'
-        vtp_management_domain_re = re.compile(r'^VTP\s*Management\s*'
-                                              r'Domain\s*:\s*'
-                                              r'\W*(?P<vtp_management_domain>([a-zA-Z\s]+'
-                                              r'))\W*')
+        vtp_management_domain_re = regex_engine.compile(r'^VTP\s*Management\s*'
+                                                        r'Domain\s*:\s*'
+                                                        r'\W*(?P<vtp_management_domain>([a-zA-Z\s]+'
+                                                        r'))\W*')
 
         # Holdtime : 126 sec
-        hold_time_re = re.compile(r'^Holdtime\s*:\s*\s*(?P<hold_time>\d+)')
+        hold_time_re = regex_engine.compile(r'^Holdtime\s*:\s*\s*(?P<hold_time>\d+)')
 
         # advertisement version: 2
-        advertver_re = re.compile(r'^advertisement\s*version:\s*'
-                                  r'(?P<advertisement_ver>\d+)')
+        advertver_re = regex_engine.compile(r'^advertisement\s*version:\s*'
+                                            r'(?P<advertisement_ver>\d+)')
 
         # Cisco IOS Software, IOSv Software (VIOS-ADVENTERPRISEK9-M), Version 15.7(3)M3, RELEASE SOFTWARE (fc2)
-        software_version_re = re.compile(r'^(?P<software_version>[\s\S]+)$')
+        software_version_re = regex_engine.compile(r'^(?P<software_version>[\s\S]+)$')
 
         # Duplex: full
         # Duplex Mode: half
-        duplex_re = re.compile(r'^Duplex\s*(Mode)*:\s*(?P<duplex_mode>\w+)')
+        duplex_re = regex_engine.compile(r'^Duplex\s*(Mode)*:\s*(?P<duplex_mode>\w+)')
 
         # Regexes for Flags:
         # Version:
-        software_version_flag_re = re.compile(r'^Version\s*:\s*')
+        software_version_flag_re = regex_engine.compile(r'^Version\s*:\s*')
         # Management address(es):
-        mngaddress_re = re.compile(r'^Management\s*address\s*\([\w]+\)\s*\:\s*')
+        mngaddress_re = regex_engine.compile(r'^Management\s*address\s*\([\w]+\)\s*\:\s*')
         # Entry address(es):
-        entryaddress_re = re.compile(r'^Entry\s*address\s*\(\w+\)\s*\:\s*')
+        entryaddress_re = regex_engine.compile(r'^Entry\s*address\s*\(\w+\)\s*\:\s*')
 
         # IPv6 address: FE80::203:E3FF:FE6A:BF81  (link-local)
         # IPv6 address: 2001:DB8:1000:8A10::C0A8:BC06  (global unicast)
-        ipv6_adress_re = re.compile(r'^IPv6\s*address\s*:\s*(?P<ip_adress>\S+)'
-                                    r'\s*\((?P<type>[\s\w\-]+)\)')
+        ipv6_adress_re = regex_engine.compile(r'^IPv6\s*address\s*:\s*(?P<ip_adress>\S+)'
+                                              r'\s*\((?P<type>[\s\w\-]+)\)')
         # IP address: 172.16.1.204
-        ipaddress_re = re.compile(r'^IP\s*address:\s*(?P<id_adress>\S*)')
+        ipaddress_re = regex_engine.compile(r'^IP\s*address:\s*(?P<id_adress>\S*)')
         
         # Power drawn: 0.099 Watts
-        power_drawn_re = re.compile(r'^Power\s*drawn\s*:\s*(?P<power_drawn>\d+\.\d+)')
+        power_drawn_re = regex_engine.compile(r'^Power\s*drawn\s*:\s*(?P<power_drawn>\d+\.\d+)')
          
         # Power request id: 2, Power management id: 5
-        power_ids_re_1 = re.compile(r'^Power\s+request\s+id:\s*(?P<power_request_id>\d+)\s*,\s*Power\s+management\s+id:\s*(?P<power_mgmt_id_1>\d+)')
+        power_ids_re_1 = regex_engine.compile(r'^Power\s+request\s+id:\s*(?P<power_request_id>\d+)\s*,\s*Power\s+management\s+id:\s*(?P<power_mgmt_id_1>\d+)')
          
         # Power request levels are:29289 15400 0 0 0
-        power_req_level_re = re.compile(r'^Power\s+request\s+levels\s+are:\s*(?P<power_req_level>\d+(?:\s+\d+)*)')
+        power_req_level_re = regex_engine.compile(r'^Power\s+request\s+levels\s+are:\s*(?P<power_req_level>\d+(?:\s+\d+)*)')
          
         # Power available id:      1       Power management id:      2
-        power_ids_re_2 = re.compile(r'^Power\s+available\s+id:\s*(?P<power_available_id>\d+)\s*Power\s+management\s+id:\s*(?P<power_mgmt_id_2>\d+)')
+        power_ids_re_2 = regex_engine.compile(r'^Power\s+available\s+id:\s*(?P<power_available_id>\d+)\s*Power\s+management\s+id:\s*(?P<power_mgmt_id_2>\d+)')
          
         # Power available is:  0.055 Watts Management Power is:  0.003 Watts
-        power_avail_re = re.compile(r'^Power\s+available\s+is:\s*(?P<available_power>\d+\.\d+)\s+Watts\s*Management\s+Power\s+is:\s*(?P<mgmt_power>\d+\.\d+)\s+Watts')
+        power_avail_re = regex_engine.compile(r'^Power\s+available\s+is:\s*(?P<available_power>\d+\.\d+)\s+Watts\s*Management\s+Power\s+is:\s*(?P<mgmt_power>\d+\.\d+)\s+Watts')
 
         # 0 or 1 flags
         entry_address_flag = 0
@@ -600,19 +598,19 @@ class ShowCdpTraffic(ShowCdpTrafficSchema):
         meta_dict = dict()
 
         # Total packets output: 297183, Input: 2546
-        p0 = re.compile(r'^Total\s+packets\s+output:\s+(?P<total_output>\d+),\s+Input:\s+(?P<total_input>\d+)$')
+        p0 = regex_engine.compile(r'^Total\s+packets\s+output:\s+(?P<total_output>\d+),\s+Input:\s+(?P<total_input>\d+)$')
 
         # Hdr syntax: 0, Chksum error: 0, Encaps failed: 0
-        p1 = re.compile(r'^Hdr\s+syntax:\s+(?P<hdr>\d+),\s+Chksum\s+error:\s+(?P<checksum>\d+),\s+Encaps\s+failed:\s+(?P<encaps>\d+)$')
+        p1 = regex_engine.compile(r'^Hdr\s+syntax:\s+(?P<hdr>\d+),\s+Chksum\s+error:\s+(?P<checksum>\d+),\s+Encaps\s+failed:\s+(?P<encaps>\d+)$')
 
         # No memory: 0, Invalid packet: 0,
-        p2 = re.compile(r'^No\s+memory:\s+(?P<memory>\d+),\s+Invalid\s+packet:\s+(?P<invalid>\d+),$')
+        p2 = regex_engine.compile(r'^No\s+memory:\s+(?P<memory>\d+),\s+Invalid\s+packet:\s+(?P<invalid>\d+),$')
 
         # CDP version 1 advertisements output: 0, Input: 0
-        p3 = re.compile(r'^CDP\s+version\s+1\s+advertisements\s+output:\s+(?P<cdp_ver1_output>\d+),\s+Input:\s+(?P<cdp_ver1_input>\d+)$')
+        p3 = regex_engine.compile(r'^CDP\s+version\s+1\s+advertisements\s+output:\s+(?P<cdp_ver1_output>\d+),\s+Input:\s+(?P<cdp_ver1_input>\d+)$')
 
         # CDP version 2 advertisements output: 285442, Input: 870
-        p4 = re.compile(r'^CDP\s+version\s+2\s+advertisements\s+output:\s+(?P<cdp_ver2_output>\d+),\s+Input:\s+(?P<cdp_ver2_input>\d+)$')
+        p4 = regex_engine.compile(r'^CDP\s+version\s+2\s+advertisements\s+output:\s+(?P<cdp_ver2_output>\d+),\s+Input:\s+(?P<cdp_ver2_input>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -690,25 +688,25 @@ class ShowCdpInterface(ShowCdpInterfaceSchema):
 
         # TwentyFiveGigE3/1/1 is down, line protocol is down
         # GigabitEthernet0/0 is administratively down, line protocol is down
-        p0 = re.compile(r'^(?P<interface>[a-zA-Z\-\/\d\.]+)\s+is\s+(?P<state>[\w\s]+),\s+line\s+protocol\s+is\s+(?P<protocol_state>\w+)$')
+        p0 = regex_engine.compile(r'^(?P<interface>[a-zA-Z\-\/\d\.]+)\s+is\s+(?P<state>[\w\s]+),\s+line\s+protocol\s+is\s+(?P<protocol_state>\w+)$')
 
         # Encapsulation ARPA
-        p1 = re.compile(r'^Encapsulation\s+(?P<encapsulation>\w+)$')
+        p1 = regex_engine.compile(r'^Encapsulation\s+(?P<encapsulation>\w+)$')
 
         # Sending CDP packets every 60 seconds
-        p2 = re.compile(r'^Sending\s+CDP\s+packets\s+every\s+(?P<cdp_interval>\d+)\s+seconds$')
+        p2 = regex_engine.compile(r'^Sending\s+CDP\s+packets\s+every\s+(?P<cdp_interval>\d+)\s+seconds$')
   
         # Holdtime is 180 seconds
-        p3 = re.compile(r'^Holdtime\s+is\s+(?P<hold_time>\d+)\s+seconds$')
+        p3 = regex_engine.compile(r'^Holdtime\s+is\s+(?P<hold_time>\d+)\s+seconds$')
 
         # cdp enabled interfaces : 172
-        p4 = re.compile(r'^cdp\s+enabled\s+interfaces\s+:\s+(?P<cdp_enabled_interfaces>\d+)$')
+        p4 = regex_engine.compile(r'^cdp\s+enabled\s+interfaces\s+:\s+(?P<cdp_enabled_interfaces>\d+)$')
 
         # interfaces up          : 7
-        p5 = re.compile(r'^interfaces\s+up\s+:\s+(?P<interfaces_up>\d+)$')
+        p5 = regex_engine.compile(r'^interfaces\s+up\s+:\s+(?P<interfaces_up>\d+)$')
         
         # interfaces down        : 166
-        p6 = re.compile(r'^interfaces\s+down\s+:\s+(?P<interfaces_down>\d+)$')
+        p6 = regex_engine.compile(r'^interfaces\s+down\s+:\s+(?P<interfaces_down>\d+)$')
 
         ret_int = lambda dicty: {key: int(value) for key, value in dicty.items()}
 
@@ -800,37 +798,37 @@ class ShowCdpEntry(ShowCdpEntrySchema):
         meta_dict = {}
 
         # Interface: GigabitEthernet0/0,  Port ID (outgoing port): GigabitEthernet1/0/18
-        p0 = re.compile(r'^Interface:\s+(?P<intf>[\w\/\.\-]+),\s+Port\s+ID\s+\(outgoing port\):\s+(?P<port>[\w\/\.\-]+)$')
+        p0 = regex_engine.compile(r'^Interface:\s+(?P<intf>[\w\/\.\-]+),\s+Port\s+ID\s+\(outgoing port\):\s+(?P<port>[\w\/\.\-]+)$')
 
         # Device ID: 9300-24UX-1
-        p1 = re.compile(r'^Device\s+ID:\s+(?P<device_id>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^Device\s+ID:\s+(?P<device_id>[\S\s]+)$')
 
         # Platform: cisco C9300-24UX,
-        p2 = re.compile(r'^Platform:\s+(?P<platform>.+),\s+Capabilities:')
+        p2 = regex_engine.compile(r'^Platform:\s+(?P<platform>.+),\s+Capabilities:')
 
         # Holdtime : 171 sec
-        p3 = re.compile(r'^Holdtime\s+:\s+(?P<hold_time>\d+)\s+sec$')
+        p3 = regex_engine.compile(r'^Holdtime\s+:\s+(?P<hold_time>\d+)\s+sec$')
 
         # Cisco IOS Software, Catalyst L3 Switch Software (CAT3K_CAA-UNIVERSALK9-M), Version 15.2(3.1.30)E1
         # Technical Support: http://www.cisco.com/techsupport
         # Copyright (c) 1986-2014 by Cisco Systems, Inc.
         # Compiled Fri 12-Dec-14 06:48 by gereddy
-        p4 = re.compile(r'^(?P<system_description>(Cisco +IOS +Software|Technical Support|Copyright|Compiled).*)$')
+        p4 = regex_engine.compile(r'^(?P<system_description>(Cisco +IOS +Software|Technical Support|Copyright|Compiled).*)$')
 
         # Peer Source MAC: a03d.6ea4.6f04
-        p5 = re.compile(r'^Peer\s+Source\s+MAC:\s+(?P<peer_mac>[a-f0-9A-F\.]+)$')
+        p5 = regex_engine.compile(r'^Peer\s+Source\s+MAC:\s+(?P<peer_mac>[a-f0-9A-F\.]+)$')
 
         # advertisement version: 2
-        p6 = re.compile(r'^advertisement\s+version:\s+(?P<cdp_version>\d+)$')
+        p6 = regex_engine.compile(r'^advertisement\s+version:\s+(?P<cdp_version>\d+)$')
 
         # VTP Management Domain: 'cisco'
-        p7 = re.compile(r'^VTP\s+Management\s+Domain:\s+\'(?P<vtp_mgmt_domain>.*)\'$')
+        p7 = regex_engine.compile(r'^VTP\s+Management\s+Domain:\s+\'(?P<vtp_mgmt_domain>.*)\'$')
 
         # Native VLAN: 1
-        p8 = re.compile(r'^Native\s+VLAN:\s+(?P<native_vlan>\d+)$')
+        p8 = regex_engine.compile(r'^Native\s+VLAN:\s+(?P<native_vlan>\d+)$')
 
         # Duplex: full
-        p9 = re.compile(r'^Duplex:\s+(?P<duplex>\w+)$')
+        p9 = regex_engine.compile(r'^Duplex:\s+(?P<duplex>\w+)$')
 
         tmp_dict = dict()
         system_description = list()
@@ -931,13 +929,13 @@ class ShowCdp(ShowCdpSchema):
             output = self.device.execute(self.cli_command)
         
         # Sending CDP packets every 60 seconds
-        p1 = re.compile(r'^Sending CDP packets every (?P<interval>\d+) seconds$')
+        p1 = regex_engine.compile(r'^Sending CDP packets every (?P<interval>\d+) seconds$')
 
         # Sending a holdtime value of 180 seconds
-        p2 = re.compile(r'^Sending a holdtime value of (?P<holdtime>\d+) seconds$')
+        p2 = regex_engine.compile(r'^Sending a holdtime value of (?P<holdtime>\d+) seconds$')
 
         # Sending CDPv2 advertisements is  enabled
-        p3 = re.compile(r'^Sending CDPv2 advertisements is\s+(?P<cdpv2>\w+)$')
+        p3 = regex_engine.compile(r'^Sending CDPv2 advertisements is\s+(?P<cdpv2>\w+)$')
 
         ret_dict = dict()
 
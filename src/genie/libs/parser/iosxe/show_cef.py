@@ -8,12 +8,12 @@ IOSXE parsers for the following show commands:
     * show cef interface <interface>
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 class ShowCefPathSetIdDetailReplicateOceSchema(MetaParser):
     """Schema for:
@@ -40,7 +40,7 @@ class ShowCefPathSetIdDetailReplicateOce(ShowCefPathSetIdDetailReplicateOceSchem
         ret_dict = {}
         
         ###Replicate oce: 0x7F9E40C59340 UID:6888
-        p1=re.compile(r"^Replicate\s+oce:\s+(?P<replicate_oce>\S+)\s+UID:(?P<uid>\S+)$")
+        p1=regex_engine.compile(r"^Replicate\s+oce:\s+(?P<replicate_oce>\S+)\s+UID:(?P<uid>\S+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -92,49 +92,49 @@ class ShowCefUid(ShowCefUidSchema):
                 
         ###CEF Unique IDs Stats: global space
         ###CEF Unique IDs Stats: platform space
-        p1=re.compile(r"^CEF\s+Unique\s+IDs\s+Stats:\s+(?P<value>[a-zA-Z ]+)$")
+        p1=regex_engine.compile(r"^CEF\s+Unique\s+IDs\s+Stats:\s+(?P<value>[a-zA-Z ]+)$")
         
         ###CEF UID Client Key Stats
-        p2=re.compile(r"CEF\s+UID\s+Client\s+Key\s+Stats")
+        p2=regex_engine.compile(r"CEF\s+UID\s+Client\s+Key\s+Stats")
         
         ##IDs Maximum : 16777216
-        p3=re.compile(r"^IDs\s+Maximum\s+:\s+(?P<ids_maximum>\d+)$")
+        p3=regex_engine.compile(r"^IDs\s+Maximum\s+:\s+(?P<ids_maximum>\d+)$")
 
         ##IDs Free : 16777212 
-        p4=re.compile(r"^IDs\s+Free\s+:\s+(?P<ids_free>\d+)$")
+        p4=regex_engine.compile(r"^IDs\s+Free\s+:\s+(?P<ids_free>\d+)$")
 
         ##IDs Active : 4
-        p5=re.compile(r"^IDs\s+Active\s+:\s+(?P<ids_active>\d+)$")
+        p5=regex_engine.compile(r"^IDs\s+Active\s+:\s+(?P<ids_active>\d+)$")
 
         ##IDs Pending re-use TO : 0
-        p6=re.compile(r"^IDs\s+Pending\s+re\-use\s+TO\s+:\s+(?P<ids_pending_to_re_use>\d+)$")
+        p6=regex_engine.compile(r"^IDs\s+Pending\s+re\-use\s+TO\s+:\s+(?P<ids_pending_to_re_use>\d+)$")
 
         ##IDs Total Generated : 4
-        p7=re.compile(r"^IDs\s+Total\s+Generated\s+:\s+(?P<ids_total_generated>\d+)$")
+        p7=regex_engine.compile(r"^IDs\s+Total\s+Generated\s+:\s+(?P<ids_total_generated>\d+)$")
 
         ##IDs Total Reserved : 0
-        p8=re.compile(r"^IDs\s+Total\s+Reserved\s+:\s+(?P<ids_total_reserved>\d+)$")
+        p8=regex_engine.compile(r"^IDs\s+Total\s+Reserved\s+:\s+(?P<ids_total_reserved>\d+)$")
 
         ##IDs Total Reserved : 0
-        p9=re.compile(r"^IDs\s+Total\s+Deleted\s+:\s+(?P<ids_total_deleted>\d+)$")
+        p9=regex_engine.compile(r"^IDs\s+Total\s+Deleted\s+:\s+(?P<ids_total_deleted>\d+)$")
         
         ##Groups Maximum : 2048
-        p10=re.compile(r"^Groups\s+Maximum\s+:\s+(?P<maximum_groups>\d+)$")
+        p10=regex_engine.compile(r"^Groups\s+Maximum\s+:\s+(?P<maximum_groups>\d+)$")
 
         ##Groups Free : 2047
-        p11=re.compile(r"^Groups\s+Free\s+:\s+(?P<free_groups>\d+)$")
+        p11=regex_engine.compile(r"^Groups\s+Free\s+:\s+(?P<free_groups>\d+)$")
 
         ##Groups Active : 1
-        p12=re.compile(r"^Groups\s+Active\s+:\s+(?P<active_groups>\d+)$")
+        p12=regex_engine.compile(r"^Groups\s+Active\s+:\s+(?P<active_groups>\d+)$")
 
         ##Client Key nodes : 4
-        p13=re.compile(r"^Client\s+Key\s+nodes\s+:\s+(?P<client_key_nodes>\d+)$")
+        p13=regex_engine.compile(r"^Client\s+Key\s+nodes\s+:\s+(?P<client_key_nodes>\d+)$")
 
         ##UID Table Entries : 4
-        p14=re.compile(r"^UID\s+Table\s+Entries\s+:\s+(?P<uid_table_entries>\d+)$")
+        p14=regex_engine.compile(r"^UID\s+Table\s+Entries\s+:\s+(?P<uid_table_entries>\d+)$")
 
         ##UID Table config size: 16777216
-        p15=re.compile(r"^UID\s+Table\s+config\s+size:\s+(?P<uid_table_config_size>\d+)$")
+        p15=regex_engine.compile(r"^UID\s+Table\s+config\s+size:\s+(?P<uid_table_config_size>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -259,7 +259,7 @@ class ShowCefPathSetsSummary(ShowCefPathSetsSummarySchema):
         ret_dict = {}
 
         ##Path Set Id 0x00000002   Num Paths 1
-        p1=re.compile(r"^Path\s+Set\s+Id\s+(?P<path_set_id>\S+)\s+Num\s+Paths\s+(?P<path_num>\d+)$")
+        p1=regex_engine.compile(r"^Path\s+Set\s+Id\s+(?P<path_set_id>\S+)\s+Num\s+Paths\s+(?P<path_num>\d+)$")
         
         for line in output.splitlines():
             line=line.strip()
@@ -296,11 +296,11 @@ class ShowCefInterfacePolicyStatistics(ShowCefInterfacePolicyStatisticsSchema):
             output = self.device.execute(self.cli_command)
 
         # AppGigabitEthernet1/0/1 is up (if_number 73)
-        p1 = re.compile(r"^(?P<intf>.*)\s+is\s+(?P<status>\w+)\s+\(if_number\s+(?P<if_number>\d+)\)$")
+        p1 = regex_engine.compile(r"^(?P<intf>.*)\s+is\s+(?P<status>\w+)\s+\(if_number\s+(?P<if_number>\d+)\)$")
         #   Corresponding hwidb fast_if_number 73
-        p1_1 = re.compile(r"^\s+Corresponding\s+hwidb\s+fast_if_number\s+(?P<corr_hwidb_fast_if_number>\d+)$")
+        p1_1 = regex_engine.compile(r"^\s+Corresponding\s+hwidb\s+fast_if_number\s+(?P<corr_hwidb_fast_if_number>\d+)$")
         #   Corresponding hwidb firstsw->if_number 73
-        p1_2 = re.compile(r"^\s+Corresponding\s+hwidb\s+firstsw->if_number\s+(?P<corr_hwidb_firstsw_if_number>\d+)$")
+        p1_2 = regex_engine.compile(r"^\s+Corresponding\s+hwidb\s+firstsw->if_number\s+(?P<corr_hwidb_firstsw_if_number>\d+)$")
 
         ret_dict = {}
 
@@ -369,40 +369,40 @@ class ShowCefInterface(ShowCefInterfaceSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
         
         # GigabitEthernet1/0/5 is down (if_number 13)
-        p1 = re.compile(r'^(?P<interface>\S+)\s+is\s+(?P<state>\w+)\s+\(if_number\s+(?P<if_number>\d+)\)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+)\s+is\s+(?P<state>\w+)\s+\(if_number\s+(?P<if_number>\d+)\)$')
 
         # Corresponding hwidb fast_if_number 13
-        p2 = re.compile(r'^Corresponding hwidb fast_if_number (?P<fast_if_number>\d+)$')
+        p2 = regex_engine.compile(r'^Corresponding hwidb fast_if_number (?P<fast_if_number>\d+)$')
 
         # Corresponding hwidb firstsw->if_number 13
-        p3 = re.compile(r'^Corresponding hwidb firstsw->if_number (?P<firstsw_if_number>\d+)$')
+        p3 = regex_engine.compile(r'^Corresponding hwidb firstsw->if_number (?P<firstsw_if_number>\d+)$')
 
         # Internet address is 192.168.0.131/24
-        p4 = re.compile(r'^Internet address is (?P<internet_address>\S+)$')
+        p4 = regex_engine.compile(r'^Internet address is (?P<internet_address>\S+)$')
 
         # Hardware idb is GigabitEthernet1/0/5
-        p5 = re.compile(r'^Hardware idb is (?P<hardware_idb>\S+)$')
+        p5 = regex_engine.compile(r'^Hardware idb is (?P<hardware_idb>\S+)$')
 
         # Fast switching type 1, interface type 146
-        p6 = re.compile(r'^Fast switching type (?P<fast_switching_type>\d+), interface type (?P<interface_type>\d+)$')
+        p6 = regex_engine.compile(r'^Fast switching type (?P<fast_switching_type>\d+), interface type (?P<interface_type>\d+)$')
 
         # IP CEF switching disabled
-        p7 = re.compile(r'^IP CEF switching (?P<cef_switching>\w+)$')
+        p7 = regex_engine.compile(r'^IP CEF switching (?P<cef_switching>\w+)$')
 
         # VPN Forwarding table "Mgmt-vrf"
-        p8 = re.compile(r'^VPN Forwarding table\s+\"(?P<vpn_forwarding_table>\S+)\"$')
+        p8 = regex_engine.compile(r'^VPN Forwarding table\s+\"(?P<vpn_forwarding_table>\S+)\"$')
 
         # Input fast flags 0x0, Output fast flags 0x0
-        p9 = re.compile(r'^Input fast flags (?P<input_fast_flags>\S+), Output fast flags (?P<output_fast_flags>\S+)$')
+        p9 = regex_engine.compile(r'^Input fast flags (?P<input_fast_flags>\S+), Output fast flags (?P<output_fast_flags>\S+)$')
 
         # ifindex 12(12)
-        p10 = re.compile(r'^ifindex (?P<ifindex>\S+)$')
+        p10 = regex_engine.compile(r'^ifindex (?P<ifindex>\S+)$')
 
         # Slot 1 (1) Slot unit 5 VC -1
-        p11 = re.compile(r'^Slot\s+(?P<slot>\d+)\s+\(\d+\)\s+Slot\s+unit\s+(?P<slot_unit>\d+)\s+VC\s+-\d+$')
+        p11 = regex_engine.compile(r'^Slot\s+(?P<slot>\d+)\s+\(\d+\)\s+Slot\s+unit\s+(?P<slot_unit>\d+)\s+VC\s+-\d+$')
 
         # IP MTU 0
-        p12 = re.compile(r'^IP MTU\s+(?P<mtu>\d+)$')
+        p12 = regex_engine.compile(r'^IP MTU\s+(?P<mtu>\d+)$')
 
         ret_dict = dict()
 
@@ -542,68 +542,68 @@ class ShowCefInterfaceInternal(ShowCefInterfaceInternalSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
         
         # GigabitEthernet0/0 is up (if_number 6) ['2]
-        p1 = re.compile(r'^(?P<interface>\S+)\s+is\s+(?P<state>\w+)\s+\(if_number\s+(?P<if_number>\d+)\).+$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+)\s+is\s+(?P<state>\w+)\s+\(if_number\s+(?P<if_number>\d+)\).+$')
 
         # Corresponding hwidb fast_if_number 13
-        p2 = re.compile(r'^Corresponding hwidb fast_if_number (?P<fast_if_number>\d+)$')
+        p2 = regex_engine.compile(r'^Corresponding hwidb fast_if_number (?P<fast_if_number>\d+)$')
 
         # Corresponding hwidb firstsw->if_number 13
-        p3 = re.compile(r'^Corresponding hwidb firstsw->if_number (?P<firstsw_if_number>\d+)$')
+        p3 = regex_engine.compile(r'^Corresponding hwidb firstsw->if_number (?P<firstsw_if_number>\d+)$')
 
         # Internet address is 192.168.0.131/24
-        p4 = re.compile(r'^Internet address is (?P<internet_address>\S+)$')
+        p4 = regex_engine.compile(r'^Internet address is (?P<internet_address>\S+)$')
 
         # Hardware idb is GigabitEthernet1/0/5
-        p5 = re.compile(r'^Hardware idb is (?P<hardware_idb>\S+)$')
+        p5 = regex_engine.compile(r'^Hardware idb is (?P<hardware_idb>\S+)$')
 
         # Fast switching type 1, interface type 146
-        p6 = re.compile(r'^Fast switching type (?P<fast_switching_type>\d+), interface type (?P<interface_type>\d+)$')
+        p6 = regex_engine.compile(r'^Fast switching type (?P<fast_switching_type>\d+), interface type (?P<interface_type>\d+)$')
 
         # IP CEF switching disabled
-        p7 = re.compile(r'^IP CEF switching (?P<cef_switching>\w+)$')
+        p7 = regex_engine.compile(r'^IP CEF switching (?P<cef_switching>\w+)$')
 
         # VPN Forwarding table "Mgmt-vrf"
-        p8 = re.compile(r'^VPN Forwarding table\s+\"(?P<vpn_forwarding_table>\S+)\"$')
+        p8 = regex_engine.compile(r'^VPN Forwarding table\s+\"(?P<vpn_forwarding_table>\S+)\"$')
 
         # Input fast flags 0x0, Output fast flags 0x0
-        p9 = re.compile(r'^Input fast flags (?P<input_fast_flags>\S+), Output fast flags (?P<output_fast_flags>\S+)$')
+        p9 = regex_engine.compile(r'^Input fast flags (?P<input_fast_flags>\S+), Output fast flags (?P<output_fast_flags>\S+)$')
 
         # ifindex 158(158) ['2]
-        p10 = re.compile(r'^ifindex (?P<ifindex>\S+)\s+.+$')
+        p10 = regex_engine.compile(r'^ifindex (?P<ifindex>\S+)\s+.+$')
 
         # Slot 1 (1) Slot unit 5 VC -1
-        p11 = re.compile(r'^Slot\s+(?P<slot>\d+)\s+\(\d+\)\s+Slot\s+unit\s+(?P<slot_unit>\d+)\s+VC\s+-\d+$')
+        p11 = regex_engine.compile(r'^Slot\s+(?P<slot>\d+)\s+\(\d+\)\s+Slot\s+unit\s+(?P<slot_unit>\d+)\s+VC\s+-\d+$')
 
         # IP MTU 0
-        p12 = re.compile(r'^IP MTU\s+(?P<mtu>\d+)$')
+        p12 = regex_engine.compile(r'^IP MTU\s+(?P<mtu>\d+)$')
 
         # Input features: IP not enabled discard
-        p13 = re.compile(r'^Input features:\s+(?P<input_features>.+)$')
+        p13 = regex_engine.compile(r'^Input features:\s+(?P<input_features>.+)$')
 
         # Suppressed input features: MCI Check
-        p14 = re.compile(r'^Suppressed input features:\s+(?P<suppressed_input_features>.+)$')
+        p14 = regex_engine.compile(r'^Suppressed input features:\s+(?P<suppressed_input_features>.+)$')
 
         # Flags 0x26000, hardware flags 0x5
-        p15 = re.compile(r'^Flags\s+(?P<flags>\S+), hardware flags\s+(?P<hardware_flags>\S+)$')
+        p15 = regex_engine.compile(r'^Flags\s+(?P<flags>\S+), hardware flags\s+(?P<hardware_flags>\S+)$')
 
         # VRF: Mgmt-vrf(1)
-        p16 = re.compile(r'^VRF:\s+(?P<vrf>.+)$')
+        p16 = regex_engine.compile(r'^VRF:\s+(?P<vrf>.+)$')
 
         # hwidb    status 210040 status2 200010 status3 0 status4 22
-        p17 = re.compile(r'^hwidb\s+(?P<hwidb>.+)$')
+        p17 = regex_engine.compile(r'^hwidb\s+(?P<hwidb>.+)$')
 
         # fibhwidb status 210040 status2 200010 status3 0 status4 22
-        p18 = re.compile(r'^fibhwidb\s+(?P<fibhwidb>.+)$')
+        p18 = regex_engine.compile(r'^fibhwidb\s+(?P<fibhwidb>.+)$')
 
         # IPv4: Internet address is 192.168.0.131/24
-        p19 = re.compile(r'^IPv4: Internet address is\s+(?P<address>\S+)$')
+        p19 = regex_engine.compile(r'^IPv4: Internet address is\s+(?P<address>\S+)$')
 
         # Broadcast address 255.255.255.255
-        p20 = re.compile(r'^Broadcast address\s+(?P<broadcast_address>[\d\.]+)$')
+        p20 = regex_engine.compile(r'^Broadcast address\s+(?P<broadcast_address>[\d\.]+)$')
 
         # Protocol discard for IPv4 - discarded packets: 0
         # Protocol discard for IPv6 - discarded packets: 0
-        p21 = re.compile(r'^Protocol discard for\s+(?P<protocol>(IPv4|IPv6))\s+- discarded packets:\s+(?P<discarded_packets>\d+)$')
+        p21 = regex_engine.compile(r'^Protocol discard for\s+(?P<protocol>(IPv4|IPv6))\s+- discarded packets:\s+(?P<discarded_packets>\d+)$')
 
         ret_dict = dict()
         subblock_flag = False
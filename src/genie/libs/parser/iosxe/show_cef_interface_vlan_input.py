@@ -1,5 +1,5 @@
-import re
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (And, Any, Default, Optional,
@@ -32,13 +32,13 @@ class ShowCefInterfaceVlanInput(ShowCefInterfaceVlanInputSchema):
             output = self.device.execute(self.cli_command)
 
         # Vlan18 is down (if_number  207)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<vlan_name>\S+)\s+is\s+(?P<state>\w+)\s+\(if_number\s+(?P<if_num>\d+)\)$")
         # Corresponding hwidb if_num_fastber  207
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^\s+Corresponding\s+hwidb\s+fast_if_number\s+(?P<if_num_fast>\d+)$")
         # Corresponding hwidb firstsw->if_number  207
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^\s+Corresponding\s+hwidb\s+firstsw->if_number\s+(?P<if_num_first>\d+)$")
 
         ret_dict = {}
@@ -1,8 +1,10 @@
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =================
 # Schema for:
@@ -54,25 +56,25 @@ class ShowChassis(ShowChassisSchema):
 
 
         # Chassis/Stack Mac Address : 58bf.eaff.d8cc - Local Mac Address
-        p_chassis_mac = re.compile(r"^Chassis/Stack\s+Mac\s+Address\s+:\s+(?P<chassis_mac>\S+)\s+-\s+Local\s+Mac\s+Address$")
+        p_chassis_mac = regex_engine.compile(r"^Chassis/Stack\s+Mac\s+Address\s+:\s+(?P<chassis_mac>\S+)\s+-\s+Local\s+Mac\s+Address$")
 
         # Mac persistency wait time: Indefinite
-        p_mac_wait = re.compile(r"^Mac\s+persistency\s+wait\s+time:\s+(?P<mac_time>\S+)$")
+        p_mac_wait = regex_engine.compile(r"^Mac\s+persistency\s+wait\s+time:\s+(?P<mac_time>\S+)$")
 
         # Local Redundancy Port Type: FIBRE
-        p_redun_port_type = re.compile(r"^Local\s+Redundancy\s+Port\s+Type:\s+(?P<port_type>.*)$")
+        p_redun_port_type = regex_engine.compile(r"^Local\s+Redundancy\s+Port\s+Type:\s+(?P<port_type>.*)$")
 
         # H/W   Current
-        p_header_1 = re.compile(r"^H\/W\s+Current$")
+        p_header_1 = regex_engine.compile(r"^H\/W\s+Current$")
 
         # Chassis#   Role    Mac Address     Priority Version  State                 IP
-        p_header_2 = re.compile(r"^Chassis#\s+Role\s+Mac\s+Address\s+Priority\s+Version\s+State\s+IP$")
+        p_header_2 = regex_engine.compile(r"^Chassis#\s+Role\s+Mac\s+Address\s+Priority\s+Version\s+State\s+IP$")
 
         # -------------------------------------------------------------------------------------
-        p_delimiter = re.compile(r"^-------------------------------------------------------------------------------------$")
+        p_delimiter = regex_engine.compile(r"^-------------------------------------------------------------------------------------$")
 
         # *1       Active   58bf.eaff.d8cc     2      V02     Ready                169.254.130.6
-        p_chassis_count = re.compile(
+        p_chassis_count = regex_engine.compile(
         r"^(?P<slot>\S+)\s+(?P<role>\S+)\s+(?P<mac>\S+)\s+(?P<priority>\d+)\s+(?P<hw_version>\S+)\s+(?P<state>\S+)\s+(?P<ip>\S+)$")
 
         chassis_obj = {}
@@ -177,25 +179,25 @@ class ShowChassisRmi(ShowChassisRmiSchema):
 
 
         # Chassis/Stack Mac Address : a453.0eff.dc7a - Local Mac Address
-        p_chassis_mac = re.compile(r"^Chassis/Stack\s+Mac\s+Address\s+:\s+(?P<chassis_mac>\S+)\s+-\s+Local\s+Mac\s+Address$")
+        p_chassis_mac = regex_engine.compile(r"^Chassis/Stack\s+Mac\s+Address\s+:\s+(?P<chassis_mac>\S+)\s+-\s+Local\s+Mac\s+Address$")
 
         # Mac persistency wait time: Indefinite
-        p_mac_wait = re.compile(r"^Mac\s+persistency\s+wait\s+time:\s+(?P<mac_time>\S+)$")
+        p_mac_wait = regex_engine.compile(r"^Mac\s+persistency\s+wait\s+time:\s+(?P<mac_time>\S+)$")
 
         # Local Redundancy Port Type: FIBRE
-        p_redun_port_type = re.compile(r"^Local\s+Redundancy\s+Port\s+Type:\s+(?P<port_type>.*)$")
+        p_redun_port_type = regex_engine.compile(r"^Local\s+Redundancy\s+Port\s+Type:\s+(?P<port_type>.*)$")
 
         # H/W   Current
-        p_header_1 = re.compile(r"^H\/W\s+Current$")
+        p_header_1 = regex_engine.compile(r"^H\/W\s+Current$")
 
         # Chassis#   Role    Mac Address     Priority Version  State                 IP                RMI-IP
-        p_header_2 = re.compile(r"^Chassis#\s+Role\s+Mac\s+Address\s+Priority\s+Version\s+State\s+IP\s+RMI-IP$")
+        p_header_2 = regex_engine.compile(r"^Chassis#\s+Role\s+Mac\s+Address\s+Priority\s+Version\s+State\s+IP\s+RMI-IP$")
 
         # -------------------------------------------------------------------------------------
-        p_delimiter = re.compile(r"^-+$")
+        p_delimiter = regex_engine.compile(r"^-+$")
 
         # *1       Active   4ce1.75ff.3a92     2      V02     Ready                169.254.138.6      10.8.138.6
-        p_chassis_count = re.compile(r"^(?P<slot>\S+)\s+(?P<role>\S+)\s+(?P<mac>\S+)\s+(?P<priority>\d+)\s+(?P<hw_version>\S+)\s+(?P<state>\S+)\s+(?P<ip>\S+)\s+(?P<rmi_ip>\S+)$")
+        p_chassis_count = regex_engine.compile(r"^(?P<slot>\S+)\s+(?P<role>\S+)\s+(?P<mac>\S+)\s+(?P<priority>\d+)\s+(?P<hw_version>\S+)\s+(?P<state>\S+)\s+(?P<ip>\S+)\s+(?P<rmi_ip>\S+)$")
 
         chassis_obj = {}
 
@@ -8,8 +8,8 @@ IOSXE parsers for the following show commands:
 # Python
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -47,14 +47,14 @@ class ShowCispSummary(ShowCispSummarySchema):
             output = self.device.execute(self.cli_command)
 
         # CISP not enabled
-        p1 = re.compile(r"^CISP not enabled$")
+        p1 = regex_engine.compile(r"^CISP not enabled$")
 
         # CISP is not running on any interface
         # CISP is running on the following interface(s):
-        p2 = re.compile(r"^CISP is (?P<running>not running|running) on.+$")
+        p2 = regex_engine.compile(r"^CISP is (?P<running>not running|running) on.+$")
 
         #    Gi1/0/4 (Authenticator)
-        p3 = re.compile(r"^(?P<interface>\S+)\s+\((?P<mode>\w+)\)$")
+        p3 = regex_engine.compile(r"^(?P<interface>\S+)\s+\((?P<mode>\w+)\)$")
 
         ret_dict = {}
 
@@ -122,22 +122,22 @@ class ShowCispInterface(ShowCispInterfaceSchema):
             output = self.device.execute(self.cli_command.format(intf=intf))
 
         # Version:  1
-        p1 = re.compile(r"^Version:\s+(?P<version>\d+)$")
+        p1 = regex_engine.compile(r"^Version:\s+(?P<version>\d+)$")
         
         # Mode:  Supplicant
-        p1_1 = re.compile(r"^Mode:\s+(?P<mode>\w+)$")
+        p1_1 = regex_engine.compile(r"^Mode:\s+(?P<mode>\w+)$")
         
         # Peer Mode:  Authenticator
-        p1_2 = re.compile(r"^Peer\s+Mode:\s+(?P<peer_mode>\w+)$")
+        p1_2 = regex_engine.compile(r"^Peer\s+Mode:\s+(?P<peer_mode>\w+)$")
         
         # Supp State:   Idle
-        p1_3 = re.compile(r"^Supp\s+State:\s+(?P<supp_state>\w+)$")
+        p1_3 = regex_engine.compile(r"^Supp\s+State:\s+(?P<supp_state>\w+)$")
         
         # CISP Status for interface Gi1/6
-        p1_4 = re.compile(r"^CISP\s+Status\s+for\s+interface\s+(?P<intf>\S+)$")
+        p1_4 = regex_engine.compile(r"^CISP\s+Status\s+for\s+interface\s+(?P<intf>\S+)$")
 
         # Auth State:   Idle
-        p1_5 = re.compile(r"^Auth\s+State:\s+(?P<auth_state>\w+)$")
+        p1_5 = regex_engine.compile(r"^Auth\s+State:\s+(?P<auth_state>\w+)$")
 
         ret_dict = {}
 
@@ -212,9 +212,9 @@ class ShowCispClients(ShowCispClientsSchema):
             output = self.device.execute(self.cli_command)
 
         # Supplicant Client Table:
-        p1 = re.compile(r"^(?P<mode>\w+)\s+Client\s+Table:$")
+        p1 = regex_engine.compile(r"^(?P<mode>\w+)\s+Client\s+Table:$")
         #    0c75.bdc7.e8c3   20          Gi1/6
-        p2 = re.compile(r"^\s+(?P<mac_address>\S+)\s+(?P<vlan>\d+)\s+(?P<interface>\S+)$")
+        p2 = regex_engine.compile(r"^\s+(?P<mac_address>\S+)\s+(?P<vlan>\d+)\s+(?P<interface>\S+)$")
 
         ret_dict = {}
 
@@ -272,16 +272,16 @@ class ShowCispRegistrations(ShowCispRegistrationsSchema):
             output = self.device.execute(self.cli_command)
 
         # Interface(s) with CISP registered user(s):
-        p1 = re.compile(r'^Interface\(s\) with CISP registered user\(s\):$')
+        p1 = regex_engine.compile(r'^Interface\(s\) with CISP registered user\(s\):$')
 
         # Te1/0/12
-        p2 = re.compile(r"^(?P<interface>\w+\/\w+\/[\w\.]+)$")
+        p2 = regex_engine.compile(r"^(?P<interface>\w+\/\w+\/[\w\.]+)$")
         
         # Auth Mgr (Authenticator)
-        p3 = re.compile(r"^Auth Mgr \((?P<auth_mgr>\w+)\)$")
+        p3 = regex_engine.compile(r"^Auth Mgr \((?P<auth_mgr>\w+)\)$")
 
         # 802.1x Sup (Supplicant)
-        p4 = re.compile(r"^802\.1x.+\((?P<dot1x>\w+)\)$")
+        p4 = regex_engine.compile(r"^802\.1x.+\((?P<dot1x>\w+)\)$")
 
         ret_dict = {}
 
@@ -1,8 +1,10 @@
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ===================
 # Schema for:
@@ -144,32 +146,32 @@ class ShowClassMap(ShowClassMapSchema):
         class_map_dict = {}
 
         # Class Map match-any system-cpp-police-ios-feature (id 22)
-        cm_header_capture = re.compile(
+        cm_header_capture = regex_engine.compile(
             r"^(\s+|)Class\sMap\s(?P<match_criteria>\S+)\s+(?P<cm_name>\S+)\s+\(id\s+(?P<cm_id>\d+)\)")
 
         #  Description: ICMPGEN,BROADCAST,ICMP,L2LVXCntrl,ProtoSnoop,PuntWebauth,MCASTData,Transit,DOT1XAuth,Swfwd,LOGGING,L2LVXData,ForusTraffic,ForusARP,McastEndStn,Openflow,Exception,EGRExcption,NflSampled,RpfFailed
-        description_capture = re.compile(r"^Description:\s+(?P<description>.*$)")
+        description_capture = regex_engine.compile(r"^Description:\s+(?P<description>.*$)")
 
         # Match access-group name AutoConf-4.0-Acl-Transactional-Data
-        p_match_access = re.compile(r"^Match\s+access-group\s+name\s+(?P<value>.*)$")
+        p_match_access = regex_engine.compile(r"^Match\s+access-group\s+name\s+(?P<value>.*)$")
 
         # Match protocol attribute traffic-class multimedia-conferencing
-        p_match_protocol = re.compile(r"^Match\s+protocol\s+attribute\s+(?P<value>.*)$")
+        p_match_protocol = regex_engine.compile(r"^Match\s+protocol\s+attribute\s+(?P<value>.*)$")
 
         # Match none
-        p_match_none = re.compile(r"^Match\s+none$")
+        p_match_none = regex_engine.compile(r"^Match\s+none$")
 
         # Match any
-        p_match_any = re.compile(r"^Match\s+any$")
+        p_match_any = regex_engine.compile(r"^Match\s+any$")
 
         # Match non-client-nrt
-        p_match_non_client = re.compile(r"^Match\s+non-client-nrt$")
+        p_match_non_client = regex_engine.compile(r"^Match\s+non-client-nrt$")
 
         # Match   dscp af21 (18) af22 (20) af23 (22)
-        p_match_dscp = re.compile(r"^Match\s+dscp\s+(?P<values>.*)$")
+        p_match_dscp = regex_engine.compile(r"^Match\s+dscp\s+(?P<values>.*)$")
 
         # Match cos  2
-        p_match_cos = re.compile(r"^Match\s+cos\s+(?P<values>.*)$")
+        p_match_cos = regex_engine.compile(r"^Match\s+cos\s+(?P<values>.*)$")
 
         match_index = 1
 
@@ -8,13 +8,13 @@
         *  show clns traffic
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                                Any, \
                                                Optional
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -103,58 +103,58 @@ class ShowClnsInterface(ShowClnsInterfaceSchema):
 
         # GigabitEthernet1 is up, line protocol is up
         # TokenRing 0 is administratively down, line protocol is down
-        p1 = re.compile(r'^(?P<interface>[\w]+[\d/.|\s]+) +is +'
-                        r'(?P<status>[\w\s]+), +line +protocol +is +'
-                        r'(?P<line_protocol>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>[\w]+[\d/.|\s]+) +is +'
+                                  r'(?P<status>[\w\s]+), +line +protocol +is +'
+                                  r'(?P<line_protocol>\w+)$')
         #   CLNS protocol processing disabled
-        p2 = re.compile(r'^CLNS +protocol +processing +disabled$')
+        p2 = regex_engine.compile(r'^CLNS +protocol +processing +disabled$')
         #   Checksums enabled, MTU 1497, Encapsulation SAP
-        p3 = re.compile(r'^Checksums +(?P<checksum>\w+), +MTU +(?P<mtu>\d+), '
-                        r'+Encapsulation +(?P<encapsulation>\w+)$')
+        p3 = regex_engine.compile(r'^Checksums +(?P<checksum>\w+), +MTU +(?P<mtu>\d+), '
+                                  r'+Encapsulation +(?P<encapsulation>\w+)$')
         #   ERPDUs enabled, min. interval 10 msec.
-        p4 = re.compile(r'^ERPDUs +(?P<erpdus>\w+), +min. +interval +'
-                        r'(?P<min_interval>\d+) +msec.$')
+        p4 = regex_engine.compile(r'^ERPDUs +(?P<erpdus>\w+), +min. +interval +'
+                                  r'(?P<min_interval>\d+) +msec.$')
         #   CLNS fast switching enabled
         #   CLNS SSE switching disabled
-        p5 = re.compile(r'^CLNS +(?P<fast_sse>\w+) +switching +'
-                        r'(?P<switching_status>\w+)$')
+        p5 = regex_engine.compile(r'^CLNS +(?P<fast_sse>\w+) +switching +'
+                                  r'(?P<switching_status>\w+)$')
         #   DEC compatibility mode OFF for this interface
-        p6 = re.compile(r'^DEC +compatibility +mode +'
-                        r'(?P<dec_compatibilty_mod>\w+) +for +this +interface$')
+        p6 = regex_engine.compile(r'^DEC +compatibility +mode +'
+                                  r'(?P<dec_compatibilty_mod>\w+) +for +this +interface$')
         #   Next ESH/ISH in 20 seconds
-        p7 = re.compile(r'^Next +ESH/ISH +in +(?P<next_esh_ish>\d+) +seconds$')
+        p7 = regex_engine.compile(r'^Next +ESH/ISH +in +(?P<next_esh_ish>\d+) +seconds$')
         #   Routing Protocol: IS-IS (test)
-        p8 = re.compile(r'^Routing +Protocol: +(?P<routing_protocol>[\S]+)'
-                        r'( +\((?P<process_id>\w+)\))?$')
+        p8 = regex_engine.compile(r'^Routing +Protocol: +(?P<routing_protocol>[\S]+)'
+                                  r'( +\((?P<process_id>\w+)\))?$')
         #     Circuit Type: level-1-2
-        p9 = re.compile(r'^Circuit +Type: +(?P<circuit_type>\S+)$')
+        p9 = regex_engine.compile(r'^Circuit +Type: +(?P<circuit_type>\S+)$')
         #     Interface number 0x1, local circuit ID 0x1
-        p10 = re.compile(r'^Interface +number +(?P<interface_number>\w+), '
-                         r'+local +circuit +ID +(?P<local_circuit>\w+)$')
+        p10 = regex_engine.compile(r'^Interface +number +(?P<interface_number>\w+), '
+                                   r'+local +circuit +ID +(?P<local_circuit>\w+)$')
         #     Neighbor Extended Local Circuit ID: 0x0
-        p11 = re.compile(r'^Neighbor +Extended +Local +Circuit +ID: +'
-                         r'(?P<neighbor_extended_local_circute_id>\w+)$')
+        p11 = regex_engine.compile(r'^Neighbor +Extended +Local +Circuit +ID: +'
+                                   r'(?P<neighbor_extended_local_circute_id>\w+)$')
         #     Level-1 Metric: 10, Priority: 64, Circuit ID: R2.01
-        p12 = re.compile(r'^(?P<level>\S+) +Metric: +(?P<level_metric>\d+), '
-                         r'+Priority: +(?P<priority>\d+), +Circuit +ID:'
-                         r' +(?P<circuit_id>\S+)$')
+        p12 = regex_engine.compile(r'^(?P<level>\S+) +Metric: +(?P<level_metric>\d+), '
+                                   r'+Priority: +(?P<priority>\d+), +Circuit +ID:'
+                                   r' +(?P<circuit_id>\S+)$')
         #     DR ID: R2.01
-        p13 = re.compile(r'^DR +ID: +(?P<dr_id>\S+)$')
+        p13 = regex_engine.compile(r'^DR +ID: +(?P<dr_id>\S+)$')
         #     Level-1 IPv6 Metric: 10
-        p14 = re.compile(r'^(?P<level>\S+) +IPv6 +Metric: +'
-                         r'(?P<level_ipv6_metric>\d+)$')
+        p14 = regex_engine.compile(r'^(?P<level>\S+) +IPv6 +Metric: +'
+                                   r'(?P<level_ipv6_metric>\d+)$')
         #     Number of active level-1 adjacencies: 1
-        p15 = re.compile(r'^Number +of +active +(?P<level>\S+) +adjacencies: '
-                         r'+(?P<adjacencies>\d+)$')
+        p15 = regex_engine.compile(r'^Number +of +active +(?P<level>\S+) +adjacencies: '
+                                   r'+(?P<adjacencies>\d+)$')
         #     Next IS-IS LAN Level-1 Hello in 1 seconds
         #     Next IS-IS LAN Level-2 Hello in 645 milliseconds
-        p16 = re.compile(r'^Next +IS\-IS +LAN (?P<level>\S+) +Hello +in +'
-                         r'(?P<level_hello>\d+) +(?P<milli>[\w\(\)]+)?seconds$')
+        p16 = regex_engine.compile(r'^Next +IS\-IS +LAN (?P<level>\S+) +Hello +in +'
+                                   r'(?P<level_hello>\d+) +(?P<milli>[\w\(\)]+)?seconds$')
         # Next IS-IS Hello in 0 seconds
-        p17 = re.compile(r'Next\s+IS\-IS\s+Hello\s+in\s+(?P<hello>\d+)\s+'
-                         r'(?P<milli>[\w\(\)]+)?seconds')
+        p17 = regex_engine.compile(r'Next\s+IS\-IS\s+Hello\s+in\s+(?P<hello>\d+)\s+'
+                                   r'(?P<milli>[\w\(\)]+)?seconds')
         # if state DOWN
-        p18 = re.compile(r'if\s+state\s+(?P<if_state>DOWN|UP)')       
+        p18 = regex_engine.compile(r'if\s+state\s+(?P<if_state>DOWN|UP)')       
 
         for line in out.splitlines():
             line = line.strip()
@@ -385,39 +385,39 @@ class ShowClnsProtocol(ShowClnsProtocolSchema):
         # IS-IS Router: VRF1 (0x10001)
         # IS-IS Router: <Null Tag> (0x10000)
         # IS-IS Router: test
-        p1 = re.compile(r'^\s*IS-IS Router: +(?P<tag_process>[\S\s]+?)( +\((?P<tag>\w+)\))?$')
+        p1 = regex_engine.compile(r'^\s*IS-IS Router: +(?P<tag_process>[\S\s]+?)( +\((?P<tag>\w+)\))?$')
         # System Id: 2222.22ff.4444.00  IS-Type: level-1-2
         # System Id: 0000.0000.0002.00  IS-Type: level-2  lsp-mtu: 1492
-        p2 = re.compile(r'^\s*System Id: +(?P<system_id>[\w\.]+) +IS\-Type: +(?P<is_type>[\w\-]+)(\s+lsp-mtu:\s+(?P<lsp_mtu>\d+))?$')
+        p2 = regex_engine.compile(r'^\s*System Id: +(?P<system_id>[\w\.]+) +IS\-Type: +(?P<is_type>[\w\-]+)(\s+lsp-mtu:\s+(?P<lsp_mtu>\d+))?$')
         # Manual area address(es):
-        p3 = re.compile(r'^\s*Manual +area +address\(es\):$')
+        p3 = regex_engine.compile(r'^\s*Manual +area +address\(es\):$')
         # 49.0001
-        p4 = re.compile(r'^\s*(?P<area_address>[\d\.]+)$')
+        p4 = regex_engine.compile(r'^\s*(?P<area_address>[\d\.]+)$')
         # Routing for area address(es):
-        p5 = re.compile(r'^\s*Routing +for +area +address\(es\):$')
+        p5 = regex_engine.compile(r'^\s*Routing +for +area +address\(es\):$')
         # Interfaces supported by IS-IS:
-        p6 = re.compile(r'^\s*Interfaces +supported +by +IS\-IS:$')
+        p6 = regex_engine.compile(r'^\s*Interfaces +supported +by +IS\-IS:$')
         # GigabitEthernet4 - IP - IPv6
         # Loopback1 - IP - IPv6
-        p7 = re.compile(r'^\s*(?P<interface>[A-Za-z]+[\d/.]+) \- +(?P<topology>[\w\-\ ]+)$')
+        p7 = regex_engine.compile(r'^\s*(?P<interface>[A-Za-z]+[\d/.]+) \- +(?P<topology>[\w\-\ ]+)$')
         # Redistribute:
         # Redistribute(CLNS):
-        p8 = re.compile(r'^\s*Redistribute(\(CLNS\))?:$')
+        p8 = regex_engine.compile(r'^\s*Redistribute(\(CLNS\))?:$')
         #   static (on by default)
-        p9 = re.compile(r'^(?P<space>\s{4})(?P<redistribute>[a-z\s\(\)]+)$')
+        p9 = regex_engine.compile(r'^(?P<space>\s{4})(?P<redistribute>[a-z\s\(\)]+)$')
         # Distance for L2 CLNS routes: 110
-        p10 = re.compile(r'^\s*Distance +for +L2 +CLNS +routes: +(?P<distance>\d+)$')
+        p10 = regex_engine.compile(r'^\s*Distance +for +L2 +CLNS +routes: +(?P<distance>\d+)$')
         # RRR level: none
         # RRR level: level-1
-        p11 = re.compile(r'^\s*RRR +level: +(?P<rrr_level>\S+)$')
+        p11 = regex_engine.compile(r'^\s*RRR +level: +(?P<rrr_level>\S+)$')
         # Generate narrow metrics: none
-        p12 = re.compile(r'^\s*Generate +narrow +metrics: +(?P<generate_narrow_metric>\S+)$')
+        p12 = regex_engine.compile(r'^\s*Generate +narrow +metrics: +(?P<generate_narrow_metric>\S+)$')
         # Accept narrow metrics:   none
-        p13 = re.compile(r'^\s*Accept +narrow +metrics: +(?P<accept_narrow_metric>\S+)$')
+        p13 = regex_engine.compile(r'^\s*Accept +narrow +metrics: +(?P<accept_narrow_metric>\S+)$')
         # Generate wide metrics:   level-1-2
-        p14 = re.compile(r'^\s*Generate +wide +metrics: +(?P<generate_wide_metric>\S+)$')
+        p14 = regex_engine.compile(r'^\s*Generate +wide +metrics: +(?P<generate_wide_metric>\S+)$')
         # Accept wide metrics:     level-1-2
-        p15 = re.compile(r'^\s*Accept +wide +metrics: +(?P<accept_wide_metric>\S+)$')
+        p15 = regex_engine.compile(r'^\s*Accept +wide +metrics: +(?P<accept_wide_metric>\S+)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -606,30 +606,30 @@ class ShowClnsNeighborsDetail(ShowClnsNeighborsDetailSchema):
         result_dict = {}
 
         # Tag VRF1:
-        p1 = re.compile(r'^Tag +(?P<tag>\S+):$')
+        p1 = regex_engine.compile(r'^Tag +(?P<tag>\S+):$')
         # System Id       Interface     SNPA                State  Holdtime  Type Protocol
         # R7              Gi4           5e00.c0ff.060d      Up     26        L2   M-ISIS
         # R2_xr           Gi2.115       fa16.3eff.9418      Up     26        L1L2 M-ISIS
         # Genie           Te0/3/0       sdfs.0asd.49sd      Up     25        L1   IS-IS //missing neighbor, instead Genie2 shows in JSON.
         # CIP-DC1-FBS-02  Po1.10        2cab.eb4f.3f4f      Up     8         L1L2 IS-IS
-        p2 = re.compile(r'^(?P<system_id>[\w\-\.]+) +(?P<interface>\S+) '
-                        r'+(?P<snpa>[\w\.]+) +(?P<state>\w+) +'
-                        r'(?P<holdtime>\d+) +(?P<level>[L\d]+) +'
-                        r'(?P<protocol>[\S ]+)$')
+        p2 = regex_engine.compile(r'^(?P<system_id>[\w\-\.]+) +(?P<interface>\S+) '
+                                  r'+(?P<snpa>[\w\.]+) +(?P<state>\w+) +'
+                                  r'(?P<holdtime>\d+) +(?P<level>[L\d]+) +'
+                                  r'(?P<protocol>[\S ]+)$')
         #   Area Address(es): 49.0002
-        p3 = re.compile(r'^Area +Address\(es\): +(?P<area_address>\S+)$')
+        p3 = regex_engine.compile(r'^Area +Address\(es\): +(?P<area_address>\S+)$')
         #   IP Address(es):  10.229.7.7*
-        p4 = re.compile(r'^IP +Address\(es\): +(?P<ip_address>\S+)$')
+        p4 = regex_engine.compile(r'^IP +Address\(es\): +(?P<ip_address>\S+)$')
         #   IPv6 Address(es): FE80::5C00:C0FF:FEFF:60D
-        p5 = re.compile(r'^IPv6 +Address\(es\): +(?P<ipv6_address>\S+)$')
+        p5 = regex_engine.compile(r'^IPv6 +Address\(es\): +(?P<ipv6_address>\S+)$')
         #   Uptime: 00:23:58
-        p6 = re.compile(r'^Uptime: +(?P<uptime>[\w\:]+)$')
+        p6 = regex_engine.compile(r'^Uptime: +(?P<uptime>[\w\:]+)$')
         #   NSF capable
-        p7 = re.compile(r'^NSF +(?P<nsf>\w+)$')
+        p7 = regex_engine.compile(r'^NSF +(?P<nsf>\w+)$')
         #   Topology: IPv4, IPv6
-        p8 = re.compile(r'^Topology: +(?P<topology>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^Topology: +(?P<topology>[\S\s]+)$')
         #   Interface name: GigabitEthernet4
-        p9 = re.compile(r'^Interface +name: +(?P<interface>\S+)$')
+        p9 = regex_engine.compile(r'^Interface +name: +(?P<interface>\S+)$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -766,36 +766,36 @@ class ShowClnsIsNeighborsDetail(ShowClnsIsNeighborsDetailSchema):
         result_dict = {}
 
         # Tag VRF1:
-        p1 = re.compile(r'^Tag +(?P<tag>\S+):$')
+        p1 = regex_engine.compile(r'^Tag +(?P<tag>\S+):$')
 
         # System Id       Interface     State  Type Priority  Circuit Id         Format
         # R7              Gi4           Up     L2   64        R2.01              Phase V
         # R3_nx           Gi3.115       Up     L1L2 64/64     R1_xe.02           Phase V
         # CIP-DC1-FBS-02  Po1.10        Up     L1L2 64/64     CIP-DC1-FBS-02.01  Phase V
-        p2 = re.compile(r'^(?P<system_id>[\w\.\-]+)\s+(?P<interface>\S+)\s+'
-                        r'(?P<state>\w+)\s+(?P<type>\S+)\s+(?P<priority>\d+)\s*'
-                        r'(\/\d+)*\s+(?P<circuit_id>[\w\.\-]+)\s+(?P<format>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^(?P<system_id>[\w\.\-]+)\s+(?P<interface>\S+)\s+'
+                                  r'(?P<state>\w+)\s+(?P<type>\S+)\s+(?P<priority>\d+)\s*'
+                                  r'(\/\d+)*\s+(?P<circuit_id>[\w\.\-]+)\s+(?P<format>[\S\s]+)$')
 
         #   Area Address(es): 49.0002
-        p3 = re.compile(r'^Area +Address\(es\): +(?P<area_address>\S+)$')
+        p3 = regex_engine.compile(r'^Area +Address\(es\): +(?P<area_address>\S+)$')
 
         #   IP Address(es):  10.229.7.7*
-        p4 = re.compile(r'^IP +Address\(es\): +(?P<ip_address>\S+)$')
+        p4 = regex_engine.compile(r'^IP +Address\(es\): +(?P<ip_address>\S+)$')
 
         #   IPv6 Address(es): FE80::5C00:C0FF:FEFF:60D
-        p5 = re.compile(r'^IPv6 +Address\(es\): +(?P<ipv6_address>\S+)$')
+        p5 = regex_engine.compile(r'^IPv6 +Address\(es\): +(?P<ipv6_address>\S+)$')
 
         #   Uptime: 00:24:24
-        p6 = re.compile(r'^Uptime: +(?P<uptime>[\w\:]+)$')
+        p6 = regex_engine.compile(r'^Uptime: +(?P<uptime>[\w\:]+)$')
 
         #   NSF capable
-        p7 = re.compile(r'^NSF +(?P<nsf>\w+)$')
+        p7 = regex_engine.compile(r'^NSF +(?P<nsf>\w+)$')
 
         #   Topology: IPv4, IPv6
-        p8 = re.compile(r'^Topology: +(?P<topology>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^Topology: +(?P<topology>[\S\s]+)$')
 
         #   Interface name: GigabitEthernet4
-        p9 = re.compile(r'^Interface +name: +(?P<interface>\S+)$')
+        p9 = regex_engine.compile(r'^Interface +name: +(?P<interface>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1017,96 +1017,96 @@ class ShowClnsTraffic(ShowClnsTrafficSchema):
         result_dict = {}
 
         # CLNS:  Time since last clear: never
-        p1 = re.compile(r'^CLNS:  +Time +since +last +clear: (?P<last_clear>\w+)$')
+        p1 = regex_engine.compile(r'^CLNS:  +Time +since +last +clear: (?P<last_clear>\w+)$')
         # CLNS & ESIS Output: 168, Input: 4021
-        p2 = re.compile(r'^CLNS \& +ESIS +Output: +(?P<clns_output>\d+), +Input: +(?P<clns_input>\d+)$')
+        p2 = regex_engine.compile(r'^CLNS \& +ESIS +Output: +(?P<clns_output>\d+), +Input: +(?P<clns_input>\d+)$')
         # Dropped Protocol not enabled on interface: 0
-        p3 = re.compile(r'^Dropped Protocol not enabled on interface: +(?P<dropped_protocol>\d+)$')
+        p3 = regex_engine.compile(r'^Dropped Protocol not enabled on interface: +(?P<dropped_protocol>\d+)$')
         # CLNS Local: 0, Forward: 0
-        p4 = re.compile(r'^CLNS +Local: +(?P<clns_local>\d+), Forward: +(?P<clns_forward>\d+)$')
+        p4 = regex_engine.compile(r'^CLNS +Local: +(?P<clns_local>\d+), Forward: +(?P<clns_forward>\d+)$')
         # CLNS Discards:
-        p5 = re.compile(r'CLNS +Discards:$')
+        p5 = regex_engine.compile(r'CLNS +Discards:$')
         #   Hdr Syntax: 0, Checksum: 0, Lifetime: 0, Output cngstn: 0
-        p6 = re.compile(r'^Hdr +Syntax: +(?P<hdr_syntax>\d+), +Checksum: +(?P<checksum>\d+),'
-                        r' +Lifetime: +(?P<lifetime>\d+), +Output +cngstn: +(?P<output_cngstn>\d+)$')
+        p6 = regex_engine.compile(r'^Hdr +Syntax: +(?P<hdr_syntax>\d+), +Checksum: +(?P<checksum>\d+),'
+                                  r' +Lifetime: +(?P<lifetime>\d+), +Output +cngstn: +(?P<output_cngstn>\d+)$')
         #   No Route: 0, Discard Route: 0, Dst Unreachable 0, Encaps. Failed: 0
-        p7 = re.compile(r'^No +Route: +(?P<no_route>\d+), +Discard +Route: +(?P<discard_route>\d+),'
-                        r' +Dst +Unreachable +(?P<dst_unreachable>\d+), +Encaps. +Failed: +(?P<encaps_failed>\d+)$')
+        p7 = regex_engine.compile(r'^No +Route: +(?P<no_route>\d+), +Discard +Route: +(?P<discard_route>\d+),'
+                                  r' +Dst +Unreachable +(?P<dst_unreachable>\d+), +Encaps. +Failed: +(?P<encaps_failed>\d+)$')
         #   NLP Unknown: 0, Not an IS: 0
-        p8 = re.compile(r'^NLP +Unknown: +(?P<nlp_unknown>\d+), +Not +an +IS: +(?P<not_an_is>\d+)$')
+        p8 = regex_engine.compile(r'^NLP +Unknown: +(?P<nlp_unknown>\d+), +Not +an +IS: +(?P<not_an_is>\d+)$')
         # CLNS Options: Packets 0, total 0 , bad 0, GQOS 0, cngstn exprncd 0
-        p9 = re.compile(r'^CLNS +Options: +Packets +(?P<packets>\d+), +total +(?P<total>\d+) ,'
-                        r' +bad +(?P<bad>\d+), +GQOS +(?P<gqos>\d+), +cngstn +exprncd +(?P<cngstn_exprncd>\d+)$')
+        p9 = regex_engine.compile(r'^CLNS +Options: +Packets +(?P<packets>\d+), +total +(?P<total>\d+) ,'
+                                  r' +bad +(?P<bad>\d+), +GQOS +(?P<gqos>\d+), +cngstn +exprncd +(?P<cngstn_exprncd>\d+)$')
         # CLNS Segments:  Segmented: 0, Failed: 0
-        p10 = re.compile(r'^CLNS +Segments:  +Segmented: +(?P<segmented>\d+), +Failed: +(?P<failed>\d+)$')
+        p10 = regex_engine.compile(r'^CLNS +Segments:  +Segmented: +(?P<segmented>\d+), +Failed: +(?P<failed>\d+)$')
         # CLNS Broadcasts: sent: 0, rcvd: 0
-        p11 = re.compile(r'^CLNS +Broadcasts: sent: +(?P<sent>\d+), +rcvd: +(?P<rcvd>\d+)$')
+        p11 = regex_engine.compile(r'^CLNS +Broadcasts: sent: +(?P<sent>\d+), +rcvd: +(?P<rcvd>\d+)$')
         # Echos: Rcvd 0 requests, 0 replies
-        p12 = re.compile(r'^Echos: +Rcvd +(?P<requests>\d+) +requests, +(?P<replied>\d+) +replies$')
+        p12 = regex_engine.compile(r'^Echos: +Rcvd +(?P<requests>\d+) +requests, +(?P<replied>\d+) +replies$')
         #       Sent 0 requests, 0 replies
-        p13 = re.compile(r'^Sent +(?P<requests>\d+) +requests, +(?P<replied>\d+) +replies$')
+        p13 = regex_engine.compile(r'^Sent +(?P<requests>\d+) +requests, +(?P<replied>\d+) +replies$')
         # ESIS(sent/rcvd): ESHs: 0/0, ISHs: 168/0, RDs: 0/0, QCF: 0/0
-        p14 = re.compile(r'^ESIS\(sent\/rcvd\): +ESHs: +(?P<esh_sent>\d+)/(?P<esh_rcvd>\d+),'
-                         r' +ISHs: +(?P<ish_sent>\d+)/(?P<ish_rcvd>\d+),'
-                         r' +RDs: +(?P<rd_sent>\d+)/(?P<rd_rcvd>\d+), +QCF: +(?P<qcf_sent>\d+)/(?P<qcf_rcvd>\d+)$')
+        p14 = regex_engine.compile(r'^ESIS\(sent\/rcvd\): +ESHs: +(?P<esh_sent>\d+)/(?P<esh_rcvd>\d+),'
+                                   r' +ISHs: +(?P<ish_sent>\d+)/(?P<ish_rcvd>\d+),'
+                                   r' +RDs: +(?P<rd_sent>\d+)/(?P<rd_rcvd>\d+), +QCF: +(?P<qcf_sent>\d+)/(?P<qcf_rcvd>\d+)$')
         # Tunneling (sent/rcvd): IP: 0/0, IPv6: 0/0
-        p15 = re.compile(r'^Tunneling +\(sent\/rcvd\): +IP: +(?P<ip_sent>\d+)/(?P<ip_rcvd>\d+),'
-                         r' +IPv6: +(?P<ipv6_sent>\d+)/(?P<ipv6_rcvd>\d+)$')
+        p15 = regex_engine.compile(r'^Tunneling +\(sent\/rcvd\): +IP: +(?P<ip_sent>\d+)/(?P<ip_rcvd>\d+),'
+                                   r' +IPv6: +(?P<ipv6_sent>\d+)/(?P<ipv6_rcvd>\d+)$')
         # Tunneling dropped (rcvd) IP/IPV6:  0
-        p16 = re.compile(r'^Tunneling +dropped +\(rcvd\) +IP\/IPV6:  +(?P<tunneling_dropped>\d+)$')
+        p16 = regex_engine.compile(r'^Tunneling +dropped +\(rcvd\) +IP\/IPV6:  +(?P<tunneling_dropped>\d+)$')
         # ISO-IGRP: Querys (sent/rcvd): 0/0 Updates (sent/rcvd): 0/0
-        p17 = re.compile(r'^ISO-IGRP: +Querys +\(sent\/rcvd\): (?P<query_sent>\d+)/(?P<query_rcvd>\d+)'
-                         r' +Updates +\(sent\/rcvd\): +(?P<update_sent>\d+)/(?P<update_rcvd>\d+)$')
+        p17 = regex_engine.compile(r'^ISO-IGRP: +Querys +\(sent\/rcvd\): (?P<query_sent>\d+)/(?P<query_rcvd>\d+)'
+                                   r' +Updates +\(sent\/rcvd\): +(?P<update_sent>\d+)/(?P<update_rcvd>\d+)$')
         # ISO-IGRP: Router Hellos: (sent/rcvd): 0/0
-        p18 = re.compile(r'^ISO-IGRP: +Router +Hellos: +\(sent\/rcvd\): +(?P<hello_sent>\d+)\/+(?P<hello_rcvd>\d+)$')
+        p18 = regex_engine.compile(r'^ISO-IGRP: +Router +Hellos: +\(sent\/rcvd\): +(?P<hello_sent>\d+)\/+(?P<hello_rcvd>\d+)$')
         # ISO-IGRP Syntax Errors: 0
-        p19 = re.compile(r'^ISO\-IGRP +Syntax +Errors: +(?P<syntax_errors>\d+)$')
+        p19 = regex_engine.compile(r'^ISO\-IGRP +Syntax +Errors: +(?P<syntax_errors>\d+)$')
         # Tag VRF1:
-        p20 = re.compile(r'^Tag +(?P<tag>\S+):$')
+        p20 = regex_engine.compile(r'^Tag +(?P<tag>\S+):$')
         #     IS-IS: Time since last clear: never
-        p21 = re.compile(r'^IS\-IS: +Time +since +last +clear: +(?P<last_clear>\S+)$')
+        p21 = regex_engine.compile(r'^IS\-IS: +Time +since +last +clear: +(?P<last_clear>\S+)$')
         #     IS-IS: Level-1 Hellos (sent/rcvd): 497/533
-        p22 = re.compile(r'^IS\-IS: +Level\-1 +Hellos \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
+        p22 = regex_engine.compile(r'^IS\-IS: +Level\-1 +Hellos \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
         #     IS-IS: Level-2 Hellos (sent/rcvd): 843/611
-        p23 = re.compile(r'^IS\-IS: +Level\-2 +Hellos \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
+        p23 = regex_engine.compile(r'^IS\-IS: +Level\-2 +Hellos \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
         #     IS-IS: PTP Hellos     (sent/rcvd): 0/0
-        p24 = re.compile(r'^IS\-IS: +PTP +Hellos *\(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
+        p24 = regex_engine.compile(r'^IS\-IS: +PTP +Hellos *\(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
         #     IS-IS: Level-1 LSPs sourced (new/refresh): 3/4
-        p25 = re.compile(r'^IS\-IS: +Level\-1 +LSPs +sourced \(new\/refresh\): +(?P<new>\d+)\/(?P<refresh>\d+)$')
+        p25 = regex_engine.compile(r'^IS\-IS: +Level\-1 +LSPs +sourced \(new\/refresh\): +(?P<new>\d+)\/(?P<refresh>\d+)$')
         #     IS-IS: Level-2 LSPs sourced (new/refresh): 4/5
-        p26 = re.compile(r'^IS\-IS: +Level\-2 +LSPs +sourced \(new\/refresh\): +(?P<new>\d+)\/(?P<refresh>\d+)$')
+        p26 = regex_engine.compile(r'^IS\-IS: +Level\-2 +LSPs +sourced \(new\/refresh\): +(?P<new>\d+)\/(?P<refresh>\d+)$')
         #     IS-IS: Level-1 LSPs flooded (sent/rcvd): 0/0
-        p27 = re.compile(r'^IS\-IS: +Level\-1 +LSPs +flooded \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
+        p27 = regex_engine.compile(r'^IS\-IS: +Level\-1 +LSPs +flooded \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
         #     IS-IS: Level-2 LSPs flooded (sent/rcvd): 5/5
-        p28 = re.compile(r'^IS\-IS: +Level\-2 +LSPs +flooded \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
+        p28 = regex_engine.compile(r'^IS\-IS: +Level\-2 +LSPs +flooded \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
         #     IS-IS: LSP Retransmissions: 0
-        p29 = re.compile(r'^IS\-IS: +LSP +Retransmissions: +(?P<lsp_retransmissions>\d+)$')
+        p29 = regex_engine.compile(r'^IS\-IS: +LSP +Retransmissions: +(?P<lsp_retransmissions>\d+)$')
         #     IS-IS: Level-1 CSNPs (sent/rcvd): 0/0
-        p30 = re.compile(r'^IS\-IS: +Level\-1 +CSNPs \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
+        p30 = regex_engine.compile(r'^IS\-IS: +Level\-1 +CSNPs \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
         #     IS-IS: Level-2 CSNPs (sent/rcvd): 170/0
-        p31 = re.compile(r'^IS\-IS: +Level\-2 +CSNPs \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
+        p31 = regex_engine.compile(r'^IS\-IS: +Level\-2 +CSNPs \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
         #     IS-IS: Level-1 PSNPs (sent/rcvd): 0/0
-        p32 = re.compile(r'^IS\-IS: +Level\-1 +PSNPs \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
+        p32 = regex_engine.compile(r'^IS\-IS: +Level\-1 +PSNPs \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
         #     IS-IS: Level-2 PSNPs (sent/rcvd): 0/0
-        p33 = re.compile(r'^IS\-IS: +Level\-2 +PSNPs \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
+        p33 = regex_engine.compile(r'^IS\-IS: +Level\-2 +PSNPs \(sent\/rcvd\): +(?P<sent>\d+)\/(?P<rcvd>\d+)$')
         #     IS-IS: Level-1 DR Elections: 1
-        p34 = re.compile(r'^IS\-IS: +Level\-1 +DR +Elections: +(?P<dr_elections>\d+)$')
+        p34 = regex_engine.compile(r'^IS\-IS: +Level\-1 +DR +Elections: +(?P<dr_elections>\d+)$')
         #     IS-IS: Level-2 DR Elections: 2
-        p35 = re.compile(r'^IS\-IS: +Level\-2 +DR +Elections: +(?P<dr_elections>\d+)$')
+        p35 = regex_engine.compile(r'^IS\-IS: +Level\-2 +DR +Elections: +(?P<dr_elections>\d+)$')
         #     IS-IS: Level-1 SPF Calculations: 14
-        p36 = re.compile(r'^IS\-IS: +Level\-1 +SPF +Calculations: +(?P<spf_calculation>\d+)$')
+        p36 = regex_engine.compile(r'^IS\-IS: +Level\-1 +SPF +Calculations: +(?P<spf_calculation>\d+)$')
         #     IS-IS: Level-2 SPF Calculations: 17
-        p37 = re.compile(r'^IS\-IS: +Level\-2 +SPF +Calculations: +(?P<spf_calculation>\d+)$')
+        p37 = regex_engine.compile(r'^IS\-IS: +Level\-2 +SPF +Calculations: +(?P<spf_calculation>\d+)$')
         #     IS-IS: Level-1 Partial Route Calculations: 0
-        p38 = re.compile(r'^IS\-IS: +Level\-1 +Partial +Route +Calculations: +(?P<partial_route_calculations>\d+)$')
+        p38 = regex_engine.compile(r'^IS\-IS: +Level\-1 +Partial +Route +Calculations: +(?P<partial_route_calculations>\d+)$')
         #     IS-IS: Level-2 Partial Route Calculations: 1
-        p39 = re.compile(r'^IS\-IS: +Level\-2 +Partial +Route +Calculations: +(?P<partial_route_calculations>\d+)$')
+        p39 = regex_engine.compile(r'^IS\-IS: +Level\-2 +Partial +Route +Calculations: +(?P<partial_route_calculations>\d+)$')
         #     IS-IS: LSP checksum errors received: 0
-        p40 = re.compile(r'^IS\-IS: +LSP +checksum +errors +received: +(?P<lsp_checksum_errors_received>\d+)$')
+        p40 = regex_engine.compile(r'^IS\-IS: +LSP +checksum +errors +received: +(?P<lsp_checksum_errors_received>\d+)$')
         #     IS-IS: Update process queue depth: 0/200
-        p41 = re.compile(r'^IS\-IS: +Update +process +queue +depth: +(?P<update_process_queue_depth>[\d\/]+)$')
+        p41 = regex_engine.compile(r'^IS\-IS: +Update +process +queue +depth: +(?P<update_process_queue_depth>[\d\/]+)$')
         #     IS-IS: Update process packets dropped: 0
-        p42 = re.compile(r'^IS\-IS: +Update +process +packets +dropped: +(?P<update_process_packets_dropped>\d+)$')
+        p42 = regex_engine.compile(r'^IS\-IS: +Update +process +packets +dropped: +(?P<update_process_packets_dropped>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
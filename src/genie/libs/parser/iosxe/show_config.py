@@ -3,15 +3,15 @@ IOSXE parsers for the following show command
     * show configuration lock
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                             Optional, \
                                             Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ==================================================
 # Parser for 'show configuration lock'
 # ==================================================
@@ -75,59 +75,59 @@ class ShowConfigurationLock(ShowConfigurationLockSchema):
         # Owner PID : -1
         # Owner PID : 543
         # Owner PID :10
-        p1 = re.compile(r'^\s*Owner +PID +: *(?P<owner_pid>(\-)?\d+)$')
+        p1 = regex_engine.compile(r'^\s*Owner +PID +: *(?P<owner_pid>(\-)?\d+)$')
         # TTY number : 2
-        p2 = re.compile(r'^\s*TTY +number +: +(?P<tty_number>\d+)$')
+        p2 = regex_engine.compile(r'^\s*TTY +number +: +(?P<tty_number>\d+)$')
         # TTY username : Test1
-        p3 = re.compile(r'^\s*TTY +username +: +(?P<tty_username>\S+)$')
+        p3 = regex_engine.compile(r'^\s*TTY +username +: +(?P<tty_username>\S+)$')
         # User debug info : CLI Session Lock
 
-        p4 = re.compile(r'^\s*User +debug +info +: '\
+        p4 = regex_engine.compile(r'^\s*User +debug +info +: '\
 		r'+(?P<user_debug_info>(\w+ *)+)$')
         # Look Active time (in Sec) : 63
-        p5 = re.compile(r'^\s*Lock +(a|A)ctive +time +\(in +Sec\) +: '\
-                r'+(?P<lock_active_time_in_sec>\d+)$')
+        p5 = regex_engine.compile(r'^\s*Lock +(a|A)ctive +time +\(in +Sec\) +: '\
+                          r'+(?P<lock_active_time_in_sec>\d+)$')
         # Parser Configure Lock
-        p6 = re.compile(r'^\s*Parser +Configure +Lock$')
+        p6 = regex_engine.compile(r'^\s*Parser +Configure +Lock$')
         
         # User              : User1
         # User:User1
-        p7 = re.compile(r'^\s*User *: *(?P<user>\S+)$')
+        p7 = regex_engine.compile(r'^\s*User *: *(?P<user>\S+)$')
         # TTY               : 3
         # TTY:3
-        p8 = re.compile(r'^\s*TTY *: *(?P<tty>(\-)?\d+)$')
+        p8 = regex_engine.compile(r'^\s*TTY *: *(?P<tty>(\-)?\d+)$')
         # Type              : EXCLUSIVE
         # Type:EXCLUSIVE
-        p9 = re.compile(r'^\s*Type *: *(?P<type>[\w\W]+)$')
+        p9 = regex_engine.compile(r'^\s*Type *: *(?P<type>[\w\W]+)$')
         # State             : LOCKED
         # State:LOCKED
-        p10 = re.compile(r'^\s*State *: *(?P<state>\S+)$')
+        p10 = regex_engine.compile(r'^\s*State *: *(?P<state>\S+)$')
         # Class             : Exposed
         # Class:Exposed
-        p11 = re.compile(r'^\s*Class *: *(?P<class_name>\S+)$')
+        p11 = regex_engine.compile(r'^\s*Class *: *(?P<class_name>\S+)$')
         # Count             : 0
         # Count:0
-        p12 = re.compile(r'^\s*Count *: *(?P<count>\d+)$')
+        p12 = regex_engine.compile(r'^\s*Count *: *(?P<count>\d+)$')
         # Pending Requests  : 0
         # Pending Requests:0
-        p13 = re.compile(r'^\s*Pending +Requests *: '\
+        p13 = regex_engine.compile(r'^\s*Pending +Requests *: '\
 		r'*(?P<pending_requests>\d+)$')
         # User debug info   : 0
         # User debug info:0
-        p14 = re.compile(r'^\s*User +debug +info *: '\
+        p14 = regex_engine.compile(r'^\s*User +debug +info *: '\
 		r'*(?P<user_debug_info>[\w\W]+)$')
         # Session idle state : TRUE
-        p15 = re.compile(r'^Session +idle +state *: *(?P<session_idle_state>[\w]+)$')
+        p15 = regex_engine.compile(r'^Session +idle +state *: *(?P<session_idle_state>[\w]+)$')
         # No of exec cmds getting executed : 0
-        p16 = re.compile(r'^No +of +exec +cmds +getting +executed *: *(?P<num_of_exec_cmds_executed>\d+)$')
+        p16 = regex_engine.compile(r'^No +of +exec +cmds +getting +executed *: *(?P<num_of_exec_cmds_executed>\d+)$')
         # No of exec cmds blocked : 0
-        p17 = re.compile(r'^No +of +exec +cmds +blocked *: *(?P<num_of_exec_cmds_blocked>\d+)$')
+        p17 = regex_engine.compile(r'^No +of +exec +cmds +blocked *: *(?P<num_of_exec_cmds_blocked>\d+)$')
         # Config wait for show completion : FALSE
-        p18 = re.compile(r'^Config +wait +for +show +completion *: *(?P<config_wait_for_show_completion>[\w]+)$')
+        p18 = regex_engine.compile(r'^Config +wait +for +show +completion *: *(?P<config_wait_for_show_completion>[\w]+)$')
         # Remote ip address : Unknown
-        p19 = re.compile(r'^Remote +ip +address *: *(?P<remote_ip_address>[\w]+)$')
+        p19 = regex_engine.compile(r'^Remote +ip +address *: *(?P<remote_ip_address>[\w]+)$')
         # Lock Expiration timer (in Sec) : 593
-        p20 = re.compile(r'^Lock +Expiration +timer +\(in +Sec\) *: *(?P<lock_expiration_timer_in_sec>[\w]+)$')
+        p20 = regex_engine.compile(r'^Lock +Expiration +timer +\(in +Sec\) *: *(?P<lock_expiration_timer_in_sec>[\w]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -11,6 +11,7 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -102,51 +103,51 @@ class ShowControllerVDSL(ShowControllerVDSLSchema):
         ctrl_dict = {}
 
         # Controller VDSL 0/2/0 is UP
-        p1 = re.compile(r'^[Cc]on\w+\s(?P<ctrl>\w+\s\S+)\s+\w+\s+(?P<state>\w+)$')
+        p1 = regex_engine.compile(r'^[Cc]on\w+\s(?P<ctrl>\w+\s\S+)\s+\w+\s+(?P<state>\w+)$')
 
         # Daemon Status: UP
-        p2 = re.compile(r'^(?P<param>Dae\w+\s+\w+):\s+(?P<vl>\w+)$')
+        p2 = regex_engine.compile(r'^(?P<param>Dae\w+\s+\w+):\s+(?P<vl>\w+)$')
 
         # Serial Number Near: FGL223491WW C1127X-8 17.7.20210
         # Modem Version Near: 17.7.2021 0524: 03251
-        p2_1 = re.compile(r'^(?P<param>Serial\s+Number\s+Near):\s+(?P<vl>.+)$')
+        p2_1 = regex_engine.compile(r'^(?P<param>Serial\s+Number\s+Near):\s+(?P<vl>.+)$')
 
         # Modem Version Near: 17.7.20210524: 03251
         # Modem Version Far: 0x544d
-        p2_2 = re.compile(r'^(?P<param>Modem\s+Version\s+Far):\s+(?P<vl>.+)$')
+        p2_2 = regex_engine.compile(r'^(?P<param>Modem\s+Version\s+Far):\s+(?P<vl>.+)$')
 
         # Modem Status: TC Sync(Showtime!)
-        p2_3 = re.compile(r'^(?P<param>Modem\s+Status):\s+(?P<vl>.+)$')
+        p2_3 = regex_engine.compile(r'^(?P<param>Modem\s+Status):\s+(?P<vl>.+)$')
         
         # DSL Config Mode: ADSL2 +
-        p2_4 = re.compile(r'^(?P<param>DSL\s+\w+\s+\w+):\s+(?P<vl>.+)$')
+        p2_4 = regex_engine.compile(r'^(?P<param>DSL\s+\w+\s+\w+):\s+(?P<vl>.+)$')
 
         # Trained Mode: G.992.5 (ADSL2 +) Annex A
-        p2_5 = re.compile(r'^(?P<param>Tr\w+\s+\w+):\s+(?P<vl>.+)$')
+        p2_5 = regex_engine.compile(r'^(?P<param>Tr\w+\s+\w+):\s+(?P<vl>.+)$')
 
         # TC Mode: ATM
-        p2_6 = re.compile(r'^(?P<param>TC\s+\w+):\s+(?P<vl>.+)$')
+        p2_6 = regex_engine.compile(r'^(?P<param>TC\s+\w+):\s+(?P<vl>.+)$')
 
         # Selftest Result: 0x00
-        p2_7 = re.compile(r'^(?P<param>Se\w+\s+\w+):\s+(?P<vl>.+)$')
+        p2_7 = regex_engine.compile(r'^(?P<param>Se\w+\s+\w+):\s+(?P<vl>.+)$')
 
         # Short inits: 0
-        p2_8 = re.compile(r'^(?P<param>Sh\w+\s+\w+):\s+(?P<vl>.+)$')
+        p2_8 = regex_engine.compile(r'^(?P<param>Sh\w+\s+\w+):\s+(?P<vl>.+)$')
 
         # DELT configuration: disabled
         # DELT state: not running
-        p2_9 = re.compile(r'^(?P<param>DELT\s+\w+):\s+(?P<vl>.+)$')
+        p2_9 = regex_engine.compile(r'^(?P<param>DELT\s+\w+):\s+(?P<vl>.+)$')
 
         # Failed full inits: 0
         # Failed short inits: 0
-        p2_10 = re.compile(r'^(?P<param>Failed\s+\w+\s+\w+):\s+(?P<vl>.+)$')
+        p2_10 = regex_engine.compile(r'^(?P<param>Failed\s+\w+\s+\w+):\s+(?P<vl>.+)$')
 
         # Modem FW Version: 4.14L.04
-        p2_11 = re.compile(r'^(?P<param>Modem\s+FW+\s+\w+):\s+(?P<vl>.+)$')
+        p2_11 = regex_engine.compile(r'^(?P<param>Modem\s+FW+\s+\w+):\s+(?P<vl>.+)$')
 
         # Modem PHY Version: A2pv6F039x8.d26d
         # Modem PHY Source: System
-        p2_12 = re.compile(r'^(?P<param>Modem\s+PHY+\s+\w+):\s+(?P<vl>.+)$')
+        p2_12 = regex_engine.compile(r'^(?P<param>Modem\s+PHY+\s+\w+):\s+(?P<vl>.+)$')
 
         # SRA count: 0    0
         # Total FECC: 799014    23383
@@ -157,28 +158,28 @@ class ShowControllerVDSL(ShowControllerVDSLSchema):
         # Total LPRS: 0     0
         # Total LOFS: 0     0
         # Total LOLS: 0     0
-        p3 = re.compile(r'^(?P<param>\w+\s+\w+):\s+(?P<xtr>\d+)\s+(?P<xtc>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<param>\w+\s+\w+):\s+(?P<xtr>\d+)\s+(?P<xtc>\d+)$')
 
         # Bit swap: enabled     enabled
-        p3_1 = re.compile(r'^(?P<param>\w+\s+\w+):\s+(?P<xtr>[enabled|disable]+)\s+(?P<xtc>\w+)$')
+        p3_1 = regex_engine.compile(r'^(?P<param>\w+\s+\w+):\s+(?P<xtr>[enabled|disable]+)\s+(?P<xtc>\w+)$')
 
         # Bit swap count: 18    3
-        p3_2 = re.compile(r'^(?P<param>\w+\s+\w+\s+\w+):\s+(?P<xtr>\d+)\s+(?P<xtc>\d+)$')
+        p3_2 = regex_engine.compile(r'^(?P<param>\w+\s+\w+\s+\w+):\s+(?P<xtr>\d+)\s+(?P<xtc>\d+)$')
 
         # Line Attenuation: 4.0 dB      2.2 dB
         # Signal Attenuation: 2.9 dB     0.0 dB
         # Noise Margin: 9.4 dB    5.8 dB
-        p3_3 = re.compile(r'^(?P<param>\w+\s+\w+):\s+(?P<xtr>\d+.\d\s+dB)\s+(?P<xtc>\d+.\d\s+dB)$')
+        p3_3 = regex_engine.compile(r'^(?P<param>\w+\s+\w+):\s+(?P<xtr>\d+.\d\s+dB)\s+(?P<xtc>\d+.\d\s+dB)$')
 
         # Actual Power: 19.1 dBm     12.1 dBm
-        p3_4 = re.compile(r'^(?P<param>\w+\s+\w+):\s+(?P<xtr>\d+.\d\s+dBm)\s+(?P<xtc>.+)$')
+        p3_4 = regex_engine.compile(r'^(?P<param>\w+\s+\w+):\s+(?P<xtr>\d+.\d\s+dBm)\s+(?P<xtc>.+)$')
 
         # Trellis: ON     ON
         # SRA: enabled    enabled
-        p3_5 = re.compile(r'^(?P<param>\w+):\s+(?P<xtr>\w+)\s+(?P<xtc>\w+)$')
+        p3_5 = regex_engine.compile(r'^(?P<param>\w+):\s+(?P<xtr>\w+)\s+(?P<xtc>\w+)$')
 
         # Attainable Rate: 23708 kbits/s       1351 kbits/s
-        p3_6 = re.compile(r'^(?P<param>\w+\s+\w+):\s+(?P<xtr>\d+\s+\S+)\s+(?P<xtc>\d+\s+\S+)$')
+        p3_6 = regex_engine.compile(r'^(?P<param>\w+\s+\w+):\s+(?P<xtr>\d+\s+\S+)\s+(?P<xtc>\d+\s+\S+)$')
 
         # Chip Vendor ID: 'BDCM'                   'BDCM'
         # Chip Vendor Specific: 0x0000        0x544D
@@ -187,19 +188,19 @@ class ShowControllerVDSL(ShowControllerVDSLSchema):
         # Modem Vendor Specific: 0x4602       0x544D
         # Modem Vendor Country: 0xB500        0xB500
         # Serial Number Near: FGL223491WW C1127X - 8 17.7.20210
-        p3_7 = re.compile(r'^(?P<param>\w+\s+\w+\s+\w+):\s+(?P<xtr>\S+)\s+(?P<xtc>\S+.+)$')
+        p3_7 = regex_engine.compile(r'^(?P<param>\w+\s+\w+\s+\w+):\s+(?P<xtr>\S+)\s+(?P<xtc>\S+.+)$')
 
         # Per Band Status: D1  D2  D3  U0  U1  U2  U3
         # Line Attenuation(dB): 0.9    2.4 2.4 N / A   2.0 1.1 N / A
         # Signal  Attenuation(dB): 0.9    2.4 2.4  N / A   1.5 0.6 N / A
         # Noise Margin(dB): 19.1    18.6    18.6    N / A   5.7 5.6 N / A
-        p4 = re.compile(r'^(?P<param>\w+\s+\w+\(dB\)):\s+(?P<d1>\d+.\d+)\s+(?P<d2>\d+.\d+)\s+(?P<d3>\d+.\d+)\s+\S+\s+(?P<u1>\d+.\d+)\s+(?P<u2>\d+.\d+)\s+(?P<u3>\S+)$')
+        p4 = regex_engine.compile(r'^(?P<param>\w+\s+\w+\(dB\)):\s+(?P<d1>\d+.\d+)\s+(?P<d2>\d+.\d+)\s+(?P<d3>\d+.\d+)\s+\S+\s+(?P<u1>\d+.\d+)\s+(?P<u2>\d+.\d+)\s+(?P<u3>\S+)$')
 
         # Training Log: Stopped
-        p5 = re.compile(r'^(?P<param>\w+\s+\w+)\s+:\s+(?P<state>\S+)$')
+        p5 = regex_engine.compile(r'^(?P<param>\w+\s+\w+)\s+:\s+(?P<state>\S+)$')
 
         # Training Log Filename: flash:vdsllog.bin
-        p6 = re.compile(r'^(?P<param>\w+\s+\w+\s+\w+)\s+:\s+(?P<state>\S+)$')
+        p6 = regex_engine.compile(r'^(?P<param>\w+\s+\w+\s+\w+)\s+:\s+(?P<state>\S+)$')
 
         # DS Channel1    DS Channel0    US Channel1    US Channel0
         # Previous Speed: NA   0   NA  0
@@ -208,17 +209,17 @@ class ShowControllerVDSL(ShowControllerVDSLSchema):
         # CRC Errors: NA  0   NA  3
         # Header Errors: NA  0   NA  1
         # Actual INP: NA 0.00    NA  0.00
-        p7 = re.compile(r'^(?P<param>\w+\s\w+):\s+(?P<d_ch1>[\w\d.]+)\s+(?P<d_ch0>[\d.]+)\s+(?P<u_ch1>[\w\d.]+)\s+(?P<u_ch0>[\d.]+)$')
+        p7 = regex_engine.compile(r'^(?P<param>\w+\s\w+):\s+(?P<d_ch1>[\w\d.]+)\s+(?P<d_ch0>[\d.]+)\s+(?P<u_ch1>[\w\d.]+)\s+(?P<u_ch0>[\d.]+)$')
 
         # Speed (kbps): NA 23756   NA  1283
         # Interleave (ms): NA  0.08    NA  0.49
-        p7_1 = re.compile(r'^(?P<param>\w+\s\(\w+\)):\s+(?P<d_ch1>[\w\d.]+)\s+(?P<d_ch0>[\d.]+)\s+(?P<u_ch1>[\w\d.]+)\s+(?P<u_ch0>[\d.]+)$')
+        p7_1 = regex_engine.compile(r'^(?P<param>\w+\s\(\w+\)):\s+(?P<d_ch1>[\w\d.]+)\s+(?P<d_ch0>[\d.]+)\s+(?P<u_ch1>[\w\d.]+)\s+(?P<u_ch0>[\d.]+)$')
 
         # SRA Previous Speed: NA   0   NA  0
-        p7_2 = re.compile(r'^(?P<param>\w+\s\w+\s+\w+):\s+(?P<d_ch1>[\w\d.]+)\s+(?P<d_ch0>[\d.]+)\s+(?P<u_ch1>[\w\d.]+)\s+(?P<u_ch0>[\d.]+)$')
+        p7_2 = regex_engine.compile(r'^(?P<param>\w+\s\w+\s+\w+):\s+(?P<d_ch1>[\w\d.]+)\s+(?P<d_ch0>[\d.]+)\s+(?P<u_ch1>[\w\d.]+)\s+(?P<u_ch0>[\d.]+)$')
 
         # Reed - Solomon EC: NA  0   NA  0
-        p7_3 = re.compile(r'^(?P<param>\w+-\w+\s+\w+):\s+(?P<d_ch1>[\w\d.]+)\s+(?P<d_ch0>[\d.]+)\s+(?P<u_ch1>[\w\d.]+)\s+(?P<u_ch0>[\d.]+)$')
+        p7_3 = regex_engine.compile(r'^(?P<param>\w+-\w+\s+\w+):\s+(?P<d_ch1>[\w\d.]+)\s+(?P<d_ch0>[\d.]+)\s+(?P<u_ch1>[\w\d.]+)\s+(?P<u_ch0>[\d.]+)$')
 
         for lines in out.splitlines():
             line = lines.strip()
@@ -594,52 +595,52 @@ class ShowControllers(ShowControllersSchema):
         config_dict = {}
 
         # GigabitEthernet 0/0/0 Cumulative Statistics:
-        p1 = re.compile(r"^(?P<interfaces>[A-Za-z]+\s+\d[/]+\d[/]+\d)")
+        p1 = regex_engine.compile(r"^(?P<interfaces>[A-Za-z]+\s+\d[/]+\d[/]+\d)")
 
         # Input packet count             7628882
-        p2 = re.compile(r"^Input\spacket count\s+(?P<input_packet_count>\d+)")
+        p2 = regex_engine.compile(r"^Input\spacket count\s+(?P<input_packet_count>\d+)")
 
         # Input bytes count              1370799013
-        p3 = re.compile(r"^Input\sbytes count\s+(?P<input_bytes_count>\d+)")
+        p3 = regex_engine.compile(r"^Input\sbytes count\s+(?P<input_bytes_count>\d+)")
 
         # Input mcast packets            7193
-        p4 = re.compile(r"^Input\smcast packets\s+(?P<input_mcast_pkts>\d+)")
+        p4 = regex_engine.compile(r"^Input\smcast packets\s+(?P<input_mcast_pkts>\d+)")
 
         # Input bcast packets            1
-        p5 = re.compile(r"^Input\sbcast packets\s+(?P<input_bcast_pkts>\d+)")
+        p5 = regex_engine.compile(r"^Input\sbcast packets\s+(?P<input_bcast_pkts>\d+)")
 
         # Input CRC errors               0
-        p6 = re.compile(r"^Input\sCRC errors\s+(?P<input_crc_errors>\d+)")
+        p6 = regex_engine.compile(r"^Input\sCRC errors\s+(?P<input_crc_errors>\d+)")
 
         # Input overruns                 3
-        p7 = re.compile(r"^Input\soverruns\s+(?P<input_overruns>\d+)")
+        p7 = regex_engine.compile(r"^Input\soverruns\s+(?P<input_overruns>\d+)")
 
         # Runt packets                   0
-        p8 = re.compile(r"^Runt\spackets\s+(?P<runt_packets>\d+)")
+        p8 = regex_engine.compile(r"^Runt\spackets\s+(?P<runt_packets>\d+)")
 
         # Giant packets                  0
-        p9 = re.compile(r"^Giant\spackets\s+(?P<giant_packets>\d+)")
+        p9 = regex_engine.compile(r"^Giant\spackets\s+(?P<giant_packets>\d+)")
 
         # Input pause frames             0
-        p10 = re.compile(r"^Input\spause frames\s+(?P<input_pause_frames>\d+)")
+        p10 = regex_engine.compile(r"^Input\spause frames\s+(?P<input_pause_frames>\d+)")
 
         # Output packet count            4546146635
-        p11 = re.compile(r"^Output\spacket count\s+(?P<output_packet_count>\d+)")
+        p11 = regex_engine.compile(r"^Output\spacket count\s+(?P<output_packet_count>\d+)")
 
         # Output bytes count             2537511523512
-        p12 = re.compile(r"^Output\sbytes count\s+(?P<output_bytes_count>\d+)")
+        p12 = regex_engine.compile(r"^Output\sbytes count\s+(?P<output_bytes_count>\d+)")
 
         # Output mcast packets           7189
-        p13 = re.compile(r"^Output\smcast packets\s+(?P<output_mcast_pkts>\d+)")
+        p13 = regex_engine.compile(r"^Output\smcast packets\s+(?P<output_mcast_pkts>\d+)")
 
         # Output bcast packets           112
-        p14 = re.compile(r"^Output\sbcast packets\s+(?P<output_bcast_pkts>\d+)")
+        p14 = regex_engine.compile(r"^Output\sbcast packets\s+(?P<output_bcast_pkts>\d+)")
 
         # Output underruns               0
-        p15 = re.compile(r"^Output\sunderruns\s+(?P<output_underruns>\d+)")
+        p15 = regex_engine.compile(r"^Output\sunderruns\s+(?P<output_underruns>\d+)")
 
         # Output pause frames            0
-        p16 = re.compile(r"^Output\spause frames\s+(?P<output_pause_frames>\s+\d+)")
+        p16 = regex_engine.compile(r"^Output\spause frames\s+(?P<output_pause_frames>\s+\d+)")
 
         for line in output.splitlines():
 
@@ -792,19 +793,19 @@ class ShowControllerEthernetController(ShowControllerEthernetControllerSchema):
             output = self.device.execute(cmd)
         
         # Transmit                  GigabitEthernet1/0/3          Receive 
-        p1 = re.compile(r'^Transmit\s+(?P<interface>[\w\/]+)\s+Receive$')
+        p1 = regex_engine.compile(r'^Transmit\s+(?P<interface>[\w\/]+)\s+Receive$')
 
         # 32199124 Total bytes                     1608886 Total bytes              
         # 78979 Unicast frames                        2 Unicast frames           
         # 5054660 Unicast bytes                       136 Unicast bytes 
-        p2 = re.compile(r'^(?P<transmit_value>\d+)\s+(?P<transmit_key_string>[\w\s\>\(\)]+(frame[s]*|bytes|dropped|truncated|successful))\s+(?P<receive_value>\d+)\s+(?P<receive_key_string>[\w\s\>\(\)]+)$')
+        p2 = regex_engine.compile(r'^(?P<transmit_value>\d+)\s+(?P<transmit_key_string>[\w\s\>\(\)]+(frame[s]*|bytes|dropped|truncated|successful))\s+(?P<receive_value>\d+)\s+(?P<receive_key_string>[\w\s\>\(\)]+)$')
 
         # 0 Gold frames successful   
         # 0 1 collision frames  
-        p3 = re.compile(r'^(?P<transmit_value>\d+)\s+(?P<transmit_key_string>[\w\s\>\(\)]+)$')
+        p3 = regex_engine.compile(r'^(?P<transmit_value>\d+)\s+(?P<transmit_key_string>[\w\s\>\(\)]+)$')
         
         # LAST UPDATE 561 msecs AGO
-        p4 = re.compile(r'^LAST UPDATE (?P<last_updated>[\w\s]+) AGO$')
+        p4 = regex_engine.compile(r'^LAST UPDATE (?P<last_updated>[\w\s]+) AGO$')
         
         ret_dict = {}
 
@@ -882,18 +883,18 @@ class ShowControllersEthernetController(ShowControllersEthernetControllerSchema)
             output = self.device.execute(cmd)
 
         # Transmit                  GigabitEthernet1/0/1          Receive   
-        p1 = re.compile(r'^Transmit\s+(?P<interface>[\w\/\d\.]+)\s+Receive$')
+        p1 = regex_engine.compile(r'^Transmit\s+(?P<interface>[\w\/\d\.]+)\s+Receive$')
 
         # 0 Total bytes                           0 Total bytes              
         # 0 Unicast frames                        0 Unicast frames       
-        p2 = re.compile(r'^(?P<transmit_value>\d+)\s+(?P<transmit_key_name>.+)\s\s+'
-                r'(?P<receive_value>\d+)\s+(?P<receive_key_name>.+)$')
+        p2 = regex_engine.compile(r'^(?P<transmit_value>\d+)\s+(?P<transmit_key_name>.+)\s\s+'
+                          r'(?P<receive_value>\d+)\s+(?P<receive_key_name>.+)$')
 
         # 0 4 collision frames 
-        p3 = re.compile(r'^(?P<transmit_value>\d+)\s+(?P<transmit_key_name>.+)$')
+        p3 = regex_engine.compile(r'^(?P<transmit_value>\d+)\s+(?P<transmit_key_name>.+)$')
 
         # LAST UPDATE 65017966 msecs AGO
-        p4 = re.compile(r'^LAST UPDATE (?P<last_update_msecs>\d+) msecs AGO$')
+        p4 = regex_engine.compile(r'^LAST UPDATE (?P<last_update_msecs>\d+) msecs AGO$')
 
         ret_dict = {}
 
@@ -975,31 +976,31 @@ class ShowControllerVDSLlocal(ShowControllerVDSLlocalSchema):
         
         
         #SFP Vendor PID:                 SFPV5311TR
-        p1 = re.compile(r'^(?P<param>\w*\s*\w*\s*PID):\s+(?P<vl>.+)')
+        p1 = regex_engine.compile(r'^(?P<param>\w*\s*\w*\s*PID):\s+(?P<vl>.+)')
         
         #SFP Vendor SN:                  MET211611AC
-        p2 = re.compile(r'^(?P<param>\w*\s*\w*\s*SN):\s+(?P<vl>.+)')
+        p2 = regex_engine.compile(r'^(?P<param>\w*\s*\w*\s*SN):\s+(?P<vl>.+)')
         
         #Firmware embedded in IOS-XE:    1_62_8463
-        p3 = re.compile(r'^(?P<param>\w*\s*\w*\s*\w*\s*IOS-XE):\s+(?P<vl>.+)')
+        p3 = regex_engine.compile(r'^(?P<param>\w*\s*\w*\s*\w*\s*IOS-XE):\s+(?P<vl>.+)')
         
         #Running Firmware Version:       1_62_8463
-        p4 = re.compile(r'^(?P<param>\w*\s*\w*\s*Version\s*):\s+(?P<vl>.+)')
+        p4 = regex_engine.compile(r'^(?P<param>\w*\s*\w*\s*Version\s*):\s+(?P<vl>.+)')
         
         #Management Link:                up
-        p5 = re.compile(r'^(?P<param>\w*\s*Link\s*):\s+(?P<state>.+)')
+        p5 = regex_engine.compile(r'^(?P<param>\w*\s*Link\s*):\s+(?P<state>.+)')
         
         #DSL Status:                     showtime
-        p6 = re.compile(r'^(?P<param>DSL\s*\w*):\s+(?P<state>\w+)')
+        p6 = regex_engine.compile(r'^(?P<param>DSL\s*\w*):\s+(?P<state>\w+)')
         
         #Dumping internal info:          idle
-        p7 = re.compile(r'^(?P<param>\w*\s*internal\s*\w*\s*):\s+(?P<state>\w+)')
+        p7 = regex_engine.compile(r'^(?P<param>\w*\s*internal\s*\w*\s*):\s+(?P<state>\w+)')
         
         #Dying Gasp:                     disarmed
-        p8 = re.compile(r'^(?P<param>\w*\s*Gasp):\s+(?P<state>\w+)')
+        p8 = regex_engine.compile(r'^(?P<param>\w*\s*Gasp):\s+(?P<state>\w+)')
         
         #Dumping DELT info:              idle
-        p9 = re.compile(r'^(?P<param>\w*\s*DELT\s*\w*\s*):\s+(?P<state>\w+)')
+        p9 = regex_engine.compile(r'^(?P<param>\w*\s*DELT\s*\w*\s*):\s+(?P<state>\w+)')
         
         ctrl_dict = {}
        
@@ -1121,11 +1122,11 @@ class ShowControllersEthernetControllersPhyDetail(ShowControllersEthernetControl
         # Regex patterns
         # --------------------------------------------------------------
         # Gi1/0/1 (if_id: 75)
-        int_reg = re.compile(r'(?P<interface>[a-zA-Z]+\d+(?:\/\d+)+)\s\(if_id\:\s(?P<if_id>\d+)\)')
+        int_reg = regex_engine.compile(r'(?P<interface>[a-zA-Z]+\d+(?:\/\d+)+)\s\(if_id\:\s(?P<if_id>\d+)\)')
 
         #  0000 : 1140                  Control Register :  0001 0001 0100 0000
         #  0001 : 796d                    Control STATUS :  0111 1001 0110 1101
-        registers_reg = re.compile(
+        registers_reg = regex_engine.compile(
             r'(?P<register_number>\S{4})\s\:\s(?P<hex_bit_value>\S{4})\s+(?P<register_name>.*)\s\:\s+(?P<bits>.*)')
 
         # --------------------------------------------------------------
@@ -1215,46 +1216,46 @@ class ShowControllerEthernetControllerLinkstatus(ShowControllerEthernetControlle
         ret_dict = {}
 
         #Gi1/0/5 (if_id: 1036)
-        p0 = re.compile(r'^(?P<name>\S+) +\(if\_id\: +(?P<if_id>\d+)\)$')
+        p0 = regex_engine.compile(r'^(?P<name>\S+) +\(if\_id\: +(?P<if_id>\d+)\)$')
 
         #******* MAC LINK STATUS ************
-        p1 = re.compile(r'^\*+\s*MAC +LINK +STATUS\s*\*+$')
+        p1 = regex_engine.compile(r'^\*+\s*MAC +LINK +STATUS\s*\*+$')
 
         #MPP PORT DETAILS
-        p2 =  re.compile(r'^MPP +PORT +DETAILS$')
+        p2 =  regex_engine.compile(r'^MPP +PORT +DETAILS$')
 
         #link_state: 1 pcs_status: 0  high_ber: 0
-        p3 = re.compile(r'^link_state\: +(?P<link_state>\d+) +pcs_status\: +(?P<pcs_status>\d+) +high_ber\: +(?P<high_ber>\d+)$')
+        p3 = regex_engine.compile(r'^link_state\: +(?P<link_state>\d+) +pcs_status\: +(?P<pcs_status>\d+) +high_ber\: +(?P<high_ber>\d+)$')
 
         #get_state = LINK_UP
-        p4 = re.compile(r'^get_state +\= +(?P<get_state>.*)$')
+        p4 = regex_engine.compile(r'^get_state +\= +(?P<get_state>.*)$')
 
         # Autoneg Details
-        p5 = re.compile(r'^Autoneg +Details$')
+        p5 = regex_engine.compile(r'^Autoneg +Details$')
 
         #Autoneg Status
-        p6 = re.compile(r'^Autoneg +Status$')
+        p6 = regex_engine.compile(r'^Autoneg +Status$')
 
         #MIB counters
-        p7 = re.compile(r'^MIB +counters$')
+        p7 = regex_engine.compile(r'^MIB +counters$')
 
         #Genral - Speed:         speed_gbps1
-        p8 = re.compile(r'^(?P<key>[\s*\w]+.*)\: +(?P<value>[\S\s]+.*)$')
+        p8 = regex_engine.compile(r'^(?P<key>[\s*\w]+.*)\: +(?P<value>[\S\s]+.*)$')
 
         
         
         # Port = 22 cmd = (port_diag unit 0 port 22 slot 0) rc = 0x0 rsn = success
         # Port = 3 Slot = 1 cmd = (port_diag unit 0 port 2 slot 0) rc = 0x0 reason = success
-        p9 = re.compile(r'^Port +\= +(?P<port>\d+) +(Slot +\= +(?P<slot>\d+) +)?cmd +\= +\((?P<cmd>[\s*\w]+)\) +rc +\= +(?P<rc>\w+) +(rsn|reason) +\= +(?P<rsn>\w+)$')
+        p9 = regex_engine.compile(r'^Port +\= +(?P<port>\d+) +(Slot +\= +(?P<slot>\d+) +)?cmd +\= +\((?P<cmd>[\s*\w]+)\) +rc +\= +(?P<rc>\w+) +(rsn|reason) +\= +(?P<rsn>\w+)$')
 
         #PHY LINK STATUS
-        p10 = re.compile(r'^\*+\s*PHY +LINK +STATUS\s*\*+$')
+        p10 = regex_engine.compile(r'^\*+\s*PHY +LINK +STATUS\s*\*+$')
 
         #Phy Configuration :
-        p11 = re.compile(r'^Phy +Configuration +\:$')
+        p11 = regex_engine.compile(r'^Phy +Configuration +\:$')
 
         #Phy Status :
-        p12 = re.compile(r'^Phy +Status +\:$')
+        p12 = regex_engine.compile(r'^Phy +Status +\:$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1405,61 +1406,61 @@ class ShowControllersEthernetControllerPortInfo(ShowControllersEthernetControlle
         ret_dict = {}
         
         # Te1/0/13 (if_id: 1043)
-        p1 = re.compile(r'^(?P<interface>\S+) +\(if_id\: +(?P<if_id>\d+)\)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+) +\(if_id\: +(?P<if_id>\d+)\)$')
         
         # Port Context Information
-        p2  = re.compile(r'^Port +Context +Information$')
+        p2  = regex_engine.compile(r'^Port +Context +Information$')
         
         # Lpn ........................ [13]
-        p3 = re.compile(r'^Lpn\s+\.+\s+\[(?P<lpn>\d+)\]$')
+        p3 = regex_engine.compile(r'^Lpn\s+\.+\s+\[(?P<lpn>\d+)\]$')
         
         # AsicNum .................... [1]
-        p4 = re.compile(r'^AsicNum\s+\.+\s+\[(?P<asic_num>\d+)\]$')
+        p4 = regex_engine.compile(r'^AsicNum\s+\.+\s+\[(?P<asic_num>\d+)\]$')
         
         # AsicPort ................... [-604733568]
-        p5 = re.compile(r'AsicPort\s+\.+\s+\[(?P<asic_port>\-*\d+)\]$')
+        p5 = regex_engine.compile(r'AsicPort\s+\.+\s+\[(?P<asic_port>\-*\d+)\]$')
         
         # IsInit ..................... [1]
-        p6 = re.compile(r'^IsInit\s+\.+\s+\[(?P<is_init>\d+)\]$')
+        p6 = regex_engine.compile(r'^IsInit\s+\.+\s+\[(?P<is_init>\d+)\]$')
         
         # ContextName ................ [Te1/0/13]
-        p7 = re.compile(r'^ContextName\s+\.+\s+\[(?P<context_name>\S+)\]$')
+        p7 = regex_engine.compile(r'^ContextName\s+\.+\s+\[(?P<context_name>\S+)\]$')
         
         # IsDisabled ................. [0]
-        p8 = re.compile(r'^IsDisabled\s+\.+\s+\[(?P<is_disabled>\d+)\]$')
+        p8 = regex_engine.compile(r'^IsDisabled\s+\.+\s+\[(?P<is_disabled>\d+)\]$')
         
         # IsBc Inserted .............. [0]
-        p9 = re.compile(r'^IsBc Inserted\s+\.+\s+\[(?P<is_bc_inserted>\d+)\]$')
+        p9 = regex_engine.compile(r'^IsBc Inserted\s+\.+\s+\[(?P<is_bc_inserted>\d+)\]$')
         
         # IsBc Forced ................ [0]
-        p10 = re.compile(r'^IsBc Forced\s+\.+\s+\[(?P<is_bc_forced>\d+)\]$')
+        p10 = regex_engine.compile(r'^IsBc Forced\s+\.+\s+\[(?P<is_bc_forced>\d+)\]$')
         
         # IsQsa Module ............... [0]
-        p11 = re.compile(r'^IsQsa Module\s+\.+\s+\[(?P<is_qsa_module>\d+)\]$')
+        p11 = regex_engine.compile(r'^IsQsa Module\s+\.+\s+\[(?P<is_qsa_module>\d+)\]$')
         
         # Admin link state ........... [1]
-        p12 = re.compile(r'^Admin link state\s+\.+\s+\[(?P<admin_link_state>\d+)\]$')
+        p12 = regex_engine.compile(r'^Admin link state\s+\.+\s+\[(?P<admin_link_state>\d+)\]$')
         
         # default_speed .............. [10000000]
-        p13 = re.compile(r'^default_speed\s+\.+\s+\[(?P<default_speed>\d+)\]$')
+        p13 = regex_engine.compile(r'^default_speed\s+\.+\s+\[(?P<default_speed>\d+)\]$')
         
         # duplex ..................... [2]
-        p14 = re.compile(r'^duplex\s+\.+\s+\[(?P<duplex>\d+)\]$')
+        p14 = regex_engine.compile(r'^duplex\s+\.+\s+\[(?P<duplex>\d+)\]$')
         
         # speed ...................... [1000000]
-        p15 = re.compile(r'^speed\s+\.+\s+\[(?P<speed>\d+)\]$')
+        p15 = regex_engine.compile(r'^speed\s+\.+\s+\[(?P<speed>\d+)\]$')
         
         # max speed .................. [10000000]
-        p16 = re.compile(r'^max speed\s+\.+\s+\[(?P<max_speed>\d+)\]$')
+        p16 = regex_engine.compile(r'^max speed\s+\.+\s+\[(?P<max_speed>\d+)\]$')
         
         # Flowcontrol ................ [2]
-        p17 = re.compile(r'^Flowcontrol\s+\.+\s+\[(?P<flowcontrol>\d+)\]$')
+        p17 = regex_engine.compile(r'^Flowcontrol\s+\.+\s+\[(?P<flowcontrol>\d+)\]$')
         
         # fec mode ................... [0]
-        p18 = re.compile(r'^fec mode\s+\.+\s+\[(?P<fec_mode>\d+)\]$')
+        p18 = regex_engine.compile(r'^fec mode\s+\.+\s+\[(?P<fec_mode>\d+)\]$')
         
         # Poll link status ........... [1]
-        p19 = re.compile(r'^Poll link status\s+\.+\s+\[(?P<poll_link_status>\d+)\]$')
+        p19 = regex_engine.compile(r'^Poll link status\s+\.+\s+\[(?P<poll_link_status>\d+)\]$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1815,195 +1816,195 @@ class ShowControllerEthernetControllerInterfaceMac(ShowControllerEthernetControl
         ret_dict = {} 
         
         #npu_pdsf_procagent_get_eye_common : asic inst 0 port 14 link 32 command 8
-        p1 = re.compile(r'^npu_pdsf_procagent_get_eye_common\s*\: +(?P<npu_pdsf_procagent_get_eye_common>[\S\s]+.*)$')
+        p1 = regex_engine.compile(r'^npu_pdsf_procagent_get_eye_common\s*\: +(?P<npu_pdsf_procagent_get_eye_common>[\S\s]+.*)$')
         
         
         #"mpp_port_0_0_36:7": {
-        p2  =  re.compile(r'^\"(?P<key>mpp_port_\d+_\d+_\d+\:\d+)\"\:\s*\{$')        
+        p2  =  regex_engine.compile(r'^\"(?P<key>mpp_port_\d+_\d+_\d+\:\d+)\"\:\s*\{$')        
        
         #"mac_state_histogram": {
-        p2_1  =  re.compile(r'^\"mac_state_histogram\"\:\s*\{$')        
+        p2_1  =  regex_engine.compile(r'^\"mac_state_histogram\"\:\s*\{$')        
        
         #"mac_port_status": { 
-        p2_2 = re.compile(r'^\"mac_port_status\"\:\s*\{$')
+        p2_2 = regex_engine.compile(r'^\"mac_port_status\"\:\s*\{$')
         
         #"mib_counters": {
-        p2_3 = re.compile(r'^\"mib_counters\"\:\s*\{$')
+        p2_3 = regex_engine.compile(r'^\"mib_counters\"\:\s*\{$')
         
         #"tx_mac_tc_fc_frames_ok": [ 
-        p2_3_1 = re.compile(r'^\"tx_mac_tc_fc_frames_ok\"\:\s*\[$')
+        p2_3_1 = regex_engine.compile(r'^\"tx_mac_tc_fc_frames_ok\"\:\s*\[$')
         
         #"tx_xoff_state_duration": [
-        p2_3_2 = re.compile(r'^\"tx_xoff_state_duration\"\:\s*\[$')
+        p2_3_2 = regex_engine.compile(r'^\"tx_xoff_state_duration\"\:\s*\[$')
         
         #"rx_mac_tc_fc_frames_ok": [
-        p2_3_3 = re.compile(r'^\"rx_mac_tc_fc_frames_ok\"\:\s*\[$')
+        p2_3_3 = regex_engine.compile(r'^\"rx_mac_tc_fc_frames_ok\"\:\s*\[$')
         
         #"rx_xoff_state_duration": [
-        p2_3_4 = re.compile(r'^\"rx_xoff_state_duration\"\:\s*\[$')
+        p2_3_4 = regex_engine.compile(r'^\"rx_xoff_state_duration\"\:\s*\[$')
         
         #"multiport_phy_0_0_36": { 
-        p3 = re.compile(r'^\"(?P<key>multiport_phy_\d+_\d+_\d+)\"\: +\{$')
+        p3 = regex_engine.compile(r'^\"(?P<key>multiport_phy_\d+_\d+_\d+)\"\: +\{$')
         
         #"device_info": {
-        p3_1 = re.compile(r'^\"device_info\"\:\s*\{$')
+        p3_1 = regex_engine.compile(r'^\"device_info\"\:\s*\{$')
         
         # "serdes_0": { 
-        p3_1_1 = re.compile(r'^\"serdes_\d+\"\:\s*\{$')        
+        p3_1_1 = regex_engine.compile(r'^\"serdes_\d+\"\:\s*\{$')        
         
         #"mac_port_config": {
-        p3_2 =  re.compile(r'^\"mac_port_config\"\:\s*\{$')
+        p3_2 =  regex_engine.compile(r'^\"mac_port_config\"\:\s*\{$')
         
         #"serdes_info_36": { 
-        p3_2_1 = re.compile(r'^\"serdes_info_\d+\"\:\s*\{$')        
+        p3_2_1 = regex_engine.compile(r'^\"serdes_info_\d+\"\:\s*\{$')        
        
         #am_lock": [ 
-        p3_3_1 = re.compile(r'^\"am_lock\"\:\s*\[$')        
+        p3_3_1 = regex_engine.compile(r'^\"am_lock\"\:\s*\[$')        
        
         #"mac_pcs_lane_mapping": [ 
-        p3_3_2 =  re.compile(r'^\"mac_pcs_lane_mapping\"\:\s*\[$') 
+        p3_3_2 =  regex_engine.compile(r'^\"mac_pcs_lane_mapping\"\:\s*\[$') 
         
         #"mac_port_soft_state": {
-        p3_4  = re.compile(r'^\"mac_port_soft_state\"\:\s*\{$')
+        p3_4  = regex_engine.compile(r'^\"mac_port_soft_state\"\:\s*\{$')
         
         #"test_mode": {
-        p3_5 = re.compile(r'^\"test_mode\"\:\s*\{$')        
+        p3_5 = regex_engine.compile(r'^\"test_mode\"\:\s*\{$')        
         
         #"state_transition_history": [ 
-        p3_6 = re.compile(r'^\"state_transition_history\"\:\s*\[$')
+        p3_6 = regex_engine.compile(r'^\"state_transition_history\"\:\s*\[$')
         
         #"serdes_parameters": {
-        p3_7 = re.compile(r'^\"serdes_parameters\"\:\s*\{$')
+        p3_7 = regex_engine.compile(r'^\"serdes_parameters\"\:\s*\{$')
         
         #"index_0": {
-        p3_7_1 = re.compile(r'^\"index_0\"\:\s*\{$')
+        p3_7_1 = regex_engine.compile(r'^\"index_0\"\:\s*\{$')
         
         #"serdes_config": {
-        p3_8 = re.compile(r'^\"serdes_config\"\:\s*\{$')
+        p3_8 = regex_engine.compile(r'^\"serdes_config\"\:\s*\{$')
         
         #"serdes_settings": [ 
-        p3_8_1 = re.compile(r'^\"serdes_settings\"\:\s*\[$')
+        p3_8_1 = regex_engine.compile(r'^\"serdes_settings\"\:\s*\[$')
         
         #"rx_settings": { 
-        p3_8_1_1 = re.compile(r'^\"rx_settings\"\:\s*\{$')
+        p3_8_1_1 = regex_engine.compile(r'^\"rx_settings\"\:\s*\{$')
         
         #"targ_shadow": [ 
-        p3_8_1_1_1 =  re.compile(r'^\"targ_shadow\"\:\s*\[$')
+        p3_8_1_1_1 =  regex_engine.compile(r'^\"targ_shadow\"\:\s*\[$')
         
         #"tx_settings": {
-        p3_8_1_2  =  re.compile(r'^\"tx_settings\"\:\s*\{$')
+        p3_8_1_2  =  regex_engine.compile(r'^\"tx_settings\"\:\s*\{$')
         
         #"tx_fir": [
-        p3_8_1_2_1 = re.compile(r'^\"tx_fir\"\:\s*\[$')
+        p3_8_1_2_1 = regex_engine.compile(r'^\"tx_fir\"\:\s*\[$')
         
         #"flow_chart_settings": { 
-        p3_8_1_3 =  re.compile(r'^\"flow_chart_settings\"\:\s*\{$')
+        p3_8_1_3 =  regex_engine.compile(r'^\"flow_chart_settings\"\:\s*\{$')
         
         #"serdes_status": {
-        p3_9 = re.compile(r'^\"serdes_status\"\:\s*\{$')
+        p3_9 = regex_engine.compile(r'^\"serdes_status\"\:\s*\{$')
         
         #"Firmware_Version": { 
-        p3_9_1 =  re.compile(r'^\"Firmware_Version\"\:\s*\{$')
+        p3_9_1 =  regex_engine.compile(r'^\"Firmware_Version\"\:\s*\{$')
         
         #"rx_status": [
-        p3_9_2 = re.compile(r'^\"rx_status\"\:\s*\[$')
+        p3_9_2 = regex_engine.compile(r'^\"rx_status\"\:\s*\[$')
         
         #"firs": [
-        p3_9_2_1 = re.compile(r'^\"firs\":\s*\[$')
+        p3_9_2_1 = regex_engine.compile(r'^\"firs\":\s*\[$')
         
         #"fw_rx_status": [
-        p3_9_3 = re.compile(r'^\"fw_rx_status\"\:\s*\[$')
+        p3_9_3 = regex_engine.compile(r'^\"fw_rx_status\"\:\s*\[$')
         
         # "fir_shadow": [ 
-        p3_9_4 =  re.compile(r'^\"fir_shadow\"\:\s*\[$')
+        p3_9_4 =  regex_engine.compile(r'^\"fir_shadow\"\:\s*\[$')
         
         #"eye_capture": {
-        p3_10 = re.compile (r'^\"eye_capture\"\:\s*\{$')
+        p3_10 = regex_engine.compile (r'^\"eye_capture\"\:\s*\{$')
         
         #"veye_data": [
-        p3_10_1 = re.compile(r'^\"veye_data\"\:\s*\[$')
+        p3_10_1 = regex_engine.compile(r'^\"veye_data\"\:\s*\[$')
         
         #"veye_values": [
-        p3_10_1_1 = re.compile(r'^\"veye_values\"\:\s*\[$')
+        p3_10_1_1 = regex_engine.compile(r'^\"veye_values\"\:\s*\[$')
         
         #"reg_dump": {
-        p3_11 = re.compile(r'^\"reg_dump\"\:\s*\{$')
+        p3_11 = regex_engine.compile(r'^\"reg_dump\"\:\s*\{$')
         
         #"Quad_Reg": [
-        p3_11_1 = re.compile(r'^\"Quad_Reg\"\:\s*\[$')        
+        p3_11_1 = regex_engine.compile(r'^\"Quad_Reg\"\:\s*\[$')        
 
         #"P_Reg": [ 
-        p3_11_2 = re.compile(r'^\"P_Reg\"\:\s*\[$')
+        p3_11_2 = regex_engine.compile(r'^\"P_Reg\"\:\s*\[$')
         
         #"S_reg": [
-        p3_11_3 = re.compile(r'^\"S_reg\"\:\s*\[$')
+        p3_11_3 = regex_engine.compile(r'^\"S_reg\"\:\s*\[$')
         
         #"RXDTOP": [
-        p3_11_4 = re.compile(r'^\"RXDTOP\"\:\s*\[$')
+        p3_11_4 = regex_engine.compile(r'^\"RXDTOP\"\:\s*\[$')
         
         #"TXDTOP": [
-        p3_11_5 = re.compile(r'^\"TXDTOP\"\:\s*\[$')
+        p3_11_5 = regex_engine.compile(r'^\"TXDTOP\"\:\s*\[$')
         
         #"AutoNeg": [
-        p3_11_6 = re.compile(r'^\"AutoNeg\"\:\s*\[$')
+        p3_11_6 = regex_engine.compile(r'^\"AutoNeg\"\:\s*\[$')
         
         #"LinkTraining": [
-        p3_11_7 = re.compile(r'^\"LinkTraining\"\:\s*\[$')
+        p3_11_7 = regex_engine.compile(r'^\"LinkTraining\"\:\s*\[$')
         
         #"RX_STS": [
-        p3_11_8 = re.compile(r'^\"RX_STS\"\:\s*\[$')
+        p3_11_8 = regex_engine.compile(r'^\"RX_STS\"\:\s*\[$')
         
         #"an_debug_1": [
-        p3_11_9 = re.compile(r'^\"an_debug_1\"\:\s*\[$')
+        p3_11_9 = regex_engine.compile(r'^\"an_debug_1\"\:\s*\[$')
         
         #""an_debug_2": [
-        p3_11_10 = re.compile(r'^\"an_debug_2\"\:\s*\[$')
+        p3_11_10 = regex_engine.compile(r'^\"an_debug_2\"\:\s*\[$')
         
         #"lt_debug_1": [
-        p3_11_11 = re.compile(r'^\"lt_debug_1\"\:\s*\[$')
+        p3_11_11 = regex_engine.compile(r'^\"lt_debug_1\"\:\s*\[$')
         
         #"lt_debug_2": [
-        p3_11_12 = re.compile(r'^\"lt_debug_2\"\:\s*\[$')
+        p3_11_12 = regex_engine.compile(r'^\"lt_debug_2\"\:\s*\[$')
         
         #"mac_port_0_0_36.link_down_histogram": {
-        p4= re.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+\.link_down_histogram)\"\:\s*\{$')        
+        p4= regex_engine.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+\.link_down_histogram)\"\:\s*\{$')        
         
         #"rx_deskew_fifo_overflow_count": [
-        p4_1 = re.compile(r'^\"rx_deskew_fifo_overflow_count\"\:\s*\[$')
+        p4_1 = regex_engine.compile(r'^\"rx_deskew_fifo_overflow_count\"\:\s*\[$')
         
         #"rx_pma_sig_ok_loss_interrupt_register_count": [ 
-        p4_2 = re.compile(r'^\"rx_pma_sig_ok_loss_interrupt_register_count\"\:\s*\[$')
+        p4_2 = regex_engine.compile(r'^\"rx_pma_sig_ok_loss_interrupt_register_count\"\:\s*\[$')
         
         #"mac_port_0_0_36.link_error_histogram": {
-        p5 =  re.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+\.link_error_histogram)\"\:\s*\{$')
+        p5 =  regex_engine.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+\.link_error_histogram)\"\:\s*\{$')
         
         #"mac_port_0_0_36.link_debounce_state": {
-        p6 = re.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+.link_debounce_state)\"\:\s*\{$')
+        p6 = regex_engine.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+.link_debounce_state)\"\:\s*\{$')
         
         # Port = 40 Slot = 1 cmd = () rc = 0x16 reason = (null)
-        p7 = re.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +reason(?P<reason>.*)$')
+        p7 = regex_engine.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +reason(?P<reason>.*)$')
         
         # Port = 39 cmd = (prbs_stop unit 0 port 39 slot 1 serdes_level 1 polynomial 31) rc = 0x0 rsn = success
-        p7_1 = re.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')
+        p7_1 = regex_engine.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')
                
         
         # "PRE_INIT": 0,
-        p8 = re.compile(r'^\"(?P<key>\w+)\"\:\s*(?P<value>.*)$')        
+        p8 = regex_engine.compile(r'^\"(?P<key>\w+)\"\:\s*(?P<value>.*)$')        
         
         #false 
-        p8_1 = re.compile(r'^(?P<value>\w+)$')
+        p8_1 = regex_engine.compile(r'^(?P<value>\w+)$')
         
         #0
-        p8_2 =  re.compile(r'^(?P<value>[-]?\d+)$')
+        p8_2 =  regex_engine.compile(r'^(?P<value>[-]?\d+)$')
         
         #64,
-        p8_3 = re.compile(r'^(?P<value>[-]?\d+)\,$')
+        p8_3 = regex_engine.compile(r'^(?P<value>[-]?\d+)\,$')
         
         #], 
-        p8_4 =  re.compile(r'^\]\,$')
+        p8_4 =  regex_engine.compile(r'^\]\,$')
         
          #], 
-        p8_5 =  re.compile(r'^\]$')
+        p8_5 =  regex_engine.compile(r'^\]$')
         
         cnt = index_flag = stat_cnt = 0
         
@@ -2564,22 +2565,22 @@ class ShowControllersEthernetControllerPreemptionHandshake(ShowControllersEthern
         ret_dict = {}
         
         ## Gig1/4 (Interface name)
-        p1 = re.compile(r'(?P<interface>^[A-Za-z]+\d+/\d+)$')
+        p1 = regex_engine.compile(r'(?P<interface>^[A-Za-z]+\d+/\d+)$')
 
         # Handshake frame counters
-        p2  = re.compile(r'^Handshake +frame +counters$')
+        p2  = regex_engine.compile(r'^Handshake +frame +counters$')
                 
         # Verify Rx ........................ [13]
-        p3 = re.compile(r'^Verify\s+Rx\.+\s+\[(?P<verify_rx>\d+)\]$')
+        p3 = regex_engine.compile(r'^Verify\s+Rx\.+\s+\[(?P<verify_rx>\d+)\]$')
                 
         # Verify Tx .................... [1]
-        p4 = re.compile(r'^Verify\s+Tx\.+\s+\[(?P<verify_tx>\d+)\]$')
+        p4 = regex_engine.compile(r'^Verify\s+Tx\.+\s+\[(?P<verify_tx>\d+)\]$')
                 
         # Respond Rx ................... [1]
-        p5 = re.compile(r'^Respond\s+Rx\.+\s+\[(?P<respond_rx>\d+)\]$')
+        p5 = regex_engine.compile(r'^Respond\s+Rx\.+\s+\[(?P<respond_rx>\d+)\]$')
                 
         # Respond Tx..................... [1]
-        p6 = re.compile(r'^Respond\s+Tx\.+\s+\[(?P<respond_tx>\d+)\]$')
+        p6 = regex_engine.compile(r'^Respond\s+Tx\.+\s+\[(?P<respond_tx>\d+)\]$')
                 
         for line in output.splitlines():
             line = line.strip()
@@ -2665,25 +2666,25 @@ class ShowControllersEthernetControllerPreemptionDrops(ShowControllersEthernetCo
         ret_dict = {}
         
         # Gi1/4 (Interface name)
-        p1 = re.compile(r'(?P<interface>^[A-Za-z]+\d+/\d+)$')
+        p1 = regex_engine.compile(r'(?P<interface>^[A-Za-z]+\d+/\d+)$')
 
         # Port Preemption Frame Drops
-        p2  = re.compile(r'^Port\s+Preemption\s+Frame\s+Drops$')
+        p2  = regex_engine.compile(r'^Port\s+Preemption\s+Frame\s+Drops$')
                         
         # Express Tx Drops ........................ [13]
-        p3 = re.compile(r'^Express\s+Tx\s+Drops\.+\s+\[(?P<express_tx_drops>\d+)\]$')
+        p3 = regex_engine.compile(r'^Express\s+Tx\s+Drops\.+\s+\[(?P<express_tx_drops>\d+)\]$')
                         
         # Express Rx Drops .................... [1]
-        p4 = re.compile(r'^Express\s+Rx\s+Drops\.+\s+\[(?P<express_rx_drops>\d+)\]$')
+        p4 = regex_engine.compile(r'^Express\s+Rx\s+Drops\.+\s+\[(?P<express_rx_drops>\d+)\]$')
                         
         # Preemptable Tx Drops ................... [1]
-        p5 = re.compile(r'^Preemptable\s+Tx\s+Drops\.+\s+\[(?P<preemptable_tx_drops>\d+)\]$')
+        p5 = regex_engine.compile(r'^Preemptable\s+Tx\s+Drops\.+\s+\[(?P<preemptable_tx_drops>\d+)\]$')
                         
         # Preemptable Rx Drops..................... [1]
-        p6 = re.compile(r'^Preemptable\s+Rx\s+Drops\.+\s+\[(?P<preemptable_rx_drops>\d+)\]$')
+        p6 = regex_engine.compile(r'^Preemptable\s+Rx\s+Drops\.+\s+\[(?P<preemptable_rx_drops>\d+)\]$')
 
         # Fragment Drops..................... [1]
-        p7 = re.compile(r'^Fragment\s+Drops\.+\s+\[(?P<fragment_drops>\d+)\]$')
+        p7 = regex_engine.compile(r'^Fragment\s+Drops\.+\s+\[(?P<fragment_drops>\d+)\]$')
             
         for line in output.splitlines():
             line = line.strip()
@@ -2869,28 +2870,28 @@ class ShowControllersEthernetControllerPreemptionStats(ShowControllersEthernetCo
         config_dict = {}
         
         # Gi1/4 (Interface name)
-        p1 = re.compile(r'(?P<interface>^[A-Za-z]+\d+/\d+)$')
+        p1 = regex_engine.compile(r'(?P<interface>^[A-Za-z]+\d+/\d+)$')
 
         # Total frames received               0                    0
-        p2 = re.compile(r"Total\s+frames\s+received\s+(?P<express_total_frames_recvd>\d+)\s+(?P<preemptable_total_frames_recvd>\d+)")
+        p2 = regex_engine.compile(r"Total\s+frames\s+received\s+(?P<express_total_frames_recvd>\d+)\s+(?P<preemptable_total_frames_recvd>\d+)")
 
         # Total frames transmitted            0                    0
-        p3 = re.compile("Total\s+frames\s+transmitted\s+(?P<express_total_frames_transmitted>\d+)\s+(?P<preemptable_total_frames_transmitted>\d+)")
+        p3 = regex_engine.compile("Total\s+frames\s+transmitted\s+(?P<express_total_frames_transmitted>\d+)\s+(?P<preemptable_total_frames_transmitted>\d+)")
         
         # 64 byte frames                      0                    0
-        p4  = re.compile(r"64\s+byte\s+frames\s+(?P<express_64b_counters>\d+)\s+(?P<preempt_64b_counters>\d+)") 
+        p4  = regex_engine.compile(r"64\s+byte\s+frames\s+(?P<express_64b_counters>\d+)\s+(?P<preempt_64b_counters>\d+)") 
 
         # 65 to 127 byte frames               0                    0 [Matches all the output in the same format]
-        p5 = re.compile(r"^(?P<first_byte>\d+) +to +(?P<last_byte>\d+) +byte +frames +(?P<express_counter>\d+) +(?P<preempt_counter>\d+)$" )
+        p5 = regex_engine.compile(r"^(?P<first_byte>\d+) +to +(?P<last_byte>\d+) +byte +frames +(?P<express_counter>\d+) +(?P<preempt_counter>\d+)$" )
 
         # 32768 to Mtu byte frames            0                    0
-        p6 = re.compile(r"32768\s+to\s+Mtu+\s+byte+\s+frames\s+(?P<express_mtub_counters>\d+)\s+(?P<preempt_mtub_counters>\d+)")
+        p6 = regex_engine.compile(r"32768\s+to\s+Mtu+\s+byte+\s+frames\s+(?P<express_mtub_counters>\d+)\s+(?P<preempt_mtub_counters>\d+)")
 
         # Init fragment frame count           N/A                  0
-        p7 = re.compile(r"Init\s+fragment\s+frame\s+count\s+(?P<express_init_frame_count>N\/A|\w+)\s+(?P<preempt_init_frame_count>\d+)")
+        p7 = regex_engine.compile(r"Init\s+fragment\s+frame\s+count\s+(?P<express_init_frame_count>N\/A|\w+)\s+(?P<preempt_init_frame_count>\d+)")
 
         # Contd fragment frame count          N/A                  0
-        p8 = re.compile(r"Contd\s+fragment\s+frame+\s+count+\s+(?P<express_contd_frame_count>N\/A|\w+)\s+(?P<preempt_contd_frame_count>\d+)")
+        p8 = regex_engine.compile(r"Contd\s+fragment\s+frame+\s+count+\s+(?P<express_contd_frame_count>N\/A|\w+)\s+(?P<preempt_contd_frame_count>\d+)")
 
         for line in output.splitlines():
             # Strip leading and trailing spaces
@@ -2,6 +2,7 @@
 
 IOSXE parsers for the following show commands:
    * show crypto pki certificates <WORD>
+   * show crypto pki certificates verbose
    * show crypto entropy status
    * show crypto ipsec sa count
    * show crypto ikev2 sa detail
@@ -28,12 +29,14 @@ IOSXE parsers for the following show commands:
 
 # Python
 import re
+import copy
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
 # Genie Libs
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =================================================
@@ -96,53 +99,53 @@ class ShowCryptoPkiCertificates(ShowCryptoPkiCertificatesSchema):
         # initial regexp pattern
         # Certificate
         # CA Certificate
-        p1 = re.compile(r'^((?P<cer>Certificate)|(?P<cer_name>(CA|Router Self-Signed) +Certificate))$')
+        p1 = regex_engine.compile(r'^((?P<cer>Certificate)|(?P<cer_name>(CA|Router Self-Signed) +Certificate))$')
 
         # Status: Available
-        p2 = re.compile(r'^Status: +(?P<status>\w+)$')
+        p2 = regex_engine.compile(r'^Status: +(?P<status>\w+)$')
 
         # Certificate Serial Number (hex): 793B572700000003750B
         # Certificate Serial Number: 0x15
-        p3 = re.compile(r'^Certificate +Serial +Number( +\(hex\))?: +(?P<serial_number_in_hex>\w+)$')
+        p3 = regex_engine.compile(r'^Certificate +Serial +Number( +\(hex\))?: +(?P<serial_number_in_hex>\w+)$')
 
         # Certificate Usage: General Purpose
-        p4 = re.compile(r'^Certificate Usage: +(?P<usage>[\w\s]+)$')
+        p4 = regex_engine.compile(r'^Certificate Usage: +(?P<usage>[\w\s]+)$')
 
         # Issuer:
         # Subject:
         # Validity Date:
-        p5 = re.compile(r'^((?P<issuer>Issuer)|(?P<subject>Subject)|(?P<validity_date>Validity +Date)):$')
+        p5 = regex_engine.compile(r'^((?P<issuer>Issuer)|(?P<subject>Subject)|(?P<validity_date>Validity +Date)):$')
 
         # cn=Cisco Manufacturing CA SHA2
         # CN = tpca-root
-        p6 = re.compile(r'(?i)^cn *= *(?P<cn>[\S\s]+)$')
+        p6 = regex_engine.compile(r'(?i)^cn *= *(?P<cn>[\S\s]+)$')
 
         # o=Cisco
         # O = Company
-        p7 = re.compile(r'(?i)^o *= *(?P<o>[\w\s]+)$')
+        p7 = regex_engine.compile(r'(?i)^o *= *(?P<o>[\w\s]+)$')
 
         # Name: WS-C3850-24P-0057D21BC800
-        p8 = re.compile(r'^Name: +(?P<name>.*)$')
+        p8 = regex_engine.compile(r'^Name: +(?P<name>.*)$')
 
         # Serial Number: PID:WS-C3850-24P SN:FCW1947C0GF
-        p9 = re.compile(r'^Serial +Number: *'
-                          r'PID: *(?P<pid>[\w\-]+) +'
-                          r'SN: *(?P<serial_number>[\w\-]+)$')
+        p9 = regex_engine.compile(r'^Serial +Number: *'
+                                    r'PID: *(?P<pid>[\w\-]+) +'
+                                    r'SN: *(?P<serial_number>[\w\-]+)$')
 
         # CRL Distribution Points: 
         #     http://www.cisco.com/security/pki/crl/cmca2.crl
-        p10 = re.compile(r'(?P<crl_distribution_points>^http:[\w\/\:\.]+)$')
+        p10 = regex_engine.compile(r'(?P<crl_distribution_points>^http:[\w\/\:\.]+)$')
 
         # start date: 00:34:52 UTC Nov 20 2015
         # end   date: 00:44:52 UTC Nov 20 2025
-        p11 = re.compile(r'^((?P<start_date>start +date)|(?P<end_date>end +date)): +(?P<value>.*)$')
+        p11 = regex_engine.compile(r'^((?P<start_date>start +date)|(?P<end_date>end +date)): +(?P<value>.*)$')
 
         # Associated Trustpoints: CISCO_IDEVID_SUDI
         # Associated Trustpoints: CISCO_IDEVID_SUDI Trustpool
-        p12 = re.compile(r'^Associated +Trustpoints: +(?P<trustpoints>[\w\-]+)( +Trustpool)?$')
+        p12 = regex_engine.compile(r'^Associated +Trustpoints: +(?P<trustpoints>[\w\-]+)( +Trustpool)?$')
 
         # Storage: nvram:IOS-Self-Sig#1.cer
-        p13 = re.compile(r'^Storage: +(?P<storage>(\S+))$')
+        p13 = regex_engine.compile(r'^Storage: +(?P<storage>(\S+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -357,124 +360,124 @@ class ShowCryptoPkiCertificateVerbose(ShowCryptoPkiCertificateVerboseSchema):
         # Certificate (RA mode CS certificate)
         # Certificate (RA mode CS certificate, Rollover)
 
-        p1 = re.compile(r'^((?P<cer>Certificate)|(?P<cer_name>(CA|Router Self-Signed) +Certificate)|(?P<cer_rollover>(CA)? *Certificate +\(Rollover\))|(?P<cer_sub_ra>Certificate +\((subordinate|RA mode) +(CA|CS) +certificate\))|(?P<cer_sub_ra_rollover>Certificate +\((subordinate|RA mode) +(CA|CS) +certificate, +Rollover\)))$')
+        p1 = regex_engine.compile(r'^((?P<cer>Certificate)|(?P<cer_name>(CA|Router Self-Signed) +Certificate)|(?P<cer_rollover>(CA)? *Certificate +\(Rollover\))|(?P<cer_sub_ra>Certificate +\((subordinate|RA mode) +(CA|CS) +certificate\))|(?P<cer_sub_ra_rollover>Certificate +\((subordinate|RA mode) +(CA|CS) +certificate, +Rollover\)))$')
     
         # Status: Available
-        p2 = re.compile(r'^Status:\s+(?P<status>\w+)$')
+        p2 = regex_engine.compile(r'^Status:\s+(?P<status>\w+)$')
 
         # Certificate Serial Number (hex): 01
-        p3 = re.compile(r'^Certificate +Serial +Number( +\(hex\))?: +(?P<serial>\w+)$')
+        p3 = regex_engine.compile(r'^Certificate +Serial +Number( +\(hex\))?: +(?P<serial>\w+)$')
         
         # Certificate Usage: Signature
-        p4 = re.compile(r'^Certificate Usage: +(?P<usage>[\w\s]+)$')
+        p4 = regex_engine.compile(r'^Certificate Usage: +(?P<usage>[\w\s]+)$')
 
         # Issuer:
         # Subject:
         # Validity Date:
-        p5 = re.compile(r'^((?P<issuer>Issuer)|(?P<subject>Subject)|(?P<validity_date>Validity +Date)):$')
+        p5 = regex_engine.compile(r'^((?P<issuer>Issuer)|(?P<subject>Subject)|(?P<validity_date>Validity +Date)):$')
 
         # cn=ROOT
-        p6 = re.compile(r'(?i)^cn *= *(?P<common_name>[\S\s]*)$')
+        p6 = regex_engine.compile(r'(?i)^cn *= *(?P<common_name>[\S\s]*)$')
 
         # ou=PKI
-        p7 = re.compile(r'(?i)^o *= *(?P<organization>[\S\s]*)$')
+        p7 = regex_engine.compile(r'(?i)^o *= *(?P<organization>[\S\s]*)$')
 
         # Name: pki-reg7
-        p8 = re.compile(r'(?i)^Name *: *(?P<name>[\S\s]*)$')
+        p8 = regex_engine.compile(r'(?i)^Name *: *(?P<name>[\S\s]*)$')
 
         # ou=EN
-        p9 = re.compile(r'(?i)^ou *= *(?P<organizational_unit>[\S\s]*)$')
+        p9 = regex_engine.compile(r'(?i)^ou *= *(?P<organizational_unit>[\S\s]*)$')
 
         # c=IN
-        p10 = re.compile(r'(?i)^c *= *(?P<country>[\S\s]*)$')
+        p10 = regex_engine.compile(r'(?i)^c *= *(?P<country>[\S\s]*)$')
 
         # l=Bangalore 
-        p11 = re.compile(r'(?i)^l *= *(?P<locale>[\S\s]*)$')
+        p11 = regex_engine.compile(r'(?i)^l *= *(?P<locale>[\S\s]*)$')
 
         # st=Marthahalli
-        p12 = re.compile(r'(?i)^st *= *(?P<street>[\S\s]*)$')
+        p12 = regex_engine.compile(r'(?i)^st *= *(?P<street>[\S\s]*)$')
     
         # hostname=pnp-agent
-        p13 = re.compile(r'(?i)^hostname *= *(?P<hostname>[\S\s]*)$')
+        p13 = regex_engine.compile(r'(?i)^hostname *= *(?P<hostname>[\S\s]*)$')
 
         # e=ashpa@cisco.com
-        p14 = re.compile(r'(?i)^e *= *(?P<email>[\S\s]*)$')
+        p14 = regex_engine.compile(r'(?i)^e *= *(?P<email>[\S\s]*)$')
 
         # IP Address: 10.10.10.1
-        p15 = re.compile(r'(?i)^IP Address: *(?P<ip_address>[\S\s]*)$')
+        p15 = regex_engine.compile(r'(?i)^IP Address: *(?P<ip_address>[\S\s]*)$')
 
         # Serial Number: 9AH31HA
-        p16 = re.compile(r'(?i)^Serial Number: *(?P<serial_number>[\S\s]*)$')
+        p16 = regex_engine.compile(r'(?i)^Serial Number: *(?P<serial_number>[\S\s]*)$')
 
         # start date: 21:58:50 IST Nov 10 2021
         # end   date: 21:58:50 IST Nov 10 2024
         # renew date: 21:58:50 IST Nov 10 2023
-        p17 = re.compile(r'^((?P<start_date>start +date)|(?P<end_date>end +date)|(?P<renew_date>renew +date)): +(?P<value>.*)$')
+        p17 = regex_engine.compile(r'^((?P<start_date>start +date)|(?P<end_date>end +date)|(?P<renew_date>renew +date)): +(?P<value>.*)$')
     
         # Public Key Algorithm: rsaEncryption
-        p18 = re.compile(r'^Public Key Algorithm: +(?P<key_type>\w+)$')
+        p18 = regex_engine.compile(r'^Public Key Algorithm: +(?P<key_type>\w+)$')
 
         # RSA Public Key: (2048 bit)
-        p19 = re.compile(r'^(RSA|EC) Public Key: +\((?P<key_len>\d+) +bit\)$')
+        p19 = regex_engine.compile(r'^(RSA|EC) Public Key: +\((?P<key_len>\d+) +bit\)$')
 
         # Signature Algorithm: SHA1 with RSA Encryption
-        p20 = re.compile(r'^Signature Algorithm: +(?P<sign_algo>.*)$')
+        p20 = regex_engine.compile(r'^Signature Algorithm: +(?P<sign_algo>.*)$')
 
         # Fingerprint MD5: D9E4599D C573463B 07F2FBD6 620DB523 
-        p21 = re.compile(r'^Fingerprint MD5: +(?P<fp_md5>.*)$')
+        p21 = regex_engine.compile(r'^Fingerprint MD5: +(?P<fp_md5>.*)$')
 
         # Fingerprint SHA1: E8E0731C D31EA142 A23066D7 4178D696 2D9815E0
-        p22 = re.compile(r'^Fingerprint SHA1: +(?P<fp_sha1>.*)$')
+        p22 = regex_engine.compile(r'^Fingerprint SHA1: +(?P<fp_sha1>.*)$')
     
         # http://10.10.10.2/test.crl
-        p23 = re.compile(r'^(?P<cdp_value>(http|ldap).*\.crl)$')
+        p23 = regex_engine.compile(r'^(?P<cdp_value>(http|ldap).*\.crl)$')
 
         # X509v3 Key Usage: A0000000
-        p24 = re.compile(r'^(?P<key_usage>X509v3 Key Usage): *(?P<key_usage_hex>.*)$')
+        p24 = regex_engine.compile(r'^(?P<key_usage>X509v3 Key Usage): *(?P<key_usage_hex>.*)$')
 
         # Digital Signature
         # Key Encipherment
-        p25 = re.compile(r'^(?P<key_purpose>(Digital Signature|Non Repudiation|Key Encipherment|Data Encipherment|Key Agreement|Key Cert Sign|CRL Signature|Encipher Only|Decipher Only))$')
+        p25 = regex_engine.compile(r'^(?P<key_purpose>(Digital Signature|Non Repudiation|Key Encipherment|Data Encipherment|Key Agreement|Key Cert Sign|CRL Signature|Encipher Only|Decipher Only))$')
 
         # X509v3 Subject Key ID: 2F6A8670 6934D26E C27965E8 67C70441 BEF2EAFC 
-        p26 = re.compile(r'^X509v3 Subject Key ID: +(?P<subject_key>[\S\s]*)$')
+        p26 = regex_engine.compile(r'^X509v3 Subject Key ID: +(?P<subject_key>[\S\s]*)$')
 
         # www.cisco.com
-        p27 = re.compile(r'^(?P<subj_fqdn>(www|mail|ftp|store|support).*)$')
+        p27 = regex_engine.compile(r'^(?P<subj_fqdn>(www|mail|ftp|store|support).*)$')
 
         # IP Address : 10.10.10.1
-        p28 = re.compile(r'^IP Address : +(?P<subj_addr>.*)$')
+        p28 = regex_engine.compile(r'^IP Address : +(?P<subj_addr>.*)$')
 
         # OtherNames : ashpa@cisco.com
-        p29 = re.compile(r'^OtherNames : +(?P<subj_other>.*)$')
+        p29 = regex_engine.compile(r'^OtherNames : +(?P<subj_other>.*)$')
 
         # X509v3 Authority Key ID: 31DEF8AC 8ED9E5F0 CDBC4749 61BED767 0CF75DB2
-        p30 = re.compile(r'^X509v3 Authority Key ID: +(?P<authority_key>[\S\s]*)$')
+        p30 = regex_engine.compile(r'^X509v3 Authority Key ID: +(?P<authority_key>[\S\s]*)$')
 
         # OCSP URL: http://9.41.19.4/ocsp
-        p31 = re.compile(r'^OCSP URL: +(?P<ocsp_url>.*)$')
+        p31 = regex_engine.compile(r'^OCSP URL: +(?P<ocsp_url>.*)$')
 
         # CA: TRUE
-        p32 = re.compile(r'^CA: +(?P<ca_flag>\w+)$')
+        p32 = regex_engine.compile(r'^CA: +(?P<ca_flag>\w+)$')
         
         # Client Auth
         # Server Auth
-        p33 = re.compile(r'^(?P<eku>((Server|Client) Auth|IPSEC (End System|Tunnel|User)|SSH (Server|Client)|Code Signing|Email Protection|OCSP Signing|Time Stamping|[\d\.]+))$')
+        p33 = regex_engine.compile(r'^(?P<eku>((Server|Client) Auth|IPSEC (End System|Tunnel|User)|SSH (Server|Client)|Code Signing|Email Protection|OCSP Signing|Time Stamping|[\d\.]+))$')
         
         # Cert install time: 21:57:41 IST Nov 10 2021
-        p34 = re.compile(r'^Cert install time: +(?P<install_time>.*)$')
+        p34 = regex_engine.compile(r'^Cert install time: +(?P<install_time>.*)$')
 
         # Associated Trustpoints: client ROOT 
-        p35 = re.compile(r'^Associated Trustpoints: +(?P<tp>.*)$')
+        p35 = regex_engine.compile(r'^Associated Trustpoints: +(?P<tp>.*)$')
 
         # Storage: nvram
-        p36 = re.compile(r'^Storage: +(?P<storage>.*)$')
+        p36 = regex_engine.compile(r'^Storage: +(?P<storage>.*)$')
 
         # Key Label: client
-        p37 = re.compile(r'^Key Label: +(?P<label>.*)$')
+        p37 = regex_engine.compile(r'^Key Label: +(?P<label>.*)$')
 
         # Key storage device: nvram:client.cer#
-        p38 = re.compile(r'^Key storage device: +(?P<key_device>.*)$')
+        p38 = regex_engine.compile(r'^Key storage device: +(?P<key_device>.*)$')
         
         ###Variables###
         cdp_incr_count = 0
@@ -766,6 +769,68 @@ class ShowCryptoPkiCertificateVerbose(ShowCryptoPkiCertificateVerboseSchema):
         
         return ret_dict 
 
+
+# =========================================================
+#  Schema for 'show crypto pki certificates verbose'
+# =========================================================
+class ShowCryptoPkiCertificatesVerboseSchema(MetaParser):
+    """Schema for
+        * show crypto pki certificates verbose
+    """
+    schema = {
+        'trustpoints': {
+            Any(): ShowCryptoPkiCertificateVerboseSchema.schema
+        }
+    }
+
+
+# =========================================================
+#  Parser for 'show crypto pki certificates verbose'
+# =========================================================
+class ShowCryptoPkiCertificatesVerbose(ShowCryptoPkiCertificatesVerboseSchema):
+    """Parser for
+        * show crypto pki certificates verbose
+
+    Certificates of every trustpoint in one command. The output is split per
+    certificate, each certificate is parsed by ShowCryptoPkiCertificateVerbose
+    and listed under each of its associated trustpoints, so every trustpoint
+    holds what 'show crypto pki certificates verbose {trustpoint}' returns.
+    """
+
+    cli_command = 'show crypto pki certificates verbose'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # CA Certificate
+        # Certificate
+        # Certificate (Rollover)
+        # Router Self-Signed Certificate
+        # Certificate (subordinate CA certificate, Rollover)
+        p1 = regex_engine.compile(r'^((CA|Router Self-Signed) +)?Certificate( +\(.+\))?$')
+
+        # one block of lines per certificate
+        blocks = []
+        for line in output.splitlines():
+            if p1.match(line.strip()):
+                blocks.append([])
+            if blocks:
+                blocks[-1].append(line)
+
+        certificate_parser = ShowCryptoPkiCertificateVerbose(device=self.device)
+
+        ret_dict = {}
+        for block in blocks:
+            parsed = certificate_parser.cli(output='\n'.join(block))
+            for cer_type, cer_dict in parsed.get('certificates', {}).items():
+                for trustpoint in cer_dict.get('trustpoints', '').split():
+                    tp_dict = ret_dict.setdefault('trustpoints', {}).\
+                        setdefault(trustpoint, {}).setdefault('certificates', {})
+                    tp_dict[cer_type] = copy.deepcopy(cer_dict)
+
+        return ret_dict
+
 # =================================================
 #  Schema for 'show crypto pki trustpoints'
 # =================================================
@@ -821,33 +886,33 @@ class ShowCryptoPkiTrustpointsStatus(ShowCryptoPkiTrustpointsStatusSchema):
         # Trustpoint PROXY-SIGNING-ROOT-CA:
         # Trustpoint TP-self-signed-1922326537:
         # Trustpoint SLA-TrustPoint:
-        p1 = re.compile(r'^Trustpoint +(?P<tp_name>[\s\S]+):$')
+        p1 = regex_engine.compile(r'^Trustpoint +(?P<tp_name>[\s\S]+):$')
         # Issuing CA certificate configured:
         # Router General Purpose certificate configured:
-        p2 = re.compile(r'^(?P<cert>[\s\S]+) +certificate +(?P<cert_status>[\s\S]+):$')
+        p2 = regex_engine.compile(r'^(?P<cert>[\s\S]+) +certificate +(?P<cert_status>[\s\S]+):$')
         # Subject Name:
-        p3 = re.compile(r'^Subject Name:$')
+        p3 = regex_engine.compile(r'^Subject Name:$')
         # Last enrollment status: Granted
-        p4 = re.compile(r'^Last +enrollment +status: (?P<last_enroll_status>[\s\S]+)$')
+        p4 = regex_engine.compile(r'^Last +enrollment +status: (?P<last_enroll_status>[\s\S]+)$')
         # State:
-        p5 = re.compile(r'^State:$')
+        p5 = regex_engine.compile(r'^State:$')
         # cn=singlevman.viptela
         # ou=ET
         # o=SDWAN
         # l=BLR
-        p6 = re.compile(r'^(?P<common_name>[\s\S]+)=+(?P<cn_value>\S+),(?P<org_unit>[\s\S]+)=+(?P<org_unit_value>\S+),(?P<org>[\s\S]+)=+(?P<org_value>\S+),(?P<loc>[\s\S]+)=+(?P<loc_value>\S+),(?P<state>[\s\S]+)=+(?P<state_value>\S+),(?P<country>[\s\S]+)=+(?P<country_value>\S+)$')
+        p6 = regex_engine.compile(r'^(?P<common_name>[\s\S]+)=+(?P<cn_value>\S+),(?P<org_unit>[\s\S]+)=+(?P<org_unit_value>\S+),(?P<org>[\s\S]+)=+(?P<org_value>\S+),(?P<loc>[\s\S]+)=+(?P<loc_value>\S+),(?P<state>[\s\S]+)=+(?P<state_value>\S+),(?P<country>[\s\S]+)=+(?P<country_value>\S+)$')
         #cn=C8K-130c17d6-a587-4834-bfce-c12b7bba3c33
-        p6_1 = re.compile(r'^(?P<common_name>[\s\S]+)=+(?P<cn_value>\S+)$')
+        p6_1 = regex_engine.compile(r'^(?P<common_name>[\s\S]+)=+(?P<cn_value>\S+)$')
         # cn=OCSP-CA,dc=pki,dc=pki-dt,dc=com
-        p6_2 = re.compile(r'^(?P<common_name>[\s\S]+)=+(?P<cn_value>\S+),(?P<domain_component>[\s\S]+)=+(?P<dc_value>\S+),(?P<domain_pki>[\s\S]+)=+(?P<pki_value>\S+),(?P<domain_suffix>[\s\S]+)=+(?P<suffix_value>\S+)$')
+        p6_2 = regex_engine.compile(r'^(?P<common_name>[\s\S]+)=+(?P<cn_value>\S+),(?P<domain_component>[\s\S]+)=+(?P<dc_value>\S+),(?P<domain_pki>[\s\S]+)=+(?P<pki_value>\S+),(?P<domain_suffix>[\s\S]+)=+(?P<suffix_value>\S+)$')
         # Fingerprint MD5: 71C6E810 3E6D3664 4BF9F450 05C41AEC
-        p7 = re.compile(r'^Fingerprint +(?P<fp_type>[\s\S]+)\: (?P<fp_value>[\s\S]+)$')
+        p7 = regex_engine.compile(r'^Fingerprint +(?P<fp_type>[\s\S]+)\: (?P<fp_value>[\s\S]+)$')
         # Keys generated ............. Yes (General Purpose, non-exportable)
-        p8 = re.compile(r'^(?P<key_type>[\s\S]+) +\.{1,} +(?P<key_state>[\s\S]+) \(([\s\S]+)\)$')
+        p8 = regex_engine.compile(r'^(?P<key_type>[\s\S]+) +\.{1,} +(?P<key_state>[\s\S]+) \(([\s\S]+)\)$')
         # Issuing CA authenticated ....... Yes
-        p9 = re.compile(r'^(?P<key_type>[\s\S]+) +\.{1,} +(?P<key_state>[\s\S]+)$')
+        p9 = regex_engine.compile(r'^(?P<key_type>[\s\S]+) +\.{1,} +(?P<key_state>[\s\S]+)$')
         # Certificate request(s) ..... Yes
-        p10 = re.compile(r'^(?P<key_type>[\s\S]+)(s) +\.{1,} +(?P<key_state>[\s\S]+)$')
+        p10 = regex_engine.compile(r'^(?P<key_type>[\s\S]+)(s) +\.{1,} +(?P<key_state>[\s\S]+)$')
         ret_dict = {}
         for line in out.splitlines():
             line = line.strip()
@@ -1042,62 +1107,62 @@ class ShowCryptoSessionSuperParser(ShowCryptoSessionSchema):
     def cli(self, output=None):
 
         #Interface: Tunnel13
-        p1=re.compile(r'^Interface\:\s+(?P<interface_name>.+)$')
+        p1=regex_engine.compile(r'^Interface\:\s+(?P<interface_name>.+)$')
 
         #Uptime: 5d23h
-        p2=re.compile(r'^Uptime\:\s+(?P<up_time>\S+)$')
+        p2=regex_engine.compile(r'^Uptime\:\s+(?P<up_time>\S+)$')
 
         #Username: cisco
-        p3=re.compile(r'^Username\:\s+(?P<user_name>.+)$')
+        p3=regex_engine.compile(r'^Username\:\s+(?P<user_name>.+)$')
 
         #Profile: prof
-        p4=re.compile(r'^Profile\:\s+(?P<profile>.+)$')
+        p4=regex_engine.compile(r'^Profile\:\s+(?P<profile>.+)$')
 
         #Group: easy
-        p5=re.compile(r'^Group\:\s+(?P<group>.+)$')
+        p5=regex_engine.compile(r'^Group\:\s+(?P<group>.+)$')
 
         #Assigned address: 10.3.3.4
-        p6=re.compile(r'^Assigned\s+address\:\s+(?P<assigned_address>[\d\.]+)$')
+        p6=regex_engine.compile(r'^Assigned\s+address\:\s+(?P<assigned_address>[\d\.]+)$')
 
         #Session status: UP-ACTIVE
-        p7=re.compile(r'^Session\s+status\:\s+(?P<session_status>[\w-]+)')
+        p7=regex_engine.compile(r'^Session\s+status\:\s+(?P<session_status>[\w-]+)')
 
         #Peer: 11.0.1.2 port 500
         #Peer: 11.0.1.2 port 500 fvrf: (none) ivrf: (none)
         #Peer: 2001:DB8:ACAD:1::2 port 500
-        p8=re.compile(r'^Peer\:\s+(?P<peer>[0-9A-Fa-f\.\:]+)\s+port\s+(?P<port>\d+)(\s+fvrf\:\s+\(*(?P<fvrf>none|[^(]\S+)\)*\s+ivrf\:\s+\(*(?P<ivrf>none|[^(]\S+)\)*)?')
+        p8=regex_engine.compile(r'^Peer\:\s+(?P<peer>[0-9A-Fa-f\.\:]+)\s+port\s+(?P<port>\d+)(\s+fvrf\:\s+\(*(?P<fvrf>none|[^(]\S+)\)*\s+ivrf\:\s+\(*(?P<ivrf>none|[^(]\S+)\)*)?')
         
         # Phase1_id: 11.0.1.2
-        p9=re.compile(r'^\s*Phase1\_id\:\s+(?P<phase_id>\S+)$')
+        p9=regex_engine.compile(r'^\s*Phase1\_id\:\s+(?P<phase_id>\S+)$')
 
         # Desc: (none)
-        p10=re.compile(r'^\s*Desc\:\s+\(?(?P<desc>none|.*)\)?$')
+        p10=regex_engine.compile(r'^\s*Desc\:\s+\(?(?P<desc>none|.*)\)?$')
 
         # Session ID: 0  
-        p11=re.compile(r'^\s*Session\s+ID\:\s+(?P<session_id>\d+)$')
+        p11=regex_engine.compile(r'^\s*Session\s+ID\:\s+(?P<session_id>\d+)$')
 
         #IKEv1 SA: local 11.0.1.1/500 remote 11.0.1.2/500 Active
         #IKEv2 SA: local 2001:DB8:ACAD:1::1/500
-        p12=re.compile(r'^\s*(?P<version>IKE(v\d)*)*\s+SA\:\s+local\s+(?P<local>[0-9A-Fa-f\.\:]+)\/(?P<local_port>\d+)')
+        p12=regex_engine.compile(r'^\s*(?P<version>IKE(v\d)*)*\s+SA\:\s+local\s+(?P<local>[0-9A-Fa-f\.\:]+)\/(?P<local_port>\d+)')
 
         #  Capabilities:(none) connid:1025 lifetime:03:04:13
-        p13=re.compile(r'^\s*Capabilities\:\(*(?P<capabilities>\w+)+\)*\s+connid\:(?P<conn_id>\d+)\s+lifetime\:(?P<lifetime>[\d\:]+)$')
+        p13=regex_engine.compile(r'^\s*Capabilities\:\(*(?P<capabilities>\w+)+\)*\s+connid\:(?P<conn_id>\d+)\s+lifetime\:(?P<lifetime>[\d\:]+)$')
 
         # IPSEC FLOW: permit 47 host 11.0.1.1 host 11.0.1.2 
-        p14=re.compile(r'^\s*IPSEC\s+FLOW\:\s+(?P<ipsec_flow>.+)$')
+        p14=regex_engine.compile(r'^\s*IPSEC\s+FLOW\:\s+(?P<ipsec_flow>.+)$')
 
         #Active SAs: 2, origin: crypto map
-        p15=re.compile(r'^\s*Active\s+SAs\:\s+(?P<active_sa>\d+)\,\s+origin\:\s+(?P<origin>[\w\s]+)$')
+        p15=regex_engine.compile(r'^\s*Active\s+SAs\:\s+(?P<active_sa>\d+)\,\s+origin\:\s+(?P<origin>[\w\s]+)$')
 
         #Inbound:  #pkts dec'ed 4172534851 drop 0 life (KB/Sec) KB Vol Rekey Disabled/2576
-        p16=re.compile(r'^\s*Inbound\:\s+\#pkts\s+dec\'ed\s+(?P<inbound_pkts_dec>\d+)\s+drop\s+(?P<inbound_drop>\d+)\s+life\s+\(KB\/Sec\)\s+(?P<inbound_life_kb>[\w\s]+)\/(?P<inbound_life_secs>[\d a-z\/\,]+)$')
+        p16=regex_engine.compile(r'^\s*Inbound\:\s+\#pkts\s+dec\'ed\s+(?P<inbound_pkts_dec>\d+)\s+drop\s+(?P<inbound_drop>\d+)\s+life\s+\(KB\/Sec\)\s+(?P<inbound_life_kb>[\w\s]+)\/(?P<inbound_life_secs>[\d a-z\/\,]+)$')
 
         #Outbound: #pkts enc'ed 4146702954 drop 0 life (KB/Sec) KB Vol Rekey Disabled/2576
-        p17=re.compile(r'^\s*Outbound\:\s+\#pkts\s+enc\'ed\s+(?P<outbound_pkts_enc>\d+)\s+drop\s+(?P<outbound_drop>\d+)\s+life\s+\(KB\/Sec\)\s+(?P<outbound_life_kb>[\w\s]+)\/(?P<outbound_life_secs>[\d a-z\/\,]+)$')
+        p17=regex_engine.compile(r'^\s*Outbound\:\s+\#pkts\s+enc\'ed\s+(?P<outbound_pkts_enc>\d+)\s+drop\s+(?P<outbound_drop>\d+)\s+life\s+\(KB\/Sec\)\s+(?P<outbound_life_kb>[\w\s]+)\/(?P<outbound_life_secs>[\d a-z\/\,]+)$')
 
         #remote 2001:101:0:1::2/500 Active
         #remote 2001:DB8:ACAD:1::2/500 Active
-        p18=re.compile(r'.*remote\s+(?P<remote>[0-9A-Fa-f\.\:]+)\/(?P<remote_port>\d+)\s+(?P<conn_status>\w+)')
+        p18=regex_engine.compile(r'.*remote\s+(?P<remote>[0-9A-Fa-f\.\:]+)\/(?P<remote_port>\d+)\s+(?P<conn_status>\w+)')
         
         ret_dict = {}
         check_flag = 1
@@ -1363,7 +1428,7 @@ class ShowCryptoIpsecSaCount(ShowCryptoIpsecSaCountSchema):
         return_dict = {}
         # IPsec SA total: 8, active: 8, rekeying: 0, unused: 0, invalid: 0
         r1 = r"^IPsec SA total: +(?P<ipsec_sa_total>[\d]+), +active: +(?P<active>[\d]+), +rekeying: +(?P<rekeying>[\d]+), +unused: +(?P<unused>[\d]+), +invalid: +(?P<invalid>[\d]+)$"
-        p1 = re.compile(r1)
+        p1 = regex_engine.compile(r1)
         for line in output.splitlines():
             # IPsec SA total: 8, active: 8, rekeying: 0, unused: 0, invalid: 0
             m = p1.match(line)
@@ -1441,99 +1506,99 @@ class ShowCryptoIkev2SaDetail(ShowCryptoIkev2SaDetailSchema):
             output = self.device.execute(self.cli_command)
         # 973       92.1.121.1/500        22.1.1.2/500          none/121             READY
         r1 = r"^(?P<tunnel_id>[\d]+) +(?P<local>[0-9\.\S]+) +(?P<remote>[0-9\.\S]+) +(?P<fvrf>[\w]+)\/(?P<ivrf>[\d\w]+) +(?P<status>[\w]+)$"
-        p1 = re.compile(r1)
+        p1 = regex_engine.compile(r1)
 
         # Encr: AES-CBC, keysize: 256, PRF: SHA256, Hash: SHA256, DH Grp:19, Auth sign: PSK, Auth verify: PSK, QR
         r2 = r"^Encr: +(?P<encryption>[\d\w\-]+), keysize: +(?P<keysize>[\d]+), PRF: +(?P<prf>[\w]+), +Hash: +(?P<hash>[\w]+), +DH Grp:+(?P<dh_grp>[\w\d]+), +Auth sign: +(?P<auth_sign>[\w]+), +Auth verify: +(?P<auth_verify>[\w]+)(,\s+(?P<qr>[\w]+))?$"
-        p2 = re.compile(r2)
+        p2 = regex_engine.compile(r2)
 
         # Life/Active Time: 86400/12689 sec
         r3 = r"^Life+\S+Active Time: +(?P<life_time>[\d]+)\/(?P<active_time>[\d]+) +sec$"
-        p3 = re.compile(r3)
+        p3 = regex_engine.compile(r3)
 
         # CE id: 76468, Session-id: 17155
         r4 = r"^CE id:+ (?P<ce_id>[\d]+), +Session-id: +(?P<session_id>[\d]+)$"
-        p4 = re.compile(r4)
+        p4 = regex_engine.compile(r4)
 
         # Status Description: Negotiation done
         r5 = r"^Status Description:+ (?P<status_description>[\w\d\s]+)$"
-        p5 = re.compile(r5)
+        p5 = regex_engine.compile(r5)
 
         # Local spi: 000D3669857A0F82       Remote spi: E0419B1DB02DE6AE
         r6 = r"^Local spi: +(?P<local_spi>[\w\d]+) +Remote spi: +(?P<remote_spi>[\w\d]+)$"
-        p6 = re.compile(r6)
+        p6 = regex_engine.compile(r6)
 
         # Local id: user2621@cisco.com
         r7 = r"^Local id: +(?P<local_id>[\w\d\S]+)$"
-        p7 = re.compile(r7)
+        p7 = regex_engine.compile(r7)
 
         # Remote id: hostname.remoteid.example.com
         r8 = r"^Remote id: +(?P<remote_id>[\w\d\S]+)$"
-        p8 = re.compile(r8)
+        p8 = regex_engine.compile(r8)
 
         # Local req msg id:  214            Remote req msg id:  6
         r9 = r"^Local req msg id: +(?P<local_reg_msg_id>[\d]+) +Remote req msg id: +(?P<remote_req_msg_id>[\d]+)$"
-        p9 = re.compile(r9)
+        p9 = regex_engine.compile(r9)
 
         # Local next msg id: 214            Remote next msg id: 6
         r10 = r"^Local next msg id: +(?P<local_next_msg_id>[\d]+) +Remote next msg id: +(?P<remote_next_msg_id>[\d]+)$"
-        p10 = re.compile(r10)
+        p10 = regex_engine.compile(r10)
 
         # Local req queued:  214            Remote req queued:  6
         r11 = r"^Local req queued: +(?P<local_req_queued>[\d]+) +Remote req queued: +(?P<remote_req_queued>[\d]+)$"
-        p11 = re.compile(r11)
+        p11 = regex_engine.compile(r11)
 
         # Local window:      5              Remote window:      5
         r12 = r"^Local window: +(?P<local_window>[\d]+) +Remote window: +(?P<remote_window>[\d]+)$"
-        p12 = re.compile(r12)
+        p12 = regex_engine.compile(r12)
 
         # DPD configured for 60 seconds, retry 3
         r13 = r"^DPD configured for +(?P<dpd_configured_time>[\d]+) +seconds, retry +(?P<retry>[\d]+)$"
-        p13 = re.compile(r13)
+        p13 = regex_engine.compile(r13)
 
         # Fragmentation not  configured.
         r14 = r"^Fragmentation +(?P<fragmentation>[\d\s\S]+)$"
-        p14 = re.compile(r14)
+        p14 = regex_engine.compile(r14)
 
         # Dynamic Route Update: enabled
         r15 = r"^Dynamic Route Update: +(?P<dynamic_route_update>[\d\s\S]+)$"
-        p15 = re.compile(r15)
+        p15 = regex_engine.compile(r15)
 
         # Extended Authentication not configured.
         r16 = r"^Extended Authentication +(?P<extended_authentication>[\d\s\S]+)$"
-        p16 = re.compile(r16)
+        p16 = regex_engine.compile(r16)
 
         # NAT-T is not detected
         r17 = r"^NAT-T is +(?P<nat_t>[\d\s\S]+)$"
-        p17 = re.compile(r17)
+        p17 = regex_engine.compile(r17)
 
         # Cisco Trust Security SGT is disabled
         r18 = r"^Cisco Trust Security SGT is +(?P<cisco_trust_security_sgt>[\d\s\S]+)$"
-        p18 = re.compile(r18)
+        p18 = regex_engine.compile(r18)
 
         # Initiator of SA : Yes
         r19 = r"^Initiator of SA :+(?P<initiator_of_sa>[\d\s\S]+)$"
-        p19 = re.compile(r19)
+        p19 = regex_engine.compile(r19)
 
         # Pushed IP address: 8.1.9.4
         r20 = r"^Pushed IP address: +(?P<pushed_ip>[0-9\.]+)$"
-        p20 = re.compile(r20)
+        p20 = regex_engine.compile(r20)
 
         # 10.0.0.0 255.0.0.0
         r21 = r"^(?P<remote_subnets>[0-9\.\s]+)$"
-        p21 = re.compile(r21)
+        p21 = regex_engine.compile(r21)
 
         # Quantum Resistance Enabled
         r22 = r"^Quantum Resistance +(?P<quantum_resistance>[\d\s\S]+)$"
-        p22 = re.compile(r22)
+        p22 = regex_engine.compile(r22)
 
         # Quantum-Safe Encryption using PPK is enabled
         r23 = r"^Quantum-Safe Encryption using PPK is +(?P<quantum_resistance>[\d\s\S]+)$"
-        p23 = re.compile(r23)
+        p23 = regex_engine.compile(r23)
 
         # Quantum-safe Encryption using Manual PPK
         r24 = r"^Quantum-safe Encryption using +(?P<quantum_encry_type>\w+) +PPK$"
-        p24 = re.compile(r24)
+        p24 = regex_engine.compile(r24)
         
 
         ret_dict={}
@@ -1805,16 +1870,16 @@ class ShowCryptoEntropyStatus(ShowCryptoEntropyStatusSchema):
 		#2 randfill              SW  Working  128(*)
         #3 getrandombytes        SW  Working  160(*)
         #1 CPU jitter           Prim Working      3     256/768   ----> Above 17.10
-        p1 = re.compile(r"^(?P<count>\d+)\s+(?P<source>[\w\-\ ?]+)\s+ (?P<type>SW|HW|Phy|NPhy|Prim)\s+(?P<status>\S+)(\s+|\s+(?P<requests>\d+)\s+)(?P<entropy_bits>(\S+|\d+\/\d+\s+\(\*\)))$")
+        p1 = regex_engine.compile(r"^(?P<count>\d+)\s+(?P<source>[\w\-\ ?]+)\s+ (?P<type>SW|HW|Phy|NPhy|Prim)\s+(?P<status>\S+)(\s+|\s+(?P<requests>\d+)\s+)(?P<entropy_bits>(\S+|\d+\/\d+\s+\(\*\)))$")
 							
 	    #Fresh entropy collected once every 60 minutes
-        p2 = re.compile(r'^Fresh +entropy +collected +once +every +(?P<total>[\d\s\w]+)$')
+        p2 = regex_engine.compile(r'^Fresh +entropy +collected +once +every +(?P<total>[\d\s\w]+)$')
 											   
 		#Entropy most recently collected 22 minutes ago
-        p3 = re.compile(r'^Entropy +most +recently +collected +(?P<count>[\d\s\w]+)$')
+        p3 = regex_engine.compile(r'^Entropy +most +recently +collected +(?P<count>[\d\s\w]+)$')
 		
 		#Entropy target = 256 bits; entropy actually collected = 384 bits
-        p4 = re.compile(r'^Entropy +target\s+=\s+(?P<count1>[\d\s\w]+);\s+entropy +actually +collected\s+=\s+(?P<count2>[\d\s\w]+)$')
+        p4 = regex_engine.compile(r'^Entropy +target\s+=\s+(?P<count1>[\d\s\w]+);\s+entropy +actually +collected\s+=\s+(?P<count2>[\d\s\w]+)$')
 
         chassis_obj = {}
         
@@ -1903,49 +1968,49 @@ class ShowCryptoPkiServer(ShowCryptoPkiServerSchema):
         ret_dict = {}
 
         # Certificate Server root:
-        p1 = re.compile(r'^Certificate +Server +(?P<server_name>\S+):$')
+        p1 = regex_engine.compile(r'^Certificate +Server +(?P<server_name>\S+):$')
     
         # Status: enabled
-        p2 = re.compile(r'^Status:\s+(?P<ca_status>\w+)$')
+        p2 = regex_engine.compile(r'^Status:\s+(?P<ca_status>\w+)$')
 
         # State: enabled
-        p3 = re.compile(r'^State:\s+(?P<ca_state>\w+)$')
+        p3 = regex_engine.compile(r'^State:\s+(?P<ca_state>\w+)$')
         
         # Issuer name: CN=root
-        p4 = re.compile(r'^Issuer\s+name:\s+(?P<cert_issuer>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^Issuer\s+name:\s+(?P<cert_issuer>[\S\s]+)$')
 
         # CA cert fingerprint: CF2C23D1 560F25DB 22E9D10F E595A6D6
-        p5 = re.compile(r'^CA\s+cert\s+fingerprint:\s+(?P<ca_fingerprint>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^CA\s+cert\s+fingerprint:\s+(?P<ca_fingerprint>[\S\s]+)$')
 
         # Granting mode is: auto
-        p6 = re.compile(r'^Granting\s+mode\s+is:\s+(?P<mode>\w+)$')
+        p6 = regex_engine.compile(r'^Granting\s+mode\s+is:\s+(?P<mode>\w+)$')
 
         # Last certificate issued serial number (hex): 1
-        p7 = re.compile(r'Last\s+certificate\s+issued\s+serial\s+number\s+\(hex\):\s+(?P<serial>\S+)$')
+        p7 = regex_engine.compile(r'Last\s+certificate\s+issued\s+serial\s+number\s+\(hex\):\s+(?P<serial>\S+)$')
 
         # CA certificate expiration timer: 12:58:34 UTC Jan 4 2025
-        p8 = re.compile(r'^CA\s+certificate\s+expiration\s+timer:\s+(?P<ca_expiry>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^CA\s+certificate\s+expiration\s+timer:\s+(?P<ca_expiry>[\S\s]+)$')
 
         # CRL NextUpdate timer: 18:58:35 UTC Jan 5 2022
-        p9 = re.compile(r'^CRL\s+NextUpdate\s+timer:\s+(?P<crl_update>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^CRL\s+NextUpdate\s+timer:\s+(?P<crl_update>[\S\s]+)$')
 
         # Current primary storage dir: nvram:
-        p10 = re.compile(r'^Current\s+primary\s+storage\s+dir:\s+(?P<storage>\S+)$')
+        p10 = regex_engine.compile(r'^Current\s+primary\s+storage\s+dir:\s+(?P<storage>\S+)$')
 
         # Database Level: Complete - all issued certs written as <serialnum>.cer 
-        p11 = re.compile(r'^Database Level:\s+(?P<level>\w+)$')
+        p11 = regex_engine.compile(r'^Database Level:\s+(?P<level>\w+)$')
 
         # Autorollover timer: 12:58:34 UTC Jan 3 2025
-        p12 = re.compile(r'^Autorollover\s+timer:\s+(?P<rollover_timer>[\S\s]+)$')
+        p12 = regex_engine.compile(r'^Autorollover\s+timer:\s+(?P<rollover_timer>[\S\s]+)$')
 
         # Upper CA cert fingerprint: 8EF4710D 2C01F563 2ADBFC3C 716442CC
-        p13 = re.compile(r'^Upper\s+CA\s+cert\s+fingerprint:\s+(?P<subca_fp>[\S\s]+)$')
+        p13 = regex_engine.compile(r'^Upper\s+CA\s+cert\s+fingerprint:\s+(?P<subca_fp>[\S\s]+)$')
 
         # RA cert fingerprint: 885DA102 58DDDE50 3ECBA461 C0E71AEB
-        p14 = re.compile(r'^RA\s+cert\s+fingerprint:\s+(?P<ra_fp>[\S\s]+)$')
+        p14 = regex_engine.compile(r'^RA\s+cert\s+fingerprint:\s+(?P<ra_fp>[\S\s]+)$')
 
         # Server configured in RA mode
-        p15 = re.compile(r'^Server\s+configured\s+in\s+(?P<type>[\S\s]+)\s+mode$')
+        p15 = regex_engine.compile(r'^Server\s+configured\s+in\s+(?P<type>[\S\s]+)\s+mode$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2101,49 +2166,49 @@ class ShowCryptoPkiTimerDetail(ShowCryptoPkiTimerDetailSchema):
         ret_dict = {}
 
         #  |        8:02.030  (2022-01-16T03:09:36Z) SESSION CLEANUP
-        p1 = re.compile(r'^\s*\|?\s*(?P<sess_cleanup>\S+)\s+\((?P<sess_cleanup_iso>\S+)\)\s+SESSION\s+CLEANUP$')
+        p1 = regex_engine.compile(r'^\s*\|?\s*(?P<sess_cleanup>\S+)\s+\((?P<sess_cleanup_iso>\S+)\)\s+SESSION\s+CLEANUP$')
     
         # |291d23:59:52.231  (2022-11-04T03:01:26Z) RENEW client
-        p2 = re.compile(r'^\s*\|?\s*(?P<renew>\S+)\s+\((?P<renew_iso>\S+)\)\s+RENEW\s+\S+$')
+        p2 = regex_engine.compile(r'^\s*\|?\s*(?P<renew>\S+)\s+\((?P<renew_iso>\S+)\)\s+RENEW\s+\S+$')
 
         #  |985d11:54:30.614  (2024-09-26T20:48:17Z) SHADOW client
-        p3 = re.compile(r'^\s*\|?\s*(?P<shadow>\S+)\s+\((?P<shadow_iso>\S+)\)\s+SHADOW\s+\S+$')
+        p3 = regex_engine.compile(r'^\s*\|?\s*(?P<shadow>\S+)\s+\((?P<shadow_iso>\S+)\)\s+SHADOW\s+\S+$')
         
         # |          57.782  (2022-01-16T05:02:44Z) POLL client
-        p4 = re.compile(r'^\s*\|?\s*(?P<poll>\S+)\s+\((?P<poll_iso>\S+)\)\s+POLL\s+\S+$')
+        p4 = regex_engine.compile(r'^\s*\|?\s*(?P<poll>\S+)\s+\((?P<poll_iso>\S+)\)\s+POLL\s+\S+$')
 
         # |304d23:54:53.213  (2022-11-17T03:01:26Z) ID(client)
-        p5 = re.compile(r'^\s*\|?\s*(?P<expiry_id>\S+)\s+\((?P<expiry_id_iso>\S+)\)\s+ID\(\S+\)$')
+        p5 = regex_engine.compile(r'^\s*\|?\s*(?P<expiry_id>\S+)\s+\((?P<expiry_id_iso>\S+)\)\s+ID\(\S+\)$')
 
         # |1034d 5:41:45.106  (2024-11-15T08:48:18Z) CS(root)
-        p6 = re.compile(r'^\s*\|?\s*(?P<expiry_ca>\S+)\s+\((?P<expiry_ca_iso>\S+)\)\s+CS\(\S+\)$')
+        p6 = regex_engine.compile(r'^\s*\|?\s*(?P<expiry_ca>\S+)\s+\((?P<expiry_ca_iso>\S+)\)\s+CS\(\S+\)$')
 
         #  |     5:58:01.690  (2022-01-16T19:51:22Z) CRL EXPIRE c=US,o=Let's Encrypt,cn=R3
-        p7 = re.compile(r'^\s*\|?\s*(?P<crl_exp>\S+)\s+\((?P<crl_exp_iso>\S+)\)\s+CRL\s+EXPIRE\s+\S+$')
+        p7 = regex_engine.compile(r'^\s*\|?\s*(?P<crl_exp>\S+)\s+\((?P<crl_exp_iso>\S+)\)\s+CRL\s+EXPIRE\s+\S+$')
 
         #|     5:58:01.690  (2022-01-16T19:51:22Z) CRL UPDATE *c=US,o=Let's Encrypt,cn=R3
-        p8 = re.compile(r'^\s*\|?\s*(?P<crl_up>\S+)\s+\((?P<crl_up_iso>\S+)\)\s+CRL\s+UPDATE\s+\S+$')
+        p8 = regex_engine.compile(r'^\s*\|?\s*(?P<crl_up>\S+)\s+\((?P<crl_up_iso>\S+)\)\s+CRL\s+UPDATE\s+\S+$')
 
         #|       29:47.358  (2022-01-16T03:36:20Z) CRL auto-download retry timer
-        p9 = re.compile(r'^\s*\|?\s*(?P<crl_dnld>\S+)\s+\((?P<crl_dnld_iso>\S+)\)\s+CRL\s+auto-download\s+retry\s+timer$')
+        p9 = regex_engine.compile(r'^\s*\|?\s*(?P<crl_dnld>\S+)\s+\((?P<crl_dnld_iso>\S+)\)\s+CRL\s+auto-download\s+retry\s+timer$')
 
         # |2655d22:49:09.717  (2029-04-25T01:55:42Z) TRUSTPOOL
-        p10 = re.compile(r'^\s*\|?\s*(?P<trustpool>\S+)\s+\((?P<trustpool_iso>\S+)\)\s+TRUSTPOOL$')
+        p10 = regex_engine.compile(r'^\s*\|?\s*(?P<trustpool>\S+)\s+\((?P<trustpool_iso>\S+)\)\s+TRUSTPOOL$')
 
         #| 6.908 (2020-05-02T04:10:40Z) CONNECT RETRY estclient
-        p11 = re.compile(r'^\s*\|?\s*(?P<est_retry>\S+)\s+\((?P<est_retry_iso>\S+)\)\s+CONNECT\s+RETRY\s+\S+$')
+        p11 = regex_engine.compile(r'^\s*\|?\s*(?P<est_retry>\S+)\s+\((?P<est_retry_iso>\S+)\)\s+CONNECT\s+RETRY\s+\S+$')
 
         # |     5:40:16.483  (2022-01-16T08:46:49Z) CS CRL UPDATE
-        p12 = re.compile(r'^\s*\|?\s*(?P<cs_crl>\S+)\s+\((?P<cs_crl_iso>\S+)\)\s+CS\s+CRL\s+UPDATE$')
+        p12 = regex_engine.compile(r'^\s*\|?\s*(?P<cs_crl>\S+)\s+\((?P<cs_crl_iso>\S+)\)\s+CS\s+CRL\s+UPDATE$')
 
         # |1094d 5:21:45.573  (2025-01-14T08:28:18Z) CS SHADOW CERT GENERATION
-        p13 = re.compile(r'^\s*\|?\s*(?P<cs_shadow>\S+)\s+\((?P<cs_shadow_iso>\S+)\)\s+CS\s+SHADOW\s+CERT\s+GENERATION$')
+        p13 = regex_engine.compile(r'^\s*\|?\s*(?P<cs_shadow>\S+)\s+\((?P<cs_shadow_iso>\S+)\)\s+CS\s+SHADOW\s+CERT\s+GENERATION$')
 
         # |1094d 5:41:45.332  (2025-01-14T08:48:18Z) CS CERT EXPIRE
-        p14 = re.compile(r'^\s*\|?\s*(?P<cs_expiry>\S+)\s+\((?P<cs_expiry_iso>\S+)\)\s+CS\s+CERT\s+EXPIRE$')
+        p14 = regex_engine.compile(r'^\s*\|?\s*(?P<cs_expiry>\S+)\s+\((?P<cs_expiry_iso>\S+)\)\s+CS\s+CERT\s+EXPIRE$')
 
         # |  6d23:59:57.701  (2025-01-14T08:48:18Z) ER EXPIRE 1
-        p15 = re.compile(r'^\s*\|?\s*(?P<er_expiry>\S+)\s+\((?P<er_expiry_iso>\S+)\)\s+ER\s+EXPIRE\s+\d+$')
+        p15 = regex_engine.compile(r'^\s*\|?\s*(?P<er_expiry>\S+)\s+\((?P<er_expiry_iso>\S+)\)\s+ER\s+EXPIRE\s+\d+$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2296,12 +2361,12 @@ class ShowCryptoPkiServerRequests(ShowCryptoPkiServerRequestsSchema):
         # Subordinate CA certificate requests:
         # RA certificate requests:
         # Router certificates requests:
-        p1 = re.compile(r'^(?P<request_type>[\S\s]*) (certificate|certificates) requests:$')
+        p1 = regex_engine.compile(r'^(?P<request_type>[\S\s]*) (certificate|certificates) requests:$')
     
         # 1      granted    744566E755B84AEE18A86DF715D8EE33 hostname=pki-reg2.cisco.com,cn=R1 C=pki
         # 2      pending    744866E755B84AEE18A86DF715D8EE33 hostname=pki-reg2.cisco.com,cn=R1 C=pki
         # 3      authorized 744866E755B84AEE18A86DF715D8EE35 hostname=pki-reg2.cisco.com,cn=R1 C=pki
-        p2 = re.compile(r'^(?P<serial>\d+)\s+(?P<status>\S+)\s+(?P<fp>\S+)\s+(?P<subject>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^(?P<serial>\d+)\s+(?P<status>\S+)\s+(?P<fp>\S+)\s+(?P<subject>[\S\s]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2404,43 +2469,43 @@ class ShowCryptoSessionRemoteSuper(ShowCryptoSessionRemoteSchema):
         ret_dict = {}
 
         # Interface: Virtual-Access1325
-        p1 = re.compile(r'^Interface:\s+(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<interface>\S+)$')
     
         # Profile: IKEV2_PROFILE
-        p2 = re.compile(r'^Profile:\s+(?P<profile>\S+)$')
+        p2 = regex_engine.compile(r'^Profile:\s+(?P<profile>\S+)$')
 
         # Uptime: 13:17:14
-        p3 = re.compile(r'^Uptime:\s+(?P<up>\S+)$')
+        p3 = regex_engine.compile(r'^Uptime:\s+(?P<up>\S+)$')
         
         # Session status: UP-ACTIVE 
-        p4 = re.compile(r'^Session status:\s+(?P<session_stats>\S+)$')
+        p4 = regex_engine.compile(r'^Session status:\s+(?P<session_stats>\S+)$')
 
         # Peer: 17.27.1.11 port 38452 fvrf: (none) ivrf: 10
-        p5 = re.compile(r'^Peer:\s+(?P<peer>\S+)\s+port\s+(?P<port>\d+)(\s+fvrf:\s+\(?(?P<f_vrf>(\w+|\d+))\)?\s+ivrf:\s+\(?(?P<i_vrf>(\w+|\d+))\)?)?$')
+        p5 = regex_engine.compile(r'^Peer:\s+(?P<peer>\S+)\s+port\s+(?P<port>\d+)(\s+fvrf:\s+\(?(?P<f_vrf>(\w+|\d+))\)?\s+ivrf:\s+\(?(?P<i_vrf>(\w+|\d+))\)?)?$')
 
         # Phase1_id: scale
-        p6 = re.compile(r'^Phase1_id:\s+(?P<phase_name>\S+)$')
+        p6 = regex_engine.compile(r'^Phase1_id:\s+(?P<phase_name>\S+)$')
 
         # Session ID: 22062
-        p7 = re.compile(r'^Session\s+ID:\s+(?P<session_num>\S+)$')
+        p7 = regex_engine.compile(r'^Session\s+ID:\s+(?P<session_num>\S+)$')
 
         # IKEv2 SA: local 1.1.1.1/4500 remote 17.27.1.11/38452 Active
-        p8 = re.compile(r'^(?P<version>\w+)\s+SA:\s+local\s+(?P<localip>\S+)\/(?P<localport>\d+)\s+remote\s+(?P<remoteip>\S+)\/(?P<remoteport>\d+)\s+\S+$')
+        p8 = regex_engine.compile(r'^(?P<version>\w+)\s+SA:\s+local\s+(?P<localip>\S+)\/(?P<localport>\d+)\s+remote\s+(?P<remoteip>\S+)\/(?P<remoteport>\d+)\s+\S+$')
 
         # Capabilities:DN connid:323 lifetime:10:43:07
-        p9 = re.compile(r'^Capabilities:(?P<caps>\S+)\s+connid:(?P<conn>\d+)\s+lifetime:(?P<life>\S+)$')
+        p9 = regex_engine.compile(r'^Capabilities:(?P<caps>\S+)\s+connid:(?P<conn>\d+)\s+lifetime:(?P<life>\S+)$')
 
         # IPSEC FLOW: permit ip 0.0.0.0/0.0.0.0 host 7.1.2.88 
-        p10 = re.compile(r'^IPSEC\s+FLOW:\s+(?P<TS>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^IPSEC\s+FLOW:\s+(?P<TS>[\S\s]+)$')
 
         # Active SAs: 2, origin: crypto map
-        p11 = re.compile(r'^Active\s+SAs:\s+(?P<sa_count>\d+)\,\s+origin:\s+(?P<origin_type>[\S\s]+)$')
+        p11 = regex_engine.compile(r'^Active\s+SAs:\s+(?P<sa_count>\d+)\,\s+origin:\s+(?P<origin_type>[\S\s]+)$')
 
         # Inbound:  #pkts dec'ed 47668 drop 0 life (KB/Sec) 4607746/1687
-        p12 = re.compile(r'^Inbound:\s+#pkts\s+dec\'ed\s+(?P<decrypt_count>\d+)\s+drop\s+(?P<in_drop>\d+)\s+life\s+\(KB\/Sec\)\s+(?P<in_life_kb>\d+)\/(?P<in_life_sec>\d+)$')
+        p12 = regex_engine.compile(r'^Inbound:\s+#pkts\s+dec\'ed\s+(?P<decrypt_count>\d+)\s+drop\s+(?P<in_drop>\d+)\s+life\s+\(KB\/Sec\)\s+(?P<in_life_kb>\d+)\/(?P<in_life_sec>\d+)$')
 
         # Outbound: #pkts enc'ed 47672 drop 0 life (KB/Sec) 4607812/1874
-        p13 = re.compile(r'^Outbound:\s+#pkts\s+enc\'ed\s+(?P<encrypt_count>\d+)\s+drop\s+(?P<out_drop>\d+)\s+life\s+\(KB\/Sec\)\s+(?P<out_life_kb>\d+)\/(?P<out_life_sec>\d+)$')
+        p13 = regex_engine.compile(r'^Outbound:\s+#pkts\s+enc\'ed\s+(?P<encrypt_count>\d+)\s+drop\s+(?P<out_drop>\d+)\s+life\s+\(KB\/Sec\)\s+(?P<out_life_kb>\d+)\/(?P<out_life_sec>\d+)$')
 
         
         count = 0
@@ -2720,73 +2785,73 @@ class ShowCryptoIkev2StatsExt(ShowCryptoIkev2StatsExtSchema):
             output = self.device.execute(self.cli_command)
 
         # RECEIVING PSKEY                                   0          0
-        p1 = re.compile(r'^RECEIVING PSKEY\s+(?P<rec_ps_pass>\d+)\s+(?P<rec_ps_fail>\d+)$')
+        p1 = regex_engine.compile(r'^RECEIVING PSKEY\s+(?P<rec_ps_pass>\d+)\s+(?P<rec_ps_fail>\d+)$')
     
         # AUTHENTICATION USING EAP                      23986          0
-        p2 = re.compile(r'^AUTHENTICATION\s+USING\s+EAP\s+(?P<eap_auth_pass>\d+)\s+(?P<eap_auth_fail>\d+)$')
+        p2 = regex_engine.compile(r'^AUTHENTICATION\s+USING\s+EAP\s+(?P<eap_auth_pass>\d+)\s+(?P<eap_auth_fail>\d+)$')
 
         # START ACCOUNTING                               3990          0
-        p3 = re.compile(r'^START\s+ACCOUNTING\s+(?P<start_acc_pass>\d+)\s+(?P<start_acc_fail>\d+)$')
+        p3 = regex_engine.compile(r'^START\s+ACCOUNTING\s+(?P<start_acc_pass>\d+)\s+(?P<start_acc_fail>\d+)$')
         
         # STOP ACCOUNTING                                3186          0
-        p4 = re.compile(r'^STOP ACCOUNTING\s+(?P<stop_acc_pass>\d+)\s+(?P<stop_acc_fail>\d+)$')
+        p4 = regex_engine.compile(r'^STOP ACCOUNTING\s+(?P<stop_acc_pass>\d+)\s+(?P<stop_acc_fail>\d+)$')
 
         # AUTHORIZATION                                     0          0
-        p5 = re.compile(r'^AUTHORIZATION\s+(?P<auth_pass>\d+)\s+(?P<auth_fail>\d+)$')
+        p5 = regex_engine.compile(r'^AUTHORIZATION\s+(?P<auth_pass>\d+)\s+(?P<auth_fail>\d+)$')
 
         # IPSEC POLICY VERIFICATION                      8895          0
-        p6 = re.compile(r'^IPSEC POLICY VERIFICATION\s+(?P<policy_ver_pass>\d+)\s+(?P<policy_ver_fail>\d+)$')
+        p6 = regex_engine.compile(r'^IPSEC POLICY VERIFICATION\s+(?P<policy_ver_pass>\d+)\s+(?P<policy_ver_fail>\d+)$')
 
         # SA CREATION                                    8895          0
-        p7 = re.compile(r'^SA CREATION\s+(?P<sa_creation_pass>\d+)\s+(?P<sa_creation_fail>\d+)$')
+        p7 = regex_engine.compile(r'^SA CREATION\s+(?P<sa_creation_pass>\d+)\s+(?P<sa_creation_fail>\d+)$')
 
         # SA DELETION                                   16182          0
-        p8 = re.compile(r'^SA DELETION\s+(?P<sa_del_pass>\d+)\s+(?P<sa_del_fail>\d+)$')
+        p8 = regex_engine.compile(r'^SA DELETION\s+(?P<sa_del_pass>\d+)\s+(?P<sa_del_fail>\d+)$')
 
         # DH PUBKEY GENERATED                           11432          0
-        p9 = re.compile(r'^DH\s+PUBKEY\s+GENERATED\s+(?P<pubkey_gen_pass>\d+)\s+(?P<pubkey_gen_fail>\d+)$')
+        p9 = regex_engine.compile(r'^DH\s+PUBKEY\s+GENERATED\s+(?P<pubkey_gen_pass>\d+)\s+(?P<pubkey_gen_fail>\d+)$')
 
         # DH SHARED SECKEY GENERATED                    11432          0
-        p10 = re.compile(r'^DH\s+SHARED\s+SECKEY\s+GENERATED\s+(?P<secret_gen_pass>\d+)\s+(?P<secret_gen_fail>\d+)$')
+        p10 = regex_engine.compile(r'^DH\s+SHARED\s+SECKEY\s+GENERATED\s+(?P<secret_gen_pass>\d+)\s+(?P<secret_gen_fail>\d+)$')
 
         # SIGNATURE SIGN                                 4000          0
-        p11 = re.compile(r'^SIGNATURE\s+SIGN\s+(?P<sign_pass>\d+)\s+(?P<sign_fail>\d+)$')
+        p11 = regex_engine.compile(r'^SIGNATURE\s+SIGN\s+(?P<sign_pass>\d+)\s+(?P<sign_fail>\d+)$')
 
         # SIGNATURE VERIFY                                  0          0
-        p12 = re.compile(r'^SIGNATURE VERIFY\s+(?P<sign_ver_pass>\d+)\s+(?P<sign_ver_fail>\d+)$')
+        p12 = regex_engine.compile(r'^SIGNATURE VERIFY\s+(?P<sign_ver_pass>\d+)\s+(?P<sign_ver_fail>\d+)$')
 
         # VERIFY CERTIFICATE                                0          0
-        p13 = re.compile(r'^VERIFY CERTIFICATE\s+(?P<ver_cert_pass>\d+)\s+(?P<ver_cert_fail>\d+)$')
+        p13 = regex_engine.compile(r'^VERIFY CERTIFICATE\s+(?P<ver_cert_pass>\d+)\s+(?P<ver_cert_fail>\d+)$')
 
         # FETCHING CERTIFICATE USING HTTP                   0          0
-        p14 = re.compile(r'^FETCHING\s+CERTIFICATE\s+USING\s+HTTP\s+(?P<cert_http_pass>\d+)\s+(?P<cert_http_fail>\d+)$')
+        p14 = regex_engine.compile(r'^FETCHING\s+CERTIFICATE\s+USING\s+HTTP\s+(?P<cert_http_pass>\d+)\s+(?P<cert_http_fail>\d+)$')
 
         # FETCHING PEER CERTIFICATE USING HTTP              0          0
-        p15 = re.compile(r'^FETCHING\s+PEER\s+CERTIFICATE\s+USING\s+HTTP\s+(?P<peer_cert_http_pass>\d+)\s+(?P<peer_cert_http_fail>\d+)$')
+        p15 = regex_engine.compile(r'^FETCHING\s+PEER\s+CERTIFICATE\s+USING\s+HTTP\s+(?P<peer_cert_http_pass>\d+)\s+(?P<peer_cert_http_fail>\d+)$')
 
         # GET ISSUERS                                   13054          0
-        p16 = re.compile(r'^GET\s+ISSUERS\s+(?P<get_issuers_pass>\d+)\s+(?P<get_issuers_fail>\d+)$') 
+        p16 = regex_engine.compile(r'^GET\s+ISSUERS\s+(?P<get_issuers_pass>\d+)\s+(?P<get_issuers_fail>\d+)$') 
 
         # GET CERTIFICATES FROM ISSUERS                  6518          0
-        p17 = re.compile(r'^GET\s+CERTIFICATES\s+FROM\s+ISSUERS\s+(?P<get_cert_pass>\d+)\s+(?P<get_cert_fail>\d+)$')
+        p17 = regex_engine.compile(r'^GET\s+CERTIFICATES\s+FROM\s+ISSUERS\s+(?P<get_cert_pass>\d+)\s+(?P<get_cert_fail>\d+)$')
 
         # GET DN FROM CERT                                  0          0
-        p18 = re.compile(r'^GET\s+DN\s+FROM\s+CERT\s+(?P<get_dn_pass>\d+)\s+(?P<get_dn_fail>\d+)$')        
+        p18 = regex_engine.compile(r'^GET\s+DN\s+FROM\s+CERT\s+(?P<get_dn_pass>\d+)\s+(?P<get_dn_fail>\d+)$')        
 
         # GET_POLICY                                        0          0
-        p19 = re.compile(r'^GET_POLICY\s+(?P<get_policy_pass>\d+)\s+(?P<get_policy_fail>\d+)$')
+        p19 = regex_engine.compile(r'^GET_POLICY\s+(?P<get_policy_pass>\d+)\s+(?P<get_policy_fail>\d+)$')
 
         # SET_POLICY                                        0          0
-        p20 = re.compile(r'^SET_POLICY\s+(?P<set_policy_pass>\d+)\s+(?P<set_policy_fail>\d+)$')
+        p20 = regex_engine.compile(r'^SET_POLICY\s+(?P<set_policy_pass>\d+)\s+(?P<set_policy_fail>\d+)$')
 
         # PPK GET CAP                                       0          0
-        p21 = re.compile(r'^PPK\s+GET\s+CAP\s+(?P<ppk_get_cap_pass>\d+)\s+(?P<ppk_get_cap_fail>\d+)$')
+        p21 = regex_engine.compile(r'^PPK\s+GET\s+CAP\s+(?P<ppk_get_cap_pass>\d+)\s+(?P<ppk_get_cap_fail>\d+)$')
 
         # PPK GET KEY                                       0          0
-        p22 = re.compile(r'^PPK\s+GET\s+KEY\s+(?P<ppk_get_key_pass>\d+)\s+(?P<ppk_get_key_fail>\d+)$')
+        p22 = regex_engine.compile(r'^PPK\s+GET\s+KEY\s+(?P<ppk_get_key_pass>\d+)\s+(?P<ppk_get_key_fail>\d+)$')
 
         # IKE PREROUTE IDB VERIFICATION                     0          0
-        p23 = re.compile(r'^IKE\s+PREROUTE\s+IDB\s+VERIFICATION\s+(?P<idb_ver_pass>\d+)\s+(?P<idb_ver_fail>\d+)$')
+        p23 = regex_engine.compile(r'^IKE\s+PREROUTE\s+IDB\s+VERIFICATION\s+(?P<idb_ver_pass>\d+)\s+(?P<idb_ver_fail>\d+)$')
 
         # initial return dictionary
         ret_dict = {}
@@ -3070,19 +3135,19 @@ class ShowCryptoIkev2StatsTimeout(ShowCryptoIkev2StatsTimeoutSchema):
         ret_dict = {}
         
         #EXT SERVICE TIMER    0
-        p1 = re.compile(r'^EXT\s+SERVICE\s+TIMER\s+(?P<ext_service_timer>\d+)$')
+        p1 = regex_engine.compile(r'^EXT\s+SERVICE\s+TIMER\s+(?P<ext_service_timer>\d+)$')
 
 
         #AUTH TIMER     0
-        p2 = re.compile(r'^AUTH\s+TIMER\s+(?P<auth_timer>\d+)$')
+        p2 = regex_engine.compile(r'^AUTH\s+TIMER\s+(?P<auth_timer>\d+)$')
 
 
         #PACKET MAXIMUM RETRANS TIMER     7736
-        p3 = re.compile(r'^PACKET\s+MAXIMUM\s+RETRANS\s+TIMER\s+(?P<packet_max_retrans_timer>\d+)$')
+        p3 = regex_engine.compile(r'^PACKET\s+MAXIMUM\s+RETRANS\s+TIMER\s+(?P<packet_max_retrans_timer>\d+)$')
 
 
         #DPD MAX RETRANS TIMER         0
-        p4 = re.compile(r'^DPD\s+MAX\s+RETRANS\s+TIMER\s+(?P<dpd_max_retrans_timer>\d+)$')        
+        p4 = regex_engine.compile(r'^DPD\s+MAX\s+RETRANS\s+TIMER\s+(?P<dpd_max_retrans_timer>\d+)$')        
 
         # Parse all lines
         for line in out.splitlines():
@@ -3156,23 +3221,23 @@ class ShowCryptoIkev2StatsReconnect(ShowCryptoIkev2StatsReconnectSchema):
         inventory_dict = {}
         
         #Total incoming reconnect connection: 10        
-        p1 = re.compile(r'^Total\s+incoming\s+reconnect\s+connection:\s+(?P<incoming_reconnect>\d+)$')
+        p1 = regex_engine.compile(r'^Total\s+incoming\s+reconnect\s+connection:\s+(?P<incoming_reconnect>\d+)$')
 
 
         #Success reconnect connection: 10
-        p2 = re.compile(r'^Success\s+reconnect\s+connection:\s+(?P<success_reconnect>\d+)$') 
+        p2 = regex_engine.compile(r'^Success\s+reconnect\s+connection:\s+(?P<success_reconnect>\d+)$') 
 
 
         #Failed reconnect connection: 0        
-        p3 = re.compile(r'^Failed\s+reconnect\s+connection:\s+(?P<failed_reconnect>\d+)$')
+        p3 = regex_engine.compile(r'^Failed\s+reconnect\s+connection:\s+(?P<failed_reconnect>\d+)$')
 
 
         #Reconnect capable active session count: 4        
-        p4 = re.compile(r'^Reconnect\s+capable\s+active\s+session\s+count:\s(?P<active_session_count>\d+)$')  
+        p4 = regex_engine.compile(r'^Reconnect\s+capable\s+active\s+session\s+count:\s(?P<active_session_count>\d+)$')  
 
 
         #Reconnect capable inactive session count: 6
-        p5 = re.compile(r'^Reconnect\s+capable\s+inactive\s+session\s+count:\s(?P<inactive_session_count>\d+)$')  
+        p5 = regex_engine.compile(r'^Reconnect\s+capable\s+inactive\s+session\s+count:\s(?P<inactive_session_count>\d+)$')  
         
 
         # Parse all lines
@@ -3256,13 +3321,13 @@ class ShowCryptoIsakmpSa(ShowCryptoIsakmpSaSchema):
 
         # IPv4 Crypto ISAKMP SA
         # IPv6 Crypto ISAKMP SA
-        p1 = re.compile(r'^(?P<version>\S+) Crypto ISAKMP SA$')
+        p1 = regex_engine.compile(r'^(?P<version>\S+) Crypto ISAKMP SA$')
     
         # 9.45.9.7        9.45.9.8        QM_IDLE           1064 ACTIVE
         # 9.45.9.8        9.45.9.7        MM_NO_STATE       1063 ACTIVE (deleted)
         # 2001::1         3001::1         QM_IDLE           1064 ACTIVE
-        p2 = re.compile(r'^(?P<dst>\S+)\s+(?P<src>\S+)\s+(?P<state>\S+)\s+'
-                        r'(?P<id>\d+)\s+(?P<stats>\S+)(\s+\((?P<stats_now>\S+)\))?$')
+        p2 = regex_engine.compile(r'^(?P<dst>\S+)\s+(?P<src>\S+)\s+(?P<state>\S+)\s+'
+                                  r'(?P<id>\d+)\s+(?P<stats>\S+)(\s+\((?P<stats_now>\S+)\))?$')
 
         count = 0
         for line in output.splitlines():
@@ -3350,18 +3415,18 @@ class ShowCryptoIsakmpSaDetail(ShowCryptoIsakmpSaDetailSchema):
 
         # IPv4 Crypto ISAKMP SA
         # IPv6 Crypto ISAKMP SA
-        p1 = re.compile(r'^(?P<version>\S+) Crypto ISAKMP SA$')
+        p1 = regex_engine.compile(r'^(?P<version>\S+) Crypto ISAKMP SA$')
     
         # 29609 100.0.10.2      100.13.220.2           ACTIVE aes  sha    psk  16 00:01:47 D
         # 29610 100.0.10.2      100.13.220.2     RED      ACTIVE aes  sha    psk  16 00:01:47 D
         # 29611 100.0.10::2      100.13.220::2     RED      ACTIVE aes  sha    psk  16 00:01:47 D
-        p2 = re.compile(r'^(?P<conn_id>\d+)\s+(?P<local>\S+)\s+(?P<remote>\S+)\s+(?P<vrf>\S+)?\s+'
-                        r'(?P<stats>\w+)\s+(?P<encr>\S+)\s+(?P<hash>\S+)\s+(?P<auth>\S+)\s+'
-                        r'(?P<dh>\d+)\s+(?P<life>\S+)\s+(?P<cap>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<conn_id>\d+)\s+(?P<local>\S+)\s+(?P<remote>\S+)\s+(?P<vrf>\S+)?\s+'
+                                  r'(?P<stats>\w+)\s+(?P<encr>\S+)\s+(?P<hash>\S+)\s+(?P<auth>\S+)\s+'
+                                  r'(?P<dh>\d+)\s+(?P<life>\S+)\s+(?P<cap>\S+)$')
  
         # Engine-id:Conn-id =  SW:12609
         # Engine-id:Conn-id =  ????
-        p3 = re.compile(r'^Engine-id:Conn-id\s+=\s+(?P<engine>\S+):(?P<id>\d+)$')
+        p3 = regex_engine.compile(r'^Engine-id:Conn-id\s+=\s+(?P<engine>\S+):(?P<id>\d+)$')
 
         count = 0
         for line in output.splitlines():
@@ -3459,31 +3524,31 @@ class ShowCryptoMibIpsecFlowmibEndpoint(ShowCryptoMibIpsecFlowmibEndpointSchema)
         end_points_dict = {}
 
         # vrf CC-INTERNET
-        p1 = re.compile(r'^vrf\s+(?P<vrf_name>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^vrf\s+(?P<vrf_name>[\S\s]+)$')
 
         # Index:                       17
-        p2 = re.compile(r'^Index:\s+(?P<index>\d+)$')
+        p2 = regex_engine.compile(r'^Index:\s+(?P<index>\d+)$')
 
         # Local type:                  Single IP address
-        p3 = re.compile(r'^Local\s+type:\s+(?P<local_type>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Local\s+type:\s+(?P<local_type>[\S\s]+)$')
 
         # Local address:               1.1.0.100
-        p4 = re.compile(r'^Local\s+address:\s+(?P<local_address>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^Local\s+address:\s+(?P<local_address>[\S\s]+)$')
 
         # Protocol:                    47
-        p5 = re.compile(r'^Protocol:\s+(?P<protocol>\d+)$')
+        p5 = regex_engine.compile(r'^Protocol:\s+(?P<protocol>\d+)$')
 
         # Local port:                  0
-        p6 = re.compile(r'^Local\s+port:\s+(?P<local_port>\d+)$')
+        p6 = regex_engine.compile(r'^Local\s+port:\s+(?P<local_port>\d+)$')
  
         # Remote type:                 Single IP address
-        p7 = re.compile(r'^Remote\s+type:\s+(?P<remote_type>[\S\s]+)$')
+        p7 = regex_engine.compile(r'^Remote\s+type:\s+(?P<remote_type>[\S\s]+)$')
 
         # Remote address:              1.1.0.101
-        p8 = re.compile(r'^Remote\s+address:\s+(?P<remote_address>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^Remote\s+address:\s+(?P<remote_address>[\S\s]+)$')
 
         # Remote port:                 0
-        p9 = re.compile(r'^Remote\s+port:\s+(?P<remote_port>\d+)$')
+        p9 = regex_engine.compile(r'^Remote\s+port:\s+(?P<remote_port>\d+)$')
  
         vrf_count = 0
         result_dict = {}
@@ -3629,136 +3694,136 @@ class ShowCryptoMibIpsecFlowmibTunnel(ShowCryptoMibIpsecFlowmibTunnelSchema):
         flowmib_tunnel_dict = {}
 
         # vrf CC-INTERNET
-        p1 = re.compile(r'^vrf\s+(?P<vrf_name>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^vrf\s+(?P<vrf_name>[\S\s]+)$')
         
         # Index:                       17
-        p2 = re.compile(r'^Index:\s+(?P<index>\d+)$')
+        p2 = regex_engine.compile(r'^Index:\s+(?P<index>\d+)$')
 
         # Local address:               1.1.0.100
-        p3 = re.compile(r'^Local\s+address:\s+(?P<local_address>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Local\s+address:\s+(?P<local_address>[\S\s]+)$')
 
         # Remote address:              1.1.0.101
-        p4 = re.compile(r'^Remote\s+address:\s+(?P<remote_address>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^Remote\s+address:\s+(?P<remote_address>[\S\s]+)$')
 
         # IPSEC keying:                IKE
-        p5 = re.compile(r'^IPSEC\s+keying:\s+(?P<ipsec_keying>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^IPSEC\s+keying:\s+(?P<ipsec_keying>[\S\s]+)$')
 
         # Encapsulation mode:          2
-        p6 = re.compile(r'^Encapsulation\s+mode:\s+(?P<encap_mode>\d+)$')
+        p6 = regex_engine.compile(r'^Encapsulation\s+mode:\s+(?P<encap_mode>\d+)$')
 
         # Lifetime (KB):               4608000
-        p7 = re.compile(r'^Lifetime\s+\(KB\):\s+(?P<lifetime_kb>\d+)$')
+        p7 = regex_engine.compile(r'^Lifetime\s+\(KB\):\s+(?P<lifetime_kb>\d+)$')
 
         # Lifetime (Sec):              3600
-        p8 = re.compile(r'^Lifetime\s+\(Sec\):\s+(?P<lifetime_sec>\d+)$')
+        p8 = regex_engine.compile(r'^Lifetime\s+\(Sec\):\s+(?P<lifetime_sec>\d+)$')
  
         # Active time:                 00:05:50
-        p9 = re.compile(r'^Active\s+time:\s+(?P<active_time>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^Active\s+time:\s+(?P<active_time>[\S\s]+)$')
 
         # Lifetime threshold (KB):     64
-        p10 = re.compile(r'^Lifetime\s+threshold\s+\(KB\):\s+(?P<lifetime_threshold_kb>\d+)$')
+        p10 = regex_engine.compile(r'^Lifetime\s+threshold\s+\(KB\):\s+(?P<lifetime_threshold_kb>\d+)$')
 
         # Lifetime threshold (Sec):    10
-        p11 = re.compile(r'^Lifetime\s+threshold\s+\(Sec\):\s+(?P<lifetime_threshold_sec>\d+)$')
+        p11 = regex_engine.compile(r'^Lifetime\s+threshold\s+\(Sec\):\s+(?P<lifetime_threshold_sec>\d+)$')
 
         # Total number of refreshes:   0
-        p12 = re.compile(r'^Total\s+number\s+of\s+refreshes:\s+(?P<no_of_refresh>\d+)$')
+        p12 = regex_engine.compile(r'^Total\s+number\s+of\s+refreshes:\s+(?P<no_of_refresh>\d+)$')
 
         # Expired SA instances:        0
-        p13 = re.compile(r'^Expired\s+SA\s+instances:\s+(?P<expired_sa>\d+)$')
+        p13 = regex_engine.compile(r'^Expired\s+SA\s+instances:\s+(?P<expired_sa>\d+)$')
 
         # Current SA instances:        2
-        p14 = re.compile(r'^Current\s+SA\s+instances:\s+(?P<current_sa>\d+)$')
+        p14 = regex_engine.compile(r'^Current\s+SA\s+instances:\s+(?P<current_sa>\d+)$')
 
         # In SA DH group:              None
-        p15 = re.compile(r'^In\s+SA\s+DH\s+group:\s+(?P<in_sa_dh_group>[\S\s]+)$')
+        p15 = regex_engine.compile(r'^In\s+SA\s+DH\s+group:\s+(?P<in_sa_dh_group>[\S\s]+)$')
 
         # In sa encrypt algorithm:     aes
-        p16 = re.compile(r'^In\s+sa\s+encrypt\s+algorithm:\s+(?P<in_sa_encrypt_algorithm>[\S\s]+)$')
+        p16 = regex_engine.compile(r'^In\s+sa\s+encrypt\s+algorithm:\s+(?P<in_sa_encrypt_algorithm>[\S\s]+)$')
 
         # In SA AH auth algorithm:     None
-        p17 = re.compile(r'^In\s+SA\s+AH\s+auth\s+algorithm:\s+(?P<in_sa_ah_auth_algorithm>[\S\s]+)$')
+        p17 = regex_engine.compile(r'^In\s+SA\s+AH\s+auth\s+algorithm:\s+(?P<in_sa_ah_auth_algorithm>[\S\s]+)$')
 
         # In SA ESP auth algo:         None
-        p18 = re.compile(r'^In\s+SA\s+ESP\s+auth\s+algo:\s+(?P<in_sa_esp_auth_algorithm>[\S\s]+)$')
+        p18 = regex_engine.compile(r'^In\s+SA\s+ESP\s+auth\s+algo:\s+(?P<in_sa_esp_auth_algorithm>[\S\s]+)$')
 
         # In SA uncompress algorithm:  None
-        p19 = re.compile(r'^In\s+SA\s+uncompress\s+algorithm:\s+(?P<in_sa_uncompress_algorithm>[\S\s]+)$')
+        p19 = regex_engine.compile(r'^In\s+SA\s+uncompress\s+algorithm:\s+(?P<in_sa_uncompress_algorithm>[\S\s]+)$')
 
         # Out SA DH group:             None
-        p20 = re.compile(r'^Out\s+SA\s+DH\s+group:\s+(?P<out_sa_dh_group>[\S\s]+)$')
+        p20 = regex_engine.compile(r'^Out\s+SA\s+DH\s+group:\s+(?P<out_sa_dh_group>[\S\s]+)$')
 
         # Out SA encryption algorithm: aes
-        p21 = re.compile(r'^Out\s+SA\s+encryption\s+algorithm:\s+(?P<out_sa_encrypt_algorithm>[\S\s]+)$')
+        p21 = regex_engine.compile(r'^Out\s+SA\s+encryption\s+algorithm:\s+(?P<out_sa_encrypt_algorithm>[\S\s]+)$')
 
         # Out SA auth algorithm:       None
-        p22 = re.compile(r'^Out\s+SA\s+auth\s+algorithm:\s+(?P<out_sa_ah_auth_algorithm>[\S\s]+)$')
+        p22 = regex_engine.compile(r'^Out\s+SA\s+auth\s+algorithm:\s+(?P<out_sa_ah_auth_algorithm>[\S\s]+)$')
 
         # Out SA ESP auth algorithm:   None
-        p23 = re.compile(r'^Out\s+SA\s+ESP\s+auth\s+algorithm:\s+(?P<out_sa_esp_auth_algorithm>[\S\s]+)$')
+        p23 = regex_engine.compile(r'^Out\s+SA\s+ESP\s+auth\s+algorithm:\s+(?P<out_sa_esp_auth_algorithm>[\S\s]+)$')
 
         # Out SA uncompress algorithm: None
-        p24 = re.compile(r'^Out\s+SA\s+uncompress\s+algorithm:\s+(?P<out_sa_uncompress_algorithm>[\S\s]+)$')
+        p24 = regex_engine.compile(r'^Out\s+SA\s+uncompress\s+algorithm:\s+(?P<out_sa_uncompress_algorithm>[\S\s]+)$')
 
         # In octets:                   386160
-        p25 = re.compile(r'^In\s+octets:\s+(?P<in_octets>\d+)$')
+        p25 = regex_engine.compile(r'^In\s+octets:\s+(?P<in_octets>\d+)$')
 
         # Decompressed octets:         386160
-        p26 = re.compile(r'^Decompressed\s+octets:\s+(?P<decompressed_octets>\d+)$')
+        p26 = regex_engine.compile(r'^Decompressed\s+octets:\s+(?P<decompressed_octets>\d+)$')
 
         # In packets:                  3210
-        p27 = re.compile(r'^In\s+packets:\s+(?P<in_packets>\d+)$')
+        p27 = regex_engine.compile(r'^In\s+packets:\s+(?P<in_packets>\d+)$')
  
         # In drops:                    0
-        p28 = re.compile(r'^In\s+drops:\s+(?P<in_drops>\d+)$')
+        p28 = regex_engine.compile(r'^In\s+drops:\s+(?P<in_drops>\d+)$')
  
         # In replay drops:             0
-        p29 = re.compile(r'^In\s+replay\s+drops:\s+(?P<in_replay_drops>\d+)$')
+        p29 = regex_engine.compile(r'^In\s+replay\s+drops:\s+(?P<in_replay_drops>\d+)$')
  
         # In authentications:          3210
-        p30 = re.compile(r'^In\s+authentications:\s+(?P<in_authentications>\d+)$')
+        p30 = regex_engine.compile(r'^In\s+authentications:\s+(?P<in_authentications>\d+)$')
  
         # In authentication failures:  0
-        p31 = re.compile(r'^In\s+authentication\s+failures:\s+(?P<in_auth_failures>\d+)$')
+        p31 = regex_engine.compile(r'^In\s+authentication\s+failures:\s+(?P<in_auth_failures>\d+)$')
 
         # In decrypts:                 3210
-        p32 = re.compile(r'^In\s+decrypts:\s+(?P<in_decrypts>\d+)$')
+        p32 = regex_engine.compile(r'^In\s+decrypts:\s+(?P<in_decrypts>\d+)$')
  
         # In decrypt failures:         0
-        p33 = re.compile(r'^In\s+decrypt\s+failures:\s+(?P<in_decrypt_failures>\d+)$')
+        p33 = regex_engine.compile(r'^In\s+decrypt\s+failures:\s+(?P<in_decrypt_failures>\d+)$')
  
         # Out octets:                  194700
-        p34 = re.compile(r'^Out\s+octets:\s+(?P<out_octets>\d+)$')
+        p34 = regex_engine.compile(r'^Out\s+octets:\s+(?P<out_octets>\d+)$')
 
         # Out uncompressed octets:     194700
-        p35 = re.compile(r'^Out\s+uncompressed\s+octets:\s+(?P<out_uncompressed_octets>\d+)$')
+        p35 = regex_engine.compile(r'^Out\s+uncompressed\s+octets:\s+(?P<out_uncompressed_octets>\d+)$')
 
         # Out packets:                 3222
-        p36 = re.compile(r'^Out\s+packets:\s+(?P<out_packets>\d+)$')
+        p36 = regex_engine.compile(r'^Out\s+packets:\s+(?P<out_packets>\d+)$')
  
         # Out drops:                   0
-        p37 = re.compile(r'^Out\s+drops:\s+(?P<out_drops>\d+)$')
+        p37 = regex_engine.compile(r'^Out\s+drops:\s+(?P<out_drops>\d+)$')
  
         # Out authentications:         3222
-        p38 = re.compile(r'^Out\s+authentications:\s+(?P<out_authentications>\d+)$')
+        p38 = regex_engine.compile(r'^Out\s+authentications:\s+(?P<out_authentications>\d+)$')
  
         # Out authentication failures: 0
-        p39 = re.compile(r'^Out\s+authentication\s+failures:\s+(?P<out_auth_failures>\d+)$')
+        p39 = regex_engine.compile(r'^Out\s+authentication\s+failures:\s+(?P<out_auth_failures>\d+)$')
  
         # Out encryptions:             3222
-        p40 = re.compile(r'^Out\s+encryptions:\s+(?P<out_encryptions>\d+)$')
+        p40 = regex_engine.compile(r'^Out\s+encryptions:\s+(?P<out_encryptions>\d+)$')
  
         # Out encryption failures:     0
-        p41 = re.compile(r'^Out\s+encryption\s+failures:\s+(?P<out_encryption_failures>\d+)$')
+        p41 = regex_engine.compile(r'^Out\s+encryption\s+failures:\s+(?P<out_encryption_failures>\d+)$')
  
         # Compressed octets:           0
-        p42 = re.compile(r'^Compressed\s+octets:\s+(?P<compressed_octets>\d+)$')
+        p42 = regex_engine.compile(r'^Compressed\s+octets:\s+(?P<compressed_octets>\d+)$')
 
         # Decompressed octets:         0
-        p43 = re.compile(r'^Decompressed\s+octets:\s+(?P<decompressed_octets_1>\d+)$')
+        p43 = regex_engine.compile(r'^Decompressed\s+octets:\s+(?P<decompressed_octets_1>\d+)$')
 
         # Out uncompressed octets:     0
-        p44 = re.compile(r'^Out\s+uncompressed\s+octets:\s+(?P<out_uncompressed_octets_1>\d+)$')
+        p44 = regex_engine.compile(r'^Out\s+uncompressed\s+octets:\s+(?P<out_uncompressed_octets_1>\d+)$')
 
         vrf_count = 0
         result_dict = {}
@@ -4150,119 +4215,119 @@ class ShowCryptoIkev2Session(ShowCryptoIkev2SessionSchema):
  
         # IPv4 Crypto IKEv2 Session
         # IPv6 Crypto IKEv2 Session
-        p1 = re.compile(r'^(?P<version>\S+) Crypto IKEv2 Session$')
+        p1 = regex_engine.compile(r'^(?P<version>\S+) Crypto IKEv2 Session$')
    
         # Session-id:3, Status:UP-ACTIVE, IKE count:1, CHILD count:1
-        p2 = re.compile(r'^Session-id:(?P<s_id>\d+),\s+Status:(?P<stats>\S+),\s+'
-                        r'IKE count:(?P<ike>\d+),\s+CHILD count:(?P<child>\d+)$')
+        p2 = regex_engine.compile(r'^Session-id:(?P<s_id>\d+),\s+Status:(?P<stats>\S+),\s+'
+                                  r'IKE count:(?P<ike>\d+),\s+CHILD count:(?P<child>\d+)$')
        
         # 1         1.1.1.1/500           1.1.1.2/500           none/none            READY
         # 2         1.1.1.1/4500          17.27.1.12/45711      none/10              READY
-        p3 = re.compile(r'^(?P<t_id>\d+)\s+(?P<loc_ip>\S+)\/(?P<loc_port>\d+)\s+'
-                        r'(?P<rem_ip>\S+)\/(?P<rem_port>\d+)\s+'
-                        r'(?P<f_vrf>\S+)\/(?P<i_vrf>\S+)\s+(?P<sess_stats>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<t_id>\d+)\s+(?P<loc_ip>\S+)\/(?P<loc_port>\d+)\s+'
+                                  r'(?P<rem_ip>\S+)\/(?P<rem_port>\d+)\s+'
+                                  r'(?P<f_vrf>\S+)\/(?P<i_vrf>\S+)\s+(?P<sess_stats>\S+)$')
  
         # Encr: AES-CBC, keysize: 256, PRF: SHA256, Hash: SHA256, DH Grp:19, Auth sign: RSA, Auth verify: AnyConnect-EAP
         # Encr: AES-CBC, keysize: 256, PRF: SHA256, Hash: SHA256, DH Grp:14, Auth sign: PSK, Auth verify: PSK
-        p4 = re.compile(r'^Encr:\s+(?P<encr>\S+),\s+keysize:\s+(?P<key_len>\d+),\s+'
-                        r'PRF:\s+(?P<random>\S+),\s+Hash:\s+(?P<hash>\S+),\s+DH Grp:(?P<dh>\d+),\s+'
-                        r'Auth sign:\s+(?P<auth>\S+),\s+Auth verify:\s+(?P<auth_ver>\S+)$')
+        p4 = regex_engine.compile(r'^Encr:\s+(?P<encr>\S+),\s+keysize:\s+(?P<key_len>\d+),\s+'
+                                  r'PRF:\s+(?P<random>\S+),\s+Hash:\s+(?P<hash>\S+),\s+DH Grp:(?P<dh>\d+),\s+'
+                                  r'Auth sign:\s+(?P<auth>\S+),\s+Auth verify:\s+(?P<auth_ver>\S+)$')
  
         # Life/Active Time: 86400/38157 sec
-        p5 = re.compile(r'^Life\/Active\s+Time:\s+(?P<life>\d+)\/(?P<active>\d+)\s+sec$')
+        p5 = regex_engine.compile(r'^Life\/Active\s+Time:\s+(?P<life>\d+)\/(?P<active>\d+)\s+sec$')
  
         # CE id: 1008, Session-id: 3
         # CE id: 0, Session-id: 1, MIB-id: 1
-        p6 = re.compile(r'^CE\s+id:\s+(?P<c_id>\d+),\s+Session-id:\s+(?P<se_id>\d+)(,\s+MIB-id:\s+(?P<m_id>\d+))?$')
+        p6 = regex_engine.compile(r'^CE\s+id:\s+(?P<c_id>\d+),\s+Session-id:\s+(?P<se_id>\d+)(,\s+MIB-id:\s+(?P<m_id>\d+))?$')
  
         # Local spi: 12A1648D1789A9F9       Remote spi: 0408D9A1AFA334B4
-        p7 = re.compile(r'^Local spi:\s+(?P<l_spi>\S+)\s+Remote spi:\s+(?P<r_spi>\S+)$')
+        p7 = regex_engine.compile(r'^Local spi:\s+(?P<l_spi>\S+)\s+Remote spi:\s+(?P<r_spi>\S+)$')
  
         # Local id: 1.1.1.1
-        p8 = re.compile(r'^Local id:\s+(?P<l_id>\S+)$')
+        p8 = regex_engine.compile(r'^Local id:\s+(?P<l_id>\S+)$')
  
         # Remote id: 1.1.1.2
         # Remote id: Scale
-        p9 = re.compile(r'^Remote id:\s+(?P<r_id>\S+)$')
+        p9 = regex_engine.compile(r'^Remote id:\s+(?P<r_id>\S+)$')
  
         # Remote EAP id: docker9_69
-        p10 = re.compile(r'^Remote EAP id:\s+(?P<r_eap_id>\S+)$')
+        p10 = regex_engine.compile(r'^Remote EAP id:\s+(?P<r_eap_id>\S+)$')
  
         # Local req msg id:  2              Remote req msg id:  0
-        p11 = re.compile(r'^Local req msg id:\s+(?P<l_req_id>\d+)\s+'
-                         r'Remote req msg id:\s+(?P<r_req_id>\d+)$')
+        p11 = regex_engine.compile(r'^Local req msg id:\s+(?P<l_req_id>\d+)\s+'
+                                   r'Remote req msg id:\s+(?P<r_req_id>\d+)$')
  
         # Local next msg id: 2              Remote next msg id: 0
-        p12 = re.compile(r'^Local next msg id:\s+(?P<l_next_id>\d+)\s+'
-                         r'Remote next msg id:\s+(?P<r_next_id>\d+)$')
+        p12 = regex_engine.compile(r'^Local next msg id:\s+(?P<l_next_id>\d+)\s+'
+                                   r'Remote next msg id:\s+(?P<r_next_id>\d+)$')
  
         # Local req queued:  2              Remote req queued:  0
-        p13 = re.compile(r'^Local req queued:\s+(?P<l_queued>\d+)\s+'
-                         r'Remote req queued:\s+(?P<r_queued>\d+)$')
+        p13 = regex_engine.compile(r'^Local req queued:\s+(?P<l_queued>\d+)\s+'
+                                   r'Remote req queued:\s+(?P<r_queued>\d+)$')
  
         # Local window:      5              Remote window:      5
-        p14 = re.compile(r'^Local window:\s+(?P<l_window>\d+)\s+'
-                         r'Remote window:\s+(?P<r_window>\d+)$')
+        p14 = regex_engine.compile(r'^Local window:\s+(?P<l_window>\d+)\s+'
+                                   r'Remote window:\s+(?P<r_window>\d+)$')
  
         # DPD configured for 45 seconds, retry 2
-        p15 = re.compile(r'^DPD\s+configured\s+for\s+(?P<dpd_in>\d+)\s+seconds,\s+retry\s+(?P<retry>\d+)$')
+        p15 = regex_engine.compile(r'^DPD\s+configured\s+for\s+(?P<dpd_in>\d+)\s+seconds,\s+retry\s+(?P<retry>\d+)$')
  
         # Fragmentation not  configured.
-        p16 = re.compile(r'^Fragmentation\s+not\s+configured\.$')
+        p16 = regex_engine.compile(r'^Fragmentation\s+not\s+configured\.$')
  
         # IETF Std Fragmentation  configured.
-        p17 = re.compile(r'^IETF\s+Std\s+Fragmentation\s+configured\.$')
+        p17 = regex_engine.compile(r'^IETF\s+Std\s+Fragmentation\s+configured\.$')
  
         # Dynamic Route Update: enabled
-        p18 = re.compile(r'^Dynamic\s+Route\s+Update:\s+(?P<dyn_route>\S+)$')
+        p18 = regex_engine.compile(r'^Dynamic\s+Route\s+Update:\s+(?P<dyn_route>\S+)$')
  
         # NAT-T is not detected
-        p19 = re.compile(r'^NAT-T\s+is\s+not\s+detected$')
+        p19 = regex_engine.compile(r'^NAT-T\s+is\s+not\s+detected$')
  
         # NAT-T is detected  outside
         # NAT-T is detected  inside
-        p20 = re.compile(r'^NAT-T\s+is\s+detected\s+(?P<nat>\w+)$')
+        p20 = regex_engine.compile(r'^NAT-T\s+is\s+detected\s+(?P<nat>\w+)$')
  
         # Cisco Trust Security SGT is enabled
         # Cisco Trust Security SGT is disabled
-        p21 = re.compile(r'^Cisco\s+Trust\s+Security\s+SGT\s+is\s+(?P<sgt>\w+)$')
+        p21 = regex_engine.compile(r'^Cisco\s+Trust\s+Security\s+SGT\s+is\s+(?P<sgt>\w+)$')
  
         # Initiator of SA : Yes
-        p22 = re.compile(r'^Initiator\s+of\s+SA\s+:\s+(?P<initiator>\w+)$')
+        p22 = regex_engine.compile(r'^Initiator\s+of\s+SA\s+:\s+(?P<initiator>\w+)$')
  
         # Child sa:
-        p23 = re.compile(r'^(?P<child_sa>[\S\s]+):$')
+        p23 = regex_engine.compile(r'^(?P<child_sa>[\S\s]+):$')
 
         # local selector       ->      remote selector
-        p23_1 = re.compile(r'^local\s+selector\s+->\s+remote\s+selector$')
+        p23_1 = regex_engine.compile(r'^local\s+selector\s+->\s+remote\s+selector$')
 
         # Child sa: local selector  10.10.10.0/0 - 10.10.10.255/65535
         # local selector  10.10.10.0/0 - 10.10.10.255/65535
-        p23_2 = re.compile(r'^((?P<child_sa>[\S\s]+):\s+)?local\s+selector\s+(?P<child_l>[\S\s]+)$')
+        p23_2 = regex_engine.compile(r'^((?P<child_sa>[\S\s]+):\s+)?local\s+selector\s+(?P<child_l>[\S\s]+)$')
 
         # remote selector 20.20.20.0/0 - 20.20.20.255/65535
-        p23_3 = re.compile(r'^remote\s+selector\s+(?P<child_r>[\S\s]+)$')
+        p23_3 = regex_engine.compile(r'^remote\s+selector\s+(?P<child_r>[\S\s]+)$')
 
         # 89.89.89.0/0 - 89.89.89.255/65535    ->    99.99.99.0/0 - 99.99.99.255/65535
         # 8001::/0 - 8001::FFFF:FFFF:FFFF:FFFF/65535    ->    9001::/0 - 9001::FFFF:FFFF:FFFF:FFFF/65535
-        p24 = re.compile(r'^(?P<traffic_selector>\S+\s+-\s+\S+\s+->\s+\S+\s+-\s+\S+)$')
+        p24 = regex_engine.compile(r'^(?P<traffic_selector>\S+\s+-\s+\S+\s+->\s+\S+\s+-\s+\S+)$')
 
         # ESP spi in/out: 0x232CB82D/0x30767B6E
-        p25 = re.compile(r'^ESP\s+spi\s+in\/out:\s+(?P<esp_i>\S+)\/(?P<esp_o>\S+)$')
+        p25 = regex_engine.compile(r'^ESP\s+spi\s+in\/out:\s+(?P<esp_i>\S+)\/(?P<esp_o>\S+)$')
 
         # AH spi in/out: 0x0/0x0
-        p26 = re.compile(r'^AH\s+spi\s+in\/out:\s+(?P<ah_i>\S+)\/(?P<ah_o>\S+)$')
+        p26 = regex_engine.compile(r'^AH\s+spi\s+in\/out:\s+(?P<ah_i>\S+)\/(?P<ah_o>\S+)$')
 
         # CPI in/out: 0x0/0x0
-        p27 = re.compile(r'^CPI\s+in\/out:\s+(?P<cpi_i>\S+)\/(?P<cpi_o>\S+)$')
+        p27 = regex_engine.compile(r'^CPI\s+in\/out:\s+(?P<cpi_i>\S+)\/(?P<cpi_o>\S+)$')
 
         # Encr: AES-CBC, keysize: 256, esp_hmac: SHA256
-        p28 = re.compile(r'^Encr:\s+(?P<encr_algo>\S+),\s+keysize:\s+(?P<key_s>\d+),\s+'
-                         r'esp_hmac:\s+(?P<hmac>\S+)$')
+        p28 = regex_engine.compile(r'^Encr:\s+(?P<encr_algo>\S+),\s+keysize:\s+(?P<key_s>\d+),\s+'
+                                   r'esp_hmac:\s+(?P<hmac>\S+)$')
 
         # ah_hmac: None, comp: IPCOMP_NONE, mode tunnel
-        p29 = re.compile(r'^ah_hmac:\s+(?P<ahhmac>[\S\s]*),\s+comp:\s+(?P<comp>\S+),\s+'
-                         r'mode\s+(?P<tunnel_type>\S+)$')
+        p29 = regex_engine.compile(r'^ah_hmac:\s+(?P<ahhmac>[\S\s]*),\s+comp:\s+(?P<comp>\S+),\s+'
+                                   r'mode\s+(?P<tunnel_type>\S+)$')
 
         child_count = count = 0
         for line in output.splitlines():
@@ -4659,124 +4724,124 @@ class ShowCryptoIpsecSaDetail(ShowCryptoIpsecSaDetailSchema):
             output = self.device.execute(self.cli_command)
 
         # interface: GigabitEthernet3
-        p1 = re.compile(r'^interface:+ (?P<interface>[\w\d]+)$')
+        p1 = regex_engine.compile(r'^interface:+ (?P<interface>[\w\d]+)$')
 
         # Crypto map tag: vpn-crypto-map, local addr 1.1.1.2
-        p2 = re.compile(r'^Crypto map tag: (?P<crypto_map_tag>[\w\d\-]+), +local addr +(?P<local_addr>[\d\.]+)$')
+        p2 = regex_engine.compile(r'^Crypto map tag: (?P<crypto_map_tag>[\w\d\-]+), +local addr +(?P<local_addr>[\d\.]+)$')
 
         # protected vrf: (none)
-        p3 = re.compile(r'^protected vrf: (?P<protected_vrf>\S+)$')
+        p3 = regex_engine.compile(r'^protected vrf: (?P<protected_vrf>\S+)$')
 
         # local ident (addr/mask/prot/port): (20.20.20.0/255.255.255.0/0/0)
-        p4 = re.compile(r'^local.*: +\((?P<addr>[0-9\.]+)\/(?P<mask>[0-9\.]+)\/(?P<prot>[\d]+)\/(?P<port>[\d]+)\)$')
+        p4 = regex_engine.compile(r'^local.*: +\((?P<addr>[0-9\.]+)\/(?P<mask>[0-9\.]+)\/(?P<prot>[\d]+)\/(?P<port>[\d]+)\)$')
 
         # remote ident (addr/mask/prot/port): (10.10.10.0/255.255.255.0/0/0)
-        p5 = re.compile(r'^remote.*: +\((?P<addr>[0-9\.]+)\/(?P<mask>[0-9\.]+)\/(?P<prot>[\d]+)\/(?P<port>[\d]+)\)$')
+        p5 = regex_engine.compile(r'^remote.*: +\((?P<addr>[0-9\.]+)\/(?P<mask>[0-9\.]+)\/(?P<prot>[\d]+)\/(?P<port>[\d]+)\)$')
 
         # current_peer 1.1.1.1 port 500
-        p6 = re.compile(r'^current_peer +(?P<peer_ip>[0-9\.]+) +port +(?P<port>[0-9]+)$')
+        p6 = regex_engine.compile(r'^current_peer +(?P<peer_ip>[0-9\.]+) +port +(?P<port>[0-9]+)$')
 
         # PERMIT, flags={origin_is_acl,}
-        p7 = re.compile(r'^(?P<action>\w+), +flags=\{(?P<acl>[\w\_\-\,]+)\}$')
+        p7 = regex_engine.compile(r'^(?P<action>\w+), +flags=\{(?P<acl>[\w\_\-\,]+)\}$')
 
         # #pkts encaps: 4, #pkts encrypt: 4, #pkts digest: 4
-        p8 = re.compile(r'^#pkts encaps: +(?P<pkts_encaps>\d+).*: +(?P<pkts_encrypt>\d+).*: +(?P<pkts_digest>\d+)$')
+        p8 = regex_engine.compile(r'^#pkts encaps: +(?P<pkts_encaps>\d+).*: +(?P<pkts_encrypt>\d+).*: +(?P<pkts_digest>\d+)$')
 
         # #pkts decaps: 4, #pkts decrypt: 4, #pkts verify: 4
-        p9 = re.compile(r'^#pkts decaps: +(?P<pkts_decaps>\d+).*: +(?P<pkts_decrypt>\d+).*: +(?P<pkts_verify>\d+)$')
+        p9 = regex_engine.compile(r'^#pkts decaps: +(?P<pkts_decaps>\d+).*: +(?P<pkts_decrypt>\d+).*: +(?P<pkts_verify>\d+)$')
 
         # #pkts compressed: 0, #pkts decompressed: 0
-        p10 = re.compile(r'^#pkts compressed: +(?P<pkts_compressed>\d+).*: +(?P<pkts_decompressed>\d+)$')
+        p10 = regex_engine.compile(r'^#pkts compressed: +(?P<pkts_compressed>\d+).*: +(?P<pkts_decompressed>\d+)$')
 
         # #pkts not compressed: 0, #pkts compr. failed: 0
-        p11 = re.compile(r'^#pkts not compressed: +(?P<pkts_not_compressed>\d+).*: +(?P<pkts_compr_failed>\d+)$')
+        p11 = regex_engine.compile(r'^#pkts not compressed: +(?P<pkts_not_compressed>\d+).*: +(?P<pkts_compr_failed>\d+)$')
 
         # #pkts not decompressed: 0, #pkts decompress failed: 0
-        p12 = re.compile(r'^#pkts not decompressed: +(?P<pkts_not_decompressed>\d+).*: +(?P<pkts_decompress_failed>\d+)$')
+        p12 = regex_engine.compile(r'^#pkts not decompressed: +(?P<pkts_not_decompressed>\d+).*: +(?P<pkts_decompress_failed>\d+)$')
 
         # #send errors 0, #recv errors 0 
-        p13 = re.compile(r'^#send errors +(?P<send_errors>\d+).* +(?P<recv_errors>\d+)$')
+        p13 = regex_engine.compile(r'^#send errors +(?P<send_errors>\d+).* +(?P<recv_errors>\d+)$')
 
         # #pkts no sa (send) 0, #pkts invalid sa (rcv) 0 
-        p14 = re.compile(r'^#pkts no sa.* +(?P<pkts_no_sa_send>\d+).* +(?P<pkts_invalid_sa_rcv>\d+)$')
+        p14 = regex_engine.compile(r'^#pkts no sa.* +(?P<pkts_no_sa_send>\d+).* +(?P<pkts_invalid_sa_rcv>\d+)$')
 
         # #pkts invalid prot (recv) 0, #pkts verify failed: 0
-        p15 = re.compile(r'^#pkts invalid prot.* +(?P<pkts_invalid_prot_recv>\d+).* +(?P<pkts_verify_failed>\d+)$')
+        p15 = regex_engine.compile(r'^#pkts invalid prot.* +(?P<pkts_invalid_prot_recv>\d+).* +(?P<pkts_verify_failed>\d+)$')
 
         # #pkts invalid identity (recv) 0, #pkts invalid len (rcv) 0 
-        p16 = re.compile(r'^#pkts invalid identity.* +(?P<pkts_invalid_identity_recv>\d+).* +(?P<pkts_verify_failed>\d+)$')
+        p16 = regex_engine.compile(r'^#pkts invalid identity.* +(?P<pkts_invalid_identity_recv>\d+).* +(?P<pkts_verify_failed>\d+)$')
 
         # #pkts replay rollover (send): 0, #pkts replay rollover (rcv) 0 
-        p17 = re.compile(r'^#pkts replay rollover.* +(?P<pkts_replay_rollover_send>\d+).* +(?P<pkts_replay_rollover_rcv>\d+)$')
+        p17 = regex_engine.compile(r'^#pkts replay rollover.* +(?P<pkts_replay_rollover_send>\d+).* +(?P<pkts_replay_rollover_rcv>\d+)$')
 
         # ##pkts replay failed (rcv): 0 
-        p18 = re.compile(r'^##pkts replay failed.* +(?P<pkts_replay_failed_rcv>\d+)$')
+        p18 = regex_engine.compile(r'^##pkts replay failed.* +(?P<pkts_replay_failed_rcv>\d+)$')
 
         # #pkts tagged (send): 0, #pkts untagged (rcv): 0 
-        p19 = re.compile(r'^#pkts tagged.* +(?P<pkts_tagged_send>\d+).*: +(?P<pkts_untagged_rcv>\d+)$')
+        p19 = regex_engine.compile(r'^#pkts tagged.* +(?P<pkts_tagged_send>\d+).*: +(?P<pkts_untagged_rcv>\d+)$')
 
         # #pkts not tagged (send): 0, #pkts not untagged (rcv): 0 
-        p20 = re.compile(r'^#pkts not tagged.* +(?P<pkts_not_tagged_send>\d+).*: +(?P<pkts_not_untagged_rcv>\d+)$')
+        p20 = regex_engine.compile(r'^#pkts not tagged.* +(?P<pkts_not_tagged_send>\d+).*: +(?P<pkts_not_untagged_rcv>\d+)$')
 
         # #pkts internal err (send): 0, #pkts internal err (recv) 0 
-        p21 = re.compile(r'^#pkts internal err.* +(?P<pkts_internal_err_send>\d+).* +(?P<pkts_internal_err_recv>\d+)$')
+        p21 = regex_engine.compile(r'^#pkts internal err.* +(?P<pkts_internal_err_send>\d+).* +(?P<pkts_internal_err_recv>\d+)$')
 
         # local crypto endpt.: 1.1.1.2, remote crypto endpt.: 1.1.1.1 
-        p22 = re.compile(r'^local crypto endpt.: +(?P<local_crypto_endpt>[\d\.]+).* +(?P<remote_crypto_endpt>[\d\.]+)$')
+        p22 = regex_engine.compile(r'^local crypto endpt.: +(?P<local_crypto_endpt>[\d\.]+).* +(?P<remote_crypto_endpt>[\d\.]+)$')
 
         # plaintext mtu 1438, path mtu 1500, ip mtu 1500, ip mtu idb GigabitEthernet3 
-        p23 = re.compile(r'^plaintext mtu +(?P<plaintext_mtu>\d+),.* +(?P<path_mtu>\d+), ip mtu +(?P<ip_mtu>\d+),.*idb +(?P<ip_mtu_idb>\S+)$')
+        p23 = regex_engine.compile(r'^plaintext mtu +(?P<plaintext_mtu>\d+),.* +(?P<path_mtu>\d+), ip mtu +(?P<ip_mtu>\d+),.*idb +(?P<ip_mtu_idb>\S+)$')
 
         # current outbound spi: 0x397C36EE(964441838) 
-        p24 = re.compile(r'^current outbound spi: +(?P<current_outbound_spi>\S+)$')
+        p24 = regex_engine.compile(r'^current outbound spi: +(?P<current_outbound_spi>\S+)$')
 
         # PFS (Y/N): N, DH group: none 
-        p25 = re.compile(r'^PFS.*: +(?P<pfs>[Y|N]+).*: +(?P<dh_group>\w+)$')
+        p25 = regex_engine.compile(r'^PFS.*: +(?P<pfs>[Y|N]+).*: +(?P<dh_group>\w+)$')
 
         # inbound esp sas: 
-        p26 = re.compile(r'^inbound esp sas:$')
+        p26 = regex_engine.compile(r'^inbound esp sas:$')
 
         # spi: 0x658F7C11(1703902225) 
-        p27 = re.compile(r'^spi: +(?P<spi>[\S]+)$')
+        p27 = regex_engine.compile(r'^spi: +(?P<spi>[\S]+)$')
 
         # transform: esp-256-aes esp-sha256-hmac , 
-        p28 = re.compile(r'^transform: +(?P<transform>[\S\s]+).*,$')
+        p28 = regex_engine.compile(r'^transform: +(?P<transform>[\S\s]+).*,$')
 
         # in use settings ={Tunnel, }
-        p29 = re.compile(r'^in use settings =+\{(?P<in_use_settings>[\w\,\s]+)\}$')
+        p29 = regex_engine.compile(r'^in use settings =+\{(?P<in_use_settings>[\w\,\s]+)\}$')
 
         # conn id: 2076, flow_id: CSR:76, sibling_flags FFFFFFFF80000048, crypto map: vpn-crypto-map
-        p30 = re.compile(r'^conn id: +(?P<conn_id>\d+), +flow_id: +(?P<flow_id>\w+):(?P<flow_id_val>\d+), +sibling_flags +(?P<sibling_flags>[\w\d]+), +crypto map: +(?P<crypto_map>[\w\-\d]+)$')
+        p30 = regex_engine.compile(r'^conn id: +(?P<conn_id>\d+), +flow_id: +(?P<flow_id>\w+):(?P<flow_id_val>\d+), +sibling_flags +(?P<sibling_flags>[\w\d]+), +crypto map: +(?P<crypto_map>[\w\-\d]+)$')
 
         # sa timing: remaining key lifetime (k/sec): (4607999/83191) 
-        p31 = re.compile(r'^sa timing.* +(?P<remaining_key_lifetime>[\S\s]+)$')
+        p31 = regex_engine.compile(r'^sa timing.* +(?P<remaining_key_lifetime>[\S\s]+)$')
 
         # Kilobyte Volume Rekey has been disabled
-        p32 = re.compile(r'^Kilobyte Volume Rekey has been +(?P<kilobyte_volume_rekey>[disabled|enabled]+)$')
+        p32 = regex_engine.compile(r'^Kilobyte Volume Rekey has been +(?P<kilobyte_volume_rekey>[disabled|enabled]+)$')
 
         # IV size: 16 bytes
-        p33 = re.compile(r'^IV size: +(?P<iv_size>[\w\s]+)$')
+        p33 = regex_engine.compile(r'^IV size: +(?P<iv_size>[\w\s]+)$')
 
         # replay detection support: Y
-        p34 = re.compile(r'^replay detection support: +(?P<replay_detection_support>\w+)$')
+        p34 = regex_engine.compile(r'^replay detection support: +(?P<replay_detection_support>\w+)$')
 
         # Status: ACTIVE(ACTIVE) 
-        p35 = re.compile(r'^Status: +(?P<status>\S+)$')
+        p35 = regex_engine.compile(r'^Status: +(?P<status>\S+)$')
 
         # inbound ah sas:
-        p36 = re.compile(r'^inbound ah sas:$')
+        p36 = regex_engine.compile(r'^inbound ah sas:$')
 
         # inbound pcp sas:
-        p37 = re.compile(r'^inbound pcp sas:$')
+        p37 = regex_engine.compile(r'^inbound pcp sas:$')
 
         # outbound esp sas: 
-        p38 = re.compile(r'^outbound esp sas:$')
+        p38 = regex_engine.compile(r'^outbound esp sas:$')
 
         # outbound ah sas:
-        p39 = re.compile(r'^outbound ah sas:$')
+        p39 = regex_engine.compile(r'^outbound ah sas:$')
 
         # outbound pcp sas:
-        p40 = re.compile(r'^outbound pcp sas:$')
+        p40 = regex_engine.compile(r'^outbound pcp sas:$')
 
         master_dict = {}
 
@@ -5175,34 +5240,34 @@ class ShowCryptoSockets(ShowCryptoSocketsSchema):
         crypto_sockets_dict = {}
 
         # Number of Crypto Socket connections 4
-        p1 = re.compile(r'^Number\s+of\s+Crypto\s+Socket\s+connections\s+(?P<socket_connections>(\d+))')
+        p1 = regex_engine.compile(r'^Number\s+of\s+Crypto\s+Socket\s+connections\s+(?P<socket_connections>(\d+))')
 
         # Tu1 Peers (local/remote): 85.45.1.1/10.0.0.2
-        p2 = re.compile(r'^(?P<tunnel_name>[\S\s]+)\s+Peers\s+\(local\/remote\):\s+(?P<local_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))\/(?P<remote_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))')
+        p2 = regex_engine.compile(r'^(?P<tunnel_name>[\S\s]+)\s+Peers\s+\(local\/remote\):\s+(?P<local_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))\/(?P<remote_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))')
 
         # Local Ident  (addr/mask/port/prot): (85.45.3.1/255.255.255.255/0/47)
-        p3 = re.compile(r'^Local\s+Ident\s+\(addr\/mask\/port\/prot\):\s+\((?P<local_ident_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))\/(?P<local_ident_mask>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))\/(?P<local_ident_port>(\d+))\/(?P<local_ident_protocol>(\d+))')
+        p3 = regex_engine.compile(r'^Local\s+Ident\s+\(addr\/mask\/port\/prot\):\s+\((?P<local_ident_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))\/(?P<local_ident_mask>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))\/(?P<local_ident_port>(\d+))\/(?P<local_ident_protocol>(\d+))')
 
         # Remote Ident (addr/mask/port/prot): (10.0.0.2/255.255.255.255/0/47)
-        p4 = re.compile(r'^Remote\s+Ident\s+\(addr\/mask\/port\/prot\):\s+\((?P<remote_ident_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))\/(?P<remote_ident_mask>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))\/(?P<remote_ident_port>(\d+))\/(?P<remote_ident_protocol>(\d+))')
+        p4 = regex_engine.compile(r'^Remote\s+Ident\s+\(addr\/mask\/port\/prot\):\s+\((?P<remote_ident_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))\/(?P<remote_ident_mask>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}))\/(?P<remote_ident_port>(\d+))\/(?P<remote_ident_protocol>(\d+))')
 
         # IPSec Profile: "IPSEC_PROFILE"
-        p5 = re.compile(r'^IPSec\s+Profile:\s+\"(?P<ipsec_profile>[\S\s]+)\"')
+        p5 = regex_engine.compile(r'^IPSec\s+Profile:\s+\"(?P<ipsec_profile>[\S\s]+)\"')
         
         # Socket State: Open
-        p6 = re.compile(r'^Socket\s+State:\s+(?P<socket_state>[\S\s]+)')
+        p6 = regex_engine.compile(r'^Socket\s+State:\s+(?P<socket_state>[\S\s]+)')
         
         # Client: "TUNNEL SEC" (Client State: Active)
-        p7 = re.compile(r'^Client:\s+\"(?P<client_name>[\S\s]+)\"\s+\(Client\s+State:\s+(?P<client_state>[\S\s]+)\)')
+        p7 = regex_engine.compile(r'^Client:\s+\"(?P<client_name>[\S\s]+)\"\s+\(Client\s+State:\s+(?P<client_state>[\S\s]+)\)')
 
         # TRUE  ident (addr/mask/prot/port): {LOCAL -> REMOTE}
-        p8 = re.compile(r'^TRUE\s+ident\s+\(addr\/mask\/prot\/port\):\s+', re.IGNORECASE)
+        p8 = regex_engine.compile(r'^TRUE\s+ident\s+\(addr\/mask\/prot\/port\):\s+', re.IGNORECASE)
         
         # Crypto Sockets in Listen state:
-        p9 = re.compile(r'^Crypto\s+Sockets\s+in\s+Listen\s+state:')
+        p9 = regex_engine.compile(r'^Crypto\s+Sockets\s+in\s+Listen\s+state:')
 
         # Client: "TUNNEL SEC" Profile: "IPSEC_PROFILE" Map-name: "Tunnel20-head-0"
-        p10 = re.compile(r'^Client:\s+\"(?P<name>[\S\s]+)\"\s+Profile:\s+\"(?P<client_state>[\S\s]+)\"\s+Map-name:\s+\"(?P<map_name>[\S\s]+)\"')
+        p10 = regex_engine.compile(r'^Client:\s+\"(?P<name>[\S\s]+)\"\s+Profile:\s+\"(?P<client_state>[\S\s]+)\"\s+Map-name:\s+\"(?P<map_name>[\S\s]+)\"')
  
         true_ident = False
         sockets_in_listen_state = False
@@ -5353,82 +5418,82 @@ class ShowCryptoMibIpsecFlowmibGlobal(ShowCryptoMibIpsecFlowmibGlobalSchema):
         flowmib_global_dict = {}
 
         # vrf CC-INTERNET
-        p1 = re.compile(r'^vrf\s+(?P<vrf_name>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^vrf\s+(?P<vrf_name>[\S\s]+)$')
 
         # Active Tunnels:                   2
-        p2 = re.compile(r'^Active\s+Tunnels:\s+(?P<active_tunnels>\d+)$')
+        p2 = regex_engine.compile(r'^Active\s+Tunnels:\s+(?P<active_tunnels>\d+)$')
 
         # Previous Tunnels:                 16
-        p3 = re.compile(r'^Previous\s+Tunnels:\s+(?P<previous_tunnels>\d+)$')
+        p3 = regex_engine.compile(r'^Previous\s+Tunnels:\s+(?P<previous_tunnels>\d+)$')
 
         # In octets:                        3551184
-        p4 = re.compile(r'^In\s+octets:\s+(?P<in_octets>\d+)$')
+        p4 = regex_engine.compile(r'^In\s+octets:\s+(?P<in_octets>\d+)$')
 
         # Out octets:                       1817806
-        p5 = re.compile(r'^Out\s+octets:\s+(?P<out_octets>\d+)$')
+        p5 = regex_engine.compile(r'^Out\s+octets:\s+(?P<out_octets>\d+)$')
 
         # In packets:                       29214 
-        p6 = re.compile(r'^In\s+packets:\s+(?P<in_packets>\d+)$')
+        p6 = regex_engine.compile(r'^In\s+packets:\s+(?P<in_packets>\d+)$')
 
         # Out packets:                      29208  
-        p7 = re.compile(r'^Out\s+packets:\s+(?P<out_packets>\d+)$')
+        p7 = regex_engine.compile(r'^Out\s+packets:\s+(?P<out_packets>\d+)$')
 
         # Uncompressed encrypted bytes:     1817806
-        p8 = re.compile(r'^Uncompressed\s+encrypted\s+bytes:\s+(?P<uncompressed_encrypted_bytes>\d+)$')
+        p8 = regex_engine.compile(r'^Uncompressed\s+encrypted\s+bytes:\s+(?P<uncompressed_encrypted_bytes>\d+)$')
 
         # In packets drops:                 0 
-        p9 = re.compile(r'^In\s+packets\s+drops:\s+(?P<in_packet_drops>\d+)$')
+        p9 = regex_engine.compile(r'^In\s+packets\s+drops:\s+(?P<in_packet_drops>\d+)$')
 
         # Out packets drops:                0 
-        p10 = re.compile(r'^Out\s+packets\s+drops:\s+(?P<out_packet_drops>\d+)$')
+        p10 = regex_engine.compile(r'^Out\s+packets\s+drops:\s+(?P<out_packet_drops>\d+)$')
                     
         # In replay drops:                  0  
-        p11 = re.compile(r'^In\s+replay\s+drops:\s+(?P<in_replay_drops>\d+)$')
+        p11 = regex_engine.compile(r'^In\s+replay\s+drops:\s+(?P<in_replay_drops>\d+)$')
                 
         # In authentications:               29214    
-        p12 = re.compile(r'^In\s+authentications:\s+(?P<in_authentications>\d+)$')
+        p12 = regex_engine.compile(r'^In\s+authentications:\s+(?P<in_authentications>\d+)$')
 
         # Out authentications:              29208        
-        p13 = re.compile(r'^Out\s+authentications:\s+(?P<out_authentications>\d+)$')
+        p13 = regex_engine.compile(r'^Out\s+authentications:\s+(?P<out_authentications>\d+)$')
 
         # In decrypts:                      29214        
-        p14 = re.compile(r'^In\s+decrypts:\s+(?P<in_decrypts>\d+)$')
+        p14 = regex_engine.compile(r'^In\s+decrypts:\s+(?P<in_decrypts>\d+)$')
 
         # Out encrypts:                     29208     
-        p15 = re.compile(r'^Out\s+encrypts:\s+(?P<out_encrypts>\d+)$')   
+        p15 = regex_engine.compile(r'^Out\s+encrypts:\s+(?P<out_encrypts>\d+)$')   
 
         # Compressed bytes:                 0
-        p16 = re.compile(r'^Compressed\s+bytes:\s+(?P<compressed_bytes>\d+)$')
+        p16 = regex_engine.compile(r'^Compressed\s+bytes:\s+(?P<compressed_bytes>\d+)$')
 
         # Uncompressed bytes:               0
-        p17 = re.compile(r'^Uncompressed\s+bytes:\s+(?P<uncompressed_bytes>\d+)$')
+        p17 = regex_engine.compile(r'^Uncompressed\s+bytes:\s+(?P<uncompressed_bytes>\d+)$')
 
         # In uncompressed bytes:            0
-        p18 = re.compile(r'^In\s+uncompressed\s+bytes:\s+(?P<in_uncompressed_bytes>\d+)$')
+        p18 = regex_engine.compile(r'^In\s+uncompressed\s+bytes:\s+(?P<in_uncompressed_bytes>\d+)$')
 
         # Out uncompressed bytes:           0
-        p19 = re.compile(r'^Out\s+uncompressed\s+bytes:\s+(?P<out_uncompressed_bytes>\d+)$')
+        p19 = regex_engine.compile(r'^Out\s+uncompressed\s+bytes:\s+(?P<out_uncompressed_bytes>\d+)$')
 
         # In decrypt failures:              0            
-        p20 = re.compile(r'^In\s+decrypt\s+failures:\s+(?P<in_decrypt_failures>\d+)$')
+        p20 = regex_engine.compile(r'^In\s+decrypt\s+failures:\s+(?P<in_decrypt_failures>\d+)$')
 
         # Out encrypt failures:             0            
-        p21 = re.compile(r'^Out\s+encrypt\s+failures:\s+(?P<out_encrypt_failures>\d+)$')
+        p21 = regex_engine.compile(r'^Out\s+encrypt\s+failures:\s+(?P<out_encrypt_failures>\d+)$')
 
         # No SA failures:                   0   
-        p22 = re.compile(r'^No\s+SA\s+failures:\s+(?P<no_sa_failures>\d+)$')
+        p22 = regex_engine.compile(r'^No\s+SA\s+failures:\s+(?P<no_sa_failures>\d+)$')
 
         # Protocol use failures:            0   
-        p23 = re.compile(r'^Protocol\s+use\s+failures:\s+(?P<protocol_use_failures>\d+)$')
+        p23 = regex_engine.compile(r'^Protocol\s+use\s+failures:\s+(?P<protocol_use_failures>\d+)$')
 
         # System capacity failures:         0   
-        p24 = re.compile(r'^System\s+capacity\s+failures:\s+(?P<system_capacity_failures>\d+)$')
+        p24 = regex_engine.compile(r'^System\s+capacity\s+failures:\s+(?P<system_capacity_failures>\d+)$')
 
         # In authentication failures:       0        
-        p25 = re.compile(r'^In\s+authentication\s+failures:\s+(?P<in_auth_failures>\d+)$')
+        p25 = regex_engine.compile(r'^In\s+authentication\s+failures:\s+(?P<in_auth_failures>\d+)$')
 
         # Out authentication failures:      0
-        p26 = re.compile(r'^Out\s+authentication\s+failures:\s+(?P<out_auth_failures>\d+)$')
+        p26 = regex_engine.compile(r'^Out\s+authentication\s+failures:\s+(?P<out_auth_failures>\d+)$')
  
         vrf_count = 0
         result_dict = {}
@@ -5650,43 +5715,43 @@ class ShowCryptoIpsecInternalDual(ShowCryptoIpsecInternalDualSchema):
         ipsec_dualstack_stats_dict = {}
 
         #  ==== IPSEC Dual Stack Statistics ====
-        p1 = re.compile(r'^====\s+IPSEC\s+Dual\s+Stack\s+Statistics\s+====')
+        p1 = regex_engine.compile(r'^====\s+IPSEC\s+Dual\s+Stack\s+Statistics\s+====')
 
         # SUCCESS Statistics
-        p2 = re.compile(r'^SUCCESS\s+Statistics')
+        p2 = regex_engine.compile(r'^SUCCESS\s+Statistics')
 
         #   Apply traffic filter success   : 134
-        p3 = re.compile(r'^Apply\s+traffic\s+filter\s+success\s+:\s+(?P<apply_traffic_filter>\d+)$')
+        p3 = regex_engine.compile(r'^Apply\s+traffic\s+filter\s+success\s+:\s+(?P<apply_traffic_filter>\d+)$')
 
         #   Remove traffic filter success  : 134
-        p4 = re.compile(r'^Remove\s+traffic\s+filter\s+success\s+:\s+(?P<remove_traffic_filter>\d+)$')
+        p4 = regex_engine.compile(r'^Remove\s+traffic\s+filter\s+success\s+:\s+(?P<remove_traffic_filter>\d+)$')
 
         # ERROR Statistics
-        p5 = re.compile(r'^ERROR\s+Statistics')
+        p5 = regex_engine.compile(r'^ERROR\s+Statistics')
 
         #   No IPv6 enabled                : 0
-        p6 = re.compile(r'^No\s+IPv6\s+enabled\s+:\s+(?P<no_ipv6_enabled>\d+)$')
+        p6 = regex_engine.compile(r'^No\s+IPv6\s+enabled\s+:\s+(?P<no_ipv6_enabled>\d+)$')
 
         #   Apply traffic filter failed    : 0
-        p7 = re.compile(r'^Apply\s+traffic\s+filter\s+failed\s+:\s+(?P<apply_traffic_filter>\d+)$')
+        p7 = regex_engine.compile(r'^Apply\s+traffic\s+filter\s+failed\s+:\s+(?P<apply_traffic_filter>\d+)$')
 
         #   IPv4 ace create failed         : 0
-        p8 = re.compile(r'^IPv4\s+ace\s+create\s+failed\s+:\s+(?P<ipv4_ace_create>\d+)$')
+        p8 = regex_engine.compile(r'^IPv4\s+ace\s+create\s+failed\s+:\s+(?P<ipv4_ace_create>\d+)$')
 
         #   IPv4 ACL insert failed         : 0
-        p9 = re.compile(r'^IPv4\s+ACL\s+insert\s+failed\s+:\s+(?P<ipv4_acl_insert>\d+)$')
+        p9 = regex_engine.compile(r'^IPv4\s+ACL\s+insert\s+failed\s+:\s+(?P<ipv4_acl_insert>\d+)$')
 
         #   IPv6 ace create failed         : 0
-        p10 = re.compile(r'^IPv6\s+ace\s+create\s+failed\s+:\s+(?P<ipv6_ace_create>\d+)$')
+        p10 = regex_engine.compile(r'^IPv6\s+ace\s+create\s+failed\s+:\s+(?P<ipv6_ace_create>\d+)$')
 
         #   IPv6 ACL insert failed         : 0
-        p11 = re.compile(r'^IPv6\s+ACL\s+insert\s+failed\s+:\s+(?P<ipv6_acl_insert>\d+)$')
+        p11 = regex_engine.compile(r'^IPv6\s+ACL\s+insert\s+failed\s+:\s+(?P<ipv6_acl_insert>\d+)$')
 
         #   Invalid parameters             : 0
-        p12 = re.compile(r'^Invalid\s+parameters\s+:\s+(?P<invalid_parameters>\d+)$')
+        p12 = regex_engine.compile(r'^Invalid\s+parameters\s+:\s+(?P<invalid_parameters>\d+)$')
 
         #   ACL retrieval failed           : 0
-        p13 = re.compile(r'^ACL\s+retrieval\s+failed\s+:\s+(?P<acl_retrieval>\d+)$')
+        p13 = regex_engine.compile(r'^ACL\s+retrieval\s+failed\s+:\s+(?P<acl_retrieval>\d+)$')
 
         ipsec_dualstack_stats = False
         result_dict = {}
@@ -5818,29 +5883,29 @@ class ShowCryptoIpsecProfile(ShowCryptoIpsecProfileSchema):
 
         # IPSEC profile nil_ips
         # IPSEC profile DCCRT1012-IPSEC-PROFILE
-        p1 = re.compile(r'^IPSEC profile\s*(?P<profile_name>[\w\-]+)$')
+        p1 = regex_engine.compile(r'^IPSEC profile\s*(?P<profile_name>[\w\-]+)$')
 
         # IKEv2 Profile: nil_ike_prof
-        p2 = re.compile(r'^IKEv2 Profile\s*:\s*(?P<ikev2_profile_name>\w+)$')
+        p2 = regex_engine.compile(r'^IKEv2 Profile\s*:\s*(?P<ikev2_profile_name>\w+)$')
 
         # Security association lifetime: 4608000 kilobytes/3600 seconds
-        p3 = re.compile(r'^Security association lifetime\s*:\s*(?P<security_association_lifetime>[\d a-z\/]+)$')
+        p3 = regex_engine.compile(r'^Security association lifetime\s*:\s*(?P<security_association_lifetime>[\d a-z\/]+)$')
 
         # Responder-Only (Y/N): N
-        p4 = re.compile(r'^Responder-Only \(Y/N\)\s*:\s*(?P<responder_only>(Y|N))$')
+        p4 = regex_engine.compile(r'^Responder-Only \(Y/N\)\s*:\s*(?P<responder_only>(Y|N))$')
 
         # PFS (Y/N): N
-        p5 = re.compile(r'^PFS \(Y/N\):\s*(?P<psf>(Y|N))$')
+        p5 = regex_engine.compile(r'^PFS \(Y/N\):\s*(?P<psf>(Y|N))$')
 
         # Mixed-mode : Disabled
-        p6 = re.compile(r'^Mixed-mode\s*:\s*(?P<mixed_mode>\w+)$')
+        p6 = regex_engine.compile(r'^Mixed-mode\s*:\s*(?P<mixed_mode>\w+)$')
 
         # Transform sets={
-        p7 = re.compile(r'^Transform sets={$')
+        p7 = regex_engine.compile(r'^Transform sets={$')
 
         # nil_tfs:  { esp-aes esp-sha-hmac  } ,
         # RSITE-ipsec-proposal-set:  { esp-gcm 256  } ,
-        p8 = re.compile(r'^(?P<transforset>[\w\-]+)\s*:\s*{\s*(?P<transform_set_name>[\w-]+)\s+(?P<transform_set_method>[\w-]+)\s*}\s*,$')
+        p8 = regex_engine.compile(r'^(?P<transforset>[\w\-]+)\s*:\s*{\s*(?P<transform_set_name>[\w-]+)\s+(?P<transform_set_method>[\w-]+)\s*}\s*,$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -5939,19 +6004,19 @@ class ShowCryptoIkev2Proposal(ShowCryptoIkev2ProposalSchema):
         ret_dict = {}
 
         # IKEv2 proposal: default
-        p1 = re.compile(r'^IKEv2 proposal\s*:\s*(?P<proposal_name>.*)$')
+        p1 = regex_engine.compile(r'^IKEv2 proposal\s*:\s*(?P<proposal_name>.*)$')
 
         # Encryption : AES-CBC-256
-        p2 = re.compile(r'^Encryption\s*:\s*(?P<encryption>[\w-]+)$')
+        p2 = regex_engine.compile(r'^Encryption\s*:\s*(?P<encryption>[\w-]+)$')
 
         # Integrity  : SHA512 SHA384
-        p3 = re.compile(r'^Integrity\s*:\s*(?P<integrity>.*)$')
+        p3 = regex_engine.compile(r'^Integrity\s*:\s*(?P<integrity>.*)$')
 
         # PRF        : SHA512 SHA384
-        p4 = re.compile(r'^PRF\s*:\s*(?P<prf>.*)$')
+        p4 = regex_engine.compile(r'^PRF\s*:\s*(?P<prf>.*)$')
 
         # DH Group   : DH_GROUP_256_ECP/Group 19 DH_GROUP_2048_MODP/Group 14 DH_GROUP_521_ECP/Group 21 DH_GROUP_1536_MODP/Group 5
-        p5 = re.compile(r'^DH Group\s*:\s*(?P<dh_group>.*)$')
+        p5 = regex_engine.compile(r'^DH Group\s*:\s*(?P<dh_group>.*)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -6042,16 +6107,16 @@ class ShowCryptoIkev2Policy(ShowCryptoIkev2PolicySchema):
         ret_dict = {}
 
         # IKEv2 policy : ikev2policy
-        p1 = re.compile(r'^IKEv2 policy\s*:\s*(?P<policy_name>.*)$')
+        p1 = regex_engine.compile(r'^IKEv2 policy\s*:\s*(?P<policy_name>.*)$')
 
         # Match fvrf : global
-        p2 = re.compile(r'^Match fvrf\s*:\s*(?P<match_fvrf>\w+)$')
+        p2 = regex_engine.compile(r'^Match fvrf\s*:\s*(?P<match_fvrf>\w+)$')
 
         # Match address local : any
-        p3 = re.compile(r'^Match address local\s*:\s*(?P<match_address_local>\w+)$')
+        p3 = regex_engine.compile(r'^Match address local\s*:\s*(?P<match_address_local>\w+)$')
 
         # Proposal    : ikev2proposal
-        p4 = re.compile(r'^Proposal\s*:\s*(?P<proposal>.*)$')
+        p4 = regex_engine.compile(r'^Proposal\s*:\s*(?P<proposal>.*)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -6141,25 +6206,25 @@ class ShowCryptoIkev2Sa(ShowCryptoIkev2SaSchema):
         ret_dict = {}
 
         # IPv4 Crypto IKEv2  SA  
-        p1 = re.compile(r'^IPv4 Crypto IKEv2 SA$')
+        p1 = regex_engine.compile(r'^IPv4 Crypto IKEv2 SA$')
 
         # IPv6 Crypto IKEv2  SA 
-        p2 = re.compile(r'^IPv6 Crypto IKEv2 SA$')
+        p2 = regex_engine.compile(r'^IPv6 Crypto IKEv2 SA$')
 
         # 1         66.66.66.1/500        66.66.66.2/500        none/none            READY
-        p3 = re.compile(r'^(?P<tunnel_id>\d+)\s+(?P<local_ip>[\w.]+)/(?P<local_port>\d+)\s+(?P<remote_ip>[\w.]+)/(?P<remote_port>\d+)\s+(?P<fvrf>\w+)/(?P<ivrf>\w+)\s+(?P<status>[\w]+)$')
+        p3 = regex_engine.compile(r'^(?P<tunnel_id>\d+)\s+(?P<local_ip>[\w.]+)/(?P<local_port>\d+)\s+(?P<remote_ip>[\w.]+)/(?P<remote_port>\d+)\s+(?P<fvrf>\w+)/(?P<ivrf>\w+)\s+(?P<status>[\w]+)$')
 
         # Encr: AES-CBC, keysize: 128, PRF: SHA1, Hash: SHA96, DH Grp:16, Auth sign: PSK, Auth verify: PSK
-        p4 = re.compile(r'^Encr:\s*(?P<encryption>[\w-]+),\s*keysize:\s*(?P<keysize>\d+),\s*PRF:\s*(?P<prf>\w+),\s*Hash:\s*(?P<hash>\w+),\s*DH Grp:(?P<dh_group>\d+),\s*Auth sign:\s*(?P<auth_sign>\w+),\s*Auth verify:\s*(?P<auth_verify>\w+)')
+        p4 = regex_engine.compile(r'^Encr:\s*(?P<encryption>[\w-]+),\s*keysize:\s*(?P<keysize>\d+),\s*PRF:\s*(?P<prf>\w+),\s*Hash:\s*(?P<hash>\w+),\s*DH Grp:(?P<dh_group>\d+),\s*Auth sign:\s*(?P<auth_sign>\w+),\s*Auth verify:\s*(?P<auth_verify>\w+)')
 
         # Life/Active Time: 86400/735 sec
-        p5 = re.compile(r'^Life/Active Time:\s*(?P<life_time>\d+)/(?P<active_time>\d+)\s*sec$')
+        p5 = regex_engine.compile(r'^Life/Active Time:\s*(?P<life_time>\d+)/(?P<active_time>\d+)\s*sec$')
 
         # CE id: 0, Session-id: 5206
-        p6 = re.compile(r'^CE id:\s*(?P<ce_id>\d+),\s*Session-id:\s*(?P<session_id>\d+)$')
+        p6 = regex_engine.compile(r'^CE id:\s*(?P<ce_id>\d+),\s*Session-id:\s*(?P<session_id>\d+)$')
 
         # Local spi: 1F7B76961C3A77ED Remote spi: 1298FDE074BD724C
-        p7 = re.compile(r'^Local spi:\s*(?P<local_spi>[A-F\d]+)\s*Remote spi:\s*(?P<remote_spi>[A-F\d]+)$')
+        p7 = regex_engine.compile(r'^Local spi:\s*(?P<local_spi>[A-F\d]+)\s*Remote spi:\s*(?P<remote_spi>[A-F\d]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6308,20 +6373,20 @@ class ShowCryptoIkev2StatsExchange(ShowCryptoIkev2StatsExchangeSchema):
         ret_dict = {}
 
         # EXCHANGES
-        p1 = re.compile(r'^EXCHANGES$')
-        p1_a = re.compile(r'^ERROR NOTIFY$')
-        p1_b = re.compile(r'^OTHER NOTIFY$')
-        p1_c = re.compile(r'^CONFIG PAYLOAD TYPE\s+TX\s+RX$')
-        p1_d = re.compile(r'^OTHER COUNTERS$')
+        p1 = regex_engine.compile(r'^EXCHANGES$')
+        p1_a = regex_engine.compile(r'^ERROR NOTIFY$')
+        p1_b = regex_engine.compile(r'^OTHER NOTIFY$')
+        p1_c = regex_engine.compile(r'^CONFIG PAYLOAD TYPE\s+TX\s+RX$')
+        p1_d = regex_engine.compile(r'^OTHER COUNTERS$')
 
         # IKE_SA_INIT 8618 0 0 5206
-        p2 = re.compile(r'^(?P<message>\w+)\s+(?P<tx_req>\d+)\s+(?P<tx_res>\d+)\s+(?P<rx_req>\d+)\s+(?P<rx_res>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<message>\w+)\s+(?P<tx_req>\d+)\s+(?P<tx_res>\d+)\s+(?P<rx_req>\d+)\s+(?P<rx_res>\d+)$')
 
         # CFG_REQUEST 5206 0
-        p3 = re.compile(r'^(?P<message>\w+)\s+(?P<tx>\d+)\s+(?P<rx>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<message>\w+)\s+(?P<tx>\d+)\s+(?P<rx>\d+)$')
 
         # NAT_INSIDE 3
-        p4 = re.compile(r'^(?P<message>\w+)\s+(?P<count>\d+)$')
+        p4 = regex_engine.compile(r'^(?P<message>\w+)\s+(?P<count>\d+)$')
 
         ret_dict = {}
 
@@ -6497,69 +6562,69 @@ class ShowCryptoEliAll(ShowCryptoEliAllSchema):
             output = self.device.execute(self.cli_command[0])
 
         # Hardware Encryption : ACTIVE
-        p1 = re.compile(r"^Hardware Encryption.* +(?P<hardware_encryption>\w+)$")
+        p1 = regex_engine.compile(r"^Hardware Encryption.* +(?P<hardware_encryption>\w+)$")
 
         # Number of crypto engines = 3
-        p2 = re.compile(r"^Number of crypto engines = +(?P<crypto_engines_num>\d+)$")
+        p2 = regex_engine.compile(r"^Number of crypto engines = +(?P<crypto_engines_num>\d+)$")
 
         # CryptoEngine IOSXE-ESP(14) details: state = Active
         # CryptoEngine act2 details: state = Active
         # CryptoEngine Software Crypto Engine details: state = Active
-        p3 = re.compile(r"^CryptoEngine +(?P<crypto_engine>[\w\S\s]+) details:.*= +(?P<state>\w+)$")
+        p3 = regex_engine.compile(r"^CryptoEngine +(?P<crypto_engine>[\w\S\s]+) details:.*= +(?P<state>\w+)$")
 
         # Capability    : DES, 3DES, AES, GCM, GMAC, RSA, IPv6, GDOI, FAILCLOSE, ESN
-        p4 = re.compile(r"^Capability.*: +(?P<capability>[\w\S\s]+)$")
+        p4 = regex_engine.compile(r"^Capability.*: +(?P<capability>[\w\S\s]+)$")
 
         # IPSec-Session :  6004 active, 40958 max, 0 failed, 414018 created
-        p5 = re.compile(r"^IPSec-Session.*: +(?P<active>\d+) +active, +(?P<max>\d+) +max, +(?P<failed>\d+) +failed, +(?P<created>\d+) +created$")
+        p5 = regex_engine.compile(r"^IPSec-Session.*: +(?P<active>\d+) +active, +(?P<max>\d+) +max, +(?P<failed>\d+) +failed, +(?P<created>\d+) +created$")
 
         # SSL support   : Yes
-        p6 = re.compile(r"^SSL support.*: (?P<ssl_support>[Yes|No]+)$")
+        p6 = regex_engine.compile(r"^SSL support.*: (?P<ssl_support>[Yes|No]+)$")
 
         # SSL versions  : TLSv1.0
-        p7 = re.compile(r"^SSL versions.*: (?P<ssl_versions>[\w\S]+)$")
+        p7 = regex_engine.compile(r"^SSL versions.*: (?P<ssl_versions>[\w\S]+)$")
 
         # Max SSL connec: 10000
-        p8 = re.compile(r"^Max SSL connec.*: (?P<max_ssl_connec>\d+)$")
+        p8 = regex_engine.compile(r"^Max SSL connec.*: (?P<max_ssl_connec>\d+)$")
 
         # SSLv3.0 suites:
-        p9 = re.compile(r"^SSLv3.*$")
+        p9 = regex_engine.compile(r"^SSLv3.*$")
 
         # TLSv1.0 suites:
-        p10 = re.compile(r"^TLSv1.*$")
+        p10 = regex_engine.compile(r"^TLSv1.*$")
 
         # DTLSv1.0 suite:
-        p11 = re.compile(r"^DTLSv1.*$")
+        p11 = regex_engine.compile(r"^DTLSv1.*$")
 
         # TLS_RSA_WITH_3DES_EDE_CBC_SHA
-        p12 = re.compile(r"^(?P<suites>\w+)$")
+        p12 = regex_engine.compile(r"^(?P<suites>\w+)$")
 
         # IKE-Session   :     0 active, 41058 max, 0 failed, 319288 created
-        p13 = re.compile(r"^IKE-Session.*: +(?P<active>\d+) +active, +(?P<max>\d+) +max, +(?P<failed>\d+) +failed, +(?P<created>\d+) +created$")
+        p13 = regex_engine.compile(r"^IKE-Session.*: +(?P<active>\d+) +active, +(?P<max>\d+) +max, +(?P<failed>\d+) +failed, +(?P<created>\d+) +created$")
 
         # IKEv2-Session :  3002 active, 41058 max, 0 failed, 319288 created
-        p14 = re.compile(r"^IKEv2-Session.*: +(?P<active>\d+) +active, +(?P<max>\d+) +max, +(?P<failed>\d+) +failed, +(?P<created>\d+) +created$")
+        p14 = regex_engine.compile(r"^IKEv2-Session.*: +(?P<active>\d+) +active, +(?P<max>\d+) +max, +(?P<failed>\d+) +failed, +(?P<created>\d+) +created$")
 
         # DH            :     0 active(0/0), 41008 max, 0 failed, 320010 created
-        p15 = re.compile(r"^DH.*: +(?P<active>\d+) +active\S+, +(?P<max>\d+) +max, +(?P<failed>\d+) +failed, +(?P<created>\d+) +created$")
+        p15 = regex_engine.compile(r"^DH.*: +(?P<active>\d+) +active\S+, +(?P<max>\d+) +max, +(?P<failed>\d+) +failed, +(?P<created>\d+) +created$")
 
         # SSL namespace : 1
-        p16 = re.compile(r"^SSL namespace.*: +(?P<ssl_namespace>\d+)$")
+        p16 = regex_engine.compile(r"^SSL namespace.*: +(?P<ssl_namespace>\d+)$")
 
         # Number of DH's pregenerated = 4
-        p17 = re.compile(r"^Number of DH's pregenerated = +(?P<number_dh_pregenerated>[0-9]+)$")
+        p17 = regex_engine.compile(r"^Number of DH's pregenerated = +(?P<number_dh_pregenerated>[0-9]+)$")
 
         # DH lifetime = 86400 seconds
-        p18 = re.compile(r"^DH lifetime.*= +(?P<dh_lifetime_seconds>\d+) +seconds$")
+        p18 = regex_engine.compile(r"^DH lifetime.*= +(?P<dh_lifetime_seconds>\d+) +seconds$")
 
         # DH calculations: P1 722, SS 319288
-        p19 = re.compile(r"^DH calculations.*: +P1 +(?P<p1>\d+), +SS +(?P<ss>\d+)$")
+        p19 = regex_engine.compile(r"^DH calculations.*: +P1 +(?P<p1>\d+), +SS +(?P<ss>\d+)$")
 
         # crypto engine 1:Software Crypto Engine
-        p20 = re.compile(r"^crypto engine +(?P<crypto_engine_num>\d+):+(?P<crypto_engine>[\w\s]+)$")
+        p20 = regex_engine.compile(r"^crypto engine +(?P<crypto_engine_num>\d+):+(?P<crypto_engine>[\w\s]+)$")
 
         # DH in use/freeing/free - 0/0/41008
-        p21 = re.compile(r"^DH in use\/freeing\/free - +(?P<dh_in_use>\d+)\/(?P<dh_in_freeing>\d+)\/(?P<dh_in_free>\d+)$")
+        p21 = regex_engine.compile(r"^DH in use\/freeing\/free - +(?P<dh_in_use>\d+)\/(?P<dh_in_freeing>\d+)\/(?P<dh_in_free>\d+)$")
 
         master_dict = {}
         for line in output.splitlines():
@@ -6797,97 +6862,97 @@ class ShowCryptoMibIkeFlowmibTunnel(ShowCryptoMibIkeFlowmibTunnelSchema):
         flowmib_tunnel_dict = {}
 
         # vrf Global
-        p1 = re.compile(r'^vrf\s+(?P<vrf_name>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^vrf\s+(?P<vrf_name>[\S\s]+)$')
         
         # Index:                       32248
-        p2 = re.compile(r'^Index:\s+(?P<index>\d+)$')
+        p2 = regex_engine.compile(r'^Index:\s+(?P<index>\d+)$')
 
         # Local type:                  ID_IPV4_ADDR 
-        p3 = re.compile(r'^Local\s+type:\s+(?P<local_type>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Local\s+type:\s+(?P<local_type>[\S\s]+)$')
 
         # Local address:               50.50.50.2
-        p4 = re.compile(r'^Local\s+address:\s+(?P<local_address>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^Local\s+address:\s+(?P<local_address>[\S\s]+)$')
 
         # Remote type:                 ID_IPV4_ADDR
-        p5 = re.compile(r'^Remote\s+type:\s+(?P<remote_type>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^Remote\s+type:\s+(?P<remote_type>[\S\s]+)$')
 
         # Remote address:              100.0.10.2
-        p6 = re.compile(r'^Remote\s+address:\s+(?P<remote_address>[\S\s]+)$')
+        p6 = regex_engine.compile(r'^Remote\s+address:\s+(?P<remote_address>[\S\s]+)$')
 
         # Negotiation mode:            IKEv2 
-        p7 = re.compile(r'^Negotiation\s+mode:\s+(?P<negotiation_mode>[\S\s]+)$')
+        p7 = regex_engine.compile(r'^Negotiation\s+mode:\s+(?P<negotiation_mode>[\S\s]+)$')
 
         # Diffie Hellman Grp:          16 
-        p8 = re.compile(r'^Diffie\s+Hellman\s+Grp:\s+(?P<diffie_hellman_grp>\d+)$')
+        p8 = regex_engine.compile(r'^Diffie\s+Hellman\s+Grp:\s+(?P<diffie_hellman_grp>\d+)$')
  
         # Encryption algo:             aes  
-        p9 = re.compile(r'^Encryption\s+algo:\s+(?P<encryption_algorithm>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^Encryption\s+algo:\s+(?P<encryption_algorithm>[\S\s]+)$')
 
         # Hash algo:                   sha512
-        p10 = re.compile(r'^Hash\s+algo:\s+(?P<hash_algorithm>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^Hash\s+algo:\s+(?P<hash_algorithm>[\S\s]+)$')
 
         # Auth method:                 localPskRemotePsk
-        p11 = re.compile(r'^Auth\s+method:\s+(?P<auth_method>[\S\s]+)$')
+        p11 = regex_engine.compile(r'^Auth\s+method:\s+(?P<auth_method>[\S\s]+)$')
 
         # Lifetime:                    86400
-        p12 = re.compile(r'^Lifetime:\s+(?P<lifetime>\d+)$')
+        p12 = regex_engine.compile(r'^Lifetime:\s+(?P<lifetime>\d+)$')
 
         # Active time:                 00:02:12
-        p13 = re.compile(r'^Active\s+time:\s+(?P<active_time>[\S\s]+)$')
+        p13 = regex_engine.compile(r'^Active\s+time:\s+(?P<active_time>[\S\s]+)$')
 
         # Policy priority:             0 
-        p14 = re.compile(r'^Policy\s+priority:\s+(?P<policy_priority>\d+)$')
+        p14 = regex_engine.compile(r'^Policy\s+priority:\s+(?P<policy_priority>\d+)$')
 
         # Keepalive enabled:           No   
-        p15 = re.compile(r'^Keepalive\s+enabled:\s+(?P<keepalive_enabled>[\S\s]+)$')
+        p15 = regex_engine.compile(r'^Keepalive\s+enabled:\s+(?P<keepalive_enabled>[\S\s]+)$')
 
         # In octets:                   5440    
-        p16 = re.compile(r'^In\s+octets:\s+(?P<in_octets>\d+)$')
+        p16 = regex_engine.compile(r'^In\s+octets:\s+(?P<in_octets>\d+)$')
 
         # In packets:                  34
-        p17 = re.compile(r'^In\s+packets:\s+(?P<in_packets>\d+)$')
+        p17 = regex_engine.compile(r'^In\s+packets:\s+(?P<in_packets>\d+)$')
 
         # In drops:                    0 
-        p18 = re.compile(r'^In\s+drops:\s+(?P<in_drops>\d+)$')
+        p18 = regex_engine.compile(r'^In\s+drops:\s+(?P<in_drops>\d+)$')
 
         # In notifys:                  17 
-        p19 = re.compile(r'^In\s+notifys:\s+(?P<in_notifys>\d+)$')
+        p19 = regex_engine.compile(r'^In\s+notifys:\s+(?P<in_notifys>\d+)$')
 
         # In P2 exchanges:             34 
-        p20 = re.compile(r'^In\s+P2\s+exchanges:\s+(?P<in_P2_exchanges>\d+)$')
+        p20 = regex_engine.compile(r'^In\s+P2\s+exchanges:\s+(?P<in_P2_exchanges>\d+)$')
 
         # In P2 exchg invalids:        0
-        p21 = re.compile(r'^In\s+P2\s+exchg\s+invalids:\s+(?P<in_P2_exchg_invalids>\d+)$')
+        p21 = regex_engine.compile(r'^In\s+P2\s+exchg\s+invalids:\s+(?P<in_P2_exchg_invalids>\d+)$')
 
         # In P2 exchg rejected:        0
-        p22 = re.compile(r'^In\s+P2\s+exchg\s+rejected:\s+(?P<in_P2_exchg_rejected>\d+)$')
+        p22 = regex_engine.compile(r'^In\s+P2\s+exchg\s+rejected:\s+(?P<in_P2_exchg_rejected>\d+)$')
 
         # In P2 SA delete reqs:        0 
-        p23 = re.compile(r'^In\s+P2\s+SA\s+delete\s+reqs:\s+(?P<in_P2_SA_delete_reqs>\d+)$')
+        p23 = regex_engine.compile(r'^In\s+P2\s+SA\s+delete\s+reqs:\s+(?P<in_P2_SA_delete_reqs>\d+)$')
 
         # Out octets:                  5712 
-        p24 = re.compile(r'^Out\s+octets:\s+(?P<out_octets>\d+)$')
+        p24 = regex_engine.compile(r'^Out\s+octets:\s+(?P<out_octets>\d+)$')
 
         # Out packets:                 34  
-        p25 = re.compile(r'^Out\s+packets:\s+(?P<out_packets>\d+)$')
+        p25 = regex_engine.compile(r'^Out\s+packets:\s+(?P<out_packets>\d+)$')
 
         # Out drops:                   0 
-        p26 = re.compile(r'^Out\s+drops:\s+(?P<out_drops>\d+)$')
+        p26 = regex_engine.compile(r'^Out\s+drops:\s+(?P<out_drops>\d+)$')
 
         # Out notifys:                 34  
-        p27 = re.compile(r'^Out\s+notifys:\s+(?P<out_notifys>\d+)$')
+        p27 = regex_engine.compile(r'^Out\s+notifys:\s+(?P<out_notifys>\d+)$')
  
         # Out P2 exchgs:               34 
-        p28 = re.compile(r'^Out\s+P2\s+exchgs:\s+(?P<out_P2_exchgs>\d+)$')
+        p28 = regex_engine.compile(r'^Out\s+P2\s+exchgs:\s+(?P<out_P2_exchgs>\d+)$')
  
         # Out P2 exchg invalids:       0
-        p29 = re.compile(r'^Out\s+P2\s+exchg\s+invalids:\s+(?P<out_P2_exchgs_invalids>\d+)$')
+        p29 = regex_engine.compile(r'^Out\s+P2\s+exchg\s+invalids:\s+(?P<out_P2_exchgs_invalids>\d+)$')
  
         # Out P2 exchg rejects:        0
-        p30 = re.compile(r'^Out\s+P2\s+exchg\s+rejects:\s+(?P<out_P2_exchgs_rejects>\d+)$')
+        p30 = regex_engine.compile(r'^Out\s+P2\s+exchg\s+rejects:\s+(?P<out_P2_exchgs_rejects>\d+)$')
  
         # Out P2 Sa delete requests:   17 
-        p31 = re.compile(r'^Out\s+P2\s+Sa\s+delete\s+requests:\s+(?P<out_P2_Sa_delete_requests>\d+)$')
+        p31 = regex_engine.compile(r'^Out\s+P2\s+Sa\s+delete\s+requests:\s+(?P<out_P2_Sa_delete_requests>\d+)$')
 
 
         vrf_count = 0
@@ -7163,52 +7228,52 @@ class ShowCryptoIkev2Stats(ShowCryptoIkev2StatsSchema):
             output = self.device.execute(self.cli_command)
 
         # System Resource Limit:   0        Max IKEv2 SAs: 0        Max in nego(in/out): 40/400
-        p1 = re.compile(r'^System Resource Limit:\s+(?P<sr_limit>\d+)\s+Max IKEv2 SAs:\s+'
-                        r'(?P<v2_sa>\d+)\s+Max in nego\(in\/out\):\s+'
-                        r'(?P<in_nego>\d+)\/(?P<out_nego>\d+)$')
+        p1 = regex_engine.compile(r'^System Resource Limit:\s+(?P<sr_limit>\d+)\s+Max IKEv2 SAs:\s+'
+                                  r'(?P<v2_sa>\d+)\s+Max in nego\(in\/out\):\s+'
+                                  r'(?P<in_nego>\d+)\/(?P<out_nego>\d+)$')
     
         # Total incoming IKEv2 SA Count:    0        active:        0        negotiating: 0
-        p2 = re.compile(r'^Total incoming IKEv2 SA Count:\s+(?P<in_sa>\d+)\s+'
-                        r'active:\s+(?P<in_sa_act>\d+)\s+negotiating:\s+(?P<in_sa_nego>\d+)$')
+        p2 = regex_engine.compile(r'^Total incoming IKEv2 SA Count:\s+(?P<in_sa>\d+)\s+'
+                                  r'active:\s+(?P<in_sa_act>\d+)\s+negotiating:\s+(?P<in_sa_nego>\d+)$')
  
         # Total outgoing IKEv2 SA Count:    0        active:        0        negotiating: 0
-        p3 = re.compile(r'^Total outgoing IKEv2 SA Count:\s+(?P<out_sa>\d+)\s+'
-                        r'active:\s+(?P<out_sa_act>\d+)\s+negotiating:\s+(?P<out_sa_nego>\d+)$')
+        p3 = regex_engine.compile(r'^Total outgoing IKEv2 SA Count:\s+(?P<out_sa>\d+)\s+'
+                                  r'active:\s+(?P<out_sa_act>\d+)\s+negotiating:\s+(?P<out_sa_nego>\d+)$')
 
         # Incoming IKEv2 Requests: 0        accepted:      0        rejected:    0
-        p4 = re.compile(r'^Incoming IKEv2 Requests:\s+(?P<in_req>\d+)\s+accepted:\s+'
-                        r'(?P<in_accept>\d+)\s+rejected:\s+(?P<in_reject>\d+)$')
+        p4 = regex_engine.compile(r'^Incoming IKEv2 Requests:\s+(?P<in_req>\d+)\s+accepted:\s+'
+                                  r'(?P<in_accept>\d+)\s+rejected:\s+(?P<in_reject>\d+)$')
 
         # Outgoing IKEv2 Requests: 0        accepted:      0        rejected:    0
-        p5 = re.compile(r'^Outgoing IKEv2 Requests:\s+(?P<out_req>\d+)\s+accepted:\s+'
-                        r'(?P<out_accept>\d+)\s+rejected:\s+(?P<out_reject>\d+)$')
+        p5 = regex_engine.compile(r'^Outgoing IKEv2 Requests:\s+(?P<out_req>\d+)\s+accepted:\s+'
+                                  r'(?P<out_accept>\d+)\s+rejected:\s+(?P<out_reject>\d+)$')
 
         # Rejected IKEv2 Requests: 0        rsrc low:      0        SA limit:    0 
-        p6 = re.compile(r'^Rejected IKEv2 Requests:\s+(?P<rej_req>\d+)\s+rsrc low:\s+'
-                        r'(?P<low_rsrc>\d+)\s+SA limit:\s+(?P<sa_limit>\d+)$')
+        p6 = regex_engine.compile(r'^Rejected IKEv2 Requests:\s+(?P<rej_req>\d+)\s+rsrc low:\s+'
+                                  r'(?P<low_rsrc>\d+)\s+SA limit:\s+(?P<sa_limit>\d+)$')
 
         # IKEv2 packets dropped at dispatch: 0 
-        p7 = re.compile(r'^IKEv2 packets dropped at dispatch:\s+(?P<pak_drop>\d+)$')
+        p7 = regex_engine.compile(r'^IKEv2 packets dropped at dispatch:\s+(?P<pak_drop>\d+)$')
 
         # Incoming Requests dropped as LOW Q limit reached : 0
-        p8 = re.compile(r'^Incoming Requests dropped as LOW Q limit reached :\s+(?P<drop_lowq>\d+)$')
+        p8 = regex_engine.compile(r'^Incoming Requests dropped as LOW Q limit reached :\s+(?P<drop_lowq>\d+)$')
 
         # Incoming IKEV2 Cookie Challenged Requests: 0 
-        p9 = re.compile(r'^Incoming IKEV2 Cookie Challenged Requests:\s+(?P<chall_req>\d+)$')
+        p9 = regex_engine.compile(r'^Incoming IKEV2 Cookie Challenged Requests:\s+(?P<chall_req>\d+)$')
 
         #     accepted: 0        rejected: 0        rejected no cookie: 0 
-        p10 = re.compile(r'^accepted:\s+(?P<chall_acc>\d+)\s+rejected:\s+(?P<chall_rej>\d+)\s+'
-                         r'rejected no cookie:\s+(?P<chall_rej_nocook>\d+)$')
+        p10 = regex_engine.compile(r'^accepted:\s+(?P<chall_acc>\d+)\s+rejected:\s+(?P<chall_rej>\d+)\s+'
+                                   r'rejected no cookie:\s+(?P<chall_rej_nocook>\d+)$')
 
         # Total Deleted sessions of Cert Revoked Peers: 0 
-        p11 = re.compile(r'^Total Deleted sessions of Cert Revoked Peers:\s+(?P<del_sess_cert>\d+)$')
+        p11 = regex_engine.compile(r'^Total Deleted sessions of Cert Revoked Peers:\s+(?P<del_sess_cert>\d+)$')
 
         # Sessions with Quantum Resistance: 1        Manual: 4294967291 Dynamic: 6
-        p12 = re.compile(r'^Sessions with Quantum Resistance:\s+(?P<active_qr_sessions>\d+)\s+Manual:\s+(?P<qr_manual>\d+)\s+Dynamic:\s+(?P<qr_dynamic>\d+)$')
+        p12 = regex_engine.compile(r'^Sessions with Quantum Resistance:\s+(?P<active_qr_sessions>\d+)\s+Manual:\s+(?P<qr_manual>\d+)\s+Dynamic:\s+(?P<qr_dynamic>\d+)$')
 
         # SA Strength Enforcement Rejects - incoming:        0 outgoing:        4
-        p13 = re.compile(r'^SA Strength Enforcement Rejects -\s+incoming:\s+(?P<sa_strength_enforce_reject_incoming>\d+)\s+'
-                         r'outgoing:\s+(?P<sa_strength_enforce_reject_outgoing>\d+)$')
+        p13 = regex_engine.compile(r'^SA Strength Enforcement Rejects -\s+incoming:\s+(?P<sa_strength_enforce_reject_incoming>\d+)\s+'
+                                   r'outgoing:\s+(?P<sa_strength_enforce_reject_outgoing>\d+)$')
 
         # initial return dictionary
 
@@ -7391,52 +7456,52 @@ class ShowCryptoCallAdmissionStatistics(ShowCryptoCallAdmissionStatisticsSchema)
             output = self.device.execute(self.cli_command)
 
         # System Resource Limit:        0 Max IKE SAs:     0 Max in nego:    40
-        p1 = re.compile(r'^System Resource Limit:\s+(?P<sr_limit>\d+)\s+Max IKE SAs:\s+'
-                        r'(?P<v1_sa>\d+)\s+Max in nego:\s+(?P<in_nego>\d+)$')
+        p1 = regex_engine.compile(r'^System Resource Limit:\s+(?P<sr_limit>\d+)\s+Max IKE SAs:\s+'
+                                  r'(?P<v1_sa>\d+)\s+Max in nego:\s+(?P<in_nego>\d+)$')
     
         # Total IKE SA Count:        1001 active:       1001 negotiating:     0
-        p2 = re.compile(r'^Total IKE SA Count:\s+(?P<ike_sa>\d+)\s+active:\s+'
-                        r'(?P<ike_sa_act>\d+)\s+negotiating:\s+(?P<ike_sa_nego>\d+)$')
+        p2 = regex_engine.compile(r'^Total IKE SA Count:\s+(?P<ike_sa>\d+)\s+active:\s+'
+                                  r'(?P<ike_sa_act>\d+)\s+negotiating:\s+(?P<ike_sa_nego>\d+)$')
  
         # Incoming IKE Requests:  1057639 accepted:  1056101 rejected:     1538
-        p3 = re.compile(r'^Incoming IKE Requests:\s+(?P<in_req>\d+)\s+accepted:\s+'
-                        r'(?P<in_accept>\d+)\s+rejected:\s+(?P<in_reject>\d+)$')
+        p3 = regex_engine.compile(r'^Incoming IKE Requests:\s+(?P<in_req>\d+)\s+accepted:\s+'
+                                  r'(?P<in_accept>\d+)\s+rejected:\s+(?P<in_reject>\d+)$')
 
         # Outgoing IKE Requests:        0 accepted:        0 rejected:        0
-        p4 = re.compile(r'^Outgoing IKE Requests:\s+(?P<out_req>\d+)\s+accepted:\s+'
-                        r'(?P<out_accept>\d+)\s+rejected:\s+(?P<out_reject>\d+)$')
+        p4 = regex_engine.compile(r'^Outgoing IKE Requests:\s+(?P<out_req>\d+)\s+accepted:\s+'
+                                  r'(?P<out_accept>\d+)\s+rejected:\s+(?P<out_reject>\d+)$')
 
         # Rejected IKE Requests:     1538 rsrc low:        0 Active SA limit: 0 
-        p5 = re.compile(r'^Rejected IKE Requests:\s+(?P<rej_req>\d+)\s+rsrc low:\s+'
-                        r'(?P<low_rsrc>\d+)\s+Active SA limit:\s+(?P<sa_limit>\d+)$')
+        p5 = regex_engine.compile(r'^Rejected IKE Requests:\s+(?P<rej_req>\d+)\s+rsrc low:\s+'
+                                  r'(?P<low_rsrc>\d+)\s+Active SA limit:\s+(?P<sa_limit>\d+)$')
 
         #      In-neg SA limit: 1538
-        p6 = re.compile(r'^In-neg SA limit:\s+(?P<neg_sa_limit>\d+)$')
+        p6 = regex_engine.compile(r'^In-neg SA limit:\s+(?P<neg_sa_limit>\d+)$')
 
         # IKE packets dropped at dispatch:        0
-        p7 = re.compile(r'^IKE packets dropped at dispatch:\s+(?P<pak_drop>\d+)$')
+        p7 = regex_engine.compile(r'^IKE packets dropped at dispatch:\s+(?P<pak_drop>\d+)$')
 
         # Max IPSEC SAs:     0
-        p8 = re.compile(r'^Max IPSEC SAs:\s+(?P<sa_max>\d+)$')
+        p8 = regex_engine.compile(r'^Max IPSEC SAs:\s+(?P<sa_max>\d+)$')
 
         # Total IPSEC SA Count:        1081 active:       1075 negotiating:     6
-        p9 = re.compile(r'^Total IPSEC SA Count:\s+(?P<ipsec_sa>\d+)\s+active:\s+'
-                        r'(?P<secsa_act>\d+)\s+negotiating:\s+(?P<secsa_nego>\d+)$')
+        p9 = regex_engine.compile(r'^Total IPSEC SA Count:\s+(?P<ipsec_sa>\d+)\s+active:\s+'
+                                  r'(?P<secsa_act>\d+)\s+negotiating:\s+(?P<secsa_nego>\d+)$')
  
         # Incoming IPSEC Requests:   511759 accepted:   511759 rejected:        0
-        p10 = re.compile(r'^Incoming IPSEC Requests:\s+(?P<in_sa_req>\d+)\s+accepted:\s+'
-                        r'(?P<in_sa_accept>\d+)\s+rejected:\s+(?P<in_sa_reject>\d+)$')
+        p10 = regex_engine.compile(r'^Incoming IPSEC Requests:\s+(?P<in_sa_req>\d+)\s+accepted:\s+'
+                                  r'(?P<in_sa_accept>\d+)\s+rejected:\s+(?P<in_sa_reject>\d+)$')
 
         # Outgoing IPSEC Requests:     1214 accepted:     1214 rejected:        0
-        p11 = re.compile(r'^Outgoing IPSEC Requests:\s+(?P<out_sa_req>\d+)\s+accepted:\s+'
-                         r'(?P<out_sa_accept>\d+)\s+rejected:\s+(?P<out_sa_reject>\d+)$')
+        p11 = regex_engine.compile(r'^Outgoing IPSEC Requests:\s+(?P<out_sa_req>\d+)\s+accepted:\s+'
+                                   r'(?P<out_sa_accept>\d+)\s+rejected:\s+(?P<out_sa_reject>\d+)$')
 
         # Phase1.5 SAs under negotiation:         0 
-        p12 = re.compile(r'^Phase1.5 SAs under negotiation:\s+(?P<phase1_sa>\d+)$')
+        p12 = regex_engine.compile(r'^Phase1.5 SAs under negotiation:\s+(?P<phase1_sa>\d+)$')
 
         # SA Strength Enforcement Rejects:  incoming:        0 outgoing:        0
-        p13 = re.compile(r'^SA Strength Enforcement Rejects:\s+incoming:\s+(?P<sa_strength_enforce_reject_incoming>\d+)\s+'
-                         r'outgoing:\s+(?P<sa_strength_enforce_reject_outgoing>\d+)$')
+        p13 = regex_engine.compile(r'^SA Strength Enforcement Rejects:\s+incoming:\s+(?P<sa_strength_enforce_reject_incoming>\d+)\s+'
+                                   r'outgoing:\s+(?P<sa_strength_enforce_reject_outgoing>\d+)$')
 
         # initial return dictionary
 
@@ -7580,7 +7645,7 @@ class ShowCryptoSessionCountUpActive(ShowCryptoSessionCountUpActiveSchema):
             output = self.device.execute(self.cli_command)
 
         # Total number of groups:   831
-        p1 = re.compile(r'^Number\s+of\s+lines\s+which\s+match\s+regexp\s+=\s+(?P<active_crypto_session_count>\d+)$')
+        p1 = regex_engine.compile(r'^Number\s+of\s+lines\s+which\s+match\s+regexp\s+=\s+(?P<active_crypto_session_count>\d+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -7640,31 +7705,31 @@ class ShowCryptogkmgmreplay(ShowCryptogkmgmreplaySchema):
             output = self.device.execute(self.cli_command)
         
         # Anti-replay Information For Group bw600:
-        p1 = re.compile(r'^Anti-replay Information For Group (?P<group>[\w\d\-]+):$')
+        p1 = regex_engine.compile(r'^Anti-replay Information For Group (?P<group>[\w\d\-]+):$')
 
         # Timebased Replay:
-        p2 = re.compile(r'^Timebased Replay:$')
+        p2 = regex_engine.compile(r'^Timebased Replay:$')
 
         #       is not enabled
-        p3 = re.compile(r'is not enabled$')
+        p3 = regex_engine.compile(r'is not enabled$')
 
         # Replay Value : 3611735.21 secs
-        p4 = re.compile(r'^Replay Value :\s(?P<replay_value>[\w\s\.]+)$')
+        p4 = regex_engine.compile(r'^Replay Value :\s(?P<replay_value>[\w\s\.]+)$')
 
         # Input Packets : 2753845832 Output Packets : 3668218697
-        p5 = re.compile(r'^Input Packets :\s+(?P<input_packets>[\d]+)\s+Output Packets :\s+(?P<output_packets>[\d]+)$')
+        p5 = regex_engine.compile(r'^Input Packets :\s+(?P<input_packets>[\d]+)\s+Output Packets :\s+(?P<output_packets>[\d]+)$')
 
         # Input Error Packets : 0 Output Error Packets : 0
-        p6 = re.compile(r'^Input Error Packets :\s+(?P<input_error_packets>\d+)\s+Output Error Packets :\s+(?P<output_error_packets>\d+)$')
+        p6 = regex_engine.compile(r'^Input Error Packets :\s+(?P<input_error_packets>\d+)\s+Output Error Packets :\s+(?P<output_error_packets>\d+)$')
 
         # Time Sync Error : 0 Max time delta : 0.00 secs
-        p7 = re.compile(r'^Time Sync Error :\s+(?P<time_sync_error>\d+)\s+Max time delta :\s+(?P<max_time_delta>[\w\.\s]+)$')
+        p7 = regex_engine.compile(r'^Time Sync Error :\s+(?P<time_sync_error>\d+)\s+Max time delta :\s+(?P<max_time_delta>[\w\.\s]+)$')
 
         # TBAR Error History (sampled at 10pak/min):
-        p8 = re.compile(r'^TBAR Error History \(sampled at 10pak\/min\):')
+        p8 = regex_engine.compile(r'^TBAR Error History \(sampled at 10pak\/min\):')
 
         #               No TBAR errors detected
-        p9 = re.compile(r'No TBAR errors detected$')
+        p9 = regex_engine.compile(r'No TBAR errors detected$')
 
         master_dict = {}
 
@@ -7790,34 +7855,34 @@ class ShowCryptoSocketsInternal(ShowCryptoSocketsInternalSchema):
 
         # initial regexp pattern
         # Crypto Secure Socket Messages
-        p1 = re.compile(r'(?P<messages_seciton>Crypto Secure Socket Messages)')
+        p1 = regex_engine.compile(r'(?P<messages_seciton>Crypto Secure Socket Messages)')
 
         #  Open Socket               : 4994      Close Socket              : 14378  
-        p2 = re.compile(r'Open Socket\s+:\s+(?P<opn_sokt>\d+)\s+Close Socket\s+:\s+(?P<cls_sokt>\d+)')
+        p2 = regex_engine.compile(r'Open Socket\s+:\s+(?P<opn_sokt>\d+)\s+Close Socket\s+:\s+(?P<cls_sokt>\d+)')
 
         #  Listen Start              : 1         Listen Stop               : 0   
-        p3 = re.compile(r'Listen Start\s+:\s+(?P<lstn_strt>\d+)\s+Listen Stop\s+:\s+(?P<lstn_stp>\d+)')
+        p3 = regex_engine.compile(r'Listen Start\s+:\s+(?P<lstn_strt>\d+)\s+Listen Stop\s+:\s+(?P<lstn_stp>\d+)')
         
         #  SS Connect                : 0         SS Connect Socket         : 0  
-        p4 = re.compile(r'SS Connect\s+:\s+(?P<ss_cnct>\d+)\s+SS Connect Socket\s+:\s+(?P<cnct_sokt>\d+)')
+        p4 = regex_engine.compile(r'SS Connect\s+:\s+(?P<ss_cnct>\d+)\s+SS Connect Socket\s+:\s+(?P<cnct_sokt>\d+)')
 
         #  SS End Message            : 0         unknown                   : 0  
-        p5 = re.compile(r'SS End Message\s+:\s+(?P<ss_end_msg>\d+)\s+unknown\s+:\s+(?P<unkn>\d+)')
+        p5 = regex_engine.compile(r'SS End Message\s+:\s+(?P<ss_end_msg>\d+)\s+unknown\s+:\s+(?P<unkn>\d+)')
 
         # Crypto Secure Socket Listen SM Stats
-        p6 = re.compile(r'^(?P<listn_sm_stats_seciton>Crypto Secure Socket Listen SM Stats)$')
+        p6 = regex_engine.compile(r'^(?P<listn_sm_stats_seciton>Crypto Secure Socket Listen SM Stats)$')
 
         # Message Stats
-        p7 = re.compile(r'^(?P<msg_sts_seciton>Message Stats)$')
+        p7 = regex_engine.compile(r'^(?P<msg_sts_seciton>Message Stats)$')
 
         #  Create Listener Map       : 1           Detach Listener Map       : 0    
-        p8 = re.compile(r'Create Listener Map\s+:\s+(?P<listn_map>\d+)\s+Detach Listener Map\s+:\s+(?P<dtch_listn_map>\d+)')
+        p8 = regex_engine.compile(r'Create Listener Map\s+:\s+(?P<listn_map>\d+)\s+Detach Listener Map\s+:\s+(?P<dtch_listn_map>\d+)')
 
         # Crypto Secure Socket IPSec Events
-        p9 = re.compile(r'^(?P<ipsec_evnt_seciton>Crypto Secure Socket IPSec Events)$')
+        p9 = regex_engine.compile(r'^(?P<ipsec_evnt_seciton>Crypto Secure Socket IPSec Events)$')
         
         #  Socket Up                 : 21513     Socket down               : 14316  
-        p10 = re.compile(r'Socket Up\s+:\s+(?P<sokt_up>\d+)\s+Socket down\s+:\s+(?P<sokt_down>\d+)')
+        p10 = regex_engine.compile(r'Socket Up\s+:\s+(?P<sokt_up>\d+)\s+Socket down\s+:\s+(?P<sokt_down>\d+)')
         m7=False
         for line in out.splitlines():
             line = line.strip()
@@ -7922,7 +7987,7 @@ class ShowCryptoIpsecPALHWcreate_ipsec_sa_by_q(ShowCryptoIpsecPALHWcreate_ipsec_
             output = self.device.execute(self.cli_command)
 
         # PALHWcreate_ipsec_sa_by_q |913873|12797964|0    |0    |913873|12797964|14   ||0    |0    |0    |0    |0    |0    |0    |0    |0    |0 
-        p1 = re.compile(r'^PALHWcreate_ipsec_sa_by_q[\s\S]+\|\|(?P<counters>\d+)\s*?[\|\d\s]+$')
+        p1 = regex_engine.compile(r'^PALHWcreate_ipsec_sa_by_q[\s\S]+\|\|(?P<counters>\d+)\s*?[\|\d\s]+$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -7961,7 +8026,7 @@ class ShowCryptoIsakmpSaCountActive(ShowCryptoIsakmpSaCountActiveSchema):
             output = self.device.execute(self.cli_command)
 
         # Number of lines which match regexp = 2016
-        p1 = re.compile(r'^Number\s+of\s+lines\s+which\s+match\s+regexp\s+=\s+(?P<active_crypto_isakmpsa_count>\d+)$')
+        p1 = regex_engine.compile(r'^Number\s+of\s+lines\s+which\s+match\s+regexp\s+=\s+(?P<active_crypto_isakmpsa_count>\d+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -8038,35 +8103,35 @@ class ShowTunnelProtectionStatistics(ShowTunnelProtectionStatisticsSchema):
             output = self.device.execute(self.cli_command)
         
         #------------------------- Message Statistics -------------------------
-        p1_0 = re.compile(r'-+ +Message +Statistics +-+')
+        p1_0 = regex_engine.compile(r'-+ +Message +Statistics +-+')
         #   Sent:
         #      Listen Start   : 1    Listen Stop    : 0    Socket Open    : 0    
-        p1 = re.compile(r'Listen +Start +: +(?P<listen_start>[\d]+) +Listen +Stop +: +(?P<listen_stop>[\d]+) +Socket +Open +: +(?P<socket_open>[\d]+)')
+        p1 = regex_engine.compile(r'Listen +Start +: +(?P<listen_start>[\d]+) +Listen +Stop +: +(?P<listen_stop>[\d]+) +Socket +Open +: +(?P<socket_open>[\d]+)')
 
         #      Socket Close   : 0    
-        p2 = re.compile(r'Socket +Close +: +(?P<socket_close>[\d+])')
+        p2 = regex_engine.compile(r'Socket +Close +: +(?P<socket_close>[\d+])')
         #   Rcvd:
         #      General Error  : 0    Socket Error   : 0    Socket Ready   : 0    
-        p3 = re.compile(r'General +Error +: +(?P<general_error>[\d]+) +Socket +Error +: +(?P<socket_error>[\d]+) +Socket +Ready +: +(?P<socket_ready>[\d]+)')
+        p3 = regex_engine.compile(r'General +Error +: +(?P<general_error>[\d]+) +Socket +Error +: +(?P<socket_error>[\d]+) +Socket +Ready +: +(?P<socket_ready>[\d]+)')
         #      Socket Up      : 0    Socket Down    : 0    MTU Changed    : 0    
-        p4 = re.compile(r'Socket Up +: +(?P<socket_up>[\d]+) +Socket +Down +: +(?P<socket_down>[\d]) +MTU +Changed +: +(?P<mtu_changed>[\d]+)')
+        p4 = regex_engine.compile(r'Socket Up +: +(?P<socket_up>[\d]+) +Socket +Down +: +(?P<socket_down>[\d]) +MTU +Changed +: +(?P<mtu_changed>[\d]+)')
         #      Listen Ready   : 1    Other          : 0    
-        p5 = re.compile(r'Listen +Ready +: +(?P<listen_ready>[\d]+) +Other +: +(?P<other>[\d]+)')
+        p5 = regex_engine.compile(r'Listen +Ready +: +(?P<listen_ready>[\d]+) +Other +: +(?P<other>[\d]+)')
         #-------------------------- Error Statistics --------------------------
-        p6_0 = re.compile(r'-+ +Error +Statistics +-+')
+        p6_0 = regex_engine.compile(r'-+ +Error +Statistics +-+')
         #   Rcvd:
         #      Listen Start   : 0    Listen Stop    : 0    Socket Open    : 0    
-        p6 = re.compile(r'Listen +Start +: +(?P<listen_start>[\d]+) +Listen +Stop +: (?P<listen_stop>[\d]+) +Socket +Open +: +(?P<socket_open>[\d]+)')
+        p6 = regex_engine.compile(r'Listen +Start +: +(?P<listen_start>[\d]+) +Listen +Stop +: (?P<listen_stop>[\d]+) +Socket +Open +: +(?P<socket_open>[\d]+)')
         #      Socket Close   : 0    Conn Timeout   : 0    
-        p7 = re.compile(r'Socket +Close +: +(?P<socket_close>[\d]+) +Conn +Timeout +: +(?P<connection_timeout>[\d]+)')
+        p7 = regex_engine.compile(r'Socket +Close +: +(?P<socket_close>[\d]+) +Conn +Timeout +: +(?P<connection_timeout>[\d]+)')
         #------------ Data Statistics(Other than IPSec protection) ------------
-        p8_0 = re.compile(r'-+ +Data +Statistics.Other +than +IPSec +protection. +-+')
+        p8_0 = regex_engine.compile(r'-+ +Data +Statistics.Other +than +IPSec +protection. +-+')
         #   Sent:
         #      cef pkt drops  : 0    ps pkt drops   : 0    
-        p8 = re.compile(r'cef +pkt +drops +: +(?P<cef_packet_drop>[\d]+) +ps +pkt +drops +: +(?P<ps_packet_drop>[\d]+)')
+        p8 = regex_engine.compile(r'cef +pkt +drops +: +(?P<cef_packet_drop>[\d]+) +ps +pkt +drops +: +(?P<ps_packet_drop>[\d]+)')
         #   Rcvd:
         #      ps pkt drops   : 0    clear pkt drops: 0    
-        p9 = re.compile(r'ps +pkt +drops +: +(?P<ps_packet_drop>[\d]+) +clear +pkt +drops: +(?P<clear_packet_drop>[\d]+)')
+        p9 = regex_engine.compile(r'ps +pkt +drops +: +(?P<ps_packet_drop>[\d]+) +clear +pkt +drops: +(?P<clear_packet_drop>[\d]+)')
 
         ret_dict = {}
         message_stats = False
@@ -8209,19 +8274,19 @@ class ShowCryptoIkev2StatsPsh(ShowCryptoIkev2StatsPshSchema):
             output = self.device.execute(self.cli_command)
 
         # ------------------IKEV2 PSH STATS----------------------
-        p1 = re.compile(r'-+IKEV2 PSH STATS-+')
+        p1 = regex_engine.compile(r'-+IKEV2 PSH STATS-+')
 
         # ikev2 psh requested: 99
-        p2 = re.compile(r'^ikev2 psh requested:\s+(?P<psh_requested>\d+)$')
+        p2 = regex_engine.compile(r'^ikev2 psh requested:\s+(?P<psh_requested>\d+)$')
 
         # ikev2 psh request success: 99
-        p3 = re.compile(r'^ikev2 psh request success:\s+(?P<psh_request_success>\d+)$')
+        p3 = regex_engine.compile(r'^ikev2 psh request success:\s+(?P<psh_request_success>\d+)$')
 
         # ikev2 psh return requested: 92
-        p4 = re.compile(r'^ikev2 psh return requested:\s+(?P<psh_return_requested>\d+)$')
+        p4 = regex_engine.compile(r'^ikev2 psh return requested:\s+(?P<psh_return_requested>\d+)$')
 
         # ikev2 psh return success: 92
-        p5 = re.compile(r'^ikev2 psh return success:\s+(?P<psh_return_success>\d+)$')
+        p5 = regex_engine.compile(r'^ikev2 psh return success:\s+(?P<psh_return_success>\d+)$')
 
         master_dict = {}
 
@@ -8316,31 +8381,31 @@ class ShowCryptoKeyMypubkeyAll(ShowCryptoKeyMypubkeyMasterSchema):
             output = self.device.execute(self.cli_command)
 
         # % Key pair was generated at: 06:51:40 UTC Aug 30 2022
-        p1 = re.compile(r'^% Key pair.*: +(?P<keypairgen_time>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^% Key pair.*: +(?P<keypairgen_time>[\S\s]+)$')
 
         # Key name: test
-        p2 = re.compile(r'^Key name: +(?P<key_name>\S+)$')
+        p2 = regex_engine.compile(r'^Key name: +(?P<key_name>\S+)$')
 
         # Key type: RSA KEYS
-        p3 = re.compile(r'^Key type: +(?P<key_type>[\s\S]+)$')
+        p3 = regex_engine.compile(r'^Key type: +(?P<key_type>[\s\S]+)$')
 
         # Storage Device: private-config
-        p4 = re.compile(r'^Storage Device: +(?P<storage_device>[\s\S]+)$')
+        p4 = regex_engine.compile(r'^Storage Device: +(?P<storage_device>[\s\S]+)$')
 
         # Usage: General Purpose Key
-        p5 = re.compile(r'^Usage: +(?P<usage>[\s\S]+)$')
+        p5 = regex_engine.compile(r'^Usage: +(?P<usage>[\s\S]+)$')
 
         # Key is not exportable. Redundancy enabled.
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Key is +(?P<key>[not exportable|exportable]+). +Redundancy +(?P<redundancy>[enabled|not enabled]+).$'
         )
 
         # Key is not exportable.
-        p7 = re.compile(r'^Key is +(?P<key>[not exportable|exportable]+).$')
+        p7 = regex_engine.compile(r'^Key is +(?P<key>[not exportable|exportable]+).$')
 
         # F2BC3B97 278C61D5 6700528C 59FF9BD2 A01F83E1 0123A7C5 638D212C FCA5AD92
         # C907010D 1D1776D8 09DDECE9 80A88D97 109A4C88 B0F85889 F379B628 4E9E0434
-        p8 = re.compile(r'^(?P<key_data>[0-9A-Z\s]+)$')
+        p8 = regex_engine.compile(r'^(?P<key_data>[0-9A-Z\s]+)$')
 
         ret_dict = {}
         entry = 1
@@ -8541,11 +8606,11 @@ class ShowCryptoIkev2Performance(ShowCryptoIkev2PerformanceSchema):
         # Crypto Engine Stats (microseconds):
         # External Service Stats (microseconds):
         # Summary (microsecs):
-        p1 = re.compile(r"^(?P<stats_type>[\S\s]+)\(\w+\):$")
+        p1 = regex_engine.compile(r"^(?P<stats_type>[\S\s]+)\(\w+\):$")
 
         # Ingress:               SampleSize tps/avg min max cpu/avg min max
         # Egress:                SampleSize tps/avg min max cpu/avg min max
-        p2 = re.compile(r"^(?P<tps>Ingress|Egress):.*$")
+        p2 = regex_engine.compile(r"^(?P<tps>Ingress|Egress):.*$")
 
         # IKE Established                 0       0   0   0       0   0   0
         # IPSEC Child Establishe          0       0   0   0       0   0   0
@@ -8553,7 +8618,7 @@ class ShowCryptoIkev2Performance(ShowCryptoIkev2PerformanceSchema):
         # IKE Established                 0       0   0   0       0   0   0
         # IPSEC Child Establishe          0       0   0   0       0   0   0
         # IKE Child Established           0       0   0   0       0   0   0
-        p3 = re.compile(r"^(?P<type>.*Est.*)\s+(?P<sample_size>\S+)\s+(?P<tps_avg>\S+)\s+(?P<tps_min>\S+)\s+(?P<tps_max>\S+)\s+(?P<cpu_avg>\S+)+\s+(?P<cpu_min>\S+)\s+(?P<cpu_max>\S+)$")
+        p3 = regex_engine.compile(r"^(?P<type>.*Est.*)\s+(?P<sample_size>\S+)\s+(?P<tps_avg>\S+)\s+(?P<tps_min>\S+)\s+(?P<tps_max>\S+)\s+(?P<cpu_avg>\S+)+\s+(?P<cpu_min>\S+)\s+(?P<cpu_max>\S+)$")
 
         # Incoming IKE Packets            0       0   0   0
         # -Init                           0       0   0   0
@@ -8633,18 +8698,18 @@ class ShowCryptoIkev2Performance(ShowCryptoIkev2PerformanceSchema):
         # Redirect Acceptance Ch          0          0          0          0
         # NO NAME                         0          0          0          0
         # NO NAME                         0          0          0          0
-        p5 = re.compile(r"^(?P<stats_type>[\S\s]+)\s+(?P<sample_size>\d+)\s+(?P<avg>\d+)\s+(?P<min>\d+)\s+(?P<max>\d+)$")
+        p5 = regex_engine.compile(r"^(?P<stats_type>[\S\s]+)\s+(?P<sample_size>\d+)\s+(?P<avg>\d+)\s+(?P<min>\d+)\s+(?P<max>\d+)$")
 
         # Main Exchange Setup:            0
         # Child Exchange Setup:            0
-        p6 = re.compile(r"^(?P<exchange_setup>Main|Child).*:\s+(?P<exchange_value>\d+)$")
+        p6 = regex_engine.compile(r"^(?P<exchange_setup>Main|Child).*:\s+(?P<exchange_value>\d+)$")
 
         # Child Processing:                0 -> 0%
         # Transmission:                    0 -> 0%
         # Main Processing:                0 -> 0%
         # On IPC Queue:                   0 -> 0%
         # Transmission:                   0 -> 0%
-        p7 = re.compile(r"^(?P<processing_type>[\w\s]+):\s+(?P<value>\d+)\s+->\s+(?P<percentage>\d+)%$")
+        p7 = regex_engine.compile(r"^(?P<processing_type>[\w\s]+):\s+(?P<value>\d+)\s+->\s+(?P<percentage>\d+)%$")
 
         ret_dict = {}
         var = 0
@@ -8849,17 +8914,17 @@ class ShowCryptoPkiTrustpoints(ShowCryptoPkiTrustpointsSchema):
             output = self.device.execute(self.cli_command)
 
         # Trustpoint SLA-TrustPoint:
-        p1 = re.compile(r"^Trustpoint\s+(?P<name>\S+):$")
+        p1 = regex_engine.compile(r"^Trustpoint\s+(?P<name>\S+):$")
         #     Subject Name:
-        p2 = re.compile(r"^(?P<subject_name>Subject\s+Name:)$")
+        p2 = regex_engine.compile(r"^(?P<subject_name>Subject\s+Name:)$")
         #     cn=Cisco Licensing Root CA
-        p3 = re.compile(r"^cn=(?P<cn>.+)$")
+        p3 = regex_engine.compile(r"^cn=(?P<cn>.+)$")
         #     o=Cisco
-        p4 = re.compile(r"^o=(?P<o>.+)$")
+        p4 = regex_engine.compile(r"^o=(?P<o>.+)$")
         #           Serial Number (hex): 01
-        p5 = re.compile(r"^Serial\s+Number\s+\(hex\):\s+(?P<serial_number_in_hex>[0-9a-fA-F]+)$")
+        p5 = regex_engine.compile(r"^Serial\s+Number\s+\(hex\):\s+(?P<serial_number_in_hex>[0-9a-fA-F]+)$")
         #     Certificate configured.
-        p6 = re.compile(r"^(?P<comment>.+)$")
+        p6 = regex_engine.compile(r"^(?P<comment>.+)$")
 
         ret_dict = {}
 
@@ -9029,118 +9094,118 @@ class ShowCryptoIpsecSaInterface(ShowCryptoIpsecSaInterfaceSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         # interface: GigabitEthernet3
-        p1 = re.compile(r'^interface:+ (?P<interface>[\w\d\/]+)$')
+        p1 = regex_engine.compile(r'^interface:+ (?P<interface>[\w\d\/]+)$')
 
         # Crypto map tag: vpn-crypto-map, local addr 1.1.1.2
-        p2 = re.compile(r'^Crypto map tag: (?P<crypto_map_tag>[\w\d\-\/]+), +local addr +(?P<local_addr>[\w\.\:]+)$')
+        p2 = regex_engine.compile(r'^Crypto map tag: (?P<crypto_map_tag>[\w\d\-\/]+), +local addr +(?P<local_addr>[\w\.\:]+)$')
 
         # protected vrf: (none)
-        p3 = re.compile(r'^protected vrf: +\((?P<protected_vrf>[\w]+)\)$')
+        p3 = regex_engine.compile(r'^protected vrf: +\((?P<protected_vrf>[\w]+)\)$')
 
         # local ident (addr/mask/prot/port): (20.20.20.0/255.255.255.0/0/0)
-        p4 = re.compile(r'^local.*: +\((?P<addr>[\w\.\:]+)\/(?P<mask>[0-9\.]+)\/(?P<prot>[\d]+)\/(?P<port>[\d]+)\)$')
+        p4 = regex_engine.compile(r'^local.*: +\((?P<addr>[\w\.\:]+)\/(?P<mask>[0-9\.]+)\/(?P<prot>[\d]+)\/(?P<port>[\d]+)\)$')
 
         # remote ident (addr/mask/prot/port): (10.10.10.0/255.255.255.0/0/0)
-        p5 = re.compile(r'^remote.*: +\((?P<addr>[0-9\.\:]+)\/(?P<mask>[0-9\.]+)\/(?P<prot>[\d]+)\/(?P<port>[\d]+)\)$')
+        p5 = regex_engine.compile(r'^remote.*: +\((?P<addr>[0-9\.\:]+)\/(?P<mask>[0-9\.]+)\/(?P<prot>[\d]+)\/(?P<port>[\d]+)\)$')
 
         # current_peer 1.1.1.1 port 500
-        p6 = re.compile(r'^current_peer +(?P<peer_ip>[\w\.\:]+) +port +(?P<port>[0-9]+)$')
+        p6 = regex_engine.compile(r'^current_peer +(?P<peer_ip>[\w\.\:]+) +port +(?P<port>[0-9]+)$')
 
         # PERMIT, flags={origin_is_acl,}
-        p7 = re.compile(r'^(?P<action>\w+), +flags=\{(?P<acl>[\w\_\-\,]+)\}$')
+        p7 = regex_engine.compile(r'^(?P<action>\w+), +flags=\{(?P<acl>[\w\_\-\,]+)\}$')
 
         # #pkts encaps: 4, #pkts encrypt: 4, #pkts digest: 4
-        p8 = re.compile(r'^#pkts encaps: +(?P<pkts_encaps>\d+).*: +(?P<pkts_encrypt>\d+).*: +(?P<pkts_digest>\d+)$')
+        p8 = regex_engine.compile(r'^#pkts encaps: +(?P<pkts_encaps>\d+).*: +(?P<pkts_encrypt>\d+).*: +(?P<pkts_digest>\d+)$')
 
         # #pkts decaps: 4, #pkts decrypt: 4, #pkts verify: 4
-        p9 = re.compile(r'^#pkts decaps: +(?P<pkts_decaps>\d+).*: +(?P<pkts_decrypt>\d+).*: +(?P<pkts_verify>\d+)$')
+        p9 = regex_engine.compile(r'^#pkts decaps: +(?P<pkts_decaps>\d+).*: +(?P<pkts_decrypt>\d+).*: +(?P<pkts_verify>\d+)$')
 
         # #pkts compressed: 0, #pkts decompressed: 0
-        p10 = re.compile(r'^#pkts compressed: +(?P<pkts_compressed>\d+).*: +(?P<pkts_decompressed>\d+)$')
+        p10 = regex_engine.compile(r'^#pkts compressed: +(?P<pkts_compressed>\d+).*: +(?P<pkts_decompressed>\d+)$')
 
         # #pkts not compressed: 0, #pkts compr. failed: 0
-        p11 = re.compile(r'^#pkts not compressed: +(?P<pkts_not_compressed>\d+).*: +(?P<pkts_compr_failed>\d+)$')
+        p11 = regex_engine.compile(r'^#pkts not compressed: +(?P<pkts_not_compressed>\d+).*: +(?P<pkts_compr_failed>\d+)$')
 
         # #pkts not decompressed: 0, #pkts decompress failed: 0
-        p12 = re.compile(r'^#pkts not decompressed: +(?P<pkts_not_decompressed>\d+).*: +(?P<pkts_decompress_failed>\d+)$')
+        p12 = regex_engine.compile(r'^#pkts not decompressed: +(?P<pkts_not_decompressed>\d+).*: +(?P<pkts_decompress_failed>\d+)$')
 
         #send errors 0, #recv errors 0 
-        p13 = re.compile(r'^#send errors +(?P<send_errors>\d+).* +(?P<recv_errors>\d+)$')
+        p13 = regex_engine.compile(r'^#send errors +(?P<send_errors>\d+).* +(?P<recv_errors>\d+)$')
 
         # IPsecv6 policy name: OSPFv3-256
-        p14 = re.compile(r'^IPsecv6 policy name: +(?P<ipsecv6_policy_name>[\w\-]+)$')
+        p14 = regex_engine.compile(r'^IPsecv6 policy name: +(?P<ipsecv6_policy_name>[\w\-]+)$')
 
         # sa timing: remaining key lifetime 4 hours, 2 mins
-        p15 = re.compile(r'^sa timing: remaining key lifetime +(?P<remaining_key_lifetime>[\w\,\ ]+)$')
+        p15 = regex_engine.compile(r'^sa timing: remaining key lifetime +(?P<remaining_key_lifetime>[\w\,\ ]+)$')
 
         # IV size: 8 bytes
-        p16 = re.compile(r'^IV size: +(?P<iv_size>[\w\ ]+)$')
+        p16 = regex_engine.compile(r'^IV size: +(?P<iv_size>[\w\ ]+)$')
 
         # ekey has been disabled
-        p17 = re.compile(r'^ekey has been +(?P<ekey_status>[\w]+)$')
+        p17 = regex_engine.compile(r'^ekey has been +(?P<ekey_status>[\w]+)$')
 
         #  local crypto endpt.: FE80::B28B:D0FF:FE8D:BA49,
-        p18 = re.compile(r'^local crypto endpt.: +(?P<local_crypto_endpt>[\w\.\:]+),$')
+        p18 = regex_engine.compile(r'^local crypto endpt.: +(?P<local_crypto_endpt>[\w\.\:]+),$')
 
         # plaintext mtu 1476, path mtu 1500, ipv6 mtu 1500, ipv6 mtu idb FiveGigabitEthernet3/0/15
-        p19 = re.compile(r'^plaintext mtu +(?P<plaintext_mtu>\d+),.* +(?P<path_mtu>\d+), ipv6 mtu +(?P<ip_mtu>\d+),.*idb +(?P<ip_mtu_idb>[\w\/]+)$')
+        p19 = regex_engine.compile(r'^plaintext mtu +(?P<plaintext_mtu>\d+),.* +(?P<path_mtu>\d+), ipv6 mtu +(?P<ip_mtu>\d+),.*idb +(?P<ip_mtu_idb>[\w\/]+)$')
 
         #  remote crypto endpt.: FF02::5
-        p20 = re.compile(r'^remote crypto endpt.: (?P<remote_crypto_endpt>[\w\.\:]+)$')
+        p20 = regex_engine.compile(r'^remote crypto endpt.: (?P<remote_crypto_endpt>[\w\.\:]+)$')
 
         # local crypto endpt.: 1.1.1.2, remote crypto endpt.: 1.1.1.1 
-        p21 = re.compile(r'^local crypto endpt.: +(?P<local_crypto_endpt>[\w\.\:]+),+\s+.+ (?P<remote_crypto_endpt>[\w\.\:]+)$')
+        p21 = regex_engine.compile(r'^local crypto endpt.: +(?P<local_crypto_endpt>[\w\.\:]+),+\s+.+ (?P<remote_crypto_endpt>[\w\.\:]+)$')
 
         # plaintext mtu 1438, path mtu 1500, ip mtu 1500, ip mtu idb GigabitEthernet3 
-        p22 = re.compile(r'^plaintext mtu +(?P<plaintext_mtu>\d+),.* +(?P<path_mtu>\d+), ip mtu +(?P<ip_mtu>\d+),.*idb +(?P<ip_mtu_idb>[\w\/]+)$')
+        p22 = regex_engine.compile(r'^plaintext mtu +(?P<plaintext_mtu>\d+),.* +(?P<path_mtu>\d+), ip mtu +(?P<ip_mtu>\d+),.*idb +(?P<ip_mtu_idb>[\w\/]+)$')
 
         # current outbound spi: 0x397C36EE(964441838) 
-        p23 = re.compile(r'^current outbound spi: +(?P<current_outbound_spi>\S+)$')
+        p23 = regex_engine.compile(r'^current outbound spi: +(?P<current_outbound_spi>\S+)$')
 
         # PFS (Y/N): N, DH group: none 
-        p24 = re.compile(r'^PFS.*: +(?P<pfs>[Y|N]+).*: +(?P<dh_group>\w+)$')
+        p24 = regex_engine.compile(r'^PFS.*: +(?P<pfs>[Y|N]+).*: +(?P<dh_group>\w+)$')
 
         # inbound esp sas: 
-        p25 = re.compile(r'^inbound esp sas:$')
+        p25 = regex_engine.compile(r'^inbound esp sas:$')
 
         # spi: 0x658F7C11(1703902225) 
-        p26 = re.compile(r'^spi: +(?P<spi>[\S]+)$')
+        p26 = regex_engine.compile(r'^spi: +(?P<spi>[\S]+)$')
 
         # transform: esp-256-aes esp-sha256-hmac , 
-        p27 = re.compile(r'^transform: +(?P<transform>[\S]+).*,$')
+        p27 = regex_engine.compile(r'^transform: +(?P<transform>[\S]+).*,$')
 
         # in use settings ={Tunnel, }
-        p28 = re.compile(r'^in use settings =+\{(?P<in_use_settings>[\w\,\s]+)\}$')
+        p28 = regex_engine.compile(r'^in use settings =+\{(?P<in_use_settings>[\w\,\s]+)\}$')
 
         # conn id: 2076, flow_id: CSR:76, sibling_flags FFFFFFFF80000048, crypto map: vpn-crypto-map
-        p29 = re.compile(r'^conn id: +(?P<conn_id>\d+), +flow_id: +(?P<flow_id>\w+):(?P<flow_id_val>\d+), +sibling_flags +(?P<sibling_flags>[\w\d]+), +crypto map: +(?P<crypto_map>[\w\-\d\/]+),+ initiator : +(?P<initiator_flag>[\w]+)$')
+        p29 = regex_engine.compile(r'^conn id: +(?P<conn_id>\d+), +flow_id: +(?P<flow_id>\w+):(?P<flow_id_val>\d+), +sibling_flags +(?P<sibling_flags>[\w\d]+), +crypto map: +(?P<crypto_map>[\w\-\d\/]+),+ initiator : +(?P<initiator_flag>[\w]+)$')
 
         # sa timing: remaining key lifetime (k/sec): (4607999/83191) 
-        p30 = re.compile(r'^sa timing: remaining key lifetime \(sec\): +(?P<remaining_key_lifetime>\S+)$')
+        p30 = regex_engine.compile(r'^sa timing: remaining key lifetime \(sec\): +(?P<remaining_key_lifetime>\S+)$')
 
         # Kilobyte Volume Rekey has been disabled
-        p31 = re.compile(r'^Kilobyte Volume Rekey has been +(?P<kilobyte_volume_rekey>[disabled|enabled]+)$')
+        p31 = regex_engine.compile(r'^Kilobyte Volume Rekey has been +(?P<kilobyte_volume_rekey>[disabled|enabled]+)$')
 
         # replay detection support: Y
-        p32 = re.compile(r'^replay detection support: +(?P<replay_detection_support>\w+)$')
+        p32 = regex_engine.compile(r'^replay detection support: +(?P<replay_detection_support>\w+)$')
 
         # Status: ACTIVE(ACTIVE) 
-        p33 = re.compile(r'^Status: +(?P<status>\S+)$')
+        p33 = regex_engine.compile(r'^Status: +(?P<status>\S+)$')
 
         # inbound ah sas:
-        p34 = re.compile(r'^inbound ah sas:$')
+        p34 = regex_engine.compile(r'^inbound ah sas:$')
 
         # inbound pcp sas:
-        p35 = re.compile(r'^inbound pcp sas:$')
+        p35 = regex_engine.compile(r'^inbound pcp sas:$')
 
         # outbound esp sas: 
-        p36 = re.compile(r'^outbound esp sas:$')
+        p36 = regex_engine.compile(r'^outbound esp sas:$')
 
         # outbound ah sas:
-        p37 = re.compile(r'^outbound ah sas:$')
+        p37 = regex_engine.compile(r'^outbound ah sas:$')
 
         # outbound pcp sas:
-        p38 = re.compile(r'^outbound pcp sas:$')
+        p38 = regex_engine.compile(r'^outbound pcp sas:$')
 
         master_dict = {}
 
@@ -9474,50 +9539,50 @@ class ShowCryptoMap(ShowCryptoMapSchema):
 
         # Crypto Map IPv4 "ikev2-cryptomap" 1 ipsec-isakmp
         # Crypto Map IPv6 "sdsd" 3 ipsec-manual
-        p1 = re.compile(r'^Crypto Map (?P<version>\S+) \"(?P<crypto_map_tag>.+)\" (?P<sequence_number>\d+)(\s+(?P<ipsec>\S+))?$')
+        p1 = regex_engine.compile(r'^Crypto Map (?P<version>\S+) \"(?P<crypto_map_tag>.+)\" (?P<sequence_number>\d+)(\s+(?P<ipsec>\S+))?$')
 
         # Peer = 172.20.249.12
         # Peer = 172.20.249.3
-        p2 = re.compile(r'^Peer = (?P<peer>\S+)$')
+        p2 = regex_engine.compile(r'^Peer = (?P<peer>\S+)$')
 
         # IKEv2 Profile: ikev2profile
-        p3 = re.compile(r'^IKEv2 Profile: (?P<ikev2_profile>\S+)$')
+        p3 = regex_engine.compile(r'^IKEv2 Profile: (?P<ikev2_profile>\S+)$')
 
         # Access-List SS dynamic: False
-        p4 = re.compile(r'^Access-List SS dynamic: (?P<access_list_ss_dynamic>\S+)$')
+        p4 = regex_engine.compile(r'^Access-List SS dynamic: (?P<access_list_ss_dynamic>\S+)$')
 
         # Extended IP access list 102
-        p5 = re.compile(r'^Extended IP access list (?P<extended_ip_access_list>\d+)$')
+        p5 = regex_engine.compile(r'^Extended IP access list (?P<extended_ip_access_list>\d+)$')
 
         # Current peer: 172.20.249.12
-        p6 = re.compile(r'^Current peer: (?P<current_peer>\S+)$')
+        p6 = regex_engine.compile(r'^Current peer: (?P<current_peer>\S+)$')
 
         # Security association lifetime: 4608000 kilobytes/3600 seconds
-        p7 = re.compile(r'^Security association lifetime: (?P<kilobytes>\d+) kilobytes\/(?P<seconds>\d+) seconds$')
+        p7 = regex_engine.compile(r'^Security association lifetime: (?P<kilobytes>\d+) kilobytes\/(?P<seconds>\d+) seconds$')
 
         # Dualstack (Y/N): N
-        p8 = re.compile(r'^Dualstack \(Y\/N\): (?P<dualstack>\S+)$')
+        p8 = regex_engine.compile(r'^Dualstack \(Y\/N\): (?P<dualstack>\S+)$')
 
         # Responder-Only (Y/N): N
-        p9 = re.compile(r'^Responder-Only \(Y\/N\): (?P<responder_only>\S+)$')
+        p9 = regex_engine.compile(r'^Responder-Only \(Y\/N\): (?P<responder_only>\S+)$')
 
         # PFS (Y/N): N
-        p10 = re.compile(r'^PFS \(Y\/N\): (?P<pfs>\S+)$')
+        p10 = regex_engine.compile(r'^PFS \(Y\/N\): (?P<pfs>\S+)$')
 
         # Mixed-mode : Disabled
-        p11 = re.compile(r'^Mixed-mode : (?P<mixed_mode>\S+)$')
+        p11 = regex_engine.compile(r'^Mixed-mode : (?P<mixed_mode>\S+)$')
 
         # Transform sets={
-        p12 = re.compile(r'^Transform sets=\{$')
+        p12 = regex_engine.compile(r'^Transform sets=\{$')
 
         # aes256-sha1:  { esp-aes esp-sha-hmac  } ,
-        p13 = re.compile(r'^(?P<key>\S+):\s+\{\s+(?P<value>.+)\}.+$')
+        p13 = regex_engine.compile(r'^(?P<key>\S+):\s+\{\s+(?P<value>.+)\}.+$')
 
         # Interfaces using crypto map ikev2-cryptomap:
-        p14 = re.compile(r'^Interfaces using crypto map (?P<crypto_map_tag>.+):$')
+        p14 = regex_engine.compile(r'^Interfaces using crypto map (?P<crypto_map_tag>.+):$')
 
         #     Vlan1
-        p15 = re.compile(r'^(?P<interface>[\w\/\.]+)$')
+        p15 = regex_engine.compile(r'^(?P<interface>[\w\/\.]+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -9660,7 +9725,7 @@ class ShowCryptoPkiCertificatesPemServer(ShowCryptoPkiCertificatesPemServerSchem
         
         # % Self-signed CA certificate:
         # % General Purpose Certificate:
-        p1 = re.compile(r'^% +(?P<key_name>.*):$')
+        p1 = regex_engine.compile(r'^% +(?P<key_name>.*):$')
 
         key_name = None
     
@@ -15,14 +15,12 @@ IOSXE parsers for the following show commands:
    * show crypto gdoi ks coop identifier detail
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
 # Genie Libs
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -62,16 +60,16 @@ class ShowCryptoGdoiKsCoopVersion(ShowCryptoGdoiKsCoopVersionSchema):
         coop_dict = {}
 
         # Cooperative key server infra Version : 2.0.0 
-        p1 = re.compile(r'Cooperative key server infra Version\s+:\s+(?P<coop_ver>\S+)$')
+        p1 = regex_engine.compile(r'Cooperative key server infra Version\s+:\s+(?P<coop_ver>\S+)$')
 
         # Client : KS_POLICY_CLIENT        Version : 2.0.0 
-        p2 = re.compile(r'Client\s+:\s+KS_POLICY_CLIENT\s+Version\s+:\s+(?P<ks_pol_ver>\S+)$')
+        p2 = regex_engine.compile(r'Client\s+:\s+KS_POLICY_CLIENT\s+Version\s+:\s+(?P<ks_pol_ver>\S+)$')
 
         # Client : GROUP_MEMBER_CLIENT     Version : 2.0.1 
-        p3 = re.compile(r'Client\s+:\s+GROUP_MEMBER_CLIENT\s+Version\s+:\s+(?P<gm_ver>\S+)$')
+        p3 = regex_engine.compile(r'Client\s+:\s+GROUP_MEMBER_CLIENT\s+Version\s+:\s+(?P<gm_ver>\S+)$')
 
         # Client : SID_CLIENT              Version : 1.0.1 
-        p4 = re.compile(r'Client\s+:\s+SID_CLIENT\s+Version\s+:\s+(?P<sid_ver>\S+)$')
+        p4 = regex_engine.compile(r'Client\s+:\s+SID_CLIENT\s+Version\s+:\s+(?P<sid_ver>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -226,120 +224,120 @@ class ShowCryptoGdoi(ShowCryptoGdoiSchema):
             output = self.device.execute(self.cli_command[0])
 
         # Group Name               : getvpn1
-        p1 = re.compile(r"^Group Name +: +(?P<group_name>\w+)$")
+        p1 = regex_engine.compile(r"^Group Name +: +(?P<group_name>\w+)$")
 
         # Group Identity           : 1223
-        p2 = re.compile(r"^Group Identity +: +(?P<group_identity>\w+)$")
+        p2 = regex_engine.compile(r"^Group Identity +: +(?P<group_identity>\w+)$")
 
         # Group Type               : GDOI (ISAKMP)
         # Group Type               : G-IKEv2 (IKEv2)
-        p3 = re.compile(r"^Group Type +: +(?P<group_type>[\w\d\S\-\s]+)$")
+        p3 = regex_engine.compile(r"^Group Type +: +(?P<group_type>[\w\d\S\-\s]+)$")
 
         # Crypto Path              : ipv4
-        p4 = re.compile(r"^Crypto Path +: +(?P<crypto_path>\w+)$")
+        p4 = regex_engine.compile(r"^Crypto Path +: +(?P<crypto_path>\w+)$")
 
         # Key Management Path      : ipv4
-        p5 = re.compile(r"^Key Management Path +: +(?P<key_management_path>\w+)$")
+        p5 = regex_engine.compile(r"^Key Management Path +: +(?P<key_management_path>\w+)$")
 
         # Rekeys received          : 25
-        p6 = re.compile(r"^Rekeys received +: +(?P<rekeys_received>\w+)$")
+        p6 = regex_engine.compile(r"^Rekeys received +: +(?P<rekeys_received>\w+)$")
 
         # IPSec SA Direction       : Both
-        p7 = re.compile(r"^IPSec SA Direction +: +(?P<ipsec_sa_direction>\w+)$")
+        p7 = regex_engine.compile(r"^IPSec SA Direction +: +(?P<ipsec_sa_direction>\w+)$")
 
         # Group Server list       : 1.1.1.1
-        p8 = re.compile(r"^Group Server list +: +(?P<group_server_list>[\d\.]+)$")
+        p8 = regex_engine.compile(r"^Group Server list +: +(?P<group_server_list>[\d\.]+)$")
 
         # Group Member Information For Group getvpn1:
-        p9 = re.compile(r"^Group Member.* +(?P<group>\w+):$")
+        p9 = regex_engine.compile(r"^Group Member.* +(?P<group>\w+):$")
 
         # ACL Received From KS     : gdoi_group_getvpn1_temp_acl
-        p10 = re.compile(r"^ACL Received.* +(?P<acl_received_from_ks>\w+)$")
+        p10 = regex_engine.compile(r"^ACL Received.* +(?P<acl_received_from_ks>\w+)$")
 
         # Group member             : 3.3.1.1         vrf: None
-        p11 = re.compile(r"^Group member.* +: +(?P<group_member>[\d\.]+) +vrf: +(?P<vrf>[\w]+)$")
+        p11 = regex_engine.compile(r"^Group member.* +: +(?P<group_member>[\d\.]+) +vrf: +(?P<vrf>[\w]+)$")
 
         # Local addr/port       : 3.3.1.1/848
-        p12 = re.compile(r"^Local addr\/port +: +(?P<local_addr>[\d\.]+)\/(?P<local_addr_port>[\d]+)$")
+        p12 = regex_engine.compile(r"^Local addr\/port +: +(?P<local_addr>[\d\.]+)\/(?P<local_addr_port>[\d]+)$")
 
         # Remote addr/port      : 1.1.1.1/848
-        p13 = re.compile(r"^Remote addr\/port +: +(?P<remote_addr>[\d\.]+)\/(?P<remote_addr_port>[\d]+)$")
+        p13 = regex_engine.compile(r"^Remote addr\/port +: +(?P<remote_addr>[\d\.]+)\/(?P<remote_addr_port>[\d]+)$")
 
         # fvrf/ivrf             : None/None
-        p14 = re.compile(r"^fvrf\/ivrf +: +(?P<fvrf>\w+)\/(?P<ivrf>\w+)$")
+        p14 = regex_engine.compile(r"^fvrf\/ivrf +: +(?P<fvrf>\w+)\/(?P<ivrf>\w+)$")
 
         # Version               : 1.0.26
-        p15 = re.compile(r"^Version +: +(?P<version>[\d\.]+)$")
+        p15 = regex_engine.compile(r"^Version +: +(?P<version>[\d\.]+)$")
 
         # Registration status   : Registered
-        p16 = re.compile(r"^Registration.* +(?P<registration>\w+)$")
+        p16 = regex_engine.compile(r"^Registration.* +(?P<registration>\w+)$")
 
         # Registered with       : 1.1.1.1
-        p17 = re.compile(r"^Registered.* +(?P<server_ip>[\d\.]+)$")
+        p17 = regex_engine.compile(r"^Registered.* +(?P<server_ip>[\d\.]+)$")
 
         # Re-registers in       : 449 sec
-        p18 = re.compile(r"^Re.* +(?P<re_register_time_sec>[\d]+) +sec$")
+        p18 = regex_engine.compile(r"^Re.* +(?P<re_register_time_sec>[\d]+) +sec$")
 
         # Succeeded registration: 1
-        p19 = re.compile(r"^Succeeded.* +(?P<succeeded_registration_count>\d+)$")
+        p19 = regex_engine.compile(r"^Succeeded.* +(?P<succeeded_registration_count>\d+)$")
 
         # Attempted registration: 1
-        p20 = re.compile(r"^Attempted.* +(?P<attempted_registration_count>\d+)$")
+        p20 = regex_engine.compile(r"^Attempted.* +(?P<attempted_registration_count>\d+)$")
 
         # Last rekey from       : UNKNOWN
         # Last rekey from       : 1.1.1.1
-        p21 = re.compile(r"^Last rekey from.* +(?P<last_rekey_server>[\w\d\.]+)$")
+        p21 = regex_engine.compile(r"^Last rekey from.* +(?P<last_rekey_server>[\w\d\.]+)$")
 
         # Last rekey seq num    : 0
-        p22 = re.compile(r"^Last rekey seq.* +(?P<last_rekey_seq_num>\d+)$")
+        p22 = regex_engine.compile(r"^Last rekey seq.* +(?P<last_rekey_seq_num>\d+)$")
 
         # Rekey ACKs sent       : 25
-        p23 = re.compile(r"^Rekey ACKs sent.* +(?P<rekey_acks_sent>\d+)$")
+        p23 = regex_engine.compile(r"^Rekey ACKs sent.* +(?P<rekey_acks_sent>\d+)$")
 
         # Rekey Rcvd(hh:mm:ss)  : 00:01:30
-        p24 = re.compile(r"^Rekey Rcvd.* +(?P<rekey_received_time>[\d\:]+)$")
+        p24 = regex_engine.compile(r"^Rekey Rcvd.* +(?P<rekey_received_time>[\d\:]+)$")
 
         # PFS Rekey received    : 0
-        p25 = re.compile(r"^PFS.* +(?P<pfs_rekey_received>\d+)$")
+        p25 = regex_engine.compile(r"^PFS.* +(?P<pfs_rekey_received>\d+)$")
 
         # DP Error Monitoring   : OFF
-        p26 = re.compile(r"^DP.* +(?P<dp_error_monitoring>\w+)$")
+        p26 = regex_engine.compile(r"^DP.* +(?P<dp_error_monitoring>\w+)$")
 
         # IPSEC init reg executed    : 0
-        p27 = re.compile(r"^IPSEC init reg executed.* +(?P<ipsec_init_reg_executed>\d+)$")
+        p27 = regex_engine.compile(r"^IPSEC init reg executed.* +(?P<ipsec_init_reg_executed>\d+)$")
 
         # IPSEC init reg postponed   : 0
-        p28 = re.compile(r"^IPSEC init reg postponed.* +(?P<ipsec_init_reg_postponed>\d+)$")
+        p28 = regex_engine.compile(r"^IPSEC init reg postponed.* +(?P<ipsec_init_reg_postponed>\d+)$")
 
         # Active TEK Number     : 2
-        p29 = re.compile(r"^Active.* +(?P<active_tek_num>\d+)$")
+        p29 = regex_engine.compile(r"^Active.* +(?P<active_tek_num>\d+)$")
 
         # SA Track (OID/status) : disabled
-        p30 = re.compile(r"^SA.* +(?P<sa_track>[disabled|enabled]+)$")
+        p30 = regex_engine.compile(r"^SA.* +(?P<sa_track>[disabled|enabled]+)$")
 
         # Fail-Close Revert : Disabled
-        p31 = re.compile(r"^Fail.* +(?P<fail_close_revert>[Disabled|Enabled]+)$")
+        p31 = regex_engine.compile(r"^Fail.* +(?P<fail_close_revert>[Disabled|Enabled]+)$")
 
         # allowable rekey cipher: any
-        p32 = re.compile(r"^allowable.* +(?P<allowable_rekey_cipher>\w+)$")
+        p32 = regex_engine.compile(r"^allowable.* +(?P<allowable_rekey_cipher>\w+)$")
 
         # allowable rekey hash  : any
-        p33 = re.compile(r"^allowable rekey hash.* +(?P<allowable_rekey_hash>\w+)$")
+        p33 = regex_engine.compile(r"^allowable rekey hash.* +(?P<allowable_rekey_hash>\w+)$")
 
         # allowable transformtag: any ESP
-        p34 = re.compile(r"^allowable transformtag: +(?P<allowable_transformtag>[\w\s]+)$")
+        p34 = regex_engine.compile(r"^allowable transformtag: +(?P<allowable_transformtag>[\w\s]+)$")
 
         # Total received        : 25
-        p35 = re.compile(r"^Total received.* +(?P<total_received>\d+)$")
+        p35 = regex_engine.compile(r"^Total received.* +(?P<total_received>\d+)$")
 
         # After latest register : 25
-        p36 = re.compile(r"^After latest register.* +(?P<after_latest_register>\d+)$")
+        p36 = regex_engine.compile(r"^After latest register.* +(?P<after_latest_register>\d+)$")
 
         # Rekey Acks sents      : 25
-        p37 = re.compile(r"^Rekey Acks sents.* +(?P<rekey_acks_sents>\d+)$")
+        p37 = regex_engine.compile(r"^Rekey Acks sents.* +(?P<rekey_acks_sents>\d+)$")
 
         # ACL Downloaded From KS 1.1.1.1:
-        p38 = re.compile(r"^ACL Downloaded From KS.* +(?P<ks_server>[\d\.]+):$")
+        p38 = regex_engine.compile(r"^ACL Downloaded From KS.* +(?P<ks_server>[\d\.]+):$")
 
         # access-list   deny ip host 11.23.33.33 host 24.54.55.55
         # access-list   deny ip host 41.23.32.37 host 44.58.59.55
@@ -363,64 +361,64 @@ class ShowCryptoGdoi(ShowCryptoGdoiSchema):
         # access-list   permit ip 25.25.0.0 0.0.255.255 15.15.0.0 0.0.255.255
         # access-list   permit ip 15.15.0.0 0.0.255.255 25.25.0.0 0.0.255.255
         # access-list   permit ip 16.16.0.0 0.0.255.255 26.26.0.0 0.0.255.255
-        p39 = re.compile(r"^access-list.*$")
+        p39 = regex_engine.compile(r"^access-list.*$")
 
         # Rekey Transport Type     : Unicast
-        p40 = re.compile(r"^Rekey Transport Type.*: (?P<rekey_transport_type>\w+)$")
+        p40 = regex_engine.compile(r"^Rekey Transport Type.*: (?P<rekey_transport_type>\w+)$")
 
         # Lifetime (secs)          : 1109
-        p41 = re.compile(r"^Lifetime.*: (?P<lifetime>\d+)$")
+        p41 = regex_engine.compile(r"^Lifetime.*: (?P<lifetime>\d+)$")
 
         # Encrypt Algorithm        : AES
-        p42 = re.compile(r"^Encrypt Algorithm.*: (?P<encrypt_algorithm>\w+)$")
+        p42 = regex_engine.compile(r"^Encrypt Algorithm.*: (?P<encrypt_algorithm>\w+)$")
 
         # Key Size                 : 256
-        p43 = re.compile(r"^Key Size.*: (?P<key_size>\d+)$")
+        p43 = regex_engine.compile(r"^Key Size.*: (?P<key_size>\d+)$")
 
         # Sig Hash Algorithm       : HMAC_AUTH_SHA
-        p44 = re.compile(r"^Sig Hash Algorithm.*: (?P<sig_hash_algorithm>\w+)$")
+        p44 = regex_engine.compile(r"^Sig Hash Algorithm.*: (?P<sig_hash_algorithm>\w+)$")
 
         # Sig Key Length (bits)    : 4400
-        p45 = re.compile(r"^Sig Key Length.*: (?P<sig_key_length>\w+)$")
+        p45 = regex_engine.compile(r"^Sig Key Length.*: (?P<sig_key_length>\w+)$")
 
         # GigabitEthernet0/0/1:
-        p46 = re.compile(r"^(?P<interface>[\S]+):$")
+        p46 = regex_engine.compile(r"^(?P<interface>[\S]+):$")
 
         # spi: 0x5A69F51E(1516893470)
-        p47 = re.compile(r"^spi.* +(?P<spi>[\w\S]+)$")
+        p47 = regex_engine.compile(r"^spi.* +(?P<spi>[\w\S]+)$")
 
         # transform: esp-256-aes esp-sha256-hmac
-        p48 = re.compile(r"^transform.*: +(?P<transform>[\w\S\s]+)$")
+        p48 = regex_engine.compile(r"^transform.*: +(?P<transform>[\w\S\s]+)$")
 
         # sa timing:remaining key lifetime (sec): (510)
-        p49 = re.compile(r"^sa timing.*\(+(?P<sa_remaining_key_lifetime>\d+)+\)$")
+        p49 = regex_engine.compile(r"^sa timing.*\(+(?P<sa_remaining_key_lifetime>\d+)+\)$")
 
         # Anti-Replay(Counter Based) : 64
-        p50 = re.compile(r"^Anti-Replay.*: +(?P<anti_replay_count>\d+)$")
+        p50 = regex_engine.compile(r"^Anti-Replay.*: +(?P<anti_replay_count>\d+)$")
 
         # tag method : disabled
-        p51 = re.compile(r"^tag method.*: +(?P<tag_method>[disabled|enabled]+)$")
+        p51 = regex_engine.compile(r"^tag method.*: +(?P<tag_method>[disabled|enabled]+)$")
 
         # alg key size: 32 (bytes)
-        p52 = re.compile(r"^alg key.*: +(?P<alg_key_size_bytes>[\d]+) +\(bytes\)$")
+        p52 = regex_engine.compile(r"^alg key.*: +(?P<alg_key_size_bytes>[\d]+) +\(bytes\)$")
 
         # sig key size: 32 (bytes)
-        p53 = re.compile(r"^sig key.*: +(?P<sig_key_size_bytes>[\d]+) +\(bytes\)$")
+        p53 = regex_engine.compile(r"^sig key.*: +(?P<sig_key_size_bytes>[\d]+) +\(bytes\)$")
 
         # encaps: ENCAPS_TUNNEL
-        p54 = re.compile(r"^encaps.*: +(?P<encaps>[\w\S]+)$")
+        p54 = regex_engine.compile(r"^encaps.*: +(?P<encaps>[\w\S]+)$")
 
         # KGS POLICY:
-        p55 = re.compile(r"^KGS POLICY:$")
+        p55 = regex_engine.compile(r"^KGS POLICY:$")
 
         # P2P POLICY:
-        p56 = re.compile(r"^P2P POLICY:$")
+        p56 = regex_engine.compile(r"^P2P POLICY:$")
 
         # REG_GM: local_addr 3.3.1.1
-        p57 = re.compile(r"^REG_GM.* +(?P<local_addr>[\d\.]+)$")
+        p57 = regex_engine.compile(r"^REG_GM.* +(?P<local_addr>[\d\.]+)$")
 
         # Unicast rekey received: 25
-        p58 = re.compile(r"^Unicast rekey .* +(?P<uncicast_rekey_received>\d+)$")
+        p58 = regex_engine.compile(r"^Unicast rekey .* +(?P<uncicast_rekey_received>\d+)$")
 
         master_dict = {}
         for line in output.splitlines():
@@ -949,61 +947,61 @@ class ShowCryptoGdoiKsPolicy(ShowCryptoGdoiKsPolicySchema):
             output = self.device.execute(self.cli_command[0])
 
         # For group getvpn1 (handle: 0x40000002) server 1.1.1.1 (handle: 0x40000002):
-        p1 = re.compile(r"^For group +(?P<group_name>\w+) +\(handle: +(?P<group_handle>[\w]+)\) +server +(?P<server_ip>[\d\.]+) +\(handle: +(?P<server_handle>\w+)\):$")
+        p1 = regex_engine.compile(r"^For group +(?P<group_name>\w+) +\(handle: +(?P<group_handle>[\w]+)\) +server +(?P<server_ip>[\d\.]+) +\(handle: +(?P<server_handle>\w+)\):$")
 
         # # of teks : 2  Seq num : 0
-        p2 = re.compile(r"^# of teks : +(?P<teks_num>\d+) + Seq num : +(?P<seq_num>\d+)$")
+        p2 = regex_engine.compile(r"^# of teks : +(?P<teks_num>\d+) + Seq num : +(?P<seq_num>\d+)$")
 
         # KEK POLICY (transport type : Unicast)
-        p3 = re.compile(r"^KEK POLICY +\(transport type : +(?P<transport_type>\w+)\)$")
+        p3 = regex_engine.compile(r"^KEK POLICY +\(transport type : +(?P<transport_type>\w+)\)$")
 
         # spi : 0xEEB0E9A2BBD4C71AF1034F6B24EB8022
-        p4 = re.compile(r"^spi : +(?P<spi>\w+)$")
+        p4 = regex_engine.compile(r"^spi : +(?P<spi>\w+)$")
 
         # management alg     : disabled      encrypt alg           : AES
-        p5 = re.compile(r"^management alg.*: +(?P<management_alg>[\disbaled|enabled]+) +encrypt alg.*: +(?P<encrypt_alg>\w+)$")
+        p5 = regex_engine.compile(r"^management alg.*: +(?P<management_alg>[\disbaled|enabled]+) +encrypt alg.*: +(?P<encrypt_alg>\w+)$")
 
         # crypto iv length   : 16            key size              : 32
-        p6 = re.compile(r"^crypto iv length.*: +(?P<crypto_iv_length>\d+) +key size.*: +(?P<key_size>\d+)$")
+        p6 = regex_engine.compile(r"^crypto iv length.*: +(?P<crypto_iv_length>\d+) +key size.*: +(?P<key_size>\d+)$")
 
         # orig life(sec)     : 1200          remaining life(sec)   : 787
-        p7 = re.compile(r"^orig life.*: +(?P<orig_life_secs>\d+) +remaining.*: +(?P<remaining_life_secs>\d+)$")
+        p7 = regex_engine.compile(r"^orig life.*: +(?P<orig_life_secs>\d+) +remaining.*: +(?P<remaining_life_secs>\d+)$")
 
         # time to rekey (sec): 552
-        p8 = re.compile(r"^time to rekey.* +(?P<time_to_rekey_sec>[\d\S]+)$")
+        p8 = regex_engine.compile(r"^time to rekey.* +(?P<time_to_rekey_sec>[\d\S]+)$")
 
         # sig hash algorithm : enabled       sig key length        : 550
-        p9 = re.compile(r"^sig hash algorithm.* +(?P<sig_hash_algorithm>[enabled|disabled]+) +sig key length.* +(?P<sig_key_length>\d+)$")
+        p9 = regex_engine.compile(r"^sig hash algorithm.* +(?P<sig_hash_algorithm>[enabled|disabled]+) +sig key length.* +(?P<sig_key_length>\d+)$")
 
         # sig size           : 512
-        p10 = re.compile(r"^sig size.*: +(?P<sig_size>\d+)$")
+        p10 = regex_engine.compile(r"^sig size.*: +(?P<sig_size>\d+)$")
 
         # sig key name       : REKEYRSA
-        p11 = re.compile(r"^sig key name.*: +(?P<sig_key_name>\w+)$")
+        p11 = regex_engine.compile(r"^sig key name.*: +(?P<sig_key_name>\w+)$")
 
         # acknowledgement    : Cisco
-        p12 = re.compile(r"^acknowledgement.*: +(?P<acknowledgement>\w+)$")
+        p12 = regex_engine.compile(r"^acknowledgement.*: +(?P<acknowledgement>\w+)$")
 
         # TEK POLICY (encaps : ENCAPS_TUNNEL)
-        p13 = re.compile(r"^TEK POLICY +\(encaps : +(?P<encaps>\w+)\)$")
+        p13 = regex_engine.compile(r"^TEK POLICY +\(encaps : +(?P<encaps>\w+)\)$")
 
         # spi                : 0xEE021924
-        p14 = re.compile(r"^spi.*: +(?P<spi>\w+)$")
+        p14 = regex_engine.compile(r"^spi.*: +(?P<spi>\w+)$")
 
         # access-list        : acl1
-        p15 = re.compile(r"^access-list.*: +(?P<access_list>\w+)$")
+        p15 = regex_engine.compile(r"^access-list.*: +(?P<access_list>\w+)$")
 
         # transform          : esp-256-aes esp-sha256-hmac
-        p16 = re.compile(r"^transform.*: +(?P<transform>[\w\s\S]+)$")
+        p16 = regex_engine.compile(r"^transform.*: +(?P<transform>[\w\s\S]+)$")
 
         #  alg key size       : 32            sig key size          : 32
-        p17 = re.compile(r"^alg key size.*: +(?P<alg_key_size>\d+) +sig key size.* +(?P<sig_key_size>\d+)$")
+        p17 = regex_engine.compile(r"^alg key size.*: +(?P<alg_key_size>\d+) +sig key size.* +(?P<sig_key_size>\d+)$")
 
         # tek life(sec)      : 600           elapsed time(sec)     : 412
-        p18 = re.compile(r"^tek life.*: +(?P<tek_life_sec>\d+) +elapsed time.* +(?P<elapsed_time_sec>\d+)$")
+        p18 = regex_engine.compile(r"^tek life.*: +(?P<tek_life_sec>\d+) +elapsed time.* +(?P<elapsed_time_sec>\d+)$")
 
         # override life(sec) : 0             antireplay window size: 64
-        p19 = re.compile(r"^override life.*: +(?P<override_life_sec>\d+) +antireplay window size.*: +(?P<antireplay_window_size>\d+)$")
+        p19 = regex_engine.compile(r"^override life.*: +(?P<override_life_sec>\d+) +antireplay window size.*: +(?P<antireplay_window_size>\d+)$")
 
         master_dict = {}
         for line in output.splitlines():
@@ -1194,28 +1192,28 @@ class ShowCryptoGdoiGmDataplanCounter(ShowCryptoGdoiGmDataplanCounterSchema):
             output = self.device.execute(self.cli_command[0])
 
         # Data-plane statistics for group getvpn1:
-        p1 = re.compile(r"^Data-plane statistics for group +(?P<group_name>[\w\S]+):$")
+        p1 = regex_engine.compile(r"^Data-plane statistics for group +(?P<group_name>[\w\S]+):$")
 
         # #pkts encrypt            : 21592009    #pkts decrypt            : 0
-        p2 = re.compile(r"^#pkts encrypt.*: +(?P<pkts_encrypt>\d+) +#pkts decrypt.*: +(?P<pkts_decrypt>\d+)$")
+        p2 = regex_engine.compile(r"^#pkts encrypt.*: +(?P<pkts_encrypt>\d+) +#pkts decrypt.*: +(?P<pkts_decrypt>\d+)$")
 
         # #pkts tagged (send)      : 0        #pkts untagged (rcv)     : 0
-        p3 = re.compile(r"^#pkts tagged.*: +(?P<pkts_tagged>\d+) +#pkts untagged.*: +(?P<pkts_untagged>\d+)$")
+        p3 = regex_engine.compile(r"^#pkts tagged.*: +(?P<pkts_tagged>\d+) +#pkts untagged.*: +(?P<pkts_untagged>\d+)$")
 
         # #pkts no sa (send)       : 0        #pkts invalid sa (rcv)   : 0
-        p4 = re.compile(r"^#pkts no sa.*: +(?P<pkts_no_sa>\d+) +#pkts invalid sa.*: +(?P<pkts_untagged>\d+)$")
+        p4 = regex_engine.compile(r"^#pkts no sa.*: +(?P<pkts_no_sa>\d+) +#pkts invalid sa.*: +(?P<pkts_untagged>\d+)$")
 
         # #pkts encaps fail (send) : 0        #pkts decap fail (rcv)   : 0
-        p5 = re.compile(r"^#pkts encaps fail.*: +(?P<pkts_tagged>\d+) +#pkts decap fail.*: +(?P<pkts_untagged>\d+)$")
+        p5 = regex_engine.compile(r"^#pkts encaps fail.*: +(?P<pkts_tagged>\d+) +#pkts decap fail.*: +(?P<pkts_untagged>\d+)$")
 
         # #pkts invalid prot (rcv) : 0        #pkts verify fail (rcv)  : 0
-        p6 = re.compile(r"^#pkts invalid prot.*: +(?P<pkts_invalid_prot>\d+) +#pkts verify fail.*: +(?P<pkts_verify_fail>\d+)$")
+        p6 = regex_engine.compile(r"^#pkts invalid prot.*: +(?P<pkts_invalid_prot>\d+) +#pkts verify fail.*: +(?P<pkts_verify_fail>\d+)$")
 
         # #pkts not tagged (send)  : 0        #pkts not untagged (rcv) : 0
-        p7 = re.compile(r"^#pkts not tagged.*: +(?P<pkts_not_tagged>\d+) +#pkts not untagged.*: +(?P<pkts_not_untagged>\d+)$")
+        p7 = regex_engine.compile(r"^#pkts not tagged.*: +(?P<pkts_not_tagged>\d+) +#pkts not untagged.*: +(?P<pkts_not_untagged>\d+)$")
 
         # #pkts internal err (send): 0        #pkts internal err (rcv) : 0
-        p8 = re.compile(r"^#pkts internal err.*: +(?P<pkts_encrypt>\d+) +#pkts internal err.*: +(?P<pkts_decrypt>\d+)$")
+        p8 = regex_engine.compile(r"^#pkts internal err.*: +(?P<pkts_encrypt>\d+) +#pkts internal err.*: +(?P<pkts_decrypt>\d+)$")
 
         master_dict = {}
         for line in output.splitlines():
@@ -1333,19 +1331,19 @@ class ShowCryptoGdoiFeature(ShowCryptoGdoiFeatureSchema):
             output = self.device.execute(self.cli_command)
         
         # Group Name: getvpn1
-        p1 = re.compile(r'^Group Name:\s(?P<group>[\S]+)$')
+        p1 = regex_engine.compile(r'^Group Name:\s(?P<group>[\S]+)$')
 
         #     Key Server ID       Version   Feature Supported
-        p2 = re.compile(r'Key Server ID \s+Version\s+Feature\sSupported')
+        p2 = regex_engine.compile(r'Key Server ID \s+Version\s+Feature\sSupported')
 
         #         15.15.15.1          1.0.26         Yes
-        p3 = re.compile(r'(?P<key_server_id>\d{1,}\.\d{1,}\.\d{1,}\.\d{1,})\s+(?P<key_version>[\d\.]+)\s+(?P<key_feature_supported>[\w]+)$')
+        p3 = regex_engine.compile(r'(?P<key_server_id>\d{1,}\.\d{1,}\.\d{1,}\.\d{1,})\s+(?P<key_version>[\d\.]+)\s+(?P<key_feature_supported>[\w]+)$')
 
         #    Group Member ID     Version   Feature Supported
-        p4 = re.compile(r'Group Member ID\s+Version\s+Feature\sSupported')
+        p4 = regex_engine.compile(r'Group Member ID\s+Version\s+Feature\sSupported')
 
         #         25.25.25.1          1.0.25         Yes
-        p5 = re.compile(r'(?P<group_member_id>\d{1,}\.\d{1,}\.\d{1,}\.\d{1,})\s+(?P<group_member_version>[\d\.]+)\s+(?P<group_feature_supported>[\w]+)$')
+        p5 = regex_engine.compile(r'(?P<group_member_id>\d{1,}\.\d{1,}\.\d{1,}\.\d{1,})\s+(?P<group_member_version>[\d\.]+)\s+(?P<group_feature_supported>[\w]+)$')
 
         master_dict = {}
         server_flag = False
@@ -1562,55 +1560,55 @@ class ShowCryptoGdoiGm(ShowCryptoGdoiGmSchema):
             out = output
         
         #Group Member Information For Group getvpn1: 
-        p1 = re.compile(r'^Group +Member +Information +For +Group +(?P<group_member>[\d\w]+)')
+        p1 = regex_engine.compile(r'^Group +Member +Information +For +Group +(?P<group_member>[\d\w]+)')
         #    IPSec SA Direction       : Both
-        p2 = re.compile(r'^IPSec +SA +Direction +: +(?P<direction>[\w]+)$')
+        p2 = regex_engine.compile(r'^IPSec +SA +Direction +: +(?P<direction>[\w]+)$')
         #    ACL Received From KS     : gdoi_group_getvpn1_temp_acl
-        p3 = re.compile(r'^ACL Received From KS     : (?P<acl_recieved>[\w\d_-]+)')
+        p3 = regex_engine.compile(r'^ACL Received From KS     : (?P<acl_recieved>[\w\d_-]+)')
         #    Group member             : 3.3.1.1         vrf: None
-        p4 = re.compile(r'^Group +member +: +(?P<group_member_ip>[\d.]+) +vrf: +(?P<vrf>[\w\d]+)')        
+        p4 = regex_engine.compile(r'^Group +member +: +(?P<group_member_ip>[\d.]+) +vrf: +(?P<vrf>[\w\d]+)')        
         #       Local addr/port       : 3.3.1.1/848
-        p5 = re.compile(r'^Local addr.port +: +(?P<local_ip>[\d.]+).(?P<local_port>[\d]+)')
+        p5 = regex_engine.compile(r'^Local addr.port +: +(?P<local_ip>[\d.]+).(?P<local_port>[\d]+)')
         #       Remote addr/port      : 1.1.1.1/848
-        p6 = re.compile(r'^Remote +addr.port +: +(?P<remote_ip>[\d.]+).(?P<remote_port>[\d]+)')
+        p6 = regex_engine.compile(r'^Remote +addr.port +: +(?P<remote_ip>[\d.]+).(?P<remote_port>[\d]+)')
         #       fvrf/ivrf             : None/None
-        p7 = re.compile(r'^fvrf.ivrf +: +(?P<fvrf>[\d\w]+).(?P<ivrf>[\d\w]+)')
+        p7 = regex_engine.compile(r'^fvrf.ivrf +: +(?P<fvrf>[\d\w]+).(?P<ivrf>[\d\w]+)')
         #       Version               : 1.0.26
-        p8 = re.compile(r'^Version +: +(?P<version>[\d.]+)')
+        p8 = regex_engine.compile(r'^Version +: +(?P<version>[\d.]+)')
         #       Registration status   : Registered
-        p9 = re.compile(r'^Registration +status +: +(?P<registration_status>[\w]+)')
+        p9 = regex_engine.compile(r'^Registration +status +: +(?P<registration_status>[\w]+)')
         #       Registered with       : 1.1.1.1
-        p10 = re.compile(r'^Registered +with +: +(?P<registered_ip>[\d.]+)')
+        p10 = regex_engine.compile(r'^Registered +with +: +(?P<registered_ip>[\d.]+)')
         #       Re-registers in       : 518 sec
-        p11 = re.compile(r'^Re\-registers +in +: +(?P<registered_time>[\d\w ]+)')
+        p11 = regex_engine.compile(r'^Re\-registers +in +: +(?P<registered_time>[\d\w ]+)')
         #       Succeeded registration: 1
-        p12 = re.compile(r'^Succeeded +registration: +(?P<registration_succeded>[\d]+)')
+        p12 = regex_engine.compile(r'^Succeeded +registration: +(?P<registration_succeded>[\d]+)')
         #       Attempted registration: 1
-        p13 = re.compile(r'^Attempted +registration: +(?P<registration_attempt>[\d]+)')
+        p13 = regex_engine.compile(r'^Attempted +registration: +(?P<registration_attempt>[\d]+)')
         #       Last rekey from       : 1.1.1.1
-        p14 = re.compile(r'^Last +rekey +from +: +(?P<rekey_ip>[\d.]+)')
+        p14 = regex_engine.compile(r'^Last +rekey +from +: +(?P<rekey_ip>[\d.]+)')
         #       Last rekey seq num    : 1
-        p15 = re.compile(r'^Last +rekey +seq +num +: +(?P<rekey_seq_num>[\d]+)')
+        p15 = regex_engine.compile(r'^Last +rekey +seq +num +: +(?P<rekey_seq_num>[\d]+)')
         #       Unicast rekey received: 26
-        p16 = re.compile(r'^Unicast +rekey +received: +(?P<unicast_rekeys_recieved>[\d]+)')
+        p16 = regex_engine.compile(r'^Unicast +rekey +received: +(?P<unicast_rekeys_recieved>[\d]+)')
         #       Rekey ACKs sent       : 26
-        p17 = re.compile(r'^Rekey +ACKs +sent +: +(?P<ack_unicast_key>[\d]+)')
+        p17 = regex_engine.compile(r'^Rekey +ACKs +sent +: +(?P<ack_unicast_key>[\d]+)')
         #       Rekey Rcvd(hh:mm:ss)  : 00:00:19
-        p18 = re.compile(r'^Rekey +Rcvd.hh:mm:ss. +: +(?P<rekey_recieved_time>[\d:]+)')
+        p18 = regex_engine.compile(r'^Rekey +Rcvd.hh:mm:ss. +: +(?P<rekey_recieved_time>[\d:]+)')
         #       PFS Rekey received    : 0
-        p19 = re.compile(r'^PFS +Rekey +received +: +(?P<pfs_rekey_recieved>[\d]+)')
+        p19 = regex_engine.compile(r'^PFS +Rekey +received +: +(?P<pfs_rekey_recieved>[\d]+)')
         #       DP Error Monitoring   : OFF
-        p20 = re.compile(r'^DP +Error +Monitoring +: +(?P<dp_error_monitoring>[\w]+)')
+        p20 = regex_engine.compile(r'^DP +Error +Monitoring +: +(?P<dp_error_monitoring>[\w]+)')
         #       IPSEC init reg executed    : 0
-        p21 = re.compile(r'^IPSEC +init +reg +executed +: +(?P<ipsec_init_reg_executed>[\d]+)')
+        p21 = regex_engine.compile(r'^IPSEC +init +reg +executed +: +(?P<ipsec_init_reg_executed>[\d]+)')
         #       IPSEC init reg postponed   : 0
-        p22 = re.compile(r'^IPSEC +init +reg +postponed +: +(?P<ipsec_init_reg_postponed>[\d]+)')
+        p22 = regex_engine.compile(r'^IPSEC +init +reg +postponed +: +(?P<ipsec_init_reg_postponed>[\d]+)')
         #       Active TEK Number     : 2
-        p23 = re.compile(r'^Active +TEK +Number +: +(?P<active_tek_number>[\d]+)')
+        p23 = regex_engine.compile(r'^Active +TEK +Number +: +(?P<active_tek_number>[\d]+)')
         #       SA Track (OID/status) : disabled
-        p24 = re.compile(r'^SA +Track +.OID.status. +: +(?P<sa_track_status>[\w]+)')
+        p24 = regex_engine.compile(r'^SA +Track +.OID.status. +: +(?P<sa_track_status>[\w]+)')
         #       Fail-Close Revert : Disabled
-        p25 = re.compile(r'^Fail.Close +Revert +: +(?P<fail_close_revert>[\w]+)')
+        p25 = regex_engine.compile(r'^Fail.Close +Revert +: +(?P<fail_close_revert>[\w]+)')
 
         # initial return dictionary
         ret_dict = {}
@@ -1839,32 +1837,32 @@ class ShowCryptoGdoiKs(ShowCryptoGdoiKsSchema):
             output = self.device.execute(self.cli_command)
         
         #Total group members registered to this box: 2
-        p1 = re.compile(r'^Total +group +members +registered +to +this +box: +(?P<total_group_members>[\d]+)$')
+        p1 = regex_engine.compile(r'^Total +group +members +registered +to +this +box: +(?P<total_group_members>[\d]+)$')
         #Key Server Information For Group getvpn1:
-        p2 = re.compile(r'^Key +Server +Information +For +Group +(?P<key_server_group_name>[\w\d]+):$')
+        p2 = regex_engine.compile(r'^Key +Server +Information +For +Group +(?P<key_server_group_name>[\w\d]+):$')
         #    Group Name               : getvpn1
-        p3 = re.compile(r'Group +Name +: +(?P<group_name>[\w\d]+)$')
+        p3 = regex_engine.compile(r'Group +Name +: +(?P<group_name>[\w\d]+)$')
         #    Re-auth on new CRL       : Disabled
-        p4 = re.compile(r'^Re.auth +on +new +CRL +: +(?P<reauth_status>[\w]+)$')
+        p4 = regex_engine.compile(r'^Re.auth +on +new +CRL +: +(?P<reauth_status>[\w]+)$')
         #    Group Identity           : 1223
-        p5 = re.compile(r'^Group +Identity +: +(?P<group_identity>[\d]+)$')
+        p5 = regex_engine.compile(r'^Group +Identity +: +(?P<group_identity>[\d]+)$')
         #    Group Type               : GDOI (ISAKMP)
-        p6 = re.compile(r'^Group +Type +: +(?P<group_type>[\w \(\)]+)$')
+        p6 = regex_engine.compile(r'^Group +Type +: +(?P<group_type>[\w \(\)]+)$')
         #    Group Members            : 2
-        p7 = re.compile(r'^Group +Members +: +(?P<group_members>[\d]+)$')
+        p7 = regex_engine.compile(r'^Group +Members +: +(?P<group_members>[\d]+)$')
         #    Rekey Acknowledgement Cfg: Cisco
-        p8 = re.compile(r'^Rekey +Acknowledgement +Cfg: +(?P<rekey_ack_config>[\w]+)$')
+        p8 = regex_engine.compile(r'^Rekey +Acknowledgement +Cfg: +(?P<rekey_ack_config>[\w]+)$')
         #    IPSec SA Direction       : Both
-        p9 = re.compile(r'^IPSec +SA +Direction +: +(?P<direction>[\w]+)$')
+        p9 = regex_engine.compile(r'^IPSec +SA +Direction +: +(?P<direction>[\w]+)$')
         #    IP D3P Window            : Disabled
-        p10 = re.compile(r'IP +D3P +Window +: +(?P<d3p_window_status>[\w]+)$')
+        p10 = regex_engine.compile(r'IP +D3P +Window +: +(?P<d3p_window_status>[\w]+)$')
         #    Split Resiliency Factor  : 0
-        p11 = re.compile(r'^Split +Resiliency +Factor +: +(?P<sr_factor>[\d]+)$')
+        p11 = regex_engine.compile(r'^Split +Resiliency +Factor +: +(?P<sr_factor>[\d]+)$')
         #    CKM status               : Disabled
-        p12 = re.compile(r'^CKM +status +: +(?P<ckm_status>[\w]+)$')
+        p12 = regex_engine.compile(r'^CKM +status +: +(?P<ckm_status>[\w]+)$')
         #    ACL Configured:
         #        access-list acl1
-        p13 = re.compile(r'^access.list +(?P<acl_name>[\w\d]+)$')
+        p13 = regex_engine.compile(r'^access.list +(?P<acl_name>[\w\d]+)$')
 
         ret_dict = {}
   
@@ -1996,10 +1994,10 @@ class ShowCryptoGdoiRekeySa(ShowCryptoGdoiRekeySaSchema):
             output = self.device.execute(self.cli_command)
         
         # dst             src             conn-id         status
-        p0 = re.compile(r'dst +src +conn.id +status')
+        p0 = regex_engine.compile(r'dst +src +conn.id +status')
 
         # 3.3.1.1         1.1.1.1         1712            ACTIVE
-        p1 = re.compile(r'(?P<dst_ip>[\d.]+) +(?P<src_ip>[\d.]+) +(?P<connection_id>[\d]+) +(?P<rekey_status>[\w]+)')
+        p1 = regex_engine.compile(r'(?P<dst_ip>[\d.]+) +(?P<src_ip>[\d.]+) +(?P<connection_id>[\d]+) +(?P<rekey_status>[\w]+)')
         
         ret_dict = {}
   
@@ -2077,58 +2075,58 @@ class ShowCryptoGdoiRekeySaDetail(ShowCryptoGdoiRekeySaDetailSchema):
             output = self.device.execute(self.cli_command)
         
         # num_active = 1
-        p1 = re.compile(r'num_active += +(?P<num_active>[\d]+)')
+        p1 = regex_engine.compile(r'num_active += +(?P<num_active>[\d]+)')
         
         # num_malloc = 107
-        p2 = re.compile(r'num_malloc += +(?P<num_malloc>[\d]+)')
+        p2 = regex_engine.compile(r'num_malloc += +(?P<num_malloc>[\d]+)')
         
         # num_free = 105
-        p3 = re.compile(r'num_free += +(?P<num_free>[\d]+)')
+        p3 = regex_engine.compile(r'num_free += +(?P<num_free>[\d]+)')
         
         #  KEK POLICY (transport type : Unicast)
-        p4 = re.compile(r'KEK +POLICY +.transport +type +: +(?P<transport_type>[\w]+).')
+        p4 = regex_engine.compile(r'KEK +POLICY +.transport +type +: +(?P<transport_type>[\w]+).')
         
         #   Local addr/port : 26.26.26.1/848
-        p5 = re.compile(r'Local +addr.port +: +(?P<local_addr>[\d.]+).(?P<local_port>[\d]+)')
+        p5 = regex_engine.compile(r'Local +addr.port +: +(?P<local_addr>[\d.]+).(?P<local_port>[\d]+)')
         
         #   Remote addr/port : 15.15.15.1/848
-        p6 = re.compile(r'Remote +addr.port +: +(?P<remote_addr>[\d.]+).(?P<remote_port>[\d]+)')
+        p6 = regex_engine.compile(r'Remote +addr.port +: +(?P<remote_addr>[\d.]+).(?P<remote_port>[\d]+)')
         
         #    spi : 0x5C78568A11D464C47E9268A1D9A8787D
-        p7 = re.compile(r'spi +: +(?P<spi>[\w\d]+)')
+        p7 = regex_engine.compile(r'spi +: +(?P<spi>[\w\d]+)')
         
         #    management alg     : disabled    encrypt alg       : AES       
-        p8 = re.compile(r'management +alg +: +(?P<mgmt_alg_status>[\w]+) +encrypt +alg +: +(?P<encrypt_alg>[\w]+)')
+        p8 = regex_engine.compile(r'management +alg +: +(?P<mgmt_alg_status>[\w]+) +encrypt +alg +: +(?P<encrypt_alg>[\w]+)')
         
         #    crypto iv length   : 16          key size          : 32      
-        p9 = re.compile(r'crypto +iv +length +: +(?P<crypto_iv_length>[\d]+)  +key +size +: +(?P<key_size>[\d]+)')
+        p9 = regex_engine.compile(r'crypto +iv +length +: +(?P<crypto_iv_length>[\d]+)  +key +size +: +(?P<key_size>[\d]+)')
         
         #    orig life(sec)     : 0         
-        p10 = re.compile(r'orig +life.sec. +: +(?P<orig_life>[\d]+)')
+        p10 = regex_engine.compile(r'orig +life.sec. +: +(?P<orig_life>[\d]+)')
         
         #    sig hash algorithm : enabled     sig key length    : 294     
-        p11 = re.compile(r'sig +hash +algorithm +: +(?P<sig_hash_alg_status>[\w]+) +sig +key +length +: +(?P<sig_key_length>[\d]+)')
+        p11 = regex_engine.compile(r'sig +hash +algorithm +: +(?P<sig_hash_alg_status>[\w]+) +sig +key +length +: +(?P<sig_key_length>[\d]+)')
         
         #    sig size           : 256
-        p12 = re.compile(r'sig +size +: +(?P<sig_size>[\d]+)')
+        p12 = regex_engine.compile(r'sig +size +: +(?P<sig_size>[\d]+)')
         
         #    acknowledgement    : Cisco
-        p13 = re.compile(r'acknowledgement +: +(?P<ack>[\w]+)')
+        p13 = regex_engine.compile(r'acknowledgement +: +(?P<ack>[\w]+)')
         
         #    conn_id (IKEv1)    : 1138
-        p14 = re.compile(r'conn_id +.(?P<connection_type>[\w\d]+). +: +(?P<connection_id>[\d]+)')
+        p14 = regex_engine.compile(r'conn_id +.(?P<connection_type>[\w\d]+). +: +(?P<connection_id>[\d]+)')
         
         #    seq num            : 0           prev seq num      : 0       
-        p15 = re.compile(r'seq +num +: +(?P<seq_num>[\d]+) +prev +seq +num +: +(?P<prev_seq_num>[\d]+)')
+        p15 = regex_engine.compile(r'seq +num +: +(?P<seq_num>[\d]+) +prev +seq +num +: +(?P<prev_seq_num>[\d]+)')
         
         #    handle             : 40000072  
-        p16 = re.compile(r'handle +: +(?P<handle>[\d]+)')
+        p16 = regex_engine.compile(r'handle +: +(?P<handle>[\d]+)')
         
         #    Interface          : GigabitEthernet
-        p17 = re.compile(r'Interface +: +(?P<interface_type>[\w]+)')
+        p17 = regex_engine.compile(r'Interface +: +(?P<interface_type>[\w]+)')
         
         #    Group Name         : GV-GROUP1
-        p18 = re.compile(r'Group +Name +: +(?P<group_name>[\d\w._-]+)')
+        p18 = regex_engine.compile(r'Group +Name +: +(?P<group_name>[\d\w._-]+)')
 
         ret_dict = {}
   
@@ -2287,19 +2285,19 @@ class ShowCryptoGdoiGmIdentifier(ShowCryptoGdoiGmIdentifierSchema):
         ret_dict = {}
 
         # GM Sender ID (SID) Information for Group bw6000:
-        p1 = re.compile(r'^GM Sender ID \(SID\) Information for Group\s*(?P<group_name>\S+):$')
+        p1 = regex_engine.compile(r'^GM Sender ID \(SID\) Information for Group\s*(?P<group_name>\S+):$')
 
         # Group Member: 44.44.44.1       vrf: None
-        p2 = re.compile(r'^Group Member:\s*(?P<group_member>[\S]+)\s*vrf:\s*(?P<vrf_name>[\S]+)$')
+        p2 = regex_engine.compile(r'^Group Member:\s*(?P<group_member>[\S]+)\s*vrf:\s*(?P<vrf_name>[\S]+)$')
 
         # Transform Mode                  : Non-Counter (Non-Suite-B)
-        p3 = re.compile(r'^Transform Mode\s*:\s*(?P<transform_mode>[\w\s\(\)-]+)$')
+        p3 = regex_engine.compile(r'^Transform Mode\s*:\s*(?P<transform_mode>[\w\s\(\)-]+)$')
 
         # of SIDs Last Requested        : 0
-        p4 = re.compile(r'^# of SIDs Last Requested\s*:\s*(?P<no_of_sid>[\d]+)$')
+        p4 = regex_engine.compile(r'^# of SIDs Last Requested\s*:\s*(?P<no_of_sid>[\d]+)$')
 
         # CURRENT SIDs: None
-        p5 = re.compile(r'^CURRENT SIDs:\s*(?P<current_sid>[\S]+)$')
+        p5 = regex_engine.compile(r'^CURRENT SIDs:\s*(?P<current_sid>[\S]+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -2394,46 +2392,46 @@ class ShowCryptoGdoiKsDetail(ShowCryptoGdoiKsDetailSchema):
             output = self.device.execute(self.cli_command)
 
         # Total group members registered to this box: 12
-        p1 = re.compile(r'^Total\s+group\s+members\s+registered\s+to\s+this\s+box:+\s(?P<group_members_registered>\d+)$')
+        p1 = regex_engine.compile(r'^Total\s+group\s+members\s+registered\s+to\s+this\s+box:+\s(?P<group_members_registered>\d+)$')
         # Key Server Information For Group bw6000:
-        p2 = re.compile(r'^Key\s+Server\s+Information\s+For\s+Group\s+(?P<key_server_group>\S+):$')
+        p2 = regex_engine.compile(r'^Key\s+Server\s+Information\s+For\s+Group\s+(?P<key_server_group>\S+):$')
         # Group Name               : bw6000
-        p3 = re.compile(r'^Group\s+Name\s+:\s+(?P<group_name>\S+)$')
+        p3 = regex_engine.compile(r'^Group\s+Name\s+:\s+(?P<group_name>\S+)$')
         # Re-auth on new CRL       : Disabled
-        p4 = re.compile(r'^Re-auth\s+on\s+new\s+CRL\s+:\s+(?P<re_auth_on_new_crl>\w+)$')
+        p4 = regex_engine.compile(r'^Re-auth\s+on\s+new\s+CRL\s+:\s+(?P<re_auth_on_new_crl>\w+)$')
         # Group Identity           : 6000
-        p5 = re.compile(r'^Group\s+Identity\s+:\s+(?P<group_identity>\d+)$')
+        p5 = regex_engine.compile(r'^Group\s+Identity\s+:\s+(?P<group_identity>\d+)$')
         # Group Type               : GDOI (ISAKMP)
-        p6 = re.compile(r'^Group\s+Type\s+:\s+GDOI\s+\((?P<group_type>\S+)\)$')
+        p6 = regex_engine.compile(r'^Group\s+Type\s+:\s+GDOI\s+\((?P<group_type>\S+)\)$')
         # Group Members            : 2
-        p7 = re.compile(r'^Group\s+Members\s+:\s+(?P<group_members>\d+)$')
+        p7 = regex_engine.compile(r'^Group\s+Members\s+:\s+(?P<group_members>\d+)$')
         # Rekey Acknowledgement Cfg: Cisco
-        p8 = re.compile(r'^Rekey\s+Acknowledgement\s+Cfg:\s+(?P<rekey_acknowledgement_cfg>\w+)$')
+        p8 = regex_engine.compile(r'^Rekey\s+Acknowledgement\s+Cfg:\s+(?P<rekey_acknowledgement_cfg>\w+)$')
         # IPSec SA Direction       : Both
-        p9 = re.compile(r'^IPSec\s+SA\s+Direction\s+:\s+(?P<ipsec_sa_direction>\w+)$')
+        p9 = regex_engine.compile(r'^IPSec\s+SA\s+Direction\s+:\s+(?P<ipsec_sa_direction>\w+)$')
         # IP D3P Window            : Disabled
-        p10 = re.compile(r'^IP\s+D3P\s+Window\s+:\s+(?P<ip_d3p_window>\w+)$')
+        p10 = regex_engine.compile(r'^IP\s+D3P\s+Window\s+:\s+(?P<ip_d3p_window>\w+)$')
         # Split Resiliency Factor  : 0
-        p11 = re.compile(r'^Split\s+Resiliency\s+Factor\s+:\s+(?P<split_resiliency_factor>\d+)$')
+        p11 = regex_engine.compile(r'^Split\s+Resiliency\s+Factor\s+:\s+(?P<split_resiliency_factor>\d+)$')
         # CKM status               : Disabled
-        p12 = re.compile(r'^CKM\s+status\s+:\s+(?P<ckm_status>\w+)$')
+        p12 = regex_engine.compile(r'^CKM\s+status\s+:\s+(?P<ckm_status>\w+)$')
         # ACL Configured: 
         # access-list bw600-crypto-policy
-        p13 = re.compile(r'^access-list\s+(?P<access_list>\S+)$')
+        p13 = regex_engine.compile(r'^access-list\s+(?P<access_list>\S+)$')
         # Redundancy               : Configured
-        p14 = re.compile(r'^Redundancy\s+:\s+(?P<redundancy_mode>\w+)$')
+        p14 = regex_engine.compile(r'^Redundancy\s+:\s+(?P<redundancy_mode>\w+)$')
         # Local Address        : 15.15.15.1
-        p15 =  re.compile(r'^Local\s+Address\s+:\s+(?P<local_address>\S+)$')
+        p15 =  regex_engine.compile(r'^Local\s+Address\s+:\s+(?P<local_address>\S+)$')
         # Local Priority       : 245
-        p16 = re.compile(r'^Local\s+Priority\s+:\s+(?P<local_priority>\d+)$')
+        p16 = regex_engine.compile(r'^Local\s+Priority\s+:\s+(?P<local_priority>\d+)$')
         # Local KS Status      : Alive
-        p17 = re.compile(r'^Local\s+KS\s+Status\s+:\s+(?P<local_ks_status>\w+)$')
+        p17 = regex_engine.compile(r'^Local\s+KS\s+Status\s+:\s+(?P<local_ks_status>\w+)$')
         # Local KS Role        : Primary
-        p18 = re.compile(r'^Local\s+KS\s+Role\s+:\s+(?P<local_ks_role>\w+)$')
+        p18 = regex_engine.compile(r'^Local\s+KS\s+Role\s+:\s+(?P<local_ks_role>\w+)$')
         # Local KS Version     : 1.0.27
-        p19 = re.compile(r'^Local\s+KS\s+Version\s+:\s+(?P<local_ks_version>\S+)$')
+        p19 = regex_engine.compile(r'^Local\s+KS\s+Version\s+:\s+(?P<local_ks_version>\S+)$')
         # Local COOP Version   : 1.0.8 
-        p20 = re.compile(r'^Local\s+COOP\s+Version\s+:\s+(?P<local_coop_version>\S+)$')
+        p20 = regex_engine.compile(r'^Local\s+COOP\s+Version\s+:\s+(?P<local_coop_version>\S+)$')
 
         ret_dict = {}
 
@@ -2622,16 +2620,16 @@ class ShowCryptoGdoiGmPubkey(ShowCryptoGdoiGmPubkeySchema):
         ret_dict = {}
 
         # GDOI Group: bw6000
-        p1 = re.compile(r'^GDOI\s*Group:\s*(?P<group_name>\S+)$')
+        p1 = regex_engine.compile(r'^GDOI\s*Group:\s*(?P<group_name>\S+)$')
 
         # KS IP Address: 15.15.15.1
-        p2 = re.compile(r'^KS\s*IP\s*Address:\s*(?P<ks_ipaddress>\S+)$')
+        p2 = regex_engine.compile(r'^KS\s*IP\s*Address:\s*(?P<ks_ipaddress>\S+)$')
 
         # conn-id: 44334    my-cookie:C5AC6039    his-cookie:A440633E
-        p3 = re.compile(r'^conn-id:\s*(?P<conn_id>\d+)\s*my-cookie:\s*(?P<my_cookie>\S+)\s*his-cookie:\s*(?P<his_cookie>\S+)$')
+        p3 = regex_engine.compile(r'^conn-id:\s*(?P<conn_id>\d+)\s*my-cookie:\s*(?P<my_cookie>\S+)\s*his-cookie:\s*(?P<his_cookie>\S+)$')
 
         # Key Data:
-        p4 = re.compile(r'^(?P<key_data_info>[0-9A-Z\s]+)$')
+        p4 = regex_engine.compile(r'^(?P<key_data_info>[0-9A-Z\s]+)$')
 
 
         for line in output.splitlines():
@@ -2713,19 +2711,19 @@ class ShowCryptoGdoiGmRekeyDetail(ShowCryptoGdoiGmRekeyDetailSchema):
         ret_dict = {}
 
         # Group bw6000 (Unicast)
-        p1 = re.compile(r'^Group\s*(?P<group_name>\S+)\s*\(Unicast\)$')
+        p1 = regex_engine.compile(r'^Group\s*(?P<group_name>\S+)\s*\(Unicast\)$')
 
         # Number of Rekeys received (cumulative)       : 0
-        p2 = re.compile(r'^Number\s*of\s*Rekeys\s*received\s*\(cumulative\)\s*:\s*(?P<rekeys_cumulative>\d+)$')
+        p2 = regex_engine.compile(r'^Number\s*of\s*Rekeys\s*received\s*\(cumulative\)\s*:\s*(?P<rekeys_cumulative>\d+)$')
 
         # Number of Rekeys received after registration : 0
-        p3 = re.compile(r'^Number\s*of\s*Rekeys\s*received\s*after\s*registration\s*:\s*(?P<rekeys_registration>\d+)$')
+        p3 = regex_engine.compile(r'^Number\s*of\s*Rekeys\s*received\s*after\s*registration\s*:\s*(?P<rekeys_registration>\d+)$')
 
         # Number of Rekey Acks sent                    : 0
-        p4 = re.compile(r'^Number\s*of\s*Rekey\s*Acks\s*sent\s*:\s*(?P<rekey_acks_sent>\d+)$')
+        p4 = regex_engine.compile(r'^Number\s*of\s*Rekey\s*Acks\s*sent\s*:\s*(?P<rekey_acks_sent>\d+)$')
         
         # New     : 41.41.41.1      15.15.15.1       44327   14C40DC1   88AD3ACA
-        p5 = re.compile(r'^(?P<state>(New|Current|Previous))\s*:\s*(?P<dst>[\S]+)\s*(?P<src>[\S]+)\s*(?P<conn_id>[\S]+)\s*(?P<my_cookie>[\S]+)\s*(?P<his_cookie>[\S]+)$')
+        p5 = regex_engine.compile(r'^(?P<state>(New|Current|Previous))\s*:\s*(?P<dst>[\S]+)\s*(?P<src>[\S]+)\s*(?P<conn_id>[\S]+)\s*(?P<my_cookie>[\S]+)\s*(?P<his_cookie>[\S]+)$')
         
 
         for line in output.splitlines():
@@ -2841,71 +2839,71 @@ class ShowCryptoGdoiKsCoopDetail(ShowCryptoGdoiKsCoopDetailSchema):
             output = self.device.execute(self.cli_command)
 
         # Crypto Gdoi Group Name :g1
-        p1 = re.compile(r'^Crypto\s+Gdoi\s+Group\s+Name +:(?P<crypto_gdoi_group_name>\S+)$')
+        p1 = regex_engine.compile(r'^Crypto\s+Gdoi\s+Group\s+Name +:(?P<crypto_gdoi_group_name>\S+)$')
         # Group handle: 1073741826, Local Key Server handle: 1073741826
-        p2 = re.compile(r'^Group\s+handle:\s+(?P<group_handle>\d+),\s+Local\s+Key\s+Server\s+handle:\s+(?P<local_key_server_handle>\d+)$')
+        p2 = regex_engine.compile(r'^Group\s+handle:\s+(?P<group_handle>\d+),\s+Local\s+Key\s+Server\s+handle:\s+(?P<local_key_server_handle>\d+)$')
         # *NO* redundancy configured for this group
-        p3 = re.compile(r'\*(?P<redundancy_state>NO)\*\s+redundancy\s+configured\s+for\s+this\s+group')
+        p3 = regex_engine.compile(r'\*(?P<redundancy_state>NO)\*\s+redundancy\s+configured\s+for\s+this\s+group')
         # Local Address: 10.78.106.116
-        p4 = re.compile(r'^Local\s+Address:\s+(?P<local_address>\S+)$')
+        p4 = regex_engine.compile(r'^Local\s+Address:\s+(?P<local_address>\S+)$')
         # Local Priority: 100
-        p5 = re.compile(r'^Local\s+Priority:\s+(?P<local_priority>\d+)$')
+        p5 = regex_engine.compile(r'^Local\s+Priority:\s+(?P<local_priority>\d+)$')
         # Local KS Role: Primary , Local KS Status: Alive
-        p6 = re.compile(r'^Local\s+KS\s+Role:\s+(?P<local_ks_role>\w+)\s+,\s+Local\s+KS\s+Status:\s+(?P<local_ks_status>\w+)$')
+        p6 = regex_engine.compile(r'^Local\s+KS\s+Role:\s+(?P<local_ks_role>\w+)\s+,\s+Local\s+KS\s+Status:\s+(?P<local_ks_status>\w+)$')
         # Local KS version: 1.0.27
-        p7 = re.compile(r'^Local\s+KS\s+version:\s+(?P<local_ks_version>\S+)$')
+        p7 = regex_engine.compile(r'^Local\s+KS\s+version:\s+(?P<local_ks_version>\S+)$')
         # Local COOP version: 1.0.8
-        p8 = re.compile(r'^Local\s+COOP\s+version:\s+(?P<local_coop_version>\S+)$')
+        p8 = regex_engine.compile(r'^Local\s+COOP\s+version:\s+(?P<local_coop_version>\S+)$')
         # Primary Refresh Policy Time: 20
-        p9 = re.compile(r'^Primary\s+Refresh\s+Policy\s+Time:\s+(?P<primary_refresh_policy_time>\d+)$')
+        p9 = regex_engine.compile(r'^Primary\s+Refresh\s+Policy\s+Time:\s+(?P<primary_refresh_policy_time>\d+)$')
         # Remaining Time: 14
-        p10 = re.compile(r'^Remaining\s+Time:\s+(?P<remaining_time>\d+)$')
+        p10 = regex_engine.compile(r'^Remaining\s+Time:\s+(?P<remaining_time>\d+)$')
         # Per-user timer remaining time: 0
-        p11 = re.compile(r'^Per-user\s+timer\s+remaining\s+time:\s+(?P<per_user_timer_remaining_time>\d+)$')
+        p11 = regex_engine.compile(r'^Per-user\s+timer\s+remaining\s+time:\s+(?P<per_user_timer_remaining_time>\d+)$')
         # Antireplay Sequence Number: 79
-        p12 = re.compile(r'^Antireplay\s+Sequence\s+Number:\s+(?P<antireplay_sequence_number>\d+)$')
+        p12 = regex_engine.compile(r'^Antireplay\s+Sequence\s+Number:\s+(?P<antireplay_sequence_number>\d+)$')
         # Session 1:
-        p13 = re.compile(r'^Session\s+(?P<session_id>\d+):$')
+        p13 = regex_engine.compile(r'^Session\s+(?P<session_id>\d+):$')
         # Server handle: 1073741827
-        p14 = re.compile(r'^Server\s+handle:\s+(?P<server_handle>\d+)$')
+        p14 = regex_engine.compile(r'^Server\s+handle:\s+(?P<server_handle>\d+)$')
         # Peer Address: 10.78.106.117
-        p15 = re.compile(r'^Peer\s+Address:\s+(?P<peer_address>\S+)$')
+        p15 = regex_engine.compile(r'^Peer\s+Address:\s+(?P<peer_address>\S+)$')
         # Peer Version: 1.0.27
-        p16 = re.compile(r'^Peer\s+Version:\s+(?P<peer_version>\S+)$')
+        p16 = regex_engine.compile(r'^Peer\s+Version:\s+(?P<peer_version>\S+)$')
         # Peer COOP version: 1.0.8
-        p17 = re.compile(r'^Peer\s+COOP\s+version:\s+(?P<peer_coop_version>\S+)$')
+        p17 = regex_engine.compile(r'^Peer\s+COOP\s+version:\s+(?P<peer_coop_version>\S+)$')
         # COOP Protocol: base
-        p18 = re.compile(r'^COOP\s+Protocol:\s+(?P<coop_protocol>\S+)$')
+        p18 = regex_engine.compile(r'^COOP\s+Protocol:\s+(?P<coop_protocol>\S+)$')
         # Peer Priority: 90
-        p19 = re.compile(r'^Peer\s+Priority:\s+(?P<peer_priority>\d+)$')
+        p19 = regex_engine.compile(r'^Peer\s+Priority:\s+(?P<peer_priority>\d+)$')
         # Peer KS Role: Secondary , Peer KS Status: Alive
-        p20 = re.compile(r'^Peer\s+KS\s+Role:\s+(?P<peer_ks_role>\w+)\s+,\s+Peer\s+KS\s+Status:\s+(?P<peer_ks_status>\w+)$')
+        p20 = regex_engine.compile(r'^Peer\s+KS\s+Role:\s+(?P<peer_ks_role>\w+)\s+,\s+Peer\s+KS\s+Status:\s+(?P<peer_ks_status>\w+)$')
         # IKE status: Established
-        p21 = re.compile(r'^IKE\s+status:\s+(?P<ike_status>\w+)$')
+        p21 = regex_engine.compile(r'^IKE\s+status:\s+(?P<ike_status>\w+)$')
         # Ann msgs sent: 122
-        p22 = re.compile(r'^Ann\s+msgs\s+sent:\s+(?P<ann_msgs_sent>\d+)$')
+        p22 = regex_engine.compile(r'^Ann\s+msgs\s+sent:\s+(?P<ann_msgs_sent>\d+)$')
         # Ann msgs sent with reply request: 1
-        p23 = re.compile(r'^Ann\s+msgs\s+sent\s+with\s+reply\s+request:\s+(?P<ann_msgs_sent_with_reply_request>\d+)$')
+        p23 = regex_engine.compile(r'^Ann\s+msgs\s+sent\s+with\s+reply\s+request:\s+(?P<ann_msgs_sent_with_reply_request>\d+)$')
         # Ann msgs recv: 4
-        p24 =  re.compile(r'^Ann\s+msgs\s+recv:\s+(?P<ann_msgs_recv>\d+)$')
+        p24 =  regex_engine.compile(r'^Ann\s+msgs\s+recv:\s+(?P<ann_msgs_recv>\d+)$')
         # Ann msgs recv with reply request: 1
-        p25 = re.compile(r'^Ann\s+msgs\s+recv\s+with\s+reply\s+request:\s+(?P<ann_msgs_recv_with_reply_request>\d+)$')
+        p25 = regex_engine.compile(r'^Ann\s+msgs\s+recv\s+with\s+reply\s+request:\s+(?P<ann_msgs_recv_with_reply_request>\d+)$')
         # Packet sent drops: 1
-        p26 = re.compile(r'^Packet\s+sent\s+drops:\s+(?P<packet_sent_drops>\d+)$')
+        p26 = regex_engine.compile(r'^Packet\s+sent\s+drops:\s+(?P<packet_sent_drops>\d+)$')
         # Packet Recv drops: 0
-        p27 = re.compile(r'^Packet\s+Recv\s+drops:\s+(?P<packet_recv_drops>\d)$')
+        p27 = regex_engine.compile(r'^Packet\s+Recv\s+drops:\s+(?P<packet_recv_drops>\d)$')
         # Total bytes sent: 104495
-        p28 = re.compile(r'^Total\s+bytes\s+sent:\s+(?P<total_bytes_sent>\d+)$')
+        p28 = regex_engine.compile(r'^Total\s+bytes\s+sent:\s+(?P<total_bytes_sent>\d+)$')
         # Total bytes recv: 2130
-        p29 = re.compile(r'^Total\s+bytes\s+recv:\s+(?P<total_bytes_recv>\d+)$')
+        p29 = regex_engine.compile(r'^Total\s+bytes\s+recv:\s+(?P<total_bytes_recv>\d+)$')
         # Sec Primary Periodic Time: 30
-        p30 = re.compile(r'^Sec Primary.*: +(?P<sec_primary_periodic_time>\d+)$')
+        p30 = regex_engine.compile(r'^Sec Primary.*: +(?P<sec_primary_periodic_time>\d+)$')
         # Remaining Time: 11, Retries: 0
-        p31 = re.compile(r'^Remaining Time: +(?P<remaining_time>\d+), +Retries: +(?P<retries>\d+)$')
+        p31 = regex_engine.compile(r'^Remaining Time: +(?P<remaining_time>\d+), +Retries: +(?P<retries>\d+)$')
         # Invalid ANN PST recvd: 0
-        p32 = re.compile(r'^Invalid.*: +(?P<invalid_ann_pst_recvd>\d+)$')
+        p32 = regex_engine.compile(r'^Invalid.*: +(?P<invalid_ann_pst_recvd>\d+)$')
         # New GM Temporary Blocking Enforced?: No
-        p33 = re.compile(r'^New.*?: +(?P<new_gm_temp_blk_enforced>\w+)$')
+        p33 = regex_engine.compile(r'^New.*?: +(?P<new_gm_temp_blk_enforced>\w+)$')
 
         ret_dict = {}
         reply_num = 0
@@ -3210,27 +3208,27 @@ class ShowCryptoGdoiKsIdentifierSuperParser(ShowCryptoGdoiKsIdentifierSchema):
         res_dict = {}
 
         # KS Sender ID (KSSID) Information for Group bw6000:
-        p1 = re.compile(r'^KS\s+Sender\s+ID\s+\(KSSID\)\s+Information\s+for\s+Group\s+(?P<ks_sender_id>\S+):$')
+        p1 = regex_engine.compile(r'^KS\s+Sender\s+ID\s+\(KSSID\)\s+Information\s+for\s+Group\s+(?P<ks_sender_id>\S+):$')
         # Transform Mode           : Non-Counter (Non-Suite-B)
-        p2 = re.compile(r'^Transform\s+Mode\s+:\s+(?P<transform_mode>\S+)\s+\(\S+\)$')
+        p2 = regex_engine.compile(r'^Transform\s+Mode\s+:\s+(?P<transform_mode>\S+)\s+\(\S+\)$')
         # Re-initializing          : No
-        p3 = re.compile(r'^Re-initializing\s+:\s+(?P<re_initializing>\w+)$')
+        p3 = regex_engine.compile(r'^Re-initializing\s+:\s+(?P<re_initializing>\w+)$')
         # SID Length (Group Size)  : 24 bits (MEDIUM)
-        p4 = re.compile(r'^SID\s+Length\s+\(Group\s+Size\)\s+:\s+(?P<sid_length>\d+)\s+bits\s+\(\S+\)$')
+        p4 = regex_engine.compile(r'^SID\s+Length\s+\(Group\s+Size\)\s+:\s+(?P<sid_length>\d+)\s+bits\s+\(\S+\)$')
         # Current KSSID In-Use     : none
-        p5 = re.compile(r'^Current KSSID\s+In-Use\s+:\s+(?P<current_kssid_in_use>\S+)$')
+        p5 = regex_engine.compile(r'^Current KSSID\s+In-Use\s+:\s+(?P<current_kssid_in_use>\S+)$')
         # Last GMSID Used          : none
-        p6 = re.compile(r'^Last\s+GMSID\s+Used\s+:\s+(?P<last_gmsid_used>\S+)$')
+        p6 = regex_engine.compile(r'^Last\s+GMSID\s+Used\s+:\s+(?P<last_gmsid_used>\S+)$')
         # KSSID(s) Assigned        : none
-        p7 = re.compile(r'^KSSID\(s\)\s+Assigned\s+:\s+(?P<kssid_assigned>\S+)$')
+        p7 = regex_engine.compile(r'^KSSID\(s\)\s+Assigned\s+:\s+(?P<kssid_assigned>\S+)$')
         # KSSID(s) Used            : none
-        p8 = re.compile(r'^KSSID\(s\)\s+Used\s+:\s+(?P<kssid_used>\S+)$')
+        p8 = regex_engine.compile(r'^KSSID\(s\)\s+Used\s+:\s+(?P<kssid_used>\S+)$')
         # KSSID(s) Used (Old)      : none
-        p9 = re.compile(r'^KSSID\(s\)\s+Used\s+\(Old\)\s+:\s+(?P<kssid_used_old>\S+)$')
+        p9 = regex_engine.compile(r'^KSSID\(s\)\s+Used\s+\(Old\)\s+:\s+(?P<kssid_used_old>\S+)$')
         # Available KSSID(s)       : none
-        p10 = re.compile(r'^Available\s+KSSID\(s\)\s+:\s+(?P<available_kssid>\S+)$')
+        p10 = regex_engine.compile(r'^Available\s+KSSID\(s\)\s+:\s+(?P<available_kssid>\S+)$')
         # REMAINING SIDs: none
-        p11 = re.compile(r'^REMAINING\s+SIDs:\s+(?P<remining_sid>\S+)$')
+        p11 = regex_engine.compile(r'^REMAINING\s+SIDs:\s+(?P<remining_sid>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3384,25 +3382,25 @@ class ShowCryptoGdoiGmIdentifierDetail(ShowCryptoGdoiGmIdentifierDetailSchema):
         ret_dict = {}
 
         # GM Sender ID (SID) Information for Group bw6000:
-        p1 = re.compile(r'^GM Sender ID \(SID\) Information for Group\s*(?P<group_name>\S+):$')
+        p1 = regex_engine.compile(r'^GM Sender ID \(SID\) Information for Group\s*(?P<group_name>\S+):$')
 
         # Group Member: 44.44.44.1       vrf: None
-        p2 = re.compile(r'^Group Member:\s*(?P<group_member>[\S]+)\s*vrf:\s*(?P<vrf_name>[\S]+)$')
+        p2 = regex_engine.compile(r'^Group Member:\s*(?P<group_member>[\S]+)\s*vrf:\s*(?P<vrf_name>[\S]+)$')
 
         # Transform Mode                  : Non-Counter (Non-Suite-B)
-        p3 = re.compile(r'^Transform Mode\s*:\s*(?P<transform_mode>[\w-]*)\s*\((?P<transform_name>[\w-]*)\)$')
+        p3 = regex_engine.compile(r'^Transform Mode\s*:\s*(?P<transform_mode>[\w-]*)\s*\((?P<transform_name>[\w-]*)\)$')
 
         # of SIDs Last Requested        : 0
-        p4 = re.compile(r'^# of SIDs Last Requested\s*:\s*(?P<no_of_sid>[\d]+)$')
+        p4 = regex_engine.compile(r'^# of SIDs Last Requested\s*:\s*(?P<no_of_sid>[\d]+)$')
 
         # CURRENT SIDs: None
-        p5 = re.compile(r'^CURRENT SIDs:\s*(?P<current_sid>[\S]+)$')
+        p5 = regex_engine.compile(r'^CURRENT SIDs:\s*(?P<current_sid>[\S]+)$')
 
         # TEK Lifetime                  : 4873 sec
-        p6 = re.compile(r'^TEK Lifetime\s*:\s*(?P<tek_lifetime>[\w]+)\s*sec$')
+        p6 = regex_engine.compile(r'^TEK Lifetime\s*:\s*(?P<tek_lifetime>[\w]+)\s*sec$')
 
         # SID Length (Group Size)       : 24 bits (MEDIUM)
-        p7 = re.compile(r'^SID Length \(Group Size\)\s*:\s*(?P<sid_length>[\d]+)\s*bits\s*\((?P<group_size>[\w]+)\)$')        
+        p7 = regex_engine.compile(r'^SID Length \(Group Size\)\s*:\s*(?P<sid_length>[\d]+)\s*bits\s*\((?P<group_size>[\w]+)\)$')        
 
         for line in output.splitlines():
             line = line.strip()
@@ -3509,46 +3507,46 @@ class ShowCryptoGdoiKsCoopIdentifierDetail(ShowCryptoGdoiKsCoopIdentifierDetailS
             output = self.device.execute(self.cli_command)
 
         # COOP-KS Sender ID (SID) Information for Group g1:
-        p1 = re.compile(r'^COOP-KS Sender ID \(SID\) Information for Group (?P<group>[\w\d\-]+):$')
+        p1 = regex_engine.compile(r'^COOP-KS Sender ID \(SID\) Information for Group (?P<group>[\w\d\-]+):$')
 
         # Local KS Role: Primary , Local KS Status: Alive
-        p2 = re.compile(r'^Local KS Role:\s+(?P<ks_role>[\w]+)\s+\,\s+Local KS Status:\s+(?P<ks_status>[\w]+)$')
+        p2 = regex_engine.compile(r'^Local KS Role:\s+(?P<ks_role>[\w]+)\s+\,\s+Local KS Status:\s+(?P<ks_status>[\w]+)$')
 
         # Local Address : 10.78.106.116
-        p3 = re.compile(r'^Local Address\s+:\s+(?P<address>\d+\.\d+\.\d+\.\d+)$')
+        p3 = regex_engine.compile(r'^Local Address\s+:\s+(?P<address>\d+\.\d+\.\d+\.\d+)$')
 
         # Next SID Client Operation : NOTIFY
-        p4 = re.compile(r'^Next SID Client Operation\s+:\s+(?P<next_sid_client_operation>[A-Z]+)$')
+        p4 = regex_engine.compile(r'^Next SID Client Operation\s+:\s+(?P<next_sid_client_operation>[A-Z]+)$')
 
         # Re-initializing : No
-        p5 = re.compile(r'^Re-initializing\s+:\s+(?P<re_initializing>[\w]+)$')
+        p5 = regex_engine.compile(r'^Re-initializing\s+:\s+(?P<re_initializing>[\w]+)$')
 
         # KSSID Overlap : No
-        p6 = re.compile(r'^KSSID Overlap\s+:\s+(?P<kssid_overlap>[\w]+)$')
+        p6 = regex_engine.compile(r'^KSSID Overlap\s+:\s+(?P<kssid_overlap>[\w]+)$')
 
         # SID Length (Group Size) Cfg : 24 bits (MEDIUM)
-        p7 = re.compile(r'^SID Length \(Group Size\) Cfg\s+:\s+(?P<sid_length_cfg>[\s\w\(\)]+)$')
+        p7 = regex_engine.compile(r'^SID Length \(Group Size\) Cfg\s+:\s+(?P<sid_length_cfg>[\s\w\(\)]+)$')
 
         # SID Length (Group Size) Used : 24 bits (MEDIUM)
-        p8 = re.compile(r'^SID Length \(Group Size\) Used\s+:\s+(?P<sid_length_used>[\s\w\(\)]+)$')
+        p8 = regex_engine.compile(r'^SID Length \(Group Size\) Used\s+:\s+(?P<sid_length_used>[\s\w\(\)]+)$')
 
         # Current KSSID In-Use : none
-        p9 = re.compile(r'^Current KSSID In-Use\s+:\s+(?P<current_kssid_inuse>[a-z]+)$')
+        p9 = regex_engine.compile(r'^Current KSSID In-Use\s+:\s+(?P<current_kssid_inuse>[a-z]+)$')
 
         # KSSID(s) Assigned : none
-        p10 = re.compile(r'^KSSID\(s\) Assigned\s+:\s+(?P<kssids_assigned>[a-z]+)$')
+        p10 = regex_engine.compile(r'^KSSID\(s\) Assigned\s+:\s+(?P<kssids_assigned>[a-z]+)$')
 
         # KSSID(s) Used : none
-        p11 = re.compile(r'^KSSID\(s\) Used\s+:\s+(?P<kssids_used>[a-z]+)$')
+        p11 = regex_engine.compile(r'^KSSID\(s\) Used\s+:\s+(?P<kssids_used>[a-z]+)$')
 
         # Old KSSID(s) Used : none
-        p12 = re.compile(r'^Old KSSID\(s\) Used\s+:\s+(?P<old_kssids_used>[a-z]+)$')
+        p12 = regex_engine.compile(r'^Old KSSID\(s\) Used\s+:\s+(?P<old_kssids_used>[a-z]+)$')
 
         # Peer KS Role: Secondary , Peer KS Status: Alive
-        p13 = re.compile(r'^Peer KS Role:\s+(?P<ks_role>[\w]+)\s\, Peer KS Status:\s+(?P<ks_status>[\w]+)$')
+        p13 = regex_engine.compile(r'^Peer KS Role:\s+(?P<ks_role>[\w]+)\s\, Peer KS Status:\s+(?P<ks_status>[\w]+)$')
 
         # Peer Address : 10.78.106.117
-        p14 = re.compile(r'^Peer Address\s+:\s+(?P<address>\d+\.\d+\.\d+\.\d+)$')
+        p14 = regex_engine.compile(r'^Peer Address\s+:\s+(?P<address>\d+\.\d+\.\d+\.\d+)$')
 
         master_dict = {}
 
@@ -3705,19 +3703,19 @@ class ShowCryptoGdoiFeatureSet(ShowCryptoGdoiFeatureSetSchema):
             output = self.device.execute(self.cli_command)
         
         # Group Name: bw6000
-        p1 = re.compile(r'^Group Name:\s(?P<group>[\S]+)$')
+        p1 = regex_engine.compile(r'^Group Name:\s(?P<group>[\S]+)$')
 
         #     Key Server ID       Version   Feature Supported
-        p2 = re.compile(r'Key Server ID \s+Version\s+Feature\sSupported')
+        p2 = regex_engine.compile(r'Key Server ID \s+Version\s+Feature\sSupported')
 
         #         15.15.15.1          1.0.27         Yes
-        p3 = re.compile(r'(?P<key_server_id>\d{1,}\.\d{1,}\.\d{1,}\.\d{1,})\s+(?P<key_version>[\d\.]+)\s+(?P<key_feature_supported>[\w]+)$')
+        p3 = regex_engine.compile(r'(?P<key_server_id>\d{1,}\.\d{1,}\.\d{1,}\.\d{1,})\s+(?P<key_version>[\d\.]+)\s+(?P<key_feature_supported>[\w]+)$')
 
         #    Group Member ID     Version   Feature Supported
-        p4 = re.compile(r'Group Member ID\s+Version\s+Feature\sSupported')
+        p4 = regex_engine.compile(r'Group Member ID\s+Version\s+Feature\sSupported')
 
         #         25.25.25.1          1.0.25         Yes
-        p5 = re.compile(r'(?P<group_member_id>\d{1,}\.\d{1,}\.\d{1,}\.\d{1,})\s+(?P<group_member_version>[\d\.]+)\s+(?P<group_feature_supported>[\w]+)$')
+        p5 = regex_engine.compile(r'(?P<group_member_id>\d{1,}\.\d{1,}\.\d{1,}\.\d{1,})\s+(?P<group_member_version>[\d\.]+)\s+(?P<group_feature_supported>[\w]+)$')
 
         master_dict = {}
         server_flag = False
@@ -3851,40 +3849,40 @@ class ShowCryptoGdoiKsCoopIdentifier(ShowCryptoGdoiKsCoopIdentifierSchema):
             output = self.device.execute(self.cli_command)
 
         # COOP-KS Sender ID (SID) Information for Group bw6000:
-        p1 = re.compile(r'^COOP-KS Sender ID \(SID\) Information for Group (?P<group>[\w\d\-]+):$')
+        p1 = regex_engine.compile(r'^COOP-KS Sender ID \(SID\) Information for Group (?P<group>[\w\d\-]+):$')
 
         # Local KS Role: Primary   , Local KS Status: Alive
-        p2 = re.compile(r'^Local KS Role: (?P<ks_role>[\w]+)\s*\, Local KS Status: (?P<ks_status>[\w]+)$')
+        p2 = regex_engine.compile(r'^Local KS Role: (?P<ks_role>[\w]+)\s*\, Local KS Status: (?P<ks_status>[\w]+)$')
 
         # Local Address                : 15.15.15.1
-        p3 = re.compile(r'^Local Address\s*: (?P<address>\d+\.\d+\.\d+\.\d+)$')
+        p3 = regex_engine.compile(r'^Local Address\s*: (?P<address>\d+\.\d+\.\d+\.\d+)$')
 
         # Next SID Client Operation    : NOTIFY
-        p4 = re.compile(r'^Next SID Client Operation\s*: (?P<next_sid_client_operation>[A-Z]+)$')
+        p4 = regex_engine.compile(r'^Next SID Client Operation\s*: (?P<next_sid_client_operation>[A-Z]+)$')
 
         # Re-initializing              : No
-        p5 = re.compile(r'^Re-initializing\s*: (?P<re_initializing>[\w]+)$')
+        p5 = regex_engine.compile(r'^Re-initializing\s*: (?P<re_initializing>[\w]+)$')
 
         # KSSID Overlap                : No
-        p6 = re.compile(r'^KSSID Overlap\s*: (?P<kssid_overlap>[\w]+)$')
+        p6 = regex_engine.compile(r'^KSSID Overlap\s*: (?P<kssid_overlap>[\w]+)$')
 
         # SID Length (Group Size) Cfg  : 24 bits (MEDIUM)
-        p7 = re.compile(r'^SID Length \(Group Size\) Cfg\s*: (?P<sid_length_cfg>[\s\w\(\)]+)$')
+        p7 = regex_engine.compile(r'^SID Length \(Group Size\) Cfg\s*: (?P<sid_length_cfg>[\s\w\(\)]+)$')
 
         # SID Length (Group Size) Used : 24 bits (MEDIUM)
-        p8 = re.compile(r'^SID Length \(Group Size\) Used\s*: (?P<sid_length_used>[\s\w\(\)]+)$')
+        p8 = regex_engine.compile(r'^SID Length \(Group Size\) Used\s*: (?P<sid_length_used>[\s\w\(\)]+)$')
 
         # Current KSSID In-Use         : none
-        p9 = re.compile(r'^Current KSSID In-Use\s*: (?P<current_kssid_inuse>[a-z]+)$')
+        p9 = regex_engine.compile(r'^Current KSSID In-Use\s*: (?P<current_kssid_inuse>[a-z]+)$')
 
         # KSSID(s) Assigned            : none
-        p10 = re.compile(r'^KSSID\(s\) Assigned\s*: (?P<kssids_assigned>[a-z]+)$')
+        p10 = regex_engine.compile(r'^KSSID\(s\) Assigned\s*: (?P<kssids_assigned>[a-z]+)$')
 
         # KSSID(s) Used                : none
-        p11 = re.compile(r'^KSSID\(s\) Used\s*: (?P<kssids_used>[a-z]+)$')
+        p11 = regex_engine.compile(r'^KSSID\(s\) Used\s*: (?P<kssids_used>[a-z]+)$')
 
         # Old KSSID(s) Used            : none
-        p12 = re.compile(r'^Old KSSID\(s\) Used\s*: (?P<old_kssids_used>[a-z]+)$')
+        p12 = regex_engine.compile(r'^Old KSSID\(s\) Used\s*: (?P<old_kssids_used>[a-z]+)$')
 
         master_dict = {}
 
@@ -4027,17 +4025,17 @@ class ShowCryptogdoiIpsecSa(ShowCryptogdoiIpsecSaSchema):
             output = self.device.execute(self.cli_command)
 
         #SA created for group getvpn1:
-        p1 = re.compile(r'^SA +created +for +group (?P<sa_created_for_group>[\w\d]+):$')
+        p1 = regex_engine.compile(r'^SA +created +for +group (?P<sa_created_for_group>[\w\d]+):$')
         #   GigabitEthernat0/0/1:
-        p2 = re.compile(r'(?P<interface>[\w\d\/]+):$')
+        p2 = regex_engine.compile(r'(?P<interface>[\w\d\/]+):$')
         #protocol = ip
-        p3 = re.compile(r'^protocol\s= (?P<protocol>\w{2,})$')
+        p3 = regex_engine.compile(r'^protocol\s= (?P<protocol>\w{2,})$')
         #local ident  = 11.23.33.33, port = 0
-        p4 = re.compile(r'^local.* +(?P<local_ident>[ANY|0-9\.\/]+), +port = (?P<port>[\d]+)$')
+        p4 = regex_engine.compile(r'^local.* +(?P<local_ident>[ANY|0-9\.\/]+), +port = (?P<port>[\d]+)$')
         #remote ident = 24.54.55.55, port = 0
-        p5 = re.compile(r'^remote.* +(?P<remote_ident>[ANY|0-9\.\/]+), +port = (?P<remote_port>[\d]+)$')
+        p5 = regex_engine.compile(r'^remote.* +(?P<remote_ident>[ANY|0-9\.\/]+), +port = (?P<remote_port>[\d]+)$')
         #direction: Both, replay(method/window): Counter/64
-        p6 = re.compile(r'^direction: (?P<direction>[\w]+), +replay.*: +(?P<method>[\w]+)\/(?P<window>[\d]+)$')
+        p6 = regex_engine.compile(r'^direction: (?P<direction>[\w]+), +replay.*: +(?P<method>[\w]+)\/(?P<window>[\d]+)$')
 
         master_dict = {}
 
@@ -4125,16 +4123,16 @@ class ShowCryptoGdoiKsAcl(ShowCryptoGdoiKsAclSchema):
             output = self.device.execute(self.cli_command)
 
         # Group Name: bw6000
-        p1 = re.compile(r"^Group Name: +(?P<group_name>[\d\S]+)$")
+        p1 = regex_engine.compile(r"^Group Name: +(?P<group_name>[\d\S]+)$")
 
         # Configured ACL:
-        p2 = re.compile(r"^Configured ACL:$")
+        p2 = regex_engine.compile(r"^Configured ACL:$")
 
         # Group Name               : getvpn1
-        p3 = re.compile(r"^access-list .*$")
+        p3 = regex_engine.compile(r"^access-list .*$")
 
         # ACL Configured Locally:
-        p4 = re.compile(r"^ACL Configured Locally:.*$")
+        p4 = regex_engine.compile(r"^ACL Configured Locally:.*$")
 
         master_dict = {}
         for line in output.splitlines():
@@ -4241,49 +4239,49 @@ class ShowCryptoGdoiKsMembers(ShowCryptoGdoiKsMembersSchema):
             output = self.device.execute(self.cli_command)
 
         # Number of rekeys sent for group bw-suiteB-v6 : 0
-        p2 = re.compile(r"^Number of rekeys sent for group +(?P<group_name>[\w\d\-]+).*: +(?P<rekeys_sent>\d+)$")
+        p2 = regex_engine.compile(r"^Number of rekeys sent for group +(?P<group_name>[\w\d\-]+).*: +(?P<rekeys_sent>\d+)$")
 
         # Number of retransmits during the last rekey for group bw-suiteB-v6 : 0
-        p3 = re.compile(r"^Number of retransmits.* +(?P<group_name>[\w\d\-]+).*: +(?P<retransmits_num>\d+)$")
+        p3 = regex_engine.compile(r"^Number of retransmits.* +(?P<group_name>[\w\d\-]+).*: +(?P<retransmits_num>\d+)$")
 
         # Duration of the last rekey for group bw-suiteB-v6 : 1 msec
-        p4 = re.compile(r"^Duration.* +(?P<group_name>[\w\d\-]+).*: +(?P<last_rekey_duration>\d+) +msec$")
+        p4 = regex_engine.compile(r"^Duration.* +(?P<group_name>[\w\d\-]+).*: +(?P<last_rekey_duration>\d+) +msec$")
 
         # Group Member ID    : 44.44.44.1  GM Version: 1.0.25
-        p5 = re.compile(r"^Group Member ID.*: +(?P<group_member_id>[\d\.]+).* +GM Version: +(?P<gm_version>[\d\.]+)$")
+        p5 = regex_engine.compile(r"^Group Member ID.*: +(?P<group_member_id>[\d\.]+).* +GM Version: +(?P<gm_version>[\d\.]+)$")
 
         # Group ID          : 2002
-        p6 = re.compile(r"^Group ID.*: +(?P<group_id>[\d\.]+)$")
+        p6 = regex_engine.compile(r"^Group ID.*: +(?P<group_id>[\d\.]+)$")
 
         # Group Name        : bw-suiteB-v6
-        p7 = re.compile(r"^Group Name.*: +(?P<group_name>[\d\S]+)$")
+        p7 = regex_engine.compile(r"^Group Name.*: +(?P<group_name>[\d\S]+)$")
 
         # Group Type        : GDOI (ISAKMP)
-        p8 = re.compile(r"^Group Type.*: +(?P<group_type>[\s\S]+)$")
+        p8 = regex_engine.compile(r"^Group Type.*: +(?P<group_type>[\s\S]+)$")
 
         # GM State          : Registered
-        p9 = re.compile(r"^GM State.*: +(?P<gm_state>[\w]+)$")
+        p9 = regex_engine.compile(r"^GM State.*: +(?P<gm_state>[\w]+)$")
 
         # Key Server ID     : 16.16.16.1
-        p10 = re.compile(r"^Key Server ID.*: +(?P<key_server_id>[\d\.]+)$")
+        p10 = regex_engine.compile(r"^Key Server ID.*: +(?P<key_server_id>[\d\.]+)$")
 
         # Rekeys sent       : 0
-        p11 = re.compile(r"^Rekeys sent.*: +(?P<rekeys_sent>\d+)$")
+        p11 = regex_engine.compile(r"^Rekeys sent.*: +(?P<rekeys_sent>\d+)$")
 
         # Rekeys retries    : 0
-        p12 = re.compile(r"^Rekeys retries.*: +(?P<rekeys_retries>\d+)$")
+        p12 = regex_engine.compile(r"^Rekeys retries.*: +(?P<rekeys_retries>\d+)$")
 
         # Rekey Acks Rcvd   : 0
-        p13 = re.compile(r"^Rekey Acks Rcvd.*: +(?P<rekey_acks_rcvd>\d+)$")
+        p13 = regex_engine.compile(r"^Rekey Acks Rcvd.*: +(?P<rekey_acks_rcvd>\d+)$")
 
         # Rekey Acks missed : 0
-        p14 = re.compile(r"^Rekey Acks missed.*: +(?P<rekey_acks_missed>\d+)$")
+        p14 = regex_engine.compile(r"^Rekey Acks missed.*: +(?P<rekey_acks_missed>\d+)$")
 
         # Sent seq num : 0     0     0     0
-        p15 = re.compile(r"^Sent seq num.*: +(?P<seq1>\d+) +(?P<seq2>\d+) +(?P<seq3>\d+) +(?P<seq4>\d+)$")
+        p15 = regex_engine.compile(r"^Sent seq num.*: +(?P<seq1>\d+) +(?P<seq2>\d+) +(?P<seq3>\d+) +(?P<seq4>\d+)$")
 
         # Rcvd seq num : 0     0     0     0
-        p16 = re.compile(r"^Rcvd seq num.*: +(?P<seq1>\d+) +(?P<seq2>\d+) +(?P<seq3>\d+) +(?P<seq4>\d+)$")
+        p16 = regex_engine.compile(r"^Rcvd seq num.*: +(?P<seq1>\d+) +(?P<seq2>\d+) +(?P<seq3>\d+) +(?P<seq4>\d+)$")
 
         master_dict = {}
         for line in output.splitlines():
@@ -4467,16 +4465,16 @@ class ShowCryptoGdoiKsMembersSummary(ShowCryptoGdoiKsMembersSummarySchema):
             output = self.device.execute(self.cli_command)
 
         # Group Member Information :
-        p1 = re.compile(r"^Group Member Information.*$")
+        p1 = regex_engine.compile(r"^Group Member Information.*$")
 
         # Group Name: bw6000_eft, ID: 1122, Group Members: 2
-        p2 = re.compile(r"^Group Name: +(?P<group_name>[\S]+), +ID: +(?P<group_id>\d+), +Group Members: +(?P<group_members>\d+)$")
+        p2 = regex_engine.compile(r"^Group Name: +(?P<group_name>[\S]+), +ID: +(?P<group_id>\d+), +Group Members: +(?P<group_members>\d+)$")
 
         # Key Server ID: 16.16.16.1, GMDB state: REDUNDANT, Group Members: 1
-        p3 = re.compile(r"^Key Server ID: +(?P<key_server_id>[\d\.]+), +GMDB state: +(?P<gmdb_state>\w+), +Group Members: +(?P<group_members>\d+)$")
+        p3 = regex_engine.compile(r"^Key Server ID: +(?P<key_server_id>[\d\.]+), +GMDB state: +(?P<gmdb_state>\w+), +Group Members: +(?P<group_members>\d+)$")
 
         # 42.42.42.1   1.0.25         0               0
-        p4 = re.compile(r"^(?P<member_id>[\d\.]+) +(?P<version>[\d\.]+) +(?P<rekey_sent>\d+) +(?P<rekey_ack_missed>\d+)$")
+        p4 = regex_engine.compile(r"^(?P<member_id>[\d\.]+) +(?P<version>[\d\.]+) +(?P<rekey_sent>\d+) +(?P<rekey_ack_missed>\d+)$")
 
         master_dict = {}
         for line in output.splitlines():
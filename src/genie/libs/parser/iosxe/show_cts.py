@@ -4,6 +4,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Any
 from genie.parsergen import oper_fill_tabular
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ===================================
 # Schema for:
 #  * 'show cts sxp connections brief'
@@ -91,32 +94,32 @@ class ShowCtsSxpConnectionsBrief(ShowCtsSxpConnectionsBriefSchema):
         # Total num of SXP Connections = 16
 
         #  SXP              : Enabled
-        p1 = re.compile(r"\s(?P<sxp_status>(Disabled|Enabled))")
+        p1 = regex_engine.compile(r"\s(?P<sxp_status>(Disabled|Enabled))")
         #  Highest Version Supported: 4
-        p2 = re.compile(r"\s+(?P<highest_version>\d+)")
+        p2 = regex_engine.compile(r"\s+(?P<highest_version>\d+)")
         #  Default Password : Set
-        p3 = re.compile(r"\s+(?P<default_pw>(Not\s+Set|Set))")
+        p3 = regex_engine.compile(r"\s+(?P<default_pw>(Not\s+Set|Set))")
         #  Default Key-Chain: Not Set
-        p4 = re.compile(r"\s+(?P<key_chain>(Not\s+Set|Set))")
+        p4 = regex_engine.compile(r"\s+(?P<key_chain>(Not\s+Set|Set))")
         #  Default Source IP: 192.168.2.24
-        p5 = re.compile(r"\s+(?P<key_chain_name>(Not\s+Applicable|\S+))")
+        p5 = regex_engine.compile(r"\s+(?P<key_chain_name>(Not\s+Applicable|\S+))")
         #  Default Source IP: 192.168.2.24
-        p6 = re.compile(r"\s+(?P<source_ip>(Not\s+Set|\d+\.\d+\.\d+\.\d+))")
+        p6 = regex_engine.compile(r"\s+(?P<source_ip>(Not\s+Set|\d+\.\d+\.\d+\.\d+))")
         # Connection retry open period: 120 secs
-        p7 = re.compile(r"\s+(?P<conn_retry>\d+)")
+        p7 = regex_engine.compile(r"\s+(?P<conn_retry>\d+)")
         # Reconcile period: 120 secs
-        p8 = re.compile(r"\s+(?P<reconcile_secs>\d+)")
+        p8 = regex_engine.compile(r"\s+(?P<reconcile_secs>\d+)")
         # Peer-Sequence traverse limit for export: Not Set
-        p9 = re.compile(r"\s+(?P<peer_sequence_traverse_limit_for_export>(Not\s+Set|\S+))")
+        p9 = regex_engine.compile(r"\s+(?P<peer_sequence_traverse_limit_for_export>(Not\s+Set|\S+))")
         # Peer-Sequence traverse limit for import: Not Set
-        p10 = re.compile(r"\s+(?P<peer_sequence_traverse_limit_for_import>(Not\s+Set|\S+))")
+        p10 = regex_engine.compile(r"\s+(?P<peer_sequence_traverse_limit_for_import>(Not\s+Set|\S+))")
         # Retry open timer is not running
-        p11 = re.compile(r"Retry\s+open\s+timer\s+is\s+(?P<retry_timer>(not\s+running|running))")
+        p11 = regex_engine.compile(r"Retry\s+open\s+timer\s+is\s+(?P<retry_timer>(not\s+running|running))")
         # 10.100.123.12   192.168.2.24   On                                                   44:18:58:47 (dd:hr:mm:sec)
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"(?P<peer_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<source_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<conn_status>\S+)\s+(?P<duration>\d+:\d+:\d+:\d+)")
         # Total num of SXP Connections = 16
-        p13 = re.compile(r"^Total\s+num\s+of\s+SXP\s+Connections\s+=\s+(?P<total_sxp_connections>\d+)")
+        p13 = regex_engine.compile(r"^Total\s+num\s+of\s+SXP\s+Connections\s+=\s+(?P<total_sxp_connections>\d+)")
 
         # This regex map will be used to split the captured line using ':' as the delimeter
         # if it starts with this string, we will use this regex pattern.
@@ -272,20 +275,20 @@ class ShowCtsPacs(ShowCtsPacsSchema):
         cts_pacs_dict = {}
 
         # AID: 1100E046659D4275B644BF946EFA49CD
-        aid_capture = re.compile(r"^AID:\s+(?P<aid>\S+)")
+        aid_capture = regex_engine.compile(r"^AID:\s+(?P<aid>\S+)")
         #   PAC-type = Cisco Trustsec
-        pac_type_capture = re.compile(r"^PAC-type\s=\s(?P<pac_type>.*$)")
+        pac_type_capture = regex_engine.compile(r"^PAC-type\s=\s(?P<pac_type>.*$)")
         #     I-ID: gw1
-        iid_capture = re.compile(r"^I-ID:\s+(?P<iid>\S+)")
+        iid_capture = regex_engine.compile(r"^I-ID:\s+(?P<iid>\S+)")
         #   A-ID-Info: Identity Services Engine
-        aid_info_capture = re.compile(r"^A-ID-Info:\s+(?P<aid_info>.*$)")
+        aid_info_capture = regex_engine.compile(r"^A-ID-Info:\s+(?P<aid_info>.*$)")
         #   Credential Lifetime: 19:56:32 PDT Sun Sep 06 2020
-        credential_lifetime_capture = re.compile(
+        credential_lifetime_capture = regex_engine.compile(
             r"^Credential\s+Lifetime:\s+(?P<time>\d+:\d+:\d+)\s+(?P<time_zone>\S+)\s+(?P<day>\S+)\s+(?P<month>\S+)\s+(?P<date>\d+)\s+(?P<year>\d+)")
         # PAC - Opaque: 000200B80003000100040010207FCE2A590A44BA0DE959740A348AF00006009C00030100F57E4D71BDE3BD2850B2B63C92E18122000000135EDA996F00093A805A004010F4EDAF81FB6900D03013E907ED81BFB83EE273B8E563BE48DC16B2E9164B1AA6711281937B734E8C449280FCEAF4BE668545B5A55BE20C6346C42AFFCA87FFDDA0AC6A480F9AEE147541EE51FB67CDE0580FD8A746978C78C2CB9E7855BB1667469896AB18902424344AC094B3162EF09488CDB0D6A95139
-        pac_opaque_capture = re.compile(r"^PAC-Opaque:\s+(?P<pac_opaque>.*$)")
+        pac_opaque_capture = regex_engine.compile(r"^PAC-Opaque:\s+(?P<pac_opaque>.*$)")
         # Refresh timer is set for 6w3d
-        refresh_timer_capture = re.compile(r"^Refresh\s+timer\s+is\s+set\s+for\s+(?P<refresh_timer>\S+)")
+        refresh_timer_capture = regex_engine.compile(r"^Refresh\s+timer\s+is\s+set\s+for\s+(?P<refresh_timer>\S+)")
 
         remove_lines = ('PAC-Info:')
 
@@ -462,10 +465,10 @@ class ShowCtsRoleBasedCounters(ShowCtsRoleBasedCountersSchema):
         # 7       0       0          0          0          0          0          0
         # 99      0       0          0          0          0          0          0
 
-        rb_counters_capture = re.compile(r"^(?P<src_group>(\d+|\*))\s+(?P<dst_group>(\d+|\*))\s+"
-                                         r"(?P<sw_denied_count>\d+)\s+(?P<hw_denied_count>\d+)\s+"
-                                         r"(?P<sw_permit_count>\d+)\s+(?P<hw_permit_count>\d+)\s+"
-                                         r"(?P<sw_monitor_count>\d+)\s+(?P<hw_monitor_count>\d+)")
+        rb_counters_capture = regex_engine.compile(r"^(?P<src_group>(\d+|\*))\s+(?P<dst_group>(\d+|\*))\s+"
+                                                   r"(?P<sw_denied_count>\d+)\s+(?P<hw_denied_count>\d+)\s+"
+                                                   r"(?P<sw_permit_count>\d+)\s+(?P<hw_permit_count>\d+)\s+"
+                                                   r"(?P<sw_monitor_count>\d+)\s+(?P<hw_monitor_count>\d+)")
 
         remove_lines = ('Role-based IPv4 counters', 'Role-based IPv6 counters', 'From')
 
@@ -767,216 +770,216 @@ class ShowCts(ShowCtsSchema):
         # Number of Un-Trusted interfaces = 0
 
         # Global Dot1x feature: Disabled
-        p_dot1x = re.compile(r"^Global\s+Dot1x\s+feature:\s+(?P<dot1x>Enabled|Disabled)$")
+        p_dot1x = regex_engine.compile(r"^Global\s+Dot1x\s+feature:\s+(?P<dot1x>Enabled|Disabled)$")
 
         # CTS device identity: "AAA2220Q2DP"
-        p_cts_device = re.compile(r"CTS\s+device\s+identity:\s+\"(?P<cts_identity>\S+)\"$")
+        p_cts_device = regex_engine.compile(r"CTS\s+device\s+identity:\s+\"(?P<cts_identity>\S+)\"$")
 
         # CTS caching support: disabled
-        p_cts_cache = re.compile(r"^CTS\s+caching\s+support:\s+(?P<cts_cache>enabled|disabled)$")
+        p_cts_cache = regex_engine.compile(r"^CTS\s+caching\s+support:\s+(?P<cts_cache>enabled|disabled)$")
 
         # CTS sgt-caching global: Disabled
-        p_cts_sgt = re.compile(r"^CTS\s+sgt-caching\s+global:\s+(?P<cts_sgt>Enabled|Disabled)$")
+        p_cts_sgt = regex_engine.compile(r"^CTS\s+sgt-caching\s+global:\s+(?P<cts_sgt>Enabled|Disabled)$")
 
         # CTS global sgt-caching: Disabled
-        p_cts_2_sgt = re.compile(r"^CTS\s+global\s+sgt-caching:\s+(?P<cts_2_sgt>Enabled|Disabled)$")
+        p_cts_2_sgt = regex_engine.compile(r"^CTS\s+global\s+sgt-caching:\s+(?P<cts_2_sgt>Enabled|Disabled)$")
 
         # CTS Ingress sgt-caching: Disabled
-        p_cts_ingress = re.compile(r"^CTS\s+Ingress\s+sgt-caching:\s+(?P<cts_ingress>Enabled|Disabled)")
+        p_cts_ingress = regex_engine.compile(r"^CTS\s+Ingress\s+sgt-caching:\s+(?P<cts_ingress>Enabled|Disabled)")
 
         # CTS sg-epg translation status: Disabled
-        p_cts_translation = re.compile(r"^CTS\s+sg-epg\s+translation\s+status:\s+(?P<cts_trans>Enabled|Disabled)")
+        p_cts_translation = regex_engine.compile(r"^CTS\s+sg-epg\s+translation\s+status:\s+(?P<cts_trans>Enabled|Disabled)")
 
         # Number of CTS interfaces in MANUAL mode: 0
-        p_man_mode = re.compile(r"^Number\s+of\s+CTS\s+interfaces\s+in\s+MANUAL\s+mode:\s+(?P<man_mode>\d+)$")
+        p_man_mode = regex_engine.compile(r"^Number\s+of\s+CTS\s+interfaces\s+in\s+MANUAL\s+mode:\s+(?P<man_mode>\d+)$")
 
         # Number of CTS interfaces in DOT1X mode:  0,    MANUAL mode: 0
-        p_dot1x_man_mode = re.compile(
+        p_dot1x_man_mode = regex_engine.compile(
         r"^Number\s+of\s+CTS\s+interfaces\s+in\s+DOT1X\s+mode:\s+(?P<dot1x_mode>\d+),\s+MANUAL\s+mode:\s+(?P<man_mode>\d+)$")
 
         # Number of CTS interfaces in LAYER3 TrustSec mode: 0
-        p_l3_mode = re.compile(r"^Number\s+of\s+CTS\s+interfaces\s+in\s+LAYER3\s+TrustSec\s+mode:\s+(?P<l3_mode>\d+)$")
+        p_l3_mode = regex_engine.compile(r"^Number\s+of\s+CTS\s+interfaces\s+in\s+LAYER3\s+TrustSec\s+mode:\s+(?P<l3_mode>\d+)$")
 
         # Number of CTS interfaces in corresponding IFC state
-        p_ifc_state = re.compile(r"^Number\s+of\s+CTS\s+interfaces\s+in\s+corresponding\s+IFC\s+state$")
+        p_ifc_state = regex_engine.compile(r"^Number\s+of\s+CTS\s+interfaces\s+in\s+corresponding\s+IFC\s+state$")
 
         # INIT            state:  0
-        p_init = re.compile(r"^INIT\s+state:\s+(?P<init>\d+)$")
+        p_init = regex_engine.compile(r"^INIT\s+state:\s+(?P<init>\d+)$")
 
         # AUTHENTICATING            state:  0
-        p_authenticating = re.compile(r"^AUTHENTICATING\s+state:\s+(?P<auth>\d+)$")
+        p_authenticating = regex_engine.compile(r"^AUTHENTICATING\s+state:\s+(?P<auth>\d+)$")
 
         # AUTHORIZING            state:  0
-        p_authorizing = re.compile(r"^AUTHORIZING\s+state:\s+(?P<authorizing>\d+)$")
+        p_authorizing = regex_engine.compile(r"^AUTHORIZING\s+state:\s+(?P<authorizing>\d+)$")
 
         # SAP_NEGOTIATING            state:  0
-        p_sap = re.compile(r"^SAP_NEGOTIATING\s+state:\s+(?P<sap>\d+)$")
+        p_sap = regex_engine.compile(r"^SAP_NEGOTIATING\s+state:\s+(?P<sap>\d+)$")
 
         # OPEN            state:  0
-        p_open = re.compile(r"^OPEN\s+state:\s+(?P<open>\d+)$")
+        p_open = regex_engine.compile(r"^OPEN\s+state:\s+(?P<open>\d+)$")
 
         # HELD            state:  0
-        p_held = re.compile(r"^HELD\s+state:\s+(?P<held>\d+)$")
+        p_held = regex_engine.compile(r"^HELD\s+state:\s+(?P<held>\d+)$")
 
         # DISCONNECTING            state:  0
-        p_disconnect = re.compile(r"^DISCONNECTING\s+state:\s+(?P<disconnect>\d+)$")
+        p_disconnect = regex_engine.compile(r"^DISCONNECTING\s+state:\s+(?P<disconnect>\d+)$")
 
         # INVALID            state:  0
-        p_invalid = re.compile(r"^INVALID\s+state:\s+(?P<invalid>\d+)$")
+        p_invalid = regex_engine.compile(r"^INVALID\s+state:\s+(?P<invalid>\d+)$")
 
         # CTS events statistics:
-        p_cts_event = re.compile(r"^CTS\s+events\s+statistics:$")
+        p_cts_event = regex_engine.compile(r"^CTS\s+events\s+statistics:$")
 
         # authentication success: 0
-        p_stat_authentication = re.compile(r"^authentication\s+success:\s+(?P<cts_authentication>\d+)$")
+        p_stat_authentication = regex_engine.compile(r"^authentication\s+success:\s+(?P<cts_authentication>\d+)$")
 
         # authentication reject: 0
-        p_stat_reject = re.compile(r"^authentication\s+reject\s+:\s+(?P<cts_reject>\d+)$")
+        p_stat_reject = regex_engine.compile(r"^authentication\s+reject\s+:\s+(?P<cts_reject>\d+)$")
 
         # authentication failure: 0
-        p_stat_failure = re.compile(r"^authentication\s+failure:\s+(?P<cts_failure>\d+)$")
+        p_stat_failure = regex_engine.compile(r"^authentication\s+failure:\s+(?P<cts_failure>\d+)$")
 
         # authentication logoff: 0
-        p_stat_logoff = re.compile(r"^authentication\s+logoff\s+:\s+(?P<cts_logoff>\d+)$")
+        p_stat_logoff = regex_engine.compile(r"^authentication\s+logoff\s+:\s+(?P<cts_logoff>\d+)$")
 
         # authentication no resp: 0
-        p_stat_noresp = re.compile(r"^authentication\s+no\s+resp:\s+(?P<cts_noresp>\d+)$")
+        p_stat_noresp = regex_engine.compile(r"^authentication\s+no\s+resp:\s+(?P<cts_noresp>\d+)$")
 
         # authorization success: 0
-        p_stat_authorization = re.compile(r"^authorization\s+success\s+:\s+(?P<cts_authorization>\d+)$")
+        p_stat_authorization = regex_engine.compile(r"^authorization\s+success\s+:\s+(?P<cts_authorization>\d+)$")
 
         # authorization failure: 0
-        p_stat_authorization_fail = re.compile(r"^authorization\s+failure\s+:\s+(?P<cts_authorization_fail>\d+)$")
+        p_stat_authorization_fail = regex_engine.compile(r"^authorization\s+failure\s+:\s+(?P<cts_authorization_fail>\d+)$")
 
         # sap success: 0
-        p_stat_sap = re.compile(r"^sap\s+success\s+:\s+(?P<cts_sap>\d+)$")
+        p_stat_sap = regex_engine.compile(r"^sap\s+success\s+:\s+(?P<cts_sap>\d+)$")
 
         # sap failure: 0
-        p_stat_sap_failure = re.compile(r"^sap\s+failure\s+:\s+(?P<cts_sap_failure>\d+)$")
+        p_stat_sap_failure = regex_engine.compile(r"^sap\s+failure\s+:\s+(?P<cts_sap_failure>\d+)$")
 
         # port auth failure: 0
-        p_port_fail = re.compile(r"^port\s+auth\s+failure\s+:\s+(?P<port_fail>\d+)$")
+        p_port_fail = regex_engine.compile(r"^port\s+auth\s+failure\s+:\s+(?P<port_fail>\d+)$")
 
         # Installed list: CTSServerList1-0085, 1 server(s):
-        p_installed_list = re.compile(r"^Installed\s+list:\s+(?P<serv_list_name>\S+),\s+(?P<serv_count>\d+)\s+server\(s\):$")
+        p_installed_list = regex_engine.compile(r"^Installed\s+list:\s+(?P<serv_list_name>\S+),\s+(?P<serv_count>\d+)\s+server\(s\):$")
 
         # *Server: 10.100.123.1, port 1812, A-ID A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A
-        p_server_ast = re.compile(r"^\*Server:\s+(?P<serv_ip>[^,]+),\s+port\s+(?P<serv_port>\d+),\s+A-ID\s+(?P<serv_id>\S+)$")
+        p_server_ast = regex_engine.compile(r"^\*Server:\s+(?P<serv_ip>[^,]+),\s+port\s+(?P<serv_port>\d+),\s+A-ID\s+(?P<serv_id>\S+)$")
 
         # Server: 10.100.123.1, port 1812, A-ID A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A
-        p_server = re.compile(r"^Server:\s+(?P<serv_ip>[^,]+),\s+port\s+(?P<serv_port>\d+),\s+A-ID\s+(?P<serv_id>\S+)$")
+        p_server = regex_engine.compile(r"^Server:\s+(?P<serv_ip>[^,]+),\s+port\s+(?P<serv_port>\d+),\s+A-ID\s+(?P<serv_id>\S+)$")
 
         # Status = ALIVE
-        p_server_status = re.compile(r"^Status\s+=\s+(?P<serv_status>\S+)")
+        p_server_status = regex_engine.compile(r"^Status\s+=\s+(?P<serv_status>\S+)")
 
         # auto-test = FALSE, keywrap-enable = FALSE, idle-time = 60 mins, deadtime = 20 secs
-        p_server_attributes = re.compile(
+        p_server_attributes = regex_engine.compile(
         r"^auto-test\s+=\s+(?P<test>[^,]+),\s+keywrap-enable\s+=\s+(?P<keywrap>[^,]+),\s+idle-time\s+=\s+(?P<idle>\d+)\s+mins,\s+deadtime\s+=\s+(?P<dead>\d+)\s+secs$")
 
         # ===================
-        p_equal_header = re.compile(r"^=+")
+        p_equal_header = regex_engine.compile(r"^=+")
 
         # CTS PAC Summary
-        p_header_1 = re.compile(r"^CTS\s+PAc\s+Summary$")
+        p_header_1 = regex_engine.compile(r"^CTS\s+PAc\s+Summary$")
 
         # PAC-Info:
-        p_pac_header = re.compile(r"^PAC-Info:$")
+        p_pac_header = regex_engine.compile(r"^PAC-Info:$")
 
         # PAC Valid Until: 09:24:04 UTC Oct 10 2020
-        p_pac_valid = re.compile(r"^PAC\s+Valid\s+Until:\s+(?P<valid>.*)")
+        p_pac_valid = regex_engine.compile(r"^PAC\s+Valid\s+Until:\s+(?P<valid>.*)")
 
         # CTS Environment-Data Summary
-        p_environment_header = re.compile(r"^CTS\s+Environment-Data\s+Summary$")
+        p_environment_header = regex_engine.compile(r"^CTS\s+Environment-Data\s+Summary$")
 
         # Environment Data Last Received: 09:26:17 UTC Tue Jul 14 2020
-        p_env_last = re.compile(r"^Environment\s+Data\s+Last\s+Received:\s+(?P<last>.*)$")
+        p_env_last = regex_engine.compile(r"^Environment\s+Data\s+Last\s+Received:\s+(?P<last>.*)$")
 
         # Environment Data Valid Until: 0:16:13:37 (dd:hr:mm:sec)
-        p_env_valid = re.compile(r"^Environment\s+Data\s+Valid\s+Until:\s+(?P<value>\S+)\s+\((?P<format>[^)]+)\)$")
+        p_env_valid = regex_engine.compile(r"^Environment\s+Data\s+Valid\s+Until:\s+(?P<value>\S+)\s+\((?P<format>[^)]+)\)$")
 
         # SXP Connections Summary
-        p_sxp_summary = re.compile(r"^SXP\s+Connections\s+Summary$")
+        p_sxp_summary = regex_engine.compile(r"^SXP\s+Connections\s+Summary$")
 
         # SXP              : Enabled
-        p_sxp_enabled = re.compile(r"SXP\s+:\s+(?P<status>Enabled|Disabled)$")
+        p_sxp_enabled = regex_engine.compile(r"SXP\s+:\s+(?P<status>Enabled|Disabled)$")
 
         # Highest Version Supported: 4
-        p_sxp_version = re.compile(r"^Highest\s+Version\s+Supported:\s+(?P<version>\d+)")
+        p_sxp_version = regex_engine.compile(r"^Highest\s+Version\s+Supported:\s+(?P<version>\d+)")
 
         # Default Password : Set
-        p_sxp_password = re.compile(r"^Default\s+Password\s+:\s+(?P<pass>.*)$")
+        p_sxp_password = regex_engine.compile(r"^Default\s+Password\s+:\s+(?P<pass>.*)$")
 
         # Default Key-Chain: Not Set
-        p_sxp_key_chain = re.compile(r"^Default\s+Key-Chain:\s+(?P<key>.*)$")
+        p_sxp_key_chain = regex_engine.compile(r"^Default\s+Key-Chain:\s+(?P<key>.*)$")
 
         # Default Key-Chain Name: Not Applicable
-        p_sxp_key_chain_name = re.compile(r"^Default\s+Key-Chain\s+Name:\s+(?P<name>.*)$")
+        p_sxp_key_chain_name = regex_engine.compile(r"^Default\s+Key-Chain\s+Name:\s+(?P<name>.*)$")
 
         # Default Source IP: Not Set
-        p_sxp_source = re.compile(r"Default\s+Source\s+IP:\s+(?P<ip>.*)$")
+        p_sxp_source = regex_engine.compile(r"Default\s+Source\s+IP:\s+(?P<ip>.*)$")
 
         # Connection retry open period: 120 secs
-        p_sxp_retry = re.compile(r"^Connection\s+retry\s+open\s+period:\s+(?P<time>\d+)\s+secs$")
+        p_sxp_retry = regex_engine.compile(r"^Connection\s+retry\s+open\s+period:\s+(?P<time>\d+)\s+secs$")
 
         # Reconcile period: 120 secs
-        p_reconcile = re.compile(r"^Reconcile\s+period:\s+(?P<period>\d+)\s+secs$")
+        p_reconcile = regex_engine.compile(r"^Reconcile\s+period:\s+(?P<period>\d+)\s+secs$")
 
         # Retry open timer is not running
-        p_open_timer = re.compile(r"^Retry\s+open\s+timer\s+is\s+not\s+running$")
+        p_open_timer = regex_engine.compile(r"^Retry\s+open\s+timer\s+is\s+not\s+running$")
 
         # Peer-Sequence traverse limit for export: Not Set
-        p_limit_export = re.compile(r"^Peer-Sequence\s+traverse\s+limit\s+for\s+export:\s+(?P<export>.*)$")
+        p_limit_export = regex_engine.compile(r"^Peer-Sequence\s+traverse\s+limit\s+for\s+export:\s+(?P<export>.*)$")
 
         # Peer-Sequence traverse limit for import: Not Set
-        p_limit_import = re.compile(r"^Peer-Sequence\s+traverse\s+limit\s+for\s+import:\s+(?P<import>.*)$")
+        p_limit_import = regex_engine.compile(r"^Peer-Sequence\s+traverse\s+limit\s+for\s+import:\s+(?P<import>.*)$")
 
         # There are no SXP Connections.
-        p_sxp_no_conn = re.compile(r"^There\s+are\s+no\s+SXP\s+Connections.$")
+        p_sxp_no_conn = regex_engine.compile(r"^There\s+are\s+no\s+SXP\s+Connections.$")
 
         # ----------------------------------------------------------------------------------------------------------------------------------
-        p_hyphen_header = re.compile(r"^-+$")
+        p_hyphen_header = regex_engine.compile(r"^-+$")
 
         # Peer_IP          Source_IP        Conn Status                                          Duration
-        p_sxp_conn_header = re.compile(r"^Peer_IP\s+Source_IP\s+\s+Conn\s+Status\s+Duration$")
+        p_sxp_conn_header = regex_engine.compile(r"^Peer_IP\s+Source_IP\s+\s+Conn\s+Status\s+Duration$")
 
         # 10.100.123.1     192.168.2.24   On                                                   44:19:54:57 (dd:hr:mm:sec)
-        p_sxp_conn = re.compile(r"^(?P<peer_ip>\S+)\s+(?P<source_ip>\S+)\s+(?P<conn_status>\S+)\s+(?P<dur_val>\S+)\s+\((?P<dur_format>[^)]+)\)$")
+        p_sxp_conn = regex_engine.compile(r"^(?P<peer_ip>\S+)\s+(?P<source_ip>\S+)\s+(?P<conn_status>\S+)\s+(?P<dur_val>\S+)\s+\((?P<dur_format>[^)]+)\)$")
 
         # Total num of SXP Connections = 16
-        p_sxp_total = re.compile(r"^Total\s+num\s+of\s+SXP\s+Connections\s+=\s+(?P<total>\d+)$")
+        p_sxp_total = regex_engine.compile(r"^Total\s+num\s+of\s+SXP\s+Connections\s+=\s+(?P<total>\d+)$")
 
         # Summary of IPv4 & IPv6 IP-SGT bindings
-        p_sum_ip_sgt = re.compile(r"^Summary\s+of\s+IPv4\s+&\s+IPv6\s+IP-SGT\s+bindings$")
+        p_sum_ip_sgt = regex_engine.compile(r"^Summary\s+of\s+IPv4\s+&\s+IPv6\s+IP-SGT\s+bindings$")
 
         # -IPv4-
-        p_ipv4_header = re.compile(r"^-IPv4-$")
+        p_ipv4_header = regex_engine.compile(r"^-IPv4-$")
 
         # IP-SGT Active Bindings Summary
-        p_ip_sgt_active_header = re.compile(r"^IP-SGT\s+Active\s+Bindings\s+Summary$")
+        p_ip_sgt_active_header = regex_engine.compile(r"^IP-SGT\s+Active\s+Bindings\s+Summary$")
 
         # Total number of SXP      bindings = 3284
-        p_total_sxp = re.compile(r"^Total\s+number\s+of\s+SXP\s+bindings\s+=\s+(?P<total>\d+)$")
+        p_total_sxp = regex_engine.compile(r"^Total\s+number\s+of\s+SXP\s+bindings\s+=\s+(?P<total>\d+)$")
 
         # Total number of active   bindings = 3284
-        p_total_active_sxp = re.compile(r"^Total\s+number\s+of\s+active\s+bindings\s+=\s+(?P<active>\d+)$")
+        p_total_active_sxp = regex_engine.compile(r"^Total\s+number\s+of\s+active\s+bindings\s+=\s+(?P<active>\d+)$")
 
         # -IPv6-
-        p_ipv6_header = re.compile(r"^-IPv6-$")
+        p_ipv6_header = regex_engine.compile(r"^-IPv6-$")
 
         # CTS Role Based Enforcement: Enabled
-        p_role_based = re.compile(r"^CTS\s+Role\s+Based\s+Enforcement:\s+(?P<value>Enabled|Disabled)$")
+        p_role_based = regex_engine.compile(r"^CTS\s+Role\s+Based\s+Enforcement:\s+(?P<value>Enabled|Disabled)$")
 
         # CTS Role Based VLAN Enforcement:Enabled
-        p_role_based_vlan = re.compile(r"^CTS\s+Role\s+Based\s+VLAN\s+Enforcement:(?P<value>Enabled|Disabled)$")
+        p_role_based_vlan = regex_engine.compile(r"^CTS\s+Role\s+Based\s+VLAN\s+Enforcement:(?P<value>Enabled|Disabled)$")
 
         # Trusted/Un-Trusted Links
-        p_links_header = re.compile(r"^Trusted\/Un-Trusted\s+Links$")
+        p_links_header = regex_engine.compile(r"^Trusted\/Un-Trusted\s+Links$")
 
         # Number of Trusted interfaces = 0
-        p_trusted_links = re.compile(r"^Number\s+of\s+Trusted\s+interfaces\s+=\s+(?P<count>\d+)$")
+        p_trusted_links = regex_engine.compile(r"^Number\s+of\s+Trusted\s+interfaces\s+=\s+(?P<count>\d+)$")
 
         # Number of Un-Trusted interfaces = 0
-        p_untrusted_links = re.compile(r"^Number\s+of\s+Un-Trusted\s+interfaces\s+=\s+(?P<count>\d+)$")
+        p_untrusted_links = regex_engine.compile(r"^Number\s+of\s+Un-Trusted\s+interfaces\s+=\s+(?P<count>\d+)$")
 
         def update_bindings(active_bindings, cts_dict):
             if len(active_bindings) == 2:
@@ -1468,39 +1471,39 @@ class ShowCtsEnvironmentData(ShowCtsEnvironmentDataSchema):
         # State Machine is running
 
         # Current state = COMPLETE
-        current_state_capture = re.compile(r"^Current\s+state\s+=\s+(?P<state>.*$)")
+        current_state_capture = regex_engine.compile(r"^Current\s+state\s+=\s+(?P<state>.*$)")
         # Last status = Successful
-        last_status_capture = re.compile(r"^Last\s+status\s+=\s+(?P<last_status>.*$)")
+        last_status_capture = regex_engine.compile(r"^Last\s+status\s+=\s+(?P<last_status>.*$)")
         #   SGT tag = 0-16:Unknown
-        tags_capture = re.compile(r"^SGT\s+tag\s+=\s+(?P<sgt_tags>\d+-\d+):(?P<tag_status>\w+)")
+        tags_capture = regex_engine.compile(r"^SGT\s+tag\s+=\s+(?P<sgt_tags>\d+-\d+):(?P<tag_status>\w+)")
         # Installed list: CTSServerList1-0089, 4 server(s):
-        server_list_capture = re.compile(
+        server_list_capture = regex_engine.compile(
             r"^Installed\s+list:\s+(?P<server_list_name>\S+),\s+(?P<server_count>\d+)\s+server\(s\):", re.MULTILINE)
         #  *Server: 10.1.100.4, port 1812, A-ID A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A1A
-        servers_capture = re.compile(
+        servers_capture = regex_engine.compile(
             r"^(\*|)Server:\s+(?P<server_ip>\d+\.\d+\.\d+\.\d+),\s+port\s+(?P<port>\d+),\s+A-ID\s+(?P<aid>\S+)")
         #           Status = ALIVE
-        server_status_capture = re.compile(r"^Status\s+=\s+(?P<server_status>\S+)")
+        server_status_capture = regex_engine.compile(r"^Status\s+=\s+(?P<server_status>\S+)")
         #           auto-test = FALSE, keywrap-enable = FALSE, idle-time = 60 mins, deadtime = 20 secs
-        keywrap_capture = re.compile(
+        keywrap_capture = regex_engine.compile(
             r"^auto-test\s+=\s+(?P<auto_test>(TRUE|FALSE)),\s+keywrap-enable\s+=\s+(?P<keywrap_enable>(TRUE|FALSE)),\s+idle-time\s+=\s+(?P<idle_time_mins>\d+)\s+mins,\s+deadtime\s+=\s+(?P<dead_time_secs>\d+)\s+secs")
         #     0-15:Unit0
-        sec_group_capture = re.compile(r"^(?P<sec_group>\S+):(?P<sec_group_name>\S+)")
+        sec_group_capture = regex_engine.compile(r"^(?P<sec_group>\S+):(?P<sec_group_name>\S+)")
         # Environment Data Lifetime = 86400 secs
-        env_data_capture = re.compile(r"^Environment\s+Data\s+Lifetime\s+=\s+(?P<env_data_lifetime_secs>\d+)\s+secs")
+        env_data_capture = regex_engine.compile(r"^Environment\s+Data\s+Lifetime\s+=\s+(?P<env_data_lifetime_secs>\d+)\s+secs")
         # Last update time = 20:04:42 PDT Tue Jul 21 2020
-        last_update_capture = re.compile(
+        last_update_capture = regex_engine.compile(
             r"^Last\s+update\s+time\s+=\s+(?P<time>\d+:\d+:\d+)\s+(?P<time_zone>\w+)\s+(?P<day>\S+)\s+(?P<month>\S+)\s+(?P<date>\d+)\s+(?P<year>\d+)")
         # Env-data expires in   0:00:46:51 (dd:hr:mm:sec)
-        expiration_capture = re.compile(r"^Env-data\s+expires\s+in\s+(?P<expiration>\d+:\d+:\d+:\d+)\s+\S+")
+        expiration_capture = regex_engine.compile(r"^Env-data\s+expires\s+in\s+(?P<expiration>\d+:\d+:\d+:\d+)\s+\S+")
         # Env-data refreshes in 0:00:46:51 (dd:hr:mm:sec)
-        refresh_capture = re.compile(r"^Env-data\s+refreshes\s+in\s+(?P<refresh>\d+:\d+:\d+:\d+)\s+\S+")
+        refresh_capture = regex_engine.compile(r"^Env-data\s+refreshes\s+in\s+(?P<refresh>\d+:\d+:\d+:\d+)\s+\S+")
         # Cache data applied           = NONE
-        cache_data_capture = re.compile(r"^Cache\s+data\s+applied\s+=\s+(?P<cache_data_status>\S+)")
+        cache_data_capture = regex_engine.compile(r"^Cache\s+data\s+applied\s+=\s+(?P<cache_data_status>\S+)")
         # State Machine is running
-        state_machine_capture = re.compile(r"^State\s+Machine\s+is\s+(?P<state_machine_status>\S+)")
+        state_machine_capture = regex_engine.compile(r"^State\s+Machine\s+is\s+(?P<state_machine_status>\S+)")
         # Retry_timer (60 secs) is not running
-        retry_capture = re.compile(
+        retry_capture = regex_engine.compile(
             r"^Retry_timer\s+\((?P<retry_timer_secs>\d+)\s+secs\)\s+is\s+(?P<retry_timer_status>.*$)")
 
         remove_lines = (
@@ -1756,15 +1759,15 @@ class ShowCtsRbacl(ShowCtsRbaclSchema):
 
 
         # RBACL IP Version Supported: IPv4 & IPv6
-        ip_ver_capture = re.compile(r"^RBACL\s+IP\s+Version\s+Supported:\s(?P<ip_ver_support>.*$)")
+        ip_ver_capture = regex_engine.compile(r"^RBACL\s+IP\s+Version\s+Supported:\s(?P<ip_ver_support>.*$)")
         #   name   = TCP_13131-01
         #   IP protocol version = IPV4
         #   refcnt = 2
         #   flag   = 0x41000000
         #   stale  = FALSE
-        rbacl_capture = re.compile(r"^(?P<rbacl_key>.*)(?==)=\s+(?P<rbacl_value>.*$)")
+        rbacl_capture = regex_engine.compile(r"^(?P<rbacl_key>.*)(?==)=\s+(?P<rbacl_value>.*$)")
         #     permit tcp dst eq 13131
-        rbacl_ace_capture = re.compile(
+        rbacl_ace_capture = regex_engine.compile(
             r"^(?P<action>(permit|deny))\s+(?P<protocol>\S+)(\s+(?P<direction>dst|src)\s+((?P<port_condition>)\S+)\s+(?P<port>\d+)|)")
 
         remove_lines = ('CTS RBACL Policy', '================', 'RBACL ACEs:')
@@ -1932,27 +1935,27 @@ class ShowCtsRoleBasedPermissions(ShowCtsRoleBasedPermissionsSchema):
 
         # IPv4 Role-based permissions default:
         # IPv4 Role-based permissions default (configured):
-        p1 = re.compile(r"^(IPv4|IPv6)\s+Role-based\s+permissions\s+(?P<default_group>default).*:$")
+        p1 = regex_engine.compile(r"^(IPv4|IPv6)\s+Role-based\s+permissions\s+(?P<default_group>default).*:$")
         
         # IPv4 Role-based permissions from group 42:Untrusted to group Unknown:
         # IPv4 Role-based permissions from group Unknown to group 100 (configured):
         # IPv4 Role-based permissions from group 100 to group 200 (configured):
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(IPv4|IPv6)\s+Role-based\s+permissions\s+from\s+group\s+(?P<src_grp_id>\d+)?:?(?P<src_grp_name>\S+)?\s+to\s+group\s((?P<unknown_group>Unknown)|(?P<dst_group_id>\d+)(:(?P<dst_group_name>\S+))?).*:$")
         
         # ACCESS-01
         # SGACL_PERMIT_IPv6
-        p3 = re.compile(r"^(?P<policy_group>\S+)$")
+        p3 = regex_engine.compile(r"^(?P<policy_group>\S+)$")
 
         #         Deny IP-00
-        p4 = re.compile(r"^(?P<action_policy>(Permit|Deny))\s+(?P<action_policy_group>\S+)$")
+        p4 = regex_engine.compile(r"^(?P<action_policy>(Permit|Deny))\s+(?P<action_policy_group>\S+)$")
         
         # RBACL Monitor All for Dynamic Policies : FALSE
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^RBACL\s+Monitor\s+All\s+for\s+Dynamic\s+Policies\s+:\s+(?P<monitor_dynamic>(TRUE|FALSE))$")
         
         #RBACL Monitor All for Configured Policies : FALSE
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^RBACL\s+Monitor\s+All\s+for\s+Configured\s+Policies\s+:\s+(?P<monitor_configured>(TRUE|FALSE))$")
 
         # Index value for each policy group which will increment as it matches a new policy group
@@ -2069,19 +2072,19 @@ class ShowCtsWirelessProfilePolicy(ShowCtsWirelessProfilePolicySchema):
 
 
         # Policy Profile Name         		: xyz-policy
-        p_profile_name = re.compile(r"^Policy\s+Profile\s+Name\s+:\s+(?P<value>\S+)$")
+        p_profile_name = regex_engine.compile(r"^Policy\s+Profile\s+Name\s+:\s+(?P<value>\S+)$")
 
         # CTS
-        p_cts_section = re.compile(r"^CTS$")
+        p_cts_section = regex_engine.compile(r"^CTS$")
 
         # Role-based enforcement         : ENABLED
-        p_role_based = re.compile(r"^Role-based\s+enforcement\s+:\s+(?P<value>\S+)$")
+        p_role_based = regex_engine.compile(r"^Role-based\s+enforcement\s+:\s+(?P<value>\S+)$")
 
         # Inline-tagging                 : DISABLED
-        p_inline = re.compile(r"^Inline-tagging\s+:\s+(?P<value>\S+)$")
+        p_inline = regex_engine.compile(r"^Inline-tagging\s+:\s+(?P<value>\S+)$")
 
         # Default SGT		         : NOT-DEFINED
-        p_sgt = re.compile(r"^Default\s+SGT\s+:\s+(?P<value>\S+)$")
+        p_sgt = regex_engine.compile(r"^Default\s+SGT\s+:\s+(?P<value>\S+)$")
 
 
 
@@ -2163,16 +2166,16 @@ class ShowCtsApSgtInfo(ShowCtsApSgtInfoSchema):
         # DEFAULT(65535)    NO                     0
 
         # Number of SGTs referred by the AP...............: 0
-        p_number_sgts = re.compile(r"^Number\s+of\s+SGTs\s+referred\s+by\s+the\s+AP\.+:\s+(?P<value>\d+)$")
+        p_number_sgts = regex_engine.compile(r"^Number\s+of\s+SGTs\s+referred\s+by\s+the\s+AP\.+:\s+(?P<value>\d+)$")
 
         # SGT               PolicyPushedToAP       No.of Clients
-        p_sgt_header = re.compile(r"^SGT\s+PolicyPushedToAP\s+No.of\s+Clients$")
+        p_sgt_header = regex_engine.compile(r"^SGT\s+PolicyPushedToAP\s+No.of\s+Clients$")
 
         # ------------------------------------------------------------
-        p_sgt_delimiter = re.compile(r"^-+$")
+        p_sgt_delimiter = regex_engine.compile(r"^-+$")
 
         # 10                NO                     1
-        p_sgt_row = re.compile(r"^(?P<sgt>\S+)\s+(?P<policy>\S+)\s+(?P<clients>\d+)$")
+        p_sgt_row = regex_engine.compile(r"^(?P<sgt>\S+)\s+(?P<policy>\S+)\s+(?P<clients>\d+)$")
 
         cts_ap_dict = {}
 
@@ -2284,86 +2287,86 @@ class ShowCtsInterface(ShowCtsInterfaceSchema):
         ret_dict = {}
 
         # Global Dot1x feature is Disabled
-        p1 = re.compile(r'^Global Dot1x feature is\s+(?P<global_dot1x_feature>\w+)')
+        p1 = regex_engine.compile(r'^Global Dot1x feature is\s+(?P<global_dot1x_feature>\w+)')
 
         # TenGigabitEthernet1/0/6:
         # Tunnel100: 
         # TenGigabitEthernet1/0/6.30:
-        p2 = re.compile(r'^Interface\s+(?P<interface>\S+\d+\/\d+\/\d+|(Tunnel|Port-channel)\d+|\S+\d+\/\d+\/\d+\.\d+):')
+        p2 = regex_engine.compile(r'^Interface\s+(?P<interface>\S+\d+\/\d+\/\d+|(Tunnel|Port-channel)\d+|\S+\d+\/\d+\/\d+\.\d+):')
 
         # CTS_status : enabled,mode: MANUAL
-        p3 = re.compile(r'^CTS\s+is\s+(?P<cts_status>\S+)(\.|,\s+mode:\s+(?P<mode>\S+))')
+        p3 = regex_engine.compile(r'^CTS\s+is\s+(?P<cts_status>\S+)(\.|,\s+mode:\s+(?P<mode>\S+))')
 
         # IFC state: OPEN
-        p4 = re.compile(r'^IFC state:\s+(?P<ifc_state>\S+)')
+        p4 = regex_engine.compile(r'^IFC state:\s+(?P<ifc_state>\S+)')
 
         # Intf_active_for: 00:29:30.798
-        p5 = re.compile(r'^Interface Active for\s+(?P<intf_active_for>\d+:\d+:\d+.\d+)')
+        p5 = regex_engine.compile(r'^Interface Active for\s+(?P<intf_active_for>\d+:\d+:\d+.\d+)')
 
         # Authentication Status:   NOT APPLICABLE
-        p6 = re.compile(r'^Authentication Status:\s+(?P<status>\w+(?:\s+)?\w+)$')
+        p6 = regex_engine.compile(r'^Authentication Status:\s+(?P<status>\w+(?:\s+)?\w+)$')
 
         # Peer_identity:       "unknown"
-        p7 = re.compile(r'^Peer identity:\s+\W(?P<peer_identity>(?:\w+)?)\W')
+        p7 = regex_engine.compile(r'^Peer identity:\s+\W(?P<peer_identity>(?:\w+)?)\W')
 
         # Peer's advertised capabilities: ""
-        p8 = re.compile(r"^Peer's advertised capabilities:\s+\W(?P<peer_advertised_capabilities>(?:\w+)?)\W")
+        p8 = regex_engine.compile(r"^Peer's advertised capabilities:\s+\W(?P<peer_advertised_capabilities>(?:\w+)?)\W")
 
         # Authorization Status:    SUCCEEDED
-        p9 = re.compile(r'^Authorization Status:\s+(?P<status>\w+(?:\s+)?\w+)$')
+        p9 = regex_engine.compile(r'^Authorization Status:\s+(?P<status>\w+(?:\s+)?\w+)$')
 
         # Peer_SGT:            2000
-        p10 = re.compile(r'^Peer SGT:\s+(?P<peer_sgt>\d+)')
+        p10 = regex_engine.compile(r'^Peer SGT:\s+(?P<peer_sgt>\d+)')
 
         # Peer SGT assignment: Trusted
-        p11 = re.compile(r'^Peer SGT assignment:\s+(?P<peer_sgt_assignment>\w+)')
+        p11 = regex_engine.compile(r'^Peer SGT assignment:\s+(?P<peer_sgt_assignment>\w+)')
 
         # SAP Status:              NOT APPLICABLE
-        p12 = re.compile(r'^SAP Status:\s+(?P<sap_status>\w+(?:\s+)?\w+)$')
+        p12 = regex_engine.compile(r'^SAP Status:\s+(?P<sap_status>\w+(?:\s+)?\w+)$')
 
         # Propagate_SGT: Enabled
-        p13 = re.compile(r'^Propagate SGT:\s+(?P<propagate_sgt>\S+)')
+        p13 = regex_engine.compile(r'^Propagate SGT:\s+(?P<propagate_sgt>\S+)')
 
         # Expiration            : N/A
-        p14 = re.compile(r'^Expiration\s+:\s+(?P<expiration>\S+)')
+        p14 = regex_engine.compile(r'^Expiration\s+:\s+(?P<expiration>\S+)')
 
         # Cache applied to link : NONE
-        p15 = re.compile(r'Cache applied to link\s+:\s+(?P<cache_applied_to_link>\S+)')
+        p15 = regex_engine.compile(r'Cache applied to link\s+:\s+(?P<cache_applied_to_link>\S+)')
 
         # authc success:              0
-        p16 = re.compile(r'^authc success:\s+(?P<authc_success>\d+)')
+        p16 = regex_engine.compile(r'^authc success:\s+(?P<authc_success>\d+)')
 
         # authc reject:               0
-        p17 = re.compile(r'^authc reject:\s+(?P<authc_reject>\d+)')
+        p17 = regex_engine.compile(r'^authc reject:\s+(?P<authc_reject>\d+)')
 
         # authc failure:              0
-        p18 = re.compile(r'^authc failure:\s+(?P<authc_failure>\d+)')
+        p18 = regex_engine.compile(r'^authc failure:\s+(?P<authc_failure>\d+)')
 
         # authc no response:          0
-        p19 = re.compile(r'^authc no response:\s+(?P<authc_no_response>\d+)')
+        p19 = regex_engine.compile(r'^authc no response:\s+(?P<authc_no_response>\d+)')
 
         # authc logoff:               0
-        p20 = re.compile(r'^authc logoff:\s+(?P<authc_logoff>\d+)')
+        p20 = regex_engine.compile(r'^authc logoff:\s+(?P<authc_logoff>\d+)')
 
         # sap success:                0
-        p21 = re.compile(r'^sap success:\s+(?P<sap_success>\d+)')
+        p21 = regex_engine.compile(r'^sap success:\s+(?P<sap_success>\d+)')
 
         # sap fail:                   0
-        p22 = re.compile(r'^sap fail:\s+(?P<sap_fail>\d+)')
+        p22 = regex_engine.compile(r'^sap fail:\s+(?P<sap_fail>\d+)')
 
         # authz success:              0
-        p23 = re.compile(r'^authz success:\s+(?P<authz_success>\d+)')
+        p23 = regex_engine.compile(r'^authz success:\s+(?P<authz_success>\d+)')
 
         # authz fail:                 0
-        p24 = re.compile(r'^authz fail:\s+(?P<authz_fail>\d+)')
+        p24 = regex_engine.compile(r'^authz fail:\s+(?P<authz_fail>\d+)')
 
         # port auth fail:             0
-        p25 = re.compile(r'^port auth fail:\s+(?P<port_auth_fail>\d+)')
+        p25 = regex_engine.compile(r'^port auth fail:\s+(?P<port_auth_fail>\d+)')
 
         # L3_IPM:   disabled.
-        p26 = re.compile(r'^L3 IPM:\s+(?P<l3_ipm>\S+).')
+        p26 = regex_engine.compile(r'^L3 IPM:\s+(?P<l3_ipm>\S+).')
 
-        p27 = re.compile(r'Index\s+:\s+(?P<index>\d+)\s+Vlan\s+:\s+(?P<vlan>\d+)\s+SGT\s+:\s+(?P<sgt>\d+)')
+        p27 = regex_engine.compile(r'Index\s+:\s+(?P<index>\d+)\s+Vlan\s+:\s+(?P<vlan>\d+)\s+SGT\s+:\s+(?P<sgt>\d+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2660,11 +2663,11 @@ class ShowCtsRoleBasedSgtMapAll(ShowCtsRoleBasedSgtMapAllSchema):
 
         # Active IPv4-SGT Bindings Information
         # Active IPv6-SGT Bindings Information
-        p0 = re.compile(r'^Active\s+(?P<sgt_type>([\w\-\s]+))\s+Information$')
+        p0 = regex_engine.compile(r'^Active\s+(?P<sgt_type>([\w\-\s]+))\s+Information$')
 
         # 1.1.1.2 2 SXP
         # 1.1.1.3 3 SXP
-        p1 = re.compile(r'^(?P<ip_address>(\S+))\s+(?P<sgt>(\d+))\s+(?P<source>(\w+))$')
+        p1 = regex_engine.compile(r'^(?P<ip_address>(\S+))\s+(?P<sgt>(\d+))\s+(?P<source>(\w+))$')
 
         # Total number of SXP bindings = 51
         # Total number of active bindings = 51
@@ -2672,7 +2675,7 @@ class ShowCtsRoleBasedSgtMapAll(ShowCtsRoleBasedSgtMapAllSchema):
         # Total number of active bindings = 2
         # Total number of L3IF     bindings = 2
         # Total number of VLAN     bindings = 1
-        p2 = re.compile(r'^Total\s+number\s+of\s+(?P<binding_type>(\S+))\s+bindings\s+=\s+(?P<binding_count>(\d+))$')
+        p2 = regex_engine.compile(r'^Total\s+number\s+of\s+(?P<binding_type>(\S+))\s+bindings\s+=\s+(?P<binding_count>(\d+))$')
         for line in output.splitlines():
             line = line.strip()
 
@@ -2772,55 +2775,55 @@ class ShowCtsSxpConnections(ShowCtsSxpConnectionsSchema):
         result_dict = {}
 
         #  SXP              : Enabled
-        p1 = re.compile(r"^SXP\s+:\s+(?P<sxp_status>(Disabled|Enabled))$")
+        p1 = regex_engine.compile(r"^SXP\s+:\s+(?P<sxp_status>(Disabled|Enabled))$")
         #  Highest Version Supported: 4
-        p2 = re.compile(r"^Highest\s+Version\s+Supported:\s+(?P<highest_version>\d+)$")
+        p2 = regex_engine.compile(r"^Highest\s+Version\s+Supported:\s+(?P<highest_version>\d+)$")
         #  Default Password : Set
-        p3 = re.compile(r"^Default\s+Password\s+:\s+(?P<default_pwd>(Not\s+Set|Set))$")
+        p3 = regex_engine.compile(r"^Default\s+Password\s+:\s+(?P<default_pwd>(Not\s+Set|Set))$")
         #  Default Key-Chain: Not Set
-        p4 = re.compile(r"^Default\s+Key-Chain:\s+(?P<default_key_chain>(Not\s+Set|Set))$")
+        p4 = regex_engine.compile(r"^Default\s+Key-Chain:\s+(?P<default_key_chain>(Not\s+Set|Set))$")
         #  Default Key-Chain Name: Not Applicable
-        p5 = re.compile(r"^Default\s+Key-Chain\s+Name:\s+(?P<default_key_chain_name>(Not\s+Applicable|\S+))$")
+        p5 = regex_engine.compile(r"^Default\s+Key-Chain\s+Name:\s+(?P<default_key_chain_name>(Not\s+Applicable|\S+))$")
         #  Default Source IP: 192.168.2.24
-        p6 = re.compile(r"^Default\s+Source\s+IP:\s+(?P<default_source_ip>(Not\s+Set|[\d+\.]+))$")
+        p6 = regex_engine.compile(r"^Default\s+Source\s+IP:\s+(?P<default_source_ip>(Not\s+Set|[\d+\.]+))$")
         # Connection retry open period: 120 secs
-        p7 = re.compile(r"^Connection\s+retry\s+open\s+period:\s+(?P<retry_period>\d+)\s+secs$")
+        p7 = regex_engine.compile(r"^Connection\s+retry\s+open\s+period:\s+(?P<retry_period>\d+)\s+secs$")
         # Reconcile period: 120 secs
-        p8 = re.compile(r"^Reconcile\s+period:\s+(?P<reconcile_period>\d+)\s+secs$")
+        p8 = regex_engine.compile(r"^Reconcile\s+period:\s+(?P<reconcile_period>\d+)\s+secs$")
         # Retry open timer is not running
-        p9 = re.compile(r"^Retry\s+open\s+timer\s+is\s+(?P<retry_timer>(not\s+running|running))$")
+        p9 = regex_engine.compile(r"^Retry\s+open\s+timer\s+is\s+(?P<retry_timer>(not\s+running|running))$")
         # Peer-Sequence traverse limit for export: Not Set
-        p10 = re.compile(r"^Peer-Sequence\s+traverse\s+limit\s+for\s+export:\s+(?P<export_traverse_limit>(Not\s+Set|\S+))$")
+        p10 = regex_engine.compile(r"^Peer-Sequence\s+traverse\s+limit\s+for\s+export:\s+(?P<export_traverse_limit>(Not\s+Set|\S+))$")
         # Peer-Sequence traverse limit for import: Not Set
-        p11 = re.compile(r"^Peer-Sequence\s+traverse\s+limit\s+for\s+import:\s+(?P<import_traverse_limit>(Not\s+Set|\S+))$")
+        p11 = regex_engine.compile(r"^Peer-Sequence\s+traverse\s+limit\s+for\s+import:\s+(?P<import_traverse_limit>(Not\s+Set|\S+))$")
         # Peer IP          : 10.1.1.2
-        p12 = re.compile(r"^Peer\s+IP\s+:\s+(?P<peer_ip>[\d\.]+)$")
+        p12 = regex_engine.compile(r"^Peer\s+IP\s+:\s+(?P<peer_ip>[\d\.]+)$")
         # Source IP        : 10.1.1.1
-        p13 = re.compile(r"^Source\s+IP\s+:\s+(?P<source_ip>[\d\.]+)$")
+        p13 = regex_engine.compile(r"^Source\s+IP\s+:\s+(?P<source_ip>[\d\.]+)$")
         # Conn status      : On
-        p14 = re.compile(r"^Conn\s+status\s+:\s+(?P<conn_status>.*$)$")
+        p14 = regex_engine.compile(r"^Conn\s+status\s+:\s+(?P<conn_status>.*$)$")
         # Conn version     : 5
-        p15 = re.compile(r"^Conn\s+version\s+:\s+(?P<conn_version>\d+)$")
+        p15 = regex_engine.compile(r"^Conn\s+version\s+:\s+(?P<conn_version>\d+)$")
         # Conn capability  : IPv4-IPv6-Subnet
-        p16 = re.compile(r"^Conn\s+capability\s+:\s+(?P<conn_capability>\S+)$")
+        p16 = regex_engine.compile(r"^Conn\s+capability\s+:\s+(?P<conn_capability>\S+)$")
         # Conn hold time   : 120 seconds
-        p17 = re.compile(r"^Conn\s+hold\s+time\s+:\s+(?P<conn_hold_time>\d+)\s+seconds$")
+        p17 = regex_engine.compile(r"^Conn\s+hold\s+time\s+:\s+(?P<conn_hold_time>\d+)\s+seconds$")
         # Local mode       : SXP Speaker
-        p18 = re.compile(r"^Local\s+mode\s+:\s+(?P<local_mode>.*$)$")
+        p18 = regex_engine.compile(r"^Local\s+mode\s+:\s+(?P<local_mode>.*$)$")
         # Connection inst# : 1
-        p19 = re.compile(r"^Connection\s+inst#\s+:\s+(?P<conn_inst>\d+)$")
+        p19 = regex_engine.compile(r"^Connection\s+inst#\s+:\s+(?P<conn_inst>\d+)$")
         # TCP conn fd      : 1
-        p20 = re.compile(r"^TCP\s+conn\s+fd\s+:\s+(?P<tcp_conn_fd>.*$)$")
+        p20 = regex_engine.compile(r"^TCP\s+conn\s+fd\s+:\s+(?P<tcp_conn_fd>.*$)$")
         # TCP conn password: none
-        p21 = re.compile(r"^TCP\s+conn\s+password:\s+(?P<tcp_conn_pwd>.*$)$")
+        p21 = regex_engine.compile(r"^TCP\s+conn\s+password:\s+(?P<tcp_conn_pwd>.*$)$")
         # Duration since last state change: 0:00:02:09 (dd:hr:mm:sec)
-        p22 = re.compile(r"^Duration\s+since\s+last\s+state\s+change:\s+(?P<duration>.*)$")
+        p22 = regex_engine.compile(r"^Duration\s+since\s+last\s+state\s+change:\s+(?P<duration>.*)$")
         # Total num of SXP Connections = 2
-        p23 = re.compile(r"^Total\s+num\s+of\s+SXP\s+Connections\s+=\s+(?P<total_sxp_connections>\d+)$")
+        p23 = regex_engine.compile(r"^Total\s+num\s+of\s+SXP\s+Connections\s+=\s+(?P<total_sxp_connections>\d+)$")
         # Speaker Conn hold time   : 120 seconds
-        p24 = re.compile(r"^Speaker\s+Conn\s+hold\s+time\s+:\s+(?P<speaker_conn_hold_time>\d+)\s+seconds$")
+        p24 = regex_engine.compile(r"^Speaker\s+Conn\s+hold\s+time\s+:\s+(?P<speaker_conn_hold_time>\d+)\s+seconds$")
         # Listener Conn hold time   : 120 seconds
-        p25 = re.compile(r"^Listener\s+Conn\s+hold\s+time\s+:\s+(?P<listener_conn_hold_time>\d+)\s+seconds$")
+        p25 = regex_engine.compile(r"^Listener\s+Conn\s+hold\s+time\s+:\s+(?P<listener_conn_hold_time>\d+)\s+seconds$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3063,16 +3066,16 @@ class ShowCtsSxpSgtMapBrief(ShowCtsSxpSgtMapBriefSchema):
         # IPv4,SGT: <10.1.1.10 , 9>
         # IPv4,SGT: <10.1.1.11 , 89>
         # IPv4,SGT: <10.1.1.18 , 87>
-        p0 = re.compile(r'^IPv4,SGT:\s+\<(?P<ip_address>[\d\.]+)\s+,\s+(?P<sgt>\d+)[:\w]*\>$')
+        p0 = regex_engine.compile(r'^IPv4,SGT:\s+\<(?P<ip_address>[\d\.]+)\s+,\s+(?P<sgt>\d+)[:\w]*\>$')
 
         # IPv6,SGT: <2001::6 , 22>
         # IPv6,SGT: <2001::60 , 208>
         # IPv6,SGT: <2001::80 , 26>
         # IPv6,SGT: <2001::89 , 26>
-        p1 = re.compile(r'^IPv6,SGT:\s+\<(?P<ip_address>[\w:]+)\s+,\s+(?P<sgt>\d+)[:\w]*\>$')
+        p1 = regex_engine.compile(r'^IPv6,SGT:\s+\<(?P<ip_address>[\w:]+)\s+,\s+(?P<sgt>\d+)[:\w]*\>$')
 
         # Total number of IP-SGT Mappings: 8
-        p2 = re.compile(r'^Total\s+number\s+of\s+IP-SGT\s+Mappings:\s+(?P<total_ip_sgt_mappings>\d+)$')
+        p2 = regex_engine.compile(r'^Total\s+number\s+of\s+IP-SGT\s+Mappings:\s+(?P<total_ip_sgt_mappings>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3200,58 +3203,58 @@ class ShowCtsServerList(ShowCtsServerListSchema):
         result_dict = {}
 
         # CTS Server Radius Load Balance = ENABLED
-        p1 = re.compile(r'^CTS\s+Server\s+Radius\s+Load\s+Balance\s+=\s+(?P<load_balance_status>\S+)$')
+        p1 = regex_engine.compile(r'^CTS\s+Server\s+Radius\s+Load\s+Balance\s+=\s+(?P<load_balance_status>\S+)$')
         # Method = least-outstanding
-        p2 = re.compile(r'^Method\s+=\s+(?P<load_balance_method>\S+)$')
+        p2 = regex_engine.compile(r'^Method\s+=\s+(?P<load_balance_method>\S+)$')
         # Batch size = 50
-        p3 = re.compile(r'^Batch\s+size\s+=\s+(?P<batch_size>\d+)$')
+        p3 = regex_engine.compile(r'^Batch\s+size\s+=\s+(?P<batch_size>\d+)$')
         # Ignore preferred server
-        p4 = re.compile(r'^Ignore\s+preferred\s+server$')
+        p4 = regex_engine.compile(r'^Ignore\s+preferred\s+server$')
         # Server Group Deadtime = 20 secs (default)
-        p5 = re.compile(r'^Server\s+Group\s+Deadtime\s+=\s+(?P<server_group_dead_time>\d+)\s+'
+        p5 = regex_engine.compile(r'^Server\s+Group\s+Deadtime\s+=\s+(?P<server_group_dead_time>\d+)\s+'
         r'(?P<server_group_dead_time_unit>\S+)')
         # Global Server Liveness Automated Test Deadtime = 20 secs
-        p6 = re.compile(r'^Global\s+Server\s+Liveness\s+Automated\s+Test\s+Deadtime\s+=\s+'
+        p6 = regex_engine.compile(r'^Global\s+Server\s+Liveness\s+Automated\s+Test\s+Deadtime\s+=\s+'
         r'(?P<dead_time>\d+)\s+(?P<dead_time_unit>\S+)$')
         # Global Server Liveness Automated Test Idle Time = 60 mins
-        p7 = re.compile(r'^Global\s+Server\s+Liveness\s+Automated\s+Test\s+Idle\s+Time\s+=\s+'
+        p7 = regex_engine.compile(r'^Global\s+Server\s+Liveness\s+Automated\s+Test\s+Idle\s+Time\s+=\s+'
         r'(?P<idle_time>\d+)\s+(?P<idle_time_unit>\S+)$')
         # Global Server Liveness Automated Test = ENABLED (default)
-        p8 = re.compile(r'^Global\s+Server\s+Liveness\s+Automated\s+Test\s+=\s+'
+        p8 = regex_engine.compile(r'^Global\s+Server\s+Liveness\s+Automated\s+Test\s+=\s+'
         r'(?P<status>.*)$')
         # Preferred list, 1 server(s):
-        p9 = re.compile(r'^Preferred\s+list.*$')
+        p9 = regex_engine.compile(r'^Preferred\s+list.*$')
         # Installed list: SL1-1E6E6AE57D4E2A9B320D1844C68BA291, 3 server(s):
-        p10 = re.compile(r'^Installed\s+list:\s+(?P<list_name>\S+),.*$')
+        p10 = regex_engine.compile(r'^Installed\s+list:\s+(?P<list_name>\S+),.*$')
         # *Server: 10.15.20.102, port 1812, A-ID 87B3503255C4384485BB808DC24C6F55
-        p11 = re.compile(r'^\*Server:\s+(?P<server_ip>[\d\.]+),\s+port\s+(?P<port_number>\d+),\s+A-ID\s+(?P<a_id>\S+)$')
+        p11 = regex_engine.compile(r'^\*Server:\s+(?P<server_ip>[\d\.]+),\s+port\s+(?P<port_number>\d+),\s+A-ID\s+(?P<a_id>\S+)$')
         # Status = ALIVE
-        p12 = re.compile(r'^Status\s+=\s+(?P<status>\S+)$')
+        p12 = regex_engine.compile(r'^Status\s+=\s+(?P<status>\S+)$')
         # auto-test = TRUE, keywrap-enable = FALSE, idle-time = 120 mins, deadtime = 20 secs
         # auto-test = TRUE, idle-time = 120 mins, deadtime = 20 secs
-        p13 = re.compile(r'^auto-test\s+=\s+(?P<auto_test_status>\S+),\s+(keywrap-enable\s+=\s+'
+        p13 = regex_engine.compile(r'^auto-test\s+=\s+(?P<auto_test_status>\S+),\s+(keywrap-enable\s+=\s+'
         r'(?P<keywrap_enable>\S+),\s+)?idle-time\s+=\s+(?P<idle_time>\d+)\s+(?P<idle_time_unit>\S+),'
         r'\s+deadtime\s+=\s+(?P<dead_time>\d+)\s+(?P<dead_time_unit>\S+)$')
         # HTTP Server-list:
-        p14 = re.compile(r'^HTTP\s+Server\-list:$')
+        p14 = regex_engine.compile(r'^HTTP\s+Server\-list:$')
         # Server Name  : cts-auto-cls1-ise1.cisco.com
-        p15 = re.compile(r'^Server\s+Name\s+:\s+(?P<server_name>\S+)$')
+        p15 = regex_engine.compile(r'^Server\s+Name\s+:\s+(?P<server_name>\S+)$')
         # Server State : ALIVE
-        p16 = re.compile(r'^Server\s+State\s+:\s+(?P<server_state>\S+)$')
+        p16 = regex_engine.compile(r'^Server\s+State\s+:\s+(?P<server_state>\S+)$')
         # IPv4 Address     : 10.76.119.180 (Unreachable)
         # IPv4 Address     : 100.100.100.101 (Reachable)
-        p17 = re.compile(r'^IPv4\s+Address\s+:\s+(?P<ipv4_address>[\d\.]+)\s+\((?P<ipv4_status>\w+)\)$')
+        p17 = regex_engine.compile(r'^IPv4\s+Address\s+:\s+(?P<ipv4_address>[\d\.]+)\s+\((?P<ipv4_status>\w+)\)$')
         # IPv6 Address     : 1000::101 (Reachable)
         # IPv6 Address     : 1100::101 (Reachable)
-        p18 = re.compile(r'^IPv6\s+Address\s+:\s+(?P<ipv6_address>[\w:]+)\s+\((?P<ipv6_status>\w+)\)$')
+        p18 = regex_engine.compile(r'^IPv6\s+Address\s+:\s+(?P<ipv6_address>[\w:]+)\s+\((?P<ipv6_status>\w+)\)$')
         # Domain-name      : cts-auto-cls1-ise1.cisco.com (Reachable)
-        p19 = re.compile(r'^Domain-name\s+:\s+(?P<domain_name>\S+)\s+\((?P<domain_status>\w+)\)$')
+        p19 = regex_engine.compile(r'^Domain-name\s+:\s+(?P<domain_name>\S+)\s+\((?P<domain_status>\w+)\)$')
         # Trustpoint       : cts_tp_cts-auto-cls1-ise1.cisco.com_0
-        p20 = re.compile(r'^Trustpoint\s+:\s+(?P<trustpoint_name>\S+)$')
+        p20 = regex_engine.compile(r'^Trustpoint\s+:\s+(?P<trustpoint_name>\S+)$')
         # Port-num         : 9063
-        p21 = re.compile(r'^Port-num\s+:\s+(?P<port_num>\d+)$')
+        p21 = regex_engine.compile(r'^Port-num\s+:\s+(?P<port_num>\d+)$')
         # Trustpoint chain : NOT CONFIGURED
-        p22 = re.compile(r'^Trustpoint\s+chain\s+:\s+(?P<trustpoint_chain>.*)$')
+        p22 = regex_engine.compile(r'^Trustpoint\s+chain\s+:\s+(?P<trustpoint_chain>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3497,43 +3500,43 @@ class ShowCtsPolicyServerStatistics(ShowCtsPolicyServerStatisticsSchema):
         result_dict = {}
         
         # Server Name  : cts-auto-cls1-ise1.cisco.com
-        p0 = re.compile(r'^server +name +: +(?P<server_name>\S+)$')
+        p0 = regex_engine.compile(r'^server +name +: +(?P<server_name>\S+)$')
         # Server State : DEAD
-        p1 = re.compile(r'^server +state +: +(?P<server_state>\S+)$')
+        p1 = regex_engine.compile(r'^server +state +: +(?P<server_state>\S+)$')
         # Number of Request sent        : 8
-        p2 = re.compile(r'^number +of +request +sent +: +(?P<num_of_req_sent>\d+)$')
+        p2 = regex_engine.compile(r'^number +of +request +sent +: +(?P<num_of_req_sent>\d+)$')
         # Number of Request sent fail   : 1
-        p3 = re.compile(r'^number +of +request +sent +fail +: +(?P<num_of_req_sent_fail>\d+)$')
+        p3 = regex_engine.compile(r'^number +of +request +sent +fail +: +(?P<num_of_req_sent_fail>\d+)$')
         # Number of Response received   : 5
-        p4 = re.compile(r'^number +of +response +received +: +(?P<num_of_res_recv>\d+)$')
+        p4 = regex_engine.compile(r'^number +of +response +received +: +(?P<num_of_res_recv>\d+)$')
         # Number of Response recv fail  : 3
-        p5 = re.compile(r'^number +of +response +recv +fail +: +(?P<num_of_res_recv_fail>\d+)$')
+        p5 = regex_engine.compile(r'^number +of +response +recv +fail +: +(?P<num_of_res_recv_fail>\d+)$')
         #     HTTP 200 OK                 : 5
-        p6 = re.compile(r'^http +200 +ok +: +(?P<http_200_ok>\d+)$')
+        p6 = regex_engine.compile(r'^http +200 +ok +: +(?P<http_200_ok>\d+)$')
         #     HTTP 400 BadReq             : 0
-        p7 = re.compile(r'^http +400 +badreq +: +(?P<http_400_badreq>\d+)$')
+        p7 = regex_engine.compile(r'^http +400 +badreq +: +(?P<http_400_badreq>\d+)$')
         #     HTTP 401 UnAuthorized Req   : 1
-        p8 = re.compile(r'^http +401 +unauthorized +req +: +(?P<http_401_unauthorized_req>\d+)$')
+        p8 = regex_engine.compile(r'^http +401 +unauthorized +req +: +(?P<http_401_unauthorized_req>\d+)$')
         #     HTTP 403 Req Forbidden      : 0
-        p9 = re.compile(r'^http +403 +req +forbidden +: +(?P<http_403_req_forbidden>\d+)$')
+        p9 = regex_engine.compile(r'^http +403 +req +forbidden +: +(?P<http_403_req_forbidden>\d+)$')
         #     HTTP 404 NotFound           : 0
-        p10 = re.compile(r'^http +404 +notfound +: +(?P<http_404_notfound>\d+)$')
+        p10 = regex_engine.compile(r'^http +404 +notfound +: +(?P<http_404_notfound>\d+)$')
         #     HTTP 408 ReqTimeout         : 0
-        p11 = re.compile(r'^http +408 +reqtimeout +: +(?P<http_408_reqtimeout>\d+)$')
+        p11 = regex_engine.compile(r'^http +408 +reqtimeout +: +(?P<http_408_reqtimeout>\d+)$')
         #     HTTP 415 UnSupported Media  : 0
-        p12 = re.compile(r'^http +415 +unsupported +media +: +(?P<http_415_unsupported_media>\d+)$')
+        p12 = regex_engine.compile(r'^http +415 +unsupported +media +: +(?P<http_415_unsupported_media>\d+)$')
         #     HTTP 500 ServerErr          : 0
-        p13 = re.compile(r'^http +500 +servererr +: +(?P<http_500_servererr>\d+)$')
+        p13 = regex_engine.compile(r'^http +500 +servererr +: +(?P<http_500_servererr>\d+)$')
         #     HTTP 501 Req NoSupport      : 0
-        p14 = re.compile(r'^http +501 +req +nosupport +: +(?P<http_501_req_nosupport>\d+)$')
+        p14 = regex_engine.compile(r'^http +501 +req +nosupport +: +(?P<http_501_req_nosupport>\d+)$')
         #     HTTP 503 Service Unavailable: 0
-        p15 = re.compile(r'^http +503 +service +unavailable *: +(?P<http_503_service_unavailable>\d+)$')
+        p15 = regex_engine.compile(r'^http +503 +service +unavailable *: +(?P<http_503_service_unavailable>\d+)$')
         #     HTTP 429 Too Many Requests  : 0
-        p16 = re.compile(r'^http +429 +too +many +requests +: +(?P<http_429_too_many_requests>\d+)$')
+        p16 = regex_engine.compile(r'^http +429 +too +many +requests +: +(?P<http_429_too_many_requests>\d+)$')
         #     TCP or TLS handshake error  : 2
-        p17 = re.compile(r'^tcp +or +tls +handshake +error +: +(?P<tcp_or_tls_handshake_err>\d+)$')
+        p17 = regex_engine.compile(r'^tcp +or +tls +handshake +error +: +(?P<tcp_or_tls_handshake_err>\d+)$')
         #     HTTP Other Error            : 0
-        p18 = re.compile(r'^http +other +error +: +(?P<http_other_err>\d+)$')
+        p18 = regex_engine.compile(r'^http +other +error +: +(?P<http_other_err>\d+)$')
        
         for line in output.splitlines():
             line = line.strip()
@@ -3698,27 +3701,27 @@ class ShowCtsPolicyServerDetails(ShowCtsPolicyServerDetailsSchema):
         results_dict = {}
         
         # Server Name  : cts-auto-cls1-ise1.cisco.com
-        p0 = re.compile(r'^server +name +: +(?P<server_name>\S+)$')
+        p0 = regex_engine.compile(r'^server +name +: +(?P<server_name>\S+)$')
         # Server Status : Inactive
-        p1 = re.compile(r'^server +status +: +(?P<server_status>\S+)$')
+        p1 = regex_engine.compile(r'^server +status +: +(?P<server_status>\S+)$')
         # IPv4 Address     : 10.76.119.181 (Reachable)
-        p2 = re.compile(r'^ipv4\s+address\s*: +(?P<ipv4_address>\S+)(:?\s*\((?P<ipv4_status>\S+)\))?$')
+        p2 = regex_engine.compile(r'^ipv4\s+address\s*: +(?P<ipv4_address>\S+)(:?\s*\((?P<ipv4_status>\S+)\))?$')
         # Domain-name      : cts-auto-cls1-ise3.cisco.com (Reachable)
-        p3 = re.compile(r'^domain-name\s*: +(?P<domain_name>\S+) +\((?P<domain_status>\S+)\)$')
+        p3 = regex_engine.compile(r'^domain-name\s*: +(?P<domain_name>\S+) +\((?P<domain_status>\S+)\)$')
         # Trustpoint       : cts_tp_cts-auto-cls1-ise3.cisco.com_2
-        p4 = re.compile(r'^trustpoint +: +(?P<trustpoint>\S+)$')
+        p4 = regex_engine.compile(r'^trustpoint +: +(?P<trustpoint>\S+)$')
         # Port-num         : 9063
-        p5 = re.compile(r'^port-num +: +(?P<port_num>\d+)$')
+        p5 = regex_engine.compile(r'^port-num +: +(?P<port_num>\d+)$')
         #     Retransmit count : 3
-        p6 = re.compile(r'^retransmit +count +: +(?P<retransmit_count>\d+)$')
+        p6 = regex_engine.compile(r'^retransmit +count +: +(?P<retransmit_count>\d+)$')
         #     Timeout          : 15
-        p7 = re.compile(r'^timeout +: +(?P<timeout>\d+)$')
+        p7 = regex_engine.compile(r'^timeout +: +(?P<timeout>\d+)$')
         #    App Content type : JSON
-        p8 = re.compile(r'^app +content +type +: +(?P<app_content_type>\S+)$')
+        p8 = regex_engine.compile(r'^app +content +type +: +(?P<app_content_type>\S+)$')
         #    Trustpoint chain : NOT CONFIGURED
-        p9 = re.compile(r'^trustpoint +chain +: +(?P<trustpoint_chain>.*)$')
+        p9 = regex_engine.compile(r'^trustpoint +chain +: +(?P<trustpoint_chain>.*)$')
         # IPv6 Address     : 1100::101 (Reachable)
-        p10 = re.compile(r'^ipv6\s+address\s+:\s+(?P<ipv6_address>[\w:]+)(:?\s*\((?P<ipv6_status>\w+)\))?$')
+        p10 = regex_engine.compile(r'^ipv6\s+address\s+:\s+(?P<ipv6_address>[\w:]+)(:?\s*\((?P<ipv6_status>\w+)\))?$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -3838,7 +3841,7 @@ class ShowPlatformSoftwareFedActiveAclSgacl(ShowPlatformSoftwareFedActiveAclSgac
 
         #SGT       DGT     Monitor-Mode    Counter-OID   ACL-CG-ID
         #0      0                0            2610             529
-        p1 = re.compile(r'^(?P<sgt>\d+)\s+(?P<dgt>\d+)\s+(?P<monitor_mode>\d+)\s+(?P<counter_oid>\d+)\s+(?P<acl_cg_id>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<sgt>\d+)\s+(?P<dgt>\d+)\s+(?P<monitor_mode>\d+)\s+(?P<counter_oid>\d+)\s+(?P<acl_cg_id>\S+)$')
         
         for line in output.splitlines(): 
             line = line.strip()
@@ -3896,7 +3899,7 @@ class ShowCtsInterfaceSummary(ShowCtsInterfaceSummarySchema):
         # -----------------------------------------------------------------------------
         # Twe1/0/12                      MANUAL  INIT      unknown    unknown    invalid  Invalid 
         # Twe1/0/19                      MANUAL  INIT      unknown    unknown    invalid  Invalid 
-        p1 = re.compile(r'^(?P<interface>\w+\d+/\d+/\d+)\s+(?P<mode>\S+)\s+(?P<ifc_state>\S+)\s+(?P<dot1x_role>\S+)\s+(?P<peer_id>\S+)\s+(?P<ifc_cache>\S+)\s+(?P<critical_authentication>\S+)$')     
+        p1 = regex_engine.compile(r'^(?P<interface>\w+\d+/\d+/\d+)\s+(?P<mode>\S+)\s+(?P<ifc_state>\S+)\s+(?P<dot1x_role>\S+)\s+(?P<peer_id>\S+)\s+(?P<ifc_cache>\S+)\s+(?P<critical_authentication>\S+)$')     
 
         for line in output.splitlines():
             line = line.strip()
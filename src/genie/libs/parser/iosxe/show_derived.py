@@ -4,14 +4,12 @@ IOSXE parsers for the following show commands:
    * show derived-config interface <INTF>
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
 # Genie Libs
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ====================================================
@@ -116,152 +114,152 @@ class ShowDerivedConfigInterface(ShowDerivedConfigInterfaceSchema):
         ret_dict = {}
 
         # interface Tunnel1
-        p1 = re.compile(r"^interface\s+(?P<interface_name>[\S\s]+)$")
+        p1 = regex_engine.compile(r"^interface\s+(?P<interface_name>[\S\s]+)$")
 
         # ip address 192.168.1.1 255.255.255.0
-        p2 = re.compile(r"^ip\s+address\s+(?P<ip_address>[\S\s]+)\s+(?P<ip_mask>[\S\s]+)$")
+        p2 = regex_engine.compile(r"^ip\s+address\s+(?P<ip_address>[\S\s]+)\s+(?P<ip_mask>[\S\s]+)$")
 
         # ipv6 address 8001::100/64
-        p3 = re.compile(r"^ipv6\s+address\s+(?P<ipv6_address>[\S\s]+)$")
+        p3 = regex_engine.compile(r"^ipv6\s+address\s+(?P<ipv6_address>[\S\s]+)$")
 
         # ip access-group Tu1-ipsec-ds-ipv4-in in
-        p4 = re.compile(r"^ip\s+access-group\s+(?P<ip_access_group_in>[\S\s]+)\s+in$")
+        p4 = regex_engine.compile(r"^ip\s+access-group\s+(?P<ip_access_group_in>[\S\s]+)\s+in$")
         
         # ip access-group Tu1-ipsec-ds-ipv4-out out
-        p5 = re.compile(r"^ip\s+access-group\s+(?P<ip_access_group_out>[\S\s]+)\s+out$")
+        p5 = regex_engine.compile(r"^ip\s+access-group\s+(?P<ip_access_group_out>[\S\s]+)\s+out$")
         
         # ipv6 enable
-        p6 = re.compile(r"^ipv6\s+enable$")
+        p6 = regex_engine.compile(r"^ipv6\s+enable$")
         
         # ipv6 traffic-filter Tu1-ipsec-ds-ipv6-in in
-        p7 = re.compile(r"^ipv6\s+traffic-filter\s+(?P<ipv6_access_group_in>[\S\s]+)\s+in$")
+        p7 = regex_engine.compile(r"^ipv6\s+traffic-filter\s+(?P<ipv6_access_group_in>[\S\s]+)\s+in$")
 
         # ipv6 traffic-filter Tu1-ipsec-ds-ipv6-out out
-        p8 = re.compile(r"^ipv6\s+traffic-filter\s+(?P<ipv6_access_group_out>[\S\s]+)\s+out$")
+        p8 = regex_engine.compile(r"^ipv6\s+traffic-filter\s+(?P<ipv6_access_group_out>[\S\s]+)\s+out$")
 
         # tunnel source 11.11.11.2
-        p9 = re.compile(r"^tunnel\s+source\s+(?P<tunnel_source>[\S\s]+)$")
+        p9 = regex_engine.compile(r"^tunnel\s+source\s+(?P<tunnel_source>[\S\s]+)$")
 
         # tunnel mode ipsec dual-overlay
-        p10 = re.compile(r"^tunnel\s+mode\s+(?P<tunnel_mode>[\S\s]+)$")
+        p10 = regex_engine.compile(r"^tunnel\s+mode\s+(?P<tunnel_mode>[\S\s]+)$")
 
         # tunnel destination 30.30.30.2
-        p11 = re.compile(r"^tunnel\s+destination\s+(?P<tunnel_destination>[\S\s]+)$")
+        p11 = regex_engine.compile(r"^tunnel\s+destination\s+(?P<tunnel_destination>[\S\s]+)$")
 
         # tunnel protection ipsec profile ipsec_global_profile
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^tunnel\s+protection\s+ipsec\s+profile\s+(?P<tunnel_ipsec_profile>[\S\s]+)$")
 
         # description Sourcing interface template beta
-        p13 = re.compile(r"^description\s+(?P<description>[\S\s]+)$")
+        p13 = regex_engine.compile(r"^description\s+(?P<description>[\S\s]+)$")
         
         # switchport trunk allowed vlan 3
-        p14 = re.compile(r"^switchport trunk allowed vlan\s+(?P<allowed_vlan>\S+)$")
+        p14 = regex_engine.compile(r"^switchport trunk allowed vlan\s+(?P<allowed_vlan>\S+)$")
         
         # switchport mode trunk
-        p15 = re.compile(r"^switchport mode\s+(?P<switchport_mode>\w+)$")
+        p15 = regex_engine.compile(r"^switchport mode\s+(?P<switchport_mode>\w+)$")
 
         # switchport block unicast
-        p16 = re.compile(r"^switchport block\s+(?P<switchport_block>\w+)$")
+        p16 = regex_engine.compile(r"^switchport block\s+(?P<switchport_block>\w+)$")
         
         # switchport port-security maximum 3
-        p17 = re.compile(r"^switchport port-security maximum\s+(?P<maximum>\d+)$")
+        p17 = regex_engine.compile(r"^switchport port-security maximum\s+(?P<maximum>\d+)$")
 
         # switchport port-security maximum 2 vlan access
-        p18 = re.compile(r"^switchport port-security maximum\s+(?P<maximum>\d+) vlan (?P<vlan>\w+)$")
+        p18 = regex_engine.compile(r"^switchport port-security maximum\s+(?P<maximum>\d+) vlan (?P<vlan>\w+)$")
 
         # switchport port-security violation restrict
-        p19 = re.compile(r"^switchport port-security violation\s+(?P<violation>\w+)$")
+        p19 = regex_engine.compile(r"^switchport port-security violation\s+(?P<violation>\w+)$")
 
         # switchport port-security aging time 2
-        p20 = re.compile(r"^switchport port-security aging time\s+(?P<aging_time>\d+)$")
+        p20 = regex_engine.compile(r"^switchport port-security aging time\s+(?P<aging_time>\d+)$")
 
         # switchport port-security aging type inactivity
-        p21 = re.compile(r"^switchport port-security aging type\s+(?P<aging_type>\w+)$")
+        p21 = regex_engine.compile(r"^switchport port-security aging type\s+(?P<aging_type>\w+)$")
 
         # switchport port-security
-        p22 = re.compile(r"^switchport port-security$")
+        p22 = regex_engine.compile(r"^switchport port-security$")
 
         # load-interval 30
-        p23 = re.compile(r"^load-interval\s+(?P<load_interval>\d+)$")
+        p23 = regex_engine.compile(r"^load-interval\s+(?P<load_interval>\d+)$")
 
         # storm-control broadcast level pps 1k
-        p24 = re.compile(r"^storm-control broadcast level pps\s+(?P<broadcast_level_pps>\w+)$")
+        p24 = regex_engine.compile(r"^storm-control broadcast level pps\s+(?P<broadcast_level_pps>\w+)$")
         
         # storm-control multicast level pps 2k
-        p25 = re.compile(r"^storm-control multicast level pps\s+(?P<multicast_level_pps>\w+)$")
+        p25 = regex_engine.compile(r"^storm-control multicast level pps\s+(?P<multicast_level_pps>\w+)$")
         
         # storm-control action trap
-        p26 = re.compile(r"^storm-control action\s+(?P<action>\w+)$")
+        p26 = regex_engine.compile(r"^storm-control action\s+(?P<action>\w+)$")
 
         # spanning-tree portfast
-        p27 = re.compile(r"^spanning-tree\s+(?P<portfast>\w+)$")
+        p27 = regex_engine.compile(r"^spanning-tree\s+(?P<portfast>\w+)$")
 
         # spanning-tree bpduguard enable
-        p28 = re.compile(r"^spanning-tree bpduguard\s+(?P<bpduguard>\w+)$")
+        p28 = regex_engine.compile(r"^spanning-tree bpduguard\s+(?P<bpduguard>\w+)$")
 
         # service-policy input AutoConf-4.0-CiscoPhone-Input-Policy
-        p29 = re.compile(r"^service-policy input\s+(?P<input>\S+)$")
+        p29 = regex_engine.compile(r"^service-policy input\s+(?P<input>\S+)$")
 
         # service-policy output AutoConf-4.0-Output-Policy
-        p30 = re.compile(r"^service-policy output\s+(?P<output>\S+)$")
+        p30 = regex_engine.compile(r"^service-policy output\s+(?P<output>\S+)$")
 
         # ip dhcp snooping limit rate 15
-        p31 = re.compile(r"^ip dhcp snooping limit rate\s+(?P<ip_dhcp_snooping_limit_rate>\d+)$")
+        p31 = regex_engine.compile(r"^ip dhcp snooping limit rate\s+(?P<ip_dhcp_snooping_limit_rate>\d+)$")
 
         # host-reachability protocol bgp
-        p32 = re.compile(r'^host-reachability protocol (?P<protocol>[a-zA-Z]+)$')
+        p32 = regex_engine.compile(r'^host-reachability protocol (?P<protocol>[a-zA-Z]+)$')
 
         # source-interface loopback1
-        p33 = re.compile(r'^source-interface (?P<src_intf>[a-zA-Z0-9\-]+)$')
+        p33 = regex_engine.compile(r'^source-interface (?P<src_intf>[a-zA-Z0-9\-]+)$')
 
         # member vni 20011 ingress-replication
-        p34 = re.compile(r'^member vni (?P<vni>[0-9]+) ingress-replication$')
+        p34 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) ingress-replication$')
 
         # member vni 20012 mcast-group 224.1.1.1
-        p35 = re.compile(r'^member vni (?P<vni>[0-9]+) mcast-group (?P<ip>[0-9\.]+)$')
+        p35 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) mcast-group (?P<ip>[0-9\.]+)$')
 
         # member vni 20010 mcast-group FF0E::A
-        p36 = re.compile(r'^member vni (?P<vni>[0-9]+) mcast-group (?P<ipv6>[a-fA-F\d\:]+)$')
+        p36 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) mcast-group (?P<ipv6>[a-fA-F\d\:]+)$')
 
         # member vni 20011 ingress-replication local-routing
-        p37 = re.compile(r'^member vni (?P<vni>[0-9]+) ingress-replication '
-                        r'local-routing$')
+        p37 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) ingress-replication '
+                                  r'local-routing$')
 
         # member vni 20011
-        p38 = re.compile(r'^member vni (?P<vni>[0-9]+)$')
+        p38 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+)$')
 
         # ingress-replication 1.1.1.1
-        p39 = re.compile(r'^ingress-replication (?P<ip>[0-9\.]+)$')
+        p39 = regex_engine.compile(r'^ingress-replication (?P<ip>[0-9\.]+)$')
 
         # member vni 20012 mcast-group 224.1.1.1 local-routing
-        p40 = re.compile(r'^member vni (?P<vni>[0-9]+) mcast-group (?P<ip>[0-9\.]+) '
-                        r'local-routing$')
+        p40 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) mcast-group (?P<ip>[0-9\.]+) '
+                                  r'local-routing$')
 
         # member vni 30000 vrf red
-        p41 = re.compile(r'^member vni (?P<vni>[0-9]+) vrf (?P<vrf>\S+)$')
+        p41 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) vrf (?P<vrf>\S+)$')
 
         #member vni 2000401 mcast-group 239.4.0.145 FF1E::91
-        p42 = re.compile(r"member vni (?P<vni>[0-9]+) mcast-group (?P<ipv4_group>\S+) (?P<ipv6_group>\S+)$")
+        p42 = regex_engine.compile(r"member vni (?P<vni>[0-9]+) mcast-group (?P<ipv4_group>\S+) (?P<ipv6_group>\S+)$")
 
         # vxlan encapsulation dual-stack prefer-ipv6 underlay-mcast ipv4
         # vxlan encapsulation ipv6
-        p43 = re.compile(r'^vxlan encapsulation +(?P<type>dual-stack|ipv6|ipv4)\s+(?P<dual_stack_ip>\S+)$')
+        p43 = regex_engine.compile(r'^vxlan encapsulation +(?P<type>dual-stack|ipv6|ipv4)\s+(?P<dual_stack_ip>\S+)$')
 
         #ip pim sparse-mode
-        p44 = re.compile(r"ip pim (?P<pim_operation>\S+)$")
+        p44 = regex_engine.compile(r"ip pim (?P<pim_operation>\S+)$")
 
         # vrf forwarding VRF1
-        p45 = re.compile(r"^vrf forwarding\s+(?P<vrf>\S+)$")
+        p45 = regex_engine.compile(r"^vrf forwarding\s+(?P<vrf>\S+)$")
 
         # ip unnumbered Loopback0
-        p46 = re.compile(r"^ip unnumbered\s+(?P<ipv4_unnumbered_intf>\S+)$")
+        p46 = regex_engine.compile(r"^ip unnumbered\s+(?P<ipv4_unnumbered_intf>\S+)$")
 
         # ipv6 unnumbered Loopback0
-        p47 = re.compile(r"^ipv6 unnumbered\s+(?P<ipv6_unnumbered_intf>\S+)$")
+        p47 = regex_engine.compile(r"^ipv6 unnumbered\s+(?P<ipv6_unnumbered_intf>\S+)$")
 
         # no autostate
-        p48 = re.compile(r"^no autostate$")
+        p48 = regex_engine.compile(r"^no autostate$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -448,7 +446,7 @@ class ShowDerivedConfigInterface(ShowDerivedConfigInterfaceSchema):
                 continue
 
             # ip dhcp snooping limit rate 15
-            p31 = re.compile(r"^ip dhcp snooping limit rate\s+(?P<ip_dhcp_snooping_limit_rate>\d+)$")
+            p31 = regex_engine.compile(r"^ip dhcp snooping limit rate\s+(?P<ip_dhcp_snooping_limit_rate>\d+)$")
             m = p31.match(line)
             if m:
                 intf_dict['ip_dhcp_snooping_limit_rate'] = int(m.groupdict()['ip_dhcp_snooping_limit_rate'])
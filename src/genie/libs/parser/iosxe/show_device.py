@@ -15,13 +15,13 @@ IOSXE parsers for the following show commands:
 
 # Python
 
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And, ListOf, Default
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =================
@@ -95,15 +95,15 @@ class ShowDeviceSensor(ShowDeviceSensorSchema):
                 return ret_dict
 
         # Device: 0050.56ae.de2e on port TenGigabitEthernet1/1/6
-        p0 = re.compile(r'^Device: +(?P<mac>\S+) +on port (?P<port>\S+)$')
+        p0 = regex_engine.compile(r'^Device: +(?P<mac>\S+) +on port (?P<port>\S+)$')
 
         # DHCP    60:class-identifier            10 3C 08 63 69 73 63 6F 70 6E  <.ciscopn
         # DHCP    60:class-identifier            38 3C 24 43 69 73 63 6F 20 73  <$Cisco s
-        p1 = re.compile(r'^(?P<protocol>\S+)\s+(?P<proto_type>\d+):(?P<name>\S+)\s+(?P<length>\d+)\s(?P<value>[0-9A-F\d ]{27})\s(?P<text>.+)$')
+        p1 = regex_engine.compile(r'^(?P<protocol>\S+)\s+(?P<proto_type>\d+):(?P<name>\S+)\s+(?P<length>\d+)\s(?P<value>[0-9A-F\d ]{27})\s(?P<text>.+)$')
 
         #                                           30 63 37 35 2E 62 64 30 32  0c75.bd02
         #                                           79 73 74 65 6D 73 2C 20 49  ystems, I
-        p2 = re.compile(r'^\s+(?P<value>[0-9A-F\d ]{27})\s(?P<text>.+)$')
+        p2 = regex_engine.compile(r'^\s+(?P<value>[0-9A-F\d ]{27})\s(?P<text>.+)$')
 
         for line in output.splitlines():
             line_strip = line.strip()
@@ -177,7 +177,7 @@ class ShowDeviceClassifierAttachedDetail(ShowDeviceClassifierAttachedDetailSchem
             output = self.device.execute(self.cli_command)
 
         # 0016.47cd.9ab1  GigabitEthernet2/0/48 10   0      M   Built-in Cisco-Device                 CISCO SYSTEMS, INC
-        p1 = re.compile(r'^(?P<mac_address>[a-f0-9\.]+)\s+(?P<port_id>\S+)\s+(?P<cert>\d+)\s+'
+        p1 = regex_engine.compile(r'^(?P<mac_address>[a-f0-9\.]+)\s+(?P<port_id>\S+)\s+(?P<cert>\d+)\s+'
         r'(?P<parent>\d+)\s+(?P<proto>[A-Z][\sA-Z]*)\s{3}(?P<profile_type>\S+)\s+(?P<profile_name>\S+)\s+(?P<device_name>.+)$')
 
         ret_dict = dict()
@@ -241,7 +241,7 @@ class ShowDeviceClassifierAttachedInterface(ShowDeviceClassifierAttachedInterfac
             output = self.device.execute(self.cli_command.format(intf=intf))
 
         # 001b.0c18.918d  GigabitEthernet1/0/24 Cisco-IP-Phone-7970          Cisco IP Phone 7970
-        p1 = re.compile(r"^(?P<mac_address>\w+\.\w+\.\w+)\s+(?P<port_id>[\w\/\.\-\:]+)\s+(?P<profile_name>\S+)\s+(?P<device_name>.+)$")
+        p1 = regex_engine.compile(r"^(?P<mac_address>\w+\.\w+\.\w+)\s+(?P<port_id>[\w\/\.\-\:]+)\s+(?P<profile_name>\S+)\s+(?P<device_name>.+)$")
 
         ret_dict = {}
 
@@ -290,7 +290,7 @@ class ShowDeviceClassifierAttachedMacAddress(ShowDeviceClassifierAttachedMacAddr
             output = self.device.execute(self.cli_command.format(mac_address=mac_address))
 
         # 001b.0c18.918d  GigabitEthernet1/0/24 Cisco-IP-Phone-7970          Cisco IP Phone 7970
-        p1 = re.compile(r"^(?P<mac_address>\w+\.\w+\.\w+)\s+(?P<port_id>[\w\/\.\-\:]+)\s+(?P<profile_name>\S+)\s+(?P<device_name>.+)$")
+        p1 = regex_engine.compile(r"^(?P<mac_address>\w+\.\w+\.\w+)\s+(?P<port_id>[\w\/\.\-\:]+)\s+(?P<profile_name>\S+)\s+(?P<device_name>.+)$")
 
         ret_dict = {}
 
@@ -338,7 +338,7 @@ class ShowDeviceClassifierProfileTypeCustom(ShowDeviceClassifierProfileTypeCusto
             output = self.device.execute(self.cli_command)
 
         # Valid     Custom      DEVICE_TYPE_A                               0     0
-        p1 = re.compile(r"^(?P<valid>\w+)\s+(?P<type>\w+)\s+(?P<profile_name>\S+)\s+(?P<ncon>\d+)\s+(?P<id>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<valid>\w+)\s+(?P<type>\w+)\s+(?P<profile_name>\S+)\s+(?P<ncon>\d+)\s+(?P<id>\d+)$")
 
         ret_dict = {}
 
@@ -398,11 +398,11 @@ class ShowDeviceSensorDetails(ShowDeviceSensorDetailsSchema):
             output = self.device.execute(self.cli_command)
 
         # Status = Enabled 
-        p1 = re.compile(r"^Status\s+=\s+(?P<status>\w+)$")
+        p1 = regex_engine.compile(r"^Status\s+=\s+(?P<status>\w+)$")
         # CDP            registered  Proto Tlv Limit = 128
-        p2 = re.compile(r"^(?P<name>\w+)\s+(?P<status>\w+)\s+(?P<tlv_limit>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+        p2 = regex_engine.compile(r"^(?P<name>\w+)\s+(?P<status>\w+)\s+(?P<tlv_limit>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
         # CDP             None
-        p3 = re.compile(r"^(?P<name>\w+)\s+(?P<filter_type>\w+)$")
+        p3 = regex_engine.compile(r"^(?P<name>\w+)\s+(?P<filter_type>\w+)$")
 
         ret_dict = {}
 
@@ -1,8 +1,8 @@
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -79,40 +79,40 @@ class ShowDeviceTrackingDatabase(ShowDeviceTrackingDatabaseSchema):
         # L   10.10.68.10                            7081.05ff.eb40     Vl243      243   0100  10330mn REACHABLE
 
         # Binding Table has 10 entries, 0 dynamic (limit 200000)
-        binding_table_capture = re.compile(
+        binding_table_capture = regex_engine.compile(
             r"^Binding\s+Table\s+has\s+(?P<binding_table_count>\d+)\s+entries,\s+(?P<dynamic_entry_count>\d+)\s+dynamic\s+\(limit\s+(?P<binding_table_limit>\d+)\)$")
 
         # vlanDB has 17 entries for vlan 101, 16 dynamic
-        vlan_db_capture = re.compile(
+        vlan_db_capture = regex_engine.compile(
             r"^vlanDB\s+has\s+(?P<vlan_db_count>\d+)\s+entries\s+for\s+vlan\s+(?P<vlandb_id>\d+)+,\s+(?P<vlan_dynamic_entry_count>\d+)\s+dynamic$")
 
         # Codes: L - Local, S - Static, ND - Neighbor Discovery, ARP - Address Resolution Protocol, DH4 - IPv4 DHCP, DH6 - IPv6 DHCP, PKT - Other Packet, API - API created
-        codes_capture = re.compile(
+        codes_capture = regex_engine.compile(
             r"^Codes:\s+L\s+-\s+Local,\s+S\s+-\s+Static,\s+ND\s+-\s+Neighbor\s+Discovery,\s+ARP\s+-\s+Address\s+Resolution\s+Protocol,\s+DH4\s+-\s+IPv4\s+DHCP,\s+DH6\s+-\s+IPv6\s+DHCP,\s+PKT\s+-\s+Other\s+Packet,\s+API\s+-\s+API\s+created$")
 
         # Preflevel flags (prlvl):
-        pref_level_flag_codes_capture = re.compile(r"^Preflevel\s+flags\s+\(prlvl\):$")
+        pref_level_flag_codes_capture = regex_engine.compile(r"^Preflevel\s+flags\s+\(prlvl\):$")
 
         # 0001:MAC and LLA match     0002:Orig trunk            0004:Orig access
-        pref_level_flags_2_capture = re.compile(
+        pref_level_flags_2_capture = regex_engine.compile(
             r"^0001:MAC\s+and\s+LLA\s+match\s+0002:Orig\s+trunk\s+0004:Orig\s+access$")
 
         # 0008:Orig trusted trunk    0010:Orig trusted access   0020:DHCP assigned
-        _capture = re.compile(r"^0008:Orig\s+trusted\s+trunk\s+0010:Orig\s+trusted\s+access\s+0020:DHCP\s+assigned$")
+        _capture = regex_engine.compile(r"^0008:Orig\s+trusted\s+trunk\s+0010:Orig\s+trusted\s+access\s+0020:DHCP\s+assigned$")
 
         # 0040:Cga authenticated     0080:Cert authenticated    0100:Statically assigned
-        _capture1 = re.compile(r"^0040:Cga\s+authenticated\s+0080:Cert\s+authenticated\s+0100:Statically\s+assigned$")
+        _capture1 = regex_engine.compile(r"^0040:Cga\s+authenticated\s+0080:Cert\s+authenticated\s+0100:Statically\s+assigned$")
 
         #     Network Layer Address                   Link Layer Address Interface  vlan  prlvl age    state     Time left
-        device_info_header_capture = re.compile(
+        device_info_header_capture = regex_engine.compile(
             r"^Network\s+Layer\s+Address\s+Link\s+Layer\s+Address\s+Interface\s+vlan\s+prlvl\s+age\s+state\s+Time\s+left$")
 
         # L   10.22.66.10                            7081.05ff.eb40     Vl230      230   0100  10194mn REACHABLE
-        device_info_capture = re.compile(
+        device_info_capture = regex_engine.compile(
             r"^(?P<dev_code>\S+)\s+(?P<network_layer_address>\S+)\s+(?P<link_layer_address>\S+)\s+(?P<interface>\S+)\s+(?P<vlan_id>\d+)\s+(?P<pref_level_code>\d+)\s+(?P<age>\S+)\s+(?P<state>\S+)$")
 
         # DH4 10.160.43.197                           94d4.69ff.e606  Te8/0/37       1023  0025  116s  REACHABLE  191 s try 0(557967 s)
-        device_info_capture_database = re.compile(
+        device_info_capture_database = regex_engine.compile(
             r"^(?P<dev_code>\S+)\s+"
             r"(?P<network_layer_address>\S+)\s+(?P<link_layer_address>\S+)\s+"
             r"(?P<interface>\S+)\s+(?P<vlan_id>\d+)\s+"
@@ -304,7 +304,7 @@ class ShowDeviceTrackingDatabaseInterface(ShowDeviceTrackingDatabaseInterfaceSch
 
         # Binding Table has 87 entries, 75 dynamic (limit 100000)
         # portDB has 2 entries for interface Gi0/1/1, 2 dynamic
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(.+) +has +(?P<entries>\d+) +entries"
             r"( +for +interface +\S+)?"
             r", +(?P<dynamic>\d+) +dynamic( +\(limit +(?P<limit>\d+)\))?$"
@@ -313,7 +313,7 @@ class ShowDeviceTrackingDatabaseInterface(ShowDeviceTrackingDatabaseInterfaceSch
         # DH4 10.160.43.197                           94d4.69ff.e606  Te8/0/37       1023  0025  116s  REACHABLE  191 s try 0(557967 s)
         # L   10.160.48.1                             0000.0cff.94fe  Vl1024         1024  0100 42473mn REACHABLE
         # ND  FE80::E6C7:22FF:FEFF:8239               e4c7.22ff.8239  Gi1/0/24       1023  0005   34s  REACHABLE  268 s
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<code>\S+)\s+(?P<network_layer_address>\S+)"
             r"\s+(?P<link_layer_address>\S+)"
             r"\s+(?P<interface>\S+)\s+(?P<vlan>\d+)"
@@ -446,11 +446,11 @@ class ShowDeviceTrackingDatabaseDetails(ShowDeviceTrackingDatabaseDetailsSchema)
         binding_key = ''
 
         #  Binding table configuration:
-        binding_table_configuration_capture = re.compile(r'^Binding\s+table\s+configuration:$')
+        binding_table_configuration_capture = regex_engine.compile(r'^Binding\s+table\s+configuration:$')
         #  Binding table current counters:
-        binding_table_counter_capture = re.compile(r'^Binding\s+table\s+current\s+counters:$')
+        binding_table_counter_capture = regex_engine.compile(r'^Binding\s+table\s+current\s+counters:$')
         #  Binding table counters by state:
-        binding_table_state_capture = re.compile(r'^Binding\s+table\s+counters\s+by\s+state:$')
+        binding_table_state_capture = regex_engine.compile(r'^Binding\s+table\s+counters\s+by\s+state:$')
 
         #  max/box  : no limit
         #  max/vlan : no limit
@@ -466,10 +466,10 @@ class ShowDeviceTrackingDatabaseDetails(ShowDeviceTrackingDatabaseDetailsSchema)
         #  CREATING   : 1
         #  TENTATIVE  : 1
         #    total    : 6
-        binding_table_info = re.compile(r'^(?P<parameter>(\S+))\s+:\s+(?P<info>(.*))$')
+        binding_table_info = regex_engine.compile(r'^(?P<parameter>(\S+))\s+:\s+(?P<info>(.*))$')
 
         #     Network Layer Address                    Link Layer Address     Interface  mode       vlan(prim)   prlvl      age        state      Time left        Filter     In Crimson   Client ID          Policy (feature)
-        device_header_capture = re.compile(r'^Network\s+Layer\s+Address\s+Link\s+Layer\s+Address\s+Interface\s+mode\s+vlan\(prim\)\s+prlvl\s+age\s+state\s+Time\s+left\s+Filter\s+In\s+Crimson\s+Client\s+ID\s+Policy\s+\(feature\)$')
+        device_header_capture = regex_engine.compile(r'^Network\s+Layer\s+Address\s+Link\s+Layer\s+Address\s+Interface\s+mode\s+vlan\(prim\)\s+prlvl\s+age\s+state\s+Time\s+left\s+Filter\s+In\s+Crimson\s+Client\s+ID\s+Policy\s+\(feature\)$')
 
         # ND  100.100.100.1                            dead.beef.0001(S)      Twe1/0/42  access     39  (  39)      0024       92mn       STALE      83192 s          no         no           0000.0000.0000     test (Device-tracking)
         # L   39.39.39.1                               5c5a.c791.d69f(R)      Vl39       svi        39  (  39)      0100       11591mn    REACHABLE                   no         yes          0000.0000.0000
@@ -477,15 +477,15 @@ class ShowDeviceTrackingDatabaseDetails(ShowDeviceTrackingDatabaseDetailsSchema)
         # S   1000::1                                  000a.000b.000c(D)      Twe1/0/1   trunk      100 ( 100)      0100       30565mn    DOWN       N/A              no         yes          0000.0000.0000
         # DH4 10.0.0.2                                 000b.000c.000d(D)      Gi1/0/1    access     100 ( 100)      0024       45mn       STALE      221 s(7177 s)    no         yes          000b.000c.000d
         # DH4 110.0.0.3                                0001.0003.0002(R)      Gi1/0/23   access     110 ( 110)      0024       3mn        REACHABLE  12 s try 0(6722 s) no         yes          0001.0003.0002     (unspecified)              LISP-DT-GUARD-VLAN-MULTI-IP (Device-tracking)
-        device_info_capture = re.compile(r'^(?P<dev_code>(\S+))\s+(?P<network_layer_address>(\S+))'
-                                         r'\s+(?P<link_layer_address>(\S+))\s+(?P<interface>(\S+))'
-                                         r'\s+(?P<mode>(\S+))\s+(?P<vlan_id>(\d+))\s+\(\s+\d+\)'
-                                         r'\s+(?P<pref_level_code>(\d+))\s+(?P<age>(\S+))'
-                                         r'\s+(?P<state>(\S+))\s+'
-                                         r'(?P<time_left>(try\s\d\s\d+\ss)|(N\/A)|(\d+\ss\stry\s\d)|'
-                                         r'(\d+\ss)|(\d+\s+s\(\d+\s+s\))|(\d+\s+s\s+try\s+\d+\(\d+\s+s\)))?'
-                                         r'\s+(?P<filter>(yes|no))\s+(?P<in_crimson>(\S+))'
-                                         r'\s+(?P<client_id>(\S+))(\s+(?P<policy>(.*)))?$')
+        device_info_capture = regex_engine.compile(r'^(?P<dev_code>(\S+))\s+(?P<network_layer_address>(\S+))'
+                                                   r'\s+(?P<link_layer_address>(\S+))\s+(?P<interface>(\S+))'
+                                                   r'\s+(?P<mode>(\S+))\s+(?P<vlan_id>(\d+))\s+\(\s+\d+\)'
+                                                   r'\s+(?P<pref_level_code>(\d+))\s+(?P<age>(\S+))'
+                                                   r'\s+(?P<state>(\S+))\s+'
+                                                   r'(?P<time_left>(try\s\d\s\d+\ss)|(N\/A)|(\d+\ss\stry\s\d)|'
+                                                   r'(\d+\ss)|(\d+\s+s\(\d+\s+s\))|(\d+\s+s\s+try\s+\d+\(\d+\s+s\)))?'
+                                                   r'\s+(?P<filter>(yes|no))\s+(?P<in_crimson>(\S+))'
+                                                   r'\s+(?P<client_id>(\S+))(\s+(?P<policy>(.*)))?$')
 
         optional_parameters = [
             'time_left',
@@ -606,8 +606,8 @@ class ShowDeviceTrackingPolicies(ShowDeviceTrackingPoliciesSchema):
         device_tracking_policies_dict = {}
         policy_index = 0
 
-        policy_info_header_capture = re.compile(r'^Target\s+Type\s+Policy\s+Feature\s+Target\s+range$')
-        policy_info_capture = re.compile(
+        policy_info_header_capture = regex_engine.compile(r'^Target\s+Type\s+Policy\s+Feature\s+Target\s+range$')
+        policy_info_capture = regex_engine.compile(
             r"^(?P<target>(\S+)|(vlan\s+\S+))\s+(?P<policy_type>[a-zA-Z]+)\s+"
             r"(?P<policy_name>\S+)\s+(?P<feature>(\S+\s?)+)\s+(?P<tgt_range>vlan\s+\S+)$")
 
@@ -714,25 +714,25 @@ class ShowDeviceTrackingPolicy(ShowDeviceTrackingPolicySchema):
         device_index = 0
 
         # Device-tracking policy test configuration:
-        device_tracking_policy_configuration_header_capture = re.compile(r'^Device-tracking\s+policy\s+\S+\s+configuration:$')
+        device_tracking_policy_configuration_header_capture = regex_engine.compile(r'^Device-tracking\s+policy\s+\S+\s+configuration:$')
 
         #   trusted-port
-        device_tracking_policy_trusted_port_capture = re.compile(r'^(?P<trusted_port>(trusted-port))$')
+        device_tracking_policy_trusted_port_capture = regex_engine.compile(r'^(?P<trusted_port>(trusted-port))$')
 
         #   security-level guard
-        device_tracking_policy_security_level_capture = re.compile(r'^security-level\s+(?P<security_level>(\S+))$')
+        device_tracking_policy_security_level_capture = regex_engine.compile(r'^security-level\s+(?P<security_level>(\S+))$')
 
         #   device-role node
-        device_tracking_policy_device_role_capture = re.compile(r'^device-role\s+(?P<device_role>(\S+))$')
+        device_tracking_policy_device_role_capture = regex_engine.compile(r'^device-role\s+(?P<device_role>(\S+))$')
 
         #   data-glean log-only
-        device_tracking_policy_data_glean_capture = re.compile(r'^data-glean\s+(?P<data_glean>(\S+))$')
+        device_tracking_policy_data_glean_capture = regex_engine.compile(r'^data-glean\s+(?P<data_glean>(\S+))$')
 
         #   destination-glean log-only
-        device_tracking_policy_destination_glean_capture = re.compile(r'^destination-glean\s+(?P<destination_glean>(\S+))$')
+        device_tracking_policy_destination_glean_capture = regex_engine.compile(r'^destination-glean\s+(?P<destination_glean>(\S+))$')
 
         #   prefix-glean only
-        device_tracking_policy_prefix_glean_capture = re.compile(r'^prefix-glean\s+(?P<prefix_glean>(\S+))$')
+        device_tracking_policy_prefix_glean_capture = regex_engine.compile(r'^prefix-glean\s+(?P<prefix_glean>(\S+))$')
 
 
         #   gleaning from Neighbor Discovery protecting prefix-list qux
@@ -740,33 +740,33 @@ class ShowDeviceTrackingPolicy(ShowDeviceTrackingPolicySchema):
         #   gleaning from ARP protecting prefix-list foo
         #   gleaning from DHCP4 protecting prefix-list bar
         #   gleaning from protocol unkn protecting prefix-list quux
-        device_tracking_policy_gleaning_capture = re.compile(
+        device_tracking_policy_gleaning_capture = regex_engine.compile(
             r'^(?P<is_gleaning>((NOT\s+)?gleaning))\s+from\s+(?P<protocol>(\S+\s+\S+|\S+))'
             r'(\s+protecting\s+prefix-list\s+(?P<protecting_prefix_list>(\S+)))?$'
         )
 
         #   limit address-count for IPv4 per mac 5
         #   limit address-count for IPv6 per mac 1
-        device_tracking_policy_limit_address_count_capture = re.compile(
+        device_tracking_policy_limit_address_count_capture = regex_engine.compile(
             r'^limit\s+address-count\s+for\s+(?P<version>(IPv\d))\s+per\s+mac\s+(?P<limit_address_count>(\d+))$')
 
         #   cache poisoning guard enabled all
-        device_tracking_policy_cache_guard_capture = re.compile(
+        device_tracking_policy_cache_guard_capture = regex_engine.compile(
             r'^cache\s+poisoning\s+guard\s+enabled\s+(?P<cache_guard>(\S+))$')
 
         #   origin fabric
-        device_tracking_policy_origin_capture = re.compile(r'^origin\s+(?P<origin>(\S+))$')
+        device_tracking_policy_origin_capture = regex_engine.compile(r'^origin\s+(?P<origin>(\S+))$')
 
         #   tracking disable
-        device_tracking_policy_tracking_capture = re.compile(r'^tracking\s(\(.*\)\s)?(?P<tracking>(\S+))$')
+        device_tracking_policy_tracking_capture = regex_engine.compile(r'^tracking\s(\(.*\)\s)?(?P<tracking>(\S+))$')
 
         # Target               Type  Policy               Feature        Target range
-        device_tracking_policy_targets_header_capture = re.compile(r'^Target\s+Type\s+Policy\s+Feature\s+Target\s+range$')
+        device_tracking_policy_targets_header_capture = regex_engine.compile(r'^Target\s+Type\s+Policy\s+Feature\s+Target\s+range$')
 
         # Twe1/0/42            PORT  test                 Device-tracking vlan all
-        device_tracking_policy_capture = re.compile(r'^(?P<target>(\S+|vlan\s+\d+))\s+(?P<policy_type>(\S+))'
-                                                    r'\s+(?P<policy_name>(\S+))\s+(?P<feature>(\S+))'
-                                                    r'\s+(?P<tgt_range>vlan\s+\S+)$')
+        device_tracking_policy_capture = regex_engine.compile(r'^(?P<target>(\S+|vlan\s+\d+))\s+(?P<policy_type>(\S+))'
+                                                              r'\s+(?P<policy_name>(\S+))\s+(?P<feature>(\S+))'
+                                                              r'\s+(?P<tgt_range>vlan\s+\S+)$')
 
         capture_list = [
             device_tracking_policy_trusted_port_capture,
@@ -898,42 +898,42 @@ class ShowIpv6RaGuardPolicy(ShowIpv6RaGuardPolicySchema):
         device_index = 0
 
         # RA guard policy asdf configuration:
-        ipv6_nd_raguard_configuration_header_capture = re.compile(r'^RA\s+guard\s+policy\s+\S+\s+configuration:$')
+        ipv6_nd_raguard_configuration_header_capture = regex_engine.compile(r'^RA\s+guard\s+policy\s+\S+\s+configuration:$')
 
         #   trusted-port
-        ipv6_nd_ragaurd_trusted_port_capture = re.compile(r'^(?P<trusted_port>(trusted-port))$')
+        ipv6_nd_ragaurd_trusted_port_capture = regex_engine.compile(r'^(?P<trusted_port>(trusted-port))$')
 
         #   device-role router
-        ipv6_nd_ragaurd_device_role_capture = re.compile(r'^device-role\s+(?P<device_role>(\S+))$')
+        ipv6_nd_ragaurd_device_role_capture = regex_engine.compile(r'^device-role\s+(?P<device_role>(\S+))$')
 
         #   hop-limit minimum 1
-        ipv6_nd_ragaurd_min_hop_limit_capture = re.compile(r'^hop-limit\s+minimum\s+(?P<min_hop_limit>(\d+))$')
+        ipv6_nd_ragaurd_min_hop_limit_capture = regex_engine.compile(r'^hop-limit\s+minimum\s+(?P<min_hop_limit>(\d+))$')
 
         #   hop-limit maximum 3
-        ipv6_nd_ragaurd_max_hop_limit_capture = re.compile(r'^hop-limit\s+maximum\s+(?P<max_hop_limit>(\d+))$')
+        ipv6_nd_ragaurd_max_hop_limit_capture = regex_engine.compile(r'^hop-limit\s+maximum\s+(?P<max_hop_limit>(\d+))$')
 
         #   managed-config-flag on
-        ipv6_nd_ragaurd_managed_config_flag_capture = re.compile(r'^managed-config-flag\s+(?P<managed_config_flag>(\S+))$')
+        ipv6_nd_ragaurd_managed_config_flag_capture = regex_engine.compile(r'^managed-config-flag\s+(?P<managed_config_flag>(\S+))$')
 
         #   other-config-flag on
-        ipv6_nd_ragaurd_other_config_flag_capture = re.compile(r'^other-config-flag\s+(?P<other_config_flag>(\S+))$')
+        ipv6_nd_ragaurd_other_config_flag_capture = regex_engine.compile(r'^other-config-flag\s+(?P<other_config_flag>(\S+))$')
 
         #   router-preference maximum high
-        ipv6_nd_ragaurd_max_router_preference_capture = re.compile(r'^router-preference\s+maximum\s+(?P<max_router_preference>(\S+))$')
+        ipv6_nd_ragaurd_max_router_preference_capture = regex_engine.compile(r'^router-preference\s+maximum\s+(?P<max_router_preference>(\S+))$')
 
         #   match ra prefix-list bar
-        ipv6_nd_ragaurd_match_ra_prefix_list_capture = re.compile(r'^match\s+ra\s+prefix-list\s+(?P<match_ra_prefix>(\S+))$')
+        ipv6_nd_ragaurd_match_ra_prefix_list_capture = regex_engine.compile(r'^match\s+ra\s+prefix-list\s+(?P<match_ra_prefix>(\S+))$')
 
         #   match ipv6 access-list foo
-        ipv6_nd_ragaurd_match_ipv6_access_list_capture = re.compile(r'^match\s+ipv6\s+access-list\s+(?P<match_ipv6_access_list>(\S+))$')
+        ipv6_nd_ragaurd_match_ipv6_access_list_capture = regex_engine.compile(r'^match\s+ipv6\s+access-list\s+(?P<match_ipv6_access_list>(\S+))$')
 
         # Target               Type  Policy               Feature        Target range
-        ipv6_nd_raguard_targets_header_capture = re.compile(r'^Target\s+Type\s+Policy\s+Feature\s+Target\s+range$')
+        ipv6_nd_raguard_targets_header_capture = regex_engine.compile(r'^Target\s+Type\s+Policy\s+Feature\s+Target\s+range$')
 
         # Twe1/0/42            PORT  asdf                 RA guard       vlan all
-        ipv6_nd_raguard_target_capture = re.compile(r'^(?P<target>(\S+|vlan\s+\d+))\s+(?P<policy_type>(\S+))'
-                                                    r'\s+(?P<policy_name>(\S+))\s+(?P<feature>(\S+|\S+\s\S+))'
-                                                    r'\s+(?P<tgt_range>vlan\s+\S+)$')
+        ipv6_nd_raguard_target_capture = regex_engine.compile(r'^(?P<target>(\S+|vlan\s+\d+))\s+(?P<policy_type>(\S+))'
+                                                              r'\s+(?P<policy_name>(\S+))\s+(?P<feature>(\S+|\S+\s\S+))'
+                                                              r'\s+(?P<tgt_range>vlan\s+\S+)$')
 
         capture_list = [
             ipv6_nd_ragaurd_device_role_capture,
@@ -1041,30 +1041,30 @@ class ShowIpv6SourceGuardPolicy(ShowIpv6SourceGuardPolicySchema):
         device_index = 0
 
         # Source guard policy test1 configuration:
-        ipv6_source_guard_configuration_header_capture = re.compile(r'^Source\s+guard\s+policy\s+\S+\s+configuration:$')
+        ipv6_source_guard_configuration_header_capture = regex_engine.compile(r'^Source\s+guard\s+policy\s+\S+\s+configuration:$')
 
         #   trusted
-        ipv6_source_guard_trusted_capture = re.compile(r'^(?P<trusted>(trusted))$')
+        ipv6_source_guard_trusted_capture = regex_engine.compile(r'^(?P<trusted>(trusted))$')
 
         #   validate prefix
-        ipv6_source_guard_prefix_capture = re.compile(r'^(?P<validate_prefix>(validate\s+prefix))$')
+        ipv6_source_guard_prefix_capture = regex_engine.compile(r'^(?P<validate_prefix>(validate\s+prefix))$')
 
         #   validate address
-        ipv6_source_guard_address_capture = re.compile(r'^(?P<validate_address>((NOT\s)?validate\s+address))$')
+        ipv6_source_guard_address_capture = regex_engine.compile(r'^(?P<validate_address>((NOT\s)?validate\s+address))$')
 
         #   permit link-local
-        ipv6_source_guard_permit_capture = re.compile(r'^permit\s+(?P<permit>(\S+))$')
+        ipv6_source_guard_permit_capture = regex_engine.compile(r'^permit\s+(?P<permit>(\S+))$')
 
         #   deny global-autoconf
-        ipv6_source_guard_deny_capture = re.compile(r'^deny\s+(?P<deny>(\S+))$')
+        ipv6_source_guard_deny_capture = regex_engine.compile(r'^deny\s+(?P<deny>(\S+))$')
 
        # Target               Type  Policy               Feature        Target range
-        ipv6_source_guard_targets_header_capture = re.compile(r'^Target\s+Type\s+Policy\s+Feature\s+Target\s+range$')
+        ipv6_source_guard_targets_header_capture = regex_engine.compile(r'^Target\s+Type\s+Policy\s+Feature\s+Target\s+range$')
 
         # Twe1/0/42            PORT  test1                Source guard   vlan all
-        ipv6_source_guard_target_capture = re.compile(r'^(?P<target>(\S+|vlan\s+\d+))\s+(?P<policy_type>(\S+))'
-                                                      r'\s+(?P<policy_name>(\S+))\s+(?P<feature>(\S+|\S+\s\S+))'
-                                                      r'\s+(?P<tgt_range>vlan\s+\S+)$')
+        ipv6_source_guard_target_capture = regex_engine.compile(r'^(?P<target>(\S+|vlan\s+\d+))\s+(?P<policy_type>(\S+))'
+                                                                r'\s+(?P<policy_name>(\S+))\s+(?P<feature>(\S+|\S+\s\S+))'
+                                                                r'\s+(?P<tgt_range>vlan\s+\S+)$')
 
         capture_list = [
             ipv6_source_guard_trusted_capture,
@@ -1178,28 +1178,28 @@ class ShowDeviceTrackingCountersVlan(ShowDeviceTrackingCountersVlanSchema):
         message_key = ''
 
         # Received messages on vlan 39   :
-        received_messages_capture = re.compile(r'^Received\s+messages\s+on\s+vlan\s+\d+\s+:$')
+        received_messages_capture = regex_engine.compile(r'^Received\s+messages\s+on\s+vlan\s+\d+\s+:$')
 
         # Received Broadcast/Multicast messages on vlan 39   :
-        received_broadcast_multicast_messages_capture = re.compile(r'^Received\s+Broadcast/Multicast\s+messages\s+on\s+vlan\s+\d+\s+:$')
+        received_broadcast_multicast_messages_capture = regex_engine.compile(r'^Received\s+Broadcast/Multicast\s+messages\s+on\s+vlan\s+\d+\s+:$')
 
         # Bridged messages from vlan 39   :
-        bridged_messages_capture = re.compile(r'^Bridged\s+messages\s+from\s+vlan\s+\d+\s+:$')
+        bridged_messages_capture = regex_engine.compile(r'^Bridged\s+messages\s+from\s+vlan\s+\d+\s+:$')
 
         # Broadcast/Multicast converted to unicast messages from vlan 39   :
-        broadcast_multicast_to_unicast_messages_capture = re.compile(r'^Broadcast/Multicast\s+converted\s+to\s+unicast\s+messages\s+from\s+vlan\s+\d+\s+:$')
+        broadcast_multicast_to_unicast_messages_capture = regex_engine.compile(r'^Broadcast/Multicast\s+converted\s+to\s+unicast\s+messages\s+from\s+vlan\s+\d+\s+:$')
 
        # Probe message on vlan 39   :
-        probe_message_capture = re.compile(r'^Probe\s+message\s+on\s+vlan\s+\d+\s+:$')
+        probe_message_capture = regex_engine.compile(r'^Probe\s+message\s+on\s+vlan\s+\d+\s+:$')
 
         # Limited Broadcast to Local message on vlan 39   :
-        limited_broadcast_to_local_messages_capture = re.compile(r'^Limited\s+Broadcast\s+to\s+Local\s+message\s+on\s+vlan\s+\d+\s+:$')
+        limited_broadcast_to_local_messages_capture = regex_engine.compile(r'^Limited\s+Broadcast\s+to\s+Local\s+message\s+on\s+vlan\s+\d+\s+:$')
 
         # Dropped messages on vlan 39   :
-        dropped_messages_capture = re.compile(r'^Dropped\s+messages\s+on\s+vlan\s+\d+\s+:$')
+        dropped_messages_capture = regex_engine.compile(r'^Dropped\s+messages\s+on\s+vlan\s+\d+\s+:$')
 
         # Faults on vlan 39   :
-        faults_capture = re.compile(r'^Faults\s+on\s+vlan\s+\d+\s+:$')
+        faults_capture = regex_engine.compile(r'^Faults\s+on\s+vlan\s+\d+\s+:$')
 
         # Protocol        Protocol message
         # NDP             RS[15543] NS[5181] NA[10]
@@ -1207,29 +1207,29 @@ class ShowDeviceTrackingCountersVlan(ShowDeviceTrackingCountersVlanSchema):
         # ARP
         # DHCPv4
         # ACD&DAD         --[5181]
-        protocol_info = re.compile(r'^(?P<protocol>(Protocol))\s+(?P<message>(.*))$')
-        ndp_info = re.compile(r'^(?P<protocol>(NDP))\s+(?P<message>(.*))?')
-        dhcp6_info = re.compile(r'^(?P<protocol>(DHCPv6))\s+(?P<message>(.*))?$')
-        arp_info = re.compile(r'^(?P<protocol>(ARP))\s+(?P<message>(.*))?$')
-        dhcp4_info = re.compile(r'^(?P<protocol>(DHCPv4))\s+(?P<message>(.*))?$')
-        acd_dad_info = re.compile(r'^(?P<protocol>(ACD&DAD))\s+\S+\[(?P<message>(\d+))\]?$')
+        protocol_info = regex_engine.compile(r'^(?P<protocol>(Protocol))\s+(?P<message>(.*))$')
+        ndp_info = regex_engine.compile(r'^(?P<protocol>(NDP))\s+(?P<message>(.*))?')
+        dhcp6_info = regex_engine.compile(r'^(?P<protocol>(DHCPv6))\s+(?P<message>(.*))?$')
+        arp_info = regex_engine.compile(r'^(?P<protocol>(ARP))\s+(?P<message>(.*))?$')
+        dhcp4_info = regex_engine.compile(r'^(?P<protocol>(DHCPv4))\s+(?P<message>(.*))?$')
+        acd_dad_info = regex_engine.compile(r'^(?P<protocol>(ACD&DAD))\s+\S+\[(?P<message>(\d+))\]?$')
 
         # PROBE_SEND      NS[3128]
         # PROBE_REPLY     NA[10]
-        probe_info = re.compile(r'^(?P<protocol>(PROBE_\S+))\s+(?P<message>(.*))?')
+        probe_info = regex_engine.compile(r'^(?P<protocol>(PROBE_\S+))\s+(?P<message>(.*))?')
 
         # Device-tracking:    NDP      NS  [10]
         # Flooding Suppress:  NDP      NS  [36]
         # Routing Proxy:      NDP      REDIR[1]
         # Routing Proxy:      NDP      REDIR[1]
-        dropped_message_info = re.compile(r'^(?P<feature>((?!reason).*)):\s+(?P<protocol>(\S+))'
-                                          r'\s+(?P<message>(\S+))\s*\[(?P<dropped>(\d+))\]$')
+        dropped_message_info = regex_engine.compile(r'^(?P<feature>((?!reason).*)):\s+(?P<protocol>(\S+))'
+                                                    r'\s+(?P<message>(\S+))\s*\[(?P<dropped>(\d+))\]$')
 
         #   DHCPv6_REQUEST_NAK[1]
-        fault_info = re.compile(r'^(?P<fault>(FAULT_CODE_INVALID|DHCPv\d_\S+_(TIMEOUT|NAK|ERROR))).*$')
+        fault_info = regex_engine.compile(r'^(?P<fault>(FAULT_CODE_INVALID|DHCPv\d_\S+_(TIMEOUT|NAK|ERROR))).*$')
 
         # reason:  Message unauthorized on port [3]
-        reason_info = re.compile(r'^reason:\s+(?P<reason>.+)\s+\[\d+\]$')
+        reason_info = regex_engine.compile(r'^reason:\s+(?P<reason>.+)\s+\[\d+\]$')
 
         capture_list = [
             ndp_info,
@@ -1323,7 +1323,7 @@ class ShowDeviceTrackingCountersVlan(ShowDeviceTrackingCountersVlanSchema):
                         protocol = groups['protocol'].lower()
                         messages = groups['message'].split()
                         packet_dict = message_dict.setdefault(message_key, {}).setdefault(protocol, {})
-                        packet_capture = re.compile(r'^(?P<packet>(\S+))\[(?P<num>(\d+))\]$')
+                        packet_capture = regex_engine.compile(r'^(?P<packet>(\S+))\[(?P<num>(\d+))\]$')
                         for message in messages:
                             packet_match = packet_capture.match(message)
                             if packet_match:
@@ -1390,7 +1390,7 @@ class ShowDeviceTrackingDatabaseMac(ShowDeviceTrackingDatabaseMacSchema):
         # 000a.000b.000c         Twe1/0/1   100        NO TRUST   MAC-DOWN         N/A              8
 
         # dead.beef.0001         Twe1/0/42  39         NO TRUST   MAC-STALE        N/A              49
-        entry_capture = re.compile(
+        entry_capture = regex_engine.compile(
             r"^(?P<link_layer_address>\S+)"
             r"\s+(?P<interface>\S+)"
             r"\s+(?P<vlan_id>\d+)"
@@ -1492,11 +1492,11 @@ class ShowDeviceTrackingDatabaseMacMac(ShowDeviceTrackingDatabaseMacMacSchema):
         # S   10.10.10.10                              dead.beef.0001         Twe1/0/41  38         0100       77s        REACHABLE  226 s
 
         # macDB has 2 entries for mac dead.beef.0001,vlan 38, 0 dynamic
-        table_info_capture = re.compile(
+        table_info_capture = regex_engine.compile(
             r"^macDB has (?P<entries>\d+) entries for mac \S+,vlan (?P<vlan_id>\d+), (?P<dynamic_count>\d+) dynamic$"
         )
         # S   10.10.10.11                              dead.beef.0001         Twe1/0/41  38         0100       4s         REACHABLE  308 s
-        entry_capture = re.compile(
+        entry_capture = regex_engine.compile(
             r"^(?P<code>\S+)\s+"
             r"(?P<network_layer_address>\S+)\s+"
             r"(?P<link_layer_address>\S+)\s+"
@@ -1658,21 +1658,21 @@ class ShowDeviceTrackingDatabaseMacMacDetails(ShowDeviceTrackingDatabaseMacMacDe
         # S   10.10.10.10                              dead.beef.0001(R)      Twe1/0/41  trunk      38  (  38)      0100       136s       REACHABLE  167 s            no         yes          0000.0000.0000
 
         # Binding table configuration:
-        binding_table_config_capture = re.compile(r"^Binding table configuration:")
+        binding_table_config_capture = regex_engine.compile(r"^Binding table configuration:")
         # max/box  : no limit
         # REACHABLE  : 2
         # total    : 2
-        table_entry_capture = re.compile(r"^(?P<parameter>\S+)\s+:\s+(?P<info>((\d+)|(no limit)))")
+        table_entry_capture = regex_engine.compile(r"^(?P<parameter>\S+)\s+:\s+(?P<info>((\d+)|(no limit)))")
         # Binding table current counters:
-        binding_table_current_counters_capture = re.compile(r"^Binding table current counters:")
+        binding_table_current_counters_capture = regex_engine.compile(r"^Binding table current counters:")
         # Binding table counters by state:
-        binding_table_counters_by_state_capture = re.compile(r"^Binding table counters by state:")
+        binding_table_counters_by_state_capture = regex_engine.compile(r"^Binding table counters by state:")
         # macDB has 2 entries for mac dead.beef.0001,vlan 38, 0 dynamic
-        table_info_capture = re.compile(
+        table_info_capture = regex_engine.compile(
             r"^macDB has (?P<entries>\d+) entries for mac \S+,vlan (?P<vlan_id>\d+), (?P<dynamic_count>\d+) dynamic$"
         )
         # S   10.10.10.11                              dead.beef.0001(R)      Twe1/0/41  trunk      38  (  38)      0100       63s        REACHABLE  249 s            no         yes          0000.0000.0000
-        entry_capture = re.compile(
+        entry_capture = regex_engine.compile(
             r"^(?P<dev_code>\S+)"
             r"\s+(?P<network_layer_address>(\S\S\.\S\S\.\S\S\.\S\S))"
             r"\s+(?P<link_layer_address>\S+)"
@@ -1848,28 +1848,28 @@ class ShowDeviceTrackingCountersInterface(ShowDeviceTrackingCountersInterfaceSch
         message_key = ''
 
         # Received messages on Twe1/0/42:
-        p1 = re.compile(r'^Received\s+messages\s+on\s+\S+:$')
+        p1 = regex_engine.compile(r'^Received\s+messages\s+on\s+\S+:$')
 
         # Received Broadcast/Multicast messages on Twe1/0/42:
-        p2 = re.compile(r'^Received\s+Broadcast/Multicast\s+messages\s+on\s+\S+:$')
+        p2 = regex_engine.compile(r'^Received\s+Broadcast/Multicast\s+messages\s+on\s+\S+:$')
 
         # Bridged messages from Twe1/0/42:
-        p3 = re.compile(r'^Bridged\s+messages\s+from\s+\S+:$')
+        p3 = regex_engine.compile(r'^Bridged\s+messages\s+from\s+\S+:$')
 
         # Broadcast/Multicast converted to unicast messages from Twe1/0/42:
-        p4 = re.compile(r'^Broadcast/Multicast\s+converted\s+to\s+unicast\s+messages\s+from\s+\S+:$')
+        p4 = regex_engine.compile(r'^Broadcast/Multicast\s+converted\s+to\s+unicast\s+messages\s+from\s+\S+:$')
 
         # Probe message on Twe1/0/42:
-        p5 = re.compile(r'^Probe\s+message\s+on\s+\S+:$')
+        p5 = regex_engine.compile(r'^Probe\s+message\s+on\s+\S+:$')
 
         # Limited Broadcast to Local message on Twe1/0/42:
-        p6 = re.compile(r'^Limited\s+Broadcast\s+to\s+Local\s+message\s+on\s+\S+:$')
+        p6 = regex_engine.compile(r'^Limited\s+Broadcast\s+to\s+Local\s+message\s+on\s+\S+:$')
 
         # Dropped messages on Twe1/0/42:
-        p7 = re.compile(r'^Dropped\s+messages\s+on\s+\S+:$')
+        p7 = regex_engine.compile(r'^Dropped\s+messages\s+on\s+\S+:$')
 
         # Faults on Twe1/0/42:
-        p8 = re.compile(r'^Faults\s+on\s+\S+:$')
+        p8 = regex_engine.compile(r'^Faults\s+on\s+\S+:$')
 
         # NDP             RS[70160] NS[20760] NA[14]
         # DHCPv6
@@ -1877,20 +1877,20 @@ class ShowDeviceTrackingCountersInterface(ShowDeviceTrackingCountersInterfaceSch
         # DHCPv4
         # PROBE_SEND      NS[19935] REQ[3]
         # PROBE_REPLY     NA[14]
-        p9 = re.compile(r'^(?P<protocol>(NDP|DHCPv6|ARP|DHCPv4|PROBE_\S+))\s+(?P<message>(.*))?')
+        p9 = regex_engine.compile(r'^(?P<protocol>(NDP|DHCPv6|ARP|DHCPv4|PROBE_\S+))\s+(?P<message>(.*))?')
 
         # ACD&DAD         --[20760]
-        p10 = re.compile(r'^(?P<protocol>(ACD&DAD))\s+\S+\[(?P<message>(\d+))\]?$')
+        p10 = regex_engine.compile(r'^(?P<protocol>(ACD&DAD))\s+\S+\[(?P<message>(\d+))\]?$')
 
         # Flooding Suppress:  NDP      NS  [35]
-        p11 = re.compile(r'^(?P<feature>((?!reason).*)):\s+(?P<protocol>(\S+))'
-                                          r'\s+(?P<message>(\S+))\s+\[(?P<dropped>(\d+))\]$')
+        p11 = regex_engine.compile(r'^(?P<feature>((?!reason).*)):\s+(?P<protocol>(\S+))'
+                                                    r'\s+(?P<message>(\S+))\s+\[(?P<dropped>(\d+))\]$')
 
         # DHCPv6_REBIND_NAK[3]
-        p12 = re.compile(r'^(?P<fault>(FAULT_CODE_INVALID|DHCPv\d_\S+_(TIMEOUT|NAK|ERROR))).*$')
+        p12 = regex_engine.compile(r'^(?P<fault>(FAULT_CODE_INVALID|DHCPv\d_\S+_(TIMEOUT|NAK|ERROR))).*$')
 
         # reason:  Message unauthorized on port [3]
-        p13 = re.compile(r'^reason:\s+(?P<reason>.+)\s+\[\d+\]$')
+        p13 = regex_engine.compile(r'^reason:\s+(?P<reason>.+)\s+\[\d+\]$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1956,7 +1956,7 @@ class ShowDeviceTrackingCountersInterface(ShowDeviceTrackingCountersInterfaceSch
                 messages = groups['message'].split()
                 packet_dict = message_dict.setdefault(message_key, {}).setdefault('protocols', {}) \
                                           .setdefault(protocol, {})
-                packet_capture = re.compile(r'^(?P<packet>(\S+))\[(?P<num>(\d+))\]$')
+                packet_capture = regex_engine.compile(r'^(?P<packet>(\S+))\[(?P<num>(\d+))\]$')
                 for message in messages:
                     m1 = packet_capture.match(message)
                     if m1:
@@ -2051,16 +2051,16 @@ class ShowDeviceTrackingEvents(ShowDeviceTrackingEventsSchema):
 
         #fsm_run event
         #[Fri Jun 18 22:14:40.000] SSID 0 FSM Feature Table running for event ACTIVE_REGISTER in state CREATING
-        p1 = re.compile(r'^\[(?P<timestamp>.+)\]\s+SSID\s+(?P<ssid>\d+)\s+FSM\s+(?P<fsm_name>.*)\s+running\s+for\s+event\s+(?P<event_name>(?<=event\s{1})\S+)\s+in\s+state\s+(?P<event_state>.+)$')
+        p1 = regex_engine.compile(r'^\[(?P<timestamp>.+)\]\s+SSID\s+(?P<ssid>\d+)\s+FSM\s+(?P<fsm_name>.*)\s+running\s+for\s+event\s+(?P<event_name>(?<=event\s{1})\S+)\s+in\s+state\s+(?P<event_state>.+)$')
 
         #fsm_transition event
         #[Fri Jun 18 22:14:40.000] SSID 0 Transition from CREATING to READY upon event ACTIVE_REGISTER
-        p2 = re.compile(r'^\[(?P<timestamp>.+)\]\s+SSID\s+(?P<ssid>\d+)\s+Transition\s+from\s+(?P<prev_state>.+)\s+to\s+(?P<state>.+)\s+upon\s+event\s+(?P<event_name>.+)$')
+        p2 = regex_engine.compile(r'^\[(?P<timestamp>.+)\]\s+SSID\s+(?P<ssid>\d+)\s+Transition\s+from\s+(?P<prev_state>.+)\s+to\s+(?P<state>.+)\s+upon\s+event\s+(?P<event_name>.+)$')
 
         #bt_entry event
         #[Wed Jun 30 17:03:14.000] SSID 1 Created Entry origin Static MAC 000a.000a.000a IPV4 1.1.1.1
         #[Wed Jun 30 17:03:14.000] SSID 1 Entry State changed origin Static MAC 000a.000a.000a IPV4 1.1.1.1
-        p3 = re.compile(r'^\[(?P<timestamp>.+)\]\s+SSID\s+(?P<ssid>\d+)\s(?P<entry_state>.+origin)\s+(?P<mac_addr_type>.+)\sMAC\s+(?P<mac_addr>([\w\d]{4}\.*){3})\s+(?P<ip_addr_type>\S+)\s+(?P<ip_addr>[\w\d\.:]+)$')
+        p3 = regex_engine.compile(r'^\[(?P<timestamp>.+)\]\s+SSID\s+(?P<ssid>\d+)\s(?P<entry_state>.+origin)\s+(?P<mac_addr_type>.+)\sMAC\s+(?P<mac_addr>([\w\d]{4}\.*){3})\s+(?P<ip_addr_type>\S+)\s+(?P<ip_addr>[\w\d\.:]+)$')
 
         parser_dict = {}
         ssid_event_no_dict = {}
@@ -2188,7 +2188,7 @@ class ShowDeviceTrackingFeatures(ShowDeviceTrackingFeaturesSchema):
         # RA guard          192   READY
         # Device-tracking   128   READY
         # Source guard       32   READY
-        p1 = re.compile(r'(?P<feature>.+[^ ])\s+(?P<priority>\d+)\s+(?P<state>\w+)')
+        p1 = regex_engine.compile(r'(?P<feature>.+[^ ])\s+(?P<priority>\d+)\s+(?P<state>\w+)')
 
         parser_dict = {}
 
@@ -2265,7 +2265,7 @@ class ShowDeviceTrackingDatabaseMacDetails(ShowDeviceTrackingDatabaseMacDetailsS
         # L2F  0001.0002.0001         Gi1/0/23   110        NO TRUST   MAC-REACHABLE    231 s            LISP-DT-GLEAN-VLAN-MULTI-IP 31
         # L    ba25.cdf4.ad38         Vl110      110        TRUSTED    MAC-REACHABLE    N/A              LISP-DT-GLEAN-VLAN-MULTI-IP 60
 
-        device_capture = re.compile(
+        device_capture = regex_engine.compile(
             r"^(?P<dev_code>\S+)"
             r"\s+(?P<link_layer_address>(\S+\.\S+\.\S+))"
             r"\s+(?P<interface>\S+)"
@@ -2276,7 +2276,7 @@ class ShowDeviceTrackingDatabaseMacDetails(ShowDeviceTrackingDatabaseMacDetailsS
             r"\s+(?P<policy>\S+)"
             r"(\s+(?P<input_index>\d+))?$"
         )
-        attached_capture = re.compile(
+        attached_capture = regex_engine.compile(
             r"^Attached IP: (?P<ip>\S+)$"
         )
         device_index = 0
@@ -2376,7 +2376,7 @@ class ShowDeviceTrackingMessages(ShowDeviceTrackingMessagesSchema):
         # [Wed Jul 21 20:31:25.000] VLAN 1006, From Et0/1 MAC aabb.cc00.0300: ARP::REP, 192.168.23.3, Packet ignored.
         # [Wed Jul 21 20:31:27.000] VLAN 10, From Et0/0 MAC aabb.cc00.0100: NDP::NA, FE80::A8BB:CCFF:FE00:100, Drop reason=Packet accepted but not forwarded
 
-        message_capture = re.compile(
+        message_capture = regex_engine.compile(
             r"^\[(?P<timestamp>(\S+\s\S+\s\d+\s\S+))\]"
             r"\s+VLAN (?P<vlan>\d+),"
             r"\s+From (?P<interface>\S+)"
@@ -2447,7 +2447,7 @@ class ShowDeviceTrackingDatabaseInterfaceCount(ShowDeviceTrackingDatabaseInterfa
         dict_count = {}
 
         # Number of lines which match regexp = 240
-        p1 = re.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
+        p1 = regex_engine.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2527,19 +2527,19 @@ class ShowDeviceTrackingCapturePolicy(ShowDeviceTrackingCapturePolicySchema):
         parsed_dict = {}
 
         # HW Policy 0000039C #targets:2 
-        p1 = re.compile(r'^HW Policy (?P<policy_id>\w+) #targets:(?P<targets>\d+)$')
+        p1 = regex_engine.compile(r'^HW Policy (?P<policy_id>\w+) #targets:(?P<targets>\d+)$')
         
         # Target Gi1/0/4 type 0 handle 40B  
-        p2 = re.compile(r'^Target (?P<target>[\S\s]+?)\s+type (?P<type>\d+) handle (?P<handle>\S+)$')
+        p2 = regex_engine.compile(r'^Target (?P<target>[\S\s]+?)\s+type (?P<type>\d+) handle (?P<handle>\S+)$')
         
         # HW Target Gi1/0/4 HW policy signature 0000039C policies#:2 rules#:6 sig 0000039C 
-        p3 = re.compile(r'^HW Target (?P<target>[\S\s]+?)\s+HW policy signature (?P<signature>\S+) policies#:(?P<policies>\d+) \S{1,7}\W{0,1}(?P<rules>\d+) sig (?P<sig>\S+)$')
+        p3 = regex_engine.compile(r'^HW Target (?P<target>[\S\s]+?)\s+HW policy signature (?P<signature>\S+) policies#:(?P<policies>\d+) \S{1,7}\W{0,1}(?P<rules>\d+) sig (?P<sig>\S+)$')
 
         # SW policy dhcp_client feature DHCP Guard  
-        p4 = re.compile(r'^SW policy (?P<policy>\S+) feature (?P<feature>.+)$')
+        p4 = regex_engine.compile(r'^SW policy (?P<policy>\S+) feature (?P<feature>.+)$')
         
         # Rule DHCP SERVER SOURCE Protocol UDP mask 00000200 action PUNT match1 0 match2 546 #feat:1 feature DHCP Guard 
-        p5 = re.compile(r'^Rule (?P<rule>[\S\s]+?) Protocol (?P<protocol>\S+) mask (?P<mask>\S+) action (?P<action>\S+) match1 (?P<match1>\d+) match2 (?P<match2>\d+)\W{0,1}#feat:(?P<feat>\d+)$')
+        p5 = regex_engine.compile(r'^Rule (?P<rule>[\S\s]+?) Protocol (?P<protocol>\S+) mask (?P<mask>\S+) action (?P<action>\S+) match1 (?P<match1>\d+) match2 (?P<match2>\d+)\W{0,1}#feat:(?P<feat>\d+)$')
 
         policy_id = None
         current_target = None
@@ -2718,11 +2718,11 @@ class ShowDeviceTrackingDatabaseDetails(ShowDeviceTrackingDatabaseDetailsSchema)
         binding_key = ''
 
         #  Binding table configuration:
-        binding_table_configuration_capture = re.compile(r'^Binding\s+table\s+configuration:$')
+        binding_table_configuration_capture = regex_engine.compile(r'^Binding\s+table\s+configuration:$')
         #  Binding table current counters:
-        binding_table_counter_capture = re.compile(r'^Binding\s+table\s+current\s+counters:$')
+        binding_table_counter_capture = regex_engine.compile(r'^Binding\s+table\s+current\s+counters:$')
         #  Binding table counters by state:
-        binding_table_state_capture = re.compile(r'^Binding\s+table\s+counters\s+by\s+state:$')
+        binding_table_state_capture = regex_engine.compile(r'^Binding\s+table\s+counters\s+by\s+state:$')
 
         #  max/box  : no limit
         #  max/vlan : no limit
@@ -2738,10 +2738,10 @@ class ShowDeviceTrackingDatabaseDetails(ShowDeviceTrackingDatabaseDetailsSchema)
         #  CREATING   : 1
         #  TENTATIVE  : 1
         #    total    : 6
-        binding_table_info = re.compile(r'^(?P<parameter>(\S+))\s+:\s+(?P<info>(.*))$')
+        binding_table_info = regex_engine.compile(r'^(?P<parameter>(\S+))\s+:\s+(?P<info>(.*))$')
 
         #     Network Layer Address                    Link Layer Address     Interface  mode       vlan(prim)   prlvl      age        state      Time left        Filter     In Crimson   Client ID          Policy (feature)
-        device_header_capture = re.compile(r'^Network\s+Layer\s+Address\s+Link\s+Layer\s+Address\s+Interface\s+mode\s+vlan\(prim\)\s+prlvl\s+age\s+state\s+Time\s+left\s+Filter\s+In\s+Crimson\s+Client\s+ID\s+Policy\s+\(feature\)$')
+        device_header_capture = regex_engine.compile(r'^Network\s+Layer\s+Address\s+Link\s+Layer\s+Address\s+Interface\s+mode\s+vlan\(prim\)\s+prlvl\s+age\s+state\s+Time\s+left\s+Filter\s+In\s+Crimson\s+Client\s+ID\s+Policy\s+\(feature\)$')
 
         # ND  100.100.100.1                            dead.beef.0001(S)      Twe1/0/42  access     39  (  39)      0024       92mn       STALE      83192 s          no         no           0000.0000.0000     test (Device-tracking)
         # L   39.39.39.1                               5c5a.c791.d69f(R)      Vl39       svi        39  (  39)      0100       11591mn    REACHABLE                   no         yes          0000.0000.0000
@@ -2749,23 +2749,23 @@ class ShowDeviceTrackingDatabaseDetails(ShowDeviceTrackingDatabaseDetailsSchema)
         # S   1000::1                                  000a.000b.000c(D)      Twe1/0/1   trunk      100 ( 100)      0100       30565mn    DOWN       N/A              no         yes          0000.0000.0000
         # DH4 10.0.0.2                                 000b.000c.000d(D)      Gi1/0/1    access     100 ( 100)      0024       45mn       STALE      221 s(7177 s)    no         yes          000b.000c.000d
         # DH4 110.0.0.3                                0001.0003.0002(R)      Gi1/0/23   access     110 ( 110)      0024       3mn        REACHABLE  12 s try 0(6722 s) no         yes          0001.0003.0002     (unspecified)              LISP-DT-GUARD-VLAN-MULTI-IP (Device-tracking)
-        device_info_capture = re.compile(r'^(?P<dev_code>(\S+))\s+(?P<network_layer_address>(\S+))'
-                                         r'\s+(?P<link_layer_address>(\S+))\s+(?P<interface>(\S+))'
-                                         r'\s+(?P<mode>(\S+))\s+(?P<vlan_id>(\d+))\s+\(\s+\d+\)'
-                                         r'\s+(?P<pref_level_code>(\d+))\s+(?P<age>(\S+))'
-                                         r'\s+(?P<state>(\S+))\s+'
-                                         r'(?P<time_left>(try\s\d\s\d+\ss)|(N\/A)|(\d+\ss\stry\s\d)|'
-                                         r'(\d+\ss)|(\d+\s+s\(\d+\s+s\))|(\d+\s+s\s+try\s+\d+\(\d+\s+s\)))?'
-                                         r'\s+(?P<filter>(yes|no))\s+(?P<in_crimson>(\S+))'
-                                         r'\s+(?P<client_id>(\S+))(\s+(?P<policy>(.*)))?$')
+        device_info_capture = regex_engine.compile(r'^(?P<dev_code>(\S+))\s+(?P<network_layer_address>(\S+))'
+                                                   r'\s+(?P<link_layer_address>(\S+))\s+(?P<interface>(\S+))'
+                                                   r'\s+(?P<mode>(\S+))\s+(?P<vlan_id>(\d+))\s+\(\s+\d+\)'
+                                                   r'\s+(?P<pref_level_code>(\d+))\s+(?P<age>(\S+))'
+                                                   r'\s+(?P<state>(\S+))\s+'
+                                                   r'(?P<time_left>(try\s\d\s\d+\ss)|(N\/A)|(\d+\ss\stry\s\d)|'
+                                                   r'(\d+\ss)|(\d+\s+s\(\d+\s+s\))|(\d+\s+s\s+try\s+\d+\(\d+\s+s\)))?'
+                                                   r'\s+(?P<filter>(yes|no))\s+(?P<in_crimson>(\S+))'
+                                                   r'\s+(?P<client_id>(\S+))(\s+(?P<policy>(.*)))?$')
         # New regex patterns for vlanDB and portDB lines
         # Example input that this regex will match:
         # "vlanDB has 10 entries for vlan 39, 5 dynamic"
-        vlan_db_capture = re.compile(r'^vlanDB\s+has\s+(?P<total_entries>\d+)\s+entries\s+for\s+vlan\s+(?P<vlan_id>\d+),\s+(?P<dynamic_entries>\d+)\s+dynamic$')
+        vlan_db_capture = regex_engine.compile(r'^vlanDB\s+has\s+(?P<total_entries>\d+)\s+entries\s+for\s+vlan\s+(?P<vlan_id>\d+),\s+(?P<dynamic_entries>\d+)\s+dynamic$')
         
         # Example input that this regex will match:
         # "portDB has 15 entries for interface Twe1/0/42, 8 dynamic"
-        port_db_capture = re.compile(r'^portDB\s+has\s+(?P<total_entries>\d+)\s+entries\s+for\s+interface\s+(?P<interface>[\w\/]+),\s+(?P<dynamic_entries>\d+)\s+dynamic$')
+        port_db_capture = regex_engine.compile(r'^portDB\s+has\s+(?P<total_entries>\d+)\s+entries\s+for\s+interface\s+(?P<interface>[\w\/]+),\s+(?P<dynamic_entries>\d+)\s+dynamic$')
 
         optional_parameters = [
             'time_left',
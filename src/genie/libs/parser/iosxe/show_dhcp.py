@@ -9,13 +9,13 @@ IOSXE parsers for the following show commands:
     * 'show ip dhcp snooping track server'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ==============================================
 # Schema Parser for 'show dhcp lease'
 # ==============================================
@@ -61,34 +61,34 @@ class ShowDhcpLease(ShowDhcpLeaseSchema):
         dhcp_dict = {}
 
         # Temp IP addr: 40.187.4.1  for peer on Interface: TenGigabitEthernet1/0/6
-        p1 = re.compile(r'^\s*Temp +IP +addr: +(?P<ip_addr>\d+.\d+.\d+.\d+)\s+for +peer +on +Interface:\s+(?P<interface>[\w\/\.\-\:]+)')
+        p1 = regex_engine.compile(r'^\s*Temp +IP +addr: +(?P<ip_addr>\d+.\d+.\d+.\d+)\s+for +peer +on +Interface:\s+(?P<interface>[\w\/\.\-\:]+)')
         
         # Temp  sub net mask: 255.255.255.252
-        p2 = re.compile(r'^\s*Temp  +sub +net +mask: +(?P<subnet_mask>\d+.\d+.\d+.\d+)')
+        p2 = regex_engine.compile(r'^\s*Temp  +sub +net +mask: +(?P<subnet_mask>\d+.\d+.\d+.\d+)')
 
         # DHCP Lease server: 40.187.4.2, state: 5 Bound
-        p3 = re.compile(r'^\s*DHCP Lease server: +(?P<lease_server>\d+.\d+.\d+.\d+),\s+state: +(?P<state>\d+\s+\w+)')
+        p3 = regex_engine.compile(r'^\s*DHCP Lease server: +(?P<lease_server>\d+.\d+.\d+.\d+),\s+state: +(?P<state>\d+\s+\w+)')
 
         # DHCP transaction id: 6AAAF114
-        p4 = re.compile(r'^\s*DHCP transaction id: +(?P<transaction_id>\w+)')
+        p4 = regex_engine.compile(r'^\s*DHCP transaction id: +(?P<transaction_id>\w+)')
 
         # Lease: 86400 secs,  Renewal: 43200 secs,  Rebind: 75600 secs
-        p5 = re.compile(r'^\s*Lease: +(?P<lease>\d+) secs,\s+Renewal: +(?P<renewal>\d+) secs,\s+Rebind: +(?P<rebind>\d+) secs')
+        p5 = regex_engine.compile(r'^\s*Lease: +(?P<lease>\d+) secs,\s+Renewal: +(?P<renewal>\d+) secs,\s+Rebind: +(?P<rebind>\d+) secs')
 
         # Temp default-gateway addr: 40.187.4.2
-        p6 = re.compile(r'^\s*Temp default-gateway addr: +(?P<default_gw>\d+.\d+.\d+.\d+)')
+        p6 = regex_engine.compile(r'^\s*Temp default-gateway addr: +(?P<default_gw>\d+.\d+.\d+.\d+)')
 
         # Retry count: 0   Client-ID: cisco-00fd.22bc.b846-Te1/0/6
-        p7 = re.compile(r'^\s*Retry count:\s+(?P<retry_count>\d+)\s+Client-ID: +(?P<client_id>(.*))')
+        p7 = regex_engine.compile(r'^\s*Retry count:\s+(?P<retry_count>\d+)\s+Client-ID: +(?P<client_id>(.*))')
 
         # Client-ID hex dump: 636973636F2D303066642E323262632E
-        p8 = re.compile(r'^\s*Client-ID hex dump: (?P<client_id_hex>[0-9A-Fa-f]+)')
+        p8 = regex_engine.compile(r'^\s*Client-ID hex dump: (?P<client_id_hex>[0-9A-Fa-f]+)')
 
         # 623834362D5465312F302F36
-        p8_1 = re.compile(r'^\s*(?P<client_id_hex_ext>[A-Fa-f0-9]+$)')
+        p8_1 = regex_engine.compile(r'^\s*(?P<client_id_hex_ext>[A-Fa-f0-9]+$)')
 
         # Hostname: SM-Hub2
-        p9 = re.compile(r'^\s*Hostname: +(?P<hostname>.*)')
+        p9 = regex_engine.compile(r'^\s*Hostname: +(?P<hostname>.*)')
 
         delimiter = 'Temp IP addr:'
         output_list = [str(delimiter+x) for x in out.split(delimiter) if x]
@@ -262,66 +262,66 @@ class ShowIpv6DhcpInterface(ShowIpv6DhcpInterfaceSchema):
         ret_dict = {}
 
         #TenGigabitEthernet1/0/2.154 is in client mode
-        p1 = re.compile(r'^(?P<interface>.*)\s+is\s+in\s+(?P<mode>.*)\s+mode\s*$')
+        p1 = regex_engine.compile(r'^(?P<interface>.*)\s+is\s+in\s+(?P<mode>.*)\s+mode\s*$')
 
         #Prefix State is OPEN
-        p2 = re.compile(r'^Prefix\s+State\s+is\s+(?P<prefix_state>\w+)\s*$')
+        p2 = regex_engine.compile(r'^Prefix\s+State\s+is\s+(?P<prefix_state>\w+)\s*$')
 
         #Address State is OPEN
-        p3 = re.compile(r'^Address\s+State\s+is\s+(?P<address_state>\w+)\s*$')
+        p3 = regex_engine.compile(r'^Address\s+State\s+is\s+(?P<address_state>\w+)\s*$')
 
         #Prefix name: TEST123
-        p4 = re.compile(r'^Prefix\s+name:\s+(?P<prefix_name>\w+).*$')
+        p4 = regex_engine.compile(r'^Prefix\s+name:\s+(?P<prefix_name>\w+).*$')
 
         #Prefix Rapid-Commit: disabled
-        p5 = re.compile(r'^Prefix\s+Rapid-Commit:\s+(?P<prefix_rapid_commit>\w+)\s*$')
+        p5 = regex_engine.compile(r'^Prefix\s+Rapid-Commit:\s+(?P<prefix_rapid_commit>\w+)\s*$')
 
         #Address Rapid-Commit: disabled
-        p6 = re.compile(r'^Address\s+Rapid-Commit:\s+(?P<address_rapid_commit>\w+)\s*$')
+        p6 = regex_engine.compile(r'^Address\s+Rapid-Commit:\s+(?P<address_rapid_commit>\w+)\s*$')
 
         #Reachable via address: FE80::20C:29FF:FE22:1DA5
-        p7 = re.compile(r'^Reachable\s+via\s+address:\s+(?P<known_servers>[0-9A-Fa-f:]+)\s*$')
+        p7 = regex_engine.compile(r'^Reachable\s+via\s+address:\s+(?P<known_servers>[0-9A-Fa-f:]+)\s*$')
 
         #DUID: 00030001001EE59BE700
-        p8 = re.compile(r'^DUID:\s+(?P<duid>[0-9A-Fa-f]+)\s*$')
+        p8 = regex_engine.compile(r'^DUID:\s+(?P<duid>[0-9A-Fa-f]+)\s*$')
 
         #Preference: 0
-        p9 = re.compile(r'^Preference:\s+(?P<preference>\d+)\s*$')
+        p9 = regex_engine.compile(r'^Preference:\s+(?P<preference>\d+)\s*$')
 
         #IA PD: IA ID 0x004C0001, T1 302400, T2 483840
         #IA NA: IA ID 0x004C0001, T1 43200, T2 69120
-        p10 = re.compile(r'^(?P<type>IA PD|IA NA):\s+IA ID\s+(?P<iaid>[A-F0-9x]+),\s+T1\s+(?P<t1>.*),\s+T2\s+(?P<t2>.*)\s*$')
+        p10 = regex_engine.compile(r'^(?P<type>IA PD|IA NA):\s+IA ID\s+(?P<iaid>[A-F0-9x]+),\s+T1\s+(?P<t1>.*),\s+T2\s+(?P<t2>.*)\s*$')
 
         #Prefix: 8881::/56
         #Address: 7772::6DBE:16C6:2F5:A636/128
-        p11 = re.compile(r'^(?P<addr_or_prefix>Address|Prefix):\s+(?P<addr_or_prefix_value>[0-9A-F:\/]+)\s*$')
+        p11 = regex_engine.compile(r'^(?P<addr_or_prefix>Address|Prefix):\s+(?P<addr_or_prefix_value>[0-9A-F:\/]+)\s*$')
 
         #preferred lifetime 604800, valid lifetime 2592000
-        p12 = re.compile(r'^preferred\s+lifetime\s+(?P<preferred_lifetime>\d+),\s+valid\s+lifetime\s+(?P<valid_lifetime>\d+).*$')
+        p12 = regex_engine.compile(r'^preferred\s+lifetime\s+(?P<preferred_lifetime>\d+),\s+valid\s+lifetime\s+(?P<valid_lifetime>\d+).*$')
 
         #DNS server: 11::11
-        p13 = re.compile(r'^DNS\s+server:\s+(?P<dns_server>[0-9A-Fa-f:]+)\s*$')
+        p13 = regex_engine.compile(r'^DNS\s+server:\s+(?P<dns_server>[0-9A-Fa-f:]+)\s*$')
 
         #Domain name: cisco.com
-        p14 = re.compile(r'^Domain\s+name:\s+(?P<domain_name>.*)\s*$')
+        p14 = regex_engine.compile(r'^Domain\s+name:\s+(?P<domain_name>.*)\s*$')
 
         #Information refresh time: 0
-        p15 = re.compile(r'^Information\s+refresh\s+time:\s+(?P<information_refresh_time>\d+)\s*$')
+        p15 = regex_engine.compile(r'^Information\s+refresh\s+time:\s+(?P<information_refresh_time>\d+)\s*$')
 
         #Using pool: A
-        p16 = re.compile(r'^Using\s+pool:\s+(?P<pool_name>.*)\s*$')
+        p16 = regex_engine.compile(r'^Using\s+pool:\s+(?P<pool_name>.*)\s*$')
        
         #    1::2
-        p17 = re.compile(r'^(?P<relay_destination>[A-F0-9:]+)\s*$')
+        p17 = regex_engine.compile(r'^(?P<relay_destination>[A-F0-9:]+)\s*$')
 
         #Preference value: 0
-        p18 = re.compile(r'^Preference\s+value:\s+(?P<preference_value>\d+)\s*$')
+        p18 = regex_engine.compile(r'^Preference\s+value:\s+(?P<preference_value>\d+)\s*$')
 
         #Hint from client: ignored
-        p19 = re.compile(r'^Hint\s+from\s+client:\s+(?P<hint_from_client>.*)\s*$')
+        p19 = regex_engine.compile(r'^Hint\s+from\s+client:\s+(?P<hint_from_client>.*)\s*$')
 
         #Rapid-Commit: disabled
-        p20 = re.compile(r'^Rapid-Commit:\s+(?P<rapid_commit>.*)\s*$')
+        p20 = regex_engine.compile(r'^Rapid-Commit:\s+(?P<rapid_commit>.*)\s*$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -498,7 +498,7 @@ class ShowIpDhcpSnoopingBibdingInterfaceCount(ShowIpDhcpSnoopingBidingInterface)
         dict_count = {}
 
         # Number of lines which match regexp = 240
-        p1 = re.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
+        p1 = regex_engine.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -529,7 +529,7 @@ class ShowIpVerifySourceInterfaceCount(ShowIpDhcpSnoopingBidingInterface):
         dict_count = {}
 
         # Number of lines which match regexp = 240
-        p1 = re.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
+        p1 = regex_engine.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -574,7 +574,7 @@ class ShowIpDhcpSnoopingStatistics(ShowIpDhcpSnoopingStatisticsSchema):
 
         # Packets Forwarded                                     = 122
         # Packets Dropped                                     = 0
-        p1 = re.compile(r'^(?P<pattern>[\w\s]+)= +(?P<value>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<pattern>[\w\s]+)= +(?P<value>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -633,7 +633,7 @@ class ShowIpDhcpSnoopingTrackServer(ShowIpDhcpSnoopingTrackServerSchema):
         ret_dict = {}
 
         # 10   20.1.2.1        68ca.e423.b846 20.1.2.0        255.255.255.0   0.0.0.0           Jul 17 2024 14:53:41 
-        p1 = re.compile(r'^(?P<vlan>\d+) +(?P<ip>\S+) +(?P<mac>\S+) +(?P<client>\S+) +(?P<mask>\S+) +(?P<relay>\S+) +(?P<time>[\S+\s+]+)$')
+        p1 = regex_engine.compile(r'^(?P<vlan>\d+) +(?P<ip>\S+) +(?P<mac>\S+) +(?P<client>\S+) +(?P<mask>\S+) +(?P<relay>\S+) +(?P<time>[\S+\s+]+)$')
 
         for line in output.splitlines():
 
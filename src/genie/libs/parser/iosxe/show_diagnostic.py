@@ -9,12 +9,12 @@
 """
 
 
-# Python
-import re 
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 class ShowDiagnosticEventSchema(MetaParser):
@@ -49,7 +49,7 @@ class ShowDiagnosticEvent(ShowDiagnosticEventSchema):
         ret_dict = {}
         
         #10/18 11:45:38.819 I  [1]    TestPhyLoopback Passed
-        p1 = re.compile(r'^(?P<timestamp>[\d/: .]+) +(?P<types>\w+) +\[(?P<card>\d+)\] +(?P<name>\w+) +(?P<status>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<timestamp>[\d/: .]+) +(?P<types>\w+) +\[(?P<card>\d+)\] +(?P<name>\w+) +(?P<status>\w+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -99,10 +99,10 @@ class ShowDiagnosticDescriptionModuleTestAll(ShowDiagnosticDescriptionModuleTest
         ret_dict = {}
         
         # TestPhyLoopback :
-        p1 = re.compile(r'^(?P<test_name>\w+)\s+\:$')
+        p1 = regex_engine.compile(r'^(?P<test_name>\w+)\s+\:$')
         
         # The PHY Loopback test verifies the PHY level loopback
-        p2 = re.compile(r'^(?P<description>[\w\s\.,-]+)$')
+        p2 = regex_engine.compile(r'^(?P<description>[\w\s\.,-]+)$')
 
         for line in output.splitlines():
             line=line.strip()
@@ -163,7 +163,7 @@ class ShowDiagnosticContentModule(ShowDiagnosticContentModuleSchema):
         ret_dict = {}
         
         #1) TestGoldPktLoopback -------------> *BPN*X**I       not configured  n/a
-        p1 = re.compile(r'^(?P<test_id>\d+)\) (?P<test_name>\w+) -+> (?P<attributes>\S+)\s+(?P<test_interval>(not configured)|[\d \:\.]+)\s+(?P<threshold>(n\/a)|\d+)$')
+        p1 = regex_engine.compile(r'^(?P<test_id>\d+)\) (?P<test_name>\w+) -+> (?P<attributes>\S+)\s+(?P<test_interval>(not configured)|[\d \:\.]+)\s+(?P<threshold>(n\/a)|\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -233,42 +233,42 @@ class ShowDiagnosticResultModuleTestDetail(ShowDiagnosticResultModuleTestDetailS
         ret_dict = {}
 
         #Error code ------------------> 1 (DIAG_FAILURE)
-        p1 = re.compile(r'^Error code [-> ]+(?P<error_code>(.*))$')
+        p1 = regex_engine.compile(r'^Error code [-> ]+(?P<error_code>(.*))$')
         
         #Total run count -------------> 8160 
-        p2 = re.compile(r'^Total run count [-> ]+(?P<total_run_count>\d+)$')
+        p2 = regex_engine.compile(r'^Total run count [-> ]+(?P<total_run_count>\d+)$')
         
         #Last test testing type ------> Health Monitoring
         #Last test testing type ------> n/a
-        p3 = re.compile(r'^Last test testing type[-> ]+(?P<testing_type>[A-Z a-z]+|n/a)$')
+        p3 = regex_engine.compile(r'^Last test testing type[-> ]+(?P<testing_type>[A-Z a-z]+|n/a)$')
         
         #Last test execution time ----> Oct 15 2019 13:02:21 
-        p4 = re.compile(r'^Last \w+ execution \w+[ ->]+(?P<test_execution_time>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
+        p4 = regex_engine.compile(r'^Last \w+ execution \w+[ ->]+(?P<test_execution_time>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
         
         #First test failure time -----> Oct 06 2019 01:30:37 
-        p5 = re.compile(r'^First test failure time [-> ]+(?P<first_test_failure>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
+        p5 = regex_engine.compile(r'^First test failure time [-> ]+(?P<first_test_failure>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
         
         #Last test failure time ------> Oct 15 2019 13:02:21
-        p6 = re.compile(r'^Last test failure time[-> ]+(?P<last_test_failure>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
+        p6 = regex_engine.compile(r'^Last test failure time[-> ]+(?P<last_test_failure>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
         
         #Last test pass time ---------> n/a 
-        p7 = re.compile(r'^Last test pass time [ ->]+(?P<last_test_pass>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
+        p7 = regex_engine.compile(r'^Last test pass time [ ->]+(?P<last_test_pass>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
         
         #Total failure count ---------> 8160 
-        p8 = re.compile(r'^Total failure count [-> ]+(?P<total_failure_count>\d+)$')
+        p8 = regex_engine.compile(r'^Total failure count [-> ]+(?P<total_failure_count>\d+)$')
         
         #Consecutive failure count ---> 8160 
-        p9 = re.compile(r'^Cons\w+ fail\w+ \w+[ ->]+ (?P<consecutive_failure_count>\d+)$')
+        p9 = regex_engine.compile(r'^Cons\w+ fail\w+ \w+[ ->]+ (?P<consecutive_failure_count>\d+)$')
         
         #2) TestFantray ---------------------> .
         #3) DiagPhyLoopbackTest:
-        p10 = re.compile(r'^(?P<test_id>\d+)\)\s+(?P<test_name>\w+):?\s*-*>*\s*(?P<result>.*)$')
+        p10 = regex_engine.compile(r'^(?P<test_id>\d+)\)\s+(?P<test_name>\w+):?\s*-*>*\s*(?P<result>.*)$')
 
         #Port 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24
-        p11 = re.compile(r'^Port +(?P<ports>[\d\s]+)')
+        p11 = regex_engine.compile(r'^Port +(?P<ports>[\d\s]+)')
         
         #U . . . . U . . . . . . . . . . . . . . . . . .
-        p12 = re.compile(r'(?P<port_state>[UF.\s]+)')
+        p12 = regex_engine.compile(r'(?P<port_state>[UF.\s]+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -425,40 +425,40 @@ class ShowDiagnosticResultSwitchModuleTestDetail(ShowDiagnosticResultSwitchModul
         ret_dict = {}
 
         #2) TestFantray ---------------------> .
-        p1 = re.compile(r'^(?P<test_id>\d+)\)\s+(?P<test_name>\w+):?\s*-*>*\s*(?P<result>.*)$')
+        p1 = regex_engine.compile(r'^(?P<test_id>\d+)\)\s+(?P<test_name>\w+):?\s*-*>*\s*(?P<result>.*)$')
 
         #Error code ------------------> 1 (DIAG_FAILURE)
-        p2 = re.compile(r'^Error code [-> ]+(?P<error_code>(.*))$')
+        p2 = regex_engine.compile(r'^Error code [-> ]+(?P<error_code>(.*))$')
 
         #Total run count -------------> 8160 
-        p3 = re.compile(r'^Total run count [-> ]+(?P<total_run_count>\d+)$')
+        p3 = regex_engine.compile(r'^Total run count [-> ]+(?P<total_run_count>\d+)$')
 
         #Last test testing type ------> Health Monitoring
-        p4 = re.compile(r'^Last test testing type[-> ]+(?P<testing_type>[A-Z a-z]+|n/a)$')
+        p4 = regex_engine.compile(r'^Last test testing type[-> ]+(?P<testing_type>[A-Z a-z]+|n/a)$')
 
         #Last test execution time ----> Oct 15 2019 13:02:21 
-        p5 = re.compile(r'^Last \w+ execution \w+[ ->]+(?P<test_execution_time>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
+        p5 = regex_engine.compile(r'^Last \w+ execution \w+[ ->]+(?P<test_execution_time>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
 
         #First test failure time -----> Oct 06 2019 01:30:37 
-        p6 = re.compile(r'^First test failure time [-> ]+(?P<first_test_failure>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
+        p6 = regex_engine.compile(r'^First test failure time [-> ]+(?P<first_test_failure>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
 
         #Last test failure time ------> Oct 15 2019 13:02:21
-        p7 = re.compile(r'^Last test failure time[-> ]+(?P<last_test_failure>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
+        p7 = regex_engine.compile(r'^Last test failure time[-> ]+(?P<last_test_failure>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
 
         #Last test pass time ---------> n/a 
-        p8 = re.compile(r'^Last test pass time [ ->]+(?P<last_test_pass>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
+        p8 = regex_engine.compile(r'^Last test pass time [ ->]+(?P<last_test_pass>(\w+ \d+ \d+ \d+:\d+:\d+)|n/a)$')
 
         #Total failure count ---------> 8160 
-        p9 = re.compile(r'^Total failure count [-> ]+(?P<total_failure_count>\d+)$')
+        p9 = regex_engine.compile(r'^Total failure count [-> ]+(?P<total_failure_count>\d+)$')
 
         #Consecutive failure count ---> 8160 
-        p10 = re.compile(r'^Cons\w+ fail\w+ \w+[ ->]+ (?P<consecutive_failure_count>\d+)$')
+        p10 = regex_engine.compile(r'^Cons\w+ fail\w+ \w+[ ->]+ (?P<consecutive_failure_count>\d+)$')
 
         #Port 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24
-        p11 = re.compile(r'^Port +(?P<ports>[\d\s]+)')
+        p11 = regex_engine.compile(r'^Port +(?P<ports>[\d\s]+)')
         
         #U . . . . U . . . . . . . . . . . . . . . . . .
-        p12 = re.compile(r'(?P<port_state>[UF.\s]+)')
+        p12 = regex_engine.compile(r'(?P<port_state>[UF.\s]+)')
 
 
         for line in output.splitlines():
@@ -620,40 +620,40 @@ class ShowDiagnosticResultSwitchTestDetail(ShowDiagnosticResultSwitchTestDetailS
         ret_dict = {}
 
         #2) TestFantray ---------------------> .
-        p1 = re.compile(r'^(?P<test_id>\d+)\)\s+(?P<test_name>\w+):?\s*-*>*\s*(?P<result>.*)$') 
+        p1 = regex_engine.compile(r'^(?P<test_id>\d+)\)\s+(?P<test_name>\w+):?\s*-*>*\s*(?P<result>.*)$') 
 
         #Error code ------------------> 1 (DIAG_FAILURE)
-        p2 = re.compile(r'^Error code [-> ]+(?P<error_code>(.*))$')
+        p2 = regex_engine.compile(r'^Error code [-> ]+(?P<error_code>(.*))$')
         
         #Total run count -------------> 8160 
-        p3 = re.compile(r'^Total run count [-> ]+(?P<total_run_count>\d+)$')
+        p3 = regex_engine.compile(r'^Total run count [-> ]+(?P<total_run_count>\d+)$')
         
         #Last test testing type ------> Health Monitoring
-        p4 = re.compile(r'^Last test testing type[-> ]+(?P<testing_type>[A-Z a-z]+|n/a)$')
+        p4 = regex_engine.compile(r'^Last test testing type[-> ]+(?P<testing_type>[A-Z a-z]+|n/a)$')
         
         #Last test execution time ----> Oct 15 2019 13:02:21 
-        p5 = re.compile(r'^Last \w+ execution \w+[ ->]+(?P<test_execution_time>.*|n/a)$')
+        p5 = regex_engine.compile(r'^Last \w+ execution \w+[ ->]+(?P<test_execution_time>.*|n/a)$')
         
         #First test failure time -----> Oct 06 2019 01:30:37 
-        p6 = re.compile(r'^First test failure time [-> ]+(?P<first_test_failure>.*|n/a)$')
+        p6 = regex_engine.compile(r'^First test failure time [-> ]+(?P<first_test_failure>.*|n/a)$')
         
         #Last test failure time ------> Oct 15 2019 13:02:21
-        p7 = re.compile(r'^Last test failure time[-> ]+(?P<last_test_failure>.*|n/a)$')
+        p7 = regex_engine.compile(r'^Last test failure time[-> ]+(?P<last_test_failure>.*|n/a)$')
         
         #Last test pass time ---------> n/a 
-        p8 = re.compile(r'^Last test pass time [ ->]+(?P<last_test_pass>.*|n/a)$')
+        p8 = regex_engine.compile(r'^Last test pass time [ ->]+(?P<last_test_pass>.*|n/a)$')
         
         #Total failure count ---------> 8160 
-        p9 = re.compile(r'^Total failure count [-> ]+(?P<total_failure_count>\d+)$')
+        p9 = regex_engine.compile(r'^Total failure count [-> ]+(?P<total_failure_count>\d+)$')
         
         #Consecutive failure count ---> 8160 
-        p10 = re.compile(r'^Cons\w+ fail\w+ \w+[ ->]+ (?P<consecutive_failure_count>\d+)$')
+        p10 = regex_engine.compile(r'^Cons\w+ fail\w+ \w+[ ->]+ (?P<consecutive_failure_count>\d+)$')
         
         #Port 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24
-        p11 = re.compile(r'^Port +(?P<ports>[\d\s]+)')
+        p11 = regex_engine.compile(r'^Port +(?P<ports>[\d\s]+)')
         
         #U . . . . U . . . . . . . . . . . . . . . . . .
-        p12 = re.compile(r'(?P<port_state>[UF.\s]+)')
+        p12 = regex_engine.compile(r'(?P<port_state>[UF.\s]+)')
 
 
         for line in output.splitlines():
@@ -808,22 +808,22 @@ class ShowDiagnosticPost(ShowDiagnosticPostSchema):
         ret_dict = switch_dict = {}
         
         # Load for five secs: 0%/0%; one minute: 0%; five minutes: 0%
-        p1 = re.compile(r'^Load for five secs: (?P<five_seconds>\S+); one minute: (?P<one_minute>\S+); five minutes: (?P<five_minutes>\S+)$')
+        p1 = regex_engine.compile(r'^Load for five secs: (?P<five_seconds>\S+); one minute: (?P<one_minute>\S+); five minutes: (?P<five_minutes>\S+)$')
 
         # Time source is NTP, .08:55:28.918 UTC Mon Mar 13 2023
-        p2 = re.compile(r'^Time source is NTP, (?P<ntp_time>.+)$')
+        p2 = regex_engine.compile(r'^Time source is NTP, (?P<ntp_time>.+)$')
         
         # Switch 1
-        p3 = re.compile(r'^Switch (?P<switch>\d+)$')
+        p3 = regex_engine.compile(r'^Switch (?P<switch>\d+)$')
 
         # POST: MBIST Tests : Begin
         # POST: PHY Loopback: loopback Test : Begin
         # POST: Thermal, Temperature Tests : Begin
-        p4 = re.compile(r'^POST:\s(?P<test>[\w\s\,]+)(:\sloopback )?Tests*\s:\s(?P<initial_state>[\w\s]+)$')
+        p4 = regex_engine.compile(r'^POST:\s(?P<test>[\w\s\,]+)(:\sloopback )?Tests*\s:\s(?P<initial_state>[\w\s]+)$')
 
         # POST: PHY Loopback: loopback Test : End, Status Passed
         # POST: Thermal, Fan Tests : End, Status Passed
-        p5 = re.compile(r'^POST:\s(?P<test>[\w\s\,]+)(:\sloopback )?Tests*\s:\s(?P<final_state>[\w\s]+), Status (?P<status>[\w\s]+)$')
+        p5 = regex_engine.compile(r'^POST:\s(?P<test>[\w\s\,]+)(:\sloopback )?Tests*\s:\s(?P<final_state>[\w\s]+), Status (?P<status>[\w\s]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -11,12 +11,10 @@ IOSXE parsers for the following show commands:
 
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -91,50 +89,50 @@ class ShowDlepNeighbors(ShowDlepNeighborsSchema):
         ret_dict = {}
 
         # DLEP Neighbors for Interface GigabitEthernet2
-        p1 = re.compile(r'^DLEP\s+Neighbors\s+for\s+Interface\s+(?P<interface>[\w\d/\.-]+)$')
+        p1 = regex_engine.compile(r'^DLEP\s+Neighbors\s+for\s+Interface\s+(?P<interface>[\w\d/\.-]+)$')
 
         # DLEP Server IP=9.9.9.31:11131 Sock=0
-        p2 = re.compile(r'^DLEP\s+Server\s+IP=(?P<dlep_server_ip>[\d\.]+):(?P<u_port>\d+)\s+Sock=(?P<sock>\d+)$')
+        p2 = regex_engine.compile(r'^DLEP\s+Server\s+IP=(?P<dlep_server_ip>[\d\.]+):(?P<u_port>\d+)\s+Sock=(?P<sock>\d+)$')
 
         # DLEP Local IP=9.9.9.11:11111 Sock=0
-        p3 = re.compile(r'^DLEP\s+Local\s+IP=(?P<dlep_local_ip>[\d\.]+):(?P<u_port>\d+)\s+Sock=(?P<sock>\d+)$')
+        p3 = regex_engine.compile(r'^DLEP\s+Local\s+IP=(?P<dlep_local_ip>[\d\.]+):(?P<u_port>\d+)\s+Sock=(?P<sock>\d+)$')
 
         # SID=2151  MAC_Address=000c.299b.a9d2
-        p4 = re.compile(r'^SID=(?P<sid>\d+)\s+(Remote\s+End-point\s+)?MAC_Address=(?P<mac_address>[\w\d\.]+)$')
+        p4 = regex_engine.compile(r'^SID=(?P<sid>\d+)\s+(Remote\s+End-point\s+)?MAC_Address=(?P<mac_address>[\w\d\.]+)$')
 
         # IPv4 : 9.9.9.21  IPv6 LL : FE80::20C:29FF:FE9B:A9D2
         # DLEP Remote IP : 9.9.9.1 DLEP Remote IPv6 LL : FE80::20C:29FF:FED4:B578
-        p5 = re.compile(r'^(DLEP\s+Remote\s+)?IP(v4)?\s+:\s+(?P<ipv4_address>[\d\.]+)\s+(DLEP\s+Remote\s+)?IPv6\s+LL\s+:\s+(?P<link_local_address>[\w:]+)$')
+        p5 = regex_engine.compile(r'^(DLEP\s+Remote\s+)?IP(v4)?\s+:\s+(?P<ipv4_address>[\d\.]+)\s+(DLEP\s+Remote\s+)?IPv6\s+LL\s+:\s+(?P<link_local_address>[\w:]+)$')
 
         # Associated virtual access interface : Virtual-Access2
-        p6 = re.compile(r'^Associated\s+virtual\s+access\s+interface\s+:\s+(?P<interface>[\w\d/\.-]+)$')
+        p6 = regex_engine.compile(r'^Associated\s+virtual\s+access\s+interface\s+:\s+(?P<interface>[\w\d/\.-]+)$')
 
         # RLQ RX Metric : 100
-        p7 = re.compile(r'^RLQ\s+RX\s+Metric\s+:\s+(?P<rlq_rx_metric>\d+)$')
+        p7 = regex_engine.compile(r'^RLQ\s+RX\s+Metric\s+:\s+(?P<rlq_rx_metric>\d+)$')
 
         # RLQ TX Metric : 100
-        p8 = re.compile(r'^RLQ\s+TX\s+Metric\s+:\s+(?P<rlq_tx_metric>\d+)$')
+        p8 = regex_engine.compile(r'^RLQ\s+TX\s+Metric\s+:\s+(?P<rlq_tx_metric>\d+)$')
 
         #   CDR RX Metric : 100000000 bps
-        p9 = re.compile(r'^CDR\s+RX\s+Metric\s+:\s+(?P<cdr_rx_metric>\d+)\s+bps$')
+        p9 = regex_engine.compile(r'^CDR\s+RX\s+Metric\s+:\s+(?P<cdr_rx_metric>\d+)\s+bps$')
 
         #   CDR TX Metric : 100000000 bps
-        p10 = re.compile(r'^CDR\s+TX\s+Metric\s+:\s+(?P<cdr_tx_metric>\d+)\s+bps$')
+        p10 = regex_engine.compile(r'^CDR\s+TX\s+Metric\s+:\s+(?P<cdr_tx_metric>\d+)\s+bps$')
 
         #   MDR RX Metric : 100000000 bps
-        p11 = re.compile(r'^MDR\s+RX\s+Metric\s+:\s+(?P<mdr_rx_metric>\d+)\s+bps$')
+        p11 = regex_engine.compile(r'^MDR\s+RX\s+Metric\s+:\s+(?P<mdr_rx_metric>\d+)\s+bps$')
 
         #   MDR TX Metric : 100000000 bps
-        p12 = re.compile(r'^MDR\s+TX\s+Metric\s+:\s+(?P<mdr_tx_metric>\d+)\s+bps$')
+        p12 = regex_engine.compile(r'^MDR\s+TX\s+Metric\s+:\s+(?P<mdr_tx_metric>\d+)\s+bps$')
 
         #   Resources Metric : 100
-        p13 = re.compile(r'^Resources\s+Metric\s+:\s+(?P<resources_metric>\d+)$')
+        p13 = regex_engine.compile(r'^Resources\s+Metric\s+:\s+(?P<resources_metric>\d+)$')
 
         #   MTU Metric : 1500
-        p14 = re.compile(r'^MTU\s+Metric\s+:\s+(?P<mtu_metric>\d+)$')
+        p14 = regex_engine.compile(r'^MTU\s+Metric\s+:\s+(?P<mtu_metric>\d+)$')
 
         #   Latency Metric : 250 microseconds
-        p15 = re.compile(r'^Latency\s+Metric\s+:\s+(?P<latency>\d+)\s+microseconds$')
+        p15 = regex_engine.compile(r'^Latency\s+Metric\s+:\s+(?P<latency>\d+)\s+microseconds$')
 
 
         for lines in out.splitlines():
@@ -358,58 +356,58 @@ class ShowDlepClients(ShowDlepClientsSchema):
         ret_dict = {}
 
         # DLEP Clients for Interface GigabitEthernet2
-        p1 = re.compile(r'^DLEP\s+Clients\s+for\s+Interface\s+(?P<interface>[\w\d/\.-]+)$')
+        p1 = regex_engine.compile(r'^DLEP\s+Clients\s+for\s+Interface\s+(?P<interface>[\w\d/\.-]+)$')
 
         # DLEP Server IP=9.9.9.21:11121 Sock=0
-        p2 = re.compile(r'^DLEP\s+(Local|Server)\s+IP=(?P<ip>[\d\.]+):(?P<u_port>\d+)\s+Sock=(?P<sock>\d+)$')
+        p2 = regex_engine.compile(r'^DLEP\s+(Local|Server)\s+IP=(?P<ip>[\d\.]+):(?P<u_port>\d+)\s+Sock=(?P<sock>\d+)$')
 
         # DLEP Local Radio IP=9.9.9.12:859 TCP Socket fd=1
-        p3_1 = re.compile(
+        p3_1 = regex_engine.compile(
             r'^DLEP\s+Local\s+Radio\s+IP=(?P<ip>[\d\.]+):(?P<t_port>\d+)\s+TCP\s+Socket\s+fd=(?P<fd>\d+)$')
 
         # DLEP Client IP=9.9.9.22:860 TCP Socket fd=1
-        p3_2 = re.compile(
+        p3_2 = regex_engine.compile(
             r'^DLEP\s+Client\s+IP=(?P<ip>[\d\.]+):(?P<t_port>\d+)\s+TCP\s+Socket\s+fd=(?P<fd>\d+)$')
 
         #  Peer ID=4, Virtual template=2
-        p4 = re.compile(r'^Peer\s+ID=(?P<peer_id>\d+),\s+Virtual\s+template=(?P<virtual_template>\d+)$')
+        p4 = regex_engine.compile(r'^Peer\s+ID=(?P<peer_id>\d+),\s+Virtual\s+template=(?P<virtual_template>\d+)$')
 
         #  Description: DLEP_Radio_RT3
-        p5 = re.compile(r'^Description:\s+(?P<description>\S+)$')
+        p5 = regex_engine.compile(r'^Description:\s+(?P<description>\S+)$')
 
         #   Heartbeat=5000, Dead Interval=10000, Terminate ACK=20000
-        p7 = re.compile(r'^Heartbeat=(?P<heartbeat>\d+),\s+Dead\s+Interval=(?P<dead_interval>\d+),\s+Terminate\s+ACK=(?P<terminate_ack>\d+)$')
+        p7 = regex_engine.compile(r'^Heartbeat=(?P<heartbeat>\d+),\s+Dead\s+Interval=(?P<dead_interval>\d+),\s+Terminate\s+ACK=(?P<terminate_ack>\d+)$')
 
         #   Activity timeout=0, Neighbor Down ACK=10
         #    Neighbor Down ACK=10
-        p9 = re.compile(r'^(?:Activity\s+timeout=(?P<activity_timeout>\d+),\s+)?Neighbor\s+Down\s+ACK=(?P<neighbor_down_ack>\d+)$')
+        p9 = regex_engine.compile(r'^(?:Activity\s+timeout=(?P<activity_timeout>\d+),\s+)?Neighbor\s+Down\s+ACK=(?P<neighbor_down_ack>\d+)$')
 
         #   Link Resources Metric : 100
-        p11 = re.compile(r'^Link\s+Resources\s+Metric\s+:\s+(?P<resources>\d+)$')
+        p11 = regex_engine.compile(r'^Link\s+Resources\s+Metric\s+:\s+(?P<resources>\d+)$')
 
         #   Link MTU Metric : 100
-        p11_1 = re.compile(r'^Link\s+MTU\s+Metric\s+:\s+(?P<mtu>\d+)$')
+        p11_1 = regex_engine.compile(r'^Link\s+MTU\s+Metric\s+:\s+(?P<mtu>\d+)$')
 
         #   Link Latency Metric : 250 microseconds
-        p12 = re.compile(r'^Link\s+Latency\s+Metric\s+:\s+(?P<latency>\d+)\s+microseconds$')
+        p12 = regex_engine.compile(r'^Link\s+Latency\s+Metric\s+:\s+(?P<latency>\d+)\s+microseconds$')
 
         #   Link RLQ RX Metric : 100
-        p13 = re.compile(r'^Link\s+RLQ\s+RX\s+Metric\s+:\s+(?P<rlq_rx>\d+)$')
+        p13 = regex_engine.compile(r'^Link\s+RLQ\s+RX\s+Metric\s+:\s+(?P<rlq_rx>\d+)$')
 
         #   Link RLQ TX Metric : 100
-        p13_1 = re.compile(r'^Link\s+RLQ\s+TX\s+Metric\s+:\s+(?P<rlq_tx>\d+)$')
+        p13_1 = regex_engine.compile(r'^Link\s+RLQ\s+TX\s+Metric\s+:\s+(?P<rlq_tx>\d+)$')
 
         #   Link CDR RX Metric : 100000000 bps
-        p14 = re.compile(r'^Link\s+CDR\s+RX\s+Metric\s+:\s+(?P<cdr_rx>\d+)\s+bps$')
+        p14 = regex_engine.compile(r'^Link\s+CDR\s+RX\s+Metric\s+:\s+(?P<cdr_rx>\d+)\s+bps$')
 
         #   Link CDR TX Metric : 100000000 bps
-        p15 = re.compile(r'^Link\s+CDR\s+TX\s+Metric\s+:\s+(?P<cdr_tx>\d+)\s+bps$')
+        p15 = regex_engine.compile(r'^Link\s+CDR\s+TX\s+Metric\s+:\s+(?P<cdr_tx>\d+)\s+bps$')
 
         #   Link MDR RX Metric : 100000000 bps
-        p16 = re.compile(r'^Link\s+MDR\s+RX\s+Metric\s+:\s+(?P<mdr_rx>\d+)\s+bps$')
+        p16 = regex_engine.compile(r'^Link\s+MDR\s+RX\s+Metric\s+:\s+(?P<mdr_rx>\d+)\s+bps$')
 
         #   Link MDR TX Metric : 100000000 bps
-        p17 = re.compile(r'^Link\s+MDR\s+TX\s+Metric\s+:\s+(?P<mdr_tx>\d+)\s+bps$')
+        p17 = regex_engine.compile(r'^Link\s+MDR\s+TX\s+Metric\s+:\s+(?P<mdr_tx>\d+)\s+bps$')
 
 
         for lines in out.splitlines():
@@ -647,19 +645,19 @@ class ShowDlepCounters(ShowDlepCountersSchema):
         # DLEP Counters for Interface 
         
         # DLEP Counters for TenGigabitEthernet0/0/0
-        p1 = re.compile(r'^(?P<counter_title1>\w+\s+\w+\s+\w+\s+)(?P<val1>\w+\/\d\/\d(\.\d+)?)$')
+        p1 = regex_engine.compile(r'^(?P<counter_title1>\w+\s+\w+\s+\w+\s+)(?P<val1>\w+\/\d\/\d(\.\d+)?)$')
         # DLEP Version = RFC 8175 
-        p2 = re.compile(r'^(?P<counter_title2>DLEP.*)=(?P<val2>.*)$')
+        p2 = regex_engine.compile(r'^(?P<counter_title2>DLEP.*)=(?P<val2>.*)$')
         # Peer Counters:  
-        p3 = re.compile(r'^(?P<counter_title3>\w+\s\w+):$')
+        p3 = regex_engine.compile(r'^(?P<counter_title3>\w+\s\w+):$')
         # RX Peer Discovery     0      TX Peer Offer             0 
-        p4 = re.compile(r'^(?P<counter_title4>\w+\W?\w+\s+(\w+\s+){1,5})(?P<val3>\d+)\s+(?P<counter_title5>\w+\s+(\w+\s+){1,5})?(?P<val4>\d+)?$')
+        p4 = regex_engine.compile(r'^(?P<counter_title4>\w+\W?\w+\s+(\w+\s+){1,5})(?P<val3>\d+)\s+(?P<counter_title5>\w+\s+(\w+\s+){1,5})?(?P<val4>\d+)?$')
         # Peer Heartbeat Timer         369
-        p5 = re.compile(r'^(?P<counter_title6>\w+\s+(\w+\s+){1,4})(?P<val5>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<counter_title6>\w+\s+(\w+\s+){1,4})(?P<val5>\d+)$')
         # Single Timer Wheel "Manet Infra Wheel"
-        p6 = re.compile(r'^(?P<counter_title7>\w+\s+(\w+\s+){1,4}"(\w+\s?){1,4})"$')
+        p6 = regex_engine.compile(r'^(?P<counter_title7>\w+\s+(\w+\s+){1,4}"(\w+\s?){1,4})"$')
         # Wheel size       = 4096
-        p7 = re.compile(r'^(?P<counter_title8>(\w+\s+){1,4})=(?P<val6>\s+\d+\s?(\w+){0,1})$')
+        p7 = regex_engine.compile(r'^(?P<counter_title8>(\w+\s+){1,4})=(?P<val6>\s+\d+\s?(\w+){0,1})$')
           
         for lines in output.splitlines():
             line = lines.strip()
@@ -766,25 +764,25 @@ class ShowDlepConfigInterface(ShowDlepConfigInterfaceSchema):
         ret_dict = {}
 
         # DLEP Version = RFC 8175
-        p1 = re.compile(r'^DLEP Version = (?P<version>.*)$')
+        p1 = regex_engine.compile(r'^DLEP Version = (?P<version>.*)$')
 
         # DLEP Local IP=9.9.9.151:55113
-        p2 = re.compile(r'^DLEP Local IP=(?P<local_ip>.*)$')
+        p2 = regex_engine.compile(r'^DLEP Local IP=(?P<local_ip>.*)$')
 
         # DLEPv27 TCP Port = 55114
-        p3 = re.compile(r'^DLEPv27 TCP Port = (?P<tcp_port>.*)$')
+        p3 = regex_engine.compile(r'^DLEPv27 TCP Port = (?P<tcp_port>.*)$')
 
         # Virtual template=1
-        p4 = re.compile(r'^Virtual template=(?P<virtual_template>.*)$')
+        p4 = regex_engine.compile(r'^Virtual template=(?P<virtual_template>.*)$')
 
         # Missed heartbeat threshold=2, Peer Terminate ACK timeout=10
-        p5 = re.compile(r'^Missed heartbeat threshold=(?P<missed_heartbeat_threshold>[0-9]+), Peer Terminate ACK timeout=(?P<peer_terminate_ack_timeout>[0-9]+)$')
+        p5 = regex_engine.compile(r'^Missed heartbeat threshold=(?P<missed_heartbeat_threshold>[0-9]+), Peer Terminate ACK timeout=(?P<peer_terminate_ack_timeout>[0-9]+)$')
 
         # Heartbeat interval=5, Discovery interval =5, Session Ack timeout=10
-        p6 = re.compile(r'^Heartbeat interval=(?P<heartbeat_interval>[0-9]+), Discovery interval =(?P<discovery_interval>[0-9]+), Session Ack timeout=(?P<session_ack_timeout>[0-9]+)$')
+        p6 = regex_engine.compile(r'^Heartbeat interval=(?P<heartbeat_interval>[0-9]+), Discovery interval =(?P<discovery_interval>[0-9]+), Session Ack timeout=(?P<session_ack_timeout>[0-9]+)$')
 
         # Neighbor activity timeout=0, Neighbor Down ACK timeout=10
-        p7 = re.compile(r'^Neighbor activity timeout=(?P<neighbor_activity_timeout>[0-9]+), Neighbor Down ACK timeout=(?P<neighbor_down_ack_timeout>[0-9]+)$')
+        p7 = regex_engine.compile(r'^Neighbor activity timeout=(?P<neighbor_activity_timeout>[0-9]+), Neighbor Down ACK timeout=(?P<neighbor_down_ack_timeout>[0-9]+)$')
 
         for line_raw in out.splitlines():
             line = line_raw.strip()
@@ -933,19 +931,19 @@ class ShowDlepCounters(ShowDlepCountersSchema):
         # DLEP Counters for Interface 
         
         # DLEP Counters for TenGigabitEthernet0/0/0
-        p1 = re.compile(r'^(?P<counter_title1>\w+\s+\w+\s+\w+\s+)(?P<val1>\w+\/\d\/\d(\.\d+)?)$')
+        p1 = regex_engine.compile(r'^(?P<counter_title1>\w+\s+\w+\s+\w+\s+)(?P<val1>\w+\/\d\/\d(\.\d+)?)$')
         # DLEP Version = RFC 8175 
-        p2 = re.compile(r'^(?P<counter_title2>DLEP.*)=(?P<val2>.*)$')
+        p2 = regex_engine.compile(r'^(?P<counter_title2>DLEP.*)=(?P<val2>.*)$')
         # Peer Counters:  
-        p3 = re.compile(r'^(?P<counter_title3>\w+\s\w+):$')
+        p3 = regex_engine.compile(r'^(?P<counter_title3>\w+\s\w+):$')
         # RX Peer Discovery     0      TX Peer Offer             0 
-        p4 = re.compile(r'^(?P<counter_title4>\w+\W?\w+\s+(\w+\s+){1,5})(?P<val3>\d+)\s+(?P<counter_title5>\w+\s+(\w+\s+){1,5})?(?P<val4>\d+)?$')
+        p4 = regex_engine.compile(r'^(?P<counter_title4>\w+\W?\w+\s+(\w+\s+){1,5})(?P<val3>\d+)\s+(?P<counter_title5>\w+\s+(\w+\s+){1,5})?(?P<val4>\d+)?$')
         # Peer Heartbeat Timer         369
-        p5 = re.compile(r'^(?P<counter_title6>\w+\s+(\w+\s+){1,4})(?P<val5>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<counter_title6>\w+\s+(\w+\s+){1,4})(?P<val5>\d+)$')
         # Single Timer Wheel "Manet Infra Wheel"
-        p6 = re.compile(r'^(?P<counter_title7>\w+\s+(\w+\s+){1,4}"(\w+\s?){1,4})"$')
+        p6 = regex_engine.compile(r'^(?P<counter_title7>\w+\s+(\w+\s+){1,4}"(\w+\s?){1,4})"$')
         # Wheel size       = 4096
-        p7 = re.compile(r'^(?P<counter_title8>(\w+\s+){1,4})=(?P<val6>\s+\d+\s?(\w+){0,1})$')
+        p7 = regex_engine.compile(r'^(?P<counter_title8>(\w+\s+){1,4})=(?P<val6>\s+\d+\s?(\w+){0,1})$')
           
         for lines in output.splitlines():
             line = lines.strip()
@@ -1052,25 +1050,25 @@ class ShowDlepConfigInterface(ShowDlepConfigInterfaceSchema):
         ret_dict = {}
 
         # DLEP Version = RFC 8175
-        p1 = re.compile(r'^DLEP Version = (?P<version>.*)$')
+        p1 = regex_engine.compile(r'^DLEP Version = (?P<version>.*)$')
 
         # DLEP Local IP=9.9.9.151:55113
-        p2 = re.compile(r'^DLEP Local IP=(?P<local_ip>.*)$')
+        p2 = regex_engine.compile(r'^DLEP Local IP=(?P<local_ip>.*)$')
 
         # DLEPv27 TCP Port = 55114
-        p3 = re.compile(r'^DLEPv27 TCP Port = (?P<tcp_port>.*)$')
+        p3 = regex_engine.compile(r'^DLEPv27 TCP Port = (?P<tcp_port>.*)$')
 
         # Virtual template=1
-        p4 = re.compile(r'^Virtual template=(?P<virtual_template>.*)$')
+        p4 = regex_engine.compile(r'^Virtual template=(?P<virtual_template>.*)$')
 
         # Missed heartbeat threshold=2, Peer Terminate ACK timeout=10
-        p5 = re.compile(r'^Missed heartbeat threshold=(?P<missed_heartbeat_threshold>[0-9]+), Peer Terminate ACK timeout=(?P<peer_terminate_ack_timeout>[0-9]+)$')
+        p5 = regex_engine.compile(r'^Missed heartbeat threshold=(?P<missed_heartbeat_threshold>[0-9]+), Peer Terminate ACK timeout=(?P<peer_terminate_ack_timeout>[0-9]+)$')
 
         # Heartbeat interval=5, Discovery interval =5, Session Ack timeout=10
-        p6 = re.compile(r'^Heartbeat interval=(?P<heartbeat_interval>[0-9]+), Discovery interval =(?P<discovery_interval>[0-9]+), Session Ack timeout=(?P<session_ack_timeout>[0-9]+)$')
+        p6 = regex_engine.compile(r'^Heartbeat interval=(?P<heartbeat_interval>[0-9]+), Discovery interval =(?P<discovery_interval>[0-9]+), Session Ack timeout=(?P<session_ack_timeout>[0-9]+)$')
 
         # Neighbor activity timeout=0, Neighbor Down ACK timeout=10
-        p7 = re.compile(r'^Neighbor activity timeout=(?P<neighbor_activity_timeout>[0-9]+), Neighbor Down ACK timeout=(?P<neighbor_down_ack_timeout>[0-9]+)$')
+        p7 = regex_engine.compile(r'^Neighbor activity timeout=(?P<neighbor_activity_timeout>[0-9]+), Neighbor Down ACK timeout=(?P<neighbor_down_ack_timeout>[0-9]+)$')
 
         for line_raw in out.splitlines():
             line = line_raw.strip()
@@ -4,9 +4,9 @@
 """
 
 # Metaparser
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -84,11 +84,11 @@ class ShowDmvpn(ShowDmvpnSchema):
         parsed_dict = {}
 
         # Interface: Tunnel84, IPv4 NHRP Details
-        p1 = re.compile(r'Interface: +(?P<interfaces>\S+),')
+        p1 = regex_engine.compile(r'Interface: +(?P<interfaces>\S+),')
 
         # Type:Spoke, NHRP Peers:1,
-        p2 = re.compile(r'Type:(?P<type>\S+),'
-                        r' +NHRP Peers:(?P<nhrp_peers>(\d+)),$')
+        p2 = regex_engine.compile(r'Type:(?P<type>\S+),'
+                                  r' +NHRP Peers:(?P<nhrp_peers>(\d+)),$')
 
         # # Ent  Peer NBMA Addr Peer Tunnel Add State  UpDn Tm Attrb
         # ----- --------------- --------------- ----- -------- -----
@@ -97,12 +97,12 @@ class ShowDmvpn(ShowDmvpnSchema):
         #                           172.30.90.25   UP    6d12h     S
         #     2 172.29.134.1       172.30.72.72    UP 00:29:40   DT2
         #                          172.30.72.72    UP 00:29:40   DT1
-        p3 = re.compile(r'^((?P<ent>(\d+))'
-                        r' +(?P<peers>([a-z0-9\.\:]+|UNKNOWN))'
-                        r' +)?(?P<tunnel_addr>[a-z0-9\.\:]+)'
-                        r' +(?P<state>[a-zA-Z]+)'
-                        r' +(?P<time>(\d+\w)+|never|[0-9\:]+)'
-                        r' +(?P<attrb>(\w)+)$')
+        p3 = regex_engine.compile(r'^((?P<ent>(\d+))'
+                                  r' +(?P<peers>([a-z0-9\.\:]+|UNKNOWN))'
+                                  r' +)?(?P<tunnel_addr>[a-z0-9\.\:]+)'
+                                  r' +(?P<state>[a-zA-Z]+)'
+                                  r' +(?P<time>(\d+\w)+|never|[0-9\:]+)'
+                                  r' +(?P<attrb>(\w)+)$')
 
         # Defines the "for" loop, to pattern match each line of output
 
@@ -205,7 +205,7 @@ class ShowDmvpnCountStatus(ShowDmvpnCountStatusSchema):
         dict_count = {}
 
         # Number of lines which match regexp = 2648
-        p1 = re.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
+        p1 = regex_engine.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -7,10 +7,8 @@ IOSXE parsers for the following show commands:
 
 '''
 
-# Python
-import re
-
 # Metaparser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
@@ -98,42 +96,42 @@ class ShowDnsLookup(ShowDnsLookupSchema):
             out = output
 
         # Job Id: 6
-        jobid_re = re.compile(r'Job\s+Id:\s*(?P<job_id>\d+)?')
+        jobid_re = regex_engine.compile(r'Job\s+Id:\s*(?P<job_id>\d+)?')
         #  Status: JOB_COMPLETED
-        jobstatus_re = re.compile(r'Status:\s*(?P<status>\S*)')
+        jobstatus_re = regex_engine.compile(r'Status:\s*(?P<status>\S*)')
         #  Request Info:
-        requestinfo_re = re.compile(r'Request\s*Info:\s*')
+        requestinfo_re = regex_engine.compile(r'Request\s*Info:\s*')
         #   VRF Name: Mgmt-intf
         #   VRF Name: default
-        vrfname_re = re.compile(r'VRF\s*Name:\s*(?P<vrf_name>(\S*))')
+        vrfname_re = regex_engine.compile(r'VRF\s*Name:\s*(?P<vrf_name>(\S*))')
         #   Host Name: yahoo.com
         #   Host Name: test123.com
-        hostname_re = re.compile(r'Host\s*Name:\s*(?P<host_name>\S*)')
+        hostname_re = regex_engine.compile(r'Host\s*Name:\s*(?P<host_name>\S*)')
         #   DNS Server: 72.163.128.140
         #   DNS Server: FE80::203:E3FF:FE6A:BF81
         #   DNS Server: 1::1
-        dnsserver_re = re.compile(r'DNS\s*Server:\s*(?P<dns_server>\S*)')
+        dnsserver_re = regex_engine.compile(r'DNS\s*Server:\s*(?P<dns_server>\S*)')
         #  Request-time: *Sep 19 20:22:29.836 Completion-time: *Sep 19 20:22:29.847
-        requestcompletiontime_re = re.compile(r'Request-time:\s*\*(?P<request_time>\w+\s*\d+\s\d{2}:\d{2}:\d{2}\.\d{3})\s*(Completion-time:\s*\*(?P<completion_time>\w+\s*\d+\s\d{2}:\d{2}:\d{2}\.\d{3})?)?$')
+        requestcompletiontime_re = regex_engine.compile(r'Request-time:\s*\*(?P<request_time>\w+\s*\d+\s\d{2}:\d{2}:\d{2}\.\d{3})\s*(Completion-time:\s*\*(?P<completion_time>\w+\s*\d+\s\d{2}:\d{2}:\d{2}\.\d{3})?)?$')
         #  Error Code: No Error
         #  Error Code: Lookup Timeout
-        errorcode_re = re.compile(r'Error\s*Code:\s*(?P<error_code>[a-zA-Z ]*)')
+        errorcode_re = regex_engine.compile(r'Error\s*Code:\s*(?P<error_code>[a-zA-Z ]*)')
         #  DNS Response: 
-        dnsresp_re = re.compile(r'DNS\s*Response:\s*')
+        dnsresp_re = regex_engine.compile(r'DNS\s*Response:\s*')
         #   Id: 0
-        dnsrespid_re = re.compile(r'Id:\s*(?P<dns_id>\d+)')
+        dnsrespid_re = regex_engine.compile(r'Id:\s*(?P<dns_id>\d+)')
         #   Flags: qr-response opcode-query rd ra rcode-noerr 
-        dnsrespflags_re = re.compile(r'Flags:\s*(?P<dns_flags>[a-zA-Z -]*)')
+        dnsrespflags_re = regex_engine.compile(r'Flags:\s*(?P<dns_flags>[a-zA-Z -]*)')
         #   Qdcount: 1 Ancount: 6 Nscount: 0 Arcount: 1 
-        dnsrespcnt_re = re.compile(r'Qdcount:\s(?P<dns_qdcnt>\d+)\sAncount:\s(?P<dns_ancnt>\d+)\sNscount:\s(?P<dns_nscnt>\d+)\sArcount:\s(?P<dns_arcnt>\d+)')
+        dnsrespcnt_re = regex_engine.compile(r'Qdcount:\s(?P<dns_qdcnt>\d+)\sAncount:\s(?P<dns_ancnt>\d+)\sNscount:\s(?P<dns_nscnt>\d+)\sArcount:\s(?P<dns_arcnt>\d+)')
         #   Class: IN Type: IPv6 RTT: 11ms
-        dnsrespclass_re = re.compile(r'Class:\s(?P<dns_class>\w+)\sType:\s(?P<dns_type>\w+)\sRTT:\s(?P<dns_rtt>\d+ms)')
+        dnsrespclass_re = regex_engine.compile(r'Class:\s(?P<dns_class>\w+)\sType:\s(?P<dns_type>\w+)\sRTT:\s(?P<dns_rtt>\d+ms)')
         #   Payload Size: 206
-        dnsresppayloadsize_re = re.compile(r'Payload\s*Size:\s*(?P<dns_payload_size>\d*)')
+        dnsresppayloadsize_re = regex_engine.compile(r'Payload\s*Size:\s*(?P<dns_payload_size>\d*)')
         #   IP: 2001:4998:44:3507::8001                   TTL: 0
         #   IP: 2001:4998:24:120D::1:1                    TTL: 0
         #   IP: 2001:4998:124:1507::F001                  TTL: 0
-        dnsrespip_re = re.compile(r'IP:\s*(?P<dns_ip>\S*)\s*TTL:\s*(?P<dns_ttl>\d*)')
+        dnsrespip_re = regex_engine.compile(r'IP:\s*(?P<dns_ip>\S*)\s*TTL:\s*(?P<dns_ttl>\d*)')
         
         # Init vars
         request_info_var = 0
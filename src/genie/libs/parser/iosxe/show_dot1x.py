@@ -6,9 +6,6 @@
      *  show dot1x all summary
      *  show dot1x statistics
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -20,6 +17,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ====================================
@@ -96,15 +94,15 @@ class ShowDot1xAllDetail(ShowDot1xAllDetailSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Sysauthcontrol +(?P<val>\w+)$')
-        p2 = re.compile(r'^Dot1x +Protocol +Version +(?P<val>\d+)$')
-        p3 = re.compile(r'^Dot1x +Info +for +(?P<intf>[\w\-\/]+)$')
-        p4 = re.compile(r'^(?P<key>[\w\s]+) +\= +(?P<val>[\w\-]+)( *[\(\)\s\w]+)?$')
-        p5 = re.compile(r'^EAP +Method +\= +(?P<eap>\S+)$')
-        p6 = re.compile(r'^Supplicant +\= +(?P<client>[\w\.]+)$')
-        p7 = re.compile(r'^Session +ID +\= +(?P<session_id>[\w\-]+)$')
-        p8 = re.compile(r'^Auth +SM +State +\= +(?P<state>[\w\-]+)$')
-        p9 = re.compile(r'^Auth +BEND +SM +State +\= +(?P<state>[\w\-]+)$')
+        p1 = regex_engine.compile(r'^Sysauthcontrol +(?P<val>\w+)$')
+        p2 = regex_engine.compile(r'^Dot1x +Protocol +Version +(?P<val>\d+)$')
+        p3 = regex_engine.compile(r'^Dot1x +Info +for +(?P<intf>[\w\-\/]+)$')
+        p4 = regex_engine.compile(r'^(?P<key>[\w\s]+) +\= +(?P<val>[\w\-]+)( *[\(\)\s\w]+)?$')
+        p5 = regex_engine.compile(r'^EAP +Method +\= +(?P<eap>\S+)$')
+        p6 = regex_engine.compile(r'^Supplicant +\= +(?P<client>[\w\.]+)$')
+        p7 = regex_engine.compile(r'^Session +ID +\= +(?P<session_id>[\w\-]+)$')
+        p8 = regex_engine.compile(r'^Auth +SM +State +\= +(?P<state>[\w\-]+)$')
+        p9 = regex_engine.compile(r'^Auth +BEND +SM +State +\= +(?P<state>[\w\-]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -316,10 +314,10 @@ class ShowDot1xAllStatistics(ShowDot1xAllStatisticsSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Dot1x +(Supplicant|Authenticator) +Port +Statistics +for +(?P<intf>[\w\-\/]+)$')
-        p2 = re.compile(r'^RxVersion +\= *(?P<rxversion>\d+) +'
-                         r'LastRxSrcMAC +\= *(?P<lastrxsrcmac>\w+\.\w+\.\w+)$')
-        p3 = re.compile(r'(\w+) +\= *(\d+)')
+        p1 = regex_engine.compile(r'^Dot1x +(Supplicant|Authenticator) +Port +Statistics +for +(?P<intf>[\w\-\/]+)$')
+        p2 = regex_engine.compile(r'^RxVersion +\= *(?P<rxversion>\d+) +'
+                                   r'LastRxSrcMAC +\= *(?P<lastrxsrcmac>\w+\.\w+\.\w+)$')
+        p3 = regex_engine.compile(r'(\w+) +\= *(\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -393,9 +391,9 @@ class ShowDot1xAllSummary(ShowDot1xAllSummarySchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<intf>[\w\-\/]+) +(?P<pae>\w+) +'
-                         r'(?P<client>\w+\.\w+\.\w+) +(?P<status>\w+)$')
-        p2 = re.compile(r'^((?P<pae>\w+) +)?(?P<client>\w+\.\w+\.\w+) +(?P<status>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<intf>[\w\-\/]+) +(?P<pae>\w+) +'
+                                   r'(?P<client>\w+\.\w+\.\w+) +(?P<status>\w+)$')
+        p2 = regex_engine.compile(r'^((?P<pae>\w+) +)?(?P<client>\w+\.\w+\.\w+) +(?P<status>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -467,9 +465,9 @@ class ShowDot1xAllCount(ShowDot1xAllCountSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Authorized +Clients +\= +(?P<authorized_clients>\d+)$')
-        p2 = re.compile(r'^UnAuthorized +Clients +\= +(?P<unauthorized_clients>\d+)$')
-        p3 = re.compile(r'^Total +No +of +Client +\= +(?P<total>\d+)$')
+        p1 = regex_engine.compile(r'^Authorized +Clients +\= +(?P<authorized_clients>\d+)$')
+        p2 = regex_engine.compile(r'^UnAuthorized +Clients +\= +(?P<unauthorized_clients>\d+)$')
+        p3 = regex_engine.compile(r'^Total +No +of +Client +\= +(?P<total>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -541,19 +539,19 @@ class ShowDot1xStatistics(ShowDot1xStatisticsSchema):
             output = self.device.execute(self.cli_command)
 
         # RxStart = 2     RxLogoff = 0    RxResp = 14      RxRespID = 32
-        p1 = re.compile(r"^RxStart\s+=\s+(?P<rx_start>\d+)\s+RxLogoff\s+=\s+(?P<rx_logoff>\d+)\s+RxResp\s+=\s+(?P<rx_resp>\d+)\s+RxRespID\s+=\s+(?P<rx_resp_id>\d+)$")
+        p1 = regex_engine.compile(r"^RxStart\s+=\s+(?P<rx_start>\d+)\s+RxLogoff\s+=\s+(?P<rx_logoff>\d+)\s+RxResp\s+=\s+(?P<rx_resp>\d+)\s+RxRespID\s+=\s+(?P<rx_resp_id>\d+)$")
         # RxReq = 0       RxInvalid = 0   RxLenErr = 0
-        p1_1 = re.compile(r"^RxReq\s+=\s+(?P<rx_req>\d+)\s+RxInvalid\s+=\s+(?P<rx_invalid>\d+)\s+RxLenErr\s+=\s+(?P<rx_len_err>\d+)$")
+        p1_1 = regex_engine.compile(r"^RxReq\s+=\s+(?P<rx_req>\d+)\s+RxInvalid\s+=\s+(?P<rx_invalid>\d+)\s+RxLenErr\s+=\s+(?P<rx_len_err>\d+)$")
         # RxTotal = 53
-        p1_2 = re.compile(r"^RxTotal\s+=\s+(?P<rx_total>\d+)$")
+        p1_2 = regex_engine.compile(r"^RxTotal\s+=\s+(?P<rx_total>\d+)$")
         # TxStart = 0     TxLogoff = 0    TxResp = 0
-        p1_3 = re.compile(r"^TxStart\s+=\s+(?P<tx_start>\d+)\s+TxLogoff\s+=\s+(?P<tx_logoff>\d+)\s+TxResp\s+=\s+(?P<tx_resp>\d+)$")
+        p1_3 = regex_engine.compile(r"^TxStart\s+=\s+(?P<tx_start>\d+)\s+TxLogoff\s+=\s+(?P<tx_logoff>\d+)\s+TxResp\s+=\s+(?P<tx_resp>\d+)$")
         # TxReq = 16       ReTxReq = 0     ReTxReqFail = 0
-        p1_4 = re.compile(r"^TxReq\s+=\s+(?P<tx_req>\d+)\s+ReTxReq\s+=\s+(?P<re_tx_req>\d+)\s+ReTxReqFail\s+=\s+(?P<re_tx_req_fail>\d+)$")
+        p1_4 = regex_engine.compile(r"^TxReq\s+=\s+(?P<tx_req>\d+)\s+ReTxReq\s+=\s+(?P<re_tx_req>\d+)\s+ReTxReqFail\s+=\s+(?P<re_tx_req_fail>\d+)$")
         # TxReqID = 36         ReTxReqID = 2       ReTxReqIDFail = 0
-        p1_5 = re.compile(r"^TxReqID\s+=\s+(?P<tx_req_id>\d+)\s+ReTxReqID\s+=\s+(?P<re_tx_req_id>\d+)\s+ReTxReqIDFail\s+=\s+(?P<re_tx_req_id_fail>\d+)$")
+        p1_5 = regex_engine.compile(r"^TxReqID\s+=\s+(?P<tx_req_id>\d+)\s+ReTxReqID\s+=\s+(?P<re_tx_req_id>\d+)\s+ReTxReqIDFail\s+=\s+(?P<re_tx_req_id_fail>\d+)$")
         # TxTotal = 81
-        p1_6 = re.compile(r"^TxTotal\s+=\s+(?P<tx_total>\d+)$")
+        p1_6 = regex_engine.compile(r"^TxTotal\s+=\s+(?P<tx_total>\d+)$")
 
         ret_dict = {}
 
@@ -682,26 +680,26 @@ class ShowDot1xInterfaceStatistics(ShowDot1xInterfaceStatisticsSchema):
 
         # Dot1x Authenticator Port Statistics for FortyGigabitEthernet1/1/1
         # Dot1x Supplicant Port Statistics for FortyGigabitEthernet1/1/1
-        p1 = re.compile(r'^(Dot1x\s+(?P<type>[\w]+)+\s+Port\s+Statistics\s+for\s+(?P<interface>[\w\d\/]+))$')
+        p1 = regex_engine.compile(r'^(Dot1x\s+(?P<type>[\w]+)+\s+Port\s+Statistics\s+for\s+(?P<interface>[\w\d\/]+))$')
 
         # RxStart = 0 RxLogoff = 0 RxResp = 3 RxRespID = 1
-        p2 = re.compile(r'^(RxStart\s+=+\s+(?P<rxstart>[\d]+)+\s+RxLogoff\s+=+\s+(?P<rxlogoff>[\d]+)+\s+RxResp\s+=+\s+(?P<rxresp>[\d]+)+\s+RxRespID+\s+=+\s+(?P<rxrespid>[\d]+))$')
+        p2 = regex_engine.compile(r'^(RxStart\s+=+\s+(?P<rxstart>[\d]+)+\s+RxLogoff\s+=+\s+(?P<rxlogoff>[\d]+)+\s+RxResp\s+=+\s+(?P<rxresp>[\d]+)+\s+RxRespID+\s+=+\s+(?P<rxrespid>[\d]+))$')
 
         # RxInvalid = 0 RxLenErr = 0 RxTotal = 5
-        p3 = re.compile(r'^(RxInvalid\s+=+\s+(?P<rxinvalid>[\d]+)+\s+RxLenErr\s+=+\s+(?P<rxlenerr>[\d]+)+\s+RxTotal\s+=+\s+(?P<rxtotal>[\d]+))$')
+        p3 = regex_engine.compile(r'^(RxInvalid\s+=+\s+(?P<rxinvalid>[\d]+)+\s+RxLenErr\s+=+\s+(?P<rxlenerr>[\d]+)+\s+RxTotal\s+=+\s+(?P<rxtotal>[\d]+))$')
 
         # TxReq = 4 TxReqID = 1 TxTotal = 5
-        p4 = re.compile(r'^(TxReq\s+=+\s+(?P<txreq>[\d]+)+\s+TxReqID\s+=+\s+(?P<txreqid>[\d]+)+\s+TxTotal\s+=+\s+(?P<txtotal>[\d]+))$')
+        p4 = regex_engine.compile(r'^(TxReq\s+=+\s+(?P<txreq>[\d]+)+\s+TxReqID\s+=+\s+(?P<txreqid>[\d]+)+\s+TxTotal\s+=+\s+(?P<txtotal>[\d]+))$')
 
         # RxVersion = 3 LastRxSrcMAC = 0027.90bf.c931
         # RxVersion = 0 LastRxSrcMAC = 0027.90bf.c931
-        p5 = re.compile(r'^(RxVersion\s+=+\s+(?P<rxversion>[\d]+)+\s+LastRxSrcMAC\s+=+\s+(?P<lastrxsrcmac>\w+\.\w+\.\w+))$')
+        p5 = regex_engine.compile(r'^(RxVersion\s+=+\s+(?P<rxversion>[\d]+)+\s+LastRxSrcMAC\s+=+\s+(?P<lastrxsrcmac>\w+\.\w+\.\w+))$')
 
         # RxReq = 24 RxInvalid = 0 RxLenErr = 0 RxTotal = 28
-        p6 = re.compile(r'^(RxReq\s+=+\s+(?P<rxreq>[\d]+)+\s+RxInvalid\s+=+\s+(?P<rxinvalid>[\d]+)+\s+RxLenErr\s+=+\s+(?P<rxlenerr>[\d]+)+\s+RxTotal\s+=+\s+(?P<rxtotal>[\d]+))$')
+        p6 = regex_engine.compile(r'^(RxReq\s+=+\s+(?P<rxreq>[\d]+)+\s+RxInvalid\s+=+\s+(?P<rxinvalid>[\d]+)+\s+RxLenErr\s+=+\s+(?P<rxlenerr>[\d]+)+\s+RxTotal\s+=+\s+(?P<rxtotal>[\d]+))$')
 
         # TxStart = 8 TxLogoff = 4 TxResp = 24 TxTotal = 36
-        p7 = re.compile(r'^(TxStart\s+=+\s+(?P<txstart>[\d]+)+\s+TxLogoff\s+=+\s+(?P<txlogoff>[\d]+)+\s+TxResp\s+=+\s+(?P<txresp>[\d]+)+\s+TxTotal\s+=+\s+(?P<txtotal>[\d]+))$')
+        p7 = regex_engine.compile(r'^(TxStart\s+=+\s+(?P<txstart>[\d]+)+\s+TxLogoff\s+=+\s+(?P<txlogoff>[\d]+)+\s+TxResp\s+=+\s+(?P<txresp>[\d]+)+\s+TxTotal\s+=+\s+(?P<txtotal>[\d]+))$')
 
         for line in output.splitlines():
             line = line.strip()
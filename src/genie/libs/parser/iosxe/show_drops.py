@@ -7,12 +7,14 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 # genie.parsergen
 try:
     import genie.parsergen
@@ -75,27 +77,27 @@ class ShowDropsHistoryQfp(ShowDropsHistoryQfpSchema):
         ret_dict = {}
 
         # Last clearing of QFP drops statistics : never
-        p1_1 = re.compile(r'^Last clearing of QFP drops statistics : never$')
+        p1_1 = regex_engine.compile(r'^Last clearing of QFP drops statistics : never$')
 
         # Last clearing of QFP drops statistics : Fri Jun  9 04:04:39 2023
-        p1_2 = re.compile(r'^Last clearing of QFP drops statistics : \w+\s+(?P<month>\w+)'
-                          r'\s+(?P<day>\d+)\s+(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)'
-                          r'\s+(?P<year>\d+)$')
+        p1_2 = regex_engine.compile(r'^Last clearing of QFP drops statistics : \w+\s+(?P<month>\w+)'
+                                    r'\s+(?P<day>\d+)\s+(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)'
+                                    r'\s+(?P<year>\d+)$')
 
         # (3w 2d 5h 10m 42s ago)
         # (2d 5h 10m 42s ago)
         # (5h 10m 42s ago)
         # (10m 42s ago)
         # (42s ago)
-        p1_3 = re.compile(r'^\(((?P<weeks>\d+)w\s+)?((?P<days>\d+)d\s+)?((?P<hours>\d+)h\s+)?'
-                          r'((?P<minutes>\d+)m\s+)?(?P<seconds>\d+)s\s+ago\)$')
+        p1_3 = regex_engine.compile(r'^\(((?P<weeks>\d+)w\s+)?((?P<days>\d+)d\s+)?((?P<hours>\d+)h\s+)?'
+                                    r'((?P<minutes>\d+)m\s+)?(?P<seconds>\d+)s\s+ago\)$')
 
         # The Global drop stats were all zero
-        p2_1 = re.compile(r'^The Global drop stats were all zero$')
+        p2_1 = regex_engine.compile(r'^The Global drop stats were all zero$')
 
         # Ipv4NoAdj     0      199935      299897    299897
-        p2_2 = re.compile(r'^(?P<reason>\w+)\s+(?P<packets_1m>\d+)\s+(?P<packets_5m>\d+)'
-                          r'\s+(?P<packets_30m>\d+)\s+(?P<packets_all>\d+)$')
+        p2_2 = regex_engine.compile(r'^(?P<reason>\w+)\s+(?P<packets_1m>\d+)\s+(?P<packets_5m>\d+)'
+                                    r'\s+(?P<packets_30m>\d+)\s+(?P<packets_all>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -186,27 +188,27 @@ class ShowDropsHistoryQfpClear(ShowDropsHistoryQfpSchema):
         ret_dict = {}
 
         # Last clearing of QFP drops statistics : never
-        p1_1 = re.compile(r'^Last clearing of QFP drops statistics : never$')
+        p1_1 = regex_engine.compile(r'^Last clearing of QFP drops statistics : never$')
 
         # Last clearing of QFP drops statistics : Fri Jun  9 04:04:39 2023
-        p1_2 = re.compile(r'^Last clearing of QFP drops statistics : \w+\s+(?P<month>\w+)'
-                          r'\s+(?P<day>\d+)\s+(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)'
-                          r'\s+(?P<year>\d+)$')
+        p1_2 = regex_engine.compile(r'^Last clearing of QFP drops statistics : \w+\s+(?P<month>\w+)'
+                                    r'\s+(?P<day>\d+)\s+(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)'
+                                    r'\s+(?P<year>\d+)$')
 
         # (3w 2d 5h 10m 42s ago)
         # (2d 5h 10m 42s ago)
         # (5h 10m 42s ago)
         # (10m 42s ago)
         # (42s ago)
-        p1_3 = re.compile(r'^\(((?P<weeks>\d+)w\s+)?((?P<days>\d+)d\s+)?((?P<hours>\d+)h\s+)?'
-                          r'((?P<minutes>\d+)m\s+)?(?P<seconds>\d+)s\s+ago\)$')
+        p1_3 = regex_engine.compile(r'^\(((?P<weeks>\d+)w\s+)?((?P<days>\d+)d\s+)?((?P<hours>\d+)h\s+)?'
+                                    r'((?P<minutes>\d+)m\s+)?(?P<seconds>\d+)s\s+ago\)$')
 
         # The Global drop stats were all zero
-        p2_1 = re.compile(r'^The Global drop stats were all zero$')
+        p2_1 = regex_engine.compile(r'^The Global drop stats were all zero$')
 
         # Ipv4NoAdj     0      199935      299897    299897
-        p2_2 = re.compile(r'^(?P<reason>\w+)\s+(?P<packets_1m>\d+)\s+(?P<packets_5m>\d+)'
-                          r'\s+(?P<packets_30m>\d+)\s+(?P<packets_all>\d+)$')
+        p2_2 = regex_engine.compile(r'^(?P<reason>\w+)\s+(?P<packets_1m>\d+)\s+(?P<packets_5m>\d+)'
+                                    r'\s+(?P<packets_30m>\d+)\s+(?P<packets_all>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6,9 +6,9 @@ IOSXE parsers for the following show commands:
 """
 
 from poplib import POP3_SSL_PORT
-import re
 import logging
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (And, Any, Default, Optional,
@@ -53,30 +53,30 @@ class ShowEeeStatusInterface(ShowEeeStatusInterfaceSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         # Te1/0/47 is up
-        p0 = re.compile(r"^(?P<interface>[\w\/\.]+) is (?P<status>\w+)$")
+        p0 = regex_engine.compile(r"^(?P<interface>[\w\/\.]+) is (?P<status>\w+)$")
         
         # EEE(efficient-ethernet):  Operational/Disabled/Disagreed
-        p1 = re.compile(r"^EEE\(efficient-ethernet\):\s+(?P<eee_mode>.*)$")
+        p1 = regex_engine.compile(r"^EEE\(efficient-ethernet\):\s+(?P<eee_mode>.*)$")
         
         # Rx LPI Status          :  None/Low Power/Received
         # Rx LPI Status          :  Receiving LPI
-        p2 = re.compile(r"^Rx\s+LPI\s+Status\s+:\s+(?P<rx_lpi>.*)$")
+        p2 = regex_engine.compile(r"^Rx\s+LPI\s+Status\s+:\s+(?P<rx_lpi>.*)$")
         
         # Tx LPI Status          :  None/Low Power/Received
         # Tx LPI Status          :  Transmitting LPI
-        p3 = re.compile(r"^Tx\s+LPI\s+Status\s+:\s+(?P<tx_lpi>.*)$")
+        p3 = regex_engine.compile(r"^Tx\s+LPI\s+Status\s+:\s+(?P<tx_lpi>.*)$")
 
         # Wake Error Count       :  0
-        p4 = re.compile(r"^Wake Error Count\s+:\s+(?P<wake_error>\d+)$")
+        p4 = regex_engine.compile(r"^Wake Error Count\s+:\s+(?P<wake_error>\d+)$")
 
         # ASIC EEE STATUS
-        p5 = re.compile(r"^ASIC EEE STATUS$")
+        p5 = regex_engine.compile(r"^ASIC EEE STATUS$")
 
         # Link Fault Status      :  Link Up
-        p6 = re.compile(r"^Link Fault Status\s+:\s+(?P<link_fault_status>.*)$")
+        p6 = regex_engine.compile(r"^Link Fault Status\s+:\s+(?P<link_fault_status>.*)$")
 
         # Sync Status            :  Code group synchronization with data stream lost
-        p7 = re.compile(r"^Sync Status\s+:\s+(?P<sync_status>.*)$")
+        p7 = regex_engine.compile(r"^Sync Status\s+:\s+(?P<sync_status>.*)$")
 
         ret_dict = {}
 
@@ -162,16 +162,16 @@ class ShowEeeCapabilitiesInterface(ShowEeeCapabilitiesInterfaceSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         # Te1/0/47
-        p0 = re.compile(r"^(?P<interface>[\w\/\.]+)$")
+        p0 = regex_engine.compile(r"^(?P<interface>[\w\/\.]+)$")
 
         # EEE(efficient-ethernet):  yes (1000T, 2G, and 5G auto)
-        p1 = re.compile(r"^\s*EEE\(efficient-ethernet\):\s+(?P<eee_mode>.*)$")
+        p1 = regex_engine.compile(r"^\s*EEE\(efficient-ethernet\):\s+(?P<eee_mode>.*)$")
         
         # Link Partner           :  not enabled
-        p2 = re.compile(r"^\s*Link\s+Partner\s+:\s+(?P<link_partner>.*)$")
+        p2 = regex_engine.compile(r"^\s*Link\s+Partner\s+:\s+(?P<link_partner>.*)$")
 
         # ASIC/Interface         :  EEE Incapable/None
-        p3 = re.compile(r"^ASIC\/Interface\s+:\s+(?P<asic_interface>.+)$")
+        p3 = regex_engine.compile(r"^ASIC\/Interface\s+:\s+(?P<asic_interface>.+)$")
 
         ret_dict = {}
 
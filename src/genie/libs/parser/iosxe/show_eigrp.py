@@ -15,14 +15,12 @@ IOSXE parsers for the following commands
     * 'show ipv6 eigrp topology {ipv6_address}'
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # Libs
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -76,45 +74,45 @@ class ShowEigrpNeighborsSuperParser(ShowEigrpNeighborsSchema):
     def cli(self, address_family='', vrf='', output=None):
 
         # EIGRP-IPv4 Neighbors for AS(1100) VRF(VRF1)
-        r1 = re.compile(r'^EIGRP\-(?P<address_family>IPv4|IPv6)\s'
+        r1 = regex_engine.compile(r'^EIGRP\-(?P<address_family>IPv4|IPv6)\s'
             r'*Neighbors\s*for \w+\(\s*(?P<as_num>\d+)\)\s*(?:VRF\((?P<vrf>\S+)\))?$')
 
         # EIGRP-IPv6 VR(test) Address-Family Neighbors for AS(100)
         # EIGRP-IPv4 VR(test) Address-Family Neighbors for AS(100) VRF(VRF1)
-        r2 = re.compile(r'^EIGRP\-(?P<address_family>IPv4|IPv6)\s* '
-                        r'VR\s*\((?P<name>\S+)\) Address-Family Neighbors\s'
-                        r'*for \w+\(\s*(?P<as_num>\d+)\)\s*'
-                        r'(?:VRF\((?P<vrf>\S+)\))?$')
+        r2 = regex_engine.compile(r'^EIGRP\-(?P<address_family>IPv4|IPv6)\s* '
+                                  r'VR\s*\((?P<name>\S+)\) Address-Family Neighbors\s'
+                                  r'*for \w+\(\s*(?P<as_num>\d+)\)\s*'
+                                  r'(?:VRF\((?P<vrf>\S+)\))?$')
 
         # When VRF is not on the same line as r1 and r2
         # VRF(VRF1)
-        r3 = re.compile(r'^VRF\((?P<vrf>\S+)\)$')
+        r3 = regex_engine.compile(r'^VRF\((?P<vrf>\S+)\)$')
 
         # H   Address      Interface  Hold  Uptime    SRTT   RTO    Q   Seq
         #                             (sec)           (ms)          Cnt Num
         # 0   10.1.1.2     Gi0/0      13    00:00:03  1996   5000   0   5
         # 2   10.1.1.9     Gi0/0      14    00:02:24  206    5000   0   5
         # 1   10.1.2.3     Gi0/1      11    00:20:39  2202   5000   0   5
-        r4 = re.compile(r'^(?P<peer_handle>\d+) +'
-                        r'(?P<nbr_address>\S+) +'
-                        r'(?P<eigrp_interface>[A-Za-z]+\s*[\.\d\/]+) +'
-                        r'(?P<hold>\d+) +(?P<uptime>\S+) +'
-                        r'(?P<srtt>\d+) +'
-                        r'(?P<rto>\d+) +'
-                        r'(?P<q_cnt>\d+) +'
-                        r'(?P<last_seq_number>\d+)$')
+        r4 = regex_engine.compile(r'^(?P<peer_handle>\d+) +'
+                                  r'(?P<nbr_address>\S+) +'
+                                  r'(?P<eigrp_interface>[A-Za-z]+\s*[\.\d\/]+) +'
+                                  r'(?P<hold>\d+) +(?P<uptime>\S+) +'
+                                  r'(?P<srtt>\d+) +'
+                                  r'(?P<rto>\d+) +'
+                                  r'(?P<q_cnt>\d+) +'
+                                  r'(?P<last_seq_number>\d+)$')
         # H   Address                 Interface       Hold Uptime   SRTT   RTO  Q  Seq
         #                                             (sec)         (ms)       Cnt Num
         # 1   Link Local Address:     Gi0/0/0/1.90      12 01:36:14   11   200  0  28
-        r5 = re.compile(r'^(?P<peer_handle>\d+) +Link\-local\s+address: +'
-                        r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
-                        r'(?P<hold>\d+) +(?P<uptime>\S+) +(?P<srtt>\d+) +'
-                        r'(?P<rto>\d+) +(?P<q_cnt>\d+) +'
-                        r'(?P<last_seq_number>\d+)$')
+        r5 = regex_engine.compile(r'^(?P<peer_handle>\d+) +Link\-local\s+address: +'
+                                  r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
+                                  r'(?P<hold>\d+) +(?P<uptime>\S+) +(?P<srtt>\d+) +'
+                                  r'(?P<rto>\d+) +(?P<q_cnt>\d+) +'
+                                  r'(?P<last_seq_number>\d+)$')
 
         # fe80::5c00:ff:fe02:7
         # fe80::5c00:ff:fe02:7
-        r6 = re.compile(r'^(?P<nbr_address>\S+:\S*:\S*:\S*:\S*:\S+)$')
+        r6 = regex_engine.compile(r'^(?P<nbr_address>\S+:\S*:\S*:\S*:\S*:\S+)$')
 
         parsed_dict = {}
         eigrp_instance = ''
@@ -385,62 +383,62 @@ class ShowIpEigrpNeighborsDetailSuperParser(ShowIpEigrpNeighborsDetailSchema):
 
         # EIGRP-IPv4 VR(foo) Address-Family Neighbors for AS(1)
         # EIGRP-IPv4 VR(foo) Address-Family Neighbors for AS(1) VRF(VRF1)
-        r1 = re.compile(r'EIGRP\-(?P<address_family>IPv4|IPv6)\s+VR'
-                        r'\((?P<name>\w+)\)\s+Address\-Family\s*Neighbors'
-                        r'\s*for \w*\(\s*(?P<as_num>[\S]+)\)\s*'
-                        r'(?:VRF\((?P<vrf>\S+)\))?')
+        r1 = regex_engine.compile(r'EIGRP\-(?P<address_family>IPv4|IPv6)\s+VR'
+                                  r'\((?P<name>\w+)\)\s+Address\-Family\s*Neighbors'
+                                  r'\s*for \w*\(\s*(?P<as_num>[\S]+)\)\s*'
+                                  r'(?:VRF\((?P<vrf>\S+)\))?')
 
         # EIGRP-IPv4 Neighbors for AS(100)
         # EIGRP-IPv4 Neighbors for AS(100) VRF(VRF1)
-        r2 = re.compile(r'EIGRP\-(?P<address_family>IPv4|IPv6)\s*'
-                        r'Neighbors\s*for \w+\(\s*(?P<as_num>\d+)\)\s*'
-                        r'(?:VRF\((?P<vrf>\S+)\))?')
+        r2 = regex_engine.compile(r'EIGRP\-(?P<address_family>IPv4|IPv6)\s*'
+                                  r'Neighbors\s*for \w+\(\s*(?P<as_num>\d+)\)\s*'
+                                  r'(?:VRF\((?P<vrf>\S+)\))?')
 
         # When VRF is alone in a line
         # VRF(VRF1)
-        r2_1 = re.compile(r'VRF\((?P<vrf>\w+)\)')
+        r2_1 = regex_engine.compile(r'VRF\((?P<vrf>\w+)\)')
 
 
         # H     Address     Interface   Hold    Uptime   SRTT   RTO     Q       Seq
         #                               (sec)                   (ms)    Cnt     Num
         # 0     10.1.2.1    Et1/0       11      00:02:31 12     200     0       6
         # 1     10.1.2.3    Gi0/1       11      00:20:39 2202   5000    0       5
-        r3 = re.compile(r'^(?P<peer_handle>\d+) +'
-                        r'(?P<nbr_address>\S+) +'
-                        r'(?P<eigrp_interface>[A-Za-z]+\s*[\.\d\/]+) +'
-                        r'(?P<hold>\d+) +(?P<uptime>\S+) +'
-                        r'(?P<srtt>\d+) +'
-                        r'(?P<rto>\d+) +'
-                        r'(?P<q_cnt>\d+) +'
-                        r'(?P<last_seq_number>\d+)$')
+        r3 = regex_engine.compile(r'^(?P<peer_handle>\d+) +'
+                                  r'(?P<nbr_address>\S+) +'
+                                  r'(?P<eigrp_interface>[A-Za-z]+\s*[\.\d\/]+) +'
+                                  r'(?P<hold>\d+) +(?P<uptime>\S+) +'
+                                  r'(?P<srtt>\d+) +'
+                                  r'(?P<rto>\d+) +'
+                                  r'(?P<q_cnt>\d+) +'
+                                  r'(?P<last_seq_number>\d+)$')
 
         # 1   Link-local address:     Gi3.90                   11 01:30:32   10   100  0  29
-        r4 = re.compile(r'^(?P<peer_handle>\d+) +Link\-local\s+address: +'
-                        r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
-                        r'(?P<hold>\d+) +(?P<uptime>\S+) +(?P<srtt>\d+) +'
-                        r'(?P<rto>\d+) +(?P<q_cnt>\d+) +'
-                        r'(?P<last_seq_number>\d+)$')
+        r4 = regex_engine.compile(r'^(?P<peer_handle>\d+) +Link\-local\s+address: +'
+                                  r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
+                                  r'(?P<hold>\d+) +(?P<uptime>\S+) +(?P<srtt>\d+) +'
+                                  r'(?P<rto>\d+) +(?P<q_cnt>\d+) +'
+                                  r'(?P<last_seq_number>\d+)$')
         # fe80::5c00:ff:fe02:7
         # fe80::5c00:ff:fe02:7
-        r5 = re.compile(r'^(?P<nbr_address>\S+:\S*:\S*:\S*:\S*:\S+)$')
+        r5 = regex_engine.compile(r'^(?P<nbr_address>\S+:\S*:\S*:\S*:\S*:\S+)$')
 
         # Version 8.0/2.0, Retrans: 0, Retries: 0, Prefixes: 1
         # Version 5.1/3.0, Retrans: 2, Retries: 0, Prefixes: 1
         # Version 23.0/2.0, Retrans: 0, Retries: 0
-        r6 = re.compile(r'Version\s*'
-                        r'(?P<os_majorver>\d+)\.(?P<os_minorver>\d+)\/'
-                        r'(?P<tlv_majorrev>\d+)\.(?P<tlv_minorrev>\d+), +'
-                        r'Retrans\s*:\s*(?P<retransmit_count>\d+)\, +'
-                        r'Retries\s*:\s*(?P<retry_count>\d+)\,* *'
-                        r'(?:Prefixes\s*:\s*(?P<prefixes>\d+))?')
+        r6 = regex_engine.compile(r'Version\s*'
+                                  r'(?P<os_majorver>\d+)\.(?P<os_minorver>\d+)\/'
+                                  r'(?P<tlv_majorrev>\d+)\.(?P<tlv_minorrev>\d+), +'
+                                  r'Retrans\s*:\s*(?P<retransmit_count>\d+)\, +'
+                                  r'Retries\s*:\s*(?P<retry_count>\d+)\,* *'
+                                  r'(?:Prefixes\s*:\s*(?P<prefixes>\d+))?')
 
         # Topology-ids from peer - 0
-        r7 = re.compile(r'Topology\-ids\s+from\s+peer\s+\-\s+'
-                        r'(?P<topology_ids_from_peer>\d+)')
+        r7 = regex_engine.compile(r'Topology\-ids\s+from\s+peer\s+\-\s+'
+                                  r'(?P<topology_ids_from_peer>\d+)')
 
         #  Topologies advertised to peer:   base
-        r8 = re.compile(r'Topologies\s+advertised\s+to\s+peer:\s*'
-                        r'(?P<topology_advert_to_peer>\w+)')
+        r8 = regex_engine.compile(r'Topologies\s+advertised\s+to\s+peer:\s*'
+                                  r'(?P<topology_advert_to_peer>\w+)')
 
         parsed_dict = {}
 
@@ -770,25 +768,25 @@ class ShowEigrpInterfacesSuperParser(ShowEigrpInterfacesSchema):
         # Defines the regex for the first line of device output. Example is:
         # EIGRP-IPv4 Interfaces for AS(1)
         # EIGRP-IPv6 VR(cisco) Address-Family Interfaces for AS(20)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'EIGRP\-(?P<address_family>IPv4|IPv6)\s+(VR\((?P<name>\w+)\)\s+Address\-Family\s+)?'
             r'Interfaces\s+for\s+AS\(\s*(?P<auto_sys>[\S]+)\)\s*(?:VRF\((?P<vrf>\S+)\))?$'
         )
 
         # VRF(1)
-        p1_2 = re.compile(r"VRF\((?P<vrf>\S+)\)")
+        p1_2 = regex_engine.compile(r"VRF\((?P<vrf>\S+)\)")
 
         # Defines the regex for the second line of device output. Example is:
         # Xmit Queue   PeerQ        Mean   Pacing Time   Multicast    Pending
-        p2 = re.compile(r'Xmit +Queue +PeerQ +Mean +Pacing +Time +Multicast +Pending$')
+        p2 = regex_engine.compile(r'Xmit +Queue +PeerQ +Mean +Pacing +Time +Multicast +Pending$')
 
         # Defines the regex for the third line of device output. Example is:
         # Interface              Peers  Un/Reliable  Un/Reliable  SRTT   Un/Reliable   Flow Timer   Routes
-        p3 = re.compile(r'Interface +Peers +Un/Reliable +Un/Reliable +SRTT +Un/Reliable +Flow +Timer +Routes$')
+        p3 = regex_engine.compile(r'Interface +Peers +Un/Reliable +Un/Reliable +SRTT +Un/Reliable +Flow +Timer +Routes$')
 
         # Defines the regex for the fourth, and repeating, lines of device output. Example is:
         # Gi1                      1        0/0       0/0          20       0/0           84           0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'(?P<interface>(\S+\d)) +(?P<peers>(\d+)) +(?P<xmit_q_unreliable>(\d+))/(?P<xmit_q_reliable>(\d+))'
             r' +(?P<peer_q_unreliable>(\d+))/(?P<peer_q_reliable>(\d+)) +(?P<mean_srtt>(\d+))'
             r' +(?P<pacing_t_unreliable>(\d+))/(?P<pacing_t_reliable>(\d+)) +(?P<mcast_flow_timer>(\d+))'
@@ -796,36 +794,36 @@ class ShowEigrpInterfacesSuperParser(ShowEigrpInterfacesSchema):
         )
 
         # Hello-interval is 5, Hold-time is 15
-        p5 = re.compile(r'^Hello\-interval +is\s+(?P<hello_interval>\d+), +Hold\-time +is\s(?P<hold_time>\d+)$')
+        p5 = regex_engine.compile(r'^Hello\-interval +is\s+(?P<hello_interval>\d+), +Hold\-time +is\s(?P<hold_time>\d+)$')
 
         # Split-horizon is enabled
-        p6 = re.compile(r'^Split-horizon is (?P<state>\w+)$')
+        p6 = regex_engine.compile(r'^Split-horizon is (?P<state>\w+)$')
 
         # Packetized sent/expedited: 0/0
-        p7 = re.compile(r'^Packetized +sent\/expedited:\s+(?P<sent>\d+)\/(?P<expedited>\d+)$')
+        p7 = regex_engine.compile(r'^Packetized +sent\/expedited:\s+(?P<sent>\d+)\/(?P<expedited>\d+)$')
 
         # Hello's sent/expedited: 597/1
-        p8 = re.compile(r"^Hello's +sent\/expedited:\s+(?P<sent>\d+)\/(?P<expedited>\d+)$")
+        p8 = regex_engine.compile(r"^Hello's +sent\/expedited:\s+(?P<sent>\d+)\/(?P<expedited>\d+)$")
 
         #  Un/reliable mcasts: 0/0  Un/reliable ucasts: 0/0
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^Un\/reliable +mcasts:\s+(?P<unreliable_mcast>\d+)\/(?P<reliable_mcast>\d+)\s+'
             r'Un\/reliable +ucasts: (?P<unreliable_ucast>\d+)\/(?P<reliable_ucast>\d+)$'
         )
         # Mcast exceptions: 0  CR packets: 0  ACKs suppressed: 0
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^Mcast +exceptions:\s+(?P<mcast_exception>\d+)  +CR +packets:\s+'
             r'(?P<cr_packets>\d+) +ACKs +suppressed:\s+(?P<ack_suppressed>\d+)$'
         )
         #   Retransmissions sent: 0  Out-of-sequence rcvd: 0
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^Retransmissions +sent:\s+(?P<retransmission_sent>\d+)  +Out\-of\-sequence +rcvd:\s+'
             r'(?P<out_of_sequence_rcvd>\d+)$'
         )
 
         #   Authentication mode is not set
         #   Authentication mode is md5,  key-chain is "test"
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^Authentication +mode +is\s+(?P<authentication>[A-Za-z0-9\-]+|not set)'
             r'(, +key\-chain +is\s+(")?(?P<key_chain>not set|[A-Za-z0-9\-]+))?(")?'
         )
@@ -1032,16 +1030,16 @@ class ShowEigrpTopologySuperParser(ShowIpEigrpTopologySchema):
         # EIGRP-IPv4 Topology Table for AS(10)/ID(10.169.0.2)
         # EIGRP-IPv4 Topology Table for AS(10)/ID(10.169.0.2) VRF(red)
         # EIGRP-IPv4 VR(test) Topology Table for AS(100)/ID(10.114.254.5)
-        r1 = re.compile(r'^EIGRP\-(?P<address_family>IPv4|IPv6)\s*(VR\((?P<process_name>\w+)\))?\s*'
-                        r'Topology\s*Table\s*for\s*\w+\(\s*(?P<as_num>\d+)\)\/\w+\(\s*(?P<eigrp_id>\S+)\)'
-                        r'\s*(?:VRF\((?P<vrf>\S+)\))?$')
+        r1 = regex_engine.compile(r'^EIGRP\-(?P<address_family>IPv4|IPv6)\s*(VR\((?P<process_name>\w+)\))?\s*'
+                                  r'Topology\s*Table\s*for\s*\w+\(\s*(?P<as_num>\d+)\)\/\w+\(\s*(?P<eigrp_id>\S+)\)'
+                                  r'\s*(?:VRF\((?P<vrf>\S+)\))?$')
 
         # Topology(base) TID(0) VRF(1)
-        r1_2 = re.compile(r'(Topology\((?P<topology_base>\w+)\)\s+TID\((?P<topology_id>\d+)\)\s+)\s*(?:VRF\((?P<vrf>\S+)\))$')
+        r1_2 = regex_engine.compile(r'(Topology\((?P<topology_base>\w+)\)\s+TID\((?P<topology_id>\d+)\)\s+)\s*(?:VRF\((?P<vrf>\S+)\))$')
 
         # IPv6-EIGRP Topology Table for AS(1)/ID(2001:0DB8:10::/64)
         # IPv6-EIGRP Topology Table for AS(1)/ID(2001:0DB8:10::/64) VRF(red)
-        r2 = re.compile(r'^(?P<address_family>IPv4|IPv6)\-EIGRP\s*'
+        r2 = regex_engine.compile(r'^(?P<address_family>IPv4|IPv6)\-EIGRP\s*'
         r'Topology\s*Table\s*for\s*\w+\(\s*(?P<as_num>\d+)\)\/\w+\(\s*(?P<eigrp_id>\S+)\)\s*'
         r'(?:VRF\((?P<vrf>\S+)\))?$')
 
@@ -1049,7 +1047,7 @@ class ShowEigrpTopologySuperParser(ShowIpEigrpTopologySchema):
         # P 10.36.3.3/32, 1 successors, FD is 130816
         # P 10.4.1.1/32, 1 successors, FD is 2816, tag is 900
         # P 2001:0DB8:3::/64, 1 successors, FD is 281600
-        r3 = re.compile(r'^(?P<code>[\w\*]+)\s*(?P<network>\S+),\s*'
+        r3 = regex_engine.compile(r'^(?P<code>[\w\*]+)\s*(?P<network>\S+),\s*'
         r'(?P<successor_count>[\d])\s*successors,\s*FD\s*is\s*(?P<fd>[\d]+)?,'
         r'?( +tag\s*is\s*(?P<tag>[\S]+))?$')
 
@@ -1057,7 +1055,7 @@ class ShowEigrpTopologySuperParser(ShowIpEigrpTopologySchema):
         # via 10.169.0.1 (130816/128256), GigabitEthernet0/0/0
         # via +Redistributed (2816/0)
         # via Connected, Ethernet1/0
-        r4 = re.compile(r'^\s*via\s*[+]?(?P<known_via>[\S]+).,*? *\(?(?P<route_preference>[\d\/]+)?\)?,?( +(?P<interface>[\S]+))?$')
+        r4 = regex_engine.compile(r'^\s*via\s*[+]?(?P<known_via>[\S]+).,*? *\(?(?P<route_preference>[\d\/]+)?\)?,?( +(?P<interface>[\S]+))?$')
 
         parsed_dict = {}
         eigrp_instance = vrf = as_num = eigrp_id = ''
@@ -1323,13 +1321,13 @@ class ShowEigrpAddressFamilyIpv6VrfNeighbors(ShowEigrpAddressFamilyIpv6VrfNeighb
         ret_dict = {}
 
         # EIGRP-IPv6 VR(test) Address-Family Neighbors for AS(200)
-        p1 = re.compile(r'^EIGRP-IPv6 VR\((?P<vr>[\w\s]+)\) Address-Family Neighbors for AS\((?P<as>\d+)\)$')
+        p1 = regex_engine.compile(r'^EIGRP-IPv6 VR\((?P<vr>[\w\s]+)\) Address-Family Neighbors for AS\((?P<as>\d+)\)$')
 
         # 0   Link-local address:     Gi1/0/1                  11 00:12:46 1598  5000  0  3
-        p2 = re.compile(r'^(?P<h>\d+)\s+(?P<add_type>[\S\s]+):\s+(?P<interface>\S+)\s+(?P<hold>\d+)\s+(?P<uptime>\S+)\s+(?P<srtt>\d+)\s+(?P<rto>\d+)\s+(?P<q_cnt>\d+)\s+(?P<seq_num>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<h>\d+)\s+(?P<add_type>[\S\s]+):\s+(?P<interface>\S+)\s+(?P<hold>\d+)\s+(?P<uptime>\S+)\s+(?P<srtt>\d+)\s+(?P<rto>\d+)\s+(?P<q_cnt>\d+)\s+(?P<seq_num>\d+)$')
 
         # FE80::2A5:BFFF:FE53:D442
-        p3 = re.compile(r'\s*(?P<address>[\w\:]+)$')
+        p3 = regex_engine.compile(r'\s*(?P<address>[\w\:]+)$')
         add_type =""
         for line in output.splitlines():
             line = line.strip()
@@ -1416,65 +1414,65 @@ class ShowIpv6EigrpTopologyEntry(ShowIpv6EigrpTopologyEntrySchema):
             )
 
         # EIGRP-IPv6 Topology Entry for AS(101)/ID(10.9.1.1) for 5001::/64
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^EIGRP-IPv6\s+Topology\s+Entry\s+for\s+AS\('
             r'(?P<autonomous_system_number>\d+)\)/ID\((?P<router_id>[\d\.]+)\)'
             r'\s+for\s+(?P<ipv6_subnet>[\d\w:/]+)$'
         )
 
         # State is Passive, Query origin flag is 1, 1 Successor(s), FD is 3072
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^State\s+is\s+(?P<state>\w+),\s+Query\s+origin\s+flag\s+is\s+'
             r'(?P<query_origin_flag>\d+),\s+(?P<num_successors>\d+)\s+'
             r'Successor\(s\),\s+FD\s+is\s+(?P<feasible_distance>\d+)$'
         )
 
         # FE80::20C:29FF:FE5C:FB0A (vmi2), from FE80::20C:29FF:FE5C:FB0A, Send flag is 0x0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<link_local_address>[\w:]+)\s+\((?P<interface>[\w\d/]+)\),'
             r'\s+from\s+(?P<from>[\w:]+),\s+Send\s+flag\s+is\s+'
             r'(?P<send_flag>[\dx]+)$'
         )
 
         # Composite metric is (3072/2816), route is Internal
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Composite\s+metric\s+is\s+\((?P<composite_metric>[\d/]+)\),'
             r'\s+route\s+is\s+(?P<route>\w+)$'
         )
 
         # Minimum bandwidth is 1000000 Kbit
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Minimum\s+bandwidth\s+is\s+(?P<minimum_bandwidth>\d+)'
             r'\s+Kbit$'
         )
 
         # Total delay is 20 microseconds
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Total\s+delay\s+is\s+(?P<total_delay>\d+)\s+microseconds$'
         )
 
         # Reliability is 255/255
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Reliability\s+is\s+(?P<reliability>[\d/]+)$'
         )
 
         # Load is 1/255
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Load\s+is\s+(?P<load>[\d/]+)$'
         )
 
         # Minimum MTU is 1492
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^Minimum\s+MTU\s+is\s+(?P<minimum_mtu>\d+)$'
         )
 
         # Hop count is 1
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^Hop\s+count\s+is\s+(?P<hop_count>\d+)$'
         )
 
         # Originating router is 11.9.1.1
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^Originating\s+router\s+is\s+(?P<originating_router>[\d\.]+)$'
         )
 
@@ -5,13 +5,13 @@ IOSXE parser for the following show commands:
     * 'show endpoint-tracker tracker-group'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ===================================================
 # Parser Schema for 'show endpoint-tracker records '
@@ -52,7 +52,7 @@ class ShowEndpointTrackerRecords(ShowEndpointTrackerRecordsSchema):
         # nat-dia-tracker-4351    151.151.151.1               IP       300      3         60        interface
         # track3                  www.diatracker.com          DNS_NAME 300      3          60       interface
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<record_name>[a-z0-9-]+)\s+(?P<endpoint>[a-z0-9-.]+\sOR\s+[a-z0-9-.]+|[a-z0-9-.]+)\s+'
             r'(?P<endpoint_type>[A-Z]+|[A-Z\/_]+)\s+(?P<threshold>\d+|[A-Z\/]+)\s+(?P<multiplier>\d+|[A-Z\/]+)\s+'
             r'(?P<interval>\d+|[A-Z\/]+)\s+(?P<tracker_type>[a-z-]+)$')
@@ -111,7 +111,7 @@ class ShowEndpointTrackerStaticRoute(ShowEndpointTrackerStaticRouteSchema):
         parsed_dict = {}
 
         # tcp-10001       UP        2                2
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<tracker_name>[a-z0-9-]+)\s+(?P<status>[A-Z]+)\s+(?P<rtt_in_msec>\d+)\s+(?P<probe_id>\d+)$')
 
         for line in output.splitlines():
@@ -172,7 +172,7 @@ class ShowEndpointTrackerTrackerGroup(ShowEndpointTrackerTrackerGroupSchema):
         # group5                 track1, track2          DOWN(DOWN OR DOWN)       Timeout, Timeout 0, 0
         # group4                 track1, track2          UP(UP OR UP)             14, 14           201, 202
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<tracker_name>[a-z0-9-]+)+\s+(?P<element_trackers_name>[a-z0-9-]+,\s+[a-z0-9-]+|[a-z0-9-])\s+'
             r'(?P<status>[A-Z]+\(([A-Z ]+)\))\s+(?P<rtt_in_msec>\w+,+ \w+|\w+)+\s+(?P<probe_id>\w+,+ \w+)$')
 
@@ -9,11 +9,9 @@ IOSXE parsers for the following show commands:
     * 'show esmc interface {interface}'
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import Any
 
@@ -67,80 +65,80 @@ class ShowESMCDetail(ShowESMCDetailSchema):
             output = self.device.execute(self.cli_command)
 
         # Interface: GigabitEthernet0/0/2
-        p0 = re.compile(r'^Interface\s*:\s*'
-                        r'(?P<interface>.+)$')
+        p0 = regex_engine.compile(r'^Interface\s*:\s*'
+                                  r'(?P<interface>.+)$')
 
         # Mode: Synchronous
-        p1 = re.compile(r'Mode\s*:\s*'
-                        r'(?P<mode>.+)$')
+        p1 = regex_engine.compile(r'Mode\s*:\s*'
+                                  r'(?P<mode>.+)$')
 
         # ESMC TX: Enable
-        p2 = re.compile(r'ESMC\s+TX\s*:\s*'
-                        r'(?P<esmc_tx>.+)$')
+        p2 = regex_engine.compile(r'ESMC\s+TX\s*:\s*'
+                                  r'(?P<esmc_tx>.+)$')
 
         # ESMC RX: Enable
-        p3 = re.compile(r'ESMC\s+RX\s*:\s*'
-                        r'(?P<esmc_rx>.+)$')
+        p3 = regex_engine.compile(r'ESMC\s+RX\s*:\s*'
+                                  r'(?P<esmc_rx>.+)$')
 
         # QL TX: -
-        p4 = re.compile(r'QL\s+TX\s*:\s*'
-                        r'(?P<ql_tx>.+)$')
+        p4 = regex_engine.compile(r'QL\s+TX\s*:\s*'
+                                  r'(?P<ql_tx>.+)$')
 
         # QL RX: -
-        p5 = re.compile(r'QL\s+RX\s*:\s*'
-                        r'(?P<ql_rx>.+)$')
+        p5 = regex_engine.compile(r'QL\s+RX\s*:\s*'
+                                  r'(?P<ql_rx>.+)$')
 
         # Port status: UP
-        p6 = re.compile(r'Port\s+status\s*:\s*'
-                        r'(?P<port_status>.+)$')
+        p6 = regex_engine.compile(r'Port\s+status\s*:\s*'
+                                  r'(?P<port_status>.+)$')
 
         # QL Receive: QL-SEC
-        p7 = re.compile(r'QL\s+Receive\s*:\s*'
-                        r'(?P<ql_receive>.+)$')
+        p7 = regex_engine.compile(r'QL\s+Receive\s*:\s*'
+                                  r'(?P<ql_receive>.+)$')
 
         # QL Transmit: QL-DNU
-        p8 = re.compile(r'QL\s+Transmit\s*:\s*'
-                        r'(?P<ql_transmit>.+)$')
+        p8 = regex_engine.compile(r'QL\s+Transmit\s*:\s*'
+                                  r'(?P<ql_transmit>.+)$')
 
         # QL rx overrided: -
-        p9 = re.compile(r'QL\s+rx\s+overrided\s*:\s*'
-                        r'(?P<ql_rx_overrided>.+)$')
+        p9 = regex_engine.compile(r'QL\s+rx\s+overrided\s*:\s*'
+                                  r'(?P<ql_rx_overrided>.+)$')
 
         # ESMC Information rate: 1 packet/second
-        p10 = re.compile(r'ESMC\s+Information\s+rate\s*:\s*'
-                         r'(?P<esmc_info_rate>\d+)\s*packet/second$')
+        p10 = regex_engine.compile(r'ESMC\s+Information\s+rate\s*:\s*'
+                                   r'(?P<esmc_info_rate>\d+)\s*packet/second$')
 
         # ESMC Expiry: 5 second
-        p11 = re.compile(r'ESMC\s+Expiry\s*:\s*'
-                         r'(?P<esmc_expiry>\d+)\s*second$')
+        p11 = regex_engine.compile(r'ESMC\s+Expiry\s*:\s*'
+                                   r'(?P<esmc_expiry>\d+)\s*second$')
 
         # ESMC Tx Timer: Running
-        p12 = re.compile(r'ESMC\s+Tx\s+Timer\s*:\s*'
-                         r'(?P<esmc_tx_timer>.+)$')
+        p12 = regex_engine.compile(r'ESMC\s+Tx\s+Timer\s*:\s*'
+                                   r'(?P<esmc_tx_timer>.+)$')
 
         # ESMC Rx Timer: Running
-        p13 = re.compile(r'ESMC\s+Rx\s+Timer\s*:\s*'
-                         r'(?P<esmc_rx_timer>.+)$')
+        p13 = regex_engine.compile(r'ESMC\s+Rx\s+Timer\s*:\s*'
+                                   r'(?P<esmc_rx_timer>.+)$')
 
         # ESMC Tx interval count: 1
-        p14 = re.compile(r'ESMC\s+Tx\s+interval\s+count\s*:\s*'
-                         r'(?P<esmc_tx_interval_count>\d+)$')
+        p14 = regex_engine.compile(r'ESMC\s+Tx\s+interval\s+count\s*:\s*'
+                                   r'(?P<esmc_tx_interval_count>\d+)$')
 
         # ESMC INFO pkts in: 579392
-        p15 = re.compile(r'ESMC\s+INFO\s+pkts\s+in\s*:\s*'
-                         r'(?P<esmc_info_pkts_in>\d+)$')
+        p15 = regex_engine.compile(r'ESMC\s+INFO\s+pkts\s+in\s*:\s*'
+                                   r'(?P<esmc_info_pkts_in>\d+)$')
 
         # ESMC INFO pkts out: 579545
-        p16 = re.compile(r'ESMC\s+INFO\s+pkts\s+out\s*:\s*'
-                         r'(?P<esmc_info_pkts_out>\d+)$')
+        p16 = regex_engine.compile(r'ESMC\s+INFO\s+pkts\s+out\s*:\s*'
+                                   r'(?P<esmc_info_pkts_out>\d+)$')
 
         # ESMC EVENT pkts in: 0
-        p17 = re.compile(r'ESMC\s+EVENT\s+pkts\s+in\s*:\s*'
-                         r'(?P<esmc_event_pkts_in>\d+)$')
+        p17 = regex_engine.compile(r'ESMC\s+EVENT\s+pkts\s+in\s*:\s*'
+                                   r'(?P<esmc_event_pkts_in>\d+)$')
 
         # ESMC EVENT pkts out: 14
-        p18 = re.compile(r'ESMC\s+EVENT\s+pkts\s+out\s*:\s*'
-                         r'(?P<esmc_event_pkts_out>\d+)$')
+        p18 = regex_engine.compile(r'ESMC\s+EVENT\s+pkts\s+out\s*:\s*'
+                                   r'(?P<esmc_event_pkts_out>\d+)$')
 
         # Init vars
         parsed_dict = {}
@@ -328,52 +326,52 @@ class ShowESMC(ShowESMCSchema):
             output = self.device.execute(self.cli_command)
 
         # Interface: GigabitEthernet0/0/2
-        p0 = re.compile(r'^Interface\s*:\s*'
-                        r'(?P<interface>.+)$')
+        p0 = regex_engine.compile(r'^Interface\s*:\s*'
+                                  r'(?P<interface>.+)$')
 
         # Mode: Synchronous
-        p1 = re.compile(r'Mode\s*:\s*'
-                        r'(?P<mode>.+)$')
+        p1 = regex_engine.compile(r'Mode\s*:\s*'
+                                  r'(?P<mode>.+)$')
 
         # ESMC TX: Enable
-        p2 = re.compile(r'ESMC\s+TX\s*:\s*'
-                        r'(?P<esmc_tx>.+)$')
+        p2 = regex_engine.compile(r'ESMC\s+TX\s*:\s*'
+                                  r'(?P<esmc_tx>.+)$')
 
         # ESMC RX: Enable
-        p3 = re.compile(r'ESMC\s+RX\s*:\s*'
-                        r'(?P<esmc_rx>.+)$')
+        p3 = regex_engine.compile(r'ESMC\s+RX\s*:\s*'
+                                  r'(?P<esmc_rx>.+)$')
 
         # QL TX: -
-        p4 = re.compile(r'QL\s+TX\s*:\s*'
-                        r'(?P<ql_tx>.+)$')
+        p4 = regex_engine.compile(r'QL\s+TX\s*:\s*'
+                                  r'(?P<ql_tx>.+)$')
 
         # QL RX: -
-        p5 = re.compile(r'QL\s+RX\s*:\s*'
-                        r'(?P<ql_rx>.+)$')
+        p5 = regex_engine.compile(r'QL\s+RX\s*:\s*'
+                                  r'(?P<ql_rx>.+)$')
 
         # Port status: UP
-        p6 = re.compile(r'Port\s+status\s*:\s*'
-                        r'(?P<port_status>.+)$')
+        p6 = regex_engine.compile(r'Port\s+status\s*:\s*'
+                                  r'(?P<port_status>.+)$')
 
         # QL Receive: QL-SEC
-        p7 = re.compile(r'QL\s+Receive\s*:\s*'
-                        r'(?P<ql_receive>.+)$')
+        p7 = regex_engine.compile(r'QL\s+Receive\s*:\s*'
+                                  r'(?P<ql_receive>.+)$')
 
         # QL Transmit: QL-DNU
-        p8 = re.compile(r'QL\s+Transmit\s*:\s*'
-                        r'(?P<ql_transmit>.+)$')
+        p8 = regex_engine.compile(r'QL\s+Transmit\s*:\s*'
+                                  r'(?P<ql_transmit>.+)$')
 
         # QL rx overrided: -
-        p9 = re.compile(r'QL\s+rx\s+overrided\s*:\s*'
-                        r'(?P<ql_rx_overrided>.+)$')
+        p9 = regex_engine.compile(r'QL\s+rx\s+overrided\s*:\s*'
+                                  r'(?P<ql_rx_overrided>.+)$')
 
         # ESMC Information rate: 1 packet/second
-        p10 = re.compile(r'ESMC\s+Information\s+rate\s*:\s*'
-                         r'(?P<esmc_info_rate>\d+)\s*packet/second$')
+        p10 = regex_engine.compile(r'ESMC\s+Information\s+rate\s*:\s*'
+                                   r'(?P<esmc_info_rate>\d+)\s*packet/second$')
 
         # ESMC Expiry: 5 second
-        p11 = re.compile(r'ESMC\s+Expiry\s*:\s*'
-                         r'(?P<esmc_expiry>\d+)\s*second$')
+        p11 = regex_engine.compile(r'ESMC\s+Expiry\s*:\s*'
+                                   r'(?P<esmc_expiry>\d+)\s*second$')
 
         # Init vars
         parsed_dict = {}
@@ -518,80 +516,80 @@ class ShowESMCInterfaceDetail(ShowESMCInterfaceDetailSchema):
                 execute(self.cli_command.format(interface=interface))
 
         # Interface: GigabitEthernet0/0/2
-        p0 = re.compile(r'^Interface\s*:\s*'
-                        r'(?P<intf>.+)$')
+        p0 = regex_engine.compile(r'^Interface\s*:\s*'
+                                  r'(?P<intf>.+)$')
 
         # Mode: Synchronous
-        p1 = re.compile(r'Mode\s*:\s*'
-                        r'(?P<mode>.+)$')
+        p1 = regex_engine.compile(r'Mode\s*:\s*'
+                                  r'(?P<mode>.+)$')
 
         # ESMC TX: Enable
-        p2 = re.compile(r'ESMC\s+TX\s*:\s*'
-                        r'(?P<esmc_tx>.+)$')
+        p2 = regex_engine.compile(r'ESMC\s+TX\s*:\s*'
+                                  r'(?P<esmc_tx>.+)$')
 
         # ESMC RX: Enable
-        p3 = re.compile(r'ESMC\s+RX\s*:\s*'
-                        r'(?P<esmc_rx>.+)$')
+        p3 = regex_engine.compile(r'ESMC\s+RX\s*:\s*'
+                                  r'(?P<esmc_rx>.+)$')
 
         # QL TX: -
-        p4 = re.compile(r'QL\s+TX\s*:\s*'
-                        r'(?P<ql_tx>.+)$')
+        p4 = regex_engine.compile(r'QL\s+TX\s*:\s*'
+                                  r'(?P<ql_tx>.+)$')
 
         # QL RX: -
-        p5 = re.compile(r'QL\s+RX\s*:\s*'
-                        r'(?P<ql_rx>.+)$')
+        p5 = regex_engine.compile(r'QL\s+RX\s*:\s*'
+                                  r'(?P<ql_rx>.+)$')
 
         # Port status: UP
-        p6 = re.compile(r'Port\s+status\s*:\s*'
-                        r'(?P<port_status>.+)$')
+        p6 = regex_engine.compile(r'Port\s+status\s*:\s*'
+                                  r'(?P<port_status>.+)$')
 
         # QL Receive: QL-SEC
-        p7 = re.compile(r'QL\s+Receive\s*:\s*'
-                        r'(?P<ql_receive>.+)$')
+        p7 = regex_engine.compile(r'QL\s+Receive\s*:\s*'
+                                  r'(?P<ql_receive>.+)$')
 
         # QL Transmit: QL-DNU
-        p8 = re.compile(r'QL\s+Transmit\s*:\s*'
-                        r'(?P<ql_transmit>.+)$')
+        p8 = regex_engine.compile(r'QL\s+Transmit\s*:\s*'
+                                  r'(?P<ql_transmit>.+)$')
 
         # QL rx overrided: -
-        p9 = re.compile(r'QL\s+rx\s+overrided\s*:\s*'
-                        r'(?P<ql_rx_overrided>.+)$')
+        p9 = regex_engine.compile(r'QL\s+rx\s+overrided\s*:\s*'
+                                  r'(?P<ql_rx_overrided>.+)$')
 
         # ESMC Information rate: 1 packet/second
-        p10 = re.compile(r'ESMC\s+Information\s+rate\s*:\s*'
-                         r'(?P<esmc_info_rate>\d+)\s*packet/second$')
+        p10 = regex_engine.compile(r'ESMC\s+Information\s+rate\s*:\s*'
+                                   r'(?P<esmc_info_rate>\d+)\s*packet/second$')
 
         # ESMC Expiry: 5 second
-        p11 = re.compile(r'ESMC\s+Expiry\s*:\s*'
-                         r'(?P<esmc_expiry>\d+)\s*second$')
+        p11 = regex_engine.compile(r'ESMC\s+Expiry\s*:\s*'
+                                   r'(?P<esmc_expiry>\d+)\s*second$')
 
         # ESMC Tx Timer: Running
-        p12 = re.compile(r'ESMC\s+Tx\s+Timer\s*:\s*'
-                         r'(?P<esmc_tx_timer>.+)$')
+        p12 = regex_engine.compile(r'ESMC\s+Tx\s+Timer\s*:\s*'
+                                   r'(?P<esmc_tx_timer>.+)$')
 
         # ESMC Rx Timer: Running
-        p13 = re.compile(r'ESMC\s+Rx\s+Timer\s*:\s*'
-                         r'(?P<esmc_rx_timer>.+)$')
+        p13 = regex_engine.compile(r'ESMC\s+Rx\s+Timer\s*:\s*'
+                                   r'(?P<esmc_rx_timer>.+)$')
 
         # ESMC Tx interval count: 1
-        p14 = re.compile(r'ESMC\s+Tx\s+interval\s+count\s*:\s*'
-                         r'(?P<esmc_tx_interval_count>\d+)$')
+        p14 = regex_engine.compile(r'ESMC\s+Tx\s+interval\s+count\s*:\s*'
+                                   r'(?P<esmc_tx_interval_count>\d+)$')
 
         # ESMC INFO pkts in: 579392
-        p15 = re.compile(r'ESMC\s+INFO\s+pkts\s+in\s*:\s*'
-                         r'(?P<esmc_info_pkts_in>\d+)$')
+        p15 = regex_engine.compile(r'ESMC\s+INFO\s+pkts\s+in\s*:\s*'
+                                   r'(?P<esmc_info_pkts_in>\d+)$')
 
         # ESMC INFO pkts out: 579545
-        p16 = re.compile(r'ESMC\s+INFO\s+pkts\s+out\s*:\s*'
-                         r'(?P<esmc_info_pkts_out>\d+)$')
+        p16 = regex_engine.compile(r'ESMC\s+INFO\s+pkts\s+out\s*:\s*'
+                                   r'(?P<esmc_info_pkts_out>\d+)$')
 
         # ESMC EVENT pkts in: 0
-        p17 = re.compile(r'ESMC\s+EVENT\s+pkts\s+in\s*:\s*'
-                         r'(?P<esmc_event_pkts_in>\d+)$')
+        p17 = regex_engine.compile(r'ESMC\s+EVENT\s+pkts\s+in\s*:\s*'
+                                   r'(?P<esmc_event_pkts_in>\d+)$')
 
         # ESMC EVENT pkts out: 14
-        p18 = re.compile(r'ESMC\s+EVENT\s+pkts\s+out\s*:\s*'
-                         r'(?P<esmc_event_pkts_out>\d+)$')
+        p18 = regex_engine.compile(r'ESMC\s+EVENT\s+pkts\s+out\s*:\s*'
+                                   r'(?P<esmc_event_pkts_out>\d+)$')
 
         # Init vars
         parsed_dict = {}
@@ -770,52 +768,52 @@ class ShowESMCInterface(ShowESMCInterfaceSchema):
                 execute(self.cli_command.format(interface=interface))
 
         # Interface: GigabitEthernet0/0/2
-        p0 = re.compile(r'^Interface\s*:\s*'
-                        r'(?P<intf>.+)$')
+        p0 = regex_engine.compile(r'^Interface\s*:\s*'
+                                  r'(?P<intf>.+)$')
 
         # Mode: Synchronous
-        p1 = re.compile(r'Mode\s*:\s*'
-                        r'(?P<mode>.+)$')
+        p1 = regex_engine.compile(r'Mode\s*:\s*'
+                                  r'(?P<mode>.+)$')
 
         # ESMC TX: Enable
-        p2 = re.compile(r'ESMC\s+TX\s*:\s*'
-                        r'(?P<esmc_tx>.+)$')
+        p2 = regex_engine.compile(r'ESMC\s+TX\s*:\s*'
+                                  r'(?P<esmc_tx>.+)$')
 
         # ESMC RX: Enable
-        p3 = re.compile(r'ESMC\s+RX\s*:\s*'
-                        r'(?P<esmc_rx>.+)$')
+        p3 = regex_engine.compile(r'ESMC\s+RX\s*:\s*'
+                                  r'(?P<esmc_rx>.+)$')
 
         # QL TX: -
-        p4 = re.compile(r'QL\s+TX\s*:\s*'
-                        r'(?P<ql_tx>.+)$')
+        p4 = regex_engine.compile(r'QL\s+TX\s*:\s*'
+                                  r'(?P<ql_tx>.+)$')
 
         # QL RX: -
-        p5 = re.compile(r'QL\s+RX\s*:\s*'
-                        r'(?P<ql_rx>.+)$')
+        p5 = regex_engine.compile(r'QL\s+RX\s*:\s*'
+                                  r'(?P<ql_rx>.+)$')
 
         # Port status: UP
-        p6 = re.compile(r'Port\s+status\s*:\s*'
-                        r'(?P<port_status>.+)$')
+        p6 = regex_engine.compile(r'Port\s+status\s*:\s*'
+                                  r'(?P<port_status>.+)$')
 
         # QL Receive: QL-SEC
-        p7 = re.compile(r'QL\s+Receive\s*:\s*'
-                        r'(?P<ql_receive>.+)$')
+        p7 = regex_engine.compile(r'QL\s+Receive\s*:\s*'
+                                  r'(?P<ql_receive>.+)$')
 
         # QL Transmit: QL-DNU
-        p8 = re.compile(r'QL\s+Transmit\s*:\s*'
-                        r'(?P<ql_transmit>.+)$')
+        p8 = regex_engine.compile(r'QL\s+Transmit\s*:\s*'
+                                  r'(?P<ql_transmit>.+)$')
 
         # QL rx overrided: -
-        p9 = re.compile(r'QL\s+rx\s+overrided\s*:\s*'
-                        r'(?P<ql_rx_overrided>.+)$')
+        p9 = regex_engine.compile(r'QL\s+rx\s+overrided\s*:\s*'
+                                  r'(?P<ql_rx_overrided>.+)$')
 
         # ESMC Information rate: 1 packet/second
-        p10 = re.compile(r'ESMC\s+Information\s+rate\s*:\s*'
-                         r'(?P<esmc_info_rate>\d+)\s*packet/second$')
+        p10 = regex_engine.compile(r'ESMC\s+Information\s+rate\s*:\s*'
+                                   r'(?P<esmc_info_rate>\d+)\s*packet/second$')
 
         # ESMC Expiry: 5 second
-        p11 = re.compile(r'ESMC\s+Expiry\s*:\s*'
-                         r'(?P<esmc_expiry>\d+)\s*second$')
+        p11 = regex_engine.compile(r'ESMC\s+Expiry\s*:\s*'
+                                   r'(?P<esmc_expiry>\d+)\s*second$')
 
         # Init vars
         parsed_dict = {}
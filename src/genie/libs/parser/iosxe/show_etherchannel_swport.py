@@ -7,7 +7,6 @@
      *  show etherchannel swport <port-channel> auto
 """
 # Python
-import re
 import random
 import logging
 
@@ -19,6 +18,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          ListOf
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 logger = logging.getLogger(__name__)
@@ -98,22 +98,22 @@ class ShowEtherChannelSwportSummary(ShowEtherChannelSwportSummarySchema):
                 output = self.device.execute(self.cli_command[1].format(port_channel=port_channel))
 
         # Number of channel-groups in use: 2
-        p1 = re.compile(r'^Number\s+of\s+channel-groups\s+in\s+use:\s+(?P<number_of_lag_in_use>\d+)$')
+        p1 = regex_engine.compile(r'^Number\s+of\s+channel-groups\s+in\s+use:\s+(?P<number_of_lag_in_use>\d+)$')
         # Number of aggregators:           2
-        p2 = re.compile(r'^Number\s+of\s+aggregators:\s+(?P<number_of_aggregators>\d+)$') 
+        p2 = regex_engine.compile(r'^Number\s+of\s+aggregators:\s+(?P<number_of_aggregators>\d+)$') 
         # Group  Port-channel  Protocol    Ports
         # ------+-------------+-----------+-----------------------------------------------
         # 1      Po1(SU)         PAgP      Gi0/1(P)    Gi0/2(P)
-        p3 = re.compile(r'^\s*(?P<bundle_id>[\d\s]+)(?P<name>[\w\-]+)\((?P<flags>[\w]+)\)?'
-                        r'( +(?P<protocol>[\w\-]+))?( +((?P<ports>[\w\-\s\/\(\)]+)))?$')
+        p3 = regex_engine.compile(r'^\s*(?P<bundle_id>[\d\s]+)(?P<name>[\w\-]+)\((?P<flags>[\w]+)\)?'
+                                  r'( +(?P<protocol>[\w\-]+))?( +((?P<ports>[\w\-\s\/\(\)]+)))?$')
         # Group  Port-channel  Protocol    Ports
         # ------+-------------+-----------+-----------------------------------------------
         # 10     Po10(SU)        PAgP        Gi1/0/15(P)     Gi1/0/16(P)     
         #                                    Gi1/0/17(P)      
-        p4 = re.compile(r'^\s*(?P<ports>[\w\-\/\(\)]+)$')
+        p4 = regex_engine.compile(r'^\s*(?P<ports>[\w\-\/\(\)]+)$')
         #                                  Te2/0/3(s)      Te3/0/1(s)
         #                                  Te3/0/2(D)      Te3/0/3(P)
-        p5 = re.compile(r'^\s*(?P<port1>[\w\-\/\(\)]+)\s+(?P<port2>[\w\-\/\(\)]+)$')
+        p5 = regex_engine.compile(r'^\s*(?P<port1>[\w\-\/\(\)]+)\s+(?P<port2>[\w\-\/\(\)]+)$')
 
         ret_dict = {}
         m1 = ""
@@ -280,14 +280,14 @@ class ShowEtherChannelSWLoadBalance(ShowEtherChannelSWLoadBalanceSchema):
         ret_dict = {}
         # EtherChannel Load-Balancing Configuration:
         #       src-ip  
-        p1 = re.compile(r'^\s*(?P<load_balance_cfg>\S+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<load_balance_cfg>\S+)$')
         # EtherChannel Load-Balancing Addresses Used Per-Protocol:
         # Non-IP: Source MAC address 
-        p2 = re.compile(r'^Non-IP: (?P<non_ip>.*)$') 
+        p2 = regex_engine.compile(r'^Non-IP: (?P<non_ip>.*)$') 
         #   IPv4: Source IP address   
-        p3 = re.compile(r'^\s*IPv4: (?P<ipv4>.*)$') 
+        p3 = regex_engine.compile(r'^\s*IPv4: (?P<ipv4>.*)$') 
         #   IPv6: Source IP address 
-        p4 = re.compile(r'^\s*IPv6: (?P<ipv6>.*)$')
+        p4 = regex_engine.compile(r'^\s*IPv6: (?P<ipv6>.*)$')
 
         for line in out.splitlines():
             if line:
@@ -4,13 +4,13 @@ IOSXE parsers for the following show commands:
     * show ethernet cfm maintenance-points remote detail
     * show ethernet cfm statistics
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 from genie.metaparser.util.exceptions import SchemaEmptyParserError, SchemaMissingKeyError
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # =======================================================================
 # Parser Schema for 'show ethernet cfm maintenance-points remote detail'
@@ -94,55 +94,55 @@ class ShowEthernetCfmMaintenancePointsRemoteDetail(ShowEthernetCfmMaintenancePoi
         partial_flag = True
 
         # Version: IEEE-CFM
-        p1 = re.compile(r'^(Version:+\s+(?P<version>[A-Z-]+))$')
+        p1 = regex_engine.compile(r'^(Version:+\s+(?P<version>[A-Z-]+))$')
 
         # MAC Address: 7070.8bba.3801
-        p2 = re.compile(r'^(MAC\sAddress:\s(?P<mac_address>([0-9a-fA-F].?){12})$)')
+        p2 = regex_engine.compile(r'^(MAC\sAddress:\s(?P<mac_address>([0-9a-fA-F].?){12})$)')
 
         # Domain Name: UNINET
-        p3 = re.compile(r'^(Domain\sName:\s(?P<domain_name>\w+)$)')
+        p3 = regex_engine.compile(r'^(Domain\sName:\s(?P<domain_name>\w+)$)')
 
         # Domain ID: UNINET
-        p4 = re.compile(r'^(Domain\sID:\s(?P<domain_id>\w+)$)')
+        p4 = regex_engine.compile(r'^(Domain\sID:\s(?P<domain_id>\w+)$)')
 
         # MA Name: UNINET_VERLEANDROVALLE-17_5005
-        p5 = re.compile(r'^(MA\sName:\s(?P<ma_name>\S+)$)')
+        p5 = regex_engine.compile(r'^(MA\sName:\s(?P<ma_name>\S+)$)')
 
         # Level: 7
-        p6 = re.compile(r'^(Level:\s(?P<level>\d+$))')
+        p6 = regex_engine.compile(r'^(Level:\s(?P<level>\d+$))')
 
         # EVC: UNINET_VERLEANDROVALLE-17_5005
-        p7 = re.compile(r'^(EVC:\s(?P<evc>\S+)$)')
+        p7 = regex_engine.compile(r'^(EVC:\s(?P<evc>\S+)$)')
 
         # Bridge Domain: 100
-        p8 = re.compile(r'^(Bridge\sDomain:\s(?P<bridge_domain>\d+$)$)')
+        p8 = regex_engine.compile(r'^(Bridge\sDomain:\s(?P<bridge_domain>\d+$)$)')
 
         # MPID: 1562
-        p9 = re.compile(r'^(MPID:\s(?P<mpid>\d+$)$)')
+        p9 = regex_engine.compile(r'^(MPID:\s(?P<mpid>\d+$)$)')
 
         # Incoming Port(s): Gi2/0/4
-        p10 = re.compile(r'^(Incoming\sPort\((s)\):\s(?P<incoming_port>[A-Za-z0-9/ -_]+)$)')
+        p10 = regex_engine.compile(r'^(Incoming\sPort\((s)\):\s(?P<incoming_port>[A-Za-z0-9/ -_]+)$)')
 
         # CC Lifetime(sec): 3.500
-        p11 = re.compile(r'^(CC\sLifetime\((sec)\):\s(?P<cc_lifetime>(\d.+|\d+))$)')
+        p11 = regex_engine.compile(r'^(CC\sLifetime\((sec)\):\s(?P<cc_lifetime>(\d.+|\d+))$)')
 
         # Age of Last CC Message(sec): 0
-        p12 = re.compile(r'^(Age\sof\sLast\sCC\sMessage\((sec)\):\s(?P<age_of_last_cc_message>(\d.+|\d+))$)')
+        p12 = regex_engine.compile(r'^(Age\sof\sLast\sCC\sMessage\((sec)\):\s(?P<age_of_last_cc_message>(\d.+|\d+))$)')
 
         # CC Packet Statistics: 28091/0 (Received/Error)
-        p13 = re.compile(r'^(CC\sPacket\sStatistics:\s(?P<cc_packet_statistics>[0-9/]+))')
+        p13 = regex_engine.compile(r'^(CC\sPacket\sStatistics:\s(?P<cc_packet_statistics>[0-9/]+))')
 
         # MEP interface status: Up
-        p14 = re.compile(r'^(MEP\sinterface\sstatus:\s(?P<mep_interface_status>\w+)$)')
+        p14 = regex_engine.compile(r'^(MEP\sinterface\sstatus:\s(?P<mep_interface_status>\w+)$)')
 
         # MEP port status: Up
-        p15 = re.compile(r'^(MEP\sport\sstatus:\s(?P<mep_port_status>\w+)$)')
+        p15 = regex_engine.compile(r'^(MEP\sport\sstatus:\s(?P<mep_port_status>\w+)$)')
 
         # Receive RDI: FALSE
-        p16 = re.compile(r'^(Receive\sRDI:\s(?P<receive_rdi>\w+)$)')
+        p16 = regex_engine.compile(r'^(Receive\sRDI:\s(?P<receive_rdi>\w+)$)')
 
         # Total Remote MEPs: 4
-        p17 = re.compile(r'^(Total\sRemote\sMEPs:\s(?P<total_remote_meps>\d+)$)')
+        p17 = regex_engine.compile(r'^(Total\sRemote\sMEPs:\s(?P<total_remote_meps>\d+)$)')
 
         index = 1
         total_mep_port_up = 0
@@ -358,67 +358,67 @@ class ShowEthernetCfmStatistics(ShowEthernetCfmStatisticsSchema):
         parsed_dict = {}
 
         # BRAIN MAC: 4c77.6dad.ea53
-        p1 = re.compile(r'^(BRAIN\sMAC:+\s+(?P<brain_mac>([0-9a-fA-F].?){12}$))')
+        p1 = regex_engine.compile(r'^(BRAIN\sMAC:+\s+(?P<brain_mac>([0-9a-fA-F].?){12}$))')
 
         # DomainName: UNINET
-        p2 = re.compile(r'^(DomainName:\s(?P<domain_name>\w+)$)')
+        p2 = regex_engine.compile(r'^(DomainName:\s(?P<domain_name>\w+)$)')
 
         # MA Name: UNINET_VERLEANDROVALLE-17_5005
-        p3 = re.compile(r'^(MA\sName:\s(?P<ma_name>\w+[-_]+\w+)$)')
+        p3 = regex_engine.compile(r'^(MA\sName:\s(?P<ma_name>\w+[-_]+\w+)$)')
 
         # MPID: 1561
-        p4 = re.compile(r'^(MPID:\s(?P<mpid>\d+$)$)')
+        p4 = regex_engine.compile(r'^(MPID:\s(?P<mpid>\d+$)$)')
 
         # Last clearing of counters: never
-        p5 = re.compile(r'^(Last\sclearing\sof\scounters:\s(?P<counters_last_clearing>\w+)$)')
+        p5 = regex_engine.compile(r'^(Last\sclearing\sof\scounters:\s(?P<counters_last_clearing>\w+)$)')
 
         # CCMs:
-        p6 = re.compile(r'^(CCMs:)$')
+        p6 = regex_engine.compile(r'^(CCMs:)$')
 
         # Transmitted:              28029     Rcvd Seq Errors:        0
-        p7 = re.compile(r'^(Transmitted:\s+(?P<transmitted>\d+)\s+(Rcvd\sSeq\sErrors:\s+(?P<rcvd_seq_errors>\d+))$)')
+        p7 = regex_engine.compile(r'^(Transmitted:\s+(?P<transmitted>\d+)\s+(Rcvd\sSeq\sErrors:\s+(?P<rcvd_seq_errors>\d+))$)')
 
         # Unexpected Rcvd:              0
-        p8 = re.compile(r'^(Unexpected\sRcvd:\s+(?P<unexpected_received>\d+)$)')
+        p8 = regex_engine.compile(r'^(Unexpected\sRcvd:\s+(?P<unexpected_received>\d+)$)')
 
         # Total Tx LTR:                 0
-        p9 = re.compile(r'^(Total\sTx\sLTR:\s+(?P<total_tx_ltr>\d+)$)')
+        p9 = regex_engine.compile(r'^(Total\sTx\sLTR:\s+(?P<total_tx_ltr>\d+)$)')
 
         # Total Rx Valid LTR:           0
-        p10 = re.compile(r'^(Total\sRx\sValid\sLTR:\s+(?P<total_rx_valid_ltr>\d+)$)')
+        p10 = regex_engine.compile(r'^(Total\sRx\sValid\sLTR:\s+(?P<total_rx_valid_ltr>\d+)$)')
 
         # Total Rx Invalid LTR:         0
-        p11 = re.compile(r'^(Total\sRx\sInvalid\sLTR:\s+(?P<total_rx_invalid_ltr>\d+)$)')
+        p11 = regex_engine.compile(r'^(Total\sRx\sInvalid\sLTR:\s+(?P<total_rx_invalid_ltr>\d+)$)')
 
         # Rx Invalid Relay Action:      0
-        p12 = re.compile(r'^(Rx\sInvalid\sRelay\sAction:\s+(?P<rx_invalid_relay_action>\d+)$)')
+        p12 = regex_engine.compile(r'^(Rx\sInvalid\sRelay\sAction:\s+(?P<rx_invalid_relay_action>\d+)$)')
 
         # Total Tx LTM:                 0
-        p13 = re.compile(r'^(Total\sTx\sLTM:\s+(?P<total_tx_ltm>\d+)$)')
+        p13 = regex_engine.compile(r'^(Total\sTx\sLTM:\s+(?P<total_tx_ltm>\d+)$)')
 
         # Total Rx Valid LTM:           0
-        p14 = re.compile(r'^(Total\sRx\sValid\sLTM:\s+(?P<total_rx_valid_ltm>\d+)$)')
+        p14 = regex_engine.compile(r'^(Total\sRx\sValid\sLTM:\s+(?P<total_rx_valid_ltm>\d+)$)')
 
         # Total Rx Invalid LTM:         0
-        p15 = re.compile(r'^(Total\sRx\sInvalid\sLTM:\s+(?P<total_rx_invalid_ltm>\d+)$)')
+        p15 = regex_engine.compile(r'^(Total\sRx\sInvalid\sLTM:\s+(?P<total_rx_invalid_ltm>\d+)$)')
 
         # LBRs:
-        p16 = re.compile(r'(^LBRs:)$')
+        p16 = regex_engine.compile(r'(^LBRs:)$')
 
         # Rcvd in order:                0   Rcvd Bad MSDU:          0
-        p17 = re.compile(r'^(Rcvd\sin\sorder:\s+(?P<rcvd_in_order>\d+)\s+(Rcvd\sBad\sMSDU:\s+(?P<rcvd_bad_msdu>\d+))$)')
+        p17 = regex_engine.compile(r'^(Rcvd\sin\sorder:\s+(?P<rcvd_in_order>\d+)\s+(Rcvd\sBad\sMSDU:\s+(?P<rcvd_bad_msdu>\d+))$)')
 
         # Rx Invalid LBR:               0
-        p18 = re.compile(r'^(Rx\sInvalid\sLBR:\s+(?P<rx_invalid_lbr>\d+)$)')
+        p18 = regex_engine.compile(r'^(Rx\sInvalid\sLBR:\s+(?P<rx_invalid_lbr>\d+)$)')
 
         # Total Tx LBM:                 0
-        p19 = re.compile(r'^(Total\sTx\sLBM:\s+(?P<total_tx_lbm>\d+)$)')
+        p19 = regex_engine.compile(r'^(Total\sTx\sLBM:\s+(?P<total_tx_lbm>\d+)$)')
 
         # Total Rx Valid LBM:           0
-        p20 = re.compile(r'^(Total\sRx\sValid\sLBM:\s+(?P<total_rx_valid_lbm>\d+)$)')
+        p20 = regex_engine.compile(r'^(Total\sRx\sValid\sLBM:\s+(?P<total_rx_valid_lbm>\d+)$)')
 
         # Total Rx Invalid LBM:         0
-        p21 = re.compile(r'^(Total\sRx\sInvalid\sLBM:\s+(?P<total_rx_invalid_lbm>\d+)$)')
+        p21 = regex_engine.compile(r'^(Total\sRx\sInvalid\sLBM:\s+(?P<total_rx_invalid_lbm>\d+)$)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1,6 +1,8 @@
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # ====================
@@ -49,12 +51,12 @@ class ShowFabricApSummary(ShowFabricApSummarySchema):
 
         ret_dict = {}
         # Number of Fabric AP : 2
-        p1 = re.compile(r"^Number\sof\sFabric\sAP\s:\s+(?P<fabric_ap_count>\d+)")
+        p1 = regex_engine.compile(r"^Number\sof\sFabric\sAP\s:\s+(?P<fabric_ap_count>\d+)")
 
         # AP0029.C2DE.65B0        2      1852I     0029.c2de.65b0  0029.c2df.d9e0  default location    US    112.201.2.152   Registered
         # AP-E1-C8A0              3      C9124AXE-B       488b.0a76.1a64  488b.0a78.c8a0  Global/Ecublens/Buil     US       2001:10b1::9    Registered
 
-        p2 = re.compile(r"^(?P<ap_name>\S+)\s+(?P<slots>\d+)\s+(?P<ap_model>\S+)\s+(?P<ethernet_mac>(([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}))\s+(?P<radio_mac>(([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}))\s+(?P<location>([\w\s\/-]+))\s+(?P<country>([A-Z]{2}))\s+(?P<ip_address>((\d{1,3}\.){3}\d{1,3}|([a-fA-F\d]{1,4}:*:?){1,7}[a-fA-F\d]{1,4}))\s+(?P<state>(\w+))")
+        p2 = regex_engine.compile(r"^(?P<ap_name>\S+)\s+(?P<slots>\d+)\s+(?P<ap_model>\S+)\s+(?P<ethernet_mac>(([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}))\s+(?P<radio_mac>(([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}))\s+(?P<location>([\w\s\/-]+))\s+(?P<country>([A-Z]{2}))\s+(?P<ip_address>((\d{1,3}\.){3}\d{1,3}|([a-fA-F\d]{1,4}:*:?){1,7}[a-fA-F\d]{1,4}))\s+(?P<state>(\w+))")
 
         for line in output.splitlines():
             line = line.strip()
@@ -21,6 +21,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import regex_engine, string_pool
 import re
 
 from genie.libs.parser.utils.common import Common
@@ -85,33 +86,35 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
         # initial return dictionary
         ret_dict = mac_dict = {}
         entry_type = entry = learn = age = ''
+        # share the repeated values of the entries, see utils/string_pool.py
+        pool = string_pool.is_enabled()
 
         # Total Mac Addresses for this criterion: 93
-        p1 = re.compile(r'^Total +Mac +Addresses +for +this +criterion: +(?P<val>\d+)$')
+        p1 = regex_engine.compile(r'^Total +Mac +Addresses +for +this +criterion: +(?P<val>\d+)$')
 
         # 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
         # 20    aaaa.bbff.8888    STATIC      Drop
         # All    0100.0cff.999a    STATIC      CPU
-        p2 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
-                        r' +(?P<entry_type>\w+) +(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
+        p2 = regex_engine.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
+                                  r' +(?P<entry_type>\w+) +(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
 
         # Gi1/9,Gi1/10,Gi1/11,Gi1/12
         #               Router,Switch
-        p3 = re.compile(r'^(?P<intfs>(vPC Peer-Link)?[\w\/\,\(\)]+)$')
+        p3 = regex_engine.compile(r'^(?P<intfs>(vPC Peer-Link)?[\w\/\,\(\)]+)$')
 
         # *  101  44dd.eeff.55bb   dynamic  Yes         10   Gi1/40
         # *  102  aa11.bbff.ee55    static  Yes          -   Gi1/2,Gi1/4,Gi1/5,Gi1/6
         # *  400  0000.0000.0000    static  No           -   vPC Peer-Link
         # *  ---  0000.0000.0000    static  No           -   Router
-        p4 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
-                        r' +(?P<entry_type>\w+) +(?P<learn>\w+) +(?P<age>[\d\-\~]+) '
-                        r'+(?P<intfs>(vPC )?[\w\/\,\-\(\)\s]+)$')
+        p4 = regex_engine.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
+                                  r' +(?P<entry_type>\w+) +(?P<learn>\w+) +(?P<age>[\d\-\~]+) '
+                                  r'+(?P<intfs>(vPC )?[\w\/\,\-\(\)\s]+)$')
 
         # 964    0000.0000.0000   dynamic ip,ipx                Router
-        p5 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) '
-                        r'+(?P<mac>[\w.]+) +(?P<entry_type>\w+) '
-                        r'+(?P<protocols>[\w\,]+) '
-                        r'+(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
+        p5 = regex_engine.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) '
+                                  r'+(?P<mac>[\w.]+) +(?P<entry_type>\w+) '
+                                  r'+(?P<protocols>[\w\,]+) '
+                                  r'+(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -155,6 +158,8 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                     if group['entry']:
                         entry = group['entry'].strip()
                         intf_dict.update({'entry': entry})
+                    if pool:
+                        string_pool.intern_values(intf_dict)
                 continue
 
             # Gi1/9,Gi1/10,Gi1/11,Gi1/12
@@ -227,6 +232,8 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                             intf_dict.update({'age': age})
                         else:
                             age = None
+                    if pool:
+                        string_pool.intern_values(intf_dict)
                 continue
 
             # 964    0000.0000.0000   dynamic ip,ipx                Router
@@ -263,6 +270,8 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
 
                     if group['protocols']:
                         intf_dict.update({'protocols': group['protocols'].split(',')})
+                    if pool:
+                        string_pool.intern_values(intf_dict)
                 continue
 
         return ret_dict
@@ -296,8 +305,8 @@ class ShowMacAddressTableAgingTime(ShowMacAddressTableAgingTimeSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Global +Aging +Time: +(?P<time>\d+)$')
-        p2 = re.compile(r'^(?P<vlan>\w+) +(?P<time>\d+)$')
+        p1 = regex_engine.compile(r'^Global +Aging +Time: +(?P<time>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<vlan>\w+) +(?P<time>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -352,7 +361,7 @@ class ShowMacAddressTableLearning(ShowMacAddressTableLearningSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Learning +disabled +on +vlans: +(?P<vlans>[\w\,\-\s]+)$')
+        p1 = regex_engine.compile(r'^Learning +disabled +on +vlans: +(?P<vlans>[\w\,\-\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -416,7 +425,7 @@ class ShowMacAddressMacVlan(ShowMacAddressMacVlanSchema):
             out = output
 
         # 10    0017.0100.0001    DYNAMIC     Fo1/0/24
-        p1 = re.compile(r'^(?P<vlanid>\d+) +(?P<mac>[\w\.]+) +(?P<type>\w+) +(?P<port>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<vlanid>\d+) +(?P<mac>[\w\.]+) +(?P<type>\w+) +(?P<port>\S+)$')
         
         # initial variables
         ret_dict = {}
@@ -473,21 +482,21 @@ class ShowMacAddressTableNotificationChange(ShowMacAddressTableNotificationChang
             output = self.device.execute(self.cli_command)
 
         # MAC Notification Feature is Disabled on the switch
-        p1 = re.compile(r"^MAC\s+Notification\s+Feature\s+is\s+(?P<mac_notification_feature>\w+)\s+on\s+the\s+switch$")
+        p1 = regex_engine.compile(r"^MAC\s+Notification\s+Feature\s+is\s+(?P<mac_notification_feature>\w+)\s+on\s+the\s+switch$")
         # Interval between Notification Traps : 1 secs
-        p2 = re.compile(r"^Interval\s+between\s+Notification\s+Traps\s+:\s+(?P<Int_btwn_notifictn_trps>\d+)\s+secs$")
+        p2 = regex_engine.compile(r"^Interval\s+between\s+Notification\s+Traps\s+:\s+(?P<Int_btwn_notifictn_trps>\d+)\s+secs$")
         # Number of MAC Addresses Added : 0
-        p3 = re.compile(r"^Number\s+of\s+MAC\s+Addresses\s+Added\s+:\s+(?P<no_of_mac_addr_added>\d+)$")
+        p3 = regex_engine.compile(r"^Number\s+of\s+MAC\s+Addresses\s+Added\s+:\s+(?P<no_of_mac_addr_added>\d+)$")
         # Number of MAC Addresses Removed : 0
-        p4 = re.compile(r"^Number\s+of\s+MAC\s+Addresses\s+Removed\s+:\s+(?P<no_of_mac_addr_rmvd>\d+)$")
+        p4 = regex_engine.compile(r"^Number\s+of\s+MAC\s+Addresses\s+Removed\s+:\s+(?P<no_of_mac_addr_rmvd>\d+)$")
         # Number of Notifications sent to NMS : 0
-        p5 = re.compile(r"^Number\s+of\s+Notifications\s+sent\s+to\s+NMS\s+:\s+(?P<no_of_notifictns>\d+)$")
+        p5 = regex_engine.compile(r"^Number\s+of\s+Notifications\s+sent\s+to\s+NMS\s+:\s+(?P<no_of_notifictns>\d+)$")
         # Maximum Number of entries configured in History Table : 1
-        p6 = re.compile(r"^Maximum\s+Number\s+of\s+entries\s+configured\s+in\s+History\s+Table\s+:\s+(?P<max_no_of_entries>\d+)$")
+        p6 = regex_engine.compile(r"^Maximum\s+Number\s+of\s+entries\s+configured\s+in\s+History\s+Table\s+:\s+(?P<max_no_of_entries>\d+)$")
         # Current History Table Length : 0
-        p7 = re.compile(r"^Current\s+History\s+Table\s+Length\s+:\s+(?P<current_history_tablen>\d+)$")
+        p7 = regex_engine.compile(r"^Current\s+History\s+Table\s+Length\s+:\s+(?P<current_history_tablen>\d+)$")
         # MAC Notification Traps are Enabled
-        p8 = re.compile(r"^MAC\s+Notification\s+Traps\s+are\s+(?P<mac_notificatn_trps>\w+)$")
+        p8 = regex_engine.compile(r"^MAC\s+Notification\s+Traps\s+are\s+(?P<mac_notificatn_trps>\w+)$")
 
         ret_dict = {}
 
@@ -579,9 +588,9 @@ class ShowMacAddressTableNotificationChangeInterface(ShowMacAddressTableNotifica
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         # MAC Notification Feature is Disabled on the switch
-        p1 = re.compile(r"^MAC\s+Notification\s+Feature\s+is\s+(?P<mac_notification_feature>\w+)\s+on\s+the\s+switch$")
+        p1 = regex_engine.compile(r"^MAC\s+Notification\s+Feature\s+is\s+(?P<mac_notification_feature>\w+)\s+on\s+the\s+switch$")
         # HundredGigE2/0/25              Disabled       Disabled        
-        p2 = re.compile(r"^(?P<interface>\S+)\s+(?P<mac_added_trap>\w+)\s+(?P<mac_rmvd_trap>\w+)$")
+        p2 = regex_engine.compile(r"^(?P<interface>\S+)\s+(?P<mac_added_trap>\w+)\s+(?P<mac_rmvd_trap>\w+)$")
 
         ret_dict = {}
 
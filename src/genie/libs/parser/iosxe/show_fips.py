@@ -4,11 +4,13 @@
         * show fips status
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =================================================
 # Schema for:
@@ -39,7 +41,7 @@ class ShowFipsAuthorizationKey(ShowFipsAuthorizationKeySchema):
 
         ret_dict = {}
         #                  FIPS: Stored key (16) : 12345678901234567890123456789012
-        p1 = re.compile(r'^FIPS: +Stored key +\((\d+)\) +: +(?P<stored_key>\S+)$')
+        p1 = regex_engine.compile(r'^FIPS: +Stored key +\((\d+)\) +: +(?P<stored_key>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -79,15 +81,15 @@ class ShowFipsStatus(ShowFipsStatusSchema):
         # Switch is in Fips Not-Configured state and not SESA Ready
         # Switch is in Fips Configured state and not SESA Ready
         # Switch is in Fips Running state and SESA Ready
-        p1 = re.compile(r'^Switch +is +in +Fips +(?P<fips_state>[\S\s]+)\s+state\s+and\s+(?P<sesa_ready>\S+)')
+        p1 = regex_engine.compile(r'^Switch +is +in +Fips +(?P<fips_state>[\S\s]+)\s+state\s+and\s+(?P<sesa_ready>\S+)')
 
         # Switch and Stacking are running in fips mode
         # Switch and Stacking are not running in fips mode
-        p2 = re.compile(r'^Switch and Stacking are (?P<fips_state>[\S\s]+) in fips mode')
+        p2 = regex_engine.compile(r'^Switch and Stacking are (?P<fips_state>[\S\s]+) in fips mode')
 
         # Switch is not running in fips mode
         # Switch is running in fips mode
-        p3 = re.compile(r'^Switch is (?P<fips_state>[\S\s]+) in fips mode$')
+        p3 = regex_engine.compile(r'^Switch is (?P<fips_state>[\S\s]+) in fips mode$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1,7 +1,9 @@
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowFirmwareVersionAllSchema(MetaParser):
     """Schema for:
        show firmware version switch {switch} all
@@ -40,15 +42,15 @@ class ShowFirmwareVersionAll(ShowFirmwareVersionAllSchema):
         index = 0
      
         #   PS2       Power Supply (PS PRI, PS_SEC, PS_I2C)   (00.05.01, 00.02.01, N/A)
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r'^PS(?P<slot>\w+)\s+Power\s+Supply\s+\(.*\)\s+(?P<version>\(.*\)).*$')
 
         #  PS5  Fantray                       17012402              N/A                 N/A
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<slot>\w+)\s+Fantray\s+(?P<version>\S+).*$')
 
         #   3    Supervisor Rommon (Active)    17.1.1[FC2]           N/A                 N/A 
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<slot>\w+)\s+Supervisor\s+Rommon\s+(\(.*\))?\s+(?P<version>\S+).*$')
 
         
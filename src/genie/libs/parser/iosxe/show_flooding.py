@@ -8,12 +8,14 @@ Copyright (c) 2021 by Cisco Systems, Inc.
 All rights reserved.
 '''
 
-import re
 
 # genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ====================================================
 # Schema for 'show flooding-suppression policy <policy name>'
 # ====================================================
@@ -52,18 +54,18 @@ class ShowFloodingSuppressionPolicy(ShowFloodingSuppressionPolicySchema):
             output = output
 
         #Flooding suppress policy fspol3 configuration:
-        p = re.compile(r'^Flooding suppress policy\s+(?P<policy_name>.+)\s+configuration:$')
+        p = regex_engine.compile(r'^Flooding suppress policy\s+(?P<policy_name>.+)\s+configuration:$')
         
         #Suppressing  NDP
-        p1 = re.compile(r'^Suppressing\s+(?P<suppressing>\S+)$') 
+        p1 = regex_engine.compile(r'^Suppressing\s+(?P<suppressing>\S+)$') 
 
         #mode:Proxy multicast resolution requests
-        p2 = re.compile(r'^mode:(?P<mode>.+)')
+        p2 = regex_engine.compile(r'^mode:(?P<mode>.+)')
 
         #Target               Type  Policy               Feature        Target range
         # vlan 2               VLAN  pol1                 DHCP Guard     vlan all
         # Et0/0                PORT  pol1                 DHCP Guard     vlanall
-        p3 = re.compile(r'^(?P<target>\S+\s*\S+)\s{2,}(?P<type>\S+)\s+\S+\s+(?P<feature>\S+\s\S+)\s+(?P<target_range>\S+.*\S+)$')
+        p3 = regex_engine.compile(r'^(?P<target>\S+\s*\S+)\s{2,}(?P<type>\S+)\s+\S+\s+(?P<feature>\S+\s\S+)\s+(?P<target_range>\S+.*\S+)$')
 
         parser_dict = {}
 
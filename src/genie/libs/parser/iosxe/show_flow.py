@@ -18,6 +18,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, ListOf, Optional, And, Default, Use
 
 # Common
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =========================================================
@@ -75,28 +76,28 @@ class ShowFlowMonitor(ShowFlowMonitorSchema):
         dst_addr_index = {}
 
         # Cache type:                               Normal (Platform cache)
-        p1 = re.compile(r'^Cache +type: +(?P<cache_type>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^Cache +type: +(?P<cache_type>[\S\s]+)$')
 
         # Cache size:                                   16
-        p2 = re.compile(r'^Cache +size: +(?P<cache_size>\d+)$')
+        p2 = regex_engine.compile(r'^Cache +size: +(?P<cache_size>\d+)$')
 
         # Current entries:                               1
-        p3 = re.compile(r'^Current +entries: +(?P<current_entries>\d+)$')
+        p3 = regex_engine.compile(r'^Current +entries: +(?P<current_entries>\d+)$')
 
         # High Watermark:                                1
-        p4 = re.compile(r'^High +Watermark: +(?P<high_water_mark>\d+)$')
+        p4 = regex_engine.compile(r'^High +Watermark: +(?P<high_water_mark>\d+)$')
 
         # Flows added:                                   1
-        p5 = re.compile(r'^Flows +added: +(?P<flows_added>\d+)$')
+        p5 = regex_engine.compile(r'^Flows +added: +(?P<flows_added>\d+)$')
 
         # Flows aged:                                   0
-        p6 = re.compile(r'^Flows +aged: +(?P<flows_aged>\d+)$')
+        p6 = regex_engine.compile(r'^Flows +aged: +(?P<flows_aged>\d+)$')
 
         # 10.4.1.10         10.4.10.1                    0              0  0xC0         89                   100                     1
-        p7 = re.compile(r'^(?P<ipv4_src_addr>\S+) +(?P<ipv4_dst_addr>\S+) +'
-                        r'(?P<trns_src_port>\d+) +(?P<trns_dst_port>\d+) +'
-                        r'(?P<ip_tos>\S+) +(?P<ip_port>\d+) +(?P<bytes_long>\d+) +'
-                        r'(?P<pkts_long>\d+)$')
+        p7 = regex_engine.compile(r'^(?P<ipv4_src_addr>\S+) +(?P<ipv4_dst_addr>\S+) +'
+                                  r'(?P<trns_src_port>\d+) +(?P<trns_dst_port>\d+) +'
+                                  r'(?P<ip_tos>\S+) +(?P<ip_port>\d+) +(?P<bytes_long>\d+) +'
+                                  r'(?P<pkts_long>\d+)$')
         for line in out.splitlines():
 
             line = line.strip()
@@ -285,129 +286,129 @@ class ShowFlowMonitorCache(ShowFlowMonitorCacheSchema):
                 match.update({val: 1})
 
         # Cache type:                               Normal (Platform cache)
-        p1 = re.compile(r'^Cache +type: +(?P<cache_type>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^Cache +type: +(?P<cache_type>[\S\s]+)$')
 
         # Cache size:                                   16
-        p2 = re.compile(r'^Cache +size: +(?P<cache_size>\d+)$')
+        p2 = regex_engine.compile(r'^Cache +size: +(?P<cache_size>\d+)$')
 
         # Current entries:                               1
-        p3 = re.compile(r'^Current +entries: +(?P<current_entries>\d+)$')
+        p3 = regex_engine.compile(r'^Current +entries: +(?P<current_entries>\d+)$')
 
         # High Watermark:                                1
-        p4 = re.compile(r'^High +Watermark: +(?P<high_water_mark>\d+)$')
+        p4 = regex_engine.compile(r'^High +Watermark: +(?P<high_water_mark>\d+)$')
 
         # Flows added:                                   1
-        p5 = re.compile(r'^Flows +added: +(?P<flows_added>\d+)$')
+        p5 = regex_engine.compile(r'^Flows +added: +(?P<flows_added>\d+)$')
 
         # Flows aged:                                   0
-        p6 = re.compile(r'^Flows +aged: +(?P<flows_aged>\d+)$')
+        p6 = regex_engine.compile(r'^Flows +aged: +(?P<flows_aged>\d+)$')
 
         # - Inactive timeout    (    15 secs)         15
         # - Event aged                                 0
         # - Watermark aged                             6
         # - Emergency aged                             0
-        p7 = re.compile(r'^- +(?P<key>[\S\s]+?)( +\( +(?P<secs>\d+) +secs\))? +(?P<value>\d+)$')
+        p7 = regex_engine.compile(r'^- +(?P<key>[\S\s]+?)( +\( +(?P<secs>\d+) +secs\))? +(?P<value>\d+)$')
 
         # 0   (DEFAULT)   192.168.189.254    192.168.189.253    Null   Te0/0/0.1003     2
-        p8 = re.compile(r'^(?P<ip_vrf_id_input>\d+ +\(\S+\)) +(?P<ipv4_src_addr>\S+) '
-                        r'+(?P<ipv4_dst_addr>\S+) +(?P<intf_input>\S+) '
-                        r'+(?P<intf_output>\S+) +(?P<pkts>\d+)$')
+        p8 = regex_engine.compile(r'^(?P<ip_vrf_id_input>\d+ +\(\S+\)) +(?P<ipv4_src_addr>\S+) '
+                                  r'+(?P<ipv4_dst_addr>\S+) +(?P<intf_input>\S+) '
+                                  r'+(?P<intf_output>\S+) +(?P<pkts>\d+)$')
 
         # 30.1.1.6         224.0.0.5                    0              0       89
-        p8_1 = re.compile(r'^(?P<ip_src_addr>\S+) +(?P<ip_dst_addr>\S+) +(?P<src_port>\d+) +(?P<dst_port>\d+) +(?P<ip_port>\d+)$')
+        p8_1 = regex_engine.compile(r'^(?P<ip_src_addr>\S+) +(?P<ip_dst_addr>\S+) +(?P<src_port>\d+) +(?P<dst_port>\d+) +(?P<ip_port>\d+)$')
 
         # IP VRF ID INPUT:           0          (DEFAULT)
-        p9 = re.compile(r'^IP VRF ID INPUT: +(?P<id>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^IP VRF ID INPUT: +(?P<id>[\S\s]+)$')
 
         # IPV4 SOURCE ADDRESS:       192.168.189.254
-        p10 = re.compile(r'^IPV4 SOURCE ADDRESS: +(?P<src>\S+)$')
+        p10 = regex_engine.compile(r'^IPV4 SOURCE ADDRESS: +(?P<src>\S+)$')
 
         # IPV4 DESTINATION ADDRESS:  192.168.189.253
-        p11 = re.compile(r'^IPV4 DESTINATION ADDRESS: +(?P<dst>\S+)$')
+        p11 = regex_engine.compile(r'^IPV4 DESTINATION ADDRESS: +(?P<dst>\S+)$')
 
         # interface input:           Null
-        p12 = re.compile(r'^interface input: +(?P<input>\S+)$')
+        p12 = regex_engine.compile(r'^interface input: +(?P<input>\S+)$')
 
         # interface output:          Te0/0/0.1003
-        p13 = re.compile(r'^interface output: +(?P<output>\S+)$')
+        p13 = regex_engine.compile(r'^interface output: +(?P<output>\S+)$')
 
         # counter packets:           3
-        p14 = re.compile(r'^counter packets: +(?P<pkts>\d+)$')
+        p14 = regex_engine.compile(r'^counter packets: +(?P<pkts>\d+)$')
 
         # IPV6 SOURCE ADDRESS:       BBBB:172:51:15::11
-        p15 = re.compile(r'^IPV6 SOURCE ADDRESS: +(?P<ipv6_src_addr>\S+)$')
+        p15 = regex_engine.compile(r'^IPV6 SOURCE ADDRESS: +(?P<ipv6_src_addr>\S+)$')
 
         # IPV6 DESTINATION ADDRESS:  BBBB:172:51:15::111
-        p16 = re.compile(r'^IPV6 DESTINATION ADDRESS: +(?P<ipv6_dst_addr>\S+)$')
+        p16 = regex_engine.compile(r'^IPV6 DESTINATION ADDRESS: +(?P<ipv6_dst_addr>\S+)$')
 
         # TRNS SOURCE PORT:          0
-        p17 = re.compile(r'^TRNS SOURCE PORT: +(?P<trns_src_port>\d+)$')
+        p17 = regex_engine.compile(r'^TRNS SOURCE PORT: +(?P<trns_src_port>\d+)$')
 
         # TRNS DESTINATION PORT:     0
-        p18 = re.compile(r'^TRNS DESTINATION PORT: +(?P<trns_dst_port>\d+)$')
+        p18 = regex_engine.compile(r'^TRNS DESTINATION PORT: +(?P<trns_dst_port>\d+)$')
 
         # FLOW DIRECTION:            Input
-        p19 = re.compile(r'^FLOW DIRECTION: +(?P<flow_direction>\S+)$')
+        p19 = regex_engine.compile(r'^FLOW DIRECTION: +(?P<flow_direction>\S+)$')
 
         # VXLAN VXLAN VNID:          20015
-        p20 = re.compile(r'^VXLAN VXLAN VNID: +(?P<vxlan_vni_id>\S+)$')
+        p20 = regex_engine.compile(r'^VXLAN VXLAN VNID: +(?P<vxlan_vni_id>\S+)$')
 
         # VXLAN VXLAN VTEP INPUT:    172.11.1.22
-        p21 = re.compile(r'^VXLAN VXLAN VTEP INPUT: +(?P<vxlan_vtep_input>\S+)$')
+        p21 = regex_engine.compile(r'^VXLAN VXLAN VTEP INPUT: +(?P<vxlan_vtep_input>\S+)$')
 
         # VXLAN VXLAN VTEP OUTPUT:   172.11.1.1
-        p22 = re.compile(r'^VXLAN VXLAN VTEP OUTPUT: +(?P<vxlan_vtep_output>\S+)$')
+        p22 = regex_engine.compile(r'^VXLAN VXLAN VTEP OUTPUT: +(?P<vxlan_vtep_output>\S+)$')
 
         # IP PROTOCOL:               1
-        p23 = re.compile(r'^IP PROTOCOL: +(?P<ip_protocol>\d+)$')
+        p23 = regex_engine.compile(r'^IP PROTOCOL: +(?P<ip_protocol>\d+)$')
 
         # ipv4 next hop address:     0.0.0.0
-        p24 = re.compile(r'^ipv4 next hop address: +(?P<ipv4_nxt_hop>\S+)$')
+        p24 = regex_engine.compile(r'^ipv4 next hop address: +(?P<ipv4_nxt_hop>\S+)$')
 
         # ipv4 source mask:          /0
-        p25 = re.compile(r'^ipv4 source mask: +(?P<ipv4_src_mask>\S+)$')
+        p25 = regex_engine.compile(r'^ipv4 source mask: +(?P<ipv4_src_mask>\S+)$')
 
         # ipv4 destination mask:     /0
-        p26 = re.compile(r'^ipv4 destination mask: +(?P<ipv4_dst_mask>\S+)$')
+        p26 = regex_engine.compile(r'^ipv4 destination mask: +(?P<ipv4_dst_mask>\S+)$')
 
         # tcp flags:                 0x00
-        p27 = re.compile(r'^tcp flags: +(?P<tcp_flags>\S+)$')
+        p27 = regex_engine.compile(r'^tcp flags: +(?P<tcp_flags>\S+)$')
 
         # counter bytes long:        192
-        p28 = re.compile(r'^counter bytes long: +(?P<counter_bytes>\d+)$')
+        p28 = regex_engine.compile(r'^counter bytes long: +(?P<counter_bytes>\d+)$')
 
         # counter packets long:      3
-        p29 = re.compile(r'^counter packets long: +(?P<counter_pkts_long>\S+)$')
+        p29 = regex_engine.compile(r'^counter packets long: +(?P<counter_pkts_long>\S+)$')
 
         # timestamp abs first:       07:50:06.900
-        p30 = re.compile(r'^timestamp abs first: +(?P<timestamp_abs_first>\S+)$')
+        p30 = regex_engine.compile(r'^timestamp abs first: +(?P<timestamp_abs_first>\S+)$')
 
         # timestamp abs last:        07:50:58.900
-        p31 = re.compile(r'^timestamp abs last: +(?P<timestamp_abs_last>\S+)$')
+        p31 = regex_engine.compile(r'^timestamp abs last: +(?P<timestamp_abs_last>\S+)$')
 
         # IP TOS:                     0x14
-        p32 = re.compile(r'^IP TOS:\s+(?P<ip_tos>\S+)$')
+        p32 = regex_engine.compile(r'^IP TOS:\s+(?P<ip_tos>\S+)$')
 
         #fw fw event:                 1
-        p33 = re.compile(r'^fw fw event: +(?P<fw_fw_event>\S+)$')
+        p33 = regex_engine.compile(r'^fw fw event: +(?P<fw_fw_event>\S+)$')
 
         #DATALINK ETHERTYPE:                      0xFFFF
-        p34 = re.compile(r'^DATALINK ETHERTYPE:\s+(?P<datalink_ethertype>[\w\s]+)$')
+        p34 = regex_engine.compile(r'^DATALINK ETHERTYPE:\s+(?P<datalink_ethertype>[\w\s]+)$')
 
         # DATALINK VLAN INPUT:                     0
-        p35 = re.compile(r'^DATALINK VLAN INPUT:\s+(?P<datalink_vlan_input>[\w\s]+)$')
+        p35 = regex_engine.compile(r'^DATALINK VLAN INPUT:\s+(?P<datalink_vlan_input>[\w\s]+)$')
         
         # DATALINK MAC SOURCE ADDRESS INPUT:       0011.0000.0010
-        p36 = re.compile(r'^DATALINK MAC SOURCE ADDRESS INPUT:\s+(?P<datalink_mac_src_input>[\w\s\.]+)$')
+        p36 = regex_engine.compile(r'^DATALINK MAC SOURCE ADDRESS INPUT:\s+(?P<datalink_mac_src_input>[\w\s\.]+)$')
 
         # DATALINK MAC DESTINATION ADDRESS INPUT:       0011.0000.0010
-        p37 = re.compile(r'^DATALINK MAC DESTINATION ADDRESS INPUT:\s+(?P<datalink_mac_dst_input>[\w\s\.]+)$')
+        p37 = regex_engine.compile(r'^DATALINK MAC DESTINATION ADDRESS INPUT:\s+(?P<datalink_mac_dst_input>[\w\s\.]+)$')
 
         # INTERFACE INPUT:                         Po31
-        p38 = re.compile(r'^INTERFACE INPUT:\s+(?P<interface_input>[\w\.\/]+)$')
+        p38 = regex_engine.compile(r'^INTERFACE INPUT:\s+(?P<interface_input>[\w\.\/]+)$')
 
         # DATALINK MAC DESTINATION ADDRESS OUTPUT:  1000.0E2A.4F57
-        p39 = re.compile(r'^DATALINK MAC DESTINATION ADDRESS OUTPUT:\s+(?P<datalink_mac_dst_output>[\w\s\.]+)$')
+        p39 = regex_engine.compile(r'^DATALINK MAC DESTINATION ADDRESS OUTPUT:\s+(?P<datalink_mac_dst_output>[\w\s\.]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -795,10 +796,10 @@ class ShowFlowExporterStatistics(ShowFlowExporterStatisticsSchema):
                 output = self.device.execute(self.cli_command[1].format(exporter=exporter))
 
         # Flow Exporter test
-        p1 = re.compile(r"^Flow +Exporter +(?P<exporter>\S+):$")
+        p1 = regex_engine.compile(r"^Flow +Exporter +(?P<exporter>\S+):$")
 
         # Packet send statistics (last cleared 00:10:10 ago):
-        p2 = re.compile(r"^Packet +send +statistics +\(last +cleared +(?P<last_cleared>[\d:]+) +ago\):$")
+        p2 = regex_engine.compile(r"^Packet +send +statistics +\(last +cleared +(?P<last_cleared>[\d:]+) +ago\):$")
 
         # Successfully sent:         10                     (1000 bytes)
         # No FIB:                    10                     (1000 bytes)
@@ -813,22 +814,22 @@ class ShowFlowExporterStatistics(ShowFlowExporterStatisticsSchema):
         # Reason not given:          10                     (1000 bytes)
         # Rate limited:              10                     (1000 bytes)
         # No destination address:    10                     (1000 bytes)
-        p3 = re.compile(r"^(?P<statistic>[\w\s]+): +(?P<pkts>\d+) +\((?P<bytes>\d+) +bytes\)$")
+        p3 = regex_engine.compile(r"^(?P<statistic>[\w\s]+): +(?P<pkts>\d+) +\((?P<bytes>\d+) +bytes\)$")
 
         # Client: client_name
-        p4 = re.compile(r"^Client: +(?P<client>[\S\s]+)$")
+        p4 = regex_engine.compile(r"^Client: +(?P<client>[\S\s]+)$")
 
         # Records added:             10
-        p5 = re.compile(r"^Records +added: +(?P<total>\d+)$")
+        p5 = regex_engine.compile(r"^Records +added: +(?P<total>\d+)$")
 
         # Bytes added:               10
-        p6 = re.compile(r"^Bytes +added: +(?P<total>\d+)$")
+        p6 = regex_engine.compile(r"^Bytes +added: +(?P<total>\d+)$")
 
         # - sent:                20
-        p7 = re.compile(r"^- +sent: +(?P<sent>\d+)$")
+        p7 = regex_engine.compile(r"^- +sent: +(?P<sent>\d+)$")
 
         # - failed to send:      30
-        p8 = re.compile(r"^- +failed +to +send: +(?P<failed>\d+)$")
+        p8 = regex_engine.compile(r"^- +failed +to +send: +(?P<failed>\d+)$")
 
         records_flag = False
         bytes_flag = False
@@ -950,28 +951,28 @@ class ShowFlowMonitorSdwanFlowMonitorStatistics(ShowFlowMonitorSdwanFlowMonitorS
             out = output
 
         #Cache type: Normal (Platform cache)
-        p1=re.compile(r'Cache+\s+type+\:+\s+(?P<cache_type>[\w\W\s()]+)')
+        p1=regex_engine.compile(r'Cache+\s+type+\:+\s+(?P<cache_type>[\w\W\s()]+)')
 
         #Cache size: 200000
-        p2=re.compile(r'Cache+\s+size+\:+\s+(?P<cache_size>\d+)')
+        p2=regex_engine.compile(r'Cache+\s+size+\:+\s+(?P<cache_size>\d+)')
 
         #Current entries: 12534
-        p3=re.compile(r'Current+\s+entries+\:+\s+(?P<current_entries>\d+)')
+        p3=regex_engine.compile(r'Current+\s+entries+\:+\s+(?P<current_entries>\d+)')
 
         #High Watermark: 16030
-        p4=re.compile(r'High+\s+Watermark+\:+\s+(?P<high_watermark>\d+)')
+        p4=regex_engine.compile(r'High+\s+Watermark+\:+\s+(?P<high_watermark>\d+)')
 
         #Flows added: 197808242
-        p5=re.compile(r'Flows+\s+added+\:+\s+(?P<flows_added>\d+)')
+        p5=regex_engine.compile(r'Flows+\s+added+\:+\s+(?P<flows_added>\d+)')
 
         #Flows aged: 197795708
-        p6=re.compile(r'Flows+\s+aged+\:+\s+(?P<flows_aged>\d+)')
+        p6=regex_engine.compile(r'Flows+\s+aged+\:+\s+(?P<flows_aged>\d+)')
 
         #- Active timeout ( 60 secs) 11897289
-        p7=re.compile(r'\-+\s+Active+\s+timeout+\s+\(+\s+(?P<active_time_secs>\d+)+\s+secs+\)+\s+(?P<active_time>\d+)')
+        p7=regex_engine.compile(r'\-+\s+Active+\s+timeout+\s+\(+\s+(?P<active_time_secs>\d+)+\s+secs+\)+\s+(?P<active_time>\d+)')
 
         #- Inactive timeout ( 10 secs) 185898419
-        p8=re.compile(r'\-+\s+Inactive+\s+timeout+\s+\(+\s+(?P<inactive_time_secs>\d+)+\s+secs+\)+\s+(?P<inactive_time>\d+)')
+        p8=regex_engine.compile(r'\-+\s+Inactive+\s+timeout+\s+\(+\s+(?P<inactive_time_secs>\d+)+\s+secs+\)+\s+(?P<inactive_time>\d+)')
 
 
         parsed_dict={}
@@ -1073,34 +1074,34 @@ class ShowFlowMonitorAll(ShowFlowMonitorAllSchema):
         ret_dict = {}
 
         # Flow Monitor v4_mon_sgt-output:
-        p1 = re.compile(r'^Flow\sMonitor\s(?P<flow_monitor_name>[\w\-]+)\:$')
+        p1 = regex_engine.compile(r'^Flow\sMonitor\s(?P<flow_monitor_name>[\w\-]+)\:$')
 
         # Description:       User defined
-        p2 = re.compile(r'^Description:\s+(?P<description>[\w\s\.]+)$')
+        p2 = regex_engine.compile(r'^Description:\s+(?P<description>[\w\s\.]+)$')
 
         # Flow Record:       v4-rec_sgt-output
-        p3 = re.compile(r'^Flow\sRecord:\s+(?P<record_name>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Flow\sRecord:\s+(?P<record_name>[\S\s]+)$')
 
         # Flow Exporter:     StealthWatch_Exporter
-        p4 = re.compile(r'^Flow\sExporter:\s+(?P<exporter_name>\S+)$')
+        p4 = regex_engine.compile(r'^Flow\sExporter:\s+(?P<exporter_name>\S+)$')
 
         # Cache
-        p5 = re.compile(r'^(?P<cache>Cache)\:$')
+        p5 = regex_engine.compile(r'^(?P<cache>Cache)\:$')
 
         # Type:                 normal (Platform cache)
-        p6 = re.compile(r'^Type:\s+(?P<type>.*)$')
+        p6 = regex_engine.compile(r'^Type:\s+(?P<type>.*)$')
 
         # Status:               not allocated
-        p7 = re.compile(r'^Status:\s+(?P<status>[\w\s]+)$')
+        p7 = regex_engine.compile(r'^Status:\s+(?P<status>[\w\s]+)$')
 
         # Size:                 10000 entries
-        p8 = re.compile(r'^Size:\s+(?P<size>\d+)\sentries$')
+        p8 = regex_engine.compile(r'^Size:\s+(?P<size>\d+)\sentries$')
 
         # Inactive Timeout:     15 secs
-        p9 = re.compile(r'^Inactive\sTimeout:\s+(?P<inactive_timeout>\d+)\ssecs$')
+        p9 = regex_engine.compile(r'^Inactive\sTimeout:\s+(?P<inactive_timeout>\d+)\ssecs$')
 
         # Active Timeout:       60 secs
-        p10 = re.compile(r'^Active\sTimeout:\s+(?P<active_timeout>\d+)\ssecs$')
+        p10 = regex_engine.compile(r'^Active\sTimeout:\s+(?P<active_timeout>\d+)\ssecs$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1211,43 +1212,43 @@ class ShowFlowExporter(ShowFlowExporterSchema):
         ret_dict = {}
 
         # Flow Exporter StealthWatch_Exporter:
-        p1 = re.compile(r'^Flow\sExporter\s(?P<flow_exporter_name>\S+)\:$')
+        p1 = regex_engine.compile(r'^Flow\sExporter\s(?P<flow_exporter_name>\S+)\:$')
 
         # Description:              Export NetFlow to StealthWatch
-        p2 = re.compile(r'^Description:\s+(?P<description>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^Description:\s+(?P<description>[\S\s]+)$')
 
         # Export protocol:          NetFlow Version 9
-        p3 = re.compile(r'^Export\sprotocol:\s+(?P<export_protocol>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Export\sprotocol:\s+(?P<export_protocol>[\S\s]+)$')
 
         # Transport Configuration:
-        p4 = re.compile(r'^(?P<transport_config>(Transport Configuration:))$')
+        p4 = regex_engine.compile(r'^(?P<transport_config>(Transport Configuration:))$')
 
         # Destination type:       IP
-        p5 = re.compile(r'^Destination\stype:\s+(?P<destination_type>\S+)$')
+        p5 = regex_engine.compile(r'^Destination\stype:\s+(?P<destination_type>\S+)$')
 
         # Destination IP address: 19.1.1.19
-        p6 = re.compile(r'^Destination\sIP\saddress:\s+(?P<destination_ip_address>\S+)$')
+        p6 = regex_engine.compile(r'^Destination\sIP\saddress:\s+(?P<destination_ip_address>\S+)$')
 
         # Source IP address:      29.29.1.1
-        p7 = re.compile(r'^Source\sIP\saddress:\s+(?P<source_ip_address>\S+)$')
+        p7 = regex_engine.compile(r'^Source\sIP\saddress:\s+(?P<source_ip_address>\S+)$')
 
         # Transport Protocol:     UDP
-        p8 = re.compile(r'^Transport\sProtocol:\s+(?P<transport_protocol>\S+)$')
+        p8 = regex_engine.compile(r'^Transport\sProtocol:\s+(?P<transport_protocol>\S+)$')
 
         # Destination Port:       2055
-        p9 = re.compile(r'^Destination\sPort:\s+(?P<destination_port>\d+)$')
+        p9 = regex_engine.compile(r'^Destination\sPort:\s+(?P<destination_port>\d+)$')
 
         # Source Port:            49165
-        p10 = re.compile(r'^Source\sPort:\s+(?P<source_port>\d+)$')
+        p10 = regex_engine.compile(r'^Source\sPort:\s+(?P<source_port>\d+)$')
 
         # DSCP:                   0x0
-        p11 = re.compile(r'^DSCP:\s+(?P<dscp>\S+)$')
+        p11 = regex_engine.compile(r'^DSCP:\s+(?P<dscp>\S+)$')
 
         # TTL:                    255
-        p12 = re.compile(r'^TTL:\s+(?P<ttl>\d+)$')
+        p12 = regex_engine.compile(r'^TTL:\s+(?P<ttl>\d+)$')
 
         # Output Features:        Used
-        p13 = re.compile(r'^Output\sFeatures:\s+(?P<output_features>\S+)$')
+        p13 = regex_engine.compile(r'^Output\sFeatures:\s+(?P<output_features>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1374,32 +1375,32 @@ class ShowFlowRecord(ShowFlowRecordSchema):
             output = self.device.execute(self.cli_command)
 
         #flow record wireless avc basic:
-        p1 = re.compile(r'^flow\srecord\s(?P<flow_record_name>.*):$')
+        p1 = regex_engine.compile(r'^flow\srecord\s(?P<flow_record_name>.*):$')
 
         #Description:        Basic IPv4 Wireless AVC template
-        p2 = re.compile(r'^Description:\s+(?P<description>.*)$')
+        p2 = regex_engine.compile(r'^Description:\s+(?P<description>.*)$')
 
         #No. of users:       0
-        p3 = re.compile(r'^No\.\sof\susers\:\s+(?P<no_of_users>\d)$')
+        p3 = regex_engine.compile(r'^No\.\sof\susers\:\s+(?P<no_of_users>\d)$')
 
         #Total field space:  78 bytes
-        p4 = re.compile(r'^Total\sfield\sspace\:\s+(?P<total_field_space>\d+)\sbytes$')
+        p4 = regex_engine.compile(r'^Total\sfield\sspace\:\s+(?P<total_field_space>\d+)\sbytes$')
 
         #Fields:
-        p5 = re.compile(r'^(?P<fields>Fields\:)$')
+        p5 = regex_engine.compile(r'^(?P<fields>Fields\:)$')
 
         #match ipv4 protocol
         #match ipv4 source address
         #match ipv4 destination address
         #match transport source-port
         #match transport destination-port
-        p6 = re.compile(r'^match\s(?P<match_list>.*)$')
+        p6 = regex_engine.compile(r'^match\s(?P<match_list>.*)$')
 
         #collect counter bytes long
         #collect counter packets long
         #collect wireless ap mac address
         #collect wireless client mac address
-        p7 = re.compile(r'^collect\s(?P<collect_list>.*)$')
+        p7 = regex_engine.compile(r'^collect\s(?P<collect_list>.*)$')
 
         ret_dict = {}
         match_filed_list = []
@@ -1500,38 +1501,38 @@ class ShowRunningConfigFlowExporter(ShowRunningConfigFlowExporterSchema):
             output = self.device.execute(self.cli_command)
 
         #flow exporter export_prime1_nf10
-        p1 = re.compile(r'flow\s+exporter\s+(?P<flow_exporter_name>.*)$')
+        p1 = regex_engine.compile(r'flow\s+exporter\s+(?P<flow_exporter_name>.*)$')
 
         #description test_expoter
-        p2 = re.compile(r'description\s+(?P<description>.*)$')
+        p2 = regex_engine.compile(r'description\s+(?P<description>.*)$')
 
         #destination 10.5.28.112
-        p3 = re.compile(r'destination\s+(?P<destination>\S+)$')
+        p3 = regex_engine.compile(r'destination\s+(?P<destination>\S+)$')
 
         #source Loopback0
-        p4 = re.compile(r'source\s+(?P<source>.*)$')
+        p4 = regex_engine.compile(r'source\s+(?P<source>.*)$')
 
         #dscp 5
-        p5 = re.compile(r'dscp\s+(?P<dscp>\d+)$')
+        p5 = regex_engine.compile(r'dscp\s+(?P<dscp>\d+)$')
 
         #ttl 64
-        p6 = re.compile(r'ttl\s+(?P<ttl>\d+)$')
+        p6 = regex_engine.compile(r'ttl\s+(?P<ttl>\d+)$')
 
         #transport udp 555
-        p7 = re.compile(r'transport\s+(?P<transport_protocol>\S+)\s+(?P<transport_protocol_port>\d+)$')
+        p7 = regex_engine.compile(r'transport\s+(?P<transport_protocol>\S+)\s+(?P<transport_protocol_port>\d+)$')
 
         #export-protocol ipfix
-        p8 = re.compile(r'export-protocol\s+(?P<export_protocol>\S+)$')
+        p8 = regex_engine.compile(r'export-protocol\s+(?P<export_protocol>\S+)$')
 
         #option interface-table timeout 10
         #option vrf-table timeout 10
         #option sampler-table
         #option application-table timeout 10
         #option application-attributes timeout 10
-        p9 = re.compile(r'option\s+(?P<options>.*)$')
+        p9 = regex_engine.compile(r'option\s+(?P<options>.*)$')
 
         #match counter packets long gt 128
-        p10 = re.compile(r'match\s+counter\s+packets\s+long\s+gt\s+(?P<match_counter_packets_long_gt>\d+)$')
+        p10 = regex_engine.compile(r'match\s+counter\s+packets\s+long\s+gt\s+(?P<match_counter_packets_long_gt>\d+)$')
 
         ret_dict = {}
 
@@ -1635,18 +1636,18 @@ class ShowRunningConfigFlowRecord(ShowRunningConfigFlowRecordSchema):
             output = self.device.execute(self.cli_command)
 
         # flow record record_l2_in
-        p1 = re.compile(r'^flow\srecord\s(?P<flow_record>.*)$')
+        p1 = regex_engine.compile(r'^flow\srecord\s(?P<flow_record>.*)$')
 
         # match datalink ethertype
         # match datalink vlan input
         # match datalink mac source address input
         # match datalink mac destination address input
-        p2 = re.compile(r'^match\s(?P<match_list>.*)$')
+        p2 = regex_engine.compile(r'^match\s(?P<match_list>.*)$')
 
         # collect counter bytes long
         # collect counter packets long
         # collect timestamp absolute first
-        p3 = re.compile(r'^collect\s(?P<collect_list>.*)$')
+        p3 = regex_engine.compile(r'^collect\s(?P<collect_list>.*)$')
 
         ret_dict = {}
 
@@ -1730,34 +1731,34 @@ class ShowFlowMonitorCheck(ShowFlowMonitorCheckSchema):
         ret_dict = {}
 
         # Flow Monitor v4_mon_sgt-output:
-        p1 = re.compile(r'^Flow\sMonitor\s(?P<flow_monitor_name>[\w\-]+)\:$')
+        p1 = regex_engine.compile(r'^Flow\sMonitor\s(?P<flow_monitor_name>[\w\-]+)\:$')
 
         # Description:       User defined
-        p2 = re.compile(r'^Description:\s+(?P<description>[\w\s\.]+)$')
+        p2 = regex_engine.compile(r'^Description:\s+(?P<description>[\w\s\.]+)$')
 
         # Flow Record:       v4-rec_sgt-output
-        p3 = re.compile(r'^Flow\sRecord:\s+(?P<record_name>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Flow\sRecord:\s+(?P<record_name>[\S\s]+)$')
 
         # Flow Exporter:     StealthWatch_Exporter
-        p4 = re.compile(r'^Flow\sExporter:\s+(?P<exporter_name>\S+)$')
+        p4 = regex_engine.compile(r'^Flow\sExporter:\s+(?P<exporter_name>\S+)$')
 
         # Cache
-        p5 = re.compile(r'^(?P<cache>Cache)\:$')
+        p5 = regex_engine.compile(r'^(?P<cache>Cache)\:$')
 
         # Type:                 normal (Platform cache)
-        p6 = re.compile(r'^Type:\s+(?P<type>.*)$')
+        p6 = regex_engine.compile(r'^Type:\s+(?P<type>.*)$')
 
         # Status:               not allocated
-        p7 = re.compile(r'^Status:\s+(?P<status>[\w\s]+)$')
+        p7 = regex_engine.compile(r'^Status:\s+(?P<status>[\w\s]+)$')
 
         # Size:                 10000 entries
-        p8 = re.compile(r'^Size:\s+(?P<size>\d+)\sentries$')
+        p8 = regex_engine.compile(r'^Size:\s+(?P<size>\d+)\sentries$')
 
         # Inactive Timeout:     15 secs
-        p9 = re.compile(r'^Inactive\sTimeout:\s+(?P<inactive_timeout>\d+)\ssecs$')
+        p9 = regex_engine.compile(r'^Inactive\sTimeout:\s+(?P<inactive_timeout>\d+)\ssecs$')
 
         # Active Timeout:       60 secs
-        p10 = re.compile(r'^Active\sTimeout:\s+(?P<active_timeout>\d+)\ssecs$')
+        p10 = regex_engine.compile(r'^Active\sTimeout:\s+(?P<active_timeout>\d+)\ssecs$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1888,70 +1889,70 @@ class ShowFlowMonitorCacheFilterInterface(ShowFlowMonitorCacheFilterInterfaceSch
         ret_dict = {}
 
         # Processed 1032 flows
-        p1 = re.compile(r'^Processed (?P<processed_flow>[\d]+) flows$')
+        p1 = regex_engine.compile(r'^Processed (?P<processed_flow>[\d]+) flows$')
 
         # Matched 479 flows
-        p2 = re.compile(r'^Matched (?P<matched_flow>[\d]+) flows$')
+        p2 = regex_engine.compile(r'^Matched (?P<matched_flow>[\d]+) flows$')
 
         # Aggregated to 479 flows
-        p3 = re.compile(r'^Aggregated to (?P<aggregated_flow>[\d]+) flows$')
+        p3 = regex_engine.compile(r'^Aggregated to (?P<aggregated_flow>[\d]+) flows$')
 
         # Showing the top 2 flows
-        p4 = re.compile(r'^Showing the (?P<showing_flow>[\w\ ]+) flows$')
+        p4 = regex_engine.compile(r'^Showing the (?P<showing_flow>[\w\ ]+) flows$')
 
         # IPV4 SOURCE ADDRESS:        11.11.19.1
-        p5 = re.compile(r'^IPV4 SOURCE ADDRESS:        (?P<ipv4_source_address>[\w\.]+)$')
+        p5 = regex_engine.compile(r'^IPV4 SOURCE ADDRESS:        (?P<ipv4_source_address>[\w\.]+)$')
 
         # IPV4 DESTINATION ADDRESS:   224.0.0.6
-        p6 = re.compile(r'^IPV4 DESTINATION ADDRESS:   (?P<ipv4_dest_address>[\w\.]+)$')
+        p6 = regex_engine.compile(r'^IPV4 DESTINATION ADDRESS:   (?P<ipv4_dest_address>[\w\.]+)$')
 
         # INTERFACE OUTPUT:           Gi1/0/13
-        p7 = re.compile(r'^INTERFACE OUTPUT:           (?P<interface_output>[\w\/]+)$')
+        p7 = regex_engine.compile(r'^INTERFACE OUTPUT:           (?P<interface_output>[\w\/]+)$')
 
         # IP VERSION:                 4
-        p8 = re.compile(r'^IP VERSION:                 (?P<ip_version>[\d]+)$')
+        p8 = regex_engine.compile(r'^IP VERSION:                 (?P<ip_version>[\d]+)$')
 
         # IP PROTOCOL:                89
-        p9 = re.compile(r'^IP PROTOCOL:                (?P<ip_protocol>[\d]+)$')
+        p9 = regex_engine.compile(r'^IP PROTOCOL:                (?P<ip_protocol>[\d]+)$')
 
         # IP TTL:                     1
-        p10 = re.compile(r'^IP TTL:                     (?P<ip_ttl>[\d]+)$')
+        p10 = regex_engine.compile(r'^IP TTL:                     (?P<ip_ttl>[\d]+)$')
 
         # interface input:            Null
-        p11 = re.compile(r'^interface input:            (?P<interface_input>[\w\/]+)$')
+        p11 = regex_engine.compile(r'^interface input:            (?P<interface_input>[\w\/]+)$')
 
         # counter packets long:       3
-        p12 = re.compile(r'^counter packets long:       (?P<counter_packets_long>[\d]+)$')
+        p12 = regex_engine.compile(r'^counter packets long:       (?P<counter_packets_long>[\d]+)$')
 
         # timestamp abs first:        17:36:52.000
-        p13 = re.compile(r'^timestamp abs first:        (?P<timestamp_abs_first>[\d\:\.]+)$')
+        p13 = regex_engine.compile(r'^timestamp abs first:        (?P<timestamp_abs_first>[\d\:\.]+)$')
 
         # timestamp abs last:         17:36:53.000
-        p14 = re.compile(r'^timestamp abs last:         (?P<timestamp_abs_last>[\d\:\.]+)$')
+        p14 = regex_engine.compile(r'^timestamp abs last:         (?P<timestamp_abs_last>[\d\:\.]+)$')
 
         # counter bytes layer2 long:  2550
-        p15 = re.compile(r'^counter bytes layer2 long:  (?P<counter_bytes_layers_long>[\d]+)$')
+        p15 = regex_engine.compile(r'^counter bytes layer2 long:  (?P<counter_bytes_layers_long>[\d]+)$')
 
         # TRNS SOURCE PORT:           0
-        p16 = re.compile(r'^TRNS SOURCE PORT:           (?P<trans_source_port>[\d]+)$')
+        p16 = regex_engine.compile(r'^TRNS SOURCE PORT:           (?P<trans_source_port>[\d]+)$')
 
         # TRNS DESTINATION PORT:      0
-        p17 = re.compile(r'^TRNS DESTINATION PORT:      (?P<trans_dest_port>[\d]+)$')
+        p17 = regex_engine.compile(r'^TRNS DESTINATION PORT:      (?P<trans_dest_port>[\d]+)$')
 
         # INTERFACE INPUT:            Gi1/0/13
-        p18 = re.compile(r'^INTERFACE INPUT:            (?P<interface_input_val>[\w\/]+)$')
+        p18 = regex_engine.compile(r'^INTERFACE INPUT:            (?P<interface_input_val>[\w\/]+)$')
 
         # interface output:           Null
-        p19 = re.compile(r'^interface output:           (?P<interface_output_val>[\w\/]+)$')
+        p19 = regex_engine.compile(r'^interface output:           (?P<interface_output_val>[\w\/]+)$')
 
         # IP TOS:                     0x00
-        p20 = re.compile(r'^IP TOS:                     (?P<ip_tos>[\w\/]+)$')
+        p20 = regex_engine.compile(r'^IP TOS:                     (?P<ip_tos>[\w\/]+)$')
 
         # IPV6 SOURCE ADDRESS:        4100:1:7:33::1
-        p21 = re.compile(r'^IPV6 SOURCE ADDRESS:        (?P<ipv6_source_address>[\w\:]+)$')
+        p21 = regex_engine.compile(r'^IPV6 SOURCE ADDRESS:        (?P<ipv6_source_address>[\w\:]+)$')
 
         # IPV6 DESTINATION ADDRESS:   21:28:1::2
-        p22 = re.compile(r'^IPV6 DESTINATION ADDRESS:   (?P<ipv6_dest_address>[\w\:]+)$')
+        p22 = regex_engine.compile(r'^IPV6 DESTINATION ADDRESS:   (?P<ipv6_dest_address>[\w\:]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2201,109 +2202,109 @@ class ShowFlowMonitorCacheFilterInterfaceIPv4(ShowFlowMonitorCacheFilterInterfac
         index = 0
 
         #  Cache type:                               Normal (Platform cache)
-        p1_1 = re.compile(r'^\s*Cache\s+type:\s+(?P<cache_type>.*)$')
+        p1_1 = regex_engine.compile(r'^\s*Cache\s+type:\s+(?P<cache_type>.*)$')
 
         #  Cache size:                              1000000
-        p1_2 = re.compile(r'^\s*Cache\s+size:\s+(?P<cache_size>\d+)$')
+        p1_2 = regex_engine.compile(r'^\s*Cache\s+size:\s+(?P<cache_size>\d+)$')
         
         #  Current entries:                               5
-        p1_3 = re.compile(r'^\s*Current\s+entries:\s+(?P<current_entries>\d+)$')
+        p1_3 = regex_engine.compile(r'^\s*Current\s+entries:\s+(?P<current_entries>\d+)$')
 
         #  High Watermark:                          1003094
-        p1_4 = re.compile(r'^\s*High\s+Watermark:\s+(?P<high_watermark>\d+)$')
+        p1_4 = regex_engine.compile(r'^\s*High\s+Watermark:\s+(?P<high_watermark>\d+)$')
 
         #  Flows added:                          2470340673
-        p1_5 = re.compile(r'^\s*Flows\s+added:\s+(?P<flows_added>\d+)$')
+        p1_5 = regex_engine.compile(r'^\s*Flows\s+added:\s+(?P<flows_added>\d+)$')
 
         #  Flows not added:                      26936258373
-        p1_6 = re.compile(r'^\s*Flows\s+not\s+added:\s+(?P<flows_not_added>\d+)$')
+        p1_6 = regex_engine.compile(r'^\s*Flows\s+not\s+added:\s+(?P<flows_not_added>\d+)$')
 
         #  Flows aged:                           2470340668
-        p1_7 = re.compile(r'^\s*Flows\s+aged:\s+(?P<flows_aged>\d+)$')
+        p1_7 = regex_engine.compile(r'^\s*Flows\s+aged:\s+(?P<flows_aged>\d+)$')
 
         #IPV4 SOURCE ADDRESS:                  121.0.5.2
-        p2_1 = re.compile(r'^\s*IPV4\s+SOURCE\s+ADDRESS\s*:\s+(?P<ipv4_source_address>[\d\.]+)$')
+        p2_1 = regex_engine.compile(r'^\s*IPV4\s+SOURCE\s+ADDRESS\s*:\s+(?P<ipv4_source_address>[\d\.]+)$')
 
         #IPV4 DESTINATION ADDRESS:             106.0.5.2
-        p2_2 = re.compile(r'^\s*IPV4\s+DESTINATION\s+ADDRESS\s*:\s+(?P<ipv4_destination_address>[\d\.]+)$')
+        p2_2 = regex_engine.compile(r'^\s*IPV4\s+DESTINATION\s+ADDRESS\s*:\s+(?P<ipv4_destination_address>[\d\.]+)$')
 
         #TRNS SOURCE PORT:                     1025
-        p2_3 = re.compile(r'^\s*TRNS\s+SOURCE\s+PORT\s*:\s+(?P<source_port>\d+)$')
+        p2_3 = regex_engine.compile(r'^\s*TRNS\s+SOURCE\s+PORT\s*:\s+(?P<source_port>\d+)$')
 
         #TRNS DESTINATION PORT:                63
-        p2_4 = re.compile(r'^\s*TRNS\s+DESTINATION\s+PORT\s*:\s+(?P<destination_port>\d+)$')
+        p2_4 = regex_engine.compile(r'^\s*TRNS\s+DESTINATION\s+PORT\s*:\s+(?P<destination_port>\d+)$')
 
         #IP VPN ID:                            5
-        p2_5 = re.compile(r'^\s*IP\s+VPN\s+ID\s*:\s+(?P<vpn_id>\d+)$')
+        p2_5 = regex_engine.compile(r'^\s*IP\s+VPN\s+ID\s*:\s+(?P<vpn_id>\d+)$')
 
         #IP PROTOCOL:                          17
-        p2_6 = re.compile(r'^\s*IP\s+PROTOCOL\s*:\s+(?P<ip_protocol>\d+)$')
+        p2_6 = regex_engine.compile(r'^\s*IP\s+PROTOCOL\s*:\s+(?P<ip_protocol>\d+)$')
 
         #tcp flags:                            0x18
-        p2_7 = re.compile(r'^\s*tcp\s+flags\s*:\s+(?P<tcp_flags>.*)$')
+        p2_7 = regex_engine.compile(r'^\s*tcp\s+flags\s*:\s+(?P<tcp_flags>.*)$')
 
         #interface input:                      Hu0/1/2.5
-        p2_8 = re.compile(r'^\s*interface\s+input\s*:\s+(?P<interface_input>.*)$')
+        p2_8 = regex_engine.compile(r'^\s*interface\s+input\s*:\s+(?P<interface_input>.*)$')
 
         #interface output:                     Hu0/1/0.3
-        p2_9 = re.compile(r'^\s*interface\s+output\s*:\s+(?P<interface_output>.*)$')
+        p2_9 = regex_engine.compile(r'^\s*interface\s+output\s*:\s+(?P<interface_output>.*)$')
 
         #counter bytes long:                   24686856
-        p2_10 = re.compile(r'^\s*counter\s+bytes\s+long\s*:\s+(?P<counter_bytes_long>\d+)$')
+        p2_10 = regex_engine.compile(r'^\s*counter\s+bytes\s+long\s*:\s+(?P<counter_bytes_long>\d+)$')
 
         #counter packets long:                 62620
-        p2_11 = re.compile(r'^\s*counter\s+packets\s+long\s*:\s+(?P<counter_packets_long>\d+)$')
+        p2_11 = regex_engine.compile(r'^\s*counter\s+packets\s+long\s*:\s+(?P<counter_packets_long>\d+)$')
 
         #timestamp abs first:                  15:53:01.433
-        p2_12 = re.compile(r'^\s*timestamp\s+abs\s+first\s*:\s+(?P<timestamp_abs_first>[\d\:\.]+)$')
+        p2_12 = regex_engine.compile(r'^\s*timestamp\s+abs\s+first\s*:\s+(?P<timestamp_abs_first>[\d\:\.]+)$')
 
         #timestamp abs last:                   15:53:05.612
-        p2_13 = re.compile(r'^\s*timestamp\s+abs\s+last\s*:\s+(?P<timestamp_abs_last>[\d\:\.]+)$')
+        p2_13 = regex_engine.compile(r'^\s*timestamp\s+abs\s+last\s*:\s+(?P<timestamp_abs_last>[\d\:\.]+)$')
 
         #flow end reason:                      Not determined
-        p2_14 = re.compile(r'^\s*flow\s+end\s+reason\s*:\s+(?P<flow_end_reason>.*)$')
+        p2_14 = regex_engine.compile(r'^\s*flow\s+end\s+reason\s*:\s+(?P<flow_end_reason>.*)$')
 
         #connection initiator:                 Initiator
-        p2_15 = re.compile(r'^\s*connection\s+initiator\s*:\s+(?P<connection_initiator>.*)$')
+        p2_15 = regex_engine.compile(r'^\s*connection\s+initiator\s*:\s+(?P<connection_initiator>.*)$')
 
         #interface overlay session id input:   0
-        p2_16 = re.compile(r'^\s*interface\s+overlay\s+session\s+id\s+input\s*:\s+(?P<interface_overlay_session_id_input>\d+)$')
+        p2_16 = regex_engine.compile(r'^\s*interface\s+overlay\s+session\s+id\s+input\s*:\s+(?P<interface_overlay_session_id_input>\d+)$')
 
         #interface overlay session id output:  42
-        p2_17 = re.compile(r'^\s*interface\s+overlay\s+session\s+id\s+output\s*:\s+(?P<interface_overlay_session_id_output>\d+)$')
+        p2_17 = regex_engine.compile(r'^\s*interface\s+overlay\s+session\s+id\s+output\s*:\s+(?P<interface_overlay_session_id_output>\d+)$')
 
         #connection connection id long:        0x9288A0F00018F2AD
-        p2_18 = re.compile(r'^\s*connection\s+connection\s+id\s+long\s*:\s+(?P<connection_connection_id_long>.*)$')
+        p2_18 = regex_engine.compile(r'^\s*connection\s+connection\s+id\s+long\s*:\s+(?P<connection_connection_id_long>.*)$')
 
         #drop cause id:                        0
-        p2_19 = re.compile(r'^\s*drop\s+cause\s+id\s*:\s+(?P<drop_cause_id>\d+)$')
+        p2_19 = regex_engine.compile(r'^\s*drop\s+cause\s+id\s*:\s+(?P<drop_cause_id>\d+)$')
 
         #counter bytes drop long:              0
-        p2_20 = re.compile(r'^\s*counter\s+bytes\s+drop\s+long\s*:\s+(?P<counter_bytes_drop_long>\d+)$')
+        p2_20 = regex_engine.compile(r'^\s*counter\s+bytes\s+drop\s+long\s*:\s+(?P<counter_bytes_drop_long>\d+)$')
 
         #sdwan sla not met :                   0
-        p2_21 = re.compile(r'^\s*sdwan\s+sla\s+not\s+met\s*:\s+(?P<sdwan_sla_not_met>\d+)$')
+        p2_21 = regex_engine.compile(r'^\s*sdwan\s+sla\s+not\s+met\s*:\s+(?P<sdwan_sla_not_met>\d+)$')
 
         #sdwan preferred color not met :       0
-        p2_22 = re.compile(r'^\s*sdwan\s+preferred\s+color\s+not\s+met\s*:\s+(?P<sdwan_preferred_color_not_met>\d+)$')
+        p2_22 = regex_engine.compile(r'^\s*sdwan\s+preferred\s+color\s+not\s+met\s*:\s+(?P<sdwan_preferred_color_not_met>\d+)$')
 
         #sdwan queue id :                      2
-        p2_23 = re.compile(r'^\s*sdwan\s+queue\s+id\s*:\s+(?P<sdwan_queue_id>\d+)$')
+        p2_23 = regex_engine.compile(r'^\s*sdwan\s+queue\s+id\s*:\s+(?P<sdwan_queue_id>\d+)$')
 
         #counter packets drop long:            0
-        p2_24 = re.compile(r'^\s*counter\s+packets\s+drop\s+long\s*:\s+(?P<counter_packets_drop_long>\d+)$')
+        p2_24 = regex_engine.compile(r'^\s*counter\s+packets\s+drop\s+long\s*:\s+(?P<counter_packets_drop_long>\d+)$')
 
         #ip tos:                               0x00
-        p2_25 = re.compile(r'^\s*ip\s+tos\s*:\s+(?P<ip_tos>.*)$')
+        p2_25 = regex_engine.compile(r'^\s*ip\s+tos\s*:\s+(?P<ip_tos>.*)$')
 
         #ip dscp:                              0x00
-        p2_26 = re.compile(r'^\s*ip\s+dscp\s*:\s+(?P<ip_dscp>.*)$')
+        p2_26 = regex_engine.compile(r'^\s*ip\s+dscp\s*:\s+(?P<ip_dscp>.*)$')
 
         #ip dscp output:                       0x00
-        p2_27 = re.compile(r'^\s*ip\s+dscp\s+output\s*:\s+(?P<ip_dscp_output>.*)$')
+        p2_27 = regex_engine.compile(r'^\s*ip\s+dscp\s+output\s*:\s+(?P<ip_dscp_output>.*)$')
 
         #application name:                     layer7 unknown
-        p2_28 = re.compile(r'^\s*application\s+name\s*:\s+(?P<application_name>.*)$')
+        p2_28 = regex_engine.compile(r'^\s*application\s+name\s*:\s+(?P<application_name>.*)$')
 
 
         for line in output.splitlines():
@@ -2552,7 +2553,7 @@ class ShowSampler(ShowSamplerSchema):
 
         # Export_ID     Description	Type		rate		samples		requests   users
         # 2	         Userdefined	Random		1outof1000	0		0	flowmonitorm4(ip,Vl100,Input)0outof0
-        p1 = re.compile(r"^(?P<export_id>\d+)\s+(?P<description>.+?)\s+(?P<type>\S+)\s+(?P<rate>.+?)\s+(?P<samples>\d+)\s+(?P<requests>\d+)\s+(?P<users>.+?)$")
+        p1 = regex_engine.compile(r"^(?P<export_id>\d+)\s+(?P<description>.+?)\s+(?P<type>\S+)\s+(?P<rate>.+?)\s+(?P<samples>\d+)\s+(?P<requests>\d+)\s+(?P<users>.+?)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2627,29 +2628,29 @@ class ShowFlowMonitorS1InputCacheFilter(ShowFlowMonitorS1InputCacheFilterSchema)
             output = self.device.execute(cmd)
 
         # Cache type: Normal (Platform cache)
-        p1 = re.compile(r'^Cache +type:\s+(?P<cache_type>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^Cache +type:\s+(?P<cache_type>[\S\s]+)$')
 
         # Cache size: 10000
-        p2 = re.compile(r'^Cache +size:\s+(?P<cache_size>\d+)$')
+        p2 = regex_engine.compile(r'^Cache +size:\s+(?P<cache_size>\d+)$')
 
         # Current entries: 6
-        p3 = re.compile(r'^Current +entries:\s+(?P<current_entries>\d+)$')
+        p3 = regex_engine.compile(r'^Current +entries:\s+(?P<current_entries>\d+)$')
 
         # Flows added: 78
-        p4 = re.compile(r'^Flows +added:\s+(?P<flows_added>\d+)$')
+        p4 = regex_engine.compile(r'^Flows +added:\s+(?P<flows_added>\d+)$')
 
         # Flows aged: 72
-        p5 = re.compile(r'^Flows +aged:\s+(?P<flows_aged>\d+)$')
+        p5 = regex_engine.compile(r'^Flows +aged:\s+(?P<flows_aged>\d+)$')
 
         # Active timeout (60 secs) 36
-        p6 = re.compile(r"^Active timeout +\((?P<active_timeout_secs>\d+) secs\) +(?P<active_timeout>\d+)$")
+        p6 = regex_engine.compile(r"^Active timeout +\((?P<active_timeout_secs>\d+) secs\) +(?P<active_timeout>\d+)$")
 
         # Inactive timeout (60 secs) 36
-        p7 = re.compile(r"^Inactive timeout +\((?P<inactive_timeout_secs>\d+) secs\) +(?P<inactive_timeout>\d+)$")
+        p7 = regex_engine.compile(r"^Inactive timeout +\((?P<inactive_timeout_secs>\d+) secs\) +(?P<inactive_timeout>\d+)$")
 
         # 100:1::123	   200:1::123	  Tw1/0/25	          100	                      0	              6	          59	   63	    13746
         # 100.1.1.123      200.1.1.123     Tw1/0/25           100                         0               4           61       64       13978
-        p8 = re.compile(r'^(?P<src_addr>(\d+\.\d+\.\d+\.\d+|[a-fA-F0-9:]+))\s+(?P<dst_addr>(\d+\.\d+\.\d+\.\d+|[a-fA-F0-9:]+))\s+(?P<interface>\S+)\s+(?P<flow_cts_src_group_tag>\d+)\s+(?P<flow_cts_dst_group_tag>\d+)\s+(?P<ip_version>\d+)\s+(?P<ip_prot>\d+)\s+(?P<ip_ttl>\d+)\s+(?P<pkts_long>\d+)$')
+        p8 = regex_engine.compile(r'^(?P<src_addr>(\d+\.\d+\.\d+\.\d+|[a-fA-F0-9:]+))\s+(?P<dst_addr>(\d+\.\d+\.\d+\.\d+|[a-fA-F0-9:]+))\s+(?P<interface>\S+)\s+(?P<flow_cts_src_group_tag>\d+)\s+(?P<flow_cts_dst_group_tag>\d+)\s+(?P<ip_version>\d+)\s+(?P<ip_prot>\d+)\s+(?P<ip_ttl>\d+)\s+(?P<pkts_long>\d+)$')
 
         ret_dict = {}
 
@@ -9,14 +9,12 @@ Copyright (c) 2021 by Cisco Systems, Inc.
 All rights reserved.
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Any
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ====================================
@@ -61,16 +59,16 @@ class ShowFpBdMac(ShowFpBdMacSchema):
         ret_dict = {}
 
         # MAC               BD        Nhop Type   Nhop Name/Idx                             Flags
-        p1 = re.compile(r'^MAC +BD +Nhop +Type +Nhop +Name\/Idx +Flags$')
+        p1 = regex_engine.compile(r'^MAC +BD +Nhop +Type +Nhop +Name\/Idx +Flags$')
 
         # ffff.ffff.fffe    111       olist       0x297c                                    none
-        p2 = re.compile(r'^(?P<mac>[\d\.a-fA-F]+) +(?P<bd_id>[\d]+) +(?P<nhop_type>\w+) +(?P<nhop_idx>0x[\w\d]+) +(?P<flags>\w+)$')
+        p2 = regex_engine.compile(r'^(?P<mac>[\d\.a-fA-F]+) +(?P<bd_id>[\d]+) +(?P<nhop_type>\w+) +(?P<nhop_idx>0x[\w\d]+) +(?P<flags>\w+)$')
 
         # aabb.0000.0011    111       efp         GigabitEthernet6.EFP111                   none
-        p3 = re.compile(r'^(?P<mac>[\d\.a-fA-F]+) +(?P<bd_id>[\d]+) +(?P<nhop_type>[\w]+) +(?P<nhop_name>[\w\d\.\/]+) +(?P<flags>\w+)$')
+        p3 = regex_engine.compile(r'^(?P<mac>[\d\.a-fA-F]+) +(?P<bd_id>[\d]+) +(?P<nhop_type>[\w]+) +(?P<nhop_name>[\w\d\.\/]+) +(?P<flags>\w+)$')
 
         # aabb.0000.0021    111       oce         EVPN(0xe8bd90a0)/0xa9f                    none
-        p4 = re.compile(r'^(?P<mac>[\d\.a-fA-F]+) +(?P<bd_id>[\d]+) +(?P<nhop_type>\w+) +(?P<nhop_name>[\w\d\.\(\)]+)+\/+(?P<nhop_idx>0x[\w\d]+) +(?P<flags>\w+)$')
+        p4 = regex_engine.compile(r'^(?P<mac>[\d\.a-fA-F]+) +(?P<bd_id>[\d]+) +(?P<nhop_type>\w+) +(?P<nhop_name>[\w\d\.\(\)]+)+\/+(?P<nhop_idx>0x[\w\d]+) +(?P<flags>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -8,13 +8,13 @@ Copyright (c) 2021 by Cisco Systems, Inc.
 All rights reserved.
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ====================================
 # Parser for 'show platform software evpn Fp active encap-oce index <oce_index> detail'
 # ====================================
@@ -74,49 +74,49 @@ class ShowFpEncapOce(ShowFpEncapOceSchema):
         ret_dict = {}
 
         # OCE Type: EVPN Encap OCE, Number of children: 1
-        p1 = re.compile(r'^OCE +Type: +(?P<oce_type>[\d\w ]+), +Number +of +children: +(?P<number_of_children>[\d]+)$')
+        p1 = regex_engine.compile(r'^OCE +Type: +(?P<oce_type>[\d\w ]+), +Number +of +children: +(?P<number_of_children>[\d]+)$')
         # Flags: 0x02
-        p2 = re.compile(r'^Flags: +(?P<flags>[\w\d]+)$')
+        p2 = regex_engine.compile(r'^Flags: +(?P<flags>[\w\d]+)$')
         # Atom flags: 0000
-        p3 = re.compile(r'^Atom +flags: +(?P<atom_flags>[\w\d]+)$')
+        p3 = regex_engine.compile(r'^Atom +flags: +(?P<atom_flags>[\w\d]+)$')
         # Next hop: 2.2.2.3
-        p4 = re.compile(r'^Next +hop: +(?P<next_hop>[\.\d]+)$')
+        p4 = regex_engine.compile(r'^Next +hop: +(?P<next_hop>[\.\d]+)$')
         # EFI Name: nve1.VNI20111
-        p5 = re.compile(r'^EFI +Name: +(?P<efi_name>[\w\d\.]+)$')
+        p5 = regex_engine.compile(r'^EFI +Name: +(?P<efi_name>[\w\d\.]+)$')
         # Next hw oce ptr: 0xe8bc9120
-        p6 = re.compile(r'^Next +hw +oce +ptr: +(?P<next_hw_oce_ptr>[\w\d]+)$')
+        p6 = regex_engine.compile(r'^Next +hw +oce +ptr: +(?P<next_hw_oce_ptr>[\w\d]+)$')
         # Fixup_Flags_2: 0xd0000
-        p7 = re.compile(r'^Fixup_Flags_2: +(?P<fixup_flags_2>[\w\d]+)$')
+        p7 = regex_engine.compile(r'^Fixup_Flags_2: +(?P<fixup_flags_2>[\w\d]+)$')
         # Adj Type: IPV4 Adjacency
-        p8 = re.compile(r'^Adj +Type: +(?P<adj_type>[\w\d ]+)$')
+        p8 = regex_engine.compile(r'^Adj +Type: +(?P<adj_type>[\w\d ]+)$')
         # Encap Len: 28
-        p9 = re.compile(r'^Encap +Len: +(?P<encap_len>[\d]+)$')
+        p9 = regex_engine.compile(r'^Encap +Len: +(?P<encap_len>[\d]+)$')
         # L3 MTU: 9216
-        p10 = re.compile(r'^L3 +MTU: +(?P<l3_mtu>[\d]+)$')
+        p10 = regex_engine.compile(r'^L3 +MTU: +(?P<l3_mtu>[\d]+)$')
         # Adj Flags: 0x0000
-        p11 = re.compile(r'^Adj +Flags: +(?P<adj_flags>[\w\d]+)$')
+        p11 = regex_engine.compile(r'^Adj +Flags: +(?P<adj_flags>[\w\d]+)$')
         # Interface Name: Tunnel1
-        p12 = re.compile(r'^Interface +Name: +(?P<interface_name>\w+)$')
+        p12 = regex_engine.compile(r'^Interface +Name: +(?P<interface_name>\w+)$')
         # Next Hop Address: 2.2.2.3
-        p13 = re.compile(r'^Next +Hop +Address: +(?P<next_hop_address>[\.\d]+)$')
+        p13 = regex_engine.compile(r'^Next +Hop +Address: +(?P<next_hop_address>[\.\d]+)$')
         # Output UIDB: 262090
-        p14 = re.compile(r'^Output +UIDB: +(?P<output_uidb>[\d]+)$')
+        p14 = regex_engine.compile(r'^Output +UIDB: +(?P<output_uidb>[\d]+)$')
         # Lisp Fixup HW Ptr: 0x4966a3a0
-        p15 = re.compile(r'^Lisp +Fixup +HW +Ptr: +(?P<lisp_fixup_hw_ptr>[\w\d]+)$')
+        p15 = regex_engine.compile(r'^Lisp +Fixup +HW +Ptr: +(?P<lisp_fixup_hw_ptr>[\w\d]+)$')
         # Next HW OCE Ptr: 00000000
-        p16 = re.compile(r'^Next +HW +OCE +Ptr: +(?P<next_hw_oce_ptr>[\w\d]+)$')
+        p16 = regex_engine.compile(r'^Next +HW +OCE +Ptr: +(?P<next_hw_oce_ptr>[\w\d]+)$')
         # Encap str: 8000000 6212400
-        p17 = re.compile(r'^Encap +str: +(?P<encap_str>[\d ]+)$')
+        p17 = regex_engine.compile(r'^Encap +str: +(?P<encap_str>[\d ]+)$')
         # Encap: 45 00 00 00 00 00 00 00 ff 11 ed 5e 63 63 03 64
-        p18 = re.compile(r'^Encap: +(?P<encap>[\d\w ]+)$')
+        p18 = regex_engine.compile(r'^Encap: +(?P<encap>[\d\w ]+)$')
         # 63 63 04 64 12 b5 12 b5 00 00 00 00
-        p19 = re.compile(r'^(?P<encap2>[\da-fA-F ]+)$')
+        p19 = regex_engine.compile(r'^(?P<encap2>[\da-fA-F ]+)$')
         # Fixup Flags: 0x0001
-        p20 = re.compile(r'^Fixup +Flags: +(?P<fixup_flags>[\d\w]+)$')
+        p20 = regex_engine.compile(r'^Fixup +Flags: +(?P<fixup_flags>[\d\w]+)$')
         # ADJ_GRE
-        p21 = re.compile(r'^ADJ_GRE$')
+        p21 = regex_engine.compile(r'^ADJ_GRE$')
         # ADJ_FLAG_2_ROUTE_PTR
-        p22 = re.compile(r'^ADJ_FLAG_2_ROUTE_PTR$')
+        p22 = regex_engine.compile(r'^ADJ_FLAG_2_ROUTE_PTR$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4,12 +4,14 @@ IOSxe parsers for the following show commands:
         * show fqdn packet statistics
         * show fqdn database
 '''
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ====================================================
 # Schema for 'show fqdn packet statistics'
 # ====================================================
@@ -63,64 +65,64 @@ class ShowFQDNPacketStatistics(ShowFQDNPacketStatisticsSchema):
         ret_dict = {}
 
         # Total DNS Pkts Rcvd                      : 108
-        p = re.compile(r'^Total\s+DNS\s+Pkts\s+Rcvd\s+:\s+((?P<total_dns_pkts_rcvd>\d+)$)')
+        p = regex_engine.compile(r'^Total\s+DNS\s+Pkts\s+Rcvd\s+:\s+((?P<total_dns_pkts_rcvd>\d+)$)')
 
         # IPv4 DNS Pkts Rcvd                   : 108
-        p1 = re.compile(r'^IPv4\s+DNS\s+Pkts\s+Rcvd\s+:\s+((?P<ipv4_dns_pkts_rcvd>\d+)$)')
+        p1 = regex_engine.compile(r'^IPv4\s+DNS\s+Pkts\s+Rcvd\s+:\s+((?P<ipv4_dns_pkts_rcvd>\d+)$)')
 
         # IPv6 DNS Pkts Rcvd                   : 0
-        p2 = re.compile(r'^IPv6\s+DNS\s+Pkts\s+Rcvd\s+:\s+((?P<ipv6_dns_pkts_rcvd>\d+)$)')
+        p2 = regex_engine.compile(r'^IPv6\s+DNS\s+Pkts\s+Rcvd\s+:\s+((?P<ipv6_dns_pkts_rcvd>\d+)$)')
 
         # Total DNS Pkts for registered FQDNs      : 2
-        p3 = re.compile(r'^Total\s+DNS\s+Pkts\s+for\s+registered\s+FQDNs\s+:\s+((?P<total_registered_fqdn>\d+)$)')
+        p3 = regex_engine.compile(r'^Total\s+DNS\s+Pkts\s+for\s+registered\s+FQDNs\s+:\s+((?P<total_registered_fqdn>\d+)$)')
 
         # Total DNS Pkts with induced latency      : 2
-        p4 = re.compile(r'^Total\s+DNS\s+Pkts\s+with\s+induced\s+latency\s+:\s+((?P<total_induced_latency>\d+)$)')
+        p4 = regex_engine.compile(r'^Total\s+DNS\s+Pkts\s+with\s+induced\s+latency\s+:\s+((?P<total_induced_latency>\d+)$)')
 
         # DNS Packet Latency:
-        p5 = re.compile(r'^DNS\s+Packet\s+Latency:$')
+        p5 = regex_engine.compile(r'^DNS\s+Packet\s+Latency:$')
 
         # Min                                  : 12 ms
-        p6 = re.compile(r'^Min\s+:\s+((?P<min_latency>\d+)\s+ms$)')
+        p6 = regex_engine.compile(r'^Min\s+:\s+((?P<min_latency>\d+)\s+ms$)')
 
         # Max                                  : 3000 ms
-        p7 = re.compile(r'^Max\s+:\s+((?P<max_latency>\d+)\s+ms$)')
+        p7 = regex_engine.compile(r'^Max\s+:\s+((?P<max_latency>\d+)\s+ms$)')
 
         # Avg                                  : 1506 ms
-        p8 = re.compile(r'^Avg\s+:\s+((?P<avg_latency>\d+)\s+ms$)')
+        p8 = regex_engine.compile(r'^Avg\s+:\s+((?P<avg_latency>\d+)\s+ms$)')
 
         # Total DNS Pkts Injected                  : 108
-        p9 = re.compile(r'^Total\s+DNS\s+Pkts\s+Injected\s+:\s+((?P<total_pkts_injected>\d+)$)')
+        p9 = regex_engine.compile(r'^Total\s+DNS\s+Pkts\s+Injected\s+:\s+((?P<total_pkts_injected>\d+)$)')
 
         # DNS Pkts Injected by Ack             : 2
-        p10 = re.compile(r'^DNS\s+Pkts\s+Injected\s+by\s+Ack\s+:\s+((?P<pkts_injected_by_ack>\d+)$)')
+        p10 = regex_engine.compile(r'^DNS\s+Pkts\s+Injected\s+by\s+Ack\s+:\s+((?P<pkts_injected_by_ack>\d+)$)')
 
         # DNS Pkts with parse error            : 0
-        p11 = re.compile(r'^DNS\s+Pkts\s+with\s+parse\s+error\s+:\s+((?P<pkts_with_parse_error>\d+)$)')
+        p11 = regex_engine.compile(r'^DNS\s+Pkts\s+with\s+parse\s+error\s+:\s+((?P<pkts_with_parse_error>\d+)$)')
 
         # DNS Pkts with no answer              : 106
-        p12 = re.compile(r'^DNS\s+Pkts\s+with\s+no\s+answer\s+:\s+((?P<pkts_with_no_answer>\d+)$)')
+        p12 = regex_engine.compile(r'^DNS\s+Pkts\s+with\s+no\s+answer\s+:\s+((?P<pkts_with_no_answer>\d+)$)')
 
         # DNS Pkts with no A/AAAA Record       : 0
-        p13 = re.compile(r'^DNS\s+Pkts\s+with\s+no\s+A/AAAA\s+Record\s+:\s+((?P<pkts_with_no_aaaa_record>\d+)$)')
+        p13 = regex_engine.compile(r'^DNS\s+Pkts\s+with\s+no\s+A/AAAA\s+Record\s+:\s+((?P<pkts_with_no_aaaa_record>\d+)$)')
 
         # DNS Pkts with FQDN not registered    : 0
-        p14 = re.compile(r'^DNS\s+Pkts\s+with\s+FQDN\s+not\s+registered\s+:\s+((?P<fqdn_not_registered>\d+)$)')
+        p14 = regex_engine.compile(r'^DNS\s+Pkts\s+with\s+FQDN\s+not\s+registered\s+:\s+((?P<fqdn_not_registered>\d+)$)')
 
         # DNS Pkts with FQDN already cached    : 0
-        p15 = re.compile(r'^DNS\s+Pkts\s+with\s+FQDN\s+already\s+cached\s+:\s+((?P<fqdn_already_cached>\d+)$)')
+        p15 = regex_engine.compile(r'^DNS\s+Pkts\s+with\s+FQDN\s+already\s+cached\s+:\s+((?P<fqdn_already_cached>\d+)$)')
 
         # Total DNS Pkts Dropped by Nack           : 0
-        p16 = re.compile(r'^Total\s+DNS\s+Pkts\s+Dropped\s+by\s+Nack\s+:\s+((?P<total_pkts_dropped_nack>\d+)$)')
+        p16 = regex_engine.compile(r'^Total\s+DNS\s+Pkts\s+Dropped\s+by\s+Nack\s+:\s+((?P<total_pkts_dropped_nack>\d+)$)')
 
         # Average Input rate - 1 min               : 1 pps
-        p17 = re.compile(r'^Average\s+Input\s+rate\s+\-\s+1\s+min\s+\:\s+((?P<avg_input_rate_1_min>\d+)\s+pps$)')
+        p17 = regex_engine.compile(r'^Average\s+Input\s+rate\s+\-\s+1\s+min\s+\:\s+((?P<avg_input_rate_1_min>\d+)\s+pps$)')
 
         # Average Input rate - 5 min               : 1 pps
-        p18 = re.compile(r'^Average\s+Input\s+rate\s+\-\s+5\s+min\s+\:\s+((?P<avg_input_rate_5_min>\d+)\s+pps$)')
+        p18 = regex_engine.compile(r'^Average\s+Input\s+rate\s+\-\s+5\s+min\s+\:\s+((?P<avg_input_rate_5_min>\d+)\s+pps$)')
 
         # Average Input rate - 1 hr                : 1 pps
-        p19 = re.compile(r'^Average\s+Input\s+rate\s+\-\s+1\s+hr\s+\:\s+((?P<avg_input_rate_1_hr>\d+)\s+pps$)')
+        p19 = regex_engine.compile(r'^Average\s+Input\s+rate\s+\-\s+1\s+hr\s+\:\s+((?P<avg_input_rate_1_hr>\d+)\s+pps$)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -302,14 +304,14 @@ class ShowFQDNDatabase(ShowFQDNDatabaseSchema):
         ret_dict = {}
 
         # ================ Cached FQDN entries =================
-        p = re.compile(r'^\=+\s+Cached\s+FQDN\s+entries\s+\=+$')
+        p = regex_engine.compile(r'^\=+\s+Cached\s+FQDN\s+entries\s+\=+$')
 
         # FQDN Name: *.msft404.com
-        p1 = re.compile(r'^FQDN\s+Name:\s+(?P<fqdn_name>[\S]+)$')
+        p1 = regex_engine.compile(r'^FQDN\s+Name:\s+(?P<fqdn_name>[\S]+)$')
 
         # 4.1.1.24                      IPv4       67/100       1
         # 2001:db8:4:1::1/64            IPv6       77/99        1
-        p2 = re.compile(r'^(?P<ip_address>[\S]+)+\s+(?P<type>[\S]+)\s+(?P<ttl>[\S]+)\s+((?P<matched_fqdn>[\S]+)$)')
+        p2 = regex_engine.compile(r'^(?P<ip_address>[\S]+)+\s+(?P<type>[\S]+)\s+(?P<ttl>[\S]+)\s+((?P<matched_fqdn>[\S]+)$)')
 
         for line in output.splitlines():
             line = line.strip()
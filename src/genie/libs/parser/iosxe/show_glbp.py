@@ -1,8 +1,8 @@
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Any
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -49,7 +49,7 @@ class ShowGlbpBrief(ShowGlbpBriefSchema):
         ret_dict = {}
 
         #Vl220       1    -   100 Standby  122.1.1.254     122.1.1.1       local
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'(?P<interface>\S+)\s+(?P<grp>\d+)\s+(?P<fwd>\S+)\s+(?P<pri>\S+)\s+(?P<state>\S+)\s+(?P<address>\S+)\s+(?P<active_router>\S+)\s+(?P<standby_router>\S+)')
 
         for line in out.splitlines():
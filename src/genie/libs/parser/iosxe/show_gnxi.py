@@ -4,11 +4,13 @@ IOSXE parsers for the following commands
     * 'show gnxi state'
     * 'show gnxi state detail'
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowGnxiStateSchema(MetaParser):
     """ Schema for:
@@ -32,7 +34,7 @@ class ShowGnxiState(ShowGnxiStateSchema):
 
         # Disabled         Down
         # Enabled          Up
-        p_full = re.compile(r"^(?P<state>Disabled|Enabled)\s*(?P<status>Down|Up)$")
+        p_full = regex_engine.compile(r"^(?P<state>Disabled|Enabled)\s*(?P<status>Down|Up)$")
 
         ret_dict = {}
         for line in output.splitlines():
@@ -121,63 +123,63 @@ class ShowGnxiStateDetail(ShowGnxiStateDetailSchema):
             output = self.device.execute(self.cli_command)
 
         # sections
-        p_settings = re.compile(r"^Settings$")
-        p_gnmi = re.compile(r"^GNMI$")
-        p_gnoi = re.compile(r"^GNOI$")
+        p_settings = regex_engine.compile(r"^Settings$")
+        p_gnmi = regex_engine.compile(r"^GNMI$")
+        p_gnoi = regex_engine.compile(r"^GNOI$")
 
         # subsections
-        p_grpc_section = re.compile(r"^gRPC Server$")
-        p_conf_section = re.compile(r"^Configuration service$")
-        p_telemetry_section = re.compile(r"^Telemetry service$")
-        p_cert_section = re.compile(r"^Cert Management service$")
-        p_os_section = re.compile(r"^OS Image service$")
-        p_reset_section = re.compile(r"^Factory Reset service$")
+        p_grpc_section = regex_engine.compile(r"^gRPC Server$")
+        p_conf_section = regex_engine.compile(r"^Configuration service$")
+        p_telemetry_section = regex_engine.compile(r"^Telemetry service$")
+        p_cert_section = regex_engine.compile(r"^Cert Management service$")
+        p_os_section = regex_engine.compile(r"^OS Image service$")
+        p_reset_section = regex_engine.compile(r"^Factory Reset service$")
 
         # Server: Enabled
         # Server: Disabled
-        p_server = re.compile(r"^Server: (?P<server>Disabled|Enabled)$")
+        p_server = regex_engine.compile(r"^Server: (?P<server>Disabled|Enabled)$")
 
         # Server port: 50052
-        p_server_port = re.compile(r"^Server port: (?P<server_port>\d+)$")
+        p_server_port = regex_engine.compile(r"^Server port: (?P<server_port>\d+)$")
 
         # Secure server: Enabled
         # Secure server: Disabled
-        p_secure_server = re.compile(r"^Secure server: (?P<secure_server>Disabled|Enabled)$")
+        p_secure_server = regex_engine.compile(r"^Secure server: (?P<secure_server>Disabled|Enabled)$")
 
         # Secure server port: 9399
-        p_secure_server_port = re.compile(r"^Secure server port: (?P<secure_server_port>\d+)$")
+        p_secure_server_port = regex_engine.compile(r"^Secure server port: (?P<secure_server_port>\d+)$")
 
         # Secure client authentication: Disabled
         # Secure client authentication: Enabled
-        p_secure_client_auth = re.compile(r"^Secure client authentication: "
-                                          r"(?P<secure_client_authentication>Disabled|Enabled)$")
+        p_secure_client_auth = regex_engine.compile(r"^Secure client authentication: "
+                                                    r"(?P<secure_client_authentication>Disabled|Enabled)$")
 
         # Secure trustpoint: Trustpoint_name_here
-        p_secure_tp = re.compile(r"^Secure trustpoint:( +)?(?P<secure_trustpoint>\S+)?$")
+        p_secure_tp = regex_engine.compile(r"^Secure trustpoint:( +)?(?P<secure_trustpoint>\S+)?$")
 
         # Secure client trustpoint: Trustpoint_name_here
-        p_secure_client_tp = re.compile(r"^Secure client trustpoint:( +)?(?P<secure_client_trustpoint>\S+)?$")
+        p_secure_client_tp = regex_engine.compile(r"^Secure client trustpoint:( +)?(?P<secure_client_trustpoint>\S+)?$")
 
         # Secure password authentication: Disabled
         # Secure password authentication: Enabled
-        p_secure_pwd_auth = re.compile(r"^Secure password authentication: "
-                                       r"(?P<secure_password_authentication>Disabled|Enabled)$")
+        p_secure_pwd_auth = regex_engine.compile(r"^Secure password authentication: "
+                                                 r"(?P<secure_password_authentication>Disabled|Enabled)$")
 
         # State: Provisioned
         # State: Default
-        p_bs_state = re.compile(r"^State: (?P<state>Provisioned|Default)$")
+        p_bs_state = regex_engine.compile(r"^State: (?P<state>Provisioned|Default)$")
 
         # Admin state: Enabled
         # Admin state: Disabled
-        p_admin_state = re.compile(r"^Admin state: (?P<admin_state>Disabled|Enabled)$")
+        p_admin_state = regex_engine.compile(r"^Admin state: (?P<admin_state>Disabled|Enabled)$")
 
         # Oper status: Up
         # Oper status: Down
-        p_oper_status = re.compile(r"^Oper status: (?P<oper_status>Down|Up)$")
+        p_oper_status = regex_engine.compile(r"^Oper status: (?P<oper_status>Down|Up)$")
 
         # Supported: Supported
         # Supported: Not supported on this platform
-        p_supported = re.compile(r"^Supported: (?P<supported>Not supported on this platform|Supported)$")
+        p_supported = regex_engine.compile(r"^Supported: (?P<supported>Not supported on this platform|Supported)$")
 
         ret_dict = {}
         current_section = None
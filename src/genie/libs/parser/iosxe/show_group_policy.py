@@ -1,7 +1,9 @@
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ==============================
 # Schema for:
 #  * 'show group-policy traffic-steering policy sgt'
@@ -55,67 +57,67 @@ class ShowGroupPolicyTrafficSteeringPolicy(ShowGroupPolicyTrafficSteeringPolicyS
         ret_dict = {}
 
         # SGT: 3053-01
-        p1 = re.compile(r"^SGT:\s*(?P<sgt>\d+)-\d+$")
+        p1 = regex_engine.compile(r"^SGT:\s*(?P<sgt>\d+)-\d+$")
 
         # SGT Policy Flag: 0x41400001
-        p2 = re.compile(r"^SGT Policy Flag:\s*(?P<sgt_policy_flag>0x[A-Fa-f\d]+)$")
+        p2 = regex_engine.compile(r"^SGT Policy Flag:\s*(?P<sgt_policy_flag>0x[A-Fa-f\d]+)$")
 
         # Source SGT: 3053-01, Destination SGT: 4003-01
-        p3 = re.compile(r"^Source SGT:\s*(?P<source_sgt>\d+)-\d+,"
-                         r"\s*Destination SGT:\s*"
-                         r"(?P<destination_sgt>\d+)-\d+$")
+        p3 = regex_engine.compile(r"^Source SGT:\s*(?P<source_sgt>\d+)-\d+,"
+                                   r"\s*Destination SGT:\s*"
+                                   r"(?P<destination_sgt>\d+)-\d+$")
 
         # steer_type = 80
-        p4 = re.compile(r"^steer_type\s*=\s*(?P<steer_type>\d+)$")
+        p4 = regex_engine.compile(r"^steer_type\s*=\s*(?P<steer_type>\d+)$")
 
         # steer_index = 1
-        p5 = re.compile(r"^steer_index\s*=\s*(?P<steer_index>\d+)$")
+        p5 = regex_engine.compile(r"^steer_index\s*=\s*(?P<steer_index>\d+)$")
 
         # name   = Contract2-03
-        p6 = re.compile(r"^name\s*=\s*(?P<contract_name>\w+)-\d+$")
+        p6 = regex_engine.compile(r"^name\s*=\s*(?P<contract_name>\w+)-\d+$")
 
         # IP protocol version = IPV4
-        p7 = re.compile(r"^IP protocol version\s*=\s*"
-                        r"(?P<ip_version>\w+)$")
+        p7 = regex_engine.compile(r"^IP protocol version\s*=\s*"
+                                  r"(?P<ip_version>\w+)$")
 
         # refcnt = 1
-        p8 = re.compile(r"^refcnt\s*=\s*(?P<refcnt>\d+)$")
+        p8 = regex_engine.compile(r"^refcnt\s*=\s*(?P<refcnt>\d+)$")
 
         # flag   = 0x41400000
-        p9 = re.compile(r"^flag\s*=\s*(?P<flag>0x[A-Fa-f\d]+)$")
+        p9 = regex_engine.compile(r"^flag\s*=\s*(?P<flag>0x[A-Fa-f\d]+)$")
 
         # stale  = FALSE
-        p10 = re.compile(r"^stale\s*=\s*(?P<stale>\w+)$")
+        p10 = regex_engine.compile(r"^stale\s*=\s*(?P<stale>\w+)$")
 
         # 1 redirect 6 any 16000 service service_INFRA_VN
-        p11 = re.compile(r"^(?P<s_no>\d+)\s*redirect\s*"
-                         r"(?P<protocol_number>\d+)\s*"
-                         r"(?P<source_port>\w+)\s*"
-                         r"(?P<destination_port>\w+)\s*service\s*"
-                         r"(?P<service_name>\w+)$")
+        p11 = regex_engine.compile(r"^(?P<s_no>\d+)\s*redirect\s*"
+                                   r"(?P<protocol_number>\d+)\s*"
+                                   r"(?P<source_port>\w+)\s*"
+                                   r"(?P<destination_port>\w+)\s*service\s*"
+                                   r"(?P<service_name>\w+)$")
 
         # Traffic-Steering Destination List: Not exist
-        p12 = re.compile(r"^Traffic-Steering Destination List:\s*"
-                         r"(?P<traffic_steering_destination_list>[\w ]+)$")
+        p12 = regex_engine.compile(r"^Traffic-Steering Destination List:\s*"
+                                   r"(?P<traffic_steering_destination_list>[\w ]+)$")
 
         # Traffic-Steering Multicast List: Not exist
-        p13 = re.compile(r"^Traffic-Steering Multicast List:\s*"
-                         r"(?P<traffic_steering_multicast_list>[\w ]+)$")
+        p13 = regex_engine.compile(r"^Traffic-Steering Multicast List:\s*"
+                                   r"(?P<traffic_steering_multicast_list>[\w ]+)$")
 
         # Traffic-Steering Policy Lifetime = 86400 secs
-        p14 = re.compile(r"^Traffic-Steering Policy Lifetime\s*=\s*"
-                         r"(?P<traffic_steering_policy_lifetime_secs>\d+)\s*secs$")
+        p14 = regex_engine.compile(r"^Traffic-Steering Policy Lifetime\s*=\s*"
+                                   r"(?P<traffic_steering_policy_lifetime_secs>\d+)\s*secs$")
 
         # Traffic-Steering Policy Last update time = 05:51:21 UTC Wed Sep 29 2021
-        p15 = re.compile(r"^Traffic-Steering Policy Last update time\s*=\s*"
-                         r"(?P<policy_last_update_time>[\d:]+\s+[\w ]+)$")
+        p15 = regex_engine.compile(r"^Traffic-Steering Policy Last update time\s*=\s*"
+                                   r"(?P<policy_last_update_time>[\d:]+\s+[\w ]+)$")
 
         # Policy expires in 0:23:58:12 (dd:hr:mm:sec)
-        p16 = re.compile(r"^Policy expires in\s*"
-                         r"(?P<policy_expires_in>[\d:]+)\s*\(dd:hr:mm:sec\)$")
+        p16 = regex_engine.compile(r"^Policy expires in\s*"
+                                   r"(?P<policy_expires_in>[\d:]+)\s*\(dd:hr:mm:sec\)$")
 
         # Policy refreshes in 0:23:58:12 (dd:hr:mm:sec)
-        p17 = re.compile(r"^Policy refreshes in\s*(?P<policy_refreshes_in>[\d:]+)\s*\(dd:hr:mm:sec\)$")
+        p17 = regex_engine.compile(r"^Policy refreshes in\s*(?P<policy_refreshes_in>[\d:]+)\s*\(dd:hr:mm:sec\)$")
 
         ace_dict = {}
         for line in output.splitlines():
@@ -342,58 +344,58 @@ class ShowGroupPolicyTrafficSteeringEntries(ShowGroupPolicyTrafficSteeringEntrie
         ret_dict = {}
 
         # Peer name                = Unknown-2057
-        p1 = re.compile(r"^Peer name\s*=\s*(?P<peer_name>\w+)-(?P<sgt>\d+)$")
+        p1 = regex_engine.compile(r"^Peer name\s*=\s*(?P<peer_name>\w+)-(?P<sgt>\d+)$")
 
         # Peer SGT                 = 2057-01
-        p2 = re.compile(r"^Peer SGT\s*=\s*(?P<peer_sgt>[\d-]+)$")
+        p2 = regex_engine.compile(r"^Peer SGT\s*=\s*(?P<peer_sgt>[\d-]+)$")
 
         # Entry State              = COMPLETE
-        p3 = re.compile(r"^Entry State\s*=\s*(?P<entry_state>\w+)$")
+        p3 = regex_engine.compile(r"^Entry State\s*=\s*(?P<entry_state>\w+)$")
 
         # Entry last refresh       = 20:04:10 UTC Sun Sep 26 2021
-        p4 = re.compile(r"^Entry last refresh\s*=\s*(?P<entry_last_refresh>[\w:]+)\s*[\w ]+$")
+        p4 = regex_engine.compile(r"^Entry last refresh\s*=\s*(?P<entry_last_refresh>[\w:]+)\s*[\w ]+$")
 
         # Requested_elements       = 0x00001001
-        p5 = re.compile(r"^Requested_elements\s*=\s*(?P<requested_elements>0x[A-Fa-d\d]+)$")
+        p5 = regex_engine.compile(r"^Requested_elements\s*=\s*(?P<requested_elements>0x[A-Fa-d\d]+)$")
 
         # Received_elements        = 0x00000880
-        p6 = re.compile(r"^Received_elements\s*=\s*(?P<received_elements>0x[A-Fa-d\d]+)$")
+        p6 = regex_engine.compile(r"^Received_elements\s*=\s*(?P<received_elements>0x[A-Fa-d\d]+)$")
 
         # Installed_elements        = 0x00000880
-        p7 = re.compile(r"^Installed_elements\s*=\s*(?P<installed_elements>0x[A-Fa-d\d]+)$")
+        p7 = regex_engine.compile(r"^Installed_elements\s*=\s*(?P<installed_elements>0x[A-Fa-d\d]+)$")
 
         # Received peer policy   (0x00000000), policy_flag = 0x00000000
-        p8 = re.compile(r"^Received peer policy\s*\((?P<peer_policy>0x[A-Fa-d\d]+)\),\s*policy_flag\s*=\s*(?P<policy_flag>0x[A-Fa-d\d]+)$")
+        p8 = regex_engine.compile(r"^Received peer policy\s*\((?P<peer_policy>0x[A-Fa-d\d]+)\),\s*policy_flag\s*=\s*(?P<policy_flag>0x[A-Fa-d\d]+)$")
 
         # Installed peer policy (0x7F561AFC4D80), policy_flag = 0x00400001
-        p9 = re.compile(r"^Installed peer policy\s*\((?P<peer_policy>0x[A-Fa-d\d]+)\),\s*policy_flag\s*=\s*(?P<policy_flag>0x[A-Fa-d\d]+)$")
+        p9 = regex_engine.compile(r"^Installed peer policy\s*\((?P<peer_policy>0x[A-Fa-d\d]+)\),\s*policy_flag\s*=\s*(?P<policy_flag>0x[A-Fa-d\d]+)$")
 
         # Staled peer policy (0x00000000), policy_flag = 0x00000000
-        p10 = re.compile(r"^Staled peer policy\s*\((?P<peer_policy>0x[A-Fa-d\d]+)\),\s*policy_flag\s*=\s*(?P<policy_flag>0x[A-Fa-d\d]+)$")
+        p10 = regex_engine.compile(r"^Staled peer policy\s*\((?P<peer_policy>0x[A-Fa-d\d]+)\),\s*policy_flag\s*=\s*(?P<policy_flag>0x[A-Fa-d\d]+)$")
 
         # Installed sgt policy  (0x7F561AFC6F10), policy_flag = 0x41400001
-        p11 = re.compile(r"^Installed sgt policy  \s*\((?P<peer_policy>0x[A-Fa-d\d]+)\),\s*policy_flag\s*=\s*(?P<policy_flag>0x[A-Fa-d\d]+)$")
+        p11 = regex_engine.compile(r"^Installed sgt policy  \s*\((?P<peer_policy>0x[A-Fa-d\d]+)\),\s*policy_flag\s*=\s*(?P<policy_flag>0x[A-Fa-d\d]+)$")
 
         # SGT  policy last refresh = 20:04:10 UTC Sun Sep 26 2021
-        p12 = re.compile(r"^SGT  policy last refresh\s*=\s*(?P<sgt_policy_last_refresh>[\w: ]+)$")
+        p12 = regex_engine.compile(r"^SGT  policy last refresh\s*=\s*(?P<sgt_policy_last_refresh>[\w: ]+)$")
 
         # SGT policy refresh time  = 86400
-        p13 = re.compile(r"^SGT policy refresh time\s*=\s*(?P<sgt_policy_refresh_time_secs>\d+)$")
+        p13 = regex_engine.compile(r"^SGT policy refresh time\s*=\s*(?P<sgt_policy_refresh_time_secs>\d+)$")
 
         # Policy expires in   0:23:51:50 (dd:hr:mm:sec)
-        p14 = re.compile(r"^Policy expires in\s*(?P<policy_expires_in>[\w:]+)\s*\([\w:]+\)$")
+        p14 = regex_engine.compile(r"^Policy expires in\s*(?P<policy_expires_in>[\w:]+)\s*\([\w:]+\)$")
 
         # Policy refreshes in 0:23:51:50 (dd:hr:mm:sec)
-        p15 = re.compile(r"^Policy refreshes in\s*(?P<policy_refreshes_in>[\w:]+)\s*\([\w:]+\)$")
+        p15 = regex_engine.compile(r"^Policy refreshes in\s*(?P<policy_refreshes_in>[\w:]+)\s*\([\w:]+\)$")
 
         # Refresh_timer            = not running
-        p16 = re.compile(r"^Refresh_timer\s*=\s*(?P<refresh_timer>[\w ]+)$")
+        p16 = regex_engine.compile(r"^Refresh_timer\s*=\s*(?P<refresh_timer>[\w ]+)$")
 
         # Retry_timer                  = not running
-        p17 = re.compile(r"^Retry_timer\s*=\s*(?P<retry_timer>[\w ]+)$")
+        p17 = regex_engine.compile(r"^Retry_timer\s*=\s*(?P<retry_timer>[\w ]+)$")
 
         # Entry status                 = UNKNOWN
-        p18 = re.compile(r"^Entry status\s*=\s*(?P<entry_status>\w+)$")
+        p18 = regex_engine.compile(r"^Entry status\s*=\s*(?P<entry_status>\w+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -594,7 +596,7 @@ class ShowGroupPolicyTrafficSteeringCounters(ShowGroupPolicyTrafficSteeringCount
         ret_dict = {}
 
         # 2057            3003                 0
-        p1 = re.compile(r'^(?P<sgt>\d+)\s+(?P<dgt>\d+)\s+(?P<count>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<sgt>\d+)\s+(?P<dgt>\d+)\s+(?P<count>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -648,7 +650,7 @@ class ShowGroupPolicyTrafficSteeringPermissions(ShowGroupPolicyTrafficSteeringPe
         ret_dict = {}
 
         # 2057              3003            Contract1-01
-        p1 = re.compile(r'^(?P<sgt>\d+)\s+(?P<dgt>\d+)\s+(?P<policy>[\w-]+)$')
+        p1 = regex_engine.compile(r'^(?P<sgt>\d+)\s+(?P<dgt>\d+)\s+(?P<policy>[\w-]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -9,14 +9,12 @@ IOSXE parsers for the following show commands:
     * hw-module beacon slot {slot_num} status
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -59,22 +57,22 @@ class ShowHwModuleStatus(ShowHwModuleStatusSchema):
         else:
             out = output
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             # The Transceiver in slot 2 subslot 1 port 1 is disabled.
             r"The\s+Transceiver\s+in\s+slot\s(?P<slot_id>\d+)"
             r"\s+subslot\s+(?P<subslot_id>\d+)"
             r"\s+port\s+(?P<port_id>\d+)\s+is\s+"
             r"(?P<status>(enabled|disabled))")
         #   Module temperature                        = +28.625 C
-        p2 = re.compile(r"\s+(?P<module_temperature>\S+)\s+C")
+        p2 = regex_engine.compile(r"\s+(?P<module_temperature>\S+)\s+C")
         #   Transceiver Tx supply voltage             = 3252.5 mVolts
-        p3 = re.compile(r"\s+(?P<supply_voltage_mVolts>\d+\.\d+)")
+        p3 = regex_engine.compile(r"\s+(?P<supply_voltage_mVolts>\d+\.\d+)")
         #   Transceiver Tx bias current               = 6706 uAmps
-        p4 = re.compile(r"\s+(?P<bias_current_uAmps>\d+)\s+uAmps")
+        p4 = regex_engine.compile(r"\s+(?P<bias_current_uAmps>\d+)\s+uAmps")
         #   Transceiver Tx power                      = -2.7 dBm
-        p5 = re.compile(r"\s+(?P<tx_power_dBm>\S+)\s+dBm")
+        p5 = regex_engine.compile(r"\s+(?P<tx_power_dBm>\S+)\s+dBm")
         #   Transceiver Rx optical power              = -2.1 dBm
-        p6 = re.compile(r"\s+(?P<optical_power_dBm>\S+)\s+dBm")
+        p6 = regex_engine.compile(r"\s+(?P<optical_power_dBm>\S+)\s+dBm")
 
         # initial variables
         transceiver_dict = {}
@@ -207,82 +205,82 @@ class ShowHardwareLed(ShowHardwareLedSchema):
         root_dict = ret_dict
 
         # SWITCH: 1
-        p1 = re.compile(r'^SWITCH:\s+(?P<switch_num>\d+)$')
+        p1 = regex_engine.compile(r'^SWITCH:\s+(?P<switch_num>\d+)$')
 
         # SYSTEM: GREEN
-        p2 = re.compile(r'^SYSTEM:\s+(?P<system>\w+)$')
+        p2 = regex_engine.compile(r'^SYSTEM:\s+(?P<system>\w+)$')
 
         # BEACON: OFF
-        p3 = re.compile(r'^BEACON:\s+(?P<beacon>\w+)$')
+        p3 = regex_engine.compile(r'^BEACON:\s+(?P<beacon>\w+)$')
 
         # PORT STATUS: (124) Hu1/0/1:GREEN Hu1/0/2:OFF Hu1/0/3:GREEN Hu1/0/4:OFF Hu1/0/5:OFF Hu1/0/6:GREEN Hu1/0/7:OFF Hu1/0/8:OFF Hu1/0/9:OFF Hu1/0/10:GREEN Hu1/0/11:GREEN Hu1/0/12:GREEN Hu1/0/13:GREEN Hu1/0/14:GREEN Fou1/0/15:GREEN Fou1/0/16:GREEN Fou1/0/17:GREEN Fou1/0/18:GREEN Fou1/0/19:GREEN Fou1/0/20:GREEN Fou1/0/21:GREEN Fou1/0/22:GREEN Hu1/0/23:GREEN Hu1/0/24:GREEN Hu1/0/25:OFF Hu1/0/26:GREEN Hu1/0/27:GREEN Hu1/0/28:GREEN Hu1/0/29:GREEN Hu1/0/30:GREEN Hu1/0/31:OFF Hu1/0/32:GREEN Hu1/0/33:GREEN Hu1/0/34:GREEN Hu1/0/35:GREEN Hu1/0/36:GREEN
-        p4 = re.compile(r'^PORT STATUS:\s+\S+\s+(?P<led_ports>((\S+:\w+\s*))+)$')
+        p4 = regex_engine.compile(r'^PORT STATUS:\s+\S+\s+(?P<led_ports>((\S+:\w+\s*))+)$')
         
         #STATUS: (28) Gi1/0/1:FLASH_GREEN Gi1/0/2:BLACK Gi1/0/3:BLACK Gi1/0/4:BLACK Gi1/0/5:FLASH_GREEN Gi1/0/6:FLASH_GREEN Gi1/0/7:FLASH_GREEN Gi1/0/8:FLASH_GREEN Gi1/0/9:BLACK Gi1/0/10:FLASH_GREEN Gi1/0/11:FLASH_GREEN Gi1/0/12:BLACK Gi1/0/13:BLACK Gi1/0/14:BLACK Gi1/0/15:BLACK Gi1/0/16:BLACK Gi1/0/17:BLACK Gi1/0/18:BLACK Gi1/0/19:BLACK Gi1/0/20:BLACK Gi1/0/21:BLACK Gi1/0/22:BLACK Gi1/0/23:FLASH_GREEN Gi1/0/24:FLASH_GREEN Gi1/0/25:BLACK Gi1/0/26:BLACK Gi1/0/27:BLACK Gi1/0/28:BLACK
-        p4_1 = re.compile(r'^STATUS:\s+\((?P<port_nums_in_status>\d+)\)+\s+(?P<led_ports>((\S+:[\w-]+\s*))+)$')
+        p4_1 = regex_engine.compile(r'^STATUS:\s+\((?P<port_nums_in_status>\d+)\)+\s+(?P<led_ports>((\S+:[\w-]+\s*))+)$')
 
         # RJ45 CONSOLE: GREEN
-        p5 = re.compile(r'^RJ45 CONSOLE:\s+(?P<rj45_console>\w+)$')
+        p5 = regex_engine.compile(r'^RJ45 CONSOLE:\s+(?P<rj45_console>\w+)$')
 
         # FANTRAY 1 STATUS: GREEN
-        p6 = re.compile(r'^FANTRAY\s+(?P<fantray_num>\d+)\s+STATUS:\s+(?P<fantray_status>\w+)$')
+        p6 = regex_engine.compile(r'^FANTRAY\s+(?P<fantray_num>\d+)\s+STATUS:\s+(?P<fantray_status>\w+)$')
 
         # POWER-SUPPLY 1 BEACON: OFF
-        p7 = re.compile(r'^POWER-SUPPLY\s+(?P<power_supply_num>\d+)\s+BEACON:\s+(?P<power_supply_status>\w+)$')
+        p7 = regex_engine.compile(r'^POWER-SUPPLY\s+(?P<power_supply_num>\d+)\s+BEACON:\s+(?P<power_supply_status>\w+)$')
         
         #DC-A: GREEN
-        p7_1 = re.compile(r'^DC-A:\s+(?P<dc_a>\w+)$')
+        p7_1 = regex_engine.compile(r'^DC-A:\s+(?P<dc_a>\w+)$')
 
         #DC-B: BLACK
-        p7_2 = re.compile(r'^DC-B:\s+(?P<dc_b>\w+)$')
+        p7_2 = regex_engine.compile(r'^DC-B:\s+(?P<dc_b>\w+)$')
 
         # SYSTEM PSU: AMBER
-        p8 = re.compile(r'^SYSTEM PSU:\s+(?P<system_psu>\w+)$')
+        p8 = regex_engine.compile(r'^SYSTEM PSU:\s+(?P<system_psu>\w+)$')
 
         # SYSTEM FAN: GREEN
-        p9 = re.compile(r'^SYSTEM FAN:\s+(?P<system_fan>\w+)$')
+        p9 = regex_engine.compile(r'^SYSTEM FAN:\s+(?P<system_fan>\w+)$')
 
         #EXPRESS-SETUP: BLACK
-        p10 = re.compile(r'^EXPRESS-SETUP:\s+(?P<express_setup>\w+)$')
+        p10 = regex_engine.compile(r'^EXPRESS-SETUP:\s+(?P<express_setup>\w+)$')
 
         # ALARM-OUT: GREEN
         # ALARM-IN1: GREEN
         # ALARM-IN2: GREEN
-        p11 = re.compile(r'^(?P<alarm>ALARM\-\w+):\s+(?P<alarm_color>\w+)$')
+        p11 = regex_engine.compile(r'^(?P<alarm>ALARM\-\w+):\s+(?P<alarm_color>\w+)$')
 
         # Current Mode: STATUS
-        p12 = re.compile(r'^Current Mode:\s+(?P<status>\w+)$')
+        p12 = regex_engine.compile(r'^Current Mode:\s+(?P<status>\w+)$')
 
         # LED Auto off: Disabled
-        p12_1 = re.compile(r'^LED Auto off:\s+(?P<auto_off>\w+)$') 
+        p12_1 = regex_engine.compile(r'^LED Auto off:\s+(?P<auto_off>\w+)$') 
 
         # MASTER: GREEN
-        p13 = re.compile(r'^MASTER:\s+(?P<master>\w+)$')
+        p13 = regex_engine.compile(r'^MASTER:\s+(?P<master>\w+)$')
 
         # DUPLEX: (65) Tw1/0/1:BLACK Tw1/0/2:BLACK Tw1/0/3:BLACK 
         # Tw1/0/4:GREEN Tw1/0/5:BLACK Tw1/0/6:BLACK Tw1/0/7:BLACK
-        p14 = re.compile(r'^DUPLEX:\s+\S+\s+(?P<duplex>((\S+:\S+\s*))+)$')
+        p14 = regex_engine.compile(r'^DUPLEX:\s+\S+\s+(?P<duplex>((\S+:\S+\s*))+)$')
 
         # SPEED: (65) Tw1/0/1:BLACK Tw1/0/2:BLACK Tw1/0/3:BLACK 
         # Tw1/0/4:BLINK_GREEN Tw1/0/5:BLACK Tw1/0/6:BLACK Tw1/0/7:BLACK
-        p15 = re.compile(r'^SPEED:\s+\S+\s+(?P<speed>((\S+:\S+\s*))+)$')
+        p15 = regex_engine.compile(r'^SPEED:\s+\S+\s+(?P<speed>((\S+:\S+\s*))+)$')
 
         # STACK: (65) Tw1/0/1:FLASH_GREEN Tw1/0/2:BLACK Tw1/0/3:BLACK
         # Tw1/0/4:BLACK Tw1/0/5:BLACK Tw1/0/6:BLACK Tw1/0/7:BLACK Tw1/0/8:BLACK
-        p16 = re.compile(r'^STACK:\s+\S+\s+(?P<stack_port>((\S+:\S+\s*))+)$')
+        p16 = regex_engine.compile(r'^STACK:\s+\S+\s+(?P<stack_port>((\S+:\S+\s*))+)$')
 
         # POE: (65) Tw1/0/1:BLACK Tw1/0/2:BLACK Tw1/0/3:BLACK Tw1/0/4:BLACK
         # Tw1/0/5:BLACK Tw1/0/6:BLACK Tw1/0/7:BLACK Tw1/0/8:BLACK Tw1/0/9:BLACK
-        p17 = re.compile(r'^POE:\s+\S+\s+(?P<poe>((\S+:\S+\s*))+)$')
+        p17 = regex_engine.compile(r'^POE:\s+\S+\s+(?P<poe>((\S+:\S+\s*))+)$')
 
         # STACK POWER: BLACK
-        p18 = re.compile(r'^STACK POWER:\s+(?P<stack_power>\w+)$')
+        p18 = regex_engine.compile(r'^STACK POWER:\s+(?P<stack_power>\w+)$')
 
         # XPS: BLACK
-        p19 = re.compile(r'^XPS:\s+(?P<xps>\w+)$')
+        p19 = regex_engine.compile(r'^XPS:\s+(?P<xps>\w+)$')
 
         # USB CONSOLE: BLACK
-        p20 = re.compile(r'^USB CONSOLE:\s+(?P<usb_console>\w+)$')
+        p20 = regex_engine.compile(r'^USB CONSOLE:\s+(?P<usb_console>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -516,7 +514,7 @@ class ShowHardwareLedPort(ShowHardwareLedPortSchema):
         ret_dict = {}
         
         # GREEN
-        p1 = re.compile(r'^(?P<port_status>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<port_status>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -567,11 +565,11 @@ class ShowHwModuleSlotPortGroupMode(ShowHwModuleSlotPortGroupModeSchema):
         ret_dict = {}
 
         #   2         1              Hu2/0/25            inactive
-        p1 = re.compile(r'^(?P<slot>\d+) +(?P<port_group>\d+) +(?P<port>\S+) +(?P<mode>(inactive|400G|100G))$')
+        p1 = regex_engine.compile(r'^(?P<slot>\d+) +(?P<port_group>\d+) +(?P<port>\S+) +(?P<mode>(inactive|400G|100G))$')
         #                             Hu2/0/26            inactive
         #                             Hu2/0/27            400G
         #                             Hu2/0/28            inactive
-        p2 = re.compile(r'^(?P<port>\S+) +(?P<mode>(inactive|400G|100G))$')
+        p2 = regex_engine.compile(r'^(?P<port>\S+) +(?P<mode>(inactive|400G|100G))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -622,7 +620,7 @@ class ShowHwModuleUsbflash1Security(ShowHwModuleUsbflash1SecuritySchema):
         # 1                    USB Not Present
         # 2                    USB Not Present
         # 3                    USB Not Present
-        p1 = re.compile(r'^(?P<switch>\d+)\s+(?P<auth_status>.+)$')
+        p1 = regex_engine.compile(r'^(?P<switch>\d+)\s+(?P<auth_status>.+)$')
 
         ret_dict = dict()
 
@@ -667,16 +665,16 @@ class ShowHwModuleSecurityLockStatus(ShowHwModuleSecurityLockStatusSchema):
         ret_dict = {}
 
         # Drive Supported: Yes, Locking Enabled: Yes, Locked: No, Partitioned: Yes, TAM Object: Yes
-        p1 = re.compile(
-                r"^Drive Supported:\s+(?P<drive_support>\w+),\s+"
-                r"Locking Enabled:\s+(?P<lock_enabled>\w+),\s+"
-                r"Locked:\s+(?P<lock_status>\w+),\s+"
-                r"Partitioned:\s+(?P<partitioned>\w+),\s+"
-                r"TAM\s+Object:\s+(?P<tam_object>\w+)$")
+        p1 = regex_engine.compile(
+                          r"^Drive Supported:\s+(?P<drive_support>\w+),\s+"
+                          r"Locking Enabled:\s+(?P<lock_enabled>\w+),\s+"
+                          r"Locked:\s+(?P<lock_status>\w+),\s+"
+                          r"Partitioned:\s+(?P<partitioned>\w+),\s+"
+                          r"TAM\s+Object:\s+(?P<tam_object>\w+)$")
 
         # Any error message with spaces like
         # DEVICE NOT SUPPORTED
-        p2 = re.compile(r"^[a-zA-Z0-9_ ]+$")
+        p2 = regex_engine.compile(r"^[a-zA-Z0-9_ ]+$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -716,10 +714,10 @@ class ShowHardwareLedPortMode(ShowHardwareLedPortModeSchema):
             output = self.device.execute(self.cli_command.format(port=port, mode=mode))
 
         # Current Mode: STATUS
-        p1 = re.compile(r'^Current Mode: (?P<current_mode>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^Current Mode: (?P<current_mode>[\w\s]+)$')
 
         # BLINK_GREEN
-        p2 = re.compile(r'^(?P<status>\w+)$')
+        p2 = regex_engine.compile(r'^(?P<status>\w+)$')
 
         ret_dict = {}
 
@@ -759,7 +757,7 @@ class HardwareModuleBeaconFanTrayStatus(HardwareModuleBeaconFanTrayStatusSchema)
             output = self.device.execute(self.cli_command)
 
         # Fantray Beacon LED: OFF
-        p1 = re.compile(r'^Fantray Beacon LED: (?P<fantray_beacon_led>\w+)$')
+        p1 = regex_engine.compile(r'^Fantray Beacon LED: (?P<fantray_beacon_led>\w+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -796,7 +794,7 @@ class HardwareModuleBeaconSlotStatus(HardwareModuleBeaconSlotStatusSchema):
 
         # BLACK
         # SOLID BLUE
-        p1 = re.compile(r'^(?P<slot_status>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<slot_status>[\w\s]+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -15,7 +15,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          And, \
                                          Default, \
                                          Use
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # ==========================
@@ -125,79 +127,79 @@ class ShowIdprom(ShowIdpromSchema):
         # possible regex patterns below:
 
         # Switch Number: 1 
-        pSwitch = re.compile(r'^Switch +Number: +(?P<switch>\S[\S ]*)$')
+        pSwitch = regex_engine.compile(r'^Switch +Number: +(?P<switch>\S[\S ]*)$')
 
         # Module 1 Idprom:
-        pModule = re.compile(r'^Module +(?P<number>\S[\S ]*) +Idprom:$')
+        pModule = regex_engine.compile(r'^Module +(?P<number>\S[\S ]*) +Idprom:$')
 
         # Power Supply 0 Idprom:
-        pPowerSupply = re.compile(r'^Power +Supply +(?P<number>\S[\S ]*) +Idprom:$')
+        pPowerSupply = regex_engine.compile(r'^Power +Supply +(?P<number>\S[\S ]*) +Idprom:$')
 
         # Fantray 0 Idprom:
-        pFantray = re.compile(r'^Fantray +(?P<number>\S[\S ]*) +Idprom:$')
+        pFantray = regex_engine.compile(r'^Fantray +(?P<number>\S[\S ]*) +Idprom:$')
 
         # Controller Type          : 4371
-        pControllerType = re.compile(r'^Controller +Type *: +(?P<controller_type>\S[\S ]*)$')
+        pControllerType = regex_engine.compile(r'^Controller +Type *: +(?P<controller_type>\S[\S ]*)$')
 
         # Hardware Revision        : 0.2
-        pHardwareRevision = re.compile(r'^Hardware +Revision *: +(?P<hardware_revision>\S[\S ]*)$')
+        pHardwareRevision = regex_engine.compile(r'^Hardware +Revision *: +(?P<hardware_revision>\S[\S ]*)$')
 
         # Top Assy. Part Number    : 68-103001-01
-        pTopAssyPartNumber = re.compile(r'^Top +Assy\. +Part +Number *: +(?P<top_assy_part_number>\S[\S ]*)$')
+        pTopAssyPartNumber = regex_engine.compile(r'^Top +Assy\. +Part +Number *: +(?P<top_assy_part_number>\S[\S ]*)$')
 
         # Top Assy. Revision       : 10  
-        pTopAssyRevision = re.compile(r'^Top +Assy\. +Revision *: +(?P<top_assy_revision>\S[\S ]*)$')
+        pTopAssyRevision = regex_engine.compile(r'^Top +Assy\. +Revision *: +(?P<top_assy_revision>\S[\S ]*)$')
 
         # PCB Part Number          : 73-19902-02
-        pPcbPartNumber = re.compile(r'^PCB +Part +Number *: +(?P<pcb_part_number>\S[\S ]*)$')
+        pPcbPartNumber = regex_engine.compile(r'^PCB +Part +Number *: +(?P<pcb_part_number>\S[\S ]*)$')
 
         # Board Revision           : 14   
-        pBoardRevision = re.compile(r'^Board +Revision *: +(?P<board_revision>\S[\S ]*)$')
+        pBoardRevision = regex_engine.compile(r'^Board +Revision *: +(?P<board_revision>\S[\S ]*)$')
 
         # Deviation Number         : 0
-        pDeviationNumber = re.compile(r'^Deviation +Number *: +(?P<deviation_number>\S[\S ]*)$')
+        pDeviationNumber = regex_engine.compile(r'^Deviation +Number *: +(?P<deviation_number>\S[\S ]*)$')
 
         # PCB Serial Number        : FDO25130VES
-        pPcbSerialNumber = re.compile(r'^PCB +Serial +Number *: +(?P<pcb_serial_number>\S[\S ]*)$')
+        pPcbSerialNumber = regex_engine.compile(r'^PCB +Serial +Number *: +(?P<pcb_serial_number>\S[\S ]*)$')
 
         # RMA Test History         : 00
-        pRmaTestHistory = re.compile(r'^RMA +Test +History *: +(?P<rma_test_history>\S[\S ]*)$')
+        pRmaTestHistory = regex_engine.compile(r'^RMA +Test +History *: +(?P<rma_test_history>\S[\S ]*)$')
 
         # RMA Number               : 0-0-0-0
-        pRmaNumber = re.compile(r'^RMA +Number *: +(?P<rma_number>\S[\S ]*)$')
+        pRmaNumber = regex_engine.compile(r'^RMA +Number *: +(?P<rma_number>\S[\S ]*)$')
 
         # RMA History              : 00
-        pRmaHistory = re.compile(r'^RMA +History *: +(?P<rma_history>\S[\S ]*)$')
+        pRmaHistory = regex_engine.compile(r'^RMA +History *: +(?P<rma_history>\S[\S ]*)$')
 
         # CLEI Code                : TBD 
-        pCleiCode = re.compile(r'^CLEI +Code *: +(?P<clei_code>\S[\S ]*)$')
+        pCleiCode = regex_engine.compile(r'^CLEI +Code *: +(?P<clei_code>\S[\S ]*)$')
 
         # Product Identifier (PID) : C9500X-28C8D
-        pPid = re.compile(r'^Product +Identifier +\(PID\) *: +(?P<pid>\S[\S ]*)$')
+        pPid = regex_engine.compile(r'^Product +Identifier +\(PID\) *: +(?P<pid>\S[\S ]*)$')
 
         # Version Identifier (VID) : V00
-        pVid = re.compile(r'^Version +Identifier +\(VID\) *: +(?P<vid>\S[\S ]*)$')
+        pVid = regex_engine.compile(r'^Version +Identifier +\(VID\) *: +(?P<vid>\S[\S ]*)$')
 
         # Manufacturing Test Data  : 00 00 00 00 00 00 00 00 
-        pManufacturingTestData = re.compile(r'^Manufacturing +Test +Data *: +(?P<manufacturing_test_data>\S[\S ]*)$')
+        pManufacturingTestData = regex_engine.compile(r'^Manufacturing +Test +Data *: +(?P<manufacturing_test_data>\S[\S ]*)$')
 
         # Base MAC Address         : 28 AF FD BE 94 00  
-        pBaseMacAddress = re.compile(r'^Base +MAC +Address *: +(?P<base_mac_address>\S[\S ]*)$')
+        pBaseMacAddress = regex_engine.compile(r'^Base +MAC +Address *: +(?P<base_mac_address>\S[\S ]*)$')
 
         # Environment Monitor Data : 06 00 00 00 0C 30 C3 00  
-        pEnvironmentMonitorData = re.compile(r'^Environment +Monitor +Data *: +(?P<environment_monitor_data>\S[\S ]*)$')
+        pEnvironmentMonitorData = regex_engine.compile(r'^Environment +Monitor +Data *: +(?P<environment_monitor_data>\S[\S ]*)$')
 
         # Max Power Requirement    : 195 Watts
-        pMaxPowerRequirementWatts = re.compile(r'^Max +Power +Requirement *: +(?P<max_power_requirement_watts>\d+) +Watts$')
+        pMaxPowerRequirementWatts = regex_engine.compile(r'^Max +Power +Requirement *: +(?P<max_power_requirement_watts>\d+) +Watts$')
 
         # Typical Power Requirement: 195 Watt
-        pTypicalPowerRequirementWatts = re.compile(r'^Typical +Power +Requirement *: +(?P<typical_power_requirement_watts>\d+) +Watts$')
+        pTypicalPowerRequirementWatts = regex_engine.compile(r'^Typical +Power +Requirement *: +(?P<typical_power_requirement_watts>\d+) +Watts$')
 
         # Field Diagnostics Data   : 00 00 00 00 00 00 00 00 
-        pFieldDiagnosticsData = re.compile(r'^Field +Diagnostics +Data +: +(?P<field_diagnostics_data>\S[\S ]*)$')
+        pFieldDiagnosticsData = regex_engine.compile(r'^Field +Diagnostics +Data +: +(?P<field_diagnostics_data>\S[\S ]*)$')
 
         # Max Power Output         : 1500 Watts
-        pMaxPowerOutputWatts = re.compile(r'^Max +Power +Output *: +(?P<max_power_output_watts>\d*) +Watts$')
+        pMaxPowerOutputWatts = regex_engine.compile(r'^Max +Power +Output *: +(?P<max_power_output_watts>\d*) +Watts$')
 
         # Output parsing starts now:
 
@@ -455,55 +457,55 @@ class ShowIdpromInterface(ShowIdpromInterfaceSchema):
         ret_dict = {}
         
         # IDPROM for transceiver
-        p1 = re.compile(r'^(?P<idprom_for_transceiver>IDPROM for transceiver)')
+        p1 = regex_engine.compile(r'^(?P<idprom_for_transceiver>IDPROM for transceiver)')
         
         # Description         = QSFP28 optics (type 134)
-        p2 = re.compile(r'^Description\s+=\s+(?P<description>.*)$')
+        p2 = regex_engine.compile(r'^Description\s+=\s+(?P<description>.*)$')
 
         # Transceiver Ty     = QSFP 100GE CU1M (464)
-        p3 = re.compile(r'^Transceiver Type:\s+=\s+(?P<transceiver_type>.*)$')
+        p3 = regex_engine.compile(r'^Transceiver Type:\s+=\s+(?P<transceiver_type>.*)$')
 
         # Product Identifier (PID)   = QSFP-100G-CU1M
-        p4 = re.compile(r'^Product Identifier\s+\(PID\)\s+=\s+(?P<product_identifier>.*)$')
+        p4 = regex_engine.compile(r'^Product Identifier\s+\(PID\)\s+=\s+(?P<product_identifier>.*)$')
  
         # Vendor Revision            = A
         # Vendor Revision            = 1.0
-        p5 = re.compile(r'^Vendor Revision\s+=\s+(?P<vendor_revision>[\w.]+)$')
+        p5 = regex_engine.compile(r'^Vendor Revision\s+=\s+(?P<vendor_revision>[\w.]+)$')
 
         # Serial Number (SN)         = APF22340870-A
-        p6 = re.compile(r'^Serial Number\s+\(SN\)\s+=\s+(?P<serial_number>[\w\S]+)$')
+        p6 = regex_engine.compile(r'^Serial Number\s+\(SN\)\s+=\s+(?P<serial_number>[\w\S]+)$')
         
         # Vendor Name                = CISCO-AMPHENOL
-        p7 = re.compile(r'^Vendor Name\s+=\s+(?P<vendor_name>[\w\S]+)$')
+        p7 = regex_engine.compile(r'^Vendor Name\s+=\s+(?P<vendor_name>[\w\S]+)$')
 
         # Vendor OUI (IEEE company ID)     = 78.A7.14 (7907092)
-        p8 = re.compile(r'^Vendor OUI\s+\(IEEE company ID\)\s+=\s+(?P<vendor_oui>.*)$')
+        p8 = regex_engine.compile(r'^Vendor OUI\s+\(IEEE company ID\)\s+=\s+(?P<vendor_oui>.*)$')
         
         # CLEI code      = CMPQACECAA
-        p9 = re.compile(r'^CLEI code\s+=\s+(?P<clei_code>[\w]+)$')
+        p9 = regex_engine.compile(r'^CLEI code\s+=\s+(?P<clei_code>[\w]+)$')
     
         # Cisco part number      = 37-1666-01
-        p10 = re.compile(r'^Cisco part number\s+=\s+(?P<cisco_part_number>[\d\S]+)$')
+        p10 = regex_engine.compile(r'^Cisco part number\s+=\s+(?P<cisco_part_number>[\d\S]+)$')
 
         # Device State      = Enabled.
-        p11 = re.compile(r'^Device State\s+=\s+(?P<device_state>[\w\S]+)$')
+        p11 = regex_engine.compile(r'^Device State\s+=\s+(?P<device_state>[\w\S]+)$')
         
         # Date code (yy/mm/dd)    = 18/08/25
-        p12 = re.compile(r'^Date code\s+\S+\s+=\s+(?P<date_code>[\d\S]+)$')
+        p12 = regex_engine.compile(r'^Date code\s+\S+\s+=\s+(?P<date_code>[\d\S]+)$')
 
         # Connector type      = No separable connector
         # Connector type      = LC.
-        p13 = re.compile(r'^Connector type\s+=\s+(?P<connector_type>[\w\s.]+)$')
+        p13 = regex_engine.compile(r'^Connector type\s+=\s+(?P<connector_type>[\w\s.]+)$')
 
         # Encoding           = 64B66B
         # Encoding           = 8B10B (1)
-        p14= re.compile(r'^Encoding\s+=\s+(?P<encoding>.*)$')
+        p14= regex_engine.compile(r'^Encoding\s+=\s+(?P<encoding>.*)$')
         
         # Nominal bitrate per channel    = 25GE (25500 Mbits/s)
-        p15 = re.compile(r'^Nominal bitrate per channel\s+=\s+(?P<nominal_bitrate_per_channel>.*)$')
+        p15 = regex_engine.compile(r'^Nominal bitrate per channel\s+=\s+(?P<nominal_bitrate_per_channel>.*)$')
 
         # Vendor part number                        = AFBR-2CAR10Z-CS1
-        p16 = re.compile(r'^Vendor part number\s+=\s+(?P<vendor_part_number>\S+)$')
+        p16 = regex_engine.compile(r'^Vendor part number\s+=\s+(?P<vendor_part_number>\S+)$')
 
         for line in output.splitlines():
             line=line.strip()
@@ -659,11 +661,11 @@ class ShowIdpromTan(ShowIdpromTanSchema):
             output = self.device.execute(cmd)
 
         # Switch 01 ---------
-        p1 = re.compile(r"^Switch\s+(?P<switch_num>\d+)$")
+        p1 = regex_engine.compile(r"^Switch\s+(?P<switch_num>\d+)$")
         # Top Assy. Part Number           : 68-101195-01
-        p2 = re.compile(r"^Top\s+Assy.\s+Part\s+Number\s+:\s+(?P<part_num>\d+-\d+-\d+)$")
+        p2 = regex_engine.compile(r"^Top\s+Assy.\s+Part\s+Number\s+:\s+(?P<part_num>\d+-\d+-\d+)$")
         # Top Assy. Revision Number       : 31
-        p3 = re.compile(r"^Top\s+Assy.\s+Revision\s+Number\s+:\s+(?P<revision_num>\S+)$")
+        p3 = regex_engine.compile(r"^Top\s+Assy.\s+Revision\s+Number\s+:\s+(?P<revision_num>\S+)$")
 
         ret_dict = {}
 
@@ -23,6 +23,7 @@ import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -113,8 +114,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
             line = line.strip()
 
             # Global IGMP State Limit : 1 active out of 20 max
-            p1 = re.compile(r'^Global +IGMP +State +Limit *: +'
-                             r'(?P<active>\d+) +active +out +of +(?P<global_max_groups>\d+) +max$')
+            p1 = regex_engine.compile(r'^Global +IGMP +State +Limit *: +'
+                                       r'(?P<active>\d+) +active +out +of +(?P<global_max_groups>\d+) +max$')
             m = p1.match(line)
             if m:
                 max_groups = int(m.groupdict()['global_max_groups'])
@@ -129,8 +130,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # GigabitEthernet1 is up, line protocol is up
-            p2 = re.compile(r'^(?P<intf>[\w\-\.\/]+) +is +(?P<intf_status>[\w\s]+), +'
-                             r'line +protocol +is +(?P<oper_status>\w+)$')
+            p2 = regex_engine.compile(r'^(?P<intf>[\w\-\.\/]+) +is +(?P<intf_status>[\w\s]+), +'
+                                       r'line +protocol +is +(?P<oper_status>\w+)$')
             m = p2.match(line)
             if m:
                 intf = m.groupdict()['intf']
@@ -151,14 +152,14 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Internet protocol processing disabled
-            p2_2 = re.compile(r'^Internet protocol processing (?P<disabled>disabled)$')
+            p2_2 = regex_engine.compile(r'^Internet protocol processing (?P<disabled>disabled)$')
             m = p2_2.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interface'][intf]['internet_protocol_processing'] = False
                 continue
 
             # Internet address is 10.1.2.1/24
-            p3 = re.compile(r'^Internet +address +is +(?P<ip>[\w\/\.\:]+)$')
+            p3 = regex_engine.compile(r'^Internet +address +is +(?P<ip>[\w\/\.\:]+)$')
             m = p3.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['interface_address'] = \
@@ -166,7 +167,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP is enabled on interface
-            p4 = re.compile(r'^IGMP +is +(?P<status>\w+) +on +interface$')
+            p4 = regex_engine.compile(r'^IGMP +is +(?P<status>\w+) +on +interface$')
             m = p4.match(line)
             if m:      
                 status = m.groupdict()['status'].lower()          
@@ -175,21 +176,21 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
             
             # Current IGMP host version is 3
-            p5 = re.compile(r'^Current +IGMP +host +version +is +(?P<ver>\d+)$')
+            p5 = regex_engine.compile(r'^Current +IGMP +host +version +is +(?P<ver>\d+)$')
             m = p5.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['host_version'] = int(m.groupdict()['ver'])
                 continue
 
             # Current IGMP router version is 3
-            p6 = re.compile(r'^Current +IGMP +router +version +is +(?P<ver>\d+)$')
+            p6 = regex_engine.compile(r'^Current +IGMP +router +version +is +(?P<ver>\d+)$')
             m = p6.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['router_version'] = int(m.groupdict()['ver'])
                 continue
 
             # IGMP query interval is 133 seconds
-            p7 = re.compile(r'^IGMP +query +interval +is +(?P<query_interval>\d+) +seconds$')
+            p7 = regex_engine.compile(r'^IGMP +query +interval +is +(?P<query_interval>\d+) +seconds$')
             m = p7.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['query_interval'] = \
@@ -197,8 +198,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP configured query interval is 133 seconds
-            p8 = re.compile(r'^IGMP +configured +query +interval +is +'
-                             r'(?P<query_interval>\d+) +seconds$')
+            p8 = regex_engine.compile(r'^IGMP +configured +query +interval +is +'
+                                       r'(?P<query_interval>\d+) +seconds$')
             m = p8.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['configured_query_interval'] = \
@@ -206,8 +207,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP querier timeout is 266 seconds
-            p9 = re.compile(r'^IGMP +querier +timeout +is +'
-                             r'(?P<timeout>\d+) +seconds$')
+            p9 = regex_engine.compile(r'^IGMP +querier +timeout +is +'
+                                       r'(?P<timeout>\d+) +seconds$')
             m = p9.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['querier_timeout'] = \
@@ -215,8 +216,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP configured querier timeout is 266 seconds
-            p10 = re.compile(r'^IGMP +configured +querier +timeout +is +'
-                             r'(?P<timeout>\d+) +seconds$')
+            p10 = regex_engine.compile(r'^IGMP +configured +querier +timeout +is +'
+                                       r'(?P<timeout>\d+) +seconds$')
             m = p10.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['configured_querier_timeout'] = \
@@ -224,8 +225,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP max query response time is 10 seconds
-            p11 = re.compile(r'^IGMP +max +query +response +time +is +'
-                             r'(?P<time>\d+) +seconds$')
+            p11 = regex_engine.compile(r'^IGMP +max +query +response +time +is +'
+                                       r'(?P<time>\d+) +seconds$')
             m = p11.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['query_max_response_time'] = \
@@ -233,7 +234,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Last member query count is 2
-            p12 = re.compile(r'^Last +member +query +count +is +(?P<count>\d+)$')
+            p12 = regex_engine.compile(r'^Last +member +query +count +is +(?P<count>\d+)$')
             m = p12.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['last_member_query_count'] = \
@@ -241,8 +242,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Last member query response interval is 100 ms
-            p13 = re.compile(r'^Last +member +query +response +interval +is '
-                              r'+(?P<time>\d+) +ms$')
+            p13 = regex_engine.compile(r'^Last +member +query +response +interval +is '
+                                        r'+(?P<time>\d+) +ms$')
             m = p13.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['last_member_query_interval'] = \
@@ -250,7 +251,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Inbound IGMP access group is test2
-            p14 = re.compile(r'^Inbound +IGMP +access +group +is +(?P<group_policy>\S+)$')
+            p14 = regex_engine.compile(r'^Inbound +IGMP +access +group +is +(?P<group_policy>\S+)$')
             m = p14.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['group_policy'] = \
@@ -258,7 +259,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP activity: 13 joins, 3 leaves
-            p15 = re.compile(r'^IGMP +activity: +(?P<joins>\d+) +joins, +(?P<leaves>\d+) +leaves$')
+            p15 = regex_engine.compile(r'^IGMP +activity: +(?P<joins>\d+) +joins, +(?P<leaves>\d+) +leaves$')
             m = p15.match(line)
             if m:
                 if 'counters' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -270,8 +271,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Interface IGMP State Limit : 1 active out of 10 max
-            p16 = re.compile(r'^Interface +IGMP +State +Limit *: +'
-                              r'(?P<active>\d+) +active +out +of +(?P<max>\d+) +max$')
+            p16 = regex_engine.compile(r'^Interface +IGMP +State +Limit *: +'
+                                        r'(?P<active>\d+) +active +out +of +(?P<max>\d+) +max$')
             m = p16.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['max_groups'] = int(m.groupdict()['max'])
@@ -279,7 +280,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Multicast routing is enabled on interface
-            p17 = re.compile(r'^Multicast +routing +is +enabled +on +interface$')
+            p17 = regex_engine.compile(r'^Multicast +routing +is +enabled +on +interface$')
             m = p17.match(line)
             if m:
                 if 'multicast' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -288,7 +289,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Multicast TTL threshold is 0
-            p18 = re.compile(r'^Multicast +TTL +threshold +is +(?P<ttl>\d+)$')
+            p18 = regex_engine.compile(r'^Multicast +TTL +threshold +is +(?P<ttl>\d+)$')
             m = p18.match(line)
             if m:
                 if 'multicast' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -298,8 +299,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Multicast designated router (DR) is 10.1.2.1 (this system)
-            p19 = re.compile(r'^Multicast +designated +router +\(DR\) +'
-                              r'is +(?P<ip>[\w\.\:]+)(?P<dummy> *\([\w\s]+\))?$')
+            p19 = regex_engine.compile(r'^Multicast +designated +router +\(DR\) +'
+                                        r'is +(?P<ip>[\w\.\:]+)(?P<dummy> *\([\w\s]+\))?$')
             m = p19.match(line)
             if m:
                 if 'multicast' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -312,8 +313,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP querying router is 10.1.2.1 (this system)
-            p20 = re.compile(r'^IGMP +querying +router +is +(?P<querier>[\w\.\:]+)'
-                              r'(?P<dummy> *\([\w\s]+\))?$')
+            p20 = regex_engine.compile(r'^IGMP +querying +router +is +(?P<querier>[\w\.\:]+)'
+                                        r'(?P<dummy> *\([\w\s]+\))?$')
             m = p20.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interface'][intf]['querier'] = \
@@ -324,7 +325,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
 
             # Multicast groups joined by this system (number of users):
             #   224.0.1.40(1)  239.4.4.4(1)  239.3.3.3(1)
-            p21 = re.compile(r'([\w\.\:]+)\((\d+)\)')
+            p21 = regex_engine.compile(r'([\w\.\:]+)\((\d+)\)')
             m = p21.findall(line)
             if m:
                 if 'joined_group' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -337,7 +338,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Multicast Routing table VRF1
-            p22 = re.compile(r'^Multicast +Routing +table +(?P<routing_table>\S+)$')
+            p22 = regex_engine.compile(r'^Multicast +Routing +table +(?P<routing_table>\S+)$')
             m = p22.match(line)
             if m:
                 if 'multicast' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -464,7 +465,7 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
 
             # Interface:        GigabitEthernet1
             # Interface:\tVlan211
-            p1 = re.compile(r'^Interface: +(?P<intf>[\w\.\-\/]+)$')
+            p1 = regex_engine.compile(r'^Interface: +(?P<intf>[\w\.\-\/]+)$')
             m = p1.match(line)
             if m:
                 if 'vrf' not in ret_dict:
@@ -480,7 +481,7 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
                 continue
 
             # Group:                239.1.1.1
-            p2 = re.compile(r'^Group: +(?P<group>[\w\.\:]+)$')
+            p2 = regex_engine.compile(r'^Group: +(?P<group>[\w\.\:]+)$')
             m = p2.match(line)
             if m:
                 group = m.groupdict()['group']
@@ -491,7 +492,7 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
                 continue
 
             # Flags:                L U
-            p3 = re.compile(r'^Flags:( *(?P<flags>[\w\s]+))?$')
+            p3 = regex_engine.compile(r'^Flags:( *(?P<flags>[\w\s]+))?$')
             m = p3.match(line)
             if m:
                 flags = m.groupdict()['flags']
@@ -515,7 +516,7 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
                 continue
 
             # Uptime:                00:05:06
-            p4 = re.compile(r'^Uptime: +(?P<up_time>[\w\:\.]+)$')
+            p4 = regex_engine.compile(r'^Uptime: +(?P<up_time>[\w\:\.]+)$')
             m = p4.match(line)
             if m:
                 up_time = m.groupdict()['up_time']
@@ -524,8 +525,8 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
 
             # Group mode:        INCLUDE
             # Group mode:        EXCLUDE (Expires: 00:06:06)
-            p5 = re.compile(r'^Group +mode: +(?P<group_mode>\w+)'
-                             r'( *\(Expires: +(?P<expire>[\w\.\:]+)\))?$')
+            p5 = regex_engine.compile(r'^Group +mode: +(?P<group_mode>\w+)'
+                                       r'( *\(Expires: +(?P<expire>[\w\.\:]+)\))?$')
             m = p5.match(line)
             if m:
                 group_mode = m.groupdict()['group_mode']
@@ -536,7 +537,7 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
                 continue
 
             # Last reporter:        10.1.2.1
-            p6 = re.compile(r'^Last +reporter: +(?P<last_reporter>[\w\.\:]+)$')
+            p6 = regex_engine.compile(r'^Last +reporter: +(?P<last_reporter>[\w\.\:]+)$')
             m = p6.match(line)
             if m:
                 last_reporter = m.groupdict()['last_reporter']
@@ -545,12 +546,12 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
 
             # Source Address   Uptime    v3 Exp   CSR Exp   Fwd  Flags
             # 10.4.1.1         00:05:06  stopped   stopped   Yes  L
-            p7 = re.compile(r'^(?P<source>[\w\.\:]+) +'
-                             r'(?P<up_time>[\w\.\:]+) +'
-                             r'(?P<v3_exp>\w+) +'
-                             r'(?P<csr_exp>\w+) +'
-                             r'(?P<forward>\w+) +'
-                             r'(?P<source_flags>\w+)$')
+            p7 = regex_engine.compile(r'^(?P<source>[\w\.\:]+) +'
+                                       r'(?P<up_time>[\w\.\:]+) +'
+                                       r'(?P<v3_exp>\w+) +'
+                                       r'(?P<csr_exp>\w+) +'
+                                       r'(?P<forward>\w+) +'
+                                       r'(?P<source_flags>\w+)$')
             m = p7.match(line)
             if m:
                 source = m.groupdict()['source']
@@ -605,7 +606,7 @@ class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
                             self.build_pre_define_key(key_value_dict=key_value_dict))
 
             # Source list is empty
-            p7_1 = re.compile(r'^Source +list +is +empty$')
+            p7_1 = regex_engine.compile(r'^Source +list +is +empty$')
             m = p7_1.match(line)
             if m:
                 source = '*'
@@ -658,7 +659,7 @@ class ShowIpIgmpSsm(ShowIpIgmpSsmSchema):
         for line in out.splitlines():
             line = line.strip()
             # SSM Mapping : Disabled
-            p1 = re.compile(r'^SSM +Mapping *: +(?P<ssm_mapping>\w+)$')
+            p1 = regex_engine.compile(r'^SSM +Mapping *: +(?P<ssm_mapping>\w+)$')
             m = p1.match(line)
             if m:
                 ret_dict['ssm_mapping'] = m.groupdict()['ssm_mapping']
@@ -717,21 +718,21 @@ class ShowIpIgmpSsmMapping(ShowIpIgmpSsmMappingSchema):
             line = line.strip()
 
             # Group address: 224.0.1.40
-            p1 = re.compile(r'^Group +address *: +(?P<group_address>[\w\.\:]+)$')
+            p1 = regex_engine.compile(r'^Group +address *: +(?P<group_address>[\w\.\:]+)$')
             m = p1.match(line)
             if m:
                 group_address = m.groupdict()['group_address']
                 continue
 
             # Database     : Static
-            p2 = re.compile(r'^Database *: +(?P<database>\w+)$')
+            p2 = regex_engine.compile(r'^Database *: +(?P<database>\w+)$')
             m = p2.match(line)
             if m:
                 database = m.groupdict()['database']
                 continue
 
             # Source list  : 10.4.1.1
-            p3 = re.compile(r'^Source +list *: +(?P<source_addr>[\w\.\:]+)$')
+            p3 = regex_engine.compile(r'^Source +list *: +(?P<source_addr>[\w\.\:]+)$')
             m = p3.match(line)
             if m:
                 if 'vrf' not in ret_dict:
@@ -756,7 +757,7 @@ class ShowIpIgmpSsmMapping(ShowIpIgmpSsmMappingSchema):
                 continue
 
             # 10.4.1.2
-            p3_1 = re.compile(r'^(?P<source_addr>[\w\.\:]+)$')
+            p3_1 = regex_engine.compile(r'^(?P<source_addr>[\w\.\:]+)$')
             m = p3_1.match(line)
             if m:
                 source_addr = m.groupdict()['source_addr']
@@ -810,7 +811,7 @@ class ShowIpIgmpSnoopingMrouter(ShowIpIgmpSnoopingMrouterSchema):
         vlan_dict = {}
 
         # 1    Po62(dynamic), Router
-        p1 = re.compile(r'(?P<vlan_id>\d+)+\s+(?P<port>.+)')
+        p1 = regex_engine.compile(r'(?P<vlan_id>\d+)+\s+(?P<port>.+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -870,7 +871,7 @@ class ShowIpIgmpSnoopingQuerier(ShowIpIgmpSnoopingQuerierSchema):
             #327       27.1.1.2                 v2          Router
             #1         193.1.1.1                v2            Switch
             #10        192.1.1.1                v2            Fou1/0/31
-            p1 = re.compile(r'^(?P<vlan>\d+) +(?P<ip_address>[\d.]+) +(?P<igmp_version>\w+) +(?P<port>\S+)$')
+            p1 = regex_engine.compile(r'^(?P<vlan>\d+) +(?P<ip_address>[\d.]+) +(?P<igmp_version>\w+) +(?P<port>\S+)$')
 
             m = p1.match(line)
             if m:
@@ -932,10 +933,10 @@ class ShowIpIgmpSnoopingGroups(ShowIpIgmpSnoopingGroupsSchema):
 
             # 801       225.6.1.1                igmp        v2          pw100155
             # 10        225.1.1.1                igmp        v2          Tw1/0/4, Tw1/0/25
-            p1 = re.compile(r'^(?P<vlan_id>\d+) +(?P<group_ip>[\d\.]+) +(?P<type>\w+) +(?P<version>\w+) +(?P<port>[\S,\s]+)$')
+            p1 = regex_engine.compile(r'^(?P<vlan_id>\d+) +(?P<group_ip>[\d\.]+) +(?P<type>\w+) +(?P<version>\w+) +(?P<port>[\S,\s]+)$')
 
 			# 12        225.0.0.1                S                       Po92
-            p1_0 = re.compile(r'^(?P<vlan_id>\d+) +(?P<group_ip>[\d\.]+) +(?P<type>\w+) +(?P<port>[\S,\s]+)$')
+            p1_0 = regex_engine.compile(r'^(?P<vlan_id>\d+) +(?P<group_ip>[\d\.]+) +(?P<type>\w+) +(?P<port>[\S,\s]+)$')
 
             m = p1.match(line)
             if m:
@@ -994,11 +995,11 @@ class ShowIpIgmpSnoopingGroupsVlanSources(
 
         # initial regexp pattern
         # 192.168.11.11 00:01:31 00:02:32 1/0 Et0/2
-        p1 = re.compile(r'^(?P<source>[0-9a-fA-F\.:]+)\s+[\d:\w]+\s+[\d:\w]+'
-                        r'\s+\d+\/\d+\s+(?P<port_list>[\w\/:]+)$')
+        p1 = regex_engine.compile(r'^(?P<source>[0-9a-fA-F\.:]+)\s+[\d:\w]+\s+[\d:\w]+'
+                                  r'\s+\d+\/\d+\s+(?P<port_list>[\w\/:]+)$')
         # 192.168.11.11 stopped 00:02:32 1/0
-        p2 = re.compile(r'^(?P<source>[0-9a-fA-F\.:]+)\s+[\d:\w]+'
-                        r'\s+[\d:\w]+\s+\d+\/\d+$')
+        p2 = regex_engine.compile(r'^(?P<source>[0-9a-fA-F\.:]+)\s+[\d:\w]+'
+                                  r'\s+[\d:\w]+\s+\d+\/\d+$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1110,7 +1111,7 @@ class ShowIpIgmpVrfGroups(ShowIpIgmpVrfGroupsSchema):
         igmp_dict = {}
         
         # 228.1.1.1        Vlan111                  00:03:07  00:02:59  151.1.1.2
-        p1=re.compile(r"^(?P<groupip>[\d\.]+)\s+(?P<interface>\S+)\s+(?P<uptime>\S+)\s+(?P<expires>\S+)\s+(?P<last_reporter>\S+).*$")
+        p1=regex_engine.compile(r"^(?P<groupip>[\d\.]+)\s+(?P<interface>\S+)\s+(?P<uptime>\S+)\s+(?P<expires>\S+)\s+(?P<last_reporter>\S+).*$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1146,7 +1147,7 @@ class ShowIpIgmpSnoopingGroupsCount(ShowIpIgmpSnoopingGroupsCountSchema):
             output = self.device.execute(self.cli_command)
 
         # Total number of groups:   831
-        p1 = re.compile(r'^Total\s+number\s+of\s+groups\:\s+(?P<igmp_groups_count>\d+)$')
+        p1 = regex_engine.compile(r'^Total\s+number\s+of\s+groups\:\s+(?P<igmp_groups_count>\d+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -1186,7 +1187,7 @@ class ShowIpIgmpVrfSnoopingGroups(ShowIpIgmpVrfSnoopingGroupsSchema):
             output = self.device.execute(self.cli_command.format(vrf=vrf))
 
         # 10        232.1.1.1                igmp        v3          Te1/0/3
-        p1 = re.compile(r'^(?P<vlan>\d+)\s+(?P<group>\S+)\s+(?P<type>\S+)\s+(?P<version>\S+)\s+(?P<port_list>[\w/\.\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<vlan>\d+)\s+(?P<group>\S+)\s+(?P<type>\S+)\s+(?P<version>\S+)\s+(?P<port_list>[\w/\.\s]+)$')
 
         ret_dict = {}
         count = 1
@@ -1242,7 +1243,7 @@ class ShowIpIgmpGroups(ShowIpIgmpGroupsSchema):
         igmp_dict = {}
         
         # 228.0.8.204      Vlan10                   00:02:26  00:02:45  60.1.1.2
-        p1=re.compile(r'^(?P<group>[\w\.\:]+) +(?P<intf>[\w\.\/\-]+) +(?P<uptime>[\w\.\:]+) +(?P<expires>[\w\.\:]+) +(?P<last_reporter>[\w\.\:]+)$')
+        p1=regex_engine.compile(r'^(?P<group>[\w\.\:]+) +(?P<intf>[\w\.\/\-]+) +(?P<uptime>[\w\.\:]+) +(?P<expires>[\w\.\:]+) +(?P<last_reporter>[\w\.\:]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1286,7 +1287,7 @@ class ShowIpIgmpSnoopingMrouterVlan(ShowIpIgmpSnoopingMrouterVlanSchema):
         vlan_dict = {}
 
         #  777    Po10(dynamic), Router
-        p1 = re.compile(r'(?P<vlan_id>\d+)\s+(?P<port>.+)')
+        p1 = regex_engine.compile(r'(?P<vlan_id>\d+)\s+(?P<port>.+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1354,57 +1355,57 @@ class ShowIpIgmpSnoopingQuerierVlanDetail(ShowIpIgmpSnoopingQuerierVlanDetailSch
             output = self.device.execute(cmd)
         
         # IP address               : 1.1.1.1
-        p1 = re.compile(r"^IP\s+address\s+:\s+(?P<ip_address>\S+)$")
+        p1 = regex_engine.compile(r"^IP\s+address\s+:\s+(?P<ip_address>\S+)$")
 
         # IGMP version             : v2
-        p2 = re.compile(r"^IGMP\s+version\s+:\s+(?P<igmp_version>\S+)$")
+        p2 = regex_engine.compile(r"^IGMP\s+version\s+:\s+(?P<igmp_version>\S+)$")
 
         # Port                     : Switch
-        p3 = re.compile(r"^Port\s+:\s+(?P<port>\w+)$")
+        p3 = regex_engine.compile(r"^Port\s+:\s+(?P<port>\w+)$")
 
         # Max response time        : 10s
-        p4 = re.compile(r"^Max\s+response\s+time\s+:\s+(?P<max_response_time>\S+)$")
+        p4 = regex_engine.compile(r"^Max\s+response\s+time\s+:\s+(?P<max_response_time>\S+)$")
 
         # Global IGMP switch querier status
-        p5 = re.compile(r"^Global\s+IGMP\s+switch\s+querier\s+status$")
+        p5 = regex_engine.compile(r"^Global\s+IGMP\s+switch\s+querier\s+status$")
 
         # Vlan 100:   IGMP switch querier status
-        p6 = re.compile(r"^Vlan\s+(?P<vlan>\d+):\s+IGMP\s+switch\s+querier\s+status$")
+        p6 = regex_engine.compile(r"^Vlan\s+(?P<vlan>\d+):\s+IGMP\s+switch\s+querier\s+status$")
 
         # admin state                    : Enabled
         # admin state                    : Enabled (state inherited)
-        p7 = re.compile(r"^admin\s+state\s+:\s+(?P<admin_state>\w+)(?:\s+\((?P<state>[\w\s]+)\))?")
+        p7 = regex_engine.compile(r"^admin\s+state\s+:\s+(?P<admin_state>\w+)(?:\s+\((?P<state>[\w\s]+)\))?")
        
         # admin version                  : 2
-        p8 = re.compile(r"^admin\s+version\s+:\s+(?P<admin_version>\d+)$")
+        p8 = regex_engine.compile(r"^admin\s+version\s+:\s+(?P<admin_version>\d+)$")
 
         # source IP address              : 1.1.1.1
-        p9 = re.compile(r"^source\s+IP\s+address\s+:\s+(?P<source_ip_address>\S+)$")
+        p9 = regex_engine.compile(r"^source\s+IP\s+address\s+:\s+(?P<source_ip_address>\S+)$")
 
         # query-interval (sec)           : 100
-        p10 = re.compile(r"^query-interval\s+\(sec\)\s+:\s+(?P<query_interval>\d+)$")
+        p10 = regex_engine.compile(r"^query-interval\s+\(sec\)\s+:\s+(?P<query_interval>\d+)$")
 
         # max-response-time (sec)        : 10
-        p11 = re.compile(r"^max-response-time\s+\(sec\)\s+:\s+(?P<max_response_time>\d+)$")
+        p11 = regex_engine.compile(r"^max-response-time\s+\(sec\)\s+:\s+(?P<max_response_time>\d+)$")
 
         # querier-timeout (sec)          : 120
-        p12 = re.compile(r"^querier-timeout\s+\(sec\)\s+:\s+(?P<querier_timeout>\d+)$")
+        p12 = regex_engine.compile(r"^querier-timeout\s+\(sec\)\s+:\s+(?P<querier_timeout>\d+)$")
 
         # tcn query count                : 10
-        p13 = re.compile(r"^tcn\s+query\s+count\s+:\s+(?P<tcn_query_count>\d+)$")
+        p13 = regex_engine.compile(r"^tcn\s+query\s+count\s+:\s+(?P<tcn_query_count>\d+)$")
 
         # tcn query interval (sec)       : 10
-        p14 = re.compile(r"^tcn\s+query\s+interval\s+\(sec\)\s+:\s+(?P<tcn_query_interval>\d+)$")
+        p14 = regex_engine.compile(r"^tcn\s+query\s+interval\s+\(sec\)\s+:\s+(?P<tcn_query_interval>\d+)$")
 
         # operational state              : Querier
         # operational state              : Non-Querier
-        p15 = re.compile(r"^operational\s+state\s+:\s+(?P<operational_state>\S+)$")
+        p15 = regex_engine.compile(r"^operational\s+state\s+:\s+(?P<operational_state>\S+)$")
 
         # operational version            : 2
-        p16 = re.compile(r"^operational\s+version\s+:\s+(?P<operational_version>\d+)$")
+        p16 = regex_engine.compile(r"^operational\s+version\s+:\s+(?P<operational_version>\d+)$")
 
         # tcn query pending count        : 0
-        p17 = re.compile(r"^tcn\s+query\s+pending\s+count\s+:\s+(?P<tcn_query_pending_count>\d+)$")
+        p17 = regex_engine.compile(r"^tcn\s+query\s+pending\s+count\s+:\s+(?P<tcn_query_pending_count>\d+)$")
         
         ret_dict = {}
         global_dict = {}       
@@ -1567,7 +1568,7 @@ class ShowIpIgmpSnoopingGroupsVlanGroup(ShowIpIgmpSnoopingGroupsVlanGroupSchema)
         # Vlan      Group                    Type        Version     Port List
         # -----------------------------------------------------------------------
         # 11        225.0.0.1                igmp        v3          Po92
-        p1=re.compile(r'^(?P<vlan>[\w\.\/\-]+) +(?P<group>[\w\.\:]+) +(?P<type>[\w\.\:]+) +(?P<version>[\w\.\:]+) +(?P<port_list>[\w\.\:\/]+)$')
+        p1=regex_engine.compile(r'^(?P<vlan>[\w\.\/\-]+) +(?P<group>[\w\.\:]+) +(?P<type>[\w\.\:]+) +(?P<version>[\w\.\:]+) +(?P<port_list>[\w\.\:\/]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -15,7 +15,6 @@
 """
 
 # Python
-import re
 import random
 
 # Metaparser
@@ -25,6 +24,7 @@ from genie.metaparser.util.schemaengine import (Schema,
                                                 Optional)
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -63,21 +63,21 @@ class ShowInstallSummary(ShowInstallSummarySchema):
 
         # initial regexp patterns
         # [ Switch 1 2 ] Installed Package(s) Information:
-        p1 = re.compile(r'^\[ +(?P<location>[\S ]+)\] +Installed Package'
-                        r'\(s\) +Information:$')
+        p1 = regex_engine.compile(r'^\[ +(?P<location>[\S ]+)\] +Installed Package'
+                                  r'\(s\) +Information:$')
         
         # SMU   U    bootflash:utah.bm.smu.may15.bin
         # IMG   C    10.69.1.0.66982
         # IMG   C    17.16.01.0.202920
-        p2 = re.compile(r'^(?P<type>\S+) + (?P<state>\w) +(?P<filename_version>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<type>\S+) + (?P<state>\w) +(?P<filename_version>\S+)$')
         
         # Auto abort timer: active on install_activate, time before rollback - 01:49:42
         # Auto abort timer: active , time before rollback - 00:52:16
-        p3 = re.compile(r'^Auto +abort +timer: +(?P<auto_abort_timer>[\S ]+), +'
-                        r'time +before +rollback +\- +(?P<time_before_rollback>\S+)$')
+        p3 = regex_engine.compile(r'^Auto +abort +timer: +(?P<auto_abort_timer>[\S ]+), +'
+                                  r'time +before +rollback +\- +(?P<time_before_rollback>\S+)$')
 
         # Auto abort timer: active
-        p4 = re.compile(r'^Auto +abort +timer: +(?P<auto_abort_timer>[\S ]+)$')
+        p4 = regex_engine.compile(r'^Auto +abort +timer: +(?P<auto_abort_timer>[\S ]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -152,7 +152,7 @@ class ShowInstallRollback(ShowInstallRollbackSchema):
         ret_dict = {}
         index = 0
         # 5       No_Label                         No Description
-        p1 = re.compile(r'^(?P<id>\d+)\s*(?P<label>(\S+ ){1,})\s{2,}(?P<description>.*)$')
+        p1 = regex_engine.compile(r'^(?P<id>\d+)\s*(?P<label>(\S+ ){1,})\s{2,}(?P<description>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -205,22 +205,22 @@ class ShowInstallRollbackId(ShowInstallRollbackIdSchema):
         ret_dict = {}
 
         # Rollback id - 5 (Created on 2021-10-21 16:34:06.000000000 +0000)
-        p1 = re.compile(r'Rollback\s*id\s*-\s*(?P<rollback_id>\d+)\s*\('
-                        r'Created\s*on\s*(?P<date>\d*-\d*-\d*)\s*'
-                        r'(?P<time>\d*:\d*:\d*.\d*)')
+        p1 = regex_engine.compile(r'Rollback\s*id\s*-\s*(?P<rollback_id>\d+)\s*\('
+                                  r'Created\s*on\s*(?P<date>\d*-\d*-\d*)\s*'
+                                  r'(?P<time>\d*:\d*:\d*.\d*)')
 
         # Label: No Label
-        p2 = re.compile(r'Label:\s*(?P<label>.*)')
+        p2 = regex_engine.compile(r'Label:\s*(?P<label>.*)')
 
         # Description: No Description
-        p3 = re.compile(r'Description:\s*(?P<description>.*)')
+        p3 = regex_engine.compile(r'Description:\s*(?P<description>.*)')
 
         # Reload required: NO
-        p4 = re.compile(r'Reload\s*required:\s*(?P<reload_required>.*)')
+        p4 = regex_engine.compile(r'Reload\s*required:\s*(?P<reload_required>.*)')
 
         # IMG   C    17.08.01.0.148528 |
         # SMU   C    /flash1/user/cat9k_iosxe.2021-10-06_22.52_shidogra.53.CSCxx12353.SSA.smu.bin
-        p5 = re.compile(r'^(?P<type>\S+) + (?P<state>\w) +(?P<filename_version>\S+)$')
+        p5 = regex_engine.compile(r'^(?P<type>\S+) + (?P<state>\w) +(?P<filename_version>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -297,13 +297,13 @@ class ShowInstallState(ShowInstallStateSchema):
         index = 0
         # initial regexp pattern
         # [ R0 ] Installed Package(s) Information:
-        p1 = re.compile(r'^\[ +(?P<location>[\S ]+)\]+\s+\w+ Package\(s\) +Information:$')
+        p1 = regex_engine.compile(r'^\[ +(?P<location>[\S ]+)\]+\s+\w+ Package\(s\) +Information:$')
         # SMU   U    bootflash:utah.bm.smu.may15.bin
         # IMG   C    10.69.1.0.66982
-        p2 = re.compile(r'^(?P<type>\S+) + (?P<state>\w) +(?P<filename_version>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<type>\S+) + (?P<state>\w) +(?P<filename_version>\S+)$')
 
         # Auto abort timer: active on install_activate
-        p4 = re.compile(r'^Auto +abort +timer: +(?P<auto_abort_timer>[\S ]+)$')
+        p4 = regex_engine.compile(r'^Auto +abort +timer: +(?P<auto_abort_timer>[\S ]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -392,91 +392,91 @@ class ShowInstallPackageSMU(ShowInstallPackageSMUSchema):
         ret_dict = {}
 
         # Name: C9800-SW-iosxe-wlc.BLD_POLARIS_DEV_LATEST_20211206_041312_V17_8_0_26.SSA.bin
-        p1 = re.compile(r'^Name: +(?P<file_name>.*bin$)')
+        p1 = regex_engine.compile(r'^Name: +(?P<file_name>.*bin$)')
 
         # Version: 17.08.01.0.150818.1638769329..Cupertino
-        p2 = re.compile(r'Version: +(?P<version>.*$)')
+        p2 = regex_engine.compile(r'Version: +(?P<version>.*$)')
 
         # Platform: CAT9K
-        p3 = re.compile(r'Platform: +(?P<platform>.*$)')
+        p3 = regex_engine.compile(r'Platform: +(?P<platform>.*$)')
 
         # Package Type: PKG
-        p4 = re.compile(r'Package Type: +(?P<package_type>.*$)')
+        p4 = regex_engine.compile(r'Package Type: +(?P<package_type>.*$)')
 
         # Defect ID: CSCvq24042
-        p5 = re.compile(r'Defect ID: +(?P<defect_id>.*$)')
+        p5 = regex_engine.compile(r'Defect ID: +(?P<defect_id>.*$)')
 
         # Package State: Not Installed
-        p6 = re.compile(r'Package State: +(?P<package_state>.*$)')
+        p6 = regex_engine.compile(r'Package State: +(?P<package_state>.*$)')
 
         # Supersedes List:
-        p7 = re.compile(r'Supersedes List: +(?P<supersedes_list>.*$)')
+        p7 = regex_engine.compile(r'Supersedes List: +(?P<supersedes_list>.*$)')
 
         # SMU Fixes List:
-        p8 = re.compile(r'SMU Fixes List: +(?P<smu_fixes_list>.*$)')
+        p8 = regex_engine.compile(r'SMU Fixes List: +(?P<smu_fixes_list>.*$)')
 
         # SMU ID: 1000
-        p9 = re.compile(r'SMU ID: +(?P<smu_id>.*$)')
+        p9 = regex_engine.compile(r'SMU ID: +(?P<smu_id>.*$)')
 
         # SMU Type: reload
-        p10 = re.compile(r'SMU Type: +(?P<smu_type>.*$)')
+        p10 = regex_engine.compile(r'SMU Type: +(?P<smu_type>.*$)')
 
         # SMU Compatible with Version: 17.08.01.0.150818
-        p11 = re.compile(r'SMU Compatible with Version: +(?P<smu_compatilble_version>.*$)')
+        p11 = regex_engine.compile(r'SMU Compatible with Version: +(?P<smu_compatilble_version>.*$)')
 
         # SMUImpact:
         # Package: cat9k-wlc.BLD_POLARIS_DEV_LATEST_20211206_041312_V17_8_0_26.SSA.pkg
-        p12 = re.compile(r'Package: +(?P<package>.*$)')
+        p12 = regex_engine.compile(r'Package: +(?P<package>.*$)')
 
         # Size: 657171504
-        p13 = re.compile(r'Size: +(?P<size>.*$)')
+        p13 = regex_engine.compile(r'Size: +(?P<size>.*$)')
 
         # Raw disk-file SHA1sum:
         #  4e739aa1b7f4705bbce4ddddf4afab969ce0a7f0
-        p14 = re.compile(r'^Raw disk-file SHA1sum:$')
-        p30 = re.compile(r'(^\s*\w+$)')
+        p14 = regex_engine.compile(r'^Raw disk-file SHA1sum:$')
+        p30 = regex_engine.compile(r'(^\s*\w+$)')
 
         # Header size: 1072 bytes
-        p15 = re.compile(r'Header size: +(?P<header_size>.*$)')
+        p15 = regex_engine.compile(r'Header size: +(?P<header_size>.*$)')
 
         # Package type: 0
-        p16 = re.compile(r'Package type: +(?P<package_type>.*$)')
+        p16 = regex_engine.compile(r'Package type: +(?P<package_type>.*$)')
 
         # Package flags: 0
-        p17 = re.compile(r'Package flags: +(?P<package_flags>.*$)')
+        p17 = regex_engine.compile(r'Package flags: +(?P<package_flags>.*$)')
 
         # Header version: 3
-        p18 = re.compile(r'Header version: +(?P<header_version>.*$)')
+        p18 = regex_engine.compile(r'Header version: +(?P<header_version>.*$)')
 
         # Internal package information:
         # Name: rp_wlc
-        p19 = re.compile(r'Name: +(?P<package_name>.*$)')
+        p19 = regex_engine.compile(r'Name: +(?P<package_name>.*$)')
 
         # BuildTime: 2021-12-05_21.42
-        p20 = re.compile(r'BuildTime: +(?P<build_time>.*$)')
+        p20 = regex_engine.compile(r'BuildTime: +(?P<build_time>.*$)')
 
         # ReleaseDate: 2021-12-06_04.53
-        p21 = re.compile(r'ReleaseDate: +(?P<release_date>.*$)')
+        p21 = regex_engine.compile(r'ReleaseDate: +(?P<release_date>.*$)')
 
         # BootArchitecture: none
-        p22 = re.compile(r'BootArchitecture: +(?P<boot_architecture>.*$)')
+        p22 = regex_engine.compile(r'BootArchitecture: +(?P<boot_architecture>.*$)')
 
         # RouteProcessor: cat9k
-        p23 = re.compile(r'RouteProcessor: +(?P<route_processor>.*$)')
+        p23 = regex_engine.compile(r'RouteProcessor: +(?P<route_processor>.*$)')
 
         # Platform: CAT9K  ---> same regex ------ can we exclude?
         # p24 = re.compile(r'Platform: +(?P<platform>.*$)')
 
         # User: mcpre
-        p25 = re.compile(r'User: +(?P<user>.*$)')
+        p25 = regex_engine.compile(r'User: +(?P<user>.*$)')
 
         # PackageName: wlc
-        p26 = re.compile(r'PackageName: +(?P<package_name>.*$)')
+        p26 = regex_engine.compile(r'PackageName: +(?P<package_name>.*$)')
 
         # Build: BLD_POLARIS_DEV_LATEST_20211206_041312_V17_8_0_26
-        p27 = re.compile(r'Build: +(?P<build>.*$)')
+        p27 = regex_engine.compile(r'Build: +(?P<build>.*$)')
 
-        p28= re.compile(r'CardTypes: +(?P<card_types>.*$)')
+        p28= regex_engine.compile(r'CardTypes: +(?P<card_types>.*$)')
 
         # k = out.splitlines()
         istr = iter(output.splitlines())
@@ -727,37 +727,37 @@ class ShowInstallVersion(ShowInstallVersionSchema):
         index = 0
 
         # Location: R0
-        p1 = re.compile(r'^Location\s*:\s*(?P<location>.*)')
+        p1 = regex_engine.compile(r'^Location\s*:\s*(?P<location>.*)')
 
         # Version: 17.10.01.0.160997
-        p2 = re.compile(r'Version\s*:\s*(?P<version>.*)')
+        p2 = regex_engine.compile(r'Version\s*:\s*(?P<version>.*)')
 
         # Version Extension: 1655047488
-        p3 = re.compile(r'Version Extension\s*:\s*(?P<version_extension>.*)')
+        p3 = regex_engine.compile(r'Version Extension\s*:\s*(?P<version_extension>.*)')
 
         # Version State: Activated & Committed
-        p4 = re.compile(r'Version State\s*:\s*(?P<version_state>.*$)')
+        p4 = regex_engine.compile(r'Version State\s*:\s*(?P<version_state>.*$)')
 
         # Filename: /flash1/user/cat9k_iosxe.BLD_POLARIS_DEV_LATEST_20220612_143809.SSA.bin
-        p5 = re.compile(r'Filename\s*:\s*(?P<filename>.*$)')
+        p5 = regex_engine.compile(r'Filename\s*:\s*(?P<filename>.*$)')
 
         # CW_IMAGE: cat9k_iosxe.BLD_POLARIS_DEV_LATEST_20220612_143809.SSA.bin
-        p6 = re.compile(r'CW_IMAGE\s*:\s*(?P<cw_image>.*$)')
+        p6 = regex_engine.compile(r'CW_IMAGE\s*:\s*(?P<cw_image>.*$)')
 
         # Checksum: dab9381de08510b901a8f27675f0a711419ccdb1
-        p7 = re.compile(r'Checksum\s*:\s*(?P<checksum>.*$)')
+        p7 = regex_engine.compile(r'Checksum\s*:\s*(?P<checksum>.*$)')
 
         # Package List:
-        p8 = re.compile(r'Package List\s*:\s*$')
+        p8 = regex_engine.compile(r'Package List\s*:\s*$')
 
         # Package Type: IMG
-        p9 = re.compile(r'Package Type\s*:\s*(?P<package_type>.*)')
+        p9 = regex_engine.compile(r'Package Type\s*:\s*(?P<package_type>.*)')
 
         # Package Name: /flash1/user/cat9k-lni.BLD_POLARIS_DEV_LATEST_20220612_143809.SSA.pkg
-        p10 = re.compile(r'Package Name\s*:\s*(?P<package_name>.*)')
+        p10 = regex_engine.compile(r'Package Name\s*:\s*(?P<package_name>.*)')
 
         # Package State: Activated & Committed
-        p11 = re.compile(r'Package State\s*:\s*(?P<package_state>.*$)')
+        p11 = regex_engine.compile(r'Package State\s*:\s*(?P<package_state>.*$)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -913,9 +913,9 @@ class ShowException(ShowExceptionSchema):
 
         ret_dict = {}
         # !!!Patched Version!!!
-        p0 = re.compile(r'!!!Patched Version!!!')
+        p0 = regex_engine.compile(r'!!!Patched Version!!!')
         # show exception not implemented
-        p1 = re.compile(r'show exception not implemented')
+        p1 = regex_engine.compile(r'show exception not implemented')
 
         for line in out.splitlines():
             line = line.strip()
@@ -962,11 +962,11 @@ class ShowInstallInactive(ShowInstallInactiveSchema):
             output = self.device.execute(self.cli_command)
 
         # IMG   C    17.06.03.0.3629
-        p1 = re.compile(r"^(?P<type>\w+)\s+(?P<state>\S)\s+(?P<version>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<type>\w+)\s+(?P<state>\S)\s+(?P<version>\S+)$")
         # No Inactive Packages
-        p2 = re.compile(r"^(?P<inactive_package>\S+\s+\S+\s+\w+)$")
+        p2 = regex_engine.compile(r"^(?P<inactive_package>\S+\s+\S+\s+\w+)$")
         # Auto abort timer: inactive
-        p3 = re.compile(r"^Auto\s+abort\s+timer:\s+(?P<abort_timer>\w+)$")
+        p3 = regex_engine.compile(r"^Auto\s+abort\s+timer:\s+(?P<abort_timer>\w+)$")
 
         ret_dict = {}
 
@@ -1028,10 +1028,10 @@ class ShowInstallCommitted(ShowInstallCommittedSchema):
             output = self.device.execute(self.cli_command)
 
         # IMG   C    17.06.03.0.3629
-        p1 = re.compile(r"^(?P<type>\w+)\s+(?P<state>\S)\s+(?P<version>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<type>\w+)\s+(?P<state>\S)\s+(?P<version>\S+)$")
        # Auto abort timer: Committed
        # Auto abort timer: inactive
-        p2 = re.compile(r"^Auto\s+abort\s+timer:\s+(?P<abort_timer>\w+)$")
+        p2 = regex_engine.compile(r"^Auto\s+abort\s+timer:\s+(?P<abort_timer>\w+)$")
 
         ret_dict = {}
 
@@ -1089,11 +1089,11 @@ class ShowInstallUncommitted(ShowInstallUncommittedSchema):
             output = self.device.execute(self.cli_command)
 
         # IMG   C    17.06.03.0.3629
-        p1 = re.compile(r"^(?P<type>\w+)\s+(?P<state>\S)\s+(?P<version>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<type>\w+)\s+(?P<state>\S)\s+(?P<version>\S+)$")
         # No Uncommitted Packages
-        p2 = re.compile(r"^(?P<uncommitted_package>\S+\s+\S+\s+\w+)$")
+        p2 = regex_engine.compile(r"^(?P<uncommitted_package>\S+\s+\S+\s+\w+)$")
         # Auto abort timer: Uncommitted
-        p3 = re.compile(r"^Auto\s+abort\s+timer:\s+(?P<abort_timer>\w+)$")
+        p3 = regex_engine.compile(r"^Auto\s+abort\s+timer:\s+(?P<abort_timer>\w+)$")
 
         ret_dict = {}
 
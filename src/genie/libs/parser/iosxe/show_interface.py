@@ -69,6 +69,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import regex_engine, string_pool
 
 logger = logging.getLogger(__name__)
 
@@ -267,55 +268,55 @@ class ShowInterfaces(ShowInterfacesSchema):
         # FastEthernet1 is down, line protocol is down (err-disabled)
         # GigabitEthernet1/0/2 is up, line protocol is down (suspended)
 
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is +(?P<enabled>[\w\s]+)(?: '
-                        r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
-                        r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 = re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
-                          r' +(?P<enabled>[\w\s]+),'
-                          r' +line +protocol +is +(?P<line_protocol>\w+)'
-                          r'( *, *(?P<attribute>[\w\s]+))?$')
+        p1 = regex_engine.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is +(?P<enabled>[\w\s]+)(?: '
+                                  r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
+                                  r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
+        p1_1 = regex_engine.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
+                                    r' +(?P<enabled>[\w\s]+),'
+                                    r' +line +protocol +is +(?P<line_protocol>\w+)'
+                                    r'( *, *(?P<attribute>[\w\s]+))?$')
 
         # pseudowire1 is up
-        p1_2 = re.compile(r'^(?P<interface>pseudowire\d+) +is +(?P<enabled>\w+)$')
+        p1_2 = regex_engine.compile(r'^(?P<interface>pseudowire\d+) +is +(?P<enabled>\w+)$')
 
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
         # Hardware is Loopback
-        p2 = re.compile(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
-                        r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
+        p2 = regex_engine.compile(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
+                                  r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
+                                  r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
 
         # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS
-        p2_2 = re.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
-                          r'(?P<mac_address>.*)(?P<phys_address>.*)')
+        p2_2 = regex_engine.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
+                                    r'(?P<mac_address>.*)(?P<phys_address>.*)')
 
         # Description: desc
         # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p3 = re.compile(r'^Description: *(?P<description>.*)$')
+        p3 = regex_engine.compile(r'^Description: *(?P<description>.*)$')
 
         # Secondary address 10.2.2.2/24
-        p4 = re.compile(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
+        p4 = regex_engine.compile(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                                  r'\/(?P<prefix_length>[0-9]+))$')
 
         # Internet address is 10.4.4.4/24
-        p5 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
+        p5 = regex_engine.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
+                                  r'\/(?P<prefix_length>[0-9]+))$')
 
         # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
         # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec,
         # MTU 1600 bytes, sub MTU 1600, BW 3584 Kbit/sec, DLY 410 usec,
         # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec,
-        p6 = re.compile(r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
-                        r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
-                        r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
-                        r'DLY +(?P<delay>[0-9]+) +usec,$')
+        p6 = regex_engine.compile(r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
+                                  r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
+                                  r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
+                                  r'DLY +(?P<delay>[0-9]+) +usec,$')
 
         # MTU 9198 bytes, BW not configured
-        p6_1 = re.compile(r'^MTU +(?P<mtu>\d+) +bytes, +BW +(?P<bandwidth>[\w\s]+)$')
+        p6_1 = regex_engine.compile(r'^MTU +(?P<mtu>\d+) +bytes, +BW +(?P<bandwidth>[\w\s]+)$')
 
         # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability +(?P<reliability>[\d\/]+),'
-                        r' +txload +(?P<txload>[\d\/]+), +rxload'
-                        r' +(?P<rxload>[\d\/]+)$')
+        p7 = regex_engine.compile(r'^reliability +(?P<reliability>[\d\/]+),'
+                                  r' +txload +(?P<txload>[\d\/]+), +rxload'
+                                  r' +(?P<rxload>[\d\/]+)$')
 
         # Encapsulation LOOPBACK, loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
@@ -324,12 +325,12 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
         # Encapsulation(s): AAL5
-        p8 = re.compile(r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
-                        r'(, +(?P<rest>.*))?$')
+        p8 = regex_engine.compile(r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
+                                  r'(, +(?P<rest>.*))?$')
 
         # Keepalive set (10 sec)
-        p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
-                         r' +sec\)$')
+        p10 = regex_engine.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
+                                   r' +sec\)$')
 
         # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
         # Full-duplex, 1000Mb/s, link type is auto, media type is
@@ -343,181 +344,181 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
         # Full-duplex, 10Gb/s, media type is 100/1000/2.5G/5G/10GBaseTX
         # Full-duplex, 10Gb/s, link type is auto, media type is CVR QSFP SFP10G(SFP-10GBase-SR)
-        p11 = re.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
-                         r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
-                         r'(S|s)peed)(?:(?:\, +link +type +is '
-                         r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
-                         r'*(?P<media_type>[\w\/\-\.() ]+)?)(?: +media +type)?)?$')
+        p11 = regex_engine.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
+                                   r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
+                                   r'(S|s)peed)(?:(?:\, +link +type +is '
+                                   r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
+                                   r'*(?P<media_type>[\w\/\-\.() ]+)?)(?: +media +type)?)?$')
 
         # input flow-control is off, output flow-control is unsupported
-        p12 = re.compile(r'^(?P<first>input|output) +flow-control +is +(?P<receive>\w+), +'
-                         r'(?P<second>output|input) +flow-control +is +(?P<send>\w+)$')
+        p12 = regex_engine.compile(r'^(?P<first>input|output) +flow-control +is +(?P<receive>\w+), +'
+                                   r'(?P<second>output|input) +flow-control +is +(?P<send>\w+)$')
 
         # ARP type: ARPA, ARP Timeout 04:00:00
-        p13 = re.compile(r'^ARP +type: +(?P<arp_type>\w+), +'
-                         r'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
+        p13 = regex_engine.compile(r'^ARP +type: +(?P<arp_type>\w+), +'
+                                   r'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
 
         # Last input never, output 00:01:05, output hang never
-        p14 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                         r'output +(?P<last_output>[\w\.\:]+), '
-                         r'output +hang +(?P<output_hang>[\w\.\:]+)$')
+        p14 = regex_engine.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+                                   r'output +(?P<last_output>[\w\.\:]+), '
+                                   r'output +hang +(?P<output_hang>[\w\.\:]+)$')
 
         # Members in this channel: Gi1/0/2
         # Members in this channel: Fo1/0/2 Fo1/0/4
-        p15 = re.compile(r'^Members +in +this +channel: +'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')
+        p15 = regex_engine.compile(r'^Members +in +this +channel: +'
+                                   r'(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')
 
         # No. of active members in this channel: 12
-        p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
-                           r'channel: +(?P<active_members>\d+)$')
+        p15_1 = regex_engine.compile(r'^No\. +of +active +members +in +this +'
+                                     r'channel: +(?P<active_members>\d+)$')
 
         # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-        p15_2 = re.compile(r'^Member +\d+ +: +(?P<interface>\S+) +,'
-                           r' +\S+, +\S+$')
+        p15_2 = regex_engine.compile(r'^Member +\d+ +: +(?P<interface>\S+) +,'
+                                     r' +\S+, +\S+$')
 
         # No. of PF_JUMBO supported members in this channel : 0
-        p15_3 = re.compile(r'^No\. +of +PF_JUMBO +supported +members +'
-                           r'in +this +channel +: +(?P<number>\d+)$')
+        p15_3 = regex_engine.compile(r'^No\. +of +PF_JUMBO +supported +members +'
+                                     r'in +this +channel +: +(?P<number>\d+)$')
 
         # Last clearing of "show interface" counters 1d02h
-        p16 = re.compile(r'^Last +clearing +of +\"show +interface\" +counters +'
-                         r'(?P<last_clear>[\w\:\.]+)$')
+        p16 = regex_engine.compile(r'^Last +clearing +of +\"show +interface\" +counters +'
+                                   r'(?P<last_clear>[\w\:\.]+)$')
 
         # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-        p17 = re.compile(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
-                         r'(?P<drops>\d+)\/(?P<flushes>\d+) +'
-                         r'\(size\/max\/drops\/flushes\); +'
-                         r'Total +output +drops: +(?P<output_drop>\d+)$')
+        p17 = regex_engine.compile(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
+                                   r'(?P<drops>\d+)\/(?P<flushes>\d+) +'
+                                   r'\(size\/max\/drops\/flushes\); +'
+                                   r'Total +output +drops: +(?P<output_drop>\d+)$')
 
         # Queueing strategy: fifo
         # Queueing strategy: Class-based queueing
-        p18 = re.compile(r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$')
+        p18 = regex_engine.compile(r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$')
 
         # Output queue: 0/0 (size/max)
         # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-        p19 = re.compile(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
-                         r'(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
-                         r'+\(size\/max(?: +total\/threshold\/drops\))?.*$')
+        p19 = regex_engine.compile(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
+                                   r'(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
+                                   r'+\(size\/max(?: +total\/threshold\/drops\))?.*$')
 
         # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p20 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
-                         r' *(?P<in_rate>[0-9]+) *bits/sec,'
-                         r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
+        p20 = regex_engine.compile(r'^(?P<load_interval>[0-9\#]+)'
+                                   r' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
+                                   r' *(?P<in_rate>[0-9]+) *bits/sec,'
+                                   r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
 
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *output *rate'
-                         r' *(?P<out_rate>[0-9]+) *bits/sec,'
-                         r' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
+        p21 = regex_engine.compile(r'^(?P<load_interval>[0-9\#]+)'
+                                   r' *(minute|second|minutes|seconds) *output *rate'
+                                   r' *(?P<out_rate>[0-9]+) *bits/sec,'
+                                   r' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
 
         # 0 packets input, 0 bytes, 0 no buffer
         # 13350 packets input, 2513375 bytes
-        p22 = re.compile(r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
-                         r'+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$')
+        p22 = regex_engine.compile(r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
+                                   r'+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$')
 
         # Received 4173 broadcasts (0 IP multicasts)
         # Received 535996 broadcasts (535961 multicasts)
-        p23 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
-                         r'\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        p23 = regex_engine.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
+                                   r'\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
 
         # 0 runts, 0 giants, 0 throttles
-        p24 = re.compile(r'^(?P<in_runts>[0-9]+) *runts,'
-                         r' *(?P<in_giants>[0-9]+) *giants,'
-                         r' *(?P<in_throttles>[0-9]+) *throttles$')
+        p24 = regex_engine.compile(r'^(?P<in_runts>[0-9]+) *runts,'
+                                   r' *(?P<in_giants>[0-9]+) *giants,'
+                                   r' *(?P<in_throttles>[0-9]+) *throttles$')
 
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p25 = re.compile(r'^(?P<in_errors>[0-9]+) +input +errors, +'
-                         r'(?P<in_crc_errors>[0-9]+) +CRC, +'
-                         r'(?P<in_frame>[0-9]+) +frame, +'
-                         r'(?P<in_overrun>[0-9]+) +overrun, +'
-                         r'(?P<in_ignored>[0-9]+) +ignored'
-                         r'(, *(?P<in_abort>[0-9]+) +abort)?$')
+        p25 = regex_engine.compile(r'^(?P<in_errors>[0-9]+) +input +errors, +'
+                                   r'(?P<in_crc_errors>[0-9]+) +CRC, +'
+                                   r'(?P<in_frame>[0-9]+) +frame, +'
+                                   r'(?P<in_overrun>[0-9]+) +overrun, +'
+                                   r'(?P<in_ignored>[0-9]+) +ignored'
+                                   r'(, *(?P<in_abort>[0-9]+) +abort)?$')
 
         # 0 watchdog, 535961 multicast, 0 pause input
-        p26 = re.compile(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
-                         r'(?P<in_multicast_pkts>[0-9]+) +multicast, +'
-                         r'(?P<in_pause_input>[0-9]+) +pause +input$')
+        p26 = regex_engine.compile(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
+                                   r'(?P<in_multicast_pkts>[0-9]+) +multicast, +'
+                                   r'(?P<in_pause_input>[0-9]+) +pause +input$')
 
         # 0 input packets with dribble condition detected
-        p27 = re.compile(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
-                         r'dribble +condition +detected$')
+        p27 = regex_engine.compile(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
+                                   r'dribble +condition +detected$')
 
         # 23376 packets output, 3642296 bytes, 0 underruns
         # 13781 packets output, 2169851 bytes
-        p28 = re.compile(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
-                         r'+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
+        p28 = regex_engine.compile(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
+                                   r'+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
 
         # Output 0 broadcasts (55 multicasts)
-        p29 = re.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcasts +'
-                         r'\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        p29 = regex_engine.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcasts +'
+                                   r'\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
 
         # 0 output errors, 0 collisions, 2 interface resets
         # 0 output errors, 0 interface resets
-        p30 = re.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
-                         r'( *(?P<out_collision>[0-9]+) +collisions,)? +'
-                         r'(?P<out_interface_resets>[0-9]+) +interface +resets$')
+        p30 = regex_engine.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
+                                   r'( *(?P<out_collision>[0-9]+) +collisions,)? +'
+                                   r'(?P<out_interface_resets>[0-9]+) +interface +resets$')
 
         # 0 unknown protocol drops
-        p31 = re.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
-                         r'unknown +protocol +drops$')
+        p31 = regex_engine.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
+                                   r'unknown +protocol +drops$')
 
         # 0 babbles, 0 late collision, 0 deferred
-        p32 = re.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
-                         r'(?P<out_late_collision>[0-9]+) +late +collision, +'
-                         r'(?P<out_deferred>[0-9]+) +deferred$')
+        p32 = regex_engine.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
+                                   r'(?P<out_late_collision>[0-9]+) +late +collision, +'
+                                   r'(?P<out_deferred>[0-9]+) +deferred$')
 
         # 0 lost carrier, 0 no carrier, 0 pause output
         # 0 lost carrier, 0 no carrier
-        p33 = re.compile(r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
-                         r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
-                         r'pause +output)?$')
+        p33 = regex_engine.compile(r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
+                                   r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
+                                   r'pause +output)?$')
 
         # 0 output buffer failures, 0 output buffers swapped out
-        p34 = re.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
-                         r'(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
+        p34 = regex_engine.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
+                                   r'(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
 
         # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
         # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-        p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                         r'(?P<unnumbered_intf>[\w\/\.]+) +'
-                         r'\((?P<unnumbered_ip>[\w\.\:]+)\)$')
+        p35 = regex_engine.compile(r'^Interface +is +unnumbered. +Using +address +of +'
+                                   r'(?P<unnumbered_intf>[\w\/\.]+) +'
+                                   r'\((?P<unnumbered_ip>[\w\.\:]+)\)$')
 
         # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-        p36 = re.compile(r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
-                         r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$')
+        p36 = regex_engine.compile(r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
+                                   r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$')
 
         # VC Auto Creation Disabled.
-        p37 = re.compile(r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$')
+        p37 = regex_engine.compile(r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$')
 
         # VC idle disconnect time: 300 seconds
-        p38 = re.compile(r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
-                         r'seconds$')
+        p38 = regex_engine.compile(r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
+                                   r'seconds$')
 
         # AAL5 CRC errors : 0
-        p39 = re.compile(r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$')
+        p39 = regex_engine.compile(r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$')
 
         # AAL5 SAR Timeouts : 0
-        p40 = re.compile(r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$')
+        p40 = regex_engine.compile(r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$')
 
         # AAL5 Oversized SDUs : 0
-        p41 = re.compile(r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$')
+        p41 = regex_engine.compile(r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$')
 
         # LCP Closed
         # LCP Closed, loopback not set
-        p42 = re.compile(r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$')
+        p42 = regex_engine.compile(r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$')
 
         # Base PPPoATM vaccess
-        p43 = re.compile(r'^Base PPPoATM +(?P<base_pppoatm>\S+)$')
+        p43 = regex_engine.compile(r'^Base PPPoATM +(?P<base_pppoatm>\S+)$')
 
         # Vaccess status 0x44, loopback not set
-        p44 = re.compile(r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
-                         r'loopback\s+(?P<loopback>[\S\s]+)$')
+        p44 = regex_engine.compile(r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
+                                   r'loopback\s+(?P<loopback>[\S\s]+)$')
 
         # DTR is pulsed for 5 seconds on reset
-        p45 = re.compile(r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
-                         r'seconds +on +reset$')
+        p45 = regex_engine.compile(r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
+                                   r'seconds +on +reset$')
 
         # Tunnel source 1.1.10.11
         # Tunnel source 1.1.1.1 (Loopback1)
@@ -525,48 +526,48 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Tunnel source 172.16.121.201 (GigabitEthernet0/0/1.91), destination 172.16.64.36
         # Tunnel source UNKNOWN, destination 1.2.3.4
         #
-        p46 = re.compile(r'^Tunnel +source +(?P<tunnel_source_ip>([a-fA-F\d\:UNKNOWN|0-9\.]+)?),?\s?'
-                         r'(?P<tunnel_source_interface>\([\w\d.\/]+\))?,?\s?'
-                         r'(destination +)?(?P<tunnel_destination_ip>([a-fA-F\d\:0-9\.]+)?)')
+        p46 = regex_engine.compile(r'^Tunnel +source +(?P<tunnel_source_ip>([a-fA-F\d\:UNKNOWN|0-9\.]+)?),?\s?'
+                                   r'(?P<tunnel_source_interface>\([\w\d.\/]+\))?,?\s?'
+                                   r'(destination +)?(?P<tunnel_destination_ip>([a-fA-F\d\:0-9\.]+)?)')
 
         # Tunnel protocol/transport AURP
-        p47 = re.compile(r'^Tunnel +protocol/transport +(?P<tunnel_protocol>[\w\/]+)')
+        p47 = regex_engine.compile(r'^Tunnel +protocol/transport +(?P<tunnel_protocol>[\w\/]+)')
 
         # Tunnel TTL 255
-        p48 = re.compile(r'^Tunnel +TTL +(?P<tunnel_ttl>\d+)')
+        p48 = regex_engine.compile(r'^Tunnel +TTL +(?P<tunnel_ttl>\d+)')
 
         # Tunnel transport MTU 1480 bytes
-        p49 = re.compile(r'^Tunnel +transport +MTU +(?P<tunnel_transport_mtu>\d+)')
+        p49 = regex_engine.compile(r'^Tunnel +transport +MTU +(?P<tunnel_transport_mtu>\d+)')
 
         # Tunnel transmit bandwidth 10000000 (kbps)
-        p50 = re.compile(r'^Tunnel +transmit +bandwidth +(?P<tunnel_transmit_bandwidth>\d+)')
+        p50 = regex_engine.compile(r'^Tunnel +transmit +bandwidth +(?P<tunnel_transmit_bandwidth>\d+)')
 
         # Tunnel receive bandwidth 10000000 (kbps)
-        p51 = re.compile(r'^Tunnel +receive +bandwidth +(?P<tunnel_receive_bandwidth>\d+)')
+        p51 = regex_engine.compile(r'^Tunnel +receive +bandwidth +(?P<tunnel_receive_bandwidth>\d+)')
 
         # Tunnel Protection profile
-        p52 = re.compile(r'^Tunnel +protection +via +(?P<tunnel_protection>[\w]+) +\(profile \"(?P<tunnel_profile>[\w]+)\"\)')
+        p52 = regex_engine.compile(r'^Tunnel +protection +via +(?P<tunnel_protection>[\w]+) +\(profile \"(?P<tunnel_profile>[\w]+)\"\)')
 
         # 3 carrier transitions
-        p53 = re.compile(r'^(?P<carrier_transitions>\d+)\s+carrier transitions$')
+        p53 = regex_engine.compile(r'^(?P<carrier_transitions>\d+)\s+carrier transitions$')
 
         # Carrier delay is 10 sec
-        p54 = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
+        p54 = regex_engine.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
 
         # Asymmetric Carrier-Delay Up Timer is 2 sec
         # Asymmetric Carrier-Delay Down Timer is 10 sec
-        p55 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
-                            r' +Timer +is +(?P<carrier_delay>\d+).*$')
+        p55 = regex_engine.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
+                                      r' +Timer +is +(?P<carrier_delay>\d+).*$')
 
         # Peer IP 192.0.2.3, VC ID 1
-        p56 = re.compile(r'^Peer IP (?P<peer_ip>[\d\.]+), VC ID (?P<vc_id>\d+)$')
+        p56 = regex_engine.compile(r'^Peer IP (?P<peer_ip>[\d\.]+), VC ID (?P<vc_id>\d+)$')
 
         # RX
         # TX
-        p57 = re.compile(r'^(?P<rx_tx>RX|TX)$')
+        p57 = regex_engine.compile(r'^(?P<rx_tx>RX|TX)$')
 
         # 0 packets 0 bytes 0 drops
-        p58 = re.compile(r'^(?P<pkts>\d+) packets (?P<octets>\d+) bytes (?P<drops>\d+) drops$')
+        p58 = regex_engine.compile(r'^(?P<pkts>\d+) packets (?P<octets>\d+) bytes (?P<drops>\d+) drops$')
 
         interface_dict = {}
         unnumbered_dict = {}
@@ -748,19 +749,19 @@ class ShowInterfaces(ShowInterfacesSchema):
                 if not rest:
                     continue
                 # Vlan ID 20, medium is p2p
-                m1 = re.compile(r'(Vlan +ID +(?P<first_dot1q>[0-9]+),)?'
-                                 r' *medium +is +(?P<medium>[a-z0-9]+)$').match(rest)
+                m1 = regex_engine.compile(r'(Vlan +ID +(?P<first_dot1q>[0-9]+),)?'
+                                           r' *medium +is +(?P<medium>[a-z0-9]+)$').match(rest)
                 # will update key when output is valid
-                m2 = re.compile(r'loopback +(?P<loopback>[\w\s]+)$').match(rest)
+                m2 = regex_engine.compile(r'loopback +(?P<loopback>[\w\s]+)$').match(rest)
 
                 #  outer ID  10, inner ID 20
-                m3 = re.compile(r'outer +ID +(?P<first>[0-9]+), +'
-                                 r'inner +ID (?P<second>[0-9]+)$').match(rest)
+                m3 = regex_engine.compile(r'outer +ID +(?P<first>[0-9]+), +'
+                                           r'inner +ID (?P<second>[0-9]+)$').match(rest)
 
                 # Vlan ID  1., loopback not set
                 # Vlan ID  105.
-                m4 = re.compile(r'Vlan +ID +(?P<first_dot1q>\d+).'
-                                 r'|(?:,(?P<rest>[\s\w]+))$').match(rest)
+                m4 = regex_engine.compile(r'Vlan +ID +(?P<first_dot1q>\d+).'
+                                           r'|(?:,(?P<rest>[\s\w]+))$').match(rest)
 
                 if m1:
                     first_dot1q = m1.groupdict()['first_dot1q']
@@ -818,7 +819,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                     else:
                         interface_dict[interface]['auto_negotiate'] = False
                 if media_type:
-                    unknown = re.search(r'[U|u]nknown',media_type)
+                    unknown = regex_engine.search(r'[U|u]nknown',media_type)
                     if unknown:
                         interface_dict[interface]['media_type'] = 'unknown'
                     else:
@@ -1387,7 +1388,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                                 interface_dict[intf]['ipv4'] = {}
                             if ip not in interface_dict[intf]['ipv4']:
                                 interface_dict[intf]['ipv4'][ip] = {}
-                            m = re.search(r'([\w\.\:]+)\/(\d+)', ip)
+                            m = regex_engine.search(r'([\w\.\:]+)\/(\d+)', ip)
                             interface_dict[intf]['ipv4'][ip]['ip'] = m.groups()[0]
                             interface_dict[intf]['ipv4'][ip]['prefix_length'] = m.groups()[1]
                             interface_dict[intf]['ipv4']['unnumbered'] = {}
@@ -1480,9 +1481,13 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
 
             # Building the schema out of the parsergen output
             if res.entries:
+                # share the repeated values, see utils/string_pool.py
+                pool = string_pool.is_enabled()
                 for intf, intf_dict in res.entries.items():
                     intf = Common.convert_intf_name(intf)
                     del intf_dict['Interface']
+                    if pool:
+                        string_pool.intern_values(intf_dict)
                     parsed_dict.setdefault('interface', {}).update({intf: intf_dict})
 
         return (parsed_dict)
@@ -1628,7 +1633,7 @@ class ShowIpInterfaceBriefPipeIp(ShowIpInterfaceBriefPipeIpSchema):
         interface_dict = {}
 
         # GigabitEthernet0/0     10.1.18.80      YES manual up                    up
-        p = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) '
+        p = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) '
             r'+(?P<ip_address>[a-z0-9\.]+) +(?P<interface_ok>[A-Z]+) '
             r'+(?P<method>[a-zA-Z]+) +(?P<interface_status>[a-z\s]+) '
             r'+(?P<protocol_status>[a-z]+)$')
@@ -1731,120 +1736,120 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
             out = output
 
         # Name: Gi1/0/2
-        p1 = re.compile(r'^Name: +(?P<intf>[\w\/\.\-]+)$')
+        p1 = regex_engine.compile(r'^Name: +(?P<intf>[\w\/\.\-]+)$')
 
         # Switchport: Enabled
-        p2 = re.compile(r'^Switchport: +(?P<switchport_enable>\w+)$')
+        p2 = regex_engine.compile(r'^Switchport: +(?P<switchport_enable>\w+)$')
 
         # Administrative Mode: trunk
-        p3 = re.compile(r'^Administrative +Mode: +(?P<switchport_mode>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^Administrative +Mode: +(?P<switchport_mode>[\w\s]+)$')
 
         # Operational Mode: trunk (member of bundle Po12)
         # Operational Mode: down (suspended member of bundle Po12)
-        p4 = re.compile(r'^Operational +Mode: +(?P<operational_mode>[\w\s]+)'
-                        r'( +\((?P<dummy>[\w\s]+)? *member +of +bundle '
-                        r'+(?P<port_channel_int>[\w\/\.\-]+)\))?$')
+        p4 = regex_engine.compile(r'^Operational +Mode: +(?P<operational_mode>[\w\s]+)'
+                                  r'( +\((?P<dummy>[\w\s]+)? *member +of +bundle '
+                                  r'+(?P<port_channel_int>[\w\/\.\-]+)\))?$')
 
         # Administrative Trunking Encapsulation: dot1q
-        p5 = re.compile(r'^Administrative +Trunking +Encapsulation: +'
-                        r'(?P<encapsulation>\w+)$')
+        p5 = regex_engine.compile(r'^Administrative +Trunking +Encapsulation: +'
+                                  r'(?P<encapsulation>\w+)$')
 
         # Operational Trunking Encapsulation: dot1q
-        p6 = re.compile(r'^Operational +Trunking +Encapsulation: +'
-                        r'(?P<encapsulation>\w+)$')
+        p6 = regex_engine.compile(r'^Operational +Trunking +Encapsulation: +'
+                                  r'(?P<encapsulation>\w+)$')
 
         # Negotiation of Trunking: On
-        p7 = re.compile(r'^Negotiation +of +Trunking: +(?P<negotiation_of_trunk>\w+)$')
+        p7 = regex_engine.compile(r'^Negotiation +of +Trunking: +(?P<negotiation_of_trunk>\w+)$')
 
         # Access Mode VLAN: 1 (default)
         # Access Mode VLAN: 100 (Falback-Data)
-        p8 = re.compile(r'^Access +Mode +VLAN: +(?P<access_vlan>[\d\-]+)'
-                        r'( *\((?P<access_vlan_name>.+)\))?$')
+        p8 = regex_engine.compile(r'^Access +Mode +VLAN: +(?P<access_vlan>[\d\-]+)'
+                                  r'( *\((?P<access_vlan_name>.+)\))?$')
 
         # Trunking Native Mode VLAN: 1 (default)
-        p9 = re.compile(r'^Trunking +Native +Mode +VLAN: +(?P<native_vlan>[\d\-]+)'
-                        r'( *\((?P<native_vlan_name>.+)\))?$')
+        p9 = regex_engine.compile(r'^Trunking +Native +Mode +VLAN: +(?P<native_vlan>[\d\-]+)'
+                                  r'( *\((?P<native_vlan_name>.+)\))?$')
 
         # Administrative Native VLAN tagging: enabled
-        p10 = re.compile(r'^Administrative +Native +VLAN +tagging: +'
-                         r'(?P<tagging>\w+)$')
+        p10 = regex_engine.compile(r'^Administrative +Native +VLAN +tagging: +'
+                                   r'(?P<tagging>\w+)$')
 
         # Voice VLAN: none
         # Voice VLAN: 100 (Fallback-Voice)
-        p11 = re.compile(r'^Voice +VLAN: +(?P<vlan>[\d\-]+)'
-                         r'( *\((?P<voice_vlan_name>.+)\))?$')
+        p11 = regex_engine.compile(r'^Voice +VLAN: +(?P<vlan>[\d\-]+)'
+                                   r'( *\((?P<voice_vlan_name>.+)\))?$')
 
         # Administrative private-vlan host-association: none
-        p12 = re.compile(r'^Administrative +private-vlan +'
-                         r'host-association: +(?P<ret>[\w\-]+)$')
+        p12 = regex_engine.compile(r'^Administrative +private-vlan +'
+                                   r'host-association: +(?P<ret>[\w\-]+)$')
 
         # Administrative private-vlan mapping: none
-        p13 = re.compile(r'^Administrative +private-vlan +'
-                         r'mapping: +(?P<ret>[\w\-]+)$')
+        p13 = regex_engine.compile(r'^Administrative +private-vlan +'
+                                   r'mapping: +(?P<ret>[\w\-]+)$')
 
         # Administrative private-vlan trunk native VLAN: none
-        p14 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +native +VLAN: +(?P<ret>[\w\-]+)$')
+        p14 = regex_engine.compile(r'^Administrative +private-vlan +'
+                                   r'trunk +native +VLAN: +(?P<ret>[\w\-]+)$')
 
         # Administrative private-vlan trunk Native VLAN tagging: enabled
-        p15 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +Native +VLAN +tagging: +(?P<ret>[\w\-]+)$')
+        p15 = regex_engine.compile(r'^Administrative +private-vlan +'
+                                   r'trunk +Native +VLAN +tagging: +(?P<ret>[\w\-]+)$')
 
         # Administrative private-vlan trunk encapsulation: dot1q
-        p16 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +encapsulation: +(?P<ret>[\w\-]+)$')
+        p16 = regex_engine.compile(r'^Administrative +private-vlan +'
+                                   r'trunk +encapsulation: +(?P<ret>[\w\-]+)$')
 
         # Administrative private-vlan trunk normal VLANs: none
-        p17 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +normal +VLANs: +(?P<ret>[\w\-]+)$')
+        p17 = regex_engine.compile(r'^Administrative +private-vlan +'
+                                   r'trunk +normal +VLANs: +(?P<ret>[\w\-]+)$')
 
         # Administrative private-vlan trunk associations: none
-        p18 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +associations: +(?P<ret>[\w\-]+)$')
+        p18 = regex_engine.compile(r'^Administrative +private-vlan +'
+                                   r'trunk +associations: +(?P<ret>[\w\-]+)$')
 
         # Administrative private-vlan trunk mappings: none
         # Administrative private-vlan trunk mappings:
-        p19 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +mappings:( *(?P<ret>[\w\-]+))?$')
+        p19 = regex_engine.compile(r'^Administrative +private-vlan +'
+                                   r'trunk +mappings:( *(?P<ret>[\w\-]+))?$')
 
         # Operational private-vlan: none
         # Operational private-vlan:
-        p20 = re.compile(r'^Operational +private-vlan:'
-                         r'( *(?P<private_operational>[\w\-]+))?$')
+        p20 = regex_engine.compile(r'^Operational +private-vlan:'
+                                   r'( *(?P<private_operational>[\w\-]+))?$')
 
         # Trunking VLANs Enabled: 200-211
         # Trunking VLANs Enabled: 100,101,110-120,121,130,170,180,
-        p21 = re.compile(r'^Trunking +VLANs +Enabled: +(?P<trunk_vlans>[\w\-\,\s]+)$')
+        p21 = regex_engine.compile(r'^Trunking +VLANs +Enabled: +(?P<trunk_vlans>[\w\-\,\s]+)$')
 
         # 1111,2222,3333, 500-55,
-        p21_1 = re.compile(r'^(?P<trunk_vlans>[\d\,\-]+)$')
+        p21_1 = regex_engine.compile(r'^(?P<trunk_vlans>[\d\,\-]+)$')
 
         # Pruning VLANs Enabled: 2-1001
-        p22 = re.compile(r'^Pruning +VLANs +Enabled: +(?P<pruning_vlans>[\w\-]+)$')
+        p22 = regex_engine.compile(r'^Pruning +VLANs +Enabled: +(?P<pruning_vlans>[\w\-]+)$')
 
         # Capture Mode Disabled
-        p23 = re.compile(r'^Capture +Mode +(?P<mode>\w+)$')
+        p23 = regex_engine.compile(r'^Capture +Mode +(?P<mode>\w+)$')
 
         # Capture VLANs Allowed: ALL
-        p24 = re.compile(r'^Capture +VLANs +Allowed: +(?P<capture_vlans>[\w\-]+)$')
+        p24 = regex_engine.compile(r'^Capture +VLANs +Allowed: +(?P<capture_vlans>[\w\-]+)$')
 
         # Protected: false
-        p25 = re.compile(r'^Protected: +(?P<protected>\w+)$')
+        p25 = regex_engine.compile(r'^Protected: +(?P<protected>\w+)$')
 
         # Unknown unicast blocked: disabled
-        p26 = re.compile(r'^Unknown +unicast +blocked: +(?P<block>\w+)$')
+        p26 = regex_engine.compile(r'^Unknown +unicast +blocked: +(?P<block>\w+)$')
 
         # Unknown multicast blocked: disabled
-        p27 = re.compile(r'^Unknown +multicast +blocked: +(?P<block>\w+)$')
+        p27 = regex_engine.compile(r'^Unknown +multicast +blocked: +(?P<block>\w+)$')
 
         # Appliance trust: none
-        p28 = re.compile(r'^Appliance +trust: +(?P<trust>[\w\-]+)$')
+        p28 = regex_engine.compile(r'^Appliance +trust: +(?P<trust>[\w\-]+)$')
 
         #Administrative Dot1q Ethertype: 0x9100
-        p29 = re.compile(r'^Administrative +Dot1q +Ethertype: +(?P<admin_ethertype>\w+)$')
+        p29 = regex_engine.compile(r'^Administrative +Dot1q +Ethertype: +(?P<admin_ethertype>\w+)$')
 
         #Operational Dot1q Ethertype: 0x9100
-        p30 = re.compile(r'^Operational +Dot1q +Ethertype: +(?P<oper_ethertype>\w+)$')        
+        p30 = regex_engine.compile(r'^Operational +Dot1q +Ethertype: +(?P<oper_ethertype>\w+)$')        
 
         ret_dict = {}
         private_trunk_mappings = None
@@ -2072,7 +2077,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # 10 (VLAN0010) 100 (VLAN0100)
             if isinstance(private_trunk_mappings, str):
-                p19_1 = re.compile(r'^(?P<mappings>[\w\(\)\s]+)$')
+                p19_1 = regex_engine.compile(r'^(?P<mappings>[\w\(\)\s]+)$')
                 m = p19_1.match(line)
                 if m:
                     ret = m.groupdict()['mappings']
@@ -2104,7 +2109,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # 10 (VLAN0010) 100 (VLAN0100)
             if isinstance(private_operational, str):
-                p20_1 = re.compile(r'^(?P<private_operational>[\w\(\)\s]+)$')
+                p20_1 = regex_engine.compile(r'^(?P<private_operational>[\w\(\)\s]+)$')
                 m = p20_1.match(line)
                 if m:
                     ret = m.groupdict()['private_operational']
@@ -2287,9 +2292,9 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
             # Vlan211 is up, line protocol is up
             # GigabitEthernet2 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
-                            r' +(?P<enabled>[\w\s]+),'
-                            r' +line +protocol +is +(?P<oper_status>\w+)$')
+            p1 =  regex_engine.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
+                                      r' +(?P<enabled>[\w\s]+),'
+                                      r' +line +protocol +is +(?P<oper_status>\w+)$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -2306,8 +2311,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Internet address is 192.168.76.1/24
-            p2 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                            r'\/(?P<prefix_length>[0-9]+))$')
+            p2 = regex_engine.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                                      r'\/(?P<prefix_length>[0-9]+))$')
             m = p2.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -2328,8 +2333,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Interface is unnumbered. Using address of GigabitEthernet0/0.101 (10.1.98.10)
-            p2_0 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +(\S+)'
-                              r' +\((?P<ipv4>(?P<ip>[0-9\.]+))\)$')
+            p2_0 = regex_engine.compile(r'^Interface +is +unnumbered. +Using +address +of +(\S+)'
+                                        r' +\((?P<ipv4>(?P<ip>[0-9\.]+))\)$')
             m = p2_0.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -2347,8 +2352,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Secondary address 10.2.2.2/24
-            p2_1 = re.compile(r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                              r'\/(?P<prefix_length>[0-9]+))$')
+            p2_1 = regex_engine.compile(r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                                        r'\/(?P<prefix_length>[0-9]+))$')
             m = p2_1.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -2369,8 +2374,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
             # Internet address will be negotiated using DHCP
             # Internet address will be negotiated using IPCP
-            p2_2 = re.compile(r'^Internet +[A|a]ddress +will +be +negotiated '
-                              r'+using +(?P<negotiated>DHCP|IPCP)$')
+            p2_2 = regex_engine.compile(r'^Internet +[A|a]ddress +will +be +negotiated '
+                                        r'+using +(?P<negotiated>DHCP|IPCP)$')
             m = p2_2.match(line)
             if m:
                 negotiated_holder = m.groupdict()
@@ -2384,7 +2389,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Broadcast address is 255.255.255.255
-            p3 = re.compile(r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$')
+            p3 = regex_engine.compile(r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$')
             m = p3.match(line)
             if m:
                 if 'ipv4' in interface_dict[interface]:
@@ -2395,7 +2400,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
             # Address determined by configuration file
             # Address determined by non-volatile memory
-            p36 = re.compile(r'^Address +determined +by +(?P<file>[\w\s\-]+)$')
+            p36 = regex_engine.compile(r'^Address +determined +by +(?P<file>[\w\s\-]+)$')
             m = p36.match(line)
             if m:
                 interface_dict[interface]['address_determined_by'] = \
@@ -2403,7 +2408,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # MTU is 1500 bytes
-            p4 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
+            p4 = regex_engine.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
             m = p4.match(line)
             if m:
                 interface_dict[interface]['mtu'] = \
@@ -2411,13 +2416,13 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Helper address is not set
-            p5 = re.compile(r'^Helper +address +is +not +set$')
+            p5 = regex_engine.compile(r'^Helper +address +is +not +set$')
             m = p5.match(line)
             if m:
                 continue
 
             # Helper address is 10.1.1.1
-            p5_0 = re.compile(r'^Helper +address +is +(?P<address>[\d\.]+)$')
+            p5_0 = regex_engine.compile(r'^Helper +address +is +(?P<address>[\d\.]+)$')
             m = p5_0.match(line)
             if m:
                 interface_dict[interface]['helper_address'] = \
@@ -2425,7 +2430,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Helper addresses are 10.1.1.1
-            p5_1 = re.compile(r'^Helper +addresses +are +(?P<address>[\w\.\:\s]+)$')
+            p5_1 = regex_engine.compile(r'^Helper +addresses +are +(?P<address>[\w\.\:\s]+)$')
             m = p5_1.match(line)
             if m:
                 helper_flag = True
@@ -2437,7 +2442,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # 10.2.2.2
-            p5_2 = re.compile(r'^(?P<address>[\d\.]+)$')
+            p5_2 = regex_engine.compile(r'^(?P<address>[\d\.]+)$')
             m = p5_2.match(line)
             if m:
                 if helper_flag:
@@ -2447,7 +2452,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 helper_flag = False
 
             # Directed broadcast forwarding is disabled
-            p6 = re.compile(r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$')
+            p6 = regex_engine.compile(r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$')
             m = p6.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2457,7 +2462,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
-            p41 = re.compile(r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$')
+            p41 = regex_engine.compile(r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$')
             m = p41.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups'])
@@ -2472,8 +2477,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
             # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
             #       224.0.0.5  <----- this extra line
             if read_multicast_reserved_lines:
-                if not re.match(r"[^\d. ]", line):
-                    p41_1 = re.compile(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
+                if not regex_engine.match(r"[^\d. ]", line):
+                    p41_1 = regex_engine.compile(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
                     m = p41_1.findall(line)
                     multicast_groups.extend(m)
                     continue
@@ -2483,8 +2488,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     read_multicast_reserved_lines = False
 
             # Outgoing Common access list is not set
-            p7 = re.compile(r'^Outgoing +Common +access +list +is +'
-                            r'(?P<access_list>.+)$')
+            p7 = regex_engine.compile(r'^Outgoing +Common +access +list +is +'
+                                      r'(?P<access_list>.+)$')
             m = p7.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
@@ -2493,8 +2498,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Outgoing access list is not set
-            p8 = re.compile(r'^Outgoing +access +list +is +'
-                            r'(?P<access_list>.+)$')
+            p8 = regex_engine.compile(r'^Outgoing +access +list +is +'
+                                      r'(?P<access_list>.+)$')
             m = p8.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
@@ -2503,8 +2508,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Inbound Common access list is not set
-            p9 = re.compile(r'^Inbound +Common +access +list +is +'
-                            r'(?P<access_list>.+)$')
+            p9 = regex_engine.compile(r'^Inbound +Common +access +list +is +'
+                                      r'(?P<access_list>.+)$')
             m = p9.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
@@ -2513,8 +2518,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Inbound  access list is not set
-            p10 = re.compile(r'^Inbound +access +list +is +'
-                            r'(?P<access_list>.+)$')
+            p10 = regex_engine.compile(r'^Inbound +access +list +is +'
+                                      r'(?P<access_list>.+)$')
             m = p10.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
@@ -2523,8 +2528,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Proxy ARP is enabled
-            p11 = re.compile(r'^Proxy +ARP +is +'
-                            r'(?P<status>\w+)$')
+            p11 = regex_engine.compile(r'^Proxy +ARP +is +'
+                                      r'(?P<status>\w+)$')
             m = p11.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2534,8 +2539,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Local Proxy ARP is disabled
-            p12 = re.compile(r'^Local +Proxy +ARP +is +'
-                            r'(?P<status>\w+)$')
+            p12 = regex_engine.compile(r'^Local +Proxy +ARP +is +'
+                                      r'(?P<status>\w+)$')
             m = p12.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2545,16 +2550,16 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Security level is default
-            p13 = re.compile(r'^Security +level +is +'
-                            r'(?P<level>\w+)$')
+            p13 = regex_engine.compile(r'^Security +level +is +'
+                                      r'(?P<level>\w+)$')
             m = p13.match(line)
             if m:
                 interface_dict[interface]['security_level'] = m.groupdict()['level']
                 continue
 
             # Split horizon is enabled
-            p14 = re.compile(r'^Split +horizon +is +'
-                            r'(?P<status>\w+)$')
+            p14 = regex_engine.compile(r'^Split +horizon +is +'
+                                      r'(?P<status>\w+)$')
             m = p14.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2564,8 +2569,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # ICMP redirects are always sent
-            p15 = re.compile(r'^ICMP +redirects +are +'
-                            r'(?P<sent>[\w\s]+)$')
+            p15 = regex_engine.compile(r'^ICMP +redirects +are +'
+                                      r'(?P<sent>[\w\s]+)$')
             m = p15.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
@@ -2576,8 +2581,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # ICMP unreachables are always sent
-            p16 = re.compile(r'^ICMP +unreachables +are +'
-                             r'(?P<sent>[\w\s]+)$')
+            p16 = regex_engine.compile(r'^ICMP +unreachables +are +'
+                                       r'(?P<sent>[\w\s]+)$')
             m = p16.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
@@ -2588,8 +2593,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # ICMP mask replies are never sent
-            p17 = re.compile(r'^ICMP +mask +replies +are +'
-                             r'(?P<sent>[\w\s]+)$')
+            p17 = regex_engine.compile(r'^ICMP +mask +replies +are +'
+                                       r'(?P<sent>[\w\s]+)$')
             m = p17.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
@@ -2600,8 +2605,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP fast switching is enabled
-            p18 = re.compile(r'^IP +fast +switching +is +'
-                             r'(?P<status>\w+)$')
+            p18 = regex_engine.compile(r'^IP +fast +switching +is +'
+                                       r'(?P<status>\w+)$')
             m = p18.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2611,8 +2616,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP Flow switching is disabled
-            p19 = re.compile(r'^IP +Flow +switching +is +'
-                             r'(?P<status>\w+)$')
+            p19 = regex_engine.compile(r'^IP +Flow +switching +is +'
+                                       r'(?P<status>\w+)$')
             m = p19.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2622,8 +2627,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP CEF switching is enabled
-            p20 = re.compile(r'^IP +CEF +switching +is +'
-                             r'(?P<status>\w+)$')
+            p20 = regex_engine.compile(r'^IP +CEF +switching +is +'
+                                       r'(?P<status>\w+)$')
             m = p20.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2633,21 +2638,21 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP CEF switching turbo vector
-            p21 = re.compile(r'^IP +CEF +switching +turbo +vector$')
+            p21 = regex_engine.compile(r'^IP +CEF +switching +turbo +vector$')
             m = p21.match(line)
             if m:
                 interface_dict[interface]['ip_cef_switching_turbo_vector'] = True
                 continue
 
             # IP Null turbo vector
-            p22 = re.compile(r'^IP +Null +turbo +vector$')
+            p22 = regex_engine.compile(r'^IP +Null +turbo +vector$')
             m = p22.match(line)
             if m:
                 interface_dict[interface]['ip_null_turbo_vector'] = True
                 continue
 
             # VPN Routing/Forwarding "Mgmt-vrf"
-            p23 = re.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
+            p23 = regex_engine.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
             m = p23.match(line)
             if m:
                 interface_dict[interface]['vrf'] = m.groupdict()['vrf']
@@ -2655,15 +2660,15 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
             # Associated unicast routing topologies:
             #     Topology "base", operation state is UP
-            p24 = re.compile(r'^Associated +unicast +routing +topologies:$')
+            p24 = regex_engine.compile(r'^Associated +unicast +routing +topologies:$')
             m = p24.match(line)
             if m:
                 if 'unicast_routing_topologies' not in interface_dict[interface]:
                     interface_dict[interface]['unicast_routing_topologies'] = {}
                 continue
 
-            p24_1 = re.compile(r'^Topology +\"(?P<topo>\w+)\", +'
-                            r'operation +state +is +(?P<topo_status>\w+)$')
+            p24_1 = regex_engine.compile(r'^Topology +\"(?P<topo>\w+)\", +'
+                                      r'operation +state +is +(?P<topo_status>\w+)$')
             m = p24_1.match(line)
             if m:
                 if 'unicast_routing_topologies' in interface_dict[interface]:
@@ -2680,8 +2685,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP multicast fast switching is disabled
-            p25 = re.compile(r'^IP +multicast +fast +switching +is +'
-                             r'(?P<status>\w+)$')
+            p25 = regex_engine.compile(r'^IP +multicast +fast +switching +is +'
+                                       r'(?P<status>\w+)$')
             m = p25.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2691,8 +2696,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP multicast distributed fast switching is disabled
-            p25 = re.compile(r'^IP +multicast +distributed +fast +switching +is +'
-                             r'(?P<status>\w+)$')
+            p25 = regex_engine.compile(r'^IP +multicast +distributed +fast +switching +is +'
+                                       r'(?P<status>\w+)$')
             m = p25.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2702,7 +2707,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP route-cache flags are Fast, CEF
-            p26 = re.compile(r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$')
+            p26 = regex_engine.compile(r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$')
             m = p26.match(line)
             if m:
                 ret = m.groupdict()['flags'].split(',')
@@ -2711,8 +2716,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Router Discovery is disabled
-            p27 = re.compile(r'^Router +Discovery +is +'
-                             r'(?P<status>\w+)$')
+            p27 = regex_engine.compile(r'^Router +Discovery +is +'
+                                       r'(?P<status>\w+)$')
             m = p27.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2722,8 +2727,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP output packet accounting is disabled
-            p28 = re.compile(r'^IP +output +packet +accounting +is +'
-                             r'(?P<status>\w+)$')
+            p28 = regex_engine.compile(r'^IP +output +packet +accounting +is +'
+                                       r'(?P<status>\w+)$')
             m = p28.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2733,8 +2738,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP access violation accounting is disabled
-            p29 = re.compile(r'^IP +access +violation +accounting +is +'
-                             r'(?P<status>\w+)$')
+            p29 = regex_engine.compile(r'^IP +access +violation +accounting +is +'
+                                       r'(?P<status>\w+)$')
             m = p29.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2744,8 +2749,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # TCP/IP header compression is disabled
-            p30 = re.compile(r'^TCP\/IP +header +compression +is +'
-                             r'(?P<status>\w+)$')
+            p30 = regex_engine.compile(r'^TCP\/IP +header +compression +is +'
+                                       r'(?P<status>\w+)$')
             m = p30.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2755,8 +2760,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # RTP/IP header compression is disabled
-            p31 = re.compile(r'^RTP\/IP +header +compression +is +'
-                             r'(?P<status>\w+)$')
+            p31 = regex_engine.compile(r'^RTP\/IP +header +compression +is +'
+                                       r'(?P<status>\w+)$')
             m = p31.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2766,8 +2771,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Probe proxy name replies are disabled
-            p32 = re.compile(r'^Probe +proxy +name +replies +are +'
-                             r'(?P<status>\w+)$')
+            p32 = regex_engine.compile(r'^Probe +proxy +name +replies +are +'
+                                       r'(?P<status>\w+)$')
             m = p32.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2777,8 +2782,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Policy routing is disabled
-            p33 = re.compile(r'^Policy +routing +is +'
-                             r'(?P<status>\w+)$')
+            p33 = regex_engine.compile(r'^Policy +routing +is +'
+                                       r'(?P<status>\w+)$')
             m = p33.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2788,8 +2793,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Network address translation is disabled
-            p34 = re.compile(r'^Network +address +translation +is +'
-                             r'(?P<status>\w+)$')
+            p34 = regex_engine.compile(r'^Network +address +translation +is +'
+                                       r'(?P<status>\w+)$')
             m = p34.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2799,8 +2804,8 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # BGP Policy Mapping is disabled
-            p35 = re.compile(r'^BGP +Policy +Mapping +is +'
-                             r'(?P<status>\w+)$')
+            p35 = regex_engine.compile(r'^BGP +Policy +Mapping +is +'
+                                       r'(?P<status>\w+)$')
             m = p35.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
@@ -2811,7 +2816,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
             # Input features: MCI Check
             # Input features: QoS Classification, QoS Marking, MCI Check
-            p36 = re.compile(r'^Input +features: +(?P<input_feature>[\w\s\,]+)$')
+            p36 = regex_engine.compile(r'^Input +features: +(?P<input_feature>[\w\s\,]+)$')
             m = p36.match(line)
             if m:
                 features = m.groupdict()['input_feature'].split(',')
@@ -2820,7 +2825,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IPv4 WCCP Redirect outbound is disable
-            p37 = re.compile(r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$')
+            p37 = regex_engine.compile(r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$')
             m = p37.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
@@ -2834,7 +2839,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IPv4 WCCP Redirect inbound is disabled
-            p38 = re.compile(r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$')
+            p38 = regex_engine.compile(r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$')
             m = p38.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
@@ -2847,7 +2852,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['redirect_inbound'] = True
 
             # IPv4 WCCP Redirect exclude is disabled
-            p39 = re.compile(r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$')
+            p39 = regex_engine.compile(r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$')
             m = p39.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
@@ -2860,9 +2865,9 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['redirect_exclude'] = True
 
             # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
-            p40 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                             r'(?P<unnumbered_intf>[\w\/\-\.]+) +'
-                             r'\((?P<unnumbered_ip>[\w\.\:]+)\)$')
+            p40 = regex_engine.compile(r'^Interface +is +unnumbered. +Using +address +of +'
+                                       r'(?P<unnumbered_intf>[\w\/\-\.]+) +'
+                                       r'\((?P<unnumbered_ip>[\w\.\:]+)\)$')
             m = p40.match(line)
             if m:
                 unnumbered_dict[interface] = {}
@@ -2877,7 +2882,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                             if unnumbered_ip in address:
                                 ip_dict = interface_dict[interface].\
                                     setdefault('ipv4', {}).setdefault(address, {})
-                                m = re.search(r'([\w\.\:]+)\/(\d+)', address)
+                                m = regex_engine.search(r'([\w\.\:]+)\/(\d+)', address)
                                 ip_dict['ip'] = m.groups()[0]
                                 ip_dict['prefix_length'] = m.groups()[1]
                                 ip_dict['secondary'] = False
@@ -2976,9 +2981,9 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
 
             # Vlan211 is up, line protocol is up
             # GigabitEthernet1/0/1 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
-                             r' +(?P<enabled>[\w\s]+),'
-                             r' +line +protocol +is +(?P<oper_status>\w+)$')
+            p1 =  regex_engine.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
+                                       r' +(?P<enabled>[\w\s]+),'
+                                       r' +line +protocol +is +(?P<oper_status>\w+)$')
             m = p1.match(line)
             if m:
                 intf = m.groupdict()['interface']
@@ -3000,9 +3005,9 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
             # IPv6 is enabled, link-local address is FE80::257:D2FF:FE28:
             # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [TEN]
             # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [UNA/TEN]
-            p2 = re.compile(r'^IPv6 +is +(?P<status>\w+), +'
-                             r'link-local +address +is +(?P<link_local>[\w\:]+)'
-                             r'( *\[(?P<type>[\w\/]+)\])?$')
+            p2 = regex_engine.compile(r'^IPv6 +is +(?P<status>\w+), +'
+                                       r'link-local +address +is +(?P<link_local>[\w\:]+)'
+                                       r'( *\[(?P<type>[\w\/]+)\])?$')
             m = p2.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -3028,14 +3033,14 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
             # No Virtual link-local address(es):
             # Virtual link-local address(es):
             # FE80::5:73FF:FEA0:16 [UNA/OOD]
-            p21 = re.compile(r'^Virtual +link\-local +address\(es\)\:$')
+            p21 = regex_engine.compile(r'^Virtual +link\-local +address\(es\)\:$')
             m = p21.match(line)
             if m:
                 ipv6 = True
                 continue
 
-            p21_1 = re.compile(r'^(?P<ipv6>[\w\:]+)'
-                                r'( *\[(?P<type>[\w\/]+)\])?$')
+            p21_1 = regex_engine.compile(r'^(?P<ipv6>[\w\:]+)'
+                                          r'( *\[(?P<type>[\w\/]+)\])?$')
             m = p21_1.match(line)
             if m and ipv6:
                 if 'ipv6' not in ret_dict[intf]:
@@ -3060,7 +3065,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # Stateless address autoconfig enabled
-            p3 = re.compile(r'^Stateless +address +autoconfig +enabled$')
+            p3 = regex_engine.compile(r'^Stateless +address +autoconfig +enabled$')
             m = p3.match(line)
             if m:
                 ret_dict[intf]['autoconf'] = True
@@ -3069,15 +3074,15 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
             # Global unicast address(es):
             #   2001:10::14:1, subnet is 2001:10::14:0/112
             #   2001:DB8:3:3::3, subnet is 2001:DB8:3:3::/64 [ANY/TEN]
-            p4 = re.compile(r'^Global +unicast +address\(es\):$')
+            p4 = regex_engine.compile(r'^Global +unicast +address\(es\):$')
             m = p4.match(line)
             if m:
                 ipv6 = True
                 continue
 
-            p4_1 = re.compile(r'^(?P<ipv6>[\w\:]+), +subnet +is +(?P<dum1>(?P<dum2>[\w\:]+)'
-                               r'\/(?P<prefix_length>[0-9]+))'
-                               r'( *\[(?P<type>[\w\/]+)\])?$')
+            p4_1 = regex_engine.compile(r'^(?P<ipv6>[\w\:]+), +subnet +is +(?P<dum1>(?P<dum2>[\w\:]+)'
+                                         r'\/(?P<prefix_length>[0-9]+))'
+                                         r'( *\[(?P<type>[\w\/]+)\])?$')
             m = p4_1.match(line)
             if m and ipv6:
                 if 'ipv6' not in ret_dict[intf]:
@@ -3118,8 +3123,8 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             #     valid lifetime 2591911 preferred lifetime 604711
-            p4_2 = re.compile(r'^valid +lifetime +(?P<valid>\d+) +'
-                               r'preferred +lifetime +(?P<preferred>\d+)$')
+            p4_2 = regex_engine.compile(r'^valid +lifetime +(?P<valid>\d+) +'
+                                         r'preferred +lifetime +(?P<preferred>\d+)$')
             m = p4_2.match(line)
             if m and ipv6:
                 try:
@@ -3139,13 +3144,13 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
             #   FF02::1
             #   FF02::1:FF14:1
             #   FF02::1:FF28:1A71
-            p5 = re.compile(r'^Joined +group +address\(es\):$')
+            p5 = regex_engine.compile(r'^Joined +group +address\(es\):$')
             m = p5.match(line)
             if m:
                 ipv6 = False
                 continue
 
-            p5_1 = re.compile(r'^(?P<address>[\w\:]+)$')
+            p5_1 = regex_engine.compile(r'^(?P<address>[\w\:]+)$')
             m = p5_1.match(line)
             if m and not ipv6:
                 joined_group.append(m.groupdict()['address'])
@@ -3153,22 +3158,22 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # MTU is 1500 bytes
-            p6 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
+            p6 = regex_engine.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
             m = p6.match(line)
             if m:
                 ret_dict[intf]['mtu'] = int(m.groupdict()['mtu'])
                 continue
 
             # VPN Routing/Forwarding "VRF1"
-            p6 = re.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
+            p6 = regex_engine.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
             m = p6.match(line)
             if m:
                 ret_dict[intf]['vrf'] = m.groupdict()['vrf']
                 continue
 
             # ICMP error messages limited to one every 100 milliseconds
-            p7 = re.compile(r'^ICMP +error +messages +limited +to +one +'
-                             r'every +(?P<limited>\d+) +milliseconds$')
+            p7 = regex_engine.compile(r'^ICMP +error +messages +limited +to +one +'
+                                       r'every +(?P<limited>\d+) +milliseconds$')
             m = p7.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
@@ -3180,7 +3185,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ICMP redirects are enabled
-            p8 = re.compile(r'^ICMP +redirects +are +(?P<status>\w+)$')
+            p8 = regex_engine.compile(r'^ICMP +redirects +are +(?P<status>\w+)$')
             m = p8.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
@@ -3194,7 +3199,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ICMP unreachables are sent
-            p9 = re.compile(r'^ICMP +unreachables +are +(?P<status>[\w\s]+)$')
+            p9 = regex_engine.compile(r'^ICMP +unreachables +are +(?P<status>[\w\s]+)$')
             m = p9.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
@@ -3206,8 +3211,8 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND DAD is enabled, number of DAD attempts: 1
-            p10 = re.compile(r'^ND +DAD +is +(?P<status>\w+), +'
-                              r'number +of +DAD +attempts: +(?P<attempts>\d+)$')
+            p10 = regex_engine.compile(r'^ND +DAD +is +(?P<status>\w+), +'
+                                        r'number +of +DAD +attempts: +(?P<attempts>\d+)$')
             m = p10.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -3222,8 +3227,8 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND reachable time is 30000 milliseconds (using 30000)
-            p11 = re.compile(r'^ND +reachable +time +is (?P<time>\d+) +milliseconds'
-                              r' +\(using +(?P<use>\d+)\)$')
+            p11 = regex_engine.compile(r'^ND +reachable +time +is (?P<time>\d+) +milliseconds'
+                                        r' +\(using +(?P<use>\d+)\)$')
             m = p11.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -3233,8 +3238,8 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND NS retransmit interval is 1000 milliseconds
-            p12 = re.compile(r'^ND +NS +retransmit +interval +is'
-                              r' +(?P<interval>\d+) +milliseconds$')
+            p12 = regex_engine.compile(r'^ND +NS +retransmit +interval +is'
+                                        r' +(?P<interval>\d+) +milliseconds$')
             m = p12.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -3243,8 +3248,8 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND advertised reachable time is 0 (unspecified)
-            p13 = re.compile(r'^ND +advertised +reachable +time +is +(?P<time>\d+)'
-                              r' +\((?P<dummy>\S+)\)$')
+            p13 = regex_engine.compile(r'^ND +advertised +reachable +time +is +(?P<time>\d+)'
+                                        r' +\((?P<dummy>\S+)\)$')
             m = p13.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -3257,8 +3262,8 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND advertised retransmit interval is 0 (unspecified)
-            p14 = re.compile(r'^ND +advertised +retransmit +interval +is +(?P<time>\d+)'
-                              r' +\((?P<dummy>\S+)\)$')
+            p14 = regex_engine.compile(r'^ND +advertised +retransmit +interval +is +(?P<time>\d+)'
+                                        r' +\((?P<dummy>\S+)\)$')
             m = p14.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -3271,8 +3276,8 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND router advertisements are sent every 200 seconds
-            p15 = re.compile(r'^ND +router +advertisements +are +sent +'
-                              r'every +(?P<time>\d+) +seconds$')
+            p15 = regex_engine.compile(r'^ND +router +advertisements +are +sent +'
+                                        r'every +(?P<time>\d+) +seconds$')
             m = p15.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -3281,8 +3286,8 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND router advertisements live for 1800 seconds
-            p16 = re.compile(r'^ND +router +advertisements +live +for +'
-                              r'(?P<time>\d+) +seconds$')
+            p16 = regex_engine.compile(r'^ND +router +advertisements +live +for +'
+                                        r'(?P<time>\d+) +seconds$')
             m = p16.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -3291,8 +3296,8 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND advertised default router preference is Medium
-            p17 = re.compile(r'^ND +advertised +default +router +preference +'
-                              r'is +(?P<prefer>\w+)$')
+            p17 = regex_engine.compile(r'^ND +advertised +default +router +preference +'
+                                        r'is +(?P<prefer>\w+)$')
             m = p17.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -3301,7 +3306,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND RAs are suppressed (periodic)
-            p17_1 = re.compile(r'^ND +RAs +are +suppressed.*$')
+            p17_1 = regex_engine.compile(r'^ND +RAs +are +suppressed.*$')
             m = p17_1.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
@@ -3309,7 +3314,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # Hosts use stateless autoconfig for addresses.
-            p18 = re.compile(r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +for +addresses.$')
+            p18 = regex_engine.compile(r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +for +addresses.$')
             m = p18.match(line)
             if m:
                 ret_dict[intf]['addresses_config_method'] = \
@@ -3317,7 +3322,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
             
             # Hosts use DHCP to obtain routable addresses.
-            p18_1 = re.compile(r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +to +obtain +routable +addresses.$')
+            p18_1 = regex_engine.compile(r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +to +obtain +routable +addresses.$')
             m = p18_1.match(line)
             if m:
                 ret_dict[intf]['addresses_config_method'] = \
@@ -3325,8 +3330,8 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # Interface is unnumbered. Using address of Loopback0
-            p19 = re.compile(r'^Interface +is +unnumbered. +Using +address +of'
-                              r' +(?P<unnumbered_intf>[\w\/\.]+)$')
+            p19 = regex_engine.compile(r'^Interface +is +unnumbered. +Using +address +of'
+                                        r' +(?P<unnumbered_intf>[\w\/\.]+)$')
             m = p19.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
@@ -3338,7 +3343,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # No global unicast address is configured
-            p20 = re.compile(r'^No +global +unicast +address +is +configured$')
+            p20 = regex_engine.compile(r'^No +global +unicast +address +is +configured$')
             m = p20.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
@@ -3378,12 +3383,12 @@ class ShowInterfacesTrunk(ShowInterfacesTrunkSchema):
             out = output
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<name>[\w\-\/\.]+) +(?P<mode>\w+) +(?P<encapsulation>\S+) +'
-                         r'(?P<status>\w+) +(?P<native_vlan>\d+)$')
-        p2 = re.compile(r'^Port +Vlans +allowed +on +trunk$')
-        p3 = re.compile(r'^Port +Vlans +allowed +and +active +in +management +domain$')
-        p4 = re.compile(r'^Port +Vlans +in +spanning +tree +forwarding +state +and +not +pruned$')
-        p5 = re.compile(r'^(?P<name>[\w\-\/\.]+) +(?P<vlans>none\s*|[\d\-\,\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<name>[\w\-\/\.]+) +(?P<mode>\w+) +(?P<encapsulation>\S+) +'
+                                   r'(?P<status>\w+) +(?P<native_vlan>\d+)$')
+        p2 = regex_engine.compile(r'^Port +Vlans +allowed +on +trunk$')
+        p3 = regex_engine.compile(r'^Port +Vlans +allowed +and +active +in +management +domain$')
+        p4 = regex_engine.compile(r'^Port +Vlans +in +spanning +tree +forwarding +state +and +not +pruned$')
+        p5 = regex_engine.compile(r'^(?P<name>[\w\-\/\.]+) +(?P<vlans>none\s*|[\d\-\,\s]+)$')
         # initial variables
         ret_dict = {}
         vlan_list_type = None
@@ -3460,10 +3465,10 @@ class ShowInterfacesCounters(ShowInterfacesCountersSchema):
             out = output
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<name>[\w\-\/\.]+) +(?P<octets>\d+) +(?P<ucast_pkts>\d+) +'
-                         r'(?P<mcast_pkts>\d+) +(?P<bcast_pkts>\d+)$')
-        p2 = re.compile(r'Port +InOctets +InUcastPkts +InMcastPkts +InBcastPkts')
-        p2_1 = re.compile(r'Port +OutOctets +OutUcastPkts +OutMcastPkts +OutBcastPkts')
+        p1 = regex_engine.compile(r'^(?P<name>[\w\-\/\.]+) +(?P<octets>\d+) +(?P<ucast_pkts>\d+) +'
+                                   r'(?P<mcast_pkts>\d+) +(?P<bcast_pkts>\d+)$')
+        p2 = regex_engine.compile(r'Port +InOctets +InUcastPkts +InMcastPkts +InBcastPkts')
+        p2_1 = regex_engine.compile(r'Port +OutOctets +OutUcastPkts +OutMcastPkts +OutBcastPkts')
 
         # initial variables
         ret_dict = {}
@@ -3554,24 +3559,24 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
         # GigabitEthernet11 OOB Net
         # (need to exclude below line)
         # -------------------------------------------------------------------------------------------------------------------------
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?!-)(?P<interface>[a-zA-Z\-\d\/\.]+)(?P<description>( (\S)+)*)$'
         )
 
         # Tunnel0 Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r'^(?P<interface>Tunnel\d+) +Pim +Register +Tunnel +\(Encap\) +for +RP +(?P<rp>[\w\.]+)$'
         )
 
         #   IPV4_UNICAST             9943           797492           50             3568
         #   DEC MOP          2        154          2        154
         #   Other           15          900          861       370708           0            0            0            0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<protocol>\S+(\s\S+)?)\s+(?P<pkts_in>\d+)\s+(?P<chars_in>\d+)\s+(?P<pkts_out>\d+)\s+(?P<chars_out>\d+)(\s+(?P<rxbs>\d+)\s+(?P<rxps>\d+)\s+(?P<txbs>\d+)\s+(?P<txps>\d+))?'
         )
 
         # No traffic sent or received on this interface.
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^No +traffic +sent +or +received +on +this +interface\.$')
 
         for line in out.splitlines():
@@ -3658,10 +3663,10 @@ class ShowInterfacesLink(ShowInterfacesLinkSchema):
         # Gi1/0/1        Foo                 00:00:00       4w5d
         # Gi1/0/2        foo bar             00:07:00
 
-        p1 = re.compile(r'^(?P<interface>\S+)'
-                        r'(?:(?P<name>.+?(?=(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2}))))?'
-                        r'(?P<down_time>(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2}))'
-                        r'(?:\s+(?P<up_time>(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2})))?$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+)'
+                                  r'(?:(?P<name>.+?(?=(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2}))))?'
+                                  r'(?P<down_time>(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2}))'
+                                  r'(?:\s+(?P<up_time>(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2})))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3736,12 +3741,12 @@ class ShowInterfacesStats(ShowInterfacesStatsSchema):
         result_dict = {}
 
         # GigabitEthernet0/0/0
-        p1 = re.compile(r'^\s*(?P<interface>[\w./]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<interface>[\w./]+)$')
 
         #    Switching path    Pkts In   Chars In   Pkts Out  Chars Out
         #         Processor         33       2507         33       2490
-        p2 = re.compile(r'^\s*(?P<path>[\w\- ]*?) +(?P<pkts_in>[\d]+) +(?P<chars_in>[\d]+)'
-                        r' +(?P<pkts_out>[\d]+) +(?P<chars_out>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<path>[\w\- ]*?) +(?P<pkts_in>[\d]+) +(?P<chars_in>[\d]+)'
+                                  r' +(?P<pkts_out>[\d]+) +(?P<chars_out>[\d]+)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -3803,7 +3808,7 @@ class ShowInterfacesDescription(ShowInterfacesDescriptionSchema):
         #Interface                      Status         Protocol Description
         #Gi0/0                          up             up
         #Gi0/1                          admin down     down     to router2
-        p1 = re.compile(r'(?P<interface>(\S+)) +(?P<status>(\S+)([\s+](\S+))?) +(?P<protocol>(\S+))(?: +(?P<description>(.*)))?$')
+        p1 = regex_engine.compile(r'(?P<interface>(\S+)) +(?P<status>(\S+)([\s+](\S+))?) +(?P<protocol>(\S+))(?: +(?P<description>(.*)))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3871,6 +3876,8 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
             output = self.device.execute(cmd)
 
         result_dict = {}
+        # share the repeated values of the entries, see utils/string_pool.py
+        pool = string_pool.is_enabled()
 
         # Port      Name               Status       Vlan       Duplex  Speed Type
         # Gi1/2     TelenlqPOIU        notconnect   125          full    100 10/100/1000-TX
@@ -3883,9 +3890,9 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
         # Te2/1/21  VSL LINK1          disabled     1            full   auto No XCVR
         # Po10      VSL LINK2          connected    trunk      a-full  a-10G
 
-        p1 = re.compile(r'^(?P<interfaces>\S+)(?:\s+(?P<name>([\S\s]+)))?'
-                        r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
-                        r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
+        p1 = regex_engine.compile(r'^(?P<interfaces>\S+)(?:\s+(?P<name>([\S\s]+)))?'
+                                  r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
+                                  r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3909,6 +3916,8 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
                 for k in keys:
                     if group[k]:
                         intf_dict[k] = group[k].strip()
+                if pool:
+                    string_pool.intern_values(intf_dict)
                 continue
 
         return result_dict
@@ -3953,7 +3962,7 @@ class ShowInterfacesStatusErrDisabled(ShowInterfacesStatusErrDisabledSchema):
 
         # Fi1/7/0/13     Hello World  err-disabled loopdetect
         # Fi1/7/0/14                  err-disabled loopdetect
-        p1= re.compile(r'^(?P<interfaces>\S+)\s+(?P<name>.+?)?\s+(?P<status>err-disabled)\s+(?P<reason>\S+)\s*(?P<err_disabled_vlans>.*)$')
+        p1= regex_engine.compile(r'^(?P<interfaces>\S+)\s+(?P<name>.+?)?\s+(?P<status>err-disabled)\s+(?P<reason>\S+)\s*(?P<err_disabled_vlans>.*)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4050,16 +4059,16 @@ class ShowInterfacesTransceiverDetail(ShowInterfacesTransceiverDetailSchema):
         # type is 10Gbase-LR
         # name is CISCO-FINISAR
         # part number is FTLX1474D3BCL-CS
-        p1 = re.compile(r'^(?P<key>[Tt]ransceiver|[Tt]ype|[Nn]ame|[Pp]art +[Nn]umber) +is +(?P<value>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<key>[Tt]ransceiver|[Tt]ype|[Nn]ame|[Pp]art +[Nn]umber) +is +(?P<value>[\S\s]+)$')
 
         # Voltage            Threshold   Threshold  Threshold  Threshold
-        p3_0 = re.compile(r'(?P<statistic>(Temperature|Voltage|Current|Transmit Power|Receive Power)) +Threshold +Threshold +Threshold +Threshold$')
+        p3_0 = regex_engine.compile(r'(?P<statistic>(Temperature|Voltage|Current|Transmit Power|Receive Power)) +Threshold +Threshold +Threshold +Threshold$')
 
         # Twe2/1/1     25.5                   90.0       85.0       -5.0      -10.0
         # Twe2/1/1   N/A    5.7                 50.0       40.0        2.0        1.0
         # Twe2/1/1   N/A    N/A                 50.0       40.0        2.0        1.0
-        p3_1 = re.compile(r'^(?P<port>(\S+)) +(?P<lane>(\S+))? +(?P<value>(\S+)) '
-                          r'+(?P<HAT>(-?[\d\.]+)) +(?P<HWT>(-?[\d\.]+)) +(?P<LWT>(-?[\d\.]+)) +(?P<LAT>(-?[\d\.]+))$')
+        p3_1 = regex_engine.compile(r'^(?P<port>(\S+)) +(?P<lane>(\S+))? +(?P<value>(\S+)) '
+                                    r'+(?P<HAT>(-?[\d\.]+)) +(?P<HWT>(-?[\d\.]+)) +(?P<LWT>(-?[\d\.]+)) +(?P<LAT>(-?[\d\.]+))$')
 
         result_dict = {}
         is_dict = {}
@@ -4158,9 +4167,9 @@ class ShowInterfacesTransceiver(ShowInterfacesTransceiverSchema):
 
         # Gi1/1      40.6       5.09       0.4     -25.2      N/A
         # Gi1/1      40.6       5.09       0.4     -25.2      -31.00    Max
-        p = re.compile(r'^(?P<port>([\d\/A-Za-z]+)) +(?P<temp>([\d\.-]+)) '
-                        r'+(?P<voltage>([\d\.-]+)) +(?P<current>([\d\.-]+)) '
-                        r'+(?P<opticaltx>(\S+)) +(?P<opticalrx>(\S+))(\s+(?P<max_power>.*))?$')
+        p = regex_engine.compile(r'^(?P<port>([\d\/A-Za-z]+)) +(?P<temp>([\d\.-]+)) '
+                                  r'+(?P<voltage>([\d\.-]+)) +(?P<current>([\d\.-]+)) '
+                                  r'+(?P<opticaltx>(\S+)) +(?P<opticalrx>(\S+))(\s+(?P<max_power>.*))?$')
 
         result_dict = {}
         for line in out.splitlines():
@@ -4226,11 +4235,11 @@ class ShowMacroAutoInterface(ShowMacroAutoInterfaceSchema):
         ret_dict = {}
 
         # Auto Smart Ports Enabled
-        p1 = re.compile(r'^Auto Smart Ports+\s(?P<asp_status>\S+)')
+        p1 = regex_engine.compile(r'^Auto Smart Ports+\s(?P<asp_status>\S+)')
         # Fallback : CDP  Disabled
-        p2 = re.compile(r'Fallback :\s+(?P<type>\S+)\s+(?P<status>\S+)')
+        p2 = regex_engine.compile(r'Fallback :\s+(?P<type>\S+)\s+(?P<status>\S+)')
         # Gi2/0/21      TRUE              None        CISCO_IPVSC_EVENT
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<interface>\S+\d+\/\d+\/\d+|\S+)\s+(?P<asp>\w+)\s\s+(?P<fallback>\w+)\s+(?P<macro>\S+|\S+(?:\s+)?\S+(?:\s+)?\S+)$')
 
         for line in out.splitlines():
@@ -4289,7 +4298,7 @@ class ShowInterfaceSummaryVlan(ShowInterfaceSummaryVlanSchema):
         ret_dict = {}
 
         #Total number of Vlan interfaces: 256
-        p1 = re.compile(r'Total\s+number\s+of\s+Vlan\s+interfaces:\s+(?P<total_number>\d+)')
+        p1 = regex_engine.compile(r'Total\s+number\s+of\s+Vlan\s+interfaces:\s+(?P<total_number>\d+)')
 
         #Vlan interfaces configured:
         #1,10-264
@@ -4303,7 +4312,7 @@ class ShowInterfaceSummaryVlan(ShowInterfaceSummaryVlanSchema):
                 group = m1.groupdict()
                 ret_dict["Total_vlan_interface"] = int(group["total_number"])
         #m2 = p2.match(output)
-        m2 = re.search(p2,output,re.M|re.I)
+        m2 = regex_engine.search(p2,output,re.M|re.I)
         if m2:
            group = m2.groupdict()
            ret_dict["Configured_vlan_interfaces"] = group["vlan_int"]
@@ -4357,10 +4366,10 @@ class ShowInterfacesSummary(ShowInterfacesSummarySchema):
         # initial regexp pattern
         # * GigabitEthernet1/0/9          0         0         0         0         0         0         0         0         0
         #   GigabitEthernet1/0/10          0         0         0         0         0         0         0         0         0
-        p = re.compile(r'^(?P<up>\*?) *(?P<name>[\w\-\/\.]+) +'
-                       r'(?P<ihq>\d+) +(?P<iqd>\d+) +(?P<ohq>\d+) +'
-                       r'(?P<oqd>\d+) +(?P<rxbs>\d+) +(?P<rxps>\d+) +'
-                       r'(?P<txbs>\d+) +(?P<txps>\d+) +(?P<trtl>\d+)$')
+        p = regex_engine.compile(r'^(?P<up>\*?) *(?P<name>[\w\-\/\.]+) +'
+                                 r'(?P<ihq>\d+) +(?P<iqd>\d+) +(?P<ohq>\d+) +'
+                                 r'(?P<oqd>\d+) +(?P<rxbs>\d+) +(?P<rxps>\d+) +'
+                                 r'(?P<txbs>\d+) +(?P<txps>\d+) +(?P<trtl>\d+)$')
 
         # initial variables
         ret_dict = {}
@@ -4431,7 +4440,7 @@ class ShowInterfacesMtu(ShowInterfacesMtuSchema):
         #Fo1/0/1       Interface1                  1500
         #Fo1/0/2       Interface2                  1500
 
-        p1 = re.compile(r'^(?P<interfaces>\S+)\s+(?P<name>.+?)?\s+(?P<mtu>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<interfaces>\S+)\s+(?P<name>.+?)?\s+(?P<mtu>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4490,14 +4499,14 @@ class ShowInterfacesStatusModule(ShowInterfacesStatusModuleSchema):
 
         result_dict = {}
         
-        p0 = re.compile(r'(?P<var>%.*)')
+        p0 = regex_engine.compile(r'(?P<var>%.*)')
 
             # Port         Name               Status       Vlan       Duplex  Speed Type
             # Hu1/0/1                         connected    1            full    40G QSFP 40G AOC5M 
             # Twe4/0/2                        connected    routed       full    10G SFP-10GBase-CX1
-        p1 = re.compile(r'^(?P<interfaces>\S+)(?:\s+(?P<name>(.+)))?'
-                r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
-                r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
+        p1 = regex_engine.compile(r'^(?P<interfaces>\S+)(?:\s+(?P<name>(.+)))?'
+                          r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
+                          r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
 
         
         # %Module1 is not Present
@@ -4571,11 +4580,11 @@ class ShowPmVpInterfaceVlan(ShowPmVpInterfaceVlanSchema):
             output = self.device.execute(cmd)
 
         # vp: 0x50823F64: 3/3(1001) es: 0, stp forwarding, link up, fwd yes
-        p1 = re.compile(r"^vp:\s+(?P<vp>\S+\s+\S+)\s+es:\s+(?P<es>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+        p1 = regex_engine.compile(r"^vp:\s+(?P<vp>\S+\s+\S+)\s+es:\s+(?P<es>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
         # sm(pm_vp 3/3(1001)), running yes, state forwarding
-        p1_1 = re.compile(r"^sm\((?P<sm>\S+\s+\S+)\),\s+running\s+(?P<running>\w+),\s+state\s+(?P<state>\w+)$")
+        p1_1 = regex_engine.compile(r"^sm\((?P<sm>\S+\s+\S+)\),\s+running\s+(?P<running>\w+),\s+state\s+(?P<state>\w+)$")
         # Last transition recorded: (linkup)-> authentication (linkup)-> authentication (authen_enable)-> authen_fail (authen_success)-> notforwarding (forward_notnotify)-> forwarding 
-        p1_2 = re.compile(r"^Last\s+transition\s+recorded:\s+(?P<last_transition>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+        p1_2 = regex_engine.compile(r"^Last\s+transition\s+recorded:\s+(?P<last_transition>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
 
 
         ret_dict = {}
@@ -4652,11 +4661,11 @@ class ShowInterfacesTransceiverSupportedlist(ShowInterfacesTransceiverSupportedl
         
         #------------------       ------------------------- 
         #p1 will match dashes pattern used to create dict that to start adiing the transceiver types
-        p1 = re.compile(r"\-+\s+\-+")
+        p1 = regex_engine.compile(r"\-+\s+\-+")
 
         #   GLC-FE-100FX-RGD         ALL
         #   GLC-SX-MM                NONE
-        p2 = re.compile(r"^(?P<transceiver>[\w-]+)\s+(?P<pin_version>(ALL|NONE))")
+        p2 = regex_engine.compile(r"^(?P<transceiver>[\w-]+)\s+(?P<pin_version>(ALL|NONE))")
 
         for line in out.splitlines():
             line = line.strip()
@@ -4782,109 +4791,109 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
             output = self.device.execute(cmd)
 
         # port 1/24  pd 0x7F837FEABD78 swidb 0x7F837EBFA020(switch)  sb 0x7F837EBFCA40 
-        p1 = re.compile(r"^port\s+(?P<port>\S+)\s+pd\s+(?P<pd>\S+)\s+swidb\s+"
+        p1 = regex_engine.compile(r"^port\s+(?P<port>\S+)\s+pd\s+(?P<pd>\S+)\s+swidb\s+"
              r"(?P<sw_idb>\S+)\s+sb\s+(?P<sb>\S+)$")
         #  hwidb 0x7F837EBF8C38
-        p1_1 = re.compile(r"^hwidb\s+(?P<hw_idb>\S+)$")
+        p1_1 = regex_engine.compile(r"^hwidb\s+(?P<hw_idb>\S+)$")
         # if_number = 32 hw_if_index = 31 snmp_if_index = 32(32) ptrunkgroup = 0(port)
-        p1_2 = re.compile(r"^if_number\s+=\s+(?P<if_num>\d+)\s+hw_if_index\s+="
+        p1_2 = regex_engine.compile(r"^if_number\s+=\s+(?P<if_num>\d+)\s+hw_if_index\s+="
                r"\s+(?P<hw_if_index>\d+)\s+snmp_if_index\s+=\s+(?P<snmp_if_index>\S+)"
                r"\s+ptrunkgroup\s+=\s+(?P<ptrunk_group>\S+)$")
         # admin up(up)  line up(up)  operErr none
-        p1_3 = re.compile(r"^admin\s+(?P<admin>\S+)\s+line\s+(?P<line>\S+)\s+"
+        p1_3 = regex_engine.compile(r"^admin\s+(?P<admin>\S+)\s+line\s+(?P<line>\S+)\s+"
                r"operErr\s+(?P<oper_err>\w+)$")
         # port assigned mac address 683b.78f3.3118
-        p1_4 = re.compile(r"^port\s+assigned\s+mac\s+address\s+(?P<port_mac>\S+)$")
+        p1_4 = regex_engine.compile(r"^port\s+assigned\s+mac\s+address\s+(?P<port_mac>\S+)$")
         # idb port vlan id 1  default vlan id 1
-        p1_5 = re.compile(r"^idb\s+port\s+vlan\s+id\s+(?P<idb_port_vlan>\d+)\s+"
+        p1_5 = regex_engine.compile(r"^idb\s+port\s+vlan\s+id\s+(?P<idb_port_vlan>\d+)\s+"
                r"default\s+vlan\s+id\s+(?P<def_vlan_id>\d+)$")
         # internalVlan 0x0  remapVlan 0x0
-        p1_6 = re.compile(r"^internalVlan\s+(?P<internal_vlan>\S+)\s+remapVlan\s+0x0$")
+        p1_6 = regex_engine.compile(r"^internalVlan\s+(?P<internal_vlan>\S+)\s+remapVlan\s+0x0$")
         # dtp special no  pagp special no
-        p1_7 = re.compile(r"^dtp\s+special\s+(?P<dtp_special>\w+)\s+pagp\s+"
+        p1_7 = regex_engine.compile(r"^dtp\s+special\s+(?P<dtp_special>\w+)\s+pagp\s+"
                r"special\s+(?P<pagp_special>\w+)$")
         # speed: 100M   duplex: full   mode: access   encap: native 
-        p1_8 = re.compile(r"^speed:\s+(?P<speed>\S+)\s+duplex:\s+(?P<duplex>\w+)"
+        p1_8 = regex_engine.compile(r"^speed:\s+(?P<speed>\S+)\s+duplex:\s+(?P<duplex>\w+)"
                r"\s+mode:\s+(?P<mode>\w+)\s+encap:\s+(?P<encap>\w+)$")
         # dtp nonegotiate: FALSE 
-        p1_9 = re.compile(r"^dtp\s+nonegotiate:\s+(?P<dtp_nonego>\w+)$")
+        p1_9 = regex_engine.compile(r"^dtp\s+nonegotiate:\s+(?P<dtp_nonego>\w+)$")
         # flowcontrol receive: on   flowcontrol send: off 
-        p1_10 = re.compile(r"^flowcontrol\s+receive:\s+(?P<flow_ctrl_receive>\w+)"
+        p1_10 = regex_engine.compile(r"^flowcontrol\s+receive:\s+(?P<flow_ctrl_receive>\w+)"
                 r"\s+flowcontrol\s+send:\s+(?P<flow_ctrl_send>\w+)$")
         # linkflapcnt: 0  dtpflapcnt: 0  pagpflapcnt: 0
-        p1_11 = re.compile(r"^linkflapcnt:\s+(?P<link_flap_cnt>\d+)\s+dtpflapcnt:"
+        p1_11 = regex_engine.compile(r"^linkflapcnt:\s+(?P<link_flap_cnt>\d+)\s+dtpflapcnt:"
                 r"\s+(?P<dtp_flap_cnt>\d+)\s+pagpflapcnt:\s+(?P<pagp_flap_cnt>\d+)$")
         # unidirectional: off 
-        p1_12 = re.compile(r"^unidirectional:\s+(?P<unidirectional>\w+)$")
+        p1_12 = regex_engine.compile(r"^unidirectional:\s+(?P<unidirectional>\w+)$")
         # operVlan: 0 
-        p1_13 = re.compile(r"^operVlan:\s+(?P<oper_vlan>\d+)$")
+        p1_13 = regex_engine.compile(r"^operVlan:\s+(?P<oper_vlan>\d+)$")
         # flag:     0 
-        p1_14 = re.compile(r"^flag:\s+(?P<flag>\d+)$")
+        p1_14 = regex_engine.compile(r"^flag:\s+(?P<flag>\d+)$")
         # sm(pm_port 1/24), running yes, state access_multi
-        p1_15 = re.compile(r"^sm\((?P<sm>\S+\s+\S+)\),\s+running\s+"
+        p1_15 = regex_engine.compile(r"^sm\((?P<sm>\S+\s+\S+)\),\s+running\s+"
                 r"(?P<running>\w+),\s+state\s+(?P<state>\S+)$")
         # Last transition recorded: (cfg_access_vvlanid)-> pagp_port_cleanup (cfg_access_vvlanid)-> pagp (cfg_access_vvlanid)-> pre_pagp_may_suspend (cfg_access_vvlanid)-> pagp_may_suspend (pagp_continue)-> start_pagp (pagp_continue)-> pagp (dont_bundle)-> pre_post_pagp (dont_bundle)-> post_pagp (dtp_access_multi)-> access_multi (bulk_sync)-> access_multi 
-        p1_16 = re.compile(r"^Last\s+transition\s+recorded:\s+"
+        p1_16 = regex_engine.compile(r"^Last\s+transition\s+recorded:\s+"
                 r"(?P<last_transition>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+"
                 r"\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+"
                 r"\s+\S+\s+\S+)$")
         # vp:  1 100
-        p1_17 = re.compile(r"^vp:\s+(?P<vp>\S+\s+\S+)$")
+        p1_17 = regex_engine.compile(r"^vp:\s+(?P<vp>\S+\s+\S+)$")
         # vlans:  1 100
-        p1_18 = re.compile(r"^vlans:\s+(?P<vlans>\S+\s+\S+)$")
+        p1_18 = regex_engine.compile(r"^vlans:\s+(?P<vlans>\S+\s+\S+)$")
         # trunkVlans:  1 100
-        p1_19 = re.compile(r"^trunkVlans:\s+(?P<trunk_vlans>\S+\s+\S+)$")
+        p1_19 = regex_engine.compile(r"^trunkVlans:\s+(?P<trunk_vlans>\S+\s+\S+)$")
         # fwdVlans:  100
-        p1_20 = re.compile(r"^fwdVlans:\s+(?P<fwd_vlans>\d+)$")
+        p1_20 = regex_engine.compile(r"^fwdVlans:\s+(?P<fwd_vlans>\d+)$")
         # currentlyPrunedVlans:  none
-        p1_21 = re.compile(r"^currentlyPrunedVlans:\s+(?P<current_pruned_vlans>\w+)$")
+        p1_21 = regex_engine.compile(r"^currentlyPrunedVlans:\s+(?P<current_pruned_vlans>\w+)$")
         # previouslyPrunedVlans:  none
-        p1_22 = re.compile(r"^previouslyPrunedVlans:\s+(?P<previous_pruned_vlans>\w+)$")
+        p1_22 = regex_engine.compile(r"^previouslyPrunedVlans:\s+(?P<previous_pruned_vlans>\w+)$")
         # protocols: ip=on ipx=on misc=on other=on 
-        p1_23 = re.compile(r"^protocols:\s+(?P<protocols>\S+\s+\S+\s+\S+\s+\S+)$")
+        p1_23 = regex_engine.compile(r"^protocols:\s+(?P<protocols>\S+\s+\S+\s+\S+\s+\S+)$")
         # access mode: unknown   access vlanid: 1   native vlanid: 1 
-        p2 = re.compile(r"^access\s+mode:\s+(?P<access_mode>\w+)\s+"
+        p2 = regex_engine.compile(r"^access\s+mode:\s+(?P<access_mode>\w+)\s+"
              r"access\s+vlanid:\s+(?P<access_vlan_id>\d+)\s+native\s+vlanid:\s+"
              r"(?P<native_vlan_id>\d+)$")
         # trunkVlans:  1-4094
-        p2_1 = re.compile(r"^trunkVlans:\s+(?P<trunk_vlans>\S+)$")
+        p2_1 = regex_engine.compile(r"^trunkVlans:\s+(?P<trunk_vlans>\S+)$")
         # pruneVlans:  2-1001primary host vlanid: 32767    secondary host vlanid: 32767
-        p2_2 = re.compile(r"^pruneVlans:\s+(?P<prune_vlans>\S+)primary\s+host\s+"
+        p2_2 = regex_engine.compile(r"^pruneVlans:\s+(?P<prune_vlans>\S+)primary\s+host\s+"
                r"vlanid:\s+(?P<primary_host_vlan>\d+)\s+secondary\s+host\s+"
                r"vlanid:\s+(?P<sec_host_vlan>\d+)$")
         # primary promiscuous vlanid: 32767
-        p2_3 = re.compile(r"^primary\s+promiscuous\s+vlanid:\s+"
+        p2_3 = regex_engine.compile(r"^primary\s+promiscuous\s+vlanid:\s+"
                r"(?P<pri_promiscuous_vlan>\d+)$")
         # secondary prom vlans:  none
-        p2_4 = re.compile(r"^secondary\s+prom\s+vlans:\s+(?P<sec_prom_vlan>\w+)$")
+        p2_4 = regex_engine.compile(r"^secondary\s+prom\s+vlans:\s+(?P<sec_prom_vlan>\w+)$")
         # speed: auto speedauto: auto-default   duplex: auto   mode: access 
-        p2_5 = re.compile(r"^speed:\s+(?P<speed>\w+)\s+speedauto:\s+"
+        p2_5 = regex_engine.compile(r"^speed:\s+(?P<speed>\w+)\s+speedauto:\s+"
                r"(?P<speed_auto>\S+)\s+duplex:\s+(?P<duplex>\w+)\s+"
                r"mode:\s+(?P<mode>\w+)$")
         # encap: dot1q   nonegotiate: false 
-        p2_6 = re.compile(r"^encap:\s+(?P<encap>\S+)\s+nonegotiate:\s+"
+        p2_6 = regex_engine.compile(r"^encap:\s+(?P<encap>\S+)\s+nonegotiate:\s+"
                r"(?P<nonego>\w+)$")
         # jumbo cap: true   jumbo: false  mtu: 1500  sync-delay: 210  HOL: Enable
-        p2_7 = re.compile(r"^jumbo\s+cap:\s+(?P<jumbo_cap>\w+)\s+jumbo:\s+"
+        p2_7 = regex_engine.compile(r"^jumbo\s+cap:\s+(?P<jumbo_cap>\w+)\s+jumbo:\s+"
                r"(?P<jumbo>\w+)\s+mtu:\s+(?P<mtu>\d+)\s+sync-delay:\s+"
                r"(?P<sync_delay>\d+)\s+HOL:\s+(?P<hol>\w+)$")
         # bcast-supp-level: 10000   mcast-supp-level: 10000   ucast-supp-level: 10000 
-        p2_8 = re.compile(r"^bcast-supp-level:\s+(?P<bcast_sup_level>\d+)\s+"
+        p2_8 = regex_engine.compile(r"^bcast-supp-level:\s+(?P<bcast_sup_level>\d+)\s+"
                r"mcast-supp-level:\s+(?P<mcast_sup_level>\d+)\s+ucast-supp-level:"
                r"\s+(?P<ucast_sup_level>\d+)$")
         # disl: off   dtp nonegotiate: FALSE   media: unknown   dualmode 0 
-        p2_9 = re.compile(r"^disl:\s+(?P<disl>\w+)\s+dtp\s+nonegotiate:\s+"
+        p2_9 = regex_engine.compile(r"^disl:\s+(?P<disl>\w+)\s+dtp\s+nonegotiate:\s+"
                r"(?P<dtp_nonego>\w+)\s+media:\s+(?P<media>\w+)\s+dualmode\s+"
                r"(?P<dualmode>\d+)$")
         # tdr_ever_run: FALSE tdr_in_progress: FALSE tdr_result_valid: FALSE
-        p2_10 = re.compile(r"^tdr_ever_run:\s+(?P<tdr_ever_run>\w+)\s+"
+        p2_10 = regex_engine.compile(r"^tdr_ever_run:\s+(?P<tdr_ever_run>\w+)\s+"
                 r"tdr_in_progress:\s+(?P<tdr_in_progress>\w+)\s+tdr_result_valid:"
                 r"\s+(?P<tdr_result_valid>\w+)$")
         # tdr_err_code: 0, prbs_err_code: 0
-        p2_11 = re.compile(r"^tdr_err_code:\s+(?P<tdr_error_code>\d+),\s+"
+        p2_11 = regex_engine.compile(r"^tdr_err_code:\s+(?P<tdr_error_code>\d+),\s+"
                 r"prbs_err_code:\s+(?P<prbs_err_code>\d+)$")
         # PRBS: Stopped PRBS - port was admin down
-        p2_12 = re.compile(r"^PRBS:\s+(?P<prbs>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+        p2_12 = regex_engine.compile(r"^PRBS:\s+(?P<prbs>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
         
 
         ret_dict = {}
@@ -5291,7 +5300,7 @@ class ShowInterfacesPrivateVlanMapping(ShowInterfacesPrivateVlanMappingSchema):
             output = self.device.execute(self.cli_command)
 
         # vlan70    71             community   
-        p1 = re.compile(r'^(?P<interface>\w+)\s+(?P<secondary_vlan>\d+)\s+(?P<type>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\w+)\s+(?P<secondary_vlan>\d+)\s+(?P<type>\w+)$')
 
         result_dict = {}
         for line in output.splitlines():
@@ -5358,25 +5367,25 @@ class ShowInterfaceEtherchannel(ShowInterfaceEtherchannelSchema):
             output = self.device.execute(cmd)
 
         #Port state    = Up Mstr In-Bndl
-        p1 = re.compile(r'^Port state\s+=\s+(?P<port_state>[\w -]+)$')
+        p1 = regex_engine.compile(r'^Port state\s+=\s+(?P<port_state>[\w -]+)$')
         #Channel group = 2           Mode = On              Gcchange = -
-        p2 = re.compile(r'^Channel group\s+=\s+(?P<channel_group>\d+)\s+Mode\s+=\s+(?P<mode>\w+)\s+Gcchange\s+=\s+(?P<gcchange>\S+)$')
+        p2 = regex_engine.compile(r'^Channel group\s+=\s+(?P<channel_group>\d+)\s+Mode\s+=\s+(?P<mode>\w+)\s+Gcchange\s+=\s+(?P<gcchange>\S+)$')
         #Port-channel  = Po2         GC   =   -             Pseudo port-channel = Po2
-        p3 = re.compile(r'^Port-channel\s+=\s+(?P<port_channel>\w+)\s+GC\s+=\s+(?P<gc>\S+)\s+Pseudo port-channel\s+=\s+(?P<pseudo_port_channel>\S+)$')
+        p3 = regex_engine.compile(r'^Port-channel\s+=\s+(?P<port_channel>\w+)\s+GC\s+=\s+(?P<gc>\S+)\s+Pseudo port-channel\s+=\s+(?P<pseudo_port_channel>\S+)$')
         #Port index    = 0           Load = 0x00            Protocol =    -
-        p4 = re.compile(r'^Port index\s+=\s+(?P<port_index>\d+)\s+Load\s+=\s+(?P<load>\S+)\s+Protocol\s+=\s+(?P<protocol>\S+)$')
+        p4 = regex_engine.compile(r'^Port index\s+=\s+(?P<port_index>\d+)\s+Load\s+=\s+(?P<load>\S+)\s+Protocol\s+=\s+(?P<protocol>\S+)$')
         #Flags:  S - Device is sending Slow LACPDUs   F - Device is sending fast LACPDUs.
-        p5 = re.compile(r'^Flags:\s+(?P<flag>\S+)\s-\s(?P<flag_value>[\S\s]+)\s+(?P<flag2>\w+)\s-\s(?P<flag_value2>[\S\s]+)\.$')
+        p5 = regex_engine.compile(r'^Flags:\s+(?P<flag>\S+)\s-\s(?P<flag_value>[\S\s]+)\s+(?P<flag2>\w+)\s-\s(?P<flag_value2>[\S\s]+)\.$')
         #A - Device is in active mode.        P - Device is in passive mode.
-        p5_1 = re.compile(r'^(?P<flag>\S+)\s-\s(?P<flag_value>[\S\s]+)\.\s+(?P<flag2>\S+)\s-\s(?P<flag_value2>[\S\s]+)\.$')
+        p5_1 = regex_engine.compile(r'^(?P<flag>\S+)\s-\s(?P<flag_value>[\S\s]+)\.\s+(?P<flag2>\S+)\s-\s(?P<flag_value2>[\S\s]+)\.$')
         #Local information:
         #                                 LACP port    Admin     Oper    Port        Port
         # Port          Flags   State     Priority     Key       Key     Number      State
         # Gi2/0/13      SA      down      32768        0xA       0x0     0x20E       0x4D 
-        p6 = re.compile(r'^(?P<port>Gi[\w\/\d]+)\s+(?P<flags>\w+)\s+(?P<state>\w+)\s+(?P<priority>\d+)'
-                        r'\s+(?P<admin_key>\w+)\s+(?P<oper_key>\w+)\s+(?P<port_number>\w+)\s+(?P<port_state>\w+)$')
+        p6 = regex_engine.compile(r'^(?P<port>Gi[\w\/\d]+)\s+(?P<flags>\w+)\s+(?P<state>\w+)\s+(?P<priority>\d+)'
+                                  r'\s+(?P<admin_key>\w+)\s+(?P<oper_key>\w+)\s+(?P<port_number>\w+)\s+(?P<port_state>\w+)$')
         #Age of the port in the current state: 0d:00h:00m:29s
-        p7 = re.compile(r'^Age of the port in the current state:\s+(?P<age_of_port>\S+)$')
+        p7 = regex_engine.compile(r'^Age of the port in the current state:\s+(?P<age_of_port>\S+)$')
         
         ret_dict = {}
 
@@ -5494,16 +5503,16 @@ class ShowInterfacesCapabilities(ShowInterfacesCapabilitiesSchema):
             output = self.device.execute(cmd)
 
         # TenGigabitEthernet3/1/3
-        p1 = re.compile(r'^(?P<interface>[\w\/\d\.]+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>[\w\/\d\.]+)$')
 
         # Model:                 WS-C3650-48PD
         # Type:                  SFP-10G-ACTIVE-CABLE
         # Speed:                 10000
         # Duplex:                full
-        p2 = re.compile(r'^(?P<key_name>[\w\s\.]+):\s+(?P<value>.+)$')
+        p2 = regex_engine.compile(r'^(?P<key_name>[\w\s\.]+):\s+(?P<value>.+)$')
 
         # tx-(2p6q3t)
-        p3 = re.compile(r'^(?P<qos_tx>tx-.+)$')
+        p3 = regex_engine.compile(r'^(?P<qos_tx>tx-.+)$')
         
         ret_dict = {}
 
@@ -5566,7 +5575,7 @@ class ShowInterfaceFlowControl(ShowInterfaceFlowControlSchema):
         #                 admin    oper     admin    oper
         # ------------    -------- -------- -------- --------    ------- -------
         # Fo2/1/0/10      Unsupp.  Unsupp.  on       on          0       0
-        p1 = re.compile(r'^(?P<port>[\w\/\d]+)\s+(?P<send_fc_admin>[\.\w]+)\s+(?P<send_fc_oper>[\.\w]+)\s+(?P<receive_fc_admin>\w+)\s+(?P<receive_fc_oper>\w+)\s+(?P<rx_pause>\d+)\s+(?P<tx_pause>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<port>[\w\/\d]+)\s+(?P<send_fc_admin>[\.\w]+)\s+(?P<send_fc_oper>[\.\w]+)\s+(?P<receive_fc_admin>\w+)\s+(?P<receive_fc_oper>\w+)\s+(?P<rx_pause>\d+)\s+(?P<tx_pause>\d+)$')
 
         ret_dict = {}
 
@@ -5616,7 +5625,7 @@ class ShowInterfacesVlanMapping(ShowInterfacesVlanMappingSchema):
             output = self.device.execute(self.cli_command)
 
         # 20                                    30             1-to-1
-        p1 = re.compile(r"^(?P<vlan_on_wire>\d+)\s+(?P<trans_vlan>\d+)\s+(?P<operation>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<vlan_on_wire>\d+)\s+(?P<trans_vlan>\d+)\s+(?P<operation>\S+)$")
 
         ret_dict = {}
 
@@ -5659,10 +5668,10 @@ class ShowInterfaceHumanReadableIncludeDrops(ShowInterfaceHumanReadableIncludeDr
             
         #   Input queue: 0/2000/0/0 (size/max/drops/flushes); Total output drops: 0
 
-        p1 = re.compile(r"^Input queue: (?P<size>\d+)/(?P<max>\d+)/(?P<drops>\d+)/(?P<flushes>\d+)\s+\(size/max/drops/flushes\); Total output drops:\s+(?P<total_output_drops>\d+)$")
+        p1 = regex_engine.compile(r"^Input queue: (?P<size>\d+)/(?P<max>\d+)/(?P<drops>\d+)/(?P<flushes>\d+)\s+\(size/max/drops/flushes\); Total output drops:\s+(?P<total_output_drops>\d+)$")
 
         # 0 unknown protocol drops
-        p2 = re.compile(r"^(?P<unknown_protocol_drops>\d+)\s+unknown protocol drops$")
+        p2 = regex_engine.compile(r"^(?P<unknown_protocol_drops>\d+)\s+unknown protocol drops$")
 
         ret_dict = {}
 
@@ -5712,7 +5721,7 @@ class ShowInterfaceHumanReadable(ShowInterfaceHumanReadableSchema):
             
         # 5 minute input rate 0 bits/sec, 0 packets/sec
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p1 = re.compile(r'^\d+\s+(minute|seconds)\s+(?P<dir>(input|output))\s+rate\s+(?P<rate>[\S\s]+)\s*,[\S\s\d]+$')
+        p1 = regex_engine.compile(r'^\d+\s+(minute|seconds)\s+(?P<dir>(input|output))\s+rate\s+(?P<rate>[\S\s]+)\s*,[\S\s\d]+$')
 
         ret_dict = {}
 
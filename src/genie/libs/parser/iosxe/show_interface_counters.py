@@ -7,10 +7,10 @@
      * show interface {interface} counters etherchannel
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -77,7 +77,7 @@ class ShowInterfaceCounters(ShowInterfaceCountersSchema):
         '''
             
         ###Po60        39019226         539205              0              0
-        m1 = re.compile(r"[a-zA-Z]+[0-9]+")
+        m1 = regex_engine.compile(r"[a-zA-Z]+[0-9]+")
             
         key=[]
         value=[]
@@ -145,11 +145,11 @@ class ShowInterfacesCountersErrors(ShowInterfacesCountersErrorsSchema):
         ret_dict = {}
 
         # Ap2/0/1                0           0           0           0          0            0             m = p1.match(line)
-        p1 = re.compile(r'^(?P<port_name>\S+) +(?P<align_err>\d+) +(?P<fcs_err>\d+) +(?P<xmit_err>\d+) +(?P<rcv_err>\d+) +(?P<under_size>\d+) +(?P<out_discards>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<port_name>\S+) +(?P<align_err>\d+) +(?P<fcs_err>\d+) +(?P<xmit_err>\d+) +(?P<rcv_err>\d+) +(?P<under_size>\d+) +(?P<out_discards>\d+)$')
         # Port         Single-Col  Multi-Col   Late-Col  Excess-Col  Carri-Sen      Runts 
-        p2 = re.compile(r'^Port +Single-Col +Multi-Col +Late-Col +Excess-Col +Carri-Sen +Runts$')
+        p2 = regex_engine.compile(r'^Port +Single-Col +Multi-Col +Late-Col +Excess-Col +Carri-Sen +Runts$')
         # Ap2/0/1                0           0           0           0          0            0             m = p1.match(line)
-        p3 = re.compile(r'^(?P<port_name>\S+) +(?P<single_col>\d+) +(?P<multi_col>\d+) +(?P<late_col>\d+) +(?P<excess_col>\d+) +(?P<carri_sen>\d+) +(?P<runts>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<port_name>\S+) +(?P<single_col>\d+) +(?P<multi_col>\d+) +(?P<late_col>\d+) +(?P<excess_col>\d+) +(?P<carri_sen>\d+) +(?P<runts>\d+)$')
         extra_counters = False
 
         for line in output.splitlines():
@@ -242,15 +242,15 @@ class ShowInterfaceCountersEtherchannel(ShowInterfaceCountersEtherchannelSchema)
         
         # Port               InOctets    InUcastPkts    InMcastPkts    InBcastPkts
         # Port              OutOctets   OutUcastPkts   OutMcastPkts   OutBcastPkts
-        p0 = re.compile(r"^Port\s+(?P<octets>InOctets|OutOctets)\s+(?P<ucastpkts>InUcastPkts|OutUcastPkts)\s+"
-                        r"(?P<mcastpkts>InMcastPkts|OutMcastPkts)\s+(?P<bcastpkts>InBcastPkts|OutBcastPkts)$")
+        p0 = regex_engine.compile(r"^Port\s+(?P<octets>InOctets|OutOctets)\s+(?P<ucastpkts>InUcastPkts|OutUcastPkts)\s+"
+                                  r"(?P<mcastpkts>InMcastPkts|OutMcastPkts)\s+(?P<bcastpkts>InBcastPkts|OutBcastPkts)$")
 
         # Po10             1988738194         397777              0              0
-        p1 = re.compile(r"^(?P<port_channel>Po\d+)\s+(?P<octets>\d+)\s+(?P<ucastpkts>\d+)\s+(?P<mcastpkts>\d+)\s+(?P<bcastpkts>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<port_channel>Po\d+)\s+(?P<octets>\d+)\s+(?P<ucastpkts>\d+)\s+(?P<mcastpkts>\d+)\s+(?P<bcastpkts>\d+)$")
 
         # Hu1/0/25          994365640         198881              0              0
         # Fou2/0/17         994372554         198896              0              0
-        p2 = re.compile(r"^(?P<port>\S+)\s+(?P<octets>\d+)\s+(?P<ucastpkts>\d+)\s+(?P<mcastpkts>\d+)\s+(?P<bcastpkts>\d+)$")
+        p2 = regex_engine.compile(r"^(?P<port>\S+)\s+(?P<octets>\d+)\s+(?P<ucastpkts>\d+)\s+(?P<mcastpkts>\d+)\s+(?P<bcastpkts>\d+)$")
 
         ret_dict = {}
         for line in output.splitlines():
@@ -3,12 +3,12 @@ IOSXE parsers for the following show commands:
     * show inventory raw
     * show incentory OID
 '''
-# python
-import re
-
 # metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 class ShowInventoryRawSchema(MetaParser):
 
@@ -49,16 +49,16 @@ class ShowInventoryRaw(ShowInventoryRawSchema):
         #NAME: "Gi2/0/5", DESCR: "Gi2/0/5"
         #NAME: "Switch 1 Slot 1 Temp: S1_I_00", DESCR: "Temp: S1_I_00"
         #NAME: "TenGigabitEthernet3/0/1", DESCR: "SFP+ 10GBASE-SR"
-        p1 = re.compile(r'^NAME: "(?P<name>[\w\d\s(\/\-)?(\:\")*]+)", DESCR: "(?P<description>[\w\d\s(\-\.\/\+)?(\:\_)*]+)"$')
+        p1 = regex_engine.compile(r'^NAME: "(?P<name>[\w\d\s(\/\-)?(\:\")*]+)", DESCR: "(?P<description>[\w\d\s(\-\.\/\+)?(\:\_)*]+)"$')
         
         # PID: C9500X-28C8D      , VID: V00  , SN: FDO25030SLN
         # PID: C9300-24U         , VID:      , SN:
         # PID: Unknown PID       , VID:      , SN:
-        p2 = re.compile(r'^PID:\s+(?P<pid>[\w\d\-]+|Unknown PID)?\s*,\s+VID:\s+(?P<vid>[\d\w\.]+)?\s*,\s+SN:\s*(?P<sn>[\w\d\-]+)?$')
+        p2 = regex_engine.compile(r'^PID:\s+(?P<pid>[\w\d\-]+|Unknown PID)?\s*,\s+VID:\s+(?P<vid>[\d\w\.]+)?\s*,\s+SN:\s*(?P<sn>[\w\d\-]+)?$')
         
         
         #OID: 1.3.6.1.4.1.9.12.3.1.3.2421
-        p3 = re.compile(r'^OID: +(?P<oid>[\d\.]+)$')
+        p3 = regex_engine.compile(r'^OID: +(?P<oid>[\d\.]+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -6,13 +6,13 @@ IOSXE parsers for the following show commands:
 
 # Python
 
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =================
@@ -66,24 +66,24 @@ class ShowIox(ShowIoxSchema):
         ret_dict = {}
 
         # IOx service (CAF)              : Running
-        p1 = re.compile(r"IOx service \(CAF\) +: (?P<caf_service>[\w\s]+)$")
+        p1 = regex_engine.compile(r"IOx service \(CAF\) +: (?P<caf_service>[\w\s]+)$")
         # IOx service (HA)              : Running
-        p2 = re.compile(r"IOx service \(HA\) +: (?P<ha_service>[\w\s]+)$")
+        p2 = regex_engine.compile(r"IOx service \(HA\) +: (?P<ha_service>[\w\s]+)$")
         # IOx service (IOxman)              : Running
-        p3 = re.compile(r"IOx service \(IOxman\) +: (?P<ioxman_service>[\w\s]+)$")
+        p3 = regex_engine.compile(r"IOx service \(IOxman\) +: (?P<ioxman_service>[\w\s]+)$")
         # IOx service (Sec storage)              : Running
-        p4 = re.compile(r"IOx service \(Sec storage\) +: (?P<sec_storage_service>[\w\s]+)$")
+        p4 = regex_engine.compile(r"IOx service \(Sec storage\) +: (?P<sec_storage_service>[\w\s]+)$")
         # Libvirtd 5.5.0                 : Running
-        p5 = re.compile(r"Libvirtd.*: (?P<libvirtd>[\w\s]+)$")
+        p5 = regex_engine.compile(r"Libvirtd.*: (?P<libvirtd>[\w\s]+)$")
         # Dockerd 18.03.0                : Running
-        p6 = re.compile(r"Dockerd.*: (?P<dockerd>[\w\s]+)$")
+        p6 = regex_engine.compile(r"Dockerd.*: (?P<dockerd>[\w\s]+)$")
         # Redundancy Status              : Ready
-        p7 = re.compile(r"Redundancy Status +: (?P<redundancy_status>.*)$")
+        p7 = regex_engine.compile(r"Redundancy Status +: (?P<redundancy_status>.*)$")
         # Sync status                    : Successful
         # Sync Status                    : Disabled
-        p8 = re.compile(r"Sync.*: (?P<sync_status>[\w\s]+)$")
+        p8 = regex_engine.compile(r"Sync.*: (?P<sync_status>[\w\s]+)$")
         # Last application sync time     : 2021-03-23 12:21:07.529935
-        p9 = re.compile(r"Last application sync time +: (?P<last_application_sync_time>.*)$")
+        p9 = regex_engine.compile(r"Last application sync time +: (?P<last_application_sync_time>.*)$")
             
         for line in out.splitlines():
             line_strip = line.strip()
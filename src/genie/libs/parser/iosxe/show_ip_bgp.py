@@ -50,9 +50,6 @@
     * show ip bgp {address_family} vrf {vrf} neighbors {neighbor} advertised-routes
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
@@ -60,6 +57,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
 from genie.libs.parser.iosxe.show_bgp import *
+from genie.libs.parser.utils import regex_engine
+from genie.libs.parser.utils.common import delegate
 
 
 # ======================================
@@ -119,12 +118,11 @@ class ShowIpBgpRouteDistributer(MetaParser):
 
         # show ip bgp 192.168.1.1
         if route or '.' in address_family:
-            parser = ShowIpBgpAllDetail(self.device)
+            parser_cls = ShowIpBgpAllDetail
         # show ip bgp ipv4
         else:
-            parser = ShowIpBgp(self.device)
-        self.schema = parser.schema
-        return parser.parse(output=output)
+            parser_cls = ShowIpBgp
+        return delegate(self, parser_cls, output=output)
 
 # =============================================
 # Parser for:
@@ -639,7 +637,7 @@ class ShowIpBgpAllNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSupe
                            address_family=address_family)
 
     def check_number_of_prefixes(self, output):
-        number_of_prefixes = re.compile(r'Total\s+number\s+of\s+prefixes\s+(?P<number_of_prefixes>\d+)\s*')
+        number_of_prefixes = regex_engine.compile(r'Total\s+number\s+of\s+prefixes\s+(?P<number_of_prefixes>\d+)\s*')
         m = number_of_prefixes.search(output)
         if not m:
             return 0
@@ -922,25 +920,25 @@ class ShowIpBgpTemplatePeerSession(ShowIpBgpTemplatePeerSessionSchema):
         else:
             out = output
 
-        p1 = re.compile(r'^\s*Template:+(?P<template_id>[0-9\s\S\w]+),'
-                        r' +index:(?P<index>[0-9]+)$')
-        p2 = re.compile(r'^\s*Local +policies:+(?P<local_policies>0x[0-9A-F]+),'
-                        r' +Inherited +polices:+(?P<inherited_polices>0x[0-9A-F]+)$')
-        p3 = re.compile(r'^\s*Locally +configured +session +commands:$')
-        p4 = re.compile(r'^\s*remote-as +(?P<remote_as>[0-9]+)$')
-        p5 = re.compile(r'^\s*password +(?P<password_text>[\w\s]+)$')
-        p6 = re.compile(r'^\s*shutdown$')
-        p7 = re.compile(r'^\s*ebgp-multihop +(?P<ebgp_multihop_max_no>[0-9]+)$')
-        p8 = re.compile(r'^\s*update-source +(?P<update_source>[\d\w]+)$')
-        p9 = re.compile(r'^\s*transport +connection-mode +(?P<transport_connection_mode>[\s\w]+)$')
-        p10 = re.compile(r'^\s*description +(?P<desc>[\d\S\s\w]+)$')
-        p11 = re.compile(r'^\s*dont-capability-negotiate +four-octets-as$')
-        p12 = re.compile(r'^\s*timers +(?P<keepalive_interval>[\d]+)'
-                            r' +(?P<holdtime>[\d]+)$')
-        p13 = re.compile(r'^\s*local-as +(?P<local_as_as_no>[\d]+)$')
-        p14 = re.compile(r'^\s*disable-connected-check$')
-        p15 = re.compile(r'^\s*fall-over +bfd$')
-        p16 = re.compile(r'^\s*Inherited +session +commands:$')
+        p1 = regex_engine.compile(r'^\s*Template:+(?P<template_id>[0-9\s\S\w]+),'
+                                  r' +index:(?P<index>[0-9]+)$')
+        p2 = regex_engine.compile(r'^\s*Local +policies:+(?P<local_policies>0x[0-9A-F]+),'
+                                  r' +Inherited +polices:+(?P<inherited_polices>0x[0-9A-F]+)$')
+        p3 = regex_engine.compile(r'^\s*Locally +configured +session +commands:$')
+        p4 = regex_engine.compile(r'^\s*remote-as +(?P<remote_as>[0-9]+)$')
+        p5 = regex_engine.compile(r'^\s*password +(?P<password_text>[\w\s]+)$')
+        p6 = regex_engine.compile(r'^\s*shutdown$')
+        p7 = regex_engine.compile(r'^\s*ebgp-multihop +(?P<ebgp_multihop_max_no>[0-9]+)$')
+        p8 = regex_engine.compile(r'^\s*update-source +(?P<update_source>[\d\w]+)$')
+        p9 = regex_engine.compile(r'^\s*transport +connection-mode +(?P<transport_connection_mode>[\s\w]+)$')
+        p10 = regex_engine.compile(r'^\s*description +(?P<desc>[\d\S\s\w]+)$')
+        p11 = regex_engine.compile(r'^\s*dont-capability-negotiate +four-octets-as$')
+        p12 = regex_engine.compile(r'^\s*timers +(?P<keepalive_interval>[\d]+)'
+                                      r' +(?P<holdtime>[\d]+)$')
+        p13 = regex_engine.compile(r'^\s*local-as +(?P<local_as_as_no>[\d]+)$')
+        p14 = regex_engine.compile(r'^\s*disable-connected-check$')
+        p15 = regex_engine.compile(r'^\s*fall-over +bfd$')
+        p16 = regex_engine.compile(r'^\s*Inherited +session +commands:$')
 
         # Init vars
         parsed_dict = {}
@@ -1212,45 +1210,45 @@ class ShowIpBgpTemplatePeerPolicy(ShowIpBgpTemplatePeerPolicySchema):
         else:
             out = output
 
-        p1 = re.compile(r'^\s*Template:+(?P<template_id>[0-9\s\S\w]+),'
-                        ' +index:(?P<index>[0-9]+).$')
+        p1 = regex_engine.compile(r'^\s*Template:+(?P<template_id>[0-9\s\S\w]+),'
+                                  ' +index:(?P<index>[0-9]+).$')
     
-        p2 = re.compile(r'^\s*Local +policies:+(?P<local_policies>0x[0-9A-F]+),'
-                        ' +Inherited +polices:+(?P<inherited_polices>0x[0-9A-F]+)$')
+        p2 = regex_engine.compile(r'^\s*Local +policies:+(?P<local_policies>0x[0-9A-F]+),'
+                                  ' +Inherited +polices:+(?P<inherited_polices>0x[0-9A-F]+)$')
     
-        p3 = re.compile(r'^\s*Local +disable +policies:+(?P<local_disable_policies>0x[0-9A-F]+),'
-                        ' +Inherited +disable +policies:+(?P<inherited_disable_polices>0x[0-9A-F]+)$')
+        p3 = regex_engine.compile(r'^\s*Local +disable +policies:+(?P<local_disable_policies>0x[0-9A-F]+),'
+                                  ' +Inherited +disable +policies:+(?P<inherited_disable_polices>0x[0-9A-F]+)$')
     
-        p4 = re.compile(r'^\s*Locally +configured +policies:$')
+        p4 = regex_engine.compile(r'^\s*Locally +configured +policies:$')
     
-        p5 = re.compile(r'^\s*route-map +(?P<remote_map_in>[0-9a-zA-Z]+) +in$')
+        p5 = regex_engine.compile(r'^\s*route-map +(?P<remote_map_in>[0-9a-zA-Z]+) +in$')
     
-        p6 = re.compile(r'^\s*route-map +(?P<route_map_out>[0-9a-zA-Z]+) +out$')
+        p6 = regex_engine.compile(r'^\s*route-map +(?P<route_map_out>[0-9a-zA-Z]+) +out$')
     
-        p7 = re.compile(r'^\s*default-originate +route-map'
-                        ' +(?P<default_originate_route_map>[0-9a-zA-Z]+)$')
+        p7 = regex_engine.compile(r'^\s*default-originate +route-map'
+                                  ' +(?P<default_originate_route_map>[0-9a-zA-Z]+)$')
     
-        p8 = re.compile(r'^\s*soft-reconfiguration'
-                        ' +(?P<soft_reconfiguration>[a-zA-Z]+)$')
+        p8 = regex_engine.compile(r'^\s*soft-reconfiguration'
+                                  ' +(?P<soft_reconfiguration>[a-zA-Z]+)$')
     
-        p9 = re.compile(r'^\s*maximum-prefix'
-                        ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)'
-                        ' ?(?P<maximum_prefix_threshold>[0-9]+)?'
-                        ' +restart +(?P<maximum_prefix_restart>[0-9]+)$')
+        p9 = regex_engine.compile(r'^\s*maximum-prefix'
+                                  ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)'
+                                  ' ?(?P<maximum_prefix_threshold>[0-9]+)?'
+                                  ' +restart +(?P<maximum_prefix_restart>[0-9]+)$')
     
-        p10 = re.compile(r'^\s*as-override$')
+        p10 = regex_engine.compile(r'^\s*as-override$')
     
-        p11 = re.compile(r'^\s*allowas-in +(?P<allowas_in_as_number>[0-9]+)$')
+        p11 = regex_engine.compile(r'^\s*allowas-in +(?P<allowas_in_as_number>[0-9]+)$')
     
-        p12 = re.compile(r'^\s*route-reflector-client$')
+        p12 = regex_engine.compile(r'^\s*route-reflector-client$')
     
-        p13 = re.compile(r'^\s*next-hop-self$')
+        p13 = regex_engine.compile(r'^\s*next-hop-self$')
     
-        p14 = re.compile(r'^\s*send-community +(?P<send_community>[\w]+)$')
+        p14 = regex_engine.compile(r'^\s*send-community +(?P<send_community>[\w]+)$')
     
-        p15 = re.compile(r'^\s*soo +(?P<soo>[\w\:\d]+)$')
+        p15 = regex_engine.compile(r'^\s*soo +(?P<soo>[\w\:\d]+)$')
     
-        p16 = re.compile(r'^\s*Inherited policies:$')
+        p16 = regex_engine.compile(r'^\s*Inherited policies:$')
 
         # Init vars
         parsed_dict = {}
@@ -1501,29 +1499,29 @@ class ShowIpBgpAllDampeningParameters(ShowIpBgpAllDampeningParametersSchema):
         else:
             out = output
 
-        p1 = re.compile(r'^\s*For +address +family:'
-                        r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
+        p1 = regex_engine.compile(r'^\s*For +address +family:'
+                                  r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
 
-        p2 = re.compile(r'^\s*dampening'
-                        r' +(?P<dampening_val>[\d\s\S]+)$')
+        p2 = regex_engine.compile(r'^\s*dampening'
+                                  r' +(?P<dampening_val>[\d\s\S]+)$')
 
-        p3 = re.compile(r'^\s*Half-life +time\s*:'
-                        r' +(?P<half_life_time>[\d]+)'
-                        r' mins +Decay +Time +: +(?P<decay_time>[\d]+) +secs$')
+        p3 = regex_engine.compile(r'^\s*Half-life +time\s*:'
+                                  r' +(?P<half_life_time>[\d]+)'
+                                  r' mins +Decay +Time +: +(?P<decay_time>[\d]+) +secs$')
 
-        p4 = re.compile(r'^\s*Max +suppress +penalty:'
-                        r'\s+(?P<max_suppress_penalty>[0-9]+)'
-                        r'\s+Max +suppress +time:\s+(?P<max_suppress_time>[\d]+) +mins$')
+        p4 = regex_engine.compile(r'^\s*Max +suppress +penalty:'
+                                  r'\s+(?P<max_suppress_penalty>[0-9]+)'
+                                  r'\s+Max +suppress +time:\s+(?P<max_suppress_time>[\d]+) +mins$')
 
-        p5 = re.compile(r'^\s*Suppress +penalty +:'
-                        r' +(?P<suppress_penalty>[\d]+)'
-                        r' +Reuse +penalty +: +(?P<reuse_penalty>[\d]+)$')
+        p5 = regex_engine.compile(r'^\s*Suppress +penalty +:'
+                                  r' +(?P<suppress_penalty>[\d]+)'
+                                  r' +Reuse +penalty +: +(?P<reuse_penalty>[\d]+)$')
 
-        p6 = re.compile(r'^\s*% +dampening +not +enabled +for +base$')
+        p6 = regex_engine.compile(r'^\s*% +dampening +not +enabled +for +base$')
 
-        p7 = re.compile(r'^\s*For +vrf: +(?P<vrf_name>[\w\d]+)$')
+        p7 = regex_engine.compile(r'^\s*For +vrf: +(?P<vrf_name>[\w\d]+)$')
 
-        p8 = re.compile(r'^\s*% +dampening +not +enabled +for +vrf +(?P<vrf_name>[\d\w]+)$')
+        p8 = regex_engine.compile(r'^\s*% +dampening +not +enabled +for +vrf +(?P<vrf_name>[\d\w]+)$')
             
         # Init vars
         parsed_dict = {}
@@ -8,12 +8,12 @@ All rights reserved
 """
 
 # Python
-import re
 import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 log = logging.getLogger(__name__)
@@ -62,10 +62,10 @@ class ShowIpRsvpFastReroute(ShowIpRsvpFastRerouteSchema):
             output = self.device.execute(self.cli_command)
 
         # Protected LSP
-        p0 = re.compile(r'Protected\s+LSP')
+        p0 = regex_engine.compile(r'Protected\s+LSP')
 
         # Bender_08_t13             Te0/0/8  250M:G     Tu232:3       Ready  any-unl Nhop
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"(?P<p2p_protected_lsp>\S+)\s+"
             r"(?P<protect_intf>\S+)\s+"
             r"(?P<bandwidth_and_type>\d+[a-zA-Z]+\:\w+)\s+"
@@ -75,10 +75,10 @@ class ShowIpRsvpFastReroute(ShowIpRsvpFastRerouteSchema):
             r"(?P<type>\S+)\s*$")
 
         # *Protected Sub-LSP
-        p2 = re.compile(r'\*Protected\s+Sub\-LSP')
+        p2 = regex_engine.compile(r'\*Protected\s+Sub\-LSP')
 
         # Bender_08_t13             Te0/0/8  250M:G     Tu232:3       Ready
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"(?P<p2p_protected_sub_lsp>\S+)\s+"
             r"(?P<protect_intf>\S+)\s+"
             r"(?P<bandwidth_and_type>\d+[a-zA-Z]+\:\w+)\s+"
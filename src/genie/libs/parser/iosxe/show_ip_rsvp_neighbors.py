@@ -7,13 +7,15 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 log = logging.getLogger(__name__)
 
 class ShowIpRsvpNeihborsSchema(MetaParser):
@@ -51,7 +53,7 @@ class ShowIpRsvpNeihbor(ShowIpRsvpNeihborsSchema):
         result=1
             
         ###192.1.1.2       Raw IP         00:35:18   00:34:58  
-        p1=re.compile(r"(?P<neighbor>\d+\.\d+\.\d+\.\d+)\s+(?P<encapsulation>[a-zA-Z ]+)\s+(?P<time_since_msg_rcvd>\S+)\s+(?P<time_since_msg_sent>\S+)")
+        p1=regex_engine.compile(r"(?P<neighbor>\d+\.\d+\.\d+\.\d+)\s+(?P<encapsulation>[a-zA-Z ]+)\s+(?P<time_since_msg_rcvd>\S+)\s+(?P<time_since_msg_sent>\S+)")
 
         for line in output.splitlines():
             line=line.strip()
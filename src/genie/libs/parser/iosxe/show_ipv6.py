@@ -45,6 +45,7 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -111,9 +112,9 @@ class ShowIpv6Neighbors(ShowIpv6NeighborsSchema):
 
         # IPv6 Address                              Age Link-layer Addr State Interface
         # 2001:db8:8548:1::2                                 0 fa16.3eff.09c8  REACH Gi2
-        p1 = re.compile(r'^(?P<ip>([\w\:]+))\s+(?P<age>\S+)\s+'
-                        r'(?P<link_layer_address>\S+)\s+(?P<neighbor_state>\S+)'
-                        r'\s+(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<ip>([\w\:]+))\s+(?P<age>\S+)\s+'
+                                  r'(?P<link_layer_address>\S+)\s+(?P<neighbor_state>\S+)'
+                                  r'\s+(?P<interface>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -168,9 +169,9 @@ class ShowIpv6NeighborsDetail(ShowIpv6NeighborsSchema):
 
         # IPv6 Address                              TRLV Age Link-layer Addr State Interface
         # FE80::F816:3EFF:FEFF:F3DC                   0    0 fa16.3eff.f3dc  REACH Gi2.90
-        p1 = re.compile(r'^(?P<ip>([\w\:]+))\s+(?P<trlv>\S)\s+(?P<age>\S+)\s+'
-                         r'(?P<link_layer_address>\S+)\s+(?P<neighbor_state>\S+)\s+'
-                         r'(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<ip>([\w\:]+))\s+(?P<trlv>\S)\s+(?P<age>\S+)\s+'
+                                   r'(?P<link_layer_address>\S+)\s+(?P<neighbor_state>\S+)\s+'
+                                   r'(?P<interface>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -250,11 +251,11 @@ class ShowIpv6DestinationGuardPolicy(ShowIpv6DestinationGuardPolicySchema):
 
 
         #   enforcement always
-        enforcement_capture = re.compile(
+        enforcement_capture = regex_engine.compile(
             r"enforcement\s+(?P<enforcement>\S+)$"
         )
         # vlan 5               VLAN  poll                 Destination Guard vlan all
-        entry_capture = re.compile(
+        entry_capture = regex_engine.compile(
             r"^(?P<target>((\S+\s\d+)|(\S+/\d+(/\d+)?)))\s+"
             r"(?P<type>\S+)\s+"
             r"(?P<policy>\S+)\s+"
@@ -344,30 +345,30 @@ class ShowIpv6DhcpGuardPolicy(ShowIpv6DhcpGuardPolicySchema):
             output = output
 
         #Dhcp guard policy pol1 configuration:
-        p = re.compile(r'^Dhcp\s+guard\s+policy\s+(?P<policy_name>.+)\s+configuration:$')
+        p = regex_engine.compile(r'^Dhcp\s+guard\s+policy\s+(?P<policy_name>.+)\s+configuration:$')
 
         #Device Role: dhcp server
-        p1 = re.compile(r'^Device\sRole:\s(?P<device_role>dhcp (client|server))$')
+        p1 = regex_engine.compile(r'^Device\sRole:\s(?P<device_role>dhcp (client|server))$')
 
         #Trusted Port
-        p2 = re.compile(r'^(?P<trusted_port>Trusted Port)$')
+        p2 = regex_engine.compile(r'^(?P<trusted_port>Trusted Port)$')
 
         #Max Preference: 255
-        p3 = re.compile(r'^Max Preference:\s+((?P<max_preference>\d+))$')
+        p3 = regex_engine.compile(r'^Max Preference:\s+((?P<max_preference>\d+))$')
 
         #Min Preference: 0
-        p4 = re.compile(r'^Min Preference:(\s+(?P<min_preference>\d+))$')
+        p4 = regex_engine.compile(r'^Min Preference:(\s+(?P<min_preference>\d+))$')
 
         #Source Address Match Access List: acl1
-        p5 = re.compile(r'^Source Address Match Access List:\s+(?P<access_list>\S+)$')
+        p5 = regex_engine.compile(r'^Source Address Match Access List:\s+(?P<access_list>\S+)$')
 
         #Prefix List Match Prefix List: abc
-        p6 = re.compile(r'^Prefix List Match Prefix List:\s+(?P<prefix_list>\S+)$')
+        p6 = regex_engine.compile(r'^Prefix List Match Prefix List:\s+(?P<prefix_list>\S+)$')
 
         #Target               Type  Policy               Feature        Target range
         # vlan 2               VLAN  pol1                 DHCP Guard     vlan all
         # Et0/0                PORT  pol1                 DHCP Guard     vlanall
-        p7 = re.compile(r'^(?P<target>\S+\s*\S+)\s{2,}(?P<type>\S+)\s+\S+\s+(?P<feature>\S+\s\S+)\s+(?P<target_range>\S+.*\S+)$')
+        p7 = regex_engine.compile(r'^(?P<target>\S+\s*\S+)\s{2,}(?P<type>\S+)\s+\S+\s+(?P<feature>\S+\s\S+)\s+(?P<target_range>\S+.*\S+)$')
 
         parser_dict = {}
 
@@ -473,19 +474,19 @@ class ShowIpv6DhcpLdra(ShowIpv6DhcpLdraSchema):
         result_dict = {}
 
         # DHCPv6 LDRA is Enabled.
-        p0 = re.compile(r'^DHCPv6 +LDRA +is +(?P<status>(Enabled|Disabled))')
+        p0 = regex_engine.compile(r'^DHCPv6 +LDRA +is +(?P<status>(Enabled|Disabled))')
         # DHCPv6 LDRA policy: client-facing-disable
         # DHCPv6 LDRA policy: client-facing-trusted
         # DHCPv6 LDRA policy: client-facing-untrusted
         # DHCPv6 LDRA policy: server-facing
-        p1 = re.compile(r'^DHCPv6 +LDRA +policy: +(?P<policy>[a-zA-z\-]+)')
+        p1 = regex_engine.compile(r'^DHCPv6 +LDRA +policy: +(?P<policy>[a-zA-z\-]+)')
         #         Target: Gi1/0/20
         #         Target: Gi1/0/12 vlan 2     vlan 3     vlan 10
         #         Target: Gi1/0/11 vlan 4     vlan 5     vlan 11
         #         Target: Gi1/0/6 Gi1/0/7 Gi1/0/8 Gi1/0/9 Gi1/0/10 Gi1/0/13 Gi1/0/14 Gi1/0/15
-        p2 = re.compile(r'^Target:\s+(?P<targets>[\w\/\s]+)')
+        p2 = regex_engine.compile(r'^Target:\s+(?P<targets>[\w\/\s]+)')
         #                 Gi1/0/16 Gi1/0/17 Gi1/0/18 Gi1/0/19
-        p3 = re.compile(r'^(?P<targets_ext>[\w\/\s]+)')
+        p3 = regex_engine.compile(r'^(?P<targets_ext>[\w\/\s]+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -578,21 +579,21 @@ class ShowIpv6DhcpLdraStatistics(ShowIpv6DhcpLdraStatisticsSchema):
 
         #                 DHCPv6 LDRA client facing statistics.
         #                 DHCPv6 LDRA server facing statistics.
-        p0 = re.compile(r'DHCPv6\s+LDRA\s+(?P<mode>[\w\s]+)\s+statistics')
+        p0 = regex_engine.compile(r'DHCPv6\s+LDRA\s+(?P<mode>[\w\s]+)\s+statistics')
         # Messages received                20
-        p1 = re.compile(r'Messages\s+received\s+(?P<total_recvd>\d+)')
+        p1 = regex_engine.compile(r'Messages\s+received\s+(?P<total_recvd>\d+)')
         # Messages sent                    20
-        p2 = re.compile(r'Messages\s+sent\s+(?P<total_sent>\d+)')
+        p2 = regex_engine.compile(r'Messages\s+sent\s+(?P<total_sent>\d+)')
         # Messages discarded               0
-        p3 = re.compile(r'Messages\s+discarded\s+(?P<total_discard>\d+)')
+        p3 = regex_engine.compile(r'Messages\s+discarded\s+(?P<total_discard>\d+)')
         # Messages                         Received
         # Messages                         Sent
-        p4 = re.compile(r'Messages\s+(?P<msg_mode>Received|Sent)')
+        p4 = regex_engine.compile(r'Messages\s+(?P<msg_mode>Received|Sent)')
         # SOLICIT                          1
         # REQUEST                          1
         # RENEW                            18
         # RELAY-FORWARD                    20
-        p5 = re.compile(r'^(?P<msg_type>[a-zA-Z\-]+)\s+(?P<count>\d+)')
+        p5 = regex_engine.compile(r'^(?P<msg_type>[a-zA-Z\-]+)\s+(?P<count>\d+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -716,26 +717,26 @@ class ShowIpv6Routers(ShowIpv6RoutersSchema):
 
         # Router FE80::FA7A:41FF:FE25:2502 on Vlan100, last update 0 min, CONFLICT
         # Router FE80::FA7A:41FF:FE25:2502 on Vlan100, last update 0 min
-        p1 = re.compile(r'^Router +(?P<router_link_local_ip>\S+)\s+\w+\s+'
-                        r'(?P<interface>\S+), +last +update +'
-                        r'(?P<last_update>\d+) +min(\,\s|)'
-                        r'(?:(?P<status>\w+))?')
+        p1 = regex_engine.compile(r'^Router +(?P<router_link_local_ip>\S+)\s+\w+\s+'
+                                  r'(?P<interface>\S+), +last +update +'
+                                  r'(?P<last_update>\d+) +min(\,\s|)'
+                                  r'(?:(?P<status>\w+))?')
 
         # Hops 64, Lifetime 200 sec, AddrFlag=0, OtherFlag=0, MTU=1500
-        p2 = re.compile(r'^Hops +(?P<hops>\d+), +Lifetime +(?P<lifetime>\d{1,4}) +sec, +AddrFlag+\=(?P<addr_flag>\d+), '
-                        r'+OtherFlag\=(?P<other_flag>\d+), +MTU\=(?P<mtu>\d{1,4})$')
+        p2 = regex_engine.compile(r'^Hops +(?P<hops>\d+), +Lifetime +(?P<lifetime>\d{1,4}) +sec, +AddrFlag+\=(?P<addr_flag>\d+), '
+                                  r'+OtherFlag\=(?P<other_flag>\d+), +MTU\=(?P<mtu>\d{1,4})$')
 
         # HomeAgentFlag=0, Preference=Low
-        p3 = re.compile(r'^HomeAgentFlag\=(?P<home_agent_flag>\d+), +Preference\=(?P<preference>\w+)$')
+        p3 = regex_engine.compile(r'^HomeAgentFlag\=(?P<home_agent_flag>\d+), +Preference\=(?P<preference>\w+)$')
 
         # Reachable time 0 (unspecified), Retransmit time 0 (unspecified)
-        p4 = re.compile(r'^Reachable +time +(?P<reachable_time>\d+) \S+, +Retransmit +time +(?P<retransmit_time>\d+)')
+        p4 = regex_engine.compile(r'^Reachable +time +(?P<reachable_time>\d+) \S+, +Retransmit +time +(?P<retransmit_time>\d+)')
 
         #Prefix 111::/64 onlink autoconfig
-        p5 = re.compile(r'^Prefix +(?P<prefix_id>\S+) +onlink +autoconfig$')
+        p5 = regex_engine.compile(r'^Prefix +(?P<prefix_id>\S+) +onlink +autoconfig$')
 
         # Valid lifetime 12, preferred lifetime 8
-        p6 = re.compile(r'^Valid +lifetime +(?P<valid_lifetime>\d+), +preferred +lifetime +(?P<preferred_lifetime>\d+)$')
+        p6 = regex_engine.compile(r'^Valid +lifetime +(?P<valid_lifetime>\d+), +preferred +lifetime +(?P<preferred_lifetime>\d+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -894,24 +895,24 @@ class ShowIpv6Mrib(ShowIpv6MribSchema):
         # (*,FF05:1:1::1) RPF nbr: 2001:150:1:1::1 Flags: C
         #(2001:192:168:7::11,FF05:1:1::1) RPF nbr: 2001:150:1:1::1 Flags: L C
 
-        p1 = re.compile(r'^\((?P<source_address>[\w\:\.\*\/]+)\,'
-                     r'(?P<multicast_group>[\w\:\.\/]+)\)'
-                     r' +RPF nbr: (?P<RPF_nbr>[\w\:\.\/]+)'
-                     r'\s+Flags\:(?P<mrib_flags>[\w\s]+|$)')
+        p1 = regex_engine.compile(r'^\((?P<source_address>[\w\:\.\*\/]+)\,'
+                               r'(?P<multicast_group>[\w\:\.\/]+)\)'
+                               r' +RPF nbr: (?P<RPF_nbr>[\w\:\.\/]+)'
+                               r'\s+Flags\:(?P<mrib_flags>[\w\s]+|$)')
 
         # GigabitEthernet2/0/6 Flags: A NS 
         # Tunnel1 Flags: A NS  		 
-        p2 = re.compile(r'^(?P<ingress_if>[\w\.\/\, ]+)'
-                         r'\s+Flags\: +(?P<ingress_flags>A[\s\w]+|[\s\w]+ +A[\s\w]+|A$)') 
+        p2 = regex_engine.compile(r'^(?P<ingress_if>[\w\.\/\, ]+)'
+                                   r'\s+Flags\: +(?P<ingress_flags>A[\s\w]+|[\s\w]+ +A[\s\w]+|A$)') 
 						 
         #  LISP0.1 Flags: F NS  Next-hop: 100.154.154.154
         #  LISP0.1 Flags: F NS   Next-hop: (100.11.11.11, 235.1.3.167)
-        p3 = re.compile(r'^(?P<egress_if>[\w\.\/\,]+)'
-                        r'\s+Flags\:\s+(?P<egress_flags>F[\s\w]+)+Next-hop\:\s+(?P<egress_next_hop>([\w\:\.\*\/]+)|(\([\w\:\.\*\/]+\, +[\w\:\.\*\/]+\)))')
+        p3 = regex_engine.compile(r'^(?P<egress_if>[\w\.\/\,]+)'
+                                  r'\s+Flags\:\s+(?P<egress_flags>F[\s\w]+)+Next-hop\:\s+(?P<egress_next_hop>([\w\:\.\*\/]+)|(\([\w\:\.\*\/]+\, +[\w\:\.\*\/]+\)))')
 
         #  Vlan2006 Flags: F LI NS
-        p4=re.compile(r'^(?P<egress_if>[\w\.\/\, ]+)'
-                        r'\s+Flags\: +(?P<egress_flags>F[\s\w]+)')            
+        p4=regex_engine.compile(r'^(?P<egress_if>[\w\.\/\, ]+)'
+                                  r'\s+Flags\: +(?P<egress_flags>F[\s\w]+)')            
 
         for line in output.splitlines():
             line=(line.strip()).replace('\t',' ')
@@ -1028,22 +1029,22 @@ class ShowIpv6MfibStatus(ShowIpv6MfibStatusSchema):
             output = self.device.execute(self.cli_command)
         
         # Configuration Status: enabled
-        p1 = re.compile(r'^Configuration Status: +(?P<configuration_status>\w+)$')
+        p1 = regex_engine.compile(r'^Configuration Status: +(?P<configuration_status>\w+)$')
 
         # Operational Status: running
-        p2 = re.compile(r'^Operational Status: +(?P<operational_status>\w+)$')
+        p2 = regex_engine.compile(r'^Operational Status: +(?P<operational_status>\w+)$')
 
         # Initialization State: Running
-        p3 = re.compile(r'^Initialization State: +(?P<initialization_state>\w+)$')
+        p3 = regex_engine.compile(r'^Initialization State: +(?P<initialization_state>\w+)$')
 
         # Total signalling packets queued: 0
-        p4 = re.compile(r'^Total signalling packets queued: +(?P<total_signalling_packets_queued>\d+)$')
+        p4 = regex_engine.compile(r'^Total signalling packets queued: +(?P<total_signalling_packets_queued>\d+)$')
 
         # Process Status: may enable - 3 - pid 737
-        p5 = re.compile(r'^Process Status: may +(?P<status>\w+) - \d+ - pid +(?P<pid>\d+)')
+        p5 = regex_engine.compile(r'^Process Status: may +(?P<status>\w+) - \d+ - pid +(?P<pid>\d+)')
 
         # Tables 1/1/0 (active/mrib/io)
-        p6 = re.compile(r'^Tables (?P<active>\d)+(\/)+(?P<mrib>\d)(\/)+(?P<io>\d) +(\()+active+(\/)+mrib+(\/)+io+(\))$')
+        p6 = regex_engine.compile(r'^Tables (?P<active>\d)+(\/)+(?P<mrib>\d)(\/)+(?P<io>\d) +(\()+active+(\/)+mrib+(\/)+io+(\))$')
         
         ret_dict = {}
 
@@ -1264,34 +1265,34 @@ class ShowIpv6Mfib(ShowIpv6MfibSchema):
         egress_data_update = False
         #Default
         #VRF vrf1
-        p1 = re.compile(r'^(VRF\s+)?(?P<vrf>[\w]+)$')
+        p1 = regex_engine.compile(r'^(VRF\s+)?(?P<vrf>[\w]+)$')
 
         #  (*,225.1.1.1) Flags: C HW
         # (70.1.1.10,225.1.1.1) Flags: HW
         #  (*,FF05:1:1::1) Flags: C HW
         # (2001:70:1:1::10,FF05:1:1::1) Flags: HW
-        p3 = re.compile(r'^\((?P<source_address>[\w\:\.\*\/]+)\,'
-                     r'(?P<multicast_group>[\w\:\.\/]+)\)'
-                     r'\s+Flags\:\s*(?P<mfib_flags>[\w\s]*)$')
+        p3 = regex_engine.compile(r'^\((?P<source_address>[\w\:\.\*\/]+)\,'
+                               r'(?P<multicast_group>[\w\:\.\/]+)\)'
+                               r'\s+Flags\:\s*(?P<mfib_flags>[\w\s]*)$')
         #0x1AF0  OIF-IC count: 0, OIF-A count: 1
-        p4 = re.compile(r'\w+ +OIF-IC count: +(?P<oif_ic_count>[\w]+)'
-                   r'\, +OIF-A count: +(?P<oif_a_count>[\w]+)$')
+        p4 = regex_engine.compile(r'\w+ +OIF-IC count: +(?P<oif_ic_count>[\w]+)'
+                             r'\, +OIF-A count: +(?P<oif_a_count>[\w]+)$')
         # SW Forwarding: 0/0/0/0, Other: 0/0/0
-        p5 = re.compile(r'SW Forwarding\:\s+(?P<sw_packet_count>[\w]+)\/'
-                     r'(?P<sw_packets_per_second>[\w]+)\/'
-                     r'(?P<sw_average_packet_size>[\w]+)\/'
-                     r'(?P<sw_kbits_per_second>[\w]+)\,'
-                     r'\s+Other\: +(?P<sw_total>[\w]+)\/'
-                     r'(?P<sw_rpf_failed>[\w]+)\/'
-                     r'(?P<sw_other_drops>[\w]+)$')
+        p5 = regex_engine.compile(r'SW Forwarding\:\s+(?P<sw_packet_count>[\w]+)\/'
+                               r'(?P<sw_packets_per_second>[\w]+)\/'
+                               r'(?P<sw_average_packet_size>[\w]+)\/'
+                               r'(?P<sw_kbits_per_second>[\w]+)\,'
+                               r'\s+Other\: +(?P<sw_total>[\w]+)\/'
+                               r'(?P<sw_rpf_failed>[\w]+)\/'
+                               r'(?P<sw_other_drops>[\w]+)$')
         #HW Forwarding:   222/0/204/0, Other: 0/0/0
-        p6 = re.compile(r'^HW\s+Forwarding\:\s+(?P<hw_packet_count>[\w]+)\/'
-                     r'(?P<hw_packets_per_second>[\w]+)\/'
-                     r'(?P<hw_average_packet_size>[\w]+)\/'
-                     r'(?P<hw_kbits_per_second>[\w]+)\,'
-                     r'\s+Other\: +(?P<hw_total>[\w]+)\/'
-                     r'(?P<hw_rpf_failed>[\w]+)\/'
-                     r'(?P<hw_other_drops>[\w]+)$')
+        p6 = regex_engine.compile(r'^HW\s+Forwarding\:\s+(?P<hw_packet_count>[\w]+)\/'
+                               r'(?P<hw_packets_per_second>[\w]+)\/'
+                               r'(?P<hw_average_packet_size>[\w]+)\/'
+                               r'(?P<hw_kbits_per_second>[\w]+)\,'
+                               r'\s+Other\: +(?P<hw_total>[\w]+)\/'
+                               r'(?P<hw_rpf_failed>[\w]+)\/'
+                               r'(?P<hw_other_drops>[\w]+)$')
         # LISP0.1 Flags: A NS
         #  Null0 Flags: A
         #  GigabitEthernet1/0/1 Flags: A NS
@@ -1299,9 +1300,9 @@ class ShowIpv6Mfib(ShowIpv6MfibSchema):
         #Vlan500, VXLAN v6 Encap (50000, 239.1.1.0) Flags: A
         #Port-channel5 Flags: RA A MA
 
-        p7 = re.compile(r'^(?P<ingress_if>[\w\/\.\-\:]+)'
-                         r'(\,\s+VXLAN +(?P<ingress_vxlan_version>[v0-9]+)?(\s+)?(?P<ingress_vxlan_cap>[\w]+)(\s+)?(\(?(?P<ingress_vxlan_vni>[0-9]+)(\,\s+)?(?P<ingress_vxlan_nxthop>[\w:./]+)?\)?)?)?'
-                         r' +Flags\: +(?P<ingress_flags>A[\s\w]+|[\s\w]+ +A[\s\w]+|A$)')
+        p7 = regex_engine.compile(r'^(?P<ingress_if>[\w\/\.\-\:]+)'
+                                   r'(\,\s+VXLAN +(?P<ingress_vxlan_version>[v0-9]+)?(\s+)?(?P<ingress_vxlan_cap>[\w]+)(\s+)?(\(?(?P<ingress_vxlan_vni>[0-9]+)(\,\s+)?(?P<ingress_vxlan_nxthop>[\w:./]+)?\)?)?)?'
+                                   r' +Flags\: +(?P<ingress_flags>A[\s\w]+|[\s\w]+ +A[\s\w]+|A$)')
 
         #Vlan2001 Flags: F NS
         #LISP0.1, (100.11.11.11, 235.1.3.167) Flags:
@@ -1311,23 +1312,23 @@ class ShowIpv6Mfib(ShowIpv6MfibSchema):
         #L2LISP0.1502, L2LISP v6 Decap Flags: F NS
         #LISP0.101, 100:88:88::88 Flags: F
         #Port-channel5 Flags: RF F NS
-        p8 = re.compile(r'^(?P<egress_if>[\w\/\.\-\:]+)'
-                        r'(\,\s+L2LISP\s*v6\s*Decap\s*)?'
-                        r'(\,\s+\(?(?P<egress_rloc>[\w:\.]+)(\,\s+)?(?P<egress_underlay_mcast>[\w\.]+)?\)?)?'
-                        r'(\,\s+VXLAN +(?P<egress_vxlan_version>[v0-9]+)?(\s+)?(?P<egress_vxlan_cap>[\w]+)(\s+)?'
-                        r'(\(?(?P<egress_vxlan_vni>[0-9]+)(\,\s+)?(?P<egress_vxlan_nxthop>[\w:.]+)?\)?)?)?'
-                        r'\s+Flags\:\s?(?P<egress_flags>F[\s\w]+|[\s\w]+\s+F[\s\w]+|F$|[\s\w]+\s+F$|$)')
+        p8 = regex_engine.compile(r'^(?P<egress_if>[\w\/\.\-\:]+)'
+                                  r'(\,\s+L2LISP\s*v6\s*Decap\s*)?'
+                                  r'(\,\s+\(?(?P<egress_rloc>[\w:\.]+)(\,\s+)?(?P<egress_underlay_mcast>[\w\.]+)?\)?)?'
+                                  r'(\,\s+VXLAN +(?P<egress_vxlan_version>[v0-9]+)?(\s+)?(?P<egress_vxlan_cap>[\w]+)(\s+)?'
+                                  r'(\(?(?P<egress_vxlan_vni>[0-9]+)(\,\s+)?(?P<egress_vxlan_nxthop>[\w:.]+)?\)?)?)?'
+                                  r'\s+Flags\:\s?(?P<egress_flags>F[\s\w]+|[\s\w]+\s+F[\s\w]+|F$|[\s\w]+\s+F$|$)')
         
 
         #CEF: Adjacency with MAC: 01005E010101000A000120010800
-        p9_1 = re.compile(r'^CEF\: +(?P<egress_adj_mac>[\w \:\(\)\.]+)$')
+        p9_1 = regex_engine.compile(r'^CEF\: +(?P<egress_adj_mac>[\w \:\(\)\.]+)$')
         #CEF: Special OCE (discard)
-        p9_2 = re.compile(r'^CEF\: +(?P<egress_adj_mac>[\w \(\.\)]+)$')
+        p9_2 = regex_engine.compile(r'^CEF\: +(?P<egress_adj_mac>[\w \(\.\)]+)$')
         #Pkts: 0/0/2    Rate: 0 pps
-        p10 = re.compile(r'^Pkts\:\s+(?P<egress_hw_pkt_count>[\w]+)\/'
-                         r'(?P<egress_fs_pkt_count>[\w]+)\/'
-                         r'(?P<egress_ps_pkt_count>[\w]+)'
-                         r'\s+Rate\:\s+(?P<egress_pkt_rate>[\w]+)\s+pps$')
+        p10 = regex_engine.compile(r'^Pkts\:\s+(?P<egress_hw_pkt_count>[\w]+)\/'
+                                   r'(?P<egress_fs_pkt_count>[\w]+)\/'
+                                   r'(?P<egress_ps_pkt_count>[\w]+)'
+                                   r'\s+Rate\:\s+(?P<egress_pkt_rate>[\w]+)\s+pps$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1512,16 +1513,16 @@ class ShowIpv6DhcpPool(ShowIpv6DhcpPoolSchema):
         pool_dict = {}
 
         #DHCPv6 pool: pool1
-        p1 = re.compile(r'^DHCPv6 +pool: +(?P<pool_name>\S+)$')
+        p1 = regex_engine.compile(r'^DHCPv6 +pool: +(?P<pool_name>\S+)$')
 
         #Address allocation prefix: 2510:1::/64 valid 300 preferred 300 (1 in use, 0 conflicts)
-        p2 = re.compile(r'^Address +allocation +prefix: +(?P<address_allocation_prefix>\S+) +valid +(?P<valid_lifetime>\d+) +preferred +(?P<preferred_lifetime>\d+) +\S(?P<in_use_address>\d+) +in +use, +(?P<conflicts>\d+) +conflicts\S$')
+        p2 = regex_engine.compile(r'^Address +allocation +prefix: +(?P<address_allocation_prefix>\S+) +valid +(?P<valid_lifetime>\d+) +preferred +(?P<preferred_lifetime>\d+) +\S(?P<in_use_address>\d+) +in +use, +(?P<conflicts>\d+) +conflicts\S$')
 
         #Domain name: cisco.com
-        p3 = re.compile(r'^Domain +name: +(?P<domain_name>\S+)$')
+        p3 = regex_engine.compile(r'^Domain +name: +(?P<domain_name>\S+)$')
 
         #Active clients: 1
-        p4 = re.compile(r'Active +clients: +(?P<active_clients>\d+)$')
+        p4 = regex_engine.compile(r'Active +clients: +(?P<active_clients>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1602,21 +1603,21 @@ class ShowIpv6DhcpStatistics(ShowIpv6DhcpStatisticsSchema):
         # Messages sent                    2
         # Messages discarded               0
         # Messages could not be sent       0        
-        p1 = re.compile(r'^Messages +(?P<total_type>[a-zA-Z ]+)\s+(?P<total>\d+)$')
+        p1 = regex_engine.compile(r'^Messages +(?P<total_type>[a-zA-Z ]+)\s+(?P<total>\d+)$')
 
         # Messages                         Received
         # Messages                         Sent
-        p2 = re.compile(r'^Messages\s+(?P<message_type>Received|Sent)$')
+        p2 = regex_engine.compile(r'^Messages\s+(?P<message_type>Received|Sent)$')
 
         # Send message failed due to:
-        p3 = re.compile(r'^Send message +failed +due +to:$')
+        p3 = regex_engine.compile(r'^Send message +failed +due +to:$')
 
         # SOLICIT                          1
         # REQUEST                          1
         # ADVERTISE                        1
         # REPLY                            1
         # IPv6 protocol on outgoing interface not ready            6
-        p4 = re.compile(r'^(?P<message_type>[a-zA-Z0-9 ]+)\s+(?P<count>\d+)$')
+        p4 = regex_engine.compile(r'^(?P<message_type>[a-zA-Z0-9 ]+)\s+(?P<count>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1735,35 +1736,35 @@ class ShowIpv6DhcpBinding(ShowIpv6DhcpBindingSchema):
         res_dict = {}
 
         # Client: FE80::210:94FF:FE00:1 
-        p1 = re.compile(r'^(?P<client>Client):\s+(?P<client_address>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<client>Client):\s+(?P<client_address>\S+)$')
 
         # DUID: 00010001534573D7001094000001
-        p2 = re.compile(r'^DUID:\s+(?P<duid>\S+)$')
+        p2 = regex_engine.compile(r'^DUID:\s+(?P<duid>\S+)$')
 
         # Username : unassigned
-        p3 = re.compile(r'^Username\s+:\s+(?P<username>\S+)$')
+        p3 = regex_engine.compile(r'^Username\s+:\s+(?P<username>\S+)$')
 
         # Interface : Ethernet0/0
-        p4 = re.compile(r'^Interface\s+:\s+(?P<interface>\S+)$')
+        p4 = regex_engine.compile(r'^Interface\s+:\s+(?P<interface>\S+)$')
 
         # VRF : default
-        p5 = re.compile(r'^VRF\s+:\s+(?P<vrf>\S+)$')
+        p5 = regex_engine.compile(r'^VRF\s+:\s+(?P<vrf>\S+)$')
 
         # IA NA: IA ID 0x00000000, T1 43200, T2 69120
         # IA PD: IA ID 0x00100001, T1 302400, T2 483840
-        p6 = re.compile(r'^(?P<ia>[A-Z ]+):\s+IA ID\s+(?P<ia_id>\S+),\s+T1\s+(?P<t1>\d+),\s+T2\s+(?P<t2>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<ia>[A-Z ]+):\s+IA ID\s+(?P<ia_id>\S+),\s+T1\s+(?P<t1>\d+),\s+T2\s+(?P<t2>\d+)$')
 
         # Address: 3001::F8AB:B06E:8974:9359
-        p71 = re.compile(r'^Address:\s+(?P<ipv6_address>\S+)$')
+        p71 = regex_engine.compile(r'^Address:\s+(?P<ipv6_address>\S+)$')
 
         # Prefix: 2001:4::/48
-        p72 = re.compile(r'^Prefix:\s+(?P<ipv6_prefix>\S+)$')
+        p72 = regex_engine.compile(r'^Prefix:\s+(?P<ipv6_prefix>\S+)$')
 
         # preferred lifetime 86400, valid lifetime 172800
         # preferred lifetime INFINITY, , valid lifetime INFINITY,
-        p8 = re.compile(r'^preferred lifetime\s+(?P<preferred_lifetime>\w+)(, ,|,)\s+valid lifetime\s+(?P<valid_lifetime>\w+)(,|)$')
+        p8 = regex_engine.compile(r'^preferred lifetime\s+(?P<preferred_lifetime>\w+)(, ,|,)\s+valid lifetime\s+(?P<valid_lifetime>\w+)(,|)$')
         # expires at Feb 17 2022 08:58 AM (172782 seconds)
-        p9 = re.compile(r'^(?P<expires>\w+) +at\s+(?P<month>\S+)\s+(?P<day>\d+)\s+(?P<year>\d+)\s+(?P<time>[0-9A-Z :]+)\s+\((?P<remaining_seconds>\d+) +seconds\)$')
+        p9 = regex_engine.compile(r'^(?P<expires>\w+) +at\s+(?P<month>\S+)\s+(?P<day>\d+)\s+(?P<year>\d+)\s+(?P<time>[0-9A-Z :]+)\s+\((?P<remaining_seconds>\d+) +seconds\)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1922,31 +1923,31 @@ class ShowIpv6NhrpSummary(ShowIpv6NhrpSummarySchema):
             out = output
         
         #IPv6 NHRP cache 4 entries, 3072 bytes
-        p1 = re.compile(r'^IPv6 +NHRP +cache +(?P<nhrp_entries>[\d]+) +entries, +(?P<size>[\d]+)')
+        p1 = regex_engine.compile(r'^IPv6 +NHRP +cache +(?P<nhrp_entries>[\d]+) +entries, +(?P<size>[\d]+)')
         #2 static 2 dynamic 0 incomplete
-        p2 = re.compile(r'^(?P<total_static_entries>[\d]+) +static +(?P<total_dynamic_entries>[\d]+) +dynamic +(?P<total_incomplete_entries>[\d]+) +incomplete')
+        p2 = regex_engine.compile(r'^(?P<total_static_entries>[\d]+) +static +(?P<total_dynamic_entries>[\d]+) +dynamic +(?P<total_incomplete_entries>[\d]+) +incomplete')
         #4 Remote
-        p3 = re.compile(r'(?P<remote_entries>[\d]+) Remote')
+        p3 = regex_engine.compile(r'(?P<remote_entries>[\d]+) Remote')
         #2 static 2 dynamic 0 incomplete
-        p4 = re.compile(r'^(?P<remote_static_entries>[\d]+) +static +(?P<remote_dynamic_entries>[\d]+) +dynamic +(?P<remote_incomplete_entries>[\d]+) +incomplete')
+        p4 = regex_engine.compile(r'^(?P<remote_static_entries>[\d]+) +static +(?P<remote_dynamic_entries>[\d]+) +dynamic +(?P<remote_incomplete_entries>[\d]+) +incomplete')
         #1 nhop 3 bfd
-        p5 = re.compile(r'^(?P<nhop>[\d]+) +nhop +(?P<bfd>[\d]+) +bfd')
+        p5 = regex_engine.compile(r'^(?P<nhop>[\d]+) +nhop +(?P<bfd>[\d]+) +bfd')
         #0 default 0 temporary
-        p6 = re.compile(r'^(?P<default>[\d]+) +default +(?P<temporary>[\d]+) +temporary')
+        p6 = regex_engine.compile(r'^(?P<default>[\d]+) +default +(?P<temporary>[\d]+) +temporary')
         #2 route
-        p7 = re.compile(r'^(?P<total>[\d]+) +route')
+        p7 = regex_engine.compile(r'^(?P<total>[\d]+) +route')
         #2 rib (2 H 0 nho)
-        p8 = re.compile(r'^(?P<rib>[\d]+) +rib +.(?P<h_rib>[\d]+) +H +(?P<nho_rib>[\d]+) +nho.')
+        p8 = regex_engine.compile(r'^(?P<rib>[\d]+) +rib +.(?P<h_rib>[\d]+) +H +(?P<nho_rib>[\d]+) +nho.')
         #0 bgp
-        p9 = re.compile(r'^(?P<bgp>[\d]+) +bgp')
+        p9 = regex_engine.compile(r'^(?P<bgp>[\d]+) +bgp')
         #0 lfib
-        p10 = re.compile(r'(?P<lfib>[\d]+) +lfib')
+        p10 = regex_engine.compile(r'(?P<lfib>[\d]+) +lfib')
         #0 Local
-        p11 = re.compile(r'^(?P<local>[\d]+) +Local')
+        p11 = regex_engine.compile(r'^(?P<local>[\d]+) +Local')
         #0 static 0 dynamic 0 incomplete
-        p12 = re.compile(r'^(?P<local_static>[\d]+) +static +(?P<local_dynamic>[\d]+) +dynamic +(?P<local_incomplete>[\d]+) +incomplete')
+        p12 = regex_engine.compile(r'^(?P<local_static>[\d]+) +static +(?P<local_dynamic>[\d]+) +dynamic +(?P<local_incomplete>[\d]+) +incomplete')
         #0 lfib
-        p13 = re.compile(r'(?P<lfib>[\d]+) +lfib')
+        p13 = regex_engine.compile(r'(?P<lfib>[\d]+) +lfib')
 
         # initial return dictionary
         nhrp = False
@@ -2112,16 +2113,16 @@ class ShowIpv6CefSummary(ShowIpv6CefSummarySchema):
             out = output
 
         # Vrf red
-        p1 = re.compile(r'^VRF +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^VRF +(?P<vrf>\S+)$')
 
         # 6 prefixes (6/0 fwd/non-fwd)
-        p2 = re.compile(r'^(?P<total_prefix>\d+) +prefixes +\((?P<fwd>\d+)\/(?P<non_fwd>\d+)+ fwd\/non-fwd\)$')
+        p2 = regex_engine.compile(r'^(?P<total_prefix>\d+) +prefixes +\((?P<fwd>\d+)\/(?P<non_fwd>\d+)+ fwd\/non-fwd\)$')
 
         # Table id 0x1E000001
-        p3 = re.compile(r'^Table id (?P<table_id>\S+)$')
+        p3 = regex_engine.compile(r'^Table id (?P<table_id>\S+)$')
 
         #Database epoch:        0 (6 entries at this epoch)
-        p4 = re.compile(r'^Database epoch: +(?P<epoch>\d+) +\(\d+ entries at this epoch\)$')
+        p4 = regex_engine.compile(r'^Database epoch: +(?P<epoch>\d+) +\(\d+ entries at this epoch\)$')
 
 
         ret_dict = {}
@@ -2188,8 +2189,8 @@ class ShowIpv6StaticRecursive(ShowIpv6StaticRecursiveSchema):
 
         # for routes installed in RIB
         # *   2005::/64 via 2001::2, distance 1
-        p1 = re.compile(r'^(?P<installed>\*?) *(?P<prefix>[a-f0-9:]+:\/\d+) via (?P<nhop>[a-f0-9:]+)'
-                        r', distance (?P<distance>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<installed>\*?) *(?P<prefix>[a-f0-9:]+:\/\d+) via (?P<nhop>[a-f0-9:]+)'
+                                  r', distance (?P<distance>\d+)$')
         
         
         ret_dict = {}
@@ -2257,11 +2258,11 @@ class showIpv6MldSnooping(showIpv6MldSnoopingSchema):
             output = self.device.execute(self.cli_command) 
 
         # Global MLD Snooping configuration
-        p1 = re.compile(r'^Global MLD Snooping configuration:$')
+        p1 = regex_engine.compile(r'^Global MLD Snooping configuration:$')
         # Vlan 1
-        p2 = re.compile(r'^Vlan +(?P<vlan>\d+):$')
+        p2 = regex_engine.compile(r'^Vlan +(?P<vlan>\d+):$')
         # MLD snooping                        : Disabled
-        p3 = re.compile(r'^(?P<key>.*) +: +(?P<value>.*)$')
+        p3 = regex_engine.compile(r'^(?P<key>.*) +: +(?P<value>.*)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -2328,31 +2329,31 @@ class ShowIpv6DhcpRelayBinding(ShowIpv6DhcpRelayBindingSchema):
             output = self.device.execute(self.cli_command)
 
         # Prefix: 2001:DB8:1201::/48 (TwentyFiveGigE1/0/1)
-        p1 = re.compile(r"^Prefix:\s+(?P<prefix>\S+)\s+\((?P<interface>\S+)\)$")
+        p1 = regex_engine.compile(r"^Prefix:\s+(?P<prefix>\S+)\s+\((?P<interface>\S+)\)$")
         
         #   DUID: 00030001ECCE131F6700
-        p1_1 = re.compile(r"^\s+DUID:\s+(?P<duid>\S+)$")
+        p1_1 = regex_engine.compile(r"^\s+DUID:\s+(?P<duid>\S+)$")
         
         #   IAID: 8388609
-        p1_2 = re.compile(r"^\s+IAID:\s+(?P<iaid>\d+)$")
+        p1_2 = regex_engine.compile(r"^\s+IAID:\s+(?P<iaid>\d+)$")
         
         #   lifetime: 1800
-        p1_3 = re.compile(r"^\s+lifetime:\s+(?P<lifetime>\d+)$")
+        p1_3 = regex_engine.compile(r"^\s+lifetime:\s+(?P<lifetime>\d+)$")
         
         #   expiration: 19:51:56 UTC Mar 21 2023
-        p1_4 = re.compile(r"^\s+expiration:\s+(?P<expiration>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+        p1_4 = regex_engine.compile(r"^\s+expiration:\s+(?P<expiration>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
         
         #   Total number of Relay bindings = 1
-        p2 = re.compile(r"^\s+Total\s+number\s+of\s+Relay\s+bindings\s+=\s+(?P<num_relay_binding>\d+)$")
+        p2 = regex_engine.compile(r"^\s+Total\s+number\s+of\s+Relay\s+bindings\s+=\s+(?P<num_relay_binding>\d+)$")
         
         #   Total number of IAPD bindings = 1
-        p3 = re.compile(r"^\s+Total\s+number\s+of\s+IAPD\s+bindings\s+=\s+(?P<num_iapd_binding>\d+)$")
+        p3 = regex_engine.compile(r"^\s+Total\s+number\s+of\s+IAPD\s+bindings\s+=\s+(?P<num_iapd_binding>\d+)$")
         
         #   Total number of IANA bindings = 0
-        p4 = re.compile(r"^\s+Total\s+number\s+of\s+IANA\s+bindings\s+=\s+(?P<num_iana_binding>\d+)$")
+        p4 = regex_engine.compile(r"^\s+Total\s+number\s+of\s+IANA\s+bindings\s+=\s+(?P<num_iana_binding>\d+)$")
         
         #   Total number of Relay bindings added by Bulk lease = 0
-        p5 = re.compile(r"^\s+Total\s+number\s+of\s+Relay\s+bindings\s+added\s+by\s+Bulk\s+lease\s+=\s+(?P<num_relay_binding_bulk_lease>\d+)$")
+        p5 = regex_engine.compile(r"^\s+Total\s+number\s+of\s+Relay\s+bindings\s+added\s+by\s+Bulk\s+lease\s+=\s+(?P<num_relay_binding_bulk_lease>\d+)$")
 
         ret_dict = {}
 
@@ -2447,7 +2448,7 @@ class ShowIpv6cefExactRoute(ShowIpv6cefExactRouteSchema):
             output = self.device.execute(self.cli_command.format(source=source, destination=destination))
 
         # 11:1:0:1::1 -> 11:0:0:2::2 => IP adj out of Port-channel1, addr 11:0:0:2::2
-        p1 = re.compile(r'^(?P<source>[\d\:]+) +-> +(?P<destination>[\d\:]+) +=> IP adj out of +(?P<ip_adj>[\w\-\.\/]+), +addr +(?P<ip_addr>[\d\:]+)$')
+        p1 = regex_engine.compile(r'^(?P<source>[\d\:]+) +-> +(?P<destination>[\d\:]+) +=> IP adj out of +(?P<ip_adj>[\w\-\.\/]+), +addr +(?P<ip_addr>[\d\:]+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -1,7 +1,7 @@
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 from genie import parsergen
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowIpv6MldSnoopingGroupsSchema(MetaParser):
@@ -42,13 +42,13 @@ class ShowIpv6MldSnoopingGroups(ShowIpv6MldSnoopingGroupsSchema):
 
         # initial regexp pattern
         #100       FF1E:11::5               mld         v1          Twe1/0/30
-        p1 = re.compile(r'^(?P<vlan_id>\d+)\s+(?P<group_ip>[0-9a-fA-F\.:]+)\s+(?P<type>\w+)\s+(?P<versions>\w+)\s+(?P<ports>[a-zA-Z\d\/\.]+)$')
+        p1 = regex_engine.compile(r'^(?P<vlan_id>\d+)\s+(?P<group_ip>[0-9a-fA-F\.:]+)\s+(?P<type>\w+)\s+(?P<versions>\w+)\s+(?P<ports>[a-zA-Z\d\/\.]+)$')
         #100       FF1E:11::2               mld         v1,v2       Twe1/0/30
-        p2 = re.compile(r'^(?P<vlan_id>\d+)\s+(?P<group_ip>[0-9a-fA-F\.:]+)\s+(?P<type>\w+)\s+(?P<versions>\w+\,\w+)\s+(?P<ports>[a-zA-Z\d\/\.]+)$')
+        p2 = regex_engine.compile(r'^(?P<vlan_id>\d+)\s+(?P<group_ip>[0-9a-fA-F\.:]+)\s+(?P<type>\w+)\s+(?P<versions>\w+\,\w+)\s+(?P<ports>[a-zA-Z\d\/\.]+)$')
         #100       FF1E:11::21              mld         v2          Twe1/0/30, Tu0
-        p3 = re.compile(r'^(?P<vlan_id>\d+)\s+(?P<group_ip>[0-9a-fA-F\.:]+)\s+(?P<type>\w+)\s+(?P<versions>\w+)\s+(?P<ports>[a-zA-Z\d\/\.]+\,\s+[a-zA-Z\d\/\.]+)$')
+        p3 = regex_engine.compile(r'^(?P<vlan_id>\d+)\s+(?P<group_ip>[0-9a-fA-F\.:]+)\s+(?P<type>\w+)\s+(?P<versions>\w+)\s+(?P<ports>[a-zA-Z\d\/\.]+\,\s+[a-zA-Z\d\/\.]+)$')
         #100       FF1E:11::1               mld         v1,v2       Twe1/0/30, Tu0
-        p4 = re.compile(r'^(?P<vlan_id>\d+)\s+(?P<group_ip>[0-9a-fA-F\.:]+)\s+(?P<type>\w+)\s+(?P<versions>\w+\,\w+)\s+(?P<ports>[a-zA-Z\d\/\.]+\,\s+[a-zA-Z\d\/\.]+)$')
+        p4 = regex_engine.compile(r'^(?P<vlan_id>\d+)\s+(?P<group_ip>[0-9a-fA-F\.:]+)\s+(?P<type>\w+)\s+(?P<versions>\w+\,\w+)\s+(?P<ports>[a-zA-Z\d\/\.]+\,\s+[a-zA-Z\d\/\.]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -175,41 +175,41 @@ class ShowIpv6MldSnoopingVlan(ShowIpv6MldSnoopingVlanSchema):
             output = self.device.execute(self.cli_command.format(vlan_id=vlan_id))
         
         # MLD snooping                 : Disabled
-        p0 = re.compile(r'^MLD\s+snooping\s+:\s+(?P<mld>\w+)$')
+        p0 = regex_engine.compile(r'^MLD\s+snooping\s+:\s+(?P<mld>\w+)$')
 
         # Global PIM Snooping          : Disabled
-        p1 = re.compile(r'^[Global\s]*(PIM|Pim)\s+Snooping\s+:\s+(?P<pim>\w+)$')
+        p1 = regex_engine.compile(r'^[Global\s]*(PIM|Pim)\s+Snooping\s+:\s+(?P<pim>\w+)$')
 
         # MLDv2 snooping               : Disabled
         # MLDv2 snooping (minimal)     : Enabled
-        p2 = re.compile(r'^MLDv2\s+snooping.+\s+:\s+(?P<mldv2>\w+)$')
+        p2 = regex_engine.compile(r'^MLDv2\s+snooping.+\s+:\s+(?P<mldv2>\w+)$')
         
         # Listener message suppression : Disabled
-        p3 = re.compile(r'^Listener\s+message\s+suppression\s+:\s+(?P<suppression>\w+)$')
+        p3 = regex_engine.compile(r'^Listener\s+message\s+suppression\s+:\s+(?P<suppression>\w+)$')
         
         # TCN solicit query            : Disabled
-        p4 = re.compile(r'^TCN\s+solicit\s+query\s+:\s+(?P<solicit_query>\w+)$')
+        p4 = regex_engine.compile(r'^TCN\s+solicit\s+query\s+:\s+(?P<solicit_query>\w+)$')
         
         # TCN flood query count        : 2
-        p5 = re.compile(r'^TCN\s+flood\s+query\s+count\s+:\s+(?P<flood_query>\d+)$')
+        p5 = regex_engine.compile(r'^TCN\s+flood\s+query\s+count\s+:\s+(?P<flood_query>\d+)$')
         
         # Robustness variable          : 2
-        p6 = re.compile(r'^Robustness\s+variable\s+:\s+(?P<robustness>\d+)$')
+        p6 = regex_engine.compile(r'^Robustness\s+variable\s+:\s+(?P<robustness>\d+)$')
         
         # Last listener query count    : 2
-        p7 = re.compile(r'^Last\s+listener\s+query\s+count\s+:\s+(?P<query_count>\d+)$')
+        p7 = regex_engine.compile(r'^Last\s+listener\s+query\s+count\s+:\s+(?P<query_count>\d+)$')
         
         # Last listener query interval : 1000
-        p8 = re.compile(r'^Last\s+listener\s+query\s+interval\s+:\s+(?P<query_interval>\d+)$')
+        p8 = regex_engine.compile(r'^Last\s+listener\s+query\s+interval\s+:\s+(?P<query_interval>\d+)$')
 
         # Vlan 1:
-        p9 = re.compile(r'^Vlan\s+(?P<vlan>\d+):$')
+        p9 = regex_engine.compile(r'^Vlan\s+(?P<vlan>\d+):$')
 
         # MLD immediate leave                 : Disabled
-        p10 = re.compile(r'^MLD\s+immediate\s+leave\s+:\s+(?P<mld_leave>\w+)$')
+        p10 = regex_engine.compile(r'^MLD\s+immediate\s+leave\s+:\s+(?P<mld_leave>\w+)$')
 
         # Explicit host tracking              : Enabled
-        p11 = re.compile(r'^Explicit\s+host\s+tracking\s+:\s+(?P<host_tracking>\w+)$')
+        p11 = regex_engine.compile(r'^Explicit\s+host\s+tracking\s+:\s+(?P<host_tracking>\w+)$')
 
         ret_dict = dict()
         vlan_flag = False
@@ -368,7 +368,7 @@ class ShowIpv6MldSnoopingMrouterVlan(ShowIpv6MldSnoopingMrouterVlanSchema):
             output = self.device.execute(self.cli_command[0].format(vlanid=vlanid))
 
         #  100    Tw1/0/13(static)
-        p = re.compile(r"^(?P<vlan>\d+)\s+(?P<ports>[\w\/\.\,\s\(\)\w]+)$")
+        p = regex_engine.compile(r"^(?P<vlan>\d+)\s+(?P<ports>[\w\/\.\,\s\(\)\w]+)$")
 
         ret_dict = {}
 
@@ -6,12 +6,14 @@ Copyright (c) 2023 by Cisco Systems, Inc.
 All rights reserved.
 '''
 
-import re
 
 # genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ====================================================
 # Schema for 'show ipv6 nd routing-proxy'
 # ====================================================
@@ -47,15 +49,15 @@ class ShowIpv6NdRoutingProxy(ShowIpv6NdRoutingProxySchema):
             output = self.device.execute(self.cli_command)
 
         # Routing Proxy default configuration:
-        p1 = re.compile(r'^Routing Proxy\s+(?P<policy_name>.+)\s+configuration:$')
+        p1 = regex_engine.compile(r'^Routing Proxy\s+(?P<policy_name>.+)\s+configuration:$')
 
         # Proxying NDP
-        p2 = re.compile(r'^Proxying\s+(?P<proxying>\S+)$')
+        p2 = regex_engine.compile(r'^Proxying\s+(?P<proxying>\S+)$')
 
         # Target               Type  Policy               Feature        Target range
         # vlan 2               VLAN  pol1                 DHCP Guard     vlan all
         # Et0/0                PORT  pol1                 DHCP Guard     vlanall
-        p3 = re.compile \
+        p3 = regex_engine.compile \
             (r'^(?P<target>\S+\s*\S+)\s{2,}(?P<type>\S+)\s+\S+\s+(?P<feature>\S+\s\S+)\s+(?P<target_range>\S+.*\S+)$')
 
         parser_dict = {}
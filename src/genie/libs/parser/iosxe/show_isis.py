@@ -33,12 +33,10 @@ IOSXE parsers for the following show commands:
     * show isis ipv6 fast-reroute ti-lfa fwd-ids {fwd_id}
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, ListOf
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -142,11 +140,11 @@ class ShowIsisNeighborsSuperParser(ShowIsisNeighborsDetailSchema):
             out = output
 
         # Tag isis_net:
-        p1 = re.compile(r"^Tag\s+(?P<isis_name>\S+)\s*:$")
+        p1 = regex_engine.compile(r"^Tag\s+(?P<isis_name>\S+)\s*:$")
 
         # LAB-9001-2      L1   Te0/0/26      10.239.7.29     UP    27       00
         # spine2-ott-lisp-c9k-127 \
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^\s*((?P<system_id>\S+([^(L1L2|L1|L2)]))(\s*\\)?)"
             r"?\s*((?P<type>(L1L2|L1|L2))\s+"
             r"(?P<interface>\S+)\s+((?P<ip_address>\S+))?\s+"
@@ -155,84 +153,84 @@ class ShowIsisNeighborsSuperParser(ShowIsisNeighborsDetailSchema):
         )
 
         # Area Address(es): 50.1234
-        p3 = re.compile(r"^Area\s+Address\(es\):\s+" r"(?P<area_addresses>([\w+. ]+))")
+        p3 = regex_engine.compile(r"^Area\s+Address\(es\):\s+" r"(?P<area_addresses>([\w+. ]+))")
 
         # SNPA: aabb.cc00.9d20
-        p4 = re.compile(r"^SNPA:\s+(?P<snpa>([\w.]+))")
+        p4 = regex_engine.compile(r"^SNPA:\s+(?P<snpa>([\w.]+))")
 
         # IP Address(es): 13.13.1.2
         # IP Address(es): 13.13.1.2 12.2.2.2
-        p5 = re.compile(r"^IP\s+Address\(es\):\s+(?P<ipv4_addresses>[\d. ]+)")
+        p5 = regex_engine.compile(r"^IP\s+Address\(es\):\s+(?P<ipv4_addresses>[\d. ]+)")
 
         # IPv6 Address(es): FE80::A8BB:CCFF:FE00:9D20
         # IPv6 Address(es): FE80::A8BB:CCFF:FE001:4333
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^IPv6\s+Address\(es\):\s+" r"(?P<ipv6_addresses>([0-9a-fA-F:]+))"
         )
 
         # IPv6 Global Address: 13:13::2
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^IPv6\s+Global\s+Address:\s+" r"(?P<ipv6_global_address>[0-9a-fA-F:]+)"
         )
 
         # State Changed: 00:00:38
-        p8 = re.compile(r"^State\s+Changed:\s+(?P<state_changed>([\d:]+))")
+        p8 = regex_engine.compile(r"^State\s+Changed:\s+(?P<state_changed>([\d:]+))")
 
         # LAN Priority: 64
-        p9 = re.compile(r"^LAN\s+Priority:\s+(?P<lan_priority>\d+)")
+        p9 = regex_engine.compile(r"^LAN\s+Priority:\s+(?P<lan_priority>\d+)")
 
         # Format: Phase V
-        p10 = re.compile(r"^Format:\s+(?P<format>([\w+\s+]+))")
+        p10 = regex_engine.compile(r"^Format:\s+(?P<format>([\w+\s+]+))")
 
         # Remote TID: 0, 2
         # Remote TID: 0(parallel adjacency suppressed)
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^Remote\s+TID:\s+(?P<remote_tids>[\d\s,]+)"
             r"(?P<parallel_suppressed>\(parallel\s*adjacency\s*suppressed\))?"
         )
 
         # Local TID:  0, 2
-        p12 = re.compile(r"^Local\s+TID:\s+(?P<local_tids>([\d\s,]+))")
+        p12 = regex_engine.compile(r"^Local\s+TID:\s+(?P<local_tids>([\d\s,]+))")
 
         # Interface name: Ethernet0/2
-        p13 = re.compile(r"^Interface\s+name:\s+(?P<interface_name>" r"([\w\d\/.]+))")
+        p13 = regex_engine.compile(r"^Interface\s+name:\s+(?P<interface_name>" r"([\w\d\/.]+))")
 
         # Neighbor Circuit Id: 3
-        p14 = re.compile(r"^Neighbor\s+Circuit\s+Id:\s+(?P<nbr_ckt_id>\d+)")
+        p14 = regex_engine.compile(r"^Neighbor\s+Circuit\s+Id:\s+(?P<nbr_ckt_id>\d+)")
 
         # Remote PSNP Interval: 50
-        p15 = re.compile(r"^Remote\s*PSNP\s*Interval:\s*" r"(?P<remote_psnp_intvl>\d+)")
+        p15 = regex_engine.compile(r"^Remote\s*PSNP\s*Interval:\s*" r"(?P<remote_psnp_intvl>\d+)")
 
         # Adjacency Not Up: Waiting For BFD Session
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^Adjacency\s+Not\s+Up:\s+" r"(?P<adj_down_reason>([\w+\s+])+)"
         )
 
         # Remote BFD Support:TLV (MTID:0, IPV6)
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"^Remote\s*BFD\s*Support:(?P<nbr_tlv_present>TLV)?"
             r"(?P<mtid_nlpid_pairs>.*)"
         )
-        p17_1 = re.compile(
+        p17_1 = regex_engine.compile(
             r"\(MTID:(?P<remote_mtid>\d+),\s*" r"(?P<remote_nlpid>\w+)\)"
         )
 
         # BFD enabled: (MTID:0, ipv6)
         # BFD enabled: (MTID:0, ipv4) (MTID:2, ipv6)
-        p18 = re.compile(r"^BFD\s*enabled:\s*" r"(?P<bfd_mtid_afi_pairs>.*)")
-        p18_1 = re.compile(r"\(MTID:(?P<local_mtid>\d+),\s*" r"(?P<local_nlpid>\w+)\)")
+        p18 = regex_engine.compile(r"^BFD\s*enabled:\s*" r"(?P<bfd_mtid_afi_pairs>.*)")
+        p18_1 = regex_engine.compile(r"\(MTID:(?P<local_mtid>\d+),\s*" r"(?P<local_nlpid>\w+)\)")
 
         # L1 Last Hello Authentication Type: MD5
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"(^L\d+\s*)?Last\s*Hello\s*Authentication\s*Type:\s*"
             r"(?P<auth_type>[\w ]+)"
         )
 
         # Key Id: 100
-        p20 = re.compile(r"Key\s*Id:\s*(?P<key_id>\d+)")
+        p20 = regex_engine.compile(r"Key\s*Id:\s*(?P<key_id>\d+)")
 
         # L(1) Adjacency SID Value:16 f:0 b:0 v:1 l:1 s:0 p:0 weight:0
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^L\((?P<level>\d+)\)\s*"
             r"Adjacency\s+SID\s+Value:(?P<adj_sid>\d+)\s+"
             r"f:\s*(?P<f_flag>0|1)\s+b:\s*(?P<b_flag>0|1)\s+"
@@ -242,7 +240,7 @@ class ShowIsisNeighborsSuperParser(ShowIsisNeighborsDetailSchema):
         )
 
         # SRv6 End.X SID FCCC:CCC1:A1:E001::/64 b:0 s:0 p:0 weight:0
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r"^SRv6\s+End\.X\s+SID\s+"
             r"(?P<srv6_endx_sid>([0-9a-fA-F:/]+))\s+"
             r"b:\s*(?P<b_flag>0|1)\s+s:\s*(?P<s_flag>0|1)\s+"
@@ -250,7 +248,7 @@ class ShowIsisNeighborsSuperParser(ShowIsisNeighborsDetailSchema):
         )
 
         # Adj sync: Syncing, CSNP Rcvd: no, Init Flood: yes, Requests: 0
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r"^Adj\ssync:\s+(?P<adj_sync>\w+)"
             r"\,\s+CSNP\sRcvd:\s+(?P<csnp_rcvd>\w+)"
             r"\,\s+Init\sFlood:\s+(?P<init_flood>\w+)"
@@ -258,16 +256,16 @@ class ShowIsisNeighborsSuperParser(ShowIsisNeighborsDetailSchema):
         )
 
         # Adj sync: Full
-        p24 = re.compile(r"^Adj\ssync:\s+(?P<adj_sync>\w+)")
+        p24 = regex_engine.compile(r"^Adj\ssync:\s+(?P<adj_sync>\w+)")
 
         # Link mtu: %d Smaller than lsp-mtu:
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r"Link mtu:\s+(?P<link_mtu>\d+)\s+"
             r"Smaller\s+than\s+lsp:\s+(?P<lsp_mtu>\d+$)"
         )
 
         #SRv6 End.X SID FCCC:CCC1:A1:E004::/64 b:0 s:0 p:0 weight:0 algo:0
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r"^SRv6\s+End\.X\s+SID\s+"
             r"(?P<srv6_endx_sid>([0-9a-fA-F:/]+))\s+"
             r"b:\s*(?P<b_flag>0|1)\s+s:\s*(?P<s_flag>0|1)\s+"
@@ -652,13 +650,13 @@ class ShowIsisHostname(ShowIsisHostnameSchema):
         result_dict = {}
 
         #  Level  System ID      Dynamic Hostname  (VRF1)
-        p1 = re.compile(r"^Level +System +ID +Dynamic +Hostname +" r"\((?P<tag>\w+)\)$")
+        p1 = regex_engine.compile(r"^Level +System +ID +Dynamic +Hostname +" r"\((?P<tag>\w+)\)$")
         #  2     7777.77ff.eeee R7
         #      * 2222.22ff.4444 R2
         #      * 2001:0db8:85a3:0000:0000:8a2e:0370:7334.
         #  2     1920.0000.2003 R2-Router
-        p2 = re.compile(r'^(?P<level>\d+)?(\s?(?P<star>\*))? +'
-                        r'(?P<system_id>[a-zA-Z\d\.\:]+) +(?P<dynamic_hostname>[\w\-]+)$')
+        p2 = regex_engine.compile(r'^(?P<level>\d+)?(\s?(?P<star>\*))? +'
+                                  r'(?P<system_id>[a-zA-Z\d\.\:]+) +(?P<dynamic_hostname>[\w\-]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -733,13 +731,13 @@ class ShowIsisLspLog(ShowIsisLspLogSchema):
         result_dict = {}
 
         #  Tag VRF1:
-        p1 = re.compile(r"^Tag +(?P<tag>\w+):$")
+        p1 = regex_engine.compile(r"^Tag +(?P<tag>\w+):$")
         #    Level 1 LSP log
-        p2 = re.compile(r"^Level +(?P<level>\d+) +LSP +log$")
+        p2 = regex_engine.compile(r"^Level +(?P<level>\d+) +LSP +log$")
         # When       Count             Interface         Triggers
         # 01:13:52        5                            CONFIG OTVINFOCHG
         # 00:25:46        2         GigabitEthernet4   NEWADJ DIS
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<when>[\w\:]+) +(?P<count>\d+)( +(?P<interface>[a-zA-Z]+[\d/.]+))? +(?P<triggers>[\S\ ]+)$"
         )
 
@@ -1009,18 +1007,18 @@ class ShowIsisDatabaseSuperParser(ShowIsisDatabaseSchema):
         tag = ""
         prev_lspid = ""
         #  Tag VRF1:
-        p1 = re.compile(r"^Tag +(?P<tag>\w+):$")
+        p1 = regex_engine.compile(r"^Tag +(?P<tag>\w+):$")
 
         # IS-IS Level-1 Link State Database:
         # IS-IS Level-1 LSP r1.00-00
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^IS\-IS +Level\-(?P<level>\d+)\s+"
             r"(Link +State +Database(:)?)?(LSP\s+(?P<host_name>\S+))?$"
         )
 
         # LSPID                 LSP Seq Num  LSP Checksum  LSP Holdtime/Rcvd      ATT/P/OL
         # R2.00-00            * 0x00000007   0x8A6D                 403/*         1/0/0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<lspid>[\w\-\.]+)(\s*(?P<star>\*))?\s+(?P<lsp_seq_num>\w+)\s+"
             r"(?P<lsp_checksum>\w+)\s+(?P<lsp_holdtime>[\d\*]+)"
             r"(/(?P<lsp_rcvd>[\d\*]+))?\s+(?P<att>\d+)/(?P<p>\d+)/(?P<ol>\d+)\s*"
@@ -1028,10 +1026,10 @@ class ShowIsisDatabaseSuperParser(ShowIsisDatabaseSchema):
         )
 
         # pireg-ultra3-13.00-00 \
-        p3_1 = re.compile(r"^(?P<lspid>[\w\-\\_\.]+)(\s*\\)" r"(\s*(?P<star>\*))?$")
+        p3_1 = regex_engine.compile(r"^(?P<lspid>[\w\-\\_\.]+)(\s*\\)" r"(\s*(?P<star>\*))?$")
 
         #   0x0000000E   0x5318                 990/1200      0/0/0
-        p3_2 = re.compile(
+        p3_2 = regex_engine.compile(
             r"^(\s*(?P<star>\*))?(?P<lsp_seq_num>\w+)\s+"
             r"(?P<lsp_checksum>\w+)\s+(?P<lsp_holdtime>[\d\*]+)"
             r"(/(?P<lsp_rcvd>[\d\*]+))?\s+(?P<att>\d+)/(?P<p>\d+)/(?P<ol>\d+)\s*"
@@ -1039,22 +1037,22 @@ class ShowIsisDatabaseSuperParser(ShowIsisDatabaseSchema):
         )
 
         #   Area Address: 49.0001
-        p4 = re.compile(r"^Area +Address: +(?P<area_address>[\w\.]+)$")
+        p4 = regex_engine.compile(r"^Area +Address: +(?P<area_address>[\w\.]+)$")
 
         #   NLPID:        0xCC 0x8E
-        p5 = re.compile(r"^NLPID: +(?P<nlp_id>[\w\s]+)$")
+        p5 = regex_engine.compile(r"^NLPID: +(?P<nlp_id>[\w\s]+)$")
 
         #   Topology:     IPv4 (0x0)
         #                 IPv6 (0x4002 ATT)
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^(Topology: +)?(?P<topology>(IP)+[\w]+) +\((?P<code>[\w\s]+)\)$"
         )
 
         #   Hostname: R2
-        p7 = re.compile(r"^Hostname: +(?P<hostname>\w+)$")
+        p7 = regex_engine.compile(r"^Hostname: +(?P<hostname>\w+)$")
 
         #   IP Address:   10.84.66.66
-        p8 = re.compile(r"^IP +Address: +(?P<ip_address>[\d\.]+)$")
+        p8 = regex_engine.compile(r"^IP +Address: +(?P<ip_address>[\d\.]+)$")
 
         #  Metric: 10         IS R2.01
         #  Metric: 10         IP 10.229.7.0/24
@@ -1062,58 +1060,58 @@ class ShowIsisDatabaseSuperParser(ShowIsisDatabaseSchema):
         #  Metric: 40         IS-Extended R2.01
         #  Metric: 10         IPv6 2001:DB8:2:2:2::2/128
         #  Metric: 10         IPv6 (MT-IPv6) 2001:DB8:20:2::/64
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^Metric: +(?P<metric>\d+) +(?P<type>[\w\-]+)( +\((?P<mt_ipv6>[\w\-]+)\))? +(?P<ip>\S+)$"
         )
 
         #   IPv6 Address: 2001:DB8:66:66:66::66
-        p10 = re.compile(r"^IPv6 +Address: +(?P<ip_address>[\w\:]+)$")
+        p10 = regex_engine.compile(r"^IPv6 +Address: +(?P<ip_address>[\w\:]+)$")
 
         # Router ID:    10.1.77.77
-        p11 = re.compile(r"^Router +ID: +(?P<router_id>\S+)$")
+        p11 = regex_engine.compile(r"^Router +ID: +(?P<router_id>\S+)$")
 
         # IPv6 Router ID: C01:1::1
-        p11_2 = re.compile(r"^IPv6 +Router +ID: +(?P<ipv6_router_id>\S+)$")
+        p11_2 = regex_engine.compile(r"^IPv6 +Router +ID: +(?P<ipv6_router_id>\S+)$")
 
         # Flex algorithm: 128 Metric-Type: IGP Alg-type: SPF Priority: 128
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^Flex algorithm:\s+(?P<flex_algo>\d+)\s+Metric-Type:\s+"
             r"(?P<metric_type>\S+)\s+Alg-type:\s+(?P<alg_type>\S+)\s+"
             r"Priority:\s+(?P<priority>\d+)$"
         )
 
         #   M:1
-        p13 = re.compile(r"^M:\s*(?P<m_flag>0|1)$")
+        p13 = regex_engine.compile(r"^M:\s*(?P<m_flag>0|1)$")
 
         # Router CAP:   1.1.1.1, D:0, S:0
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^Router CAP:\s+(?P<router_cap>[\d+\.]+),\s+D:\s*(?P<d_flag>0|1)"
             r",\s+S:\s*(?P<s_flag>0|1)$"
         )
 
         # Segment Routing: I:1 V:0, SRGB Base: 16000 Range: 8000
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^Segment\s+Routing:\s+I:(?P<i_flag>0|1)\s+"
             r"V:(?P<v_flag>0|1),\s+SRGB\s+Base:\s+(?P<srgb_base>\d+)"
             r"\s+Range:\s+(?P<srgb_range>\d+)$"
         )
 
         # Segment Routing Local Block: SRLB Base: 15000 Range: 1000
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^Segment\s+Routing\s+Local\s+Block:\s+SRLB Base:\s+"
             r"(?P<srlb_base>\d+)\s+Range:\s+(?P<srlb_range>\d+)$"
         )
 
         # Segment Routing Algorithms: SPF, Strict-SPF
         # Segment Routing Algorithms: SPF, Strict-SPF, Flex-algo 128
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"^Segment\s+Routing\s+Algorithms:\s+((?P<spf>SPF)?)"
             r",\s+((?P<strict_spf>Strict-SPF)?)(,\s+Flex-algo\s+"
             r"(?P<flex_id>\d+))?$"
         )
 
         # Segment Routing Algorithms: Flex-algo 129, Flex-algo 130, Flex-algo 131
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^Segment\s+Routing\s+Algorithms:\s+Flex-algo\s+"
             r"(?P<flex_id_1>\d+)((,\s+Flex-algo\s+(?P<flex_id_2>\d+))?)"
             r"((,\s+Flex-algo\s+(?P<flex_id_3>\d+))?)$"
@@ -1121,16 +1119,16 @@ class ShowIsisDatabaseSuperParser(ShowIsisDatabaseSchema):
 
         # Node-MSD
         # MSD: 16
-        p19 = re.compile(r"^MSD:\s+(?P<msd>\d+)$")
+        p19 = regex_engine.compile(r"^MSD:\s+(?P<msd>\d+)$")
 
         # Prefix-attr: X:0 R:0 N:0
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r"^Prefix-attr: X:\s*(?P<x_flag>0|1)\s+R:\s*"
             r"(?P<r_flag>0|1)\s+N:\s*(?P<n_flag>0|1)$"
         )
 
         # Adjacency SID Value:16 F:0 B:0 V:1 L:1 S:0 P:0 Weight:0
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^Adjacency SID Value:\s*(?P<adj_sid>\d+)\s+"
             r"F:\s*(?P<f_flag>0|1)\s+B:\s*(?P<b_flag>0|1)\s+"
             r"V:\s*(?P<v_flag>0|1)\s+L:\s*(?P<l_flag>0|1)\s+"
@@ -1139,31 +1137,31 @@ class ShowIsisDatabaseSuperParser(ShowIsisDatabaseSchema):
         )
 
         # Local Interface ID: 1, Remote Interface ID: 1
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r"^Local\s+Interface\s+ID:\s+(?P<local_intrf_id>\d+),\s+"
             r"Remote\s+Interface\s+ID:\s+(?P<remote_intrf_id>\d+)$"
         )
 
         # Neighbor IP Address: 12.12.12.2
-        p23 = re.compile(r"^Neighbor\s+IP\s+Address:(?P<neighbor_ip>[\d\.]+)$")
+        p23 = regex_engine.compile(r"^Neighbor\s+IP\s+Address:(?P<neighbor_ip>[\d\.]+)$")
 
         # Admin. Weight: 10
-        p24 = re.compile(r"^Admin.\s+Weight:\s+(?P<admin_weight>\d+)$")
+        p24 = regex_engine.compile(r"^Admin.\s+Weight:\s+(?P<admin_weight>\d+)$")
 
         # Physical LINK BW: 10000 kbits/sec
-        p25 = re.compile(r"^Physical\s+LINK\s+BW:\s+(?P<physical_link_bw>\d+)\.+$")
+        p25 = regex_engine.compile(r"^Physical\s+LINK\s+BW:\s+(?P<physical_link_bw>\d+)\.+$")
 
         # Interface IPV6 Address: 12:12::1
-        p26 = re.compile(r"^Interface\s+IPV6\s+Address:\s+(?P<intrf_ipv6>\S+)$")
+        p26 = regex_engine.compile(r"^Interface\s+IPV6\s+Address:\s+(?P<intrf_ipv6>\S+)$")
 
         # Neighbor IPV6 Address: 12:12::2
-        p27 = re.compile(r"^Neighbor\s+IPV6\s+Address:\s+(?P<neighbor_ipv6>\S+)$")
+        p27 = regex_engine.compile(r"^Neighbor\s+IPV6\s+Address:\s+(?P<neighbor_ipv6>\S+)$")
 
         # Route Admin Tag: 30
-        p28 = re.compile(r"^Route\s+Admin\s+Tag:\s+(?P<route_admin_tag>\d+)$")
+        p28 = regex_engine.compile(r"^Route\s+Admin\s+Tag:\s+(?P<route_admin_tag>\d+)$")
 
         # Prefix-SID Index: 1, Algorithm: SPF, R:0 N:1 P:0 E:0 V:0 L:0
-        p29 = re.compile(
+        p29 = regex_engine.compile(
             r"^Prefix-SID Index:\s+(?P<prefix_sid_index>\d+),\s+"
             r"Algorithm:\s+((?P<algo>SPF|Strict-SPF),)?(Flex-algo"
             r"\s+(?P<flex_algo>\d+),)?\s+R:(?P<r_flag>0|1)\s+"
@@ -1173,49 +1171,49 @@ class ShowIsisDatabaseSuperParser(ShowIsisDatabaseSchema):
         )
 
         # Source Router ID: 1.1.1.1
-        p30 = re.compile(r"^Source\s+Router\s+ID:\s+(?P<source_router_id>[\d\.]+)$")
+        p30 = regex_engine.compile(r"^Source\s+Router\s+ID:\s+(?P<source_router_id>[\d\.]+)$")
 
         # Reservable Global Pool BW: 0 kbits/sec
-        p31 = re.compile(
+        p31 = regex_engine.compile(
             r"^Reservable Global Pool BW:\s+(?P<reservable_gpbw>\d+)\s+kbits/sec$"
         )
 
         # Global Pool BW Unreserved:
         # [0]:        0 kbits/sec, [1]:        0 kbits/sec
-        p32 = re.compile(
+        p32 = regex_engine.compile(
             r"^\[(?P<index_1>\d)\]:\s+(?P<bit_1>\d+)\s+kbits/sec,\s+"
             r"\[(?P<index_2>\d)\]:\s+(?P<bit_2>\d+)\s+kbits/sec$"
         )
 
         # Uni Link Delay(Avg.) A-bit:0 Value:113
-        p33 = re.compile(
+        p33 = regex_engine.compile(
             r"^Uni Link Delay(Avg.)\s+A-bit:\s*(?P<a_bit>0|1)\s+"
             r"Value:\s*(?P<value>\d+)$"
         )
 
         # Uni Link Delay(Min/Max) A-bit:0 Min:93 Max:160
-        p34 = re.compile(
+        p34 = regex_engine.compile(
             r"^Uni Link Delay(Min/Max) A-bit:\s*(?P<a_bit>0|1)\s+"
             r"Min:\s*(?P<min>\d+)\s+Max:\s*(?P<max>\d+)$"
         )
 
         # Uni Link Delay(Var.) Value:12
-        p35 = re.compile(r"^Uni Link Delay(Var.) Value:\s*(?P<uni_link_delay>\d+)$")
+        p35 = regex_engine.compile(r"^Uni Link Delay(Var.) Value:\s*(?P<uni_link_delay>\d+)$")
 
         # ASLA: L flag: 0, SA-Length 1, UDA-Length 0
-        p36 = re.compile(
+        p36 = regex_engine.compile(
             r"^ASLA: L flag:\s*(?P<l_flag>0|1),\s+SA-Length\s*"
             r"(?P<sa_length>\d+),\s+UDA-Length\s*(?P<uda_length>\d+)$"
         )
 
         # Standard Applications:  FLEX-ALGO
-        p37 = re.compile(r"^Standard Applications:\s+(?P<standard_app>\S+)$")
+        p37 = regex_engine.compile(r"^Standard Applications:\s+(?P<standard_app>\S+)$")
 
         #  Bit mask:  0x10
-        p38 = re.compile(r"^Bit mask:\s+(?P<bit_mask>\S+)$")
+        p38 = regex_engine.compile(r"^Bit mask:\s+(?P<bit_mask>\S+)$")
 
         #  Appl spec Uni Link Delay(Min/Max) A-bit:0 Min:100 Max:100
-        p39 = re.compile(
+        p39 = regex_engine.compile(
             r"^Appl spec Uni Link Delay(Min/Max) A-bit:\s*"
             r"(?P<a_bit>0|1)\s+Min:\s*(?P<min>\d+)\s+Max:\s*(?P<max>\d+)$"
         )
@@ -1223,69 +1221,69 @@ class ShowIsisDatabaseSuperParser(ShowIsisDatabaseSchema):
         #  Appl spec Ext Admin Group:
         #     0x00000000 0x00000000 0x00000000 0x00000000
         #     0x00000000 0x00000000 0x00000000 0x80000000
-        p40 = re.compile(r"^Appl spec Ext Admin Group:$")
+        p40 = regex_engine.compile(r"^Appl spec Ext Admin Group:$")
 
         #  Appl spec Admin Group: 0x00000001
-        p41 = re.compile(r"^Appl spec Admin Group:\s+(?P<appl_spec_ag>\S+)$")
+        p41 = regex_engine.compile(r"^Appl spec Admin Group:\s+(?P<appl_spec_ag>\S+)$")
 
         # Affinity: 0x00000000
-        p42 = re.compile(r"^Affinity:\s+(?P<affinity>\S+)$")
+        p42 = regex_engine.compile(r"^Affinity:\s+(?P<affinity>\S+)$")
 
         # Extended Affinity:
         #    0x00000000 0x00000000 0x00000000 0x00000000
         #    0x00000000 0x00000000 0x00000200
-        p43 = re.compile(r"^Extended Affinity:$")
+        p43 = regex_engine.compile(r"^Extended Affinity:$")
 
         #   Flex-algo Exclude-any Ext Admin Group:
         #    0x00000000 0x00000000 0x00000000 0x00000000
         #    0x00000000 0x00000000 0x00000200
-        p44 = re.compile(r"^Flex-algo Exclude-any Ext Admin Group:$")
+        p44 = regex_engine.compile(r"^Flex-algo Exclude-any Ext Admin Group:$")
 
         #   Flex-algo Include-any Ext Admin Group:
         #    0x00000000 0x00000000 0x00000000 0x00000000
         #    0x00000000 0x00000000 0x00000200
-        p45 = re.compile(r"^Flex-algo Include-any Ext Admin Group:$")
+        p45 = regex_engine.compile(r"^Flex-algo Include-any Ext Admin Group:$")
 
         #   Flex-algo Include-all Ext Admin Group:
         #    0x00000000 0x00000000 0x00000000 0x00000000
         #    0x00000000 0x00000000 0x00000200
-        p46 = re.compile(r"^Flex-algo Include-all Ext Admin Group:$")
+        p46 = regex_engine.compile(r"^Flex-algo Include-all Ext Admin Group:$")
 
         #    0x00000000
         #    0x00000000 0x00000000
         #    0x00000000 0x00000000 0x00000200
         #    0x00000000 0x00000000 0x00000000 0x00000000
-        p47 = re.compile(r"^(?P<hex>(0x\w{8}\s*){1,4})$")
+        p47 = regex_engine.compile(r"^(?P<hex>(0x\w{8}\s*){1,4})$")
 
         # Uni Link Loss 0.799998%
         # Uni Link Loss 0.799998% (Anomalous)
-        p48 = re.compile(
+        p48 = regex_engine.compile(
             r"^Uni Link Loss\s+(?P<loss>\S+)%(\s+\((?P<anomalous>Anomalous)\))?$"
         )
 
         # Appl spec Uni Link Loss 0.899997% (Anomalous)
-        p49 = re.compile(
+        p49 = regex_engine.compile(
             r"^Appl spec Uni Link Loss\s+(?P<loss>\S+)%(\s+\((?P<anomalous>Anomalous)\))?$"
         )
 
         # Appl spec Admin. Weight: 10
-        p50 = re.compile(r"^Appl spec Admin.\s+Weight:\s+(?P<appl_spec_te_metric>\d+)$")
+        p50 = regex_engine.compile(r"^Appl spec Admin.\s+Weight:\s+(?P<appl_spec_te_metric>\d+)$")
 
         # SRv6 Oflag:0
-        p51 = re.compile(r"SRv6\s+Oflag:(?P<srv6_o_flag>0|1)$")
+        p51 = regex_engine.compile(r"SRv6\s+Oflag:(?P<srv6_o_flag>0|1)$")
 
         # SRv6 Locator: (MT-IPv4) FCCC:CCC1:A1::/48 Metric:0 Algorithm:0
-        p52 = re.compile(
+        p52 = regex_engine.compile(
             r"SRv6\sLocator:\s[(]MT-IPv[4|6][)]\s+(?P<srv6_locator>\S+)\s+Metric:(?P<srv6_metric>\d+)\s+Algorithm:(?P<srv6_algorithm>\d+)$"
         )
 
         # End.X SID: FCCC:CCC1:A1:E002:: uA (PSP/USD) B:0 S:0 P:0 Algorithm:0 Weight:0
-        p53 = re.compile(
+        p53 = regex_engine.compile(
             r"End.X\sSID:\s+(?P<end_x_sid>\S+)\suA\s[(]PSP[\/]USD[)]\s+B:(?P<end_x_b_flag>0|1)\s+S:(?P<end_x_s_flag>0|1)\s+P:(?P<end_x_p_flag>0|1)\s+Algorithm:(?P<end_x_algorithm>\d+)\sWeight:(?P<end_x_weight>\d+)$"
         )
 
         # End SID: FCCC:CCC1:A1:: uN (PSP/USD)
-        p54 = re.compile(
+        p54 = regex_engine.compile(
             r"End\sSID:\s+(?P<end_sid>\S+)\s(?P<end_behavior>\S+(?:\s\S+)*)$"
         )
 
@@ -1980,9 +1978,9 @@ class ShowRunSectionIsis(ShowRunSectionIsisSchema):
         result_dict = {}
 
         # router isis VRF1
-        p1 = re.compile(r"^router +isis *(?P<instance>\S*)$")
+        p1 = regex_engine.compile(r"^router +isis *(?P<instance>\S*)$")
         # vrf VRF1
-        p2 = re.compile(r"^vrf +(?P<vrf>\S+)$")
+        p2 = regex_engine.compile(r"^vrf +(?P<vrf>\S+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2107,68 +2105,68 @@ class ShowIsisNode(ShowIsisNodeSchema):
         # initial return dictionary
         ret_dict = {}
         # Tag 1:
-        p1 = re.compile(r"^Tag (?P<tag>\S+):$")
+        p1 = regex_engine.compile(r"^Tag (?P<tag>\S+):$")
 
         # ISIS level-1 node information for R1-asr1k-43.00
-        p2 = re.compile(r"^ISIS (?P<level>\S+)\s+node information for\s+(?P<host>\S+)$")
+        p2 = regex_engine.compile(r"^ISIS (?P<level>\S+)\s+node information for\s+(?P<host>\S+)$")
 
         # IP router ID: 1.1.1.1 (LSP #0)
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^IP router ID: (?P<ip_router_id>\d+\.\d+\.\d+\.\d+)\s+\(LSP\s+#(?P<lsp_id>\d+)\)$"
         )
 
         # IP interface address: 1.1.1.1 (LSP #0)
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^IP interface address: (?P<ip_interface_address>\d+\.\d+\.\d+\.\d+)\s+\(LSP\s+#(?P<lsp_id>\d+)\)$"
         )
 
         # IP PQ address: 3.3.3.3
-        p5 = re.compile(r"^IP PQ address: (?P<ip_pq_address>\d+\.\d+\.\d+\.\d+)$")
+        p5 = regex_engine.compile(r"^IP PQ address: (?P<ip_pq_address>\d+\.\d+\.\d+\.\d+)$")
 
         # IP prefix SID: 31, R:0 N:1 P:0 E:0 V:0 L:0
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^IP prefix SID: (?P<prefix>\d+), R:(?P<r_flag>[01]) N:(?P<n_flag>[01]) P:(?P<p_flag>[01]) E:(?P<e_flag>[01]) V:(?P<v_flag>[01]) L:(?P<l_flag>[01])$"
         )
 
         # IP strict-SPF SID: 131, R:0 N:1 P:0 E:0 V:0 L:0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^IP strict-SPF SID: (?P<prefix>\d+), R:(?P<r_flag>[01]) N:(?P<n_flag>[01]) P:(?P<p_flag>[01]) E:(?P<e_flag>[01]) V:(?P<v_flag>[01]) L:(?P<l_flag>[01])$"
         )
 
         # Adj-sid from R1-asr1k-43.00 to R2-asr1k-33
-        p8 = re.compile(r"^Adj-sid from (?P<from>\S+) to (?P<to>\S+)$")
+        p8 = regex_engine.compile(r"^Adj-sid from (?P<from>\S+) to (?P<to>\S+)$")
 
         # adj-sid 739 (LSP #0)
-        p9 = re.compile(r"^adj-sid (?P<adj_sid>\d+)\s+\(LSP\s+#(?P<lsp_id>\d+)\)$")
+        p9 = regex_engine.compile(r"^adj-sid (?P<adj_sid>\d+)\s+\(LSP\s+#(?P<lsp_id>\d+)\)$")
 
         # LSP index: 3
-        p10 = re.compile(r"^LSP index: (?P<lsp_index>\S+)$")
+        p10 = regex_engine.compile(r"^LSP index: (?P<lsp_index>\S+)$")
 
         # SRGB start[0]: 16000, SRGB range[0]: 8000 (LSP #0)
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^SRGB start\[0]: (?P<srgb_start>\d+), SRGB range\[0]: (?P<srgb_range>\d+)\s+\(LSP\s+#(?P<lsp_id>\d+)\)$"
         )
 
         # SRLB start[0]: 15000, SRLB range[0]: 1000 (LSP #0)
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^SRLB start\[0]: (?P<srlb_start>\d+), SRLB range\[0]: (?P<srlb_range>\d+)\s+\(LSP\s+#(?P<lsp_id>\d+)\)$"
         )
 
         # SR capable: No, Strict-SPF capable: No (LSP #0)
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^SR capable: (?P<sr_capable>\w+), Strict-SPF capable: (?P<strict_spf_capable>\w+)(\s+\(?LSP\s+#)?(?P<lsp_id>\d+)?\)?$"
         )
 
         # SR end-point: 4.4.4.4
-        p14 = re.compile(r"^SR end-point: (?P<sr_endpoint>\d+\.\d+\.\d+\.\d+)$")
+        p14 = regex_engine.compile(r"^SR end-point: (?P<sr_endpoint>\d+\.\d+\.\d+\.\d+)$")
 
         # Policy: Tunnel65536 ifnum 23 metric 0 flag 0
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^Policy: (?P<policy>\S+) ifnum (?P<ifnum>\d+) metric (?P<metric>\d+) flag (?P<flag>\d+)$"
         )
 
         # Flex algorithm:128 Metric-Type:IGP Alg-type:SPF Priority:131
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^Flex algorithm:(?P<flex_algo>\d+) Metric-Type:(?P<metric>\w+) Alg-type:(?P<alg_type>\w+) Priority:(?P<priority>\d+)$"
         )
 
@@ -2451,27 +2449,27 @@ class ShowIsisAdjacencyStagger(ShowIsisAdjacencyStaggerSchema):
         ret_dict = {}
 
         # Tag name:
-        p1 = re.compile(r"^Tag +(?P<isis_name>\S+)\s*:$")
+        p1 = regex_engine.compile(r"^Tag +(?P<isis_name>\S+)\s*:$")
 
         # Adjacency stagger enabled: init 2, max 64
         # Adjacency stagger disabled
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Adjacency\s+stagger\s+(?P<state>disabled|enabled)(:\s+init\s+(?P<init>\d+),?\s+max\s+(?P<max>\d+))?$"
         )
 
         # Full or expired P2P nbrs: 2
-        p3 = re.compile(r"^Full or expired P2P nbrs: (?P<full>\d+)$")
+        p3 = regex_engine.compile(r"^Full or expired P2P nbrs: (?P<full>\d+)$")
 
         # Syncing P2P nbrs: 0
-        p4 = re.compile(r"^Syncing P2P nbrs: (?P<sync>\d+)$")
+        p4 = regex_engine.compile(r"^Syncing P2P nbrs: (?P<sync>\d+)$")
 
         # R2              L1L2 Et0/0         Full    NewCfg  yes  yes   0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^(?P<host>\w+)\s+(?P<level>L1|L2|L1L2)\s+(?P<intf>\S+)\s+(?P<state>Uninitialized|Syncing|Full|Unknown)\s+(?P<timer>Expired|Stopped|NewCfg|\d+)\s+(sec\s+)?(?P<csnp>no|yes)\s+(?P<flood>no|yes)\s+(?P<reqlist>\d+)$"
         )
 
         # 0200.C5F5.A202.01-00/0 0200.C5F5.A202.02-00/0 0200.C5F6.0602.00-00/0 0200.C5F6.0602.01-00/0
-        p6 = re.compile(r"(\S{4}\.\S{4}\.\S{4}.\d{2}-\d{2})/(\d+)")
+        p6 = regex_engine.compile(r"(\S{4}\.\S{4}\.\S{4}.\d{2}-\d{2})/(\d+)")
         for line in out.splitlines():
             line = line.strip()
 
@@ -2619,24 +2617,24 @@ class ShowIsisTopology(ShowIsisTopologySchema):
         ret_dict = {}
 
         # Tag 1:
-        p1 = re.compile(r"^Tag (?P<tag>\S+):$")
+        p1 = regex_engine.compile(r"^Tag (?P<tag>\S+):$")
 
         # IS-IS TID 0 paths to level-1 routers
-        p2 = re.compile(r"^.+paths to level-(?P<level>\d).+$")
+        p2 = regex_engine.compile(r"^.+paths to level-(?P<level>\d).+$")
 
         # Flex-algo 129
-        p3 = re.compile(r"^Flex-algo\s+(?P<flex_algo>\d+)$")
+        p3 = regex_engine.compile(r"^Flex-algo\s+(?P<flex_algo>\d+)$")
 
         # R1-asr1k-43          --
-        p4 = re.compile(r"^(?P<system_id>\S+)\s+(?P<metric>--+)$")
+        p4 = regex_engine.compile(r"^(?P<system_id>\S+)\s+(?P<metric>--+)$")
 
         # R2-asr1k-33          10         R2-asr1k-33          Gi0/0/2     c47d.4f12.e020
         # R2                   20         R3                   Te0/0/0.10  ccb6.c8f6.e904
-        p5 = re.compile(r'^(?P<system_id>\S+)\s+(?P<metric>\d+)\s+(?P<next_hop>\S+)\s+(?P<interface>\S+)\s+(?P<snpa>[\w\d.]+)$')
+        p5 = regex_engine.compile(r'^(?P<system_id>\S+)\s+(?P<metric>\d+)\s+(?P<next_hop>\S+)\s+(?P<interface>\S+)\s+(?P<snpa>[\w\d.]+)$')
 
         #                                 R2-asr1k-33          Gi0/0/3     c47d.4f12.e021
         #                                 R6                   Te0/0/0.20  04bd.97d1.2e24
-        p6 = re.compile(r'^(?P<next_hop>\S+)\s+(?P<interface>[\w/-]+(?:\.\d+)?\d*)\s+(?P<snpa>[\w\d]{4}\.\w{4}\.\w{4})$')
+        p6 = regex_engine.compile(r'^(?P<next_hop>\S+)\s+(?P<interface>[\w/-]+(?:\.\d+)?\d*)\s+(?P<snpa>[\w\d]{4}\.\w{4}\.\w{4})$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2773,74 +2771,74 @@ class ShowIsisFlexAlgo(ShowIsisFlexAlgoSchema):
         exclude_any, include_any, include_all = False, False, False
 
         # Tag 1:
-        p1 = re.compile(r"^Tag\s+(?P<tag>\S+):$")
+        p1 = regex_engine.compile(r"^Tag\s+(?P<tag>\S+):$")
 
         #  Flex-Algo count: 3
-        p2 = re.compile(r"^Flex-Algo count:\s+(?P<count>\d+)$")
+        p2 = regex_engine.compile(r"^Flex-Algo count:\s+(?P<count>\d+)$")
 
         # Flex-Algo 128:
-        p3 = re.compile(r"^Flex-Algo\s+(?P<flex_algo>\d+):$")
+        p3 = regex_engine.compile(r"^Flex-Algo\s+(?P<flex_algo>\d+):$")
 
         # IS-IS Level-1
-        p4 = re.compile(r"^IS-IS Level-(?P<level>\d+)$")
+        p4 = regex_engine.compile(r"^IS-IS Level-(?P<level>\d+)$")
 
         # Definition Priority: 131
-        p5 = re.compile(r"^Definition Priority:\s+(?P<def_priority>\d+)$")
+        p5 = regex_engine.compile(r"^Definition Priority:\s+(?P<def_priority>\d+)$")
 
         # Definition Source: R6-asr1k-20.00
-        p6 = re.compile(r"^Definition Source:\s+(?P<def_source>\S+)$")
+        p6 = regex_engine.compile(r"^Definition Source:\s+(?P<def_source>\S+)$")
 
         # Definition Equal to Local: Yes
-        p7 = re.compile(r"^Definition Equal to Local:\s+(?P<def_equal>Yes|No)$")
+        p7 = regex_engine.compile(r"^Definition Equal to Local:\s+(?P<def_equal>Yes|No)$")
 
         # Definition Metric Type: IGP
-        p8 = re.compile(r"^Definition Metric Type:\s+(?P<def_metric_type>\S+)$")
+        p8 = regex_engine.compile(r"^Definition Metric Type:\s+(?P<def_metric_type>\S+)$")
 
         # Definition Flex-Algo Prefix Metric: Yes
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^Definition Flex-Algo Prefix Metric:\s+(?P<def_flex_prefix_metric>Yes|No)$"
         )
 
         # Disabled: No
-        p10 = re.compile(r"^Disabled:\s(?P<disabled>Yes|No)$")
+        p10 = regex_engine.compile(r"^Disabled:\s(?P<disabled>Yes|No)$")
 
         # Microloop Avoidance Timer Running: No
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^Microloop Avoidance Timer Running:\s+(?P<microloop_avoidance_timer>Yes|No)$"
         )
 
         #    Local Priority: 128
-        p12 = re.compile(r"^Local Priority:\s+(?P<local_priority>\d+)$")
+        p12 = regex_engine.compile(r"^Local Priority:\s+(?P<local_priority>\d+)$")
 
         #    FRR Disabled: No
-        p13 = re.compile(r"^FRR Disabled:\s+(?P<frr_disabled>Yes|No)$")
+        p13 = regex_engine.compile(r"^FRR Disabled:\s+(?P<frr_disabled>Yes|No)$")
 
         #    Microloop Avoidance Disabled: No
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^Microloop Avoidance Disabled:\s+(?P<microloop_avoidance_disabled>Yes|No)$"
         )
 
         # Definition Exclude-any Affinity:
-        p15 = re.compile(r"^Definition Exclude-any Affinity:$")
+        p15 = regex_engine.compile(r"^Definition Exclude-any Affinity:$")
 
         # Definition Include-any Affinity:
-        p16 = re.compile(r"^Definition Include-any Affinity:$")
+        p16 = regex_engine.compile(r"^Definition Include-any Affinity:$")
 
         # Definition Include-all Affinity:
-        p17 = re.compile(r"^Definition Include-all Affinity:$")
+        p17 = regex_engine.compile(r"^Definition Include-all Affinity:$")
 
         # 0x00000000 0x00000000 0x00000000 0x00000000
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^(?P<hex_val>0x\d{8})(\s+(?P<hex_val2>0x\d{8}))?(\s+(?P<hex_val3>0x\d{8}))?(\s+(?P<hex_val4>0x\d{8}))?$"
         )
 
         # Use delay metric advertisement: Application, Legacy
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"^Use delay metric advertisement:\s+(?P<use_delay_metric_advertise>.+)$"
         )
 
         # Delay metric: Active
-        p20 = re.compile(r"^Delay metric:\s+(?P<delay_metric>Active|Inactive)$")
+        p20 = regex_engine.compile(r"^Delay metric:\s+(?P<delay_metric>Active|Inactive)$")
 
         flex_algo = None
         for line in out.splitlines():
@@ -3184,14 +3182,14 @@ class ShowIsisIpv6Rib(ShowIsisIpv6RibSchema):
 
         # IS-IS IPv6 process 1, local RIB
         # IS-IS IPv6 process "", local RIB
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^IS-IS IPv6 process\s+(?P<tag>\S+)\," r"\s*(?P<rib_root>[\w\s]+)$"
         )
 
         # 12:12::/64
         # FCCC:CCC1:B1::/48
         # 666::666/128  prefix attr X:0 R:0 N:1  source router id: 666::666
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^((\s?(?P<star>\*))?\s+)?"
             r"(?P<ipv6_prefix>[0-9a-fA-F:/]+)(\s+prefix\s+attr\s+X:"
             r"(?P<x_flag>0|1)\s+R:(?P<r_flag>0|1)\s+N:(?P<n_flag>0|1))?"
@@ -3203,7 +3201,7 @@ class ShowIsisIpv6Rib(ShowIsisIpv6RibSchema):
         # via ::/Null0, type Sum metric 30 tag 0
         # via FE80::210:7BFF:FEC2:ACC9/GigabitEthernet2/0/0, type L2  metric 20 LSP [3/7]
         # via FE80::A8BB:CCFF:FE00:6500/Ethernet0/0, type L2  metric 20 tag 0 -
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^via\s+((?P<nh_addr>[0-9a-fA-F:]+)/(?P<interface>"
             r"[a-zA-Z0-9/.]+))?((?P<uloop_ep>ULOOP_EP\s*)"
             r"SRv6-Fwd-Id\s*"
@@ -3217,26 +3215,26 @@ class ShowIsisIpv6Rib(ShowIsisIpv6RibSchema):
         # P node: R6 SID FCCC:CCC1:F1:: uN (PSP/USD)
         # P node: R6 SID FCCC:CCC1:AA66::
         # Q node: r604 SID CAFE:0:603:E001:: reserved behavior: 0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"(?P<node_type>(P|Q))\s+node:\s+(?P<host>\S+)\s+"
             r"SID\s+(?P<sid>[0-9a-fA-F:]+)"
             r"(\s+(?P<srv6_sid_behavior>[\w\W\s()/]+))?"
         )
 
         # prefix attr: X:0 R:0 N:1
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^prefix\s+attr:\s+X:(?P<x_flag>0|1)\s+R:"
             r"(?P<r_flag>0|1)\s+N:(?P<n_flag>0|1)$"
         )
 
         # - - - - - -
-        p6 = re.compile(r"(?P<alt>[-\s]+)$")
+        p6 = regex_engine.compile(r"(?P<alt>[-\s]+)$")
 
         # (installed)
-        p7 = re.compile(r"\((?P<installed>installed)\)$")
+        p7 = regex_engine.compile(r"\((?P<installed>installed)\)$")
 
         # repair path: via FE80::A8BB:CCFF:FE00:6902/Ethernet2/0 metric: 110 (LC,DS,NP,SR)
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^repair\s*path:\s*via\s*(?P<nh_addr>"
             r"[0-9a-fA-F:]+)/(?P<interface>"
             r"[a-zA-Z0-9/.]+)\s*metric:\s*(?P<metric>\d+)"
@@ -3249,29 +3247,29 @@ class ShowIsisIpv6Rib(ShowIsisIpv6RibSchema):
         # TI-LFA node/SRLG-protecting
         # TI-LFA node-protecting
         # TI-LFA SRLG-protecting
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"(?P<lfa_type>local\s+LFA|TI-LFA\s+link-protecting"
             r"|TI-LFA\s+node/SRLG-protecting|TI-LFA\s+"
             r"node-protecting|TI-LFA\s+SRLG-protecting)$"
         )
 
         # SRv6-Fwd-Id 25165857
-        p10 = re.compile(r"SRv6-Fwd-Id\s*(?P<srv6_fwid>\d+)$")
+        p10 = regex_engine.compile(r"SRv6-Fwd-Id\s*(?P<srv6_fwid>\d+)$")
 
         # repair source: R6, metric to pfx: 50
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"repair\s*source:\s*(?P<repair_source>\S+)\,\s*"
             r"metric\s*to\s*pfx:\s*(?P<metric_to_prefix>\d+)$"
         )
 
         #Flex-algo 128
-        p12 = re.compile(r"Flex-algo\s+(?P<flex_algo>\d+)")         
+        p12 = regex_engine.compile(r"Flex-algo\s+(?P<flex_algo>\d+)")         
 
         #Algorithm: 128
-        p13 = re.compile(r"Algorithm:\s+(?P<algorithm>\d+)")
+        p13 = regex_engine.compile(r"Algorithm:\s+(?P<algorithm>\d+)")
      
         #source router id: 222::222
-        p14 = re.compile(r"source router id:\s+(?P<src_rtr_id>[0-9a-fA-F:]+)?$")
+        p14 = regex_engine.compile(r"source router id:\s+(?P<src_rtr_id>[0-9a-fA-F:]+)?$")
  
         for line in output.splitlines():
             line = line.strip()
@@ -3707,13 +3705,13 @@ class ShowIsisRib(ShowIsisRibSchema):
         flex_algo_enabled, in_repair_path, ret_dict = False, False, {}
 
         # IPv4 local RIB for IS-IS process 1
-        p1 = re.compile(r"^IPv4 local RIB for IS-IS process\s+(?P<tag>\S+)$")
+        p1 = regex_engine.compile(r"^IPv4 local RIB for IS-IS process\s+(?P<tag>\S+)$")
 
         # 6.6.6.6/32
         # 1.1.1.0/24  prefix attr X:0 R:1 N:0
         # 3.3.3.3/32  prefix attr X:0 R:0 N:1  source router id: 3.3.3.3  SID index 3 - Bound
         # 6.6.6.6/32  prefix attr X:0 R:0 N:1  source router id: 6.6.6.6  prefix SID index 61 - Bound (SR_POLICY)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<ip>[\d.]+)/(?P<subnet>\d+)(\s+((prefix\s+attr\s+"
             r"X:(?P<x_flag>0|1)\s+R:(?P<r_flag>0|1)\s+N:"
             r"(?P<n_flag>0|1)))?((\((?P<strict_sid_bound_attribute_te1>TE)"
@@ -3726,7 +3724,7 @@ class ShowIsisRib(ShowIsisRibSchema):
 
         # [115/L1/70] via 6.6.6.6(MPLS-SR-Tunnel6) R3.00-00, from 4.4.4.4, tag 0
         # [115/L2/50] via 199.1.1.2(Tunnel4001), from 6.6.6.6, tag 0, LSP[105/209/18349]
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^\[(?P<distance>\d+)/(?P<route_type>\w+(\d+)?)/"
             r"(?P<metric>\d+)\]\s+via\s+(?P<ip>[\d.]+)"
             r"\((?P<interface>\S+)\)"
@@ -3737,7 +3735,7 @@ class ShowIsisRib(ShowIsisRibSchema):
         )
 
         # LSP 3/4/0(52), prefix attr: X:0 R:0 N:1
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^(LSP (?P<next_hop_lsp_index>\d+)/"
             r"(?P<rtp_lsp_index>\d+)/(?P<rtp_lsp_version>\d+)"
             r"\((?P<tpl_lsp_version>\d+)\))?(, )?prefix attr:"
@@ -3745,7 +3743,7 @@ class ShowIsisRib(ShowIsisRibSchema):
         )
 
         # SRGB: 16000, range: 8000 prefix-SID index: 3, R:0 N:1 P:0 E:0 V:0 L:0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^SRGB:\s+(?P<srgb>\d+),\s+range:\s+(?P<range>\d+)\s+"
             r"prefix-SID index:\s+(?P<pre_sid_ind>\w+|\d+)(,\s+"
             r"R:(?P<r_flag>0|1)\s+N:(?P<n_flag>0|1)\s+"
@@ -3755,7 +3753,7 @@ class ShowIsisRib(ShowIsisRibSchema):
 
         # (ALT)(installed)
         # (installed)
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^(\((?P<alt_attr>ALT)\))?"
             r"(\((?P<forced>(bdw|def|all)\s+forced)\))?"
             r"(\((?P<path_attr>(SR_POLICY|SRTE|SR_POLICY_STRICT"
@@ -3765,11 +3763,11 @@ class ShowIsisRib(ShowIsisRibSchema):
         )
 
         # label: implicit-null
-        p7 = re.compile(r"^label:\s+(?P<label>\S+)$")
+        p7 = regex_engine.compile(r"^label:\s+(?P<label>\S+)$")
 
         # repair path: 5.5.5.5 (MPLS-SR-Tunnel4) metric: 65 (DS,SR)
         # repair path: 199.1.2.2(Tunnel4002) metric:50 (PP,LC,DS,NP,SR) LSP[115]
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^repair path(?P<stale>\(\?\))?:\s+"
             r"(?P<repair_path>\d+.\d+.\d+.\d+)\s*"
             r"\((?P<interface>\S+)\)"
@@ -3780,33 +3778,33 @@ class ShowIsisRib(ShowIsisRibSchema):
         )
 
         # next-hop: 10.10.20.2 (Ethernet1/1)
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^next-hop:\s+(?P<next_hop>(([\d.]+)|(not found)))(\s+"
             r"(\((?P<interface>[\w-]+\d+(\/\d+(\/\d+)?)?)\)))?$"
         )
 
         # P node: R5[5.5.5.5], label: 16005
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^(?P<node_type>(P|PQ|Q))\s+node:\s+(?P<host>\S+)"
             r"\[(?P<ip>[\d.]+)\],\s+label:\s+(?P<label>\S+)$"
         )
 
         # repair source: R3, LSP 3
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^repair source:\s+(?P<repair_src>\S+)(,\s+LSP\s+"
             r"(?P<rtp_lsp_index>\d+))?$"
         )
 
         # Source router id: 3.3.3.3
-        p12 = re.compile(r"source router id:\s+(?P<src_router_id>[\d.]+)")
+        p12 = regex_engine.compile(r"source router id:\s+(?P<src_router_id>[\d.]+)")
 
         # strict-SPF label: implicit-null
-        p13 = re.compile(r"^strict-SPF label:\s+(?P<strict_sid_label>\S+)$")
+        p13 = regex_engine.compile(r"^strict-SPF label:\s+(?P<strict_sid_label>\S+)$")
 
         # strict-SPF SID index: 6, R:0 N:1 P:0 E:0 V:0 L:0
         # Prefix-SID index: 4, R:0 N:1 P:0 E:0 V:0 L:0
         # Prefix-SID index: 1004, R:0 N:0 P:0 E:0 V:0 L:0, from SRAPP
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"(Prefix-SID index:|strict-SPF SID index:)\s+"
             r"(?P<spf_sid_ind>\d+),\s+R:(?P<r_flag>0|1)\s+"
             r"N:(?P<n_flag>0|1)\s+P:(?P<p_flag>0|1)\s+"
@@ -3815,7 +3813,7 @@ class ShowIsisRib(ShowIsisRibSchema):
         )
 
         # type: Micro-Loop Avoidance Explicit-Path
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^type:\s+" r"(?P<u_loop_enabled>Micro-Loop Avoidance Explicit-Path)$"
         )
 
@@ -3824,7 +3822,7 @@ class ShowIsisRib(ShowIsisRibSchema):
         # p16 = re.compile(r'^strict-SPF SID index\s+(?P<strict_sid_index>\d+)'
         #                  r'\s+-\s+(?P<bound>Bound)\s*'
         #                  r'\((?P<strict_attribute>\S+)\)')
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"strict-SPF SID index\s+(?P<strict_sid_index>\d+)"
             r"\s+(-\s+(?P<bound>Bound))?\s*"
             r"(\((?P<strict_attribute>\S+)\))?"
@@ -3833,18 +3831,18 @@ class ShowIsisRib(ShowIsisRibSchema):
         # TI-LFA link-protecting
         # local LFA
         # remote LFA
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"^(?P<lfa_type>local LFA|remote LFA|TI-LFA link-protecting"
             r"|TI-LFA node/SRLG-protecting|TI-LFA node-protecting"
             r"|TI-LFA SRLG-protectinfTopog)$"
         )
 
         # Flex-algo 128
-        p18 = re.compile(r"^Flex-algo\s+(?P<flex_algo>\d+)$")
+        p18 = regex_engine.compile(r"^Flex-algo\s+(?P<flex_algo>\d+)$")
 
         # IPV4 unicast topology base (TID 0, TOPOID 0x0) =================
         # IPV4 multicast topology *** (TID 0, TOPOID 0x0) =================
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"^IPV4\s+(?P<topo_type>unicast|multicast)\s+topology"
             r"\s+(?P<topo_name>\S+)\s+\(TID\s+(?P<tid>\d+),\s+"
             r"TOPOID\s+(?P<topo_id>\S+)\).+$"
@@ -4345,25 +4343,25 @@ class ShowIsisRibRedistribution(ShowIsisRibRedistributionSchema):
 
         #######  Reg-exes  ##########
         # IPv4 redistribution RIB for IS-IS process 1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^IPv4 redistribution RIB for IS-IS process +(?P<isis_name>\S+)$"
         )
 
         # IPV4 unicast base topology (TID 0, TOPOID 0x0) =================
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^IPV4 (?P<topo>unicast|multicast) (?P<topo_name>.+)"
             r" \(TID (?P<mtid>\d+), TOPOID (?P<topoid>\S+)\).*"
         )
 
         # ====== Level 1 ======
-        p3 = re.compile(r"^=*\s*Level\s*(?P<level>\d)\s*=*$")
+        p3 = regex_engine.compile(r"^=*\s*Level\s*(?P<level>\d)\s*=*$")
 
         # 22.22.22.22/32
-        p4 = re.compile(r"^(?P<prefix>\d+(\.\d+){3})/(?P<masklen>\d+)$")
+        p4 = regex_engine.compile(r"^(?P<prefix>\d+(\.\d+){3})/(?P<masklen>\d+)$")
 
         # [Connected/10]
         # [ISIS/0] external  prefix-SID index: 44, R:1 N:0 P:1 E:0 V:0 L:0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^\[(?P<rt_pdb>Connected|Static|BGP|RIP|IGRP|EIGRP"
             r"|OSPF|OSPFv3|ISIS|Mobil|ODR|LISP|OMP|NAT Route)/"
             r"(?P<metric>\d+)\] *"
@@ -4375,14 +4373,14 @@ class ShowIsisRibRedistribution(ShowIsisRibRedistributionSchema):
         )
 
         # strict-SPF SID index: 404, R:1 N:0 P:1 E:0 V:0 L:0
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^(?P<algo>strict-SPF SID index: )(?P<index>\d+)"
             r", R:(?P<r_flag>0|1) N:(?P<n_flag>0|1) P:(?P<p_flag>0|1)"
             r" E:(?P<e_flag>0|1) V:(?P<v_flag>0|1) L:(?P<l_flag>0|1)$"
         )
 
         # flex-algo 129 SID index: 122, R:0 N:1 P:0 E:0 V:0 L:0 map 0x1
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^flex-algo (?P<algo>\d+) SID index: (?P<index>\d+)"
             r", R:(?P<r_flag>0|1) N:(?P<n_flag>0|1) P:(?P<p_flag>0|1)"
             r" E:(?P<e_flag>0|1) V:(?P<v_flag>0|1) L:(?P<l_flag>0|1) "
@@ -4390,17 +4388,17 @@ class ShowIsisRibRedistribution(ShowIsisRibRedistributionSchema):
         )
 
         # prefix-metric: 0, not advertised
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^prefix-metric: (?P<metric>\d+), (?P<not_advertised>not )?advertised$"
         )
 
         # prefix attr: X:0 R:0 N:1
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^prefix attr: X:(?P<x_flag>0|1) R:(?P<r_flag>0|1) N:(?P<n_flag>0|1)$"
         )
 
         # source router id: 22.22.22.22
-        p10 = re.compile(r"^source router id: (?P<src>\d+(\.\d+){3})$")
+        p10 = regex_engine.compile(r"^source router id: (?P<src>\d+(\.\d+){3})$")
 
         ########## Searching the output ################
         for line in out.splitlines():
@@ -4615,53 +4613,53 @@ class ShowIsisNodeLevel(ShowIsisNodeLevelSchema):
         ret_dict = {}
 
         # Tag nSVL-1:
-        p1 = re.compile(r"^Tag (?P<tag>\S+):$")
+        p1 = regex_engine.compile(r"^Tag (?P<tag>\S+):$")
 
         # ISIS level-1 node information for Switch.00
-        p2 = re.compile(r"^ISIS (?P<level>\S+)\s+node information for\s+(?P<host>\S+)$")
+        p2 = regex_engine.compile(r"^ISIS (?P<level>\S+)\s+node information for\s+(?P<host>\S+)$")
 
         # LSP index: 1
-        p3 = re.compile(r"^LSP index:\s+(?P<lsp_index>\d+)$")
+        p3 = regex_engine.compile(r"^LSP index:\s+(?P<lsp_index>\d+)$")
 
         # SR capable: No, Strict-SPF capable: No
         # SR capable: Yes, Strict-SPF capable: Yes (LSP #0)
-        p4 = re.compile(r'^SR capable: (?P<sr_capable>\w+), Strict-SPF capable: (?P<strict_spf_capable>\w+).*$')
+        p4 = regex_engine.compile(r'^SR capable: (?P<sr_capable>\w+), Strict-SPF capable: (?P<strict_spf_capable>\w+).*$')
 
         # IP interface address: 1.1.1.1 (LSP #0)
-        p5 = re.compile(r'^IP interface address: (?P<ip_interface_address>[\d\.]+)\s+\(LSP\s+\#(?P<lsp_id>\d+)\)$')
+        p5 = regex_engine.compile(r'^IP interface address: (?P<ip_interface_address>[\d\.]+)\s+\(LSP\s+\#(?P<lsp_id>\d+)\)$')
 
         # IP router ID: 192.0.2.53 (LSP #0)
-        p6 = re.compile(r'^IP\s+router\s+ID:\s+(?P<ip_router_id>[\d\.]+)\s+\(LSP\s+\#(?P<ip_router_lsp_id>\d+)\)$')
+        p6 = regex_engine.compile(r'^IP\s+router\s+ID:\s+(?P<ip_router_id>[\d\.]+)\s+\(LSP\s+\#(?P<ip_router_lsp_id>\d+)\)$')
 
         # IP PQ address: 192.0.2.53
-        p7 = re.compile(r'^IP\s+PQ\s+address:\s+(?P<ip_pq_address>[\d\.]+).*$')
+        p7 = regex_engine.compile(r'^IP\s+PQ\s+address:\s+(?P<ip_pq_address>[\d\.]+).*$')
 
         # IP prefix SID: 990, R:0 N:1 P:0 E:0 V:0 L:0
-        p8 = re.compile(r'^IP\s+prefix\s+SID:\s+(?P<sid>[\d\.]+),\s+R:(?P<r_flag>0|1)\s+N:(?P<n_flag>0|1)\s+'
-                        r'P:(?P<p_flag>0|1)\s+E:(?P<e_flag>0|1)\s+V:(?P<v_flag>0|1)\s+L:(?P<l_flag>0|1)$')
+        p8 = regex_engine.compile(r'^IP\s+prefix\s+SID:\s+(?P<sid>[\d\.]+),\s+R:(?P<r_flag>0|1)\s+N:(?P<n_flag>0|1)\s+'
+                                  r'P:(?P<p_flag>0|1)\s+E:(?P<e_flag>0|1)\s+V:(?P<v_flag>0|1)\s+L:(?P<l_flag>0|1)$')
 
         # IP strict-SPF SID: 991, R:0 N:1 P:0 E:0 V:0 L:0
-        p9 = re.compile(r'^IP\s+strict-SPF\s+SID:\s+(?P<sid>[\d\.]+),\s+R:(?P<r_flag>0|1)\s+N:(?P<n_flag>0|1)\s+'
-                        r'P:(?P<p_flag>0|1)\s+E:(?P<e_flag>0|1)\s+V:(?P<v_flag>0|1)\s+L:(?P<l_flag>0|1)$')
+        p9 = regex_engine.compile(r'^IP\s+strict-SPF\s+SID:\s+(?P<sid>[\d\.]+),\s+R:(?P<r_flag>0|1)\s+N:(?P<n_flag>0|1)\s+'
+                                  r'P:(?P<p_flag>0|1)\s+E:(?P<e_flag>0|1)\s+V:(?P<v_flag>0|1)\s+L:(?P<l_flag>0|1)$')
 
         # SRGB start[0]: 16000, SRGB range[0]: 8000 (LSP #0)
-        p10 = re.compile(r'^SRGB\s+start\[0\]\:\s+(?P<start>\d+),\s+SRGB\s+range\[0\]:\s+(?P<range>\d+)\s+'
-                         r'\(LSP\s+\#(?P<lsp_id>\d+)\)$')
+        p10 = regex_engine.compile(r'^SRGB\s+start\[0\]\:\s+(?P<start>\d+),\s+SRGB\s+range\[0\]:\s+(?P<range>\d+)\s+'
+                                   r'\(LSP\s+\#(?P<lsp_id>\d+)\)$')
 
         # SRLB start[0]: 15000, SRLB range[0]: 1000 (LSP #0)
-        p11 = re.compile(r'^SRLB\s+start\[0\]\:\s+(?P<start>\d+),\s+SRLB\s+range\[0\]:\s+(?P<range>\d+)\s+'
-                         r'\(LSP\s+\#(?P<lsp_id>\d+)\)$')
+        p11 = regex_engine.compile(r'^SRLB\s+start\[0\]\:\s+(?P<start>\d+),\s+SRLB\s+range\[0\]:\s+(?P<range>\d+)\s+'
+                                   r'\(LSP\s+\#(?P<lsp_id>\d+)\)$')
 
         # Flex algorithm:129 Metric-Type:IGP Alg-type:SPF Priority:128
-        p12 = re.compile(r'^Flex\s+algorithm:(?P<flex_algo>\d+)\s+Metric-Type:(?P<metric>\w+)\s+Alg-type:(?P<alg_type>\w+)\s+'
-                         r'Priority:(?P<priority>\d+)$')
+        p12 = regex_engine.compile(r'^Flex\s+algorithm:(?P<flex_algo>\d+)\s+Metric-Type:(?P<metric>\w+)\s+Alg-type:(?P<alg_type>\w+)\s+'
+                                   r'Priority:(?P<priority>\d+)$')
 
         # Affinity Include-any:
-        p13 = re.compile(r'^Affinity\s+(?P<affinity_type>\S+):$')
+        p13 = regex_engine.compile(r'^Affinity\s+(?P<affinity_type>\S+):$')
 
         # 0x00000004
         # 0x0000000A
-        p14 = re.compile(r'^(?P<hex_val>0x[a-fA-F0-9]{8})$')
+        p14 = regex_engine.compile(r'^(?P<hex_val>0x[a-fA-F0-9]{8})$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4830,11 +4828,11 @@ class ShowIsisNodeSummary(ShowIsisNodeSummarySchema):
         ret_dict = {}
 
         # Tag nSVL-1:
-        p1 = re.compile(r"^Tag (?P<tag>\S+):$")
+        p1 = regex_engine.compile(r"^Tag (?P<tag>\S+):$")
 
         # ISIS level-1 node information for sw.F87A4137BE0.00
         # ISIS level-1 node information for sw.F87A4137BE0.01
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^ISIS level-(?P<level>\d+)\s+node information for\s+(?P<switch>\S+)$"
         )
 
@@ -4902,14 +4900,14 @@ class ShowIsisTopologyLevel(ShowIsisTopologyLevelSchema):
         ret_dict = {}
 
         # Tag nSVL-1:
-        p1 = re.compile(r"^Tag (?P<tag>\S+):$")
+        p1 = regex_engine.compile(r"^Tag (?P<tag>\S+):$")
 
         # IS-IS TID 0 paths to level-2 routers
-        p2 = re.compile(r"^.+paths to level-(?P<level>\d).+$")
+        p2 = regex_engine.compile(r"^.+paths to level-(?P<level>\d).+$")
 
         # System Id            Metric     Next-Hop             Interface   SNPA
         # sw.F87A4137BE00      10         sw.F87A4137BE00      Po241       f87a.4137.bf02
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"(?P<system_id>\S+)\s+(?P<metric>\d+)\s+(?P<next_hop>\S+)\s+(?P<interface>\w+)\s+(?P<snpa>[\w\d\.]+)$"
         )
 
@@ -4986,11 +4984,11 @@ class ShowIsisMicroloopAvoidanceFlexAlgo(ShowIsisMicroloopAvoidanceFlexAlgoSchem
         # initial variables
         ret_dict = {}
         # Tag: srtest
-        p1 = re.compile(r"Tag\:\s+(?P<isis_tag>\w+)")
+        p1 = regex_engine.compile(r"Tag\:\s+(?P<isis_tag>\w+)")
 
         # Algo  State            Delay  Running(L1/L2)
         # 128   Segment-Routing  5000   FALSE/NA
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"(?P<flex_algo_id>\d+)\s+(?P<state>[\w\-]+)\s+(?P<delay>\d+)\s+(?P<RunningL1>\S+)\/(?P<RunningL2>\S+)$"
         )
 
@@ -5056,11 +5054,11 @@ class ShowIsisIpv6MicroloopAvoidance(ShowIsisIpv6MicroloopAvoidanceSchema):
         # initial variables
         ret_dict = {}
         # Tag: srtest
-        p1 = re.compile(r"Tag\:\s+(?P<isis_tag>\w+)")
+        p1 = regex_engine.compile(r"Tag\:\s+(?P<isis_tag>\w+)")
 
         # Algo  State            Delay  Running(L1/L2)
         # 0   Segment-Routing    5000   FALSE/NA
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"(?P<algo_id>\d+)\s+(?P<state>[\w\-]+)\s+(?P<delay>\d+)\s+(?P<Running_L1>\S+)\/(?P<Running_L2>\S+)$"
         )
 
@@ -5144,35 +5142,35 @@ class ShowIsisTeapp(ShowIsisTeappSchema):
         ret_dict = {}
 
         # Tag 1:
-        p1 = re.compile(r"^Tag\s+(?P<tag>\S+):$")
+        p1 = regex_engine.compile(r"^Tag\s+(?P<tag>\S+):$")
 
         # ISIS TEAPP Information: Topology(ID:0x0) Type:SRTE, Enabled:1, Router ID:1.1.1.1
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^ISIS TEAPP Information: Topology\(ID:(?P<id>\S+)\) "
             r"Type:(?P<type>\w+),\s+Enabled:(?P<enabled>\S+),\s+"
             r"Router ID:(?P<router_id>\d+\.\d+\.\d+\.\d+)$"
         )
 
         # Interface(hdl:0xF): GigabitEthernet0/0/7
-        p3 = re.compile(r"^Interface\(hdl:(?P<hdl>\S+)\):\s(?P<interface>\S+)$")
+        p3 = regex_engine.compile(r"^Interface\(hdl:(?P<hdl>\S+)\):\s(?P<interface>\S+)$")
 
         # Affinity: set 0, affinity_bits 0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Affinity:\s+set\s+(?P<set>\d+),\s+affinity_bits\s+(?P<affinity_bits>\d+)$"
         )
 
         # TE Metric: set 0, te_metric 4294967295
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^TE Metric: set\s+(?P<set>\d+),\s+te_metric\s+(?P<te_metric>\d+)$"
         )
 
         # Extended Affinity: set 0, length 0,
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Extended Affinity: set\s+(?P<set>\d+),\s+length\s+(?P<length>\d+),$"
         )
 
         # Gi0/0/7: IDB num:15 Min:30 Max:30 Min-max-anomaly:0 Avg:30 Avg-anomaly:0 Var:0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^(?P<interface>\S+): IDB num:(?P<idb_num>\d+)\s+"
             r"Min:(?P<min>\d+)\s+Max:(?P<max>\d+)\s+"
             r"(Min-max-anomaly:(?P<min_max_anomaly>\d+)\s+)?"
@@ -5182,7 +5180,7 @@ class ShowIsisTeapp(ShowIsisTeappSchema):
         )
 
         # Is-Loss-set:1 Loss:299999 Loss-anomaly:1
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^Is-Loss-set:(?P<is_loss_set>\d+)\s+Loss:(?P<loss>\d+)\s+"
             r"Loss-anomaly:(?P<loss_anomaly>\d+)$"
         )
@@ -5359,10 +5357,10 @@ class ShowIsisTeappPolicy(ShowIsisTeappPolicySchema):
         }
 
         # Tag 1:
-        p1 = re.compile(r"^Tag\s+(?P<tag>\S+):$")
+        p1 = regex_engine.compile(r"^Tag\s+(?P<tag>\S+):$")
 
         # 1.1.1.1         L2/asr1k-34.00     Tunnel96616                         0                SP:n 01:09:33
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<ip>[\d.]+)\s+(?P<level>-|L1|L2|L1L2)(/(?P<sys_id>\S+))?\s+"
             r"(?P<interface>\w+[/\d]+)\s+(?P<metric>\d+)\s+"
             r"(?P<attributes>(SP|SS):(n|r|a|c))\s+(?P<last_updated>\S+)$"
@@ -5370,18 +5368,18 @@ class ShowIsisTeappPolicy(ShowIsisTeappPolicySchema):
 
         #                                     Tunnel96703                         0                SP:n 01:09:31
         #                                    Tunnel70550                         0                SS:n 1w2d
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<interface>\w+[/\d]+)\s+(?P<metric>\d+)\s+"
             r"(?P<attributes>(SP|SS):(n|r|a|c))\s+(?P<last_updated>\S+)$"
         )
 
         # 16.0.0.16 - System-id: R6.00 level: 1
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^(?P<ip>[\d.]+)\s+-\s+System-id:\s+(?P<host>\S+)\s+level:\s+(?P<level>\d+)$"
         )
 
         # Tunnel67528 - Flags: 1 (Strict-SPF) Metric-mode: None Last update: 20:04:06
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^(?P<interface>.+)\s+-\s+Flags:\s+(?P<flags>0|1)\s+"
             r"(\((?P<sid_type>\S+)\)){0,1}\s+Metric-mode:\s+(?P<metric_mode>(Absolute|Constant|Relative|None|Unknown))\s+"
             r"Last\s+update:\s+(?P<last_update>\S+)$"
@@ -5528,25 +5526,25 @@ class ShowIsisSrv6LocatorsDetail(ShowIsisSrv6LocatorsDetailSchema):
         ret_dict = {}
 
         # Tag null:
-        p1 = re.compile(r"^Tag (?P<tag>\S+):$")
+        p1 = regex_engine.compile(r"^Tag (?P<tag>\S+):$")
 
         # Name             Prefix                                         Level
         # ----             ------                                         -----
         # loc1             FCCC:CCC1:C3::/48                              1-2
         # loc1             -                                              1-2
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"(?P<loc_name>\S+)\s+(?P<prefix>([a-fA-F0-9:])+/\d+|\-)\s+(?P<level>\S+)"
         )
 
         # Level-1 metric: 0
         # Level-2 metric: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(Level-(?P<level_name>\d+) metric):\s+(?P<level_metric>\d+)$"
         )
 
         # End-SIDs:
         # FCCC:CCC1:C3::
-        p4 = re.compile(r"^\s*(?P<end_sids>([a-fA-F0-9:]+))\s*$")
+        p4 = regex_engine.compile(r"^\s*(?P<end_sids>([a-fA-F0-9:]+))\s*$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -5638,22 +5636,22 @@ class ShowIsisIpv6Tilfa(ShowIsisIpv6TilfaSchema):
         ret_dict = {}
 
         # Tag 1:
-        p1 = re.compile(r'^Tag (?P<tag>\S+):$')
+        p1 = regex_engine.compile(r'^Tag (?P<tag>\S+):$')
 
         # SRv6-Fwd-Id: 25165861 via FE80::21E:BDFF:FE15:FA00 Tunnel121 (16)
-        p2 = re.compile(r'^SRv6-Fwd-Id: (?P<srv6_fwid>\d+) via (?P<nh_addr>\S+) (?P<interface>\S+) \((?P<metric>\d+)\)$')
+        p2 = regex_engine.compile(r'^SRv6-Fwd-Id: (?P<srv6_fwid>\d+) via (?P<nh_addr>\S+) (?P<interface>\S+) \((?P<metric>\d+)\)$')
 
         # Uncompressed SID List, SID count: 1
-        p3 = re.compile(r'^Uncompressed SID List, SID count: (?P<sid_count>\d+)$')
+        p3 = regex_engine.compile(r'^Uncompressed SID List, SID count: (?P<sid_count>\d+)$')
 
         # P node: P5.00-00 SID F:1:5:: uN (PSP/USD)
-        p4 = re.compile(r'^P node: (?P<p_node>\S+) SID (?P<sid>\S+) (?P<behavior>[\w\W]+)$')
+        p4 = regex_engine.compile(r'^P node: (?P<p_node>\S+) SID (?P<sid>\S+) (?P<behavior>[\w\W]+)$')
 
         # Compressed SID List, SID count: 1
-        p5 = re.compile(r'^Compressed SID List, SID count: (?P<sid_count>\d+)$')
+        p5 = regex_engine.compile(r'^Compressed SID List, SID count: (?P<sid_count>\d+)$')
 
         # SID[1]: F:1:5::, MSD SL:16 End-POP:16
-        p6 = re.compile(r'^SID\[(?P<sid_index>\d+)\]: (?P<sid>\S+), MSD SL:(?P<msd_sl>\d+) End-POP:(?P<end_pop>\d+)$')
+        p6 = regex_engine.compile(r'^SID\[(?P<sid_index>\d+)\]: (?P<sid>\S+), MSD SL:(?P<msd_sl>\d+) End-POP:(?P<end_pop>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6,15 +6,13 @@ IOSXE parsers for the following show commands:
    * show issu clients
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                                Default, Use
 
 # Genie Libs
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -86,100 +84,100 @@ class ShowIssuStateDetail(ShowIssuStateDetailSchema):
         # Compile regexp patterns
 
         # Finished local lock acquisition on R0
-        p0 = re.compile(r'^Finished +local +lock +acquisition'
-                         r' +on +(switch *)?(?P<slot>(\S+))$')
+        p0 = regex_engine.compile(r'^Finished +local +lock +acquisition'
+                                   r' +on +(switch *)?(?P<slot>(\S+))$')
 
         # No ISSU operation is in progress
-        p1 = re.compile(r'^No +ISSU +operation +is +in +progress$')
+        p1 = regex_engine.compile(r'^No +ISSU +operation +is +in +progress$')
 
         # Slot being modified: R1
-        p2 = re.compile(r'^Slot +being +modified: +(?P<slot>(\S+))$')
+        p2 = regex_engine.compile(r'^Slot +being +modified: +(?P<slot>(\S+))$')
         
         # Loadversion time: 20180430 19:13:51 on vty 0
-        p3 = re.compile(r'^Loadversion +time: +(?P<date>(\S+))'
-                         r' +(?P<time>(\S+))(?: +on +(?P<context>.*))?$')
+        p3 = regex_engine.compile(r'^Loadversion +time: +(?P<date>(\S+))'
+                                   r' +(?P<time>(\S+))(?: +on +(?P<context>.*))?$')
 
         # Last operation: loadversion
-        p4 = re.compile(r'^Last +operation:'
+        p4 = regex_engine.compile(r'^Last +operation:'
             r' (?P<last>(loadversion|runversion|acceptversion|commitversion))$')
 
         # Rollback: automatic, remaining time before rollback: 00:35:58
-        p5_1 = re.compile(r'^Rollback: +(?P<state>(automatic)), +remaining +time'
-                           r' +before +rollback: +(?P<time>(\S+))$')
+        p5_1 = regex_engine.compile(r'^Rollback: +(?P<state>(automatic)), +remaining +time'
+                                     r' +before +rollback: +(?P<time>(\S+))$')
 
         # Rollback: inactive, timer canceled by acceptversion
-        p5_2 = re.compile(r'^Rollback: +(?P<state>(inactive)), +(?P<reason>.*)$')
+        p5_2 = regex_engine.compile(r'^Rollback: +(?P<state>(inactive)), +(?P<reason>.*)$')
 
         # Original (rollback) image: harddisk:asr1000rpx86-universalk9.16.08.01sprd1.SPA.bin
-        p6 = re.compile(r'^Original +\(rollback\) +image: +(?P<orig_image>(\S+))$')
+        p6 = regex_engine.compile(r'^Original +\(rollback\) +image: +(?P<orig_image>(\S+))$')
 
         # Running image: harddisk:asr1000rpx86-universalk9.BLD_V168_1_THROTTLE_LATEST_20180426_165658_V16_8_0_265.SSA.bin
-        p7 = re.compile(r'^Running +image: +(?P<run_image>(\S+))$')
+        p7 = regex_engine.compile(r'^Running +image: +(?P<run_image>(\S+))$')
 
         # Operating mode: sso, terminal state not reached
-        p8 = re.compile(r'^Operating +mode: +(?P<mode>(\S+)), +terminal +state'
-                         r' +(?P<terminal_state>(reached|not reached))$')
+        p8 = regex_engine.compile(r'^Operating +mode: +(?P<mode>(\S+)), +terminal +state'
+                                   r' +(?P<terminal_state>(reached|not reached))$')
 
         # Notes: runversion executed, active RP is being provisioned
-        p9 = re.compile(r'^Notes: +runversion +executed, +active +RP +is +being'
-                         r' +provisioned$')
+        p9 = regex_engine.compile(r'^Notes: +runversion +executed, +active +RP +is +being'
+                                   r' +provisioned$')
 
         # Slot = 1
-        p10 = re.compile(r'Slot\s*=\s*(?P<slot>\d+)')
+        p10 = regex_engine.compile(r'Slot\s*=\s*(?P<slot>\d+)')
 
         # RP State = Active
-        p11 = re.compile(r'RP\s+State\s*=\s*(?P<state>.+)')
+        p11 = regex_engine.compile(r'RP\s+State\s*=\s*(?P<state>.+)')
 
         # ISSU State = Init
-        p12 = re.compile(r'ISSU\s+State\s*=\s*(?P<issu_state>.+)')
+        p12 = regex_engine.compile(r'ISSU\s+State\s*=\s*(?P<issu_state>.+)')
 
         # Boot Variable = bootdisk:,1;
-        p13 = re.compile(r'Boot\s+Variable\s*=\s*(?P<boot_variable>.+)')
+        p13 = regex_engine.compile(r'Boot\s+Variable\s*=\s*(?P<boot_variable>.+)')
 
         # Operating Mode = sso
-        p14 = re.compile(r'Operating\s+Mode\s*=\s*(?P<operating_mode>.+)')
+        p14 = regex_engine.compile(r'Operating\s+Mode\s*=\s*(?P<operating_mode>.+)')
 
         # Primary Version = N/A
-        p15 = re.compile(r'Primary\s+Version\s*=\s*(?P<primary_version>.+)')
+        p15 = regex_engine.compile(r'Primary\s+Version\s*=\s*(?P<primary_version>.+)')
 
         # Secondary Version = N/A
-        p16 = re.compile(r'Secondary\s+Version\s*=\s*(?P<secondary_version>.+)')
+        p16 = regex_engine.compile(r'Secondary\s+Version\s*=\s*(?P<secondary_version>.+)')
 
         # Current Version = bootdisk:s2t54-adventerprisek9-mz.SPA.151-1.SY.bin
-        p17 = re.compile(r'Current\s+Version\s*=\s*(?P<current_version>.+)')
+        p17 = regex_engine.compile(r'Current\s+Version\s*=\s*(?P<current_version>.+)')
 
         # Variable Store = PrstVbl
-        p18 = re.compile(r'Variable\s+Store\s*=\s*(?P<variable_store>.+)')
+        p18 = regex_engine.compile(r'Variable\s+Store\s*=\s*(?P<variable_store>.+)')
 
         # Current ISSU Status: Disabled
-        p19 = re.compile(r'^Current +ISSU +Status: +(?P<current_status>(\S+))$')
+        p19 = regex_engine.compile(r'^Current +ISSU +Status: +(?P<current_status>(\S+))$')
         
         # Previous ISSU Operation: N/A
-        p20 = re.compile(r'^Previous +ISSU +Operation: +(?P<previous_operation>(\S+))$')
+        p20 = regex_engine.compile(r'^Previous +ISSU +Operation: +(?P<previous_operation>(\S+))$')
 
         # System Check                        Status
-        p21 = re.compile(r'^System +Check +Status$')
+        p21 = regex_engine.compile(r'^System +Check +Status$')
 
         # Platform ISSU Support               No
-        p22 = re.compile(r'^Platform +ISSU +Support +(?P<platform_issu_support>(\S+))$')
+        p22 = regex_engine.compile(r'^Platform +ISSU +Support +(?P<platform_issu_support>(\S+))$')
 
         # Standby Online                      No
-        p23 = re.compile(r'^Standby +Online +(?P<standby_online>(\S+))$')
+        p23 = regex_engine.compile(r'^Standby +Online +(?P<standby_online>(\S+))$')
 
         # Autoboot Enabled                    Yes
-        p24 = re.compile(r'^Autoboot +Enabled +(?P<autoboot_enabled>(\S+))$')
+        p24 = regex_engine.compile(r'^Autoboot +Enabled +(?P<autoboot_enabled>(\S+))$')
 
         # SSO Mode                            No
-        p25 = re.compile(r'^SSO +Mode +(?P<sso_mode>(\S+))$')
+        p25 = regex_engine.compile(r'^SSO +Mode +(?P<sso_mode>(\S+))$')
 
         # Install Boot                        No
-        p26 = re.compile(r'^Install +Boot +(?P<install_boot>(\S+))$')
+        p26 = regex_engine.compile(r'^Install +Boot +(?P<install_boot>(\S+))$')
 
         # Valid Boot Media                    Yes
-        p27 = re.compile(r'^Valid +Boot +Media +(?P<valid_boot_media>(\S+))$')
+        p27 = regex_engine.compile(r'^Valid +Boot +Media +(?P<valid_boot_media>(\S+))$')
 
         # Operational Mode                    HA-REMOTE
-        p28 = re.compile(r'^Operational +Mode +(?P<opertional_mode>(\S+))$')
+        p28 = regex_engine.compile(r'^Operational +Mode +(?P<opertional_mode>(\S+))$')
 
         # Parse all lines
         for line in out.splitlines():
@@ -482,17 +480,17 @@ class ShowIssuRollbackTimer(ShowIssuRollbackTimerSchema):
 
         # Compile regexp patterns
         # Finished local lock acquisition on R0
-        p0 = re.compile(r'^Finished +local +lock +acquisition +on +(\w+ *)?(?P<slot>(\S+))$')
+        p0 = regex_engine.compile(r'^Finished +local +lock +acquisition +on +(\w+ *)?(?P<slot>(\S+))$')
 
         # Rollback: inactive, no ISSU operation is in progress
         # Rollback: inactive, timer canceled by acceptversion
-        p1 = re.compile(r'^Rollback: +(?P<state>(\S+)), +(?P<reason>.*)$')
+        p1 = regex_engine.compile(r'^Rollback: +(?P<state>(\S+)), +(?P<reason>.*)$')
 
         # Rollback Process State = Not in progress
-        p2 = re.compile(r'Rollback\s+Process\s+State\s*=\s*(?P<state>.+)')
+        p2 = regex_engine.compile(r'Rollback\s+Process\s+State\s*=\s*(?P<state>.+)')
 
         # Configured Rollback Time = 00:45:00
-        p3 = re.compile(r'Configured\s+Rollback\s+Time\s*=\s*(?P<rollback_time>.+)')
+        p3 = regex_engine.compile(r'Configured\s+Rollback\s+Time\s*=\s*(?P<rollback_time>.+)')
 
         # Parse all lines
         for line in out.splitlines():
@@ -563,13 +561,13 @@ class ShowIssuClients(ShowIssuClientsSchema):
 
         # Compile regexp patterns
         # Client_ID = 2, Client_Name = ISSU Proto client,  Entity_Count = 1
-        p0 = re.compile(r'^Client_ID += +(?P<client_id>\d+), +Client_Name += +(?P<client_name>[\w ]+), +Entity_Count += +(?P<entity_count>\d+)$')
+        p0 = regex_engine.compile(r'^Client_ID += +(?P<client_id>\d+), +Client_Name += +(?P<client_name>[\w ]+), +Entity_Count += +(?P<entity_count>\d+)$')
 
         #Base Clients:
-        p1 = re.compile(r'^Base +Clients:$')
+        p1 = regex_engine.compile(r'^Base +Clients:$')
 
         # Client_Name = ISSU Proto client
-        p2 = re.compile(r'^Client_Name += +(?P<base_client_name>[\w ]+)$')
+        p2 = regex_engine.compile(r'^Client_Name += +(?P<base_client_name>[\w ]+)$')
 
         # Parse all lines
         for line in out.splitlines():
@@ -4,11 +4,13 @@ Parser for following commands:
     * show key chain
 '''
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowKeyChainSchema(MetaParser):
     '''
@@ -54,25 +56,25 @@ class ShowKeyChain(ShowKeyChainSchema):
             output = self.device.execute(self.cli_command)
 
         # Key-chain hello:
-        p1 = re.compile(r'\s*^Key\-chain\s+(?P<name>[A-Za-z0-9\-_]+):$')
+        p1 = regex_engine.compile(r'\s*^Key\-chain\s+(?P<name>[A-Za-z0-9\-_]+):$')
 
 
         #MacSEC key chain
-        p2 = re.compile(r'\s*(?P<is_macsec>MacSEC key chain)')
+        p2 = regex_engine.compile(r'\s*(?P<is_macsec>MacSEC key chain)')
 
         # key 1 -- text "cisco123"
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^\s*key\s+(?P<id>[\d\w]+)\s+\-\-\s+text\s+'
             r'\"(?P<key_string>.*)\"$'
         )
 
         #cryptographic-algorithm: aes-256-cmac
-        p4 = re.compile(r'^\s*cryptographic-algorithm\: (?P<cryptographic_algo>.*)')
+        p4 = regex_engine.compile(r'^\s*cryptographic-algorithm\: (?P<cryptographic_algo>.*)')
 
         # accept lifetime (11:11:11 UTC Mar 1 2001) - (infinite) [valid now]
         # accept lifetime (always valid) - (always valid) [valid now]
         # accept lifetime (10:10:10 UTC Jan 1 2002) - (06:01:00 UTC Jan 1 2010)
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^\s*accept\s+lifetime\s+\((?P<start>[A-Za-z0-9:\s\+\-_]+)\)\s+\-\s+'
             r'\((?P<end>[A-Za-z0-9:\s\+\-_]+)\)'
             r'(\s+\[(?P<is_valid>[A-Za-z0-9\s\-_]+)\])?$'
@@ -81,7 +83,7 @@ class ShowKeyChain(ShowKeyChainSchema):
         # send lifetime (11:11:11 UTC Mar 1 2001) - (infinite) [valid now]
         # send lifetime (10:10:10 UTC Jan 1 2002) - (06:01:00 UTC Jan 1 2010)
         # send lifetime (always valid) - (always valid) [valid now]
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^\s*send\s+lifetime\s+\((?P<start>[A-Za-z0-9:\s\+\-_]+)\)\s+\-\s+'
             r'\((?P<end>[A-Za-z0-9:\s\+\-_]+)\)'
             r'(\s+\[(?P<is_valid>[A-Za-z0-9\s\-_]+)\])?$'
@@ -91,7 +93,7 @@ class ShowKeyChain(ShowKeyChainSchema):
         #lifetime (20:20:00 IST Jun 15 2023) - (20:34:00 IST Jun 15 2023)
         #lifetime (always valid) - (always valid) [valid now]
         #lifetime (11:11:11 UTC Mar 1 2001) - (infinite) [valid now]
-        p7 = re.compile(r'^\s*lifetime\s+\((?P<start>[A-Za-z0-9:\s\+\-_]+)\)\s+\-\s+'
+        p7 = regex_engine.compile(r'^\s*lifetime\s+\((?P<start>[A-Za-z0-9:\s\+\-_]+)\)\s+\-\s+'
             r'\((?P<end>[A-Za-z0-9:\s\+\-_]+)\)'
             r'(\s+\[(?P<is_valid>[A-Za-z0-9\s\-_]+)\])?$')
 
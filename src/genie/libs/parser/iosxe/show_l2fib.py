@@ -13,12 +13,14 @@ Copyright (c) 2021 by Cisco Systems, Inc.
 All rights reserved.
 '''
 
-import re
 
 # genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, ListOf, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================================
 # Schema for 'show l2fib output-list <id>'
@@ -64,30 +66,30 @@ class ShowL2fibOlist(ShowL2fibOlistSchema):
             cli_output = output
 
         # ID                            : 3
-        p1 = re.compile(r'^ID\s+:\s+(?P<olist_id>\d+)$')
+        p1 = regex_engine.compile(r'^ID\s+:\s+(?P<olist_id>\d+)$')
 
         # Bridge Domain                 : 11
-        p2 = re.compile(r'^Bridge Domain\s+:\s+(?P<bd_id>\d+)$')
+        p2 = regex_engine.compile(r'^Bridge Domain\s+:\s+(?P<bd_id>\d+)$')
 
         # Reference Count               : 4
-        p3 = re.compile(r'^Reference Count\s+:\s+(?P<ref_cnt>\d+)$')
+        p3 = regex_engine.compile(r'^Reference Count\s+:\s+(?P<ref_cnt>\d+)$')
 
         # Flags                         : flood list
-        p4 = re.compile(r'^Flags\s+:\s+(?P<flags>[\w ]+)$')
+        p4 = regex_engine.compile(r'^Flags\s+:\s+(?P<flags>[\w ]+)$')
 
         # Port Count                    : 3
-        p5 = re.compile(r'^Port Count\s+:\s+(?P<port_cnt>\d+)$')
+        p5 = regex_engine.compile(r'^Port Count\s+:\s+(?P<port_cnt>\d+)$')
 
         # Port(s) : VXLAN_REP PL:1(1) T:VXLAN_REP [SMC]20011:227.0.0.1
-        p6 = re.compile(r'^(Port\(s\)\s+)?'
-                        r':\s+(?P<type>\w+)\s+'
-                        r'PL:(?P<pl_id>\d+)\((?P<pl_cnt>\d+)\)\s+'
-                        r'T:(?P<pl_type>\w+)\s+'
-                        r'(?P<pl_desc>\[\w+\][0-9a-fA-F\.:@ ]+)$')
+        p6 = regex_engine.compile(r'^(Port\(s\)\s+)?'
+                                  r':\s+(?P<type>\w+)\s+'
+                                  r'PL:(?P<pl_id>\d+)\((?P<pl_cnt>\d+)\)\s+'
+                                  r'T:(?P<pl_type>\w+)\s+'
+                                  r'(?P<pl_desc>\[\w+\][0-9a-fA-F\.:@ ]+)$')
 
         # Port(s) : BD_PORT   Et0/1:11
-        p7 = re.compile(r'^(Port\(s\)\s+)?'
-                        r':\s+(?P<type>BD_PORT)\s+(?P<port>[\w:\/]+)$')
+        p7 = regex_engine.compile(r'^(Port\(s\)\s+)?'
+                                  r':\s+(?P<type>BD_PORT)\s+(?P<port>[\w:\/]+)$')
 
         parser_dict = {}
 
@@ -220,21 +222,21 @@ class ShowL2fibPathListId(ShowL2fibPathListIdSchema):
             cli_output = output
 
         # PathList ID                   : 28
-        p1 = re.compile(r'^PathList ID\s+:\s+(?P<path_list_id>\d+)$')
+        p1 = regex_engine.compile(r'^PathList ID\s+:\s+(?P<path_list_id>\d+)$')
 
         # PathList Type                 : MPLS_UC
-        p2 = re.compile(r'^PathList Type\s+:\s+(?P<type>\w+)$')
+        p2 = regex_engine.compile(r'^PathList Type\s+:\s+(?P<type>\w+)$')
 
         # Ethernet Segment              : 0000.0000.0000.0000.0000
-        p3 = re.compile(r'^Ethernet Segment\s+:\s+'
-                        r'(?P<eth_seg>[0-9a-fA-F\.]+)$')
+        p3 = regex_engine.compile(r'^Ethernet Segment\s+:\s+'
+                                  r'(?P<eth_seg>[0-9a-fA-F\.]+)$')
 
         # Path Count                    : 1
-        p4 = re.compile(r'^Path Count\s+:\s+(?P<path_cnt>\d+)$')
+        p4 = regex_engine.compile(r'^Path Count\s+:\s+(?P<path_cnt>\d+)$')
 
         # Paths                         : [MAC]16@2.2.2.1
-        p5 = re.compile(r'^[Paths]*\s*:\s+(?P<path>\[\w+\]\d+'
-                        r'[0-9a-fA-F\.:@ ]+)$')
+        p5 = regex_engine.compile(r'^[Paths]*\s*:\s+(?P<path>\[\w+\]\d+'
+                                  r'[0-9a-fA-F\.:@ ]+)$')
 
         parser_dict = {}
 
@@ -322,11 +324,11 @@ class ShowL2fibBdPort(ShowL2fibBdPortSchema):
             cli_output = output
 
         # BD_PORT   Et0/2:12
-        p1 = re.compile(r'^(?P<port_type>BD_PORT)\s+(?P<interface>[\w:\/]+)$')
+        p1 = regex_engine.compile(r'^(?P<port_type>BD_PORT)\s+(?P<interface>[\w:\/]+)$')
 
         # VXLAN_REP PL:1191(1) T:VXLAN_REP [IR]20012:2.2.2.2
-        p2 = re.compile(r'^(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)\((?P<path_list_count>\d+)\)'
-                        r'\s+T:(?P<path_list_type>\w+)\s+(?P<path_list_desc>\[\w+\][0-9a-fA-F:@\.]+)$')
+        p2 = regex_engine.compile(r'^(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)\((?P<path_list_count>\d+)\)'
+                                  r'\s+T:(?P<path_list_type>\w+)\s+(?P<path_list_desc>\[\w+\][0-9a-fA-F:@\.]+)$')
 
         parser_dict = {}
 
@@ -407,18 +409,18 @@ class ShowL2fibBdTableMulticast(ShowL2fibBdTableMulticastSchema):
             cli_output = output
 
         # Bridge Domain : 11
-        p1 = re.compile(r'^Bridge Domain\s+:\s+(?P<bd_id>\d+)$')
+        p1 = regex_engine.compile(r'^Bridge Domain\s+:\s+(?P<bd_id>\d+)$')
 
         # IP Multicast Prefix table size : 3
-        p2 = re.compile(r'^IP Multicast Prefix table size\s+:\s+'
-                        r'(?P<ip_mcast_cnt>\d+)$')
+        p2 = regex_engine.compile(r'^IP Multicast Prefix table size\s+:\s+'
+                                  r'(?P<ip_mcast_cnt>\d+)$')
 
         # Source: *, Group: 224.0.1.39, IIF: Null, Adjacency: Olist: 1, Ports: 2
-        p3 = re.compile(r'^Source:\s+(?P<source>[0-9a-fA-F:\*\./]+),\s+'
-                        r'Group:\s+(?P<group>[0-9a-fA-F:\.\*/]+),\s+'
-                        r'IIF:\s+(?P<iif>.*),\s+'
-                        r'Adjacency:\s+Olist:\s+(?P<output_list_id>\d+),\s+'
-                        r'Ports:\s+(?P<ports>\d+)$')
+        p3 = regex_engine.compile(r'^Source:\s+(?P<source>[0-9a-fA-F:\*\./]+),\s+'
+                                  r'Group:\s+(?P<group>[0-9a-fA-F:\.\*/]+),\s+'
+                                  r'IIF:\s+(?P<iif>.*),\s+'
+                                  r'Adjacency:\s+Olist:\s+(?P<output_list_id>\d+),\s+'
+                                  r'Ports:\s+(?P<ports>\d+)$')
 
         parser_dict = {}
         mcast = None
@@ -539,61 +541,61 @@ class ShowL2fibBdAddressMulticast(ShowL2fibBdAddressMulticastSchema):
             cli_output = output
 
         # Source                : *
-        p1 = re.compile(r'^Source\s+:\s+(?P<source>[0-9a-fA-F:\*\./]+)$')
+        p1 = regex_engine.compile(r'^Source\s+:\s+(?P<source>[0-9a-fA-F:\*\./]+)$')
 
         # Group                 : 227.0.1.1
-        p2 = re.compile(r'^Group\s+:\s+(?P<group>[0-9a-fA-F:\.\*/]+)$')
+        p2 = regex_engine.compile(r'^Group\s+:\s+(?P<group>[0-9a-fA-F:\.\*/]+)$')
 
         # Reference Count       : 1
-        p3 = re.compile(r'^Reference Count\s+:\s+(?P<reference_count>\d+)$')
+        p3 = regex_engine.compile(r'^Reference Count\s+:\s+(?P<reference_count>\d+)$')
 
         # Epoch                 : 0
-        p4 = re.compile(r'^Epoch\s+:\s+(?P<epoch>\d+)$')
+        p4 = regex_engine.compile(r'^Epoch\s+:\s+(?P<epoch>\d+)$')
 
         # Source Port           : Null
-        p5 = re.compile(r'^Source Port\s+:\s+(?P<source_port>[\w ]+)$')
+        p5 = regex_engine.compile(r'^Source Port\s+:\s+(?P<source_port>[\w ]+)$')
 
         # Flags                 : Age Out
-        p6 = re.compile(r'^Flags\s+:\s+(?P<flags>[\w ]+)$')
+        p6 = regex_engine.compile(r'^Flags\s+:\s+(?P<flags>[\w ]+)$')
 
         # Adjacency             : Olist: 5, Ports: 2
-        p7 = re.compile(r'^Adjacency\s+:\s+Olist:\s+(?P<output_list_id>\d+),\s+'
-                        r'Ports:\s+(?P<ports>\d+)$')
+        p7 = regex_engine.compile(r'^Adjacency\s+:\s+Olist:\s+(?P<output_list_id>\d+),\s+'
+                                  r'Ports:\s+(?P<ports>\d+)$')
 
         # : NULL, Epoch: 0, Producer: EVPN
-        p8 = re.compile(r'^:\s+(?P<port>NULL),\s+'
-                        r'Epoch:\s+(?P<epoch>\d+),\s+'
-                        r'Producer:\s+(?P<producer>\w+)$')
+        p8 = regex_engine.compile(r'^:\s+(?P<port>NULL),\s+'
+                                  r'Epoch:\s+(?P<epoch>\d+),\s+'
+                                  r'Producer:\s+(?P<producer>\w+)$')
         # : Et0/2:12, Epoch: 0, Producer: EVPN
-        p9 = re.compile(r'^:\s+(?P<port>[\w:\/]+),\s+'
-                        r'Epoch:\s+(?P<epoch>\d+),\s+'
-                        r'Producer:\s+(?P<producer>\w+)$')
+        p9 = regex_engine.compile(r'^:\s+(?P<port>[\w:\/]+),\s+'
+                                  r'Epoch:\s+(?P<epoch>\d+),\s+'
+                                  r'Producer:\s+(?P<producer>\w+)$')
 
         # : PL:8(1) T:VXLAN_REP [IR]20012:3.3.3.2 , Epoch: 0, Producer: EVPN
-        p10 = re.compile(r'^:\s+PL:(?P<path_list_id>\d+)'
-                         r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                         r'(?P<path_list_description>\[(?P<type>\w+)\](?P<port>\d+):(?P<address>[0-9a-fA-F:\.\*/]+))\s+,\s+'
-                         r'Epoch:\s+(?P<epoch>\d+),\s+'
-                         r'Producer:\s+(?P<producer>\w+)$')
-
-        p11 = re.compile(r'^:\s+PL:(?P<path_list_id>\d+)'
-                         r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                         r'(?P<path_list_description>\[(?P<type>\w+)\](?P<label>\d+)@(?P<address>[0-9a-fA-F:\.\*/]+))\s+,\s+'
-                         r'Epoch:\s+(?P<epoch>\d+),\s+'
-                         r'Producer:\s+(?P<producer>\w+)$')
-
-        p12 = re.compile(r'^:\s+PL:(?P<path_list_id>\d+)'
-                         r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                         r'(?P<path_list_description>\[(?P<type>\w+)\]LT:(?P<vni>\d+):(?P<lvtep_address>[0-9a-fA-F:\.\*/]+),'
-                         r'RT:(?P<evni>\d+):(?P<rvtep_address>[0-9a-fA-F:\.\*/]+))\s+,\s+'
-                         r'Epoch:\s+(?P<epoch>\d+),\s+'
-                         r'Producer:\s+(?P<producer>\w+)$')
-
-        p13 = re.compile(r'^:\s+PL:(?P<path_list_id>\d+)'
-                         r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                         r'(?P<path_list_description>\[(?P<type>\w+)\](?P<address>[0-9a-fA-F:\.\*/]+))\s+,\s+'
-                         r'Epoch:\s+(?P<epoch>\d+),\s+'
-                         r'Producer:\s+(?P<producer>\w+)$')
+        p10 = regex_engine.compile(r'^:\s+PL:(?P<path_list_id>\d+)'
+                                   r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                   r'(?P<path_list_description>\[(?P<type>\w+)\](?P<port>\d+):(?P<address>[0-9a-fA-F:\.\*/]+))\s+,\s+'
+                                   r'Epoch:\s+(?P<epoch>\d+),\s+'
+                                   r'Producer:\s+(?P<producer>\w+)$')
+
+        p11 = regex_engine.compile(r'^:\s+PL:(?P<path_list_id>\d+)'
+                                   r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                   r'(?P<path_list_description>\[(?P<type>\w+)\](?P<label>\d+)@(?P<address>[0-9a-fA-F:\.\*/]+))\s+,\s+'
+                                   r'Epoch:\s+(?P<epoch>\d+),\s+'
+                                   r'Producer:\s+(?P<producer>\w+)$')
+
+        p12 = regex_engine.compile(r'^:\s+PL:(?P<path_list_id>\d+)'
+                                   r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                   r'(?P<path_list_description>\[(?P<type>\w+)\]LT:(?P<vni>\d+):(?P<lvtep_address>[0-9a-fA-F:\.\*/]+),'
+                                   r'RT:(?P<evni>\d+):(?P<rvtep_address>[0-9a-fA-F:\.\*/]+))\s+,\s+'
+                                   r'Epoch:\s+(?P<epoch>\d+),\s+'
+                                   r'Producer:\s+(?P<producer>\w+)$')
+
+        p13 = regex_engine.compile(r'^:\s+PL:(?P<path_list_id>\d+)'
+                                   r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                   r'(?P<path_list_description>\[(?P<type>\w+)\](?P<address>[0-9a-fA-F:\.\*/]+))\s+,\s+'
+                                   r'Epoch:\s+(?P<epoch>\d+),\s+'
+                                   r'Producer:\s+(?P<producer>\w+)$')
 
         parser_dict = {}
 
@@ -829,34 +831,34 @@ class ShowL2fibBdTableUnicast(ShowL2fibBdTableUnicastSchema):
             cli_output = output
 
         # aabb.0011.0031  VXLAN_UC  PL:18(2) T:VXLAN_UC [EVI]20011:3.3.3.3
-        p1 = re.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+'
-                        r'PL:(?P<path_list_id>\d+)\((?P<path_list_count>\d+)\)'
-                        r'\s+T:(?P<path_list_type>\w+)\s+'
-                        r'\[(?P<source_type>\w+)\](?P<port>\d+):(?P<address>[0-9a-fA-F:\.\*/]+)$')
-
-        p2 = re.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+'
-                        r'PL:(?P<path_list_id>\d+)'
-                        r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                        r'\[(?P<source_type>\w+)\](?P<label>\d+)@(?P<address>[0-9a-fA-F:\.\*/]+)$')
-
-        p3 = re.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+'
-                        r'PL:(?P<path_list_id>\d+)'
-                        r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                        r'\[(?P<source_type>\w+)\]LT:(?P<vni>\d+):(?P<lvtep_address>[0-9a-fA-F:\.\*/]+),'
-                        r'RT:(?P<evni>\d+):(?P<rvtep_address>[0-9a-fA-F:\.\*/]+)$')
-
-        p4 = re.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+'
-                        r'PL:(?P<path_list_id>\d+)'
-                        r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                        r'\[(?P<source_type>\w+)\](?P<address>[0-9a-fA-F:\.\*/]+)$')
+        p1 = regex_engine.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+'
+                                  r'PL:(?P<path_list_id>\d+)\((?P<path_list_count>\d+)\)'
+                                  r'\s+T:(?P<path_list_type>\w+)\s+'
+                                  r'\[(?P<source_type>\w+)\](?P<port>\d+):(?P<address>[0-9a-fA-F:\.\*/]+)$')
+
+        p2 = regex_engine.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+'
+                                  r'PL:(?P<path_list_id>\d+)'
+                                  r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                  r'\[(?P<source_type>\w+)\](?P<label>\d+)@(?P<address>[0-9a-fA-F:\.\*/]+)$')
+
+        p3 = regex_engine.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+'
+                                  r'PL:(?P<path_list_id>\d+)'
+                                  r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                  r'\[(?P<source_type>\w+)\]LT:(?P<vni>\d+):(?P<lvtep_address>[0-9a-fA-F:\.\*/]+),'
+                                  r'RT:(?P<evni>\d+):(?P<rvtep_address>[0-9a-fA-F:\.\*/]+)$')
+
+        p4 = regex_engine.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+'
+                                  r'PL:(?P<path_list_id>\d+)'
+                                  r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                  r'\[(?P<source_type>\w+)\](?P<address>[0-9a-fA-F:\.\*/]+)$')
 
         # 000a.000a.000a  Olist: 2, Ports: 2
-        p5 = re.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+'
-                        r'Olist: (?P<output_list_id>\d+), Ports: (?P<ports>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+'
+                                  r'Olist: (?P<output_list_id>\d+), Ports: (?P<ports>\d+)$')
 
         # aabb.0011.0042  VXLAN_CP  L:20011:2.2.2.2 R:20011:4.4.4.4
-        p6 = re.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+'
-                        r'(?P<description>.*)$')
+        p6 = regex_engine.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+'
+                                  r'(?P<description>.*)$')
 
         parser_dict = {}
 
@@ -1059,48 +1061,48 @@ class ShowL2fibBridgedomainAddressUnicast(ShowL2fibBridgedomainAddressUnicastSch
             out = output
 
         # MAC Address                   : aabb.0000.0002
-        p1 = re.compile(r'^MAC\s+Address\s+:\s+(?P<mac_addr>[a-fA-F0-9\.]+)$')
+        p1 = regex_engine.compile(r'^MAC\s+Address\s+:\s+(?P<mac_addr>[a-fA-F0-9\.]+)$')
 
         # Reference Count               : 1
-        p2 = re.compile(r'^Reference\s+Count\s+:\s+(?P<reference_count>\d+)$')
+        p2 = regex_engine.compile(r'^Reference\s+Count\s+:\s+(?P<reference_count>\d+)$')
 
         # Epoch                         : 0
-        p3 = re.compile(r'^Epoch\s+:\s+(?P<epoch>\d+)$')
+        p3 = regex_engine.compile(r'^Epoch\s+:\s+(?P<epoch>\d+)$')
 
         # Producer                      : BGP
         # Producer : BD-ENG
-        p4 = re.compile(r'^Producer\s+:\s+(?P<producer>.+)$')
+        p4 = regex_engine.compile(r'^Producer\s+:\s+(?P<producer>.+)$')
 
         # Flags                         : Local Mac
-        p5 = re.compile(r'^Flags\s+:\s+(?P<flags>[\w\s]+)$')
+        p5 = regex_engine.compile(r'^Flags\s+:\s+(?P<flags>[\w\s]+)$')
 
         #: CP Learn
-        p6 = re.compile(r'^:\s+(?P<flags>[\w\s]+)$')
+        p6 = regex_engine.compile(r'^:\s+(?P<flags>[\w\s]+)$')
 
         # Adjacency                     : MPLS_UC   PL:5(1) T:MPLS_UC [MAC]16@2.2.2.1
         # PD Adjacency                  : MPLS_UC   PL:5(1) T:MPLS_UC [MAC]16@2.2.2.1
         # Adjacency                     : MPLS_UC   PL:5(2) T:MPLS_UC [MAC]16@2.2.2.1 ...
         # PD Adjacency                  : MPLS_UC   PL:5(2) T:MPLS_UC [MAC]16@2.2.2.1 ...
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^(?P<tag>(Adjacency|PD Adjacency))\s+:\s+(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)\((?P<path_list_count>\d+)\)'
             r'\s+T:(?P<path_list_type>\w+)\s+(?P<path_list_desc>\[\w+\][0-9a-fA-F:@\.]+)(\s+...)?$')
 
         # Adjacency                     : Olist: 3, Ports: 1
         # PD Adjacency                  : Olist: 3, Ports: 1
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^(?P<tag>(Adjacency|PD Adjacency))\s+:\s+Olist:\s+(?P<olist>\d+),\s+Ports:\s+(?P<port_count>\d+)$')
 
         # Adjacency : VXLAN_CP L:20011:1.1.1.1 R:20012:2.2.2.2
         # PD Adjacency : VXLAN_CP L:20011:1.1.1.1 R:20012:2.2.2.2
         # Adjacency                     : BD_PORT   Et0/1:11
         # PD Adjacency                  : BD_PORT   Et0/1:11
-        p9 = re.compile(r'^(?P<tag>(Adjacency|PD Adjacency))\s+:\s+(?P<type>\w+)\s+(?P<desc>.+)$')
+        p9 = regex_engine.compile(r'^(?P<tag>(Adjacency|PD Adjacency))\s+:\s+(?P<type>\w+)\s+(?P<desc>.+)$')
 
         # Packets                       : 0
-        p10 = re.compile(r'^Packets\s+:\s+(?P<packet_count>\d+)$')
+        p10 = regex_engine.compile(r'^Packets\s+:\s+(?P<packet_count>\d+)$')
 
         # Bytes                         : 0
-        p11 = re.compile(r'^Bytes\s+:\s+(?P<bytes>\d+)$')
+        p11 = regex_engine.compile(r'^Bytes\s+:\s+(?P<bytes>\d+)$')
 
         parser_dict = {}
 
@@ -1263,7 +1265,7 @@ class ShowL2fibOutputList(ShowL2fibOutputListSchema):
             output = self.device.execute(self.cli_command)
 
         # 1055 31   3    flood list
-        p1 = re.compile(r"^(?P<output_id>\d+)\s+(?P<bridge_domain>\d+)\s+(?P<port>\d+)\s+(?P<flags>\S+\s+\S+)$")
+        p1 = regex_engine.compile(r"^(?P<output_id>\d+)\s+(?P<bridge_domain>\d+)\s+(?P<port>\d+)\s+(?P<flags>\S+\s+\S+)$")
 
         ret_dict = {}
 
@@ -1317,24 +1319,24 @@ class ShowL2fibOutputListId(ShowL2fibOutputListIdSchema):
             output = self.device.execute(self.cli_command.format(output_id=output_id))
 
         # ID                            : 1225
-        p1 = re.compile(r"^ID\s+:\s+(?P<output_id>\d+)$")
+        p1 = regex_engine.compile(r"^ID\s+:\s+(?P<output_id>\d+)$")
         # Bridge Domain                 : 201
-        p2 = re.compile(r"^Bridge\s+Domain\s+:\s+(?P<bridge_domain>\d+)$")
+        p2 = regex_engine.compile(r"^Bridge\s+Domain\s+:\s+(?P<bridge_domain>\d+)$")
         # Reference Count               : 1
-        p3 = re.compile(r"^Reference\s+Count\s+:\s+(?P<ref_count>\d+)$")
+        p3 = regex_engine.compile(r"^Reference\s+Count\s+:\s+(?P<ref_count>\d+)$")
         # Flags                         : flood list
-        p4 = re.compile(r"^Flags\s+:\s+(?P<flags>\S+\s+\S+)$")
+        p4 = regex_engine.compile(r"^Flags\s+:\s+(?P<flags>\S+\s+\S+)$")
         # Port Count                    : 3
-        p5 = re.compile(r"^Port\s+Count\s+:\s+(?P<port_count>\d+)$")
+        p5 = regex_engine.compile(r"^Port\s+Count\s+:\s+(?P<port_count>\d+)$")
         # Port(s)                       : BD_PORT   Hu1/0/31:201
-        p6 = re.compile(r"^Port\(s\)\s+:\s+BD_PORT\s+(?P<ports>\S+):\d+$")
+        p6 = regex_engine.compile(r"^Port\(s\)\s+:\s+BD_PORT\s+(?P<ports>\S+):\d+$")
         #                               : BD_PORT   Gi1/0/24:201
-        p6_1 = re.compile(r"^:\s+BD_PORT\s+(?P<ports>\S+):\d+$")
+        p6_1 = regex_engine.compile(r"^:\s+BD_PORT\s+(?P<ports>\S+):\d+$")
         #                               : VXLAN_REP PL:1110(1) T:VXLAN_REP [IR]100201:172.11.1.1
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^:\s+VXLAN_REP\s+PL:(?P<vlan_rep>\d+)\S+\s+T:VXLAN_REP\s+\[IR\](?P<vni_id>\d+)+:+(?P<loopback_ip>\S+)$")
         # Port(s)                       : VXLAN_REP PL:1110(1) T:VXLAN_REP [IR]100201:172.11.1.1
-        p7_1 = re.compile(
+        p7_1 = regex_engine.compile(
             r"^Port\(s\)\s+:\s+VXLAN_REP\s+PL:(?P<vlan_rep>\d+)\S+\s+T:VXLAN_REP\s+\[IR\](?P<vni_id>\d+)+:+(?P<loopback_ip>\S+)$")
 
         ret_dict = {}
@@ -1500,76 +1502,76 @@ class ShowL2fibBridgeDomainDetail(ShowL2fibBridgeDomainDetailSchema):
             output = self.device.execute(self.cli_command.format(bd_id=bd_id))
 
         # Bridge Domain : 101
-        p1 = re.compile(r'^Bridge Domain : (?P<bd_id>\d+)$')
+        p1 = regex_engine.compile(r'^Bridge Domain : (?P<bd_id>\d+)$')
 
         # Reference Count : 10
-        p2 = re.compile(r'^Reference Count : (?P<reference_count>\d+)$')
+        p2 = regex_engine.compile(r'^Reference Count : (?P<reference_count>\d+)$')
 
         # Replication ports count : 2
-        p3 = re.compile(r'^Replication ports count : (?P<replication_ports_count>\d+)$')
+        p3 = regex_engine.compile(r'^Replication ports count : (?P<replication_ports_count>\d+)$')
 
         # Unicast Address table size : 1
-        p4 = re.compile(r'^Unicast Address table size : (?P<unicast_addr_table_size>\d+)$')
+        p4 = regex_engine.compile(r'^Unicast Address table size : (?P<unicast_addr_table_size>\d+)$')
 
         # IP Multicast Prefix table size : 3
-        p5 = re.compile(r'^IP Multicast Prefix table size : (?P<ip_multicast_pref_table_size>\d+)$')
+        p5 = regex_engine.compile(r'^IP Multicast Prefix table size : (?P<ip_multicast_pref_table_size>\d+)$')
 
         # Olist: 1125, Ports: 2
-        p6 = re.compile(r'^Olist: (?P<olist>\d+)\,\s*Ports: (?P<port_count>\d+)$')
+        p6 = regex_engine.compile(r'^Olist: (?P<olist>\d+)\,\s*Ports: (?P<port_count>\d+)$')
 
         # BD_PORT   Gi1/0/10:101
-        p7 = re.compile(r'^(?P<port_type>BD_PORT)\s+(?P<desc>(?P<interface>[\w\/]+):(?P<service_instance>\d+))$')
+        p7 = regex_engine.compile(r'^(?P<port_type>BD_PORT)\s+(?P<desc>(?P<interface>[\w\/]+):(?P<service_instance>\d+))$')
 
         # VXLAN_REP PL:25(1) T:VXLAN_REP [IR]10101:172.16.254.2
-        p8 = re.compile(r'^(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)\((?P<path_count>\d+)\)\s'
-                        r'+T:(?P<path_list_type>\w+)\s+'
-                        r'(?P<desc>\[(?P<source_type>\w+)\](?P<port>\d+):(?P<address>[0-9a-fA-F:\.\*/]+))$')
+        p8 = regex_engine.compile(r'^(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)\((?P<path_count>\d+)\)\s'
+                                  r'+T:(?P<path_list_type>\w+)\s+'
+                                  r'(?P<desc>\[(?P<source_type>\w+)\](?P<port>\d+):(?P<address>[0-9a-fA-F:\.\*/]+))$')
 
-        p9 = re.compile(r'^(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
-                        r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                        r'(?P<desc>\[(?P<source_type>\w+)\](?P<label>\d+)@(?P<address>[0-9a-fA-F:\.\*/]+))$')
+        p9 = regex_engine.compile(r'^(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
+                                  r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                  r'(?P<desc>\[(?P<source_type>\w+)\](?P<label>\d+)@(?P<address>[0-9a-fA-F:\.\*/]+))$')
 
-        p10 = re.compile(r'^(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
-                         r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                         r'(?P<desc>\[(?P<source_type>\w+)\]LT:(?P<vni>\d+):(?P<lvtep_address>[0-9a-fA-F:\.\*/]+),'
-                         r'RT:(?P<evni>\d+):(?P<rvtep_address>[0-9a-fA-F:\.\*/]+))$')
+        p10 = regex_engine.compile(r'^(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
+                                   r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                   r'(?P<desc>\[(?P<source_type>\w+)\]LT:(?P<vni>\d+):(?P<lvtep_address>[0-9a-fA-F:\.\*/]+),'
+                                   r'RT:(?P<evni>\d+):(?P<rvtep_address>[0-9a-fA-F:\.\*/]+))$')
 
-        p11 = re.compile(r'^(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
-                         r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                         r'(?P<desc>\[(?P<source_type>\w+)\](?P<address>[0-9a-fA-F:\.\*/]+))$')
+        p11 = regex_engine.compile(r'^(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
+                                   r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                   r'(?P<desc>\[(?P<source_type>\w+)\](?P<address>[0-9a-fA-F:\.\*/]+))$')
 
         # 44d3.ca28.6cc2  VXLAN_UC  PL:24(1) T:VXLAN_UC [MAC]10101:172.16.254.2
-        p12 = re.compile(r'^(?P<unicast_mac_addr>[a-fA-F0-9\.]+)\s+(?P<type>\w+)\s'
-                         r'+PL:(?P<path_list_id>\d+)\((?P<path_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s'
-                         r'(?P<path_list_desc>\[(?P<source_type>\w+)\](?P<port>\d+):(?P<address>[0-9a-fA-F:\.\*/]+))$')
+        p12 = regex_engine.compile(r'^(?P<unicast_mac_addr>[a-fA-F0-9\.]+)\s+(?P<type>\w+)\s'
+                                   r'+PL:(?P<path_list_id>\d+)\((?P<path_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s'
+                                   r'(?P<path_list_desc>\[(?P<source_type>\w+)\](?P<port>\d+):(?P<address>[0-9a-fA-F:\.\*/]+))$')
 
-        p13 = re.compile(r'^(?P<unicast_mac_addr>[a-fA-F0-9\.]+)\s+(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
-                         r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                         r'(?P<path_list_desc>\[(?P<source_type>\w+)\](?P<label>\d+)@(?P<address>[0-9a-fA-F:\.\*/]+))$')
+        p13 = regex_engine.compile(r'^(?P<unicast_mac_addr>[a-fA-F0-9\.]+)\s+(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
+                                   r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                   r'(?P<path_list_desc>\[(?P<source_type>\w+)\](?P<label>\d+)@(?P<address>[0-9a-fA-F:\.\*/]+))$')
 
-        p14 = re.compile(r'^(?P<unicast_mac_addr>[a-fA-F0-9\.]+)\s+(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
-                         r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                         r'(?P<path_list_desc>\[(?P<source_type>\w+)\]LT:(?P<vni>\d+):(?P<lvtep_address>[0-9a-fA-F:\.\*/]+),'
-                         r'RT:(?P<evni>\d+):(?P<rvtep_address>[0-9a-fA-F:\.\*/]+))$')
+        p14 = regex_engine.compile(r'^(?P<unicast_mac_addr>[a-fA-F0-9\.]+)\s+(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
+                                   r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                   r'(?P<path_list_desc>\[(?P<source_type>\w+)\]LT:(?P<vni>\d+):(?P<lvtep_address>[0-9a-fA-F:\.\*/]+),'
+                                   r'RT:(?P<evni>\d+):(?P<rvtep_address>[0-9a-fA-F:\.\*/]+))$')
 
-        p15 = re.compile(r'^(?P<unicast_mac_addr>[a-fA-F0-9\.]+)\s+(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
-                         r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
-                         r'(?P<path_list_desc>\[(?P<source_type>\w+)\](?P<address>[0-9a-fA-F:\.\*/]+))$')
+        p15 = regex_engine.compile(r'^(?P<unicast_mac_addr>[a-fA-F0-9\.]+)\s+(?P<type>\w+)\s+PL:(?P<path_list_id>\d+)'
+                                   r'\((?P<path_list_count>\d+)\)\s+T:(?P<path_list_type>\w+)\s+'
+                                   r'(?P<path_list_desc>\[(?P<source_type>\w+)\](?P<address>[0-9a-fA-F:\.\*/]+))$')
 
         # aabb.0011.0042 VXLAN_CP L:20011:2.2.2.2 R:20011:4.4.4.4
-        p16 = re.compile(r'^(?P<unicast_mac_addr>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+(?P<path_list_desc>.*)$')
+        p16 = regex_engine.compile(r'^(?P<unicast_mac_addr>[0-9a-fA-F\.]+)\s+(?P<type>\w+)\s+(?P<path_list_desc>.*)$')
 
         # 000a.000a.000a Olist: 2, Ports: 2
-        p17 = re.compile(r'^(?P<unicast_mac_addr>[0-9a-fA-F\.]+)\s+'
-                         r'Olist: (?P<output_list_id>\d+), Ports: (?P<ports>\d+)$')
+        p17 = regex_engine.compile(r'^(?P<unicast_mac_addr>[0-9a-fA-F\.]+)\s+'
+                                   r'Olist: (?P<output_list_id>\d+), Ports: (?P<ports>\d+)$')
 
         # Source: *, Group: 224.0.0.0/24, IIF: Null, Adjacency: Olist: 1125, Ports: 2
         # Source: *, Group: *, IIF: Null, Adjacency: Olist: 6396, Ports: 1
         # Source: ::, Group: ::, IIF: Null, Adjacency: Olist: 6397, Ports: 1
         # Source: ::, Group: FF1E::1, IIF: Null, Adjacency: Olist: 6398, Ports: 2
-        p18 = re.compile(r'^Source: (?P<source>.+),\s+Group: (?P<group>.+),\s'
-                         r'+IIF: (?P<iif>\w+),\s+Adjacency:(?P<adjacency>[\s\S]+)Olist:\s'
-                         r'+(?P<olist>\d+),\s+Ports:\s+(?P<port_count>\d+)$')
+        p18 = regex_engine.compile(r'^Source: (?P<source>.+),\s+Group: (?P<group>.+),\s'
+                                   r'+IIF: (?P<iif>\w+),\s+Adjacency:(?P<adjacency>[\s\S]+)Olist:\s'
+                                   r'+(?P<olist>\d+),\s+Ports:\s+(?P<port_count>\d+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -8,8 +8,8 @@ Copyright (c) 2023 by Cisco Systems, Inc.
 All rights reserved.
 '''
 
-import re
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
@@ -46,14 +46,14 @@ class ShowL2ProtocolTunnelInterface(ShowL2ProtocolTunnelInterfaceSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         # COS for Encapsulated Packets: 5
-        p1 = re.compile(r"^[\S\s]+: (?P<cos>\d+)$")
+        p1 = regex_engine.compile(r"^[\S\s]+: (?P<cos>\d+)$")
 
         # Gi1/0/20            cdp             40        30            7         1         0
-        p2 = re.compile(r"^(?P<port>\S+)\s+(?P<protocol>\w+)\s+(?P<shutdown_threshold>\d+|\-+)\s+"
+        p2 = regex_engine.compile(r"^(?P<port>\S+)\s+(?P<protocol>\w+)\s+(?P<shutdown_threshold>\d+|\-+)\s+"
 			r"(?P<drop_threshold>\d+|\-+)\s+(?P<encaps_counter>\d+|\-+)\s+(?P<decaps_counter>\d+|\-+)\s+(?P<drop_counter>\d+|\-+)$")
 
         # lldp          ----        20            4         3         0
-        p3 = re.compile(r"^(?P<protocol>\w+)\s+(?P<shutdown_threshold>\d+|\-+)\s+(?P<drop_threshold>\d+|\-+)?"
+        p3 = regex_engine.compile(r"^(?P<protocol>\w+)\s+(?P<shutdown_threshold>\d+|\-+)\s+(?P<drop_threshold>\d+|\-+)?"
 			r"\s+(?P<encaps_counter>\d+|\-+)?\s+(?P<decaps_counter>\d+|\-+)?\s+(?P<drop_counter>\d+|\-+)?$")
 
         ret_dict = {}
@@ -135,13 +135,13 @@ Copyright (c) 2021 by Cisco Systems, Inc.
 All rights reserved.
 
 '''
-import re
 
 # genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, ListOf, Optional
 
 # Libs
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =============================================
@@ -275,34 +275,34 @@ class ShowL2routeEvpnMacIpDetail(ShowL2routeEvpnMacIpDetailSchema):
             cli_output = output
 
         # EVPN Instance:            2
-        p1 = re.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
+        p1 = regex_engine.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
 
         # Ethernet Tag:             0
-        p2 = re.compile(r'^Ethernet Tag:\s+(?P<eth_tag>\d+)$')
+        p2 = regex_engine.compile(r'^Ethernet Tag:\s+(?P<eth_tag>\d+)$')
 
         # Producer Name:            BGP
-        p3 = re.compile(r'^Producer Name:\s+(?P<producer>\w+)$')
+        p3 = regex_engine.compile(r'^Producer Name:\s+(?P<producer>\w+)$')
 
         # MAC Address:              0012.0012.0012
-        p4 = re.compile(r'^MAC Address:\s+(?P<mac_addr>[0-9a-fA-F\.]+)$')
+        p4 = regex_engine.compile(r'^MAC Address:\s+(?P<mac_addr>[0-9a-fA-F\.]+)$')
 
         # Host IP:                  192.168.12.254
-        p5 = re.compile(r'^Host IP:\s+(?P<host_ip>[0-9a-fA-F\.:]+)$')
+        p5 = regex_engine.compile(r'^Host IP:\s+(?P<host_ip>[0-9a-fA-F\.:]+)$')
 
         # Sequence Number:          0
-        p6 = re.compile(r'^Sequence Number:\s+(?P<seq_number>\d+)$')
+        p6 = regex_engine.compile(r'^Sequence Number:\s+(?P<seq_number>\d+)$')
 
         # Label 2:                  0
-        p7 = re.compile(r'^Label 2:\s+(?P<label_2>\d+)$')
+        p7 = regex_engine.compile(r'^Label 2:\s+(?P<label_2>\d+)$')
 
         # ESI:                      0000.0000.0000.0000.0000
-        p8 = re.compile(r'^ESI:\s+(?P<esi>[0-9a-fA-F\.]+)$')
+        p8 = regex_engine.compile(r'^ESI:\s+(?P<esi>[0-9a-fA-F\.]+)$')
 
         # MAC Route Flags:          BInt(Brm)Dgr
-        p9 = re.compile(r'^MAC Route Flags:\s+(?P<mac_rt_flags>[\w()]+)$')
+        p9 = regex_engine.compile(r'^MAC Route Flags:\s+(?P<mac_rt_flags>[\w()]+)$')
 
         # Next Hop(s):              L:16 2.2.2.1
-        p10 = re.compile(r'^[Next Hop\(s\):]*\s*(?P<next_hop>.+)$')
+        p10 = regex_engine.compile(r'^[Next Hop\(s\):]*\s*(?P<next_hop>.+)$')
 
         parser_dict = {}
 
@@ -485,38 +485,38 @@ class ShowL2routeEvpnImetDetail(ShowL2routeEvpnImetDetailSchema):
         # start regex statement complies
 
         #EVPN Instance:            1
-        p1 = re.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
+        p1 = regex_engine.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
 
         #Ethernet Tag:             0
-        p2 = re.compile(r'^Ethernet Tag:\s+(?P<eth_tag>\d+)$')
+        p2 = regex_engine.compile(r'^Ethernet Tag:\s+(?P<eth_tag>\d+)$')
 
         #Producer Name:            BGP
-        p3 = re.compile(r'^Producer Name:\s+(?P<producer>\w+)$')
+        p3 = regex_engine.compile(r'^Producer Name:\s+(?P<producer>\w+)$')
 
         #Router IP Addr:           3.3.3.2
-        p4 = re.compile(r'^Router IP Addr:\s+(?P<origin_ip>[0-9a-fA-F\.:]+)$')
+        p4 = regex_engine.compile(r'^Router IP Addr:\s+(?P<origin_ip>[0-9a-fA-F\.:]+)$')
 
         #Route Ethernet Tag:       0
-        p5 = re.compile(r'^Route Ethernet Tag:\s+(?P<r_eth_tag>\d+)$')
+        p5 = regex_engine.compile(r'^Route Ethernet Tag:\s+(?P<r_eth_tag>\d+)$')
 
         #Tunnel Flags:             0
-        p6 = re.compile(r'^Tunnel Flags:\s+(?P<tun_flag>\d+)$')
+        p6 = regex_engine.compile(r'^Tunnel Flags:\s+(?P<tun_flag>\d+)$')
 
         #Tunnel Type:              Ingress Replication
-        p7 = re.compile(r'^Tunnel Type:\s+(?P<tun_type>.*)$')
+        p7 = regex_engine.compile(r'^Tunnel Type:\s+(?P<tun_type>.*)$')
 
         #Tunnel Labels:            20011
-        p8 = re.compile(r'^Tunnel Labels:\s+(?P<tun_labels>\d+)$')
+        p8 = regex_engine.compile(r'^Tunnel Labels:\s+(?P<tun_labels>\d+)$')
 
         #Tunnel ID:                3.3.3.2
-        p9 = re.compile(r'^Tunnel ID:\s+(?P<tun_id>[0-9a-fA-F\.:]+)$')
+        p9 = regex_engine.compile(r'^Tunnel ID:\s+(?P<tun_id>[0-9a-fA-F\.:]+)$')
 
         #Multicast Proxy:          IGMP, MLD
-        p10 = re.compile(r'^Multicast Proxy:\s+(?P<multi_proxy>.+)$')
+        p10 = regex_engine.compile(r'^Multicast Proxy:\s+(?P<multi_proxy>.+)$')
 
         #Next Hop(s):              V:20011 3.3.3.2
         #Next Hop(s):              N/A
-        p11 = re.compile(r'^[Next Hop\(s\):]+\s+(?P<next_hop>[\w\s.:()/]+)$')
+        p11 = regex_engine.compile(r'^[Next Hop\(s\):]+\s+(?P<next_hop>[\w\s.:()/]+)$')
 
         parser_dict = {}
 
@@ -747,15 +747,15 @@ class ShowL2routeEvpnMacIp(ShowL2routeEvpnMacIpSchema):
             cli_output = output
 
         #  EVI       ETag  Prod    Mac Address         Host IP                Next Hop(s)
-        p1 = re.compile(r'^EVI\s+ETag\s+Prod\s+Mac Address\s+Host IP\s+Next Hop\(s\)$')
+        p1 = regex_engine.compile(r'^EVI\s+ETag\s+Prod\s+Mac Address\s+Host IP\s+Next Hop\(s\)$')
 
         #    1          0   BGP 0011.0011.0011  192.168.11.254            V:20011 3.3.3.2
         #    1          0 L2VPN aabb.0011.0011 FE80::A8BB:FF:FE11:11 \
-        p2 = re.compile(r'^(?P<evi>\d+)\s+(?P<eth_tag>\d+)\s+(?P<producer>\w+)\s+(?P<mac_addr>[0-9a-fA-F.]+)'
-                        r'\s+(?P<host_ip>[0-9a-fA-F.:]+)\s+(?P<next_hop>.+)$')
+        p2 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<eth_tag>\d+)\s+(?P<producer>\w+)\s+(?P<mac_addr>[0-9a-fA-F.]+)'
+                                  r'\s+(?P<host_ip>[0-9a-fA-F.:]+)\s+(?P<next_hop>.+)$')
 
         # Et0/1:11
-        p3 = re.compile(r'^(?!-)(?P<next_hop>.+)$')
+        p3 = regex_engine.compile(r'^(?!-)(?P<next_hop>.+)$')
 
         parser_dict = {}
         header_found = False
@@ -1068,11 +1068,11 @@ class ShowL2routeEvpnDGW(ShowL2routeEvpnDGWSchema):
         #  EVI       ETag  Prod    Mac Address         Host IP                Next Hop(s)
         #    1          0   BGP 0011.0011.0011  192.168.11.254            V:20011 3.3.3.2
         #    1          0 L2VPN aabb.0011.0011 FE80::A8BB:FF:FE11:11 \
-        p1 = re.compile(r'^(?P<evi>\d+)\s+(?P<eth_tag>\d+)\s+(?P<producer>\w+)\s+(?P<mac_addr>[0-9a-fA-F.]+)'
-                        r'\s+(?P<host_ip>[0-9a-fA-F.:]+)\s+(?P<next_hop>.+)$')
+        p1 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<eth_tag>\d+)\s+(?P<producer>\w+)\s+(?P<mac_addr>[0-9a-fA-F.]+)'
+                                  r'\s+(?P<host_ip>[0-9a-fA-F.:]+)\s+(?P<next_hop>.+)$')
 
         # Et0/1:11
-        p2 = re.compile(r'^(?P<next_hop>.+)$')
+        p2 = regex_engine.compile(r'^(?P<next_hop>.+)$')
 
         ret_dict = {}
         next_hop_list = []
@@ -1373,34 +1373,34 @@ class ShowL2routeEvpnDGWDetail(ShowL2routeEvpnDGWDetailSchema):
             out = output
 
         # EVPN Instance:            2
-        p1 = re.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
+        p1 = regex_engine.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
 
         # Ethernet Tag:             0
-        p2 = re.compile(r'^Ethernet Tag:\s+(?P<eth_tag>\d+)$')
+        p2 = regex_engine.compile(r'^Ethernet Tag:\s+(?P<eth_tag>\d+)$')
 
         # Producer Name:            BGP
-        p3 = re.compile(r'^Producer Name:\s+(?P<producer>\w+)$')
+        p3 = regex_engine.compile(r'^Producer Name:\s+(?P<producer>\w+)$')
 
         # MAC Address:              0012.0012.0012
-        p4 = re.compile(r'^MAC Address:\s+(?P<mac_addr>[0-9a-fA-F\.]+)$')
+        p4 = regex_engine.compile(r'^MAC Address:\s+(?P<mac_addr>[0-9a-fA-F\.]+)$')
 
         # Host IP:                  192.168.12.254
-        p5 = re.compile(r'^Host IP:\s+(?P<host_ip>[0-9a-fA-F\.:]+)$')
+        p5 = regex_engine.compile(r'^Host IP:\s+(?P<host_ip>[0-9a-fA-F\.:]+)$')
 
         # Sequence Number:          0
-        p6 = re.compile(r'^Sequence Number:\s+(?P<seq_number>\d+)$')
+        p6 = regex_engine.compile(r'^Sequence Number:\s+(?P<seq_number>\d+)$')
 
         # Label 2:                  0
-        p7 = re.compile(r'^Label 2:\s+(?P<label_2>\d+)$')
+        p7 = regex_engine.compile(r'^Label 2:\s+(?P<label_2>\d+)$')
 
         # ESI:                      0000.0000.0000.0000.0000
-        p8 = re.compile(r'^ESI:\s+(?P<esi>[0-9a-fA-F\.]+)$')
+        p8 = regex_engine.compile(r'^ESI:\s+(?P<esi>[0-9a-fA-F\.]+)$')
 
         # MAC Route Flags:          BInt(Brm)Dgr
-        p9 = re.compile(r'^MAC Route Flags:\s+(?P<mac_rt_flags>[\w()]+)$')
+        p9 = regex_engine.compile(r'^MAC Route Flags:\s+(?P<mac_rt_flags>[\w()]+)$')
 
         # Next Hop(s):              L:16 2.2.2.1
-        p10 = re.compile(r'^[Next Hop\(s\):]*\s*(?P<next_hops>[\w\s.:(),/]+)$')
+        p10 = regex_engine.compile(r'^[Next Hop\(s\):]*\s*(?P<next_hops>[\w\s.:(),/]+)$')
 
         ret_dict = {}
 
@@ -1548,8 +1548,8 @@ class ShowL2routeEvpnPeers(ShowL2routeEvpnPeersSchema):
         # Topo Name   EVI       ETAG         Peer-IP Encap Num Routes    Up Time
         #     BD-12     2          0         3.3.3.1  MPLS          4      2d22h
         #    BD-101     2          0         2.2.2.3 VxLAN          1   00:02:07
-        p = re.compile(r'^(?P<top_name>[^\s]+)\s+(?P<evi>\d+)\s+(?P<eth_tag>\d+)\s+'
-                        r'(?P<peer_ip>[0-9a-fA-F.:]+)\s+(?P<encap>\w+)\s+(?P<num_rtes>\d+)\s+(?P<up_time>[\w:]+)$')
+        p = regex_engine.compile(r'^(?P<top_name>[^\s]+)\s+(?P<evi>\d+)\s+(?P<eth_tag>\d+)\s+'
+                                  r'(?P<peer_ip>[0-9a-fA-F.:]+)\s+(?P<encap>\w+)\s+(?P<num_rtes>\d+)\s+(?P<up_time>[\w:]+)$')
 
         ret_dict = {}
         header_found = False
@@ -1648,43 +1648,43 @@ class ShowL2routeEvpnPeersDetail(ShowL2routeEvpnPeersDetailSchema):
             out = output
 
         # EVPN Instance:            2
-        p1 = re.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
+        p1 = regex_engine.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
 
         # Ethernet Tag:             0
-        p2 = re.compile(r'^Ethernet Tag:\s+(?P<eth_tag>\d+)$')
+        p2 = regex_engine.compile(r'^Ethernet Tag:\s+(?P<eth_tag>\d+)$')
 
         # Topology                 BD-12
-        p3 = re.compile(r'^Topology:\s+(?P<top_name>[^\s]+)$')
+        p3 = regex_engine.compile(r'^Topology:\s+(?P<top_name>[^\s]+)$')
 
         # Topology ID:              FFFFFFFE00000000
-        p4 = re.compile(r'^Topology ID:\s+(?P<top_id>[a-fA-f\d]+)$')
+        p4 = regex_engine.compile(r'^Topology ID:\s+(?P<top_id>[a-fA-f\d]+)$')
 
         # Peer IP:                  3.3.3.1
-        p5 = re.compile(r'^Peer IP:\s+(?P<peer_ip>[0-9a-fA-F.:]+)$')
+        p5 = regex_engine.compile(r'^Peer IP:\s+(?P<peer_ip>[0-9a-fA-F.:]+)$')
 
         # Encapsulation:            MPLS
-        p6 = re.compile(r'^Encapsulation:\s+(?P<encap>\w+)$')
+        p6 = regex_engine.compile(r'^Encapsulation:\s+(?P<encap>\w+)$')
 
         # Up Time:                  3d02h
-        p7 = re.compile(r'^Up Time:\s+(?P<up_time>[\w]+)$')
+        p7 = regex_engine.compile(r'^Up Time:\s+(?P<up_time>[\w]+)$')
 
         # MAC:                    1
-        p8 = re.compile(r'^MAC:\s+(?P<mac>\d+)$')
+        p8 = regex_engine.compile(r'^MAC:\s+(?P<mac>\d+)$')
 
         # MAC-IP:                 1
-        p9 = re.compile(r'^MAC-IP:\s+(?P<mac_ip>\d+)$')
+        p9 = regex_engine.compile(r'^MAC-IP:\s+(?P<mac_ip>\d+)$')
 
         # IMET:                   1
-        p10 = re.compile(r'^IMET:\s+(?P<imet>\d+)$')
+        p10 = regex_engine.compile(r'^IMET:\s+(?P<imet>\d+)$')
 
         # EAD-EVI:                1
-        p11 = re.compile(r'^EAD-EVI:\s+(?P<ead_evi>\d+)$')
+        p11 = regex_engine.compile(r'^EAD-EVI:\s+(?P<ead_evi>\d+)$')
 
         # EAD-ES:                 1
-        p12 = re.compile(r'^EAD-ES:\s+(?P<ead_es>\d+)$')
+        p12 = regex_engine.compile(r'^EAD-ES:\s+(?P<ead_es>\d+)$')
 
         # ES:                     1
-        p13 = re.compile(r'^ES:\s+(?P<es>\d+)$')
+        p13 = regex_engine.compile(r'^ES:\s+(?P<es>\d+)$')
 
         ret_dict = {}
 
@@ -1935,34 +1935,34 @@ class ShowL2routeEvpnMacDetail(ShowL2routeEvpnMacDetailSchema):
 
 
         # EVPN Instance:            2
-        p1 = re.compile(r'^EVPN\s+Instance:\s+(?P<evi>\d+)$')
+        p1 = regex_engine.compile(r'^EVPN\s+Instance:\s+(?P<evi>\d+)$')
 
         # Ethernet Tag:             0
-        p2 = re.compile(r'^Ethernet\s+Tag:\s+(?P<eth_tag>\d+)$')
+        p2 = regex_engine.compile(r'^Ethernet\s+Tag:\s+(?P<eth_tag>\d+)$')
 
         # Producer Name:            BGP
-        p3 = re.compile(r'^Producer\s+Name:\s+(?P<producer>[\w\d]+)$')
+        p3 = regex_engine.compile(r'^Producer\s+Name:\s+(?P<producer>[\w\d]+)$')
 
         # MAC Address:              0012.0012.0012
-        p4 = re.compile(r'^MAC\s+Address:\s+(?P<mac_addr>[0-9a-fA-F\.]+)$')
+        p4 = regex_engine.compile(r'^MAC\s+Address:\s+(?P<mac_addr>[0-9a-fA-F\.]+)$')
 
         # Num of MAC IP Route(s):   2
-        p5 = re.compile(r'^[Num of MAC IP Route\(s\):]*\s*(?P<no_of_macip_rts>\d+)$')
+        p5 = regex_engine.compile(r'^[Num of MAC IP Route\(s\):]*\s*(?P<no_of_macip_rts>\d+)$')
 
         # Sequence Number:          0
-        p6 = re.compile(r'^Sequence\s+Number:\s+(?P<seq_number>\d+)$')
+        p6 = regex_engine.compile(r'^Sequence\s+Number:\s+(?P<seq_number>\d+)$')
 
         # ESI:                      0000.0000.0000.0000.0000
-        p7 = re.compile(r'^ESI:\s+(?P<esi>[0-9a-fA-F\.]+)$')
+        p7 = regex_engine.compile(r'^ESI:\s+(?P<esi>[0-9a-fA-F\.]+)$')
 
         # Flags:                    BInt(Brm)Dgr
-        p8 = re.compile(r'^Flags:\s+(?P<flags>[\w()]+)$')
+        p8 = regex_engine.compile(r'^Flags:\s+(?P<flags>[\w()]+)$')
 
         # Num of Default Gateways:  2
-        p9 = re.compile(r'^Num\s+of\s+Default\s+Gateways:\s+(?P<no_of_default_gws>\d+)$')
+        p9 = regex_engine.compile(r'^Num\s+of\s+Default\s+Gateways:\s+(?P<no_of_default_gws>\d+)$')
 
         # Next Hop(s):              L:16 2.2.2.1, L:17 5.5.5.1
-        p10 = re.compile(r'^Next\s+Hop\(s\):\s*(?P<next_hop>[\w\d\s.,:()/]+)$')
+        p10 = regex_engine.compile(r'^Next\s+Hop\(s\):\s*(?P<next_hop>[\w\d\s.,:()/]+)$')
 
         parser_dict = {}
 
@@ -2184,17 +2184,17 @@ class ShowL2routeEvpnMac(ShowL2routeEvpnMacSchema):
             cli_output = output
 
         # EVI       ETag  Prod    Mac Address                  Next Hop(s) Seq Number
-        p1 = re.compile(r'^EVI\s+ETag\s+Prod\s+Mac\s+Address\s+Next\s+Hop\(s\)\s+Seq\s+Number$')
+        p1 = regex_engine.compile(r'^EVI\s+ETag\s+Prod\s+Mac\s+Address\s+Next\s+Hop\(s\)\s+Seq\s+Number$')
 
         #1          0 L2VPN 0011.0011.0011                       BD11:0          0
         #1          0 L2VPN aabb.0012.0002                       Gi4:11          0
         #10          0   BGP 000C.000C.000C            V:2002 IP:2.2.2.2          0
         #10          0   BGP 000B.000B.000B             L:101 IP:1.1.1.1          0
-        p2 = re.compile(r'^(?P<evi>\d+)\s+(?P<eth_tag>\d+)\s+(?P<producer>[\w\d]+)\s+'
-                        r'(?P<mac_addr>[0-9a-fA-F.:]+)\s+(?P<next_hop>[\/\.:\w\d]+\s*[\/\.:\w\d]+)\s+(?P<seq_no>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<eth_tag>\d+)\s+(?P<producer>[\w\d]+)\s+'
+                                  r'(?P<mac_addr>[0-9a-fA-F.:]+)\s+(?P<next_hop>[\/\.:\w\d]+\s*[\/\.:\w\d]+)\s+(?P<seq_no>\d+)$')
 
         #           L:101 IP:1.1.1.1
-        p3 = re.compile(r'^(?P<next_hop>[\/\.:\w\d]+\s*[\/\.:\w\d]+)$')
+        p3 = regex_engine.compile(r'^(?P<next_hop>[\/\.:\w\d]+\s*[\/\.:\w\d]+)$')
 
         parser_dict = {}
         header_found = False
@@ -2313,7 +2313,7 @@ class ShowL2routeEvpnImet(ShowL2routeEvpnImetSchema):
 
         #    2          0    BGP         3.3.3.2     6    20012         3.3.3.2            IGMP
         #    2          0  L2VPN         1.1.1.2     6    20012         1.1.1.2            IGMP
-        p1 = re.compile(r'^(?P<evi>\d+)\s+(?P<etag>\d+)\s+(?P<producer>\w+)\s+(?P<router_ip_addr>[\d\.:A-Fa-f\*]+)\s+(?P<type>\d+)\s+(?P<label>\d+)\s+(?P<tunnel_id>[\d\.:A-Fa-f\*]+)\s+(?P<mcast_proxy>[\d\w]+)$')
+        p1 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<etag>\d+)\s+(?P<producer>\w+)\s+(?P<router_ip_addr>[\d\.:A-Fa-f\*]+)\s+(?P<type>\d+)\s+(?P<label>\d+)\s+(?P<tunnel_id>[\d\.:A-Fa-f\*]+)\s+(?P<mcast_proxy>[\d\w]+)$')
 
         parser_dict = {}
 
@@ -2475,7 +2475,7 @@ class ShowL2routeEvpnMulticastSmet(ShowL2routeEvpnMulticastSmetSchema):
             cli_output = output
 
         #103   0          Et0/0:103            227.1.1.1       N/A        (*)IGMPv2
-        p1 = re.compile(r'^(?P<evi>\d+)\s+(?P<etag>\d+)\s+(?P<origin>[\d\.:\w\*\/]+)\s+(?P<group>[\d\.:A-Fa-f\*]+)\s+(?P<filter>[\w\/]+)\s+(?P<source>[\w*()]+)$')
+        p1 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<etag>\d+)\s+(?P<origin>[\d\.:\w\*\/]+)\s+(?P<group>[\d\.:A-Fa-f\*]+)\s+(?P<filter>[\w\/]+)\s+(?P<source>[\w*()]+)$')
 
         parser_dict = {}
 
@@ -2606,7 +2606,7 @@ class ShowL2routeEvpnMulticastRoute(ShowL2routeEvpnMulticastRouteschema):
 
         #100   100        224.1.1.1       *               V:101 227.1.1.1, Et0/3:100, Et0/3:200, Et0/1:100, Et0/1:200
         #100   100        224.1.1.1       172.1.1.1       V:101 227.1.1.1, Et0/2:100, Et0/3:200, Et0/1:100, Et0/1:200
-        p1 = re.compile(r'^(?P<evi>\d+)\s+(?P<etag>\d+)\s+(?P<group>[\d\.:A-Fa-f\*]+)\s+(?P<source>[\d\.:A-Fa-f\*]+)\s+(?P<next_hops>[\w\/\s\.\(\)\&,:-]+)$')
+        p1 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<etag>\d+)\s+(?P<group>[\d\.:A-Fa-f\*]+)\s+(?P<source>[\d\.:A-Fa-f\*]+)\s+(?P<next_hops>[\w\/\s\.\(\)\&,:-]+)$')
 
         parser_dict = {}
 
@@ -2729,8 +2729,8 @@ class ShowL2routeEvpnEs(ShowL2routeEvpnEsschema):
         #0034.3434.3434.3434.3434   10.0.0.13       BGP     V:0 10.0.0.13          0
         #01F4.BD9E.EBB1.8000.0600   10.0.0.14       L2VPN             Po6          0
         
-        p1 = re.compile(r'^(?P<esi>[0-9a-fA-F\.]+)\s+(?P<orig_rtr>[0-9a-fA-F.:]+)\s+(?P<producer>\w+)\s+'
-                        r'(?P<l2vni_id>V:\d+)?\s+(?P<next_hop>([0-9a-fA-F.:]+)|([\w\/\.\-\:]+))\s+(?P<nfn_bitmap>[0-9a-fA-F]+)$')
+        p1 = regex_engine.compile(r'^(?P<esi>[0-9a-fA-F\.]+)\s+(?P<orig_rtr>[0-9a-fA-F.:]+)\s+(?P<producer>\w+)\s+'
+                                  r'(?P<l2vni_id>V:\d+)?\s+(?P<next_hop>([0-9a-fA-F.:]+)|([\w\/\.\-\:]+))\s+(?P<nfn_bitmap>[0-9a-fA-F]+)$')
 
         parser_dict = {}
         for line in cli_output.splitlines():
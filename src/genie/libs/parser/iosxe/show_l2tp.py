@@ -1,10 +1,10 @@
 """
 show_l2tp.py
 """
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowL2tpTunnelSchema(MetaParser):
@@ -49,15 +49,15 @@ class ShowL2tpTunnel(ShowL2tpTunnelSchema):
         var=1
 
         # L2TP Tunnel Information Total tunnels 1 sessions 16
-        p1 = re.compile(r'L2TP\s+Tunnel\s+Information\s+Total\s+tunnels\s+(?P<total_tunnels>\d+)\s+sessions\s+(?P<sessions>\d+)')
+        p1 = regex_engine.compile(r'L2TP\s+Tunnel\s+Information\s+Total\s+tunnels\s+(?P<total_tunnels>\d+)\s+sessions\s+(?P<sessions>\d+)')
 
         # LocTunID   RemTunID   Remote Name   State  Remote Address  Sessn L2TP Class/
         # 11367      26859      LAC           est    99.1.1.1        16    airtel
         # 2311074340 2784131943 fsw-TSN-2     est    150.0.0.1       1      l2tp_default_class
-        p2 = re.compile(r'^(?P<loc_tunnel_id>\d+)\s+(?P<rem_tunnel_id>\d+)\s+(?P<remote_name>\S+)\s+(?P<state>\S+)\s+(?P<remote_address>\d+\.\d+\.\d+\.\d+)\s+(?P<sessions>\d+)\s+(?P<l2tp_class>\S+)(?:\s*|$)')
+        p2 = regex_engine.compile(r'^(?P<loc_tunnel_id>\d+)\s+(?P<rem_tunnel_id>\d+)\s+(?P<remote_name>\S+)\s+(?P<state>\S+)\s+(?P<remote_address>\d+\.\d+\.\d+\.\d+)\s+(?P<sessions>\d+)\s+(?P<l2tp_class>\S+)(?:\s*|$)')
         
         #%%No active L2TP tunnels
-        p3=re.compile(r'^%%(?P<no_active_tunnels>(No\s+active\s+L2TP\s+tunnels))$')
+        p3=regex_engine.compile(r'^%%(?P<no_active_tunnels>(No\s+active\s+L2TP\s+tunnels))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -133,16 +133,16 @@ class ShowL2tpSessionPacketsSuperParser(ShowL2tpSessionPacketsSchema):
         index = 1
 
         # L2TP Session Information Total tunnels 8000 sessions 8000
-        p1 = re.compile(r'L2TP\s+Session\s+Information\s+Total\s+tunnels\s+(?P<total_tunnels>\d+)\s+sessions\s+(?P<total_sessions>\d+)')
+        p1 = regex_engine.compile(r'L2TP\s+Session\s+Information\s+Total\s+tunnels\s+(?P<total_tunnels>\d+)\s+sessions\s+(?P<total_sessions>\d+)')
 
         # LocID      RemID      TunID      Pkts-In    Pkts-Out   Bytes-In   Bytes-Out
         # 507155526  4194000749 609164     182805     183322     181342560  182588712
-        p2 = re.compile(r'^(?P<loc_id>\d+)\s+(?P<rem_id>\d+)\s+(?P<tunnel_id>\w+)\s+'
-                        r'(?P<packets_in>\w+)\s+(?P<packets_out>\w+)\s+'
-                        r'(?P<bytes_in>\w+)\s+(?P<bytes_out>\w+)$')
+        p2 = regex_engine.compile(r'^(?P<loc_id>\d+)\s+(?P<rem_id>\d+)\s+(?P<tunnel_id>\w+)\s+'
+                                  r'(?P<packets_in>\w+)\s+(?P<packets_out>\w+)\s+'
+                                  r'(?P<bytes_in>\w+)\s+(?P<bytes_out>\w+)$')
 
         #%%No active L2TP tunnels
-        p3=re.compile(r'^%%(?P<no_active_tunnels>(No\s+active\s+L2TP\s+tunnels))$')
+        p3=regex_engine.compile(r'^%%(?P<no_active_tunnels>(No\s+active\s+L2TP\s+tunnels))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -191,9 +191,6 @@ Copyright (c) 2024 by Cisco Systems, Inc.
 All rights reserved.
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -206,6 +203,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          ListOf
 from genie.parsergen import oper_fill_tabular
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ====================================
@@ -276,41 +274,41 @@ class ShowBridgeDomain(ShowBridgeDomainSchema):
 
         # initial regexp pattern
         # Bridge-domain 2051 (2 ports in all)
-        p1 = re.compile(r'^Bridge-domain +(?P<bridge_domain>\d+) +\((?P<number_of_ports_in_all>\d+) +ports +in +all\)$')
+        p1 = regex_engine.compile(r'^Bridge-domain +(?P<bridge_domain>\d+) +\((?P<number_of_ports_in_all>\d+) +ports +in +all\)$')
 
         # State: UP                    Mac learning: Enabled
-        p2 = re.compile(r'^State: +(?P<state>\w+) +Mac +learning: +(?P<mac_learning_state>\w+)$')
+        p2 = regex_engine.compile(r'^State: +(?P<state>\w+) +Mac +learning: +(?P<mac_learning_state>\w+)$')
 
         # Aging-Timer: 3600 second(s)
-        p3 = re.compile(r'^Aging-Timer: +(?P<aging_timer>\d+) +second\(s\)$')
+        p3 = regex_engine.compile(r'^Aging-Timer: +(?P<aging_timer>\d+) +second\(s\)$')
 
         # Load for five secs: 10%/1%; one minute: 11%; five minutes: 12%
-        p4 = re.compile(r'^Load +for.*$')
+        p4 = regex_engine.compile(r'^Load +for.*$')
 
         # Time source is NTP, 19:54:46.940 EST Wed Nov 2 2016
-        p4_1 = re.compile(r'^Time +source.*$')
+        p4_1 = regex_engine.compile(r'^Time +source.*$')
 
         # AED MAC address    Policy  Tag       Age  Pseudoport
-        p4_2 = re.compile(r'^AED +MAC +address +Policy +Tag +Age +Pseudoport$')
+        p4_2 = regex_engine.compile(r'^AED +MAC +address +Policy +Tag +Age +Pseudoport$')
 
         # 1 ports belonging to split-horizon group 0
-        p5 = re.compile(r'^(?P<num_of_ports>\d+) +ports +belonging +to +(?P<port_belonging_group>[\w\-\d]+) +group +(?P<group_number>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<num_of_ports>\d+) +ports +belonging +to +(?P<port_belonging_group>[\w\-\d]+) +group +(?P<group_number>\d+)$')
 
         #     vfi VPLS-2051 neighbor 10.120.202.64 2051
         #     Port-channel1 service instance 2051 (split-horizon)
         #     GigabitEthernet0/0/3 service instance 3051 (split-horizon)
         #    -   000C.29FF.4971 forward static_r  0    OCE_PTR:0xe8e5dda0
-        p6 = re.compile(r'^(?P<member_port>[\w\d\-\/\s\.:]+)( +\(.*\))?$')
+        p6 = regex_engine.compile(r'^(?P<member_port>[\w\d\-\/\s\.:]+)( +\(.*\))?$')
 
         #    AED MAC address    Policy  Tag       Age  Pseudoport
         #    0   0000.A0FF.0027 forward dynamic   3142 Port-channel1.EFP2051
         #    0   0000.A0FF.00F2 forward dynamic   3438 GigabitEthernet0/0/3.EFP3051
         #    -   000C.29FF.4971 forward static_r  0    OCE_PTR:0xe8e5dda0
-        p7 = re.compile(r'^(?P<aed>[\d-]+) +(?P<mac_address>[\w\d\.]+) +(?P<policy>\w+) +(?P<tag>\w+)'
-                         r' +(?P<age>\d+) +(?P<pseudoport>[\w\d\-\.\/:]+)$')
+        p7 = regex_engine.compile(r'^(?P<aed>[\d-]+) +(?P<mac_address>[\w\d\.]+) +(?P<policy>\w+) +(?P<tag>\w+)'
+                                   r' +(?P<age>\d+) +(?P<pseudoport>[\w\d\-\.\/:]+)$')
 
         # Number of lines which match regexp = 32000
-        p8 = re.compile(r'^Number +of +lines +which +match +regexp += +(?P<lines_match_regexp>\d+)$')
+        p8 = regex_engine.compile(r'^Number +of +lines +which +match +regexp += +(?P<lines_match_regexp>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -484,78 +482,78 @@ class ShowEthernetServiceInstanceDetail(ShowEthernetServiceInstanceDetailSchema)
         final_dict = {}
         # initial regexp pattern
         # Service Instance ID: 2051
-        p1 = re.compile(r'^Service +Instance +ID: +(?P<service_id>\d+)$')
+        p1 = regex_engine.compile(r'^Service +Instance +ID: +(?P<service_id>\d+)$')
 
         # Service Instance Type: Static
         # Service instance type: L2Context
-        p2 = re.compile(r'^Service +(i|I)nstance +(t|T)ype: +(?P<service_instance_type>\S+)$')
+        p2 = regex_engine.compile(r'^Service +(i|I)nstance +(t|T)ype: +(?P<service_instance_type>\S+)$')
 
         # Description: xxx
         # Description: Fiber Connexion to XXX-111-1111
-        p3 = re.compile(r'^Description: +(?P<description>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Description: +(?P<description>[\S\s]+)$')
 
         # Associated Interface: GigabitEthernet0/0/3
-        p4 = re.compile(r'^Associated +Interface: +(?P<associated_interface>[\w\d\-\.\/]+)$')
+        p4 = regex_engine.compile(r'^Associated +Interface: +(?P<associated_interface>[\w\d\-\.\/]+)$')
 
         # Associated EVC:
-        p5 = re.compile(r'^Associated +EVC: +(?P<associated_evc>\S+)$')
+        p5 = regex_engine.compile(r'^Associated +EVC: +(?P<associated_evc>\S+)$')
 
         # L2protocol drop
-        p6 = re.compile(r'^L2protocol +drop$')
+        p6 = regex_engine.compile(r'^L2protocol +drop$')
 
         # CE-Vlans: 10-20
-        p7 = re.compile(r'^CE-Vlans: +(?P<vlans>\S+)$')
+        p7 = regex_engine.compile(r'^CE-Vlans: +(?P<vlans>\S+)$')
 
         # Encapsulation: dot1q 2051 vlan protocol type 0x8100
-        p8 = re.compile(r'^Encapsulation: +(?P<encapsulation>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^Encapsulation: +(?P<encapsulation>[\S\s]+)$')
 
         # Rewrite: egress tag translate 1-to-1 dot1q 2051 vlan-type 0x8100
-        p9 = re.compile(r'^Rewrite: +(?P<rewrite>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^Rewrite: +(?P<rewrite>[\S\s]+)$')
 
         # Interface Dot1q Tunnel Ethertype: 0x8100
-        p10 = re.compile(r'^Interface Dot1q Tunnel Ethertype: +(?P<dot1q_tunnel_ethertype>\S+)$')
+        p10 = regex_engine.compile(r'^Interface Dot1q Tunnel Ethertype: +(?P<dot1q_tunnel_ethertype>\S+)$')
 
         # State: Up
-        p11 = re.compile(r'^State: +(?P<state>\w+)$')
+        p11 = regex_engine.compile(r'^State: +(?P<state>\w+)$')
 
         # EFP Statistics:
-        p12 = re.compile(r'^EFP Statistics:$')
+        p12 = regex_engine.compile(r'^EFP Statistics:$')
 
         #    Pkts In   Bytes In   Pkts Out  Bytes Out
         #          0          0          0          0
-        p13 = re.compile(r'^(?P<pkts_in>\d+) +(?P<bytes_in>\d+) +(?P<pkts_out>\d+) +(?P<bytes_out>\d+)$')
+        p13 = regex_engine.compile(r'^(?P<pkts_in>\d+) +(?P<bytes_in>\d+) +(?P<pkts_out>\d+) +(?P<bytes_out>\d+)$')
 
         # Intiators: unclassified vlan
-        p14 = re.compile(r'^Intiators: +(?P<intiators>[\S\s]+)$')
+        p14 = regex_engine.compile(r'^Intiators: +(?P<intiators>[\S\s]+)$')
 
         # Control policy: ABC
-        p15 = re.compile(r'^Control +policy: +(?P<control_policy>[\S\s]+)$')
+        p15 = regex_engine.compile(r'^Control +policy: +(?P<control_policy>[\S\s]+)$')
 
         # 1   Static GigabitEthernet0/0/3       Up
-        p16 = re.compile(r'^(?P<service_id>\d+) +(?P<service_instance_type>\w+) +'
+        p16 = regex_engine.compile(r'^(?P<service_id>\d+) +(?P<service_instance_type>\w+) +'
             r'(?P<associated_interface>\S+) +(?P<state>\w+)( +(?P<vlans>\S+))?$')
 
         # Microblock type: Storm-Control
-        p17 = re.compile(r'^Microblock +type: +(?P<micro_block_type>[\S ]+)$')
+        p17 = regex_engine.compile(r'^Microblock +type: +(?P<micro_block_type>[\S ]+)$')
 
         # storm-control unicast cir 8001
         # storm-control broadcast cir 8001
         # storm-control multicast cir 8001
-        p18 = re.compile(r'^(?P<key>storm-control +\S+ +\S+) +(?P<val>\d+)$')
+        p18 = regex_engine.compile(r'^(?P<key>storm-control +\S+ +\S+) +(?P<val>\d+)$')
 
         # Load for five secs: 2%/0%; one minute: 5%; five minutes: 4%
-        p19 = re.compile(r'^Load +for +\w+ +\w+: [\S ]+$')
+        p19 = regex_engine.compile(r'^Load +for +\w+ +\w+: [\S ]+$')
 
         # L2 ACL (inbound): test-acl
-        p20 = re.compile(r'^L2 +ACL +\((?P<key>\w+)\): +(?P<val>\S+)$')
+        p20 = regex_engine.compile(r'^L2 +ACL +\((?P<key>\w+)\): +(?P<val>\S+)$')
 
         # L2 ACL permit count: 10255
         # L2 ACL deny count: 53
-        p21 = re.compile(r'^L2 +ACL +(?P<key>(permit|deny) +count): +(?P<val>\d+)$')
+        p21 = regex_engine.compile(r'^L2 +ACL +(?P<key>(permit|deny) +count): +(?P<val>\d+)$')
 
         # Bridge-domain: 12-1900
         # L2 Multicast GID: 9
-        p22 = re.compile(r'^(?P<key>[\S+ ]+): +(?P<val>\S+)$')
+        p22 = regex_engine.compile(r'^(?P<key>[\S+ ]+): +(?P<val>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -818,20 +816,20 @@ class ShowEthernetServiceInstanceStats(ShowEthernetServiceInstanceStatsSchema):
 
         # initial regexp pattern
         # System maximum number of service instances: 32768
-        p1 = re.compile(r'^\S+ +maximum +number +of +service +instances: +(?P<max_num_of_service_instances>\d+)$')
+        p1 = regex_engine.compile(r'^\S+ +maximum +number +of +service +instances: +(?P<max_num_of_service_instances>\d+)$')
 
         # Service Instance 2051, Interface GigabitEthernet0/0/3
-        p2 = re.compile(r'^Service +Instance +(?P<service_instance>\d+), Interface +(?P<interface>\S+)$')
+        p2 = regex_engine.compile(r'^Service +Instance +(?P<service_instance>\d+), Interface +(?P<interface>\S+)$')
 
         #    Pkts In   Bytes In   Pkts Out  Bytes Out
         #          0          0          0          0
-        p3 = re.compile(r'^(?P<pkts_in>\d+) +(?P<bytes_in>\d+) +(?P<pkts_out>\d+) +(?P<bytes_out>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<pkts_in>\d+) +(?P<bytes_in>\d+) +(?P<pkts_out>\d+) +(?P<bytes_out>\d+)$')
 
         # default:0            default:0            default:0
         # cos 0:0              cos 0:0              cos 0:0
-        p4 = re.compile(r'^(?P<broadcast_key>(default)|(\w+ +\d+)):(?P<broadcast_value>\d+) +'
-                r'(?P<multicast_key>(default)|(\w+ +\d+)):(?P<multicast_value>\d+) +'
-                r'(?P<unknown_unicast_key>(default)|(\w+ +\d+)):(?P<unknown_unicast_value>\d+)$')
+        p4 = regex_engine.compile(r'^(?P<broadcast_key>(default)|(\w+ +\d+)):(?P<broadcast_value>\d+) +'
+                          r'(?P<multicast_key>(default)|(\w+ +\d+)):(?P<multicast_value>\d+) +'
+                          r'(?P<unknown_unicast_key>(default)|(\w+ +\d+)):(?P<unknown_unicast_value>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -915,11 +913,11 @@ class ShowEthernetServiceInstanceSummary(ShowEthernetServiceInstanceSummarySchem
 
         # initial regexp pattern
         # System summary
-        p1 = re.compile(r'^System +summary$')
+        p1 = regex_engine.compile(r'^System +summary$')
 
         # Associated interface: GigabitEthernet0/0/3
         # Associated interface: Port-channel1
-        p2 = re.compile(r'^Associated +interface: +(?P<interface>[\w\d\/\.\-]+)$')
+        p2 = regex_engine.compile(r'^Associated +interface: +(?P<interface>[\w\d\/\.\-]+)$')
 
         #             Total       Up  AdminDo     Down  ErrorDi  Unknown  Deleted  BdAdmDo
         # bdomain         0        0        0        0        0        0        0        0
@@ -927,9 +925,9 @@ class ShowEthernetServiceInstanceSummary(ShowEthernetServiceInstanceSummarySchem
         # local sw        0        0        0        0        0        0        0        0
         # other         201      201        0        0        0        0        0        0
         # all           201      201        0        0        0        0        0        0
-        p3 = re.compile(r'^(?P<service>[\w\s\d]+) +(?P<total>\d+) +(?P<up>\d+)'
-                         r' +(?P<admin_do>\d+) +(?P<down>\d+) +(?P<error_di>\d+)'
-                         r' +(?P<unknown>\d+) +(?P<deleted>\d+) +(?P<bd_adm_do>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<service>[\w\s\d]+) +(?P<total>\d+) +(?P<up>\d+)'
+                                   r' +(?P<admin_do>\d+) +(?P<down>\d+) +(?P<error_di>\d+)'
+                                   r' +(?P<unknown>\d+) +(?P<deleted>\d+) +(?P<bd_adm_do>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1029,49 +1027,49 @@ class ShowL2vpnVfi(ShowL2vpnVfiSchema):
 
         # VFI name: VPLS-2051, state: up, type: multipoint, signaling: BGP
         # VFI name: serviceCore1, State: UP, Signaling Protocol: LDP
-        p1 = re.compile(r'^VFI +name: +(?P<vfi>[\w\d\-]+), +[S|s]tate:'
-                         r' +(?P<state>\w+)(, type: +(?P<type>\w+))?,'
-                         r' +[S|s]ignaling( Protocol)?: +(?P<signaling>\w+)$')
+        p1 = regex_engine.compile(r'^VFI +name: +(?P<vfi>[\w\d\-]+), +[S|s]tate:'
+                                   r' +(?P<state>\w+)(, type: +(?P<type>\w+))?,'
+                                   r' +[S|s]ignaling( Protocol)?: +(?P<signaling>\w+)$')
 
         #   VPN ID: 2051, VE-ID: 2, VE-SIZE: 10
         #   VPN ID: 2000
-        p2 = re.compile(r'^VPN +ID: +(?P<vpn_id>\d+)(, +VE-ID: +(?P<ve_id>\d+),'
-                         r' VE-SIZE: +(?P<ve_range>\d+))?$')
+        p2 = regex_engine.compile(r'^VPN +ID: +(?P<vpn_id>\d+)(, +VE-ID: +(?P<ve_id>\d+),'
+                                   r' VE-SIZE: +(?P<ve_range>\d+))?$')
 
         #   VPN ID: 100, VPLS-ID: 9:10, Bridge-domain vlan: 100
-        p2_1 = re.compile(r'^VPN +ID: +(?P<vpn_id>\d+), +VPLS-ID: +(?P<vpls_id>\S+),'
-                         r' Bridge-domain +vlan: +(?P<bridge_domain_vlan>\d+)$')
+        p2_1 = regex_engine.compile(r'^VPN +ID: +(?P<vpn_id>\d+), +VPLS-ID: +(?P<vpls_id>\S+),'
+                                   r' Bridge-domain +vlan: +(?P<bridge_domain_vlan>\d+)$')
 
         #   RD: 65109:2051, RT: 65109:2051, 65109:2051,
         #   RD: 9:10, RT: 10.10.10.10:150
-        p3 = re.compile(r'^RD: +(?P<rd>[\d\:]+), +RT: +(?P<rt>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^RD: +(?P<rd>[\d\:]+), +RT: +(?P<rt>[\S\s]+)$')
 
         #   Bridge-Domain 2051 attachment circuits:
-        p4 = re.compile(r'^Bridge-Domain +(?P<bd_id>\d+)'
-                         r' +attachment +circuits:( +(?P<attachment_circuits>[\S\s]+))?$')
+        p4 = regex_engine.compile(r'^Bridge-Domain +(?P<bd_id>\d+)'
+                                   r' +attachment +circuits:( +(?P<attachment_circuits>[\S\s]+))?$')
 
         #   Pseudo-port interface: pseudowire100001
-        p5 = re.compile(r'^Pseudo-port +[I|i]nterface: +(?P<pseudo_port_interface>\S+)$')
+        p5 = regex_engine.compile(r'^Pseudo-port +[I|i]nterface: +(?P<pseudo_port_interface>\S+)$')
 
         #   Interface          Peer Address    VE-ID  Local Label  Remote Label    S
         #   pseudowire100202   10.120.202.64    1      16           327810          Y
-        p6 = re.compile(r'^(?P<pw_intf>\S+) +(?P<pw_peer_id>[\d\.]+)'
-                         r' +(?P<ve_id>\d+) +(?P<local_label>\d+) +(?P<remote_label>\d+) +(?P<split_horizon>\w+)$')
+        p6 = regex_engine.compile(r'^(?P<pw_intf>\S+) +(?P<pw_peer_id>[\d\.]+)'
+                                   r' +(?P<ve_id>\d+) +(?P<local_label>\d+) +(?P<remote_label>\d+) +(?P<split_horizon>\w+)$')
 
         # Interface          Peer Address     VC ID        S
         # pseudowire3        10.64.4.4        14           Y
         # pseudowire2        10.36.3.3        13           Y
         # pseudowire1        10.16.2.2        12           Y
-        p6_1 = re.compile(r'^(?P<pw_intf>\S+) +(?P<pw_peer_id>[\d\.]+)'
-                         r' +(?P<vc_id>\d+) +(?P<split_horizon>\w+)$')
+        p6_1 = regex_engine.compile(r'^(?P<pw_intf>\S+) +(?P<pw_peer_id>[\d\.]+)'
+                                   r' +(?P<vc_id>\d+) +(?P<split_horizon>\w+)$')
 
         # Interface    Peer Address    VC ID      Discovered Router ID   Next Hop
         # Pw2000       10.0.0.1        10         10.0.0.1               10.0.0.1
         # Pw2001       10.0.0.2        10         10.1.1.2               10.0.0.2
         # Pw2002       10.0.0.3        10         10.1.1.3               10.0.0.3
         # Pw5          10.0.0.4        10         -                      10.0.0.4
-        p6_2 = re.compile(r'^(?P<pw_intf>\S+) +(?P<pw_peer_id>[\d\.]+)'
-                         r' +(?P<vc_id>\d+) +(?P<discovered_router_id>[\d\.\-]+) +(?P<next_hop>\S+)$')
+        p6_2 = regex_engine.compile(r'^(?P<pw_intf>\S+) +(?P<pw_peer_id>[\d\.]+)'
+                                   r' +(?P<vc_id>\d+) +(?P<discovered_router_id>[\d\.\-]+) +(?P<next_hop>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1277,18 +1275,18 @@ class ShowL2vpnServiceAll(ShowL2vpnServiceAllSchema):
         # XC name: serviceWire1, State: UP
         # VPWS name: Gi1/1/1-1001, State: UP
         # VPWS name: Gi3-SI:2842, State: UP
-        p1 = re.compile(r'^\w+ +name: +(?P<name>[\w\d\-\/:]+), +State: +(?P<state>\w+)$')
+        p1 = regex_engine.compile(r'^\w+ +name: +(?P<name>[\w\d\-\/:]+), +State: +(?P<state>\w+)$')
 
         #   pw100214           core_pw     1:2051(MPLS)                    0     UP  UP
         #   pw100001                       VPLS-2051(VFI)                  0     UP  UP
         #   Eth2/1:20          access_conn EVC 55                  0     UP  UP
         #   Pw2                core        MPLS 10.144.6.6:200        1     SB  IA
         #   Te0/1/3                        Te0/1/3:1900(Eth VLAN)          0     UP  UP
-        p2 = re.compile(r'^(?P<pw_intf>\S+)( +(?P<group>\S+))? +(?P<encapsulation>\S+(?:\s\S+|\(.+\))) +(?P<priority>\d+) +(?P<intf_state>\w+) +(?P<state_in_l2vpn_service>[\w\-]+)$')
+        p2 = regex_engine.compile(r'^(?P<pw_intf>\S+)( +(?P<group>\S+))? +(?P<encapsulation>\S+(?:\s\S+|\(.+\))) +(?P<priority>\d+) +(?P<intf_state>\w+) +(?P<state_in_l2vpn_service>[\w\-]+)$')
 
         #   Description: none
         #   Description: Any_String
-        p3 = re.compile(r'^\s*Description:\s+(?P<description>\S+)')
+        p3 = regex_engine.compile(r'^\s*Description:\s+(?P<description>\S+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1377,25 +1375,25 @@ class ShowL2vpnVfiNameDetail(ShowL2vpnVfiNameDetailSchema):
         ret_dict = {}
 
         #VFI name: vpls, state: up, type: multipoint, signaling: LDP
-        p1 = re.compile(r'VFI name: +(?P<vfi_name>\w+)\, +'
-                    r'state: +(?P<state>\w+)\, +'
-                    r'type: +(?P<type>\w+)\, +'
-                    r'signaling: +(?P<signaling>\w+)')
+        p1 = regex_engine.compile(r'VFI name: +(?P<vfi_name>\w+)\, +'
+                              r'state: +(?P<state>\w+)\, +'
+                              r'type: +(?P<type>\w+)\, +'
+                              r'signaling: +(?P<signaling>\w+)')
 
         #VPN ID: 1000
-        p2 = re.compile(r'VPN ID: +(?P<vpn_id>\d+)')
+        p2 = regex_engine.compile(r'VPN ID: +(?P<vpn_id>\d+)')
 
         #Bridge-Domain 1000 attachment circuits:
-        p3 = re.compile(r'Bridge-Domain +(?P<bridge_domain>\d+)')
+        p3 = regex_engine.compile(r'Bridge-Domain +(?P<bridge_domain>\d+)')
 
         #Pseudo-port interface: pseudowire100007
-        p4 = re.compile(r'Pseudo-port interface\: +(?P<pseudo_port_intf>\S+)')
+        p4 = regex_engine.compile(r'Pseudo-port interface\: +(?P<pseudo_port_intf>\S+)')
 
         #pseudowire22       192.168.255.3    1000         Y
-        p5 = re.compile(r'(?P<interface>\S+) +'
-                    r'(?P<addr>([0-9]+\.){3}[0-9]+) +'
-                    r'(?P<vc_id>\d+) +'
-                    r'(?P<s>\w)')
+        p5 = regex_engine.compile(r'(?P<interface>\S+) +'
+                              r'(?P<addr>([0-9]+\.){3}[0-9]+) +'
+                              r'(?P<vc_id>\d+) +'
+                              r'(?P<s>\w)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1476,21 +1474,21 @@ class ShowVfiName(ShowVfiNameSchema):
         ret_dict = {}
 
         #VFI name: vpls, state: up, type: multipoint, signaling: LDP
-        p1 = re.compile(r'VFI name: +(?P<vfi_name>\w+)\, +'
-                    r'state: +(?P<state>\w+)\, +'
-                    r'type: +(?P<type>\w+)\, +'
-                    r'signaling: +(?P<signaling>\w+)')
+        p1 = regex_engine.compile(r'VFI name: +(?P<vfi_name>\w+)\, +'
+                              r'state: +(?P<state>\w+)\, +'
+                              r'type: +(?P<type>\w+)\, +'
+                              r'signaling: +(?P<signaling>\w+)')
 
         #VPN ID: 1000
-        p2 = re.compile(r'VPN ID: +(?P<vpn_id>\d+)')
+        p2 = regex_engine.compile(r'VPN ID: +(?P<vpn_id>\d+)')
 
         #Bridge-Domain 1000 attachment circuits:
-        p3 = re.compile(r'Bridge-Domain +(?P<bridge_domain>\d+)')
+        p3 = regex_engine.compile(r'Bridge-Domain +(?P<bridge_domain>\d+)')
 
         #192.168.255.3    1000         Y
-        p4 = re.compile(r'(?P<addr>([0-9]+\.){3}[0-9]+) +'
-                    r'(?P<vc_id>\d+) +'
-                    r'(?P<s>\w)')
+        p4 = regex_engine.compile(r'(?P<addr>([0-9]+\.){3}[0-9]+) +'
+                              r'(?P<vc_id>\d+) +'
+                              r'(?P<s>\w)')
 
         peer_count=1
         for line in out.splitlines():
@@ -1581,49 +1579,49 @@ class ShowL2vpnEvpnEthernetSegmentDetail(ShowL2vpnEvpnEthernetSegmentDetailSchem
             cli_output = output
 
         # EVPN Ethernet Segment ID: 03AA.BB00.0000.0200.0001
-        p1 = re.compile(r'^EVPN +Ethernet +Segment +ID: +(?P<eth_seg>[0-9a-fA-F\.]+)$')
+        p1 = regex_engine.compile(r'^EVPN +Ethernet +Segment +ID: +(?P<eth_seg>[0-9a-fA-F\.]+)$')
 
         # Interface:              Po1
         # Interface:              pw100002 pw100003 pw100005 pw100006
-        p2 = re.compile(r'^Interface: +(?P<intf>.*)$')
+        p2 = regex_engine.compile(r'^Interface: +(?P<intf>.*)$')
 
         # Redundancy mode:        all-active
-        p3 = re.compile(r'^Redundancy +mode: +(?P<redundancy_mode>[a-z\-]+)$')
+        p3 = regex_engine.compile(r'^Redundancy +mode: +(?P<redundancy_mode>[a-z\-]+)$')
 
         # DF election wait time:  3 seconds
-        p4 = re.compile(r'^DF +election +wait +time: +(?P<df_time>[0-9]+) +seconds$')
+        p4 = regex_engine.compile(r'^DF +election +wait +time: +(?P<df_time>[0-9]+) +seconds$')
 
         # Split Horizon label:    16
-        p5 = re.compile(r'^Split +Horizon +label: +(?P<sh_label>\d+)$')
+        p5 = regex_engine.compile(r'^Split +Horizon +label: +(?P<sh_label>\d+)$')
 
         # State:                  Ready
         # State:                  Port Down
-        p6 = re.compile(r'^State: +(?P<state>[\w\(\): ]+)$')
+        p6 = regex_engine.compile(r'^State: +(?P<state>[\w\(\): ]+)$')
 
         # Encapsulation:          mpls
-        p7 = re.compile(r'^Encapsulation: +(?P<encap_type>\w+)$')
+        p7 = regex_engine.compile(r'^Encapsulation: +(?P<encap_type>\w+)$')
 
         # Ordinal:                1
         # Ordinal:                Not available
-        p8 = re.compile(r'^Ordinal: +(?P<ordinal>[\d\w ]+)$')
+        p8 = regex_engine.compile(r'^Ordinal: +(?P<ordinal>[\d\w ]+)$')
 
         # Core Isolation:         No
         # Core Isolation:         Yes (error disable)
-        p9 = re.compile(r'^Core +Isolation: +(?P<core_iso>[\w\(\) ]+)$')
+        p9 = regex_engine.compile(r'^Core +Isolation: +(?P<core_iso>[\w\(\) ]+)$')
 
         # RD:                     4.4.4.3:1
         # RD:                     Not set
-        p10 = re.compile(r'^RD: +(?P<rd>[0-9\.:\w ]+)$')
+        p10 = regex_engine.compile(r'^RD: +(?P<rd>[0-9\.:\w ]+)$')
 
         # Export-RTs:           100:2
-        p11 = re.compile(r'^Export-RTs: +(?P<export_rt>[0-9: ]+)$')
+        p11 = regex_engine.compile(r'^Export-RTs: +(?P<export_rt>[0-9: ]+)$')
 
         #                       1:12 1:13 1:14 1:21 1:22
-        p11_1 = re.compile(r'^(?P<export_rt>[0-9: ]+)$')
+        p11_1 = regex_engine.compile(r'^(?P<export_rt>[0-9: ]+)$')
 
         # Forwarder List:         3.3.3.3 4.4.4.3
         # Forwarder List:
-        p12 = re.compile(r'^Forwarder +List: *(?P<fwd>[0-9\. ]*)$')
+        p12 = regex_engine.compile(r'^Forwarder +List: *(?P<fwd>[0-9\. ]*)$')
 
         parser_dict = {}
 
@@ -1783,7 +1781,7 @@ class ShowL2vpnEvpnEthernetSegment(ShowL2vpnEvpnEthernetSegmentSchema):
             cli_output = output
 
         #03AA.AABB.BBCC.CC00.0001 Et0/2      single-active   3       16
-        p1 = re.compile(r'^(?P<esi>(\w+\.\w+\.\w+\.\w+\.\w+)) +(?P<port>\S+) +(?P<redundancy_mode>\S+) +(?P<df_time>\S+) +(?P<sh_label>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<esi>(\w+\.\w+\.\w+\.\w+\.\w+)) +(?P<port>\S+) +(?P<redundancy_mode>\S+) +(?P<df_time>\S+) +(?P<sh_label>\S+)$')
         parser_dict = {}
 
         if not cli_output:
@@ -1840,7 +1838,7 @@ class ShowL2vpnEvpnMultihomingVlan(ShowL2vpnEvpnMultihomingVlanSchema):
             output = self.device.execute(self.cli_command)
 
         #200   00AA.AAAA.AAAA.AAAA.AAAA FastEthernet0/0/1
-        p1 = re.compile(r'^(?P<vlan>(\d+)) +(?P<esi>\S+) +(?P<switchport>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<vlan>(\d+)) +(?P<esi>\S+) +(?P<switchport>\S+)$')
         parser_dict = {}
 
         for line in output.splitlines():
@@ -2005,9 +2003,9 @@ class ShowL2vpnEvpnMac(ShowL2vpnEvpnMacSchema):
         # aabb.cc02.2800 2     12    03AA.BB00.0000.0200.0001 0          3.3.3.1
         # aabb.cc82.2800 2     12    03AA.BB00.0000.0200.0001 0          Et1/0:12
         #                                                                3.3.3.1
-        p1 = re.compile(r'^MAC Address\s+EVI\s+(BD|VLAN)\s+ESI\s+Ether Tag\s+Next Hop\(s\)$')
-        p2 = re.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<esi>[0-9a-fA-F\.]+)\s+(?P<eth_tag>\d+)\s+(?P<next_hop>.+)$')
-        p3 = re.compile(r'^(?P<next_hop>.+)$')
+        p1 = regex_engine.compile(r'^MAC Address\s+EVI\s+(BD|VLAN)\s+ESI\s+Ether Tag\s+Next Hop\(s\)$')
+        p2 = regex_engine.compile(r'^(?P<mac>[0-9a-fA-F\.]+)\s+(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<esi>[0-9a-fA-F\.]+)\s+(?P<eth_tag>\d+)\s+(?P<next_hop>.+)$')
+        p3 = regex_engine.compile(r'^(?P<next_hop>.+)$')
 
         parser_dict = {}
 
@@ -2178,45 +2176,45 @@ class ShowL2vpnEvpnMacDetail(ShowL2vpnEvpnMacDetailSchema):
         # MAC Address:                aabb.0012.0002, sticky
         # MAC Address:                aabb.0012.0002 (stale)
         # MAC Address:                aabb.0012.0002, sticky (stale)
-        p1 = re.compile(r'^MAC Address:\s+(?P<mac>[0-9a-fA-F\.]+)(,?\s+(?P<mac_status>[\w\s\(\)]+))?$')
+        p1 = regex_engine.compile(r'^MAC Address:\s+(?P<mac>[0-9a-fA-F\.]+)(,?\s+(?P<mac_status>[\w\s\(\)]+))?$')
 
         # EVPN Instance:              2
-        p2 = re.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
+        p2 = regex_engine.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
 
         # Bridge Domain:              11
         # Vlan:                       11
-        p3 = re.compile(r'^(Bridge Domain|Vlan):\s+(?P<bd_id>\d+)$')
+        p3 = regex_engine.compile(r'^(Bridge Domain|Vlan):\s+(?P<bd_id>\d+)$')
 
         # Ethernet Segment:           03AA.BB00.0000.0200.0001
-        p4 = re.compile(r'^Ethernet Segment:\s+(?P<esi>[0-9a-fA-F\.]+)$')
+        p4 = regex_engine.compile(r'^Ethernet Segment:\s+(?P<esi>[0-9a-fA-F\.]+)$')
 
         # Ethernet Tag ID:            0
-        p5 = re.compile(r'^Ethernet Tag ID:\s+(?P<eth_tag>\d+)$')
+        p5 = regex_engine.compile(r'^Ethernet Tag ID:\s+(?P<eth_tag>\d+)$')
 
         # Next Hop(s):                L:17 Ethernet1/0 service instance 12
         # Next Hop(s):                V:1000111 BD-VIF1112
-        p6 = re.compile(r'^Next Hop\(s\):\s+(?P<next_hop>[\w\/\s\.:-]+)$')
+        p6 = regex_engine.compile(r'^Next Hop\(s\):\s+(?P<next_hop>[\w\/\s\.:-]+)$')
         #                             L:17 3.3.3.1
         #                             L:17 5.5.5.1
         #                             V:1000111 BD-VIF1112
-        p7 = re.compile(r'^(?P<next_hop>[\w\/\s\.:-]+)$')
+        p7 = regex_engine.compile(r'^(?P<next_hop>[\w\/\s\.:-]+)$')
 
         # Local Address:              4.4.4.1
-        p8 = re.compile(r'^Local Address:\s+(?P<local_addr>[a-zA-Z0-9\.:]+)$')
+        p8 = regex_engine.compile(r'^Local Address:\s+(?P<local_addr>[a-zA-Z0-9\.:]+)$')
 
         # Sequence Number:            0
-        p9 = re.compile(r'^Sequence Number:\s+(?P<seq_number>\d+)$')
+        p9 = regex_engine.compile(r'^Sequence Number:\s+(?P<seq_number>\d+)$')
 
         # MAC only present:           Yes
-        p10 = re.compile(r'^MAC only present:\s+(?P<mac_only_present>(Yes|No))$')
+        p10 = regex_engine.compile(r'^MAC only present:\s+(?P<mac_only_present>(Yes|No))$')
 
         # MAC Duplication Detection:  Timer not running
         # MAC Duplication Detection:  MAC moves 3, limit 5
         #                             Timer expires in 09:56:34
         # MAC Duplication Detection:  Duplicate MAC address detected
-        p11 = re.compile(r'^MAC Duplication Detection:\s+(?P<mac_dup_status>[\w\d\s,]+)$')
-        p12 = re.compile(r'^MAC moves (?P<moves_count>\d+), limit (?P<moves_limit>\d+)$')
-        p13 = re.compile(r'^Timer expires in (?P<expiry_time>[\d:]+)$')
+        p11 = regex_engine.compile(r'^MAC Duplication Detection:\s+(?P<mac_dup_status>[\w\d\s,]+)$')
+        p12 = regex_engine.compile(r'^MAC moves (?P<moves_count>\d+), limit (?P<moves_limit>\d+)$')
+        p13 = regex_engine.compile(r'^Timer expires in (?P<expiry_time>[\d:]+)$')
 
         parser_dict = {}
 
@@ -2477,14 +2475,14 @@ class ShowL2vpnEvpnMacSummary(ShowL2vpnEvpnMacSummarySchema):
         # 2     12    0          0          0          0
         #
         # Total                  1          0          0
-        p1 = re.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Remote MAC\s+Local MAC\s+Dup MAC$')
-        p2 = re.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Remote MAC$')
-        p3 = re.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Local MAC$')
-        p4 = re.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Dup MAC$')
-        p5 = re.compile(r'^(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<eth_tag>\d+)\s+(?P<remote_count>\d+)\s+(?P<local_count>\d+)\s+(?P<dup_count>\d+)$')
-        p6 = re.compile(r'^(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<eth_tag>\d+)\s+(?P<count>\d+)$')
-        p7 = re.compile(r'^Total\s+(?P<remote_count>\d+)\s+(?P<local_count>\d+)\s+(?P<dup_count>\d+)$')
-        p8 = re.compile(r'^Total\s+(?P<count>\d+)$')
+        p1 = regex_engine.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Remote MAC\s+Local MAC\s+Dup MAC$')
+        p2 = regex_engine.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Remote MAC$')
+        p3 = regex_engine.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Local MAC$')
+        p4 = regex_engine.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Dup MAC$')
+        p5 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<eth_tag>\d+)\s+(?P<remote_count>\d+)\s+(?P<local_count>\d+)\s+(?P<dup_count>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<eth_tag>\d+)\s+(?P<count>\d+)$')
+        p7 = regex_engine.compile(r'^Total\s+(?P<remote_count>\d+)\s+(?P<local_count>\d+)\s+(?P<dup_count>\d+)$')
+        p8 = regex_engine.compile(r'^Total\s+(?P<count>\d+)$')
 
         parser_dict = {}
 
@@ -2788,9 +2786,9 @@ class ShowL2vpnEvpnMacIp(ShowL2vpnEvpnMacIpSchema):
         # IP Address                EVI   BD    MAC Address    Next Hop(s)
         # ------------------------- ----- ----- -------------- -------------------------
         # 192.168.11.21             1     11    Duplicate      Et1/0:11
-        p1 = re.compile(r'^IP Address\s+EVI\s+(BD|VLAN)\s+MAC Address\s+Next Hop\(s\)$')
-        p2 = re.compile(r'^(?P<ip>[0-9a-fA-F\.:]+)\s+(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<mac>[\d\w\.]+)\s+(?P<next_hop>.+)$')
-        p3 = re.compile(r'^(?P<next_hop>.+)$')
+        p1 = regex_engine.compile(r'^IP Address\s+EVI\s+(BD|VLAN)\s+MAC Address\s+Next Hop\(s\)$')
+        p2 = regex_engine.compile(r'^(?P<ip>[0-9a-fA-F\.:]+)\s+(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<mac>[\d\w\.]+)\s+(?P<next_hop>.+)$')
+        p3 = regex_engine.compile(r'^(?P<next_hop>.+)$')
 
         parser_dict = {}
 
@@ -2997,57 +2995,57 @@ class ShowL2vpnEvpnMacIpDetail(ShowL2vpnEvpnMacIpDetailSchema):
         # IP Address:                192.168.11.21
         # IP Address:                2001:12::3
         # IP Address:                FE80::A8BB:FF:FE12:2 (stale)
-        p1 = re.compile(r'^IP Address:\s+(?P<ip>[0-9a-fA-F\.:]+)(\s+(?P<ip_status>[\w\s\(\)]+))?$')
+        p1 = regex_engine.compile(r'^IP Address:\s+(?P<ip>[0-9a-fA-F\.:]+)(\s+(?P<ip_status>[\w\s\(\)]+))?$')
 
         # EVPN Instance:             1
-        p2 = re.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
+        p2 = regex_engine.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
 
         # Bridge Domain:             11
         # Vlan:                      11
-        p3 = re.compile(r'^(Bridge Domain|Vlan):\s+(?P<bd_id>\d+)$')
+        p3 = regex_engine.compile(r'^(Bridge Domain|Vlan):\s+(?P<bd_id>\d+)$')
 
         # MAC Address:               aabb.0012.0002
-        p4 = re.compile(r'^MAC Address:\s+(?P<mac>[0-9a-fA-F\.]+)$')
+        p4 = regex_engine.compile(r'^MAC Address:\s+(?P<mac>[0-9a-fA-F\.]+)$')
 
         # Ethernet Segment:          03AA.BB00.0000.0200.0001
-        p5 = re.compile(r'^Ethernet Segment:\s+(?P<esi>[0-9a-fA-F\.]+)$')
+        p5 = regex_engine.compile(r'^Ethernet Segment:\s+(?P<esi>[0-9a-fA-F\.]+)$')
 
         # Ethernet Tag ID:           0
-        p6 = re.compile(r'^Ethernet Tag ID:\s+(?P<eth_tag>\d+)$')
+        p6 = regex_engine.compile(r'^Ethernet Tag ID:\s+(?P<eth_tag>\d+)$')
 
         # Next Hop(s):               L:17 Ethernet1/0 service instance 12
         #                            L:17 3.3.3.1
         #                            L:17 5.5.5.1
         #                            V:20011 2.2.2.2 (proxy)
         #                            V:20011 Ethernet0/1 service instance 11 (proxy)
-        p7 = re.compile(r'^Next Hop\(s\):\s+(?P<next_hop>[\w\/\s\.\(\):-]+)$')
-        p8 = re.compile(r'^(?P<next_hop>[\w\/\s\.\(\):-]+)$')
+        p7 = regex_engine.compile(r'^Next Hop\(s\):\s+(?P<next_hop>[\w\/\s\.\(\):-]+)$')
+        p8 = regex_engine.compile(r'^(?P<next_hop>[\w\/\s\.\(\):-]+)$')
 
         # Local Address:             4.4.4.1
-        p9 = re.compile(r'^Local Address:\s+(?P<local_addr>[a-zA-Z0-9\.:]+)$')
+        p9 = regex_engine.compile(r'^Local Address:\s+(?P<local_addr>[a-zA-Z0-9\.:]+)$')
 
         # Sequence Number:           0
-        p10 = re.compile(r'^Sequence Number:\s+(?P<seq_number>\d+)$')
+        p10 = regex_engine.compile(r'^Sequence Number:\s+(?P<seq_number>\d+)$')
 
         # IP Duplication Detection:  Timer not running
         # IP Duplication Detection:  IP moves 4, limit 5
         #                            Timer expires in 09:19:15
         # IP Duplication Detection:  Duplicate IP address detected
-        p11 = re.compile(r'^IP Duplication Detection:\s+(?P<ip_dup_status>[\w\d\s,]+)$')
-        p12 = re.compile(r'^IP moves (?P<moves_count>\d+), limit (?P<moves_limit>\d+)$')
-        p13 = re.compile(r'^Timer expires in (?P<expiry_time>[\d:]+)$')
+        p11 = regex_engine.compile(r'^IP Duplication Detection:\s+(?P<ip_dup_status>[\w\d\s,]+)$')
+        p12 = regex_engine.compile(r'^IP moves (?P<moves_count>\d+), limit (?P<moves_limit>\d+)$')
+        p13 = regex_engine.compile(r'^Timer expires in (?P<expiry_time>[\d:]+)$')
 
         # Last Local MAC sent:       aabb.0011.0022
-        p14 = re.compile(r'^Last Local MAC sent:\s+(?P<last_local_mac_sent>[0-9a-fA-F\.]+)$')
+        p14 = regex_engine.compile(r'^Last Local MAC sent:\s+(?P<last_local_mac_sent>[0-9a-fA-F\.]+)$')
 
         # Last Local MAC learned:    aabb.0011.0022
-        p15 = re.compile(r'^Last Local MAC learned:\s+(?P<last_local_mac_learned>[0-9a-fA-F\.]+)$')
+        p15 = regex_engine.compile(r'^Last Local MAC learned:\s+(?P<last_local_mac_learned>[0-9a-fA-F\.]+)$')
 
         # Last Remote MAC received:  aabb.0011.0022
-        p16 = re.compile(r'^Last Remote MAC received:\s+(?P<last_remote_mac_received>[0-9a-fA-F\.]+)$')
+        p16 = regex_engine.compile(r'^Last Remote MAC received:\s+(?P<last_remote_mac_received>[0-9a-fA-F\.]+)$')
 
         # Label2 included:           No
-        p17 = re.compile(r'^Label2 included:\s+(?P<label2_included>(Yes|No))$')
+        p17 = regex_engine.compile(r'^Label2 included:\s+(?P<label2_included>(Yes|No))$')
 
         parser_dict = {}
 
@@ -3340,14 +3338,14 @@ class ShowL2vpnEvpnMacIpSummary(ShowL2vpnEvpnMacIpSummarySchema):
         # 2     12    0          0          0          0
         #
         # Total                  2          0          0
-        p1 = re.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Remote IP\s+Local IP\s+Dup IP$')
-        p2 = re.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Remote IP$')
-        p3 = re.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Local IP$')
-        p4 = re.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Dup IP$')
-        p5 = re.compile(r'^(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<eth_tag>\d+)\s+(?P<remote_count>\d+)\s+(?P<local_count>\d+)\s+(?P<dup_count>\d+)$')
-        p6 = re.compile(r'^(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<eth_tag>\d+)\s+(?P<count>\d+)$')
-        p7 = re.compile(r'^Total\s+(?P<remote_count>\d+)\s+(?P<local_count>\d+)\s+(?P<dup_count>\d+)$')
-        p8 = re.compile(r'^Total\s+(?P<count>\d+)$')
+        p1 = regex_engine.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Remote IP\s+Local IP\s+Dup IP$')
+        p2 = regex_engine.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Remote IP$')
+        p3 = regex_engine.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Local IP$')
+        p4 = regex_engine.compile(r'^EVI\s+(BD|VLAN)\s+Ether Tag\s+Dup IP$')
+        p5 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<eth_tag>\d+)\s+(?P<remote_count>\d+)\s+(?P<local_count>\d+)\s+(?P<dup_count>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<eth_tag>\d+)\s+(?P<count>\d+)$')
+        p7 = regex_engine.compile(r'^Total\s+(?P<remote_count>\d+)\s+(?P<local_count>\d+)\s+(?P<dup_count>\d+)$')
+        p8 = regex_engine.compile(r'^Total\s+(?P<count>\d+)$')
 
         parser_dict = {}
 
@@ -3520,7 +3518,7 @@ class ShowStormControl(ShowStormControlSchema):
         # Gi0/2/0         Link Down            0.70%        0.70%          0.00%    Shutdown     B
         # Gi1/0/3         Forwarding           1k pps       1k pps         0 pps        None     U
         # Gi1/0/3         Forwarding           950 pps      950 pps        0 pps        None    UU
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface>(\S+))\s+(?P<state>([A-Za-z]+\s?[A-Za-z]+))\s+(?P<upper>[\d\w\.]+)\s?(%|pps|bps)\s+(?P<lower>[\d\w\.]+)\s?(%|pps|bps)\s+(?P<current>[\d\w\.]+)\s?(%|pps|bps)\s+(?P<action>\S+)\s+(?P<type>\S+)')
 
         for line in output.splitlines():
@@ -3662,40 +3660,40 @@ class ShowL2vpnEvpnPeersVxlanDetail(ShowL2vpnEvpnPeersVxlanDetailSchema):
 
         # Interface:        nve1
         # Interface:        Global
-        p1 = re.compile(r'^Interface:\s+(?P<name>\w*)$')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<name>\w*)$')
 
         # Local VNI:        20011
         # Local VNI:        N/A
-        p2 = re.compile(r'^Local VNI:\s+((?P<vni>\d+)|N/A)$')
+        p2 = regex_engine.compile(r'^Local VNI:\s+((?P<vni>\d+)|N/A)$')
 
         # Peer VNI:         20011
         # Peer VNI:         N/A
-        p3 = re.compile(r'^Peer VNI:\s+((?P<vni>\d+)|N/A)$')
+        p3 = regex_engine.compile(r'^Peer VNI:\s+((?P<vni>\d+)|N/A)$')
 
         # Peer IP Address:  11.11.11.2
-        p4 = re.compile(r'^Peer IP Address:\s+(?P<address>[0-9a-fA-F\.:]+)$')
+        p4 = regex_engine.compile(r'^Peer IP Address:\s+(?P<address>[0-9a-fA-F\.:]+)$')
 
         # UP time:          1w6d
         # UP time:          00:15:49
-        p5 = re.compile(r'^UP time:\s+(?P<time>[\w:]*)$')
+        p5 = regex_engine.compile(r'^UP time:\s+(?P<time>[\w:]*)$')
 
         # Number of routes
-        p6 = re.compile(r'^Number of routes$')
+        p6 = regex_engine.compile(r'^Number of routes$')
 
         # EAD per-EVI:    0
-        p7 = re.compile(r'^EAD per-EVI:\s+(?P<routes>\d+)$')
+        p7 = regex_engine.compile(r'^EAD per-EVI:\s+(?P<routes>\d+)$')
 
         # MAC:            1
-        p8 = re.compile(r'^MAC:\s+(?P<routes>\d+)$')
+        p8 = regex_engine.compile(r'^MAC:\s+(?P<routes>\d+)$')
 
         # MAC/IP:         0
-        p9 = re.compile(r'^MAC/IP:\s+(?P<routes>\d+)$')
+        p9 = regex_engine.compile(r'^MAC/IP:\s+(?P<routes>\d+)$')
 
         # IMET:           1
-        p10 = re.compile(r'^IMET:\s+(?P<routes>\d+)$')
+        p10 = regex_engine.compile(r'^IMET:\s+(?P<routes>\d+)$')
 
         # Total:          1
-        p11 = re.compile(r'^Total:\s+(?P<routes>\d+)$')
+        p11 = regex_engine.compile(r'^Total:\s+(?P<routes>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3853,27 +3851,27 @@ class ShowL2vpnEvpnDefaultGatewayDetail(ShowL2vpnEvpnDefaultGatewayDetailSchema)
                 output = self.device.execute(self.cli_command[0])
 
         # Default Gateway Address:   10.3.1.254 (invalid)
-        p0 = re.compile(r'^Default Gateway Address:\s+(?P<address>[0-9a-fA-F\.:]+)\s+\(invalid\)$')
+        p0 = regex_engine.compile(r'^Default Gateway Address:\s+(?P<address>[0-9a-fA-F\.:]+)\s+\(invalid\)$')
 
         # Default Gateway Address:   10.3.1.254
-        p1 = re.compile(r'^Default Gateway Address:\s+(?P<address>[0-9a-fA-F\.:]+)$')
+        p1 = regex_engine.compile(r'^Default Gateway Address:\s+(?P<address>[0-9a-fA-F\.:]+)$')
 
         # EVPN Instance:             103
-        p2 = re.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
+        p2 = regex_engine.compile(r'^EVPN Instance:\s+(?P<evi>\d+)$')
 
         # Vlan:                      103
         # Bridge Domain:             103
-        p3 = re.compile(r'^(Vlan|Bridge Domain):\s+(?P<bd_id>\d+)$')
+        p3 = regex_engine.compile(r'^(Vlan|Bridge Domain):\s+(?P<bd_id>\d+)$')
 
         # MAC Address:               549f.c6f4.53bf
-        p4 = re.compile(r'^MAC Address:\s+(?P<mac>[0-9a-fA-F\.]+)$')
+        p4 = regex_engine.compile(r'^MAC Address:\s+(?P<mac>[0-9a-fA-F\.]+)$')
 
         # Ethernet Tag ID:           0
-        p5 = re.compile(r'^Ethernet Tag ID:\s+(?P<etag>\d+)$')
+        p5 = regex_engine.compile(r'^Ethernet Tag ID:\s+(?P<etag>\d+)$')
 
         # Source:                    V:2000103 Vlan103
         # Source:                    V:2000103 20.0.101.1
-        p6 = re.compile(r'^Source:\s+(?P<source>[\w\.\: ]+)$')
+        p6 = regex_engine.compile(r'^Source:\s+(?P<source>[\w\.\: ]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3949,7 +3947,7 @@ class ShowL2vpnEvpnDefaultGateway(ShowL2vpnEvpnDefaultGatewayDetailSchema):
             output = self.device.execute(self.cli_command)
 
         # Y   192.168.1.201             1     201   a0f8.4910.bccc Vl201
-        p1 = re.compile(r'^(?P<valid>\w+)\s+(?P<dg_addr>\S+)\s+(?P<evi>\d+)\s+(?P<vlan>\d+)\s+(?P<mac_addr>\S+)\s+(?P<source>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<valid>\w+)\s+(?P<dg_addr>\S+)\s+(?P<evi>\d+)\s+(?P<vlan>\d+)\s+(?P<mac_addr>\S+)\s+(?P<source>\S+)$')
 
         ret_dict = {}
 
@@ -4032,10 +4030,10 @@ class ShowL2vpnEvpnDefaultGatewaySummary(ShowL2vpnEvpnDefaultGatewaySummarySchem
                 output = self.device.execute(self.cli_command[0])
 
         # 103   103   0          4          4
-        p1 = re.compile(r'^(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<eth_tag>\d+)\s+(?P<remote_dg>\d+)\s+(?P<local_dg>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<evi>\d+)\s+(?P<bd_id>\d+)\s+(?P<eth_tag>\d+)\s+(?P<remote_dg>\d+)\s+(?P<local_dg>\d+)$')
 
         # Total                  4          4
-        p2 = re.compile(r'^Total\s+(?P<remote_dg>\d+)\s+(?P<local_dg>\d+)$')
+        p2 = regex_engine.compile(r'^Total\s+(?P<remote_dg>\d+)\s+(?P<local_dg>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4109,8 +4107,8 @@ class ShowL2vpnAtomPreferredPath(ShowL2vpnAtomPreferredPathSchema):
         # Tunnel1             500/100/400                      1.1.1.1         1
         # Tunnel65536                                          20.20.20.20     2
 
-        p1 = re.compile(r'^(?P<interface>\S+) +(?:(?P<total_bandwidth>\d+)\/(?P<avail_bandwidth>\d+)'
-                         r'\/(?P<reserved_bandwidth>\d+))? +(?P<peer_id>[\d.]+) +(?P<vc_id>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+) +(?:(?P<total_bandwidth>\d+)\/(?P<avail_bandwidth>\d+)'
+                                   r'\/(?P<reserved_bandwidth>\d+))? +(?P<peer_id>[\d.]+) +(?P<vc_id>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4231,113 +4229,113 @@ class ShowL2vpnEvpnSummary(ShowL2vpnEvpnSummarySchema):
 
 
         # EVPN Instances (excluding point-to-point): 1
-        p1 = re.compile(r'^EVPN Instances \(excluding point-to-point\):'
-                        r'\s+(?P<evis>\d+)$')
+        p1 = regex_engine.compile(r'^EVPN Instances \(excluding point-to-point\):'
+                                  r'\s+(?P<evis>\d+)$')
 
         # VLAN Aware:   1
-        p2 = re.compile(r'^VLAN Aware:\s+(?P<evis>\d+)$')
+        p2 = regex_engine.compile(r'^VLAN Aware:\s+(?P<evis>\d+)$')
 
         # VLAN Based:   1
-        p3 = re.compile(r'^VLAN Based:\s+(?P<evis>\d+)$')
+        p3 = regex_engine.compile(r'^VLAN Based:\s+(?P<evis>\d+)$')
 
         # VLAN Bundle:   1
-        p4 = re.compile(r'^VLAN Bundle:\s+(?P<evis>\d+)$')
+        p4 = regex_engine.compile(r'^VLAN Bundle:\s+(?P<evis>\d+)$')
 
         # Vlans: 1
         # Bridge Domains: 10
-        p5 = re.compile(r'^(Vlans|Bridge Domains): (?P<bds>\d+)$')
+        p5 = regex_engine.compile(r'^(Vlans|Bridge Domains): (?P<bds>\d+)$')
 
         # BGP: ASN 1, address-family l2vpn evpn configured
-        p6 = re.compile(r'^BGP: ASN (?P<asn>\d+), '
-                        r'address-family l2vpn evpn (?P<af>[\w ]+)$')
+        p6 = regex_engine.compile(r'^BGP: ASN (?P<asn>\d+), '
+                                  r'address-family l2vpn evpn (?P<af>[\w ]+)$')
 
         # Router ID: 20.20.20.20
-        p7 = re.compile(r'^Router ID:\s+(?P<id>[0-9a-fA-F\.:]+)$')
+        p7 = regex_engine.compile(r'^Router ID:\s+(?P<id>[0-9a-fA-F\.:]+)$')
 
         # Label Allocation Mode: Per-BD
-        p8 = re.compile(r'^Label Allocation Mode:\s+(?P<mode>[\w\-]+)$')
+        p8 = regex_engine.compile(r'^Label Allocation Mode:\s+(?P<mode>[\w\-]+)$')
 
         # Global Replication Type: Static
-        p9 = re.compile(r'^Global Replication Type:\s+(?P<type>[\w\- ]+)$')
+        p9 = regex_engine.compile(r'^Global Replication Type:\s+(?P<type>[\w\- ]+)$')
 
         # ARP/ND Flooding Suppression: Enabled
-        p10 = re.compile(r'^ARP\/ND Flooding Suppression:\s+(?P<enable>\w+)$')
+        p10 = regex_engine.compile(r'^ARP\/ND Flooding Suppression:\s+(?P<enable>\w+)$')
 
         # DHCP Relay Flooding Suppression: Disabled
-        p11 = re.compile(r'^DHCP Relay Flooding Suppression:'
-                         r'\s+(?P<enable>\w+)$')
+        p11 = regex_engine.compile(r'^DHCP Relay Flooding Suppression:'
+                                   r'\s+(?P<enable>\w+)$')
 
         # Connectivity to Core: UP
-        p12 = re.compile(r'^Connectivity to Core:\s+(?P<status>\w+)$')
+        p12 = regex_engine.compile(r'^Connectivity to Core:\s+(?P<status>\w+)$')
 
         # MAC Duplication: seconds 10 limit 100
-        p13 = re.compile(r'^MAC Duplication: seconds (?P<seconds>\d+) '
-                         r'limit (?P<limit>\d+)$')
+        p13 = regex_engine.compile(r'^MAC Duplication: seconds (?P<seconds>\d+) '
+                                   r'limit (?P<limit>\d+)$')
 
         # MAC Addresses: 25
-        p14 = re.compile(r'^MAC Addresses:\s+(?P<total>\d+)$')
+        p14 = regex_engine.compile(r'^MAC Addresses:\s+(?P<total>\d+)$')
 
         # IP Duplication: seconds 180 limit 5
-        p15 = re.compile(r'^IP Duplication: seconds (?P<seconds>\d+) '
-                         r'limit (?P<limit>\d+)$')
+        p15 = regex_engine.compile(r'^IP Duplication: seconds (?P<seconds>\d+) '
+                                   r'limit (?P<limit>\d+)$')
 
         # IP Addresses: 14
-        p16 = re.compile(r'^IP Addresses:\s+(?P<total>\d+)$')
+        p16 = regex_engine.compile(r'^IP Addresses:\s+(?P<total>\d+)$')
 
         # Advertise Default Gateway: No
-        p17 = re.compile(r'^Advertise Default Gateway:\s+(?P<enable>\w+)$')
+        p17 = regex_engine.compile(r'^Advertise Default Gateway:\s+(?P<enable>\w+)$')
 
         # Default Gateway Addresses: 1
-        p18 = re.compile(r'^Default Gateway Addresses:\s+(?P<total>\d+)$')
+        p18 = regex_engine.compile(r'^Default Gateway Addresses:\s+(?P<total>\d+)$')
 
         # Local:     11
-        p19 = re.compile(r'^Local:\s+(?P<local>\d+)$')
+        p19 = regex_engine.compile(r'^Local:\s+(?P<local>\d+)$')
 
         # Remote:    12
-        p20 = re.compile(r'^Remote:\s+(?P<remote>\d+)$')
+        p20 = regex_engine.compile(r'^Remote:\s+(?P<remote>\d+)$')
 
         # Duplicate: 2
-        p21 = re.compile(r'^Duplicate:\s+(?P<duplicate>\d+)$')
+        p21 = regex_engine.compile(r'^Duplicate:\s+(?P<duplicate>\d+)$')
 
         # Maximum number of Route Targets per EAD-ES route: 200
-        p22 = re.compile(r'^Maximum number of Route Targets '
-                         r'per EAD-ES route: (?P<rts>\d+)$')
+        p22 = regex_engine.compile(r'^Maximum number of Route Targets '
+                                   r'per EAD-ES route: (?P<rts>\d+)$')
 
         # Multi-home aliasing: Enabled
-        p23 = re.compile(r'^Multi-home aliasing:\s+(?P<enable>\w+)$')
+        p23 = regex_engine.compile(r'^Multi-home aliasing:\s+(?P<enable>\w+)$')
 
         # Global IP Local Learn: Enabled
-        p24 = re.compile(r'^Global IP Local Learn:\s+(?P<enable>[\w ]+)$')
+        p24 = regex_engine.compile(r'^Global IP Local Learn:\s+(?P<enable>[\w ]+)$')
 
         # IP local learning limits
-        p25 = re.compile(r'^IP local learning limits$')
+        p25 = regex_engine.compile(r'^IP local learning limits$')
 
         # IPv4: 4 addresses per-MAC
-        p26 = re.compile(r'^IPv4: (?P<ipv4>\d+) addresses per-MAC$')
+        p26 = regex_engine.compile(r'^IPv4: (?P<ipv4>\d+) addresses per-MAC$')
 
         # IPv6: 12 addresses per-MAC
-        p27 = re.compile(r'^IPv6: (?P<ipv6>\d+) addresses per-MAC$')
+        p27 = regex_engine.compile(r'^IPv6: (?P<ipv6>\d+) addresses per-MAC$')
 
         # IP local learning timers
-        p28 = re.compile(r'^IP local learning timers$')
+        p28 = regex_engine.compile(r'^IP local learning timers$')
 
         # Down:      10 minutes
-        p29 = re.compile(r'^Down:\s+(?P<down>\d+) minutes$')
+        p29 = regex_engine.compile(r'^Down:\s+(?P<down>\d+) minutes$')
 
         # Poll:      1 minutes
-        p30 = re.compile(r'^Poll:\s+(?P<poll>\d+) minutes$')
+        p30 = regex_engine.compile(r'^Poll:\s+(?P<poll>\d+) minutes$')
 
         # Reachable: 5 minutes
-        p31 = re.compile(r'^Reachable:\s+(?P<reachable>\d+) minutes$')
+        p31 = regex_engine.compile(r'^Reachable:\s+(?P<reachable>\d+) minutes$')
 
         # Stale:     30 minutes
-        p32 = re.compile(r'^Stale:\s+(?P<stale>\d+) minutes$')
+        p32 = regex_engine.compile(r'^Stale:\s+(?P<stale>\d+) minutes$')
 
         # Auto route-target: evi-id based
-        p33 = re.compile(r'^Auto route-target:\s+(?P<type>[\w\- ]+)$')
+        p33 = regex_engine.compile(r'^Auto route-target:\s+(?P<type>[\w\- ]+)$')
 
         # Advertise Multicast: Yes
-        p34 = re.compile(r'^Advertise Multicast:\s+(?P<enable>\w+)$')
+        p34 = regex_engine.compile(r'^Advertise Multicast:\s+(?P<enable>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4698,114 +4696,114 @@ class ShowL2vpnEvpnEviDetail(ShowL2vpnEvpnEviDetailSchema):
 
 
         # EVPN instance:       1 (VLAN Based)
-        p1 = re.compile(r'^EVPN instance:\s+(?P<evi>\d+)\s+\((?P<type>.*)\)$')
+        p1 = regex_engine.compile(r'^EVPN instance:\s+(?P<evi>\d+)\s+\((?P<type>.*)\)$')
 
         # RD:                20.20.20.20:1 (auto)
-        p2 = re.compile(r'^RD:\s+(?P<rd>[0-9a-fA-F\.:]+)\s+\((?P<type>\w+)\)$')
+        p2 = regex_engine.compile(r'^RD:\s+(?P<rd>[0-9a-fA-F\.:]+)\s+\((?P<type>\w+)\)$')
 
         # Import-RTs:        1:1
         # Import-RTs:        1:100 995:95 997:97 998:98 999:99
-        p3 = re.compile(r'^Import-RTs:\s+(?P<rt>[\d:\s]+)')
+        p3 = regex_engine.compile(r'^Import-RTs:\s+(?P<rt>[\d:\s]+)')
 
         # Export-RTs:        1:1
         # Export-RTs:        1:100 995:95 997:97 998:98 999:99
-        p4 = re.compile(r'^Export-RTs:\s+(?P<rt>[\d:\s]+)')
+        p4 = regex_engine.compile(r'^Export-RTs:\s+(?P<rt>[\d:\s]+)')
 
         # Per-EVI Label:     none
-        p5 = re.compile(r'^Per-EVI Label:\s+(?P<label>\d+|none)$')
+        p5 = regex_engine.compile(r'^Per-EVI Label:\s+(?P<label>\d+|none)$')
 
         # State:             Established
         # State:             No BGP, Incomplete
-        p6 = re.compile(r'^State:\s+(?P<state>[\w\s,]+)$')
+        p6 = regex_engine.compile(r'^State:\s+(?P<state>[\w\s,]+)$')
 
         # Replication Type:  Static (global)
-        p7 = re.compile(r'^Replication Type:\s+(?P<type>[\w\-\s]+)')
+        p7 = regex_engine.compile(r'^Replication Type:\s+(?P<type>[\w\-\s]+)')
 
         # Encapsulation:     vxlan
-        p8 = re.compile(r'^Encapsulation:\s+(?P<enctype>\w+)')
+        p8 = regex_engine.compile(r'^Encapsulation:\s+(?P<enctype>\w+)')
 
         # IP Local Learn:    Enabled (global)
-        p9 = re.compile(r'^IP Local Learn:\s+(?P<enable>[\w\s]+)')
+        p9 = regex_engine.compile(r'^IP Local Learn:\s+(?P<enable>[\w\s]+)')
 
         # Adv. Def. Gateway: Disabled (global)
-        p10 = re.compile(r'^Adv. Def. Gateway:\s+(?P<enable>\w+)')
+        p10 = regex_engine.compile(r'^Adv. Def. Gateway:\s+(?P<enable>\w+)')
 
         # Re-originate RT5:  Disabled
-        p11 = re.compile(r'^Re-originate RT5:\s+(?P<enable>\w+)')
+        p11 = regex_engine.compile(r'^Re-originate RT5:\s+(?P<enable>\w+)')
 
         # Adv. Multicast:    Enabled (global)
         # Adv. Multicast:    Enabled (global) (sync-only)
         # Adv. Multicast:    Enabled (sync-only)
-        p12 = re.compile(r'Adv\. Multicast:\s+(?P<enable>\w+)+'
-                         r'(?:\s+\(\w+\))?(?:\s+\((?P<scope>sync-only)\))?')
+        p12 = regex_engine.compile(r'Adv\. Multicast:\s+(?P<enable>\w+)+'
+                                   r'(?:\s+\(\w+\))?(?:\s+\((?P<scope>sync-only)\))?')
 
         # Vlan:              100
         # Bridge Domain:     1
-        p13 = re.compile(r'^(Vlan|Bridge Domain):\s+(?P<bd_id>\d+)$')
+        p13 = regex_engine.compile(r'^(Vlan|Bridge Domain):\s+(?P<bd_id>\d+)$')
 
         # Ethernet-Tag:    0
-        p14 = re.compile(r'^Ethernet-Tag:\s+(?P<etag>\d+)$')
+        p14 = regex_engine.compile(r'^Ethernet-Tag:\s+(?P<etag>\d+)$')
 
         # Flood Suppress:  Attached
-        p15 = re.compile(r'^Flood Suppress:\s+(?P<attach>\w+)$')
+        p15 = regex_engine.compile(r'^Flood Suppress:\s+(?P<attach>\w+)$')
 
         # Core If:         Vlan500
-        p16 = re.compile(r'^Core If:\s+(?P<name>\w*)$')
+        p16 = regex_engine.compile(r'^Core If:\s+(?P<name>\w*)$')
 
         # Access If:       Vlan100
-        p17 = re.compile(r'^Access If:\s+(?P<name>\w*)$')
+        p17 = regex_engine.compile(r'^Access If:\s+(?P<name>\w*)$')
 
         # NVE If:          nve1
-        p18 = re.compile(r'^NVE If:\s+(?P<name>\w+)$')
+        p18 = regex_engine.compile(r'^NVE If:\s+(?P<name>\w+)$')
 
         # RMAC:            0000.0000.0000
-        p19 = re.compile(r'^RMAC:\s+(?P<mac>[A-Fa-f0-9:\.]+)$')
+        p19 = regex_engine.compile(r'^RMAC:\s+(?P<mac>[A-Fa-f0-9:\.]+)$')
 
         # Core Vlan:       0
-        p20 = re.compile(r'^Core Vlan:\s+(?P<vlan>\d+)$')
+        p20 = regex_engine.compile(r'^Core Vlan:\s+(?P<vlan>\d+)$')
 
         # L2 VNI:          10000
-        p21 = re.compile(r'^L2 VNI:\s+(?P<vni>\d+)$')
+        p21 = regex_engine.compile(r'^L2 VNI:\s+(?P<vni>\d+)$')
 
         # L3 VNI:          0
-        p22 = re.compile(r'^L3 VNI:\s+(?P<vni>\d+)$')
+        p22 = regex_engine.compile(r'^L3 VNI:\s+(?P<vni>\d+)$')
 
         # VTEP IP:         1.20.20.20
-        p23 = re.compile(r'^VTEP IP:\s+(?P<addr>UNKNOWN|[A-Fa-f0-9:\.]+)$')
+        p23 = regex_engine.compile(r'^VTEP IP:\s+(?P<addr>UNKNOWN|[A-Fa-f0-9:\.]+)$')
 
         # MCAST IP:        227.0.0.1
-        p24 = re.compile(r'^MCAST IP:\s+(?P<addr>UNKNOWN|[A-Fa-f0-9:\.]+)')
+        p24 = regex_engine.compile(r'^MCAST IP:\s+(?P<addr>UNKNOWN|[A-Fa-f0-9:\.]+)')
 
         # VRF:             Red
-        p25 = re.compile(r'^VRF:\s+(?P<vrf>\w*)$')
+        p25 = regex_engine.compile(r'^VRF:\s+(?P<vrf>\w*)$')
 
         # IPv4 IRB:        Enabled (Asymmetric)
-        p26 = re.compile(r'^IPv4 IRB:\s+(?P<enable>\w+)')
+        p26 = regex_engine.compile(r'^IPv4 IRB:\s+(?P<enable>\w+)')
 
         # IPv6 IRB:        Disabled
-        p27 = re.compile(r'^IPv6 IRB:\s+(?P<enable>\w+)')
+        p27 = regex_engine.compile(r'^IPv6 IRB:\s+(?P<enable>\w+)')
 
         # BUM Label:       1002
-        p28 = re.compile(r'^BUM Label:\s+((?P<label>\d+)|none)$')
+        p28 = regex_engine.compile(r'^BUM Label:\s+((?P<label>\d+)|none)$')
 
         # Per-BD Label:    1003
-        p29 = re.compile(r'^Per-BD Label:\s+((?P<label>\d+)|none)$')
+        p29 = regex_engine.compile(r'^Per-BD Label:\s+((?P<label>\d+)|none)$')
 
         # BDI Label:       none
-        p30 = re.compile(r'^BDI Label:\s+((?P<label>\d+)|none)$')
+        p30 = regex_engine.compile(r'^BDI Label:\s+((?P<label>\d+)|none)$')
 
         # Pseudoports:
-        p31 = re.compile(r'^Pseudoports( \(Labels\))?:$')
+        p31 = regex_engine.compile(r'^Pseudoports( \(Labels\))?:$')
 
         # Ethernet0/1 service instance 1
         # Ethernet0/3 service instance 1 (DF state: PE-to-CE BUM blocked)
-        p32 = re.compile(r'^(?P<pp_name>[\w\/\.\-]+ service instance \d+)'
-                         r'( \(((?P<label>\d+)|none)\))?'
-                         r'( \(DF state: (?P<state>[\w\- ]+)\))?$')
+        p32 = regex_engine.compile(r'^(?P<pp_name>[\w\/\.\-]+ service instance \d+)'
+                                   r'( \(((?P<label>\d+)|none)\))?'
+                                   r'( \(DF state: (?P<state>[\w\- ]+)\))?$')
 
         # pseudowire100002 (Access VFI VFI10: Peer 5.5.5.5, VC 10)
         # pseudowire100003 (Access PW: Peer 5.5.5.5, VC 10) (DF state: blocked)
-        p33 = re.compile(
+        p33 = regex_engine.compile(
             r'^(?P<pp_name>pseudowire\d+)'
             r' \((((Access )?VFI (?P<access_vfi>\w+))|(Access PW)):'
             r' ((Peer (?P<addr>[A-Fa-f0-9:\.]+), VC (?P<vc>\d+))'
@@ -4814,26 +4812,26 @@ class ShowL2vpnEvpnEviDetail(ShowL2vpnEvpnEviDetailSchema):
             r'( \(DF state: (?P<state>[\w\-\s]+)\))?$')
 
         # Routes: 1 MAC, 1 MAC/IP
-        p34 = re.compile(r'^Routes:\s+(?P<mac>\d+) MAC,'
-                         r'\s+(?P<mac_ip>\d+) MAC\/IP$')
+        p34 = regex_engine.compile(r'^Routes:\s+(?P<mac>\d+) MAC,'
+                                   r'\s+(?P<mac_ip>\d+) MAC\/IP$')
 
         # Peers:
-        p35 = re.compile(r'^Peers:$')
+        p35 = regex_engine.compile(r'^Peers:$')
 
         # 15.15.15.15
-        p36 = re.compile(r'^(?P<addr>[A-Fa-f0-9:\.]+)$')
+        p36 = regex_engine.compile(r'^(?P<addr>[A-Fa-f0-9:\.]+)$')
 
         # Routes: 0 MAC, 0 MAC/IP, 1 IMET, 1 EAD
-        p37 = re.compile(r'^Routes:\s+(?P<mac>\d+) MAC,'
-                         r'\s+(?P<mac_ip>\d+) MAC\/IP,'
-                         r'\s+(?P<imet>\d+) IMET,'
-                         r'\s+(?P<ead>\d+) EAD$')
+        p37 = regex_engine.compile(r'^Routes:\s+(?P<mac>\d+) MAC,'
+                                   r'\s+(?P<mac_ip>\d+) MAC\/IP,'
+                                   r'\s+(?P<imet>\d+) IMET,'
+                                   r'\s+(?P<ead>\d+) EAD$')
 
         # Sec. VTEP IP:    1.1.1.2
-        p38 = re.compile(r'^Sec\. VTEP IP:\s+(?P<addr>UNKNOWN|[A-Fa-f\d:.]+)$')
+        p38 = regex_engine.compile(r'^Sec\. VTEP IP:\s+(?P<addr>UNKNOWN|[A-Fa-f\d:.]+)$')
 
         # ESI: 0000.0000.0000.0000.0001
-        p39 = re.compile(r'^ESI:\s+(?P<esi>[0-9a-fA-F\.]+)$')
+        p39 = regex_engine.compile(r'^ESI:\s+(?P<esi>[0-9a-fA-F\.]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -5326,67 +5324,67 @@ class ShowL2vpnEvpnCap(ShowL2vpnEvpnCapSchema):
         parsed_dict = {}
 
         # EVPN Platform Capabilities
-        p0 = re.compile(r'^EVPN Platform Capabilities$')
+        p0 = regex_engine.compile(r'^EVPN Platform Capabilities$')
         # VLAN-based EVPN Instance: supported
-        p1 = re.compile(r'^VLAN-based EVPN Instance: supported$')
+        p1 = regex_engine.compile(r'^VLAN-based EVPN Instance: supported$')
         # VLAN-bundle EVPN Instance: supported
-        p2 = re.compile(r'^VLAN-bundle EVPN Instance: supported$')
+        p2 = regex_engine.compile(r'^VLAN-bundle EVPN Instance: supported$')
         # VLAN-aware EVPN Instance: supported
-        p3 = re.compile(r'^VLAN-aware EVPN Instance: supported$')
+        p3 = regex_engine.compile(r'^VLAN-aware EVPN Instance: supported$')
         # Ingress replication type: supported
-        p4 = re.compile(r'^Ingress replication type: supported$')
+        p4 = regex_engine.compile(r'^Ingress replication type: supported$')
         # Point-to-multipoint replication type: supported
-        p5 = re.compile(r'^Point-to-multipoint replication type: supported$')
+        p5 = regex_engine.compile(r'^Point-to-multipoint replication type: supported$')
         # Multipoint-to-multipoint replication type: supported
-        p6 = re.compile(r'^Multipoint-to-multipoint '
-                        r'replication type: supported$')
+        p6 = regex_engine.compile(r'^Multipoint-to-multipoint '
+                                  r'replication type: supported$')
         # Static replication type: supported
-        p7 = re.compile(r'^Static replication type: supported$')
+        p7 = regex_engine.compile(r'^Static replication type: supported$')
         # Per-BD MPLS label allocation mode: supported
-        p8 = re.compile(r'^Per-BD MPLS label allocation mode: supported$')
+        p8 = regex_engine.compile(r'^Per-BD MPLS label allocation mode: supported$')
         # Per-CE MPLS label allocation mode: supported
-        p9 = re.compile(r'^Per-CE MPLS label allocation mode: supported$')
+        p9 = regex_engine.compile(r'^Per-CE MPLS label allocation mode: supported$')
         # Per-EVI MPLS label allocation mode: supported
-        p10 = re.compile(r'^Per-EVI MPLS label allocation mode: supported$')
+        p10 = regex_engine.compile(r'^Per-EVI MPLS label allocation mode: supported$')
         # Address resolution flooding suppression: supported
-        p11 = re.compile(r'^Address resolution flooding '
-                         r'suppression: supported$')
+        p11 = regex_engine.compile(r'^Address resolution flooding '
+                                   r'suppression: supported$')
         # DHCP Relay flooding suppression: supported
-        p12 = re.compile(r'^DHCP Relay flooding suppression: supported$')
+        p12 = regex_engine.compile(r'^DHCP Relay flooding suppression: supported$')
         # VLAN configuration mode: supported
-        p13 = re.compile(r'^VLAN configuration mode: supported$')
+        p13 = regex_engine.compile(r'^VLAN configuration mode: supported$')
         # MPLS encapsulation: supported
-        p14 = re.compile(r'^MPLS encapsulation: supported$')
+        p14 = regex_engine.compile(r'^MPLS encapsulation: supported$')
         # VxLAN encapsulation: supported
-        p15 = re.compile(r'^VxLAN encapsulation: supported$')
+        p15 = regex_engine.compile(r'^VxLAN encapsulation: supported$')
         # Multi-homing aliasing: supported
-        p16 = re.compile(r'^Multi-homing aliasing: supported$')
+        p16 = regex_engine.compile(r'^Multi-homing aliasing: supported$')
         # VPLS stitching: supported
-        p17 = re.compile(r'^VPLS stitching: supported$')
+        p17 = regex_engine.compile(r'^VPLS stitching: supported$')
         # VPLS seamless integration: supported
-        p18 = re.compile(r'^VPLS seamless integration: supported$')
+        p18 = regex_engine.compile(r'^VPLS seamless integration: supported$')
         # Multi-homing all active redundancy mode: supported
-        p19 = re.compile(r'^Multi-homing all active '
-                         r'redundancy mode: supported$')
+        p19 = regex_engine.compile(r'^Multi-homing all active '
+                                   r'redundancy mode: supported$')
         # Multi-homing single active redundancy mode: supported
-        p20 = re.compile(r'^Multi-homing single active '
-                         r'redundancy mode: supported$')
+        p20 = regex_engine.compile(r'^Multi-homing single active '
+                                   r'redundancy mode: supported$')
         # Ethernet Segment old config model: supported
-        p21 = re.compile(r'^Ethernet Segment old config model: supported$')
+        p21 = regex_engine.compile(r'^Ethernet Segment old config model: supported$')
         # IP local learning: supported
-        p22 = re.compile(r'^IP local learning: supported$')
+        p22 = regex_engine.compile(r'^IP local learning: supported$')
         # VPLS stitching single-active dual-homing: supported
-        p23 = re.compile(r'^VPLS stitching single-active '
-                         r'dual-homing: supported$')
+        p23 = regex_engine.compile(r'^VPLS stitching single-active '
+                                   r'dual-homing: supported$')
         # Layer 2 Tenant Routed Multicast IPv4: supported
-        p24 = re.compile(r'^Layer 2 Tenant Routed Multicast IPv4: supported$')
+        p24 = regex_engine.compile(r'^Layer 2 Tenant Routed Multicast IPv4: supported$')
         # Layer 2 Tenant Routed Multicast IPv6: supported
-        p25 = re.compile(r'^Layer 2 Tenant Routed Multicast IPv6: supported$')
+        p25 = regex_engine.compile(r'^Layer 2 Tenant Routed Multicast IPv6: supported$')
         # Layer 2 multicast source specific forwarding: supported
-        p26 = re.compile(r'^Layer 2 multicast source specific '
-                         r'forwarding: supported$')
+        p26 = regex_engine.compile(r'^Layer 2 multicast source specific '
+                                   r'forwarding: supported$')
         # VPWS Preferred Path SRTE Policy: supported
-        p27 = re.compile(r'^VPWS Preferred Path SRTE Policy: supported$')
+        p27 = regex_engine.compile(r'^VPWS Preferred Path SRTE Policy: supported$')
 
         for line in show_output.splitlines():
             line = line.strip()
@@ -5630,38 +5628,38 @@ class ShowRunSectionL2vpnEvpn(ShowRunSectionL2vpnEvpnSchema):
         parsed_dict = {}
 
         # l2vpn evpn
-        p1 = re.compile(r'^l2vpn evpn$')
+        p1 = regex_engine.compile(r'^l2vpn evpn$')
 
         # l2vpn evpn instance 2 vlan-based
-        p2 = re.compile(r'^l2vpn evpn instance '
-                        r'(?P<evi>\d+) (?P<srvinst>[\w-]+)$')
+        p2 = regex_engine.compile(r'^l2vpn evpn instance '
+                                  r'(?P<evi>\d+) (?P<srvinst>[\w-]+)$')
 
         # replication-type ingress
-        p3 = re.compile(r'^replication-type (?P<reptype>\w+)$')
+        p3 = regex_engine.compile(r'^replication-type (?P<reptype>\w+)$')
 
         # flooding-suppression address-resolution disable
-        p4 = re.compile(r'^flooding-suppression address-resolution disable$')
+        p4 = regex_engine.compile(r'^flooding-suppression address-resolution disable$')
 
         # multihoming aliasing disable
-        p5 = re.compile(r'^multihoming aliasing disable$')
+        p5 = regex_engine.compile(r'^multihoming aliasing disable$')
 
         # default-gateway advertise
-        p6 = re.compile(r'^default-gateway advertise$')
+        p6 = regex_engine.compile(r'^default-gateway advertise$')
 
         # multicast advertise
-        p7 = re.compile(r'^multicast advertise$')
+        p7 = regex_engine.compile(r'^multicast advertise$')
 
         # encapsulation vxlan
-        p8 = re.compile(r'^encapsulation (?P<encaptype>\w+)$')
+        p8 = regex_engine.compile(r'^encapsulation (?P<encaptype>\w+)$')
 
         # default-gateway advertise enable/disable
-        p9 = re.compile(r'^default-gateway advertise (?P<dgadv>\w+)$')
+        p9 = regex_engine.compile(r'^default-gateway advertise (?P<dgadv>\w+)$')
 
         # multicast advertise enable/disable
-        p10 = re.compile(r'^multicast advertise (?P<mcadv>\w+)$')
+        p10 = regex_engine.compile(r'^multicast advertise (?P<mcadv>\w+)$')
 
         # flooding-suppression dhcp-relay disable
-        p11 = re.compile(r'^flooding-suppression dhcp-relay disable$')
+        p11 = regex_engine.compile(r'^flooding-suppression dhcp-relay disable$')
 
         floodsup_ar_disable = False
         floodsup_dhcprelay_disable = False
@@ -5818,40 +5816,40 @@ class ShowL2vpnEvpnVpwsVc(ShowL2vpnEvpnVpwsVcSchema):
 
 
         # EVPN name: vc100, state: up, type: point-to-point
-        p1 = re.compile(r'^EVPN name:\s+(?P<vc_name>[^,]+), state:\s+(?P<vc_state>[^,]+), type:\s+point-to-point$')
+        p1 = regex_engine.compile(r'^EVPN name:\s+(?P<vc_name>[^,]+), state:\s+(?P<vc_state>[^,]+), type:\s+point-to-point$')
 
         # EVPN ID: 100
-        p2 = re.compile(r'^EVPN ID:\s+(?P<evi>\d+)$')
+        p2 = regex_engine.compile(r'^EVPN ID:\s+(?P<evi>\d+)$')
 
         # VPWS Service Instance ID: Source 1, Target 2
-        p3 = re.compile(r'^\s*VPWS Service Instance ID:\s+Source\s+(?P<source>\d+), Target\s+(?P<target>\d+)$')
+        p3 = regex_engine.compile(r'^\s*VPWS Service Instance ID:\s+Source\s+(?P<source>\d+), Target\s+(?P<target>\d+)$')
 
         # Labels: Local 18, Remote 16
-        p4 = re.compile(r'^\s*Labels:\s+Local\s+(?P<local_label>\d+), Remote\s+(?P<remote_label>\d+)$')
+        p4 = regex_engine.compile(r'^\s*Labels:\s+Local\s+(?P<local_label>\d+), Remote\s+(?P<remote_label>\d+)$')
 
         # Next Hop Address: 20.20.20.20
-        p5 = re.compile(r'^\s*Next Hop Address:\s+(?P<next_hop>[A-Fa-f0-9:\.]+)$')
+        p5 = regex_engine.compile(r'^\s*Next Hop Address:\s+(?P<next_hop>[A-Fa-f0-9:\.]+)$')
 
         # Associated member interface Et1/2 up, Et1/2 status is up
-        p6 = re.compile(r'^\s*Associated member interface\s+(?P<access_if>\S+)\s+(?P<access_member_state>[^,]+)(\S+\s+){4}(?P<access_if_state>.*)$')
+        p6 = regex_engine.compile(r'^\s*Associated member interface\s+(?P<access_if>\S+)\s+(?P<access_member_state>[^,]+)(\S+\s+){4}(?P<access_if_state>.*)$')
 
         # Output interface: Tu65536, imposed label stack {24321 16}
-        p7 = re.compile(r'^\s*Output interface:\s+(?P<output_if>.*), imposed label stack {(?P<output_label_stack>[^}]+)')
+        p7 = regex_engine.compile(r'^\s*Output interface:\s+(?P<output_if>.*), imposed label stack {(?P<output_label_stack>[^}]+)')
 
         # Preferred path:   active
-        p8 = re.compile(r'^\s*Preferred path:\s+(?P<preferred_path>.*)$')
+        p8 = regex_engine.compile(r'^\s*Preferred path:\s+(?P<preferred_path>.*)$')
 
         # Default path: ready
-        p9 = re.compile(r'^\s*Default path:\s+(?P<default_path>.*)$')
+        p9 = regex_engine.compile(r'^\s*Default path:\s+(?P<default_path>.*)$')
 
         # Rx Counters
         # 0 input transit packets, 0 bytes
-        p10 = re.compile(r'^\s*(?P<rx_pak>\S+)\s+input transit packets')
+        p10 = regex_engine.compile(r'^\s*(?P<rx_pak>\S+)\s+input transit packets')
         # 0 drops
 
         # Tx Counters
         # 0 output transit packets, 0 bytes
-        p11 = re.compile(r'^\s*(?P<tx_pak>\S+)\s+output transit packets')
+        p11 = regex_engine.compile(r'^\s*(?P<tx_pak>\S+)\s+output transit packets')
         # 0 drops
 
         for line in show_output.splitlines():
@@ -6012,7 +6010,7 @@ class ShowL2vpnAtomVc(ShowL2vpnAtomVcSchema):
         ret_dict = {}
 
         # Interface Peer ID        VC ID      Type   Name                     Status
-        p1 = re.compile(r"^(?P<interface>[\w\d]+)\s+(?P<peer_id>[\d\:\.]+)\s+(?P<vc_id>\d+)\s+(?P<type>\w+)\s+(?P<name>[\w\d]+)\s+(?P<status>\w+)$")
+        p1 = regex_engine.compile(r"^(?P<interface>[\w\d]+)\s+(?P<peer_id>[\d\:\.]+)\s+(?P<vc_id>\d+)\s+(?P<type>\w+)\s+(?P<name>[\w\d]+)\s+(?P<status>\w+)$")
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -6077,37 +6075,37 @@ class ShowL2vpnEvpnEsiMlagSummary(ShowL2vpnEvpnEsiMlagSummarySchema):
          ret_dict = {}
 
          # BGP is not configured or not up
-         p1_0 = re.compile(r'^BGP is not configured or not up$')
+         p1_0 = regex_engine.compile(r'^BGP is not configured or not up$')
 
          # Local BGP RouterID : 10.0.1.14, ASN : 65034
-         p1 = re.compile(r'^Local\s+BGP\s+RouterID\s+:\s+'
-                        r'(?P<bgp_router_id>[\d\.]+)\,\s+ASN\s+:\s+'
-                        r'(?P<asn>\d+)$')
+         p1 = regex_engine.compile(r'^Local\s+BGP\s+RouterID\s+:\s+'
+                                  r'(?P<bgp_router_id>[\d\.]+)\,\s+ASN\s+:\s+'
+                                  r'(?P<asn>\d+)$')
 
          # Neighbor IP : 10.0.1.13, Up/Down : 00:22:25, State/PfxRcd : 2560, Source Interface : Loopback1
-         p2 = re.compile(r'^Neighbor\s+IP\s+:\s+(?P<nbr_ip>[\d\.]+)\,'
-                        r'\s+Up\/Down\s+:\s+(?P<up_down_time>[\:\S]+)\,'
-                        r'\s+State\/PfxRcd\s+:\s+(?P<state>\S+)\,'
-                        r'\s+Source\sInterface\s:\s+(?P<src_interface>\S+)$')
+         p2 = regex_engine.compile(r'^Neighbor\s+IP\s+:\s+(?P<nbr_ip>[\d\.]+)\,'
+                                  r'\s+Up\/Down\s+:\s+(?P<up_down_time>[\:\S]+)\,'
+                                  r'\s+State\/PfxRcd\s+:\s+(?P<state>\S+)\,'
+                                  r'\s+Source\sInterface\s:\s+(?P<src_interface>\S+)$')
 
          #Total Port-Channel Count       : 3
-         p3 = re.compile(r'^Total\s+Port\-Channel\s+Count\s+:\s+'
-                        r'(?P<pc_count>\d+)$')
+         p3 = regex_engine.compile(r'^Total\s+Port\-Channel\s+Count\s+:\s+'
+                                  r'(?P<pc_count>\d+)$')
 
          #Total VLAN Count               : 300
-         p4 = re.compile(r'^Total\s+VLAN\s+Count\s+:\s+'
-                        r'(?P<vlan_count>\d+)$')
+         p4 = regex_engine.compile(r'^Total\s+VLAN\s+Count\s+:\s+'
+                                  r'(?P<vlan_count>\d+)$')
 
          #Total MAC Count                : 1048
-         p5 = re.compile(r'^Total\s+MAC\s+Count\s+:\s+(?P<mac_count>\d+)$')
+         p5 = regex_engine.compile(r'^Total\s+MAC\s+Count\s+:\s+(?P<mac_count>\d+)$')
 
          # Interface       ESI                      State
          # --------------- ------------------------ ------
          # Po6             0150.F722.D491.0000.0600 Ready
          # Po5             0170.1F53.9AB0.8000.0500 Ready
-         p6_0 = re.compile(r'^Interface\s+ESI\s+State$')
-         p6 = re.compile(r'^(?P<interface>[\w\d]+)\s+(?P<esi_id>[\S.]+)'
-                        r'\s+(?P<state>[\w\s]+)$')
+         p6_0 = regex_engine.compile(r'^Interface\s+ESI\s+State$')
+         p6 = regex_engine.compile(r'^(?P<interface>[\w\d]+)\s+(?P<esi_id>[\S.]+)'
+                                  r'\s+(?P<state>[\w\s]+)$')
 
          for line in out.splitlines():
              line = line.strip()
@@ -6230,9 +6228,9 @@ class ShowL2vpnEvpnEsiMlagMacIp(ShowL2vpnEvpnEsiMlagMacIpSchema):
 
          # 1100  0014.0100.0001 2001::250:0:0:2 Po3:1100        10.0.1.12
          # 1100  0012.0100.0001 101.0.0.1                       10.0.1.12
-         p1 = re.compile(r'^(?P<vlan>\d+)\s+(?P<mac>[\S.]+)\s+'
-                        r'(?P<ip>[\w.:]+)\s+(?P<local_intf>[\S:\s]+)'
-                        r'\s+(?P<neighbor_ip>[\S.]+)$')
+         p1 = regex_engine.compile(r'^(?P<vlan>\d+)\s+(?P<mac>[\S.]+)\s+'
+                                  r'(?P<ip>[\w.:]+)\s+(?P<local_intf>[\S:\s]+)'
+                                  r'\s+(?P<neighbor_ip>[\S.]+)$')
 
          for line in out.splitlines():
              line = line.strip()
@@ -6291,9 +6289,9 @@ class ShowL2vpnEvpnEsiMlagVlanBrief(ShowL2vpnEvpnEsiMlagVlanBriefSchema):
          # 1400  21400    2         0          Established
          # 1401  21401    2         0          Established
          # 1100  21100    0         0          No BGP, Incomplete
-         p1 = re.compile(r'^(?P<vlan>\d+)\s+(?P<vni>\d+)\s+'
-                        r'(?P<local_mac_cnt>\d+)\s+(?P<remote_mac_cnt>\d+)'
-                        r'\s+(?P<state>[\S,\s]+)$')
+         p1 = regex_engine.compile(r'^(?P<vlan>\d+)\s+(?P<vni>\d+)\s+'
+                                  r'(?P<local_mac_cnt>\d+)\s+(?P<remote_mac_cnt>\d+)'
+                                  r'\s+(?P<state>[\S,\s]+)$')
 
          for line in out.splitlines():
              line = line.strip()
@@ -6362,37 +6360,37 @@ class ShowL2vpnEvpnAllActiveMhSummary(ShowL2vpnEvpnAllActiveMhSummarySchema):
          ret_dict = {}
 
          # BGP is not configured or not up
-         p1_0 = re.compile(r'^BGP is not configured or not up$')
+         p1_0 = regex_engine.compile(r'^BGP is not configured or not up$')
 
          # Local BGP RouterID : 10.0.1.14, ASN : 65034
-         p1 = re.compile(r'^Local\s+BGP\s+RouterID\s+:\s+'
-                        r'(?P<bgp_router_id>[\d\.]+)\,\s+ASN\s+:\s+'
-                        r'(?P<asn>\d+)$')
+         p1 = regex_engine.compile(r'^Local\s+BGP\s+RouterID\s+:\s+'
+                                  r'(?P<bgp_router_id>[\d\.]+)\,\s+ASN\s+:\s+'
+                                  r'(?P<asn>\d+)$')
 
          # Neighbor IP : 10.0.1.13, Up/Down : 00:22:25, State/PfxRcd : 2560, Source Interface : Loopback1
-         p2 = re.compile(r'^Neighbor\s+IP\s+:\s+(?P<nbr_ip>[\d\.]+)\,'
-                        r'\s+Up\/Down\s+:\s+(?P<up_down_time>[\:\S]+)\,'
-                        r'\s+State\/PfxRcd\s+:\s+(?P<state>\S+)\,'
-                        r'\s+Source\sInterface\s:\s+(?P<src_interface>\S+)$')
+         p2 = regex_engine.compile(r'^Neighbor\s+IP\s+:\s+(?P<nbr_ip>[\d\.]+)\,'
+                                  r'\s+Up\/Down\s+:\s+(?P<up_down_time>[\:\S]+)\,'
+                                  r'\s+State\/PfxRcd\s+:\s+(?P<state>\S+)\,'
+                                  r'\s+Source\sInterface\s:\s+(?P<src_interface>\S+)$')
 
          #Total Port-Channel Count       : 3
-         p3 = re.compile(r'^Total\s+Port\-Channel\s+Count\s+:\s+'
-                        r'(?P<pc_count>\d+)$')
+         p3 = regex_engine.compile(r'^Total\s+Port\-Channel\s+Count\s+:\s+'
+                                  r'(?P<pc_count>\d+)$')
 
          #Total VLAN Count               : 300
-         p4 = re.compile(r'^Total\s+VLAN\s+Count\s+:\s+'
-                        r'(?P<vlan_count>\d+)$')
+         p4 = regex_engine.compile(r'^Total\s+VLAN\s+Count\s+:\s+'
+                                  r'(?P<vlan_count>\d+)$')
 
          #Total MAC Count                : 1048
-         p5 = re.compile(r'^Total\s+MAC\s+Count\s+:\s+(?P<mac_count>\d+)$')
+         p5 = regex_engine.compile(r'^Total\s+MAC\s+Count\s+:\s+(?P<mac_count>\d+)$')
 
          # Interface       ESI                      State
          # --------------- ------------------------ ------
          # Po6             0150.F722.D491.0000.0600 Ready
          # Po5             0170.1F53.9AB0.8000.0500 Ready
-         p6_0 = re.compile(r'^Interface\s+ESI\s+State$')
-         p6 = re.compile(r'^(?P<interface>[\w\d]+)\s+(?P<esi_id>[\S.]+)'
-                        r'\s+(?P<state>[\w\s]+)$')
+         p6_0 = regex_engine.compile(r'^Interface\s+ESI\s+State$')
+         p6 = regex_engine.compile(r'^(?P<interface>[\w\d]+)\s+(?P<esi_id>[\S.]+)'
+                                  r'\s+(?P<state>[\w\s]+)$')
 
          for line in out.splitlines():
              line = line.strip()
@@ -6515,9 +6513,9 @@ class ShowL2vpnEvpnAllActiveMhMacIp(ShowL2vpnEvpnAllActiveMhMacIpSchema):
 
          # 1100  0014.0100.0001 2001::250:0:0:2 Po3:1100        10.0.1.12
          # 1100  0012.0100.0001 101.0.0.1                       10.0.1.12
-         p1 = re.compile(r'^(?P<vlan>\d+)\s+(?P<mac>[\S.]+)\s+'
-                        r'(?P<ip>[\w.:]+)\s+(?P<local_intf>[\S:\s]+)'
-                        r'\s+(?P<neighbor_ip>[\S.]+)$')
+         p1 = regex_engine.compile(r'^(?P<vlan>\d+)\s+(?P<mac>[\S.]+)\s+'
+                                  r'(?P<ip>[\w.:]+)\s+(?P<local_intf>[\S:\s]+)'
+                                  r'\s+(?P<neighbor_ip>[\S.]+)$')
 
          for line in out.splitlines():
              line = line.strip()
@@ -6576,9 +6574,9 @@ class ShowL2vpnEvpnAllActiveMhVlanBrief(ShowL2vpnEvpnAllActiveMhVlanBriefSchema)
          # 1400  21400    2         0          Established
          # 1401  21401    2         0          Established
          # 1100  21100    0         0          No BGP, Incomplete
-         p1 = re.compile(r'^(?P<vlan>\d+)\s+(?P<vni>\d+)\s+'
-                        r'(?P<local_mac_cnt>\d+)\s+(?P<remote_mac_cnt>\d+)'
-                        r'\s+(?P<state>[\S,\s]+)$')
+         p1 = regex_engine.compile(r'^(?P<vlan>\d+)\s+(?P<vni>\d+)\s+'
+                                  r'(?P<local_mac_cnt>\d+)\s+(?P<remote_mac_cnt>\d+)'
+                                  r'\s+(?P<state>[\S,\s]+)$')
 
          for line in out.splitlines():
              line = line.strip()
@@ -20,7 +20,6 @@
      *  show etherchannel <channel_group> detail
 """
 # Python
-import re
 import random
 
 # Metaparser
@@ -34,6 +33,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -65,7 +65,7 @@ class ShowLacpSysId(ShowLacpSysIdSchema):
         # 32768, 001e.49ff.3caf
         # 32768,0014.a9ff.873d
         # 8000,AC-12-34-FF-CE-E6
-        p1 = re.compile(r'^\s*(?P<system_priority>[\d]+), *(?P<system_id_mac>[\w\.\-]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<system_priority>[\d]+), *(?P<system_id_mac>[\w\.\-]+)$')
 
         for line in out.splitlines():
             if line:
@@ -147,11 +147,11 @@ class ShowLacpCounters(ShowLacpCountersSchema):
         #   Fa4/1    8      15       0      0         3    0
         #   Fa4/3    14     18       0      0         0
 
-        p1 = re.compile(r'^\s*Channel +group: +(?P<channel_group>[\d]+)$')
-        p2 = re.compile(r'^\s*(?P<interface>[\w\/]+) +(?P<lacp_out_pkts>[\d]+) +(?P<lacp_in_pkts>[\d]+)'
-                         r' +(?P<marker_out_pkts>[\d]+) +(?P<marker_in_pkts>[\d]+)'
-                         r'( +(?P<marker_response_out_pkts>[\d]+) +(?P<marker_response_in_pkts>[\d]+))?'
-                         r' +(?P<lacp_pkts>[\d]+)( +(?P<lacp_errors>[\d]+))?$')
+        p1 = regex_engine.compile(r'^\s*Channel +group: +(?P<channel_group>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<interface>[\w\/]+) +(?P<lacp_out_pkts>[\d]+) +(?P<lacp_in_pkts>[\d]+)'
+                                   r' +(?P<marker_out_pkts>[\d]+) +(?P<marker_in_pkts>[\d]+)'
+                                   r'( +(?P<marker_response_out_pkts>[\d]+) +(?P<marker_response_in_pkts>[\d]+))?'
+                                   r' +(?P<lacp_pkts>[\d]+)( +(?P<lacp_errors>[\d]+))?$')
 
         for line in out.splitlines():
             if line:
@@ -250,12 +250,12 @@ class ShowLacpInternal(ShowLacpInternalSchema):
         #                             LACPDUs     LACP Port    Admin   Oper    Port     Port
         # Port      Flags    State    Interval    Priority     Key     Key     Number   State
         # Fa4/1     saC      bndl     30s         32768        100     100     0xc1     0x75
-        p1 = re.compile(r'^\s*Channel +group +(?P<channel_group>[\d]+)$')
-        p2 = re.compile(r'^\s*(?P<interface>[\w\/]+) +(?P<flags>[\w]+)'
-                        r' +(?P<state>[\S]+)( +(?P<lacp_interval>[\w]+))?'
-                        r' +(?P<lacp_port_priority>[\d]+) +(?P<admin_key>[\w]+)'
-                        r' +(?P<oper_key>[\w]+) +(?P<port_num>[\w]+)'
-                        r' +(?P<port_state>[\w]+)$')
+        p1 = regex_engine.compile(r'^\s*Channel +group +(?P<channel_group>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<interface>[\w\/]+) +(?P<flags>[\w]+)'
+                                  r' +(?P<state>[\S]+)( +(?P<lacp_interval>[\w]+))?'
+                                  r' +(?P<lacp_port_priority>[\d]+) +(?P<admin_key>[\w]+)'
+                                  r' +(?P<oper_key>[\w]+) +(?P<port_num>[\w]+)'
+                                  r' +(?P<port_state>[\w]+)$')
 
         for line in out.splitlines():
             if line:
@@ -357,11 +357,11 @@ class ShowLacpNeighbor(ShowLacpNeighborSchema):
         # Port      Flags   Priority  Dev ID          Age    key    Key    Number  State
         # Gi2       SA      32768     001e.49ff.a3e6  25s    0x0    0x1    0x1     0x3D
         # Gi5/0/0   SP      32768     0011.20ff.9926  11s    0x1    0x14   0x3C
-        p1 = re.compile(r'^\s*Channel +group +(?P<channel_group>[\d]+) +neighbors$')
-        p2 = re.compile(r'^\s*(?P<interface>[\w\/]+) +(?P<flags>[\w]+)'
-                        r' +(?P<lacp_port_priority>[\d]+) +(?P<partner_id>[\w\.]+) +(?P<age>[\d]+)s +(?P<admin_key>[\w]+)'
-                        r' +(?P<oper_key>[\w]+) +(?P<port_num>[\w]+)'
-                        r'( +(?P<port_state>[\w]+))?$')
+        p1 = regex_engine.compile(r'^\s*Channel +group +(?P<channel_group>[\d]+) +neighbors$')
+        p2 = regex_engine.compile(r'^\s*(?P<interface>[\w\/]+) +(?P<flags>[\w]+)'
+                                  r' +(?P<lacp_port_priority>[\d]+) +(?P<partner_id>[\w\.]+) +(?P<age>[\d]+)s +(?P<admin_key>[\w]+)'
+                                  r' +(?P<oper_key>[\w]+) +(?P<port_num>[\w]+)'
+                                  r'( +(?P<port_state>[\w]+))?$')
 
         for line in out.splitlines():
             if line:
@@ -458,10 +458,10 @@ class ShowPagpCounters(ShowPagpCountersSchema):
         # Channel group: 1
         # Gi0/1     60      52       0       0       0
 
-        p1 = re.compile(r'^\s*Channel +group: +(?P<channel_group>[\d]+)$')
-        p2 = re.compile(r'^\s*(?P<interface>[\w\/]+) +(?P<information_out_pkts>[\d]+)'
-                        r' +(?P<information_in_pkts>[\d]+) +(?P<flush_out_pkts>[\d]+) +(?P<flush_in_pkts>[\d]+)'
-                        r' +(?P<pagp_errors>[\d]+)$')
+        p1 = regex_engine.compile(r'^\s*Channel +group: +(?P<channel_group>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<interface>[\w\/]+) +(?P<information_out_pkts>[\d]+)'
+                                  r' +(?P<information_in_pkts>[\d]+) +(?P<flush_out_pkts>[\d]+) +(?P<flush_in_pkts>[\d]+)'
+                                  r' +(?P<pagp_errors>[\d]+)$')
 
         for line in out.splitlines():
             if line:
@@ -542,14 +542,14 @@ class ShowPagpNeighbor(ShowPagpNeighborSchema):
 
         result_dict = {}
         # Channel group 1 neighbors
-        p1 = re.compile(r'^Channel +group +(?P<channel_group>[\d]+) +neighbors$')
+        p1 = regex_engine.compile(r'^Channel +group +(?P<channel_group>[\d]+) +neighbors$')
         #           Partner              Partner          Partner         Partner Group
         # Port      Name                 Device ID        Port       Age  Flags   Cap.
         # Gi0/1     iosvl2-2             5e02.40ff.8101   Gi0/1       11s SC      10001
         # Gi1/0/15    R5                   6c41.6aff.5d65   Gi1/0/1      5s  SC       A0001
-        p2 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +(?P<partner_name>[\w\-\.]+)'
-                        r' +(?P<partner_id>[\w\.]+) *(?P<partner_port>[\w\/\.\-]+) +(?P<age>[\d]+)s +(?P<flags>[\w]+)'
-                        r' *(?P<group_cap>[\w]+)$')
+        p2 = regex_engine.compile(r'^(?P<interface>[\w\/\.\-]+) +(?P<partner_name>[\w\-\.]+)'
+                                  r' +(?P<partner_id>[\w\.]+) *(?P<partner_port>[\w\/\.\-]+) +(?P<age>[\d]+)s +(?P<flags>[\w]+)'
+                                  r' *(?P<group_cap>[\w]+)$')
 
         for line in out.splitlines():
             if line:
@@ -648,11 +648,11 @@ class ShowPagpInternal(ShowPagpInternalSchema):
         # Gi1/0/8     d     U1/S1           1s       0        128        Any       0
         # Gi1/0/9     d     U1/S1           1s       0        128        Any       0
 
-        p1 = re.compile(r'^\s*Channel +group +(?P<channel_group>[\d]+)$')
-        p2 = re.compile(r'^\s*(?P<interface>[\w\/]+) +(?P<flags>[\w\s]+)'
-                        r' +(?P<state>[\w\/]+)( +(?P<timers>[\w]+))? +(?P<hello_interval>[\d]+)[\w]'
-                        r' +(?P<partner_count>[\d]+) +(?P<pagp_port_priority>[\d]+)'
-                        r' +(?P<learn_method>[\w]+) +(?P<group_ifindex>[\d]+)$')
+        p1 = regex_engine.compile(r'^\s*Channel +group +(?P<channel_group>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<interface>[\w\/]+) +(?P<flags>[\w\s]+)'
+                                  r' +(?P<state>[\w\/]+)( +(?P<timers>[\w]+))? +(?P<hello_interval>[\d]+)[\w]'
+                                  r' +(?P<partner_count>[\d]+) +(?P<pagp_port_priority>[\d]+)'
+                                  r' +(?P<learn_method>[\w]+) +(?P<group_ifindex>[\d]+)$')
 
         for line in out.splitlines():
             if line:
@@ -776,20 +776,20 @@ class ShowEtherchannelSummary(ShowEtherchannelSummarySchema):
         # ------+-------------+-----------+-----------------------------------------------
         # 10     Po10(SU)        PAgP        Gi1/0/15(P)     Gi1/0/16(P)     
         #                                    Gi1/0/17(P)     
-        p1 = re.compile(r'^\s*Number +of +channel-groups +in +use: +(?P<number_of_lag_in_use>[\d]+)$')
-        p2 = re.compile(r'^\s*Number +of +aggregators: +(?P<number_of_aggregators>[\d]+)$')
-        p3 = re.compile(r'^\s*(?P<bundle_id>[\d\s]+)(?P<name>[\w\-]+)\((?P<flags>[\w]+)\)?'
-                        r'( +(?P<protocol>[\w\-]+))?( +((?P<ports>[\w\-\s\/\(\)]+)))?$')
-        p4 = re.compile(r'^\s*(?P<bundle_id>[\d\t]+)(?P<name>[\w\-\t]+)\((?P<flags>[\w]+)\)'
-                        r'(?P<protocol>[\w\-\t]+)?((?P<ports>[\w\-\s\/\(\)]+))?$')
+        p1 = regex_engine.compile(r'^\s*Number +of +channel-groups +in +use: +(?P<number_of_lag_in_use>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*Number +of +aggregators: +(?P<number_of_aggregators>[\d]+)$')
+        p3 = regex_engine.compile(r'^\s*(?P<bundle_id>[\d\s]+)(?P<name>[\w\-]+)\((?P<flags>[\w]+)\)?'
+                                  r'( +(?P<protocol>[\w\-]+))?( +((?P<ports>[\w\-\s\/\(\)]+)))?$')
+        p4 = regex_engine.compile(r'^\s*(?P<bundle_id>[\d\t]+)(?P<name>[\w\-\t]+)\((?P<flags>[\w]+)\)'
+                                  r'(?P<protocol>[\w\-\t]+)?((?P<ports>[\w\-\s\/\(\)]+))?$')
         # Group  Port-channel  Protocol    Ports
         # ------+-------------+-----------+-----------------------------------------------
         # 10     Po10(SU)        PAgP        Gi1/0/15(P)     Gi1/0/16(P)     
         #                                    Gi1/0/17(P)     
-        p5 = re.compile(r'^\s*(?P<ports>[\w\-\/\(\)]+)$')
+        p5 = regex_engine.compile(r'^\s*(?P<ports>[\w\-\/\(\)]+)$')
         #                                  Te2/0/3(s)      Te3/0/1(s)
         #                                  Te3/0/2(D)      Te3/0/3(P)
-        p6 = re.compile(r'^\s*(?P<port1>[\w\-\/\(\)]+)\s+(?P<port2>[\w\-\/\(\)]+)$')
+        p6 = regex_engine.compile(r'^\s*(?P<port1>[\w\-\/\(\)]+)\s+(?P<port2>[\w\-\/\(\)]+)$')
 
         for line in out.splitlines():
             if line:
@@ -960,9 +960,9 @@ class ShowEtherChannelLoadBalancing(ShowEtherChannelLoadBalancingSchema):
         # LB Algo type: Source Destination IP
         #   Port-Channel:                       LB Method
         #     Port-channel1                   :  flow-based (Source Destination IP)
-        p1 = re.compile(r'^\s*Global +LB +Method: *(?P<global_lb_method>[\w-]*)$')
-        p2 = re.compile(r'^\s*LB +Algo +type: *(?P<lb_algo_type>[\w\s]*)$')
-        p3 = re.compile(r'^\s*(?P<port_channel>[\w-]+) +: *(?P<lb_method>.+)$')
+        p1 = regex_engine.compile(r'^\s*Global +LB +Method: *(?P<global_lb_method>[\w-]*)$')
+        p2 = regex_engine.compile(r'^\s*LB +Algo +type: *(?P<lb_algo_type>[\w\s]*)$')
+        p3 = regex_engine.compile(r'^\s*(?P<port_channel>[\w-]+) +: *(?P<lb_method>.+)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -1046,25 +1046,25 @@ class ShowLacpNeighborDetail(ShowLacpNeighborDetailSchema):
         result_dict = {}
         
         # Channel group 1 neighbors
-        p1 = re.compile(r'^\s*Channel +group +(?P<channel_group>[\d]+)')
+        p1 = regex_engine.compile(r'^\s*Channel +group +(?P<channel_group>[\d]+)')
 
         # Port           System ID             Port Number     Age         Flags
         # Gi0/0/1         00127,6487.88ff.68ef  0x2              28s        FA
-        p2 = re.compile(r'^\s*(?P<interface>[\w/]+) +(?P<system_id>[\w,.]+) +(?P<port_num>[\w]+)'
-                        r' +(?P<age>[\d]+)s +(?P<flags>[\w]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<interface>[\w/]+) +(?P<system_id>[\w,.]+) +(?P<port_num>[\w]+)'
+                                  r' +(?P<age>[\d]+)s +(?P<flags>[\w]+)$')
 
         # Port Priority        Oper Key        Port State
         # 100                  0x1             0x3F
-        p3 = re.compile(r'^\s*(?P<lacp_port_priority>[\d.]+) +(?P<oper_key>[\w]+) +(?P<port_state>[\w]+)$')
+        p3 = regex_engine.compile(r'^\s*(?P<lacp_port_priority>[\d.]+) +(?P<oper_key>[\w]+) +(?P<port_state>[\w]+)$')
 
         # Activity:   Timeout:   Aggregation:   Synchronization:
         # Active      Short      Yes            Yes
-        p4 = re.compile(r'^\s*(?P<activity>[\w]+) +(?P<timeout>Long|Short)'
-                        r' +(?P<aggregatable>[\w]+) +(?P<synchronization>[\w]+)$')
+        p4 = regex_engine.compile(r'^\s*(?P<activity>[\w]+) +(?P<timeout>Long|Short)'
+                                  r' +(?P<aggregatable>[\w]+) +(?P<synchronization>[\w]+)$')
 
         # Collecting:   Distributing:   Defaulted:   Expired:
         # Yes           Yes             No           No 
-        p5 = re.compile(r'^\s*(?P<collecting>Yes|No) +(?P<distributing>[\w]+) +(?P<defaulted>[\w]+) +(?P<expired>[\w]+)$')
+        p5 = regex_engine.compile(r'^\s*(?P<collecting>Yes|No) +(?P<distributing>[\w]+) +(?P<defaulted>[\w]+) +(?P<expired>[\w]+)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -1213,79 +1213,79 @@ class ShowEtherChannelDetail(ShowEtherChannelDetailSchema):
             output = self.device.execute(self.cli_command.format(channel_group=channel_group))
         
         # Group state = L2
-        p1 = re.compile(r'^Group state = (?P<group_state>\w+)$')
+        p1 = regex_engine.compile(r'^Group state = (?P<group_state>\w+)$')
 
         # Ports: 2   Maxports = 16
-        p2 = re.compile(r'^Ports:\s+(?P<ports>\d+)\s+Maxports =\s+(?P<max_ports>\d+)$')
+        p2 = regex_engine.compile(r'^Ports:\s+(?P<ports>\d+)\s+Maxports =\s+(?P<max_ports>\d+)$')
 
         # Port-channels: 1 Max Port-channels = 16
-        p3 = re.compile(r'^Port-channels:\s(?P<port_channels>\d+)\s+Max Port-channels =\s(?P<max_port_channels>\d+)$')
+        p3 = regex_engine.compile(r'^Port-channels:\s(?P<port_channels>\d+)\s+Max Port-channels =\s(?P<max_port_channels>\d+)$')
 
         # Protocol:   LACP
-        p4 = re.compile(r'^Protocol:\s+(?P<protocol>\w+)$')
+        p4 = regex_engine.compile(r'^Protocol:\s+(?P<protocol>\w+)$')
 
         # Minimum Links: 0
-        p5 = re.compile(r'^Minimum Links:\s+(?P<minimum_links>\d+)$')
+        p5 = regex_engine.compile(r'^Minimum Links:\s+(?P<minimum_links>\d+)$')
 
         # Port: Twe1/0/13
-        p6 = re.compile(r'^Port:\s+(?P<port>[\w/\.]+)$')
+        p6 = regex_engine.compile(r'^Port:\s+(?P<port>[\w/\.]+)$')
 
         # Port state    = Up Mstr Assoc In-Bndl 
-        p7 = re.compile(r'^Port state    =\s+(?P<port_state>.+)$')
+        p7 = regex_engine.compile(r'^Port state    =\s+(?P<port_state>.+)$')
 
         # Channel group = 1           Mode = Active          Gcchange = -
-        p8 = re.compile(r'^Channel\sgroup\s=\s+(?P<channel_group>\d+)\s+Mode\s=\s(?P<mode>\w+)\s+Gcchange\s=\s(?P<gcchange>\S+)$')
+        p8 = regex_engine.compile(r'^Channel\sgroup\s=\s+(?P<channel_group>\d+)\s+Mode\s=\s(?P<mode>\w+)\s+Gcchange\s=\s(?P<gcchange>\S+)$')
 
         # Port-channel  = Po1         GC   =   -             Pseudo port-channel = Po1
-        p9 = re.compile(r'^Port-channel\s+=\s(?P<port_channel>\w+)\s+GC\s+=\s+(?P<gc>\S+)\s+Pseudo\sport-channel\s=\s(?P<pseudo_port_channel>\w+)$')
+        p9 = regex_engine.compile(r'^Port-channel\s+=\s(?P<port_channel>\w+)\s+GC\s+=\s+(?P<gc>\S+)\s+Pseudo\sport-channel\s=\s(?P<pseudo_port_channel>\w+)$')
 
         # Port index    = 0           Load = 0x00            Protocol =   LACP
-        p10 = re.compile(r'^Port\sindex\s+=\s(?P<port_index>\d+)\s+Load\s=\s(?P<load>\w+)\s+Protocol\s=\s+(?P<protocol>\S+)$')
+        p10 = regex_engine.compile(r'^Port\sindex\s+=\s(?P<port_index>\d+)\s+Load\s=\s(?P<load>\w+)\s+Protocol\s=\s+(?P<protocol>\S+)$')
 
         # Age of the port in the current state: 0d:00h:03m:14s
-        p11 = re.compile(r'^Age of the port in the current state:\s(?P<age>\S+)$')
+        p11 = regex_engine.compile(r'^Age of the port in the current state:\s(?P<age>\S+)$')
 
         # Twe1/0/13     SA      bndl      200          0x1       0x1     0x10E       0x3D
-        p12 = re.compile(r'^(?P<port>[\w/\.]+)\s+(?P<flags>\w+)\s+(?P<state>\S+)\s+(?P<lacp_priority>\d+)\s+(?P<admin_key>\w+)\s+(?P<oper_key>\w+)\s+(?P<port_number>\w+)\s+(?P<port_state>\w+)$')
+        p12 = regex_engine.compile(r'^(?P<port>[\w/\.]+)\s+(?P<flags>\w+)\s+(?P<state>\S+)\s+(?P<lacp_priority>\d+)\s+(?P<admin_key>\w+)\s+(?P<oper_key>\w+)\s+(?P<port_number>\w+)\s+(?P<port_state>\w+)$')
 
         # Twe1/0/13     SA     32768     6cb2.ae4a.54c0   6s  0x0    0x1    0x804   0x3D 
-        p13 = re.compile(r'^(?P<port>[\w/\.]+)\s+(?P<flags>\w+)\s+(?P<lacp_priority>\d+)\s+(?P<dev_id>[a-f0-9\.]+)\s+(?P<age>\w+)\s+(?P<admin_key>\w+)\s+(?P<oper_key>\w+)\s+(?P<port_number>\w+)\s+(?P<port_state>\w+)$')
+        p13 = regex_engine.compile(r'^(?P<port>[\w/\.]+)\s+(?P<flags>\w+)\s+(?P<lacp_priority>\d+)\s+(?P<dev_id>[a-f0-9\.]+)\s+(?P<age>\w+)\s+(?P<admin_key>\w+)\s+(?P<oper_key>\w+)\s+(?P<port_number>\w+)\s+(?P<port_state>\w+)$')
 
         # Port-channel: Po1    (Primary Aggregator)
-        p14 = re.compile(r'^Port\-channel:\s(?P<port_channel>\S+).+$')
+        p14 = regex_engine.compile(r'^Port\-channel:\s(?P<port_channel>\S+).+$')
 
         # Age of the Port-channel   = 0d:00h:10m:38s
-        p15 = re.compile(r'^Age of the Port\-channel\s+=\s(?P<age>\S+)$')
+        p15 = regex_engine.compile(r'^Age of the Port\-channel\s+=\s(?P<age>\S+)$')
 
         # Logical slot/port   = 9/1          Number of ports = 1
-        p16 = re.compile(r'^Logical slot/port\s+=\s(?P<logical_slot>\S+)\s+Number of ports =\s(?P<number_of_ports>\d+)$')
+        p16 = regex_engine.compile(r'^Logical slot/port\s+=\s(?P<logical_slot>\S+)\s+Number of ports =\s(?P<number_of_ports>\d+)$')
 
         # HotStandBy port = Twe1/0/15 
-        p17 = re.compile(r'^HotStandBy port =\s(?P<hot_standby>[\w/\.]+)$')
+        p17 = regex_engine.compile(r'^HotStandBy port =\s(?P<hot_standby>[\w/\.]+)$')
 
         # Port state          = Port-channel Ag-Inuse 
-        p18 = re.compile(r'^Port state          =\s(?P<state>.+)$')
+        p18 = regex_engine.compile(r'^Port state          =\s(?P<state>.+)$')
 
         # Protocol            =   LACP
-        p19 = re.compile(r'^Protocol\s+=\s+(?P<protocol>\S+)$')
+        p19 = regex_engine.compile(r'^Protocol\s+=\s+(?P<protocol>\S+)$')
 
         # Port security       = Disabled
-        p20 = re.compile(r'^Port security\s+=\s(?P<port_security>\S+)$')
+        p20 = regex_engine.compile(r'^Port security\s+=\s(?P<port_security>\S+)$')
 
         # Fast-switchover     = disabled
-        p21 = re.compile(r'^Fast\-switchover\s+=\s(?P<fast_switchover>\S+)$')
+        p21 = regex_engine.compile(r'^Fast\-switchover\s+=\s(?P<fast_switchover>\S+)$')
 
         # Fast-switchover Dampening = disabled
-        p22 = re.compile(r'^Fast\-switchover Dampening =\s(?P<dampening>\S+)$')
+        p22 = regex_engine.compile(r'^Fast\-switchover Dampening =\s(?P<dampening>\S+)$')
 
         # Time since last port bundled:    0d:00h:03m:14s     Twe1/0/13
-        p23 = re.compile(r'^Time since last port bundled:\s+(?P<time>\S+)\s+(?P<port>\S+)$')
+        p23 = regex_engine.compile(r'^Time since last port bundled:\s+(?P<time>\S+)\s+(?P<port>\S+)$')
 
         # Time since last port Un-bundled: 0d:00h:03m:16s     Twe1/0/15
-        p24 = re.compile(r'^Time since last port Un\-bundled:\s+(?P<time>\S+)\s+(?P<port>\S+)$')
+        p24 = regex_engine.compile(r'^Time since last port Un\-bundled:\s+(?P<time>\S+)\s+(?P<port>\S+)$')
 
         #   0     00     Twe1/0/13      Active             0
-        p25 = re.compile(r'^(?P<index>\d+)\s+(?P<load>\w+)\s+(?P<port>[\w/\.]+)\s+(?P<ec_state>\S+)\s+(?P<no_of_bits>\d+)$')
+        p25 = regex_engine.compile(r'^(?P<index>\d+)\s+(?P<load>\w+)\s+(?P<port>[\w/\.]+)\s+(?P<ec_state>\S+)\s+(?P<no_of_bits>\d+)$')
 
         ret_dict = dict()
 
@@ -1518,33 +1518,33 @@ class ShowEtherchannelPortChannel(ShowEtherchannelPortChannelSchema):
             output = self.device.execute(self.cli_command.format(number=number))
 
         # Port-channel: Po1
-        p1 = re.compile(r"^Port-channel:\s+(?P<port_channel>\S+).*$")
+        p1 = regex_engine.compile(r"^Port-channel:\s+(?P<port_channel>\S+).*$")
 
         # Age of the Port-channel   = 0d:00h:01m:16s
-        p2 = re.compile(r"^Age of the Port-channel\s+=\s+(?P<age>\S+)$")
+        p2 = regex_engine.compile(r"^Age of the Port-channel\s+=\s+(?P<age>\S+)$")
 
         # Logical slot/port   = 35/1          Number of ports = 2
-        p3 = re.compile(r"^Logical slot/port\s+=\s+(?P<logical_slot>\S+)\s+Number\s+of\s+ports\s+=\s+("
-                          r"?P<number_of_ports>\d+)$")
+        p3 = regex_engine.compile(r"^Logical slot/port\s+=\s+(?P<logical_slot>\S+)\s+Number\s+of\s+ports\s+=\s+("
+                                    r"?P<number_of_ports>\d+)$")
 
         # GC                  = 0x00010001      HotStandBy port = null
-        p4 = re.compile(r"^GC\s+=\s+(?P<gc>\S+)\s+HotStandBy\s+port\s+=\s+null$")
+        p4 = regex_engine.compile(r"^GC\s+=\s+(?P<gc>\S+)\s+HotStandBy\s+port\s+=\s+null$")
 
         # Protocol            =   PAgP
-        p5 = re.compile(r"^Protocol\s+=\s+(?P<protocol>\w+)$")
+        p5 = regex_engine.compile(r"^Protocol\s+=\s+(?P<protocol>\w+)$")
 
         # Port security       = Disabled
-        p6 = re.compile(r"^Port security\s+=\s+(?P<port_security>\w+)$")
+        p6 = regex_engine.compile(r"^Port security\s+=\s+(?P<port_security>\w+)$")
 
         # Fast-switchover     = disabled
-        p7 = re.compile(r"^Fast-switchover\s+=\s+(?P<switchover>\w+)$"
-                          )
+        p7 = regex_engine.compile(r"^Fast-switchover\s+=\s+(?P<switchover>\w+)$"
+                                    )
 
         # Fast-switchover Dampening = disabled
-        p8 = re.compile(r"^Fast-switchover Dampening\s+=\s+(?P<dampening>\w+)$")
+        p8 = regex_engine.compile(r"^Fast-switchover Dampening\s+=\s+(?P<dampening>\w+)$")
 
         #   0     00     Tw1/0/14       Desirable-Sl       0
-        p9 = re.compile(r"^(?P<index>\d+)\s+(?P<load>\d+)\s+(?P<port>\S+)\s+(?P<ec_state>\S+)\s+(?P<bits>\d+)$")
+        p9 = regex_engine.compile(r"^(?P<index>\d+)\s+(?P<load>\d+)\s+(?P<port>\S+)\s+(?P<ec_state>\S+)\s+(?P<bits>\d+)$")
 
         ret_dict = {}
 
@@ -1647,11 +1647,11 @@ class ShowEtherchannelProtocol(ShowEtherchannelProtocolSchema):
             output = self.device.execute(self.cli_command)
 
         # Group: 1
-        p1 = re.compile(r"^Group:\s+(?P<group>\d+)$")
+        p1 = regex_engine.compile(r"^Group:\s+(?P<group>\d+)$")
 
         # Protocol:   -  (Mode ON)
         # Protocol:  LACP
-        p1_1 = re.compile(r"^Protocol:\s+-?\s+\(?(?P<protocol>[\w\s]+)\)?$")
+        p1_1 = regex_engine.compile(r"^Protocol:\s+-?\s+\(?(?P<protocol>[\w\s]+)\)?$")
 
         ret_dict = {}
 
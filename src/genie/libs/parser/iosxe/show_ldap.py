@@ -6,14 +6,12 @@
         * Show ldap server {name} summary
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ============================================
@@ -94,49 +92,49 @@ class ShowLdapServerAll(ShowLdapServerAllSchema):
             output = self.device.execute(cmd)
     
         #Server name :mgmt-ldap
-        p1 = re.compile(r'^Server +name\s+:(?P<server_name>.*)$')
+        p1 = regex_engine.compile(r'^Server +name\s+:(?P<server_name>.*)$')
         
         #Server Address :10.106.26.254
-        p2 = re.compile(r'^Server Address\s+:(?P<server_address>[\d\.]+)$')
+        p2 = regex_engine.compile(r'^Server Address\s+:(?P<server_address>[\d\.]+)$')
         
         #Server listening Port :389
-        p3 = re.compile(r'^Server listening Port\s+:(?P<server_listening_port>\d+)$')
+        p3 = regex_engine.compile(r'^Server listening Port\s+:(?P<server_listening_port>\d+)$')
 
         #Bind Root-dn :Administrator
-        p4 = re.compile(r'^Bind Root-dn\s+:(?P<bind_rootdn>.*)$')
+        p4 = regex_engine.compile(r'^Bind Root-dn\s+:(?P<bind_rootdn>.*)$')
         
         #Server mode :Non-Secure
-        p5 = re.compile(r'^Server mode\s+:(?P<server_mode>.*)$')
+        p5 = regex_engine.compile(r'^Server mode\s+:(?P<server_mode>.*)$')
 
         #Cipher Suite :0x10
-        p6 = re.compile(r'^Cipher Suite\s+:(?P<cipher_suite>.*)$')
+        p6 = regex_engine.compile(r'^Cipher Suite\s+:(?P<cipher_suite>.*)$')
         
         #Request timeout :20
-        p7 = re.compile(r'^Request timeout\s+:(?P<request_timeout>\d+)$')
+        p7 = regex_engine.compile(r'^Request timeout\s+:(?P<request_timeout>\d+)$')
         
         #Deadtime in Mins :0
-        p8 = re.compile(r'^Deadtime in Mins\s+:(?P<deadtime>\d+)$')
+        p8 = regex_engine.compile(r'^Deadtime in Mins\s+:(?P<deadtime>\d+)$')
         
         #State :ALIVE
-        p9 = re.compile(r'^State\s+:(?P<state>.*)$')
+        p9 = regex_engine.compile(r'^State\s+:(?P<state>.*)$')
         
         #No. of active connections :0
-        p10 = re.compile(r'^No. of active connections\s+:(?P<no_of_active_connections>\d+)$')
+        p10 = regex_engine.compile(r'^No. of active connections\s+:(?P<no_of_active_connections>\d+)$')
 
         #Total messages  [Sent:0, Received:0]
-        p11 = re.compile(r'^Total messages\s+\[Sent:+(?P<sent>\d+)\, Received:+(?P<received>\d+)\]$')
+        p11 = regex_engine.compile(r'^Total messages\s+\[Sent:+(?P<sent>\d+)\, Received:+(?P<received>\d+)\]$')
 
         #Response delay(ms) [Average:0, Maximum:0]
-        p12 = re.compile(r'^Response delay\(ms\) \[Average:+(?P<average>\d+)\, Maximum:+(?P<maximum>\d+)\]$')
+        p12 = regex_engine.compile(r'^Response delay\(ms\) \[Average:+(?P<average>\d+)\, Maximum:+(?P<maximum>\d+)\]$')
 
         #Search [Success:0, Failures:0]
-        p13 = re.compile(r'^Search\s+\[Success:+(?P<success>\d+)\, Failures:+(?P<failures>\d+)\]$')
+        p13 = regex_engine.compile(r'^Search\s+\[Success:+(?P<success>\d+)\, Failures:+(?P<failures>\d+)\]$')
 
         #Bind   [Success:0, Failures:0]
-        p14 = re.compile(r'^Bind\s+\[Success:+(?P<success>\d+)\, Failures:+(?P<failures>\d+)\]$')
+        p14 = regex_engine.compile(r'^Bind\s+\[Success:+(?P<success>\d+)\, Failures:+(?P<failures>\d+)\]$')
 
         #Connection   [Closes:0, Aborts:0, Fails:0, Timeouts:0]
-        p15 = re.compile(r'^Connection\s+\[Closes:+(?P<closes>\d+)\, Aborts:+(?P<aborts>\d+)\, Fails:+(?P<fails>\d+)\, Timeouts:+(?P<timeouts>\d+)\]$')
+        p15 = regex_engine.compile(r'^Connection\s+\[Closes:+(?P<closes>\d+)\, Aborts:+(?P<aborts>\d+)\, Fails:+(?P<fails>\d+)\, Timeouts:+(?P<timeouts>\d+)\]$')
 
         #Initial return dictionary
         ret_dict = {}
@@ -299,7 +297,7 @@ class ShowLdapServerConnections(ShowLdapServerConnectionsSchema):
             line = line.strip()
             
             #No. of active connections :0
-            p1 = re.compile(r'^No. of active connections\s+:(?P<no_of_active_connections>\d+)$')
+            p1 = regex_engine.compile(r'^No. of active connections\s+:(?P<no_of_active_connections>\d+)$')
             
             #No of active connections
             m = p1.match(line)
@@ -365,19 +363,19 @@ class ShowLdapServerStatistics(ShowLdapServerStatisticsSchema):
             line = line.strip()
 
             #Total messages  [Sent:0, Received:0]
-            p1 = re.compile(r'^Total +messages\s+\[Sent:+(?P<sent>\d+)\, Received:+(?P<received>\d+)\]$')
+            p1 = regex_engine.compile(r'^Total +messages\s+\[Sent:+(?P<sent>\d+)\, Received:+(?P<received>\d+)\]$')
 
             #Response delay(ms) [Average:0, Maximum:0]
-            p2 = re.compile(r'^Response delay\(ms\) \[Average:+(?P<average>\d+)\, Maximum:+(?P<maximum>\d+)\]$')
+            p2 = regex_engine.compile(r'^Response delay\(ms\) \[Average:+(?P<average>\d+)\, Maximum:+(?P<maximum>\d+)\]$')
 
             #Search [Success:0, Failures:0]
-            p3 = re.compile(r'^Search\s+\[Success:+(?P<success>\d+)\, Failures:+(?P<failures>\d+)\]$')
+            p3 = regex_engine.compile(r'^Search\s+\[Success:+(?P<success>\d+)\, Failures:+(?P<failures>\d+)\]$')
 
             #Bind   [Success:0, Failures:0]
-            p4 = re.compile(r'^Bind\s+\[Success:+(?P<success>\d+)\, Failures:+(?P<failures>\d+)\]$')
+            p4 = regex_engine.compile(r'^Bind\s+\[Success:+(?P<success>\d+)\, Failures:+(?P<failures>\d+)\]$')
 
             #Connection   [Closes:0, Aborts:0, Fails:0, Timeouts:0]
-            p5 = re.compile(r'^Connection\s+\[Closes:+(?P<closes>\d+)\, Aborts:+(?P<aborts>\d+)\, Fails:+(?P<fails>\d+)\, Timeouts:+(?P<timeouts>\d+)\]$')
+            p5 = regex_engine.compile(r'^Connection\s+\[Closes:+(?P<closes>\d+)\, Aborts:+(?P<aborts>\d+)\, Fails:+(?P<fails>\d+)\, Timeouts:+(?P<timeouts>\d+)\]$')
    
             #Total messages 
             m = p1.match(line)
@@ -23,6 +23,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or, ListOf
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =================
@@ -69,20 +70,20 @@ class ShowLicense(ShowLicenseSchema):
             out = output
 
         # Index 1 Feature: appxk9
-        p1 = re.compile(r"Index\s+(?P<id>\d+)\s+Feature:\s+(?P<feature>\S+)")
+        p1 = regex_engine.compile(r"Index\s+(?P<id>\d+)\s+Feature:\s+(?P<feature>\S+)")
         #         Period left: Life time
-        p2 = re.compile(r"\s+(?P<period_left>(Life\s+time|Not\s+Activated))")
+        p2 = regex_engine.compile(r"\s+(?P<period_left>(Life\s+time|Not\s+Activated))")
         #           Period Used: 0  minute  0  second
-        p3 = re.compile(r"\s+(?P<period_minutes>\d+)\s+minute\s+(?P<period_seconds>\d+)\s+second")
+        p3 = regex_engine.compile(r"\s+(?P<period_minutes>\d+)\s+minute\s+(?P<period_seconds>\d+)\s+second")
         #         License Type: Permanent
-        p4 = re.compile(r"\s+(?P<license_type>(Permanent|EvalRightToUse))")
+        p4 = regex_engine.compile(r"\s+(?P<license_type>(Permanent|EvalRightToUse))")
         #         License State: Active, In Use
-        p5 = re.compile(r"\s+((?P<count_in_use>\d+)/(?P<count_violation>\d+)\s+\(In-use/Violation\)|(?P<count>\S+))")
+        p5 = regex_engine.compile(r"\s+((?P<count_in_use>\d+)/(?P<count_violation>\d+)\s+\(In-use/Violation\)|(?P<count>\S+))")
         #         License Priority: None
-        p6 = re.compile(r"\s+(?P<license_priority>\S+)")
+        p6 = regex_engine.compile(r"\s+(?P<license_priority>\S+)")
         #         License State: Active, Not in Use
         #         License State: Active, Not in Use, EULA not accepted
-        p7 = re.compile(r"\s+(?P<license_state>(Active,\s+Not\s+in\s+Use,\s+EULA\s+not\s+accepted|Active,\s+In\s+Use|Active,\s+Not in\s+Use))")
+        p7 = regex_engine.compile(r"\s+(?P<license_state>(Active,\s+Not\s+in\s+Use,\s+EULA\s+not\s+accepted|Active,\s+In\s+Use|Active,\s+Not in\s+Use))")
 
         regex_map = {
             "Period left": p2,
@@ -187,25 +188,25 @@ class ShowLicenseUdi(ShowLicenseUdiSchema):
         ret_dict={}
 
         #Load for five secs: 0%/0%; one minute: 0%; five minutes: 0%
-        p1 = re.compile(r'^Load for five secs:\s*(?P<primary_load_time_percent>[0-9])\%\/(?P<secondary_load_time_percent>[0-9])\%\;\s*one minute:\s*(?P<one_minute_load_percent>[0-9])\%\;\s*five minutes:\s*(?P<five_minute_load_percent>[0-9])\%')
+        p1 = regex_engine.compile(r'^Load for five secs:\s*(?P<primary_load_time_percent>[0-9])\%\/(?P<secondary_load_time_percent>[0-9])\%\;\s*one minute:\s*(?P<one_minute_load_percent>[0-9])\%\;\s*five minutes:\s*(?P<five_minute_load_percent>[0-9])\%')
 
         #Time source is NTP, .06:17:59.041 UTC Thu Sep 9 2021
-        p2 = re.compile(r'^Time source is NTP, +(?P<time_source_is_ntp>.*)$')
+        p2 = regex_engine.compile(r'^Time source is NTP, +(?P<time_source_is_ntp>.*)$')
 
         #UDI: PID:C9300-24UX,SN:FCW2303D16Y
-        p3 = re.compile(r'^UDI: PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p3 = regex_engine.compile(r'^UDI: PID:(?P<pid>.*),SN:(?P<sn>.*)$')
 
         #Active: PID:C9300-24UX,SN:FCW2303D16Y
-        p4 = re.compile(r'^Active:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p4 = regex_engine.compile(r'^Active:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
 
         #Standby: PID:C9300-24U,SN:FHH2043P09E
-        p5 = re.compile(r'^Standby:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p5 = regex_engine.compile(r'^Standby:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
 
         #Member: PID:C9300-48T,SN:FCW2139L056
-        p6 = re.compile(r'^Member:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p6 = regex_engine.compile(r'^Member:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
 
         #*        ASR1001-X             JAF211403VH     ASR1001-X:JAF211403VH
-        p7 = re.compile(r'^(?P<slotid>\S+)\s+(?P<pid>\S+)\s+(?P<sn>\S+)\s+(?P<udi>\S+)')
+        p7 = regex_engine.compile(r'^(?P<slotid>\S+)\s+(?P<pid>\S+)\s+(?P<sn>\S+)\s+(?P<udi>\S+)')
 
         for line in output.splitlines():
           line = line.strip()
@@ -314,13 +315,13 @@ class ShowLicenseSummary(ShowLicenseSummarySchema):
         ret_dict={}
 
         #Smart Account: SA-Switching-Polaris As of Jul 16 07:08:31 2021 PST
-        p1 = re.compile(r'^Smart +Account: +(?P<smart_account>.*)$')
+        p1 = regex_engine.compile(r'^Smart +Account: +(?P<smart_account>.*)$')
 
         #Virtual Account: SLE_Test
-        p2 = re.compile(r'^Virtual +Account: +(?P<virtual_account>.*)$')
+        p2 = regex_engine.compile(r'^Virtual +Account: +(?P<virtual_account>.*)$')
 
         #network-advantage       (C9300-48 Network Advan...)       1 IN USE
-        p3 = re.compile(r'^(?P<license>.+?)\s+\((?P<entitlement>.+)\)\s+(?P<count>\d+)\s+(?P<status>.+)$')
+        p3 = regex_engine.compile(r'^(?P<license>.+?)\s+\((?P<entitlement>.+)\)\s+(?P<count>\d+)\s+(?P<status>.+)$')
 
         for line in output.splitlines():
             line=line.strip()
@@ -384,7 +385,7 @@ class ShowLicenseRumIdAll(ShowLicenseRumIdAllSchema):
         ret_dict = {}
 
         # 1629870048          CLOSED    N     network-premier_2.5G
-        p1 = re.compile(r'^(?P<report_id>\d+)\s+(?P<state>\S+)\s+(?P<flag>\w+)\s+(?P<feature_name>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<report_id>\d+)\s+(?P<state>\S+)\s+(?P<flag>\w+)\s+(?P<feature_name>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -508,116 +509,116 @@ class ShowLicenseStatus(ShowLicenseStatusSchema):
         res=out.splitlines()
 
         #Load for five secs: 2%/0%; one minute: 2%; five minutes: 3%
-        p1=re.compile(r'^Load for five secs: +(?P<load_for_five_secs>.*); +one +minute: +(?P<one_minute>.*); +five +minutes: +(?P<five_minutes>.*)$')
+        p1=regex_engine.compile(r'^Load for five secs: +(?P<load_for_five_secs>.*); +one +minute: +(?P<one_minute>.*); +five +minutes: +(?P<five_minutes>.*)$')
 
         #Time source is NTP, 11:41:04.102 UTC Mon Sep 13 2021
-        p2=re.compile(r'^Time source is NTP, +(?P<time_source_is_ntp>.*)$')
+        p2=regex_engine.compile(r'^Time source is NTP, +(?P<time_source_is_ntp>.*)$')
 
         #Utility:
-        p3= re.compile(r'^Utility:+(?P<utility>.*)$')
+        p3= regex_engine.compile(r'^Utility:+(?P<utility>.*)$')
         #Status: DISABLED
-        p3_1= re.compile(r'^Status: +(?P<status>(ENABLED|DISABLED))$')
+        p3_1= regex_engine.compile(r'^Status: +(?P<status>(ENABLED|DISABLED))$')
 
         #Smart Licensing Using Policy:
-        p4= re.compile(r'^Smart +Licensing +Using +Policy:+(?P<smart_licensing_using_policy>.*)$')
+        p4= regex_engine.compile(r'^Smart +Licensing +Using +Policy:+(?P<smart_licensing_using_policy>.*)$')
 
         #Account Information:
-        p5= re.compile(r'^Account +Information:+(?P<account_information>.*)$')
+        p5= regex_engine.compile(r'^Account +Information:+(?P<account_information>.*)$')
         #Smart Account: SA-Switching-Polaris As of Sep 27 12:59:45 2021 UTC
-        p5_1= re.compile(r'^Smart +Account: +(?P<smart_account>.*)$')
+        p5_1= regex_engine.compile(r'^Smart +Account: +(?P<smart_account>.*)$')
         # Virtual Account: SLE_Test
-        p5_2= re.compile(r'^Virtual +Account: +(?P<virtual_account>.*)$')
+        p5_2= regex_engine.compile(r'^Virtual +Account: +(?P<virtual_account>.*)$')
 
         #Data Privacy:
-        p6= re.compile(r'^Data +Privacy:+(?P<data_privacy>.*)$')
+        p6= regex_engine.compile(r'^Data +Privacy:+(?P<data_privacy>.*)$')
         #Sending Hostname: yes
-        p6_1= re.compile(r'^Sending +Hostname: +(?P<sending_hostname>.*)$')
+        p6_1= regex_engine.compile(r'^Sending +Hostname: +(?P<sending_hostname>.*)$')
         #Callhome hostname privacy: DISABLED
-        p6_2= re.compile(r'^Callhome +hostname +privacy: +(?P<callhome_hostname_privacy>.*)$')
+        p6_2= regex_engine.compile(r'^Callhome +hostname +privacy: +(?P<callhome_hostname_privacy>.*)$')
         #Smart Licensing hostname privacy: DISABLED
-        p6_3= re.compile(r'^Smart +Licensing +hostname +privacy: +(?P<smart_licensing_hostname_privacy>.*)$')
+        p6_3= regex_engine.compile(r'^Smart +Licensing +hostname +privacy: +(?P<smart_licensing_hostname_privacy>.*)$')
         #Version privacy: DISABLED
-        p6_4= re.compile(r'^Version +privacy: +(?P<version_privacy>.*)$')
+        p6_4= regex_engine.compile(r'^Version +privacy: +(?P<version_privacy>.*)$')
 
         #Transport:
-        p7= re.compile(r'^Transport:+(?P<transport>.*)$')
+        p7= regex_engine.compile(r'^Transport:+(?P<transport>.*)$')
         #Type: cslu
-        p7_1 = re.compile(r'^Type: +(?P<type>.*)$')
+        p7_1 = regex_engine.compile(r'^Type: +(?P<type>.*)$')
         #URL: https://smartreceiver-stage.cisco.com/licservice/license
-        p7_2 = re.compile(r'^URL: +(?P<url>.*)$')
+        p7_2 = regex_engine.compile(r'^URL: +(?P<url>.*)$')
         #Cslu address: <empty>
-        p7_3 = re.compile(r'^Cslu +address: +(?P<cslu_address>.*)$')
+        p7_3 = regex_engine.compile(r'^Cslu +address: +(?P<cslu_address>.*)$')
         #Proxy:
-        p7_4 = re.compile(r'^Proxy:+(?P<proxy>.*)$')
+        p7_4 = regex_engine.compile(r'^Proxy:+(?P<proxy>.*)$')
         #Not Configured
-        p7_5=re.compile(r'^Not +Configured$')
+        p7_5=regex_engine.compile(r'^Not +Configured$')
         #VRF:
-        p7_6 = re.compile(r'^VRF:+(?P<vrf>.*)$')
+        p7_6 = regex_engine.compile(r'^VRF:+(?P<vrf>.*)$')
 
 
         #Policy:
-        p8 = re.compile(r'^Policy:+(?P<policy>.*)$')
+        p8 = regex_engine.compile(r'^Policy:+(?P<policy>.*)$')
         #Policy in use: Installed On Sep 27 12:22:33 2021 UTC
-        p8_1 = re.compile(r'^Policy +in +use: +(?P<policy_in_use>.*)$')
+        p8_1 = regex_engine.compile(r'^Policy +in +use: +(?P<policy_in_use>.*)$')
         #Policy name: Custom Policy
-        p8_2 = re.compile(r'^Policy +name: +(?P<policy_name>.*)$')
+        p8_2 = regex_engine.compile(r'^Policy +name: +(?P<policy_name>.*)$')
         #Reporting ACK required: yes (Customer Policy)
-        p8_3 = re.compile(r'^Reporting +ACK +required: +(?P<reporting_ack_required>.*)$')
+        p8_3 = regex_engine.compile(r'^Reporting +ACK +required: +(?P<reporting_ack_required>.*)$')
         #Unenforced/Non-Export Perpetual Attributes:
-        p8_4 = re.compile(r'^Unenforced/Non-Export +Perpetual +Attributes:+(?P<unenforced_non_export_perpetual_attributes>.*)$')
+        p8_4 = regex_engine.compile(r'^Unenforced/Non-Export +Perpetual +Attributes:+(?P<unenforced_non_export_perpetual_attributes>.*)$')
         #First report requirement (days): 365 (Customer Policy)
-        p8_5 = re.compile(r'^First +report +requirement +\(days\): +(?P<first_report_requirement_days>.*)$')
+        p8_5 = regex_engine.compile(r'^First +report +requirement +\(days\): +(?P<first_report_requirement_days>.*)$')
         #Reporting frequency (days): 0 (Customer Policy)
-        p8_6 = re.compile(r'^Reporting +frequency +\(days\): +(?P<reporting_frequency_days>.*)$')
+        p8_6 = regex_engine.compile(r'^Reporting +frequency +\(days\): +(?P<reporting_frequency_days>.*)$')
         #Report on change (days): 90 (Customer Policy)
-        p8_7 = re.compile(r'^Report +on +change +\(days\): +(?P<report_on_change_days>.*)$')
+        p8_7 = regex_engine.compile(r'^Report +on +change +\(days\): +(?P<report_on_change_days>.*)$')
         #Unenforced/Non-Export Subscription Attributes:
-        p8_8 = re.compile(r'^Unenforced/Non-Export +Subscription +Attributes:+(?P<unenforced_non_export_subscription_attributes>.*)$')
+        p8_8 = regex_engine.compile(r'^Unenforced/Non-Export +Subscription +Attributes:+(?P<unenforced_non_export_subscription_attributes>.*)$')
         #Enforced (Perpetual/Subscription) License Attributes:
-        p8_9 = re.compile(r'^Enforced +\(Perpetual/Subscription\) +License +Attributes:+(?P<enforced_perpetual_subscription_license_attributes>.*)$')
+        p8_9 = regex_engine.compile(r'^Enforced +\(Perpetual/Subscription\) +License +Attributes:+(?P<enforced_perpetual_subscription_license_attributes>.*)$')
         #Export (Perpetual/Subscription) License Attributes:
-        p8_10 = re.compile(r'^Export +\(Perpetual/Subscription\) +License +Attributes:+(?P<export_perpetual_subscription_license_attributes>.*)$')
+        p8_10 = regex_engine.compile(r'^Export +\(Perpetual/Subscription\) +License +Attributes:+(?P<export_perpetual_subscription_license_attributes>.*)$')
 
 
         #Miscellaneous:
-        p9 = re.compile(r'^Miscellaneous:+(?P<miscellaneous>.*)$')
+        p9 = regex_engine.compile(r'^Miscellaneous:+(?P<miscellaneous>.*)$')
         #Custom Id: <empty>
-        p9_1 = re.compile(r'^Custom +Id: +(?P<custom_id>.*)$')
+        p9_1 = regex_engine.compile(r'^Custom +Id: +(?P<custom_id>.*)$')
 
         #Usage Reporting:
-        p10 = re.compile(r'^Usage +Reporting:+(?P<usage_reporting>.*)$')
+        p10 = regex_engine.compile(r'^Usage +Reporting:+(?P<usage_reporting>.*)$')
         #Last ACK received: <none>
-        p10_1 = re.compile(r'^Last +ACK +received: +(?P<last_ack_received>.*)$')
+        p10_1 = regex_engine.compile(r'^Last +ACK +received: +(?P<last_ack_received>.*)$')
         #Next ACK deadline: Dec 26 12:32:14 2021 UTC
-        p10_2 = re.compile(r'^Next +ACK +deadline: +(?P<next_ack_deadline>.*)$')
+        p10_2 = regex_engine.compile(r'^Next +ACK +deadline: +(?P<next_ack_deadline>.*)$')
         #Reporting push interval: 30  days
-        p10_3 = re.compile(r'^Reporting +push +interval: +(?P<reporting_push_interval>.*)$')
+        p10_3 = regex_engine.compile(r'^Reporting +push +interval: +(?P<reporting_push_interval>.*)$')
         #Next ACK push check: Sep 29 16:39:27 2021 UTC
-        p10_4 = re.compile(r'^Next +ACK +push +check: +(?P<next_ack_push_check>.*)$')
+        p10_4 = regex_engine.compile(r'^Next +ACK +push +check: +(?P<next_ack_push_check>.*)$')
         #Next report push: Sep 29 13:51:16 2021 UTC
-        p10_5 = re.compile(r'^Next +report +push: +(?P<next_report_push>.*)$')
+        p10_5 = regex_engine.compile(r'^Next +report +push: +(?P<next_report_push>.*)$')
         #Last report push: Sep 27 12:59:50 2021 UTC
-        p10_6= re.compile(r'^Last +report +push: +(?P<last_report_push>.*)$')
+        p10_6= regex_engine.compile(r'^Last +report +push: +(?P<last_report_push>.*)$')
         #Last report file write: <none>
-        p10_7 = re.compile(r'^Last +report +file +write: +(?P<last_report_file_write>.*)$')
+        p10_7 = regex_engine.compile(r'^Last +report +file +write: +(?P<last_report_file_write>.*)$')
 
         #Trust Code Installed:
-        p11 = re.compile(r'^Trust +Code +Installed:+(?P<trust_code_installed>.*)$')
+        p11 = regex_engine.compile(r'^Trust +Code +Installed:+(?P<trust_code_installed>.*)$')
         #Active:
-        p11_1=re.compile(r'^Active: +(?P<active>)')
+        p11_1=regex_engine.compile(r'^Active: +(?P<active>)')
         #Active: PID:C9300-24UX,SN:FCW2303D16Y
-        p11_2=re.compile(r'^Active: +(?P<active>)+PID:+(?P<pid>.*),+SN:+(?P<sn>.*)$')
+        p11_2=regex_engine.compile(r'^Active: +(?P<active>)+PID:+(?P<pid>.*),+SN:+(?P<sn>.*)$')
         #INSTALLED on Sep 27 12:22:33 2021 UTC
         # <none> removed as it also appears in other contexts, like 'Features Authorized'
-        p11_3=re.compile(r'^INSTALLED +on +.*')
+        p11_3=regex_engine.compile(r'^INSTALLED +on +.*')
         #Standby:
-        p11_4=re.compile(r'^Standby: +(?P<standby>)')
+        p11_4=regex_engine.compile(r'^Standby: +(?P<standby>)')
         # Standby: PID:C9300-24U,SN:FHH2043P09E
-        p11_5=re.compile(r'^Standby: +(?P<standby>)+PID:+(?P<pid>.*),+SN:+(?P<sn>.*)$')
+        p11_5=regex_engine.compile(r'^Standby: +(?P<standby>)+PID:+(?P<pid>.*),+SN:+(?P<sn>.*)$')
         #Member:
-        p11_6=re.compile(r'^Member: +(?P<member>)')
+        p11_6=regex_engine.compile(r'^Member: +(?P<member>)')
         #Member: PID:C9300-48T,SN:FCW2139L056
-        p11_7=re.compile(r'^Member: +(?P<member>)+PID:+(?P<pid>.*),+SN:+(?P<sn>.*)$')
+        p11_7=regex_engine.compile(r'^Member: +(?P<member>)+PID:+(?P<pid>.*),+SN:+(?P<sn>.*)$')
 
         for line in res:
           line=line.strip()
@@ -1082,42 +1083,42 @@ class ShowLicenseRumIdDetail(ShowLicenseRumIdDetailSchema):
         ret_dict={}
 
         #Report Id: 1631796710
-        p1 = re.compile(r'^Report +Id: +(?P<report_id>.*)$')
+        p1 = regex_engine.compile(r'^Report +Id: +(?P<report_id>.*)$')
 
         #Feature Name: dna-advantage
-        p2 = re.compile(r'^Feature +Name: +(?P<feature_name>.*)$')
+        p2 = regex_engine.compile(r'^Feature +Name: +(?P<feature_name>.*)$')
 
         #Metric Name: ENTITLEMENT
-        p3 = re.compile(r'^Metric +Name: +(?P<metric_name>.*)$')
+        p3 = regex_engine.compile(r'^Metric +Name: +(?P<metric_name>.*)$')
 
         #UDI:
-        p4=re.compile(r'^UDI:+(?P<udi>)')
+        p4=regex_engine.compile(r'^UDI:+(?P<udi>)')
         #UDI: PID:C9300-24UX,SN:FCW2303D16Y
-        p4_1=re.compile(r'^UDI:+(?P<udi>) +PID:+(?P<pid>.*),+SN:+(?P<sn>.*)$')
+        p4_1=regex_engine.compile(r'^UDI:+(?P<udi>) +PID:+(?P<pid>.*),+SN:+(?P<sn>.*)$')
 
         #Metric Value: regid.2017-05.com.cisco.C9300_48P_Dna_Advantage,1.0_60783b06-53ee-484c-b21e-615d3cf6837a
-        p5 = re.compile(r'^Metric +Value: +(?P<metric_value>.*)$')
+        p5 = regex_engine.compile(r'^Metric +Value: +(?P<metric_value>.*)$')
 
         #Previous Report Id: 1631796706,    Next Report Id: 1631796714
-        p6 = re.compile(r'^Previous +Report +Id: +(?P<previous_report_id>[\S ]+), +'
-                        r'Next +Report +Id: +(?P<next_report_id>.*)$')
+        p6 = regex_engine.compile(r'^Previous +Report +Id: +(?P<previous_report_id>[\S ]+), +'
+                                  r'Next +Report +Id: +(?P<next_report_id>.*)$')
 
         #State: CLOSED,      State Change Reason: REPORTING
-        p7 = re.compile(r'^State: +(?P<state>[\S ]+), +'
-                        r'.*Reason: +(?P<state_change_reason>.*)$')
+        p7 = regex_engine.compile(r'^State: +(?P<state>[\S ]+), +'
+                                  r'.*Reason: +(?P<state_change_reason>.*)$')
 
         #Start Time: Sep 19 05:12:48 2021 UTC,      End Time: Sep 19 05:21:41 2021 UTC
-        p8 = re.compile(r'^Start +Time: +(?P<start_time>[\S ]+), +'
-                        r'End +Time: +(?P<end_time>.*)$')
+        p8 = regex_engine.compile(r'^Start +Time: +(?P<start_time>[\S ]+), +'
+                                  r'End +Time: +(?P<end_time>.*)$')
 
         #Storage State: EXIST
-        p9 = re.compile(r'^Storage +State: +(?P<storage_state>.*)$')
+        p9 = regex_engine.compile(r'^Storage +State: +(?P<storage_state>.*)$')
 
         #Transaction ID: 0
-        p10 = re.compile(r'^Transaction +ID: +(?P<transaction_id>.*)$')
+        p10 = regex_engine.compile(r'^Transaction +ID: +(?P<transaction_id>.*)$')
 
         #Transaction Message: <none>
-        p11 = re.compile(r'^Transaction +Message: +(?P<transaction_message>.*)$')
+        p11 = regex_engine.compile(r'^Transaction +Message: +(?P<transaction_message>.*)$')
 
         for line in output.splitlines():
           line = line.strip()
@@ -1456,160 +1457,160 @@ class ShowLicenseAll(ShowLicenseAllSchema):
         ret_dict={}
         
         #Load for five secs: 0%/0%; one minute: 0%; five minutes: 0%
-        p1=re.compile(r'^Load for five secs: +(?P<load_time>.*); +one +minute: +(?P<one_minute>.*); +five +minutes: +(?P<five_minutes>.*)$')
+        p1=regex_engine.compile(r'^Load for five secs: +(?P<load_time>.*); +one +minute: +(?P<one_minute>.*); +five +minutes: +(?P<five_minutes>.*)$')
         #Time source is NTP, .16:22:51.426 UTC Wed Sep 29 2021
-        p2=re.compile(r'^Time source is NTP, +(?P<ntp_time>.*)$')
+        p2=regex_engine.compile(r'^Time source is NTP, +(?P<ntp_time>.*)$')
 
         #INSTALLED on Sep 27 12:22:33 2021 UTC|<none>
-        p3=re.compile(r'^INSTALLED +on +.*|^<none>.*')
+        p3=regex_engine.compile(r'^INSTALLED +on +.*|^<none>.*')
 
         #Status: DISABLED
-        p4= re.compile(r'^Status: +(?P<status>(ENABLED|DISABLED))$')
+        p4= regex_engine.compile(r'^Status: +(?P<status>(ENABLED|DISABLED))$')
 
         #Smart Account: SA-Switching-Polaris As of Sep 27 12:59:45 2021 UTC
-        p5= re.compile(r'^Smart +Account: +(?P<smart_account>.*)$')
+        p5= regex_engine.compile(r'^Smart +Account: +(?P<smart_account>.*)$')
         # Virtual Account: SLE_Test
-        p5_1= re.compile(r'^Virtual +Account: +(?P<virtual_account>.*)$')
+        p5_1= regex_engine.compile(r'^Virtual +Account: +(?P<virtual_account>.*)$')
 
         #Sending Hostname: yes
-        p6= re.compile(r'^Sending +Hostname: +(?P<sending_hostname>.*)$')
+        p6= regex_engine.compile(r'^Sending +Hostname: +(?P<sending_hostname>.*)$')
         #Callhome hostname privacy: DISABLED
-        p6_1= re.compile(r'^Callhome +hostname +privacy: +(?P<callhome_hostname_privacy>.*)$')
+        p6_1= regex_engine.compile(r'^Callhome +hostname +privacy: +(?P<callhome_hostname_privacy>.*)$')
         #Smart Licensing hostname privacy: DISABLED
-        p6_2= re.compile(r'^Smart +Licensing +hostname +privacy: +(?P<smart_licensing_hostname_privacy>.*)$')
+        p6_2= regex_engine.compile(r'^Smart +Licensing +hostname +privacy: +(?P<smart_licensing_hostname_privacy>.*)$')
         #Version privacy: DISABLED
-        p6_3= re.compile(r'^Version +privacy: +(?P<version_privacy>.*)$')
+        p6_3= regex_engine.compile(r'^Version +privacy: +(?P<version_privacy>.*)$')
 
         #Type: cslu
-        p7 = re.compile(r'^Type: +(?P<type>.*)$')
+        p7 = regex_engine.compile(r'^Type: +(?P<type>.*)$')
         #URL: https://smartreceiver-stage.cisco.com/licservice/license
-        p7_1 = re.compile(r'^URL: +(?P<url>.*)$')
+        p7_1 = regex_engine.compile(r'^URL: +(?P<url>.*)$')
         #Cslu address: <empty>
-        p7_2 = re.compile(r'^Cslu +address: +(?P<cslu_address>.*)$')
+        p7_2 = regex_engine.compile(r'^Cslu +address: +(?P<cslu_address>.*)$')
         #Proxy:
-        p7_3 = re.compile(r'^Proxy:+(?P<proxy>.*)$')
+        p7_3 = regex_engine.compile(r'^Proxy:+(?P<proxy>.*)$')
         #Not Configured
-        p7_4=re.compile(r'^Not +Configured$')
+        p7_4=regex_engine.compile(r'^Not +Configured$')
         #VRF:
-        p7_5 = re.compile(r'^VRF:+(?P<vrf>.*)$')
+        p7_5 = regex_engine.compile(r'^VRF:+(?P<vrf>.*)$')
 
         #Policy in use: Installed On Sep 27 12:22:33 2021 UTC
-        p8 = re.compile(r'^Policy +in +use: +(?P<policy_in_use>.*)$')
+        p8 = regex_engine.compile(r'^Policy +in +use: +(?P<policy_in_use>.*)$')
         #Policy name: Custom Policy
-        p8_1 = re.compile(r'^Policy +name: +(?P<policy_name>.*)$')
+        p8_1 = regex_engine.compile(r'^Policy +name: +(?P<policy_name>.*)$')
         #Reporting ACK required: yes (Customer Policy)
-        p8_2 = re.compile(r'^Reporting +ACK +required: +(?P<reporting_ack_required>.*)$')
+        p8_2 = regex_engine.compile(r'^Reporting +ACK +required: +(?P<reporting_ack_required>.*)$')
         #Unenforced/Non-Export Perpetual Attributes:
-        p8_3 = re.compile(r'^Unenforced/Non-Export +Perpetual +Attributes:+(?P<unenforced_non_export_perpetual_attributes>.*)$')
+        p8_3 = regex_engine.compile(r'^Unenforced/Non-Export +Perpetual +Attributes:+(?P<unenforced_non_export_perpetual_attributes>.*)$')
         #First report requirement (days): 365 (Customer Policy)
-        p8_4 = re.compile(r'^First +report +requirement +\(days\): +(?P<first_report_requirement_days>.*)$')
+        p8_4 = regex_engine.compile(r'^First +report +requirement +\(days\): +(?P<first_report_requirement_days>.*)$')
         #Reporting frequency (days): 0 (Customer Policy)
-        p8_5 = re.compile(r'^Reporting +frequency +\(days\): +(?P<reporting_frequency_days>.*)$')
+        p8_5 = regex_engine.compile(r'^Reporting +frequency +\(days\): +(?P<reporting_frequency_days>.*)$')
         #Report on change (days): 90 (Customer Policy)
-        p8_6 = re.compile(r'^Report +on +change +\(days\): +(?P<report_on_change_days>.*)$')
+        p8_6 = regex_engine.compile(r'^Report +on +change +\(days\): +(?P<report_on_change_days>.*)$')
         #Unenforced/Non-Export Subscription Attributes:
-        p8_7 = re.compile(r'^Unenforced/Non-Export +Subscription +Attributes:+(?P<unenforced_non_export_subscription_attributes>.*)$')
+        p8_7 = regex_engine.compile(r'^Unenforced/Non-Export +Subscription +Attributes:+(?P<unenforced_non_export_subscription_attributes>.*)$')
         #Enforced (Perpetual/Subscription) License Attributes:
-        p8_8 = re.compile(r'^Enforced +\(Perpetual/Subscription\) +License +Attributes:+(?P<enforced_perpetual_subscription_license_attributes>.*)$')
+        p8_8 = regex_engine.compile(r'^Enforced +\(Perpetual/Subscription\) +License +Attributes:+(?P<enforced_perpetual_subscription_license_attributes>.*)$')
         #Export (Perpetual/Subscription) License Attributes:
-        p8_9 = re.compile(r'^Export +\(Perpetual/Subscription\) +License +Attributes:+(?P<export_perpetual_subscription_license_attributes>.*)$')
+        p8_9 = regex_engine.compile(r'^Export +\(Perpetual/Subscription\) +License +Attributes:+(?P<export_perpetual_subscription_license_attributes>.*)$')
 
         #Custom Id: <empty>
-        p9 = re.compile(r'^Custom +Id: +(?P<custom_id>.*)$')
+        p9 = regex_engine.compile(r'^Custom +Id: +(?P<custom_id>.*)$')
 
         #Last ACK received: <none>
-        p10 = re.compile(r'^Last +ACK +received: +(?P<last_ack_received>.*)$')
+        p10 = regex_engine.compile(r'^Last +ACK +received: +(?P<last_ack_received>.*)$')
         #Next ACK deadline: Dec 26 12:32:14 2021 UTC
-        p10_1 = re.compile(r'^Next +ACK +deadline: +(?P<next_ack_deadline>.*)$')
+        p10_1 = regex_engine.compile(r'^Next +ACK +deadline: +(?P<next_ack_deadline>.*)$')
         #Reporting push interval: 30  days
-        p10_2 = re.compile(r'^Reporting +push +interval: +(?P<reporting_push_interval>.*)$')
+        p10_2 = regex_engine.compile(r'^Reporting +push +interval: +(?P<reporting_push_interval>.*)$')
         #Next ACK push check: Sep 29 16:39:27 2021 UTC
-        p10_3 = re.compile(r'^Next +ACK +push +check: +(?P<next_ack_push_check>.*)$')
+        p10_3 = regex_engine.compile(r'^Next +ACK +push +check: +(?P<next_ack_push_check>.*)$')
         #Next report push: Sep 29 13:51:16 2021 UTC
-        p10_4 = re.compile(r'^Next +report +push: +(?P<next_report_push>.*)$')
+        p10_4 = regex_engine.compile(r'^Next +report +push: +(?P<next_report_push>.*)$')
         #Last report push: Sep 27 12:59:50 2021 UTC
-        p10_5= re.compile(r'^Last +report +push: +(?P<last_report_push>.*)$')
+        p10_5= regex_engine.compile(r'^Last +report +push: +(?P<last_report_push>.*)$')
         #Last report file write: <none>
-        p10_6 = re.compile(r'^Last +report +file +write: +(?P<last_report_file_write>.*)$')
+        p10_6 = regex_engine.compile(r'^Last +report +file +write: +(?P<last_report_file_write>.*)$')
 
         #Trust Code Installed:
-        p11 = re.compile(r'^Trust +Code +Installed:+(?P<trust_code_installed>.*)$')
+        p11 = regex_engine.compile(r'^Trust +Code +Installed:+(?P<trust_code_installed>.*)$')
         #Active: PID:C9300-24UX,SN:FCW2303D16Y
-        p11_1=re.compile(r'^Active: PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p11_1=regex_engine.compile(r'^Active: PID:(?P<pid>.*),SN:(?P<sn>.*)$')
         #Standby: PID:C9300-24U,SN:FHH2043P09E
-        p11_2=re.compile(r'^Standby: PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p11_2=regex_engine.compile(r'^Standby: PID:(?P<pid>.*),SN:(?P<sn>.*)$')
         #Member: PID:C9300-48T,SN:FCW2139L056
-        p11_3=re.compile(r'^Member: PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p11_3=regex_engine.compile(r'^Member: PID:(?P<pid>.*),SN:(?P<sn>.*)$')
 
         #(C9300-24 Network Advantage):
-        p12=re.compile(r'^.*\(.*:+(?P<license_name>.*)$')
+        p12=regex_engine.compile(r'^.*\(.*:+(?P<license_name>.*)$')
         #Description: C9300-24 Network Advantage
-        p12_1 = re.compile(r'^Description: +(?P<description>.*)$')
+        p12_1 = regex_engine.compile(r'^Description: +(?P<description>.*)$')
         #Count: 2
-        p12_2 = re.compile(r'^Count: +(?P<count>.*)$')
+        p12_2 = regex_engine.compile(r'^Count: +(?P<count>.*)$')
         #Version: 1.0
-        p12_3 = re.compile(r'^Version: +(?P<version>.*)$')
+        p12_3 = regex_engine.compile(r'^Version: +(?P<version>.*)$')
         #Status: IN USE
-        p12_4 = re.compile(r'^Status: +(?P<status>.*)$')
+        p12_4 = regex_engine.compile(r'^Status: +(?P<status>.*)$')
         #Export status: NOT RESTRICTED
-        p12_5 = re.compile(r'^Export +status: +(?P<export_status>.*)$')
+        p12_5 = regex_engine.compile(r'^Export +status: +(?P<export_status>.*)$')
         #Feature Name: network-advantage
-        p12_6 = re.compile(r'^Feature +Name: +(?P<feature_name>.*)$')
+        p12_6 = regex_engine.compile(r'^Feature +Name: +(?P<feature_name>.*)$')
         #Feature Description: C9300-24 Network Advantage
-        p12_7 = re.compile(r'^Feature +Description: +(?P<feature_description>.*)$')
+        p12_7 = regex_engine.compile(r'^Feature +Description: +(?P<feature_description>.*)$')
         #Enforcement type: NOT ENFORCED
-        p12_8 = re.compile(r'^Enforcement +type: +(?P<enforcement_type>.*)$')
+        p12_8 = regex_engine.compile(r'^Enforcement +type: +(?P<enforcement_type>.*)$')
         #License type: Perpetual
-        p12_9 = re.compile(r'^License +type: +(?P<license_type>.*)$')
+        p12_9 = regex_engine.compile(r'^License +type: +(?P<license_type>.*)$')
 
         #UDI: PID:C9300-24UX,SN:FCW2303D16Y
-        p13 = re.compile(r'^UDI: PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p13 = regex_engine.compile(r'^UDI: PID:(?P<pid>.*),SN:(?P<sn>.*)$')
         #Active: PID:C9300-24UX,SN:FCW2303D16Y
-        p13_1=re.compile(r'^Active:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p13_1=regex_engine.compile(r'^Active:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
         #Standby: PID:C9300-24U,SN:FHH2043P09E
-        p13_2=re.compile(r'^Standby:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p13_2=regex_engine.compile(r'^Standby:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
         #Member: PID:C9300-48T,SN:FCW2139L056
-        p13_3=re.compile(r'^Member:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
+        p13_3=regex_engine.compile(r'^Member:PID:(?P<pid>.*),SN:(?P<sn>.*)$')
 
         #Smart Agent for Licensing: 5.3.10_rel/25
-        p14= re.compile(r'^Smart +Agent +for +Licensing: +(?P<smart_agent_for_licensing>.*)$')
+        p14= regex_engine.compile(r'^Smart +Agent +for +Licensing: +(?P<smart_agent_for_licensing>.*)$')
 
         #License Authorizations
-        p15= re.compile(r'^License +Authorizations+(?P<license_authorizations>)$')
+        p15= regex_engine.compile(r'^License +Authorizations+(?P<license_authorizations>)$')
         #Overall status:
-        p15_1= re.compile(r'^Overall +status:+(?P<overall_status>)$')
+        p15_1= regex_engine.compile(r'^Overall +status:+(?P<overall_status>)$')
         #Last return code: CEL7AU-RaGyRi-dGWrct-Mex5qo-hZbfKf-Pp84Vg-m3QZre-FXjAbH-59J
-        p15_2= re.compile(r'^Last +return +code: +(?P<last_return_code>.*)$')
+        p15_2= regex_engine.compile(r'^Last +return +code: +(?P<last_return_code>.*)$')
         #Last Confirmation code: <none>
-        p15_3= re.compile(r'^Last +Confirmation +code: +(?P<last_confirmation_code>.*)$')
+        p15_3= regex_engine.compile(r'^Last +Confirmation +code: +(?P<last_confirmation_code>.*)$')
 
         #Authorizations:
-        p16_1=re.compile(r'^Authorizations:+(?P<authorizations>)$')
+        p16_1=regex_engine.compile(r'^Authorizations:+(?P<authorizations>)$')
         #Total available count: 3
-        p16_2= re.compile(r'^Total +available +count: +(?P<total_available_count>.*)$')
+        p16_2= regex_engine.compile(r'^Total +available +count: +(?P<total_available_count>.*)$')
         #Term information:
-        p16_3= re.compile(r'^Term +information:+(?P<term_information>)$')
+        p16_3= regex_engine.compile(r'^Term +information:+(?P<term_information>)$')
         #Authorization type: SMART AUTHORIZATION INSTALLED 
-        p16_4= re.compile(r'^Authorization +type: +(?P<authorization_type>.*)$')
+        p16_4= regex_engine.compile(r'^Authorization +type: +(?P<authorization_type>.*)$')
         #Term Count: 1
-        p16_5= re.compile(r'^Term +Count: +(?P<term_count>.*)$')
+        p16_5= regex_engine.compile(r'^Term +Count: +(?P<term_count>.*)$')
 
         #Purchased Licenses:
-        p17= re.compile(r'^Purchased +Licenses:+(?P<purchased_licenses>)$')
+        p17= regex_engine.compile(r'^Purchased +Licenses:+(?P<purchased_licenses>)$')
         #No Purchase Information Available
-        p17_1= re.compile(r'^No +Purchase +Information +Available$')
+        p17_1= regex_engine.compile(r'^No +Purchase +Information +Available$')
 
         #Total: 44,  Purged: 0
-        p18 = re.compile(r'^Total: +(?P<total>[\S ]+), +'
-                        r'Purged: +(?P<purged>.*)$')
+        p18 = regex_engine.compile(r'^Total: +(?P<total>[\S ]+), +'
+                                  r'Purged: +(?P<purged>.*)$')
         #Total Acknowledged Received: 0,  Waiting for Ack: 36
-        p18_1= re.compile(r'^Total +Acknowledged +Received: +(?P<total_acknowledged_received>[\S ]+), +'
-                        r'Waiting +for +Ack: +(?P<waiting_for_ack>.*)$')
+        p18_1= regex_engine.compile(r'^Total +Acknowledged +Received: +(?P<total_acknowledged_received>[\S ]+), +'
+                                  r'Waiting +for +Ack: +(?P<waiting_for_ack>.*)$')
         #Available to Report: 8  Collecting Data: 0
-        p18_2= re.compile(r'^Available +to +Report: +(?P<available_to_report>[\S ]+)  +'
-                        r'Collecting +Data: +(?P<collecting_data>.*)$')
+        p18_2= regex_engine.compile(r'^Available +to +Report: +(?P<available_to_report>[\S ]+)  +'
+                                  r'Collecting +Data: +(?P<collecting_data>.*)$')
         #License  Conversion
-        p3_1  =  re.compile(r'^Automatic +Conversion +Enabled: +(?P<automatic_conversion_enabled>.*)$')
+        p3_1  =  regex_engine.compile(r'^Automatic +Conversion +Enabled: +(?P<automatic_conversion_enabled>.*)$')
 
         license_authorizations_dict=None
         overall_status_dict=None
@@ -2293,34 +2294,34 @@ class ShowLicenseUsage(ShowLicenseUsageSchema):
         ret_dict={}
         
         #C9300-24 Network Advantage):
-        p1 = re.compile(r'^.*\(.*:+(?P<license_name>.*)$')
+        p1 = regex_engine.compile(r'^.*\(.*:+(?P<license_name>.*)$')
 
         #Status: Not Applicable
-        p2 = re.compile(r'^Status: +(?P<status>.*)$')
+        p2 = regex_engine.compile(r'^Status: +(?P<status>.*)$')
 
         #Description: C9300-24 Network Advantage
-        p3 = re.compile(r'^Description: +(?P<description>.*)$')
+        p3 = regex_engine.compile(r'^Description: +(?P<description>.*)$')
 
         #Count: 1
-        p4 = re.compile(r'^Count: +(?P<count>\d+)$')
+        p4 = regex_engine.compile(r'^Count: +(?P<count>\d+)$')
 
         #Version: 1.0
-        p5 = re.compile(r'^Version: +(?P<version>.*)$')
+        p5 = regex_engine.compile(r'^Version: +(?P<version>.*)$')
 
         #Export status: NOT RESTRICTED
-        p6 = re.compile(r'^Export +status: +(?P<export_status>.*)$')
+        p6 = regex_engine.compile(r'^Export +status: +(?P<export_status>.*)$')
 
         #Feature Name: dna-advantage
-        p7 = re.compile(r'^Feature +Name: +(?P<feature_name>.*)$')
+        p7 = regex_engine.compile(r'^Feature +Name: +(?P<feature_name>.*)$')
 
         #Feature Description: C9300-48 DNA Advantage
-        p8 = re.compile(r'^Feature +Description: +(?P<feature_description>.*)$')
+        p8 = regex_engine.compile(r'^Feature +Description: +(?P<feature_description>.*)$')
 
         #Enforcement type: NOT ENFORCED
-        p9 = re.compile(r'^Enforcement +type: +(?P<enforcement_type>.*)$')
+        p9 = regex_engine.compile(r'^Enforcement +type: +(?P<enforcement_type>.*)$')
 
         #License type: Subscription
-        p10 = re.compile(r'^License +type: +(?P<license_type>.*)$')
+        p10 = regex_engine.compile(r'^License +type: +(?P<license_type>.*)$')
 
         license_name_dict=None
 
@@ -2434,19 +2435,19 @@ class ShowLicenseEventlog2(ShowLicenseEventlog2Schema):
         ret_dict={}
 
         #Load for five secs: 2%/0%; one minute: 2%; five minutes: 3%
-        p1 = re.compile(r'^Load for five secs: +(?P<load_time>.*); +one +minute: +(?P<one_minute>.*); +five +minutes: +(?P<five_minutes>.*)$')
+        p1 = regex_engine.compile(r'^Load for five secs: +(?P<load_time>.*); +one +minute: +(?P<one_minute>.*); +five +minutes: +(?P<five_minutes>.*)$')
 
         #Time source is NTP, 11:41:04.102 UTC Mon Sep 13 2021
-        p2 = re.compile(r'^Time source is NTP, +(?P<ntp_time>.*)$')
+        p2 = regex_engine.compile(r'^Time source is NTP, +(?P<ntp_time>.*)$')
 
         #No EventLog Found.
-        p3 = re.compile(r'^No EventLog Found\.$')
+        p3 = regex_engine.compile(r'^No EventLog Found\.$')
 
         #**** Event Log ****
-        p4 = re.compile(r'^\*+\s+Event Log\s+\*+$')
+        p4 = regex_engine.compile(r'^\*+\s+Event Log\s+\*+$')
 
         #2021-10-30 04:32:38.266 UTC SAEVT_ENDPOINT_USAGE count="0" entitlementTag="regid.2018-06.com.cisco.DNA_NWStack,1.0_e7244e71-3ad5-4608-8bf0-d12f67c80896"
-        p5 = re.compile(r'^[\d-]+\s[\d:\.]+\s\w+\s+(?P<log_message>.*)$')
+        p5 = regex_engine.compile(r'^[\d-]+\s[\d:\.]+\s\w+\s+(?P<log_message>.*)$')
 
         for line in output.splitlines():
             line=line.strip()
@@ -2884,181 +2885,181 @@ class ShowLicenseTechSupport(ShowLicenseTechSupportSchema):
         
         #Below code for handling special NTP lines 
         #Load for five secs: 0%/0%; one minute: 0%; five minutes: 0%
-        p0 = re.compile(r'^Load for five secs:\s*(?P<primary_load_time_percent>[0-9]+)\%\/(?P<secondary_load_time_percent>[0-9]+)\%\;\s*one minute:\s*(?P<one_minute_load_percent>[0-9]+)\%\;\s*five minutes:\s*(?P<five_minute_load_percent>[0-9]+)\%')
+        p0 = regex_engine.compile(r'^Load for five secs:\s*(?P<primary_load_time_percent>[0-9]+)\%\/(?P<secondary_load_time_percent>[0-9]+)\%\;\s*one minute:\s*(?P<one_minute_load_percent>[0-9]+)\%\;\s*five minutes:\s*(?P<five_minute_load_percent>[0-9]+)\%')
         #Time source is NTP, .06:17:59.041 UTC Thu Sep 9 2021
-        p0_1 = re.compile(r'^Time source is NTP, +(?P<ntp_time>.*)$')
+        p0_1 = regex_engine.compile(r'^Time source is NTP, +(?P<ntp_time>.*)$')
         
         #Below set of regular expressions to match headings and sub headings from output
         #Smart Licensing Status
-        p1 = re.compile(r'^(?P<smart_licensing_status_dict>Smart +Licensing +Status)$')
+        p1 = regex_engine.compile(r'^(?P<smart_licensing_status_dict>Smart +Licensing +Status)$')
         #Export Authorization Key:
-        p1_1 = re.compile(r'^(?P<export_authorization_key>Export +Authorization +Key)\:$')
+        p1_1 = regex_engine.compile(r'^(?P<export_authorization_key>Export +Authorization +Key)\:$')
         #Utility:
-        p1_2 = re.compile(r'^(?P<utility>Utility)\:$')
+        p1_2 = regex_engine.compile(r'^(?P<utility>Utility)\:$')
         #Smart Licensing Using Policy:
-        p1_3 = re.compile(r'^(?P<smart_licensing_using_policy>Smart +Licensing +Using +Policy)\:$')
+        p1_3 = regex_engine.compile(r'^(?P<smart_licensing_using_policy>Smart +Licensing +Using +Policy)\:$')
         #Account Information:
-        p1_4 = re.compile(r'^(?P<account_information>Account +Information)\:$')
+        p1_4 = regex_engine.compile(r'^(?P<account_information>Account +Information)\:$')
         #Data Privacy:
-        p1_5 = re.compile(r'^(?P<data_privacy>Data +Privacy)\:$')
+        p1_5 = regex_engine.compile(r'^(?P<data_privacy>Data +Privacy)\:$')
         #Transport:
-        p1_6 = re.compile(r'^(?P<transport>Transport)\:$')
+        p1_6 = regex_engine.compile(r'^(?P<transport>Transport)\:$')
         #Proxy:
-        p1_6_1 = re.compile(r'^\s*(?P<proxy>Proxy)\:$')
+        p1_6_1 = regex_engine.compile(r'^\s*(?P<proxy>Proxy)\:$')
         #Miscellaneous:
-        p1_7 = re.compile(r'^(?P<miscellaneous>Miscellaneous)\:$')
+        p1_7 = regex_engine.compile(r'^(?P<miscellaneous>Miscellaneous)\:$')
         #Policy:
-        p1_8 = re.compile(r'^(?P<policy>Policy)\:$')
+        p1_8 = regex_engine.compile(r'^(?P<policy>Policy)\:$')
         #Unenforced/Non-Export Perpetual Attributes:
         #Unenforced/Non-Export Subscription Attributes:
         #Enforced (Perpetual/Subscription) License Attributes:
         #Export (Perpetual/Subscription) License Attributes:
-        p1_8_1 = re.compile(r'^\s*(?P<policy_sub_header>[Unenforced|Enforced|Export]+[\/]*[\w\-\w]* +[\(]*[Perpetual|Subscription]+[\/]*[Perpetual|Subscription]*[\)]*.*Attributes)\:$')
+        p1_8_1 = regex_engine.compile(r'^\s*(?P<policy_sub_header>[Unenforced|Enforced|Export]+[\/]*[\w\-\w]* +[\(]*[Perpetual|Subscription]+[\/]*[Perpetual|Subscription]*[\)]*.*Attributes)\:$')
         #Usage Reporting:
-        p1_9 = re.compile(r'^(?P<usage_reporting>Usage Reporting)\:$')
+        p1_9 = regex_engine.compile(r'^(?P<usage_reporting>Usage Reporting)\:$')
         #License  Conversion
-        p1_10 = re.compile(r'^(?P<license_conversion>License +Conversion)\:$')
+        p1_10 = regex_engine.compile(r'^(?P<license_conversion>License +Conversion)\:$')
         
         #License Usage
-        p2 = re.compile(r'^(?P<license_usage>License +Usage)$')
+        p2 = regex_engine.compile(r'^(?P<license_usage>License +Usage)$')
         #Handle: 1
-        p2_1 = re.compile(r'^(?P<handle>Handle)\: +(?P<value>\d+)$')
+        p2_1 = regex_engine.compile(r'^(?P<handle>Handle)\: +(?P<value>\d+)$')
         #Measurements:
-        p2_1_1 = re.compile(r'^\s*(?P<measurements>Measurements)\:$')
+        p2_1_1 = regex_engine.compile(r'^\s*(?P<measurements>Measurements)\:$')
         #ENTITLEMENT:
-        p2_1_1_1 = re.compile(r'^\s*(?P<entitlement>ENTITLEMENT)\:$')
+        p2_1_1_1 = regex_engine.compile(r'^\s*(?P<entitlement>ENTITLEMENT)\:$')
         
         #Product Information
-        p3 = re.compile(r'^(?P<product_information>Product +Information)$')
+        p3 = regex_engine.compile(r'^(?P<product_information>Product +Information)$')
         #UDI: PID:C9410R,SN:FXS2202037E  
         #Added this regexp  to update the data with heading.
-        p3_1 = re.compile(r'^(?P<udi>UDI)\:\s*PID:(?P<pid>\S+),SN:(?P<sn>\S+)$') 
+        p3_1 = regex_engine.compile(r'^(?P<udi>UDI)\:\s*PID:(?P<pid>\S+),SN:(?P<sn>\S+)$') 
         #HA UDI List:
-        p3_2 = re.compile(r'^(?P<ha_udi_list>HA UDI List)\:$')
+        p3_2 = regex_engine.compile(r'^(?P<ha_udi_list>HA UDI List)\:$')
         
         #Agent Version
-        p4 = re.compile(r'^(?P<agent_version>Agent +Version)$')
+        p4 = regex_engine.compile(r'^(?P<agent_version>Agent +Version)$')
         
         #Upcoming Scheduled Jobs
-        p5 = re.compile(r'^(?P<upcoming_scheduled_jobs>Upcoming +Scheduled +Jobs)$')
+        p5 = regex_engine.compile(r'^(?P<upcoming_scheduled_jobs>Upcoming +Scheduled +Jobs)$')
         
         #Communication Statistics:
-        p6 = re.compile(r'^(?P<communication_statistics>Communication +Statistics)\:$')
+        p6 = regex_engine.compile(r'^(?P<communication_statistics>Communication +Statistics)\:$')
         #Trust Establishment:
-        p6_1 = re.compile(r'^(?P<trust_establishment>Trust +Establishment)\:$')
+        p6_1 = regex_engine.compile(r'^(?P<trust_establishment>Trust +Establishment)\:$')
         #Trust Acknowledgement:
-        p6_2 = re.compile(r'^(?P<trust_acknowledgement>Trust +Acknowledgement)\:$')     
+        p6_2 = regex_engine.compile(r'^(?P<trust_acknowledgement>Trust +Acknowledgement)\:$')     
         #Result Polling:
-        p6_4 = re.compile(r'^(?P<result_polling>Result +Polling)\:$')
+        p6_4 = regex_engine.compile(r'^(?P<result_polling>Result +Polling)\:$')
         #Authorization Request:
-        p6_5 = re.compile(r'^(?P<authorization_request>Authorization +Request)\:$')
+        p6_5 = regex_engine.compile(r'^(?P<authorization_request>Authorization +Request)\:$')
         #Authorization Confirmation:
-        p6_6 = re.compile(r'^(?P<authorization_confirmation>Authorization +Confirmation)\:$')
+        p6_6 = regex_engine.compile(r'^(?P<authorization_confirmation>Authorization +Confirmation)\:$')
         #Authorization Return:
-        p6_7 = re.compile(r'^(?P<authorization_return>Authorization +Return)\:$')
+        p6_7 = regex_engine.compile(r'^(?P<authorization_return>Authorization +Return)\:$')
         #Trust Sync:
-        p6_8 = re.compile(r'^(?P<trust_sync>Trust +Sync)\:$')
+        p6_8 = regex_engine.compile(r'^(?P<trust_sync>Trust +Sync)\:$')
         #Hello Message:
-        p6_9 = re.compile(r'^(?P<hello_message>Hello +Message)\:$')
+        p6_9 = regex_engine.compile(r'^(?P<hello_message>Hello +Message)\:$')
         
         #License Certificates
-        p7 = re.compile(r'^(?P<license_certificates>License +Certificates)$')
+        p7 = regex_engine.compile(r'^(?P<license_certificates>License +Certificates)$')
         
         #HA Info
-        p8 = re.compile(r'^(?P<ha_info>HA +Info)$')        
+        p8 = regex_engine.compile(r'^(?P<ha_info>HA +Info)$')        
         #Reservation Info
-        p9 = re.compile(r'^(?P<reservation_info>Reservation +Info)$')
+        p9 = regex_engine.compile(r'^(?P<reservation_info>Reservation +Info)$')
         #Overall status:
-        p9_1 = re.compile(r'^(?P<overall_status>Overall +status)\:$')
+        p9_1 = regex_engine.compile(r'^(?P<overall_status>Overall +status)\:$')
         #Authorizations:
-        p9_2 = re.compile(r'^(?P<authorizations>Authorizations)\:$')
+        p9_2 = regex_engine.compile(r'^(?P<authorizations>Authorizations)\:$')
         #C9K HSEC (Cat9K HSEC):
-        p9_2_1 = re.compile(r'^(?P<c9k_hsec>C9K HSEC)\s*\(Cat9K +HSEC\)\:$')
+        p9_2_1 = regex_engine.compile(r'^(?P<c9k_hsec>C9K HSEC)\s*\(Cat9K +HSEC\)\:$')
         #Term information:
-        p9_2_1_1 = re.compile(r'^(?P<term_information>Term +information)\:$')
+        p9_2_1_1 = regex_engine.compile(r'^(?P<term_information>Term +information)\:$')
         #Last Reporting Not Required:
-        p9_3 = re.compile(r'^(?P<last_reporting_not_required>Last +Reporting +Not +Required)\:$')
+        p9_3 = regex_engine.compile(r'^(?P<last_reporting_not_required>Last +Reporting +Not +Required)\:$')
         
         #Usage Report Summary:
-        p10 = re.compile(r'^(?P<usage_report_summary>Usage +Report +Summary)\:$')
+        p10 = regex_engine.compile(r'^(?P<usage_report_summary>Usage +Report +Summary)\:$')
         
         #Other Info
-        p11 = re.compile(r'^(?P<other_info>Other +Info)$')
+        p11 = regex_engine.compile(r'^(?P<other_info>Other +Info)$')
         
         #Platform Provided Mapping Table
-        p12 = re.compile(r'^(?P<platform_provided_mapping_table>Platform +Provided +Mapping +Table)$')
+        p12 = regex_engine.compile(r'^(?P<platform_provided_mapping_table>Platform +Provided +Mapping +Table)$')
         #Enforced Licenses:
-        p12_1 = re.compile(r'^(?P<enforced_licenses>Enforced +Licenses)\:$')
+        p12_1 = regex_engine.compile(r'^(?P<enforced_licenses>Enforced +Licenses)\:$')
 
         #Telemetry Report Summary
-        p13 = re.compile(r'^(?P<telemetry_report_summary>Telemetry +Report +Summary)\:$')
+        p13 = regex_engine.compile(r'^(?P<telemetry_report_summary>Telemetry +Report +Summary)\:$')
         
         #Device Telemetry Report Summary
-        p14 = re.compile(r'^(?P<device_telemetry_report_summary>Device +Telemetry +Report +Summary)\:$')      
+        p14 = regex_engine.compile(r'^(?P<device_telemetry_report_summary>Device +Telemetry +Report +Summary)\:$')      
         #Trust Code Installed:
-        p14_1 = re.compile(r'^(?P<trust_code_installed>Trust +Code +Installed)\:$') 
+        p14_1 = regex_engine.compile(r'^(?P<trust_code_installed>Trust +Code +Installed)\:$') 
         
         #Below set of expressions are for capturing data lines (For eg. key-value pairs)
         #<none>
-        p0_2 = re.compile(r'^\s*\<(?P<value>none)\>$')
+        p0_2 = regex_engine.compile(r'^\s*\<(?P<value>none)\>$')
 
         #No Purchase Information Available
-        p0_5 = re.compile(r'^\s*(?P<value>No +Purchase +Information +Available)$')
+        p0_5 = regex_engine.compile(r'^\s*(?P<value>No +Purchase +Information +Available)$')
 
         #Generalised expression for all lines in <Key>: <Value> format
         # Need to stop matching at the fist colon(:) as value can have colon(:)
         #  i.e 'Failure Reason: Server error occurred: LS_LICENGINE_FAIL_TO_CONNECT'
         # Need to match double or more consecutive colons(::) in value
-        p0_3=re.compile(r'^(?P<key>[^:]+)\:+ *(?P<value>[\S\s]+.*)$')
+        p0_3=regex_engine.compile(r'^(?P<key>[^:]+)\:+ *(?P<value>[\S\s]+.*)$')
 
         #Active: PID:C9300-24UX,SN:FCW2134L00C
         #Standby: PID:C9300-24U,SN:FOC2129Z02H
         #Member: PID:C9300-24T,SN:FCW2125L07Y
-        p0_4=re.compile(r'^\s*(?P<member_type>\S+):\s*PID:(?P<pid>\S+),SN:(?P<sn>\S+)$')
+        p0_4=regex_engine.compile(r'^\s*(?P<member_type>\S+):\s*PID:(?P<pid>\S+),SN:(?P<sn>\S+)$')
         
         #INSTALLED on Sep 27 12:22:33 2021 UTC
-        p0_4_1 =  re.compile(r'^INSTALLED +on +.*')
+        p0_4_1 =  regex_engine.compile(r'^INSTALLED +on +.*')
 
         #Below set of regular expressions are for special cases which could not be handled in above generic expressions
         #In variable name, the digit next to p identifies the heading under which this output line appears
         #For eg. p2_data1, this output line comes under heading matched with variable p2
         #Current Report: 1640690706       Previous: 1640626219
-        p2_data1 = re.compile(r'^Current +Report: +(?P<current_report>[\S ]+)  +'r'Previous: +(?P<previous>.*)$')
+        p2_data1 = regex_engine.compile(r'^Current +Report: +(?P<current_report>[\S ]+)  +'r'Previous: +(?P<previous>.*)$')
 
         #Attempts: Total=0, Success=0, Fail=0  Ongoing Failure: Overall=0 Communication=0
-        p6_data1= re.compile(r'^\s*(?P<key1>Attempts)\:\s+(?P<value1>.*)\s*(?P<key2>Ongoing Failure)\:\s*(?P<value2>.*)$')
+        p6_data1= regex_engine.compile(r'^\s*(?P<key1>Attempts)\:\s+(?P<value1>.*)\s*(?P<key2>Ongoing Failure)\:\s*(?P<value2>.*)$')
 
         #Total: 88,  Purged: 0(0)
-        p10_data1 = re.compile(r'^Total: +(?P<total>[\S ]+), +'r'Purged: +(?P<purged>.*)$')
+        p10_data1 = regex_engine.compile(r'^Total: +(?P<total>[\S ]+), +'r'Purged: +(?P<purged>.*)$')
 
         #Total Acknowledged Received: 0,  Waiting for Ack: 0(4)
-        p10_data2= re.compile(r'^Total +Acknowledged +Received: +(?P<total_acknowledged_received>[\S ]+), +'r'Waiting +for +Ack: +(?P<waiting_for_ack>.*)$')
+        p10_data2= regex_engine.compile(r'^Total +Acknowledged +Received: +(?P<total_acknowledged_received>[\S ]+), +'r'Waiting +for +Ack: +(?P<waiting_for_ack>.*)$')
 
         #Available to Report: 8  Collecting Data: 0
-        p10_data3= re.compile(r'^Available +to +Report: +(?P<available_to_report>[\S ]+)  +'r'Collecting +Data: +(?P<collecting_data>.*)$')
+        p10_data3= regex_engine.compile(r'^Available +to +Report: +(?P<available_to_report>[\S ]+)  +'r'Collecting +Data: +(?P<collecting_data>.*)$')
 
         #Maximum Display: 40  In Storage: 36,  MIA: 0(0)
-        p10_data4= re.compile(r'^Maximum +Display: +(?P<maximum_display>[\S ]+)  +'r'In +Storage: +(?P<in_storage>[\S ]+), +'r'MIA: +(?P<mia>.*)$')
+        p10_data4= regex_engine.compile(r'^Maximum +Display: +(?P<maximum_display>[\S ]+)  +'r'In +Storage: +(?P<in_storage>[\S ]+), +'r'MIA: +(?P<mia>.*)$')
 
         #P:C9300-24UX,S:FCW2134L00C: P:C9300-24UX,S:FCW2134L00C, state[2], Trust Data INSTALLED  TrustId:903
-        p11_data1 = re.compile(r'^[\w\s]*\:*\s*P\:+(?P<p>\S+).S\:+(?P<s>\S+)\:*.*TrustId\:+(?P<trustid>\d+)$')
+        p11_data1 = regex_engine.compile(r'^[\w\s]*\:*\s*P\:+(?P<p>\S+).S\:+(?P<s>\S+)\:*.*TrustId\:+(?P<trustid>\d+)$')
         #P:C9300-24UX,S:FCW2134L00C: No Trust Data
-        p11_data1_2 = re.compile(r'^[\w\s]*\:*\s*P\:+(?P<p>\S+).S\:+(?P<s>\S+)\: +(?P<trustvalue>No +Trust +Data)$')
+        p11_data1_2 = regex_engine.compile(r'^[\w\s]*\:*\s*P\:+(?P<p>\S+).S\:+(?P<s>\S+)\: +(?P<trustvalue>No +Trust +Data)$')
         #P:C9300-24UX,S:FCW2134L00C: P:C9300-24UX,S:FCW2134L00C, state[2], Trust Data INSTALLED
-        p11_data1_3 = re.compile(r'^[\w\s]*\:*\s*P\:+(?P<p>\S+).S\:+(?P<s>\S+)\:*.*(?P<trustvalue>Trust +Data +INSTALLED)$')
+        p11_data1_3 = regex_engine.compile(r'^[\w\s]*\:*\s*P\:+(?P<p>\S+).S\:+(?P<s>\S+)\:*.*(?P<trustvalue>Trust +Data +INSTALLED)$')
         #P:C9300-48U,S:FCW2133G09T: P:C9300-48U,S:FCW2133G09T, state[1], NOT INSTALLED
-        p11_data1_4 = re.compile(r'^[\w\s]*\:*\s*P\:+(?P<p>\S+).S\:+(?P<s>\S+)\:*.*(?P<trustvalue>NOT INSTALLED)$')
+        p11_data1_4 = regex_engine.compile(r'^[\w\s]*\:*\s*P\:+(?P<p>\S+).S\:+(?P<s>\S+)\:*.*(?P<trustvalue>NOT INSTALLED)$')
 
         #C9300-24UX: Total licenses found: 198
-        p12_data1 = re.compile(r'^\s*(?P<pid>\S+)\: +Total licenses found\: +(?P<total_licenses_found>\d+)$')
+        p12_data1 = regex_engine.compile(r'^\s*(?P<pid>\S+)\: +Total licenses found\: +(?P<total_licenses_found>\d+)$')
         #P:C9300-24UX,S:FCW2134L00C:
-        p12_data2 = re.compile(r'^\s*P\:(?P<pid>\S+)\,S\:(?P<sn>\S+)\:$')
+        p12_data2 = regex_engine.compile(r'^\s*P\:(?P<pid>\S+)\,S\:(?P<sn>\S+)\:$')
         #hseck9: regid.2021-05.com.cisco.C9K_HSEC,1.0_90fdf411-3823-45bd-bd8c-5a5d0e0e1ea2 (3)
-        p12_data3 = re.compile(r'^\s*hseck9\: +(?P<hseck9_entitlement_tag>regid\.\S.*) +\((?P<hseck9_no>\d+)\)$')
+        p12_data3 = regex_engine.compile(r'^\s*hseck9\: +(?P<hseck9_entitlement_tag>regid\.\S.*) +\((?P<hseck9_no>\d+)\)$')
         
         #Trust Code Installed: <none> 
         #Trust Code Installed: Feb 27 09:06:59 2024 IST
-        p14_data1 = re.compile(r'^Trust +Code +Installed\: +(?P<trust_code_installed>.*)$')
+        p14_data1 = regex_engine.compile(r'^Trust +Code +Installed\: +(?P<trust_code_installed>.*)$')
         
         for line in output.splitlines():
             line=line.strip()            
@@ -3646,15 +3647,15 @@ class ShowLicenseHistoryMessage(ShowLicenseHistoryMessageSchema):
 
         # Message History (oldest to newest):
         # Import Message History (oldest to newest):
-        p1 = re.compile(r'^[Import]*\s*Message\s+History\s+\(oldest\s+to\s+newest\):$')
+        p1 = regex_engine.compile(r'^[Import]*\s*Message\s+History\s+\(oldest\s+to\s+newest\):$')
 
         # Trust Establishment:
-        p2 = re.compile(r'^(?P<key_name>(Trust\s+Establishment|Usage\s+Reporting|Result\s+Polling|'
+        p2 = regex_engine.compile(r'^(?P<key_name>(Trust\s+Establishment|Usage\s+Reporting|Result\s+Polling|'
         r'Authorization\s+Request|Authorization\s+Return|Trust\s+Sync|Import\s+POLICY|Import\s+AUTH|'
         r'Import\s+TRUST\s+CODE|Import\s+RUM\s+ACK|Import\s+CONVERSION\s+ACK|Import\s+ACCOUNT\s+INFO)):$')
 
         # No past history
-        p3 = re.compile(r'^[\w\s]+$')
+        p3 = regex_engine.compile(r'^[\w\s]+$')
 
         ret_dict = dict()
         tmp_key = None
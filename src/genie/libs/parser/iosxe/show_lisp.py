@@ -59,6 +59,7 @@ from genie.metaparser.util.schemaengine import (Any,
                                                 ListOf,
                                                 Optional,
                                                 Or)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.libs.parser.iosxe.show_lisp_super import *
@@ -114,20 +115,20 @@ class ShowLispExtranet(ShowLispExtranetSchema):
         ret_dict = {}
 
         # Output for router lisp 0
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>(\d+))$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>(\d+))$")
 
         # Home Instance ID: 101
-        p2 = re.compile(r"^Home\s+Instance\s+ID:\s+(?P<home_instance>(\d+))$")
+        p2 = regex_engine.compile(r"^Home\s+Instance\s+ID:\s+(?P<home_instance>(\d+))$")
 
         # Provider    Dynamic     103        88.88.88.0/24
         # Provider    Config      103        88.88.88.0/24
         # Provider    Config      103        2001:200:200:200::/64
-        p3 = re.compile(r'^(?P<type>Provider|Subscriber)\s+(?P<source>Dynamic|Config|Config-Propagation)'
-                        r'\s+(?P<iid>\d+)\s+(?P<eid>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|'
-                        r'[a-fA-F\d\:]+)\/(?P<mask>\d{1,2})$')
+        p3 = regex_engine.compile(r'^(?P<type>Provider|Subscriber)\s+(?P<source>Dynamic|Config|Config-Propagation)'
+                                  r'\s+(?P<iid>\d+)\s+(?P<eid>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|'
+                                  r'[a-fA-F\d\:]+)\/(?P<mask>\d{1,2})$')
 
         # Total entries: 5
-        p4 = re.compile(r"^Total\s+entries:\s+(?P<total>\d+)$")
+        p4 = regex_engine.compile(r"^Total\s+entries:\s+(?P<total>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -351,58 +352,58 @@ class ShowLispPrefixList(ShowLispPrefixListSchema):
         lisp_prefix_dict = {}
 
         #LISP Prefix List information for router lisp 0
-        p1 = re.compile(r"^LISP Prefix List information for router lisp\s+(?P<lisp_prefix_id>\d+)$")
+        p1 = regex_engine.compile(r"^LISP Prefix List information for router lisp\s+(?P<lisp_prefix_id>\d+)$")
 
         #Prefix List: site1
-        p2 = re.compile(r"^Prefix\s+List:\s+(?P<prefix_list_name>\S+)$")
+        p2 = regex_engine.compile(r"^Prefix\s+List:\s+(?P<prefix_list_name>\S+)$")
 
         #Number of entries: 2
-        p3 = re.compile(r"^\s+Number\s+of\s+entries:\s+(?P<no_entries>\d+)")
+        p3 = regex_engine.compile(r"^\s+Number\s+of\s+entries:\s+(?P<no_entries>\d+)")
 
         #ITR Map Resolver    100.100.100.100|2001:192:168:1::
         #IID 5000     IPv6  ITR Map Resolver    3130:3130:3130:3130:3130:3130:3130:3130
-        p4 = re.compile(r"^\s+(IID\s+)?(?P<iid>\d+)?\s*(?P<afi>\w+)?\s*ITR\s+Map\s+Resolver\s+(?P<itr_map_resolver_ip>[0-9a-fA-F\d:]+|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$")
+        p4 = regex_engine.compile(r"^\s+(IID\s+)?(?P<iid>\d+)?\s*(?P<afi>\w+)?\s*ITR\s+Map\s+Resolver\s+(?P<itr_map_resolver_ip>[0-9a-fA-F\d:]+|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$")
 
         #ETR Map Server      44.44.44.44|2001:192:168:1::
         #IID 5000     IPv6  ETR Map Server      3130:3130:3130:3130:3130:3130:3130:3130
-        p5 = re.compile(r"^\s+(IID\s+)?(?P<iid>\d+)?\s*(?P<afi>\w+)?\s*ETR\s+Map\s+Server\s+(?P<etr_map_server_ip>[0-9a-fA-F\d:]+|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$")
+        p5 = regex_engine.compile(r"^\s+(IID\s+)?(?P<iid>\d+)?\s*(?P<afi>\w+)?\s*ETR\s+Map\s+Server\s+(?P<etr_map_server_ip>[0-9a-fA-F\d:]+|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$")
 
         #Import Publication
         #IID 5000     IPv6  Import Publication
-        p6 = re.compile(r"^\s+(IID\s+)?(?P<iid>\d+)?\s*(?P<afi>\w+)?\s*Import\s+Publication(?P<import_publication>\s)")
+        p6 = regex_engine.compile(r"^\s+(IID\s+)?(?P<iid>\d+)?\s*(?P<afi>\w+)?\s*Import\s+Publication(?P<import_publication>\s)")
 
         #Route Import
         #IID 5000     IPv6  Route Import
-        p7 = re.compile(r"^\s+(IID\s+)?(?P<iid>\d+)?\s*(?P<afi>\w+)?\s*Route\s+Import(?P<route_import>\s)")
+        p7 = regex_engine.compile(r"^\s+(IID\s+)?(?P<iid>\d+)?\s*(?P<afi>\w+)?\s*Route\s+Import(?P<route_import>\s)")
 
         #Import
         #IID 5000     IPv6  Import
-        p8 = re.compile(r"^\s+(IID\s+)?(?P<iid>\d+)?\s*(?P<afi>\w+)?\s*Import(?P<import>\s)")
+        p8 = regex_engine.compile(r"^\s+(IID\s+)?(?P<iid>\d+)?\s*(?P<afi>\w+)?\s*Import(?P<import>\s)")
 
         #192.168.1.0/24|2001:192:168:1::/64
-        p9 = re.compile(r"^\s+(?P<eid_prefix>[0-9a-fA-F\d:]+\/\d+|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})$")
+        p9 = regex_engine.compile(r"^\s+(?P<eid_prefix>[0-9a-fA-F\d:]+\/\d+|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})$")
 
         #Sources: static
         #Sources: static, publication
-        p10 = re.compile(r"^\s+Sources:\s+(?P<prefix_source>.+)$")
+        p10 = regex_engine.compile(r"^\s+Sources:\s+(?P<prefix_source>.+)$")
 
         #First added: 00:09:20
-        p11 = re.compile(r"^\s+First added:\s+(?P<first_added>\S+),")
+        p11 = regex_engine.compile(r"^\s+First added:\s+(?P<first_added>\S+),")
 
         #last verified: by static
-        p12 = re.compile(r"^\s+First added:\s+\S+\s+last verified:\s+(?P<last_verified_by>\S+\s+\S+),")
+        p12 = regex_engine.compile(r"^\s+First added:\s+\S+\s+last verified:\s+(?P<last_verified_by>\S+\s+\S+),")
 
         #00:09:20
-        p13 = re.compile(r"^\s+First added:\s+\S+\s+last verified:\s\S+\s+\S+,\s+(?P<last_verified>\S+)")
+        p13 = regex_engine.compile(r"^\s+First added:\s+\S+\s+last verified:\s\S+\s+\S+,\s+(?P<last_verified>\S+)")
 
         #Number of publications sourcing this entry: 2
-        p14 = re.compile(r"^\s+Number of publications sourcing this entry: (?P<pub_source_count>\d+)")
+        p14 = regex_engine.compile(r"^\s+Number of publications sourcing this entry: (?P<pub_source_count>\d+)")
 
         #Number of route imports sourcing this entry: 2
-        p15 = re.compile(r"^\s+Number of route imports sourcing this entry: (?P<rib_source_count>\d+)")
+        p15 = regex_engine.compile(r"^\s+Number of route imports sourcing this entry: (?P<rib_source_count>\d+)")
 
         #Number of site registrations sourcing this entry: 2
-        p16 = re.compile(r"^\s+Number of site registrations sourcing this entry: (?P<site_reg_source_count>\d+)")
+        p16 = regex_engine.compile(r"^\s+Number of site registrations sourcing this entry: (?P<site_reg_source_count>\d+)")
 
         for line in output.splitlines():
             #LISP Prefix List information for router lisp 0
@@ -691,13 +692,13 @@ class ShowLispAR(ShowLispARSchema):
         lisp_ar_dict = {}
 
         # Address-resolution data for router lisp 0 instance-id 1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Address-resolution\s+data\s+for\s+router\s+lisp\s+"
             r"(?P<lisp_id>\d+)\s+instance-id\s+(?P<instance_id>\d+)$")
 
         # 0    192.168.1.1/32       aabb.cc00.ca00
         # 4100 2001:192:168:1::71/128 aabb.cc00.c901
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<l2_inst_id>\d+)\s+(?P<eid_address>[0-9.]+\d+\/\d+"
             r"|[0-9a-fA-F.:]+\d+\/\d+|[0-9a-fA-F.:]+\/\d+)\s+(?P<mac_addr>[0-9a-fA-F.]+)$")
 
@@ -1036,25 +1037,25 @@ class ShowLispEthernetPublication(ShowLispIpv4PublicationSchema):
             output = self.device.execute(cmd)
         ret_dict = {}
         # Output for router lisp 0 instance-id 101
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)\s+"
-                        r"instance-id\s+(?P<instance_id>\d+)$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)\s+"
+                                  r"instance-id\s+(?P<instance_id>\d+)$")
 
         # Entries total 2
-        p2 = re.compile(r"^Entries\s+total\s+(?P<total_entries>\d+)$")
+        p2 = regex_engine.compile(r"^Entries\s+total\s+(?P<total_entries>\d+)$")
 
         # 100.100.100.100 15:52:51    aabb.cc00.c901/48        11.11.11.11     -
         # 100:100:100:100:: 15:52:51    aabb.cc00.c901/48        11:11:11:11::   -
-        p3 = re.compile(r"^(?P<publisher_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                        r"(?P<last_published>\S+)\s+(?P<eid_prefix>([a-fA-F\d]{4}\.){2}"
-                        r"[a-fA-F\d]{4}\/\d{1,3})\s+(?P<rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\."
-                        r"\d{1,3})|([a-fA-F\d\:]+))\s+(?P<encap_iid>\S+)$")
+        p3 = regex_engine.compile(r"^(?P<publisher_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                  r"(?P<last_published>\S+)\s+(?P<eid_prefix>([a-fA-F\d]{4}\.){2}"
+                                  r"[a-fA-F\d]{4}\/\d{1,3})\s+(?P<rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\."
+                                  r"\d{1,3})|([a-fA-F\d\:]+))\s+(?P<encap_iid>\S+)$")
 
         # New format (Locators are no longer displayed in the output)
 
         # aabb.cc00.c901/48   15:52:51   100.100.100.100   -
-        p4 = re.compile(r"^(?P<eid_prefix>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,3})\s+"
-                        r"(?P<last_published>\S+)\s+(?P<publisher_ip>(\d{1,3}\.\d{1,3}\."
-                        r"\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<encap_iid>\S+)$")
+        p4 = regex_engine.compile(r"^(?P<eid_prefix>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,3})\s+"
+                                  r"(?P<last_published>\S+)\s+(?P<publisher_ip>(\d{1,3}\.\d{1,3}\."
+                                  r"\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<encap_iid>\S+)$")
         count = 0
 
         for line in output.splitlines():
@@ -1167,70 +1168,70 @@ class ShowLispEthernetPublicationPrefix(ShowLispPublicationPrefixSchema):
         else:
             output = output
         #Output for router lisp 0 instance-id 4100
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)"
-                        r"\s+instance-id\s+(?P<instance_id>\d+)$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)"
+                                  r"\s+instance-id\s+(?P<instance_id>\d+)$")
 
         #EID-prefix: aabb.cc00.c901/48
-        p2 = re.compile(r"^EID-prefix:\s+(?P<eid_prefixes>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,3})$")
+        p2 = regex_engine.compile(r"^EID-prefix:\s+(?P<eid_prefixes>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,3})$")
 
         #First published:      03:05:56
-        p3 = re.compile(r"^First\s+published:\s+(?P<first_published>\S+)$")
+        p3 = regex_engine.compile(r"^First\s+published:\s+(?P<first_published>\S+)$")
 
         #Last published:      03:05:56
-        p4 = re.compile(r"^Last\s+published:\s+(?P<last_published>\S+)$")
+        p4 = regex_engine.compile(r"^Last\s+published:\s+(?P<last_published>\S+)$")
 
         #State:                complete
-        p5 = re.compile(r"^State:\s+(?P<state>\S+)$")
+        p5 = regex_engine.compile(r"^State:\s+(?P<state>\S+)$")
 
         #Exported to:          map-cache
-        p6 = re.compile(r"^Exported\s+to:\s+(?P<exported_to>\S+)$")
+        p6 = regex_engine.compile(r"^Exported\s+to:\s+(?P<exported_to>\S+)$")
 
         #Publisher 100.100.100.100:4342, last published 16:02:47, TTL never
         #Publisher 100:100:100:100::.4342, last published 16:02:47, TTL never
-        p7 = re.compile(r"^Publisher\s+(?P<publishers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:|\.)"
-                        r"(?P<port>\d+),\s+last\s+published\s+(?P<last_published>\S+),\s+"
-                        r"TTL\s+(?P<ttl>\S+)")
+        p7 = regex_engine.compile(r"^Publisher\s+(?P<publishers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:|\.)"
+                                  r"(?P<port>\d+),\s+last\s+published\s+(?P<last_published>\S+),\s+"
+                                  r"TTL\s+(?P<ttl>\S+)")
 
         #publisher epoch 1, entry epoch 1
-        p8 = re.compile(r"^publisher\s+epoch\s+(?P<publisher_epoch>\d+),"
-                        r"\s+entry\s+epoch\s+(?P<entry_epoch>\d+)")
+        p8 = regex_engine.compile(r"^publisher\s+epoch\s+(?P<publisher_epoch>\d+),"
+                                  r"\s+entry\s+epoch\s+(?P<entry_epoch>\d+)")
 
         #entry-state complete
-        p9 = re.compile(r"^entry-state\s+(?P<entry_state>\S+)")
+        p9 = regex_engine.compile(r"^entry-state\s+(?P<entry_state>\S+)")
 
         #routing table tag 101
-        p10 = re.compile(r"^routing\s+table\s+tag\s+(?P<routing_tag>\d+)")
+        p10 = regex_engine.compile(r"^routing\s+table\s+tag\s+(?P<routing_tag>\d+)")
 
         #xTR-ID 0x790800FF-0x426D6D8E-0xC6C5F60C-0xB4386D22
-        p11 = re.compile(r"^xTR-ID\s+(?P<xtr_id>\S+)")
+        p11 = regex_engine.compile(r"^xTR-ID\s+(?P<xtr_id>\S+)")
 
         #site-ID unspecified
-        p12 = re.compile(r"^site-ID\s+(?P<site_id>\S+)")
+        p12 = regex_engine.compile(r"^site-ID\s+(?P<site_id>\S+)")
 
         #Domain-ID unset
-        p13 = re.compile(r"^Domain-ID\s+(?P<domain_id>\S+)")
+        p13 = regex_engine.compile(r"^Domain-ID\s+(?P<domain_id>\S+)")
 
         #Multihoming-ID unspecified
-        p14 = re.compile(r"^Multihoming-ID\s+(?P<multihoming_id>\S+)")
+        p14 = regex_engine.compile(r"^Multihoming-ID\s+(?P<multihoming_id>\S+)")
 
         #11.11.11.11   10/10   up        -                   1/1       44
         #11:11:11:11:: 10/10   up        -                   1/1       44
-        p15 = re.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                         r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)"
-                         r"|\s+(?P<domain_id>\d+)\/(?P<multihoming_id>\d+)\s+(?P<metric>\d+)")
+        p15 = regex_engine.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                   r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)"
+                                   r"|\s+(?P<domain_id>\d+)\/(?P<multihoming_id>\d+)\s+(?P<metric>\d+)")
 
         #  Instance ID:                              4100
-        p16 = re.compile(r"^\s+Instance\s+ID:\s+(?P<inst_id>\d+)")
+        p16 = regex_engine.compile(r"^\s+Instance\s+ID:\s+(?P<inst_id>\d+)")
         count = 0
 
         #Publisher 100.100.100.100:4342
         #Publisher 100:100:100:100::.4342
-        p17 = re.compile(r"^Publisher\s+(?P<publishers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|"
-                         r"([a-fA-F\d\:]+))(:|\.)(?P<port>\d+)")
+        p17 = regex_engine.compile(r"^Publisher\s+(?P<publishers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|"
+                                   r"([a-fA-F\d\:]+))(:|\.)(?P<port>\d+)")
 
         #  last published 16:02:47, TTL never
-        p18 = re.compile(r"^last\s+published\s+(?P<last_published>\S+),\s+"
-                        r"TTL\s+(?P<ttl>\S+)")
+        p18 = regex_engine.compile(r"^last\s+published\s+(?P<last_published>\S+),\s+"
+                                  r"TTL\s+(?P<ttl>\S+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1527,52 +1528,52 @@ class ShowLispARDetailParser(ShowLispARDetailSchema):
             output = self.device.execute(cmd)
 
         #Address-resolution data for router lisp 0 instance-id 101
-        p1 = re.compile(r"^Address-resolution\s+data\s+for\s+router\s+"
-                        r"lisp\s+(?P<lisp_id>\d+)\s+instance-id\s+(?P<instance_id>\d+)$")
+        p1 = regex_engine.compile(r"^Address-resolution\s+data\s+for\s+router\s+"
+                                  r"lisp\s+(?P<lisp_id>\d+)\s+instance-id\s+(?P<instance_id>\d+)$")
 
         #Site name: Shire
-        p2 = re.compile(r"^Site\s+name:\s+(?P<site>\S+)$")
+        p2 = regex_engine.compile(r"^Site\s+name:\s+(?P<site>\S+)$")
 
         #Host Address:         192.168.1.71/32
-        p3 = re.compile(r"^Host\s+Address:\s+(?P<host_address>\d{1,3}\."
-                        r"\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3})$")
+        p3 = regex_engine.compile(r"^Host\s+Address:\s+(?P<host_address>\d{1,3}\."
+                                  r"\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3})$")
 
         #Hardware Address:     aabb.cc00.c901
-        p4 = re.compile(r"^Hardware\s+Address:\s+(?P<hardware_address>"
-                        r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})$")
+        p4 = regex_engine.compile(r"^Hardware\s+Address:\s+(?P<hardware_address>"
+                                  r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})$")
 
         #First registered:     1w0d
-        p5 = re.compile(r"^First\s+registered:\s+(?P<first_registered>\S+)$")
+        p5 = regex_engine.compile(r"^First\s+registered:\s+(?P<first_registered>\S+)$")
 
         #Last registered:      1w0d
-        p6 = re.compile(r"^Last\s+registered:\s+(?P<last_registered>\S+)$")
+        p6 = regex_engine.compile(r"^Last\s+registered:\s+(?P<last_registered>\S+)$")
 
         #Authentication failures:   0
-        p7 = re.compile(r"^\s+Authentication\s+failures:\s+(?P<authentication_failures>\d+)$")
+        p7 = regex_engine.compile(r"^\s+Authentication\s+failures:\s+(?P<authentication_failures>\d+)$")
 
         #ETR 11.11.11.11:28966
         #ETR 11:11:11:11::.28966
-        p8 = re.compile(r"^\s+ETR\s+(?P<etr>((\d{1,3}\.\d{1,3}\."
-                        r"\d{1,3}\.\d{1,3}:)|([a-fA-F\d\:]+\.))(?P<port>\d+))$")
+        p8 = regex_engine.compile(r"^\s+ETR\s+(?P<etr>((\d{1,3}\.\d{1,3}\."
+                                  r"\d{1,3}\.\d{1,3}:)|([a-fA-F\d\:]+\.))(?P<port>\d+))$")
 
         #Last registered:      1w0d
-        p9 = re.compile(r"^\s+Last\s+registered:\s+(?P<etr_last_registered>\S+)$")
+        p9 = regex_engine.compile(r"^\s+Last\s+registered:\s+(?P<etr_last_registered>\S+)$")
 
         #TTL:                   1d00h
-        p10 = re.compile(r"^\s+TTL:\s+(?P<ttl>\S+)$")
+        p10 = regex_engine.compile(r"^\s+TTL:\s+(?P<ttl>\S+)$")
 
         #xTR-ID:                0xC25C9262-0xC9865A33-0x008E8A37-0x9206AC33
-        p11 = re.compile(r"^\s+xTR-ID:\s+(?P<xtr_id>\S+)$")
+        p11 = regex_engine.compile(r"^\s+xTR-ID:\s+(?P<xtr_id>\S+)$")
 
         #Site-ID:               unspecified
-        p12 = re.compile(r"^\s+Site-ID:\s+(?P<site_id>\S+)$")
+        p12 = regex_engine.compile(r"^\s+Site-ID:\s+(?P<site_id>\S+)$")
 
         #Registered addr:       aabb.cc00.c901
-        p13 = re.compile(r"^\s+Registered\s+addr:\s+(?P<registered_addr>"
-                         r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})$")
+        p13 = regex_engine.compile(r"^\s+Registered\s+addr:\s+(?P<registered_addr>"
+                                   r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})$")
 
         #L3 Instance ID:        4100
-        p14 = re.compile(r"^\s+L3\s+Instance\s+ID:\s+(?P<l3_instance_id>\d+)$")
+        p14 = regex_engine.compile(r"^\s+L3\s+Instance\s+ID:\s+(?P<l3_instance_id>\d+)$")
 
         for line in output.splitlines():
             #Address-resolution data for router lisp 0 instance-id 101
@@ -1790,61 +1791,61 @@ class ShowLispDatabaseEid(ShowLispDatabaseEidSchema):
         #LISP ETR IPv4 Mapping Database for LISP 1 EID-table vrf red (IID 101), LSBs: 0x0
         #LISP ETR MAC Mapping Database for LISP 1 EID-table Vlan 111 (IID 102), LSBs: 0x1
         #LISP ETR IPv4 Mapping Database for LISP 0 EID-table default (IID 4098), LSBs: 0x1
-        p1 = re.compile(r"^LISP\sETR\s(?P<address_family>[A-Za-z0-9]+)\sMapping\sDatabase\sfor"
-                        r"(\sLISP\s)?(?P<lisp_id>\d)?\sEID-table\s(?P<eid_table>\S+"
-                        r"|(vrf\s\w+)|(Vlan\s\d+))\s\(IID\s(?P<instance_id>\d+)\),\sLSBs:\s"
-                        r"(?P<lsb>0x[a-fA-F\d]+)$")
+        p1 = regex_engine.compile(r"^LISP\sETR\s(?P<address_family>[A-Za-z0-9]+)\sMapping\sDatabase\sfor"
+                                  r"(\sLISP\s)?(?P<lisp_id>\d)?\sEID-table\s(?P<eid_table>\S+"
+                                  r"|(vrf\s\w+)|(Vlan\s\d+))\s\(IID\s(?P<instance_id>\d+)\),\sLSBs:\s"
+                                  r"(?P<lsb>0x[a-fA-F\d]+)$")
 
         #Entries total 2, no-route 2, inactive 0, do-not-register 0
         # Entries total 1, no-route 0, inactive 0
-        p2 = re.compile(r"^Entries total\s(?P<entries_total>\d+),\sno-route\s(?P<no_route_entries>\d+),\sinactive\s(?P<inactive_entries>\d+)(,\sdo-not-register\s(?P<do_not_register_entries>\d+))?$")
+        p2 = regex_engine.compile(r"^Entries total\s(?P<entries_total>\d+),\sno-route\s(?P<no_route_entries>\d+),\sinactive\s(?P<inactive_entries>\d+)(,\sdo-not-register\s(?P<do_not_register_entries>\d+))?$")
 
         #*** ALL ACTIVE LOCAL EID PREFIXES HAVE NO ROUTE ***
         #***    REPORTING LOCAL RLOCS AS UNREACHABLE     ***
-        p3 = re.compile(r"^(?P<all_no_route>\*\*\* ALL ACTIVE LOCAL EID PREFIXES HAVE NO ROUTE \*\*\*)")
+        p3 = regex_engine.compile(r"^(?P<all_no_route>\*\*\* ALL ACTIVE LOCAL EID PREFIXES HAVE NO ROUTE \*\*\*)")
 
         #192.168.1.0/24, locator-set RLOC *** NO ROUTE TO EID PREFIX ***
         #00aa.00bb.00cc/48, locator-set RLOC
-        p4 = re.compile(r"^(?P<eid_prefix>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})|([a-fA-F\d\:]+\/\d{1,3})|(([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,2})),\s(?P<eid_info>.+)$")
+        p4 = regex_engine.compile(r"^(?P<eid_prefix>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})|([a-fA-F\d\:]+\/\d{1,3})|(([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,2})),\s(?P<eid_info>.+)$")
 
         #  Uptime: 00:00:56, Last-change: 00:00:56
         # Line not parsed, not interesting data for now
 
         #  Route-map: match-metric
-        p5 = re.compile(r"^Route-map:\s(?P<route_map>.+)$")
+        p5 = regex_engine.compile(r"^Route-map:\s(?P<route_map>.+)$")
 
         #  Domain-ID: unset
-        p6 = re.compile(r"^Domain-ID:\s(?P<domain_id>.+)$")
+        p6 = regex_engine.compile(r"^Domain-ID:\s(?P<domain_id>.+)$")
 
         #  Metric: -
-        p7 = re.compile(r"^Metric:\s(?P<metric>.+)$")
+        p7 = regex_engine.compile(r"^Metric:\s(?P<metric>.+)$")
 
         #  Service-Insertion: N/A (0)
-        p8 = re.compile(r"^Service-Insertion:\s(?P<srvc_ins_type>[^\s]+)\s\((?P<srvc_ins_id>\d+)\)$")
+        p8 = regex_engine.compile(r"^Service-Insertion:\s(?P<srvc_ins_type>[^\s]+)\s\((?P<srvc_ins_id>\d+)\)$")
 
         #  Extranet-IID: 4100
-        p9 = re.compile(r"^Extranet-IID:\s(?P<extranet_iid>\d+)$")
+        p9 = regex_engine.compile(r"^Extranet-IID:\s(?P<extranet_iid>\d+)$")
 
         # SGT: 10
-        p10 = re.compile(r"^SGT:\s(?P<sgt>\d+)$")
+        p10 = regex_engine.compile(r"^SGT:\s(?P<sgt>\d+)$")
 
         # Publish-mode: no-extranet
         # Publish-mode: publish-extranet instance-id <id>
-        p10_1 = re.compile(r'^Publish-mode:\s+(?P<publish_mode>.+\S)')
+        p10_1 = regex_engine.compile(r'^Publish-mode:\s+(?P<publish_mode>.+\S)')
 
         #  Locator       Pri/Wgt  Source     State
         #  100.31.31.31    1/1    cfg-addr   site-self, unreachable
         #  100.44.44.44 *** missing in configuration ***
-        p11 = re.compile(r"^(?P<locator>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<source>[\w-]+)\s+(?P<state>.+)$")
-        p12 = re.compile(r"^(?P<locator>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s(?P<config_missing>\*\*\* missing in configuration \*\*\*)$")
+        p11 = regex_engine.compile(r"^(?P<locator>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<source>[\w-]+)\s+(?P<state>.+)$")
+        p12 = regex_engine.compile(r"^(?P<locator>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s(?P<config_missing>\*\*\* missing in configuration \*\*\*)$")
 
         # Affinity-id: 20 , 20
-        p12_1 = re.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
+        p12_1 = regex_engine.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
 
         #  Map-server       Uptime         ACK  Domain-ID
         #  100.31.31.31     00:00:21       No   0
         #  100.31.31.31     never          No   0
-        p13 = re.compile(r"^(?P<map_server>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<uptime>\S+)\s+(?P<ack>Yes|No)\s+(?P<domain_id>\w+)")
+        p13 = regex_engine.compile(r"^(?P<map_server>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<uptime>\S+)\s+(?P<ack>Yes|No)\s+(?P<domain_id>\w+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2113,7 +2114,7 @@ class ShowLispEthernetMapCachePrefix(ShowLispEthernetMapCachePrefixSchema):
             out = self.device.expect(
                 [r'Instance ID:\s+\S+'],
                 timeout=2).match_output
-            p0 = re.compile(r'^Instance ID:\s+(?P<instance_id>\d+)$')
+            p0 = regex_engine.compile(r'^Instance ID:\s+(?P<instance_id>\d+)$')
             group = p0.match(out)
             instance_id = int(group['instance_id'])
         else:
@@ -2123,48 +2124,48 @@ class ShowLispEthernetMapCachePrefix(ShowLispEthernetMapCachePrefixSchema):
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 193
         # Output for router lisp 2 instance-id 101
-        p1 = re.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>(\d+))'
-                        r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>(\d+))'
+                                  r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
 
         # LISP MAC Mapping Cache for EID-table Vlan 210 (IID 8188), 1 entries
         # LISP MAC Mapping Cache for LISP 0 EID-table Vlan 101 (IID 1031), 1 entries
-        p2 = re.compile(r'^LISP\sMAC\sMapping\sCache\sfor\s(LISP\s+\d+\s+)?EID-table\s'
-                        r'(?P<eid_table>.*)\s\(IID\s(?P<instance_id>\d+)\),'
-                        r'\s(?P<entries>\d+)\sentries$')
+        p2 = regex_engine.compile(r'^LISP\sMAC\sMapping\sCache\sfor\s(LISP\s+\d+\s+)?EID-table\s'
+                                  r'(?P<eid_table>.*)\s\(IID\s(?P<instance_id>\d+)\),'
+                                  r'\s(?P<entries>\d+)\sentries$')
 
         # 0017.0100.0001/48, uptime: 01:09:06, expires: 22:50:53, via map-reply, complete, local-to-site
 	# aabb.cc00.ca00/48, uptime: 00:00:08, expires: 23:59:51, via map-reply, complete
-        p3 = re.compile(r'^(?P<eid_prefix>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})|([a-fA-F\d\:]+\/\d{1,3})|'
-                        r'(([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,2})),\suptime:\s(?P<uptime>\S+),\sexpires:\s(?P<expiry_time>\S+),'
-                        r'\s+via\s(?P<via>\S+),\s(?P<map_reply_state>\S+)(,\s(?P<prefix_location>\S+))?$')
+        p3 = regex_engine.compile(r'^(?P<eid_prefix>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})|([a-fA-F\d\:]+\/\d{1,3})|'
+                                  r'(([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,2})),\suptime:\s(?P<uptime>\S+),\sexpires:\s(?P<expiry_time>\S+),'
+                                  r'\s+via\s(?P<via>\S+),\s(?P<map_reply_state>\S+)(,\s(?P<prefix_location>\S+))?$')
 
         # Sources: map-reply
-        p4 = re.compile(r'^Sources:\s(?P<source_type>\S+)$')
+        p4 = regex_engine.compile(r'^Sources:\s(?P<source_type>\S+)$')
 
         # State: complete, last modified: 01:09:06, map-source: 1.1.1.10
-        p5 = re.compile(r'^State:\s(?P<state>\S+),\slast\smodified:\s(?P<last_modified>\S+)\smap-source:\s(?P<source_ip>.+)$')
+        p5 = regex_engine.compile(r'^State:\s(?P<state>\S+),\slast\smodified:\s(?P<last_modified>\S+)\smap-source:\s(?P<source_ip>.+)$')
 
         # Active, Packets out: 139(0 bytes), counters are not accurate (~ 00:00:01 ago)
-        p6 = re.compile(r'^(?P<prefix_state>\S+),\sPackets out:\s(?P<packets_out>\d+).+$')
+        p6 = regex_engine.compile(r'^(?P<prefix_state>\S+),\sPackets out:\s(?P<packets_out>\d+).+$')
 
         # Encapsulating dynamic-EID traffic
-        p7 = re.compile(r'^Encapsulating\s(?P<encap>.+)$')
+        p7 = regex_engine.compile(r'^Encapsulating\s(?P<encap>.+)$')
 
         # 1.1.1.10  01:09:06  up      10/10        -
         # 1:1:1:10::  01:09:06  up      10/10        -
-        p8 = re.compile(r'^(?P<rloc_set>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<uptime>\S+)\s+(?P<rloc_state>\S+)\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<encap_iid>\S+)$')
+        p8 = regex_engine.compile(r'^(?P<rloc_set>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<uptime>\S+)\s+(?P<rloc_state>\S+)\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<encap_iid>\S+)$')
 
         # Last up-down state change:         01:09:06, state change count: 1
-        p9 = re.compile(r'^Last\sup-down\sstate\schange:\s+(?P<time>\S+),\s+state change count:\s+(?P<count>\d+)$')
+        p9 = regex_engine.compile(r'^Last\sup-down\sstate\schange:\s+(?P<time>\S+),\s+state change count:\s+(?P<count>\d+)$')
 
         # Last route reachability change:    01:09:06, state change count: 1
-        p10 = re.compile(r'^Last\sroute\sreachability\schange:\s+(?P<time>\S+),\s+state change count:\s+(?P<count>\d+)$')
+        p10 = regex_engine.compile(r'^Last\sroute\sreachability\schange:\s+(?P<time>\S+),\s+state change count:\s+(?P<count>\d+)$')
 
         # Last priority / weight change:     never/never
-        p11 = re.compile(r'^Last\spriority\s\/\sweight\schange:\s+(?P<priority>\S+)\/(?P<weight>\S+)$')
+        p11 = regex_engine.compile(r'^Last\spriority\s\/\sweight\schange:\s+(?P<priority>\S+)\/(?P<weight>\S+)$')
 
         # Last RLOC-probe sent:            01:09:06 (rtt 1ms)
-        p12 = re.compile(r'^Last\sRLOC-probe\ssent:\s+(?P<time>\S+)\s\(rtt (?P<rtt>\d+)(?P<rtt_unit>\S+)\)$')
+        p12 = regex_engine.compile(r'^Last\sRLOC-probe\ssent:\s+(?P<time>\S+)\s\(rtt (?P<rtt>\d+)(?P<rtt_unit>\S+)\)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2345,44 +2346,44 @@ class ShowLispRedundancy(ShowLispRedundancySchema):
         lisp_dict = {}
 
         #Redundancy for LISP 0
-        p1 = re.compile(r"^Redundancy\s+for\s+LISP\s+(?P<lisp_id>\d+)$")
+        p1 = regex_engine.compile(r"^Redundancy\s+for\s+LISP\s+(?P<lisp_id>\d+)$")
 
         #  Active RP
         #  Standby RP
-        p2 = re.compile(r"^(?P<rp>Active|Standby)\s+RP$")
+        p2 = regex_engine.compile(r"^(?P<rp>Active|Standby)\s+RP$")
 
         #  SSO enabled
         #  SSO disabled
-        p3 = re.compile(r"^SSO\s+(?P<sso>enabled|disabled)$")
+        p3 = regex_engine.compile(r"^SSO\s+(?P<sso>enabled|disabled)$")
 
         #  Checkpoint connection open
         #  Checkpoint connection closed
-        p4 = re.compile(r"^Checkpoint\s+connection\s+(?P<checkpoint_connection>open|closed)$")
+        p4 = regex_engine.compile(r"^Checkpoint\s+connection\s+(?P<checkpoint_connection>open|closed)$")
 
         #  Peer redundancy state: synchronized
         #  Peer redundancy state: unsynchronized
-        p5 = re.compile(r"^Peer\s+redundancy\s+state:\s+(?P<peer_redundancy_state>synchronized|unsynchronized)$")
+        p5 = regex_engine.compile(r"^Peer\s+redundancy\s+state:\s+(?P<peer_redundancy_state>synchronized|unsynchronized)$")
 
         #  Number of Bulk Syncs started: 1
-        p6 = re.compile(r"^Number\s+of\s+Bulk\s+Syncs\s+started:\s+(?P<number_of_bulk_sync_started>\d+)$")
+        p6 = regex_engine.compile(r"^Number\s+of\s+Bulk\s+Syncs\s+started:\s+(?P<number_of_bulk_sync_started>\d+)$")
 
         #  Last Bulk Sync started: never
         #  Last Bulk Sync started: Jan 23 15:55:26.712 PST
-        p7 = re.compile(r"^Last\s+Bulk\s+Sync\s+started:\s+(?P<last_bulk_sync_started>[\w:\s+\.]+)$")
+        p7 = regex_engine.compile(r"^Last\s+Bulk\s+Sync\s+started:\s+(?P<last_bulk_sync_started>[\w:\s+\.]+)$")
 
         #  Last Bulk Sync finished: never
         #  Last Bulk Sync finished: Jan 23 15:55:26.712 PST
-        p8 = re.compile(r"^Last\s+Bulk\s+Sync\s+finished:\s+(?P<last_bulk_sync_finished>[\w:\s+\.]+)$")
+        p8 = regex_engine.compile(r"^Last\s+Bulk\s+Sync\s+finished:\s+(?P<last_bulk_sync_finished>[\w:\s+\.]+)$")
 
         #  Last time synchronization was lost: never
         #  Last time synchronization was lost: Jan 23 15:55:26.712 PST
-        p9 = re.compile(r"^Last\s+time\s+synchronization\s+was\s+lost:\s+(?P<last_sync_lost>[\w\s+\d:\.]+)$")
+        p9 = regex_engine.compile(r"^Last\s+time\s+synchronization\s+was\s+lost:\s+(?P<last_sync_lost>[\w\s+\d:\.]+)$")
 
         #  Queued/max checkpoint requests: 0/17
-        p10 = re.compile(r"^Queued\/max\s+checkpoint\s+requests:\s+(?P<queued_checkpoint_requests>\d+)\/(?P<max_checkpoint_requests>\d+)$")
+        p10 = regex_engine.compile(r"^Queued\/max\s+checkpoint\s+requests:\s+(?P<queued_checkpoint_requests>\d+)\/(?P<max_checkpoint_requests>\d+)$")
 
         #  Unacknowledged/max checkpoint requests: 0/17
-        p11 = re.compile(r"^Unacknowledged\/max\s+checkpoint\s+requests:\s+(?P<unack_checkpoint_requests>\d+)\/\d+$")
+        p11 = regex_engine.compile(r"^Unacknowledged\/max\s+checkpoint\s+requests:\s+(?P<unack_checkpoint_requests>\d+)\/\d+$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2542,32 +2543,32 @@ class ShowLispEthernetMapCache(ShowLispEthernetMapCacheSchema):
         ret_dict = {}
 
         #Output for router lisp 0 instance-id 8188
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)"
-                        r"\s+instance-id\s+(?P<instance_id>\d+)$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)"
+                                  r"\s+instance-id\s+(?P<instance_id>\d+)$")
 
         #LISP MAC Mapping Cache for EID-table Vlan 210 (IID 8188), 1 entries
         # LISP MAC Mapping Cache for LISP 0 EID-table Vlan 101 (IID 1023), 2 entries
-        p2 = re.compile(r"^LISP\s+MAC\s+Mapping\s+Cache\s+for(\s+LISP\s+\d+)?\s+EID-table\s+"
-                        r"(?P<eid_table>Vlan\s+\d+)\s+\(IID\s+\d+\),\s+(?P<entries>\d+)\s+entries$")
+        p2 = regex_engine.compile(r"^LISP\s+MAC\s+Mapping\s+Cache\s+for(\s+LISP\s+\d+)?\s+EID-table\s+"
+                                  r"(?P<eid_table>Vlan\s+\d+)\s+\(IID\s+\d+\),\s+(?P<entries>\d+)\s+entries$")
 
         #0017.0100.0001/48, uptime: 18:33:39, expires: 05:26:20, via map-reply, complete, local-to-site
         # aabb.cc00.cb00/48, uptime: 00:00:03, expires: never, via pub-sub, complete, local-to-site
-        p3 = re.compile(r"^(?P<eid_prefix>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,2}),"
-                        r"\s+uptime:\s+(?P<uptime>\S+),\s+expires:\s+"
-                        r"(?P<expiry_time>\d{1,2}:\d{1,2}:\d{1,2}|\S+),\s+via\s+(?P<via>\w+\-+\w+),\s+"
-                        r"(?P<map_reply_state>\w+),\s+(?P<site>\S+)$")
+        p3 = regex_engine.compile(r"^(?P<eid_prefix>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,2}),"
+                                  r"\s+uptime:\s+(?P<uptime>\S+),\s+expires:\s+"
+                                  r"(?P<expiry_time>\d{1,2}:\d{1,2}:\d{1,2}|\S+),\s+via\s+(?P<via>\w+\-+\w+),\s+"
+                                  r"(?P<map_reply_state>\w+),\s+(?P<site>\S+)$")
 
         # 0000.58bb.6f48/48, uptime: 1d05h, expires: 5d18h, via map-reply, complete
-        p3_1 = re.compile(r"(?P<eid_prefix>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,2}),"
-                          r"\s+uptime:\s+(?P<uptime>\S+),\s+expires:\s+"
-                          r"(?P<expiry_time>\d{1,2}:\d{1,2}:\d{1,2}|\S+),\s+via\s+"
-                          r"(?P<via>(\w+\-+\w+)|\S+\s+\w+\-+\w+),\s+(?P<map_reply_state>\w+)$")
+        p3_1 = regex_engine.compile(r"(?P<eid_prefix>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,2}),"
+                                    r"\s+uptime:\s+(?P<uptime>\S+),\s+expires:\s+"
+                                    r"(?P<expiry_time>\d{1,2}:\d{1,2}:\d{1,2}|\S+),\s+via\s+"
+                                    r"(?P<via>(\w+\-+\w+)|\S+\s+\w+\-+\w+),\s+(?P<map_reply_state>\w+)$")
 
         #  1.1.1.10  18:33:39  up      10/10        -
         #  1:1:1:10::  18:33:39  up      10/10        -
-        p4 = re.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                        r"(?P<uptime>\S+)\s+(?P<rloc_state>\S+)"
-                        r"\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<encap_iid>\S+)$")
+        p4 = regex_engine.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                  r"(?P<uptime>\S+)\s+(?P<rloc_state>\S+)"
+                                  r"\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<encap_iid>\S+)$")
         for line in output.splitlines():
             line = line.strip()
             #Output for router lisp 0 instance-id 8188
@@ -2720,36 +2721,36 @@ class ShowLispEidWatch(ShowLispEidWatchSchema):
         lisp_dict = {}
 
         #LISP EID watch information for router 0
-        p1 = re.compile(r"^LISP\sEID\swatch\sinformation\sfor\srouter\s+(?P<lisp_id>\d+)$")
+        p1 = regex_engine.compile(r"^LISP\sEID\swatch\sinformation\sfor\srouter\s+(?P<lisp_id>\d+)$")
 
         #Client : Test 0
-        p2 = re.compile(r"^Client\s+:\s+(?P<client_name>.+)$")
+        p2 = regex_engine.compile(r"^Client\s+:\s+(?P<client_name>.+)$")
 
         #Process ID : 87
-        p3 = re.compile(r"^Process\sID\s+:\s+(?P<process_id>\d+)$")
+        p3 = regex_engine.compile(r"^Process\sID\s+:\s+(?P<process_id>\d+)$")
 
         #Connection to LISP control process : ENABLED
-        p4 = re.compile(r"^Connection\sto\sLISP\scontrol\sprocess\s+:\s+(?P<connection_to_control_process>.+)$")
+        p4 = regex_engine.compile(r"^Connection\sto\sLISP\scontrol\sprocess\s+:\s+(?P<connection_to_control_process>.+)$")
 
         #IPC end point : 1
-        p5 = re.compile(r"^IPC\send\spoint\s+:\s+(?P<ipc_endpoint>\d+)$")
+        p5 = regex_engine.compile(r"^IPC\send\spoint\s+:\s+(?P<ipc_endpoint>\d+)$")
 
         #Client notifications : Delivered
-        p6 = re.compile(r"^Client\snotifications\s+:\s+(?P<client_notifications>.+)$")
+        p6 = regex_engine.compile(r"^Client\snotifications\s+:\s+(?P<client_notifications>.+)$")
 
         #LISP IPv4 EID Watches for Table (RLOC mapping in vrf default IPv4) IID (101), 1 watch entries
         #LISP invalid EID Watches for Table (AR mapping in Vlan 100) IID (103), 1 watch entries
-        p7 = re.compile(r"^LISP\s+(?P<address_family>[A-Za-z0-9]+)\sEID\sWatches\sfor\sTable\s+\((RLOC|AR)\smapping\sin\s+(?P<eid_table>(vrf\s+\w+)|(Vlan\s+\d+))(\s+)?(IPv4|IPv6)?\)\sIID\s+\((?P<instance_id>\d+)\),\s+(?P<entry_count>\d+)\swatch\sentries$")
+        p7 = regex_engine.compile(r"^LISP\s+(?P<address_family>[A-Za-z0-9]+)\sEID\sWatches\sfor\sTable\s+\((RLOC|AR)\smapping\sin\s+(?P<eid_table>(vrf\s+\w+)|(Vlan\s+\d+))(\s+)?(IPv4|IPv6)?\)\sIID\s+\((?P<instance_id>\d+)\),\s+(?P<entry_count>\d+)\swatch\sentries$")
 
         #  Watch entries for prefix 0.0.0.0/0
         #  Watch entries for prefix ::/0
         #  Watch entries for prefix 0000.0000.0000/0
-        p8 = re.compile(r"^Watch\sentries\sfor\sprefix\s+(?P<prefix>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})|([a-fA-F\d\:]+\/\d{1,3})|(([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,2}))$")
+        p8 = regex_engine.compile(r"^Watch\sentries\sfor\sprefix\s+(?P<prefix>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})|([a-fA-F\d\:]+\/\d{1,3})|(([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,2}))$")
 
         #   1.1.1.1
         #   E80::AEDE:48FF:FE00:1111
         #   f100.a551.0501
-        p9 = re.compile(r"^(?P<watched_entry>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|(([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})|([a-fA-F\d\:]+))")
+        p9 = regex_engine.compile(r"^(?P<watched_entry>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|(([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})|([a-fA-F\d\:]+))")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2933,72 +2934,72 @@ class ShowLispInstanceIdForwardingState(ShowLispInstanceIdForwardingStateSchema)
         ret_dict = {}
 
         # EID VRF                      red (0x2)
-        p1 = re.compile(r"^EID\s+VRF\s+(?P<eid_vrf>\S+\s+\S+)$")
+        p1 = regex_engine.compile(r"^EID\s+VRF\s+(?P<eid_vrf>\S+\s+\S+)$")
 
         # IPv4
-        p2 = re.compile(r"^(?P<address_family>IPv4|IPv6|L2)$")
+        p2 = regex_engine.compile(r"^(?P<address_family>IPv4|IPv6|L2)$")
 
         # Configured roles         ETR|PITR
-        p3 = re.compile(r"^Configured\s+roles\s+(?P<configured_roles>\S+)$")
+        p3 = regex_engine.compile(r"^Configured\s+roles\s+(?P<configured_roles>\S+)$")
 
         # EID table                IPv4:red
-        p4 = re.compile(r"^EID\s+table\s+(?P<eid_table>\S+)$")
+        p4 = regex_engine.compile(r"^EID\s+table\s+(?P<eid_table>\S+)$")
 
         # ALT table                <null>
-        p5 = re.compile(r"^ALT\s+table\s+(?P<alt_table>\S+)$")
+        p5 = regex_engine.compile(r"^ALT\s+table\s+(?P<alt_table>\S+)$")
 
         # Locator status bits      Disabled
-        p6 = re.compile(r"^Locator\s+status\s+bits\s+(?P<locator_status_bit>Disabled|Enabled)$")
+        p6 = regex_engine.compile(r"^Locator\s+status\s+bits\s+(?P<locator_status_bit>Disabled|Enabled)$")
 
         # Nonce                    N/A
-        p7 = re.compile(r"^Nonce\s+(?P<nonce>\S+)$")
+        p7 = regex_engine.compile(r"^Nonce\s+(?P<nonce>\S+)$")
 
         # TTL Propagation          Enabled
-        p8 = re.compile(r"^TTL\s+Propagation\s+(?P<ttl_propagation>Disabled|Enabled)$")
+        p8 = regex_engine.compile(r"^TTL\s+Propagation\s+(?P<ttl_propagation>Disabled|Enabled)$")
 
         # Table Suppression        Disabled
-        p9 = re.compile(r"^Table\s+Suppression\s+(?P<table_supression>Disabled|Enabled)$")
+        p9 = regex_engine.compile(r"^Table\s+Suppression\s+(?P<table_supression>Disabled|Enabled)$")
 
         # SGT Policy Fwd           Disabled
-        p10 = re.compile(r"^SGT\s+Policy\s+Fwd\s+(?P<sgt_policy_fwd>Disabled|Enabled)$")
+        p10 = regex_engine.compile(r"^SGT\s+Policy\s+Fwd\s+(?P<sgt_policy_fwd>Disabled|Enabled)$")
 
         # L2 Domain ID             0
-        p11 = re.compile(r"^L2\s+Domain\s+ID\s+(?P<l2_domain_id>\d+)$")
+        p11 = regex_engine.compile(r"^L2\s+Domain\s+ID\s+(?P<l2_domain_id>\d+)$")
 
         # IPv4 Unnum I/F           N/A
-        p12 = re.compile(r"^IPv4\s+Unnum\s+I\/F\s+(?P<ipv4_unnum_if>\S+)$")
+        p12 = regex_engine.compile(r"^IPv4\s+Unnum\s+I\/F\s+(?P<ipv4_unnum_if>\S+)$")
 
         # IPv6 Unnum I/F           N/A
-        p13 = re.compile(r"^IPv6\s+Unnum\s+I\/F\s+(?P<ipv6_unnum_if>\S+)$")
+        p13 = regex_engine.compile(r"^IPv6\s+Unnum\s+I\/F\s+(?P<ipv6_unnum_if>\S+)$")
 
         # RLOC transport VRF         Default
-        p14  = re.compile(r"^RLOC\s+transport\s+VRF\s+(?P<vrf>\S+)")
+        p14  = regex_engine.compile(r"^RLOC\s+transport\s+VRF\s+(?P<vrf>\S+)")
 
         # IPv4 RLOC table          IPv4:Default
-        p15 = re.compile(r"^IPv4\s+RLOC\s+table\s+(?P<ipv4_rloc_table>\S+)")
+        p15 = regex_engine.compile(r"^IPv4\s+RLOC\s+table\s+(?P<ipv4_rloc_table>\S+)")
 
         # IPv6 RLOC table          IPv6:Default
-        p16 = re.compile(r"^IPv6\s+RLOC\s+table\s+(?P<ipv6_rloc_table>\S+)")
+        p16 = regex_engine.compile(r"^IPv6\s+RLOC\s+table\s+(?P<ipv6_rloc_table>\S+)")
 
         # IPv4 path MTU discovery  min  576 max 65535
         # IPv6 path MTU discovery  min  1280 max 65535
-        p17 = re.compile(r"^IPv(?P<ip_version>\d)\s+path\s+MTU\s+discovery\s+"
-                         r"min\s+(?P<min>\d+)\s+max\s+(?P<max>\d+)$")
+        p17 = regex_engine.compile(r"^IPv(?P<ip_version>\d)\s+path\s+MTU\s+discovery\s+"
+                                   r"min\s+(?P<min>\d+)\s+max\s+(?P<max>\d+)$")
 
         # IPv4 RLOC fltr handle    0x0
         # IPv6 RLOC fltr handle    0x0
-        p18 = re.compile(r"^IPv(?P<ip_version>\d)\s+RLOC\s+fltr\s+handle\s+"
-                         r"(?P<rloc_fltr_handle>\S+)$")
+        p18 = regex_engine.compile(r"^IPv(?P<ip_version>\d)\s+RLOC\s+fltr\s+handle\s+"
+                                   r"(?P<rloc_fltr_handle>\S+)$")
 
         # LISP router ID             0
-        p19 = re.compile(r"^LISP\s+router\s+ID\s+(?P<lisp_id>\d+)$")
+        p19 = regex_engine.compile(r"^LISP\s+router\s+ID\s+(?P<lisp_id>\d+)$")
 
         # LISP virtual interface     LISP0.4100
-        p20 = re.compile(r"^LISP\s+virtual\s+interface\s+"
-                         r"(?P<lisp_virtual_intf>\S+)$")
+        p20 = regex_engine.compile(r"^LISP\s+virtual\s+interface\s+"
+                                   r"(?P<lisp_virtual_intf>\S+)$")
 
         # User                       LISP
-        p21 = re.compile(r"^User\s+(?P<user>\S+)$")
+        p21 = regex_engine.compile(r"^User\s+(?P<user>\S+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3261,49 +3262,49 @@ class ShowLispIAFServer(ShowLispIAFServerSchema):
         ret_dict = {}
 
         # Output for router lisp 0 instance-id 4100
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)"
-                        r"\s+instance-id\s+(?P<instance_id>\d+)$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)"
+                                  r"\s+instance-id\s+(?P<instance_id>\d+)$")
 
         # Shire                         1          0      0
-        p2 = re.compile(r"^(?P<site>\S+)\s+(?P<configured>\d+)\s+"
-                        r"(?P<registered>\d+)\s+(?P<incons>\d+)$")
+        p2 = regex_engine.compile(r"^(?P<site>\S+)\s+(?P<configured>\d+)\s+"
+                                  r"(?P<registered>\d+)\s+(?P<incons>\d+)$")
 
         # Site-registration limit for router lisp 0:              0
-        p3 = re.compile(r"^Site-registration\s+limit\s+for\s+"
-                        r"router\s+lisp\s+\d+:\s+(?P<site_reg_limit>\d+)")
+        p3 = regex_engine.compile(r"^Site-registration\s+limit\s+for\s+"
+                                  r"router\s+lisp\s+\d+:\s+(?P<site_reg_limit>\d+)")
 
         # Site-registration count for router lisp 0:              6
-        p4 = re.compile(r"^Site-registration\s+count\s+for\s+router\s+"
-                        r"lisp\s+\d+:\s+(?P<site_reg_count>\d+)")
+        p4 = regex_engine.compile(r"^Site-registration\s+count\s+for\s+router\s+"
+                                  r"lisp\s+\d+:\s+(?P<site_reg_count>\d+)")
 
         # Number of configured sites:                             1
-        p5 = re.compile(r"^Number\s+of\s+configured\s+sites:\s+(?P<configured_sites>\d+)")
+        p5 = regex_engine.compile(r"^Number\s+of\s+configured\s+sites:\s+(?P<configured_sites>\d+)")
 
         # Number of registered sites:                             0
-        p6 = re.compile(r"^Number\s+of\s+registered\s+sites:\s+(?P<registered_sites>\d+)")
+        p6 = regex_engine.compile(r"^Number\s+of\s+registered\s+sites:\s+(?P<registered_sites>\d+)")
 
         # Sites with inconsistent registrations:                  0
-        p7 = re.compile(r"^Sites\s+with\s+inconsistent\s+registrations:\s+"
-                        r"(?P<sites_inconsistent_registrations>\d+)")
+        p7 = regex_engine.compile(r"^Sites\s+with\s+inconsistent\s+registrations:\s+"
+                                  r"(?P<sites_inconsistent_registrations>\d+)")
 
         # IPv4|IPv6|MAC
-        p8 = re.compile(r"^(?P<af>IPv4|IPv6|MAC)$")
+        p8 = regex_engine.compile(r"^(?P<af>IPv4|IPv6|MAC)$")
 
         # Number of configured EID prefixes:                    1
-        p9 = re.compile(r"^Number\s+of\s+configured\s+EID\s+prefixes:\s+"
-                        r"(?P<configured_eid_prefixes>\d+)$")
+        p9 = regex_engine.compile(r"^Number\s+of\s+configured\s+EID\s+prefixes:\s+"
+                                  r"(?P<configured_eid_prefixes>\d+)$")
 
         # Number of registered EID prefixes:                    0
-        p10 = re.compile(r"^Number\s+of\s+registered\s+EID\s+prefixes:\s+"
-                         r"(?P<registered_eid_prefixes>\d+)$")
+        p10 = regex_engine.compile(r"^Number\s+of\s+registered\s+EID\s+prefixes:\s+"
+                                   r"(?P<registered_eid_prefixes>\d+)$")
 
         # Instance-Service site-registration limit:             0
-        p11 = re.compile(r"^Instance-Service\s+site-registration\s+limit:\s+"
-                         r"(?P<instance_service_site_reg_limit>\d+)$")
+        p11 = regex_engine.compile(r"^Instance-Service\s+site-registration\s+limit:\s+"
+                                   r"(?P<instance_service_site_reg_limit>\d+)$")
 
         # Registration-history size/limit:                      0/1000
-        p12 = re.compile(r"^Registration-history\s+size\/limit:\s+"
-                         r"(?P<registration_history_size>\d+)\/(?P<registration_history_limit>\d+)$")
+        p12 = regex_engine.compile(r"^Registration-history\s+size\/limit:\s+"
+                                   r"(?P<registration_history_size>\d+)\/(?P<registration_history_limit>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3471,37 +3472,37 @@ class ShowLispInstanceIdDNStatistics(ShowLispInstanceIdDNStatisticsSchema):
         ret_dict = {}
 
         # Output for router lisp 0
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)$")
 
         # LISP EID Statistics for instance ID 16777214
-        p2 = re.compile(r"^LISP\s+EID\s+Statistics\s+for\s+instance\s+ID\s+(?P<instance_id>\d+)$")
+        p2 = regex_engine.compile(r"^LISP\s+EID\s+Statistics\s+for\s+instance\s+ID\s+(?P<instance_id>\d+)$")
 
         # Active DN IAF count:                              1
-        p3 = re.compile(r"^Active\s+DN\s+IAF\s+count:\s+(?P<iaf_count>\d+)$")
+        p3 = regex_engine.compile(r"^Active\s+DN\s+IAF\s+count:\s+(?P<iaf_count>\d+)$")
 
         # Active DN local eid map count:                    1
-        p4 = re.compile(r"^Active\s+DN\s+local\s+eid\s+map\s+"
-                        r"count:\s+(?P<loca_eid_map_count>\d+)$")
+        p4 = regex_engine.compile(r"^Active\s+DN\s+local\s+eid\s+map\s+"
+                                  r"count:\s+(?P<loca_eid_map_count>\d+)$")
 
         # Active DN etr ems registration link count:        2
-        p5 = re.compile(r"^Active\s+DN\s+etr\s+ems\s+registration\s+"
-                        r"link\s+count:\s+(?P<etr_ems_link_count>\d+)$")
+        p5 = regex_engine.compile(r"^Active\s+DN\s+etr\s+ems\s+registration\s+"
+                                  r"link\s+count:\s+(?P<etr_ems_link_count>\d+)$")
 
         # UDP Map-Register (send/recv):                     1/0
-        p6 = re.compile(r"^UDP\s+Map-Register\s+\(send\/recv\):\s+"
-                        r"(?P<sent>\d)\/(?P<received>\d)")
+        p6 = regex_engine.compile(r"^UDP\s+Map-Register\s+\(send\/recv\):\s+"
+                                  r"(?P<sent>\d)\/(?P<received>\d)")
 
         # TCP Map-Register (send/recv):                     1/0
-        p7 = re.compile(r"^TCP\s+Map-Register\s+\(send\/recv\):\s+"
-                        r"(?P<sent>\d)\/(?P<received>\d)")
+        p7 = regex_engine.compile(r"^TCP\s+Map-Register\s+\(send\/recv\):\s+"
+                                  r"(?P<sent>\d)\/(?P<received>\d)")
 
         # UDP Map-Notify (send/recv):                       0/2
-        p8 = re.compile(r"^UDP\s+Map-Notify\s+\(send\/recv\):\s+"
-                        r"(?P<sent>\d)\/(?P<received>\d)")
+        p8 = regex_engine.compile(r"^UDP\s+Map-Notify\s+\(send\/recv\):\s+"
+                                  r"(?P<sent>\d)\/(?P<received>\d)")
 
         # TCP Map-Notify (send/recv):                       0/5
-        p9 = re.compile(r"^TCP\s+Map-Notify\s+\(send\/recv\):\s+"
-                        r"(?P<sent>\d)\/(?P<received>\d)")
+        p9 = regex_engine.compile(r"^TCP\s+Map-Notify\s+\(send\/recv\):\s+"
+                                  r"(?P<sent>\d)\/(?P<received>\d)")
         for line in output.splitlines():
             line = line.strip()
 
@@ -3644,55 +3645,55 @@ class ShowLispExtranetSummary(ShowLispExtranetSummarySchema):
         parsed_dict = {}
 
         # Total extranets: 1
-        p1 = re.compile(r"^Total\sextranets:\s+(?P<total_ext>\d+)")
+        p1 = regex_engine.compile(r"^Total\sextranets:\s+(?P<total_ext>\d+)")
 
         # Max allowed Extranet IPV4 EID prefixes: 4294967295
-        p2 = re.compile(r"^Max\sallowed\sExtranet\sIPV4\sEID\sprefixes:\s+(?P<MAX_ALLOWED_IPV4_PREFIX>\d+)")
+        p2 = regex_engine.compile(r"^Max\sallowed\sExtranet\sIPV4\sEID\sprefixes:\s+(?P<MAX_ALLOWED_IPV4_PREFIX>\d+)")
 
         # Total Extranet IPV4 EID prefixes      : 4
-        p3 = re.compile(r"^Total\sExtranet\sIPV4\sEID\sprefixes\s+:\s+(?P<TOTAL_IPV4_PREFIX>\d+)")
+        p3 = regex_engine.compile(r"^Total\sExtranet\sIPV4\sEID\sprefixes\s+:\s+(?P<TOTAL_IPV4_PREFIX>\d+)")
 
         # Max allowed Extranet IPV6 EID prefixes: 4294967295
-        p4 = re.compile(r"^Max\sallowed\sExtranet\sIPV6\sEID\sprefixes:\s+(?P<MAX_ALLOWED_IPV6_PREFIX>\d+)")
+        p4 = regex_engine.compile(r"^Max\sallowed\sExtranet\sIPV6\sEID\sprefixes:\s+(?P<MAX_ALLOWED_IPV6_PREFIX>\d+)")
 
         # Total Extranet IPV6 EID prefixes      : 0
-        p5 = re.compile(r"^Total\sExtranet\sIPV6\sEID\sprefixes\s+:\s+(?P<TOTAL_IPV6_PREFIX>\d+)")
+        p5 = regex_engine.compile(r"^Total\sExtranet\sIPV6\sEID\sprefixes\s+:\s+(?P<TOTAL_IPV6_PREFIX>\d+)")
 
         # Extranet name: ext1
-        p6 = re.compile(r"^\s*Extranet\sname:\s+(?P<EXTRANET_NAME>\S+)")
+        p6 = regex_engine.compile(r"^\s*Extranet\sname:\s+(?P<EXTRANET_NAME>\S+)")
 
         # Provider Instance ID : 111
-        p7 = re.compile(r"^Provider\sInstance ID\s+:\s+(?P<PROVIDER_IID>\d+)")
+        p7 = regex_engine.compile(r"^Provider\sInstance ID\s+:\s+(?P<PROVIDER_IID>\d+)")
 
         # Total Provider IPV4 EID prefixes : 0
-        p8 = re.compile(r"^Total\sProvider\sIPV4\sEID\sprefixes\s+:\s+(?P<PROVIDER_IPV4_PREFIX_COUNT>\d+)")
+        p8 = regex_engine.compile(r"^Total\sProvider\sIPV4\sEID\sprefixes\s+:\s+(?P<PROVIDER_IPV4_PREFIX_COUNT>\d+)")
 
         # Total Provider IPV6 EID prefixes : 0
-        p9 = re.compile(r"^Total\sProvider\sIPV6\sEID\sprefixes\s+:\s+(?P<PROVIDER_IPV6_PREFIX_COUNT>\d+)")
+        p9 = regex_engine.compile(r"^Total\sProvider\sIPV6\sEID\sprefixes\s+:\s+(?P<PROVIDER_IPV6_PREFIX_COUNT>\d+)")
 
         # Total Provider EID prefixes : 0
-        p10 = re.compile(r"^Total\sProvider\sEID\sprefixes\s+:\s+(?P<PROVIDER_TOTAL_PREFIX_COUNT>\d+)")
+        p10 = regex_engine.compile(r"^Total\sProvider\sEID\sprefixes\s+:\s+(?P<PROVIDER_TOTAL_PREFIX_COUNT>\d+)")
 
         # Total Subscriber Instances : 1
-        p11 = re.compile(r"^Total\sSubscriber\sInstances\s+:\s+(?P<SUBSCRIBER_INST_COUNT>\d+)")
+        p11 = regex_engine.compile(r"^Total\sSubscriber\sInstances\s+:\s+(?P<SUBSCRIBER_INST_COUNT>\d+)")
 
         # Total Subscriber IPV4 EID prefixes  : 4
-        p12 = re.compile(r"^Total\sSubscriber\sIPV4\sEID\sprefixes\s+:\s+(?P<SUBSCRIBER_IPV4_PREFIX_COUNT>\d+)")
+        p12 = regex_engine.compile(r"^Total\sSubscriber\sIPV4\sEID\sprefixes\s+:\s+(?P<SUBSCRIBER_IPV4_PREFIX_COUNT>\d+)")
 
         # Total Subscriber IPV6 EID prefixes  : 0
-        p13 = re.compile(r"^Total\sSubscriber\sIPV6\sEID\sprefixes\s+:\s+(?P<SUBSCRIBER_IPV6_PREFIX_COUNT>\d+)")
+        p13 = regex_engine.compile(r"^Total\sSubscriber\sIPV6\sEID\sprefixes\s+:\s+(?P<SUBSCRIBER_IPV6_PREFIX_COUNT>\d+)")
 
         # Total Subscriber EID prefixes : 4
-        p14 = re.compile(r"^Total\sSubscriber\sEID\sprefixes\s+:\s+(?P<SUBSCRIBER_TOTAL_PREFIX_COUNT>\d+)")
+        p14 = regex_engine.compile(r"^Total\sSubscriber\sEID\sprefixes\s+:\s+(?P<SUBSCRIBER_TOTAL_PREFIX_COUNT>\d+)")
 
         # Total IPV4 EID prefixes  : 4
-        p15 = re.compile(r"^Total\sIPV4\sEID\sprefixes\s+:\s+(?P<TOTAL_IPV4_PREFIX_COUNT>\d+)")
+        p15 = regex_engine.compile(r"^Total\sIPV4\sEID\sprefixes\s+:\s+(?P<TOTAL_IPV4_PREFIX_COUNT>\d+)")
 
         # Total IPV6 EID prefixes  : 0
-        p16 = re.compile(r"^Total\sIPV6\sEID\sprefixes\s+:\s+(?P<TOTAL_IPV6_PREFIX_COUNT>\d+)")
+        p16 = regex_engine.compile(r"^Total\sIPV6\sEID\sprefixes\s+:\s+(?P<TOTAL_IPV6_PREFIX_COUNT>\d+)")
 
         # Total EID prefixes  : 4
-        p17 = re.compile(r"^Total\sEID\sprefixes\s+:\s+(?P<TOTAL_PREFIX_COUNT>\d+)")
+        p17 = regex_engine.compile(r"^Total\sEID\sprefixes\s+:\s+(?P<TOTAL_PREFIX_COUNT>\d+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -4081,14 +4082,14 @@ class ShowLispRegistrationHistory(ShowLispRegistrationHistorySchema):
         ret_dict ={}
 
         # *Mar  5 20:40:31.737 17476    TCP   No   No  80.80.80.11
-        p1 = re.compile(r"^(\*?)(?P<time>([\w:\s\.]+))\s+(?P<instance_id>\d+)\s+"
-                        r"(?P<protocol>\S+)\s+(?P<roam>\S+)\s+(?P<wlc>\S+)\s+"
-                        r"((?P<source>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+)))$")
+        p1 = regex_engine.compile(r"^(\*?)(?P<time>([\w:\s\.]+))\s+(?P<instance_id>\d+)\s+"
+                                  r"(?P<protocol>\S+)\s+(?P<roam>\S+)\s+(?P<wlc>\S+)\s+"
+                                  r"((?P<source>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+)))$")
 
         # +*2001:192:168:1::71/128 / aabb.cc00.c901
         # + 0.0.0.0/0
-        p2 = re.compile(r"^(?P<reg_type>\+|\-)\*?\s?(?P<eid>([0-9a-fA-F.:]+))"
-                        r"\/(?P<mask>\d{1,3})(\s\/\s([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})?")
+        p2 = regex_engine.compile(r"^(?P<reg_type>\+|\-)\*?\s?(?P<eid>([0-9a-fA-F.:]+))"
+                                  r"\/(?P<mask>\d{1,3})(\s\/\s([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})?")
 
         for line in output.splitlines():
             line = line.strip()
@@ -4170,74 +4171,74 @@ class ShowLisp(ShowLispSchema):
         ret_dict ={}
 
         # Output for router lisp 0
-        p1 = re.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)$')
+        p1 = regex_engine.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)$')
 
         # Router-lisp ID:        0
-        p2 = re.compile(r'^Router-lisp\s+ID:\s+(?P<lisp_id>\d+)$')
+        p2 = regex_engine.compile(r'^Router-lisp\s+ID:\s+(?P<lisp_id>\d+)$')
 
         # Domain ID:             0
-        p3 = re.compile(r'^Domain\s+ID:\s+(?P<domain_id>\d+)$')
+        p3 = regex_engine.compile(r'^Domain\s+ID:\s+(?P<domain_id>\d+)$')
 
         # Multihoming ID:        0
-        p4 = re.compile(r'^Multihoming\s+ID:\s+(?P<multihoming_id>\d+)$')
+        p4 = regex_engine.compile(r'^Multihoming\s+ID:\s+(?P<multihoming_id>\d+)$')
 
         # Locator table:         default
-        p5 = re.compile(r'^Locator\s+table:\s+(?P<locator_table>\S+)$')
+        p5 = regex_engine.compile(r'^Locator\s+table:\s+(?P<locator_table>\S+)$')
 
         # Locator default-set:   N/A
-        p6 = re.compile(r'^Locator\s+default-set:\s+(?P<locator_default_set>\S+)$')
+        p6 = regex_engine.compile(r'^Locator\s+default-set:\s+(?P<locator_default_set>\S+)$')
 
         # EID instance count:    7
-        p7 = re.compile(r'^EID\s+instance count:\s+(?P<eid_instance_count>\d+)$')
+        p7 = regex_engine.compile(r'^EID\s+instance count:\s+(?P<eid_instance_count>\d+)$')
 
         # Capability:            Publish-Subscribe Instance-ID
         # Capability:            Domain-Info
-        p8 = re.compile(r'^Capability:\s+(?P<capability>Publish-Subscribe\s+Instance-ID|\S+)$')
+        p8 = regex_engine.compile(r'^Capability:\s+(?P<capability>Publish-Subscribe\s+Instance-ID|\S+)$')
 
         # Domain-Info
-        p9 = re.compile(r'^(?P<domain>Domain-Info)$')
+        p9 = regex_engine.compile(r'^(?P<domain>Domain-Info)$')
 
         # Route-Tag
-        p10 = re.compile(r'^(?P<route>Route-Tag)$')
+        p10 = regex_engine.compile(r'^(?P<route>Route-Tag)$')
 
         # SGT
-        p11 = re.compile(r'^(?P<sgt>SGT)$')
+        p11 = regex_engine.compile(r'^(?P<sgt>SGT)$')
 
         # Default-originate
-        p12 = re.compile(r'^(?P<default>Default-originate)$')
+        p12 = regex_engine.compile(r'^(?P<default>Default-originate)$')
 
         # Service-registration
-        p13 = re.compile(r'^(?P<service>Service-registration)$')
+        p13 = regex_engine.compile(r'^(?P<service>Service-registration)$')
 
         # Extranet-policy-propagation
-        p14 = re.compile(r'^(?P<extranet>Extranet-policy-propagation)$')
+        p14 = regex_engine.compile(r'^(?P<extranet>Extranet-policy-propagation)$')
 
         # Default-ETR Route-metric
-        p15 = re.compile(r'^(?P<etr>Default-ETR Route-metric)$')
+        p15 = regex_engine.compile(r'^(?P<etr>Default-ETR Route-metric)$')
 
         # Unknown vendor type skip
-        p16 = re.compile(r'^(?P<vendor>Unknown\s+vendor\s+type\s+skip)$')
+        p16 = regex_engine.compile(r'^(?P<vendor>Unknown\s+vendor\s+type\s+skip)$')
 
         # RAR-notify
-        p17 = re.compile(r'^(?P<rar>RAR-notify)$')
+        p17 = regex_engine.compile(r'^(?P<rar>RAR-notify)$')
 
         # Extended Subscription
-        p18 = re.compile(r'^(?P<extended>Extended\s+Subscription)$')
+        p18 = regex_engine.compile(r'^(?P<extended>Extended\s+Subscription)$')
 
         # Silent Host Detection
-        p19 = re.compile(r'^(?P<shd>Silent\s+Host\s+Detection)$')
+        p19 = regex_engine.compile(r'^(?P<shd>Silent\s+Host\s+Detection)$')
 
         # RTT Refresh
-        p20 = re.compile(r'^(?P<rtt>RTT\s+Refresh)$')
+        p20 = regex_engine.compile(r'^(?P<rtt>RTT\s+Refresh)$')
 
         # RLOC Domain Path
-        p21 = re.compile(r'^(?P<rdp>RLOC\s+Domain\s+Path)$')
+        p21 = regex_engine.compile(r'^(?P<rdp>RLOC\s+Domain\s+Path)$')
 
         # Publish-Subscribe EID
-        p22 = re.compile(r'^(?P<pub_sub_eid>Publish-Subscribe\s+EID)$')
+        p22 = regex_engine.compile(r'^(?P<pub_sub_eid>Publish-Subscribe\s+EID)$')
 
         # TCP path mtu discovery OFF
-        p23 = re.compile(r'^TCP\s+path\s+mtu\s+discovery\s+(?P<tcp_path_mtu_discovery>ON|OFF)$')
+        p23 = regex_engine.compile(r'^TCP\s+path\s+mtu\s+discovery\s+(?P<tcp_path_mtu_discovery>ON|OFF)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4615,229 +4616,229 @@ class ShowLispInstanceIdService(ShowLispInstanceIdServiceSchema):
             'enabled': True}
 
         # Instance ID:                              4100
-        p1 = re.compile(r'Instance ID:\s+(?P<instance_id>\d+)$')
+        p1 = regex_engine.compile(r'Instance ID:\s+(?P<instance_id>\d+)$')
 
         # Router-lisp ID:                      0
-        p2 = re.compile(r'Router-lisp +ID *: +(?P<lisp_id>\d+)$')
+        p2 = regex_engine.compile(r'Router-lisp +ID *: +(?P<lisp_id>\d+)$')
 
         # Locator table:                       default
-        p3 = re.compile(r'Locator +table *: +(?P<locator_table>\S+)$')
+        p3 = regex_engine.compile(r'Locator +table *: +(?P<locator_table>\S+)$')
 
         # EID table:                                vrf red
-        p4 = re.compile(r'EID table:\s+(?P<eid_table>.*)$')
+        p4 = regex_engine.compile(r'EID table:\s+(?P<eid_table>.*)$')
 
         # Ingress Tunnel Router (ITR):         enabled
         # Egress Tunnel Router (ETR):          enabled
-        p5 = re.compile(r'(Ingress|Egress) +Tunnel +Router '
-                        r'+\((?P<type>(ITR|ETR))\) *: '
-                        r'+(?P<enabled>(enabled|disabled))$')
+        p5 = regex_engine.compile(r'(Ingress|Egress) +Tunnel +Router '
+                                  r'+\((?P<type>(ITR|ETR))\) *: '
+                                  r'+(?P<enabled>(enabled|disabled))$')
 
         # Proxy-ITR Router (PITR):             disabled
         # Proxy-ETR Router (PETR):             disabled
         # Proxy-ETR Router (PETR):             enabled RLOCs: 10.10.10.10
         # Proxy-ITR Router (PITR):             enabled RLOCs: 2001:10:10:10::10
-        p6 = re.compile(r'Proxy\-(ITR|ETR) +Router +\((?P<proxy_type>(PITR|PETR))\)'
-                        r'*: +(?P<proxy_itr_router>(enabled|disabled))'
-                        r'(?: +RLOCs: +(?P<proxy_itr_rloc>'
-                        r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|[a-fA-F\d\:]+))?$')
+        p6 = regex_engine.compile(r'Proxy\-(ITR|ETR) +Router +\((?P<proxy_type>(PITR|PETR))\)'
+                                  r'*: +(?P<proxy_itr_router>(enabled|disabled))'
+                                  r'(?: +RLOCs: +(?P<proxy_itr_rloc>'
+                                  r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|[a-fA-F\d\:]+))?$')
 
         # ITR local RLOC (last resort):             *** NOT FOUND ***
-        p7 = re.compile(r'^ITR +local +RLOC +\(last +resort\):\s+'
-                        r'(?P<local_rloc_last_resort>.*)$')
+        p7 = regex_engine.compile(r'^ITR +local +RLOC +\(last +resort\):\s+'
+                                  r'(?P<local_rloc_last_resort>.*)$')
 
         # ITR use proxy ETR RLOC(Encap IID):        1.1.1.1 (self), 66.66.66.66
-        p8 = re.compile(r'^ITR\s+use +proxy +ETR +RLOC\(Encap IID\) *'
-                        r': +(?P<use_proxy_etr_rloc_1>[\d.]+ *'
-                        r'(\(self\))?),? *(?P<use_proxy_etr_rloc_2>([\d.]+)|([a-fA-F\d\:]+))?$')
+        p8 = regex_engine.compile(r'^ITR\s+use +proxy +ETR +RLOC\(Encap IID\) *'
+                                  r': +(?P<use_proxy_etr_rloc_1>[\d.]+ *'
+                                  r'(\(self\))?),? *(?P<use_proxy_etr_rloc_2>([\d.]+)|([a-fA-F\d\:]+))?$')
 
         # ITR Solicit Map Request (SMR):       accept and process
-        p9 = re.compile(r'^ITR +Solicit +Map +Request +\(SMR\) *:'
-                        r'+(?P<solicit_map_request>.*)$')
+        p9 = regex_engine.compile(r'^ITR +Solicit +Map +Request +\(SMR\) *:'
+                                  r'+(?P<solicit_map_request>.*)$')
 
         # Max SMRs per map-cache entry:      8 more specifics
-        p10 = re.compile(r'^Max SMRs per map-cache entry:\s+(?P<max_smr_per_map_cache>.*)$')
+        p10 = regex_engine.compile(r'^Max SMRs per map-cache entry:\s+(?P<max_smr_per_map_cache>.*)$')
 
         # Multiple SMR suppression time:     20 secs
-        p11 = re.compile(r'^Multiple +SMR +suppression +time *: +'
-                        r'(?P<multiple_smr_supression_time>\d+) +secs$')
+        p11 = regex_engine.compile(r'^Multiple +SMR +suppression +time *: +'
+                                  r'(?P<multiple_smr_supression_time>\d+) +secs$')
 
         # ETR accept mapping data:             disabled, verify disabled
-        p12 = re.compile(r'^ETR +accept +mapping +data *: +(?P<accept_mapping_data>.*)$')
+        p12 = regex_engine.compile(r'^ETR +accept +mapping +data *: +(?P<accept_mapping_data>.*)$')
 
         # ETR map-cache TTL:                   1d00h
-        p13 = re.compile(r'^ETR +map-cache +TTL *: +(?P<map_cache_ttl>\S+)$')
+        p13 = regex_engine.compile(r'^ETR +map-cache +TTL *: +(?P<map_cache_ttl>\S+)$')
 
         # NAT-traversal Router (NAT-RTR):      disabled
-        p14 = re.compile(r'^NAT-traversal +Router +\(NAT\-RTR\) *: +'
-                         r'(?P<nat_traversal_router>(enabled|disabled))$')
+        p14 = regex_engine.compile(r'^NAT-traversal +Router +\(NAT\-RTR\) *: +'
+                                   r'(?P<nat_traversal_router>(enabled|disabled))$')
 
         # Mobility First-Hop Router:           disabled
-        p15 = re.compile(r'Mobility +First-Hop +Router *:'
-                         r' +(?P<mobility_first_hop_router>(enabled|disabled))$')
+        p15 = regex_engine.compile(r'Mobility +First-Hop +Router *:'
+                                   r' +(?P<mobility_first_hop_router>(enabled|disabled))$')
 
         # Map Server (MS):                     disabled
-        p16 = re.compile(r'Map +Server +\(MS\) *:'
-                        r' +(?P<enabled>(enabled|disabled))$')
+        p16 = regex_engine.compile(r'Map +Server +\(MS\) *:'
+                                  r' +(?P<enabled>(enabled|disabled))$')
 
         # Map Resolver (MR):                   disabled
-        p17 = re.compile(r'Map +Resolver +\(MR\) *:'
-                         r' +(?P<enabled>enabled|disabled)$')
+        p17 = regex_engine.compile(r'Map +Resolver +\(MR\) *:'
+                                   r' +(?P<enabled>enabled|disabled)$')
 
         # Delegated Database Tree (DDT):       disabled
-        p18 = re.compile(r'Delegated +Database +Tree +\(DDT\) *:'
-                         r' +(?P<delegated_database_tree>enabled|disabled)$')
+        p18 = regex_engine.compile(r'Delegated +Database +Tree +\(DDT\) *:'
+                                   r' +(?P<delegated_database_tree>enabled|disabled)$')
 
         # Mr-use-petr:                              enabled
-        p19 = re.compile(r'^Mr-use-petr:\s+(?P<role>enabled|disabled)$')
+        p19 = regex_engine.compile(r'^Mr-use-petr:\s+(?P<role>enabled|disabled)$')
 
         # Mr-use-petr locator set name:             RLOC1
-        p20 = re.compile(r'^Mr-use-petr locator set name:\s+(?P<locator_set>\S+)$')
+        p20 = regex_engine.compile(r'^Mr-use-petr locator set name:\s+(?P<locator_set>\S+)$')
 
         # First-Packet pETR:                        enabled
-        p21 = re.compile(r'^First-Packet pETR:\s+(?P<role>enabled|disabled)$')
+        p21 = regex_engine.compile(r'^First-Packet pETR:\s+(?P<role>enabled|disabled)$')
 
         # First-Packet pETR locator set name:       RLOC1
-        p22 = re.compile(r'^First-Packet pETR locator set name:\s+(?P<locator_set>\S+)$')
+        p22 = regex_engine.compile(r'^First-Packet pETR locator set name:\s+(?P<locator_set>\S+)$')
 
         # Multiple IP per MAC support:              disabled
-        p23 = re.compile(r'^Multiple IP per MAC support:\s+'
-                         r'(?P<multiple_ip_per_mac>disabled|enabled)$')
+        p23 = regex_engine.compile(r'^Multiple IP per MAC support:\s+'
+                                   r'(?P<multiple_ip_per_mac>disabled|enabled)$')
 
         # Multicast Flood Access-Tunnel:            disabled
-        p24 = re.compile(r'^Multicast Flood Access-Tunnel:\s+'
-                         r'(?P<mcast_flood_access_tunnel>disabled|enabled)$')
+        p24 = regex_engine.compile(r'^Multicast Flood Access-Tunnel:\s+'
+                                   r'(?P<mcast_flood_access_tunnel>disabled|enabled)$')
 
         # Publication-Subscription-EID:             disabled
-        p25_1 = re.compile(r'^Publication-Subscription-EID:\s+'
-                         r'(?P<pub_sub_eid>disabled|enabled)$')
+        p25_1 = regex_engine.compile(r'^Publication-Subscription-EID:\s+'
+                                   r'(?P<pub_sub_eid>disabled|enabled)$')
 
         # Publication-Subscription:                 enabled
-        p25 = re.compile(r'^Publication-Subscription:\s+(?P<role>enabled|disabled)$')
+        p25 = regex_engine.compile(r'^Publication-Subscription:\s+(?P<role>enabled|disabled)$')
 
         # Publisher(s):                           *** NOT FOUND ***
-        p26 = re.compile(r'^Publisher\(s\):\s+(?P<publishers>[\d.:]+)(?: +.*)?$')
+        p26 = regex_engine.compile(r'^Publisher\(s\):\s+(?P<publishers>[\d.:]+)(?: +.*)?$')
 
         # Subscriber(s):                           *** NOT FOUND ***
-        p27 = re.compile(r'^Subscriber\(s\):\s+(?P<subscribers>.*)')
+        p27 = regex_engine.compile(r'^Subscriber\(s\):\s+(?P<subscribers>.*)')
 
         # Site Registration Limit:                  0
-        p28 = re.compile(r'Site Registration Limit:\s+(?P<site_registration_limit>\d+)$')
+        p28 = regex_engine.compile(r'Site Registration Limit:\s+(?P<site_registration_limit>\d+)$')
 
         # ITR Map-Resolver(s):                 10.64.4.4, 10.166.13.13
-        p29 = re.compile(r'ITR +Map\-Resolver\(s\) *: +(?P<mr_address>.*)$')
+        p29 = regex_engine.compile(r'ITR +Map\-Resolver\(s\) *: +(?P<mr_address>.*)$')
 
         #                                      10.84.66.66 *** not reachable ***
-        p30 = re.compile(r'^(?P<prefix_list>[\d.:]+)(?: +.*)?$')
+        p30 = regex_engine.compile(r'^(?P<prefix_list>[\d.:]+)(?: +.*)?$')
 
         # ETR Map-Server(s):                   10.64.4.4 (17:49:58), 10.166.13.13 (00:00:35)
-        p31 = re.compile(r'ETR +Map\-Server\(s\) *: +(?P<ms_address>.*)$')
+        p31 = regex_engine.compile(r'ETR +Map\-Server\(s\) *: +(?P<ms_address>.*)$')
 
         # xTR-ID:                              0x730E0861-0x12996F6D-0xEFEA2114-0xE1C951F7
-        p32 = re.compile(r'^xTR-ID *: +(?P<xtr_id>[a-fA-F0-9x-]+)$')
+        p32 = regex_engine.compile(r'^xTR-ID *: +(?P<xtr_id>[a-fA-F0-9x-]+)$')
 
         # site-ID:                             unspecified
-        p33 = re.compile(r'site-ID *: +(?P<site_id>\S+)$')
+        p33 = regex_engine.compile(r'site-ID *: +(?P<site_id>\S+)$')
 
         # RLOC-probe algorithm:              disabled
-        p34 = re.compile(r'RLOC\-probe +algorithm *: '
-                         r'+(?P<rloc_probe_algorithm>enabled|disabled)$')
+        p34 = regex_engine.compile(r'RLOC\-probe +algorithm *: '
+                                   r'+(?P<rloc_probe_algorithm>enabled|disabled)$')
 
         # RLOC-probe on route change:        N/A (periodic probing disabled)
-        p35 = re.compile(r'RLOC\-probe +on +route +change *: +(?P<rloc_probe_on_route_change>.*)$')
+        p35 = regex_engine.compile(r'RLOC\-probe +on +route +change *: +(?P<rloc_probe_on_route_change>.*)$')
 
         # RLOC-probe on member change:       disabled
-        p36 = re.compile(r'RLOC\-probe +on +member +change *:'
-                         r' +(?P<rloc_probe_member_change>enabled|disabled)$')
+        p36 = regex_engine.compile(r'RLOC\-probe +on +member +change *:'
+                                   r' +(?P<rloc_probe_member_change>enabled|disabled)$')
 
         # LSB reports:                       process
-        p37 = re.compile(r'LSB +reports *: +(?P<lsb_reports>\S+)$')
+        p37 = regex_engine.compile(r'LSB +reports *: +(?P<lsb_reports>\S+)$')
 
         # IPv4 RLOC minimum mask length:     /0
-        p38 = re.compile(r'IPv4 +RLOC +minimum +mask +length *:'
-                         r' +\/(?P<ipv4_rloc_min_mask_len>\d+)$')
+        p38 = regex_engine.compile(r'IPv4 +RLOC +minimum +mask +length *:'
+                                   r' +\/(?P<ipv4_rloc_min_mask_len>\d+)$')
 
         # IPv6 RLOC minimum mask length:     /0
-        p39 = re.compile(r'IPv6 +RLOC +minimum +mask +length *:'
-                         r' +\/(?P<ipv6_rloc_min_mask_len>\d+)$')
+        p39 = regex_engine.compile(r'IPv6 +RLOC +minimum +mask +length *:'
+                                   r' +\/(?P<ipv6_rloc_min_mask_len>\d+)$')
 
         # Static mappings configured:             1
-        p40 = re.compile(r'Static mappings configured:\s+(?P<static_mappings>\d+)$')
+        p40 = regex_engine.compile(r'Static mappings configured:\s+(?P<static_mappings>\d+)$')
 
         # Map-cache size/limit:                   2/4294967295
-        p41 = re.compile(r'Map-cache size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p41 = regex_engine.compile(r'Map-cache size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # Imported route count/limit:             0/5000
-        p42 = re.compile(r'Imported route count\/limit:\s+(?P<count>\d+)\/(?P<limit>\d+)$')
+        p42 = regex_engine.compile(r'Imported route count\/limit:\s+(?P<count>\d+)\/(?P<limit>\d+)$')
 
         # Map-cache activity check period:   60 secs
-        p43 = re.compile(r'Map-cache +activity +check +period *:'
-                         r' +(?P<activity_check_period>\d+) +secs$')
+        p43 = regex_engine.compile(r'Map-cache +activity +check +period *:'
+                                   r' +(?P<activity_check_period>\d+) +secs$')
 
         # Map-cache signal suppress:              disabled
-        p44 = re.compile(r'Map-cache signal suppress:\s+(?P<signal_supress>disabled|enabled)$')
+        p44 = regex_engine.compile(r'Map-cache signal suppress:\s+(?P<signal_supress>disabled|enabled)$')
 
         # Conservative-allocation:                disabled
-        p45 = re.compile(r'Conservative-allocation:\s+(?P<conservative_allocation>disabled|enabled)$')
+        p45 = regex_engine.compile(r'Conservative-allocation:\s+(?P<conservative_allocation>disabled|enabled)$')
 
         # Map-cache FIB updates:                  established
-        p46 = re.compile(r'Map-cache FIB updates:\s+(?P<fib_updates>\S+)$')
+        p46 = regex_engine.compile(r'Map-cache FIB updates:\s+(?P<fib_updates>\S+)$')
 
         # Persistent map-cache:              disabled
-        p47 = re.compile(r'Persistent +map\-cache *:'
-                         r' +(?P<persistent>enabled|disabled)$')
+        p47 = regex_engine.compile(r'Persistent +map\-cache *:'
+                                   r' +(?P<persistent>enabled|disabled)$')
 
         # Map-cache activity-tracking:            enabled
-        p48 = re.compile(r'Map-cache activity-tracking:\s+(?P<activity_tracking>\S+)$')
+        p48 = regex_engine.compile(r'Map-cache activity-tracking:\s+(?P<activity_tracking>\S+)$')
 
         # Total database mapping size:            2
-        p49 = re.compile(r'Total database mapping size:\s+(?P<total_database_mapping>\d+)')
+        p49 = regex_engine.compile(r'Total database mapping size:\s+(?P<total_database_mapping>\d+)')
 
         # static database size/limit:             0/4294967295
-        p50 = re.compile(r'static database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p50 = regex_engine.compile(r'static database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # dynamic database size/limit:            2/4294967295
-        p51 = re.compile(r'dynamic database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p51 = regex_engine.compile(r'dynamic database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # route-import database size/limit:       0/5000
-        p52 = re.compile(r'route-import database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p52 = regex_engine.compile(r'route-import database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # import-site-reg database size/limit:    0/4294967295
-        p53 = re.compile(r'import-site-reg database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p53 = regex_engine.compile(r'import-site-reg database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # dummy database size/limit:              0/4294967295
-        p54 = re.compile(r'dummy database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p54 = regex_engine.compile(r'dummy database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # import-publication database size/limit: 0/4294967295
-        p55 = re.compile(r'import-publication database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
+        p55 = regex_engine.compile(r'import-publication database size\/limit:\s+(?P<size>\d+)\/(?P<limit>\d+)$')
 
         # proxy database size:                    0
-        p56 = re.compile(r'proxy database size:\s+(?P<size>\d+)$')
+        p56 = regex_engine.compile(r'proxy database size:\s+(?P<size>\d+)$')
 
         # Inactive (deconfig/away) size:          0
-        p57 = re.compile(r'Inactive \(deconfig\/away\) size:\s+(?P<size>\d+)$')
+        p57 = regex_engine.compile(r'Inactive \(deconfig\/away\) size:\s+(?P<size>\d+)$')
 
         # Map-cache:                              0
-        p58 = re.compile(r'Map-cache:\s+(?P<map_cache>\d+)')
+        p58 = regex_engine.compile(r'Map-cache:\s+(?P<map_cache>\d+)')
 
         # RIB:                                    0
-        p59 = re.compile(r'RIB:\s+(?P<rib>\d+)')
+        p59 = regex_engine.compile(r'RIB:\s+(?P<rib>\d+)')
 
         # Database:                               0
-        p60 = re.compile(r'Database:\s+(?P<database>\d+)')
+        p60 = regex_engine.compile(r'Database:\s+(?P<database>\d+)')
 
         # Prefix-list:                            0
-        p61 = re.compile(r'Prefix-list:\s+(?P<prefix_list>\d+)')
+        p61 = regex_engine.compile(r'Prefix-list:\s+(?P<prefix_list>\d+)')
 
         #   Vlan100: 10.229.11.1 (Loopback0)
-        p62 = re.compile(r'Vlan(?P<vlans>(\d+))\: +(?P<address>([0-9\.\:]+)) +'
-                         r'\((?P<interface>(\S+))\)$')
+        p62 = regex_engine.compile(r'Vlan(?P<vlans>(\d+))\: +(?P<address>([0-9\.\:]+)) +'
+                                   r'\((?P<interface>(\S+))\)$')
 
         # Encapsulation type:                       vxlan
-        p63 = re.compile(r'Encapsulation type:\s+(?P<encapsulation_type>\S+)$')
+        p63 = regex_engine.compile(r'Encapsulation type:\s+(?P<encapsulation_type>\S+)$')
 
         # Ethernet Fast Detection:                  enabled
         # Ethernet Fast Detection:                  disabled
-        p64 = re.compile(r'^Ethernet Fast Detection:\s+(?P<eth_fast_detect>enabled|disabled)$')
+        p64 = regex_engine.compile(r'^Ethernet Fast Detection:\s+(?P<eth_fast_detect>enabled|disabled)$')
 
         count = 0
         for line in out.splitlines():
@@ -5545,45 +5546,45 @@ class ShowLispSiteSummary(ShowLispSiteSummarySchema):
         ret_dict = {}
 
         # Edoras                        0          0      0          0          0      0          0          0      0
-        p1 = re.compile(r'^(?P<site>\S+)\s+(?P<v4_configured>\d+)\s+'
-                        r'(?P<v4_registered>\d+)\s+(?P<v4_inconsistent>\d+)\s+'
-                        r'(?P<v6_configured>\d+)\s+(?P<v6_registered>\d+)\s+'
-                        r'(?P<v6_inconsistent>\d+)\s+(?P<mac_configured>\d+)\s+'
-                        r'(?P<mac_registered>\d+)\s+(?P<mac_inconsistent>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<site>\S+)\s+(?P<v4_configured>\d+)\s+'
+                                  r'(?P<v4_registered>\d+)\s+(?P<v4_inconsistent>\d+)\s+'
+                                  r'(?P<v6_configured>\d+)\s+(?P<v6_registered>\d+)\s+'
+                                  r'(?P<v6_inconsistent>\d+)\s+(?P<mac_configured>\d+)\s+'
+                                  r'(?P<mac_registered>\d+)\s+(?P<mac_inconsistent>\d+)$')
 
         # Site-registration limit for router lisp 0:              0
-        p2 = re.compile(r'^Site-registration\s+limit\s+for\s+'
-                        r'router\s+lisp\s+(?P<lisp_id>\d+):\s+(?P<site_registration_limit>\d+)$')
+        p2 = regex_engine.compile(r'^Site-registration\s+limit\s+for\s+'
+                                  r'router\s+lisp\s+(?P<lisp_id>\d+):\s+(?P<site_registration_limit>\d+)$')
 
         # Site-registration count for router lisp 0:              5
-        p3 = re.compile(r'^Site-registration\s+count\s+for\s+router\s+lisp\s+\d+'
-                        r':\s+(?P<site_registration_count>\d+)$')
+        p3 = regex_engine.compile(r'^Site-registration\s+count\s+for\s+router\s+lisp\s+\d+'
+                                  r':\s+(?P<site_registration_count>\d+)$')
 
         # Number of address-resolution entries:                   3
-        p4 = re.compile(r'^Number\s+of\s+address-resolution\s+entries:\s+(?P<ar_entries>\d+)$')
+        p4 = regex_engine.compile(r'^Number\s+of\s+address-resolution\s+entries:\s+(?P<ar_entries>\d+)$')
 
         # Number of configured sites:                             2
-        p5 = re.compile(r'^Number\s+of\s+configured\s+sites:\s+(?P<configured_sites>\d+)$')
+        p5 = regex_engine.compile(r'^Number\s+of\s+configured\s+sites:\s+(?P<configured_sites>\d+)$')
 
         # Number of registered sites:                             1
-        p6 = re.compile(r'^Number\s+of\s+registered\s+sites:\s+(?P<registered_sites>\d+)$')
+        p6 = regex_engine.compile(r'^Number\s+of\s+registered\s+sites:\s+(?P<registered_sites>\d+)$')
 
         # Sites with inconsistent registrations:                  0
-        p7 = re.compile(r'^Sites\s+with\s+inconsistent\s+registrations:'
-                        r'\s+(?P<sites_with_inconsistent_reg>\d+)$')
+        p7 = regex_engine.compile(r'^Sites\s+with\s+inconsistent\s+registrations:'
+                                  r'\s+(?P<sites_with_inconsistent_reg>\d+)$')
 
         # Number of configured EID prefixes:                    4
-        p8 = re.compile(r'^Number\s+of\s+configured\s+EID\s+prefixes:'
-                        r'\s+(?P<ipv4_configured>\d+)$')
+        p8 = regex_engine.compile(r'^Number\s+of\s+configured\s+EID\s+prefixes:'
+                                  r'\s+(?P<ipv4_configured>\d+)$')
 
         # Number of registered EID prefixes:                    2
-        p9 = re.compile(r'^Number\s+of\s+registered\s+EID\s+prefixes:'
-                        r'\s+(?P<ipv4_registered>\d+)$')
+        p9 = regex_engine.compile(r'^Number\s+of\s+registered\s+EID\s+prefixes:'
+                                  r'\s+(?P<ipv4_registered>\d+)$')
 
         # IPv4
         # IPv6
         # MAC
-        p10 = re.compile(r'^(?P<ip_version>IPv4|IPv6|MAC)$')
+        p10 = regex_engine.compile(r'^(?P<ip_version>IPv4|IPv6|MAC)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6016,279 +6017,279 @@ class ShowLispInstanceIdServiceStatistics(ShowLispInstanceIdServiceStatisticsSch
 
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 101
-        p1 = re.compile(r'^Output for router lisp (?P<lisp_id>\d+)(\s+instance-id\s+\d+)?$')
+        p1 = regex_engine.compile(r'^Output for router lisp (?P<lisp_id>\d+)(\s+instance-id\s+\d+)?$')
 
         # LISP EID Statistics for instance ID 4100 - last cleared: never
-        p2 = re.compile(r'^LISP EID Statistics for instance ID (?P<instance_id>\d+) - last cleared: (?P<last_cleared>\S+)$')
+        p2 = regex_engine.compile(r'^LISP EID Statistics for instance ID (?P<instance_id>\d+) - last cleared: (?P<last_cleared>\S+)$')
 
         # Map-Requests in/out:                              1/24
-        p3 = re.compile(r'^Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p3 = regex_engine.compile(r'^Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Requests in (5 sec/1 min/5 min):            0/0/0
-        p4 = re.compile(r'^Map-Requests in \(5 sec\/1 min\/5 min\):\s+(?P<sec>\d+)\/(?P<min1>\d+)\/(?P<min5>\d+)$')
+        p4 = regex_engine.compile(r'^Map-Requests in \(5 sec\/1 min\/5 min\):\s+(?P<sec>\d+)\/(?P<min1>\d+)\/(?P<min5>\d+)$')
 
         # Encapsulated Map-Requests in/out:               0/23
-        p5 = re.compile(r'^Encapsulated Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p5 = regex_engine.compile(r'^Encapsulated Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # RLOC-probe Map-Requests in/out:                 1/1
-        p6 = re.compile(r'^RLOC-probe Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
+        p6 = regex_engine.compile(r'^RLOC-probe Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
 
         # SMR-based Map-Requests in/out:                  0/0
-        p7 = re.compile(r'^SMR-based Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p7 = regex_engine.compile(r'^SMR-based Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Requests expired on-queue/no-reply          0/3
-        p8 = re.compile(r'^Map-Requests expired on-queue\/no-reply\s+(?P<on_queue>\d+)\/(?P<no_reply>\d+)$')
+        p8 = regex_engine.compile(r'^Map-Requests expired on-queue\/no-reply\s+(?P<on_queue>\d+)\/(?P<no_reply>\d+)$')
 
         # Map-Resolver Map-Requests forwarded:            0
-        p9 = re.compile(r'^Map-Resolver Map-Requests forwarded:\s+(?P<map_resolver_forwarded>\d+)$')
+        p9 = regex_engine.compile(r'^Map-Resolver Map-Requests forwarded:\s+(?P<map_resolver_forwarded>\d+)$')
 
         # Map-Server Map-Requests forwarded:              0
-        p10 = re.compile(r'^Map-Server Map-Requests forwarded:\s+(?P<map_server_forwarded>\d+)$')
+        p10 = regex_engine.compile(r'^Map-Server Map-Requests forwarded:\s+(?P<map_server_forwarded>\d+)$')
 
         # Map-Reply records in/out:                         24/1
-        p11 = re.compile(r'^Map-Reply records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p11 = regex_engine.compile(r'^Map-Reply records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Authoritative records in/out:                   23/1
-        p12 = re.compile(r'^Authoritative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p12 = regex_engine.compile(r'^Authoritative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Non-authoritative records in/out:               1/0
-        p13 = re.compile(r'^Non-authoritative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p13 = regex_engine.compile(r'^Non-authoritative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Negative records in/out:                        22/0
-        p14 = re.compile(r'^Negative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p14 = regex_engine.compile(r'^Negative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # RLOC-probe records in/out:                      1/1
-        p15 = re.compile(r'^RLOC-probe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p15 = regex_engine.compile(r'^RLOC-probe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Server Proxy-Reply records out:             0
-        p16 = re.compile(r'^Map-Server Proxy-Reply records out:\s+(?P<out>\d+)$')
+        p16 = regex_engine.compile(r'^Map-Server Proxy-Reply records out:\s+(?P<out>\d+)$')
 
         # WLC Map-Subscribe records in/out:                 0/2
-        p17 = re.compile(r'^WLC Map-Subscribe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p17 = regex_engine.compile(r'^WLC Map-Subscribe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Subscribe failures in/out:                  0/0
-        p18 = re.compile(r'^Map-Subscribe failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p18 = regex_engine.compile(r'^Map-Subscribe failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # WLC Map-Unsubscribe records in/out:               0/0
-        p19 = re.compile(r'^WLC Map-Unsubscribe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p19 = regex_engine.compile(r'^WLC Map-Unsubscribe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Unsubscribe failures in/out:                0/0
-        p20 = re.compile(r'^Map-Unsubscribe failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p20 = regex_engine.compile(r'^Map-Unsubscribe failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Register records in/out:                      0/6
-        p21 = re.compile(r'^Map-Register records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p21 = regex_engine.compile(r'^Map-Register records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Registers in (5 sec/1 min/5 min):           0/0/0
-        p22 = re.compile(r'^Map-Registers in \(5 sec\/1 min\/5 min\):\s+(?P<sec_5>\d+)\/(?P<min_1>\d+)\/(?P<min_5>\d+)$')
+        p22 = regex_engine.compile(r'^Map-Registers in \(5 sec\/1 min\/5 min\):\s+(?P<sec_5>\d+)\/(?P<min_1>\d+)\/(?P<min_5>\d+)$')
 
         # Map-Server AF disabled:                         0
-        p23 = re.compile(r'^Map-Server AF disabled:\s+(?P<map_server_af_disabled>\d+)$')
+        p23 = regex_engine.compile(r'^Map-Server AF disabled:\s+(?P<map_server_af_disabled>\d+)$')
 
         # Not valid site eid prefix:                      0
-        p24 = re.compile(r'^Not valid site eid prefix:\s+(?P<not_valid_site_eid_prefix>\d+)$')
+        p24 = regex_engine.compile(r'^Not valid site eid prefix:\s+(?P<not_valid_site_eid_prefix>\d+)$')
 
         # Authentication failures:                        0
-        p25 = re.compile(r'^Authentication failures:\s+(?P<authentication_failures>\d+)$')
+        p25 = regex_engine.compile(r'^Authentication failures:\s+(?P<authentication_failures>\d+)$')
 
         # Disallowed locators:                            0
-        p26 = re.compile(r'^Disallowed locators:\s+(?P<disallowed_locators>\d+)$')
+        p26 = regex_engine.compile(r'^Disallowed locators:\s+(?P<disallowed_locators>\d+)$')
 
         # Miscellaneous:                                  0
-        p27 = re.compile(r'^Miscellaneous:\s+(?P<misc>\d+)$')
+        p27 = regex_engine.compile(r'^Miscellaneous:\s+(?P<misc>\d+)$')
 
         # WLC Map-Register records in/out:                  0/0
-        p28 = re.compile(r'^WLC Map-Register records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p28 = regex_engine.compile(r'^WLC Map-Register records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # WLC AP Map-Register in/out:                     0/0
-        p29 = re.compile(r'^WLC AP Map-Register in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p29 = regex_engine.compile(r'^WLC AP Map-Register in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # WLC Client Map-Register in/out:                 0/0
-        p30 = re.compile(r'^WLC Client Map-Register in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p30 = regex_engine.compile(r'^WLC Client Map-Register in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # WLC Map-Register failures in/out:               0/0
-        p31 = re.compile(r'^WLC Map-Register failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p31 = regex_engine.compile(r'^WLC Map-Register failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Notify records in/out:                        8/0
-        p32 = re.compile(r'^Map-Notify records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p32 = regex_engine.compile(r'^Map-Notify records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Authentication failures:                        0
-        p33 = re.compile(r'^Authentication failures:\s+(?P<authentication_failures>\d+)')
+        p33 = regex_engine.compile(r'^Authentication failures:\s+(?P<authentication_failures>\d+)')
 
         # WLC Map-Notify records in/out:                    0/0
-        p34 = re.compile(r'^WLC Map-Notify records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
+        p34 = regex_engine.compile(r'^WLC Map-Notify records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
 
         # WLC AP Map-Notify in/out:                       0/0
-        p35 = re.compile(r'^WLC AP Map-Notify in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
+        p35 = regex_engine.compile(r'^WLC AP Map-Notify in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
 
         # WLC Client Map-Notify in/out:                   0/0
-        p36 = re.compile(r'^WLC Client Map-Notify in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
+        p36 = regex_engine.compile(r'^WLC Client Map-Notify in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
 
         # WLC Map-Notify failures in/out:                 0/0
-        p37 = re.compile(r'^WLC Map-Notify failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p37 = regex_engine.compile(r'^WLC Map-Notify failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription Request records in/out:            0/4
-        p38 = re.compile(r'^Subscription Request records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p38 = regex_engine.compile(r'^Subscription Request records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # IID subscription requests in/out:             0/0
-        p39 = re.compile(r'^IID subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p39 = regex_engine.compile(r'^IID subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Pub-refresh subscription requests in/out:     0/0
-        p40 = re.compile(r'^Pub-refresh subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p40 = regex_engine.compile(r'^Pub-refresh subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Policy subscription requests in/out:          0/4
-        p41 = re.compile(r'^Policy subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p41 = regex_engine.compile(r'^Policy subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription Request failures in/out:           0/0
-        p42 = re.compile(r'^Subscription Request failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p42 = regex_engine.compile(r'^Subscription Request failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription Status records in/out:             2/0
-        p43 = re.compile(r'^Subscription Status records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p43 = regex_engine.compile(r'^Subscription Status records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # End of Publication records in/out:            0/0
-        p44 = re.compile(r'^End of Publication records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p44 = regex_engine.compile(r'^End of Publication records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription rejected records in/out:         0/0
-        p45 = re.compile(r'^Subscription rejected records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p45 = regex_engine.compile(r'^Subscription rejected records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription removed records in/out:          0/0
-        p46 = re.compile(r'^Subscription removed records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p46 = regex_engine.compile(r'^Subscription removed records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription Status failures in/out:            0/0
-        p47 = re.compile(r'^Subscription Status failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p47 = regex_engine.compile(r'^Subscription Status failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Solicit Subscription records in/out:            2/0
-        p48 = re.compile(r'^Solicit Subscription records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p48 = regex_engine.compile(r'^Solicit Subscription records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Solicit Subscription failures in/out:           0/0
-        p49 = re.compile(r'^Solicit Subscription failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p49 = regex_engine.compile(r'^Solicit Subscription failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Publication records in/out:                     0/0
-        p50 = re.compile(r'^Publication records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p50 = regex_engine.compile(r'^Publication records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Publication failures in/out:                    0/0
-        p51 = re.compile(r'^Publication failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p51 = regex_engine.compile(r'^Publication failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Mapping record TTL alerts:                        0
-        p52 = re.compile(r'^Mapping record TTL alerts:\s+(?P<mapping_rec_ttl_alerts>\d+)$')
+        p52 = regex_engine.compile(r'^Mapping record TTL alerts:\s+(?P<mapping_rec_ttl_alerts>\d+)$')
 
         # Map-Request invalid source rloc drops:            0
-        p53 = re.compile(r'^Map-Request invalid source rloc drops:\s+(?P<map_request_invalid_source_rloc>\d+)$')
+        p53 = regex_engine.compile(r'^Map-Request invalid source rloc drops:\s+(?P<map_request_invalid_source_rloc>\d+)$')
 
         # Map-Register invalid source rloc drops:           0
-        p54 = re.compile(r'^Map-Register invalid source rloc drops:\s+(?P<map_register_invalid_source_rloc>\d+)$')
+        p54 = regex_engine.compile(r'^Map-Register invalid source rloc drops:\s+(?P<map_register_invalid_source_rloc>\d+)$')
 
         # DDT Requests failed:                              0
-        p55 = re.compile(r'^DDT Requests failed:\s+(?P<ddt_requests_failed>\d+)$')
+        p55 = regex_engine.compile(r'^DDT Requests failed:\s+(?P<ddt_requests_failed>\d+)$')
 
         # DDT ITR Map-Requests dropped:                     0 (nonce-collision: 0, bad-xTR-nonce: 0)
-        p56 = re.compile(r'^DDT ITR Map-Requests dropped:\s+(?P<dropped>\d+)\s+'
-                         r'\(nonce-collision:\s+(?P<nonce_collision>\d+), '
-                         r'bad-xTR-nonce:\s+(?P<bad_xtr_nonce>\d+)\)$')
+        p56 = regex_engine.compile(r'^DDT ITR Map-Requests dropped:\s+(?P<dropped>\d+)\s+'
+                                   r'\(nonce-collision:\s+(?P<nonce_collision>\d+), '
+                                   r'bad-xTR-nonce:\s+(?P<bad_xtr_nonce>\d+)\)$')
 
         # Cache entries created/deleted:                    10/8
-        p57 = re.compile(r'^Cache entries created\/deleted:\s+(?P<created>\d+)\/(?P<deleted>\d+)$')
+        p57 = regex_engine.compile(r'^Cache entries created\/deleted:\s+(?P<created>\d+)\/(?P<deleted>\d+)$')
 
         # NSF CEF replay entry count                        0
-        p58 = re.compile(r'^NSF CEF replay entry count\s+(?P<nsf_cef_replay_entry_count>\d+)$')
+        p58 = regex_engine.compile(r'^NSF CEF replay entry count\s+(?P<nsf_cef_replay_entry_count>\d+)$')
 
         # Number of EID-prefixes in map-cache:              2
-        p59 = re.compile(r'^Number of EID-prefixes in map-cache:\s+(?P<eid_prefix_map_cache>\d+)$')
+        p59 = regex_engine.compile(r'^Number of EID-prefixes in map-cache:\s+(?P<eid_prefix_map_cache>\d+)$')
 
         # Number of rejected EID-prefixes due to limit:     0
-        p60 = re.compile(r'^Number of rejected EID-prefixes due to limit:\s+'
-                         r'(?P<rejected_eid_prefix_due_to_limit>\d+)$')
+        p60 = regex_engine.compile(r'^Number of rejected EID-prefixes due to limit:\s+'
+                                   r'(?P<rejected_eid_prefix_due_to_limit>\d+)$')
 
         # Number of times signal suppression was turned on: 0
-        p61 = re.compile(r'^Number of times signal suppression was turned on:\s+'
-                         r'(?P<times_signal_suppresion_turned>\d+)$')
+        p61 = regex_engine.compile(r'^Number of times signal suppression was turned on:\s+'
+                                   r'(?P<times_signal_suppresion_turned>\d+)$')
 
         # Time since last signal suppressed change:         never
-        p62 = re.compile(r'^Time since last signal suppressed change:\s+'
-                         r'(?P<time_since_last_signal>never|\d+)$')
+        p62 = regex_engine.compile(r'^Time since last signal suppressed change:\s+'
+                                   r'(?P<time_since_last_signal>never|\d+)$')
 
         # Number of negative entries in map-cache:          2
-        p63 = re.compile(r'^Number of negative entries in map-cache:\s+'
-                         r'(?P<negative_entries_map_cache>\d+)$')
+        p63 = regex_engine.compile(r'^Number of negative entries in map-cache:\s+'
+                                   r'(?P<negative_entries_map_cache>\d+)$')
 
         # Total number of RLOCs in map-cache:               0
-        p64 = re.compile(r'^Total number of RLOCs in map-cache:\s+(?P<total_rlocs_map_cache>\d+)$')
+        p64 = regex_engine.compile(r'^Total number of RLOCs in map-cache:\s+(?P<total_rlocs_map_cache>\d+)$')
 
         # Average RLOCs per EID-prefix:                     0
-        p65 = re.compile(r'^Average RLOCs per EID-prefix:\s+(?P<average_rlocs_per_eid_prefix>\d+)$')
+        p65 = regex_engine.compile(r'^Average RLOCs per EID-prefix:\s+(?P<average_rlocs_per_eid_prefix>\d+)$')
 
         # Policy active entries:                            0
-        p66 = re.compile(r'^Policy active entries:\s+(?P<policy_active_entries>\d+)$')
+        p66 = regex_engine.compile(r'^Policy active entries:\s+(?P<policy_active_entries>\d+)$')
 
         # Number of data signals processed:                 2 (+ dropped 0)
-        p67 = re.compile(r'^Number of data signals processed:\s+'
-                         r'(?P<processed>\d+)\s+\(\+\s+dropped\s(?P<dropped>\d+)\)$')
+        p67 = regex_engine.compile(r'^Number of data signals processed:\s+'
+                                   r'(?P<processed>\d+)\s+\(\+\s+dropped\s(?P<dropped>\d+)\)$')
 
         # Number of reachability reports:                   0 (+ dropped 0)
-        p68 = re.compile(r'^Number of reachability reports:\s+'
-                         r'(?P<count>\d+)\s+\(\+\s+dropped\s(?P<dropped>\d+)\)$')
+        p68 = regex_engine.compile(r'^Number of reachability reports:\s+'
+                                   r'(?P<count>\d+)\s+\(\+\s+dropped\s(?P<dropped>\d+)\)$')
 
         # Number of SMR signals dropped:                    0
-        p69 = re.compile(r'^Number of SMR signals dropped:\s+(?P<dropped>\d+)$')
+        p69 = regex_engine.compile(r'^Number of SMR signals dropped:\s+(?P<dropped>\d+)$')
 
         #   44.44.44.44          6d21h      202176        8        0        0        6    0/ 0/ 0
         #   44:44:44:44::        6d21h      202176        8        0        0        6    0/ 0/ 0
-        p70 = re.compile(r'^(?P<itr_map_resolvers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))'
-                         r'\s+(?P<last_reply>\S+)\s+(?P<metric>\d+)\s+(?P<req_sent>\d+)\s+'
-                         r'(?P<positive>\d+)\s+(?P<negative>\d+)\s+(?P<no_reply>\d+)\s+'
-                         r'(?P<sec_5>\d+)\/\s(?P<min_1>\d+)\/\s(?P<min_5>\d+)$')
+        p70 = regex_engine.compile(r'^(?P<itr_map_resolvers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))'
+                                   r'\s+(?P<last_reply>\S+)\s+(?P<metric>\d+)\s+(?P<req_sent>\d+)\s+'
+                                   r'(?P<positive>\d+)\s+(?P<negative>\d+)\s+(?P<no_reply>\d+)\s+'
+                                   r'(?P<sec_5>\d+)\/\s(?P<min_1>\d+)\/\s(?P<min_5>\d+)$')
 
         # 44.44.44.44          0/ 0/ 0
         # 44:44:44:44::        0/ 0/ 0
-        p71 = re.compile(r'^(?P<etr_map_servers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+'
-                         r'(?P<sec_5>\d+)\/\s+(?P<min_1>\d+)\/\s(?P<min_5>\d+)$')
+        p71 = regex_engine.compile(r'^(?P<etr_map_servers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+'
+                                   r'(?P<sec_5>\d+)\/\s+(?P<min_1>\d+)\/\s(?P<min_5>\d+)$')
 
         # LISP RLOC Statistics - last cleared: never
-        p72 = re.compile(r'^LISP RLOC Statistics - last cleared:\s(?P<last_cleared>\S+)$')
+        p72 = regex_engine.compile(r'^LISP RLOC Statistics - last cleared:\s(?P<last_cleared>\S+)$')
 
         # RTR Map-Requests forwarded:                       0
-        p73 = re.compile(r'^RTR Map-Requests forwarded:\s+(?P<map_requests_forwarded>\d+)$')
+        p73 = regex_engine.compile(r'^RTR Map-Requests forwarded:\s+(?P<map_requests_forwarded>\d+)$')
 
         # RTR Map-Notifies forwarded:                       0
-        p74 = re.compile(r'^RTR Map-Notifies forwarded:\s+(?P<map_notifies_forwarded>\d+)$')
+        p74 = regex_engine.compile(r'^RTR Map-Notifies forwarded:\s+(?P<map_notifies_forwarded>\d+)$')
 
         # DDT-Map-Requests in/out:                          0/0
-        p75 = re.compile(r'^DDT-Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p75 = regex_engine.compile(r'^DDT-Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # DDT-Map-Referrals in/out:                         0/0
-        p76 = re.compile(r'^DDT-Map-Referrals in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p76 = regex_engine.compile(r'^DDT-Map-Referrals in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Request format errors:                        0
-        p77 = re.compile(r'^Map-Request format errors:\s+(?P<map_request_format>\d+)$')
+        p77 = regex_engine.compile(r'^Map-Request format errors:\s+(?P<map_request_format>\d+)$')
 
         # Map-Reply format errors:                          0
-        p78 = re.compile(r'^Map-Reply format errors:\s+(?P<map_reply_format>\d+)$')
+        p78 = regex_engine.compile(r'^Map-Reply format errors:\s+(?P<map_reply_format>\d+)$')
 
         # Map-Referral format errors:                       0
-        p79 = re.compile(r'^Map-Referral format errors:\s+(?P<map_referral>\d+)$')
+        p79 = regex_engine.compile(r'^Map-Referral format errors:\s+(?P<map_referral>\d+)$')
 
         # Invalid IP version drops:                         0
-        p80 = re.compile(r'^Invalid IP version drops:\s+(?P<ip_version_drops>\d+)$')
+        p80 = regex_engine.compile(r'^Invalid IP version drops:\s+(?P<ip_version_drops>\d+)$')
 
         # Invalid IP header drops:                          0
-        p81 = re.compile(r'^Invalid IP header drops:\s+(?P<ip_header_drops>\d+)$')
+        p81 = regex_engine.compile(r'^Invalid IP header drops:\s+(?P<ip_header_drops>\d+)$')
 
         # Invalid IP proto field drops:                     0
-        p82 = re.compile(r'^Invalid IP proto field drops:\s+(?P<ip_proto_field_drops>\d+)$')
+        p82 = regex_engine.compile(r'^Invalid IP proto field drops:\s+(?P<ip_proto_field_drops>\d+)$')
 
         # Invalid packet size drops:                        0
-        p83 = re.compile(r'^Invalid packet size drops:\s+(?P<packet_size_drops>\d+)$')
+        p83 = regex_engine.compile(r'^Invalid packet size drops:\s+(?P<packet_size_drops>\d+)$')
 
         # Invalid LISP control port drops:                  0
-        p84 = re.compile(r'^Invalid LISP control port drops:\s+(?P<lisp_control_port_drops>\d+)$')
+        p84 = regex_engine.compile(r'^Invalid LISP control port drops:\s+(?P<lisp_control_port_drops>\d+)$')
 
         # Invalid LISP checksum drops:                      0
-        p85 = re.compile(r'^Invalid LISP checksum drops:\s+(?P<lisp_checksum_drops>\d+)$')
+        p85 = regex_engine.compile(r'^Invalid LISP checksum drops:\s+(?P<lisp_checksum_drops>\d+)$')
 
         # Unsupported LISP packet type drops:               0
-        p86 = re.compile(r'^Unsupported LISP packet type drops:\s+(?P<unsupported_lisp_packet_drops>\d+)$')
+        p86 = regex_engine.compile(r'^Unsupported LISP packet type drops:\s+(?P<unsupported_lisp_packet_drops>\d+)$')
 
         # Unknown packet drops:                             0
-        p87 = re.compile(r'^Unknown packet drops:\s+(?P<unknown_packet_drops>\d+)$')
+        p87 = regex_engine.compile(r'^Unknown packet drops:\s+(?P<unknown_packet_drops>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -7245,17 +7246,17 @@ class ShowLispRemoteLocatorSet(ShowLispRemoteLocatorSetSchema):
         ret_dict = {}
 
         # LISP remote-locator-set default-etr-locator-set-ipv4 Information
-        p1 = re.compile(r'^LISP\s+remote-locator-set\s+(?P<remote_locator_name>\S+)\s+Information$')
+        p1 = regex_engine.compile(r'^LISP\s+remote-locator-set\s+(?P<remote_locator_name>\S+)\s+Information$')
 
         # 7.7.7.7         2/3  /-          101                0/0      Default
         # 32.32.32.32   32/10 /0          -                  0/0      Service
         # 32:32:32:32:: 32/10 /0          -                  0/0      Service
-        p2 = re.compile(r'^(?P<rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(\*)?\s+'
-                        r'(?P<priority>\d+)\/(?P<weight>[\d\s]+)'
-                        r'(\/(?P<metric>[\d-]+))?\s+(?P<instance_id>\d+|-)'
-                        r'(\s+)?(?P<domain_id>\d+)?(\/)?(?P<multihome_id>\d+)?'
-                        r'(\s+(?P<etr_type>\S+))?(\s+)?(?P<srvc_ins_id>\S+)?(\s+)?'
-                        r'(\/(?P<srvc_ins_type>\S+))?$')
+        p2 = regex_engine.compile(r'^(?P<rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(\*)?\s+'
+                                  r'(?P<priority>\d+)\/(?P<weight>[\d\s]+)'
+                                  r'(\/(?P<metric>[\d-]+))?\s+(?P<instance_id>\d+|-)'
+                                  r'(\s+)?(?P<domain_id>\d+)?(\/)?(?P<multihome_id>\d+)?'
+                                  r'(\s+(?P<etr_type>\S+))?(\s+)?(?P<srvc_ins_id>\S+)?(\s+)?'
+                                  r'(\/(?P<srvc_ins_type>\S+))?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -7367,14 +7368,14 @@ class ShowLispInstanceServerRAR(ShowLispInstanceServerRARSchema):
         instance_dict = {}
         host_address_list = []
         # Reverse-Address-resolution data for router lisp 0 instance-id 1031
-        p1 = re.compile(r'Reverse-Address-resolution data for router lisp (?P<lisp_id>\d+) instance-id (?P<instance_id>\d+)')
+        p1 = regex_engine.compile(r'Reverse-Address-resolution data for router lisp (?P<lisp_id>\d+) instance-id (?P<instance_id>\d+)')
 
         ''' aabb.cc00.c900/48     192.168.3.2
                                   2001:192:168:3::2
                                   FE80::A8BB:CCFF:FE00:C900
         '''
-        p2 = re.compile(r'(?P<eid>[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\/\d+\s+)?'
-                        r'(?P<host_address>[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}|[a-fA-F\d\:]+)')
+        p2 = regex_engine.compile(r'(?P<eid>[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\/\d+\s+)?'
+                                  r'(?P<host_address>[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}|[a-fA-F\d\:]+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -7503,43 +7504,43 @@ class ShowLispInstanceServerRARDetail(ShowLispInstanceServerRARDetailSchema):
         eid_flag = False
 
         # Reverse-Address-resolution data for router lisp 0 instance-id 1031
-        p1 = re.compile(r'Reverse-Address-resolution data for router lisp (?P<lisp_id>\d+)'
-                        r' instance-id (?P<instance_id>\d+)')
+        p1 = regex_engine.compile(r'Reverse-Address-resolution data for router lisp (?P<lisp_id>\d+)'
+                                  r' instance-id (?P<instance_id>\d+)')
 
         # Site name: wired
-        p2 = re.compile(r'Site name:\s+(?P<site>\S+)')
+        p2 = regex_engine.compile(r'Site name:\s+(?P<site>\S+)')
 
         # Hardware Address:     aabb.cc00.c900/48
-        p3 = re.compile(r'Hardware Address:\s+(?P<eid>([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}\/\d{2})')
+        p3 = regex_engine.compile(r'Hardware Address:\s+(?P<eid>([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}\/\d{2})')
 
         '''Host Address:         192.168.3.2
                                 2001:192:168:3::2
                                 FE80::A8BB:CCFF:FE00:C900'''
-        p4 = re.compile(r'(Host Address:\s+)?(?P<host_address>((\d{1,3}\.){3}\d{1,3})|([a-fA-F\d\:]+))$')
+        p4 = regex_engine.compile(r'(Host Address:\s+)?(?P<host_address>((\d{1,3}\.){3}\d{1,3})|([a-fA-F\d\:]+))$')
 
         #First registered:     04:21:34
-        p5 = re.compile(r'First registered:\s+(?P<first_registered>(\d{2}\:){2}(\d{2}))')
+        p5 = regex_engine.compile(r'First registered:\s+(?P<first_registered>(\d{2}\:){2}(\d{2}))')
 
         #Last registered:      04:21:34
-        p6 = re.compile(r'Last registered:\s+(?P<last_registered>(\d{2}\:){2}(\d{2}))')
+        p6 = regex_engine.compile(r'Last registered:\s+(?P<last_registered>(\d{2}\:){2}(\d{2}))')
 
         #  Authentication failures:   0
-        p7 = re.compile(r'Authentication failures:\s+(?P<auth_failures>\d+)')
+        p7 = regex_engine.compile(r'Authentication failures:\s+(?P<auth_failures>\d+)')
 
-        p8 = re.compile(r'Last registered:\s+(?P<last_registered_etr>(\d{2}\:){2}(\d{2}))')
+        p8 = regex_engine.compile(r'Last registered:\s+(?P<last_registered_etr>(\d{2}\:){2}(\d{2}))')
         # TTL:                   00:01:00
-        p9 = re.compile(r'TTL:\s+(?P<ttl>(\d{2}\:){2}(\d{2}))')
+        p9 = regex_engine.compile(r'TTL:\s+(?P<ttl>(\d{2}\:){2}(\d{2}))')
 
         #xTR-ID:                N/A
-        p10 = re.compile(r'xTR-ID:\s+(?P<xtr_id>\S+)')
+        p10 = regex_engine.compile(r'xTR-ID:\s+(?P<xtr_id>\S+)')
 
         #Site-ID:               N/A
-        p11 = re.compile(r'Site-ID:\s+(?P<site_id>\S+)')
+        p11 = regex_engine.compile(r'Site-ID:\s+(?P<site_id>\S+)')
 
         #Registered addr:       192.168.3.2
         #                       2001:192:168:3::2
         #                       FE80::A8BB:CCFF:FE00:C900
-        p12 = re.compile(r'(Registered addr:\s+)?(?P<registered_address>((\d{1,3}\.){3}\d{1,3})|([a-fA-F\d\:]+))$')
+        p12 = regex_engine.compile(r'(Registered addr:\s+)?(?P<registered_address>((\d{1,3}\.){3}\d{1,3})|([a-fA-F\d\:]+))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -7940,14 +7941,14 @@ class ShowLispDecapsulationFilterParser(ShowLispDecapsulationFilterSchema):
         ret_dict = {}
 
         # LISP decapsulation filter for EID table vrf red (IID 101), 1 entries
-        p1 = re.compile(r'^LISP decapsulation filter for EID table '
-                        r'(?P<eid_table>.+) \(IID (?P<iid>\d+)\), '
-                        r'(?P<entries>\d+) entries$')
+        p1 = regex_engine.compile(r'^LISP decapsulation filter for EID table '
+                                  r'(?P<eid_table>.+) \(IID (?P<iid>\d+)\), '
+                                  r'(?P<entries>\d+) entries$')
 
         # Source RLOC      Added by
         # 100:33:33::33    MS 100:44:44::44, MS 100:55:55::55
-        p2 = re.compile(r'^(?P<source_rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\.'
-                        r'\d{1,3})|([a-fA-F\d\:]+))\s+(?P<added_by>.+)$')
+        p2 = regex_engine.compile(r'^(?P<source_rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\.'
+                                  r'\d{1,3})|([a-fA-F\d\:]+))\s+(?P<added_by>.+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -8029,17 +8030,17 @@ class ShowLispVrf(ShowLispVrfSchema):
         ret_dict = {}
 
         # vrf VN_1 ID 0x2 UP users  EID
-        p1 = re.compile(r'vrf\s+(?P<vrf>\S+)+\s+ID\s+(?P<vrf_id>\S+)\s+UP\s+users+\s+EID$')
+        p1 = regex_engine.compile(r'vrf\s+(?P<vrf>\S+)+\s+ID\s+(?P<vrf_id>\S+)\s+UP\s+users+\s+EID$')
 
         # Topology IPv4 UP, topoid 0x2, locks 2, RIB registered
-        p2 = re.compile(r'Topology\s+IPv4\s+(?P<status>\w+),\s+topoid\s+(?P<v4_topoid>\S+),\s+locks\s+(?P<lock_no>(\d+)),\s+RIB\s+(?P<rib>\S+)$')
+        p2 = regex_engine.compile(r'Topology\s+IPv4\s+(?P<status>\w+),\s+topoid\s+(?P<v4_topoid>\S+),\s+locks\s+(?P<lock_no>(\d+)),\s+RIB\s+(?P<rib>\S+)$')
 
         # User EID, top ID 0, IID 4105, lock count 4, RIB watch count 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'User\s+EID,\s+top\s+ID (?P<top_id>(\d+)),\s+IID (?P<iid>(\d+)),\s+lock\s+count (?P<lock_count>(\d+)),\s+RIB\s+watch\s+count (?P<watch_count>(\d+))$')
 
         # Topology IPv6 DOWN, topoid 0x503316482, locks 0, RIB no
-        p4 = re.compile(r'Topology\s+IPv6\s+(?P<status>\w+),\s+topoid\s+(?P<v6_topoid>\S+),\s+locks\s+(?P<lock_no>(\d+)),\s+RIB\s+(?P<rib>\S+)$')
+        p4 = regex_engine.compile(r'Topology\s+IPv6\s+(?P<status>\w+),\s+topoid\s+(?P<v6_topoid>\S+),\s+locks\s+(?P<lock_no>(\d+)),\s+RIB\s+(?P<rib>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
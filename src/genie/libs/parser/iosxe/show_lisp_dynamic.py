@@ -21,15 +21,13 @@
     * show lisp eid-table vlan {vlan} dynamic-eid detail
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
                                                 ListOf,
                                                 Optional,
                                                 Or)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.libs.parser.iosxe.show_lisp_super import *
@@ -118,54 +116,54 @@ class ShowLispDynamicEidDetail(ShowLispDynamicEidDetailSchema):
 
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 101
-        p1 = re.compile(r'Output +for +router +lisp +(?P<lisp_router_id>(\S+))'
-                         r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'Output +for +router +lisp +(?P<lisp_router_id>(\S+))'
+                                   r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
 
         # LISP Dynamic EID Information for VRF "red"
-        p2 = re.compile(r'LISP +Dynamic +EID +Information +for +VRF'
-                         r' +"(?P<vrf>(\S+))"$')
+        p2 = regex_engine.compile(r'LISP +Dynamic +EID +Information +for +VRF'
+                                   r' +"(?P<vrf>(\S+))"$')
 
         # Dynamic-EID name: 192
-        p3 = re.compile(r'Dynamic-EID +name: +(?P<eid_id>(\S+))$')
+        p3 = regex_engine.compile(r'Dynamic-EID +name: +(?P<eid_id>(\S+))$')
 
         # Database-mapping EID-prefix: 192.168.0.0/24, locator-set RLOC
-        p4 = re.compile(r'Database-mapping +EID-prefix: +(?P<dyn_eid>(\S+)),'
-                         r' +locator-set +(?P<locator_set_name>(\S+))$')
+        p4 = regex_engine.compile(r'Database-mapping +EID-prefix: +(?P<dyn_eid>(\S+)),'
+                                   r' +locator-set +(?P<locator_set_name>(\S+))$')
 
         # Registering more-specific dynamic-EIDs
-        p5 = re.compile(r'Registering +more-specific +dynamic-EIDs$')
+        p5 = regex_engine.compile(r'Registering +more-specific +dynamic-EIDs$')
 
         # Map-Server(s): none configured, use global Map-Server
-        p6 = re.compile(r'Map-Server\(s\)\: none configured, use global Map-Server$')
+        p6 = regex_engine.compile(r'Map-Server\(s\)\: none configured, use global Map-Server$')
 
         # Map-Server(s): 10.64.4.4  (proxy-replying)
         # Map-Server(s): 10.144.6.6
         # Map-Server(s): 10:144:6:6::
-        p6_1 = re.compile(r'Map-Server\(s\)\: +(?P<ms>([\d\.\:a-fA-F]+))'
-                          r'(?: +\((?P<pr>(proxy-replying))\))?$')
+        p6_1 = regex_engine.compile(r'Map-Server\(s\)\: +(?P<ms>([\d\.\:a-fA-F]+))'
+                                    r'(?: +\((?P<pr>(proxy-replying))\))?$')
 
         # Site-based multicast Map-Notify group: none configured
         # Site-based multicast Map-Notify group: 225.1.1.2
         # Site-based multicast Map-Notify group: 225:1:1:2::
-        p7 = re.compile(r'Site-based +multicast +Map-Notify +group\:'
-                        r' +(?P<map_notify>([a-zA-Z0-9\s]+)|([a-fA-F\d\:]+))$')
+        p7 = regex_engine.compile(r'Site-based +multicast +Map-Notify +group\:'
+                                  r' +(?P<map_notify>([a-zA-Z0-9\s]+)|([a-fA-F\d\:]+))$')
 
         # Number of roaming dynamic-EIDs discovered: 1
-        p8 = re.compile(r'Number +of +roaming +dynamic-EIDs +discovered:'
-                         r' +(?P<roam>(\d+))$')
+        p8 = regex_engine.compile(r'Number +of +roaming +dynamic-EIDs +discovered:'
+                                   r' +(?P<roam>(\d+))$')
 
         # Last dynamic-EID discovered: 192.168.0.1, 01:17:25 ago
-        p9 = re.compile(r'Last +dynamic-EID +discovered: +(?P<last>(\S+)),'
-                         r' +(?P<time>(\S+)) +ago$')
+        p9 = regex_engine.compile(r'Last +dynamic-EID +discovered: +(?P<last>(\S+)),'
+                                   r' +(?P<time>(\S+)) +ago$')
 
         # 192.168.0.1, GigabitEthernet5, uptime: 01:17:25
         # 192:168:0:1::, GigabitEthernet5, uptime: 01:17:25
-        p10 = re.compile(r'(?P<eid>([0-9\.]+)|([a-fA-F\d\:]+)), +(?P<interface>(\S+)),'
-                         r' +uptime: +(?P<uptime>(\S+))$')
+        p10 = regex_engine.compile(r'(?P<eid>([0-9\.]+)|([a-fA-F\d\:]+)), +(?P<interface>(\S+)),'
+                                   r' +uptime: +(?P<uptime>(\S+))$')
 
         #   last activity: 00:00:23, discovered by: Packet Reception
-        p11 = re.compile(r'last +activity: +(?P<last>(\S+)), +discovered +by:'
-                          r' +(?P<discovered_by>([a-zA-Z\s]+))$')
+        p11 = regex_engine.compile(r'last +activity: +(?P<last>(\S+)), +discovered +by:'
+                                    r' +(?P<discovered_by>([a-zA-Z\s]+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -381,12 +379,12 @@ class ShowLispDynamicEidSummary(ShowLispDynamicEidSummarySchema):
 
         # LISP Dynamic EID Summary for router 0, IID 4100, EID-table VRF "red"
         # LISP Dynamic EID Summary for router 0, IID 101
-        p1 = re.compile(r'^LISP +Dynamic +EID +Summary +for +router\s+(?P<lisp_id>\d+),\s+IID\s+'
-                        r'(?P<instance_id>\d+)(, EID-table VRF\s+)?(?P<eid_table>.+)?$')
+        p1 = regex_engine.compile(r'^LISP +Dynamic +EID +Summary +for +router\s+(?P<lisp_id>\d+),\s+IID\s+'
+                                  r'(?P<instance_id>\d+)(, EID-table VRF\s+)?(?P<eid_table>.+)?$')
 
         # 192_168_1_0          192.168.1.1             Vl101         1d22h     never     0
-        p2 = re.compile(r'^(?P<dynamic_eid_name>\S+)\s+(?P<eid>\S+)\s+(?P<interface>\S+)'
-                        r'\s+(?P<uptime>\S+)\s+(?P<last_packet>\S+)\s+(?P<pending_ping_count>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<dynamic_eid_name>\S+)\s+(?P<eid>\S+)\s+(?P<interface>\S+)'
+                                  r'\s+(?P<uptime>\S+)\s+(?P<last_packet>\S+)\s+(?P<pending_ping_count>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -43,15 +43,13 @@
 """
 
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
                                                 ListOf,
                                                 Optional,
                                                 Or)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.libs.parser.iosxe.show_lisp_super import *
@@ -205,26 +203,26 @@ class ShowLispIpv4Publication(ShowLispIpv4PublicationSchema):
         ret_dict = {}
 
         # Publication Information for LISP 0 EID-table vrf red (IID 4100)
-        p1 = re.compile(r"^Publication\s+Information\s+for\s+LISP\s+"
-                        r"(?P<lisp_id>\d+)\s+EID-table\s+vrf\s+\S+\s+"
-                        r"\(IID\s+(?P<instance_id>\d+)\)$")
+        p1 = regex_engine.compile(r"^Publication\s+Information\s+for\s+LISP\s+"
+                                  r"(?P<lisp_id>\d+)\s+EID-table\s+vrf\s+\S+\s+"
+                                  r"\(IID\s+(?P<instance_id>\d+)\)$")
 
         # Entries total 2
-        p2 = re.compile(r"^Entries\s+total\s+(?P<total_entries>\d+)")
+        p2 = regex_engine.compile(r"^Entries\s+total\s+(?P<total_entries>\d+)")
 
         # 44.44.44.44     1d21h       192.168.1.71/32          11.11.11.11     -
         # 44:44:44:44::   1d21h       192.168.1.71/32          11.11.11.11     -
         # 13.13.13.13     00:00:54    192.168.0.0/16           -       -
-        p3 = re.compile(r"^(?P<publisher_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                        r"(?P<last_published>\S+)\s+(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})\s+"
-                        r"(?P<rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+)|-)\s+(?P<encap_iid>\S+)$")
+        p3 = regex_engine.compile(r"^(?P<publisher_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                  r"(?P<last_published>\S+)\s+(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})\s+"
+                                  r"(?P<rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+)|-)\s+(?P<encap_iid>\S+)$")
 
         # New format (Locators are no longer displayed in the output)
 
         # 192.168.1.71/32     1d21h   44.44.44.44   -
-        p4 = re.compile(r"^(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})\s+"
-                        r"(?P<last_published>\S+)\s+(?P<publisher_ip>(\d{1,3}\.\d{1,3}\."
-                        r"\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<encap_iid>\S+)$")
+        p4 = regex_engine.compile(r"^(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})\s+"
+                                  r"(?P<last_published>\S+)\s+(?P<publisher_ip>(\d{1,3}\.\d{1,3}\."
+                                  r"\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<encap_iid>\S+)$")
 
         for line in output.splitlines():
 
@@ -732,23 +730,23 @@ class ShowLispV4SMRParser(ShowLispSMRSchema):
         count = 0
 
         #Output for router lisp 0 instance-id 4100
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)"
-                        r"\s+instance-id\s+(?P<instance_id>\d+)$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)"
+                                  r"\s+instance-id\s+(?P<instance_id>\d+)$")
 
         #LISP SMR Table for router lisp 0 (red) IID 4100
-        p2 = re.compile(r"^LISP\s+SMR\s+Table\s+for\s+router\s+lisp\s+"
-                        r"\d+\s+\((?P<eid_table>\S+)\)\s+IID\s+\d+")
+        p2 = regex_engine.compile(r"^LISP\s+SMR\s+Table\s+for\s+router\s+lisp\s+"
+                                  r"\d+\s+\((?P<eid_table>\S+)\)\s+IID\s+\d+")
 
         #Entries: 3
-        p3 = re.compile(r"^Entries:\s+(?P<entries>\d+)")
+        p3 = regex_engine.compile(r"^Entries:\s+(?P<entries>\d+)")
 
         #192.168.1.0/24                          away table
-        p4 = re.compile(r"^(?P<prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
-                        r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3})\s+"
-                        r"(?P<producer>\w+\s\w+\,\s\w+\s\w+|\w+\s\w+|\w+)")
+        p4 = regex_engine.compile(r"^(?P<prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
+                                  r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3})\s+"
+                                  r"(?P<producer>\w+\s\w+\,\s\w+\s\w+|\w+\s\w+|\w+)")
 
         #  Instance ID:                              4100
-        p5 = re.compile(r"^\s+Instance\s+ID:\s+(?P<inst_id>\S+)")
+        p5 = regex_engine.compile(r"^\s+Instance\s+ID:\s+(?P<inst_id>\S+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -830,11 +828,11 @@ class ShowLispInstanceIdIpv4ForwardingEID(ShowLispInstanceIdForwardingEidRemoteS
         ret_dict = {}
 
         # 0.0.0.0/0              signal      0x00000000            N/A
-        p1 = re.compile(r"^(?P<prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})\s+"
-                        r"(?P<fwd_action>\S+)\s+(?P<locator_status_bits>\S+)\s+(?P<encap_iid>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})\s+"
+                                  r"(?P<fwd_action>\S+)\s+(?P<locator_status_bits>\S+)\s+(?P<encap_iid>\S+)$")
 
         #   packets/bytes       0/0
-        p2 = re.compile(r"^packets\/bytes\s+(?P<packets>\d+)\/(?P<bytes>\d+)$")
+        p2 = regex_engine.compile(r"^packets\/bytes\s+(?P<packets>\d+)\/(?P<bytes>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
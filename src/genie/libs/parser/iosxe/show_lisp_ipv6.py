@@ -22,15 +22,13 @@
 """
 
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
                                                 ListOf,
                                                 Optional,
                                                 Or)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.libs.parser.iosxe.show_lisp_super import *
@@ -240,24 +238,24 @@ class ShowLispIpv6Publication(ShowLispIpv4PublicationSchema):
         ret_dict = {}
 
         # Publication Information for LISP 0 EID-table vrf red (IID 4100)
-        p1 = re.compile(r"^Publication\s+Information\s+for\s+LISP\s+"
-                        r"(?P<lisp_id>\d+)\s+EID-table\s+vrf\s+\S+\s+"
-                        r"\(IID\s+(?P<instance_id>\d+)\)$")
+        p1 = regex_engine.compile(r"^Publication\s+Information\s+for\s+LISP\s+"
+                                  r"(?P<lisp_id>\d+)\s+EID-table\s+vrf\s+\S+\s+"
+                                  r"\(IID\s+(?P<instance_id>\d+)\)$")
 
         # Entries total 2
-        p2 = re.compile(r"^Entries\s+total\s+(?P<total_entries>\d+)")
+        p2 = regex_engine.compile(r"^Entries\s+total\s+(?P<total_entries>\d+)")
 
         # 100.14.14.14    01:11:02    2001:192:168:1::2/128    100.11.11.11    -
         # 13.13.13.13     00:00:54    192.168.0.0/16           -       -
-        p3 = re.compile(r"^(?P<publisher_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                        r"(?P<last_published>\S+)\s+(?P<eid_prefix>[a-fA-F\d\:]+\/\d{1,3})\s+"
-                        r"(?P<rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+)|-)\s+(?P<encap_iid>\S+)$")
+        p3 = regex_engine.compile(r"^(?P<publisher_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                  r"(?P<last_published>\S+)\s+(?P<eid_prefix>[a-fA-F\d\:]+\/\d{1,3})\s+"
+                                  r"(?P<rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+)|-)\s+(?P<encap_iid>\S+)$")
 
         # New format (Locators are no longer displayed in the output)
 
         # 2001:192:168:1::2/128   01:11:02   100.14.14.14   -
-        p4 = re.compile(r"^(?P<eid_prefix>[a-fA-F\d\:]+\/\d{1,3})\s+(?P<last_published>\S+)\s+"
-                        r"(?P<publisher_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<encap_iid>\S+)$")
+        p4 = regex_engine.compile(r"^(?P<eid_prefix>[a-fA-F\d\:]+\/\d{1,3})\s+(?P<last_published>\S+)\s+"
+                                  r"(?P<publisher_ip>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<encap_iid>\S+)$")
 
         for line in output.splitlines():
 
@@ -761,11 +759,11 @@ class ShowLispInstanceIdIpv6ForwardingEID(ShowLispInstanceIdForwardingEidRemoteS
         ret_dict = {}
 
         # ::/0           signal      0x00000000            N/A
-        p1 = re.compile(r"^(?P<prefix>[a-fA-F\d\:]+\/\d{1,3})\s+(?P<fwd_action>\S+)"
-                        r"\s+(?P<locator_status_bits>\S+)\s+(?P<encap_iid>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<prefix>[a-fA-F\d\:]+\/\d{1,3})\s+(?P<fwd_action>\S+)"
+                                  r"\s+(?P<locator_status_bits>\S+)\s+(?P<encap_iid>\S+)$")
 
         #   packets/bytes       0/0
-        p2 = re.compile(r"^packets\/bytes\s+(?P<packets>\d+)\/(?P<bytes>\d+)$")
+        p2 = regex_engine.compile(r"^packets\/bytes\s+(?P<packets>\d+)\/(?P<bytes>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
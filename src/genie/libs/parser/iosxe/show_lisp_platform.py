@@ -3,15 +3,13 @@
     * show lisp platform
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
                                                 ListOf,
                                                 Optional,
                                                 Or)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.libs.parser.iosxe.show_lisp_super import *
@@ -111,75 +109,75 @@ class ShowLispPlatform(ShowLispPlatformSchema):
         parsed_dict = {}
 
         # Parallel LISP instance limit:      2000
-        p1 = re.compile(r'Parallel +LISP +instance +limit: +(?P<limit>(\d+))$')
+        p1 = regex_engine.compile(r'Parallel +LISP +instance +limit: +(?P<limit>(\d+))$')
 
         # IPv4 RLOC, local:                 OK
         # IPv6 RLOC, local:                 OK
         # MAC RLOC, local:                  Unsupported
-        p2 = re.compile(r'(?P<type>(IPv4|IPv6|MAC)) RLOC,'
-                            r' +local: +(?P<local>(\S+))$')
+        p2 = regex_engine.compile(r'(?P<type>(IPv4|IPv6|MAC)) RLOC,'
+                                      r' +local: +(?P<local>(\S+))$')
 
         # IPv4 RLOC, remote:                OK
         # IPv6 RLOC, remote:                OK
         # MAC RLOC, remote:                 Unsupported
-        p3 = re.compile(r'(?P<type>(IPv4|IPv6|MAC)) RLOC,'
-                            r' +remote: +(?P<remote>(\S+))$')
+        p3 = regex_engine.compile(r'(?P<type>(IPv4|IPv6|MAC)) RLOC,'
+                                      r' +remote: +(?P<remote>(\S+))$')
 
         # Latest supported config style:     Service and instance
-        p4 = re.compile(r'Latest +supported +config +style:'
-                            r' +(?P<supported>([a-zA-Z\s]+))$')
+        p4 = regex_engine.compile(r'Latest +supported +config +style:'
+                                      r' +(?P<supported>([a-zA-Z\s]+))$')
 
         # Current config style:              Service and instance
-        p5 = re.compile(r'Current +config +style:'
-                            r' +(?P<current>([a-zA-Z\s]+))$')
+        p5 = regex_engine.compile(r'Current +config +style:'
+                                      r' +(?P<current>([a-zA-Z\s]+))$')
 
         # Support for signal+forward:
-        p6 = re.compile(r'^Support for signal\Sforward:$')
+        p6 = regex_engine.compile(r'^Support for signal\Sforward:$')
 
         # IPv4:                             Unsupported
         # IPv6:                             Unsupported
         # MAC:                              Unsupported
-        p7 = re.compile(r'^(?P<support_type>(IPv4|IPv6|MAC)):(:?\s*)(?P<status>\w*)$')
+        p7 = regex_engine.compile(r'^(?P<support_type>(IPv4|IPv6|MAC)):(:?\s*)(?P<status>\w*)$')
 
         #Platform reported limits:
-        p8 = re.compile(r'^Platform reported limits:$')
+        p8 = regex_engine.compile(r'^Platform reported limits:$')
 
         # L3 limit:                         114688
         # L2 limit:                         65536
         # p10 = re.compile(r'^(?P<type>(L2 limit)):(?:\s*)(?P<l2_limit>(\d*))$')
-        p9 = re.compile(r'^(?P<type>(L3 limit|L2 limit)):(?:\s*)(?P<l_limit>(\d*))$')
+        p9 = regex_engine.compile(r'^(?P<type>(L3 limit|L2 limit)):(?:\s*)(?P<l_limit>(\d*))$')
         
         # Software-only counters:
-        p9_1 = re.compile(r'^(?P<type>(Software-only))\scounters:')
+        p9_1 = regex_engine.compile(r'^(?P<type>(Software-only))\scounters:')
 
         #     Total Current utilization:      0%
-        p10 = re.compile(r'^Total Current utilization:(?:\s*)+(?P<total_current_utilization>(\d*%))$')
+        p10 = regex_engine.compile(r'^Total Current utilization:(?:\s*)+(?P<total_current_utilization>(\d*%))$')
 
         # IPv4 local EID counter:         3
         # IPv4 remote EID counter:        6
         # IPv4 remote EID idle counter:   1
-        p11 = re.compile(r'^IPv4 (?P<type>(multiplier|local\sEID\scounter|remote\sEID\scounter|remote\sEID\sidle\scounter)):(?:\s*)(?P<ipv4>(\d*))$')
+        p11 = regex_engine.compile(r'^IPv4 (?P<type>(multiplier|local\sEID\scounter|remote\sEID\scounter|remote\sEID\sidle\scounter)):(?:\s*)(?P<ipv4>(\d*))$')
 
         #IPv4 mapping cache full:        no
-        p12 = re.compile(r'^IPv4 mapping cache full:(?:\s*)(?P<ipv4_1>(\w*))$')
+        p12 = regex_engine.compile(r'^IPv4 mapping cache full:(?:\s*)(?P<ipv4_1>(\w*))$')
 
         # IPv6 multiplier:                2
         # IPv6 local EID counter:         3
         # IPv6 remote EID counter:        4
         # IPv6 remote EID idle counter:   0
-        p13 = re.compile(r'^IPv6 (?P<type>(multiplier|local\sEID\scounter|remote\sEID\scounter|remote\sEID\sidle\scounter)):(?:\s*)(?P<ipv6>(\d*))$')
+        p13 = regex_engine.compile(r'^IPv6 (?P<type>(multiplier|local\sEID\scounter|remote\sEID\scounter|remote\sEID\sidle\scounter)):(?:\s*)(?P<ipv6>(\d*))$')
 
         #IPv6 mapping cache full:        no
-        p14 = re.compile(r'^IPv6 mapping cache full:(?:\s*)(?P<ipv6_1>(\w*))$')
+        p14 = regex_engine.compile(r'^IPv6 mapping cache full:(?:\s*)(?P<ipv6_1>(\w*))$')
 
         # MAC multiplier:                 1
         # MAC local EID counter:          0
         # MAC remote EID counter:         0
         # MAC remote EID idle counter:    0
-        p15 = re.compile(r'^MAC (?P<type>(multiplier|local\sEID\scounter|remote\sEID\scounter|remote\sEID\sidle\scounter)):(?:\s*)(?P<mac>(\d*))$')
+        p15 = regex_engine.compile(r'^MAC (?P<type>(multiplier|local\sEID\scounter|remote\sEID\scounter|remote\sEID\sidle\scounter)):(?:\s*)(?P<mac>(\d*))$')
 
         #MAC mapping cache full:         no
-        p16 = re.compile(r'^MAC mapping cache full:(?:\s*)(?P<mac_1>(\w*))$')
+        p16 = regex_engine.compile(r'^MAC mapping cache full:(?:\s*)(?P<mac_1>(\w*))$')
 
         # loop to split lines of output
         for line in out.splitlines():
@@ -523,200 +521,200 @@ class ShowLispPlatformStatistics(ShowLispPlatformStatisticsSchema):
         ret_dict = {}
 
         #  FIB notications received/processed:                    35669/35669
-        p1 = re.compile(r"^FIB\s+notications\s+received\/processed:\s+"
-                        r"(?P<received>\d+)\/(?P<processed>\d+)$")
+        p1 = regex_engine.compile(r"^FIB\s+notications\s+received\/processed:\s+"
+                                  r"(?P<received>\d+)\/(?P<processed>\d+)$")
 
         # Invalid received/processed:                          0/0
-        p2 = re.compile(r"^Invalid\s+received\/processed:\s+"
-                        r"(?P<received>\d+)\/(?P<processed>\d+)$")
+        p2 = regex_engine.compile(r"^Invalid\s+received\/processed:\s+"
+                                  r"(?P<received>\d+)\/(?P<processed>\d+)$")
 
         # Data packet signal received/processed:               35669/35669
-        p3 = re.compile(r"^Data\s+packet\s+signal\s+received\/processed:\s+"
-                        r"(?P<received>\d+)\/(?P<processed>\d+)$")
+        p3 = regex_engine.compile(r"^Data\s+packet\s+signal\s+received\/processed:\s+"
+                                  r"(?P<received>\d+)\/(?P<processed>\d+)$")
 
         # L2 data packet signal received/processed:            0/0
-        p4 = re.compile(r"^L2\s+data\s+packet\s+signal\s+received\/processed:\s+"
-                        r"(?P<received>\d+)\/(?P<processed>\d+)$")
+        p4 = regex_engine.compile(r"^L2\s+data\s+packet\s+signal\s+received\/processed:\s+"
+                                  r"(?P<received>\d+)\/(?P<processed>\d+)$")
 
         # Status report received/processed:                    0/0
-        p5 = re.compile(r"^Status\s+report\s+received\/processed:\s+"
-                        r"(?P<received>\d+)\/(?P<processed>\d+)$")
+        p5 = regex_engine.compile(r"^Status\s+report\s+received\/processed:\s+"
+                                  r"(?P<received>\d+)\/(?P<processed>\d+)$")
 
         # Dyn-EID detected received/processed:                 0/0
-        p6 = re.compile(r"^Dyn-EID\s+detected\s+received\/processed:\s+"
-                        r"(?P<received>\d+)\/(?P<processed>\d+)$")
+        p6 = regex_engine.compile(r"^Dyn-EID\s+detected\s+received\/processed:\s+"
+                                  r"(?P<received>\d+)\/(?P<processed>\d+)$")
 
         # Dyn-EID decap stale detected received/processed:     0/0
-        p7 = re.compile(r"^Dyn-EID\s+decap\s+stale\s+detected\s+received\/processed:\s+"
-                        r"(?P<received>\d+)\/(?P<processed>\d+)$")
+        p7 = regex_engine.compile(r"^Dyn-EID\s+decap\s+stale\s+detected\s+received\/processed:\s+"
+                                  r"(?P<received>\d+)\/(?P<processed>\d+)$")
 
         # L2 dyn-EID decap stale detected received/processed:  0/0
-        p8 = re.compile(r"^L2\s+dyn-EID\s+decap\s+stale\s+detected\s+"
-                        r"received\/processed:\s+(?P<received>\d+)\/(?P<processed>\d+)$")
+        p8 = regex_engine.compile(r"^L2\s+dyn-EID\s+decap\s+stale\s+detected\s+"
+                                  r"received\/processed:\s+(?P<received>\d+)\/(?P<processed>\d+)$")
 
         # Dyn-EID adjacency discover received/processed:       0/0
-        p9 = re.compile(r"^Dyn-EID\s+adjacency\s+discover\s+received\/"
-                        r"processed:\s+(?P<received>\d+)\/(?P<processed>\d+)$")
+        p9 = regex_engine.compile(r"^Dyn-EID\s+adjacency\s+discover\s+received\/"
+                                  r"processed:\s+(?P<received>\d+)\/(?P<processed>\d+)$")
 
         # delete map-cache received/processed:                 0/0
-        p10 = re.compile(r"^delete\s+map-cache\s+received\/processed:\s+"
-                         r"(?P<received>\d+)\/(?P<processed>\d+)$")
+        p10 = regex_engine.compile(r"^delete\s+map-cache\s+received\/processed:\s+"
+                                   r"(?P<received>\d+)\/(?P<processed>\d+)$")
 
         # Remote update requests:                              0
-        p11 = re.compile(r"^Remote\s+update\s+requests:\s+(?P<remote_update_requests>\d+)$")
+        p11 = regex_engine.compile(r"^Remote\s+update\s+requests:\s+(?P<remote_update_requests>\d+)$")
 
         # Local update requests:                               5
-        p12 = re.compile(r"^Local\s+update\s+requests:\s+(?P<local_update_requests>\d+)$")
+        p12 = regex_engine.compile(r"^Local\s+update\s+requests:\s+(?P<local_update_requests>\d+)$")
 
         # Delete requests:                                     1
-        p13 = re.compile(r"^Delete\s+requests:\s+(?P<delete_requests>\d+)$")
+        p13 = regex_engine.compile(r"^Delete\s+requests:\s+(?P<delete_requests>\d+)$")
 
         # Update test:                                         0
-        p14 = re.compile(r"^Update\s+test:\s+(?P<update_test>\d+)$")
+        p14 = regex_engine.compile(r"^Update\s+test:\s+(?P<update_test>\d+)$")
 
         # Delete test:                                         0
-        p15 = re.compile(r"^Delete\s+test:\s+(?P<delete_test>\d+)$")
+        p15 = regex_engine.compile(r"^Delete\s+test:\s+(?P<delete_test>\d+)$")
 
         # Message sent:                                        6
-        p16 = re.compile(r"^Message\s+sent:\s+(?P<message_sent>\d+)$")
+        p16 = regex_engine.compile(r"^Message\s+sent:\s+(?P<message_sent>\d+)$")
 
         # Message received:                                    6
-        p17 = re.compile(r"^Message\s+received:\s+(?P<message_received>\d+)$")
+        p17 = regex_engine.compile(r"^Message\s+received:\s+(?P<message_received>\d+)$")
 
         # Unknown message received:                            0
-        p18 = re.compile(r"^Unknown\s+message\s+received:\s+(?P<unknown_message_received>\d+)$")
+        p18 = regex_engine.compile(r"^Unknown\s+message\s+received:\s+(?P<unknown_message_received>\d+)$")
 
         # Send Error:                                          0
-        p19 = re.compile(r"^Send\s+Error:\s+(?P<send_errors>\d+)$")
+        p19 = regex_engine.compile(r"^Send\s+Error:\s+(?P<send_errors>\d+)$")
 
         # Number of times blocked (flow control):              0
-        p20 = re.compile(r"^Number\s+of\s+times\s+blocked\s+"
-                         r"\(flow\s+control\):\s+(?P<flow_control>\d+)$")
+        p20 = regex_engine.compile(r"^Number\s+of\s+times\s+blocked\s+"
+                                   r"\(flow\s+control\):\s+(?P<flow_control>\d+)$")
 
         # Dropped notications from CEF:                          0
-        p21 = re.compile(r"^Dropped\s+notications\s+"
-                         r"from\s+CEF:\s+(?P<dropped_notifications>\d+)$")
+        p21 = regex_engine.compile(r"^Dropped\s+notications\s+"
+                                   r"from\s+CEF:\s+(?P<dropped_notifications>\d+)$")
 
         # Total notications from CEF:                            35669
-        p22 = re.compile(r"^Total\s+notications\s+from\s+CEF:\s+(?P<total_notifications>\d+)$")
+        p22 = regex_engine.compile(r"^Total\s+notications\s+from\s+CEF:\s+(?P<total_notifications>\d+)$")
 
         # Dropped control packets in input queue:                0
-        p23 = re.compile(r"^Dropped\s+control\s+packets\s+in\s+"
-                         r"input\s+queue:\s+(?P<dropped_control_packets>\d+)$")
+        p23 = regex_engine.compile(r"^Dropped\s+control\s+packets\s+in\s+"
+                                   r"input\s+queue:\s+(?P<dropped_control_packets>\d+)$")
 
         # High priority input queue:                           0
-        p24 = re.compile(r"^High\s+priority\s+input\s+queue:\s+(?P<high_priority_queue>\d+)$")
+        p24 = regex_engine.compile(r"^High\s+priority\s+input\s+queue:\s+(?P<high_priority_queue>\d+)$")
 
         # Normal priority input queue:                         0
-        p25 = re.compile(r"^Normal\s+priority\s+input\s+queue:\s+(?P<normal_priority_queue>\d+)$")
+        p25 = regex_engine.compile(r"^Normal\s+priority\s+input\s+queue:\s+(?P<normal_priority_queue>\d+)$")
 
         # DDT referral deferred/dropped:                       0/0
-        p26 = re.compile(r"^DDT\s+referral\s+deferred\/dropped:\s+"
-                         r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p26 = regex_engine.compile(r"^DDT\s+referral\s+deferred\/dropped:\s+"
+                                   r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # DDT request deferred/dropped:                        0/0
-        p27 = re.compile(r"^DDT\s+request\s+deferred\/dropped:\s+"
-                         r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p27 = regex_engine.compile(r"^DDT\s+request\s+deferred\/dropped:\s+"
+                                   r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # DDT query deferred/dropped:                          0/0
-        p28 = re.compile(r"^DDT\s+query\s+deferred\/dropped:\s+"
-                         r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p28 = regex_engine.compile(r"^DDT\s+query\s+deferred\/dropped:\s+"
+                                   r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # Map-Request deferred/dropped:                        0/0
-        p29 = re.compile(r"^Map-Request\s+deferred\/dropped:\s+"
-                         r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p29 = regex_engine.compile(r"^Map-Request\s+deferred\/dropped:\s+"
+                                   r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # Map-Register deferred/dropped:                       0/0
-        p30 = re.compile(r"^Map-Register\s+deferred\/dropped:\s+"
-                         r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p30 = regex_engine.compile(r"^Map-Register\s+deferred\/dropped:\s+"
+                                   r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # Map-Reply deferred/dropped:                          0/0
-        p31 = re.compile(r"^Map-Reply\s+deferred\/dropped:\s+"
-                         r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p31 = regex_engine.compile(r"^Map-Reply\s+deferred\/dropped:\s+"
+                                   r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # MR negative Map-Reply deferred/dropped:              0/0
-        p32 = re.compile(r"^MR\s+negative\s+Map-Reply\s+deferred\/dropped:"
-                         r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p32 = regex_engine.compile(r"^MR\s+negative\s+Map-Reply\s+deferred\/dropped:"
+                                   r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # MR Map-Request fwd deferred/dropped:                 0/0
-        p33 = re.compile(r"^MR\s+Map-Request\s+fwd\s+deferred\/dropped:"
-                         r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p33 = regex_engine.compile(r"^MR\s+Map-Request\s+fwd\s+deferred\/dropped:"
+                                   r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # MS Map-Request fwd deferred/dropped:                 0/0
-        p34 = re.compile(r"^MS\s+Map-Request\s+fwd\s+deferred\/dropped:"
-                         r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p34 = regex_engine.compile(r"^MS\s+Map-Request\s+fwd\s+deferred\/dropped:"
+                                   r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # MS proxy Map-Reply deferred/dropped:                 0/0
-        p35 = re.compile(r"^MS\s+proxy\s+Map-Reply\s+deferred\/dropped:"
-                         r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p35 = regex_engine.compile(r"^MS\s+proxy\s+Map-Reply\s+deferred\/dropped:"
+                                   r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # xTR mcast Map-Notify deferred/dropped:               0/0
-        p36 = re.compile(r"^xTR\s+mcast\s+Map-Notify\s+deferred\/dropped:"
-                         r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p36 = regex_engine.compile(r"^xTR\s+mcast\s+Map-Notify\s+deferred\/dropped:"
+                                   r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # MS Info-Reply deferred/dropped:                      0/0
-        p37 = re.compile(r"^MS\s+Info-Reply\s+deferred\/dropped:\s+"
-                         r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p37 = regex_engine.compile(r"^MS\s+Info-Reply\s+deferred\/dropped:\s+"
+                                   r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # MS Map-Notify deferred/dropped:                      0/0
-        p38 = re.compile(r"^MS\s+Map-Notify\s+deferred\/dropped:\s+"
-                         r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p38 = regex_engine.compile(r"^MS\s+Map-Notify\s+deferred\/dropped:\s+"
+                                   r"(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # RTR Map-Register fwd deferred/dropped:               0/0
-        p39 = re.compile(r"^RTR\s+Map-Register\s+fwd\s+deferred\/dropped:"
-                         r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p39 = regex_engine.compile(r"^RTR\s+Map-Register\s+fwd\s+deferred\/dropped:"
+                                   r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # RTR Map-Notify fwd deferred/dropped:                 0/0
-        p40 = re.compile(r"^RTR\s+Map-Notify\s+fwd\s+deferred\/dropped:"
-                         r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p40 = regex_engine.compile(r"^RTR\s+Map-Notify\s+fwd\s+deferred\/dropped:"
+                                   r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # ETR Info-Request deferred/dropped:                   0/0
-        p41 = re.compile(r"^ETR\s+Info-Request\s+deferred\/dropped:"
-                         r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
+        p41 = regex_engine.compile(r"^ETR\s+Info-Request\s+deferred\/dropped:"
+                                   r"\s+(?P<deferred>\d+)\/(?P<dropped>\d+)$")
 
         # Invalid IP version drops:                              0
-        p42 = re.compile(r"^Invalid\s+IP\s+version\s+drops:"
-                         r"\s+(?P<invalid_ip_version_drops>\d+)$")
+        p42 = regex_engine.compile(r"^Invalid\s+IP\s+version\s+drops:"
+                                   r"\s+(?P<invalid_ip_version_drops>\d+)$")
 
         # IPv4 UDP control packets:
         # IPv6 UDP control packets:
-        p43 = re.compile(r"^IP(?P<ip_version>v4|v6)\s+UDP\s+control\s+packets:$")
+        p43 = regex_engine.compile(r"^IP(?P<ip_version>v4|v6)\s+UDP\s+control\s+packets:$")
 
         # Rcvd total packets:                                    0
-        p44 = re.compile(r"^Rcvd\s+total\s+packets:\s+(?P<received_total_packets>\d+)$")
+        p44 = regex_engine.compile(r"^Rcvd\s+total\s+packets:\s+(?P<received_total_packets>\d+)$")
 
         # Rcvd invalid vrf:                                      0
-        p45 = re.compile(r"^Rcvd\s+invalid\s+vrf:\s+(?P<received_invalid_vrf>\d+)$")
+        p45 = regex_engine.compile(r"^Rcvd\s+invalid\s+vrf:\s+(?P<received_invalid_vrf>\d+)$")
 
         # Rcvd invalid IP header:                                0
-        p46 = re.compile(r"^Rcvd\s+invalid\s+IP\s+header:\s+(?P<received_invalid_ip_header>\d+)$")
+        p46 = regex_engine.compile(r"^Rcvd\s+invalid\s+IP\s+header:\s+(?P<received_invalid_ip_header>\d+)$")
 
         # Rcvd invalid protocol:                                 0
-        p47 = re.compile(r"^Rcvd\s+invalid\s+protocol:\s+(?P<received_invalid_protocol>\d+)$")
+        p47 = regex_engine.compile(r"^Rcvd\s+invalid\s+protocol:\s+(?P<received_invalid_protocol>\d+)$")
 
         # Rcvd invalid size:                                     0
-        p48 = re.compile(r"^Rcvd\s+invalid\s+size:\s+(?P<received_invalid_size>\d+)$")
+        p48 = regex_engine.compile(r"^Rcvd\s+invalid\s+size:\s+(?P<received_invalid_size>\d+)$")
 
         # Rcvd invalid port:                                     0
-        p49 = re.compile(r"^Rcvd\s+invalid\s+port:\s+(?P<received_invalid_port>\d+)$")
+        p49 = regex_engine.compile(r"^Rcvd\s+invalid\s+port:\s+(?P<received_invalid_port>\d+)$")
 
         # Rcvd invalid checksum:                                 0
-        p50 = re.compile(r"^Rcvd\s+invalid\s+checksum:\s+(?P<received_invalid_checksum>\d+)$")
+        p50 = regex_engine.compile(r"^Rcvd\s+invalid\s+checksum:\s+(?P<received_invalid_checksum>\d+)$")
 
         # Rcvd unsupported LISP:                                 0
-        p51 = re.compile(r"^Rcvd\s+unsupported\s+LISP:\s+(?P<received_unsupported_lisp>\d+)$")
+        p51 = regex_engine.compile(r"^Rcvd\s+unsupported\s+LISP:\s+(?P<received_unsupported_lisp>\d+)$")
 
         # Rcvd not LISP control:                                 0
-        p52 = re.compile(r"^Rcvd\s+not\s+LISP\s+control:\s+(?P<received_not_lisp_control>\d+)$")
+        p52 = regex_engine.compile(r"^Rcvd\s+not\s+LISP\s+control:\s+(?P<received_not_lisp_control>\d+)$")
 
         # Rcvd unknown LISP control:                             0
-        p53 = re.compile(r"^Rcvd\s+unknown\s+LISP\s+control:\s+(?P<received_unknown_lisp_control>\d+)$")
+        p53 = regex_engine.compile(r"^Rcvd\s+unknown\s+LISP\s+control:\s+(?P<received_unknown_lisp_control>\d+)$")
 
         # Sent total packets:                                    0
-        p54 = re.compile(r"^Sent\s+total\s+packets:\s+(?P<sent_total>\d+)$")
+        p54 = regex_engine.compile(r"^Sent\s+total\s+packets:\s+(?P<sent_total>\d+)$")
 
         # Sent flow controlled:                                  0
-        p55 = re.compile(r"^Sent\s+flow\s+controlled:\s+(?P<sent_flow_controlled>\d+)$")
+        p55 = regex_engine.compile(r"^Sent\s+flow\s+controlled:\s+(?P<sent_flow_controlled>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1279,15 +1277,15 @@ class ShowLispPlatformSmrKnownLocatorsParser(ShowLispPlatformSmrKnownLocatorsSch
 
         # Platform requested masked SMR for:
         #  IPv6: 32 bits
-        p1 = re.compile(r'^(?P<address_family>IPv\d): (?P<bits>\d+) bits$')
+        p1 = regex_engine.compile(r'^(?P<address_family>IPv\d): (?P<bits>\d+) bits$')
 
         # LISP known locators in VRF default
-        p2 = re.compile(r'^LISP known locators in VRF (?P<vrf>\S+)$')
+        p2 = regex_engine.compile(r'^LISP known locators in VRF (?P<vrf>\S+)$')
 
         # RLOC                    Known from
         # 2::2                    MS 3::3
-        p3 = re.compile(r'^(?P<locator>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|'
-                        r'([a-fA-F\d\:]+))\s+(?P<known_from>.+)$')
+        p3 = regex_engine.compile(r'^(?P<locator>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|'
+                                  r'([a-fA-F\d\:]+))\s+(?P<known_from>.+)$')
 
         for line in out.splitlines():
             line = line.strip()
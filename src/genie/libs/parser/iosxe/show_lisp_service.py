@@ -11,6 +11,7 @@ from genie.metaparser.util.schemaengine import (Any,
                                                 ListOf,
                                                 Optional,
                                                 Or)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.libs.parser.iosxe.show_lisp_super import *
@@ -134,160 +135,160 @@ class ShowLispService(ShowLispServiceSchema):
         ret_dict = {}
 
         # Router-lisp ID:                      0
-        p1 = re.compile(r'Router-lisp +ID *: +(?P<lisp_id>(\d+))$')
+        p1 = regex_engine.compile(r'Router-lisp +ID *: +(?P<lisp_id>(\d+))$')
 
         # Locator table:                       default
-        p2 = re.compile(r'Locator +table *: +(?P<locator_table>(\S+))$')
+        p2 = regex_engine.compile(r'Locator +table *: +(?P<locator_table>(\S+))$')
 
         # Ingress Tunnel Router (ITR):         enabled
         # Egress Tunnel Router (ETR):          enabled
-        p3 = re.compile(r'(Ingress|Egress) +Tunnel +Router '
-                        r'+\((?P<type>(ITR|ETR))\) *: '
-                        r'+(?P<enabled>(enabled|disabled))$')
+        p3 = regex_engine.compile(r'(Ingress|Egress) +Tunnel +Router '
+                                  r'+\((?P<type>(ITR|ETR))\) *: '
+                                  r'+(?P<enabled>(enabled|disabled))$')
 
         # Proxy-ITR Router (PITR):             disabled
         # Proxy-ETR Router (PETR):             disabled
         # Proxy-ETR Router (PETR):             enabled RLOCs: 10.10.10.10
         # Proxy-ITR Router (PITR):             enabled RLOCs: 2001:21:21:21::21
-        p4 = re.compile(r'Proxy\-(ITR|ETR) +Router +\((?P<proxy_type>(PITR|PETR))\)'
-                        r'*: +(?P<proxy_itr_router>(enabled|disabled))'
-                        r'(?: +RLOCs: +(?P<proxy_itr_rloc>'
-                        r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|[a-fA-F\d\:]+))?$')
+        p4 = regex_engine.compile(r'Proxy\-(ITR|ETR) +Router +\((?P<proxy_type>(PITR|PETR))\)'
+                                  r'*: +(?P<proxy_itr_router>(enabled|disabled))'
+                                  r'(?: +RLOCs: +(?P<proxy_itr_rloc>'
+                                  r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|[a-fA-F\d\:]+))?$')
 
         # ITR local RLOC (last resort):             *** NOT FOUND ***
-        p5 = re.compile(r'^ITR +local +RLOC +\(last +resort\):\s+'
-                        r'(?P<local_rloc_last_resort>.*)$')
+        p5 = regex_engine.compile(r'^ITR +local +RLOC +\(last +resort\):\s+'
+                                  r'(?P<local_rloc_last_resort>.*)$')
 
         # ITR use proxy ETR RLOC(s):           10.10.10.10
-        p6 = re.compile(r'^ITR\s+use +proxy +ETR +RLOC\(Encap IID\) *:'
-                        r'+(?P<use_proxy_etr_rloc>.*)$')
+        p6 = regex_engine.compile(r'^ITR\s+use +proxy +ETR +RLOC\(Encap IID\) *:'
+                                  r'+(?P<use_proxy_etr_rloc>.*)$')
 
         # ITR Solicit Map Request (SMR):       accept and process
-        p7 = re.compile(r'^ITR +Solicit +Map +Request +\(SMR\) *:'
-                        r'+(?P<solicit_map_request>(.*))$')
+        p7 = regex_engine.compile(r'^ITR +Solicit +Map +Request +\(SMR\) *:'
+                                  r'+(?P<solicit_map_request>(.*))$')
 
         # Max SMRs per map-cache entry:      8 more specifics
-        p8 = re.compile(r'^Max SMRs per map-cache entry:\s+(?P<max_smr_per_map_cache>.*)$')
+        p8 = regex_engine.compile(r'^Max SMRs per map-cache entry:\s+(?P<max_smr_per_map_cache>.*)$')
 
         # Multiple SMR suppression time:     20 secs
-        p9 = re.compile(r'^Multiple +SMR +suppression +time *: +'
-                        r'(?P<multiple_smr_supression_time>(\d+)) +secs$')
+        p9 = regex_engine.compile(r'^Multiple +SMR +suppression +time *: +'
+                                  r'(?P<multiple_smr_supression_time>(\d+)) +secs$')
 
         # ETR accept mapping data:             disabled, verify disabled
-        p10 = re.compile(r'^ETR +accept +mapping +data *: +(?P<accept_mapping_data>(.*))$')
+        p10 = regex_engine.compile(r'^ETR +accept +mapping +data *: +(?P<accept_mapping_data>(.*))$')
 
         # ETR map-cache TTL:                   1d00h
-        p11 = re.compile(r'^ETR +map-cache +TTL *: +(?P<map_cache_ttl>(\S+))$')
+        p11 = regex_engine.compile(r'^ETR +map-cache +TTL *: +(?P<map_cache_ttl>(\S+))$')
 
         # NAT-traversal Router (NAT-RTR):      disabled
-        p12 = re.compile(r'^NAT-traversal +Router +\(NAT\-RTR\) *: +'
-                         r'(?P<nat_traversal_router>(enabled|disabled))$')
+        p12 = regex_engine.compile(r'^NAT-traversal +Router +\(NAT\-RTR\) *: +'
+                                   r'(?P<nat_traversal_router>(enabled|disabled))$')
 
         # Mobility First-Hop Router:           disabled
-        p13 = re.compile(r'Mobility +First-Hop +Router *:'
-                         r' +(?P<mobility_first_hop_router>(enabled|disabled))$')
+        p13 = regex_engine.compile(r'Mobility +First-Hop +Router *:'
+                                   r' +(?P<mobility_first_hop_router>(enabled|disabled))$')
 
         # Map Server (MS):                     disabled
-        p14 = re.compile(r'Map +Server +\(MS\) *:'
-                        r' +(?P<enabled>(enabled|disabled))$')
+        p14 = regex_engine.compile(r'Map +Server +\(MS\) *:'
+                                  r' +(?P<enabled>(enabled|disabled))$')
 
         # Map Resolver (MR):                   disabled
-        p15 = re.compile(r'Map +Resolver +\(MR\) *:'
-                         r' +(?P<enabled>(enabled|disabled))$')
+        p15 = regex_engine.compile(r'Map +Resolver +\(MR\) *:'
+                                   r' +(?P<enabled>(enabled|disabled))$')
 
         # Delegated Database Tree (DDT):       disabled
-        p16 = re.compile(r'Delegated +Database +Tree +\(DDT\) *:'
-                         r' +(?P<delegated_database_tree>(enabled|disabled))$')
+        p16 = regex_engine.compile(r'Delegated +Database +Tree +\(DDT\) *:'
+                                   r' +(?P<delegated_database_tree>(enabled|disabled))$')
 
         # Mr-use-petr:                              enabled
-        p17 = re.compile(r'^Mr-use-petr:\s+(?P<role>enabled|disabled)$')
+        p17 = regex_engine.compile(r'^Mr-use-petr:\s+(?P<role>enabled|disabled)$')
 
         # Mr-use-petr locator set name:             RLOC1
-        p18 = re.compile(r'^Mr-use-petr locator set name:\s+(?P<locator_set>\S+)$')
+        p18 = regex_engine.compile(r'^Mr-use-petr locator set name:\s+(?P<locator_set>\S+)$')
 
         # First-Packet pETR:                        enabled
-        p19 = re.compile(r'^First-Packet pETR:\s+(?P<role>enabled|disabled)$')
+        p19 = regex_engine.compile(r'^First-Packet pETR:\s+(?P<role>enabled|disabled)$')
 
         # First-Packet pETR locator set name:       RLOC1
-        p20 = re.compile(r'^First-Packet pETR locator set name:\s+(?P<locator_set>\S+)$')
+        p20 = regex_engine.compile(r'^First-Packet pETR locator set name:\s+(?P<locator_set>\S+)$')
 
         # Multiple IP per MAC support:              disabled
-        p21 = re.compile(r'^Multiple IP per MAC support:\s+'
-                         r'(?P<multiple_ip_per_mac>disabled|enabled)$')
+        p21 = regex_engine.compile(r'^Multiple IP per MAC support:\s+'
+                                   r'(?P<multiple_ip_per_mac>disabled|enabled)$')
 
         # Multicast Flood Access-Tunnel:            disabled
-        p22 = re.compile(r'^Multicast Flood Access-Tunnel:\s+'
-                         r'(?P<mcast_flood_access_tunnel>disabled|enabled)$')
+        p22 = regex_engine.compile(r'^Multicast Flood Access-Tunnel:\s+'
+                                   r'(?P<mcast_flood_access_tunnel>disabled|enabled)$')
 
         # Publication-Subscription:                 enabled
-        p23 = re.compile(r'^Publication-Subscription:\s+(?P<role>enabled|disabled)$')
+        p23 = regex_engine.compile(r'^Publication-Subscription:\s+(?P<role>enabled|disabled)$')
 
         # Publisher(s):                           *** NOT FOUND ***
         # Publisher(s):                           2001:4:4:4::4
-        p24 = re.compile(r'^Publisher\(s\):\s+(?P<publishers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+)')
+        p24 = regex_engine.compile(r'^Publisher\(s\):\s+(?P<publishers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+)')
 
         # Subscriber(s):                           *** NOT FOUND ***
         # Subscriber(s):                           2001:4:4:4::4
-        p25 = re.compile(r'^Subscriber\(s\):\s+(?P<subscribers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+)')
+        p25 = regex_engine.compile(r'^Subscriber\(s\):\s+(?P<subscribers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+)')
 
         # ITR Map-Resolver(s):                 10.64.4.4, 10.166.13.13
-        p26 = re.compile(r'ITR +Map\-Resolver\(s\) *: +(?P<mr_address>(.*))$')
+        p26 = regex_engine.compile(r'ITR +Map\-Resolver\(s\) *: +(?P<mr_address>(.*))$')
 
         #                                      10.84.66.66 *** not reachable ***
-        p26_1 = re.compile(r'^(?P<prefix_list>([0-9\.\:]+)|([a-fA-F\d\:]+))(?: +\*.*)?$')
+        p26_1 = regex_engine.compile(r'^(?P<prefix_list>([0-9\.\:]+)|([a-fA-F\d\:]+))(?: +\*.*)?$')
 
         # ETR Map-Server(s):                   10.64.4.4 (17:49:58), 10.166.13.13 (00:00:35)
-        p27 = re.compile(r'ETR +Map\-Server\(s\) *: +(?P<ms_address>(.*))$')
+        p27 = regex_engine.compile(r'ETR +Map\-Server\(s\) *: +(?P<ms_address>(.*))$')
 
         #                                      10.84.66.66 (never)
-        p27_1 = re.compile(r'^(?P<prefix_list>([0-9\.\:]+)|([a-fA-F\d\:]+))(?: +\((?P<uptime>(\S+))\))?$')
+        p27_1 = regex_engine.compile(r'^(?P<prefix_list>([0-9\.\:]+)|([a-fA-F\d\:]+))(?: +\((?P<uptime>(\S+))\))?$')
 
         # xTR-ID:                              0x730E0861-0x12996F6D-0xEFEA2114-0xE1C951F7
-        p28 = re.compile(r'^xTR-ID *: +(?P<xtr_id>(\S+))$')
+        p28 = regex_engine.compile(r'^xTR-ID *: +(?P<xtr_id>(\S+))$')
 
         # site-ID:                             unspecified
-        p29 = re.compile(r'site-ID *: +(?P<site_id>(\S+))$')
+        p29 = regex_engine.compile(r'site-ID *: +(?P<site_id>(\S+))$')
 
         # RLOC-probe algorithm:              disabled
-        p30 = re.compile(r'RLOC\-probe +algorithm *: '
-                         r'+(?P<rloc_probe_algorithm>(enabled|disabled))$')
+        p30 = regex_engine.compile(r'RLOC\-probe +algorithm *: '
+                                   r'+(?P<rloc_probe_algorithm>(enabled|disabled))$')
 
         # RLOC-probe on route change:        N/A (periodic probing disabled)
-        p31 = re.compile(r'RLOC\-probe +on +route +change *: +(?P<rloc_probe_on_route_change>(.*))$')
+        p31 = regex_engine.compile(r'RLOC\-probe +on +route +change *: +(?P<rloc_probe_on_route_change>(.*))$')
 
         # RLOC-probe on member change:       disabled
-        p32 = re.compile(r'RLOC\-probe +on +member +change *:'
-                         r' +(?P<rloc_probe_member_change>(enabled|disabled))$')
+        p32 = regex_engine.compile(r'RLOC\-probe +on +member +change *:'
+                                   r' +(?P<rloc_probe_member_change>(enabled|disabled))$')
 
         # LSB reports:                       process
-        p33 = re.compile(r'LSB +reports *: +(?P<lsb_reports>(\S+))$')
+        p33 = regex_engine.compile(r'LSB +reports *: +(?P<lsb_reports>(\S+))$')
 
         # IPv4 RLOC minimum mask length:     /0
-        p34 = re.compile(r'IPv4 +RLOC +minimum +mask +length *:'
-                         r' +\/(?P<ipv4_rloc_min_mask_len>(\d+))$')
+        p34 = regex_engine.compile(r'IPv4 +RLOC +minimum +mask +length *:'
+                                   r' +\/(?P<ipv4_rloc_min_mask_len>(\d+))$')
 
         # IPv6 RLOC minimum mask length:     /0
-        p35 = re.compile(r'IPv6 +RLOC +minimum +mask +length *:'
-                         r' +\/(?P<ipv6_rloc_min_mask_len>(\d+))$')
+        p35 = regex_engine.compile(r'IPv6 +RLOC +minimum +mask +length *:'
+                                   r' +\/(?P<ipv6_rloc_min_mask_len>(\d+))$')
 
         # Map-cache limit:                   5120
-        p36 = re.compile(r'Map\-cache +limit *: +(?P<limit>(\d+))$')
+        p36 = regex_engine.compile(r'Map\-cache +limit *: +(?P<limit>(\d+))$')
 
         # Map-cache activity check period:   60 secs
-        p37 = re.compile(r'Map-cache +activity +check +period *:'
-                         r' +(?P<activity_check_period>(\d+)) +secs$')
+        p37 = regex_engine.compile(r'Map-cache +activity +check +period *:'
+                                   r' +(?P<activity_check_period>(\d+)) +secs$')
 
         # Persistent map-cache:              disabled
-        p38 = re.compile(r'Persistent +map\-cache *:'
-                         r' +(?P<persistent>(enabled|disabled))$')
+        p38 = regex_engine.compile(r'Persistent +map\-cache *:'
+                                   r' +(?P<persistent>(enabled|disabled))$')
 
         # Dynamic database mapping limit:    5120
-        p39 = re.compile(r'Dynamic +database +mapping +limit *:'
-                         r' +(?P<dynamic_database_limit>(\d+))$')
+        p39 = regex_engine.compile(r'Dynamic +database +mapping +limit *:'
+                                   r' +(?P<dynamic_database_limit>(\d+))$')
 
         #   Vlan100: 10.229.11.1 (Loopback0)
-        p40 = re.compile(r'Vlan(?P<vlans>(\d+))\: +(?P<address>([0-9\.\:]+)) +'
-                         r'\((?P<interface>(\S+))\)$')
+        p40 = regex_engine.compile(r'Vlan(?P<vlans>(\d+))\: +(?P<address>([0-9\.\:]+)) +'
+                                   r'\((?P<interface>(\S+))\)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -807,42 +808,42 @@ class ShowLispServiceMapCache(ShowLispServiceMapCacheSchema):
 
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 193
-        p1 = re.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))'
-                         r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))'
+                                   r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
 
         # LISP IPv4 Mapping Cache for EID-table default (IID 101), 2 entries
         # LISP IPv6 Mapping Cache for EID-table vrf red (IID 101), 2 entries
         # LISP MAC Mapping Cache for EID-table Vlan 101 (IID 1), 4 entries
         # LISP IPv4 Mapping Cache for LISP 0 EID-table default (IID 4097), 2 entries
-        p2 = re.compile(r'LISP +(?P<type>(IPv4|IPv6|MAC)) +Mapping +Cache +for'
-                         r' ((LISP\s*[\d. ]+)|\s*)+EID\-table +(default|(vrf|Vlan)'
-                         r' +(?P<vrf>(\S+))) +\(IID +(?P<iid>(\d+))\), +(?P<entries>(\d+))'
-                         r' +entries$')
+        p2 = regex_engine.compile(r'LISP +(?P<type>(IPv4|IPv6|MAC)) +Mapping +Cache +for'
+                                   r' ((LISP\s*[\d. ]+)|\s*)+EID\-table +(default|(vrf|Vlan)'
+                                   r' +(?P<vrf>(\S+))) +\(IID +(?P<iid>(\d+))\), +(?P<entries>(\d+))'
+                                   r' +entries$')
 
         # 0.0.0.0/0, uptime: 15:23:50, expires: never, via static-send-map-request
         # ::/0, uptime: 00:11:28, expires: never, via static-send-map-request
         # b827.ebff.4720/48, uptime: 22:49:42, expires: 01:10:17, via WLC Map-Notify, complete
         # 192.168.9.0/24, uptime: 00:04:02, expires: 23:55:57, via map-reply, complete
-        p3 = re.compile(r'(?P<map_id>(\S+)), +uptime: +(?P<uptime>(\S+)),'
-                         r' +expires: +(?P<expires>(\S+)), +via +(?P<via>(.*))$')
+        p3 = regex_engine.compile(r'(?P<map_id>(\S+)), +uptime: +(?P<uptime>(\S+)),'
+                                   r' +expires: +(?P<expires>(\S+)), +via +(?P<via>(.*))$')
 
         #   Negative cache entry, action: send-map-request
-        p4 = re.compile(r'Negative +cache +entry, +action: +(?P<action>(.*))$')
+        p4 = regex_engine.compile(r'Negative +cache +entry, +action: +(?P<action>(.*))$')
 
         #   Locator  Uptime    State      Pri/Wgt     Encap-IID
         #   10.1.8.8 00:04:02  up          50/50        -
         # State can be: 'up', 'down', 'route-rejec', 'up, self' and etc
-        p5 = re.compile(r'(?P<locator>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+)) +(?P<uptime>(\S+))'
-                         r' +(?P<state>(\S+|up, self))'
-                         r' +(?P<priority>(\d+))\/(?P<weight>(\d+))'
-                         r'(?: +(?P<encap_iid>(\S+)))?$')
+        p5 = regex_engine.compile(r'(?P<locator>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+)) +(?P<uptime>(\S+))'
+                                   r' +(?P<state>(\S+|up, self))'
+                                   r' +(?P<priority>(\d+))\/(?P<weight>(\d+))'
+                                   r'(?: +(?P<encap_iid>(\S+)))?$')
 
         # Encapsulating to proxy ETR
         # Encapsulating to proxy ETR Encap-IID 3
-        p6 = re.compile(r'Encapsulating\s+to\s+proxy\s+ETR(\s+Encap-IID\s+(?P<encap_to_petr_iid>\S+))?$')
+        p6 = regex_engine.compile(r'Encapsulating\s+to\s+proxy\s+ETR(\s+Encap-IID\s+(?P<encap_to_petr_iid>\S+))?$')
 
         # SGT: 3003, software only
-        p7 = re.compile(r'SGT:\s+(?P<sgt>[-\w]+)')
+        p7 = regex_engine.compile(r'SGT:\s+(?P<sgt>[-\w]+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1032,23 +1033,23 @@ class ShowLispServiceRlocMembers(ShowLispServiceRlocMembersSchema):
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 193
         # Output for router lisp 2 instance-id 101
-        p1 = re.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))'
-                         r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))'
+                                   r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
 
         # LISP RLOC Membership for router lisp 0 IID 101
-        p2 = re.compile(r'LISP +RLOC +Membership +for +router +lisp'
-                         r' +(?P<router_id>(\S+)) +IID +(?P<instance_id>(\d+))$')
+        p2 = regex_engine.compile(r'LISP +RLOC +Membership +for +router +lisp'
+                                   r' +(?P<router_id>(\S+)) +IID +(?P<instance_id>(\d+))$')
 
         # Entries: 2 valid / 2 total, Distribution disabled
-        p3 = re.compile(r'Entries: +(?P<valid>(\d+)) +valid +\/'
-                         r' +(?P<total>(\d+)) +total, +Distribution'
-                         r' +(?P<distribution>(enabled|disabled))$')
+        p3 = regex_engine.compile(r'Entries: +(?P<valid>(\d+)) +valid +\/'
+                                   r' +(?P<total>(\d+)) +total, +Distribution'
+                                   r' +(?P<distribution>(enabled|disabled))$')
 
         # RLOC                    Origin                       Valid
         # 10.16.2.2               Registration                 Yes
         # 10:16:2:2::             Registration                 Yes
-        p4 = re.compile(r'(?P<member>([\d\.]+)|([a-fA-F\d\:]+)) +(?P<origin>(\S+))'
-                        r' +(?P<valid>(\S+))$')
+        p4 = regex_engine.compile(r'(?P<member>([\d\.]+)|([a-fA-F\d\:]+)) +(?P<origin>(\S+))'
+                                  r' +(?P<valid>(\S+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1160,20 +1161,20 @@ class ShowLispServiceSmr(ShowLispServiceSmrSchema):
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 193
         # Output for router lisp 2 instance-id 101
-        p1 = re.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))'
-                         r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))'
+                                   r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
 
         # LISP SMR Table for router lisp 0 (red) IID 101
-        p2 = re.compile(r'LISP +SMR +Table +for +router +lisp +(\d+)'
-                         r' +\((?P<vrf>(\S+))\) +IID +(?P<instance_id>(\S+))$')
+        p2 = regex_engine.compile(r'LISP +SMR +Table +for +router +lisp +(\d+)'
+                                   r' +\((?P<vrf>(\S+))\) +IID +(?P<instance_id>(\S+))$')
 
         # Entries: 1
-        p3 = re.compile(r'Entries: +(?P<entries>(\d+))$')
+        p3 = regex_engine.compile(r'Entries: +(?P<entries>(\d+))$')
 
         # Prefix                                  Producer
         # 192.168.0.0/24                          local EID
         # 192:168:0:0::/64                        local EID
-        p4 = re.compile(r'(?P<prefix>([\d\.\/]+)|([a-fA-F\d\:]+\/\d{1,3})) +(?P<producer>(.*))$')
+        p4 = regex_engine.compile(r'(?P<prefix>([\d\.\/]+)|([a-fA-F\d\:]+\/\d{1,3})) +(?P<producer>(.*))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1311,13 +1312,13 @@ class ShowLispServiceSummary(ShowLispServiceSummarySchema):
         parsed_dict = {}
 
         # Output for router lisp 0
-        p1 = re.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))$')
+        p1 = regex_engine.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))$')
 
         # Router-lisp ID:   0
-        p2 = re.compile(r'Router-lisp +ID: +(?P<router_id>(\S+))$')
+        p2 = regex_engine.compile(r'Router-lisp +ID: +(?P<router_id>(\S+))$')
 
         # Instance count:   2
-        p3 = re.compile(r'Instance +count: +(?P<val>(\d+))$')
+        p3 = regex_engine.compile(r'Instance +count: +(?P<val>(\d+))$')
 
         # Key: DB - Local EID Database entry count (@ - RLOC check pending
         #                                   * - RLOC consistency problem),
@@ -1331,45 +1332,45 @@ class ShowLispServiceSummary(ShowLispServiceSummarySchema):
         # blue                  LISP0.102     1      0      1   0.0%    0%  ITR-ETR
         # blue                  LISP0.102     1@     0      1   0.0%    0%  ITR-ETR
         # blue                  LISP0.102     1*     0      1   0.0%    0%  ITR-ETR
-        p4_1 = re.compile(r'(?P<vrf>(\S+)) +(?P<interface>(\S+))\.(?P<iid>(\d+))'
-                          r' +(?P<db_size>(\d+))(?P<rloc_status>(\W))? +(?P<db_no_route>(\d+))'
-                          r' +(?P<cache_size>(\d+)) +(?P<incomplete>(\S+))'
-                          r' +(?P<cache_idle>(\S+)) +(?P<role>(\S+))$')
+        p4_1 = regex_engine.compile(r'(?P<vrf>(\S+)) +(?P<interface>(\S+))\.(?P<iid>(\d+))'
+                                    r' +(?P<db_size>(\d+))(?P<rloc_status>(\W))? +(?P<db_no_route>(\d+))'
+                                    r' +(?P<cache_size>(\d+)) +(?P<incomplete>(\S+))'
+                                    r' +(?P<cache_idle>(\S+)) +(?P<role>(\S+))$')
 
-        p4_2 = re.compile(r'(?P<interface>(\S+))\.(?P<iid>(\d+))'
-                          r' +(?P<db_size>(\d+))(?P<rloc_status>(\W))? +(?P<db_no_route>(\d+))'
-                          r' +(?P<cache_size>(\d+)) +(?P<incomplete>(\S+))'
-                          r' +(?P<cache_idle>(\S+)) +(?P<role>(\S+))$')
+        p4_2 = regex_engine.compile(r'(?P<interface>(\S+))\.(?P<iid>(\d+))'
+                                    r' +(?P<db_size>(\d+))(?P<rloc_status>(\W))? +(?P<db_no_route>(\d+))'
+                                    r' +(?P<cache_size>(\d+)) +(?P<incomplete>(\S+))'
+                                    r' +(?P<cache_idle>(\S+)) +(?P<role>(\S+))$')
 
         # Number of eid-tables:                                 2
-        p5 = re.compile(r'Number +of +eid-tables: +(?P<val>(\d+))$')
+        p5 = regex_engine.compile(r'Number +of +eid-tables: +(?P<val>(\d+))$')
 
         # Total number of database entries:                     2 (inactive 0)
-        p6 = re.compile(r'Total +number +of +database +entries:'
-                        r' +(?P<val>(\d+))(?: +\(inactive'
-                        r' +(?P<inactive>(\d+))\))?$')
+        p6 = regex_engine.compile(r'Total +number +of +database +entries:'
+                                  r' +(?P<val>(\d+))(?: +\(inactive'
+                                  r' +(?P<inactive>(\d+))\))?$')
 
         # EID-tables with inconsistent locators:                0
-        p7 = re.compile(r'EID-tables +with +inconsistent +locators:'
-                        r' +(?P<val>(\d+))$')
+        p7 = regex_engine.compile(r'EID-tables +with +inconsistent +locators:'
+                                  r' +(?P<val>(\d+))$')
 
         # Total number of map-cache entries:                    3
-        p8 = re.compile(r'Total +number +of +map-cache +entries:'
-                        r' +(?P<val>(\d+))$')
+        p8 = regex_engine.compile(r'Total +number +of +map-cache +entries:'
+                                  r' +(?P<val>(\d+))$')
 
         # EID-tables with incomplete map-cache entries:         0
-        p9 = re.compile(r'EID-tables +with +incomplete +map-cache +entries:'
-                        r' +(?P<val>(\d+))$')
+        p9 = regex_engine.compile(r'EID-tables +with +incomplete +map-cache +entries:'
+                                  r' +(?P<val>(\d+))$')
 
         # EID-tables pending map-cache update to FIB:           0
-        p10 = re.compile(r'EID-tables +pending +map-cache +update +to +FIB:'
-                         r' +(?P<val>(\d+))$')
+        p10 = regex_engine.compile(r'EID-tables +pending +map-cache +update +to +FIB:'
+                                   r' +(?P<val>(\d+))$')
 
         # Maximum database entries:                        123456
-        p11 = re.compile(r'^Maximum database entries: +(?P<maximum_db_entries>\d+)$')
+        p11 = regex_engine.compile(r'^Maximum database entries: +(?P<maximum_db_entries>\d+)$')
 
         # Maximum map-cache entries:                       654321
-        p12 = re.compile(r'Maximum map-cache entries: +(?P<maximum_map_cache_entries>\d+)$')
+        p12 = regex_engine.compile(r'Maximum map-cache entries: +(?P<maximum_map_cache_entries>\d+)$')
 
         lisp_router_id = None
         for line in out.splitlines():
@@ -1622,41 +1623,41 @@ class ShowLispServiceServerSummary(ShowLispServiceServerSummarySchema):
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 193
         # Output for router lisp 2 instance-id 101
-        p1 = re.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))'
-                         r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))'
+                                   r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
 
         #                      -----------  IPv4 -----------
         #  Site name            Configured Registered Incons
         # xtr1_1                        1          1      0
         # xtr2                          1          1      0
-        p2 = re.compile(r'(?P<site_name>(\S+)) +(?P<cfgd>(\d+))'
-                         r' +(?P<registered>(\d+)) +(?P<incons>(\d+))$')
+        p2 = regex_engine.compile(r'(?P<site_name>(\S+)) +(?P<cfgd>(\d+))'
+                                   r' +(?P<registered>(\d+)) +(?P<incons>(\d+))$')
 
         # Number of configured sites:                     2
-        p3 = re.compile(r'Number +of +configured +sites: +(?P<val>(\d+))$')
+        p3 = regex_engine.compile(r'Number +of +configured +sites: +(?P<val>(\d+))$')
 
         # Number of registered sites:                     2
-        p4 = re.compile(r'Number +of +registered +sites: +(?P<val>(\d+))$')
+        p4 = regex_engine.compile(r'Number +of +registered +sites: +(?P<val>(\d+))$')
 
         # Number of configured EID prefixes:            2
-        p5 = re.compile(r'Number +of +configured +EID +prefixes:'
-                         r' +(?P<val>(\d+))$')
+        p5 = regex_engine.compile(r'Number +of +configured +EID +prefixes:'
+                                   r' +(?P<val>(\d+))$')
 
         # Number of registered EID prefixes:            2
-        p6 = re.compile(r'Number +of +registered +EID +prefixes:'
-                         r' +(?P<val>(\d+))$')
+        p6 = regex_engine.compile(r'Number +of +registered +EID +prefixes:'
+                                   r' +(?P<val>(\d+))$')
 
         # Site-registration limit for router lisp 2:            0
-        p7 = re.compile(r'Site-registration +limit +for +router +lisp'
-                         r' +(?P<router_id>(\d+)): +(?P<val>(\d+))$')
+        p7 = regex_engine.compile(r'Site-registration +limit +for +router +lisp'
+                                   r' +(?P<router_id>(\d+)): +(?P<val>(\d+))$')
 
         # Site-registration count for router lisp 2:            0
-        p8 = re.compile(r'Site-registration +count +for +router +lisp'
-                         r' +(?P<router_id>(\d+)): +(?P<val>(\d+))$')
+        p8 = regex_engine.compile(r'Site-registration +count +for +router +lisp'
+                                   r' +(?P<router_id>(\d+)): +(?P<val>(\d+))$')
 
         # Sites with inconsistent registrations:          0
-        p9 = re.compile(r'Sites +with +inconsistent +registrations:'
-                         r' +(?P<val>(\d+))$')
+        p9 = regex_engine.compile(r'Sites +with +inconsistent +registrations:'
+                                   r' +(?P<val>(\d+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1892,99 +1893,99 @@ class ShowLispServiceServerDetailInternal(ShowLispServiceServerDetailInternalSch
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 193
         # Output for router lisp 2 instance-id 101
-        p1 = re.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))'
-                         r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'Output +for +router +lisp +(?P<router_id>(\S+))'
+                                   r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
 
         # Site name: prov1
         # Site name: provider
-        p2 = re.compile(r'Site +name: +(?P<site_name>(\S+))$')
+        p2 = regex_engine.compile(r'Site +name: +(?P<site_name>(\S+))$')
 
         # Allowed configured locators: any
-        p3 = re.compile(r'Allowed +configured +locators: +(?P<val>(\S+))$')
+        p3 = regex_engine.compile(r'Allowed +configured +locators: +(?P<val>(\S+))$')
 
         # EID-prefix: 192.168.0.1/32 instance-id 101
-        p4 = re.compile(r'EID-prefix: +(?P<eid>(\S+)) +instance-id'
-                         r' +(?P<iid>(\d+))$')
+        p4 = regex_engine.compile(r'EID-prefix: +(?P<eid>(\S+)) +instance-id'
+                                   r' +(?P<iid>(\d+))$')
 
         # First registered:     01:12:41
-        p5 = re.compile(r'First +registered: +(?P<first>(\S+))$')
+        p5 = regex_engine.compile(r'First +registered: +(?P<first>(\S+))$')
 
         # Last registered:      01:12:41
-        p6 = re.compile(r'Last +registered: +(?P<last>(\S+))$')
+        p6 = regex_engine.compile(r'Last +registered: +(?P<last>(\S+))$')
 
         # Routing table tag:    0
-        p7 = re.compile(r'Routing +table +tag: +(?P<rtt>(\d+))$')
+        p7 = regex_engine.compile(r'Routing +table +tag: +(?P<rtt>(\d+))$')
 
         # Origin:               Dynamic, more specific of 192.168.0.0/24
-        p8_1 = re.compile(r'Origin: +(?P<origin>(\S+))(?:, +more +specific +of'
-                         r' +(\S+))?$')
+        p8_1 = regex_engine.compile(r'Origin: +(?P<origin>(\S+))(?:, +more +specific +of'
+                                   r' +(\S+))?$')
 
         # Origin:               Configuration, accepting more specifics
-        p8_2 = re.compile(r'Origin: +(?P<origin>(\S+))(?:,'
-                         r' +(?P<more_specific>(accepting more specifics)))?$')
+        p8_2 = regex_engine.compile(r'Origin: +(?P<origin>(\S+))(?:,'
+                                   r' +(?P<more_specific>(accepting more specifics)))?$')
 
         # Merge active:         No
-        p9 = re.compile(r'Merge +active: +(?P<merge>(Yes|No))$')
+        p9 = regex_engine.compile(r'Merge +active: +(?P<merge>(Yes|No))$')
 
         # Proxy reply:          Yes
-        p10 = re.compile(r'Proxy +reply: +(?P<proxy>(Yes|No))$')
+        p10 = regex_engine.compile(r'Proxy +reply: +(?P<proxy>(Yes|No))$')
 
         # TTL:                  1d00h
-        p11 = re.compile(r'TTL: +(?P<ttl>(\S+))$')
+        p11 = regex_engine.compile(r'TTL: +(?P<ttl>(\S+))$')
 
         # State:                complete
-        p12 = re.compile(r'State: +(?P<state>(\S+))$')
+        p12 = regex_engine.compile(r'State: +(?P<state>(\S+))$')
 
         # Registration errors:
         #  Authentication failures:   0
-        p13 = re.compile(r'Authentication +failures: +(?P<auth_failures>(\d+))$')
+        p13 = regex_engine.compile(r'Authentication +failures: +(?P<auth_failures>(\d+))$')
 
         # Allowed locators mismatch: 0
-        p14 = re.compile(r'Allowed +locators +mismatch: +(?P<mismatch>(\d+))$')
+        p14 = regex_engine.compile(r'Allowed +locators +mismatch: +(?P<mismatch>(\d+))$')
 
         # ETR 10.16.2.2, last registered 01:12:41, proxy-reply, map-notify
-        p15 = re.compile(r'ETR +(?P<etr>(\S+)), +last +registered'
-                          r' +(?P<last_registered>(\S+)),'
-                          r'(?: +(?P<proxy_reply>(proxy-reply)),)?'
-                          r'(?: +(?P<map_notify>(map-notify)))?$')
+        p15 = regex_engine.compile(r'ETR +(?P<etr>(\S+)), +last +registered'
+                                    r' +(?P<last_registered>(\S+)),'
+                                    r'(?: +(?P<proxy_reply>(proxy-reply)),)?'
+                                    r'(?: +(?P<map_notify>(map-notify)))?$')
 
         # TTL 1d00h, no merge, hash-function sha1, nonce 0x70D18EF4-0x3A605D67
-        p16 = re.compile(r'TTL +(?P<ttl>(\S+)),(?: +(?P<merge>(no merge)),)?'
-                          r' +hash-function +(?P<hash>(\S+)) +nonce'
-                          r' +(?P<nonce>(\S+))$')
+        p16 = regex_engine.compile(r'TTL +(?P<ttl>(\S+)),(?: +(?P<merge>(no merge)),)?'
+                                    r' +hash-function +(?P<hash>(\S+)) +nonce'
+                                    r' +(?P<nonce>(\S+))$')
 
         # state complete, no security-capability
-        p17 = re.compile(r'state +(?P<state>(\S+))'
-                          r'(?:, +(?P<security>(no security-capability)))?$')
+        p17 = regex_engine.compile(r'state +(?P<state>(\S+))'
+                                    r'(?:, +(?P<security>(no security-capability)))?$')
 
         # xTR-ID 0x21EDD25F-0x7598784C-0x769C8E4E-0xC04926EC
-        p18 = re.compile(r'xTR-ID +(?P<xtr_id>(.*))$')
+        p18 = regex_engine.compile(r'xTR-ID +(?P<xtr_id>(.*))$')
 
         # site-ID unspecified
-        p19 = re.compile(r'site-ID +(?P<site_id>(.*))$')
+        p19 = regex_engine.compile(r'site-ID +(?P<site_id>(.*))$')
 
         # sourced by reliable transport
-        p20 = re.compile(r'sourced +by +(?P<source>(.*))$')
+        p20 = regex_engine.compile(r'sourced +by +(?P<source>(.*))$')
 
         # Locator  Local  State      Pri/Wgt  Scope
         # 10.16.2.2 yes    up          50/50   IPv4 none
-        p21 = re.compile(r'(?P<locator>(\S+)) +(?P<local>(\S+))'
-                          r' +(?P<state>(\S+)) +(?P<priority>(\d+))\/'
-                          r'(?P<weight>(\d+)) +(?P<scope>(.*))$')
+        p21 = regex_engine.compile(r'(?P<locator>(\S+)) +(?P<local>(\S+))'
+                                    r' +(?P<state>(\S+)) +(?P<priority>(\d+))\/'
+                                    r'(?P<weight>(\d+)) +(?P<scope>(.*))$')
 
         # ETR 10.16.2.2
-        p22 = re.compile(r'ETR +(?P<etr>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$')
+        p22 = regex_engine.compile(r'ETR +(?P<etr>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$')
 
         # ETR 1000:1000:1000:1000:1000::
-        p23 = re.compile(r'ETR +(?P<etr>[a-fA-F\d\:]+)$')
+        p23 = regex_engine.compile(r'ETR +(?P<etr>[a-fA-F\d\:]+)$')
 
         # last registered 01:12:41, proxy-reply, map-notify
-        p24 = re.compile(r'last +registered +(?P<last_registered>(\S+)),'
-                          r'(?: +(?P<proxy_reply>(proxy-reply)),)'
-                          r'?(?: +(?P<map_notify>(map-notify)))?$')
+        p24 = regex_engine.compile(r'last +registered +(?P<last_registered>(\S+)),'
+                                    r'(?: +(?P<proxy_reply>(proxy-reply)),)'
+                                    r'?(?: +(?P<map_notify>(map-notify)))?$')
 
         # SGT: 10
-        p25 = re.compile(r'SGT:\s+(?P<sgt>\d+)$')
+        p25 = regex_engine.compile(r'SGT:\s+(?P<sgt>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2532,246 +2533,246 @@ class ShowLispServiceStatistics(ShowLispServiceStatisticsSchema):
 
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 101
-        p1 = re.compile(r'^Output for router lisp (?P<lisp_id>\d+)(\s+instance-id\s+\d+)?$')
+        p1 = regex_engine.compile(r'^Output for router lisp (?P<lisp_id>\d+)(\s+instance-id\s+\d+)?$')
 
         # LISP EID Statistics for all EID instances - last cleared: never
-        p2 = re.compile(r'^LISP EID Statistics for all EID instances - last cleared: (?P<last_cleared>\S+)$')
+        p2 = regex_engine.compile(r'^LISP EID Statistics for all EID instances - last cleared: (?P<last_cleared>\S+)$')
 
         # Map-Requests in/out:                              1/24
-        p3 = re.compile(r'^Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p3 = regex_engine.compile(r'^Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Requests in (5 sec/1 min/5 min):            0/0/0
-        p4 = re.compile(r'^Map-Requests in \(5 sec\/1 min\/5 min\):\s+(?P<sec>\d+)\/(?P<min1>\d+)\/(?P<min5>\d+)$')
+        p4 = regex_engine.compile(r'^Map-Requests in \(5 sec\/1 min\/5 min\):\s+(?P<sec>\d+)\/(?P<min1>\d+)\/(?P<min5>\d+)$')
 
         # Encapsulated Map-Requests in/out:               0/23
-        p5 = re.compile(r'^Encapsulated Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p5 = regex_engine.compile(r'^Encapsulated Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # RLOC-probe Map-Requests in/out:                 1/1
-        p6 = re.compile(r'^RLOC-probe Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
+        p6 = regex_engine.compile(r'^RLOC-probe Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
 
         # SMR-based Map-Requests in/out:                  0/0
-        p7 = re.compile(r'^SMR-based Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p7 = regex_engine.compile(r'^SMR-based Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Extranet SMR cross-IID Map-Requests in:         0
-        p8 = re.compile(r'^Extranet SMR cross-IID Map-Requests in:\s+(?P<in>\d+)$')
+        p8 = regex_engine.compile(r'^Extranet SMR cross-IID Map-Requests in:\s+(?P<in>\d+)$')
 
         # Map-Requests expired on-queue/no-reply          0/3
-        p9 = re.compile(r'^Map-Requests expired on-queue\/no-reply\s+(?P<on_queue>\d+)\/(?P<no_reply>\d+)$')
+        p9 = regex_engine.compile(r'^Map-Requests expired on-queue\/no-reply\s+(?P<on_queue>\d+)\/(?P<no_reply>\d+)$')
 
         # Map-Resolver Map-Requests forwarded:            0
-        p10 = re.compile(r'^Map-Resolver Map-Requests forwarded:\s+(?P<map_resolver_forwarded>\d+)$')
+        p10 = regex_engine.compile(r'^Map-Resolver Map-Requests forwarded:\s+(?P<map_resolver_forwarded>\d+)$')
 
         # Map-Server Map-Requests forwarded:              0
-        p11 = re.compile(r'^Map-Server Map-Requests forwarded:\s+(?P<map_server_forwarded>\d+)$')
+        p11 = regex_engine.compile(r'^Map-Server Map-Requests forwarded:\s+(?P<map_server_forwarded>\d+)$')
 
         # Map-Reply records in/out:                         24/1
-        p12 = re.compile(r'^Map-Reply records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p12 = regex_engine.compile(r'^Map-Reply records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Authoritative records in/out:                   23/1
-        p13 = re.compile(r'^Authoritative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p13 = regex_engine.compile(r'^Authoritative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Non-authoritative records in/out:               1/0
-        p14 = re.compile(r'^Non-authoritative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p14 = regex_engine.compile(r'^Non-authoritative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Negative records in/out:                        22/0
-        p15 = re.compile(r'^Negative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p15 = regex_engine.compile(r'^Negative records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # RLOC-probe records in/out:                      1/1
-        p16 = re.compile(r'^RLOC-probe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p16 = regex_engine.compile(r'^RLOC-probe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Server Proxy-Reply records out:             0
-        p17 = re.compile(r'^Map-Server Proxy-Reply records out:\s+(?P<out>\d+)$')
+        p17 = regex_engine.compile(r'^Map-Server Proxy-Reply records out:\s+(?P<out>\d+)$')
 
         # WLC Map-Subscribe records in/out:                 0/2
-        p18 = re.compile(r'^WLC Map-Subscribe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p18 = regex_engine.compile(r'^WLC Map-Subscribe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Subscribe failures in/out:                  0/0
-        p19 = re.compile(r'^Map-Subscribe failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p19 = regex_engine.compile(r'^Map-Subscribe failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # WLC Map-Unsubscribe records in/out:               0/0
-        p20 = re.compile(r'^WLC Map-Unsubscribe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p20 = regex_engine.compile(r'^WLC Map-Unsubscribe records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Unsubscribe failures in/out:                0/0
-        p21 = re.compile(r'^Map-Unsubscribe failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p21 = regex_engine.compile(r'^Map-Unsubscribe failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Register records in/out:                      0/6
-        p22 = re.compile(r'^Map-Register records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p22 = regex_engine.compile(r'^Map-Register records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Registers in (5 sec/1 min/5 min):           0/0/0
-        p23 = re.compile(r'^Map-Registers in \(5 sec\/1 min\/5 min\):\s+(?P<sec_5>\d+)\/(?P<min_1>\d+)\/(?P<min_5>\d+)$')
+        p23 = regex_engine.compile(r'^Map-Registers in \(5 sec\/1 min\/5 min\):\s+(?P<sec_5>\d+)\/(?P<min_1>\d+)\/(?P<min_5>\d+)$')
 
         # Map-Server AF disabled:                         0
-        p24 = re.compile(r'^Map-Server AF disabled:\s+(?P<map_server_af_disabled>\d+)$')
+        p24 = regex_engine.compile(r'^Map-Server AF disabled:\s+(?P<map_server_af_disabled>\d+)$')
 
         # Not valid site eid prefix:                      0
-        p25 = re.compile(r'^Not valid site eid prefix:\s+(?P<not_valid_site_eid_prefix>\d+)$')
+        p25 = regex_engine.compile(r'^Not valid site eid prefix:\s+(?P<not_valid_site_eid_prefix>\d+)$')
 
         # Authentication failures:                        0
-        p26 = re.compile(r'^Authentication failures:\s+(?P<authentication_failures>\d+)$')
+        p26 = regex_engine.compile(r'^Authentication failures:\s+(?P<authentication_failures>\d+)$')
 
         # Disallowed locators:                            0
-        p27 = re.compile(r'^Disallowed locators:\s+(?P<disallowed_locators>\d+)$')
+        p27 = regex_engine.compile(r'^Disallowed locators:\s+(?P<disallowed_locators>\d+)$')
 
         # Miscellaneous:                                  0
-        p28 = re.compile(r'^Miscellaneous:\s+(?P<misc>\d+)$')
+        p28 = regex_engine.compile(r'^Miscellaneous:\s+(?P<misc>\d+)$')
 
         # WLC Map-Register records in/out:                  0/0
-        p29 = re.compile(r'^WLC Map-Register records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p29 = regex_engine.compile(r'^WLC Map-Register records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # WLC AP Map-Register in/out:                     0/0
-        p30 = re.compile(r'^WLC AP Map-Register in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p30 = regex_engine.compile(r'^WLC AP Map-Register in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # WLC Client Map-Register in/out:                 0/0
-        p31 = re.compile(r'^WLC Client Map-Register in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p31 = regex_engine.compile(r'^WLC Client Map-Register in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # WLC Map-Register failures in/out:               0/0
-        p32 = re.compile(r'^WLC Map-Register failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p32 = regex_engine.compile(r'^WLC Map-Register failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Notify records in/out:                        8/0
-        p33 = re.compile(r'^Map-Notify records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p33 = regex_engine.compile(r'^Map-Notify records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Authentication failures:                        0
-        p34 = re.compile(r'^Authentication failures:\s+(?P<authentication_failures>\d+)')
+        p34 = regex_engine.compile(r'^Authentication failures:\s+(?P<authentication_failures>\d+)')
 
         # WLC Map-Notify records in/out:                    0/0
-        p35 = re.compile(r'^WLC Map-Notify records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
+        p35 = regex_engine.compile(r'^WLC Map-Notify records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
 
         # WLC AP Map-Notify in/out:                       0/0
-        p36 = re.compile(r'^WLC AP Map-Notify in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
+        p36 = regex_engine.compile(r'^WLC AP Map-Notify in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
 
         # WLC Client Map-Notify in/out:                   0/0
-        p37 = re.compile(r'^WLC Client Map-Notify in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
+        p37 = regex_engine.compile(r'^WLC Client Map-Notify in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)')
 
         # WLC Map-Notify failures in/out:                 0/0
-        p38 = re.compile(r'^WLC Map-Notify failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p38 = regex_engine.compile(r'^WLC Map-Notify failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription Request records in/out:            0/4
-        p39 = re.compile(r'^Subscription Request records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p39 = regex_engine.compile(r'^Subscription Request records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # IID subscription requests in/out:             0/0
-        p40 = re.compile(r'^IID subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p40 = regex_engine.compile(r'^IID subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Pub-refresh subscription requests in/out:     0/0
-        p41 = re.compile(r'^Pub-refresh subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p41 = regex_engine.compile(r'^Pub-refresh subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Policy subscription requests in/out:          0/4
-        p42 = re.compile(r'^Policy subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p42 = regex_engine.compile(r'^Policy subscription requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription Request failures in/out:           0/0
-        p43 = re.compile(r'^Subscription Request failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p43 = regex_engine.compile(r'^Subscription Request failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription Status records in/out:             2/0
-        p44 = re.compile(r'^Subscription Status records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p44 = regex_engine.compile(r'^Subscription Status records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # End of Publication records in/out:            0/0
-        p45 = re.compile(r'^End of Publication records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p45 = regex_engine.compile(r'^End of Publication records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription rejected records in/out:         0/0
-        p46 = re.compile(r'^Subscription rejected records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p46 = regex_engine.compile(r'^Subscription rejected records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription removed records in/out:          0/0
-        p47 = re.compile(r'^Subscription removed records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p47 = regex_engine.compile(r'^Subscription removed records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Subscription Status failures in/out:            0/0
-        p48 = re.compile(r'^Subscription Status failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p48 = regex_engine.compile(r'^Subscription Status failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Solicit Subscription records in/out:            2/0
-        p49 = re.compile(r'^Solicit Subscription records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p49 = regex_engine.compile(r'^Solicit Subscription records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Solicit Subscription failures in/out:           0/0
-        p50 = re.compile(r'^Solicit Subscription failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p50 = regex_engine.compile(r'^Solicit Subscription failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Publication records in/out:                     0/0
-        p51 = re.compile(r'^Publication records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p51 = regex_engine.compile(r'^Publication records in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Publication failures in/out:                    0/0
-        p52 = re.compile(r'^Publication failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p52 = regex_engine.compile(r'^Publication failures in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Mapping record TTL alerts:                        0
-        p53 = re.compile(r'^Mapping record TTL alerts:\s+(?P<mapping_rec_ttl_alerts>\d+)$')
+        p53 = regex_engine.compile(r'^Mapping record TTL alerts:\s+(?P<mapping_rec_ttl_alerts>\d+)$')
 
         # Map-Request invalid source rloc drops:            0
-        p54 = re.compile(r'^Map-Request invalid source rloc drops:\s+(?P<map_request_invalid_source_rloc>\d+)$')
+        p54 = regex_engine.compile(r'^Map-Request invalid source rloc drops:\s+(?P<map_request_invalid_source_rloc>\d+)$')
 
         # Map-Register invalid source rloc drops:           0
-        p55 = re.compile(r'^Map-Register invalid source rloc drops:\s+(?P<map_register_invalid_source_rloc>\d+)$')
+        p55 = regex_engine.compile(r'^Map-Register invalid source rloc drops:\s+(?P<map_register_invalid_source_rloc>\d+)$')
 
         # DDT Requests failed:                              0
-        p56 = re.compile(r'^DDT Requests failed:\s+(?P<ddt_requests_failed>\d+)$')
+        p56 = regex_engine.compile(r'^DDT Requests failed:\s+(?P<ddt_requests_failed>\d+)$')
 
         # DDT ITR Map-Requests dropped:                     0 (nonce-collision: 0, bad-xTR-nonce: 0)
-        p57 = re.compile(r'^DDT ITR Map-Requests dropped:\s+(?P<dropped>\d+)\s+'
-                         r'\(nonce-collision:\s+(?P<nonce_collision>\d+), '
-                         r'bad-xTR-nonce:\s+(?P<bad_xtr_nonce>\d+)\)$')
+        p57 = regex_engine.compile(r'^DDT ITR Map-Requests dropped:\s+(?P<dropped>\d+)\s+'
+                                   r'\(nonce-collision:\s+(?P<nonce_collision>\d+), '
+                                   r'bad-xTR-nonce:\s+(?P<bad_xtr_nonce>\d+)\)$')
 
         # Cache entries created/deleted:                    10/8
-        p58 = re.compile(r'^Cache entries created\/deleted:\s+(?P<created>\d+)\/(?P<deleted>\d+)$')
+        p58 = regex_engine.compile(r'^Cache entries created\/deleted:\s+(?P<created>\d+)\/(?P<deleted>\d+)$')
 
         # NSF CEF replay entry count                        0
-        p59 = re.compile(r'^NSF CEF replay entry count\s+(?P<nsf_cef_replay_entry_count>\d+)$')
+        p59 = regex_engine.compile(r'^NSF CEF replay entry count\s+(?P<nsf_cef_replay_entry_count>\d+)$')
 
         # Number of rejected EID-prefixes due to limit:     0
-        p60 = re.compile(r'^Number of rejected EID-prefixes due to limit:\s+'
-                         r'(?P<rejected_eid_prefix_due_to_limit>\d+)$')
+        p60 = regex_engine.compile(r'^Number of rejected EID-prefixes due to limit:\s+'
+                                   r'(?P<rejected_eid_prefix_due_to_limit>\d+)$')
 
         # Number of data signals processed:                 2 (+ dropped 0)
-        p61 = re.compile(r'^Number of data signals processed:\s+'
-                         r'(?P<processed>\d+)\s+\(\+\s+dropped\s(?P<dropped>\d+)\)$')
+        p61 = regex_engine.compile(r'^Number of data signals processed:\s+'
+                                   r'(?P<processed>\d+)\s+\(\+\s+dropped\s(?P<dropped>\d+)\)$')
 
         # Number of reachability reports:                   0 (+ dropped 0)
-        p62 = re.compile(r'^Number of reachability reports:\s+'
-                         r'(?P<count>\d+)\s+\(\+\s+dropped\s(?P<dropped>\d+)\)$')
+        p62 = regex_engine.compile(r'^Number of reachability reports:\s+'
+                                   r'(?P<count>\d+)\s+\(\+\s+dropped\s(?P<dropped>\d+)\)$')
 
         # Number of SMR signals dropped:                    0
-        p63 = re.compile(r'^Number of SMR signals dropped:\s+(?P<dropped>\d+)$')
+        p63 = regex_engine.compile(r'^Number of SMR signals dropped:\s+(?P<dropped>\d+)$')
 
         # LISP RLOC Statistics - last cleared: never
-        p64 = re.compile(r'^LISP RLOC Statistics - last cleared:\s(?P<last_cleared>\S+)$')
+        p64 = regex_engine.compile(r'^LISP RLOC Statistics - last cleared:\s(?P<last_cleared>\S+)$')
 
         # RTR Map-Requests forwarded:                       0
-        p65 = re.compile(r'^RTR Map-Requests forwarded:\s+(?P<map_requests_forwarded>\d+)$')
+        p65 = regex_engine.compile(r'^RTR Map-Requests forwarded:\s+(?P<map_requests_forwarded>\d+)$')
 
         # RTR Map-Notifies forwarded:                       0
-        p66 = re.compile(r'^RTR Map-Notifies forwarded:\s+(?P<map_notifies_forwarded>\d+)$')
+        p66 = regex_engine.compile(r'^RTR Map-Notifies forwarded:\s+(?P<map_notifies_forwarded>\d+)$')
 
         # DDT-Map-Requests in/out:                          0/0
-        p67 = re.compile(r'^DDT-Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p67 = regex_engine.compile(r'^DDT-Map-Requests in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # DDT-Map-Referrals in/out:                         0/0
-        p68 = re.compile(r'^DDT-Map-Referrals in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
+        p68 = regex_engine.compile(r'^DDT-Map-Referrals in\/out:\s+(?P<in>\d+)\/(?P<out>\d+)$')
 
         # Map-Request format errors:                        0
-        p69 = re.compile(r'^Map-Request format errors:\s+(?P<map_request_format>\d+)$')
+        p69 = regex_engine.compile(r'^Map-Request format errors:\s+(?P<map_request_format>\d+)$')
 
         # Map-Reply format errors:                          0
-        p70 = re.compile(r'^Map-Reply format errors:\s+(?P<map_reply_format>\d+)$')
+        p70 = regex_engine.compile(r'^Map-Reply format errors:\s+(?P<map_reply_format>\d+)$')
 
         # Map-Referral format errors:                       0
-        p71 = re.compile(r'^Map-Referral format errors:\s+(?P<map_referral>\d+)$')
+        p71 = regex_engine.compile(r'^Map-Referral format errors:\s+(?P<map_referral>\d+)$')
 
         # Invalid IP version drops:                         0
-        p72 = re.compile(r'^Invalid IP version drops:\s+(?P<ip_version_drops>\d+)$')
+        p72 = regex_engine.compile(r'^Invalid IP version drops:\s+(?P<ip_version_drops>\d+)$')
 
         # Invalid IP header drops:                          0
-        p73 = re.compile(r'^Invalid IP header drops:\s+(?P<ip_header_drops>\d+)$')
+        p73 = regex_engine.compile(r'^Invalid IP header drops:\s+(?P<ip_header_drops>\d+)$')
 
         # Invalid IP proto field drops:                     0
-        p74 = re.compile(r'^Invalid IP proto field drops:\s+(?P<ip_proto_field_drops>\d+)$')
+        p74 = regex_engine.compile(r'^Invalid IP proto field drops:\s+(?P<ip_proto_field_drops>\d+)$')
 
         # Invalid packet size drops:                        0
-        p75 = re.compile(r'^Invalid packet size drops:\s+(?P<packet_size_drops>\d+)$')
+        p75 = regex_engine.compile(r'^Invalid packet size drops:\s+(?P<packet_size_drops>\d+)$')
 
         # Invalid LISP control port drops:                  0
-        p76 = re.compile(r'^Invalid LISP control port drops:\s+(?P<lisp_control_port_drops>\d+)$')
+        p76 = regex_engine.compile(r'^Invalid LISP control port drops:\s+(?P<lisp_control_port_drops>\d+)$')
 
         # Invalid LISP checksum drops:                      0
-        p77 = re.compile(r'^Invalid LISP checksum drops:\s+(?P<lisp_checksum_drops>\d+)$')
+        p77 = regex_engine.compile(r'^Invalid LISP checksum drops:\s+(?P<lisp_checksum_drops>\d+)$')
 
         # Unsupported LISP packet type drops:               0
-        p78 = re.compile(r'^Unsupported LISP packet type drops:\s+(?P<unsupported_lisp_packet_drops>\d+)$')
+        p78 = regex_engine.compile(r'^Unsupported LISP packet type drops:\s+(?P<unsupported_lisp_packet_drops>\d+)$')
 
         # Unknown packet drops:                             0
-        p79 = re.compile(r'^Unknown packet drops:\s+(?P<unknown_packet_drops>\d+)$')
+        p79 = regex_engine.compile(r'^Unknown packet drops:\s+(?P<unknown_packet_drops>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
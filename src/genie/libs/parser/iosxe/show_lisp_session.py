@@ -6,15 +6,13 @@
 """
 
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
                                                 ListOf,
                                                 Optional,
                                                 Or)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.libs.parser.iosxe.show_lisp_super import *
@@ -99,13 +97,13 @@ class ShowLispSessionRedundancy(ShowLispSessionRedundancySchema):
         lisp_dict = {}
 
         #  Passive sessions
-        p1 = re.compile(r"^Passive sessions$")
+        p1 = regex_engine.compile(r"^Passive sessions$")
 
         #  Listeners
-        p2 = re.compile(r"^Listeners$")
+        p2 = regex_engine.compile(r"^Listeners$")
 
         #    Synced/pending TCP action/pending checkpoint: 7/0/3
-        p3 = re.compile(r"^Synced\/pending\sTCP\saction\/pending\scheckpoint:\s(?P<synced>\d+)\/(?P<pending_tcp_action>\d+)\/(?P<pending_checkpoints>\d+)$")
+        p3 = regex_engine.compile(r"^Synced\/pending\sTCP\saction\/pending\scheckpoint:\s(?P<synced>\d+)\/(?P<pending_tcp_action>\d+)\/(?P<pending_checkpoints>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -175,13 +173,13 @@ class ShowLispSessionCapability(ShowLispSessionCapabilitySchema):
         ret_dict = {}
 
         #Output for router lisp vrf red
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+vrf\s+(?P<vrf>\S+)$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+vrf\s+(?P<vrf>\S+)$")
 
         #44.44.44.44:4342               0x1FF      0x1FF      1         0
         #44:44:44:44::.4342               0x1FF      0x1FF      1         0
-        p2 = re.compile(r"^(?P<peer>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:|\.)(?P<port>\d+)"
-                        r"\s+(?P<tx_flags>\S+)\s+(?P<rx_flags>\S+)\s+(?P<rx_count>\d+)"
-                        r"\s+(?P<err_count>\d+)$")
+        p2 = regex_engine.compile(r"^(?P<peer>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:|\.)(?P<port>\d+)"
+                                  r"\s+(?P<tx_flags>\S+)\s+(?P<rx_flags>\S+)\s+(?P<rx_count>\d+)"
+                                  r"\s+(?P<err_count>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -255,87 +253,87 @@ class ShowLispSessionCapabilityRLOC(ShowLispSessionCapabilityRLOCSchema):
         ret_dict = {}
 
         # Output for router lisp vrf red
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+vrf\s+(?P<vrf>\S+)$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+vrf\s+(?P<vrf>\S+)$")
 
         # Peer address:                 66.66.66.66:4342
         # Peer address:                 66:66:66:66::.4342
-        p2 = re.compile(r"^Peer\s+address:\s+(?P<peer_address>((\d{1,3}\.\d{1,3}"
-                        r"\.\d{1,3}\.\d{1,3}:)|([a-fA-F\d\:]+\.))(?P<peer_port>\d+))$")
+        p2 = regex_engine.compile(r"^Peer\s+address:\s+(?P<peer_address>((\d{1,3}\.\d{1,3}"
+                                  r"\.\d{1,3}\.\d{1,3}:)|([a-fA-F\d\:]+\.))(?P<peer_port>\d+))$")
 
         # Local address:                66.66.66.66:50383
         # Local address:                66:66:66:66::.50383
-        p3 = re.compile(r"^Local\s+address:\s+(?P<local_address>((\d{1,3}\.\d{1,3}"
-                        r"\.\d{1,3}\.\d{1,3}:)|([a-fA-F\d\:]+\.))(?P<local_port>\d+))$")
+        p3 = regex_engine.compile(r"^Local\s+address:\s+(?P<local_address>((\d{1,3}\.\d{1,3}"
+                                  r"\.\d{1,3}\.\d{1,3}:)|([a-fA-F\d\:]+\.))(?P<local_port>\d+))$")
 
         # Capability Exchange Complete: Yes
-        p4 = re.compile(r"^Capability\s+Exchange\s+Complete:\s+"
-                        r"(?P<capability_exchange_complete>\S+)$")
+        p4 = regex_engine.compile(r"^Capability\s+Exchange\s+Complete:\s+"
+                                  r"(?P<capability_exchange_complete>\S+)$")
 
         # Capability Sent:              0x000001FF
-        p5 = re.compile(r"^Capability\s+Sent:\s+(?P<capability_sent_bitmap>\S+)$")
+        p5 = regex_engine.compile(r"^Capability\s+Sent:\s+(?P<capability_sent_bitmap>\S+)$")
 
         # Publish-Subscribe Instance-ID
-        p6 = re.compile(r"^(?P<capability_sent>Publish-Subscribe\s+Instance-ID)$")
+        p6 = regex_engine.compile(r"^(?P<capability_sent>Publish-Subscribe\s+Instance-ID)$")
 
         # Domain-Info
-        p7 = re.compile(r"^(?P<Domain>Domain-Info)$")
+        p7 = regex_engine.compile(r"^(?P<Domain>Domain-Info)$")
 
         # Route-Tag
-        p8 = re.compile(r"^(?P<route>Route-Tag)$")
+        p8 = regex_engine.compile(r"^(?P<route>Route-Tag)$")
 
         # SGT
-        p9 = re.compile(r"^(?P<sgt>SGT)$")
+        p9 = regex_engine.compile(r"^(?P<sgt>SGT)$")
 
         # Default-originate
-        p10 = re.compile(r"^(?P<default>Default-originate)$")
+        p10 = regex_engine.compile(r"^(?P<default>Default-originate)$")
 
         # Service-registration
-        p11 = re.compile(r"^(?P<service>Service-registration)$")
+        p11 = regex_engine.compile(r"^(?P<service>Service-registration)$")
 
         # Extranet-policy-propagation
-        p12 = re.compile(r"^(?P<extranet>Extranet-policy-propagation)$")
+        p12 = regex_engine.compile(r"^(?P<extranet>Extranet-policy-propagation)$")
 
         # Default-ETR Route-metric
-        p13 = re.compile(r"^(?P<default_etr>Default-ETR Route-metric)$")
+        p13 = regex_engine.compile(r"^(?P<default_etr>Default-ETR Route-metric)$")
 
         # Unknown vendor type skip
-        p14 = re.compile(r"^(?P<unknown>Unknown\s+vendor\s+type\s+skip)$")
+        p14 = regex_engine.compile(r"^(?P<unknown>Unknown\s+vendor\s+type\s+skip)$")
 
         # Capability Received:              0x000001FF
-        p15 = re.compile(r"^Capability\s+Received:\s+(?P<capability_received_bitmap>\S+)$")
+        p15 = regex_engine.compile(r"^Capability\s+Received:\s+(?P<capability_received_bitmap>\S+)$")
 
         # Publish-Subscribe Instance-ID
-        p16 = re.compile(r"^(?P<capability_received>Publish-Subscribe\s+Instance-ID)$")
+        p16 = regex_engine.compile(r"^(?P<capability_received>Publish-Subscribe\s+Instance-ID)$")
 
         # Domain-Info
-        p17 = re.compile(r"^(?P<Domain_received>Domain-Info)$")
+        p17 = regex_engine.compile(r"^(?P<Domain_received>Domain-Info)$")
 
         # Route-Tag
-        p18 = re.compile(r"^(?P<route_received>Route-Tag)$")
+        p18 = regex_engine.compile(r"^(?P<route_received>Route-Tag)$")
 
         # SGT
-        p19 = re.compile(r"^(?P<sgt_received>SGT)$")
+        p19 = regex_engine.compile(r"^(?P<sgt_received>SGT)$")
 
         # Default-originate
-        p20 = re.compile(r"^(?P<default_received>Default-originate)$")
+        p20 = regex_engine.compile(r"^(?P<default_received>Default-originate)$")
 
         # Service-registration
-        p21 = re.compile(r"^(?P<service_received>Service-registration)$")
+        p21 = regex_engine.compile(r"^(?P<service_received>Service-registration)$")
 
         # Extranet-policy-propagation
-        p22 = re.compile(r"^(?P<extranet_received>Extranet-policy-propagation)$")
+        p22 = regex_engine.compile(r"^(?P<extranet_received>Extranet-policy-propagation)$")
 
         # Default-ETR Route-metric
-        p23 = re.compile(r"^(?P<default_etr_received>Default-ETR Route-metric)$")
+        p23 = regex_engine.compile(r"^(?P<default_etr_received>Default-ETR Route-metric)$")
 
         # Unknown vendor type skip
-        p24 = re.compile(r"^(?P<unknown_received>Unknown\s+vendor\s+type\s+skip)$")
+        p24 = regex_engine.compile(r"^(?P<unknown_received>Unknown\s+vendor\s+type\s+skip)$")
 
         # Receive count:                1
-        p25 = re.compile(r"^Receive\s+count:\s+(?P<rx_count>\d+)$")
+        p25 = regex_engine.compile(r"^Receive\s+count:\s+(?P<rx_count>\d+)$")
 
         # Error count:                  0
-        p26 = re.compile(r"^Error\s+count:\s+(?P<err_count>\d+)$")
+        p26 = regex_engine.compile(r"^Error\s+count:\s+(?P<err_count>\d+)$")
 
         count1 = 0
         count2 = 0
@@ -647,70 +645,70 @@ class ShowLispSessionRLOC(ShowLispSessionRLOCSchema):
         ret_dict = {}
 
         # Output for router lisp 0
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)$")
 
         # Peer address:     44.44.44.44:4342
         # Peer address:     44:44:44:44::.4342
-        p2 = re.compile(r"^Peer\s+address:\s+(?P<peer_addr>(\d{1,3}\.\d{1,3}\."
-                        r"\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:|\.)(?P<peer_port>\d+)$")
+        p2 = regex_engine.compile(r"^Peer\s+address:\s+(?P<peer_addr>(\d{1,3}\.\d{1,3}\."
+                                  r"\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:|\.)(?P<peer_port>\d+)$")
 
         # Local address:    11.11.11.11:61669
         # Local address:    11:11:11:11::.61669
-        p3 = re.compile(r"^Local\s+address:\s+(?P<local_address>(\d{1,3}\.\d{1,3}\."
-                        r"\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:|\.)(?P<local_port>\d+)$")
+        p3 = regex_engine.compile(r"^Local\s+address:\s+(?P<local_address>(\d{1,3}\.\d{1,3}\."
+                                  r"\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:|\.)(?P<local_port>\d+)$")
 
         # Session Type:     Active
-        p4 = re.compile(r"^Session\s+Type:\s+(?P<session_type>\S+)$")
+        p4 = regex_engine.compile(r"^Session\s+Type:\s+(?P<session_type>\S+)$")
 
         # Session State:    Up (4d23h)
-        p5 = re.compile(r"^Session\s+State:\s+(?P<session_state>\S+)\s+"
-                        r"(?P<session_state_time>\S+)$")
+        p5 = regex_engine.compile(r"^Session\s+State:\s+(?P<session_state>\S+)\s+"
+                                  r"(?P<session_state_time>\S+)$")
 
         # Session RTT:      0 ms  (4d23h)
-        p6 = re.compile(r"^Session\s+RTT:\s+(?P<session_rtt>\S+)\s+"
-                        r"ms\s+(?P<session_rtt_time>\S+)$")
+        p6 = regex_engine.compile(r"^Session\s+RTT:\s+(?P<session_rtt>\S+)\s+"
+                                  r"ms\s+(?P<session_rtt_time>\S+)$")
 
         # Messages in/out:  32/15
-        p7 = re.compile(r"^Messages in\/out:\s+(?P<messages_in>\d+)"
-                        r"\/(?P<messages_out>\d+)$")
+        p7 = regex_engine.compile(r"^Messages in\/out:\s+(?P<messages_in>\d+)"
+                                  r"\/(?P<messages_out>\d+)$")
 
         # Bytes in/out:     1606/1076
-        p8 = re.compile(r"^Bytes in\/out:\s+(?P<bytes_in>\d+)"
-                        r"\/(?P<bytes_out>\d+)$")
+        p8 = regex_engine.compile(r"^Bytes in\/out:\s+(?P<bytes_in>\d+)"
+                                  r"\/(?P<bytes_out>\d+)$")
 
         # Fatal errors:     0
-        p9 = re.compile(r"^Fatal\s+errors:\s+(?P<fatal_errors>\d+)$")
+        p9 = regex_engine.compile(r"^Fatal\s+errors:\s+(?P<fatal_errors>\d+)$")
 
         # Rcvd unsupported: 0
-        p10 = re.compile(r"^Rcvd\s+unsupported:\s+(?P<rcvd_unsupported>\d+)$")
+        p10 = regex_engine.compile(r"^Rcvd\s+unsupported:\s+(?P<rcvd_unsupported>\d+)$")
 
         # Rcvd invalid VRF: 0
-        p11 = re.compile(r"^Rcvd\s+invalid\s+VRF:\s+(?P<rcvd_invalid_vrf>\d+)$")
+        p11 = regex_engine.compile(r"^Rcvd\s+invalid\s+VRF:\s+(?P<rcvd_invalid_vrf>\d+)$")
 
         # Rcvd override:    0
-        p12 = re.compile(r"^Rcvd\s+override:\s+(?P<rcvd_override>\d+)$")
+        p12 = regex_engine.compile(r"^Rcvd\s+override:\s+(?P<rcvd_override>\d+)$")
 
         # Rcvd malformed:   0
-        p13 = re.compile(r"^Rcvd\s+malformed:\s+(?P<rcvd_malformed>\d+)$")
+        p13 = regex_engine.compile(r"^Rcvd\s+malformed:\s+(?P<rcvd_malformed>\d+)$")
 
         # Sent deferred:    1
-        p14 = re.compile(r"^Sent\s+deferred:\s+(?P<sent_defferred>\d+)$")
+        p14 = regex_engine.compile(r"^Sent\s+deferred:\s+(?P<sent_defferred>\d+)$")
 
         # SSO redundancy:   N/A
-        p15 = re.compile(r"^SSO\s+redundancy:\s+(?P<ssd_redundancy>\S+)$")
+        p15 = regex_engine.compile(r"^SSO\s+redundancy:\s+(?P<ssd_redundancy>\S+)$")
 
         #Auth Type:        TCP-Auth-Option, keychain:  kc1
-        p16 = re.compile(r"^Auth\s+Type:\s+(?P<auth_type>\S+)"
-                         r"(,\s+keychain:\s+(?P<keychain_name>\S+))?$")
+        p16 = regex_engine.compile(r"^Auth\s+Type:\s+(?P<auth_type>\S+)"
+                                   r"(,\s+keychain:\s+(?P<keychain_name>\S+))?$")
 
         # Users:            14
-        p17 = re.compile(r"^Users:\s+(?P<count>\S+)$")
+        p17 = regex_engine.compile(r"^Users:\s+(?P<count>\S+)$")
 
         # Pubsub subscriber         lisp 0 IID 101 AFI MAC                   2/0      Off
         # Capability Exchange       N/A                                      1/1      Unsubscribe IID Sent
-        p18 = re.compile(r"^(?P<type>[a-zA-Z]+(?:[\s.]+[a-zA-Z]+)*)\s+"
-                         r"(?P<id>[a-zA-Z\/]+(?:[\s.]+[\da-zA-Z]+)*)\s+"
-                         r"(?P<in>\d+)\/(?P<out>\d+)\s+(?P<state>[\S ]+)$")
+        p18 = regex_engine.compile(r"^(?P<type>[a-zA-Z]+(?:[\s.]+[a-zA-Z]+)*)\s+"
+                                   r"(?P<id>[a-zA-Z\/]+(?:[\s.]+[\da-zA-Z]+)*)\s+"
+                                   r"(?P<in>\d+)\/(?P<out>\d+)\s+(?P<state>[\S ]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -12,6 +12,7 @@ from genie.metaparser.util.schemaengine import (Any,
                                                 ListOf,
                                                 Optional,
                                                 Or)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -55,16 +56,16 @@ class ShowLispSessionSuperParser(ShowLispSessionSuperParserSchema):
         ret_dict = {}
 
         # Sessions for VRF default, total: 7, established: 4
-        p1 = re.compile(r'^Sessions\s+for\s+VRF\s+(?P<vrf>\S+),\s+'
-                        r'total:\s+(?P<total>\d+),\s+established:\s+'
-                        r'(?P<established>\d+)$')
+        p1 = regex_engine.compile(r'^Sessions\s+for\s+VRF\s+(?P<vrf>\S+),\s+'
+                                  r'total:\s+(?P<total>\d+),\s+established:\s+'
+                                  r'(?P<established>\d+)$')
 
         # 201.201.201.201:22400          Up         00:03:22       14/16    4      125
         # 2001:2001:2001:2001::.22400    Up         00:03:22       14/16    4      125
-        p2 = re.compile(r'^(?P<peers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))'
-                        r'((:|\.)(?P<port>\d+))?\s+(?P<state>\S+)\s+'
-                        r'(?P<time>\S+)\s+(?P<in>\d+)'
-                        r'\/(?P<out>\d+)\s+(?P<users>\d+)(\s+(?P<rtt>\d+))?$')
+        p2 = regex_engine.compile(r'^(?P<peers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))'
+                                  r'((:|\.)(?P<port>\d+))?\s+(?P<state>\S+)\s+'
+                                  r'(?P<time>\S+)\s+(?P<in>\d+)'
+                                  r'\/(?P<out>\d+)\s+(?P<users>\d+)(\s+(?P<rtt>\d+))?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -188,54 +189,54 @@ class ShowLispDatabaseSuperParser(ShowLispDatabaseSuperParserSchema):
         # LISP ETR IPv4 Mapping Database for EID-table default (IID 1), LSBs: 0x1
         # LISP ETR IPv4 Mapping Database for EID-table vrf INTERNAL (IID 4099), LSBs: 0x1
         # LISP ETR IPv6 Mapping Database for LISP 0 EID-table vrf red (IID 4100), LSBs: 0x1
-        p1 = re.compile(r'^LISP\s+ETR\s+(MAC|IPv6|IPv4)\s+Mapping\s+Database\s+for(\s+LISP\s+'
-                        r'(?P<lisp_id>\d+))?\s+EID-table\s+'
-                        r'(?P<eid_table>(vrf\s\w+)|(Vlan\s\d+)|default)\s+'
-                        r'\(IID\s(?P<instance_id>\d+)\),\sLSBs:\s(?P<lsb>\S+)$')
+        p1 = regex_engine.compile(r'^LISP\s+ETR\s+(MAC|IPv6|IPv4)\s+Mapping\s+Database\s+for(\s+LISP\s+'
+                                  r'(?P<lisp_id>\d+))?\s+EID-table\s+'
+                                  r'(?P<eid_table>(vrf\s\w+)|(Vlan\s\d+)|default)\s+'
+                                  r'\(IID\s(?P<instance_id>\d+)\),\sLSBs:\s(?P<lsb>\S+)$')
 
         # Entries total 2, no-route 0, inactive 0, do-not-register 1
-        p2 = re.compile(r'^Entries\s+total\s+(?P<total>\d+),\s+no-route\s+'
-                        r'(?P<no_route>\d),\s+inactive\s+(?P<inactive>\d+)'
-                        r'(,\s+do-not-register\s+(?P<do_not_register>\d+))?$')
+        p2 = regex_engine.compile(r'^Entries\s+total\s+(?P<total>\d+),\s+no-route\s+'
+                                  r'(?P<no_route>\d),\s+inactive\s+(?P<inactive>\d+)'
+                                  r'(,\s+do-not-register\s+(?P<do_not_register>\d+))?$')
 
         # aabb.cc00.c901/48, dynamic-eid Auto-L2-group-101, inherited from default locator-set RLOC *** NO ROUTE TO EID PREFIX ***
         # 21.2.1.0/24, import from publication, inherited from default locator-set set1, auto-discover-rlocs, proxy
-        p3 = re.compile(r'^(?P<eid>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}|'
-                        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+)(\/)?'
-                        r'(?P<mask>\d{1,3})(,\s)?'
-                        r'(?P<dbmap_src>route-import|import from [\w\s]+)?'
-                        r'(dynamic-eid\s+(?P<dynamic_eid>\S+))?'
-                        r'(,\s(?P<do_not_register>do\snot\sregister))?(,\sinherited\sfrom\sdefault\s+)?'
-                        r'((,\s)?locator-set\s(?P<locator_set>\S+))?'
-                        r'(,\s(?P<auto_discover_rlocs>auto-discover-rlocs))?'
-                        r'(\s\*\*\*\s(?P<no_route_to_prefix>NO ROUTE TO EID PREFIX)\s\*\*\*)?'
-                        r'(,\s(?P<proxy>proxy))?(,\s(?P<default>default-ETR))?$')
+        p3 = regex_engine.compile(r'^(?P<eid>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}|'
+                                  r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+)(\/)?'
+                                  r'(?P<mask>\d{1,3})(,\s)?'
+                                  r'(?P<dbmap_src>route-import|import from [\w\s]+)?'
+                                  r'(dynamic-eid\s+(?P<dynamic_eid>\S+))?'
+                                  r'(,\s(?P<do_not_register>do\snot\sregister))?(,\sinherited\sfrom\sdefault\s+)?'
+                                  r'((,\s)?locator-set\s(?P<locator_set>\S+))?'
+                                  r'(,\s(?P<auto_discover_rlocs>auto-discover-rlocs))?'
+                                  r'(\s\*\*\*\s(?P<no_route_to_prefix>NO ROUTE TO EID PREFIX)\s\*\*\*)?'
+                                  r'(,\s(?P<proxy>proxy))?(,\s(?P<default>default-ETR))?$')
 
         # Uptime: 1w3d, Last-change: 1w3d
-        p4 = re.compile(r'^Uptime:\s+(?P<uptime>\S+),\s+Last-change:\s+(?P<last_change>\S+)$')
+        p4 = regex_engine.compile(r'^Uptime:\s+(?P<uptime>\S+),\s+Last-change:\s+(?P<last_change>\S+)$')
 
         # Domain-ID: local
-        p5 = re.compile(r'^Domain-ID:\s+(?P<domain_id>\S+)$')
+        p5 = regex_engine.compile(r'^Domain-ID:\s+(?P<domain_id>\S+)$')
 
         # Service-Insertion: N/A
         # Service-Insertion: N/A (0)
-        p6 = re.compile(r'^Service-Insertion: (?P<service_insertion>[^\s]+)\s?(\((?P<service_insertion_id>\d+)\))?$')
+        p6 = regex_engine.compile(r'^Service-Insertion: (?P<service_insertion>[^\s]+)\s?(\((?P<service_insertion_id>\d+)\))?$')
 
         # SGT: 10
-        p7 = re.compile(r'^SGT:\s+(?P<sgt>\d+)$')
+        p7 = regex_engine.compile(r'^SGT:\s+(?P<sgt>\d+)$')
 
         # Publish-mode: no-extranet
         # Publish-mode: publish-extranet instance-id <id>
-        p7_1 = re.compile(r'^Publish-mode:\s+(?P<publish_mode>.+\S)')
+        p7_1 = regex_engine.compile(r'^Publish-mode:\s+(?P<publish_mode>.+\S)')
 
         # 11.11.11.11   10/10   cfg-intf   site-self, reachable
         # 11:11:11:11:: 10/10   cfg-intf   site-self, reachable
-        p8 = re.compile(r'^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))'
-                        r'\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<source>\S+)'
-                        r'\s+(?P<location>\S+),\s(?P<state>\S+)$')
+        p8 = regex_engine.compile(r'^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))'
+                                  r'\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<source>\S+)'
+                                  r'\s+(?P<location>\S+),\s(?P<state>\S+)$')
 
         # Affinity-id: 20 , 20
-        p9 = re.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
+        p9 = regex_engine.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
 
         lisp_id = "default"
 
@@ -414,27 +415,27 @@ class ShowLispSiteSuperParser(ShowLispSiteSuperParserSchema):
         ret_dict = {}
 
         # Output for router lisp 0
-        p1 = re.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)')
+        p1 = regex_engine.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)')
 
         # Site Name      Last      Up     Who Last             Inst     EID Prefix
         #                Register         Registered           ID
         # Shire          never     no     --                   0        1.1.1.0/24
         #                00:00:06  yes*#  11.11.11.11:29972    10       2001:DB8::2/128
-        p2 = re.compile(r'^((?P<site_name>\S+)\s+)?(?P<last_registered>\S+)\s+'
-                        r'(?P<up>yes|no)\*?#?\s+(?P<who_last_registered>\S+)\s+'
-                        r'(?P<instance_id>\d+)\s+(?P<eid_prefix>\d{1,3}\.'
-                        r'\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}'
-                        r'|any-mac|([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})$')
+        p2 = regex_engine.compile(r'^((?P<site_name>\S+)\s+)?(?P<last_registered>\S+)\s+'
+                                  r'(?P<up>yes|no)\*?#?\s+(?P<who_last_registered>\S+)\s+'
+                                  r'(?P<instance_id>\d+)\s+(?P<eid_prefix>\d{1,3}\.'
+                                  r'\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}'
+                                  r'|any-mac|([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})$')
 
         # Site Name      Last      Up     Who Last             Inst     EID Prefix
         #                Register         Registered           ID
         # Shire          00:00:06  yes*#  1000:1000:1000:1000:1000:1000:1000:1000
         #                                                      10       2001:DB8::2/128
-        p3_1 = re.compile(r'^((?P<site_name>\S+)\s+)?(?P<last_registered>\S+)\s+'
-                          r'(?P<up>yes|no)\*?#?\s+(?P<who_last_registered>\S+)$')
-        p3_2 = re.compile(r'^(?P<instance_id>\d+)\s+(?P<eid_prefix>\d{1,3}\.'
-                          r'\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}'
-                          r'|any-mac|([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})$')
+        p3_1 = regex_engine.compile(r'^((?P<site_name>\S+)\s+)?(?P<last_registered>\S+)\s+'
+                                    r'(?P<up>yes|no)\*?#?\s+(?P<who_last_registered>\S+)$')
+        p3_2 = regex_engine.compile(r'^(?P<instance_id>\d+)\s+(?P<eid_prefix>\d{1,3}\.'
+                                    r'\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}'
+                                    r'|any-mac|([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})$')
 
         current_prefix_dict = {}
         for line in output.splitlines():
@@ -621,37 +622,37 @@ class ShowLispDynamicEidSuperParser(ShowLispDynamicEidSchema):
 
         # LISP Dynamic EID Information for router 0, IID 4100, EID-table VRF "red"
         # LISP Dynamic EID Information for router 0, IID 4100
-        p1 = re.compile(r'^LISP +Dynamic +EID +Information +for +router\s+(?P<lisp_id>\d+),\s+IID\s+'
-                        r'(?P<instance_id>\d+)(, EID-table VRF\s+)?(?P<eid_table>.+)?$')
+        p1 = regex_engine.compile(r'^LISP +Dynamic +EID +Information +for +router\s+(?P<lisp_id>\d+),\s+IID\s+'
+                                  r'(?P<instance_id>\d+)(, EID-table VRF\s+)?(?P<eid_table>.+)?$')
 
         # Dynamic-EID name: 192_168_1_0
-        p2 = re.compile(r'^Dynamic-EID name:\s+(?P<dynamic_eids>.+)$')
+        p2 = regex_engine.compile(r'^Dynamic-EID name:\s+(?P<dynamic_eids>.+)$')
 
         # Database-mapping EID-prefix: 192.168.1.0/24, locator-set RLOC
-        p3 = re.compile(r'^Database-mapping +EID-prefix:\s+(?P<eid_prefix>[\d.:\/\w\-]+),'
-                        r'\s+locator-set\s+(?P<locator_set>.+)$')
+        p3 = regex_engine.compile(r'^Database-mapping +EID-prefix:\s+(?P<eid_prefix>[\d.:\/\w\-]+),'
+                                  r'\s+locator-set\s+(?P<locator_set>.+)$')
 
         # Map-Server(s): none configured, use global Map-Server
-        p4 = re.compile(r'^Map-Server\(s\):\s+(?P<map_servers>.+),.+$')
+        p4 = regex_engine.compile(r'^Map-Server\(s\):\s+(?P<map_servers>.+),.+$')
 
         # Map-Server(s): 1.1.1.1
         # Map-Server(s): 1:1:1:1::
-        p4_1 = re.compile(r'^Map-Server\(s\):\s+(?P<map_servers>(\d{1,3}\.\d{1,3}'
-                          r'\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))$')
+        p4_1 = regex_engine.compile(r'^Map-Server\(s\):\s+(?P<map_servers>(\d{1,3}\.\d{1,3}'
+                                    r'\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))$')
 
         # Number of roaming dynamic-EIDs discovered: 2
-        p5 = re.compile(r'^Number +of +roaming +dynamic-EIDs +discovered:'
-                        r'\s+(?P<num_of_dynamic_eid>\d+)$')
+        p5 = regex_engine.compile(r'^Number +of +roaming +dynamic-EIDs +discovered:'
+                                  r'\s+(?P<num_of_dynamic_eid>\d+)$')
 
         # Last dynamic-EID discovered: 192.168.1.1, 1d22h ago
-        p6 = re.compile(r'^Last +dynamic-EID +discovered:\s+(?P<last_dyn_eid>[\d.:\/\w\-]+),.+$')
+        p6 = regex_engine.compile(r'^Last +dynamic-EID +discovered:\s+(?P<last_dyn_eid>[\d.:\/\w\-]+),.+$')
 
         # 2001:192:168:1::1, Vlan101, uptime: 1d22h
-        p7 = re.compile(r'^(?P<eid>[\d.:\/\w\-]+),\s+(?P<interface>.+),\s+uptime:\s+(?P<uptime>.+)$')
+        p7 = regex_engine.compile(r'^(?P<eid>[\d.:\/\w\-]+),\s+(?P<interface>.+),\s+uptime:\s+(?P<uptime>.+)$')
 
         # last activity: never, discovered by: Device-tracking, do not register, no-roam
-        p8 = re.compile(r'^last +activity:\s+(?P<last_activity>.+),\s+discovered +by:'
-                        r'\s+(?P<discovered_by>([^,]+)).+$')
+        p8 = regex_engine.compile(r'^last +activity:\s+(?P<last_activity>.+),\s+discovered +by:'
+                                  r'\s+(?P<discovered_by>([^,]+)).+$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -820,13 +821,13 @@ class ShowLispRouteImportMapCacheSuperParser(ShowLispRouteImportMapCacheSchema):
 
         # LISP IPv4 imported routes for EID-table vrf blue (IID 102)
         # LISP IPv4 imported routes for LISP 1 EID-table vrf red (IID 105)
-        p1 = re.compile(r'LISP +IPv(?P<v4_v6>[4-6]) +imported +routes +for(\sLISP\s)?(?P<lisp_id>\d)? +EID-table(\svrf)? +(?P<vrf>.+) +\(+IID +(?P<instance_id>\d+)+\)$')
+        p1 = regex_engine.compile(r'LISP +IPv(?P<v4_v6>[4-6]) +imported +routes +for(\sLISP\s)?(?P<lisp_id>\d)? +EID-table(\svrf)? +(?P<vrf>.+) +\(+IID +(?P<instance_id>\d+)+\)$')
 
         # Config: 2, Entries: 1 (limit 5000)
-        p2 = re.compile(r'Config: +(?P<config>\d+), +Entries: +(?P<entries>\d+) +\(+limit+ (?P<limit>\d+)+\)$')
+        p2 = regex_engine.compile(r'Config: +(?P<config>\d+), +Entries: +(?P<entries>\d+) +\(+limit+ (?P<limit>\d+)+\)$')
 
         # 50.1.1.0/24               00:00:13  static                          installed
-        p3 = re.compile(r'(?P<eid>[\da-fA-F.:]+\/\d+\S+) +(?P<uptime>\S+) +(?P<source>.+\S+) +(?P<rloc>.+\S+)? +(?P<cached>none|installed|replaced|full\S+)+(?P<state>.+)?$')
+        p3 = regex_engine.compile(r'(?P<eid>[\da-fA-F.:]+\/\d+\S+) +(?P<uptime>\S+) +(?P<source>.+\S+) +(?P<rloc>.+\S+)? +(?P<cached>none|installed|replaced|full\S+)+(?P<state>.+)?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -941,12 +942,12 @@ class ShowLispEidAwaySuperParser(ShowLispEidAwaySchema):
     def cli(self, output=None):
         parsed_dict = {}
         # LISP Away Table for router lisp 0 (blue) IID 102
-        p1 = re.compile(r'^LISP +Away +Table +for +router +lisp (?P<lisp_id>\d+) +\((?P<vrf>.+)\) +IID +(?P<instance_id>\d+)$')
+        p1 = regex_engine.compile(r'^LISP +Away +Table +for +router +lisp (?P<lisp_id>\d+) +\((?P<vrf>.+)\) +IID +(?P<instance_id>\d+)$')
         # Entries: 1
-        p2 = re.compile(r'^Entries: +(?P<entries>\d+)$')
+        p2 = regex_engine.compile(r'^Entries: +(?P<entries>\d+)$')
         # 10.1.0.0/16                             dyn-eid                        4d20h
         # 192.168.1.0/24                          local EID                      00:23:50
-        p3 = re.compile(r'^(?P<eid_prefix>[\da-fA-F.:]+\S+) +(?P<producer>\w+\s\w+\,\s\w+\s\w+|\w+\s\w+|\w+\-\w+) +(?P<created>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<eid_prefix>[\da-fA-F.:]+\S+) +(?P<producer>\w+\s\w+\,\s\w+\s\w+|\w+\s\w+|\w+\-\w+) +(?P<created>\S+)$')
         for line in output.splitlines():
             line = line.strip()
 
@@ -1050,7 +1051,7 @@ class ShowLispPublisherSuperParser(ShowLispPublisherSchema):
             out = self.device.expect(
                 [r'Instance ID:\s+\S+'],
                 timeout=2).match_output
-            p0 = re.compile(r'^Instance ID:\s+(?P<instance_id>\d+)$')
+            p0 = regex_engine.compile(r'^Instance ID:\s+(?P<instance_id>\d+)$')
             group = p0.match(out)
             instance_id = int(group['instance_id'])
         else:
@@ -1063,17 +1064,17 @@ class ShowLispPublisherSuperParser(ShowLispPublisherSchema):
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 193
         # Output for router lisp 2 instance-id 101
-        p1 = re.compile(r'^Output +for +router +lisp +(?P<lisp_id>(\S+))'
-                        r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'^Output +for +router +lisp +(?P<lisp_id>(\S+))'
+                                  r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
 
         # 23.23.23.23                 ETR Map-Server not found   Down    T     Off
         # 23.23.23.23                 Unreachable                Down    L     Off
         # 23.23.23.23                 Reachable                  Up
         # 2001:199:199:199::199       ETR Map-Server             Down    S     Off
         # 101.101.101.101             No ETR MS                  Down    ?     Established
-        p2 = re.compile(r'^(?P<publisher_ip>[\da-fA-F\.:]+)\s+(?P<state>ETR Map-Server '
-                        r'not found|ETR Map-Server|Unreachable|Reachable|No ETR MS)\s+'
-                        r'(?P<session>\w+)\s+((?P<type>L|T|S|\?)\s+)?(?P<pubsub_state>.+)$')
+        p2 = regex_engine.compile(r'^(?P<publisher_ip>[\da-fA-F\.:]+)\s+(?P<state>ETR Map-Server '
+                                  r'not found|ETR Map-Server|Unreachable|Reachable|No ETR MS)\s+'
+                                  r'(?P<session>\w+)\s+((?P<type>L|T|S|\?)\s+)?(?P<pubsub_state>.+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1193,96 +1194,96 @@ class ShowLispPublicationPrefixSuperParser(ShowLispPublicationPrefixSchema):
         count = 0
 
         # Publication Information for LISP 0 EID-table vrf red (IID 4100)
-        p1 = re.compile(r"^Publication\s+Information\s+for\s+LISP\s+"
-                        r"(?P<lisp_id>\d+)\s+EID-table\s+vrf\s+\S+\s+"
-                        r"\(IID\s+(?P<instance_id>\d+)\)$")
+        p1 = regex_engine.compile(r"^Publication\s+Information\s+for\s+LISP\s+"
+                                  r"(?P<lisp_id>\d+)\s+EID-table\s+vrf\s+\S+\s+"
+                                  r"\(IID\s+(?P<instance_id>\d+)\)$")
 
         # EID-prefix: 192.168.1.71/32
         # EID-prefix: 2001:172:168:1::/64
-        p2 = re.compile(r"^EID-prefix:\s+(?P<eid_prefixes>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}"
-                        r"|[a-fA-F\d\:]+\/\d{1,3})|([a-fA-F\d\:]+\/\d{1,3}))$")
+        p2 = regex_engine.compile(r"^EID-prefix:\s+(?P<eid_prefixes>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}"
+                                  r"|[a-fA-F\d\:]+\/\d{1,3})|([a-fA-F\d\:]+\/\d{1,3}))$")
 
         # First published:      03:05:56
-        p3 = re.compile(r"^First\s+published:\s+(?P<first_published>\S+)$")
+        p3 = regex_engine.compile(r"^First\s+published:\s+(?P<first_published>\S+)$")
 
         # Last published:      03:05:56
-        p4 = re.compile(r"^Last\s+published:\s+(?P<last_published>\S+)$")
+        p4 = regex_engine.compile(r"^Last\s+published:\s+(?P<last_published>\S+)$")
 
         # State:                complete
-        p5 = re.compile(r"^State:\s+(?P<state>\S+)$")
+        p5 = regex_engine.compile(r"^State:\s+(?P<state>\S+)$")
 
         # Exported to:          map-cache
         # Exported to:          local-eid, map-cache
-        p6 = re.compile(r"^Exported\s+to:\s+(?P<exported_to>[\s\S]+)$")
+        p6 = regex_engine.compile(r"^Exported\s+to:\s+(?P<exported_to>[\s\S]+)$")
 
         # Publisher 100.100.100.100:4342, last published 16:02:47, TTL never
         # Publisher 2001:13:13:13::13.4342, last published 00:03:35, TTL never, Expires: never
-        p7 = re.compile(r"^Publisher\s+(?P<publishers>((\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})?"
-                        r"|([a-fA-F\d\:]+)))?\.?\:?(?P<port>\d+),\s+last\s+published\s+"
-                        r"(?P<last_published>\S+),\s+TTL\s+(?P<ttl>\w+)")
+        p7 = regex_engine.compile(r"^Publisher\s+(?P<publishers>((\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})?"
+                                  r"|([a-fA-F\d\:]+)))?\.?\:?(?P<port>\d+),\s+last\s+published\s+"
+                                  r"(?P<last_published>\S+),\s+TTL\s+(?P<ttl>\w+)")
 
         # publisher epoch 1, entry epoch 1
-        p8 = re.compile(r"^publisher\s+epoch\s+(?P<publisher_epoch>\d+),"
-                        r"\s+entry\s+epoch\s+(?P<entry_epoch>\d+)")
+        p8 = regex_engine.compile(r"^publisher\s+epoch\s+(?P<publisher_epoch>\d+),"
+                                  r"\s+entry\s+epoch\s+(?P<entry_epoch>\d+)")
 
         # entry-state complete
-        p9 = re.compile(r"^entry-state\s+(?P<entry_state>\S+)")
+        p9 = regex_engine.compile(r"^entry-state\s+(?P<entry_state>\S+)")
 
         # routing table tag 101
-        p10 = re.compile(r"^routing\s+table\s+tag\s+(?P<routing_tag>\d+)")
+        p10 = regex_engine.compile(r"^routing\s+table\s+tag\s+(?P<routing_tag>\d+)")
 
         # xTR-ID 0x790800FF-0x426D6D8E-0xC6C5F60C-0xB4386D22
-        p11 = re.compile(r"^xTR-ID\s+(?P<xtr_id>\S+)")
+        p11 = regex_engine.compile(r"^xTR-ID\s+(?P<xtr_id>\S+)")
 
         # site-ID unspecified
-        p12 = re.compile(r"^site-ID\s+(?P<site_id>\S+)")
+        p12 = regex_engine.compile(r"^site-ID\s+(?P<site_id>\S+)")
 
         # Domain-ID unset
-        p13 = re.compile(r"^Domain-ID\s+(?P<domain_id>\S+)")
+        p13 = regex_engine.compile(r"^Domain-ID\s+(?P<domain_id>\S+)")
 
         # Multihoming-ID unspecified
-        p14 = re.compile(r"^Multihoming-ID\s+(?P<multihoming_id>\S+)")
+        p14 = regex_engine.compile(r"^Multihoming-ID\s+(?P<multihoming_id>\S+)")
 
         # Publication-mode  no-extranet
-        p14_1 = re.compile(r'^Publish-mode\s+(?P<publish_mode>.+\S)')
+        p14_1 = regex_engine.compile(r'^Publish-mode\s+(?P<publish_mode>.+\S)')
 
         # Merge Locator Information
         # Locator        Pri/Wgt  State     Encap-IID  RDP-Len Src-Address
         # 100.88.88.88    20/90   up        -          0       100.77.77.77
         # 100::88:88:88   20/90   up        -          0       100.77.77.77
-        p15 = re.compile(r"^(?P<merged_locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+)\S+)\s+"
-                         r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)\s+"
-                         r"(?P<rdp_len>\d+)\s+(?P<src_add>\S+)$")
+        p15 = regex_engine.compile(r"^(?P<merged_locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+)\S+)\s+"
+                                   r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)\s+"
+                                   r"(?P<rdp_len>\d+)\s+(?P<src_add>\S+)$")
 
         # 100.88.88.88  100/50   up        -                   [-]
-        p16 = re.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                         r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)"
-                         r"\s+(?P<rdp>\[[ 0-9\-]+\])$")
+        p16 = regex_engine.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                   r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)"
+                                   r"\s+(?P<rdp>\[[ 0-9\-]+\])$")
 
         # 100.88.88.88  100/50   up        -                   1/1       44
         # 2001:2:2:2::2   50/50   up        -                  1/1       44
-        p17 = re.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                         r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)"
-                         r"|\s+(?P<domain_id>\d+)\/(?P<multihoming_id>\d+)\s+(?P<metric>\d+)")
+        p17 = regex_engine.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                   r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<state>\S+)\s+(?P<encap_iid>\S+)"
+                                   r"|\s+(?P<domain_id>\d+)\/(?P<multihoming_id>\d+)\s+(?P<metric>\d+)")
 
         # Affinity-id: 20 , 20
-        p18 = re.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
+        p18 = regex_engine.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
 
         # Instance ID:                              4100
-        p19 = re.compile(r"^\s+Instance\s+ID:\s+(?P<inst_id>\S+)")
+        p19 = regex_engine.compile(r"^\s+Instance\s+ID:\s+(?P<inst_id>\S+)")
 
         # Publisher 100.100.100.100:4342
-        p20 = re.compile(r"^Publisher\s+(?P<publishers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
-                        r":(?P<port>\d+)$")
+        p20 = regex_engine.compile(r"^Publisher\s+(?P<publishers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
+                                  r":(?P<port>\d+)$")
 
         # Publisher 100::100:100:100.4342
-        p21 = re.compile(r"^Publisher\s+(?P<publishers>[a-fA-F\d\:]+)\.(?P<port>\d+)$")
+        p21 = regex_engine.compile(r"^Publisher\s+(?P<publishers>[a-fA-F\d\:]+)\.(?P<port>\d+)$")
 
         # last published 16:02:47, TTL never
-        p22 = re.compile(r"^last\s+published\s+(?P<last_published>\S+),\s+TTL\s+(?P<ttl>\w+)")
+        p22 = regex_engine.compile(r"^last\s+published\s+(?P<last_published>\S+),\s+TTL\s+(?P<ttl>\w+)")
 
         # SGT 100
-        p23 = re.compile(r"^SGT\s+(?P<sgt>\d+)$")
+        p23 = regex_engine.compile(r"^SGT\s+(?P<sgt>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1648,7 +1649,7 @@ class ShowLispSubscriberSuperParser(ShowLispSubscriberSchema):
             out = self.device.expect(
                 [r'Instance ID:\s+\S+'],
                 timeout=2).match_output
-            p0 = re.compile(r'^Instance ID:\s+(?P<instance_id>\d+)$')
+            p0 = regex_engine.compile(r'^Instance ID:\s+(?P<instance_id>\d+)$')
             group = p0.match(out)
             instance_id = int(group['instance_id'])
         else:
@@ -1659,19 +1660,19 @@ class ShowLispSubscriberSuperParser(ShowLispSubscriberSchema):
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 193
         # Output for router lisp 2 instance-id 101
-        p1 = re.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>(\d+))'
-                        r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>(\d+))'
+                                  r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
 
         # Entries total 1
-        p2 = re.compile(r'^Entries\s+total\s+(?P<entries>\d+)$')
+        p2 = regex_engine.compile(r'^Entries\s+total\s+(?P<entries>\d+)$')
 
         # 66.66.66.66:54087         IID
         # 77.77.77.77:54123         IID
         # 100.110.110.110:45676     IID        200 , 10
         # 2001:10:10:10::10.49787   IID        -
-        p3 = re.compile(r'^(?P<subscriber_ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'
-                        r'|[a-fA-F\d\:]+):?\.?(?P<port>\d+)\s+(?P<type>\S+)'
-                        r'(\s+(?P<affinity_id_x>\d+))?(\s+,\s+(?P<affinity_id_y>\d+))?')
+        p3 = regex_engine.compile(r'^(?P<subscriber_ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'
+                                  r'|[a-fA-F\d\:]+):?\.?(?P<port>\d+)\s+(?P<type>\S+)'
+                                  r'(\s+(?P<affinity_id_x>\d+))?(\s+,\s+(?P<affinity_id_y>\d+))?')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1775,19 +1776,19 @@ class ShowLispSubscriptionSuperParser(ShowLispSubscriptionSchema):
         parsed_dict = {}
 
         # LISP EID Subscriptions for LISP 0 EID-table vrf red (IID 4100), 2 entries
-        p1 = re.compile(r"^LISP\s+EID\s+Subscriptions\s+for(\s+LISP\s+"
-                        r"(?P<lisp_id>\d+))?\s+EID-table\s+(vrf\s+|Vlan\s+)?(?P<eid_table>\S+)\s+"
-                        r"\(IID\s+(?P<instance_id>\d+)\),\s+(?P<entries>\d+)\s+entries$")
+        p1 = regex_engine.compile(r"^LISP\s+EID\s+Subscriptions\s+for(\s+LISP\s+"
+                                  r"(?P<lisp_id>\d+))?\s+EID-table\s+(vrf\s+|Vlan\s+)?(?P<eid_table>\S+)\s+"
+                                  r"\(IID\s+(?P<instance_id>\d+)\),\s+(?P<entries>\d+)\s+entries$")
 
         #Prefix                                  Source                         Created     Last Update
         #2.2.2.0/24                              remote-eid,eid-watch           00:01:58    00:01:58
         #172.168.0.0/16                          remote-eid                     20:53:49    20:53:49
         #aaaa.aaaa.aaaa/48                       remote-eid                     20:53:49    20:53:49
-        p2 = re.compile(r"^(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
-                        r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|"
-                        r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})\s+"
-                        r"(?P<source>\S+)\s+"
-                        r"(?P<created>\S+)\s+(?P<last_update>\S+)$")
+        p2 = regex_engine.compile(r"^(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
+                                  r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|"
+                                  r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})\s+"
+                                  r"(?P<source>\S+)\s+"
+                                  r"(?P<created>\S+)\s+(?P<last_update>\S+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1871,23 +1872,23 @@ class ShowLispSubscriptionPrefixSuperParser(ShowLispSubscriptionPrefixSchema):
         parsed_dict = {}
 
         # LISP EID Subscriptions for LISP 0 EID-table vrf red (IID 4100), 2 entries
-        p1 = re.compile(r"^LISP\s+EID\s+Subscriptions\s+for(\s+LISP\s+"
-                        r"(?P<lisp_id>\d+))?\s+EID-table\s+(vrf\s+|Vlan\s+)?(?P<eid_table>\S+)\s+"
-                        r"\(IID\s+(?P<instance_id>\d+)\),\s+(?P<entries>\d+)\s+entries$")
+        p1 = regex_engine.compile(r"^LISP\s+EID\s+Subscriptions\s+for(\s+LISP\s+"
+                                  r"(?P<lisp_id>\d+))?\s+EID-table\s+(vrf\s+|Vlan\s+)?(?P<eid_table>\S+)\s+"
+                                  r"\(IID\s+(?P<instance_id>\d+)\),\s+(?P<entries>\d+)\s+entries$")
 
         # 172.168.0.0/16, Uptime: 00:01:15, Last-change: 00:01:15
-        p2 = re.compile(r"^(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
-                        r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|"
-                        r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2}),\sUptime:\s+"
-                        r"(?P<up_time>\S+),\sLast-change:\s+(?P<last_change>\S+)$")
+        p2 = regex_engine.compile(r"^(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
+                                  r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|"
+                                  r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2}),\sUptime:\s+"
+                                  r"(?P<up_time>\S+),\sLast-change:\s+(?P<last_change>\S+)$")
 
         # Source: remote-eid
-        p3 = re.compile(r"^Source:\s+(?P<source>\S+)$")
+        p3 = regex_engine.compile(r"^Source:\s+(?P<source>\S+)$")
 
         # Map-server                              State
         # 100.44.44.44                            Subs Acked
         # 100.55.55.55                            Subs Acked
-        p4 = re.compile(r"^(?P<map_server>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<state>.+)")
+        p4 = regex_engine.compile(r"^(?P<map_server>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+(?P<state>.+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2024,85 +2025,85 @@ class ShowLispIpMapCachePrefixSuperParser(ShowLispIpMapCachePrefixSchema):
         # LISP IPv4 Mapping Cache for LISP 0 EID-table vrf red (IID 100), 3 entries
         # LISP IPv6 Mapping Cache for LISP 0 EID-table vrf red (IID 100), 3 entries
         # LISP IPv4 Mapping Cache for LISP 0 EID-table default (IID 10), 2 entries
-        p1 = re.compile(r"^LISP\s+(IPv4|IPv6|MAC)\s+Mapping\s+Cache\s+for(\s+LISP\s+"
-                        r"(?P<lisp_id>\d+))?\s+EID-table\s+(vrf\s+|Vlan\s+)?(?P<eid_table>\S+)\s+"
-                        r"\(IID\s+(?P<instance_id>\d+)\),\s+(?P<entries>\d+)\s+entries$")
+        p1 = regex_engine.compile(r"^LISP\s+(IPv4|IPv6|MAC)\s+Mapping\s+Cache\s+for(\s+LISP\s+"
+                                  r"(?P<lisp_id>\d+))?\s+EID-table\s+(vrf\s+|Vlan\s+)?(?P<eid_table>\S+)\s+"
+                                  r"\(IID\s+(?P<instance_id>\d+)\),\s+(?P<entries>\d+)\s+entries$")
 
         # 191.168.1.11/32, uptime: 02:26:35, expires: 21:33:24, via map-reply, self, complete, remote-to-site
         # 2001:194:168:1::72/128, uptime: 00:44:35, expires: 23:15:25, via map-reply, complete
         # 2001:194:168:1::72/128, uptime: 00:44:35, expires: 1d11h, via map-reply, complete
-        p2 = re.compile(r"^(?P<eid>[a-fA-F\d\:\.]+)\/(?P<mask>\d{1,3}),\s+uptime:\s+"
-                         r"(?P<uptime>\S+),\s+expires:\s+(?P<expires>(\d{2}:?){3}|never|(\dw\dd)|(\dd\d{1,2}h)),"
-                        r"\s+via\s+(?P<via>[-\w]+)(,\s+self)?(,\s+complete)?(,\s+unknown-eid-forward)?(,\s+"
-                        r"(?P<site>remote-to-site|local-to-site))?(,\s+\S+)?$")
+        p2 = regex_engine.compile(r"^(?P<eid>[a-fA-F\d\:\.]+)\/(?P<mask>\d{1,3}),\s+uptime:\s+"
+                                   r"(?P<uptime>\S+),\s+expires:\s+(?P<expires>(\d{2}:?){3}|never|(\dw\dd)|(\dd\d{1,2}h)),"
+                                  r"\s+via\s+(?P<via>[-\w]+)(,\s+self)?(,\s+complete)?(,\s+unknown-eid-forward)?(,\s+"
+                                  r"(?P<site>remote-to-site|local-to-site))?(,\s+\S+)?$")
 
         # Received mapping for 191.168.0.0/16
-        p3 = re.compile(r"^Received\s+mapping\s+for\s+"
-                        r"(?P<received_mapping>[a-fA-F\d\:\.]+\/\d{1,3})$")
+        p3 = regex_engine.compile(r"^Received\s+mapping\s+for\s+"
+                                  r"(?P<received_mapping>[a-fA-F\d\:\.]+\/\d{1,3})$")
 
         # SGT: 100
-        p4 = re.compile(r"^SGT:\s+(?P<sgt>\d+)$")
+        p4 = regex_engine.compile(r"^SGT:\s+(?P<sgt>\d+)$")
 
         # Sources: map-reply
         # Sources: map-reply, static-send-map-request
-        p5 = re.compile(r"^Sources:\s+(?P<sources>[\S\s]+)$")
+        p5 = regex_engine.compile(r"^Sources:\s+(?P<sources>[\S\s]+)$")
 
         # State: complete, last modified: 02:26:35, map-source: 10.10.10.101
         # State: unknown-eid-forward, last modified: 00:00:00, map-source: local
-        p6 = re.compile(r"^State:\s+(?P<state>\S+),\s+last\s+modified:\s+"
-                        r"(?P<last_modified>\d{1,2}:\d{2}:\d{2}),\s+map-source:\s+"
-                        r"(?P<map_source>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|\S+)$")
+        p6 = regex_engine.compile(r"^State:\s+(?P<state>\S+),\s+last\s+modified:\s+"
+                                  r"(?P<last_modified>\d{1,2}:\d{2}:\d{2}),\s+map-source:\s+"
+                                  r"(?P<map_source>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|\S+)$")
 
         # Exempt, Packets out: 146(14600 bytes) (~ 01:37:41 ago)
         # Active, Packets out: 2(1152 bytes), counters are not accurate (~ 00:01:05 ago)
-        p7 = re.compile(r"^(?P<activity>Idle|Active|Exempt),\s+Packets\s+out:\s+"
-                        r"(?P<packets_out>\d+)\((?P<packets_out_bytes>\d+)\s+bytes\)"
-                        r"(,\s+(?P<counters_not_accurate>counters are not accurate))?"
-                        r"(\s+\(\W+\d{1,2}:\d{2}:\d{2}\s+ago\))?$")
+        p7 = regex_engine.compile(r"^(?P<activity>Idle|Active|Exempt),\s+Packets\s+out:\s+"
+                                  r"(?P<packets_out>\d+)\((?P<packets_out_bytes>\d+)\s+bytes\)"
+                                  r"(,\s+(?P<counters_not_accurate>counters are not accurate))?"
+                                  r"(\s+\(\W+\d{1,2}:\d{2}:\d{2}\s+ago\))?$")
 
         # Negative cache entry, action: send-map-request
-        p8 = re.compile(r"^Negative\s+cache\s+entry,\s+action:\s+(?P<action>\S+)$")
+        p8 = regex_engine.compile(r"^Negative\s+cache\s+entry,\s+action:\s+(?P<action>\S+)$")
 
         # 101.101.101.101  02:26:35  up           1/100       -             1/2           -
         # 45.45.45.45  00:00:04  up, self    10/50   111                 3/3      0
-        p9 = re.compile(r"^(?P<locators>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+|[a-fA-F\d\.]+)\s+"
-                        r"(?P<uptime>\S+)\s+(?P<state>\S+)(,\s+self)?\s+"
-                        r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<encap_iid>\S+)|\s+"
-                        r"(?P<domain_id>\d+)\/(?P<multihome_id>\d+)\s+(?P<metric>\S+)$")
+        p9 = regex_engine.compile(r"^(?P<locators>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+|[a-fA-F\d\.]+)\s+"
+                                  r"(?P<uptime>\S+)\s+(?P<state>\S+)(,\s+self)?\s+"
+                                  r"(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<encap_iid>\S+)|\s+"
+                                  r"(?P<domain_id>\d+)\/(?P<multihome_id>\d+)\s+(?P<metric>\S+)$")
 
         # Last up-down state change:         02:26:35, state change count: 1
-        p10 = re.compile(r"^Last\s+up-down\s+state\s+change:\s+"
-                         r"(?P<state_change_time>\d{1,2}:\d{2}:\d{2}|\dw\dd),"
-                         r"\s+state\s+change\s+count:\s+(?P<state_change_count>\d+)$")
+        p10 = regex_engine.compile(r"^Last\s+up-down\s+state\s+change:\s+"
+                                   r"(?P<state_change_time>\d{1,2}:\d{2}:\d{2}|\dw\dd),"
+                                   r"\s+state\s+change\s+count:\s+(?P<state_change_count>\d+)$")
 
         # Last route reachability change:    02:26:35, state change count: 1
-        p11 = re.compile(r"^Last\s+route\s+reachability\s+change:\s+"
-                         r"(?P<route_reachability_change_time>\d{1,2}:\d{2}:\d{2}|\dw\dd|never),\s+"
-                         r"state\s+change\s+count:\s+(?P<route_reachability_change_count>\d+)$")
+        p11 = regex_engine.compile(r"^Last\s+route\s+reachability\s+change:\s+"
+                                   r"(?P<route_reachability_change_time>\d{1,2}:\d{2}:\d{2}|\dw\dd|never),\s+"
+                                   r"state\s+change\s+count:\s+(?P<route_reachability_change_count>\d+)$")
 
         # Last priority / weight change:     never/never
-        p12 = re.compile(r"^Last\s+priority\s+\/\s+weight\s+change:\s+"
-                         r"(?P<priority_change>\S+)\/(?P<weight_change>\S+)$")
+        p12 = regex_engine.compile(r"^Last\s+priority\s+\/\s+weight\s+change:\s+"
+                                   r"(?P<priority_change>\S+)\/(?P<weight_change>\S+)$")
 
         # RLOC route rejection reason:       reachability (minimum mask length check failed)
-        p13 = re.compile(r"^RLOC\s+route\s+rejection\s+reason:\s+"
-                         r"(?P<reject_reason>[\(\)\w\s-]+)$")
+        p13 = regex_engine.compile(r"^RLOC\s+route\s+rejection\s+reason:\s+"
+                                   r"(?P<reject_reason>[\(\)\w\s-]+)$")
 
         # Last RLOC-probe sent:            00:24:49 (rtt 1ms)
-        p14 = re.compile(r"^Last\s+RLOC-probe\s+sent:\s+"
-                         r"(?P<rloc_probe_sent>\d{2}:\d{2}:\d{2}\s+\(rtt\s+\d+ms\)|never)$")
+        p14 = regex_engine.compile(r"^Last\s+RLOC-probe\s+sent:\s+"
+                                   r"(?P<rloc_probe_sent>\d{2}:\d{2}:\d{2}\s+\(rtt\s+\d+ms\)|never)$")
 
         # Next RLOC-probe in:              00:47:14
-        p15 = re.compile(r"^Next\s+RLOC-probe\s+in:\s+"
-                         r"(?P<rloc_probe_in>\d{2}:\d{2}:\d{2})$")
+        p15 = regex_engine.compile(r"^Next\s+RLOC-probe\s+in:\s+"
+                                   r"(?P<rloc_probe_in>\d{2}:\d{2}:\d{2})$")
 
         # Latched to ITR-RLOC:             104.104.104.104
         # Latched to ITR-RLOC:             104:104:104:104::
-        p16 = re.compile(r"^Latched\s+to\s+ITR-RLOC:\s+"
-                         r"(?P<itr_rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))$")
+        p16 = regex_engine.compile(r"^Latched\s+to\s+ITR-RLOC:\s+"
+                                   r"(?P<itr_rloc>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))$")
 
         # Affinity-id: 20 , 20
-        p17 = re.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
+        p17 = regex_engine.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2411,139 +2412,139 @@ class ShowLispSiteDetailSuperParser(ShowLispSiteDetailSuperParserSchema):
         ret_dict = {}
 
         # Output for router lisp 0
-        p1 = re.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)$")
+        p1 = regex_engine.compile(r"^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>\d+)$")
 
         # Site name: Shire
-        p2 = re.compile(r"^Site\s+name:\s+(?P<site_name>\S+)$")
+        p2 = regex_engine.compile(r"^Site\s+name:\s+(?P<site_name>\S+)$")
 
         # EID-prefix: 1.1.1.0/24 instance-id 0
         # EID-prefix: 2001:192:168:1::1/64 instance-id 0
         # EID-prefix: aabb.cc00.c901/48 instance-id 101
         # EID-prefix: any-mac instance-id 101
-        p3 = re.compile(r"^EID-prefix:\s+(?P<eid_prefix>\d{1,3}\.\d{1,3}\."
-                        r"\d{1,3}\.\d{1,3}\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}"
-                        r"|([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,3}|any-mac)"
-                        r"\s+instance-id\s+(?P<instance_id>\d+)$")
+        p3 = regex_engine.compile(r"^EID-prefix:\s+(?P<eid_prefix>\d{1,3}\.\d{1,3}\."
+                                  r"\d{1,3}\.\d{1,3}\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}"
+                                  r"|([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{1,3}|any-mac)"
+                                  r"\s+instance-id\s+(?P<instance_id>\d+)$")
 
         # First registered:     never
         # First registered:     1d12h
-        p4 = re.compile(r"^First\s+registered:\s+"
-                        r"(?P<first_registered>\w+|\d{1,2}:\d{2}:\d{2}|\dw\dd|never)$")
+        p4 = regex_engine.compile(r"^First\s+registered:\s+"
+                                  r"(?P<first_registered>\w+|\d{1,2}:\d{2}:\d{2}|\dw\dd|never)$")
 
         # Last registered:      00:45:46
         # Last registered:      1d12h
-        p5 = re.compile(r"^Last\s+registered:\s+"
-                        r"(?P<last_registered>\w+|\d{1,2}:\d{2}:\d{2}|\dw\dd|never)$")
+        p5 = regex_engine.compile(r"^Last\s+registered:\s+"
+                                  r"(?P<last_registered>\w+|\d{1,2}:\d{2}:\d{2}|\dw\dd|never)$")
 
         # Routing table tag:    0
-        p6 = re.compile(r"^Routing\s+table\s+tag:\s+(?P<routing_table_tag>\d+)$")
+        p6 = regex_engine.compile(r"^Routing\s+table\s+tag:\s+(?P<routing_table_tag>\d+)$")
 
         # Origin:               Dynamic, more specific of 192.168.1.0/24
-        p7 = re.compile(r"^Origin:\s+(?P<origin>[\d:\.\/\w\s,\W]+)$")
+        p7 = regex_engine.compile(r"^Origin:\s+(?P<origin>[\d:\.\/\w\s,\W]+)$")
 
         # Merge active:         No
-        p8 = re.compile(r"^Merge\s+active:\s+(?P<merge_active>Yes|No)$")
+        p8 = regex_engine.compile(r"^Merge\s+active:\s+(?P<merge_active>Yes|No)$")
 
         # Proxy reply:          No
-        p9 = re.compile(r"^Proxy\s+reply:\s+(?P<proxy_reply>Yes|No)$")
+        p9 = regex_engine.compile(r"^Proxy\s+reply:\s+(?P<proxy_reply>Yes|No)$")
 
         # Skip Publication:     No
-        p10 = re.compile(r"^Skip\s+Publication:\s+(?P<skip_publication>Yes|No)$")
+        p10 = regex_engine.compile(r"^Skip\s+Publication:\s+(?P<skip_publication>Yes|No)$")
 
         # Force Withdraw:       No
-        p11 = re.compile(r"^Force\s+Withdraw:\s+(?P<force_withdraw>Yes|No)$")
+        p11 = regex_engine.compile(r"^Force\s+Withdraw:\s+(?P<force_withdraw>Yes|No)$")
 
         # TTL:                  00:00:00
-        p12 = re.compile(r"^TTL:\s+(?P<ttl>\S+)$")
+        p12 = regex_engine.compile(r"^TTL:\s+(?P<ttl>\S+)$")
 
         # State:                unknown
-        p13 = re.compile(r"^State:\s+(?P<state>\S+)$")
+        p13 = regex_engine.compile(r"^State:\s+(?P<state>\S+)$")
 
         # Extranet IID:         Unspecified
-        p14 = re.compile(r"^Extranet\s+IID:\s+(?P<extranet_iid>\S+)$")
+        p14 = regex_engine.compile(r"^Extranet\s+IID:\s+(?P<extranet_iid>\S+)$")
 
         # Publish-mode:         no-extranet
-        p14_1 = re.compile(r'^Publish-mode:\s+(?P<publish_mode>.+\S)')
+        p14_1 = regex_engine.compile(r'^Publish-mode:\s+(?P<publish_mode>.+\S)')
 
         # Authentication failures:   0
-        p15 = re.compile(r"^Authentication\s+failures:\s+(?P<authentication_failures>\d+)$")
+        p15 = regex_engine.compile(r"^Authentication\s+failures:\s+(?P<authentication_failures>\d+)$")
 
         # Allowed locators mismatch: 0
-        p16 = re.compile(r"^Allowed\s+locators\s+mismatch:\s+(?P<allowed_locators_mismatch>\d+)$")
+        p16 = regex_engine.compile(r"^Allowed\s+locators\s+mismatch:\s+(?P<allowed_locators_mismatch>\d+)$")
 
         # ETR 11.11.11.11:33079, last registered 00:45:46, proxy-reply, map-notify
         # ETR 100.99.99.99:34273, last registered 00:00:39, no proxy-reply, map-notify
         # ETR 11.11.11.11, last registered 00:45:46, proxy-reply, map-notify
         # ETR 172.19.1.68:51370, last registered 1d12h, proxy-reply, map-notify
-        p17 = re.compile(r"(^ETR\s+((?P<etrp>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+),|(?P<etr>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}),))"
-                         r"\s+last\s+registered\s+(?P<last_registered>\w+|\d{1,2}:\d{2}:\d{2}|\dw\dd),"
-                         r"\s+(?P<proxy_reply>[\S\s]+),\s+(?P<map_notify>map-notify)$")
+        p17 = regex_engine.compile(r"(^ETR\s+((?P<etrp>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+),|(?P<etr>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}),))"
+                                   r"\s+last\s+registered\s+(?P<last_registered>\w+|\d{1,2}:\d{2}:\d{2}|\dw\dd),"
+                                   r"\s+(?P<proxy_reply>[\S\s]+),\s+(?P<map_notify>map-notify)$")
 
         # TTL 1d00h, no merge, hash-function sha1, nonce 0x4536735E-0xE5D90458
         # TTL 1d00h, merge, hash-function sha1
-        p18 = re.compile(r"^TTL\s+(?P<ttl>\S+),\s+(no\s+)?merge,\s+"
-                         r"hash-function\s+sha1(,\s+nonce\s+(?P<nonce>\S+))?$")
+        p18 = regex_engine.compile(r"^TTL\s+(?P<ttl>\S+),\s+(no\s+)?merge,\s+"
+                                   r"hash-function\s+sha1(,\s+nonce\s+(?P<nonce>\S+))?$")
 
         # nonce 0x4536735E-0xE5D90458
-        p18_1 = re.compile(r"^nonce\s+(?P<nonce>\S+)$")
+        p18_1 = regex_engine.compile(r"^nonce\s+(?P<nonce>\S+)$")
 
         # state complete, no security-capability
-        p19 = re.compile(r"^state\s+(?P<state>\S+),\s+no\s+security-capability$")
+        p19 = regex_engine.compile(r"^state\s+(?P<state>\S+),\s+no\s+security-capability$")
 
         # xTR-ID 0xE52CBAD5-0x38D3485F-0x97DC3A75-0xC27B2130
-        p20 = re.compile(r"^xTR-ID\s+(?P<xtr_id>\S+)$")
+        p20 = regex_engine.compile(r"^xTR-ID\s+(?P<xtr_id>\S+)$")
 
         # Domain-ID local
-        p21 = re.compile(r"^Domain-ID\s+(?P<domain_id>local)$")
+        p21 = regex_engine.compile(r"^Domain-ID\s+(?P<domain_id>local)$")
 
         # Domain-ID '1'
-        p21_1 = re.compile(r"^Domain-ID\s+(?P<domain_id>\S+)$")
+        p21_1 = regex_engine.compile(r"^Domain-ID\s+(?P<domain_id>\S+)$")
 
         # Multihoming-ID unspecified
-        p22 = re.compile(r"^Multihoming-ID\s+(?P<multihoming_id>\S+)$")
+        p22 = regex_engine.compile(r"^Multihoming-ID\s+(?P<multihoming_id>\S+)$")
 
         # Affinity-id: 20 , 20
-        p22_1 = re.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
+        p22_1 = regex_engine.compile(r'^Affinity-id:\s+(?P<affinity_id_x>\d+)(\s+,\s+(?P<affinity_id_y>\d+))?$')
 
         # 22.22.22.22    yes    up          10/10   IPv4 none
         # 22:22:22:22::  yes    up          10/10   IPv4 none
         # 22:22:22:22::  yes    up          10/10   IPv6 none
-        p23 = re.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                         r"(?P<local>yes|no)\s+(?P<state>\S+)\s+(?P<priority>\d+)"
-                         r"\/(?P<weight>\d+)\s+(?P<scope>IPv4|IPv6)\snone$")
+        p23 = regex_engine.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                   r"(?P<local>yes|no)\s+(?P<state>\S+)\s+(?P<priority>\d+)"
+                                   r"\/(?P<weight>\d+)\s+(?P<scope>IPv4|IPv6)\snone$")
 
         # 22.22.22.22    yes    up          10/10   IPv4 none     [-]
         # 22:22:22:22::  yes    up          10/10   IPv6 none     [-]
-        p24 = re.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                         r"(?P<local>yes|no)\s+(?P<state>\S+)\s+(?P<priority>\d+)"
-                         r"\/(?P<weight>\d+)\s+(?P<scope>IPv4|IPv6)\snone\s+(?P<rdp>\[[ 0-9\-]+\])$")
+        p24 = regex_engine.compile(r"^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                   r"(?P<local>yes|no)\s+(?P<state>\S+)\s+(?P<priority>\d+)"
+                                   r"\/(?P<weight>\d+)\s+(?P<scope>IPv4|IPv6)\snone\s+(?P<rdp>\[[ 0-9\-]+\])$")
 
         # Merged locators
         #  Locator       Local  State      Pri/Wgt  Scope        Registering ETR          RDP
         #  100.99.99.99  yes    up          10/50   IPv4 none    100.99.99.99:30343       [-]
         #  A0:EE:EE::EE  yes    up          10/50   IPv6 none    A0:EE:EE::EE.30343       [-]
-        p25 = re.compile(r"^(?P<merged_locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
-                         r"(?P<local>yes|no)\s+(?P<state>\S+)\s+(?P<priority>\d+)"
-                         r"\/(?P<weight>\d+)\s+(?P<scope>IPv4|IPv6)\snone\s+"
-                         r"((?P<etrp>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+)|([a-fA-F\d\:]+\.\d+))|"
-                         r"(?P<etr>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+)))\s+"
-                         r"(?P<rdp>\[[ 0-9\-]+\])$")
+        p25 = regex_engine.compile(r"^(?P<merged_locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+"
+                                   r"(?P<local>yes|no)\s+(?P<state>\S+)\s+(?P<priority>\d+)"
+                                   r"\/(?P<weight>\d+)\s+(?P<scope>IPv4|IPv6)\snone\s+"
+                                   r"((?P<etrp>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+)|([a-fA-F\d\:]+\.\d+))|"
+                                   r"(?P<etr>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+)))\s+"
+                                   r"(?P<rdp>\[[ 0-9\-]+\])$")
 
         # ETR 11.11.11.11:33079
         # ETR 11.11.11.11
-        p26 = re.compile(r"(^ETR\s+((?P<etrp>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+)|"
-                         r"(?P<etr>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})))$")
+        p26 = regex_engine.compile(r"(^ETR\s+((?P<etrp>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+)|"
+                                   r"(?P<etr>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})))$")
 
         # ETR 100:99:99:99::
         # ETR 100:99:99:99::.34273
-        p27 = re.compile(r"(^ETR\s+((?P<etrp>[a-fA-F\d\:]+\.\d+)|(?P<etr>[a-fA-F\d\:]+)))$")
+        p27 = regex_engine.compile(r"(^ETR\s+((?P<etrp>[a-fA-F\d\:]+\.\d+)|(?P<etr>[a-fA-F\d\:]+)))$")
 
         # last registered 00:45:46, proxy-reply, map-notify
-        p28 = re.compile(r"last\s+registered\s+(?P<last_registered>\d{1,2}:\d{2}:\d{2}|\dw\dd),"
-                         r"\s+(?P<proxy_reply>[\S\s]+),\s+(?P<map_notify>map-notify)$")
+        p28 = regex_engine.compile(r"last\s+registered\s+(?P<last_registered>\d{1,2}:\d{2}:\d{2}|\dw\dd),"
+                                   r"\s+(?P<proxy_reply>[\S\s]+),\s+(?P<map_notify>map-notify)$")
 
         # SGT: 10
-        p29 = re.compile(r'SGT:\s+(?P<sgt>\d+)$')
+        p29 = regex_engine.compile(r'SGT:\s+(?P<sgt>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2984,36 +2985,36 @@ class ShowLispMapCacheSuperParser(ShowLispMapCacheSuperParserSchema):
         # LISP IPv4 Mapping Cache for LISP 0 EID-table vrf red (IID 4100), 5 entries
         # LISP IPv4 Mapping Cache for LISP 0 EID-table vrf NEW_VN (IID 4099), 3 entries
         # LISP IPv6 Mapping Cache for EID-table vrf red (IID 4100), 3 entries
-        p1 = re.compile(r'^LISP (IPv4|IPv6|MAC) Mapping Cache for(\s+LISP (?P<lisp_id>\d+))?\s+'
-                        r'EID-table\s+(?P<eid_table>[a-zA-Z0-9\s_]+)(\s+)?'
-                        r'\(IID\s+(?P<instance_id>\d+)\),\s+(?P<entries>\d+)\s+entries$')
+        p1 = regex_engine.compile(r'^LISP (IPv4|IPv6|MAC) Mapping Cache for(\s+LISP (?P<lisp_id>\d+))?\s+'
+                                  r'EID-table\s+(?P<eid_table>[a-zA-Z0-9\s_]+)(\s+)?'
+                                  r'\(IID\s+(?P<instance_id>\d+)\),\s+(?P<entries>\d+)\s+entries$')
 
         # 50.1.1.0/24, uptime: 2d09h, expires: 20:10:07, via map-reply, complete, local-to-site
         # aabb.cc00.ca00/48, uptime: 00:00:23, expires: 00:59:36, via map-reply, complete, local-to-site
-        p2 = re.compile(r'^(?P<eid_prefix>[a-fA-F\d\:]+\/\d{1,3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/'
-                        r'\d{1,2}|[a-fA-F\d\.]+\/\d{1,3}),\s+uptime:\s(?P<uptime>\S+),\sexpires:\s'
-                        r'(?P<expiry_time>\d{1,2}:\d{2}:\d{2}|never),\svia\s(?P<via>\S+)(,'
-                        r'\s(?P<map_reply_state>(complete|unknown-eid-forward|forward-native'
-                        r'|send-map-request|drop|incomplete)))?'
-                        r'(,\s(?P<site>local-to-site|remote-to-site))?$')
+        p2 = regex_engine.compile(r'^(?P<eid_prefix>[a-fA-F\d\:]+\/\d{1,3}|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/'
+                                  r'\d{1,2}|[a-fA-F\d\.]+\/\d{1,3}),\s+uptime:\s(?P<uptime>\S+),\sexpires:\s'
+                                  r'(?P<expiry_time>\d{1,2}:\d{2}:\d{2}|never),\svia\s(?P<via>\S+)(,'
+                                  r'\s(?P<map_reply_state>(complete|unknown-eid-forward|forward-native'
+                                  r'|send-map-request|drop|incomplete)))?'
+                                  r'(,\s(?P<site>local-to-site|remote-to-site))?$')
 
         # SGT: 10, software only
         # SGT: 10
-        p3 = re.compile(r'^(SGT: (?P<sgt>\d+))?(,\s)?(?P<map_cache_type>software only)?$')
+        p3 = regex_engine.compile(r'^(SGT: (?P<sgt>\d+))?(,\s)?(?P<map_cache_type>software only)?$')
 
         # action: send-map-request + Encapsulating to proxy ETR
         # Negative cache entry, action: send-map-request
-        p4 = re.compile(r'^(?P<negative_cache_entry>Negative cache entry,\s)?'
-                        r'action:\s(?P<action>(send-map-request\s\+\s'
-                        r'Encapsulating to proxy ETR)|send-map-request|forward-native)$')
+        p4 = regex_engine.compile(r'^(?P<negative_cache_entry>Negative cache entry,\s)?'
+                                  r'action:\s(?P<action>(send-map-request\s\+\s'
+                                  r'Encapsulating to proxy ETR)|send-map-request|forward-native)$')
 
         # 100.165.165.165  2d09h     up          10/10        4100
         # FE80::A8BB:CCFF:FE00:CA00  00:00:10  admin-down  255/0         -
         # 100.88.88.88  00:00:28  up         100/50        5000      -
         # 100.88.88.88  00:00:28  up, self   100/50        5000      -
-        p5 = re.compile(r'^(?P<locators>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+)\s+'
-                        r'(?P<uptime>\S+)\s+(?P<rloc_state>\S+.*\S)\s+(?P<priority>\d+)'
-                        r'\/(?P<weight>\d+)\s+(?P<encap_iid>\d+|-)(\s+(?P<metric>\d+|-))?$')
+        p5 = regex_engine.compile(r'^(?P<locators>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|[a-fA-F\d\:]+)\s+'
+                                  r'(?P<uptime>\S+)\s+(?P<rloc_state>\S+.*\S)\s+(?P<priority>\d+)'
+                                  r'\/(?P<weight>\d+)\s+(?P<encap_iid>\d+|-)(\s+(?P<metric>\d+|-))?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3182,20 +3183,20 @@ class ShowLispServerSubscriptionSuperParser(ShowLispServerSubscriptionSchema):
             lisp_id = int(lisp_id)
 
         # LISP EID Subscriptions for LISP 0 IID 4100, 2 entries
-        p1 = re.compile(r"^LISP\s+MS\s+EID\s+Subscriptions\s+for\s+LISP\s+"
-                        r"(?P<lisp_id>\d+)?\s+"
-                        r"IID\s+(?P<instance_id>\d+),\s+(?P<entries>\d+)\s+entries$")
+        p1 = regex_engine.compile(r"^LISP\s+MS\s+EID\s+Subscriptions\s+for\s+LISP\s+"
+                                  r"(?P<lisp_id>\d+)?\s+"
+                                  r"IID\s+(?P<instance_id>\d+),\s+(?P<entries>\d+)\s+entries$")
 
         #Prefix                                  Source                         Created     Last Update   Subscribers
         #2.2.2.0/24                              2.2.2.0/24                     21:01:12    never           2
         #172.168.0.0/16                          172.168.0.0/16                 20:53:14    never           1
-        p2 = re.compile(r"^(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
-                        r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|"
-                        r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})\s+"
-                        r"(?P<registration>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
-                        r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|Unattached|"
-                        r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})\s+"
-                        r"(?P<created>\S+)\s+(?P<last_update>\S+)\s+(?P<subscribers>\d+)$")
+        p2 = regex_engine.compile(r"^(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
+                                  r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|"
+                                  r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})\s+"
+                                  r"(?P<registration>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
+                                  r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|Unattached|"
+                                  r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})\s+"
+                                  r"(?P<created>\S+)\s+(?P<last_update>\S+)\s+(?P<subscribers>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3288,35 +3289,35 @@ class ShowLispServerSubscriptionPrefixSuperParser(ShowLispServerSubscriptionPref
         parsed_dict = {}
 
         # LISP MS EID Subscriptions for LISP 0 IID 4100, 1 entries
-        p1 = re.compile(r"^LISP\s+MS\s+EID\s+Subscriptions\s+for\s+LISP\s+"
-                        r"(?P<lisp_id>\d+)?\s+"
-                        r"IID\s+(?P<instance_id>\d+),\s+(?P<entries>\d+)\s+entries$")
+        p1 = regex_engine.compile(r"^LISP\s+MS\s+EID\s+Subscriptions\s+for\s+LISP\s+"
+                                  r"(?P<lisp_id>\d+)?\s+"
+                                  r"IID\s+(?P<instance_id>\d+),\s+(?P<entries>\d+)\s+entries$")
 
         # Eid Prefix: 172.168.0.0/16
-        p2 = re.compile(r"^Eid\s+Prefix:\s+(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
-                        r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|"
-                        r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})$")
+        p2 = regex_engine.compile(r"^Eid\s+Prefix:\s+(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
+                                  r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|"
+                                  r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})$")
 
         # First Subscribed: 00:00:55
-        p3 = re.compile(r"^First\s+Subscribed:\s+(?P<first_subscribed>\S+)$")
+        p3 = regex_engine.compile(r"^First\s+Subscribed:\s+(?P<first_subscribed>\S+)$")
 
         # Last Subscribed: 00:00:55
-        p4 = re.compile(r"^Last\s+Subscribed:\s+(?P<last_subscribed>\S+)$")
+        p4 = regex_engine.compile(r"^Last\s+Subscribed:\s+(?P<last_subscribed>\S+)$")
 
         # Registration: 172.168.0.0/16
-        p4_1 = re.compile(r"^Registration:\s+(?P<registration>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
-                        r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|Unattached|"
-                        r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})$")
+        p4_1 = regex_engine.compile(r"^Registration:\s+(?P<registration>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
+                                  r"\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3}|Unattached|"
+                                  r"([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}\/\d{2})$")
 
         # Subscriber 100.11.11.11:45646
-        p5 = re.compile(r'^Subscriber\s+(?P<subscriber>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:'
-                         r'|\.)(?P<port>\d+)$')
+        p5 = regex_engine.compile(r'^Subscriber\s+(?P<subscriber>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:'
+                                   r'|\.)(?P<port>\d+)$')
 
         # xTR-ID 0xE9BF16D9-0x3D747C14-0x96C3FEB8-0x4AF6C2CB
-        p6 = re.compile(r'^xTR-ID\s+(?P<xtr_id>\S+)$')
+        p6 = regex_engine.compile(r'^xTR-ID\s+(?P<xtr_id>\S+)$')
 
         # Subscriber Index: 5
-        p7 = re.compile(r'^Subscriber\s+Index:\s+(?P<subscriber_index>\d+)$')
+        p7 = regex_engine.compile(r'^Subscriber\s+Index:\s+(?P<subscriber_index>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3443,58 +3444,58 @@ class ShowLispPublicationConfigPropSuperParser(ShowLispPublicationConfigPropSupe
         ret_dict = {}
 
         # Publication Information for LISP 0 EID-table vrf internet (IID 5000)
-        p1 = re.compile(r'^Publication\s+Information\s+for\s+LISP\s+(?P<lisp_id>\d+)'
-                        r'\s+EID-table\s+(?P<eid_table>vrf\s+\S+)\s+'
-                        r'\(IID\s+(?P<instance_id>\d+)\)$')
+        p1 = regex_engine.compile(r'^Publication\s+Information\s+for\s+LISP\s+(?P<lisp_id>\d+)'
+                                  r'\s+EID-table\s+(?P<eid_table>vrf\s+\S+)\s+'
+                                  r'\(IID\s+(?P<instance_id>\d+)\)$')
 
         # EID-prefix: 51.51.0.0/16
-        p2 = re.compile(r'^EID-prefix:\s+(?P<eid>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|'
-                        r'([a-fA-F\d\:]+))\/(?P<mask>\d{1,3})$')
+        p2 = regex_engine.compile(r'^EID-prefix:\s+(?P<eid>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|'
+                                  r'([a-fA-F\d\:]+))\/(?P<mask>\d{1,3})$')
 
         # First published:      10:24:38
-        p3 = re.compile(r'^First\s+published:\s+(?P<first_published>never|\d{1,2}:\d{1,2}:\d{1,2})$')
+        p3 = regex_engine.compile(r'^First\s+published:\s+(?P<first_published>never|\d{1,2}:\d{1,2}:\d{1,2})$')
 
         # Last published:       10:24:36
-        p4 = re.compile(r'^Last\s+published:\s+(?P<last_published>never|\d{1,2}:\d{1,2}:\d{1,2})$')
+        p4 = regex_engine.compile(r'^Last\s+published:\s+(?P<last_published>never|\d{1,2}:\d{1,2}:\d{1,2})$')
 
         # Exported to:          local-eid
-        p5 = re.compile(r'^Exported\s+to:\s+(?P<exported_to>[\s\S]+)$')
+        p5 = regex_engine.compile(r'^Exported\s+to:\s+(?P<exported_to>[\s\S]+)$')
 
         # Publisher 100.77.77.77:4342, last published 00:03:39, TTL never, Expires: never
         # Publisher 100:77:77:77::.4342, last published 00:03:39, TTL never, Expires: never
-        p6 = re.compile(r'^Publisher\s+(?P<publishers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:'
-                        r'|\.)(?P<port>\d+),\s+last\s+published\s+(?P<last_published>\d{1,2}:\d{1,2}:\d{1,2}),'
-                        r'\s+TTL\s+(?P<ttl>\S+)\s+Expires:\s+'
-                        r'(?P<expires>\S+)$')
+        p6 = regex_engine.compile(r'^Publisher\s+(?P<publishers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:'
+                                  r'|\.)(?P<port>\d+),\s+last\s+published\s+(?P<last_published>\d{1,2}:\d{1,2}:\d{1,2}),'
+                                  r'\s+TTL\s+(?P<ttl>\S+)\s+Expires:\s+'
+                                  r'(?P<expires>\S+)$')
 
         # publisher epoch 0, entry epoch 0
-        p7 = re.compile(r"^publisher\s+epoch\s+(?P<publisher>\d+),"
-                        r"\s+entry\s+epoch\s+(?P<entry>\d+)")
+        p7 = regex_engine.compile(r"^publisher\s+epoch\s+(?P<publisher>\d+),"
+                                  r"\s+entry\s+epoch\s+(?P<entry>\d+)")
 
         # entry-state unknown
-        p8 = re.compile(r'^entry-state\s+(?P<entry_state>\S+)$')
+        p8 = regex_engine.compile(r'^entry-state\s+(?P<entry_state>\S+)$')
 
         # xTR-ID 0x790800FF-0x426D6D8E-0xC6C5F60C-0xB4386D22
-        p9 = re.compile(r'^xTR-ID\s+(?P<xtr_id>\S+)$')
+        p9 = regex_engine.compile(r'^xTR-ID\s+(?P<xtr_id>\S+)$')
 
         # Domain-ID unset
-        p10 = re.compile(r"^Domain-ID\s+(?P<domain_id>\S+)")
+        p10 = regex_engine.compile(r"^Domain-ID\s+(?P<domain_id>\S+)")
 
         # Multihoming-ID unspecified
-        p11 = re.compile(r"^Multihoming-ID\s+(?P<multihoming_id>\S+)")
+        p11 = regex_engine.compile(r"^Multihoming-ID\s+(?P<multihoming_id>\S+)")
 
         # Extranet-IID 4101
-        p12 = re.compile(r'^Extranet-IID\s+(?P<extranet_iid>\d+)$')
+        p12 = regex_engine.compile(r'^Extranet-IID\s+(?P<extranet_iid>\d+)$')
 
         # Publisher 100.77.77.77:4342
         # Publisher 100:77:77:77::.4342
-        p13 = re.compile(r'^Publisher\s+(?P<publishers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:'
-                         r'|\.)(?P<port>\d+)$')
+        p13 = regex_engine.compile(r'^Publisher\s+(?P<publishers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))(:'
+                                   r'|\.)(?P<port>\d+)$')
 
         # last published 00:03:39, TTL never, Expires: never
-        p14 = re.compile(r'^last\s+published\s+(?P<last_published>\d{1,2}:\d{1,2}:\d{1,2}),'
-                        r'\s+TTL\s+(?P<ttl>\S+)\s+Expires:\s+'
-                        r'(?P<expires>\S+)$')
+        p14 = regex_engine.compile(r'^last\s+published\s+(?P<last_published>\d{1,2}:\d{1,2}:\d{1,2}),'
+                                  r'\s+TTL\s+(?P<ttl>\S+)\s+Expires:\s+'
+                                  r'(?P<expires>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3707,44 +3708,44 @@ class ShowLispDatabaseConfigPropSuperParser(ShowLispDatabaseConfigPropSuperSchem
         ret_dict = {}
 
         # LISP ETR IPv4 Mapping Database for LISP 0 EID-table vrf internet (IID 5000), LSBs: 0x3
-        p1 = re.compile(r'^LISP\s+ETR\s+(IPv4|IPv6)\s+Mapping\s+Database\s+for\s+LISP\s+'
-                        r'(?P<lisp_id>\d+)\s+EID-table\s+(?P<eid_table>vrf\s+\S+)\s+'
-                        r'\(IID\s+(?P<instance_id>\d+)\),\s+LSBs:\s+(?P<lsb>\S+)$')
+        p1 = regex_engine.compile(r'^LISP\s+ETR\s+(IPv4|IPv6)\s+Mapping\s+Database\s+for\s+LISP\s+'
+                                  r'(?P<lisp_id>\d+)\s+EID-table\s+(?P<eid_table>vrf\s+\S+)\s+'
+                                  r'\(IID\s+(?P<instance_id>\d+)\),\s+LSBs:\s+(?P<lsb>\S+)$')
 
         # Entries total 7, no-route 0, inactive 0, do-not-register 0
-        p2 = re.compile(r'^Entries\s+total\s+(?P<entries>\d+),\s+no-route\s+'
-                        r'(?P<no_route>\d+),\s+inactive\s+(?P<inactive>\d+),\s+'
-                        r'do-not-register\s+(?P<do_not_register>\d+)$')
+        p2 = regex_engine.compile(r'^Entries\s+total\s+(?P<entries>\d+),\s+no-route\s+'
+                                  r'(?P<no_route>\d+),\s+inactive\s+(?P<inactive>\d+),\s+'
+                                  r'do-not-register\s+(?P<do_not_register>\d+)$')
 
         # 51.51.0.0/16, import from publication cfg prop, inherited from default locator-set RLOC, auto-discover-rlocs, proxy
         # 51.51.0.0/16, import from publication cfg prop, inherited from default locator-set DEFAULT-ETR-RLOC, auto-discover-rlocs, proxy
-        p3 = re.compile(r'^(?P<eid>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))'
-                        r'\/(?P<mask>\d{1,3})(,\s+import\s+from\s+(?P<import_from>\S+'
-                        r'|publication cfg prop))?(,\s+inherited\s+from\s+'
-                        r'(?P<inherited_from>default locator-set (RLOC|DEFAULT-ETR-RLOC)|\S+))?'
-                        r'(,\s+(?P<auto_disc_rloc>auto-discover-rlocs))?(,\s+(?P<proxy>proxy))?$')
+        p3 = regex_engine.compile(r'^(?P<eid>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))'
+                                  r'\/(?P<mask>\d{1,3})(,\s+import\s+from\s+(?P<import_from>\S+'
+                                  r'|publication cfg prop))?(,\s+inherited\s+from\s+'
+                                  r'(?P<inherited_from>default locator-set (RLOC|DEFAULT-ETR-RLOC)|\S+))?'
+                                  r'(,\s+(?P<auto_disc_rloc>auto-discover-rlocs))?(,\s+(?P<proxy>proxy))?$')
 
         # Uptime: 01:30:26, Last-change: 01:30:26
-        p4 = re.compile(r'^Uptime:\s+(?P<up_time>\d{1,2}:\d{1,2}:\d{1,2}),'
-                        r'\s+Last-change:\s+(?P<last_change>\d{1,2}:\d{1,2}:\d{1,2})$')
+        p4 = regex_engine.compile(r'^Uptime:\s+(?P<up_time>\d{1,2}:\d{1,2}:\d{1,2}),'
+                                  r'\s+Last-change:\s+(?P<last_change>\d{1,2}:\d{1,2}:\d{1,2})$')
 
         # Service-Insertion: N/A
-        p5 = re.compile(r'^Service-Insertion:\s+(?P<service_insertion>\S+)$')
+        p5 = regex_engine.compile(r'^Service-Insertion:\s+(?P<service_insertion>\S+)$')
 
         # Extranet-IID: 5000  (Sourced by Config Propagation)
-        p6 = re.compile(r'^Extranet-IID:\s+(?P<extranet_iid>\d+)')
+        p6 = regex_engine.compile(r'^Extranet-IID:\s+(?P<extranet_iid>\d+)')
 
         # 100.88.88.88   10/50   cfg-intf   site-self, reachable
         # 100:88:88:88:: 10/50   cfg-intf   site-self, reachable
-        p7 = re.compile(r'^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+'
-                        r'(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<source>\S+)\s+'
-                        r'(?P<state>site-self, reachable|site-other, report-reachable)$')
+        p7 = regex_engine.compile(r'^(?P<locators>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+'
+                                  r'(?P<priority>\d+)\/(?P<weight>\d+)\s+(?P<source>\S+)\s+'
+                                  r'(?P<state>site-self, reachable|site-other, report-reachable)$')
 
         # 100.77.77.77     04:29:46       Yes  4
         # 100:77:77:77::   04:29:46       Yes  4
-        p8 = re.compile(r'^(?P<map_servers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+'
-                        r'(?P<uptime>\d{1,2}:\d{1,2}:\d{1,2})\s+(?P<ack>\S+)\s+'
-                        r'(?P<domain_id>\d+)$')
+        p8 = regex_engine.compile(r'^(?P<map_servers>(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})|([a-fA-F\d\:]+))\s+'
+                                  r'(?P<uptime>\d{1,2}:\d{1,2}:\d{1,2})\s+(?P<ack>\S+)\s+'
+                                  r'(?P<domain_id>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4010,7 +4011,7 @@ class ShowLispIpv4v6PublisherRloc(ShowLispIpv4PublisherRlocSchema):
             out = self.device.expect(
                 [r'Instance ID:\s+\S+'],
                 timeout=2).match_output
-            p0 = re.compile(r'^Instance ID:\s+(?P<instance_id>\d+)$')
+            p0 = regex_engine.compile(r'^Instance ID:\s+(?P<instance_id>\d+)$')
             group = p0.match(out)
             instance_id = int(group['instance_id'])
         else:
@@ -4021,30 +4022,30 @@ class ShowLispIpv4v6PublisherRloc(ShowLispIpv4PublisherRlocSchema):
         # Output for router lisp 0
         # Output for router lisp 0 instance-id 193
         # Output for router lisp 2 instance-id 101
-        p1 = re.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>(\d+))'
-                        r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
+        p1 = regex_engine.compile(r'^Output\s+for\s+router\s+lisp\s+(?P<lisp_id>(\d+))'
+                                  r'(?: +instance-id +(?P<instance_id>(\d+)))?$')
 
         # LISP ETR IPv4 Publisher Table for EID-table vrf red (IID 4099)
-        p2 = re.compile(r'^LISP\sETR\s(?P<address_family>\S+)\s+Publisher\sTable'\
-                        r'\sfor(\s+LISP\s+\d+)?\sEID-table\svrf\s(?P<eid_table>\S+).+$')
+        p2 = regex_engine.compile(r'^LISP\sETR\s(?P<address_family>\S+)\s+Publisher\sTable'\
+                                  r'\sfor(\s+LISP\s+\d+)?\sEID-table\svrf\s(?P<eid_table>\S+).+$')
 
         # Publisher state: Established, Publisher epoch 0, Entries total 2
-        p3 = re.compile(r'^Publisher\sstate:\s+(?P<state>\S+),\sPublisher\sepoch\s'\
-                        r'(?P<epoch>\d+),\sEntries\stotal\s(?P<entries>\d+)$')
+        p3 = regex_engine.compile(r'^Publisher\sstate:\s+(?P<state>\S+),\sPublisher\sepoch\s'\
+                                  r'(?P<epoch>\d+),\sEntries\stotal\s(?P<entries>\d+)$')
 
         # 0.0.0.0/0, Epoch: 0, Last Published: 5d22h
         # 2001:172:168:1::/64, Epoch: 0, Last Published: 00:00:43
-        p4 = re.compile(r'^(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3})'\
-                        r',\sEpoch:\s(?P<eid_epoch>\d+),\sLast Published:\s+(?P<last_pub_time>.+)$')
+        p4 = regex_engine.compile(r'^(?P<eid_prefix>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2}|[a-fA-F\d\:]+\/\d{1,3})'\
+                                  r',\sEpoch:\s(?P<eid_epoch>\d+),\sLast Published:\s+(?P<last_pub_time>.+)$')
 
         # TTL: never, State unknown-eid-forward
-        p5 = re.compile(r'^TTL:\s(?P<ttl>\S+),\sState\s(?P<eid_state>\S+)$')
+        p5 = regex_engine.compile(r'^TTL:\s(?P<ttl>\S+),\sState\s(?P<eid_state>\S+)$')
 
         # 203.203.203.203  255/10   up        -
         # 2001:2:2:2::2   50/50   up        -
-        p6 = re.compile(r'(?P<rloc_set>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'
-                        r'|[a-fA-F\d\:]+)\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+'
-                        r'(?P<rloc_state>\S+)\s+(?P<encap_iid>\S+)$')
+        p6 = regex_engine.compile(r'(?P<rloc_set>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'
+                                  r'|[a-fA-F\d\:]+)\s+(?P<priority>\d+)\/(?P<weight>\d+)\s+'
+                                  r'(?P<rloc_state>\S+)\s+(?P<encap_iid>\S+)$')
 
 
         for line in output.splitlines():
@@ -22,6 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -50,8 +51,8 @@ class ShowLldp(ShowLldpSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Status: +(?P<status>\w+)$')
-        p2 = re.compile(r'^LLDP +(?P<pattern>[\w\s]+) +(?P<value>\d+) +seconds$')
+        p1 = regex_engine.compile(r'^Status: +(?P<status>\w+)$')
+        p2 = regex_engine.compile(r'^LLDP +(?P<pattern>[\w\s]+) +(?P<value>\d+) +seconds$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -174,112 +175,112 @@ class ShowLldpEntry(ShowLldpEntrySchema):
 
         # ==== initial regexp pattern ====
         # Local Intf: Gi2/0/15
-        p1 = re.compile(r'^Local\s+Intf:\s+(?P<intf>[\w\/\.\-]+)$')
+        p1 = regex_engine.compile(r'^Local\s+Intf:\s+(?P<intf>[\w\/\.\-]+)$')
 
         # Port id: Gi1/0/4
-        p1_1 = re.compile(r'^Port\s+id:\s+(?P<port_id>[\S\s]+)$')
+        p1_1 = regex_engine.compile(r'^Port\s+id:\s+(?P<port_id>[\S\s]+)$')
 
         # Chassis id:  843d.c6ff.f1b8
         # Chassis id: r2-rf2222-qwe
-        p2 = re.compile(r'^Chassis\s+id:\s+(?P<chassis_id>.+?)\s*$')
+        p2 = regex_engine.compile(r'^Chassis\s+id:\s+(?P<chassis_id>.+?)\s*$')
 
         # Port Description: GigabitEthernet1/0/4
-        p3 = re.compile(r'^Port\s+Description:\s+(?P<desc>[\w\/\.\-\s]+)$')
+        p3 = regex_engine.compile(r'^Port\s+Description:\s+(?P<desc>[\w\/\.\-\s]+)$')
 
         # System Name: R5
         # System Name - not advertised
-        p4 = re.compile(r'^System\s+Name(?: +-|:)\s+(?P<name>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^System\s+Name(?: +-|:)\s+(?P<name>[\S\s]+)$')
 
         # System Description:
-        p5 = re.compile(r'^System\s+Description:.*$')
+        p5 = regex_engine.compile(r'^System\s+Description:.*$')
 
         # Cisco IOS Software, C3750E Software (C3750E-UNIVERSALK9-M), Version 12.2(58)SE2, RELEASE SOFTWARE (fc1)
         # Technical Support: http://www.cisco.com/techsupport
         # Copyright (c) 1986-2011 by Cisco Systems, Inc.
         # Cisco IP Phone 7962G,V12, SCCP42.9-3-1ES27S
-        p5_1 = re.compile(r'^(?P<msg>(Cisco +IOS +Software|Technical Support|Copyright|Cisco IP Phone).*)$')
+        p5_1 = regex_engine.compile(r'^(?P<msg>(Cisco +IOS +Software|Technical Support|Copyright|Cisco IP Phone).*)$')
 
         # Compiled Thu 21-Jul-11 01:23 by prod_rel_team
         # Avaya 1220 IP Deskphone, Firmware:06Q
         # IP Phone, Firmware:90234AP
         # {"SN":"SN-NR","Owner":"OWNER"}
-        p5_2 = re.compile(r'^(?P<msg>(Compile|Avaya|IP Phone|{).*)$')
+        p5_2 = regex_engine.compile(r'^(?P<msg>(Compile|Avaya|IP Phone|{).*)$')
 
         # Time remaining: 112 seconds
-        p6 = re.compile(r'^Time\s+remaining:\s+(?P<time_remaining>\w+)\s+seconds$')
+        p6 = regex_engine.compile(r'^Time\s+remaining:\s+(?P<time_remaining>\w+)\s+seconds$')
 
         # System Capabilities: B,R
-        p7 = re.compile(r'^System\s+Capabilities:\s+(?P<capab>[\w\,\s]+)$')
+        p7 = regex_engine.compile(r'^System\s+Capabilities:\s+(?P<capab>[\w\,\s]+)$')
 
         # Enabled Capabilities: B,R
-        p8 = re.compile(r'^Enabled\s+Capabilities:\s+(?P<capab>[\w\,\s]+)$')
+        p8 = regex_engine.compile(r'^Enabled\s+Capabilities:\s+(?P<capab>[\w\,\s]+)$')
 
         # Management Addresses:
         #     IP: 10.9.1.1
         # Management Addresses:
         #     IPV6: 0000:0000:0000:0000:0000:ffff:7f00:0001
         # Management Addresses - not advertised
-        p9 = re.compile(r'^(IP|IPV6):\s+(?P<ip>[\w\.:]+)$')
-        p9_1 = re.compile(r'^Management\s+Addresses\s+-\s+(?P<ip>not\sadvertised)$')
+        p9 = regex_engine.compile(r'^(IP|IPV6):\s+(?P<ip>[\w\.:]+)$')
+        p9_1 = regex_engine.compile(r'^Management\s+Addresses\s+-\s+(?P<ip>not\sadvertised)$')
 
         # Auto Negotiation - supported, enabled
-        p10 = re.compile(r'^Auto\s+Negotiation\s+\-\s+(?P<auto_negotiation>[\w\s\,]+)$')
+        p10 = regex_engine.compile(r'^Auto\s+Negotiation\s+\-\s+(?P<auto_negotiation>[\w\s\,]+)$')
 
         # Physical media capabilities:
-        p11 = re.compile(r'^Physical\s+media\s+capabilities:$')
+        p11 = regex_engine.compile(r'^Physical\s+media\s+capabilities:$')
 
         # 1000baseT(FD)
         # 100base-TX(HD)
         # Symm, Asym Pause(FD)
         # Symm Pause(FD)
-        p11_1 = re.compile(r'^(?P<physical_media_capabilities>[\S\(\s]+(HD|FD)[\)])$')
+        p11_1 = regex_engine.compile(r'^(?P<physical_media_capabilities>[\S\(\s]+(HD|FD)[\)])$')
 
         # Media Attachment Unit type: 30
-        p12 = re.compile(r'^Media\s+Attachment\s+Unit\s+type:\s+(?P<unit_type>\d+)$')
+        p12 = regex_engine.compile(r'^Media\s+Attachment\s+Unit\s+type:\s+(?P<unit_type>\d+)$')
 
         # Vlan ID: 1
         # Note: not parsing 'not advertised since value type is int
-        p13 = re.compile(r'^^Vlan\s+ID:\s+(?P<vlan_id>\d+)$')
+        p13 = regex_engine.compile(r'^^Vlan\s+ID:\s+(?P<vlan_id>\d+)$')
 
         # Total entries displayed: 4
-        p14 = re.compile(r'^Total\s+entries\s+displayed:\s+(?P<entry>\d+)$')
+        p14 = regex_engine.compile(r'^Total\s+entries\s+displayed:\s+(?P<entry>\d+)$')
 
         # ==== MED Information patterns =====
         # MED Information:
-        med_p0 = re.compile(r'^MED\s+Information:.*$')
+        med_p0 = regex_engine.compile(r'^MED\s+Information:.*$')
 
         # F/W revision: 06Q
         # S/W revision: SCCP42.9-3-1ES27S
         # H/W revision: 12
-        med_p1 = re.compile(r'^(?P<head>(H/W|F/W|S/W))\s+revision:\s+(?P<revision>\S+)$')
+        med_p1 = regex_engine.compile(r'^(?P<head>(H/W|F/W|S/W))\s+revision:\s+(?P<revision>\S+)$')
 
         # Manufacturer: Avaya-05
-        med_p2 = re.compile(r'^Manufacturer:\s+(?P<manufacturer>[\S\s]+)$')
+        med_p2 = regex_engine.compile(r'^Manufacturer:\s+(?P<manufacturer>[\S\s]+)$')
 
         # Model: 1220 IP Deskphone
-        med_p3 = re.compile(r'^Model:\s+(?P<model>[\S\s]+)$')
+        med_p3 = regex_engine.compile(r'^Model:\s+(?P<model>[\S\s]+)$')
 
         # Capabilities: NP, LI, PD, IN
-        med_p4 = re.compile(r'^Capabilities:\s*(?P<capabilities>[\S\s]+)$')
+        med_p4 = regex_engine.compile(r'^Capabilities:\s*(?P<capabilities>[\S\s]+)$')
 
         # Device type: Endpoint Class III
-        med_p5 = re.compile(r'^Device\s+type:\s+(?P<device_type>[\S\s]+)$')
+        med_p5 = regex_engine.compile(r'^Device\s+type:\s+(?P<device_type>[\S\s]+)$')
 
         # Network Policy(Voice): VLAN 110, tagged, Layer-2 priority: 5, DSCP: 46
         # Network Policy(Voice Signal): VLAN 110, tagged, Layer-2 priority: 0, DSCP: 0
-        med_p6 = re.compile(r'^Network\s+Policy\(Voice(\s+(?P<voice_signal>Signal))?\):'
-                            r'\s+VLAN\s+(?P<vlan>\d+),\s+(?P<tagged>tagged),\s+'
-                            r'Layer-2 priority:\s+(?P<layer_2_priority>\d+),\s+DSCP:\s+(?P<dscp>\d+)$')
+        med_p6 = regex_engine.compile(r'^Network\s+Policy\(Voice(\s+(?P<voice_signal>Signal))?\):'
+                                      r'\s+VLAN\s+(?P<vlan>\d+),\s+(?P<tagged>tagged),\s+'
+                                      r'Layer-2 priority:\s+(?P<layer_2_priority>\d+),\s+DSCP:\s+(?P<dscp>\d+)$')
 
         # PD device, Power source: Unknown, Power Priority: High, Wattage: 6.0
-        med_p7 = re.compile(r'^(?P<device_type>PD device),\s+Power\s+source:\s+(?P<power_source>\S+),\s+'
-                            r'Power\s+Priority:\s+(?P<power_priority>\S+),\s+Wattage:\s+(?P<wattage>\S+)$')
+        med_p7 = regex_engine.compile(r'^(?P<device_type>PD device),\s+Power\s+source:\s+(?P<power_source>\S+),\s+'
+                                      r'Power\s+Priority:\s+(?P<power_priority>\S+),\s+Wattage:\s+(?P<wattage>\S+)$')
 
         # Location - not advertised
-        med_p8 = re.compile(r'^Location\s+-\s+(?P<location>[\S\s]+)$')
+        med_p8 = regex_engine.compile(r'^Location\s+-\s+(?P<location>[\S\s]+)$')
 
         # Serial number: FCH1610A5S5
-        med_p9 = re.compile(r'^Serial\s+number:\s+(?P<serial_number>\S+)$')
+        med_p9 = regex_engine.compile(r'^Serial\s+number:\s+(?P<serial_number>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -551,7 +552,7 @@ class ShowLldpTraffic(ShowLldpTrafficSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<pattern>[\w\s]+): +(?P<value>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<pattern>[\w\s]+): +(?P<value>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -620,8 +621,8 @@ class ShowLldpInterface(ShowLldpInterfaceSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<intf>[\w\/\-\.]+):$')
-        p2 = re.compile(r'^(?P<key>[\w\s]+): +(?P<value>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<intf>[\w\/\-\.]+):$')
+        p2 = regex_engine.compile(r'^(?P<key>[\w\s]+): +(?P<value>[\w\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -694,7 +695,7 @@ class ShowLldpNeighbors(ShowLldpNeighborsSchema):
         parsed_output = {}
 
         # Total entries displayed: 4
-        p1 = re.compile(r'^Total\s+entries\s+displayed:\s+(?P<entry>\d+)$')
+        p1 = regex_engine.compile(r'^Total\s+entries\s+displayed:\s+(?P<entry>\d+)$')
 
         # Device ID           Local Intf     Hold-time  Capability      Port ID
         # router               Gi1/0/52       117        R               Gi0/0/0
@@ -702,9 +703,9 @@ class ShowLldpNeighbors(ShowLldpNeighborsSchema):
         # d89e.f3ff.58fe      Gi1/0/33       3070                       d89e.f3ff.58fe
         # Polycom Trio Visual+Gi2/0/28       120        T               6416.7fff.1e30
 
-        p2 = re.compile(r'(?P<device_id>.{20})(?P<interfaces>\S+)'
-                        r'\s+(?P<hold_time>\d+)\s+(?P<capabilities>[A-Z,]+)?'
-                        r'\s+(?P<port_id>\S+)')
+        p2 = regex_engine.compile(r'(?P<device_id>.{20})(?P<interfaces>\S+)'
+                                  r'\s+(?P<hold_time>\d+)\s+(?P<capabilities>[A-Z,]+)?'
+                                  r'\s+(?P<port_id>\S+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -768,16 +769,16 @@ class ShowLldpErrors(ShowLldpErrorsSchema):
         ret_dict = dict()
 
         # Total memory allocation failures: 0
-        p0 = re.compile(r'^Total\s+memory\s+allocation\s+failures:\s+(?P<memory>\d+)$')
+        p0 = regex_engine.compile(r'^Total\s+memory\s+allocation\s+failures:\s+(?P<memory>\d+)$')
 
         # Total encapsulation failures: 0
-        p1 = re.compile(r'^Total\s+encapsulation\s+failures:\s+(?P<encapsulation>\d+)$')
+        p1 = regex_engine.compile(r'^Total\s+encapsulation\s+failures:\s+(?P<encapsulation>\d+)$')
 
         # Total input queue overflows: 0
-        p2 = re.compile(r'^Total\s+input\s+queue\s+overflows:\s+(?P<input_queue>\d+)$')
+        p2 = regex_engine.compile(r'^Total\s+input\s+queue\s+overflows:\s+(?P<input_queue>\d+)$')
 
         # Total table overflows: 0
-        p3 = re.compile(r'^Total\s+table\s+overflows:\s+(?P<table>\d+)$')
+        p3 = regex_engine.compile(r'^Total\s+table\s+overflows:\s+(?P<table>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -838,19 +839,19 @@ class ShowLldpCustomInformation(ShowLldpCustomInformationSchema):
 
         # initial regexp pattern based on the output
         # Management VLAN: 100
-        p1 = re.compile(r'Management\sVLAN: +(?P<vlan>\d+)$')
+        p1 = regex_engine.compile(r'Management\sVLAN: +(?P<vlan>\d+)$')
         
         # Custom  network hash: check
-        p2 = re.compile(r'Custom\s*network\shash: +(?P<network_hash>\w+)$')
+        p2 = regex_engine.compile(r'Custom\s*network\shash: +(?P<network_hash>\w+)$')
         
         # Management IPv4: 10.0.0.1  20.0.0.1
-        p3 = re.compile(r'Management\sIP\S*: +(?P<ip_string>[\S*\s*]*)$')
+        p3 = regex_engine.compile(r'Management\sIP\S*: +(?P<ip_string>[\S*\s*]*)$')
         
         # Management IPv6: 10::1  20::1
-        p4 = re.compile(r'Management\sIPv6: +(?P<ipv6_string>[\S*\s*]*)$')
+        p4 = regex_engine.compile(r'Management\sIPv6: +(?P<ipv6_string>[\S*\s*]*)$')
         
         # Switch-id 1 system-name: check
-        p5 = re.compile(r'Switch-id +(?P<switch_id>\d+) system-name: (?P<system_name>\S+)$')
+        p5 = regex_engine.compile(r'Switch-id +(?P<switch_id>\d+) system-name: (?P<system_name>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -966,68 +967,68 @@ class ShowLldpNeighborsInterfaceDetail(ShowLldpNeighborsInterfaceDetailSchema):
         ret_dict = {}
 
         # Local Intf: Gi4/0/5
-        p1 = re.compile(r'^Local Intf: (?P<local_intf>\S+)$')
+        p1 = regex_engine.compile(r'^Local Intf: (?P<local_intf>\S+)$')
 
         # Chassis id: 380e.4d9b.0580
-        p2 = re.compile(r'^Chassis id: (?P<chassis_id>\S+)$')
+        p2 = regex_engine.compile(r'^Chassis id: (?P<chassis_id>\S+)$')
 
         # Port id: Gi4/0/5
-        p3 = re.compile(r'^Port id: (?P<port_id>\S+)$')
+        p3 = regex_engine.compile(r'^Port id: (?P<port_id>\S+)$')
 
         # Port Description: GigabitEthernet4/0/5
-        p4 = re.compile(r'^Port Description: (?P<port_description>\S+)$')
+        p4 = regex_engine.compile(r'^Port Description: (?P<port_description>\S+)$')
 
         # System Name: dut9404
-        p5 = re.compile(r'^System Name: (?P<system_name>\S+)$')
+        p5 = regex_engine.compile(r'^System Name: (?P<system_name>\S+)$')
 
         # Cisco IOS Software [Dublin], Catalyst L3 Switch Software (CAT9K_IOSXE), 
         # Experimental Version 17.12.20230309:084324 
         # [BLD_POLARIS_DEV_LATEST_20230309_082032:/nobackup/mcpre/s2c-build-ws 101]
-        p6 = re.compile(r'^Cisco IOS Software \[(?P<ios_software>\S+)\], Catalyst L3 Switch Software \((?P<calatyst_software>\S+)\), Experimental Version (?P<exp_version>\S+) \[(?P<image_label>\S+):(?P<local_path>[\S\s]+)\]$')
+        p6 = regex_engine.compile(r'^Cisco IOS Software \[(?P<ios_software>\S+)\], Catalyst L3 Switch Software \((?P<calatyst_software>\S+)\), Experimental Version (?P<exp_version>\S+) \[(?P<image_label>\S+):(?P<local_path>[\S\s]+)\]$')
 
         #Cisco IOS Software [Gibraltar], Catalyst L3 Switch Software (CAT9K_IOSXE), 
         # Version 16.12.4, RELEASE SOFTWARE (fc5)
-        p7 = re.compile(r'^Cisco IOS Software \[(?P<ios_software>\S+)\], Catalyst L3 Switch Software \((?P<calatyst_software>\S+)\), Version (?P<version>\S+), RELEASE SOFTWARE \((?P<release_software>\S+)\)$')
+        p7 = regex_engine.compile(r'^Cisco IOS Software \[(?P<ios_software>\S+)\], Catalyst L3 Switch Software \((?P<calatyst_software>\S+)\), Version (?P<version>\S+), RELEASE SOFTWARE \((?P<release_software>\S+)\)$')
 
         #Technical Support: http://www.cisco.com/techsupport
-        p8 = re.compile(r'^Technical Support: (?P<technical_support>\S+)$')
+        p8 = regex_engine.compile(r'^Technical Support: (?P<technical_support>\S+)$')
 
         # Copyright (c) 1986-2023 by Cisco Systems, Inc.
-        p9 = re.compile(r'^Copyright \(c\) (?P<copyright>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^Copyright \(c\) (?P<copyright>[\S\s]+)$')
 
         # Compiled Thu 09-Mar
-        p10 = re.compile(r'^Compiled (?P<compiled>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^Compiled (?P<compiled>[\S\s]+)$')
 
         # Time remaining: 109 seconds
-        p11 = re.compile(r'^Time remaining: (?P<time>\d+) seconds$')
+        p11 = regex_engine.compile(r'^Time remaining: (?P<time>\d+) seconds$')
         
         # System Capabilities: B,R
-        p12 = re.compile(r'^System Capabilities: (?P<system_capabilities>\S+)$')
+        p12 = regex_engine.compile(r'^System Capabilities: (?P<system_capabilities>\S+)$')
 
         # Enabled Capabilities: B,R
-        p13 = re.compile(r'^Enabled Capabilities: (?P<enabled_capabilities>\S+)$')
+        p13 = regex_engine.compile(r'^Enabled Capabilities: (?P<enabled_capabilities>\S+)$')
 
         # IP: 172.21.227.230
-        p14 = re.compile(r'^IP: (?P<ip>\S+)$')
+        p14 = regex_engine.compile(r'^IP: (?P<ip>\S+)$')
 
         # Auto Negotiation - supported, enabled
-        p15 = re.compile(r'^Auto Negotiation - (?P<auto_negotiation>[\S\s]+)$')
+        p15 = regex_engine.compile(r'^Auto Negotiation - (?P<auto_negotiation>[\S\s]+)$')
 
         # 1000baseT(FD)
         # 100base-TX(FD)
-        p16 = re.compile(r'^(?P<media_capabilities>.*base.*|.*un.*)$')
+        p16 = regex_engine.compile(r'^(?P<media_capabilities>.*base.*|.*un.*)$')
 
         # Media Attachment Unit type: 30
-        p17 = re.compile(r'^Media Attachment Unit type: (?P<media_unit_type>\d+)$')
+        p17 = regex_engine.compile(r'^Media Attachment Unit type: (?P<media_unit_type>\d+)$')
 
         # Vlan ID: 1
-        p18 = re.compile(r'^Vlan ID: (?P<vlan_id>\d+)$')
+        p18 = regex_engine.compile(r'^Vlan ID: (?P<vlan_id>\d+)$')
 
         # Peer Source MAC: d477.989b.79c4
-        p19 = re.compile(r'^Peer Source MAC: (?P<peer_source_mac>\S+)$')
+        p19 = regex_engine.compile(r'^Peer Source MAC: (?P<peer_source_mac>\S+)$')
 
         # Total entries displayed: 8
-        p20 = re.compile(r'^Total entries displayed: (?P<total_entries>\d+)$')
+        p20 = regex_engine.compile(r'^Total entries displayed: (?P<total_entries>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
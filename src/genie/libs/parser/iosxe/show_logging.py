@@ -15,13 +15,13 @@ IOSXE parsers for the following show commands:
     * show logging process smd {switch} {mode} reverse
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowLoggingSchema(MetaParser):
     '''Schema for:
@@ -212,101 +212,101 @@ class ShowLogging(ShowLoggingSchema):
         log_lines = []
 
         # Syslog logging: enabled (0 messages dropped, 0 messages rate-limited, 0 flushes, 0 overruns, xml disabled, filtering disabled)
-        p1 = re.compile(r'^Syslog +logging: +(?P<enable_disable>\S+) +\(+(?P<messages_dropped>\d+) '
-                        r'+messages +dropped, +(?P<messages_rate_limited>\d+) +messages +rate-limited, '
-                        r'+(?P<flushes>\d+) +flushes, +(?P<overruns>\d+) +overruns, +xml +(?P<xml>\S+), '
-                        r'filtering +(?P<filtering>\S+)\)$')
+        p1 = regex_engine.compile(r'^Syslog +logging: +(?P<enable_disable>\S+) +\(+(?P<messages_dropped>\d+) '
+                                  r'+messages +dropped, +(?P<messages_rate_limited>\d+) +messages +rate-limited, '
+                                  r'+(?P<flushes>\d+) +flushes, +(?P<overruns>\d+) +overruns, +xml +(?P<xml>\S+), '
+                                  r'filtering +(?P<filtering>\S+)\)$')
 
         # Console logging: disabled
-        p2 = re.compile(r'^(?P<tag>\S+) +logging: +(?P<status>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<tag>\S+) +logging: +(?P<status>\S+)$')
 
         # Buffer logging: disabled, xml disabled,
-        p3 = re.compile(r'^(?P<tag>\S+) +[Ll]ogging: +(?P<status>\S+), +xml +(?P<xml>\S+),$')
+        p3 = regex_engine.compile(r'^(?P<tag>\S+) +[Ll]ogging: +(?P<status>\S+), +xml +(?P<xml>\S+),$')
 
         # Monitor logging: level debugging, 13 messages logged, xml disabled,
         # Console logging: level debugging, 9789 messages logged, xml disabled,
-        p4 = re.compile(r'^(?P<tag>\S+) +logging: +level '
-                        r'+(?P<level>\S+), +(?P<messages_logged>\d+) '
-                        r'+messages +logged, +xml +(?P<xml>\S+),$')
+        p4 = regex_engine.compile(r'^(?P<tag>\S+) +logging: +level '
+                                  r'+(?P<level>\S+), +(?P<messages_logged>\d+) '
+                                  r'+messages +logged, +xml +(?P<xml>\S+),$')
 
         # filtering disabled
-        p5 = re.compile(r'^filtering +(?P<filtering>\S+)$')
+        p5 = regex_engine.compile(r'^filtering +(?P<filtering>\S+)$')
 
         # Exception Logging: size (4096 bytes)
         # Exception Logging: Disabled
-        p6 = re.compile(r'^Exception +Logging:\s+((?P<disabled>[Dd]isabled)|size\s+\((?P<size_bytes>\d+) +bytes\))$')
+        p6 = regex_engine.compile(r'^Exception +Logging:\s+((?P<disabled>[Dd]isabled)|size\s+\((?P<size_bytes>\d+) +bytes\))$')
 
         # Count and timestamp logging messages: disabled
-        p7 = re.compile(r'^Count +and +timestamp +logging +messages: '
-                        r'+(?P<count_and_time_stamp_logging_messages>\S+)$')
+        p7 = regex_engine.compile(r'^Count +and +timestamp +logging +messages: '
+                                  r'+(?P<count_and_time_stamp_logging_messages>\S+)$')
 
         # File logging: disabled
-        p8 = re.compile(r'^(?P<tag>File +logging): +(?P<status>\S+)$')
+        p8 = regex_engine.compile(r'^(?P<tag>File +logging): +(?P<status>\S+)$')
 
         # Persistent logging: disabled
         # Persistent logging: enabled, url bootflash:/, disk space 16384 bytes, file size 8192 bytes, batch size 4096 bytes, threshold capacity 5  alert , immediate , protected , notify
-        p9 = re.compile(r'^Persistent\s+logging:\s+(?P<status>\w+)(,\s+url\s+(?P<url>[\w:/]+),\s+disk\s+space\s+'
-                        r'(?P<disk_space_bytes>\d+)\s+bytes,\s+file\s+size\s+(?P<file_size_bytes>\d+)'
-                        r'\s+bytes,\s+batch\s+size\s+(?P<batch_size_bytes>\d+)\s+bytes)'
-                        r'(,?\s+threshold\s+capacity\s+'
-                        r'(?P<threshold_percent>\d+))?(\s+(?P<threshold_alert>alert))?'
-                        r'(\s+,\s+(?P<immediate_write>immediate))?(\s+,\s+(?P<protected>protected))?'
-                        r'(\s+,\s+(?P<notify>notify))?$')
+        p9 = regex_engine.compile(r'^Persistent\s+logging:\s+(?P<status>\w+)(,\s+url\s+(?P<url>[\w:/]+),\s+disk\s+space\s+'
+                                  r'(?P<disk_space_bytes>\d+)\s+bytes,\s+file\s+size\s+(?P<file_size_bytes>\d+)'
+                                  r'\s+bytes,\s+batch\s+size\s+(?P<batch_size_bytes>\d+)\s+bytes)'
+                                  r'(,?\s+threshold\s+capacity\s+'
+                                  r'(?P<threshold_percent>\d+))?(\s+(?P<threshold_alert>alert))?'
+                                  r'(\s+,\s+(?P<immediate_write>immediate))?(\s+,\s+(?P<protected>protected))?'
+                                  r'(\s+,\s+(?P<notify>notify))?$')
 
         # Trap logging: level informational, 1570 message lines logged
-        p10 = re.compile(r'^(?P<tag>Trap) +logging: +level +'
-                         r'(?P<level>\S+), +(?P<message_lines_logged>\d+) '
-                         r'+message +lines +logged$')
+        p10 = regex_engine.compile(r'^(?P<tag>Trap) +logging: +level +'
+                                   r'(?P<level>\S+), +(?P<message_lines_logged>\d+) '
+                                   r'+message +lines +logged$')
 
         # Logging to 192.168.1.3  (tcp port 1514, audit disabled,
         # Logging to 55.55.55.70  (Mgmt-vrf) (udp port 514, audit disabled,
         # Logging to 2001:DB8::1  (MGMT) (udp port 514, audit disabled,
-        p11 = re.compile(r'^Logging +to (?P<logging_to>[\w\.\:]+) +'
-                         r'(\((?P<vrf>(\S+))\) +)?'
-                         r'\((?P<protocol>\S+) '
-                         r'+port +(?P<port>\d+), +audit +(?P<audit>\S+),$')
+        p11 = regex_engine.compile(r'^Logging +to (?P<logging_to>[\w\.\:]+) +'
+                                   r'(\((?P<vrf>(\S+))\) +)?'
+                                   r'\((?P<protocol>\S+) '
+                                   r'+port +(?P<port>\d+), +audit +(?P<audit>\S+),$')
 
         # link down),
         # authentication disabled, encryption disabled, link up),
-        p12 = re.compile(r'^(authentication (?P<authentication>\w+), encryption (?P<encryption>\w+), )?link +(?P<link>\S+)\),$')
+        p12 = regex_engine.compile(r'^(authentication (?P<authentication>\w+), encryption (?P<encryption>\w+), )?link +(?P<link>\S+)\),$')
 
         # 787 message lines logged,
-        p13 = re.compile(r'^(?P<message_lines_logged>\d+) +message +lines +logged,$')
+        p13 = regex_engine.compile(r'^(?P<message_lines_logged>\d+) +message +lines +logged,$')
 
         # 0 message lines rate-limited,
-        p14 = re.compile(r'^(?P<message_lines_rate_limited>\d+) '
-                         r'+message +lines +rate-limited,$')
+        p14 = regex_engine.compile(r'^(?P<message_lines_rate_limited>\d+) '
+                                   r'+message +lines +rate-limited,$')
 
         # 0 message lines dropped-by-MD,
-        p15 = re.compile(r'^(?P<message_lines_dropped_by_md>\d+) '
-                         r'+message +lines +dropped-by-MD,$')
+        p15 = regex_engine.compile(r'^(?P<message_lines_dropped_by_md>\d+) '
+                                   r'+message +lines +dropped-by-MD,$')
 
         # xml disabled, sequence number disabled
-        p16 = re.compile(r'^xml +(?P<xml>\S+), +sequence +number +(?P<sequence_number>\S+)$')
+        p16 = regex_engine.compile(r'^xml +(?P<xml>\S+), +sequence +number +(?P<sequence_number>\S+)$')
 
         # TLS Profiles:
-        p17 = re.compile(r'^TLS\s+Profiles:$')
+        p17 = regex_engine.compile(r'^TLS\s+Profiles:$')
 
         # Profile Name:
-        p18 = re.compile(r'^Profile +Name: +(?P<tls_profile_name>\S+)$')
+        p18 = regex_engine.compile(r'^Profile +Name: +(?P<tls_profile_name>\S+)$')
 
         # Ciphersuites:  rsa-aes-cbc-sha2 ecdhe-rsa-aes-cbc-sha2 ecdhe-ecdsa-aes-gcm-sha2
-        p19 = re.compile(r'^Ciphersuites: +(?P<tls_cipher_suites>.*)$')
+        p19 = regex_engine.compile(r'^Ciphersuites: +(?P<tls_cipher_suites>.*)$')
 
         # Trustpoint:
-        p20 = re.compile(r'^Trustpoint: +(?P<tls_trustpoint>\S+)$')
+        p20 = regex_engine.compile(r'^Trustpoint: +(?P<tls_trustpoint>\S+)$')
 
         # TLS version:
-        p21 = re.compile(r'^TLS +version: +(?P<tls_version>\S+)$')
+        p21 = regex_engine.compile(r'^TLS +version: +(?P<tls_version>\S+)$')
 
         # Logging Source-Interface:       VRF Name:
-        p22 = re.compile(r'^Logging Source-Interface: +VRF +Name:$')
+        p22 = regex_engine.compile(r'^Logging Source-Interface: +VRF +Name:$')
 
         # Vlan200
-        p23 = re.compile(r'^(?P<interface>\S+)\s*(?P<vrf>\S+)?$')
+        p23 = regex_engine.compile(r'^(?P<interface>\S+)\s*(?P<vrf>\S+)?$')
 
         # Log Buffer (32000 bytes):
-        p24 = re.compile(r'^Log +Buffer +\((?P<vrf>\d+) +bytes+\):$')
+        p24 = regex_engine.compile(r'^Log +Buffer +\((?P<vrf>\d+) +bytes+\):$')
 
         ret_dict = {}
         logging_dict = {}
@@ -683,34 +683,34 @@ class ShowLoggingOnboardRpActiveUptime(ShowLoggingOnboardRpActiveUptimeSchema):
         ret_dict ={}
 
         #First customer power on : 06/22/2021 12:35:40
-        p1= re.compile(r'^First customer power on :?\s?(?P<first_customer_poweron>(\d+\/){2}\d+ \d+:\d+:\d+)$')
+        p1= regex_engine.compile(r'^First customer power on :?\s?(?P<first_customer_poweron>(\d+\/){2}\d+ \d+:\d+:\d+)$')
 
         #Total uptime            :  0  years  12 weeks  1  days  17 hours  55 minutes
-        p2=re.compile(r'^Total uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p2=regex_engine.compile(r'^Total uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
 
         #Total downtime          :  2177 years  8  weeks  0  days  2  hours  29 minutes
-        p3=re.compile(r'^Total downtime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p3=regex_engine.compile(r'^Total downtime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
 
         #Number of resets        : 630
-        p4=re.compile(r'^Number of resets\s+: (?P<numberof_reset>\d+)$')
+        p4=regex_engine.compile(r'^Number of resets\s+: (?P<numberof_reset>\d+)$')
 
         #Number of slot changes  : 1
-        p5=re.compile(r'^Number of slot changes\s+: (?P<numberof_slot_changes>\d+)$')
+        p5=regex_engine.compile(r'^Number of slot changes\s+: (?P<numberof_slot_changes>\d+)$')
 
         #Current reset reason    : Reload Command
-        p6=re.compile(r'^Current reset reason\s+: (?P<current_reset_reason>[A-Z a-z\S]+)$')
+        p6=regex_engine.compile(r'^Current reset reason\s+: (?P<current_reset_reason>[A-Z a-z\S]+)$')
 
         #Current reset timestamp : 10/06/2019 01:28:26
-        p7=re.compile(r'^Current reset timestamp\s+: (?P<current_reset_timestamp>(\d+\/){2}\d+.*)$')
+        p7=regex_engine.compile(r'^Current reset timestamp\s+: (?P<current_reset_timestamp>(\d+\/){2}\d+.*)$')
 
         #Current slot            : 1
-        p8=re.compile(r'^Current slot\s+: (?P<current_slot>\d+)$')
+        p8=regex_engine.compile(r'^Current slot\s+: (?P<current_slot>\d+)$')
 
         #Chassis type            : 80
-        p9=re.compile(r'^Chassis type\s+: (?P<chassis_type>\w+)$')
+        p9=regex_engine.compile(r'^Chassis type\s+: (?P<chassis_type>\w+)$')
 
         #Current uptime          :  0  years  1  weeks  1  days  0  hours  0  minutes
-        p10=re.compile(r'^Current uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p10=regex_engine.compile(r'^Current uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -844,13 +844,13 @@ class ShowLoggingOnboardRpActiveStatus(ShowLoggingOnboardRpActiveStatusSchema):
 
         ret_dict ={}
         #Application Clilog:
-        p1=re.compile(r'^Application (?P<application>\S+):$')
+        p1=regex_engine.compile(r'^Application (?P<application>\S+):$')
 
         #Cli enable status: enabled
-        p2=re.compile(r'^Cli (?P<enable_status>enable status): (?P<status>\S+)$')
+        p2=regex_engine.compile(r'^Cli (?P<enable_status>enable status): (?P<status>\S+)$')
 
         # Path: /obfl0/
-        p3=re.compile(r'^Path\: (?P<path>\S+)$')
+        p3=regex_engine.compile(r'^Path\: (?P<path>\S+)$')
 
         for line in output.splitlines():
             line=line.strip()
@@ -943,19 +943,19 @@ class ShowLoggingOnboardRpActiveTemperatureContinuous(ShowLoggingOnboardRpActive
             # Execute the command
             output = self.device.execute(cmd)
         #TEMPERATURE CONTINUOUS INFORMATION
-        p1 = re.compile(r'^(?P<continuous_info>[A-Z ]+) CONTINUOUS INFORMATION$')
+        p1 = regex_engine.compile(r'^(?P<continuous_info>[A-Z ]+) CONTINUOUS INFORMATION$')
 
         #No continuous data
-        p2 = re.compile(r'^(?P<no_date>No continuous data|Application is not yet initialized.*)$')
+        p2 = regex_engine.compile(r'^(?P<no_date>No continuous data|Application is not yet initialized.*)$')
 
         #Temp: CPU board           23
-        p3 = re.compile(r'^(\w+\: )?(?P<sensor_name>\w+.*?)\s+(?P<sensor_count>\d+)$')
+        p3 = regex_engine.compile(r'^(\w+\: )?(?P<sensor_name>\w+.*?)\s+(?P<sensor_count>\d+)$')
 
         #10/13/2019 21:58:42  40  38  33
-        p4 = re.compile(r'^(?P<time>\d+\/\d+\/\d+ \d+:\d+:\d+)\s+(?P<sensor_value>[\d\s]+).*$')
+        p4 = regex_engine.compile(r'^(?P<time>\d+\/\d+\/\d+ \d+:\d+:\d+)\s+(?P<sensor_value>[\d\s]+).*$')
 
         #10/29/2019 07:38:01 %IOSXE-2-DIAGNOSTICS_PASSED : Diagnostics Thermal passed
-        p5 = re.compile(r'^(?P<time>\d+\/\d+\/\d+ \d+:\d+:\d+)\s+%(?P<info>\S+\s+\: [\w\s\/?]+)$')
+        p5 = regex_engine.compile(r'^(?P<time>\d+\/\d+\/\d+ \d+:\d+:\d+)\s+%(?P<info>\S+\s+\: [\w\s\/?]+)$')
 
         sensor_list=[]
         ret_dict = {}
@@ -1053,7 +1053,7 @@ class ShowLoggingOnboardRpActiveTemperatureDetail(ShowLoggingOnboardRpActiveTemp
         ret_dict = {}
 
         #Number of sensors          : 15
-        p1 = re.compile(r'^Number +of +sensors +: +(?P<number_of_sensors>\d+)$')
+        p1 = regex_engine.compile(r'^Number +of +sensors +: +(?P<number_of_sensors>\d+)$')
 
         #--------------------------------------------------------------------------------
         #Sensor                    ID         Normal Range          Maximum Sensor Value
@@ -1064,7 +1064,7 @@ class ShowLoggingOnboardRpActiveTemperatureDetail(ShowLoggingOnboardRpActiveTemp
         #SYSTEM INLET-B            38         0 - 45                121
         #Temp: UADP_0_0            39         0 - 105               121
         #DOPPLER0 UADP_0_2         6          0 - 124               91
-        p2 = re.compile(r'^(?P<sensors>.+?)\s+(?P<sensor_id>\d+)\s+(?P<normal_range_min>\d+) - (?P<normal_range_max>\d+)\s+(?P<maximum_sensor_value>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<sensors>.+?)\s+(?P<sensor_id>\d+)\s+(?P<normal_range_min>\d+) - (?P<normal_range_max>\d+)\s+(?P<maximum_sensor_value>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1153,34 +1153,34 @@ class ShowLoggingOnboardRpActiveUptimeDetail(ShowLoggingOnboardRpActiveUptimeDet
         ret_dict = {}
 
         # First customer power on : 06/22/2021 12:35:40
-        p1 = re.compile(r'^First customer power on :?\s?(?P<first_customer_poweron>(\d+\/){2}\d+ \d+:\d+:\d+)$')
+        p1 = regex_engine.compile(r'^First customer power on :?\s?(?P<first_customer_poweron>(\d+\/){2}\d+ \d+:\d+:\d+)$')
 
         # Total uptime            :  0  years  12 weeks  1  days  17 hours  55 minutes
-        p2 = re.compile(r'^Total uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p2 = regex_engine.compile(r'^Total uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
 
         # Total downtime          :  2177 years  8  weeks  0  days  2  hours  29 minutes
-        p3 = re.compile(r'^Total downtime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p3 = regex_engine.compile(r'^Total downtime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
 
         # Number of resets        : 630
-        p4 = re.compile(r'^Number of resets\s+: (?P<numberof_reset>\d+)$')
+        p4 = regex_engine.compile(r'^Number of resets\s+: (?P<numberof_reset>\d+)$')
 
         # Number of slot changes  : 1
-        p5 = re.compile(r'^Number of slot changes\s+: (?P<numberof_slot_changes>\d+)$')
+        p5 = regex_engine.compile(r'^Number of slot changes\s+: (?P<numberof_slot_changes>\d+)$')
 
         # Current reset reason    : Reload Command
-        p6 = re.compile(r'^Current reset reason\s+: (?P<current_reset_reason>[A-Z a-z]+)$')
+        p6 = regex_engine.compile(r'^Current reset reason\s+: (?P<current_reset_reason>[A-Z a-z]+)$')
 
         # Current reset timestamp : 10/06/2019 01:28:26
-        p7 = re.compile(r'^Current reset timestamp\s+: (?P<current_reset_timestamp>(\d+\/){2}\d+.*)$')
+        p7 = regex_engine.compile(r'^Current reset timestamp\s+: (?P<current_reset_timestamp>(\d+\/){2}\d+.*)$')
 
         # Current slot            : 1
-        p8 = re.compile(r'^Current slot\s+: (?P<current_slot>\d+)$')
+        p8 = regex_engine.compile(r'^Current slot\s+: (?P<current_slot>\d+)$')
 
         # Chassis type            : 80
-        p9 = re.compile(r'^Chassis type\s+: (?P<chassis_type>.+?)$')
+        p9 = regex_engine.compile(r'^Chassis type\s+: (?P<chassis_type>.+?)$')
 
         # Current uptime          :  0  years  1  weeks  1  days  0  hours  0  minutes
-        p10 = re.compile(r'^Current uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p10 = regex_engine.compile(r'^Current uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
 
         # --------------------------------------------------------------------------------
         # Time Stamp          | Reset                       | Uptime
@@ -1189,7 +1189,7 @@ class ShowLoggingOnboardRpActiveUptimeDetail(ShowLoggingOnboardRpActiveUptimeDet
         # 04/02/2022 21:32:31   EHSA standby down             0     0     0     0     13
         # 04/02/2022 22:11:32   Reload Command                0     0     0     0     38
 
-        p11 = re.compile(r'^(?P<time_stamp>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<reset_reason>.+?)\s+?(?P<uptime_years>\d+)\s+(?P<uptime_weeks>\d+)\s+(?P<uptime_days>\d+)\s+(?P<uptime_hours>\d+)\s+(?P<uptime_minutes>\d+)$')
+        p11 = regex_engine.compile(r'^(?P<time_stamp>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<reset_reason>.+?)\s+?(?P<uptime_years>\d+)\s+(?P<uptime_weeks>\d+)\s+(?P<uptime_days>\d+)\s+(?P<uptime_hours>\d+)\s+(?P<uptime_minutes>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1403,28 +1403,28 @@ class ShowLoggingProcessSmdReverse(ShowLoggingProcessSmdReverseSchema):
 
         # Logging display requested on 2023/04/27 21:34:18 (UTC) for Hostname:
         # [stack3-nyquist-1], Model: [C9300-48P], Version: [17.12.01], SN: [FOC21446Z0R], MD_SN: [FCW2146L00Y]
-        p1 = re.compile(r'^Logging display requested on (?P<requested_date>\S+) (?P<requested_time>\S+) \(.+\) for Hostname:'
-                        r' \[(?P<hostname>\S+)\], Model: \[(?P<model>\S+)\], Version: \[(?P<version>\S+)\],'
-                        r' SN: \[(?P<serial_number>\S+)\], MD_SN: \[(?P<md_sn>\S+)\]$')
+        p1 = regex_engine.compile(r'^Logging display requested on (?P<requested_date>\S+) (?P<requested_time>\S+) \(.+\) for Hostname:'
+                                  r' \[(?P<hostname>\S+)\], Model: \[(?P<model>\S+)\], Version: \[(?P<version>\S+)\],'
+                                  r' SN: \[(?P<serial_number>\S+)\], MD_SN: \[(?P<md_sn>\S+)\]$')
 
         # Displaying logs from the last 0 days, 0 hours, 10 minutes, 0 seconds
-        p2 = re.compile(r'^Displaying logs from the last (?P<days>\d+) days, (?P<hours>\d+) hours,'
-                        r' (?P<minutes>\d+) minutes, (?P<seconds>\d+) seconds$')
+        p2 = regex_engine.compile(r'^Displaying logs from the last (?P<days>\d+) days, (?P<hours>\d+) hours,'
+                                  r' (?P<minutes>\d+) minutes, (?P<seconds>\d+) seconds$')
 
         # executing cmd on chassis 2 ...
-        p3 = re.compile(r'^executing cmd on chassis (?P<chassisd>\d+).+$')
+        p3 = regex_engine.compile(r'^executing cmd on chassis (?P<chassisd>\d+).+$')
 
         #  UTM Level [VERBOSE / NOISE / INVALID] ............. 0 / 0 / 0
-        p4 = re.compile(r'^UTM Level \[VERBOSE \/ NOISE \/ INVALID\]\s+\.+\s+(?P<verbose>\d+)'
-                        r' \/ (?P<noise>\d+) \/ (?P<invalid>\d+)$')
+        p4 = regex_engine.compile(r'^UTM Level \[VERBOSE \/ NOISE \/ INVALID\]\s+\.+\s+(?P<verbose>\d+)'
+                                  r' \/ (?P<noise>\d+) \/ (?P<invalid>\d+)$')
 
         #  UTM Level [WARNING / NOTICE / INFO / DEBUG] ....... 0 / 0 / 0 / 0
-        p5 = re.compile(r'^UTM Level \[WARNING \/ NOTICE \/ INFO \/ DEBUG\]\s+\.+\s+(?P<warning>\d+)'
-                        r' \/ (?P<notice>\d+) \/ (?P<info>\d+) \/ (?P<debug>\d+)$')
+        p5 = regex_engine.compile(r'^UTM Level \[WARNING \/ NOTICE \/ INFO \/ DEBUG\]\s+\.+\s+(?P<warning>\d+)'
+                                  r' \/ (?P<notice>\d+) \/ (?P<info>\d+) \/ (?P<debug>\d+)$')
 
         #  UTM Level [EMERGENCY / ALERT / CRITICAL / ERROR] .. 0 / 0 / 0 / 24
-        p6 = re.compile(r'^UTM Level \[EMERGENCY \/ ALERT \/ CRITICAL \/ ERROR\]\s+\.+\s+(?P<emergency>\d+)'
-                        r' \/ (?P<alert>\d+) \/ (?P<critical>\d+) \/ (?P<error>\d+)$')
+        p6 = regex_engine.compile(r'^UTM Level \[EMERGENCY \/ ALERT \/ CRITICAL \/ ERROR\]\s+\.+\s+(?P<emergency>\d+)'
+                                  r' \/ (?P<alert>\d+) \/ (?P<critical>\d+) \/ (?P<error>\d+)$')
 
         #  UTM [LUID NOT FOUND] .............. 0
         #  UTM [PCAP] ........................ 0
@@ -1435,35 +1435,35 @@ class ShowLoggingProcessSmdReverse(ShowLoggingProcessSmdReverseSchema):
         #  UTM [DYN LIB] ..................... 0
         #  UTM [PLAIN TEXT] .................. 0
         #  UTM [ENCODED] ..................... 24
-        p7 = re.compile(r'^UTM \[(?P<utm_name>.+)\] \.+ (?P<utm_value>\d+)$')
+        p7 = regex_engine.compile(r'^UTM \[(?P<utm_name>.+)\] \.+ (?P<utm_value>\d+)$')
 
         #  UTM [Skipped / Rendered / Total] .. 153967 / 24 / 153991
-        p8 = re.compile(r'^UTM \[Skipped \/ Rendered \/ Total\] \.+ (?P<skipped>\d+) \/ (?P<rendered>\d+) \/ (?P<total>\d+)$')
+        p8 = regex_engine.compile(r'^UTM \[Skipped \/ Rendered \/ Total\] \.+ (?P<skipped>\d+) \/ (?P<rendered>\d+) \/ (?P<total>\d+)$')
 
         #  Last UTM TimeStamp ................ 2023/04/27 21:34:17.692905538
         #  First UTM TimeStamp ............... 2023/04/27 20:57:07.075475821
-        p9 = re.compile(r'^(?P<utm_timestamp>(Last|First) UTM TimeStamp) \.+ (?P<date>\S+) (?P<time>\S+)$')
+        p9 = regex_engine.compile(r'^(?P<utm_timestamp>(Last|First) UTM TimeStamp) \.+ (?P<date>\S+) (?P<time>\S+)$')
 
         # ----------------- Decoder Output Information --------------
-        p10 = re.compile(r'^\-+ Decoder Output Information \-+$')
+        p10 = regex_engine.compile(r'^\-+ Decoder Output Information \-+$')
 
         #  MRST Filter Rules ...... 1
-        p11 = re.compile(r'^MRST Filter Rules \.+ (?P<mrst_filter_rules>\d+)$')
+        p11 = regex_engine.compile(r'^MRST Filter Rules \.+ (?P<mrst_filter_rules>\d+)$')
 
         #  UTM Process Filter ..... smd
-        p12 = re.compile(r'^UTM Process Filter \.+ (?P<utm_process_filter>\w+)$')
+        p12 = regex_engine.compile(r'^UTM Process Filter \.+ (?P<utm_process_filter>\w+)$')
 
         #  Total UTM To Process ... 153991
-        p13 = re.compile(r'^Total UTM To Process \.+ (?P<utm_to_process>\d+)$')
+        p13 = regex_engine.compile(r'^Total UTM To Process \.+ (?P<utm_to_process>\d+)$')
 
         #  Total UTF To Process ... 2
-        p14 = re.compile(r'^Total UTF To Process \.+ (?P<utf_to_process>\d+)$')
+        p14 = regex_engine.compile(r'^Total UTF To Process \.+ (?P<utf_to_process>\d+)$')
 
         #  Num of Unique Streams .. 1
-        p15 = re.compile(r'^Num of Unique Streams \.+ (?P<unique_streams>\d+)$')
+        p15 = regex_engine.compile(r'^Num of Unique Streams \.+ (?P<unique_streams>\d+)$')
 
         # 2023/04/27 21:29:51.918681533 {smd_R0-0}{2}: [radius] [30442]: (ERR): Failed to mark Identifier for reuse
-        p16 = re.compile(r'^(?P<date>\S+) (?P<time>\S+) \{.+\}\{.+\}: \[(?P<process>.+)\] \[(?P<pid>\d+)\]: \((?P<message_type>\S+)\): (?P<message>.+)$')
+        p16 = regex_engine.compile(r'^(?P<date>\S+) (?P<time>\S+) \{.+\}\{.+\}: \[(?P<process>.+)\] \[(?P<pid>\d+)\]: \((?P<message_type>\S+)\): (?P<message>.+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -1665,34 +1665,34 @@ class ShowLoggingOnboardRpStandbyUptimeDetail(ShowLoggingOnboardRpStandbyUptimeD
         ret_dict = {}
 
         # First customer power on : 06/22/2021 12:35:40
-        p1 = re.compile(r'^First customer power on :?\s?(?P<first_customer_poweron>(\d+\/){2}\d+ \d+:\d+:\d+)$')
+        p1 = regex_engine.compile(r'^First customer power on :?\s?(?P<first_customer_poweron>(\d+\/){2}\d+ \d+:\d+:\d+)$')
 
         # Total uptime            :  0  years  12 weeks  1  days  17 hours  55 minutes
-        p2 = re.compile(r'^Total uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p2 = regex_engine.compile(r'^Total uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
 
         # Total downtime          :  2177 years  8  weeks  0  days  2  hours  29 minutes
-        p3 = re.compile(r'^Total downtime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p3 = regex_engine.compile(r'^Total downtime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
 
         # Number of resets        : 630
-        p4 = re.compile(r'^Number of resets\s+: (?P<numberof_reset>\d+)$')
+        p4 = regex_engine.compile(r'^Number of resets\s+: (?P<numberof_reset>\d+)$')
 
         # Number of slot changes  : 1
-        p5 = re.compile(r'^Number of slot changes\s+: (?P<numberof_slot_changes>\d+)$')
+        p5 = regex_engine.compile(r'^Number of slot changes\s+: (?P<numberof_slot_changes>\d+)$')
 
         # Current reset reason    : Reload Command
-        p6 = re.compile(r'^Current reset reason\s+: (?P<current_reset_reason>[A-Z a-z]+)$')
+        p6 = regex_engine.compile(r'^Current reset reason\s+: (?P<current_reset_reason>[A-Z a-z]+)$')
 
         # Current reset timestamp : 10/06/2019 01:28:26
-        p7 = re.compile(r'^Current reset timestamp\s+: (?P<current_reset_timestamp>(\d+\/){2}\d+.*)$')
+        p7 = regex_engine.compile(r'^Current reset timestamp\s+: (?P<current_reset_timestamp>(\d+\/){2}\d+.*)$')
 
         # Current slot            : 1
-        p8 = re.compile(r'^Current slot\s+: (?P<current_slot>\d+)$')
+        p8 = regex_engine.compile(r'^Current slot\s+: (?P<current_slot>\d+)$')
 
         # Chassis type            : 80
-        p9 = re.compile(r'^Chassis type\s+: (?P<chassis_type>.+?)$')
+        p9 = regex_engine.compile(r'^Chassis type\s+: (?P<chassis_type>.+?)$')
 
         # Current uptime          :  0  years  1  weeks  1  days  0  hours  0  minutes
-        p10 = re.compile(r'^Current uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p10 = regex_engine.compile(r'^Current uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
 
         # --------------------------------------------------------------------------------
         # Time Stamp          | Reset                       | Uptime
@@ -1701,7 +1701,7 @@ class ShowLoggingOnboardRpStandbyUptimeDetail(ShowLoggingOnboardRpStandbyUptimeD
         # 04/02/2022 21:32:31   EHSA standby down             0     0     0     0     13
         # 04/02/2022 22:11:32   Reload Command                0     0     0     0     38
 
-        p11 = re.compile(r'^(?P<time_stamp>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<reset_reason>.+?)\s+?(?P<uptime_years>\d+)\s+(?P<uptime_weeks>\d+)\s+(?P<uptime_days>\d+)\s+(?P<uptime_hours>\d+)\s+(?P<uptime_minutes>\d+)$')
+        p11 = regex_engine.compile(r'^(?P<time_stamp>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<reset_reason>.+?)\s+?(?P<uptime_years>\d+)\s+(?P<uptime_weeks>\d+)\s+(?P<uptime_days>\d+)\s+(?P<uptime_hours>\d+)\s+(?P<uptime_minutes>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1840,15 +1840,15 @@ class ShowLoggingProcess(ShowLoggingProcessSchema):
         ret_dict = {}
 
         #Logging display requested on 2024/08/22 04:14:42 (PDT) for Hostname: [hendrix], Model: [C9350-48HX], Version: [17.16.01], SN: [FOC27361DWU], MD_SN: [FOC2743Y44V]
-        p1 = re.compile(r'^Logging +display +requested +on +'
-                        r'(?P<date_time>\d+\/\d+\/\d+ +\d+\:\d+\:\d+ +\(\w+\)) +for +'
-                        r'Hostname\: +\[(?P<hostname>\w+)\]\, +'
-                        r'Model\: +\[(?P<model>\S+)\]\, +'
-                        r'Version\: +\[(?P<version>\d+\.\d+\.\d+)\]\, +'
-                        r'SN\: +\[(?P<sn>\S+)\]\, +MD_SN\: +\[(?P<md_sn>\S+)\]$')
+        p1 = regex_engine.compile(r'^Logging +display +requested +on +'
+                                  r'(?P<date_time>\d+\/\d+\/\d+ +\d+\:\d+\:\d+ +\(\w+\)) +for +'
+                                  r'Hostname\: +\[(?P<hostname>\w+)\]\, +'
+                                  r'Model\: +\[(?P<model>\S+)\]\, +'
+                                  r'Version\: +\[(?P<version>\d+\.\d+\.\d+)\]\, +'
+                                  r'SN\: +\[(?P<sn>\S+)\]\, +MD_SN\: +\[(?P<md_sn>\S+)\]$')
 
         #Displaying logs from the last 2 days, 1 hours, 54 minutes, 14 seconds
-        p2 = re.compile(r'^Displaying +logs +from +the +last +(?P<time_period>.*)$')
+        p2 = regex_engine.compile(r'^Displaying +logs +from +the +last +(?P<time_period>.*)$')
 
 
         for line in output.splitlines():
@@ -3,11 +3,13 @@ IOSXE parser for the following show command:
   * show lslib producer all lscache links detail
 '''
 
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And, \
     Default, Use
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 class ShowLslibProducerAllLscacheLinksDetailSchema(MetaParser):
@@ -81,145 +83,145 @@ class ShowLslibProducerAllLscacheLinksDetail(ShowLslibProducerAllLscacheLinksDet
         parsed_dict = {}
 
         # Type: Link
-        p0 = re.compile(r'^Type: (?P<type>[\w]+)$')
+        p0 = regex_engine.compile(r'^Type: (?P<type>[\w]+)$')
 
         # Protocol: ISIS L1
-        p1 = re.compile(r'^Protocol: (?P<protocol>[\w ]+)$')
+        p1 = regex_engine.compile(r'^Protocol: (?P<protocol>[\w ]+)$')
 
         # Identifier: 0x0
-        p2 = re.compile(r'^Identifier: (?P<identifier>[\w]+)$')
+        p2 = regex_engine.compile(r'^Identifier: (?P<identifier>[\w]+)$')
 
         # Local Node Descriptor:
-        p3 = re.compile(r'^Local Node Descriptor:$')
+        p3 = regex_engine.compile(r'^Local Node Descriptor:$')
 
         # Remote Node Descriptor:
-        p4 = re.compile(r'^Remote Node Descriptor:$')
+        p4 = regex_engine.compile(r'^Remote Node Descriptor:$')
 
         # Link Descriptor:
-        p5 = re.compile(r'^Link Descriptor:$')
+        p5 = regex_engine.compile(r'^Link Descriptor:$')
 
         # Merged Link Attributes:
-        p6 = re.compile(r'^Merged Link Attributes:$')
+        p6 = regex_engine.compile(r'^Merged Link Attributes:$')
 
         # AS Number: 50
-        p7 = re.compile(r'^AS Number: (?P<asnum>[\d]+)$')
+        p7 = regex_engine.compile(r'^AS Number: (?P<asnum>[\d]+)$')
 
         # BGP Identifier: 0.0.0.0
-        p8 = re.compile(r'^BGP Identifier: (?P<bgpid>[\w.]+)$')
+        p8 = regex_engine.compile(r'^BGP Identifier: (?P<bgpid>[\w.]+)$')
 
         # Area ID: 0.0.0.0
-        p9 = re.compile(r'^Area ID: (?P<areaid>[\w.]+)$')
+        p9 = regex_engine.compile(r'^Area ID: (?P<areaid>[\w.]+)$')
 
         # Router ID IPv4: 22.2.2.2
-        p10 = re.compile(r'^Router ID IPv4: (?P<routerid>[\w.]+)$')
+        p10 = regex_engine.compile(r'^Router ID IPv4: (?P<routerid>[\w.]+)$')
 
         # ISO Node ID: 2222.2222.2222
-        p17 = re.compile(r'^ISO Node ID: (?P<isonode>[\w.]+)$')
+        p17 = regex_engine.compile(r'^ISO Node ID: (?P<isonode>[\w.]+)$')
 
         # Link ID: 1.2
-        p11 = re.compile(r'^Link ID: (?P<linkid>[\d.]+)$')
+        p11 = regex_engine.compile(r'^Link ID: (?P<linkid>[\d.]+)$')
 
         # Local Interface Address IPv4: 1.2.0.12
-        p12 = re.compile(r'^Local Interface Address IPv4: (?P<localintfaddr>[\w.]+)$')
+        p12 = regex_engine.compile(r'^Local Interface Address IPv4: (?P<localintfaddr>[\w.]+)$')
 
         # Neighbor Interface Address IPv4: 1.2.0.21
-        p13 = re.compile(r'^Neighbor Interface Address IPv4: (?P<Neighborintfaddr>[\w.]+)$')
+        p13 = regex_engine.compile(r'^Neighbor Interface Address IPv4: (?P<Neighborintfaddr>[\w.]+)$')
 
         # Multi-Topology: 121x7
-        p18 = re.compile(r'^Multi-Topology: (?P<multi_topo>[\w]+)$')
+        p18 = regex_engine.compile(r'^Multi-Topology: (?P<multi_topo>[\w]+)$')
 
         # Internal flags: 0x0
-        p14 = re.compile(r'^Internal flags: (?P<internal_flag>[\d\w]+)$')
+        p14 = regex_engine.compile(r'^Internal flags: (?P<internal_flag>[\d\w]+)$')
 
         # Action: Update
-        p15 = re.compile(r'^Action: (?P<action>[\w]+)$')
+        p15 = regex_engine.compile(r'^Action: (?P<action>[\w]+)$')
 
         # Metric: 10
-        p16 = re.compile(r'^Metric: (?P<metric>[\d]+)$')
+        p16 = regex_engine.compile(r'^Metric: (?P<metric>[\d]+)$')
 
         # Admin-group: 0x00000001
-        p19 = re.compile(r'^Admin-group: (?P<admin_group>[\w]+)$')
+        p19 = regex_engine.compile(r'^Admin-group: (?P<admin_group>[\w]+)$')
 
         # Max-link-bw (kbits/sec): 9
-        p20 = re.compile(r'^Max-link-bw \(kbits\/sec\): (?P<max_link>[\d]+)$')
+        p20 = regex_engine.compile(r'^Max-link-bw \(kbits\/sec\): (?P<max_link>[\d]+)$')
 
         # Max-reserv-link-bw (kbits/sec): 17
-        p21 = re.compile(r'^Max-reserv-link-bw \(kbits\/sec\): (?P<max_res_link>[\d]+)$')
+        p21 = regex_engine.compile(r'^Max-reserv-link-bw \(kbits\/sec\): (?P<max_res_link>[\d]+)$')
 
         # TE-default-metric: 301989888
-        p22 = re.compile(r'^TE-default-metric: (?P<te_metric>[\d]+)$')
+        p22 = regex_engine.compile(r'^TE-default-metric: (?P<te_metric>[\d]+)$')
 
         # ADJ-SID:
-        p23 = re.compile(r'^ADJ-SID:$')
+        p23 = regex_engine.compile(r'^ADJ-SID:$')
 
         # LAN-ADJ-SID:
-        p25 = re.compile(r'^LAN-ADJ-SID:$')
+        p25 = regex_engine.compile(r'^LAN-ADJ-SID:$')
 
         # 18(0x1)
         # 4608(0x2)(18.0.18.0)
-        p26 = re.compile(r'(?P<sid>[\d()x]+\((\d+.)+)$')
+        p26 = regex_engine.compile(r'(?P<sid>[\d()x]+\((\d+.)+)$')
 
         #ASLA:
-        p27 = re.compile(r'^ASLA:$')
+        p27 = regex_engine.compile(r'^ASLA:$')
 
         #SABM:(4,
-        p28 = re.compile(r'^SABM: (?P<sabm>[(\d,]+)*$')
+        p28 = regex_engine.compile(r'^SABM: (?P<sabm>[(\d,]+)*$')
 
-        p29 = re.compile(r'^(?P<sab>[\s+\d+x+[\d]+\))$')
+        p29 = regex_engine.compile(r'^(?P<sab>[\s+\d+x+[\d]+\))$')
 
         # Link-protection-type: 0x1200
-        p30 = re.compile(r'^Link-protection-type: (?P<link_protection>[\w]+)$')
+        p30 = regex_engine.compile(r'^Link-protection-type: (?P<link_protection>[\w]+)$')
 
         # MPLS-proto-mask: 0x12
-        p31 = re.compile(r'^MPLS-proto-mask: (?P<mpls_proto>[\w]+)$')
+        p31 = regex_engine.compile(r'^MPLS-proto-mask: (?P<mpls_proto>[\w]+)$')
 
         # Link-name: L12
-        p32 = re.compile(r'^Link-name: (?P<link_name>[\w]+)$')
+        p32 = regex_engine.compile(r'^Link-name: (?P<link_name>[\w]+)$')
 
         # Link-delay (us): 1179648 (A)
-        p33 = re.compile(r'^Link-delay \(us\): (?P<link_delay>[\w]+).*$')
+        p33 = regex_engine.compile(r'^Link-delay \(us\): (?P<link_delay>[\w]+).*$')
 
         # Min-delay (us): 18 Max-delay (us): 1179666
-        p34 = re.compile(r'^Min-delay \(us\): (?P<min_delay>[\d]+) Max-delay \(us\): (?P<max_delay>[\d]+)$')
+        p34 = regex_engine.compile(r'^Min-delay \(us\): (?P<min_delay>[\d]+) Max-delay \(us\): (?P<max_delay>[\d]+)$')
 
         # Delay-variation (us): 1184274
-        p35 = re.compile(r'^Delay-variation \(us\): (?P<delay_var>[\d]+)$')
+        p35 = regex_engine.compile(r'^Delay-variation \(us\): (?P<delay_var>[\d]+)$')
 
         # Link-loss (%): 18 * 0.000003 (A)
-        p36 = re.compile(r'^Link-loss \(%\): (?P<link_loss>.*)')
+        p36 = regex_engine.compile(r'^Link-loss \(%\): (?P<link_loss>.*)')
 
         # Residual-bw (kbits/sec): 9
-        p37 = re.compile(r'^Residual-bw \(kbits\/sec\): (?P<res>[\d]+)$')
+        p37 = regex_engine.compile(r'^Residual-bw \(kbits\/sec\): (?P<res>[\d]+)$')
 
         # Available-bw (kbits/sec): 9
-        p38 = re.compile(r'^Available-bw \(kbits\/sec\): (?P<available_bw>[\d]+)$')
+        p38 = regex_engine.compile(r'^Available-bw \(kbits\/sec\): (?P<available_bw>[\d]+)$')
 
         # Utilized-bw (kbits/sec): 9
-        p39 = re.compile(r'^Utilized-bw \(kbits\/sec\): (?P<utilized_bw>[\d]+)$')
+        p39 = regex_engine.compile(r'^Utilized-bw \(kbits\/sec\): (?P<utilized_bw>[\d]+)$')
 
         # Max-unreserv-link-bw (kbits/sec):
-        p40 = re.compile(r'^Max-unreserv-link-bw \(kbits\/sec\):$')
+        p40 = regex_engine.compile(r'^Max-unreserv-link-bw \(kbits\/sec\):$')
 
         # Opaque-link-attr:
-        p41 = re.compile(r'^Opaque-link-attr:$')
+        p41 = regex_engine.compile(r'^Opaque-link-attr:$')
 
         # 0x4C.0x69.0x6E.0x6B.0x20.0x4F.0x6E.0x65.0x20.0x54.0x77
-        p41_1 = re.compile(r'^(?P<opaque>(\w*\.)+.*)$')
+        p41_1 = regex_engine.compile(r'^(?P<opaque>(\w*\.)+.*)$')
 
         # SRLG:
-        p42 = re.compile(r'^SRLG:$')
+        p42 = regex_engine.compile(r'^SRLG:$')
 
         # 18         4608       1184256    303174144
-        p43 = re.compile(r'^(?P<srlg_links>(\d+\s+)+)')
+        p43 = regex_engine.compile(r'^(?P<srlg_links>(\d+\s+)+)')
 
         # Link Attributes of Group 0x1:
-        p44 = re.compile(r'^Link Attributes of Group.*$')
+        p44 = regex_engine.compile(r'^Link Attributes of Group.*$')
 
         # Extended Admin-group:
-        p45 = re.compile(r'^Extended Admin-group:$')
+        p45 = regex_engine.compile(r'^Extended Admin-group:$')
 
         # 0x00000001 0x00000002 0x00000004 0x00000008
-        p46 = re.compile(r'^(?P<ext_admin>(\dx\w+\s*)+$)')
+        p46 = regex_engine.compile(r'^(?P<ext_admin>(\dx\w+\s*)+$)')
 
         sabm = ''
         link_attr = False
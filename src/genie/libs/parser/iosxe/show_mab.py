@@ -11,6 +11,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================================
 #  Schema for show mab all details
@@ -46,18 +49,18 @@ class ShowMabAllDetails(ShowMabAllDetailsSchema):
         cmd = 'show mab all details'
 
         # MAB details for GigabitEthernet2/0/2
-        p1 = re.compile(r'(^MAB\s+details\s+for)\s*(.*)')
+        p1 = regex_engine.compile(r'(^MAB\s+details\s+for)\s*(.*)')
         # Mac-Auth-Bypass = Enabled
-        p2 = re.compile(r'(^Mac-Auth-Bypass)\s*=\s*(?P<mac_auth_bypass>.*)')
+        p2 = regex_engine.compile(r'(^Mac-Auth-Bypass)\s*=\s*(?P<mac_auth_bypass>.*)')
         # MAB Client List
-        p3 = re.compile(r'(^MAB\s+Client\s+List)\s*')
+        p3 = regex_engine.compile(r'(^MAB\s+Client\s+List)\s*')
         
         # My Client MAC = 0000.0001.0003
         # My Session ID = 000000000000000C82FA130E
         # My Authen Status = SUCCESS
-        p4 = re.compile(r'(^My)\s+(\w+\s+\w+)\s*=\s*(.*)')
+        p4 = regex_engine.compile(r'(^My)\s+(\w+\s+\w+)\s*=\s*(.*)')
         # My MAB SM state = TERMINATE
-        p5 = re.compile(r'(^My\s*MAB\s*SM\s*state)\s*=\s*(?P<mab_sm_state>.*)')
+        p5 = regex_engine.compile(r'(^My\s*MAB\s*SM\s*state)\s*=\s*(?P<mab_sm_state>.*)')
 
         ret_dict = {}
         interface_dict = {}
@@ -148,7 +151,7 @@ class ShowMabAllSummary(ShowMabAllSummarySchema):
         ret_dict = {}
 
         # Gi1/0/5         0005.0000.0001  SUCCESS
-        p1 = re.compile(r'^(?P<interface>\S+) +(?P<mac>\S+) +(?P<auth_status>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+) +(?P<mac>\S+) +(?P<auth_status>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -5,9 +5,6 @@ IOSXE parsers for the following show commands:
     * show mac address-table dynamic vlan {vlan_id}
     * show mac address-table count
 '''
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -19,6 +16,7 @@ from genie.metaparser.util.schemaengine import Schema, \
     Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -62,10 +60,10 @@ class ShowMacAddressTableDynamic(ShowMacAddressTableDynamicSchema):
             out = output
         # initial return dictionary
         vlan_dict = {}
-        p1 = re.compile(r'(?P<vlan_id>\d+) +'
-                    r'(?P<mac>([a-zA-Z0-9]+\.){2}[a-zA-Z0-9]+) +'
-                    r'(?P<type>\w+) +'
-                    r'(?P<port>\S+)')
+        p1 = regex_engine.compile(r'(?P<vlan_id>\d+) +'
+                              r'(?P<mac>([a-zA-Z0-9]+\.){2}[a-zA-Z0-9]+) +'
+                              r'(?P<type>\w+) +'
+                              r'(?P<port>\S+)')
 
         port_count = 1
         for line in out.splitlines():
@@ -111,13 +109,13 @@ class ShowMacAddressTableCountSummary(ShowMacAddressTableCountSummarySchema):
         ret_dict = {}
 
         #Total Dynamic Address Count  : 15
-        p1 = re.compile(r'Total\s+Dynamic\s+Address\s+Count\s+:\s+(?P<dynamic_count>\d+)')
+        p1 = regex_engine.compile(r'Total\s+Dynamic\s+Address\s+Count\s+:\s+(?P<dynamic_count>\d+)')
         #Total Static  Address Count  : 0
-        p2 = re.compile(r'Total\s+Static\s+Address\s+Count\s+:\s+(?P<static_count>\d+)')
+        p2 = regex_engine.compile(r'Total\s+Static\s+Address\s+Count\s+:\s+(?P<static_count>\d+)')
         #Total Mac Address In Use     : 15
-        p3 = re.compile(r'Total\s+Mac\s+Address\s+In\s+Use\s+:\s+(?P<total_mac>\d+)')
+        p3 = regex_engine.compile(r'Total\s+Mac\s+Address\s+In\s+Use\s+:\s+(?P<total_mac>\d+)')
         #Total Mac Address Space Available: 65521
-        p4 = re.compile(r'Total\s+Mac\s+Address\s+Space\s+Available:\s+(?P<total_mac_space>\d+)')
+        p4 = regex_engine.compile(r'Total\s+Mac\s+Address\s+Space\s+Available:\s+(?P<total_mac_space>\d+)')
         for line in output.splitlines():
             line = line.strip()
             #Total Dynamic Address Count  : 15
@@ -172,13 +170,13 @@ class ShowMacAddressTableCountVlan(ShowMacAddressTableCountVlanSchema):
             output = self.device.execute(self.cli_command.format(vlan_id=vlan_id))
         ret_dict = {}
         #Dynamic Address Count  : 15
-        p1 = re.compile(r'^Dynamic\s+Address\s+Count\s+:\s+(?P<dynamic_count>\d+)$')
+        p1 = regex_engine.compile(r'^Dynamic\s+Address\s+Count\s+:\s+(?P<dynamic_count>\d+)$')
         #Static  Address Count  : 0
-        p2 = re.compile(r'^Static\s+Address\s+Count\s+:\s+(?P<static_count>\d+)$')
+        p2 = regex_engine.compile(r'^Static\s+Address\s+Count\s+:\s+(?P<static_count>\d+)$')
         #Total Mac Address In Use     : 15
-        p3 = re.compile(r'^Total\s+Mac\s+Addresses\s+:\s+(?P<mac>\d+)$')
+        p3 = regex_engine.compile(r'^Total\s+Mac\s+Addresses\s+:\s+(?P<mac>\d+)$')
         #Total Mac Address Space Available: 65521
-        p4 = re.compile(r'^Total\s+Mac\s+Address\s+Space\s+Available:\s+(?P<total_mac_space>\d+)$')
+        p4 = regex_engine.compile(r'^Total\s+Mac\s+Address\s+Space\s+Available:\s+(?P<total_mac_space>\d+)$')
         for line in output.splitlines():
             line = line.strip()
             #Total Dynamic Address Count  : 15
@@ -239,21 +237,21 @@ class ShowMacAddressTableCount(ShowMacAddressTableCountSchema):
             output = self.device.execute(self.cli_command)
 
         # Mac Entries for Vlan 1:
-        p1 = re.compile(r"^Mac\s+Entries\s+for\s+Vlan\s+(?P<vlan>\d+):$")
+        p1 = regex_engine.compile(r"^Mac\s+Entries\s+for\s+Vlan\s+(?P<vlan>\d+):$")
         # Static  Address Count  : 1
-        p1_1 = re.compile(r"^Static\s+Address\s+Count\s+:\s+(?P<static_address_count>\d+)$")
+        p1_1 = regex_engine.compile(r"^Static\s+Address\s+Count\s+:\s+(?P<static_address_count>\d+)$")
         # Dynamic Address Count  : 8
-        p2 = re.compile(r"^Dynamic\s+Address\s+Count\s+:\s+(?P<dynamic_address_count>\d+)$")
+        p2 = regex_engine.compile(r"^Dynamic\s+Address\s+Count\s+:\s+(?P<dynamic_address_count>\d+)$")
         # Total Mac Addresses    : 9
-        p3 = re.compile(r"^Total\s+Mac\s+Addresses\s+:\s+(?P<total_mac_address>\d+)$")
+        p3 = regex_engine.compile(r"^Total\s+Mac\s+Addresses\s+:\s+(?P<total_mac_address>\d+)$")
         # Total Dynamic Address Count  : 32776
-        p4 = re.compile(r"^Total\s+Dynamic\s+Address\s+Count\s+:\s+(?P<total_dynamic_address_count>\d+)$")
+        p4 = regex_engine.compile(r"^Total\s+Dynamic\s+Address\s+Count\s+:\s+(?P<total_dynamic_address_count>\d+)$")
         # Total Static  Address Count  : 2
-        p5 = re.compile(r"^Total\s+Static\s+Address\s+Count\s+:\s+(?P<total_static_address_count>\d+)$")
+        p5 = regex_engine.compile(r"^Total\s+Static\s+Address\s+Count\s+:\s+(?P<total_static_address_count>\d+)$")
         # Total Mac Address In Use     : 32778
-        p6 = re.compile(r"^Total\s+Mac\s+Address\s+In\s+Use\s+:\s+(?P<total_mac_address_in_use>\d+)$")
+        p6 = regex_engine.compile(r"^Total\s+Mac\s+Address\s+In\s+Use\s+:\s+(?P<total_mac_address_in_use>\d+)$")
         # Total Mac Address Space Available: 98294
-        p7 = re.compile(r"^Total\s+Mac\s+Address\s+Space\s+Available:\s+(?P<total_mac_address_space>\d+)$")
+        p7 = regex_engine.compile(r"^Total\s+Mac\s+Address\s+Space\s+Available:\s+(?P<total_mac_address_space>\d+)$")
 
         ret_dict = {}
 
@@ -339,7 +337,7 @@ class ShowMacAddresstableDynamicVlanCount(ShowMacAddresstableDynamicVlanCountSch
 
         # Number of lines which match regexp = 6500
         # Number of lines which match regexp = 10
-        p1 = re.compile(r"^Number of lines which match regexp\s+= (?P<number_of_lines>\d+)$")
+        p1 = regex_engine.compile(r"^Number of lines which match regexp\s+= (?P<number_of_lines>\d+)$")
 
         ret_dict = {}
 
@@ -400,7 +398,7 @@ class ShowPlatformSoftwareMatmSwitchTable(ShowPlatformSoftwareMatmSwitchTableSch
         # Tbl_Type   Tbl_ID  Num_MAC  Aging  AOM_ID/OM_PTR
         # MAT_VLAN        1        4    300  205 created
         # MAT_VLAN       10        1    300  524 created
-        p1 = re.compile(r'^(?P<tbl_type>\S+) *(?P<tbl_id>\d+) *(?P<num_mac>\d+) *(?P<aging>\d+) *(?P<aom_id_om_ptr>.*)$')
+        p1 = regex_engine.compile(r'^(?P<tbl_type>\S+) *(?P<tbl_id>\d+) *(?P<num_mac>\d+) *(?P<aging>\d+) *(?P<aom_id_om_ptr>.*)$')
         for line in output.splitlines():
             line = line.strip()
             # MAT_VLAN        1        4    300  205 created
@@ -5,13 +5,13 @@
     * show macro auto device
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowMacroAutoDeviceSchema(MetaParser):
     '''Schema for show macro auto device'''
@@ -45,22 +45,22 @@ class ShowMacroAutoDevice(ShowMacroAutoDeviceSchema):
                 output = self.device.execute(self.cli_command[1])
         
         # Device:access-point
-        p1 = re.compile(r'^Device:(?P<device>\S+)$')
+        p1 = regex_engine.compile(r'^Device:(?P<device>\S+)$')
 
         # Default Macro:CISCO_AP_AUTO_SMARTPORT
-        p2 = re.compile(r'^Default Macro:(?P<default>\S+)$')
+        p2 = regex_engine.compile(r'^Default Macro:(?P<default>\S+)$')
         
         # Current Macro:CISCO_AP_AUTO_SMARTPORT
-        p3 = re.compile(r'^Current Macro:(?P<current>\S+)$')
+        p3 = regex_engine.compile(r'^Current Macro:(?P<current>\S+)$')
 
         # Configurable Parameters:NATIVE_VLAN
-        p4 = re.compile(r'^Configurable Parameters:(?P<configurable>.+)$')
+        p4 = regex_engine.compile(r'^Configurable Parameters:(?P<configurable>.+)$')
 
         # Defaults Parameters:NATIVE_VLAN=1
-        p5 = re.compile(r'^Defaults Parameters:(?P<defaults>.+)$')
+        p5 = regex_engine.compile(r'^Defaults Parameters:(?P<defaults>.+)$')
 
         # Current Parameters:NATIVE_VLAN=1
-        p6 = re.compile(r'^Current Parameters:(?P<current>.+)$')
+        p6 = regex_engine.compile(r'^Current Parameters:(?P<current>.+)$')
 
         ret_dict= dict()
 
@@ -135,7 +135,7 @@ class ShowMacroAutoAddressgroup(ShowMacroAutoAddressgroupSchema):
         # Group Name                      OUI         MAC ADDRESS
         # --------------------------------------------------------------
         # test_add                                    1111.2222.3333
-        p1 = re.compile(r'^(?P<group_name>\S+)\s+(?P<oui>\S*)\s+(?P<mac_address>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<group_name>\S+)\s+(?P<oui>\S*)\s+(?P<mac_address>\S+)$')
         
         ret_dict= dict()
         
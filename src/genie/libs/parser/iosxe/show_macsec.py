@@ -1,8 +1,8 @@
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Any
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -58,14 +58,14 @@ class ShowMacsecSummary(ShowMacsecSummarySchema):
         # Te2/0/13                           1                   1
         # port-channel1                      1                   2
         # Fif1/6/0/32.2001                   1                   2
-        p1 = re.compile(r'^(?P<interface>[\w\s\.\-\/]+)\s+(?P<transmit_sc>\d+)\s+(?P<receive_sc>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>[\w\s\.\-\/]+)\s+(?P<transmit_sc>\d+)\s+(?P<receive_sc>\d+)$')
 
         # TenGigabitEthernet0/0/0                 One tag-in-clear                 1
         # TenGigabitEthernet0/0/1                 One tag-in-clear
-        p2 = re.compile(r'^(?P<interface>[\w\.\-\/]+)\s+(?P<extension>\w+\s[\w\-]+)\s*(?P<installed_rx_sc>\d+)?$')
+        p2 = regex_engine.compile(r'^(?P<interface>[\w\.\-\/]+)\s+(?P<extension>\w+\s[\w\-]+)\s*(?P<installed_rx_sc>\d+)?$')
 
         # TenGigabitEthernet0/0/0.10   :        1       10
-        p3 = re.compile(r'^(?P<interface>[\w\.\/]+)\s+\:\s+(?P<receive_sc>\d+)\s*(?P<vlan>\d+)?$')
+        p3 = regex_engine.compile(r'^(?P<interface>[\w\.\/]+)\s+\:\s+(?P<receive_sc>\d+)\s*(?P<vlan>\d+)?$')
 
         ret_dict = {}
 
@@ -148,7 +148,7 @@ class ShowMacsecPost(ShowMacsecPostSchema):
         # --------------------------------------------------------------
         # TenGigabitEthernet0/0/0                             NONE
 
-        p1 = re.compile(r"^\s*(?P<macsec_capable_interface>\S+)\s+(?P<post_result>\S+)\s*$")
+        p1 = regex_engine.compile(r"^\s*(?P<macsec_capable_interface>\S+)\s+(?P<post_result>\S+)\s*$")
 
         ret_dict = {}
 
@@ -240,97 +240,97 @@ class ShowMacsecStatisticsInterface(ShowMacsecStatisticsInterfaceSchema):
         ret_dict = {}
 
         #  Ingress Untag Pkts:       0
-        p1 = re.compile(r'^Ingress\s+Untag\s+Pkts:\s+(?P<ingress_untag_pkts>\d+)$')
+        p1 = regex_engine.compile(r'^Ingress\s+Untag\s+Pkts:\s+(?P<ingress_untag_pkts>\d+)$')
 
         #   Ingress No Tag Pkts:      0
-        p2 = re.compile(r'^Ingress\s+No\s+Tag\s+Pkts:\s+(?P<ingress_no_tag_pkts>\d+)$')
+        p2 = regex_engine.compile(r'^Ingress\s+No\s+Tag\s+Pkts:\s+(?P<ingress_no_tag_pkts>\d+)$')
 
         #   Ingress Bad Tag Pkts:     0
-        p3 = re.compile(r'^Ingress\s+Bad\s+Tag\s+Pkts:\s+(?P<ingress_bad_tag_pkts>\d+)$')
+        p3 = regex_engine.compile(r'^Ingress\s+Bad\s+Tag\s+Pkts:\s+(?P<ingress_bad_tag_pkts>\d+)$')
 
         #   Ingress Unknown SCI Pkts: 0
-        p4 = re.compile(r'^Ingress\s+Unknown\s+SCI\s+Pkts:\s+(?P<ingress_unknown_sci_pkts>\d+)$')
+        p4 = regex_engine.compile(r'^Ingress\s+Unknown\s+SCI\s+Pkts:\s+(?P<ingress_unknown_sci_pkts>\d+)$')
 
         #   Ingress No SCI Pkts:      0
-        p5 = re.compile(r'^Ingress\s+No\s+SCI\s+Pkts:\s+(?P<ingress_no_sci_pkts>\d+)$')
+        p5 = regex_engine.compile(r'^Ingress\s+No\s+SCI\s+Pkts:\s+(?P<ingress_no_sci_pkts>\d+)$')
 
         #   Ingress Overrun Pkts:     0
-        p6 = re.compile(r'^Ingress\s+Overrun\s+Pkts:\s+(?P<ingress_overrun_pkts>\d+)$')
+        p6 = regex_engine.compile(r'^Ingress\s+Overrun\s+Pkts:\s+(?P<ingress_overrun_pkts>\d+)$')
 
         #   Ingress Validated Octets: 0
-        p7 = re.compile(r'^Ingress\s+Validated\s+Octets:\s+(?P<ingress_validated_octets>\d+)$')
+        p7 = regex_engine.compile(r'^Ingress\s+Validated\s+Octets:\s+(?P<ingress_validated_octets>\d+)$')
 
         #   Ingress Decrypted Octets: 184493007008
-        p8 = re.compile(r'^Ingress\s+Decrypted\s+Octets:\s+(?P<ingress_decrypted_octets>\d+)$')
+        p8 = regex_engine.compile(r'^Ingress\s+Decrypted\s+Octets:\s+(?P<ingress_decrypted_octets>\d+)$')
 
         #   Egress Untag Pkts:        0
-        p9 = re.compile(r'^Egress\s+Untag\s+Pkts:\s+(?P<egress_untag_pkts>\d+)$')
+        p9 = regex_engine.compile(r'^Egress\s+Untag\s+Pkts:\s+(?P<egress_untag_pkts>\d+)$')
 
         #   Egress Too Long Pkts:     0
-        p10 = re.compile(r'^Egress\s+Too\s+Long\s+Pkts:\s+(?P<egress_too_long_pkts>\d+)$')
+        p10 = regex_engine.compile(r'^Egress\s+Too\s+Long\s+Pkts:\s+(?P<egress_too_long_pkts>\d+)$')
 
         #   Egress Protected Octets:  0
-        p11 = re.compile(r'^Egress\s+Protected\s+Octets:\s+(?P<egress_protected_octets>\d+)$')
+        p11 = regex_engine.compile(r'^Egress\s+Protected\s+Octets:\s+(?P<egress_protected_octets>\d+)$')
 
         #   Egress Encrypted Octets:  3519888
-        p12 = re.compile(r'^Egress\s+Encrypted\s+Octets:\s+(?P<egress_encrypted_octets>\d+)$')
+        p12 = regex_engine.compile(r'^Egress\s+Encrypted\s+Octets:\s+(?P<egress_encrypted_octets>\d+)$')
 
         #   IF In Octets:             186176188032
-        p13 = re.compile(r'^IF\s+In\s+Octets:\s+(?P<if_in_octects>\d+)$')
+        p13 = regex_engine.compile(r'^IF\s+In\s+Octets:\s+(?P<if_in_octects>\d+)$')
 
         #   IF In Packets:            134202116
-        p14 = re.compile(r'^IF\s+In\s+Packets:\s+(?P<if_in_packets>\d+)$')
+        p14 = regex_engine.compile(r'^IF\s+In\s+Packets:\s+(?P<if_in_packets>\d+)$')
 
         #   IF In Discard:            0
-        p15 = re.compile(r'^IF\s+In\s+Discard:\s+(?P<if_in_discard>\d+)$')
+        p15 = regex_engine.compile(r'^IF\s+In\s+Discard:\s+(?P<if_in_discard>\d+)$')
 
         #   IF In Errors:             0
-        p16 = re.compile(r'^IF\s+In\s+Errors:\s+(?P<if_in_errors>\d+)$')
+        p16 = regex_engine.compile(r'^IF\s+In\s+Errors:\s+(?P<if_in_errors>\d+)$')
 
         #   IF Out Octets:            3623448
-        p17 = re.compile(r'^IF\s+Out\s+Octets:\s+(?P<if_out_octects>\d+)$')
+        p17 = regex_engine.compile(r'^IF\s+Out\s+Octets:\s+(?P<if_out_octects>\d+)$')
 
         #   IF Out Packets:           8630
-        p18 = re.compile(r'^IF\s+Out\s+Packets:\s+(?P<if_out_packets>\d+)$')
+        p18 = regex_engine.compile(r'^IF\s+Out\s+Packets:\s+(?P<if_out_packets>\d+)$')
 
         #   IF Out Errors:            0
-        p19 = re.compile(r'^IF\s+Out\s+Errors:\s+(?P<if_out_errors>\d+)$')
+        p19 = regex_engine.compile(r'^IF\s+Out\s+Errors:\s+(?P<if_out_errors>\d+)$')
 
         #Transmit SC Counters (SCI: 44881699B510001C)
-        p20 = re.compile(r'^Transmit SC Counters \(SCI: (?P<sci>\w+)\)$')
+        p20 = regex_engine.compile(r'^Transmit SC Counters \(SCI: (?P<sci>\w+)\)$')
 
         #   Out Pkts Protected:       0
-        p21 = re.compile(r'^Out\s+Pkts\s+Protected:\s+(?P<out_pkts_protected>\d+)$')
+        p21 = regex_engine.compile(r'^Out\s+Pkts\s+Protected:\s+(?P<out_pkts_protected>\d+)$')
 
         #   out_pkts_encrypted:       8630
-        p22 = re.compile(r'^Out\s+Pkts\s+Encrypted:\s+(?P<out_pkts_encrypted>\d+)$')
+        p22 = regex_engine.compile(r'^Out\s+Pkts\s+Encrypted:\s+(?P<out_pkts_encrypted>\d+)$')
 
         # Receive SA Counters (SCI: A44C119DF89C001E  AN 0)
-        p23 = re.compile(r'^Receive\s+SA\s+Counters\s+\(SCI:\s+(?P<sci>\S+)\s+AN\s+(?P<an>\S+)\)$')
+        p23 = regex_engine.compile(r'^Receive\s+SA\s+Counters\s+\(SCI:\s+(?P<sci>\S+)\s+AN\s+(?P<an>\S+)\)$')
 
         #   In Pkts Unchecked:        0
-        p24 = re.compile(r'^In\s+Pkts\s+Unchecked:\s+(?P<in_pkts_unchecked>\d+)$')
+        p24 = regex_engine.compile(r'^In\s+Pkts\s+Unchecked:\s+(?P<in_pkts_unchecked>\d+)$')
 
         #   In Pkts Delayed:          0
-        p25 = re.compile(r'^In\s+Pkts\s+Delayed:\s+(?P<in_pkts_delayed>\d+)$')
+        p25 = regex_engine.compile(r'^In\s+Pkts\s+Delayed:\s+(?P<in_pkts_delayed>\d+)$')
 
         #   In Pkts OK:               103416932
-        p26 = re.compile(r'^In\s+Pkts\s+OK:\s+(?P<in_pkts_ok>\d+)$')
+        p26 = regex_engine.compile(r'^In\s+Pkts\s+OK:\s+(?P<in_pkts_ok>\d+)$')
 
         #   In Pkts Invalid:          0
-        p27 = re.compile(r'^\s*In\s+Pkts\s+Invalid:\s+(?P<in_pkts_invalid>\d+)$')
+        p27 = regex_engine.compile(r'^\s*In\s+Pkts\s+Invalid:\s+(?P<in_pkts_invalid>\d+)$')
 
         #   In Pkts Not Valid:        0
-        p28 = re.compile(r'^In\s+Pkts\s+Not\s+Valid:\s+(?P<in_pkts_not_valid>\d+)$')
+        p28 = regex_engine.compile(r'^In\s+Pkts\s+Not\s+Valid:\s+(?P<in_pkts_not_valid>\d+)$')
 
         #   In Pkts Not using SA:     0
-        p29 = re.compile(r'^In\s+Pkts\s+Not\s+using\s+SA:\s+(?P<in_pkts_not_using_sa>\d+)$')
+        p29 = regex_engine.compile(r'^In\s+Pkts\s+Not\s+using\s+SA:\s+(?P<in_pkts_not_using_sa>\d+)$')
 
         #   In Pkts Unused SA:        0
-        p30 = re.compile(r'^In\s+Pkts\s+Unused\s+SA:\s+(?P<in_pkts_unused_sa>\d+)$')
+        p30 = regex_engine.compile(r'^In\s+Pkts\s+Unused\s+SA:\s+(?P<in_pkts_unused_sa>\d+)$')
 
         #   In Pkts Late:             0
-        p31 = re.compile(r'^In\s+Pkts\s+Late:\s+(?P<in_pkts_late>\d+)$')
+        p31 = regex_engine.compile(r'^In\s+Pkts\s+Late:\s+(?P<in_pkts_late>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
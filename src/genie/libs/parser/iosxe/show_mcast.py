@@ -21,13 +21,13 @@ IOSXE parsers for the following show commands:
     * 'show consistency-checker mcast <layer> start vlan <vlan_id> <address>
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =====================================
 # Parser for 'show ip mroute'
@@ -191,42 +191,42 @@ class ShowIpMroute(ShowIpMrouteSchema):
         outgoing = False
         # IP Multicast Routing Table
         # Multicast Routing Table
-        p1 = re.compile(r'^(?P<address_family>[\w\W]+)? *[mM]ulticast'
-                        r' +[rR]outing +[tT]able$')
+        p1 = regex_engine.compile(r'^(?P<address_family>[\w\W]+)? *[mM]ulticast'
+                                  r' +[rR]outing +[tT]able$')
         # (*, 239.1.1.1), 00:00:03/stopped, RP 10.4.1.1, flags: SPF
         # (10.4.1.1, 239.1.1.1), 00:00:03/00:02:57, flags: PFT
         # (*, FF07::1), 00:04:45/00:02:47, RP 2001:DB8:6::6, flags:S
         # (2001:DB8:999::99, FF07::1), 00:02:06/00:01:23, flags:SFT
         # (50.50.50.2, 239.0.0.13), 00:00:39/00:02:20, flags:
-        p2 = re.compile(r'^\((?P<source_address>[\w\:\.\*\/]+),'
-                            r'(\s+)?(?P<multicast_group>[\w\:\.\/]+)\),'
-                            r' +(?P<uptime>[\w\:\.]+)\/'
-                            r'(?P<expires>[\w\:\.\-]+),'
-                            r'( +RP +(?P<rendezvous_point>[\w\:\.]+),)?'
-                            r' +flags: *(?P<flags>[a-zA-Z]*)$')  
+        p2 = regex_engine.compile(r'^\((?P<source_address>[\w\:\.\*\/]+),'
+                                      r'(\s+)?(?P<multicast_group>[\w\:\.\/]+)\),'
+                                      r' +(?P<uptime>[\w\:\.]+)\/'
+                                      r'(?P<expires>[\w\:\.\-]+),'
+                                      r'( +RP +(?P<rendezvous_point>[\w\:\.]+),)?'
+                                      r' +flags: *(?P<flags>[a-zA-Z]*)$')  
                             
         # Incoming interface: Null, RPF nbr 224.0.0.0224.0.0.0
         # Incoming interface: Loopback0, RPF nbr 0.0.0.0, Registering
         # Incoming interface: Lspvif10, RPF nbr 3.3.3.3, MDT [10, 3.3.3.3]/00:02:11
         # Incoming interface: LISP0.4100, RPF nbr 100.22.22.22, LISP: [100.22.22.22, 232.100.100.234]
         # Incoming interface: LISP0.4100, RPF nbr 100.88.88.88, using vrf VRF1
-        p3 = re.compile(r'^Incoming +interface:'
-                       r' +(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+),'
-                       r' +RPF +nbr +(?P<rpf_nbr>[\w\:\.]+)'
-                       r'(\s*,\s+LISP:\s\[(?P<iif_lisp_rloc>[\d\.]+)\,\s(?P<iif_lisp_group>[\d\.]+)\])?'
-                       r'(\s*,\s+using\s+vrf\s+(?P<lisp_vrf>[a-zA-Z0-9]+)\s*)?'
-                       r'(, *(?P<status>.*))?$') 
+        p3 = regex_engine.compile(r'^Incoming +interface:'
+                                 r' +(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+),'
+                                 r' +RPF +nbr +(?P<rpf_nbr>[\w\:\.]+)'
+                                 r'(\s*,\s+LISP:\s\[(?P<iif_lisp_rloc>[\d\.]+)\,\s(?P<iif_lisp_group>[\d\.]+)\])?'
+                                 r'(\s*,\s+using\s+vrf\s+(?P<lisp_vrf>[a-zA-Z0-9]+)\s*)?'
+                                 r'(, *(?P<status>.*))?$') 
                        
         # Incoming interface:Tunnel5
-        p3_1 = re.compile(r'^Incoming +interface:'
-                         r' *(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+)$')  
+        p3_1 = regex_engine.compile(r'^Incoming +interface:'
+                                   r' *(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+)$')  
         # RPF nbr:2001:db8:90:24::6
-        p3_2 = re.compile(r'^RPF +nbr: *(?P<rpf_nbr>[\w\:\.]+)$')
+        p3_2 = regex_engine.compile(r'^RPF +nbr: *(?P<rpf_nbr>[\w\:\.]+)$')
         # Outgoing interface list: Null
         # Outgoing interface list:
-        p4 =  re.compile(r'^Outgoing +interface +list:|^Immediate +Outgoing +interface +list:'
-                         r'|^Inherited +Outgoing +interface +list:'
-                         r'( *(?P<intf>\w+))?$')       
+        p4 =  regex_engine.compile(r'^Outgoing +interface +list:|^Immediate +Outgoing +interface +list:'
+                                   r'|^Inherited +Outgoing +interface +list:'
+                                   r'( *(?P<intf>\w+))?$')       
         # Vlan5, Forward/Dense, 00:03:25/00:00:00, H
         # Vlan5, Forward/Dense, 00:04:35/00:02:30
         # ATM0/0, VCD 14, Forward/Sparse, 00:03:57/00:02:53
@@ -235,29 +235,29 @@ class ShowIpMroute(ShowIpMrouteSchema):
         # LISP0.101, NH 100:44:44::44, Forward, 04:54:20/00:03:09
         # Vlan500, VXLAN v4 Encap: (50000, 225.2.2.2), Forward/Sparse, 00:00:54/00:02:05
         # Vlan500, VXLAN v6 Encap: (50000, FF13::1), Forward/Sparse, 00:17:31/stopped, flags:
-        p5 = re.compile(r'^(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+)(\,\s+)?'
-                            r'(VCD +(?P<vcd>\d+))?(\,\s+)?'
-                            r'(NH)?(\s+)?(\(?(?P<lisp_mcast_source>[0-9\.:]+)(\,\s+)?(?P<lisp_mcast_group>[0-9\.]+)?\)?)?(\,\s+)?'
-                            r'(VXLAN +(?P<vxlan_version>[a-z0-9]+)(\s+)?(Encap:)?(\s+)?(\(?(?P<vxlan_vni>[0-9]+)(\,\s+)?(?P<vxlan_nxthop>[\w\:\.]+)?\)?)?)?(\,\s+)?'
-                            r'(?P<state_mode>[\w\-\/-]+)(\,\s+)?'
-                            r'(?P<uptime>[a-zA-Z0-9\:]+)\/'
-                            r'(?P<expire>[\w\:]+)(\,\s+)?'
-                            r'(Pkts\:(?P<pkts>\w+))?(\,\s+)?'
-                            r'(flags\:\s+(?P<flags>\w+)?$|(,\s+flags\:)?$)')
+        p5 = regex_engine.compile(r'^(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+)(\,\s+)?'
+                                      r'(VCD +(?P<vcd>\d+))?(\,\s+)?'
+                                      r'(NH)?(\s+)?(\(?(?P<lisp_mcast_source>[0-9\.:]+)(\,\s+)?(?P<lisp_mcast_group>[0-9\.]+)?\)?)?(\,\s+)?'
+                                      r'(VXLAN +(?P<vxlan_version>[a-z0-9]+)(\s+)?(Encap:)?(\s+)?(\(?(?P<vxlan_vni>[0-9]+)(\,\s+)?(?P<vxlan_nxthop>[\w\:\.]+)?\)?)?)?(\,\s+)?'
+                                      r'(?P<state_mode>[\w\-\/-]+)(\,\s+)?'
+                                      r'(?P<uptime>[a-zA-Z0-9\:]+)\/'
+                                      r'(?P<expire>[\w\:]+)(\,\s+)?'
+                                      r'(Pkts\:(?P<pkts>\w+))?(\,\s+)?'
+                                      r'(flags\:\s+(?P<flags>\w+)?$|(,\s+flags\:)?$)')
         # 100.11.11.11, 2d22h/00:02:36
-        p5_1 = re.compile(r'^\s*(?P<lisp_js_addr>[0-9\.]+)\,\s*'
-                            r'(?P<lisp_js_uptime>[\w\:]+)\/(?P<lisp_js_expire>[\w\:]+)$')
+        p5_1 = regex_engine.compile(r'^\s*(?P<lisp_js_addr>[0-9\.]+)\,\s*'
+                                      r'(?P<lisp_js_uptime>[\w\:]+)\/(?P<lisp_js_expire>[\w\:]+)$')
         # Extranet receivers in vrf internet:
-        p7 = re.compile(r'^Extranet receivers in vrf (?P<extranet_vrf>[a-zA-Z0-9]+)\:\s*$')
+        p7 = regex_engine.compile(r'^Extranet receivers in vrf (?P<extranet_vrf>[a-zA-Z0-9]+)\:\s*$')
         # (192.168.1.3, 232.64.64.1), 21:38:05/00:03:25, OIF count: 1, flags: sTpl
         # (*, 239.5.1.100), 12:54:25/stopped, RP 152.1.1.1, OIF count: 0, flags: SP
-        p8 = re.compile(r'^\((?P<e_src>[\d\.\*]+)\,(\s+)?'
-                              r'(?P<e_grp>[\d\.]+)\)\,(\s+)?'
-                              r'(?P<e_uptime>[\w\:]+)\/'
-                              r'(?P<e_expire>[\w\:]+)\,(\s+)?'
-                              r'(RP\s+(?P<e_rp>[\d\.]+)\,(\s+)?)?'
-                              r'(OIF count:\s(?P<e_oif_count>\d+))\,(\s+)?'
-                              r'(flags: (?P<e_flags>[\w]+))(\s+)?$')
+        p8 = regex_engine.compile(r'^\((?P<e_src>[\d\.\*]+)\,(\s+)?'
+                                        r'(?P<e_grp>[\d\.]+)\)\,(\s+)?'
+                                        r'(?P<e_uptime>[\w\:]+)\/'
+                                        r'(?P<e_expire>[\w\:]+)\,(\s+)?'
+                                        r'(RP\s+(?P<e_rp>[\d\.]+)\,(\s+)?)?'
+                                        r'(OIF count:\s(?P<e_oif_count>\d+))\,(\s+)?'
+                                        r'(flags: (?P<e_flags>[\w]+))(\s+)?$')
         for line in out.splitlines():
             line = line.strip()
 
@@ -372,7 +372,7 @@ class ShowIpMroute(ShowIpMrouteSchema):
                 continue
                 
             # ##Incoming interface list:
-            p3_4 = re.compile(r'^(?P<incoming_interface>\S+)\, +(?P<state>[\w\/-]+)$')
+            p3_4 = regex_engine.compile(r'^(?P<incoming_interface>\S+)\, +(?P<state>[\w\/-]+)$')
             m = p3_4.match(line)
             if m:
                 res = m.groupdict()
@@ -461,8 +461,8 @@ class ShowIpMroute(ShowIpMrouteSchema):
                 continue
                 
             # Bidir-Upstream: Lspvif52, RPF nbr: 1.1.1.1
-            p6 = re.compile(r'^Bidir-Upstream: +(?P<upstream_interface>[a-zA-Z0-9\/\-\.]+), '
-                            r'+RPF +nbr\:? +(?P<rpf_nbr>[\w\:\.]+)(, *(?P<status>\w+))?$')
+            p6 = regex_engine.compile(r'^Bidir-Upstream: +(?P<upstream_interface>[a-zA-Z0-9\/\-\.]+), '
+                                      r'+RPF +nbr\:? +(?P<rpf_nbr>[\w\:\.]+)(, *(?P<status>\w+))?$')
             m = p6.match(line)
             if m:
                 r=m.groupdict()
@@ -601,9 +601,9 @@ class ShowIpMrouteStatic(ShowIpMrouteStaticSchema):
         for line in out.splitlines():
             line = line.strip()
             # Mroute: 172.16.0.0/16, RPF neighbor: 172.30.10.13, distance: 1
-            p1 = re.compile(r'^Mroute: +(?P<mroute>[\w\:\.\/]+),'
-                             r' RPF +neighbor: +(?P<rpf_nbr>[\w\.\:]+),'
-                             r' distance: +(?P<distance>\d+)$')
+            p1 = regex_engine.compile(r'^Mroute: +(?P<mroute>[\w\:\.\/]+),'
+                                       r' RPF +neighbor: +(?P<rpf_nbr>[\w\.\:]+),'
+                                       r' distance: +(?P<distance>\d+)$')
                               
             m = p1.match(line)
             if m:
@@ -690,25 +690,25 @@ class ShowIpMulticast(ShowIpMulticastSchema):
         ret_dict = {}
 
         # Multicast Routing: enabled
-        p1 = re.compile(r'^Multicast +Routing: +(?P<status>\w+)$')
+        p1 = regex_engine.compile(r'^Multicast +Routing: +(?P<status>\w+)$')
 
         # Multicast Multipath: enabled
         # Multicast Multipath: enabled (algorithm: basic)
         # Multicast Multipath: enabled (algorithm: next-hop-based)
-        p2 = re.compile(r'^Multicast +Multipath: +(?P<status>\w+)( \(algorithm\: (?P<algo>[\w\-]+)\))?$')
+        p2 = regex_engine.compile(r'^Multicast +Multipath: +(?P<status>\w+)( \(algorithm\: (?P<algo>[\w\-]+)\))?$')
 
         # Multicast Route limit: No limit
-        p3 = re.compile(r'^Multicast +Route +limit: +(?P<status>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^Multicast +Route +limit: +(?P<status>[\w\s]+)$')
 
         # Multicast Fallback group mode: Sparse
-        p4 = re.compile(r'^Multicast +Fallback +group +mode: +(?P<mode>[\w\s]+)$')
+        p4 = regex_engine.compile(r'^Multicast +Fallback +group +mode: +(?P<mode>[\w\s]+)$')
 
         # Number of multicast boundaries configured with filter-autorp option: 0
-        p5 = re.compile(r'^Number +of +multicast +boundaries +configured +'
-                        r'with +filter\-autorp +option: +(?P<num>\d+)$')
+        p5 = regex_engine.compile(r'^Number +of +multicast +boundaries +configured +'
+                                  r'with +filter\-autorp +option: +(?P<num>\d+)$')
 
         # MoFRR: Disabled
-        p6 = re.compile(r'^MoFRR: +(?P<status>\w+)$')
+        p6 = regex_engine.compile(r'^MoFRR: +(?P<status>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -801,9 +801,9 @@ class ShowIpMulticastMplsvif(ShowIpMulticastMplsvifSchema):
             return ret_dict
 
         ## Lspvif9     0.0.0.0              MDT               N/A       11   (vrf vrf3001) 0x1
-        p1=re.compile(r"(?P<interface>[a-zA-Z0-9]+)\s+(?P<next_hop>\d+\.\d+\.\d+\.\d+)\s+"
-                    r"(?P<application>\S+)\s+(?P<ref_count>\S+)\s+(?P<table>\S+)\s+[a-zA-Z\(]*\s*"
-                    r"(?P<vrf>[a-z0-9]+)\)*\s+(?P<flags>\S+)")
+        p1=regex_engine.compile(r"(?P<interface>[a-zA-Z0-9]+)\s+(?P<next_hop>\d+\.\d+\.\d+\.\d+)\s+"
+                              r"(?P<application>\S+)\s+(?P<ref_count>\S+)\s+(?P<table>\S+)\s+[a-zA-Z\(]*\s*"
+                              r"(?P<vrf>[a-z0-9]+)\)*\s+(?P<flags>\S+)")
 
         for line in out.splitlines():
             line=line.strip()
@@ -855,13 +855,13 @@ class ShowIpMrouteCount(ShowIpMrouteCountSchema):
         ret_dict = {}
 
         # 1009 routes using 1103272 bytes of memory
-        p1 = re.compile(r'(?P<routes>\d+)\s+routes\s+using\s+(?P<bytes_of_memory>\d+)')
+        p1 = regex_engine.compile(r'(?P<routes>\d+)\s+routes\s+using\s+(?P<bytes_of_memory>\d+)')
 
         # 1005 groups, 0.00 average sources per group
-        p2 = re.compile(r'(?P<groups>\d+)\s+groups,\s(?P<average>[\d\.]+)\s+average')
+        p2 = regex_engine.compile(r'(?P<groups>\d+)\s+groups,\s(?P<average>[\d\.]+)\s+average')
 
         # Group: 232.3.6.233, Source count: 0, Packets forwarded: 0, Packets received: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'Group:\s+(?P<group>[\w.]+),\s+Source\scount:\s(?P<source_count>\d+),\s+Packets\sforwarded:\s(?P<pkt_forwarded>\d+),\s+Packets\sreceived:\s(?P<pkt_received>\d+)')
 
         for line in out.splitlines():
@@ -950,10 +950,10 @@ class ShowConsistencyCheckerMcastStartAll(ShowConsistencyCheckerMcastStartAllSch
             output = self.device.execute(cmd)
 
         # L3 multicast Full scan started. Run_id: 2181
-        p1 = re.compile(r'^(?P<layer>(\w\d+)) multicast +Full +scan +started. Run_id: +(?P<run_id>(\d+))$')
+        p1 = regex_engine.compile(r'^(?P<layer>(\w\d+)) multicast +Full +scan +started. Run_id: +(?P<run_id>(\d+))$')
 
         # Single entry scan started with Run_id: 2255
-        p2 = re.compile(r'^Single +entry +scan +started +with +Run_id: +(?P<run_id>(\d+))$')
+        p2 = regex_engine.compile(r'^Single +entry +scan +started +with +Run_id: +(?P<run_id>(\d+))$')
 
         ret_dict = {}
 
@@ -1014,10 +1014,10 @@ class ShowConsistencyCheckerRunIdDetail(ShowConsistencyCheckerRunIdDetailSchema)
             output = self.device.execute(self.cli_command.format(id=id))
         # Process: IOSD
         # Process: FMAN-RP
-        p1 = re.compile(r'^Process:\s+(?P<type>[\w\s\-]+)$')
+        p1 = regex_engine.compile(r'^Process:\s+(?P<type>[\w\s\-]+)$')
         # Switch: 1 Process: FMAN-FP
         # Switch: 1 Process: FED
-        p2 = re.compile(r'^Switch:\s+(?P<switch>[\d]+)+\s+Process:\s+(?P<process_type>[\w\s\-]+)$')
+        p2 = regex_engine.compile(r'^Switch:\s+(?P<switch>[\d]+)+\s+Process:\s+(?P<process_type>[\w\s\-]+)$')
         
         ret_dict = {}
         for line in output.splitlines():
@@ -1102,29 +1102,29 @@ class ShowConsistencyCheckerRunId(ShowConsistencyCheckerRunIdSchema):
 
         # Process: IOSD
         # Process: FMAN-RP
-        p1 = re.compile(r'^Process:\s+(?P<type>[\w\s\-]+)$')
+        p1 = regex_engine.compile(r'^Process:\s+(?P<type>[\w\s\-]+)$')
 
         # Object-Type    Start-time                Entries  Exceptions  Flags
         #  l2m_vlan      2023/04/28 03:51:03         72         0       F GD Hw HS
         #  l2m_group     2023/04/28 03:51:03          0         0       F GD Hw HS
-        p2 = re.compile(r'^(?P<object_type>[\w\s\_]+)\s+(?P<starttime>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<entries>[\d]+)\s+(?P<exceptions>[\d]+)\s+\b(?P<fulltable>F)?\b\s+\b(?P<garbagedetector>GD)?\b\s+\b(?P<hwcheck>Hw)?\b\s+\b(?P<hwshadow>HS)?\b$')
+        p2 = regex_engine.compile(r'^(?P<object_type>[\w\s\_]+)\s+(?P<starttime>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<entries>[\d]+)\s+(?P<exceptions>[\d]+)\s+\b(?P<fulltable>F)?\b\s+\b(?P<garbagedetector>GD)?\b\s+\b(?P<hwcheck>Hw)?\b\s+\b(?P<hwshadow>HS)?\b$')
 
         # Object-Type       Start-time                State           A/  I/  M/  S/Oth 
         #  l2m_vlan       2023/04/28 03:51:03      Consistent        0/  0/  0/  0/  0
         #  l2m_group      2023/04/28 03:51:03       Consistent        0/  0/  0/  0/  0
-        p3 = re.compile(r'^(?P<object_type>[\w\s\-]+)\s+(?P<starttime>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<state>[\w]+)\s+(?P<actual>[\d]+)/\s+(?P<inherited>[\d]+)/\s+(?P<missing>[\d]+)/\s+(?P<stale>[\d]+)/\s+(?P<others>[\d]+)$')
+        p3 = regex_engine.compile(r'^(?P<object_type>[\w\s\-]+)\s+(?P<starttime>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<state>[\w]+)\s+(?P<actual>[\d]+)/\s+(?P<inherited>[\d]+)/\s+(?P<missing>[\d]+)/\s+(?P<stale>[\d]+)/\s+(?P<others>[\d]+)$')
 
         # Switch: 1 Process: FMAN-FP
         # Switch: 1 Process: FED
-        p4 = re.compile(r'^Switch:\s+(?P<switch>[\d]+)+\s+Process:\s+(?P<process_type>[\w\s\-]+)$')
+        p4 = regex_engine.compile(r'^Switch:\s+(?P<switch>[\d]+)+\s+Process:\s+(?P<process_type>[\w\s\-]+)$')
 
         # Object-Type    Start-time              State              A/  I/  M/  S/ HW/Oth
         # l2m_vlan       2023/05/08 05:05:36     Consistent         0/  0/  0/  0/  0/  0
         # l2m_group      2023/05/08 05:05:36     Consistent         0/  0/  0/  0/  0/  0
-        p5 = re.compile(r'^(?P<object_type>[\w\s\-]+)\s+(?P<starttime>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<state>[\w]+)\s+(?P<actual>[\d]+)/\s+(?P<inherited>[\d]+)/\s+(?P<missing>[\d]+)/\s+(?P<stale>[\d]+)/\s+(?P<hardware>[\d]+)/\s+(?P<others>[\d]+)$')
+        p5 = regex_engine.compile(r'^(?P<object_type>[\w\s\-]+)\s+(?P<starttime>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<state>[\w]+)\s+(?P<actual>[\d]+)/\s+(?P<inherited>[\d]+)/\s+(?P<missing>[\d]+)/\s+(?P<stale>[\d]+)/\s+(?P<hardware>[\d]+)/\s+(?P<others>[\d]+)$')
 
         # l3m_entry      2023/11/03 12:37:18        1012         0    F Hw HS
-        p6 = re.compile(r'^(?P<object_type>[\w\s\_]+)\s+(?P<starttime>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<entries>[\d]+)\s+(?P<exceptions>[\d]+)\s+\b(?P<fulltable>F+)?\b\s+\b(?P<hwcheck>Hw)?\b\s+\b(?P<hwshadow>HS)?\b$')
+        p6 = regex_engine.compile(r'^(?P<object_type>[\w\s\_]+)\s+(?P<starttime>(\d+\/){2}\d+.\d+:\d+:\d+)\s+(?P<entries>[\d]+)\s+(?P<exceptions>[\d]+)\s+\b(?P<fulltable>F+)?\b\s+\b(?P<hwcheck>Hw)?\b\s+\b(?P<hwshadow>HS)?\b$')
         
         ret_dict = {}
 
@@ -24,7 +24,6 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -37,6 +36,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =================
@@ -99,25 +99,25 @@ class ShowMdnsSdServicePeerStatistics(ShowMdnsSdServicePeerStatisticsSchema):
         ret_dict = {}
 
         # mDNS Packet statistics:
-        p0 = re.compile(r"^mDNS +Packet +statistics:$")
+        p0 = regex_engine.compile(r"^mDNS +Packet +statistics:$")
 
         # Packets received from client  : 44
-        p1 = re.compile(r"^Packets +received +from +(?P<peer_type>\w+) +: +(?P<packet_count>(\d)+)$")
+        p1 = regex_engine.compile(r"^Packets +received +from +(?P<peer_type>\w+) +: +(?P<packet_count>(\d)+)$")
 
         # IPv4                      : 0
-        p2 = re.compile(r"^IPv4 +: +(?P<ipv4_count>[\d]+)$")
+        p2 = regex_engine.compile(r"^IPv4 +: +(?P<ipv4_count>[\d]+)$")
 
         # IPv6                      : 0
-        p3 = re.compile(r"^IPv6 +: +(?P<ipv6_count>[\d]+)$")
+        p3 = regex_engine.compile(r"^IPv6 +: +(?P<ipv6_count>[\d]+)$")
 
         # Packets sent to client        : 114
-        p4 = re.compile(r"^Packets +sent +to +(?P<peer_type>\w+) +: +(?P<packet_count>[\d]+)$")
+        p4 = regex_engine.compile(r"^Packets +sent +to +(?P<peer_type>\w+) +: +(?P<packet_count>[\d]+)$")
 
         # Advertisements              : 36
-        p6 = re.compile(r"^Advertisements +: +(?P<advertisements_count>[\d]+)$")
+        p6 = regex_engine.compile(r"^Advertisements +: +(?P<advertisements_count>[\d]+)$")
 
         # Queries                     : 108
-        p7 = re.compile(r"^Queries +: +(?P<queries_count>[\d]+)$")
+        p7 = regex_engine.compile(r"^Queries +: +(?P<queries_count>[\d]+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -259,70 +259,70 @@ class ShowMdnsSdStatisticsInterfaceVlan(ShowMdnsSdStatisticsInterfaceVlanSchema)
         ret_dict = {}
 
         # mDNS Packet statistics:
-        p0 = re.compile(r"^mDNS +Statistics$")
+        p0 = regex_engine.compile(r"^mDNS +Statistics$")
         
         # Vl301:
-        p1 = re.compile(r"^Vl(?P<vlan>(\d)+):$")
+        p1 = regex_engine.compile(r"^Vl(?P<vlan>(\d)+):$")
         
         # mDNS packets sent                 : 561
-        p2 = re.compile(r"^mDNS +packets +sent +: +(?P<pkt_sent>(\d)+)$")
+        p2 = regex_engine.compile(r"^mDNS +packets +sent +: +(?P<pkt_sent>(\d)+)$")
         
         # IPv4 advertisements sent     : 1
-        p3 = re.compile(r"^IPv4 +advertisements +sent +: +(?P<ipv4_adv_sent>[\d]+)$")
+        p3 = regex_engine.compile(r"^IPv4 +advertisements +sent +: +(?P<ipv4_adv_sent>[\d]+)$")
         
         # IPv4 queries sent
-        p4 = re.compile(r"^IPv4 +queries +sent +: +(?P<ipv4_qry_sent>[\d]+)$")
+        p4 = regex_engine.compile(r"^IPv4 +queries +sent +: +(?P<ipv4_qry_sent>[\d]+)$")
         
         # IPv6 advertisements sent     : 0
-        p5 = re.compile(r"^IPv6 +advertisements +sent +: +(?P<ipv6_adv_val>[\d]+)$")
+        p5 = regex_engine.compile(r"^IPv6 +advertisements +sent +: +(?P<ipv6_adv_val>[\d]+)$")
         
         # IPv6 queries sent            : 0
-        p6 = re.compile(r"^IPv6 +queries +sent +: +(?P<ipv6_qry_val>[\d]+)$")
+        p6 = regex_engine.compile(r"^IPv6 +queries +sent +: +(?P<ipv6_qry_val>[\d]+)$")
         
         # IPv4 sent                      : 561
-        p7 = re.compile(r"^IPv4 +sent +: +(?P<ipv4_sent_val>[\d]+)$")
+        p7 = regex_engine.compile(r"^IPv4 +sent +: +(?P<ipv4_sent_val>[\d]+)$")
         
         # IPv6 sent                      : 0
-        p8 = re.compile(r"^IPv6 +sent +: +(?P<ipv6_sent_val>[\d]+)$")
+        p8 = regex_engine.compile(r"^IPv6 +sent +: +(?P<ipv6_sent_val>[\d]+)$")
         
         # mDNS packets received             : 10465
-        p9 = re.compile(r"^mDNS +packets +received +: +(?P<pkt_rcvd>(\d)+)$")
+        p9 = regex_engine.compile(r"^mDNS +packets +received +: +(?P<pkt_rcvd>(\d)+)$")
         
         # advertisements received          : 5065
-        p10 = re.compile(r"^advertisements +received +: +(?P<adv_rcvd>[\d]+)$")
+        p10 = regex_engine.compile(r"^advertisements +received +: +(?P<adv_rcvd>[\d]+)$")
         
         # queries received                 : 5400
-        p11 = re.compile(r"^queries received +: +(?P<qry_count>[\d]+)$")
+        p11 = regex_engine.compile(r"^queries received +: +(?P<qry_count>[\d]+)$")
         
         # IPv4 received                  : 10465
-        p12 = re.compile(r"^IPv4 +received +: +(?P<ipv4_rcvd_val>[\d]+)$")
+        p12 = regex_engine.compile(r"^IPv4 +received +: +(?P<ipv4_rcvd_val>[\d]+)$")
         
         # IPv4 advertisements received : 5065
-        p13 = re.compile(r"^IPv4 +advertisements +received +: +(?P<ipv4_adv_rcvd>[\d]+)$")
+        p13 = regex_engine.compile(r"^IPv4 +advertisements +received +: +(?P<ipv4_adv_rcvd>[\d]+)$")
         
         # IPv4 queries received        : 5400
-        p14 = re.compile(r"^IPv4 +queries +received +: +(?P<ipv4_qry_rcvd>[\d]+)$")
+        p14 = regex_engine.compile(r"^IPv4 +queries +received +: +(?P<ipv4_qry_rcvd>[\d]+)$")
         
         # IPv6 received                  : 0
-        p15 = re.compile(r"^IPv6 +received +: +(?P<ipv6_rcvd_val>[\d]+)$")
+        p15 = regex_engine.compile(r"^IPv6 +received +: +(?P<ipv6_rcvd_val>[\d]+)$")
         
         # IPv6 advertisements received : 0
-        p16 = re.compile(r"^IPv6 +advertisements +received +: +(?P<ipv6_adv_rcvd>[\d]+)$")
+        p16 = regex_engine.compile(r"^IPv6 +advertisements +received +: +(?P<ipv6_adv_rcvd>[\d]+)$")
         
         # IPv6 queries received        : 0
-        p17 = re.compile(r"^IPv6 +queries +received +: +(?P<ipv6_qry_rcvd>[\d]+)$")
+        p17 = regex_engine.compile(r"^IPv6 +queries +received +: +(?P<ipv6_qry_rcvd>[\d]+)$")
         
         # mDNS packets rate limited         : 158
-        p18 = re.compile(r"^mDNS +packets +rate +limited +: +(?P<mdns_rate_lim>[\d]+)$")
+        p18 = regex_engine.compile(r"^mDNS +packets +rate +limited +: +(?P<mdns_rate_lim>[\d]+)$")
         
         # mDNS packets dropped              : 298
-        p19 = re.compile(r"^mDNS +packets +dropped +: +(?P<mdns_pkt_drop>[\d]+)$")
+        p19 = regex_engine.compile(r"^mDNS +packets +dropped +: +(?P<mdns_pkt_drop>[\d]+)$")
         
         # PTR                               : 0
-        p20 = re.compile(r"^(?P<qry_type>[\w]+) +: +(?P<qry_type_val>[\d]+)$")
+        p20 = regex_engine.compile(r"^(?P<qry_type>[\w]+) +: +(?P<qry_type_val>[\d]+)$")
         
         # _airplay._tcp.local                                       15         0
-        p21 = re.compile(r"^(?P<ptr_name>[\w.-]+)  +(?P<adv_count>[\d]+) +(?P<qry_count>[\d]+)$")
+        p21 = regex_engine.compile(r"^(?P<ptr_name>[\w.-]+)  +(?P<adv_count>[\d]+) +(?P<qry_count>[\d]+)$")
         
         for line in out.splitlines():
             line = line.strip()
@@ -546,50 +546,50 @@ class ShowMdnsSdControllerStatistics(ShowMdnsSdControllerStatisticsSchema):
         ret_dict = {}
         
         # Total messages sent              : 0
-        p0 = re.compile(r"^Total +messages +sent +: +(?P<total_msg_sent>(\d)+)$")
+        p0 = regex_engine.compile(r"^Total +messages +sent +: +(?P<total_msg_sent>(\d)+)$")
         
         # Total messages received          : 0
-        p1 = re.compile(r"^Total +messages +received  +: +(?P<total_msg_rcvd>(\w)+)$")
+        p1 = regex_engine.compile(r"^Total +messages +received  +: +(?P<total_msg_rcvd>(\w)+)$")
         
         # Keepalive messages sent          : 0
-        p2 = re.compile(r"^Keepalive +messages +sent  +: +(?P<keepalive_msg_sent>(\d)+)$")
+        p2 = regex_engine.compile(r"^Keepalive +messages +sent  +: +(?P<keepalive_msg_sent>(\d)+)$")
         
         # Keepalive messages received      : 0
-        p3 = re.compile(r"^Keepalive +messages +received +: +(?P<keepalive_msg_rcvd>[\d]+)$")
+        p3 = regex_engine.compile(r"^Keepalive +messages +received +: +(?P<keepalive_msg_rcvd>[\d]+)$")
         
         # Interface WITHDRAW messages sent : 0
-        p4 = re.compile(r"^Interface +WITHDRAW +messages +sent +: +(?P<intf_withdraw_msg_sent>[\d]+)$")
+        p4 = regex_engine.compile(r"^Interface +WITHDRAW +messages +sent +: +(?P<intf_withdraw_msg_sent>[\d]+)$")
         
         # Vlan WITHDRAW messages sent      : 0
-        p5 = re.compile(r"^Vlan +WITHDRAW +messages +sent +: +(?P<vlan_withdraw_msg_sent>[\d]+)$")
+        p5 = regex_engine.compile(r"^Vlan +WITHDRAW +messages +sent +: +(?P<vlan_withdraw_msg_sent>[\d]+)$")
         
         # Clear cache messages sent        : 0
-        p6 = re.compile(r"^Clear +cache +messages +sent +: +(?P<clr_cache_msg_sent>[\d]+)$")
+        p6 = regex_engine.compile(r"^Clear +cache +messages +sent +: +(?P<clr_cache_msg_sent>[\d]+)$")
         
         # Total RESYNC state count         : 0
-        p7 = re.compile(r"^Total +RESYNC +state +count +: +(?P<resync_state_count>[\d]+)$")
+        p7 = regex_engine.compile(r"^Total +RESYNC +state +count +: +(?P<resync_state_count>[\d]+)$")
         
         # Last successful RESYNC           : Not-Applicable
         #p8 = re.compile(r"^Last +successful +RESYNC +: +(?P<last_successful_resync>[\w-]+)$") 
-        p8 = re.compile(r"^Last +successful +RESYNC +: +(?P<last_successful_resync>[\w\s:-]+)$")    
+        p8 = regex_engine.compile(r"^Last +successful +RESYNC +: +(?P<last_successful_resync>[\w\s:-]+)$")    
 
         # Advertisements sent             : 0
-        p9 = re.compile(r"^Advertisements +sent  +: +(?P<adv_sent>[\d]+)$")
+        p9 = regex_engine.compile(r"^Advertisements +sent  +: +(?P<adv_sent>[\d]+)$")
         
         # Withdraws sent                  : 0
-        p10 = re.compile(r"^Withdraws +sent +: +(?P<withdraw_sent>[\d]+)$")
+        p10 = regex_engine.compile(r"^Withdraws +sent +: +(?P<withdraw_sent>[\d]+)$")
         
         # Advertisements Filtered         : 0
-        p11 = re.compile(r"^Advertisements +Filtered +: +(?P<adv_filter>[\d]+)$")
+        p11 = regex_engine.compile(r"^Advertisements +Filtered +: +(?P<adv_filter>[\d]+)$")
         
         # Total service resynced          : 0
-        p12 = re.compile(r"^Total +service +resynced +: +(?P<tot_srvc_resync>[\d]+)$")
+        p12 = regex_engine.compile(r"^Total +service +resynced +: +(?P<tot_srvc_resync>[\d]+)$")
         
         # Queries sent                    : 0
-        p13 = re.compile(r"^Queries +sent +: +(?P<qry_sent>[\d]+)$")
+        p13 = regex_engine.compile(r"^Queries +sent +: +(?P<qry_sent>[\d]+)$")
         
         # Query responses received        : 0
-        p14 = re.compile(r"^Query +responses +received  +: +(?P<qry_response_rcvd>[\d]+)$")
+        p14 = regex_engine.compile(r"^Query +responses +received  +: +(?P<qry_response_rcvd>[\d]+)$")
        
         for line in output.splitlines():
             line = line.strip()
@@ -739,7 +739,7 @@ class ShowMdnsSdSdgServicePeerSummary(ShowMdnsSdSdgServicePeerSummarySchema):
         ret_dict = {}
 
         # 40.1.25.2/10991                                0           NA /May  7 18:08:12 2021               0 Hrs 2  Mins   0
-        p0 = re.compile(r"^(?P<sp_address>[\d.]+|[\d:]+)/(?P<port>\d+)\s+(?P<cache_sync_sent>\d+)\s+(?P<cache_sync_time>NA|\w+\s+\d+\s+[\d:]+\s+\d+)\s+(?P<uptime>\d+\s+Hrs\s+\d+\s+Mins)\s+(?P<record_count>\d+)$")
+        p0 = regex_engine.compile(r"^(?P<sp_address>[\d.]+|[\d:]+)/(?P<port>\d+)\s+(?P<cache_sync_sent>\d+)\s+(?P<cache_sync_time>NA|\w+\s+\d+\s+[\d:]+\s+\d+)\s+(?P<uptime>\d+\s+Hrs\s+\d+\s+Mins)\s+(?P<record_count>\d+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -805,10 +805,10 @@ class ShowMdnsSdServiceList(ShowMdnsSdServiceListSchema):
         ret_dict = {}
 
         # default-mdns-out-service-list                        OUT         multifunction-printer            any                           ALL              default-mdns-location-filter
-        p0 = re.compile(r"^(?P<srvc_list>[\w-]+)\s+(?P<filter_dir>(IN|OUT|CTRL))\s+(?P<srvc>[\w-]+)\s+(?P<msg_type>[\w-]+)\s+(?P<source>(ALL|-))\s+(?P<loc_filter>[\w-]+)$")
+        p0 = regex_engine.compile(r"^(?P<srvc_list>[\w-]+)\s+(?P<filter_dir>(IN|OUT|CTRL))\s+(?P<srvc>[\w-]+)\s+(?P<msg_type>[\w-]+)\s+(?P<source>(ALL|-))\s+(?P<loc_filter>[\w-]+)$")
         
         # IN                  printer-ipps            any                             -           -
-        p1 = re.compile(r"^(?P<filter_dir>(IN|OUT|CTRL))\s+(?P<srvc>[\w-]+)\s+(?P<msg_type>[\w-]+)\s+(?P<source>(ALL|-))\s+(?P<loc_filter>[\w-]+)$")
+        p1 = regex_engine.compile(r"^(?P<filter_dir>(IN|OUT|CTRL))\s+(?P<srvc>[\w-]+)\s+(?P<msg_type>[\w-]+)\s+(?P<source>(ALL|-))\s+(?P<loc_filter>[\w-]+)$")
          
         for line in out.splitlines():
             line = line.strip()
@@ -888,12 +888,12 @@ class ShowMdnsSdQueryDb(ShowMdnsSdQueryDbSchema):
         ret_dict = {}
         
         # PTR Name: _ipp._tcp.local
-        p0 = re.compile(r"^PTR Name: +(?P<query_name>[\w.-]+)$")
+        p0 = regex_engine.compile(r"^PTR Name: +(?P<query_name>[\w.-]+)$")
         
-        p1 = re.compile(r"^(?P<client_mac>([a-zA-Z0-9]+\.){2}[a-zA-Z0-9]+)\s+(?P<vlan_id>[\d]+)\s+(?P<location_id>([\d]+)|[\w]+)\s+(?P<user_role>[A-Za-z]+)$")
+        p1 = regex_engine.compile(r"^(?P<client_mac>([a-zA-Z0-9]+\.){2}[a-zA-Z0-9]+)\s+(?P<vlan_id>[\d]+)\s+(?P<location_id>([\d]+)|[\w]+)\s+(?P<user_role>[A-Za-z]+)$")
         
         # 000c.297d.4ed7      120       851        Default                       none
-        p2 = re.compile(r"^(?P<client_mac>([a-zA-Z0-9]+\.\w+\.\w+)+)\s+(?P<ttl>[\d]+)\s+(?P<vlan_id>[\d]+)\s+(?P<location_id>([\d]+)|[\w]+)\s+(?P<user_role>[A-Za-z]+)$")
+        p2 = regex_engine.compile(r"^(?P<client_mac>([a-zA-Z0-9]+\.\w+\.\w+)+)\s+(?P<ttl>[\d]+)\s+(?P<vlan_id>[\d]+)\s+(?P<location_id>([\d]+)|[\w]+)\s+(?P<user_role>[A-Za-z]+)$")
         
         
               
@@ -974,19 +974,19 @@ class ShowMdnsSdLocationGroupDetail(ShowMdnsSdLocationGroupDetailSchema):
         ret_dict = {}
          
         # Trusted Trunks         : Twe1/0/13 
-        p0 = re.compile(r"^Trusted +Trunks\s+: +(?P<trust_links>(.*))$")
+        p0 = regex_engine.compile(r"^Trusted +Trunks\s+: +(?P<trust_links>(.*))$")
         
         # Vlan's                 : 2801-2802
-        p1 = re.compile(r"^Vlan.*: +(?P<vlans_added>[\d\-,]+)$")
+        p1 = regex_engine.compile(r"^Vlan.*: +(?P<vlans_added>[\d\-,]+)$")
          
         # Total Number of Location Groups: 0
-        p2 = re.compile(r"^Total +Number +of +Location +Groups: +(?P<total_loc_grps>([0-9]+))$")
+        p2 = regex_engine.compile(r"^Total +Number +of +Location +Groups: +(?P<total_loc_grps>([0-9]+))$")
         
         # 2801                         1          0     Twe1/0/1, Twe1/0/24, 
-        p3 = re.compile(r"^(?P<vlans>\d+)\s+(?P<no_of_lg>\d+)\s+(?P<lg_id>\d+)\s+(?P<ports>.*),?$")
+        p3 = regex_engine.compile(r"^(?P<vlans>\d+)\s+(?P<no_of_lg>\d+)\s+(?P<lg_id>\d+)\s+(?P<ports>.*),?$")
         
         # 2802                         1          0     Twe1/0/7, 
-        p4 = re.compile(r"^(?P<lg_id>\d+)\s+(?P<ports>.*),?$")
+        p4 = regex_engine.compile(r"^(?P<lg_id>\d+)\s+(?P<ports>.*),?$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1070,22 +1070,22 @@ class ShowMdnsSdStatisticsCacheVlan(ShowMdnsSdStatisticsCacheVlanSchema):
         ret_dict = {}
         
         # Number of service types : 14
-        p1 = re.compile(r'^Number +of +service +types +: +(?P<srvc_types>\d+)$')
+        p1 = regex_engine.compile(r'^Number +of +service +types +: +(?P<srvc_types>\d+)$')
                 
         # Number of records of type PTR : 913
-        p2 = re.compile(r'^Number +of +records +of +type +PTR +: +(?P<srvc_PTR>\d+)$')
+        p2 = regex_engine.compile(r'^Number +of +records +of +type +PTR +: +(?P<srvc_PTR>\d+)$')
         
         # Number of records of type SRV : 913
-        p3 = re.compile(r'^Number +of +records +of +type +SRV +: +(?P<srvc_SRV>\d+)$')
+        p3 = regex_engine.compile(r'^Number +of +records +of +type +SRV +: +(?P<srvc_SRV>\d+)$')
 
         # Number of records of type A : 78
-        p4 = re.compile(r'^Number +of +records +of +type +A +: +(?P<srvc_A>\d+)$')
+        p4 = regex_engine.compile(r'^Number +of +records +of +type +A +: +(?P<srvc_A>\d+)$')
 
         # Number of records of type AAAA : 78
-        p5 = re.compile(r'^Number +of +records +of +type +AAAA +: +(?P<srvc_AAAA>\d+)$')
+        p5 = regex_engine.compile(r'^Number +of +records +of +type +AAAA +: +(?P<srvc_AAAA>\d+)$')
         
         # Number of records of type TXT : 913
-        p6 = re.compile(r'^Number +of +records +of +type +TXT +: +(?P<srvc_TXT>\d+)$')
+        p6 = regex_engine.compile(r'^Number +of +records +of +type +TXT +: +(?P<srvc_TXT>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1168,7 +1168,7 @@ class ShowMdnsSdServicePolicyAssociationVlan(ShowMdnsSdServicePolicyAssociationV
         ret_dict = {}
         
         #VLAN            Service-policy
-        p1 = re.compile(r'^(?P<VLAN>\d+) +(?P<Service_policy>.+)$')
+        p1 = regex_engine.compile(r'^(?P<VLAN>\d+) +(?P<Service_policy>.+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1253,64 +1253,64 @@ class ShowMdnsSdSpSdgStatistics(ShowMdnsSdSpSdgStatisticsSchema):
         ret_dict = {}
         
         # Average Input rate (pps) : 0, 0, 0
-        p0 = re.compile(r'Average Input rate +\(pps\) +: +(?P<one_min>\d+),\s+(?P<five_mins>\d+),\s+(?P<one_hour>\d+)')
+        p0 = regex_engine.compile(r'Average Input rate +\(pps\) +: +(?P<one_min>\d+),\s+(?P<five_mins>\d+),\s+(?P<one_hour>\d+)')
         
         # Average Output rate (pps) : 0, 0, 0
-        p1 = re.compile(r'Average Output rate +\(pps\) +: +(?P<one_min>\d+),\s+(?P<five_mins>\d+),\s+(?P<one_hour>\d+)')
+        p1 = regex_engine.compile(r'Average Output rate +\(pps\) +: +(?P<one_min>\d+),\s+(?P<five_mins>\d+),\s+(?P<one_hour>\d+)')
         
         # Messages sent:
-        p2 = re.compile(r'Messages sent:')
+        p2 = regex_engine.compile(r'Messages sent:')
         
         # Query : 15050
-        p3 = re.compile(r'Query +: +(?P<query>\d+)')
+        p3 = regex_engine.compile(r'Query +: +(?P<query>\d+)')
         
         # ANY query : 0
-        p4 = re.compile(r'ANY +query +: +(?P<any_qry>\d+)')
+        p4 = regex_engine.compile(r'ANY +query +: +(?P<any_qry>\d+)')
         
         # Advertisements : 2684
-        p5 = re.compile(r'Advertisements +: +(?P<advts>\d+)')
+        p5 = regex_engine.compile(r'Advertisements +: +(?P<advts>\d+)')
         
         # Advertisement Withdraw : 0
-        p6 = re.compile(r'Advertisement +Withdraw +: +(?P<advt_wtdrw>\d+)')
+        p6 = regex_engine.compile(r'Advertisement +Withdraw +: +(?P<advt_wtdrw>\d+)')
         
         # Interface down : 0
-        p7 = re.compile(r'Interface +down +: +(?P<intf_down>\d+)')
+        p7 = regex_engine.compile(r'Interface +down +: +(?P<intf_down>\d+)')
         
         # Vlan down : 0
-        p8 = re.compile(r'Vlan +down +: +(?P<vlan_down>\d+)')
+        p8 = regex_engine.compile(r'Vlan +down +: +(?P<vlan_down>\d+)')
         
         # Service-peer cache clear : 0
-        p9 = re.compile(r'Service-peer +cache +clear +: +(?P<srvic_cach_clear>\d+)')
+        p9 = regex_engine.compile(r'Service-peer +cache +clear +: +(?P<srvic_cach_clear>\d+)')
         
         # Resync response : 0
-        p10 = re.compile(r'Resync +response +: +(?P<rsync_resp>\d+)')
+        p10 = regex_engine.compile(r'Resync +response +: +(?P<rsync_resp>\d+)')
         
         # Srvc Discovery response : 0
-        p11 = re.compile(r'Srvc +Discovery +response +: +(?P<srvc_discv_resp>\d+)')
+        p11 = regex_engine.compile(r'Srvc +Discovery +response +: +(?P<srvc_discv_resp>\d+)')
         
         # Keep-Alive : 5421
-        p12 = re.compile(r'Keep-Alive +: +(?P<keep_alive>\d+)')
+        p12 = regex_engine.compile(r'Keep-Alive +: +(?P<keep_alive>\d+)')
         
         # Messages received:
-        p13 = re.compile(r'Messages received:')
+        p13 = regex_engine.compile(r'Messages received:')
         
         # Query response : 0
-        p14 = re.compile(r'Query +response +: +(?P<qry_resp>\d+)')
+        p14 = regex_engine.compile(r'Query +response +: +(?P<qry_resp>\d+)')
         
         # ANY Query response : 0
-        p15 = re.compile(r'ANY +Query +response +: +(?P<any_qry_resp>\d+)')
+        p15 = regex_engine.compile(r'ANY +Query +response +: +(?P<any_qry_resp>\d+)')
         
         # Cache-sync : 60
-        p16 = re.compile(r'Cache-sync +: +(?P<cache_sync>\d+)')
+        p16 = regex_engine.compile(r'Cache-sync +: +(?P<cache_sync>\d+)')
         
         # Get service-instance : 0
-        p17 = re.compile(r'Get +service-instance +: +(?P<get_srvc_inst>\d+)')
+        p17 = regex_engine.compile(r'Get +service-instance +: +(?P<get_srvc_inst>\d+)')
         
         # Srvc Discovery request : 0
-        p18 = re.compile(r'Srvc +Discovery +request +: +(?P<srvc_discv_reqst>\d+)')
+        p18 = regex_engine.compile(r'Srvc +Discovery +request +: +(?P<srvc_discv_reqst>\d+)')
         
         # Keep-Alive Response : 5421
-        p19 = re.compile(r'Keep-Alive +Response +: +(?P<keep_alive_resp>\d+)')
+        p19 = regex_engine.compile(r'Keep-Alive +Response +: +(?P<keep_alive_resp>\d+)')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1470,31 +1470,31 @@ class ShowMdnsSdStatisticsCacheAll(ShowMdnsSdStatisticsCacheAllSchema):
         ret_dict = {}
         
         # mDNS cache statistics:
-        p0 = re.compile(r'mDNS cache statistics')
+        p0 = regex_engine.compile(r'mDNS cache statistics')
         
         #Number of service types : 14
-        p1 = re.compile(r'Number +of +service +types +: +(?P<srvc_types>\d+)')
+        p1 = regex_engine.compile(r'Number +of +service +types +: +(?P<srvc_types>\d+)')
                 
         # Number of records of type PTR : 913
-        p2 = re.compile(r'^Number +of +records +of +type +(?P<record_type>\S+) +: +(?P<count>\d+)$')
+        p2 = regex_engine.compile(r'^Number +of +records +of +type +(?P<record_type>\S+) +: +(?P<count>\d+)$')
         
         # Top service types by instances:
-        p3 = re.compile(r'Top service types by instances')
+        p3 = regex_engine.compile(r'Top service types by instances')
                 
         #Service type
-        p4 = re.compile(r'^Service type')
+        p4 = regex_engine.compile(r'^Service type')
         
         #service instances _http._tcp.local : 76
-        p5 = re.compile(r'^(?P<service_instance>_\S+) +: +(?P<count>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<service_instance>_\S+) +: +(?P<count>\d+)$')
         
         # Top advertisers of record:
-        p6 = re.compile(r'Top advertisers of record')
+        p6 = regex_engine.compile(r'Top advertisers of record')
         
         #MAC Address
-        p7 = re.compile(r'^MAC Address')
+        p7 = regex_engine.compile(r'^MAC Address')
         
         #MAC Address records 0242.2d01.0f04 : 74
-        p8 = re.compile(r'^(?P<mac_address_records>[a-zA-Z0-9]+\.\w+\.\w+) +: +(?P<count>\d+)$')
+        p8 = regex_engine.compile(r'^(?P<mac_address_records>[a-zA-Z0-9]+\.\w+\.\w+) +: +(?P<count>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1608,86 +1608,86 @@ class ShowMdnsSdSummary(ShowMdnsSdSummarySchema):
         ret_dict = {}
         
         #Global mDNS Gateway
-        p0 = re.compile(r"Global mDNS Gateway")
+        p0 = regex_engine.compile(r"Global mDNS Gateway")
 
         # mDNS Gateway               : Enabled
-        p1 = re.compile(r'^mDNS +Gateway +: +(?P<mdns_gty>\w+)$')
+        p1 = regex_engine.compile(r'^mDNS +Gateway +: +(?P<mdns_gty>\w+)$')
     
         # Rate Limit PPS             : 60
-        p2 = re.compile(r'^Rate +Limit +PPS +: +(?P<rate_lmt>\d+)$')
+        p2 = regex_engine.compile(r'^Rate +Limit +PPS +: +(?P<rate_lmt>\d+)$')
         
         # Rate Limit Mode            : default
-        p3 = re.compile(r'^Rate +Limit +Mode +: +(?P<rate_lmt_mode>\w+)$')
+        p3 = regex_engine.compile(r'^Rate +Limit +Mode +: +(?P<rate_lmt_mode>\w+)$')
     
         # AirPrint Helper            : Disabled
-        p4 = re.compile(r'^AirPrint +Helper +: +(?P<air_prnt>\w+)$')
+        p4 = regex_engine.compile(r'^AirPrint +Helper +: +(?P<air_prnt>\w+)$')
     
         # Mode                       : SDG-Agent
-        p5 = re.compile(r'^Mode +: +(?P<mode>\S+)$')
+        p5 = regex_engine.compile(r'^Mode +: +(?P<mode>\S+)$')
     
         # SDG Agent IP               : 40.1.3.1
-        p6 = re.compile(r'^SDG +Agent +IP +: +(?P<sdg_ip>\d+.+\d+.+\d+.+\d+)$')
+        p6 = regex_engine.compile(r'^SDG +Agent +IP +: +(?P<sdg_ip>\d+.+\d+.+\d+.+\d+)$')
     
         # Source Interface : Vl1301
-        p7 = re.compile(r'^Source +Interface +\: +(?P<src_intef>(.*))$')
+        p7 = regex_engine.compile(r'^Source +Interface +\: +(?P<src_intef>(.*))$')
     
         # Cache-Sync Periodicity Minutes   : 30 
-        p8 = re.compile(r'^Cache-Sync +Periodicity +Minutes +: +(?P<cache_sync>\d+)$')
+        p8 = regex_engine.compile(r'^Cache-Sync +Periodicity +Minutes +: +(?P<cache_sync>\d+)$')
         
         # Cache-Sync Periodicity Mode    : default
-        p9 = re.compile(r'^Cache-Sync +Periodicity +Mode +: +(?P<cache_sync_mode>\w+)$')
+        p9 = regex_engine.compile(r'^Cache-Sync +Periodicity +Mode +: +(?P<cache_sync_mode>\w+)$')
     
         # Active Response Timer      : 20 Seconds
-        p10 = re.compile(r'^Active +Response +Timer +: +(?P<act_tmr>(.*))$')
+        p10 = regex_engine.compile(r'^Active +Response +Timer +: +(?P<act_tmr>(.*))$')
     
         # Active Query Timer         : Enabled
-        p11 = re.compile(r'^Active +Query +Timer +: +(?P<act_qtmr>\w+)$')
+        p11 = regex_engine.compile(r'^Active +Query +Timer +: +(?P<act_qtmr>\w+)$')
         
         # Active Query Timer Minutes        : 30
-        p12 = re.compile(r'^Active +Query +Timer +Minutes +: +(?P<act_qtmr_mins>\d+)$')
+        p12 = regex_engine.compile(r'^Active +Query +Timer +Minutes +: +(?P<act_qtmr_mins>\d+)$')
         
         # Active Query Timer Mode        : default
-        p13 = re.compile(r'^Active +Query +Timer +Mode +: +(?P<act_qtmr_mode>\w+)$')
+        p13 = regex_engine.compile(r'^Active +Query +Timer +Mode +: +(?P<act_qtmr_mode>\w+)$')
     
         # mDNS Query Type            : PTR only
-        p14 = re.compile(r'^mDNS +Query +Type +: +(?P<mdns_qry_type>\w+ +\w+)$')
+        p14 = regex_engine.compile(r'^mDNS +Query +Type +: +(?P<mdns_qry_type>\w+ +\w+)$')
     
         # Service Enumeration period : Default
-        p15 = re.compile(r'^Service +Enumeration +period +: +(?P<srv_prd>\w+)$')
+        p15 = regex_engine.compile(r'^Service +Enumeration +period +: +(?P<srv_prd>\w+)$')
     
         # SSO                        : Active
-        p16 = re.compile(r'^SSO +: +(?P<sso>\w+)$')
+        p16 = regex_engine.compile(r'^SSO +: +(?P<sso>\w+)$')
         
         # Service Record TTL : original
         # Service Record TTL               : Enhanced (default)
-        p17 = re.compile(r'^Service +Record +TTL +: +(?P<srv_ttl>(.*))$')
+        p17 = regex_engine.compile(r'^Service +Record +TTL +: +(?P<srv_ttl>(.*))$')
         
         # Ingress-client query-suppression : Disabled
-        p18 = re.compile(r'^Ingress-client +query-suppression +: +(?P<ingrs_qry_suprs>\w+)$')
+        p18 = regex_engine.compile(r'^Ingress-client +query-suppression +: +(?P<ingrs_qry_suprs>\w+)$')
         
         # ANY Query Forward : Disabled
-        p19 = re.compile(r'^ANY +Query +Forward +: +(?P<any_query_frwrd>\w+)$')
+        p19 = regex_engine.compile(r'^ANY +Query +Forward +: +(?P<any_query_frwrd>\w+)$')
         
         # Next Advertisement to SDG : 00:00:06
-        p20 = re.compile(r'^Next +Advertisement +to +SDG +: +(?P<nxt_advt_sdg>[\d:]+)$')
+        p20 = regex_engine.compile(r'^Next +Advertisement +to +SDG +: +(?P<nxt_advt_sdg>[\d:]+)$')
         
         # Next Query to SDG : 00:00:06
-        p21 = re.compile(r'^Next +Query +to +SDG +: +(?P<nxt_qry_sdg>[\d:]+)$')
+        p21 = regex_engine.compile(r'^Next +Query +to +SDG +: +(?P<nxt_qry_sdg>[\d:]+)$')
         
         # Query Response Mode : Recurring (default)
-        p22 = re.compile(r'^Query +Response +Mode +: +(?P<qry_resp_mode>(.*))$')
+        p22 = regex_engine.compile(r'^Query +Response +Mode +: +(?P<qry_resp_mode>(.*))$')
         
         # Service Receiver Purge Timer: 60 Seconds
-        p23 = re.compile(r'^Service +Receiver +Purge +Timer +: +(?P<servc_purge_timer>(.*))$')
+        p23 = regex_engine.compile(r'^Service +Receiver +Purge +Timer +: +(?P<servc_purge_timer>(.*))$')
         
         # Remote cache : Enabled (default)
-        p24 = re.compile(r'^Remote +cache +: +(?P<rmt_cache>(.*))$')
+        p24 = regex_engine.compile(r'^Remote +cache +: +(?P<rmt_cache>(.*))$')
 
         # Remote cache max limit : 1000 (default)
-        p25 = re.compile(r'^Remote +cache +max +limit +: +(?P<rmt_cache_max_lmt>(.*))$')
+        p25 = regex_engine.compile(r'^Remote +cache +max +limit +: +(?P<rmt_cache_max_lmt>(.*))$')
 
         # Remote cache purge timer : 300 Seconds (default) 
-        p26 = re.compile(r'^Remote +cache +purge +timer +: +(?P<rmt_cache_prg_tmr>(.*))$')
+        p26 = regex_engine.compile(r'^Remote +cache +purge +timer +: +(?P<rmt_cache_prg_tmr>(.*))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1911,28 +1911,28 @@ class ShowMdnsSdSummaryInterfaceVlan(ShowMdnsSdSummaryInterfaceVlanSchema):
         ret_dict = {}
 
         # Interface : Vlan300
-        p1 = re.compile(r'Interface +: +(?P<inter>(.*))')
+        p1 = regex_engine.compile(r'Interface +: +(?P<inter>(.*))')
         
         # mDNS Gateway               : Enabled
-        p2 = re.compile(r'mDNS +Gateway +: +(?P<mdns_gty>\w+)')
+        p2 = regex_engine.compile(r'mDNS +Gateway +: +(?P<mdns_gty>\w+)')
     
         # mDNS Service Policy      : Not-Configured
-        p3 = re.compile(r'mDNS +Service +Policy +: +(?P<mdns_plcy>(.*))')
+        p3 = regex_engine.compile(r'mDNS +Service +Policy +: +(?P<mdns_plcy>(.*))')
         
         # Active Query             : Enabled
-        p4 = re.compile(r'Active +Query +: +(?P<act_qry>\w+)')
+        p4 = regex_engine.compile(r'Active +Query +: +(?P<act_qry>\w+)')
     
         # Periodicity Seconds : 60
-        p5 = re.compile(r'Periodicity +Seconds +: +(?P<prdcty>\d+)')
+        p5 = regex_engine.compile(r'Periodicity +Seconds +: +(?P<prdcty>\d+)')
         
         # Transport Type           : IPv6
-        p6 = re.compile(r'Transport +Type +\: +(?P<trnsprt_type>(.*))')
+        p6 = regex_engine.compile(r'Transport +Type +\: +(?P<trnsprt_type>(.*))')
         
         # Service Instance Suffix  : Not-Configured
-        p7 = re.compile(r'Service +Instance +Suffix +: +(?P<srvc_inst>(.*))')
+        p7 = regex_engine.compile(r'Service +Instance +Suffix +: +(?P<srvc_inst>(.*))')
     
         # mDNS Query Type            : PTR only
-        p8 = re.compile(r'mDNS +Query +Type +: +(?P<mdns_qry_type>\w+ +\w+)')
+        p8 = regex_engine.compile(r'mDNS +Query +Type +: +(?P<mdns_qry_type>\w+ +\w+)')
     
         for line in output.splitlines():
             line = line.strip()
@@ -2019,34 +2019,34 @@ class ShowMdnsSdSummaryVlan(ShowMdnsSdSummaryVlanSchema):
         ret_dict = {}
                 
         # VLAN  :  1101
-        p1 = re.compile(r'VLAN +: +(?P<vln>\d+)')
+        p1 = regex_engine.compile(r'VLAN +: +(?P<vln>\d+)')
 
         # mDNS Gateway               : Enabled
-        p2 = re.compile(r'mDNS +Gateway +: +(?P<mdns_gty>\w+)')
+        p2 = regex_engine.compile(r'mDNS +Gateway +: +(?P<mdns_gty>\w+)')
     
         # mDNS Service Policy : default-mdns-service-policy
-        p3 = re.compile(r'mDNS +Service +Policy +: +(?P<mdns_plcy>(.*))')
+        p3 = regex_engine.compile(r'mDNS +Service +Policy +: +(?P<mdns_plcy>(.*))')
         
         # Active Query             : Enabled
-        p4 = re.compile(r'Active +Query +: +(?P<act_qry>\w+)')
+        p4 = regex_engine.compile(r'Active +Query +: +(?P<act_qry>\w+)')
     
         #                         : Periodicity 30 minutes
-        p5 = re.compile(r': +(?P<prdcty>(.*))')
+        p5 = regex_engine.compile(r': +(?P<prdcty>(.*))')
                 
         # Transport Type           : IPv4 
-        p6 = re.compile(r'Transport +Type +\: +(?P<trnsprt_type>(.*))')
+        p6 = regex_engine.compile(r'Transport +Type +\: +(?P<trnsprt_type>(.*))')
         
         # Service Instance Suffix  : Not-Configured
-        p7 = re.compile(r'Service +Instance +Suffix +: +(?P<srvc_inst>(.*))')
+        p7 = regex_engine.compile(r'Service +Instance +Suffix +: +(?P<srvc_inst>(.*))')
         
         # mDNS Query Type            : ALL
-        p8 = re.compile(r'mDNS +Query +Type +: +(?P<mdns_qry_type>(.*))')
+        p8 = regex_engine.compile(r'mDNS +Query +Type +: +(?P<mdns_qry_type>(.*))')
     
         # SDG Agent IP               : 10.1.1.2
-        p9 = re.compile(r'SDG +Agent +IP +: +(?P<sdg_ip>\d+.+\d+.+\d+.+\d+)')
+        p9 = regex_engine.compile(r'SDG +Agent +IP +: +(?P<sdg_ip>\d+.+\d+.+\d+.+\d+)')
     
         # Source Interface : Vlan4025
-        p10 = re.compile(r'Source +Interface +\: +(?P<src_intef>(.*))')
+        p10 = regex_engine.compile(r'Source +Interface +\: +(?P<src_intef>(.*))')
            
         for line in output.splitlines():
             line = line.strip()
@@ -2145,7 +2145,7 @@ class ShowMdnsSdServicePolicyAssociationRole(ShowMdnsSdServicePolicyAssociationR
 
         ret_dict = {}
         #                     Mac                 Service-policy                Lg-Id           Role
-        p1 = re.compile(r'(?P<Mac>[\w\.\:]+) +(?P<Service_policy>([\w_]+)) +(?P<Lg_Id>\d+) +(?P<Role>\w+)')
+        p1 = regex_engine.compile(r'(?P<Mac>[\w\.\:]+) +(?P<Service_policy>([\w_]+)) +(?P<Lg_Id>\d+) +(?P<Role>\w+)')
         
         for line in output.splitlines():
             line = line.strip()
@@ -2198,31 +2198,31 @@ class ShowMdnsSdControllerSummary(ShowMdnsSdControllerSummarySchema):
         ret_dict = {}
         
         #Controller Summary
-        p0 = re.compile(r"Controller Summary")
+        p0 = regex_engine.compile(r"Controller Summary")
         
         #Controller Name : DNAC
-        p1 = re.compile(r'Controller +Name +: +(?P<contrl_name>\w+)')
+        p1 = regex_engine.compile(r'Controller +Name +: +(?P<contrl_name>\w+)')
                 
         # Controller IP : 11.12.13.14
-        p2 = re.compile(r'Controller +IP +: +(?P<cntrl_ip>\d+.+\d+.+\d+.+\d+)')
+        p2 = regex_engine.compile(r'Controller +IP +: +(?P<cntrl_ip>\d+.+\d+.+\d+.+\d+)')
         
         #State : UP
-        p3 = re.compile(r'State +: +(?P<state>\w+)')
+        p3 = regex_engine.compile(r'State +: +(?P<state>\w+)')
 
         #Port : 9991
-        p4 = re.compile(r'Port +: +(?P<port>\d+)')
+        p4 = regex_engine.compile(r'Port +: +(?P<port>\d+)')
 
         #Interface : Loopback0
-        p5 = re.compile(r'Interface +: +(?P<intf>(.*))')
+        p5 = regex_engine.compile(r'Interface +: +(?P<intf>(.*))')
         
         #Filter List : policy-con
-        p6 = re.compile(r'Filter +List +: +(?P<filt_lst>(.*))')
+        p6 = regex_engine.compile(r'Filter +List +: +(?P<filt_lst>(.*))')
         
         #Dead Time : 00:00:00
-        p7 = re.compile(r'Dead +Time +: +(?P<dead_time>(.*))')
+        p7 = regex_engine.compile(r'Dead +Time +: +(?P<dead_time>(.*))')
         
         #Service Buffer : Enabled
-        p8 = re.compile(r'Service +Buffer +: +(?P<servc_buff>\w+)')
+        p8 = regex_engine.compile(r'Service +Buffer +: +(?P<servc_buff>\w+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2342,55 +2342,55 @@ class ShowMdnsSdControllerDetail(ShowMdnsSdControllerDetailSchema):
         ret_dict = {}
 
         #Controller : DNAC-CONTROLLER-POLICY
-        p0 = re.compile(r"^Controller +: +(?P<policy>[\w-]+)$")
+        p0 = regex_engine.compile(r"^Controller +: +(?P<policy>[\w-]+)$")
 
         #IP : 98.98.98.10, Dest Port : 9991, Src Port : 25204, State : UP
-        p1 = re.compile(r"^IP +: +(?P<cont_ip>[\d.]+)\, +Dest +Port +: (?P<dest_port>[\d]+)\, +Src +Port +: +(?P<src_port>[\d]+)\, +State +: +(?P<state>\w+)$")
+        p1 = regex_engine.compile(r"^IP +: +(?P<cont_ip>[\d.]+)\, +Dest +Port +: (?P<dest_port>[\d]+)\, +Src +Port +: +(?P<src_port>[\d]+)\, +State +: +(?P<state>\w+)$")
 
         #Source Interface : Loopback0, MD5 Enabled, Synchronized
-        p2 = re.compile(r"^Source +Interface +: +(?P<src_intf>[\w\d]+)\, +MD5 +(?P<md5_mode>[\w]+)")
+        p2 = regex_engine.compile(r"^Source +Interface +: +(?P<src_intf>[\w\d]+)\, +MD5 +(?P<md5_mode>[\w]+)")
 
         #Hello Timer 40 sec, Dead Timer 160 sec, Next Hello 00:00:08
-        p3 = re.compile(r"^Hello +Timer +(?P<hello_timer>[\d]+) +sec\, +Dead +Timer +(?P<dead_timer>[\d]+) +sec\, +Next +Hello +(?P<next_hello>[\d:]+)$")
+        p3 = regex_engine.compile(r"^Hello +Timer +(?P<hello_timer>[\d]+) +sec\, +Dead +Timer +(?P<dead_timer>[\d]+) +sec\, +Next +Hello +(?P<next_hello>[\d:]+)$")
         
         #Uptime 2d00h (15:32:56 IST Nov 3 2021)
-        p4 = re.compile(r"^Uptime +(?P<up_time>(.*))$")
+        p4 = regex_engine.compile(r"^Uptime +(?P<up_time>(.*))$")
 
         #Service Buffer : Enabled
-        p5 = re.compile(r"^Service +Buffer +: +(?P<srvc_buffer>[\w]+)$")
+        p5 = regex_engine.compile(r"^Service +Buffer +: +(?P<srvc_buffer>[\w]+)$")
 
         #Service Announcement :
-        p6 = re.compile(r"^Service +Announcement +:$")
+        p6 = regex_engine.compile(r"^Service +Announcement +:$")
 
         #Filter : WIDE-AREA-POLICY
-        p7 = re.compile(r"^Filter +: +(?P<filter>[\w-]+)$")
+        p7 = regex_engine.compile(r"^Filter +: +(?P<filter>[\w-]+)$")
 
         # Count 50, Delay Timer 30 sec, Pending Announcement 0, Pending Withdraw 0
-        p8 = re.compile(r"^Count +(?P<count>[\d]+)\, +Delay +Timer +(?P<delay_timer>[\d]+) +sec\, +Pending +Announcement +(?P<pending_announcement>[\d]+)\, +Pending +Withdraw +(?P<pending_withdrw>[\d]+)$")
+        p8 = regex_engine.compile(r"^Count +(?P<count>[\d]+)\, +Delay +Timer +(?P<delay_timer>[\d]+) +sec\, +Pending +Announcement +(?P<pending_announcement>[\d]+)\, +Pending +Withdraw +(?P<pending_withdrw>[\d]+)$")
 
         # Total Export Count 387, Next Export in 00:00:18
-        p9 = re.compile(r"^Total +Export +Count +(?P<tot_exp_count>[\d]+), +Next +Export +in +(?P<next_exp>[\d:]+)$")
+        p9 = regex_engine.compile(r"^Total +Export +Count +(?P<tot_exp_count>[\d]+), +Next +Export +in +(?P<next_exp>[\d:]+)$")
 
         #Service Query :
-        p10 = re.compile(r"^Service +Query +:$")
+        p10 = regex_engine.compile(r"^Service +Query +:$")
 
         # Query Suppression Disabled
-        p11 = re.compile(r"^Query +Suppression +(?P<qry_suppression>[\w]+)$")
+        p11 = regex_engine.compile(r"^Query +Suppression +(?P<qry_suppression>[\w]+)$")
 
         # Query Count 50, Query Delay Timer 15 sec, Pending 4
-        p12 = re.compile(r"^Query +Count +(?P<qry_count>[\d]+)\, +Query +Delay +Timer +(?P<qry_delay_timer>[\d]+) +sec\, +Pending +(?P<pending>[\d]+)$")
+        p12 = regex_engine.compile(r"^Query +Count +(?P<qry_count>[\d]+)\, +Query +Delay +Timer +(?P<qry_delay_timer>[\d]+) +sec\, +Pending +(?P<pending>[\d]+)$")
 
         # Total Query Count 171143, Next Query in 00:00:03
-        p13 = re.compile(r"^Total +Query +Count +(?P<tot_qry_count>[\d]+)\, +Next +Query +in +(?P<next_qry>[\d:]+)$")
+        p13 = regex_engine.compile(r"^Total +Query +Count +(?P<tot_qry_count>[\d]+)\, +Next +Query +in +(?P<next_qry>[\d:]+)$")
 
         #Service Enumeration :
-        p14 = re.compile(r"^Service +Enumeration +:$")
+        p14 = regex_engine.compile(r"^Service +Enumeration +:$")
 
         # Request Count 0, Last Requested :
-        p15 = re.compile(r"^Request +Count +(?P<req_count>[\d]+)\, +Last +Requested +:(?P<last_req>.*)$")
+        p15 = regex_engine.compile(r"^Request +Count +(?P<req_count>[\d]+)\, +Last +Requested +:(?P<last_req>.*)$")
 
         #Response Count 0, Last Responded :
-        p16 = re.compile(r"^Response +Count +(?P<res_count>[\d]+)\, +Last +Responded +:(?P<last_res>.*)$")
+        p16 = regex_engine.compile(r"^Response +Count +(?P<res_count>[\d]+)\, +Last +Responded +:(?P<last_res>.*)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2549,7 +2549,7 @@ class ShowMdnsSdCacheInvalid(ShowMdnsSdCacheInvalidSchema):
         ret_dict = {}
                 
         #                      SERVICE NAME               Mac Address                 PTR           SRV           A/AAAA           TXT
-        p1 = re.compile(r'^(?P<SERVICE_NAME>[\w.-]+) +(?P<Mac_Address>[\w\.\:]+) +(?P<PTR>\w+) +(?P<SRV>\w+) +(?P<A_AAAA>\w+) +(?P<TXT>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<SERVICE_NAME>[\w.-]+) +(?P<Mac_Address>[\w\.\:]+) +(?P<PTR>\w+) +(?P<SRV>\w+) +(?P<A_AAAA>\w+) +(?P<TXT>\w+)$')
         
         
         for line in output.splitlines():
@@ -2606,7 +2606,7 @@ class ShowMdnsSdCache(ShowMdnsSdCacheSchema):
 
         ret_dict = {}
         #[<NAME>]   [<TYPE>]    [<TTL>/Remaining]   [Vlan-Id/If-name] [Mac Address] [<RR Record Data>]        
-        p1 = re.compile(r'^\s*(?P<NAME>[\w._]+)\s+(?P<TYPE>\w+)\s+(?P<TTL_Remaining>\d+/\d+)\s+(?P<vlan>\d+)\s+(?P<Mac_Address>[\w\.\:]+)\s+(?P<RR>.*)$')
+        p1 = regex_engine.compile(r'^\s*(?P<NAME>[\w._]+)\s+(?P<TYPE>\w+)\s+(?P<TTL_Remaining>\d+/\d+)\s+(?P<vlan>\d+)\s+(?P<Mac_Address>[\w\.\:]+)\s+(?P<RR>.*)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -2658,7 +2658,7 @@ class ShowMdnsSdCacheRemote(ShowMdnsSdCacheRemoteSchema):
 
         ret_dict = {}
         #[<NAME>]   [<TTL/Remaining>]   [Vlan-Id]   [Location ID]   [<User Role>]        
-        p1 = re.compile(r'^\s*(?P<NAME>[\w._]+)\s+(?P<TTL_Remaining>\d+/\d+)\s+(?P<vlan>\d+)\s+(?P<Location_id>[\w\.\:]+)\s+(?P<User_Role>.*)$')
+        p1 = regex_engine.compile(r'^\s*(?P<NAME>[\w._]+)\s+(?P<TTL_Remaining>\d+/\d+)\s+(?P<vlan>\d+)\s+(?P<Location_id>[\w\.\:]+)\s+(?P<User_Role>.*)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1,9 +1,6 @@
 """show_memory.py
 
 """
-# python
-import re
-
 # metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -14,6 +11,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowMemoryStatisticsSchema(MetaParser):
     """Schema for show memory statistics"""
@@ -48,11 +48,11 @@ class ShowMemoryStatistics(ShowMemoryStatisticsSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<name>\S+( \w)?) +(?P<head>\w+) +(?P<total>\d+) +'
-                         r'(?P<used>\d+) +(?P<free>\d+) +'
-                         r'(?P<lowest>\d+) +(?P<largest>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<name>\S+( \w)?) +(?P<head>\w+) +(?P<total>\d+) +'
+                                   r'(?P<used>\d+) +(?P<free>\d+) +'
+                                   r'(?P<lowest>\d+) +(?P<largest>\d+)$')
 
-        p2 = re.compile(r'^Tracekey *: +(?P<tracekey>\S+)$')
+        p2 = regex_engine.compile(r'^Tracekey *: +(?P<tracekey>\S+)$')
 
         for line in out.splitlines(): 
             line = line.strip()
@@ -111,16 +111,16 @@ class ShowMemoryDebugLeaks(ShowMemoryDebugLeaksSchema):
             out = output
 
         # Tracekey : 1#50bb0560a294e78d5c720c4dd666d9f5
-        p1 = re.compile(r'^Tracekey *: +(?P<tracekey>\S+)$')
+        p1 = regex_engine.compile(r'^Tracekey *: +(?P<tracekey>\S+)$')
 
         # Processor memory
         # reserve Processor memory
         # lsmpi_io memory
-        p2 = re.compile(r'^(?P<memory>[\w\s]*memory)$')
+        p2 = regex_engine.compile(r'^(?P<memory>[\w\s]*memory)$')
 
         # 10.0.0.1        80  1234   Placeholder_proc        Placeholder_name               Placeholder_pc
-        p3 = re.compile(r'^(?P<address>\S+) +(?P<size>\d+) +(?P<pid>\d+) +'
-                       r'(?P<alloc_proc>\S+) +(?P<name>\S+) +(?P<alloc_pc>.*)$')
+        p3 = regex_engine.compile(r'^(?P<address>\S+) +(?P<size>\d+) +(?P<pid>\d+) +'
+                                 r'(?P<alloc_proc>\S+) +(?P<name>\S+) +(?P<alloc_pc>.*)$')
 
         ret_dict = dict()
 
@@ -195,15 +195,15 @@ class ShowMemoryDebugLeaksChunks(ShowMemoryDebugLeaksChunksSchema):
             output = self.device.execute(self.cli_command)
 
         # Tracekey : 1#cc860b27cccff1817bea87604823f7be
-        p1 = re.compile(r'^Tracekey *:\s+(?P<tracekey>\S+)$')
+        p1 = regex_engine.compile(r'^Tracekey *:\s+(?P<tracekey>\S+)$')
 
         # Processor memory
         # reserve Processor memory
         # lsmpi_io memory
-        p2 = re.compile(r'^(?P<memory>[\w\s]* memory)$')
+        p2 = regex_engine.compile(r'^(?P<memory>[\w\s]* memory)$')
 
         # 7F129EC22658    76 7F129EF46108 (MallocLite)     :55D8C0A61000+E0D8F11
-        p3 = re.compile(r'^(?P<address>\S+)\s+(?P<size>\d+)\s+(?P<parent>\S+)\s+\((?P<name>\S+)\)\s+(?P<alloc_pc>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<address>\S+)\s+(?P<size>\d+)\s+(?P<parent>\S+)\s+\((?P<name>\S+)\)\s+(?P<alloc_pc>\S+)$')
 
         ret_dict = {}
 
@@ -292,30 +292,30 @@ class ShowMemoryDeadTotal(ShowMemoryDeadTotalSchema):
             output = self.device.execute(self.cli_command)
 
         # Tracekey : 1#50bb0560a294e78d5c720c4dd666d9f5
-        p1 = re.compile(r'^Tracekey *: +(?P<tracekey>\S+)$')
+        p1 = regex_engine.compile(r'^Tracekey *: +(?P<tracekey>\S+)$')
 
         # Processor  7F5B2B4FD048   3791419980   281368020   3510051960   645435404   3145727908
-        p2 = re.compile(r'^Processor\s+(?P<head>\w+)\s+(?P<total>\d+)\s+(?P<used>\d+)\s+(?P<free>\d+)\s+(?P<lowest>\d+)\s+(?P<largest>\d+)$')
+        p2 = regex_engine.compile(r'^Processor\s+(?P<head>\w+)\s+(?P<total>\d+)\s+(?P<used>\d+)\s+(?P<free>\d+)\s+(?P<lowest>\d+)\s+(?P<largest>\d+)$')
 
         # reserve P  7F5B2B4FD0A0      102404          92      102312      102312      102312
-        p3 = re.compile(r'^reserve\s+P\s+(?P<head>\w+)\s+(?P<total>\d+)\s+(?P<used>\d+)\s+(?P<free>\d+)\s+(?P<lowest>\d+)\s+(?P<largest>\d+)$')
+        p3 = regex_engine.compile(r'^reserve\s+P\s+(?P<head>\w+)\s+(?P<total>\d+)\s+(?P<used>\d+)\s+(?P<free>\d+)\s+(?P<lowest>\d+)\s+(?P<largest>\d+)$')
 
         #  lsmpi_io  7F5B292CD1A8     6295128     6294304         824         824         412
-        p4 = re.compile(r'^lsmpi_io\s+(?P<head>\w+)\s+(?P<total>\d+)\s+(?P<used>\d+)\s+(?P<free>\d+)\s+(?P<lowest>\d+)\s+(?P<largest>\d+)$')
+        p4 = regex_engine.compile(r'^lsmpi_io\s+(?P<head>\w+)\s+(?P<total>\d+)\s+(?P<used>\d+)\s+(?P<free>\d+)\s+(?P<lowest>\d+)\s+(?P<largest>\d+)$')
 
         # Dynamic heap limit(MB) 3000      Use(MB) 0
-        p5 = re.compile(r'^Dynamic\s+heap\s+limit\(MB\)\s+(?P<dynamic_heap_limit>\d+)\s+Use\(MB\)\s+(?P<use>\d+)$')
+        p5 = regex_engine.compile(r'^Dynamic\s+heap\s+limit\(MB\)\s+(?P<dynamic_heap_limit>\d+)\s+Use\(MB\)\s+(?P<use>\d+)$')
         
         # Dead Proc Summary for: Processor
         # Dead Proc Summary for: reserve Processor
         # Dead Proc Summary for: lsmpi_io
-        p6 = re.compile(r'^Dead\sProc\sSummary\sfor:\s(?P<name>[A-Za-z _]+)$')
+        p6 = regex_engine.compile(r'^Dead\sProc\sSummary\sfor:\s(?P<name>[A-Za-z _]+)$')
         
         # # 10.0.0.1        80  1234   Placeholder_proc        Placeholder_name               Placeholder_pc
         # p3 = re.compile(r'^(?P<address>\S+) +(?P<size>\d+) +(?P<pid>\d+) +'
         #               r'(?P<alloc_proc>\S+) +(?P<name>\S+) +(?P<alloc_pc>.*)$')
         
-        p7 = re.compile(r'^(?P<total>\d+)\s+(?P<count>\d+)\s+(?P<name>[A-Za-z_0-9:-]+ ?[A-Za-z_0-9-:]+ ?[A-Za-z_0-9:-]+ ?[A-Za-z_:0-9]+)\s+:(?P<pc>[A-Z0-9+]+)$')
+        p7 = regex_engine.compile(r'^(?P<total>\d+)\s+(?P<count>\d+)\s+(?P<name>[A-Za-z_0-9:-]+ ?[A-Za-z_0-9-:]+ ?[A-Za-z_0-9:-]+ ?[A-Za-z_:0-9]+)\s+:(?P<pc>[A-Z0-9+]+)$')
 
         ret_dict = dict()
 
@@ -477,22 +477,22 @@ class ShowMemoryPlatformInformation(ShowMemoryPlatformInformationSchema):
         parsed_dict = {}
     
         # Virtual memory   : 49030533120
-        p1 = re.compile(r'^(?P<name>[A-Z][a-z]+\s+[a-z]+)\s+:\s(?P<size>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<name>[A-Z][a-z]+\s+[a-z]+)\s+:\s(?P<size>\d+)$')
         
         # Major page faults: 6958
-        p2 = re.compile(r'^(?P<name>[A-Z][a-z]+\s+\w+\s+\w+):\s(?P<size>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<name>[A-Z][a-z]+\s+\w+\s+\w+):\s(?P<size>\d+)$')
         
         # Architecture     : x86_64
-        p3 = re.compile(r'^Architecture\s+:\s+(?P<architecture>\w+)$')
+        p3 = regex_engine.compile(r'^Architecture\s+:\s+(?P<architecture>\w+)$')
         
         # Memory (kB)
-        p4 = re.compile(r'^(?P<block_name>\w+(\s\w+|\s+\(\w+\)))$')
+        p4 = regex_engine.compile(r'^(?P<block_name>\w+(\s\w+|\s+\(\w+\)))$')
         
         # Physical       : 7748808
-        p5 = re.compile(r'^(?P<name>[A-Za-z0-9-]+|[A-Za-z]+(-| )+\w+)(\s+:|:)\s+(?P<size>\d+|\d.+)$')
+        p5 = regex_engine.compile(r'^(?P<name>[A-Za-z0-9-]+|[A-Za-z]+(-| )+\w+)(\s+:|:)\s+(?P<size>\d+|\d.+)$')
         
         # Buffers (kB)     : 389964
-        p6 = re.compile(r'^(?P<block_name>\w+(\s\w+|\s+\(\w+\)))\s+:\s+(?P<buffer>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<block_name>\w+(\s\w+|\s+\(\w+\)))\s+:\s+(?P<buffer>\d+)$')
         
        
         for line in output.splitlines():
@@ -584,11 +584,11 @@ class ShowMemoryDebugIncrementalLeaks(ShowMemoryDebugLeaksSchema):
         # Processor memory
         # reserve Processor memory
         # lsmpi_io memory
-        p1 = re.compile(r'^(?P<memory>[\w\s]*memory)$')
+        p1 = regex_engine.compile(r'^(?P<memory>[\w\s]*memory)$')
 
         # 10.0.0.1        80  1234   Placeholder_proc        Placeholder_name               Placeholder_pc
-        p2 = re.compile(r'^(?P<address>\S+) +(?P<size>\d+) +(?P<pid>\d+) +'
-                       r'(?P<alloc_proc>\S+) +(?P<name>\S+) +(?P<alloc_pc>.*)$')
+        p2 = regex_engine.compile(r'^(?P<address>\S+) +(?P<size>\d+) +(?P<pid>\d+) +'
+                                 r'(?P<alloc_proc>\S+) +(?P<name>\S+) +(?P<alloc_pc>.*)$')
 
         ret_dict = dict()
 
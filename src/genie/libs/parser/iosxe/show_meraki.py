@@ -8,12 +8,12 @@ IOSXE parsers for the following show command:
 '''
 
 # Python
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 from genie.metaparser.util.schemaengine import (Schema, Any, Optional, Or, And, Default, Use, ListOf)
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -64,11 +64,11 @@ class ShowMeraki(ShowMerakiSchema):
         # 3       C9300-48UX FJC2317T0DT Q3EA-AZYP-WDFH  4cbc.4812.2501   Registered         C9K-C
         # 4       C9300-48TX FJC2311T0AJ N/A             5cbc.4812.3479   N/A                C9K-C
         # 1   C9300-24UX         FCW2248D19Q    Q5TD-GJZW-GLBA  0029.c29a.8e00    Registered   C9K-C [Monitoring]
-        p1 = re.compile(r'^(?P<switch_num>\d+)\s+(?P<pid>[\w-]+)\s+(?P<serial_number>[\w]+)\s+(?P<meraki_sn>[\w\/-]+)\s+(?P<mac_addr>[\w\.:]+)\s+(?P<conversion_status>[\w\s\/-]+)\s+(?P<current_mode>[\w\-]+(\s\[[\w\s]+\])?)$')
+        p1 = regex_engine.compile(r'^(?P<switch_num>\d+)\s+(?P<pid>[\w-]+)\s+(?P<serial_number>[\w]+)\s+(?P<meraki_sn>[\w\/-]+)\s+(?P<mac_addr>[\w\.:]+)\s+(?P<conversion_status>[\w\s\/-]+)\s+(?P<current_mode>[\w\-]+(\s\[[\w\s]+\])?)$')
         
         # 1   MS390-24UX         Q3ED-6UWS-6TLX     N/A  N/A   N/A   C9K-C
         # 1   MS390-24UX         Q3ED-6UWS-6TLX     N/A  N/A   N/A   C9K-C[Monitoring]
-        p2 = re.compile(r'^(?P<switch_num>\d+)\s+(?P<pid>[\w-]+)\s+(?P<serial_number>[\w\/-]+)\s+(?P<meraki_sn>[\w\/-]+)\s+(?P<mac_addr>[\w\/.:]+)\s+(?P<conversion_status>[\w\/-]+)\s+(?P<current_mode>[\w\-]+(\s\[[\w\s]+\])?)\s*$')
+        p2 = regex_engine.compile(r'^(?P<switch_num>\d+)\s+(?P<pid>[\w-]+)\s+(?P<serial_number>[\w\/-]+)\s+(?P<meraki_sn>[\w\/-]+)\s+(?P<mac_addr>[\w\/.:]+)\s+(?P<conversion_status>[\w\/-]+)\s+(?P<current_mode>[\w\-]+(\s\[[\w\s]+\])?)\s*$')
         
         parsed_dict = {}
 
@@ -205,16 +205,16 @@ class ShowMerakiConnect(ShowMerakiConnectSchema):
         #   Status:                     Registered
         #   Timestamp(UTC):             2015-01-04 06:59:22
         #   Cloud ID:                   Q2ZZ-VYED-JVDA
-        p1 = re.compile(r"^(?P<key>.+): +(?P<value>.+)$")
+        p1 = regex_engine.compile(r"^(?P<key>.+): +(?P<value>.+)$")
         
         # Meraki Tunnel Config
         # Meraki Tunnel State
         # Meraki Tunnel Interface
         # Meraki Device Registration
-        p2 = re.compile(r"^(?P<key>[A-Z][a-z]+(\s+[A-Z][a-z]+)+)$")
+        p2 = regex_engine.compile(r"^(?P<key>[A-Z][a-z]+(\s+[A-Z][a-z]+)+)$")
         
         #service meraki connect is disabled
-        p3 = re.compile(r"^(service\s+meraki\s+connect)\s+is\s+(disabled)$")
+        p3 = regex_engine.compile(r"^(service\s+meraki\s+connect)\s+is\s+(disabled)$")
         
         ret_dict = {} #level-0 dictionary
         stack_dict_index = 0 #level-1 dictionary
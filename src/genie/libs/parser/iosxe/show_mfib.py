@@ -5,13 +5,13 @@
         *  show ip mfib vrf <vrf> active
         *  show ip mfib summary
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowIpMfibVrfSummarySchema(MetaParser):
     """Schema for:
         show ip mfib vrf {vrf} summary
@@ -58,20 +58,20 @@ class ShowIpMfibVrfSummary(ShowIpMfibVrfSummarySchema):
         result_dict = {}
     
         ##VRF vrf3001
-        p1=re.compile(r"^VRF (\S+)$")
+        p1=regex_engine.compile(r"^VRF (\S+)$")
         
         ##49 prefixes (49/0/0 fwd/non-fwd/deleted)
         ##98 ioitems (98/0/0 fwd/non-fwd/deleted)
-        p2=re.compile(r"^(?P<total>\d+)\s+(?P<field>\S+) \((?P<fwd>\d+)\/(?P<non_fwd>\d+)\/(?P<deleted>\d+).*$")
+        p2=regex_engine.compile(r"^(?P<total>\d+)\s+(?P<field>\S+) \((?P<fwd>\d+)\/(?P<non_fwd>\d+)\/(?P<deleted>\d+).*$")
         
         ##Forwarding prefixes: [20 (S,G), 27 (*,G), 2 (*,G/m)]
-        p3=re.compile(r"^Forwarding prefixes:\s+\[(?P<s_g>\d+)[ \(A-z\,\)]+\,\s+(?P<g>\d+)[ \(\*\,A-Z\)]+\,\s+(?P<g_m>\d+).*$")
+        p3=regex_engine.compile(r"^Forwarding prefixes:\s+\[(?P<s_g>\d+)[ \(A-z\,\)]+\,\s+(?P<g>\d+)[ \(\*\,A-Z\)]+\,\s+(?P<g_m>\d+).*$")
         
         ##Table id 0xB, instance 0x7FC5BE77F480
-        p4=re.compile(r"^Table id (?P<table_id>\S+)\,\s+instance\s+(?P<instance>\S+)$")
+        p4=regex_engine.compile(r"^Table id (?P<table_id>\S+)\,\s+instance\s+(?P<instance>\S+)$")
         
         ##Database: epoch 0
-        p5=re.compile(r"Database: ([a-z0-9 ]+)")
+        p5=regex_engine.compile(r"Database: ([a-z0-9 ]+)")
         
         for line in out.splitlines():
             line=line.strip()
@@ -198,22 +198,22 @@ class ShowIpMfibVrfActive(ShowIpMfibVrfActiveSchema):
             return result_dict
     
         ##VRF vrf3001
-        p1=re.compile(r"^VRF (\S+)$")
+        p1=regex_engine.compile(r"^VRF (\S+)$")
         
         ##Group: 228.1.1.1
-        p2=re.compile(r"^Group:\s+(\S+)$")
+        p2=regex_engine.compile(r"^Group:\s+(\S+)$")
         
         ##Source: 161.1.1.2,
         ##RP-tree,
-        p3=re.compile(r"(?:Source: +)?(\S+)\,$")
+        p3=regex_engine.compile(r"(?:Source: +)?(\S+)\,$")
         
         ##SW Rate: 100 pps/0 kbps(1sec), 0 kbps(last 210 sec)
-        p4=re.compile(r"^SW Rate: +(?P<sw_rate_utilized>\d+) +(?P<utilised_speed_type>\S+)\/"
-                      r"(?P<max_sw_rate>\d+) +(?P<max_sw_speed_type>\S+)\(.*\(last +(?P<duration>.*)\)$")
+        p4=regex_engine.compile(r"^SW Rate: +(?P<sw_rate_utilized>\d+) +(?P<utilised_speed_type>\S+)\/"
+                                r"(?P<max_sw_rate>\d+) +(?P<max_sw_speed_type>\S+)\(.*\(last +(?P<duration>.*)\)$")
                       
         ##HW Rate: 2000 pps/7750 kbps(1sec)
-        p5=re.compile(r"^HW Rate: +(?P<hw_rate_utilized>\d+) +(?P<utilised_speed_type>\S+)\/"
-                    r"(?P<max_hw_rate>\d+) +(?P<max_hw_speed_type>\S+)\(.*$")
+        p5=regex_engine.compile(r"^HW Rate: +(?P<hw_rate_utilized>\d+) +(?P<utilised_speed_type>\S+)\/"
+                              r"(?P<max_hw_rate>\d+) +(?P<max_hw_speed_type>\S+)\(.*$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -280,7 +280,7 @@ class ShowIpMfibSummary(ShowIpMfibSummarySchema):
             output = self.device.execute(self.cli_command)
             
         #  Forwarding prefixes: [0 (S,G), 5 (*,G), 3 (*,G/m)]
-        p1 = re.compile(r"^Forwarding\s+prefixes:\s+\[(?P<s_g_entry>\d+)\s+\(S,G\),\s+(?P<star_g_entry>\d+)\s+\(\*,G\),\s+(?P<star_g_m_entry>\d+)\s+\(\*,G/m\)\]$")
+        p1 = regex_engine.compile(r"^Forwarding\s+prefixes:\s+\[(?P<s_g_entry>\d+)\s+\(S,G\),\s+(?P<star_g_entry>\d+)\s+\(\*,G\),\s+(?P<star_g_m_entry>\d+)\s+\(\*,G/m\)\]$")
         ret_dict = {}
 
         for line in output.splitlines():
@@ -319,7 +319,7 @@ class ShowIpv6MfibSummary(ShowIpv6MfibSummarySchema):
             output = self.device.execute(self.cli_command)
             
         #  Forwarding prefixes: [0 (S,G), 5 (*,G), 3 (*,G/m)]
-        p1 = re.compile(r"^Forwarding\s+prefixes:\s+\[(?P<s_g_entry>\d+)\s+\(S,G\),\s+(?P<star_g_entry>\d+)\s+\(\*,G\),\s+(?P<star_g_m_entry>\d+)\s+\(\*,G/m\)\]$")
+        p1 = regex_engine.compile(r"^Forwarding\s+prefixes:\s+\[(?P<s_g_entry>\d+)\s+\(S,G\),\s+(?P<star_g_entry>\d+)\s+\(\*,G\),\s+(?P<star_g_m_entry>\d+)\s+\(\*,G/m\)\]$")
         ret_dict = {}
 
         for line in output.splitlines():
@@ -356,7 +356,7 @@ class ShowIpMfibCount(ShowIpMfibCountSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
             
         # Number of lines which match regexp = 6500
-        p1 = re.compile(r"^Number of lines which match regexp\s+= (?P<number_of_lines>\S+)$")
+        p1 = regex_engine.compile(r"^Number of lines which match regexp\s+= (?P<number_of_lines>\S+)$")
 
         ret_dict = {}
 
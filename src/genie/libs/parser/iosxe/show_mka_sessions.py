@@ -6,9 +6,6 @@ IOSXE parsers for the following show commands:
     * show mka sessions interface {interface} detail
     * show macsec interface {interface}
 '''
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -20,6 +17,7 @@ from genie.metaparser.util.schemaengine import Schema, \
     Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 '''
@@ -85,26 +83,26 @@ class ShowMkaSessions(ShowMkaSessionsSchema):
         # initial return dictionary
         ret_dict = {}
   
-        p1 = re.compile(r'^Total MKA Sessions\.+ (?P<total_mka_sessions>\d+)$')
-        p2 = re.compile(r'^Secured Sessions\.+ (?P<secured_mka_sessions>\d+)$')
-        p3 = re.compile(r'^Pending Sessions\.+ (?P<pending_mka_sessions>\d+)$')
+        p1 = regex_engine.compile(r'^Total MKA Sessions\.+ (?P<total_mka_sessions>\d+)$')
+        p2 = regex_engine.compile(r'^Secured Sessions\.+ (?P<secured_mka_sessions>\d+)$')
+        p3 = regex_engine.compile(r'^Pending Sessions\.+ (?P<pending_mka_sessions>\d+)$')
 
         # Matching patterns
         #Hu2/6/0/39     70b3.171e.b282/0103 *DEFAULT POLICY* NO                NO
-        p4 = re.compile(r'(?P<interface>\S+\/\S+) +'
-                    r'(?P<local_txsci>\w+\.\w+\.\w+\/\w+) +'
-                    r'(?P<policy_name>\S+(?: +\S+)?) +'
-                    r'(?P<inherited>\w+) +'
-                    r'(?P<key_server>\w+(?: +\w+)?)')
+        p4 = regex_engine.compile(r'(?P<interface>\S+\/\S+) +'
+                              r'(?P<local_txsci>\w+\.\w+\.\w+\/\w+) +'
+                              r'(?P<policy_name>\S+(?: +\S+)?) +'
+                              r'(?P<inherited>\w+) +'
+                              r'(?P<key_server>\w+(?: +\w+)?)')
 
         # Matching patterns
         #259            00a7.42ce.d57f/0074 1                Secured           10
         #2              40f0.78b9.2a81/0002 1                Secured           FA5132C4F968EED9A1B0C2AFD5608288
-        p5 = re.compile(r'(?P<port_id>\d+) +'
-                        r'(?P<peer_rxsci>\w+\.\w+\.\w+\/\w+) +'
-                        r'(?P<macsec_peers>\w+) +'
-                        r'(?P<status>.*) '
-                        r'(?P<ckn>\S+)')
+        p5 = regex_engine.compile(r'(?P<port_id>\d+) +'
+                                  r'(?P<peer_rxsci>\w+\.\w+\.\w+\/\w+) +'
+                                  r'(?P<macsec_peers>\w+) +'
+                                  r'(?P<status>.*) '
+                                  r'(?P<ckn>\S+)')
 
         session_count = 0
         for line in out.splitlines():
@@ -278,41 +276,41 @@ class ShowMkaSessionsInterfaceDetails(ShowMkaSessionsInterfaceDetailsSchema):
         live_peer_count=0
         potential_peer_count=0
         dormant_peer_count=0        
-        p1 = re.compile(r'^Status\: (?P<status>\S+)')
-        p2 = re.compile(r'^Local Tx-SCI.+ (?P<local_txsci>\S+)$')
-        p3 = re.compile(r'^Interface MAC Address.+ (?P<interface_mac>\S+\.\S+\.\S+)$')
-        p4 = re.compile(r'^MKA Port Identifier.+ (?P<mka_port_id>\S+)$')
-        p5 = re.compile(r'^Interface Name.+ (?P<int_name>\S+)$')
-        p6 = re.compile(r'^Audit Session ID.+ (?P<audit_sess>\S+)$')
-        p7 = re.compile(r'^CAK Name \(CKN\).+ (?P<ckn>\S+)$')
-        p8 = re.compile(r'^Member Identifier \(MI\).+ (?P<mi>\S+)$')
-        p9 = re.compile(r'^Message Number \(MN\).+ (?P<mn>\S+)$')
-        p10 = re.compile(r'^EAP Role.+ (?P<eap_role>\S+)$')
-        p11 = re.compile(r'^Key Server\.+ (?P<key_server>\w+)$')
-        p12 = re.compile(r'^MKA Cipher Suite.+ (?P<mka_cipher_suite>\S+)$')
-        p13 = re.compile(r'^Latest SAK Status\.+ +(?P<latest_sak_status>\S+(?: +\S+)*)')
-        p14 = re.compile(r'^Latest SAK AN.+ (?P<latest_sak_an>\w+)$')
-        p15 = re.compile(r'^Latest SAK KI \(KN\)\.+ (?P<latest_sak_ki>(.*))')
-        p16 = re.compile(r'^Old SAK Status\.+ (?P<old_sak_status>(.*))')
-        p17 = re.compile(r'^Old SAK AN.+ (?P<old_sak_an>\w+)$')
-        p18 = re.compile(r'^Old SAK KI \(KN\)\.+ (?P<old_sak_ki>(.*))')
-        p19 = re.compile(r'^SAK Transmit Wait Time\.+ (?P<sak_transmit_wait_time>(.*))')
-        p20 = re.compile(r'^SAK Retire Time\.+ (?P<sak_retire_time>(.*))')
-        p21 = re.compile(r'^SAK Rekey Time\.+ (?P<sak_rekey_time>(.*))')
-        p22 = re.compile(r'^MKA Policy Name\.+ (?P<mka_policy_name>(.*))')
-        p23 = re.compile(r'^Delay Protection\.+ (?P<delay_protection>\w+)$')
-        p24 = re.compile(r'^Confidentiality Offset\.+ (?P<confidentiality_offset>\w+)$')
-        p25 = re.compile(r'^Algorithm Agility\.+ (?P<algorithm_agility>\w+)$')
-        p26 = re.compile(r'^SAK Rekey On Live Peer Loss\.+ (?P<sak_rekey_on_live_peer_loss>\w+)$')
-        p27 = re.compile(r'^Send Secure Announcement\.+ (?P<send_secure_announcement>\w+)$')
-        p28 = re.compile(r'^SCI Based SSCI Computation\.+ (?P<sci_based_ssci_computation>\w+)$')
-        p29 = re.compile(r'^SAK Cipher Suite\.+ (?P<sak_cipher_suite>(.*))')
-        p30 = re.compile(r'^MACsec Capability\.+ (?P<macsec_capability>(.*))')
-        p31 = re.compile(r'^MACsec Desired\.+ (?P<macsec_desired>\w+)$')
-        p32 = re.compile(r'^\# of MACsec Capable Live Peers\.+ (?P<macsec_capable_live_peers>\w+)$')
-        p33 = re.compile(r'^\# of MACsec Capable Live Peers Responded\.+ (?P<macsec_capable_live_peers_responded>\w+)$')
-        p34 = re.compile(r'^Delay Protection Timer\.+ (?P<delay_protection_timer>(.*))')
-        p35 = re.compile(r'^Key Server Priority\.+ (?P<key_server_priority>\S+)')
+        p1 = regex_engine.compile(r'^Status\: (?P<status>\S+)')
+        p2 = regex_engine.compile(r'^Local Tx-SCI.+ (?P<local_txsci>\S+)$')
+        p3 = regex_engine.compile(r'^Interface MAC Address.+ (?P<interface_mac>\S+\.\S+\.\S+)$')
+        p4 = regex_engine.compile(r'^MKA Port Identifier.+ (?P<mka_port_id>\S+)$')
+        p5 = regex_engine.compile(r'^Interface Name.+ (?P<int_name>\S+)$')
+        p6 = regex_engine.compile(r'^Audit Session ID.+ (?P<audit_sess>\S+)$')
+        p7 = regex_engine.compile(r'^CAK Name \(CKN\).+ (?P<ckn>\S+)$')
+        p8 = regex_engine.compile(r'^Member Identifier \(MI\).+ (?P<mi>\S+)$')
+        p9 = regex_engine.compile(r'^Message Number \(MN\).+ (?P<mn>\S+)$')
+        p10 = regex_engine.compile(r'^EAP Role.+ (?P<eap_role>\S+)$')
+        p11 = regex_engine.compile(r'^Key Server\.+ (?P<key_server>\w+)$')
+        p12 = regex_engine.compile(r'^MKA Cipher Suite.+ (?P<mka_cipher_suite>\S+)$')
+        p13 = regex_engine.compile(r'^Latest SAK Status\.+ +(?P<latest_sak_status>\S+(?: +\S+)*)')
+        p14 = regex_engine.compile(r'^Latest SAK AN.+ (?P<latest_sak_an>\w+)$')
+        p15 = regex_engine.compile(r'^Latest SAK KI \(KN\)\.+ (?P<latest_sak_ki>(.*))')
+        p16 = regex_engine.compile(r'^Old SAK Status\.+ (?P<old_sak_status>(.*))')
+        p17 = regex_engine.compile(r'^Old SAK AN.+ (?P<old_sak_an>\w+)$')
+        p18 = regex_engine.compile(r'^Old SAK KI \(KN\)\.+ (?P<old_sak_ki>(.*))')
+        p19 = regex_engine.compile(r'^SAK Transmit Wait Time\.+ (?P<sak_transmit_wait_time>(.*))')
+        p20 = regex_engine.compile(r'^SAK Retire Time\.+ (?P<sak_retire_time>(.*))')
+        p21 = regex_engine.compile(r'^SAK Rekey Time\.+ (?P<sak_rekey_time>(.*))')
+        p22 = regex_engine.compile(r'^MKA Policy Name\.+ (?P<mka_policy_name>(.*))')
+        p23 = regex_engine.compile(r'^Delay Protection\.+ (?P<delay_protection>\w+)$')
+        p24 = regex_engine.compile(r'^Confidentiality Offset\.+ (?P<confidentiality_offset>\w+)$')
+        p25 = regex_engine.compile(r'^Algorithm Agility\.+ (?P<algorithm_agility>\w+)$')
+        p26 = regex_engine.compile(r'^SAK Rekey On Live Peer Loss\.+ (?P<sak_rekey_on_live_peer_loss>\w+)$')
+        p27 = regex_engine.compile(r'^Send Secure Announcement\.+ (?P<send_secure_announcement>\w+)$')
+        p28 = regex_engine.compile(r'^SCI Based SSCI Computation\.+ (?P<sci_based_ssci_computation>\w+)$')
+        p29 = regex_engine.compile(r'^SAK Cipher Suite\.+ (?P<sak_cipher_suite>(.*))')
+        p30 = regex_engine.compile(r'^MACsec Capability\.+ (?P<macsec_capability>(.*))')
+        p31 = regex_engine.compile(r'^MACsec Desired\.+ (?P<macsec_desired>\w+)$')
+        p32 = regex_engine.compile(r'^\# of MACsec Capable Live Peers\.+ (?P<macsec_capable_live_peers>\w+)$')
+        p33 = regex_engine.compile(r'^\# of MACsec Capable Live Peers Responded\.+ (?P<macsec_capable_live_peers_responded>\w+)$')
+        p34 = regex_engine.compile(r'^Delay Protection Timer\.+ (?P<delay_protection_timer>(.*))')
+        p35 = regex_engine.compile(r'^Key Server Priority\.+ (?P<key_server_priority>\S+)')
 
         #Matching the below peer list line by line
         '''
@@ -333,15 +331,15 @@ class ShowMkaSessionsInterfaceDetails(ShowMkaSessionsInterfaceDetailsSchema):
         ---------------------------------------------------------------------------------------
         '''
 
-        p36 = re.compile(r'^Live Peers List:')
-        p37 = re.compile(r'^Potential Peers List:')
-        p38 = re.compile(r'^Dormant Peers List:')
-        p39 = re.compile(re.compile(r'(?P<mi>\S+) +'
-                            r'(?P<mn>\S+) +'
-                        r'(?P<rx_sci>\w+\.\w+\.\w+\/\w+) +'
-                        r'(?P<ks_priority>\w+) +'
-                        r'(?P<rxsa_installed>\w+) +'
-                        r'(?P<ssci>\w+)')) 
+        p36 = regex_engine.compile(r'^Live Peers List:')
+        p37 = regex_engine.compile(r'^Potential Peers List:')
+        p38 = regex_engine.compile(r'^Dormant Peers List:')
+        p39 = regex_engine.compile(regex_engine.compile(r'(?P<mi>\S+) +'
+                                                r'(?P<mn>\S+) +'
+                                  r'(?P<rx_sci>\w+\.\w+\.\w+\/\w+) +'
+                                  r'(?P<ks_priority>\w+) +'
+                                  r'(?P<rxsa_installed>\w+) +'
+                                  r'(?P<ssci>\w+)')) 
 
         for line in out.splitlines():
             out_dict = ret_dict.setdefault('sessions', {})
@@ -650,196 +648,196 @@ class ShowMacsecInterface(ShowMacsecInterfaceSchema):
 
         ret_dict = {}
         #MACsec is enabled
-        p1 = re.compile(r'^MACsec is (?P<status>\S+)$')
+        p1 = regex_engine.compile(r'^MACsec is (?P<status>\S+)$')
 
         #Replay protect : enabled
-        p2 = re.compile(r'^Replay protect \: (?P<replay_protect_status>\S+)$')
+        p2 = regex_engine.compile(r'^Replay protect \: (?P<replay_protect_status>\S+)$')
 
         #Replay window : 4294967295
-        p3 = re.compile(r'^Replay window \: (?P<replay_window>\S+)$')
+        p3 = regex_engine.compile(r'^Replay window \: (?P<replay_window>\S+)$')
 
         #Include SCI : yes
-        p4 = re.compile(r'^Include SCI \: (?P<include_sci>\S+)$')
+        p4 = regex_engine.compile(r'^Include SCI \: (?P<include_sci>\S+)$')
 
         #Use ES Enable : no
-        p5 = re.compile(r'^Use ES Enable \: (?P<use_es_enable>\S+)$')
+        p5 = regex_engine.compile(r'^Use ES Enable \: (?P<use_es_enable>\S+)$')
 
         #Use SCB Enable : no
-        p6 = re.compile(r'^Use SCB Enable \: (?P<use_scb_enable>\S+)$')
+        p6 = regex_engine.compile(r'^Use SCB Enable \: (?P<use_scb_enable>\S+)$')
 
         #Admin Pt2Pt MAC : forceTrue(1)
-        p7 = re.compile(r'^Admin Pt2Pt MAC \: (?P<admin_pt2pt_mac>(.*))')
+        p7 = regex_engine.compile(r'^Admin Pt2Pt MAC \: (?P<admin_pt2pt_mac>(.*))')
 
         #Pt2Pt MAC Operational : no
-        p8 = re.compile(r'^Pt2Pt MAC Operational \: (?P<pt2pt_mac_operational>\S+)$')
+        p8 = regex_engine.compile(r'^Pt2Pt MAC Operational \: (?P<pt2pt_mac_operational>\S+)$')
 
         #Cipher : GCM-AES-XPN-256
-        p9 = re.compile(r'^Cipher \: (?P<cipher>\S+)$')
+        p9 = regex_engine.compile(r'^Cipher \: (?P<cipher>\S+)$')
 
         #Confidentiality Offset : 0
-        p10 = re.compile(r'^Confidentiality Offset \: (?P<confidentiality_offset>\S+)$')
+        p10 = regex_engine.compile(r'^Confidentiality Offset \: (?P<confidentiality_offset>\S+)$')
 
         #Capabilities
-        p11 = re.compile(r'^Capabilities$')
+        p11 = regex_engine.compile(r'^Capabilities$')
 
         #ICV length : 16
-        p12 = re.compile(r'^ICV length \: (?P<icv_length>\S+)$')
+        p12 = regex_engine.compile(r'^ICV length \: (?P<icv_length>\S+)$')
 
         #Data length change supported: yes
-        p13 = re.compile(r'^Data length change supported\: (?P<data_length_change_supported>\S+)$')
+        p13 = regex_engine.compile(r'^Data length change supported\: (?P<data_length_change_supported>\S+)$')
 
         #Max. Rx SA : 16
-        p14 = re.compile(r'^Max\. Rx SA \: (?P<max_rx_sa>\S+)$')
+        p14 = regex_engine.compile(r'^Max\. Rx SA \: (?P<max_rx_sa>\S+)$')
 
         #Max. Tx SA : 16
-        p15 = re.compile(r'^Max\. Tx SA \: (?P<max_tx_sa>\S+)$')
+        p15 = regex_engine.compile(r'^Max\. Tx SA \: (?P<max_tx_sa>\S+)$')
 
         #Max. Rx SC : 8
-        p16 = re.compile(r'^Max\. Rx SC \: (?P<max_rx_sc>\S+)$')
+        p16 = regex_engine.compile(r'^Max\. Rx SC \: (?P<max_rx_sc>\S+)$')
 
         #Max. Tx SC : 8
-        p17 = re.compile(r'^Max\. Tx SC \: (?P<max_tx_sc>\S+)$')
+        p17 = regex_engine.compile(r'^Max\. Tx SC \: (?P<max_tx_sc>\S+)$')
 
         #Validate Frames : strict
-        p18 = re.compile(r'^Validate Frames \: (?P<validate_frames>\S+)$')
+        p18 = regex_engine.compile(r'^Validate Frames \: (?P<validate_frames>\S+)$')
 
         #PN threshold notification support : Yes
-        p19 = re.compile(r'^PN threshold notification support \: (?P<pn_threshold_notification_support>\S+)$')
+        p19 = regex_engine.compile(r'^PN threshold notification support \: (?P<pn_threshold_notification_support>\S+)$')
 
         #Ciphers supported : GCM-AES-128
-        p20 = re.compile(r'^Ciphers supported \: (?P<ciphers_supported>\S+)$')
+        p20 = regex_engine.compile(r'^Ciphers supported \: (?P<ciphers_supported>\S+)$')
 
         #GCM-AES-256
-        p21 = re.compile(r'^GCM.+(?P<ciphers>128|256)$')
+        p21 = regex_engine.compile(r'^GCM.+(?P<ciphers>128|256)$')
 
         #Access control : must secure
-        p22 = re.compile(r'^Access control \: (?P<access_control>(.*))$')
+        p22 = regex_engine.compile(r'^Access control \: (?P<access_control>(.*))$')
 
         #Type    : one dot1q in clear
-        p23 = re.compile(r'^Type    \: (?P<type>(.*))$')
+        p23 = regex_engine.compile(r'^Type    \: (?P<type>(.*))$')
 
         #VlanId1 : 111
-        p24 = re.compile(r'^VlanId1 \: (?P<vlanid1>\S+)$')
+        p24 = regex_engine.compile(r'^VlanId1 \: (?P<vlanid1>\S+)$')
 
         #Transmit Secure Channels
-        p25 = re.compile(r'^Transmit Secure Channels$')
+        p25 = regex_engine.compile(r'^Transmit Secure Channels$')
 
         #SCI : F87A412527020488
-        p26 = re.compile(r'^SCI \: (?P<sci>\S+)$')
+        p26 = regex_engine.compile(r'^SCI \: (?P<sci>\S+)$')
 
         #SC state : inUse(1)
-        p27 = re.compile(r'^SC state \: (?P<sc_state>\S+)$')
+        p27 = regex_engine.compile(r'^SC state \: (?P<sc_state>\S+)$')
 
         #Elapsed time : 7w0d
-        p28 = re.compile(r'^Elapsed time \: (?P<elapsed_time>\S+)$')
+        p28 = regex_engine.compile(r'^Elapsed time \: (?P<elapsed_time>\S+)$')
 
         #Start time : 7w0d
-        p29 = re.compile(r'^Start time \: (?P<start_time>\S+)$')
+        p29 = regex_engine.compile(r'^Start time \: (?P<start_time>\S+)$')
 
         #Current AN: 0
-        p30 = re.compile(r'^Current AN\: (?P<current_an>\S+)$')
+        p30 = regex_engine.compile(r'^Current AN\: (?P<current_an>\S+)$')
 
         #Previous AN: -
-        p31 = re.compile(r'^Previous AN\: (?P<previous_an>\S+)$')
+        p31 = regex_engine.compile(r'^Previous AN\: (?P<previous_an>\S+)$')
 
         #Next PN: 250
-        p32 = re.compile(r'^Next PN\: (?P<next_pn>\S+)$')
+        p32 = regex_engine.compile(r'^Next PN\: (?P<next_pn>\S+)$')
 
         #SA State: inUse(1)
-        p33 = re.compile(r'^SA State\: (?P<sa_state>\S+)$')
+        p33 = regex_engine.compile(r'^SA State\: (?P<sa_state>\S+)$')
 
         #Confidentiality : yes
-        p34 = re.compile(r'^Confidentiality \: (?P<confidentiality>\S+)$')
+        p34 = regex_engine.compile(r'^Confidentiality \: (?P<confidentiality>\S+)$')
 
         #SAK Unchanged : yes
-        p35 = re.compile(r'^SAK Unchanged \: (?P<sak_unchanged>\S+)$')
+        p35 = regex_engine.compile(r'^SAK Unchanged \: (?P<sak_unchanged>\S+)$')
 
         #SA Create time : 01:32:52
-        p36 = re.compile(r'^SA Create time \: (?P<sa_create_time>(.*))$')
+        p36 = regex_engine.compile(r'^SA Create time \: (?P<sa_create_time>(.*))$')
 
         #SA Start time : 7w0d
-        p37 = re.compile(r'^SA Start time \: (?P<sa_start_time>\S+)$')
+        p37 = regex_engine.compile(r'^SA Start time \: (?P<sa_start_time>\S+)$')
 
         #SC Statistics
-        p38 = re.compile(r'^SC Statistics$')
+        p38 = regex_engine.compile(r'^SC Statistics$')
 
         #Auth-only Pkts : 0
-        p39 = re.compile(r'^Auth\-only Pkts \: (?P<auth_only_pkts>\d+)$')
+        p39 = regex_engine.compile(r'^Auth\-only Pkts \: (?P<auth_only_pkts>\d+)$')
 
         #Auth-only Bytes : 0
-        p40 = re.compile(r'^Auth\-only Bytes \: (?P<auth_only_bytes>\d+)$')
+        p40 = regex_engine.compile(r'^Auth\-only Bytes \: (?P<auth_only_bytes>\d+)$')
 
         #Encrypted Pkts : 0
-        p41 = re.compile(r'^Encrypted Pkts \: (?P<encrypted_pkts>\d+)$')
+        p41 = regex_engine.compile(r'^Encrypted Pkts \: (?P<encrypted_pkts>\d+)$')
 
         #Encrypted Bytes : 0
-        p42 = re.compile(r'^Encrypted Bytes \: (?P<encrypted_bytes>\d+)$')
+        p42 = regex_engine.compile(r'^Encrypted Bytes \: (?P<encrypted_bytes>\d+)$')
 
         #SA Statistics
-        p43 = re.compile(r'^SA Statistics$')
+        p43 = regex_engine.compile(r'^SA Statistics$')
 
         #Port Statistics
-        p44 = re.compile(r'^Port Statistics$')
+        p44 = regex_engine.compile(r'^Port Statistics$')
 
         #Egress untag pkts  0
-        p45 = re.compile(r'^Egress untag pkts  (?P<egress_untag_pkts>\d+)$')
+        p45 = regex_engine.compile(r'^Egress untag pkts  (?P<egress_untag_pkts>\d+)$')
 
         #Egress long pkts  0
-        p46 = re.compile(r'^Egress long pkts  (?P<egress_long_pkts>\d+)$')
+        p46 = regex_engine.compile(r'^Egress long pkts  (?P<egress_long_pkts>\d+)$')
 
         #Receive Secure Channels
-        p47 = re.compile(r'^Receive Secure Channels$')
+        p47 = regex_engine.compile(r'^Receive Secure Channels$')
 
         #RX SA Count: 0
-        p48 = re.compile(r'^RX SA Count\: (?P<rx_sa_count>\d+)$')
+        p48 = regex_engine.compile(r'^RX SA Count\: (?P<rx_sa_count>\d+)$')
 
         #Notvalid pkts 0
-        p49 = re.compile(r'^Notvalid pkts (?P<notvalid_pkts>\d+)$')
+        p49 = regex_engine.compile(r'^Notvalid pkts (?P<notvalid_pkts>\d+)$')
 
         #Invalid pkts 0
-        p50 = re.compile(r'^Invalid pkts (?P<invalid_pkts>\d+)$')
+        p50 = regex_engine.compile(r'^Invalid pkts (?P<invalid_pkts>\d+)$')
 
         #Valid pkts 0
-        p51 = re.compile(r'^Valid pkts (?P<valid_pkts>\d+)$')
+        p51 = regex_engine.compile(r'^Valid pkts (?P<valid_pkts>\d+)$')
 
         #UnusedSA pkts 0
-        p52 = re.compile(r'^UnusedSA pkts (?P<unusedsa_pkts>\d+)$')
+        p52 = regex_engine.compile(r'^UnusedSA pkts (?P<unusedsa_pkts>\d+)$')
 
         #NousingSA pkts 0
-        p53 = re.compile(r'^NousingSA pkts (?P<nousingsa_pkts>\d+)$')
+        p53 = regex_engine.compile(r'^NousingSA pkts (?P<nousingsa_pkts>\d+)$')
 
         #Validated Bytes 0
-        p54 = re.compile(r'^Validated Bytes (?P<validated_bytes>\d+)$')
+        p54 = regex_engine.compile(r'^Validated Bytes (?P<validated_bytes>\d+)$')
 
         #Decrypted Bytes 0
-        p55 = re.compile(r'^Decrypted Bytes (?P<decrypted_bytes>\d+)$')
+        p55 = regex_engine.compile(r'^Decrypted Bytes (?P<decrypted_bytes>\d+)$')
 
         #Late pkts 0
-        p56 = re.compile(r'^Late pkts (?P<late_pkts>\d+)$')
+        p56 = regex_engine.compile(r'^Late pkts (?P<late_pkts>\d+)$')
 
         #Uncheck pkts 0
-        p57 = re.compile(r'^Uncheck pkts (?P<uncheck_pkts>\d+)$')
+        p57 = regex_engine.compile(r'^Uncheck pkts (?P<uncheck_pkts>\d+)$')
 
         #Delay pkts 0
-        p58 = re.compile(r'^Delay pkts (?P<delay_pkts>\d+)$')
+        p58 = regex_engine.compile(r'^Delay pkts (?P<delay_pkts>\d+)$')
 
         #Ingress untag pkts  0
-        p59 = re.compile(r'^Ingress untag pkts  (?P<ingress_untag_pkts>\d+)$')
+        p59 = regex_engine.compile(r'^Ingress untag pkts  (?P<ingress_untag_pkts>\d+)$')
 
         #Ingress notag pkts  54
-        p60 = re.compile(r'^Ingress notag pkts  (?P<ingress_notag_pkts>\d+)$')
+        p60 = regex_engine.compile(r'^Ingress notag pkts  (?P<ingress_notag_pkts>\d+)$')
 
         #Ingress badtag pkts  0
-        p61 = re.compile(r'^Ingress badtag pkts  (?P<ingress_badtag_pkts>\d+)$')
+        p61 = regex_engine.compile(r'^Ingress badtag pkts  (?P<ingress_badtag_pkts>\d+)$')
 
         #Ingress unknownSCI pkts  0
-        p62 = re.compile(r'^Ingress unknownSCI pkts  (?P<ingress_unknownsci_pkts>\d+)$')
+        p62 = regex_engine.compile(r'^Ingress unknownSCI pkts  (?P<ingress_unknownsci_pkts>\d+)$')
 
         #Ingress noSCI pkts  0
-        p63 = re.compile(r'^Ingress noSCI pkts  (?P<ingress_nosci_pkts>\d+)$')
+        p63 = regex_engine.compile(r'^Ingress noSCI pkts  (?P<ingress_nosci_pkts>\d+)$')
 
         #Ingress overrun pkts  0
-        p64 = re.compile(r'^Ingress overrun pkts  (?P<ingress_overrun_pkts>\d+)$')
+        p64 = regex_engine.compile(r'^Ingress overrun pkts  (?P<ingress_overrun_pkts>\d+)$')
 
         for line in out.splitlines():
             macsec_dict = ret_dict.setdefault('macsec-data', {})
@@ -1267,65 +1265,65 @@ class ShowMkaSummary(ShowMkaSummarySchema):
             out = output
         # initial return dictionary
         ret_dict = {}
-        p1 = re.compile(r'^Total MKA Sessions\.+ (?P<total_mka_sessions>\d+)$')
-        p2 = re.compile(r'^Secured Sessions\.+ (?P<secured_mka_sessions>\d+)$')
-        p3 = re.compile(r'^Pending Sessions\.+ (?P<pending_mka_sessions>\d+)$')
-        p4 = re.compile(r'(?P<interface>\S+\/\S+) +'
-                    r'(?P<local_txsci>\w+\.\w+\.\w+\/\w+) +'
-                    r'(?P<policy_name>\S+(?: +\S+)?) +'
-                    r'(?P<inherited>\w+) +'
-                    r'(?P<key_server>\w+(?: +\w+)?)')
-        p5 = re.compile(r'(?P<port_id>\d+) +'
-                        r'(?P<peer_rxsci>\w+\.\w+\.\w+\/\w+) +'
-                        r'(?P<macsec_peers>\w+) +'
-                        r'(?P<status>.*) '
-                        r'(?P<ckn>\d+)')
-        p6 = re.compile(r'^Secured\.+ (?P<secured>\d+)$')
-        p7 = re.compile(r'^Reauthentication Attempts\.+ (?P<reauthentication_attempts>\d+)$')
-        p8 = re.compile(r'^Deleted \(Secured\)\.+ (?P<deleted_secured>\d+)$')
-        p9 = re.compile(r'^Keepalive Timeouts\.+ (?P<keepalive_timeouts>\d+)$')
-        p10 = re.compile(r'^CA Statistics$')
-        p11 = re.compile(r'^Pairwise CAKs Derived\.+ (?P<pairwise_caks_derived>\d+)$')
-        p12 = re.compile(r'^Pairwise CAK Rekeys\.+ (?P<pairwaise_cak_rekeys>\d+)$')
-        p13 = re.compile(r'^Group CAKs Generated\.+ (?P<group_caks_generated>\d+)$')
-        p14 = re.compile(r'^Group CAKs Received\.+ (?P<group_caks_received>\d+)$')
-        p15 = re.compile(r'^SA Statistics$')
-        p16 = re.compile(r'^SAKs Generated\.+ (?P<saks_generated>\d+)$')
-        p17 = re.compile(r'^SAKs Rekeyed\.+ (?P<saks_rekeyed>\d+)$')
-        p18 = re.compile(r'^SAKs Received\.+ (?P<saks_received>\d+)$')
-        p19 = re.compile(r'^SAK Responses Received\.+ (?P<sak_responses_received>\d+)$')
-        p20 = re.compile(r'^MKPDU Statistics$')
-        p21 = re.compile(r'^MKPDUs Validated \& Rx\.+ (?P<mkpdus_validated>\d+)$')
-        p22 = re.compile(r'^\"Distributed SAK\"\.+ (?P<distributed_sak>\d+)$')
-        p23 = re.compile(r'^\"Distributed CAK\"\.+ (?P<distributed_cak>\d+)$')
-        p24 = re.compile(r'^MKPDUs Transmitted\.+ (?P<mkpdus_transmitted>\d+)$')
-
-        p25 = re.compile(r'^Bring\-up Failures\.+ (?P<bringup_failures>\d+)$')
-        p26 = re.compile(r'^Reauthentication Failures\.+ (?P<reauthentication_failures>\d+)$')
-        p27 = re.compile(r'^Duplicate Auth\-Mgr Handle\.+ (?P<duplicate_auth_mgr_handle>\d+)$')
-        p28 = re.compile(r'^SAK Generation\.+ (?P<sak_generation>\d+)$')
-        p29 = re.compile(r'^Hash Key Generation\.+ (?P<hash_key_generation>\d+)$')
-        p30 = re.compile(r'^SAK Encryption\/Wrap\.+ (?P<sak_encryption_wrap>\d+)$')
-        p31 = re.compile(r'^SAK Decryption\/Unwrap\.+ (?P<sak_decryption_unwrap>\d+)$')
-        p32 = re.compile(r'^SAK Cipher Mismatch\.+ (?P<sak_cipher_mismatch>\d+)$')
-        p33 = re.compile(r'^Group CAK Generation\.+ (?P<group_cak_generation>\d+)$')
-        p34 = re.compile(r'^Group CAK Encryption\/Wrap\.+ (?P<group_cak_encryption_wrap>\d+)$')
-        p35 = re.compile(r'^Group CAK Decryption\/Unwrap\.+ (?P<group_cak_decryption_unwrap>\d+)$')
-        p36 = re.compile(r'^Pairwise CAK Derivation\.+ (?P<pairwise_cak_derivation>\d+)$')
-        p37 = re.compile(r'^CKN Derivation\.+ (?P<ckn_derivation>\d+)$')
-        p38 = re.compile(r'^ICK Derivation\.+ (?P<ick_derivation>\d+)$')
-        p39 = re.compile(r'^KEK Derivation\.+ (?P<kek_derivation>\d+)$')
-        p40 = re.compile(r'^Invalid Peer MACsec Capability\.+ (?P<invalid_peer_macsec_capability>\d+)$')
-
-        p41 = re.compile(r'^Rx SC Creation\.+ (?P<rx_sc_creation>\d+)$')
-        p42 = re.compile(r'^Tx SC Creation\.+ (?P<tx_sc_creation>\d+)$')
-        p43 = re.compile(r'^Rx SA Installation\.+ (?P<rx_sa_installation>\d+)$')
-        p44 = re.compile(r'^Tx SA Installation\.+ (?P<tx_sa_installation>\d+)$')
-        p45 = re.compile(r'^MKPDU Tx\.+ (?P<mkpdu_tx>\d+)$')
-        p46 = re.compile(r'^MKPDU Rx ICV Verification\.+ (?P<mkpdu_rx_icv_verification>\d+)$')
-        p47 = re.compile(r'^MKPDU Rx Validation\.+ (?P<mkpdu_rx_validation>\d+)$')
-        p48 = re.compile(r'^MKPDU Rx Bad Peer MN\.+ (?P<mkpdu_rx_bad_peer_mn>\d+)$')
-        p49 = re.compile(r'^MKPDU Rx Non\-recent Peerlist MN\.+ (?P<mkpdu_rx_nonrecent_peerlist_mn>\d+)$')
+        p1 = regex_engine.compile(r'^Total MKA Sessions\.+ (?P<total_mka_sessions>\d+)$')
+        p2 = regex_engine.compile(r'^Secured Sessions\.+ (?P<secured_mka_sessions>\d+)$')
+        p3 = regex_engine.compile(r'^Pending Sessions\.+ (?P<pending_mka_sessions>\d+)$')
+        p4 = regex_engine.compile(r'(?P<interface>\S+\/\S+) +'
+                              r'(?P<local_txsci>\w+\.\w+\.\w+\/\w+) +'
+                              r'(?P<policy_name>\S+(?: +\S+)?) +'
+                              r'(?P<inherited>\w+) +'
+                              r'(?P<key_server>\w+(?: +\w+)?)')
+        p5 = regex_engine.compile(r'(?P<port_id>\d+) +'
+                                  r'(?P<peer_rxsci>\w+\.\w+\.\w+\/\w+) +'
+                                  r'(?P<macsec_peers>\w+) +'
+                                  r'(?P<status>.*) '
+                                  r'(?P<ckn>\d+)')
+        p6 = regex_engine.compile(r'^Secured\.+ (?P<secured>\d+)$')
+        p7 = regex_engine.compile(r'^Reauthentication Attempts\.+ (?P<reauthentication_attempts>\d+)$')
+        p8 = regex_engine.compile(r'^Deleted \(Secured\)\.+ (?P<deleted_secured>\d+)$')
+        p9 = regex_engine.compile(r'^Keepalive Timeouts\.+ (?P<keepalive_timeouts>\d+)$')
+        p10 = regex_engine.compile(r'^CA Statistics$')
+        p11 = regex_engine.compile(r'^Pairwise CAKs Derived\.+ (?P<pairwise_caks_derived>\d+)$')
+        p12 = regex_engine.compile(r'^Pairwise CAK Rekeys\.+ (?P<pairwaise_cak_rekeys>\d+)$')
+        p13 = regex_engine.compile(r'^Group CAKs Generated\.+ (?P<group_caks_generated>\d+)$')
+        p14 = regex_engine.compile(r'^Group CAKs Received\.+ (?P<group_caks_received>\d+)$')
+        p15 = regex_engine.compile(r'^SA Statistics$')
+        p16 = regex_engine.compile(r'^SAKs Generated\.+ (?P<saks_generated>\d+)$')
+        p17 = regex_engine.compile(r'^SAKs Rekeyed\.+ (?P<saks_rekeyed>\d+)$')
+        p18 = regex_engine.compile(r'^SAKs Received\.+ (?P<saks_received>\d+)$')
+        p19 = regex_engine.compile(r'^SAK Responses Received\.+ (?P<sak_responses_received>\d+)$')
+        p20 = regex_engine.compile(r'^MKPDU Statistics$')
+        p21 = regex_engine.compile(r'^MKPDUs Validated \& Rx\.+ (?P<mkpdus_validated>\d+)$')
+        p22 = regex_engine.compile(r'^\"Distributed SAK\"\.+ (?P<distributed_sak>\d+)$')
+        p23 = regex_engine.compile(r'^\"Distributed CAK\"\.+ (?P<distributed_cak>\d+)$')
+        p24 = regex_engine.compile(r'^MKPDUs Transmitted\.+ (?P<mkpdus_transmitted>\d+)$')
+
+        p25 = regex_engine.compile(r'^Bring\-up Failures\.+ (?P<bringup_failures>\d+)$')
+        p26 = regex_engine.compile(r'^Reauthentication Failures\.+ (?P<reauthentication_failures>\d+)$')
+        p27 = regex_engine.compile(r'^Duplicate Auth\-Mgr Handle\.+ (?P<duplicate_auth_mgr_handle>\d+)$')
+        p28 = regex_engine.compile(r'^SAK Generation\.+ (?P<sak_generation>\d+)$')
+        p29 = regex_engine.compile(r'^Hash Key Generation\.+ (?P<hash_key_generation>\d+)$')
+        p30 = regex_engine.compile(r'^SAK Encryption\/Wrap\.+ (?P<sak_encryption_wrap>\d+)$')
+        p31 = regex_engine.compile(r'^SAK Decryption\/Unwrap\.+ (?P<sak_decryption_unwrap>\d+)$')
+        p32 = regex_engine.compile(r'^SAK Cipher Mismatch\.+ (?P<sak_cipher_mismatch>\d+)$')
+        p33 = regex_engine.compile(r'^Group CAK Generation\.+ (?P<group_cak_generation>\d+)$')
+        p34 = regex_engine.compile(r'^Group CAK Encryption\/Wrap\.+ (?P<group_cak_encryption_wrap>\d+)$')
+        p35 = regex_engine.compile(r'^Group CAK Decryption\/Unwrap\.+ (?P<group_cak_decryption_unwrap>\d+)$')
+        p36 = regex_engine.compile(r'^Pairwise CAK Derivation\.+ (?P<pairwise_cak_derivation>\d+)$')
+        p37 = regex_engine.compile(r'^CKN Derivation\.+ (?P<ckn_derivation>\d+)$')
+        p38 = regex_engine.compile(r'^ICK Derivation\.+ (?P<ick_derivation>\d+)$')
+        p39 = regex_engine.compile(r'^KEK Derivation\.+ (?P<kek_derivation>\d+)$')
+        p40 = regex_engine.compile(r'^Invalid Peer MACsec Capability\.+ (?P<invalid_peer_macsec_capability>\d+)$')
+
+        p41 = regex_engine.compile(r'^Rx SC Creation\.+ (?P<rx_sc_creation>\d+)$')
+        p42 = regex_engine.compile(r'^Tx SC Creation\.+ (?P<tx_sc_creation>\d+)$')
+        p43 = regex_engine.compile(r'^Rx SA Installation\.+ (?P<rx_sa_installation>\d+)$')
+        p44 = regex_engine.compile(r'^Tx SA Installation\.+ (?P<tx_sa_installation>\d+)$')
+        p45 = regex_engine.compile(r'^MKPDU Tx\.+ (?P<mkpdu_tx>\d+)$')
+        p46 = regex_engine.compile(r'^MKPDU Rx ICV Verification\.+ (?P<mkpdu_rx_icv_verification>\d+)$')
+        p47 = regex_engine.compile(r'^MKPDU Rx Validation\.+ (?P<mkpdu_rx_validation>\d+)$')
+        p48 = regex_engine.compile(r'^MKPDU Rx Bad Peer MN\.+ (?P<mkpdu_rx_bad_peer_mn>\d+)$')
+        p49 = regex_engine.compile(r'^MKPDU Rx Non\-recent Peerlist MN\.+ (?P<mkpdu_rx_nonrecent_peerlist_mn>\d+)$')
 
         session_count = 0
         for line in out.splitlines():
@@ -1712,145 +1710,145 @@ class ShowMkaStatistics(ShowMkaStatisticsSchema):
         ret_dict = {}
 
         # MKA Session Totals
-        p0 = re.compile(r'^MKA Session Totals$')
+        p0 = regex_engine.compile(r'^MKA Session Totals$')
 
         #Secured.................... 3
-        p1 = re.compile(r'^Secured\.+ (?P<secured>\d+)$')
+        p1 = regex_engine.compile(r'^Secured\.+ (?P<secured>\d+)$')
 
         #Fallback Secured........... 2
-        p2 = re.compile(r'^Fallback Secured\.+ (?P<fallback_secured>\d+)$')
+        p2 = regex_engine.compile(r'^Fallback Secured\.+ (?P<fallback_secured>\d+)$')
 
         #Reauthentication Attempts.. 4
-        p3 = re.compile(r'^Reauthentication Attempts\.+ (?P<reauthentication_attempts>\d+)$')
+        p3 = regex_engine.compile(r'^Reauthentication Attempts\.+ (?P<reauthentication_attempts>\d+)$')
 
         #Deleted (Secured).......... 2
-        p4 = re.compile(r'^Deleted \(Secured\)\.+ (?P<deleted_secured>\d+)$')
+        p4 = regex_engine.compile(r'^Deleted \(Secured\)\.+ (?P<deleted_secured>\d+)$')
 
         #Keepalive Timeouts......... 0
-        p5 = re.compile(r'^Keepalive Timeouts\.+ (?P<keepalive_timeouts>\d+)$')
+        p5 = regex_engine.compile(r'^Keepalive Timeouts\.+ (?P<keepalive_timeouts>\d+)$')
 
         #CA Statistics
-        p6 = re.compile(r'^CA Statistics$')
+        p6 = regex_engine.compile(r'^CA Statistics$')
 
         #Pairwise CAKs Derived...... 4
-        p7 = re.compile(r'^Pairwise CAKs Derived\.+ (?P<pairwise_caks_derived>\d+)$')
+        p7 = regex_engine.compile(r'^Pairwise CAKs Derived\.+ (?P<pairwise_caks_derived>\d+)$')
 
         #Pairwise CAK Rekeys........ 4
-        p8 = re.compile(r'^Pairwise CAK Rekeys\.+ (?P<pairwaise_cak_rekeys>\d+)$')
+        p8 = regex_engine.compile(r'^Pairwise CAK Rekeys\.+ (?P<pairwaise_cak_rekeys>\d+)$')
 
         #Group CAKs Generated....... 0
-        p9 = re.compile(r'^Group CAKs Generated\.+ (?P<group_caks_generated>\d+)$')
+        p9 = regex_engine.compile(r'^Group CAKs Generated\.+ (?P<group_caks_generated>\d+)$')
 
         #Group CAKs Received........ 0
-        p10 = re.compile(r'^Group CAKs Received\.+ (?P<group_caks_received>\d+)$')
+        p10 = regex_engine.compile(r'^Group CAKs Received\.+ (?P<group_caks_received>\d+)$')
 
         #SA Statistics
-        p11 = re.compile(r'^SA Statistics$')
+        p11 = regex_engine.compile(r'^SA Statistics$')
 
         #SAKs Generated............. 0
-        p12 = re.compile(r'^SAKs Generated\.+ (?P<saks_generated>\d+)$')
+        p12 = regex_engine.compile(r'^SAKs Generated\.+ (?P<saks_generated>\d+)$')
 
         #SAKs Rekeyed............... 1479
-        p13 = re.compile(r'^SAKs Rekeyed\.+ (?P<saks_rekeyed>\d+)$')
+        p13 = regex_engine.compile(r'^SAKs Rekeyed\.+ (?P<saks_rekeyed>\d+)$')
 
         #SAKs Received.............. 1480
-        p14 = re.compile(r'^SAKs Received\.+ (?P<saks_received>\d+)$')
+        p14 = regex_engine.compile(r'^SAKs Received\.+ (?P<saks_received>\d+)$')
 
         #SAK Responses Received..... 0
-        p15 = re.compile(r'^SAK Responses Received\.+ (?P<sak_responses_received>\d+)$')
+        p15 = regex_engine.compile(r'^SAK Responses Received\.+ (?P<sak_responses_received>\d+)$')
 
         #MKPDU Statistics
-        p16 = re.compile(r'^MKPDU Statistics$')
+        p16 = regex_engine.compile(r'^MKPDU Statistics$')
 
         #MKPDUs Validated & Rx...... 44937
-        p17 = re.compile(r'^MKPDUs Validated \& Rx\.+ (?P<mkpdus_validated>\d+)$')
+        p17 = regex_engine.compile(r'^MKPDUs Validated \& Rx\.+ (?P<mkpdus_validated>\d+)$')
 
         #"Distributed SAK"..... 1480
-        p18 = re.compile(r'^\"Distributed SAK\"\.+ (?P<distributed_sak>\d+)$')
+        p18 = regex_engine.compile(r'^\"Distributed SAK\"\.+ (?P<distributed_sak>\d+)$')
 
         #"Distributed CAK"..... 0
-        p19 = re.compile(r'^\"Distributed CAK\"\.+ (?P<distributed_cak>\d+)$')
+        p19 = regex_engine.compile(r'^\"Distributed CAK\"\.+ (?P<distributed_cak>\d+)$')
 
         #MKPDUs Transmitted......... 91067
-        p20 = re.compile(r'^MKPDUs Transmitted\.+ (?P<mkpdus_transmitted>\d+)$')
+        p20 = regex_engine.compile(r'^MKPDUs Transmitted\.+ (?P<mkpdus_transmitted>\d+)$')
 
         #Bring-up Failures................ 0
-        p21 = re.compile(r'^Bring\-up Failures\.+ (?P<bringup_failures>\d+)$')
+        p21 = regex_engine.compile(r'^Bring\-up Failures\.+ (?P<bringup_failures>\d+)$')
 
         #Reauthentication Failures........ 0
-        p22 = re.compile(r'^Reauthentication Failures\.+ (?P<reauthentication_failures>\d+)$')
+        p22 = regex_engine.compile(r'^Reauthentication Failures\.+ (?P<reauthentication_failures>\d+)$')
 
         #Duplicate Auth-Mgr Handle........ 0
-        p23 = re.compile(r'^Duplicate Auth\-Mgr Handle\.+ (?P<duplicate_auth_mgr_handle>\d+)$')
+        p23 = regex_engine.compile(r'^Duplicate Auth\-Mgr Handle\.+ (?P<duplicate_auth_mgr_handle>\d+)$')
 
         #SAK Generation................... 0
-        p24 = re.compile(r'^SAK Generation\.+ (?P<sak_generation>\d+)$')
+        p24 = regex_engine.compile(r'^SAK Generation\.+ (?P<sak_generation>\d+)$')
 
         #Hash Key Generation.............. 0
-        p25 = re.compile(r'^Hash Key Generation\.+ (?P<hash_key_generation>\d+)$')
+        p25 = regex_engine.compile(r'^Hash Key Generation\.+ (?P<hash_key_generation>\d+)$')
 
         #SAK Encryption/Wrap.............. 0
-        p26 = re.compile(r'^SAK Encryption\/Wrap\.+ (?P<sak_encryption_wrap>\d+)$')
+        p26 = regex_engine.compile(r'^SAK Encryption\/Wrap\.+ (?P<sak_encryption_wrap>\d+)$')
 
         #SAK Decryption/Unwrap............ 0
-        p27 = re.compile(r'^SAK Decryption\/Unwrap\.+ (?P<sak_decryption_unwrap>\d+)$')
+        p27 = regex_engine.compile(r'^SAK Decryption\/Unwrap\.+ (?P<sak_decryption_unwrap>\d+)$')
 
         #SAK Cipher Mismatch.............. 0
-        p28 = re.compile(r'^SAK Cipher Mismatch\.+ (?P<sak_cipher_mismatch>\d+)$')
+        p28 = regex_engine.compile(r'^SAK Cipher Mismatch\.+ (?P<sak_cipher_mismatch>\d+)$')
 
         #Group CAK Generation............. 0
-        p29 = re.compile(r'^Group CAK Generation\.+ (?P<group_cak_generation>\d+)$')
+        p29 = regex_engine.compile(r'^Group CAK Generation\.+ (?P<group_cak_generation>\d+)$')
 
         #Group CAK Encryption/Wrap........ 0
-        p30 = re.compile(r'^Group CAK Encryption\/Wrap\.+ (?P<group_cak_encryption_wrap>\d+)$')
+        p30 = regex_engine.compile(r'^Group CAK Encryption\/Wrap\.+ (?P<group_cak_encryption_wrap>\d+)$')
 
         #Group CAK Decryption/Unwrap...... 0
-        p31 = re.compile(r'^Group CAK Decryption\/Unwrap\.+ (?P<group_cak_decryption_unwrap>\d+)$')
+        p31 = regex_engine.compile(r'^Group CAK Decryption\/Unwrap\.+ (?P<group_cak_decryption_unwrap>\d+)$')
         
         #Pairwise CAK Derivation.......... 0
-        p32 = re.compile(r'^Pairwise CAK Derivation\.+ (?P<pairwise_cak_derivation>\d+)$')
+        p32 = regex_engine.compile(r'^Pairwise CAK Derivation\.+ (?P<pairwise_cak_derivation>\d+)$')
 
         #CKN Derivation................... 0
-        p33 = re.compile(r'^CKN Derivation\.+ (?P<ckn_derivation>\d+)$')
+        p33 = regex_engine.compile(r'^CKN Derivation\.+ (?P<ckn_derivation>\d+)$')
 
         #ICK Derivation................... 0
-        p34 = re.compile(r'^ICK Derivation\.+ (?P<ick_derivation>\d+)$')
+        p34 = regex_engine.compile(r'^ICK Derivation\.+ (?P<ick_derivation>\d+)$')
 
         #KEK Derivation................... 0
-        p35 = re.compile(r'^KEK Derivation\.+ (?P<kek_derivation>\d+)$')
+        p35 = regex_engine.compile(r'^KEK Derivation\.+ (?P<kek_derivation>\d+)$')
 
         #Invalid Peer MACsec Capability... 0
-        p36 = re.compile(r'^Invalid Peer MACsec Capability\.+ (?P<invalid_peer_macsec_capability>\d+)$')
+        p36 = regex_engine.compile(r'^Invalid Peer MACsec Capability\.+ (?P<invalid_peer_macsec_capability>\d+)$')
 
         #Rx SC Creation................... 0
-        p37 = re.compile(r'^Rx SC Creation\.+ (?P<rx_sc_creation>\d+)$')
+        p37 = regex_engine.compile(r'^Rx SC Creation\.+ (?P<rx_sc_creation>\d+)$')
 
         #Tx SC Creation................... 0
-        p38 = re.compile(r'^Tx SC Creation\.+ (?P<tx_sc_creation>\d+)$')
+        p38 = regex_engine.compile(r'^Tx SC Creation\.+ (?P<tx_sc_creation>\d+)$')
 
         #Rx SA Installation............... 0
-        p39 = re.compile(r'^Rx SA Installation\.+ (?P<rx_sa_installation>\d+)$')
+        p39 = regex_engine.compile(r'^Rx SA Installation\.+ (?P<rx_sa_installation>\d+)$')
 
         #Tx SA Installation............... 0
-        p40 = re.compile(r'^Tx SA Installation\.+ (?P<tx_sa_installation>\d+)$')
+        p40 = regex_engine.compile(r'^Tx SA Installation\.+ (?P<tx_sa_installation>\d+)$')
 
         #MKPDU Tx............................... 0
-        p41 = re.compile(r'^MKPDU Tx\.+ (?P<mkpdu_tx>\d+)$')
+        p41 = regex_engine.compile(r'^MKPDU Tx\.+ (?P<mkpdu_tx>\d+)$')
 
         #MKPDU Rx ICV Verification.............. 44647
-        p42 = re.compile(r'^MKPDU Rx ICV Verification\.+ (?P<mkpdu_rx_icv_verification>\d+)$')
+        p42 = regex_engine.compile(r'^MKPDU Rx ICV Verification\.+ (?P<mkpdu_rx_icv_verification>\d+)$')
 
         #MKPDU Rx Fallback ICV Verification..... 0
-        p43 = re.compile(r'^MKPDU Rx Fallback ICV Verification\.+ (?P<mkpdu_rx_icv_fallback_ver>\d+)$')
+        p43 = regex_engine.compile(r'^MKPDU Rx Fallback ICV Verification\.+ (?P<mkpdu_rx_icv_fallback_ver>\d+)$')
         
         #MKPDU Rx Validation.................... 0
-        p44 = re.compile(r'^MKPDU Rx Validation\.+ (?P<mkpdu_rx_validation>\d+)$')
+        p44 = regex_engine.compile(r'^MKPDU Rx Validation\.+ (?P<mkpdu_rx_validation>\d+)$')
         
         #MKPDU Rx Bad Peer MN................... 0
-        p45 = re.compile(r'^MKPDU Rx Bad Peer MN\.+ (?P<mkpdu_rx_bad_peer_mn>\d+)$')
+        p45 = regex_engine.compile(r'^MKPDU Rx Bad Peer MN\.+ (?P<mkpdu_rx_bad_peer_mn>\d+)$')
 
         #MKPDU Rx Non-recent Peerlist MN........ 0
-        p46 = re.compile(r'^MKPDU Rx Non\-recent Peerlist MN\.+ (?P<mkpdu_rx_nonrecent_peerlist_mn>\d+)$')
+        p46 = regex_engine.compile(r'^MKPDU Rx Non\-recent Peerlist MN\.+ (?P<mkpdu_rx_nonrecent_peerlist_mn>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2186,15 +2184,15 @@ class ShowMkaPolicy(ShowMkaPolicySchema):
         # initial return dictionary
         ret_dict = {}
         #Send-Secure-Announcements: DISABLED
-        p = re.compile(r'^Send-Secure-Announcements:\s+(?P<send_secure_announcements>\w+)')
+        p = regex_engine.compile(r'^Send-Secure-Announcements:\s+(?P<send_secure_announcements>\w+)')
 
         # DEFAULT POLICY  0    FALSE 0  FALSE TRUE   GCM-AES-128
         # macsec            0    FALSE 30 FALSE TRUE   GCM-AES-128     Te1/0/48       Fo1/1/2
-        p2 = re.compile(r'^(?P<policy>[\w\s]+)\s+(?P<key_server_priority>\d+)\s+(?P<delay_protect>\S+)\s+(?P<confidentiality_offset>\d+)\s+(?P<sak_rey_key_on_live_peer_loss>\S+)\s+(?P<include_icv_indicator>\S+)\s+(?P<cipher>\S+)(\s+(?P<interfaces>[\S\s]*))?$')
+        p2 = regex_engine.compile(r'^(?P<policy>[\w\s]+)\s+(?P<key_server_priority>\d+)\s+(?P<delay_protect>\S+)\s+(?P<confidentiality_offset>\d+)\s+(?P<sak_rey_key_on_live_peer_loss>\S+)\s+(?P<include_icv_indicator>\S+)\s+(?P<cipher>\S+)(\s+(?P<interfaces>[\S\s]*))?$')
         
         # Gi2/0/12       Gi2/0/22
         # Te3/0/46       Te3/0/48
-        p3 = re.compile(r'^(?P<interfaces>(\w+\d+\/\d+\/\d+)\s+.*)$') 
+        p3 = regex_engine.compile(r'^(?P<interfaces>(\w+\d+\/\d+\/\d+)\s+.*)$') 
        
         for line in output.splitlines():
             line = line.strip()
@@ -13,13 +13,13 @@ IOSXE parsers for the following show commands:
     * show platform software fed switch active ipv6 mld snooping groups count
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================================
 # Parser for 'show ipv6 mld interface'
@@ -87,8 +87,8 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
             line = line.strip()
 
             # Global State Limit : 0 active out of 64000 max
-            p1 = re.compile(r'^Global +State +Limit *: +'
-                             r'(?P<active>\d+) +active +out +of +(?P<global_max_groups>\d+) +max$')
+            p1 = regex_engine.compile(r'^Global +State +Limit *: +'
+                                       r'(?P<active>\d+) +active +out +of +(?P<global_max_groups>\d+) +max$')
             m = p1.match(line)
             if m:
                 max_groups = int(m.groupdict()['global_max_groups'])
@@ -102,8 +102,8 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
 
             # GigabitEthernet1 is up, line protocol is up
-            p2 = re.compile(r'^(?P<intf>[\w\-\.\/]+) +is +(?P<intf_status>[\w\s]+), +'
-                             r'line +protocol +is +(?P<oper_status>\w+)$')
+            p2 = regex_engine.compile(r'^(?P<intf>[\w\-\.\/]+) +is +(?P<intf_status>[\w\s]+), +'
+                                       r'line +protocol +is +(?P<oper_status>\w+)$')
             m = p2.match(line)
             if m:
                 intf = m.groupdict()['intf']
@@ -124,7 +124,7 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
 
             # Internet address is FE80::5054:FF:FE7C:DC70/10
-            p3 = re.compile(r'^Internet +address +is +(?P<ip>[\w\/\.\:]+)$')
+            p3 = regex_engine.compile(r'^Internet +address +is +(?P<ip>[\w\/\.\:]+)$')
             m = p3.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['interface_adress'] = \
@@ -132,7 +132,7 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
 
             # MLD is enabled on interface
-            p4 = re.compile(r'^MLD +is +(?P<status>\w+) +on +interface$')
+            p4 = regex_engine.compile(r'^MLD +is +(?P<status>\w+) +on +interface$')
             m = p4.match(line)
             if m:
                 status = m.groupdict()['status'].lower()
@@ -141,14 +141,14 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
             
             # Current MLD version is 2
-            p5 = re.compile(r'^Current +MLD +version +is +(?P<ver>\d+)$')
+            p5 = regex_engine.compile(r'^Current +MLD +version +is +(?P<ver>\d+)$')
             m = p5.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['version'] = int(m.groupdict()['ver'])
                 continue
 
             # MLD query interval is 366 seconds
-            p7 = re.compile(r'^MLD +query +interval +is +(?P<query_interval>\d+) +seconds$')
+            p7 = regex_engine.compile(r'^MLD +query +interval +is +(?P<query_interval>\d+) +seconds$')
             m = p7.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['query_interval'] = \
@@ -156,8 +156,8 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
 
             # MLD querier timeout is 740 seconds
-            p9 = re.compile(r'^MLD +querier +timeout +is +'
-                             r'(?P<timeout>\d+) +seconds$')
+            p9 = regex_engine.compile(r'^MLD +querier +timeout +is +'
+                                       r'(?P<timeout>\d+) +seconds$')
             m = p9.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['querier_timeout'] = \
@@ -165,8 +165,8 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
 
             # MLD max query response time is 16 seconds
-            p11 = re.compile(r'^MLD +max +query +response +time +is +'
-                             r'(?P<time>\d+) +seconds$')
+            p11 = regex_engine.compile(r'^MLD +max +query +response +time +is +'
+                                       r'(?P<time>\d+) +seconds$')
             m = p11.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['query_max_response_time'] = \
@@ -174,8 +174,8 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
 
             # Last member query response interval is 1 seconds
-            p13 = re.compile(r'^Last +member +query +response +interval +is '
-                              r'+(?P<time>\d+) +(seconds|ms)$')
+            p13 = regex_engine.compile(r'^Last +member +query +response +interval +is '
+                                        r'+(?P<time>\d+) +(seconds|ms)$')
             m = p13.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['last_member_query_interval'] = \
@@ -183,7 +183,7 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
 
             # Inbound MLD access group is: test
-            p14 = re.compile(r'^Inbound +MLD +access +group +is *: +(?P<group_policy>\S+)$')
+            p14 = regex_engine.compile(r'^Inbound +MLD +access +group +is *: +(?P<group_policy>\S+)$')
             m = p14.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['group_policy'] = \
@@ -191,7 +191,7 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
 
             # MLD activity: 11 joins, 2 leaves
-            p15 = re.compile(r'^MLD +activity: +(?P<joins>\d+) +joins, +(?P<leaves>\d+) +leaves$')
+            p15 = regex_engine.compile(r'^MLD +activity: +(?P<joins>\d+) +joins, +(?P<leaves>\d+) +leaves$')
             m = p15.match(line)
             if m:
                 if 'counters' not in ret_dict['vrf'][vrf]['interface'][intf]:
@@ -203,8 +203,8 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
 
             # Interface State Limit : 0 active out of 6400 max
-            p16 = re.compile(r'^Interface +State +Limit *: +'
-                              r'(?P<active>\d+) +active +out +of +(?P<max>\d+) +max$')
+            p16 = regex_engine.compile(r'^Interface +State +Limit *: +'
+                                        r'(?P<active>\d+) +active +out +of +(?P<max>\d+) +max$')
             m = p16.match(line)
             if m:                
                 ret_dict['vrf'][vrf]['interface'][intf]['max_groups'] = int(m.groupdict()['max'])
@@ -212,8 +212,8 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
                 continue
 
             # MLD querying router is FE80::5054:FF:FE7C:DC70 (this system)
-            p20 = re.compile(r'^MLD +querying +router +is +(?P<querier>[\w\.\:]+)'
-                              r'(?P<dummy> *\([\w\s]+\))?$')
+            p20 = regex_engine.compile(r'^MLD +querying +router +is +(?P<querier>[\w\.\:]+)'
+                                        r'(?P<dummy> *\([\w\s]+\))?$')
             m = p20.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interface'][intf]['querier'] = \
@@ -305,7 +305,7 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
             line = line.replace('\t', '    ')
 
             # Interface:        GigabitEthernet1
-            p1 = re.compile(r'^Interface: +(?P<intf>[\w\.\-\/]+)$')
+            p1 = regex_engine.compile(r'^Interface: +(?P<intf>[\w\.\-\/]+)$')
             m = p1.match(line)
             if m:
                 if 'vrf' not in ret_dict:
@@ -321,7 +321,7 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
                 continue
 
             # Group:                239.1.1.1
-            p2 = re.compile(r'^Group: +(?P<group>[\w\.\:]+)$')
+            p2 = regex_engine.compile(r'^Group: +(?P<group>[\w\.\:]+)$')
             m = p2.match(line)
             if m:
                 group = m.groupdict()['group']
@@ -332,7 +332,7 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
                 continue
 
             # Host mode:        INCLUDE
-            p3 = re.compile(r'^Host +mode: +(?P<host_mode>\w+)$')
+            p3 = regex_engine.compile(r'^Host +mode: +(?P<host_mode>\w+)$')
             m = p3.match(line)
             if m:
                 host_mode = m.groupdict()['host_mode']
@@ -340,7 +340,7 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
                 continue
 
             # Uptime:                00:05:06
-            p4 = re.compile(r'^Uptime: +(?P<up_time>[\w\:\.]+)$')
+            p4 = regex_engine.compile(r'^Uptime: +(?P<up_time>[\w\:\.]+)$')
             m = p4.match(line)
             if m:
                 up_time = m.groupdict()['up_time']
@@ -349,8 +349,8 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
 
             # Router mode:        INCLUDE
             # Router mode:        EXCLUDE (Expires: 00:06:06)
-            p5 = re.compile(r'^Router +mode: +(?P<filter_mode>\w+)'
-                             r'( *\(Expires: +(?P<expire>[\w\.\:]+)\))?$')
+            p5 = regex_engine.compile(r'^Router +mode: +(?P<filter_mode>\w+)'
+                                       r'( *\(Expires: +(?P<expire>[\w\.\:]+)\))?$')
             m = p5.match(line)
             if m:
                 filter_mode = m.groupdict()['filter_mode']
@@ -361,7 +361,7 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
                 continue
 
             # Last reporter:        10.1.2.1
-            p6 = re.compile(r'^Last +reporter: +(?P<last_reporter>[\w\.\:]+)$')
+            p6 = regex_engine.compile(r'^Last +reporter: +(?P<last_reporter>[\w\.\:]+)$')
             m = p6.match(line)
             if m:
                 last_reporter = m.groupdict()['last_reporter']
@@ -369,17 +369,17 @@ class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
                 continue
 
             # Source Address                          Uptime    Expires   Fwd  Flags
-            p7_1 = re.compile(r'^Source +Address +Uptime +Expires +Fwd +Flags$')
+            p7_1 = regex_engine.compile(r'^Source +Address +Uptime +Expires +Fwd +Flags$')
             m = p7_1.match(line)
             if m:
                 continue
 
             # 2001:DB8:2:2::2                         08:13:22  00:06:42  Yes  Remote Local 2D
-            p7 = re.compile(r'^(?P<source>[\w\.\:]+) +'
-                             r'(?P<up_time>[\w\.\:]+) +'
-                             r'(?P<expire>[\w\.\:]+) +'
-                             r'(?P<forward>\w+) +'
-                             r'(?P<flags>[\w\s]+)$')
+            p7 = regex_engine.compile(r'^(?P<source>[\w\.\:]+) +'
+                                       r'(?P<up_time>[\w\.\:]+) +'
+                                       r'(?P<expire>[\w\.\:]+) +'
+                                       r'(?P<forward>\w+) +'
+                                       r'(?P<flags>[\w\s]+)$')
             m = p7.match(line)
             if m:
                 source = m.groupdict()['source']
@@ -454,10 +454,10 @@ class ShowIpv6MldSsm(ShowIpv6MldSsmSchema):
             out = output
 
         # SSM Mapping : Enabled
-        p1 = re.compile(r'^SSM Mapping *: *(?P<ssm_mapping>\w+)$')
+        p1 = regex_engine.compile(r'^SSM Mapping *: *(?P<ssm_mapping>\w+)$')
 
         # DNS Lookup : Enabled
-        p2 = re.compile(r'^DNS Lookup *: *(?P<dns_lookup>\w+)$')
+        p2 = regex_engine.compile(r'^DNS Lookup *: *(?P<dns_lookup>\w+)$')
 
         # initial variables
         ret_dict = {}
@@ -527,28 +527,28 @@ class ShowIpv6MldSsmMap(ShowIpv6MldSsmMapSchema):
             line = line.strip()
 
             # Group address: FF35:1::1
-            p1 = re.compile(r'^Group +address *: +(?P<group_address>[\w\.\:]+)$')
+            p1 = regex_engine.compile(r'^Group +address *: +(?P<group_address>[\w\.\:]+)$')
             m = p1.match(line)
             if m:
                 group_address = m.groupdict()['group_address']
                 continue
 
             # Database     : STATIC
-            p2 = re.compile(r'^Database *: +(?P<database>\w+)$')
+            p2 = regex_engine.compile(r'^Database *: +(?P<database>\w+)$')
             m = p2.match(line)
             if m:
                 database = m.groupdict()['database'].lower()
                 continue
 
             # Group mode ssm : FALSE
-            p4 = re.compile(r'^Group +mode +ssm *: +(?P<mode>\w+)$')
+            p4 = regex_engine.compile(r'^Group +mode +ssm *: +(?P<mode>\w+)$')
             m = p4.match(line)
             if m:
                 mode = False if 'false' in m.groupdict()['mode'].lower() else True
                 continue
 
             # Source list  : 2001:DB8:1:1::1
-            p3 = re.compile(r'^Source +list *: +(?P<source_addr>[\w\.\:]+)$')
+            p3 = regex_engine.compile(r'^Source +list *: +(?P<source_addr>[\w\.\:]+)$')
             m = p3.match(line)
             if m:
                 if 'vrf' not in ret_dict:
@@ -576,7 +576,7 @@ class ShowIpv6MldSsmMap(ShowIpv6MldSsmMapSchema):
                 continue
 
             # 2001:DB8::3
-            p3_1 = re.compile(r'^(?P<source_addr>[\w\.\:]+)$')
+            p3_1 = regex_engine.compile(r'^(?P<source_addr>[\w\.\:]+)$')
             m = p3_1.match(line)
             if m:
                 source_addr = m.groupdict()['source_addr']
@@ -621,7 +621,7 @@ class ShowIpv6MldSnoopingAddressCount(ShowIpv6MldSnoopingAddressCountSchema):
             output = self.device.execute(self.cli_command)
 
         # Total number of groups:   551
-        p1 = re.compile(r'^Total\s+number\s+of\s+groups\:\s+(?P<mld_groups_count>\d+)$')
+        p1 = regex_engine.compile(r'^Total\s+number\s+of\s+groups\:\s+(?P<mld_groups_count>\d+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -659,7 +659,7 @@ class ShowIpv6MldGroupsSummary(ShowIpv6MldGroupsSummarySchema):
             output = self.device.execute(self.cli_command)
 
         # No. of (*,G) routes = 9
-        p1 = re.compile(r'^No\. of \((?P<route>.+)\) routes =\s(?P<routes>\d+)$')
+        p1 = regex_engine.compile(r'^No\. of \((?P<route>.+)\) routes =\s(?P<routes>\d+)$')
 
         ret_dict = dict()
         for line in output.splitlines():
@@ -710,11 +710,11 @@ class ShowIpv6MldSnoopingQuerier(ShowIpv6MldSnoopingQuerierSchema):
 
         # initial regexp pattern
         #101       FE80::A      v2         Switch
-        p1 = re.compile(r'^[a-zA-Z\/\s-]*(?P<vlan_id>\d+)\s+(?P<ip_addr>[0-9a-fA-F\.:]+)\s+(?P<version>[v\d,]+)\s+(?P<port>[\w:\/\s]+)$')
+        p1 = regex_engine.compile(r'^[a-zA-Z\/\s-]*(?P<vlan_id>\d+)\s+(?P<ip_addr>[0-9a-fA-F\.:]+)\s+(?P<version>[v\d,]+)\s+(?P<port>[\w:\/\s]+)$')
         #101       FE80:0:9D36:F78B:A8BB:CCFF:FE00:400
-        p2 = re.compile(r'^[a-zA-Z\/\s-]*(?P<vlan_id>\d+)\s+(?P<ip_addr>[0-9a-fA-F\.:]+)\s*\\*$')
+        p2 = regex_engine.compile(r'^[a-zA-Z\/\s-]*(?P<vlan_id>\d+)\s+(?P<ip_addr>[0-9a-fA-F\.:]+)\s*\\*$')
         #v2         Switch
-        p3 = re.compile(r'^(?P<version>v[\d,]+)\s+(?P<port>[\w:\/\s]+)$')
+        p3 = regex_engine.compile(r'^(?P<version>v[\d,]+)\s+(?P<port>[\w:\/\s]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -795,7 +795,7 @@ class ShowIpv6MldGroups(ShowIpv6MldGroupsSchema):
         
         # FF1E::         Vlan10         00:00:27  not used
         # FF1E::1        Te1/0/3        00:01:49  00:01:46
-        p1=re.compile(r'(?P<group>[\w\.\:]+) +(?P<intf>[\w\.\/\-]+) +(?P<uptime>[\d\:]+) +(?P<expires>(?:[\d\:]+)|(?:[\w\s]+)|(?:not used))$')
+        p1=regex_engine.compile(r'(?P<group>[\w\.\:]+) +(?P<intf>[\w\.\/\-]+) +(?P<uptime>[\d\:]+) +(?P<expires>(?:[\d\:]+)|(?:[\w\s]+)|(?:not used))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -829,7 +829,7 @@ class ShowPlatformSoftwareMldSnoopingGroupsCount(ShowPlatformSoftwareMldSnooping
             output = self.device.execute(cmd)
         dict_count = {}
         # Total number of entries:8000
-        p1 = re.compile(r'^Total\s+number\s+of\s+entries\:(?P<ipv6_mld_snooping_entries>\d+)$')
+        p1 = regex_engine.compile(r'^Total\s+number\s+of\s+entries\:(?P<ipv6_mld_snooping_entries>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -8,12 +8,12 @@ IOSXE parsers for the following show commands:
     * show mpls mldp database
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 class ShowMplsMldpCountSchema(MetaParser):
     """Schema for:
@@ -55,10 +55,10 @@ class ShowMplsMldpCount(ShowMplsMldpCountSchema):
         ##MLDP Database Summary:
         ##MLDP Root Count:
         ##MLDP Neighbor Count:
-        p1 = re.compile(r'^([a-zA-Z ]+):$')
+        p1 = regex_engine.compile(r'^([a-zA-Z ]+):$')
         
         ##Number of MP2MP Entries : 1
-        p2 = re.compile(r'^([a-zA-Z0-9 ]+)\s*: (\d+)$')
+        p2 = regex_engine.compile(r'^([a-zA-Z0-9 ]+)\s*: (\d+)$')
         
         for line in out.splitlines():
             line=line.strip()
@@ -66,13 +66,13 @@ class ShowMplsMldpCount(ShowMplsMldpCountSchema):
             ##MLDP Database Summary:
             ##MLDP Root Count:
             ##MLDP Neighbor Count:
-            m=re.match(p1,line)
+            m=regex_engine.match(p1,line)
             if m:
                 key = m.groups()[0].strip().lower().replace(" ","_")
                 new_dict = ret_dict.setdefault('mldp_count',{}).setdefault(key,{})
                 
             ##Number of MP2MP Entries : 1
-            m=re.match(p2,line)
+            m=regex_engine.match(p2,line)
             if m:
                 res = m.groups()
                 new_dict.update({res[0].strip().lower().replace(" ","_"):int(res[1])})
@@ -118,13 +118,13 @@ class ShowMplsMldpRoot(ShowMplsMldpRootSchema):
         ##Path(s)     : 26.1.1.2         LDP nbr: 3.3.3.3:0         Port-channel30
         ##Path(s)     : 191.1.1.2        LDP nbr: 2.2.2.2:0         Port-channel20.1
         ##Path(s)     : 191.1.1.2        LDP nbr: 2.2.2.2:0         HundredGigE1/0/52.1
-        p1 = re.compile(r"^Path\(s\)\s+\:\s+(?P<path>\S+)\s+[a-zA-z ]+:\s+(?P<ldp_neigh>\S+)\s+(?P<interface>\S+)$")
+        p1 = regex_engine.compile(r"^Path\(s\)\s+\:\s+(?P<path>\S+)\s+[a-zA-z ]+:\s+(?P<ldp_neigh>\S+)\s+(?P<interface>\S+)$")
         
         ##Interface   : Port-channel30 (via unicast RT)
-        p2 = re.compile(r"^Interface\s+\:\s+(?P<interface>\S+)\s+\(via\s+(?P<learnet_via>[a-zA-Z ]+)\)$")
+        p2 = regex_engine.compile(r"^Interface\s+\:\s+(?P<interface>\S+)\s+\(via\s+(?P<learnet_via>[a-zA-Z ]+)\)$")
         
         ## Root node    : 5.5.5.5  (we are the root)
-        p3 = re.compile(r"^Root\s+node\s+:\s+(?P<root_node>\S+).*$")
+        p3 = regex_engine.compile(r"^Root\s+node\s+:\s+(?P<root_node>\S+).*$")
         
         for line in out.splitlines():
             line=line.strip()
@@ -205,18 +205,18 @@ class ShowMplsMldpNeighbors(ShowMplsMldpNeighborsSchema):
             return ret_dict
             
         ## MLDP peer ID    : 3.3.3.3:0, uptime 00:06:07 Up,
-        p1 =re.compile(r"^MLDP peer ID\s+\:\s+(?P<mldp_peer>\S+)\,\s+uptime\s+(?P<uptime>\S+)\s+(?P<peer_state>\w+)\,$")
+        p1 =regex_engine.compile(r"^MLDP peer ID\s+\:\s+(?P<mldp_peer>\S+)\,\s+uptime\s+(?P<uptime>\S+)\s+(?P<peer_state>\w+)\,$")
         
         ##LDP GR         : Enabled
         ##LDP GR         :  Enabled (we are in restart mode)
-        p2 = re.compile(r"^LDP GR\s+\:\s+(?P<ldp_gr_state>.*)$")
+        p2 = regex_engine.compile(r"^LDP GR\s+\:\s+(?P<ldp_gr_state>.*)$")
         
         ##: Reconnect time: 120 Seconds
         ##: Instance: 2
-        p3=re.compile(r"^:\s+(?P<key>[a-zA-z ]+)\:\s+(?P<value>\d+)\s*(?P<time_unit>\w+)?$")
+        p3=regex_engine.compile(r"^:\s+(?P<key>[a-zA-z ]+)\:\s+(?P<value>\d+)\s*(?P<time_unit>\w+)?$")
         
         ## Path(s)        : 26.1.1.2          LDP Port-channel30
-        p4=re.compile(r"^Path\(s\)\s+:\s+(?P<path>\S+)\s+LDP\s+(?P<ldp_interface>\S+)$")
+        p4=regex_engine.compile(r"^Path\(s\)\s+:\s+(?P<path>\S+)\s+LDP\s+(?P<ldp_interface>\S+)$")
         
         for line in out.splitlines():
             line=line.strip()
@@ -334,43 +334,43 @@ class ShowMplsMldpDatabase(ShowMplsMldpDatabaseSchema):
             return ret_dict
  
         ##LSM ID : 100 (RNR LSM ID: 101)   Type: MP2MP   Uptime : 00:00:45
-        p1=re.compile(r"^LSM ID : (?P<lsm_id>\S+)\s+(?:[\(A-Z: ]+\s+(?P<rnr_lsm_id>[0-9A-Z]+)\)?)*\s+Type: (?P<type>\S+)\s+Uptime : (?P<uptime>\S+)$")
+        p1=regex_engine.compile(r"^LSM ID : (?P<lsm_id>\S+)\s+(?:[\(A-Z: ]+\s+(?P<rnr_lsm_id>[0-9A-Z]+)\)?)*\s+Type: (?P<type>\S+)\s+Uptime : (?P<uptime>\S+)$")
        
         ##FEC Root           : 5.5.5.5     
-        p2=re.compile(r"^FEC Root\s+\:\s+(?P<fec_root>[\d\.]+).*$")
+        p2=regex_engine.compile(r"^FEC Root\s+\:\s+(?P<fec_root>[\d\.]+).*$")
         
         ##Opaque decoded     : [mdt 3001:1 0]
-        p3=re.compile(r"^Opaque decoded\s+:\s+\[(?P<type>\S+)\s+(?P<rd>(\S+))\s+\(*(?P<mdt_data>[a-zA-Z0-9 ]+)\)*\]$")
+        p3=regex_engine.compile(r"^Opaque decoded\s+:\s+\[(?P<type>\S+)\s+(?P<rd>(\S+))\s+\(*(?P<mdt_data>[a-zA-Z0-9 ]+)\)*\]$")
 
         ##Opaque length      : 11 bytes       
-        p4=re.compile(r"^Opaque length\s+:\s+(?P<opaque_length>\d+)\s+(?P<opaque_length_type>(\w+))$")
+        p4=regex_engine.compile(r"^Opaque length\s+:\s+(?P<opaque_length>\d+)\s+(?P<opaque_length_type>(\w+))$")
 
         ##Opaque value       : 02 000B 0030010000000100000000              
-        p5=re.compile(r"Opaque value\s+:\s+([0-9A-Z ]+)$")
+        p5=regex_engine.compile(r"Opaque value\s+:\s+([0-9A-Z ]+)$")
         
         ##Upstream client(s) :
         ##Replication client(s):
-        p6=re.compile(r'^([a-zA-Z ]+)\S+\s*:$')
+        p6=regex_engine.compile(r'^([a-zA-Z ]+)\S+\s*:$')
         
         ##2.2.2.2:0    [Active]
         ##None
-        p7=re.compile(r"(?P<key>[\d+\.]+\:\d+)\s*\[*(?P<state>[a-zA-Z]+)*\]*|None")
+        p7=regex_engine.compile(r"(?P<key>[\d+\.]+\:\d+)\s*\[*(?P<state>[a-zA-Z]+)*\]*|None")
         
         ##>MDT  (VRF vrf3001)
-        p8=re.compile(r">*\s*MDT\s+\(VRF\s+(\S+)\)")
+        p8=regex_engine.compile(r">*\s*MDT\s+\(VRF\s+(\S+)\)")
 
         ##Expires        : Never         Path Set ID  : 100
         ##Out Label (U)  : 26            Interface    : Port-channel20*
         ##Local Label (D): 45            Next Hop     : 104.1.1.2
         ##Uptime         : 00:00:45      Path Set ID  : 101
         ##Interface      : Lspvif9       RPF-ID       : *        
-        p9=re.compile(r"([a-zA-Z\(\) ]+\s*\:\s+\S+)\s+([a-zA-Z\- ]+\:[a-zA-Z0-9\/\-\.\:\* ]+)")
+        p9=regex_engine.compile(r"([a-zA-Z\(\) ]+\s*\:\s+\S+)\s+([a-zA-Z\- ]+\:[a-zA-Z0-9\/\-\.\:\* ]+)")
         
         for line in out.splitlines():
             line=line.strip()
             
             ##LSM ID : 100 (RNR LSM ID: 101)   Type: MP2MP   Uptime : 00:00:45
-            m=re.match(p1,line)
+            m=regex_engine.match(p1,line)
             if m:
                 r1=m.groupdict()
                 lsm_dict=ret_dict.setdefault('lsm_id',{}).setdefault(r1['lsm_id'],{})
@@ -378,14 +378,14 @@ class ShowMplsMldpDatabase(ShowMplsMldpDatabaseSchema):
                 continue
                 
             ##FEC Root           : 5.5.5.5 
-            m=re.match(p2,line)
+            m=regex_engine.match(p2,line)
             if m:
                 r2=m.groupdict()
                 lsm_dict.update({'fec_root':r2['fec_root']})
                 continue
             
             ##Opaque decoded     : [mdt 3001:1 0]
-            m=re.match(p3,line)
+            m=regex_engine.match(p3,line)
             if m:
                 r3=m.groupdict()
                 opaque_dcit=lsm_dict.setdefault("opaque_decoded",{})
@@ -393,21 +393,21 @@ class ShowMplsMldpDatabase(ShowMplsMldpDatabaseSchema):
                 continue
         
             ##Opaque length      : 11 bytes 
-            m=re.match(p4,line)
+            m=regex_engine.match(p4,line)
             if m:
                 r4=m.groupdict()
                 lsm_dict.update({key:int(value) if value.isdigit() else value for key,value in r4.items()})
                 continue
         
             ##Opaque value       : 02 000B 0030010000000100000000 
-            m=re.match(p5,line)
+            m=regex_engine.match(p5,line)
             if m:
                 lsm_dict.update({'opaque_value':m.groups()[0]})
                 continue
             
             ##Upstream client(s) :
             ##Replication client(s):
-            m=re.match(p6,line)
+            m=regex_engine.match(p6,line)
             if m:
                 client=lsm_dict.setdefault(m.groups()[0].lower().replace(" ","_"),{})
                 continue
@@ -415,7 +415,7 @@ class ShowMplsMldpDatabase(ShowMplsMldpDatabaseSchema):
             ##2.2.2.2:0    [Active]
             ##None
             ##>MDT  (VRF vrf3001)
-            m=re.match(p7,line) or re.match(p8,line)
+            m=regex_engine.match(p7,line) or regex_engine.match(p8,line)
             if m:
                 client_info=client.setdefault(str(m.groups()[0]),{})
                 if m.groupdict().get('state'):
@@ -427,9 +427,9 @@ class ShowMplsMldpDatabase(ShowMplsMldpDatabaseSchema):
             ##Local Label (D): 45            Next Hop     : 104.1.1.2
             ##Uptime         : 00:00:45      Path Set ID  : 101
             ##Interface      : Lspvif9       RPF-ID       : *      
-            m=re.match(p9,line)
+            m=regex_engine.match(p9,line)
             if m:
-                for i in list(re.findall(p9,line)[0]):
+                for i in list(regex_engine.findall(p9,line)[0]):
                     res=i.split(":",1)
                     val=res[1].replace("*","") if res[0].strip()=="Interface" else res[1]
                     client_info.update({res[0].lower().strip().replace("-","_").replace(" ","_").replace("_(d)","").replace("_(u)",""):int(val) if val.strip().isdigit() else val.strip()})
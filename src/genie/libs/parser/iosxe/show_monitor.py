@@ -8,13 +8,13 @@ IOSXE parsers for the following show commands:
 '''
 
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =========================================
 # Schema for 'show monitor'
@@ -80,64 +80,64 @@ class ShowMonitor(ShowMonitorSchema):
         ret_dict = {}
 
         # Session 1
-        p1 = re.compile(r'Session +(?P<session>(\d+))')
+        p1 = regex_engine.compile(r'Session +(?P<session>(\d+))')
 
         # Type                   : ERSPAN Source Session
         # Type: ERSPAN Source Session
-        p2 = re.compile(r'^Type *: +(?P<type>([a-zA-Z\s]+))$')
+        p2 = regex_engine.compile(r'^Type *: +(?P<type>([a-zA-Z\s]+))$')
 
         # Status                 : Admin Enabled
         # Status: Admin Enabled
-        p3 = re.compile(r'^Status *: +(?P<status>([a-zA-Z\s]+))$')
+        p3 = regex_engine.compile(r'^Status *: +(?P<status>([a-zA-Z\s]+))$')
 
         # Source Ports           :
-        p4_1 = re.compile(r'^Source +Ports +:$')
+        p4_1 = regex_engine.compile(r'^Source +Ports +:$')
 
         #    TX Only            : Gi0/1/4
         #    Both               : Gi0/1/4
         #    RX Only            : 20
         #    RX Only            : Twe2/0/3
-        p4_2 = re.compile(r'(?P<key>(TX Only|Both|RX Only)) *: +(?P<src_val>(\S+))$')
+        p4_2 = regex_engine.compile(r'(?P<key>(TX Only|Both|RX Only)) *: +(?P<src_val>(\S+))$')
 
         # Source Subinterfaces:
-        p5_1 = re.compile(r'^Source +Subinterfaces\s*:$')
+        p5_1 = regex_engine.compile(r'^Source +Subinterfaces\s*:$')
 
         # Source VLANs           :
-        p6_1 = re.compile(r'^Source +VLANs +:$')
+        p6_1 = regex_engine.compile(r'^Source +VLANs +:$')
 
         # Filter Access-Group: 100
-        p7 = re.compile(r'^Filter +Access-Group: +(?P<filter_access_group>(\d+))$')
+        p7 = regex_engine.compile(r'^Filter +Access-Group: +(?P<filter_access_group>(\d+))$')
 
         # Destination Ports      : Gi0/1/6 Gi0/1/2
         # Destination Ports        : Po24,Po26,Po28,Po30,Po32,Po34,Po36,Po38,Po40,Po46-50
-        p8 = re.compile(r'^Destination +Ports +: +(?P<destination_ports>([\w\/\s\-\,\.]+))$')
+        p8 = regex_engine.compile(r'^Destination +Ports +: +(?P<destination_ports>([\w\/\s\-\,\.]+))$')
 
         # Destination IP Address : 172.18.197.254
-        p9 = re.compile(r'^Destination +IP +Address +: +(?P<destination_ip_address>([0-9\.\:]+))$')
+        p9 = regex_engine.compile(r'^Destination +IP +Address +: +(?P<destination_ip_address>([0-9\.\:]+))$')
 
         # Destination ERSPAN ID  : 1
-        p10 = re.compile(r'^Destination +ERSPAN +ID +: +(?P<destination_erspan_Id>([0-9]+))$')
+        p10 = regex_engine.compile(r'^Destination +ERSPAN +ID +: +(?P<destination_erspan_Id>([0-9]+))$')
 
         # Origin IP Address      : 172.18.197.254
-        p11 = re.compile(r'^Origin +IP +Address *: +(?P<origin_ip_address>([0-9\.\:]+))$')
+        p11 = regex_engine.compile(r'^Origin +IP +Address *: +(?P<origin_ip_address>([0-9\.\:]+))$')
 
         # Source ERSPAN ID       : 1
-        p12 = re.compile(r'^Source +ERSPAN +ID +: +(?P<source_erspan_Id>([0-9]+))$')
+        p12 = regex_engine.compile(r'^Source +ERSPAN +ID +: +(?P<source_erspan_Id>([0-9]+))$')
 
         # Source IP Address      : 172.18.197.254
-        p13 = re.compile(r'^Source +IP +Address +: +(?P<source_ip_address>([0-9\.\:]+))$')
+        p13 = regex_engine.compile(r'^Source +IP +Address +: +(?P<source_ip_address>([0-9\.\:]+))$')
 
         # Source RSPAN VLAN : 100
-        p14 = re.compile(r'^Source +RSPAN +VLAN :+ (?P<source_rspan_vlan>(\d+))$')
+        p14 = regex_engine.compile(r'^Source +RSPAN +VLAN :+ (?P<source_rspan_vlan>(\d+))$')
 
         # Dest RSPAN VLAN : 100
-        p15 = re.compile(r'^Dest +RSPAN +VLAN :+ (?P<dest_rspan_vlan>(\d+))$')
+        p15 = regex_engine.compile(r'^Dest +RSPAN +VLAN :+ (?P<dest_rspan_vlan>(\d+))$')
 
         # MTU                    : 1464
-        p16 = re.compile(r'^MTU +: +(?P<mtu>([0-9]+))$')
+        p16 = regex_engine.compile(r'^MTU +: +(?P<mtu>([0-9]+))$')
 
         # Source EFPs           :
-        p17 = re.compile(r'^Source +EFPs +:$')
+        p17 = regex_engine.compile(r'^Source +EFPs +:$')
 
         for line in out.splitlines():
 
@@ -324,78 +324,78 @@ class ShowMonitorCapture(ShowMonitorCaptureSchema):
 
         # Status Information for Capture CAPTURE
         # Status Information for Capture NTP
-        p1 = re.compile(r'^Status +Information +for +Capture +(?P<status_information>(\w+))$')
+        p1 = regex_engine.compile(r'^Status +Information +for +Capture +(?P<status_information>(\w+))$')
 
         # Target Type:
-        p2 = re.compile(r'^Target +Type:+$')
+        p2 = regex_engine.compile(r'^Target +Type:+$')
 
         # Interface: Control Plane, Direction : both
         # Interface: GigabitEthernet0/0/0, Direction: both
-        p2_1 = re.compile(r'^Interface: +(?P<interface>([\w\s\/]+)), +Direction *:+ (?P<direction>(\w+))$')
+        p2_1 = regex_engine.compile(r'^Interface: +(?P<interface>([\w\s\/]+)), +Direction *:+ (?P<direction>(\w+))$')
 
         # Status : Inactive
-        p2_2 = re.compile(r'^Status +: +(?P<status>(\w+))$')
+        p2_2 = regex_engine.compile(r'^Status +: +(?P<status>(\w+))$')
 
         # Filter Details:
-        p3=re.compile(r'^Filter +Details:+$')
+        p3=regex_engine.compile(r'^Filter +Details:+$')
 
         # Capture all packets
         # IPv4
-        p3_1 = re.compile(r'^(?P<filter_details_type>([\w\s]+))$')
+        p3_1 = regex_engine.compile(r'^(?P<filter_details_type>([\w\s]+))$')
 
         # Source IP:  any
-        p3_2=re.compile(r'^Source +IP: +(?P<source_ip>(\w+))$')
+        p3_2=regex_engine.compile(r'^Source +IP: +(?P<source_ip>(\w+))$')
 
         # Destination IP:  any
-        p3_3 = re.compile(r'^Destination +IP: +(?P<destination_ip>(\w+))$')
+        p3_3 = regex_engine.compile(r'^Destination +IP: +(?P<destination_ip>(\w+))$')
 
         #Protocol: any
-        p3_4 = re.compile(r'^Protocol: +(?P<protocol>(\w+))$')
+        p3_4 = regex_engine.compile(r'^Protocol: +(?P<protocol>(\w+))$')
 
         # Buffer Details:
-        p4 = re.compile(r'^Buffer +Details:+$')
+        p4 = regex_engine.compile(r'^Buffer +Details:+$')
 
         # Buffer Type: LINEAR (default)
-        p4_1 = re.compile(r'^Buffer +Type: +(?P<buffer_type>(.*))$')
+        p4_1 = regex_engine.compile(r'^Buffer +Type: +(?P<buffer_type>(.*))$')
 
         # Buffer Size (in MB): 10
-        p4_2 = re.compile(r'^Buffer +Size +\(in MB\): +(?P<buffer_size>(\d+))$')
+        p4_2 = regex_engine.compile(r'^Buffer +Size +\(in MB\): +(?P<buffer_size>(\d+))$')
 
         # File Details:
-        p5 = re.compile(r'^File +Details:+$')
+        p5 = regex_engine.compile(r'^File +Details:+$')
 
         # Associated file name: flash:mycap.pcap
-        p5_1 = re.compile(r'^Associated +file +name: +(?P<file_name>(.*))$')
+        p5_1 = regex_engine.compile(r'^Associated +file +name: +(?P<file_name>(.*))$')
 
         # Total size of files(in MB): 5
-        p5_2 = re.compile(r'^Total +size +of +files+\(in MB\): +(?P<file_size>(\d+))$')
+        p5_2 = regex_engine.compile(r'^Total +size +of +files+\(in MB\): +(?P<file_size>(\d+))$')
 
         # Number of files in ring: 2
-        p5_3 = re.compile(r'^Number +of +files +in +ring: +(?P<file_number>(\d+))$')
+        p5_3 = regex_engine.compile(r'^Number +of +files +in +ring: +(?P<file_number>(\d+))$')
 
         # Size of buffer(in MB): 10
-        p5_4 = re.compile(r'^Size +of +buffer+\(in MB\): +(?P<size_of_buffer>(\d+))$')
+        p5_4 = regex_engine.compile(r'^Size +of +buffer+\(in MB\): +(?P<size_of_buffer>(\d+))$')
 
         # Limit Details:
-        p6 = re.compile(r'^Limit +Details:+$')
+        p6 = regex_engine.compile(r'^Limit +Details:+$')
 
         # Number of Packets to capture: 0 (no limit)
-        p6_1 = re.compile(r'^Number +of +Packets +to +capture: +(?P<packets_number>(\d+))')
+        p6_1 = regex_engine.compile(r'^Number +of +Packets +to +capture: +(?P<packets_number>(\d+))')
 
         # Packet Capture duration: 0 (no limit)
-        p6_2 = re.compile(r'^Packet +Capture +duration: +(?P<packets_capture_duaration>(\d+))')
+        p6_2 = regex_engine.compile(r'^Packet +Capture +duration: +(?P<packets_capture_duaration>(\d+))')
 
         # Packet Size to capture: 0 (no limit)
-        p6_3 = re.compile(r'^Packet +Size +to +capture: +(?P<packets_size>(\d+))')
+        p6_3 = regex_engine.compile(r'^Packet +Size +to +capture: +(?P<packets_size>(\d+))')
 
         # Maximum number of packets to capture per second: 1000
-        p6_4 = re.compile(r'^Maximum +number +of +packets +to +capture +per +second: +(?P<maximum_packets_number>(\d+))$')
+        p6_4 = regex_engine.compile(r'^Maximum +number +of +packets +to +capture +per +second: +(?P<maximum_packets_number>(\d+))$')
 
         # Packets per second: 0 (no limit)
-        p6_5=re.compile(r'Packets +per +second: +(?P<packets_per_second>(\d+))')
+        p6_5=regex_engine.compile(r'Packets +per +second: +(?P<packets_per_second>(\d+))')
 
         # Packet sampling rate: 0 (no sampling)
-        p6_6 = re.compile(r'^Packet +sampling +rate: +(?P<packet_sampling_rate>(\d+))')
+        p6_6 = regex_engine.compile(r'^Packet +sampling +rate: +(?P<packet_sampling_rate>(\d+))')
 
         for line in out.splitlines():
             line = line.strip()
@@ -578,22 +578,22 @@ class MonitorCaptureStop(MonitorCaptureStopSchema):
             output = self.device.execute(self.cli_command.format(capture_name=capture_name))
 
         # Capture duration - 56 seconds
-        p1 = re.compile(r'Capture\sduration\s\-\s+(?P<capture_duration>\d+)\s+seconds')
+        p1 = regex_engine.compile(r'Capture\sduration\s\-\s+(?P<capture_duration>\d+)\s+seconds')
 
         # Packets received - 0
-        p2 = re.compile(r'Packets\sreceived\s+\-\s+(?P<packets_received>\d+)')
+        p2 = regex_engine.compile(r'Packets\sreceived\s+\-\s+(?P<packets_received>\d+)')
 
         # Packets dropped - 0
-        p3 = re.compile(r'Packets\sdropped\s+\-\s+(?P<packets_dropped>\d+)')
+        p3 = regex_engine.compile(r'Packets\sdropped\s+\-\s+(?P<packets_dropped>\d+)')
 
         # Packets oversized - 0
-        p4 = re.compile(r'Packets\soversized\s+\-\s+(?P<packets_oversized>\d+)')
+        p4 = regex_engine.compile(r'Packets\soversized\s+\-\s+(?P<packets_oversized>\d+)')
 
         # Bytes dropped in asic - 0
-        p5 = re.compile(r'Bytes\sdropped\sin\sasic\s+\-\s+(?P<bytes_dropped_in_asic>\d+)')
+        p5 = regex_engine.compile(r'Bytes\sdropped\sin\sasic\s+\-\s+(?P<bytes_dropped_in_asic>\d+)')
 
         # Stopped capture point : cap1
-        p6 = re.compile(r'Stopped\scapture\spoint\s\:\s+(?P<stopped_capture_name>\S+)')
+        p6 = regex_engine.compile(r'Stopped\scapture\spoint\s\:\s+(?P<stopped_capture_name>\S+)')
 
         ret_dict = {}
 
@@ -680,7 +680,7 @@ class ShowMonitorCaptureBuffer(ShowMonitorCaptureBufferSchema):
 
         # 1   0.000000 f4:db:e6:5b:97:04 -> 01:80:c2:00:00:00 STP 60 RST. Root = 32768/805/6c:b2:ae:49:6a:40  Cost = 0  Port = 0x8185
         # 2   2.999988     10.1.1.2 -> 233.252.252.127 IPv4 96 Fragmented IP protocol (proto=UDP 17, off=1480, ID=93f1)
-        p1 = re.compile(r'^(?P<pck_no>\d+) +(?P<time>[\d\.]+) +(?P<scr_mac_address>[\da-f\:\.]+) +-> +(?P<dst_mac_address>[\da-f\:\.]+) +(?P<protocol>[\w]+) +(?P<packet_size>[0-9]+) +(?P<data>.*)$')
+        p1 = regex_engine.compile(r'^(?P<pck_no>\d+) +(?P<time>[\d\.]+) +(?P<scr_mac_address>[\da-f\:\.]+) +-> +(?P<dst_mac_address>[\da-f\:\.]+) +(?P<protocol>[\w]+) +(?P<packet_size>[0-9]+) +(?P<data>.*)$')
 
         ret_dict = {}
 
@@ -812,31 +812,31 @@ class ShowMonitorCaptureBufferDetailed(ShowMonitorCaptureBufferDetailedSchema):
         ret_dict = {}
 
         # Frame 1: 1496 bytes on wire (11968 bits), 80 bytes captured (640 bits) on interface /tmp/epc_ws/wif_to_ts_pipe, id 0
-        p0 =re.compile(r'^Frame (?P<frame_num>\d+): +(?P<frame_value>[\w\s\(\)\,\/]+)$')
+        p0 =regex_engine.compile(r'^Frame (?P<frame_num>\d+): +(?P<frame_value>[\w\s\(\)\,\/]+)$')
 
         # Frame Number: 1
-        p1 = re.compile(r'^(?P<pattern>[a-zA-Z \[]+): +(?P<value>[\w\s\(\)\:\,\.\/\]\[]+)$')
+        p1 = regex_engine.compile(r'^(?P<pattern>[a-zA-Z \[]+): +(?P<value>[\w\s\(\)\:\,\.\/\]\[]+)$')
         
         # Internet Protocol Version 4, Src: 49.1.1.2, Dst: 91.4.1.1
-        p2 = re.compile(r'^Internet Protocol Version 4, Src:+\s+(?P<source_ipv4>[\d\.]+)+, Dst:+\s+(?P<destination_ipv4>[\.\d]+)$')
+        p2 = regex_engine.compile(r'^Internet Protocol Version 4, Src:+\s+(?P<source_ipv4>[\d\.]+)+, Dst:+\s+(?P<destination_ipv4>[\.\d]+)$')
 
         # Ethernet II, Src: fa:88:8e:78:00:02 (fa:88:8e:78:00:02), Dst: 00:a7:42:86:06:bf (00:a7:42:86:06:bf)
-        p3=re.compile(r'^Ethernet II, Src:+\s+(?P<source_eth>[\:\w\)\( ]+)+, Dst:+\s+(?P<destination_eth>[\:\w\(\) ]+)$')
+        p3=regex_engine.compile(r'^Ethernet II, Src:+\s+(?P<source_eth>[\:\w\)\( ]+)+, Dst:+\s+(?P<destination_eth>[\:\w\(\) ]+)$')
 
         # Transmission Control Protocol, Src Port: 0, Dst Port: 0, Seq: 1, Len: 942
-        p4 = re.compile(r'^Transmission Control Protocol, Src Port:+\s+(?P<tcp_source_port>[\d]+)+, Dst Port:+\s+(?P<tcp_destination_port>[\d]+)+, Seq:+\s+(?P<tcp_seq_num>[\d]+)+, Len:+\s+(?P<tcp_len>[\d]+)$')
+        p4 = regex_engine.compile(r'^Transmission Control Protocol, Src Port:+\s+(?P<tcp_source_port>[\d]+)+, Dst Port:+\s+(?P<tcp_destination_port>[\d]+)+, Seq:+\s+(?P<tcp_seq_num>[\d]+)+, Len:+\s+(?P<tcp_len>[\d]+)$')
 
         # User Datagram Protocol, Src Port: 65473, Dst Port: 4789
-        p5 = re.compile(r'^User Datagram Protocol, Src Port:+\s+(?P<udp_source_port>[\d]+)+, Dst Port:+\s+(?P<udp_destination_port>[\d]+)$')
+        p5 = regex_engine.compile(r'^User Datagram Protocol, Src Port:+\s+(?P<udp_source_port>[\d]+)+, Dst Port:+\s+(?P<udp_destination_port>[\d]+)$')
 
         # Internet Protocol Version 6, Src: 2000:10::10, Dst: 2000:14::20
-        p6 = re.compile(r'^Internet Protocol Version 6, Src:+\s+(?P<source_ipv6>[\d\:]+)+, Dst:+\s+(?P<destination_ipv6>[\:\d]+)$')
+        p6 = regex_engine.compile(r'^Internet Protocol Version 6, Src:+\s+(?P<source_ipv6>[\d\:]+)+, Dst:+\s+(?P<destination_ipv6>[\:\d]+)$')
         
         # VXLAN Network Identifier (VNI): 50000
-        p7 = re.compile(r'^VXLAN +Network +Identifier +\(VNI+\): +(?P<vxlan_id>(\d+))$')
+        p7 = regex_engine.compile(r'^VXLAN +Network +Identifier +\(VNI+\): +(?P<vxlan_id>(\d+))$')
 
         #     1010 00.. = Differentiated Services Codepoint: Class Selector 5 (40)
-        p8 = re.compile(r'^[\S\s]+\s+= Differentiated Services Codepoint: [\s\S]+ \((?P<dscp_value>\d+)\)$')
+        p8 = regex_engine.compile(r'^[\S\s]+\s+= Differentiated Services Codepoint: [\s\S]+ \((?P<dscp_value>\d+)\)$')
 
         # loop to split lines of output
         for line in output.splitlines():
@@ -975,40 +975,40 @@ class ShowMonitorCaptureStatistics(ShowMonitorCaptureStatisticsSchema):
         ret_dict = {}
 
         # Capture_statistics_collected_at_software
-        p1 = re.compile(r'^capture\s+statistics\s+collected\s+at\s+software:$')
+        p1 = regex_engine.compile(r'^capture\s+statistics\s+collected\s+at\s+software:$')
 
         # capture duration
-        p2 = re.compile(r'^capture +duration +- +(?P<capture_duration>(\d+)) +seconds$')
+        p2 = regex_engine.compile(r'^capture +duration +- +(?P<capture_duration>(\d+)) +seconds$')
 
         # Packets received
-        p3 = re.compile(r'^packets +received +- +(?P<packets_received>(\d+))$')
+        p3 = regex_engine.compile(r'^packets +received +- +(?P<packets_received>(\d+))$')
 
         # Packets dropped
-        p4 = re.compile(r'^packets +dropped +- +(?P<packets_dropped>(\d+))$')
+        p4 = regex_engine.compile(r'^packets +dropped +- +(?P<packets_dropped>(\d+))$')
 
         # Packets oversized
-        p5 = re.compile(r'^packets +oversized +- +(?P<packets_oversized>(\d+))$')
+        p5 = regex_engine.compile(r'^packets +oversized +- +(?P<packets_oversized>(\d+))$')
 
         # Packets errored
-        p6 = re.compile(r'^packets +errored +- +(?P<packets_errored>(\d+))$')
+        p6 = regex_engine.compile(r'^packets +errored +- +(?P<packets_errored>(\d+))$')
 
         # Packets sent
-        p7 = re.compile(r'^packets +sent +- +(?P<packets_sent>(\d+))$')
+        p7 = regex_engine.compile(r'^packets +sent +- +(?P<packets_sent>(\d+))$')
 
         # Bytes received
-        p8 = re.compile(r'^bytes +received +- +(?P<bytes_received>(\d+))$')
+        p8 = regex_engine.compile(r'^bytes +received +- +(?P<bytes_received>(\d+))$')
 
         # Bytes dropped
-        p9 = re.compile(r'^bytes +dropped +- +(?P<bytes_dropped>(\d+))$')
+        p9 = regex_engine.compile(r'^bytes +dropped +- +(?P<bytes_dropped>(\d+))$')
 
         #Bytes oversized
-        p10 = re.compile(r'^bytes +oversized +- +(?P<bytes_oversized>(\d+))$')
+        p10 = regex_engine.compile(r'^bytes +oversized +- +(?P<bytes_oversized>(\d+))$')
 
         #Bytes errored
-        p11 = re.compile(r'^bytes +errored +- +(?P<bytes_errored>(\d+))$')
+        p11 = regex_engine.compile(r'^bytes +errored +- +(?P<bytes_errored>(\d+))$')
 
         #Bytes sent
-        p12 = re.compile(r'^bytes +sent +- +(?P<bytes_sent>(\d+))$')
+        p12 = regex_engine.compile(r'^bytes +sent +- +(?P<bytes_sent>(\d+))$')
         
 
         for line in out.splitlines():
@@ -1143,7 +1143,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
         '''*Jun 22 06:39:28.358: NHRP-CACHE-ADD tunnel: Tu1 target: 
             192.168.10. nbma_src: 1.1.1.1 vpn_src: 192.168.10.1 nbma_dest: 
             3.3.3.1 vpn_dest: 192.168.10.3 vrf: global(0x0) label: none'''
-        p0 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p0 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-CACHE-ADD) tunnel: (?P<tunnel>[A-z0-9]+) "
             r"target: (?P<target>[0-9.]+) nbma_src: (?P<nbma_src>[0-9.]+) "
             r"vpn_src: (?P<vpn_src>[0-9.]+) nbma_dest: (?P<nbma_dest>[0-9.]+) "
@@ -1153,7 +1153,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
         '''*Jun 22 06:39:28.361: NHRP-NHC-UP tunnel: Tu1 NHC up nbma_src: 
             1.1.1.1 vpn_src: 192.168.10.1 nbma_dest: 3.3.3.1 vpn_dest: 
             192.168.10.3 vrf: global(0x0)'''        
-        p1 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p1 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-NHC-UP) tunnel: (?P<tunnel>[A-z0-9]+) NHC up "
             r"nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: (?P<vpn_src>[0-9.]+) "
             r"nbma_dest: (?P<nbma_dest>[0-9.]+) vpn_dest: "
@@ -1163,7 +1163,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
             tunnel endpoints nbma_dest: 3.3.3.1 vpn_dest: 192.168.10.3'''
         '''*Jul 27 07: 30: 25.534: NHRP-TUNNEL-ENDPOINT-ADD tunnel: Tu1 add/update 
             tunnel endpoints nbma_dest: 1.1.1.1 vpn_dest: 192.168.10.1'''
-        p2 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p2 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-TUNNEL-ENDPOINT-ADD) tunnel: "
             r"(?P<tunnel>[A-z0-9]+) ([A-za-z/]+) tunnel endpoints nbma_dest: "
             r"(?P<nbma_dest>[0-9.]+) vpn_dest: (?P<vpn_dest>[0-9.]+)")
@@ -1171,7 +1171,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
         '''*Jun 22 06:39:28.930: NHRP-NHS-UP tunnel: Tu1 NHS up nbma_src: 
             2.2.2.1 vpn_src: 192.168.10.2 nbma_dest: 1.1.1.1 vpn_dest: 
             192.168.10.1 vrf: global(0x0)'''        
-        p3 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p3 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-NHS-UP) tunnel: (?P<tunnel>[A-z0-9]+) NHS up "
             r"nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: (?P<vpn_src>[0-9.]+) "
             r"nbma_dest: (?P<nbma_dest>[0-9.]+) vpn_dest: "
@@ -1181,7 +1181,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
             nbma_src: 1.1.1.1 vpn_src: 192.168.10.3 received resolution 
             request from nbma_dest: 2.2.2.1 vpn_dest: 192.168.10.2 vrf: 
             global(0x0) label: none'''        
-        p4 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p4 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-RECV-RES-REQ) tunnel: (?P<tunnel>[A-z0-9]+) host "
             r"with nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: "
             r"(?P<vpn_src>[0-9.]+) received resolution request from nbma_dest: "
@@ -1192,7 +1192,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
             nbma_src: 2.2.2.1 vpn_src: 192.168.10.2 send resolution request 
             to nbma_dest: 1.1.1.1 vpn_dest: 192.168.10.3 vrf: global(0x0) 
             label: none'''        
-        p5 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p5 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-SEND-RES-REQ) tunnel: (?P<tunnel>[A-z0-9]+) host "
             r"with nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: "
             r"(?P<vpn_src>[0-9.]+) send resolution request to nbma_dest: "
@@ -1203,7 +1203,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
             nbma_src: 2.2.2.1 vpn_src: 192.168.10.2 received resolution reply 
             from nbma_dest: 3.3.3.1 vpn_dest: 192.168.10.3 vrf: global(0x0) 
             label: none'''        
-        p6 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p6 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-RECV-RES-REPLY) tunnel: (?P<tunnel>[A-z0-9]+) "
             r"host with nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: "
             r"(?P<vpn_src>[0-9.]+) received resolution reply from nbma_dest: "
@@ -1214,7 +1214,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
             nbma_src: 3.3.3.1 vpn_src: 192.168.10.3 send resolution reply to 
             nbma_dest: 2.2.2.1 vpn_dest: 192.168.10.2 vrf: global(0x0) 
             label: illegal'''        
-        p8 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p8 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-SEND-RES-REPLY) tunnel: (?P<tunnel>[A-z0-9]+) "
             r"host with nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: "
             r"(?P<vpn_src>[0-9.]+) send resolution reply to nbma_dest: "
@@ -1225,7 +1225,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
             with nbma_src: 1.1.1.1 vpn_src: 192.168.10.1 receive purge 
             request from nbma_dest: 3.3.3.1 vpn_dest: 192.168.10.3 vrf: 
             global(0x0) label: explicit-null'''        
-        p9 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p9 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-RECV-PURGE-REQ) tunnel: (?P<tunnel>[A-z0-9]+) "
             r"host with nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: "
             r"(?P<vpn_src>[0-9.]+) receive purge request from nbma_dest: "
@@ -1235,7 +1235,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
         '''*Jun 22 07:06:10.841: NHRP-SEND-PURGE-REQ tunnel: Tu1 host with 
             nbma_src: 3.3.3.1 vpn_src: 0.0.0.0 send purge request to nbma_dest: 
             UNKNOWN vpn_dest: 192.168.10.1 vrf: global(0x0) label: none'''        
-        p10 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p10 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-SEND-PURGE-REQ) tunnel: (?P<tunnel>[A-z0-9]+) "
             r"host with nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: "
             r"(?P<vpn_src>[0-9.]+) send purge request to nbma_dest: "
@@ -1245,7 +1245,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
         '''NHRP-NHC-DOWN tunnel: Tu1 NHC down nbma_src: 1.1.1.1 vpn_src: 
             192.168.10.1 nbma_dest: 2.2.2.1 vpn_dest: 192.168.10.2 vrf: 
             global(0x0) reason: EXT - Tunnel Interface AdminDown'''        
-        p11 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p11 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-NHC-DOWN) tunnel: (?P<tunnel>[A-z0-9]+) NHC down "
             r"nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: (?P<vpn_src>[0-9.]+) "
             r"nbma_dest: (?P<nbma_dest>[0-9.]+) vpn_dest: "
@@ -1255,7 +1255,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
         '''*Jun 22 08:56:36.794: NHRP-TUNNEL-ENDPOINT-DELETE tunnel: 
             Tu1 Deleting tunnel endpoints nbma_dest: 3.3.3.1 vpn_dest: 
             192.168.10.3'''        
-        p12 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p12 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-TUNNEL-ENDPOINT-DELETE) tunnel: "
             r"(?P<tunnel>[A-z0-9]+) Deleting tunnel endpoints nbma_dest: "
             r"(?P<nbma_dest>[0-9.]+) vpn_dest: (?P<vpn_dest>[0-9.]+)")
@@ -1264,7 +1264,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
             nbma_src: 2.2.2.1 vpn_src: 192.168.10.2 nbma_dest: 1.1.1.1 
             vpn_dest: 192.168.10.1 vrf: global(0x0) reason: NHRP - 
             Registration Failure'''
-        p13 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p13 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-NHS-DOWN) tunnel: (?P<tunnel>[A-z0-9]+) NHS "
             r"down nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: "
             r"(?P<vpn_src>[0-9.]+) nbma_dest: (?P<nbma_dest>[0-9.]+) "
@@ -1277,7 +1277,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
         '''*Jul 27 07: 30: 34.496: NHRP-NHS-RECOVERY-NHS-STATE  NHS vpn_dest: 192.168.10.1 
             Tunnel1 vrf: global(0x0) cluster 0 priority 0 transitioned to 'responding 
             expecting replies' from 'expecting replies'''
-        p14 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p14 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-NHS-RECOVERY-NHS-STATE)  NHS vpn_dest: "
             r"(?P<vpn_dest>[0-9.]+) ([A-z0-9]+) ([a-z:]+) (?P<vrf>[A-Za-z0()]+) cluster "
             r"(?P<cluster>[0-9]+) priority (?P<priority>[0-9]+) transitioned "
@@ -1289,7 +1289,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
         '''*Aug 14 05: 06: 47.622: NHRP-CTRL-PLANE-RETRANS tunnel: Tu1 
            retransmitting Registration Request for vpn_dest: 192.168.10.1 reqid 
            4 retrans 2 sec vrf: global (0x0) label: explicit-null'''
-        p15 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p15 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-CTRL-PLANE-RETRANS) tunnel: "
             r"(?P<tunnel>[A-z0-9]+) retransmitting ([A-za-z]+) ([A-za-z]+) for "
             r"vpn_dest: (?P<vpn_dest>[0-9.]+) reqid (?P<reqid>[0-9]+) ([a-z ]+) "
@@ -1302,7 +1302,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
         '''*Aug 15 13: 59: 48.248: NHRP-NHP-DOWN tunnel: Tu1 NHP down nbma_src: 
             2.2.2.1 vpn_src: 192.168.10.2 nbma_dest: 3.3.3.1 vpn_dest: 192.168.10.3 
             vrf: global (0x0) reason: NHRP - Hold time expiry'''
-        p18 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p18 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-NHP-DOWN) tunnel: (?P<tunnel>[A-z0-9]+) NHP down "
             r"nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: (?P<vpn_src>[0-9.]+) "
             r"nbma_dest: (?P<nbma_dest>[0-9.]+) vpn_dest: "
@@ -1313,7 +1313,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
             1.1.1.1 vpn_src: 192.168.10.1 nbma_dest: 2.2.2.1 vpn_dest: 
             192.168.10. vrf: global(0x0) label: none reason: 
             EXT - Tunnel Interface AdminDown'''        
-        p20 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p20 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-CACHE-DELETE) tunnel: (?P<tunnel>[A-z0-9]+) "
             r"nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: (?P<vpn_src>[0-9.]+) "
             r"nbma_dest: (?P<nbma_dest>[0-9.]+) vpn_dest: "
@@ -1323,7 +1323,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
         '''*Jun 26 18:38:52.148: NHRP-CACHE-UPDATE tunnel: Tu1 target: 
             192.168.10. nbma_src: 2.2.2.1 vpn_src: 192.168.10.2 nbma_dest: 
             1.1.1.1 vpn_dest: 192.168.10.3 vrf: global(0x0) label: none'''        
-        p21 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p21 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-CACHE-UPDATE) tunnel: (?P<tunnel>[A-z0-9]+) "
             r"target: (?P<target>[0-9.]+) nbma_src: (?P<nbma_src>[0-9.]+) "
             r"vpn_src: (?P<vpn_src>[0-9.]+) nbma_dest: (?P<nbma_dest>[0-9.]+) "
@@ -1332,7 +1332,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
 
         '''*Jun 27 17:48:34.466: NHRP-CACHE-NBMA-NHOP-CHANGE tunnel: Tu1 
             cache address change nbma old: 1.1.1.1 -> new: 3.3.3.1'''        
-        p22 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p22 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-CACHE-NBMA-NHOP-CHANGE) tunnel: "
             r"(?P<tunnel>[A-z0-9]+) cache address change nbma old: "
             r"(?P<old>[0-9.]+) -> new: (?P<new>[0-9.]+)")
@@ -1341,7 +1341,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
             nbma_src: 2.2.2.1 vpn_src: 192.168.10.2 receive purge reply from 
             nbma_dest: 2.2.2.1 vpn_dest: 192.168.10.3 vrf: global(0x0) 
             label: none'''        
-        p23 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p23 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-RECV-PURGE-REPLY) tunnel: (?P<tunnel>[A-z0-9]+) "
             r"host with nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: "
             r"(?P<vpn_src>[0-9.]+) receive purge reply from nbma_dest: "
@@ -1352,7 +1352,7 @@ class ShowMonitorEventTraceDmvpnAll(ShowMonitorEventTraceDmvpnAllSchema):
             with nbma_src: 3.3.3.1 vpn_src: 192.168.10.3 send purge reply 
             to nbma_dest: 2.2.2.1 vpn_dest: 192.168.10.2 vrf: global(0x0) 
             label: illegal'''        
-        p24 = re.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
+        p24 = regex_engine.compile(r"\*(?P<time_stamp>[A-z0-9\s\d:.]+) "
             r"(?P<event>NHRP-SEND-PURGE-REPLY) tunnel: (?P<tunnel>[A-z0-9]+)  "
             r"host with nbma_src: (?P<nbma_src>[0-9.]+) vpn_src: "
             r"(?P<vpn_src>[0-9.]+) send purge reply to nbma_dest: "
@@ -51,6 +51,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                                Any, \
                                                Optional
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 class ShowMplsLdpParametersSchema(MetaParser):
     """Schema for show mpls ldp Parameters"""
@@ -99,34 +100,34 @@ class ShowMplsLdpParameters(ShowMplsLdpParametersSchema):
         ldp_feature_list = []
 
         # LDP Feature Set Manager: State Initialized
-        p1 = re.compile(r'^LDP +Feature +Set +Manager: +(S|s)tate +(?P<state_initialized>\w+)$')
+        p1 = regex_engine.compile(r'^LDP +Feature +Set +Manager: +(S|s)tate +(?P<state_initialized>\w+)$')
         #   LDP features:
-        p2 = re.compile(r'^LDP +features:$')
+        p2 = regex_engine.compile(r'^LDP +features:$')
         #  Auto-Configuration
-        p2_1 = re.compile(r'^(?P<ldp_features>[\w\-]+)?$')
+        p2_1 = regex_engine.compile(r'^(?P<ldp_features>[\w\-]+)?$')
         # Protocol version: 1
-        p3 = re.compile(r'^Protocol version: +(?P<version>\d+)$')
+        p3 = regex_engine.compile(r'^Protocol version: +(?P<version>\d+)$')
         # Session hold time: 180 sec; keep alive interval: 60 sec
-        p4 = re.compile(r'^Session +hold +time: +(?P<session_holdtime>\d+) +sec;'
-                        r' +keep +alive +interval: +(?P<keepalive_interval>\d+) +sec$')
+        p4 = regex_engine.compile(r'^Session +hold +time: +(?P<session_holdtime>\d+) +sec;'
+                                  r' +keep +alive +interval: +(?P<keepalive_interval>\d+) +sec$')
 
         # Discovery hello: holdtime: 15 sec; interval: 5 sec
-        p5 = re.compile(r'^Discovery +hello: +holdtime: +(?P<holdtime>\d+) +sec; +interval: +(?P<interval>\d+) +sec$')
+        p5 = regex_engine.compile(r'^Discovery +hello: +holdtime: +(?P<holdtime>\d+) +sec; +interval: +(?P<interval>\d+) +sec$')
 
         # Discovery targeted hello: holdtime: 90 sec; interval: 10 sec
-        p6 = re.compile(r'^Discovery +targeted +hello: +holdtime: +(?P<targeted_holdtime>\d+) +sec; +interval:'
-                        r' +(?P<targeted_interval>\d+) +sec$')
+        p6 = regex_engine.compile(r'^Discovery +targeted +hello: +holdtime: +(?P<targeted_holdtime>\d+) +sec; +interval:'
+                                  r' +(?P<targeted_interval>\d+) +sec$')
 
         # Downstream on Demand max hop count: 255
-        p7 = re.compile(r'^Downstream +on +Demand +max +hop +count: +(?P<maxhop_count>\d+)$')
+        p7 = regex_engine.compile(r'^Downstream +on +Demand +max +hop +count: +(?P<maxhop_count>\d+)$')
         # LDP for targeted sessions
-        p8 = re.compile(r'^LDP +for +targeted +sessions$')
+        p8 = regex_engine.compile(r'^LDP +for +targeted +sessions$')
         # LDP initial/maximum backoff: 15/120 sec
-        p9 = re.compile(r'^LDP +initial\/maximum +backoff: +(?P<initial>\w+)/+(?P<maximum>\w+) sec$')
+        p9 = regex_engine.compile(r'^LDP +initial\/maximum +backoff: +(?P<initial>\w+)/+(?P<maximum>\w+) sec$')
         # LDP loop detection: off
-        p10 = re.compile(r'^LDP +loop +detection: +(?P<loop_detection>\w+)$')
+        p10 = regex_engine.compile(r'^LDP +loop +detection: +(?P<loop_detection>\w+)$')
         # LDP NSR: Disabled
-        p11 = re.compile(r'^LDP +NSR: +(?P<nsr>\w+)$')
+        p11 = regex_engine.compile(r'^LDP +NSR: +(?P<nsr>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -321,54 +322,54 @@ class ShowMplsLdpNsrStatistics(ShowMplsLdpNsrStatisticsSchema):
         session_sync_flag = False
 
         # Peer: 10.169.197.253:0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Peer: +(?P<peer>[\d\.]+):(?P<local_space_id>\d+)$')
         #   In label Request Records created: 0, freed: 0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^In +label +Request +Records +created: +(?P<created>\d+), +freed: +(?P<freed>\d+)$')
 
         #   In label Withdraw Records created: 0, freed: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^In +label +Withdraw +Records +created: +(?P<created>\d+), +freed: +(?P<freed>\d+)$')
         #   Local Address Withdraw Set: 0, Cleared: 0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Local +Address +Withdraw +Set: +(?P<set>\d+), +Cleared: +(?P<cleared>\d+)$')
 
         #   Transmit contexts enqueued: 0, dequeued: 0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Transmit +contexts +enqueued: +(?P<enqueued>\d+), +dequeued: +(?P<dequeued>\d+)$')
         # Total In label Request Records created: 0, freed: 0
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Total +In +label +Request +Records +created: +(?P<created>\d+), +freed: +(?P<freed>\d+)$')
 
         # Total In label Withdraw Records created: 0, freed: 0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Total +In +label +Withdraw +Records +created: +(?P<created>\d+), +freed: +(?P<freed>\d+)$')
         # Total Local Address Withdraw Records created: 0, freed: 0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Total +Local +Address +Withdraw +Records +created: +(?P<created>\d+), +freed: +(?P<freed>\d+)$')
         # Label Request Acks:
-        p9 = re.compile(r'^Label +Request +Acks:$')
+        p9 = regex_engine.compile(r'^Label +Request +Acks:$')
 
         #   Number of chkpt msg sent: 0
-        p10 = re.compile(r'^Number +of +chkpt +msg +sent: +(?P<msg_sent>\d+)$')
+        p10 = regex_engine.compile(r'^Number +of +chkpt +msg +sent: +(?P<msg_sent>\d+)$')
         #   Number of chkpt msg in queue: 0
-        p11 = re.compile(r'^Number +of +chkpt +msg +in +queue: +(?P<queue>\d+)$')
+        p11 = regex_engine.compile(r'^Number +of +chkpt +msg +in +queue: +(?P<queue>\d+)$')
         #   Number of chkpt msg in state none: 0
-        p12 = re.compile(r'^Number +of +chkpt +msg +in +state +none: +(?P<state_none>\d+)$')
+        p12 = regex_engine.compile(r'^Number +of +chkpt +msg +in +state +none: +(?P<state_none>\d+)$')
         #   Number of chkpt msg in state send: 0
-        p13 = re.compile(r'^Number +of +chkpt +msg +in +state +send: +(?P<state_send>\d+)$')
+        p13 = regex_engine.compile(r'^Number +of +chkpt +msg +in +state +send: +(?P<state_send>\d+)$')
         #   Number of chkpt msg in state wait: 0
-        p14 = re.compile(r'^Number +of +chkpt +msg +in +state +wait: +(?P<state_wait>\d+)$')
+        p14 = regex_engine.compile(r'^Number +of +chkpt +msg +in +state +wait: +(?P<state_wait>\d+)$')
         # Label Withdraw Acks:
-        p15= re.compile(r'^Label +Withdraw +Acks:$')
+        p15= regex_engine.compile(r'^Label +Withdraw +Acks:$')
         # Address Withdraw Acks:
-        p16 = re.compile(r'^Address +Withdraw +Acks:$')
+        p16 = regex_engine.compile(r'^Address +Withdraw +Acks:$')
         # Session Sync:
-        p17 = re.compile(r'^Session +Sync:$')
+        p17 = regex_engine.compile(r'^Session +Sync:$')
 
         #   Number of session-sync msg sent: 0
-        p18 = re.compile(r'^(?P<session_sync_keys>^(Number)[\S\s]+): (?P<session_sync_values>\d+)$')
+        p18 = regex_engine.compile(r'^(?P<session_sync_keys>^(Number)[\S\s]+): (?P<session_sync_values>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -619,65 +620,65 @@ class ShowMplsLdpNeighbor(ShowMplsLdpNeighborSchema):
         sent_flag = False
 
         # Peer LDP Ident: 10.169.197.252:0; Local LDP Ident 10.169.197.254:0
-        p1 = re.compile(r'^Peer +LDP +Ident: *(?P<peer_ldp>[\d\.]+):(?P<label_space_id>\d+); +Local +LDP +Ident +(?P<local_ldp>\S+)$')
+        p1 = regex_engine.compile(r'^Peer +LDP +Ident: *(?P<peer_ldp>[\d\.]+):(?P<label_space_id>\d+); +Local +LDP +Ident +(?P<local_ldp>\S+)$')
 
         #     TCP connection: 10.169.197.252.646 - 10.169.197.254.20170
-        p2 = re.compile(r'^TCP +connection: *(?P<tcp_connection>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^TCP +connection: *(?P<tcp_connection>[\S\s]+)$')
 
         #     State: Oper; Msgs sent/rcvd: 824/825; Downstream
         #     State: Oper; Msgs sent/rcvd: 824/825; Downstream; Last TIB rev sent 4103
         #     State: Oper; Msgs sent/rcvd: 5855/6371; Downstream on demand
-        p3 = re.compile(r'^State: *(?P<state>\w+); +Msgs +sent\/rcvd: *(?P<msg_sent>\d+)\/(?P<msg_rcvd>\d+);'
-                                r' +(?P<downstream>[\w\s]+)(; +Last +TIB +rev +sent +(?P<last_tib_rev_sent>\d+))?$')
+        p3 = regex_engine.compile(r'^State: *(?P<state>\w+); +Msgs +sent\/rcvd: *(?P<msg_sent>\d+)\/(?P<msg_rcvd>\d+);'
+                                          r' +(?P<downstream>[\w\s]+)(; +Last +TIB +rev +sent +(?P<last_tib_rev_sent>\d+))?$')
 
         #  Up time: 04:26:14
         #  Up time: 3d21h; UID: 4; Peer Id 0
-        p4 = re.compile(r'^Up +time: *(?P<up_time>[\w\:]+)(; +UID: *(?P<uid>\d+); +Peer +Id +(?P<peer_id>\d+))?$')
+        p4 = regex_engine.compile(r'^Up +time: *(?P<up_time>[\w\:]+)(; +UID: *(?P<uid>\d+); +Peer +Id +(?P<peer_id>\d+))?$')
 
         #     LDP discovery sources:
         #       GigabitEthernet0/0/0, Src IP addr: 10.169.197.93
         #       ATM3/0.1
-        p5 = re.compile(r'^(?P<interface>[A-Za-z]+[\d/.]+)((,|;) +Src +IP +addr: *(?P<src_ip_address>[\d\.]+))?$')
+        p5 = regex_engine.compile(r'^(?P<interface>[A-Za-z]+[\d/.]+)((,|;) +Src +IP +addr: *(?P<src_ip_address>[\d\.]+))?$')
 
         #       holdtime: 15000 ms, hello interval: 5000 ms
-        p5_1 = re.compile(r'^holdtime: *(?P<holdtime>\d+) +ms, +hello +interval: *(?P<hello_interval>\d+) +ms$')
+        p5_1 = regex_engine.compile(r'^holdtime: *(?P<holdtime>\d+) +ms, +hello +interval: *(?P<hello_interval>\d+) +ms$')
 
         #     Addresses bound to peer LDP Ident:
-        p6 = re.compile(r'^Addresses +bound +to +peer +LDP +Ident:$')
+        p6 = regex_engine.compile(r'^Addresses +bound +to +peer +LDP +Ident:$')
 
         #       10.169.197.252 10.120.202.49    10.169.197.101 10.16.190.254
-        p7 = re.compile(r'^(?P<address_bound_peer_ldp>[\d\.\s]+)$')
+        p7 = regex_engine.compile(r'^(?P<address_bound_peer_ldp>[\d\.\s]+)$')
 
         # Peer holdtime: 180000 ms; KA interval: 60000 ms; Peer state: estab
-        p8 = re.compile(r'^Peer +holdtime: *(?P<peer_holdtime>\d+) +ms; +KA +interval: *(?P<ka_interval>\d+) +ms;'
-                         r' +Peer +state: +(?P<peer_state>\S+)$')
+        p8 = regex_engine.compile(r'^Peer +holdtime: *(?P<peer_holdtime>\d+) +ms; +KA +interval: *(?P<ka_interval>\d+) +ms;'
+                                   r' +Peer +state: +(?P<peer_state>\S+)$')
 
         # Password: not required, none, in use
-        p9 = re.compile(r'^Password: +(?P<password>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^Password: +(?P<password>[\S\s]+)$')
 
         #NSR: Not Ready
-        p10 = re.compile(r'^NSR: +(?P<nsr>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^NSR: +(?P<nsr>[\S\s]+)$')
 
         # Capabilities Sent:
-        p11 = re.compile(r'^Capabilities +Sent:$')
+        p11 = regex_engine.compile(r'^Capabilities +Sent:$')
 
         #   [ICCP (type 0x0405) MajVer 1 MinVer 0]
-        p12 = re.compile(r'^\[ICCP \(type +(?P<type>\w+)\) +MajVer +(?P<maj_ver>\d+) +MinVer +(?P<min_ver>\d+)\]$')
+        p12 = regex_engine.compile(r'^\[ICCP \(type +(?P<type>\w+)\) +MajVer +(?P<maj_ver>\d+) +MinVer +(?P<min_ver>\d+)\]$')
 
         #   [Dynamic Announcement (0x0506)]
-        p13 = re.compile(r'^\[Dynamic +Announcement \((?P<dynamic_anouncement>\w+)\)\]$')
+        p13 = regex_engine.compile(r'^\[Dynamic +Announcement \((?P<dynamic_anouncement>\w+)\)\]$')
 
         #   [mLDP Point-to-Multipoint (0x0508)]
-        p14 = re.compile(r'^\[mLDP +Point\-to\-Multipoint \((?P<mldp_point_to_multipoint>\w+)\)\]$')
+        p14 = regex_engine.compile(r'^\[mLDP +Point\-to\-Multipoint \((?P<mldp_point_to_multipoint>\w+)\)\]$')
         #   [mLDP Multipoint-to-Multipoint (0x0509)]
-        p15 = re.compile(r'^\[mLDP +Multipoint\-to\-Multipoint \((?P<mldp_multipoint_to_multipoint>\w+)\)\]$')
+        p15 = regex_engine.compile(r'^\[mLDP +Multipoint\-to\-Multipoint \((?P<mldp_multipoint_to_multipoint>\w+)\)\]$')
         #   [Typed Wildcard (0x050B)]
-        p16 = re.compile(r'^\[Typed +Wildcard \((?P<typed_wildcard>\w+)\)\]$')
+        p16 = regex_engine.compile(r'^\[Typed +Wildcard \((?P<typed_wildcard>\w+)\)\]$')
 
         # Capabilities Received:
-        p17 = re.compile(r'^Capabilities +Received:$')
+        p17 = regex_engine.compile(r'^Capabilities +Received:$')
         #   [None]
-        p18 = re.compile(r'^\[None\]$')
+        p18 = regex_engine.compile(r'^\[None\]$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -947,28 +948,28 @@ class ShowMplsLdpBindings(ShowMplsLdpBindingsSchema):
         result_dict = {}
 
         # VRF vrf1:
-        p0 = re.compile(r'^VRF +(?P<vrf>\S+):$')
+        p0 = regex_engine.compile(r'^VRF +(?P<vrf>\S+):$')
         # lib entry: 10.186.1.0/24, rev 1028
         # lib entry: 10.186.1.0/24, rev 1028,
         # lib entry: 10.120.202.64/32, rev 12, chkpt: none
         # tib entry: 10.0.0.0/8, rev 4
         # 10.16.16.16/32, rev 775
         # lib entry: 10.0.0.0/8, rev 300(no route)
-        p1 = re.compile(r'^([\w]+ +entry: +)?(?P<lib_entry>[\d\.\/]+), +rev +(?P<rev>\d+),'
+        p1 = regex_engine.compile(r'^([\w]+ +entry: +)?(?P<lib_entry>[\d\.\/]+), +rev +(?P<rev>\d+),'
             r'?( +chkpt: +(?P<checkpoint>\S+))?(, +elc)?(?P<no_route>\(no route\))?$')
 
         #  local binding:  label: 2536
         #  local binding:  label: 2027 (owner LDP)
-        p2 = re.compile(r'^local +binding: +label: +(?P<local_label>\S+)( +\(owner +(?P<owner>\w+)\))?$')
+        p2 = regex_engine.compile(r'^local +binding: +label: +(?P<local_label>\S+)( +\(owner +(?P<owner>\w+)\))?$')
 
         #  Advertised to:
         # 10.169.197.252:0      10.169.197.253:0
-        p3 = re.compile(r'^(?P<advertised_to>[\d\.\:\s]+)$')
+        p3 = regex_engine.compile(r'^(?P<advertised_to>[\d\.\:\s]+)$')
 
         #  remote binding: lsr: 10.169.197.252:0, label: 508
         #  remote binding: lsr: 10.169.197.253:0, label: 308016 checkpointed
-        p4 = re.compile(r'^remote +binding: +lsr: +(?P<lsr>[\d\.]+):(?P<label_space_id>[\d]+),'
-                        r' +label: +(?P<remote_label>\S+)( +(?P<checkpointed>\w+))?(, +elc)?$')
+        p4 = regex_engine.compile(r'^remote +binding: +lsr: +(?P<lsr>[\d\.]+):(?P<label_space_id>[\d]+),'
+                                  r' +label: +(?P<remote_label>\S+)( +(?P<checkpointed>\w+))?(, +elc)?$')
 
 
         for line in out.splitlines():
@@ -1076,20 +1077,20 @@ class ShowMplsLdpCapabilities(ShowMplsLdpCapabilitiesSchema):
         # initial return dictionary
         result_dict = {}
         # LDP Capabilities - [<description> (<type>)]
-        p0 = re.compile(r'^LDP +Capabilities +\- +\[\<description\> +\(\<type\>\)\]$')
+        p0 = regex_engine.compile(r'^LDP +Capabilities +\- +\[\<description\> +\(\<type\>\)\]$')
 
         #   [ICCP (type 0x0405) MajVer 1 MinVer 0]
-        p1 = re.compile(r'^\[ICCP \(type +(?P<type>\w+)\) +MajVer +(?P<maj_ver>\d+) +MinVer +(?P<min_ver>\d+)\]$')
+        p1 = regex_engine.compile(r'^\[ICCP \(type +(?P<type>\w+)\) +MajVer +(?P<maj_ver>\d+) +MinVer +(?P<min_ver>\d+)\]$')
 
         #   [Dynamic Announcement (0x0506)]
-        p2 = re.compile(r'^\[Dynamic +Announcement \((?P<dynamic_anouncement>\w+)\)\]$')
+        p2 = regex_engine.compile(r'^\[Dynamic +Announcement \((?P<dynamic_anouncement>\w+)\)\]$')
 
         #   [mLDP Point-to-Multipoint (0x0508)]
-        p3 = re.compile(r'^\[mLDP +Point\-to\-Multipoint \((?P<mldp_point_to_multipoint>\w+)\)\]$')
+        p3 = regex_engine.compile(r'^\[mLDP +Point\-to\-Multipoint \((?P<mldp_point_to_multipoint>\w+)\)\]$')
         #   [mLDP Multipoint-to-Multipoint (0x0509)]
-        p4 = re.compile(r'^\[mLDP +Multipoint\-to\-Multipoint \((?P<mldp_multipoint_to_multipoint>\w+)\)\]$')
+        p4 = regex_engine.compile(r'^\[mLDP +Multipoint\-to\-Multipoint \((?P<mldp_multipoint_to_multipoint>\w+)\)\]$')
         #   [Typed Wildcard (0x050B)]
-        p5 = re.compile(r'^\[Typed +Wildcard \((?P<typed_wildcard>\w+)\)\]$')
+        p5 = regex_engine.compile(r'^\[Typed +Wildcard \((?P<typed_wildcard>\w+)\)\]$')
 
 
         for line in out.splitlines():
@@ -1247,56 +1248,56 @@ class ShowMplsLdpDiscovery(ShowMplsLdpDiscoverySchema):
         # Local LDP Identifier:
         # VRF vpn1:Local LDP Identifier:
         # VRF vpn1: Local LDP Identifier:
-        p1 = re.compile(r'^(VRF +(?P<vrf>\S+):)? *Local +LDP +Identifier:$')
+        p1 = regex_engine.compile(r'^(VRF +(?P<vrf>\S+):)? *Local +LDP +Identifier:$')
 
         # 10.169.197.254:0
-        p2 = re.compile(r'^(?P<local_ldp_identifier>[\d\.\:]+)$')
+        p2 = regex_engine.compile(r'^(?P<local_ldp_identifier>[\d\.\:]+)$')
         # Discovery Sources:
-        p2_1 = re.compile(r'^Discovery +Sources:$')
+        p2_1 = regex_engine.compile(r'^Discovery +Sources:$')
 
         #     GigabitEthernet0/0/0 (ldp): xmit/recv
         #     ATM1/1/0.1 (tdp):xmit/recv
         #     Ethernet3/0 (ldp): xmit
         #                (ldp): xmit/recv
-        p3 = re.compile(r'^((?P<interface>\S+) +)?\((?P<session>[\w]+)\): *(?P<xmit>xmit)?\/?(?P<recv>recv)?$')
+        p3 = regex_engine.compile(r'^((?P<interface>\S+) +)?\((?P<session>[\w]+)\): *(?P<xmit>xmit)?\/?(?P<recv>recv)?$')
 
         #         Enabled: Interface config
-        p4 = re.compile(r'^Enabled: +(?P<enabled>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^Enabled: +(?P<enabled>[\S\s]+)$')
 
         #         Hello interval: 5000 ms; Transport IP addr: 10.169.197.254
-        p5 = re.compile(r'^Hello +interval: +(?P<hello_interval_ms>\d+) +ms;'
-                        r' +Transport +IP +addr: (?P<transport_ip_address>[\d\.]+)$')
+        p5 = regex_engine.compile(r'^Hello +interval: +(?P<hello_interval_ms>\d+) +ms;'
+                                  r' +Transport +IP +addr: (?P<transport_ip_address>[\d\.]+)$')
 
         #         LDP Id: 10.169.197.252:0
-        p6 = re.compile(r'^(?P<ldp_tdp>\w+) +Id:(?P<space>\s{1,2})?(?P<ldp_tdp_id>[\d\.\:]+)$')
+        p6 = regex_engine.compile(r'^(?P<ldp_tdp>\w+) +Id:(?P<space>\s{1,2})?(?P<ldp_tdp_id>[\d\.\:]+)$')
 
         #           Src IP addr: 10.169.197.93; Transport IP addr: 10.169.197.252
-        p7 = re.compile(r'^Src +IP +addr: +(?P<source_ip_address>[\d\.]+);'
-                        r' +Transport +IP +addr: +(?P<transport_ip_address>[\d\.]+)$')
+        p7 = regex_engine.compile(r'^Src +IP +addr: +(?P<source_ip_address>[\d\.]+);'
+                                  r' +Transport +IP +addr: +(?P<transport_ip_address>[\d\.]+)$')
 
         #           Hold time: 15 sec; Proposed local/peer: 15/15 sec
-        p8 = re.compile(r'^Hold +time: +(?P<holdtime_sec>\d+) +sec; +Proposed +local\/peer:'
-                        r' +(?P<proposed_local>\d+)\/(?P<proposed_peer>\d+) +sec$')
+        p8 = regex_engine.compile(r'^Hold +time: +(?P<holdtime_sec>\d+) +sec; +Proposed +local\/peer:'
+                                  r' +(?P<proposed_local>\d+)\/(?P<proposed_peer>\d+) +sec$')
 
         #           Reachable via 10.169.197.252/32
-        p9 = re.compile(r'^Reachable +via +(?P<reachable_via>[\d\.\/]+)$')
+        p9 = regex_engine.compile(r'^Reachable +via +(?P<reachable_via>[\d\.\/]+)$')
 
         #           Password: not required, none, in use
-        p10 = re.compile(r'^Password: +(?P<password>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^Password: +(?P<password>[\S\s]+)$')
 
         #  Clients: IPv4, mLDP
-        p11 = re.compile(r'^Clients: +(?P<clients>[\S\s]+)$')
+        p11 = regex_engine.compile(r'^Clients: +(?P<clients>[\S\s]+)$')
 
         #  10.81.1.1 -> 172.16.94.33 (ldp): active, xmit/recv
         #  10.81.1.1 -> 172.16.25.16 (tdp): passive, xmit/recv
         #  10.131.191.252 -> 10.131.159.251 (ldp): active, xmit
         #  10.131.191.252 -> 10.131.159.252 (ldp): active/passive, xmit/recv
-        p12 = re.compile(r'^(?P<source>[\d\.]+) +\-> +(?P<destination>[\d\.]+)'
-                          r' +\((?P<session>(ldp|tdp)+)\): +(?P<status>(active|passive|active\/passive)+),'
-                          r' +(?P<xmit>xmit)?\/?(?P<recv>recv)?$')
+        p12 = regex_engine.compile(r'^(?P<source>[\d\.]+) +\-> +(?P<destination>[\d\.]+)'
+                                    r' +\((?P<session>(ldp|tdp)+)\): +(?P<status>(active|passive|active\/passive)+),'
+                                    r' +(?P<xmit>xmit)?\/?(?P<recv>recv)?$')
 
         # Targeted Hellos:
-        p13 = re.compile(r'^Targeted +Hellos:$')
+        p13 = regex_engine.compile(r'^Targeted +Hellos:$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1500,32 +1501,32 @@ class ShowMplsLdpIgpSync(ShowMplsLdpIgpSyncSchema):
         result_dict = {}
 
         # GigabitEthernet0/0/0:
-        p1 = re.compile(r'^(?P<interface>\S+):$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+):$')
 
         #     LDP configured; LDP-IGP Synchronization enabled.
         #     LDP configured; LDP-IGP Synchronization not enabled.
         #     LDP configured;  SYNC enabled.
         #     LDP not configured; LDP-IGP Synchronization enabled.
-        p2 = re.compile(r'^LDP +(?P<configured>[\w\s]+); +(LDP\-IGP +Synchronization '
-                         r'+(?P<state>[\w\s]+))?(SYNC +(?P<sync_enabled>[\w\s]+))?.$')
+        p2 = regex_engine.compile(r'^LDP +(?P<configured>[\w\s]+); +(LDP\-IGP +Synchronization '
+                                   r'+(?P<state>[\w\s]+))?(SYNC +(?P<sync_enabled>[\w\s]+))?.$')
 
         #     Sync status: sync achieved; peer reachable.
         #     Sync status: sync not achieved; peer reachable.
         #     Sync status: sync not achieved; peer not reachable.
-        p3 = re.compile(r'^(Sync|SYNC) +status: +sync +(?P<sync_status>[\w\s]+); +peer +(?P<reachable>[\w\s]+).$')
+        p3 = regex_engine.compile(r'^(Sync|SYNC) +status: +sync +(?P<sync_status>[\w\s]+); +peer +(?P<reachable>[\w\s]+).$')
 
         #     Sync delay time: 0 seconds (0 seconds left)
-        p4 = re.compile(r'^Sync +delay +time: +(?P<delay_time>\d+) +seconds \((?P<left_time>\d+) +seconds +left\)$')
+        p4 = regex_engine.compile(r'^Sync +delay +time: +(?P<delay_time>\d+) +seconds \((?P<left_time>\d+) +seconds +left\)$')
 
         #     IGP holddown time: infinite.
         #     IGP holddown time: 1 milliseconds.
-        p5 = re.compile(r'^IGP +holddown +time: +(?P<holddown_time>[\w\s]+).?$')
+        p5 = regex_engine.compile(r'^IGP +holddown +time: +(?P<holddown_time>[\w\s]+).?$')
 
         #     Peer LDP Ident: 10.169.197.252:0
-        p6 = re.compile(r'^Peer +LDP +Ident: +(?P<peer_ldp_ident>\S+).?$')
+        p6 = regex_engine.compile(r'^Peer +LDP +Ident: +(?P<peer_ldp_ident>\S+).?$')
 
         #     IGP enabled: OSPF 65109
-        p7 = re.compile(r'^IGP +enabled: +(?P<igp_enabled>[\S\s]+)$')
+        p7 = regex_engine.compile(r'^IGP +enabled: +(?P<igp_enabled>[\S\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1730,54 +1731,54 @@ class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
         #                             0             Gi0/1/7    192.168.10.254
         # 25         16021      0-23.23.23.23/32-4 (10:30:130:1)   \
         #                              0             Et0/2      13.1.1.2
-        p1 = re.compile(r'^((?P<local_label>\d+|[Nn]one) +)?(?:\[(?P<info_tag>(?:T|M)+)\] +)?'
-                        r'(?P<outgoing_label>(\w+|(No|Pop) +Label)) +(?P<prefix_or_tunnel_id>[\S]+) '
-                        r'+\(?(?P<flexalgo_info>\d+:\d+:\d+:\d+)?\)?'
-                        r'(?P<bytes_label_switched>\d*)( +(?P<interface>\S+))?( +(?P<next_hop>[\w\.]+))?$')
+        p1 = regex_engine.compile(r'^((?P<local_label>\d+|[Nn]one) +)?(?:\[(?P<info_tag>(?:T|M)+)\] +)?'
+                                  r'(?P<outgoing_label>(\w+|(No|Pop) +Label)) +(?P<prefix_or_tunnel_id>[\S]+) '
+                                  r'+\(?(?P<flexalgo_info>\d+:\d+:\d+:\d+)?\)?'
+                                  r'(?P<bytes_label_switched>\d*)( +(?P<interface>\S+))?( +(?P<next_hop>[\w\.]+))?$')
 
         #       [T]  16130      10.25.40.40/32   0             Tu1        point2point
         # 22    [M]  Pop Label  192.168.0.1/32   0             Gi2        192.168.0.2
         # 22    [T]  Pop Label  1/1[TE-Bind]     0             Tu1        point2point
-        p2_1 = re.compile(r'^(?:(?P<local_label>\w+) +)?(?:\[(?P<info_tag>(?:T|M)+)\] +)?'
-                           r'(?P<outgoing_label>(?:(?:A|a)ggregate|Untagged|(?:No|Pop) '
-                           r'Label|(?:No|Pop) (?:T|t)ag|\d\/\w*|\d|\d\/)+)(?:\['
-                           r'(?P<t1>(T)+)\] +)? +(?P<prefix_or_tunnel_id>[\w\(\)\:|\S]+) '
-                           r'+\(?(?P<flexalgo_info>\d+:\d+:\d+:\d+)?\)?'
-                           r' +(?P<bytes_label_switched>\d*)(?: +(?P<interface>\S+))?(?: +'
-                           r'(?P<next_hop>[\w\.]+))?$')
+        p2_1 = regex_engine.compile(r'^(?:(?P<local_label>\w+) +)?(?:\[(?P<info_tag>(?:T|M)+)\] +)?'
+                                     r'(?P<outgoing_label>(?:(?:A|a)ggregate|Untagged|(?:No|Pop) '
+                                     r'Label|(?:No|Pop) (?:T|t)ag|\d\/\w*|\d|\d\/)+)(?:\['
+                                     r'(?P<t1>(T)+)\] +)? +(?P<prefix_or_tunnel_id>[\w\(\)\:|\S]+) '
+                                     r'+\(?(?P<flexalgo_info>\d+:\d+:\d+:\d+)?\)?'
+                                     r' +(?P<bytes_label_switched>\d*)(?: +(?P<interface>\S+))?(?: +'
+                                     r'(?P<next_hop>[\w\.]+))?$')
 
         # 22    [T]  Pop Label  1/1[TE-Bind]     0             Tu1        point2point
-        p2_2 = re.compile(r'^((?P<local_label>\w+) +)?(\[(?P<info_tag>(T)+)\] +)?'
-                          r'(?P<outgoing_label>((A|a)ggregate|(No|Pop) Label|(No|Pop) tag|\d|\d\/)+)?'
-                          r'(\[(?P<t1>(T)+)\] +)? +(?P<prefix_or_tunnel_id>[\w\.\[\]\-\s]+) '
-                          r'+\(?(?P<flexalgo_info>\d+:\d+:\d+:\d+)?\)?'
-                          r' +(?P<bytes_label_switched>\d+)( +(?P<interface>\S+))?( +(?P<next_hop>[\w\.]+))?$')
+        p2_2 = regex_engine.compile(r'^((?P<local_label>\w+) +)?(\[(?P<info_tag>(T)+)\] +)?'
+                                    r'(?P<outgoing_label>((A|a)ggregate|(No|Pop) Label|(No|Pop) tag|\d|\d\/)+)?'
+                                    r'(\[(?P<t1>(T)+)\] +)? +(?P<prefix_or_tunnel_id>[\w\.\[\]\-\s]+) '
+                                    r'+\(?(?P<flexalgo_info>\d+:\d+:\d+:\d+)?\)?'
+                                    r' +(?P<bytes_label_switched>\d+)( +(?P<interface>\S+))?( +(?P<next_hop>[\w\.]+))?$')
         
         #23    [T]  No Label   [mdt 3001:1 0][V]   \
         #                               200497062836  aggregate/vrf3001        
-        p2_3 = re.compile(r'^((?P<local_label>\d+|[Nn]one)\s+)?(?:\[(?P<info_tag>(?:T|M)+)\]\s+)?'
-                          r'(?P<outgoing_label>(\w+|(No|Pop) +Label))\s+\[(?P<prefix_type>\w+)\s+'
-                          r'(?P<prefix_or_tunnel_id>\S+)\s+\(*(?P<prefix_no>[a-zA-Z0-9]+)\)*\]\[V\]\s+'
-                          r'(?P<bytes_label_switched>\d*)(\s+(?P<interface>\S+))?(\s+(?P<next_hop>[\w\.]+))?$')
+        p2_3 = regex_engine.compile(r'^((?P<local_label>\d+|[Nn]one)\s+)?(?:\[(?P<info_tag>(?:T|M)+)\]\s+)?'
+                                    r'(?P<outgoing_label>(\w+|(No|Pop) +Label))\s+\[(?P<prefix_type>\w+)\s+'
+                                    r'(?P<prefix_or_tunnel_id>\S+)\s+\(*(?P<prefix_no>[a-zA-Z0-9]+)\)*\]\[V\]\s+'
+                                    r'(?P<bytes_label_switched>\d*)(\s+(?P<interface>\S+))?(\s+(?P<next_hop>[\w\.]+))?$')
 
         #         MAC/Encaps=18/18, MRU=1530, Label Stack{}
         #         MAC/Encaps=18/18, MRU=1530, Label Stack{}, via Ls0
         #         MAC/Encaps=14/26, MRU=1492, Label Stack{16052 16062 16063}, via Gi0/1/7
-        p3 = re.compile(r'^MAC\/Encaps=(?P<mac>\d+)\/(?P<encaps>\d+), +MRU=(?P<mru>[\d]+), '
-                         r'+Label +Stack{(?P<label_stack>.*)}(, via +(?P<via>\S+))?$')
+        p3 = regex_engine.compile(r'^MAC\/Encaps=(?P<mac>\d+)\/(?P<encaps>\d+), +MRU=(?P<mru>[\d]+), '
+                                   r'+Label +Stack{(?P<label_stack>.*)}(, via +(?P<via>\S+))?$')
 
         #         00002440156384B261CB1480810000330800
         #         AABBCC032800AABBCC0325018847 00010000
         #         0050568DA282BC16652F3A178847 03EB400003EBE00003EBF000
-        p4 = re.compile(r'^(?P<code>[0-9A-F]+)( +(?P<lstack>\w+))?$')
+        p4 = regex_engine.compile(r'^(?P<code>[0-9A-F]+)( +(?P<lstack>\w+))?$')
         #         VPN route: L3VPN-0051
-        p5 = re.compile(r'^VPN +route: +(?P<vpn_route>\S+)$')
+        p5 = regex_engine.compile(r'^VPN +route: +(?P<vpn_route>\S+)$')
         #         No output feature configured
-        p6 = re.compile(r'^No +output +feature +configured$')
+        p6 = regex_engine.compile(r'^No +output +feature +configured$')
         #     Per-destination load-sharing, slots: 0 2 4 6 8 10 12 14
-        p7 = re.compile(r'^(?P<method>\S+) +load\-sharing, +slots: +(?P<slots>[\d\s]+)$')
+        p7 = regex_engine.compile(r'^(?P<method>\S+) +load\-sharing, +slots: +(?P<slots>[\d\s]+)$')
         #      Broadcast
-        p8 = re.compile(r'^(B|b)roadcast$')
+        p8 = regex_engine.compile(r'^(B|b)roadcast$')
 
         partial_line = None
         local_label = "No Label"
@@ -2134,32 +2135,32 @@ class ShowMplsInterface(ShowMplsInterfaceSchema):
         result_dict = {}
 
         # vrf vpn1:
-        p0 = re.compile(r'^VRF +(?P<vrf>\S+):$')
+        p0 = regex_engine.compile(r'^VRF +(?P<vrf>\S+):$')
         # Interface              IP            Tunnel   BGP Static Operational
         # GigabitEthernet6       Yes (ldp)     No       No  No     Yes
         # Interface              IP            Tunnel   Operational
         # GigabitEthernet6/0     Yes (ldp)     No       Yes
-        p1 = re.compile(r'^(?P<interface>(?!Interface)[\S]+) +(?P<ip>((Y|y)es|(N|n)o)+)( +\((?P<session>\w+)\))? +(?P<tunnel>\w+)'
-                        r'( +(?P<bgp>\w+) +(?P<static>\w+))? +(?P<operational>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>(?!Interface)[\S]+) +(?P<ip>((Y|y)es|(N|n)o)+)( +\((?P<session>\w+)\))? +(?P<tunnel>\w+)'
+                                  r'( +(?P<bgp>\w+) +(?P<static>\w+))? +(?P<operational>\w+)$')
         # Interface GigabitEthernet0/0/0:
-        p2 = re.compile(r'^Interface +(?P<interface>\S+):$')
+        p2 = regex_engine.compile(r'^Interface +(?P<interface>\S+):$')
         #     Type Unknown
-        p3 = re.compile(r'^Type +(?P<type>\w+)$')
+        p3 = regex_engine.compile(r'^Type +(?P<type>\w+)$')
         #     IP labeling enabled (ldp) :
-        p4 = re.compile(r'^IP +labeling +enabled \(+(?P<session>\w+)\)( +\:)?$')
+        p4 = regex_engine.compile(r'^IP +labeling +enabled \(+(?P<session>\w+)\)( +\:)?$')
         #       Interface config
-        p5 = re.compile(r'^Interface +config$')
+        p5 = regex_engine.compile(r'^Interface +config$')
         #     LSP Tunnel labeling not enabled
-        p6 = re.compile(r'^LSP +Tunnel +labeling +((?P<lsp_tunnel_enabled>\w+) )?enabled$')
+        p6 = regex_engine.compile(r'^LSP +Tunnel +labeling +((?P<lsp_tunnel_enabled>\w+) )?enabled$')
         #     IP FRR labeling not enabled
-        p7 = re.compile(r'^IP +FRR +labeling +((?P<lp_frr_labeling>\w+) )?enabled$')
+        p7 = regex_engine.compile(r'^IP +FRR +labeling +((?P<lp_frr_labeling>\w+) )?enabled$')
         #     BGP labeling not enabled
-        p8 = re.compile(r'^BGP +labeling +((?P<bgp_labeling>\w+) )?enabled$')
+        p8 = regex_engine.compile(r'^BGP +labeling +((?P<bgp_labeling>\w+) )?enabled$')
         #     MPLS operational
         #     MPLS not operational
-        p9 = re.compile(r'^MPLS +(?P<mpls_status>[\w\s]+)$')
+        p9 = regex_engine.compile(r'^MPLS +(?P<mpls_status>[\w\s]+)$')
         #     MTU = 1552
-        p10 = re.compile(r'^MTU \= +(?P<mtu>\d+)$')
+        p10 = regex_engine.compile(r'^MTU \= +(?P<mtu>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2403,123 +2404,123 @@ class ShowMplsL2TransportDetail(ShowMplsL2TransportSchema):
 
         # Local interface: VFI PE1-VPLS-A up
         # Local interface: Fa2/1/1.2 up, line protocol up, Eth VLAN 2 up
-        p1 = re.compile(r'^Local +interface: +(?P<interface>[\w\d\/\.\s\-]+)'
-                         r' +(?P<state>\w+)(, line +protocol +(?P<line_protocol_status>\w+),'
-                         r' Eth +VLAN +(?P<number>\d+) +(?P<status>\w+))?$')
+        p1 = regex_engine.compile(r'^Local +interface: +(?P<interface>[\w\d\/\.\s\-]+)'
+                                   r' +(?P<state>\w+)(, line +protocol +(?P<line_protocol_status>\w+),'
+                                   r' Eth +VLAN +(?P<number>\d+) +(?P<status>\w+))?$')
 
         # Local interface: Se0/1/0:0 up, line protocol up, HDLC up
-        p1_1 = re.compile(r'^Local +interface: +(?P<interface>[\w\W]+) +(?P<state>\w+), +line +protocol +(?P<line_protocol_status>\w+), +(?P<protocol>\w+) +(?P<status>\w+)$')
+        p1_1 = regex_engine.compile(r'^Local +interface: +(?P<interface>[\w\W]+) +(?P<state>\w+), +line +protocol +(?P<line_protocol_status>\w+), +(?P<protocol>\w+) +(?P<status>\w+)$')
 
         #   Destination address: 10.2.2.2, VC ID: 1002, VC status: recovering
-        p2 = re.compile(r'^Destination +address: +(?P<address>[\d\.]+),'
-                         r' +VC +ID: +(?P<vc_id>\d+), +VC +status: +(?P<vc_status>\w+)$')
+        p2 = regex_engine.compile(r'^Destination +address: +(?P<address>[\d\.]+),'
+                                   r' +VC +ID: +(?P<vc_id>\d+), +VC +status: +(?P<vc_status>\w+)$')
 
         #   Preferred path: not configured
-        p3 = re.compile(r'^Preferred +path: +(?P<preferred_path>[a-zA-Z0-9 ]+)(?:\,\s+(?P<state>\S+)$)?$')
+        p3 = regex_engine.compile(r'^Preferred +path: +(?P<preferred_path>[a-zA-Z0-9 ]+)(?:\,\s+(?P<state>\S+)$)?$')
 
         #   Default path: active
-        p4 = re.compile(r'^Default +path: +(?P<default_path>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^Default +path: +(?P<default_path>[\S\s]+)$')
 
         #   Tunnel label: imp-null, next hop point2point
-        p5 = re.compile(r'^Tunnel +label: +(?P<tunnel_label>\S+),'
-                         r' +next +hop +(?P<next_hop>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^Tunnel +label: +(?P<tunnel_label>\S+),'
+                                   r' +next +hop +(?P<next_hop>[\S\s]+)$')
 
         #   Next hop: point2point
-        p5_1 = re.compile(r'^Next +hop: +(?P<next_hop>[\S\s]+)$')
+        p5_1 = regex_engine.compile(r'^Next +hop: +(?P<next_hop>[\S\s]+)$')
 
         #   Output interface: Se2/0/2, imposed label stack {16}
         #   Output interface: Et0/1, imposed label stack {24 21}
-        p6 = re.compile(r'^Output +interface: +(?P<output_interface>\S+),'
-                         r' +imposed +label +stack +(?P<imposed_label_stack>[^}]+})')
+        p6 = regex_engine.compile(r'^Output +interface: +(?P<output_interface>\S+),'
+                                   r' +imposed +label +stack +(?P<imposed_label_stack>[^}]+})')
 
         #   Create time: 1d00h, last status change time: 00:00:03
-        p7 = re.compile(r'^Create +time: +(?P<create_time>\S+),'
-                         r' +last +status +change +time: +(?P<last_status_change_time>\S+)$')
+        p7 = regex_engine.compile(r'^Create +time: +(?P<create_time>\S+),'
+                                   r' +last +status +change +time: +(?P<last_status_change_time>\S+)$')
 
         #   Signaling protocol: LDP, peer 10.2.2.2:0 down
         #   Signaling protocol: LDP, peer unknown
-        p8 = re.compile(r'^Signaling +protocol: +(?P<signaling_protocol>\S+)(,'
-                         r' +peer +(?P<peer_id>\S+)( +(?P<peer_state>\w+))?)?$')
+        p8 = regex_engine.compile(r'^Signaling +protocol: +(?P<signaling_protocol>\S+)(,'
+                                   r' +peer +(?P<peer_id>\S+)( +(?P<peer_state>\w+))?)?$')
 
         #   MPLS VC labels: local 21, remote 16
         #   MPLS VC labels: local 21, remote unassigned
-        p9 = re.compile(r'^MPLS +VC +labels: +local +(?P<mpls_local>\w+),'
-                         r' +remote +(?P<mpls_remote>\w+)$')
+        p9 = regex_engine.compile(r'^MPLS +VC +labels: +local +(?P<mpls_local>\w+),'
+                                   r' +remote +(?P<mpls_remote>\w+)$')
 
         #   Group ID: local 0, remote 0
         #   Group ID: local 0, remote unknown
-        p10 = re.compile(r'^Group +ID: +local +(?P<group_id_local>[\w\W]+),'
-                          r' +remote +(?P<group_id_remote>[\w\W]+)$')
+        p10 = regex_engine.compile(r'^Group +ID: +local +(?P<group_id_local>[\w\W]+),'
+                                    r' +remote +(?P<group_id_remote>[\w\W]+)$')
 
         #   MTU: local 1500, remote 1500
-        p11 = re.compile(r'^MTU: +local +(?P<mtu_local>\w+),'
-                          r' +remote +(?P<mtu_remote>\w+)$')
+        p11 = regex_engine.compile(r'^MTU: +local +(?P<mtu_local>\w+),'
+                                    r' +remote +(?P<mtu_remote>\w+)$')
 
         #   Remote interface description: "xconnect to PE2"
-        p12 = re.compile(r'^Remote +interface +description:'
-                          r' \"+(?P<remote_interface_description>[\S\s]+)\"$')
+        p12 = regex_engine.compile(r'^Remote +interface +description:'
+                                    r' \"+(?P<remote_interface_description>[\S\s]+)\"$')
 
         # Targeted Hello: 10.1.1.4(LDP Id) -> 10.1.1.1, LDP is UP
         # Targeted Hello: 10.1.1.1(LDP Id) -> 10.1.1.1
-        p12_1 = re.compile(r'^Targeted +Hello: +(?P<targeted_hello_ip>\S+)\([A-Z]+ +Id\)'
-                            r' +\-\> +(?P<id>[\d\.]+)(,'
-                            r' +[A-Z]+ +is +(?P<status>\S+))?$')
+        p12_1 = regex_engine.compile(r'^Targeted +Hello: +(?P<targeted_hello_ip>\S+)\([A-Z]+ +Id\)'
+                                      r' +\-\> +(?P<id>[\d\.]+)(,'
+                                      r' +[A-Z]+ +is +(?P<status>\S+))?$')
 
         # MAC Withdraw: sent 5, received 3
-        p12_2 = re.compile(r'^MAC Withdraw: +sent +(?P<sent>\d+),'
-                            r' +received +(?P<received>\d+)$')
+        p12_2 = regex_engine.compile(r'^MAC Withdraw: +sent +(?P<sent>\d+),'
+                                      r' +received +(?P<received>\d+)$')
 
         #   Sequencing: receive disabled, send disabled
-        p13 = re.compile(r'^Sequencing: +receive +(?P<receive>\S+),'
-                          r' +send +(?P<send>\S+)$')
+        p13 = regex_engine.compile(r'^Sequencing: +receive +(?P<receive>\S+),'
+                                    r' +send +(?P<send>\S+)$')
 
         #   VC statistics:
-        p14 = re.compile(r'^VC +statistics:$')
+        p14 = regex_engine.compile(r'^VC +statistics:$')
 
         #   packet totals: receive 20040, send 28879
-        p15 = re.compile(r'^(transit +)?packet +totals: +receive'
-                          r' +(?P<pkts_receive>\d+), +send +(?P<pkts_send>\d+)$')
+        p15 = regex_engine.compile(r'^(transit +)?packet +totals: +receive'
+                                    r' +(?P<pkts_receive>\d+), +send +(?P<pkts_send>\d+)$')
 
         #   byte totals:   receive 25073016, send 25992388
-        p16 = re.compile(r'^(transit +)?byte +totals: +receive'
-                          r' +(?P<byte_receive>\d+), +send +(?P<byte_send>\d+)$')
+        p16 = regex_engine.compile(r'^(transit +)?byte +totals: +receive'
+                                    r' +(?P<byte_receive>\d+), +send +(?P<byte_send>\d+)$')
 
         #   transit packet drops:  receive 0, seq error 0, send 0
-        p17 = re.compile(r'^(transit +)?packet +drops: +receive'
-                          r' +(?P<pkts_drop_receive>\d+), +send +(?P<pkts_drop_send>\d+)$')
+        p17 = regex_engine.compile(r'^(transit +)?packet +drops: +receive'
+                                    r' +(?P<pkts_drop_receive>\d+), +send +(?P<pkts_drop_send>\d+)$')
 
         #   packet drops:  receive 0, send 0
-        p17_1 = re.compile(r'^(transit +)?packet +drops: +receive +(?P<pkts_drop_receive>\d+), +seq +error +(?P<seq_error>\d+), +send +(?P<pkts_drop_send>\d+)')
+        p17_1 = regex_engine.compile(r'^(transit +)?packet +drops: +receive +(?P<pkts_drop_receive>\d+), +seq +error +(?P<seq_error>\d+), +send +(?P<pkts_drop_send>\d+)')
 
 
         #  Se5/0          FR DLCI 55         10.0.0.1        55         UP
-        p18 = re.compile(r'^\s*(?P<local_intf>[\w\W]{0,13}) +(?P<local_circuit>' \
+        p18 = regex_engine.compile(r'^\s*(?P<local_intf>[\w\W]{0,13}) +(?P<local_circuit>' \
             r'[\w\W]{0,26}) +(?P<dest_address>[\d\.]+) +(?P<vc_id>\d+) +' \
             r'(?P<vc_status>\S+)')
 
         # Last label FSM state change time: 00:00:19
-        p19 = re.compile(r'^\s*Last +label +FSM +state +change +time: +(?P<last_label_fsm_state_change_time>\d+:\d+:\d+)$')
+        p19 = regex_engine.compile(r'^\s*Last +label +FSM +state +change +time: +(?P<last_label_fsm_state_change_time>\d+:\d+:\d+)$')
 
         # Graceful restart: configured and enabled
-        p20 = re.compile(r'^\s*Graceful +restart: +(?P<graceful_restart>[\w\W]+)$')
+        p20 = regex_engine.compile(r'^\s*Graceful +restart: +(?P<graceful_restart>[\w\W]+)$')
 
         # Non stop routing: not configured and not enabled
-        p21 = re.compile(r'^\s*Non +stop +routing: +(?P<non_stop_routing>[\w\W]+)$')
+        p21 = regex_engine.compile(r'^\s*Non +stop +routing: +(?P<non_stop_routing>[\w\W]+)$')
 
         # Status TLV support (local/remote) : enabled/supported
-        p22 = re.compile(r'^\s*Status +TLV +support +\(local\/remote\) +: +(?P<status_tlv_support>[\w\W]+)$')
+        p22 = regex_engine.compile(r'^\s*Status +TLV +support +\(local\/remote\) +: +(?P<status_tlv_support>[\w\W]+)$')
 
         # LDP route watch : enabled
-        p23 = re.compile(r'^\s*LDP +route +watch +: +(?P<ldp_route_enabled>[\w\W]+)$')
+        p23 = regex_engine.compile(r'^\s*LDP +route +watch +: +(?P<ldp_route_enabled>[\w\W]+)$')
 
         # Last local PW i/f circ status rcvd: No fault
-        p24 = re.compile(r'^\s*Last +(?P<last_status_name>[\w\W]+) +status +(rcvd): (?P<received>[\w\W]+)$')
+        p24 = regex_engine.compile(r'^\s*Last +(?P<last_status_name>[\w\W]+) +status +(rcvd): (?P<received>[\w\W]+)$')
 
         # Last local AC circuit status sent: No fault
-        p25 = re.compile(r'^\s*Last +(?P<last_status_name>[\w\W]+) +status +(sent): (?P<sent>[\w\W]+)$')
+        p25 = regex_engine.compile(r'^\s*Last +(?P<last_status_name>[\w\W]+) +status +(sent): (?P<sent>[\w\W]+)$')
 
         # Label/status state machine : established, LruRru
-        p26 = re.compile(r'^\s*Label\/status +state +machine +: +(?P<label_state_machine>[\w\W]+)$')
+        p26 = regex_engine.compile(r'^\s*Label\/status +state +machine +: +(?P<label_state_machine>[\w\W]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2855,22 +2856,22 @@ class ShowMplsL2TransportDetail_VC_Statistics(ShowMplsL2TransportDetail_VC_Stati
             out = output
 
         #   VC statistics:
-        p1 = re.compile(r'^VC +statistics:$')
+        p1 = regex_engine.compile(r'^VC +statistics:$')
 
         #   packet totals: receive 20040, send 28879
-        p2 = re.compile(r'^(transit +)?packet +totals: +receive'
-                          r' +(?P<pkts_receive>\d+), +send +(?P<pkts_send>\d+)$')
+        p2 = regex_engine.compile(r'^(transit +)?packet +totals: +receive'
+                                    r' +(?P<pkts_receive>\d+), +send +(?P<pkts_send>\d+)$')
 
         #   byte totals:   receive 25073016, send 25992388
-        p3 = re.compile(r'^(transit +)?byte +totals: +receive'
-                          r' +(?P<byte_receive>\d+), +send +(?P<byte_send>\d+)$')
+        p3 = regex_engine.compile(r'^(transit +)?byte +totals: +receive'
+                                    r' +(?P<byte_receive>\d+), +send +(?P<byte_send>\d+)$')
 
         #   transit packet drops:  receive 0, seq error 0, send 0
-        p4 = re.compile(r'^(transit +)?packet +drops: +receive'
-                          r' +(?P<pkts_drop_receive>\d+), +send +(?P<pkts_drop_send>\d+)$')
+        p4 = regex_engine.compile(r'^(transit +)?packet +drops: +receive'
+                                    r' +(?P<pkts_drop_receive>\d+), +send +(?P<pkts_drop_send>\d+)$')
 
         #   packet drops:  receive 0, send 0
-        p4_1 = re.compile(r'^(transit +)?packet +drops: +receive +(?P<pkts_drop_receive>\d+), +seq +error +(?P<seq_error>\d+), +send +(?P<pkts_drop_send>\d+)')
+        p4_1 = regex_engine.compile(r'^(transit +)?packet +drops: +receive +(?P<pkts_drop_receive>\d+), +seq +error +(?P<seq_error>\d+), +send +(?P<pkts_drop_send>\d+)')
         final_dict={}
         for line in out.splitlines():
             line = line.strip()
@@ -2950,25 +2951,25 @@ class ShowMplsL2TransportDetail_Destination_address(ShowMplsL2TransportDetail_De
             out = output
 
         #   Destination address: 10.2.2.2, VC ID: 1002, VC status: recovering
-        p1 = re.compile(r'^Destination +address: +(?P<address>[\d\.]+),'
-                         r' +VC +ID: +(?P<vc_id>\d+), +VC +status: +(?P<vc_status>\w+)$')
+        p1 = regex_engine.compile(r'^Destination +address: +(?P<address>[\d\.]+),'
+                                   r' +VC +ID: +(?P<vc_id>\d+), +VC +status: +(?P<vc_status>\w+)$')
 
         #   Preferred path: not configured
-        p2 = re.compile(r'^Preferred +path: +(?P<preferred_path>[a-zA-Z0-9 ]+)(?:\,\s+(?P<state>\S+)$)?$')
+        p2 = regex_engine.compile(r'^Preferred +path: +(?P<preferred_path>[a-zA-Z0-9 ]+)(?:\,\s+(?P<state>\S+)$)?$')
 
         #   Default path: active
-        p3 = re.compile(r'^Default +path: +(?P<default_path>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Default +path: +(?P<default_path>[\S\s]+)$')
 
         #   Tunnel label: imp-null, next hop point2point
-        p4 = re.compile(r'^Tunnel +label: +(?P<tunnel_label>\S+),'
-                         r' +next +hop +(?P<next_hop>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^Tunnel +label: +(?P<tunnel_label>\S+),'
+                                   r' +next +hop +(?P<next_hop>[\S\s]+)$')
 
         #   Next hop: point2point
-        p4_1 = re.compile(r'^Next +hop: +(?P<next_hop>[\S\s]+)$')
+        p4_1 = regex_engine.compile(r'^Next +hop: +(?P<next_hop>[\S\s]+)$')
 
         #   Output interface: Se2/0/2, imposed label stack {16}
-        p5 = re.compile(r'^Output +interface: +(?P<output_interface>\S+),'
-                         r' +imposed +label +stack +(?P<imposed_label_stack>\{[0-9 ]+\})$')
+        p5 = regex_engine.compile(r'^Output +interface: +(?P<output_interface>\S+),'
+                                   r' +imposed +label +stack +(?P<imposed_label_stack>\{[0-9 ]+\})$')
 
         final_dict={}
         for line in out.splitlines():
@@ -3170,108 +3171,108 @@ class ShowMplsTrafficEngTunnelTunnelid(ShowMplsTrafficEngTunnelTunnelidSchema):
         ##Regex
         ###Name: R3_t100                             (Tunnel100) Destination: 2.2.2.2
         #Name: Entrega PEDR                        (Tunnel12831) Destination: 10.166.0.1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'\S+:\s+.*\((?P<Tunnel>\S+)\)\s+\S+\s+(?P<destination>\S+)??$')
 
         ###Eg:Status:,Config Parameters:,Active Path Option Parameters:
-        p2 = re.compile(r'^(?P<key>[a-zA-Z\- ]+)\:$')
+        p2 = regex_engine.compile(r'^(?P<key>[a-zA-Z\- ]+)\:$')
         ###Mentions the keys to be considered
-        p2_1 = re.compile(
+        p2_1 = regex_engine.compile(
             r'Status:|Config Parameters:|Active Path Option Parameters:|RSVP Signalling Info:|History:|Shortest Unconstrained Path Info:'
         )
 
         ###path option 1, type explicit R3_R4_R5_R2 (Basis for Setup, path weight 3)
         #path option 5, type explicit Path-BA-SM-PE-Pe (Basis for Setup, path weight 21)
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^[a-zA-Z ]+(?P<path_option>[0-9 ]+)\,\s+(?P<lockdown>\([A-Z]+\))?"
             r"\s*\S+\s(?P<type>[a-zA-Z_0-9 -]+)\s*(?:\(.*\,[a-z ]+(?P<path_weight>\S+)\))?$"
         )
-        p3_1 = re.compile(r"^Path-option attribute:\s(?P<path_attribute>\S+)$")
+        p3_1 = regex_engine.compile(r"^Path-option attribute:\s(?P<path_attribute>\S+)$")
 
         ###Src 3.3.3.3, Dst 2.2.2.2, Tun_Id 100, Tun_Instance 28
-        p4 = re.compile(r"^Src\s+([0-9\. ]+)\,")
+        p4 = regex_engine.compile(r"^Src\s+([0-9\. ]+)\,")
 
         ###State:
-        p5 = re.compile(r"^State:")
+        p5 = regex_engine.compile(r"^State:")
 
         ###Time since created: 14 minutes, 44 seconds
-        p6 = re.compile(r"^Time\s+")
+        p6 = regex_engine.compile(r"^Time\s+")
 
         ###Bandwidth: 500      kbps (Global)  Priority: 7  7   Affinity: 0x0/0xFFFF
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Bandwidth:\s+(?P<bandwidth>.*)\s+[a-zA-Z ]+\:\s+(?P<priority>[0-9 ]+)'
             r'\s+[a-zA-Z ]+\:\s+(?P<affinity>\S+)$')
 
         ### InLabel  :  -
         ###OutLabel : Port-channel30, 63
         ###Next Hop : 193.1.1.2
-        p8 = re.compile(r"^([a-zA-Z ]+)\s+\:\s+([a-zA-Z\-0-9\.\, ]+)$")
+        p8 = regex_engine.compile(r"^([a-zA-Z ]+)\s+\:\s+([a-zA-Z\-0-9\.\, ]+)$")
 
         ###AutoRoute: enabled  LockDown: disabled Loadshare: 500 [4000000] bw-based
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^AutoRoute\:\s+(?P<autoroute>\S+)\s+\S+\:\s+(?P<lockdown>\S+)"
             r"\s+\S+\:\s+(?P<loadshare>\d+)\s+\[(?P<max_load_share>\d+)\]\s+(?P<load_share_type>\S+)$"
         )
 
         ###Record   Route:
         ###Tspec:,Fspec:
-        p10 = re.compile(r"Record   Route:|[A-Za-z ]+spec\:\s+.*")
+        p10 = regex_engine.compile(r"Record   Route:|[A-Za-z ]+spec\:\s+.*")
 
         ###Fault-OAM: disabled, Wrap-Protection: disabled, Wrap-Capable: No
         ###Hop Limit: disabled
         ###Cost Limit: disabled
         ###BandwidthOverride: disabled  LockDown: enabled   Verbatim: disabled
         ###auto-bw: disabled
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'Hop|Cost|auto-bw:'
             r'|State:|Path Weight:|BandwidthOverride:|Fault-OAM:|AutoRoute destination:'
         )
 
         ###Explicit Route: 193.1.1.2 196.1.1.2 196.1.1.1 198.1.1.1
         #              198.1.1.2 2.2.2.2
-        p12 = re.compile(r"^\d+\.\d+\.\d+\.\d+")
+        p12 = regex_engine.compile(r"^\d+\.\d+\.\d+\.\d+")
 
         ###Admin: up         Oper: up     Path: valid       Signalling: connected
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"(Admin|Oper|Path|Signalling):([a-zA-Z\- ]+\s|[a-zA-Z\- ]+)")
 
         ##Path-invalidation timeout: 10000 msec (default), Action: Tear
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^Path-invalidation.+\:\s+(?P<path_invalidation_timeout>\d+)\s+"
             r"(?P<path_invalidation_timeout_unit>\w+)\s+\((?P<path_invalidation_timeout_type>\S+)\)\,"
             r"\s+\S+\s+(?P<action>\w+)$")
 
         ###Number of LSP IDs (Tun_Instances) used:
-        p15 = re.compile(r"Number of LSP IDs \(Tun_Instances\) used:\s+\d+")
+        p15 = regex_engine.compile(r"Number of LSP IDs \(Tun_Instances\) used:\s+\d+")
 
         ###Current LSP: [ID: 19]
-        p16 = re.compile(r"^Current LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
+        p16 = regex_engine.compile(r"^Current LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
 
         ###Uptime: 9 hours, 52 minutes
         ###Selection: reoptimization
-        p17 = re.compile(r"(Uptime|Selection):\s+([0-9a-zA-Z, ]+)")
+        p17 = regex_engine.compile(r"(Uptime|Selection):\s+([0-9a-zA-Z, ]+)")
 
         ##Metric Type: TE (default)
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^Metric Type:\s+(?P<metric_used>\S+)(?:\s+\((?P<metric_type>\S+)\))*"
         )
 
         ###Prior LSP: [ID: 19]
-        p19 = re.compile(r"^Prior LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
+        p19 = regex_engine.compile(r"^Prior LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
 
         ##ID: path option 3 [35]
         ##Removal Trigger: tunnel shutdown
         ##Last Error: CTRL:: Explicit path has unknown address, 194.1.1.1
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r"(ID|Removal Trigger|Last Error):\s+([0-9a-zA-Z,.: ]+)")
 
         ###Global: not set   Tunnel Specific: not set   Effective: min-fill (default)
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^Global:\s+(?P<global>[a-zA-Z ]+)\s+Tunnel Specific:\s+(?P<tunnel_specific>[a-zA-Z ]+)\s+Effective:\s+(?P<effective>\S+)\s*\(?(?P<effective_type>[a-zA-Z ]+)?\)?$"
         )
 
         ###Path Weight: 1 (TE)
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r"^Path Weight:\s+(?P<path_weight>(\d+))\s+\(?(?P<path_weight_type>[A-Za-z]+)?\)?$"
         )
 
@@ -3750,114 +3751,114 @@ class ShowMplsTrafficEngTunnel(ShowMplsTrafficEngTunnelSchema):
 
         ##Regex
         ###Name: R3_t100                             (Tunnel100) Destination: 2.2.2.2
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^\S+:\s+\S+\s+\((?P<Tunnel>\S+)\)\s+\S+\s+(?P<destination>\S+)')
 
         ###Eg:Status:,Config Parameters:,Active Path Option Parameters:
-        p2 = re.compile(r'^(?P<key>[a-zA-Z\-0-9/LSPs ]+)\:$')
+        p2 = regex_engine.compile(r'^(?P<key>[a-zA-Z\-0-9/LSPs ]+)\:$')
         ###Mentions the keys to be considered
-        p2_1 = re.compile(
+        p2_1 = regex_engine.compile(
             r'Status:|Config Parameters:|Active Path Option Parameters:'
             r'|RSVP Signalling Info:|History:|Shortest Unconstrained Path Info:'
         )
 
         ###path option 1, type explicit R3_R4_R5_R2 (Basis for Setup, path weight 3)
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^[a-zA-Z ]+(?P<path_option>[0-9 ]+)\,\s+(?P<lockdown>\([A-Z]+\))?"
             r"\s*\S+\s(?P<type>[a-zA-Z_0-9 ]+)\s*(?:\(.*\,[a-z ]+(?P<path_weight>\S+)\))?"
         )
-        p3_1 = re.compile(r"^Path-option attribute:\s(?P<path_attribute>\S+)$")
+        p3_1 = regex_engine.compile(r"^Path-option attribute:\s(?P<path_attribute>\S+)$")
 
         ###Src 3.3.3.3, Dst 2.2.2.2, Tun_Id 100, Tun_Instance 28
-        p4 = re.compile(r"^Src\s+([0-9\. ]+)\,")
+        p4 = regex_engine.compile(r"^Src\s+([0-9\. ]+)\,")
 
         ###Time since created: 14 minutes, 44 seconds
-        p5 = re.compile(r"^Time\s+")
+        p5 = regex_engine.compile(r"^Time\s+")
 
         ###Bandwidth: 500      kbps (Global)  Priority: 7  7   Affinity: 0x0/0xFFFF
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Bandwidth:\s+(?P<bandwidth>.*)\s+[a-zA-Z ]+\:\s+(?P<priority>[0-9 ]+)'
             r'\s+[a-zA-Z ]+\:\s+(?P<affinity>\S+)$')
 
         ### InLabel  :  -
         ###OutLabel : Port-channel30, 63
         ###Next Hop : 193.1.1.2
-        p7 = re.compile(r"^([a-zA-Z ]+)\s+\:\s+([a-zA-Z\/\-0-9\.\, ]+)$")
+        p7 = regex_engine.compile(r"^([a-zA-Z ]+)\s+\:\s+([a-zA-Z\/\-0-9\.\, ]+)$")
 
         ###AutoRoute: enabled  LockDown: disabled Loadshare: 500 [4000000] bw-based
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^AutoRoute\:\s+(?P<autoroute>\S+)\s+\S+\:\s+(?P<lockdown>\S+)"
             r"\s+\S+\:\s+(?P<loadshare>\d+)\s+\[(?P<max_load_share>\d+)\]\s+(?P<load_share_type>\S+)$"
         )
 
         ###Record   Route:
         ###Tspec:,Fspec:
-        p9 = re.compile(r"Record   Route:|[A-Za-z ]+spec\:\s+.*")
+        p9 = regex_engine.compile(r"Record   Route:|[A-Za-z ]+spec\:\s+.*")
 
         ###Fault-OAM: disabled, Wrap-Protection: disabled, Wrap-Capable: No
         ###Hop Limit: disabled
         ###Cost Limit: disabled
         ###BandwidthOverride: disabled  LockDown: enabled   Verbatim: disabled
         ###auto-bw: disabled
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'Hop|Cost|'
             r'auto-bw:|State:|Path Weight:|BandwidthOverride:|Fault-OAM:|AutoRoute destination:'
         )
 
         ###Explicit Route: 193.1.1.2 196.1.1.2 196.1.1.1 198.1.1.1
         #              198.1.1.2 2.2.2.2 --matches line
-        p11 = re.compile(r"^\d+\.\d+\.\d+\.\d+")
+        p11 = regex_engine.compile(r"^\d+\.\d+\.\d+\.\d+")
 
         ###State:
-        p12 = re.compile(r"^State:")
+        p12 = regex_engine.compile(r"^State:")
 
         ###Admin: up         Oper: up     Path: valid       Signalling: connected
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"(Admin|Oper|Path|Signalling):([a-zA-Z\- ]+\s|[a-zA-Z\- ]+)")
 
         ##Path-invalidation timeout: 10000 msec (default), Action: Tear
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^Path-invalidation.+\:\s+(?P<path_invalidation_timeout>\d+)\s+"
             r"(?P<path_invalidation_timeout_unit>\w+)\s+\((?P<path_invalidation_timeout_type>\S+)\)"
             r"\,\s+\S+\s+(?P<action>\w+)$")
 
         ####LSP Tunnel PE1_t100 is signalled, connection is up
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^LSP\sTunnel\s+[a-zA-Z0-9]+\_\w"
             r"(?P<tunnel_id>[0-9]+)\s+is\s+(?P<signalled>\S+)\,\s+connection\s+is\s+(?P<state>\S+)$"
         )
 
         ###Number of LSP IDs (Tun_Instances) used:
-        p16 = re.compile(r"Number of LSP IDs \(Tun_Instances\) used:\s+\d+")
+        p16 = regex_engine.compile(r"Number of LSP IDs \(Tun_Instances\) used:\s+\d+")
 
         ###Current LSP: [ID: 19]
-        p17 = re.compile(r"^Current LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
+        p17 = regex_engine.compile(r"^Current LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
 
         ###Uptime: 9 hours, 52 minutes
         ###Selection: reoptimization
-        p18 = re.compile(r"(Uptime|Selection):\s+([0-9a-zA-Z, ]+)")
+        p18 = regex_engine.compile(r"(Uptime|Selection):\s+([0-9a-zA-Z, ]+)")
 
         ##Metric Type: TE (default)
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"^Metric Type:\s+(?P<metric_used>\S+)(?:\s+\((?P<metric_type>\S+)\))*"
         )
 
         ###Prior LSP: [ID: 19]
-        p20 = re.compile(r"^Prior LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
+        p20 = regex_engine.compile(r"^Prior LSP:\s+\[ID:\s+(?P<id>\d+)\]$")
 
         ##ID: path option 3 [35]
         ##Removal Trigger: tunnel shutdown
         ##Last Error: CTRL:: Explicit path has unknown address, 194.1.1.1
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"(ID|Removal Trigger|Last Error):\s+([0-9a-zA-Z,.: ]+)")
 
         ###Global: not set   Tunnel Specific: not set   Effective: min-fill (default)
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r"^Global:\s+(?P<global>[a-zA-Z ]+)\s+Tunnel Specific:\s+(?P<tunnel_specific>[a-zA-Z ]+)\s+Effective:\s+(?P<effective>\S+)\s*\(?(?P<effective_type>[a-zA-Z ]+)?\)?$"
         )
 
         ###Path Weight: 1 (TE)
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r"^Path Weight:\s+(?P<path_weight>(\d+))\s+\(?(?P<path_weight_type>[A-Za-z]+)?\)?$"
         )
 
@@ -4287,19 +4288,19 @@ class ShowMplsTrafficEngTunnelBrief(ShowMplsTrafficEngTunnelBriefSchema):
         #Signalling Summary:
         #P2P TUNNELS/LSPs:
         #P2MP TUNNELS:
-        p1 = re.compile(r"^(?P<key>[a-zA-Z\/\d ]+)\:$")
+        p1 = regex_engine.compile(r"^(?P<key>[a-zA-Z\/\d ]+)\:$")
 
         #Matched lines for p2 regex, all the string with the format, key: value
         # Eg: LSP Tunnels Process:            running
-        p2 = re.compile(r'^(?P<key1>[\S ]+)\:\s+(?P<value1>[\S ]+)$')
+        p2 = regex_engine.compile(r'^(?P<key1>[\S ]+)\:\s+(?P<value1>[\S ]+)$')
 
         #Macallan-SVL_t100                2.2.2.2          -         Gi1/1/0/2 up/up
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'\S+\_(?P<tunnel_id>\S+)\s+(?P<destination_ip>\S+)\s+(?P<up_intf>\S+)\s+(?P<down_intf>\S+)\s+(?P<state>\S+)\/(?P<prot>\S+)'
         )
 
         #p2p    Disabled (0), id-range:62336-64335
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'\S+\s+(?P<p2p_state>\S+)\s+\S+\,\s+[a-z\- ]+\:(?P<min_range>\d+)\-(?P<max_range>\d+)'
         )
 
@@ -4383,7 +4384,7 @@ class ShowMplsLabelRange(ShowMplsLabelRangeSchema):
 
         ret_dict = {}
 
-        p1 = re.compile(r'^Downstream Generic label region: Min/Max label: (?P<min_label>\d+)\/(?P<max_label>\d+)$')
+        p1 = regex_engine.compile(r'^Downstream Generic label region: Min/Max label: (?P<min_label>\d+)\/(?P<max_label>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4431,13 +4432,13 @@ class ShowMplsTrafficEngAutoroute(ShowMplsTrafficEngAutorouteSchema):
             output = self.device.execute(self.cli_command)
 
         # MPLS TE autorouting enabled
-        p1 = re.compile(r"^MPLS\s+TE\s+autorouting\s+(?P<status>\w+)|:.+$")
+        p1 = regex_engine.compile(r"^MPLS\s+TE\s+autorouting\s+(?P<status>\w+)|:.+$")
         #   destination 2.2.2.2, area ospf 1  area 0, has 1 tunnels
-        p2 = re.compile(r"^destination\s+(?P<destination>(\d{1,4}\.){3}\d{1,4}),\s+(?P<protocol>.+),\s+has\s+(?P<number_of_tunnels>\d+)\s+tunnels$")
+        p2 = regex_engine.compile(r"^destination\s+(?P<destination>(\d{1,4}\.){3}\d{1,4}),\s+(?P<protocol>.+),\s+has\s+(?P<number_of_tunnels>\d+)\s+tunnels$")
         #     Tunnel100   (load balancing metric 4000000, nexthop 2.2.2.2)
-        p3 = re.compile(r"^(?P<tunnel_number>\S+)\s+\(load\s+balancing\s+metric\s+(?P<load_balance_metric>\d+),\s+nexthop\s+(?P<nexthop>(\d{1,3}\.){3}\d{1,3})\)$")
+        p3 = regex_engine.compile(r"^(?P<tunnel_number>\S+)\s+\(load\s+balancing\s+metric\s+(?P<load_balance_metric>\d+),\s+nexthop\s+(?P<nexthop>(\d{1,3}\.){3}\d{1,3})\)$")
         #                 (flags: Announce)
-        p3_1 = re.compile(r"^\(flags:\s+(?P<flags>\w+)\)$")
+        p3_1 = regex_engine.compile(r"^\(flags:\s+(?P<flags>\w+)\)$")
 
         ret_dict = {}
 
@@ -4501,7 +4502,7 @@ class ShowMplsForwardingTableSummary(ShowMplsForwardingTableSummarySchema):
             output = self.device.execute(self.cli_command)
 
         # 9 total labels
-        p1 = re.compile(r"^(?P<total_label>\d+)\s+total\s+labels$")
+        p1 = regex_engine.compile(r"^(?P<total_label>\d+)\s+total\s+labels$")
 
         ret_dict = {}
 
@@ -4558,40 +4559,40 @@ class ShowMplsTrafficEngLinkManagementAdvertisements(ShowMplsTrafficEngLinkManag
             output = self.device.execute(self.cli_command)
 
         # Link ID::  2 (Port-channel60)
-        p1 = re.compile(r"^Link\s+ID::\s+(?P<link_id>\d+)\s+\((?P<interface>\S+)\)$")
+        p1 = regex_engine.compile(r"^Link\s+ID::\s+(?P<link_id>\d+)\s+\((?P<interface>\S+)\)$")
         
         # Link Subnet Type:     Broadcast
-        p2 = re.compile(r"^Link\s+Subnet\s+Type:\s+(?P<link_subnet_type>\w+)$")
+        p2 = regex_engine.compile(r"^Link\s+Subnet\s+Type:\s+(?P<link_subnet_type>\w+)$")
         
         # Link IP Address:      195.1.1.1
-        p3 = re.compile(r"^Link\s+IP\s+Address:\s+(?P<link_ip_address>(\d{1,3}\.){3}\d{1,3})$")
+        p3 = regex_engine.compile(r"^Link\s+IP\s+Address:\s+(?P<link_ip_address>(\d{1,3}\.){3}\d{1,3})$")
         
         # Designated Router:    195.1.1.1
-        p4 = re.compile(r"^Designated\s+Router:\s+(?P<designated_router>(\d{1,3}\.){3}\d{1,3})$")
+        p4 = regex_engine.compile(r"^Designated\s+Router:\s+(?P<designated_router>(\d{1,3}\.){3}\d{1,3})$")
         
         # TE metric:            1
-        p5 = re.compile(r"^TE\s+metric:\s+(?P<te_metric>\d+)$")
+        p5 = regex_engine.compile(r"^TE\s+metric:\s+(?P<te_metric>\d+)$")
         
         # IGP metric:           1
-        p6 = re.compile(r"^IGP\s+metric:\s+(?P<igp_metric>\d+)$")
+        p6 = regex_engine.compile(r"^IGP\s+metric:\s+(?P<igp_metric>\d+)$")
         
         # SRLGs:                None
-        p7 = re.compile(r"^SRLGs:\s+(?P<srlgs>\w+)$")
+        p7 = regex_engine.compile(r"^SRLGs:\s+(?P<srlgs>\w+)$")
         
         # Physical Bandwidth:   80000000 kbits/sec
-        p8 = re.compile(r"^Physical\s+Bandwidth:\s+(?P<physical_bandwidth>\d+)\s+kbits\/sec$")
+        p8 = regex_engine.compile(r"^Physical\s+Bandwidth:\s+(?P<physical_bandwidth>\d+)\s+kbits\/sec$")
         
         # Res. Global BW:       50000 kbits/sec
-        p9 = re.compile(r"^Res\.\s+Global\s+BW:\s+(?P<reserved_global_bandwidth>\d+)\s+kbits\/sec$")
+        p9 = regex_engine.compile(r"^Res\.\s+Global\s+BW:\s+(?P<reserved_global_bandwidth>\d+)\s+kbits\/sec$")
         
         # Res. Sub BW:          0 kbits/sec
-        p10 = re.compile(r"^Res\.\s+Sub\s+BW:\s+(?P<reserved_sub_bandwidth>\d+)\s+kbits\/sec$")
+        p10 = regex_engine.compile(r"^Res\.\s+Sub\s+BW:\s+(?P<reserved_sub_bandwidth>\d+)\s+kbits\/sec$")
 
         # Attribute Flags:      0x00000000
-        p11 = re.compile(r"^Attribute Flags:\s+(?P<attribute_flags>\w+)$")
+        p11 = regex_engine.compile(r"^Attribute Flags:\s+(?P<attribute_flags>\w+)$")
 
         # Reservable Bandwidth[0]:        50000            0 kbits/sec
-        p12 = re.compile(r"^(?P<bandwidth_name>.+)\[(?P<count>\d+)\]:\s+(?P<global_pool>\d+)\s+(?P<sub_pool>\d+) kbits\/sec$")
+        p12 = regex_engine.compile(r"^(?P<bandwidth_name>.+)\[(?P<count>\d+)\]:\s+(?P<global_pool>\d+)\s+(?P<sub_pool>\d+) kbits\/sec$")
         
         ret_dict = {}
 
@@ -4733,36 +4734,36 @@ class ShowMplsTrafficEngTopology(ShowMplsTrafficEngTopologySchema):
             output = self.device.execute(self.cli_command)
         
             # My_System_id: 18.18.18.18 (ospf 1  area 0)
-            p1 = re.compile(r'^My_System_id: (?P<system_id>\S+) \(ospf (?P<ospf_process_id>\d+)  area (?P<area_id>\d+)\)$')
+            p1 = regex_engine.compile(r'^My_System_id: (?P<system_id>\S+) \(ospf (?P<ospf_process_id>\d+)  area (?P<area_id>\d+)\)$')
 
             # Signalling error holddown: 30 sec Global Link Generation 30
-            p2 = re.compile(r'^Signalling error holddown: (?P<signalling_error_holddown>\d+)'
-                            r' sec Global Link Generation (?P<global_link_generation>\d+)$')
+            p2 = regex_engine.compile(r'^Signalling error holddown: (?P<signalling_error_holddown>\d+)'
+                                      r' sec Global Link Generation (?P<global_link_generation>\d+)$')
             
             # IGP Id: 1.1.1.1, MPLS TE Id:1.1.1.1 Router Node  (ospf 1  area 0)
-            p3 = re.compile(r'^IGP Id: (?P<igp_id>\S+), MPLS TE Id:(?P<mpls_te_id>\S+)'
-                            r' (?P<node>\S+) Node(  \(ospf (?P<ospf_process_id>\d+)  area (?P<area_id>\d+)\))?$')
+            p3 = regex_engine.compile(r'^IGP Id: (?P<igp_id>\S+), MPLS TE Id:(?P<mpls_te_id>\S+)'
+                                      r' (?P<node>\S+) Node(  \(ospf (?P<ospf_process_id>\d+)  area (?P<area_id>\d+)\))?$')
 
             # link[0]: Broadcast, DR: 172.15.145.5, nbr_node_id:2, gen:25
-            p4 = re.compile(r'^link\[(?P<link>\d+)\]: (?P<type>.+), DR: (?P<dr>\S+),'
-                            r' nbr_node_id:(?P<nbr_node_id>\d+), gen:(?P<gen>\d+)$')
+            p4 = regex_engine.compile(r'^link\[(?P<link>\d+)\]: (?P<type>.+), DR: (?P<dr>\S+),'
+                                      r' nbr_node_id:(?P<nbr_node_id>\d+), gen:(?P<gen>\d+)$')
             
             # frag_id: 110, Intf Address: 172.15.145.14
-            p5 = re.compile(r'^frag_id: (?P<frag_id>\d+), Intf Address: (?P<interface_address>\S+)$')
+            p5 = regex_engine.compile(r'^frag_id: (?P<frag_id>\d+), Intf Address: (?P<interface_address>\S+)$')
             
             # TE metric: 1, IGP metric: 1, attribute flags: 0x0
-            p6 = re.compile(r'^TE metric: (?P<te_metric>\d+), IGP metric: (?P<igp_metric>\d+),'
-                            r' attribute flags: (?P<attribute_flags>\S+)$')
+            p6 = regex_engine.compile(r'^TE metric: (?P<te_metric>\d+), IGP metric: (?P<igp_metric>\d+),'
+                                      r' attribute flags: (?P<attribute_flags>\S+)$')
             
             # SRLGs: None 
-            p7 = re.compile(r'^SRLGs: (?P<srlgs>\S+)$')
+            p7 = regex_engine.compile(r'^SRLGs: (?P<srlgs>\S+)$')
 
             # physical_bw: 10000000 (kbps), max_reservable_bw_global: 7499999 (kbps)
-            p8 = re.compile(r'^physical_bw: (?P<physical_bw>\d+) \(kbps\), max_reservable_bw_global:'
-                            r' (?P<max_reservable_bw_global>\d+) \(kbps\)$')
+            p8 = regex_engine.compile(r'^physical_bw: (?P<physical_bw>\d+) \(kbps\), max_reservable_bw_global:'
+                                      r' (?P<max_reservable_bw_global>\d+) \(kbps\)$')
             
             # max_reservable_bw_sub: 0 (kbps)
-            p9 = re.compile(r'^max_reservable_bw_sub: (?P<max_reservable_bw_sub>\d+) \(kbps\)$')
+            p9 = regex_engine.compile(r'^max_reservable_bw_sub: (?P<max_reservable_bw_sub>\d+) \(kbps\)$')
 
             #                     Global Pool       Sub Pool
             # Total Allocated   Reservable        Reservable
@@ -4770,8 +4771,8 @@ class ShowMplsTrafficEngTopology(ShowMplsTrafficEngTopologySchema):
             # ---------------   -----------       ----------
             # bw[0]:            0          7499999                0
             # bw[1]:            0          7499999                0
-            p10 = re.compile(r'^bw\[(?P<bandwidth>\d+)\]:\s+(?P<total_allocated_bw>\d+)'
-                             r'\s+(?P<global_pool_reservable_bw>\d+)\s+(?P<sub_pool_reservable_bw>\d+)$')
+            p10 = regex_engine.compile(r'^bw\[(?P<bandwidth>\d+)\]:\s+(?P<total_allocated_bw>\d+)'
+                                       r'\s+(?P<global_pool_reservable_bw>\d+)\s+(?P<sub_pool_reservable_bw>\d+)$')
 
             ret_dict = {}
 
@@ -4928,60 +4929,60 @@ class ShowMplsTrafficEngFastRerouteDatabaseDetail \
             output = self.device.execute(self.cli_command)
 
         # FRR Database Summary:
-        p0 = re.compile(r'^FRR\s+Database\s+Summary\s*:$')
+        p0 = regex_engine.compile(r'^FRR\s+Database\s+Summary\s*:$')
 
         # Protected interfaces    : 2
-        p1 = re.compile(r'Protected\s+interfaces\s*:\s*'
-                        r'(?P<protected_intfs_num>\d+)$')
+        p1 = regex_engine.compile(r'Protected\s+interfaces\s*:\s*'
+                                  r'(?P<protected_intfs_num>\d+)$')
 
         # Protected LSPs/Sub-LSPs : 2
-        p2 = re.compile(r'Protected\s+LSPs\/Sub\-LSPs\s*:\s*'
-                        r'(?P<protected_lsps_num>\d+)$')
+        p2 = regex_engine.compile(r'Protected\s+LSPs\/Sub\-LSPs\s*:\s*'
+                                  r'(?P<protected_lsps_num>\d+)$')
 
         # Backup tunnels          : 3
-        p3 = re.compile(r'Backup\s+tunnels\s*:\s*'
-                        r'(?P<backup_tunnels_num>\d+)$')
+        p3 = regex_engine.compile(r'Backup\s+tunnels\s*:\s*'
+                                  r'(?P<backup_tunnels_num>\d+)$')
 
         # Active interfaces       : 0
-        p4 = re.compile(r'Active\s+interfaces\s*:\s*'
-                        r'(?P<active_intfs_num>\d+)$')
+        p4 = regex_engine.compile(r'Active\s+interfaces\s*:\s*'
+                                  r'(?P<active_intfs_num>\d+)$')
 
         # FRR Active tunnels      : 0
-        p5 = re.compile(r'FRR\s+Active\s+tunnels\s*:\s*'
-                        r'(?P<frr_active_tunnels_num>\d+)$')
+        p5 = regex_engine.compile(r'FRR\s+Active\s+tunnels\s*:\s*'
+                                  r'(?P<frr_active_tunnels_num>\d+)$')
 
         # P2P LSPs:
-        p6 = re.compile(r'^P2P\s+LSPs\s*:$')
+        p6 = regex_engine.compile(r'^P2P\s+LSPs\s*:$')
 
         # P2MP Sub-LSPs:
-        p7 = re.compile(r'^P2MP\s+Sub\-LSPs\s*:$')
+        p7 = regex_engine.compile(r'^P2MP\s+Sub\-LSPs\s*:$')
 
         # Tun ID: 14, LSP ID: 113, Source: 1.1.1.1
-        p8 = re.compile(r'Tun\s+ID\s*:\s*(?P<tun_id>\d+)\s*,\s*'
-                        r'LSP\s+ID\s*:\s*(?P<lsp_id>\d+)\s*,\s*'
-                        r'Source\s*:\s*(?P<src_ip>.+)$')
+        p8 = regex_engine.compile(r'Tun\s+ID\s*:\s*(?P<tun_id>\d+)\s*,\s*'
+                                  r'LSP\s+ID\s*:\s*(?P<lsp_id>\d+)\s*,\s*'
+                                  r'Source\s*:\s*(?P<src_ip>.+)$')
 
         # Destination: 4.4.4.4
-        p9 = re.compile(r'Destination\s*:\s*'
-                        r'(?P<dst_ip>.+)$')
+        p9 = regex_engine.compile(r'Destination\s*:\s*'
+                                  r'(?P<dst_ip>.+)$')
 
         # State        : ready
-        p10 = re.compile(r'State\s*:\s*'
-                         r'(?P<state>.+)$')
+        p10 = regex_engine.compile(r'State\s*:\s*'
+                                   r'(?P<state>.+)$')
 
         # InLabel      : 30
-        p11 = re.compile(r'InLabel\s*:\s*'
-                         r'(?P<in_label>.+)$')
+        p11 = regex_engine.compile(r'InLabel\s*:\s*'
+                                   r'(?P<in_label>.+)$')
 
         # OutLabel     : Twe0/0/16:19
-        p12 = re.compile(r'OutLabel\s*:\s*'
-                         r'(?P<out_intf>.+)\s*:\s*'
-                         r'(?P<out_label>.+)$')
+        p12 = regex_engine.compile(r'OutLabel\s*:\s*'
+                                   r'(?P<out_intf>.+)\s*:\s*'
+                                   r'(?P<out_label>.+)$')
 
         # FRR OutLabel : Tu231:19
-        p13 = re.compile(r'FRR\s+OutLabel\s*:\s*'
-                         r'(?P<frr_tunnel>.+)\s*:\s*'
-                         r'(?P<frr_out_label>.+)$')
+        p13 = regex_engine.compile(r'FRR\s+OutLabel\s*:\s*'
+                                   r'(?P<frr_tunnel>.+)\s*:\s*'
+                                   r'(?P<frr_out_label>.+)$')
 
         ret_dict = {}
 
@@ -5,13 +5,13 @@ IOSXE parsers for the following show commands:
     * show mgmt-traffic control ipv4
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowMgmtTrafficControlIpv4Schema(MetaParser):
     """Schema for show mgmt-traffic control ipv4"""
 
@@ -36,11 +36,11 @@ class ShowMgmtTrafficControlIpv4(ShowMgmtTrafficControlIpv4Schema):
         res_dict = {}
 
         # Interface List: HundredGigE1/0/3 HundredGigE1/0/4
-        p1 = re.compile(r'Interface +List: +(?P<interface_list>[\S+ ]+)')
+        p1 = regex_engine.compile(r'Interface +List: +(?P<interface_list>[\S+ ]+)')
         # Protocol List: telnet netconf
-        p2 = re.compile(r'Protocol +List: +(?P<protocol_list>[\w ]+)')
+        p2 = regex_engine.compile(r'Protocol +List: +(?P<protocol_list>[\w ]+)')
         # IP Address:  3.3.3.3
-        p3 = re.compile(r'IP +Address: +(?P<ip_address>\S+)')
+        p3 = regex_engine.compile(r'IP +Address: +(?P<ip_address>\S+)')
 
         for line in output.splitlines():
             line = line.strip()
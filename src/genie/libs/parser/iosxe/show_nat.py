@@ -27,13 +27,13 @@ IOSXE parser for the following show commands:
    * show nat66 nd
    * show nat66 prefix
 '''
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowNat64TranslationsSchema(MetaParser):
     """Schema for show nat64 translations"""
 
@@ -120,26 +120,26 @@ class ShowNat64Translations(ShowNat64TranslationsSchema):
 
         # Proto Original IPv4   Translated IPv4
         # icmp  1.1.1.2:0       [1001::101:102]:0
-        p1 = re.compile(r'^(?P<proto>\S+)\s+(?P<original_ipv4>\S+)\s+(?P<translated_ipv4>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<proto>\S+)\s+(?P<original_ipv4>\S+)\s+(?P<translated_ipv4>\S+)$')
         
         # Translated IPv6 Original IPv6
         # 5.5.5.5:0  [2009::2]:0
-        p2 = re.compile(r'^(?P<translated_ipv6>\S+)\s+(?P<original_ipv6>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<translated_ipv6>\S+)\s+(?P<original_ipv6>\S+)$')
         
         # created: 3 Jun 2022 16:23:45, last-used: 3 Jun 2022 16:23:45,
-        p3 = re.compile(r"^created+: +(?P<created>(.*))\, +last-used+: +(?P<last_used>(.*))$")
+        p3 = regex_engine.compile(r"^created+: +(?P<created>(.*))\, +last-used+: +(?P<last_used>(.*))$")
         
         # timeout: 300000, left 00:00:02,
-        p4 = re.compile(r"^timeout+: +(?P<timeout>\d+)\, +left +(?P<left>(.*))$")
+        p4 = regex_engine.compile(r"^timeout+: +(?P<timeout>\d+)\, +left +(?P<left>(.*))$")
         
         #use_count: 0, id: 44, parent-id(src/dst): 18/27
-        p5 = re.compile(r"^use_count+: +(?P<use_count>\d+)\, +id+: +(?P<id>\d+)\,"
-                        r" +parent-id\(src/dst\)+: +(?P<parent_id>\d+/\d+)$")
+        p5 = regex_engine.compile(r"^use_count+: +(?P<use_count>\d+)\, +id+: +(?P<id>\d+)\,"
+                                  r" +parent-id\(src/dst\)+: +(?P<parent_id>\d+/\d+)$")
         # use_count: 1, config-id: 18
-        p6 = re.compile(r"^use_count+: +(?P<use_count>\d+)\, +config-id+: +(?P<config_id>\d+)$")
+        p6 = regex_engine.compile(r"^use_count+: +(?P<use_count>\d+)\, +config-id+: +(?P<config_id>\d+)$")
         
         # Total number of translations: 3
-        p7 = re.compile(r'^Total number of translations+: +(?P<total_no_of_translations>\d+)$')
+        p7 = regex_engine.compile(r'^Total number of translations+: +(?P<total_no_of_translations>\d+)$')
       
         for line in output.splitlines(): 
             line = line.strip()   
@@ -229,7 +229,7 @@ class ShowNat64Timeouts(ShowNat64TimeoutsSchema):
         ret_dict = {}
         
         # Seconds CLI Cfg Uses 'All'
-        p1 = re.compile(r'^Seconds +CLI +(?P<cfg>(\w+)) +Uses \'All\'$')
+        p1 = regex_engine.compile(r'^Seconds +CLI +(?P<cfg>(\w+)) +Uses \'All\'$')
         
         # all flows 
         # udp
@@ -237,7 +237,7 @@ class ShowNat64Timeouts(ShowNat64TimeoutsSchema):
         # tcp-transient
         # icmp
         # bind
-        p2 = re.compile(r'^(?P<all_flows>(\D+))$')
+        p2 = regex_engine.compile(r'^(?P<all_flows>(\D+))$')
         
         # 86400 FALSE FALSE
         # 300 FALSE TRUE
@@ -245,7 +245,7 @@ class ShowNat64Timeouts(ShowNat64TimeoutsSchema):
         # 240 FALSE FALSE
         # 60 FALSE TRUE
         # 3600 FALSE TRUE
-        p3 = re.compile(r'(?P<seconds>(\d+)) +(?P<cli_cfg>(\w+)) +(?P<uses_all>(\w+))')
+        p3 = regex_engine.compile(r'(?P<seconds>(\d+)) +(?P<cli_cfg>(\w+)) +(?P<uses_all>(\w+))')
         
         for line in output.splitlines():
             line = line.strip()
@@ -406,64 +406,64 @@ class ShowNat64Statistics(ShowNat64StatisticsSchema):
         state_dict = {}
         
         # Number of NAT64 enabled interfaces: 4
-        p1 = re.compile(r'^Number of NAT64 enabled interfaces\: +(?P<nat64_enabled_interfaces>(\d+))')
+        p1 = regex_engine.compile(r'^Number of NAT64 enabled interfaces\: +(?P<nat64_enabled_interfaces>(\d+))')
         
         # Packets translated (IPv4 -> IPv6): 5
-        p2 = re.compile(r'^Packets translated \(IPv4 \-\> IPv6\)\: +(?P<v4_to_v6>(\d+)$)')
+        p2 = regex_engine.compile(r'^Packets translated \(IPv4 \-\> IPv6\)\: +(?P<v4_to_v6>(\d+)$)')
         
         # Packets translated (IPv6 -> IPv4): 131495
-        p3 = re.compile(r'^Packets translated \(IPv6 \-\> IPv4\)\: +(?P<v6_to_v4>(\d+)$)')
+        p3 = regex_engine.compile(r'^Packets translated \(IPv6 \-\> IPv4\)\: +(?P<v6_to_v4>(\d+)$)')
         
         # Prefix: 64:FF9B::/96
-        p4 = re.compile(r'^Prefix\: +(?P<prefix>(\S+))$')
+        p4 = regex_engine.compile(r'^Prefix\: +(?P<prefix>(\S+))$')
         
         # Prefix: 2002:1::/96 - vrf nat64_vrf
-        p44 = re.compile(r'^Prefix\: +(?P<prefix>(\S+)) \- +vrf+ (?P<prefix_vrf_name>\S+)$')
+        p44 = regex_engine.compile(r'^Prefix\: +(?P<prefix>(\S+)) \- +vrf+ (?P<prefix_vrf_name>\S+)$')
         
         # Packets dropped: 0
-        p5 = re.compile(r'^Packets +dropped+\: +(?P<packets_dropped>\d+)')
+        p5 = regex_engine.compile(r'^Packets +dropped+\: +(?P<packets_dropped>\d+)')
         
         # TenGigabitEthernet5/0/12 (IPv4 not configured, IPv6 not configured):
-        p6 = re.compile(r'^(?P<interface>(\S+)) +\(IPv4 (?P<ipv4>(\D+)), +IPv6 (?P<ipv6>(\D+))+\)\:')
+        p6 = regex_engine.compile(r'^(?P<interface>(\S+)) +\(IPv4 (?P<ipv4>(\D+)), +IPv6 (?P<ipv6>(\D+))+\)\:')
         
         # Stateful Prefix: 2010:1::/96
-        p7 = re.compile(r'^Stateful Prefix\: +(?P<stateful_prefix>(\S+))')
+        p7 = regex_engine.compile(r'^Stateful Prefix\: +(?P<stateful_prefix>(\S+))')
         
         # Total active translations: 2(1 static, 1 dynamic,1 extended)
         # Total active translations: 12(10 static, 1 dynamic,1 extended)
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Total active translations+\: +(?P<total_translations>(\d+))\(+(?P<static>(\d+)) +static, +(?P<dynamic>(\d+)) +dynamic,+(?P<extended>(\d+)) +extended')
         
         # Active sessions: 0
-        p9 = re.compile(r'^Active sessions\: +(?P<active_sessions>(\d+))')
+        p9 = regex_engine.compile(r'^Active sessions\: +(?P<active_sessions>(\d+))')
         
         # Number of expired entries: 0
-        p10 = re.compile(r'^Number of expired entries\: +(?P<expired_sessions>(\d+))')
+        p10 = regex_engine.compile(r'^Number of expired entries\: +(?P<expired_sessions>(\d+))')
         
         # Hits: 0 Misses: 0
-        p11 = re.compile(r'^Hits+\: +(?P<hit_pkts>(\d+))+\s+Misses+\: +(?P<miss_pkts>(\d+))')
+        p11 = regex_engine.compile(r'^Hits+\: +(?P<hit_pkts>(\d+))+\s+Misses+\: +(?P<miss_pkts>(\d+))')
         
         # access-list nat64_acl1 pool nat64_v4_pool refcount 0
-        p12 = re.compile(r'access-list +(?P<access_list>(\S+)) +pool +(?P<nat64_pool>(\S+)) +refcount +(?P<refcount>(\d+))')
+        p12 = regex_engine.compile(r'access-list +(?P<access_list>(\S+)) +pool +(?P<nat64_pool>(\S+)) +refcount +(?P<refcount>(\d+))')
         
         # pool nat64_v4_pool:
-        p13 = re.compile(r'pool +(?P<nat64_pool_name>(\S+))\:')
+        p13 = regex_engine.compile(r'pool +(?P<nat64_pool_name>(\S+))\:')
         
         # start 10.0.0.2 end 10.0.0.255
-        p14 = re.compile(r'^start (?P<start_ip>([0-9]{1,3}.){3}([0-9]{1,3})) +end +(?P<end_ip>([0-9]{1,3}.){3}([0-9]{1,3}))')
+        p14 = regex_engine.compile(r'^start (?P<start_ip>([0-9]{1,3}.){3}([0-9]{1,3})) +end +(?P<end_ip>([0-9]{1,3}.){3}([0-9]{1,3}))')
         
         # total addresses 254, allocated 0 (0%)
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r'^total addresses +(?P<total_address>(\d+)), +allocated +(?P<allocated>(\d+)) +\(+(?P<percent>(\d+))+\%\)')
         
         # address exhaustion packet count 0
-        p16 = re.compile(r'address exhaustion packet count +(?P<packet_count>(\d+))')
+        p16 = regex_engine.compile(r'address exhaustion packet count +(?P<packet_count>(\d+))')
         
         # CEF Translated: 0 CEF Punted packets: 0
-        p17 = re.compile(r'^CEF +Translated+\: +(?P<cef_translated_pkts>\d+) +CEF Punted packets+\: +(?P<cef_punted_pkts>\d+)')
+        p17 = regex_engine.compile(r'^CEF +Translated+\: +(?P<cef_translated_pkts>\d+) +CEF Punted packets+\: +(?P<cef_punted_pkts>\d+)')
         
         # Dropped: 3461156
-        p18 = re.compile(r'^Dropped+\: +(?P<dropped_pkts>\d+)')
+        p18 = regex_engine.compile(r'^Dropped+\: +(?P<dropped_pkts>\d+)')
         
         for line in output.splitlines():
             line = line.strip()
@@ -684,11 +684,11 @@ class ShowNat64MappingsStaticAddresses(ShowNat64MappingsStaticAddressesSchema):
         ret_dict = {}
     
         # 5.5.5.5
-        p1 = re.compile(r'(?P<address>([[0-9]+[:|.]+.*))')
+        p1 = regex_engine.compile(r'(?P<address>([[0-9]+[:|.]+.*))')
     
         # v6v4      1
         # v6v4      16
-        p2 = re.compile(r'(?P<direction>(\S+)) +(?P<ref_count>(\d+))')
+        p2 = regex_engine.compile(r'(?P<direction>(\S+)) +(?P<ref_count>(\d+))')
         for line in output.splitlines():
             line = line.strip()
     
@@ -766,22 +766,22 @@ class ShowNat64MappingsDynamic(ShowNat64MappingsDynamicSchema):
         pool_dict = {}
         
         # Dynamic mappings configured: 2
-        p1 = re.compile(r'^Dynamic mappings configured\: +(?P<no_of_mappings>(\d+))')
+        p1 = regex_engine.compile(r'^Dynamic mappings configured\: +(?P<no_of_mappings>(\d+))')
         
         # Direction ID      ACL
         # v6v4      1       acl_1                            NULL
         # v6v4      27       acl_1                            NULL
-        p2 = re.compile(r'(?P<direction>(\w+)) +(?P<dir_id>(\d+)) +(?P<acl>(\w+)) +(?P<null>(\w+))')
+        p2 = regex_engine.compile(r'(?P<direction>(\w+)) +(?P<dir_id>(\d+)) +(?P<acl>(\w+)) +(?P<null>(\w+))')
         
         # Pool                             Flags
         # n64_pool                         0x00000000 0.0.0.0 (none)
-        p3 = re.compile(r'(?P<pool>(\S+)) .* +(?P<flags>([0-9x0-9]+ .* +\(none\)))')
+        p3 = regex_engine.compile(r'(?P<pool>(\S+)) .* +(?P<flags>([0-9x0-9]+ .* +\(none\)))')
         
         # RG ID Mapping ID
         # 0     0
         # RG ID Mapping ID
         # 11     12
-        p4 = re.compile(r'(?P<rg_id>(\d+)) +(?P<mapping_id>(\d+))')
+        p4 = regex_engine.compile(r'(?P<rg_id>(\d+)) +(?P<mapping_id>(\d+))')
         
         for line in output.splitlines():
             line = line.strip()
@@ -864,16 +864,16 @@ class ShowNat64StatisticsPrefixStateful(ShowNat64StatisticsPrefixStatefulSchema)
         ret_dict = {}
         
         # Stateful Prefix: 1001::/96
-        p1 = re.compile(r'^Stateful Prefix\: +(?P<stateful_prefix>(\S+))')
+        p1 = regex_engine.compile(r'^Stateful Prefix\: +(?P<stateful_prefix>(\S+))')
         
         # Packets translated (IPv4 -> IPv6): 0
-        p2 = re.compile(r'^Packets translated \(IPv4 \-\> IPv6\)\: +(?P<v4_to_v6>(\d+)$)')
+        p2 = regex_engine.compile(r'^Packets translated \(IPv4 \-\> IPv6\)\: +(?P<v4_to_v6>(\d+)$)')
         
         # Packets translated (IPv6 -> IPv4): 0
-        p3 = re.compile(r'^Packets translated \(IPv6 \-\> IPv4\)\: +(?P<v6_to_v4>(\d+)$)')
+        p3 = regex_engine.compile(r'^Packets translated \(IPv6 \-\> IPv4\)\: +(?P<v6_to_v4>(\d+)$)')
 
         # Packets dropped: 0
-        p4 = re.compile(r'^Packets +dropped+\: +(?P<packets_dropped>\d+)')
+        p4 = regex_engine.compile(r'^Packets +dropped+\: +(?P<packets_dropped>\d+)')
         
         for line in output.splitlines():
             line = line.strip()
@@ -947,25 +947,25 @@ class ShowNat64MappingsStatic(ShowNat64MappingsStaticSchema):
         index_dict = {}
         
         # Static mappings configured: 1
-        p1 = re.compile(r'^Static mappings configured\: +(?P<no_of_mappings>(\d+))')
+        p1 = regex_engine.compile(r'^Static mappings configured\: +(?P<no_of_mappings>(\d+))')
         
         # Direction Protocol Address (Port, if any)
         # v6v4 --- 2009::2
-        p2 = re.compile(r'(?P<direction>(\w+)) +(?P<protocol>(\S+)) +(?P<address>([0-9:].*).*)')
+        p2 = regex_engine.compile(r'(?P<direction>(\w+)) +(?P<protocol>(\S+)) +(?P<address>([0-9:].*).*)')
         
         # Non-key Address (Port, if any)
         # 1.1.1.2 (100)
-        p3 = re.compile(r'(?P<non_key_address>(\d.+ .*\)))')
+        p3 = regex_engine.compile(r'(?P<non_key_address>(\d.+ .*\)))')
         
         # Non-key Address (Port, if any)
         # 2.2.2.2
-        p4 = re.compile(r'(?P<non_key_address>([0-9]{1,3}.){3}([0-9]{1,3}))')
+        p4 = regex_engine.compile(r'(?P<non_key_address>([0-9]{1,3}.){3}([0-9]{1,3}))')
         
         # RG ID Mapping ID
         # 0     0          FALSE
         # RG ID Mapping ID
         # 11     12          FALSE
-        p5 = re.compile(r'(?P<rg_id>(\d+)) +(?P<mapping_id>(\d+)) +(?P<is_valid>(\w+))')
+        p5 = regex_engine.compile(r'(?P<rg_id>(\d+)) +(?P<mapping_id>(\d+)) +(?P<is_valid>(\w+))')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1101,25 +1101,25 @@ class ShowNat64Pools(ShowNat64PoolsSchema):
             index_dict = {}
             
             # Pools configured: 2
-            p0 = re.compile(r'^Pools configured+: +(?P<pools_configured>\d+)$')
+            p0 = regex_engine.compile(r'^Pools configured+: +(?P<pools_configured>\d+)$')
             
             # Protocol HSL ID     Name
             # IPv4     1          n64_pool
-            p1 = re.compile(r'^(?P<protocol>\S+) +(?P<hsl_id>\d+) +(?P<name>\S+)$')
+            p1 = regex_engine.compile(r'^(?P<protocol>\S+) +(?P<hsl_id>\d+) +(?P<name>\S+)$')
             
             # Is Single        Range
             # TRUE            (135.0.0.1 - 135.0.0.100)
-            p2 = re.compile(r'^(?P<is_single>\w+) +(?P<range>\(+[\d.\s -]+\))$')
+            p2 = regex_engine.compile(r'^(?P<is_single>\w+) +(?P<range>\(+[\d.\s -]+\))$')
             
             # Ranges
             # 135.0.0.1 - 135.0.0.100
-            p3 = re.compile(r'^(?P<ranges>[\d.\s -]+)$')
+            p3 = regex_engine.compile(r'^(?P<ranges>[\d.\s -]+)$')
             
             # Static Routes for Range: 9
-            p4 = re.compile(r'^Static Routes for Range+: +(?P<static_routes_range>\d+)$')
+            p4 = regex_engine.compile(r'^Static Routes for Range+: +(?P<static_routes_range>\d+)$')
             
             # Static Routes 135.0.0.1/32
-            p5 = re.compile(r'^(?P<static_routes>[\d./]+)$')
+            p5 = regex_engine.compile(r'^(?P<static_routes>[\d./]+)$')
             
             for line in output.splitlines():
                 line = line.strip()
@@ -1214,23 +1214,23 @@ class ShowNat64PrefixStatefulGlobal(ShowNat64PrefixStatefulGlobalSchema):
         index =  1
 
         # Global Stateful Prefix: is valid, 1001::/96
-        p1 = re.compile(r'^Global Stateful Prefix+: is +(?P<validation>(\w+))\, +(?P<prefix>(.*))$')
+        p1 = regex_engine.compile(r'^Global Stateful Prefix+: is +(?P<validation>(\w+))\, +(?P<prefix>(.*))$')
         
         # Global Stateful Prefix: is not valid
-        p2 = re.compile(r'^Global Stateful Prefix+: is +(?P<validation>[\w ]+)$')
+        p2 = regex_engine.compile(r'^Global Stateful Prefix+: is +(?P<validation>[\w ]+)$')
         
         # 2002:1::/96 - vrf nat64_vrf
-        p22 = re.compile(r'(?P<prefix>[\w\:\.]+[\/]+[\d]+) \- +vrf+ (?P<prefix_vrf_name>\S+)$')
+        p22 = regex_engine.compile(r'(?P<prefix>[\w\:\.]+[\/]+[\d]+) \- +vrf+ (?P<prefix_vrf_name>\S+)$')
         
         # IFs Using Global Prefix
         # Twe1/0/3
         # Twe1/0/19
         # Twe2/0/9
-        p3 = re.compile(r'^(?P<interface>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<interface>\S+)$')
         
         # IFs Using Global Prefix
         # Te2/2/0/19 - vrf nat64_vrf
-        p33 = re.compile(r'^(?P<interface>\S+) \- +vrf+ (?P<int_vrf_name>\S+)$')
+        p33 = regex_engine.compile(r'^(?P<interface>\S+) \- +vrf+ (?P<int_vrf_name>\S+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1326,11 +1326,11 @@ class ShowNat64PrefixStatefulInterfaces(ShowNat64PrefixStatefulInterfacesSchema)
         
         # Interface
         # TwentyFiveGigE1/0/19
-        p1 = re.compile(r'^(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+)$')
         
         #  NAT64 Enabled Global Prefix
         #  TRUE          TRUE   1001::/96
-        p2 = re.compile(r'^(?P<nat64_enabled>\S+) + (?P<global>\S+) + (?P<prefix>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<nat64_enabled>\S+) + (?P<global>\S+) + (?P<prefix>\S+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1403,16 +1403,16 @@ class ShowNat64PrefixStatefulStaticRoutes(ShowNat64PrefixStatefulStaticRoutesSch
         
         # NAT64 Prefix
         # 1001::/96
-        p1 = re.compile(r'^(?P<nat64_prefix>[\w\:\.]+[\/]+[\d]+)$')
+        p1 = regex_engine.compile(r'^(?P<nat64_prefix>[\w\:\.]+[\/]+[\d]+)$')
         
         # NAT64 Prefix
         # VRF
         # 2002:1::/96 vrf vrf1
-        p11 = re.compile(r'^(?P<nat64_prefix>[\w\:\.]+[\/]+[\d]+)+ vrf +(?P<vrf_name>\S+)$')
+        p11 = regex_engine.compile(r'^(?P<nat64_prefix>[\w\:\.]+[\/]+[\d]+)+ vrf +(?P<vrf_name>\S+)$')
 
         # Static Route Ref-Count
         # 1
-        p2 = re.compile(r'^(?P<static_route_ref_count>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<static_route_ref_count>\d+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1481,7 +1481,7 @@ class ShowIpv6NdRaPrefix(ShowIpv6NdRaPrefixSchema):
         index = 1
         
         # 5000::/32 100  GigabitEthernet29
-        p1 = re.compile(r'^(?P<prefix>[\w\:\.]+)\s+(?P<prefix_length>[\/]+[\d]+)\s+(?P<time>\d+)\s+(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<prefix>[\w\:\.]+)\s+(?P<prefix_length>[\/]+[\d]+)\s+(?P<time>\d+)\s+(?P<interface>\S+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1529,7 +1529,7 @@ class ShowIpNatRedundancy(ShowIpNatRedundancySchema):
         ip_dict = {}
         
         # 201.201.1.200 hsrp_lan_201         0         1
-        p1 = re.compile(r'^\s*(?P<ip>[\>\d\.]+)\s+(?P<name>\w+)\s+(?P<id>\d+)\s+(?P<use_count>\d+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<ip>[\>\d\.]+)\s+(?P<name>\w+)\s+(?P<id>\d+)\s+(?P<use_count>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1575,16 +1575,16 @@ class ShowNat66Statistics(ShowNat66StatisticsSchema):
         ret_dict = dict()
         global_stats_dict = dict()
         # NAT66 Statistics
-        p0 = re.compile(r'^NAT66 +Statistics$')
+        p0 = regex_engine.compile(r'^NAT66 +Statistics$')
         # Global Stats: enable count 4 or Global Stats:
-        p1 = re.compile(r'^Global +Stats: +enable +count +(?P<enable_count>\d+)$')
+        p1 = regex_engine.compile(r'^Global +Stats: +enable +count +(?P<enable_count>\d+)$')
         # Packets translated (In -> Out)
         #     : 25
         # Packets translated (Out -> In)
         #     : 20
-        p2_1 = re.compile(r'^Packets +translated +\(In +\-\> +Out\)$')
-        p2_2 = re.compile(r'^Packets +translated +\(Out +\-\> +In\)$')
-        p2_3 = re.compile(r'^: +(?P<nat66_pkt_count>\d+)$')
+        p2_1 = regex_engine.compile(r'^Packets +translated +\(In +\-\> +Out\)$')
+        p2_2 = regex_engine.compile(r'^Packets +translated +\(Out +\-\> +In\)$')
+        p2_3 = regex_engine.compile(r'^: +(?P<nat66_pkt_count>\d+)$')
         for line in output.splitlines():
             line = line.strip()
             # NAT66 Statistics
@@ -1653,13 +1653,13 @@ class ShowNat66Prefix(ShowNat66PrefixSchema):
         ret_dict = dict()
         nat66_prefixes_dict = dict()
         # Prefixes configured: 3
-        p1 = re.compile(r'^Prefixes +configured: +(?P<prefixes_configured>\d+)$')
+        p1 = regex_engine.compile(r'^Prefixes +configured: +(?P<prefixes_configured>\d+)$')
         # RA Prefixes configured: 0
-        p2 = re.compile(r'^RA +Prefixes +configured: +(?P<ra_prefixes_configured>\d+)$')
+        p2 = regex_engine.compile(r'^RA +Prefixes +configured: +(?P<ra_prefixes_configured>\d+)$')
         # Id: 1          Inside FD62:1B53:AFFB:1201::/112 Outside 2001:4888:AFFB:1201::/112
-        p3_1 = re.compile(r'^Id: +(?P<id>\d+) +Inside +(?P<inside>[\w\:\/]+) +Outside +(?P<outside>[\w\:\/]+)$')
+        p3_1 = regex_engine.compile(r'^Id: +(?P<id>\d+) +Inside +(?P<inside>[\w\:\/]+) +Outside +(?P<outside>[\w\:\/]+)$')
         # Id: 1          Inside FD62:1B53:AFFB:1201::/112 Outside 2001:4888:AFFB:1201::/112 vrf MPN1201
-        p3_2 = re.compile(r'^Id: +(?P<id>\d+) +Inside +(?P<inside>[\w\:\/]+) +Outside +(?P<outside>[\w\:\/]+)( +vrf +(?P<vrf>\S+))?$')
+        p3_2 = regex_engine.compile(r'^Id: +(?P<id>\d+) +Inside +(?P<inside>[\w\:\/]+) +Outside +(?P<outside>[\w\:\/]+)( +vrf +(?P<vrf>\S+))?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1724,12 +1724,12 @@ class ShowNat66Nd(ShowNat66NdSchema):
         disable_flag = False
         # ND Prefix DB:
         # 2001:4888:AFFB:1201::/112
-        p1 = re.compile(r'^(?P<nd_prefix_db>[\w\:\/]+)$')
+        p1 = regex_engine.compile(r'^(?P<nd_prefix_db>[\w\:\/]+)$')
         # IPv6 ND Entries:
         # 2001:4888:AFFB:1201::1
-        p2 = re.compile(r'^(?P<ipv6_nd_entries>[\w\:]+)$')
+        p2 = regex_engine.compile(r'^(?P<ipv6_nd_entries>[\w\:]+)$')
         # NAT66 neighbor discovery is not enabled.
-        p3 = re.compile(r'^NAT66 +neighbor +discovery +is +not +enabled.$')
+        p3 = regex_engine.compile(r'^NAT66 +neighbor +discovery +is +not +enabled.$')
 
 
         for line in output.splitlines():
@@ -1803,13 +1803,13 @@ class ShowPlatformSoftwareFedSwitchActiveNatAcl(ShowPlatformSoftwareFedSwitchAct
         # ----------------------------------------------------------------------------
         #  SNAT |      any |        - |        - |        12.0.0.0 |         0.0.0.0 |
         #  DNAT |      any |        - |        - |         0.0.0.0 |        36.0.0.2 |
-        p0 = re.compile(r'^(?P<type>\S+)\s+\|+\s+(?P<protocol>\S+)\s+\|+\s+(?P<src_port>\S+)\s+\|+\s+(?P<dst_port>\S+)\s+\|+\s+(?P<src_addr>[\d\.]+)\s+\|+\s+(?P<dst_addr>[\d\.]+)\s+\|$')
+        p0 = regex_engine.compile(r'^(?P<type>\S+)\s+\|+\s+(?P<protocol>\S+)\s+\|+\s+(?P<src_port>\S+)\s+\|+\s+(?P<dst_port>\S+)\s+\|+\s+(?P<src_addr>[\d\.]+)\s+\|+\s+(?P<dst_addr>[\d\.]+)\s+\|$')
 
         # Ace Count : 2
-        p1 = re.compile(r'^Ace Count +: +(?P<ace_count>\d+)$')
+        p1 = regex_engine.compile(r'^Ace Count +: +(?P<ace_count>\d+)$')
 
         # Oid       : 1082
-        p2 = re.compile(r'^Oid +: +(?P<oid>\S+)$')
+        p2 = regex_engine.compile(r'^Oid +: +(?P<oid>\S+)$')
 
         for line in output.splitlines(): 
             line = line.strip()   
@@ -1890,10 +1890,10 @@ class ShowPlatformSoftwareFedSwitchActiveNatFlows(ShowPlatformSoftwareFedSwitchA
         # ------------------------------------------------------------------------------------------------------------------------------------------
         #                  0xa |     0 |      tcp |        12.0.0.2:60    |        36.0.0.2:60    |        22.0.0.2:60    |        22.0.0.2:60    |
         #                  0xb |     0 |      udp |        12.0.0.2:63    |        36.0.0.2:63    |        22.0.0.2:63    |        22.0.0.2:63    |
-        p0 = re.compile(r'^(?P<flow_id>\w+)\s+\|+\s+(?P<vrf>\d+)\s+\|+\s+(?P<protocol>\S+)\s+\|\s+(?P<il_ip_port>[\d\.\:]+)\s+\|\s+(?P<ig_ip_port>[\d\.\:]+)\s+\|\s+(?P<ol_ip_port>[\d\.\:]+)\s+\|\s+(?P<og_ip_port>[\d\.\:]+)\s+\|$')
+        p0 = regex_engine.compile(r'^(?P<flow_id>\w+)\s+\|+\s+(?P<vrf>\d+)\s+\|+\s+(?P<protocol>\S+)\s+\|\s+(?P<il_ip_port>[\d\.\:]+)\s+\|\s+(?P<ig_ip_port>[\d\.\:]+)\s+\|\s+(?P<ol_ip_port>[\d\.\:]+)\s+\|\s+(?P<og_ip_port>[\d\.\:]+)\s+\|$')
 
         # Number of Flows : 2
-        p1 = re.compile(r'^Number of Flows +: +(?P<no_of_flows>\d+)$')
+        p1 = regex_engine.compile(r'^Number of Flows +: +(?P<no_of_flows>\d+)$')
 
         for line in output.splitlines(): 
             line = line.strip()   
@@ -1965,10 +1965,10 @@ class ShowPlatformSoftwareFedSwitchActiveNatPools(ShowPlatformSoftwareFedSwitchA
         # Pool ID |                      Pool Name |      Start Addr |        End Addr |
         # ----------------------------------------------------------------------------------
         # 0x1     |                      in_pool_1 |        35.0.0.2 |       35.0.0.10 |
-        p0 = re.compile(r'^(?P<pool_id>\w+)\s+\|+\s+(?P<pool_name>\S+)\s+\|+\s+(?P<start_addr>\S+)\s+\|+\s+(?P<end_addr>\S+)\s+\|$')
+        p0 = regex_engine.compile(r'^(?P<pool_id>\w+)\s+\|+\s+(?P<pool_name>\S+)\s+\|+\s+(?P<start_addr>\S+)\s+\|+\s+(?P<end_addr>\S+)\s+\|$')
 
         # Number of Pools : 22
-        p1 = re.compile(r'^Number of Pools +: +(?P<number_of_pools>\d+)$')
+        p1 = regex_engine.compile(r'^Number of Pools +: +(?P<number_of_pools>\d+)$')
 
         for line in output.splitlines(): 
             line = line.strip()   
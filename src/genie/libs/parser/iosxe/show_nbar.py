@@ -1,7 +1,9 @@
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # ======================================================
 # Schema for 'show ip nbar protocol-discovery protocol'
@@ -52,11 +54,11 @@ class ShowIpNbarDiscovery(ShowIpNbarDiscoverySchema):
             out = output
             
         result_dict = {}
-        p1 = re.compile(r'^(?P<interface>Gig.+|Ten.+|Fast.+ |Port.+ |Vlan.+)')
-        p2 = re.compile(r'^(?P<protocol>[\w\-]+) +(?P<In_Packet_Count>[\d]+) +(?P<Out_Packet_Count>[\d]+)')
-        p3 = re.compile(r'^(?P<In_Byte_Count>[\d]+) +(?P<Out_Byte_Count>[\d]+)')
-        p4 = re.compile(r'^(?P<In_Bitrate>[\d]+) +(?P<Out_Bitrate>[\d]+)')
-        p5 = re.compile(r'^(?P<In_Bitrate_Max>[\d]+) +(?P<Out_Bitrate_Max>[\d]+)')
+        p1 = regex_engine.compile(r'^(?P<interface>Gig.+|Ten.+|Fast.+ |Port.+ |Vlan.+)')
+        p2 = regex_engine.compile(r'^(?P<protocol>[\w\-]+) +(?P<In_Packet_Count>[\d]+) +(?P<Out_Packet_Count>[\d]+)')
+        p3 = regex_engine.compile(r'^(?P<In_Byte_Count>[\d]+) +(?P<Out_Byte_Count>[\d]+)')
+        p4 = regex_engine.compile(r'^(?P<In_Bitrate>[\d]+) +(?P<Out_Bitrate>[\d]+)')
+        p5 = regex_engine.compile(r'^(?P<In_Bitrate_Max>[\d]+) +(?P<Out_Bitrate_Max>[\d]+)')
 
         
 
@@ -148,19 +150,19 @@ class ShowIpNbarProtocolPackActive(ShowIpNbarProtocolPackActiveSchema):
         ret_dict = {}
 
         # Name:                          Advanced Protocol Pack
-        p1 = re.compile(r'^Name:\s+(?P<name>(.+))$')
+        p1 = regex_engine.compile(r'^Name:\s+(?P<name>(.+))$')
 
         # Version:                       70.0
-        p2 = re.compile(r'^Version:\s+(?P<version>(\S+))$')
+        p2 = regex_engine.compile(r'^Version:\s+(?P<version>(\S+))$')
 
         # Publisher:                     Cisco Systems Inc.
-        p3 = re.compile(r'^Publisher:\s+(?P<publisher>(.+))$')
+        p3 = regex_engine.compile(r'^Publisher:\s+(?P<publisher>(.+))$')
         
         # NBAR Engine Version:           52
-        p4 = re.compile(r'^NBAR Engine Version:\s+(?P<nbar_engine_version>(\d+))$')
+        p4 = regex_engine.compile(r'^NBAR Engine Version:\s+(?P<nbar_engine_version>(\d+))$')
 
         # State:                         Active
-        p5 = re.compile(r'^State:\s+(?P<state>(.+))$')
+        p5 = regex_engine.compile(r'^State:\s+(?P<state>(.+))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -8,9 +8,6 @@ IOSXE parsers for the following commands
     * 'show netconf-yang status
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Any, Use, Schema, ListOf
@@ -18,6 +15,9 @@ from genie.metaparser.util.schemaengine import Optional, Any, Use, Schema, ListO
 # pyATS
 from pyats.utils.exceptions import SchemaTypeError
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowNetconfSessionSchema(MetaParser):
     '''Schema for:
@@ -43,7 +43,7 @@ class ShowNetconfSession(ShowNetconfSessionSchema):
             out = output
 
         # Netconf Sessions: 0 open, maximum is 4
-        p1 = re.compile(r'^Netconf +Sessions: +(?P<open>\d+) +open, +maximum +is +(?P<maximum>\d+)$')
+        p1 = regex_engine.compile(r'^Netconf +Sessions: +(?P<open>\d+) +open, +maximum +is +(?P<maximum>\d+)$')
 
         ret_dict = {}
 
@@ -85,7 +85,7 @@ class ShowNetconfYangDatastores(ShowNetconfYangDatastoresSchema):
 
         # Datastore Name             : running
         # Datastore Name             : candidate
-        p1 = re.compile(r'^Datastore Name\s+:\s+(?P<datastore>\S+)$')
+        p1 = regex_engine.compile(r'^Datastore Name\s+:\s+(?P<datastore>\S+)$')
 
         ret_dict = {}
 
@@ -141,11 +141,11 @@ class ShowNetconfYangSessions(ShowNetconfYangSessionsSchema):
 
 
         # Number of sessions : 1
-        p1 = re.compile(r'^Number +of +sessions *: +(?P<session_count>\d+)$')
+        p1 = regex_engine.compile(r'^Number +of +sessions *: +(?P<session_count>\d+)$')
 
         # 24          netconf-ssh  admin                10.69.35.35             None
-        p2 = re.compile(r'^(?P<session_id>\d+) +(?P<transport>\S+) +(?P<username>\S+) +'
-                        r'(?P<source_host>\S+) +(?P<global_lock>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<session_id>\d+) +(?P<transport>\S+) +(?P<username>\S+) +'
+                                  r'(?P<source_host>\S+) +(?P<global_lock>\S+)$')
 
         ret_dict = {}
 
@@ -191,10 +191,10 @@ class ShowNetconfYangSessionsDetail(ShowNetconfYangSessionsSchema):
 
 
         # Number of sessions : 1
-        p1 = re.compile(r'^Number +of +sessions *: +(?P<session_count>\d+)$')
+        p1 = regex_engine.compile(r'^Number +of +sessions *: +(?P<session_count>\d+)$')
 
         # session-id             : 24
-        p2 = re.compile(r'^session-id *: +(?P<session_id>\d+)$')
+        p2 = regex_engine.compile(r'^session-id *: +(?P<session_id>\d+)$')
 
         # transport : netconf-ssh
         # username : admin
@@ -205,7 +205,7 @@ class ShowNetconfYangSessionsDetail(ShowNetconfYangSessionsSchema):
         # out-rpc-errors : 0
         # out-notifications : 0
         # global-lock : None  
-        p3 = re.compile(r'^(?P<key>\S+) *: +(?P<data>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<key>\S+) *: +(?P<data>\S+)$')
 
         ret_dict = {}
 
@@ -262,10 +262,10 @@ class ShowNetconfYangSessionsDetail(ShowNetconfYangSessionsSchema):
 
 
         # Number of sessions : 1
-        p1 = re.compile(r'^Number +of +sessions *: +(?P<session_count>\d+)$')
+        p1 = regex_engine.compile(r'^Number +of +sessions *: +(?P<session_count>\d+)$')
 
         # session-id             : 24
-        p2 = re.compile(r'^session-id *: +(?P<session_id>\d+)$')
+        p2 = regex_engine.compile(r'^session-id *: +(?P<session_id>\d+)$')
 
         # transport : netconf-ssh
         # username : admin
@@ -276,7 +276,7 @@ class ShowNetconfYangSessionsDetail(ShowNetconfYangSessionsSchema):
         # out-rpc-errors : 0
         # out-notifications : 0
         # global-lock : None  
-        p3 = re.compile(r'^(?P<key>\S+) *: +(?P<data>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<key>\S+) *: +(?P<data>\S+)$')
 
         ret_dict = {}
 
@@ -348,23 +348,23 @@ class ShowNetconfYangStatus(ShowNetconfYangStatusSchema):
             output = self.device.execute(self.cli_command)
 
         # netconf-yang: enabled
-        p1 = re.compile(r'^netconf-yang:\s+(?P<status>\S+)$')
+        p1 = regex_engine.compile(r'^netconf-yang:\s+(?P<status>\S+)$')
         # netconf-yang ssh port: 830
-        p2 = re.compile(r'^netconf-yang ssh port:\s+(?P<ssh_port>\d+)$')
+        p2 = regex_engine.compile(r'^netconf-yang ssh port:\s+(?P<ssh_port>\d+)$')
         # netconf-yang candidate-datastore: enabled
-        p3 = re.compile(r'^netconf-yang candidate-datastore:\s+(?P<candidate_datastore_status>\S+)$')
+        p3 = regex_engine.compile(r'^netconf-yang candidate-datastore:\s+(?P<candidate_datastore_status>\S+)$')
         # netconf-yang side-effect-sync: enabled
-        p4 = re.compile(r'^netconf-yang side-effect-sync:\s+(?P<side_effect_sync>\S+)$')
+        p4 = regex_engine.compile(r'^netconf-yang side-effect-sync:\s+(?P<side_effect_sync>\S+)$')
         # netconf-yang turbocli: disabled
-        p5 = re.compile(r'^netconf-yang turbocli:\s+(?P<turbocli>\S+)$')
+        p5 = regex_engine.compile(r'^netconf-yang turbocli:\s+(?P<turbocli>\S+)$')
         # netconf-yang ssh hostkey algorithms: rsa-sha2-256,rsa-sha2-512,ssh-rsa
-        p6 = re.compile(r'^netconf-yang ssh hostkey algorithms:\s+(?P<hostkey_algorithm>\S+)$')
+        p6 = regex_engine.compile(r'^netconf-yang ssh hostkey algorithms:\s+(?P<hostkey_algorithm>\S+)$')
         # netconf-yang ssh encryption algorithms: aes128-ctr,aes192-ctr,aes256-ctr,aes128-cbc,aes256-cbc
-        p7 = re.compile(r'^netconf-yang ssh encryption algorithms:\s+(?P<encryption_algorithm>\S+)$')
+        p7 = regex_engine.compile(r'^netconf-yang ssh encryption algorithms:\s+(?P<encryption_algorithm>\S+)$')
         # netconf-yang ssh MAC algorithms: hmac-sha2-256,hmac-sha2-512,hmac-sha1
-        p8 = re.compile(r'^netconf-yang ssh MAC algorithms:\s+(?P<mac_algorithm>\S+)$')
+        p8 = regex_engine.compile(r'^netconf-yang ssh MAC algorithms:\s+(?P<mac_algorithm>\S+)$')
         # netconf-yang ssh KEX algorithms: diffie-hellman-group14-sha1,diffie-hellman-group14-sha256,ecdh-sha2-nistp256,ecdh-sha2-nistp384,ecdh-sha2-nistp521,diffie-hellman-group16-sha512
-        p9 = re.compile(r'^netconf-yang ssh KEX algorithms:\s+(?P<kex_algorithm>\S+)$')
+        p9 = regex_engine.compile(r'^netconf-yang ssh KEX algorithms:\s+(?P<kex_algorithm>\S+)$')
 
         ret_dict = {}
 
@@ -12,11 +12,9 @@ IOSXE parsers for the following show commands:
     * 'show network-clocks synchronization t0'
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import Any, Optional
 
@@ -99,169 +97,169 @@ class ShowNetworkClocksSynchronizationDetail(ShowNetworkClocksSynchronizationDet
             output = self.device.execute(self.cli_command)
 
         # Automatic selection process : Enable
-        p0 = re.compile(r'^Automatic\s+selection\s+process\s*:\s*'
-                        r'(?P<automatic_selection_process>.+)$')
+        p0 = regex_engine.compile(r'^Automatic\s+selection\s+process\s*:\s*'
+                                  r'(?P<automatic_selection_process>.+)$')
 
         # Equipment Clock : 2048 (EEC-Option1)
-        p1 = re.compile(r'^Equipment\s+Clock\s*:\s*'
-                        r'(?P<equipment_clock>\d+\s*\(.+\))$')
+        p1 = regex_engine.compile(r'^Equipment\s+Clock\s*:\s*'
+                                  r'(?P<equipment_clock>\d+\s*\(.+\))$')
 
         # Clock State : Frequency Locked
-        p2 = re.compile(r'^Clock\s+State\s*:\s*'
-                        r'(?P<clock_state>.+)$')
+        p2 = regex_engine.compile(r'^Clock\s+State\s*:\s*'
+                                  r'(?P<clock_state>.+)$')
 
         # Clock Mode : QL-Enable
-        p3 = re.compile(r'^Clock\s+Mode\s*:\s*'
-                        r'(?P<clock_mode>.+)$')
+        p3 = regex_engine.compile(r'^Clock\s+Mode\s*:\s*'
+                                  r'(?P<clock_mode>.+)$')
 
         # ESMC : Enabled
-        p4 = re.compile(r'^ESMC\s*:\s*'
-                        r'(?P<esmc_state>.+)$')
+        p4 = regex_engine.compile(r'^ESMC\s*:\s*'
+                                  r'(?P<esmc_state>.+)$')
 
         # SSM Option : 1
         # SSM Option : GEN1
-        p5 = re.compile(r'^SSM\s+Option\s*:\s*'
-                        r'(?P<ssm_option>.+)$')
+        p5 = regex_engine.compile(r'^SSM\s+Option\s*:\s*'
+                                  r'(?P<ssm_option>.+)$')
 
         # T0 : Internal
         # T0 : GigabitEthernet0/0/2
-        p6 = re.compile(r'^T0\s*:\s*'
-                        r'(?P<t0>.+)$')
+        p6 = regex_engine.compile(r'^T0\s*:\s*'
+                                  r'(?P<t0>.+)$')
 
         # Hold-off (global) : 300 ms
-        p7 = re.compile(r'^Hold-off\s+\(global\)\s*:\s*'
-                        r'(?P<global_hold_off_time>\d+)\s*ms$')
+        p7 = regex_engine.compile(r'^Hold-off\s+\(global\)\s*:\s*'
+                                  r'(?P<global_hold_off_time>\d+)\s*ms$')
 
         # Wait-to-restore (global) : 10 sec
-        p8 = re.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
-                        r'(?P<global_wait_to_restore>\d+)\s*sec$')
+        p8 = regex_engine.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
+                                  r'(?P<global_wait_to_restore>\d+)\s*sec$')
 
         # Tsm Delay : 180 ms
-        p9 = re.compile(r'^Tsm\s+Delay\s*:\s*'
-                        r'(?P<tsm_delay>\d+)\s*ms$')
+        p9 = regex_engine.compile(r'^Tsm\s+Delay\s*:\s*'
+                                  r'(?P<tsm_delay>\d+)\s*ms$')
 
         # Revertive : No
-        p10 = re.compile(r'^Revertive\s*:\s*'
-                         r'(?P<revertive>.+)$')
+        p10 = regex_engine.compile(r'^Revertive\s*:\s*'
+                                   r'(?P<revertive>.+)$')
 
         # Force Switch: FALSE
-        p11 = re.compile(r'^Force\s+Switch\s*:\s*'
-                         r'(?P<force_switch>.+)$')
+        p11 = regex_engine.compile(r'^Force\s+Switch\s*:\s*'
+                                   r'(?P<force_switch>.+)$')
 
         # Manual Switch: FALSE
-        p12 = re.compile(r'^Manual\s+Switch\s*:\s*'
-                         r'(?P<manual_switch>.+)$')
+        p12 = regex_engine.compile(r'^Manual\s+Switch\s*:\s*'
+                                   r'(?P<manual_switch>.+)$')
 
         # Number of synchronization sources: 4
-        p13 = re.compile(r'^Number\s+of\s+synchronization\s+sources\s*:\s*'
-                         r'(?P<num_of_sync_sources>\d+)$')
+        p13 = regex_engine.compile(r'^Number\s+of\s+synchronization\s+sources\s*:\s*'
+                                   r'(?P<num_of_sync_sources>\d+)$')
 
         # Squelch Threshold: QL-SEC
-        p14 = re.compile(r'^Squelch\s+Threshold\s*:\s*'
-                         r'(?P<squelch_threshold>.+)$')
+        p14 = regex_engine.compile(r'^Squelch\s+Threshold\s*:\s*'
+                                   r'(?P<squelch_threshold>.+)$')
 
         # Last transition recorded: (begin)-> 2A (ql_mode_enable)-> 1A
-        p15 = re.compile(r'^Last\s+transition\s+recorded\s*:\s*'
-                         r'(?P<last_transition_recorded>.+)$')
+        p15 = regex_engine.compile(r'^Last\s+transition\s+recorded\s*:\s*'
+                                   r'(?P<last_transition_recorded>.+)$')
 
         #  Interface            SigType     Mode/QL      Prio  QL_IN  ESMC Tx  ESMC Rx
         #  Internal             NA          NA/Dis       251   QL-SEC    NA        NA
         # *Gi0/0/2              NA          Sync/En      1     QL-SEC    -         -
-        p39 = re.compile(r'(?P<nominated_interface>\S+) +(?P<sigtype>\S+) +(?P<mode_or_ql>\S+/\S+) +(?P<prio>\d+) +'
-                         r'(?P<ql_in>\S+) +(?P<esmc_tx>\S+) +(?P<esmc_rx>\S+)$')
+        p39 = regex_engine.compile(r'(?P<nominated_interface>\S+) +(?P<sigtype>\S+) +(?P<mode_or_ql>\S+/\S+) +(?P<prio>\d+) +'
+                                   r'(?P<ql_in>\S+) +(?P<esmc_tx>\S+) +(?P<esmc_rx>\S+)$')
 
         # Local Interface: Internal
         # Local Interface: Gi0/0/2
-        p16 = re.compile(r'^Local\s+Interface\s*:\s*'
-                         r'(?P<local_interface>.+)$')
+        p16 = regex_engine.compile(r'^Local\s+Interface\s*:\s*'
+                                   r'(?P<local_interface>.+)$')
 
         # Signal Type: NA
-        p17 = re.compile(r'^Signal\s+Type\s*:\s*'
-                         r'(?P<signal_type>.+)$')
+        p17 = regex_engine.compile(r'^Signal\s+Type\s*:\s*'
+                                   r'(?P<signal_type>.+)$')
 
         # Mode: NA(Ql-enabled)
-        p18 = re.compile(r'^Mode\s*:\s*'
-                         r'(?P<mode>.+)$')
+        p18 = regex_engine.compile(r'^Mode\s*:\s*'
+                                   r'(?P<mode>.+)$')
 
         # SSM Tx: DISABLED
-        p19 = re.compile(r'^SSM\s+Tx\s*:\s*'
-                         r'(?P<ssm_tx>.+)$')
+        p19 = regex_engine.compile(r'^SSM\s+Tx\s*:\s*'
+                                   r'(?P<ssm_tx>.+)$')
 
         # SSM Rx: DISABLED
-        p20 = re.compile(r'^SSM\s+Rx\s*:\s*'
-                         r'(?P<ssm_rx>.+)$')
+        p20 = regex_engine.compile(r'^SSM\s+Rx\s*:\s*'
+                                   r'(?P<ssm_rx>.+)$')
 
         # ESMC Tx: ENABLED
-        p21 = re.compile(r'^ESMC\s+Tx\s*:\s*'
-                         r'(?P<esmc_tx>.+)$')
+        p21 = regex_engine.compile(r'^ESMC\s+Tx\s*:\s*'
+                                   r'(?P<esmc_tx>.+)$')
 
         # ESMC Rx: ENABLED
-        p22 = re.compile(r'^ESMC\s+Rx\s*:\s*'
-                         r'(?P<esmc_rx>.+)$')
+        p22 = regex_engine.compile(r'^ESMC\s+Rx\s*:\s*'
+                                   r'(?P<esmc_rx>.+)$')
 
         # Priority: 1
-        p23 = re.compile(r'^Priority\s*:\s*'
-                         r'(?P<priority>.+)$')
+        p23 = regex_engine.compile(r'^Priority\s*:\s*'
+                                   r'(?P<priority>.+)$')
 
         # QL Receive: QL-SEC
-        p24 = re.compile(r'^QL\s+Receive\s*:\s*'
-                         r'(?P<ql_receive>.+)$')
+        p24 = regex_engine.compile(r'^QL\s+Receive\s*:\s*'
+                                   r'(?P<ql_receive>.+)$')
 
         # QL Receive Configured: -
-        p25 = re.compile(r'^QL\s+Receive\s+Configured\s*:\s*'
-                         r'(?P<ql_receive_configured>.+)$')
+        p25 = regex_engine.compile(r'^QL\s+Receive\s+Configured\s*:\s*'
+                                   r'(?P<ql_receive_configured>.+)$')
 
         # QL Receive Overrided: -
-        p26 = re.compile(r'^QL\s+Receive\s+Overrided\s*:\s*'
-                         r'(?P<ql_receive_overrided>.+)$')
+        p26 = regex_engine.compile(r'^QL\s+Receive\s+Overrided\s*:\s*'
+                                   r'(?P<ql_receive_overrided>.+)$')
 
         # QL Transmit: QL-DNU
-        p27 = re.compile(r'^QL\s+Transmit\s*:\s*'
-                         r'(?P<ql_transmit>.+)$')
+        p27 = regex_engine.compile(r'^QL\s+Transmit\s*:\s*'
+                                   r'(?P<ql_transmit>.+)$')
 
         # QL Transmit Configured: -
-        p28 = re.compile(r'^QL\s+Transmit\s+Configured\s*:\s*'
-                         r'(?P<ql_transmit_configured>.+)$')
+        p28 = regex_engine.compile(r'^QL\s+Transmit\s+Configured\s*:\s*'
+                                   r'(?P<ql_transmit_configured>.+)$')
 
         # Hold-off: 300
-        p29 = re.compile(r'^Hold-off\s*:\s*'
-                         r'(?P<hold_off_time>\d+)$')
+        p29 = regex_engine.compile(r'^Hold-off\s*:\s*'
+                                   r'(?P<hold_off_time>\d+)$')
 
         # Wait-to-restore: 10
-        p30 = re.compile(r'^Wait-to-restore\s*:\s*'
-                         r'(?P<wait_to_restore>\d+)$')
+        p30 = regex_engine.compile(r'^Wait-to-restore\s*:\s*'
+                                   r'(?P<wait_to_restore>\d+)$')
 
         # Lock Out: FALSE
-        p31 = re.compile(r'^Lock\s+Out\s*:\s*'
-                         r'(?P<lock_out>.+)$')
+        p31 = regex_engine.compile(r'^Lock\s+Out\s*:\s*'
+                                   r'(?P<lock_out>.+)$')
 
         # Signal Fail: FALSE
-        p32 = re.compile(r'^Signal\s+Fail\s*:\s*'
-                         r'(?P<signal_fail>.+)$')
+        p32 = regex_engine.compile(r'^Signal\s+Fail\s*:\s*'
+                                   r'(?P<signal_fail>.+)$')
 
         # Alarms: FALSE
-        p33 = re.compile(r'^Alarms\s*:\s*'
-                         r'(?P<alarms>.+)$')
+        p33 = regex_engine.compile(r'^Alarms\s*:\s*'
+                                   r'(?P<alarms>.+)$')
 
         # Active Alarms :  None
-        p34 = re.compile(r'^Active\s+Alarms\s*:\s*'
-                         r'(?P<active_alarms>.+)$')
+        p34 = regex_engine.compile(r'^Active\s+Alarms\s*:\s*'
+                                   r'(?P<active_alarms>.+)$')
 
         # Slot Disabled: FALSE
-        p35 = re.compile(r'^Slot\s+Disabled\s*:\s*'
-                         r'(?P<slot_disabled>.+)$')
+        p35 = regex_engine.compile(r'^Slot\s+Disabled\s*:\s*'
+                                   r'(?P<slot_disabled>.+)$')
 
         # SNMP input source index: 2
-        p36 = re.compile(r'^SNMP\s+input\s+source\s+index\s*:\s*'
-                         r'(?P<snmp_input_source_index>\d+)$')
+        p36 = regex_engine.compile(r'^SNMP\s+input\s+source\s+index\s*:\s*'
+                                   r'(?P<snmp_input_source_index>\d+)$')
 
         # SNMP parent list index: 0
-        p37 = re.compile(r'^SNMP\s+parent\s+list\s+index\s*:\s*'
-                         r'(?P<snmp_parent_list_index>\d+)$')
+        p37 = regex_engine.compile(r'^SNMP\s+parent\s+list\s+index\s*:\s*'
+                                   r'(?P<snmp_parent_list_index>\d+)$')
 
         # Description: None
-        p38 = re.compile(r'^Description\s*:\s*'
-                         r'(?P<description>.+)$')
+        p38 = regex_engine.compile(r'^Description\s*:\s*'
+                                   r'(?P<description>.+)$')
 
         # Init vars
         parsed_dict = {}
@@ -607,55 +605,55 @@ class ShowNetworkClocksSynchronization(ShowNetworkClocksSynchronizationSchema):
             output = self.device.execute(self.cli_command)
 
         # Automatic selection process : Enable
-        p0 = re.compile(r'^Automatic\s+selection\s+process\s*:\s*'
-                        r'(?P<automatic_selection_process>.+)$')
+        p0 = regex_engine.compile(r'^Automatic\s+selection\s+process\s*:\s*'
+                                  r'(?P<automatic_selection_process>.+)$')
 
         # Equipment Clock : 2048 (EEC-Option1)
-        p1 = re.compile(r'^Equipment\s+Clock\s*:\s*'
-                        r'(?P<equipment_clock>\d+\s*\(.+\))$')
+        p1 = regex_engine.compile(r'^Equipment\s+Clock\s*:\s*'
+                                  r'(?P<equipment_clock>\d+\s*\(.+\))$')
 
         # Clock Mode : QL-Enable
-        p2 = re.compile(r'^Clock\s+Mode\s*:\s*'
-                        r'(?P<clock_mode>.+)$')
+        p2 = regex_engine.compile(r'^Clock\s+Mode\s*:\s*'
+                                  r'(?P<clock_mode>.+)$')
 
         # ESMC : Enabled
-        p3 = re.compile(r'^ESMC\s*:\s*'
-                        r'(?P<esmc_state>.+)$')
+        p3 = regex_engine.compile(r'^ESMC\s*:\s*'
+                                  r'(?P<esmc_state>.+)$')
 
         # SSM Option : 1
         # SSM Option : GEN1
-        p4 = re.compile(r'^SSM\s+Option\s*:\s*'
-                        r'(?P<ssm_option>.+)$')
+        p4 = regex_engine.compile(r'^SSM\s+Option\s*:\s*'
+                                  r'(?P<ssm_option>.+)$')
 
         # T0 : Internal
         # T0 : GigabitEthernet0/0/2
-        p5 = re.compile(r'^T0\s*:\s*'
-                        r'(?P<t0>.+)$')
+        p5 = regex_engine.compile(r'^T0\s*:\s*'
+                                  r'(?P<t0>.+)$')
 
         # Hold-off (global) : 300 ms
-        p6 = re.compile(r'^Hold-off\s+\(global\)\s*:\s*'
-                        r'(?P<global_hold_off_time>\d+)\s*ms$')
+        p6 = regex_engine.compile(r'^Hold-off\s+\(global\)\s*:\s*'
+                                  r'(?P<global_hold_off_time>\d+)\s*ms$')
 
         # Wait-to-restore (global) : 10 sec
-        p7 = re.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
-                        r'(?P<global_wait_to_restore>\d+)\s*sec$')
+        p7 = regex_engine.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
+                                  r'(?P<global_wait_to_restore>\d+)\s*sec$')
 
         # Tsm Delay : 180 ms
-        p8 = re.compile(r'^Tsm\s+Delay\s*:\s*'
-                        r'(?P<tsm_delay>\d+)\s*ms$')
+        p8 = regex_engine.compile(r'^Tsm\s+Delay\s*:\s*'
+                                  r'(?P<tsm_delay>\d+)\s*ms$')
 
         # Revertive : No
-        p9 = re.compile(r'^Revertive\s*:\s*'
-                        r'(?P<revertive>.+)$')
+        p9 = regex_engine.compile(r'^Revertive\s*:\s*'
+                                  r'(?P<revertive>.+)$')
 
         #  Internal             NA          NA/Dis       251   QL-SEC    NA        NA
         # *Gi0/0/2              NA          Sync/En      1     QL-SEC    -         -
-        p10 = re.compile(r'(?P<local_interface>\S+) +'
-                         r'(?P<signal_type>\S+) +'
-                         r'(?P<mode>\S+/\S+) +(?P<priority>\d+) +'
-                         r'(?P<ql_in>\S+) +'
-                         r'(?P<esmc_tx>\S+) +'
-                         r'(?P<esmc_rx>\S+)$')
+        p10 = regex_engine.compile(r'(?P<local_interface>\S+) +'
+                                   r'(?P<signal_type>\S+) +'
+                                   r'(?P<mode>\S+/\S+) +(?P<priority>\d+) +'
+                                   r'(?P<ql_in>\S+) +'
+                                   r'(?P<esmc_tx>\S+) +'
+                                   r'(?P<esmc_rx>\S+)$')
 
         # Init vars
         parsed_dict = {}
@@ -809,70 +807,70 @@ class ShowNetworkClocksSynchronizationGlobalDetail(ShowNetworkClocksSynchronizat
             output = self.device.execute(self.cli_command)
 
         # Automatic selection process : Enable
-        p0 = re.compile(r'^Automatic\s+selection\s+process\s*:\s*'
-                        r'(?P<automatic_selection_process>.+)$')
+        p0 = regex_engine.compile(r'^Automatic\s+selection\s+process\s*:\s*'
+                                  r'(?P<automatic_selection_process>.+)$')
 
         # Equipment Clock : 2048 (EEC-Option1)
-        p1 = re.compile(r'^Equipment\s+Clock\s*:\s*'
-                        r'(?P<equipment_clock>\d+\s*\(.+\))$')
+        p1 = regex_engine.compile(r'^Equipment\s+Clock\s*:\s*'
+                                  r'(?P<equipment_clock>\d+\s*\(.+\))$')
 
         # Clock State : Frequency Locked
-        p2 = re.compile(r'^Clock\s+State\s*:\s*'
-                        r'(?P<clock_state>.+)$')
+        p2 = regex_engine.compile(r'^Clock\s+State\s*:\s*'
+                                  r'(?P<clock_state>.+)$')
 
         # Clock Mode : QL-Enable
-        p3 = re.compile(r'^Clock\s+Mode\s*:\s*'
-                        r'(?P<clock_mode>.+)$')
+        p3 = regex_engine.compile(r'^Clock\s+Mode\s*:\s*'
+                                  r'(?P<clock_mode>.+)$')
 
         # ESMC : Enabled
-        p4 = re.compile(r'^ESMC\s*:\s*'
-                        r'(?P<esmc_state>.+)$')
+        p4 = regex_engine.compile(r'^ESMC\s*:\s*'
+                                  r'(?P<esmc_state>.+)$')
 
         # SSM Option : 1
         # SSM Option : GEN1
-        p5 = re.compile(r'^SSM\s+Option\s*:\s*'
-                        r'(?P<ssm_option>.+)$')
+        p5 = regex_engine.compile(r'^SSM\s+Option\s*:\s*'
+                                  r'(?P<ssm_option>.+)$')
 
         # T0 : Internal
         # T0 : GigabitEthernet0/0/2
-        p6 = re.compile(r'^T0\s*:\s*'
-                        r'(?P<t0>.+)$')
+        p6 = regex_engine.compile(r'^T0\s*:\s*'
+                                  r'(?P<t0>.+)$')
 
         # Hold-off (global) : 300 ms
-        p7 = re.compile(r'^Hold-off\s+\(global\)\s*:\s*'
-                        r'(?P<global_hold_off_time>\d+)\s*ms$')
+        p7 = regex_engine.compile(r'^Hold-off\s+\(global\)\s*:\s*'
+                                  r'(?P<global_hold_off_time>\d+)\s*ms$')
 
         # Wait-to-restore (global) : 10 sec
-        p8 = re.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
-                        r'(?P<global_wait_to_restore>\d+)\s*sec$')
+        p8 = regex_engine.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
+                                  r'(?P<global_wait_to_restore>\d+)\s*sec$')
 
         # Tsm Delay : 180 ms
-        p9 = re.compile(r'^Tsm\s+Delay\s*:\s*'
-                        r'(?P<tsm_delay>\d+)\s*ms$')
+        p9 = regex_engine.compile(r'^Tsm\s+Delay\s*:\s*'
+                                  r'(?P<tsm_delay>\d+)\s*ms$')
 
         # Revertive : No
-        p10 = re.compile(r'^Revertive\s*:\s*'
-                         r'(?P<revertive>.+)$')
+        p10 = regex_engine.compile(r'^Revertive\s*:\s*'
+                                   r'(?P<revertive>.+)$')
 
         # Force Switch: FALSE
-        p11 = re.compile(r'^Force\s+Switch\s*:\s*'
-                         r'(?P<force_switch>.+)$')
+        p11 = regex_engine.compile(r'^Force\s+Switch\s*:\s*'
+                                   r'(?P<force_switch>.+)$')
 
         # Manual Switch: FALSE
-        p12 = re.compile(r'^Manual\s+Switch\s*:\s*'
-                         r'(?P<manual_switch>.+)$')
+        p12 = regex_engine.compile(r'^Manual\s+Switch\s*:\s*'
+                                   r'(?P<manual_switch>.+)$')
 
         # Number of synchronization sources: 4
-        p13 = re.compile(r'^Number\s+of\s+synchronization\s+sources\s*:\s*'
-                         r'(?P<num_of_sync_sources>\d+)$')
+        p13 = regex_engine.compile(r'^Number\s+of\s+synchronization\s+sources\s*:\s*'
+                                   r'(?P<num_of_sync_sources>\d+)$')
 
         # Squelch Threshold: QL-SEC
-        p14 = re.compile(r'^Squelch\s+Threshold\s*:\s*'
-                         r'(?P<squelch_threshold>.+)$')
+        p14 = regex_engine.compile(r'^Squelch\s+Threshold\s*:\s*'
+                                   r'(?P<squelch_threshold>.+)$')
 
         # Last transition recorded: (begin)-> 2A (ql_mode_enable)-> 1A
-        p15 = re.compile(r'^Last\s+transition\s+recorded\s*:\s*'
-                         r'(?P<last_transition_recorded>.+)$')
+        p15 = regex_engine.compile(r'^Last\s+transition\s+recorded\s*:\s*'
+                                   r'(?P<last_transition_recorded>.+)$')
 
         # Init vars
         parsed_dict = {}
@@ -1034,46 +1032,46 @@ class ShowNetworkClocksSynchronizationGlobal(ShowNetworkClocksSynchronizationGlo
             output = self.device.execute(self.cli_command)
 
         # Automatic selection process : Enable
-        p0 = re.compile(r'^Automatic\s+selection\s+process\s*:\s*'
-                        r'(?P<automatic_selection_process>.+)$')
+        p0 = regex_engine.compile(r'^Automatic\s+selection\s+process\s*:\s*'
+                                  r'(?P<automatic_selection_process>.+)$')
 
         # Equipment Clock : 2048 (EEC-Option1)
-        p1 = re.compile(r'^Equipment\s+Clock\s*:\s*'
-                        r'(?P<equipment_clock>\d+\s*\(.+\))$')
+        p1 = regex_engine.compile(r'^Equipment\s+Clock\s*:\s*'
+                                  r'(?P<equipment_clock>\d+\s*\(.+\))$')
 
         # Clock Mode : QL-Enable
-        p2 = re.compile(r'^Clock\s+Mode\s*:\s*'
-                        r'(?P<clock_mode>.+)$')
+        p2 = regex_engine.compile(r'^Clock\s+Mode\s*:\s*'
+                                  r'(?P<clock_mode>.+)$')
 
         # ESMC : Enabled
-        p3 = re.compile(r'^ESMC\s*:\s*'
-                        r'(?P<esmc_state>.+)$')
+        p3 = regex_engine.compile(r'^ESMC\s*:\s*'
+                                  r'(?P<esmc_state>.+)$')
 
         # SSM Option : 1
         # SSM Option : GEN1
-        p4 = re.compile(r'^SSM\s+Option\s*:\s*'
-                        r'(?P<ssm_option>.+)$')
+        p4 = regex_engine.compile(r'^SSM\s+Option\s*:\s*'
+                                  r'(?P<ssm_option>.+)$')
 
         # T0 : Internal
         # T0 : GigabitEthernet0/0/2
-        p5 = re.compile(r'^T0\s*:\s*'
-                        r'(?P<t0>.+)$')
+        p5 = regex_engine.compile(r'^T0\s*:\s*'
+                                  r'(?P<t0>.+)$')
 
         # Hold-off (global) : 300 ms
-        p6 = re.compile(r'^Hold-off\s+\(global\)\s*:\s*'
-                        r'(?P<global_hold_off_time>\d+)\s*ms$')
+        p6 = regex_engine.compile(r'^Hold-off\s+\(global\)\s*:\s*'
+                                  r'(?P<global_hold_off_time>\d+)\s*ms$')
 
         # Wait-to-restore (global) : 10 sec
-        p7 = re.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
-                        r'(?P<global_wait_to_restore>\d+)\s*sec$')
+        p7 = regex_engine.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
+                                  r'(?P<global_wait_to_restore>\d+)\s*sec$')
 
         # Tsm Delay : 180 ms
-        p8 = re.compile(r'^Tsm\s+Delay\s*:\s*'
-                        r'(?P<tsm_delay>\d+)\s*ms$')
+        p8 = regex_engine.compile(r'^Tsm\s+Delay\s*:\s*'
+                                  r'(?P<tsm_delay>\d+)\s*ms$')
 
         # Revertive : No
-        p9 = re.compile(r'^Revertive\s*:\s*'
-                        r'(?P<revertive>.+)$')
+        p9 = regex_engine.compile(r'^Revertive\s*:\s*'
+                                  r'(?P<revertive>.+)$')
 
         # Init vars
         parsed_dict = {}
@@ -1224,157 +1222,157 @@ class ShowNetworkClocksSynchronizationInterface(ShowNetworkClocksSynchronization
                 execute(self.cli_command.format(interface=interface))
 
         # GigabitEthernet0/0/2
-        p_intf = re.compile(r'^(?P<intf>[a-zA-Z]+[\d/]*)$')
+        p_intf = regex_engine.compile(r'^(?P<intf>[a-zA-Z]+[\d/]*)$')
 
         # T0
-        p_t0 = re.compile(r'^T0$')
+        p_t0 = regex_engine.compile(r'^T0$')
 
         # Description: None
-        p0 = re.compile(r'^Description\s*:\s*'
-                        r'(?P<description>.+)$')
+        p0 = regex_engine.compile(r'^Description\s*:\s*'
+                                  r'(?P<description>.+)$')
 
         # Signal Type: NA
-        p1 = re.compile(r'^Signal\s+Type\s*:\s*'
-                        r'(?P<signal_type>.+)$')
+        p1 = regex_engine.compile(r'^Signal\s+Type\s*:\s*'
+                                  r'(?P<signal_type>.+)$')
 
         # Mode: NA(Ql-enabled)
-        p2 = re.compile(r'^Mode\s*:\s*'
-                        r'(?P<mode>.+)$')
+        p2 = regex_engine.compile(r'^Mode\s*:\s*'
+                                  r'(?P<mode>.+)$')
 
         # SSM Tx: DISABLED
-        p3 = re.compile(r'^SSM\s+Tx\s*:\s*'
-                        r'(?P<ssm_tx>.+)$')
+        p3 = regex_engine.compile(r'^SSM\s+Tx\s*:\s*'
+                                  r'(?P<ssm_tx>.+)$')
 
         # SSM Rx: DISABLED
-        p4 = re.compile(r'^SSM\s+Rx\s*:\s*'
-                        r'(?P<ssm_rx>.+)$')
+        p4 = regex_engine.compile(r'^SSM\s+Rx\s*:\s*'
+                                  r'(?P<ssm_rx>.+)$')
 
         # ESMC Tx: ENABLED
-        p5 = re.compile(r'^ESMC\s+Tx\s*:\s*'
-                        r'(?P<esmc_tx>.+)$')
+        p5 = regex_engine.compile(r'^ESMC\s+Tx\s*:\s*'
+                                  r'(?P<esmc_tx>.+)$')
 
         # ESMC Rx: ENABLED
-        p6 = re.compile(r'^ESMC\s+Rx\s*:\s*'
-                        r'(?P<esmc_rx>.+)$')
+        p6 = regex_engine.compile(r'^ESMC\s+Rx\s*:\s*'
+                                  r'(?P<esmc_rx>.+)$')
 
         # QL Receive: QL-SEC
-        p7 = re.compile(r'^QL\s+Receive\s*:\s*'
-                        r'(?P<ql_receive>.+)$')
+        p7 = regex_engine.compile(r'^QL\s+Receive\s*:\s*'
+                                  r'(?P<ql_receive>.+)$')
 
         # QL Receive Configured: -
-        p8 = re.compile(r'^QL\s+Receive\s+Configured\s*:\s*'
-                        r'(?P<ql_receive_configured>.+)$')
+        p8 = regex_engine.compile(r'^QL\s+Receive\s+Configured\s*:\s*'
+                                  r'(?P<ql_receive_configured>.+)$')
 
         # QL Receive Overrided: -
-        p9 = re.compile(r'^QL\s+Receive\s+Overrided\s*:\s*'
-                        r'(?P<ql_receive_overrided>.+)$')
+        p9 = regex_engine.compile(r'^QL\s+Receive\s+Overrided\s*:\s*'
+                                  r'(?P<ql_receive_overrided>.+)$')
 
         # QL Transmit: QL-DNU
-        p10 = re.compile(r'^QL\s+Transmit\s*:\s*'
-                         r'(?P<ql_transmit>.+)$')
+        p10 = regex_engine.compile(r'^QL\s+Transmit\s*:\s*'
+                                   r'(?P<ql_transmit>.+)$')
 
         # QL Transmit Configured: -
-        p11 = re.compile(r'^QL\s+Transmit\s+Configured\s*:\s*'
-                         r'(?P<ql_transmit_configured>.+)$')
+        p11 = regex_engine.compile(r'^QL\s+Transmit\s+Configured\s*:\s*'
+                                   r'(?P<ql_transmit_configured>.+)$')
 
         # Hold-off: 300
-        p12 = re.compile(r'^Hold-off\s*:\s*'
-                         r'(?P<hold_off_time>\d+)$')
+        p12 = regex_engine.compile(r'^Hold-off\s*:\s*'
+                                   r'(?P<hold_off_time>\d+)$')
 
         # Holdoff Configured: TRUE
-        p13 = re.compile(r'^Holdoff\s+Configured\s*:\s*'
-                         r'(?P<hold_off_configured>.+)$')
+        p13 = regex_engine.compile(r'^Holdoff\s+Configured\s*:\s*'
+                                   r'(?P<hold_off_configured>.+)$')
 
         # Wait-to-restore: 10
-        p14 = re.compile(r'^Wait-to-restore\s*:\s*'
-                         r'(?P<wait_to_restore>\d+)$')
+        p14 = regex_engine.compile(r'^Wait-to-restore\s*:\s*'
+                                   r'(?P<wait_to_restore>\d+)$')
 
         # WTR Configured: FALSE
-        p15 = re.compile(r'^WTR\s+Configured\s*:\s*'
-                         r'(?P<wtr_configured>.+)$')
+        p15 = regex_engine.compile(r'^WTR\s+Configured\s*:\s*'
+                                   r'(?P<wtr_configured>.+)$')
 
         # Lock out: FALSE
-        p16 = re.compile(r'^Lock\s+out\s*:\s*'
-                         r'(?P<lock_out>.+)$')
+        p16 = regex_engine.compile(r'^Lock\s+out\s*:\s*'
+                                   r'(?P<lock_out>.+)$')
 
         # Signal Fail: FALSE
-        p17 = re.compile(r'^Signal\s+Fail\s*:\s*'
-                         r'(?P<signal_fail>.+)$')
+        p17 = regex_engine.compile(r'^Signal\s+Fail\s*:\s*'
+                                   r'(?P<signal_fail>.+)$')
 
         # Alarms: FALSE
-        p18 = re.compile(r'^Alarms\s*:\s*'
-                         r'(?P<alarms>.+)$')
+        p18 = regex_engine.compile(r'^Alarms\s*:\s*'
+                                   r'(?P<alarms>.+)$')
 
         # Reason for alarm flag: 0
-        p19 = re.compile(r'^Reason\s+for\s+alarm\s+flag\s*:\s*'
-                         r'(?P<reason_for_alarm_flag>\d+)$')
+        p19 = regex_engine.compile(r'^Reason\s+for\s+alarm\s+flag\s*:\s*'
+                                   r'(?P<reason_for_alarm_flag>\d+)$')
 
         # Slot Disabled: FALSE
-        p20 = re.compile(r'^Slot\s+Disabled\s*:\s*'
-                         r'(?P<slot_disabled>.+)$')
+        p20 = regex_engine.compile(r'^Slot\s+Disabled\s*:\s*'
+                                   r'(?P<slot_disabled>.+)$')
 
         # Hold off Timer: STOPPED
-        p21 = re.compile(r'^Hold\s+off\s+Timer\s*:\s*'
-                         r'(?P<hold_off_timer>.+)$')
+        p21 = regex_engine.compile(r'^Hold\s+off\s+Timer\s*:\s*'
+                                   r'(?P<hold_off_timer>.+)$')
 
         # Wait to restore Timer: STOPPED
-        p22 = re.compile(r'^Wait\s+to\s+restore\s+Timer\s*:\s*'
-                         r'(?P<wait_to_restore_timer>.+)$')
+        p22 = regex_engine.compile(r'^Wait\s+to\s+restore\s+Timer\s*:\s*'
+                                   r'(?P<wait_to_restore_timer>.+)$')
 
         # Switchover Timer: STOPPED
-        p23 = re.compile(r'^Switchover\s+Timer\s*:\s*'
-                         r'(?P<switchover_timer>.+)$')
+        p23 = regex_engine.compile(r'^Switchover\s+Timer\s*:\s*'
+                                   r'(?P<switchover_timer>.+)$')
 
         # ESMC Tx Timer: RUNNING
-        p24 = re.compile(r'^ESMC\s+Tx\s+Timer\s*:\s*'
-                         r'(?P<esmc_tx_timer>.+)$')
+        p24 = regex_engine.compile(r'^ESMC\s+Tx\s+Timer\s*:\s*'
+                                   r'(?P<esmc_tx_timer>.+)$')
 
         # ESMC Rx Timer: RUNNING
-        p25 = re.compile(r'^ESMC\s+Rx\s+Timer\s*:\s*'
-                         r'(?P<esmc_rx_timer>.+)$')
+        p25 = regex_engine.compile(r'^ESMC\s+Rx\s+Timer\s*:\s*'
+                                   r'(?P<esmc_rx_timer>.+)$')
 
         # Tsm delay Timer: STOPPED
-        p26 = re.compile(r'^Tsm\s+delay\s+Timer\s*:\s*'
-                         r'(?P<tsm_delay_timer>.+)$')
+        p26 = regex_engine.compile(r'^Tsm\s+delay\s+Timer\s*:\s*'
+                                   r'(?P<tsm_delay_timer>.+)$')
 
         # Selected source: TRUE
-        p27 = re.compile(r'^Selected\s+source\s*:\s*'
-                         r'(?P<selected_source>.+)$')
+        p27 = regex_engine.compile(r'^Selected\s+source\s*:\s*'
+                                   r'(?P<selected_source>.+)$')
 
         # Priority: 1
-        p28 = re.compile(r'^Priority\s*:\s*'
-                         r'(?P<priority>.+)$')
+        p28 = regex_engine.compile(r'^Priority\s*:\s*'
+                                   r'(?P<priority>.+)$')
 
         # Force Switch: FALSE
-        p29 = re.compile(r'^Force\s+Switch\s*:\s*'
-                         r'(?P<force_switch>.+)$')
+        p29 = regex_engine.compile(r'^Force\s+Switch\s*:\s*'
+                                   r'(?P<force_switch>.+)$')
 
         # Manual Switch: FALSE
-        p30 = re.compile(r'^Manual\s+Switch\s*:\s*'
-                         r'(?P<manual_switch>.+)$')
+        p30 = regex_engine.compile(r'^Manual\s+Switch\s*:\s*'
+                                   r'(?P<manual_switch>.+)$')
 
         # Manual Switch in progress: FALSE
-        p31 = re.compile(r'^Manual\s+Switch\s+in\s+progress\s*:\s*'
-                         r'(?P<manual_switch_in_progress>.+)$')
+        p31 = regex_engine.compile(r'^Manual\s+Switch\s+in\s+progress\s*:\s*'
+                                   r'(?P<manual_switch_in_progress>.+)$')
         # Don't Use: FALSE
-        p32 = re.compile(r'^Don\'t\s+Use\s*:\s*'
-                         r'(?P<not_use>.+)$')
+        p32 = regex_engine.compile(r'^Don\'t\s+Use\s*:\s*'
+                                   r'(?P<not_use>.+)$')
 
         # Been Selected: TRUE
-        p33 = re.compile(r'^Been\s+Selected\s*:\s*'
-                         r'(?P<been_selected>.+)$')
+        p33 = regex_engine.compile(r'^Been\s+Selected\s*:\s*'
+                                   r'(?P<been_selected>.+)$')
 
         # SNMP input source index: 2
-        p34 = re.compile(r'^SNMP\s+input\s+source\s+index\s*:\s*'
-                         r'(?P<snmp_input_source_index>\d+)$')
+        p34 = regex_engine.compile(r'^SNMP\s+input\s+source\s+index\s*:\s*'
+                                   r'(?P<snmp_input_source_index>\d+)$')
 
         # SNMP parent source index: 0
-        p35 = re.compile(r'^SNMP\s+parent\s+source\s+index\s*:\s*'
-                         r'(?P<snmp_parent_source_index>\d+)$')
+        p35 = regex_engine.compile(r'^SNMP\s+parent\s+source\s+index\s*:\s*'
+                                   r'(?P<snmp_parent_source_index>\d+)$')
 
         # Intf_sig_nv: 0
-        p36 = re.compile(r'^Intf_sig_nv\s*:\s*'
-                         r'(?P<intf_sig_nv>.+)$')
+        p36 = regex_engine.compile(r'^Intf_sig_nv\s*:\s*'
+                                   r'(?P<intf_sig_nv>.+)$')
 
         # Init vars
         parsed_dict = {}
@@ -1703,122 +1701,122 @@ class ShowNetworkClocksSynchronizationT0Detail(ShowNetworkClocksSynchronizationT
             output = self.device.execute(self.cli_command)
 
         # Automatic selection process : Enable
-        p0 = re.compile(r'^Automatic\s+selection\s+process\s*:\s*'
-                        r'(?P<automatic_selection_process>.+)$')
+        p0 = regex_engine.compile(r'^Automatic\s+selection\s+process\s*:\s*'
+                                  r'(?P<automatic_selection_process>.+)$')
 
         # Equipment Clock : 2048 (EEC-Option1)
-        p1 = re.compile(r'^Equipment\s+Clock\s*:\s*'
-                        r'(?P<equipment_clock>\d+\s*\(.+\))$')
+        p1 = regex_engine.compile(r'^Equipment\s+Clock\s*:\s*'
+                                  r'(?P<equipment_clock>\d+\s*\(.+\))$')
 
         # Clock State : Frequency Locked
-        p2 = re.compile(r'^Clock\s+State\s*:\s*'
-                        r'(?P<clock_state>.+)$')
+        p2 = regex_engine.compile(r'^Clock\s+State\s*:\s*'
+                                  r'(?P<clock_state>.+)$')
 
         # Clock Mode : QL-Enable
-        p3 = re.compile(r'^Clock\s+Mode\s*:\s*'
-                        r'(?P<clock_mode>.+)$')
+        p3 = regex_engine.compile(r'^Clock\s+Mode\s*:\s*'
+                                  r'(?P<clock_mode>.+)$')
 
         # ESMC : Enabled
-        p4 = re.compile(r'^ESMC\s*:\s*'
-                        r'(?P<esmc_state>.+)$')
+        p4 = regex_engine.compile(r'^ESMC\s*:\s*'
+                                  r'(?P<esmc_state>.+)$')
 
         # SSM Option : 1
         # SSM Option : GEN1
-        p5 = re.compile(r'^SSM\s+Option\s*:\s*'
-                        r'(?P<ssm_option>.+)$')
+        p5 = regex_engine.compile(r'^SSM\s+Option\s*:\s*'
+                                  r'(?P<ssm_option>.+)$')
 
         # T0 : Internal
         # T0 : GigabitEthernet0/0/2
-        p6 = re.compile(r'^T0\s*:\s*'
-                        r'(?P<t0>.+)$')
+        p6 = regex_engine.compile(r'^T0\s*:\s*'
+                                  r'(?P<t0>.+)$')
 
         # Hold-off (global) : 300 ms
-        p7 = re.compile(r'^Hold-off\s+\(global\)\s*:\s*'
-                        r'(?P<global_hold_off_time>\d+)\s*ms$')
+        p7 = regex_engine.compile(r'^Hold-off\s+\(global\)\s*:\s*'
+                                  r'(?P<global_hold_off_time>\d+)\s*ms$')
 
         # Wait-to-restore (global) : 10 sec
-        p8 = re.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
-                        r'(?P<global_wait_to_restore>\d+)\s*sec$')
+        p8 = regex_engine.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
+                                  r'(?P<global_wait_to_restore>\d+)\s*sec$')
 
         # Tsm Delay : 180 ms
-        p9 = re.compile(r'^Tsm\s+Delay\s*:\s*'
-                        r'(?P<tsm_delay>\d+)\s*ms$')
+        p9 = regex_engine.compile(r'^Tsm\s+Delay\s*:\s*'
+                                  r'(?P<tsm_delay>\d+)\s*ms$')
 
         # Revertive : No
-        p10 = re.compile(r'^Revertive\s*:\s*'
-                         r'(?P<revertive>.+)$')
+        p10 = regex_engine.compile(r'^Revertive\s*:\s*'
+                                   r'(?P<revertive>.+)$')
 
         # Force Switch: FALSE
-        p11 = re.compile(r'^Force\s+Switch\s*:\s*'
-                         r'(?P<force_switch>.+)$')
+        p11 = regex_engine.compile(r'^Force\s+Switch\s*:\s*'
+                                   r'(?P<force_switch>.+)$')
 
         # Manual Switch: FALSE
-        p12 = re.compile(r'^Manual\s+Switch\s*:\s*'
-                         r'(?P<manual_switch>.+)$')
+        p12 = regex_engine.compile(r'^Manual\s+Switch\s*:\s*'
+                                   r'(?P<manual_switch>.+)$')
 
         # Number of synchronization sources: 4
-        p13 = re.compile(r'^Number\s+of\s+synchronization\s+sources\s*:\s*'
-                         r'(?P<num_of_sync_sources>\d+)$')
+        p13 = regex_engine.compile(r'^Number\s+of\s+synchronization\s+sources\s*:\s*'
+                                   r'(?P<num_of_sync_sources>\d+)$')
 
         # Squelch Threshold: QL-SEC
-        p14 = re.compile(r'^Squelch\s+Threshold\s*:\s*'
-                         r'(?P<squelch_threshold>.+)$')
+        p14 = regex_engine.compile(r'^Squelch\s+Threshold\s*:\s*'
+                                   r'(?P<squelch_threshold>.+)$')
 
         # Last transition recorded: (begin)-> 2A (ql_mode_enable)-> 1A
-        p15 = re.compile(r'^Last\s+transition\s+recorded\s*:\s*'
-                         r'(?P<last_transition_recorded>.+)$')
+        p15 = regex_engine.compile(r'^Last\s+transition\s+recorded\s*:\s*'
+                                   r'(?P<last_transition_recorded>.+)$')
 
         # Internal
         # GigabitEthernet0/0/2
-        p16 = re.compile(r'^(?P<local_interface>[a-zA-Z]+[\d/]*)$')
+        p16 = regex_engine.compile(r'^(?P<local_interface>[a-zA-Z]+[\d/]*)$')
 
         # Description: None
-        p17 = re.compile(r'^Description\s*:\s*'
-                         r'(?P<description>.+)$')
+        p17 = regex_engine.compile(r'^Description\s*:\s*'
+                                   r'(?P<description>.+)$')
 
         # Signal Type: NA
-        p18 = re.compile(r'^Signal\s+Type\s*:\s*'
-                         r'(?P<signal_type>.+)$')
+        p18 = regex_engine.compile(r'^Signal\s+Type\s*:\s*'
+                                   r'(?P<signal_type>.+)$')
 
         # Mode: NA(Ql-enabled)
-        p19 = re.compile(r'^Mode\s*:\s*'
-                         r'(?P<mode>.+)$')
+        p19 = regex_engine.compile(r'^Mode\s*:\s*'
+                                   r'(?P<mode>.+)$')
 
         # SSM Tx: DISABLED
-        p20 = re.compile(r'^SSM\s+Tx\s*:\s*'
-                         r'(?P<ssm_tx>.+)$')
+        p20 = regex_engine.compile(r'^SSM\s+Tx\s*:\s*'
+                                   r'(?P<ssm_tx>.+)$')
 
         # SSM Rx: DISABLED
-        p21 = re.compile(r'^SSM\s+Rx\s*:\s*'
-                         r'(?P<ssm_rx>.+)$')
+        p21 = regex_engine.compile(r'^SSM\s+Rx\s*:\s*'
+                                   r'(?P<ssm_rx>.+)$')
 
         # ESMC Tx: ENABLED
-        p22 = re.compile(r'^ESMC\s+Tx\s*:\s*'
-                         r'(?P<esmc_tx>.+)$')
+        p22 = regex_engine.compile(r'^ESMC\s+Tx\s*:\s*'
+                                   r'(?P<esmc_tx>.+)$')
 
         # ESMC Rx: ENABLED
-        p23 = re.compile(r'^ESMC\s+Rx\s*:\s*'
-                         r'(?P<esmc_rx>.+)$')
+        p23 = regex_engine.compile(r'^ESMC\s+Rx\s*:\s*'
+                                   r'(?P<esmc_rx>.+)$')
 
         # QL Receive: QL-SEC
-        p24 = re.compile(r'^QL\s+Receive\s*:\s*'
-                         r'(?P<ql_receive>.+)$')
+        p24 = regex_engine.compile(r'^QL\s+Receive\s*:\s*'
+                                   r'(?P<ql_receive>.+)$')
 
         # QL Receive Configured: -
-        p25 = re.compile(r'^QL\s+Receive\s+Configured\s*:\s*'
-                         r'(?P<ql_receive_configured>.+)$')
+        p25 = regex_engine.compile(r'^QL\s+Receive\s+Configured\s*:\s*'
+                                   r'(?P<ql_receive_configured>.+)$')
 
         # QL Receive Overrided: -
-        p26 = re.compile(r'^QL\s+Receive\s+Overrided\s*:\s*'
-                         r'(?P<ql_receive_overrided>.+)$')
+        p26 = regex_engine.compile(r'^QL\s+Receive\s+Overrided\s*:\s*'
+                                   r'(?P<ql_receive_overrided>.+)$')
 
         # QL Transmit: QL-DNU
-        p27 = re.compile(r'^QL\s+Transmit\s*:\s*'
-                         r'(?P<ql_transmit>.+)$')
+        p27 = regex_engine.compile(r'^QL\s+Transmit\s*:\s*'
+                                   r'(?P<ql_transmit>.+)$')
 
         # QL Transmit Configured: -
-        p28 = re.compile(r'^QL\s+Transmit\s+Configured\s*:\s*'
-                         r'(?P<ql_transmit_configured>.+)$')
+        p28 = regex_engine.compile(r'^QL\s+Transmit\s+Configured\s*:\s*'
+                                   r'(?P<ql_transmit_configured>.+)$')
 
         # Init vars
         parsed_dict = {}
@@ -2082,55 +2080,55 @@ class ShowNetworkClocksSynchronizationT0(ShowNetworkClocksSynchronizationT0Schem
             output = self.device.execute(self.cli_command)
 
         # Automatic selection process : Enable
-        p0 = re.compile(r'^Automatic\s+selection\s+process\s*:\s*'
-                        r'(?P<automatic_selection_process>.+)$')
+        p0 = regex_engine.compile(r'^Automatic\s+selection\s+process\s*:\s*'
+                                  r'(?P<automatic_selection_process>.+)$')
 
         # Equipment Clock : 2048 (EEC-Option1)
-        p1 = re.compile(r'^Equipment\s+Clock\s*:\s*'
-                        r'(?P<equipment_clock>\d+\s*\(.+\))$')
+        p1 = regex_engine.compile(r'^Equipment\s+Clock\s*:\s*'
+                                  r'(?P<equipment_clock>\d+\s*\(.+\))$')
 
         # Clock Mode : QL-Enable
-        p2 = re.compile(r'^Clock\s+Mode\s*:\s*'
-                        r'(?P<clock_mode>.+)$')
+        p2 = regex_engine.compile(r'^Clock\s+Mode\s*:\s*'
+                                  r'(?P<clock_mode>.+)$')
 
         # ESMC : Enabled
-        p3 = re.compile(r'^ESMC\s*:\s*'
-                        r'(?P<esmc_state>.+)$')
+        p3 = regex_engine.compile(r'^ESMC\s*:\s*'
+                                  r'(?P<esmc_state>.+)$')
 
         # SSM Option : 1
         # SSM Option : GEN1
-        p4 = re.compile(r'^SSM\s+Option\s*:\s*'
-                        r'(?P<ssm_option>.+)$')
+        p4 = regex_engine.compile(r'^SSM\s+Option\s*:\s*'
+                                  r'(?P<ssm_option>.+)$')
 
         # T0 : Internal
         # T0 : GigabitEthernet0/0/2
-        p5 = re.compile(r'^T0\s*:\s*'
-                        r'(?P<t0>.+)$')
+        p5 = regex_engine.compile(r'^T0\s*:\s*'
+                                  r'(?P<t0>.+)$')
 
         # Hold-off (global) : 300 ms
-        p6 = re.compile(r'^Hold-off\s+\(global\)\s*:\s*'
-                        r'(?P<global_hold_off_time>\d+)\s*ms$')
+        p6 = regex_engine.compile(r'^Hold-off\s+\(global\)\s*:\s*'
+                                  r'(?P<global_hold_off_time>\d+)\s*ms$')
 
         # Wait-to-restore (global) : 10 sec
-        p7 = re.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
-                        r'(?P<global_wait_to_restore>\d+)\s*sec$')
+        p7 = regex_engine.compile(r'^Wait-to-restore\s+\(global\)\s*:\s*'
+                                  r'(?P<global_wait_to_restore>\d+)\s*sec$')
 
         # Tsm Delay : 180 ms
-        p8 = re.compile(r'^Tsm\s+Delay\s*:\s*'
-                        r'(?P<tsm_delay>\d+)\s*ms$')
+        p8 = regex_engine.compile(r'^Tsm\s+Delay\s*:\s*'
+                                  r'(?P<tsm_delay>\d+)\s*ms$')
 
         # Revertive : No
-        p9 = re.compile(r'^Revertive\s*:\s*'
-                        r'(?P<revertive>.+)$')
+        p9 = regex_engine.compile(r'^Revertive\s*:\s*'
+                                  r'(?P<revertive>.+)$')
 
         #  Internal             NA          NA/Dis       251   QL-SEC    NA        NA
         # *Gi0/0/2              NA          Sync/En      1     QL-SEC    -         -
-        p10 = re.compile(r'(?P<local_interface>\S+) +'
-                         r'(?P<signal_type>\S+) +'
-                         r'(?P<mode>\S+/\S+) +(?P<priority>\d+) +'
-                         r'(?P<ql_in>\S+) +'
-                         r'(?P<esmc_tx>\S+) +'
-                         r'(?P<esmc_rx>\S+)$')
+        p10 = regex_engine.compile(r'(?P<local_interface>\S+) +'
+                                   r'(?P<signal_type>\S+) +'
+                                   r'(?P<mode>\S+/\S+) +(?P<priority>\d+) +'
+                                   r'(?P<ql_in>\S+) +'
+                                   r'(?P<esmc_tx>\S+) +'
+                                   r'(?P<esmc_rx>\S+)$')
 
         # Init vars
         parsed_dict = {}
@@ -5,13 +5,13 @@ IOSXE parsers for the following show commands:
     * show nmsp status
 
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================================
 #  Schema for show nmsp status
@@ -47,14 +47,14 @@ class ShowNmspStatus(ShowNmspStatusSchema):
         # initial variables
         ret_dict = dict()
 
-        p_line = re.compile(
+        p_line = regex_engine.compile(
             # Parsing line:
             # 9.9.71.110|2001:bebe::1                          Active    439           439           22965       22          TLS
             r'(?P<ip_addr>(^(\d{1,3}\.){3}\d{1,3})|([a-fA-F\d]{1,4}:*:?){1,7}[a-fA-F\d]{1,4})\s+(?P<active>([A-Za-z]+))\s+(?P<tx_echo_resp>(\d+))\s+(?P<rx_echo_req>(\d+))\s+(?P<tx_data>(\d+))\s+(?P<rx_data>(\d+))\s+(?P<transport>(\w+)$)'
         )
         for line in output.splitlines():
             # 9.9.71.110|2001:bebe::1                          Active    439           439           22965       22          TLS
-            m = re.match(p_line, line)
+            m = regex_engine.match(p_line, line)
             if m:
                 m_dict = m.groupdict()
                 ip_addr = m_dict.get('ip_addr')
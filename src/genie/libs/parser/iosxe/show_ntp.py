@@ -8,13 +8,13 @@ IOSXE parsers for the following show commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================================
 #  Schema for show ntp associations
@@ -87,11 +87,11 @@ class ShowNtpAssociations(ShowNtpAssociationsSchema):
         # +~10.16.2.2       127.127.1.1      8    137     64     1 15.917 556.786 7938.0
         # *172.16.229.65    .GNSS.           1 -   59   64  377    1.436   73.819  10.905
         # *~2001:DB8:EEE8  2001:DB8::EEE8   2    337    512   377  1.957  -2.107  1.078
-        p1 = re.compile(r'^(?P<mode_code>[x\*\#\+\- ])?(?P<configured>[\~])? *(?P<remote>[\w\.\:]+) +'
-                        r'(?P<refid>[\w\.\:]+) +(?P<stratum>\d+) +'
-                        r'(?P<receive_time>[\d\-]+) +(?P<poll>\d+) +'
-                        r'(?P<reach>\d+) +(?P<delay>[\d\.]+) +'
-                        r'(?P<offset>[\d\.\-]+) +(?P<disp>[\d\.\-]+)$')
+        p1 = regex_engine.compile(r'^(?P<mode_code>[x\*\#\+\- ])?(?P<configured>[\~])? *(?P<remote>[\w\.\:]+) +'
+                                  r'(?P<refid>[\w\.\:]+) +(?P<stratum>\d+) +'
+                                  r'(?P<receive_time>[\d\-]+) +(?P<poll>\d+) +'
+                                  r'(?P<reach>\d+) +(?P<delay>[\d\.]+) +'
+                                  r'(?P<offset>[\d\.\-]+) +(?P<disp>[\d\.\-]+)$')
 
 
         for line in out.splitlines():
@@ -205,34 +205,34 @@ class ShowNtpStatus(ShowNtpStatusSchema):
         # Clock is synchronized, stratum 1, reference is .LOCL.
         # Clock is synchronized, stratum 2, reference assoc id 1, reference is 192.0.2.1
         # Clock is synchronized (adding leap second), stratum 1, reference is 192.168.4.20
-        p1 = re.compile(r'Clock +is +(?P<clock_state>\w+)(?P<leapsecond> +\(adding +leap +second\))?,'
+        p1 = regex_engine.compile(r'Clock +is +(?P<clock_state>\w+)(?P<leapsecond> +\(adding +leap +second\))?,'
             r' +stratum +(?P<stratum>\d+),(?: +reference +assoc +id +'
             r'(?P<assoc_id>[\d]+),)? +reference +is +(?P<refid>[\w\.]+)$')
 
         # Clock is unsynchronized, stratum 16, no reference clock
-        p1_1 = re.compile(r'^Clock +is +(?P<clock_state>\w+), +stratum +(?P<stratum>\d+), +no +reference +clock$')
+        p1_1 = regex_engine.compile(r'^Clock +is +(?P<clock_state>\w+), +stratum +(?P<stratum>\d+), +no +reference +clock$')
 
         # nominal freq is 250.0000 Hz, actual freq is 250.0000 Hz, precision is 2**10
-        p2 = re.compile(r'^nominal +freq +is +(?P<nom_freq>[\d\.]+) +Hz, actual +freq +is'
-                         r' +(?P<act_freq>[\d\.]+) +Hz, precision +is +(?P<precision>[\d\*]+)$')
+        p2 = regex_engine.compile(r'^nominal +freq +is +(?P<nom_freq>[\d\.]+) +Hz, actual +freq +is'
+                                   r' +(?P<act_freq>[\d\.]+) +Hz, precision +is +(?P<precision>[\d\*]+)$')
 
         # ntp uptime is 1921500 (1/100 of seconds), resolution is 4000
-        p3 = re.compile(r'^ntp +uptime +is +(?P<uptime>[\d\s\w\/\(\)]+), +resolution +is +(?P<resolution>[\d]+)$')
+        p3 = regex_engine.compile(r'^ntp +uptime +is +(?P<uptime>[\d\s\w\/\(\)]+), +resolution +is +(?P<resolution>[\d]+)$')
 
         # reference time is DF9FFBA0.8B020DC8 (15:43:28.543 UTC Wed Nov 21 2018)
-        p4 = re.compile(r'^reference +time +is +(?P<reftime>[\w\s\.\:\(\)]+)$')
+        p4 = regex_engine.compile(r'^reference +time +is +(?P<reftime>[\w\s\.\:\(\)]+)$')
 
         # clock offset is 0.0000 msec, root delay is 0.00 msec
-        p5 = re.compile(r'^clock +offset +is +(?P<offset>[\d\.]+) +msec, +root +delay +is +(?P<rootdelay>[\d\.]+) +msec$')
+        p5 = regex_engine.compile(r'^clock +offset +is +(?P<offset>[\d\.]+) +msec, +root +delay +is +(?P<rootdelay>[\d\.]+) +msec$')
 
         # root dispersion is 2.31 msec, peer dispersion is 1.20 msec
-        p6 = re.compile(r'^root +dispersion +is +(?P<rootdispersion>[\d\.]+) +msec, +peer +dispersion +is +(?P<peerdispersion>[\d\.]+) +msec$')
+        p6 = regex_engine.compile(r'^root +dispersion +is +(?P<rootdispersion>[\d\.]+) +msec, +peer +dispersion +is +(?P<peerdispersion>[\d\.]+) +msec$')
 
         # loopfilter state is 'CTRL' (Normal Controlled Loop), drift is 0.000000000 s/s
-        p7 = re.compile(r'^loopfilter +state +is +(?P<leap_status>[\'\s\w\(\)]+), +drift +is +(?P<drift>[\d\.\s\w\/]+)$')
+        p7 = regex_engine.compile(r'^loopfilter +state +is +(?P<leap_status>[\'\s\w\(\)]+), +drift +is +(?P<drift>[\d\.\s\w\/]+)$')
 
         # system poll interval is 16, last update was 9 sec ago.
-        p8 = re.compile(r'^system +poll +interval +is +(?P<poll>\d+), +last +update +was +(?P<last_update>[\d\s\w]+).*$')
+        p8 = regex_engine.compile(r'^system +poll +interval +is +(?P<poll>\d+), +last +update +was +(?P<last_update>[\d\s\w]+).*$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -376,9 +376,9 @@ class ShowNtpConfig(ShowNtpConfigSchema):
         # ntp server vrf VRF1 10.64.4.4
         # ntp server 10.16.2.2 source Loopback0
         # ntp server 10.3.254.100 prefer
-        p1 = re.compile(r"^ntp +(?P<type>\w+)( +vrf +(?P<vrf>\S+))? "
-                         r"+(?P<address>[\w\.\:]+)( +source +"
-                         r"(?P<source_interface>[\w]+))?(?P<prefer> prefer)?$")
+        p1 = regex_engine.compile(r"^ntp +(?P<type>\w+)( +vrf +(?P<vrf>\S+))? "
+                                   r"+(?P<address>[\w\.\:]+)( +source +"
+                                   r"(?P<source_interface>[\w]+))?(?P<prefer> prefer)?$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -523,67 +523,67 @@ class ShowNtpAssociationsDetail(ShowNtpAssociationsDetailSchema):
         # 192.168.13.33 configured, selected, sane, valid, stratum 3
         # 192.168.13.57 configured, our_master, sane, valid, stratum 3
         # 192.168.255.254 configured, ipv4, authenticated (' ' reject), insane, invalid, stratum 3
-        p1 = re.compile(r'^(?P<address>[\w\.\:]+) +(?P<configured>\w+),( +(?P<ip_type>ipv4|ipv6),)?'
-                         r'( +(?P<authenticated>authenticated)( +\(\'\W\' +\S+\))?,)?( +(?P<our_master>our_master),)?'
-                         r'( +(?P<selected>selected),)? +(?P<insane>\w+), +(?P<invalid>\w+),'
-                         r'( +(?P<unsynced>unsynced),)? +stratum +(?P<stratum>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<address>[\w\.\:]+) +(?P<configured>\w+),( +(?P<ip_type>ipv4|ipv6),)?'
+                                   r'( +(?P<authenticated>authenticated)( +\(\'\W\' +\S+\))?,)?( +(?P<our_master>our_master),)?'
+                                   r'( +(?P<selected>selected),)? +(?P<insane>\w+), +(?P<invalid>\w+),'
+                                   r'( +(?P<unsynced>unsynced),)? +stratum +(?P<stratum>\d+)$')
 
         # ref ID 10.10.10.254      , time DBAB02D6.9E354130 (18:49:35.873 UTC Thu Jul 11 2019)
         # ref ID 172.16.255.254, time DBAB02D6.9E354130 (16:08:06.618 EST Fri Oct 14 2016)
-        p2 = re.compile(r'^ref +ID +(?P<refid>[\w\.]+)( +)?, +time +(?P<input_time>[\w\:\s\(\)\.]+)$')
+        p2 = regex_engine.compile(r'^ref +ID +(?P<refid>[\w\.]+)( +)?, +time +(?P<input_time>[\w\:\s\(\)\.]+)$')
 
         # our mode client, peer mode server, our poll intvl 512, peer poll intvl 512
         # our mode client, peer mode server, our poll intvl 512, peer poll intvl 512
-        p3 = re.compile(r'^our +mode +(?P<mode>\w+), +peer +mode +(?P<peer_mode>\w+),'
-                         r' +our +poll +intvl +(?P<poll_intv>\d+),'
-                         r' +peer +poll +intvl +(?P<peer_poll_intv>\d+)$')
+        p3 = regex_engine.compile(r'^our +mode +(?P<mode>\w+), +peer +mode +(?P<peer_mode>\w+),'
+                                   r' +our +poll +intvl +(?P<poll_intv>\d+),'
+                                   r' +peer +poll +intvl +(?P<peer_poll_intv>\d+)$')
 
         # root delay 0.00 msec, root disp 14.52, reach 377, sync dist 28.40
-        p4 = re.compile(r'^root +delay +(?P<root_delay_msec>[\d\.]+) +msec, +root +disp +(?P<root_disp>[\d\.]+),'
-                         r' +reach +(?P<reach>[\d\.]+),'
-                         r' +sync +dist +(?P<sync_dist>[\d\.]+)$')
+        p4 = regex_engine.compile(r'^root +delay +(?P<root_delay_msec>[\d\.]+) +msec, +root +disp +(?P<root_disp>[\d\.]+),'
+                                   r' +reach +(?P<reach>[\d\.]+),'
+                                   r' +sync +dist +(?P<sync_dist>[\d\.]+)$')
 
         # delay 0.00 msec, offset 0.0000 msec, dispersion 7.23, jitter 0.97 
         # delay 0.00 msec, offset -1.0000 msec, dispersion 5.64, jitter 0.97 msec
         # delay 7.86 msec, offset 11.176 msec, dispersion 3.62
-        p5 = re.compile(r'^delay +(?P<delay_msec>[\d\.]+) +msec, +offset +(?P<offset_msec>[\d\.\-]+)'
-                         r' +msec, +dispersion +(?P<dispersion>[\d\.]+)'
-                         r'(, +jitter +(?P<jitter_msec>[\d\.]+)( +msec)?)?$')
+        p5 = regex_engine.compile(r'^delay +(?P<delay_msec>[\d\.]+) +msec, +offset +(?P<offset_msec>[\d\.\-]+)'
+                                   r' +msec, +dispersion +(?P<dispersion>[\d\.]+)'
+                                   r'(, +jitter +(?P<jitter_msec>[\d\.]+)( +msec)?)?$')
 
         # precision 2**10, version 4
-        p6 = re.compile(r'^precision +(?P<precision>[\d\*]+), +version +(?P<version>\d+)$')
+        p6 = regex_engine.compile(r'^precision +(?P<precision>[\d\*]+), +version +(?P<version>\d+)$')
 
         # assoc id 62758, assoc name 192.168.255.254
         # assoc ID 2, assoc name myserver
         # assoc ID 1, assoc name 192.168.1.55,
-        p7 = re.compile(r'^assoc +(id|ID) +(?P<assoc_id>\d+), +assoc +name +(?P<assoc_name>[\w\.]+),?$')
+        p7 = regex_engine.compile(r'^assoc +(id|ID) +(?P<assoc_id>\d+), +assoc +name +(?P<assoc_name>[\w\.]+),?$')
 
         # assoc in packets 27, assoc out packets 27, assoc error packets 0
-        p8 = re.compile(r'^assoc +in +packets +(?P<assoc_in_packets>\d+),'
-                         r' +assoc +out +packets +(?P<assoc_out_packets>\d+),'
-                         r' +assoc +error +packets +(?P<assoc_error_packets>[\d\.]+)$')
+        p8 = regex_engine.compile(r'^assoc +in +packets +(?P<assoc_in_packets>\d+),'
+                                   r' +assoc +out +packets +(?P<assoc_out_packets>\d+),'
+                                   r' +assoc +error +packets +(?P<assoc_error_packets>[\d\.]+)$')
 
         # org time 00000000.00000000 (09:00:00.000 EST Mon Jan 1 1900)
-        p9 = re.compile(r'^org +time +(?P<org_time>[\w\:\s\(\)\.]+)$')
+        p9 = regex_engine.compile(r'^org +time +(?P<org_time>[\w\:\s\(\)\.]+)$')
 
         # rec time DBAB046D.A8B43B28 (16:14:53.659 EST Fri Oct 14 2016)
         # rcv time AFE252E2.3D7E464D (00:12:34.240 PDT Mon Jan 1 1900)
-        p10 = re.compile(r'^(rec|rcv) +time +(?P<rec_time>[\w\:\s\(\)\.]+)$')
+        p10 = regex_engine.compile(r'^(rec|rcv) +time +(?P<rec_time>[\w\:\s\(\)\.]+)$')
 
         # xmt time DBAB046D.A8B43B28 (16:14:53.659 EST Fri Oct 14 2016)
-        p11 = re.compile(r'^xmt +time +(?P<xmt_time>[\w\:\s\(\)\.]+)$')
+        p11 = regex_engine.compile(r'^xmt +time +(?P<xmt_time>[\w\:\s\(\)\.]+)$')
 
         # filtdelay =     0.00    1.00    0.00    0.00    0.00    0.00    0.00    0.00
-        p12 = re.compile(r'^filtdelay +\= +(?P<filtdelay>[\d\s\.]+)$')
+        p12 = regex_engine.compile(r'^filtdelay +\= +(?P<filtdelay>[\d\s\.]+)$')
 
         # filtoffset =    0.00    0.50    0.00    1.00    1.00    1.00    1.00    1.00
-        p13 = re.compile(r'^filtoffset +\= +(?P<filtoffset>[\d\s\.\-]+)$')
+        p13 = regex_engine.compile(r'^filtoffset +\= +(?P<filtoffset>[\d\s\.\-]+)$')
 
         # filterror =     1.95    5.89    9.88   13.89   15.84   17.79   19.74   21.76
-        p14 = re.compile(r'^filterror +\= +(?P<filterror>[\d\s\.]+)$')
+        p14 = regex_engine.compile(r'^filterror +\= +(?P<filterror>[\d\s\.]+)$')
 
         # minpoll = 6, maxpoll = 10
-        p15 = re.compile(r'^minpoll +\= +(?P<minpoll>\d+), +maxpoll +\= +(?P<maxpoll>\d+)$')
+        p15 = regex_engine.compile(r'^minpoll +\= +(?P<minpoll>\d+), +maxpoll +\= +(?P<maxpoll>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
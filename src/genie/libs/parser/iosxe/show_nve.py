@@ -17,14 +17,14 @@ IOSXE parsers for the following show commands:
 
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 from genie.parsergen import oper_fill_tabular
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================================
 #  schema for show nve peers
@@ -107,9 +107,9 @@ class ShowNvePeers(ShowNvePeersSchema):
         # nve1       200052   L2CP 20.0.101.3       3              200052     UP   N/A  4d17h
         # nve1       200052   L2CP 30.0.107.78      6              200052     UP   N/A  4d17h
 
-        p1 = re.compile(r'^\s*(?P<nve_interface>[\w\/]+)\s+(?P<vni>[\d]+)\s+'
-                        r'(?P<type>(L3CP|L2CP))\s+(?P<peer_ip>[\w\.\:]+)\s+(?P<rmac_num_rt>[\S]+)\s+'
-                        r'(?P<evni>[\d]+)\s+(?P<state>(UP|DN|LP|NA|--|DOWN))\s+(?P<flags>[\S]+)\s+(?P<uptime>[\S]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<nve_interface>[\w\/]+)\s+(?P<vni>[\d]+)\s+'
+                                  r'(?P<type>(L3CP|L2CP))\s+(?P<peer_ip>[\w\.\:]+)\s+(?P<rmac_num_rt>[\S]+)\s+'
+                                  r'(?P<evni>[\d]+)\s+(?P<state>(UP|DN|LP|NA|--|DOWN))\s+(?P<flags>[\S]+)\s+(?P<uptime>[\S]+)$')
 
         for line in out.splitlines():
             if line:
@@ -217,49 +217,49 @@ class ShowNveInterfaceDetail(ShowNveInterfaceDetailSchema):
 
         # Interface: nve1, State: Admin Up, Oper Down, Encapsulation: Vxlan,
         # Interface: nve1, State: Admin Up, Oper Down
-        p1 = re.compile(r'^Interface:\s+(?P<interface>[a-zA-Z0-9 ]+),'
-                        r'\s+State:\s+Admin\s+(?P<admin_state>[\w]+),'
-                        r'\s+Oper\s+(?P<oper_state>[\w\s]+)(,'
-                        r'\s+Encapsulation:\s+(?P<encap>[\w]+),)?$')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<interface>[a-zA-Z0-9 ]+),'
+                                  r'\s+State:\s+Admin\s+(?P<admin_state>[\w]+),'
+                                  r'\s+Oper\s+(?P<oper_state>[\w\s]+)(,'
+                                  r'\s+Encapsulation:\s+(?P<encap>[\w]+),)?$')
 
         # Encapsulation: Vxlan IPv4
         # Encapsulation: Vxlan dual stack prefer IPv4
-        p2 = re.compile(r'^Encapsulation:\s+(?P<encap>[\w ]+)$')
+        p2 = regex_engine.compile(r'^Encapsulation:\s+(?P<encap>[\w ]+)$')
 
         # Multicast BUM encapsulation: Vxlan IPv4
-        p3 = re.compile(r'^Multicast BUM encapsulation:\s+(?P<encap>[\w ]+)$')
+        p3 = regex_engine.compile(r'^Multicast BUM encapsulation:\s+(?P<encap>[\w ]+)$')
 
         # BGP host reachability: Enabled, VxLAN dport: 4789
-        p4 = re.compile(r'^BGP host reachability:\s+(?P<bgp_host_reachability>[\w]+),'
-                        r'\s+VxLAN dport:\s+(?P<vxlan_dport>\d+)$')
+        p4 = regex_engine.compile(r'^BGP host reachability:\s+(?P<bgp_host_reachability>[\w]+),'
+                                  r'\s+VxLAN dport:\s+(?P<vxlan_dport>\d+)$')
 
         # VNI number: L3CP 30 L2CP 3 L2DP 0
-        p5 = re.compile(r'^VNI number:\s+L3CP\s+(?P<num_l3vni_cp>[\d]+)'
-                        r'\s+L2CP\s+(?P<num_l2vni_cp>[\d]+)'
-                        r'\s+L2DP\s+(?P<num_l2vni_dp>[\d]+)$')
+        p5 = regex_engine.compile(r'^VNI number:\s+L3CP\s+(?P<num_l3vni_cp>[\d]+)'
+                                  r'\s+L2CP\s+(?P<num_l2vni_cp>[\d]+)'
+                                  r'\s+L2DP\s+(?P<num_l2vni_dp>[\d]+)$')
 
         # source-interface: Loopback2 (primary: 1.1.1.3 vrf: 0)
         # source-interface: Loopback1 (primary: UNKNOWN vrf: 0)
-        p6 = re.compile(r'^source-interface:\s+(?P<src_intf>[a-zA-Z0-9]+)\s+'
-                        r'\(primary:\s*(?P<primary_ip>UNKNOWN|[0-9a-fA-F\.:]+)\s+'
-                        r'vrf:\s*(?P<vrf>[a-zA-Z0-9]+)\)$')
+        p6 = regex_engine.compile(r'^source-interface:\s+(?P<src_intf>[a-zA-Z0-9]+)\s+'
+                                  r'\(primary:\s*(?P<primary_ip>UNKNOWN|[0-9a-fA-F\.:]+)\s+'
+                                  r'vrf:\s*(?P<vrf>[a-zA-Z0-9]+)\)$')
 
         # source-interface: Loopback1 (primary: ABCD:1::2 1.1.1.2 vrf:0)
-        p6_1 = re.compile(r'^source-interface:\s+(?P<src_intf>[a-zA-Z0-9]+)\s+'
-                          r'\(primary:\s*(?P<primary_ip>[0-9a-fA-F\.:]+)\s+'
-                          r'(?P<secondary_ip>[0-9a-fA-F\.:]+)\s+'
-                          r'vrf:\s*(?P<vrf>[a-zA-Z0-9]+)\)$')
+        p6_1 = regex_engine.compile(r'^source-interface:\s+(?P<src_intf>[a-zA-Z0-9]+)\s+'
+                                    r'\(primary:\s*(?P<primary_ip>[0-9a-fA-F\.:]+)\s+'
+                                    r'(?P<secondary_ip>[0-9a-fA-F\.:]+)\s+'
+                                    r'vrf:\s*(?P<vrf>[a-zA-Z0-9]+)\)$')
 
         # tunnel interface: Tunnel0
         # tunnel interface: Tunnel1 Tunnel4
-        p7 = re.compile(r'^tunnel interface:\s+(?P<tunnel_intf>[a-zA-Z0-9 ]+)$')
+        p7 = regex_engine.compile(r'^tunnel interface:\s+(?P<tunnel_intf>[a-zA-Z0-9 ]+)$')
 
         # 1          11          0          0
-        p8 = re.compile(r'^(?P<pkts_in>[\d]+)\s+(?P<bytes_in>[\d]+)\s'
-                        r'+(?P<pkts_out>[\d]+)\s+(?P<bytes_out>[\d]+)$')
+        p8 = regex_engine.compile(r'^(?P<pkts_in>[\d]+)\s+(?P<bytes_in>[\d]+)\s'
+                                  r'+(?P<pkts_out>[\d]+)\s+(?P<bytes_out>[\d]+)$')
 
         # Tunnel0 Tunnel4
-        p9 = re.compile(r'^(?P<tunnel_primary>[a-zA-Z0-9]+)\s+(?P<tunnel_secondary>[a-zA-Z0-9]+)$')
+        p9 = regex_engine.compile(r'^(?P<tunnel_primary>[a-zA-Z0-9]+)\s+(?P<tunnel_secondary>[a-zA-Z0-9]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -498,71 +498,71 @@ class ShowNveVniDetail(ShowNveVniDetailSchema):
             output = self.device.execute(self.cli_command.format(vni=vni))
 
         # nve1      20011      227.0.0.11       Down       L2CP  11    CLI red
-        p1 = re.compile(r'^(?P<nve_if>nve[0-9]+)\s*(?P<vni_id>[0-9]*)\s*'
-                        r'(?P<mcast_ip>(([0-9]{1,3}\.){3}[0-9]{1,3})|(N\/A))?\s(?P<mcast_ipv6>\S+)?\s+'
-                        r'(?P<vni_state>\S+\s*\S*)\s+(?P<vni_type>L\S+)'
-                        r'\s+(?P<vlan_id>\S+)\s+(?P<vni_origin>\S+)'
-                        r'\s+(?P<vni_vrf>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<nve_if>nve[0-9]+)\s*(?P<vni_id>[0-9]*)\s*'
+                                  r'(?P<mcast_ip>(([0-9]{1,3}\.){3}[0-9]{1,3})|(N\/A))?\s(?P<mcast_ipv6>\S+)?\s+'
+                                  r'(?P<vni_state>\S+\s*\S*)\s+(?P<vni_type>L\S+)'
+                                  r'\s+(?P<vlan_id>\S+)\s+(?P<vni_origin>\S+)'
+                                  r'\s+(?P<vni_vrf>\S+)$')
 
         # nve1       1000420    239.0.4.120 FF04::4:120 \
         #                               BD Down/Re L2CP  N/A   CLI N/A
         # nve1       1000101    239.0.0.101 FF04::1:120 \
         #                               Up         L2CP  101   CLI VRF-101
-        p1_1 = re.compile(r'^(?P<nve_if>nve[0-9]+)\s*(?P<vni_id>[0-9]*)\s*'
-                          r'(?P<mcast_ip>\S+)\s(?P<mcast_ipv6>\S+)?\s+\\$')
+        p1_1 = regex_engine.compile(r'^(?P<nve_if>nve[0-9]+)\s*(?P<vni_id>[0-9]*)\s*'
+                                    r'(?P<mcast_ip>\S+)\s(?P<mcast_ipv6>\S+)?\s+\\$')
 
-        p1_2 = re.compile(r'^(?P<vni_state>\S+\s*\S*)\s+(?P<vni_type>L\S+)'
-                          r'\s+(?P<vlan_id>\S+)\s+(?P<vni_origin>\S+)'
-                          r'\s+(?P<vni_vrf>\S+)$')
+        p1_2 = regex_engine.compile(r'^(?P<vni_state>\S+\s*\S*)\s+(?P<vni_type>L\S+)'
+                                    r'\s+(?P<vlan_id>\S+)\s+(?P<vni_origin>\S+)'
+                                    r'\s+(?P<vni_vrf>\S+)$')
 
         # SVI if handler: 0x2F
-        p2 = re.compile(r'^(SVI|BDI) if handler:\s+(?P<svi_if>\S+)$')
+        p2 = regex_engine.compile(r'^(SVI|BDI) if handler:\s+(?P<svi_if>\S+)$')
 
         # Local VTEP: 1.1.1.2
-        p3 = re.compile(r'^Local VTEP:\s+(?P<vtep_ip>\S+)$')
+        p3 = regex_engine.compile(r'^Local VTEP:\s+(?P<vtep_ip>\S+)$')
 
         # Local VTEP: 172.16.255.7 2000:172:16:255::7
-        p3_1 = re.compile(r'^Local VTEP:\s+(?P<vtep_ip>\S+)\s+(?P<vtep_ip_secondary>\S+)$')
+        p3_1 = regex_engine.compile(r'^Local VTEP:\s+(?P<vtep_ip>\S+)\s+(?P<vtep_ip_secondary>\S+)$')
 
         # Local routing: Disabled
-        p4 = re.compile(r'^Local routing:\s+(?P<local_routing>\S+)$')
+        p4 = regex_engine.compile(r'^Local routing:\s+(?P<local_routing>\S+)$')
 
         # L3VNI: 30000
-        p5 = re.compile(r'^L3VNI:\s+(?P<l3_vni>\d+)$')
+        p5 = regex_engine.compile(r'^L3VNI:\s+(?P<l3_vni>\d+)$')
 
         # IPv4 TRM mdt group: N/A
-        p6 = re.compile(r'^IPv4 TRM mdt group:\s+(?P<trm_ipv4>\S+)$')
+        p6 = regex_engine.compile(r'^IPv4 TRM mdt group:\s+(?P<trm_ipv4>\S+)$')
 
         # IPv6 TRM mdt group: N/A
-        p7 = re.compile(r'^IPv6 TRM mdt group:\s+(?P<trm_ipv6>\S+)$')
+        p7 = regex_engine.compile(r'^IPv6 TRM mdt group:\s+(?P<trm_ipv6>\S+)$')
 
         # V4TopoID: 0x2
-        p8 = re.compile(r'^V4TopoID:\s+(?P<v4_topo_id>\S+)$')
+        p8 = regex_engine.compile(r'^V4TopoID:\s+(?P<v4_topo_id>\S+)$')
 
         # V6TopoID: 0x1E000002
-        p9 = re.compile(r'^V6TopoID:\s+(?P<v6_topo_id>\S+)$')
+        p9 = regex_engine.compile(r'^V6TopoID:\s+(?P<v6_topo_id>\S+)$')
 
         # SVI MAC: 6C8B.D36D.471F
-        p10 = re.compile(r'^SVI MAC:\s+(?P<svi_mac>\S+)$')
+        p10 = regex_engine.compile(r'^SVI MAC:\s+(?P<svi_mac>\S+)$')
 
         # Pkts In   Bytes In   Pkts Out  Bytes Out
         # 0          0          0          0
-        p11 = re.compile(r'^(?P<uc_input_packets>\d+)\s+(?P<uc_input_bytes>\d+)'
-                         r'\s+(?P<uc_output_packets>\d+)\s+'
-                         r'(?P<uc_output_bytes>\d+)$')
+        p11 = regex_engine.compile(r'^(?P<uc_input_packets>\d+)\s+(?P<uc_input_bytes>\d+)'
+                                   r'\s+(?P<uc_output_packets>\d+)\s+'
+                                   r'(?P<uc_output_bytes>\d+)$')
         # UcastPkts  UcastBytes McastPkts McastBytes"
         # RX 0          0          0          0
-        p12 = re.compile(r'^RX\s*(?P<uc_input_packets>\d+)\s+'
-                         r'(?P<uc_input_bytes>\d+)\s+(?P<mc_input_packets>\d+)'
-                         r'\s+(?P<mc_input_bytes>\d+)$')
+        p12 = regex_engine.compile(r'^RX\s*(?P<uc_input_packets>\d+)\s+'
+                                   r'(?P<uc_input_bytes>\d+)\s+(?P<mc_input_packets>\d+)'
+                                   r'\s+(?P<mc_input_bytes>\d+)$')
         # TX 0          0          0          0
-        p13 = re.compile(r'^TX\s*(?P<uc_output_packets>\d+)\s+'
-                         r'(?P<uc_output_bytes>\d+)\s+(?P<mc_output_packets>'
-                         r'\d+)\s+(?P<mc_output_bytes>\d+)$')
+        p13 = regex_engine.compile(r'^TX\s*(?P<uc_output_packets>\d+)\s+'
+                                   r'(?P<uc_output_bytes>\d+)\s+(?P<mc_output_packets>'
+                                   r'\d+)\s+(?P<mc_output_bytes>\d+)$')
 
         # VLAN: 1000
         # BD: 1000
-        p14 = re.compile(r'^(VLAN|BD):\s+(?P<vlan_id>\S+)$')
+        p14 = regex_engine.compile(r'^(VLAN|BD):\s+(?P<vlan_id>\S+)$')
 
         parsed_dict = {}
         l3vni_found = False
@@ -655,7 +655,7 @@ class ShowNveVniDetail(ShowNveVniDetailSchema):
 
             if l3vni_found:
                 # L3VNI: 30000
-                p5 = re.compile(r'^L3VNI:\s+(?P<l3_vni>\S+)$')
+                p5 = regex_engine.compile(r'^L3VNI:\s+(?P<l3_vni>\S+)$')
                 m = p5.match(line)
                 if m:
                     group = m.groupdict()
@@ -36,7 +36,9 @@ from netaddr import IPAddress, IPNetwork, INET_ATON
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.device_cache import cached_execute
 
 # ===========================================================
 # Schema for:
@@ -96,20 +98,20 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
         ret_dict = {}
 
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         r' +\(Process +ID +(?P<pid>(\S+))\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                   r' +\(Process +ID +(?P<pid>(\S+))\)$')
 
         # OSPF Segment Routing Local Blocks in Area 8
-        p2 = re.compile(r'^OSPF +Segment +Routing +Local +Blocks +in +Area'
-                         r' +(?P<area>(\d+))$')
+        p2 = regex_engine.compile(r'^OSPF +Segment +Routing +Local +Blocks +in +Area'
+                                   r' +(?P<area>(\d+))$')
 
         # Router ID        SR Capable   SRLB Base   SRLB Range
         # --------------------------------------------------------
         # *10.4.1.1          Yes          15000       1000
         # 10.16.2.2          Yes          15000       1000
         # 10.169.197.252    No 
-        p3 = re.compile(r'^(?P<value>\*)?(?P<router_id>\S+) +(?P<sr_capable>Yes|No)'
-                         r'( +(?P<srlb_base>\d+) +(?P<srlb_range>\d+))?$')
+        p3 = regex_engine.compile(r'^(?P<value>\*)?(?P<router_id>\S+) +(?P<sr_capable>Yes|No)'
+                                   r'( +(?P<srlb_base>\d+) +(?P<srlb_range>\d+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -348,215 +350,215 @@ class ShowIpOspf(ShowIpOspfSchema):
         redist_max_prefix = False
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
-                            r' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
-                            r' +with +ID +(?P<router_id>(\S+))$')
+        p1 = regex_engine.compile(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
+                                      r' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
+                                      r' +with +ID +(?P<router_id>(\S+))$')
 
-        p1_1 = re.compile(r'^Routing +Process +is +shutdown$')
+        p1_1 = regex_engine.compile(r'^Routing +Process +is +shutdown$')
 
-        p2 = re.compile(r'^Domain +ID +type +(?P<domain_id>(\S+)), +value'
-                            r' +(?P<value>(\S+))$')
+        p2 = regex_engine.compile(r'^Domain +ID +type +(?P<domain_id>(\S+)), +value'
+                                      r' +(?P<value>(\S+))$')
 
-        p3 = re.compile(r'^Start +time: +(?P<start>([0-9\:\.]+)), +Time'
-                            r' +elapsed: +(?P<elapsed>(\S+))$')
+        p3 = regex_engine.compile(r'^Start +time: +(?P<start>([0-9\:\.]+)), +Time'
+                                      r' +elapsed: +(?P<elapsed>(\S+))$')
 
-        p4 = re.compile(r'^Supports +only +single +TOS(TOS0) routes$')
+        p4 = regex_engine.compile(r'^Supports +only +single +TOS(TOS0) routes$')
 
-        p5 = re.compile(r'^Supports +opaque +LSA$')
+        p5 = regex_engine.compile(r'^Supports +opaque +LSA$')
 
-        p6 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
+        p6 = regex_engine.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
 
-        p7 = re.compile(r'^Supports +area +transit +capability$')
+        p7 = regex_engine.compile(r'^Supports +area +transit +capability$')
 
-        p8 = re.compile(r'^Supports +NSSA +\(compatible +with +RFC +3101\)$')
+        p8 = regex_engine.compile(r'^Supports +NSSA +\(compatible +with +RFC +3101\)$')
 
-        p9 = re.compile(r'^Supports +Database +Exchange +Summary +List'
-                            r' +Optimization +\(RFC +5243\)$')
+        p9 = regex_engine.compile(r'^Supports +Database +Exchange +Summary +List'
+                                      r' +Optimization +\(RFC +5243\)$')
 
-        p10 = re.compile(r'^Event-log +(?P<event_log>(enabled|disabled)),'
-                            r'(?: +Maximum +number +of +events:'
-                            r' +(?P<max_events>(\d+)),'
-                            r' +Mode: +(?P<mode>(\S+)))?$')
+        p10 = regex_engine.compile(r'^Event-log +(?P<event_log>(enabled|disabled)),'
+                                      r'(?: +Maximum +number +of +events:'
+                                      r' +(?P<max_events>(\d+)),'
+                                      r' +Mode: +(?P<mode>(\S+)))?$')
 
-        p11 = re.compile(r'^It +is +an'
-                            r'(?: +(?P<abr>(area border)))?'
-                            r'(?: +and)?'
-                            r'(?: +(?P<asbr>(autonomous system boundary)))?'
-                            r' +router$')
+        p11 = regex_engine.compile(r'^It +is +an'
+                                      r'(?: +(?P<abr>(area border)))?'
+                                      r'(?: +and)?'
+                                      r'(?: +(?P<asbr>(autonomous system boundary)))?'
+                                      r' +router$')
 
-        p12_1 = re.compile(r'^Redistributing +External +Routes +from,$')
+        p12_1 = regex_engine.compile(r'^Redistributing +External +Routes +from,$')
 
-        p12_2 = re.compile(r'^(?P<type>(connected|static))(?: +with +metric'
-                            r' +mapped +to +(?P<metric>(\d+)))?$')
+        p12_2 = regex_engine.compile(r'^(?P<type>(connected|static))(?: +with +metric'
+                                      r' +mapped +to +(?P<metric>(\d+)))?$')
 
-        p12_2_1 = re.compile(r'^(?P<type>(connected|static|isis))'
-                                r', +includes +(?P<redist>(subnets)) +in +redistribution')
+        p12_2_1 = regex_engine.compile(r'^(?P<type>(connected|static|isis))'
+                                          r', +includes +(?P<redist>(subnets)) +in +redistribution')
 
-        p12_3 = re.compile(r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))'
-                            r'(?: +with +metric +mapped +to +(?P<metric>(\d+)))?'
-                            r'(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?'
-                            r'(?:, +(?P<nssa>(nssa areas only)))?$')
+        p12_3 = regex_engine.compile(r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))'
+                                      r'(?: +with +metric +mapped +to +(?P<metric>(\d+)))?'
+                                      r'(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?'
+                                      r'(?:, +(?P<nssa>(nssa areas only)))?$')
 
-        p12_4 = re.compile(r'^Maximum +limit +of +redistributed +prefixes'
-                            r' +(?P<num_prefix>(\d+))'
-                            r'(?: +\((?P<warn>(warning-only))\))?')
+        p12_4 = regex_engine.compile(r'^Maximum +limit +of +redistributed +prefixes'
+                                      r' +(?P<num_prefix>(\d+))'
+                                      r'(?: +\((?P<warn>(warning-only))\))?')
 
-        p12_5 = re.compile(r'^Threshold +for +warning +message'
-                            r' +(?P<thld>(\d+))\%$')
+        p12_5 = regex_engine.compile(r'^Threshold +for +warning +message'
+                                      r' +(?P<thld>(\d+))\%$')
 
-        p13 = re.compile(r'^Router +is +not +originating +router-LSAs'
-                            r' +with +maximum +metric$')
+        p13 = regex_engine.compile(r'^Router +is +not +originating +router-LSAs'
+                                      r' +with +maximum +metric$')
 
-        p14_1 = re.compile(r'^Originating +router-LSAs +with +maximum'
-                            r' +metric$')
+        p14_1 = regex_engine.compile(r'^Originating +router-LSAs +with +maximum'
+                                      r' +metric$')
 
-        p14_2 = re.compile(r'^Condition:'
-                            r' +(?P<condition>(always|on \S+))'
-                            r'(?: +for +(?P<seconds>(\d+)) +seconds,)?'
-                            r' +State: +(?P<state>(\S+))$')
+        p14_2 = regex_engine.compile(r'^Condition:'
+                                      r' +(?P<condition>(always|on \S+))'
+                                      r'(?: +for +(?P<seconds>(\d+)) +seconds,)?'
+                                      r' +State: +(?P<state>(\S+))$')
 
-        p14_3 = re.compile(r'^Advertise +stub +links +with +maximum +metric'
-                            r' +in +router\-LSAs$')
+        p14_3 = regex_engine.compile(r'^Advertise +stub +links +with +maximum +metric'
+                                      r' +in +router\-LSAs$')
 
-        p14_4 = re.compile(r'^Advertise +summary\-LSAs +with +metric'
-                            r' +(?P<metric>(\d+))$')
+        p14_4 = regex_engine.compile(r'^Advertise +summary\-LSAs +with +metric'
+                                      r' +(?P<metric>(\d+))$')
 
-        p14_5 = re.compile(r'^^Advertise +external\-LSAs +with +metric'
-                            r' +(?P<metric>(\d+))$')
+        p14_5 = regex_engine.compile(r'^^Advertise +external\-LSAs +with +metric'
+                                      r' +(?P<metric>(\d+))$')
 
-        p15 = re.compile(r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
-                            r' +msecs$')
+        p15 = regex_engine.compile(r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
+                                      r' +msecs$')
 
-        p16 = re.compile(r'^Minimum +hold +time +between +two +consecutive'
-                            r' +SPFs +(?P<time>(\S+)) +msecs$')
+        p16 = regex_engine.compile(r'^Minimum +hold +time +between +two +consecutive'
+                                      r' +SPFs +(?P<time>(\S+)) +msecs$')
 
-        p17 = re.compile(r'^Maximum +wait +time +between +two +consecutive'
-                            r' +SPFs +(?P<time>(\S+)) +msecs$')
+        p17 = regex_engine.compile(r'^Maximum +wait +time +between +two +consecutive'
+                                      r' +SPFs +(?P<time>(\S+)) +msecs$')
 
-        p18 = re.compile(r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
-                            r' +msecs$')
+        p18 = regex_engine.compile(r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
+                                      r' +msecs$')
 
-        p19 = re.compile(r'^Minimum +hold +time +for +LSA +throttle'
-                            r' +(?P<time>(\S+)) +msecs$')
+        p19 = regex_engine.compile(r'^Minimum +hold +time +for +LSA +throttle'
+                                      r' +(?P<time>(\S+)) +msecs$')
 
-        p20 = re.compile(r'^Maximum +wait +time +for +LSA +throttle'
-                            r' +(?P<time>(\S+)) +msecs$')
+        p20 = regex_engine.compile(r'^Maximum +wait +time +for +LSA +throttle'
+                                      r' +(?P<time>(\S+)) +msecs$')
 
-        p21 = re.compile(r'^Minimum +LSA +arrival'
-                            r' +(?P<arrival>(\S+)) +msecs$')
+        p21 = regex_engine.compile(r'^Minimum +LSA +arrival'
+                                      r' +(?P<arrival>(\S+)) +msecs$')
 
-        p22 = re.compile(r'^Incremental-SPF +(?P<incr>(disabled|enabled))$')
+        p22 = regex_engine.compile(r'^Incremental-SPF +(?P<incr>(disabled|enabled))$')
 
-        p23 = re.compile(r'LSA +group +pacing +timer'
-                            r' +(?P<pacing>(\d+)) +secs$')
+        p23 = regex_engine.compile(r'LSA +group +pacing +timer'
+                                      r' +(?P<pacing>(\d+)) +secs$')
 
-        p24 = re.compile(r'Interface +flood +pacing +timer'
-                            r' +(?P<interface>(\d+)) +msecs$')
+        p24 = regex_engine.compile(r'Interface +flood +pacing +timer'
+                                      r' +(?P<interface>(\d+)) +msecs$')
 
-        p25 = re.compile(r'Retransmission +pacing +timer'
-                            r' +(?P<retransmission>(\d+)) +msecs$')
+        p25 = regex_engine.compile(r'Retransmission +pacing +timer'
+                                      r' +(?P<retransmission>(\d+)) +msecs$')
 
-        p26 = re.compile(r'EXCHANGE/LOADING +adjacency +limit: +initial'
-                            r' +(?P<initial>(\S+)), +process +maximum'
-                            r' +(?P<maximum>(\d+))$')
+        p26 = regex_engine.compile(r'EXCHANGE/LOADING +adjacency +limit: +initial'
+                                      r' +(?P<initial>(\S+)), +process +maximum'
+                                      r' +(?P<maximum>(\d+))$')
 
-        p27 = re.compile(r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
-                            r' +Checksum +Sum +(?P<checksum>(\S+))$')
+        p27 = regex_engine.compile(r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
+                                      r' +Checksum +Sum +(?P<checksum>(\S+))$')
 
-        p28 = re.compile(r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
-                            r' +Checksum +Sum +(?P<checksum>(\S+))$')
+        p28 = regex_engine.compile(r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
+                                      r' +Checksum +Sum +(?P<checksum>(\S+))$')
 
-        p29 = re.compile(r'^Number +of +DCbitless +external +and +opaque'
-                            r' +AS +LSA +(?P<num>(\d+))$')
+        p29 = regex_engine.compile(r'^Number +of +DCbitless +external +and +opaque'
+                                      r' +AS +LSA +(?P<num>(\d+))$')
 
-        p30 = re.compile(r'^Number +of +DoNotAge +external +and +opaque'
-                            r' +AS +LSA +(?P<num>(\d+))$')
+        p30 = regex_engine.compile(r'^Number +of +DoNotAge +external +and +opaque'
+                                      r' +AS +LSA +(?P<num>(\d+))$')
 
-        p31 = re.compile(r'^Number +of +areas +in +this +router +is'
-                            r' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
-                            r' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
-                            r' +nssa$')
+        p31 = regex_engine.compile(r'^Number +of +areas +in +this +router +is'
+                                      r' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
+                                      r' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
+                                      r' +nssa$')
 
-        p32 = re.compile(r'Number +of +areas +transit +capable +is'
-                            r' +(?P<num>(\d+))$')
+        p32 = regex_engine.compile(r'Number +of +areas +transit +capable +is'
+                                      r' +(?P<num>(\d+))$')
 
-        p33 = re.compile(r'^Maximum +number +of +non +self-generated +LSA'
-                            r' +allowed +(?P<max_lsa>(\d+))(?: +\((?P<warn>(warning-only))\))?')
+        p33 = regex_engine.compile(r'^Maximum +number +of +non +self-generated +LSA'
+                                      r' +allowed +(?P<max_lsa>(\d+))(?: +\((?P<warn>(warning-only))\))?')
 
-        p33_1 = re.compile(r'^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$')
+        p33_1 = regex_engine.compile(r'^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$')
 
-        p33_2 = re.compile(r'^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$')
+        p33_2 = regex_engine.compile(r'^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$')
 
-        p33_3 = re.compile(r'^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,'
-                            r' +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$')
+        p33_3 = regex_engine.compile(r'^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,'
+                                      r' +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$')
 
-        p33_4 = re.compile(r'^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),'
-                            r' +current ignore\-count +(?P<max_lsa_current_count>\d+)$')
+        p33_4 = regex_engine.compile(r'^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),'
+                                      r' +current ignore\-count +(?P<max_lsa_current_count>\d+)$')
 
-        p33_5 = re.compile(r'^Maximum +limit +of +redistributed +prefixes +(?P<max_lsa_limit>\d+) +\(warning\-only\)$')
+        p33_5 = regex_engine.compile(r'^Maximum +limit +of +redistributed +prefixes +(?P<max_lsa_limit>\d+) +\(warning\-only\)$')
 
-        p34 = re.compile(r'^External +flood +list +length +(?P<num>(\d+))$')
+        p34 = regex_engine.compile(r'^External +flood +list +length +(?P<num>(\d+))$')
 
-        p35 = re.compile(r'^(?P<gr_type>(IETF|Cisco)) +Non-Stop +Forwarding'
-                            r' +(?P<enable>(enabled|disabled))$')
+        p35 = regex_engine.compile(r'^(?P<gr_type>(IETF|Cisco)) +Non-Stop +Forwarding'
+                                      r' +(?P<enable>(enabled|disabled))$')
 
-        p36 = re.compile(r'^(?P<gr_type>(IETF|Cisco)) +NSF +helper +support'
-                            r' +(?P<gr_helper>(enabled|disabled))$')
+        p36 = regex_engine.compile(r'^(?P<gr_type>(IETF|Cisco)) +NSF +helper +support'
+                                      r' +(?P<gr_helper>(enabled|disabled))$')
 
-        p36_1 = re.compile(r'^restart-interval +limit *: +(?P<num>(\d+)) +sec$')
+        p36_1 = regex_engine.compile(r'^restart-interval +limit *: +(?P<num>(\d+)) +sec$')
 
-        p37 = re.compile(r'^Reference +bandwidth +unit +is'
-                            r' +(?P<bd>(\d+)) +(?P<unit>(mbps))$')
+        p37 = regex_engine.compile(r'^Reference +bandwidth +unit +is'
+                                      r' +(?P<bd>(\d+)) +(?P<unit>(mbps))$')
 
-        p38 = re.compile(r'^Area +(?P<area>(\S+))(?: *\((I|i)nactive\))?$')
+        p38 = regex_engine.compile(r'^Area +(?P<area>(\S+))(?: *\((I|i)nactive\))?$')
 
-        p39_1 = re.compile(r'^It +is +a +(?P<area_type>(\S+)) +area'
-                            r'(?:, +(?P<summary>(no +summary +LSA +in +this'
-                            r' +area)))?$')
+        p39_1 = regex_engine.compile(r'^It +is +a +(?P<area_type>(\S+)) +area'
+                                      r'(?:, +(?P<summary>(no +summary +LSA +in +this'
+                                      r' +area)))?$')
 
-        p39_2 = re.compile(r'^generates +stub +default +route +with +cost'
-                            r' +(?P<default_cost>(\d+))$')
+        p39_2 = regex_engine.compile(r'^generates +stub +default +route +with +cost'
+                                      r' +(?P<default_cost>(\d+))$')
 
-        p40_1 = re.compile(r'^Area ranges are$')
+        p40_1 = regex_engine.compile(r'^Area ranges are$')
 
-        p40_2 = re.compile(r'^(?P<prefix>([0-9\.\/]+)) +(Passive|Active)'
-                            r'(?:\((?P<cost>(\d+)) +\- +configured\))?'
-                            r' +(?P<advertise>(Advertise|DoNotAdvertise))$')
+        p40_2 = regex_engine.compile(r'^(?P<prefix>([0-9\.\/]+)) +(Passive|Active)'
+                                      r'(?:\((?P<cost>(\d+)) +\- +configured\))?'
+                                      r' +(?P<advertise>(Advertise|DoNotAdvertise))$')
 
-        p41 = re.compile(r'^Number +of +interfaces +in +this +area +is'
-                            r' +(?P<num_intf>(\d+))(?:'
-                            r' *\((?P<loopback>(\d+)) +loopback\))?$')
+        p41 = regex_engine.compile(r'^Number +of +interfaces +in +this +area +is'
+                                      r' +(?P<num_intf>(\d+))(?:'
+                                      r' *\((?P<loopback>(\d+)) +loopback\))?$')
 
-        p42 = re.compile(r'^Area +has +RRR +enabled$')
+        p42 = regex_engine.compile(r'^Area +has +RRR +enabled$')
 
-        p43 = re.compile(r'^SPF +algorithm +executed +(?P<count>(\d+))'
-                            r' +times$')
+        p43 = regex_engine.compile(r'^SPF +algorithm +executed +(?P<count>(\d+))'
+                                      r' +times$')
 
-        p44 = re.compile(r'^SPF +algorithm +last +executed'
-                            r' +(?P<last_exec>(\S+)) +ago$')
+        p44 = regex_engine.compile(r'^SPF +algorithm +last +executed'
+                                      r' +(?P<last_exec>(\S+)) +ago$')
 
-        p45 = re.compile(r'^Area +has +no +authentication$')
+        p45 = regex_engine.compile(r'^Area +has +no +authentication$')
 
-        p46 = re.compile(r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
-                            r' +Checksum +Sum +(?P<checksum_sum>(\S+))$')
+        p46 = regex_engine.compile(r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
+                                      r' +Checksum +Sum +(?P<checksum_sum>(\S+))$')
 
-        p47 = re.compile(r'^Number +of opaque +link +LSA'
-                            r' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
-                            r' +(?P<checksum_sum>(\S+))$')
+        p47 = regex_engine.compile(r'^Number +of opaque +link +LSA'
+                                      r' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
+                                      r' +(?P<checksum_sum>(\S+))$')
 
-        p48 = re.compile(r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$')
+        p48 = regex_engine.compile(r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$')
 
-        p49 = re.compile(r'^Number +of +indication +LSA +(?P<count>(\d+))$')
+        p49 = regex_engine.compile(r'^Number +of +indication +LSA +(?P<count>(\d+))$')
 
-        p50 = re.compile(r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$')
+        p50 = regex_engine.compile(r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$')
 
-        p51 = re.compile(r'^Flood +list +length +(?P<len>(\d+))$')
+        p51 = regex_engine.compile(r'^Flood +list +length +(?P<len>(\d+))$')
 
-        p52 = re.compile(r'^Non-Stop +Routing +(?P<nsr>(enabled))$')
+        p52 = regex_engine.compile(r'^Non-Stop +Routing +(?P<nsr>(enabled))$')
 
-        p53_1 = re.compile(r'^BFD +is +enabled +in +strict +mode$')
+        p53_1 = regex_engine.compile(r'^BFD +is +enabled +in +strict +mode$')
 
-        p53_2 = re.compile(r'^BFD +is +enabled$')
+        p53_2 = regex_engine.compile(r'^BFD +is +enabled$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -799,10 +801,10 @@ class ShowIpOspf(ShowIpOspfSchema):
             # Condition: always, State: active
             # Condition: on start-up for 5 seconds, State: inactive
             # Condition: on startup for 300 seconds, State: inactive
-            p14_2 = re.compile(r'^Condition:'
-                               r' +(?P<condition>(always|on \S+))'
-                               r'(?: +for +(?P<seconds>(\d+)) +seconds)?,?'
-                               r' +State: +(?P<state>(\S+))$')
+            p14_2 = regex_engine.compile(r'^Condition:'
+                                         r' +(?P<condition>(always|on \S+))'
+                                         r'(?: +for +(?P<seconds>(\d+)) +seconds)?,?'
+                                         r' +State: +(?P<state>(\S+))$')
             m = p14_2.match(line)
             if m:
                 condition = str(m.groupdict()['condition']).lower().replace("-", "")
@@ -1405,7 +1407,7 @@ class ShowIpOspfInterfaceBrief(ShowIpOspfInterfaceBriefSchema):
         # Init vars
         ret_dict = {}
         
-        p1 = re.compile(r'^(?P<interface>\S+) +(?P<instance>\S+) +(?P<area>\d+) +'
+        p1 = regex_engine.compile(r'^(?P<interface>\S+) +(?P<instance>\S+) +(?P<area>\d+) +'
             r'(?P<address>\S+) +(?P<cost>\d+) +(?P<state>\S+) +(?P<nbrs_full>\d+)'
             r'\/(?P<nbrs_count>\d+)$$')
 
@@ -1790,140 +1792,140 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
         bool_dict = {'up': True, 'down': False, 'unknown': False}
 
         
-        p1 = re.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
-                            r' +(?P<enable>(unknown|up|down)), +line +protocol'
-                            r' +is +(?P<line_protocol>(up|down))'
-                            r'(?: +\(\S+\))?$')
+        p1 = regex_engine.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
+                                      r' +(?P<enable>(unknown|up|down)), +line +protocol'
+                                      r' +is +(?P<line_protocol>(up|down))'
+                                      r'(?: +\(\S+\))?$')
         # Internet Address 0.0.0.1/30|Interface is unnumbered, Interface ID 55, Area 0
-        p2 = re.compile(r'^(Internet +Address|Interface +is) +(?P<address>(\S+)),'
-                            r'(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
-                            r' +Area +(?P<area>(\S+))(?:, +Attached +via'
-                            r' +(?P<attach>(.*)))?$')
+        p2 = regex_engine.compile(r'^(Internet +Address|Interface +is) +(?P<address>(\S+)),'
+                                      r'(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
+                                      r' +Area +(?P<area>(\S+))(?:, +Attached +via'
+                                      r' +(?P<attach>(.*)))?$')
  
-        p2_1 = re.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
+        p2_1 = regex_engine.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
  
-        p3 = re.compile(r'^Process +ID +(?P<pid>(\S+)),'
-                            r'(?: +VRF +(?P<vrf>(\S+)))?'
-                            r' +Router +ID +(?P<router_id>(\S+)),'
-                            r' +Network +Type +(?P<interface_type>(\S+)),'
-                            r' +Cost: +(?P<cost>(\d+))$')
+        p3 = regex_engine.compile(r'^Process +ID +(?P<pid>(\S+)),'
+                                      r'(?: +VRF +(?P<vrf>(\S+)))?'
+                                      r' +Router +ID +(?P<router_id>(\S+)),'
+                                      r' +Network +Type +(?P<interface_type>(\S+)),'
+                                      r' +Cost: +(?P<cost>(\d+))$')
 
-        p5 = re.compile(r'^Configured as demand circuit$')
+        p5 = regex_engine.compile(r'^Configured as demand circuit$')
  
-        p6 = re.compile(r'^Run as demand circuit$')
+        p6 = regex_engine.compile(r'^Run as demand circuit$')
  
-        p7 = re.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
-                            r' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
+        p7 = regex_engine.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
+                                      r' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
  
-        p8 = re.compile(r'^Enabled +by +interface +config, +including'
-                            r' +secondary +ip +addresses$')
+        p8 = regex_engine.compile(r'^Enabled +by +interface +config, +including'
+                                      r' +secondary +ip +addresses$')
  
-        p9 = re.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
-                            r' +State +(?P<state>(\S+))'
-                            r'(?:, +Priority +(?P<priority>(\d+)))?'
-                            r'(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
+        p9 = regex_engine.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
+                                      r' +State +(?P<state>(\S+))'
+                                      r'(?:, +Priority +(?P<priority>(\d+)))?'
+                                      r'(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
  
-        p10 = re.compile(r'^Designated +(R|r)outer +\(ID\)'
-                            r' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
-                            r' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
+        p10 = regex_engine.compile(r'^Designated +(R|r)outer +\(ID\)'
+                                      r' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
+                                      r' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
  
-        p11 = re.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
-                            r' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
-                            r' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
+        p11 = regex_engine.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
+                                      r' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
+                                      r' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
  
-        p12 = re.compile(r'^Timer +intervals +configured,'
-                            r' +Hello +(?P<hello>(\d+)),'
-                            r' +Dead +(?P<dead>(\d+)),'
-                            r' +Wait +(?P<wait>(\d+)),'
-                            r' +Retransmit +(?P<retransmit>(\d+))$')
+        p12 = regex_engine.compile(r'^Timer +intervals +configured,'
+                                      r' +Hello +(?P<hello>(\d+)),'
+                                      r' +Dead +(?P<dead>(\d+)),'
+                                      r' +Wait +(?P<wait>(\d+)),'
+                                      r' +Retransmit +(?P<retransmit>(\d+))$')
  
-        p12_1 = re.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
+        p12_1 = regex_engine.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
  
-        p12_2 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p12_2 = regex_engine.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
  
-        p13 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
+        p13 = regex_engine.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
  
-        p14 = re.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
-                            r' +(?P<helper>(enabled|disabled))$')
+        p14 = regex_engine.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
+                                      r' +(?P<helper>(enabled|disabled))$')
  
-        p15 = re.compile(r'^Index +(?P<index>(\S+)),'
-                            r' +flood +queue +length +(?P<length>(\d+))$')
+        p15 = regex_engine.compile(r'^Index +(?P<index>(\S+)),'
+                                      r' +flood +queue +length +(?P<length>(\d+))$')
  
-        p16 = re.compile(r'^Next +(?P<next>(\S+))$')
+        p16 = regex_engine.compile(r'^Next +(?P<next>(\S+))$')
  
-        p17 = re.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
-                            r' +maximum +is +(?P<max>(\d+))$')
+        p17 = regex_engine.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
+                                      r' +maximum +is +(?P<max>(\d+))$')
  
-        p18 = re.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
-                            r' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
+        p18 = regex_engine.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
+                                      r' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
  
-        p19 = re.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
-                            r' +Adjacent +neighbor +count +is'
-                            r' +(?P<adj_nbr_count>(\d+))$')
+        p19 = regex_engine.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
+                                      r' +Adjacent +neighbor +count +is'
+                                      r' +(?P<adj_nbr_count>(\d+))$')
  
-        p20_1 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            r' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
+        p20_1 = regex_engine.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                      r' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
  
-        p20_2 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            r' +\((D|d)esignated +(R|r)outer\)$')
+        p20_2 = regex_engine.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                      r' +\((D|d)esignated +(R|r)outer\)$')
  
-        p20_3 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            r' +\(Hello suppressed\)$')
+        p20_3 = regex_engine.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                      r' +\(Hello suppressed\)$')
  
-        p21 = re.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
-                            r' +neighbor\(s\)$')
+        p21 = regex_engine.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
+                                      r' +neighbor\(s\)$')
  
-        p22 = re.compile(r'^Loopback +interface +is +treated +as +a +stub'
-                            r' +Host$')
+        p22 = regex_engine.compile(r'^Loopback +interface +is +treated +as +a +stub'
+                                      r' +Host$')
  
-        p23 = re.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
-                            r' +FastReroute$')
+        p23 = regex_engine.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
+                                      r' +FastReroute$')
  
-        p24 = re.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
-                            r' +FastReroute +repair +paths$')
+        p24 = regex_engine.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
+                                      r' +FastReroute +repair +paths$')
  
-        p25 = re.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
+        p25 = regex_engine.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
  
-        p26 = re.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
+        p26 = regex_engine.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
  
-        p27 = re.compile(r'^Strict +TTL +checking'
-                            r' +(?P<strict_ttl>(enabled|disabled))'
-                            r'(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p27 = regex_engine.compile(r'^Strict +TTL +checking'
+                                      r' +(?P<strict_ttl>(enabled|disabled))'
+                                      r'(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
  
-        p28_1 = re.compile(r'^Simple +password +authentication +enabled$')
+        p28_1 = regex_engine.compile(r'^Simple +password +authentication +enabled$')
  
-        p28_2 = re.compile(r'^Cryptographic +authentication +enabled$')
+        p28_2 = regex_engine.compile(r'^Cryptographic +authentication +enabled$')
  
-        p28_3 = re.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
+        p28_3 = regex_engine.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
  
-        p28_4 = re.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
-                            r' +neighbor(s) +using +the +old +key(s):$')
+        p28_4 = regex_engine.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
+                                      r' +neighbor(s) +using +the +old +key(s):$')
  
-        p28_5 = re.compile(r'^key +id +1 +algorithm +MD5$')
+        p28_5 = regex_engine.compile(r'^key +id +1 +algorithm +MD5$')
 
         # Segment Routing enabled for MPLS forwarding
-        p29 = re.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
+        p29 = regex_engine.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
 
         # TEAPP:
-        p30 = re.compile(r'^TEAPP:$')
+        p30 = regex_engine.compile(r'^TEAPP:$')
 
         # Topology Id:0x0
-        p30_1 = re.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
+        p30_1 = regex_engine.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
 
         # TEAPP:SRTE
-        p30_2 = re.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
+        p30_2 = regex_engine.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
 
         # Affinity: length 32, bits 0x00000010
-        p30_3 = re.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_3 = regex_engine.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
 
         # Extended affinity: length 32, bits 0x00000010
-        p30_4 = re.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_4 = regex_engine.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
 
         # SR Policy Manager:
-        p31 = re.compile(r'^SR +Policy +Manager:$')
+        p31 = regex_engine.compile(r'^SR +Policy +Manager:$')
 
         # TE Opaque LSA: Source of link information OSPF
-        p31_1 = re.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
+        p31_1 = regex_engine.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2076,7 +2078,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
 
                 # Get VRF information based on OSPF instance
                 cmd = 'show running-config | section router ospf {}'.format(instance)
-                out = self.device.execute(cmd)
+                out = cached_execute(self.device, cmd)
 
                 for line in out.splitlines():
                     line = line.rstrip()
@@ -2184,9 +2186,9 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
 
             # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
             #             0       1          no          no               Base
-            p4 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                             r' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                             r' +(?P<topo_name>(\S+))$')
+            p4 = regex_engine.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+                                       r' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+                                       r' +(?P<topo_name>(\S+))$')
             m = p4.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
@@ -2875,140 +2877,140 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
         bool_dict = {'up': True, 'down': False, 'unknown': False}
 
         
-        p1 = re.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
-                            r' +(?P<enable>(unknown|up|down)), +line +protocol'
-                            r' +is +(?P<line_protocol>(up|down))'
-                            r'(?: +\(\S+\))?$')
+        p1 = regex_engine.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
+                                      r' +(?P<enable>(unknown|up|down)), +line +protocol'
+                                      r' +is +(?P<line_protocol>(up|down))'
+                                      r'(?: +\(\S+\))?$')
         # Internet Address 0.0.0.1/30|Interface is unnumbered, Interface ID 55, Area 0
-        p2 = re.compile(r'^(Internet +Address|Interface +is) +(?P<address>(\S+)),'
-                            r'(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
-                            r' +Area +(?P<area>(\S+))(?:, +Attached +via'
-                            r' +(?P<attach>(.*)))?$')
+        p2 = regex_engine.compile(r'^(Internet +Address|Interface +is) +(?P<address>(\S+)),'
+                                      r'(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
+                                      r' +Area +(?P<area>(\S+))(?:, +Attached +via'
+                                      r' +(?P<attach>(.*)))?$')
  
-        p2_1 = re.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
+        p2_1 = regex_engine.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
  
-        p3 = re.compile(r'^Process +ID +(?P<pid>(\S+)),'
-                            r'(?: +VRF +(?P<vrf>(\S+)))?'
-                            r' +Router +ID +(?P<router_id>(\S+)),'
-                            r' +Network +Type +(?P<interface_type>(\S+)),'
-                            r' +Cost: +(?P<cost>(\d+))$')
+        p3 = regex_engine.compile(r'^Process +ID +(?P<pid>(\S+)),'
+                                      r'(?: +VRF +(?P<vrf>(\S+)))?'
+                                      r' +Router +ID +(?P<router_id>(\S+)),'
+                                      r' +Network +Type +(?P<interface_type>(\S+)),'
+                                      r' +Cost: +(?P<cost>(\d+))$')
 
-        p5 = re.compile(r'^Configured as demand circuit$')
+        p5 = regex_engine.compile(r'^Configured as demand circuit$')
  
-        p6 = re.compile(r'^Run as demand circuit$')
+        p6 = regex_engine.compile(r'^Run as demand circuit$')
  
-        p7 = re.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
-                            r' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
+        p7 = regex_engine.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
+                                      r' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
  
-        p8 = re.compile(r'^Enabled +by +interface +config, +including'
-                            r' +secondary +ip +addresses$')
+        p8 = regex_engine.compile(r'^Enabled +by +interface +config, +including'
+                                      r' +secondary +ip +addresses$')
  
-        p9 = re.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
-                            r' +State +(?P<state>(\S+))'
-                            r'(?:, +Priority +(?P<priority>(\d+)))?'
-                            r'(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
+        p9 = regex_engine.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
+                                      r' +State +(?P<state>(\S+))'
+                                      r'(?:, +Priority +(?P<priority>(\d+)))?'
+                                      r'(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
  
-        p10 = re.compile(r'^Designated +(R|r)outer +\(ID\)'
-                            r' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
-                            r' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
+        p10 = regex_engine.compile(r'^Designated +(R|r)outer +\(ID\)'
+                                      r' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
+                                      r' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
  
-        p11 = re.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
-                            r' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
-                            r' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
+        p11 = regex_engine.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
+                                      r' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
+                                      r' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
  
-        p12 = re.compile(r'^Timer +intervals +configured,'
-                            r' +Hello +(?P<hello>(\d+)),'
-                            r' +Dead +(?P<dead>(\d+)),'
-                            r' +Wait +(?P<wait>(\d+)),'
-                            r' +Retransmit +(?P<retransmit>(\d+))$')
+        p12 = regex_engine.compile(r'^Timer +intervals +configured,'
+                                      r' +Hello +(?P<hello>(\d+)),'
+                                      r' +Dead +(?P<dead>(\d+)),'
+                                      r' +Wait +(?P<wait>(\d+)),'
+                                      r' +Retransmit +(?P<retransmit>(\d+))$')
  
-        p12_1 = re.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
+        p12_1 = regex_engine.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
  
-        p12_2 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p12_2 = regex_engine.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
  
-        p13 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
+        p13 = regex_engine.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
  
-        p14 = re.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
-                            r' +(?P<helper>(enabled|disabled))$')
+        p14 = regex_engine.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
+                                      r' +(?P<helper>(enabled|disabled))$')
  
-        p15 = re.compile(r'^Index +(?P<index>(\S+)),'
-                            r' +flood +queue +length +(?P<length>(\d+))$')
+        p15 = regex_engine.compile(r'^Index +(?P<index>(\S+)),'
+                                      r' +flood +queue +length +(?P<length>(\d+))$')
  
-        p16 = re.compile(r'^Next +(?P<next>(\S+))$')
+        p16 = regex_engine.compile(r'^Next +(?P<next>(\S+))$')
  
-        p17 = re.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
-                            r' +maximum +is +(?P<max>(\d+))$')
+        p17 = regex_engine.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
+                                      r' +maximum +is +(?P<max>(\d+))$')
  
-        p18 = re.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
-                            r' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
+        p18 = regex_engine.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
+                                      r' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
  
-        p19 = re.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
-                            r' +Adjacent +neighbor +count +is'
-                            r' +(?P<adj_nbr_count>(\d+))$')
+        p19 = regex_engine.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
+                                      r' +Adjacent +neighbor +count +is'
+                                      r' +(?P<adj_nbr_count>(\d+))$')
  
-        p20_1 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            r' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
+        p20_1 = regex_engine.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                      r' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
  
-        p20_2 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            r' +\((D|d)esignated +(R|r)outer\)$')
+        p20_2 = regex_engine.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                      r' +\((D|d)esignated +(R|r)outer\)$')
  
-        p20_3 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            r' +\(Hello suppressed\)$')
+        p20_3 = regex_engine.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+                                      r' +\(Hello suppressed\)$')
  
-        p21 = re.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
-                            r' +neighbor\(s\)$')
+        p21 = regex_engine.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
+                                      r' +neighbor\(s\)$')
  
-        p22 = re.compile(r'^Loopback +interface +is +treated +as +a +stub'
-                            r' +Host$')
+        p22 = regex_engine.compile(r'^Loopback +interface +is +treated +as +a +stub'
+                                      r' +Host$')
  
-        p23 = re.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
-                            r' +FastReroute$')
+        p23 = regex_engine.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
+                                      r' +FastReroute$')
  
-        p24 = re.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
-                            r' +FastReroute +repair +paths$')
+        p24 = regex_engine.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
+                                      r' +FastReroute +repair +paths$')
  
-        p25 = re.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
+        p25 = regex_engine.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
  
-        p26 = re.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
+        p26 = regex_engine.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
  
-        p27 = re.compile(r'^Strict +TTL +checking'
-                            r' +(?P<strict_ttl>(enabled|disabled))'
-                            r'(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p27 = regex_engine.compile(r'^Strict +TTL +checking'
+                                      r' +(?P<strict_ttl>(enabled|disabled))'
+                                      r'(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
  
-        p28_1 = re.compile(r'^Simple +password +authentication +enabled$')
+        p28_1 = regex_engine.compile(r'^Simple +password +authentication +enabled$')
  
-        p28_2 = re.compile(r'^Cryptographic +authentication +enabled$')
+        p28_2 = regex_engine.compile(r'^Cryptographic +authentication +enabled$')
  
-        p28_3 = re.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
+        p28_3 = regex_engine.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
  
-        p28_4 = re.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
-                            r' +neighbor(s) +using +the +old +key(s):$')
+        p28_4 = regex_engine.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
+                                      r' +neighbor(s) +using +the +old +key(s):$')
  
-        p28_5 = re.compile(r'^key +id +1 +algorithm +MD5$')
+        p28_5 = regex_engine.compile(r'^key +id +1 +algorithm +MD5$')
 
         # Segment Routing enabled for MPLS forwarding
-        p29 = re.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
+        p29 = regex_engine.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
 
         # TEAPP:
-        p30 = re.compile(r'^TEAPP:$')
+        p30 = regex_engine.compile(r'^TEAPP:$')
 
         # Topology Id:0x0
-        p30_1 = re.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
+        p30_1 = regex_engine.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
 
         # TEAPP:SRTE
-        p30_2 = re.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
+        p30_2 = regex_engine.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
 
         # Affinity: length 32, bits 0x00000010
-        p30_3 = re.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_3 = regex_engine.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
 
         # Extended affinity: length 32, bits 0x00000010
-        p30_4 = re.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_4 = regex_engine.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
 
         # SR Policy Manager:
-        p31 = re.compile(r'^SR +Policy +Manager:$')
+        p31 = regex_engine.compile(r'^SR +Policy +Manager:$')
 
         # TE Opaque LSA: Source of link information OSPF
-        p31_1 = re.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
+        p31_1 = regex_engine.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3157,9 +3159,9 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
 
             # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
             #             0       1          no          no               Base
-            p4 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                             r' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                             r' +(?P<topo_name>(\S+))$')
+            p4 = regex_engine.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+                                       r' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+                                       r' +(?P<topo_name>(\S+))$')
             m = p4.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
@@ -3547,56 +3549,56 @@ class ShowIpOspfLinksParser(MetaParser):
         crypto_dict = {'cryptographic': 'md5', 'simple password': 'simple'}
 
 
-        p1 = re.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
-                            r' +(address|router) +(?P<address>(\S+)) +is'
-                            r' +(?P<link_state>(up|down))$')
+        p1 = regex_engine.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
+                                      r' +(address|router) +(?P<address>(\S+)) +is'
+                                      r' +(?P<link_state>(up|down))$')
 
-        p2 = re.compile(r'^Area +(?P<area>(\S+)),? +source +address'
-                            r' +(?P<source_address>(\S+))$')
+        p2 = regex_engine.compile(r'^Area +(?P<area>(\S+)),? +source +address'
+                                      r' +(?P<source_address>(\S+))$')
 
-        p3 = re.compile(r'^Run +as +demand +circuit$')
+        p3 = regex_engine.compile(r'^Run +as +demand +circuit$')
 
-        p4 = re.compile(r'^DoNotAge +LSA +not +allowed'
-                            r' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
-                            r'(?: +Cost +of +using +(?P<cost>(\d+)))?'
-                            r'(?: State +(?P<state>(\S+)))?$')
+        p4 = regex_engine.compile(r'^DoNotAge +LSA +not +allowed'
+                                      r' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
+                                      r'(?: +Cost +of +using +(?P<cost>(\d+)))?'
+                                      r'(?: State +(?P<state>(\S+)))?$')
 
-        p5 = re.compile(r'^Transit +area +(?P<area>(\S+)),'
-                            r'(?: +via +interface +(?P<intf>(\S+)))?$')
+        p5 = regex_engine.compile(r'^Transit +area +(?P<area>(\S+)),'
+                                      r'(?: +via +interface +(?P<intf>(\S+)))?$')
 
-        p6 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                            r' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                            r' +(?P<topo_name>(\S+))$')
+        p6 = regex_engine.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+                                      r' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+                                      r' +(?P<topo_name>(\S+))$')
 
-        p7 = re.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
-                            r' +sec, +State +(?P<state>(\S+)),?$')
+        p7 = regex_engine.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
+                                      r' +sec, +State +(?P<state>(\S+)),?$')
 
-        p8 = re.compile(r'^Timer +intervals +configured,'
-                            r' +Hello +(?P<hello>(\d+)),'
-                            r' +Dead +(?P<dead>(\d+)),'
-                            r' +Wait +(?P<wait>(\d+)),'
-                            r'(?: +Retransmit +(?P<retransmit>(\d+)))?$')
+        p8 = regex_engine.compile(r'^Timer +intervals +configured,'
+                                      r' +Hello +(?P<hello>(\d+)),'
+                                      r' +Dead +(?P<dead>(\d+)),'
+                                      r' +Wait +(?P<wait>(\d+)),'
+                                      r'(?: +Retransmit +(?P<retransmit>(\d+)))?$')
 
-        p9 = re.compile(r'^Strict +TTL +checking'
-                            r' +(?P<strict_ttl>(enabled|disabled))'
-                            r'(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p9 = regex_engine.compile(r'^Strict +TTL +checking'
+                                      r' +(?P<strict_ttl>(enabled|disabled))'
+                                      r'(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
 
-        p10 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p10 = regex_engine.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
 
-        p11 = re.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
+        p11 = regex_engine.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
 
-        p12 = re.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
-                            r' +length +(?P<length>(\d+)), +number +of'
-                            r' +retransmission +(?P<retrans>(\d+))$')
+        p12 = regex_engine.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
+                                      r' +length +(?P<length>(\d+)), +number +of'
+                                      r' +retransmission +(?P<retrans>(\d+))$')
 
-        p13 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        p13 = regex_engine.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
 
-        p14 = re.compile(r'^Last +retransmission +scan +length +is'
-                            r' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
+        p14 = regex_engine.compile(r'^Last +retransmission +scan +length +is'
+                                      r' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
 
-        p15 = re.compile(r'^Last +retransmission +scan +time +is'
-                            r' +(?P<time>(\d+)) +msec, +maximum +is'
-                            r' +(?P<max>(\d+)) +msec$')
+        p15 = regex_engine.compile(r'^Last +retransmission +scan +time +is'
+                                      r' +(?P<time>(\d+)) +msec, +maximum +is'
+                                      r' +(?P<max>(\d+)) +msec$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3635,7 +3637,7 @@ class ShowIpOspfLinksParser(MetaParser):
                 # Get VRF information using the ospf instance
                 if instance is not None:
                     cmd = 'show running-config | section router ospf {}'.format(instance)
-                    out = self.device.execute(cmd)
+                    out = cached_execute(self.device, cmd)
 
                     for line in out.splitlines():
                         line = line.rstrip()
@@ -4259,45 +4261,45 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
-                           r' +address +(?P<address>(\S+))'
-                            r'(?:, +interface-id +(?P<intf_id>(\S+)))?$')
+        p1 = regex_engine.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
+                                     r' +address +(?P<address>(\S+))'
+                                      r'(?:, +interface-id +(?P<intf_id>(\S+)))?$')
         
-        p2 = re.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
-                            r' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
+        p2 = regex_engine.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
+                                      r' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
         
-        p3 = re.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
-                           r' +State +is +(?P<state>(\S+)),'
-                            r' +(?P<num>(\d+)) +state +changes$')
+        p3 = regex_engine.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
+                                     r' +State +is +(?P<state>(\S+)),'
+                                      r' +(?P<num>(\d+)) +state +changes$')
         
-        p4 = re.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
-                            r' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
+        p4 = regex_engine.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
+                                      r' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
         
-        p5 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
-                            r' +\(E-bit\)$')
+        p5 = regex_engine.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
+                                      r' +\(E-bit\)$')
         
-        p6 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
-                            r' +\(E-bit, O-bit\)$')
+        p6 = regex_engine.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
+                                      r' +\(E-bit, O-bit\)$')
         
-        p7 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
+        p7 = regex_engine.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
         
-        p8 = re.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
+        p8 = regex_engine.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
         
-        p9 = re.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
-                            r' +length +(?P<ql>(\d+)), +number +of'
-                            r' +retransmission +(?P<num_retrans>(\d+))$')
+        p9 = regex_engine.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
+                                      r' +length +(?P<ql>(\d+)), +number +of'
+                                      r' +retransmission +(?P<num_retrans>(\d+))$')
         
-        p10 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        p10 = regex_engine.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
         
-        p11 = re.compile(r'^Last +retransmission +scan +length +is'
-                            r' +(?P<num1>(\d+)), +maximum +is'
-                            r' +(?P<num2>(\d+))$')
+        p11 = regex_engine.compile(r'^Last +retransmission +scan +length +is'
+                                      r' +(?P<num1>(\d+)), +maximum +is'
+                                      r' +(?P<num2>(\d+))$')
         
-        p12 = re.compile(r'^Last +retransmission +scan +time +is'
-                            r' +(?P<num1>(\d+)) +msec, +maximum +is'
-                            r' +(?P<num2>(\d+)) +msec$')
+        p12 = regex_engine.compile(r'^Last +retransmission +scan +time +is'
+                                      r' +(?P<num1>(\d+)) +msec, +maximum +is'
+                                      r' +(?P<num2>(\d+)) +msec$')
         
-        p13 = re.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
+        p13 = regex_engine.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -4340,7 +4342,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 # Get VRF information using the ospf instance
                 if instance is not None:
                     cmd = 'show running-config | section router ospf {}'.format(instance)
-                    out = self.device.execute(cmd)
+                    out = cached_execute(self.device, cmd)
 
                     for line in out.splitlines():
                         line = line.rstrip()
@@ -4694,45 +4696,45 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
-                            r' +address +(?P<address>(\S+))'
-                            r'(?:, +interface-id +(?P<intf_id>(\S+)))?$')
+        p1 = regex_engine.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
+                                      r' +address +(?P<address>(\S+))'
+                                      r'(?:, +interface-id +(?P<intf_id>(\S+)))?$')
         
-        p2 = re.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
-                            r' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
+        p2 = regex_engine.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
+                                      r' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
         
-        p3 = re.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
-                            r' +State +is +(?P<state>(\S+)),'
-                            r' +(?P<num>(\d+)) +state +changes$')
+        p3 = regex_engine.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
+                                      r' +State +is +(?P<state>(\S+)),'
+                                      r' +(?P<num>(\d+)) +state +changes$')
         
-        p4 = re.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
-                            r' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
+        p4 = regex_engine.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
+                                      r' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
         
-        p5 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
-                            r' +\(E-bit\)$')
+        p5 = regex_engine.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
+                                      r' +\(E-bit\)$')
         
-        p6 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
-                            r' +\(E-bit, O-bit\)$')
+        p6 = regex_engine.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
+                                      r' +\(E-bit, O-bit\)$')
         
-        p7 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
+        p7 = regex_engine.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
         
-        p8 = re.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
+        p8 = regex_engine.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
         
-        p9 = re.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
-                            r' +length +(?P<ql>(\d+)), +number +of'
-                            r' +retransmission +(?P<num_retrans>(\d+))$')
+        p9 = regex_engine.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
+                                      r' +length +(?P<ql>(\d+)), +number +of'
+                                      r' +retransmission +(?P<num_retrans>(\d+))$')
         
-        p10 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        p10 = regex_engine.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
         
-        p11 = re.compile(r'^Last +retransmission +scan +length +is'
-                            r' +(?P<num1>(\d+)), +maximum +is'
-                            r' +(?P<num2>(\d+))$')
+        p11 = regex_engine.compile(r'^Last +retransmission +scan +length +is'
+                                      r' +(?P<num1>(\d+)), +maximum +is'
+                                      r' +(?P<num2>(\d+))$')
         
-        p12 = re.compile(r'^Last +retransmission +scan +time +is'
-                            r' +(?P<num1>(\d+)) +msec, +maximum +is'
-                            r' +(?P<num2>(\d+)) +msec$')
+        p12 = regex_engine.compile(r'^Last +retransmission +scan +time +is'
+                                      r' +(?P<num1>(\d+)) +msec, +maximum +is'
+                                      r' +(?P<num2>(\d+)) +msec$')
         
-        p13 = re.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
+        p13 = regex_engine.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
         
         
         for line in out.splitlines():
@@ -4952,21 +4954,21 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^(?P<interface>(Lo.*|.*Gig.*|.*(SL|VL).*|'
-                            r'Cellular.*|FastEthernet.*|LISP.*|Po.*|Tunnel.*|'
-                            r'VirtualPortGroup.*|Vlan.*))$')
+        p1 = regex_engine.compile(r'^(?P<interface>(Lo.*|.*Gig.*|.*(SL|VL).*|'
+                                      r'Cellular.*|FastEthernet.*|LISP.*|Po.*|Tunnel.*|'
+                                      r'VirtualPortGroup.*|Vlan.*))$')
 
-        p2 = re.compile(r'^Process +ID +(?P<instance>(\S+)),'
-                            r'(?: +VRF +(?P<vrf>(\S+)),)?'
-                            r' +Area +(?P<area>(\S+))$')
+        p2 = regex_engine.compile(r'^Process +ID +(?P<instance>(\S+)),'
+                                      r'(?: +VRF +(?P<vrf>(\S+)),)?'
+                                      r' +Area +(?P<area>(\S+))$')
 
-        p3 = re.compile(r'^LDP +is'
-                            r' +(?P<auto_config>(not configured|configured))'
-                            r' +through +LDP +autoconfig$')
+        p3 = regex_engine.compile(r'^LDP +is'
+                                      r' +(?P<auto_config>(not configured|configured))'
+                                      r' +through +LDP +autoconfig$')
 
-        p5 = re.compile(r'^Holddown +timer +is (?P<val>([a-zA-Z\s]+))$')
+        p5 = regex_engine.compile(r'^Holddown +timer +is (?P<val>([a-zA-Z\s]+))$')
         # Interface is down and pending LDP
-        p6 = re.compile(r'^Interface +is (?P<state>(up|down))( +and +(?P<state_info>[\w\s]*))?$')
+        p6 = regex_engine.compile(r'^Interface +is (?P<state>(up|down))( +and +(?P<state_info>[\w\s]*))?$')
 
 
         for line in out.splitlines():
@@ -5089,8 +5091,8 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
             
             # LDP-IGP Synchronization : Not required
             # LDP-IGP Synchronization : Required
-            p4 = re.compile(r'^LDP-IGP +Synchronization *:'
-                              r' +(?P<igp_sync>(Not required|Required))$')
+            p4 = regex_engine.compile(r'^LDP-IGP +Synchronization *:'
+                                        r' +(?P<igp_sync>(Not required|Required))$')
             m = p4.match(line)
             if m:
                 if m.groupdict()['igp_sync'] == 'Required':
@@ -5209,42 +5211,42 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            r' +\(Process +ID +(?P<instance>(\S+))\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                      r' +\(Process +ID +(?P<instance>(\S+))\)$')
 
-        p2 = re.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
-                            r' +MPLS +TE +links. +Area +instance +is'
-                            r' +(?P<area_instance>(\d+))\.$')
+        p2 = regex_engine.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
+                                      r' +MPLS +TE +links. +Area +instance +is'
+                                      r' +(?P<area_instance>(\d+))\.$')
 
-        p3 = re.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
+        p3 = regex_engine.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
 
-        p4 = re.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
+        p4 = regex_engine.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
 
-        p5 = re.compile(r'^Link +is +associated +with +fragment'
-                            r' +(?P<fragment>(\d+))\. +Link +instance +is'
-                            r' +(?P<link_instance>(\d+))$')
+        p5 = regex_engine.compile(r'^Link +is +associated +with +fragment'
+                                      r' +(?P<fragment>(\d+))\. +Link +instance +is'
+                                      r' +(?P<link_instance>(\d+))$')
 
-        p6 = re.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
+        p6 = regex_engine.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
 
-        p7 = re.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
+        p7 = regex_engine.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
 
-        p8 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
+        p8 = regex_engine.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
 
-        p9 = re.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
-                            r' +(?P<igp>(\d+))$')
+        p9 = regex_engine.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
+                                      r' +(?P<igp>(\d+))$')
 
-        p14 = re.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
+        p14 = regex_engine.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
 
-        p10 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
-                            r' +(?P<res_band>(\d+))$')
+        p10 = regex_engine.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
+                                      r' +(?P<res_band>(\d+))$')
 
-        p11 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+        p11 = regex_engine.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
 
-        p12 = re.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
+        p12 = regex_engine.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
 
-        p13 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            r' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            r' *: +(?P<band2>(\d+)))?$')
+        p13 = regex_engine.compile(r'^Priority +(?P<num1>(\d+)) *:'
+                                      r' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+                                      r' *: +(?P<band2>(\d+)))?$')
 
 
         for line in out.splitlines():
@@ -5257,7 +5259,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 instance = str(m.groupdict()['instance'])
                 # Get VRF information using the ospf instance
                 cmd = 'show running-config | section router ospf {}'.format(instance)
-                out = self.device.execute(cmd)
+                out = cached_execute(self.device, cmd)
 
                 for line in out.splitlines():
                     line = line.rstrip()
@@ -5562,42 +5564,42 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            r' +\(Process +ID +(?P<instance>(\S+))\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                      r' +\(Process +ID +(?P<instance>(\S+))\)$')
 
-        p2 = re.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
-                            r' +MPLS +TE +links. +Area +instance +is'
-                            r' +(?P<area_instance>(\d+))\.$')
+        p2 = regex_engine.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
+                                      r' +MPLS +TE +links. +Area +instance +is'
+                                      r' +(?P<area_instance>(\d+))\.$')
 
-        p3 = re.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
+        p3 = regex_engine.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
 
-        p4 = re.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
+        p4 = regex_engine.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
 
-        p5 = re.compile(r'^Link +is +associated +with +fragment'
-                            r' +(?P<fragment>(\d+))\. +Link +instance +is'
-                            r' +(?P<link_instance>(\d+))$')
+        p5 = regex_engine.compile(r'^Link +is +associated +with +fragment'
+                                      r' +(?P<fragment>(\d+))\. +Link +instance +is'
+                                      r' +(?P<link_instance>(\d+))$')
 
-        p6 = re.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
+        p6 = regex_engine.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
 
-        p7 = re.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
+        p7 = regex_engine.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
 
-        p8 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
+        p8 = regex_engine.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
 
-        p9 = re.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
-                            r' +(?P<igp>(\d+))$')
+        p9 = regex_engine.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
+                                      r' +(?P<igp>(\d+))$')
 
-        p14 = re.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
+        p14 = regex_engine.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
 
-        p10 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
-                            r' +(?P<res_band>(\d+))$')
+        p10 = regex_engine.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
+                                      r' +(?P<res_band>(\d+))$')
 
-        p11 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+        p11 = regex_engine.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
 
-        p12 = re.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
+        p12 = regex_engine.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
 
-        p13 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            r' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            r' *: +(?P<band2>(\d+)))?$')
+        p13 = regex_engine.compile(r'^Priority +(?P<num1>(\d+)) *:'
+                                      r' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+                                      r' *: +(?P<band2>(\d+)))?$')
 
 
         for line in out.splitlines():
@@ -5818,39 +5820,39 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
 
         # OSPF Router with ID (172.16.1.214) (Process ID 65109)
         # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         r' +\(Process +ID +(?P<instance>(\d+))'
-                         r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                   r' +\(Process +ID +(?P<instance>(\d+))'
+                                   r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
         # Base Topology (MTID 0)
-        p2 = re.compile(r'^Base +Topology +\(MTID +(?P<mtid>(\d+))\)$')
+        p2 = regex_engine.compile(r'^Base +Topology +\(MTID +(?P<mtid>(\d+))\)$')
 
         # Start time: 00:01:58.314, Time elapsed: 00:54:43.858
-        p3 = re.compile(r'^Start +time: +(?P<start_time>(\S+)), +Time +elapsed:'
-                         r' +(?P<time_elapsed>(\S+))$')
+        p3 = regex_engine.compile(r'^Start +time: +(?P<start_time>(\S+)), +Time +elapsed:'
+                                   r' +(?P<time_elapsed>(\S+))$')
 
         # Originating router-LSAs with maximum metric
         # Originating router-LSAs with maximum metric, Time remaining: 00:03:55
-        p4_1 = re.compile(r'^Originating +router-LSAs +with +maximum +metric(, +Time +remaining: +(?P<time_remaining>([\d\:]+)))?$')
+        p4_1 = regex_engine.compile(r'^Originating +router-LSAs +with +maximum +metric(, +Time +remaining: +(?P<time_remaining>([\d\:]+)))?$')
 
         # Router is not originating router-LSAs with maximum metric
-        p4_2 = re.compile(r'^Router +is +not +originating +router-LSAs +with'
-                           r' +maximum +metric$')
+        p4_2 = regex_engine.compile(r'^Router +is +not +originating +router-LSAs +with'
+                                     r' +maximum +metric$')
 
         # Condition: on startup for 5 seconds, State: inactive
-        p5 = re.compile(r'^Condition: +(?P<condition>(.*)), +State:'
-                          r' +(?P<state>([a-zA-Z\s]+))$')
+        p5 = regex_engine.compile(r'^Condition: +(?P<condition>(.*)), +State:'
+                                    r' +(?P<state>([a-zA-Z\s]+))$')
 
         # Advertise summary-LSAs with metric 16711680
-        p6 = re.compile(r'^Advertise +summary-LSAs +with +metric'
-                         r' +(?P<metric>(\d+))$')
+        p6 = regex_engine.compile(r'^Advertise +summary-LSAs +with +metric'
+                                   r' +(?P<metric>(\d+))$')
 
         # Unset reason: timer expired, Originated for 5 seconds
-        p7 = re.compile(r'^Unset +reason: (?P<reason>(.*))$')
+        p7 = regex_engine.compile(r'^Unset +reason: (?P<reason>(.*))$')
 
         # Unset time: 00:02:03.314, Time elapsed: 00:54:38.858
-        p8 = re.compile(r'^Unset +time: +(?P<time>(\S+)), +Time +elapsed:'
-                         r' +(?P<elapsed>(\S+))$')
+        p8 = regex_engine.compile(r'^Unset +time: +(?P<time>(\S+)), +Time +elapsed:'
+                                   r' +(?P<elapsed>(\S+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6191,47 +6193,47 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
         max_size_stats = False ; current_size_stats = False
 
         # OSPF statistics:
-        p1 = re.compile(r'^OSPF +statistics:$')
+        p1 = regex_engine.compile(r'^OSPF +statistics:$')
 
         # Last clearing of OSPF traffic counters never
         # Last clearing of interface traffic counters never
-        p2 = re.compile(r'^Last +clearing +of +(?P<type>(OSPF|interface)) +traffic'
-                         r' +counters +(?P<last_clear>([a-zA-Z0-9\:\s]+))$')
+        p2 = regex_engine.compile(r'^Last +clearing +of +(?P<type>(OSPF|interface)) +traffic'
+                                   r' +counters +(?P<last_clear>([a-zA-Z0-9\:\s]+))$')
 
         # Rcvd: 2112690 total, 0 checksum errors
-        p3 = re.compile(r'^Rcvd: +(?P<total>(\d+)) total, +(?P<csum_errors>(\d+))'
-                         r' +checksum +errors$')
+        p3 = regex_engine.compile(r'^Rcvd: +(?P<total>(\d+)) total, +(?P<csum_errors>(\d+))'
+                                   r' +checksum +errors$')
 
         # 2024732 hello, 938 database desc, 323 link state req
         # 2381794 hello, 1176 database desc, 43 link state req
-        p4 = re.compile(r'^(?P<hello>(\d+)) +hello, +(?P<db_desc>(\d+))'
-                         r' +database +desc, +(?P<link_state_req>(\d+))'
-                         r' +link +state +req$')
+        p4 = regex_engine.compile(r'^(?P<hello>(\d+)) +hello, +(?P<db_desc>(\d+))'
+                                   r' +database +desc, +(?P<link_state_req>(\d+))'
+                                   r' +link +state +req$')
 
         # 11030 link state updates, 75666 link state acks
         # 92224 link state updates, 8893 link state acks
-        p5 = re.compile(r'^(?P<link_state_updates>(\d+)) +link +state +updates,'
-                         r' +(?P<link_state_acks>(\d+)) +link +state +acks$')
+        p5 = regex_engine.compile(r'^(?P<link_state_updates>(\d+)) +link +state +updates,'
+                                   r' +(?P<link_state_acks>(\d+)) +link +state +acks$')
 
         # Sent: 2509472 total
-        p6 = re.compile(r'^Sent: +(?P<total>(\d+)) +total$')
+        p6 = regex_engine.compile(r'^Sent: +(?P<total>(\d+)) +total$')
 
 
         # OSPF Router with ID (10.169.197.252) (Process ID 65109)
         # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p7 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         r' +\(Process +ID +(?P<instance>(\d+))'
-                         r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p7 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                   r' +\(Process +ID +(?P<instance>(\d+))'
+                                   r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
         # OSPF queue statistics for process ID 65109:
-        p8 = re.compile(r'^OSPF +queue +statistics +for +process +ID +(?P<pid>(\d+)):$')
+        p8 = regex_engine.compile(r'^OSPF +queue +statistics +for +process +ID +(?P<pid>(\d+)):$')
 
         #                   InputQ   UpdateQ      OutputQ
         # Limit             0        200          0
         # Drops             0          0          0
         # Max delay [msec] 49          2          2
-        p9_1 = re.compile(r'^(?P<item>(Limit|Drops|Max delay \[msec\])) +'
-                        r'(?P<inputq>(\d+)) +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
+        p9_1 = regex_engine.compile(r'^(?P<item>(Limit|Drops|Max delay \[msec\])) +'
+                                  r'(?P<inputq>(\d+)) +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
         
         # Invalid           0          0          0
         # Hello             0          0          0
@@ -6239,21 +6241,21 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
         # LS req            0          0          0
         # LS upd            0          0          0
         # LS ack           14         14          6
-        p9_2 = re.compile(r'^(?P<item>(Invalid|Hello|DB des|LS '
-                        r'req|LS upd|LS ack)) +(?P<inputq>(\d+)) '
-                        r'+(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
+        p9_2 = regex_engine.compile(r'^(?P<item>(Invalid|Hello|DB des|LS '
+                                  r'req|LS upd|LS ack)) +(?P<inputq>(\d+)) '
+                                  r'+(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
 
         #                   InputQ   UpdateQ      OutputQ
         # Max size         14         14          6
         # Current size      0          0          0
-        p9_3 = re.compile(r'^(?P<item>(Max size|Current size)) +(?P<inputq>(\d+))'
-                           r' +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
+        p9_3 = regex_engine.compile(r'^(?P<item>(Max size|Current size)) +(?P<inputq>(\d+))'
+                                     r' +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
 
         # Interface statistics:
-        p10 = re.compile(r'^Interface +statistics:$')
+        p10 = regex_engine.compile(r'^Interface +statistics:$')
 
         # Interface GigabitEthernet0/0/6
-        p11 = re.compile(r'^Interface +(?P<intf>(\S+))$')
+        p11 = regex_engine.compile(r'^Interface +(?P<intf>(\S+))$')
 
         # OSPF packets received/sent
         # Type          Packets              Bytes
@@ -6271,61 +6273,61 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
         # TX LS upd     12539                12553264
         # TX LS ack     899                  63396
         # TX Total      182893               26212884
-        p12 = re.compile(r'^(?P<type>([a-zA-Z\s]+)) +(?P<packets>(\d+))'
-                          r' +(?P<bytes>(\d+))$')
+        p12 = regex_engine.compile(r'^(?P<type>([a-zA-Z\s]+)) +(?P<packets>(\d+))'
+                                    r' +(?P<bytes>(\d+))$')
 
         # OSPF header errors
-        p13 = re.compile(r'^OSPF +header +errors$')
+        p13 = regex_engine.compile(r'^OSPF +header +errors$')
 
         # Length 0, Instance ID 0, Checksum 0, Auth Type 0,
-        p14 = re.compile(r'^Length +(?P<len>(\d+)), +Instance +ID'
-                          r' +(?P<iid>(\d+)), +Checksum +(?P<csum>(\d+)),'
-                          r' +Auth +Type +(?P<auth>(\d+)),?$')
+        p14 = regex_engine.compile(r'^Length +(?P<len>(\d+)), +Instance +ID'
+                                    r' +(?P<iid>(\d+)), +Checksum +(?P<csum>(\d+)),'
+                                    r' +Auth +Type +(?P<auth>(\d+)),?$')
 
         # Version 0, Bad Source 0, No Virtual Link 0,
-        p15 = re.compile(r'^Version +(?P<version>(\d+)), +Bad +Source'
-                          r' +(?P<bad_source>(\d+)), +No +Virtual +Link'
-                          r' +(?P<no_virtual_link>(\d+)),?$')
+        p15 = regex_engine.compile(r'^Version +(?P<version>(\d+)), +Bad +Source'
+                                    r' +(?P<bad_source>(\d+)), +No +Virtual +Link'
+                                    r' +(?P<no_virtual_link>(\d+)),?$')
 
         # Area Mismatch 0, No Sham Link 0, Self Originated 0,
-        p16 = re.compile(r'^Area +Mismatch +(?P<area_mismatch>(\d+)),'
-                          r' +No +Sham +Link +(?P<no_sham_link>(\d+)),'
-                          r' +Self +Originated +(?P<self_originated>(\d+)),?$')
+        p16 = regex_engine.compile(r'^Area +Mismatch +(?P<area_mismatch>(\d+)),'
+                                    r' +No +Sham +Link +(?P<no_sham_link>(\d+)),'
+                                    r' +Self +Originated +(?P<self_originated>(\d+)),?$')
 
         # Duplicate ID 0, Hello 0, MTU Mismatch 0,
-        p17 = re.compile(r'^Duplicate +ID +(?P<duplicate_id>(\d+)),'
-                          r' +Hello +(?P<hello>(\d+)), +MTU +Mismatch'
-                          r' +(?P<mtu_mismatch>(\d+)),$')
+        p17 = regex_engine.compile(r'^Duplicate +ID +(?P<duplicate_id>(\d+)),'
+                                    r' +Hello +(?P<hello>(\d+)), +MTU +Mismatch'
+                                    r' +(?P<mtu_mismatch>(\d+)),$')
 
         # Nbr Ignored 0, LLS 0, Unknown Neighbor 0,
-        p18 = re.compile(r'^Nbr +Ignored +(?P<nbr_ignored>(\d+)), +LLS'
-                          r' +(?P<lls>(\d+)), +Unknown +Neighbor'
-                          r' +(?P<unknown_neighbor>(\d+)),?$')
+        p18 = regex_engine.compile(r'^Nbr +Ignored +(?P<nbr_ignored>(\d+)), +LLS'
+                                    r' +(?P<lls>(\d+)), +Unknown +Neighbor'
+                                    r' +(?P<unknown_neighbor>(\d+)),?$')
 
         # Authentication 0, TTL Check Fail 0, Adjacency Throttle 0,
-        p19 = re.compile(r'^Authentication +(?P<authentication>(\d+)), +TTL'
-                          r' +Check +Fail +(?P<ttl_check_fail>(\d+)), +Adjacency'
-                          r' +Throttle +(?P<adjacency_throttle>(\d+)),?$')
+        p19 = regex_engine.compile(r'^Authentication +(?P<authentication>(\d+)), +TTL'
+                                    r' +Check +Fail +(?P<ttl_check_fail>(\d+)), +Adjacency'
+                                    r' +Throttle +(?P<adjacency_throttle>(\d+)),?$')
 
         # Authentication 0, TTL Check Fail 0, Test discard 0
-        p19_1 = re.compile(r'^Authentication +(?P<authentication>\d+), +TTL'
-                          r' +Check +Fail +(?P<ttl_check_fail>\d+), +Test discard'
-                          r' +(?P<test_discard>\d+),?$')
+        p19_1 = regex_engine.compile(r'^Authentication +(?P<authentication>\d+), +TTL'
+                                    r' +Check +Fail +(?P<ttl_check_fail>\d+), +Test discard'
+                                    r' +(?P<test_discard>\d+),?$')
 
         # BFD 0, Test discard 0
-        p20 = re.compile(r'^BFD +(?P<bfd>(\d+)), +Test +discard'
-                          r' +(?P<test_discard>(\d+))$')
+        p20 = regex_engine.compile(r'^BFD +(?P<bfd>(\d+)), +Test +discard'
+                                    r' +(?P<test_discard>(\d+))$')
 
         # OSPF LSA errors
-        p21 = re.compile(r'^OSPF +LSA +errors$')
+        p21 = regex_engine.compile(r'^OSPF +LSA +errors$')
 
         # Type 0, Length 0, Data 0, Checksum 0
-        p22 = re.compile(r'^Type +(?P<type>(\d+)), +Length +(?P<len>(\d+)),'
-                          r' +Data +(?P<data>(\d+)), +Checksum +(?P<csum>(\d+))$')
+        p22 = regex_engine.compile(r'^Type +(?P<type>(\d+)), +Length +(?P<len>(\d+)),'
+                                    r' +Data +(?P<data>(\d+)), +Checksum +(?P<csum>(\d+))$')
 
         # Summary traffic statistics for process ID 65109:
-        p23 = re.compile(r'^Summary +traffic +statistics +for +process +ID'
-                          r' +(?P<pid>(\d+)):$')
+        p23 = regex_engine.compile(r'^Summary +traffic +statistics +for +process +ID'
+                                    r' +(?P<pid>(\d+)):$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6735,8 +6737,8 @@ class ShowIpOspfNeighbor(ShowIpOspfNeighborSchema):
         # 172.16.197.253 128   FULL/DR         00:00:30    172.16.165.49  GigabitEthernet0/0/1
         # 10.169.197.252   0   FULL/  -        00:00:36    10.169.197.93  GigabitEthernet2
         
-        p1=re.compile(r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
-                       r' +(?P<dead_time>\S+) +(?P<address>\S+) +(?P<interface>\S+)$')
+        p1=regex_engine.compile(r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
+                                 r' +(?P<dead_time>\S+) +(?P<address>\S+) +(?P<interface>\S+)$')
 
         for line in out.splitlines():
 
@@ -6807,15 +6809,15 @@ class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidS
             out = output
 
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        r1 = re.compile(r'OSPF\s+Router\s+with\s+ID\s+\((?P<router_id>\S+)\)\s+'
-                         r'\(Process\s+ID\s+(?P<process_id>\d+)\)')
+        r1 = regex_engine.compile(r'OSPF\s+Router\s+with\s+ID\s+\((?P<router_id>\S+)\)\s+'
+                                   r'\(Process\s+ID\s+(?P<process_id>\d+)\)')
 
         # 16       10.16.2.2         Gi0/1/2            192.168.154.2       D U   
         # 17       10.16.2.2         Gi0/1/1            192.168.4.2       D U   
-        r2 = re.compile(r'(?P<adj_sid>\d+)\s+(?P<neighbor_id>\S+)\s+'
-                         r'(?P<interface>\S+)\s+(?P<neighbor_address>\S+)\s+'
-                         r'(?P<flags>[SDPUGL\s]+)\s*(?:(?P<backup_nexthop>\S+))?'
-                         r'\s*(?:(?P<backup_interface>\S+))?')
+        r2 = regex_engine.compile(r'(?P<adj_sid>\d+)\s+(?P<neighbor_id>\S+)\s+'
+                                   r'(?P<interface>\S+)\s+(?P<neighbor_address>\S+)\s+'
+                                   r'(?P<flags>[SDPUGL\s]+)\s*(?:(?P<backup_nexthop>\S+))?'
+                                   r'\s*(?:(?P<backup_interface>\S+))?')
 
         parsed_output = {}
 
@@ -6909,17 +6911,17 @@ class ShowIpOspfFastRerouteTiLfa(ShowIpOspfFastRerouteTiLfaSchema):
             out = output
 
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)'
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)'
             r'\) +\(Process +ID +(?P<process_id>\d+)\)')
 
         # Process ID (65109)       no       yes      no          no
         # Area 8                  no       yes      no          no
         # Loopback0               no       no       no          no
         # GigabitEthernet0/1/2    no       yes      no          no
-        p2 = re.compile(r'^(?P<ospf_object>[\S\s]+) +(?P<ipfrr_enabled>(yes|no)'
-                         r'( +\(inactive\))?) +(?P<sr_enabled>(yes|no)( +\(inactive\))?) '
-                         r'+(?P<ti_lfa_configured>(yes|no)( +\(inactive\))?) +'
-                         r'(?P<ti_lfa_enabled>(yes|no)( +\(inactive\))?)$')
+        p2 = regex_engine.compile(r'^(?P<ospf_object>[\S\s]+) +(?P<ipfrr_enabled>(yes|no)'
+                                   r'( +\(inactive\))?) +(?P<sr_enabled>(yes|no)( +\(inactive\))?) '
+                                   r'+(?P<ti_lfa_configured>(yes|no)( +\(inactive\))?) +'
+                                   r'(?P<ti_lfa_enabled>(yes|no)( +\(inactive\))?)$')
 
         # initial variables
         ret_dict = {}
@@ -7014,14 +7016,14 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
             out = output
 
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
-                         r'Process +ID +(?P<process_id>\d+)\)')
+        p1 = regex_engine.compile(r'OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
+                                   r'Process +ID +(?P<process_id>\d+)\)')
 
         # Area with ID (8)
-        p2 = re.compile(r'^Area +with +ID \((?P<area_id>\d+)\)$')
+        p2 = regex_engine.compile(r'^Area +with +ID \((?P<area_id>\d+)\)$')
 
         # 10.234.30.22     Gi10                192.168.10.2       17           192.168.10.3       Gi14
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<neighbor_id>\S+) +(?P<interface>\S+) +(?P<address>\S+) +('
             r'?P<adj_sid>\d+)( +(?P<backup_nexthop>\S+))?( +(?P<backup_interface>\S+))?$')
 
@@ -7121,17 +7123,17 @@ class ShowIpOspfSegmentRoutingSidDatabase(ShowIpOspfSegmentRoutingSidDatabaseSch
             out = output
 
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
-                        r'\(Process +ID +(?P<pid>\d+)\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
+                                  r'\(Process +ID +(?P<pid>\d+)\)$')
 
         # 1       (L)     10.4.1.1/32          10.4.1.1          8        Intra     0
         # 2               10.16.2.2/32          10.16.2.2          8        Intra     0
         #                 10.16.2.3/32          10.16.2.2          8        Intra     0
         # 3       (M)     10.16.2.3/32                                    Unknown   0
         #                 10.36.3.3/32               10.16.2.10         0
-        p2 = re.compile(r'(?:(?P<sid>\d+) +)?(?:\((?P<codes>[LNM,]+)\) +)?(?P<prefix>[\d\.\/]+)'
-                        r'( +(?P<adv_rtr_id>[\d\.]+))?( +(?P<area_id>\d+))?(?: +(?P<type>\w+))?'
-                        r'(?: +(?P<algo>\d+))?')
+        p2 = regex_engine.compile(r'(?:(?P<sid>\d+) +)?(?:\((?P<codes>[LNM,]+)\) +)?(?P<prefix>[\d\.\/]+)'
+                                  r'( +(?P<adv_rtr_id>[\d\.]+))?( +(?P<area_id>\d+))?(?: +(?P<type>\w+))?'
+                                  r'(?: +(?P<algo>\d+))?')
 
         ret_dict = {}
         sid_entries = 0
@@ -7237,19 +7239,19 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
             out = output
 
         # OSPF Router with ID (10.4.1.1) (Process ID 1234)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
-                         r'\(Process +ID +(?P<pid>\d+)\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
+                                   r'\(Process +ID +(?P<pid>\d+)\)$')
 
         # OSPF Segment Routing Global Blocks in Area 3
-        p2 = re.compile(r'^OSPF +Segment +Routing +Global +Blocks +in +Area (?P<area>\d+)$')
+        p2 = regex_engine.compile(r'^OSPF +Segment +Routing +Global +Blocks +in +Area (?P<area>\d+)$')
 
         # *10.4.1.1         Yes         SPF,StrictSPF 16000      8000         Label
         # 10.16.2.2         Yes         SPF,StrictSPF 16000      8000         Label
         # *10.4.1.1         No
         # 10.16.2.2         No
-        p3 = re.compile(r'^\*?(?P<router_id>[\d\.]+) +(?P<sr_capable>\w+)'
-                         r'(?: +(?P<sr_algorithm>[\w,]+) +(?P<srgb_base>\d+) +'
-                         r'(?P<srgb_range>\d+) +(?P<sid_label>\w+))?$')
+        p3 = regex_engine.compile(r'^\*?(?P<router_id>[\d\.]+) +(?P<sr_capable>\w+)'
+                                   r'(?: +(?P<sr_algorithm>[\w,]+) +(?P<srgb_base>\d+) +'
+                                   r'(?P<srgb_range>\d+) +(?P<sid_label>\w+))?$')
 
         ret_dict = {}
 
@@ -7390,78 +7392,78 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
             out = output
         
         # OSPF Router with ID (10.16.2.2) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
-                         r'Process +ID +(?P<process_id>\d+)\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
+                                   r'Process +ID +(?P<process_id>\d+)\)$')
 
         # Global segment-routing state: Enabled
-        p2 = re.compile(r'^Global +segment\-routing +state: +'
-                         r'(?P<global_segment_routing_state>\S+)$')
+        p2 = regex_engine.compile(r'^Global +segment\-routing +state: +'
+                                   r'(?P<global_segment_routing_state>\S+)$')
         
         # Prefer non-SR (LDP) Labels
-        p3 = re.compile(r'^Prefer +non\-SR +\(LDP\) +Labels$')
+        p3 = regex_engine.compile(r'^Prefer +non\-SR +\(LDP\) +Labels$')
 
         # Do not advertise Explicit Null
-        p4 = re.compile(r'^Do +not +advertise +Explicit +Null$')
+        p4 = regex_engine.compile(r'^Do +not +advertise +Explicit +Null$')
 
         # Global Block (SRGB):
-        p5 = re.compile(r'^Global +Block +\(SRGB\):$')
+        p5 = regex_engine.compile(r'^Global +Block +\(SRGB\):$')
 
         # Range: 16000 - 23999
-        p6 = re.compile(r'^Range: +(?P<start>\d+) +\- +(?P<end>\d+)$')
+        p6 = regex_engine.compile(r'^Range: +(?P<start>\d+) +\- +(?P<end>\d+)$')
 
         # State: Created
-        p7 = re.compile(r'^State: +(?P<state>\S+)$')
+        p7 = regex_engine.compile(r'^State: +(?P<state>\S+)$')
 
         # Local Block (SRLB):
-        p8 = re.compile(r'^Local +Block +\(SRLB\):$')
+        p8 = regex_engine.compile(r'^Local +Block +\(SRLB\):$')
 
         # Registered with SR App, client handle: 2
-        p9 = re.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +'
-                         r'client +handle: +(?P<client_handle>\d+)$')
+        p9 = regex_engine.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +'
+                                   r'client +handle: +(?P<client_handle>\d+)$')
 
         # SR algo 0 Connected map notifications active (handle 0x0), bitmask 0x1
-        p10 = re.compile(r'^SR +algo +(?P<algo>\d+) +(?P<notifications>[\S\s]+) +\('
-                          r'handle +(?P<handle>\w+)\), +bitmask +(?P<bitmask>\w+)$')
+        p10 = regex_engine.compile(r'^SR +algo +(?P<algo>\d+) +(?P<notifications>[\S\s]+) +\('
+                                    r'handle +(?P<handle>\w+)\), +bitmask +(?P<bitmask>\w+)$')
 
         # Registered with MPLS, client-id: 100
-        p12 = re.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +client\-id: +'
-                          r'(?P<client_id>\d+)$')
+        p12 = regex_engine.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +client\-id: +'
+                                    r'(?P<client_id>\d+)$')
 
         # Max labels: platform 16, available 13
-        p13 = re.compile(r'^Max +labels: +platform +(?P<platform>\d+), available +(?P<available>\d+)$')
+        p13 = regex_engine.compile(r'^Max +labels: +platform +(?P<platform>\d+), available +(?P<available>\d+)$')
 
         # Max labels pushed by OSPF: uloop tunnels 10, TI-LFA tunnels 10
-        p14 = re.compile(r'^Max +labels +pushed +by +OSPF: +uloop +tunnels +(?P<uloop_tunnels>\d+)'
-                          r', +TI\-LFA +tunnels +(?P<ti_lfa_tunnels>\d+)$')
+        p14 = regex_engine.compile(r'^Max +labels +pushed +by +OSPF: +uloop +tunnels +(?P<uloop_tunnels>\d+)'
+                                    r', +TI\-LFA +tunnels +(?P<ti_lfa_tunnels>\d+)$')
 
         # mfi label reservation ack not pending
-        p15 = re.compile(r'^mfi +label +reservation +ack +not +pending$')
+        p15 = regex_engine.compile(r'^mfi +label +reservation +ack +not +pending$')
 
         # Bind Retry timer not running
-        p16 = re.compile(r'^Bind +Retry +timer +not +running$')
+        p16 = regex_engine.compile(r'^Bind +Retry +timer +not +running$')
         
         # Bind Retry timer running, left ???
-        p16_1 = re.compile(r'^Bind +Retry +timer +running, +left +(?P<bind_retry_timer_left>\S+)$')
+        p16_1 = regex_engine.compile(r'^Bind +Retry +timer +running, +left +(?P<bind_retry_timer_left>\S+)$')
 
         # Adj Label Bind Retry timer not running
-        p17 = re.compile(r'^Adj +Label +Bind +Retry +timer +not +running$')
+        p17 = regex_engine.compile(r'^Adj +Label +Bind +Retry +timer +not +running$')
 
         # Adj Label Bind Retry timer running, left ???
-        p17_1 = re.compile(r'^Adj +Label +Bind +Retry +timer +running, +left +(?P<adj_label_bind_retry_timer_left>\S+)$')
+        p17_1 = regex_engine.compile(r'^Adj +Label +Bind +Retry +timer +running, +left +(?P<adj_label_bind_retry_timer_left>\S+)$')
 
         # sr-app locks requested: srgb 0, srlb 0
-        p18 = re.compile(r'^sr\-app +locks +requested: +srgb +(?P<srgb>\d+), +srlb +(?P<srlb>\d+)$')
+        p18 = regex_engine.compile(r'^sr\-app +locks +requested: +srgb +(?P<srgb>\d+), +srlb +(?P<srlb>\d+)$')
 
         # TE Router ID 10.16.2.2
-        p19 = re.compile(r'^TE +Router +ID +(?P<te_router_id>\S+)$')
+        p19 = regex_engine.compile(r'^TE +Router +ID +(?P<te_router_id>\S+)$')
 
         # Area Topology name Forwarding Strict SPF
-        p20 = re.compile(r'^Area +Topology +name +Forwarding +Strict +SPF$')
+        p20 = regex_engine.compile(r'^Area +Topology +name +Forwarding +Strict +SPF$')
 
         # 8    Base             MPLS          Capable
         # AS external    Base             MPLS          Not applicable
-        p21 = re.compile(r'^(?P<area>(\d+|(\w+ +\w+))) +(?P<topology_name>\w+)'
-                         r' +(?P<forwarding>\w+) +(?P<strict_spf>\w+( +\w+)?)$')
+        p21 = regex_engine.compile(r'^(?P<area>(\d+|(\w+ +\w+))) +(?P<topology_name>\w+)'
+                                   r' +(?P<forwarding>\w+) +(?P<strict_spf>\w+( +\w+)?)$')
         
         # initial variables
         ret_dict = {}
@@ -7716,76 +7718,76 @@ class ShowIpOspfLinksParser2(MetaParser):
 
         # Sham Link OSPF_SL0 to address 10.151.22.22 is up
         # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-        p1 = re.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
-                            r' +(address|router) +(?P<address>(\S+)) +is'
-                            r' +(?P<link_state>(up|down))$')
+        p1 = regex_engine.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
+                                      r' +(address|router) +(?P<address>(\S+)) +is'
+                                      r' +(?P<link_state>(up|down))$')
 
         # Area 1, source address 10.21.33.33
         # Area 1 source address 10.229.11.11
-        p2 = re.compile(r'^Area +(?P<area>(\S+)),? +source +address'
-                            r' +(?P<source_address>(\S+))$')
+        p2 = regex_engine.compile(r'^Area +(?P<area>(\S+)),? +source +address'
+                                      r' +(?P<source_address>(\S+))$')
         
         # Run as demand circuit
-        p3 = re.compile(r'^Run +as +demand +circuit$')
+        p3 = regex_engine.compile(r'^Run +as +demand +circuit$')
 
         # DoNotAge LSA not allowed (Number of DCbitless LSA is 7).
         # DoNotAge LSA not allowed (Number of DCbitless LSA is 1). Cost of using 111 State POINT_TO_POINT,
-        p4 = re.compile(r'^DoNotAge +LSA +not +allowed'
-                            r' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
-                            r'(?: +Cost +of +using +(?P<cost>(\d+)))?'
-                            r'(?: State +(?P<state>(\S+)))?$')
+        p4 = regex_engine.compile(r'^DoNotAge +LSA +not +allowed'
+                                      r' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
+                                      r'(?: +Cost +of +using +(?P<cost>(\d+)))?'
+                                      r'(?: State +(?P<state>(\S+)))?$')
 
         # Transit area 1
         # Transit area 1, via interface GigabitEthernet0/1
-        p5 = re.compile(r'^Transit +area +(?P<area>(\S+)),'
-                            r'(?: +via +interface +(?P<intf>(\S+)))?$')
+        p5 = regex_engine.compile(r'^Transit +area +(?P<area>(\S+)),'
+                                      r'(?: +via +interface +(?P<intf>(\S+)))?$')
 
         # Topology-MTID    Cost    Disabled     Shutdown      Topology Name
         #             0       1          no           no               Base
-        p6 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                            r' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                            r' +(?P<topo_name>(\S+))$')
+        p6 = regex_engine.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+                                      r' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+                                      r' +(?P<topo_name>(\S+))$')
 
         # Transmit Delay is 1 sec, State POINT_TO_POINT,
-        p7 = re.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
-                            r' +sec, +State +(?P<state>(\S+)),?$')
+        p7 = regex_engine.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
+                                      r' +sec, +State +(?P<state>(\S+)),?$')
 
         # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
         # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
         # Timer intervals configured, Hello 10, Dead 40, Wait 40,
-        p8 = re.compile(r'^Timer +intervals +configured,'
-                            r' +Hello +(?P<hello>(\d+)),'
-                            r' +Dead +(?P<dead>(\d+)),'
-                            r' +Wait +(?P<wait>(\d+)),'
-                            r'(?: +Retransmit +(?P<retransmit>(\d+)))?$')
+        p8 = regex_engine.compile(r'^Timer +intervals +configured,'
+                                      r' +Hello +(?P<hello>(\d+)),'
+                                      r' +Dead +(?P<dead>(\d+)),'
+                                      r' +Wait +(?P<wait>(\d+)),'
+                                      r'(?: +Retransmit +(?P<retransmit>(\d+)))?$')
 
         # Strict TTL checking enabled, up to 3 hops allowed
-        p9 = re.compile(r'^Strict +TTL +checking'
-                            r' +(?P<strict_ttl>(enabled|disabled))'
-                            r'(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p9 = regex_engine.compile(r'^Strict +TTL +checking'
+                                      r' +(?P<strict_ttl>(enabled|disabled))'
+                                      r'(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
 
         # Hello due in 00:00:03:179
-        p10 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p10 = regex_engine.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
 
         # Adjacency State FULL
-        p11 = re.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
+        p11 = regex_engine.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
 
         # Index 1/2/2, retransmission queue length 0, number of retransmission 2
-        p12 = re.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
-                            r' +length +(?P<length>(\d+)), +number +of'
-                            r' +retransmission +(?P<retrans>(\d+))$')
+        p12 = regex_engine.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
+                                      r' +length +(?P<length>(\d+)), +number +of'
+                                      r' +retransmission +(?P<retrans>(\d+))$')
         
         # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-        p13 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        p13 = regex_engine.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
 
         # Last retransmission scan length is 1, maximum is 1
-        p14 = re.compile(r'^Last +retransmission +scan +length +is'
-                            r' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
+        p14 = regex_engine.compile(r'^Last +retransmission +scan +length +is'
+                                      r' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
 
         # Last retransmission scan time is 0 msec, maximum is 0 msec
-        p15 = re.compile(r'^Last +retransmission +scan +time +is'
-                            r' +(?P<time>(\d+)) +msec, +maximum +is'
-                            r' +(?P<max>(\d+)) +msec$')
+        p15 = regex_engine.compile(r'^Last +retransmission +scan +time +is'
+                                      r' +(?P<time>(\d+)) +msec, +maximum +is'
+                                      r' +(?P<max>(\d+)) +msec$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -8257,8 +8259,8 @@ class ShowIpv6OspfNeighbor(ShowIpv6OspfNeighborSchema):
         # 172.16.197.253 128   FULL/DR         00:00:30          21       GigabitEthernet0/0/1
         # 10.169.197.252   0   FULL/  -        00:00:36          23       GigabitEthernet2
 
-        p1 = re.compile(r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
-                        r' +(?P<dead_time>\S+) +(?P<interface_id>\S+) +(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
+                                  r' +(?P<dead_time>\S+) +(?P<interface_id>\S+) +(?P<interface>\S+)$')
 
         for line in output.splitlines():
 
@@ -8309,25 +8311,25 @@ class ShowIpOspfNsr(ShowIpOspfNsrSchema):
             output = self.device.execute(self.cli_command)
 
         # Redundancy state: ACTIVE
-        p1 = re.compile(r"^Redundancy\s+state:\s+(?P<redundancy_state>\w+)$")
+        p1 = regex_engine.compile(r"^Redundancy\s+state:\s+(?P<redundancy_state>\w+)$")
         
         # Peer redundancy state: STANDBY HOT
-        p2 = re.compile(r"^Peer\s+redundancy\s+state:\s+(?P<peer_redundancy_state>\S+\s+\S+)$")
+        p2 = regex_engine.compile(r"^Peer\s+redundancy\s+state:\s+(?P<peer_redundancy_state>\S+\s+\S+)$")
         
         # Routing Process "ospf 50" with ID 2.200.1.2
-        p3 = re.compile(r"^Routing\s+Process\s+\"ospf\s+(?P<ospf_num>\d+)\"\s+with\s+ID\s+(?P<ospf_id>(\d{1,3}\.){3}\d{1,3})$")
+        p3 = regex_engine.compile(r"^Routing\s+Process\s+\"ospf\s+(?P<ospf_num>\d+)\"\s+with\s+ID\s+(?P<ospf_id>(\d{1,3}\.){3}\d{1,3})$")
         
         # Checkpoint message sequence number: 12358
-        p4 = re.compile(r"^Checkpoint\s+message\s+sequence\s+number:\s+(?P<sequence_num>\d+)$")
+        p4 = regex_engine.compile(r"^Checkpoint\s+message\s+sequence\s+number:\s+(?P<sequence_num>\d+)$")
         
         # Bulk sync operations:  1
-        p5 = re.compile(r"^Bulk\s+sync\s+operations:\s+(?P<sync_operations>\d+)$")
+        p5 = regex_engine.compile(r"^Bulk\s+sync\s+operations:\s+(?P<sync_operations>\d+)$")
         
         # Next sync check time:  20:29:44.061 IST Thu Oct 6 2022
-        p6 = re.compile(r"^Next\s+sync\s+check\s+time:\s+(?P<check_time>\S+)\s+(?P<check_date>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+        p6 = regex_engine.compile(r"^Next\s+sync\s+check\s+time:\s+(?P<check_time>\S+)\s+(?P<check_date>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
         
         # LSA Count: 60, Checksum Sum 0x001DF372
-        p7 = re.compile(r"^LSA\s+Count:\s+(?P<lsa_count>\d+),\s+Checksum\s+Sum\s+(?P<checksum>\S+)$")
+        p7 = regex_engine.compile(r"^LSA\s+Count:\s+(?P<lsa_count>\d+),\s+Checksum\s+Sum\s+(?P<checksum>\S+)$")
 
         ret_dict = {}
 
@@ -8428,17 +8430,17 @@ class ShowIpOspfRibRedistribution(ShowIpOspfRibRedistributionSchema):
             output = self.device.execute(self.cli_command)
 
         # OSPF Router with ID (10.4.1.1) (Process ID 100)
-        p1 = re.compile(r'OSPF+ Router +with +ID +\((?P<router_id>\S+)\)+\s+\(Process +ID +(?P<instance>\d+)\)')
+        p1 = regex_engine.compile(r'OSPF+ Router +with +ID +\((?P<router_id>\S+)\)+\s+\(Process +ID +(?P<instance>\d+)\)')
 
         # Base Topology (MTID 0)
-        p2 = re.compile(r'Base +Topology +\(MTID (?P<mtid>\d+)\)$')
+        p2 = regex_engine.compile(r'Base +Topology +\(MTID (?P<mtid>\d+)\)$')
 
         # 40.0.0.1/32, type 2, metric 20, tag 0, from IS-IS Router
-        p3 = re.compile(r'(?P<network>\S+), type (?P<type>\d+), metric (?P<metric>\d+), tag (?P<tag>\d+), from (?P<from>.*)$')
+        p3 = regex_engine.compile(r'(?P<network>\S+), type (?P<type>\d+), metric (?P<metric>\d+), tag (?P<tag>\d+), from (?P<from>.*)$')
         
         # via 40.60.1.40, Ethernet0/2
         # via Null0
-        p4 = re.compile(r'via ((?P<via_network>\S+),)?\s*(?P<interface>\S+)')
+        p4 = regex_engine.compile(r'via ((?P<via_network>\S+),)?\s*(?P<interface>\S+)')
 
         # initial variables
         ret_dict = {}
@@ -8567,49 +8569,49 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
         output = self.device.execute(cmd)
 
         # TwentyFiveGigE1/0/3 is up, line protocol is up (connected)
-        p1 = re.compile(r'^(?P<interface>[\S]+) is (?P<interface_status>[\S]+), line protocol is (?P<line_status>[\S]+)\s+\((?P<connect_status>[\S]+)\)$')
+        p1 = regex_engine.compile(r'^(?P<interface>[\S]+) is (?P<interface_status>[\S]+), line protocol is (?P<line_status>[\S]+)\s+\((?P<connect_status>[\S]+)\)$')
 
         # Link Local Address FE80::2A7:42FF:FED7:4CFF, Interface ID 5 (snmp-if-index)
-        p2 = re.compile(r'^Link Local Address (?P<link_local_address>[\S]+), Interface ID (?P<interface_id>[\d]+)\s+\((?P<if_index>[\S]+)\)$')
+        p2 = regex_engine.compile(r'^Link Local Address (?P<link_local_address>[\S]+), Interface ID (?P<interface_id>[\d]+)\s+\((?P<if_index>[\S]+)\)$')
 
         # Area 0, Process ID 1, Instance ID 0, Router ID 109.0.0.1
-        p3 = re.compile(r'^Area (?P<area>[\d]+), Process ID (?P<process_id>[\d]+), Instance ID (?P<instance_id>[\d]+), Router ID (?P<router_id>[\S]+)$')
+        p3 = regex_engine.compile(r'^Area (?P<area>[\d]+), Process ID (?P<process_id>[\d]+), Instance ID (?P<instance_id>[\d]+), Router ID (?P<router_id>[\S]+)$')
 
         # Network Type POINT_TO_POINT, Cost: 1
-        p4 = re.compile(r'^Network Type (?P<network_type>[\S]+), Cost: (?P<cost>[\d]+)$')
+        p4 = regex_engine.compile(r'^Network Type (?P<network_type>[\S]+), Cost: (?P<cost>[\d]+)$')
         
         # Transmit Delay is 1 sec, State POINT_TO_POINT
-        p5 = re.compile(r'^Transmit Delay is (?P<transmit_delay>[\d\s\w]+), State (?P<state>[\S]+)$')
+        p5 = regex_engine.compile(r'^Transmit Delay is (?P<transmit_delay>[\d\s\w]+), State (?P<state>[\S]+)$')
 
         # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-        p6 = re.compile(r'^Timer intervals configured, Hello (?P<hello>[\d]+), Dead (?P<dead>[\d]+), Wait (?P<wait>[\d]+), Retransmit (?P<retransmit>[\d]+)$')
+        p6 = regex_engine.compile(r'^Timer intervals configured, Hello (?P<hello>[\d]+), Dead (?P<dead>[\d]+), Wait (?P<wait>[\d]+), Retransmit (?P<retransmit>[\d]+)$')
 
         # Hello due in 00:00:08
-        p6_1 = re.compile(r'^Hello due in (?P<hello_due>\S+)$')
+        p6_1 = regex_engine.compile(r'^Hello due in (?P<hello_due>\S+)$')
         
         # Graceful restart helper support enabled
-        p7 = re.compile(r'^Graceful restart helper support (?P<graceful_restart_helper_support>[\S]+)$')
+        p7 = regex_engine.compile(r'^Graceful restart helper support (?P<graceful_restart_helper_support>[\S]+)$')
 
         # Index 1/4/4, flood queue length 0
-        p8 = re.compile(r'^Index (?P<index>\S+), flood queue length (?P<flood_queue_length>\d+)$')
+        p8 = regex_engine.compile(r'^Index (?P<index>\S+), flood queue length (?P<flood_queue_length>\d+)$')
 
         # Next 0x0(0)/0x0(0)/0x0(0)
-        p9 = re.compile(r'^Next (?P<next>\S+)$')
+        p9 = regex_engine.compile(r'^Next (?P<next>\S+)$')
 
         # Last flood scan length is 3, maximum is 3
-        p10 = re.compile(r'^Last flood scan length is (?P<scan_length>\d+), maximum is (?P<scan_length_maximum>\d+)$')
+        p10 = regex_engine.compile(r'^Last flood scan length is (?P<scan_length>\d+), maximum is (?P<scan_length_maximum>\d+)$')
 
         # Last flood scan time is 0 msec, maximum is 0 msec
-        p11 = re.compile(r'^Last flood scan time is (?P<scan_time_msec>\d+) msec, maximum is (?P<scan_time_maximum_msec>\d+) msec$')
+        p11 = regex_engine.compile(r'^Last flood scan time is (?P<scan_time_msec>\d+) msec, maximum is (?P<scan_time_maximum_msec>\d+) msec$')
 
         # Neighbor Count is 1, Adjacent neighbor count is 1
-        p12 = re.compile(r'^Neighbor Count is (?P<neighbor_count>[\d]+), Adjacent neighbor count is (?P<adjacent_neighbor_count>[\d]+)$')
+        p12 = regex_engine.compile(r'^Neighbor Count is (?P<neighbor_count>[\d]+), Adjacent neighbor count is (?P<adjacent_neighbor_count>[\d]+)$')
 
         # Adjacent with neighbor 109.0.0.5
-        p13 = re.compile(r'^Adjacent with neighbor (?P<adjacent_neighbor_address>[\S]+)$')
+        p13 = regex_engine.compile(r'^Adjacent with neighbor (?P<adjacent_neighbor_address>[\S]+)$')
 
         # Suppress hello for 0 neighbor(s)
-        p14 = re.compile(r'^Suppress hello for (?P<suppressed_hello_neighbor_count>\d+) neighbor\(s\)$')
+        p14 = regex_engine.compile(r'^Suppress hello for (?P<suppressed_hello_neighbor_count>\d+) neighbor\(s\)$')
         
         ret_dict ={}
 
@@ -8799,43 +8801,43 @@ class ShowIpv6OspfNeighborDetail(ShowIpv6OspfNeighborDetailSchema):
         output = self.device.execute(cmd)
 
         # OSPFv3 Router with ID (109.0.0.5) (Process ID 1)
-        p1 = re.compile(r'^OSPFv3 Router with ID \((?P<router_id>[\S]+)\)\s+\(Process ID (?P<process_id>[\d]+)\)$')
+        p1 = regex_engine.compile(r'^OSPFv3 Router with ID \((?P<router_id>[\S]+)\)\s+\(Process ID (?P<process_id>[\d]+)\)$')
 
         # Neighbor 109.0.0.1
-        p2 = re.compile(r'^Neighbor (?P<neighbor>[\S]+)$')
+        p2 = regex_engine.compile(r'^Neighbor (?P<neighbor>[\S]+)$')
 
         # In the area 0 via interface HundredGigE1/0/7
-        p3 = re.compile(r'^In the area (?P<area>[\d]+)\s+via interface (?P<interface>[\S]+)$')
+        p3 = regex_engine.compile(r'^In the area (?P<area>[\d]+)\s+via interface (?P<interface>[\S]+)$')
 
         # Neighbor: interface-id 5, link-local address FE80::2A7:42FF:FED7:4CFF
-        p4 = re.compile(r'^Neighbor: interface-id (?P<interface_id>[\d]+),\s+link-local address (?P<link_local_address>[\S]+)$')
+        p4 = regex_engine.compile(r'^Neighbor: interface-id (?P<interface_id>[\d]+),\s+link-local address (?P<link_local_address>[\S]+)$')
 
         # Neighbor priority is 0, State is FULL, 6 state changes
-        p5 = re.compile(r'^Neighbor priority is (?P<priority>[\d]+), State is (?P<state>[\S]+), (?P<state_changes>[\d]+) state changes$')
+        p5 = regex_engine.compile(r'^Neighbor priority is (?P<priority>[\d]+), State is (?P<state>[\S]+), (?P<state_changes>[\d]+) state changes$')
 
         # Options is 0x000013 in Hello (V6-Bit, E-Bit, R-Bit)
-        p6 = re.compile(r'^Options is (?P<hello_options>[\S]+) in Hello \((?P<hello_bits>[\S\s]+)\)$')
+        p6 = regex_engine.compile(r'^Options is (?P<hello_options>[\S]+) in Hello \((?P<hello_bits>[\S\s]+)\)$')
 
         # Options is 0x000013 in DBD (V6-Bit, E-Bit, R-Bit)
-        p7 = re.compile(r'^Options is (?P<dbd_options>[\S]+) in DBD \((?P<dbd_bits>[\S\s]+)\)$')
+        p7 = regex_engine.compile(r'^Options is (?P<dbd_options>[\S]+) in DBD \((?P<dbd_bits>[\S\s]+)\)$')
 
         # Dead timer due in 00:00:39
-        p8 = re.compile(r'^Dead timer due in (?P<dead_timer>\S+)$')
+        p8 = regex_engine.compile(r'^Dead timer due in (?P<dead_timer>\S+)$')
         
         # Neighbor is up for 17:54:26
-        p9 = re.compile(r'^Neighbor is up for (?P<neighbor_up_time>\S+)$')
+        p9 = regex_engine.compile(r'^Neighbor is up for (?P<neighbor_up_time>\S+)$')
         
         # Index 1/2/2, retransmission queue length 0, number of retransmission 0
-        p10 = re.compile(r'^Index (?P<index>\S+)\, retransmission queue length (?P<retransmission_length>\d+)\, number of retransmission (?P<number_of_transmission>\d+)$')
+        p10 = regex_engine.compile(r'^Index (?P<index>\S+)\, retransmission queue length (?P<retransmission_length>\d+)\, number of retransmission (?P<number_of_transmission>\d+)$')
         
         # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-        p11 = re.compile(r'^First (?P<first>\S+) Next (?P<next>\S+)$')
+        p11 = regex_engine.compile(r'^First (?P<first>\S+) Next (?P<next>\S+)$')
 
         # Last retransmission scan length is 0, maximum is 0
-        p12 = re.compile(r'^Last retransmission scan length is (?P<last_retransmission_length>\d+)\, maximum is (?P<retransmission_length_maximum>\d+)$')
+        p12 = regex_engine.compile(r'^Last retransmission scan length is (?P<last_retransmission_length>\d+)\, maximum is (?P<retransmission_length_maximum>\d+)$')
 
         # Last retransmission scan time is 0 msec, maximum is 0 msec
-        p13 = re.compile(r'^Last retransmission scan time is (?P<last_retransmission_time>\d+) msec\, maximum is (?P<retransmission_time_maximum>\d+) msec$')
+        p13 = regex_engine.compile(r'^Last retransmission scan time is (?P<last_retransmission_time>\d+) msec\, maximum is (?P<retransmission_time_maximum>\d+) msec$')
 
         ret_dict = {}
 
@@ -9011,23 +9013,23 @@ class ShowIpOspfRibRoute(ShowIpOspfRibRouteSchema):
                 output = self.device.execute(self.cli_command[0].format(route=route))
         # OSPF Router with ID (10.36.3.3) (Process ID 1)
         # OSPF Router with ID (20.3.5.6) (Process ID 2, VRF VRF1)
-        p0 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\) +\(Process +ID +(?P<instance>(\d+))'
-                        r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p0 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\) +\(Process +ID +(?P<instance>(\d+))'
+                                  r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
   
         # 20.20.20.0/24, Intra, cost 10, area 0
-        p1 = re.compile(r'^\*\>?\s+(?P<network>\S+),\s+(?P<route_type>\S+),\s+cost\s+(?P<cost>\d+),\s+area\s+(?P<area>\d+)*$')
+        p1 = regex_engine.compile(r'^\*\>?\s+(?P<network>\S+),\s+(?P<route_type>\S+),\s+cost\s+(?P<cost>\d+),\s+area\s+(?P<area>\d+)*$')
         
         # via 40.60.1.40, Ethernet0/2
         # via 40.60.1.40, Ethernet0/2, label 16001, strict label 17001
         # via 40.60.1.40, Ethernet0/2, label 16001, strict label 17001, cost 100
         # via Null0
-        p2 = re.compile(r'via ((?P<nexthop_ip>\S+),)?\s*(?P<interface>[A-Za-z0-9./-]+)(,\s+label\s+(?P<label>\d+))?(,\s+strict\s+label\s+(?P<strict_label>\d+))?(,\s+cost\s+(?P<cost>\d+))?')
+        p2 = regex_engine.compile(r'via ((?P<nexthop_ip>\S+),)?\s*(?P<interface>[A-Za-z0-9./-]+)(,\s+label\s+(?P<label>\d+))?(,\s+strict\s+label\s+(?P<strict_label>\d+))?(,\s+cost\s+(?P<cost>\d+))?')
 
         # Flags: RIB, MFI
-        p3 = re.compile(r'Flags: (?P<flags>[\S\s]+)')
+        p3 = regex_engine.compile(r'Flags: (?P<flags>[\S\s]+)')
         
         # repair path via 40.60.1.40, Ethernet0/2, label 16001, strict label 17001, cost 100
-        p4 = re.compile(r'.*repair path via (?P<nexthop_ip>\S+),\s*(?P<interface>[A-Za-z0-9./-]+)(,\s+label\s+(?P<label>\d+))?(,\s+strict\s+label\s+(?P<strict_label>\d+))?(,\s+cost\s+(?P<cost>\d+))?')
+        p4 = regex_engine.compile(r'.*repair path via (?P<nexthop_ip>\S+),\s*(?P<interface>[A-Za-z0-9./-]+)(,\s+label\s+(?P<label>\d+))?(,\s+strict\s+label\s+(?P<strict_label>\d+))?(,\s+cost\s+(?P<cost>\d+))?')
 
         # initial variables
         ret_dict = {}
@@ -13,13 +13,13 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 import xmltodict
 from netaddr import IPAddress, IPNetwork, INET_ATON
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ===========================
@@ -121,23 +121,23 @@ class ShowIpOspfDatabase(ShowIpOspfDatabaseSchema):
 
         # OSPF Router with ID (172.16.1.214) (Process ID 65109)
         # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         r' +\(Process +ID +(?P<instance>(\d+))'
-                         r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                   r' +\(Process +ID +(?P<instance>(\d+))'
+                                   r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
         # Router Link States (Area 0)
         # Net Link States (Area 0)
         # Summary Net Link States (Area 8)
         # Summary ASB Link States (Area 8)
-        p2 = re.compile(r'^(?P<lsa_type>([a-zA-Z\s]+)) +Link +States +\(Area'
-                         r' +(?P<area>(\S+))\)$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type>([a-zA-Z\s]+)) +Link +States +\(Area'
+                                   r' +(?P<area>(\S+))\)$')
 
         # Link ID         ADV Router      Age         Seq#       Checksum Link count
         # 10.13.202.64    10.120.202.64   2794        0x80000043 0x002254 3
         # 10.1.1.2        10.169.197.253  70          0x8000003F 0x0015EF
-        p3 = re.compile(r'^(?P<link_id>(\S+)) +(?P<adv_router>(\S+))'
-                         r' +(?P<age>(\d+)) +(?P<seq>(\S+)) +(?P<checksum>(\S+))'
-                         r'(?: *(?P<link_count>(\d+)))?$')
+        p3 = regex_engine.compile(r'^(?P<link_id>(\S+)) +(?P<adv_router>(\S+))'
+                                   r' +(?P<age>(\d+)) +(?P<seq>(\S+)) +(?P<checksum>(\S+))'
+                                   r'(?: *(?P<link_count>(\d+)))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -273,210 +273,210 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
             'opaque': 10,
             }
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            r' +\(Process +ID +(?P<instance>(\d+))'
-                            r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                      r' +\(Process +ID +(?P<instance>(\d+))'
+                                      r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
        
-        p2 = re.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
-                            r'(?: +\(Area +(?P<area>(\S+))\))?$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
+                                      r'(?: +\(Area +(?P<area>(\S+))\))?$')
        
-        p3_1 = re.compile(r'^Routing +Bit +Set +on +this +LSA$')
+        p3_1 = regex_engine.compile(r'^Routing +Bit +Set +on +this +LSA$')
        
-        p3_2 = re.compile(r'^LS +age: +(?P<age>(\d+))$')
+        p3_2 = regex_engine.compile(r'^LS +age: +(?P<age>(\d+))$')
        
-        p3_2_1 = re.compile(r'^LS +age: +\w+\((?P<age>(\d+))\)$')
+        p3_2_1 = regex_engine.compile(r'^LS +age: +\w+\((?P<age>(\d+))\)$')
        
-        p4 = re.compile(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
-                        r'(?: *\((?P<option_desc>(.*))\))?$')
+        p4 = regex_engine.compile(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
+                                  r'(?: *\((?P<option_desc>(.*))\))?$')
        
-        p5_1 = re.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
+        p5_1 = regex_engine.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
        
-        p5_2 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
-                            r'(?: +\(.*\))?$')
+        p5_2 = regex_engine.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
+                                      r'(?: +\(.*\))?$')
        
-        p6 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
+        p6 = regex_engine.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
        
-        p7 = re.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
+        p7 = regex_engine.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
        
-        p8 = re.compile(r'^Checksum: +(?P<checksum>(\S+))$')
+        p8 = regex_engine.compile(r'^Checksum: +(?P<checksum>(\S+))$')
        
-        p9 = re.compile(r'^Length *: +(?P<length>(\d+))$')
+        p9 = regex_engine.compile(r'^Length *: +(?P<length>(\d+))$')
        
-        p10 = re.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
+        p10 = regex_engine.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
        
-        p11_1 = re.compile(r'^Metric +Type: +2 +\(.*\)$')
+        p11_1 = regex_engine.compile(r'^Metric +Type: +2 +\(.*\)$')
        
-        p11_2 = re.compile(r'^Metric +Type: +1 +\(.*\)$')
+        p11_2 = regex_engine.compile(r'^Metric +Type: +1 +\(.*\)$')
        
-        p12 = re.compile(r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
-                            r' +(?P<metric>(\d+)))?$')
+        p12 = regex_engine.compile(r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
+                                      r' +(?P<metric>(\d+)))?$')
        
-        p13 = re.compile(r'^Metric: +(?P<metric>(\d+))$')
+        p13 = regex_engine.compile(r'^Metric: +(?P<metric>(\d+))$')
        
-        p14 = re.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
+        p14 = regex_engine.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
        
-        p15 = re.compile(r'^External +Route +Tag: +(?P<tag>(\d+))$')
+        p15 = regex_engine.compile(r'^External +Route +Tag: +(?P<tag>(\d+))$')
        
-        p16 = re.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
+        p16 = regex_engine.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
        
-        p17 = re.compile(r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$')
+        p17 = regex_engine.compile(r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$')
        
-        p18 = re.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
+        p18 = regex_engine.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
        
-        p18_1 = re.compile(r'^Link\s+connected +to\s*: +(?P<type>(.*))$')
+        p18_1 = regex_engine.compile(r'^Link\s+connected +to\s*: +(?P<type>(.*))$')
        
-        p19_1 = re.compile(r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
-                            r' +(?P<link_id>(\S+))$')
+        p19_1 = regex_engine.compile(r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
+                                      r' +(?P<link_id>(\S+))$')
        
-        p19_2 = re.compile(r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
-                            r' +(a|A)ddress: +(?P<link_id>(\S+))$')
+        p19_2 = regex_engine.compile(r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
+                                      r' +(a|A)ddress: +(?P<link_id>(\S+))$')
        
-        p19_3 = re.compile(r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
-                            r' +(I|d)D: +(?P<link_id>(\S+))$')
+        p19_3 = regex_engine.compile(r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
+                                      r' +(I|d)D: +(?P<link_id>(\S+))$')
        
-        p20_1 = re.compile(r'^\(Link +Data\) +Network +Mask:'
-                            r' +(?P<link_data>(\S+))$')
+        p20_1 = regex_engine.compile(r'^\(Link +Data\) +Network +Mask:'
+                                      r' +(?P<link_data>(\S+))$')
        
-        p20_2 = re.compile(r'^\(Link +Data\) +Router +Interface +address:'
-                            r' +(?P<link_data>(\S+))$')
+        p20_2 = regex_engine.compile(r'^\(Link +Data\) +Router +Interface +address:'
+                                      r' +(?P<link_data>(\S+))$')
        
         # MTID 32 Metrics: 1
         # MTID   : 0
-        p21 = re.compile(r'MTID\s*:*\s*(?P<mtid>\d+)\s*(?:(Metrics*\s*:*\s*(?P<metric>\d+)))?')
+        p21 = regex_engine.compile(r'MTID\s*:*\s*(?P<mtid>\d+)\s*(?:(Metrics*\s*:*\s*(?P<metric>\d+)))?')
        
-        p21_1 = re.compile(r'^Number +of +MTID +metrics: +(?P<num>(\d+))$')
+        p21_1 = regex_engine.compile(r'^Number +of +MTID +metrics: +(?P<num>(\d+))$')
        
-        p22 = re.compile(r'^Opaque +Type: +(?P<type>(\d+))(?: +\((Traffic Engineering)\))?$')
+        p22 = regex_engine.compile(r'^Opaque +Type: +(?P<type>(\d+))(?: +\((Traffic Engineering)\))?$')
        
-        p23 = re.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
+        p23 = regex_engine.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
        
-        p24 = re.compile(r'^Fragment +number *: +(?P<num>(\d+))$')
+        p24 = regex_engine.compile(r'^Fragment +number *: +(?P<num>(\d+))$')
        
-        p25 = re.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
+        p25 = regex_engine.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
        
-        p26_1 = re.compile(r'^AS +Boundary +Router$')
+        p26_1 = regex_engine.compile(r'^AS +Boundary +Router$')
        
-        p26_2 = re.compile(r'^Area +Border +Router$')
+        p26_2 = regex_engine.compile(r'^Area +Border +Router$')
        
-        p27 = re.compile(r'^Link +connected +to\s*\:*\s+(?P<link>(.*))$')
+        p27 = regex_engine.compile(r'^Link +connected +to\s*\:*\s+(?P<link>(.*))$')
        
-        p28 = re.compile(r'^Link +ID *: +(?P<id>(\S+))$')
+        p28 = regex_engine.compile(r'^Link +ID *: +(?P<id>(\S+))$')
        
-        p29 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
+        p29 = regex_engine.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
        
-        p30 = re.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
+        p30 = regex_engine.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
        
-        p31 = re.compile(r'^Maximum +(B|b)andwidth *:'
-                            r' +(?P<max_band>(\d+))$')
+        p31 = regex_engine.compile(r'^Maximum +(B|b)andwidth *:'
+                                      r' +(?P<max_band>(\d+))$')
        
-        p32 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth'
-                            r'(?: +global)? *: +(?P<max_res_band>(\d+))$')
+        p32 = regex_engine.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth'
+                                      r'(?: +global)? *: +(?P<max_res_band>(\d+))$')
        
-        p33 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+        p33 = regex_engine.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
        
-        p33_1 = re.compile(r'^IGP +Metric *: +(?P<igp_metric>(\d+))$')
+        p33_1 = regex_engine.compile(r'^IGP +Metric *: +(?P<igp_metric>(\d+))$')
        
-        p33_2 = re.compile(r'^Number +of +Priority *: +(?P<num>(\d+))$')
+        p33_2 = regex_engine.compile(r'^Number +of +Priority *: +(?P<num>(\d+))$')
        
-        p34 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            r' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            r' *: +(?P<band2>(\d+)))?$')
+        p34 = regex_engine.compile(r'^Priority +(?P<num1>(\d+)) *:'
+                                      r' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+                                      r' *: +(?P<band2>(\d+)))?$')
        
-        p35 = re.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
-                            r' +Length += +(?P<length>(\d+))'
-                            r' +Value += +(?P<value>(.*))$')
+        p35 = regex_engine.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
+                                      r' +Length += +(?P<length>(\d+))'
+                                      r' +Value += +(?P<value>(.*))$')
        
-        p36 = re.compile(r'^Extended +Administrative +Group *: +Length *:'
-                            r' +(?P<eag_length>(\d+))$')
+        p36 = regex_engine.compile(r'^Extended +Administrative +Group *: +Length *:'
+                                      r' +(?P<eag_length>(\d+))$')
        
-        p37 = re.compile(r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$')
+        p37 = regex_engine.compile(r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$')
 
         # Neighbor Address : 192.168.220.2
-        p38 = re.compile(r'Neighbor\s+Address\s*:\s*(?P<neighbor_address>\S+)')
+        p38 = regex_engine.compile(r'Neighbor\s+Address\s*:\s*(?P<neighbor_address>\S+)')
 
         # TLV Type: Router Information
         # TLV Type: Segment Routing Algorithm
-        p39 = re.compile(r'TLV\s+Type\s*:\s*(?P<tlv_type>.+)')
+        p39 = regex_engine.compile(r'TLV\s+Type\s*:\s*(?P<tlv_type>.+)')
 
         # Router Information
-        p39_1 = re.compile(r'(R|r)outer\s+(I|i)nformation')
+        p39_1 = regex_engine.compile(r'(R|r)outer\s+(I|i)nformation')
 
         # Segment Routing Algorithm
-        p39_2 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(A|a)lgorithm')
+        p39_2 = regex_engine.compile(r'(S|s)egment\s+(R|r)outing\s+(A|a)lgorithm')
 
         # Segment Routing Range
-        p39_3 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(R|r)ange')
+        p39_3 = regex_engine.compile(r'(S|s)egment\s+(R|r)outing\s+(R|r)ange')
 
         # Segment Routing Node MSD
-        p39_4 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(N|n)ode\s+MSD')
+        p39_4 = regex_engine.compile(r'(S|s)egment\s+(R|r)outing\s+(N|n)ode\s+MSD')
 
         # Segment Routing Local Block
-        p39_5 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(L|l)ocal\s+(B|b)lock')
+        p39_5 = regex_engine.compile(r'(S|s)egment\s+(R|r)outing\s+(L|l)ocal\s+(B|b)lock')
 
         # Extended Prefix
-        p39_6 = re.compile(r'(E|e)xtended\s+(P|p)refix')
+        p39_6 = regex_engine.compile(r'(E|e)xtended\s+(P|p)refix')
 
         # Extended Link
-        p39_7 = re.compile(r'(E|e)xtended\s+(L|l)ink')
+        p39_7 = regex_engine.compile(r'(E|e)xtended\s+(L|l)ink')
 
         # Algorithm: SPF
         # Algorithm: Strict SPF
-        p40 = re.compile(r'Algo(?:(rithm))?\s*:\s*(?P<algorithm>.+)')
+        p40 = regex_engine.compile(r'Algo(?:(rithm))?\s*:\s*(?P<algorithm>.+)')
 
         # Range Size: 1000
-        p41 = re.compile(r'Range\s+Size\s*:\s*(?P<range_size>\d+)')
+        p41 = regex_engine.compile(r'Range\s+Size\s*:\s*(?P<range_size>\d+)')
 
         # Flags  : L-Bit, V-bit
-        p42 = re.compile(r'Flags\s*\:\s*(?P<flags>.+)')        
+        p42 = regex_engine.compile(r'Flags\s*\:\s*(?P<flags>.+)')        
 
         # Weight : 0
-        p44 = re.compile(r'Weight\s*:\s*(?P<weight>\d+)')
+        p44 = regex_engine.compile(r'Weight\s*:\s*(?P<weight>\d+)')
 
         # Label  : 19
-        p45 = re.compile(r'Label\s*:\s*(?P<label>\d+)')       
+        p45 = regex_engine.compile(r'Label\s*:\s*(?P<label>\d+)')       
         
         # (Link Data) Interface IP address: 192.168.220.1
-        p46 = re.compile(r'\(Link\s+Data\)\s+Interface\s+IP\s+address\s*:\s*(?P<link_data>\S+)')
+        p46 = regex_engine.compile(r'\(Link\s+Data\)\s+Interface\s+IP\s+address\s*:\s*(?P<link_data>\S+)')
 
         # Prefix    : 10.4.1.1/32
-        p47 = re.compile(r'Prefix\s*:\s*(?P<prefix>\S+)')
+        p47 = regex_engine.compile(r'Prefix\s*:\s*(?P<prefix>\S+)')
 
         # AF        : 0
-        p48 = re.compile(r'AF\s*:\s*(?P<af>\S+)')
+        p48 = regex_engine.compile(r'AF\s*:\s*(?P<af>\S+)')
 
         # Route-type: Intra
-        p49 = re.compile(r'Route\-type\s*:\s*(?P<route_type>.+)')
+        p49 = regex_engine.compile(r'Route\-type\s*:\s*(?P<route_type>.+)')
 
         # Sub-TLV Type: Remote Intf Addr
         # Sub-TLV Type: Local / Remote Intf ID
-        p50 = re.compile(r'Sub\-TLV\s+Type\s*:\s*(?P<sub_tlv_type>.+)')
+        p50 = regex_engine.compile(r'Sub\-TLV\s+Type\s*:\s*(?P<sub_tlv_type>.+)')
 
         # Remote Interface Address   : 192.168.0.1
-        p51 = re.compile(r'Remote\s+Interface\s+Address\s*:\s*(?P<remote_interface_address>\S+)')
+        p51 = regex_engine.compile(r'Remote\s+Interface\s+Address\s*:\s*(?P<remote_interface_address>\S+)')
 
         # Local Interface ID   : 20
-        p52 = re.compile(r'Local\s+Interface\s+ID\s*:\s*(?P<local_interface_id>\S+)')
+        p52 = regex_engine.compile(r'Local\s+Interface\s+ID\s*:\s*(?P<local_interface_id>\S+)')
 
         # Remote Interface ID   : 20
-        p53 = re.compile(r'Remote\s+Interface\s+ID\s*:\s*(?P<remote_interface_id>\S+)')
+        p53 = regex_engine.compile(r'Remote\s+Interface\s+ID\s*:\s*(?P<remote_interface_id>\S+)')
 
         # SID   : 1
-        p54 = re.compile(r'SID\s*:\s*(?P<sid>\S+)')
+        p54 = regex_engine.compile(r'SID\s*:\s*(?P<sid>\S+)')
 
         # Graceful Restart Helper                
-        p55 = re.compile(r'(G|g)raceful\s+(R|r)estart\s+(H|h)elper')
+        p55 = regex_engine.compile(r'(G|g)raceful\s+(R|r)estart\s+(H|h)elper')
 
         # Stub Router Support
-        p56 = re.compile(r'(S|s)tub\s+(R|r)outer\s+(S|s)upport')
+        p56 = regex_engine.compile(r'(S|s)tub\s+(R|r)outer\s+(S|s)upport')
 
         # SPF
-        p57 = re.compile(r'SPF')
+        p57 = regex_engine.compile(r'SPF')
 
         # Strict SPF
-        p58 = re.compile(r'Strict\s+SPF')
+        p58 = regex_engine.compile(r'Strict\s+SPF')
 
         # Sub-type: Node Max Sid Depth, Value: 13
-        p59 = re.compile(r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)')
+        p59 = regex_engine.compile(r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -951,7 +951,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
                 
             # Number of TOS metrics: 0
-            p21_2 = re.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
+            p21_2 = regex_engine.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
             m = p21_2.match(line)
             if m:
                 db_dict['links'][link_id]['num_tos_metrics'] = \
@@ -2262,11 +2262,11 @@ class ShowIpOspfDatabaseSummaryDetail(ShowIpOspfDatabaseSummaryDetailSchema):
 
         # OSPF Router with ID (10.36.3.3) (Process ID 1)
         # OSPF Router with ID (20.3.5.6) (Process ID 2, VRF VRF1)
-        p0 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\) +\(Process +ID +(?P<instance>(\d+))'
-                        r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p0 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\) +\(Process +ID +(?P<instance>(\d+))'
+                                  r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
         # Router 22.22.22.22 LSA summary
-        p1 = re.compile(r'^Router +(?P<router_ip>(\S+)) +LSA +summary$')
+        p1 = regex_engine.compile(r'^Router +(?P<router_ip>(\S+)) +LSA +summary$')
 
         #LSA Type      Count    Delete   Maxage
         #Router        2        0        0
@@ -2280,9 +2280,9 @@ class ShowIpOspfDatabaseSummaryDetail(ShowIpOspfDatabaseSummaryDetailSchema):
         #Opaque AS     0        0        0
         #Total         8        0        0
         
-        p2 = re.compile(r'^(?P<lsa_type>(Router|Network|Summary Net|Summary ASBR|'
-                r'Type-5 Ext|Type-7 Ext|Opaque Link|Opaque Area|Opaque AS|Total))'
-                r' +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+))')
+        p2 = regex_engine.compile(r'^(?P<lsa_type>(Router|Network|Summary Net|Summary ASBR|'
+                          r'Type-5 Ext|Type-7 Ext|Opaque Link|Opaque Area|Opaque AS|Total))'
+                          r' +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+))')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2535,55 +2535,55 @@ class ShowIpOspfDatabaseDatabaseSummary(ShowIpOspfDatabaseDatabaseSummarySchema)
         # Define RegExes for each possible kind of line
 
         #                 OSPF Router with ID (192.168.0.1) (Process ID 1)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\) +\(Process +ID +(?P<ospf_pid>(\d+))\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\) +\(Process +ID +(?P<ospf_pid>(\d+))\)$')
 
         # Area 0 database summary
-        p2 = re.compile(r'^Area +(?P<area_no>(\d+)) +database +summary$')
+        p2 = regex_engine.compile(r'^Area +(?P<area_no>(\d+)) +database +summary$')
 
         #   Router        0        0        0 
-        p3 = re.compile(r'^Router +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p3 = regex_engine.compile(r'^Router +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         #   Network       0        0        0       
-        p4 = re.compile(r'^Network +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p4 = regex_engine.compile(r'^Network +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         #   Summary Net   0        0        0       
-        p5 = re.compile(r'^Summary +Net +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p5 = regex_engine.compile(r'^Summary +Net +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         #   Summary ASBR  0        0        0       
-        p6 = re.compile(r'^Summary +ASBR +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p6 = regex_engine.compile(r'^Summary +ASBR +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         #   Type-7 Ext    0        0        0       
-        p7 = re.compile(r'^Type-7 +Ext +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p7 = regex_engine.compile(r'^Type-7 +Ext +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         #     Prefixes redistributed in Type-7  0
-        p8 = re.compile(r'^Prefixes +redistributed +in +Type-7 +(?P<prefixes_redist_type_7>(\d+))$')
+        p8 = regex_engine.compile(r'^Prefixes +redistributed +in +Type-7 +(?P<prefixes_redist_type_7>(\d+))$')
 
         #   Opaque Link   0        0        0       
-        p9 = re.compile(r'^Opaque +Link +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p9 = regex_engine.compile(r'^Opaque +Link +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         #   Opaque Area   0        0        0       
-        p10 = re.compile(r'^Opaque +Area +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p10 = regex_engine.compile(r'^Opaque +Area +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         #   Subtotal      0        0        0       
-        p11 = re.compile(r'^Subtotal +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p11 = regex_engine.compile(r'^Subtotal +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         # Process 1 database summary
-        p12 = re.compile(r'^Process +(?P<ospf_pid>(\d+)) +database +summary$')
+        p12 = regex_engine.compile(r'^Process +(?P<ospf_pid>(\d+)) +database +summary$')
   
         #   Type-5 Ext    0        0        0      
-        p13 = re.compile(r'^Type-5 +Ext +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p13 = regex_engine.compile(r'^Type-5 +Ext +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         #       Prefixes redistributed in Type-5  0
-        p14 = re.compile(r'^Prefixes +redistributed +in +Type-5 +(?P<prefixes_redist_type_5>(\d+))$')
+        p14 = regex_engine.compile(r'^Prefixes +redistributed +in +Type-5 +(?P<prefixes_redist_type_5>(\d+))$')
 
         #   Opaque AS     0        0        0       
-        p15 = re.compile(r'^Opaque +AS +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p15 = regex_engine.compile(r'^Opaque +AS +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         #   Total         0        0        0       
-        p16 = re.compile(r'^Total +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
+        p16 = regex_engine.compile(r'^Total +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+)) *$')
 
         #   Non-self      0   
-        p17 = re.compile(r'^Non-self +(?P<non_self_count>(\d+)) *$')
+        p17 = regex_engine.compile(r'^Non-self +(?P<non_self_count>(\d+)) *$')
 
 
         area_summary_update = False
@@ -5,13 +5,13 @@ IOSXE parser for the following show command:
     * show ospfv3 rib redistribution
 """
 
-# python
-import re
-
 # metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, Default
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ===============================================
 # Schema for 'show ospfv3 summary-prefix'
 # Optional: allowing either ipv4 or ipv6 or both
@@ -64,15 +64,15 @@ class ShowOspfv3SummaryPrefix(ShowOspfv3SummaryPrefixSchema):
         ospf_id = ""
 
         # OSPFv3 10000 address-family ipv6 (router-id 10.2.2.21)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPFv3 +(?P<ospf_id>(\d+)) +address-family +(?P<address_family>(\S+)) +\(router-id +(?P<router_id>(\S+))\)"
         )
 
         # 10:2::/96           Metric <unreachable>
-        p2 = re.compile(r"^(?P<null_prefix>(\S+)) +.* Metric\s+(?P<null_metric>(\S+$))")
+        p2 = regex_engine.compile(r"^(?P<null_prefix>(\S+)) +.* Metric\s+(?P<null_metric>(\S+$))")
 
         # 10:2:2::/96         Metric 111, External metric type 2, Tag 111
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<sum_prefix>(\S+)) +.* Metric\s+(?P<sum_metric>(\d+)),.* +type +(?P<sum_type>(\d)),\s+Tag +(?P<sum_tag>(\S+))"
         )
 
@@ -169,7 +169,7 @@ class ShowOspfv3vrfNeighbor(ShowOspfv3vrfNeighborSchema):
         ret_dict = {}
         # OSPFv3 2 address-family ipv6 vrf 2 (router-id 173.19.2.2)
         # OSPFv3 100 address-family ipv4 vrf WAN-VRF (router-id 10.0.2.38)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPFv3\s+(?P<process_id>\d+)+\s+address-family\s(?P<address_family>\w+)\s+vrf\s(?P<vrf_id>[\w\-]+)"
             r"\s+\(router-id\s+(?P<router_id>[\d\.\/]+)\)$"
         )
@@ -178,7 +178,7 @@ class ShowOspfv3vrfNeighbor(ShowOspfv3vrfNeighborSchema):
         # 100.100.100.100 1     FULL/  -        00:00:38    100.10.0.2      GigabitEthernet0/0/0/0
         # 95.95.95.95     1     FULL/  -        00:00:38    100.20.0.2      GigabitEthernet0/0/0/1
         # 192.168.199.137 1    FULL/DR       0:00:31    172.31.80.37      GigabitEthernet 0/3/0/2
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<neighbor_id>\S+)\s+(?P<priority>\d+) +(?P<state>[0-9A-Z]+/\s*[A-Z-]*)"
             r" +(?P<dead_time>(\d+:){2}\d+) +(?P<address>[\d\.\/]+) +(?P<interface>\w+\s*\S+)$"
         )
@@ -264,7 +264,7 @@ class ShowOspfv3vrfNeighborInterface(ShowOspfv3vrfNeighborInterfaceSchema):
             output = self.device.execute(cmd)
         ret_dict = {}
         # OSPFv3 2 address-family ipv6 vrf 2 (router-id 173.19.2.2)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPFv3\s+(?P<process_id>\d+)+\s+address-family\s(?P<address_family>\w+)\s+vrf\s(?P<vrf_id>[\w\-]+)"
             r"\s+\(router-id\s+(?P<router_id>[\d\.\/]+)\)$"
         )
@@ -275,7 +275,7 @@ class ShowOspfv3vrfNeighborInterface(ShowOspfv3vrfNeighborInterfaceSchema):
         # Neighbor ID     Pri   State           Dead Time   Interface ID    Interface
         # 101.1.1.2         1   FULL/DR         00:00:33    56              TenGigabitEthernet1/0/47
 
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<neighbor_id>\S+)\s+(?P<priority>\d+) +(?P<state>[0-9A-Z]+/\s*[A-Z-]*)"
             r" +(?P<dead_time>(\d+:){2}\d+) +(?P<int_id>[\d\.\/]+) +(?P<interface>\w+\s*\S+)$"
         )
@@ -342,14 +342,14 @@ class ShowOspfv3Neighbor(ShowOspfv3NeighborSchema):
             output = self.device.execute(self.cli_command.format(pid=pid))
 
         # OSPFv3 50 address-family ipv6 (router-id 2.200.1.2)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPFv3\s+(?P<pid>\d+)\s+address-family\s+(?P<address_family>\S+)\s+\(router-id\s+("
             r"?P<router_id>(\d{1,3}\.){3}\d{1,3})\)$"
         )
 
         # 2.200.33.3        1   FULL/BDR        00:00:33    4584            Vlan3892
         # 100.100.100.100   0   FULL/  -        00:01:58    86              vmi1
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<neighbor_id>(\d{1,3}\.){3}\d{1,3})\s+(?P<priority>\d+)\s+(?P<state>\w+/(\w+|\s+-))\s+("
             r"?P<dead_time>\S+)\s+(?P<int_id>\d+)\s+(?P<interface>\S+)$"
         )
@@ -410,13 +410,13 @@ class ShowOspfv3RetransmissionList(ShowOspfv3RetransmissionListSchema):
             output = self.device.execute(self.cli_command.format(pid=pid))
 
         # OSPFv3 50 address-family ipv6 (router-id 2.200.1.2)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPFv3\s+(?P<pid>\d+)\s+address-family\s+(?P<address_family>\S+)\s+\(router-id\s+("
             r"?P<router_id>(\d{1,3}\.){3}\d{1,3})\)$"
         )
 
         # Neighbor 2.200.33.3, interface Vlan3892
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Neighbor\s+(?P<neighbor_id>(\d{1,3}\.){3}\d{1,3}),\s+interface\s+(?P<interface>\S+)$"
         )
 
@@ -477,19 +477,19 @@ class ShowOspfv3RequestList(ShowOspfv3RequestListSchema):
             output = self.device.execute(self.cli_command.format(pid=pid))
 
         # OSPFv3 50 address-family ipv6 (router-id 2.200.1.2)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPFv3\s+(?P<pid>\d+)\s+address-family\s+(?P<address_family>\S+)\s+\(router-id\s+("
             r"?P<router_id>(\d{1,3}\.){3}\d{1,3})\)$"
         )
 
         # Neighbor 2.200.33.3, interface Vlan3892 address FE80::3E57:31FF:FE04:6B05
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Neighbor\s+(?P<neighbor_id>(\d{1,3}\.){3}\d{1,3}),\s+interface\s+("
             r"?P<interface>\S+)\s+address\s+(?P<address>\S+)$"
         )
 
         # Request list size 0, maximum list size 1
-        p2_1 = re.compile(
+        p2_1 = regex_engine.compile(
             r"^Request\s+list\s+size\s+(?P<req_list_size>\d+),\s+maximum\s+list\s+size\s+("
             r"?P<max_list_size>\d+)$"
         )
@@ -583,41 +583,41 @@ class ShowOspfv3StatisticDetail(ShowOspfv3StatisticDetailSchema):
             output = self.device.execute(self.cli_command.format(pid=pid))
 
         # OSPFv3 5 address-family ipv6 (router-id 1.1.1.1)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPFv3\s+(?P<pid>\d+)\s+address-family\s+(?P<address_family>\S+)\s+\("
             r"router-id\s+(?P<router_id>(\d{1,3}\.){3}\d{1,3})\)$"
         )
 
         # SPF 1 executed 16:03:11 ago, SPF type Full
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^SPF\s+(?P<spf_id>\d+)\s+executed\s+(?P<executed_time>\S+)\s+ago,\s+SPF\s+type\s+("
             r"?P<spf_type>\w+)$"
         )
 
         # SPT    Prefix D-Int  Sum    D-Sum  Ext    D-Ext  Total
         # 0      0      0      0      0      0      0      0
-        p2_1 = re.compile(
+        p2_1 = regex_engine.compile(
             r"^(?P<spt>\d+)\s+(?P<prefix>\d+)\s+(?P<d_int>\d+)\s+(?P<sum>\d+)\s+(?P<d_sum>\d+)\s+("
             r"?P<ext>\d+)\s+(?P<d_ext>\d+)\s+(?P<total>\d+)$"
         )
 
         # LSAs changed 1
-        p2_2 = re.compile(r"^LSAs\s+changed\s+(?P<lsa_changed>\d+)$")
+        p2_2 = regex_engine.compile(r"^LSAs\s+changed\s+(?P<lsa_changed>\d+)$")
 
         # LSIDs processed R:1 N:0 Prefix:0 SN:0 SA:0 X7:0
-        p2_3 = re.compile(
+        p2_3 = regex_engine.compile(
             r"^LSIDs\s+processed\s+R:(?P<r>\d+)\s+N:(?P<n>\d+)\s+Prefix:("
             r"?P<prefix>\d+)\s+SN:(?P<sn>\d+)\s+SA:(?P<sa>\d+)\s+X7:(?P<x7>\d+)$"
         )
 
         # Change record R
-        p2_4 = re.compile(r"^Change\s+record\s+(?P<change_record>\w+)$")
+        p2_4 = regex_engine.compile(r"^Change\s+record\s+(?P<change_record>\w+)$")
 
         # 1.1.1.1/0(R)
-        p2_5 = re.compile(r"^(?P<adv_routers_list>.*\/.*)$")
+        p2_5 = regex_engine.compile(r"^(?P<adv_routers_list>.*\/.*)$")
 
         # Area 0: SPF algorithm executed 1 times
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Area\s+(?P<area>\d+):\s+SPF\s+algorithm\s+executed\s+("
             r"?P<spf_alg_executed_times>\d+)\s+times$"
         )
@@ -792,98 +792,98 @@ class ShowOspfv3Interface(ShowOspfv3InterfaceSchema):
             output = self.device.execute(self.cli_command.format(pid=pid))
 
         # TwoGigabitEthernet1/0/10 is down, line protocol is down (notconnect)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<interface>\S+)\s+is\s+(?P<int_status>\w+),\s+line\s+protocol\s+is\s+("
             r"?P<line_protocol>\w+)\s*(.*)?$"
         )
 
         # Link Local Address FE80::E75:BDFF:FE6E:DB47, Interface ID 18 (snmp-if-index)
         # Link Local Address FE80::8AFC:5DFF:FE32:900, Interface ID 42 (ios-if-index)
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r"^Link\s+Local\s+Address\s+(?P<link_local_address>\S+),\s+Interface\s+ID\s+("
             r"?P<int_id>\d+)\s+\(\S+\)$"
         )
 
         # Area 0, Process ID 5, Instance ID 0, Router ID 1.1.1.1
-        p1_2 = re.compile(
+        p1_2 = regex_engine.compile(
             r"^Area\s+(?P<area>\d+),\s+Process\s+ID\s+(?P<pid>\d+),\s+Instance\s+ID\s+("
             r"?P<instance_id>\d+),\s+Router\s+ID\s+(?P<router_id>(\d{1,3}\.){3}\d{1,3})$"
         )
 
         # Network Type BROADCAST, Cost: 1
         # Network Type MANET, Cost: 1 (dynamic), Cost Hysteresis: Disabled
-        p1_3 = re.compile(
+        p1_3 = regex_engine.compile(
             r"^Network\s+Type\s+(?P<network_type>\w+),\s+Cost:\s+(?P<cost>\d+)(\s+\(dynamic\),)?(\s+Cost\s+Hysteresis:\s+(?P<cost_hysteresis>[\w\s]+))?$"
         )
 
         # Transmit Delay is 1 sec, State DOWN, Priority 1
         # Transmit Delay is 1 sec, State POINT_TO_MULTIPOINT
-        p1_4 = re.compile(
+        p1_4 = regex_engine.compile(
             r"^Transmit\s+Delay\s+is\s+(?P<transmit_delay>\d+)\s+sec,\s+State\s+(?P<state>\w+)(,"
             r"\s+Priority\s+(?P<priority>\d+))?[,\s+BFD\s+]*(?P<bfd_status>\w*)$"
         )
 
         # Designated Router (ID) 2.200.1.2, local address FE80::72B3:17FF:FE1E:A982
-        p1_5 = re.compile(
+        p1_5 = regex_engine.compile(
             r"^Designated\s+Router\s+\(ID\)\s+(?P<Designated_router>(\d{1,3}\.){3}\d{1,3}),"
             r"\s+local\s+address\s+(?P<dr_local_address>\S+)$"
         )
 
         # Backup Designated router (ID) 2.200.33.3, local address FE80::3E57:31FF:FE04:6B05
-        p1_6 = re.compile(
+        p1_6 = regex_engine.compile(
             r"^Backup\s+Designated\s+router\s+\(ID\)\s+(?P<backup_designated_router>(\d{1,"
             r"3}\.){3}\d{1,3}),\s+local\s+address\s+(?P<bdr_local_address>\S+)$"
         )
 
         # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-        p1_7 = re.compile(
+        p1_7 = regex_engine.compile(
             r"^Timer\s+intervals\s+configured,\s+Hello\s+(?P<hello>\d+),\s+Dead\s+(?P<dead>\d+),"
             r"\s+Wait\s+(?P<wait>\d+),\s+Retransmit\s+(?P<retransmit>\d+)$"
         )
 
         # Hello due in 00:00:04
-        p1_8 = re.compile(r"^Hello\s+due\s+in\s+(?P<hello_due>\S+)$")
+        p1_8 = regex_engine.compile(r"^Hello\s+due\s+in\s+(?P<hello_due>\S+)$")
 
         # Graceful restart helper support enabled
-        p1_9 = re.compile(
+        p1_9 = regex_engine.compile(
             r"^Graceful\s+restart\s+helper\s+support\s+(?P<gr_support>\w+)$"
         )
 
         # Index 1/11/11, flood queue length 0
-        p1_10 = re.compile(
+        p1_10 = regex_engine.compile(
             r"^Index\s+(?P<index>\S+),\s+flood\s+queue\s+length\s+(?P<flood_queue_length>\d+)$"
         )
 
         # Next 0x0(0)/0x0(0)/0x0(0)
-        p1_11 = re.compile(r"^Next\s+(?P<next_index>\S+)$")
+        p1_11 = regex_engine.compile(r"^Next\s+(?P<next_index>\S+)$")
 
         #  Last flood scan length is 28, maximum is 253
-        p1_12 = re.compile(
+        p1_12 = regex_engine.compile(
             r"^Last\s+flood\s+scan\s+length\s+is\s+(?P<flood_scan_length>\d+),\s+maximum\s+is\s+("
             r"?P<flood_scan_length_maximum>\d+)$"
         )
 
         # Last flood scan time is 0 msec, maximum is 2 msec
-        p1_13 = re.compile(
+        p1_13 = regex_engine.compile(
             r"^Last\s+flood\s+scan\s+time\s+is\s+(?P<flood_scan_time>\d+)\s+msec,"
             r"\s+maximum\s+is\s+(?P<flood_scan_time_maximum>\d+)\s+msec$"
         )
 
         # Neighbor Count is 1, Adjacent neighbor count is 1
-        p1_14 = re.compile(
+        p1_14 = regex_engine.compile(
             r"^Neighbor\s+Count\s+is\s+(?P<neighbor_count>\d+),"
             r"\s+Adjacent\s+neighbor\s+count\s+is\s+(?P<adj_neighbor_count>\d+)$"
         )
 
         # Adjacent with neighbor 2.200.33.3  (Backup Designated Router)
         # Adjacent with neighbor 100.100.100.100, cost is 2
-        p1_15 = re.compile(
+        p1_15 = regex_engine.compile(
             r"^Adjacent\s+with\s+neighbor\s+(?P<neighbor_id>(\d{1,3}\.){3}\d{1,3})(\s+\(("
             r"?P<dr_or_bdr>.*)\))?(,\s+cost\s+is\s+(?P<neighbor_cost>\d+))?$"
         )
 
         # Suppress hello for 0 neighbor(s)
-        p1_16 = re.compile(
+        p1_16 = regex_engine.compile(
             r"^Suppress\s+hello\s+for\s+(?P<suppress_hello>\d+)\s+neighbor\(s\)$"
         )
 
@@ -1081,19 +1081,19 @@ class ShowOspfv3Gracefulrestart(ShowOspfv3GracefulrestartSchema):
             output = self.device.execute(self.cli_command.format(pid=pid))
 
         # OSPFv3 5 address-family ipv6 (router-id 1.1.1.1)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPFv3\s+(?P<pid>\d+)\s+address-family\s+(?P<address_family>\S+)\s+\("
             r"router-id\s+(?P<router_id>(\d{1,3}\.){3}\d{1,3})\)$"
         )
 
         # Router is running in SSO mode
-        p2 = re.compile(r"^Router\s+is\s+running\s+in\s+(?P<router_mode>\w+)\s+mode$")
+        p2 = regex_engine.compile(r"^Router\s+is\s+running\s+in\s+(?P<router_mode>\w+)\s+mode$")
 
         # restart-interval limit: 3 sec
-        p2_1 = re.compile(r"^restart-interval\s+limit:\s+(?P<limit_in_sec>\d+)\s+sec$")
+        p2_1 = regex_engine.compile(r"^restart-interval\s+limit:\s+(?P<limit_in_sec>\d+)\s+sec$")
 
         # Number of neighbors performing Graceful Restart is 4
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Number\s+of\s+neighbors\s+performing\s+Graceful\s+Restart\s+is\s+(?P<neighbors>\d+)$"
         )
 
@@ -1163,13 +1163,13 @@ class ShowOspfv3FloodList(ShowOspfv3FloodListSchema):
             output = self.device.execute(self.cli_command.format(pid=pid))
 
         # OSPFv3 50 address-family ipv6 (router-id 2.200.1.2)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPFv3\s+(?P<pid>\d+)\s+address-family\s+(?P<address_family>\S+)\s+\("
             r"router-id\s+(?P<router_id>(\d{1,3}\.){3}\d{1,3})\)$"
         )
 
         # Interface Vlan3892, Queue length 0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Interface\s+(?P<interface>\S+),\s+Queue\s+length\s+(?P<queue_length>\d+)$"
         )
 
@@ -1227,13 +1227,13 @@ class ShowOspfv3Events(ShowOspfv3EventsSchema):
             output = self.device.execute(self.cli_command.format(pid=pid))
 
         # OSPFv3 5 address-family ipv6 (router-id 1.1.1.1)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPFv3\s+(?P<pid>\d+)\s+address-family\s+(?P<address_family>\S+)\s+\(router-id\s+("
             r"?P<router_id>(\d{1,3}\.){3}\d{1,3})\)$"
         )
 
         # 1    *Oct 10 13:19:29.499: End of SPF, SPF time 0ms, next wait-interval 200ms
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<index>\d+)\s+(?P<date>\S+\s+\S+\s+\S+):\s+(?P<message>.*)$"
         )
 
@@ -1384,13 +1384,13 @@ class ShowOspfv3DatabaseSummaryDetail(ShowOspfv3DatabaseSummaryDetailSchema):
         # OSPFv3 5 address-family ipv4 (router-id 21.1.1.1)
         # OSPFv3 5 address-family ipv6 vrf red (router-id 12.1.1.2)
 
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^OSPFv3 +(?P<instance>(\d+)) +address\-family +(?P<address_family>(\S+))"
             r"(?: +vrf +(?P<vrf>(\S+)))? +\(router\-id +(?P<router_id>(\S+))\)$"
         )
 
         # Router 21.1.1.1 LSA summary
-        p1 = re.compile(r"^Router +(?P<router_ip>(\S+)) +LSA +summary$")
+        p1 = regex_engine.compile(r"^Router +(?P<router_ip>(\S+)) +LSA +summary$")
 
         # LSA Type      Count    Delete   Maxage
         # Router              1        0        0
@@ -1405,7 +1405,7 @@ class ShowOspfv3DatabaseSummaryDetail(ShowOspfv3DatabaseSummaryDetailSchema):
         # GR                  0        0        0
         # Total               7        0        0
 
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<lsa_type>(Router|Network|Inter-area Prefix|Inter-area Router|"
             r"Type-5 Ext|Type-7 External|Link|Prefix|TE|GR|Total))"
             r" +(?P<count>(\d+)) +(?P<delete>(\d+)) +(?P<maxage>(\d+))"
@@ -1575,59 +1575,59 @@ class ShowOspfv3(ShowOspfv3Schema):
 
         # OSPFv3 5 address-family ipv6 vrf red
         # OSPFv3 5 address-family ipv6
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^OSPFv3 +(?P<instance>(\d+)) +address\-family +(?P<address_family>(\S+))"
             r"(?: +vrf +(?P<vrf>(\S+)))?$"
         )
 
         # Router ID 21.1.1.1
-        p1 = re.compile(r"^Router +ID +(?P<router_id>(\S+))$")
+        p1 = regex_engine.compile(r"^Router +ID +(?P<router_id>(\S+))$")
 
         # Maximum number of non self-generated LSA allowed 500000
         # Maximum number of non self-generated LSA allowed 500000 (warning-only)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Maximum +number +of +non +self-generated +LSA"
             r" +allowed +(?P<max_lsa>(\d+))"
             r"(?: +\((?P<max_lsa_warning_only>(warning-only))\))?"
         )
 
         # Current number of non self-generated LSA 3
-        p3_1 = re.compile(
+        p3_1 = regex_engine.compile(
             r"^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$"
         )
 
         # Threshold for warning message 75%
-        p3_2 = re.compile(
+        p3_2 = regex_engine.compile(
             r"^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$"
         )
 
         # Ignore-time 5 minutes, reset-time 10 minutes
-        p3_3 = re.compile(
+        p3_3 = regex_engine.compile(
             r"^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,"
             r" +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$"
         )
 
         # Ignore-count allowed 5, current ignore-count 0
-        p3_4 = re.compile(
+        p3_4 = regex_engine.compile(
             r"^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),"
             r" +current ignore\-count +(?P<max_lsa_current_count>\d+)$"
         )
 
         # Redistributing External Routes from,
-        p4 = re.compile(r"^Redistributing +External +Routes +from,$")
+        p4 = regex_engine.compile(r"^Redistributing +External +Routes +from,$")
 
         # connected
         # connected with metric mapped to 10
         # static
         # static with metric mapped to 10
-        p4_1_1 = re.compile(
+        p4_1_1 = regex_engine.compile(
             r"^(?P<type>(connected|static))(?: +with +metric +mapped +to +(?P<metric>(\d+)))?$"
         )
 
         # connected, includes subnets in redistribution
         # static, includes subnets in redistribution
         # isis, includes subnets in redistribution
-        p4_1_2 = re.compile(
+        p4_1_2 = regex_engine.compile(
             r"^(?P<type>(connected|static|isis))"
             r", +includes +(?P<redist>(subnets)) +in +redistribution"
         )
@@ -1636,7 +1636,7 @@ class ShowOspfv3(ShowOspfv3Schema):
         # isis 10 with metric mapped to 3333
         # bgp 100 with metric mapped to 100, includes subnets in redistribution, nssa areas only
         # bgp 100, includes subnets in redistribution
-        p4_1_3 = re.compile(
+        p4_1_3 = regex_engine.compile(
             r"^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))"
             r"(?: +with +metric +mapped +to +(?P<metric>(\d+)))?"
             r"(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?"
@@ -1644,14 +1644,14 @@ class ShowOspfv3(ShowOspfv3Schema):
         )
         # Maximum limit of redistributed prefixes 100000
         # Maximum limit of redistributed prefixes 100000 (warning-only)
-        p4_2 = re.compile(
+        p4_2 = regex_engine.compile(
             r"^Maximum +limit +of +redistributed +prefixes"
             r" +(?P<num_prefix>(\d+))"
             r"(?: +\((?P<warn>(warning-only))\))?"
         )
 
         # Threshold for warning message 85%
-        p4_3 = re.compile(r"^Threshold +for +warning +message" r" +(?P<thld>(\d+))\%$")
+        p4_3 = regex_engine.compile(r"^Threshold +for +warning +message" r" +(?P<thld>(\d+))\%$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1884,53 +1884,53 @@ class ShowRunSectionOspfv3(ShowRunSectionOspfv3Schema):
         address_level = 0
 
         # router ospfv3 5
-        p1 = re.compile(r"^router +ospfv3 +(?P<instance>(\d+))$")
+        p1 = regex_engine.compile(r"^router +ospfv3 +(?P<instance>(\d+))$")
 
         # address-family ipv4 unicast
         # address-family ipv6 unicast vrf red
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^address\-family +(?P<address_family>(\S+)) +unicast(?: +vrf +(?P<vrf>(\S+)))?"
         )
 
         # max-lsa 300000
-        p3_1 = re.compile(r"^max-lsa +(?P<max_lsa>(\d+))")
+        p3_1 = regex_engine.compile(r"^max-lsa +(?P<max_lsa>(\d+))")
 
         # max-lsa 300000 76
-        p3_2 = re.compile(r"^max-lsa +(?P<max_lsa>(\d+)) +(?P<threshold>(\d+))$")
+        p3_2 = regex_engine.compile(r"^max-lsa +(?P<max_lsa>(\d+)) +(?P<threshold>(\d+))$")
 
         # max-lsa 500000 warning-only
-        p3_3 = re.compile(r"^max-lsa +(?P<max_lsa>(\d+)) +(?P<warn>(\S+))$")
+        p3_3 = regex_engine.compile(r"^max-lsa +(?P<max_lsa>(\d+)) +(?P<warn>(\S+))$")
 
         # max-lsa 500000 89 warning-only
-        p3_4 = re.compile(
+        p3_4 = regex_engine.compile(
             r"^max-lsa +(?P<max_lsa>(\d+))(:? +(?P<threshold>(\d+))?)(:? +(?P<warn>(\S+))?)$"
         )
 
         # max-lsa 500000 ignore-count 2
-        p3_5 = re.compile(
+        p3_5 = regex_engine.compile(
             r"^max-lsa +(?P<max_lsa>(\d+)) +ignore-count +(?P<ignore_count>(\d+))"
         )
 
         # max-lsa 500000 ignore-time 5
-        p3_6 = re.compile(
+        p3_6 = regex_engine.compile(
             r"^max-lsa +(?P<max_lsa>(\d+)) +ignore-time +(?P<ignore_time>(\d+))"
         )
 
         # max-lsa 300000 reset-time 11
-        p3_7 = re.compile(
+        p3_7 = regex_engine.compile(
             r"^max-lsa +(?P<max_lsa>(\d+)) +reset-time +(?P<reset_time>(\d+))"
         )
 
         # redistribute maximum-prefix 388899
-        p4_1 = re.compile(r"^redistribute maximum-prefix +(?P<max_redist>(\d+))")
+        p4_1 = regex_engine.compile(r"^redistribute maximum-prefix +(?P<max_redist>(\d+))")
 
         # redistribute maximum-prefix 388899 76
-        p4_2 = re.compile(
+        p4_2 = regex_engine.compile(
             r"^redistribute maximum-prefix +(?P<max_redist>(\d+))(:? +(?P<threshold>(\d+))?)$"
         )
 
         # redistribute maximum-prefix 388899 warning-only
-        p4_3 = re.compile(
+        p4_3 = regex_engine.compile(
             r"^redistribute maximum-prefix +(?P<max_redist>(\d+))(:? +(?P<warn>(warning-only)))$"
         )
 
@@ -2169,7 +2169,7 @@ class ShowOspfv3RibRedistribution(ShowOspfv3RibRedistributionSchema):
 
         # OSPFv3 1 address-family ipv4 (router-id 100.1.1.1)
         # OSPFv3 10 address-family ipv4 vrf red (router-id 40.60.0.60)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"OSPFv3 (?P<instance>\d+)+ address-family (?P<address_family>\S+)\s+((vrf (?P<vrf>\S+) )?)+\(router-id (?P<router_id>\S+)\)"
         )
 
@@ -2178,13 +2178,13 @@ class ShowOspfv3RibRedistribution(ShowOspfv3RibRedistributionSchema):
         # 33::2/128, type 2, metric 20, tag 0, from connected (connected)
         # via Loopback1
 
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"(?P<network>\S+), type (?P<type>\d+), metric (?P<metric>\d+), tag (?P<tag>\d+), from (?P<from>.*)$"
         )
 
         # via 40.60.1.40, Ethernet0/2
         # via Null0
-        p3 = re.compile(r"via ((?P<via_network>\S+),)?\s*(?P<interface>\S+)")
+        p3 = regex_engine.compile(r"via ((?P<via_network>\S+),)?\s*(?P<interface>\S+)")
 
         # initial variables
         ret_dict = {}
@@ -2287,12 +2287,12 @@ class ShowOspfv3NeighborInterface(ShowOspfv3NeighborInterfaceSchema):
 
         ret_dict = {}
         # OSPFv3 1 address-family ipv6 (router-id 1.1.1.1)
-        p1 = re.compile(r'^OSPFv3\s+(?P<ospfv3_process_id>\d+)\s+address-family\s+(?P<address_family>\S+)\s+\(router-id\s+(?P<router_id>[\d.]+)\)$')
+        p1 = regex_engine.compile(r'^OSPFv3\s+(?P<ospfv3_process_id>\d+)\s+address-family\s+(?P<address_family>\S+)\s+\(router-id\s+(?P<router_id>[\d.]+)\)$')
 
         # Neighbor ID     Pri   State           Dead Time   Interface ID    Interface
         # 2.2.2.2           0   FULL/  -        00:00:39    11              GigabitEthernet1/0/21
         # 9.9.9.9           1   DOWN/DROTHER       -        81              Vlan120
-        p2 = re.compile(r'^(?P<neighbor_id>[\d.]+)\s+(?P<priority>\d)\s+(?P<state>\S+/\s*[\S-]+)\s+(?P<dead_time>[\d:-]+)\s+(?P<interface_id>\d+)\s+(?P<interface_name>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<neighbor_id>[\d.]+)\s+(?P<priority>\d)\s+(?P<state>\S+/\s*[\S-]+)\s+(?P<dead_time>[\d:-]+)\s+(?P<interface_id>\d+)\s+(?P<interface_name>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4,12 +4,12 @@
      * show parser statistics
 
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 
@@ -42,13 +42,13 @@ class ShowParserEncryptFileStatus(ShowParserEncryptFileStatusSchema):
         ret_dict = {}
         
         #Feature:            Enabled
-        p1=re.compile(r'^Feature\:\s+(?P<feature>Enabled|Disabled)$')
+        p1=regex_engine.compile(r'^Feature\:\s+(?P<feature>Enabled|Disabled)$')
         
         #File Format:        Cipher text
-        p2=re.compile(r'^File Format:\s+(?P<format>(Plain|Cipher) text)$')
+        p2=regex_engine.compile(r'^File Format:\s+(?P<format>(Plain|Cipher) text)$')
         
         #Encryption Version: ver1 
-        p3= re.compile(r'^Encryption Version:\s+(?P<encrypt_ver>\S+)$')
+        p3= regex_engine.compile(r'^Encryption Version:\s+(?P<encrypt_ver>\S+)$')
         
         for line in output.splitlines():
             line = line.strip() 
@@ -133,35 +133,35 @@ class ShowParserStatistics(ShowParserStatisticsSchema):
         # ^Last configuration file parsed: +(?P<last_config>(Number of Commands: +(?P<number_of_commands>\d+)+,+ Time: (?P<time>\d+)+ ms$))
         # p1 = re.compile(r'^Last configuration file parsed: Number of Commands:'
         #                r' +(?P<number_of_commands>\d+)+,+ Time: (?P<time>\d+)+ ms$')
-        p1 = re.compile(r'^Last configuration file parsed: +(?P<last_config>Number of Commands: +(?P<number_of_commands>\d+)+,+ Time: (?P<time>\d+)+ ms$)')
+        p1 = regex_engine.compile(r'^Last configuration file parsed: +(?P<last_config>Number of Commands: +(?P<number_of_commands>\d+)+,+ Time: (?P<time>\d+)+ ms$)')
 
         # Parser cache: enabled, 397 hits, 663 misses
-        p2 = re.compile(r'^Parser cache: (?P<status>\w+)+, +(?P<hits>\d+)+ hits+, +(?P<misses>\d+)+ misses$')
+        p2 = regex_engine.compile(r'^Parser cache: (?P<status>\w+)+, +(?P<hits>\d+)+ hits+, +(?P<misses>\d+)+ misses$')
 
         # Active startup time
-        p3 = re.compile(r'^Active startup time:+\s+(?P<active_startup_time>\d+)$')
+        p3 = regex_engine.compile(r'^Active startup time:+\s+(?P<active_startup_time>\d+)$')
         # p12 = re.compile(r'^([^:]+)+:+\s+(\d+)$')
 
         # Standby startup time
-        p4 = re.compile(r'^Standby startup time:+\s+(?P<standby_startup_time>\d+)$')
+        p4 = regex_engine.compile(r'^Standby startup time:+\s+(?P<standby_startup_time>\d+)$')
 
         # Copy to running-config time
-        p5 = re.compile(r'^Copy to running-config time:+\s+(?P<copy_running_config_time>\d+)$')
+        p5 = regex_engine.compile(r'^Copy to running-config time:+\s+(?P<copy_running_config_time>\d+)$')
 
         # BulkSync time
-        p6 = re.compile(r'^Bulksync time:+\s+(?P<bulksync_time>\d+)$')
+        p6 = regex_engine.compile(r'^Bulksync time:+\s+(?P<bulksync_time>\d+)$')
 
         # Top 10 commands
-        p7 = re.compile(r'(?P<function>0[xX][A-Fa-f0-9]+)\s+(?P<time_ms>\d+)\s+(?P<command>.*?)(\s*(?P<date>\d{4}\/\d+\/\d+)\s+(?P<time_with_seconds>\d+:\d+:\d+.\d+)\s+(?P<timezone>\w+))?$')
+        p7 = regex_engine.compile(r'(?P<function>0[xX][A-Fa-f0-9]+)\s+(?P<time_ms>\d+)\s+(?P<command>.*?)(\s*(?P<date>\d{4}\/\d+\/\d+)\s+(?P<time_with_seconds>\d+:\d+:\d+.\d+)\s+(?P<timezone>\w+))?$')
 
         # Bootup hits
-        p8 = re.compile(r'^Bootup hits:+\s+(?P<bootup_time>\d+)$')
+        p8 = regex_engine.compile(r'^Bootup hits:+\s+(?P<bootup_time>\d+)$')
 
         # Bootup misses
-        p9 = re.compile(r'^Bootup misses:+\s+(?P<bootup_misses>\d+)$')
+        p9 = regex_engine.compile(r'^Bootup misses:+\s+(?P<bootup_misses>\d+)$')
 
         # Bootup clear parser cache
-        p10 = re.compile(r'^Bootup clear parser cache:+\s+(?P<bootup_clear_parser_cache>\d+)$')
+        p10 = regex_engine.compile(r'^Bootup clear parser cache:+\s+(?P<bootup_clear_parser_cache>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
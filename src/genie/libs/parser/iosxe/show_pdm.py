@@ -7,10 +7,10 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -54,15 +54,15 @@ class ShowPdmSteeringPolicy(ShowPdmSteeringPolicySchema):
 
         # Steering Policy Contract2-01
         # Steering Policy Contract2_01
-        p1 = re.compile(r"^Steering\s+Policy\s*(?P<contract>\S+)")
+        p1 = regex_engine.compile(r"^Steering\s+Policy\s*(?P<contract>\S+)")
         
         #     1 redirect protocol 6 src-port any dst-port eq 15000 service \
         #        service_INFRA_VN (0 match)
-        p2 = re.compile(r"^(?P<s_no>[\d]+)\s*redirect protocol\s*"\
-                r"(?P<protocol>[\d]+)\s*src-port\s*(eq)?\s*"\
-                r"(?P<src_port>[\w]+)\s*dst-port\s*(eq)?\s*"\
-                r"(?P<dst_port>[\w]+)\s*service\s*(?P<service>[\w]+)"\
-                r"\s*\(\s*(?P<pdm_counters>[\d]+)\s*(match|matches)\)$")
+        p2 = regex_engine.compile(r"^(?P<s_no>[\d]+)\s*redirect protocol\s*"\
+                          r"(?P<protocol>[\d]+)\s*src-port\s*(eq)?\s*"\
+                          r"(?P<src_port>[\w]+)\s*dst-port\s*(eq)?\s*"\
+                          r"(?P<dst_port>[\w]+)\s*service\s*(?P<service>[\w]+)"\
+                          r"\s*\(\s*(?P<pdm_counters>[\d]+)\s*(match|matches)\)$")
         for line in output.splitlines():
             line = line.strip()
 
@@ -152,31 +152,31 @@ class ShowPdmSteeringPolicyDetails(ShowPdmSteeringPolicyDetailsSchema):
         parsed_dict = {}
 
         # Steering Policy Contract2-01
-        p1 = re.compile(r"^Steering Policy\s*(?P<policy>[\w]+)-[\w]+$")
+        p1 = regex_engine.compile(r"^Steering Policy\s*(?P<policy>[\w]+)-[\w]+$")
         # Policy ID: 577677153
-        p2 = re.compile(r"^Policy ID:\s*(?P<policy_id>[\d]+)$")
+        p2 = regex_engine.compile(r"^Policy ID:\s*(?P<policy_id>[\d]+)$")
         # 1 redirect protocol 6 src-port any dst-port eq 15000 service service_INFRA_VN (0 match)
-        p3 = re.compile(r"^(?P<s_no>[\d]+)\s*redirect protocol\s*(?P<protocol>[\d]+)\s*src-port\s*(eq)?\s*(?P<src_port>[\w]+)\s*dst-port\s*(eq)?\s*(?P<dst_port>[\w]+)\s*service\s*(?P<service>[\w]+)\s*\(\s*(?P<counters>[\d]+)\s*(match|matches)\)$")
+        p3 = regex_engine.compile(r"^(?P<s_no>[\d]+)\s*redirect protocol\s*(?P<protocol>[\d]+)\s*src-port\s*(eq)?\s*(?P<src_port>[\w]+)\s*dst-port\s*(eq)?\s*(?P<dst_port>[\w]+)\s*service\s*(?P<service>[\w]+)\s*\(\s*(?P<counters>[\d]+)\s*(match|matches)\)$")
         # Service Name: service_INFRA_VN
-        p4 = re.compile(r"^Service Name:\s*(?P<service_name>[\w]+)$")
+        p4 = regex_engine.compile(r"^Service Name:\s*(?P<service_name>[\w]+)$")
         # Firewall mode      : routed
-        p5 = re.compile(r"^Firewall mode\s*:\s*(?P<firewall_mode>[\w]+)$")
+        p5 = regex_engine.compile(r"^Firewall mode\s*:\s*(?P<firewall_mode>[\w]+)$")
         # Service IP         : 172.18.0.2
-        p6 = re.compile(r"^Service IP\s*:\s*(?P<service_ip>[\w.]+)$")
+        p6 = regex_engine.compile(r"^Service IP\s*:\s*(?P<service_ip>[\w.]+)$")
         # Service Locator    : 255
-        p7 = re.compile(r"^Service Locator\s*:\s*(?P<service_locator>[\w]+)$")
+        p7 = regex_engine.compile(r"^Service Locator\s*:\s*(?P<service_locator>[\w]+)$")
         # VRF ID             : 0
-        p8 = re.compile(r"^VRF ID\s*:\s*(?P<vrf_id>[\w]+)$")
+        p8 = regex_engine.compile(r"^VRF ID\s*:\s*(?P<vrf_id>[\w]+)$")
         # Vnid               : 4097
-        p9 = re.compile(r"^Vnid\s*:\s*(?P<vnid>[\w]+)$")
+        p9 = regex_engine.compile(r"^Vnid\s*:\s*(?P<vnid>[\w]+)$")
         # RLOC Status        : Received
-        p10 = re.compile(r"^RLOC Status\s*:\s*(?P<rloc_status>[\w]+)$")
+        p10 = regex_engine.compile(r"^RLOC Status\s*:\s*(?P<rloc_status>[\w]+)$")
         # no.of rlocs        : 1
-        p11 = re.compile(r"^no.of rlocs\s*:\s*(?P<no_of_rlocs>[\w]+)$")
+        p11 = regex_engine.compile(r"^no.of rlocs\s*:\s*(?P<no_of_rlocs>[\w]+)$")
         # *1. RLOC IP: 60.60.60.62    Weight: 10    Priority: 0
-        p12 = re.compile(r"^\*?(?P<s_no>[\d]+).\s*RLOC\s*IP:\s*(?P<rloc_ip>[\w.]+)\s*Weight:\s*(?P<weight>[\d]+)\s*Priority:\s*(?P<priority>[\d]+)$")
+        p12 = regex_engine.compile(r"^\*?(?P<s_no>[\d]+).\s*RLOC\s*IP:\s*(?P<rloc_ip>[\w.]+)\s*Weight:\s*(?P<weight>[\d]+)\s*Priority:\s*(?P<priority>[\d]+)$")
         # Owner              : GPP
-        p13 = re.compile(r"^Owner\s*:\s*(?P<owner>[\w]+)$")
+        p13 = regex_engine.compile(r"^Owner\s*:\s*(?P<owner>[\w]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -334,9 +334,9 @@ class ShowPdmSteeringService(ShowPdmSteeringServiceSchema):
         parsed_dict = {}
 
         # Steering Service service_INFRA_VN
-        p1 = re.compile(r"^Steering Service\s*(?P<service>[\w]+)")
+        p1 = regex_engine.compile(r"^Steering Service\s*(?P<service>[\w]+)")
         #     mode routed address 172.18.0.2 selector 255 vnid 4097
-        p2 = re.compile(r"^\s*mode\s*(?P<mode>[\w]+)\s*address\s*(?P<ip_address>[\w.]+)\s*selector\s*(?P<selector>[\w]+)\s*vnid\s*(?P<vnid>[\d]+)\s*")
+        p2 = regex_engine.compile(r"^\s*mode\s*(?P<mode>[\w]+)\s*address\s*(?P<ip_address>[\w.]+)\s*selector\s*(?P<selector>[\w]+)\s*vnid\s*(?P<vnid>[\d]+)\s*")
         for line in output.splitlines():
             line = line.strip()
 
@@ -414,31 +414,31 @@ class ShowPdmSteeringServiceDetail(ShowPdmSteeringServiceDetailSchema):
 
 
         # Service Name   : service_INFRA_VN
-        p1 = re.compile(r"^Service Name\s*:\s*(?P<service_name>[\w]+)$")
+        p1 = regex_engine.compile(r"^Service Name\s*:\s*(?P<service_name>[\w]+)$")
         # Service ID     : 2068955985
-        p2 = re.compile(r"^Service ID\s*:\s*(?P<service_id>[\d]+)$")
+        p2 = regex_engine.compile(r"^Service ID\s*:\s*(?P<service_id>[\d]+)$")
         # Ref count      : 2
-        p3 = re.compile(r"^Ref count\s*:\s*(?P<ref_count>[\d]+)$")
+        p3 = regex_engine.compile(r"^Ref count\s*:\s*(?P<ref_count>[\d]+)$")
         # Stale          : FALSE
-        p4 = re.compile(r"^Stale\s*:\s*(?P<stale>[\w]+)$")
+        p4 = regex_engine.compile(r"^Stale\s*:\s*(?P<stale>[\w]+)$")
         # Firewall mode      : routed
-        p5 = re.compile(r"^Firewall mode\s*:\s*(?P<firewall_mode>[\w]+)$")
+        p5 = regex_engine.compile(r"^Firewall mode\s*:\s*(?P<firewall_mode>[\w]+)$")
         # Service IP         : 172.18.0.2
-        p6 = re.compile(r"^Service IP\s*:\s*(?P<service_ip>[\w.]+)$")
+        p6 = regex_engine.compile(r"^Service IP\s*:\s*(?P<service_ip>[\w.]+)$")
         # Service Locator    : 255
-        p7 = re.compile(r"^Service Locator\s*:\s*(?P<service_locator>[\w]+)$")
+        p7 = regex_engine.compile(r"^Service Locator\s*:\s*(?P<service_locator>[\w]+)$")
         # VRF ID             : 0
-        p8 = re.compile(r"^VRF ID\s*:\s*(?P<vrf_id>[\w]+)$")
+        p8 = regex_engine.compile(r"^VRF ID\s*:\s*(?P<vrf_id>[\w]+)$")
         # Vnid               : 4097
-        p9 = re.compile(r"^Vnid\s*:\s*(?P<vnid>[\w]+)$")
+        p9 = regex_engine.compile(r"^Vnid\s*:\s*(?P<vnid>[\w]+)$")
         # RLOC Status        : Received
-        p10 = re.compile(r"^RLOC Status\s*:\s*(?P<rloc_status>[\w]+)$")
+        p10 = regex_engine.compile(r"^RLOC Status\s*:\s*(?P<rloc_status>[\w]+)$")
         # no.of rlocs        : 1
-        p11 = re.compile(r"^no.of rlocs\s*:\s*(?P<no_of_rlocs>[\w]+)$")
+        p11 = regex_engine.compile(r"^no.of rlocs\s*:\s*(?P<no_of_rlocs>[\w]+)$")
         # *1. RLOC IP: 60.60.60.62    Weight: 10    Priority: 0
-        p12 = re.compile(r"^\*?(?P<s_no>[\d]+).\s*RLOC\s*IP:\s*(?P<rloc_ip>[\w.]+)\s*Weight:\s*(?P<weight>[\d]+)\s*Priority:\s*(?P<priority>[\d]+)$")
+        p12 = regex_engine.compile(r"^\*?(?P<s_no>[\d]+).\s*RLOC\s*IP:\s*(?P<rloc_ip>[\w.]+)\s*Weight:\s*(?P<weight>[\d]+)\s*Priority:\s*(?P<priority>[\d]+)$")
         # Owner              : GPP
-        p13 = re.compile(r"^Owner\s*:\s*(?P<owner>[\w]+)$")
+        p13 = regex_engine.compile(r"^Owner\s*:\s*(?P<owner>[\w]+)$")
 
 
 
@@ -569,7 +569,7 @@ class ShowPdmSteeringPolicyCount(ShowPdmSteeringPolicyCountSchema):
         pdm_dict_count = {}
 
         # Number of lines which match regexp = 2100
-        p1 = re.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
+        p1 = regex_engine.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
 
         for line in output.splitlines():
             line = line.strip()
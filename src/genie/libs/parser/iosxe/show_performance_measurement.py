@@ -1,12 +1,14 @@
 
 # Python
 from contextlib import redirect_stderr
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 ''' show_pm.py
 
 IOSXE parsers for the following show commands:
@@ -381,173 +383,173 @@ class ShowPerformanceMeasurementSrPolicy(ShowPerformanceMeasurementSrPolicySchem
             output = self.device.execute(cmd)
 
         # SR Policy name: Ethernet0/0
-        p1 = re.compile(r'^SR Policy name: (?P<sr_policy_name>\S+)$')
+        p1 = regex_engine.compile(r'^SR Policy name: (?P<sr_policy_name>\S+)$')
 
         # Color                           : 1235
-        p2 = re.compile(r'^Color\s+: (?P<color>\d+)$')
+        p2 = regex_engine.compile(r'^Color\s+: (?P<color>\d+)$')
 
         # Endpoint                        : 1.1.1.7
-        p3 = re.compile(r'^Endpoint\s+: (?P<endpoint>[\d\.:A-F]+)$')
+        p3 = regex_engine.compile(r'^Endpoint\s+: (?P<endpoint>[\d\.:A-F]+)$')
 
         # Source                          : 1.1.1.3
-        p4 = re.compile(r'^Source\s+: (?P<source>[\d\.:A-F]+)$')
+        p4 = regex_engine.compile(r'^Source\s+: (?P<source>[\d\.:A-F]+)$')
 
         # Profile name                    : Not configured
-        p5 = re.compile(r'^Profile name\s+: (?P<profile_name>.+)$')
+        p5 = regex_engine.compile(r'^Profile name\s+: (?P<profile_name>.+)$')
 
         # Policy Update Timestamp         : 05-20 06:46:52.222
-        p6 = re.compile(r'^Policy Update Timestamp\s+: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p6 = regex_engine.compile(r'^Policy Update Timestamp\s+: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         # Number of candidate-paths       : 1
-        p7 = re.compile(r'^Number of candidate-paths\s+: (?P<number_of_candidate_paths>\d+)$')
+        p7 = regex_engine.compile(r'^Number of candidate-paths\s+: (?P<number_of_candidate_paths>\d+)$')
 
         # Candidate-Path:
-        p8 = re.compile(r'^Candidate-Path:$')
+        p8 = regex_engine.compile(r'^Candidate-Path:$')
 
         # Preference                    : 100
-        p9 = re.compile(r'^Preference\s+: (?P<preference>\d+)$')
+        p9 = regex_engine.compile(r'^Preference\s+: (?P<preference>\d+)$')
 
         # Protocol-origin               : CLI
-        p10 = re.compile(r'^Protocol-origin\s+: (?P<protocol_origin>.+)$')
+        p10 = regex_engine.compile(r'^Protocol-origin\s+: (?P<protocol_origin>.+)$')
 
         # Discriminator                 : 0
-        p11 = re.compile(r'^Discriminator\s+: (?P<discriminator>\d+)$')
+        p11 = regex_engine.compile(r'^Discriminator\s+: (?P<discriminator>\d+)$')
 
         # Active:                       : No
-        p12 = re.compile(r'^Active:\s+: (?P<active>\S+)$')
+        p12 = regex_engine.compile(r'^Active:\s+: (?P<active>\S+)$')
 
         # Number of segment-lists       : 1
-        p13 = re.compile(r'^Number of segment-lists\s+: (?P<number_of_segment_lists>\d+)$')
+        p13 = regex_engine.compile(r'^Number of segment-lists\s+: (?P<number_of_segment_lists>\d+)$')
 
         # Number of atomic paths        : 1
-        p14 = re.compile(r'^Number of atomic paths\s+: (?P<number_of_atomic_paths>\d+)$')
+        p14 = regex_engine.compile(r'^Number of atomic paths\s+: (?P<number_of_atomic_paths>\d+)$')
 
         # Number of live UP atomic paths: 1
-        p15 = re.compile(r'^Number of live UP atomic paths:\s+(?P<number_of_live_up_atomic_paths>\d+)$')
+        p15 = regex_engine.compile(r'^Number of live UP atomic paths:\s+(?P<number_of_live_up_atomic_paths>\d+)$')
 
         # Number of live Unknown atomic : 1
-        p16 = re.compile(r'^Number of live Unknown atomic\s+: (?P<number_of_live_unknown_atomic>\d+)$')
+        p16 = regex_engine.compile(r'^Number of live Unknown atomic\s+: (?P<number_of_live_unknown_atomic>\d+)$')
 
         # Max Pkts per Burst            : 500
-        p17 = re.compile(r'^Max Pkts per Burst\s+: (?P<max_packets_per_burst>\d+)$')
+        p17 = regex_engine.compile(r'^Max Pkts per Burst\s+: (?P<max_packets_per_burst>\d+)$')
 
         # Max Pkts per Probe            : 15000
-        p18 = re.compile(r'^Max Pkts per Probe\s+: (?P<max_packets_per_probe>\d+)$')
+        p18 = regex_engine.compile(r'^Max Pkts per Probe\s+: (?P<max_packets_per_probe>\d+)$')
 
         # AP Min Run per Probe          : 3
-        p19 = re.compile(r'^AP Min Run per Probe\s+: (?P<ap_min_run_per_probe>\d+)$')
+        p19 = regex_engine.compile(r'^AP Min Run per Probe\s+: (?P<ap_min_run_per_probe>\d+)$')
 
         # Round-robin bursts            : 1
-        p20 = re.compile(r'^Round-robin bursts\s+: (?P<round_robin_bursts>\d+)$')
+        p20 = regex_engine.compile(r'^Round-robin bursts\s+: (?P<round_robin_bursts>\d+)$')
 
         # Round-robin probes            : 1
-        p21 = re.compile(r'^Round-robin probes\s+: (?P<round_robin_probes>\d+)$')
+        p21 = regex_engine.compile(r'^Round-robin probes\s+: (?P<round_robin_probes>\d+)$')
 
         # Last advertisement:
-        p22 = re.compile(r'^Last advertisement:$')
+        p22 = regex_engine.compile(r'^Last advertisement:$')
 
         # Advertised at: 09:06:42  20 2021 (92796 seconds ago)
-        p23 = re.compile(r'^Advertised at: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)\s+(?P<day>\d+)\s+(?P<year>\d+)\s+\((?P<seconds_ago>\d+) seconds ago\)$')
+        p23 = regex_engine.compile(r'^Advertised at: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)\s+(?P<day>\d+)\s+(?P<year>\d+)\s+\((?P<seconds_ago>\d+) seconds ago\)$')
 
         # Advertised delays (uSec): avg: 465, min: 1, max: 999, variance: 464
-        p24 = re.compile(r'^Advertised delays\s+\(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p24 = regex_engine.compile(r'^Advertised delays\s+\(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         # Next advertisement:
-        p25 = re.compile(r'^Next advertisement:$')
+        p25 = regex_engine.compile(r'^Next advertisement:$')
 
         # Check scheduled in 2 more probes (roughly every 120 seconds)
-        p26 = re.compile(r'^Check scheduled in (?P<probes>\d+) more probe\S* \(roughly every (?P<second>\d+) seconds\)$')
+        p26 = regex_engine.compile(r'^Check scheduled in (?P<probes>\d+) more probe\S* \(roughly every (?P<second>\d+) seconds\)$')
 
         # Aggregated delays (uSec): avg: 233, min: 1, max: 499, variance: 232
-        p27 = re.compile(r'^Aggregated delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p27 = regex_engine.compile(r'^Aggregated delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         # Last probe:
-        p28 = re.compile(r'^Last probe:$')
+        p28 = regex_engine.compile(r'^Last probe:$')
 
         # Packets Sent: 30, received: 30
-        p29 = re.compile(r'^Packets Sent: (?P<sent>\d+), received: (?P<received>\d+)$')
+        p29 = regex_engine.compile(r'^Packets Sent: (?P<sent>\d+), received: (?P<received>\d+)$')
 
         # Measured delays (uSec): avg: 233, min: 1, max: 499, variance: 232
-        p30 = re.compile(r'^Measured delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p30 = regex_engine.compile(r'^Measured delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         # Current probe:
-        p31 = re.compile(r'^Current probe:$')
+        p31 = regex_engine.compile(r'^Current probe:$')
 
         # Segment-List:
-        p32 = re.compile(r'^Segment-List:$')
+        p32 = regex_engine.compile(r'^Segment-List:$')
 
         # Name                        : SL7
-        p33 = re.compile(r'^Name\s+: (?P<name>\S+)$')
+        p33 = regex_engine.compile(r'^Name\s+: (?P<name>\S+)$')
 
         # Number of atomic paths      : 1
-        p34 = re.compile(r'^Number of atomic paths\s+: (?P<number_of_atomic_paths>\d+)$')
+        p34 = regex_engine.compile(r'^Number of atomic paths\s+: (?P<number_of_atomic_paths>\d+)$')
 
         # Atomic path:
-        p35 = re.compile(r'^Atomic path:$')
+        p35 = regex_engine.compile(r'^Atomic path:$')
 
         # Hops                      : 1.1.1.7
-        p36 = re.compile(r'^Hops\s+: (?P<hops>.+)$')
+        p36 = regex_engine.compile(r'^Hops\s+: (?P<hops>.+)$')
 
         # Labels                    : 16230
         # Labels                    : FCCC:CCC1:AA22:AA33:AA11:E003::
-        p37 = re.compile(r'^Labels\s+: (?P<labels>[\d:A-F,\s]+)$')
+        p37 = regex_engine.compile(r'^Labels\s+: (?P<labels>[\d:A-F,\s]+)$')
 
         # Outgoing Interface        : Ethernet0/1
-        p38 = re.compile(r'^Outgoing Interface\s+: (?P<outgoing_interface>\S+)$')
+        p38 = regex_engine.compile(r'^Outgoing Interface\s+: (?P<outgoing_interface>\S+)$')
 
         # Max IP MTU                : 1500
-        p39 = re.compile(r'^Max IP MTU\s+: (?P<max_ip_mtu>\d+)$')
+        p39 = regex_engine.compile(r'^Max IP MTU\s+: (?P<max_ip_mtu>\d+)$')
 
         # Next Hop                  : 110.1.1.4
-        p40 = re.compile(r'^Next Hop\s+: (?P<next_hop>[\d\.:A-F]+)$')
+        p40 = regex_engine.compile(r'^Next Hop\s+: (?P<next_hop>[\d\.:A-F]+)$')
 
         # Destination               : 1.1.1.7
-        p41 = re.compile(r'^Destination\s+: (?P<destination>[\d\.:A-F]+)$')
+        p41 = regex_engine.compile(r'^Destination\s+: (?P<destination>[\d\.:A-F]+)$')
 
         # Session ID                : 10
-        p42 = re.compile(r'^Session ID\s+: (?P<session_id>\d+)$')
+        p42 = regex_engine.compile(r'^Session ID\s+: (?P<session_id>\d+)$')
 
         # Advertised reason: Periodic timer, avg delay threshold crossed
-        p43 = re.compile(r'^Advertised reason: (?P<advertised_reason>.+)$')
+        p43 = regex_engine.compile(r'^Advertised reason: (?P<advertised_reason>.+)$')
 
         # Rolling average (uSec): 287
-        p44 = re.compile(r'^Rolling average \(uSec\): (?P<rolling_average>\d+)$')
+        p44 = regex_engine.compile(r'^Rolling average \(uSec\): (?P<rolling_average>\d+)$')
 
         # Probe samples:
-        p45 = re.compile(r'^Probe samples:$')
+        p45 = regex_engine.compile(r'^Probe samples:$')
 
         # Packet Rx Timestamp Measured Delay
-        p46 = re.compile(r'^Packet Rx Timestamp Measured Delay$')
+        p46 = regex_engine.compile(r'^Packet Rx Timestamp Measured Delay$')
 
         # 10:53:18  21 2021 0
-        p47 = re.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)\s+(?P<day>\d+)\s+(?P<year>\d+)\s+(?P<delay>\d+)$')
+        p47 = regex_engine.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)\s+(?P<day>\d+)\s+(?P<year>\d+)\s+(?P<delay>\d+)$')
 
         # Liveness Detection:
-        p48 = re.compile(r'^Liveness Detection:$')
+        p48 = regex_engine.compile(r'^Liveness Detection:$')
 
         # Session Creation Timestamp: 05-20 06:46:52.222
-        p49 = re.compile(r'^Session Creation Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p49 = regex_engine.compile(r'^Session Creation Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         # Session State: Up
-        p50 = re.compile(r'^Session State: (?P<session_state>\S+)$')
+        p50 = regex_engine.compile(r'^Session State: (?P<session_state>\S+)$')
 
         # Last State Change Timestamp: 05-20 06:46:52.414
-        p51 = re.compile(r'^Last State Change Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p51 = regex_engine.compile(r'^Last State Change Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         # Missed count   [consecutive]: 0
-        p52 = re.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
+        p52 = regex_engine.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
 
         # Received count [consecutive]: 101186
-        p53 = re.compile(r'^Received count \[consecutive\]: (?P<received_count>\d+)$')
+        p53 = regex_engine.compile(r'^Received count \[consecutive\]: (?P<received_count>\d+)$')
 
         # Backoff                     : 0
-        p54 = re.compile(r'^Backoff\s+: (?P<backoff>\d+)$')
+        p54 = regex_engine.compile(r'^Backoff\s+: (?P<backoff>\d+)$')
 
         # Unique Path Name            : Path-10
-        p55 = re.compile(r'^Unique Path Name\s+: (?P<unique_path_name>\S+)$')
+        p55 = regex_engine.compile(r'^Unique Path Name\s+: (?P<unique_path_name>\S+)$')
 
         # Loss in Last Interval       : 0 % [TX: 6 RX: 6]
-        p56 = re.compile(r'^Loss in Last Interval\s+: (?P<percent>\d+) % \[TX: (?P<tx>\d+) RX: (?P<rx>\d+)\]$')
+        p56 = regex_engine.compile(r'^Loss in Last Interval\s+: (?P<percent>\d+) % \[TX: (?P<tx>\d+) RX: (?P<rx>\d+)\]$')
 
         ret_dict = {}
         sr_pol = ''
@@ -991,7 +993,7 @@ class ShowPerformanceMeasurementSrPolicy(ShowPerformanceMeasurementSrPolicySchem
                 continue
 
             # Missed count   [consecutive]: 0
-            p52 = re.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
+            p52 = regex_engine.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
             m = p52.match(line)
             if m:
                 group = m.groupdict()
@@ -1353,168 +1355,168 @@ class ShowPerformanceMeasurementInterfaces(ShowPerformanceMeasurementInterfacesS
             output = self.device.execute(cmd)
 
         # Interface Name: Ethernet0/0 (ifh: 0x2)
-        p1 = re.compile(r'^Interface Name: (?P<interface_name>\S+) \(ifh: (?P<ifh>\S+)\)$')
+        p1 = regex_engine.compile(r'^Interface Name: (?P<interface_name>\S+) \(ifh: (?P<ifh>\S+)\)$')
 
         # Delay-Measurement           : Enabled
-        p2 = re.compile(r'^Delay-Measurement\s+: (?P<delay_measurement_enabled>\S+)$')
+        p2 = regex_engine.compile(r'^Delay-Measurement\s+: (?P<delay_measurement_enabled>\S+)$')
 
         # Loss-Measurement            : Disabled
-        p3 = re.compile(r'^Loss-Measurement\s+: (?P<loss_measurement_enabled>\S+)$')
+        p3 = regex_engine.compile(r'^Loss-Measurement\s+: (?P<loss_measurement_enabled>\S+)$')
 
         # Local IPV4 Address          : 19.1.1.3
-        p4 = re.compile(r'^Local IPV4 Address\s+: (?P<local_ipv4_address>[\d\.]+)$')
+        p4 = regex_engine.compile(r'^Local IPV4 Address\s+: (?P<local_ipv4_address>[\d\.]+)$')
 
         # Local IPV6 Address          : ::
-        p5 = re.compile(r'^Local IPV6 Address\s+: (?P<local_ipv6_address>[\d:A-F]+)$')
+        p5 = regex_engine.compile(r'^Local IPV6 Address\s+: (?P<local_ipv6_address>[\d:A-F]+)$')
 
         # State                       : Up
-        p6 = re.compile(r'^State\s+: (?P<state>\S+)$')
+        p6 = regex_engine.compile(r'^State\s+: (?P<state>\S+)$')
 
         # MPLS Caps                   : Not created
-        p7 = re.compile(r'^MPLS Caps\s+: (?P<mpls_caps>.+)$')
+        p7 = regex_engine.compile(r'^MPLS Caps\s+: (?P<mpls_caps>.+)$')
 
         # Delay Measurement session:
-        p8 = re.compile(r'^Delay Measurement session:$')
+        p8 = regex_engine.compile(r'^Delay Measurement session:$')
 
         #     Session ID                : 1
-        p9 = re.compile(r'^Session ID\s+: (?P<session_id>\d+)$')
+        p9 = regex_engine.compile(r'^Session ID\s+: (?P<session_id>\d+)$')
 
         #     Profile name              : Not configured
-        p10 = re.compile(r'^Profile name\s+: (?P<profile_name>.+)$')
+        p10 = regex_engine.compile(r'^Profile name\s+: (?P<profile_name>.+)$')
 
         #     Last advertisement:
-        p11 = re.compile(r'^Last advertisement:$')
+        p11 = regex_engine.compile(r'^Last advertisement:$')
 
         #     No advertisements have occured
-        p12 = re.compile(r'^No advertisements have occured$')
+        p12 = regex_engine.compile(r'^No advertisements have occured$')
 
         #     Next advertisement:
-        p13 = re.compile(r'^Next advertisement:$')
+        p13 = regex_engine.compile(r'^Next advertisement:$')
 
         #     Check scheduled in 2 more probes (roughly every 120 seconds)
-        p14 = re.compile(r'^Check scheduled in (?P<in_n_more_probes>\d+) more probes \(roughly every (?P<check_scheduled>\d+) seconds\)$')
+        p14 = regex_engine.compile(r'^Check scheduled in (?P<in_n_more_probes>\d+) more probes \(roughly every (?P<check_scheduled>\d+) seconds\)$')
 
         #     No probes completed
-        p15 = re.compile(r'^No probes completed$')
+        p15 = regex_engine.compile(r'^No probes completed$')
 
         #     Last Error:
-        p16 = re.compile(r'^Last Error:$')
+        p16 = regex_engine.compile(r'^Last Error:$')
 
         #     Timestamp: 13:11:32 10-18 2021
-        p17 = re.compile(r'^Timestamp: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)$')
+        p17 = regex_engine.compile(r'^Timestamp: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)$')
 
         #     0 0 packet sent error. INVALID_OUT_IF
-        p18 = re.compile(r'^(?P<error>.+)$')
+        p18 = regex_engine.compile(r'^(?P<error>.+)$')
 
         #     Current Probe:
-        p19 = re.compile(r'^Current Probe:$')
+        p19 = regex_engine.compile(r'^Current Probe:$')
 
         #     Started at 13:11:17 10-18 2021 (16 seconds ago)
-        p20 = re.compile(r'^Started at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
+        p20 = regex_engine.compile(r'^Started at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
 
         #     Packets Sent: 6, received: 0
-        p21 = re.compile(r'^Packets Sent: (?P<packets_sent>\d+), received: (?P<packets_received>\d+)$')
+        p21 = regex_engine.compile(r'^Packets Sent: (?P<packets_sent>\d+), received: (?P<packets_received>\d+)$')
 
         #     Measured delays (uSec): avg: 0, min: 0, max: 0, variance: 0
-        p22 = re.compile(r'^Measured delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p22 = regex_engine.compile(r'^Measured delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         #     Probe samples:
-        p23 = re.compile(r'^Probe samples:$')
+        p23 = regex_engine.compile(r'^Probe samples:$')
 
         #         No History
-        p24 = re.compile(r'^No History$')
+        p24 = regex_engine.compile(r'^No History$')
 
         #     Next probe scheduled at 13:11:47 10-18 2021 (in 14 seconds)
-        p25 = re.compile(r'^Next probe scheduled at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \(in (?P<remaining_seconds>\d+) seconds\)$')
+        p25 = regex_engine.compile(r'^Next probe scheduled at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \(in (?P<remaining_seconds>\d+) seconds\)$')
 
         #     Next burst packet will be sent in 2 seconds
-        p26 = re.compile(r'^Next burst packet will be sent in (?P<next_burst_packet>\d+) seconds$')
+        p26 = regex_engine.compile(r'^Next burst packet will be sent in (?P<next_burst_packet>\d+) seconds$')
 
         #       Not running: Platform not supported
-        p27 = re.compile(r'^Not running: (?P<not_running_info>.+)$')
+        p27 = regex_engine.compile(r'^Not running: (?P<not_running_info>.+)$')
 
         #     Liveness Detection:
-        p28 = re.compile(r'^Liveness Detection:$')
+        p28 = regex_engine.compile(r'^Liveness Detection:$')
 
         #     Session Creation Timestamp: 10-18 12:56:46.731
-        p29 = re.compile(r'Session Creation Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p29 = regex_engine.compile(r'Session Creation Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         #     Session State: Down
-        p30 = re.compile(r'^Session State: (?P<session_state>\S+)$')
+        p30 = regex_engine.compile(r'^Session State: (?P<session_state>\S+)$')
 
         #     Last State Change Timestamp: 10-18 12:58:47.578
-        p31 = re.compile(r'^Last State Change Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p31 = regex_engine.compile(r'^Last State Change Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         #     Missed count   [consecutive]: 296
-        p32 = re.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
+        p32 = regex_engine.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
 
         #     Received count [consecutive]: 0
-        p33 = re.compile(r'^Received count\s+\[consecutive\]: (?P<received_count>\d+)$')
+        p33 = regex_engine.compile(r'^Received count\s+\[consecutive\]: (?P<received_count>\d+)$')
 
         #     Backoff                     : 1
-        p34 = re.compile(r'^Backoff\s+: (?P<backoff>\d+)$')
+        p34 = regex_engine.compile(r'^Backoff\s+: (?P<backoff>\d+)$')
 
         #     Unique Path Name            : Path-1
-        p35 = re.compile(r'^Unique Path Name\s+: (?P<unique_path_name>.+)$')
+        p35 = regex_engine.compile(r'^Unique Path Name\s+: (?P<unique_path_name>.+)$')
 
         #     Loss in Last Interval       : 100 % [TX: 6 RX: 0]
-        p36 = re.compile(r'^Loss in Last Interval\s+: (?P<percent>\d+) % \[TX: (?P<tx>\d+) RX: (?P<rx>\d+)\]$')
+        p36 = regex_engine.compile(r'^Loss in Last Interval\s+: (?P<percent>\d+) % \[TX: (?P<tx>\d+) RX: (?P<rx>\d+)\]$')
 
         #     Advertised at: 05:15:42 11-02 2021 (4901 seconds ago)
-        p37 = re.compile(r'^Advertised at: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
+        p37 = regex_engine.compile(r'^Advertised at: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
 
         #     Advertised reason: First advertisement
-        p38 = re.compile(r'^Advertised reason: (?P<advertised_reason>.+)$')
+        p38 = regex_engine.compile(r'^Advertised reason: (?P<advertised_reason>.+)$')
 
         #     Advertised anomaly: INACTIVE
-        p39 = re.compile(r'^Advertised anomaly: (?P<advertised_anomaly>.+)$')
+        p39 = regex_engine.compile(r'^Advertised anomaly: (?P<advertised_anomaly>.+)$')
 
         #     Advertised delays (uSec): avg: 752, min: 575, max: 947, variance: 99
-        p40 = re.compile(r'^Advertised delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p40 = regex_engine.compile(r'^Advertised delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         #     Check scheduled at the end of the current probe (roughly every 120 seconds)
-        p41 = re.compile(r'^Check scheduled at the end of the current probe \(roughly every (?P<check_scheduled>\d+) seconds\)$')
+        p41 = regex_engine.compile(r'^Check scheduled at the end of the current probe \(roughly every (?P<check_scheduled>\d+) seconds\)$')
 
         #     Aggregated delays (uSec): avg: 383, min: 313, max: 499, variance: 51
-        p42 = re.compile(r'^Aggregated delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p42 = regex_engine.compile(r'^Aggregated delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         #     Rolling average (uSec): 395
-        p43 = re.compile(r'^Rolling average \(uSec\): (?P<rolling_average>\d+)$')
+        p43 = regex_engine.compile(r'^Rolling average \(uSec\): (?P<rolling_average>\d+)$')
 
         #     Probe samples:
-        p44 = re.compile(r'^Probe samples:$')
+        p44 = regex_engine.compile(r'^Probe samples:$')
 
         #     Packet Rx Timestamp       Measured Delay (nsec)
-        p45 = re.compile(r'^Packet Rx Timestamp\s+Measured Delay \(nsec\)$')
+        p45 = regex_engine.compile(r'^Packet Rx Timestamp\s+Measured Delay \(nsec\)$')
 
         #     06:37:21 11-02 2021       432500
-        p46 = re.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<measured_delay>\d+)$')
+        p46 = regex_engine.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<measured_delay>\d+)$')
 
         #     Burst completed
-        p47 = re.compile(r'^Burst completed$')
+        p47 = regex_engine.compile(r'^Burst completed$')
 
         # Loss Measurement session:
-        p48 = re.compile(r'^Loss Measurement session:$')
+        p48 = regex_engine.compile(r'^Loss Measurement session:$')
 
         #     Advertised loss(%) [Capped @ 50.331642%]: avg: 0.000000, min: 0.000000, max: 0.000000, variance: 0.000000
-        p49 = re.compile(r'^Advertised loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
+        p49 = regex_engine.compile(r'^Advertised loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
 
         #     Aggregated loss(%) [Capped @ 50.331642%]: avg: 0.000000, min: 0.000000, max: 0.000000, variance: 0.000000
-        p50 = re.compile(r'^Aggregated loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
+        p50 = regex_engine.compile(r'^Aggregated loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
 
         #     Rolling average (%): 0.000000
-        p51 = re.compile(r'^Rolling average \(%\): (?P<rolling_average>\d*\.\d+)$')
+        p51 = regex_engine.compile(r'^Rolling average \(%\): (?P<rolling_average>\d*\.\d+)$')
 
         #     Measured loss(%) [Capped @ 50.331642%]: avg: 0.000000, min: 0.000000, max: 0.000000, variance: 0.000000
-        p52 = re.compile(r'^Measured loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
+        p52 = regex_engine.compile(r'^Measured loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
 
         #         Rx Timestamp              Last TX    TX         Last RX    RX         Loss(0-100%)
         #         Rx Timestamp              Last TX    TX         Last RX    RX         Col  Loss(0-100%)
-        p53 = re.compile(r'^Rx Timestamp\s+Last TX\s+TX\s+Last RX\s+RX\s+(Col\s+)?Loss\(0-100%\)$')
+        p53 = regex_engine.compile(r'^Rx Timestamp\s+Last TX\s+TX\s+Last RX\s+RX\s+(Col\s+)?Loss\(0-100%\)$')
 
         #         13:11:32 10-18 2021       56         57         57         58         0.000000
         #         13:11:32 10-18 2021       56         57         57         58         1 0.000000
-        p54 = re.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<tx0>\d+)\s+(?P<tx1>\d+)\s+(?P<rx0>\d+)\s+(?P<rx1>\d+)\s+((?P<co>\d+)\s+)?(?P<loss>\d*\.\d+)$')
+        p54 = regex_engine.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<tx0>\d+)\s+(?P<tx1>\d+)\s+(?P<rx0>\d+)\s+(?P<rx1>\d+)\s+((?P<co>\d+)\s+)?(?P<loss>\d*\.\d+)$')
 
         ret_dict = {}
         intf_name = ''
@@ -2284,175 +2286,175 @@ class ShowPerformanceMeasurementSummary(ShowPerformanceMeasurementSummarySchema)
             output = self.device.execute(cmd)
 
         # Total interfaces                              : 5
-        p1 = re.compile(r'^Total interfaces\s+: (?P<total_interfaces>\d+)$')
+        p1 = regex_engine.compile(r'^Total interfaces\s+: (?P<total_interfaces>\d+)$')
 
         # Total SR Policies                             : 3
-        p2 = re.compile(r'^Total SR Policies\s+: (?P<total_sr_policies>\d+)$')
+        p2 = regex_engine.compile(r'^Total SR Policies\s+: (?P<total_sr_policies>\d+)$')
 
         # Total endpoints                               : 2
-        p3 = re.compile(r'^Total endpoints\s+: (?P<total_endpoints>\d+)$')
+        p3 = regex_engine.compile(r'^Total endpoints\s+: (?P<total_endpoints>\d+)$')
 
         # Maximum PPS                                   : 2000 pkts/sec
-        p4 = re.compile(r'^Maximum PPS\s+: (?P<maximum_pps>\d+) pkts/sec$')
+        p4 = regex_engine.compile(r'^Maximum PPS\s+: (?P<maximum_pps>\d+) pkts/sec$')
 
         # Dual-color gre bit-position                   : 8 - Failed, last success 0
-        p5 = re.compile(r'^Dual-color gre bit-position\s+: (?P<bit_pos>\d+)( - (?P<info>.+))?$')
+        p5 = regex_engine.compile(r'^Dual-color gre bit-position\s+: (?P<bit_pos>\d+)( - (?P<info>.+))?$')
 
         # Interface Delay-Measurement:
-        p6 = re.compile(r'^(?P<trans_type>.+) (?P<measurement_type>.+)-Measurement:$')
+        p6 = regex_engine.compile(r'^(?P<trans_type>.+) (?P<measurement_type>.+)-Measurement:$')
 
         # Total sessions                              : 2
-        p7 = re.compile(r'^Total sessions\s+: (?P<total_sessions>\d+)$')
+        p7 = regex_engine.compile(r'^Total sessions\s+: (?P<total_sessions>\d+)$')
 
         # Counters:
-        p8 = re.compile(r'^Counters:$')
+        p8 = regex_engine.compile(r'^Counters:$')
 
         #     Packets:
-        p9 = re.compile(r'^Packets:$')
+        p9 = regex_engine.compile(r'^Packets:$')
 
         #     Total sent                              : 288628
-        p10 = re.compile(r'^Total sent\s+: (?P<sent>\d+)$')
+        p10 = regex_engine.compile(r'^Total sent\s+: (?P<sent>\d+)$')
 
         #     Total received                          : 0
-        p11 = re.compile(r'^Total received\s+: (?P<received>\d+)$')
+        p11 = regex_engine.compile(r'^Total received\s+: (?P<received>\d+)$')
 
         #     Errors:
-        p12 = re.compile(r'^Errors:$')
+        p12 = regex_engine.compile(r'^Errors:$')
 
         #     Total sent errors                       : 14
-        p13 = re.compile(r'^Total sent errors\s+: (?P<sent_errors>\d+)$')
+        p13 = regex_engine.compile(r'^Total sent errors\s+: (?P<sent_errors>\d+)$')
 
         #     Total received errors                   : 0
-        p14 = re.compile(r'^Total received errors\s+: (?P<received_errors>\d+)$')
+        p14 = regex_engine.compile(r'^Total received errors\s+: (?P<received_errors>\d+)$')
 
         #     Probes:
-        p15 = re.compile(r'^Probes:$')
+        p15 = regex_engine.compile(r'^Probes:$')
 
         #     Total started                           : 28866
-        p16 = re.compile(r'^Total started\s+: (?P<started>\d+)$')
+        p16 = regex_engine.compile(r'^Total started\s+: (?P<started>\d+)$')
 
         #     Total completed                         : 0
-        p17 = re.compile(r'^Total completed\s+: (?P<completed>\d+)$')
+        p17 = regex_engine.compile(r'^Total completed\s+: (?P<completed>\d+)$')
 
         #     Total incomplete                        : 28864
-        p18 = re.compile(r'^Total incomplete\s+: (?P<incomplete>\d+)$')
+        p18 = regex_engine.compile(r'^Total incomplete\s+: (?P<incomplete>\d+)$')
 
         #     Total advertisements                    : 0
-        p19 = re.compile(r'^Total advertisements\s+: (?P<advertisements>\d+)$')
+        p19 = regex_engine.compile(r'^Total advertisements\s+: (?P<advertisements>\d+)$')
 
         # Global Counters:
-        p20 = re.compile(r'^Global Counters:$')
+        p20 = regex_engine.compile(r'^Global Counters:$')
 
         # Total packets sent                          : 3607644
-        p21 = re.compile(r'^Total packets sent\s+: (?P<packets_sent>\d+)$')
+        p21 = regex_engine.compile(r'^Total packets sent\s+: (?P<packets_sent>\d+)$')
 
         # Total query packets received                : 3319004
-        p22 = re.compile(r'^Total query packets received\s+: (?P<query_packets_received>\d+)$')
+        p22 = regex_engine.compile(r'^Total query packets received\s+: (?P<query_packets_received>\d+)$')
 
         # Total invalid session id                    : 0
-        p23 = re.compile(r'^Total invalid session id\s+: (?P<invalid_session_id>\d+)$')
+        p23 = regex_engine.compile(r'^Total invalid session id\s+: (?P<invalid_session_id>\d+)$')
 
         # Total no session                            : 0
-        p24 = re.compile(r'^Total no session\s+: (?P<no_session>\d+)')
+        p24 = regex_engine.compile(r'^Total no session\s+: (?P<no_session>\d+)')
 
         # HW Support for MPLS-GAL [RFC6374] timestamp   : Yes
-        p25 = re.compile(r'^HW Support for MPLS-GAL \[RFC6374\] timestamp\s+: (?P<hw_support_mpls_gal_timestamp>\S+)$')
+        p25 = regex_engine.compile(r'^HW Support for MPLS-GAL \[RFC6374\] timestamp\s+: (?P<hw_support_mpls_gal_timestamp>\S+)$')
 
         # HW Support for IPv4 TWAMP [RF5357] timestamp  : Yes
-        p26 = re.compile(r'^HW Support for IPv4 TWAMP \[RF5357\] timestamp\s+: (?P<hw_support_ipv4_twamp_timestamp>\S+)$')
+        p26 = regex_engine.compile(r'^HW Support for IPv4 TWAMP \[RF5357\] timestamp\s+: (?P<hw_support_ipv4_twamp_timestamp>\S+)$')
 
         # HW Support for IPv6 TWAMP [RF5357] timestamp  : No
-        p27 = re.compile(r'^HW Support for IPv6 TWAMP \[RF5357\] timestamp\s+: (?P<hw_support_ipv6_twamp_timestamp>\S+)$')
+        p27 = regex_engine.compile(r'^HW Support for IPv6 TWAMP \[RF5357\] timestamp\s+: (?P<hw_support_ipv6_twamp_timestamp>\S+)$')
 
         # HW Support for 64 bit timestamp               : Yes
-        p28 = re.compile(r'^HW Support for 64 bit timestamp\s+: (?P<hw_support_64_bit_timestamp>\S+)$')
+        p28 = regex_engine.compile(r'^HW Support for 64 bit timestamp\s+: (?P<hw_support_64_bit_timestamp>\S+)$')
 
         # HW Support for IPv4 UDP Cheksum               : Yes
-        p29 = re.compile(r'^HW Support for IPv4 UDP Cheksum\s+: (?P<hw_support_ipv4_udp_cheksum>\S+)$')
+        p29 = regex_engine.compile(r'^HW Support for IPv4 UDP Cheksum\s+: (?P<hw_support_ipv4_udp_cheksum>\S+)$')
 
         # TX:
-        p30 = re.compile(r'^TX:$')
+        p30 = regex_engine.compile(r'^TX:$')
 
         #   Total interface down                : 0
-        p31 = re.compile(r'Total interface down\s+: (?P<interface_down>\d+)$')
+        p31 = regex_engine.compile(r'Total interface down\s+: (?P<interface_down>\d+)$')
 
         #   Total no MPLS caps                  : 0
-        p32 = re.compile(r'^Total no MPLS caps\s+: (?P<no_mpls_caps>\d+)$')
+        p32 = regex_engine.compile(r'^Total no MPLS caps\s+: (?P<no_mpls_caps>\d+)$')
 
         #   Total no IP address                 : 0
-        p33 = re.compile(r'^Total no IP address\s+: (?P<no_ip_address>\d+)$')
+        p33 = regex_engine.compile(r'^Total no IP address\s+: (?P<no_ip_address>\d+)$')
 
         #   Total other                         : 14
-        p34 = re.compile(r'^Total other\s+: (?P<other>\d+)$')
+        p34 = regex_engine.compile(r'^Total other\s+: (?P<other>\d+)$')
 
         # RX:
-        p35 = re.compile(r'^RX:$')
+        p35 = regex_engine.compile(r'^RX:$')
 
         #   Total negative delay                : 0
-        p36 = re.compile(r'^Total negative delay\s+: (?P<negative_delay>\d+)$')
+        p36 = regex_engine.compile(r'^Total negative delay\s+: (?P<negative_delay>\d+)$')
 
         #   Total delay threshold exceeded      : 0
-        p37 = re.compile(r'^Total delay threshold exceeded\s+: (?P<delay_threshold_exceeded>\d+)$')
+        p37 = regex_engine.compile(r'^Total delay threshold exceeded\s+: (?P<delay_threshold_exceeded>\d+)$')
 
         #   Total missing TX timestamp          : 0
-        p38 = re.compile(r'^Total missing TX timestamp\s+: (?P<missing_tx_timestamp>\d+)$')
+        p38 = regex_engine.compile(r'^Total missing TX timestamp\s+: (?P<missing_tx_timestamp>\d+)$')
 
         #   Total missing RX timestamp          : 0
-        p39 = re.compile(r'^Total missing RX timestamp\s+: (?P<missing_rx_timestamp>\d+)$')
+        p39 = regex_engine.compile(r'^Total missing RX timestamp\s+: (?P<missing_rx_timestamp>\d+)$')
 
         #   Total probe full                    : 0
-        p40 = re.compile(r'^Total probe full\s+: (?P<probe_full>\d+)$')
+        p40 = regex_engine.compile(r'^Total probe full\s+: (?P<probe_full>\d+)$')
 
         #   Total probe not started             : 0
-        p41 = re.compile(r'^Total probe not started\s+: (?P<probe_not_started>\d+)$')
+        p41 = regex_engine.compile(r'^Total probe not started\s+: (?P<probe_not_started>\d+)$')
 
         #   Total control code error            : 0
-        p42 = re.compile(r'^Total control code error\s+: (?P<control_code_error>\d+)$')
+        p42 = regex_engine.compile(r'^Total control code error\s+: (?P<control_code_error>\d+)$')
 
         #   Total control code notif            : 0
-        p43 = re.compile(r'^Total control code notif\s+: (?P<control_code_notif>\d+)$')
+        p43 = regex_engine.compile(r'^Total control code notif\s+: (?P<control_code_notif>\d+)$')
 
         # Querier RX queue:
-        p44 = re.compile(r'^(?P<q_or_p>\S+) (?P<type>\S+) queue:$')
+        p44 = regex_engine.compile(r'^(?P<q_or_p>\S+) (?P<type>\S+) queue:$')
 
         # Size                                   : 0
-        p45 = re.compile(r'^Size\s+: (?P<size>\d+)$')
+        p45 = regex_engine.compile(r'^Size\s+: (?P<size>\d+)$')
 
         # Enqueues                               : 5860
-        p46 = re.compile(r'^Enqueues\s+: (?P<enqueues>\d+)$')
+        p46 = regex_engine.compile(r'^Enqueues\s+: (?P<enqueues>\d+)$')
 
         # High water mark                        : 7
-        p47 = re.compile(r'^High water mark\s+: (?P<high_water_mark>\d+)$')
+        p47 = regex_engine.compile(r'^High water mark\s+: (?P<high_water_mark>\d+)$')
 
         # High water mark time                   : 19 1970 09:42:09.484
-        p48 = re.compile(r'^High water mark time\s+: (?P<high_water_mark_time>.+)$')
+        p48 = regex_engine.compile(r'^High water mark time\s+: (?P<high_water_mark_time>.+)$')
 
         # Max packets per burst                         : 2000
-        p49 = re.compile(r'^Max packets per burst\s+: (?P<max_packets_per_burst>\d+)$')
+        p49 = regex_engine.compile(r'^Max packets per burst\s+: (?P<max_packets_per_burst>\d+)$')
 
         # UDP Port GAL OOB IPV4                         : 63426
-        p50 = re.compile(r'^UDP Port (?P<type>.+\S)\s+: (?P<value>\d+)$')
+        p50 = regex_engine.compile(r'^UDP Port (?P<type>.+\S)\s+: (?P<value>\d+)$')
 
         # Last Error [Querier]:
-        p51 = re.compile(r'^Last Error \[(?P<err_type>\S+)\]:$')
+        p51 = regex_engine.compile(r'^Last Error \[(?P<err_type>\S+)\]:$')
 
         # Timestamp: 06:30:28  20 2021
-        p52 = re.compile(r'^Timestamp: (?P<timestamp>.+)$')
+        p52 = regex_engine.compile(r'^Timestamp: (?P<timestamp>.+)$')
 
         # Unknown destination address type 0.
-        p53 = re.compile(r'^(?P<info>.+)$')
+        p53 = regex_engine.compile(r'^(?P<info>.+)$')
 
         # Session ID: 2
-        p54 = re.compile(r'^Session ID: (?P<session_id>\d+)$')
+        p54 = regex_engine.compile(r'^Session ID: (?P<session_id>\d+)$')
 
         # PM RUNTIME
-        p55 = re.compile(r'^PM RUNTIME$')
+        p55 = regex_engine.compile(r'^PM RUNTIME$')
 
         # NAME                LAST        AVG         TOTAL               CNT         WRAPPED
-        p56 = re.compile(r'^NAME\s+LAST\s+AVG\s+TOTAL\s+CNT\s+WRAPPED$')
+        p56 = regex_engine.compile(r'^NAME\s+LAST\s+AVG\s+TOTAL\s+CNT\s+WRAPPED$')
 
         # CP PROBE START      34000       341861      44442000            130         0
-        p57 = re.compile(r'^(?P<name>.+)\s+(?P<last>\d+)\s+(?P<avg>\d+)\s+(?P<total>\d+)\s+(?P<cnt>\d+)\s+(?P<wrapped>\d+)$')
+        p57 = regex_engine.compile(r'^(?P<name>.+)\s+(?P<last>\d+)\s+(?P<avg>\d+)\s+(?P<total>\d+)\s+(?P<cnt>\d+)\s+(?P<wrapped>\d+)$')
 
         ret_dict = {}
         trans_type = err_type = ''
@@ -2917,34 +2919,34 @@ class ShowPerformanceMeasurementPaths(ShowPerformanceMeasurementPathsSchema):
             output = self.device.execute(self.cli_command)
 
         # Path name: Path-7
-        p1 = re.compile(r'^Path name:\s+(?P<path_name>(.+))$')
+        p1 = regex_engine.compile(r'^Path name:\s+(?P<path_name>(.+))$')
 
         #   Source                          : 1:2:3:3::1
-        p2 = re.compile(r'^Source\s+:\s+(?P<source>[\d\.:A-F]+)$')
+        p2 = regex_engine.compile(r'^Source\s+:\s+(?P<source>[\d\.:A-F]+)$')
 
         #   Endpoint                        : 1:1:1:7::1
-        p3 = re.compile(r'^Endpoint\s+:\s+(?P<endpoint>[\d\.:A-F]+)$')
+        p3 = regex_engine.compile(r'^Endpoint\s+:\s+(?P<endpoint>[\d\.:A-F]+)$')
 
         #   Next-Hop                        : 1:1:1:7::1
-        p4 = re.compile(r'^Next-Hop\s+:\s+(?P<next_hop>[\d\.:A-F]+)$')
+        p4 = regex_engine.compile(r'^Next-Hop\s+:\s+(?P<next_hop>[\d\.:A-F]+)$')
 
         #   Destination                     : 1:1:1:7::1
-        p5 = re.compile(r'^Destination\s+:\s+(?P<dest>[\d\.:A-F]+)$')
+        p5 = regex_engine.compile(r'^Destination\s+:\s+(?P<dest>[\d\.:A-F]+)$')
 
         #   SR Labels                       : 25, 17
-        p6 = re.compile(r'^SR Labels\s+:\s+(?P<sr_labels>([\d:A-F,\s]+))$')
+        p6 = regex_engine.compile(r'^SR Labels\s+:\s+(?P<sr_labels>([\d:A-F,\s]+))$')
 
         #   Outgoing Interface              : Ethernet1/2
-        p7 = re.compile(r'^Outgoing Interface\s+:\s+(?P<outgoing_intf>(\S+))$')
+        p7 = regex_engine.compile(r'^Outgoing Interface\s+:\s+(?P<outgoing_intf>(\S+))$')
 
         #   Backoff                         : 1
-        p8 = re.compile(r'^Backoff\s+:\s+(?P<backoff>(\d+))$')
+        p8 = regex_engine.compile(r'^Backoff\s+:\s+(?P<backoff>(\d+))$')
 
         #   Used Cnt                        : 1
-        p9 = re.compile(r'^Used Cnt\s+:\s+(?P<used_cnt>(\d+))$')
+        p9 = regex_engine.compile(r'^Used Cnt\s+:\s+(?P<used_cnt>(\d+))$')
 
         #   Cleanup (seconds)               : 3599
-        p10 = re.compile(r'^Cleanup \(seconds\)\s+:\s+(?P<cleanup>(\d+))$')
+        p10 = regex_engine.compile(r'^Cleanup \(seconds\)\s+:\s+(?P<cleanup>(\d+))$')
 
         # Init return dict
         ret_dict = {}
@@ -3368,173 +3370,173 @@ class ShowPerformanceMeasurementSrPolicy(ShowPerformanceMeasurementSrPolicySchem
             output = self.device.execute(cmd)
 
         # SR Policy name: Ethernet0/0
-        p1 = re.compile(r'^SR Policy name: (?P<sr_policy_name>\S+)$')
+        p1 = regex_engine.compile(r'^SR Policy name: (?P<sr_policy_name>\S+)$')
 
         # Color                           : 1235
-        p2 = re.compile(r'^Color\s+: (?P<color>\d+)$')
+        p2 = regex_engine.compile(r'^Color\s+: (?P<color>\d+)$')
 
         # Endpoint                        : 1.1.1.7
-        p3 = re.compile(r'^Endpoint\s+: (?P<endpoint>[\d\.:A-F]+)$')
+        p3 = regex_engine.compile(r'^Endpoint\s+: (?P<endpoint>[\d\.:A-F]+)$')
 
         # Source                          : 1.1.1.3
-        p4 = re.compile(r'^Source\s+: (?P<source>[\d\.:A-F]+)$')
+        p4 = regex_engine.compile(r'^Source\s+: (?P<source>[\d\.:A-F]+)$')
 
         # Profile name                    : Not configured
-        p5 = re.compile(r'^Profile name\s+: (?P<profile_name>.+)$')
+        p5 = regex_engine.compile(r'^Profile name\s+: (?P<profile_name>.+)$')
 
         # Policy Update Timestamp         : 05-20 06:46:52.222
-        p6 = re.compile(r'^Policy Update Timestamp\s+: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p6 = regex_engine.compile(r'^Policy Update Timestamp\s+: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         # Number of candidate-paths       : 1
-        p7 = re.compile(r'^Number of candidate-paths\s+: (?P<number_of_candidate_paths>\d+)$')
+        p7 = regex_engine.compile(r'^Number of candidate-paths\s+: (?P<number_of_candidate_paths>\d+)$')
 
         # Candidate-Path:
-        p8 = re.compile(r'^Candidate-Path:$')
+        p8 = regex_engine.compile(r'^Candidate-Path:$')
 
         # Preference                    : 100
-        p9 = re.compile(r'^Preference\s+: (?P<preference>\d+)$')
+        p9 = regex_engine.compile(r'^Preference\s+: (?P<preference>\d+)$')
 
         # Protocol-origin               : CLI
-        p10 = re.compile(r'^Protocol-origin\s+: (?P<protocol_origin>.+)$')
+        p10 = regex_engine.compile(r'^Protocol-origin\s+: (?P<protocol_origin>.+)$')
 
         # Discriminator                 : 0
-        p11 = re.compile(r'^Discriminator\s+: (?P<discriminator>\d+)$')
+        p11 = regex_engine.compile(r'^Discriminator\s+: (?P<discriminator>\d+)$')
 
         # Active:                       : No
-        p12 = re.compile(r'^Active:\s+: (?P<active>\S+)$')
+        p12 = regex_engine.compile(r'^Active:\s+: (?P<active>\S+)$')
 
         # Number of segment-lists       : 1
-        p13 = re.compile(r'^Number of segment-lists\s+: (?P<number_of_segment_lists>\d+)$')
+        p13 = regex_engine.compile(r'^Number of segment-lists\s+: (?P<number_of_segment_lists>\d+)$')
 
         # Number of atomic paths        : 1
-        p14 = re.compile(r'^Number of atomic paths\s+: (?P<number_of_atomic_paths>\d+)$')
+        p14 = regex_engine.compile(r'^Number of atomic paths\s+: (?P<number_of_atomic_paths>\d+)$')
 
         # Number of live UP atomic paths: 1
-        p15 = re.compile(r'^Number of live UP atomic paths:\s+(?P<number_of_live_up_atomic_paths>\d+)$')
+        p15 = regex_engine.compile(r'^Number of live UP atomic paths:\s+(?P<number_of_live_up_atomic_paths>\d+)$')
 
         # Number of live Unknown atomic : 1
-        p16 = re.compile(r'^Number of live Unknown atomic\s+: (?P<number_of_live_unknown_atomic>\d+)$')
+        p16 = regex_engine.compile(r'^Number of live Unknown atomic\s+: (?P<number_of_live_unknown_atomic>\d+)$')
 
         # Max Pkts per Burst            : 500
-        p17 = re.compile(r'^Max Pkts per Burst\s+: (?P<max_packets_per_burst>\d+)$')
+        p17 = regex_engine.compile(r'^Max Pkts per Burst\s+: (?P<max_packets_per_burst>\d+)$')
 
         # Max Pkts per Probe            : 15000
-        p18 = re.compile(r'^Max Pkts per Probe\s+: (?P<max_packets_per_probe>\d+)$')
+        p18 = regex_engine.compile(r'^Max Pkts per Probe\s+: (?P<max_packets_per_probe>\d+)$')
 
         # AP Min Run per Probe          : 3
-        p19 = re.compile(r'^AP Min Run per Probe\s+: (?P<ap_min_run_per_probe>\d+)$')
+        p19 = regex_engine.compile(r'^AP Min Run per Probe\s+: (?P<ap_min_run_per_probe>\d+)$')
 
         # Round-robin bursts            : 1
-        p20 = re.compile(r'^Round-robin bursts\s+: (?P<round_robin_bursts>\d+)$')
+        p20 = regex_engine.compile(r'^Round-robin bursts\s+: (?P<round_robin_bursts>\d+)$')
 
         # Round-robin probes            : 1
-        p21 = re.compile(r'^Round-robin probes\s+: (?P<round_robin_probes>\d+)$')
+        p21 = regex_engine.compile(r'^Round-robin probes\s+: (?P<round_robin_probes>\d+)$')
 
         # Last advertisement:
-        p22 = re.compile(r'^Last advertisement:$')
+        p22 = regex_engine.compile(r'^Last advertisement:$')
 
         # Advertised at: 09:06:42  20 2021 (92796 seconds ago)
-        p23 = re.compile(r'^Advertised at: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)\s+(?P<day>\d+)\s+(?P<year>\d+)\s+\((?P<seconds_ago>\d+) seconds ago\)$')
+        p23 = regex_engine.compile(r'^Advertised at: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)\s+(?P<day>\d+)\s+(?P<year>\d+)\s+\((?P<seconds_ago>\d+) seconds ago\)$')
 
         # Advertised delays (uSec): avg: 465, min: 1, max: 999, variance: 464
-        p24 = re.compile(r'^Advertised delays\s+\(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p24 = regex_engine.compile(r'^Advertised delays\s+\(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         # Next advertisement:
-        p25 = re.compile(r'^Next advertisement:$')
+        p25 = regex_engine.compile(r'^Next advertisement:$')
 
         # Check scheduled in 2 more probes (roughly every 120 seconds)
-        p26 = re.compile(r'^Check scheduled in (?P<probes>\d+) more probe\S* \(roughly every (?P<second>\d+) seconds\)$')
+        p26 = regex_engine.compile(r'^Check scheduled in (?P<probes>\d+) more probe\S* \(roughly every (?P<second>\d+) seconds\)$')
 
         # Aggregated delays (uSec): avg: 233, min: 1, max: 499, variance: 232
-        p27 = re.compile(r'^Aggregated delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p27 = regex_engine.compile(r'^Aggregated delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         # Last probe:
-        p28 = re.compile(r'^Last probe:$')
+        p28 = regex_engine.compile(r'^Last probe:$')
 
         # Packets Sent: 30, received: 30
-        p29 = re.compile(r'^Packets Sent: (?P<sent>\d+), received: (?P<received>\d+)$')
+        p29 = regex_engine.compile(r'^Packets Sent: (?P<sent>\d+), received: (?P<received>\d+)$')
 
         # Measured delays (uSec): avg: 233, min: 1, max: 499, variance: 232
-        p30 = re.compile(r'^Measured delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p30 = regex_engine.compile(r'^Measured delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         # Current probe:
-        p31 = re.compile(r'^Current probe:$')
+        p31 = regex_engine.compile(r'^Current probe:$')
 
         # Segment-List:
-        p32 = re.compile(r'^Segment-List:$')
+        p32 = regex_engine.compile(r'^Segment-List:$')
 
         # Name                        : SL7
-        p33 = re.compile(r'^Name\s+: (?P<name>\S+)$')
+        p33 = regex_engine.compile(r'^Name\s+: (?P<name>\S+)$')
 
         # Number of atomic paths      : 1
-        p34 = re.compile(r'^Number of atomic paths\s+: (?P<number_of_atomic_paths>\d+)$')
+        p34 = regex_engine.compile(r'^Number of atomic paths\s+: (?P<number_of_atomic_paths>\d+)$')
 
         # Atomic path:
-        p35 = re.compile(r'^Atomic path:$')
+        p35 = regex_engine.compile(r'^Atomic path:$')
 
         # Hops                      : 1.1.1.7
-        p36 = re.compile(r'^Hops\s+: (?P<hops>.+)$')
+        p36 = regex_engine.compile(r'^Hops\s+: (?P<hops>.+)$')
 
         # Labels                    : 16230
         # Labels                    : FCCC:CCC1:AA22:AA33:AA11:E003::
-        p37 = re.compile(r'^Labels\s+: (?P<labels>[\d:A-F,\s]+)$')
+        p37 = regex_engine.compile(r'^Labels\s+: (?P<labels>[\d:A-F,\s]+)$')
 
         # Outgoing Interface        : Ethernet0/1
-        p38 = re.compile(r'^Outgoing Interface\s+: (?P<outgoing_interface>\S+)$')
+        p38 = regex_engine.compile(r'^Outgoing Interface\s+: (?P<outgoing_interface>\S+)$')
 
         # Max IP MTU                : 1500
-        p39 = re.compile(r'^Max IP MTU\s+: (?P<max_ip_mtu>\d+)$')
+        p39 = regex_engine.compile(r'^Max IP MTU\s+: (?P<max_ip_mtu>\d+)$')
 
         # Next Hop                  : 110.1.1.4
-        p40 = re.compile(r'^Next Hop\s+: (?P<next_hop>[\d\.:A-F]+)$')
+        p40 = regex_engine.compile(r'^Next Hop\s+: (?P<next_hop>[\d\.:A-F]+)$')
 
         # Destination               : 1.1.1.7
-        p41 = re.compile(r'^Destination\s+: (?P<destination>[\d\.:A-F]+)$')
+        p41 = regex_engine.compile(r'^Destination\s+: (?P<destination>[\d\.:A-F]+)$')
 
         # Session ID                : 10
-        p42 = re.compile(r'^Session ID\s+: (?P<session_id>\d+)$')
+        p42 = regex_engine.compile(r'^Session ID\s+: (?P<session_id>\d+)$')
 
         # Advertised reason: Periodic timer, avg delay threshold crossed
-        p43 = re.compile(r'^Advertised reason: (?P<advertised_reason>.+)$')
+        p43 = regex_engine.compile(r'^Advertised reason: (?P<advertised_reason>.+)$')
 
         # Rolling average (uSec): 287
-        p44 = re.compile(r'^Rolling average \(uSec\): (?P<rolling_average>\d+)$')
+        p44 = regex_engine.compile(r'^Rolling average \(uSec\): (?P<rolling_average>\d+)$')
 
         # Probe samples:
-        p45 = re.compile(r'^Probe samples:$')
+        p45 = regex_engine.compile(r'^Probe samples:$')
 
         # Packet Rx Timestamp Measured Delay
-        p46 = re.compile(r'^Packet Rx Timestamp Measured Delay$')
+        p46 = regex_engine.compile(r'^Packet Rx Timestamp Measured Delay$')
 
         # 10:53:18  21 2021 0
-        p47 = re.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)\s+(?P<day>\d+)\s+(?P<year>\d+)\s+(?P<delay>\d+)$')
+        p47 = regex_engine.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)\s+(?P<day>\d+)\s+(?P<year>\d+)\s+(?P<delay>\d+)$')
 
         # Liveness Detection:
-        p48 = re.compile(r'^Liveness Detection:$')
+        p48 = regex_engine.compile(r'^Liveness Detection:$')
 
         # Session Creation Timestamp: 05-20 06:46:52.222
-        p49 = re.compile(r'^Session Creation Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p49 = regex_engine.compile(r'^Session Creation Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         # Session State: Up
-        p50 = re.compile(r'^Session State: (?P<session_state>\S+)$')
+        p50 = regex_engine.compile(r'^Session State: (?P<session_state>\S+)$')
 
         # Last State Change Timestamp: 05-20 06:46:52.414
-        p51 = re.compile(r'^Last State Change Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p51 = regex_engine.compile(r'^Last State Change Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         # Missed count   [consecutive]: 0
-        p52 = re.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
+        p52 = regex_engine.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
 
         # Received count [consecutive]: 101186
-        p53 = re.compile(r'^Received count \[consecutive\]: (?P<received_count>\d+)$')
+        p53 = regex_engine.compile(r'^Received count \[consecutive\]: (?P<received_count>\d+)$')
 
         # Backoff                     : 0
-        p54 = re.compile(r'^Backoff\s+: (?P<backoff>\d+)$')
+        p54 = regex_engine.compile(r'^Backoff\s+: (?P<backoff>\d+)$')
 
         # Unique Path Name            : Path-10
-        p55 = re.compile(r'^Unique Path Name\s+: (?P<unique_path_name>\S+)$')
+        p55 = regex_engine.compile(r'^Unique Path Name\s+: (?P<unique_path_name>\S+)$')
 
         # Loss in Last Interval       : 0 % [TX: 6 RX: 6]
-        p56 = re.compile(r'^Loss in Last Interval\s+: (?P<percent>\d+) % \[TX: (?P<tx>\d+) RX: (?P<rx>\d+)\]$')
+        p56 = regex_engine.compile(r'^Loss in Last Interval\s+: (?P<percent>\d+) % \[TX: (?P<tx>\d+) RX: (?P<rx>\d+)\]$')
 
         ret_dict = {}
         sr_pol = ''
@@ -3978,7 +3980,7 @@ class ShowPerformanceMeasurementSrPolicy(ShowPerformanceMeasurementSrPolicySchem
                 continue
 
             # Missed count   [consecutive]: 0
-            p52 = re.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
+            p52 = regex_engine.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
             m = p52.match(line)
             if m:
                 group = m.groupdict()
@@ -4340,168 +4342,168 @@ class ShowPerformanceMeasurementInterfaces(ShowPerformanceMeasurementInterfacesS
             output = self.device.execute(cmd)
 
         # Interface Name: Ethernet0/0 (ifh: 0x2)
-        p1 = re.compile(r'^Interface Name: (?P<interface_name>\S+) \(ifh: (?P<ifh>\S+)\)$')
+        p1 = regex_engine.compile(r'^Interface Name: (?P<interface_name>\S+) \(ifh: (?P<ifh>\S+)\)$')
 
         # Delay-Measurement           : Enabled
-        p2 = re.compile(r'^Delay-Measurement\s+: (?P<delay_measurement_enabled>\S+)$')
+        p2 = regex_engine.compile(r'^Delay-Measurement\s+: (?P<delay_measurement_enabled>\S+)$')
 
         # Loss-Measurement            : Disabled
-        p3 = re.compile(r'^Loss-Measurement\s+: (?P<loss_measurement_enabled>\S+)$')
+        p3 = regex_engine.compile(r'^Loss-Measurement\s+: (?P<loss_measurement_enabled>\S+)$')
 
         # Local IPV4 Address          : 19.1.1.3
-        p4 = re.compile(r'^Local IPV4 Address\s+: (?P<local_ipv4_address>[\d\.]+)$')
+        p4 = regex_engine.compile(r'^Local IPV4 Address\s+: (?P<local_ipv4_address>[\d\.]+)$')
 
         # Local IPV6 Address          : ::
-        p5 = re.compile(r'^Local IPV6 Address\s+: (?P<local_ipv6_address>[\d:A-F]+)$')
+        p5 = regex_engine.compile(r'^Local IPV6 Address\s+: (?P<local_ipv6_address>[\d:A-F]+)$')
 
         # State                       : Up
-        p6 = re.compile(r'^State\s+: (?P<state>\S+)$')
+        p6 = regex_engine.compile(r'^State\s+: (?P<state>\S+)$')
 
         # MPLS Caps                   : Not created
-        p7 = re.compile(r'^MPLS Caps\s+: (?P<mpls_caps>.+)$')
+        p7 = regex_engine.compile(r'^MPLS Caps\s+: (?P<mpls_caps>.+)$')
 
         # Delay Measurement session:
-        p8 = re.compile(r'^Delay Measurement session:$')
+        p8 = regex_engine.compile(r'^Delay Measurement session:$')
 
         #     Session ID                : 1
-        p9 = re.compile(r'^Session ID\s+: (?P<session_id>\d+)$')
+        p9 = regex_engine.compile(r'^Session ID\s+: (?P<session_id>\d+)$')
 
         #     Profile name              : Not configured
-        p10 = re.compile(r'^Profile name\s+: (?P<profile_name>.+)$')
+        p10 = regex_engine.compile(r'^Profile name\s+: (?P<profile_name>.+)$')
 
         #     Last advertisement:
-        p11 = re.compile(r'^Last advertisement:$')
+        p11 = regex_engine.compile(r'^Last advertisement:$')
 
         #     No advertisements have occured
-        p12 = re.compile(r'^No advertisements have occured$')
+        p12 = regex_engine.compile(r'^No advertisements have occured$')
 
         #     Next advertisement:
-        p13 = re.compile(r'^Next advertisement:$')
+        p13 = regex_engine.compile(r'^Next advertisement:$')
 
         #     Check scheduled in 2 more probes (roughly every 120 seconds)
-        p14 = re.compile(r'^Check scheduled in (?P<in_n_more_probes>\d+) more probes \(roughly every (?P<check_scheduled>\d+) seconds\)$')
+        p14 = regex_engine.compile(r'^Check scheduled in (?P<in_n_more_probes>\d+) more probes \(roughly every (?P<check_scheduled>\d+) seconds\)$')
 
         #     No probes completed
-        p15 = re.compile(r'^No probes completed$')
+        p15 = regex_engine.compile(r'^No probes completed$')
 
         #     Last Error:
-        p16 = re.compile(r'^Last Error:$')
+        p16 = regex_engine.compile(r'^Last Error:$')
 
         #     Timestamp: 13:11:32 10-18 2021
-        p17 = re.compile(r'^Timestamp: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)$')
+        p17 = regex_engine.compile(r'^Timestamp: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)$')
 
         #     0 0 packet sent error. INVALID_OUT_IF
-        p18 = re.compile(r'^(?P<error>.+)$')
+        p18 = regex_engine.compile(r'^(?P<error>.+)$')
 
         #     Current Probe:
-        p19 = re.compile(r'^Current Probe:$')
+        p19 = regex_engine.compile(r'^Current Probe:$')
 
         #     Started at 13:11:17 10-18 2021 (16 seconds ago)
-        p20 = re.compile(r'^Started at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
+        p20 = regex_engine.compile(r'^Started at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
 
         #     Packets Sent: 6, received: 0
-        p21 = re.compile(r'^Packets Sent: (?P<packets_sent>\d+), received: (?P<packets_received>\d+)$')
+        p21 = regex_engine.compile(r'^Packets Sent: (?P<packets_sent>\d+), received: (?P<packets_received>\d+)$')
 
         #     Measured delays (uSec): avg: 0, min: 0, max: 0, variance: 0
-        p22 = re.compile(r'^Measured delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p22 = regex_engine.compile(r'^Measured delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         #     Probe samples:
-        p23 = re.compile(r'^Probe samples:$')
+        p23 = regex_engine.compile(r'^Probe samples:$')
 
         #         No History
-        p24 = re.compile(r'^No History$')
+        p24 = regex_engine.compile(r'^No History$')
 
         #     Next probe scheduled at 13:11:47 10-18 2021 (in 14 seconds)
-        p25 = re.compile(r'^Next probe scheduled at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \(in (?P<remaining_seconds>\d+) seconds\)$')
+        p25 = regex_engine.compile(r'^Next probe scheduled at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \(in (?P<remaining_seconds>\d+) seconds\)$')
 
         #     Next burst packet will be sent in 2 seconds
-        p26 = re.compile(r'^Next burst packet will be sent in (?P<next_burst_packet>\d+) seconds$')
+        p26 = regex_engine.compile(r'^Next burst packet will be sent in (?P<next_burst_packet>\d+) seconds$')
 
         #       Not running: Platform not supported
-        p27 = re.compile(r'^Not running: (?P<not_running_info>.+)$')
+        p27 = regex_engine.compile(r'^Not running: (?P<not_running_info>.+)$')
 
         #     Liveness Detection:
-        p28 = re.compile(r'^Liveness Detection:$')
+        p28 = regex_engine.compile(r'^Liveness Detection:$')
 
         #     Session Creation Timestamp: 10-18 12:56:46.731
-        p29 = re.compile(r'Session Creation Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p29 = regex_engine.compile(r'Session Creation Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         #     Session State: Down
-        p30 = re.compile(r'^Session State: (?P<session_state>\S+)$')
+        p30 = regex_engine.compile(r'^Session State: (?P<session_state>\S+)$')
 
         #     Last State Change Timestamp: 10-18 12:58:47.578
-        p31 = re.compile(r'^Last State Change Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p31 = regex_engine.compile(r'^Last State Change Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         #     Missed count   [consecutive]: 296
-        p32 = re.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
+        p32 = regex_engine.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
 
         #     Received count [consecutive]: 0
-        p33 = re.compile(r'^Received count\s+\[consecutive\]: (?P<received_count>\d+)$')
+        p33 = regex_engine.compile(r'^Received count\s+\[consecutive\]: (?P<received_count>\d+)$')
 
         #     Backoff                     : 1
-        p34 = re.compile(r'^Backoff\s+: (?P<backoff>\d+)$')
+        p34 = regex_engine.compile(r'^Backoff\s+: (?P<backoff>\d+)$')
 
         #     Unique Path Name            : Path-1
-        p35 = re.compile(r'^Unique Path Name\s+: (?P<unique_path_name>.+)$')
+        p35 = regex_engine.compile(r'^Unique Path Name\s+: (?P<unique_path_name>.+)$')
 
         #     Loss in Last Interval       : 100 % [TX: 6 RX: 0]
-        p36 = re.compile(r'^Loss in Last Interval\s+: (?P<percent>\d+) % \[TX: (?P<tx>\d+) RX: (?P<rx>\d+)\]$')
+        p36 = regex_engine.compile(r'^Loss in Last Interval\s+: (?P<percent>\d+) % \[TX: (?P<tx>\d+) RX: (?P<rx>\d+)\]$')
 
         #     Advertised at: 05:15:42 11-02 2021 (4901 seconds ago)
-        p37 = re.compile(r'^Advertised at: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
+        p37 = regex_engine.compile(r'^Advertised at: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
 
         #     Advertised reason: First advertisement
-        p38 = re.compile(r'^Advertised reason: (?P<advertised_reason>.+)$')
+        p38 = regex_engine.compile(r'^Advertised reason: (?P<advertised_reason>.+)$')
 
         #     Advertised anomaly: INACTIVE
-        p39 = re.compile(r'^Advertised anomaly: (?P<advertised_anomaly>.+)$')
+        p39 = regex_engine.compile(r'^Advertised anomaly: (?P<advertised_anomaly>.+)$')
 
         #     Advertised delays (uSec): avg: 752, min: 575, max: 947, variance: 99
-        p40 = re.compile(r'^Advertised delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p40 = regex_engine.compile(r'^Advertised delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         #     Check scheduled at the end of the current probe (roughly every 120 seconds)
-        p41 = re.compile(r'^Check scheduled at the end of the current probe \(roughly every (?P<check_scheduled>\d+) seconds\)$')
+        p41 = regex_engine.compile(r'^Check scheduled at the end of the current probe \(roughly every (?P<check_scheduled>\d+) seconds\)$')
 
         #     Aggregated delays (uSec): avg: 383, min: 313, max: 499, variance: 51
-        p42 = re.compile(r'^Aggregated delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p42 = regex_engine.compile(r'^Aggregated delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         #     Rolling average (uSec): 395
-        p43 = re.compile(r'^Rolling average \(uSec\): (?P<rolling_average>\d+)$')
+        p43 = regex_engine.compile(r'^Rolling average \(uSec\): (?P<rolling_average>\d+)$')
 
         #     Probe samples:
-        p44 = re.compile(r'^Probe samples:$')
+        p44 = regex_engine.compile(r'^Probe samples:$')
 
         #     Packet Rx Timestamp       Measured Delay (nsec)
-        p45 = re.compile(r'^Packet Rx Timestamp\s+Measured Delay \(nsec\)$')
+        p45 = regex_engine.compile(r'^Packet Rx Timestamp\s+Measured Delay \(nsec\)$')
 
         #     06:37:21 11-02 2021       432500
-        p46 = re.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<measured_delay>\d+)$')
+        p46 = regex_engine.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<measured_delay>\d+)$')
 
         #     Burst completed
-        p47 = re.compile(r'^Burst completed$')
+        p47 = regex_engine.compile(r'^Burst completed$')
 
         # Loss Measurement session:
-        p48 = re.compile(r'^Loss Measurement session:$')
+        p48 = regex_engine.compile(r'^Loss Measurement session:$')
 
         #     Advertised loss(%) [Capped @ 50.331642%]: avg: 0.000000, min: 0.000000, max: 0.000000, variance: 0.000000
-        p49 = re.compile(r'^Advertised loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
+        p49 = regex_engine.compile(r'^Advertised loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
 
         #     Aggregated loss(%) [Capped @ 50.331642%]: avg: 0.000000, min: 0.000000, max: 0.000000, variance: 0.000000
-        p50 = re.compile(r'^Aggregated loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
+        p50 = regex_engine.compile(r'^Aggregated loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
 
         #     Rolling average (%): 0.000000
-        p51 = re.compile(r'^Rolling average \(%\): (?P<rolling_average>\d*\.\d+)$')
+        p51 = regex_engine.compile(r'^Rolling average \(%\): (?P<rolling_average>\d*\.\d+)$')
 
         #     Measured loss(%) [Capped @ 50.331642%]: avg: 0.000000, min: 0.000000, max: 0.000000, variance: 0.000000
-        p52 = re.compile(r'^Measured loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
+        p52 = regex_engine.compile(r'^Measured loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
 
         #         Rx Timestamp              Last TX    TX         Last RX    RX         Loss(0-100%)
         #         Rx Timestamp              Last TX    TX         Last RX    RX         Col  Loss(0-100%)
-        p53 = re.compile(r'^Rx Timestamp\s+Last TX\s+TX\s+Last RX\s+RX\s+(Col\s+)?Loss\(0-100%\)$')
+        p53 = regex_engine.compile(r'^Rx Timestamp\s+Last TX\s+TX\s+Last RX\s+RX\s+(Col\s+)?Loss\(0-100%\)$')
 
         #         13:11:32 10-18 2021       56         57         57         58         0.000000
         #         13:11:32 10-18 2021       56         57         57         58         1 0.000000
-        p54 = re.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<tx0>\d+)\s+(?P<tx1>\d+)\s+(?P<rx0>\d+)\s+(?P<rx1>\d+)\s+((?P<co>\d+)\s+)?(?P<loss>\d*\.\d+)$')
+        p54 = regex_engine.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<tx0>\d+)\s+(?P<tx1>\d+)\s+(?P<rx0>\d+)\s+(?P<rx1>\d+)\s+((?P<co>\d+)\s+)?(?P<loss>\d*\.\d+)$')
 
         ret_dict = {}
         intf_name = ''
@@ -5324,168 +5326,168 @@ class ShowPerformanceMeasurementInterfaces(ShowPerformanceMeasurementInterfacesS
             output = self.device.execute(cmd)
 
         # Interface Name: Ethernet0/0 (ifh: 0x2)
-        p1 = re.compile(r'^Interface Name: (?P<interface_name>\S+) \(ifh: (?P<ifh>\S+)\)$')
+        p1 = regex_engine.compile(r'^Interface Name: (?P<interface_name>\S+) \(ifh: (?P<ifh>\S+)\)$')
 
         # Delay-Measurement           : Enabled
-        p2 = re.compile(r'^Delay-Measurement\s+: (?P<delay_measurement_enabled>\S+)$')
+        p2 = regex_engine.compile(r'^Delay-Measurement\s+: (?P<delay_measurement_enabled>\S+)$')
 
         # Loss-Measurement            : Disabled
-        p3 = re.compile(r'^Loss-Measurement\s+: (?P<loss_measurement_enabled>\S+)$')
+        p3 = regex_engine.compile(r'^Loss-Measurement\s+: (?P<loss_measurement_enabled>\S+)$')
 
         # Local IPV4 Address          : 19.1.1.3
-        p4 = re.compile(r'^Local IPV4 Address\s+: (?P<local_ipv4_address>[\d\.]+)$')
+        p4 = regex_engine.compile(r'^Local IPV4 Address\s+: (?P<local_ipv4_address>[\d\.]+)$')
 
         # Local IPV6 Address          : ::
-        p5 = re.compile(r'^Local IPV6 Address\s+: (?P<local_ipv6_address>[\d:A-F]+)$')
+        p5 = regex_engine.compile(r'^Local IPV6 Address\s+: (?P<local_ipv6_address>[\d:A-F]+)$')
 
         # State                       : Up
-        p6 = re.compile(r'^State\s+: (?P<state>\S+)$')
+        p6 = regex_engine.compile(r'^State\s+: (?P<state>\S+)$')
 
         # MPLS Caps                   : Not created
-        p7 = re.compile(r'^MPLS Caps\s+: (?P<mpls_caps>.+)$')
+        p7 = regex_engine.compile(r'^MPLS Caps\s+: (?P<mpls_caps>.+)$')
 
         # Delay Measurement session:
-        p8 = re.compile(r'^Delay Measurement session:$')
+        p8 = regex_engine.compile(r'^Delay Measurement session:$')
 
         #     Session ID                : 1
-        p9 = re.compile(r'^Session ID\s+: (?P<session_id>\d+)$')
+        p9 = regex_engine.compile(r'^Session ID\s+: (?P<session_id>\d+)$')
 
         #     Profile name              : Not configured
-        p10 = re.compile(r'^Profile name\s+: (?P<profile_name>.+)$')
+        p10 = regex_engine.compile(r'^Profile name\s+: (?P<profile_name>.+)$')
 
         #     Last advertisement:
-        p11 = re.compile(r'^Last advertisement:$')
+        p11 = regex_engine.compile(r'^Last advertisement:$')
 
         #     No advertisements have occured
-        p12 = re.compile(r'^No advertisements have occured$')
+        p12 = regex_engine.compile(r'^No advertisements have occured$')
 
         #     Next advertisement:
-        p13 = re.compile(r'^Next advertisement:$')
+        p13 = regex_engine.compile(r'^Next advertisement:$')
 
         #     Check scheduled in 2 more probes (roughly every 120 seconds)
-        p14 = re.compile(r'^Check scheduled in (?P<in_n_more_probes>\d+) more probes \(roughly every (?P<check_scheduled>\d+) seconds\)$')
+        p14 = regex_engine.compile(r'^Check scheduled in (?P<in_n_more_probes>\d+) more probes \(roughly every (?P<check_scheduled>\d+) seconds\)$')
 
         #     No probes completed
-        p15 = re.compile(r'^No probes completed$')
+        p15 = regex_engine.compile(r'^No probes completed$')
 
         #     Last Error:
-        p16 = re.compile(r'^Last Error:$')
+        p16 = regex_engine.compile(r'^Last Error:$')
 
         #     Timestamp: 13:11:32 10-18 2021
-        p17 = re.compile(r'^Timestamp: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)$')
+        p17 = regex_engine.compile(r'^Timestamp: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)$')
 
         #     0 0 packet sent error. INVALID_OUT_IF
-        p18 = re.compile(r'^(?P<error>.+)$')
+        p18 = regex_engine.compile(r'^(?P<error>.+)$')
 
         #     Current Probe:
-        p19 = re.compile(r'^Current Probe:$')
+        p19 = regex_engine.compile(r'^Current Probe:$')
 
         #     Started at 13:11:17 10-18 2021 (16 seconds ago)
-        p20 = re.compile(r'^Started at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
+        p20 = regex_engine.compile(r'^Started at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
 
         #     Packets Sent: 6, received: 0
-        p21 = re.compile(r'^Packets Sent: (?P<packets_sent>\d+), received: (?P<packets_received>\d+)$')
+        p21 = regex_engine.compile(r'^Packets Sent: (?P<packets_sent>\d+), received: (?P<packets_received>\d+)$')
 
         #     Measured delays (uSec): avg: 0, min: 0, max: 0, variance: 0
-        p22 = re.compile(r'^Measured delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p22 = regex_engine.compile(r'^Measured delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         #     Probe samples:
-        p23 = re.compile(r'^Probe samples:$')
+        p23 = regex_engine.compile(r'^Probe samples:$')
 
         #         No History
-        p24 = re.compile(r'^No History$')
+        p24 = regex_engine.compile(r'^No History$')
 
         #     Next probe scheduled at 13:11:47 10-18 2021 (in 14 seconds)
-        p25 = re.compile(r'^Next probe scheduled at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \(in (?P<remaining_seconds>\d+) seconds\)$')
+        p25 = regex_engine.compile(r'^Next probe scheduled at (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \(in (?P<remaining_seconds>\d+) seconds\)$')
 
         #     Next burst packet will be sent in 2 seconds
-        p26 = re.compile(r'^Next burst packet will be sent in (?P<next_burst_packet>\d+) seconds$')
+        p26 = regex_engine.compile(r'^Next burst packet will be sent in (?P<next_burst_packet>\d+) seconds$')
 
         #       Not running: Platform not supported
-        p27 = re.compile(r'^Not running: (?P<not_running_info>.+)$')
+        p27 = regex_engine.compile(r'^Not running: (?P<not_running_info>.+)$')
 
         #     Liveness Detection:
-        p28 = re.compile(r'^Liveness Detection:$')
+        p28 = regex_engine.compile(r'^Liveness Detection:$')
 
         #     Session Creation Timestamp: 10-18 12:56:46.731
-        p29 = re.compile(r'Session Creation Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p29 = regex_engine.compile(r'Session Creation Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         #     Session State: Down
-        p30 = re.compile(r'^Session State: (?P<session_state>\S+)$')
+        p30 = regex_engine.compile(r'^Session State: (?P<session_state>\S+)$')
 
         #     Last State Change Timestamp: 10-18 12:58:47.578
-        p31 = re.compile(r'^Last State Change Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
+        p31 = regex_engine.compile(r'^Last State Change Timestamp: (?P<month>\d+)-(?P<day>\d+) (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d*\.\d+)$')
 
         #     Missed count   [consecutive]: 296
-        p32 = re.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
+        p32 = regex_engine.compile(r'^Missed count\s+\[consecutive\]: (?P<missed_count>\d+)$')
 
         #     Received count [consecutive]: 0
-        p33 = re.compile(r'^Received count\s+\[consecutive\]: (?P<received_count>\d+)$')
+        p33 = regex_engine.compile(r'^Received count\s+\[consecutive\]: (?P<received_count>\d+)$')
 
         #     Backoff                     : 1
-        p34 = re.compile(r'^Backoff\s+: (?P<backoff>\d+)$')
+        p34 = regex_engine.compile(r'^Backoff\s+: (?P<backoff>\d+)$')
 
         #     Unique Path Name            : Path-1
-        p35 = re.compile(r'^Unique Path Name\s+: (?P<unique_path_name>.+)$')
+        p35 = regex_engine.compile(r'^Unique Path Name\s+: (?P<unique_path_name>.+)$')
 
         #     Loss in Last Interval       : 100 % [TX: 6 RX: 0]
-        p36 = re.compile(r'^Loss in Last Interval\s+: (?P<percent>\d+) % \[TX: (?P<tx>\d+) RX: (?P<rx>\d+)\]$')
+        p36 = regex_engine.compile(r'^Loss in Last Interval\s+: (?P<percent>\d+) % \[TX: (?P<tx>\d+) RX: (?P<rx>\d+)\]$')
 
         #     Advertised at: 05:15:42 11-02 2021 (4901 seconds ago)
-        p37 = re.compile(r'^Advertised at: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
+        p37 = regex_engine.compile(r'^Advertised at: (?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+) \((?P<seconds_ago>\d+) seconds ago\)$')
 
         #     Advertised reason: First advertisement
-        p38 = re.compile(r'^Advertised reason: (?P<advertised_reason>.+)$')
+        p38 = regex_engine.compile(r'^Advertised reason: (?P<advertised_reason>.+)$')
 
         #     Advertised anomaly: INACTIVE
-        p39 = re.compile(r'^Advertised anomaly: (?P<advertised_anomaly>.+)$')
+        p39 = regex_engine.compile(r'^Advertised anomaly: (?P<advertised_anomaly>.+)$')
 
         #     Advertised delays (uSec): avg: 752, min: 575, max: 947, variance: 99
-        p40 = re.compile(r'^Advertised delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p40 = regex_engine.compile(r'^Advertised delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         #     Check scheduled at the end of the current probe (roughly every 120 seconds)
-        p41 = re.compile(r'^Check scheduled at the end of the current probe \(roughly every (?P<check_scheduled>\d+) seconds\)$')
+        p41 = regex_engine.compile(r'^Check scheduled at the end of the current probe \(roughly every (?P<check_scheduled>\d+) seconds\)$')
 
         #     Aggregated delays (uSec): avg: 383, min: 313, max: 499, variance: 51
-        p42 = re.compile(r'^Aggregated delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
+        p42 = regex_engine.compile(r'^Aggregated delays \(uSec\): avg: (?P<average>\d+), min: (?P<minimum>\d+), max: (?P<maximum>\d+), variance: (?P<variance>\d+)$')
 
         #     Rolling average (uSec): 395
-        p43 = re.compile(r'^Rolling average \(uSec\): (?P<rolling_average>\d+)$')
+        p43 = regex_engine.compile(r'^Rolling average \(uSec\): (?P<rolling_average>\d+)$')
 
         #     Probe samples:
-        p44 = re.compile(r'^Probe samples:$')
+        p44 = regex_engine.compile(r'^Probe samples:$')
 
         #     Packet Rx Timestamp       Measured Delay (nsec)
-        p45 = re.compile(r'^Packet Rx Timestamp\s+Measured Delay \(nsec\)$')
+        p45 = regex_engine.compile(r'^Packet Rx Timestamp\s+Measured Delay \(nsec\)$')
 
         #     06:37:21 11-02 2021       432500
-        p46 = re.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<measured_delay>\d+)$')
+        p46 = regex_engine.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<measured_delay>\d+)$')
 
         #     Burst completed
-        p47 = re.compile(r'^Burst completed$')
+        p47 = regex_engine.compile(r'^Burst completed$')
 
         # Loss Measurement session:
-        p48 = re.compile(r'^Loss Measurement session:$')
+        p48 = regex_engine.compile(r'^Loss Measurement session:$')
 
         #     Advertised loss(%) [Capped @ 50.331642%]: avg: 0.000000, min: 0.000000, max: 0.000000, variance: 0.000000
-        p49 = re.compile(r'^Advertised loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
+        p49 = regex_engine.compile(r'^Advertised loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
 
         #     Aggregated loss(%) [Capped @ 50.331642%]: avg: 0.000000, min: 0.000000, max: 0.000000, variance: 0.000000
-        p50 = re.compile(r'^Aggregated loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
+        p50 = regex_engine.compile(r'^Aggregated loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
 
         #     Rolling average (%): 0.000000
-        p51 = re.compile(r'^Rolling average \(%\): (?P<rolling_average>\d*\.\d+)$')
+        p51 = regex_engine.compile(r'^Rolling average \(%\): (?P<rolling_average>\d*\.\d+)$')
 
         #     Measured loss(%) [Capped @ 50.331642%]: avg: 0.000000, min: 0.000000, max: 0.000000, variance: 0.000000
-        p52 = re.compile(r'^Measured loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
+        p52 = regex_engine.compile(r'^Measured loss\(%\) \[Capped @ (?P<capped>\d*\.\d+)%\]: avg: (?P<average>\d*\.\d+), min: (?P<minimum>\d*\.\d+), max: (?P<maximum>\d*\.\d+), variance: (?P<variance>\d*\.\d+)$')
 
         #         Rx Timestamp              Last TX    TX         Last RX    RX         Loss(0-100%)
         #         Rx Timestamp              Last TX    TX         Last RX    RX         Col  Loss(0-100%)
-        p53 = re.compile(r'^Rx Timestamp\s+Last TX\s+TX\s+Last RX\s+RX\s+(Col\s+)?Loss\(0-100%\)$')
+        p53 = regex_engine.compile(r'^Rx Timestamp\s+Last TX\s+TX\s+Last RX\s+RX\s+(Col\s+)?Loss\(0-100%\)$')
 
         #         13:11:32 10-18 2021       56         57         57         58         0.000000
         #         13:11:32 10-18 2021       56         57         57         58         1 0.000000
-        p54 = re.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<tx0>\d+)\s+(?P<tx1>\d+)\s+(?P<rx0>\d+)\s+(?P<rx1>\d+)\s+((?P<co>\d+)\s+)?(?P<loss>\d*\.\d+)$')
+        p54 = regex_engine.compile(r'^(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+) (?P<month>\d+)-(?P<day>\d+) (?P<year>\d+)\s+(?P<tx0>\d+)\s+(?P<tx1>\d+)\s+(?P<rx0>\d+)\s+(?P<rx1>\d+)\s+((?P<co>\d+)\s+)?(?P<loss>\d*\.\d+)$')
 
         ret_dict = {}
         intf_name = ''
@@ -6036,31 +6038,31 @@ class ShowPerformanceMeasurementResponderInterfaces(ShowPerformanceMeasurementRe
             output = self.device.execute(cmd)
 
         # Interface Name: Ethernet0/1
-        p1 = re.compile(r'^Interface Name: (?P<interface_name>\S+)$')
+        p1 = regex_engine.compile(r'^Interface Name: (?P<interface_name>\S+)$')
 
         # Interface Handle        : 0x3
-        p2 = re.compile(r'^Interface Handle\s+: (?P<interface_handle>\S+)$')
+        p2 = regex_engine.compile(r'^Interface Handle\s+: (?P<interface_handle>\S+)$')
 
         # Local IPV4 Address      : 110.1.1.3
-        p3 = re.compile(r'^Local IPV4 Address\s+: (?P<local_ipv4_address>[\d\.]+)$')
+        p3 = regex_engine.compile(r'^Local IPV4 Address\s+: (?P<local_ipv4_address>[\d\.]+)$')
 
         # Local IPV6 Address      : ::
-        p4 = re.compile(r'^Local IPV6 Address\s+: (?P<local_ipv6_address>[\d:A-F]+)$')
+        p4 = regex_engine.compile(r'^Local IPV6 Address\s+: (?P<local_ipv6_address>[\d:A-F]+)$')
 
         # Current rate            : 0 pkts/sec
-        p5 = re.compile(r'^Current rate\s+: (?P<current_rate>\d+) pkts/sec$')
+        p5 = regex_engine.compile(r'^Current rate\s+: (?P<current_rate>\d+) pkts/sec$')
 
         # Rate high water mark    : 0 pkts/sec
-        p6 = re.compile(r'^Rate high water mark\s+: (?P<rate_high_watermark>\d+) pkts/sec$')
+        p6 = regex_engine.compile(r'^Rate high water mark\s+: (?P<rate_high_watermark>\d+) pkts/sec$')
 
         # Cleanup time remaining  : 3599 sec
-        p7 = re.compile(r'^Cleanup time remaining\s+: (?P<cleanup_time_remaining>\d+) sec$')
+        p7 = regex_engine.compile(r'^Cleanup time remaining\s+: (?P<cleanup_time_remaining>\d+) sec$')
 
         # Loss color type         : dual-color gre
-        p8 = re.compile(r'^Loss color type\s+: (?P<loss_color_type>.+)$')
+        p8 = regex_engine.compile(r'^Loss color type\s+: (?P<loss_color_type>.+)$')
 
         # Loss color inact remain : 1006 sec
-        p9 = re.compile(r'^Loss color inact remain\s+: (?P<loss_color_inact_remain>\d+) sec$')
+        p9 = regex_engine.compile(r'^Loss color inact remain\s+: (?P<loss_color_inact_remain>\d+) sec$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -6187,46 +6189,46 @@ class ShowPerformanceMeasurementResponderCounters(ShowPerformanceMeasurementResp
 
 
         # Interface Name: Ethernet0/1
-        p1 = re.compile(r'^Interface Name: (?P<interface_name>\S+)$')
+        p1 = regex_engine.compile(r'^Interface Name: (?P<interface_name>\S+)$')
 
         #     Total query packets received                  : 23304
-        p2 = re.compile(r'^Total query packets received\s+: (?P<total_query_packets_received>\d+)$')
+        p2 = regex_engine.compile(r'^Total query packets received\s+: (?P<total_query_packets_received>\d+)$')
 
         #     Total reply packets sent                      : 23302
-        p3 = re.compile(r'^Total reply packets sent\s+: (?P<total_reply_packets_sent>\d+)$')
+        p3 = regex_engine.compile(r'^Total reply packets sent\s+: (?P<total_reply_packets_sent>\d+)$')
 
         #     Total reply packets sent errors               : 2
-        p4 = re.compile(r'^Total reply packets sent errors\s+: (?P<total_reply_packets_sent_errors>\d+)$')
+        p4 = regex_engine.compile(r'^Total reply packets sent errors\s+: (?P<total_reply_packets_sent_errors>\d+)$')
 
         #     Total URO TLV not present errors              : 0
-        p5 = re.compile(r'^Total URO TLV not present errors\s+: (?P<total_uro_tlv_not_present_errors>\d+)$')
+        p5 = regex_engine.compile(r'^Total URO TLV not present errors\s+: (?P<total_uro_tlv_not_present_errors>\d+)$')
 
         #     Total invalid port number errors              : 0
-        p6 = re.compile(r'^Total invalid port number errors\s+: (?P<total_invalid_port_number_errors>\d+)$')
+        p6 = regex_engine.compile(r'^Total invalid port number errors\s+: (?P<total_invalid_port_number_errors>\d+)$')
 
         #     Total no source address errors                : 0
-        p7 = re.compile(r'^Total no source address errors\s+: (?P<total_no_source_address_errors>\d+)$')
+        p7 = regex_engine.compile(r'^Total no source address errors\s+: (?P<total_no_source_address_errors>\d+)$')
 
         #     Total no return path errors                   : 0
-        p8 = re.compile(r'^Total no return path errors\s+: (?P<total_no_return_path_errors>\d+)$')
+        p8 = regex_engine.compile(r'^Total no return path errors\s+: (?P<total_no_return_path_errors>\d+)$')
 
         #     Total unsupported querier control code errors : 0
-        p9 = re.compile(r'^Total unsupported querier control code errors\s+: (?P<total_unsupported_querier_control_code_errors>\d+)$')
+        p9 = regex_engine.compile(r'^Total unsupported querier control code errors\s+: (?P<total_unsupported_querier_control_code_errors>\d+)$')
 
         #     Total unsupported timestamp format errors     : 0
-        p10 = re.compile(r'^Total unsupported timestamp format errors\s+: (?P<total_unsupported_timestamp_format_errors>\d+)$')
+        p10 = regex_engine.compile(r'^Total unsupported timestamp format errors\s+: (?P<total_unsupported_timestamp_format_errors>\d+)$')
 
         #     Total timestamp not available errors          : 0
-        p11 = re.compile(r'^Total timestamp not available errors\s+: (?P<total_timestamp_not_available_errors>\d+)$')
+        p11 = regex_engine.compile(r'^Total timestamp not available errors\s+: (?P<total_timestamp_not_available_errors>\d+)$')
 
         #     Total unsupported mandatory TLV errors        : 0
-        p12 = re.compile(r'^Total unsupported mandatory TLV errors\s+: (?P<total_unsupported_mandatory_tlv_errors>\d+)$')
+        p12 = regex_engine.compile(r'^Total unsupported mandatory TLV errors\s+: (?P<total_unsupported_mandatory_tlv_errors>\d+)$')
 
         #     Total invalid packet errors                   : 0
-        p13 = re.compile(r'^Total invalid packet errors\s+: (?P<total_invalid_packet_errors>\d+)$')
+        p13 = regex_engine.compile(r'^Total invalid packet errors\s+: (?P<total_invalid_packet_errors>\d+)$')
 
         #     Total loss probe color errors                 : 2
-        p14 = re.compile(r'^Total loss probe color errors\s+: (?P<total_loss_probe_color_errors>\d+)$')
+        p14 = regex_engine.compile(r'^Total loss probe color errors\s+: (?P<total_loss_probe_color_errors>\d+)$')
 
 
         intf_name = ''
@@ -6381,52 +6383,52 @@ class ShowPerformanceMeasurementResponderSummary(ShowPerformanceMeasurementRespo
             output = self.device.execute(cmd)
 
         # Total interfaces                              : 2
-        p1 = re.compile(r'^Total interfaces\s+: (?P<total_interfaces>\d+)$')
+        p1 = regex_engine.compile(r'^Total interfaces\s+: (?P<total_interfaces>\d+)$')
 
         # Total query packets received                  : 45501
-        p2 = re.compile(r'^Total query packets received\s+: (?P<total_query_packets_received>\d+)$')
+        p2 = regex_engine.compile(r'^Total query packets received\s+: (?P<total_query_packets_received>\d+)$')
 
         # Total reply packets sent                      : 45499
-        p3 = re.compile(r'^Total reply packets sent\s+: (?P<total_reply_packets_sent>\d+)$')
+        p3 = regex_engine.compile(r'^Total reply packets sent\s+: (?P<total_reply_packets_sent>\d+)$')
 
         # Total reply packets sent errors               : 2
-        p4 = re.compile(r'^Total reply packets sent errors\s+: (?P<total_reply_packets_sent_errors>\d+)$')
+        p4 = regex_engine.compile(r'^Total reply packets sent errors\s+: (?P<total_reply_packets_sent_errors>\d+)$')
 
         # Total URO TLV not present errors              : 0
-        p5 = re.compile(r'^Total URO TLV not present errors\s+: (?P<total_uro_tlv_not_present_errors>\d+)$')
+        p5 = regex_engine.compile(r'^Total URO TLV not present errors\s+: (?P<total_uro_tlv_not_present_errors>\d+)$')
 
         # Total invalid port number errors              : 0
-        p6 = re.compile(r'^Total invalid port number errors\s+: (?P<total_invalid_port_number_errors>\d+)$')
+        p6 = regex_engine.compile(r'^Total invalid port number errors\s+: (?P<total_invalid_port_number_errors>\d+)$')
 
         # Total no source address errors                : 0
-        p7 = re.compile(r'^Total no source address errors\s+: (?P<total_no_source_address_errors>\d+)$')
+        p7 = regex_engine.compile(r'^Total no source address errors\s+: (?P<total_no_source_address_errors>\d+)$')
 
         # Total no return path errors                   : 0
-        p8 = re.compile(r'^Total no return path errors\s+: (?P<total_no_return_path_errors>\d+)$')
+        p8 = regex_engine.compile(r'^Total no return path errors\s+: (?P<total_no_return_path_errors>\d+)$')
 
         # Total unsupported querier control code errors : 0
-        p9 = re.compile(r'^Total unsupported querier control code errors\s+: (?P<total_unsupported_querier>\d+)$')
+        p9 = regex_engine.compile(r'^Total unsupported querier control code errors\s+: (?P<total_unsupported_querier>\d+)$')
 
         # Total unsupported timestamp format errors     : 0
-        p10 = re.compile(r'^Total unsupported timestamp format errors\s+: (?P<total_unsupported_timestamp_format_errors>\d+)$')
+        p10 = regex_engine.compile(r'^Total unsupported timestamp format errors\s+: (?P<total_unsupported_timestamp_format_errors>\d+)$')
 
         # Total timestamp not available errors          : 0
-        p11 = re.compile(r'^Total timestamp not available errors\s+: (?P<total_timestamp_not_available_errors>\d+)$')
+        p11 = regex_engine.compile(r'^Total timestamp not available errors\s+: (?P<total_timestamp_not_available_errors>\d+)$')
 
         # Total unsupported mandatory TLV errors        : 0
-        p12 = re.compile(r'^Total unsupported mandatory TLV errors\s+: (?P<total_unsupported_mandatory_tlv_errors>\d+)$')
+        p12 = regex_engine.compile(r'^Total unsupported mandatory TLV errors\s+: (?P<total_unsupported_mandatory_tlv_errors>\d+)$')
 
         # Total invalid packet errors                   : 0
-        p13 = re.compile(r'^Total invalid packet errors\s+: (?P<total_invalid_packet_errors>\d+)$')
+        p13 = regex_engine.compile(r'^Total invalid packet errors\s+: (?P<total_invalid_packet_errors>\d+)$')
 
         #     Total loss probe color errors                 : 2
-        p14 = re.compile(r'^Total loss probe color errors\s+: (?P<total_loss_probe_color_errors>\d+)$')
+        p14 = regex_engine.compile(r'^Total loss probe color errors\s+: (?P<total_loss_probe_color_errors>\d+)$')
 
         # Current rate                                  : 0 pkts/sec
-        p15 = re.compile(r'^Current rate\s+: (?P<current_rate>\d+) pkts/sec$')
+        p15 = regex_engine.compile(r'^Current rate\s+: (?P<current_rate>\d+) pkts/sec$')
 
         # Rate high water mark                          : 0 pkts/sec
-        p16 = re.compile(r'^Rate high water mark\s+: (?P<rate_high_water_mark>\d+) pkts/sec$')
+        p16 = regex_engine.compile(r'^Rate high water mark\s+: (?P<rate_high_water_mark>\d+) pkts/sec$')
 
         ret_dict = {}
         for line in output.splitlines():
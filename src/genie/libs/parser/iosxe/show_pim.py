@@ -37,6 +37,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -95,8 +96,8 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
             line = line.strip()
 
             # GigabitEthernet1   on    1     30     1
-            p1 = re.compile(r'^(?P<intf>[\w\-\/\.]+) +(?P<status>(on|off))'
-                             r' +(?P<nbr_count>\d+) +(?P<hello_int>\d+) +(?P<dr_pri>\d+)$')
+            p1 = regex_engine.compile(r'^(?P<intf>[\w\-\/\.]+) +(?P<status>(on|off))'
+                                       r' +(?P<nbr_count>\d+) +(?P<hello_int>\d+) +(?P<dr_pri>\d+)$')
             m = p1.match(line)
             if m:
                 intf = Common.convert_intf_name(m.groupdict()['intf'])
@@ -127,7 +128,7 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
 
             # Address: FE80::5054:FF:FE2C:6CDF
             # Address: ::
-            p2 = re.compile(r'^Address *: +(?P<address>[\s\w\:\.]+)$')
+            p2 = regex_engine.compile(r'^Address *: +(?P<address>[\s\w\:\.]+)$')
             m = p2.match(line)
             if m:
                 address = m.groupdict()['address']
@@ -137,7 +138,7 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
 
             # DR     : FE80::5054:FF:FEAC:64B3
             # DR     : not elected
-            p3 = re.compile(r'^DR *: +(?P<dr_address>[\w\:\.]+)$')
+            p3 = regex_engine.compile(r'^DR *: +(?P<dr_address>[\w\:\.]+)$')
             m = p3.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interface'][intf]['dr_address'] = \
@@ -218,7 +219,7 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
 
             # BSR Election Information
             #  Scope Range List: ff00::/8
-            p1 = re.compile(r'^\s*Scope +Range +List: +(?P<scope_range_list>[\w\:\.//]+)$')
+            p1 = regex_engine.compile(r'^\s*Scope +Range +List: +(?P<scope_range_list>[\w\:\.//]+)$')
             m = p1.match(line)
             if m:
                 scope_range_list = m.groupdict()['scope_range_list']
@@ -247,7 +248,7 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
                 continue
 
             # BSR Address: 2001:1:1:1::1
-            p2 = re.compile(r'^\s*BSR +Address: +(?P<bsr_address>[\w\:\.]+)$')
+            p2 = regex_engine.compile(r'^\s*BSR +Address: +(?P<bsr_address>[\w\:\.]+)$')
             m = p2.match(line)
             if m:
                 address = m.groupdict()['bsr_address']
@@ -256,9 +257,9 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
                 continue
 
             # Uptime: 00:00:07, BSR Priority: 0, Hash mask length: 126
-            p3 = re.compile(r'^\s*Uptime: +(?P<up_time>[\d\:]+),'
-                            r' +BSR +Priority: +(?P<priority>\d+),'
-                            r' +Hash +mask +length: +(?P<hash_mask_length>\d+)$')
+            p3 = regex_engine.compile(r'^\s*Uptime: +(?P<up_time>[\d\:]+),'
+                                      r' +BSR +Priority: +(?P<priority>\d+),'
+                                      r' +Hash +mask +length: +(?P<hash_mask_length>\d+)$')
             m = p3.match(line)
             if m:
                 up_time = m.groupdict()['up_time']
@@ -273,7 +274,7 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
                 continue
 
             # RPF: FE80::21E:F6FF:FE2D:3600,Loopback0
-            p4 = re.compile(r'^\s*RPF: +(?P<rpf>[\w\:\.]+),(?P<interface>[\w\d\S]+)$')
+            p4 = regex_engine.compile(r'^\s*RPF: +(?P<rpf>[\w\:\.]+),(?P<interface>[\w\d\S]+)$')
 
             m = p4.match(line)
             if m:
@@ -286,7 +287,7 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
                 continue
 
             # BS Timer: 00:00:52
-            p5 = re.compile(r'^\s*BS +Timer: +(?P<bs_timer>[\d\:]+)$')
+            p5 = regex_engine.compile(r'^\s*BS +Timer: +(?P<bs_timer>[\d\:]+)$')
             m = p5.match(line)
             if m:
                 bs_timer = m.groupdict()['bs_timer']
@@ -295,9 +296,9 @@ class ShowIpv6PimBsrElection(ShowIpv6PimBsrElectionSchema):
                 continue
 
             # Candidate BSR address: 2001:1:1:1::1, priority: 0, hash mask length: 126
-            p6 = re.compile(r'^\s*Candidate +BSR +address: +(?P<can_address>[\w\d\:\.]+),'
-                            r' +priority: +(?P<can_priority>\d+),'
-                            r' +hash +mask +length: +(?P<can_hash_mask_lenght>\d+)$')
+            p6 = regex_engine.compile(r'^\s*Candidate +BSR +address: +(?P<can_address>[\w\d\:\.]+),'
+                                      r' +priority: +(?P<can_priority>\d+),'
+                                      r' +hash +mask +length: +(?P<can_hash_mask_lenght>\d+)$')
             m = p6.match(line)
             if m:
                 can_address = m.groupdict()['can_address']
@@ -389,8 +390,8 @@ class ShowIpv6PimBsrCandidateRp(ShowIpv6PimBsrCandidateRpSchema):
             # PIMv2 C-RP information
             # Candidate RP: 2001:3:3:3::3 SM
             # Candidate RP: 2001:db8:100::1:1:3
-            p1 = re.compile(r'^\s*Candidate RP: +(?P<candidate_rp_address>[\w\:\.]+)'
-                            r'( +(?P<mode>\w+))?$')
+            p1 = regex_engine.compile(r'^\s*Candidate RP: +(?P<candidate_rp_address>[\w\:\.]+)'
+                                      r'( +(?P<mode>\w+))?$')
             m = p1.match(line)
             if m:
                 address = m.groupdict()['candidate_rp_address']
@@ -399,8 +400,8 @@ class ShowIpv6PimBsrCandidateRp(ShowIpv6PimBsrCandidateRpSchema):
 
             # Priority 5, Holdtime 150
             # All Learnt Scoped Zones, Priority 192, Holdtime 150
-            p2 = re.compile(r'^\s*((?P<scope>[\S\s]+), )?Priority +(?P<priority>\d+)'
-                            r', +Holdtime +(?P<holdtime>\d+)$')
+            p2 = regex_engine.compile(r'^\s*((?P<scope>[\S\s]+), )?Priority +(?P<priority>\d+)'
+                                      r', +Holdtime +(?P<holdtime>\d+)$')
             m = p2.match(line)
             if m:
                 priority = int(m.groupdict()['priority'])
@@ -410,14 +411,14 @@ class ShowIpv6PimBsrCandidateRp(ShowIpv6PimBsrCandidateRpSchema):
                 continue
 
             # Advertisement interval 60 seconds
-            p3 = re.compile(r'^\s*Advertisement +interval +(?P<interval>\d+) +seconds$')
+            p3 = regex_engine.compile(r'^\s*Advertisement +interval +(?P<interval>\d+) +seconds$')
             m = p3.match(line)
             if m:
                 interval = int(m.groupdict()['interval'])
                 continue
 
             # Next advertisement in 00:00:48
-            p4 = re.compile(r'^\s*Next +advertisement +in +(?P<next_advertisement>[\d\:]+)$')
+            p4 = regex_engine.compile(r'^\s*Next +advertisement +in +(?P<next_advertisement>[\d\:]+)$')
             m = p4.match(line)
             if m:
                 next_advertisement = m.groupdict()['next_advertisement']
@@ -538,12 +539,12 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
             # Address          Interface                Ver/   Nbr    Query  DR         DR
             #                              Mode   Count  Intvl  Prior
             # 10.1.2.1         GigabitEthernet1         v2/S   1      30     1          10.1.2.2
-            p1 = re.compile(r'^\s*(?P<address>[\w\:\.]+) +(?P<interface>[\w\d\S]+)'
-                            r' +v(?P<version>[\d]+)\/(?P<mode>[\w]+)'
-                            r' +(?P<nbr_count>[\d]+)'
-                            r' +(?P<query_interval>[\d]+)'
-                            r' +(?P<dr_priority>[\d]+)'
-                            r' +(?P<dr_address>[\w\d\.\:]+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<address>[\w\:\.]+) +(?P<interface>[\w\d\S]+)'
+                                      r' +v(?P<version>[\d]+)\/(?P<mode>[\w]+)'
+                                      r' +(?P<nbr_count>[\d]+)'
+                                      r' +(?P<query_interval>[\d]+)'
+                                      r' +(?P<dr_priority>[\d]+)'
+                                      r' +(?P<dr_address>[\w\d\.\:]+)$')
             m = p1.match(line)
             if m:
                 new_mode = ""
@@ -677,7 +678,7 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
 
             # PIMv2 Bootstrap information
             # BSR address: 10.64.4.4 (?)
-            p1 = re.compile(r'^\s*BSR +address: +(?P<address>[\w\:\.]+) +\((?P<address_host>[\w\d\S]+)\)$')
+            p1 = regex_engine.compile(r'^\s*BSR +address: +(?P<address>[\w\:\.]+) +\((?P<address_host>[\w\d\S]+)\)$')
             m = p1.match(line)
             if m:
                 address = m.groupdict()['address']
@@ -709,9 +710,9 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                 continue
 
             # Uptime:      00:01:23, BSR Priority: 0, Hash mask length: 0
-            p2 = re.compile(r'^\s*Uptime: +(?P<up_time>[\w\d\:]+),'
-                            r' +BSR +Priority: +(?P<priority>\d+),'
-                            r' +Hash +mask +length: +(?P<hash_mask_length>\d+)$')
+            p2 = regex_engine.compile(r'^\s*Uptime: +(?P<up_time>[\w\d\:]+),'
+                                      r' +BSR +Priority: +(?P<priority>\d+),'
+                                      r' +Hash +mask +length: +(?P<hash_mask_length>\d+)$')
             m = p2.match(line)
             if m:
                 bsr_up_time = m.groupdict()['up_time']
@@ -749,7 +750,7 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                 continue
 
             # Expires:     00:01:46
-            p3 = re.compile(r'^\s*Expires: +(?P<expires>[\d\:]+)$')
+            p3 = regex_engine.compile(r'^\s*Expires: +(?P<expires>[\d\:]+)$')
 
             m = p3.match(line)
             if m:
@@ -759,8 +760,8 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                 continue
 
             # Next bootstrap message in 00:00:06
-            p10 = re.compile(r'^\s*Next +bootstrap +message +in'
-                             r' +(?P<next_bsr_message>[\w\d\S]+)$')
+            p10 = regex_engine.compile(r'^\s*Next +bootstrap +message +in'
+                                       r' +(?P<next_bsr_message>[\w\d\S]+)$')
             m = p10.match(line)
             if m:
                 next_bsr_meaasge = m.groupdict()['next_bsr_message']
@@ -769,9 +770,9 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                 continue
 
             # Candidate BSR address: 10.4.1.1, priority: 0, hash mask length: 0
-            p4 = re.compile(r'^\s*Candidate +BSR +address: +(?P<can_address>[\w\d\:\.]+),'
-                            r' +priority: +(?P<can_priority>\d+),'
-                            r' +hash +mask +length: +(?P<can_hash_mask_length>\d+)$')
+            p4 = regex_engine.compile(r'^\s*Candidate +BSR +address: +(?P<can_address>[\w\d\:\.]+),'
+                                      r' +priority: +(?P<can_priority>\d+),'
+                                      r' +hash +mask +length: +(?P<can_hash_mask_length>\d+)$')
             m = p4.match(line)
             if m:
                 can_address = m.groupdict()['can_address']
@@ -798,8 +799,8 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                 continue
 
             # Candidate RP: 10.1.5.1(GigabitEthernet3)
-            p5 = re.compile(r'^\s*Candidate +RP:'
-                            r' +(?P<rp_can_address>[\w\d\.\:]+)\((?P<rp_can_interface>[\w\d\S]+)\)$')
+            p5 = regex_engine.compile(r'^\s*Candidate +RP:'
+                                      r' +(?P<rp_can_address>[\w\d\.\:]+)\((?P<rp_can_interface>[\w\d\S]+)\)$')
 
             m = p5.match(line)
             if m:
@@ -834,8 +835,8 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                 continue
 
             # Holdtime 150 seconds
-            p6 = re.compile(r'^\s*Holdtime'
-                            r' +(?P<holdtime>\d+) +seconds$')
+            p6 = regex_engine.compile(r'^\s*Holdtime'
+                                      r' +(?P<holdtime>\d+) +seconds$')
             m = p6.match(line)
             if m:
                 rp_can_holdtime = int(m.groupdict()['holdtime'])
@@ -844,8 +845,8 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                 continue
 
             # Advertisement interval 60 seconds
-            p7 = re.compile(r'^\s*Advertisement +interval'
-                            r' +(?P<interval>\d+) +seconds$')
+            p7 = regex_engine.compile(r'^\s*Advertisement +interval'
+                                      r' +(?P<interval>\d+) +seconds$')
             m = p7.match(line)
             if m:
                 rp_can_interval = int(m.groupdict()['interval'])
@@ -854,8 +855,8 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                 continue
 
             # Next advertisement in 00:00:27
-            p8 = re.compile(r'^\s*Next +advertisement +in'
-                            r' +(?P<next_advertisment>[\d\:]+)$')
+            p8 = regex_engine.compile(r'^\s*Next +advertisement +in'
+                                      r' +(?P<next_advertisment>[\d\:]+)$')
             m = p8.match(line)
             if m:
                 rp_can_next_advertisment = m.groupdict()['next_advertisment']
@@ -864,8 +865,8 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
                 continue
 
             # Candidate RP priority : 5
-            p9 = re.compile(r'^\s*Candidate +RP +priority +:'
-                            r' +(?P<rp_can_priority>[\d]+)$')
+            p9 = regex_engine.compile(r'^\s*Candidate +RP +priority +:'
+                                      r' +(?P<rp_can_priority>[\d]+)$')
             m = p9.match(line)
             if m:
                 rp_can_priority = int(m.groupdict()['rp_can_priority'])
@@ -971,9 +972,9 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
             # Group(s) 224.0.0.0/4
             # Group(s) 224.0.0.0/4, Static
             # Group(s): 224.0.0.0/4, Static, Bidir Mode
-            p1 = re.compile(r'^\s*Group\(s\)\:? +(?P<group>[0-9a-zA-Z\:\.\/]+)'
-                             r'(, +(?P<protocol>\S+))?'
-                             r'(, +(?P<mode>[\w\s]+))?$')
+            p1 = regex_engine.compile(r'^\s*Group\(s\)\:? +(?P<group>[0-9a-zA-Z\:\.\/]+)'
+                                       r'(, +(?P<protocol>\S+))?'
+                                       r'(, +(?P<mode>[\w\s]+))?$')
             m = p1.match(line)
             if m:
                 rp_group_protocol = ""
@@ -993,9 +994,9 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
                 continue
 
             # Acl: STATIC_RP_V4, Static-Override
-            p1_1 = re.compile(r'^\s*Acl: +(?P<group>\S+)'
-                             r'(, +(?P<protocol>\S+))?'
-                             r'(, +(?P<mode>[\w\s]+))?$')
+            p1_1 = regex_engine.compile(r'^\s*Acl: +(?P<group>\S+)'
+                                       r'(, +(?P<protocol>\S+))?'
+                                       r'(, +(?P<mode>[\w\s]+))?$')
             m = p1_1.match(line)
             if m:
                 rp_group_protocol = ""
@@ -1017,9 +1018,9 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
                 continue
 
             # RP 10.36.3.3 (?), v2
-            p2 = re.compile(r'^\s*RP\:? +(?P<rp_address>[\s\w\:\.]+)'
-                            r' +\((?P<rp_address_host>[\w\d\.\:\?]+)\)?'
-                            r'(, +(?P<rp_version>[\w\d]+))?$')
+            p2 = regex_engine.compile(r'^\s*RP\:? +(?P<rp_address>[\s\w\:\.]+)'
+                                      r' +\((?P<rp_address_host>[\w\d\.\:\?]+)\)?'
+                                      r'(, +(?P<rp_version>[\w\d]+))?$')
             m = p2.match(line)
             if m:
                 rp_group_protocol = ""
@@ -1134,12 +1135,12 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
 
             # Info source: 10.64.4.4 (?), via bootstrap, priority 5, holdtime 150
             # Info source: 192.168.246.1 (?), elected via Auto-RP, via bootstrap, priority 0, holdtime 181
-            p3 = re.compile(r'^\s*Info +source: +(?P<info_source>[\w\:\.]+)'
-                            r' +\((?P<rp_address_host>[\w\d\.\:\?]+)\)?'
-                            r'(, +elected +via +(?P<elected>\S+))?'
-                            r'(, +via +(?P<protocol>[\w\S\-]+))?'
-                            r'(, +priority +(?P<priority>[\d]+))?'
-                            r'(, +holdtime +(?P<holdtime>[\d]+))?$')
+            p3 = regex_engine.compile(r'^\s*Info +source: +(?P<info_source>[\w\:\.]+)'
+                                      r' +\((?P<rp_address_host>[\w\d\.\:\?]+)\)?'
+                                      r'(, +elected +via +(?P<elected>\S+))?'
+                                      r'(, +via +(?P<protocol>[\w\S\-]+))?'
+                                      r'(, +priority +(?P<priority>[\d]+))?'
+                                      r'(, +holdtime +(?P<holdtime>[\d]+))?$')
             m = p3.match(line)
             if m:
                 info_source_address = m.groupdict()['info_source']
@@ -1235,8 +1236,8 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
                 continue
 
             # Uptime: 00:00:19, expires: 00:02:19
-            p4 = re.compile(r'^\s*Uptime: +(?P<uptime>[\w\d\S\:]+),'
-                            r' +expires: +(?P<expires>[\w\d\S\:]+)$')
+            p4 = regex_engine.compile(r'^\s*Uptime: +(?P<uptime>[\w\d\S\:]+),'
+                                      r' +expires: +(?P<expires>[\w\d\S\:]+)$')
             m = p4.match(line)
             if m:
                 up_time = m.groupdict()['uptime']
@@ -1382,8 +1383,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
             line = line.strip()
 
             # GigabitEthernet3 is up, line protocol is up
-            p1 = re.compile(r'^\s*(?P<intf_name>[\w\d\S]+) +is +(?P<enable>\S+),'
-                            r' +line +protocol +is +(?P<oper_status>\w+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<intf_name>[\w\d\S]+) +is +(?P<enable>\S+),'
+                                      r' +line +protocol +is +(?P<oper_status>\w+)$')
             m = p1.match(line)
             if m:
                 intf_name = m.groupdict()['intf_name']
@@ -1412,7 +1413,7 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # Internet protocol processing: disabled
-            p23 = re.compile(r'^Internet protocol processing: (?P<disabled>\S+)$')
+            p23 = regex_engine.compile(r'^Internet protocol processing: (?P<disabled>\S+)$')
             m = p23.match(line)
             if m:
 
@@ -1423,7 +1424,7 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # Internet address is 10.1.2.1/24
-            p2 = re.compile(r'^\s*Internet +address +is +(?P<address>[\w\d\S]+)$')
+            p2 = regex_engine.compile(r'^\s*Internet +address +is +(?P<address>[\w\d\S]+)$')
             m = p2.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interfaces'][intf_name]['address_family']\
@@ -1431,7 +1432,7 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # Multicast switching: fast
-            p3 = re.compile(r'^\s*Multicast +switching: +(?P<multi_switching>\w+)$')
+            p3 = regex_engine.compile(r'^\s*Multicast +switching: +(?P<multi_switching>\w+)$')
             m = p3.match(line)
             if m:
                 if 'multicast' not in ret_dict['vrf'][vrf]['interfaces']\
@@ -1443,8 +1444,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # Multicast packets in/out: 5/0
-            p4 = re.compile(r'^\s*Multicast +packets +in/out:'
-                            r' +(?P<in>\d+)/(?P<out>\d+)$')
+            p4 = regex_engine.compile(r'^\s*Multicast +packets +in/out:'
+                                      r' +(?P<in>\d+)/(?P<out>\d+)$')
             m = p4.match(line)
             if m:
                 multi_packet_in = int(m.groupdict()['in'])
@@ -1463,8 +1464,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # Multicast TTL threshold: 0
-            p5 = re.compile(r'^\s*Multicast +TTL +threshold:'
-                            r' +(?P<ttl_threshold>\d+)$')
+            p5 = regex_engine.compile(r'^\s*Multicast +TTL +threshold:'
+                                      r' +(?P<ttl_threshold>\d+)$')
             m = p5.match(line)
             if m:
                 ttl_threshold = int(m.groupdict()['ttl_threshold'])
@@ -1477,8 +1478,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM: enabled
-            p6 = re.compile(r'^\s*PIM:'
-                            r' +(?P<status>\w+)$')
+            p6 = regex_engine.compile(r'^\s*PIM:'
+                                      r' +(?P<status>\w+)$')
             m = p6.match(line)
             if m:
                 pim_status = m.groupdict()['status']
@@ -1487,8 +1488,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM version: 2, mode: sparse
-            p7 = re.compile(r'^\s*PIM +version:'
-                            r' +(?P<version>\d+), +mode: +(?P<mode>\w+)$')
+            p7 = regex_engine.compile(r'^\s*PIM +version:'
+                                      r' +(?P<version>\d+), +mode: +(?P<mode>\w+)$')
             m = p7.match(line)
             if m:
                 version = int(m.groupdict()['version'])
@@ -1515,8 +1516,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
 
             # PIM DR: 10.1.2.2
             # PIM DR: 10.4.1.1 (this system)
-            p8 = re.compile(r'^\s*PIM +DR:'
-                            r' +(?P<dr_address>[\w\d\S]+)(\s+(?P<info>[\w\S\s]+))?$')
+            p8 = regex_engine.compile(r'^\s*PIM +DR:'
+                                      r' +(?P<dr_address>[\w\d\S]+)(\s+(?P<info>[\w\S\s]+))?$')
             m = p8.match(line)
             if m:
                 dr_address = m.groupdict()['dr_address']
@@ -1525,8 +1526,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM neighbor count: 1
-            p9 = re.compile(r'^\s*PIM +neighbor +count:'
-                            r' +(?P<nbr_count>\d+)$')
+            p9 = regex_engine.compile(r'^\s*PIM +neighbor +count:'
+                                      r' +(?P<nbr_count>\d+)$')
             m = p9.match(line)
             if m:
                 nbr_count = int(m.groupdict()['nbr_count'])
@@ -1535,8 +1536,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM Hello/Query interval: 30 seconds
-            p10 = re.compile(r'^\s*PIM +[h|H]ello/[q|Q]uery +interval:'
-                            r' +(?P<hello_interval>\d+) +seconds$')
+            p10 = regex_engine.compile(r'^\s*PIM +[h|H]ello/[q|Q]uery +interval:'
+                                      r' +(?P<hello_interval>\d+) +seconds$')
             m = p10.match(line)
             if m:
                 hello_interval = int(m.groupdict()['hello_interval'])
@@ -1545,8 +1546,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM Hello packets in/out: 8/10
-            p11 = re.compile(r'^\s*PIM +Hello +packets +in/out:'
-                             r' +(?P<h_in>\d+)/(?P<h_out>\d+)$')
+            p11 = regex_engine.compile(r'^\s*PIM +Hello +packets +in/out:'
+                                       r' +(?P<h_in>\d+)/(?P<h_out>\d+)$')
             m = p11.match(line)
             if m:
                 hello_packet_in = int(m.groupdict()['h_in'])
@@ -1558,8 +1559,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM J/P interval: 60 seconds
-            p12 = re.compile(r'^\s*PIM +J/P +interval:'
-                             r' +(?P<jp_interval>\d+) +seconds$')
+            p12 = regex_engine.compile(r'^\s*PIM +J/P +interval:'
+                                       r' +(?P<jp_interval>\d+) +seconds$')
             m = p12.match(line)
             if m:
                 jp_interval = int(m.groupdict()['jp_interval'])
@@ -1568,8 +1569,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM State-Refresh processing: enabled
-            p13 = re.compile(r'^\s*PIM +[s|S]tate-[r|R]efresh +processing:'
-                             r' +(?P<state_refresh_processing>\w+)$')
+            p13 = regex_engine.compile(r'^\s*PIM +[s|S]tate-[r|R]efresh +processing:'
+                                       r' +(?P<state_refresh_processing>\w+)$')
             m = p13.match(line)
             if m:
                 state_refresh_processing = m.groupdict()['state_refresh_processing']
@@ -1578,8 +1579,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM State-Refresh origination: disabled
-            p14 = re.compile(r'^\s*PIM +[s|S]tate-[r|R]efresh +origination:'
-                             r' +(?P<state_refresh_origination>\w+)$')
+            p14 = regex_engine.compile(r'^\s*PIM +[s|S]tate-[r|R]efresh +origination:'
+                                       r' +(?P<state_refresh_origination>\w+)$')
             m = p14.match(line)
             if m:
                 state_refresh_origination = m.groupdict()['state_refresh_origination']
@@ -1588,8 +1589,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM NBMA mode: disabled
-            p15 = re.compile(r'^\s*PIM +NBMA +mode:'
-                             r' +(?P<nbma_mode>\w+)$')
+            p15 = regex_engine.compile(r'^\s*PIM +NBMA +mode:'
+                                       r' +(?P<nbma_mode>\w+)$')
             m = p15.match(line)
             if m:
                 nbma_mode = m.groupdict()['nbma_mode']
@@ -1598,8 +1599,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM ATM multipoint signalling: disabled
-            p16 = re.compile(r'^\s*PIM +ATM +multipoint +signalling:'
-                             r' +(?P<atm_multipoint>\w+)$')
+            p16 = regex_engine.compile(r'^\s*PIM +ATM +multipoint +signalling:'
+                                       r' +(?P<atm_multipoint>\w+)$')
             m = p16.match(line)
             if m:
                 atm_multipoint = m.groupdict()['atm_multipoint']
@@ -1608,8 +1609,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM domain border: disabled
-            p17 = re.compile(r'^\s*PIM +domain +border:'
-                             r' +(?P<domain_border>\w+)$')
+            p17 = regex_engine.compile(r'^\s*PIM +domain +border:'
+                                       r' +(?P<domain_border>\w+)$')
             m = p17.match(line)
             if m:
                 bsr_border = m.groupdict()['domain_border']
@@ -1618,8 +1619,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM neighbors rpf proxy capable: TRUE
-            p18 = re.compile(r'^\s*PIM +neighbors +rpf +proxy +capable:'
-                             r' +(?P<neighbors_rpf_proxy_capable>\w+)$')
+            p18 = regex_engine.compile(r'^\s*PIM +neighbors +rpf +proxy +capable:'
+                                       r' +(?P<neighbors_rpf_proxy_capable>\w+)$')
             m = p18.match(line)
             if m:
                 nbr_val = m.groupdict()['neighbors_rpf_proxy_capable']
@@ -1629,8 +1630,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM BFD: disabled
-            p19 = re.compile(r'^\s*PIM +BFD:'
-                             r' +(?P<bfd>\w+)$')
+            p19 = regex_engine.compile(r'^\s*PIM +BFD:'
+                                       r' +(?P<bfd>\w+)$')
             m = p19.match(line)
             if m:
                 bfd = m.groupdict()['bfd']
@@ -1644,8 +1645,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                         [af_name]['bfd']['enable'] = enable
 
             # PIM Non-DR-Join: FALSE
-            p20 = re.compile(r'^\s*PIM +Non-DR-Join:'
-                             r' +(?P<non_dr_join>\w+)$')
+            p20 = regex_engine.compile(r'^\s*PIM +Non-DR-Join:'
+                                       r' +(?P<non_dr_join>\w+)$')
             m = p20.match(line)
             if m:
                 non_dr_join = m.groupdict()['non_dr_join']
@@ -1658,8 +1659,8 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # Multicast Tagswitching: disabled
-            p21 = re.compile(r'^\s*Multicast +Tagswitching:'
-                             r' +(?P<tagswitching>\w+)$')
+            p21 = regex_engine.compile(r'^\s*Multicast +Tagswitching:'
+                                       r' +(?P<tagswitching>\w+)$')
             m = p21.match(line)
             if m:
                 tagswitching = m.groupdict()['tagswitching']
@@ -1673,7 +1674,7 @@ class ShowIpPimInterfaceDetail(ShowIpPimInterfaceDetailSchema):
                 continue
 
             # PIM neighbor filter: 7
-            p22 = re.compile(r'^\s*PIM +neighbor +filter: +(?P<nei_filter>\d+)$')
+            p22 = regex_engine.compile(r'^\s*PIM +neighbor +filter: +(?P<nei_filter>\d+)$')
             m = p22.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interfaces'][intf_name]['address_family'] \
@@ -1766,21 +1767,21 @@ class ShowPimNeighbor(ShowPimNeighborSchema):
             # Address                                                            Prio/Mode
             # 192.168.154.1      Port-channel2.100       1d09h/00:01:39    v2    1 / S P G
             # 172.19.1.64       LISP0.4099               4d23h/00:01:11    v2    0 /
-            p1 = re.compile(r'^(?P<nei_address>[\d\.]+) +'
-                            r'(?P<intf>[\w\.\/\-]+) +'
-                            r'(?P<uptime>[\w\.\:]+)\/(?P<expires>[\w\.\:]+) +'
-                            r'(?P<ver>\w+) +'
-                            r'(?P<dr_prio>\d+) *\/ *(?P<mode>[\w\s]+)?$')
+            p1 = regex_engine.compile(r'^(?P<nei_address>[\d\.]+) +'
+                                      r'(?P<intf>[\w\.\/\-]+) +'
+                                      r'(?P<uptime>[\w\.\:]+)\/(?P<expires>[\w\.\:]+) +'
+                                      r'(?P<ver>\w+) +'
+                                      r'(?P<dr_prio>\d+) *\/ *(?P<mode>[\w\s]+)?$')
             m1 = p1.match(line)
 
             # Neighbor Address           Interface          Uptime    Expires  Mode DR pri
             # FE80::21A:30FF:FE47:6EC1   Port-channel2.100  1d09h     00:01:17 B G     1
-            p2 = re.compile(r'^(?P<nei_address>[\w\:]+) +'
-                            r'(?P<intf>[\w\.\/\-]+) +'
-                            r'(?P<uptime>[\w\.\:]+) +'
-                            r'(?P<expires>[\w\.\:]+) +'
-                            r'(?P<mode>[\w\s]+) +'
-                            r'(?P<dr_prio>\d+)$')
+            p2 = regex_engine.compile(r'^(?P<nei_address>[\w\:]+) +'
+                                      r'(?P<intf>[\w\.\/\-]+) +'
+                                      r'(?P<uptime>[\w\.\:]+) +'
+                                      r'(?P<expires>[\w\.\:]+) +'
+                                      r'(?P<mode>[\w\s]+) +'
+                                      r'(?P<dr_prio>\d+)$')
             m2 = p2.match(line)
 
             if m := m1 or m2:
@@ -1825,7 +1826,7 @@ class ShowPimNeighbor(ShowPimNeighborSchema):
                 continue
 
             # 2001::2:1
-            p3 = re.compile(r'^(?P<secondary_address>[\w\:]+)$')
+            p3 = regex_engine.compile(r'^(?P<secondary_address>[\w\:]+)$')
             m = p3.match(line)
             if m:
                 ret_dict['vrf'][vrf]['interfaces'][intf]['address_family'\
@@ -1967,11 +1968,11 @@ class ShowIpPimInterfaceDf(ShowIpPimInterfaceDfSchema):
             # Ethernet3/3        10.10.0.2        10.4.0.2         0               00:03:49
             #                    10.10.0.3        10.4.0.3         0               00:01:49
             # Ethernet0/1        10.186.0.1      *10.4.0.4         20              00:00:39
-            p1 = re.compile(r'^((?P<intf>[\w\.\/\-]+) +)?'
-                             r'(?P<address>[\w\.\:]+) +'
-                             r'(?P<df>\*)?(?P<df_address>[\w\.\:]+) +'
-                             r'(?P<metric>\d+) +'
-                             r'(?P<uptime>[\w\.\:]+)$')
+            p1 = regex_engine.compile(r'^((?P<intf>[\w\.\/\-]+) +)?'
+                                       r'(?P<address>[\w\.\:]+) +'
+                                       r'(?P<df>\*)?(?P<df_address>[\w\.\:]+) +'
+                                       r'(?P<metric>\d+) +'
+                                       r'(?P<uptime>[\w\.\:]+)$')
             m = p1.match(line)
             if m:
                 if m.groupdict()['intf']:
@@ -2065,24 +2066,24 @@ class ShowIpPimTunnel(ShowIpPimTunnelSchema):
         ret_dict = {}
 
         #Tunnel0
-        p1 = re.compile(r'Tunnel(?P<tunnel>\d+)')
+        p1 = regex_engine.compile(r'Tunnel(?P<tunnel>\d+)')
 
         #Type       : PIM Encap
-        p2 = re.compile(r'^Type\s+\:\s+(?P<type>.*)$')
+        p2 = regex_engine.compile(r'^Type\s+\:\s+(?P<type>.*)$')
 
         #RP         : 4.4.4.4
         #RP    : Embedded RP Tunnel
-        p3 = re.compile(r'^RP\s+\:\s+(?P<rp>.*)$')
+        p3 = regex_engine.compile(r'^RP\s+\:\s+(?P<rp>.*)$')
 
         #Source     : 87.1.1.1
         #Source: 77:77:77::77
-        p4 = re.compile(r'^Source(\s+)?\:\s+(?P<source>\S+)$')
+        p4 = regex_engine.compile(r'^Source(\s+)?\:\s+(?P<source>\S+)$')
 
         #State      : UP
-        p5 = re.compile(r'^State\s+\:\s+(?P<state>\S+)$')
+        p5 = regex_engine.compile(r'^State\s+\:\s+(?P<state>\S+)$')
 
         #Last event : RP address reachable (1d10h)
-        p6 = re.compile(r'^Last\s+event\s+:\s+(?P<last_event>(.*?))\s+\((?P<uptime>\S+)\)$')
+        p6 = regex_engine.compile(r'^Last\s+event\s+:\s+(?P<last_event>(.*?))\s+\((?P<uptime>\S+)\)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2169,19 +2170,19 @@ class ShowIpPimAutorp(ShowIpPimAutorpSchema):
         ret_dict = {}
 
         #AutoRP is enabled.
-        p1 = re.compile(r'^\s*AutoRP\s+is\s*(?P<autorp>\w+).+$')
+        p1 = regex_engine.compile(r'^\s*AutoRP\s+is\s*(?P<autorp>\w+).+$')
 
         #RP Discovery packet MTU is 1496.
-        p2 = re.compile(r'^\s*RP\s+Discovery\s+packet\s+MTU\s+is\s+(?P<mtu>\d+).+$')
+        p2 = regex_engine.compile(r'^\s*RP\s+Discovery\s+packet\s+MTU\s+is\s+(?P<mtu>\d+).+$')
 
         #224.0.1.40 is joined on Loopback0.
-        p3 = re.compile(r'^\s*(?P<group>\d+.\d+.\d+.\d+)\s+is\s+joined\s+on\s+(?P<interface>[\w\/\.\-\:]+).+$')
+        p3 = regex_engine.compile(r'^\s*(?P<group>\d+.\d+.\d+.\d+)\s+is\s+joined\s+on\s+(?P<interface>[\w\/\.\-\:]+).+$')
 
         #AutoRP groups over sparse mode interface is enabled
-        p4 = re.compile(r'^\s*AutoRP\s+groups\s+over\s+(?P<mode>\w+)\s+mode\s+interface\s+is\s+enabled$')
+        p4 = regex_engine.compile(r'^\s*AutoRP\s+groups\s+over\s+(?P<mode>\w+)\s+mode\s+interface\s+is\s+enabled$')
 
         #RP Announce: 3078/1303, RP Discovery: 3780/10412
-        p5 = re.compile(r'^\s*RP\s+Announce:\s+(?P<rpas>\d+)\/(?P<rpar>\d+),\s+RP Discovery:\s+(?P<rpds>\d+)\/(?P<rpdr>\d+)$')
+        p5 = regex_engine.compile(r'^\s*RP\s+Announce:\s+(?P<rpas>\d+)\/(?P<rpar>\d+),\s+RP Discovery:\s+(?P<rpds>\d+)\/(?P<rpdr>\d+)$')
 
         for line in output.splitlines():
             if not line:
@@ -2272,7 +2273,7 @@ class ShowIpPimVrfMdtSend(ShowIpPimVrfMdtSendSchema):
         # (10.100.8.10, 225.1.8.9)      232.2.8.8       1
         # (10.100.8.10, 225.1.8.10)     232.2.8.9       1
         
-        p1 = re.compile(r'\((?P<source>[\d\.]+),\s+(?P<group>[\d\.]+)\)\s+(?P<mdt_data_group>[\d\.]+)\s+(?P<ref_count>\d+)')
+        p1 = regex_engine.compile(r'\((?P<source>[\d\.]+),\s+(?P<group>[\d\.]+)\)\s+(?P<mdt_data_group>[\d\.]+)\s+(?P<ref_count>\d+)')
         
         for line in output.splitlines():
             line = line.strip()
@@ -2335,10 +2336,10 @@ class ShowIpVrfMdtReceiveDetail(ShowIpPimVrfMdtReceiveDetailSchema):
         index= 0
         
         # group:172.16.8.0 source:10.0.0.100 ref_count:13
-        p1 = re.compile(r'^\s*group\:(?P<group>\S+)\s+source\:(?P<source>\S+)\s+ref_count\:(?P<ref_count>\d+)$')
+        p1 = regex_engine.compile(r'^\s*group\:(?P<group>\S+)\s+source\:(?P<source>\S+)\s+ref_count\:(?P<ref_count>\d+)$')
         
         # (10.101.8.10, 225.1.8.1), 1d13h/00:03:28/00:02:26, OIF count:1, flags:TY
-        p2 = re.compile(r'^\((?P<source>\S+), +(?P<group>\S+)\), +\S+/+\S+/+\S+, +OIF +count:(?P<oif_count>\d+), +flags:(?P<flags>\S+)$')
+        p2 = regex_engine.compile(r'^\((?P<source>\S+), +(?P<group>\S+)\), +\S+/+\S+/+\S+, +OIF +count:(?P<oif_count>\d+), +flags:(?P<flags>\S+)$')
         
         for line in output.splitlines():
             if not line:
@@ -2407,7 +2408,7 @@ class ShowIpPimVrfMdtHistoryInterval(ShowIpPimVrfMdtHistoryIntervalSchema):
         # MDT-data group        Number of reuse 
         #     10.9.9.8           3 
         #     10.9.9.9           2 
-        p1 = re.compile(r'^(?P<mdt_data_group>[\d\.]+)\s+(?P<no_of_reuse>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<mdt_data_group>[\d\.]+)\s+(?P<no_of_reuse>\d+)$')
         
         for line in output.splitlines():
             line = line.strip()
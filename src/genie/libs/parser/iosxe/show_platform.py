@@ -49,6 +49,7 @@ from xml.dom import minidom
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 # genie.parsergen
@@ -103,27 +104,27 @@ class ShowBootvar(ShowBootvarSchema):
         # BOOT variable = flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150907_031219.bin;flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150828_174328.SSA.bin;flash:ISSUCleanGolden;
         # BOOT variable = tftp:/auto/tftp-best/genie_images/genie_clean/asr1000-genie-image 255.255.255.255,12;
         # BOOT variable = tftp:/auto/tftp-best/genie_images/genie_clean/asr1000-genie-image 255.255.255.255,12;harddisk:/asr1000-genie-image_asr-MIB-1,12;
-        p1 = re.compile(r'^BOOT +variable +=( *(?P<var>.+);?)?$')
+        p1 = regex_engine.compile(r'^BOOT +variable +=( *(?P<var>.+);?)?$')
 
         # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-        p2 = re.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
+        p2 = regex_engine.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
 
         # Configuration register is 0x2002
         # Configuration register is 0x2 (will be 0x2102 at next reload)
         # Configuration Register is 0x102
-        p3 = re.compile(r'Configuration +[R|r]egister +is +(?P<var1>(\S+))'
-                        r'(?: +\(will +be +(?P<var2>(\S+)) +at +next +reload\))?$')
+        p3 = regex_engine.compile(r'Configuration +[R|r]egister +is +(?P<var1>(\S+))'
+                                  r'(?: +\(will +be +(?P<var2>(\S+)) +at +next +reload\))?$')
 
         # Standby Configuration register is 0x2002
         # Standby Configuration register is 0x1  (will be 0x2102 at next reload)
-        p4 = re.compile(r'^Standby +Configuration +register +is +(?P<var>\w+)'
-                        r'(?: +\(will +be +(?P<var2>\S+) +at +next +reload\))?$')
+        p4 = regex_engine.compile(r'^Standby +Configuration +register +is +(?P<var>\w+)'
+                                  r'(?: +\(will +be +(?P<var2>\S+) +at +next +reload\))?$')
 
         # CONFIG_FILE variable =
-        p5 = re.compile(r'^CONFIG_FILE +variable += +(?P<var>\S+)$')
+        p5 = regex_engine.compile(r'^CONFIG_FILE +variable += +(?P<var>\S+)$')
 
         # BOOTLDR variable =
-        p6 = re.compile(r'^BOOTLDR +variable += +(?P<var>\S+)$')
+        p6 = regex_engine.compile(r'^BOOTLDR +variable += +(?P<var>\S+)$')
 
         # BOOTLDR variable does not exist
         # not parsing
@@ -131,10 +132,10 @@ class ShowBootvar(ShowBootvarSchema):
         # Standby not ready to show bootvar
         # not parsing
         # MANUAL_BOOT variable = no
-        p7 = re.compile(r'(^MANUAL_BOOT\s*variable)\s*=\s*(?P<manual_boot>\w+)$')
+        p7 = regex_engine.compile(r'(^MANUAL_BOOT\s*variable)\s*=\s*(?P<manual_boot>\w+)$')
 
         # Standby MANUAL_BOOT variable = no
-        p8 = re.compile(r'(^Standby\s*MANUAL_BOOT\s*variable)\s*=\s*(?P<standby_manual_boot>\w+)$')
+        p8 = regex_engine.compile(r'(^Standby\s*MANUAL_BOOT\s*variable)\s*=\s*(?P<standby_manual_boot>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -377,25 +378,25 @@ class ShowVersion(ShowVersionSchema):
         license_flag = False
 
         # Cisco IOS XE Software, Version BLD_POLARIS_DEV_LATEST_20200702_122021_V17_4_0_67_2
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r'^Cisco +([\S\s]+) +Software, +Version +(?P<xe_version>.*)$')
 
         # version
         # Cisco IOS Software [Everest], ISR Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.6.5, RELEASE SOFTWARE (fc3)
         # Cisco IOS Software, IOS-XE Software, Catalyst 4500 L3 Switch Software (cat4500e-UNIVERSALK9-M), Version 03.03.02.SG RELEASE SOFTWARE (fc1)
-        p1 = re.compile(r'^[Cc]isco +IOS +[Ss]oftware\, +(?P<os>([\S]+)) +Software\, '
-                        r'+(?P<platform>.+) Software +\((?P<image_id>.+)\).+[Vv]ersion '
-                        r'+(?P<version>\S+) +.*$')
+        p1 = regex_engine.compile(r'^[Cc]isco +IOS +[Ss]oftware\, +(?P<os>([\S]+)) +Software\, '
+                                  r'+(?P<platform>.+) Software +\((?P<image_id>.+)\).+[Vv]ersion '
+                                  r'+(?P<version>\S+) +.*$')
 
         # IOS (tm) Catalyst 4000 L3 Switch Software (cat4000-I9S-M), Version 12.2(18)EW5, RELEASE SOFTWARE (fc1)
         # IOS (tm) s72033_rp Software (s72033_rp-ADVENTERPRISEK9_WAN-M), Version 12.2(18)SXF7, RELEASE SOFTWARE (fc1)
         # IOS (tm) C2600 Software (C2600-I-M), Version 12.2(2)XA1, EARLY DEPLOYMENT RELEASE SOFTWARE (fc1)
-        p1_1 = re.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
-                          r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
-                          r' +(?P<version>\S+), +(EARLY DEPLOYMENT )?RELEASE SOFTWARE .*$')
+        p1_1 = regex_engine.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
+                                    r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
+                                    r' +(?P<version>\S+), +(EARLY DEPLOYMENT )?RELEASE SOFTWARE .*$')
 
         # 16.6.5
-        p2 = re.compile(r'^(?P<ver_short>\d+\.\d+).*')
+        p2 = regex_engine.compile(r'^(?P<ver_short>\d+\.\d+).*')
 
         # Cisco IOS Software [Fuji], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.7.1prd4, RELEASE SOFTWARE (fc1)
         # Cisco IOS Software [Fuji], Catalyst L3 Switch Software (CAT3K_CAA-UNIVERSALK9-M), Experimental Version 16.8.20170924:182909 [polaris_dev-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20170924_191550 132]
@@ -403,82 +404,82 @@ class ShowVersion(ShowVersionSchema):
         # Cisco IOS Software [Amsterdam], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.4.20200702:124009 [S2C-build-polaris_dev-116872-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20200702_122021 243]
         # Cisco IOS Software [Denali], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Experimental Version 16.3.20170410:103306 [v163_mr_throttle-BLD-BLD_V163_MR_THROTTLE_LATEST_20170410_093453 118]
         # Cisco IOS Software [IOSXE], Virtual XE Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Experimental Version 17.15.20240326:010319 [BLD_POLARIS_DEV_LATEST_20240326_003112:/nobackup/mcpre/s2c-build-ws 101]
-        p3 = re.compile(r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware\s*\[?(?P<location>\w*)?\]?\, '
-                        r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
-                        r'+Experimental)? +[Vv]ersion '
-                        r'+(?P<version>[\w.:()]+) *,? *'
-                        r'(?P<label>(\[.*?(?P<build_label>BLD_\w+)([-:]\S+)? \d+\])|.*)$')
+        p3 = regex_engine.compile(r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware\s*\[?(?P<location>\w*)?\]?\, '
+                                  r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
+                                  r'+Experimental)? +[Vv]ersion '
+                                  r'+(?P<version>[\w.:()]+) *,? *'
+                                  r'(?P<label>(\[.*?(?P<build_label>BLD_\w+)([-:]\S+)? \d+\])|.*)$')
 
         # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-        p4 = re.compile(r'^Copyright +\(c\) +(?P<copyright_years>\d+-\d+).*$')
+        p4 = regex_engine.compile(r'^Copyright +\(c\) +(?P<copyright_years>\d+-\d+).*$')
 
         # Technical Support: http://www.cisco.com/techsupport
-        p5 = re.compile(r'^Technical +Support: +http\:\/\/www'
-                        r'\.cisco\.com\/techsupport')
+        p5 = regex_engine.compile(r'^Technical +Support: +http\:\/\/www'
+                                  r'\.cisco\.com\/techsupport')
 
         # rom
         # ROM: IOS-XE ROMMONBOOTLDR: System Bootstrap, Version 17.6.1r[FC2], DEVELOPMENT SOFTWARE
-        p6 = re.compile(r'^ROM\:( +(?P<rom>.+?)(?:BOOTLDR\: +(?P<bootldr>.+))?$)?')
+        p6 = regex_engine.compile(r'^ROM\:( +(?P<rom>.+?)(?:BOOTLDR\: +(?P<bootldr>.+))?$)?')
 
         # ROM: Bootstrap program is IOSv
-        p7 = re.compile(r'^Bootstrap +program +is +(?P<os>.+)$')
+        p7 = regex_engine.compile(r'^Bootstrap +program +is +(?P<os>.+)$')
 
         # bootldr
-        p8 = re.compile(r'^BOOTLDR\: +(?P<bootldr>.+)$')
+        p8 = regex_engine.compile(r'^BOOTLDR\: +(?P<bootldr>.+)$')
 
         # hostname & uptime
-        p9 = re.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
+        p9 = regex_engine.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
 
         # uptime_this_cp
-        p10 = re.compile(r'^[Uu]ptime +for +this +control +processor '
-                         r'+is +(?P<uptime_this_cp>.+)$')
+        p10 = regex_engine.compile(r'^[Uu]ptime +for +this +control +processor '
+                                   r'+is +(?P<uptime_this_cp>.+)$')
 
         # system_restarted_at
-        p11 = re.compile(r'^[Ss]ystem +restarted +at '
-                         r'+(?P<system_restarted_at>.+)$')
+        p11 = regex_engine.compile(r'^[Ss]ystem +restarted +at '
+                                   r'+(?P<system_restarted_at>.+)$')
 
         # system_image
         # System image file is "tftp://10.1.6.241//auto/genie-ftp/Edison/cat3k_caa-universalk9.BLD__20170410_174845.SSA.bin"
         # System image file is "harddisk:test-image-PE1-13113029"
-        p12 = re.compile(r'^[Ss]ystem +image +file +is '
-                         r'+\"(?P<system_image>.+)\"')
+        p12 = regex_engine.compile(r'^[Ss]ystem +image +file +is '
+                                   r'+\"(?P<system_image>.+)\"')
 
         # last_reload_reason
-        p13 = re.compile(r'^[Ll]ast +reload +reason\: '
-                         r'+(?P<last_reload_reason>.+)$')
+        p13 = regex_engine.compile(r'^[Ll]ast +reload +reason\: '
+                                   r'+(?P<last_reload_reason>.+)$')
 
         # last_reload_reason
         # Last reset from power-on
-        p14 = re.compile(r'^[Ll]ast +reset +from +(?P<last_reload_reason>.+)$')
+        p14 = regex_engine.compile(r'^[Ll]ast +reset +from +(?P<last_reload_reason>.+)$')
 
         # license_type
-        p15 = re.compile(r'^[Ll]icense +[Tt]ype\: +(?P<license_type>.+)$')
+        p15 = regex_engine.compile(r'^[Ll]icense +[Tt]ype\: +(?P<license_type>.+)$')
 
         # license_level
-        p16 = re.compile(r'^\s*[Ll]icense +[Ll]evel\: +(?P<license_level>.+)$')
+        p16 = regex_engine.compile(r'^\s*[Ll]icense +[Ll]evel\: +(?P<license_level>.+)$')
 
         # entservices   Type: Permanent
-        p16_1 = re.compile(r'(?P<license_level>\S+) +Type\: +(?P<license_type>.+)$')
+        p16_1 = regex_engine.compile(r'(?P<license_level>\S+) +Type\: +(?P<license_type>.+)$')
 
         # AIR License Level: AIR DNA Advantage
-        p16_2 = re.compile(r'^\s*AIR [Ll]icense +[Ll]evel\: +(?P<air_license_level>.+)$')
+        p16_2 = regex_engine.compile(r'^\s*AIR [Ll]icense +[Ll]evel\: +(?P<air_license_level>.+)$')
 
         ## Technology Package License Information:
         ## Technology-package                                     Technology-package
         # Current                        Type                       Next reboot
-        p16_3 = re.compile(r'^Current  +Type  +Next reboot')
+        p16_3 = regex_engine.compile(r'^Current  +Type  +Next reboot')
 
         # network-advantage     Smart License                    network-advantage
         # dna-advantage         Subscription Smart License       dna-advantage
-        p16_4 = re.compile(r'^(?P<license_package>[\w-]+)(?:\s{2,})(?P<package_license_type>(\w+ )+)(?:\s{2,})(?P<next_reload_license_level>\S+)\s*$')
+        p16_4 = regex_engine.compile(r'^(?P<license_package>[\w-]+)(?:\s{2,})(?P<package_license_type>(\w+ )+)(?:\s{2,})(?P<next_reload_license_level>\S+)\s*$')
 
         # next_reload_license_level
-        p17 = re.compile(r'^[Nn]ext +(reload|reboot) +license +Level\: '
-                         r'+(?P<next_reload_license_level>.+)$')
+        p17 = regex_engine.compile(r'^[Nn]ext +(reload|reboot) +license +Level\: '
+                                   r'+(?P<next_reload_license_level>.+)$')
 
         # Next reload AIR license Level: AIR DNA Advantage
-        p17_1 = re.compile(r'^[Nn]ext +(reload|reboot) +AIR license +Level\: '
-                           r'+(?P<next_reload_air_license_level>.+)$')
+        p17_1 = regex_engine.compile(r'^[Nn]ext +(reload|reboot) +AIR license +Level\: '
+                                     r'+(?P<next_reload_air_license_level>.+)$')
 
         # chassis, processor_type, main_mem and rtr_type
         # cisco WS-C3650-24PD (MIPS) processor (revision H0) with 829481K/6147K bytes of memory.
@@ -489,198 +490,198 @@ class ShowVersion(ShowVersionSchema):
         # cisco ISR4451-X/K9 (2RU) processor with 1795979K/6147K bytes of memory.
         # cisco WS-C4507R+E (MPC8572) processor (revision 10) with 2097152K/20480K bytes of memory.
         # Cisco CISCO1941/K9 (revision 1.0) with 491520K/32768K bytes of memory.
-        p18 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
-                         r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
-                         r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18 = regex_engine.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
+                                   r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
+                                   r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
 
         # Cisco CISCO3945-CHASSIS (revision 1.0) with C3900-SPE150/K9 with 1835264K/261888K bytes of memory.
-        p18_2 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +.* '
-                           r'+with +(?P<processor_type>.+) +with +(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18_2 = regex_engine.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +.* '
+                                     r'+with +(?P<processor_type>.+) +with +(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
 
         # Allen-Bradley 1783-CMS10DP (ARM) processor (revision V00) with 634958K/6147K bytes of memory.
-        p18_3 = re.compile(r'^(A|a)llen-Bradley +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
-                         r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
-                         r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18_3 = regex_engine.compile(r'^(A|a)llen-Bradley +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
+                                   r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
+                                   r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
 
         # chassis_sn
-        p19 = re.compile(r'^[pP]rocessor +board +ID '
-                         r'+(?P<chassis_sn>[a-zA-Z0-9]+)')
+        p19 = regex_engine.compile(r'^[pP]rocessor +board +ID '
+                                   r'+(?P<chassis_sn>[a-zA-Z0-9]+)')
 
         # number_of_intfs
-        p20 = re.compile(r'^(?P<number_of_ports>\d+) +(?P<interface>.+) '
-                         r'+(interface(?:s)?|line|port(?:s)?)$')
+        p20 = regex_engine.compile(r'^(?P<number_of_ports>\d+) +(?P<interface>.+) '
+                                   r'+(interface(?:s)?|line|port(?:s)?)$')
 
         # mem_size
-        p21 = re.compile(r'^(?P<mem_size>\d+)K +bytes +of '
-                         r'+(?P<memories>.+) +[Mm]emory\.')
+        p21 = regex_engine.compile(r'^(?P<mem_size>\d+)K +bytes +of '
+                                   r'+(?P<memories>.+) +[Mm]emory\.')
 
         # disks, disk_size and type_of_disk
-        p22 = re.compile(r'^(?P<disk_size>\d+)K bytes of '
-                         r'(?P<type_of_disk>.*) at (?P<disks>.+)$')
+        p22 = regex_engine.compile(r'^(?P<disk_size>\d+)K bytes of '
+                                   r'(?P<type_of_disk>.*) at (?P<disks>.+)$')
 
         # os
         # Cisco IOS Software,
-        p23 = re.compile(r'^[Cc]isco +(?P<os>[a-zA-Z\-]+) '
-                         r'+[Ss]oftware\,')
+        p23 = regex_engine.compile(r'^[Cc]isco +(?P<os>[a-zA-Z\-]+) '
+                                   r'+[Ss]oftware\,')
 
         # curr_config_register
-        p24 = re.compile(r'^[Cc]onfiguration +register +is '
-                         r'+(?P<curr_config_register>[a-zA-Z0-9]+)')
+        p24 = regex_engine.compile(r'^[Cc]onfiguration +register +is '
+                                   r'+(?P<curr_config_register>[a-zA-Z0-9]+)')
 
         # next_config_register
-        p25 = re.compile(r'^[Cc]onfiguration +register +is +[a-zA-Z0-9]+ '
-                         r'+\(will be (?P<next_config_register>[a-zA-Z0-9]+) '
-                         r'at next reload\)')
+        p25 = regex_engine.compile(r'^[Cc]onfiguration +register +is +[a-zA-Z0-9]+ '
+                                   r'+\(will be (?P<next_config_register>[a-zA-Z0-9]+) '
+                                   r'at next reload\)')
 
         # switch_number
-        p26 = re.compile(r'^[Ss]witch +0(?P<switch_number>\d+)$')
+        p26 = regex_engine.compile(r'^[Ss]witch +0(?P<switch_number>\d+)$')
 
         # uptime
-        p27 = re.compile(r'^[Ss]witch +[Uu]ptime +\: +(?P<uptime>.+)$')
+        p27 = regex_engine.compile(r'^[Ss]witch +[Uu]ptime +\: +(?P<uptime>.+)$')
 
         # mac_address
-        p28 = re.compile(r'^[Bb]ase +[Ee]thernet +MAC +[Aa]ddress '
-                         r'+\: +(?P<mac_address>.+)$')
+        p28 = regex_engine.compile(r'^[Bb]ase +[Ee]thernet +MAC +[Aa]ddress '
+                                   r'+\: +(?P<mac_address>.+)$')
 
         # mb_assembly_num
-        p29 = re.compile(r'^[Mm]otherboard +[Aa]ssembly +[Nn]umber +\: '
-                         r'+(?P<mb_assembly_num>.+)$')
+        p29 = regex_engine.compile(r'^[Mm]otherboard +[Aa]ssembly +[Nn]umber +\: '
+                                   r'+(?P<mb_assembly_num>.+)$')
 
         # mb_sn
-        p30 = re.compile(r'^[Mm]otherboard +[Ss]erial +[Nn]umber +\: '
-                         r'+(?P<mb_sn>.+)$')
+        p30 = regex_engine.compile(r'^[Mm]otherboard +[Ss]erial +[Nn]umber +\: '
+                                   r'+(?P<mb_sn>.+)$')
 
         # model_rev_num
-        p31 = re.compile(r'^[Mm]odel +[Rr]evision +[Nn]umber +\: '
-                         r'+(?P<model_rev_num>.+)$')
+        p31 = regex_engine.compile(r'^[Mm]odel +[Rr]evision +[Nn]umber +\: '
+                                   r'+(?P<model_rev_num>.+)$')
 
         # mb_rev_num
-        p32 = re.compile(r'^[Mm]otherboard +[Rr]evision +[Nn]umber +\: '
-                         r'+(?P<mb_rev_num>.+)$')
+        p32 = regex_engine.compile(r'^[Mm]otherboard +[Rr]evision +[Nn]umber +\: '
+                                   r'+(?P<mb_rev_num>.+)$')
 
         # model_num
-        p33 = re.compile(r'^[Mm]odel +[Nn]umber +\: +(?P<model_num>.+)$')
+        p33 = regex_engine.compile(r'^[Mm]odel +[Nn]umber +\: +(?P<model_num>.+)$')
 
         # system_sn
-        p34 = re.compile(r'^[Ss]ystem +[Ss]erial +[Nn]umber +\: +(?P<system_sn>.+)$')
+        p34 = regex_engine.compile(r'^[Ss]ystem +[Ss]erial +[Nn]umber +\: +(?P<system_sn>.+)$')
 
         # Compiled Mon 10-Apr-17 04:35 by mcpre
         # Compiled Mon 19-Mar-18 16:39 by prod_rel_team
-        p36 = re.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
-                         r'+(?P<compiled_by>\w+)$')
+        p36 = regex_engine.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
+                                   r'+(?P<compiled_by>\w+)$')
 
         # System returned to ROM by reload at 15:57:52 CDT Mon Sep 24 2018
         # System returned to ROM by Reload Command at 07:15:43 UTC Fri Feb 1 2019
         # System returned to ROM by reload
         # System returned to ROM by power cycle at 23:31:24 PDT Thu Sep 27 2007 (SP by power on)
         # System returned to ROM by power-on
-        p37 = re.compile(r'^System +returned +to +ROM +by '
-                         r'+(?P<returned_to_rom_by>[\w\s\-]+)(?: +at '
-                         r'+(?P<returned_to_rom_at>[\w\s\:]+))?(?: +\(SP +by '
-                         r'+(?P<sp_by>[\S\s\-]+)\))?$')
+        p37 = regex_engine.compile(r'^System +returned +to +ROM +by '
+                                   r'+(?P<returned_to_rom_by>[\w\s\-]+)(?: +at '
+                                   r'+(?P<returned_to_rom_at>[\w\s\:]+))?(?: +\(SP +by '
+                                   r'+(?P<sp_by>[\S\s\-]+)\))?$')
 
         # Last reload type: Normal Reload
-        p38 = re.compile(
+        p38 = regex_engine.compile(
             r'^Last +reload +type\: +(?P<last_reload_type>[\S ]+)$')
 
         # P2020 CPU at 800MHz, E500v2 core, 512KB L2 Cache
-        p39 = re.compile(r'^(?P<cpu_name>\S+) +(CPU|cpu|Cpu) +at '
-                         r'+(?P<speed>\S+)\,(( +(?P<core>\S+) +core\, '
-                         r'+(?P<l2_cache>\S+) +L2 +[Cc]ache)|( +Supervisor '
-                         r'+(?P<supervisor>\S+)))$')
+        p39 = regex_engine.compile(r'^(?P<cpu_name>\S+) +(CPU|cpu|Cpu) +at '
+                                   r'+(?P<speed>\S+)\,(( +(?P<core>\S+) +core\, '
+                                   r'+(?P<l2_cache>\S+) +L2 +[Cc]ache)|( +Supervisor '
+                                   r'+(?P<supervisor>\S+)))$')
 
         # 98304K bytes of processor board System flash (Read/Write)
-        p40 = re.compile(r'^(?P<processor_board_flash>\S+) +bytes .+$')
+        p40 = regex_engine.compile(r'^(?P<processor_board_flash>\S+) +bytes .+$')
 
         # Running default software
-        p41 = re.compile(r'^Running +(?P<running_default_software>\S+) +software$')
+        p41 = regex_engine.compile(r'^Running +(?P<running_default_software>\S+) +software$')
 
         # Jawa Revision 7, Snowtrooper Revision 0x0.0x1C
-        p42 = re.compile(r'^Jawa +Revision +(?P<jawa_revision>\S+)\, '
-                         r'+Snowtrooper +Revision +(?P<snowtrooper_rev>\S+)$')
+        p42 = regex_engine.compile(r'^Jawa +Revision +(?P<jawa_revision>\S+)\, '
+                                   r'+Snowtrooper +Revision +(?P<snowtrooper_rev>\S+)$')
 
         # ipbase           ipbasek9         Smart License    ipbasek9
         # securityk9       securityk9       RightToUse       securityk9
-        p43 = re.compile(r'^(?P<technology>\w[\w\-]+)(?: {2,}'
-                         r'(?P<license_level>\w+) {2,}(?P<license_type>\w+(?: '
-                         r'+\w+)?) {2,}(?P<next_boot>\w+))?$')
+        p43 = regex_engine.compile(r'^(?P<technology>\w[\w\-]+)(?: {2,}'
+                                   r'(?P<license_level>\w+) {2,}(?P<license_type>\w+(?: '
+                                   r'+\w+)?) {2,}(?P<next_boot>\w+))?$')
 
         # Suite                 Suite Current         Type           Suite Next reboot
         # Technology    Technology-package           Technology-package
-        p44 = re.compile(r'^(?P<aname>Suite|Technology) +((Suite +Current)|'
-                         r'(Technology\-package))')
+        p44 = regex_engine.compile(r'^(?P<aname>Suite|Technology) +((Suite +Current)|'
+                                   r'(Technology\-package))')
 
         # Suite License Information for Module:'esg'
-        p45 = re.compile(r'^[Ss]uite +[Ll]icense +[Ii]nformation +for '
-                         r'+[Mm]odule\:\'(?P<module>\S+)\'$')
+        p45 = regex_engine.compile(r'^[Ss]uite +[Ll]icense +[Ii]nformation +for '
+                                   r'+[Mm]odule\:\'(?P<module>\S+)\'$')
 
         # License UDI:
-        p46_0 = re.compile(r'^License UDI:$')
+        p46_0 = regex_engine.compile(r'^License UDI:$')
 
         #     *0        C3900-SPE150/K9       FOC16050QP6
-        p46 = re.compile(r'^(?P<device_num>[*\d]+) +(?P<pid>[\S]+) +(?P<sn>[A-Z\d]+)$')
+        p46 = regex_engine.compile(r'^(?P<device_num>[*\d]+) +(?P<pid>[\S]+) +(?P<sn>[A-Z\d]+)$')
 
         # Image text-base: 0x40101040, data-base: 0x42D98000
-        p47 = re.compile(r'^Image text-base: +(?P<text_base>\S+), '
-                         r'data-base: +(?P<data_base>\S+)$')
+        p47 = regex_engine.compile(r'^Image text-base: +(?P<text_base>\S+), '
+                                   r'data-base: +(?P<data_base>\S+)$')
 
         # 1 Virtual Ethernet/IEEE 802.3 interface(s)
         # 50 Gigabit Ethernet/IEEE 802.3 interface(s)
-        p48 = re.compile(r'^(?P<interface>\d+) +(?P<ethernet_type>Virtual Ethernet|Gigabit Ethernet|FastEthernet)'
-                         r'/IEEE 802\.3 +interface\(s\)$')
+        p48 = regex_engine.compile(r'^(?P<interface>\d+) +(?P<ethernet_type>Virtual Ethernet|Gigabit Ethernet|FastEthernet)'
+                                   r'/IEEE 802\.3 +interface\(s\)$')
 
         # Dagobah Revision 95, Swamp Revision 6
-        p50 = re.compile(r'^(?P<group1>\S+)\s+Revision\s+(?P<group1_int>\d+),'
-                         r'\s+(?P<group2>\S+)\s+Revision\s+(?P<group2_int>\d+)$')
+        p50 = regex_engine.compile(r'^(?P<group1>\S+)\s+Revision\s+(?P<group1_int>\d+),'
+                                   r'\s+(?P<group2>\S+)\s+Revision\s+(?P<group2_int>\d+)$')
 
         # power_supply_part_nr
         # Power supply part number: 444-8888-00
-        p51 = re.compile(r'^[Pp]ower\s+[Ss]upply\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<power_supply_part_nr>.+)$')
+        p51 = regex_engine.compile(r'^[Pp]ower\s+[Ss]upply\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<power_supply_part_nr>.+)$')
 
         # power_supply_sn
         # Power supply serial number: CCC4466B6LL
-        p52 = re.compile(r'^[Pp]ower\s+[Ss]upply\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<power_supply_sn>.+)$')
+        p52 = regex_engine.compile(r'^[Pp]ower\s+[Ss]upply\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<power_supply_sn>.+)$')
 
         # Daughterboard assembly number   : 73-11111-00
         # db_assembly_num
-        p53 = re.compile(r'^[Dd]aughterboard\s+[Aa]ssembly\s+[Nn]umber\s+\:\s+(?P<db_assembly_num>.+)$')
+        p53 = regex_engine.compile(r'^[Dd]aughterboard\s+[Aa]ssembly\s+[Nn]umber\s+\:\s+(?P<db_assembly_num>.+)$')
 
         # Daughterboard serial number     : FOC87654CWW
         # db_sn
-        p54 = re.compile(r'^[Dd]aughterboard\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<db_sn>.+)$')
+        p54 = regex_engine.compile(r'^[Dd]aughterboard\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<db_sn>.+)$')
 
         # top_assembly_part_num
         # Top Assembly Part Number        : 800-55555-11
-        p55 = re.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<top_assembly_part_num>.+)$')
+        p55 = regex_engine.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<top_assembly_part_num>.+)$')
 
         # top_assembly_rev_num
         # Top Assembly Revision Number    : C0
-        p56 = re.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<top_assembly_rev_num>.+)$')
+        p56 = regex_engine.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<top_assembly_rev_num>.+)$')
 
         # version_id
         # Version ID                      : V02
-        p57 = re.compile(r'^[Vv]ersion\s+ID\s+\:\s+(?P<version_id>.+)$')
+        p57 = regex_engine.compile(r'^[Vv]ersion\s+ID\s+\:\s+(?P<version_id>.+)$')
 
         # clei_code_num
         # CLEI Code Number                : AAALJ00ERT
-        p58 = re.compile(r'^CLEI\s+[Cc]ode\s+[Nn]umber\s+\:\s+(?P<clei_code_num>.+)$')
+        p58 = regex_engine.compile(r'^CLEI\s+[Cc]ode\s+[Nn]umber\s+\:\s+(?P<clei_code_num>.+)$')
 
         # Daughterboard revision number   : A0
         # db_rev_num
-        p59 = re.compile(r'^[Dd]aughterboard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<db_rev_num>.+)$')
+        p59 = regex_engine.compile(r'^[Dd]aughterboard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<db_rev_num>.+)$')
 
         # Hardware Board Revision Number  : 0x12
         # hb_rev_num
-        p60 = re.compile(r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$')
+        p60 = regex_engine.compile(r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$')
 
         # Router operating mode: Controller-Managed
-        p61 = re.compile(r'^Router operating mode: (?P<router_operating_mode>.+)$')
+        p61 = regex_engine.compile(r'^Router operating mode: (?P<router_operating_mode>.+)$')
 
         # Installation mode is BUNDLE
-        p62 = re.compile(r'^Installation\s+mode\s+is\s+(?P<installation_mode>.+)$')
+        p62 = regex_engine.compile(r'^Installation\s+mode\s+is\s+(?P<installation_mode>.+)$')
 
         #System FPGA version                : 0.2.11
-        p63 = re.compile(r'^System FPGA version\s+:\s+(?P<system_fpga_version>(\d+\.?)+)')
+        p63 = regex_engine.compile(r'^System FPGA version\s+:\s+(?P<system_fpga_version>(\d+\.?)+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1427,7 +1428,7 @@ class ShowVersion(ShowVersionSchema):
                 if 'switch_num' not in version_dict['version']:
                     version_dict['version']['switch_num'] = {}
                 if '*' in key:
-                    p = re.compile(r'\**\ *(?P<new_key>\d)')
+                    p = regex_engine.compile(r'\**\ *(?P<new_key>\d)')
                     m = p.match(key)
                     switch_no = m.groupdict()['new_key']
                     if m:
@@ -1529,7 +1530,7 @@ class Dir(DirSchema):
             line = line.rstrip()
 
             # dir
-            p1 = re.compile(
+            p1 = regex_engine.compile(
                 r'^\s*[Dd]irectory +of +(?P<dir>.+)$')
             m = p1.match(line)
             if m:
@@ -1542,7 +1543,7 @@ class Dir(DirSchema):
                 continue
 
             # filename, index, permissions, size and last_modified_date
-            p2 = re.compile(
+            p2 = regex_engine.compile(
                 r'\s*(?P<index>\d+) +(?P<permissions>\S+) +(?P<size>\d+) +(?P<last_modified_date>\S+ +\d+ +\d+ +\d+\:\d+\:\d+ +\S+) +(?P<filename>.+)$')
             m = p2.match(line)
             if m:
@@ -1558,7 +1559,7 @@ class Dir(DirSchema):
                 continue
 
             # bytes_total and bytes_free
-            p3 = re.compile(r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)')
+            p3 = regex_engine.compile(r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)')
             m = p3.match(line)
             if m:
                 dir_dict['dir'][dir1]['bytes_total'] = m.groupdict()['bytes_total']
@@ -1628,7 +1629,7 @@ class ShowRedundancy(ShowRedundancySchema):
             line = line.rstrip()
 
             # available_system_uptime
-            p1 = re.compile(r'\s*[Aa]vailable +[Ss]ystem +[Uu]ptime +\= +(?P<available_system_uptime>.+)$')
+            p1 = regex_engine.compile(r'\s*[Aa]vailable +[Ss]ystem +[Uu]ptime +\= +(?P<available_system_uptime>.+)$')
             m = p1.match(line)
             if m:
                 redundancy_dict.setdefault('red_sys_info', {})
@@ -1637,7 +1638,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # switchovers_system_experienced
-            p2 = re.compile(r'\s*[Ss]witchovers +system +experienced +\= +(?P<switchovers_system_experienced>\d+)$')
+            p2 = regex_engine.compile(r'\s*[Ss]witchovers +system +experienced +\= +(?P<switchovers_system_experienced>\d+)$')
             m = p2.match(line)
             if m:
                 redundancy_dict['red_sys_info']['switchovers_system_experienced'] = \
@@ -1645,7 +1646,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # standby_failures
-            p3 = re.compile(r'\s*[Ss]tandby +failures +\= +(?P<standby_failures>\d+)$')
+            p3 = regex_engine.compile(r'\s*[Ss]tandby +failures +\= +(?P<standby_failures>\d+)$')
             m = p3.match(line)
             if m:
                 redundancy_dict['red_sys_info']['standby_failures'] = \
@@ -1653,7 +1654,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # last_switchover_reason
-            p4 = re.compile(r'^\s*[Ll]ast +[Ss]witchover +[Rr]eason +\= +(?P<last_switchover_reason>.+)$')
+            p4 = regex_engine.compile(r'^\s*[Ll]ast +[Ss]witchover +[Rr]eason +\= +(?P<last_switchover_reason>.+)$')
             m = p4.match(line)
             if m:
                 redundancy_dict['red_sys_info']['last_switchover_reason'] = \
@@ -1661,7 +1662,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # hw_mode
-            p5 = re.compile(r'\s*[Hh]ardware +[Mm]ode +\= +(?P<hw_mode>\S+)$')
+            p5 = regex_engine.compile(r'\s*[Hh]ardware +[Mm]ode +\= +(?P<hw_mode>\S+)$')
             m = p5.match(line)
             if m:
                 redundancy_dict['red_sys_info']['hw_mode'] = \
@@ -1669,7 +1670,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # conf_red_mode
-            p6 = re.compile(r'\s*[Cc]onfigured +[Rr]edundancy +[Mm]ode +\= +(?P<conf_red_mode>[\s\S]+)$')
+            p6 = regex_engine.compile(r'\s*[Cc]onfigured +[Rr]edundancy +[Mm]ode +\= +(?P<conf_red_mode>[\s\S]+)$')
             m = p6.match(line)
             if m:
                 redundancy_dict['red_sys_info']['conf_red_mode'] = \
@@ -1677,7 +1678,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # oper_red_mode
-            p7 = re.compile(r'\s*[Oo]perating +[Rr]edundancy +[Mm]ode +\= +(?P<oper_red_mode>.+)$')
+            p7 = regex_engine.compile(r'\s*[Oo]perating +[Rr]edundancy +[Mm]ode +\= +(?P<oper_red_mode>.+)$')
             m = p7.match(line)
             if m:
                 redundancy_dict['red_sys_info']['oper_red_mode'] = \
@@ -1685,7 +1686,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # maint_mode
-            p7 = re.compile(r'\s*[Mm]aintenance +[Mm]ode +\= +(?P<maint_mode>\S+)$')
+            p7 = regex_engine.compile(r'\s*[Mm]aintenance +[Mm]ode +\= +(?P<maint_mode>\S+)$')
             m = p7.match(line)
             if m:
                 redundancy_dict['red_sys_info']['maint_mode'] = \
@@ -1693,14 +1694,14 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # communications
-            p8 = re.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)$')
+            p8 = regex_engine.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)$')
             m = p8.match(line)
             if m:
                 redundancy_dict['red_sys_info']['communications'] = \
                     m.groupdict()['communications']
 
             # communications_reason
-            p8 = re.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)\s+[Rr]eason\: +(?P<communications_reason>.+)$')
+            p8 = regex_engine.compile(r'^\s*[Cc]ommunications +\= +(?P<communications>\S+)\s+[Rr]eason\: +(?P<communications_reason>.+)$')
             m = p8.match(line)
             if m:
                 redundancy_dict['red_sys_info']['communications'] = \
@@ -1710,7 +1711,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # slot number
-            p9 = re.compile(r'^\s*\S+ +[Ll]ocation +\= +(?P<slot>.+)$')
+            p9 = regex_engine.compile(r'^\s*\S+ +[Ll]ocation +\= +(?P<slot>.+)$')
             m = p9.match(line)
             if m:
                 slot = m.groupdict()['slot']
@@ -1721,7 +1722,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # curr_sw_state
-            p10 = re.compile(r'^\s*[Cc]urrent +[Ss]oftware +[Ss]tate +\= +(?P<curr_sw_state>.+)$')
+            p10 = regex_engine.compile(r'^\s*[Cc]urrent +[Ss]oftware +[Ss]tate +\= +(?P<curr_sw_state>.+)$')
             m = p10.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1730,7 +1731,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # uptime_in_curr_state
-            p11 = re.compile(r'^\s*[Uu]ptime +[Ii]n +[Cc]urrent +[Ss]tate +\= +(?P<uptime_in_curr_state>.+)$')
+            p11 = regex_engine.compile(r'^\s*[Uu]ptime +[Ii]n +[Cc]urrent +[Ss]tate +\= +(?P<uptime_in_curr_state>.+)$')
             m = p11.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1739,7 +1740,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # image_ver
-            p12 = re.compile(r'^\s*[Ii]mage +[Vv]ersion +\= +(?P<image_ver>.+)$')
+            p12 = regex_engine.compile(r'^\s*[Ii]mage +[Vv]ersion +\= +(?P<image_ver>.+)$')
             m = p12.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1748,7 +1749,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # boot
-            p13 = re.compile(r'^\s*BOOT +\= +(?P<boot>.+)$')
+            p13 = regex_engine.compile(r'^\s*BOOT +\= +(?P<boot>.+)$')
             m = p13.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1757,7 +1758,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # config_file
-            p14 = re.compile(r'\s*CONFIG_FILE +\= +(?P<config_file>.?)$')
+            p14 = regex_engine.compile(r'\s*CONFIG_FILE +\= +(?P<config_file>.?)$')
             m = p14.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1766,7 +1767,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # bootldr
-            p15 = re.compile(r'\s*BOOTLDR +\= +(?P<bootldr>.?)$')
+            p15 = regex_engine.compile(r'\s*BOOTLDR +\= +(?P<bootldr>.?)$')
             m = p15.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1775,7 +1776,7 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # config_register
-            p16 = re.compile(r'^\s*[Cc]onfiguration +[Rr]egister = (?P<config_register>.+)$')
+            p16 = regex_engine.compile(r'^\s*[Cc]onfiguration +[Rr]egister = (?P<config_register>.+)$')
             m = p16.match(line)
             if m:
                 if 'slot' in redundancy_dict:
@@ -1823,53 +1824,53 @@ class ShowRedundancyStates(ShowRedundancyStatesSchema):
         ret_dict = {}
 
         # my state = 13 -ACTIVE
-        p1 = re.compile(r'^my +state += +(?P<my_state>[\s\S]+)$')
+        p1 = regex_engine.compile(r'^my +state += +(?P<my_state>[\s\S]+)$')
 
         # peer state = 8  -STANDBY HOT
-        p2 = re.compile(r'^peer +state += +(?P<peer_state>[\s\S]+)$')
+        p2 = regex_engine.compile(r'^peer +state += +(?P<peer_state>[\s\S]+)$')
 
         # Mode = Duplex
-        p3 = re.compile(r'^Mode += +(?P<mode>[\w]+)$')
+        p3 = regex_engine.compile(r'^Mode += +(?P<mode>[\w]+)$')
 
         # Unit = Primary
-        p4 = re.compile(r'^Unit += +(?P<unit>[\w]+)$')
+        p4 = regex_engine.compile(r'^Unit += +(?P<unit>[\w]+)$')
 
         # Unit ID = 48
-        p5 = re.compile(r'^Unit +ID += +(?P<unit_id>[\d]+)$')
+        p5 = regex_engine.compile(r'^Unit +ID += +(?P<unit_id>[\d]+)$')
 
         # Redundancy Mode (Operational) = sso
-        p6 = re.compile(r'^Redundancy +Mode +\(Operational\) += +'
-                        r'(?P<redundancy_mode_operational>[\s\S]+)$')
+        p6 = regex_engine.compile(r'^Redundancy +Mode +\(Operational\) += +'
+                                  r'(?P<redundancy_mode_operational>[\s\S]+)$')
 
         # Redundancy Mode (Configured)  = sso
-        p7 = re.compile(r'^Redundancy +Mode +\(Configured\) += +'
-                        r'(?P<redundancy_mode_configured>[\s\S]+)$')
+        p7 = regex_engine.compile(r'^Redundancy +Mode +\(Configured\) += +'
+                                  r'(?P<redundancy_mode_configured>[\s\S]+)$')
 
         # Redundancy State              = sso
-        p8 = re.compile(r'^Redundancy +State += +(?P<redundancy_state>[\s\S]+)$')
+        p8 = regex_engine.compile(r'^Redundancy +State += +(?P<redundancy_state>[\s\S]+)$')
 
         # Maintenance Mode = Disabled
-        p9 = re.compile(r'^Maintenance +Mode += +(?P<maintenance_mode>[\w]+)$')
+        p9 = regex_engine.compile(r'^Maintenance +Mode += +(?P<maintenance_mode>[\w]+)$')
 
         # Manual Swact = enabled
         # Manual Swact = disabled (system is simplex (no peer unit))
-        p10 = re.compile(r'^Manual +Swact += +(?P<manual_swact>[\w]+)'
-                         r'( +\((?P<manual_swact_reason>.*)\))?$')
+        p10 = regex_engine.compile(r'^Manual +Swact += +(?P<manual_swact>[\w]+)'
+                                   r'( +\((?P<manual_swact_reason>.*)\))?$')
 
         # Communications = Up
         # Communications = Down      Reason: Simplex mode
-        p11 = re.compile(r'^Communications += +(?P<communications>[\w]+)'
-                         r'( +Reason: +(?P<communications_reason>[\s\S]+))?$')
+        p11 = regex_engine.compile(r'^Communications += +(?P<communications>[\w]+)'
+                                   r'( +Reason: +(?P<communications_reason>[\s\S]+))?$')
 
         # client count = 76
-        p12 = re.compile(r'^client +count += +(?P<client_count>[\d]+)$')
+        p12 = regex_engine.compile(r'^client +count += +(?P<client_count>[\d]+)$')
 
         # client_notification_TMR = 30000 milliseconds
-        p13 = re.compile(r'^client_notification_TMR += +'
-                         r'(?P<client_notification_tmr_msec>[\d]+) +milliseconds$')
+        p13 = regex_engine.compile(r'^client_notification_TMR += +'
+                                   r'(?P<client_notification_tmr_msec>[\d]+) +milliseconds$')
 
         # RF debug mask = 0x0
-        p14 = re.compile(r'^RF +debug +mask += +(?P<rf_debug_mask>[\w]+)$')
+        p14 = regex_engine.compile(r'^RF +debug +mask += +(?P<rf_debug_mask>[\w]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2104,38 +2105,38 @@ class ShowInventory(ShowInventorySchema):
         # NAME: "NIM subslot 0/0", DESCR: "Front Panel 3 ports Gigabitethernet Module"
         # NAME: "Modem 0 on Cellular0/2/0", DESCR: "Sierra Wireless EM7455/EM7430"
         # NAME: "1", DESCR: "WS-C3560CX-12PC-S"
-        p1 = re.compile(r'^NAME: +\"(?P<name>.*)\",'
-                        r' +DESCR: +\"(?P<descr>.*)\"$')
+        p1 = regex_engine.compile(r'^NAME: +\"(?P<name>.*)\",'
+                                  r' +DESCR: +\"(?P<descr>.*)\"$')
 
         # Switch 1
         # module 0
-        p1_1 = re.compile(r'^(Switch|[Mm]odule) +(?P<slot>(\S+))')
+        p1_1 = regex_engine.compile(r'^(Switch|[Mm]odule) +(?P<slot>(\S+))')
 
         # Power Supply Module 0
         # Power Supply Module 1
-        p1_2 = re.compile(r'Power Supply Module')
+        p1_2 = regex_engine.compile(r'Power Supply Module')
 
         # SPA subslot 0/0
         # IM subslot 0/1
         # NIM subslot 0/0
-        p1_3 = re.compile(r'^(SPA|IM|NIM|PVDM) +subslot +(?P<slot>(\d+))/(?P<subslot>(\d+))')
+        p1_3 = regex_engine.compile(r'^(SPA|IM|NIM|PVDM) +subslot +(?P<slot>(\d+))/(?P<subslot>(\d+))')
 
         # subslot 0/0 transceiver 0
-        p1_4 = re.compile(r'^subslot +(?P<slot>(\d+))\/(?P<subslot>(.*))')
+        p1_4 = regex_engine.compile(r'^subslot +(?P<slot>(\d+))\/(?P<subslot>(.*))')
 
         # StackPort1/1
-        p1_5 = re.compile(r'^StackPort(?P<slot>(\d+))/(?P<subslot>(\d+))$')
+        p1_5 = regex_engine.compile(r'^StackPort(?P<slot>(\d+))/(?P<subslot>(\d+))$')
 
         # Fan Tray
-        p1_6 = re.compile(r'^Fan +Tray|\d+$')
+        p1_6 = regex_engine.compile(r'^Fan +Tray|\d+$')
 
         # Modem 0 on Cellular0/2/0
-        p1_7 = re.compile(r'^Modem +(?P<modem>\S+) +on +Cellular(?P<slot>\d+)\/(?P<subslot>.*)$')
+        p1_7 = regex_engine.compile(r'^Modem +(?P<modem>\S+) +on +Cellular(?P<slot>\d+)\/(?P<subslot>.*)$')
 
         # Slot 2 Linecard
         # Slot 3 Supervisor
-        p1_8 = re.compile(r'^Slot \d Linecard|Slot \d Supervisor|Slot \d Router$')
-        p1_8 = re.compile(r'^Slot \d Linecard|Slot \d Supervisor|Slot \d Router$')
+        p1_8 = regex_engine.compile(r'^Slot \d Linecard|Slot \d Supervisor|Slot \d Router$')
+        p1_8 = regex_engine.compile(r'^Slot \d Linecard|Slot \d Supervisor|Slot \d Router$')
 
         # PID: ASR-920-24SZ-IM   , VID: V01  , SN: CAT1902V19M
         # PID: SFP-10G-LR        , VID: CSCO , SN: CD180456291
@@ -2146,8 +2147,8 @@ class ShowInventory(ShowInventorySchema):
         # PID: ISR4331/K9        , VID:      , SN:
         # PID: , VID: 1.0  , SN: 1162722191
         # PID: WS-C3560CX-12PC-S , VID: V03  , SN: FOC2419L9KY
-        p2 = re.compile(r'^PID: +(?P<pid>[\S\s]+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
-                        r' +SN:(?: +(?P<sn>(\S+)))?$')
+        p2 = regex_engine.compile(r'^PID: +(?P<pid>[\S\s]+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
+                                  r' +SN:(?: +(?P<sn>(\S+)))?$')
         for line in out.splitlines():
             line = line.strip()
 
@@ -2515,33 +2516,33 @@ class ShowPlatform(ShowPlatformSchema):
         # ----------      C3850    -------------
 
         # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-        p1 = re.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
-                        r'(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
+        p1 = regex_engine.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
+                                  r'(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
 
         # Mac persistency wait time: Indefinite
-        p2 = re.compile(r'^[Mm]ac +persistency +wait +time\: +(?P<mac_persistency_wait_time>[\w\.\:]+)$')
+        p2 = regex_engine.compile(r'^[Mm]ac +persistency +wait +time\: +(?P<mac_persistency_wait_time>[\w\.\:]+)$')
 
         # Switch  Ports    Model                Serial No.   MAC address     Hw Ver.       Sw Ver.
         # ------  -----   ---------             -----------  --------------  -------       --------
         #  1       32     WS-C3850-24P-E        FCW1947C0HH  0057.d2ff.e71b  V07           16.6.1
         #  1       32     C9200-24P             JAD2310213C  dc8c.37ff.ad21  V01           17.05.01
         #  1       32     C9200-24P             JAD2310213C  dc8c.37ff.ad21  V01           2021-03-03_18.
-        p3 = re.compile(r'^(?P<switch>\d+) +(?P<ports>\d+) +'
-                        r'(?P<model>[\w\-]+) +(?P<serial_no>\w+) +'
-                        r'(?P<mac_address>[\w\.\:]+) +'
-                        r'(?P<hw_ver>\w+) +(?P<sw_ver>[\s\S]+)$')
+        p3 = regex_engine.compile(r'^(?P<switch>\d+) +(?P<ports>\d+) +'
+                                  r'(?P<model>[\w\-]+) +(?P<serial_no>\w+) +'
+                                  r'(?P<mac_address>[\w\.\:]+) +'
+                                  r'(?P<hw_ver>\w+) +(?P<sw_ver>[\s\S]+)$')
 
         #                                     Current
         # Switch#   Role        Priority      State
         # -------------------------------------------
         # *1       Active          3          Ready
-        p4 = re.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
-                        r'(?P<priority>\d+) +(?P<state>[\w\s]+)$')
+        p4 = regex_engine.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
+                                  r'(?P<priority>\d+) +(?P<state>[\w\s]+)$')
 
         # ----------      ASR1K    -------------
         # Chassis type: ASR1006
         # Chassis type: ASR-903
-        p5 = re.compile(r'^[Cc]hassis +type: +(?P<chassis>\S+)$')
+        p5 = regex_engine.compile(r'^[Cc]hassis +type: +(?P<chassis>\S+)$')
 
         # Slot      Type                State                 Insert time (ago)
         # --------- ------------------- --------------------- -----------------
@@ -2551,18 +2552,18 @@ class ShowPlatform(ShowPlatformSchema):
         # P1        Unknown             N/A                   never
         # 1/0       SM-X-E2-20UXF       admin down            00:00:03
         # F0        C8500-20X6C         init, active          00:01:37
-        p6 = re.compile(r'^(?P<slot>[\w]+)(\/)?(?P<subslot>\d+)?\s*(?P<name>[\w\-_+\/]+)?\s*'\
-                        r'(?P<state>(ok|unknown|admin down|ok, active|N\/A|ok, standby|init, active'\
-                        r'|ps, fail|empty|incompatible|inserted|fail|disabled|booting|init, standby))\s*'\
-                        r'(?P<insert_time>[\w\.\:]+)$')
+        p6 = regex_engine.compile(r'^(?P<slot>[\w]+)(\/)?(?P<subslot>\d+)?\s*(?P<name>[\w\-_+\/]+)?\s*'\
+                                  r'(?P<state>(ok|unknown|admin down|ok, active|N\/A|ok, standby|init, active'\
+                                  r'|ps, fail|empty|incompatible|inserted|fail|disabled|booting|init, standby))\s*'\
+                                  r'(?P<insert_time>[\w\.\:]+)$')
 
         # 4                             unknown               2d00h
-        p6_1 = re.compile(r'^(?P<slot>\w+) +(?P<state>\w+(\, \w+)?) +(?P<insert_time>[\w\.\:]+)$')
+        p6_1 = regex_engine.compile(r'^(?P<slot>\w+) +(?P<state>\w+(\, \w+)?) +(?P<insert_time>[\w\.\:]+)$')
 
         # Slot      CPLD Version        Firmware Version
         # --------- ------------------- ---------------------------------------
         # 0         00200800            16.2(1r)
-        p7 = re.compile(r'^(?P<slot>\w+) +(?P<cpld_version>\d+|N\/A) +(?P<fireware_ver>[\w\.\(\)\/]+)$')
+        p7 = regex_engine.compile(r'^(?P<slot>\w+) +(?P<cpld_version>\d+|N\/A) +(?P<fireware_ver>[\w\.\(\)\/]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2888,51 +2889,51 @@ class ShowBoot(ShowBootSchema):
         switch_number = 0
 
         # Current Boot Variables:
-        p1 = re.compile(r'Current +Boot +Variables:$')
+        p1 = regex_engine.compile(r'Current +Boot +Variables:$')
 
         # Boot Variables on next reload:
-        p1_2 = re.compile(r'Boot +Variables +on +next +reload:$')
+        p1_2 = regex_engine.compile(r'Boot +Variables +on +next +reload:$')
 
         # BOOT variable = bootflash:/asr1000rpx.bin,12;
         # BOOT variable = flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150907_031219.bin;
         #                 flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150828_174328.SSA.bin;flash:ISSUCleanGolden;
         # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200427_012602.SSA.bin
         # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200428_021754.SSA.bin;bootflash:/cat9k_iosxe.BLD_POLARIS_DEV_LATEST_20200429_051305.SSA_starfleet-1.bin;
-        p1_1 = re.compile(r'^BOOT +variable +=( *(?P<var>\S+);?)?$')
+        p1_1 = regex_engine.compile(r'^BOOT +variable +=( *(?P<var>\S+);?)?$')
 
         # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-        p2 = re.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
+        p2 = regex_engine.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
 
         # Configuration register is 0x2002
         # Configuration Register is 0x102
-        p3 = re.compile(r'^Configuration +[r|R]egister +is +(?P<var>\w+)$')
+        p3 = regex_engine.compile(r'^Configuration +[r|R]egister +is +(?P<var>\w+)$')
 
         # Standby Configuration register is 0x2002
-        p4 = re.compile(r'^Standby +Configuration +register'
-                        r' +is +(?P<var>\w+)$')
+        p4 = regex_engine.compile(r'^Standby +Configuration +register'
+                                  r' +is +(?P<var>\w+)$')
 
         # Manual Boot = yes
-        p5 = re.compile(r'^Manual +Boot += +(?P<var>\w+)$')
+        p5 = regex_engine.compile(r'^Manual +Boot += +(?P<var>\w+)$')
 
         # MANUAL_BOOT variable = no
-        p5_1 = re.compile(r'(^MANUAL_BOOT +variable) += +(?P<var>\w+)$')
+        p5_1 = regex_engine.compile(r'(^MANUAL_BOOT +variable) += +(?P<var>\w+)$')
 
         # Standby MANUAL_BOOT variable = no
-        p5_2 = re.compile(r'(^Standby +MANUAL_BOOT +variable) += +(?P<var>\w+)$')
+        p5_2 = regex_engine.compile(r'(^Standby +MANUAL_BOOT +variable) += +(?P<var>\w+)$')
 
         # Enable Break = yes
-        p6 = re.compile(r'^Enable +Break += +(?P<var>\w+)$')
+        p6 = regex_engine.compile(r'^Enable +Break += +(?P<var>\w+)$')
 
         # Boot Mode = DEVICE
-        p7 = re.compile(r'^Boot +Mode += +(?P<var>\S+)$')
+        p7 = regex_engine.compile(r'^Boot +Mode += +(?P<var>\S+)$')
 
         # iPXE Timeout = 0
-        p8 = re.compile(r'^iPXE +Timeout +=? +(?P<var>\w+)$')
+        p8 = regex_engine.compile(r'^iPXE +Timeout +=? +(?P<var>\w+)$')
 
         # BOOT path-list{      : flash:/c2960x-universalk9-mz.152-4.E8.bin
         # HELPER path-list    :
-        p9 = re.compile(r'^(?P<key>BOOT|HELPER) +path\-list +\:(?: '
-                        r'+(?P<value>[\w\:\/\-\.]+)?)$')
+        p9 = regex_engine.compile(r'^(?P<key>BOOT|HELPER) +path\-list +\:(?: '
+                                  r'+(?P<value>[\w\:\/\-\.]+)?)$')
 
         # Config file         : flash:/config.text
         # Private Config file : flash:/private-config.text
@@ -2941,24 +2942,24 @@ class ShowBoot(ShowBootSchema):
         # Allow Dev Key         : yes
         # Auto upgrade        : no
         # Auto upgrade path   :
-        p10 = re.compile(r'^(?P<key>[\w\s]+) +\: +(?P<value>[\w\:\/\-\.]+)$')
+        p10 = regex_engine.compile(r'^(?P<key>[\w\s]+) +\: +(?P<value>[\w\:\/\-\.]+)$')
 
         # buffer size:   524288
-        p11 = re.compile(r'buffer +size\: +(?P<value>\d+)$')
+        p11 = regex_engine.compile(r'buffer +size\: +(?P<value>\d+)$')
 
         # Download:    0 seconds
-        p12 = re.compile(r'Download\: +(?P<value>\d+ +\w+)$')
+        p12 = regex_engine.compile(r'Download\: +(?P<value>\d+ +\w+)$')
 
         # via DHCP:       disabled (next boot: disabled)
-        p13 = re.compile(r'via +DHCP\: +(?P<value>\w+) +\(next +boot\: '
-                            r'+(?P<next_boot>\w+)\)$')
+        p13 = regex_engine.compile(r'via +DHCP\: +(?P<value>\w+) +\(next +boot\: '
+                                      r'+(?P<next_boot>\w+)\)$')
 
         # Switch 2
         # switch 3
-        p14 = re.compile(r'^[Ss]witch +(?P<switch_number>\d+)$')
+        p14 = regex_engine.compile(r'^[Ss]witch +(?P<switch_number>\d+)$')
 
         # BOOT path-list      :
-        p15 = re.compile(r'^(?P<key>BOOT) +path\-list +\:$')
+        p15 = regex_engine.compile(r'^(?P<key>BOOT) +path\-list +\:$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3202,12 +3203,12 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
         # initial regexp pattern
 
         # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-        p1 = re.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
-                        r'(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
+        p1 = regex_engine.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
+                                  r'(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
 
         # Mac persistency wait time: Indefinite
-        p2 = re.compile(r'^[Mm]ac +persistency +wait +time\: +'
-                        r'(?P<mac_persistency_wait_time>[\w\.\:]+)$')
+        p2 = regex_engine.compile(r'^[Mm]ac +persistency +wait +time\: +'
+                                  r'(?P<mac_persistency_wait_time>[\w\.\:]+)$')
 
         #                                              H/W   Current
         # Switch#   Role    Mac Address     Priority Version  State
@@ -3215,24 +3216,24 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
         # *1       Active   689c.e2ff.b9d9     3      V04     Ready
         #  2       Standby  689c.e2ff.b9d9     14             Ready
         #  3       Member   bbcc.fcff.7b00     15     0       V-Mismatch
-        p3_0 = re.compile(r'^Switch#\s+Role\s+Mac\sAddress\s+Priority\s+Version\s+State$')
+        p3_0 = regex_engine.compile(r'^Switch#\s+Role\s+Mac\sAddress\s+Priority\s+Version\s+State$')
 
-        p3_1 = re.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
-                           r'(?P<mac_address>[\w\.]+) +'
-                           r'(?P<priority>\d+) +'
-                           r'(?P<hw_ver>\w+)? +'
-                           r'(?P<state>[\w\s-]+)$')
+        p3_1 = regex_engine.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
+                                     r'(?P<mac_address>[\w\.]+) +'
+                                     r'(?P<priority>\d+) +'
+                                     r'(?P<hw_ver>\w+)? +'
+                                     r'(?P<state>[\w\s-]+)$')
 
         #          Stack Port Status             Neighbors
         # Switch#  Port 1     Port 2           Port 1   Port 2
         #   1         OK         OK               3        2
         #   1       DOWN       DOWN             None     None
-        p4_0 = re.compile(r'^Switch#\s+Port\s1\s+Port\s2\s+Port\s1\s+Port\s2$')
+        p4_0 = regex_engine.compile(r'^Switch#\s+Port\s1\s+Port\s2\s+Port\s1\s+Port\s2$')
 
-        p4_1 = re.compile(r'^(?P<switch>\d+) +(?P<status1>\w+) +'
-                           r'(?P<status2>\w+) +'
-                           r'(?P<nbr_num_1>\w+) +'
-                           r'(?P<nbr_num_2>\w+)$')
+        p4_1 = regex_engine.compile(r'^(?P<switch>\d+) +(?P<status1>\w+) +'
+                                     r'(?P<status2>\w+) +'
+                                     r'(?P<nbr_num_1>\w+) +'
+                                     r'(?P<nbr_num_2>\w+)$')
 
         active_table = 0
 
@@ -3436,82 +3437,82 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
         ret_dict = {}
 
         # SWITCH: 1
-        p0 = re.compile(r'^SWITCH: +(?P<switch>\d+)$')
+        p0 = regex_engine.compile(r'^SWITCH: +(?P<switch>\d+)$')
 
         # Switch 1 FAN 1 is OK
-        p1 = re.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN\s+(?P<fan>\d+)\s+is\s+(?P<state>\S+)$')
+        p1 = regex_engine.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN\s+(?P<fan>\d+)\s+is\s+(?P<state>\S+)$')
 
         # Switch 1 FAN 1 direction is Front to Back
-        p1_1 = re.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN +(?P<fan>\d+)\s+direction\s+is\s+(?P<direction>[\w\s]+)$')
+        p1_1 = regex_engine.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN +(?P<fan>\d+)\s+direction\s+is\s+(?P<direction>[\w\s]+)$')
 
         # Switch   FAN   Speed   State
         # ---------------------------------------------------
         # 1     1 35840     OK
-        p1_2 = re.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)$')
+        p1_2 = regex_engine.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)$')
 
         # Switch     FAN     Speed   State   Airflow direction
         # ---------------------------------------------------
         # 2           1       5600    OK     Front to Back
-        p1_3 = re.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)\s+(?P<direction>[\w\s]+)$')
+        p1_3 = regex_engine.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)\s+(?P<direction>[\w\s]+)$')
 
         # FAN PS-1 is NOT PRESENT
         # FAN PS-2 is OK
-        p2 = re.compile(r'^FAN\s+PS\-(?P<ps>\d+)\s+is\s+(?P<state>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^FAN\s+PS\-(?P<ps>\d+)\s+is\s+(?P<state>[\w\s]+)$')
 
         # Switch 1: SYSTEM TEMPERATURE is OK
         # SYSTEM TEMPERATURE is OK
-        p3 = re.compile(r'^(Switch\s+(?P<switch>\d+):\s+)?SYSTEM\s+TEMPERATURE\s+is\s+(?P<state>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^(Switch\s+(?P<switch>\d+):\s+)?SYSTEM\s+TEMPERATURE\s+is\s+(?P<state>[\w\s]+)$')
 
         # Inlet Temperature Value: 34 Degree Celsius
         # Hotspot Temperature Value: 45 Degree Celsius
         # ASIC Temperature Value: 36 Degree Celsius
         # System Temperature Value: 41 Degree Celsius
         # Temperature Value: 28 Degree Celsius
-        p4 = re.compile(r'^((?P<type>\w+)\s+)?Temperature\s+Value:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
+        p4 = regex_engine.compile(r'^((?P<type>\w+)\s+)?Temperature\s+Value:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
 
         # System Temperature State: GREEN
         # Temperature State: GREEN
-        p5 = re.compile(r'^(System\s+)?Temperature\s+State:\s+(?P<state>\w+)$')
+        p5 = regex_engine.compile(r'^(System\s+)?Temperature\s+State:\s+(?P<state>\w+)$')
 
 
         # Yellow Threshold : 66 Degree Celsius
         # Red Threshold    : 76 Degree Celsius
-        p6 = re.compile(r'^(?P<color>\w+)\s+Threshold\s*:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
+        p6 = regex_engine.compile(r'^(?P<color>\w+)\s+Threshold\s*:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
 
         # POWER SUPPLY 1A TEMPERATURE: OK
         # POWER SUPPLY 1B TEMPERATURE: Not Present
-        p7 = re.compile(r'^POWER\s+SUPPLY\s+(?P<switch>\d+)(?P<power_supply>A|B)\s+'
-                        r'TEMPERATURE:\s+(?P<temperature>[\w\s]+)$')
+        p7 = regex_engine.compile(r'^POWER\s+SUPPLY\s+(?P<switch>\d+)(?P<power_supply>A|B)\s+'
+                                  r'TEMPERATURE:\s+(?P<temperature>[\w\s]+)$')
 
         # 1A  PWR-C1-715WAC       DCB1844G1ZY  OK              Good     Good     715
         # 1A  PWR-C2-1025WAC      DCB1636C003  OK              Good     Good     250/775
         # 1B  Not Present
-        p8 = re.compile(r'^(?P<sw>\d+)(?P<ps>\w+)\s*'
-                        r'((?P<pid>[\w\-]+)\s+'
-                        r'(?P<serial_number>\w+)\s+)?'
-                        r'(?P<status>(\w+|Not\sPresent|No\s+Input\s+Power))\s*'
-                        r'((?P<system_power>\w+)\s+'
-                        r'(?P<poe_power>[\w\/]+)\s+'
-                        r'(?P<watts>[\w\/]+))?$')
+        p8 = regex_engine.compile(r'^(?P<sw>\d+)(?P<ps>\w+)\s*'
+                                  r'((?P<pid>[\w\-]+)\s+'
+                                  r'(?P<serial_number>\w+)\s+)?'
+                                  r'(?P<status>(\w+|Not\sPresent|No\s+Input\s+Power))\s*'
+                                  r'((?P<system_power>\w+)\s+'
+                                  r'(?P<poe_power>[\w\/]+)\s+'
+                                  r'(?P<watts>[\w\/]+))?$')
 
         # 1   Not Present     <>
-        p9 = re.compile(r'^(?P<switch>\d+)\s+(?P<status>\w+|Not\s+Present)\s+'
-                         r'(?P<rps_name>\w+|<>)(\s+(?P<rps_serial_num>\w+)\s+'
-                         r'(?P<rps_port_num>\w+))?$')
+        p9 = regex_engine.compile(r'^(?P<switch>\d+)\s+(?P<status>\w+|Not\s+Present)\s+'
+                                   r'(?P<rps_name>\w+|<>)(\s+(?P<rps_serial_num>\w+)\s+'
+                                   r'(?P<rps_port_num>\w+))?$')
 
         #Gi1/1/1        Type3          60(w)     Available
-        p10 = re.compile(r'^(?P<power_source>[\w./]+)\s+(?P<type>\w+)\s+(?P<watts>\S+)\(w\)\s+(?P<mode>\S+)')
+        p10 = regex_engine.compile(r'^(?P<power_source>[\w./]+)\s+(?P<type>\w+)\s+(?P<watts>\S+)\(w\)\s+(?P<mode>\S+)')
 
         #A.C. Input     Auxilliary     150(w)    Available
-        p11 = re.compile(r'^(?P<power_source>A.C. Input|\S+)\s+(?P<type>\w+)\s+(?P<watts>\S+)\(w\)\s+(?P<mode>\S+)')
+        p11 = regex_engine.compile(r'^(?P<power_source>A.C. Input|\S+)\s+(?P<type>\w+)\s+(?P<watts>\S+)\(w\)\s+(?P<mode>\S+)')
 
         #Built-In                      310(w)
-        p12 = re.compile(r'^(?P<power_source>A.C. Input|\S+)\s+(?P<watts>\S+)\(w\)')
+        p12 = regex_engine.compile(r'^(?P<power_source>A.C. Input|\S+)\s+(?P<watts>\S+)\(w\)')
 
         # Switch   FAN     Speed   State   Airflow direction
         # ---------------------------------------------------
         #     1       1     5160      OK     Front to Back
-        p13 = re.compile(r'^\s*(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)\s+(?P<direction>\S+\s+\S+\s+\S+)$')
+        p13 = regex_engine.compile(r'^\s*(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)\s+(?P<direction>\S+\s+\S+\s+\S+)$')
 
         #Sensor          Location        State               Reading       Range(min-max)
         # PS1 Vout        1               GOOD               12000 mV          na
@@ -3519,12 +3520,12 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
         # PS1 Powout      1               GOOD              300000 mW          na
         # PS1 Hotspot     1               GOOD                  24 Celsius     na
         # PS1 Fan Status  1               GOOD               43008 rpm         na
-        p14 = re.compile(r"^\s*(?P<sensor>PS\d+\s+\S+(?:\s+\S+)?)\s+(?P<location>\d+)\s+(?P<state>\S+)\s+(?P<reading>\d+)\s+(?P<unit>\S+)\s+\S+")
+        p14 = regex_engine.compile(r"^\s*(?P<sensor>PS\d+\s+\S+(?:\s+\S+)?)\s+(?P<location>\d+)\s+(?P<state>\S+)\s+(?P<reading>\d+)\s+(?P<unit>\S+)\s+\S+")
 
         # SYSTEM INLET    1               GREEN                 23 Celsius   0 - 56
         # SYSTEM OUTLET   1               GREEN                 28 Celsius   0 - 125
         # SYSTEM HOTSPOT  1               GREEN                 38 Celsius   0 - 125
-        p15 = re.compile(r"^\s*(?P<sensor>SYSTEM+\s+\S+(?:\s+\S+)?)\s+(?P<location>\d+)\s+(?P<state>\S+)\s+(?P<reading>\d+)\s+(?P<unit>\S+)\s+(?P<range>\d+\s*-\s*\d+)$")
+        p15 = regex_engine.compile(r"^\s*(?P<sensor>SYSTEM+\s+\S+(?:\s+\S+)?)\s+(?P<location>\d+)\s+(?P<state>\S+)\s+(?P<reading>\d+)\s+(?P<unit>\S+)\s+(?P<range>\d+\s*-\s*\d+)$")
         # set default value for switch
         switch = 1
 
@@ -4004,13 +4005,13 @@ class ShowModule(ShowModuleSchema):
         switch_flag = False
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<switch>\d+) *'
-                        r'(?P<port>\w+) +'
-                        r'(?P<model>[\w\-]+) +'
-                        r'(?P<serial_number>\w+) +'
-                        r'(?P<mac_address>[\w\.]+) +'
-                        r'(?P<hw_ver>\w+) +'
-                        r'(?P<sw_ver>[\w\.]+)$')
+        p1 = regex_engine.compile(r'^(?P<switch>\d+) *'
+                                  r'(?P<port>\w+) +'
+                                  r'(?P<model>[\w\-]+) +'
+                                  r'(?P<serial_number>\w+) +'
+                                  r'(?P<mac_address>[\w\.]+) +'
+                                  r'(?P<hw_ver>\w+) +'
+                                  r'(?P<sw_ver>[\w\.]+)$')
 
         # Chassis Type: C9500X-28C8D
 
@@ -4018,28 +4019,28 @@ class ShowModule(ShowModuleSchema):
         # ---+-----+--------------------------------------+--------------+--------------
         # 1   38   Cisco Catalyst 9500X-28C8D Switch           C9500X-28C8D     FDO25030SLN
 
-        p2=re.compile(r'^(?P<mod>\d+) +(?P<ports>\d+) +(?P<card_type>[\w\/()\-\+]+(?: [\w\/()\-\+]+)*) +(?P<model>\S+)(\s+)?(?P<serial>\S+)?$')
+        p2=regex_engine.compile(r'^(?P<mod>\d+) +(?P<ports>\d+) +(?P<card_type>[\w\/()\-\+]+(?: [\w\/()\-\+]+)*) +(?P<model>\S+)(\s+)?(?P<serial>\S+)?$')
 
         # Mod MAC addresses                    Hw   Fw           Sw                 Status
         # ---+--------------------------------+----+------------+------------------+--------
         # 1   F87A.4125.1400 to F87A.4125.147D 0.2  17.7.0.41     BLD_POLARIS_DEV_LA ok
 
-        p3=re.compile(r'^(?P<mod>\d+) +(?P<mac_address>([\w\.]+ +to +[\w\.]+)|unknown) +(?P<hw>\S+) +(?P<fw>\S+) +(?P<sw>\S+) +(?P<status>\S+)$')
+        p3=regex_engine.compile(r'^(?P<mod>\d+) +(?P<mac_address>([\w\.]+ +to +[\w\.]+)|unknown) +(?P<hw>\S+) +(?P<fw>\S+) +(?P<sw>\S+) +(?P<status>\S+)$')
 
         # Mod Redundancy Role     Operating Redundancy Mode Configured Redundancy Mode
         # ---+-------------------+-------------------------+---------------------------
         # 1   Active              non-redundant             Non-redundant
 
-        p4=re.compile(r'^(?P<mod>\d+) *(?P<redundancy_role>\S+) *(?P<operating_redundancy_mode>\S+) *(?P<configured_redundancy_mode>\S+)$')
+        p4=regex_engine.compile(r'^(?P<mod>\d+) *(?P<redundancy_role>\S+) *(?P<operating_redundancy_mode>\S+) *(?P<configured_redundancy_mode>\S+)$')
 
         # Chassis MAC address range: 512 addresses from f87a.4125.1400 to f87a.4125.15ff
-        p5=re.compile(r'^Chassis MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$')
+        p5=regex_engine.compile(r'^Chassis MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$')
 
         # Switch Number 1
-        p6 = re.compile(r'^Switch\s+Number\s+(?P<switch_number>\d+)$')
+        p6 = regex_engine.compile(r'^Switch\s+Number\s+(?P<switch_number>\d+)$')
 
         # Chassis 1 MAC address range: 512 addresses from 40b5.c1ff.ee00 to 40b5.c1ff.efff
-        p7=re.compile(r'^Chassis\s*(?P<chassis>\d+)\s*MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$')
+        p7=regex_engine.compile(r'^Chassis\s*(?P<chassis>\d+)\s*MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$')
 
 
         for line in output.splitlines():
@@ -4239,15 +4240,15 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
 
         # initial regexp pattern
         #Core 0 : CPU utilization for five seconds: 5%/1%; one minute: 6%; five minutes: 6%
-        p1 = re.compile(r'^(Core\s+(?P<core>[\w\s]+): +)?CPU +utilization +for +five +seconds: '
-                        r'+(?P<five_sec_cpu_total>\d+)\%(\/(?P<five_sec_cpu_interrupts>\d+)\%)?; +one +minute: '
-                        r'+(?P<one_min_cpu>\d+)\%; +five +minutes: +(?P<five_min_cpu>\d+)\%$')
+        p1 = regex_engine.compile(r'^(Core\s+(?P<core>[\w\s]+): +)?CPU +utilization +for +five +seconds: '
+                                  r'+(?P<five_sec_cpu_total>\d+)\%(\/(?P<five_sec_cpu_interrupts>\d+)\%)?; +one +minute: '
+                                  r'+(?P<one_min_cpu>\d+)\%; +five +minutes: +(?P<five_min_cpu>\d+)\%$')
 
         #PID    Runtime(ms) Invoked  uSecs  5Sec     1Min     5Min     TTY   Process
         # 5782   2045595     13521147 208    4.52     6.10     5.85     0     iosd
         # 22     1520051     62763660 24     0.02     0.02     0.02     0     sirq-net-rx/1
-        p2 = re.compile(r'^(?P<pid>\d+) +(?P<runtime>\d+) +(?P<invoked>\d+) +(?P<usecs>\d+) +(?P<five_sec_cpu>[\d\.]+)(\%)? +'
-                        r'(?P<one_min_cpu>[\d\.]+)(\%)? +(?P<five_min_cpu>[\d\.]+)(\%)? +(?P<tty>\d+) +(?P<process>.+)$')
+        p2 = regex_engine.compile(r'^(?P<pid>\d+) +(?P<runtime>\d+) +(?P<invoked>\d+) +(?P<usecs>\d+) +(?P<five_sec_cpu>[\d\.]+)(\%)? +'
+                                  r'(?P<one_min_cpu>[\d\.]+)(\%)? +(?P<five_min_cpu>[\d\.]+)(\%)? +(?P<tty>\d+) +(?P<process>.+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4344,21 +4345,21 @@ class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
         # initial regexp pattern
 
         # CPU utilization for five seconds: 43%, one minute: 44%, five minutes: 44%
-        p1 = re.compile(r'^CPU +utilization +for +five +seconds: +(?P<cpu_util_five_secs>[\d\%]+),'
-                        r' +one +minute: +(?P<cpu_util_one_min>[\d\%]+),'
-                        r' +five +minutes: +(?P<cpu_util_five_min>[\d\%]+)$')
+        p1 = regex_engine.compile(r'^CPU +utilization +for +five +seconds: +(?P<cpu_util_five_secs>[\d\%]+),'
+                                  r' +one +minute: +(?P<cpu_util_one_min>[\d\%]+),'
+                                  r' +five +minutes: +(?P<cpu_util_five_min>[\d\%]+)$')
 
         # Core 0: CPU utilization for five seconds:  6%, one minute: 11%, five minutes: 11%
-        p2 = re.compile(r'^(?P<core>[\w\s]+): +CPU +utilization +for'
-                        r' +five +seconds: +(?P<core_cpu_util_five_secs>\d+\%+),'
-                        r' +one +minute: +(?P<core_cpu_util_one_min>[\d+\%]+),'
-                        r' +five +minutes: +(?P<core_cpu_util_five_min>[\d+\%]+)$')
+        p2 = regex_engine.compile(r'^(?P<core>[\w\s]+): +CPU +utilization +for'
+                                  r' +five +seconds: +(?P<core_cpu_util_five_secs>\d+\%+),'
+                                  r' +one +minute: +(?P<core_cpu_util_one_min>[\d+\%]+),'
+                                  r' +five +minutes: +(?P<core_cpu_util_five_min>[\d+\%]+)$')
 
         # 21188   21176    599%    600%    599%  R           478632  ucode_pkt_PPE0
-        p3 = re.compile(r'^(?P<pid>\d+) +(?P<ppid>\d+)'
-                        r' +(?P<five_sec>[\d\%]+) +(?P<one_min>[\d\%]+)'
-                        r' +(?P<five_min>[\d\%]+) +(?P<status>[\w]+)'
-                        r' +(?P<size>\d+) +(?P<name>.*)$')
+        p3 = regex_engine.compile(r'^(?P<pid>\d+) +(?P<ppid>\d+)'
+                                  r' +(?P<five_sec>[\d\%]+) +(?P<one_min>[\d\%]+)'
+                                  r' +(?P<five_min>[\d\%]+) +(?P<status>[\w]+)'
+                                  r' +(?P<size>\d+) +(?P<name>.*)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4451,13 +4452,13 @@ class ShowEnvironment(ShowEnvironmentSchema):
         ret_dict = {}
 
         # Number of Critical alarms:  0
-        p1 = re.compile(r'^Number +of +Critical +alarms: +(?P<critic_larams>\d+)$')
+        p1 = regex_engine.compile(r'^Number +of +Critical +alarms: +(?P<critic_larams>\d+)$')
 
         # Number of Major alarms:     0
-        p2 = re.compile(r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$')
+        p2 = regex_engine.compile(r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$')
 
         # Number of Minor alarms:     0
-        p3 = re.compile(r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$')
+        p3 = regex_engine.compile(r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$')
 
         # Slot    Sensor       Current State       Reading          Threshold(Minor,Major,Critical,Shutdown)
         # ----    ------       -------------       -------          ---------------------------------------
@@ -4474,7 +4475,7 @@ class ShowEnvironment(ShowEnvironmentSchema):
 
         #R0 Temp: Inlet Critical 47 Celsius (na ,na ,47 ,na )(Celsius)
         #R0 Temp: Internal Normal 47 Celsius (na ,na ,na ,na )(Celsius)
-        p4 = re.compile(r'^(?P<slot>\S+) +(?P<sensor_name>.+?)\s+(?P<state>Normal|Critical|Warning|Fan +Speed +\d+%)\s+(?P<reading>\d+\s*\S+\s*?\S*?)(\s*?(?P<threshold>na|\([\d|na,\s]+\)(\(Celsius\))?))?$')
+        p4 = regex_engine.compile(r'^(?P<slot>\S+) +(?P<sensor_name>.+?)\s+(?P<state>Normal|Critical|Warning|Fan +Speed +\d+%)\s+(?P<reading>\d+\s*\S+\s*?\S*?)(\s*?(?P<threshold>na|\([\d|na,\s]+\)(\(Celsius\))?))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4618,22 +4619,22 @@ class ShowVersionRp(ShowVersionRpSchema):
 
         # Package: rpbase, version: 03.16.04a.S.155-3.S4a-ext, status: active
         # Package: Provisioning File, version: n/a, status: active
-        p1 = re.compile(r'^Package: +(?P<package_name>[\w\d\s]+),'
-                        r' +version: +(?P<version>[\w\d\.\-\/]+),'
-                        r' +status: +(?P<status>[\w\/]+)$')
+        p1 = regex_engine.compile(r'^Package: +(?P<package_name>[\w\d\s]+),'
+                                  r' +version: +(?P<version>[\w\d\.\-\/]+),'
+                                  r' +status: +(?P<status>[\w\/]+)$')
 
         #   File: consolidated:asr1000rp2-rpbase.03.16.04a.S.155-3.S4a-ext.pkg, on: RP0
-        p2 = re.compile(r'^File: +consolidated:(?P<file>[\w\d\-\.]+),'
-                        r' +on: +(?P<rp_slot>[\w\d\/]+)$')
+        p2 = regex_engine.compile(r'^File: +consolidated:(?P<file>[\w\d\-\.]+),'
+                                  r' +on: +(?P<rp_slot>[\w\d\/]+)$')
 
         # Built: 2016-10-04_12.28, by: mcpre
         # Built: n/a, by: n/a
-        p3 = re.compile(r'^Built: +(?P<built_time>[\w\d\:\.\_\/\-]+),'
-                        r' +by: +(?P<built_by>[\w\d\/]+)$')
+        p3 = regex_engine.compile(r'^Built: +(?P<built_time>[\w\d\:\.\_\/\-]+),'
+                                  r' +by: +(?P<built_by>[\w\d\/]+)$')
 
         #   File SHA1 checksum: 79e234871520fd480dc1128058160b4e2acee9f7
-        p4 = re.compile(r'^File +SHA1 +checksum:'
-                        r' +(?P<file_sha1_checksum>[\w\d]+)$')
+        p4 = regex_engine.compile(r'^File +SHA1 +checksum:'
+                                  r' +(?P<file_sha1_checksum>[\w\d]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4739,47 +4740,47 @@ class ShowPlatformPower(ShowPlatformPowerSchema):
         ret_dict = {}
 
         # Chassis type: ASR1006-X
-        p1 = re.compile(r'^\s*Chassis +type\: +(?P<chassis>[\w\-]+)')
+        p1 = regex_engine.compile(r'^\s*Chassis +type\: +(?P<chassis>[\w\-]+)')
 
         # Power Redundancy Mode: nplus1
-        p2 = re.compile(r'^\s*Power +Redundancy +Mode\: +(?P<redundancy_mode>[\w]+)')
+        p2 = regex_engine.compile(r'^\s*Power +Redundancy +Mode\: +(?P<redundancy_mode>[\w]+)')
 
         # Power Allocation Status: Sufficient
-        p3 = re.compile(r'^\s*Power +Allocation +Status\: +(?P<allocation_status>[\w]+)')
+        p3 = regex_engine.compile(r'^\s*Power +Allocation +Status\: +(?P<allocation_status>[\w]+)')
 
         # Slot      Type                State                 Allocation(W)
         # 0         ASR1000-SIP40       ok                    64
         #  0/0      SPA-8X1GE-V2        inserted              14
         #  0/1      SPA-1X10GE-L-V2     inserted              17.40
-        p4 = re.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w-]+) '
-                        r'+(?P<state>\w+(?:\, \w+)?) +(?P<allocation>[\d.]+)$')
+        p4 = regex_engine.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w-]+) '
+                                  r'+(?P<state>\w+(?:\, \w+)?) +(?P<allocation>[\d.]+)$')
 
         # Slot      Type                State                 Capacity (W) Load (W)
         # P0        ASR1000X-AC-1100W   ok                    1100         132
-        p5 = re.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w\-]+) '
-                        r'+(?P<state>\w+(?:\, \w+)?) +(?P<capacity>[\d.]+) +(?P<load>[\d.]+)')
+        p5 = regex_engine.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w\-]+) '
+                                  r'+(?P<state>\w+(?:\, \w+)?) +(?P<capacity>[\d.]+) +(?P<load>[\d.]+)')
 
         # Total load: 696 W, total capacity: 4400 W. Load / Capacity is 15%
-        p6 = re.compile(r'^\s*Total +load\: +(?P<total_load>\d+) +W\, +total +capacity\: +(?P<total_capacity>\d+) +W\.'
-                        r' +Load +\/ +Capacity +is +(?P<load_capacity_percent>\d+)\%$')
+        p6 = regex_engine.compile(r'^\s*Total +load\: +(?P<total_load>\d+) +W\, +total +capacity\: +(?P<total_capacity>\d+) +W\.'
+                                  r' +Load +\/ +Capacity +is +(?P<load_capacity_percent>\d+)\%$')
 
         # Power capacity:       4400 W
-        p7 = re.compile(r'^\s*Power +capacity\: +(?P<power_capacity>\d+) +W$')
+        p7 = regex_engine.compile(r'^\s*Power +capacity\: +(?P<power_capacity>\d+) +W$')
 
         # Redundant allocation: 0 W
-        p8 = re.compile(r'^\s*Redundant +allocation\: +(?P<redundant_alc>\d+) +W$')
+        p8 = regex_engine.compile(r'^\s*Redundant +allocation\: +(?P<redundant_alc>\d+) +W$')
 
         # Fan allocation:       250 W
-        p9 = re.compile(r'^\s*Fan +allocation\: +(?P<fan_alc>\d+) +W$')
+        p9 = regex_engine.compile(r'^\s*Fan +allocation\: +(?P<fan_alc>\d+) +W$')
 
         # FRU allocation:       949 W
-        p10 = re.compile(r'^\s*FRU +allocation\: +(?P<fru_alc>\d+) +W$')
+        p10 = regex_engine.compile(r'^\s*FRU +allocation\: +(?P<fru_alc>\d+) +W$')
 
         # Excess Power in Reserve:   3201 W
-        p11 = re.compile(r'^\s*Excess +Power +in +Reserve\: +(?P<excess_power>\d+) +W$')
+        p11 = regex_engine.compile(r'^\s*Excess +Power +in +Reserve\: +(?P<excess_power>\d+) +W$')
 
         # Excess / (Capacity - Redundant) is 72%
-        p12 = re.compile(r'^\s*Excess +\/ +\(Capacity - Redundant\) +is +(?P<excess_capacity_percent>\d+)\%$')
+        p12 = regex_engine.compile(r'^\s*Excess +\/ +\(Capacity - Redundant\) +is +(?P<excess_capacity_percent>\d+)\%$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4904,17 +4905,17 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
 
         #           888886666611111                    11111
         # 7777755555996510966664444466666333335555544444666667777777777
-        p1 = re.compile(r'^ *\d+( +\d+)* *$')
+        p1 = regex_engine.compile(r'^ *\d+( +\d+)* *$')
 
         #          0    5    0    5    0    5    0    5    0    5    0
-        p2 = re.compile(r'^ *0( +5 +0){5,6} *$')
+        p2 = regex_engine.compile(r'^ *0( +5 +0){5,6} *$')
 
         # 80     * **#*#**   * *       *
         # 70  *  * **#*#**   * *       *           *
-        p3 = re.compile(r'^ *(?P<num>[\d]+)(?P<line>.*#.*$)')
+        p3 = regex_engine.compile(r'^ *(?P<num>[\d]+)(?P<line>.*#.*$)')
 
         # CPU% per second (last 60 seconds)
-        p4 = re.compile(r'^ *CPU%.*$')
+        p4 = regex_engine.compile(r'^ *CPU%.*$')
 
         # initialize max list & average list & return dictionary
         max_list = []
@@ -5056,22 +5057,22 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
             out = output
 
         # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-        p1 = re.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p1 = regex_engine.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
+                                  r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # reserve P Pool Total:     102404 Used:         88 Free:     102316
-        p2 = re.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p2 = regex_engine.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
+                                  r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-        p3 = re.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p3 = regex_engine.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
+                                  r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # 0   0  678985440  347855496  304892096        428    2134314 *Init*
         # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-        p4 = re.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
-                        r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
-                        r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
+        p4 = regex_engine.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
+                                  r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
+                                  r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5165,22 +5166,22 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
             per_process_memory_dict = ret_dict.setdefault('per_process_memory', OrderedDict())
 
         # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-        p1 = re.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p1 = regex_engine.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
+                                  r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # reserve P Pool Total:     102404 Used:         88 Free:     102316
-        p2 = re.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p2 = regex_engine.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
+                                  r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-        p3 = re.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
+        p3 = regex_engine.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
+                                  r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
 
         # 0   0  678985440  347855496  304892096        428    2134314 *Init*
         # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-        p4 = re.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
-                        r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
-                        r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
+        p4 = regex_engine.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
+                                  r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
+                                  r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5267,29 +5268,29 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
         ret_dict = {}
 
         # Platform: C9300-24U
-        p1 = re.compile(r'^Platform: +(?P<platform>\S+)$')
+        p1 = regex_engine.compile(r'^Platform: +(?P<platform>\S+)$')
         # Boot 0 Version: F01144R16.216e68ad62019-02-13
-        p2 = re.compile(r'^Boot +(?P<boot>\d+) +Version: +(?P<version>\S+)$')
+        p2 = regex_engine.compile(r'^Boot +(?P<boot>\d+) +Version: +(?P<version>\S+)$')
         # Boot 0 Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-        p3 = re.compile(r'^Boot +(?P<boot>\d+) +Hash: +(?P<hash>\S+)$')
+        p3 = regex_engine.compile(r'^Boot +(?P<boot>\d+) +Hash: +(?P<hash>\S+)$')
         # Boot Loader Version: System Bootstrap, Version 16.10.1r[FC2], DEVELOPMENT SOFTWARE
-        p4 = re.compile(r'^Boot +Loader +Version: +(?P<boot_loader_version>[\S ]+)$')
+        p4 = regex_engine.compile(r'^Boot +Loader +Version: +(?P<boot_loader_version>[\S ]+)$')
         # Boot Loader Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-        p5 = re.compile(r'^Boot +Loader +Hash: *(?P<hash>\S+)$')
+        p5 = regex_engine.compile(r'^Boot +Loader +Hash: *(?P<hash>\S+)$')
         # 51CE6FB9AE606330810EBFFE99D71D56640FD48F780EDE0C19FB5A75E31EF2192A58A196D18B244ADF67D18BF6B3AA6A16229C66DCC03D8A900753760B252C57
-        p6 = re.compile(r'^(?P<hash>\S+)$')
+        p6 = regex_engine.compile(r'^(?P<hash>\S+)$')
         # OS Version: 2019-07-11_16.25_mzafar
-        p7 = re.compile(r'^OS +Version: +(?P<os_version>\S+)$')
+        p7 = regex_engine.compile(r'^OS +Version: +(?P<os_version>\S+)$')
         # OS Hashes:
-        p8 = re.compile(r'^OS +Hashes:$')
+        p8 = regex_engine.compile(r'^OS +Hashes:$')
         # PCR0: BB33E3FE338B82635B1BD3F1401CF442ACC9BB12A405A424FBE0A5776569884E
-        p9 = re.compile(r'^(?P<hash_key>\S+): +(?P<hash_val>\S+)$')
+        p9 = regex_engine.compile(r'^(?P<hash_key>\S+): +(?P<hash_val>\S+)$')
         # cat9k_iosxe.2019-07-11_16.25_mzafar.SSA.bin:
-        p10 = re.compile(r'^(?P<os_hash>\S+):$')
+        p10 = regex_engine.compile(r'^(?P<os_hash>\S+):$')
         # Signature version: 1
-        p11 = re.compile(r'^Signature version: +(?P<signature_version>\S+)$')
+        p11 = regex_engine.compile(r'^Signature version: +(?P<signature_version>\S+)$')
         # Signature:
-        p12 = re.compile(r'^Signature:$')
+        p12 = regex_engine.compile(r'^Signature:$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -5521,7 +5522,7 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
 
         # initial regexp pattern
         # CAM Utilization for ASIC  [0]
-        p1 = re.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
+        p1 = regex_engine.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
 
         #CTS Cell Matrix/VPN
         #Label                  EM           O       16384        0    0.00%        0        0        0        0
@@ -5529,7 +5530,7 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
         #Label                  TCAM         O        1024        1    0.10%        0        0        0        1
         # Mac Address Table      EM           I       16384       44    0.27%        0        0        0       44
         # Mac Address Table      TCAM         I        1024       21    2.05%        0        0        0       21
-        p2 = re.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
+        p2 = regex_engine.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
 
 
         for line in output.splitlines():
@@ -5738,24 +5739,24 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
         #RP1 (ok, standby)                                                                               H
         #ESP0(ok, active)                                                                               H
         #ESP1(ok, standby)                                                                               H
-        p1 = re.compile(r'^(?P<type>RP|ESP)(?P<key>[0-9]) ?\((?P<status>\S+)\, +(?P<role>\S+)\) +(?P<state>\S)$')
+        p1 = regex_engine.compile(r'^(?P<type>RP|ESP)(?P<key>[0-9]) ?\((?P<status>\S+)\, +(?P<role>\S+)\) +(?P<state>\S)$')
 
         #SIP0                                                                                           H
-        p2 = re.compile(r'^SIP(?P<key>[0-9]) +(?P<state>\S)$')
+        p2 = regex_engine.compile(r'^SIP(?P<key>[0-9]) +(?P<state>\S)$')
 
         # Control Processor       0.51%                 100%            80%             90%             H
-        p3 = re.compile(r'^Control Processor +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p3 = regex_engine.compile(r'^Control Processor +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
 
         #QFP                                                                                           H
-        p4 = re.compile(r'^QFP +(?P<state>\S)$')
+        p4 = regex_engine.compile(r'^QFP +(?P<state>\S)$')
 
         #CPU Utilization        0.00%                 100%            90%             95%             H
-        p5 = re.compile(r'^(?P<resource>[\S\s]+\S) +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p5 = regex_engine.compile(r'^(?P<resource>[\S\s]+\S) +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
 
         # TCAM                   16cells(0%)           1048576cells    65%             85%             H
         # DRAM                   238906KB(5%)          4194304KB       85%             95%             H
         # IRAM                   13014KB(9%)           131072KB        85%             95%             H
-        p6 = re.compile(r'^(?P<resource>[\s\S]+\S) +(?P<use_val>(\d*\.?\d+))(?P<type>\S+)\((?P<val>\d+)\%\) +(?P<max>\d+)(?P<max_type>\S+) +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p6 = regex_engine.compile(r'^(?P<resource>[\s\S]+\S) +(?P<use_val>(\d*\.?\d+))(?P<type>\S+)\((?P<val>\d+)\%\) +(?P<max>\d+)(?P<max_type>\S+) +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
 
 
         ret_dict = {}
@@ -5875,22 +5876,22 @@ class ShowPlatformSudiCertificateNonce(ShowPlatformSudiCertificateNonceSchema):
         ret_dict = {}
 
         # -----BEGIN CERTIFICATE-----
-        p1=re.compile(r'^\-+BEGIN CERTIFICATE\-+$')
+        p1=regex_engine.compile(r'^\-+BEGIN CERTIFICATE\-+$')
 
         # -----END CERTIFICATE-----
-        p2=re.compile(r'^\-+END CERTIFICATE\-+$')
+        p2=regex_engine.compile(r'^\-+END CERTIFICATE\-+$')
 
         # Signature version: 1
-        p3=re.compile(r'^Signature version:\s+(?P<signature>\d+)$')
+        p3=regex_engine.compile(r'^Signature version:\s+(?P<signature>\d+)$')
 
         # Signature:
-        p4=re.compile(r'^Signature:$')
+        p4=regex_engine.compile(r'^Signature:$')
 
         # A59DA741EA66C2AFC006E1766B3B11493A79E67408388C40160C2729F88281E9
-        p5=re.compile(r'^(?P<signatur>[A-Z\d]+)$')
+        p5=regex_engine.compile(r'^(?P<signatur>[A-Z\d]+)$')
 
         # o4IBBDCCAQAwDgYDVR0PAQH/BAQDAgXgMAwGA1UdEwEB/wQCMAAwHwYDVR0jBBgw
-        p6 =re.compile(r'([a-zA-Z0-9/+=]+)')
+        p6 =regex_engine.compile(r'([a-zA-Z0-9/+=]+)')
 
         for line in output.splitlines():
             line=line.strip()
@@ -6003,28 +6004,28 @@ class ShowEnvironmentStatus(ShowEnvironmentStatusSchema):
         ret_dict  = switch_id_dict = {}
 
         # Switch:1
-        p1 = re.compile(r'^Switch:(?P<switch>\S+)$')
+        p1 = regex_engine.compile(r'^Switch:(?P<switch>\S+)$')
 
         # PS1     C9K-PWR-1500WAC-R     ac    n.a.      standby    good  good
         # PS0     C9K-PWR-650WAC-R      AC    650 W     ok         good  N/A
-        p2 = re.compile(r'^(?P<power_supply>\S+) +'
-                        r'(?P<model_num>\S+) +'
-                        r'(?P<type>\S+) +'
-                        r'(?P<capacity>\S+) +W?\s*'
-                        r'(?P<status>\S+) +'
-                        r'(?P<fan_state0>\S+) +'
-                        r'(?P<fan_state1>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<power_supply>\S+) +'
+                                  r'(?P<model_num>\S+) +'
+                                  r'(?P<type>\S+) +'
+                                  r'(?P<capacity>\S+) +W?\s*'
+                                  r'(?P<status>\S+) +'
+                                  r'(?P<fan_state0>\S+) +'
+                                  r'(?P<fan_state1>\S+)$')
 
         # FM6     active      good  good
-        p3= re.compile(r'^(?P<fan_tray>\w+\d+)\s+(?P<status>\w+)\s+(?P<fan_state0>\w+)\s+(?P<fan_state1>\w+)$')
+        p3= regex_engine.compile(r'^(?P<fan_tray>\w+\d+)\s+(?P<status>\w+)\s+(?P<fan_state0>\w+)\s+(?P<fan_state1>\w+)$')
 
         # FM0     ok          good  good  good  good
-        p4= re.compile(r'^(?P<fan_tray>\w+\d+) +'
-                        r'(?P<status>\w+) +'
-                        r'(?P<fan_state0>\S+) +'
-                        r'(?P<fan_state1>\S+) +'
-                        r'(?P<fan_state2>\S+) +'
-                        r'(?P<fan_state3>\S+)$')
+        p4= regex_engine.compile(r'^(?P<fan_tray>\w+\d+) +'
+                                  r'(?P<status>\w+) +'
+                                  r'(?P<fan_state0>\S+) +'
+                                  r'(?P<fan_state1>\S+) +'
+                                  r'(?P<fan_state2>\S+) +'
+                                  r'(?P<fan_state3>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6115,7 +6116,7 @@ class ShowPlatformSudiPki(ShowPlatformSudiPkiSchema):
 
         ret_dict = {}
 
-        p1=re.compile(r'((Cisco.+|\'Cisco.+:)\s+(?P<Valid>(((Enabled\s\(.*\))|Enabled)|((Disabled\s\(.*\))|Disabled)|Valid|Not Supported|Invalid|Init Failure)))')
+        p1=regex_engine.compile(r'((Cisco.+|\'Cisco.+:)\s+(?P<Valid>(((Enabled\s\(.*\))|Enabled)|((Disabled\s\(.*\))|Disabled)|Valid|Not Supported|Invalid|Init Failure)))')
 
         for line in output.splitlines():
             line1=[]
@@ -6185,19 +6186,19 @@ class ShowPlatformTcamPbr(ShowPlatformTcamPbrSchema):
         ret_dict = {}
 
         # Printing entries for region NAT_1 (387) type 6 asic 0
-        p00 = re.compile(r'^Printing entries for region\s(?P<nat_r>\w+)\s\(\d+\)\stype\s\d+\sasic\s\d$')
+        p00 = regex_engine.compile(r'^Printing entries for region\s(?P<nat_r>\w+)\s\(\d+\)\stype\s\d+\sasic\s\d$')
 
         #TAQ-1 Index-352 (A:0,C:0) Valid StartF-1 StartA-1 SkipF-0 SkipA-0
-        p0 = re.compile(r'^TAQ-\d+\sIndex-(?P<index>\d+)\s\([A-Z]\:\d,[A-Z]\:\d\)\sValid\sStart[A-Z]-\d\sStart[A-Z]-\d\sSkip[A-Z]-\d\sSkip[A-Z]-\d$')
+        p0 = regex_engine.compile(r'^TAQ-\d+\sIndex-(?P<index>\d+)\s\([A-Z]\:\d,[A-Z]\:\d\)\sValid\sStart[A-Z]-\d\sStart[A-Z]-\d\sSkip[A-Z]-\d\sSkip[A-Z]-\d$')
 
         # Mask1 00ffff00:00000000:00000000:00000000:00000000:00000000:00000000:00000000
-        p1 = re.compile(r'^Mask(?P<mask_name>\d+) +(?P<mask_id>\S+)$')
+        p1 = regex_engine.compile(r'^Mask(?P<mask_name>\d+) +(?P<mask_id>\S+)$')
 
         # Key1  00800400:00000000:00000000:00000000:00000000:00000000:00000000:00000000
-        p2 = re.compile(r'^Key(?P<key_name>\d+) +(?P<key_id>\S+)$')
+        p2 = regex_engine.compile(r'^Key(?P<key_name>\d+) +(?P<key_id>\S+)$')
 
         # AD 10082000:00000001
-        p3 = re.compile(r'^AD +(?P<ad>[\da-f:]+)$')
+        p3 = regex_engine.compile(r'^AD +(?P<ad>[\da-f:]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6277,25 +6278,25 @@ class ShowPlatformNatTranslationsStatistics(ShowPlatformNatTranslationsStatistic
         ret_dict = {}
 
         # NAT Type                : Static
-        p0 = re.compile(r'^NAT Type +: +(?P<nat_type>-+|Static|Dynamic|Mixed)$')
+        p0 = regex_engine.compile(r'^NAT Type +: +(?P<nat_type>-+|Static|Dynamic|Mixed)$')
 
         # Netflow Type            : NA
-        p1 = re.compile(r'^Netflow Type +: +(?P<netflow_type>\S+)$')
+        p1 = regex_engine.compile(r'^Netflow Type +: +(?P<netflow_type>\S+)$')
 
         # Flow Record             : Disabled
-        p2 = re.compile(r'^Flow Record  +: +(?P<flow_record>-+|Disabled|Enabled)$')
+        p2 = regex_engine.compile(r'^Flow Record  +: +(?P<flow_record>-+|Disabled|Enabled)$')
 
         # Dynamic NAT entries     : 0 entries
-        p3 = re.compile(r'^Dynamic NAT entries  +: +(?P<dynamic_nat_entries>\d+ entries)$')
+        p3 = regex_engine.compile(r'^Dynamic NAT entries  +: +(?P<dynamic_nat_entries>\d+ entries)$')
 
         # Static NAT entries      : 0 entries
-        p4 = re.compile(r'^Static NAT entries +: +(?P<static_nat_entries>\d+ entries)$')
+        p4 = regex_engine.compile(r'^Static NAT entries +: +(?P<static_nat_entries>\d+ entries)$')
 
         # Total NAT entries       : 0 entries
-        p5 = re.compile(r'^Total NAT entries +: +(?P<total_nat_entries>\d+ entries)$')
+        p5 = regex_engine.compile(r'^Total NAT entries +: +(?P<total_nat_entries>\d+ entries)$')
 
         # Total HW Resource (TCAM): 26 of 27648 /0 .09% utilization
-        p6 = re.compile(r'^Total HW Resource \(TCAM\)+: +(?P<total_hw_resource_tcam>\d+ of \d+ /\d+ \.\d+% utilization)$')
+        p6 = regex_engine.compile(r'^Total HW Resource \(TCAM\)+: +(?P<total_hw_resource_tcam>\d+ of \d+ /\d+ \.\d+% utilization)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6384,11 +6385,11 @@ class ShowPlatformNatTranslations(ShowPlatformNatTranslationsSchema):
 
         # Pro Inside global Inside local Outside local Outside global
         # TCP 135.0.0.2:0   192.0.0.2:0  193.0.0.2:0   193.0.0.2:0
-        p1 = re.compile(r'^(?P<protocol>-+|UDP|TCP) +'
-                        r'(?P<inside_global>[\d.]+:+\d+) +'
-                        r'(?P<inside_local>[\d.]+:+\d+) +'
-                        r'(?P<outside_local>[\d.]+:+\d+) +'
-                        r'(?P<outside_global>[\d.]+:+\d+)$')
+        p1 = regex_engine.compile(r'^(?P<protocol>-+|UDP|TCP) +'
+                                  r'(?P<inside_global>[\d.]+:+\d+) +'
+                                  r'(?P<inside_local>[\d.]+:+\d+) +'
+                                  r'(?P<outside_local>[\d.]+:+\d+) +'
+                                  r'(?P<outside_global>[\d.]+:+\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6461,27 +6462,27 @@ class ShowPlatformTcamAcl(ShowPlatformTcamAclSchema):
         ret_dict = {}
 
         # Index-1152
-        p0 = re.compile(r'Index-+(?P<index>\d+)$')
+        p0 = regex_engine.compile(r'Index-+(?P<index>\d+)$')
 
         # Labels vcuResults l3Len l3Pro l3Tos SrcAddr  DstAddr  mtrid vrfid  SH Mvid  l3Err
         # M:  00000000   0000  00    00  00000000 00000000  00   0000   0000 000   00
         # V:  00000000   0000  00    00  00000000 00000000  00   0000   0000 000   00
-        p1 = re.compile(r'^(?P<labels>\S+) +'
-                        r'(?P<vcu_results>\d+) +'
-                        r'(?P<l3len>\d+) +'
-                        r'(?P<l3pro>\d+) +'
-                        r'(?P<l3tos>\d+) +'
-                        r'(?P<srcaddr>\d+) +'
-                        r'(?P<dstaddr>\d+) +'
-                        r'(?P<mtrid>\d+) +'
-                        r'(?P<vrfid>\d+) +'
-                        r'(?P<sh>\d+) +'
-                        r'(?P<mvid>\d+) +'
-                        r'(?P<l3err>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<labels>\S+) +'
+                                  r'(?P<vcu_results>\d+) +'
+                                  r'(?P<l3len>\d+) +'
+                                  r'(?P<l3pro>\d+) +'
+                                  r'(?P<l3tos>\d+) +'
+                                  r'(?P<srcaddr>\d+) +'
+                                  r'(?P<dstaddr>\d+) +'
+                                  r'(?P<mtrid>\d+) +'
+                                  r'(?P<vrfid>\d+) +'
+                                  r'(?P<sh>\d+) +'
+                                  r'(?P<mvid>\d+) +'
+                                  r'(?P<l3err>\d+)$')
 
         # natResultRm    natStaticRule     natDynamicRule
         # 1                1                  0
-        p2 = re.compile(r'^(?P<nat_result_rm>\d+) +(?P<nat_static_rule>\d+) +(?P<nat_dynamic_rule>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<nat_result_rm>\d+) +(?P<nat_static_rule>\d+) +(?P<nat_dynamic_rule>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6560,19 +6561,19 @@ class ShowVersionRunning(ShowVersionRunningSchema):
 
         # initial regexp pattern
         # Package: Provisioning File, version: n/a, status: active
-        p1 = re.compile(r'^Package: +(?P<package>[\w+\s+\w]+)+, +version: (?P<version>\S+)+, status: (?P<status>\S+)$')
+        p1 = regex_engine.compile(r'^Package: +(?P<package>[\w+\s+\w]+)+, +version: (?P<version>\S+)+, status: (?P<status>\S+)$')
 
         # Role: provisioning file
-        p2 = re.compile(r'^Role: +(?P<role>[\w+\s+\w]+)$')
+        p2 = regex_engine.compile(r'^Role: +(?P<role>[\w+\s+\w]+)$')
 
         # File: bootflash:cat9k-rpbase.BLD_POLARIS_DEV_LATEST_20211115_013205.SSA.pkg, on: RP0
-        p3 = re.compile(r'^File: +(?P<file>\S+)+, on: (?P<on>\S+)$')
+        p3 = regex_engine.compile(r'^File: +(?P<file>\S+)+, on: (?P<on>\S+)$')
 
         # Built: 2021-11-14_18.31, by: mcpre
-        p4 = re.compile(r'^Built: +(?P<built>\S+)+, by: (?P<by>\S+)$')
+        p4 = regex_engine.compile(r'^Built: +(?P<built>\S+)+, by: (?P<by>\S+)$')
 
         # File SHA1 checksum: 69c0fe122c9f0885021f874875caeba46a2c6d07
-        p5 = re.compile(r'^File SHA1 checksum: +(?P<file_sha_checksum>\S+)$')
+        p5 = regex_engine.compile(r'^File SHA1 checksum: +(?P<file_sha_checksum>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6682,46 +6683,46 @@ class ShowCallAdmissionStatistics(ShowCallAdmissionStatisticsSchema):
 
         res_dict = {}
         # CAC New Model (SRSM) is ACTIVE
-        p1 = re.compile(r'^CAC New Model \(SRSM\) is (?P<state>\w+)$')
+        p1 = regex_engine.compile(r'^CAC New Model \(SRSM\) is (?P<state>\w+)$')
 
         # CAC statistics duration:  2(seconds)
-        p2 = re.compile(r'^CAC statistics duration:  (?P<duration>\d+)'
-                        r'\(seconds\)$')
+        p2 = regex_engine.compile(r'^CAC statistics duration:  (?P<duration>\d+)'
+                                  r'\(seconds\)$')
 
         # Total calls rejected 0, accepted 0
-        p3 = re.compile(r'^Total calls rejected (?P<rejected>\d+), '
-                        r'accepted (?P<accepted>\d+)$')
+        p3 = regex_engine.compile(r'^Total calls rejected (?P<rejected>\d+), '
+                                  r'accepted (?P<accepted>\d+)$')
 
         # Current hardware CAC status is: Not Dropping
-        p4 = re.compile(r'^Current hardware CAC status is: '
-                        r'(?P<status>\w+\s?\w+)$')
+        p4 = regex_engine.compile(r'^Current hardware CAC status is: '
+                                  r'(?P<status>\w+\s?\w+)$')
 
         # Total call Session charges: 0, limit 350
-        p5 = re.compile(r'^Total call Session charges: (?P<total_call_session_charges>'
-                        r'\d+), limit (?P<call_limit>\d+)$')
+        p5 = regex_engine.compile(r'^Total call Session charges: (?P<total_call_session_charges>'
+                                  r'\d+), limit (?P<call_limit>\d+)$')
 
         # CPU utilization: Five Sec Average CPU Load, Current actual CPU: 3%, Limit: 80%
-        p6 = re.compile(r'^CPU utilization: Five Sec Average CPU Load, Current actual '
-                        r'CPU: (?P<current_actual_cpu>\d+)%, Limit: (?P<cpu_limit>\d+)%$')
+        p6 = regex_engine.compile(r'^CPU utilization: Five Sec Average CPU Load, Current actual '
+                                  r'CPU: (?P<current_actual_cpu>\d+)%, Limit: (?P<cpu_limit>\d+)%$')
 
         # CPU-limit:              3354                116                  33541234
-        p7 = re.compile(r'^CPU-limit:\s+(?P<times_of_activation>\d+)\s+'
-                        r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
+        p7 = regex_engine.compile(r'^CPU-limit:\s+(?P<times_of_activation>\d+)\s+'
+                                  r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
 
         # SessionCharges:          27                  0                    27
-        p8 = re.compile(r'^SessionCharges:\s+(?P<times_of_activation>\d+)\s+'
-                        r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
+        p8 = regex_engine.compile(r'^SessionCharges:\s+(?P<times_of_activation>\d+)\s+'
+                                  r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
 
         # LowPlatformResource:     0                   0                     0
-        p9 = re.compile(r'^LowPlatformResource:\s+(?P<times_of_activation>\d+)\s+'
-                        r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
+        p9 = regex_engine.compile(r'^LowPlatformResource:\s+(?P<times_of_activation>\d+)\s+'
+                                  r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
 
         # Session Limit:         9876543               0                     0
-        p10 = re.compile(r'^Session Limit:\s+(?P<times_of_activation>\d+)\s+'
-                         r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
+        p10 = regex_engine.compile(r'^Session Limit:\s+(?P<times_of_activation>\d+)\s+'
+                                   r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
 
         # Total dropped FSOL packets at data plane: 0
-        p11 = re.compile(r'^Total dropped FSOL packets at data plane: (?P<fsol_drop>\d+)$')
+        p11 = regex_engine.compile(r'^Total dropped FSOL packets at data plane: (?P<fsol_drop>\d+)$')
         for line in output.splitlines():
             line = line.strip()
 
@@ -6884,7 +6885,7 @@ class ShowRepTopologySegment(ShowRepTopologySegmentSchema):
         # fr1                              Tw2/0/3    Pri* Alt
         # fr1                              Gi1/0/3    Sec* Open
         # IE34001                          Gi1/2           Open
-        p1 = re.compile(r'^(?P<bridge>\S+)\s+(?P<interface>[a-z|A-Z]+\d+\/\d+(\/\d+)?)\s+((?P<edge>\S+)\s+)?(?P<role>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<bridge>\S+)\s+(?P<interface>[a-z|A-Z]+\d+\/\d+(\/\d+)?)\s+((?P<edge>\S+)\s+)?(?P<role>\S+)$')
 
         for line in output.splitlines():
 
@@ -6944,23 +6945,23 @@ class ShowPlatformPacketStats(ShowPlatformPktTraceStatsSchema):
 
         # Packets Summary
         #   Matched  1
-        p1 = re.compile(r'\s+Matched\s+(?P<count>\d+)')
+        p1 = regex_engine.compile(r'\s+Matched\s+(?P<count>\d+)')
         # Packets Traced: 5
         #    or (different version)
         #   Traced   11
-        p2 = re.compile(r'.*Traced:?\s+(?P<count>\d+)')
+        p2 = regex_engine.compile(r'.*Traced:?\s+(?P<count>\d+)')
 
         # Packets Received
         #   Ingress  12
         #   Inject   13
-        p3 = re.compile(r'^\s+(?P<pkt_type>(Ingress|Inject))\s+(?P<count>\d+)$')
+        p3 = regex_engine.compile(r'^\s+(?P<pkt_type>(Ingress|Inject))\s+(?P<count>\d+)$')
 
         # Packets Processed
         #   Forward  14
         #   Punt     15
         #   Drop     16
         #   Consume  17
-        p4 = re.compile(r'^\s+(?P<pkt_type>(Forward|Punt|Drop|Consume))\s+(?P<count>\d+)$')
+        p4 = regex_engine.compile(r'^\s+(?P<pkt_type>(Forward|Punt|Drop|Consume))\s+(?P<count>\d+)$')
 
         for line in output.splitlines():
 
@@ -7038,8 +7039,8 @@ class ShowPlatformPacketSumm(ShowPlatformPktTraceSummarySchema):
 
         # Pkt   Input            Output           State  Reason
         # 0     Gi0/0/1          Gi0/0/0          FWD     97  (Packets to LFTS)
-        p = re.compile(r'\s*(?P<pkt>\d+)\s+(?P<input>\S+)\s+(?P<output>\S+)'
-                       r'\s+(?P<state>\S+)(\s+(?P<reason_code>\d+)\s+(?P<reason_str>.*$))?')
+        p = regex_engine.compile(r'\s*(?P<pkt>\d+)\s+(?P<input>\S+)\s+(?P<output>\S+)'
+                                 r'\s+(?P<state>\S+)(\s+(?P<reason_code>\d+)\s+(?P<reason_str>.*$))?')
 
         for line in output.splitlines():
             m = p.match(line)
@@ -7213,9 +7214,9 @@ class ShowPlatformPacketTracePacket(ShowPlatformPacketTracePacketSchema):
     cli_command = ['show platform packet-trace packet all',
                    'show platform packet-trace packet {packet_id}']
 
-    FIRST_CAP_REGEX = re.compile(r'(.)([A-Z][a-z]+)')
-    ALL_CAP_REGEX = re.compile(r'([a-z0-9])([A-Z])')
-    SLUGIFY_P = re.compile(r'[^a-z0-9]+')
+    FIRST_CAP_REGEX = regex_engine.compile(r'(.)([A-Z][a-z]+)')
+    ALL_CAP_REGEX = regex_engine.compile(r'([a-z0-9])([A-Z])')
+    SLUGIFY_P = regex_engine.compile(r'[^a-z0-9]+')
 
     def _field_name_normalize(self, name):
         """
@@ -7227,7 +7228,7 @@ class ShowPlatformPacketTracePacket(ShowPlatformPacketTracePacketSchema):
         string_one = self.FIRST_CAP_REGEX.sub(r'\1_\2', name)
         name = self.ALL_CAP_REGEX.sub(r'\1_\2', string_one).lower()
         # slugify
-        name = re.sub(self.SLUGIFY_P, '_', name)
+        name = regex_engine.sub(self.SLUGIFY_P, '_', name)
         name = re.sub(r'_{2,}', '_', name).strip('_')
         return name
 
@@ -7240,24 +7241,24 @@ class ShowPlatformPacketTracePacket(ShowPlatformPacketTracePacketSchema):
             output = self.device.execute(cmd)
 
         # Packet: 0           CBUG ID: 104
-        p_packet_start = re.compile(r'Packet:\s+(?P<packet_id>\d+)\s+CBUG\s+ID:\s(?P<cbug_id>\d+)')
+        p_packet_start = regex_engine.compile(r'Packet:\s+(?P<packet_id>\d+)\s+CBUG\s+ID:\s(?P<cbug_id>\d+)')
         # Summary
-        p_summary_start = re.compile(r'Summary$')
+        p_summary_start = regex_engine.compile(r'Summary$')
         #  Timestamp
         #   Start   : 19591546248064016 ns (07/27/2021 09:34:28.261898 UTC)
         #   Stop    : 19591546248087028 ns (07/27/2021 09:34:28.261921 UTC)
-        p_timestamp = re.compile(
+        p_timestamp = regex_engine.compile(
             r'\s+(?P<field>(Start)|(Stop))\s+:\s(?P<time_ns>\d+)\s+ns\s+'
             r'\((?P<date_str>\d+/\d+/\d+\s+\d+:\d+:\d+\.\d+)\s+\w+\)')
         #   Feature: IPV4(Output)
-        p_feature_start = re.compile(r'\s+Feature:\s(?P<feature_name>[\w\\()]+)')
+        p_feature_start = regex_engine.compile(r'\s+Feature:\s(?P<feature_name>[\w\\()]+)')
         # Path Trace
-        p_path_trace_start = re.compile(r'Path\s+Trace$')
+        p_path_trace_start = regex_engine.compile(r'Path\s+Trace$')
         # IOSd Path Flow: Packet: 1    CBUG ID: 105
-        p_iosd_flow_start = re.compile(r'IOSd\sPath\sFlow:\sPacket:')
+        p_iosd_flow_start = regex_engine.compile(r'IOSd\sPath\sFlow:\sPacket:')
 
-        p_from_plane = re.compile(r'\s+Packet\s+Rcvd\s+From\s+(?P<from_plane>\w+)')
-        p_layer = re.compile(r'\s+Packet\s+Enqueued\s+in\s+(?P<layer>.*)')
+        p_from_plane = regex_engine.compile(r'\s+Packet\s+Rcvd\s+From\s+(?P<from_plane>\w+)')
+        p_layer = regex_engine.compile(r'\s+Packet\s+Enqueued\s+in\s+(?P<layer>.*)')
 
         ret_dict = {}
 
@@ -7373,7 +7374,7 @@ class ShowSystemMtu(ShowSystemMtuSchema):
         ret_dict = {}
 
         # Global Ethernet MTU is 1500 bytes
-        p1 = re.compile(r'^Global\s+Ethernet\s+MTU\s+is\s+(?P<mtu_in_bytes>\d+)\s+bytes\.$')
+        p1 = regex_engine.compile(r'^Global\s+Ethernet\s+MTU\s+is\s+(?P<mtu_in_bytes>\d+)\s+bytes\.$')
 
 
         for line in output.splitlines():
@@ -7432,9 +7433,9 @@ class ShowFileSystems(ShowFileSystemsSchema):
         ret_dict = {}
         index = 0
         #*  11353194496    7130390528      disk     rw   flash-3:
-        p0 = re.compile(r'^\*\s*(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\w+)\s*(?P<flags>\w+)\s*(?P<prefixes>[\S\s]+)$')
+        p0 = regex_engine.compile(r'^\*\s*(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\w+)\s*(?P<flags>\w+)\s*(?P<prefixes>[\S\s]+)$')
         #8162746368    8019398656      disk     ro   webui:
-        p1 = re.compile(r'^(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\S*)\s*(?P<flags>\S*)\s*(?P<prefixes>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\S*)\s*(?P<flags>\S*)\s*(?P<prefixes>[\S\s]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -7478,10 +7479,10 @@ class ShowRedundancyConfigSyncFailuresMcl(ShowRedundancyConfigSyncFailuresMclSch
             output = self.device.execute(self.cli_command)
 
         # The list is Empty
-        p1 = re.compile(r"^The\s+list\s+is\s+Empty$")
+        p1 = regex_engine.compile(r"^The\s+list\s+is\s+Empty$")
 
         # 00:06:31: Config Sync: Starting lines from MCL file:
-        p2 = re.compile(r"^\S+\s+Config Sync: Starting lines from MCL file:$")
+        p2 = regex_engine.compile(r"^\S+\s+Config Sync: Starting lines from MCL file:$")
 
         ret_dict = {}
         err_flag = False
@@ -7572,37 +7573,37 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         # SB Access Vlan: 1
-        p1 = re.compile(r"^\s+SB\s+Access\s+Vlan:\s+(?P<sb_access_vlan>\d+)$")
+        p1 = regex_engine.compile(r"^\s+SB\s+Access\s+Vlan:\s+(?P<sb_access_vlan>\d+)$")
         # SB Voice Vlan: 100
-        p1_1 = re.compile(r"^\s+SB\s+Voice\s+Vlan:\s+(?P<sb_voice_vlan>\d+)$")
+        p1_1 = regex_engine.compile(r"^\s+SB\s+Voice\s+Vlan:\s+(?P<sb_voice_vlan>\d+)$")
         # Conf Access Vlan: 1
-        p1_2 = re.compile(r"^\s+Conf\s+Access\s+Vlan:\s+(?P<conf_access_vlan>\d+)$")
+        p1_2 = regex_engine.compile(r"^\s+Conf\s+Access\s+Vlan:\s+(?P<conf_access_vlan>\d+)$")
         # Conf Voice Vlan: 100
-        p1_3 = re.compile(r"^\s+Conf\s+Voice\s+Vlan:\s+(?P<conf_voice_vlan>\d+)$")
+        p1_3 = regex_engine.compile(r"^\s+Conf\s+Voice\s+Vlan:\s+(?P<conf_voice_vlan>\d+)$")
         # Oper Access Vlan: 1
-        p1_4 = re.compile(r"^\s+Oper\s+Access\s+Vlan:\s+(?P<oper_access_vlan>\d+)$")
+        p1_4 = regex_engine.compile(r"^\s+Oper\s+Access\s+Vlan:\s+(?P<oper_access_vlan>\d+)$")
         # Oper Voice Vlan: 100
-        p1_5 = re.compile(r"^\s+Oper\s+Voice\s+Vlan:\s+(?P<oper_voice_vlan>\d+)$")
+        p1_5 = regex_engine.compile(r"^\s+Oper\s+Voice\s+Vlan:\s+(?P<oper_voice_vlan>\d+)$")
         # Default Host Access: 1
-        p1_6 = re.compile(r"^\s+Default\s+Host\s+Access:\s+(?P<def_host_access>\d+)$")
+        p1_6 = regex_engine.compile(r"^\s+Default\s+Host\s+Access:\s+(?P<def_host_access>\d+)$")
         # Auth In VP: True
-        p1_7 = re.compile(r"^\s+Auth\s+In\s+VP:\s+(?P<auth_in_vp>\w+)$")
+        p1_7 = regex_engine.compile(r"^\s+Auth\s+In\s+VP:\s+(?P<auth_in_vp>\w+)$")
         # Client Count : 1
-        p1_8 = re.compile(r"^\s+Client\s+Count\s+:\s+(?P<client_count>\d+)$")
+        p1_8 = regex_engine.compile(r"^\s+Client\s+Count\s+:\s+(?P<client_count>\d+)$")
         # Vlan Count : 2
-        p1_9 = re.compile(r"^\s+Vlan\s+Count\s+:\s+(?P<vlan_count>\d+)$")
+        p1_9 = regex_engine.compile(r"^\s+Vlan\s+Count\s+:\s+(?P<vlan_count>\d+)$")
         # Port-Control Auto Enabled : TRUE
-        p1_10 = re.compile(r"^Port-Control\s+Auto\s+Enabled\s+:\s+(?P<port_ctrl_enable>\w+)$")
+        p1_10 = regex_engine.compile(r"^Port-Control\s+Auto\s+Enabled\s+:\s+(?P<port_ctrl_enable>\w+)$")
         # CDP Bypass Enabled : FALSE
-        p1_11 = re.compile(r"^\s+CDP\s+Bypass\s+Enabled\s+:\s+(?P<cdp_bypass_enable>\w+)$")
+        p1_11 = regex_engine.compile(r"^\s+CDP\s+Bypass\s+Enabled\s+:\s+(?P<cdp_bypass_enable>\w+)$")
         # Port Mode : CLOSED
-        p1_12 = re.compile(r"^\s+Port\s+Mode\s+:\s+(?P<port_mode>\w+)$")
+        p1_12 = regex_engine.compile(r"^\s+Port\s+Mode\s+:\s+(?P<port_mode>\w+)$")
         # Control Direction : BOTH
-        p1_13 = re.compile(r"^\s+Control\s+Direction\s+:\s+(?P<ctrl_dir>\w+)$")
+        p1_13 = regex_engine.compile(r"^\s+Control\s+Direction\s+:\s+(?P<ctrl_dir>\w+)$")
         # Gi1/0/24  001b.0c18.918d    VOICE    100  0x94000008  0x0002  None
-        p2 = re.compile(r"^\s+(?P<int>\S+)\s+(?P<mac>\S+)\s+(?P<domain>\w+)\s+(?P<vlan>\d+)\s+(?P<clent_handle>\S+)\s+(?P<port_open>\S+)\s+(?P<flags>\w+)$")
+        p2 = regex_engine.compile(r"^\s+(?P<int>\S+)\s+(?P<mac>\S+)\s+(?P<domain>\w+)\s+(?P<vlan>\d+)\s+(?P<clent_handle>\S+)\s+(?P<port_open>\S+)\s+(?P<flags>\w+)$")
         # Gi1/0/24  1       DATA    1     0     0       2     None
-        p3 = re.compile(r"^\s+(?P<int>\S+)\s+(?P<vlan>\d+)\s+(?P<domain>\w+)\s+(?P<user_count>\d+)\s+(?P<fwd_count>\d+)\s+(?P<client_count>\d+)\s+(?P<vp_state>\S+\s+)\s+(?P<flags>\w+)$")
+        p3 = regex_engine.compile(r"^\s+(?P<int>\S+)\s+(?P<vlan>\d+)\s+(?P<domain>\w+)\s+(?P<user_count>\d+)\s+(?P<fwd_count>\d+)\s+(?P<client_count>\d+)\s+(?P<vp_state>\S+\s+)\s+(?P<flags>\w+)$")
 
         ret_dict = {}
 
@@ -7807,11 +7808,11 @@ class ShowPlatformHostAccessTableIntf(ShowPlatformHostAccessTableIntfSchema):
             output = self.device.execute(cmd)
 
         # 001b.0c18.918d       100         permit         dot1x        dynamic
-        p1 = re.compile(r"^(?P<src_address>\S+)\s+(?P<vlan_id>\d+)\s+(?P<access_mode>\w+)\s+(?P<feature>\S+)\s+(?P<type>\w+)$")
+        p1 = regex_engine.compile(r"^(?P<src_address>\S+)\s+(?P<vlan_id>\d+)\s+(?P<access_mode>\w+)\s+(?P<feature>\S+)\s+(?P<type>\w+)$")
         # Current feature:  dot1x
-        p1_1 = re.compile(r"^Current\s+feature:\s+(?P<current_feature>\S+)$")
+        p1_1 = regex_engine.compile(r"^Current\s+feature:\s+(?P<current_feature>\S+)$")
         # Default            ask
-        p1_2 = re.compile(r"^Default\s+(?P<default>\w+)$")
+        p1_2 = regex_engine.compile(r"^Default\s+(?P<default>\w+)$")
 
         ret_dict = {}
 
@@ -7898,24 +7899,24 @@ class ShowPlatformPmPortDataInt(ShowPlatformPmPortDataIntSchema):
             output = self.device.execute(cmd)
 
         #   Access Mode               Multi-Static         Multi-Static
-        p1 = re.compile(r"^\s+(?P<field>(\w+|\w+\s+\w+|\w+\s+\w+\s+\w+)?)\s+(?P<admin_field>(\S+|\s+)?)\s+(?P<oper_field>(\S+|s+)?)$")
+        p1 = regex_engine.compile(r"^\s+(?P<field>(\w+|\w+\s+\w+|\w+\s+\w+\s+\w+)?)\s+(?P<admin_field>(\S+|\s+)?)\s+(?P<oper_field>(\S+|s+)?)$")
 
         #   Forwarding Vlans : 100
-        p2 = re.compile(r"^\s+Forwarding\s+Vlans\s+:\s+(?P<forwarding_vlans>\d+)$")
+        p2 = regex_engine.compile(r"^\s+Forwarding\s+Vlans\s+:\s+(?P<forwarding_vlans>\d+)$")
         #   Current Pruned Vlans : none
-        p2_1 = re.compile(r"^\s+Current\s+Pruned\s+Vlans\s+:\s+(?P<current_pruned_vlans>\w+)$")
+        p2_1 = regex_engine.compile(r"^\s+Current\s+Pruned\s+Vlans\s+:\s+(?P<current_pruned_vlans>\w+)$")
         #   Previous Pruned Vlans : none
-        p2_2 = re.compile(r"^\s+Previous\s+Pruned\s+Vlans\s+:\s+(?P<previous_pruned_vlans>\w+)$")
+        p2_2 = regex_engine.compile(r"^\s+Previous\s+Pruned\s+Vlans\s+:\s+(?P<previous_pruned_vlans>\w+)$")
         #   Sw LinkNeg State : LinkStateUp
-        p2_3 = re.compile(r"^\s+Sw\s+LinkNeg\s+State\s+:\s+(?P<sw_linkneg_state>\w+)$")
+        p2_3 = regex_engine.compile(r"^\s+Sw\s+LinkNeg\s+State\s+:\s+(?P<sw_linkneg_state>\w+)$")
         #   No.of LinkDownEvents :    3
-        p2_4 = re.compile(r"^\s+No\.of\s+LinkDownEvents\s+:\s+(?P<no_link_down_events>\d+)\s+$")
+        p2_4 = regex_engine.compile(r"^\s+No\.of\s+LinkDownEvents\s+:\s+(?P<no_link_down_events>\d+)\s+$")
         #   Time Stamp Last Link Flapped(U) : Sep 13 20:14:35.714
-        p2_5 = re.compile(r"^\s+Time\s+Stamp\s+Last\s+Link\s+Flapped\(U\)\s+:\s+(?P<time_stamp_last_link_flapped>\S+\s+\S+\s+\S+)$")
+        p2_5 = regex_engine.compile(r"^\s+Time\s+Stamp\s+Last\s+Link\s+Flapped\(U\)\s+:\s+(?P<time_stamp_last_link_flapped>\S+\s+\S+\s+\S+)$")
         #   LastLinkDownDuration(sec) 2
-        p2_6 = re.compile(r"^\s+LastLinkDownDuration\(sec\)\s+(?P<last_link_down_duration_secs>\d+)\s+$")
+        p2_6 = regex_engine.compile(r"^\s+LastLinkDownDuration\(sec\)\s+(?P<last_link_down_duration_secs>\d+)\s+$")
         #   LastLinkUpDuration(sec):  1355054
-        p2_7 = re.compile(r"^\s+LastLinkUpDuration\(sec\):\s+(?P<last_link_up_duration_secs>\d+)\s+$")
+        p2_7 = regex_engine.compile(r"^\s+LastLinkUpDuration\(sec\):\s+(?P<last_link_up_duration_secs>\d+)\s+$")
 
         ret_dict = {}
 
@@ -8046,13 +8047,13 @@ class ShowPlatformRewriteUtilization(ShowPlatformRewriteUtilizationSchema):
         ret_dict = {}
         # initial regexp pattern
         # Resource Info for ASIC Instance: 0
-        p1 = re.compile(r'Resource +Info +for +ASIC +Instance: +(?P<asic>(\d+))$')
+        p1 = regex_engine.compile(r'Resource +Info +for +ASIC +Instance: +(?P<asic>(\d+))$')
 
         #Rewrite Data                        Allocated     Free
         #-------------------------------------------------------
         #PHF_EGRESS_destMacAddress             75001       23303
         #UDP_ENCAP_SRC_PORT                        0         256
-        p2 = re.compile(r'(?P<rewritedata>\S+) +(?P<allocated>\S+) +(?P<free>\S+)$')
+        p2 = regex_engine.compile(r'(?P<rewritedata>\S+) +(?P<allocated>\S+) +(?P<free>\S+)$')
         for line in output.splitlines():
             line = line.strip()
 
@@ -8162,31 +8163,31 @@ class ShowPlatformMatmMacTable(ShowPlatformMatmMacTableSchema):
             output = self.device.execute(self.cli_command)
 
         # HEAD: MAC address 0012.7fae.9662 in VLAN 1
-        p1 = re.compile(r'^HEAD:\s+MAC\s+address\s+(?P<mac_address>[\d\.a-f]+)\s+in\s+VLAN\s+(?P<vlan>\d+)$')
+        p1 = regex_engine.compile(r'^HEAD:\s+MAC\s+address\s+(?P<mac_address>[\d\.a-f]+)\s+in\s+VLAN\s+(?P<vlan>\d+)$')
 
         # KEY: vlan 4, mac 0x127fae9662, l3_if 0, gpn 24, epoch 0, static 0, flood_en 0, vlan_lead_wless_flood_en 0,
         # client_home_asic 0, learning_peerid 0, learning_peerid_valid 0
-        p2 = re.compile(r'^(?P<key_mask>(KEY|MASK)):\s+vlan\s+(?P<vlan>\d+),\s+mac\s+(?P<mac>\S+),\s+l3_if\s+(?P<l3_if>\d+),\s+gpn\s+(?P<gpn>\d+),'
+        p2 = regex_engine.compile(r'^(?P<key_mask>(KEY|MASK)):\s+vlan\s+(?P<vlan>\d+),\s+mac\s+(?P<mac>\S+),\s+l3_if\s+(?P<l3_if>\d+),\s+gpn\s+(?P<gpn>\d+),'
         r'\s+epoch\s+(?P<epoch>\d+),\s+static\s+(?P<static>\d+),\s+flood_en\s+(?P<flood_en>\d+),\s+vlan_lead_wless_flood_en'
         r'\s+(?P<vlan_lead_wless_flood_en>\d+),\s+client_home_asic\s+(?P<client_home_asic>\d+),*\s+learning_peerid\s+(?P<learning_peerid>\d+),'
         r'\s+learning_peerid_valid\s+(?P<learning_peerid_valid>\d+)$')
 
         # SRC_AD: need_to_learn 0, lrn_v 0, catchall 0, static_mac 0, chain_ptr_v 0, chain_ptr 0, static_entry_v 0,
         # auth_state 0, auth_mode 0, traf_mode 0, is_src_ce 0
-        p3 = re.compile(r'^SRC_AD:\s+need_to_learn\s+(?P<need_to_learn>\d+),\s+lrn_v\s+(?P<lrn_v>\d+),\s+catchall\s+(?P<catchall>\d+),'
+        p3 = regex_engine.compile(r'^SRC_AD:\s+need_to_learn\s+(?P<need_to_learn>\d+),\s+lrn_v\s+(?P<lrn_v>\d+),\s+catchall\s+(?P<catchall>\d+),'
         r'\s+static_mac\s+(?P<static_mac>\d+),\s+chain_ptr_v\s+(?P<chain_ptr_v>\d+),\s+chain_ptr\s+(?P<chain_ptr>\d+),\s+static_entry_v'
         r'\s+(?P<static_entry_v>\d+),\s+auth_state\s+(?P<auth_state>\d+),\s+auth_mode\s+(?P<auth_mode>\d+),\s+traf_mode\s+(?P<traf_mode>\d+),'
         r'\s+is_src_ce\s+(?P<is_src_ce>\d+)$')
 
         # DST_AD: si 0xb1, bridge 0, replicate 0, blk_fwd_o 0, v4_mac 0, v6_mac 0, catchall 0, ign_src_lrn 0, port_mask_o 0,
         # afd_cli_f 0, afd_lbl 0, priority 3, dest_mod_idx 0, destined_to_us 0, pv_trunk 0
-        p4 = re.compile(r'^DST_AD:\s+si\s+(?P<si>\S+),\s+bridge\s+(?P<bridge>\d+),\s+replicate\s+(?P<replicate>\d+),\s+blk_fwd_o\s+(?P<blk_fwd_o>\d+),'
+        p4 = regex_engine.compile(r'^DST_AD:\s+si\s+(?P<si>\S+),\s+bridge\s+(?P<bridge>\d+),\s+replicate\s+(?P<replicate>\d+),\s+blk_fwd_o\s+(?P<blk_fwd_o>\d+),'
         r'\s+v4_mac\s+(?P<v4_mac>\d+),\s+v6_mac\s+(?P<v6_mac>\d+),\s+catchall\s+(?P<catchall>\d+),\s+ign_src_lrn\s+(?P<ign_src_lrn>\d+),\s+port_mask_o'
         r'\s+(?P<port_mask_o>\d+),\s+afd_cli_f\s+(?P<afd_cli_f>\d+),\s+afd_lbl\s+(?P<afd_lbl>\d+),\s+priority\s+(?P<priority>\d+),\s+'
         r'dest_mod_idx\s+(?P<dest_mod_idx>\d+),\s+destined_to_us\s+(?P<destined_to_us>\d+),\s+pv_trunk\s+(?P<pv_trunk>\d+)$')
 
         # Total Mac number of addresses:: 6
-        p5 = re.compile(r'^Total\s+Mac\s+number\s+of\s+addresses::\s+(?P<total_mac_address>\d+)$')
+        p5 = regex_engine.compile(r'^Total\s+Mac\s+number\s+of\s+addresses::\s+(?P<total_mac_address>\d+)$')
 
         ret_dict = dict()
 
@@ -8290,13 +8291,13 @@ class ShowSwitchStackRingSpeed(ShowSwitchStackRingSpeedSchema):
 
         # Stack Ring Speed        : 240G
         # Stack Ring Speed        : N/A
-        p1 = re.compile(r'^Stack\s+Ring\s+Speed\s+:\s+(?P<speed>\S+)$')
+        p1 = regex_engine.compile(r'^Stack\s+Ring\s+Speed\s+:\s+(?P<speed>\S+)$')
 
         # Stack Ring Configuration: Half
-        p2 = re.compile(r'^Stack\s+Ring\s+Configuration:\s+(?P<configuration>\w+)$')
+        p2 = regex_engine.compile(r'^Stack\s+Ring\s+Configuration:\s+(?P<configuration>\w+)$')
 
         # Stack Ring Protocol     : StackWise
-        p3 = re.compile(r'^Stack\s+Ring\s+Protocol\s+:\s+(?P<protocol>\w+)$')
+        p3 = regex_engine.compile(r'^Stack\s+Ring\s+Protocol\s+:\s+(?P<protocol>\w+)$')
 
         ret_dict = dict()
 
@@ -8337,7 +8338,7 @@ class ShowPlatformUsbStatus(ShowPlatformUsbStatusSchema):
             output = self.device.execute(self.cli_command)
 
         # USB enabled
-        p1 = re.compile(r'^USB\s+(?P<status>\S+)$')
+        p1 = regex_engine.compile(r'^USB\s+(?P<status>\S+)$')
 
         ret_dict = dict()
 
@@ -8386,7 +8387,7 @@ class ShowPlatformPmInterfaceNumbers(ShowPlatformPmInterfaceNumbersSchema):
 
         # Gi1/0/1       9  1    1    1    1    0x7F2C5B930F40 0x10040    0x20001B   0x4        9
 
-        p1 = re.compile(r"^(?P<interface>\S+)\s+(?P<iif_id>\d+)\s+(?P<gid>\d+)\s+(?P<slot>\d+)\s+(?P<unit>\d+)\s+(?P<slun>\d+)\s+(?P<hwidb_ptr>\S+)\s+(?P<status>\S+)\s+(?P<status2>\S+)\s+(?P<state>\S+)\s+(?P<snmp_if_index>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<interface>\S+)\s+(?P<iif_id>\d+)\s+(?P<gid>\d+)\s+(?P<slot>\d+)\s+(?P<unit>\d+)\s+(?P<slun>\d+)\s+(?P<hwidb_ptr>\S+)\s+(?P<status>\S+)\s+(?P<status2>\S+)\s+(?P<state>\S+)\s+(?P<snmp_if_index>\d+)$")
         ret_dict = {}
         for line in output.splitlines():
             line = line.strip()
@@ -8480,25 +8481,25 @@ class ShowProcessesPid(ShowProcessesPidSchema):
         # Define RegExes for each possible kind of line
 
         # Process ID 3 [Network Synchronization Selection Control Process], TTY 0
-        p1 = re.compile(r'^Process +ID +(?P<pid>(\S+)) +\[ *(?P<process_name>([ a-zA-Z0-9]+)) *\], TTY +(?P<tty>(\S+))$')
+        p1 = regex_engine.compile(r'^Process +ID +(?P<pid>(\S+)) +\[ *(?P<process_name>([ a-zA-Z0-9]+)) *\], TTY +(?P<tty>(\S+))$')
 
         #   Holding: 41960, Maximum: 0, Allocated: 0, Freed: 0
-        p2 = re.compile(r'^Holding: +(?P<holding>(\d+)), +Maximum: +(?P<maximum>(\d+)), +Allocated: +(?P<allocated>(\d+)), +Freed: +(?P<freed>(\d+))$')
+        p2 = regex_engine.compile(r'^Holding: +(?P<holding>(\d+)), +Maximum: +(?P<maximum>(\d+)), +Allocated: +(?P<allocated>(\d+)), +Freed: +(?P<freed>(\d+))$')
 
         #   Getbufs: 0, Retbufs: 0, Stack: 34240/36000
-        p3 = re.compile(r'^Getbufs: +(?P<getbufs>(\d+)), +Retbufs: +(?P<retbufs>(\d+)), Stack: +(?P<stack>(\S+))$')
+        p3 = regex_engine.compile(r'^Getbufs: +(?P<getbufs>(\d+)), +Retbufs: +(?P<retbufs>(\d+)), Stack: +(?P<stack>(\S+))$')
 
         #   PC: 64448F4868F5, Invoked: 1, Giveups: 0, uSec: 0
-        p4 = re.compile(r'^PC: +(?P<pc>(\S+)), +Invoked: +(?P<invoked>(\d+)), Giveups: +(?P<giveups>(\d+)), uSec: (?P<u_sec>(\d+))$')
+        p4 = regex_engine.compile(r'^PC: +(?P<pc>(\S+)), +Invoked: +(?P<invoked>(\d+)), Giveups: +(?P<giveups>(\d+)), uSec: (?P<u_sec>(\d+))$')
 
         #   5Sec: 0.00%, 1Min: 0.00%, 5Min: 0.00%, Average: 0.00%
-        p5 = re.compile(r'^5Sec: +(?P<five_sec_percent>(\S+))%, +1Min: +(?P<one_min_percent>(\S+))%, +5Min: +(?P<five_min_percent>(\S+))%, +Average: +(?P<average>(\S+))%$')
+        p5 = regex_engine.compile(r'^5Sec: +(?P<five_sec_percent>(\S+))%, +1Min: +(?P<one_min_percent>(\S+))%, +5Min: +(?P<five_min_percent>(\S+))%, +Average: +(?P<average>(\S+))%$')
 
         #   Age: 511941589 msec, Runtime: 0 msec
-        p6 = re.compile(r'^Age: +(?P<age>(\S+)) msec, +Runtime: +(?P<runtime>(\d+)) msec$')
+        p6 = regex_engine.compile(r'^Age: +(?P<age>(\S+)) msec, +Runtime: +(?P<runtime>(\d+)) msec$')
 
         #   State: Waiting for Event, Priority: Critical
-        p7 = re.compile(r'^State: +(?P<state>([ a-zA-Z0-9]+)), +Priority: +(?P<priority>(\S+))$')
+        p7 = regex_engine.compile(r'^State: +(?P<state>([ a-zA-Z0-9]+)), +Priority: +(?P<priority>(\S+))$')
 
 
         # Iterate over output lines to check which pattern is matched
@@ -8642,13 +8643,13 @@ class ShowXfsuEligibility(ShowXfsuEligibilitySchema):
             output = self.device.execute(self.cli_command)
 
         # Reload fast supported: Yes
-        p1 = re.compile(r'^Reload fast supported: (?P<reload_fast_supported>\w+)$')
+        p1 = regex_engine.compile(r'^Reload fast supported: (?P<reload_fast_supported>\w+)$')
 
         # Reload Fast PLATFORM Status: Not started yet
-        p2 = re.compile(r'^Reload Fast PLATFORM Status: (?P<platform_status>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^Reload Fast PLATFORM Status: (?P<platform_status>[\w\s]+)$')
 
         # Stack Configuration: Yes
-        p3 = re.compile(r'^Stack Configuration: (?P<stack_configuration>\w+)$')
+        p3 = regex_engine.compile(r'^Stack Configuration: (?P<stack_configuration>\w+)$')
 
         # Eligibility Check         Status
         # =================         ======
@@ -8657,13 +8658,13 @@ class ShowXfsuEligibility(ShowXfsuEligibilitySchema):
         # Network Advantage License Yes
         # Full ring stack           Yes
         # Check macsec eligibility  Eligible
-        p4 = re.compile(r'^(?P<eligibility_check>[\w+ ]+) +(?P<status>Yes|No|Eligible|Ineligible)$')
+        p4 = regex_engine.compile(r'^(?P<eligibility_check>[\w+ ]+) +(?P<status>Yes|No|Eligible|Ineligible)$')
 
         # Spanning Tree             Ineligible:Root Switch with forwarding link:VLAN0069
-        p5 = re.compile(r'^Spanning Tree\s+(?P<spanning_tree>\w+):(?P<status>[\w ]+):(?P<forwarding_link>\S+)$')
+        p5 = regex_engine.compile(r'^Spanning Tree\s+(?P<spanning_tree>\w+):(?P<status>[\w ]+):(?P<forwarding_link>\S+)$')
 
         # xFSU PLATFORM Status: Not started yet
-        p6 = re.compile(r'^xFSU PLATFORM Status: (?P<xfsu_platform_stauts>[\w\s]+)$')
+        p6 = regex_engine.compile(r'^xFSU PLATFORM Status: (?P<xfsu_platform_stauts>[\w\s]+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -8780,40 +8781,40 @@ class ShowSwitchStackPortsDetail(ShowSwitchStackPortsDetailSchema):
         ret_dict = {}
 
         # 1/1 is DOWN Loopback No
-        p1 = re.compile(r'^(?P<switch_port_id>\S+) is (?P<status>\S+) Loopback (?P<loopback>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<switch_port_id>\S+) is (?P<status>\S+) Loopback (?P<loopback>\S+)$')
 
         # Cable Length 50cm     Neighbor NONE
-        p2 = re.compile(r'^Cable Length (?P<cable_length>\S+)\s+Neighbor (?P<neighbor>\S+)$')
+        p2 = regex_engine.compile(r'^Cable Length (?P<cable_length>\S+)\s+Neighbor (?P<neighbor>\S+)$')
 
         # Link Ok Yes Sync Ok Yes Link Active No
-        p3 = re.compile(r'^Link Ok (?P<link_ok>\S+) Sync Ok (?P<sync_ok>\S+) Link Active (?P<link_active>\S+)$')
+        p3 = regex_engine.compile(r'^Link Ok (?P<link_ok>\S+) Sync Ok (?P<sync_ok>\S+) Link Active (?P<link_active>\S+)$')
 
         # Changes to LinkOK 0
-        p4 = re.compile(r'^Changes to LinkOK (?P<changes_to_link_ok>\d+)$')
+        p4 = regex_engine.compile(r'^Changes to LinkOK (?P<changes_to_link_ok>\d+)$')
 
         # Five minute input rate  0 bytes/sec
-        p5 = re.compile(r'^Five minute input rate\s+(?P<five_minute_input_rate>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^Five minute input rate\s+(?P<five_minute_input_rate>[\S\s]+)$')
 
         # Five minute output rate 0 bytes/sec
-        p6 = re.compile(r'^Five minute output rate\s+(?P<five_minute_output_rate>[\S\s]+)$')
+        p6 = regex_engine.compile(r'^Five minute output rate\s+(?P<five_minute_output_rate>[\S\s]+)$')
 
         # 0 bytes input
-        p7 = re.compile(r'^(?P<input_bytes>\d+) bytes input$')
+        p7 = regex_engine.compile(r'^(?P<input_bytes>\d+) bytes input$')
 
         # 0 bytes output
-        p8 = re.compile(r'^(?P<output_bytes>\d+) bytes output$')
+        p8 = regex_engine.compile(r'^(?P<output_bytes>\d+) bytes output$')
 
         # Data CRC 0
-        p9 = re.compile(r'^Data CRC\s+(?P<data_crc>\d+)$')
+        p9 = regex_engine.compile(r'^Data CRC\s+(?P<data_crc>\d+)$')
 
         # Ringword CRC 0
-        p10 = re.compile(r'^Ringword CRC\s+(?P<ringword_crc>\d+)$')
+        p10 = regex_engine.compile(r'^Ringword CRC\s+(?P<ringword_crc>\d+)$')
 
         # InvRingWord  0
-        p11 = re.compile(r'^InvRingWord\s+(?P<inv_ringword>\d+)$')
+        p11 = regex_engine.compile(r'^InvRingWord\s+(?P<inv_ringword>\d+)$')
 
         # PcsCodeWord 0
-        p12 = re.compile(r'^PcsCodeWord\s+(?P<pcs_codeword>\d+)$')
+        p12 = regex_engine.compile(r'^PcsCodeWord\s+(?P<pcs_codeword>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -8938,19 +8939,19 @@ class ShowXfsuStatus(ShowXfsuStatusSchema):
         if output is None:
             output = self.device.execute(self.cli_command)
         # Reload Fast PLATFORM Status: Not started yet
-        p1 = re.compile(r'^Reload Fast PLATFORM Status: (?P<reload_fast_platform_status>.+)$')
+        p1 = regex_engine.compile(r'^Reload Fast PLATFORM Status: (?P<reload_fast_platform_status>.+)$')
 
         # Graceful Reload Infra Status: Started in stacking mode, not running
-        p2 = re.compile(r'^Graceful Reload Infra Status: (?P<graceful_reload_infra_status>.+)$')
+        p2 = regex_engine.compile(r'^Graceful Reload Infra Status: (?P<graceful_reload_infra_status>.+)$')
 
         # Minimum required system uptime before fast reload can be supported is 5 seconds
-        p3 = re.compile(r'^Minimum required system uptime before fast reload can be supported is (?P<uptime_before_fast_reload>\d+) seconds$')
+        p3 = regex_engine.compile(r'^Minimum required system uptime before fast reload can be supported is (?P<uptime_before_fast_reload>\d+) seconds$')
         # Client OSPFV3                          : (0x10203004) Status: GR stack none: Up
         # Client OSPF                            : (0x10203003) Status: GR stack none: Up
         # Client IS-IS                           : (0x10203002) Status: GR stack none: Up
         # Client GR_CLIENT_FIB                   : (0x10203001) Status: GR stack none: Up
         # Client GR_CLIENT_RIB                   : (0x10203000) Status: GR stack none: Up
-        p4 = re.compile(r'^Client (?P<client>\S+)\s+: \((?P<id>\S+)\) Status: (?P<status>.+)$')
+        p4 = regex_engine.compile(r'^Client (?P<client>\S+)\s+: \((?P<id>\S+)\) Status: (?P<status>.+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -9025,7 +9026,7 @@ class ShowFileSys(ShowFileSysSchema):
         # Filesystem Path: /mnt/usb0
         # Filesystem Type: vfat
         # Mounted: Read/Write
-        p1 = re.compile(r'^(?P<key>Filesystem|Filesystem Path|Filesystem Type|Mounted):\s+(?P<value>.+)$')
+        p1 = regex_engine.compile(r'^(?P<key>Filesystem|Filesystem Path|Filesystem Type|Mounted):\s+(?P<value>.+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -9069,7 +9070,7 @@ class ShowFileInformation(ShowFileInformationSchema):
         # initialze return dictionary
         ret_dict = {}
         #type is IOSXE_PACKAGE []
-        p1 = re.compile(r'^type\s+is\s+(?P<file_type>\S+).*$')
+        p1 = regex_engine.compile(r'^type\s+is\s+(?P<file_type>\S+).*$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -9113,10 +9114,10 @@ class ShowFileDescriptorsDetail(ShowFileDescriptorsDetailSchema):
         ret_dict = {}
 
         # 0         0  0000  699  revrcsf:-
-        p1 = re.compile(r'^(?P<file_id>\d+) +(?P<position_id>\d+) +(?P<open_id>\d+) +(?P<pid>\d+) +(?P<path>\w+\:\-)$')
+        p1 = regex_engine.compile(r'^(?P<file_id>\d+) +(?P<position_id>\d+) +(?P<open_id>\d+) +(?P<pid>\d+) +(?P<path>\w+\:\-)$')
 
         # Filename: usb0:GD_run_config Fd: 4
-        p2 = re.compile(r'^Filename\: +(?P<file_system>\w+)\:(\/)?(?P<file_name>\w+(\.)?(\w+)?).*$')
+        p2 = regex_engine.compile(r'^Filename\: +(?P<file_system>\w+)\:(\/)?(?P<file_name>\w+(\.)?(\w+)?).*$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -9170,11 +9171,11 @@ class ShowTimeRange(ShowTimeRangeSchema):
             output = self.device.execute(self.cli_command.format(time_range_name=time_range_name))
 
         # time-range entry: time1 (active)
-        p1 = re.compile(r"^time-range\s+entry:\s+(?P<time_range_entry>\S+)\s+\((?P<status>\w+)\)$")
+        p1 = regex_engine.compile(r"^time-range\s+entry:\s+(?P<time_range_entry>\S+)\s+\((?P<status>\w+)\)$")
         #    periodic daily 22:40 to 22:41
-        p2 = re.compile(r"^\s+periodic\s+(?P<periodicity>\w+)\s+(?P<start_time>\S+)\s+to\s+(?P<end_time>\S+)$")
+        p2 = regex_engine.compile(r"^\s+periodic\s+(?P<periodicity>\w+)\s+(?P<start_time>\S+)\s+to\s+(?P<end_time>\S+)$")
         #    used in: IPv6 ACL entry
-        p3 = re.compile(r"^\s+used\s+in:\s+(?P<used_in>\S+\s+\S+\s+\S+)$")
+        p3 = regex_engine.compile(r"^\s+used\s+in:\s+(?P<used_in>\S+\s+\S+\s+\S+)$")
 
         ret_dict = {}
 
@@ -9241,16 +9242,16 @@ class ShowPlatformPmEtherchannelGroupMask(ShowPlatformPmEtherchannelGroupMaskSch
             output = self.device.execute(self.cli_command.format(ec_channel_group_id=ec_channel_group_id))
 
         # EC Channel-Group               : 10
-        p1 = re.compile(r"^EC Channel-Group\s+: (?P<ec_channel_group_id>\S+)$")
+        p1 = regex_engine.compile(r"^EC Channel-Group\s+: (?P<ec_channel_group_id>\S+)$")
 
         # EC Channel-Group Mac           : 0077.8d99.410e
-        p2 = re.compile(r"^EC Channel-Group Mac\s+: (?P<ec_channel_group_mac>\S+)$")
+        p2 = regex_engine.compile(r"^EC Channel-Group Mac\s+: (?P<ec_channel_group_mac>\S+)$")
 
         # # Of Active Ports              : 2
-        p3 = re.compile(r"^# Of Active Ports\s+: (?P<of_active_ports>\S+)$")
+        p3 = regex_engine.compile(r"^# Of Active Ports\s+: (?P<of_active_ports>\S+)$")
 
         # If Name                                  If Id                  EC Index
-        p4 = re.compile(r"^(?P<interface_name>\S+) +(?P<interface_id>[\w\s]+)\s+(?P<ec_index>[\d]+)$")
+        p4 = regex_engine.compile(r"^(?P<interface_name>\S+) +(?P<interface_id>[\w\s]+)\s+(?P<ec_index>[\d]+)$")
 
         ret_dict = {}
 
@@ -9317,10 +9318,10 @@ class TestPlatformSoftwareDatabase(TestPlatformSoftwareDatabaseSchema):
         ret_dict = {}
 
         # Table Record Index 0 = {
-        p1 = re.compile(r"^Table\s+Record\s+Index\s+(?P<index>\d+)\s+=\s+{$")
+        p1 = regex_engine.compile(r"^Table\s+Record\s+Index\s+(?P<index>\d+)\s+=\s+{$")
 
         # [0] cname = Fan1/1
-        p2 = re.compile(r"^\s*\[(?P<index>\d+)\]\s+(?P<key>\S+)\s+=\s+(?P<value>.*)$")
+        p2 = regex_engine.compile(r"^\s*\[(?P<index>\d+)\]\s+(?P<key>\S+)\s+=\s+(?P<value>.*)$")
 
         # Initialize variables to hold temporary values
         index = None
@@ -9395,7 +9396,7 @@ class ShowPlatformSoftwareFedSwitchAclUsageIncludeAcl(ShowPlatformSoftwareFedSwi
         ret_dict = {}
 
         # PACL          IPV4          Egress          racl_permit_egress          2
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<feature_type>\w+)\s+(?P<acl_type>IPV[46])\s+(?P<dir>\w+)\s+(?P<name>\w+)\s+(?P<entries_used>\d+)$"
         )
 
@@ -9461,27 +9462,27 @@ class ShowRepTopologyDetail(ShowRepTopologyDetailSchema):
         ret_dict = {}
 
         # REP Segment 50
-        p1 = re.compile(r'^REP Segment (?P<rep_segment_no>\d+)$')
+        p1 = regex_engine.compile(r'^REP Segment (?P<rep_segment_no>\d+)$')
 
         # BOIS168ZW2001, Te0/2 (Primary Edge No-Neighbor)
         # BOIS168ZW2001, Te0/1 (Intermediate)
-        p2 = re.compile(r'^(?P<bridge>[\w\d]+), (?P<interface>[a-z|A-Z]+\d+\/\d+(\/\d+)?) \((?P<edge>.+)\)$')
+        p2 = regex_engine.compile(r'^(?P<bridge>[\w\d]+), (?P<interface>[a-z|A-Z]+\d+\/\d+(\/\d+)?) \((?P<edge>.+)\)$')
 
         # Open Port, all vlans forwarding
         # Alternate Port, some vlans blocked
-        p3 = re.compile(r'^(?P<role>(Open|Alternate)) Port, (?P<vlan_status>.+)$')
+        p3 = regex_engine.compile(r'^(?P<role>(Open|Alternate)) Port, (?P<vlan_status>.+)$')
 
         # Bridge MAC: f80b.cb8f.7bbf
-        p4 = re.compile(r'^Bridge MAC: (?P<bridge_mac>[\w\d\.]+)$')
+        p4 = regex_engine.compile(r'^Bridge MAC: (?P<bridge_mac>[\w\d\.]+)$')
 
         # Port Number: 022
-        p5 = re.compile(r'^Port Number: (?P<port_number>[\w\d]+)$')
+        p5 = regex_engine.compile(r'^Port Number: (?P<port_number>[\w\d]+)$')
 
         # Port Priority: 000
-        p6 = re.compile(r'^Port Priority: (?P<port_priority>\d+)$')
+        p6 = regex_engine.compile(r'^Port Priority: (?P<port_priority>\d+)$')
 
         # Neighbor Number: 35 / [-26]
-        p7 = re.compile(r'^Neighbor Number: (?P<neighbor_number>.+)$')
+        p7 = regex_engine.compile(r'^Neighbor Number: (?P<neighbor_number>.+)$')
 
         for line in output.splitlines():
 
@@ -9593,25 +9594,25 @@ class ShowPlatformfrontendcontroller(ShowPlatformfrontendcontrollerSchema):
         ret_dict = {}
 
         #Switch 1 MCU
-        p1 = re.compile(r'^Switch +(?P<switch_number>\d+) +MCU\:$')
+        p1 = regex_engine.compile(r'^Switch +(?P<switch_number>\d+) +MCU\:$')
 
         #Software Version   0.0
-        p2 =  re.compile(r'^Software +Version +(?P<software_version>.*)$')
+        p2 =  regex_engine.compile(r'^Software +Version +(?P<software_version>.*)$')
 
         #System Type        0
-        p3 = re.compile(r'^System +Type +(?P<system_type>.*)$')
+        p3 = regex_engine.compile(r'^System +Type +(?P<system_type>.*)$')
 
         #Device Id          0
-        p4 = re.compile(r'^Device +Id +(?P<device_id>.*)$')
+        p4 = regex_engine.compile(r'^Device +Id +(?P<device_id>.*)$')
 
         #Device Revision    0
-        p5 = re.compile(r'^Device +Revision +(?P<device_revision>.*)$')
+        p5 = regex_engine.compile(r'^Device +Revision +(?P<device_revision>.*)$')
 
         #Hardware Version   0
-        p6 = re.compile(r'^Hardware +Version +(?P<hardware_version>.*)$')
+        p6 = regex_engine.compile(r'^Hardware +Version +(?P<hardware_version>.*)$')
 
         #Bootloader Version 0
-        p7 = re.compile(r'^Bootloader +Version +(?P<bootloader_version>.*)$')
+        p7 = regex_engine.compile(r'^Bootloader +Version +(?P<bootloader_version>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -9707,11 +9708,11 @@ class ShowPlatformNatTranslationsStandby(ShowPlatformNatTranslationsStandbySchem
 
         # Pro Inside global Inside local Outside local Outside global
         # TCP 135.0.0.2:0   192.0.0.2:0  193.0.0.2:0   193.0.0.2:0
-        p1 = re.compile(r'^(?P<protocol>-+|UDP|TCP) +'
-                        r'(?P<inside_global>[\d.]+:+\d+) +'
-                        r'(?P<inside_local>[\d.]+:+\d+) +'
-                        r'(?P<outside_local>[\d.]+:+\d+) +'
-                        r'(?P<outside_global>[\d.]+:+\d+)$')
+        p1 = regex_engine.compile(r'^(?P<protocol>-+|UDP|TCP) +'
+                                  r'(?P<inside_global>[\d.]+:+\d+) +'
+                                  r'(?P<inside_local>[\d.]+:+\d+) +'
+                                  r'(?P<outside_local>[\d.]+:+\d+) +'
+                                  r'(?P<outside_global>[\d.]+:+\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -9767,25 +9768,25 @@ class ShowPlatformNatTranslationsStandbyStatistics(ShowPlatformNatTranslationsSt
         ret_dict = {}
 
         # NAT Type                : Static
-        p0 = re.compile(r'^NAT Type +: +(?P<nat_type>-+|Static|Dynamic|Mixed)$')
+        p0 = regex_engine.compile(r'^NAT Type +: +(?P<nat_type>-+|Static|Dynamic|Mixed)$')
 
         # Netflow Type            : NA
-        p1 = re.compile(r'^Netflow Type +: +(?P<netflow_type>\S+)$')
+        p1 = regex_engine.compile(r'^Netflow Type +: +(?P<netflow_type>\S+)$')
 
         # Flow Record             : Disabled
-        p2 = re.compile(r'^Flow Record  +: +(?P<flow_record>-+|Disabled|Enabled)$')
+        p2 = regex_engine.compile(r'^Flow Record  +: +(?P<flow_record>-+|Disabled|Enabled)$')
 
         # Dynamic NAT entries     : 0 entries
-        p3 = re.compile(r'^Dynamic NAT entries  +: +(?P<dynamic_nat_entries>\d+ entries)$')
+        p3 = regex_engine.compile(r'^Dynamic NAT entries  +: +(?P<dynamic_nat_entries>\d+ entries)$')
 
         # Static NAT entries      : 0 entries
-        p4 = re.compile(r'^Static NAT entries +: +(?P<static_nat_entries>\d+ entries)$')
+        p4 = regex_engine.compile(r'^Static NAT entries +: +(?P<static_nat_entries>\d+ entries)$')
 
         # Total NAT entries       : 0 entries
-        p5 = re.compile(r'^Total NAT entries +: +(?P<total_nat_entries>\d+ entries)$')
+        p5 = regex_engine.compile(r'^Total NAT entries +: +(?P<total_nat_entries>\d+ entries)$')
 
         # Total HW Resource (TCAM): 26 of 27648 /0 .09% utilization
-        p6 = re.compile(r'^Total HW Resource \(TCAM\)+: +(?P<total_hw_resource_tcam>\d+ of \d+ /\d+ \.\d+% utilization)$')
+        p6 = regex_engine.compile(r'^Total HW Resource \(TCAM\)+: +(?P<total_hw_resource_tcam>\d+ of \d+ /\d+ \.\d+% utilization)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -9859,10 +9860,10 @@ class ShowPlatformSoftwareCpmSwitchActiveB0PacketsControlIpc(ShowPlatformSoftwar
         ret_dict = {}
 
         # Packet :: 1
-        p1 = re.compile(r'^Packet :: (\d+)$')  
+        p1 = regex_engine.compile(r'^Packet :: (\d+)$')  
         
         #Jun 16 13:13:17.742
-        p2 = re.compile(r'^[A-Za-z]+\s+\d+\s+\d+:\d+:\d+\.\d+$')
+        p2 = regex_engine.compile(r'^[A-Za-z]+\s+\d+\s+\d+:\d+:\d+\.\d+$')
 
         current_packet = None  
         packet_data = ""  # A string to accumulate data for the current packet
@@ -33,7 +33,6 @@
 """
 
 # Python
-import re
 import logging
 from collections import OrderedDict
 from sys import int_info
@@ -43,6 +42,7 @@ from xml.dom import minidom
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -140,7 +140,7 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
         # Interface: BG4048.10207e1 QFP: 0.0 if_h: 4079 Num Queues/Schedules: 0
         # Interface: VPLS-2944.10207e2 QFP: 0.0 if_h: 4080 Num Queues/Schedules:
         # Interface: internal0/0/recycle:0 QFP: 0.0 if_h: 1 Num Queues/Schedules: 0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Interface: +(?P<intf_name>[\w\d\/\.\-\:]+)"
             r" +QFP: +(?P<qfp>[\d\.]+)"
             r" +if_h: +(?P<if_h>\d+)"
@@ -148,7 +148,7 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
         )
 
         #     Index 0 (Queue ID:0xa6, Name: GigabitEthernet1/0/7)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Index +(?P<index>\d+)"
             r" +\(Queue +ID:(?P<queue_id>[\w\d]+),"
             r" +Name: +(?P<interf_name>[\w\d\/\.\-\:]+)\)$"
@@ -156,84 +156,84 @@ class ShowPlatformHardware(ShowPlatformHardwareSchema):
 
         #       Software Control Info:
         #  PARQ Software Control Info:
-        p3_1 = re.compile(r"^(PARQ +)?Software Control Info:$")
+        p3_1 = regex_engine.compile(r"^(PARQ +)?Software Control Info:$")
 
         #  (cache) queue id: 0x000000a6, wred: 0x88b16ac2, qlimit (bytes): 3281312
         #  (cache) queue id: 0x00000070, wred: 0xe73cfde0, qlimit (pkts ): 418
-        p3_2 = re.compile(
+        p3_2 = regex_engine.compile(
             r"^\(cache\) +queue +id: +(?P<cache_queue_id>[\w\d]+),"
             r" +wred: +(?P<wred>[\w\d]+),"
             r" +qlimit +\((?P<type>bytes|pkts +)\): +(?P<qlimit>\d+)$"
         )
 
         #       parent_sid: 0x284, debug_name: GigabitEthernet1/0/7
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^parent_sid: +(?P<parent_sid>[\w\d]+),"
             r" debug_name: +(?P<debug_name>[\w\d\/\.\-\:]+)$"
         )
 
         #       sw_flags: 0x08000011, sw_state: 0x00000c01, port_uidb: 245728
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^sw_flags: +(?P<sw_flags>[\w\d]+),"
             r" +sw_state: +(?P<sw_state>[\w\d]+),"
             r" +port_uidb: +(?P<port_uidb>\d+)$"
         )
 
         #       orig_min  : 0                   ,      min: 105000000
-        p6 = re.compile(r"^orig_min +: +(?P<orig_min>\d+) +, +min: +(?P<min>\d+)$")
+        p6 = regex_engine.compile(r"^orig_min +: +(?P<orig_min>\d+) +, +min: +(?P<min>\d+)$")
 
         #       min_qos   : 0                   , min_dflt: 0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^min_qos +: +(?P<min_qos>\d+) +, +min_dflt: +(?P<min_dflt>\d+)$"
         )
 
         #       orig_max  : 0                   ,      max: 0
-        p8 = re.compile(r"^orig_max +: +(?P<orig_max>\d+) +, +max: +(?P<max>\d+)$")
+        p8 = regex_engine.compile(r"^orig_max +: +(?P<orig_max>\d+) +, +max: +(?P<max>\d+)$")
 
         #       max_qos   : 0                   , max_dflt: 0
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^max_qos +: +(?P<max_qos>\d+) +, +max_dflt: +(?P<max_dflt>\d+)$"
         )
 
         #       share     : 1
-        p10 = re.compile(r"^share +: +(?P<share>\d+)$")
+        p10 = regex_engine.compile(r"^share +: +(?P<share>\d+)$")
 
         #       plevel    : 0, priority: 65535
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^plevel +: +(?P<plevel>\d+), +priority: +(?P<priority>\d+)$"
         )
 
         #       defer_obj_refcnt: 0
         #   defer_obj_refcnt: 0, cp_ppe_addr: 0x00000000
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^defer_obj_refcnt: +(?P<defer_obj_refcnt>\d+)"
             r"(, +cp_ppe_addr: +(?P<cp_ppe_addr>\w+))?$"
         )
 
         #     Statistics:
-        p13_1 = re.compile(r"^Statistics:$")
+        p13_1 = regex_engine.compile(r"^Statistics:$")
 
         #       tail drops  (bytes): 0                   ,          (packets): 0
-        p13_2 = re.compile(
+        p13_2 = regex_engine.compile(
             r"^tail +drops +\(bytes\): +(?P<tail_drops_bytes>\d+) +,"
             r" +\(packets\): +(?P<tail_drops_packets>\d+)$"
         )
 
         #       total enqs  (bytes): 0                   ,          (packets): 0
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^total +enqs +\(bytes\): +(?P<total_enqs_bytes>\d+) +,"
             r" +\(packets\): +(?P<total_enqs_packets>\d+)$"
         )
 
         #       queue_depth (bytes): 0
         #       queue_depth (pkts ): 0
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^queue_depth +\((?P<type>bytes|pkts +)\): +(?P<queue_depth>\d+)$"
         )
 
         #       licensed throughput oversubscription drops:
         #                   (bytes): 0                   ,          (packets): 0
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^\(bytes\): +(?P<lic_throughput_oversub_drops_bytes>\d+) +,"
             r" +\(packets\): +(?P<lic_throughput_oversub_drops_packets>\d+)$"
         )
@@ -533,103 +533,103 @@ class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
         ret_dict = {}
 
         # Interface 0/0/0
-        p1 = re.compile(r"^Interface +(?P<port>[\d\/]+)$")
+        p1 = regex_engine.compile(r"^Interface +(?P<port>[\d\/]+)$")
 
         #   RX Low Priority
         #   RX High Priority
-        p2 = re.compile(r"^RX +(?P<direction>\w+) +Priority$")
+        p2 = regex_engine.compile(r"^RX +(?P<direction>\w+) +Priority$")
 
         #     RX Pkts      369         Bytes 27789
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^RX +Pkts +(?P<rx_total_pkts>\d+) +Bytes +(?P<rx_total_bytes>\d+)$"
         )
 
         #     RX Drop Pkts 0           Bytes 0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^RX +Drop +Pkts +(?P<rx_dropped_pkts>\d+) +Bytes +(?P<rx_dropped_bytes>\d+)$"
         )
 
         #     RX Err  Pkts 0           Bytes 0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^RX +Err +Pkts +(?P<rx_errored_pkts>\d+) +Bytes +(?P<rx_errored_bytes>\d+)$"
         )
 
         #   TX Low Priority
         #   TX High Priority
-        p6 = re.compile(r"^TX +(?P<direction>\w+) +Priority$")
+        p6 = regex_engine.compile(r"^TX +(?P<direction>\w+) +Priority$")
 
         #     TX Pkts      1265574622  Bytes 250735325722
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^TX +Pkts +(?P<tx_total_pkts>\d+) +Bytes +(?P<tx_total_bytes>\d+)$"
         )
 
         #     TX Drop Pkts 0           Bytes 0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^TX +Drop +Pkts +(?P<tx_dropped_pkts>\d+) +Bytes +(?P<tx_dropped_bytes>\d+)$"
         )
 
         # 0/3, SPA-1XTENGE-XFP-V2, Online
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^(?P<slot>\d+)/(?P<subslot>\d+),"
             r" +(?P<name>[\w\d\-]+),"
             r" +(?P<status>\w+)$"
         )
 
         #   RX IPC Pkts 0           Bytes 0
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^RX +IPC +Pkts +(?P<rx_ipc_pkts>\d+) +Bytes +(?P<rx_ipc_bytes>\d+)$"
         )
 
         #   TX IPC Pkts 0           Bytes 0
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^TX +IPC +Pkts +(?P<tx_ipc_pkts>\d+) +Bytes +(?P<tx_ipc_bytes>\d+)$"
         )
 
         #   RX IPC Err 0
-        p12 = re.compile(r"^RX +IPC +Err +(?P<rx_ipc_err>\d+)$")
+        p12 = regex_engine.compile(r"^RX +IPC +Err +(?P<rx_ipc_err>\d+)$")
 
         #   TX IPC Err 0
-        p13 = re.compile(r"^TX +IPC +Err +(?P<tx_ipc_err>\d+)$")
+        p13 = regex_engine.compile(r"^TX +IPC +Err +(?P<tx_ipc_err>\d+)$")
 
         #   RX Spi4 Interrupt Counters
         #   TX Spi4 Interrupt Counters
-        p14 = re.compile(r"^(?P<tx_rx>\w+) +Spi4 +Interrupt +Counters$")
+        p14 = regex_engine.compile(r"^(?P<tx_rx>\w+) +Spi4 +Interrupt +Counters$")
 
         #     Out Of Frame 0
-        p15 = re.compile(r"^Out +Of +Frame +(?P<out_of_frame>\d+)$")
+        p15 = regex_engine.compile(r"^Out +Of +Frame +(?P<out_of_frame>\d+)$")
 
         #     Dip4 Error 0
-        p16 = re.compile(r"^Dip4 +Error +(?P<rx_dip4_error>\d+)$")
+        p16 = regex_engine.compile(r"^Dip4 +Error +(?P<rx_dip4_error>\d+)$")
 
         #     Disabled 0
-        p17 = re.compile(r"^Disabled +(?P<rx_disbaled>\d+)$")
+        p17 = regex_engine.compile(r"^Disabled +(?P<rx_disbaled>\d+)$")
 
         #     Loss Of Sync 0
-        p18 = re.compile(r"^Loss +Of +Sync +(?P<rx_loss_of_sync>\d+)$")
+        p18 = regex_engine.compile(r"^Loss +Of +Sync +(?P<rx_loss_of_sync>\d+)$")
 
         #     Sequence Error 0
-        p19 = re.compile(r"^Sequence +Error +(?P<rx_sequence_error>\d+)$")
+        p19 = regex_engine.compile(r"^Sequence +Error +(?P<rx_sequence_error>\d+)$")
 
         #     Burst Error 0
-        p20 = re.compile(r"^Burst +Error +(?P<rx_burst_error>\d+)$")
+        p20 = regex_engine.compile(r"^Burst +Error +(?P<rx_burst_error>\d+)$")
 
         #     EOP Abort 0
-        p21 = re.compile(r"^EOP +Abort +(?P<rx_eop_abort>\d+)$")
+        p21 = regex_engine.compile(r"^EOP +Abort +(?P<rx_eop_abort>\d+)$")
 
         #     Packet Gap Error 0
-        p22 = re.compile(r"^Packet +Gap +Error +(?P<rx_packet_gap_error>\d+)$")
+        p22 = regex_engine.compile(r"^Packet +Gap +Error +(?P<rx_packet_gap_error>\d+)$")
 
         #     Control Word Error 0
-        p23 = re.compile(r"^Control +Word +Error +(?P<rx_control_word_error>\d+)$")
+        p23 = regex_engine.compile(r"^Control +Word +Error +(?P<rx_control_word_error>\d+)$")
 
         #     Frame Error 0
-        p24 = re.compile(r"^Frame +Error +(?P<tx_frame_error>\d+)$")
+        p24 = regex_engine.compile(r"^Frame +Error +(?P<tx_frame_error>\d+)$")
 
         #     FIFO Over Flow 0
-        p25 = re.compile(r"^FIFO +Over +Flow +(?P<tx_fifo_over_flow>\d+)$")
+        p25 = regex_engine.compile(r"^FIFO +Over +Flow +(?P<tx_fifo_over_flow>\d+)$")
 
         #     Dip2 Error 0
-        p26 = re.compile(r"^Dip2 +Error +(?P<tx_dip2_error>\d+)$")
+        p26 = regex_engine.compile(r"^Dip2 +Error +(?P<tx_dip2_error>\d+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -963,13 +963,13 @@ class ShowPlatformHardwareQfpBqsOpmMapping(ShowPlatformHardwareQfpBqsMappingSche
         # 38       HighNormal                    GPM             7
         # 55*      Drain Low                     GPM             0
         # * - indicates the drain mode bit is set for this channel
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<number>\d+)(?P<drained>\*)? +(?P<name>[\w\-\s]+)"
             r" +(?P<interface>[\w\d]+) +(?P<logical_channel>\d+)$"
         )
 
         # 32       Unmapped
-        p2 = re.compile(r"^(?P<unmapped_number>\d+) +Unmapped$")
+        p2 = regex_engine.compile(r"^(?P<unmapped_number>\d+) +Unmapped$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1027,14 +1027,14 @@ class ShowPlatformHardwareQfpBqsIpmMapping(ShowPlatformHardwareQfpBqsMappingSche
         # 15     Nitrox Low          SPI0          14        1
         # 17     HT Pkt Low          HT             0        1
         # 21     CC4 Low             SPI0          16        1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<number>\d+) +(?P<name>[\w\-\s]+)"
             r" +(?P<interface>[\w\d]+) +(?P<port>\d+)"
             r" +(?P<cfifo>\d+)$"
         )
 
         # 32       Unmapped
-        p2 = re.compile(r"^(?P<unmapped_number>\d+) +Unmapped$")
+        p2 = regex_engine.compile(r"^(?P<unmapped_number>\d+) +Unmapped$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1153,26 +1153,26 @@ class ShowPlatformHardwareSerdes(ShowPlatformHardwareSerdesSchema):
         ret_dict = {}
 
         # From Slot 1-Link B
-        p1 = re.compile(r"^From +Slot +(?P<link>[\w\d\-\s]+)$")
+        p1 = regex_engine.compile(r"^From +Slot +(?P<link>[\w\d\-\s]+)$")
 
         #   Pkts  High: 0          Low: 0          Bad: 0          Dropped: 0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Pkts +High: +(?P<high>\d+) +Low: +(?P<low>\d+)( +Bad: +(?P<bad>\d+) +Dropped: +(?P<dropped>\d+))?$"
         )
 
         #   Bytes High: 0          Low: 0          Bad: 0          Dropped: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Bytes +High: +(?P<high>\d+) +Low: +(?P<low>\d+) +Bad: +(?P<bad>\d+) +Dropped: +(?P<dropped>\d+)$"
         )
 
         #   Pkts  Looped: 0          Error: 0
-        p4 = re.compile(r"^Pkts +Looped: +(?P<looped>\d+) +Error: +(?P<errored>\d+)$")
+        p4 = regex_engine.compile(r"^Pkts +Looped: +(?P<looped>\d+) +Error: +(?P<errored>\d+)$")
 
         #   Bytes Looped 0
-        p5 = re.compile(r"^Bytes +Looped +(?P<looped>\d+)$")
+        p5 = regex_engine.compile(r"^Bytes +Looped +(?P<looped>\d+)$")
 
         #   Qstat count: 0          Flow ctrl count: 3501
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Qstat +count: +(?P<qstat_count>\d+) +Flow +ctrl +count: +(?P<flow_ctrl_count>\d+)$"
         )
 
@@ -1251,57 +1251,57 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
 
         # Network-Processor-0 Link:
         # RP/ESP Link:
-        p1 = re.compile(r"^(?P<link>[\w\d\-\s/]+) +Link:$")
+        p1 = regex_engine.compile(r"^(?P<link>[\w\d\-\s/]+) +Link:$")
 
         #   Local TX in sync, Local RX in sync
-        p2 = re.compile(r"^Local +TX +in +sync, +Local +RX +in +sync$")
+        p2 = regex_engine.compile(r"^Local +TX +in +sync, +Local +RX +in +sync$")
 
         #   Remote TX in sync, Remote RX in sync
-        p3 = re.compile(r"^Remote +TX +in +sync, +Remote +RX +in +sync$")
+        p3 = regex_engine.compile(r"^Remote +TX +in +sync, +Remote +RX +in +sync$")
 
         #   To Network-Processor       Packets:    21763844  Bytes:  7343838083
         #   To Encryption Processor   Packets:           0  Bytes:           0
         #   To RP/ESP Packets: 1150522 Bytes: 166031138
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^To +(?P<link_name_1>[\w\-\d\s/]+) +Packets: +(?P<to_packets>\d+) +Bytes: +(?P<to_bytes>\d+)$"
         )
 
         #   From Network-Processor     Packets:    21259012  Bytes:  7397920802
         #   From RP/ESP Packets: 4364008 Bytes: 697982854
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^From +(?P<link_name_2>[\w\-\d\s/]+) +Packets: +(?P<from_packets>\d+) +Bytes: +(?P<from_bytes>\d+)$"
         )
 
         #     Drops                   Packets:           0  Bytes:           0
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Drops +Packets: +(?P<dropped_packets>\d+) +Bytes: +(?P<dropped_bytes>\d+)$"
         )
 
         #     Errors                  Packets:           0  Bytes:           0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Errors +Packets: +(?P<errored_packets>\d+) +Bytes: +(?P<errored_bytes>\d+)$"
         )
 
         #     Errors:
-        p8 = re.compile(r"^Errors:$")
+        p8 = regex_engine.compile(r"^Errors:$")
 
         #     RX/TX process: 0/0, RX/TX schedule: 0/0
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^RX/TX +process: +(?P<rx_process>\d+)/(?P<tx_process>\d+), +RX/TX +schedule: +(?P<rx_schedule>\d+)/(?P<tx_schedule>\d+)$"
         )
 
         #     RX/TX statistics: 0/0, RX parity: 0
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^RX/TX +statistics: +(?P<rx_statistics>\d+)/(?P<tx_statistics>\d+), +RX +parity: +(?P<rx_parity>\d+)$"
         )
 
         # Serdes Exception Counts:
-        p11 = re.compile(r"^Serdes +Exception +Counts:$")
+        p11 = regex_engine.compile(r"^Serdes +Exception +Counts:$")
 
         #   eqs/fc:
         #   idh-hi:
         #   spi link:
-        p12 = re.compile(r"^(?P<link>[\w\d\-\s\/]+):$")
+        p12 = regex_engine.compile(r"^(?P<link>[\w\d\-\s\/]+):$")
 
         #     link 0: msgTypeError: 5
         #     link 0: msgEccError: 5
@@ -1312,7 +1312,7 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
         #     link 2: msgTypeError: 3
         #     link 2: msgEccError: 3
         #     link 2: chicoEvent: 3
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^link +(?P<link_number>\d+): +(?P<error_event>\w+): +(?P<count>\d+)$"
         )
 
@@ -1516,117 +1516,117 @@ class ShowPlatformHardwareModuleInterfaceStatus(
             output = self.device.execute(self.cli_command[0].format(id=id, intf=intf))
 
         # MAC Status: hw_port 0, speed 1000, duplex full, link Up, link_en Enable , tx_pause Enable, rx_pause Enable
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^MAC Status: hw_port (?P<hw_port>\d+), +speed (?P<speed>\d+), +duplex (?P<duplex>\S+), link "
             + r"(?P<link>\S+), link_en (?P<link_en>\S+) , tx_pause (?P<tx_pause>\S+), rx_pause (?P<rx_pause>\S+)$"
         )
 
         # link Up(config Enable), speed 1000(config 1000), duplex full(config full), config force_up, mtu 1526
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^link (?P<link>\S+)\(config (?P<link_config>\S+)\), +speed (?P<speed>\S+)\(config "
             + r"(?P<speed_config>\S+)\), duplex (?P<duplex>\S+)\(config (?P<duplex_config>\S+)\), "
             + r"config (?P<nego_config>\S+), mtu (?P<mtu>\d+)$"
         )
 
         # rx_pause On(config On), tx_pause On(config On)
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^rx_pause (?P<rx_pause>\S+)\(config (?P<rx_pause_config>\S+)\), tx_pause"
             + r" (?P<tx_pause>\S+)\(config (?P<tx_pause_config>\S+)\)$"
         )
 
         # mac_filtering: Enable, mac: 0000.0000.0001
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^mac_filtering: +(?P<mac_filtering>\S+), mac: (?P<mac_addr>\S+)$"
         )
 
         # PVE :enable, target port: 24, isTrunk:false
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^PVE :+(?P<pve>\S+), target port: +(?P<target_port>\d+), isTrunk:(?P<is_trunk>\S+)$"
         )
 
         # nested vlan :enable, vlan: 2356
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^nested vlan :+(?P<nested_vlan>\S+), vlan: (?P<nested_vid>\d+)$"
         )
 
         # tail-drop profile 0, sche_profile 2
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^tail-drop profile +(?P<td_profile>\d+), sche_profile (?P<sche_profile>\d+)$"
         )
 
         # default priority 0, UP override True
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^default priority +(?P<default_pri>\d+), UP override (?P<up_override>\S+)$"
         )
 
         # None Trust mode
-        p9 = re.compile(r"^(?P<trust_mode>\S+) Trust mode$")
+        p9 = regex_engine.compile(r"^(?P<trust_mode>\S+) Trust mode$")
 
         # Exp Enable
-        p10 = re.compile(r"^Exp (?P<exp>\S+)$")
+        p10 = regex_engine.compile(r"^Exp (?P<exp>\S+)$")
 
         # cos_bit_vec: 0x00, exp_bit_vec: 0xc0, dscp_bit_vec: 0x0000000000000000
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^cos_bit_vec: +(?P<cos_bit>\S+), exp_bit_vec: +(?P<exp_bit>\S+), dscp_bit_vec: +(?P<dscp_bit>\S+)$"
         )
 
         # LP Qos Profile: 104, Cos: 0, TC: 0.
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^LP Qos Profile: +(?P<lp_profile>\d+), Cos: +(?P<lp_cos>\d+), TC: +(?P<lp_tc>\d+).$"
         )
 
         # HP Qos Profile: 105, Cos: 4, TC: 4.
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^HP Qos Profile: +(?P<hp_profile>\d+), Cos: +(?P<hp_cos>\d+), TC: +(?P<hp_tc>\d+).$"
         )
 
         # SP Tx Queue: 7.
-        p14 = re.compile(r"^SP Tx Queue: +(?P<tx_queue>\d+).$")
+        p14 = regex_engine.compile(r"^SP Tx Queue: +(?P<tx_queue>\d+).$")
 
         # TX_PAUSE: disabled XOFF_THRES: 1024(plim threshold 99%, Buff-size: 1024),   XON_THRES: 128
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^TX_PAUSE: +(?P<tx_pause_xoff>\S+) XOFF_THRES: +(?P<xoff_thres>\d+)\(plim threshold "
             + r"(?P<plim_thres>\d+)%, Buff-size: +(?P<buffer_size>\d+)\), +XON_THRES: +(?P<xon_thres>\d+)$"
         )
 
         # LP Queue cos:0 tc:0, config weight: 20, sche Weight: 255
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^LP Queue cos:+(?P<lp_q_cos>\d+) tc:(?P<lp_q_tc>\d+), config weight: "
             + r"(?P<lp_weight>\d+), sche Weight: (?P<lp_sche_weight>\d+)$"
         )
 
         # HP Queue cos:4 tc:4, config bw: 100, sche Weight: 255
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"^HP Queue cos:+(?P<hp_q_cos>\d+) tc:(?P<hp_q_tc>\d+), config bw: "
             + r"(?P<hp_bw>\d+), sche Weight: (?P<hp_sche_weight>\d+)$"
         )
 
         # Port Tx buff: 0
-        p18 = re.compile(r"^Port Tx buff: +(?P<port_tx_buffer>\d+)$")
+        p18 = regex_engine.compile(r"^Port Tx buff: +(?P<port_tx_buffer>\d+)$")
 
         # Queue 0, tx buff 0
-        p19 = re.compile(r"^Queue 0, tx buff +(?P<q0_tx_buffer>\d+)$")
+        p19 = regex_engine.compile(r"^Queue 0, tx buff +(?P<q0_tx_buffer>\d+)$")
 
         # Queue 1, tx buff 0
-        p20 = re.compile(r"^Queue 1, tx buff +(?P<q1_tx_buffer>\d+)$")
+        p20 = regex_engine.compile(r"^Queue 1, tx buff +(?P<q1_tx_buffer>\d+)$")
 
         # Queue 2, tx buff 0
-        p21 = re.compile(r"^Queue 2, tx buff +(?P<q2_tx_buffer>\d+)$")
+        p21 = regex_engine.compile(r"^Queue 2, tx buff +(?P<q2_tx_buffer>\d+)$")
 
         # Queue 3, tx buff 0
-        p22 = re.compile(r"^Queue 3, tx buff +(?P<q3_tx_buffer>\d+)$")
+        p22 = regex_engine.compile(r"^Queue 3, tx buff +(?P<q3_tx_buffer>\d+)$")
 
         # Queue 4, tx buff 0
-        p23 = re.compile(r"^Queue 4, tx buff +(?P<q4_tx_buffer>\d+)$")
+        p23 = regex_engine.compile(r"^Queue 4, tx buff +(?P<q4_tx_buffer>\d+)$")
 
         # Queue 5, tx buff 0
-        p24 = re.compile(r"^Queue 5, tx buff +(?P<q5_tx_buffer>\d+)$")
+        p24 = regex_engine.compile(r"^Queue 5, tx buff +(?P<q5_tx_buffer>\d+)$")
 
         # Queue 6, tx buff 0
-        p25 = re.compile(r"^Queue 6, tx buff +(?P<q6_tx_buffer>\d+)$")
+        p25 = regex_engine.compile(r"^Queue 6, tx buff +(?P<q6_tx_buffer>\d+)$")
 
         # Queue 7, tx buff 0
-        p26 = re.compile(r"^Queue 7, tx buff +(?P<q7_tx_buffer>\d+)$")
+        p26 = regex_engine.compile(r"^Queue 7, tx buff +(?P<q7_tx_buffer>\d+)$")
 
         ret_dict = {}
 
@@ -1958,14 +1958,14 @@ class ShowPlatformHardwareQfpBqsStatisticsChannelAll(
         # Chan   GoodPkts  GoodBytes    BadPkts   BadBytes
         # 1 - 0000000000 0000000000 0000000000 0000000000
         # 2 - 0000c40f64 016a5004b0 0000000000 0000000000
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<channel>\d+) +- +(?P<goodpkts>\w+) +(?P<goodbytes>\w+) +(?P<badpkts>\w+) +(?P<badbytes>\w+)$"
         )
 
         #  0-55: OPM Channels
         # 56-59: Metapacket/Recycle Pools 0-3
         #    60: Reassembled Packets Sent to QED
-        p2 = re.compile(r"^(?P<channel>\d+)-?(?P<end_channel>\d+)?: +(?P<comment>.+)$")
+        p2 = regex_engine.compile(r"^(?P<channel>\d+)-?(?P<end_channel>\d+)?: +(?P<comment>.+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2038,13 +2038,13 @@ class ShowPlatformHardwareQfpBqsOpmMapping(ShowPlatformHardwareQfpBqsMappingSche
         # 38       HighNormal                    GPM             7
         # 55*      Drain Low                     GPM             0
         # * - indicates the drain mode bit is set for this channel
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<number>\d+)(?P<drained>\*)? +(?P<name>[\w\-\s]+)"
             r" +(?P<interface>[\w\d]+) +(?P<logical_channel>\d+)$"
         )
 
         # 32       Unmapped
-        p2 = re.compile(r"^(?P<unmapped_number>\d+) +Unmapped$")
+        p2 = regex_engine.compile(r"^(?P<unmapped_number>\d+) +Unmapped$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2102,14 +2102,14 @@ class ShowPlatformHardwareQfpBqsIpmMapping(ShowPlatformHardwareQfpBqsMappingSche
         # 15     Nitrox Low          SPI0          14        1
         # 17     HT Pkt Low          HT             0        1
         # 21     CC4 Low             SPI0          16        1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<number>\d+) +(?P<name>[\w\-\s]+)"
             r" +(?P<interface>[\w\d]+) +(?P<port>\d+)"
             r" +(?P<cfifo>\d+)$"
         )
 
         # 32       Unmapped
-        p2 = re.compile(r"^(?P<unmapped_number>\d+) +Unmapped$")
+        p2 = regex_engine.compile(r"^(?P<unmapped_number>\d+) +Unmapped$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2202,17 +2202,17 @@ class ShowPlatformHardwareQfpInterfaceIfnameStatistics(
         final_dict = {}
 
         # Platform Handle 7
-        p1 = re.compile(r"^Platform +Handle +(?P<platform_handle>\d+)$")
+        p1 = regex_engine.compile(r"^Platform +Handle +(?P<platform_handle>\d+)$")
 
         # Receive Stats                             Packets        Octets
         # Transmit Stats                            Packets        Octets
         # Input Drop Stats                          Packets        Octets
         # Output Drop Stats                         Packets        Octets
-        p2 = re.compile(r"^(?P<transmit_receive>[\w\s]+) +Stats +Packets +Octets$")
+        p2 = regex_engine.compile(r"^(?P<transmit_receive>[\w\s]+) +Stats +Packets +Octets$")
 
         #   FragmentedIpv6                             0               0
         #   Other
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<stats>[\w\d]+) +(?P<packets>[\w\d]+) +(?P<octets>[\w\d]+)$"
         )
 
@@ -2311,14 +2311,14 @@ class ShowPlatformHardwareQfpStatisticsDrop(
         # -------------------------------------------------------------------------
         # Ipv4NoAdj                                       7                     296
         # Ipv4NoRoute                                   181                    7964
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<global_drop_stats>\w+) +(?P<packets>\d+) +(?P<octets>\d+)$"
         )
 
         # Global Drop Stats                         Packets        Octets
         # ----------------------------------------------------------------
         #    The Global drop stats were all zero
-        p2 = re.compile(r"The Global drop stats were all zero")
+        p2 = regex_engine.compile(r"The Global drop stats were all zero")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2363,7 +2363,7 @@ class ShowPlatformHardwareQfpStatisticsDropClear(
         # Note: The command output contains multiple such rows
         #       with different row headers, so we parse the
         #       row header as well
-        p1 = re.compile(r"^(?P<drop_reason>\w+)\s+(?P<packets>\d+)\s+(?P<octets>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<drop_reason>\w+)\s+(?P<packets>\d+)\s+(?P<octets>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2443,10 +2443,10 @@ class ShowPlatformHardwareQfpStatisticsDropHistory(
         ret_dict = {}
 
         # Last clearing of QFP drops statistics : never
-        p1_1 = re.compile(r"^Last clearing of QFP drops statistics : never$")
+        p1_1 = regex_engine.compile(r"^Last clearing of QFP drops statistics : never$")
 
         # Last clearing of QFP drops statistics : Fri Jun  9 04:04:39 2023
-        p1_2 = re.compile(
+        p1_2 = regex_engine.compile(
             r"^Last clearing of QFP drops statistics : \w+\s+(?P<month>\w+)"
             r"\s+(?P<day>\d+)\s+(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)"
             r"\s+(?P<year>\d+)$"
@@ -2457,16 +2457,16 @@ class ShowPlatformHardwareQfpStatisticsDropHistory(
         # (5h 10m 42s ago)
         # (10m 42s ago)
         # (42s ago)
-        p1_3 = re.compile(
+        p1_3 = regex_engine.compile(
             r"^\(((?P<weeks>\d+)w\s+)?((?P<days>\d+)d\s+)?((?P<hours>\d+)h\s+)?"
             r"((?P<minutes>\d+)m\s+)?(?P<seconds>\d+)s\s+ago\)$"
         )
 
         # The Global drop stats were all zero
-        p2_1 = re.compile(r"^The Global drop stats were all zero$")
+        p2_1 = regex_engine.compile(r"^The Global drop stats were all zero$")
 
         # Ipv4NoAdj     0      199935      299897    299897
-        p2_2 = re.compile(
+        p2_2 = regex_engine.compile(
             r"^(?P<reason>\w+)\s+(?P<packets_1m>\d+)\s+(?P<packets_5m>\d+)"
             r"\s+(?P<packets_30m>\d+)\s+(?P<packets_all>\d+)$"
         )
@@ -2561,10 +2561,10 @@ class ShowPlatformHardwareQfpStatisticsDropHistoryClear(
         ret_dict = {}
 
         # Last clearing of QFP drops statistics : never
-        p1_1 = re.compile(r"^Last clearing of QFP drops statistics : never$")
+        p1_1 = regex_engine.compile(r"^Last clearing of QFP drops statistics : never$")
 
         # Last clearing of QFP drops statistics : Fri Jun  9 04:04:39 2023
-        p1_2 = re.compile(
+        p1_2 = regex_engine.compile(
             r"^Last clearing of QFP drops statistics : \w+\s+(?P<month>\w+)"
             r"\s+(?P<day>\d+)\s+(?P<hour>\d+):(?P<minute>\d+):(?P<second>\d+)"
             r"\s+(?P<year>\d+)$"
@@ -2575,16 +2575,16 @@ class ShowPlatformHardwareQfpStatisticsDropHistoryClear(
         # (5h 10m 42s ago)
         # (10m 42s ago)
         # (42s ago)
-        p1_3 = re.compile(
+        p1_3 = regex_engine.compile(
             r"^\(((?P<weeks>\d+)w\s+)?((?P<days>\d+)d\s+)?((?P<hours>\d+)h\s+)?"
             r"((?P<minutes>\d+)m\s+)?(?P<seconds>\d+)s\s+ago\)$"
         )
 
         # The Global drop stats were all zero
-        p2_1 = re.compile(r"^The Global drop stats were all zero$")
+        p2_1 = regex_engine.compile(r"^The Global drop stats were all zero$")
 
         # Ipv4NoAdj     0      199935      299897    299897
-        p2_2 = re.compile(
+        p2_2 = regex_engine.compile(
             r"^(?P<reason>\w+)\s+(?P<packets_1m>\d+)\s+(?P<packets_5m>\d+)"
             r"\s+(?P<packets_30m>\d+)\s+(?P<packets_all>\d+)$"
         )
@@ -2832,41 +2832,41 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(
                 output = self.device.execute(self.cli_command[0])
 
         # APPQOE Feature Statistics:
-        p1 = re.compile(r"^(?P<feature>\w+) +Feature +Statistics:$")
+        p1 = regex_engine.compile(r"^(?P<feature>\w+) +Feature +Statistics:$")
 
         # Global:
-        p2 = re.compile(r"^Global:$")
+        p2 = regex_engine.compile(r"^Global:$")
 
         # SDVT Global stats:
-        p3 = re.compile(r"^SDVT +Global +stats:$")
+        p3 = regex_engine.compile(r"^SDVT +Global +stats:$")
 
         # SN Index [0 (Green)]
         # SN Index [Default]
-        p4 = re.compile(r"^SN +Index +\[(?P<index>[\s\S]+)\]$")
+        p4 = regex_engine.compile(r"^SN +Index +\[(?P<index>[\s\S]+)\]$")
 
         # SNG: 3
-        p4_1 = re.compile(r"^SNG: +(?P<sng_index>[\d]+)")
+        p4_1 = regex_engine.compile(r"^SNG: +(?P<sng_index>[\d]+)")
 
         # SDVT Count stats:
         # SDVT Packet stats:
         # SDVT Drop Cause stats:
         # SDVT Errors stats:
-        p5 = re.compile(r"^(?P<sdvt_stats_type>SDVT +[\s\S]+ +stats):$")
+        p5 = regex_engine.compile(r"^(?P<sdvt_stats_type>SDVT +[\s\S]+ +stats):$")
 
         # decaps: Processed control messages from SN: 14200
         # decaps: delete requests received total: 14200
         # decaps: delete - protocol decision: 14200
-        p6 = re.compile(r"^decaps: +(?P<decap_type>[\s\S]+): +(?P<value>\d+)$")
+        p6 = regex_engine.compile(r"^decaps: +(?P<decap_type>[\s\S]+): +(?P<value>\d+)$")
 
         # Divert packets/bytes: 743013/43313261
         # Reinject packets/bytes: 679010/503129551
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^(?P<type>Divert|Reinject) +packets\/bytes: +(?P<packets>\d+)\/(?P<bytes>\d+)$"
         )
 
         # Divert packets / bytes 30342 / 23649159
         # Reinject packets / bytes 35694 / 21975547
-        p7_1 = re.compile(
+        p7_1 = regex_engine.compile(
             r"^(?P<type>Divert|Reinject) +packets \/ bytes +(?P<packets>\d+) \/ (?P<bytes>\d+)$"
         )
 
@@ -2875,35 +2875,35 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(
         # cft_handle_pkt:  0
         # sdvt_divert_req_fail:  0
         # syn_policer_rate: 800
-        p8 = re.compile(r"^(?P<key>[\s\S]+): +(?P<value>\d+)$")
+        p8 = regex_engine.compile(r"^(?P<key>[\s\S]+): +(?P<value>\d+)$")
 
         # SN Index [0 (Green)], IP: 10.136.1.250, oce_id: 1243618816
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^SN +Index +\[(?P<index>[\s\S]+)\], +IP: +(?P<ip>[\s\S]+), +oce_id: +(?P<oce_id>[\S]+)$"
         )
 
         # SNG: 3 SN Index [0 (Green)], IP: 10.136.1.250, oce_id: 1243618816
-        p9_1 = re.compile(
+        p9_1 = regex_engine.compile(
             r"^SNG: +(?P<sng_index>[\d]+) +SN +Index +\[(?P<index>[\s\S]+)\], +IP: +(?P<ip>[\s\S]+), +oce_id: +(?P<oce_id>[\S]+)$"
         )
 
         # SNG: 1 SN Index [0 (Green)], IP: 26:126:0:252::1, oce_id: 1099779072, ocev6_id: 1099779136
-        p9_2 = re.compile(
+        p9_2 = regex_engine.compile(
             r"^SNG: +(?P<sng_index>[\d]+) +SN +Index +\[(?P<index>[\s\S]+)\], +IP: +(?P<ip>[\s\S]+), +oce_id: +(?P<oce_id>[\s\S]+), +ocev6_id: +(?P<ocev6_id>[\S]+)$"
         )
 
         # del 0, key 0x0301, id 1, ver 1, status 1, type 3, sng 0
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^del +(?P<del>[\s\S]+), key +(?P<key>[\s\S]+), id +(?P<id>[\s\S]+), ver +(?P<ver>[\s\S]+), status +(?P<status>[\s\S]+), type +(?P<type>[\s\S]+), sng +(?P<sng>[\S]+)$"
         )
 
         # APPNAV STATS: toSN 2662751642/2206742552009, fromSN 2715505607/2260448392656
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^APPNAV STATS: +(?P<to_sn>[\S]+) +(?P<tosn_packets>[\d]+)\/(?P<tosn_bytes>\d+), +(?P<from_sn>[\S]+) +(?P<frmsn_packets>[\d]+)\/(?P<frmsn_bytes>\d+)$"
         )
 
         # APPNAV STATS: toSN 340233144 / 371163888500 fromSN 282458369 / 207930078958
-        p11_1 = re.compile(
+        p11_1 = regex_engine.compile(
             r"^APPNAV STATS: +(?P<to_sn>[\S]+) +(?P<tosn_packets>[\d]+) \/ (?P<tosn_bytes>\d+) +(?P<from_sn>[\S]+) +(?P<frmsn_packets>[\d]+) \/ (?P<frmsn_bytes>\d+)$"
         )
 
@@ -3217,18 +3217,18 @@ class ShowPlatformHardwareQfpActiveDatapathUtilSum(
             output = self.device.execute(self.cli_command[0])
 
         # CPP 0:                     5 secs        1 min        5 min       60 min
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^CPP (?P<cpp_num>\d)\: +(\d\s\S+) +(\d\s\S+) +(\d\s\S+) +(\d+\s\S+)$"
         )
         # Crypto/IO
-        p2 = re.compile(r"^Crypto/IO$")
+        p2 = regex_engine.compile(r"^Crypto/IO$")
         # Input:     Total (pps)            2            2            1            0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<dir>\w+)\: +\S+ \((?P<type>\S+)\) +(?P<value_5s>\d+) +(?P<value_1m>\d+) +(?P<value_5m>\d+) +(?P<value_60m>\d+)$"
         )
         # (bps)         2928         1856         1056           88
         # Idle (pct)           43           35           35           75
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^(Idle )?\((?P<type>bps|pct)\) +(?P<value_5s>\d+) +(?P<value_1m>\d+) +(?P<value_5m>\d+) +(?P<value_60m>\d+)$"
         )
 
@@ -3349,18 +3349,18 @@ class ShowPlatformHardwareQfpActiveTcamResourceManagerUsage(
             output = self.device.execute(self.cli_command[0])
 
         # QFP TCAM Usage Information
-        p1 = re.compile(r"^(?P<key>QFP TCAM Usage Information)$")
+        p1 = regex_engine.compile(r"^(?P<key>QFP TCAM Usage Information)$")
 
         # 80 Bit Region Information
         # Total TCAM Cell Usage Information
-        p2 = re.compile(r"^(?P<num>\d+|Total TCAM)(?P<region>[\s\S]+)$")
+        p2 = regex_engine.compile(r"^(?P<num>\d+|Total TCAM)(?P<region>[\s\S]+)$")
 
         # Name                                : Leaf Region #1
         # Number of cells per entry           : 2
         # Current 160 bits entries used       : 19
         # Current used cell entries           : 38
         # Current free cell entries           : 4058
-        p3 = re.compile(r"^(?P<key>[\s\S]+)\:(?P<value>[\s\S]+\S)$")
+        p3 = regex_engine.compile(r"^(?P<key>[\s\S]+)\:(?P<value>[\s\S]+\S)$")
 
         ret_dict = {}
         for line in output.splitlines():
@@ -3435,22 +3435,22 @@ class ShowPlatformHardwareThroughputCrypto(ShowPlatformHardwareThroughputCryptoS
         ret_dict = {}
 
         # Current configured crypto throughput level: T3
-        p1 = re.compile(r"^Current configured crypto throughput level: (?P<level>.+)$")
+        p1 = regex_engine.compile(r"^Current configured crypto throughput level: (?P<level>.+)$")
 
         # Current enforced crypto throughput level: 10G
-        p2 = re.compile(r"^Current enforced crypto throughput level: (?P<level>.+)$")
+        p2 = regex_engine.compile(r"^Current enforced crypto throughput level: (?P<level>.+)$")
 
         # Default Crypto throughput level: 2.5G
-        p3 = re.compile(r"^Default Crypto throughput level: (?P<level>.+)$")
+        p3 = regex_engine.compile(r"^Default Crypto throughput level: (?P<level>.+)$")
 
         # Level is saved, reboot is not required
-        p4 = re.compile(r"^Level is (?P<saved>[^,]+), reboot is (?P<reboot>.+)$")
+        p4 = regex_engine.compile(r"^Level is (?P<saved>[^,]+), reboot is (?P<reboot>.+)$")
 
         # Crypto Throughput is not throttled
-        p5 = re.compile(r"^Crypto Throughput is (?P<throttled>.+)$")
+        p5 = regex_engine.compile(r"^Crypto Throughput is (?P<throttled>.+)$")
 
         # Current boot level is network-premier
-        p6 = re.compile(r"^Current boot level is (?P<level>.+)$")
+        p6 = regex_engine.compile(r"^Current boot level is (?P<level>.+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -3542,11 +3542,11 @@ class ShowPlatformHardwareQfpActiveFeatureSdwanDpFecGlobal(
             output = self.device.execute(self.cli_command)
 
         # FEC Global Info
-        p1 = re.compile(r"^(?P<key>[A-Za-z\s]+)$")
+        p1 = regex_engine.compile(r"^(?P<key>[A-Za-z\s]+)$")
 
         # "ses_chunk_head": int
         # "pak_chunk_head": int
-        p2 = re.compile(r"^(?P<key>[a-z\_]+)\s+:\s+(?P<value>[\d\D]+)")
+        p2 = regex_engine.compile(r"^(?P<key>[a-z\_]+)\s+:\s+(?P<value>[\d\D]+)")
 
         ret_dict = {}
         for line in output.splitlines():
@@ -3618,12 +3618,12 @@ class ShowPlatformHardwareQfpActiveFeatureSdwanDpFecSessionSummary(
             output = self.device.execute(self.cli_command)
 
         # 12345     0x123    100        2       200         3          1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<index>[\S]+)\s+(?P<flags>[\S]+)\s+(?P<tx_data>[\d]+)\s+(?P<tx_parity>[\d]+)\s+(?P<rx_data>[\d]+)\s+(?P<rx_parity>[\d]+)\s+(?P<reconstruct>[\d]+)$"
         )
 
         # 0     0X2     1     219329664 0     92        56        0xC85EAD30
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<win_num>[\d]+)\s+(?P<win_flags>[\S]+)\s+(?P<count>[\d]+)\s+(?P<isn>[\d]+)\s+(?P<tos>[\d]+)\s+(?P<parity_len>[\d]+)\s+(?P<fec_len>[\d]+)\s+(?P<fec_data>[\S]+)$"
         )
 
@@ -3730,38 +3730,38 @@ class ShowPlatformHardwareAuthenticationStatus(
         # Line Card 6 Authentication:  pass
         # Fan Tray 1 Authentication:  pass
         # Chassis Authentication: pass
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"(Line\s+Card |SUP|Line\s+Card:|Fan\s+Tray|Chassis|SSD.+|SUP\s+|Fan\s+Tray )\d*\s*Authentication:\s+(?P<Slot>(pass|Not Available|fail))$"
         )
 
         # Switch 1:
-        p1 = re.compile(r"^Switch\s+(?P<switch>\d+):$")
+        p1 = regex_engine.compile(r"^Switch\s+(?P<switch>\d+):$")
 
         # Mainboard Authentication:     Passed
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Mainboard Authentication:\s+(?P<mainboard_authentication>\w+(\s\w+)?)$"
         )
 
         # FRU Authentication:           Not Available
-        p3 = re.compile(r"^FRU Authentication:\s+(?P<fru_authentication>\w+(\s\w+)?)$")
+        p3 = regex_engine.compile(r"^FRU Authentication:\s+(?P<fru_authentication>\w+(\s\w+)?)$")
 
         # Stack Cable A Authentication: Passed
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Stack Cable A Authentication:\s+(?P<stack_cable_a_authentication>\w+(\s\w+)?)$"
         )
 
         # Stack Cable B Authentication: Passed
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^Stack Cable B Authentication:\s+(?P<stack_cable_b_authentication>\w+(\s\w+)?)$"
         )
 
         # Stack Adapter A Authentication Passed
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Stack Adapter A (Authentication:|Authenticatio)\s+(?P<stack_adapter_a_authentication>[\s\w]+)$"
         )
 
         # Stack Adapter B Authentication Passed
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Stack Adapter B (Authentication:|Authenticatio)\s+(?P<stack_adapter_b_authentication>[\s\w]+)$"
         )
 
@@ -3877,10 +3877,10 @@ class ShowPlatformHardwareChassisFantrayDetailSwitch(
         ret_dict = {}
 
         # FT1:
-        p1 = re.compile(r"^(?P<fan_tray>.+)\:$")
+        p1 = regex_engine.compile(r"^(?P<fan_tray>.+)\:$")
 
         # Inlet:8330 RPM, Outlet:10015 RPM, PWM:30%
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Inlet:(?P<inlet_rpm>\d+) +RPM\, +Outlet:(?P<outlet_rpm>\d+) +RPM\, PWM:(?P<pwm>\d+%)$"
         )
 
@@ -3948,37 +3948,37 @@ class ShowPlatformHardwareChassisPowerSupplyDetailSwitchAll(
         ret_dict = {}
 
         # PS1:
-        p1 = re.compile(r"^(?P<power_supply>.+)\:$")
+        p1 = regex_engine.compile(r"^(?P<power_supply>.+)\:$")
 
         # Input Voltage   :       121.1250 V
-        p2 = re.compile(r"^Input\s+Voltage\s+:\s+(?P<input_voltage_volt>\d+\.\d+) V$")
+        p2 = regex_engine.compile(r"^Input\s+Voltage\s+:\s+(?P<input_voltage_volt>\d+\.\d+) V$")
 
         # Output Voltage  :       12.0547 V
-        p3 = re.compile(r"^Output\s+Voltage\s+:\s+(?P<output_voltage_volt>\d+\.\d+) V$")
+        p3 = regex_engine.compile(r"^Output\s+Voltage\s+:\s+(?P<output_voltage_volt>\d+\.\d+) V$")
 
         # Input Power     :       507.5000 W
-        p4 = re.compile(r"^Input\s+Power\s+:\s+(?P<input_power_watt>\d+\.\d+) W$")
+        p4 = regex_engine.compile(r"^Input\s+Power\s+:\s+(?P<input_power_watt>\d+\.\d+) W$")
 
         # Output Power    :       0.0000 W
-        p5 = re.compile(r"^Output\s+Power\s+:\s+(?P<output_power_watt>\d+\.\d+) W$")
+        p5 = regex_engine.compile(r"^Output\s+Power\s+:\s+(?P<output_power_watt>\d+\.\d+) W$")
 
         # Input Current   :       0.0000 A
-        p6 = re.compile(r"^Input\s+Current\s+:\s+(?P<input_current_amp>\d+\.\d+) A$")
+        p6 = regex_engine.compile(r"^Input\s+Current\s+:\s+(?P<input_current_amp>\d+\.\d+) A$")
 
         # Output Current  :       0.0000 A
-        p7 = re.compile(r"^Output\s+Current\s+:\s+(?P<output_current_amp>\d+\.\d+) A$")
+        p7 = regex_engine.compile(r"^Output\s+Current\s+:\s+(?P<output_current_amp>\d+\.\d+) A$")
 
         # Temperature1    :       0.0000 C
-        p8 = re.compile(r"^Temperature1\s+:\s+(?P<temperature1_celsius>\d+\.\d+) C$")
+        p8 = regex_engine.compile(r"^Temperature1\s+:\s+(?P<temperature1_celsius>\d+\.\d+) C$")
 
         # Temperature2    :       0.0000 C
-        p9 = re.compile(r"^Temperature2\s+:\s+(?P<temperature2_celsius>\d+\.\d+) C$")
+        p9 = regex_engine.compile(r"^Temperature2\s+:\s+(?P<temperature2_celsius>\d+\.\d+) C$")
 
         # Temperature3    :       0.0000 C
-        p10 = re.compile(r"^Temperature3\s+:\s+(?P<temperature3_celsius>\d+\.\d+) C$")
+        p10 = regex_engine.compile(r"^Temperature3\s+:\s+(?P<temperature3_celsius>\d+\.\d+) C$")
 
         # Fan Speed 1     :       0.0000 RPM
-        p11 = re.compile(r"^Fan\s+Speed\s+1\s+:\s+(?P<fan_speed_1_rpm>\d+\.\d+) RPM$")
+        p11 = regex_engine.compile(r"^Fan\s+Speed\s+1\s+:\s+(?P<fan_speed_1_rpm>\d+\.\d+) RPM$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -4087,7 +4087,7 @@ class ShowPlatformHardwareQfpIpsecDrop(ShowPlatformHardwareQfpIpsecDropSchema):
             output = self.device.execute(self.cli_command)
 
         # 4  IN_US_V4_PKT_SA_NOT_FOUND_SPI                           67643
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<drop_type>\d+).* +(?P<drop_name>[\w\_]+).* +(?P<packets>\d+)$"
         )
 
@@ -4149,11 +4149,11 @@ class ShowPlatformHardwareVoltageMarginSwitch(
         ret_dict = {}
 
         # max chnl 36
-        p1 = re.compile(r"^max chnl\s+(?P<max_channels>\d+)$")
+        p1 = regex_engine.compile(r"^max chnl\s+(?P<max_channels>\d+)$")
 
         # Channel  Rail Name         Voltage(mv)   Nominal Voltage  Min Margin  % Change  Max Margin  Monitor
         # 0        PVCCKRHV              1315.71        1300.00       -3.00        1.21        3.00       0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<channels>\S+)\s+(?P<rail_name>\S+)\s+(?P<voltage_in_mv>[\d+\.]+)\s+(?P<nominal_voltage>[\d+\.]+)\s+(?P<min_margin>\S+)\s+(?P<percentage_change>\S+)\s+(?P<max_margin>\S+)\s+(?P<monitor>\d+)$"
         )
 
@@ -4216,15 +4216,15 @@ class ShowPlatformHardwareQfpActiveInfrastructureBqsStatus(
         parsed_dict = {}
 
         # QFP.0:
-        p1 = re.compile(r"(?P<qfp_key>QFP\.\d+)")
+        p1 = regex_engine.compile(r"(?P<qfp_key>QFP\.\d+)")
 
         # # of QOS Queue Objects:                   1
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^\#\s+of\s+QOS\s+Queue\s+Objects\:\s+(?P<total_qos_queue>\d+)"
         )
 
         ## of QOS Schedule Objects :               2
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^\#\s+of\s+QOS\s+Schedule\s+Objects\s+\:\s+(?P<total_qos_schedule_nodes>\d+)"
         )
 
@@ -4291,7 +4291,7 @@ class ShowPlatformHardwareQfpActiveFeatureQosInterfaceHierarchyDetail(
         parsed_dict = {}
 
         # subdevice_id  : 1
-        p1 = re.compile(r"subdevice_id\s+\:\s+(?P<subdev>\d+)")
+        p1 = regex_engine.compile(r"subdevice_id\s+\:\s+(?P<subdev>\d+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -4342,7 +4342,7 @@ class ShowPlatformHardwareQfpActiveInterfaceAllStatisticsDropSummary(
         parsed_dict = {}
 
         # GigabitEthernet0/0/0                                 16                   0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<intf_name>[a-zA-Z]+[\d/.]+)\s+(?P<rx_packets>\d+)\s+(?P<tx_packets>\d+)$"
         )
 
@@ -4409,14 +4409,14 @@ class ShowPlatformHardwareQfpActiveInfraPuntStatTypePer(
 
         # Number of punt causes =   160
         # Number of inject causes = 56
-        p1 = re.compile(r"^(?P<name_of_cause>[A-Za-z ]+)=\s+(?P<no_of_causes>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<name_of_cause>[A-Za-z ]+)=\s+(?P<no_of_causes>\d+)$")
 
         # Per Punt Cause Statistics
         # Per Inject Cause Statistics
-        p2 = re.compile(r"^(?P<name_of_stats>Per+[A-Za-z ]+)$")
+        p2 = regex_engine.compile(r"^(?P<name_of_stats>Per+[A-Za-z ]+)$")
 
         # 003         Layer2 control and legacy                 3888454               3888454
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<counter_id>\d+)\s+(?P<cause_name>([A-Za-z0-9_\/-<->]+ ?){5})\s+(?P<packet_received>\d+)\s+(?P<packets_transmitted>\d+)$"
         )
 
@@ -4527,46 +4527,46 @@ class ShowPlatformHardwareQfpActiveDatapathInfraSwCio(
         parsed_dict = {}
 
         # Credits Usage:
-        p1 = re.compile(r"^(?P<credits_usage>Credits\sUsage):$")
+        p1 = regex_engine.compile(r"^(?P<credits_usage>Credits\sUsage):$")
 
         # ID      Port  Wght  Global WRKR0  WRKR1  WRKR2  WRKR3  WRKR10  WRKR11  Total
         # 1      rcl0     4:   4999     0      0      0      0       0     121   5120
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<id>\d+)\s+(?P<port>\w+)\s+(?P<wght>\d:+)\s+(?P<global>\d+)\s+(?P<wrkr0>\d+)\s+(?P<wrkr1>\d+)\s+(?P<wrkr2>\d+)\s+(?P<wrkr3>\d+)\s+(?P<wrkr10>\d+)\s+(?P<wrkr11>\d+)\s+(?P<total>\d+)$"
         )
 
         # Core Utilization over preceding 95292.2911 seconds
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Core\sUtilization\sover\spreceding\s(?P<preceding_secs>[0-9.]+)\sseconds$"
         )
 
         # ID:       0       1       2       3      10      11
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^ID:\s+(?P<id0>\d+)\s+(?P<id1>\d+)\s+(?P<id2>\d+)\s+(?P<id3>\d+)\s+(?P<id10>\d+)\s+(?P<id11>\d+)$"
         )
 
         # % PP:    0.10    0.73    0.65    0.11    0.00    0.00
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^%\sPP:\s+(?P<id0>[0-9.]+)\s+(?P<id1>[0-9.]+)\s+(?P<id2>[0-9.]+)\s+(?P<id3>[0-9.]+)\s+(?P<id10>[0-9.]+)\s+(?P<id11>[0-9.]+)$"
         )
 
         # % RX:    0.00    0.00    0.00    0.00    0.00    0.89
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^%\sRX:\s+(?P<id0>[0-9.]+)\s+(?P<id1>[0-9.]+)\s+(?P<id2>[0-9.]+)\s+(?P<id3>[0-9.]+)\s+(?P<id10>[0-9.]+)\s+(?P<id11>[0-9.]+)$"
         )
 
         # % TM:    0.00    0.00    0.00    0.00    0.78    0.00
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^%\sTM:\s+(?P<id0>[0-9.]+)\s+(?P<id1>[0-9.]+)\s+(?P<id2>[0-9.]+)\s+(?P<id3>[0-9.]+)\s+(?P<id10>[0-9.]+)\s+(?P<id11>[0-9.]+)$"
         )
 
         # % COFF:    0.00    0.00    0.00    0.00    0.00    0.00
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^%\sCOFF:\s+(?P<id0>[0-9.]+)\s+(?P<id1>[0-9.]+)\s+(?P<id2>[0-9.]+)\s+(?P<id3>[0-9.]+)\s+(?P<id10>[0-9.]+)\s+(?P<id11>[0-9.]+)$"
         )
 
         # % IDLE:   99.90   99.27   99.35   99.89   99.22   99.11
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^%\sIDLE:\s+(?P<id0>[0-9.]+)\s+(?P<id1>[0-9.]+)\s+(?P<id2>[0-9.]+)\s+(?P<id3>[0-9.]+)\s+(?P<id10>[0-9.]+)\s+(?P<id11>[0-9.]+)$"
         )
 
@@ -4732,54 +4732,54 @@ class ShowPlatformHardwareQfpActiveDatapathInfraSwNic(
         parsed_dict = {}
 
         # pmd 46813180 device fpe0
-        p1 = re.compile(r"^pmd\s+(?P<pmd>\w+)\sdevice\s(?P<device>\w+)$")
+        p1 = regex_engine.compile(r"^pmd\s+(?P<pmd>\w+)\sdevice\s(?P<device>\w+)$")
 
         # RX: pkts 15254  bytes 1498020 return 0 badlen 0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^RX:\spkts\s(?P<rx_pkts>\d+)\s+bytes\s(?P<rx_bytes>\d+)\sreturn\s(?P<rx_return>\d+)\s+badlen\s(?P<rx_badlen>\d+)$"
         )
 
         # pkts/burst 1  cycl/pkt 938  ext_cycl/pkt 1390
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^pkts/burst\s+(?P<pkts_burts>\d+)\s+cycl/pkt\s+(?P<cycl_pkt>\d+)\s+ext_cycl/pkt\s+(?P<ext_cycl_pkt>\d+)$"
         )
 
         # Total ring read 4322810273, empty 4322795019
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Total\s+ring\s+read\s+(?P<total_ring_read>\d+),\s+empty\s+(?P<empty>\d+)$"
         )
 
         # TX: pkts 2061  bytes 891639
-        p5 = re.compile(r"TX:\s+pkts\s+(?P<tx_pkts>\d+)\s+bytes\s+(?P<tx_bytes>\d+)$")
+        p5 = regex_engine.compile(r"TX:\s+pkts\s+(?P<tx_pkts>\d+)\s+bytes\s+(?P<tx_bytes>\d+)$")
 
         # pri-0: pkts 2068  bytes 892100
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^pri-0:\s+pkts\s+(?P<pri_0_pkts>\d+)\s+bytes\s+(?P<pri_0_bytes>\d+)$"
         )
 
         # pkts/send 1
-        p7 = re.compile(r"^pkts/send\s(?P<pkts_send>\d+)$")
+        p7 = regex_engine.compile(r"^pkts/send\s(?P<pkts_send>\d+)$")
 
         # Total: pkts/send 1  cycl/pkt 1717
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^Total:\spkts/send\s+(?P<total_pkts_send>\d+)\s+cycl/pkt\s+(?P<cycl_pkt>\d+)$"
         )
 
         # send 2047  sendnow 0
-        p9 = re.compile(r"^send\s(?P<send>\d+)\s+sendnow\s+(?P<send_now>\d+)$")
+        p9 = regex_engine.compile(r"^send\s(?P<send>\d+)\s+sendnow\s+(?P<send_now>\d+)$")
 
         # forced 2056  poll 0  thd_poll 0
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^forced\s+(?P<forced>\d+)\s+poll\s+(?P<poll>\d+)\s+thd_poll\s+(?P<thd_poll>\d+)$"
         )
 
         # blocked 0  retries 0  mbuf alloc err 0
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"blocked\s+(?P<blocked>\d+)\s+retries\s+(?P<retries>\d+)\s+mbuf\s+alloc\s+err\s+(?P<mbuf_alloc_err>\d+)$"
         )
 
         # TX Queue 0: full 0  current index 0  hiwater 0
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"TX\s+Queue\s+(?P<tx_queue>\d+):\s+full\s+(?P<full>\d+)\s+current\s+index\s+(?P<current_index>\d+)\s+hiwater\s+(?P<hiwater>\d+)$"
         )
 
@@ -4956,60 +4956,60 @@ class ShowPlatformHardwareQfpActiveSystemState(
         parsed_dict = {}
 
         # CPP HA client processes registered (5 of 5)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^CPP\s+HA\s+client\s+processes\s+registered\s+\((?P<total_processes>\d+)\sof\s(?P<registered_process>\d+)\)$"
         )
 
         # cpp_ha : Initialized
-        p2 = re.compile(r"^cpp_ha\s:\s+(?P<cpp_ha>\w+)$")
+        p2 = regex_engine.compile(r"^cpp_ha\s:\s+(?P<cpp_ha>\w+)$")
 
         # cpp_sp : Initialized
-        p3 = re.compile(r"^cpp_sp\s:\s+(?P<cpp_sp>\w+)$")
+        p3 = regex_engine.compile(r"^cpp_sp\s:\s+(?P<cpp_sp>\w+)$")
 
         # cpp_driver0 : Initialized
-        p4 = re.compile(r"^cpp_driver0\s:\s+(?P<cpp_driver0>\w+)$")
+        p4 = regex_engine.compile(r"^cpp_driver0\s:\s+(?P<cpp_driver0>\w+)$")
 
         # FMAN-FP : Initialized
-        p5 = re.compile(r"^FMAN-FP\s:\s+(?P<fman_fp>\w+)$")
+        p5 = regex_engine.compile(r"^FMAN-FP\s:\s+(?P<fman_fp>\w+)$")
 
         # cpp_cp : Initialized
-        p6 = re.compile(r"^cpp_cp\s:\s+(?P<cpp_cp>\w+)$")
+        p6 = regex_engine.compile(r"^cpp_cp\s:\s+(?P<cpp_cp>\w+)$")
 
         # Platform State: curr=ACTIVE_SOLO next=ACTIVE_SOLO
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Platform\s+State:\scurr=(?P<curr>[A-Z_]+)\snext=(?P<next>[A-Z_]+)$"
         )
 
         # HA State: CPP=0 dir=BOTH Role: curr=ACTIVE_SOLO next=ACTIVE_SOLO
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^HA\sState:\s+CPP=(?P<cpp>\d+)\sdir=(?P<dir>\w+)\sRole:\scurr=(?P<curr>[A-Z_]+)\snext=(?P<next>[A-Z_]+)$"
         )
 
         # Client State: ENABLE
-        p9 = re.compile(r"^Client\s+State:\s+(?P<client_state>\w+)$")
+        p9 = regex_engine.compile(r"^Client\s+State:\s+(?P<client_state>\w+)$")
 
         # Image: /tmp/sw/fp/0/0/fp/mount/usr/cpp/bin/qfp-ucode-radium
-        p10 = re.compile(r"^Image:\s+(?P<image>[a-z0-9\/-]+)$")
+        p10 = regex_engine.compile(r"^Image:\s+(?P<image>[a-z0-9\/-]+)$")
 
         # Load Cnt: 1 Time: Jun 23, 2022 07:21:15
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^Load\s+Cnt:\s+(?P<load_count>\d+)\sTime:\s(?P<time>[A-Za-z0-9 :,]+)$"
         )
 
         # Active Threads: 0-3,10-11
-        p12 = re.compile(r"^Active\s+Threads:\s+(?P<active_threads>[0-9-,]+)$")
+        p12 = regex_engine.compile(r"^Active\s+Threads:\s+(?P<active_threads>[0-9-,]+)$")
 
         # Stuck Threads: 4-9
-        p13 = re.compile(r"^Stuck\s+Threads:\s+(?P<stuck_threads>[0-9-]+)$")
+        p13 = regex_engine.compile(r"^Stuck\s+Threads:\s+(?P<stuck_threads>[0-9-]+)$")
 
         # ignore_fault:          FALSE
-        p14 = re.compile(r"^ignore_fault:\s+(?P<ignore_fault>\w+)$")
+        p14 = regex_engine.compile(r"^ignore_fault:\s+(?P<ignore_fault>\w+)$")
 
         # ignore_stuck_thread:   FALSE
-        p15 = re.compile(r"^ignore_stuck_thread:\s+(?P<ignore_stuck_thread>\w+)$")
+        p15 = regex_engine.compile(r"^ignore_stuck_thread:\s+(?P<ignore_stuck_thread>\w+)$")
 
         # crashdump_in_progress: FALSE
-        p16 = re.compile(r"^crashdump_in_progress:\s+(?P<crashdump_in_progress>\w+)$")
+        p16 = regex_engine.compile(r"^crashdump_in_progress:\s+(?P<crashdump_in_progress>\w+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -5189,7 +5189,7 @@ class ShowPlatformHardwareQfpActiveFeatureIpsecDatapathDropsAll(
         ret_dict = {}
 
         # 1  IN_V4_PKT_HIT_INVALID_SA                                    0                           67643
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<drop_type>\d+).* +(?P<drop_name>[\w\_]+).* +(?P<packets>\d+)$"
         )
 
@@ -5306,147 +5306,147 @@ class ShowPlatformHardwareQfpActiveDatapathPmdIfdev(
         parsed_dict = {}
 
         # Port#0 - Name: fpe0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Port#(?P<port_number>\d+)\s+\-\s+Name:\s+(?P<port_name>\w+)$"
         )
 
         # Bind name      : 0000:0b:10.0
-        p2 = re.compile(r"^Bind\s+name\s+:\s(?P<bind_name>[0-9a-z:.]+)$")
+        p2 = regex_engine.compile(r"^Bind\s+name\s+:\s(?P<bind_name>[0-9a-z:.]+)$")
 
         # Driver         : net_e1000_igb_vf
-        p3 = re.compile(r"^Driver\s+:\s+(?P<driver>[0-9a-z_]+)$")
+        p3 = regex_engine.compile(r"^Driver\s+:\s+(?P<driver>[0-9a-z_]+)$")
 
         # MAC Address    : f86b.d9c0.cbe0
-        p4 = re.compile(r"MAC\s+Address\s+:\s+(?P<mac_address>([0-9a-fA-F].?){12})$")
+        p4 = regex_engine.compile(r"MAC\s+Address\s+:\s+(?P<mac_address>([0-9a-fA-F].?){12})$")
 
         # Device         : RUNNING
-        p5 = re.compile(r"^Device\s+:\s+(?P<device>\w+)$")
+        p5 = regex_engine.compile(r"^Device\s+:\s+(?P<device>\w+)$")
 
         # CIO State      : ENABLED, if_type 0, uidb_index 1023, module_id 65535, flags 0x1
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^CIO\s+State\s+:\s+(?P<cio_state>\w+),\s+if_type\s+(?P<if_type>\d+),\s+uidb_index\s+(?P<uidb_index>\d+),\s+module_id\s+(?P<module_id>\d+),\s+flags\s+(?P<flags>\w+)$"
         )
 
         # CIO Events     : Enable 2, Disable 1
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^CIO\s+Events\s+:\s+Enable\s(?P<enable>\d+),\s+Disable\s+(?P<disable>\d+)$"
         )
 
         # Tx_Drain       : FALSE
-        p8 = re.compile(r"^Tx_Drain\s+:\s+(?P<tx_drain>\w+)$")
+        p8 = regex_engine.compile(r"^Tx_Drain\s+:\s+(?P<tx_drain>\w+)$")
 
         # Vdev Pause     : Inactive
-        p9 = re.compile(r"^Vdev\s+Pause\s+:\s+(?P<vdev_pause>\w+)$")
+        p9 = regex_engine.compile(r"^Vdev\s+Pause\s+:\s+(?P<vdev_pause>\w+)$")
 
         # Admin State    : Up
-        p10 = re.compile(r"^Admin\s+State\s+:\s+(?P<admin_state>\w+)$")
+        p10 = regex_engine.compile(r"^Admin\s+State\s+:\s+(?P<admin_state>\w+)$")
 
         # Oper State     : Up (Up)
-        p11 = re.compile(r"^Oper\s+State\s+:\s+(?P<oper_state>\w+\s\(\w+\))$")
+        p11 = regex_engine.compile(r"^Oper\s+State\s+:\s+(?P<oper_state>\w+\s\(\w+\))$")
 
         # Link state chg : Up 1, Down 0
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^Link\s+state\s+chg\s:\sUp\s(?P<up>\d+),\s+Down\s+(?P<down>\d+)$"
         )
 
         # Events         : Remove 0, Reset 1, Link up 0, Link dn 0
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^Events\s+:\s+Remove\s+(?P<remove>\d+),\s+Reset\s+(?P<reset>\d+),\s+Link\s+up+\s(?P<link_up>\d+),\s+Link\s+dn\s+(?P<link_down>\d+)$"
         )
 
         # Events         : Bond del 0, Unknown 0
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^Events\s+:\s+Bond\s+del\s+(?P<bond_del>\d+),\s+Unknown\s+(?P<unknown>\d+)$"
         )
 
         # Vdev Rmv Pendng: 0
-        p15 = re.compile(r"^Vdev\s+Rmv\s+Pendng:\s+(?P<vdev_rmv_pendng>\d+)$")
+        p15 = regex_engine.compile(r"^Vdev\s+Rmv\s+Pendng:\s+(?P<vdev_rmv_pendng>\d+)$")
 
         # Attach Attempts: 50
-        p16 = re.compile(r"^Attach\s+Attempts:\s+(?P<attach_attempts>\d+)$")
+        p16 = regex_engine.compile(r"^Attach\s+Attempts:\s+(?P<attach_attempts>\d+)$")
 
         # Attributes
         # RECONFIGURE_SUPPORTED
-        p17 = re.compile(r"^(?P<attribute_name>RECONFIGURE)_(?P<status>[A-Z]+)$")
+        p17 = regex_engine.compile(r"^(?P<attribute_name>RECONFIGURE)_(?P<status>[A-Z]+)$")
 
         # RX_OFFLOAD_CRC_STRIP_SUPPORTED
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^(?P<attribute_name>RX_OFFLOAD_CRC_STRIP)_(?P<status>[A-Z]+)$"
         )
 
         # RX_OFFLOAD_VLAN_FILTER_SUPPORTED
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"^(?P<attribute_name>RX_OFFLOAD_VLAN_FILTER)_(?P<status>[A-Z]+)$"
         )
 
         # RX_VLAN_TAG_INSERT_NEEDED
-        p20 = re.compile(r"^(?P<attribute_name>RX_VLAN_TAG_INSERT)_(?P<status>[A-Z]+)$")
+        p20 = regex_engine.compile(r"^(?P<attribute_name>RX_VLAN_TAG_INSERT)_(?P<status>[A-Z]+)$")
 
         # RX_VLAN_TAG_SWAP_NEEDED
-        p21 = re.compile(r"^(?P<attribute_name>RX_VLAN_TAG_SWAP_)(?P<status>[A-Z]+)$")
+        p21 = regex_engine.compile(r"^(?P<attribute_name>RX_VLAN_TAG_SWAP_)(?P<status>[A-Z]+)$")
 
         # MAC_FILTER_API_SUPPORTED
-        p22 = re.compile(r"^(?P<attribute_name>MAC_FILTER_API)_(?P<status>[A-Z]+)$")
+        p22 = regex_engine.compile(r"^(?P<attribute_name>MAC_FILTER_API)_(?P<status>[A-Z]+)$")
 
         # ALWAYS_MC_PROMISC
-        p23 = re.compile(r"^(?P<status>[A-Z]+)_(?P<attribute_name>MC_PROMISC)$")
+        p23 = regex_engine.compile(r"^(?P<status>[A-Z]+)_(?P<attribute_name>MC_PROMISC)$")
 
         # SET_MC_ADDR_API_SUPPORTED
-        p24 = re.compile(r"^(?P<attribute_name>SET_MC_ADDR_API)_(?P<status>[A-Z]+)$")
+        p24 = regex_engine.compile(r"^(?P<attribute_name>SET_MC_ADDR_API)_(?P<status>[A-Z]+)$")
 
         # PAUSE_RESUME_SUPPORTED
-        p25 = re.compile(r"^(?P<attribute_name>PAUSE_RESUME)_(?P<status>[A-Z]+)$")
+        p25 = regex_engine.compile(r"^(?P<attribute_name>PAUSE_RESUME)_(?P<status>[A-Z]+)$")
 
         # Configuration
         # Promiscuous    : Admin DISABLED, Override DISABLED, Multicast ENABLED
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r"^Promiscuous\s+:\s+Admin\s+(?P<admin_status>\w+),\s+Override\s+(?P<override_status>\w+),\s+Multicast\s+(?P<multicast_status>\w+)$"
         )
 
         # MTU config     : 1526
-        p27 = re.compile(r"^MTU\s+config\s+:\s+(?P<mtu>\d+)$")
+        p27 = regex_engine.compile(r"^MTU\s+config\s+:\s+(?P<mtu>\d+)$")
 
         # cur/min/max  : 1500/68/65535
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r"^cur\/min\/max\s+:\s+(?P<cur>\d+)/(?P<min>\d+)/(?P<max>\d+)$"
         )
 
         # Trans VLAN     : 0
-        p29 = re.compile(r"^Trans\s+VLAN\s+:\s+(?P<trans_vlan>\d+)$")
+        p29 = regex_engine.compile(r"^Trans\s+VLAN\s+:\s+(?P<trans_vlan>\d+)$")
 
         # Map QID Num    : 0
-        p30 = re.compile(r"^Map\s+QID\s+Num\s+:\s+(?P<map_qid_num>\d+)$")
+        p30 = regex_engine.compile(r"^Map\s+QID\s+Num\s+:\s+(?P<map_qid_num>\d+)$")
 
         # Map QID Id     : 0
-        p31 = re.compile(r"^Map\s+QID\s+Id\s+:\s+(?P<map_qid_id>\d+)$")
+        p31 = regex_engine.compile(r"^Map\s+QID\s+Id\s+:\s+(?P<map_qid_id>\d+)$")
 
         # Rx ring size   : 0
-        p32 = re.compile(r"^Rx\s+ring\s+size\s+:\s+(?P<rx_ring_size>\d+)$")
+        p32 = regex_engine.compile(r"^Rx\s+ring\s+size\s+:\s+(?P<rx_ring_size>\d+)$")
 
         # Tx ring size   : 0
-        p33 = re.compile(r"^Tx\s+ring\s+size\s+:\s+(?P<tx_ring_size>\d+)$")
+        p33 = regex_engine.compile(r"^Tx\s+ring\s+size\s+:\s+(?P<tx_ring_size>\d+)$")
 
         # Rx Active Q Num: 1
-        p34 = re.compile(r"^Rx\s+Active\s+Q\s+Num:\s+(?P<rx_active_q_num>\d+)$")
+        p34 = regex_engine.compile(r"^Rx\s+Active\s+Q\s+Num:\s+(?P<rx_active_q_num>\d+)$")
 
         # Rx Total Q Num : 1
-        p35 = re.compile(r"^Rx\s+Total\s+Q\s+Num\s+:\s+(?P<rx_total_q_num>\d+)$")
+        p35 = regex_engine.compile(r"^Rx\s+Total\s+Q\s+Num\s+:\s+(?P<rx_total_q_num>\d+)$")
 
         # Rx CIO Q Num   : 1
-        p36 = re.compile(r"^Rx\s+CIO\s+Q\s+Num\s+:\s+(?P<rx_cio_q_num>\d+)$")
+        p36 = regex_engine.compile(r"^Rx\s+CIO\s+Q\s+Num\s+:\s+(?P<rx_cio_q_num>\d+)$")
 
         # Rx Desc Num
         # Tx Desc Num
-        p37 = re.compile(r"^(?P<name>([A-Z][a-z]\s+[A-zZ][a-z]+\s+[A-Z][a-z]+))$")
+        p37 = regex_engine.compile(r"^(?P<name>([A-Z][a-z]\s+[A-zZ][a-z]+\s+[A-Z][a-z]+))$")
 
         # Queue 0      : 1024
-        p38 = re.compile(r"^Queue\s+0\s+:\s+(?P<queue0>\d+)$")
+        p38 = regex_engine.compile(r"^Queue\s+0\s+:\s+(?P<queue0>\d+)$")
 
         # Tx Q Num       : 1
-        p39 = re.compile(r"^Tx\s+Q\s+Num\s+:\s+(?P<tx_q_num>\d+)$")
+        p39 = regex_engine.compile(r"^Tx\s+Q\s+Num\s+:\s+(?P<tx_q_num>\d+)$")
 
         # Num VLANs      : 0
-        p40 = re.compile(r"^Num\s+VLANs\s+:\s+(?P<num_vlans>\d+)$")
+        p40 = regex_engine.compile(r"^Num\s+VLANs\s+:\s+(?P<num_vlans>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -5814,7 +5814,7 @@ class ShowPlatformHardwareThroughputLevel(ShowPlatformHardwareThroughputLevelSch
 
         # The current throughput level is unthrottled
         # The current throughput level is 1000000 kb/s
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^The\s+current\s+throughput\s+level\s+is\s+(?P<curr_throughput_level>[a-z0-9 /]+)$"
         )
 
@@ -5892,39 +5892,39 @@ class ShowPlatformHardwareQfpActiveInfraDatapathInfraSwDistrib(
         parsed_dict = {}
 
         # Dist Mode: NSFBD
-        p1 = re.compile(r"^Dist\s+Mode:\s(?P<dist_mode>\w+)$")
+        p1 = regex_engine.compile(r"^Dist\s+Mode:\s(?P<dist_mode>\w+)$")
 
         # Inactive PPEs: 4-9
-        p2 = re.compile(r"^Inactive\s+PPEs:\s(?P<inactive_ppes>[0-9-]+)$")
+        p2 = regex_engine.compile(r"^Inactive\s+PPEs:\s(?P<inactive_ppes>[0-9-]+)$")
 
         # RX Stats
-        p3 = re.compile(r"^(?P<stats>RX Stats)$")
+        p3 = regex_engine.compile(r"^(?P<stats>RX Stats)$")
 
         # Source  0: name   DST, pmask 0x3f0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Source\s+(?P<source_id>\d+):\s+name\s+(?P<name>\w+),\s+pmask\s(?P<pmask>\w+)$"
         )
 
         # Port  4 (fpe0/GigabitEthernet0/0/0): Classifier: L4TUPLE, Credit Err:  -
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^Port\s+(?P<port>\d+)\s+(?P<port_name>\([A-Za-z0-9_//)]+):\s+Classifier:\s+(?P<classifier>\w+),\s+Credit\s+Err:\s+(?P<credit_error>\S+)$"
         )
 
         #                 Flushes         Flushed            Spin         SW Hash   COFF Directed           Total
         # PP  0:           665518          665538               -          665538               -          665538
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^PP\s+(?P<pp>[0-9-]+):\s+(?P<flushes>[0-9-]+)\s+(?P<flushed>[0-9-]+)\s+(?P<spin>[0-9-]+)\s+(?P<sw_hash>[0-9-]+)\s+(?P<coff_directed>[0-9-]+)\s+(?P<total>[0-9-]+)$"
         )
 
         #                  Flushes         Flushed            Spin         SW Hash           Total
         # PP  3:           306421          306421               -          306421          306421
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^PP\s+(?P<pp>[0-9-]+):\s+(?P<flushes>[0-9-]+)\s+(?P<flushed>[0-9-]+)\s+(?P<spin>[0-9-]+)\s+(?P<sw_hash>[0-9-]+)\s+(?P<total>[0-9-]+)$"
         )
 
         #                 Flushes         Flushed            Spin         SW Hash         Unknown           Total
         # PP  0:           105241          124512               -          124512               -          124512
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^PP\s+(?P<pp>[0-9-]+):\s+(?P<flushes>[0-9-]+)\s+(?P<flushed>[0-9-]+)\s+(?P<spin>[0-9-]+)\s+(?P<sw_hash>[0-9-]+)\s+(?P<unknown>[0-9-]+)\s+(?P<total>[0-9-]+)$"
         )
 
@@ -6053,19 +6053,19 @@ class ShowPlatformHardwareQfpActiveInfrastructureExmemStatistics(
         # Type: Name: DRAM, QFP: 0
         # Type: Name: IRAM, QFP: 0
         # Type: Name: SRAM, QFP: 0
-        p1 = re.compile(r"^Type:\sName:\s(?P<type_name>\w+),\sQFP:\s(?P<qfp>\d+)$")
+        p1 = regex_engine.compile(r"^Type:\sName:\s(?P<type_name>\w+),\sQFP:\s(?P<qfp>\d+)$")
 
         # Total: 536870912
-        p2 = re.compile(r"^Total:\s(?P<total>\d+)$")
+        p2 = regex_engine.compile(r"^Total:\s(?P<total>\d+)$")
 
         # InUse: 423936
-        p3 = re.compile(r"^InUse:\s(?P<inuse>\d+)$")
+        p3 = regex_engine.compile(r"^InUse:\s(?P<inuse>\d+)$")
 
         # Free: 1673216
-        p4 = re.compile(r"^Free:\s(?P<free>\d+)$")
+        p4 = regex_engine.compile(r"^Free:\s(?P<free>\d+)$")
 
         # Lowest free water mark: 1673216
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^Lowest\sfree\swater\smark:\s(?P<lowest_free_water_mark>\d+)$"
         )
 
@@ -6194,7 +6194,7 @@ class ShowPlatformHardwareIomdQosPortIngressQueueStats(
         """
         DATA Port:1 StartingQueue:0  Enqueue Counters
         """
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^DATA Port:(?P<port_no>\d+)\s+StartingQueue:(?P<starting>\d+)\s+Enqueue Counters$"
         )
 
@@ -6205,7 +6205,7 @@ class ShowPlatformHardwareIomdQosPortIngressQueueStats(
         0       0           0           0           0
         1     314           0           0  1606072000
         """
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<queue>\d+)\s+(?P<buf>\d+)\s+(?P<en_th0>\d+)\s+(?P<en_th1>\d+)\s+(?P<en_th2>\d+)$"
         )
 
@@ -6216,14 +6216,14 @@ class ShowPlatformHardwareIomdQosPortIngressQueueStats(
         0           0           0           0           0           0
         1           0           0  1605942200           0           0
         """
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<queue>\d+)\s+(?P<dr_th0>\d+)\s+(?P<dr_th1>\d+)\s+(?P<dr_th2>\d+)\s+(?P<sbuf>\d+)\s+(?P<qeb>\d+)$"
         )
 
         """
         Note: Queuing stats are in bytes
         """
-        p4 = re.compile(r"Note:\s+Queuing stats are in\s+(?P<unit>\S+)$")
+        p4 = regex_engine.compile(r"Note:\s+Queuing stats are in\s+(?P<unit>\S+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -6342,12 +6342,12 @@ class ShowPlatformHardwareIomdPortgroups(ShowPlatformHardwareIomdPortgroupsSchem
         group_bw_dict = {}
 
         # 1     TenGigabitEthernet10/0/18       up         10G       60G
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<group>\d+)\s+(?P<intf>\S+)\s+(?P<status>\S+)\s+(?P<intf_bw>\S+)\s+(?P<group_bw>\S+)$"
         )
 
         # 1     TenGigabitEthernet10/0/1        up         10G
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r"^(?P<group>\d+)\s+(?P<intf>\S+)\s+(?P<status>\S+)\s+(?P<intf_bw>\S+)$"
         )
 
@@ -6440,15 +6440,15 @@ class ShowPlatformHardwareCryptoDeviceUtilization(
         # 1 min (percentage) : 2%
         # 5 min (percentage) : 2%
         # 15 min (percentage) : 2%
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\s*(?P<min_data>\d+) min \(percentage\) \: +(?P<min_percent>.*)\%"
         )
 
         # (decrypt pkt): 0
-        p2 = re.compile(r"^\s*\(decrypt pkt\)\: +(?P<decrypt_pkt>.*)")
+        p2 = regex_engine.compile(r"^\s*\(decrypt pkt\)\: +(?P<decrypt_pkt>.*)")
 
         # (encrypt pkt): 0
-        p3 = re.compile(r"^\s*\(encrypt pkt\)\: +(?P<encrypt_pkt>.*)")
+        p3 = regex_engine.compile(r"^\s*\(encrypt pkt\)\: +(?P<encrypt_pkt>.*)")
 
         for line in out.splitlines():
             line = line.strip()
@@ -6536,7 +6536,7 @@ class ShowPlatformHardwareQfpActiveClassificationFeatureTcamUsage(
         ret_dict["client"] = {}
 
         # nat           5   2           0           4           0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\s*(?P<client>[\w\d]+)+\s*(?P<id>\d+)+\s*(?P<one_sixty_bit_VMR>\d+)+\s*(?P<three_twenty_bit_VMR>\d+)+\s*(?P<total_cell>\d+)+\s*(?P<total_percent>\d+)"
         )
 
@@ -6588,7 +6588,7 @@ class ShowPlatformHardwareFpgaSwitch(ShowPlatformHardwareFpgaSwitchSchema):
 
         # Register Addr           FPGA Reg Description    Value
         # 0x000000f0         Common Platform Board ID     0x02705919
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<register_address>[\w\d]+)\s+(?P<fpga_reg_desc>[\S\s]+)     (?P<value>[\w\d]+)$"
         )
 
@@ -6656,19 +6656,19 @@ class ShowPlatformHardwareQfpActiveFeatureNat66DatapathPrefix(
             output = self.device.execute(self.cli_command)
 
         # prefix hasht 0xe76da800 max 32 chunk 0xe8a23010 hash_salt 1588817540
-        q1 = re.compile(
+        q1 = regex_engine.compile(
             r"^prefix +hasht +(?P<hasht>\S+) +max +(?P<max>\d+) +chunk +(?P<chunk>\S+) +hash_salt +(?P<hash_salt>\d+)$"
         )
         # NAT66 hash[1] id(1) len(112) vrf(1) in: fd62:1b53:affb:1201:0000:0000:0000:0000 out: 2001:4888:affb:1201:0000:0000:0000:0000 inc_csum: 0xb02c in2out: 25 out2in: 20 egress_ifh 0x0 ra 0
-        q2_1 = re.compile(
+        q2_1 = regex_engine.compile(
             r"^NAT66 +hash\[(?P<hash>\d+)\] +id\((?P<id>\d+)\) +len\((?P<len>\d+)\) +vrf\((?P<vrf>\d+)\) +in: +(?P<in>\S+) +out: +(?P<out>\S+) +inc_csum: +(?P<inc_csum>\S+) +in2out: +(?P<in2out>\d+) +out2in: +(?P<out2in>\d+) +egress_ifh +(?P<egress_ifh>\S+) +ra +(?P<ra>\d+)$"
         )
         # NAT66 hash[1] id(1) len(112) vrf(1) in: fd62:1b53:affb:1201:0000:0000:0000:0000 out: 2001:4888:affb:1201:0000:0000:0000:0000 inc_csum: 0xb02c in2out: 25 out2in: 20 egress_ifh 0x0
-        q2_2 = re.compile(
+        q2_2 = regex_engine.compile(
             r"^NAT66 +hash\[(?P<hash>\d+)\] +id\((?P<id>\d+)\) +len\((?P<len>\d+)\) +vrf\((?P<vrf>\d+)\) +in: +(?P<in>\S+) +out: +(?P<out>\S+) +inc_csum: +(?P<inc_csum>\S+) +in2out: +(?P<in2out>\d+) +out2in: +(?P<out2in>\d+) +egress_ifh +(?P<egress_ifh>\S+)$"
         )
         # Total Prefixes: 3
-        q3 = re.compile(r"^Total +Prefixes: +(?P<total_prefixes>\d+)$")
+        q3 = regex_engine.compile(r"^Total +Prefixes: +(?P<total_prefixes>\d+)$")
         ret_dict = {}
         nat66_prefixes_dict = {}
 
@@ -6761,19 +6761,19 @@ class ShowPlatformHardwareQfpInterfaceIfnamepath(
             out = output
 
         # Valid flag 1
-        p1 = re.compile(r"^\s*Valid\s+flag\s+(?P<valid_flag>\d+)$")
+        p1 = regex_engine.compile(r"^\s*Valid\s+flag\s+(?P<valid_flag>\d+)$")
 
         # BAF Port
-        p2 = re.compile(r"^\s*BAF\s+Port\s+(?P<baf_port>\d+)$")
+        p2 = regex_engine.compile(r"^\s*BAF\s+Port\s+(?P<baf_port>\d+)$")
 
         # Input uIDB
-        p3 = re.compile(r"^\s*Input\s+uIDB\s+(?P<input_uidb>\d+)$")
+        p3 = regex_engine.compile(r"^\s*Input\s+uIDB\s+(?P<input_uidb>\d+)$")
 
         # ESI channel
-        p4 = re.compile(r"^\s*ESI\s+channel\s+(?P<esi_channel>0x[a-fA-F\d]+)$")
+        p4 = regex_engine.compile(r"^\s*ESI\s+channel\s+(?P<esi_channel>0x[a-fA-F\d]+)$")
 
         # BAF header
-        p5 = re.compile(r"^\s*BAF\s+header\s+(?P<baf_header>0x[\da-fA-F]+)$")
+        p5 = regex_engine.compile(r"^\s*BAF\s+header\s+(?P<baf_header>0x[\da-fA-F]+)$")
 
         # initial return dictionary
         ret_dict = {}
@@ -6845,19 +6845,19 @@ class ShowPlatformHardwareQfpInterfaceIfnamepath(
             out = output
 
         # Valid flag 1
-        p1 = re.compile(r"^\s*Valid\s+flag\s+(?P<valid_flag>\d+)$")
+        p1 = regex_engine.compile(r"^\s*Valid\s+flag\s+(?P<valid_flag>\d+)$")
 
         # BAF Port
-        p2 = re.compile(r"^\s*BAF\s+Port\s+(?P<baf_port>\d+)$")
+        p2 = regex_engine.compile(r"^\s*BAF\s+Port\s+(?P<baf_port>\d+)$")
 
         # Input uIDB
-        p3 = re.compile(r"^\s*Input\s+uIDB\s+(?P<input_uidb>\d+)$")
+        p3 = regex_engine.compile(r"^\s*Input\s+uIDB\s+(?P<input_uidb>\d+)$")
 
         # ESI channel
-        p4 = re.compile(r"^\s*ESI\s+channel\s+(?P<esi_channel>0x[a-fA-F\d]+)$")
+        p4 = regex_engine.compile(r"^\s*ESI\s+channel\s+(?P<esi_channel>0x[a-fA-F\d]+)$")
 
         # BAF header
-        p5 = re.compile(r"^\s*BAF\s+header\s+(?P<baf_header>0x[\da-fA-F]+)$")
+        p5 = regex_engine.compile(r"^\s*BAF\s+header\s+(?P<baf_header>0x[\da-fA-F]+)$")
 
         # initial return dictionary
         ret_dict = {}
@@ -6931,7 +6931,7 @@ class ShowPlatformHardwareIomdMacsecPortSubport(
         list_key_num = 1
 
         # Secy_Device SA Idx count: No of Free SA 507, Used SA 5
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"Secy_Device\s+SA\s+Idx\s+count:\s+No\s+of\s+Free\s+SA\s+(?P<free_SA>-?\d+),\s+Used\s+SA\s+(?P<used_SA>-?\d+)$"
         )
 
@@ -6982,7 +6982,7 @@ class ShowPlatformHardwareIomdMacsecPortSubport(
         list_key_num = 1
 
         # Secy_Device SA Idx count: No of Free SA 507, Used SA 5
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"Secy_Device\s+SA\s+Idx\s+count:\s+No\s+of\s+Free\s+SA\s+(?P<free_SA>-?\d+),\s+Used\s+SA\s+(?P<used_SA>-?\d+)$"
         )
 
@@ -7033,7 +7033,7 @@ class ShowPlatformHardwareIomdMacsecPortSubport(
         list_key_num = 1
 
         # Secy_Device SA Idx count: No of Free SA 507, Used SA 5
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"Secy_Device\s+SA\s+Idx\s+count:\s+No\s+of\s+Free\s+SA\s+(?P<free_SA>-?\d+),\s+Used\s+SA\s+(?P<used_SA>-?\d+)$"
         )
 
@@ -7092,28 +7092,28 @@ class ShowPlatformHardwareFedeyescan(ShowPlatformHardwareFedeyescanSchema):
         ret_dict = {}
 
         #npu_pdsf_procagent_config_loopback : asic inst 0 port 39 mode 1 command 20
-        p1 =  re.compile(r'^npu_pdsf_procagent_get_eye_common\s*\:\s*(?P<npu_pdsf_procagent_get_eye_common>.*)$')
+        p1 =  regex_engine.compile(r'^npu_pdsf_procagent_get_eye_common\s*\:\s*(?P<npu_pdsf_procagent_get_eye_common>.*)$')
 
         #"eye_capture": {
-        p2 = re.compile (r'^\"eye_capture\"\:\s*\{$')
+        p2 = regex_engine.compile (r'^\"eye_capture\"\:\s*\{$')
 
         #"veye_data": [
-        p3 = re.compile(r'^\"veye_data\"\:\s*\[$')
+        p3 = regex_engine.compile(r'^\"veye_data\"\:\s*\[$')
 
         #"veye_values": [
-        p4 = re.compile(r'^\"veye_values\"\:\s*\[$')	
+        p4 = regex_engine.compile(r'^\"veye_values\"\:\s*\[$')	
 
         # "serdes_id": 18,
-        p5 = re.compile(r'^\"(?P<key>\w+)\"\:\s*(?P<value>.*)$')        
+        p5 = regex_engine.compile(r'^\"(?P<key>\w+)\"\:\s*(?P<value>.*)$')        
 
         #64,
-        p5_1 = re.compile(r'^(?P<value>[-]?\d+)\,$')  
+        p5_1 = regex_engine.compile(r'^(?P<value>[-]?\d+)\,$')  
 
         # Port = 40 Slot = 1 cmd = () rc = 0x16 reason = (null)
-        p6 = re.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +reason +\=(?P<reason>.*)$')
+        p6 = regex_engine.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +reason +\=(?P<reason>.*)$')
 
         # Port = 39 cmd = (prbs_stop unit 0 port 39 slot 1 serdes_level 1 polynomial 31) rc = 0x0 rsn = success
-        p7  =  re.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')
+        p7  =  regex_engine.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')
         cnt = 0
         for line in output.splitlines():
             line = line.strip()
@@ -7215,10 +7215,10 @@ class ShowPlatformHardwareFedXcvrRegisters(ShowPlatformHardwareFedXcvrRegistersS
         ret_dict = {}
 
         # Phy Reg Value(Hex): FFFF
-        p1 =  re.compile(r'^Phy +Reg +Value\(Hex\)\:\s*(?P<phy_reg_value_hex>.*)$')
+        p1 =  regex_engine.compile(r'^Phy +Reg +Value\(Hex\)\:\s*(?P<phy_reg_value_hex>.*)$')
 
         #"eye_capture": {
-        p2 = re.compile (r'^\(Dec\)\:\s*(?P<phy_reg_value_dec>.*)$')
+        p2 = regex_engine.compile (r'^\(Dec\)\:\s*(?P<phy_reg_value_dec>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -7270,16 +7270,16 @@ class ShowPlatformHardwareFedSwitchActiveNpuSlotPortRecreate(
         ret_dict = {}
 
         #Deleting port 1/40
-        p1 =  re.compile(r'^Deleting +port +(?P<port>.*)$')
+        p1 =  regex_engine.compile(r'^Deleting +port +(?P<port>.*)$')
 
         # creating port 1/40
-        p2 = re.compile(r'^creating +port +(?P<port>.*)$')
+        p2 = regex_engine.compile(r'^creating +port +(?P<port>.*)$')
 
         # Recreate successfull 1/40
-        p3 = re.compile(r'^Recreate +successfull +(?P<port>.*)$')
+        p3 = regex_engine.compile(r'^Recreate +successfull +(?P<port>.*)$')
 
         # , Enabling the port
-        p4 = re.compile(r'^\, +Enabling +the +port$')
+        p4 = regex_engine.compile(r'^\, +Enabling +the +port$')
 
         for line in output.splitlines():
             line = line.strip()
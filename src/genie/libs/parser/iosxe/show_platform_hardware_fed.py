@@ -46,6 +46,7 @@ from xml.dom import minidom
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And, ListOf
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -104,12 +105,12 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicDropsExceptions(
         ret_dict = {}
 
         # ****EXCEPTION STATS ASIC INSTANCE 0 (asic/core 0/0)****
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\*{4}EXCEPTION +STATS +ASIC +INSTANCE +(?P<asic>\d) +\(asic/core \d\/\d\)\*{4}$"
         )
 
         # 0  0  NO_EXCEPTION                                   354740102   354740637    535
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^\d +\d +(?P<name>\w+) +(?P<prev>\d+) +(?P<current>\d+) +(?P<delta>\d+)$"
         )
 
@@ -162,18 +163,18 @@ class ShowPlatformHardwareFedActiveVlanIngress(
         ret_dict = {}
 
         # vlan id is:: 1
-        p1 = re.compile(r"^vlan\s+id\s+is::\s* (?P<vlan_id>\d+)")
+        p1 = regex_engine.compile(r"^vlan\s+id\s+is::\s* (?P<vlan_id>\d+)")
 
         # Interfaces in forwarding state: : Gi1/0/15(Tagged), Fo5/0/9(Untagged)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Interfaces\s+in\s+forwarding state\s*:\s*:\s*(?P<forwarding_state>[\w\/\.\s\(\w\)\,]+)$"
         )
 
         # flood list: : Gi1/0/15, Fo5/0/9
-        p3 = re.compile(r"^flood\s+list\s*:\s+:\s+(?P<flood_list>([\w\/\.\s\,]+)$)")
+        p3 = regex_engine.compile(r"^flood\s+list\s*:\s+:\s+(?P<flood_list>([\w\/\.\s\,]+)$)")
 
         # Gi1/0/15
-        p4 = re.compile(r"^(?P<intf>([\w\/\.\s]+))")
+        p4 = regex_engine.compile(r"^(?P<intf>([\w\/\.\s]+))")
 
         for line in output.splitlines():
             line = line.strip()
@@ -328,51 +329,51 @@ class ShowPlatformHardwareFedActiveQosScheduleInterface(
         list1 = ["Credit PIR    ", "Credit Burst  ", "Transmit PIR  ", "Transmit Burst"]
 
         # Interface  : Gi1/0/2
-        p1 = re.compile(r"^Interface +: (?P<intf>[\w+\/\.\-]+)")
+        p1 = regex_engine.compile(r"^Interface +: (?P<intf>[\w+\/\.\-]+)")
 
         # | Interface SCH OID     : 3125
-        p2 = re.compile(r"\| Interface SCH OID +: (?P<Interface_SCH_OID>\d+)")
+        p2 = regex_engine.compile(r"\| Interface SCH OID +: (?P<Interface_SCH_OID>\d+)")
 
         # System Port SCH OID   : 3129
-        p3 = re.compile(r"\| System Port SCH OID +: (?P<System_Port_SCH_OID>\d+)")
+        p3 = regex_engine.compile(r"\| System Port SCH OID +: (?P<System_Port_SCH_OID>\d+)")
 
         # Priority Propagation  : Disabled
-        p4 = re.compile(r"\| Priority Propagation +: (?P<Priority_Propagation>\w+)")
+        p4 = regex_engine.compile(r"\| Priority Propagation +: (?P<Priority_Propagation>\w+)")
 
         # Sub-interface Q Mode  : Enabled - Priority Propagation
-        p5 = re.compile(r"\| Sub-interface Q Mode +: (?P<Sub_interface_Q>[\w+-]+)")
+        p5 = regex_engine.compile(r"\| Sub-interface Q Mode +: (?P<Sub_interface_Q>[\w+-]+)")
 
         # Logical Port          : Enabled
-        p6 = re.compile(r"\| Logical Port +: (?P<Logical_Port>\w+)")
+        p6 = regex_engine.compile(r"\| Logical Port +: (?P<Logical_Port>\w+)")
 
         # TC Profile            : SDK OID    :   110
-        p7 = re.compile(r"\| TC Profile +: SDK OID +: +(?P<SDK_OID>\d+)$")
+        p7 = regex_engine.compile(r"\| TC Profile +: SDK OID +: +(?P<SDK_OID>\d+)$")
 
         # |                       : VOQ Offset :   0 |   0 |   0 |   0 |   0 |   0 |   0 |   2
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"\| +: VOQ Offset : +(?P<TC0>\d+) \| +(?P<TC1>\d+) \| +(?P<TC2>\d+) \| +(?P<TC3>\d+) \| +(?P<TC4>\d+) \| +(?P<TC5>\d+) \| +(?P<TC6>\d+) \| +(?P<TC7>\d+)$"
         )
 
         # |           | Credit        : 20000000000
-        p9 = re.compile(r"\| +\| Credit +: (?P<Credit>\d+)")
+        p9 = regex_engine.compile(r"\| +\| Credit +: (?P<Credit>\d+)")
 
         # | CIR [RR]  | Transmit      : 20000000000
-        p10 = re.compile(r"\| CIR \[RR\] +\| Transmit +: (?P<Transmit>\d+)")
+        p10 = regex_engine.compile(r"\| CIR \[RR\] +\| Transmit +: (?P<Transmit>\d+)")
 
         # |           | Weight        : 1
-        p11 = re.compile(r"\|           \| Weight        : (?P<Weight>\d+)")
+        p11 = regex_engine.compile(r"\|           \| Weight        : (?P<Weight>\d+)")
 
         # | PIR [WFQ] | Transmit      : 20000000000
-        p12 = re.compile(r"\| PIR \[WFQ\] +\| Transmit +: (?P<Transmit>\d+)")
+        p12 = regex_engine.compile(r"\| PIR \[WFQ\] +\| Transmit +: (?P<Transmit>\d+)")
 
         # |    |Credit CIR    || 0                | 0                | 0                | 0                | 0                | 0                | 0                | 60000000000      |
         # | RR |Credit Burst  || 0                | 0                | 0                | 0                | 0                | 0                | 0                | SDK Default      |
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"\| (\w+ | +)\|(?P<PG_TYPE>[\w+ ]+) +\|\| (?P<OQPG_0>\d+) +\| (?P<OQPG_1>\d+) +\| (?P<OQPG_2>\d+) +\| (?P<OQPG_3>\d+) +\| (?P<OQPG_4>\d+) +\| (?P<OQPG_5>\d+) +\| (?P<OQPG_6>\d+) +\| (?P<OQPG_7>[a-zA-z0-9 ]{1,11})"
         )
 
         # | OQ List           || 0                | 1                |                  | 3                | 4                | 5                | 6                | 2 7              |
-        p13_1 = re.compile(
+        p13_1 = regex_engine.compile(
             r"\| (?P<PG_TYPE>[\w+ ]+) +\|\| (?P<OQPG_0>[\d+ ]) +\| (?P<OQPG_1>[\d+ ]) +\| (?P<OQPG_2>[\d+ ]) +\| (?P<OQPG_3>[\d+ ]) +\| (?P<OQPG_4>[\d+ ]) +\| (?P<OQPG_5>[\d+ ]) +\| (?P<OQPG_6>[\d+ ]) +\| (?P<OQPG_7>[a-zA-z0-9 ]{1,11})"
         )
 
@@ -383,7 +384,7 @@ class ShowPlatformHardwareFedActiveQosScheduleInterface(
         # | Weights : UC : MC ||      8 : 2       |      8 : 2       |      8 : 2       |      8 : 2       |      8 : 2       |      8 : 2       |      8 : 2       |      8 : 2       |
         # | OQSE OID          || LPSE OID : 3138 (0xC42  )           | 3132 (0xC3C  )   | 3133 (0xC3D  )   | 3134 (0xC3E  )   | 3135 (0xC3F  )   | 3136 (0xC40  )   | 3137 (0xC41  )   |
 
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"\| (?P<OQ_Number>[\w+ ]{1,14}) +\|\| (?P<LPSE_OQ_0>[a-zA-Z0-9 ]{1,11}) +\| (?P<LPSE_OQ_1>[a-zA-Z0-9 ]{1,11}) +\| (?P<OQ_2>[a-zA-Z0-9 ]{1,11}) +\| (?P<OQ_3>[a-zA-Z0-9 ]{1,11}) +\| (?P<OQ_4>[a-zA-Z0-9 ]{1,11}) +\| (?P<OQ_5>[a-zA-Z0-9 ]{1,11}) +\| (?P<OQ_6>[a-zA-Z0-9 ]{1,11}) +\| (?P<OQ_7>[a-zA-Z0-9 ]{1,11})"
         )
 
@@ -392,83 +393,83 @@ class ShowPlatformHardwareFedActiveQosScheduleInterface(
         # | Transmit PIR      || 20000000000      | 20000000000      |
         # | Transmit Burst    || SDK Default      | SDK Default      |
         # | LPSE OID          || 3138 (0xC42  )                      |
-        p14_1 = re.compile(
+        p14_1 = regex_engine.compile(
             r"\| (?P<OQ_Number>[\w+ ]{1,14}) +\|\| (?P<LPSE_OQ_0>[a-zA-Z0-9 ]{1,11}) +\| (?P<LPSE_OQ_1>[a-zA-Z0-9 ]{1,11})"
         )
 
         # | LPSE OID          || 3138 (0xC42  )
-        p15 = re.compile(r"\| LPSE OID +\|\| (?P<LPSE_OID>\d+)")
+        p15 = regex_engine.compile(r"\| LPSE OID +\|\| (?P<LPSE_OID>\d+)")
 
         # | LPSE OID                            : 3138 (  0xC42)
-        p16 = re.compile(r"\| LPSE OID +: (?P<LPSE_OID>\d+)")
+        p16 = regex_engine.compile(r"\| LPSE OID +: (?P<LPSE_OID>\d+)")
 
         # | LPSE CIR (Priority Queue) Rate      : 2000000000
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"\| LPSE CIR \(Priority Queue\) Rate +: (?P<LPSE_CIR_Rate>\d+)"
         )
 
         # | LPSE CIR (Priority Queue) Burst     : SDK Default
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"\| LPSE CIR \(Priority Queue\) Burst +: (?P<LPSE_CIR_Burst>[\w+ ]{1,11})"
         )
 
         # | LPSE PIR (Sub-Interface Port) Rate  : 2000000000
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"\| LPSE PIR \(Sub-Interface Port\) Rate  : (?P<LPSE_PIR_Rate>\d+)"
         )
 
         # | LPSE PIR (Sub-Interface Port) Burst : SDK Default
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r"\| LPSE PIR (Sub-Interface Port) Burst : (?P<LPSE_PIR_Burst>[\w+ ]{1,11})"
         )
 
         # | LPSE Main Interface OQSE  : 3130 (0xC3A  )   | 3131 (0xC3B  )   |
-        p21 = re.compile(r"\| LPSE Main Interface OQSE  : (?P<LPSE_Main_Int>\d+)")
+        p21 = regex_engine.compile(r"\| LPSE Main Interface OQSE  : (?P<LPSE_Main_Int>\d+)")
 
         # | LPSE OQSE Credit CIR      : 60000000000      | 60000000000      |
-        p22 = re.compile(r"\| LPSE OQSE Credit CIR +: (?P<LPSE_OQSE_CIR>\d+)")
+        p22 = regex_engine.compile(r"\| LPSE OQSE Credit CIR +: (?P<LPSE_OQSE_CIR>\d+)")
 
         # | LPSE OQSE Credit CIR Burst: SDK Default      | SDK Default      |
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r"\| LPSE OQSE Credit CIR Burst: (?P<LPSE_OQSE_CIR_Burst>[\w+ ]{1,11})"
         )
 
         # | LPSE OQSE Credit PIR      : 60000000000      | 60000000000      |
-        p24 = re.compile(r"\| LPSE OQSE Credit PIR +: (?P<LPSE_OQSE_PIR>\d+)")
+        p24 = regex_engine.compile(r"\| LPSE OQSE Credit PIR +: (?P<LPSE_OQSE_PIR>\d+)")
 
         # | LPSE OQSE Credit PIR Burst: SDK Default      | SDK Default      |
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r"\| LPSE OQSE Credit PIR Burst: (?P<LPSE_OQSE_PIR_Burst>[\w+ ]{1,11})"
         )
 
         # | LPSE Total Attached OQSEs : 2
-        p26 = re.compile(r"\| LPSE Total Attached OQSEs : (?P<LPSE_Total>\d+)")
+        p26 = regex_engine.compile(r"\| LPSE Total Attached OQSEs : (?P<LPSE_Total>\d+)")
         # | OQSE OID              : 4234
-        p27 = re.compile(r"\| OQSE OID\s+: (?P<oqse_oid>\d+)")
+        p27 = regex_engine.compile(r"\| OQSE OID\s+: (?P<oqse_oid>\d+)")
 
         # | OQ    ID              : 0
-        p28 = re.compile(r"\| OQ    ID\s+: (?P<oq_id>\d+)")
+        p28 = regex_engine.compile(r"\| OQ    ID\s+: (?P<oq_id>\d+)")
 
         # | Scheduling Mode       : Logical Port SP WFQ
-        p29 = re.compile(r"\| Scheduling Mode\s+: (?P<oq_scheduling_mode>\w+)")
+        p29 = regex_engine.compile(r"\| Scheduling Mode\s+: (?P<oq_scheduling_mode>\w+)")
 
         # | Credit CIR            : 2000000000
-        p30 = re.compile(r"\| Credit CIR\s+: (?P<oq_credit_cir>\d+)")
+        p30 = regex_engine.compile(r"\| Credit CIR\s+: (?P<oq_credit_cir>\d+)")
 
         # | Credit CIR Burst      : SDK Default
-        p31 = re.compile(r"\| Credit CIR Burst\s+:(?P<oq_credit_cir_burst>\w+)")
+        p31 = regex_engine.compile(r"\| Credit CIR Burst\s+:(?P<oq_credit_cir_burst>\w+)")
 
         # | Credit PIR            : 2000000000
-        p32 = re.compile(r"\| Credit PIR\s+: (?P<oq_credit_pir>\w+)")
+        p32 = regex_engine.compile(r"\| Credit PIR\s+: (?P<oq_credit_pir>\w+)")
 
         # | Credit PIR Burst      : SDK Default
-        p33 = re.compile(r"\| Credit PIR Burst\s+: (?P<oq_credit_pir_burst>\w+)")
+        p33 = regex_engine.compile(r"\| Credit PIR Burst\s+: (?P<oq_credit_pir_burst>\w+)")
 
         # | Transmit PIR          : 60000000000
-        p34 = re.compile(r"\| Transmit PIR\s+: (?P<oq_transmit_pir>\d+)")
+        p34 = regex_engine.compile(r"\| Transmit PIR\s+: (?P<oq_transmit_pir>\d+)")
 
         # | Transmit PIR Burst    : SDK Default
-        p35 = re.compile(r"\| Transmit PIR Burst\s+: (?P<oq_transmit_pir_burst>\d+)")
+        p35 = regex_engine.compile(r"\| Transmit PIR Burst\s+: (?P<oq_transmit_pir_burst>\d+)")
 
         flag_CIR = 0
         for line in output.splitlines():
@@ -860,12 +861,12 @@ class ShowPlatformHardwareFedActiveQosQueueStats(
         7       0                    0                    0                    0                    0
        """
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<Q>\d)\s+(?P<buffers_count>\d+)\s+(?P<enqueue_th0>\d+)\s+(?P<enqueue_th1>\d+)\s+(?P<enqueue_th2>\d+)\s+(?P<qpolicer>\d+)$"
         )
 
         #  Q Buffers          Enqueue-TH0          Enqueue-TH1          Enqueue-TH2
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r"^(?P<Q>\d)\s+(?P<buffers_count>\d+)\s+(?P<enqueue_th0>\d+)\s+(?P<enqueue_th1>\d+)\s+(?P<enqueue_th2>\d+)$"
         )
 
@@ -884,20 +885,20 @@ class ShowPlatformHardwareFedActiveQosQueueStats(
         7                    0                    0                    0                    0                    0                    0
         """
 
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<Q>\d)\s+(?P<drop_th0>\d+)\s+(?P<drop_th1>\d+)\s+(?P<drop_th2>\d+)\s+(?P<sbufDrop>\d+)\s+(?P<qebDrop>\d+)\s+(?P<qpolicerDrop>\d+)$"
         )
 
         # Queue Drop-TH0 Drop-TH1 Drop-TH2 SBufDrop QebDrop
-        p2_1 = re.compile(
+        p2_1 = regex_engine.compile(
             r"^(?P<Q>\d)\s+(?P<drop_th0>\d+)\s+(?P<drop_th1>\d+)\s+(?P<drop_th2>\d+)\s+(?P<sbufDrop>\d+)\s+(?P<qebDrop>\d+)$"
         )
 
         # AQM Global counters
-        p3 = re.compile(r"^AQM Global counters$")
+        p3 = regex_engine.compile(r"^AQM Global counters$")
 
         # Asic:1 Core:0 DATA Port:8 Hardware Drop Counters
-        p4 = re.compile(r"^Asic:.*Hardware Drop Counters$")
+        p4 = regex_engine.compile(r"^Asic:.*Hardware Drop Counters$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1059,7 +1060,7 @@ class ShowPlatformHardwareFedActiveQosQueuelabel2qmapQmapegressdataInterface(
         0   1         2   0         1   1         2   0         2   1         2   0
         3   1         2   0         4   1         2   0         5   1         2   0
         """
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"(?P<Label>\d+)\s+(?P<Q>\d+)\s+(?P<Threshold>\d+)\s+(?P<VQ>\d+)\s+"
             + r"(?P<Label1>\d+)\s+(?P<Q1>\d+)\s+(?P<Threshold1>\d+)\s+(?P<VQ1>\d+)\s+"
             + r"(?P<Label2>\d+)\s+(?P<Q2>\d+)\s+(?P<Threshold2>\d+)\s+(?P<VQ2>\d+)"
@@ -1140,7 +1141,7 @@ class ShowPlatformHardwareFedSwitchActiveFwdResourceUtilizationLabel(
         # initial return dictionary
         ret_dict = {}
         # RSC_LABEL_STACK_ID           6       65531
-        p1 = re.compile(r"(?P<resource_name>\S+)\s+(?P<allocated>\d+)\s+(?P<free>\d+)$")
+        p1 = regex_engine.compile(r"(?P<resource_name>\S+)\s+(?P<allocated>\d+)\s+(?P<free>\d+)$")
         for line in output.splitlines():
             line = line.strip()
             m = p1.match(line)
@@ -1251,31 +1252,31 @@ class ShowPlatformHardwareFedActiveQosQueueConfigInterface(
         Asic:1 Core:1 DATA Port:70 GPN:325 LinkSpeed:0xa
         AFD:Disabled FlatAFD:Disabled QoSMap:0 HW Queues: 560 - 567
         """
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Asic:(?P<asic>\d+)\s+Core:(?P<core>\d+)\s+DATA Port:(?P<data_port>\d+)\s+GPN:(?P<gpn>\d+)\s+LinkSpeed:(?P<linkspeed>\S+)$"
         )
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^AFD:(?P<afd>\S+)\s+FlatAFD:(?P<flatafd>\S+)\s+QoSMap:(?P<qosmap>\d+)\s+HW Queues:\s*(?P<hw_queue1>\d+)\s*-\s*(?P<hw_queue2>\d+)$"
         )
 
         """
         DATA Port:0 GPN:97 AFD:Disabled QoSMap:0 HW Queues: 0 - 7
         """
-        p2_1 = re.compile(
+        p2_1 = regex_engine.compile(
             r"^DATA Port:(?P<data_port>\d+)\s+GPN:(?P<gpn>\d+)\s+AFD:(?P<afd>\S+)\s+QoSMap:(?P<qosmap>\d+)\s+HW Queues:\s*(?P<hw_queue1>\d+)\s*-\s*(?P<hw_queue2>\d+)$"
         )
 
         """
         DrainFast:Disabled PortSoftStart:3 - 42000 BufferSharing:Disabled
         """
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^DrainFast:(?P<drainfast>\S+)\s+PortSoftStart:(?P<portsoftstart1>\d+)\s*-\s*(?P<portsoftstart2>\d+)\s+BufferSharing:(?P<buffersharing>\S+)$"
         )
 
         """
         DrainFast:Disabled PortSoftStart:2 - 2016
         """
-        p3_1 = re.compile(
+        p3_1 = regex_engine.compile(
             r"^DrainFast:(?P<drainfast>\S+)\s+PortSoftStart:(?P<portsoftstart1>\d+)\s*-\s*(?P<portsoftstart2>\d+)$"
         )
 
@@ -1285,7 +1286,7 @@ class ShowPlatformHardwareFedActiveQosQueueConfigInterface(
         0   1  2   224   5 42000   0     0   0     0   1 42000      En
         1   1  0     0   5 42000   1  1312   0     0   1 42000      En
         """
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^(?P<q_no>\d+)\s+(?P<dts>\d+)\s+(\d+)\s+(?P<hardmax>\d+)\s+"
             r"(\d+)\s+(?P<softmax>\d+)\s+(\d+)\s+(?P<portsmin>\d+)\s+(\d+)\s+(?P<glblsmin>\d+)\s+"
             r"(\d+)\s+(?P<portstend>\d+)\s+(?P<qenable>\S+)$"
@@ -1297,7 +1298,7 @@ class ShowPlatformHardwareFedActiveQosQueueConfigInterface(
         0   1  2   224   5 42000   0     0   0     0   1 42000
         1   1  0     0   5 42000   1  1312   0     0   1 42000
         """
-        p4_1 = re.compile(
+        p4_1 = regex_engine.compile(
             r"^(?P<q_no>\d+)\s+(?P<dts>\d+)\s+(\d+)\s+(?P<hardmax>\d+)\s+"
             r"(\d+)\s+(?P<softmax>\d+)\s+(\d+)\s+(?P<portsmin>\d+)\s+(\d+)\s+(?P<glblsmin>\d+)\s+"
             r"(\d+)\s+(?P<portstend>\d+)$"
@@ -1309,7 +1310,7 @@ class ShowPlatformHardwareFedActiveQosQueueConfigInterface(
         0      0     Shared            50           0           0
 
         """
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^(?P<q_no>\d+)\s+(?P<priority>\d+)\s+(?P<mode>\S+)\s+"
             r"(?P<weight>\d+)\s+(?P<shaping_step>\d+)\s+(?P<sharpedweight>\d+)$"
         )
@@ -1320,7 +1321,7 @@ class ShowPlatformHardwareFedActiveQosQueueConfigInterface(
         0      0     Shared            50           0
 
         """
-        p5_1 = re.compile(
+        p5_1 = regex_engine.compile(
             r"^(?P<q_no>\d+)\s+(?P<priority>\d+)\s+(?P<mode>\S+)\s+"
             r"(?P<weight>\d+)\s+(?P<shaping_step>\d+)$"
         )
@@ -1332,7 +1333,7 @@ class ShowPlatformHardwareFedActiveQosQueueConfigInterface(
         1       0   33468       0       0   37406       0       0   42000       0
 
         """
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^(?P<q_no>\d+)\s+(?P<weight0>\d+)\s+(?P<max_th0>\d+)\s+(?P<min_th0>\d+)\s+"
             r"(?P<weight1>\d+)\s+(?P<max_th1>\d+)\s+(?P<min_th1>\d+)\s+"
             r"(?P<weight2>\d+)\s+(?P<max_th2>\d+)\s+(?P<min_th2>\d+)$"
@@ -1353,10 +1354,10 @@ class ShowPlatformHardwareFedActiveQosQueueConfigInterface(
 
 
         """
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^(?P<priority>\d+)\s+(?P<mode>\S+)\s+(?P<weight>\d+)\s+(?P<step>\d+)\s+(?P<s_weight>\d+)$"
         )
-        p7_1 = re.compile(
+        p7_1 = regex_engine.compile(
             r"^(?P<priority>\d+)\s+(?P<mode>\S+)\s+(?P<weight>\d+)\s+(?P<step>\d+)$"
         )
 
@@ -1575,10 +1576,10 @@ class ShowPlatformHardwareFedSwitchResourceUtilization(
             output = self.device.execute(cmd)
 
         # Resource Info for ASIC Instance:    0
-        p1 = re.compile(r"^Resource Info for ASIC Instance:\s+(?P<asic_instance>\d+)$")
+        p1 = regex_engine.compile(r"^Resource Info for ASIC Instance:\s+(?P<asic_instance>\d+)$")
 
         # RSC_DI                     149       41525
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<resource_name>\w+)\s+(?P<allocated>\d+)\s+(?P<free>\d+)$"
         )
 
@@ -1650,11 +1651,11 @@ class ShowPlatformHardwareFedSwitchActiveQosDscpCosCountersInterface(
             output = self.device.execute(cmd)
 
         #               Frames        Bytes
-        p0 = re.compile(r"^(?P<heading>\AFrames[\s]+ +Bytes)$")
+        p0 = regex_engine.compile(r"^(?P<heading>\AFrames[\s]+ +Bytes)$")
 
         # Ingress DSCP0 0             0
         # Egress DSCP0 0             0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<direction>\w+)\s+(?P<qos>\S+)\s+(?P<frames>\d+)\s+(?P<bytes>\d+)$"
         )
 
@@ -1711,11 +1712,11 @@ class ShowPlatformHardwareFedSwitchActiveQosDscpCosCountersInterface(
             output = self.device.execute(cmd)
 
         #               Frames        Bytes
-        p0 = re.compile(r"^(?P<heading>\AFrames[\s]+ +Bytes)$")
+        p0 = regex_engine.compile(r"^(?P<heading>\AFrames[\s]+ +Bytes)$")
 
         # Ingress DSCP0 0             0
         # Egress DSCP0 0             0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<direction>\w+)\s+(?P<qos>\S+)\s+(?P<frames>\d+)\s+(?P<bytes>\d+)$"
         )
 
@@ -1865,235 +1866,235 @@ class ShowPlatformHardwareFedQosSchedulerSdkInterface(
             output = self.device.execute(cmd)
 
         # Interface              : HundredGigE1/0/5 (0x54A)
-        p0 = re.compile(r"^Interface\s+: (?P<interface>\S+) \((?P<interface_id>\S+)\)$")
+        p0 = regex_engine.compile(r"^Interface\s+: (?P<interface>\S+) \((?P<interface_id>\S+)\)$")
 
         # Port Scheduler Configuration
-        p1_0 = re.compile(r"^Port Scheduler Configuration$")
+        p1_0 = regex_engine.compile(r"^Port Scheduler Configuration$")
 
         # Interface SCH OID     : 1343 (  0x53F)
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r"^Interface SCH OID\s+: (?P<interface_sch_oid>\d+)\s+\(\s*(?P<interface_sch_id>\S+)\)$"
         )
 
         # System Port SCH OID   : 1347 (  0x543)
         # System Port SCH OID   : 746  (  0x2EA)
-        p1_2 = re.compile(
+        p1_2 = regex_engine.compile(
             r"^System Port SCH OID\s+: (?P<system_port_sch_oid>\d+)\s+\(\s*(?P<system_port_sch_id>\S+)\)$"
         )
 
         # Priority Propagation  : Disabled
-        p1_3 = re.compile(r"^Priority Propagation\s+: (?P<priority_propagation>\w+)$")
+        p1_3 = regex_engine.compile(r"^Priority Propagation\s+: (?P<priority_propagation>\w+)$")
 
         # Sub-interface Q Mode  : Disabled - No Priority Propagation
-        p1_4 = re.compile(r"^Sub-interface Q Mode  : (?P<sub_interface_q_mode>.+)$")
+        p1_4 = regex_engine.compile(r"^Sub-interface Q Mode  : (?P<sub_interface_q_mode>.+)$")
 
         # Logical Port          : Enabled
-        p1_5 = re.compile(r"^Logical Port\s+: (?P<logical_port>\w+)$")
+        p1_5 = regex_engine.compile(r"^Logical Port\s+: (?P<logical_port>\w+)$")
 
         # TC Profile            : SDK OID    :   209
-        p1_6 = re.compile(r"^TC Profile\s+: SDK OID\s+:\s+(?P<sdk_oid>\d+)$")
+        p1_6 = regex_engine.compile(r"^TC Profile\s+: SDK OID\s+:\s+(?P<sdk_oid>\d+)$")
 
         # : TC         : TC0 | TC1 | TC2 | TC3 | TC4 | TC5 | TC6 | TC7
-        p1_7 = re.compile(r"^: TC         : (?P<tc>[\w\s\|]+)$")
+        p1_7 = regex_engine.compile(r"^: TC         : (?P<tc>[\w\s\|]+)$")
 
         # : VOQ Offset :   0 |   1 |   2 |   3 |   4 |   5 |   6 |   7
-        p1_8 = re.compile(r"^: VOQ Offset :\s+(?P<voq_offset>[\d\s\|]+)$")
+        p1_8 = regex_engine.compile(r"^: VOQ Offset :\s+(?P<voq_offset>[\d\s\|]+)$")
 
         # Interface Scheduler Configuration
-        p2_0 = re.compile(r"^Interface Scheduler Configuration$")
+        p2_0 = regex_engine.compile(r"^Interface Scheduler Configuration$")
 
         # Credit        : 12000081000
-        p2_1 = re.compile(r"^Credit\s+: (?P<credit>\d+)$")
+        p2_1 = regex_engine.compile(r"^Credit\s+: (?P<credit>\d+)$")
 
         # CIR [RR]  | Transmit      : 12000081000
         # PIR [WFQ] | Transmit      : 12000081000
-        p2_2 = re.compile(
+        p2_2 = regex_engine.compile(
             r"^(?P<interface_scheduler>\w+) \[.+\]\s+\| Transmit\s+: (?P<transmit>\d+)$"
         )
 
         # Weight        : 1
-        p2_3 = re.compile(r"^Weight\s+: (?P<weight>\d+)$")
+        p2_3 = regex_engine.compile(r"^Weight\s+: (?P<weight>\d+)$")
 
         # Interface Scheduler - OQPG  Configuration
-        p3_0 = re.compile(r"^Interface Scheduler - OQPG  Configuration$")
+        p3_0 = regex_engine.compile(r"^Interface Scheduler - OQPG  Configuration$")
 
         # PG TYPE           || OQPG-0           | OQPG-1           | OQPG-2           | OQPG-3
         #            | OQPG-4           | OQPG-5           | OQPG-6           | OQPG-7
-        p3_1 = re.compile(r"PG TYPE           \|\| (?P<oqpg>[OQPG\-\d\s\|]+)")
+        p3_1 = regex_engine.compile(r"PG TYPE           \|\| (?P<oqpg>[OQPG\-\d\s\|]+)")
 
         # Credit CIR    || 0                | 0                | 0                | 0
         # | 0                | 0                | 0                | SDK Default
-        p3_2 = re.compile(r"^Credit CIR\s+\|\| (?P<credit_cir>[\w\|\s]+)$")
+        p3_2 = regex_engine.compile(r"^Credit CIR\s+\|\| (?P<credit_cir>[\w\|\s]+)$")
 
         # RR |Credit Burst  || 0                | 0                | 0                | 0
         # | 0                | 0                | 0                | 30
-        p3_3 = re.compile(r"^RR \|Credit Burst\s+\|\| (?P<credit_burst>[\w\|\s]+)$")
+        p3_3 = regex_engine.compile(r"^RR \|Credit Burst\s+\|\| (?P<credit_burst>[\w\|\s]+)$")
 
         # Transmit CIR  || 0                | 0                | 0                | 0
         #                 | 0                | 0                | 0                | SDK Default
-        p3_4 = re.compile(
+        p3_4 = regex_engine.compile(
             r"^(?P<transmit_type>Transmit CIR\s+|Transmit Burst)\|\| (?P<transmit_values>[\w\|\s]+)$"
         )
 
         # WFQ|Weights PIR  || 0                | 0                | 0                | 0
         # | 0                | 0                | 0                | 30
-        p3_5 = re.compile(r"^WFQ\|Weights PIR\s+\|\| (?P<weights_pir>[\w\|\s]+)$")
+        p3_5 = regex_engine.compile(r"^WFQ\|Weights PIR\s+\|\| (?P<weights_pir>[\w\|\s]+)$")
 
         # Weights Actual|| 63               | 63               | 63               | 63
         #                | 63               | 63               | 63               | 63
-        p3_6 = re.compile(r"^Weights Actual\|\| (?P<weights_actual>[\w\|\s]+)$")
+        p3_6 = regex_engine.compile(r"^Weights Actual\|\| (?P<weights_actual>[\w\|\s]+)$")
 
         # OQ List           || 0                |                  |                  |
         #                   |                  |                  |                  | 1 2 3 4 5 6 7
-        p3_7 = re.compile(r"^OQ List\s+\|\| (?P<oq_list>[\d\|\s]+)$")
+        p3_7 = regex_engine.compile(r"^OQ List\s+\|\| (?P<oq_list>[\d\|\s]+)$")
 
         # LPSE/OQSE <->  OQPG  Configuration
-        p4_0 = re.compile(r"^LPSE\/OQSE <\->\s+OQPG\s+Configuration$")
+        p4_0 = regex_engine.compile(r"^LPSE\/OQSE <\->\s+OQPG\s+Configuration$")
 
         # OQ Number         ||    LPSE-OQ-0     |    LPSE-OQ-1     | OQ-2             | OQ-3
         #              | OQ-4             | OQ-5             | OQ-6             | OQ-7
-        p4_1 = re.compile(r"^OQ Number\s+\|\|\s+(?P<oq_number>[LPSE\-OQ\d\|\s]+)$")
+        p4_1 = regex_engine.compile(r"^OQ Number\s+\|\|\s+(?P<oq_number>[LPSE\-OQ\d\|\s]+)$")
 
         # OQPG Associated   || OQPG-0           | OQPG-1           | OQPG-7 [P]       | OQPG-7 [P]
         #        | OQPG-7 [P]       | OQPG-7 [P]       | OQPG-7 [P]       | OQPG-7 [P]
-        p4_2 = re.compile(
+        p4_2 = regex_engine.compile(
             r"^OQPG Associated\s+\|\|(?P<oqpg_associated>[OQPG\-\d\s\[P\]\|]+)$"
         )
 
         # Credit PIR        || SDK Default      | 94921872         | 189843744        | 94921872
         #          | 94921872         | 147656256        | 94921872         | 189843744
-        p4_3 = re.compile(
+        p4_3 = regex_engine.compile(
             r"^(?P<lpse_type>Credit PIR|Credit Burst|Transmit PIR|Transmit Burst)\s+\|\| (?P<lpse_values>[\w\|\s]+)$"
         )
 
         # Weights : UC : MC ||      8 : 2       |      8 : 2       |      8 : 2       |      8 : 2
         #        |      8 : 2       |      8 : 2       |      8 : 2       |      8 : 2
-        p4_4 = re.compile(r"^Weights : UC : MC \|\|\s+(?P<uc_mc>[\d:\s\|]+)$")
+        p4_4 = regex_engine.compile(r"^Weights : UC : MC \|\|\s+(?P<uc_mc>[\d:\s\|]+)$")
 
         # OQSE OID          || LPSE OID : 1356 (0x54C  )           | 1350 (0x546  )   | 1351 (0x547  )
         #    | 1352 (0x548  )   | 1353 (0x549  )   | 1354 (0x54A  )   | 1355 (0x54B  )
-        p4_5 = re.compile(
+        p4_5 = regex_engine.compile(
             r"^OQSE OID\s+\|\| LPSE OID : (?P<lpse_oid>\d+) \((?P<lpse_id>\w+)\s*\)\s+\|\s+(?P<oqse_oid>[\d\s\(\)\w\|]+)$"
         )
 
         # LPSE Configuration
-        p5_0 = re.compile(r"^LPSE Configuration$")
+        p5_0 = regex_engine.compile(r"^LPSE Configuration$")
 
         # LPSE OID                  : 1356 (  0x54C)
-        p5_1 = re.compile(r"^LPSE OID\s+: (?P<oid>\d+)\s+\(\s+(?P<id>\w+)\)$")
+        p5_1 = regex_engine.compile(r"^LPSE OID\s+: (?P<oid>\d+)\s+\(\s+(?P<id>\w+)\)$")
 
         # LPSE CIR Weight           :   1 :   1 :   1 :   1 :   1 :   1 :   1 :   1
-        p5_2 = re.compile(r"^LPSE CIR Weight\s+:(?P<cir_weight>[\s\d:]+)$")
+        p5_2 = regex_engine.compile(r"^LPSE CIR Weight\s+:(?P<cir_weight>[\s\d:]+)$")
 
         # LPSE EIR Weight           :   1 :   1 :   1 :   1 :   1 :   1 :   1 :   1
-        p5_3 = re.compile(r"^LPSE EIR Weight\s+:(?P<eir_weight>[\s\d:]+)$")
+        p5_3 = regex_engine.compile(r"^LPSE EIR Weight\s+:(?P<eir_weight>[\s\d:]+)$")
 
         # LPSE Main Interface OQSE  : 1348 (0x544  )   | 1349 (0x545  )
-        p5_4 = re.compile(
+        p5_4 = regex_engine.compile(
             r"^LPSE Main Interface OQSE\s+: (?P<main_interface_oqse>[\d\s\w\(\)\|]+)$"
         )
 
         # LPSE OQSE Credit CIR      : SDK Default      | 94921872
-        p5_5 = re.compile(r"^LPSE OQSE Credit CIR\s+: (?P<oqse_credit_cir>[\w\s\|]+)$")
+        p5_5 = regex_engine.compile(r"^LPSE OQSE Credit CIR\s+: (?P<oqse_credit_cir>[\w\s\|]+)$")
 
         # LPSE OQSE Credit CIR Burst: 0                | 30
-        p5_6 = re.compile(
+        p5_6 = regex_engine.compile(
             r"^LPSE OQSE Credit CIR Burst: (?P<oqse_credit_cir_burst>[\w\s\|]+)$"
         )
 
         # LPSE OQSE Credit PIR      : SDK Default      | 94921872
-        p5_7 = re.compile(r"^LPSE OQSE Credit PIR\s+: (?P<oqse_credit_pir>[\w\s\|]+)$")
+        p5_7 = regex_engine.compile(r"^LPSE OQSE Credit PIR\s+: (?P<oqse_credit_pir>[\w\s\|]+)$")
 
         # LPSE OQSE Credit PIR Burst: 30               | 0
-        p5_8 = re.compile(
+        p5_8 = regex_engine.compile(
             r"^LPSE OQSE Credit PIR Burst: (?P<oqse_credit_pir_burst>[\w\s\|]+)$"
         )
 
         # LPSE Total Attached OQSEs : 2
-        p5_9 = re.compile(r"^LPSE Total Attached OQSEs : (?P<total_attached_oqse>\d+)$")
+        p5_9 = regex_engine.compile(r"^LPSE Total Attached OQSEs : (?P<total_attached_oqse>\d+)$")
 
         # LPSE CIR (Priority Queue) Rate      : SDK Default
-        p5_10 = re.compile(
+        p5_10 = regex_engine.compile(
             r"^LPSE CIR \(Priority Queue\) Rate\s+: (?P<lpse_cir_priority_queue_rate>[\w\s\|]+)$"
         )
 
         # LPSE CIR (Priority Queue) Burst     : 30
-        p5_11 = re.compile(
+        p5_11 = regex_engine.compile(
             r"^LPSE CIR \(Priority Queue\) Burst\s+: (?P<lpse_cir_priority_queue_burst>[\w\s\|]+)$"
         )
 
         # LPSE PIR (Sub-Interface Port) Rate  : SDK Default
-        p5_12 = re.compile(
+        p5_12 = regex_engine.compile(
             r"^LPSE PIR \(Sub\-Interface Port\) Rate\s+: (?P<lpse_pir_sub_interface_port_rate>[\w\s\|]+)$"
         )
 
         # LPSE PIR (Sub-Interface Port) Burst : 30
-        p5_13 = re.compile(
+        p5_13 = regex_engine.compile(
             r"^LPSE PIR \(Sub\-Interface Port\) Burst\s+: (?P<lpse_pir_sub_interface_port_burst>[\w\s\|]+)$"
         )
 
         # OQSE <-> VOQ-VSC Configuration
-        p6_0 = re.compile(r"^OQSE <\-> VOQ\-VSC Configuration$")
+        p6_0 = regex_engine.compile(r"^OQSE <\-> VOQ\-VSC Configuration$")
 
         # OQSE OID              : 1348 (  0x544)
         # OQSE OID              : 749  (  0x2ED)
-        p6_1 = re.compile(
+        p6_1 = regex_engine.compile(
             r"^OQSE OID              : (?P<oqse_oid>\d+)\s+\(\s*(?P<oqse_id>\w+)\)$"
         )
 
         # OQ    ID              : 0
-        p6_2 = re.compile(r"^OQ    ID              : (?P<oq_id>\d+)$")
+        p6_2 = regex_engine.compile(r"^OQ    ID              : (?P<oq_id>\d+)$")
 
         # Scheduling Mode       : Logical Port SP SP
-        p6_3 = re.compile(r"^Scheduling Mode       : (?P<scheduling_mode>.+)$")
+        p6_3 = regex_engine.compile(r"^Scheduling Mode       : (?P<scheduling_mode>.+)$")
 
         # Credit CIR            : SDK Default
         # Credit PIR            : 189843744
         # Transmit PIR          : 232031248
-        p6_4 = re.compile(
+        p6_4 = regex_engine.compile(
             r"^(?P<cir_pir>(Credit|Transmit) (CIR|PIR))\s+: (?P<credit>.+)$"
         )
 
         # Credit CIR Burst      : 0
         # Credit PIR Burst      : 30
         # Transmit PIR Burst    : 30
-        p6_5 = re.compile(
+        p6_5 = regex_engine.compile(
             r"^(?P<cir_pir>(Credit|Transmit) (CIR|PIR) Burst)\s+: (?P<credit_burst>.+)$"
         )
 
         # RR Weights            :   1 :   1 :   1 :   1 : N/A : N/A : N/A : N/A
-        p6_6 = re.compile(r"^RR Weights            :\s+(?P<rr_weights>[\w\s:\/]+)$")
+        p6_6 = regex_engine.compile(r"^RR Weights            :\s+(?P<rr_weights>[\w\s:\/]+)$")
 
         # RR Weights Actual     : 255 : 255 : 255 : 255 : N/A : N/A : N/A : N/A
-        p6_7 = re.compile(
+        p6_7 = regex_engine.compile(
             r"^RR Weights Actual\s+:\s+(?P<rr_weights_actual>[\w\s:\/]+)$"
         )
 
         # RR3      || In Device |                    0 |                    0 |                    0 |
         #                     0 |                    0 |                    0
-        p6_8 = re.compile(
+        p6_8 = regex_engine.compile(
             r"^(?P<rr>RR\d+)      \|\| In Device \|\s+(?P<in_device>[\w\s\|]+)$"
         )
 
         # In Slice  |                    0 |                    1 |                    2 |
         #                     3 |                    4 |                    5
-        p6_9 = re.compile(r"^In Slice\s+\|\s+(?P<in_slice>[\w\s\|]+)$")
+        p6_9 = regex_engine.compile(r"^In Slice\s+\|\s+(?P<in_slice>[\w\s\|]+)$")
 
         # VSC ID    |                  352 |                  416 |                  480 |
         #                   544 |                  608 |                  672
-        p6_10 = re.compile(r"^VSC ID\s+\|\s+(?P<vsc_id>[\w\s\|]+)$")
+        p6_10 = regex_engine.compile(r"^VSC ID\s+\|\s+(?P<vsc_id>[\w\s\|]+)$")
 
         # VOQ ID    |                52576 |                52576 |                52576 |
         #                 52576 |                52576 |                52576
-        p6_11 = re.compile(r"^VOQ ID\s+\|\s+(?P<voq_id>[\w\s\|]+)$")
+        p6_11 = regex_engine.compile(r"^VOQ ID\s+\|\s+(?P<voq_id>[\w\s\|]+)$")
 
         # VSC PIR   |        2678399959040 |        2678399959040 |        2678399959040 |
         #         2678399959040 |        2678399959040 |        2678399959040
-        p6_12 = re.compile(r"^VSC PIR\s+\|\s+(?P<vsc_pir>[\w\s\|]+)$")
+        p6_12 = regex_engine.compile(r"^VSC PIR\s+\|\s+(?P<vsc_pir>[\w\s\|]+)$")
 
         # VSC Burst |                  511 |                  511 |                  511 |
         #                   511 |                  511 |                  511
-        p6_13 = re.compile(r"^VSC Burst\s+\|\s+(?P<vsc_burst>[\w\s\|]+)$")
+        p6_13 = regex_engine.compile(r"^VSC Burst\s+\|\s+(?P<vsc_burst>[\w\s\|]+)$")
 
         ret_dict = {}
 
@@ -2154,7 +2155,7 @@ class ShowPlatformHardwareFedQosSchedulerSdkInterface(
                 continue
 
             # Logical Port          : Enabled
-            p1_5 = re.compile(r"^Logical Port\s+: (?P<logical_port>\w+)$")
+            p1_5 = regex_engine.compile(r"^Logical Port\s+: (?P<logical_port>\w+)$")
             m = p1_5.match(line)
             if m:
                 port_schedule_dict["logical_port"] = m.groupdict()["logical_port"]
@@ -2719,20 +2720,20 @@ class ShowPlatformHardwareFedQosQueueStatsOqMulticast(
             output = self.device.execute(cmd)
 
         # Multicast OQ stats for : HundredGigE1/0/5, oq_id:7
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Multicast OQ stats for : (?P<interface>\S+), oq_id:(?P<oq_id>\d+)$"
         )
 
         # |          |              Packets              |               Bytes               |
-        p2 = re.compile(r"^\|\s+\|\s+Packets\s+\|\s+Bytes\s+\|$")
+        p2 = regex_engine.compile(r"^\|\s+\|\s+Packets\s+\|\s+Bytes\s+\|$")
 
         # | Enqueued |                         452993529 |                      469432571476 |
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^\|\s+Enqueued\s+\|\s+(?P<packets>\d+)\s+\|\s+(?P<bytes>\d+)\s+\|$"
         )
 
         # | Dropped  |                           1457949 |                       44346943560 |
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^\|\s+Dropped\s+\|\s+(?P<packets>\d+)\s+\|\s+(?P<bytes>\d+)\s+\|$"
         )
 
@@ -2886,129 +2887,129 @@ class ShowPlatformHardwareFedSwitchQosQueueConfig(
             output = self.device.execute(cmd)
 
             # Interface : HundredGigE2/0/34.100 (0x54C)
-            p0 = re.compile(
+            p0 = regex_engine.compile(
                 r"^Interface\s+: (?P<interface>\S+) \((?P<interface_id>\S+)\)$"
             )
 
             # VOQ OID        : 2114(0x842)
-            p1 = re.compile(r"^VOQ OID\s+: (?P<voq_oid>\S+)\((?P<voq_id>\S+)\)$")
+            p1 = regex_engine.compile(r"^VOQ OID\s+: (?P<voq_oid>\S+)\((?P<voq_id>\S+)\)$")
 
             # VOQ Set Size   : 3
-            p2 = re.compile(r"^VOQ Set Size\s+: (?P<voq_set_size>\S+)$")
+            p2 = regex_engine.compile(r"^VOQ Set Size\s+: (?P<voq_set_size>\S+)$")
 
             # Base VOQ ID    : 28952
-            p3 = re.compile(r"^Base VOQ ID\s+: (?P<base_voq_id>\S+)$")
+            p3 = regex_engine.compile(r"^Base VOQ ID\s+: (?P<base_voq_id>\S+)$")
 
             # Base VSC IDs   : 728, 792, 856, 920, 984, 1048
-            p4 = re.compile(r"^Base VSC IDs\s+: (?P<base_vsc_ids>[\w\s\,]+)$")
+            p4 = regex_engine.compile(r"^Base VSC IDs\s+: (?P<base_vsc_ids>[\w\s\,]+)$")
 
             # VOQ State      : Active
-            p5 = re.compile(r"^VOQ State\s+: (?P<voq_state>\S+)$")
+            p5 = regex_engine.compile(r"^VOQ State\s+: (?P<voq_state>\S+)$")
 
             # VOQ Flush      : Flush not active
-            p6 = re.compile(r"^VOQ Flush\s+: (?P<voq_flush>.+)$")
+            p6 = regex_engine.compile(r"^VOQ Flush\s+: (?P<voq_flush>.+)$")
 
             # Is Empty       : Yes
-            p7 = re.compile(r"^Is Empty\s+: (?P<is_empty>.+)$")
+            p7 = regex_engine.compile(r"^Is Empty\s+: (?P<is_empty>.+)$")
 
             # Profile OID            : 433(0x1B1)
-            p8_1 = re.compile(
+            p8_1 = regex_engine.compile(
                 r"^Profile OID\s+: (?P<profile_oid>\d+)\((?P<profile_id>\w+)\)$"
             )
 
             # Device ID              : 0
-            p9 = re.compile(r"^Device ID\s+: (?P<device_id>\d+)$")
+            p9 = regex_engine.compile(r"^Device ID\s+: (?P<device_id>\d+)$")
 
             # CGM Type               : Unicast
-            p10 = re.compile(r"^CGM Type\s+: (?P<cgm_type>\w+)$")
+            p10 = regex_engine.compile(r"^CGM Type\s+: (?P<cgm_type>\w+)$")
 
             # Profile reference count: 73
-            p11 = re.compile(
+            p11 = regex_engine.compile(
                 r"^Profile reference count\s*: (?P<profile_reference_count>\d+)$"
             )
 
             # Is Reserved            : Yes
-            p12 = re.compile(r"^Is Reserved\s+: (?P<is_reserved>[\w\s]+)$")
+            p12 = regex_engine.compile(r"^Is Reserved\s+: (?P<is_reserved>[\w\s]+)$")
 
             # For speeds             : 10000000000
-            p13 = re.compile(r"^For speeds\s+: (?P<for_speeds>\d+)$")
+            p13 = regex_engine.compile(r"^For speeds\s+: (?P<for_speeds>\d+)$")
 
             # Associated VOQ Offsets : 0
-            p14 = re.compile(
+            p14 = regex_engine.compile(
                 r"^Associated VOQ Offsets\s+: (?P<associated_voq_offsets>[\d, ]+)$"
             )
 
             # HBM Enabled            : Enabled
-            p15 = re.compile(r"^HBM Enabled\s+: (?P<hbm_enabled>\w+)$")
+            p15 = regex_engine.compile(r"^HBM Enabled\s+: (?P<hbm_enabled>\w+)$")
 
             # HBM Block Size         : 6144
-            p16 = re.compile(r"^HBM Block Size\s+: (?P<hgm_block_size>\w+)$")
+            p16 = regex_engine.compile(r"^HBM Block Size\s+: (?P<hgm_block_size>\w+)$")
 
             # RED Enabled            : Enabled
-            p17 = re.compile(r"^RED Enabled\s+: (?P<red_enabled>\w+)$")
+            p17 = regex_engine.compile(r"^RED Enabled\s+: (?P<red_enabled>\w+)$")
 
             # FCN Enabled            : Disabled
-            p18 = re.compile(r"^FCN Enabled\s+: (?P<fcn_enabled>\w+)$")
+            p18 = regex_engine.compile(r"^FCN Enabled\s+: (?P<fcn_enabled>\w+)$")
 
             # Queue User Config      :
-            p19 = re.compile(r"^Queue User Config\s+:$")
+            p19 = regex_engine.compile(r"^Queue User Config\s+:$")
 
             # Q-Limit(HBM Blocks)    : 4882
-            p19_1 = re.compile(
+            p19_1 = regex_engine.compile(
                 r"^Q-Limit\(HBM Blocks\)\s+: (?P<q_limit_hbm_blocks>\d+)$"
             )
 
             # RED EMA Coefficient    : 1.000000
-            p19_2 = re.compile(
+            p19_2 = regex_engine.compile(
                 r"^RED EMA Coefficient\s+: (?P<red_ema_coefficient>[\w\.]+)$"
             )
 
             # RED Green :
-            p19_3 = re.compile(r"^RED\s+(?P<red_flag>[\w\s]+)\s+:$")
+            p19_3 = regex_engine.compile(r"^RED\s+(?P<red_flag>[\w\s]+)\s+:$")
 
             # Minium(HBM BLOCKS)   : 0
-            p19_4 = re.compile(
+            p19_4 = regex_engine.compile(
                 r"^Minium\(HBM BLOCKS\)\s*: (?P<minimun_hbm_blocks>\d+)$"
             )
 
             # Maximum(HBM BLOCKS)  : 1220
-            p19_5 = re.compile(
+            p19_5 = regex_engine.compile(
                 r"^Maximum\(HBM BLOCKS\)\s*: (?P<maximum_hbm_blocks>\d+)$"
             )
 
             # Maximum Probability  : 0
-            p19_6 = re.compile(
+            p19_6 = regex_engine.compile(
                 r"^Maximum Probability\s*: (?P<maximum_probability>\d+)$"
             )
 
             # Queue H/W Values       :
-            p20 = re.compile(r"^Queue H/W Values\s+:$")
+            p20 = regex_engine.compile(r"^Queue H/W Values\s+:$")
 
             # RED Action                     : Drop
-            p20_1 = re.compile(r"^RED Action\s+: (?P<red_action>\w+)$")
+            p20_1 = regex_engine.compile(r"^RED Action\s+: (?P<red_action>\w+)$")
 
             # RED Drop thresholds            : 0, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220, 1220
-            p20_2 = re.compile(
+            p20_2 = regex_engine.compile(
                 r"^RED Drop thresholds\s+: (?P<red_drop_thresholds>[\w\s\,]+)$"
             )
 
             # RED Drop Probabilities[Green]  : 0.000000, 0.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000, 1.000000
-            p20_3 = re.compile(
+            p20_3 = regex_engine.compile(
                 r"^RED Drop Probabilities\[(?P<red_flag>[\w]+)\]\s+: (?P<red_drop_probabilities>[\w\s\,\.]+)$"
             )
 
             # HBM Free Thresholds            : 10000, 20000, 40000, 60000, 124992, 250000, 500000, 1000000
-            p20_4 = re.compile(
+            p20_4 = regex_engine.compile(
                 r"^HBM Free Thresholds\s+: (?P<hbm_free_thresholds>[\w\s\,\.]+)$"
             )
 
             # HBM VOQ Age Thresholds         : 1, 2, 3, 4, 5, 6, 7, 8, 10, 12, 16, 24, 32, 64, 128
-            p20_5 = re.compile(
+            p20_5 = regex_engine.compile(
                 r"^HBM VOQ Age Thresholds\s+: (?P<hbm_voq_age_thresholds>[\w\s\,\.]+)$"
             )
 
             # HBM VOQ Thresholds             : 96, 992, 2000, 4000, 6000, 8000, 12000, 16000, 24000, 32000, 40000, 48000, 56000, 64000, 64512, 65536,
-            p20_6 = re.compile(
+            p20_6 = regex_engine.compile(
                 r"^HBM VOQ Thresholds\s+: (?P<hbm_voq_thresholds>[\w\s\,\.]+)$"
             )
 
@@ -3311,7 +3312,7 @@ class ShowPlatformHardwareFedActiveFwdAsicTrapsNputraps(
         #     1 |            0 |                       la_event_e_ETHERNET_ACL_DROP |            0 |            0 |            0
         #     2 |            0 |                 la_event_e_ETHERNET_ACL_FORCE_PUNT |            0 |            0 |            0
         #     4 |            0 |      la_event_e_ETHERNET_NO_TERMINATION_ON_L3_PORT |      8276565 |      8276565 |            0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<trap_id>[\d]+)+\s+\|+\s+(?P<asic>[\d]+)+\s+\|+\s+(?P<npu_trap_name>[\w\_]+)+\s+\|+\s+(?P<prev>[\d]+)+\s+\|+\s+(?P<current>[\d]+)+\s+\|+\s+(?P<delta>[\d]+)$"
         )
 
@@ -3383,7 +3384,7 @@ class ShowPlatformHardwareFedActiveFwdAsicTrapsTMtraps(
         # 2 |  0 |    la_tm_traps_e_STATISTICAL_METER_PACKET_GOT_DROPPED_DUE_TO_STATISTICAL_METER |            0 |            0 |            0
         # 3 |  0 |                               la_tm_traps_e_ETHERNET_METERS_PACKET_OUT_OF_RATE |            0 |            0 |            0
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<trap_id>[\d]+)+\s+\|+\s+(?P<asic>[\d]+)+\s+\|+\s+(?P<tm_trap_name>[\w\_]+)+\s+\|+\s+(?P<prev>[\d]+)+\s+\|+\s+(?P<current>[\d]+)+\s+\|+\s+(?P<delta>[\d]+)$"
         )
 
@@ -3469,7 +3470,7 @@ class ShowPlatformHardwareFedActiveFwdasicdrops(
         # |  81   |RX IFGB0 Port0 partial_drop_counter TC0                     |0|0|               0|
         # ===================================================================================================================
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\|+\s+(?P<id>\d+)+\s+\|+(?P<counter_name>[\w\s\_\-\=\(\)\']+)\s+\|+\s*(?P<slice_number>\d+)+\s*\|+\s*(?P<ifg_number>[\d\-]+)+\s*\|+\s+(?P<field_value>\d+)+\|$"
         )
 
@@ -3526,26 +3527,26 @@ class ShowPlatformHardwareFedSwitchActiveNpuSlotPortInfo(
 
         ret_dict = {}
         # SW port debug states
-        p0 = re.compile(r"^\|\s*SW port debug states\s*\|$")
+        p0 = regex_engine.compile(r"^\|\s*SW port debug states\s*\|$")
 
         # LED port debug states
-        p1 = re.compile(r"^\|\s*LED port debug states\s*\|$")
+        p1 = regex_engine.compile(r"^\|\s*LED port debug states\s*\|$")
 
         # LC present
-        p2 = re.compile(r"^\s*LC present\s+(?P<lc_present>\d+)$")
+        p2 = regex_engine.compile(r"^\s*LC present\s+(?P<lc_present>\d+)$")
 
         # Outstanding ports to be deleted
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^\s*Outstanding ports to be deleted\s+(?P<outstanding_ports_to_be_deleted>\d+)$"
         )
 
         # Total failed Deleted ports
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^\s*Total failed deleted ports\s+(?P<total_failed_deleted_ports>\d+)$"
         )
 
         # General Key: value
-        p5 = re.compile(r"^\|?(?P<key>[\w\s/]+)\|\s*(?P<value>.+)$")
+        p5 = regex_engine.compile(r"^\|?(?P<key>[\w\s/]+)\|\s*(?P<value>.+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3647,30 +3648,30 @@ class ShowPlatformHardwareFedSwitchActiveNpuSlotPortLinkstatus(
         ret_dict = {}
 
         # MPP PORT DETAILS
-        p0 = re.compile(r"^MPP +PORT +DETAILS$")
+        p0 = regex_engine.compile(r"^MPP +PORT +DETAILS$")
 
         # link_state: 1 pcs_status: 0  high_ber: 0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^link_state\: +(?P<link_state>\d+) +pcs_status\: +(?P<pcs_status>\d+) +high_ber\: +(?P<high_ber>\d+)$"
         )
 
         # get_state = LINK_UP
-        p2 = re.compile(r"^get_state +\= +(?P<get_state>.*)$")
+        p2 = regex_engine.compile(r"^get_state +\= +(?P<get_state>.*)$")
 
         # Autoneg Details
-        p3 = re.compile(r"^Autoneg +Details$")
+        p3 = regex_engine.compile(r"^Autoneg +Details$")
 
         # Autoneg Status
-        p4 = re.compile(r"^Autoneg +Status$")
+        p4 = regex_engine.compile(r"^Autoneg +Status$")
 
         # MIB counters
-        p5 = re.compile(r"^MIB +counters$")
+        p5 = regex_engine.compile(r"^MIB +counters$")
 
         # Genral - Speed:         speed_gbps1
-        p6 = re.compile(r"^(?P<key>[\s*\w]+.*)\: +(?P<value>[\S\s]+.*)$")
+        p6 = regex_engine.compile(r"^(?P<key>[\s*\w]+.*)\: +(?P<value>[\S\s]+.*)$")
 
         # Port = 22 cmd = (port_diag unit 0 port 22 slot 0) rc = 0x0 rsn = success
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Port +\= +(?P<port>\d+) +cmd +\= +\((?P<cmd>[\s*\w]+)\) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>\w+)$"
         )
 
@@ -3788,30 +3789,30 @@ class ShowPlatformHardwareFedSwitchActiveNpuSlotPortLinkstatus(
         ret_dict = {}
 
         # MPP PORT DETAILS
-        p0 = re.compile(r"^MPP +PORT +DETAILS$")
+        p0 = regex_engine.compile(r"^MPP +PORT +DETAILS$")
 
         # link_state: 1 pcs_status: 0  high_ber: 0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^link_state\: +(?P<link_state>\d+) +pcs_status\: +(?P<pcs_status>\d+) +high_ber\: +(?P<high_ber>\d+)$"
         )
 
         # get_state = LINK_UP
-        p2 = re.compile(r"^get_state +\= +(?P<get_state>.*)$")
+        p2 = regex_engine.compile(r"^get_state +\= +(?P<get_state>.*)$")
 
         # Autoneg Details
-        p3 = re.compile(r"^Autoneg +Details$")
+        p3 = regex_engine.compile(r"^Autoneg +Details$")
 
         # Autoneg Status
-        p4 = re.compile(r"^Autoneg +Status$")
+        p4 = regex_engine.compile(r"^Autoneg +Status$")
 
         # MIB counters
-        p5 = re.compile(r"^MIB +counters$")
+        p5 = regex_engine.compile(r"^MIB +counters$")
 
         # Genral - Speed:         speed_gbps1
-        p6 = re.compile(r"^(?P<key>[\s*\w]+.*)\: +(?P<value>[\S\s]+.*)$")
+        p6 = regex_engine.compile(r"^(?P<key>[\s*\w]+.*)\: +(?P<value>[\S\s]+.*)$")
 
         # Port = 22 cmd = (port_diag unit 0 port 22 slot 0) rc = 0x0 rsn = success
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Port +\= +(?P<port>\d+) +cmd +\= +\((?P<cmd>[\s*\w]+)\) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>\w+)$"
         )
 
@@ -3955,28 +3956,28 @@ class ShowPlatformHwFedActiveQosQStatsInternalCpuPolicer(
             output = self.device.execute(cmd)
 
         # 0    11     DOT1X Auth                  Yes     1000      1000     0            0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<cpu_qid>\d+)\s+(?P<cpu_picidx>\d+)\s+(?P<cpu_queue_name>[\w\s]+)\s+(?P<cpu_enabled>Yes|No)\s+(?P<cpu_default_rate>\d+)\s+(?P<cpu_set_rate>\d+)\s+(?P<q_drop_bytes>\d+)\s+(?P<q_drop_frames>\d+)$"
         )
 
         # 1          281306           1403            0             0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<index>\d+)\s+(?P<accept_bytes>\d+)\s+(?P<accept_frames>\d+)\s+(?P<drop_bytes>\d+)\s+(?P<drop_frames>\d+)$"
         )
 
         # 20        :   1  2  8                        17000     17000
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<cpp_level2_picidx>\d+)\s+:(?P<cpp_level1_picidx>[\w\s]+)\s+(?P<cpp_default_rate>[\d]+)\s+(?P<cpp_set_rate>[\d]+)$"
         )
 
         # 0      system-cpp-police-data                   :  ICMP GEN/ BROADCAST/ ICMP Redirect/
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^(?P<cpp_picidx>\d+)\s+(?P<cpp_class>[\-\w\s]+)\s+:(?P<cpp_enabled>[\-\w\s\/]+)$"
         )
 
         # 30   9       21      MCAST Data                  Yes
         # 31   3       -       Gold Pkt                    No
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^(?P<sec_qid>\d+)\s+(?P<sec_level1_picidx>\d+)\s+(?P<sec_level2_picidx>[\-\d]+)\s+(?P<sec_queue_name>[\w\s]+)\s+(?P<sec_enabled>Yes|No)$"
         )
 
@@ -4118,7 +4119,7 @@ class ShowPlatHardFedActiveQosQueueStatsOqMulticastAttach(
             output = self.device.execute(cmd)
 
         #  HundredGigE1/0/5              6
-        p1 = re.compile(r"^(?P<interface>\S+)\s+(?P<oq_id>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<interface>\S+)\s+(?P<oq_id>\d+)$")
 
         ret_dict = {}
 
@@ -4178,10 +4179,10 @@ class ShowPlatformHardwareRegisterReadAsic(ShowPlatformHardwareRegisterReadAsicS
         ret_dict = {}
 
         # For asic 1 core 0
-        p0 = re.compile(r"^For +asic +(?P<asic>\d+) +core +(?P<core>\d+)$")
+        p0 = regex_engine.compile(r"^For +asic +(?P<asic>\d+) +core +(?P<core>\d+)$")
 
         # <key>: <value>   i.e. waitTimer                 : 0xfffbfff88
-        p1 = re.compile(r"^(?P<key>\S+)\s*:\s*(?P<hex>0[xX][0-9a-fA-F]+)$")
+        p1 = regex_engine.compile(r"^(?P<key>\S+)\s*:\s*(?P<hex>0[xX][0-9a-fA-F]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -4241,10 +4242,10 @@ class ShowPlatformHardwareFedPortPrbscmd(ShowPlatformHardwareFedPortPrbscmdSchem
         ret_dict = {}
 
         # Port = 40 Slot = 1 cmd = () rc = 0x16 reason = (null)
-        p0 = re.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s*\w]*\)) +rc +\= +(?P<rc>\w+) +reason(?P<reason>.*)$')
+        p0 = regex_engine.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s*\w]*\)) +rc +\= +(?P<rc>\w+) +reason(?P<reason>.*)$')
 
         # Port = 39 cmd = (prbs_stop unit 0 port 39 slot 1 serdes_level 1 polynomial 31) rc = 0x0 rsn = success
-        p1  =  re.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s*\w]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')
+        p1  =  regex_engine.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s*\w]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')
 
 
         for line in output.splitlines():
@@ -4305,10 +4306,10 @@ class ShowPlatformHardwareFedPrbsPolynomial(ShowPlatformHardwareFedPrbsPolynomia
         ret_dict = {}
 
         # Port = 40 Slot = 1 cmd = () rc = 0x16 reason = (null)
-        p0 = re.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s\w]*\)) +rc +\= +(?P<rc>\w+) +reason(?P<reason>.*)$')
+        p0 = regex_engine.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s\w]*\)) +rc +\= +(?P<rc>\w+) +reason(?P<reason>.*)$')
 
         # Port = 39 cmd = (prbs_stop unit 0 port 39 slot 1 serdes_level 1 polynomial 31) rc = 0x0 rsn = success
-        p1  =  re.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s\w]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')
+        p1  =  regex_engine.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s\w]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')
 
 
         for line in output.splitlines():
@@ -4371,16 +4372,16 @@ class ShowPlatformHardwareFedloopback(ShowPlatformHardwareFedloopbackSchema):
         ret_dict = {}
 
         #npu_pdsf_procagent_config_loopback : asic inst 0 port 39 mode 1 command 20
-        p1 =  re.compile(r'^npu_pdsf_procagent_config_loopback\s*\:\s*(?P<npu_pdsf_procagent_config_loopback>.*)$')
+        p1 =  regex_engine.compile(r'^npu_pdsf_procagent_config_loopback\s*\:\s*(?P<npu_pdsf_procagent_config_loopback>.*)$')
 
         #npu_pdsf_l1_port_config_loopback [asic 0 port 39 mode 1]: returned 0 ()
-        p2  = re.compile(r'^\w+\s*\[[\s*\w]+\]\:(?P<npu_pdsf_port_config_loopback>.*)$')
+        p2  = regex_engine.compile(r'^\w+\s*\[[\s*\w]+\]\:(?P<npu_pdsf_port_config_loopback>.*)$')
 
         # Port = 40 Slot = 1 cmd = () rc = 0x16 reason = (null)
-        p3 = re.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +reason(?P<reason>.*)$')
+        p3 = regex_engine.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +reason(?P<reason>.*)$')
 
         # Port = 39 cmd = (prbs_stop unit 0 port 39 slot 1 serdes_level 1 polynomial 31) rc = 0x0 rsn = success
-        p4  =  re.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')
+        p4  =  regex_engine.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')
 
 
         for line in output.splitlines():
@@ -4454,7 +4455,7 @@ class ShowPlatformHardwareFedSwitchActiveStandbyFwdAsicInsightNplSummaryDiff(Sho
 
         # table_name                               length_subtables_f1            length_subtables_f2            nb_subtables_f1                nb_subtables_f2
         # mac_forwarding_table                     (3,)                           (4,)                           1                              1                              nb_subtables_f2
-        p1 = re.compile(r"^(?P<table_name>\S+)\s+.(?P<length_subtables_f1>\d+)\S+\s+.(?P<length_subtables_f2>\d+)\S+\s+.(?P<nb_subtables_f1>\d+)\s+(?P<nb_subtables_f2>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<table_name>\S+)\s+.(?P<length_subtables_f1>\d+)\S+\s+.(?P<length_subtables_f2>\d+)\S+\s+.(?P<nb_subtables_f1>\d+)\s+(?P<nb_subtables_f2>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -4529,7 +4530,7 @@ class ShowPlatformHardwareFedSwitchActiveFwdasicdropsasic(
         #|  3    |RX_METER Slice0 drop_pkts                                   |           0|             -1|              0|                0|               0|
         #|  4    |FLLB Slice0 drop_pkts                                       |
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\|+\s+(?P<id>\d+)+\s+\|+(?P<counter_name>[\w\s\_\-\=\(\)\']+)\s+\|+\s*(?P<slice_number>\d+)+\s*\|+\s*(?P<ifg_number>[\d\-]+)+\s*\|+\s+(?P<prev_value>\d+)+\s*\|+\s+(?P<current_value>\d+)+\s*\|+\s+(?P<delta>\d+)+\|$"
         )
 
@@ -4590,16 +4591,16 @@ class ShowPlatformHardwareFedSwitchActiveVlanIngress(
         ret_dict = {}
 
         # vlan id is:: 1
-        p1 = re.compile(r'^vlan\s+id\s+is::\s* (?P<vlan_id>\d+)')
+        p1 = regex_engine.compile(r'^vlan\s+id\s+is::\s* (?P<vlan_id>\d+)')
 
         # Interfaces in forwarding state: : Gi1/0/15(Tagged), Fo5/0/9(Untagged)
-        p2 = re.compile(r'^Interfaces\s+in\s+forwarding state\s*:\s*:\s*(?P<forwarding_state>[\w\/\.\s\(\w\)\,]+)$')
+        p2 = regex_engine.compile(r'^Interfaces\s+in\s+forwarding state\s*:\s*:\s*(?P<forwarding_state>[\w\/\.\s\(\w\)\,]+)$')
 
         # flood list: : Gi1/0/15, Fo5/0/9
-        p3 = re.compile(r'^flood\s+list\s*:\s+:\s+(?P<flood_list>([\w\/\.\s\,]+)$)')
+        p3 = regex_engine.compile(r'^flood\s+list\s*:\s+:\s+(?P<flood_list>([\w\/\.\s\,]+)$)')
 
         # Gi1/0/15
-        p4 = re.compile(r'^(?P<intf>([\w\/\.\s]+))')
+        p4 = regex_engine.compile(r'^(?P<intf>([\w\/\.\s]+))')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4673,16 +4674,16 @@ class ShowPlatformHardwareFedSwitchStandbyVlanIngress(
         ret_dict = {}
 
         # vlan id is:: 1
-        p1 = re.compile(r'^vlan\s+id\s+is::\s* (?P<vlan_id>\d+)')
+        p1 = regex_engine.compile(r'^vlan\s+id\s+is::\s* (?P<vlan_id>\d+)')
 
         # Interfaces in forwarding state: : Gi1/0/15(Tagged), Fo5/0/9(Untagged)
-        p2 = re.compile(r'^Interfaces\s+in\s+forwarding state\s*:\s*:\s*(?P<forwarding_state>[\w\/\.\s\(\w\)\,]+)$')
+        p2 = regex_engine.compile(r'^Interfaces\s+in\s+forwarding state\s*:\s*:\s*(?P<forwarding_state>[\w\/\.\s\(\w\)\,]+)$')
 
         # flood list: : Gi1/0/15, Fo5/0/9
-        p3 = re.compile(r'^flood\s+list\s*:\s+:\s+(?P<flood_list>([\w\/\.\s\,]+)$)')
+        p3 = regex_engine.compile(r'^flood\s+list\s*:\s+:\s+(?P<flood_list>([\w\/\.\s\,]+)$)')
 
         # Gi1/0/15
-        p4 = re.compile(r'^(?P<intf>([\w\/\.\s]+))')
+        p4 = regex_engine.compile(r'^(?P<intf>([\w\/\.\s]+))')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4753,7 +4754,7 @@ class ShowPlatformHardwareFedSwitchQosQueueConfigInterfaceQueueInclude(ShowPlatf
 
         # Q-Limit(Blocks    )    : 100000
         # Q-Limit(Bytes    )    : 100000
-        p1 = re.compile(r'^Q-Limit\((?P<type>Blocks|Bytes)\s+\)\s+:\s+(?P<q_limit_blocks>\d+)$')
+        p1 = regex_engine.compile(r'^Q-Limit\((?P<type>Blocks|Bytes)\s+\)\s+:\s+(?P<q_limit_blocks>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4795,7 +4796,7 @@ class ShowPlatformHardwareFedSwitchQosSchedulerInterfaceInclude(ShowPlatformHard
         result_dict = {}
 
         # |                       : VOQ Offset :   0 |   0 |   0 |   0 |   0 |   5 |   6 |   7
-        p1 = re.compile(r'^\|\s+:\s+VOQ\s+Offset\s+:\s+(?P<voq_offset>\d+\s+\|\s+\d+\s+\|\s+\d+\s+\|\s+\d+\s+\|\s+\d+\s+\|\s+\d+\s+\|\s+\d+\s+\|\s+\d+)')
+        p1 = regex_engine.compile(r'^\|\s+:\s+VOQ\s+Offset\s+:\s+(?P<voq_offset>\d+\s+\|\s+\d+\s+\|\s+\d+\s+\|\s+\d+\s+\|\s+\d+\s+\|\s+\d+\s+\|\s+\d+\s+\|\s+\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4839,10 +4840,10 @@ class ShowPlatformHardwareFedSwitchQosInterfaceIngressNdpDetailedInclude(ShowPla
         ret_dict = {}
 
         # [GigabitEthernet1/0/2, pm-dc1-tc6, Ingress]: CGID = 0x634E00
-        p1 = re.compile(r'^\[(?P<interface>\S+),\s+(?P<location>\S+),\s+(?P<direction>\S+)]:\s+CGID\s+=\s+(?P<cgid>\S+)$')
+        p1 = regex_engine.compile(r'^\[(?P<interface>\S+),\s+(?P<location>\S+),\s+(?P<direction>\S+)]:\s+CGID\s+=\s+(?P<cgid>\S+)$')
 
         #  No of classes: 1
-        p2 = re.compile(r'^\s*No of classes:\s+(?P<no_of_classes>\d+)$')
+        p2 = regex_engine.compile(r'^\s*No of classes:\s+(?P<no_of_classes>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4888,10 +4889,10 @@ class ShowPlatformHardwareFedSwitchActiveSgaclResourceUsage(ShowPlatformHardware
         ret_dict = {}
 
         # ------------------------ SG-ACL Usage for Device ID 0 ------------------------
-        p1 = re.compile(r'^.*SG-ACL Usage for Device ID (?P<device_id>\d+).*$')
+        p1 = regex_engine.compile(r'^.*SG-ACL Usage for Device ID (?P<device_id>\d+).*$')
 
         # Policy Entries : Used = 5, Max = 508
-        p2 = re.compile(r'^Policy Entries : Used = (?P<used>\d+), Max = (?P<max>\d+)$')
+        p2 = regex_engine.compile(r'^Policy Entries : Used = (?P<used>\d+), Max = (?P<max>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4956,55 +4957,55 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicInsightL3unexthop(ShowPlatformHa
         ret_dict = {}
 
         # Nexthop with nh_gid: 0,0x0
-        p1 = re.compile(r'Nexthop with nh_gid:\s+(?P<nh_gid>\d+).(?P<hex>\S+)$')
+        p1 = regex_engine.compile(r'Nexthop with nh_gid:\s+(?P<nh_gid>\d+).(?P<hex>\S+)$')
 
         # Value:
-        p2 = re.compile(r'Value:$')
+        p2 = regex_engine.compile(r'Value:$')
 
         # nh_da(dmac): 00:00:00:00:00:00/0x0
-        p3 = re.compile(r'nh_da.dmac.\S+\s+(?P<destmac>\w+:\w+:\w+:\w+:\w+:\w+)\/(?P<oid>\w+)$')
+        p3 = regex_engine.compile(r'nh_da.dmac.\S+\s+(?P<destmac>\w+:\w+:\w+:\w+:\w+:\w+)\/(?P<oid>\w+)$')
 
         # nh_payload:
-        p4 = re.compile(r'nh_payload:$')
+        p4 = regex_engine.compile(r'nh_payload:$')
 
         # bd_mirror_cmd: 0/0x0
-        p5 = re.compile(r'bd_mirror_cmd:\s+(?P<bd_mirror_cmd>\S+)$')
+        p5 = regex_engine.compile(r'bd_mirror_cmd:\s+(?P<bd_mirror_cmd>\S+)$')
 
         # eve_vid1: 0/0x0
-        p6 = re.compile(r'eve_vid1:\s+(?P<eve_vid1>\S+)$')
+        p6 = regex_engine.compile(r'eve_vid1:\s+(?P<eve_vid1>\S+)$')
 
         # eve_vid2: 0/0x0
-        p7 = re.compile(r'eve_vid2:\s+(?P<eve_vid2>\S+)$')
+        p7 = regex_engine.compile(r'eve_vid2:\s+(?P<eve_vid2>\S+)$')
 
         # l2_flood: 0/0x0
-        p8 = re.compile(r'l2_flood:\s+(?P<l2_flood>\S+)$')
+        p8 = regex_engine.compile(r'l2_flood:\s+(?P<l2_flood>\S+)$')
 
         # l2_port: 0/0x0
-        p9 = re.compile(r'l2_port:\s+(?P<l2_port>\S+)$')
+        p9 = regex_engine.compile(r'l2_port:\s+(?P<l2_port>\S+)$')
 
         # lif_policy_id: 0/0x0
-        p10 = re.compile(r'lif_policy_id:\s+(?P<lif_policy_id>\S+)$')
+        p10 = regex_engine.compile(r'lif_policy_id:\s+(?P<lif_policy_id>\S+)$')
 
         # rtf_conf_set: 0/0x0
-        p11 = re.compile(r'rtf_conf_set:\s+(?P<rtf_conf_set>\S+)$')
+        p11 = regex_engine.compile(r'rtf_conf_set:\s+(?P<rtf_conf_set>\S+)$')
 
         # l3_sa_vlan_or_l2_dlp_attr:
-        p12 = re.compile(r'l3_sa_vlan_or_l2_dlp_attr:$')
+        p12 = regex_engine.compile(r'l3_sa_vlan_or_l2_dlp_attr:$')
 
         # l3_sa_lsb:
-        p13 = re.compile(r'l3_sa_lsb:$')
+        p13 = regex_engine.compile(r'l3_sa_lsb:$')
 
         # sa_prefix_index: 0/0x0
-        p14 = re.compile(r'sa_prefix_index:\s+(?P<sa_prefix_index>\S+)$')
+        p14 = regex_engine.compile(r'sa_prefix_index:\s+(?P<sa_prefix_index>\S+)$')
 
         # tpid_sa_lsb:
-        p15 = re.compile(r'tpid_sa_lsb:$')
+        p15 = regex_engine.compile(r'tpid_sa_lsb:$')
 
         # sa_lsb: 0/0x0
-        p16 = re.compile(r'sa_lsb:\s+(?P<sa_lsb>\S+)$')
+        p16 = regex_engine.compile(r'sa_lsb:\s+(?P<sa_lsb>\S+)$')
 
         # tpid: 0/0x0
-        p17 = re.compile(r'tpid:\s+(?P<tpid>\S+)$')
+        p17 = regex_engine.compile(r'tpid:\s+(?P<tpid>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -5331,187 +5332,187 @@ class ShowPlatformHardwareFedNpuDscDump(ShowPlatformHardwareFedNpuDscDumpSchema)
         ret_dict = {} 
         
         # npu_pdsf_procagent_get_eye_common : asic inst 0 port 14 link 32 command 8
-        p1 = re.compile(r'^npu_pdsf_procagent_get_eye_common\s*\: +(?P<npu_pdsf_procagent_get_eye_common>[\S\s]+.*)$')        
+        p1 = regex_engine.compile(r'^npu_pdsf_procagent_get_eye_common\s*\: +(?P<npu_pdsf_procagent_get_eye_common>[\S\s]+.*)$')        
         
         # "mpp_port_0_0_36:7": {
-        p2  =  re.compile(r'^\"(?P<key>mpp_port_\d+_\d+_\d+\:\d+)\"\:\s*\{$')        
+        p2  =  regex_engine.compile(r'^\"(?P<key>mpp_port_\d+_\d+_\d+\:\d+)\"\:\s*\{$')        
        
         # "mac_state_histogram": {
-        p2_1  =  re.compile(r'^\"mac_state_histogram\"\:\s*\{$')        
+        p2_1  =  regex_engine.compile(r'^\"mac_state_histogram\"\:\s*\{$')        
        
         # "mac_port_status": { 
-        p2_2 = re.compile(r'^\"mac_port_status\"\:\s*\{$')
+        p2_2 = regex_engine.compile(r'^\"mac_port_status\"\:\s*\{$')
         
         # "mib_counters": {
-        p2_3 = re.compile(r'^\"mib_counters\"\:\s*\{$')
+        p2_3 = regex_engine.compile(r'^\"mib_counters\"\:\s*\{$')
         
         # "tx_mac_tc_fc_frames_ok": [ 
-        p2_3_1 = re.compile(r'^\"tx_mac_tc_fc_frames_ok\"\:\s*\[$')
+        p2_3_1 = regex_engine.compile(r'^\"tx_mac_tc_fc_frames_ok\"\:\s*\[$')
         
         # "tx_xoff_state_duration": [
-        p2_3_2 = re.compile(r'^\"tx_xoff_state_duration\"\:\s*\[$')
+        p2_3_2 = regex_engine.compile(r'^\"tx_xoff_state_duration\"\:\s*\[$')
         
         # "rx_mac_tc_fc_frames_ok": [
-        p2_3_3 = re.compile(r'^\"rx_mac_tc_fc_frames_ok\"\:\s*\[$')
+        p2_3_3 = regex_engine.compile(r'^\"rx_mac_tc_fc_frames_ok\"\:\s*\[$')
         
         # "rx_xoff_state_duration": [
-        p2_3_4 = re.compile(r'^\"rx_xoff_state_duration\"\:\s*\[$')        
+        p2_3_4 = regex_engine.compile(r'^\"rx_xoff_state_duration\"\:\s*\[$')        
         
         # "multiport_phy_0_0_36": { 
-        p3 = re.compile(r'^\"(?P<key>multiport_phy_\d+_\d+_\d+)\"\: +\{$')
+        p3 = regex_engine.compile(r'^\"(?P<key>multiport_phy_\d+_\d+_\d+)\"\: +\{$')
         
         # "device_info": {
-        p3_1 = re.compile(r'^\"device_info\"\:\s*\{$')
+        p3_1 = regex_engine.compile(r'^\"device_info\"\:\s*\{$')
         
         # "serdes_0": { 
-        p3_1_1 = re.compile(r'^\"serdes_\d+\"\:\s*\{$')        
+        p3_1_1 = regex_engine.compile(r'^\"serdes_\d+\"\:\s*\{$')        
         
         # "mac_port_config": {
-        p3_2 =  re.compile(r'^\"mac_port_config\"\:\s*\{$')
+        p3_2 =  regex_engine.compile(r'^\"mac_port_config\"\:\s*\{$')
         
         # "serdes_info_36": { 
-        p3_2_1 = re.compile(r'^\"serdes_info_\d+\"\:\s*\{$')        
+        p3_2_1 = regex_engine.compile(r'^\"serdes_info_\d+\"\:\s*\{$')        
        
         # am_lock": [ 
-        p3_3_1 = re.compile(r'^\"am_lock\"\:\s*\[$')        
+        p3_3_1 = regex_engine.compile(r'^\"am_lock\"\:\s*\[$')        
        
         # "mac_pcs_lane_mapping": [ 
-        p3_3_2 =  re.compile(r'^\"mac_pcs_lane_mapping\"\:\s*\[$') 
+        p3_3_2 =  regex_engine.compile(r'^\"mac_pcs_lane_mapping\"\:\s*\[$') 
         
         # "mac_port_soft_state": {
-        p3_4  = re.compile(r'^\"mac_port_soft_state\"\:\s*\{$')
+        p3_4  = regex_engine.compile(r'^\"mac_port_soft_state\"\:\s*\{$')
         
         # "test_mode": {
-        p3_5 = re.compile(r'^\"test_mode\"\:\s*\{$')        
+        p3_5 = regex_engine.compile(r'^\"test_mode\"\:\s*\{$')        
         
         # "state_transition_history": [ 
-        p3_6 = re.compile(r'^\"state_transition_history\"\:\s*\[$')
+        p3_6 = regex_engine.compile(r'^\"state_transition_history\"\:\s*\[$')
         
         # "serdes_parameters": {
-        p3_7 = re.compile(r'^\"serdes_parameters\"\:\s*\{$')
+        p3_7 = regex_engine.compile(r'^\"serdes_parameters\"\:\s*\{$')
         
         # "index_0": {
-        p3_7_1 = re.compile(r'^\"index_0\"\:\s*\{$')
+        p3_7_1 = regex_engine.compile(r'^\"index_0\"\:\s*\{$')
         
         # "serdes_config": {
-        p3_8 = re.compile(r'^\"serdes_config\"\:\s*\{$')
+        p3_8 = regex_engine.compile(r'^\"serdes_config\"\:\s*\{$')
         
         #  "serdes_settings": [ 
-        p3_8_1 = re.compile(r'^\"serdes_settings\"\:\s*\[$')
+        p3_8_1 = regex_engine.compile(r'^\"serdes_settings\"\:\s*\[$')
         
         # "rx_settings": { 
-        p3_8_1_1 = re.compile(r'^\"rx_settings\"\:\s*\{$')
+        p3_8_1_1 = regex_engine.compile(r'^\"rx_settings\"\:\s*\{$')
         
         # "targ_shadow": [ 
-        p3_8_1_1_1 =  re.compile(r'^\"targ_shadow\"\:\s*\[$')
+        p3_8_1_1_1 =  regex_engine.compile(r'^\"targ_shadow\"\:\s*\[$')
         
         # "tx_settings": {
-        p3_8_1_2  =  re.compile(r'^\"tx_settings\"\:\s*\{$')
+        p3_8_1_2  =  regex_engine.compile(r'^\"tx_settings\"\:\s*\{$')
         
         # "tx_fir": [
-        p3_8_1_2_1 = re.compile(r'^\"tx_fir\"\:\s*\[$')
+        p3_8_1_2_1 = regex_engine.compile(r'^\"tx_fir\"\:\s*\[$')
         
         # "flow_chart_settings": { 
-        p3_8_1_3 =  re.compile(r'^\"flow_chart_settings\"\:\s*\{$')
+        p3_8_1_3 =  regex_engine.compile(r'^\"flow_chart_settings\"\:\s*\{$')
         
         # "serdes_status": {
-        p3_9 = re.compile(r'^\"serdes_status\"\:\s*\{$')
+        p3_9 = regex_engine.compile(r'^\"serdes_status\"\:\s*\{$')
         
         # "Firmware_Version": { 
-        p3_9_1 =  re.compile(r'^\"Firmware_Version\"\:\s*\{$')
+        p3_9_1 =  regex_engine.compile(r'^\"Firmware_Version\"\:\s*\{$')
         
         # "rx_status": [
-        p3_9_2 = re.compile(r'^\"rx_status\"\:\s*\[$')
+        p3_9_2 = regex_engine.compile(r'^\"rx_status\"\:\s*\[$')
         
         # "firs": [
-        p3_9_2_1 = re.compile(r'^\"firs\":\s*\[$')
+        p3_9_2_1 = regex_engine.compile(r'^\"firs\":\s*\[$')
         
         # "fw_rx_status": [
-        p3_9_3 = re.compile(r'^\"fw_rx_status\"\:\s*\[$')
+        p3_9_3 = regex_engine.compile(r'^\"fw_rx_status\"\:\s*\[$')
         
         # "fir_shadow": [ 
-        p3_9_4 =  re.compile(r'^\"fir_shadow\"\:\s*\[$')
+        p3_9_4 =  regex_engine.compile(r'^\"fir_shadow\"\:\s*\[$')
         
         # "eye_capture": {
-        p3_10 = re.compile (r'^\"eye_capture\"\:\s*\{$')
+        p3_10 = regex_engine.compile (r'^\"eye_capture\"\:\s*\{$')
         
         # "veye_data": [
-        p3_10_1 = re.compile(r'^\"veye_data\"\:\s*\[$')
+        p3_10_1 = regex_engine.compile(r'^\"veye_data\"\:\s*\[$')
         
         # "veye_values": [
-        p3_10_1_1 = re.compile(r'^\"veye_values\"\:\s*\[$')
+        p3_10_1_1 = regex_engine.compile(r'^\"veye_values\"\:\s*\[$')
         
         # "reg_dump": {
-        p3_11 = re.compile(r'^\"reg_dump\"\:\s*\{$')
+        p3_11 = regex_engine.compile(r'^\"reg_dump\"\:\s*\{$')
         
         # "Quad_Reg": [
-        p3_11_1 = re.compile(r'^\"Quad_Reg\"\:\s*\[$')        
+        p3_11_1 = regex_engine.compile(r'^\"Quad_Reg\"\:\s*\[$')        
 
         # "P_Reg": [ 
-        p3_11_2 = re.compile(r'^\"P_Reg\"\:\s*\[$')
+        p3_11_2 = regex_engine.compile(r'^\"P_Reg\"\:\s*\[$')
         
         # "S_reg": [
-        p3_11_3 = re.compile(r'^\"S_reg\"\:\s*\[$')
+        p3_11_3 = regex_engine.compile(r'^\"S_reg\"\:\s*\[$')
         
         # "RXDTOP": [
-        p3_11_4 = re.compile(r'^\"RXDTOP\"\:\s*\[$')
+        p3_11_4 = regex_engine.compile(r'^\"RXDTOP\"\:\s*\[$')
         
         # "TXDTOP": [
-        p3_11_5 = re.compile(r'^\"TXDTOP\"\:\s*\[$')
+        p3_11_5 = regex_engine.compile(r'^\"TXDTOP\"\:\s*\[$')
         
         # "AutoNeg": [
-        p3_11_6 = re.compile(r'^\"AutoNeg\"\:\s*\[$')
+        p3_11_6 = regex_engine.compile(r'^\"AutoNeg\"\:\s*\[$')
         
         # "LinkTraining": [
-        p3_11_7 = re.compile(r'^\"LinkTraining\"\:\s*\[$')
+        p3_11_7 = regex_engine.compile(r'^\"LinkTraining\"\:\s*\[$')
         
         # "RX_STS": [
-        p3_11_8 = re.compile(r'^\"RX_STS\"\:\s*\[$')
+        p3_11_8 = regex_engine.compile(r'^\"RX_STS\"\:\s*\[$')
         
         # "an_debug_1": [
-        p3_11_9 = re.compile(r'^\"an_debug_1\"\:\s*\[$')
+        p3_11_9 = regex_engine.compile(r'^\"an_debug_1\"\:\s*\[$')
         
         # ""an_debug_2": [
-        p3_11_10 = re.compile(r'^\"an_debug_2\"\:\s*\[$')
+        p3_11_10 = regex_engine.compile(r'^\"an_debug_2\"\:\s*\[$')
         
         # "lt_debug_1": [
-        p3_11_11 = re.compile(r'^\"lt_debug_1\"\:\s*\[$')
+        p3_11_11 = regex_engine.compile(r'^\"lt_debug_1\"\:\s*\[$')
         
         # "lt_debug_2": [
-        p3_11_12 = re.compile(r'^\"lt_debug_2\"\:\s*\[$')
+        p3_11_12 = regex_engine.compile(r'^\"lt_debug_2\"\:\s*\[$')
         
         # "mac_port_0_0_36.link_down_histogram": {
-        p4= re.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+\.link_down_histogram)\"\:\s*\{$')        
+        p4= regex_engine.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+\.link_down_histogram)\"\:\s*\{$')        
         
         # "rx_deskew_fifo_overflow_count": [
-        p4_1 = re.compile(r'^\"rx_deskew_fifo_overflow_count\"\:\s*\[$')
+        p4_1 = regex_engine.compile(r'^\"rx_deskew_fifo_overflow_count\"\:\s*\[$')
         
         # "rx_pma_sig_ok_loss_interrupt_register_count": [ 
-        p4_2 = re.compile(r'^\"rx_pma_sig_ok_loss_interrupt_register_count\"\:\s*\[$')
+        p4_2 = regex_engine.compile(r'^\"rx_pma_sig_ok_loss_interrupt_register_count\"\:\s*\[$')
         
         # "mac_port_0_0_36.link_error_histogram": {
-        p5 =  re.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+\.link_error_histogram)\"\:\s*\{$')
+        p5 =  regex_engine.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+\.link_error_histogram)\"\:\s*\{$')
         
         # "mac_port_0_0_36.link_debounce_state": {
-        p6 = re.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+.link_debounce_state)\"\:\s*\{$')
+        p6 = regex_engine.compile(r'^\"(?P<key>mac_port_\d+_\d+_\d+.link_debounce_state)\"\:\s*\{$')
         
         # Port = 40 Slot = 1 cmd = () rc = 0x16 reason = (null)
-        p7 = re.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +reason(?P<reason>.*)$')
+        p7 = regex_engine.compile(r'^Port +\= +(?P<port>\d+) +Slot +\= +(?P<slot>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +reason(?P<reason>.*)$')
         
         # Port = 39 cmd = (prbs_stop unit 0 port 39 slot 1 serdes_level 1 polynomial 31) rc = 0x0 rsn = success
-        p7_1 = re.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')               
+        p7_1 = regex_engine.compile(r'^Port +\= +(?P<port>\d+) +cmd +\= +(?P<cmd>\([\s*\S]*\)) +rc +\= +(?P<rc>\w+) +rsn +\= +(?P<rsn>.*)$')               
         
         # "PRE_INIT": 0,
-        p8 = re.compile(r'^\"(?P<key>\w+)\"\:\s*(?P<value>.*)$')        
+        p8 = regex_engine.compile(r'^\"(?P<key>\w+)\"\:\s*(?P<value>.*)$')        
         
         # false 
-        p8_1 = re.compile(r'^(?P<value>\w+)$')        
+        p8_1 = regex_engine.compile(r'^(?P<value>\w+)$')        
         
         # 64,
-        p8_2 = re.compile(r'^(?P<value>[-]?\d+)\,$')
+        p8_2 = regex_engine.compile(r'^(?P<value>[-]?\d+)\,$')
         
         #], 
-        p8_3 =  re.compile(r'^\]\,?$')      
+        p8_3 =  regex_engine.compile(r'^\]\,?$')      
         
         cnt = index_flag = stat_cnt = multiport_flag = 0
         
@@ -6074,14 +6075,14 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicResourceTcamTableSghash(ShowPlat
         ret_dict = {}
         
         # List of SG-ACL Matrix Cells for Device ID = 0
-        p1 = re.compile(r'^.*List of SG-ACL Matrix Cells for Device ID = (?P<device_id>\d+).*$')
+        p1 = regex_engine.compile(r'^.*List of SG-ACL Matrix Cells for Device ID = (?P<device_id>\d+).*$')
         
         # Total Entries: 7 
-        p2 = re.compile(r'^Total Entries: (?P<total_entries>\d+)$')
+        p2 = regex_engine.compile(r'^Total Entries: (?P<total_entries>\d+)$')
         
         # S_NO    SGT        DGT             Monitor Mode    ACL_ID     IP_version 
         # 1       4          6               0               5          ipv4       
-        p3 = re.compile(r'^(?P<s_no>\d+)\s+(?P<sgt>\d+)\s+(?P<dgt>\d+)\s+(?P<monitor_mode>\d+)\s+(?P<acl_id>\d+)\s+(?P<ip_version>\w+)$')
+        p3 = regex_engine.compile(r'^(?P<s_no>\d+)\s+(?P<sgt>\d+)\s+(?P<dgt>\d+)\s+(?P<monitor_mode>\d+)\s+(?P<acl_id>\d+)\s+(?P<ip_version>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6140,16 +6141,16 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicInsightSdkObjects(ShowPlatformHa
         ret_dict = {}
         
         # - # 1
-        p1 = re.compile(r'^- # (?P<object_id>\d+)$')
+        p1 = regex_engine.compile(r'^- # (?P<object_id>\d+)$')
         
         # cookie: ''
-        p2 = re.compile(r"^cookie:\s*'(?P<cookie>.*)'$")
+        p2 = regex_engine.compile(r"^cookie:\s*'(?P<cookie>.*)'$")
         
         # device: =oref('device', oid=0x0)
-        p3 = re.compile(r'^device: =oref\(\'device\', oid=(?P<device_oid>.*)\)$')
+        p3 = regex_engine.compile(r'^device: =oref\(\'device\', oid=(?P<device_oid>.*)\)$')
         
         # oid: =0x225
-        p4 = re.compile(r'^oid: =(?P<oid>.*)$')
+        p4 = regex_engine.compile(r'^oid: =(?P<oid>.*)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -6210,19 +6211,19 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicInsightSdkObject(ShowPlatformHar
         ret_dict = {}
 
         # aggregation_mode: =0x0
-        p1 = re.compile(r'^aggregation_mode: =(?P<aggregation_mode>.*)$')
+        p1 = regex_engine.compile(r'^aggregation_mode: =(?P<aggregation_mode>.*)$')
 
         # cookie: ''
-        p2 = re.compile(r"^cookie:\s*'(?P<cookie>.*)'$")
+        p2 = regex_engine.compile(r"^cookie:\s*'(?P<cookie>.*)'$")
 
         # device: =oref('device', oid=0x0)
-        p3 = re.compile(r'^device: =oref\(\'device\', oid=(?P<device_oid>.*)\)$')
+        p3 = regex_engine.compile(r'^device: =oref\(\'device\', oid=(?P<device_oid>.*)\)$')
 
         # oid: =0x225
-        p4 = re.compile(r'^oid: =(?P<oid>.*)$')
+        p4 = regex_engine.compile(r'^oid: =(?P<oid>.*)$')
 
         # set_size: =0x1
-        p5 = re.compile(r'^set_size: =(?P<set_size>.*)$')
+        p5 = regex_engine.compile(r'^set_size: =(?P<set_size>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6294,14 +6295,14 @@ class ShowPlatformHardwareFedSwitchFwdAsicInsightIpv4SgtMapping(ShowPlatformHard
         entries = []
 
         # Total IPv4-SGT EM entries = 4 
-        p1 = re.compile(r'^Total IPv4-SGT EM entries\s*=\s*(?P<total_ipv4_sgt_em_entries>\d+)$')
+        p1 = regex_engine.compile(r'^Total IPv4-SGT EM entries\s*=\s*(?P<total_ipv4_sgt_em_entries>\d+)$')
 
         # Total IPv4-SGT LPM entries = 3 
-        p2 = re.compile(r'^Total IPv4-SGT LPM entries\s*=\s*(?P<total_ipv4_sgt_lpm_entries>\d+)$')
+        p2 = regex_engine.compile(r'^Total IPv4-SGT LPM entries\s*=\s*(?P<total_ipv4_sgt_lpm_entries>\d+)$')
 
         # SNo.   IPv4-ADDRESS   MASKLEN VRFID SGT   VALID 
         # 0      30.0.0.2       32      0     4     1     
-        p3 = re.compile(r'^(?P<sno>\d+)\s+(?P<ipv4_address>\S+)\s+(?P<masklen>\d+)\s+(?P<vrfid>\d+)\s+(?P<sgt>\d+)\s+(?P<valid>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<sno>\d+)\s+(?P<ipv4_address>\S+)\s+(?P<masklen>\d+)\s+(?P<vrfid>\d+)\s+(?P<sgt>\d+)\s+(?P<valid>\d+)$')
 
         # Process each line of the output
         for line in output.splitlines():
@@ -6366,14 +6367,14 @@ class ShowPlatformHardwareFedSwitchFwdAsicInsightIpv6SgtMapping(ShowPlatformHard
         entries = []
 
         # Total IPv6-SGT EM entries = 2 
-        p1 = re.compile(r'^Total IPv6-SGT EM entries\s*=\s*(?P<total_ipv6_sgt_em_entries>\d+)$')
+        p1 = regex_engine.compile(r'^Total IPv6-SGT EM entries\s*=\s*(?P<total_ipv6_sgt_em_entries>\d+)$')
 
         # Total IPv6-SGT LPM entries = 4
-        p2 = re.compile(r'^Total IPv6-SGT LPM entries\s*=\s*(?P<total_ipv6_sgt_lpm_entries>\d+)$')
+        p2 = regex_engine.compile(r'^Total IPv6-SGT LPM entries\s*=\s*(?P<total_ipv6_sgt_lpm_entries>\d+)$')
 
         # SNo.   IPv6-ADDRESS  MASKLEN VRFID SGT   VALID 
         # 0      30::2          128     0     40002 1    
-        p3 = re.compile(r'^(?P<sno>\d+)\s+(?P<ipv6_address>[0-9a-fA-F:.]+)\s+(?P<masklen>\d+)\s+(?P<vrfid>\d+)\s+(?P<sgt>\d+)\s+(?P<valid>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<sno>\d+)\s+(?P<ipv6_address>[0-9a-fA-F:.]+)\s+(?P<masklen>\d+)\s+(?P<vrfid>\d+)\s+(?P<sgt>\d+)\s+(?P<valid>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6441,10 +6442,10 @@ class ShowPlatformHardwareFedSwitchFwdAsicInsightIpSourceGuardDef(ShowPlatformHa
         ret_dict = {}
 
         #| 1358    | 1115                | SA                   | 1357                | IPSG_VIOLATION_DROP   | 
-        p1 = re.compile(r'^\|\s+(?P<acl_oid>\d+)\s+\|\s+(?P<acl_key_profile_oid>\d+)\s+\|\s+(?P<acl_match_key_fields>.+?)\s+\|\s+(?P<acl_cmd_profile_oid>\d+)\s+\|\s+(?P<acl_commands>.+?)\s+\|$')
+        p1 = regex_engine.compile(r'^\|\s+(?P<acl_oid>\d+)\s+\|\s+(?P<acl_key_profile_oid>\d+)\s+\|\s+(?P<acl_match_key_fields>.+?)\s+\|\s+(?P<acl_cmd_profile_oid>\d+)\s+\|\s+(?P<acl_commands>.+?)\s+\|$')
 
         #|         |                     | VLAN_OUTER           |                     | FORCE_TRAP_WITH_EVENT | 
-        p2 = re.compile(r'^\|\s+\|\s+\|(?P<acl_match_key_fields>.+?)\s+\|\s+\|\s+(?P<acl_commands>.+?)\s+\|')
+        p2 = regex_engine.compile(r'^\|\s+\|\s+\|(?P<acl_match_key_fields>.+?)\s+\|\s+\|\s+(?P<acl_commands>.+?)\s+\|')
 
 
         for line in output.splitlines():
@@ -6518,13 +6519,13 @@ class ShowPlatformHardwareFedSwitchFwdAsicInsightIpSourceGuardAcl(ShowPlatformHa
         # | Priority | SSP | IPV4 SIP               | Source mac               | Vlan | Protocol | DPort | SPort | Drop | Hit count | Counter oid |
         # +----------+-----+------------------------+--------------------------+------+----------+-------+-------+------+-----------+-------------+
         # | 0        |     |                        |                          |      | 17       | 67    | 68    |      | 18        | 1359        |
-        p1 = re.compile(r'^\|\s+(?P<priority>\d+)\s+\|\s+(?P<ssp>\S*)\s+\|\s+(?P<ipv4_sip>\S*)\s+\|\s+(?P<source_mac>\S*)\s+\|\s+(?P<vlan>\S*)\s+\|\s+(?P<protocol>\S*)\s+\|\s+(?P<dport>\S*)\s+\|\s+(?P<sport>\S*)\s+\|\s+(?P<drop>\S*)\s+\|\s+(?P<hit_count>\d+)\s+\|\s+(?P<counter_oid>\d+)\s+\|$')
+        p1 = regex_engine.compile(r'^\|\s+(?P<priority>\d+)\s+\|\s+(?P<ssp>\S*)\s+\|\s+(?P<ipv4_sip>\S*)\s+\|\s+(?P<source_mac>\S*)\s+\|\s+(?P<vlan>\S*)\s+\|\s+(?P<protocol>\S*)\s+\|\s+(?P<dport>\S*)\s+\|\s+(?P<sport>\S*)\s+\|\s+(?P<drop>\S*)\s+\|\s+(?P<hit_count>\d+)\s+\|\s+(?P<counter_oid>\d+)\s+\|$')
 
         # | 3        | 60  | IP   : 30.0.0.2        | Mac  : 00:12:01:00:00:01 | 30   |          |       |       |      | 0         | 2479        |        
-        p1_1 = re.compile(r'^\|\s+(?P<priority>\d+)\s+\|\s+(?P<ssp>\S*)\s+\|\s+IP\s*:\s*(?P<ipv4_sip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+\|\s+Mac\s*:\s*(?P<source_mac>[\w:]+)\s+\|\s+(?P<vlan>\S*)\s+\|\s+(?P<protocol>\S*)\s+\|\s+(?P<dport>\S*)\s+\|\s+(?P<sport>\S*)\s+\|\s+(?P<drop>\S*)\s+\|\s+(?P<hit_count>\d+)\s+\|\s+(?P<counter_oid>\d+)\s+\|$')
+        p1_1 = regex_engine.compile(r'^\|\s+(?P<priority>\d+)\s+\|\s+(?P<ssp>\S*)\s+\|\s+IP\s*:\s*(?P<ipv4_sip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+\|\s+Mac\s*:\s*(?P<source_mac>[\w:]+)\s+\|\s+(?P<vlan>\S*)\s+\|\s+(?P<protocol>\S*)\s+\|\s+(?P<dport>\S*)\s+\|\s+(?P<sport>\S*)\s+\|\s+(?P<drop>\S*)\s+\|\s+(?P<hit_count>\d+)\s+\|\s+(?P<counter_oid>\d+)\s+\|$')
 
         # |          |     | Mask : 255.255.255.255 | Mask : ff:ff:ff:ff:ff:ff |      |          |       |       |      |           |             |
-        p1_2 = re.compile(r'^\|\s+\|\s+\|\s+Mask\s*:\s*(?P<ipv4_sip_mask>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+\|\s+Mask\s*:\s*(?P<source_mac_mask>[\w:]+)\s+\|')
+        p1_2 = regex_engine.compile(r'^\|\s+\|\s+\|\s+Mask\s*:\s*(?P<ipv4_sip_mask>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+\|\s+Mask\s*:\s*(?P<source_mac_mask>[\w:]+)\s+\|')
 
         current_priority = None
 
@@ -6611,7 +6612,7 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicInsightS1SgtMappingStatusV4(Show
 
         # | SGT | IP address  | IP version | VRF gid | VRF cookie |
         # | 20  | 20.0.0.2/32 | 4          | 0       |            |
-        p1 = re.compile(r'^\|\s*(?P<sgt>\d+)\s*\|\s*(?P<ip_address>[0-9a-fA-F:.\/]+)\s*\|\s*(?P<ip_version>\d+)\s*\|\s*(?P<vrf_gid>\d+)\s*\|\s*(?P<vrf_cookie>.*?)\s*\|$')
+        p1 = regex_engine.compile(r'^\|\s*(?P<sgt>\d+)\s*\|\s*(?P<ip_address>[0-9a-fA-F:.\/]+)\s*\|\s*(?P<ip_version>\d+)\s*\|\s*(?P<vrf_gid>\d+)\s*\|\s*(?P<vrf_cookie>.*?)\s*\|$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6662,7 +6663,7 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicInsightS1SgtMappingStatusV6(Show
 
         # | SGT | IP address   | IP version | VRF gid | VRF cookie |
         # | 10  | 10:10::2/128 | 6          | 0       |            |
-        p1 = re.compile(r'^\|\s*(?P<sgt>\d+)\s*\|\s*(?P<ip_address>[0-9a-fA-F:.\/]+)\s*\|\s*(?P<ip_version>\d+)\s*\|\s*(?P<vrf_gid>\d+)\s*\|\s*(?P<vrf_cookie>.*?)\s*\|$')
+        p1 = regex_engine.compile(r'^\|\s*(?P<sgt>\d+)\s*\|\s*(?P<ip_address>[0-9a-fA-F:.\/]+)\s*\|\s*(?P<ip_version>\d+)\s*\|\s*(?P<vrf_gid>\d+)\s*\|\s*(?P<vrf_cookie>.*?)\s*\|$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6716,7 +6717,7 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicInsightS1SecGroupsMatrixMapStatu
         ret_dict = {}
         
         # R| 65535 | 65534 | IPV4       | True         | 1       | 2000    |            | 1999             | 0              | 0            | 
-        p1 = re.compile(r'^\|\s*(?P<sgt>\d+)\s*\|\s*(?P<dgt>\d+)\s*\|\s*(?P<ip_version>\S+)\s*\|\s*(?P<monitor_mode>\S+)\s*\|\s*(?P<bincode>\d+)\s*\|\s*(?P<acl_oid>\d+)\s*\|\s*(?P<acl_cookie>\S*)\s*\|\s*(?P<cell_counter_oid>\d+)\s*\|\s*(?P<permit_counter>\d+)\s*\|\s*(?P<deny_counter>\d+)\s*\|$')
+        p1 = regex_engine.compile(r'^\|\s*(?P<sgt>\d+)\s*\|\s*(?P<dgt>\d+)\s*\|\s*(?P<ip_version>\S+)\s*\|\s*(?P<monitor_mode>\S+)\s*\|\s*(?P<bincode>\d+)\s*\|\s*(?P<acl_oid>\d+)\s*\|\s*(?P<acl_cookie>\S*)\s*\|\s*(?P<cell_counter_oid>\d+)\s*\|\s*(?P<permit_counter>\d+)\s*\|\s*(?P<deny_counter>\d+)\s*\|$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -6783,7 +6784,7 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicInsightL2MirrorCommandErspan(Sho
         # |          2 |            1 |            10 |         1.0 | 6c:b2:ae:4a:90:c5 | 4e:41:50:00:01:14 |        1 |  4.4.4.1  | 4.4.4.2 |     29130 | 255 | [10000,1180000] |
         # |            |              |               |             |                   |                   |          |           |         |           |     |                 |
         # +------------+--------------+---------------+-------------+-------------------+-------------------+----------+-----------+---------+-----------+-----+-----------------+
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\|\s*(?P<mirror_gid>\d+)\s*\|\s*(?P<dest_port_tc>\d+)\s*\|\s*"
             r"(?P<dest_port_gid>\d+)\s*\|\s*(?P<probability>[\d.]+)\s*\|\s*"
             r"(?P<source_mac>[\da-fA-F:]+)\s*\|\s*(?P<dest_mac>[\da-fA-F:]+)\s*\|\s*"
@@ -6852,8 +6853,8 @@ class ShowPlatformHardwareFedSwitchActiveFwdAsicInsightL2MirrorCommandStatus(Sho
         # | Mirror GID | Mirror Type | Dest port GID | Dest port TC |
         # +------------+-------------+---------------+--------------+
         # |         21 |      L2     |           260 |            2 |
-        p1 = re.compile(r"^\|\s*(?P<mirror_gid>\d+)\s*\|\s*(?P<mirror_type>\S+)\s*\|\s*"
-                        r"(?P<dest_port_gid>\d+)\s*\|\s*(?P<dest_port_tc>\d+)\s*\|$")
+        p1 = regex_engine.compile(r"^\|\s*(?P<mirror_gid>\d+)\s*\|\s*(?P<mirror_type>\S+)\s*\|\s*"
+                                  r"(?P<dest_port_gid>\d+)\s*\|\s*(?P<dest_port_tc>\d+)\s*\|$")
                         
         for line in output.splitlines():
             line = line.strip()
@@ -11,7 +11,6 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 import logging
 from collections import OrderedDict
 import xml.etree.ElementTree as ET
@@ -20,6 +19,7 @@ from xml.dom import minidom
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, ListOf 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -62,7 +62,7 @@ class ShowLoggingOnboardSwitchClilog(ShowLoggingOnboardSwitchClilogSchema):
 
         # 1    clear obfl switch 3 environment
         # 1    clear obfl switch 1
-        p1 = re.compile(r'(?P<count>\d)\s+(?P<command>clear+\s+obfl+\s+switch+\s+\d+(\s+.*)?)')
+        p1 = regex_engine.compile(r'(?P<count>\d)\s+(?P<command>clear+\s+obfl+\s+switch+\s+\d+(\s+.*)?)')
         
         for line in output.splitlines():
             line = line.strip()
@@ -107,13 +107,13 @@ class ShowLoggingOnboardSwitchActiveStatus(ShowLoggingOnboardSwitchActiveStatusS
             
         ret_dict ={}
         #Application Clilog:
-        p1 = re.compile(r'^Application (?P<application>\S+):$')
+        p1 = regex_engine.compile(r'^Application (?P<application>\S+):$')
         
         #Cli enable status: enabled
-        p2 = re.compile(r'^Cli (?P<enable_status>enable status): (?P<status>\S+)$')
+        p2 = regex_engine.compile(r'^Cli (?P<enable_status>enable status): (?P<status>\S+)$')
         
         # Path: /obfl0/
-        p3 = re.compile(r'^Path\: (?P<path>\S+)$')
+        p3 = regex_engine.compile(r'^Path\: (?P<path>\S+)$')
         
         for line in output.splitlines():
             line=line.strip()
@@ -201,44 +201,44 @@ class ShowLoggingOnboardSwitchActiveUptimeDetail(ShowLoggingOnboardSwitchActiveU
         ret_dict ={}
         
         #First customer power on : 06/22/2021 12:35:40
-        p1 = re.compile(r'^First customer power on :?\s?(?P<first_customer_poweron>(\d+\/){2}\d+ \d+:\d+:\d+)$')
+        p1 = regex_engine.compile(r'^First customer power on :?\s?(?P<first_customer_poweron>(\d+\/){2}\d+ \d+:\d+:\d+)$')
         
         #Total uptime            :  0  years  12 weeks  1  days  17 hours  55 minutes
-        p2 = re.compile(r'^Total uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p2 = regex_engine.compile(r'^Total uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
         
         #Total downtime          :  2177 years  8  weeks  0  days  2  hours  29 minutes
-        p3 = re.compile(r'^Total downtime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p3 = regex_engine.compile(r'^Total downtime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
         
         #Number of resets        : 630
-        p4 = re.compile(r'^Number of resets\s+: (?P<numberof_reset>\d+)$')
+        p4 = regex_engine.compile(r'^Number of resets\s+: (?P<numberof_reset>\d+)$')
         
         #Number of slot changes  : 1
-        p5 = re.compile(r'^Number of slot changes\s+: (?P<numberof_slot_changes>\d+)$')
+        p5 = regex_engine.compile(r'^Number of slot changes\s+: (?P<numberof_slot_changes>\d+)$')
         
         #Current reset reason    : Reload Command
-        p6 = re.compile(r'^Current reset reason\s+: (?P<current_reset_reason>[A-Z a-z\S]+)$')
+        p6 = regex_engine.compile(r'^Current reset reason\s+: (?P<current_reset_reason>[A-Z a-z\S]+)$')
         
         #Current reset timestamp : 10/06/2019 01:28:26
-        p7 = re.compile(r'^Current reset timestamp\s+: (?P<current_reset_timestamp>(\d+\/){2}\d+.*)$')
+        p7 = regex_engine.compile(r'^Current reset timestamp\s+: (?P<current_reset_timestamp>(\d+\/){2}\d+.*)$')
         
         #Current slot            : 1
-        p8 = re.compile(r'^Current slot\s+: (?P<current_slot>\d+)$')
+        p8 = regex_engine.compile(r'^Current slot\s+: (?P<current_slot>\d+)$')
         
         #Chassis type            : 80
-        p9 = re.compile(r'^Chassis type\s+: (?P<chassis_type>\w+)$')
+        p9 = regex_engine.compile(r'^Chassis type\s+: (?P<chassis_type>\w+)$')
         
         #Current uptime          :  0  years  1  weeks  1  days  0  hours  0  minutes
-        p10 = re.compile(r'^Current uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
+        p10 = regex_engine.compile(r'^Current uptime\s+:\s+(?P<years>\d+)\s+\w+\s+(?P<weeks>\d+)\s+\w+\s+(?P<days>\d+)\s+\w+\s+(?P<hours>\d+)\s+\w+\s+(?P<minutes>\d+)\s+\w+$')
         
         #05/16/2015 16:31:49   Reload Command                0     0     0     0     0
-        p11 = re.compile(r'^(?P<date>\d+/+\d+/+\d+)+\s+(?P<time>\d+:+\d+:+\d+)+\s+(?P<reason>\S+\s+\D+)+\s+(?P<years>\d)+\s+(?P<weeks>\d)+\s+(?P<days>\d)+\s+(?P<hours>\d)+\s+(?P<minutes>\d+)$')
+        p11 = regex_engine.compile(r'^(?P<date>\d+/+\d+/+\d+)+\s+(?P<time>\d+:+\d+:+\d+)+\s+(?P<reason>\S+\s+\D+)+\s+(?P<years>\d)+\s+(?P<weeks>\d)+\s+(?P<days>\d)+\s+(?P<hours>\d)+\s+(?P<minutes>\d+)$')
 
         # 10/31/2024 12:12:56   Admin reload CLI
         # 11/03/2024 11:25:31   redundancy force-switchover
-        p12 = re.compile(r'^(?P<date>\d+\/\d+\/\d+)\s+(?P<time>\d+\:+\d+\:+\d+)\s+(?P<reason>.+)$')
+        p12 = regex_engine.compile(r'^(?P<date>\d+\/\d+\/\d+)\s+(?P<time>\d+\:+\d+\:+\d+)\s+(?P<reason>.+)$')
 
         # 0     0     0     3     0
-        p13 = re.compile(r'^(?P<years>\d+)\s+(?P<weeks>\d+)\s+(?P<days>\d+)\s+(?P<hours>\d+)\s+(?P<minutes>\d+)$')
+        p13 = regex_engine.compile(r'^(?P<years>\d+)\s+(?P<weeks>\d+)\s+(?P<days>\d+)\s+(?P<hours>\d+)\s+(?P<minutes>\d+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -419,16 +419,16 @@ class ShowLoggingOnboardSwitchContinuous(ShowLoggingOnboardSwitchContinuousSchem
             output = self.device.execute(self.cli_command.format(switch_num=switch_num,include=include))
 			
         #VOLTAGE CONTINUOUS INFORMATION
-        p1 = re.compile(r'^(?P<continuous_info>[A-Z ]+) CONTINUOUS INFORMATION$')
+        p1 = regex_engine.compile(r'^(?P<continuous_info>[A-Z ]+) CONTINUOUS INFORMATION$')
 
         #PS1 Vout 0
-        p2 = re.compile(r'^(\w+\: )?(?P<sensor_name>\w+.*?)\s+(?P<sensor_count>\d+)$')
+        p2 = regex_engine.compile(r'^(\w+\: )?(?P<sensor_name>\w+.*?)\s+(?P<sensor_count>\d+)$')
 
         #05/25/2015 04:09:00  56  210  10  28  177  157   0   0   0   0   0   0   0   0   0   0   0   0   0   0
-        p3 = re.compile(r'^(?P<time>\d+\/\d+\/\d+ \d+:\d+:\d+)\s+(?P<sensor_value>[\d\s]+).*$')
+        p3 = regex_engine.compile(r'^(?P<time>\d+\/\d+\/\d+ \d+:\d+:\d+)\s+(?P<sensor_value>[\d\s]+).*$')
         
         #05/16/2015 15:57:21 %NYQ-2-PLATFORM_PSFAN_NOT_PRESENT : OBFL PS-FAN NOT PRESENT : FEP fan PS-2
-        p4 = re.compile(r'^(?P<time>\d+\/\d+\/\d+ \d+:\d+:\d+)\s+%(?P<info>\S+\s+\:+.*)$')
+        p4 = regex_engine.compile(r'^(?P<time>\d+\/\d+\/\d+ \d+:\d+:\d+)\s+%(?P<info>\S+\s+\:+.*)$')
 
         sensor_list=[]
         ret_dict = {}
@@ -529,10 +529,10 @@ class ShowLoggingOnboardSwitchEnvironmentContinuous(ShowLoggingOnboardSwitchEnvi
         ret_dict = {}
 
         #11/24/2022 05:56:13                    NA          Port-0          0       Rmv 
-        p1=re.compile(r'^(?P<date>\d+/+\d+/\d+)+\s+(?P<time>\d+.+\d+.\d+)\s+(?P<device_name>\S+)\s+(?P<ios_version>\S+)\s+(?P<fw_ver_bias_ver>\S+)\s+(?P<event>\S+)$')
+        p1=regex_engine.compile(r'^(?P<date>\d+/+\d+/\d+)+\s+(?P<time>\d+.+\d+.\d+)\s+(?P<device_name>\S+)\s+(?P<ios_version>\S+)\s+(?P<fw_ver_bias_ver>\S+)\s+(?P<event>\S+)$')
 
         #V01 STACK-T1-50CM         Stack-Cable LCC2131G3TH 
-        p2=re.compile(r'^(?P<vid_pid>\S+\s+STACK+.\S+)+\s+(?P<tan>\S+)+\s(?P<serial_no>\S+)$')
+        p2=regex_engine.compile(r'^(?P<vid_pid>\S+\s+STACK+.\S+)+\s+(?P<tan>\S+)+\s(?P<serial_no>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -592,7 +592,7 @@ class ShowLoggingOnboardSwitchDetail(ShowLoggingOnboardSwitchDetailSchema):
         ret_dict = {}
 
         #Number of sensors          : 20
-        p1 = re.compile(r'^Number +of +sensors +: +(?P<number_of_sensors>\d+)$')
+        p1 = regex_engine.compile(r'^Number +of +sensors +: +(?P<number_of_sensors>\d+)$')
 
         #--------------------------------------------------------------------------------
         #Sensor                    ID         Normal Range          Maximum Sensor Value
@@ -603,7 +603,7 @@ class ShowLoggingOnboardSwitchDetail(ShowLoggingOnboardSwitchDetailSchema):
         #PS1 Curout                3          0 - 5                 31
         #PS1 POWin                 4          0 - 5                 202
 
-        p2 = re.compile(r'^(?P<sensors>.+?)\s+(?P<sensor_id>\d+)\s+(?P<normal_range_min>\d+) - (?P<normal_range_max>\d+)\s+(?P<maximum_sensor_value>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<sensors>.+?)\s+(?P<sensor_id>\d+)\s+(?P<normal_range_min>\d+) - (?P<normal_range_max>\d+)\s+(?P<maximum_sensor_value>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -671,7 +671,7 @@ class ShowLoggingOnboardSwitchMessageDetail(ShowLoggingOnboardSwitchMessageDetai
         #05/16/2015 21:39:57 %NYQ-2-PLATFORM_PSFAN_NOT_PRESENT :  >254 LAST  OBFL PS-FAN NOT PRESENT : FEP fan PS-2
         #05/16/2015 21:39:57 %NYQ-2-PLATFORM_PSFAN_PRESENT :  >254 LAST  OBFL PS-FAN PRESENT : FEP fan PS-1
 
-        p1 = re.compile(r'^(?P<time>\d+\/\d+\/\d+ \d+:\d+:\d+)\s+%(?P<info>\S+\s+\:+.*)$')		
+        p1 = regex_engine.compile(r'^(?P<time>\d+\/\d+\/\d+ \d+:\d+:\d+)\s+%(?P<info>\S+\s+\:+.*)$')		
 	
         for line in output.splitlines():
             line = line.strip()
@@ -730,13 +730,13 @@ class ShowEnvironmentFan(ShowEnvironmentFanSchema):
             # 1       1     5600      OK     Front to Back
             # 1       2     5600      OK     Front to Back
 
-            p1=re.compile(r'^(?P<switch>\d)+\s+(?P<fan>\d)+\s+(?P<speed>\d+)\s+(?P<state>\S+)\s+(?P<airflow_direction>\S+\s+\S+\s+\S+)$')
+            p1=regex_engine.compile(r'^(?P<switch>\d)+\s+(?P<fan>\d)+\s+(?P<speed>\d+)\s+(?P<state>\S+)\s+(?P<airflow_direction>\S+\s+\S+\s+\S+)$')
 
             #FAN PS-1 is OK
-            p2=re.compile(r'^FAN+\s+PS-1+\s+\S+\s+(?P<fan_ps1>\S+)$')
+            p2=regex_engine.compile(r'^FAN+\s+PS-1+\s+\S+\s+(?P<fan_ps1>\S+)$')
 
             #FAN PS-2 is NOT PRESENT
-            p3=re.compile(r'^FAN+\s+PS-2+\s+\S+\s+(?P<fan_ps2>\S+.*)$')
+            p3=regex_engine.compile(r'^FAN+\s+PS-2+\s+\S+\s+(?P<fan_ps2>\S+.*)$')
 
             # 1       2     5600      OK     Front to Back
             m = p1.match(line)
@@ -811,10 +811,10 @@ class ShowEnvironmentPowerAll(ShowEnvironmentPowerAllSchema):
             line=line.strip()
 
             #1A  PWR-C1-1100WAC      DTN2129V1AG  OK              Good     Good     1100
-            p1=re.compile(r'^(?P<sw>\d\S)+\s+(?P<pid>\S+)\s+(?P<serial>\S+)\s+(?P<status>\S+)\s+(?P<sys_pwr>\w+)+\s+(?P<poe_pwr>\S+)\s+(?P<watts>\S+)$')
+            p1=regex_engine.compile(r'^(?P<sw>\d\S)+\s+(?P<pid>\S+)\s+(?P<serial>\S+)\s+(?P<status>\S+)\s+(?P<sys_pwr>\w+)+\s+(?P<poe_pwr>\S+)\s+(?P<watts>\S+)$')
        
             #1B  Not Present
-            p2=re.compile(r'^(?P<sw>\d+\S)\s+(?P<pid>Not Present)$')
+            p2=regex_engine.compile(r'^(?P<sw>\d+\S)\s+(?P<pid>Not Present)$')
 
             #1A  PWR-C1-1100WAC      DTN2129V1AG  OK              Good     Good     1100
             m = p1.match(line)
@@ -873,7 +873,7 @@ class ShowLoggingOnboardRpClilog(ShowLoggingOnboardSwitchClilogSchema):
         ret_dict = {}
 
         # 1    clear obfl RP active
-        p1 = re.compile(r'(?P<count>\d)\s+(?P<command>clear\s+logging\s+onboard\s+RP\s+.*)')
+        p1 = regex_engine.compile(r'(?P<count>\d)\s+(?P<command>clear\s+logging\s+onboard\s+RP\s+.*)')
         
         for line in output.splitlines():
             line = line.strip()
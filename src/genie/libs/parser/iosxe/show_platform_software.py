@@ -34,7 +34,6 @@
 """
 
 # Python
-import re
 import logging
 from collections import OrderedDict
 from sys import int_info
@@ -44,6 +43,7 @@ from xml.dom import minidom
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -87,13 +87,13 @@ class ShowPlatformSoftwareSlotActiveMonitorMem(
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^KiB +Mem *: +(?P<total>\d+) *total, +"
             r"(?P<free>\d+) *free, +(?P<used>\d+) *used, +"
             r"(?P<buff_cache>\d+) *buff\/cache$"
         )
 
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^KiB +Swap *: +(?P<total>\d+) *total, +"
             r"(?P<free>\d+) *free, +(?P<used>\d+) *used. +"
             r"(?P<available_memory>\d+) *avail +Mem$"
@@ -186,19 +186,19 @@ class ShowPlatformSoftwareStatusControl(ShowPlatformSoftwareStatusControlSchema)
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<slot>\S+) +(?P<status>\w+) +"
             r"(?P<min1>[\d\.]+) +(?P<min5>[\d\.]+) +(?P<min15>[\d\.]+)$"
         )
 
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<slot>\S+) +(?P<status>\w+) +"
             r"(?P<total>\d+) +(?P<used>\d+) +\((?P<used_percentage>[\d\s]+)\%\) +"
             r"(?P<free>\d+) +\((?P<free_percentage>[\d\s]+)\%\) +"
             r"(?P<committed>\d+) +\((?P<committed_percentage>[\d\s]+)\%\)$"
         )
 
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^((?P<slot>\S+) +)?(?P<cpu>\d+) +(?P<user>[\d\.]+) +(?P<system>[\d\.]+) +(?P<nice_process>[\d\.]+) +(?P<idle>[\d\.]+) +(?P<irq>[\d\.]+) +(?P<sirq>[\d\.]+) +(?P<waiting>[\d\.]+)$"
         )
 
@@ -293,13 +293,13 @@ class ShowPlatformSoftwareMemoryCallsite(ShowPlatformSoftwareMemoryCallsiteSchem
             callsite_dict = parsed_dict.setdefault("callsites", {})
 
         # The current tracekey is   : 1#2315ece11e07bc883d89421df58e37b6
-        p1 = re.compile(r"The +current +tracekey +is\s*: +(?P<tracekey>[#\d\w]*)")
+        p1 = regex_engine.compile(r"The +current +tracekey +is\s*: +(?P<tracekey>[#\d\w]*)")
 
         # callsite      thread    diff_byte               diff_call
         # ----------------------------------------------------------
         # 1617611779    31884     57424                   2
         # 16A761F779    31884     37424                   21
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"(?P<callsite>([0-9a-fA-F]+))\s+(?P<thread>(\d+))\s+(?P<diffbyte>(\d+))\s+(?P<diffcall>(\d+))"
         )
 
@@ -367,15 +367,15 @@ class ShowPlatformSoftwareMemoryBacktrace(ShowPlatformSoftwareMemoryBacktraceSch
             backtraces_dict = parsed_dict.setdefault("backtraces", {})
 
         # backtrace: 1#2315ece11e07bc883d89421df58e37b6   maroon:7F740DEDC000+61F6 tdllib:7F7474D05000+B2B46 ui:7F74770E4000+4639A ui:7F74770E4000+4718C cdlcore:7F7466A6B000+37C95 cdlcore:7F7466A6B000+37957 uipeer:7F747A7A8000+24F2A evutil:7F747864E000+7966 evutil:7F747864E000+7745
-        p1 = re.compile(r"backtrace: (?P<backtrace>[\w#\d\s:+]+)$")
+        p1 = regex_engine.compile(r"backtrace: (?P<backtrace>[\w#\d\s:+]+)$")
 
         #   callsite: 2150603778, thread_id: 31884
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"callsite: +(?P<callsite>\d+), +thread_id: +(?P<thread_id>\d+)"
         )
 
         #   allocs: 1, frees: 0, call_diff: 1
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"allocs: +(?P<allocs>(\d+)), +frees: +(?P<frees>(\d+)), +call_diff: +(?P<call_diff>(\d+))"
         )
 
@@ -436,7 +436,7 @@ class ShowPlatformSoftwareYangManagementProcess(
         # confd            : Running
         # pubd             : Running
         # gnmib            : Not Running
-        p1 = re.compile(r"^(?P<key>\S+) *: +(?P<data>(Running|Not +Running))$")
+        p1 = regex_engine.compile(r"^(?P<key>\S+) *: +(?P<data>(Running|Not +Running))$")
 
         ret_dict = dict()
 
@@ -489,7 +489,7 @@ class ShowPlatformSoftwareYangManagementProcessMonitor(
 
         # dmiauthd          551 S 376940 49600  0.0  0.6    21:44:33
         # ncsshd           1503 S 301344 17592  0.0  0.2    21:44:32
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<command>\S+) +(?P<pid>\d+) +(?P<s>\S+) +(?P<vsz>\d+) +"
             r"(?P<rss>\d+) +(?P<cpu>\S+) +(?P<mem>\S+) +(?P<elapsed>\S+)$"
         )
@@ -555,13 +555,13 @@ class ShowPlatformSoftwareYangManagementProcessState(
 
         # Confd Status: Started
         # Confd Status: Not Running
-        p1 = re.compile(r"^Confd +Status: +(?P<status>.+)$")
+        p1 = regex_engine.compile(r"^Confd +Status: +(?P<status>.+)$")
 
         # pubd                 Running             Active
         # gnmib                Not Running         Not Applicable
         # ndbmand              Not Running         Down
         # pubd                 Running             Reset
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<process>\S+) +(?P<status>(Running|Not +Running)) +"
             r"(?P<state>(Active|Not +Active|Not +Applicable|Down|Reset|Init|Failed|Invalid))$"
         )
@@ -632,16 +632,16 @@ class ShowPlatformSoftwareMemoryRpActive(ShowPlatformSoftwareMemoryRpActiveSchem
         ret_dict = {}
 
         # Module: process
-        p1 = re.compile(r"Module: +(?P<module>[\S\s]+)$")
+        p1 = regex_engine.compile(r"Module: +(?P<module>[\S\s]+)$")
 
         # allocated: 16695, requested: 16647, overhead: 48
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"allocated: +(?P<allocated>\d+), +requested: +"
             r"(?P<requested>\d+), +overhead: +(?P<overhead>\d+)$"
         )
 
         # Allocations: 3, failed: 0, frees: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"Allocations: +(?P<allocations>\d+), +failed: +"
             r"(?P<failed>\d+), +frees: +(?P<frees>\d+)$"
         )
@@ -749,7 +749,7 @@ class ShowPlatformSoftwareMemoryRpActiveBrief(
         ret_dict = {}
 
         # Summary                 420136        364136        3706          206
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<module>\S+) +(?P<allocated>\d+) +"
             r"(?P<requested>\d+) +(?P<allocs>\d+) +(?P<frees>\d+)$"
         )
@@ -849,12 +849,12 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsite(
         ret_dict = {}
 
         # callsite: 1355696130, thread_id: 24813
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^callsite: +(?P<callsite>\d+), +thread_id: +(?P<thread_id>\d+)$"
         )
 
         # allocs: 138151, frees: 138141, alloc_bytes: 15466123, free_bytes: 15464846, call_diff: 10, byte_diff: 1277
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^allocs: +(?P<allocs>\d+), +frees: +(?P<frees>\d+), +"
             r"alloc_bytes: +(?P<alloc_bytes>\d+), +free_bytes: +(?P<free_bytes>\d+), +"
             r"call_diff: +(?P<call_diff>\d+), +byte_diff: +(?P<byte_diff>\d+)$"
@@ -946,10 +946,10 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsiteBrief(
         ret_dict = {}
 
         # callsite: 1355696130, thread_id: 24813
-        p1 = re.compile(r"^The +current +tracekey +is +: +(?P<tracekey>\S+)$")
+        p1 = regex_engine.compile(r"^The +current +tracekey +is +: +(?P<tracekey>\S+)$")
 
         # allocs: 138151, frees: 138141, alloc_bytes: 15466123, free_bytes: 15464846, call_diff: 10, byte_diff: 1277
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<callsite>\d+) +(?P<thread_id>\d+) +(?P<diff_byte>\d+) +(?P<diff_call>\d+)$"
         )
 
@@ -1032,19 +1032,19 @@ class ShowPlatformSoftwareMemoryRpActiveAllocType(
         ret_dict = {}
 
         # Module: process
-        p1 = re.compile(r"Module: +(?P<module>[\S\s]+)$")
+        p1 = regex_engine.compile(r"Module: +(?P<module>[\S\s]+)$")
 
         # Type: process
-        p1_1 = re.compile(r"Type: +(?P<type>[\S\s]+)$")
+        p1_1 = regex_engine.compile(r"Type: +(?P<type>[\S\s]+)$")
 
         # allocated: 16695, requested: 16647, overhead: 48
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"Allocated: +(?P<allocated>\d+), +"
             r"Requested: +(?P<requested>\d+), +Overhead: +(?P<overhead>\d+)$"
         )
 
         # Allocations: 3, failed: 0, frees: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"Allocations: +(?P<allocations>\d+), +Null +Allocations: +"
             r"(?P<null_allocations>\d+), +Frees: +(?P<frees>\d+)$"
         )
@@ -1148,7 +1148,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocTypeBrief(
         ret_dict = {}
 
         # Summary                 4989412       4501988       150851        142147
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"(?P<type>\S+) +(?P<allocated>\d+) +"
             r"(?P<requested>\d+) +(?P<allocations>\d+) +(?P<frees>\d+)$"
         )
@@ -1238,13 +1238,13 @@ class ShowPlatformSoftwareIomdMacsecInterfaceBrief(
 
         ret_dict = {}
         # Tx SC
-        p1 = re.compile(r"(.*)Tx SC")
+        p1 = regex_engine.compile(r"(.*)Tx SC")
 
         # Rx SC
-        p2 = re.compile(r"(.*)Rx SC")
+        p2 = regex_engine.compile(r"(.*)Rx SC")
 
         # 3/11  |   0    |     3/0    | f87a41252702008b | 50331759/ 2/ 1  |     GCM_AES_128 |
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"(?P<if>\d+\/\d+) +\|"
             r" +(?P<sc_idx>\d+) +\|"
             r" +(?P<pre_cur_an>\d+\/\d+) +\|"
@@ -1390,68 +1390,68 @@ class ShowPlatformSoftwareIomdMacsecInterfaceDetail(
         ret_dict = {}
 
         # Port:3, Subport:11, Tx SC index:0
-        p1 = re.compile(r"Port\:\d+\, Subport\:(.*)\, Tx SC index")
+        p1 = regex_engine.compile(r"Port\:\d+\, Subport\:(.*)\, Tx SC index")
 
         # Port:3, Subport:11, Rx SC index:0
-        p2 = re.compile(r"Port\:\d+\, Subport\:(.*)\, Rx SC index")
+        p2 = regex_engine.compile(r"Port\:\d+\, Subport\:(.*)\, Rx SC index")
 
         # Prev AN: 3, Cur AN: 0
-        p3 = re.compile(r"Prev AN\: (?P<prev_an>\d+)\, Cur AN\: (?P<cur_an>\d+)")
+        p3 = regex_engine.compile(r"Prev AN\: (?P<prev_an>\d+)\, Cur AN\: (?P<cur_an>\d+)")
 
         # SA index: 50331759, vport index: 2, rule index: 1
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"SA index\: (?P<sa_index>\d+)\, +"
             r"vport index\: (?P<vport_index>\d+)\, +"
             r"rule index\: (?P<rule_index>\d+)"
         )
 
         # key_len: 16
-        p5 = re.compile(r"^key_len\: (?P<key_len>\d+)$")
+        p5 = regex_engine.compile(r"^key_len\: (?P<key_len>\d+)$")
 
         # hashkey_len: 16
-        p6 = re.compile(r"^hashkey_len\: (?P<hashkey_len>\d+)$")
+        p6 = regex_engine.compile(r"^hashkey_len\: (?P<hashkey_len>\d+)$")
 
         # bypass: 0
-        p7 = re.compile(r"^bypass\: (?P<bypass>\d+)$")
+        p7 = regex_engine.compile(r"^bypass\: (?P<bypass>\d+)$")
 
         # nextPn: 1
-        p8 = re.compile(r"^nextPn\: (?P<nextPn>\d+)$")
+        p8 = regex_engine.compile(r"^nextPn\: (?P<nextPn>\d+)$")
 
         # conf_offset: 0
-        p9 = re.compile(r"^conf_offset\: (?P<conf_offset>\d+)$")
+        p9 = regex_engine.compile(r"^conf_offset\: (?P<conf_offset>\d+)$")
 
         # encrypt: 1
-        p10 = re.compile(r"^encrypt\: (?P<encrypt>\d+)$")
+        p10 = regex_engine.compile(r"^encrypt\: (?P<encrypt>\d+)$")
 
         # vlan: 1
-        p11 = re.compile(r"^vlan\: (?P<vlan>\d+)$")
+        p11 = regex_engine.compile(r"^vlan\: (?P<vlan>\d+)$")
 
         # end_station: 0
-        p12 = re.compile(r"^end_station\: (?P<end_station>\d+)$")
+        p12 = regex_engine.compile(r"^end_station\: (?P<end_station>\d+)$")
 
         # scb: 0
-        p13 = re.compile(r"^scb\: (?P<scb>\d+)$")
+        p13 = regex_engine.compile(r"^scb\: (?P<scb>\d+)$")
 
         # cipher: GCM_AES_128
-        p14 = re.compile(r"^cipher\: (?P<cipher>\S+)$")
+        p14 = regex_engine.compile(r"^cipher\: (?P<cipher>\S+)$")
 
         # Delay protection: 0
-        p15 = re.compile(r"^Delay protection\: (?P<delay_protection>\d+)$")
+        p15 = regex_engine.compile(r"^Delay protection\: (?P<delay_protection>\d+)$")
 
         # replay_protect: 1
-        p16 = re.compile(r"^replay_protect\: (?P<replay_protect>\d+)$")
+        p16 = regex_engine.compile(r"^replay_protect\: (?P<replay_protect>\d+)$")
 
         # replay_window_size: 0
-        p17 = re.compile(r"^replay_window_size\: (?P<replay_window_size>\d+)$")
+        p17 = regex_engine.compile(r"^replay_window_size\: (?P<replay_window_size>\d+)$")
 
         # decrypt_frames: 1
-        p18 = re.compile(r"^decrypt_frames\: (?P<decrypt_frames>\d+)$")
+        p18 = regex_engine.compile(r"^decrypt_frames\: (?P<decrypt_frames>\d+)$")
 
         # validate_frames: 1
-        p19 = re.compile(r"^validate_frames\: (?P<validate_frames>\d+)$")
+        p19 = regex_engine.compile(r"^validate_frames\: (?P<validate_frames>\d+)$")
 
         # sci:ecce1346f902008c
-        p20 = re.compile(r"^sci\:(?P<sci>\S+)$")
+        p20 = regex_engine.compile(r"^sci\:(?P<sci>\S+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1667,20 +1667,20 @@ class ShowPlatformSoftwareObjectManagerF0PendingAckUpdate(
         sub_dict = {}
 
         # Update identifier: 305, Object identifier: 305
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Update identifier:\s+(?P<update_id>\d*)(?:,\s*)Object identifier:\s+(?P<object_id>\d*)$"
         )
 
         # Description: [aom_mlist_show_cb] mlist 2046
-        p2 = re.compile(r"^Description:\s*(?P<description>.*)$")
+        p2 = regex_engine.compile(r"^Description:\s*(?P<description>.*)$")
 
         # Action: Create, Pending seconds: 3930
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Action:\s*(?P<action>\w*)(?:,\s*)Pending seconds:\s*(?P<pending_sec>\d*)$"
         )
 
         # Number of retries: 0, Number of batch begin retries: 0, Number of nacked download retries: 0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Number of retries:\s*(?P<num_retries>\d*)(?:,\s*)"
             r"Number of batch begin retries:\s*(?P<number_batch_begin_retries>\d*)(?:,\s*)"
             r"Number of nacked download retries:\s*(?P<number_nacked_download_retries>\d*)$"
@@ -1773,7 +1773,7 @@ class ShowPlatformSoftwareDpidIndex(ShowPlatformSoftwareDpidIndexSchema):
             out = output
         result_dict = {}
         # Index 1030 -- swidb Hu1/0/1
-        p1 = re.compile(r"^Index\s+(?P<index>\d+)\s+--\s+swidb\s+(?P<interface>\S+)$")
+        p1 = regex_engine.compile(r"^Index\s+(?P<index>\d+)\s+--\s+swidb\s+(?P<interface>\S+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1818,7 +1818,7 @@ class ShowPlatformSoftwareDbalR0DataAll(ShowPlatformSoftwareDbalR0DataAllSchema)
 
         # SMD_CONF                  Local                       0                     0                30                 0                 0
 
-        pr = re.compile(
+        pr = regex_engine.compile(
             r"^(?P<db_name>\S+) +"
             r"(?P<db_mode>\S+) +"
             r"(?P<batches_waiting>\d+) +"
@@ -1884,7 +1884,7 @@ class ShowPlatformSoftwareInterfaceSwitchF0Brief(
         # initial variables
         ret_dict = {}
         # HundredGigE2/0/35/4                1285              1285
-        p1 = re.compile(r"^(?P<name>\S+)\s+(?P<id>\d+)\s+(?P<qfp_id>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<name>\S+)\s+(?P<id>\d+)\s+(?P<qfp_id>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1941,36 +1941,36 @@ class ShowPlatformSoftwareDnsUmbrellaStatistics(
         ret_dict = {}
 
         # Umbrella Statistics
-        p0 = re.compile(r"^Umbrella\s+Statistics$")
+        p0 = regex_engine.compile(r"^Umbrella\s+Statistics$")
 
         # Total Packets               : 57057
-        p1 = re.compile(r"^Total\s+Packets\s+:\s+(?P<TotalPacket>\d+)$")
+        p1 = regex_engine.compile(r"^Total\s+Packets\s+:\s+(?P<TotalPacket>\d+)$")
 
         # DNSCrypt queries            : 0
-        p2 = re.compile(r"^DNSCrypt\s+queries\s+:\s+(?P<DnsCryptQueri>\d+)$")
+        p2 = regex_engine.compile(r"^DNSCrypt\s+queries\s+:\s+(?P<DnsCryptQueri>\d+)$")
 
         # DNSCrypt responses          : 0
-        p3 = re.compile(r"^DNSCrypt\s+responses\s+:\s+(?P<DnsCryptResp>\d+)$")
+        p3 = regex_engine.compile(r"^DNSCrypt\s+responses\s+:\s+(?P<DnsCryptResp>\d+)$")
 
         # DNS queries                 : 32321
-        p4 = re.compile(r"^DNS\s+queries\s+:\s+(?P<DnsQueri>\d+)$")
+        p4 = regex_engine.compile(r"^DNS\s+queries\s+:\s+(?P<DnsQueri>\d+)$")
 
         # DNS bypassed queries(Regex) : 0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^DNS\s+bypassed\s+queries\(Regex\)\s+:\s+(?P<DnsBypassQueri>\d+)$"
         )
 
         # DNS responses(Umbrella)     : 24693
-        p6 = re.compile(r"^DNS\s+responses\(Umbrella\)\s+:\s+(?P<DnsUmbrellaResp>\d+)$")
+        p6 = regex_engine.compile(r"^DNS\s+responses\(Umbrella\)\s+:\s+(?P<DnsUmbrellaResp>\d+)$")
 
         # DNS responses(Other)        : 37
-        p7 = re.compile(r"^DNS\s+responses\(Other\)\s+:\s+(?P<DnsOtherResp>\d+)$")
+        p7 = regex_engine.compile(r"^DNS\s+responses\(Other\)\s+:\s+(?P<DnsOtherResp>\d+)$")
 
         # Aged queries                : 7628
-        p8 = re.compile(r"^Aged\s+queries\s+:\s+(?P<AgedQueri>\d+)$")
+        p8 = regex_engine.compile(r"^Aged\s+queries\s+:\s+(?P<AgedQueri>\d+)$")
 
         # Dropped pkts                : 0
-        p9 = re.compile(r"^Dropped\s+pkts\s+:\s+(?P<DroppedPkts>\d+)$")
+        p9 = regex_engine.compile(r"^Dropped\s+pkts\s+:\s+(?P<DroppedPkts>\d+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2086,7 +2086,7 @@ class ShowPlatformSoftwareCpmSwitchB0CountersDrop(
         ret_dict = {}
 
         # RX unexpected packet count                    311
-        p1 = re.compile(r"^(?P<drop_counters>[\w ]+)\s+(?P<drop_count>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<drop_counters>[\w ]+)\s+(?P<drop_count>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2159,62 +2159,62 @@ class ShowPlatformSoftwareCpmSwitchB0CountersPuntInject(
         temp_dict = {}
 
         # SVL CTRL           12673           12641                0                15
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<traffic_type>\w+\s+\w+)\s+(?P<packets_inject>\d+)\s+(?P<packets_punt>\d+)\s+(?P<drop_inject>\d+)\s+(?P<drop_punt>\d+)$"
         )
 
         # Timestamp Now: May 07 11:58:31.969
-        p2 = re.compile(r"^Timestamp +Now\: +(?P<timestamp_now>.*)$")
+        p2 = regex_engine.compile(r"^Timestamp +Now\: +(?P<timestamp_now>.*)$")
 
         # CTRL RX Timestamp: May 07 11:58:21.515 [1]
-        p3 = re.compile(r"^CTRL +RX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
+        p3 = regex_engine.compile(r"^CTRL +RX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
 
         # CTRL RX Maximum Time Gap:                4 sec,          941197usec
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^CTRL +RX +Maximum +Time +Gap\: +(?P<ctrl_rx_max_time_gap_sec>.*)$"
         )
 
         # CTRL RX Maximum Gap Timestamp: May 07 06:13:36.003
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^CTRL +RX +Maximum +Gap +Timestamp\: +(?P<ctrl_rx_max_timestamp>.*)$"
         )
 
         # CTRL TX Timestamp: May 07 11:58:20.859 [3]
-        p6 = re.compile(r"^CTRL +TX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
+        p6 = regex_engine.compile(r"^CTRL +TX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
 
         # CTRL TX Maximum Time Gap:                4 sec,          991449usec
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^CTRL +TX +Maximum +Time +Gap\: +(?P<ctrl_tx_max_time_gap_sec>.*)$"
         )
 
         # CTRL TX Maximum Gap Timestamp: May 07 05:25:53.959
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^CTRL +TX +Maximum +Gap +Timestamp\: +(?P<ctrl_tx_max_timestamp>.*)$"
         )
 
         # IPC RX Timestamp: May 07 11:58:31.882 [2]
-        p9 = re.compile(r"^IPC +RX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
+        p9 = regex_engine.compile(r"^IPC +RX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
 
         # IPC RX Maximum Time Gap:                4 sec,          350695usec
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^IPC +RX +Maximum +Time +Gap\: +(?P<ipc_rx_max_time_gap_sec>.*)$"
         )
 
         # IPC RX Maximum Gap Timestamp: May 07 05:29:06.825
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^IPC +RX +Maximum +Gap +Timestamp\: +(?P<ipc_rx_max_timestamp>.*)$"
         )
 
         # IPC TX Timestamp: May 07 11:58:31.869 [2]
-        p12 = re.compile(r"^IPC +TX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
+        p12 = regex_engine.compile(r"^IPC +TX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
 
         # IPC TX Maximum Time Gap:                1 sec,          953783usec
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^IPC +TX +Maximum +Time +Gap\: +(?P<ipc_tx_max_time_gap_sec>.*)$"
         )
 
         # IPC TX Maximum Gap Timestamp: May 07 05:21:16.021
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^IPC +TX +Maximum +Gap +Timestamp\: +(?P<ipc_tx_max_timestamp>.*)$"
         )
 
@@ -2376,10 +2376,10 @@ class ShowPlatformSoftwareCpmSwitchB0IpcBrief(
         ret_dict = {}
 
         # cpm-cm     connected
-        p1 = re.compile(r"^cpm-cm\s+(?P<cpm_cm>\w+)$")
+        p1 = regex_engine.compile(r"^cpm-cm\s+(?P<cpm_cm>\w+)$")
 
         # cpm-fed    connected
-        p2 = re.compile(r"^cpm-fed\s+(?P<cpm_fed>\w+)$")
+        p2 = regex_engine.compile(r"^cpm-fed\s+(?P<cpm_fed>\w+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2442,46 +2442,46 @@ class ShowPlatformSoftwareCpmSwitchB0IpcDetail(
         ret_dict = {}
 
         # Service: cpm-cm
-        p1 = re.compile(r"^Service:\s+(?P<service>\S+)$")
+        p1 = regex_engine.compile(r"^Service:\s+(?P<service>\S+)$")
 
         # Peer Location: -1
-        p2 = re.compile(r"^Peer Location:\s+(?P<peer_location>\S+)$")
+        p2 = regex_engine.compile(r"^Peer Location:\s+(?P<peer_location>\S+)$")
 
         # Peer State: 2
-        p3 = re.compile(r"^Peer State:\s+(?P<peer_state>\d+)$")
+        p3 = regex_engine.compile(r"^Peer State:\s+(?P<peer_state>\d+)$")
 
         # Connection Drops: 0
-        p4 = re.compile(r"^Connection Drops:\s+(?P<connection_drops>\d+)$")
+        p4 = regex_engine.compile(r"^Connection Drops:\s+(?P<connection_drops>\d+)$")
 
         # Flow Control: 0
-        p5 = re.compile(r"^Flow Control:\s+(?P<flow_control>\d+)$")
+        p5 = regex_engine.compile(r"^Flow Control:\s+(?P<flow_control>\d+)$")
 
         # Transition Count: 0
-        p6 = re.compile(r"^Transition Count:\s+(?P<transition_count>\d+)$")
+        p6 = regex_engine.compile(r"^Transition Count:\s+(?P<transition_count>\d+)$")
 
         # Received Msgs: 1
-        p7 = re.compile(r"^Received Msgs:\s+(?P<received_msgs>\d+)$")
+        p7 = regex_engine.compile(r"^Received Msgs:\s+(?P<received_msgs>\d+)$")
 
         # TDL hdl failure: 0
-        p8 = re.compile(r"^TDL hdl failure:\s+(?P<tdl_hdl_failure>\d+)$")
+        p8 = regex_engine.compile(r"^TDL hdl failure:\s+(?P<tdl_hdl_failure>\d+)$")
 
         # Dispatch failures: 1
-        p9 = re.compile(r"^Dispatch failures:\s+(?P<dispatch_failures>\d+)$")
+        p9 = regex_engine.compile(r"^Dispatch failures:\s+(?P<dispatch_failures>\d+)$")
 
         # Rx Other Drops: 0
-        p10 = re.compile(r"^Rx Other Drops:\s+(?P<rx_other_drops>\d+)$")
+        p10 = regex_engine.compile(r"^Rx Other Drops:\s+(?P<rx_other_drops>\d+)$")
 
         # Sent msgs: 1
-        p11 = re.compile(r"^Sent msgs:\s+(?P<sent_msgs>\d+)$")
+        p11 = regex_engine.compile(r"^Sent msgs:\s+(?P<sent_msgs>\d+)$")
 
         # Tx No Mem failures: 0
-        p12 = re.compile(r"^Tx No Mem failures:\s+(?P<tx_no_mem_failures>\d+)$")
+        p12 = regex_engine.compile(r"^Tx No Mem failures:\s+(?P<tx_no_mem_failures>\d+)$")
 
         # Tx Other Drops: 0
-        p13 = re.compile(r"^Tx Other Drops:\s+(?P<tx_other_drops>\d+)$")
+        p13 = regex_engine.compile(r"^Tx Other Drops:\s+(?P<tx_other_drops>\d+)$")
 
         # Tx No Space failures: 0
-        p14 = re.compile(r"^Tx No Space failures:\s+(?P<tx_no_space_failures>\d+)$")
+        p14 = regex_engine.compile(r"^Tx No Space failures:\s+(?P<tx_no_space_failures>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2622,16 +2622,16 @@ class ShowPlatformSoftwareCpmSwitchB0ControlInfo(
         ret_dict = {}
 
         # System port: 98
-        p1 = re.compile(r"^System port: (?P<system_port>\d+)$")
+        p1 = regex_engine.compile(r"^System port: (?P<system_port>\d+)$")
 
         # SVL Control Interface: HundredGigE1/0/2
-        p2 = re.compile(r"^SVL Control Interface: (?P<svl_control_interface>\S+)$")
+        p2 = regex_engine.compile(r"^SVL Control Interface: (?P<svl_control_interface>\S+)$")
 
         # 27                  FiftyGigE1/0/56
-        p1_2 = re.compile(r"^(?P<system_port>\s*\d+)\s+(?P<svl_control_interface>\S+)$")
+        p1_2 = regex_engine.compile(r"^(?P<system_port>\s*\d+)\s+(?P<svl_control_interface>\S+)$")
 
         # 0x2c       0x2c     28       etherchannel
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<if_id>\S+)\s+(?P<ec_if_id>\S+)\s+(?P<system_port>\d+)\s+(?P<if_type>\S+)$"
         )
 
@@ -2700,13 +2700,13 @@ class ShowPlatformSoftwareCpmSwitchB0Resource(
         ret_dict = {}
 
         # oobnd1          UP
-        p1 = re.compile(r"^oobnd1\s+(?P<oobnd1>UP|DOWN)$")
+        p1 = regex_engine.compile(r"^oobnd1\s+(?P<oobnd1>UP|DOWN)$")
 
         # leaba0_3        UP
-        p2 = re.compile(r"^leaba0_3\s+(?P<leaba0_3>UP|DOWN)$")
+        p2 = regex_engine.compile(r"^leaba0_3\s+(?P<leaba0_3>UP|DOWN)$")
 
         # leaba0_5        UP
-        p3 = re.compile(r"^leaba0_5\s+(?P<leaba0_5>UP|DOWN)$")
+        p3 = regex_engine.compile(r"^leaba0_5\s+(?P<leaba0_5>UP|DOWN)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2792,50 +2792,50 @@ class ShowPlatformSoftwareObjectManagerFpActiveStatistics(
         ret_dict = {}
 
         # Object update: Pending-issue: 7083, Pending-acknowledgement: 14101
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^Object update: +Pending-issue: +(?P<pending_issue>\d+), +Pending-acknowledgement: +(?P<pending_acknowledgement>\d+)$"
         )
 
         # Batch begin:   Pending-issue: 0, Pending-acknowledgement: 0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Batch begin: + Pending-issue: +(?P<pending_issue>\d)+, +Pending-acknowledgement: +(?P<pending_acknowledgement>\d+)$"
         )
 
         # Batch end:     Pending-issue: 0, Pending-acknowledgement: 0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Batch end: + Pending-issue: +(?P<pending_issue>\d)+, +Pending-acknowledgement: +(?P<pending_acknowledgement>\d+)$"
         )
 
         # Command:       Pending-acknowledgement: 54
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Command: + Pending-acknowledgement: +(?P<pending_acknowledgement>\d+)$"
         )
 
         # Total-objects: 30105
-        p4 = re.compile(r"^Total-objects: +(?P<total_objects>\d+)$")
+        p4 = regex_engine.compile(r"^Total-objects: +(?P<total_objects>\d+)$")
 
         # Stale-objects: 0
-        p5 = re.compile(r"^Stale-objects: +(?P<stale_objects>\d+)$")
+        p5 = regex_engine.compile(r"^Stale-objects: +(?P<stale_objects>\d+)$")
 
         # Resolve-objects: 0
-        p6 = re.compile(r"^Resolve-objects: +(?P<resolve_objects>\d+)$")
+        p6 = regex_engine.compile(r"^Resolve-objects: +(?P<resolve_objects>\d+)$")
 
         # Childless-delete-objects: 0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Childless-delete-objects: +(?P<childless_delete_objects>\d+)$"
         )
 
         # Backplane-objects: 0
-        p8 = re.compile(r"^Backplane-objects: +(?P<backplane_objects>\d+)$")
+        p8 = regex_engine.compile(r"^Backplane-objects: +(?P<backplane_objects>\d+)$")
 
         # Error-objects: 0
-        p9 = re.compile(r"^Error-objects: +(?P<error_objects>\d+)$")
+        p9 = regex_engine.compile(r"^Error-objects: +(?P<error_objects>\d+)$")
 
         # Number of bundles: 0
-        p10 = re.compile(r"^Number of bundles: +(?P<number_of_bundles>\d+)$")
+        p10 = regex_engine.compile(r"^Number of bundles: +(?P<number_of_bundles>\d+)$")
 
         # Paused-types: 0
-        p11 = re.compile(r"^Paused-types: +(?P<paused_types>\d+)$")
+        p11 = regex_engine.compile(r"^Paused-types: +(?P<paused_types>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2975,7 +2975,7 @@ class ShowPlatformSoftwareInstallManagerRpActiveOperationHistorySummary(
         ret_dict = {}
         index = 0
         # 2021_11_02_06_50_44_op_rollback  1        rollback     Fail    00:00:04   [2021-11-02 06:50:44 - 2021-11-02 06:50:48]
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"(?P<uuid>\S*)\s*(?P<op_id>\d+)\s*(?P<command>\S*)\s*(?P<status>\w+)\s*(?P<duration>\d+:\d+:\d+)\s*"
             r"\[(?P<start_date>\d+-\d+-\d+)\s*(?P<start_time>\d+:\d+:\d+)\s*-\s*(?P<end_date>\d+-\d+-\d+)\s*"
             r"(?P<end_time>\d+:\d+:\d+)\]"
@@ -3045,7 +3045,7 @@ class ShowPlatformSoftwareInstallManagerSwitchActiveR0OperationHistorySummary(
         ret_dict = {}
         index = 0
         # 2021_11_02_06_50_44_op_rollback  1        rollback     Fail    00:00:04   [2021-11-02 06:50:44 - 2021-11-02 06:50:48]
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"(?P<uuid>\S*)\s*(?P<op_id>\d+)\s*(?P<command>\S*)\s*(?P<status>\w+)\s*(?P<duration>\d+:\d+:\d+)\s*"
             r"\[(?P<start_date>\d+-\d+-\d+)\s*(?P<start_time>\d+:\d+:\d+)\s*-\s*(?P<end_date>\d+-\d+-\d+)\s*"
             r"(?P<end_time>\d+:\d+:\d+)\]"
@@ -3116,15 +3116,15 @@ class ShowPlatformSoftwareSteeringCellInfo(ShowPlatformSoftwareSteeringCellInfoS
         #   3861840057
 
         # SGT: 2057, DGT: 3003
-        p1 = re.compile(r"^SGT\s*:\s*(?P<sgt>\d+)\s*,\s*DGT\s*:\s*(?P<dgt>\d+)$")
+        p1 = regex_engine.compile(r"^SGT\s*:\s*(?P<sgt>\d+)\s*,\s*DGT\s*:\s*(?P<dgt>\d+)$")
 
         # Template name: V4GRPPLC9;00, No.of Policies: 1
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Template name\s*:\s*(?P<template_name>.+)\s*,\s*No.of Policies\s*:\s*(?P<number_of_policies>\d+)$"
         )
 
         #   3861840057
-        p3 = re.compile(r"^(?P<policy_id>\d+)$")
+        p3 = regex_engine.compile(r"^(?P<policy_id>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3450,26 +3450,26 @@ class ShowPlatformSoftwareBPCrimsonContentConfig(
 
         # Node    Domain    Mode          Router-ID
         # 1       1         Aggregation   0.0.0.0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"(?P<node>(\d)) +(?P<domain>(\d)) + (?P<mode>(\w+)) +(?P<router_id>(\S+))"
         )
 
         # FIPSKEY
         # 4D56F017FFC920A5FA0EF11397788E917931D1D1AE48F9C0
-        p2 = re.compile(r"^(?P<fipskey>(\w+)$)")
+        p2 = regex_engine.compile(r"^(?P<fipskey>(\w+)$)")
 
         # Node    Priority
         # 1       1
-        p3 = re.compile(r"^(?P<node_number>(\d)) +(?P<priority>(\d))")
+        p3 = regex_engine.compile(r"^(?P<node_number>(\d)) +(?P<priority>(\d))")
 
         # Configured SVL Links:
         # Link ID: 1
-        p4 = re.compile(r"^Link +ID+\: +(?P<link>\d+)")
+        p4 = regex_engine.compile(r"^Link +ID+\: +(?P<link>\d+)")
 
         # Interface                     Link    Slot:Bay:Port
         # HundredGigE1/0/13             1       1:0:13
         # HundredGigE1/0/14             1       1:0:14
-        p5 = re.compile(r"^(?P<interface>(\S+)) +(?P<link>(\d+)) +(?P<slot>(\S+))$")
+        p5 = regex_engine.compile(r"^(?P<interface>(\S+)) +(?P<link>(\d+)) +(?P<slot>(\S+))$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3556,7 +3556,7 @@ class ShowPlatformSoftwareNodeClusterManagerSwitchB0Node(
         # initial variables
         ret_dict = {}
         # Node status is : NODE_STATUS_UP
-        p1 = re.compile(r"^(?P<node_description>[\w\s]+)\: (?P<status>.*)$")
+        p1 = regex_engine.compile(r"^(?P<node_description>[\w\s]+)\: (?P<status>.*)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3613,7 +3613,7 @@ class ShowPlatformSoftwarePuntPolicer(ShowPlatformSoftwarePuntPolicerSchema):
         parsed_dict = {}
 
         #   2    IPv4 Options   4000     3000     0        0         0         0           4000     3000     Off      Off
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<punt_cause>\d+)\s+(?P<description>(([A-Za-z0-9_-]+ ?){5}).*\s+|([A-Za-z0-9_-]+ ?))"
             r"\s+(?P<config_rate_normal_pps>\d+)\s+(?P<config_rate_high_pps>\d+)\s+(?P<conform_pkts_normal>\d+)"
             r"\s+(?P<conform_pkts_high>\d+)\s+(?P<dropped_pkts_normal>\d+)\s+(?P<dropped_pkts_high>\d+)"
@@ -3698,17 +3698,17 @@ class ShowPlatformSoftwareFactoryResetSecureLog(
         ret_dict = {}
 
         # START : 13-07-2022, 06:27:18
-        p0 = re.compile(r".*START\s+:\s+(?P<start_time>.*)")
+        p0 = regex_engine.compile(r".*START\s+:\s+(?P<start_time>.*)")
 
         #   END : 13-07-2022, 06:30:01
-        p1 = re.compile(r".*END\s+:\s+(?P<end_time>.*)")
+        p1 = regex_engine.compile(r".*END\s+:\s+(?P<end_time>.*)")
 
         #  -eMMC-
-        p2 = re.compile(r"-(?P<partition>\S+)-$")
+        p2 = regex_engine.compile(r"-(?P<partition>\S+)-$")
 
         #  PNM : nor
         #  NIST : PURGE
-        p3 = re.compile(r"^(?P<partition_key>\S+)\s+:\s+(?P<partition_value>\S+)")
+        p3 = regex_engine.compile(r"^(?P<partition_key>\S+)\s+:\s+(?P<partition_value>\S+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3788,31 +3788,31 @@ class ShowPlatformSoftInfraBipc(ShowPlatformSoftInfraBipcSchema):
         parsed_dict = {}
 
         # 338036 total buffers allocated
-        p1 = re.compile(r"^(?P<total>\d+)\s+total\s+buffers\s+allocated$")
+        p1 = regex_engine.compile(r"^(?P<total>\d+)\s+total\s+buffers\s+allocated$")
 
         # 338036 total buffers freed
-        p2 = re.compile(r"^(?P<total>\d+)\s+total\s+buffers\s+freed$")
+        p2 = regex_engine.compile(r"^(?P<total>\d+)\s+total\s+buffers\s+freed$")
 
         # 307831 rx buffer allocated
-        p3 = re.compile(r"^(?P<total>\d+)\s+rx\s+buffer\s+allocated$")
+        p3 = regex_engine.compile(r"^(?P<total>\d+)\s+rx\s+buffer\s+allocated$")
 
         # 307831 rx buffer freed
-        p4 = re.compile(r"^(?P<total>\d+)\s+rx\s+buffer\s+freed$")
+        p4 = regex_engine.compile(r"^(?P<total>\d+)\s+rx\s+buffer\s+freed$")
 
         # 30205 tx buffer allocated
-        p5 = re.compile(r"^(?P<total>\d+)\s+tx\s+buffer\s+allocated$")
+        p5 = regex_engine.compile(r"^(?P<total>\d+)\s+tx\s+buffer\s+allocated$")
 
         # 30205 tx buffer freed
-        p6 = re.compile(r"^(?P<total>\d+)\s+tx\s+buffer\s+freed$")
+        p6 = regex_engine.compile(r"^(?P<total>\d+)\s+tx\s+buffer\s+freed$")
 
         # 0 total buffer alloc failure
-        p7 = re.compile(r"^(?P<total>\d+)\s+total\s+buffer\s+alloc\s+failure$")
+        p7 = regex_engine.compile(r"^(?P<total>\d+)\s+total\s+buffer\s+alloc\s+failure$")
 
         # 0 rx buffer alloc failure
-        p8 = re.compile(r"^(?P<total>\d+)\s+rx\s+buffer\s+alloc\s+failure$")
+        p8 = regex_engine.compile(r"^(?P<total>\d+)\s+rx\s+buffer\s+alloc\s+failure$")
 
         # 0 tx buffer alloc failure
-        p9 = re.compile(r"^(?P<total>\d+)\s+tx\s+buffer\s+alloc\s+failure$")
+        p9 = regex_engine.compile(r"^(?P<total>\d+)\s+tx\s+buffer\s+alloc\s+failure$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3920,7 +3920,7 @@ class ShowPlatformSoftwareWiredClientSwitchActiveF0(
             output = self.device.execute(self.cli_command.format(switch=switch))
 
         # 0x13151bdb  001b.0c18.918d  Yes      No            Done
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<id>\S+)\s+(?P<mac_address>\S+)\s+(?P<fwd>\w+)\s+(?P<open_access>\w+)\s+(?P<status>\w+)\s+$"
         )
 
@@ -3986,7 +3986,7 @@ class ShowPlatformSoftwareWiredClientSwitchR0(
             )
 
         # 0x13151bdb  001b.0c18.918d  Yes    No
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<id>\S+)\s+(?P<mac>\S+)\s+(?P<fwd>\w+)\s+(?P<open_access>\w+)$"
         )
 
@@ -4076,129 +4076,129 @@ class ShowPlatformSoftwareMonitorSession(ShowPlatformSoftwareMonitorSessionSchem
             output = self.device.execute(self.cli_command.format(session=session))
 
         # Span Session 3 (FED Session 2):
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Span\s+Session\s+(?P<span_session>\d+)\s+\(FED\s+Session\s+(?P<fed_session>\w+)\):$"
         )
 
         # Type:      ERSPAN Source
-        p2 = re.compile(r"^Type:\s+(?P<type>.+)$")
+        p2 = regex_engine.compile(r"^Type:\s+(?P<type>.+)$")
 
         # Prev type: Unknown
-        p3 = re.compile(r"^Prev\s+type:\s+(?P<prev_type>[\w\s]+)$")
+        p3 = regex_engine.compile(r"^Prev\s+type:\s+(?P<prev_type>[\w\s]+)$")
 
         # Ingress Src Ports: Fif2/0/2
         # Ingress Src Ports: Po23 Po25 Po27 Po29 Po31 Po33 Po35 Po37 Po39 Po41 Po42 Po43 Po44 Po45
-        p4 = re.compile(r"^Ingress\s+Src\s+Ports:\s+(?P<ingress_source_ports>.+)$")
+        p4 = regex_engine.compile(r"^Ingress\s+Src\s+Ports:\s+(?P<ingress_source_ports>.+)$")
 
         # Egress Src Ports: Fif2/0/4
-        p5 = re.compile(r"^Egress\s+Src\s+Ports:\s+(?P<egress_source_ports>\S+)$")
+        p5 = regex_engine.compile(r"^Egress\s+Src\s+Ports:\s+(?P<egress_source_ports>\S+)$")
 
         # Ingress Local Src Ports: (null)
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Ingress\s+Local\s+Src\s+Ports:\s+\((?P<ingress_local_source_ports>(?!null)\S+)\)$"
         )
 
         # Egress Local Src Ports: (null)
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Egress\s+Local\s+Src\s+Ports:\s+\((?P<egress_local_source_ports>(?!null)\S+)\)$"
         )
 
         # Destination Ports: Fif2/0/10 2/0/5
-        p8 = re.compile(r"^Destination\s+Ports:\s+(?P<destination_ports>.+)$")
+        p8 = regex_engine.compile(r"^Destination\s+Ports:\s+(?P<destination_ports>.+)$")
 
         # Ingress Src Vlans: 3
-        p9 = re.compile(r"^Ingress\s+Src\s+Vlans:\s+(?P<ingress_source_vlans>\d+)$")
+        p9 = regex_engine.compile(r"^Ingress\s+Src\s+Vlans:\s+(?P<ingress_source_vlans>\d+)$")
 
         # Egress Src Vlans: 3
-        p10 = re.compile(r"^Egress\s+Src\s+Vlans:\s+(?P<egress_source_vlans>\d+)$")
+        p10 = regex_engine.compile(r"^Egress\s+Src\s+Vlans:\s+(?P<egress_source_vlans>\d+)$")
 
         # Ingress Up Src Vlans: (null)
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^Ingress\s+Up\s+Src\s+Vlans:\s+\((?P<ingress_up_source_vlans>(?!null)\S+)\)$"
         )
 
         # Egress Up Src Vlans:  (null)
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^Egress\s+Up\s+Src\s+Vlans:\s+\((?P<egress_up_source_vlans>(?!null)\S+)\)$"
         )
 
         # Src Trunk filter Vlans: 3
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^Src\s+Trunk\s+filter\s+Vlans:\s+(?P<source_trunk_filter_vlans>\d+)$"
         )
 
         # RSPAN dst vlan: 0
-        p14 = re.compile(r"^RSPAN\s+dst\s+vlan:\s+(?P<destination_vlan>\d+)$")
+        p14 = regex_engine.compile(r"^RSPAN\s+dst\s+vlan:\s+(?P<destination_vlan>\d+)$")
 
         # RSPAN src vlan: 0
-        p15 = re.compile(r"^RSPAN\s+src\s+vlan:\s+(?P<source_vlan>\d+)$")
+        p15 = regex_engine.compile(r"^RSPAN\s+src\s+vlan:\s+(?P<source_vlan>\d+)$")
 
         # RSPAN src vlan sav: 0
-        p16 = re.compile(r"^RSPAN\s+src\s+vlan\s+sav:\s+(?P<source_vlan_sav>\d+)$")
+        p16 = regex_engine.compile(r"^RSPAN\s+src\s+vlan\s+sav:\s+(?P<source_vlan_sav>\d+)$")
 
         # Dest port encap = 0x0000
-        p17 = re.compile(r"^Dest\s+port\s+encap\s+=\s+(?P<destination_port_encap>\S+)$")
+        p17 = regex_engine.compile(r"^Dest\s+port\s+encap\s+=\s+(?P<destination_port_encap>\S+)$")
 
         # Dest port ingress encap = 0x0000
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^Dest\s+port\s+ingress\s+encap\s+=\s+(?P<destination_port_ingress_encap>\S+)$"
         )
 
         # Dest port ingress vlan = 0x0
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"^Dest\s+port\s+ingress\s+vlan\s+=\s+(?P<destination_port_ingress_vlan>\S+)$"
         )
 
         # SrcSess: 1  DstSess: 0 DstPortCfgd: 0  RspnDstCfg: 0  RspnSrcVld: 0
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r"^SrcSess:\s+(?P<source_session>\d+)\s+DstSess:\s+(?P<destination_session>\d+)\s+DstPortCfgd:\s+(?P<destination_port_cfgd>\d+)\s+RspnDstCfg:\s+(?P<rspn_destination_cfg>\d+)\s+RspnSrcVld:\s+(?P<rspn_source_vld>\d+)$"
         )
 
         # DstCliCfg: 0  DstPrtInit: 0  PsLclCfgd: 0
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^DstCliCfg:\s+(?P<dstination_cli_cfg>\d+)\s+DstPrtInit:\s+(?P<dstination_prt_init>\d+)\s+PsLclCfgd:\s+(?P<pslclcfgd>\d+)$"
         )
 
         # Flags: 0x00000002 VSPAN
-        p22 = re.compile(r"^Flags:\s+(?P<flags>.+)$")
+        p22 = regex_engine.compile(r"^Flags:\s+(?P<flags>.+)$")
 
         # Remote dest port: 0   Dest port group: 0
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r"^Remote dest port:\s(?P<remote_destination_port>\w+)\s+Dest port group:\s(?P<destination_port_group>\w+)$"
         )
 
         # ERSPAN Id    : 11
-        p24 = re.compile(r"^ERSPAN\sId\s+:\s+(?P<id>\d+)$")
+        p24 = regex_engine.compile(r"^ERSPAN\sId\s+:\s+(?P<id>\d+)$")
 
         # ERSPAN Org Ip: 0.0.0.0
-        p25 = re.compile(r"^ERSPAN\s+Org\s+Ip:\s+(?P<org_ip>[\d.]+)$")
+        p25 = regex_engine.compile(r"^ERSPAN\s+Org\s+Ip:\s+(?P<org_ip>[\d.]+)$")
 
         # ERSPAN Dst Ip: 0.0.0.0
-        p26 = re.compile(r"^ERSPAN\s+Dst\s+Ip:\s+(?P<destination_ip>[\d.]+)$")
+        p26 = regex_engine.compile(r"^ERSPAN\s+Dst\s+Ip:\s+(?P<destination_ip>[\d.]+)$")
 
         #  ERSPAN Org Ipv6: 2002::1
-        p27 = re.compile(r"^ERSPAN\s+Org\s+Ipv6:\s+(?P<org_ipv6>[\d:]+)$")
+        p27 = regex_engine.compile(r"^ERSPAN\s+Org\s+Ipv6:\s+(?P<org_ipv6>[\d:]+)$")
 
         # ERSPAN Dst Ipv6: 2001::1
-        p28 = re.compile(r"^ERSPAN\s+Dst\s+Ipv6:\s+(?P<destination_ipv6>[\d:]+)$")
+        p28 = regex_engine.compile(r"^ERSPAN\s+Dst\s+Ipv6:\s+(?P<destination_ipv6>[\d:]+)$")
 
         # ERSPAN Ip Ttl: 255
-        p29 = re.compile(r"^ERSPAN\s+Ip\s+Ttl:\s+(?P<ip_ttl>\d+)$")
+        p29 = regex_engine.compile(r"^ERSPAN\s+Ip\s+Ttl:\s+(?P<ip_ttl>\d+)$")
 
         # ERSPAN DSCP  : 0
-        p30 = re.compile(r"^ERSPAN DSCP\s+:\s+(?P<dscp>\d+)$")
+        p30 = regex_engine.compile(r"^ERSPAN DSCP\s+:\s+(?P<dscp>\d+)$")
 
         # ERSPAN Ipv6 flow label: 0
-        p31 = re.compile(r"^ERSPAN Ipv6 flow label:\s+(?P<ipv6_flow_label>\d+)$")
+        p31 = regex_engine.compile(r"^ERSPAN Ipv6 flow label:\s+(?P<ipv6_flow_label>\d+)$")
 
         # ERSPAN VRFID   : 0
-        p32 = re.compile(r"^ERSPAN VRFID\s+:\s+(?P<vrfid>\d+)$")
+        p32 = regex_engine.compile(r"^ERSPAN VRFID\s+:\s+(?P<vrfid>\d+)$")
 
         # ERSPAN State : Enabled
-        p33 = re.compile(r"^ERSPAN State :\s+(?P<state>\w+)$")
+        p33 = regex_engine.compile(r"^ERSPAN State :\s+(?P<state>\w+)$")
 
         # ERSPAN Tun id: 1251
-        p34 = re.compile(r"^ERSPAN Tun id:\s+(?P<tun_id>\d+)$")
+        p34 = regex_engine.compile(r"^ERSPAN Tun id:\s+(?P<tun_id>\d+)$")
 
         ret_dict = {}
 
@@ -4464,13 +4464,13 @@ class ShowPlatformSoftwareTdlContentBpConfig(
 
         # Node    Domain    Mode          Router-ID
         # 1       2         Aggregation
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<node>\d+)\s+(?P<domain>\d+)\s+(?P<mode>\w+)(\s+(?P<router_id>\w+))?$"
         )
 
         # Node    Priority
         # 1       1
-        p2 = re.compile(r"^(?P<node>\d+)\s+(?P<priority>\d+)$")
+        p2 = regex_engine.compile(r"^(?P<node>\d+)\s+(?P<priority>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -4616,35 +4616,35 @@ class ShowPlatformSoftwareBpCrimsonStatistics(
         ret_dict = {}
 
         # BP Crimson Statistics
-        p1 = re.compile(r"^(?P<bp_crimson_statistics>BP Crimson Statistics)$")
+        p1 = regex_engine.compile(r"^(?P<bp_crimson_statistics>BP Crimson Statistics)$")
 
         # Regexp  for  all the  lines  which fals in the below  pattern
         # Initialized            : Yes
-        p2 = re.compile(r"^(?P<description>[\w'\s]+)\:\s+(?P<value>\w+)$")
+        p2 = regex_engine.compile(r"^(?P<description>[\w'\s]+)\:\s+(?P<value>\w+)$")
 
         # BP SVL Crimson Statistics
-        p3 = re.compile(r"^(?P<bp_svl_crimson_statistics>BP SVL Crimson Statistics)$")
+        p3 = regex_engine.compile(r"^(?P<bp_svl_crimson_statistics>BP SVL Crimson Statistics)$")
 
         # BP Remote DB Statistics
-        p4 = re.compile(r"^(?P<bp_remote_db_statistics>BP Remote DB Statistics)$")
+        p4 = regex_engine.compile(r"^(?P<bp_remote_db_statistics>BP Remote DB Statistics)$")
 
         # GET Requests:
-        p5 = re.compile(r"^(?P<get_requests>GET Requests\:)$")
+        p5 = regex_engine.compile(r"^(?P<get_requests>GET Requests\:)$")
 
         # SET Requests:
-        p6 = re.compile(r"^(?P<set_requests>SET Requests\:)$")
+        p6 = regex_engine.compile(r"^(?P<set_requests>SET Requests\:)$")
 
         # In Progress Requests:
-        p7 = re.compile(r"^(?P<in_progress_requests>In Progress Requests\:)$")
+        p7 = regex_engine.compile(r"^(?P<in_progress_requests>In Progress Requests\:)$")
 
         # DBAL Response Time:
-        p8 = re.compile(r"^(?P<dbal_response_time>DBAL Response Time\:)$")
+        p8 = regex_engine.compile(r"^(?P<dbal_response_time>DBAL Response Time\:)$")
 
         # Record Free Failures:
-        p9 = re.compile(r"^(?P<record_free_failures>Record Free Failures\:)$")
+        p9 = regex_engine.compile(r"^(?P<record_free_failures>Record Free Failures\:)$")
 
         #  MAX (ms)         : 49
-        p10 = re.compile(r"^\s*MAX +\(ms\) +\:\s*(?P<max>\d+)$")
+        p10 = regex_engine.compile(r"^\s*MAX +\(ms\) +\:\s*(?P<max>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -4775,34 +4775,34 @@ class ShowPlatformSoftwareNodeClusterManagerSwitchB0Local(
         ret_dict = {}
         # p1 = re.compile(r'^(?P<node_description>[\w\s]+)\: (?P<status>.*)$')
         # Local Node Number: 1
-        p1 = re.compile(r"^Local +Node +Number\: +(?P<local_node_number>\d+)$")
+        p1 = regex_engine.compile(r"^Local +Node +Number\: +(?P<local_node_number>\d+)$")
 
         # Node status is: NODE_STATUS_UP
-        p2 = re.compile(r"^Node +status +is\: +(?P<node_status_is>.*)$")
+        p2 = regex_engine.compile(r"^Node +status +is\: +(?P<node_status_is>.*)$")
 
         # Tunnel status is: NODE_TUNNEL_UP
-        p3 = re.compile(r"^Tunnel +status +is\: +(?P<tunnel_status_is>.*)$")
+        p3 = regex_engine.compile(r"^Tunnel +status +is\: +(?P<tunnel_status_is>.*)$")
 
         # Node role is: CLUSTER_NODE_ROLE_LEADER
-        p4 = re.compile(r"^Node +role +is\: +(?P<node_role_is>.*)$")
+        p4 = regex_engine.compile(r"^Node +role +is\: +(?P<node_role_is>.*)$")
 
         # MAC address is : 64 181 193 255 238 0
-        p5 = re.compile(r"^MAC +address +is +\: +(?P<mac_address_is>.*)$")
+        p5 = regex_engine.compile(r"^MAC +address +is +\: +(?P<mac_address_is>.*)$")
 
         # Slot number is : 0
-        p6 = re.compile(r"^Slot +number +is +\: +(?P<slot_number_is>\d+)$")
+        p6 = regex_engine.compile(r"^Slot +number +is +\: +(?P<slot_number_is>\d+)$")
 
         # priority set to: 1
-        p7 = re.compile(r"^priority +set +to\: +(?P<priority_set_to>\d+)$")
+        p7 = regex_engine.compile(r"^priority +set +to\: +(?P<priority_set_to>\d+)$")
 
         # Leader node num is: 1
-        p8 = re.compile(r"^Leader +node +num is\: +(?P<leader_node_num_is>\d+)$")
+        p8 = regex_engine.compile(r"^Leader +node +num is\: +(?P<leader_node_num_is>\d+)$")
 
         # Follower node is: 2
-        p9 = re.compile(r"^Follower +node +is\: +(?P<follower_node_is>\d+)$")
+        p9 = regex_engine.compile(r"^Follower +node +is\: +(?P<follower_node_is>\d+)$")
 
         # Total node present in cluster: 2
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^Total +node +present +in +cluster\: +(?P<total_node_present_in_cluster>\d+)$"
         )
 
@@ -4969,35 +4969,35 @@ class ShowPlatformSoftwareBpCrimsonStatistics(
         ret_dict = {}
 
         # BP Crimson Statistics
-        p1 = re.compile(r"^(?P<bp_crimson_statistics>BP Crimson Statistics)$")
+        p1 = regex_engine.compile(r"^(?P<bp_crimson_statistics>BP Crimson Statistics)$")
 
         # Regexp  for  all the  lines  which fals in the below  pattern
         # Initialized            : Yes
-        p2 = re.compile(r"^(?P<description>[\w'\s]+)\:\s+(?P<value>\w+)$")
+        p2 = regex_engine.compile(r"^(?P<description>[\w'\s]+)\:\s+(?P<value>\w+)$")
 
         # BP SVL Crimson Statistics
-        p3 = re.compile(r"^(?P<bp_svl_crimson_statistics>BP SVL Crimson Statistics)$")
+        p3 = regex_engine.compile(r"^(?P<bp_svl_crimson_statistics>BP SVL Crimson Statistics)$")
 
         # BP Remote DB Statistics
-        p4 = re.compile(r"^(?P<bp_remote_db_statistics>BP Remote DB Statistics)$")
+        p4 = regex_engine.compile(r"^(?P<bp_remote_db_statistics>BP Remote DB Statistics)$")
 
         # GET Requests:
-        p5 = re.compile(r"^(?P<get_requests>GET Requests\:)$")
+        p5 = regex_engine.compile(r"^(?P<get_requests>GET Requests\:)$")
 
         # SET Requests:
-        p6 = re.compile(r"^(?P<set_requests>SET Requests\:)$")
+        p6 = regex_engine.compile(r"^(?P<set_requests>SET Requests\:)$")
 
         # In Progress Requests:
-        p7 = re.compile(r"^(?P<in_progress_requests>In Progress Requests\:)$")
+        p7 = regex_engine.compile(r"^(?P<in_progress_requests>In Progress Requests\:)$")
 
         # DBAL Response Time:
-        p8 = re.compile(r"^(?P<dbal_response_time>DBAL Response Time\:)$")
+        p8 = regex_engine.compile(r"^(?P<dbal_response_time>DBAL Response Time\:)$")
 
         # Record Free Failures:
-        p9 = re.compile(r"^(?P<record_free_failures>Record Free Failures\:)$")
+        p9 = regex_engine.compile(r"^(?P<record_free_failures>Record Free Failures\:)$")
 
         #  MAX (ms)         : 49
-        p10 = re.compile(r"^\s*MAX +\(ms\) +\:\s*(?P<max>\d+)$")
+        p10 = regex_engine.compile(r"^\s*MAX +\(ms\) +\:\s*(?P<max>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -5128,34 +5128,34 @@ class ShowPlatformSoftwareNodeClusterManagerSwitchB0Local(
         ret_dict = {}
         # p1 = re.compile(r'^(?P<node_description>[\w\s]+)\: (?P<status>.*)$')
         # Local Node Number: 1
-        p1 = re.compile(r"^Local +Node +Number\: +(?P<local_node_number>\d+)$")
+        p1 = regex_engine.compile(r"^Local +Node +Number\: +(?P<local_node_number>\d+)$")
 
         # Node status is: NODE_STATUS_UP
-        p2 = re.compile(r"^Node +status +is\: +(?P<node_status_is>.*)$")
+        p2 = regex_engine.compile(r"^Node +status +is\: +(?P<node_status_is>.*)$")
 
         # Tunnel status is: NODE_TUNNEL_UP
-        p3 = re.compile(r"^Tunnel +status +is\: +(?P<tunnel_status_is>.*)$")
+        p3 = regex_engine.compile(r"^Tunnel +status +is\: +(?P<tunnel_status_is>.*)$")
 
         # Node role is: CLUSTER_NODE_ROLE_LEADER
-        p4 = re.compile(r"^Node +role +is\: +(?P<node_role_is>.*)$")
+        p4 = regex_engine.compile(r"^Node +role +is\: +(?P<node_role_is>.*)$")
 
         # MAC address is : 64 181 193 255 238 0
-        p5 = re.compile(r"^MAC +address +is +\: +(?P<mac_address_is>.*)$")
+        p5 = regex_engine.compile(r"^MAC +address +is +\: +(?P<mac_address_is>.*)$")
 
         # Slot number is : 0
-        p6 = re.compile(r"^Slot +number +is +\: +(?P<slot_number_is>\d+)$")
+        p6 = regex_engine.compile(r"^Slot +number +is +\: +(?P<slot_number_is>\d+)$")
 
         # priority set to: 1
-        p7 = re.compile(r"^priority +set +to\: +(?P<priority_set_to>\d+)$")
+        p7 = regex_engine.compile(r"^priority +set +to\: +(?P<priority_set_to>\d+)$")
 
         # Leader node num is: 1
-        p8 = re.compile(r"^Leader +node +num is\: +(?P<leader_node_num_is>\d+)$")
+        p8 = regex_engine.compile(r"^Leader +node +num is\: +(?P<leader_node_num_is>\d+)$")
 
         # Follower node is: 2
-        p9 = re.compile(r"^Follower +node +is\: +(?P<follower_node_is>\d+)$")
+        p9 = regex_engine.compile(r"^Follower +node +is\: +(?P<follower_node_is>\d+)$")
 
         # Total node present in cluster: 2
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^Total +node +present +in +cluster\: +(?P<total_node_present_in_cluster>\d+)$"
         )
 
@@ -5255,15 +5255,15 @@ class ShowPlatformSoftwareAuditSummary(ShowPlatformSoftwareAuditSummarySchema):
             output = self.device.execute(self.cli_command)
 
         # AUDIT LOG ON chassis 1 route-processor 0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^AUDIT LOG ON chassis (?P<chassis>\d+) route-processor (?P<route_process>\d+)$"
         )
 
         # AUDIT LOG ON ACTIVE
-        p2 = re.compile(r"^AUDIT LOG ON (?P<chassis>\w+)$")
+        p2 = regex_engine.compile(r"^AUDIT LOG ON (?P<chassis>\w+)$")
 
         # AVC Denial count: 82
-        p3 = re.compile(r"^AVC Denial count: (?P<avc_denial_count>\d+)$")
+        p3 = regex_engine.compile(r"^AVC Denial count: (?P<avc_denial_count>\d+)$")
 
         ret_dict = {}
 
@@ -5370,108 +5370,108 @@ class ShowPlatformSoftwareIlppowerPort(ShowPlatformSoftwareIlppowerPortSchema):
         ret_dict = {}
 
         # ILP Port Configuration for interface Gi1/0/14
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^ILP +Port +Configuration +for +interface+\s(?P<interface>[\w\/]+)$"
         )
 
         # Initialization Done:   Yes
-        p2 = re.compile(r"^Initialization Done:\s+(?P<initialization_done>[\w]+)$")
+        p2 = regex_engine.compile(r"^Initialization Done:\s+(?P<initialization_done>[\w]+)$")
 
         # ILP Supported:         Yes
-        p3 = re.compile(r"^ILP Supported:\s+(?P<ilp_supported>[\w]+)$")
+        p3 = regex_engine.compile(r"^ILP Supported:\s+(?P<ilp_supported>[\w]+)$")
 
         # ILP Enabled:           Yes
-        p4 = re.compile(r"^ILP Enabled:\s+(?P<ilp_enabled>[\w]+)$")
+        p4 = regex_engine.compile(r"^ILP Enabled:\s+(?P<ilp_enabled>[\w]+)$")
 
         # POST:                  Yes
-        p5 = re.compile(r"^POST:\s+(?P<post>[\w]+)$")
+        p5 = regex_engine.compile(r"^POST:\s+(?P<post>[\w]+)$")
 
         # Detect On:             No
-        p6 = re.compile(r"^Detect On:\s+(?P<detect_on>[\w]+)$")
+        p6 = regex_engine.compile(r"^Detect On:\s+(?P<detect_on>[\w]+)$")
 
         # PD Detected            Yes
-        p7 = re.compile(r"^PD Detected\s+(?P<pd_detected>[\w]+)$")
+        p7 = regex_engine.compile(r"^PD Detected\s+(?P<pd_detected>[\w]+)$")
 
         # PD Class Done          No
-        p8 = re.compile(r"^PD Class Done\s+(?P<pd_class_done>[\w]+)$")
+        p8 = regex_engine.compile(r"^PD Class Done\s+(?P<pd_class_done>[\w]+)$")
 
         # Cisco PD:              No
-        p9 = re.compile(r"^Cisco PD:\s+(?P<cisco_pd>[\w]+)$")
+        p9 = regex_engine.compile(r"^Cisco PD:\s+(?P<cisco_pd>[\w]+)$")
 
         # Power is On:           Yes
-        p10 = re.compile(r"^Power is On:\s+(?P<power_is_on>[\w]+)$")
+        p10 = regex_engine.compile(r"^Power is On:\s+(?P<power_is_on>[\w]+)$")
 
         # Power Denied:          No
-        p11 = re.compile(r"^Power Denied:\s+(?P<power_denied>([Yy]es|[Nn]o)+)$")
+        p11 = regex_engine.compile(r"^Power Denied:\s+(?P<power_denied>([Yy]es|[Nn]o)+)$")
 
         # PD Type:               IEEE
-        p12 = re.compile(r"^PD Type:\s+(?P<pd_type>[\w]+)$")
+        p12 = regex_engine.compile(r"^PD Type:\s+(?P<pd_type>[\w]+)$")
 
         # PD Class:              IEEE3
-        p13 = re.compile(r"^PD Class:\s+(?P<pd_class>[\w]+)$")
+        p13 = regex_engine.compile(r"^PD Class:\s+(?P<pd_class>[\w]+)$")
 
         # Power State:           OK
-        p14 = re.compile(r"^Power State:\s+(?P<power_state>[\w]+)$")
+        p14 = regex_engine.compile(r"^Power State:\s+(?P<power_state>[\w]+)$")
 
         # Current State:         NGWC_ILP_LINK_UP_S
-        p15 = re.compile(r"^Current State:\s+(?P<current_state>[\w\_]+)$")
+        p15 = regex_engine.compile(r"^Current State:\s+(?P<current_state>[\w\_]+)$")
 
         # Previous State:        NGWC_ILP_LINK_UP_S
-        p16 = re.compile(r"^Previous State:\s+(?P<previous_state>[\w\_]+)$")
+        p16 = regex_engine.compile(r"^Previous State:\s+(?P<previous_state>[\w\_]+)$")
 
         # Requested Power:       10250
-        p17 = re.compile(r"^Requested Power:\s+(?P<requested_power>[\d]+)$")
+        p17 = regex_engine.compile(r"^Requested Power:\s+(?P<requested_power>[\d]+)$")
 
         # Short:                 0
-        p18 = re.compile(r"^Short:\s+(?P<short>[\d]+)$")
+        p18 = regex_engine.compile(r"^Short:\s+(?P<short>[\d]+)$")
 
         # Short Cnt:             0
-        p19 = re.compile(r"^Short Cnt:\s+(?P<short_cnt>[\d]+)$")
+        p19 = regex_engine.compile(r"^Short Cnt:\s+(?P<short_cnt>[\d]+)$")
 
         # Cisco PD Detect Count: 0
-        p20 = re.compile(r"^Cisco PD Detect Count:\s+(?P<cisco_pd_detect_count>[\d]+)$")
+        p20 = regex_engine.compile(r"^Cisco PD Detect Count:\s+(?P<cisco_pd_detect_count>[\d]+)$")
 
         # Spare Pair mode:       0
-        p21 = re.compile(r"^Spare Pair mode:\s+(?P<spare_pair_mode>[\d]+)$")
+        p21 = regex_engine.compile(r"^Spare Pair mode:\s+(?P<spare_pair_mode>[\d]+)$")
 
         # Spare Pair Arch:       1
-        p22 = re.compile(r"^Spare Pair Arch:\s+(?P<spare_pair_arch>[\d]+)$")
+        p22 = regex_engine.compile(r"^Spare Pair Arch:\s+(?P<spare_pair_arch>[\d]+)$")
 
         # Signal Pair Pwr alloc: 0
-        p23 = re.compile(r"^Signal Pair Pwr alloc:\s+(?P<signal_pair_pwr_alloc>[\d]+)$")
+        p23 = regex_engine.compile(r"^Signal Pair Pwr alloc:\s+(?P<signal_pair_pwr_alloc>[\d]+)$")
 
         # Spare Pair Power On:   0
-        p24 = re.compile(r"^Spare Pair Power On:\s+(?P<spare_pair_power_on>[\d]+)$")
+        p24 = regex_engine.compile(r"^Spare Pair Power On:\s+(?P<spare_pair_power_on>[\d]+)$")
 
         # PD power state:        0
-        p25 = re.compile(r"^PD power state:\s+(?P<pd_power_state>[\d]+)$")
+        p25 = regex_engine.compile(r"^PD power state:\s+(?P<pd_power_state>[\d]+)$")
 
         # Timer:
-        p26 = re.compile(r"^Timer:$")
+        p26 = regex_engine.compile(r"^Timer:$")
 
         # Bad Power:        Stopped
-        p27 = re.compile(r"^Bad Power:\s+(?P<bad_power>[\w]+)$")
+        p27 = regex_engine.compile(r"^Bad Power:\s+(?P<bad_power>[\w]+)$")
 
         # Power Good:        Stopped
-        p28 = re.compile(r"^Power Good:\s+(?P<power_good>[\w]+)$")
+        p28 = regex_engine.compile(r"^Power Good:\s+(?P<power_good>[\w]+)$")
 
         # Power Denied:      Stopped
-        p29 = re.compile(r"^Power Denied:\s+(?P<power_denied>([Ss]topped|[Ss]tarted)+)")
+        p29 = regex_engine.compile(r"^Power Denied:\s+(?P<power_denied>([Ss]topped|[Ss]tarted)+)")
 
         # Cisco PD Detect:   Stopped
-        p30 = re.compile(r"^Cisco PD Detect:\s+(?P<cisco_pd_detect>[\w]+)$")
+        p30 = regex_engine.compile(r"^Cisco PD Detect:\s+(?P<cisco_pd_detect>[\w]+)$")
 
         # IEEE Detect:       Stopped
-        p31 = re.compile(r"^IEEE Detect:\s+(?P<ieee_detect>[\w]+)$")
+        p31 = regex_engine.compile(r"^IEEE Detect:\s+(?P<ieee_detect>[\w]+)$")
 
         # IEEE Short:        Stopped
-        p32 = re.compile(r"^IEEE Short:\s+(?P<ieee_short>[\w]+)$")
+        p32 = regex_engine.compile(r"^IEEE Short:\s+(?P<ieee_short>[\w]+)$")
 
         # Link Down:         Stopped
-        p33 = re.compile(r"^Link Down:\s+(?P<link_down>[\w]+)$")
+        p33 = regex_engine.compile(r"^Link Down:\s+(?P<link_down>[\w]+)$")
 
         # Vsense:            Stopped
-        p34 = re.compile(r"^Vsense:\s+(?P<vsense>[\w]+)$")
+        p34 = regex_engine.compile(r"^Vsense:\s+(?P<vsense>[\w]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -5759,7 +5759,7 @@ class ShowPlatformSoftwareWiredClientFpActive(
         #      0x14597f9b 00a3.d144.49f6 Yes Yes         Done
         #      0x145aa536 000c.29e0.3ea6 Yes Yes         Done
         #      0x14a5b221 0cd0.f8e7.9b00 Yes Yes         Done
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<id>\S+)\s+(?P<mac_address>\S+)\s+(?P<fwd>\w+)\s+(?P<open_access>\w+)\s+(?P<status>\w+)$"
         )
 
@@ -5833,7 +5833,7 @@ class ShowPlatformSoftwareAccessListSwitchActiveF0Summary(
         # CISCO-CWA-URL-REDIRECT-ACL           10           0            6
         # v6-ogacl-1                           13           1            1
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<Access_list>\S+)\s+(?P<Index>\d+)\s+(?P<Num_Ref>\d+)\s+(?P<Dwnld_ACEs>\d+)$"
         )
 
@@ -5904,16 +5904,16 @@ class ShowPlatformSoftwareDistributedIpsecTunnelInfo(
         ret_dict = {}
         list_key_num = 1
         # IPSEC Total ASIC Count = 2
-        p1 = re.compile(r"IPSEC\s+Total\s+ASIC\s+Count\s+=\s+(?P<asic_count>-?\d+)\s+$")
+        p1 = regex_engine.compile(r"IPSEC\s+Total\s+ASIC\s+Count\s+=\s+(?P<asic_count>-?\d+)\s+$")
         #   SW_NUM   ASIC   # of TUNNELS     PLATFORM
         #  |  2   |   0    |       2     |    C9300X   |
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"\s+\|\s+(?P<switch_number>-?\d+)\s+\|\s+(?P<asic_value>-?\d+)\s+\|\s+(?P<num_of_tunnel>-?\d+)\s+\|\s+(?P<platform>\S+)\s+\|$"
         )
 
         # |       INTERFACE |      IF_ID | SADB_ID | SW_NUM | ASIC |
         # |       Tunnel201 | 0x00000216 |       1 |      1 |    0 |
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^\s+\|\s+(?P<tunnel_int>Tunnel\d+)\s+\|\s+(?P<if_id>\w+)\s+\|\s+(?P<sbad_info>\d+)\s+\|\s+(?P<switch_number>\d+)\s+\|\s+(?P<asic_id>\d+)\s+\|"
         )
 
@@ -5982,7 +5982,7 @@ class ShowPlatformSoftwareAccessListSwitchActiveFPActiveOgLkupIds(
             output = self.device.execute(self.cli_command)
 
         # IP-Adm-V4-Int-ACL-global             4            0x0          0x0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<access_list>\S+)\s+(?P<index>\d+)\s+(?P<src_lkup_id>\w+)\s+(?P<dst_lkup_id>\w+)$"
         )
 
@@ -6043,7 +6043,7 @@ class ShowPlatformSoftwareSteeringPolicyAomInfo(
         # -------------------------------------------------------------------------------
         # contract_4_28eadb333777_v0        2090904497    1895        1        1900
         # contract_4(Mirror)_b4675385cca2_  2090904057    1903        1        1907
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<Policy>\S+)\s+(?P<Index>\d+)\s+(?P<Aom_id>\d+)\s+(?P<Num_ref>\d+)\s+(?P<Ref_aom_id>\d+)$"
         )
 
@@ -6108,29 +6108,29 @@ class ShowPlatformSoftwareObjectManagerF0Object(
         sts_dict = {}
 
         # Object identifier: 1895
-        p1 = re.compile(r"Object identifier\: (?P<obj_identifier>(\d+))")
+        p1 = regex_engine.compile(r"Object identifier\: (?P<obj_identifier>(\d+))")
 
         # Description: PLC: contract_4_28eadb333777_v0 idx: 2090904497
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"Description\:\s+PLC\: (?P<contract>\S+)\s+idx\: (?P<idx>(\d+))"
         )
 
         # Obj type id: 765
-        p3 = re.compile(r"[Oo]bj type id\: (?P<obj_type_id>(\d+))")
+        p3 = regex_engine.compile(r"[Oo]bj type id\: (?P<obj_type_id>(\d+))")
 
         # Obj type: Hawkeye policy-defn
-        p4 = re.compile(r"[Oobj] type\: (?P<obj_type>\W+)")
+        p4 = regex_engine.compile(r"[Oobj] type\: (?P<obj_type>\W+)")
 
         # Status: Pending-issue, Epoch: 0, Client data: 0x4f0875b8
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"Status\: (?P<status>\S+)\, Epoch\: (?P<epoch>(\d+))\, Client data\: (?P<client_data>\S+)"
         )
 
         # Pre-lock count: 1
-        p6 = re.compile(r"Pre-lock count\: (?P<pre_lock_count>(\d+))")
+        p6 = regex_engine.compile(r"Pre-lock count\: (?P<pre_lock_count>(\d+))")
 
         # Post-lock count: 2
-        p7 = re.compile(r"Post-lock count\: (?P<post_lock_count>(\d+))")
+        p7 = regex_engine.compile(r"Post-lock count\: (?P<post_lock_count>(\d+))")
 
         for line in output.splitlines():
             line = line.strip()
@@ -6283,120 +6283,120 @@ class ShowPlatformSoftwareIomdMacsecInterfacePortDetail(
         tx_match = rx_match = False
 
         # Port:10, Subport:0, Tx SC index:0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"Port:(?P<tx_port>-?\d+),\s+Subport:(?P<tx_sub_port>-?\d+),\s+Tx\s+SC\s+index:(?P<tx_index>-?\d+)$"
         )
 
         # Prev AN: 1, Cur AN: 2
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r"Prev\s+AN:\s+(?P<tx_prev_an>-?\d+),\s+Cur\s+AN:\s+(?P<tx_cur_an>-?\d+)$"
         )
 
         # encrypt: 1
-        p1_2 = re.compile(r"encrypt:\s+(?P<tx_encrypt>-?\d+)$")
+        p1_2 = regex_engine.compile(r"encrypt:\s+(?P<tx_encrypt>-?\d+)$")
 
         # vlan: 1
-        p1_3 = re.compile(r"vlan:\s+(?P<tx_vlan>-?\d+)$")
+        p1_3 = regex_engine.compile(r"vlan:\s+(?P<tx_vlan>-?\d+)$")
 
         # end_station: 0
-        p1_4 = re.compile(r"end_station:\s+(?P<tx_end_station>-?\d+)$")
+        p1_4 = regex_engine.compile(r"end_station:\s+(?P<tx_end_station>-?\d+)$")
 
         # scb: 0
-        p1_5 = re.compile(r"scb:\s+(?P<tx_scb>-?\d+)$")
+        p1_5 = regex_engine.compile(r"scb:\s+(?P<tx_scb>-?\d+)$")
 
         # nextPn: 1
-        p1_6 = re.compile(r"nextPn:\s+(?P<tx_next_pn>-?\d+)$")
+        p1_6 = regex_engine.compile(r"nextPn:\s+(?P<tx_next_pn>-?\d+)$")
 
         # key_len: 32
-        p1_7 = re.compile(r"key_len:\s+(?P<tx_key_len>-?\d+)$")
+        p1_7 = regex_engine.compile(r"key_len:\s+(?P<tx_key_len>-?\d+)$")
 
         # hashkey_len: 16
-        p1_8 = re.compile(r"hashkey_len:\s+(?P<tx_hashkey_len>-?\d+)$")
+        p1_8 = regex_engine.compile(r"hashkey_len:\s+(?P<tx_hashkey_len>-?\d+)$")
 
         # bypass: 0
-        p1_9 = re.compile(r"bypass:\s+(?P<tx_bypass>-?\d+)$")
+        p1_9 = regex_engine.compile(r"bypass:\s+(?P<tx_bypass>-?\d+)$")
 
         # conf_offset: 0
-        p1_10 = re.compile(r"conf_offset:\s+(?P<tx_conf_offset>-?\d+)$")
+        p1_10 = regex_engine.compile(r"conf_offset:\s+(?P<tx_conf_offset>-?\d+)$")
 
         # cipher: GCM_AES_256
-        p1_11 = re.compile(r"cipher:\s+(?P<tx_cipher>\S+)$")
+        p1_11 = regex_engine.compile(r"cipher:\s+(?P<tx_cipher>\S+)$")
 
         # Macsec hash data: Port: 10, Subport: 0, sa_index: -2130706432
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"Macsec\s+hash\s+data:\s+Port:\s+(?P<common_port>-?\d+),\s+Subport:\s+(?P<common_sub_port>-?\d+),\s+sa_index:\s+(?P<common_index>\S+)$"
         )
 
         # Install Rx Count 715
-        p2_1 = re.compile(r"Install\s+Rx\s+Count\s+(?P<install_rx_cnt>-?\d+)$")
+        p2_1 = regex_engine.compile(r"Install\s+Rx\s+Count\s+(?P<install_rx_cnt>-?\d+)$")
 
         # Install Tx Count 715
-        p2_2 = re.compile(r"Install\s+Tx\s+Count\s+(?P<install_tx_cnt>-?\d+)$")
+        p2_2 = regex_engine.compile(r"Install\s+Tx\s+Count\s+(?P<install_tx_cnt>-?\d+)$")
 
         # Delete Rx Count 711
-        p2_3 = re.compile(r"Delete\s+Rx\s+Count\s+(?P<del_rx_cnt>-?\d+)$")
+        p2_3 = regex_engine.compile(r"Delete\s+Rx\s+Count\s+(?P<del_rx_cnt>-?\d+)$")
 
         # Install Rx Fail Count 3
-        p2_4 = re.compile(
+        p2_4 = regex_engine.compile(
             r"Install\s+Rx\s+Fail\s+Count\s+(?P<instal_rx_fail_cnt>-?\d+)$"
         )
 
         # Install Tx Fail Count 0
-        p2_5 = re.compile(
+        p2_5 = regex_engine.compile(
             r"Install\s+Tx\s+Fail\s+Count\s+(?P<install_tx_fail_cnt>-?\d+)$"
         )
 
         # Delete Rx Fail Count 0
-        p2_6 = re.compile(r"Delete\s+Rx\s+Fail\s+Count\s+(?P<del_rx_fail_cnt>-?\d+)$")
+        p2_6 = regex_engine.compile(r"Delete\s+Rx\s+Fail\s+Count\s+(?P<del_rx_fail_cnt>-?\d+)$")
 
         # Rx SA Same AN Count 3
-        p2_7 = re.compile(r"Rx\s+SA\s+Same\s+AN\s+Count\s+(?P<rx_an_cnt>-?\d+)$")
+        p2_7 = regex_engine.compile(r"Rx\s+SA\s+Same\s+AN\s+Count\s+(?P<rx_an_cnt>-?\d+)$")
 
         # Delay protection: 0
-        p2_8 = re.compile(r"Delay\s+protection:\s+(?P<delay_protection>-?\d+)$")
+        p2_8 = regex_engine.compile(r"Delay\s+protection:\s+(?P<delay_protection>-?\d+)$")
 
         # Port:10, Subport:0, Rx SC index:0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"Port:(?P<rx_port>-?\d+),\s+Subport:(?P<rx_sub_port>-?\d+),\s+Rx\s+SC\s+index:(?P<rx_index>-?\d+)$"
         )
 
         # Prev AN: 1, Cur AN: 2
-        p3_1 = re.compile(
+        p3_1 = regex_engine.compile(
             r"Prev\s+AN:\s+(?P<rx_prev_an>-?\d+),\s+Cur\s+AN:\s+(?P<rx_cur_an>-?\d+)$"
         )
 
         # replay_protect: 1
-        p3_2 = re.compile(r"replay_protect:\s+(?P<rx_replay_protect>-?\d+)$")
+        p3_2 = regex_engine.compile(r"replay_protect:\s+(?P<rx_replay_protect>-?\d+)$")
 
         # replay_window_size: 0
-        p3_3 = re.compile(r"replay_window_size:\s+(?P<replay_window_size>-?\d+)$")
+        p3_3 = regex_engine.compile(r"replay_window_size:\s+(?P<replay_window_size>-?\d+)$")
 
         # decrypt_frames: 1
-        p3_4 = re.compile(r"decrypt_frames:\s+(?P<decrypt_frames>-?\d+)$")
+        p3_4 = regex_engine.compile(r"decrypt_frames:\s+(?P<decrypt_frames>-?\d+)$")
 
         # validate_frames: 1
-        p3_5 = re.compile(r"validate_frames:\s+(?P<validate_frames>-?\d+)$")
+        p3_5 = regex_engine.compile(r"validate_frames:\s+(?P<validate_frames>-?\d+)$")
 
         # nextPn: 0
-        p3_6 = re.compile(r"nextPn:\s+(?P<rx_next_pn>-?\d+)$")
+        p3_6 = regex_engine.compile(r"nextPn:\s+(?P<rx_next_pn>-?\d+)$")
 
         # key_len: 32
-        p3_7 = re.compile(r"key_len:\s+(?P<rx_key_len>-?\d+)$")
+        p3_7 = regex_engine.compile(r"key_len:\s+(?P<rx_key_len>-?\d+)$")
 
         # hashkey_len: 16
-        p3_8 = re.compile(r"hashkey_len:\s+(?P<rx_hashkey_len>-?\d+)$")
+        p3_8 = regex_engine.compile(r"hashkey_len:\s+(?P<rx_hashkey_len>-?\d+)$")
 
         # bypass: 0
-        p3_9 = re.compile(r"bypass:\s+(?P<rx_bypass>-?\d+)$")
+        p3_9 = regex_engine.compile(r"bypass:\s+(?P<rx_bypass>-?\d+)$")
 
         # conf_offset: 0
-        p3_10 = re.compile(r"conf_offset:\s+(?P<rx_conf_offset>-?\d+)$")
+        p3_10 = regex_engine.compile(r"conf_offset:\s+(?P<rx_conf_offset>-?\d+)$")
 
         # cipher: GCM_AES_256
-        p3_11 = re.compile(r"cipher:\s+(?P<rx_cipher>\S+)$")
+        p3_11 = regex_engine.compile(r"cipher:\s+(?P<rx_cipher>\S+)$")
 
         # DeviceID 0
-        p4 = re.compile(r"DeviceID\s+(?P<id>-?\d+)$")
+        p4 = regex_engine.compile(r"DeviceID\s+(?P<id>-?\d+)$")
 
         for line in output.splitlines():
             # Port:10, Subport:0, Tx SC index:0
@@ -6747,120 +6747,120 @@ class ShowPlatformSoftwareIomdMacsecInterfacePortDetail(
         tx_match = rx_match = False
 
         # Port:10, Subport:0, Tx SC index:0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"Port:(?P<tx_port>-?\d+),\s+Subport:(?P<tx_sub_port>-?\d+),\s+Tx\s+SC\s+index:(?P<tx_index>-?\d+)$"
         )
 
         # Prev AN: 1, Cur AN: 2
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r"Prev\s+AN:\s+(?P<tx_prev_an>-?\d+),\s+Cur\s+AN:\s+(?P<tx_cur_an>-?\d+)$"
         )
 
         # encrypt: 1
-        p1_2 = re.compile(r"encrypt:\s+(?P<tx_encrypt>-?\d+)$")
+        p1_2 = regex_engine.compile(r"encrypt:\s+(?P<tx_encrypt>-?\d+)$")
 
         # vlan: 1
-        p1_3 = re.compile(r"vlan:\s+(?P<tx_vlan>-?\d+)$")
+        p1_3 = regex_engine.compile(r"vlan:\s+(?P<tx_vlan>-?\d+)$")
 
         # end_station: 0
-        p1_4 = re.compile(r"end_station:\s+(?P<tx_end_station>-?\d+)$")
+        p1_4 = regex_engine.compile(r"end_station:\s+(?P<tx_end_station>-?\d+)$")
 
         # scb: 0
-        p1_5 = re.compile(r"scb:\s+(?P<tx_scb>-?\d+)$")
+        p1_5 = regex_engine.compile(r"scb:\s+(?P<tx_scb>-?\d+)$")
 
         # nextPn: 1
-        p1_6 = re.compile(r"nextPn:\s+(?P<tx_next_pn>-?\d+)$")
+        p1_6 = regex_engine.compile(r"nextPn:\s+(?P<tx_next_pn>-?\d+)$")
 
         # key_len: 32
-        p1_7 = re.compile(r"key_len:\s+(?P<tx_key_len>-?\d+)$")
+        p1_7 = regex_engine.compile(r"key_len:\s+(?P<tx_key_len>-?\d+)$")
 
         # hashkey_len: 16
-        p1_8 = re.compile(r"hashkey_len:\s+(?P<tx_hashkey_len>-?\d+)$")
+        p1_8 = regex_engine.compile(r"hashkey_len:\s+(?P<tx_hashkey_len>-?\d+)$")
 
         # bypass: 0
-        p1_9 = re.compile(r"bypass:\s+(?P<tx_bypass>-?\d+)$")
+        p1_9 = regex_engine.compile(r"bypass:\s+(?P<tx_bypass>-?\d+)$")
 
         # conf_offset: 0
-        p1_10 = re.compile(r"conf_offset:\s+(?P<tx_conf_offset>-?\d+)$")
+        p1_10 = regex_engine.compile(r"conf_offset:\s+(?P<tx_conf_offset>-?\d+)$")
 
         # cipher: GCM_AES_256
-        p1_11 = re.compile(r"cipher:\s+(?P<tx_cipher>\S+)$")
+        p1_11 = regex_engine.compile(r"cipher:\s+(?P<tx_cipher>\S+)$")
 
         # Macsec hash data: Port: 10, Subport: 0, sa_index: -2130706432
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"Macsec\s+hash\s+data:\s+Port:\s+(?P<common_port>-?\d+),\s+Subport:\s+(?P<common_sub_port>-?\d+),\s+sa_index:\s+(?P<common_index>\S+)$"
         )
 
         # Install Rx Count 715
-        p2_1 = re.compile(r"Install\s+Rx\s+Count\s+(?P<install_rx_cnt>-?\d+)$")
+        p2_1 = regex_engine.compile(r"Install\s+Rx\s+Count\s+(?P<install_rx_cnt>-?\d+)$")
 
         # Install Tx Count 715
-        p2_2 = re.compile(r"Install\s+Tx\s+Count\s+(?P<install_tx_cnt>-?\d+)$")
+        p2_2 = regex_engine.compile(r"Install\s+Tx\s+Count\s+(?P<install_tx_cnt>-?\d+)$")
 
         # Delete Rx Count 711
-        p2_3 = re.compile(r"Delete\s+Rx\s+Count\s+(?P<del_rx_cnt>-?\d+)$")
+        p2_3 = regex_engine.compile(r"Delete\s+Rx\s+Count\s+(?P<del_rx_cnt>-?\d+)$")
 
         # Install Rx Fail Count 3
-        p2_4 = re.compile(
+        p2_4 = regex_engine.compile(
             r"Install\s+Rx\s+Fail\s+Count\s+(?P<instal_rx_fail_cnt>-?\d+)$"
         )
 
         # Install Tx Fail Count 0
-        p2_5 = re.compile(
+        p2_5 = regex_engine.compile(
             r"Install\s+Tx\s+Fail\s+Count\s+(?P<install_tx_fail_cnt>-?\d+)$"
         )
 
         # Delete Rx Fail Count 0
-        p2_6 = re.compile(r"Delete\s+Rx\s+Fail\s+Count\s+(?P<del_rx_fail_cnt>-?\d+)$")
+        p2_6 = regex_engine.compile(r"Delete\s+Rx\s+Fail\s+Count\s+(?P<del_rx_fail_cnt>-?\d+)$")
 
         # Rx SA Same AN Count 3
-        p2_7 = re.compile(r"Rx\s+SA\s+Same\s+AN\s+Count\s+(?P<rx_an_cnt>-?\d+)$")
+        p2_7 = regex_engine.compile(r"Rx\s+SA\s+Same\s+AN\s+Count\s+(?P<rx_an_cnt>-?\d+)$")
 
         # Delay protection: 0
-        p2_8 = re.compile(r"Delay\s+protection:\s+(?P<delay_protection>-?\d+)$")
+        p2_8 = regex_engine.compile(r"Delay\s+protection:\s+(?P<delay_protection>-?\d+)$")
 
         # Port:10, Subport:0, Rx SC index:0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"Port:(?P<rx_port>-?\d+),\s+Subport:(?P<rx_sub_port>-?\d+),\s+Rx\s+SC\s+index:(?P<rx_index>-?\d+)$"
         )
 
         # Prev AN: 1, Cur AN: 2
-        p3_1 = re.compile(
+        p3_1 = regex_engine.compile(
             r"Prev\s+AN:\s+(?P<rx_prev_an>-?\d+),\s+Cur\s+AN:\s+(?P<rx_cur_an>-?\d+)$"
         )
 
         # replay_protect: 1
-        p3_2 = re.compile(r"replay_protect:\s+(?P<rx_replay_protect>-?\d+)$")
+        p3_2 = regex_engine.compile(r"replay_protect:\s+(?P<rx_replay_protect>-?\d+)$")
 
         # replay_window_size: 0
-        p3_3 = re.compile(r"replay_window_size:\s+(?P<replay_window_size>-?\d+)$")
+        p3_3 = regex_engine.compile(r"replay_window_size:\s+(?P<replay_window_size>-?\d+)$")
 
         # decrypt_frames: 1
-        p3_4 = re.compile(r"decrypt_frames:\s+(?P<decrypt_frames>-?\d+)$")
+        p3_4 = regex_engine.compile(r"decrypt_frames:\s+(?P<decrypt_frames>-?\d+)$")
 
         # validate_frames: 1
-        p3_5 = re.compile(r"validate_frames:\s+(?P<validate_frames>-?\d+)$")
+        p3_5 = regex_engine.compile(r"validate_frames:\s+(?P<validate_frames>-?\d+)$")
 
         # nextPn: 0
-        p3_6 = re.compile(r"nextPn:\s+(?P<rx_next_pn>-?\d+)$")
+        p3_6 = regex_engine.compile(r"nextPn:\s+(?P<rx_next_pn>-?\d+)$")
 
         # key_len: 32
-        p3_7 = re.compile(r"key_len:\s+(?P<rx_key_len>-?\d+)$")
+        p3_7 = regex_engine.compile(r"key_len:\s+(?P<rx_key_len>-?\d+)$")
 
         # hashkey_len: 16
-        p3_8 = re.compile(r"hashkey_len:\s+(?P<rx_hashkey_len>-?\d+)$")
+        p3_8 = regex_engine.compile(r"hashkey_len:\s+(?P<rx_hashkey_len>-?\d+)$")
 
         # bypass: 0
-        p3_9 = re.compile(r"bypass:\s+(?P<rx_bypass>-?\d+)$")
+        p3_9 = regex_engine.compile(r"bypass:\s+(?P<rx_bypass>-?\d+)$")
 
         # conf_offset: 0
-        p3_10 = re.compile(r"conf_offset:\s+(?P<rx_conf_offset>-?\d+)$")
+        p3_10 = regex_engine.compile(r"conf_offset:\s+(?P<rx_conf_offset>-?\d+)$")
 
         # cipher: GCM_AES_256
-        p3_11 = re.compile(r"cipher:\s+(?P<rx_cipher>\S+)$")
+        p3_11 = regex_engine.compile(r"cipher:\s+(?P<rx_cipher>\S+)$")
 
         # DeviceID 0
-        p4 = re.compile(r"DeviceID\s+(?P<id>-?\d+)$")
+        p4 = regex_engine.compile(r"DeviceID\s+(?P<id>-?\d+)$")
 
         for line in output.splitlines():
             # Port:10, Subport:0, Tx SC index:0
@@ -7211,120 +7211,120 @@ class ShowPlatformSoftwareIomdMacsecInterfacePortDetail(
         tx_match = rx_match = False
 
         # Port:10, Subport:0, Tx SC index:0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"Port:(?P<tx_port>-?\d+),\s+Subport:(?P<tx_sub_port>-?\d+),\s+Tx\s+SC\s+index:(?P<tx_index>-?\d+)$"
         )
 
         # Prev AN: 1, Cur AN: 2
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r"Prev\s+AN:\s+(?P<tx_prev_an>-?\d+),\s+Cur\s+AN:\s+(?P<tx_cur_an>-?\d+)$"
         )
 
         # encrypt: 1
-        p1_2 = re.compile(r"encrypt:\s+(?P<tx_encrypt>-?\d+)$")
+        p1_2 = regex_engine.compile(r"encrypt:\s+(?P<tx_encrypt>-?\d+)$")
 
         # vlan: 1
-        p1_3 = re.compile(r"vlan:\s+(?P<tx_vlan>-?\d+)$")
+        p1_3 = regex_engine.compile(r"vlan:\s+(?P<tx_vlan>-?\d+)$")
 
         # end_station: 0
-        p1_4 = re.compile(r"end_station:\s+(?P<tx_end_station>-?\d+)$")
+        p1_4 = regex_engine.compile(r"end_station:\s+(?P<tx_end_station>-?\d+)$")
 
         # scb: 0
-        p1_5 = re.compile(r"scb:\s+(?P<tx_scb>-?\d+)$")
+        p1_5 = regex_engine.compile(r"scb:\s+(?P<tx_scb>-?\d+)$")
 
         # nextPn: 1
-        p1_6 = re.compile(r"nextPn:\s+(?P<tx_next_pn>-?\d+)$")
+        p1_6 = regex_engine.compile(r"nextPn:\s+(?P<tx_next_pn>-?\d+)$")
 
         # key_len: 32
-        p1_7 = re.compile(r"key_len:\s+(?P<tx_key_len>-?\d+)$")
+        p1_7 = regex_engine.compile(r"key_len:\s+(?P<tx_key_len>-?\d+)$")
 
         # hashkey_len: 16
-        p1_8 = re.compile(r"hashkey_len:\s+(?P<tx_hashkey_len>-?\d+)$")
+        p1_8 = regex_engine.compile(r"hashkey_len:\s+(?P<tx_hashkey_len>-?\d+)$")
 
         # bypass: 0
-        p1_9 = re.compile(r"bypass:\s+(?P<tx_bypass>-?\d+)$")
+        p1_9 = regex_engine.compile(r"bypass:\s+(?P<tx_bypass>-?\d+)$")
 
         # conf_offset: 0
-        p1_10 = re.compile(r"conf_offset:\s+(?P<tx_conf_offset>-?\d+)$")
+        p1_10 = regex_engine.compile(r"conf_offset:\s+(?P<tx_conf_offset>-?\d+)$")
 
         # cipher: GCM_AES_256
-        p1_11 = re.compile(r"cipher:\s+(?P<tx_cipher>\S+)$")
+        p1_11 = regex_engine.compile(r"cipher:\s+(?P<tx_cipher>\S+)$")
 
         # Macsec hash data: Port: 10, Subport: 0, sa_index: -2130706432
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"Macsec\s+hash\s+data:\s+Port:\s+(?P<common_port>-?\d+),\s+Subport:\s+(?P<common_sub_port>-?\d+),\s+sa_index:\s+(?P<common_index>\S+)$"
         )
 
         # Install Rx Count 715
-        p2_1 = re.compile(r"Install\s+Rx\s+Count\s+(?P<install_rx_cnt>-?\d+)$")
+        p2_1 = regex_engine.compile(r"Install\s+Rx\s+Count\s+(?P<install_rx_cnt>-?\d+)$")
 
         # Install Tx Count 715
-        p2_2 = re.compile(r"Install\s+Tx\s+Count\s+(?P<install_tx_cnt>-?\d+)$")
+        p2_2 = regex_engine.compile(r"Install\s+Tx\s+Count\s+(?P<install_tx_cnt>-?\d+)$")
 
         # Delete Rx Count 711
-        p2_3 = re.compile(r"Delete\s+Rx\s+Count\s+(?P<del_rx_cnt>-?\d+)$")
+        p2_3 = regex_engine.compile(r"Delete\s+Rx\s+Count\s+(?P<del_rx_cnt>-?\d+)$")
 
         # Install Rx Fail Count 3
-        p2_4 = re.compile(
+        p2_4 = regex_engine.compile(
             r"Install\s+Rx\s+Fail\s+Count\s+(?P<instal_rx_fail_cnt>-?\d+)$"
         )
 
         # Install Tx Fail Count 0
-        p2_5 = re.compile(
+        p2_5 = regex_engine.compile(
             r"Install\s+Tx\s+Fail\s+Count\s+(?P<install_tx_fail_cnt>-?\d+)$"
         )
 
         # Delete Rx Fail Count 0
-        p2_6 = re.compile(r"Delete\s+Rx\s+Fail\s+Count\s+(?P<del_rx_fail_cnt>-?\d+)$")
+        p2_6 = regex_engine.compile(r"Delete\s+Rx\s+Fail\s+Count\s+(?P<del_rx_fail_cnt>-?\d+)$")
 
         # Rx SA Same AN Count 3
-        p2_7 = re.compile(r"Rx\s+SA\s+Same\s+AN\s+Count\s+(?P<rx_an_cnt>-?\d+)$")
+        p2_7 = regex_engine.compile(r"Rx\s+SA\s+Same\s+AN\s+Count\s+(?P<rx_an_cnt>-?\d+)$")
 
         # Delay protection: 0
-        p2_8 = re.compile(r"Delay\s+protection:\s+(?P<delay_protection>-?\d+)$")
+        p2_8 = regex_engine.compile(r"Delay\s+protection:\s+(?P<delay_protection>-?\d+)$")
 
         # Port:10, Subport:0, Rx SC index:0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"Port:(?P<rx_port>-?\d+),\s+Subport:(?P<rx_sub_port>-?\d+),\s+Rx\s+SC\s+index:(?P<rx_index>-?\d+)$"
         )
 
         # Prev AN: 1, Cur AN: 2
-        p3_1 = re.compile(
+        p3_1 = regex_engine.compile(
             r"Prev\s+AN:\s+(?P<rx_prev_an>-?\d+),\s+Cur\s+AN:\s+(?P<rx_cur_an>-?\d+)$"
         )
 
         # replay_protect: 1
-        p3_2 = re.compile(r"replay_protect:\s+(?P<rx_replay_protect>-?\d+)$")
+        p3_2 = regex_engine.compile(r"replay_protect:\s+(?P<rx_replay_protect>-?\d+)$")
 
         # replay_window_size: 0
-        p3_3 = re.compile(r"replay_window_size:\s+(?P<replay_window_size>-?\d+)$")
+        p3_3 = regex_engine.compile(r"replay_window_size:\s+(?P<replay_window_size>-?\d+)$")
 
         # decrypt_frames: 1
-        p3_4 = re.compile(r"decrypt_frames:\s+(?P<decrypt_frames>-?\d+)$")
+        p3_4 = regex_engine.compile(r"decrypt_frames:\s+(?P<decrypt_frames>-?\d+)$")
 
         # validate_frames: 1
-        p3_5 = re.compile(r"validate_frames:\s+(?P<validate_frames>-?\d+)$")
+        p3_5 = regex_engine.compile(r"validate_frames:\s+(?P<validate_frames>-?\d+)$")
 
         # nextPn: 0
-        p3_6 = re.compile(r"nextPn:\s+(?P<rx_next_pn>-?\d+)$")
+        p3_6 = regex_engine.compile(r"nextPn:\s+(?P<rx_next_pn>-?\d+)$")
 
         # key_len: 32
-        p3_7 = re.compile(r"key_len:\s+(?P<rx_key_len>-?\d+)$")
+        p3_7 = regex_engine.compile(r"key_len:\s+(?P<rx_key_len>-?\d+)$")
 
         # hashkey_len: 16
-        p3_8 = re.compile(r"hashkey_len:\s+(?P<rx_hashkey_len>-?\d+)$")
+        p3_8 = regex_engine.compile(r"hashkey_len:\s+(?P<rx_hashkey_len>-?\d+)$")
 
         # bypass: 0
-        p3_9 = re.compile(r"bypass:\s+(?P<rx_bypass>-?\d+)$")
+        p3_9 = regex_engine.compile(r"bypass:\s+(?P<rx_bypass>-?\d+)$")
 
         # conf_offset: 0
-        p3_10 = re.compile(r"conf_offset:\s+(?P<rx_conf_offset>-?\d+)$")
+        p3_10 = regex_engine.compile(r"conf_offset:\s+(?P<rx_conf_offset>-?\d+)$")
 
         # cipher: GCM_AES_256
-        p3_11 = re.compile(r"cipher:\s+(?P<rx_cipher>\S+)$")
+        p3_11 = regex_engine.compile(r"cipher:\s+(?P<rx_cipher>\S+)$")
 
         # DeviceID 0
-        p4 = re.compile(r"DeviceID\s+(?P<id>-?\d+)$")
+        p4 = regex_engine.compile(r"DeviceID\s+(?P<id>-?\d+)$")
 
         for line in output.splitlines():
             # Port:10, Subport:0, Tx SC index:0
@@ -7626,11 +7626,11 @@ class ShowPlatformSoftwareMemoryDatabaseFedSwitchActiveCallsite(
             output = self.device.execute(cmd)
 
         # Database name: BP_OPER_DB
-        p1 = re.compile(r"^Database name:\s+(?P<database>[\w\_]+)$")
+        p1 = regex_engine.compile(r"^Database name:\s+(?P<database>[\w\_]+)$")
 
         # 7E24C8967BBC800C    1             136
         # AEB80E49BA63C001    10            1176
-        p2 = re.compile(r"^(?P<callsite>\w+)\s+(?P<calls>\d+)\s+(?P<bytes>\d+)$")
+        p2 = regex_engine.compile(r"^(?P<callsite>\w+)\s+(?P<calls>\d+)\s+(?P<bytes>\d+)$")
 
         ret_dict = {}
 
@@ -7685,12 +7685,12 @@ class ShowDiagnosticStatus(ShowDiagnosticStatusSchema):
         ret_dict = {}
 
         # 1      C9300-24UX                        DiagThermalTest                 <HM>
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<card>\d)+\s+(?P<description>\S+)+\s+\S+\s+.(?P<run_by>\w+).*$"
         )
 
         # DiagFanTest                     <HM>
-        p2 = re.compile(r"^(?P<current_running_test>\S+\s+)<HM>$")
+        p2 = regex_engine.compile(r"^(?P<current_running_test>\S+\s+)<HM>$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -7756,10 +7756,10 @@ class ShowPlatformSoftwareCpmSwitchActiveB0CountersInterfaceLacp(
         ret_dict = {}
 
         # FiftyGigE1/0/25
-        p0 = re.compile(r"^(?P<interface>\S+)$")
+        p0 = regex_engine.compile(r"^(?P<interface>\S+)$")
 
         #'114      329      0     0'
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<tx>\d+) +(?P<rx>\d+) +(?P<tx_drop>\d+) +(?P<rx_drop>\d+)$"
         )
 
@@ -7839,35 +7839,35 @@ class ShowPlatformSoftwareCpmCountersInterfaceIsis(
         temp_dict = {}
 
         # FiftyGigE1/0/25 [4]
-        p0 = re.compile(r"^(?P<interface>\S+)\s+\[\d+\]$")
+        p0 = regex_engine.compile(r"^(?P<interface>\S+)\s+\[\d+\]$")
 
         #'114      329      0     0'
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<tx>\d+) +(?P<rx>\d+) +(?P<tx_drop>\d+) +(?P<rx_drop>\d+)$"
         )
 
         # Timestamp Now: Mar 07 11:00:43.313
-        p2 = re.compile(r"^Timestamp +Now\: +(?P<timestamp_now>.*)$")
+        p2 = regex_engine.compile(r"^Timestamp +Now\: +(?P<timestamp_now>.*)$")
 
         # ISIS RX Timestamp: Mar 11 10:42:45.594 [3]
-        p3 = re.compile(r"^ISIS +RX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
+        p3 = regex_engine.compile(r"^ISIS +RX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
 
         # ISIS RX Maximum Time Gap:                5 sec,             512 usec
-        p4 = re.compile(r"^ISIS +RX +Maximum +Time +Gap\: +(?P<rx_max_time_gap>.*)$")
+        p4 = regex_engine.compile(r"^ISIS +RX +Maximum +Time +Gap\: +(?P<rx_max_time_gap>.*)$")
 
         # ISIS RX Maximum Gap Timestamp: Mar 11 08:36:12.697
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^ISIS +RX +Maximum +Gap +Timestamp\: +(?P<rx_max_timestamp>.*)$"
         )
 
         # ISIS TX Timestamp: Mar 11 10:42:50.983 [1]
-        p6 = re.compile(r"^ISIS +TX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
+        p6 = regex_engine.compile(r"^ISIS +TX +Timestamp\: +(?P<time>.*) +\[(?P<count>\d+)\]$")
 
         # ISIS TX Maximum Time Gap:                9 sec,          492792 usec
-        p7 = re.compile(r"^ISIS +TX +Maximum +Time +Gap\: +(?P<tx_max_time_gap>.*)$")
+        p7 = regex_engine.compile(r"^ISIS +TX +Maximum +Time +Gap\: +(?P<tx_max_time_gap>.*)$")
 
         # ISIS TX Maximum Gap Timestamp: Mar 11 07:31:20.299
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^ISIS +TX +Maximum +Gap +Timestamp\: +(?P<tx_max_timestamp>.*)$"
         )
 
@@ -8010,7 +8010,7 @@ class ShowPlatformSoftwareMountSwitchActiveRpTmpfs(
         # Filesystem                 Used  Available Use % Mounted on
         # -------------------------------------------------------------------------------
         # tmpfs                    147996   25782148    1% /tmp/rp/tdldb
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^(?P<file_system>\S+)\s+(?P<used>\d+)\s+(?P<available>\d+)\s+(?P<use_percent>\S+)\s+(?P<mounted_on>\S+)$"
         )
 
@@ -8100,7 +8100,7 @@ class ShowPlatSwObjectManagerF0Statistics(ShowPlatSwObjectManagerF0StatisticsSch
         result_dict = {}
 
         # Object update: Pending-issue: 180, Pending-acknowledgement: 89
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Object update:\s+Pending-issue:"
             r"\s+(?P<pending_issue>\d+)\,\s"
             r"Pending-acknowledgement: "
@@ -8108,7 +8108,7 @@ class ShowPlatSwObjectManagerF0Statistics(ShowPlatSwObjectManagerF0StatisticsSch
         )
 
         # Batch begin:   Pending-issue: 0, Pending-acknowledgement: 0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Batch begin:\s+Pending-issue:"
             r"\s+(?P<pending_issue>\d+)\,\s"
             r"Pending-acknowledgement: "
@@ -8116,7 +8116,7 @@ class ShowPlatSwObjectManagerF0Statistics(ShowPlatSwObjectManagerF0StatisticsSch
         )
 
         # Batch end:     Pending-issue: 0, Pending-acknowledgement: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Batch end:\s+Pending-issue:"
             r"\s+(?P<pending_issue>\d+)\,\s"
             r"Pending-acknowledgement: "
@@ -8124,37 +8124,37 @@ class ShowPlatSwObjectManagerF0Statistics(ShowPlatSwObjectManagerF0StatisticsSch
         )
 
         # Command:       Pending-acknowledgement: 0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Command:+"
             r"\s+Pending-acknowledgement: "
             r"(?P<pending_acknowledgement>\d+)$"
         )
 
         # Total-objects: 1401
-        p5 = re.compile(r"^Total-objects:" r"\s+(?P<total_objects>\d+)$")
+        p5 = regex_engine.compile(r"^Total-objects:" r"\s+(?P<total_objects>\d+)$")
 
         # Stale-objects: 0
-        p6 = re.compile(r"^Stale-objects:" r"\s+(?P<stale_objects>\d+)$")
+        p6 = regex_engine.compile(r"^Stale-objects:" r"\s+(?P<stale_objects>\d+)$")
 
         # Resolve-objects: 0
-        p7 = re.compile(r"^Resolve-objects:" r"\s+(?P<resolve_objects>\d+)$")
+        p7 = regex_engine.compile(r"^Resolve-objects:" r"\s+(?P<resolve_objects>\d+)$")
 
         # Childless-delete-objects: 0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^Childless-delete-objects:" r"\s+(?P<childless_delete_objects>\d+)$"
         )
 
         # Backplane-objects: 0
-        p9 = re.compile(r"^Backplane-objects:" r"\s+(?P<backplane_objects>\d+)$")
+        p9 = regex_engine.compile(r"^Backplane-objects:" r"\s+(?P<backplane_objects>\d+)$")
 
         # Error-objects: 1
-        p10 = re.compile(r"^Error-objects:" r"\s+(?P<error_objects>\d+)$")
+        p10 = regex_engine.compile(r"^Error-objects:" r"\s+(?P<error_objects>\d+)$")
 
         # Number of bundles: 136
-        p11 = re.compile(r"^Number of bundles:" r"\s+(?P<number_of_bundles>\d+)$")
+        p11 = regex_engine.compile(r"^Number of bundles:" r"\s+(?P<number_of_bundles>\d+)$")
 
         # Paused-types: 0
-        p12 = re.compile(r"^Paused-types:" r"\s+(?P<paused_types>\d+)$")
+        p12 = regex_engine.compile(r"^Paused-types:" r"\s+(?P<paused_types>\d+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -8319,13 +8319,13 @@ class ShowPlatSwObjectManagerF0ErrorObject(ShowPlatSwObjectManagerF0ErrorObjectS
         result_dict = {}
 
         # Description: PREFIX 2.2.2.2/32 (Table id 1)
-        p0 = re.compile(r"^Description:\s+(?P<description>.*).*$")
+        p0 = regex_engine.compile(r"^Description:\s+(?P<description>.*).*$")
 
         # Object identifier: 1515
-        p1 = re.compile(r"^Object identifier:\s+(?P<identifier>\d+)$")
+        p1 = regex_engine.compile(r"^Object identifier:\s+(?P<identifier>\d+)$")
 
         # Status: Create-failed"
-        p2 = re.compile(r"Status:\s+(?P<status>\S+)$")
+        p2 = regex_engine.compile(r"Status:\s+(?P<status>\S+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -8411,7 +8411,7 @@ class ShowPlatformFedSwitchActiveWiredClientR0IdIifid(
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r"^(?P<pattern>[\w\s]+):\s+(?P<value>[\w\s\.]+)$")
+        p1 = regex_engine.compile(r"^(?P<pattern>[\w\s]+):\s+(?P<value>[\w\s\.]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -8479,58 +8479,58 @@ class ShowPlatformSoftwareInterfaceF0Name(ShowPlatformSoftwareInterfaceF0NameSch
         # initial variables
         ret_dict = {}
         # Name: HundredGigE2/0/22, ID: 1275, QFP ID: 1275, Schedules: 4096
-        p0 = re.compile(r"^Name: +(?P<name>\S+),\s+ID: +(?P<id>\d+),\s+QFP ID: +(?P<qfp_id>\d+),\s+Schedules: +(?P<schedules>\d+)$")
+        p0 = regex_engine.compile(r"^Name: +(?P<name>\S+),\s+ID: +(?P<id>\d+),\s+QFP ID: +(?P<qfp_id>\d+),\s+Schedules: +(?P<schedules>\d+)$")
 
         # Type: PORT, State: enabled, SNMP ID: 98, MTU: 1500
-        p1 = re.compile(r"^Type: +(?P<type>\w+),\s+State: +(?P<state>\w+),\s+SNMP ID: +(?P<snmp_id>\d+),\s+MTU: +(?P<mtu>\d+)$")
+        p1 = regex_engine.compile(r"^Type: +(?P<type>\w+),\s+State: +(?P<state>\w+),\s+SNMP ID: +(?P<snmp_id>\d+),\s+MTU: +(?P<mtu>\d+)$")
 
         # TX channel ID: 0, RX channel ID: 0, AOM state: created
-        p2 = re.compile(r"^TX channel ID: +(?P<tx_channel_id>\d+),\s+RX channel ID: +(?P<rx_channel_id>\d+),\s+AOM state: +(?P<aom_state>\w+)$")
+        p2 = regex_engine.compile(r"^TX channel ID: +(?P<tx_channel_id>\d+),\s+RX channel ID: +(?P<rx_channel_id>\d+),\s+AOM state: +(?P<aom_state>\w+)$")
 
         # Flow control ID: 49175
-        p3 = re.compile(r"^Flow control ID: +(?P<flow_control_id>\d+)$")
+        p3 = regex_engine.compile(r"^Flow control ID: +(?P<flow_control_id>\d+)$")
 
         # bandwidth: 100000000, encap: ARPA
-        p4 = re.compile(r"^bandwidth: +(?P<bandwidth>\d+),\s+encap: +(?P<encap>\w+)$")
+        p4 = regex_engine.compile(r"^bandwidth: +(?P<bandwidth>\d+),\s+encap: +(?P<encap>\w+)$")
 
         # IP Address: 10.10.10.96
-        p5 = re.compile(r"^IP Address: +(?P<ip_address>(\d{1,3}\.){3}\d{1,3})$")
+        p5 = regex_engine.compile(r"^IP Address: +(?P<ip_address>(\d{1,3}\.){3}\d{1,3})$")
 
         # IPV6 Address: ::
-        p6 = re.compile(r"^IPV6 Address: +(?P<ipv6_address>[\da-fA-F:]+)$")
+        p6 = regex_engine.compile(r"^IPV6 Address: +(?P<ipv6_address>[\da-fA-F:]+)$")
 
         # Flags: ipv4
-        p7 = re.compile(r"^Flags: +(?P<flags>[\w\s]+)$")
+        p7 = regex_engine.compile(r"^Flags: +(?P<flags>[\w\s]+)$")
 
         # ICMP Flags: unreachables, redirects, no-info-reply, no-mask-reply
-        p8 = re.compile(r"^ICMP Flags: +(?P<icmp_flags>[\w\s,-]+)$")
+        p8 = regex_engine.compile(r"^ICMP Flags: +(?P<icmp_flags>[\w\s,-]+)$")
 
         # ICMP6 Flags: unreachables, redirects
-        p9 = re.compile(r"^ICMP6 Flags: +(?P<icmp6_flags>[\w\s,-]+)$")
+        p9 = regex_engine.compile(r"^ICMP6 Flags: +(?P<icmp6_flags>[\w\s,-]+)$")
 
         # SMI enabled on protocol(s): UNKNOWN
-        p10 = re.compile(r"^SMI enabled on protocol\(s\): +(?P<smi_protocols>[\w\s,-]+)$")
+        p10 = regex_engine.compile(r"^SMI enabled on protocol\(s\): +(?P<smi_protocols>[\w\s,-]+)$")
 
         # Authenticated-user:
-        p11 = re.compile(r"^Authenticated-user: *(?P<auth_user>.*)$")
+        p11 = regex_engine.compile(r"^Authenticated-user: *(?P<auth_user>.*)$")
 
         # FRR linkdown ID: 65535
-        p12 = re.compile(r"^FRR linkdown ID: +(?P<frr_linkdown_id>\d+)$")
+        p12 = regex_engine.compile(r"^FRR linkdown ID: +(?P<frr_linkdown_id>\d+)$")
 
         # vNet Name: , vNet Tag: 0, vNet Extra Information: 0
-        p13 = re.compile(r"^vNet Name: *(?P<vnet_name>.*),\s+vNet Tag: +(?P<vnet_tag>\d+),\s+vNet Extra Information: +(?P<vnet_extra_info>\d+)$")
+        p13 = regex_engine.compile(r"^vNet Name: *(?P<vnet_name>.*),\s+vNet Tag: +(?P<vnet_tag>\d+),\s+vNet Extra Information: +(?P<vnet_extra_info>\d+)$")
 
         # Dirty: unknown
-        p14 = re.compile(r"^Dirty: +(?P<dirty_status>\w+)$")
+        p14 = regex_engine.compile(r"^Dirty: +(?P<dirty_status>\w+)$")
 
         # AOM dependency sanity check: PASS
-        p15 = re.compile(r"^AOM dependency sanity check: +(?P<aom_sanity_check>\w+)$")
+        p15 = regex_engine.compile(r"^AOM dependency sanity check: +(?P<aom_sanity_check>\w+)$")
 
         # AOM Obj ID: 2071
-        p16 = re.compile(r"^AOM Obj ID: +(?P<aom_obj_id>\d+)$")
+        p16 = regex_engine.compile(r"^AOM Obj ID: +(?P<aom_obj_id>\d+)$")
 
         # QOS trust type: Trust DSCP
-        p17 = re.compile(r"^QOS trust type: +(?P<qos_trust_type>[\w\s]+)$")
+        p17 = regex_engine.compile(r"^QOS trust type: +(?P<qos_trust_type>[\w\s]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -8703,13 +8703,13 @@ class ShowPlatformSoftwareObjectManagerF0ObjectIdentifier(
         ret_dict = {}
 
         # Object identifier: 2072
-        p0 = re.compile(r"^Object identifier\:\s+(?P<object_identifier>\d+)$")
+        p0 = regex_engine.compile(r"^Object identifier\:\s+(?P<object_identifier>\d+)$")
 
         # Description: Tx Channel HundredGigE2/0/22, handle 1275, hw handle 1275, flag 0x0, dirty hw: NONE dirty aom NONE
-        p1 = re.compile(r"^Description\:\s+(?P<description>.+)$")
+        p1 = regex_engine.compile(r"^Description\:\s+(?P<description>.+)$")
 
         # Status: Done
-        p2 = re.compile(r"Status\:\s+(?P<status>\w+)$")
+        p2 = regex_engine.compile(r"Status\:\s+(?P<status>\w+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -8775,25 +8775,25 @@ class ShowPlatsoftwaremcuversion(ShowPlatsoftwaremcuversionSchema):
         ret_dict = {}
 
         # Switch 1 MCU
-        p1 = re.compile(r'^Switch +(?P<switch_number>\d+) +MCU\:$')
+        p1 = regex_engine.compile(r'^Switch +(?P<switch_number>\d+) +MCU\:$')
 
         # Software Version   0.0
-        p2 =  re.compile(r'^Software +Version +(?P<software_version>.*)$')
+        p2 =  regex_engine.compile(r'^Software +Version +(?P<software_version>.*)$')
 
         # System Type        0
-        p3 = re.compile(r'^System +Type +(?P<system_type>.*)$')
+        p3 = regex_engine.compile(r'^System +Type +(?P<system_type>.*)$')
 
         # Device Id          0
-        p4 = re.compile(r'^Device +Id +(?P<device_id>.*)$')
+        p4 = regex_engine.compile(r'^Device +Id +(?P<device_id>.*)$')
 
         # Device Revision    0
-        p5 = re.compile(r'^Device +Revision +(?P<device_revision>.*)$')
+        p5 = regex_engine.compile(r'^Device +Revision +(?P<device_revision>.*)$')
 
         # Hardware Version   0
-        p6 = re.compile(r'^Hardware +Version +(?P<hardware_version>.*)$')
+        p6 = regex_engine.compile(r'^Hardware +Version +(?P<hardware_version>.*)$')
 
         # Bootloader Version 0
-        p7 = re.compile(r'^Bootloader +Version +(?P<bootloader_version>.*)$')
+        p7 = regex_engine.compile(r'^Bootloader +Version +(?P<bootloader_version>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -8895,70 +8895,70 @@ class ShowPlatsoftwaremcusubordinate(
         ret_dict = {}
 
         # showing sub info:    1
-        p1 = re.compile(r'^showing +sub +info\: +(?P<showing_sub_info>.*)$')
+        p1 = regex_engine.compile(r'^showing +sub +info\: +(?P<showing_sub_info>.*)$')
 
         # State                OK
-        p2 =  re.compile(r'^State +(?P<state>.*)$')
+        p2 =  regex_engine.compile(r'^State +(?P<state>.*)$')
 
         # Last Reset Reason    UNKNOWN REASON
-        p3 = re.compile(r'^Last +Reset +Reason +(?P<last_reset_reason>.*)$')
+        p3 = regex_engine.compile(r'^Last +Reset +Reason +(?P<last_reset_reason>.*)$')
 
         # UART FE Error        0
-        p4 = re.compile(r'^UART +FE +Error +(?P<uart_fe_error>\d+)$')
+        p4 = regex_engine.compile(r'^UART +FE +Error +(?P<uart_fe_error>\d+)$')
 
         # UART PE Error        0
-        p5 = re.compile(r'^UART +PE +Error +(?P<uart_pe_error>\d+)$')
+        p5 = regex_engine.compile(r'^UART +PE +Error +(?P<uart_pe_error>\d+)$')
 
         # UART DOR Error       0
-        p6 = re.compile(r'^UART +DOR +Error +(?P<uart_dor_error>\d+)$')
+        p6 = regex_engine.compile(r'^UART +DOR +Error +(?P<uart_dor_error>\d+)$')
 
         # Rx Buf Overflow      0
-        p7 = re.compile(r'^Rx +Buf +Overflow +(?P<rx_buf_overflow>\d+)$')
+        p7 = regex_engine.compile(r'^Rx +Buf +Overflow +(?P<rx_buf_overflow>\d+)$')
 
         # Rx Buf Underflow      0
-        p8 = re.compile(r'^Rx +Buf +Underflow +(?P<rx_buf_underflow>\d+)$')
+        p8 = regex_engine.compile(r'^Rx +Buf +Underflow +(?P<rx_buf_underflow>\d+)$')
 
         # Tx Buf Full          0
-        p9 = re.compile(r'^Tx +Buf +Full +(?P<tx_buf_full>\d+)$')
+        p9 = regex_engine.compile(r'^Tx +Buf +Full +(?P<tx_buf_full>\d+)$')
 
         # Rx Bad Endbyte       0
-        p10 = re.compile(r'^Rx +Bad +Endbyte +(?P<rx_bad_endbyte>\d+)$')
+        p10 = regex_engine.compile(r'^Rx +Bad +Endbyte +(?P<rx_bad_endbyte>\d+)$')
 
         # PLE Invalid App      0
-        p11 = re.compile(r'^PLE +Invalid +App +(?P<ple_invalid_app>\d+)$')
+        p11 = regex_engine.compile(r'^PLE +Invalid +App +(?P<ple_invalid_app>\d+)$')
 
         # PLE Disabled App     0
-        p12 = re.compile(r'^PLE +Disabled +App +(?P<ple_disabled_app>\d+)$')
+        p12 = regex_engine.compile(r'^PLE +Disabled +App +(?P<ple_disabled_app>\d+)$')
 
         # PLE Invalid Data     0
-        p13 = re.compile(r'^PLE +Invalid +Data +(?P<ple_invalid_data>\d+)$')
+        p13 = regex_engine.compile(r'^PLE +Invalid +Data +(?P<ple_invalid_data>\d+)$')
 
         # PLE Invalid Flags    0
-        p14 = re.compile(r'^PLE +Invalid +Flags +(?P<ple_invalid_flags>\d+)$')
+        p14 = regex_engine.compile(r'^PLE +Invalid +Flags +(?P<ple_invalid_flags>\d+)$')
 
         # PLE App Error        0
-        p15 = re.compile(r'^PLE +App +Error +(?P<ple_app_error>\d+)$')
+        p15 = regex_engine.compile(r'^PLE +App +Error +(?P<ple_app_error>\d+)$')
 
         # PLE Lost Ctxt        0
-        p16 = re.compile(r'^PLE +Lost +Ctxt +(?P<ple_lost_ctxt>\d+)$')
+        p16 = regex_engine.compile(r'^PLE +Lost +Ctxt +(?P<ple_lost_ctxt>\d+)$')
 
         # PLE Invalid Reg      0
-        p17 = re.compile(r'^PLE +Invalid +Reg +(?P<ple_invalid_reg>\d+)$')
+        p17 = regex_engine.compile(r'^PLE +Invalid +Reg +(?P<ple_invalid_reg>\d+)$')
 
         # PLE Invalid Reg Len  0
-        p18 = re.compile(r'^PLE +Invalid +Reg +Len +(?P<ple_invalid_reg_len>\d+)$')
+        p18 = regex_engine.compile(r'^PLE +Invalid +Reg +Len +(?P<ple_invalid_reg_len>\d+)$')
 
         # PLE Invalid Msg Len  0
-        p19 = re.compile(r'^PLE +Invalid +Msg +Len +(?P<ple_invalid_msg_len>\d+)$')
+        p19 = regex_engine.compile(r'^PLE +Invalid +Msg +Len +(?P<ple_invalid_msg_len>\d+)$')
 
         # SLE Poe No Port      0
-        p20 = re.compile(r'^SLE +Poe +No +Port +(?P<sle_poe_no_port>\d+)$')
+        p20 = regex_engine.compile(r'^SLE +Poe +No +Port +(?P<sle_poe_no_port>\d+)$')
 
         # SLE Invalid Reg Len  0
-        p21 = re.compile(r'^SLE +Invalid +Reg +Len +(?P<sle_invalid_reg_len>\d+)$')
+        p21 = regex_engine.compile(r'^SLE +Invalid +Reg +Len +(?P<sle_invalid_reg_len>\d+)$')
 
         # SLE Msg Underrun     0
-        p22 = re.compile(r'^SLE +Msg +Underrun +(?P<sle_msg_underrun>\d+)$')
+        p22 = regex_engine.compile(r'^SLE +Msg +Underrun +(?P<sle_msg_underrun>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -9196,16 +9196,16 @@ class ShowPlatformSoftwareInfrastructureInject(ShowPlatformSoftwareInfrastructur
         parsed_dict = {}
 
         # 3524142 total inject pak, 0 failed
-        p1 = re.compile(r'^(?P<total>\d+) total (?P<type>[\w\s\-]+) pak, (?P<failed>\d+) failed$')
+        p1 = regex_engine.compile(r'^(?P<total>\d+) total (?P<type>[\w\s\-]+) pak, (?P<failed>\d+) failed$')
 
         #  0 Feature multicast overlay replication
-        p2 = re.compile(r'^(?P<value>\d+) (?P<key>[\w\s\-]+)$')
+        p2 = regex_engine.compile(r'^(?P<value>\d+) (?P<key>[\w\s\-]+)$')
 
         #  0 MPLS, 0 Non-IP Tunnel
-        p3 = re.compile(r'^(?P<value1>\d+) (?P<key1>[\w\s\-]+), (?P<value2>\d+) (?P<key2>[\w\s\-]+)$')
+        p3 = regex_engine.compile(r'^(?P<value1>\d+) (?P<key1>[\w\s\-]+), (?P<value2>\d+) (?P<key2>[\w\s\-]+)$')
 
         # Statistics for L2 injected packets:
-        p4 = re.compile(r'^(?P<key>[\w\s\-]+):$')
+        p4 = regex_engine.compile(r'^(?P<key>[\w\s\-]+):$')
 
         # Track sections
         current_section = None
@@ -9349,163 +9349,163 @@ class ShowPlatsoftwaremcumanager(ShowPlatsoftwaremcumanagerSchema):
         ret_dict = {}
 
         #showing manager info: 1
-        p1 = re.compile(r'^showing +manager +info\: +(?P<showing_manager_info>.*)$')
+        p1 = regex_engine.compile(r'^showing +manager +info\: +(?P<showing_manager_info>.*)$')
 
         #Tx cmd cnt   SYS App              0
-        p2 =  re.compile(r'^Tx +cmd +cnt +SYS +App +(?P<tx_cmd_cnt_sys_app>.*)$')
+        p2 =  regex_engine.compile(r'^Tx +cmd +cnt +SYS +App +(?P<tx_cmd_cnt_sys_app>.*)$')
 
         #Rx cmd cnt   SYS App              0
-        p3 = re.compile(r'^Rx +cmd +cnt +SYS +App +(?P<rx_cmd_cnt_sys_app>.*)$')
+        p3 = regex_engine.compile(r'^Rx +cmd +cnt +SYS +App +(?P<rx_cmd_cnt_sys_app>.*)$')
 
         #Tx cmd ignore   SYS App           0
-        p4 = re.compile(r'^Tx +cmd +ignore +SYS +App +(?P<tx_cmd_ignore_sys_app>.*)$')
+        p4 = regex_engine.compile(r'^Tx +cmd +ignore +SYS +App +(?P<tx_cmd_ignore_sys_app>.*)$')
 
         #Tx cmd Q full   SYS App           0
-        p5 = re.compile(r'^Tx +cmd +Q +full +SYS +App +(?P<tx_cmd_q_full_sys_app>.*)$')
+        p5 = regex_engine.compile(r'^Tx +cmd +Q +full +SYS +App +(?P<tx_cmd_q_full_sys_app>.*)$')
 
         #Tx cmd cnt   POE App              0
-        p6 = re.compile(r'^Tx +cmd +cnt +POE +App +(?P<tx_cmd_cnt_poe_app>.*)$')
+        p6 = regex_engine.compile(r'^Tx +cmd +cnt +POE +App +(?P<tx_cmd_cnt_poe_app>.*)$')
 
         #Rx cmd cnt   POE App              0
-        p7 = re.compile(r'^Rx +cmd +cnt +POE +App +(?P<rx_cmd_cnt_poe_app>.*)$')
+        p7 = regex_engine.compile(r'^Rx +cmd +cnt +POE +App +(?P<rx_cmd_cnt_poe_app>.*)$')
 
         #Tx cmd ignore   POE App           0
-        p8 = re.compile(r'^Tx +cmd +ignore +POE +App+(?P<tx_cmd_ignore_poe_app>.*)$')
+        p8 = regex_engine.compile(r'^Tx +cmd +ignore +POE +App+(?P<tx_cmd_ignore_poe_app>.*)$')
 
         #Tx cmd Q full   POE App           0
-        p9 = re.compile(r'^Tx +cmd +Q +full +POE +App +(?P<tx_cmd_q_full_poe_app>.*)$')
+        p9 = regex_engine.compile(r'^Tx +cmd +Q +full +POE +App +(?P<tx_cmd_q_full_poe_app>.*)$')
 
         #Tx cmd cnt FRUFEP App              0
-        p10 = re.compile(r'^Tx +cmd +cnt +FRUFEP +App +(?P<tx_cmd_cnt_frufep_app>.*)$')
+        p10 = regex_engine.compile(r'^Tx +cmd +cnt +FRUFEP +App +(?P<tx_cmd_cnt_frufep_app>.*)$')
 
         #Rx cmd cnt FRUFEP App              0
-        p11 = re.compile(r'^Rx +cmd +cnt +FRUFEP +App +(?P<rx_cmd_cnt_frufep_app>.*)$')
+        p11 = regex_engine.compile(r'^Rx +cmd +cnt +FRUFEP +App +(?P<rx_cmd_cnt_frufep_app>.*)$')
 
         #Tx cmd ignore FRUFEP App           0
-        p12 = re.compile(r'^Tx +cmd +ignore +FRUFEP +App +(?P<tx_cmd_ignore_frufep_app>.*)$')
+        p12 = regex_engine.compile(r'^Tx +cmd +ignore +FRUFEP +App +(?P<tx_cmd_ignore_frufep_app>.*)$')
 
         #Tx cmd Q full FRUFEP App           0
-        p13 = re.compile(r'^Tx +cmd +Q +full +FRUFEP +App +(?P<tx_cmd_q_full_frufep_app>.*)$')
+        p13 = regex_engine.compile(r'^Tx +cmd +Q +full +FRUFEP +App +(?P<tx_cmd_q_full_frufep_app>.*)$')
 
         #Tx cmd cnt IMAGE App              0
-        p14 = re.compile(r'^Tx +cmd +cnt +IMAGE +App +(?P<tx_cmd_cnt_image_app>.*)$')
+        p14 = regex_engine.compile(r'^Tx +cmd +cnt +IMAGE +App +(?P<tx_cmd_cnt_image_app>.*)$')
 
         #Rx cmd cnt IMAGE App              0
-        p15 = re.compile(r'^Rx +cmd +cnt +IMAGE +App +(?P<rx_cmd_cnt_image_app>.*)$')
+        p15 = regex_engine.compile(r'^Rx +cmd +cnt +IMAGE +App +(?P<rx_cmd_cnt_image_app>.*)$')
 
         #Tx cmd ignore IMAGE App           0
-        p16 = re.compile(r'^Tx +cmd +ignore +IMAGE +App +(?P<tx_cmd_ignore_image_app>.*)$')
+        p16 = regex_engine.compile(r'^Tx +cmd +ignore +IMAGE +App +(?P<tx_cmd_ignore_image_app>.*)$')
 
         #Tx cmd Q full IMAGE App           0
-        p17 = re.compile(r'^Tx +cmd +Q +full +IMAGE +App +(?P<tx_cmd_q_full_image_app>.*)$')
+        p17 = regex_engine.compile(r'^Tx +cmd +Q +full +IMAGE +App +(?P<tx_cmd_q_full_image_app>.*)$')
 
         #Tx cmd cnt STACKPOWER App              0
-        p18 = re.compile(r'^Tx +cmd +cnt +STACKPOWER +App +(?P<tx_cmd_cnt_stackpower_app>.*)$')
+        p18 = regex_engine.compile(r'^Tx +cmd +cnt +STACKPOWER +App +(?P<tx_cmd_cnt_stackpower_app>.*)$')
 
         #Rx cmd cnt STACKPOWER App              0
-        p19 = re.compile(r'^Rx +cmd +cnt +STACKPOWER +App +(?P<rx_cmd_cnt_stackpower_app>.*)$')
+        p19 = regex_engine.compile(r'^Rx +cmd +cnt +STACKPOWER +App +(?P<rx_cmd_cnt_stackpower_app>.*)$')
 
         #Tx cmd ignore STACKPOWER App           0
-        p20 = re.compile(r'^Tx +cmd +ignore +STACKPOWER +App +(?P<tx_cmd_ignore_stackpower_app>.*)$')
+        p20 = regex_engine.compile(r'^Tx +cmd +ignore +STACKPOWER +App +(?P<tx_cmd_ignore_stackpower_app>.*)$')
 
         #Tx cmd Q full STACKPOWER App           0
-        p21 = re.compile(r'^Tx +cmd +Q +full +STACKPOWER +App +(?P<tx_cmd_q_full_stackpower_app>.*)$')
+        p21 = regex_engine.compile(r'^Tx +cmd +Q +full +STACKPOWER +App +(?P<tx_cmd_q_full_stackpower_app>.*)$')
 
         #Tx cmd cnt   J2A App              0
-        p22 = re.compile(r'^Tx +cmd +cnt +J2A +App +(?P<tx_cmd_cnt_j2a_app>.*)$')
+        p22 = regex_engine.compile(r'^Tx +cmd +cnt +J2A +App +(?P<tx_cmd_cnt_j2a_app>.*)$')
 
         #Rx cmd cnt   J2A App              0
-        p23 = re.compile(r'^Rx +cmd +cnt +J2A +App +(?P<rx_cmd_cnt_j2a_app>.*)$')
+        p23 = regex_engine.compile(r'^Rx +cmd +cnt +J2A +App +(?P<rx_cmd_cnt_j2a_app>.*)$')
 
         #Tx cmd ignore   J2A App           0
-        p24 = re.compile(r'^Tx +cmd +ignore +J2A +App +(?P<tx_cmd_ignore_j2a_app>.*)$')
+        p24 = regex_engine.compile(r'^Tx +cmd +ignore +J2A +App +(?P<tx_cmd_ignore_j2a_app>.*)$')
 
         #Tx cmd Q full   J2A App           0
-        p25 = re.compile(r'^Tx +cmd +Q +full +J2A +App +(?P<tx_cmd_q_full_j2a_app>.*)$')
+        p25 = regex_engine.compile(r'^Tx +cmd +Q +full +J2A +App +(?P<tx_cmd_q_full_j2a_app>.*)$')
 
         #Tx cmd cnt THERM App              0
-        p26 = re.compile(r'^Tx +cmd +cnt +THERM +App +(?P<tx_cmd_cnt_therm_app>.*)$')
+        p26 = regex_engine.compile(r'^Tx +cmd +cnt +THERM +App +(?P<tx_cmd_cnt_therm_app>.*)$')
 
         #Rx cmd cnt THERM App              0
-        p27 = re.compile(r'^Rx +cmd +cnt +THERM +App +(?P<rx_cmd_cnt_therm_app>.*)$')
+        p27 = regex_engine.compile(r'^Rx +cmd +cnt +THERM +App +(?P<rx_cmd_cnt_therm_app>.*)$')
 
         #Tx cmd ignore THERM App           0
-        p28 = re.compile(r'^Tx +cmd +ignore +THERM +App +(?P<tx_cmd_ignore_therm_app>.*)$')
+        p28 = regex_engine.compile(r'^Tx +cmd +ignore +THERM +App +(?P<tx_cmd_ignore_therm_app>.*)$')
 
         #Tx cmd Q full THERM App           0
-        p29 = re.compile(r'^Tx +cmd +Q +full +THERM +App +(?P<tx_cmd_q_full_therm_app>.*)$')
+        p29 = regex_engine.compile(r'^Tx +cmd +Q +full +THERM +App +(?P<tx_cmd_q_full_therm_app>.*)$')
 
         #Tx reg cnt                        2
-        p30 = re.compile(r'^Tx +reg +cnt +(?P<tx_reg_cnt>.*)$')
+        p30 = regex_engine.compile(r'^Tx +reg +cnt +(?P<tx_reg_cnt>.*)$')
 
         #Rx reg cnt                        0
-        p31 = re.compile(r'^Rx +reg +cnt +(?P<rx_reg_cnt>.*)$')
+        p31 = regex_engine.compile(r'^Rx +reg +cnt +(?P<rx_reg_cnt>.*)$')
 
         #Tx reg ignore                     2
-        p32 = re.compile(r'^Tx +reg +ignore +(?P<tx_reg_ignore>\d+)$')
+        p32 = regex_engine.compile(r'^Tx +reg +ignore +(?P<tx_reg_ignore>\d+)$')
 
         #Tx reg Q full                     0
-        p33 = re.compile(r'^Tx +reg +Q full +(?P<tx_reg_q_full>\d+)$')
+        p33 = regex_engine.compile(r'^Tx +reg +Q full +(?P<tx_reg_q_full>\d+)$')
 
         #Rx invalid frame                  2
-        p34 = re.compile(r'^Rx +invalid +frame +(?P<rx_invalid_frame>\d+)$')
+        p34 = regex_engine.compile(r'^Rx +invalid +frame +(?P<rx_invalid_frame>\d+)$')
 
         #Rx invalid App                    0
-        p35 = re.compile(r'^Rx +invalid +App +(?P<rx_invalid_app>\d+)$')
+        p35 = regex_engine.compile(r'^Rx +invalid +App +(?P<rx_invalid_app>\d+)$')
 
         #Rx invalid Seq                    0
-        p36 = re.compile(r'^Rx +invalid +Seq +(?P<rx_invalid_seq>\d+)$')
+        p36 = regex_engine.compile(r'^Rx +invalid +Seq +(?P<rx_invalid_seq>\d+)$')
 
         #Rx invalid checksum               0
-        p37 = re.compile(r'^Rx +invalid +checksum +(?P<rx_invalid_checksum>\d+)$')
+        p37 = regex_engine.compile(r'^Rx +invalid +checksum +(?P<rx_invalid_checksum>\d+)$')
 
         #Nack cnt                          0
-        p38 = re.compile(r'^Nack +cnt +(?P<nack_cnt>\d+)$')
+        p38 = regex_engine.compile(r'^Nack +cnt +(?P<nack_cnt>\d+)$')
 
         #Send Break count                  0
-        p39 = re.compile(r'^Send +Break +count +(?P<send_break_count>\d+)$')
+        p39 = regex_engine.compile(r'^Send +Break +count +(?P<send_break_count>\d+)$')
 
         #Early Send Break count            0
-        p40 = re.compile(r'^Early +Send +Break +count +(?P<early_send_break_count>\d+)$')
+        p40 = regex_engine.compile(r'^Early +Send +Break +count +(?P<early_send_break_count>\d+)$')
 
         #Retransmission cnt                0
-        p41 = re.compile(r'^Retransmission +cnt +(?P<retransmission_cnt>\d+)$')
+        p41 = regex_engine.compile(r'^Retransmission +cnt +(?P<retransmission_cnt>\d+)$')
 
         #Tx cmd cnt  GPIO App              0
-        p42 = re.compile(r'^Tx +cmd +cnt +GPIO +App +(?P<tx_cmd_cnt_gpio_app>.*)$')
+        p42 = regex_engine.compile(r'^Tx +cmd +cnt +GPIO +App +(?P<tx_cmd_cnt_gpio_app>.*)$')
 
         #Rx cmd cnt  GPIO App              0
-        p43 = re.compile(r'^Rx +cmd +cnt +GPIO +App +(?P<rx_cmd_cnt_gpio_app>.*)$')
+        p43 = regex_engine.compile(r'^Rx +cmd +cnt +GPIO +App +(?P<rx_cmd_cnt_gpio_app>.*)$')
 
         #Tx cmd ignore  GPIO App           0
-        p44 = re.compile(r'^Tx +cmd +ignore +GPIO +App +(?P<tx_cmd_ignore_gpio_app>.*)$')
+        p44 = regex_engine.compile(r'^Tx +cmd +ignore +GPIO +App +(?P<tx_cmd_ignore_gpio_app>.*)$')
 
         #Tx cmd Q full  GPIO App           0
-        p45 = re.compile(r'^Tx +cmd +Q +full +GPIO +App +(?P<tx_cmd_q_full_gpio_app>.*)$')
+        p45 = regex_engine.compile(r'^Tx +cmd +Q +full +GPIO +App +(?P<tx_cmd_q_full_gpio_app>.*)$')
 
         #Tx cmd cnt POE_EXT App              0
-        p46 = re.compile(r'^Tx +cmd +cnt +POE_EXT +App +(?P<tx_cmd_cnt_poe_ext_app>.*)$')
+        p46 = regex_engine.compile(r'^Tx +cmd +cnt +POE_EXT +App +(?P<tx_cmd_cnt_poe_ext_app>.*)$')
 
         #Rx cmd cnt POE_EXT App              0
-        p47 = re.compile(r'^Rx +cmd +cnt +POE_EXT +App +(?P<rx_cmd_cnt_poe_ext_app>.*)$')
+        p47 = regex_engine.compile(r'^Rx +cmd +cnt +POE_EXT +App +(?P<rx_cmd_cnt_poe_ext_app>.*)$')
 
         #Tx cmd ignore POE_EXT App           0
-        p48 = re.compile(r'^Tx +cmd +ignore +POE_EXT +App +(?P<tx_cmd_ignore_poe_ext_app>.*)$')
+        p48 = regex_engine.compile(r'^Tx +cmd +ignore +POE_EXT +App +(?P<tx_cmd_ignore_poe_ext_app>.*)$')
 
         #Tx cmd Q full POE_EXT App           0
-        p49 = re.compile(r'^Tx +cmd +Q +full +POE_EXT +App +(?P<tx_cmd_q_full_poe_ext_app>.*)$')
+        p49 = regex_engine.compile(r'^Tx +cmd +Q +full +POE_EXT +App +(?P<tx_cmd_q_full_poe_ext_app>.*)$')
 
         #Tx cmd cnt DMSG App              0
-        p50 = re.compile(r'^Tx +cmd +cnt +DMSG +App +(?P<tx_cmd_cnt_dsmg_app>.*)$')
+        p50 = regex_engine.compile(r'^Tx +cmd +cnt +DMSG +App +(?P<tx_cmd_cnt_dsmg_app>.*)$')
 
         #Rx cmd cnt DMSG App              0
-        p51 = re.compile(r'^Rx +cmd +cnt +DMSG +App +(?P<rx_cmd_cnt_dsmg_app>.*)$')
+        p51 = regex_engine.compile(r'^Rx +cmd +cnt +DMSG +App +(?P<rx_cmd_cnt_dsmg_app>.*)$')
 
         #Tx cmd ignore DMSG App           0
-        p52 = re.compile(r'^Tx +cmd +ignore +DMSG +App +(?P<tx_cmd_ignore_dsmg_app>.*)$')
+        p52 = regex_engine.compile(r'^Tx +cmd +ignore +DMSG +App +(?P<tx_cmd_ignore_dsmg_app>.*)$')
 
         #Tx cmd Q full DMSG App           0
-        p53 = re.compile(r'^Tx +cmd +Q +full +DMSG +App +(?P<tx_cmd_q_full_dsmg_app>.*)$')
+        p53 = regex_engine.compile(r'^Tx +cmd +Q +full +DMSG +App +(?P<tx_cmd_q_full_dsmg_app>.*)$')
 
         i = j = k = l = 0
 
@@ -9923,7 +9923,7 @@ class ShowPlatformSoftwareWiredClientID(ShowPlatformSoftwareWiredClientIDSchema)
         # Regular expression pattern
         # ID  MAC Address     Fwd    Open Access
         # 0x15be62c3  00a3.d1f3.d9eb  Yes    No
-        p1 = re.compile(r'^(?P<id>0x[a-fA-F0-9]+)\s+(?P<mac_address>[0-9a-fA-F\.]+)\s+(?P<fwd>\w+)\s+(?P<open_access>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<id>0x[a-fA-F0-9]+)\s+(?P<mac_address>[0-9a-fA-F\.]+)\s+(?P<fwd>\w+)\s+(?P<open_access>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -9994,41 +9994,41 @@ class ShowPlatsoftwaremcusnapshot(ShowPlatsoftwaremcusnapshotSchema):
         ret_dict = {}
                 
         # Fast PoE power budget: 0
-        p1 = re.compile(r'^Fast +PoE +power +budget\: +(?P<fast_poe_power_budget>\d+)$')
+        p1 = regex_engine.compile(r'^Fast +PoE +power +budget\: +(?P<fast_poe_power_budget>\d+)$')
         
         # Load Shed info:
-        p2 =  re.compile(r'^Load +Shed +info\:$')        
+        p2 =  regex_engine.compile(r'^Load +Shed +info\:$')        
                 
         # TOP: 1, wrap around : 0 
-        p3 = re.compile(r'^TOP\: +(?P<top>\d+)\, +wrap +around +\: +(?P<wrap_around>\d+)$')  
+        p3 = regex_engine.compile(r'^TOP\: +(?P<top>\d+)\, +wrap +around +\: +(?P<wrap_around>\d+)$')  
 
         # Got invalid load shed info
         # 0x00
-        p4 = re.compile(r'^(?P<invalid_load_shed_info>(0x\w+){1})$')
+        p4 = regex_engine.compile(r'^(?P<invalid_load_shed_info>(0x\w+){1})$')
          
         # Manufacturing Config
-        p5 = re.compile(r'^Manufacturing +Config$')
+        p5 = regex_engine.compile(r'^Manufacturing +Config$')
         
         # User Config                           
-        p6 = re.compile(r'^User +Config$') 
+        p6 = regex_engine.compile(r'^User +Config$') 
         
         # Red Earth data
-        p7 = re.compile(r'^Red +Earth +data$')
+        p7 = regex_engine.compile(r'^Red +Earth +data$')
 
         # I2C data         
-        p8 = re.compile(r'^I2C +data$')  
+        p8 = regex_engine.compile(r'^I2C +data$')  
         
         # Load Shed Registers      
-        p9 = re.compile(r'^Load +Shed +Registers$')  
+        p9 = regex_engine.compile(r'^Load +Shed +Registers$')  
         
         # acmy_cfg0                   : 0xc0          
         # Lo POE load shed priority   : 0
         # Power stack mode            : STK_PWR_POWER_SHARING_MODE_STRICT 
         # mac address                 : aa:bb:cc:dd:ee:ff 
-        p10 = re.compile(r'^(?P<key>[\w\s]+):\s+(?P<value>0x[\w\d]+|\d{1,3}|\w[\w:\-]+)') 
+        p10 = regex_engine.compile(r'^(?P<key>[\w\s]+):\s+(?P<value>0x[\w\d]+|\d{1,3}|\w[\w:\-]+)') 
         
         # 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00 0x00
-        p11 = re.compile(r'^(?P<registers>(?:0x[0-9A-Fa-f]{2}\s*){3,})$')    
+        p11 = regex_engine.compile(r'^(?P<registers>(?:0x[0-9A-Fa-f]{2}\s*){3,})$')    
         
         count  = regflag = 0    
         
@@ -41,7 +41,6 @@
     * 'show platform software fed switch {switch} ifm mappings {ifm_type}'
 """
 # Python
-import re
 import logging
 from collections import OrderedDict
 from sys import int_info
@@ -51,6 +50,7 @@ from xml.dom import minidom
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And, ListOf
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -108,59 +108,59 @@ class ShowPlatformSoftwareFedSwitchAclIfId(ShowPlatformSoftwareFedSwitchAclIfIdS
         ret_dict = {}
 
         # ##  INTFACE INFO: (INTF_TYPE: Group)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\#\#\s\sINTFACE\sINFO\:\s\(INTF\_TYPE\:\s+(?P<intf_type>\S+)\)$"
         )
 
         # INTERFACE: Client MAC 00da.5516.1903
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^INTERFACE\:\sClient\sMAC\s(?P<interface_client_mac>[\w\.]+)$"
         )
 
         # MAC 00da.5516.1903
-        p3 = re.compile(r"^MAC\s(?P<interface_mac>[\w\.]+)$")
+        p3 = regex_engine.compile(r"^MAC\s(?P<interface_mac>[\w\.]+)$")
 
         #     intfinfo: 0x73e7d8169408
-        p4 = re.compile(r"^intfinfo\:\s(?P<intfinfo>\w+)$")
+        p4 = regex_engine.compile(r"^intfinfo\:\s(?P<intfinfo>\w+)$")
 
         #     Interface handle: 0x3f0001ad
-        p5 = re.compile(r"^Interface\shandle\:\s(?P<intf_handle>\w+)$")
+        p5 = regex_engine.compile(r"^Interface\shandle\:\s(?P<intf_handle>\w+)$")
 
         # Interface Type: Group
-        p6 = re.compile(r"^Interface\s+Type:\s+(?P<interface_type>\w+)$")
+        p6 = regex_engine.compile(r"^Interface\s+Type:\s+(?P<interface_type>\w+)$")
 
         #     if-id: 0x000000001a4bff14
-        p7 = re.compile(r"^if\-id\:\s(?P<intf_if_id>\w+)$")
+        p7 = regex_engine.compile(r"^if\-id\:\s(?P<intf_if_id>\w+)$")
 
         # Direction:  Input
-        p8 = re.compile(r"^Direction\:\s\s(?P<intf_direction>\w+)$")
+        p8 = regex_engine.compile(r"^Direction\:\s\s(?P<intf_direction>\w+)$")
 
         # Protocol Type:IP
-        p9 = re.compile(r"^Protocol\sType\:(?P<intf_protocol_type>\w+)$")
+        p9 = regex_engine.compile(r"^Protocol\sType\:(?P<intf_protocol_type>\w+)$")
 
         # Policy Intface Handle: 0x1b00011f
-        p10 = re.compile(r"^Policy\sIntface\sHandle\:\s(?P<policy_intf_handle>\w+)$")
+        p10 = regex_engine.compile(r"^Policy\sIntface\sHandle\:\s(?P<policy_intf_handle>\w+)$")
 
         #     Policy Handle: 0x80000ba
-        p11 = re.compile(r"^Policy\sHandle\:\s(?P<policy_handle>\w+)$")
+        p11 = regex_engine.compile(r"^Policy\sHandle\:\s(?P<policy_handle>\w+)$")
 
         #     Policy handle       : 0x080000ba
-        p12 = re.compile(r"^Policy\shandle\s{7}\:\s(?P<policy_info_handle>\w+)$")
+        p12 = regex_engine.compile(r"^Policy\shandle\s{7}\:\s(?P<policy_info_handle>\w+)$")
 
         # Policy name         : implicit_deny_v6!implicit_deny:xACSACLx-IPV6-PERMIT_ALL_IPV6_TRAFFIC-61117e44!xACSACLx-IP-PERMIT_ALL_IPV4_TRAFFIC-57f6b0d3:
-        p13 = re.compile(r"^Policy\sname\s{9}\:\s(?P<policy_info_name>[\w\-\!\_\:]+)$")
+        p13 = regex_engine.compile(r"^Policy\sname\s{9}\:\s(?P<policy_info_name>[\w\-\!\_\:]+)$")
 
         # ID                  : 1296
-        p14 = re.compile(r"^ID\s{18}\:\s(?P<policy_info_id>\d+)$")
+        p14 = regex_engine.compile(r"^ID\s{18}\:\s(?P<policy_info_id>\d+)$")
 
         # Protocol            : [3] IPV4
-        p15 = re.compile(r"^Protocol\s{12}:\s(?P<policy_info_protocol>[\[\]\s\w]+)$")
+        p15 = regex_engine.compile(r"^Protocol\s{12}:\s(?P<policy_info_protocol>[\[\]\s\w]+)$")
 
         # Feature             : [40] AAL_FEATURE_GACL
-        p16 = re.compile(r"^Feature\s{13}\:\s(?P<policy_info_feature>[\[\]\_\s\w]+)$")
+        p16 = regex_engine.compile(r"^Feature\s{13}\:\s(?P<policy_info_feature>[\[\]\_\s\w]+)$")
 
         # Number of ACLs      : 1
-        p17 = re.compile(r"^Number\sof\sACLs\s{6}\:\s(?P<policy_number_of_acls>\d)$")
+        p17 = regex_engine.compile(r"^Number\sof\sACLs\s{6}\:\s(?P<policy_number_of_acls>\d)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -360,34 +360,34 @@ class ShowPlatformSoftwareFedactiveFnfEtAnalyticsFlows(
         ret_dict = {}
 
         # Total packets received     : 80
-        p1 = re.compile(r"Total +packets +received +: +(?P<total_pkts>\d+)")
+        p1 = regex_engine.compile(r"Total +packets +received +: +(?P<total_pkts>\d+)")
 
         # Excess packets received    : 60
-        p2 = re.compile(r"Excess +packets +received +: +(?P<excess_pkts>\d+)")
+        p2 = regex_engine.compile(r"Excess +packets +received +: +(?P<excess_pkts>\d+)")
 
         # Excess syn received        : 0
-        p3 = re.compile(r"Excess +syn +received +: +(?P<excess_syn>\d+)")
+        p3 = regex_engine.compile(r"Excess +syn +received +: +(?P<excess_syn>\d+)")
 
         # Total eta records added    : 4
-        p4 = re.compile(r"Total +eta +records +added +: +(?P<tot_eta>\d+)")
+        p4 = regex_engine.compile(r"Total +eta +records +added +: +(?P<tot_eta>\d+)")
 
         # Current eta records        : 0
-        p5 = re.compile(r"Current +eta +records +: +(?P<cur_eta>\d+)")
+        p5 = regex_engine.compile(r"Current +eta +records +: +(?P<cur_eta>\d+)")
 
         # Total eta splt exported    : 2
-        p6 = re.compile(r"Total +eta +splt +exported +: +(?P<eta_splt>\d+)")
+        p6 = regex_engine.compile(r"Total +eta +splt +exported +: +(?P<eta_splt>\d+)")
 
         # Total eta IDP exported     : 2
-        p7 = re.compile(r"Total +eta +IDP +exported +: +(?P<eta_idp>\d+)")
+        p7 = regex_engine.compile(r"Total +eta +IDP +exported +: +(?P<eta_idp>\d+)")
 
         # Total eta-fnf records      : 2
-        p8 = re.compile(r"Total +eta\-fnf +records +: +(?P<eta_fnf>\d+)")
+        p8 = regex_engine.compile(r"Total +eta\-fnf +records +: +(?P<eta_fnf>\d+)")
 
         # Total retransmitted pkts   : 0
-        p9 = re.compile(r"Total +retransmitted +pkts +: +(?P<retr_pkts>\d+)")
+        p9 = regex_engine.compile(r"Total +retransmitted +pkts +: +(?P<retr_pkts>\d+)")
 
         # Total out of order pkts    : 0
-        p10 = re.compile(r"Total +out +of +order +pkts +: +(?P<order_pkts>\d+)")
+        p10 = regex_engine.compile(r"Total +out +of +order +pkts +: +(?P<order_pkts>\d+)")
 
         for line in out.splitlines():
             line = line.strip()
@@ -590,14 +590,14 @@ class ShowPlatformSoftwareFedactiveAclCountersHardware(
         ret_dict = {}
 
         # Unknown Stat Counter    : 80
-        p1 = re.compile(r"Unknown\s+Stat\s+Counter\s+:\s+(?P<unknown_stats>\d+)")
+        p1 = regex_engine.compile(r"Unknown\s+Stat\s+Counter\s+:\s+(?P<unknown_stats>\d+)")
 
         # Ingress IPv4 Forward             (0x8d000003):       40365 frames
         # Ingress IPv6 GACL Drop           (0x0a000015):           0 frames
         # Ingress MAC Forward              (0x9100001f):       28270 frames
         # Egress IPv4 Forward              (0x77000030):       20480 frames
         # Egress IPv6 Forward to CPU       (0x5c00003e):           0 frames
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<counter_name>.+[^ ])\s+(\(.+\))?:\s+(?P<num_frames>\d+)\s+frames$"
         )
 
@@ -695,74 +695,74 @@ class ShowPlatformSoftwareFedActiveInjectPacketCaptureDetailed(
             out = output
 
         # Inject packet capturing: disabled. Buffer wrapping: disabled
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Inject +packet +capturing:+\s+(?P<inject_packet_capture>\w+)\.+\s+"
             r"Buffer +wrapping:\s+(?P<buffer_wrapping>\w+)$"
         )
 
         # Total captured so far: 4 packets. Capture capacity : 4096 packets
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Total +captured +so +far:\s(?P<total_captured>\d)+\s+packets+\.\s+"
             r"Capture +capacity +:\s+(?P<capture_capacity>\d+)+\s+packets$"
         )
 
         # Capture filter : "udp.port == 9995"
-        p3 = re.compile(r"^Capture +filter +: +(?P<capture_filter>.+)$")
+        p3 = regex_engine.compile(r"^Capture +filter +: +(?P<capture_filter>.+)$")
 
         # ------ Inject Packet Number: 1, Timestamp: 2021/09/15 07:40:40.603 ------
-        p4 = re.compile(r"^-+\s+Inject +Packet +Number: +(?P<inject_packet_no>\d+)")
+        p4 = regex_engine.compile(r"^-+\s+Inject +Packet +Number: +(?P<inject_packet_no>\d+)")
 
         # interface : pal:  [if-id: 0x00000000]
-        p5 = re.compile(r"^interface +: pal: \s+\[+if-id: +(?P<iifd>\S+)$")
+        p5 = regex_engine.compile(r"^interface +: pal: \s+\[+if-id: +(?P<iifd>\S+)$")
 
         # metadata  : cause: 2 [QFP destination lookup], sub-cause: 1, q-no: 0, linktype: MCP_LINK_TYPE_IP [1]
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^metadata +: +cause: +(?P<cause>.+)"
             r"\s+sub-cause: +(?P<sub_cause>\d+)\, +q-no: +(?P<q_no>\d+)\,"
             r"\s+linktype: +(?P<linktype>.+)"
         )
 
         # ether hdr : dest mac: 3c57.3104.6a00, src mac: 3c57.3104.6a00
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^ether +hdr +: +dest +mac: +(?P<dest_mac>\S+)\s+src +mac: +(?P<src_mac>\S+)"
         )
 
         # ether hdr : ethertype: 0x0800 (IPv4)
-        p8 = re.compile(r"^ether +hdr +: +ethertype: +(?P<ether_type>.+)$")
+        p8 = regex_engine.compile(r"^ether +hdr +: +ethertype: +(?P<ether_type>.+)$")
 
         # ipv4  hdr : dest ip: 111.0.0.2, src ip: 111.0.0.1
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^ipv4 +hdr +: +dest +ip: +(?P<dest_ip>\S+)\s+src +ip: +(?P<src_ip>\S+)"
         )
 
         # ipv4  hdr : packet len: 188, ttl: 255, protocol: 17 (UDP)
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^ipv4 +hdr +: +packet +len: +(?P<packet_len>\d+)\,\s+ttl: +(?P<ttl>\d+)"
             r"\,+\s+protocol: +(?P<protocol>.+)$"
         )
 
         # udp   hdr : dest port: 9995, src port: 53926
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^udp +hdr +: +dest +port: +(?P<dest_port>\d+)\,\s+src +port: +(?P<src_port>\d+)"
         )
 
         # Doppler Frame Descriptor :
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^Doppler +Frame +Descriptor +:(?P<doppler_frame_descriptor>)$"
         )
 
         # fdFormat                  = 0x3            systemTtl                 = 0x8
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^fdFormat\s+\= (?P<fdformat>\S+)\s+systemTtl\s+\= (?P<system_ttl>\S+$)"
         )
 
         # fdType                    = 0x1            spanSessionMap            = 0
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^fdType\s+\= (?P<fdtype>\S+)\s+spanSessionMap\s+\= (?P<span_session_map>\S+$)"
         )
 
         # qosLabel                  = 0x81           fpeFirstHeaderType        = 0
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^qosLabel\s+\= (?P<qoslabel>\S+)\s+fpeFirstHeaderType\s+\= (?P<fpe_first_header_type>\S+$)"
         )
 
@@ -970,7 +970,7 @@ class ShowPlatformSoftwareFedSwitchActiveIfmMappingsLpn(
             output = self.device.execute(cmd)
 
         # 19   1     18    TenGigabitEthernet1/0/19   0x0000001b  y
-        p = re.compile(
+        p = regex_engine.compile(
             r"^(?P<lpn>\d+)\s+(?P<asic>\d+)\s+(?P<port>\d+)\s+(?P<interfaces>\S+)\s+(?P<if_id>(0x([\da-fA-F]){8}))\s+(?P<active>\S+)$"
         )
 
@@ -1065,7 +1065,7 @@ class ShowPlatformSoftwareFedSwitchActiveIfmInterfacesLabel(ShowPlatformSoftware
         # LISP0                             0x0000054c          Ready
         # Loopback999999                    0x00000006          Ready
         # Null0                             0x00000400          Ready
-        p1 = re.compile(r'^(?P<interface_name>\S+)(?:\s*)(?P<if_id>0x\w+)(?:\s*)(?P<state>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<interface_name>\S+)(?:\s*)(?P<if_id>0x\w+)(?:\s*)(?P<state>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1129,38 +1129,38 @@ class ShowPlatformSoftwareFedSwitchActivePtpDomain(
             output = self.device.execute(self.cli_command)
 
         # Displaying data for domain number 0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Displaying\sdata\sfor\sdomain\snumber\s(?P<domain_number>\d+)$"
         )
 
         # Profile Type : DEFAULT
-        p2 = re.compile(r"^Profile\sType\s\:\s(?P<profile_type>[a-zA-Z]+)$")
+        p2 = regex_engine.compile(r"^Profile\sType\s\:\s(?P<profile_type>[a-zA-Z]+)$")
 
         # Profile State: enabled
-        p3 = re.compile(r"^Profile\sState\:\s(?P<profile_state>\S+)$")
+        p3 = regex_engine.compile(r"^Profile\sState\:\s(?P<profile_state>\S+)$")
 
         # Clock Mode : BOUNDARY CLOCK
-        p4 = re.compile(r"^Clock\sMode\s\:\s(?P<clock_mode>[A-Z\s]+)$")
+        p4 = regex_engine.compile(r"^Clock\sMode\s\:\s(?P<clock_mode>[A-Z\s]+)$")
 
         # Delay Mechanism: : END-TO-END
-        p5 = re.compile(r"^Delay\sMechanism\:\s\:\s(?P<delay_mechanism>[A-Z\-]+)$")
+        p5 = regex_engine.compile(r"^Delay\sMechanism\:\s\:\s(?P<delay_mechanism>[A-Z\-]+)$")
 
         # PTP clock : 1970-1-24 22:41:20
-        p6 = re.compile(r"^PTP\sclock\s\:\s(?P<ptp_clock>[\d\-\:\s]+)$")
+        p6 = regex_engine.compile(r"^PTP\sclock\s\:\s(?P<ptp_clock>[\d\-\:\s]+)$")
 
         # mean_path_delay 83 nanoseconds
-        p7 = re.compile(r"^mean_path_delay\s(?P<mean_path_delay_ns>\d+)\snanoseconds$")
+        p7 = regex_engine.compile(r"^mean_path_delay\s(?P<mean_path_delay_ns>\d+)\snanoseconds$")
 
         # Transport Method : 802.3
-        p8 = re.compile(r"^Transport\sMethod\s\:\s(?P<transport_method>[\w\.\-]+)$")
+        p8 = regex_engine.compile(r"^Transport\sMethod\s\:\s(?P<transport_method>[\w\.\-]+)$")
 
         # Message general ip dscp  : 47
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^Message\sgeneral\sip\sdscp\s+\:\s(?P<message_general_ip_dscp>\d+)$"
         )
 
         # Message event ip dscp    : 59
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^Message\sevent\sip\sdscp\s+\:\s(?P<message_event_ip_dscp>\d+)$"
         )
 
@@ -1314,108 +1314,108 @@ class ShowPlatformSoftwareFedSwitchActivePtpInterfaceInterface(
 
         # Displaying port data for if_id 2a
         # Displaying port data for if_id 29
-        p1 = re.compile(r"^Displaying\sport\sdata\sfor\sif_id\s(?P<if_id>\S+)$")
+        p1 = regex_engine.compile(r"^Displaying\sport\sdata\sfor\sif_id\s(?P<if_id>\S+)$")
 
         # Port Mac Address 34:ED:1B:7D:F2:A1
-        p2 = re.compile(r"^Port\sMac\sAddress\s(?P<mac_address>([\da-fA-F]:?).*)$")
+        p2 = regex_engine.compile(r"^Port\sMac\sAddress\s(?P<mac_address>([\da-fA-F]:?).*)$")
 
         # Port Clock Identity 34:ED:1B:FF:FE:7D:F2:80
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Port\sClock\sIdentity\s(?P<clock_identity>([\da-fA-F]:?).*)$"
         )
 
         # Port number 33
-        p4 = re.compile(r"^Port\snumber\s(?P<number>\d+)$")
+        p4 = regex_engine.compile(r"^Port\snumber\s(?P<number>\d+)$")
 
         # PTP Version 2
-        p5 = re.compile(r"^PTP\sVersion\s(?P<version>\d+)$")
+        p5 = regex_engine.compile(r"^PTP\sVersion\s(?P<version>\d+)$")
 
         # domain_value 0
-        p6 = re.compile(r"^domain_value\s(?P<domain_value>\d+)$")
+        p6 = regex_engine.compile(r"^domain_value\s(?P<domain_value>\d+)$")
 
         # Profile Type: : DEFAULT
-        p7 = re.compile(r"^Profile\sType\:\s\:\s(?P<profile_type>\S+)$")
+        p7 = regex_engine.compile(r"^Profile\sType\:\s\:\s(?P<profile_type>\S+)$")
 
         # Clock Mode : BOUNDARY CLOCK
-        p8 = re.compile(r"^Clock\sMode\s\:\s(?P<clock_mode>.*)$")
+        p8 = regex_engine.compile(r"^Clock\sMode\s\:\s(?P<clock_mode>.*)$")
 
         # Delay mechanism: End-to-End
-        p9 = re.compile(r"^Delay\smechanism\:\s(?P<delay_mechanism>\S+)$")
+        p9 = regex_engine.compile(r"^Delay\smechanism\:\s(?P<delay_mechanism>\S+)$")
 
         # port_enabled: TRUE
-        p10 = re.compile(r"^port_enabled\:\s(?P<port_enabled>\S+)$")
+        p10 = regex_engine.compile(r"^port_enabled\:\s(?P<port_enabled>\S+)$")
 
         # ptt_port_enabled: TRUE
-        p11 = re.compile(r"^ptt_port_enabled\:\s(?P<ptt_port_enabled>\S+)$")
+        p11 = regex_engine.compile(r"^ptt_port_enabled\:\s(?P<ptt_port_enabled>\S+)$")
 
         # Port state: : SLAVE
-        p12 = re.compile(r"^Port\sstate\:\s\:\s(?P<state>\S+)$")
+        p12 = regex_engine.compile(r"^Port\sstate\:\s\:\s(?P<state>\S+)$")
 
         # sync_seq_num 2189
-        p13 = re.compile(r"^sync_seq_num\s(?P<sync_seq_num>\d+)$")
+        p13 = regex_engine.compile(r"^sync_seq_num\s(?P<sync_seq_num>\d+)$")
 
         # delay_req_seq_num 0
-        p14 = re.compile(r"^delay_req_seq_num\s(?P<delay_req_seq_num>\d+)$")
+        p14 = regex_engine.compile(r"^delay_req_seq_num\s(?P<delay_req_seq_num>\d+)$")
 
         # log mean sync interval -3
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^log\smean\ssync\sinterval\s(?P<log_mean_sync_interval>[-?\d]+)$"
         )
 
         # log mean delay interval -5
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^log\smean\sdelay\sinterval\s(?P<log_mean_delay_interval>[-?\d]+)$"
         )
 
         # ptp vlan is valid : FALSE
-        p17 = re.compile(r"^ptp\svlan\sis\svalid\s\:\s(?P<ptp_vlan_is_valid>\S+)$")
+        p17 = regex_engine.compile(r"^ptp\svlan\sis\svalid\s\:\s(?P<ptp_vlan_is_valid>\S+)$")
 
         # ptp vlan id 0
-        p18 = re.compile(r"^ptp\svlan\sid\s(?P<ptp_vlan_id>\d+)$")
+        p18 = regex_engine.compile(r"^ptp\svlan\sid\s(?P<ptp_vlan_id>\d+)$")
 
         # port mode 2
-        p19 = re.compile(r"^port\smode\s(?P<mode>\d+)$")
+        p19 = regex_engine.compile(r"^port\smode\s(?P<mode>\d+)$")
 
         # tag native vlan : FALSE
-        p20 = re.compile(r"^tag\snative\svlan\s\:\s(?P<tag_native_vlan>\S+)$")
+        p20 = regex_engine.compile(r"^tag\snative\svlan\s\:\s(?P<tag_native_vlan>\S+)$")
 
         # num sync messages transmitted  0
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^num\ssync\smessages\stransmitted\s+(?P<num_sync_messages_transmitted>\d+)$"
         )
 
         # num followup messages transmitted  0
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r"^num\sfollowup\smessages\stransmitted\s+(?P<num_followup_messages_transmitted>\d+)$"
         )
 
         # num sync messages received  8758
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r"^num\ssync\smessages\sreceived\s+(?P<num_sync_messages_received>\d+)$"
         )
 
         # num followup messages received  8757
-        p24 = re.compile(
+        p24 = regex_engine.compile(
             r"^num\sfollowup\smessages\sreceived\s+(?P<num_followup_messages_received>\d+)$"
         )
 
         # num delay requests transmitted  8753
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r"^num\sdelay\srequests\stransmitted\s+(?P<num_delay_requests_transmitted>\d+)$"
         )
 
         # num delay responses received 8753
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r"^num\sdelay\sresponses\sreceived\s+(?P<num_delay_responses_received>\d+)$"
         )
 
         # num delay requests received  0
-        p27 = re.compile(
+        p27 = regex_engine.compile(
             r"^num\sdelay\srequests\sreceived\s+(?P<num_delay_requests_received>\d+)$"
         )
 
         # num delay responses transmitted  0
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r"^num\sdelay\sresponses\stransmitted\s+(?P<num_delay_responses_transmitted>\d+)$"
         )
 
@@ -1712,12 +1712,12 @@ class ShowPlatformSoftwareFedActiveAclUsage(
             output = self.device.execute(cmd)
 
         ######  ACE Software VMR max:196608 used:253
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\#\#\#\#\#\s+ACE\sSoftware\sVMR\smax\:(?P<vmr_max>\d+)\sused\:(?P<used>\d+)$"
         )
 
         #   RACL        IPV4     Ingress   PBR-DMVPN    92
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<feature_type>\S+)\s+(?P<acl_type>\S+)\s+(?P<direction>\S+)\s+(?P<name>\S+)\s+(?P<entries_used>\d+)$"
         )
 
@@ -1828,74 +1828,74 @@ class ShowPlatformSoftwareFedActiveInjectPacketCaptureDetailed(
             out = output
 
         # Inject packet capturing: disabled. Buffer wrapping: disabled
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Inject +packet +capturing:+\s+(?P<inject_packet_capture>\w+)\.+\s+"
             r"Buffer +wrapping:\s+(?P<buffer_wrapping>\w+)$"
         )
 
         # Total captured so far: 4 packets. Capture capacity : 4096 packets
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Total +captured +so +far:\s(?P<total_captured>\d)+\s+packets+\.\s+"
             r"Capture +capacity +:\s+(?P<capture_capacity>\d+)+\s+packets$"
         )
 
         # Capture filter : "udp.port == 9995"
-        p3 = re.compile(r"^Capture +filter +: +(?P<capture_filter>.+)$")
+        p3 = regex_engine.compile(r"^Capture +filter +: +(?P<capture_filter>.+)$")
 
         # ------ Inject Packet Number: 1, Timestamp: 2021/09/15 07:40:40.603 ------
-        p4 = re.compile(r"^-+\s+Inject +Packet +Number: +(?P<inject_packet_no>\d+)")
+        p4 = regex_engine.compile(r"^-+\s+Inject +Packet +Number: +(?P<inject_packet_no>\d+)")
 
         # interface : pal:  [if-id: 0x00000000]
-        p5 = re.compile(r"^interface +: pal: \s+\[+if-id: +(?P<iifd>\S+)$")
+        p5 = regex_engine.compile(r"^interface +: pal: \s+\[+if-id: +(?P<iifd>\S+)$")
 
         # metadata  : cause: 2 [QFP destination lookup], sub-cause: 1, q-no: 0, linktype: MCP_LINK_TYPE_IP [1]
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^metadata +: +cause: +(?P<cause>.+)"
             r"\s+sub-cause: +(?P<sub_cause>\d+)\, +q-no: +(?P<q_no>\d+)\,"
             r"\s+linktype: +(?P<linktype>.+)"
         )
 
         # ether hdr : dest mac: 3c57.3104.6a00, src mac: 3c57.3104.6a00
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^ether +hdr +: +dest +mac: +(?P<dest_mac>\S+)\s+src +mac: +(?P<src_mac>\S+)"
         )
 
         # ether hdr : ethertype: 0x0800 (IPv4)
-        p8 = re.compile(r"^ether +hdr +: +ethertype: +(?P<ether_type>.+)$")
+        p8 = regex_engine.compile(r"^ether +hdr +: +ethertype: +(?P<ether_type>.+)$")
 
         # ipv4  hdr : dest ip: 111.0.0.2, src ip: 111.0.0.1
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^ipv4 +hdr +: +dest +ip: +(?P<dest_ip>\S+)\s+src +ip: +(?P<src_ip>\S+)"
         )
 
         # ipv4  hdr : packet len: 188, ttl: 255, protocol: 17 (UDP)
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^ipv4 +hdr +: +packet +len: +(?P<packet_len>\d+)\,\s+ttl: +(?P<ttl>\d+)"
             r"\,+\s+protocol: +(?P<protocol>.+)$"
         )
 
         # udp   hdr : dest port: 9995, src port: 53926
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^udp +hdr +: +dest +port: +(?P<dest_port>\d+)\,\s+src +port: +(?P<src_port>\d+)"
         )
 
         # Doppler Frame Descriptor :
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^Doppler +Frame +Descriptor +:(?P<doppler_frame_descriptor>)$"
         )
 
         # fdFormat                  = 0x3            systemTtl                 = 0x8
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^fdFormat\s+\= (?P<fdformat>\S+)\s+systemTtl\s+\= (?P<system_ttl>\S+$)"
         )
 
         # fdType                    = 0x1            spanSessionMap            = 0
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^fdType\s+\= (?P<fdtype>\S+)\s+spanSessionMap\s+\= (?P<span_session_map>\S+$)"
         )
 
         # qosLabel                  = 0x81           fpeFirstHeaderType        = 0
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^qosLabel\s+\= (?P<qoslabel>\S+)\s+fpeFirstHeaderType\s+\= (?P<fpe_first_header_type>\S+$)"
         )
 
@@ -2103,7 +2103,7 @@ class ShowPlatformSoftwareFedSwitchActiveIfmMappingsLpn(
             output = self.device.execute(cmd)
 
         # 19   1     18    TenGigabitEthernet1/0/19   0x0000001b  y
-        p = re.compile(
+        p = regex_engine.compile(
             r"^(?P<lpn>\d+)\s+(?P<asic>\d+)\s+(?P<port>\d+)\s+(?P<interfaces>\S+)\s+(?P<if_id>(0x([\da-fA-F]){8}))\s+(?P<active>\S+)$"
         )
 
@@ -2194,55 +2194,55 @@ class ShowPlatformSoftwareFedSwitchActivePtpDomain(
             output = self.device.execute(cmd)
 
         # Displaying data for domain number 0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Displaying\sdata\sfor\sdomain\snumber\s(?P<domain_number>\d+)$"
         )
 
         # Profile Type : DEFAULT
-        p2 = re.compile(r"^Profile\sType\s\:\s(?P<profile_type>\w+)$")
+        p2 = regex_engine.compile(r"^Profile\sType\s\:\s(?P<profile_type>\w+)$")
 
         # Profile State: enabled
-        p3 = re.compile(r"^Profile\sState\:\s(?P<profile_state>\S+)$")
+        p3 = regex_engine.compile(r"^Profile\sState\:\s(?P<profile_state>\S+)$")
 
         # Clock Mode : BOUNDARY CLOCK
-        p4 = re.compile(r"^Clock\sMode\s\:\s(?P<clock_mode>[A-Z\s]+)$")
+        p4 = regex_engine.compile(r"^Clock\sMode\s\:\s(?P<clock_mode>[A-Z\s]+)$")
 
         # Delay Mechanism: : END-TO-END
-        p5 = re.compile(r"^Delay\sMechanism\:\s\:\s(?P<delay_mechanism>[A-Z\-]+)$")
+        p5 = regex_engine.compile(r"^Delay\sMechanism\:\s\:\s(?P<delay_mechanism>[A-Z\-]+)$")
 
         # PTP clock : 1970-1-24 22:41:20
-        p6 = re.compile(r"^PTP\sclock\s\:\s(?P<ptp_clock>[\d\-\:\s]+)$")
+        p6 = regex_engine.compile(r"^PTP\sclock\s\:\s(?P<ptp_clock>[\d\-\:\s]+)$")
 
         # mean_path_delay 83 nanoseconds
-        p7 = re.compile(r"^mean_path_delay\s(?P<mean_path_delay_ns>\d+)\snanoseconds$")
+        p7 = regex_engine.compile(r"^mean_path_delay\s(?P<mean_path_delay_ns>\d+)\snanoseconds$")
 
         # Transport Method : 802.3
-        p8 = re.compile(r"^Transport\sMethod\s\:\s(?P<transport_method>[\w\.\-]+)$")
+        p8 = regex_engine.compile(r"^Transport\sMethod\s\:\s(?P<transport_method>[\w\.\-]+)$")
 
         # Message general ip dscp  : 47
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^Message\sgeneral\sip\sdscp\s+\:\s(?P<message_general_ip_dscp>\d+)$"
         )
 
         # Message event ip dscp    : 59
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^Message\sevent\sip\sdscp\s+\:\s(?P<message_event_ip_dscp>\d+)$"
         )
 
         # clocksource 160
-        p11 = re.compile(r"^clocksource\s+(?P<clocksource>\d+)$")
+        p11 = regex_engine.compile(r"^clocksource\s+(?P<clocksource>\d+)$")
 
         # Grandmaster: FALSE
-        p12 = re.compile(r"^Grandmaster:\s+(?P<grandmaster>\w+)$")
+        p12 = regex_engine.compile(r"^Grandmaster:\s+(?P<grandmaster>\w+)$")
 
         # gm_capable: TRUE
-        p13 = re.compile(r"^gm_capable:\s+(?P<gm_capable>\w+)$")
+        p13 = regex_engine.compile(r"^gm_capable:\s+(?P<gm_capable>\w+)$")
 
         # gm_present: TRUE
-        p14 = re.compile(r"^gm_present:\s+(?P<gm_present>\w+)$")
+        p14 = regex_engine.compile(r"^gm_present:\s+(?P<gm_present>\w+)$")
 
         # neighbor propagation delay threshold: 800 ns
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^neighbor propagation delay threshold:\s+(?P<propagation_delay>[\w\s]+)$"
         )
 
@@ -2426,110 +2426,110 @@ class ShowPlatformSoftwareFedSwitchActivePtpInterfaceInterface(
 
         # Displaying port data for if_id 2a
         # Displaying port data for if_id 29
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Displaying\sport\sdata\sfor\sif_id\s(?P<if_id>[0-9a-fA-F]+)$"
         )
 
         # Port Mac Address 34:ED:1B:7D:F2:A1
-        p2 = re.compile(r"^Port\sMac\sAddress\s(?P<mac_address>([\da-fA-F]:?).*)$")
+        p2 = regex_engine.compile(r"^Port\sMac\sAddress\s(?P<mac_address>([\da-fA-F]:?).*)$")
 
         # Port Clock Identity 34:ED:1B:FF:FE:7D:F2:80
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Port\sClock\sIdentity\s(?P<clock_identity>([\da-fA-F]:?).*)$"
         )
 
         # Port number 33
-        p4 = re.compile(r"^Port\snumber\s(?P<number>\d+)$")
+        p4 = regex_engine.compile(r"^Port\snumber\s(?P<number>\d+)$")
 
         # PTP Version 2
-        p5 = re.compile(r"^PTP\sVersion\s(?P<version>\d+)$")
+        p5 = regex_engine.compile(r"^PTP\sVersion\s(?P<version>\d+)$")
 
         # domain_value 0
-        p6 = re.compile(r"^domain_value\s(?P<domain_value>\d+)$")
+        p6 = regex_engine.compile(r"^domain_value\s(?P<domain_value>\d+)$")
 
         # Profile Type: : DEFAULT
-        p7 = re.compile(r"^Profile\sType\:\s\:\s(?P<profile_type>\S+)$")
+        p7 = regex_engine.compile(r"^Profile\sType\:\s\:\s(?P<profile_type>\S+)$")
 
         # Clock Mode : BOUNDARY CLOCK
-        p8 = re.compile(r"^Clock\sMode\s\:\s(?P<clock_mode>.*)$")
+        p8 = regex_engine.compile(r"^Clock\sMode\s\:\s(?P<clock_mode>.*)$")
 
         # Delay mechanism: End-to-End
-        p9 = re.compile(r"^Delay\smechanism\:\s(?P<delay_mechanism>\S+)$")
+        p9 = regex_engine.compile(r"^Delay\smechanism\:\s(?P<delay_mechanism>\S+)$")
 
         # port_enabled: TRUE
-        p10 = re.compile(r"^port_enabled\:\s(?P<port_enabled>\S+)$")
+        p10 = regex_engine.compile(r"^port_enabled\:\s(?P<port_enabled>\S+)$")
 
         # ptt_port_enabled: TRUE
-        p11 = re.compile(r"^ptt_port_enabled\:\s(?P<ptt_port_enabled>\S+)$")
+        p11 = regex_engine.compile(r"^ptt_port_enabled\:\s(?P<ptt_port_enabled>\S+)$")
 
         # Port state: : SLAVE
-        p12 = re.compile(r"^Port\sstate\:\s\:\s(?P<state>\S+)$")
+        p12 = regex_engine.compile(r"^Port\sstate\:\s\:\s(?P<state>\S+)$")
 
         # sync_seq_num 2189
-        p13 = re.compile(r"^sync_seq_num\s(?P<sync_seq_num>\d+)$")
+        p13 = regex_engine.compile(r"^sync_seq_num\s(?P<sync_seq_num>\d+)$")
 
         # delay_req_seq_num 0
-        p14 = re.compile(r"^delay_req_seq_num\s(?P<delay_req_seq_num>\d+)$")
+        p14 = regex_engine.compile(r"^delay_req_seq_num\s(?P<delay_req_seq_num>\d+)$")
 
         # log mean sync interval -3
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^log\smean\ssync\sinterval\s(?P<log_mean_sync_interval>[-?\d]+)$"
         )
 
         # log mean delay interval -5
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^log\smean\sdelay\sinterval\s(?P<log_mean_delay_interval>[-?\d]+)$"
         )
 
         # ptp vlan is valid : FALSE
-        p17 = re.compile(r"^ptp\svlan\sis\svalid\s\:\s(?P<ptp_vlan_is_valid>\S+)$")
+        p17 = regex_engine.compile(r"^ptp\svlan\sis\svalid\s\:\s(?P<ptp_vlan_is_valid>\S+)$")
 
         # ptp vlan id 0
-        p18 = re.compile(r"^ptp\svlan\sid\s(?P<ptp_vlan_id>\d+)$")
+        p18 = regex_engine.compile(r"^ptp\svlan\sid\s(?P<ptp_vlan_id>\d+)$")
 
         # port mode 2
-        p19 = re.compile(r"^port\smode\s(?P<mode>\d+)$")
+        p19 = regex_engine.compile(r"^port\smode\s(?P<mode>\d+)$")
 
         # tag native vlan : FALSE
-        p20 = re.compile(r"^tag\snative\svlan\s\:\s(?P<tag_native_vlan>\S+)$")
+        p20 = regex_engine.compile(r"^tag\snative\svlan\s\:\s(?P<tag_native_vlan>\S+)$")
 
         # num sync messages transmitted  0
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^num\ssync\smessages\stransmitted\s+(?P<num_sync_messages_transmitted>\d+)$"
         )
 
         # num followup messages transmitted  0
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r"^num\sfollowup\smessages\stransmitted\s+(?P<num_followup_messages_transmitted>\d+)$"
         )
 
         # num sync messages received  8758
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r"^num\ssync\smessages\sreceived\s+(?P<num_sync_messages_received>\d+)$"
         )
 
         # num followup messages received  8757
-        p24 = re.compile(
+        p24 = regex_engine.compile(
             r"^num\sfollowup\smessages\sreceived\s+(?P<num_followup_messages_received>\d+)$"
         )
 
         # num delay requests transmitted  8753
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r"^num\sdelay\srequests\stransmitted\s+(?P<num_delay_requests_transmitted>\d+)$"
         )
 
         # num delay responses received 8753
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r"^num\sdelay\sresponses\sreceived\s+(?P<num_delay_responses_received>\d+)$"
         )
 
         # num delay requests received  0
-        p27 = re.compile(
+        p27 = regex_engine.compile(
             r"^num\sdelay\srequests\sreceived\s+(?P<num_delay_requests_received>\d+)$"
         )
 
         # num delay responses transmitted  0
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r"^num\sdelay\sresponses\stransmitted\s+(?P<num_delay_responses_transmitted>\d+)$"
         )
 
@@ -2826,12 +2826,12 @@ class ShowPlatformSoftwareFedActiveAclUsage(
             output = self.device.execute(cmd)
 
         ######  ACE Software VMR max:196608 used:253
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\#\#\#\#\#\s+ACE\sSoftware\sVMR\smax\:(?P<vmr_max>\d+)\sused\:(?P<used>\d+)$"
         )
 
         #   RACL        IPV4     Ingress   PBR-DMVPN    92
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<feature_type>\S+)\s+(?P<acl_type>\S+)\s+(?P<direction>\S+)\s+(?P<name>\S+)\s+(?P<entries_used>\d+)$"
         )
 
@@ -2906,7 +2906,7 @@ class ShowPlatformSoftwareFedSwitchPortSummary(
         ret_dict = {}
 
         # 1266           HundredGigE2/0/27/1             true
-        p1 = re.compile(r"^(?P<if_id>\d+)\s+(?P<if_name>\S+)\s+(?P<port_enable>\w+)$")
+        p1 = regex_engine.compile(r"^(?P<if_id>\d+)\s+(?P<if_name>\S+)\s+(?P<port_enable>\w+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2968,18 +2968,18 @@ class ShowPlatformSoftwareFedSwitchSecurityfedDhcpsnoopVlanVlanid(
         ret_dict = {}
 
         # DHCP Snooping disabled on vlan: 100
-        p = re.compile(r"DHCP\s+Snooping\s+disabled\s+on\s+vlan\s*:\s*(?P<vlan>\d+)")
+        p = regex_engine.compile(r"DHCP\s+Snooping\s+disabled\s+on\s+vlan\s*:\s*(?P<vlan>\d+)")
 
         # Valid Snooping DI handle:none
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"Valid\s+Snooping\s+DI\s+handle\s*:\s*(?P<snooping_handle>\S+)"
         )
 
         # No trust ports for this vlan
-        p2 = re.compile(r"No\s+trust\s+ports\s+for\s+this\s+vlan")
+        p2 = regex_engine.compile(r"No\s+trust\s+ports\s+for\s+this\s+vlan")
 
         # GigabitEthernet1/0/3             trust
-        p3 = re.compile(r"(?P<port>.*\d+\/\d+\/\d+)\s+(?P<mode>\S+)")
+        p3 = regex_engine.compile(r"(?P<port>.*\d+\/\d+\/\d+)\s+(?P<mode>\S+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3070,7 +3070,7 @@ class ShowPlatformSoftwareFedActiveSecurityFed(
         #  -------------------------------------------------------------------------------------------
         #  557985737     0         153.11.0.6      0x2a000014      0x7482b07260e8    0x7482b0726368
         #  -------------------------------------------------------------------------------------------
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<service_id>\d+)\s+(?P<vrf_id>\d+)\s+(?P<firewall_ip>[\d.]+)\s+(?P<aal_hd1>0x[\da-f]+)\s+(?P<redirect_hd1>0x[\da-f]+)\s+(?P<hmt_hd1>0x[\da-f]+)$"
         )
 
@@ -3157,15 +3157,15 @@ class ShowPlatformSoftwareFedActiveSecurityFedAclAll(
         # Number of ACL's: 1
 
         #  1405908841   1         1252352985    0x370000cb                   9862                   9862
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<acl_id>\d+)\s+(?P<seq_number>\d+)\s+(?P<firewall_id>[\d.]+)\s+(?P<stats_handle>0x[\da-f]+)\s+(?P<frame_count>\d+)\s+(?P<hardware_count>\d+)$"
         )
 
         # Number of ACE's: 1
-        p2 = re.compile(r"^Number of ACE's\s*:\s*(?P<number_of_aces>\d+)$")
+        p2 = regex_engine.compile(r"^Number of ACE's\s*:\s*(?P<number_of_aces>\d+)$")
 
         # Number of ACL's: 1
-        p3 = re.compile(r"^Number of ACL's\s*:\s*(?P<number_of_acls>\d+)$")
+        p3 = regex_engine.compile(r"^Number of ACL's\s*:\s*(?P<number_of_acls>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3264,36 +3264,36 @@ class ShowPlatformSoftwareFedActiveSecurityFedServiceDetail(
         # Adj OCE Sub-Type         : NONE
 
         # Service ID               : 3861840337
-        p1 = re.compile(r"^Service ID\s+:\s+(?P<service_id>\d+)$")
+        p1 = regex_engine.compile(r"^Service ID\s+:\s+(?P<service_id>\d+)$")
 
         # VRF ID                   : 0
-        p2 = re.compile(r"^VRF ID\s*:\s*(?P<vrf_id>\d+)$")
+        p2 = regex_engine.compile(r"^VRF ID\s*:\s*(?P<vrf_id>\d+)$")
 
         # IP                       : 172.18.0.2/32
-        p3 = re.compile(r"^IP\s*:\s*(?P<firewall_ip>[\d/.]+)$")
+        p3 = regex_engine.compile(r"^IP\s*:\s*(?P<firewall_ip>[\d/.]+)$")
 
         # Redirect Hdl             : 0x7fe0bb341f38
-        p4 = re.compile(r"^Redirect Hdl\s*:\s*(?P<redirect_hd1>\w+)$")
+        p4 = regex_engine.compile(r"^Redirect Hdl\s*:\s*(?P<redirect_hd1>\w+)$")
 
         # HTM Hdl                  : 0x7fe0bb2f27d8
-        p5 = re.compile(r"^HTM Hdl\s*:\s*(?P<hmt_hd1>\w+)$")
+        p5 = regex_engine.compile(r"^HTM Hdl\s*:\s*(?P<hmt_hd1>\w+)$")
 
         # Route Prefix             : 172.18.0.0/30
-        p6 = re.compile(r"^Route Prefix\s*:\s*(?P<router_prefix>[\d/.]+)$")
+        p6 = regex_engine.compile(r"^Route Prefix\s*:\s*(?P<router_prefix>[\d/.]+)$")
 
         # Next Hop                 : 60.60.60.62
-        p7 = re.compile(r"^Next Hop\s*:\s*(?P<next_hop>[\d/.]+)$")
+        p7 = regex_engine.compile(r"^Next Hop\s*:\s*(?P<next_hop>[\d/.]+)$")
 
         # Adj Last Modified        : 2021-10-17,06:43:16
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^Adj Last Modified\s*:\s*(?P<adj_last_modified>[\w-]+,[\w:]+)$"
         )
 
         # Adj OCE Type             : ADJ
-        p9 = re.compile(r"^Adj OCE Type\s*:\s*(?P<adj_oce_type>\w+)$")
+        p9 = regex_engine.compile(r"^Adj OCE Type\s*:\s*(?P<adj_oce_type>\w+)$")
 
         # Adj OCE Sub-Type         : NONE
-        p10 = re.compile(r"^Adj OCE Sub-Type\s*:\s*(?P<adj_oce_sub_type>\w+)$")
+        p10 = regex_engine.compile(r"^Adj OCE Sub-Type\s*:\s*(?P<adj_oce_sub_type>\w+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -3407,46 +3407,46 @@ class ShowPlatformSoftwareFedIpsecCounter(ShowPlatformSoftwareFedIpsecCounterSch
         inbound_flag = True
 
         # Flow Stats for if-id 0x62
-        p1 = re.compile(r"^[Ff]low +[Ss]tats +for +if-id +(?P<if_id>\w+)$")
+        p1 = regex_engine.compile(r"^[Ff]low +[Ss]tats +for +if-id +(?P<if_id>\w+)$")
 
         # Inbound Flow Info for flow id: 44
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^[Ii]nbound +[Ff]low +[Ii]nfo +for +flow +id+\: +(?P<flow_id>\d+)$"
         )
 
         # SA Index: 3
-        p3 = re.compile(r"^SA +Index+\: +(?P<sa_index>\d+)$")
+        p3 = regex_engine.compile(r"^SA +Index+\: +(?P<sa_index>\d+)$")
 
         # Asic Instance 0: SA Stats
-        p4 = re.compile(r"^[Aa]sic +Instance +0+\: +(?P<asic_instance>[\w\s]+)$")
+        p4 = regex_engine.compile(r"^[Aa]sic +Instance +0+\: +(?P<asic_instance>[\w\s]+)$")
 
         # Packet Format Check Error: 0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^[Pp]acket +[Ff]ormat +[Cc]heck +[Ee]rror+\: +(?P<packet_format_check_error>\d+)$"
         )
 
         # Invalid SA: 0
-        p6 = re.compile(r"^[Ii]nvalid +SA+\: +(?P<invalid_sa>\d+)$")
+        p6 = regex_engine.compile(r"^[Ii]nvalid +SA+\: +(?P<invalid_sa>\d+)$")
 
         # Auth Fail: 0
-        p7 = re.compile(r"^[Aa]uth +[Ff]ail+\: +(?P<auth_fail>\d+)$")
+        p7 = regex_engine.compile(r"^[Aa]uth +[Ff]ail+\: +(?P<auth_fail>\d+)$")
 
         # Sequence Number Overflows: 0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^[Ss]equence +[Nn]umber +[Oo]verflows+\: +(?P<sequence_number_overflows>\d+)$"
         )
 
         # Anti-Replay Fail: 0
-        p9 = re.compile(r"^[Aa]nti\-+[Rr]eplay +[Ff]ail+\: +(?P<anti_replay_fail>\d+)$")
+        p9 = regex_engine.compile(r"^[Aa]nti\-+[Rr]eplay +[Ff]ail+\: +(?P<anti_replay_fail>\d+)$")
 
         # Packet Count: 2056
-        p10 = re.compile(r"^[Pp]acket +[Cc]ount+\: +(?P<packet_count>\d+)$")
+        p10 = regex_engine.compile(r"^[Pp]acket +[Cc]ount+\: +(?P<packet_count>\d+)$")
 
         # Byte Count: 177076
-        p11 = re.compile(r"^[Bb]yte +[Cc]ount+\: +(?P<byte_count>\d+)$")
+        p11 = regex_engine.compile(r"^[Bb]yte +[Cc]ount+\: +(?P<byte_count>\d+)$")
 
         # Outbound Flow Info for flow id: 43
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^[Oo]utbound +[Ff]low +[Ii]nfo +for +flow +id+\: +(?P<flow_id>\d+)$"
         )
 
@@ -3660,105 +3660,105 @@ class ShowPlatformSoftwareFedIgmpSnooping(ShowPlatformSoftwareFedIgmpSnoopingSch
         # IGMPSN Enabled : On
 
         # Vlan 20
-        p0 = re.compile(r"^Vlan\:?\s+(?P<vlan>\d+)$")
+        p0 = regex_engine.compile(r"^Vlan\:?\s+(?P<vlan>\d+)$")
 
         # (ipv4, vlan: 3000)
-        p0_1 = re.compile(r'\(+(?P<protocol>\S+)+\,+\s+vlan\: +(?P<vlan>\d+)+\)')
+        p0_1 = regex_engine.compile(r'\(+(?P<protocol>\S+)+\,+\s+vlan\: +(?P<vlan>\d+)+\)')
 
         # IGMPSN Enabled : On
-        p1 = re.compile(r"^IGMPSN\s+Enabled\s+:\s+(?P<igmp_en>[\s\w\s]+)$")
+        p1 = regex_engine.compile(r"^IGMPSN\s+Enabled\s+:\s+(?P<igmp_en>[\s\w\s]+)$")
 
         # Snoop State     : ON
-        p1_1 = re.compile(r"^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$")
+        p1_1 = regex_engine.compile(r"^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$")
 
         # Snoop State     : ON
-        p1_1 = re.compile(r"^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$")
+        p1_1 = regex_engine.compile(r"^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$")
 
         # PIMSN Enabled : Off
-        p2 = re.compile(r"^PIMSN\s+Enabled\s+:\s+(?P<pimsn_en>[\s\w\s]+)$")
+        p2 = regex_engine.compile(r"^PIMSN\s+Enabled\s+:\s+(?P<pimsn_en>[\s\w\s]+)$")
 
         # Flood Mode : Off
-        p3 = re.compile(r"^Flood\s+Mode\s+:\s+(?P<flood_md>[\s\w\s]+)$")
+        p3 = regex_engine.compile(r"^Flood\s+Mode\s+:\s+(?P<flood_md>[\s\w\s]+)$")
 
         # Oper State : Up
-        p4 = re.compile(r"^Oper\s+State\s+:\s+(?P<op_state>[\s\w\s]+)$")
+        p4 = regex_engine.compile(r"^Oper\s+State\s+:\s+(?P<op_state>[\s\w\s]+)$")
 
         # STP TCN Flood : Off
         # STP TCN State : Off
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^STP\s+TCN\s+(Flood|State)\s+:\s+(?P<stp_tcn_flood>[\s\w\s]+)$"
         )
         # STP TCN State : Off
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^STP\s+TCN\s+(Flood|State)\s+:\s+(?P<stp_tcn_flood>[\s\w\s]+)$"
         )
 
         # Routing Enabled : On
-        p6 = re.compile(r"^Routing\s+Enabled\s+:\s+(?P<route_en>[\s\w\s]+)$")
+        p6 = regex_engine.compile(r"^Routing\s+Enabled\s+:\s+(?P<route_en>[\s\w\s]+)$")
 
         # PIM Enabled : On
-        p7 = re.compile(r"^PIM\s+Enabled\s+:\s+(?P<pim_en>[\s\w\s]+)$")
+        p7 = regex_engine.compile(r"^PIM\s+Enabled\s+:\s+(?P<pim_en>[\s\w\s]+)$")
 
         # Pim state               : ON
-        p7_1 = re.compile(r'^Pim\s+state\s+:\s+(?P<pim_en>[\s\w\s]+)$')
+        p7_1 = regex_engine.compile(r'^Pim\s+state\s+:\s+(?P<pim_en>[\s\w\s]+)$')
 
         # PVLAN : No
-        p8 = re.compile(r"^PVLAN\s+:\s+(?P<pvlan>[\s\w\s]+)$")
+        p8 = regex_engine.compile(r"^PVLAN\s+:\s+(?P<pvlan>[\s\w\s]+)$")
 
         # In Retry : 0x0
-        p9 = re.compile(r"^In\s+Retry\s+:\s+(?P<in_retry>[\s\w\s]+)$")
+        p9 = regex_engine.compile(r"^In\s+Retry\s+:\s+(?P<in_retry>[\s\w\s]+)$")
 
         # CCK Epoch : 0x17
-        p10 = re.compile(r"^CCK\s+Epoch\s+:\s+(?P<cck_ep>[\s\w\s]+)$")
+        p10 = regex_engine.compile(r"^CCK\s+Epoch\s+:\s+(?P<cck_ep>[\s\w\s]+)$")
 
         # IOSD Flood Mode : Off
-        p11 = re.compile(r"^IOSD\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$")
+        p11 = regex_engine.compile(r"^IOSD\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$")
 
         # IOS Flood Mode          : OFF
-        p11_1 = re.compile(r'^IOS\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$')
+        p11_1 = regex_engine.compile(r'^IOS\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$')
 
         # EVPN Proxy Enabled : On
-        p12 = re.compile(r"^EVPN\s+Proxy\s+Enabled\s+:\s+(?P<evpn_en>[\s\w\s]+)$")
+        p12 = regex_engine.compile(r"^EVPN\s+Proxy\s+Enabled\s+:\s+(?P<evpn_en>[\s\w\s]+)$")
 
         # Evpn Proxy              : OFF
-        p12_1 = re.compile(r'^Evpn\s+Proxy\s+:\s+(?P<evpn_en>[\s\w\s]+)$')
+        p12_1 = regex_engine.compile(r'^Evpn\s+Proxy\s+:\s+(?P<evpn_en>[\s\w\s]+)$')
 
         # L3mcast Adj :
-        p13 = re.compile(r"L3mcast\s+Adj\s+:(?P<l3m_adj>.*)")
+        p13 = regex_engine.compile(r"L3mcast\s+Adj\s+:(?P<l3m_adj>.*)")
 
         # Mrouter PortQ :
-        p14 = re.compile(r"^Mrouter\s+[P|p]ort[Q|s]\s+:\s*")
+        p14 = regex_engine.compile(r"^Mrouter\s+[P|p]ort[Q|s]\s+:\s*")
         # nve1.VNI60020(0x200000071)
-        p14_1 = re.compile(r"([A-Za-z]*\d[-().]*){10,}")
+        p14_1 = regex_engine.compile(r"([A-Za-z]*\d[-().]*){10,}")
 
         # port:Port-channel10 (ec_member:HundredGigE1/0/5) (group_oif:0) (mrouter_flag:1)
         # port:Port-channel10 (ec_member:HundredGigE1/0/5) (group_oif:0) (mrouter_flag:1)
         # port:Port-channel100 (ec_member:HundredGigE2/5/0/2)
         # port:Port-channel0 (ec_member:HundredGigE1/0/5) (group_oif:0)
         # port:Port-channel77
-        p14_2 = re.compile(r"^port:(?P<port>[\w\-\.]+)(\s+(?P<left>.*))?$")
+        p14_2 = regex_engine.compile(r"^port:(?P<port>[\w\-\.]+)(\s+(?P<left>.*))?$")
         # port:Port-channel0 (ec_member:HundredGigE1/0/5) (group_oif:0)
         # port:Port-channel77
-        p14_2 = re.compile(r"^port:(?P<port>[\w\-\.]+)(\s+(?P<left>.*))?$")
+        p14_2 = regex_engine.compile(r"^port:(?P<port>[\w\-\.]+)(\s+(?P<left>.*))?$")
 
         # Flood PortQ :
-        p15 = re.compile(r"^Flood [P|p]ort[Q|s]\s+:\s*")
+        p15 = regex_engine.compile(r"^Flood [P|p]ort[Q|s]\s+:\s*")
         # TenGigabitEthernet7/0/13
         # FiveGigabitEthernet1/0/2
         # GigabitEthernet2/0/31
-        p15_1 = re.compile(r"^[A-Za-z-]+[\d\/\.]+$")
+        p15_1 = regex_engine.compile(r"^[A-Za-z-]+[\d\/\.]+$")
 
         # REP RI handle : 0x0
-        p16 = re.compile(r"^REP\s+RI\s+handle\s+:\s+(?P<rep_han>[\s\w\s]+)$")
+        p16 = regex_engine.compile(r"^REP\s+RI\s+handle\s+:\s+(?P<rep_han>[\s\w\s]+)$")
 
         # Secondary Vlan          : NO
-        p17 = re.compile(r'^Secondary\s+Vlan\s+:\s+(?P<secondary_vlan>[\s\w\s]+)$')
+        p17 = regex_engine.compile(r'^Secondary\s+Vlan\s+:\s+(?P<secondary_vlan>[\s\w\s]+)$')
 
         # Vlan Urid               : 0x5000000000000008
-        p18 = re.compile(r'^Vlan\s+Urid\s+:\s+(?P<vlan_urid>[\s\w\s]+)$')
+        p18 = regex_engine.compile(r'^Vlan\s+Urid\s+:\s+(?P<vlan_urid>[\s\w\s]+)$')
 
         # Dependant users count   : 0
-        p19 = re.compile(r'^Dependant\s+users\s+count\s+:\s+(?P<d_users_count>[\s\w\s]+)$')
+        p19 = regex_engine.compile(r'^Dependant\s+users\s+count\s+:\s+(?P<d_users_count>[\s\w\s]+)$')
 
         mroute_port_flag = 0
         mroute_list = []
@@ -3997,32 +3997,32 @@ class ShowPlatformSoftwareFedIgmpSnoopingGroups(
         # nve1.VNI60020(0x200000062)
 
         # Vlan:20 Group:229.1.1.1
-        p0 = re.compile(r"(^Vlan+:+(?P<vlan>\d+))+\s+(Group:+(?P<group>\w.*))")
+        p0 = regex_engine.compile(r"(^Vlan+:+(?P<vlan>\d+))+\s+(Group:+(?P<group>\w.*))")
 
         # Member ports :
-        p1 = re.compile(r"(^Member +ports   :(?P<mem_port>.*))")
+        p1 = regex_engine.compile(r"(^Member +ports   :(?P<mem_port>.*))")
         # TenGigabitEthernet7/0/13
-        p1_1 = re.compile(r"([A-Za-z]*\d[-().]*){10,}")
+        p1_1 = regex_engine.compile(r"([A-Za-z]*\d[-().]*){10,}")
         # nve1.VNI60020(0x200000062)
-        p1_2 = re.compile(r"^[A-Za-z]+[\d\/]+$")
+        p1_2 = regex_engine.compile(r"^[A-Za-z]+[\d\/]+$")
 
         # CCK_epoch : 1
-        p2 = re.compile(r"(^CCK_epoch+ +:+ +(?P<cck_ep>\d.*)$)")
+        p2 = regex_engine.compile(r"(^CCK_epoch+ +:+ +(?P<cck_ep>\d.*)$)")
 
         # Failure Flags : 0
-        p3 = re.compile(r"(^Failure+ +Flags+ +:+ +(?P<fail_flag>\d.*)$)")
+        p3 = regex_engine.compile(r"(^Failure+ +Flags+ +:+ +(?P<fail_flag>\d.*)$)")
 
         # DI handle : 0x7f95a2320408
-        p4 = re.compile(r"(^DI+ +handle+ +:+ +(?P<di_hand>\w.*)$)")
+        p4 = regex_engine.compile(r"(^DI+ +handle+ +:+ +(?P<di_hand>\w.*)$)")
 
         # REP RI handle : 0x7f95a2320718
-        p5 = re.compile(r"(^REP+ +RI+ +handle+ +:+ +(?P<rep_ri>\w.*)$)")
+        p5 = regex_engine.compile(r"(^REP+ +RI+ +handle+ +:+ +(?P<rep_ri>\w.*)$)")
 
         # SI handle : 0x7f95a2321998
-        p6 = re.compile(r"(^SI+ +handle+ +:+ +(?P<si_hand>\w.*)$)")
+        p6 = regex_engine.compile(r"(^SI+ +handle+ +:+ +(?P<si_hand>\w.*)$)")
 
         # HTM handle : 0x7f95a2321c28
-        p7 = re.compile(r"(^HTM+ +handle+ +:+ +(?P<htm_hand>\w.*)$)")
+        p7 = regex_engine.compile(r"(^HTM+ +handle+ +:+ +(?P<htm_hand>\w.*)$)")
 
         member_port_flag = 0
         member_list = []
@@ -4149,13 +4149,13 @@ class ShowPlatformSoftwareFedSwitchActiveAclUsage(
             output = self.device.execute(cmd)
 
         ######  ACE Software VMR max:196608 used:253
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\#\#\#\#\#\s+ACE\sSoftware\sVMR\smax\:(?P<vmr_max>\d+)\sused\:(?P<used>\d+)$"
         )
 
         #   RACL        IPV4     Ingress   PBR-DMVPN    92
         #   V_SISF                  IPV6            Ingress         sisf v6acl 0001DF9F     9
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<feature_type>\S+)\s+(?P<acl_type>\S+)\s+(?P<direction>\S+)\s+(?P<name>.+?)\s+(?P<entries_used>\d+)$"
         )
 
@@ -4233,7 +4233,7 @@ class ShowPlatformSoftwareFedSwitchActiveVtCounter(
             output = self.device.execute(cmd)
 
         # Total no of vlan mappings configured: 1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Total\s+no\s+of\s+vlan\s+mappings\s+configured:\s+(?P<number_of_vlans>\d+)$"
         )
         ret_dict = {}
@@ -4287,7 +4287,7 @@ class ShowPlatformSoftwareFedSwitchActiveVtAll(
 
         # interface_id  cvlan_id      svlan-id              action
         # 183           20            30                    1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<interface_id>\d+)\s+(?P<cvlan_id>\d+)\s+(?P<svlan_id>\d+)\s+(?P<action>\d+)$"
         )
         ret_dict = {}
@@ -4352,7 +4352,7 @@ class ShowPlatformSoftwareFedSwitchActiveVpSummaryVlan(
             output = self.device.execute(cmd, timeout=600)
 
         #               32          100         none            1  forwarding          No                No
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<if_id>\d+)\s+(?P<vlan_id>\d+)\s+(?P<pvlan_mode>\w+)\s+(?P<pvlan_vlan>\d+)\s+(?P<stp_state>\w+)\s+(?P<vtp_pruned>\w+)\s+(?P<untagged>\w+)$"
         )
 
@@ -4485,139 +4485,139 @@ class ShowPlatformSoftwareFedSwitchStateIfmIfIdIf_id(
             output = self.device.execute(cmd)
 
         # Interface Name          : C320150491
-        p1 = re.compile(r"^Interface\s+Name\s+:\s+(?P<name>\S+)$")
+        p1 = regex_engine.compile(r"^Interface\s+Name\s+:\s+(?P<name>\S+)$")
         # Interface IF_ID         : 0x0000000013151bdb
-        p1_1 = re.compile(r"^Interface\s+IF_ID\s+:\s+(?P<if_id>\S+)$")
+        p1_1 = regex_engine.compile(r"^Interface\s+IF_ID\s+:\s+(?P<if_id>\S+)$")
         # Interface Block Pointer : 0x7f16cd385568
-        p1_2 = re.compile(r"^Interface\s+Block\s+Pointer\s+:\s+(?P<blk_ptr>\S+)$")
+        p1_2 = regex_engine.compile(r"^Interface\s+Block\s+Pointer\s+:\s+(?P<blk_ptr>\S+)$")
         # Interface Block State   : READY
-        p1_3 = re.compile(r"^Interface\s+Block\s+State\s+:\s+(?P<blk_state>\w+)$")
+        p1_3 = regex_engine.compile(r"^Interface\s+Block\s+State\s+:\s+(?P<blk_state>\w+)$")
         # Interface State         : Enabled
-        p1_4 = re.compile(r"^Interface\s+State\s+:\s+(?P<state>\w+)$")
+        p1_4 = regex_engine.compile(r"^Interface\s+State\s+:\s+(?P<state>\w+)$")
         # Interface Status        : ADD, UPD
-        p1_5 = re.compile(r"^Interface\s+Status\s+:\s+(?P<status>\S+\s+\S+)$")
+        p1_5 = regex_engine.compile(r"^Interface\s+Status\s+:\s+(?P<status>\S+\s+\S+)$")
         # Interface Ref-Cnt       : 2
-        p1_6 = re.compile(r"^Interface\s+Ref-Cnt\s+:\s+(?P<ref_count>\d+)$")
+        p1_6 = regex_engine.compile(r"^Interface\s+Ref-Cnt\s+:\s+(?P<ref_count>\d+)$")
         # Interface Type          : WIRED_CLIENT
-        p1_7 = re.compile(r"^Interface\s+Type\s+:\s+(?P<type>\S+)$")
+        p1_7 = regex_engine.compile(r"^Interface\s+Type\s+:\s+(?P<type>\S+)$")
         # Created Time            : 2022/09/29 12:17:16.343
-        p1_8 = re.compile(r"^Created\s+Time\s+:\s+(?P<create_time>\S+\s+\S+)$")
+        p1_8 = regex_engine.compile(r"^Created\s+Time\s+:\s+(?P<create_time>\S+\s+\S+)$")
         # Last Modified Time      : 2022/09/29 12:17:16.387
-        p1_9 = re.compile(
+        p1_9 = regex_engine.compile(
             r"^Last\s+Modified\s+Time\s+:\s+(?P<last_modfd_time>\S+\s+\S+)$"
         )
         # Current Time            : 2022/09/29 12:29:36.705
-        p1_10 = re.compile(r"^Current\s+Time\s+:\s+(?P<cur_time>\S+\s+\S+)$")
+        p1_10 = regex_engine.compile(r"^Current\s+Time\s+:\s+(?P<cur_time>\S+\s+\S+)$")
         #   mac            : 001b.0c18.918d
-        p1_11 = re.compile(r"^mac\s+:\s+(?P<mac>\S+)$")
+        p1_11 = regex_engine.compile(r"^mac\s+:\s+(?P<mac>\S+)$")
         #   parent if_id   : 0x0000000000000020
-        p1_12 = re.compile(r"^parent\s+if_id\s+:\s+(?P<parent_if_id>\S+)$")
+        p1_12 = regex_engine.compile(r"^parent\s+if_id\s+:\s+(?P<parent_if_id>\S+)$")
         #   Client if_id   : 0x0000000013151bdb
-        p1_13 = re.compile(r"^Client\s+if_id\s+:\s+(?P<client_if_id>\S+)$")
+        p1_13 = regex_engine.compile(r"^Client\s+if_id\s+:\s+(?P<client_if_id>\S+)$")
         #   Switch Num     : 1
-        p1_14 = re.compile(r"^Switch\s+Num\s+:\s+(?P<switch_num>\d+)$")
+        p1_14 = regex_engine.compile(r"^Switch\s+Num\s+:\s+(?P<switch_num>\d+)$")
         #   Client type    : 1
-        p1_15 = re.compile(r"^Client\s+type\s+:\s+(?P<client_type>\d+)$")
+        p1_15 = regex_engine.compile(r"^Client\s+type\s+:\s+(?P<client_type>\d+)$")
         #   ASIC Num       : 1
-        p1_16 = re.compile(r"^ASIC\s+Num\s+:\s+(?P<asic_num>\d+)$")
+        p1_16 = regex_engine.compile(r"^ASIC\s+Num\s+:\s+(?P<asic_num>\d+)$")
         #   Client LE      : 0x7f16cd0caaa8
-        p1_17 = re.compile(r"^Client\s+LE\s+:\s+(?P<client_le>\S+)$")
+        p1_17 = regex_engine.compile(r"^Client\s+LE\s+:\s+(?P<client_le>\S+)$")
         #   DNS punt       : False
-        p1_18 = re.compile(r"^DNS\s+punt\s+:\s+(?P<dns_punt>\S+)$")
+        p1_18 = regex_engine.compile(r"^DNS\s+punt\s+:\s+(?P<dns_punt>\S+)$")
         # Ref Count : 2 (feature Ref Counts + 1)
-        p1_19 = re.compile(
+        p1_19 = regex_engine.compile(
             r"^Ref\s+Count\s+:\s+(?P<ref_count_feature>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$"
         )
         #   Handle ............ [0x8b00013f]
-        p2 = re.compile(r"^Handle\s+\.*\s+\[(?P<handle>\S+)\]$")
+        p2 = regex_engine.compile(r"^Handle\s+\.*\s+\[(?P<handle>\S+)\]$")
         #   Type .............. [Wired-client]
-        p2_1 = re.compile(r"^Type\s+\.*\s+\[(?P<type>\S+)\]$")
+        p2_1 = regex_engine.compile(r"^Type\s+\.*\s+\[(?P<type>\S+)\]$")
         #   Identifier ........ [0x13151bdb]
-        p2_2 = re.compile(r"^Identifier\s+\.*\s+\[(?P<identifier>\S+)\]$")
+        p2_2 = regex_engine.compile(r"^Identifier\s+\.*\s+\[(?P<identifier>\S+)\]$")
         #   Unit .............. [320150491]
-        p2_3 = re.compile(r"^Unit\s+\.*\s+\[(?P<unit>\S+)\]$")
+        p2_3 = regex_engine.compile(r"^Unit\s+\.*\s+\[(?P<unit>\S+)\]$")
         #       Client LE handle .... [0x7f16cd0caaa8]
-        p3 = re.compile(r"^Client\s+LE\s+handle\s+\.*\s+\[(?P<client_le_handle>\S+)\]$")
+        p3 = regex_engine.compile(r"^Client\s+LE\s+handle\s+\.*\s+\[(?P<client_le_handle>\S+)\]$")
         #       Parent Identifier : 0x20
-        p3_1 = re.compile(r"^Parent\s+Identifier\s+:\s+(?P<parent_identifier>\S+)$")
+        p3_1 = regex_engine.compile(r"^Parent\s+Identifier\s+:\s+(?P<parent_identifier>\S+)$")
         #       Asic num          : 0x1
-        p3_2 = re.compile(r"^Asic\s+num\s+:\s+(?P<asic_num>\S+)$")
+        p3_2 = regex_engine.compile(r"^Asic\s+num\s+:\s+(?P<asic_num>\S+)$")
         #       Switch num        : 0x1
-        p3_3 = re.compile(r"^Switch\s+num\s+:\s+(?P<switch_num>\S+)$")
+        p3_3 = regex_engine.compile(r"^Switch\s+num\s+:\s+(?P<switch_num>\S+)$")
         #       Rewrite type      : 0x0
-        p3_4 = re.compile(r"^Rewrite\s+type\s+:\s+(?P<rewr_type>\S+)$")
+        p3_4 = regex_engine.compile(r"^Rewrite\s+type\s+:\s+(?P<rewr_type>\S+)$")
         #       Client mac        : 1:0:0:0:0:0
-        p3_5 = re.compile(r"^Client\s+mac\s+:\s+(?P<client_mac>\S+)$")
+        p3_5 = regex_engine.compile(r"^Client\s+mac\s+:\s+(?P<client_mac>\S+)$")
         #       RI handle         : 53
-        p3_6 = re.compile(r"^RI\s+handle\s+:\s+(?P<ri_handle>\d+)$")
+        p3_6 = regex_engine.compile(r"^RI\s+handle\s+:\s+(?P<ri_handle>\d+)$")
         #       DI handle         : 0
-        p3_7 = re.compile(r"^DI\s+handle\s+:\s+(?P<di_handle>\d+)$")
+        p3_7 = regex_engine.compile(r"^DI\s+handle\s+:\s+(?P<di_handle>\d+)$")
         #       Dst Adj  handle   : 0
-        p3_8 = re.compile(r"^Dst\s+Adj\s+handle\s+:\s+(?P<dst_adj_handle>\d+)$")
+        p3_8 = regex_engine.compile(r"^Dst\s+Adj\s+handle\s+:\s+(?P<dst_adj_handle>\d+)$")
         #       Dst Lookup handle : 0
-        p3_9 = re.compile(r"^Dst\s+Lookup\s+handle\s+:\s+(?P<dst_lkp_handle>\d+)$")
+        p3_9 = regex_engine.compile(r"^Dst\s+Lookup\s+handle\s+:\s+(?P<dst_lkp_handle>\d+)$")
         #       Src Adj  handle   : 0x53
-        p3_10 = re.compile(r"^Src\s+Adj\s+handle\s+:\s+(?P<src_adj_handle>\S+)$")
+        p3_10 = regex_engine.compile(r"^Src\s+Adj\s+handle\s+:\s+(?P<src_adj_handle>\S+)$")
         #       Src Lookup handle : 0
-        p3_11 = re.compile(r"^Src\s+Lookup\s+handle\s+:\s+(?P<src_lkp_handle>\d+)$")
+        p3_11 = regex_engine.compile(r"^Src\s+Lookup\s+handle\s+:\s+(?P<src_lkp_handle>\d+)$")
 
         #       Enabled ............. [No]
-        p4 = re.compile(r"^Enabled\s+\.*\s+\[(?P<enabled>\w+)\]$")
+        p4 = regex_engine.compile(r"^Enabled\s+\.*\s+\[(?P<enabled>\w+)\]$")
         #       Allow dot1q ......... [No]
-        p4_1 = re.compile(r"^Allow\s+dot1q\s+\.*\s+\[(?P<allow_dot1q>\w+)\]$")
+        p4_1 = regex_engine.compile(r"^Allow\s+dot1q\s+\.*\s+\[(?P<allow_dot1q>\w+)\]$")
         #       Allow native ........ [No]
-        p4_2 = re.compile(r"^Allow\s+native\s+\.*\s+\[(?P<allow_native>\w+)\]$")
+        p4_2 = regex_engine.compile(r"^Allow\s+native\s+\.*\s+\[(?P<allow_native>\w+)\]$")
         #       Default VLAN ........ [0]
-        p4_3 = re.compile(r"^Default\s+VLAN\s+\.*\s+\[(?P<def_vlan>\d+)\]$")
+        p4_3 = regex_engine.compile(r"^Default\s+VLAN\s+\.*\s+\[(?P<def_vlan>\d+)\]$")
         #       Allow priority tag ... [No]
-        p4_4 = re.compile(
+        p4_4 = regex_engine.compile(
             r"^Allow\s+priority\s+tag\s+\.*\s+\[(?P<allow_priority_tag>\w+)\]$"
         )
         #       Allow unknown unicast  [No]
-        p4_5 = re.compile(
+        p4_5 = regex_engine.compile(
             r"^Allow\s+unknown\s+unicast\s+\[(?P<allow_unkn_ucast>\w+)\]$"
         )
         #       Allow unknown multicast[No]
-        p4_6 = re.compile(r"^Allow\s+unknown\s+multicast\[(?P<allow_unkn_mcast>\w+)\]$")
+        p4_6 = regex_engine.compile(r"^Allow\s+unknown\s+multicast\[(?P<allow_unkn_mcast>\w+)\]$")
         #       Allow unknown broadcast[No]
-        p4_7 = re.compile(r"^Allow\s+unknown\s+broadcast\[(?P<allow_unkn_bcast>\w+)\]$")
+        p4_7 = regex_engine.compile(r"^Allow\s+unknown\s+broadcast\[(?P<allow_unkn_bcast>\w+)\]$")
         #       Protected ............ [No]
-        p4_8 = re.compile(r"^Protected\s+\.*\s+\[(?P<protected>\w+)\]$")
+        p4_8 = regex_engine.compile(r"^Protected\s+\.*\s+\[(?P<protected>\w+)\]$")
         #       IPv4 ARP snoop ....... [No]
-        p4_9 = re.compile(r"^IPv4\s+ARP\s+snoop\s+\.*\s+\[(?P<ipv4_arp_snp>\w+)\]$")
+        p4_9 = regex_engine.compile(r"^IPv4\s+ARP\s+snoop\s+\.*\s+\[(?P<ipv4_arp_snp>\w+)\]$")
         #       IPv6 ARP snoop ....... [No]
-        p4_10 = re.compile(r"^IPv6\s+ARP\s+snoop\s+\.*\s+\[(?P<ipv6_arp_snp>\w+)\]$")
+        p4_10 = regex_engine.compile(r"^IPv6\s+ARP\s+snoop\s+\.*\s+\[(?P<ipv6_arp_snp>\w+)\]$")
         #       Jumbo MTU ............ [0]
-        p4_11 = re.compile(r"^Jumbo\s+MTU\s+\.*\s+\[(?P<jumbo_mtu>\d+)\]$")
+        p4_11 = regex_engine.compile(r"^Jumbo\s+MTU\s+\.*\s+\[(?P<jumbo_mtu>\d+)\]$")
         #       Learning Mode ........ [0]
-        p4_12 = re.compile(r"^Learning\s+Mode\s+\.*\s+\[(?P<learning_mode>\d+)\]$")
+        p4_12 = regex_engine.compile(r"^Learning\s+Mode\s+\.*\s+\[(?P<learning_mode>\d+)\]$")
         #       Vepa ................. [Disabled]
-        p4_13 = re.compile(r"^Vepa\s+\.*\s+\[(?P<vepa>\w+)\]$")
+        p4_13 = regex_engine.compile(r"^Vepa\s+\.*\s+\[(?P<vepa>\w+)\]$")
         #       App Hosting........... [Disabled]
-        p4_14 = re.compile(r"^App\s+Hosting\.*\s+\[(?P<app_hosting>\S+)\]$")
+        p4_14 = regex_engine.compile(r"^App\s+Hosting\.*\s+\[(?P<app_hosting>\S+)\]$")
 
         #       Trust Type .................... [0x7]
-        p5 = re.compile(r"^Trust\s+Type\s+\.*\s+\[(?P<trust_type>\S+)\]$")
+        p5 = regex_engine.compile(r"^Trust\s+Type\s+\.*\s+\[(?P<trust_type>\S+)\]$")
         #       Default Value ................. [0]
-        p5_1 = re.compile(r"^Default\s+Value\s+\.*\s+\[(?P<def_value>\d+)\]$")
+        p5_1 = regex_engine.compile(r"^Default\s+Value\s+\.*\s+\[(?P<def_value>\d+)\]$")
         #       Ingress Table Map ............. [0x0]
-        p5_2 = re.compile(r"^Ingress\s+Table\s+Map\s+\.*\s+\[(?P<ingrs_tbl_map>\S+)\]$")
+        p5_2 = regex_engine.compile(r"^Ingress\s+Table\s+Map\s+\.*\s+\[(?P<ingrs_tbl_map>\S+)\]$")
         #       Egress Table Map .............. [0x0]
-        p5_3 = re.compile(r"^Egress\s+Table\s+Map\s+\.*\s+\[(?P<egrs_tbl_map>\S+)\]$")
+        p5_3 = regex_engine.compile(r"^Egress\s+Table\s+Map\s+\.*\s+\[(?P<egrs_tbl_map>\S+)\]$")
         #       Queue Map ..................... [0x0]
-        p5_4 = re.compile(r"^Queue\s+Map\s+\.*\s+\[(?P<q_map>\S+)\]$")
+        p5_4 = regex_engine.compile(r"^Queue\s+Map\s+\.*\s+\[(?P<q_map>\S+)\]$")
 
         #       Disable SGACL .................... [0x0]
-        p6 = re.compile(r"^Disable\s+SGACL\s+\.*\s+\[(?P<disable_sgacl>\S+)\]$")
+        p6 = regex_engine.compile(r"^Disable\s+SGACL\s+\.*\s+\[(?P<disable_sgacl>\S+)\]$")
         #       Trust ............................ [0x0]
-        p6_1 = re.compile(r"^Trust\s+\.*\s+\[(?P<trust>\S+)\]$")
+        p6_1 = regex_engine.compile(r"^Trust\s+\.*\s+\[(?P<trust>\S+)\]$")
         #       Propagate ........................ [0x0]
-        p6_2 = re.compile(r"^Propagate\s+\.*\s+\[(?P<propagate>\S+)\]$")
+        p6_2 = regex_engine.compile(r"^Propagate\s+\.*\s+\[(?P<propagate>\S+)\]$")
         #       Port SGT ......................... [0xffff]
-        p6_3 = re.compile(r"^Port\s+SGT\s+\.*\s+\[(?P<port_sgt>\S+)\]$")
+        p6_3 = regex_engine.compile(r"^Port\s+SGT\s+\.*\s+\[(?P<port_sgt>\S+)\]$")
 
         #   FID : 98 (AAL_FEATURE_L2_MULTICAST_IGMP), Ref Count : 1
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^FID\s+:\s+(?P<fid>\S+\s+\S+),\s+Ref\s+Count\s+:\s+(?P<ref_count>\d+)$"
         )
 
@@ -5226,85 +5226,85 @@ class ShowPlatformSoftwareFedActiveMonitor(ShowPlatformSoftwareFedActiveMonitorS
             output = self.device.execute(self.cli_command.format(session=session))
 
         # Session Type         : ERSPAN Source Session
-        p1 = re.compile(r"^Session Type\s+:\s+(?P<session_type>[\w\s]+)$")
+        p1 = regex_engine.compile(r"^Session Type\s+:\s+(?P<session_type>[\w\s]+)$")
 
         # Source Ports         : RX: GigabitEthernet1/0/1 TenGigabitEthernet1/1/3 TX: None
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Source Ports\s+: RX:\s+(?P<rx>[\w\/\s]+)\sTX:\s+(?P<tx>[\w\/\s]+)$"
         )
 
         # Destination Ports    : TwoGigabitEthernet1/0/13
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Destination Ports\s+:\s+(?P<destination_ports>[\w\/\s]+(?<!None))$"
         )
 
         # Source VLANs         : None
-        p4 = re.compile(r"^Source VLANs\s+:\s+(?P<source_vlans>[\w\-\d\s]+(?<!None))$")
+        p4 = regex_engine.compile(r"^Source VLANs\s+:\s+(?P<source_vlans>[\w\-\d\s]+(?<!None))$")
 
         # Destination VLANs    : None
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^Destination VLANs\s+:\s+(?P<destination_vlans>[\w\-\d\s]+(?<!None))$"
         )
 
         # Source RSPAN VLAN    : 0
-        p6 = re.compile(r"^Source RSPAN VLAN\s+:\s+(?P<source_rspan_vlan>\d+)$")
+        p6 = regex_engine.compile(r"^Source RSPAN VLAN\s+:\s+(?P<source_rspan_vlan>\d+)$")
 
         # DST RSPAN VLAN       : 0
-        p7 = re.compile(r"^DST RSPAN VLAN\s+:\s+(?P<destination_rspan_vlan>\d+)$")
+        p7 = regex_engine.compile(r"^DST RSPAN VLAN\s+:\s+(?P<destination_rspan_vlan>\d+)$")
 
         # Encap                : Native
-        p8 = re.compile(r"^Encap\s+:\s+(?P<encap>\S+)$")
+        p8 = regex_engine.compile(r"^Encap\s+:\s+(?P<encap>\S+)$")
 
         # Ingress Forwarding   : Disabled
-        p9 = re.compile(r"^Ingress Forwarding\s+:\s+(?P<ingress_forwarding>\S+)$")
+        p9 = regex_engine.compile(r"^Ingress Forwarding\s+:\s+(?P<ingress_forwarding>\S+)$")
 
         # Filter VLANs         : None
-        p10 = re.compile(r"^Filter VLANs\s+:\s+(?P<filter_vlans>[\d\s]+(?<!None))$")
+        p10 = regex_engine.compile(r"^Filter VLANs\s+:\s+(?P<filter_vlans>[\d\s]+(?<!None))$")
 
         # ERSPAN Enable        : 1
-        p11 = re.compile(r"^ERSPAN Enable\s+:\s+(?P<erspan_enable>\d+)$")
+        p11 = regex_engine.compile(r"^ERSPAN Enable\s+:\s+(?P<erspan_enable>\d+)$")
 
         # ERSPAN Hw Programmed : 1
-        p12 = re.compile(r"^ERSPAN Hw Programmed\s+:\s+(?P<erspan_hw_programmed>\d+)$")
+        p12 = regex_engine.compile(r"^ERSPAN Hw Programmed\s+:\s+(?P<erspan_hw_programmed>\d+)$")
 
         # ERSPAN Mandatory Cfg : 1
-        p13 = re.compile(r"^ERSPAN Mandatory Cfg\s+:\s+(?P<erspan_mandatory_cfg>\d+)$")
+        p13 = regex_engine.compile(r"^ERSPAN Mandatory Cfg\s+:\s+(?P<erspan_mandatory_cfg>\d+)$")
 
         # ERSPAN Id            : 3
-        p14 = re.compile(r"^ERSPAN Id\s+:\s+(?P<erspan_id>\d+)$")
+        p14 = regex_engine.compile(r"^ERSPAN Id\s+:\s+(?P<erspan_id>\d+)$")
 
         # Gre Prot             : 88be
-        p15 = re.compile(r"^Gre Prot\s+:\s+(?P<gre_protocol>\S+)$")
+        p15 = regex_engine.compile(r"^Gre Prot\s+:\s+(?P<gre_protocol>\S+)$")
 
         # MTU                  : 9000
-        p16 = re.compile(r"^MTU\s+:\s+(?P<mtu>\d+)$")
+        p16 = regex_engine.compile(r"^MTU\s+:\s+(?P<mtu>\d+)$")
 
         # Ip Tos               : 0 (DSCP:0)
-        p17 = re.compile(r"^Ip Tos\s+:\s+(?P<ip_tos>\d+).+$")
+        p17 = regex_engine.compile(r"^Ip Tos\s+:\s+(?P<ip_tos>\d+).+$")
 
         # Ip Ttl               : 255
-        p18 = re.compile(r"^Ip Ttl\s+:\s+(?P<ip_ttl>\d+)$")
+        p18 = regex_engine.compile(r"^Ip Ttl\s+:\s+(?P<ip_ttl>\d+)$")
 
         # Cos                  : 0
-        p19 = re.compile(r"^Cos\s+:\s+(?P<cos>\d+)$")
+        p19 = regex_engine.compile(r"^Cos\s+:\s+(?P<cos>\d+)$")
 
         # Vrf Id               : 0
-        p20 = re.compile(r"^Vrf Id\s+:\s+(?P<vrf_id>\d+)$")
+        p20 = regex_engine.compile(r"^Vrf Id\s+:\s+(?P<vrf_id>\d+)$")
 
         # Tunnel IfId          : 65
-        p21 = re.compile(r"^Tunnel IfId\s+:\s+(?P<tunnel_if_id>\d+)$")
+        p21 = regex_engine.compile(r"^Tunnel IfId\s+:\s+(?P<tunnel_if_id>\d+)$")
 
         # Dst Ip               : 1.1.3.2
-        p22 = re.compile(r"^Dst Ip\s+:\s+(?P<destination_ip>\S+)$")
+        p22 = regex_engine.compile(r"^Dst Ip\s+:\s+(?P<destination_ip>\S+)$")
 
         # Org Ip               : 1.1.3.1
-        p23 = re.compile(r"^Org Ip\s+:\s+(?P<org_ip>\S+)$")
+        p23 = regex_engine.compile(r"^Org Ip\s+:\s+(?P<org_ip>\S+)$")
 
         # SGT count            : 0
-        p24 = re.compile(r"^SGT count\s+:\s+(?P<sgt_count>\d+)$")
+        p24 = regex_engine.compile(r"^SGT count\s+:\s+(?P<sgt_count>\d+)$")
 
         # SGT Tag(s)           :
-        p25 = re.compile(r"^SGT Tag\(s\)\s+:\s+(?P<sgt_tag>\S+)$")
+        p25 = regex_engine.compile(r"^SGT Tag\(s\)\s+:\s+(?P<sgt_tag>\S+)$")
 
         ret_dict = {}
 
@@ -5506,7 +5506,7 @@ class ShowPlatformSoftwareFedIfmInterfaces(ShowPlatformSoftwareFedIfmInterfacesS
         ret_dict = {}
 
         # Vlan10 0x0000005d READY
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<interface>\S+)\s+(?P<if_id>\d+x+\w+)\s+(?P<state>[\w\s]+)$"
         )
 
@@ -5573,10 +5573,10 @@ class ShowPlatformSoftwareFedActiveVtHardwareIfId(
         ret_dict = {}
         # Forward Mapping
         # Reverse Mapping
-        p1 = re.compile(r"^(?P<mapping>\S+) Mapping$")
+        p1 = regex_engine.compile(r"^(?P<mapping>\S+) Mapping$")
 
         # 40            30
-        p2 = re.compile(r"^(?P<vlan_id>\d+)\s*(?P<translated_id>\d+)$")
+        p2 = regex_engine.compile(r"^(?P<vlan_id>\d+)\s*(?P<translated_id>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -5646,90 +5646,90 @@ class ShowPlatformSoftwareFedActiveMonitor(ShowPlatformSoftwareFedActiveMonitorS
             output = self.device.execute(self.cli_command.format(session=session))
 
         # Session Type         : ERSPAN Source Session
-        p1 = re.compile(r"^Session Type\s+:\s+(?P<session_type>[\w\s]+)$")
+        p1 = regex_engine.compile(r"^Session Type\s+:\s+(?P<session_type>[\w\s]+)$")
 
         # Source Ports         : RX: GigabitEthernet1/0/1 TenGigabitEthernet1/1/3 TX: None
         # Source Ports         : RX: FourHundredGigE1/0/31 TX:
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Source Ports\s+: RX:\s+(?P<rx>[\w\/\s]+)\sTX:\s*(?P<tx>[\w\/\s]+)?$"
         )
         # Source Ports         : RX: FourHundredGigE1/0/31 TX:
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Source Ports\s+: RX:\s+(?P<rx>[\w\/\s]+)\sTX:\s*(?P<tx>[\w\/\s]+)?$"
         )
 
         # Destination Ports    : TwoGigabitEthernet1/0/13
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Destination Ports\s+:\s+(?P<destination_ports>[\w\/\s]+(?<!None))$"
         )
 
         # Source VLANs         : None
-        p4 = re.compile(r"^Source VLANs\s+:\s+(?P<source_vlans>[\w\-\d\s]+(?<!None))$")
+        p4 = regex_engine.compile(r"^Source VLANs\s+:\s+(?P<source_vlans>[\w\-\d\s]+(?<!None))$")
 
         # Destination VLANs    : None
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^Destination VLANs\s+:\s+(?P<destination_vlans>[\w\-\d\s]+(?<!None))$"
         )
 
         # Source RSPAN VLAN    : 0
-        p6 = re.compile(r"^Source RSPAN VLAN\s+:\s+(?P<source_rspan_vlan>\d+)$")
+        p6 = regex_engine.compile(r"^Source RSPAN VLAN\s+:\s+(?P<source_rspan_vlan>\d+)$")
 
         # DST RSPAN VLAN       : 0
-        p7 = re.compile(r"^DST RSPAN VLAN\s+:\s+(?P<destination_rspan_vlan>\d+)$")
+        p7 = regex_engine.compile(r"^DST RSPAN VLAN\s+:\s+(?P<destination_rspan_vlan>\d+)$")
 
         # Encap                : Native
-        p8 = re.compile(r"^Encap\s+:\s+(?P<encap>\S+)$")
+        p8 = regex_engine.compile(r"^Encap\s+:\s+(?P<encap>\S+)$")
 
         # Ingress Forwarding   : Disabled
-        p9 = re.compile(r"^Ingress Forwarding\s+:\s+(?P<ingress_forwarding>\S+)$")
+        p9 = regex_engine.compile(r"^Ingress Forwarding\s+:\s+(?P<ingress_forwarding>\S+)$")
 
         # Filter VLANs         : None
-        p10 = re.compile(r"^Filter VLANs\s+:\s+(?P<filter_vlans>[\d\s]+(?<!None))$")
+        p10 = regex_engine.compile(r"^Filter VLANs\s+:\s+(?P<filter_vlans>[\d\s]+(?<!None))$")
 
         # ERSPAN Enable        : 1
-        p11 = re.compile(r"^ERSPAN Enable\s+:\s+(?P<erspan_enable>\d+)$")
+        p11 = regex_engine.compile(r"^ERSPAN Enable\s+:\s+(?P<erspan_enable>\d+)$")
 
         # ERSPAN Hw Programmed : 1
-        p12 = re.compile(r"^ERSPAN Hw Programmed\s+:\s+(?P<erspan_hw_programmed>\d+)$")
+        p12 = regex_engine.compile(r"^ERSPAN Hw Programmed\s+:\s+(?P<erspan_hw_programmed>\d+)$")
 
         # ERSPAN Mandatory Cfg : 1
-        p13 = re.compile(r"^ERSPAN Mandatory Cfg\s+:\s+(?P<erspan_mandatory_cfg>\d+)$")
+        p13 = regex_engine.compile(r"^ERSPAN Mandatory Cfg\s+:\s+(?P<erspan_mandatory_cfg>\d+)$")
 
         # ERSPAN Id            : 3
-        p14 = re.compile(r"^ERSPAN Id\s+:\s+(?P<erspan_id>\d+)$")
+        p14 = regex_engine.compile(r"^ERSPAN Id\s+:\s+(?P<erspan_id>\d+)$")
 
         # Gre Prot             : 88be
-        p15 = re.compile(r"^Gre Prot\s+:\s+(?P<gre_protocol>\S+)$")
+        p15 = regex_engine.compile(r"^Gre Prot\s+:\s+(?P<gre_protocol>\S+)$")
 
         # MTU                  : 9000
-        p16 = re.compile(r"^MTU\s+:\s+(?P<mtu>\d+)$")
+        p16 = regex_engine.compile(r"^MTU\s+:\s+(?P<mtu>\d+)$")
 
         # Ip Tos               : 0 (DSCP:0)
-        p17 = re.compile(r"^Ip Tos\s+:\s+(?P<ip_tos>\d+).+$")
+        p17 = regex_engine.compile(r"^Ip Tos\s+:\s+(?P<ip_tos>\d+).+$")
 
         # Ip Ttl               : 255
-        p18 = re.compile(r"^Ip Ttl\s+:\s+(?P<ip_ttl>\d+)$")
+        p18 = regex_engine.compile(r"^Ip Ttl\s+:\s+(?P<ip_ttl>\d+)$")
 
         # Cos                  : 0
-        p19 = re.compile(r"^Cos\s+:\s+(?P<cos>\d+)$")
+        p19 = regex_engine.compile(r"^Cos\s+:\s+(?P<cos>\d+)$")
 
         # Vrf Id               : 0
-        p20 = re.compile(r"^Vrf Id\s+:\s+(?P<vrf_id>\d+)$")
+        p20 = regex_engine.compile(r"^Vrf Id\s+:\s+(?P<vrf_id>\d+)$")
 
         # Tunnel IfId          : 65
-        p21 = re.compile(r"^Tunnel IfId\s+:\s+(?P<tunnel_if_id>\d+)$")
+        p21 = regex_engine.compile(r"^Tunnel IfId\s+:\s+(?P<tunnel_if_id>\d+)$")
 
         # Dst Ip               : 1.1.3.2
-        p22 = re.compile(r"^Dst Ip\s+:\s+(?P<destination_ip>\S+)$")
+        p22 = regex_engine.compile(r"^Dst Ip\s+:\s+(?P<destination_ip>\S+)$")
 
         # Org Ip               : 1.1.3.1
-        p23 = re.compile(r"^Org Ip\s+:\s+(?P<org_ip>\S+)$")
+        p23 = regex_engine.compile(r"^Org Ip\s+:\s+(?P<org_ip>\S+)$")
 
         # SGT count            : 0
-        p24 = re.compile(r"^SGT count\s+:\s+(?P<sgt_count>\d+)$")
+        p24 = regex_engine.compile(r"^SGT count\s+:\s+(?P<sgt_count>\d+)$")
 
         # SGT Tag(s)           :
-        p25 = re.compile(r"^SGT Tag\(s\)\s+:\s+(?P<sgt_tag>\S+)$")
+        p25 = regex_engine.compile(r"^SGT Tag\(s\)\s+:\s+(?P<sgt_tag>\S+)$")
 
         ret_dict = {}
 
@@ -5955,13 +5955,13 @@ class ShowPlatformSoftwareFedSwitchActiveVtHardware(
             output = self.device.execute(cmd)
 
         # Cvlan-id      Translated vlan-id
-        p1 = re.compile(r"^Cvlan\-id\s+Translated vlan\-id$")
+        p1 = regex_engine.compile(r"^Cvlan\-id\s+Translated vlan\-id$")
 
         # Svlan-id      Translated vlan-id
-        p2 = re.compile(r"^Svlan\-id\s+Translated vlan\-id$")
+        p2 = regex_engine.compile(r"^Svlan\-id\s+Translated vlan\-id$")
 
         # 30            20
-        p3 = re.compile(r"^(?P<vlan_id>\d+)\s+(?P<translated_vlan>\d+)$")
+        p3 = regex_engine.compile(r"^(?P<vlan_id>\d+)\s+(?P<translated_vlan>\d+)$")
 
         ret_dict = {}
         reverse_map_flag = False
@@ -6028,7 +6028,7 @@ class ShowPlatformSoftwareFedSecurityFedIpsgIfId(
             output = self.device.execute(cmd)
 
         # 10.1.1.1           2056770536     00:11:01:00:00:01    2047852776
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<ip>\S+)\s+(?P<ip_handle>\d+)\s+(?P<mac>\S+)\s+(?P<mac_handle>\d+)$"
         )
 
@@ -6100,21 +6100,21 @@ class ShowPlatformSoftwareFedSwitchSwitchFnfFlowRecordAsicAsicStartIndexIndexNum
             output = self.device.execute(self.cli_command)
 
         # 11 flows starting at 0 for asic 0:
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<num_flows>\d+)\s+flows\s+starting\s+at\s+(?P<index_num>\d+)\s+for\s+asic\s+(?P<asic_num>\d+):$"
         )
         # FirstSeen = 0x7647c, LastSeen = 0x76a55, sysUptime = 0x76aa8
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^FirstSeen\s+=\s+(?P<first_seen>\S+),\s+LastSeen\s+=\s+(?P<last_seen>\S+),\s+sysUptime\s+=\s+(?P<sys_uptime>\S+)$"
         )
         # PKT Count = 0x0000000003c515d5, L2ByteCount = 0x00000001e28aea80
-        p2_1 = re.compile(
+        p2_1 = regex_engine.compile(
             r"^PKT\s+Count\s+=\s+(?P<pkt_count>\S+),\s+L2ByteCount\s+=\s+(?P<byte_count>\S+)$"
         )
         # Idx 8256 :
-        p2_2 = re.compile(r"^Idx\s+(?P<id>\d+)\s+:$")
+        p2_2 = regex_engine.compile(r"^Idx\s+(?P<id>\d+)\s+:$")
         # {231, ALR_EGRESS_NET_FLOW_ACL_LOOKUP_TYPE1 = 0x01}
-        p2_3 = re.compile(
+        p2_3 = regex_engine.compile(
             r"^\{(?P<lookup_num>\d+),\s+(?P<lookup_type>\S+)\s+=\s+(?P<lookup_value>\S+)\}$"
         )
 
@@ -6219,7 +6219,7 @@ class ShowPlatformSoftwareFedSwitchActiveAclInfoDbSummary(
         # --------------------------------------------------------------------------------------------------------------
         # 13        acl-2                                       Racl       4              IPv4        N          Y
         # 17        acl-1                                       Racl       5              IPv4        Y          N
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<cg_id>\d+)\s+(?P<acl_name>\S+)\s+(?P<feature>\w+)\s+(?P<no_of_aces>\d+)\s+(?P<protocol>\S+)\s+(?P<ingress>\w+)\s+(?P<egress>\w+)$"
         )
 
@@ -6305,31 +6305,31 @@ class ShowPlatformSoftwareFedActiveAclBindDbDetail(
         ret_dict = {}
 
         # Interface Name: Hu1/0/2
-        p1 = re.compile(r"^Interface Name:\s+(?P<interface>[\w\/\.]+)$")
+        p1 = regex_engine.compile(r"^Interface Name:\s+(?P<interface>[\w\/\.]+)$")
 
         # Direction: Egress
-        p2 = re.compile(r"^Direction:\s+(?P<direction>[\w\_]+)$")
+        p2 = regex_engine.compile(r"^Direction:\s+(?P<direction>[\w\_]+)$")
 
         # Feature         : Pbr
-        p3 = re.compile(r"^Feature\s+:\s(?P<feature>[\w]+)$")
+        p3 = regex_engine.compile(r"^Feature\s+:\s(?P<feature>[\w]+)$")
 
         # Protocol        : IPv4
-        p4 = re.compile(r"^Protocol\s+:\s(?P<protocol>[\w]+)$")
+        p4 = regex_engine.compile(r"^Protocol\s+:\s(?P<protocol>[\w]+)$")
 
         # CG ID           : 1
-        p5 = re.compile(r"^CG ID\s+:\s(?P<cg_id>[\d]+)$")
+        p5 = regex_engine.compile(r"^CG ID\s+:\s(?P<cg_id>[\d]+)$")
 
         # CG Name         : v4_rmap2
-        p6 = re.compile(r"^CG Name\s+:\s(?P<cg_name>[\w\_\-]+)$")
+        p6 = regex_engine.compile(r"^CG Name\s+:\s(?P<cg_name>[\w\_\-]+)$")
 
         # Status          : Success
-        p7 = re.compile(r"^Status\s+:\s(?P<status>[\w]+)$")
+        p7 = regex_engine.compile(r"^Status\s+:\s(?P<status>[\w]+)$")
 
         # Src_og_lkup_hdl : 0
-        p8 = re.compile(r"^Src_og_lkup_hdl\s+:\s(?P<src_og_lkup_hdl>[\d]+)$")
+        p8 = regex_engine.compile(r"^Src_og_lkup_hdl\s+:\s(?P<src_og_lkup_hdl>[\d]+)$")
 
         # Dst_og_lkup_hdl : 0
-        p9 = re.compile(r"^Dst_og_lkup_hdl\s+:\s(?P<dst_og_lkup_hdl>[\d]+)$")
+        p9 = regex_engine.compile(r"^Dst_og_lkup_hdl\s+:\s(?P<dst_og_lkup_hdl>[\d]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -6500,92 +6500,92 @@ class ShowPlatformSoftwareFedActiveAclInfoDbDetail(
         tos_flag = False
 
         # [CG ID 13]    CG Name: acl-2    Feature: Racl
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^\[CG ID+\s+(?P<cg_id>[\d]+)\]+\s+CG+\s+Name:+\s(?P<cg_name>[\w\-]+)+\s+Feature:+\s(?P<feature>[\w]+)$"
         )
 
         # [CG ID: 10]    CG Name: pre-auth
-        p1_1 = re.compile(r'^\[CG ID: (?P<cg_id>\d+)\]\s+CG Name: (?P<cg_name>\S+)$')
+        p1_1 = regex_engine.compile(r'^\[CG ID: (?P<cg_id>\d+)\]\s+CG Name: (?P<cg_name>\S+)$')
 
         # [Sgacl, CG ID: 273]    CG Name: V4SGACL;000 
-        p1_2 = re.compile(r'\[\w+, CG ID: (?P<cg_id>\d+)\]\s+CG Name: (?P<cg_name>\S+)$')
+        p1_2 = regex_engine.compile(r'\[\w+, CG ID: (?P<cg_id>\d+)\]\s+CG Name: (?P<cg_name>\S+)$')
         
         # [CG ID 13]    Prot: IPv4
-        p2 = re.compile(r"^\[CG ID+\s+(?P<cg_id>[\d]+)\]+\s+Prot:+\s(?P<prot>[\w]+)$")
+        p2 = regex_engine.compile(r"^\[CG ID+\s+(?P<cg_id>[\d]+)\]+\s+Prot:+\s(?P<prot>[\w]+)$")
 
         # Feature: Pacl    Prot: IPv4
-        p2_1 = re.compile(r'Feature: (?P<feature>\S+)\s+Prot: (?P<prot>\S+)')
+        p2_1 = regex_engine.compile(r'Feature: (?P<feature>\S+)\s+Prot: (?P<prot>\S+)')
 
         # [CG ID 13]    Region grp: 0xdc09b2a8
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^\[CG ID+\s+(?P<cg_id>[\d]+)\]+\s+Region+\s+grp:+\s(?P<region>[\w\-]+)$"
         )
 
         # Region grp: 0x8c062308    Dir: Ingress
-        p3_1 = re.compile(r'Region grp: (?P<region>\S+)\s+Dir: (?P<dir>\S+)')
+        p3_1 = regex_engine.compile(r'Region grp: (?P<region>\S+)\s+Dir: (?P<dir>\S+)')
 
 
         # [CG ID 13]    Dir: Egress    SDK-handle(asic: 0, OID: 0x0000)
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^\[CG ID+\s+(?P<cg_id>[\S\s]+)\]+\s+Dir:+\s(?P<dir>[\w]+)+\s+SDK-handle+\(asic:+\s+(?P<asic>[\d]+),\s+OID:+\s+(?P<oid>[\w\s]+)\)$"
         )
 
         # SDK-handle(asic: 0, OID: 0xAC4)
-        p4_1 = re.compile(r'SDK-handle\(asic: (?P<asic>\d+), OID: (?P<oid>\S+)\)')
+        p4_1 = regex_engine.compile(r'SDK-handle\(asic: (?P<asic>\d+), OID: (?P<oid>\S+)\)')
 
         # Seq Num:10
-        p5 = re.compile(r"^Seq Num:+(?P<seq>[\d\w]+)$")
+        p5 = regex_engine.compile(r"^Seq Num:+(?P<seq>[\d\w]+)$")
 
         # ipv4_src: value = 0x00000000       mask = 0x00000000
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^ipv4_src:\s+value+\s=\s+(?P<ipv4_src_value>[\d\w]+)+\s+mask+\s=\s+(?P<ipv4_src_mask>[\d\w]+)$"
         )
 
         # ipv4_dst: value = 0x00000000       mask = 0x00000000
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^ipv4_dst:\s+value+\s=\s+(?P<ipv4_dst_value>[\d\w]+)+\s+mask+\s=\s+(?P<ipv4_dst_mask>[\d\w]+)$"
         )
 
         # ipv6_src: value = 0x00001100.0x01000000.0x00000000.0x30000000
-        p7_1 = re.compile(r"^ipv6_src:\s+value+\s=\s+(?P<ipv6_src_value>[\S]+)$")
+        p7_1 = regex_engine.compile(r"^ipv6_src:\s+value+\s=\s+(?P<ipv6_src_value>[\S]+)$")
 
         # ipv6_dst: value = 0x00001100.0x00000000.0x00000000.0x3000000
-        p7_2 = re.compile(r"^ipv6_dst:\s+value+\s=\s+(?P<ipv6_dst_value>[\S]+)$")
+        p7_2 = regex_engine.compile(r"^ipv6_dst:\s+value+\s=\s+(?P<ipv6_dst_value>[\S]+)$")
 
         # mask = 0xffffffff.0xffffffff.0xffffffff.0xffffffff
-        p7_3 = re.compile(r"^mask+\s=\s+(?P<ipv6_mask>[\S]+)$")
+        p7_3 = regex_engine.compile(r"^mask+\s=\s+(?P<ipv6_mask>[\S]+)$")
 
         # proto    frag    tcp_flg    tcp_op    src_port    dst_port
-        p8_0 = re.compile(
+        p8_0 = regex_engine.compile(
             r"^proto+\s+frag+\s+tcp_flg+\s+tcp_op+\s+src_port+\s+dst_port$"
         )
 
         #  tos      ttl       cos      v4_opt    src_obj     dst_obj
-        p8_1 = re.compile(
+        p8_1 = regex_engine.compile(
             r"^tos+\s+ttl+\s+cos+\s+[v4_opt|ext_hdr]+\s+src_obj+\s+dst_obj$"
         )
 
         # V:  0x1       0x0      0x0         0x0        0x0          0x0
         # M:  0xff       0x0      0x0         0x0        0x0          0x0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^(?P<pro_type>[\w\_]+)+:\s+(?P<proto>[\w]+)+\s+(?P<frag>[\w]+)+\s+(?P<tcp_flg>[\w]+)+\s+(?P<tcp_op>[\w]+)+\s+(?P<src_port>[\w]+)+\s+(?P<dst_port>[\w]+)$"
         )
         # V:  0x0       0x0      0x0         0x0        0x0          0x0
         # M:  0x0       0x0      0x0         0x0        0x0          0x0
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^(?P<tos_type>[\w\_]+)+:\s+(?P<tos>[\w]+)+\s+(?P<ttl>[\w]+)+\s+(?P<cos>[\w]+)+\s+(?P<v4_opt>[\w]+)+\s+(?P<src_obj>[\w]+)+\s+(?P<dst_obj>[\w]+)$"
         )
 
         # Result  deny:0x1    Counter handle: 0x72c
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^Result+\s+deny:+(?P<result>[\d\w]+)+\s+Counter handle:+(?P<counter>[\d\w\s]+)$"
         )
 
         # Result  action: PERMIT    Logging: NO_LOG
-        p10_1 = re.compile(r'Result\s+action: (?P<result>\S+)\s+Logging: (?P<logging>\S+)')
+        p10_1 = regex_engine.compile(r'Result\s+action: (?P<result>\S+)\s+Logging: (?P<logging>\S+)')
 
         # Counter handle: (asic: 0 , OID: 0xAC6 (0))
-        p11 = re.compile(r'Counter handle: \(asic: (?P<counter_asic>\d+) , OID: (?P<counter_oid>\S+) \(\d+\)\)')
+        p11 = regex_engine.compile(r'Counter handle: \(asic: (?P<counter_asic>\d+) , OID: (?P<counter_oid>\S+) \(\d+\)\)')
 
         ret_dict = {}
 
@@ -6874,7 +6874,7 @@ class ShowPlatformSoftwareFedActiveAclBindDbSummary(
         # Gi1/0/25    Racl          IPv4          Ingress     17           Success
         # Gi1/0/26.11  Racl          IPv4          Egress      13           Success
         # Gi1/0/25    Racl          IPv4          Ingress     17           Success
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<interface>[\w\-\.\/]+)\s+(?P<feature>\w+)\s+(?P<protocol>\w+)?\s+(?P<direction>\w+)\s+(?P<cg_id>\d+)\s+(?P<status>\w+)$"
         )
 
@@ -6948,35 +6948,35 @@ class ShowPlatformSoftwareFedSwitchActiveLearningStats(
             output = self.device.execute(cmd)
 
         # Learning cache parameter error: 0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Learning\s+cache\s+parameter\s+error:\s+(?P<learning_cache>\d+)$"
         )
 
         # IOSd notification message count: 169042
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^IOSd\s+notification\s+message\s+count:\s+(?P<IOSd_notification>\d+)$"
         )
 
         # IOSd notification cache count: 173791
-        p3 = re.compile(r"^IOSd\s+notification\s+cache\s+count:\s+(?P<IOSd_cache>\d+)$")
+        p3 = regex_engine.compile(r"^IOSd\s+notification\s+cache\s+count:\s+(?P<IOSd_cache>\d+)$")
 
         # L2 validation error: 2
-        p4 = re.compile(r"^L2\s+validation\s+error:\s+(?P<L2_validation>\d+)$")
+        p4 = regex_engine.compile(r"^L2\s+validation\s+error:\s+(?P<L2_validation>\d+)$")
 
         # L2 matm add error: 0
-        p5 = re.compile(r"^L2\s+matm\s+add\s+error:\s+(?P<L2_matm>\d+)$")
+        p5 = regex_engine.compile(r"^L2\s+matm\s+add\s+error:\s+(?P<L2_matm>\d+)$")
 
         # L2 learning cache: 173791
-        p6 = re.compile(r"^L2\s+learning\s+cache:\s+(?P<L2_learning>\d+)$")
+        p6 = regex_engine.compile(r"^L2\s+learning\s+cache:\s+(?P<L2_learning>\d+)$")
 
         # L3 validation error: 0
-        p7 = re.compile(r"^L3\s+validation\s+error:\s+(?P<L3_validation>\d+)$")
+        p7 = regex_engine.compile(r"^L3\s+validation\s+error:\s+(?P<L3_validation>\d+)$")
 
         # L3 process error: 0
-        p8 = re.compile(r"^L3\s+process\s+error:\s+(?P<L3_process>\d+)$")
+        p8 = regex_engine.compile(r"^L3\s+process\s+error:\s+(?P<L3_process>\d+)$")
 
         # L3 learning cache: 0
-        p9 = re.compile(r"^L3\s+learning\s+cache:\s+(?P<L3_learning>\d+)$")
+        p9 = regex_engine.compile(r"^L3\s+learning\s+cache:\s+(?P<L3_learning>\d+)$")
 
         ret_dict = {}
 
@@ -7095,12 +7095,12 @@ class ShowPlatformSoftwareFedSwitchActiveStpVlan(
             output = self.device.execute(self.cli_command)
 
         #                    Interface   pvlan_mode   stp_state  vtp pruned          Untagged          Ingress           Egress
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<interface>\S+) +(?P<pvlan_mode>\S+) +(?P<stp_state>\S+) +(?P<vtp_pruned>\S+) +(?P<untagged>\w+) +(?P<ingress>\w+) +(?P<egress>\w+)$"
         )
 
         # HW flood list: : Gi2/0/23, Gi2/0/10, Gi2/0/12, Gi2/0/14, Gi2/0/16, Ap2/0/1
-        p2 = re.compile(r"^HW flood list\:\s+:(?P<hw_flood_list>[\w\s\,/\.]*)$")
+        p2 = regex_engine.compile(r"^HW flood list\:\s+:(?P<hw_flood_list>[\w\s\,/\.]*)$")
 
         ret_dict = {}
 
@@ -7173,7 +7173,7 @@ class ShowPlatformSoftwareFedSwitchActiveAclOgPcl(
 
         # lkup-id   proto     num-ogs     ref-cnt    bits-used    prefixes  in HW
         # 0x3d      IPv4           1           2           1           4    Y
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<lkup_id>\S+)\s+(?P<proto>\w+)\s+(?P<num_orgs>\d+)\s+(?P<ref_cnt>\d+)\s+(?P<bits_used>\d+)\s+(?P<prefixes>\d+)\s+(?P<in_HW>\S)$"
         )
 
@@ -7275,7 +7275,7 @@ class ShowPlatformSoftwareFedSwitchActiveAclStatisticsEvents(
         # Mac Ingress ACL Deny:                0
         # Mac Egress ACL Deny:                 0
         # Mac ACL Implicit Deny:               0
-        p1 = re.compile(r"^(?P<stat_name>[\s\w]+):\s+(?P<stat_value>[\w]+)$")
+        p1 = regex_engine.compile(r"^(?P<stat_name>[\s\w]+):\s+(?P<stat_value>[\w]+)$")
 
         ret_dict = {}
 
@@ -7351,7 +7351,7 @@ class ShowPlatformSoftwareFedSwitchActiveIFMInterfacesSVI(
             output = self.device.execute(cmd, timeout=timeout)
 
         # Vlan1                             0x00000409          Ready
-        p1 = re.compile(r"^(?P<interface_name>\S+)\s+(?P<if_id>\S+)\s+(?P<state>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<interface_name>\S+)\s+(?P<if_id>\S+)\s+(?P<state>\S+)$")
 
         ret_dict = {}
         dict_value = {}
@@ -7408,7 +7408,7 @@ class ShowPlatformSoftwareFedSwitchActiveIFMMappingsEtherchannel(
             output = self.device.execute(cmd, timeout=timeout)
 
         # 241   Port-channel241                   0x00000038
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<channel_num>\d+)\s+(?P<interface_name>\S+)\s+(?P<if_id>\S+)$"
         )
 
@@ -7477,12 +7477,12 @@ class ShowPlatformSoftwareFedSwitchActiveNatInterfaces(
         # ------------------------------------------------------------------
         #          GigabitEthernet1/0/23 |                0x44e | outside |
         #                         Vlan11 |                0x450 |  inside |
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^(?P<interface_name>\S+)\s+\|+\s+(?P<interface_id>\w+)\s+\|+\s+(?P<domain>\S+)\s+\|$"
         )
 
         # Number of Interfaces : 2
-        p1 = re.compile(r"^Number of Interfaces +: +(?P<number_of_interfaces>\d+)$")
+        p1 = regex_engine.compile(r"^Number of Interfaces +: +(?P<number_of_interfaces>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -7566,28 +7566,28 @@ class ShowPlatformSoftwareFedSwitchActiveNatRules(
         index = 1
 
         # STATIC Rules:
-        p0 = re.compile(r"^STATIC Rules:$")
+        p0 = regex_engine.compile(r"^STATIC Rules:$")
 
         # Rule ID | Type |  Domain |   VRF | Protocol |        Local IP |  Port |       Global IP |  Port | Network |
         # ---------------------------------------------------------------------------------------------------------------
         # 0xc     |  1-1 |  inside |     0 |      any |        15.0.0.1 |     0 |       135.0.0.1 |     0 |      32 |
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<rule_id>\S+)\s+\|+\s+(?P<type>\d+-\d+|\s|\w+\/\w+)\s+\|+\s+(?P<domain>\w+)\s+\|+\s+(?P<vrf>\d+)\s+\|+\s+(?P<protocol>\S+)\s+\|+\s+(?P<local_ip>\S+)\s+\|+\s+(?P<local_port>\d+)\s+\|+\s+(?P<global_ip>\S+)\s+\|+\s+(?P<global_port>\d+)\s+\|+\s+(?P<network>\d+)\s+\|$"
         )
 
         # DYNAMIC Rules:
-        p2 = re.compile(r"^DYNAMIC Rules:$")
+        p2 = regex_engine.compile(r"^DYNAMIC Rules:$")
 
         # Rule ID    |    Type |   VRF |                  Acl |    Pool/Interface_IP | Overload |
         # ----------------------------------------------------------------------------------------
         # 0x80000001 |  Inside |     0 |                    1 |            pool_in_1 |       No |
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<rule_id>\S+)\s+\|+\s+(?P<type>\w+)\s+\|+\s+(?P<vrf>\d+)\s+\|+\s+(?P<acl>\S+)\s+\|+\s+(?P<pool_interface_ip>\S+)\s+\|+\s+(?P<overload>\S+)\s+\|$"
         )
 
         # Number of Rules : 2
-        p4 = re.compile(r"^Number of Rules +: +(?P<number_of_rules>\d+)$")
+        p4 = regex_engine.compile(r"^Number of Rules +: +(?P<number_of_rules>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -7706,28 +7706,28 @@ class ShowPlatformSoftwareFedSwitchActiveNatRules(
         index = 1
 
         # STATIC Rules:
-        p0 = re.compile(r"^STATIC Rules:$")
+        p0 = regex_engine.compile(r"^STATIC Rules:$")
 
         # Rule ID | Type |  Domain |   VRF | Protocol |        Local IP |  Port |       Global IP |  Port | Network |
         # ---------------------------------------------------------------------------------------------------------------
         # 0xc     |  1-1 |  inside |     0 |      any |        15.0.0.1 |     0 |       135.0.0.1 |     0 |      32 |
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<rule_id>\S+)\s+\|+\s+(?P<type>\d+-\d+|\s|\w+\/\w+)\s+\|+\s+(?P<domain>\w+)\s+\|+\s+(?P<vrf>\d+)\s+\|+\s+(?P<protocol>\S+)\s+\|+\s+(?P<local_ip>\S+)\s+\|+\s+(?P<local_port>\d+)\s+\|+\s+(?P<global_ip>\S+)\s+\|+\s+(?P<global_port>\d+)\s+\|+\s+(?P<network>\d+)\s+\|$"
         )
 
         # DYNAMIC Rules:
-        p2 = re.compile(r"^DYNAMIC Rules:$")
+        p2 = regex_engine.compile(r"^DYNAMIC Rules:$")
 
         # Rule ID    |    Type |   VRF |                  Acl |    Pool/Interface_IP | Overload |
         # ----------------------------------------------------------------------------------------
         # 0x80000001 |  Inside |     0 |                    1 |            pool_in_1 |       No |
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<rule_id>\S+)\s+\|+\s+(?P<type>\w+)\s+\|+\s+(?P<vrf>\d+)\s+\|+\s+(?P<acl>\S+)\s+\|+\s+(?P<pool_interface_ip>\S+)\s+\|+\s+(?P<overload>\S+)\s+\|$"
         )
 
         # Number of Rules : 2
-        p4 = re.compile(r"^Number of Rules +: +(?P<number_of_rules>\d+)$")
+        p4 = regex_engine.compile(r"^Number of Rules +: +(?P<number_of_rules>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -7835,12 +7835,12 @@ class ShowPlatformSoftwareFedSwitchActiveNatInterfaces(
         # ------------------------------------------------------------------
         #          GigabitEthernet1/0/23 |                0x44e | outside |
         #                         Vlan11 |                0x450 |  inside |
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^(?P<interface_name>\S+)\s+\|+\s+(?P<interface_id>\w+)\s+\|+\s+(?P<domain>\S+)\s+\|$"
         )
 
         # Number of Interfaces : 2
-        p1 = re.compile(r"^Number of Interfaces +: +(?P<number_of_interfaces>\d+)$")
+        p1 = regex_engine.compile(r"^Number of Interfaces +: +(?P<number_of_interfaces>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -7924,28 +7924,28 @@ class ShowPlatformSoftwareFedSwitchActiveNatRules(
         index = 1
 
         # STATIC Rules:
-        p0 = re.compile(r"^STATIC Rules:$")
+        p0 = regex_engine.compile(r"^STATIC Rules:$")
 
         # Rule ID | Type |  Domain |   VRF | Protocol |        Local IP |  Port |       Global IP |  Port | Network |
         # ---------------------------------------------------------------------------------------------------------------
         # 0xc     |  1-1 |  inside |     0 |      any |        15.0.0.1 |     0 |       135.0.0.1 |     0 |      32 |
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<rule_id>\S+)\s+\|+\s+(?P<type>\d+-\d+|\s|\w+\/\w+)\s+\|+\s+(?P<domain>\w+)\s+\|+\s+(?P<vrf>\d+)\s+\|+\s+(?P<protocol>\S+)\s+\|+\s+(?P<local_ip>\S+)\s+\|+\s+(?P<local_port>\d+)\s+\|+\s+(?P<global_ip>\S+)\s+\|+\s+(?P<global_port>\d+)\s+\|+\s+(?P<network>\d+)\s+\|$"
         )
 
         # DYNAMIC Rules:
-        p2 = re.compile(r"^DYNAMIC Rules:$")
+        p2 = regex_engine.compile(r"^DYNAMIC Rules:$")
 
         # Rule ID    |    Type |   VRF |                  Acl |    Pool/Interface_IP | Overload |
         # ----------------------------------------------------------------------------------------
         # 0x80000001 |  Inside |     0 |                    1 |            pool_in_1 |       No |
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<rule_id>\S+)\s+\|+\s+(?P<type>\w+)\s+\|+\s+(?P<vrf>\d+)\s+\|+\s+(?P<acl>\S+)\s+\|+\s+(?P<pool_interface_ip>\S+)\s+\|+\s+(?P<overload>\S+)\s+\|$"
         )
 
         # Number of Rules : 2
-        p4 = re.compile(r"^Number of Rules +: +(?P<number_of_rules>\d+)$")
+        p4 = regex_engine.compile(r"^Number of Rules +: +(?P<number_of_rules>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -8045,11 +8045,11 @@ class ShowPlatformSoftwareFedSwitchActiveFnfSwStatsShow(
 
         # monitor_action_message_rcvd:                    4
         # exporter_action_message_rcvd:                   0
-        p1 = re.compile(r"(?P<statistic>[\w\_]+):\s+(?P<value>[\d]+)$")
+        p1 = regex_engine.compile(r"(?P<statistic>[\w\_]+):\s+(?P<value>[\d]+)$")
 
         # 110: num_fin_rst_skip_flow_pend_del:    0
         # 111: num_wdavc_del_pend_set_same_state_warn: 0
-        p2 = re.compile(r"^(?P<id>\d+):\s+(?P<statistic>[\w\_]+):\s+(?P<value>[\d]+)$")
+        p2 = regex_engine.compile(r"^(?P<id>\d+):\s+(?P<statistic>[\w\_]+):\s+(?P<value>[\d]+)$")
 
         ret_dict = {}
         for line in output.splitlines():
@@ -8116,7 +8116,7 @@ class ShowPlatformSoftwareFedActiveDropPacketCaptureStatistics(
         # 225   EXACT_METER_PACKET_GOT_DROPPED_DUE_TO_EXACT_METER                          1659               0
         # 226   STATISTICAL_METER_PACKET_GOT_DROPPED_DUE_TO_STATISTICAL_METER               0                 0
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<trap_id>[\d]+)+\s+(?P<trap_name>[\w\_]+)+\s+(?P<dropped_pkts>[\d]+)+\s+(?P<rate>[\d]+)$"
         )
 
@@ -8175,7 +8175,7 @@ class ShowPlatformSoftwareFedActiveDropPacketCaptureInterfacesStats(
         # --------------------------------------------------------------------------
         # HundredGigE1/0/3                       0x4CD                 504
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<interface>[\w\/]+)+\s+(?P<if_id>[\w]+)+\s+(?P<dropped_pkts>[\d]+)$"
         )
 
@@ -8216,7 +8216,7 @@ class ShowPlatformSoftwareFedIfm(ShowPlatformSoftwareFedIfmSchema):
             output = self.device.execute(cmd)
         parsed_dict = {}
         # Tunnel1 0x0000005d READY
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<interface>(^[a-zA-Z]+[0-9]+)) +(?P<if_id>\w+) +(?P<state>[\w\s]+)$"
         )
         for line in output.splitlines():
@@ -8286,7 +8286,7 @@ class ShowPlatformIfmMapping(ShowPlatformIfmMappingSchema):
             output = self.device.execute(cmd)
 
         # HundredGigE2/0/1          0x3      0   0    5      1    0      0     1    0            1            0    1    769  NIF    Y
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<interface>\S+)\s+(?P<if_id>\S+)\s+(?P<inst>\d+)\s+(?P<asic>\d+)\s+(?P<core>\d+)\s+(?P<ifg_id>\d+)?\s+(?P<port>\d+)\s+(?P<subport>\d+)\s+(?P<mac>\d+)\s+(?P<first_serdes>\d+)?\s+(?P<last_serdes>\d+)?\s+(?P<cntx>\d+)\s+(?P<lpn>\d+)\s+(?P<gpn>\d+)\s+(?P<type>\w+)\s+(?P<active>\w+)\s*$"
         )
 
@@ -8436,301 +8436,301 @@ class ShSoftwareFed(ShSoftwareFedSchema):
             out = self.device.execute(cmd)
 
         # Interface IF_ID : 0x0000000000000561
-        p1 = re.compile(r"^Interface\s+IF_ID\s+:\s+(?P<intf_id>\S+)$")
+        p1 = regex_engine.compile(r"^Interface\s+IF_ID\s+:\s+(?P<intf_id>\S+)$")
 
         # Interface Name : HundredGigE1/6/0/19
-        p2 = re.compile(r"^Interface\s+Name\s+:\s+(?P<intf_name>\S+)$")
+        p2 = regex_engine.compile(r"^Interface\s+Name\s+:\s+(?P<intf_name>\S+)$")
 
         # Interface Block Pointer : 0x7feaa50bbc28
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Interface\s+Block\s+Pointer\s+:\s+(?P<intf_block_pointer>\S+)$"
         )
 
         # Interface Block State : Ready
-        p4 = re.compile(r"^Interface\s+Block\s+State\s+:\s+(?P<intf_block_state>\w+)$")
+        p4 = regex_engine.compile(r"^Interface\s+Block\s+State\s+:\s+(?P<intf_block_state>\w+)$")
 
         # Interface State : Enabled
-        p5 = re.compile(r"^Interface\s+State\s+:\s+(?P<intf_state>\w+)$")
+        p5 = regex_engine.compile(r"^Interface\s+State\s+:\s+(?P<intf_state>\w+)$")
 
         # Interface Admin mode : Admin Up
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Interface\s+Admin\s+mode\s+:\s+(?P<intf_admin_mode>\S+\s+\S+)$"
         )
 
         # Interface Status : NPD
-        p7 = re.compile(r"^Interface\s+Status\s+:\s+(?P<intf_status>\w.+)$")
+        p7 = regex_engine.compile(r"^Interface\s+Status\s+:\s+(?P<intf_status>\w.+)$")
 
         # Interface Ref-Cnt : 1
-        p8 = re.compile(r"^Interface\s+Ref-Cnt\s+:\s+(?P<int_ref_cnt>\d+)$")
+        p8 = regex_engine.compile(r"^Interface\s+Ref-Cnt\s+:\s+(?P<int_ref_cnt>\d+)$")
 
         # Interface Type : ETHER
-        p9 = re.compile(r"^Interface\s+Type\s+:\s+(?P<intf_type>\w+)$")
+        p9 = regex_engine.compile(r"^Interface\s+Type\s+:\s+(?P<intf_type>\w+)$")
 
         # Port Type : ROUTE PORT
-        p9_1 = re.compile(r"^\s+Port\s+Type\s+:\s+(?P<port_type>\S+\s+\S+)$")
+        p9_1 = regex_engine.compile(r"^\s+Port\s+Type\s+:\s+(?P<port_type>\S+\s+\S+)$")
 
         # Port Location : LOCAL
-        p9_2 = re.compile(r"^\s+Port\s+Location\s+:\s+(?P<port_location>\w+)$")
+        p9_2 = regex_engine.compile(r"^\s+Port\s+Location\s+:\s+(?P<port_location>\w+)$")
 
         # Slot : 13
-        p9_3 = re.compile(r"^\s+Slot\s+:\s+(?P<slot>\d+)$")
+        p9_3 = regex_engine.compile(r"^\s+Slot\s+:\s+(?P<slot>\d+)$")
 
         # Unit : 0
-        p9_4 = re.compile(r"^\s+Unit\s+:\s+(?P<unit>\d+)$")
+        p9_4 = regex_engine.compile(r"^\s+Unit\s+:\s+(?P<unit>\d+)$")
 
         # Slot Unit : 19
-        p9_5 = re.compile(r"^\s+Slot\s+Unit\s+:\s+(?P<slot_unit>\d+)$")
+        p9_5 = regex_engine.compile(r"^\s+Slot\s+Unit\s+:\s+(?P<slot_unit>\d+)$")
 
         # SNMP IF Index : 119
-        p9_6 = re.compile(r"^\s+SNMP\s+IF\s+Index\s+:\s+(?P<snmp_index>\d+)$")
+        p9_6 = regex_engine.compile(r"^\s+SNMP\s+IF\s+Index\s+:\s+(?P<snmp_index>\d+)$")
 
         # GPN : 979
-        p9_7 = re.compile(r"^\s+GPN\s+:\s+(?P<gpn>\d+)$")
+        p9_7 = regex_engine.compile(r"^\s+GPN\s+:\s+(?P<gpn>\d+)$")
 
         # EC Channel : 0
-        p9_8 = re.compile(r"^\s+EC\s+Channel\s+:\s+(?P<ec_channel>\d+)$")
+        p9_8 = regex_engine.compile(r"^\s+EC\s+Channel\s+:\s+(?P<ec_channel>\d+)$")
 
         # EC Index : 0
-        p9_9 = re.compile(r"^\s+EC\s+Index\s+:\s+(?P<ec_index>\d+)$")
+        p9_9 = regex_engine.compile(r"^\s+EC\s+Index\s+:\s+(?P<ec_index>\d+)$")
 
         # IPv4 MTU : 2000
-        p9_10 = re.compile(r"^\s+IPv4\s+MTU\s+:\s+(?P<ipv4_mtu>\d+)$")
+        p9_10 = regex_engine.compile(r"^\s+IPv4\s+MTU\s+:\s+(?P<ipv4_mtu>\d+)$")
 
         # IPv6 MTU : 0
-        p9_11 = re.compile(r"^\s+IPv6\s+MTU\s+:\s+(?P<ipv6_mtu>\d+)$")
+        p9_11 = regex_engine.compile(r"^\s+IPv6\s+MTU\s+:\s+(?P<ipv6_mtu>\d+)$")
 
         # IPv4 VRF ID : 0
-        p9_12 = re.compile(r"^\s+IPv4\s+VRF\s+ID\s+:\s+(?P<ipv4_vrf_id>\d+)$")
+        p9_12 = regex_engine.compile(r"^\s+IPv4\s+VRF\s+ID\s+:\s+(?P<ipv4_vrf_id>\d+)$")
 
         # IPv6 VRF ID : 65535
-        p9_13 = re.compile(r"^\s+IPv6\s+VRF\s+ID\s+:\s+(?P<ipv6_vrf_id>\d+)$")
+        p9_13 = regex_engine.compile(r"^\s+IPv6\s+VRF\s+ID\s+:\s+(?P<ipv6_vrf_id>\d+)$")
 
         # Protocol flags : 0x0003 [ ipv4 ipv6 ]
-        p9_14 = re.compile(
+        p9_14 = regex_engine.compile(
             r"^\s+Protocol\s+flags\s+:\s+(?P<protocol_flags>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$"
         )
 
         # Misc flags : 0x0041 [ ipv4 --- ]
-        p9_15 = re.compile(
+        p9_15 = regex_engine.compile(
             r"^\s+Misc\s+flags\s+:\s+(?P<misc_flags>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$"
         )
 
         # ICMPv4 flags : 0x03 [ unreachable redirect ]
-        p9_16 = re.compile(
+        p9_16 = regex_engine.compile(
             r"^\s+ICMPv4\s+flags\s+:\s+(?P<icmpv4_flags>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$"
         )
 
         # ICMPv6 flags : 0x03 [ unreachable redirect ]
-        p9_17 = re.compile(
+        p9_17 = regex_engine.compile(
             r"^\s+ICMPv6\s+flags\s+:\s+(?P<icmpv6_flags>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$"
         )
 
         # Mac Address : 6c:b2:ae:4a:54:c5
-        p9_18 = re.compile(r"^\s+Mac\s+Address\s+:\s+(?P<mac_address>\S+)$")
+        p9_18 = regex_engine.compile(r"^\s+Mac\s+Address\s+:\s+(?P<mac_address>\S+)$")
 
         # QoS Trust Type : 3 (DSCP)
-        p9_19 = re.compile(
+        p9_19 = regex_engine.compile(
             r"^\s+QoS\s+Trust\s+Type\s+:\s+(?P<qos_trust_type>\S+\s+\S+)$"
         )
 
         # Ref Count : 1 (feature Ref Counts + 1)
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^Ref\s+Count\s+:\s+(?P<ref_count>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$"
         )
 
         # Affinity .......... [local]
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^\s+Affinity\s+\.\.\.\.\.\.\.\.\.\.\s+\[(?P<affinity>\w+)\]$"
         )
 
         # LPN ............... [19]
-        p11_1 = re.compile(
+        p11_1 = regex_engine.compile(
             r"^\s+LPN\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<lpn>\d+)\]$"
         )
 
         # GPN ............... [979]
-        p11_2 = re.compile(
+        p11_2 = regex_engine.compile(
             r"^\s+GPN\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<gpn>\d+)\]$"
         )
 
         # Speed ............. [40GB]
-        p11_3 = re.compile(
+        p11_3 = regex_engine.compile(
             r"^\s+Speed\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<speed>\S+)\]$"
         )
 
         # type .............. [IFM_PORT_TYPE_L3]
-        p11_4 = re.compile(
+        p11_4 = regex_engine.compile(
             r"^\s+type\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<type>\S+)\]$"
         )
 
         # MTU ............... [2022]
-        p11_5 = re.compile(
+        p11_5 = regex_engine.compile(
             r"^\s+MTU\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<mtu>\d+)\]$"
         )
 
         # ac profile ........ [IFM_AC_PROFILE_DEFAULT]
-        p11_6 = re.compile(
+        p11_6 = regex_engine.compile(
             r"^\s+ac\s+profile\s+\.\.\.\.\.\.\.\.\s+\[(?P<ac_profile>\S+)\]$"
         )
 
         # Mac port oid................... [4444]
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^\s+Mac\s+port\s+oid\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<mac_port_oid>\d+)\]$"
         )
 
         # System port oid................ [4448]
-        p12_1 = re.compile(
+        p12_1 = regex_engine.compile(
             r"^\s+System\s+port\s+oid\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<system_port_oid>\d+)\]$"
         )
 
         # System port gid................ [223]
-        p12_2 = re.compile(
+        p12_2 = regex_engine.compile(
             r"^\s+System\s+port\s+gid\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<system_port_gid>\d+)\]$"
         )
 
         # Ethernet port oid.............. [4459]
-        p12_3 = re.compile(
+        p12_3 = regex_engine.compile(
             r"^\s+Ethernet\s+port\s+oid\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<ethernet_port_oid>\d+)\]$"
         )
 
         # Voq oid........................ [4446]
-        p12_4 = re.compile(
+        p12_4 = regex_engine.compile(
             r"^\s+Voq\s+oid\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<vog_oid>\d+)\]$"
         )
 
         # Asic.............. [0]
-        p13 = re.compile(r"^\s+Asic\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<asic>\d+)\]$")
+        p13 = regex_engine.compile(r"^\s+Asic\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<asic>\d+)\]$")
 
         # Core.............. [5]
-        p13_1 = re.compile(r"^\s+Core\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<core>\d+)\]$")
+        p13_1 = regex_engine.compile(r"^\s+Core\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<core>\d+)\]$")
 
         # Asic Port......... [0]
-        p13_2 = re.compile(
+        p13_2 = regex_engine.compile(
             r"^\s+Asic\s+Port\.\.\.\.\.\.\.\.\.\s+\[(?P<asic_port>\d+)\]$"
         )
 
         # Asic Sub Port..... [65535]
-        p13_3 = re.compile(
+        p13_3 = regex_engine.compile(
             r"^\s+Asic\s+Sub\s+Port\.\.\.\.\.\s+\[(?P<asic_sub_port>\d+)\]$"
         )
 
         # Ifg Id............ [0]
-        p13_4 = re.compile(
+        p13_4 = regex_engine.compile(
             r"^\s+Ifg\s+Id\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<ifg_id>\d+)\]$"
         )
 
         # Mac Num........... [211]
-        p13_5 = re.compile(
+        p13_5 = regex_engine.compile(
             r"^\s+Mac\s+Num\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<mac_num>\d+)\]$"
         )
 
         # First Serdes...... [10]
-        p13_6 = re.compile(
+        p13_6 = regex_engine.compile(
             r"^\s+First\s+Serdes\.\.\.\.\.\.\s+\[(?P<first_serdes>\d+)\]$"
         )
 
         # Last Serdes....... [11]
-        p13_7 = re.compile(
+        p13_7 = regex_engine.compile(
             r"^\s+Last\s+Serdes\.\.\.\.\.\.\.\s+\[(?P<last_serdes>\d+)\]$"
         )
 
         # FC Mode........... [0]
-        p13_8 = re.compile(
+        p13_8 = regex_engine.compile(
             r"^\s+FC\s+Mode\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<fc_mode>\d+)\]$"
         )
 
         # FEC Mode.......... [0]
-        p13_9 = re.compile(
+        p13_9 = regex_engine.compile(
             r"^\s+FEC\s+Mode\.\.\.\.\.\.\.\.\.\.\s+\[(?P<fec_mode>\d+)\]$"
         )
 
         # Context Id........ [0]
-        p13_10 = re.compile(
+        p13_10 = regex_engine.compile(
             r"^\s+Context\s+Id\.\.\.\.\.\.\.\.\s+\[(?P<context_id>\d+)\]$"
         )
 
         # L2 Port Mode ................ [port_mode_dynamic]
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^\s+L2\s+Port\s+Mode\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<port_mode>\S+)\]$"
         )
 
         # L2 Port Mode set............. [No]
-        p14_1 = re.compile(
+        p14_1 = regex_engine.compile(
             r"^\s+L2\s+Port\s+Mode\s+set\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<port_mode_set>\w+)\]$"
         )
 
         # Default vlan ................ [0]
-        p14_2 = re.compile(
+        p14_2 = regex_engine.compile(
             r"^\s+Default\s+vlan\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<vlan>\d+)\]$"
         )
 
         # Ethertype.................... [8100]
-        p14_3 = re.compile(
+        p14_3 = regex_engine.compile(
             r"^\s+Ethertype\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<ethertype>\d+)\]$"
         )
 
         # untagged port bd vlan ....... [0]
-        p14_4 = re.compile(
+        p14_4 = regex_engine.compile(
             r"^\s+untagged\s+port\s+bd\s+vlan\s+\.\.\.\.\.\.\.\s+\[(?P<bd_vlan>\d+)\]$"
         )
 
         # status....................... [0]
-        p14_5 = re.compile(
+        p14_5 = regex_engine.compile(
             r"^\s+status\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<status>\d+)\]$"
         )
 
         # ac profile .................. [IFM_AC_PROFILE_DEFAULT]
-        p14_6 = re.compile(
+        p14_6 = regex_engine.compile(
             r"^\s+ac\s+profile\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<ac_profile>\S+)\]$"
         )
 
         # VRF ID .................. [0]
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^\s+VRF\s+ID\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<vrf_id>\d+)\]$"
         )
 
         # IPv4 Routing Enabled .... [Yes]
-        p15_1 = re.compile(
+        p15_1 = regex_engine.compile(
             r"^\s+IPv4\s+Routing\s+Enabled\s+\.\.\.\.\s+\[(?P<ipv4_routing>\w+)\]$"
         )
 
         # IPv6 Routing Enabled .... [No]
-        p15_2 = re.compile(
+        p15_2 = regex_engine.compile(
             r"^\s+IPv6\s+Routing\s+Enabled\s+\.\.\.\.\s+\[(?P<ipv6_routing>\w+)\]$"
         )
 
         # MPLS Enabled ............ [No]
-        p15_3 = re.compile(
+        p15_3 = regex_engine.compile(
             r"^\s+MPLS\s+Enabled\s+\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<mpls>\w+)\]$"
         )
 
         # Pimv4 Enabled ........... [No]
-        p15_4 = re.compile(
+        p15_4 = regex_engine.compile(
             r"^\s+Pimv4\s+Enabled\s+\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<pimv4>\w+)\]$"
         )
 
         # Pimv6 Enabled ........... [No]
-        p15_5 = re.compile(
+        p15_5 = regex_engine.compile(
             r"^\s+Pimv6\s+Enabled\s+\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<pimv6>\w+)\]$"
         )
 
         # IPv4 MTU ................ [2018]
-        p15_6 = re.compile(
+        p15_6 = regex_engine.compile(
             r"^\s+IPv4\s+MTU\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<ipv4_mtu>\d+)\]$"
         )
 
         # IPv6 MTU ................ [18]
-        p15_7 = re.compile(
+        p15_7 = regex_engine.compile(
             r"^\s+IPv6\s+MTU\s+\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\.\s+\[(?P<ipv6_mtu>\d+)\]$"
         )
 
         # L3 srv port gid ......... [4312]
-        p15_8 = re.compile(
+        p15_8 = regex_engine.compile(
             r"^\s+L3\s+srv\s+port\s+gid\s+\.\.\.\.\.\.\.\.\.\s+\[(?P<l3_srv>\d+)\]$"
         )
 
         # L3 srv port oid ......... [5489]
-        p15_9 = re.compile(
+        p15_9 = regex_engine.compile(
             r"^\s+L3\s+srv\s+port\s+oid\s+\.\.\.\.\.\.\.\.\.\s+\[(?P<l3_srv_oid>\d+)\]$"
         )
 
@@ -9387,7 +9387,7 @@ class ShPlatformSoftwareFedActiveVpSummaryInterfaceIf_id(
             output = self.device.execute(cmd)
 
         #              102           80        trunk            1  forwarding          No                Yes
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"(?P<if_id>\d+)\s+(?P<vlan_id>\d+)\s+(?P<pvln_mode>\w+)\s+(?P<pvlan>\d+)\s+(?P<stp_state>\w+)\s+(?P<vtp_pruned>\w+)\s+(?P<untag>\w+)$"
         )
 
@@ -9485,7 +9485,7 @@ class ShowPlatformFedSwitchActiveFnfRecordCountAsicNum(
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r"^(?P<pattern>[\w\s]+)= +(?P<value>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<pattern>[\w\s]+)= +(?P<value>\d+)$")
 
         # Current flow count               = 0
         # Total flows learned              = 0
@@ -9565,7 +9565,7 @@ class ShowPlatformSoftwareFedActiveFnfRecordCountAsicNum(ShowPlatformSoftwareFed
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<pattern>[\S ]+)= +(?P<value>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<pattern>[\S ]+)= +(?P<value>\d+)$')
 
         # Current flow count               = 0
         # Total flows learned              = 0
@@ -9629,7 +9629,7 @@ class ShowPlatformSoftwareFedSwitchActiveipecrexactroutesourceipdestinationip(Sh
 
         ret_dict = {}
         #Dest Port:GigabitEthernet2/0/1
-        p1 = re.compile(r'^Dest Port:(?P<destport>.*)$')
+        p1 = regex_engine.compile(r'^Dest Port:(?P<destport>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -9719,105 +9719,105 @@ class ShowPlatformSoftwareFedIgmpSnoopingVlanDetail(ShowPlatformSoftwareFedIgmpS
         # IGMPSN Enabled : On
 
         # Vlan 20
-        p0 = re.compile(r"^Vlan\:?\s+(?P<vlan>\d+)$")
+        p0 = regex_engine.compile(r"^Vlan\:?\s+(?P<vlan>\d+)$")
 
         # (ipv4, vlan: 3000)
-        p0_1 = re.compile(r'^\(+(?P<protocol>\S+)+\,+\s+vlan\:\s+(?P<vlan>\d+)+\)$')
+        p0_1 = regex_engine.compile(r'^\(+(?P<protocol>\S+)+\,+\s+vlan\:\s+(?P<vlan>\d+)+\)$')
 
         # IGMPSN Enabled : On
-        p1 = re.compile(r"^IGMPSN\s+Enabled\s+:\s+(?P<igmp_en>[\s\w\s]+)$")
+        p1 = regex_engine.compile(r"^IGMPSN\s+Enabled\s+:\s+(?P<igmp_en>[\s\w\s]+)$")
 
         # Snoop State     : ON
-        p1_1 = re.compile(r"^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$")
+        p1_1 = regex_engine.compile(r"^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$")
 
         # Snoop State     : ON
-        p1_1 = re.compile(r"^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$")
+        p1_1 = regex_engine.compile(r"^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$")
 
         # PIMSN Enabled : Off
-        p2 = re.compile(r"^PIMSN\s+Enabled\s+:\s+(?P<pimsn_en>[\s\w\s]+)$")
+        p2 = regex_engine.compile(r"^PIMSN\s+Enabled\s+:\s+(?P<pimsn_en>[\s\w\s]+)$")
 
         # Flood Mode : Off
-        p3 = re.compile(r"^Flood\s+Mode\s+:\s+(?P<flood_md>[\s\w\s]+)$")
+        p3 = regex_engine.compile(r"^Flood\s+Mode\s+:\s+(?P<flood_md>[\s\w\s]+)$")
 
         # Oper State : Up
-        p4 = re.compile(r"^Oper\s+State\s+:\s+(?P<op_state>[\s\w\s]+)$")
+        p4 = regex_engine.compile(r"^Oper\s+State\s+:\s+(?P<op_state>[\s\w\s]+)$")
 
         # STP TCN Flood : Off
         # STP TCN State : Off
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^STP\s+TCN\s+(Flood|State)\s+:\s+(?P<stp_tcn_flood>[\s\w\s]+)$"
         )
         # STP TCN State : Off
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^STP\s+TCN\s+(Flood|State)\s+:\s+(?P<stp_tcn_flood>[\s\w\s]+)$"
         )
 
         # Routing Enabled : On
-        p6 = re.compile(r"^Routing\s+Enabled\s+:\s+(?P<route_en>[\s\w\s]+)$")
+        p6 = regex_engine.compile(r"^Routing\s+Enabled\s+:\s+(?P<route_en>[\s\w\s]+)$")
 
         # PIM Enabled : On
-        p7 = re.compile(r"^PIM\s+Enabled\s+:\s+(?P<pim_en>[\s\w\s]+)$")
+        p7 = regex_engine.compile(r"^PIM\s+Enabled\s+:\s+(?P<pim_en>[\s\w\s]+)$")
 
         # Pim state               : ON
-        p7_1 = re.compile(r'^Pim\s+state\s+:\s+(?P<pim_en>[\s\w\s]+)$')
+        p7_1 = regex_engine.compile(r'^Pim\s+state\s+:\s+(?P<pim_en>[\s\w\s]+)$')
 
         # PVLAN : No
-        p8 = re.compile(r"^PVLAN\s+:\s+(?P<pvlan>[\s\w\s]+)$")
+        p8 = regex_engine.compile(r"^PVLAN\s+:\s+(?P<pvlan>[\s\w\s]+)$")
 
         # In Retry : 0x0
-        p9 = re.compile(r"^In\s+Retry\s+:\s+(?P<in_retry>[\s\w\s]+)$")
+        p9 = regex_engine.compile(r"^In\s+Retry\s+:\s+(?P<in_retry>[\s\w\s]+)$")
 
         # CCK Epoch : 0x17
-        p10 = re.compile(r"^CCK\s+Epoch\s+:\s+(?P<cck_ep>[\s\w\s]+)$")
+        p10 = regex_engine.compile(r"^CCK\s+Epoch\s+:\s+(?P<cck_ep>[\s\w\s]+)$")
 
         # IOSD Flood Mode : Off
-        p11 = re.compile(r"^IOSD\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$")
+        p11 = regex_engine.compile(r"^IOSD\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$")
 
         # IOS Flood Mode          : OFF
-        p11_1 = re.compile(r'^IOS\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$')
+        p11_1 = regex_engine.compile(r'^IOS\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$')
 
         # EVPN Proxy Enabled : On
-        p12 = re.compile(r"^EVPN\s+Proxy\s+Enabled\s+:\s+(?P<evpn_en>[\s\w\s]+)$")
+        p12 = regex_engine.compile(r"^EVPN\s+Proxy\s+Enabled\s+:\s+(?P<evpn_en>[\s\w\s]+)$")
 
         # Evpn Proxy              : OFF
-        p12_1 = re.compile(r'^Evpn\s+Proxy\s+:\s+(?P<evpn_en>[\s\w\s]+)$')
+        p12_1 = regex_engine.compile(r'^Evpn\s+Proxy\s+:\s+(?P<evpn_en>[\s\w\s]+)$')
 
         # L3mcast Adj :
-        p13 = re.compile(r"^L3mcast\s+Adj\s+:(?P<l3m_adj>.*)$")
+        p13 = regex_engine.compile(r"^L3mcast\s+Adj\s+:(?P<l3m_adj>.*)$")
 
         # Mrouter PortQ :
-        p14 = re.compile(r"^Mrouter\s+[P|p]ort[Q|s]\s+:\s*")
+        p14 = regex_engine.compile(r"^Mrouter\s+[P|p]ort[Q|s]\s+:\s*")
         # nve1.VNI60020(0x200000071)
-        p14_1 = re.compile(r"([A-Za-z]*\d[-().]*){10,}")
+        p14_1 = regex_engine.compile(r"([A-Za-z]*\d[-().]*){10,}")
 
         # port:Port-channel10 (ec_member:HundredGigE1/0/5) (group_oif:0) (mrouter_flag:1)
         # port:Port-channel10 (ec_member:HundredGigE1/0/5) (group_oif:0) (mrouter_flag:1)
         # port:Port-channel100 (ec_member:HundredGigE2/5/0/2)
         # port:Port-channel0 (ec_member:HundredGigE1/0/5) (group_oif:0)
         # port:Port-channel77
-        p14_2 = re.compile(r"^port:(?P<port>[\w\-\.]+)(\s+(?P<left>.*))?$")
+        p14_2 = regex_engine.compile(r"^port:(?P<port>[\w\-\.]+)(\s+(?P<left>.*))?$")
         # port:Port-channel0 (ec_member:HundredGigE1/0/5) (group_oif:0)
         # port:Port-channel77
-        p14_2 = re.compile(r"^port:(?P<port>[\w\-\.]+)(\s+(?P<left>.*))?$")
+        p14_2 = regex_engine.compile(r"^port:(?P<port>[\w\-\.]+)(\s+(?P<left>.*))?$")
 
         # Flood PortQ :
-        p15 = re.compile(r"^Flood [P|p]ort[Q|s]\s+:\s*")
+        p15 = regex_engine.compile(r"^Flood [P|p]ort[Q|s]\s+:\s*")
         # TenGigabitEthernet7/0/13
         # FiveGigabitEthernet1/0/2
         # GigabitEthernet2/0/31
-        p15_1 = re.compile(r"^[A-Za-z-]+[\d\/\.]+$")
+        p15_1 = regex_engine.compile(r"^[A-Za-z-]+[\d\/\.]+$")
 
         # REP RI handle : 0x0
-        p16 = re.compile(r"^REP\s+RI\s+handle\s+:\s+(?P<rep_han>[\s\w\s]+)$")
+        p16 = regex_engine.compile(r"^REP\s+RI\s+handle\s+:\s+(?P<rep_han>[\s\w\s]+)$")
 
         # Secondary Vlan          : NO
-        p17 = re.compile(r'^Secondary\s+Vlan\s+:\s+(?P<secondary_vlan>[\s\w\s]+)$')
+        p17 = regex_engine.compile(r'^Secondary\s+Vlan\s+:\s+(?P<secondary_vlan>[\s\w\s]+)$')
 
         # Vlan Urid               : 0x5000000000000008
-        p18 = re.compile(r'^Vlan\s+Urid\s+:\s+(?P<vlan_urid>[\s\w\s]+)$')
+        p18 = regex_engine.compile(r'^Vlan\s+Urid\s+:\s+(?P<vlan_urid>[\s\w\s]+)$')
 
         # Dependant users count   : 0
-        p19 = re.compile(r'^Dependant\s+users\s+count\s+:\s+(?P<d_users_count>[\s\w\s]+)$')
+        p19 = regex_engine.compile(r'^Dependant\s+users\s+count\s+:\s+(?P<d_users_count>[\s\w\s]+)$')
 
         port_list = None
         mroute_list = []
@@ -10027,7 +10027,7 @@ class ShowPlatformSoftwareFedSwitchActiveInjectBrief(
         # 5      QFP <->RP keepalive             416                  0
         # 12     ARP request or response         3                    0
         # 25     Layer2 frame to BD              219930               0
-        p0 = re.compile(r"^(?P<cause>\d+)\s+(?P<cause_info>[\w \/ \< \- \>]+)\s+(?P<rcvd>\d+)\s+(?P<dropped>\d+)$")
+        p0 = regex_engine.compile(r"^(?P<cause>\d+)\s+(?P<cause_info>[\w \/ \< \- \>]+)\s+(?P<rcvd>\d+)\s+(?P<dropped>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -10135,64 +10135,64 @@ class ShowPlatformSoftwareFedSwitchActiveIfmInterfacesInternal(ShowPlatformSoftw
         bootup_dict = None
 
         # Interface IF_ID         : 0x0015000000000001
-        p1 = re.compile(r'^Interface IF_ID\s+:\s+(?P<if_id>.+)$')
+        p1 = regex_engine.compile(r'^Interface IF_ID\s+:\s+(?P<if_id>.+)$')
 
         # Interface Name          : Puntport/0
-        p2 = re.compile(r'^Interface Name\s+:\s+(?P<interface_name>.+)$')
+        p2 = regex_engine.compile(r'^Interface Name\s+:\s+(?P<interface_name>.+)$')
 
         # Interface Block Pointer : 0x7c74d4279228
-        p3 = re.compile(r'^Interface Block Pointer\s+:\s+(?P<interface_block_pointer>.+)$')
+        p3 = regex_engine.compile(r'^Interface Block Pointer\s+:\s+(?P<interface_block_pointer>.+)$')
 
         # Interface Block State   : Ready
-        p4 = re.compile(r'^Interface Block State\s+:\s+(?P<interface_block_state>.+)$')
+        p4 = regex_engine.compile(r'^Interface Block State\s+:\s+(?P<interface_block_state>.+)$')
 
         # Interface State         : Enabled
-        p5 = re.compile(r'^Interface State\s+:\s+(?P<interface_state>.+)$')
+        p5 = regex_engine.compile(r'^Interface State\s+:\s+(?P<interface_state>.+)$')
 
         # Interface Status        : ADD
-        p6 = re.compile(r'^Interface Status\s+:\s+(?P<interface_status>.+),$')
+        p6 = regex_engine.compile(r'^Interface Status\s+:\s+(?P<interface_status>.+),$')
 
         # Interface Ref-Cnt       : 1
-        p7 = re.compile(r'^Interface Ref-Cnt\s+:\s+(?P<interface_ref_cnt>\d+)$')
+        p7 = regex_engine.compile(r'^Interface Ref-Cnt\s+:\s+(?P<interface_ref_cnt>\d+)$')
 
         # Interface Type          : INTERNAL INTERFACE
-        p8 = re.compile(r'^Interface Type\s+:\s+(?P<interface_type>.+)$')
+        p8 = regex_engine.compile(r'^Interface Type\s+:\s+(?P<interface_type>.+)$')
 
         # Port Type         : EGRESS CPU
-        p9 = re.compile(r'^Port Type\s+:\s+(?P<port_type>.+)$')
+        p9 = regex_engine.compile(r'^Port Type\s+:\s+(?P<port_type>.+)$')
 
         # Port Location     : REMOTE
-        p10 = re.compile(r'^Port Location\s+:\s+(?P<port_location>.+)$')
+        p10 = regex_engine.compile(r'^Port Location\s+:\s+(?P<port_location>.+)$')
 
         # Slot              : 0
-        p11 = re.compile(r'^Slot\s+:\s+(?P<slot>\d+)$')
+        p11 = regex_engine.compile(r'^Slot\s+:\s+(?P<slot>\d+)$')
 
         #  Unit              : 0
-        p12 = re.compile(r'^Unit\s+:\s+(?P<unit>\d+)$')
+        p12 = regex_engine.compile(r'^Unit\s+:\s+(?P<unit>\d+)$')
 
         # Slot Unit         : 0
-        p13 = re.compile(r'^Slot Unit\s+:\s+(?P<slot_unit>\d+)$')
+        p13 = regex_engine.compile(r'^Slot Unit\s+:\s+(?P<slot_unit>\d+)$')
 
         # Num Queues        : 0
-        p14 = re.compile(r'^Num Queues\s+:\s+(?P<num_queues>\d+)$')
+        p14 = regex_engine.compile(r'^Num Queues\s+:\s+(?P<num_queues>\d+)$')
 
         # Ref Count : 1 (feature Ref Counts + 1)
-        p15 = re.compile(r'^Ref Count\s+:\s+(?P<ref_count>\d+)\s+\(feature Ref Counts \+ \d+\)$')
+        p15 = regex_engine.compile(r'^Ref Count\s+:\s+(?P<ref_count>\d+)\s+\(feature Ref Counts \+ \d+\)$')
 
         # No Feature Reference count Present
-        p16 = re.compile(r'^(?P<feature_reference_count>\w+)\s+Feature Reference count Present$')
+        p16 = regex_engine.compile(r'^(?P<feature_reference_count>\w+)\s+Feature Reference count Present$')
 
         # Port Physical Subblock
         # Port Subblock [0]
         # Platform Subblock
         #  Port CTS Subblock
-        p17 = re.compile(r'^(?P<SubblockName>.+) Subblock(\s+\[.+\])?$')
+        p17 = regex_engine.compile(r'^(?P<SubblockName>.+) Subblock(\s+\[.+\])?$')
 
         # Affinity .......... [local]
-        p18 = re.compile(r'^(?P<key>.+)\s+\.+\s+\[(?P<value>.+)\]$')
+        p18 = regex_engine.compile(r'^(?P<key>.+)\s+\.+\s+\[(?P<value>.+)\]$')
 
          # Mac port oid................... [0xe4(228)]
-        p19 = re.compile(r'^(?P<key>.+?)\s*\.+\s*\[(?P<value>[^\]]+)\]$')
+        p19 = regex_engine.compile(r'^(?P<key>.+?)\s*\.+\s*\[(?P<value>[^\]]+)\]$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -10390,31 +10390,31 @@ class ShowPlatformSoftwareFedSwitchActiveAclBindDbIfid(ShowPlatformSoftwareFedSw
         ret_dict = {}
 
         # Interface Name: Gi2/0/10
-        p1 = re.compile(r'^Interface Name: (?P<interface_name>\S+)$')
+        p1 = regex_engine.compile(r'^Interface Name: (?P<interface_name>\S+)$')
 
         # Direction: Ingress
-        p2 = re.compile(r'^Direction: (?P<direction>\S+)$')
+        p2 = regex_engine.compile(r'^Direction: (?P<direction>\S+)$')
 
         # Feature         : Pacl
-        p3 = re.compile(r'^Feature\s+: (?P<feature>\S+)$')
+        p3 = regex_engine.compile(r'^Feature\s+: (?P<feature>\S+)$')
 
         # Protocol        : MAC
-        p4 = re.compile(r'^Protocol\s+: (?P<protocol>\S+)$')
+        p4 = regex_engine.compile(r'^Protocol\s+: (?P<protocol>\S+)$')
 
         # CG ID           : 1
-        p5 = re.compile(r'^CG ID\s+: (?P<cg_id>\d+)$')
+        p5 = regex_engine.compile(r'^CG ID\s+: (?P<cg_id>\d+)$')
 
         # CG Name         : pacl_mac
-        p6 = re.compile(r'^CG Name\s+: (?P<cg_name>\S+)$')
+        p6 = regex_engine.compile(r'^CG Name\s+: (?P<cg_name>\S+)$')
 
         # Status          : Success
-        p7 = re.compile(r'^Status\s+: (?P<status>\S+)$')
+        p7 = regex_engine.compile(r'^Status\s+: (?P<status>\S+)$')
 
         # Src_og_lkup_hdl : 0
-        p8 = re.compile(r'^Src_og_lkup_hdl\s+: (?P<src_og_lkup_hdl>\d+)$')
+        p8 = regex_engine.compile(r'^Src_og_lkup_hdl\s+: (?P<src_og_lkup_hdl>\d+)$')
 
         # Dst_og_lkup_hdl : 0
-        p9 = re.compile(r'^Dst_og_lkup_hdl\s+: (?P<dst_og_lkup_hdl>\d+)$')
+        p9 = regex_engine.compile(r'^Dst_og_lkup_hdl\s+: (?P<dst_og_lkup_hdl>\d+)$')
 
         current_interface = None
         current_direction = None
@@ -10514,31 +10514,31 @@ class ShowPlatformSoftwareFedSwitchActiveSecurityFedArpIf(ShowPlatformSoftwareFe
         ret_dict = {}
 
         # FED ARP SNOOPING PORT Data :
-        p0 = re.compile(r'^\s*FED ARP SNOOPING PORT Data\s*:\s*$')
+        p0 = regex_engine.compile(r'^\s*FED ARP SNOOPING PORT Data\s*:\s*$')
 
         # if_id = 1180
-        p1 = re.compile(r'^\s*if_id\s+=\s+(?P<if_id>\d+)\s*$')
+        p1 = regex_engine.compile(r'^\s*if_id\s+=\s+(?P<if_id>\d+)\s*$')
 
         # if_name = GigabitEthernet3/0/10
-        p2 = re.compile(r'^\s*if_name\s+=\s+(?P<if_name>\S+)\s*$')
+        p2 = regex_engine.compile(r'^\s*if_name\s+=\s+(?P<if_name>\S+)\s*$')
 
         # ARP SNOOP enable: FALSE
-        p3 = re.compile(r'^\s*ARP SNOOP enable:\s+(?P<arp_snoop_enable>\S+)\s*$')
+        p3 = regex_engine.compile(r'^\s*ARP SNOOP enable:\s+(?P<arp_snoop_enable>\S+)\s*$')
 
         # Punject Port Profile: FALSE
-        p4 = re.compile(r'^\s*Punject Port Profile:\s+(?P<punject_port_profile>\S+)\s*$')
+        p4 = regex_engine.compile(r'^\s*Punject Port Profile:\s+(?P<punject_port_profile>\S+)\s*$')
 
         # EtherChannel member: FALSE
-        p5 = re.compile(r'^\s*EtherChannel member:\s+(?P<etherchannel_member>\S+)\s*$')
+        p5 = regex_engine.compile(r'^\s*EtherChannel member:\s+(?P<etherchannel_member>\S+)\s*$')
 
         # EtherChannel: FALSE
-        p6 = re.compile(r'^\s*EtherChannel:\s+(?P<etherchannel>\S+)\s*$')
+        p6 = regex_engine.compile(r'^\s*EtherChannel:\s+(?P<etherchannel>\S+)\s*$')
 
         # EtherChannel if_id = 0
-        p7 = re.compile(r'^\s*EtherChannel if_id\s+=\s+(?P<etherchannel_if_id>\d+)\s*$')
+        p7 = regex_engine.compile(r'^\s*EtherChannel if_id\s+=\s+(?P<etherchannel_if_id>\d+)\s*$')
 
         # ref_cnt = 0
-        p8 = re.compile(r'^\s*ref_cnt\s+=\s+(?P<ref_cnt>\d+)\s*$')
+        p8 = regex_engine.compile(r'^\s*ref_cnt\s+=\s+(?P<ref_cnt>\d+)\s*$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -10628,26 +10628,26 @@ class ShowPlatformSoftwareFedSwitchActiveSecurityFedArpVlan(ShowPlatformSoftware
         ret_dict = {}
 
         # FED ARP SNOOPING VLAN Data :
-        p0 = re.compile(r'^\s*FED ARP SNOOPING VLAN Data\s*:\s*$')
+        p0 = regex_engine.compile(r'^\s*FED ARP SNOOPING VLAN Data\s*:\s*$')
 
         # Vlan= 50
-        p1 = re.compile(r'^\s*Vlan=\s+(?P<vlan>\d+)\s*$')
+        p1 = regex_engine.compile(r'^\s*Vlan=\s+(?P<vlan>\d+)\s*$')
 
         # Punject Switch Profile: TRUE
-        p2 = re.compile(r'^\s*Punject Switch Profile:\s+(?P<punject_switch_profile>\S+)\s*$')
+        p2 = regex_engine.compile(r'^\s*Punject Switch Profile:\s+(?P<punject_switch_profile>\S+)\s*$')
 
         # ARP SNOOP enable: TRUE
-        p3 = re.compile(r'^\s*ARP SNOOP enable:\s+(?P<arp_snoop_enable>\S+)\s*$')
+        p3 = regex_engine.compile(r'^\s*ARP SNOOP enable:\s+(?P<arp_snoop_enable>\S+)\s*$')
 
         # Information about ACL with OID(552) on ASIC(0)
-        p4 = re.compile(r'^\s*Information about ACL with OID\((?P<oid>\d+)\) on ASIC\((?P<asic>\d+)\)\s*$')
+        p4 = regex_engine.compile(r'^\s*Information about ACL with OID\((?P<oid>\d+)\) on ASIC\((?P<asic>\d+)\)\s*$')
 
         # Position Action  Counter OID
 
         # ----------------------------
 
         # 0        PUNT    553
-        p5 = re.compile(r'^\s*(?P<position>\d+)\s+(?P<action>\w+)\s+(?P<counter_oid>\d+)\s*$')
+        p5 = regex_engine.compile(r'^\s*(?P<position>\d+)\s+(?P<action>\w+)\s+(?P<counter_oid>\d+)\s*$')
 
         # Parse each line of the output
         for line in output.splitlines():
@@ -10760,7 +10760,7 @@ class ShowPlatSoftFedSwAccessSecuritySecMacLrnTable(ShowPlatSoftFedSwAccessSecur
         parsed_data = {}
 
         # 1 Gi3/0/10     50         0000.0033.3333   0          12288      0     FWD_ALL_LRN_DATA   None               NONE         No     NONE     551        0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'(?P<se_no>\d+)\s+(?P<interface>\S+)\s+(?P<vlan>\d+)\s+(?P<mac>[0-9A-Fa-f.]+)\s+(?P<logical_id>\d+)\s+'
             r'(?P<position>\d+)\s+(?P<asic_number>\d+)\s+(?P<auth_act>\S+)\s+(?P<restore_auth_act>\S+)\s+(?P<flag>\S+)\s+'
             r'(?P<drop>\S+)\s+(?P<policy>\S+)\s+(?P<policy_oid>\S+)\s+(?P<packets>\d+)'
@@ -10870,61 +10870,61 @@ class ShowPlatformSoftwareFedSwitchActiveAclInfoSdkDetail(ShowPlatformSoftwareFe
         parsed_dict = {}
 
         # Class Group Name: V4SGACL;000
-        p1 = re.compile(r'^Class Group Name:\s+(?P<class_group_name>\S+)$')
+        p1 = regex_engine.compile(r'^Class Group Name:\s+(?P<class_group_name>\S+)$')
 
         # Direction: Egress
-        p2 = re.compile(r'^Direction:\s+(?P<direction>\S+)$')
+        p2 = regex_engine.compile(r'^Direction:\s+(?P<direction>\S+)$')
 
         # Feature         : Sgacl
-        p3 = re.compile(r'^Feature\s+:\s+(?P<feature>\S+)$')
+        p3 = regex_engine.compile(r'^Feature\s+:\s+(?P<feature>\S+)$')
 
         # Protocol        : IPv4
-        p4 = re.compile(r'^Protocol\s+:\s+(?P<protocol>\S+)$')
+        p4 = regex_engine.compile(r'^Protocol\s+:\s+(?P<protocol>\S+)$')
 
         # CG ID           : 273
-        p5 = re.compile(r'^CG ID\s+:\s+(?P<cg_id>\d+)$')
+        p5 = regex_engine.compile(r'^CG ID\s+:\s+(?P<cg_id>\d+)$')
 
         # Pol Hdl         : 0x5405cf68
-        p6 = re.compile(r'^Pol Hdl\s+:\s+(?P<pol_hdl>\S+)$')
+        p6 = regex_engine.compile(r'^Pol Hdl\s+:\s+(?P<pol_hdl>\S+)$')
 
         # ACL (OID: 0x81E, No of ACEs: 1)
-        p7 = re.compile(r'^ACL\s+\(OID:\s+(?P<oid>\S+),\s+No\s+of\s+ACEs:\s+(?P<no_of_ace>\d+)\)$')
+        p7 = regex_engine.compile(r'^ACL\s+\(OID:\s+(?P<oid>\S+),\s+No\s+of\s+ACEs:\s+(?P<no_of_ace>\d+)\)$')
 
         # IPV4 ACE Key/Mask
-        p8 = re.compile(r'^IPV4 ACE Key/Mask$')
+        p8 = regex_engine.compile(r'^IPV4 ACE Key/Mask$')
 
         # ipv4_src: value = 0.0.0.0       mask = 0.0.0.0
-        p9 = re.compile(r'^ipv4_src:\s+value\s+=\s+(?P<ipv4_src_value>\S+)\s+mask\s+=\s+(?P<ipv4_src_mask>\S+)$')
+        p9 = regex_engine.compile(r'^ipv4_src:\s+value\s+=\s+(?P<ipv4_src_value>\S+)\s+mask\s+=\s+(?P<ipv4_src_mask>\S+)$')
 
         # ipv4_dst: value = 0.0.0.0       mask = 0.0.0.0
-        p10 = re.compile(r'^ipv4_dst:\s+value\s+=\s+(?P<ipv4_dst_value>\S+)\s+mask\s+=\s+(?P<ipv4_dst_mask>\S+)$')
+        p10 = regex_engine.compile(r'^ipv4_dst:\s+value\s+=\s+(?P<ipv4_dst_value>\S+)\s+mask\s+=\s+(?P<ipv4_dst_mask>\S+)$')
 
         # IPV6 ACE Key/Mask
-        p8_1 = re.compile(r'^IPV6 ACE Key/Mask$')
+        p8_1 = regex_engine.compile(r'^IPV6 ACE Key/Mask$')
 
         # src_mac: value = 0x0.0x0.0x0.0x0.0x0.0x0
-        p9_1 = re.compile(r'^src_mac:\s+value\s+=\s+(?P<ipv6_src_mac_value>[\S]+)$')
+        p9_1 = regex_engine.compile(r'^src_mac:\s+value\s+=\s+(?P<ipv6_src_mac_value>[\S]+)$')
 
         # mask = 0x0.0x0.0x0.0x0.0x0.0x0
-        p9_1_1 = re.compile(r'^mask\s+=\s+(?P<ipv6_src_mac_mask>[\S]+)$')
+        p9_1_1 = regex_engine.compile(r'^mask\s+=\s+(?P<ipv6_src_mac_mask>[\S]+)$')
 
         # dst_mac: value = 0x0.0x0.0x0.0x0.0x0.0x0
-        p10_1 = re.compile(r'^dst_mac:\s+value\s+=\s+(?P<ipv6_dst_mac_value>[\S]+)$')
+        p10_1 = regex_engine.compile(r'^dst_mac:\s+value\s+=\s+(?P<ipv6_dst_mac_value>[\S]+)$')
 
         # mask = 0x0.0x0.0x0.0x0.0x0.0x0
-        p10_1_1 = re.compile(r'^mask\s+=\s+(?P<ipv6_dst_mac_mask>[\S]+)$')
+        p10_1_1 = regex_engine.compile(r'^mask\s+=\s+(?P<ipv6_dst_mac_mask>[\S]+)$')
 
         # V:  0x0       0x0      0x0         0x0       0x0           0x0          0x0
-        p11 = re.compile(r'^(?P<pro_type>[VM])\s*:\s+(?P<proto>\S+)\s+(?P<tos>\S+)\s+(?P<tcp_flg>\S+)\s+(?P<ttl>\S+)\s+(?P<ipv4_flags>\S+)\s+(?P<src_port>\S+)\s+(?P<dst_port>\S+)$')
+        p11 = regex_engine.compile(r'^(?P<pro_type>[VM])\s*:\s+(?P<proto>\S+)\s+(?P<tos>\S+)\s+(?P<tcp_flg>\S+)\s+(?P<ttl>\S+)\s+(?P<ipv4_flags>\S+)\s+(?P<src_port>\S+)\s+(?P<dst_port>\S+)$')
 
         # V:  0x0       0x0      0x0         0x0       0x0           0x0          0x0
-        p12 = re.compile(r'^(?P<pro_type>[VM])\s*:\s+(?P<ext_h>\S+)\s+(?P<tos>\S+)\s+(?P<tcp_flg>\S+)\s+(?P<ttl>\S+)\s+(?P<ipv4_flags>\S+)\s+(?P<src_port>\S+)\s+(?P<dst_port>\S+)$')
+        p12 = regex_engine.compile(r'^(?P<pro_type>[VM])\s*:\s+(?P<ext_h>\S+)\s+(?P<tos>\S+)\s+(?P<tcp_flg>\S+)\s+(?P<ttl>\S+)\s+(?P<ipv4_flags>\S+)\s+(?P<src_port>\S+)\s+(?P<dst_port>\S+)$')
 
         # Result Action
-        p13 = re.compile(r'^Result Action$')
+        p13 = regex_engine.compile(r'^Result Action$')
 
         # Punt : N    Drop : N    Mirror: N    Counter: 0x0 (0)
-        p14 = re.compile(r'^Punt\s*:\s*(?P<punt>\S+)\s+Drop\s*:\s*(?P<drop>\S+)\s+Mirror\s*:\s*(?P<mirror>\S+)\s+Counter:\s*(?P<counter>\S+)\s*\((?P<counter_value>\d+)\)$')
+        p14 = regex_engine.compile(r'^Punt\s*:\s*(?P<punt>\S+)\s+Drop\s*:\s*(?P<drop>\S+)\s+Mirror\s*:\s*(?P<mirror>\S+)\s+Counter:\s*(?P<counter>\S+)\s*\((?P<counter_value>\d+)\)$')
 
         current_protocol = None
         current_key_mask = None
@@ -11150,13 +11150,13 @@ class ShowPlatformsoftwareFedActiveXcvrLpnLinkstatus(
         ret_dict = {}
 
         # XCVR Link Status
-        p1 = re.compile(r'^XCVR +Link +Status +\:$')
+        p1 = regex_engine.compile(r'^XCVR +Link +Status +\:$')
 
         # link state: UP
-        p2 =  re.compile(r'^link +state\:(?P<link_state>.*)$')
+        p2 =  regex_engine.compile(r'^link +state\:(?P<link_state>.*)$')
 
         # Link Resets Count on port: 0
-        p3 = re.compile(r'^Link +Resets +Count +on +port\:\s*(?P<link_resets_count_on_port>\d+)$')
+        p3 = regex_engine.compile(r'^Link +Resets +Count +on +port\:\s*(?P<link_resets_count_on_port>\d+)$')
 
 
         for line in output.splitlines():
@@ -11210,7 +11210,7 @@ class ShowPlatformSoftwareFedSwitchActiveSecurityFedSisfStatistics(ShowPlatformS
 
         # Name                              OID       Packets Hits
         # DHCPV6 SERVER TO ANY on PORT      558       0
-        p1 = re.compile(r'^(?P<name>[\w\s]+?)\s+(?P<oid>\d+)\s+(?P<packets_hits>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<name>[\w\s]+?)\s+(?P<oid>\d+)\s+(?P<packets_hits>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -11263,31 +11263,31 @@ class ShowPlatformSoftwareFedActiveIpUrpf(ShowPlatformSoftwareFedActiveIpUrpfSch
             output = self.device.execute(cli)
 
         # Associated intfc name Vlan2
-        p1 = re.compile(r'^Associated intfc name (?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^Associated intfc name (?P<interface>\S+)$')
 
         # Vlan2: [0x4c1]
-        p1_1 = re.compile(r'^(?P<interface>\S+)\: \[(?P<interface_id>.+)\]$')
+        p1_1 = regex_engine.compile(r'^(?P<interface>\S+)\: \[(?P<interface_id>.+)\]$')
 
         # Associated intfc id 223
-        p1_2 = re.compile(r'^Associated intfc id (?P<interface_id>\d+)$')
+        p1_2 = regex_engine.compile(r'^Associated intfc id (?P<interface_id>\d+)$')
 
         # Allow Default: Yes
-        p2 = re.compile(r'^Allow.+Default\:\:* (?P<allow_default>\S+)$')
+        p2 = regex_engine.compile(r'^Allow.+Default\:\:* (?P<allow_default>\S+)$')
 
         # Flags:: 0x0
-        p3 = re.compile(r'^Flags\:\:\s*(?P<flags>.+)$')
+        p3 = regex_engine.compile(r'^Flags\:\:\s*(?P<flags>.+)$')
 
         # uRPF Mode: STRICT
-        p4 = re.compile(r'^uRPF Mode\:\s*(?P<urpf_mode>.+)$')
+        p4 = regex_engine.compile(r'^uRPF Mode\:\s*(?P<urpf_mode>.+)$')
 
         # Allow Self Ping: Yes
-        p5 = re.compile(r'^Allow Self Ping\:\s*(?P<allow_self_ping>.+)$')
+        p5 = regex_engine.compile(r'^Allow Self Ping\:\s*(?P<allow_self_ping>.+)$')
 
         # AF:: IPv4
-        p6 = re.compile(r'^AF\:\:\s*(?P<af>.+)$')
+        p6 = regex_engine.compile(r'^AF\:\:\s*(?P<af>.+)$')
 
         # ACL name:
-        p7 = re.compile(r'^ACL name\:\s*(?P<acl_name>.+)$')
+        p7 = regex_engine.compile(r'^ACL name\:\s*(?P<acl_name>.+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -11381,7 +11381,7 @@ class ShowPlatformSoftwareFedSwitchActiveifmMappingsgid(ShowPlatformSoftwareFedS
         # 122881      GigabitEthernet1/0/2              0x00000409          ETHER
         # 122882      GigabitEthernet1/0/3              0x0000040a          ETHER
 
-        p1 = re.compile(r"^(?P<gid>\d+)\s+(?P<interface>\S+)\s+(?P<if_id>\w+)\s+(?P<if_type>\w+)$")
+        p1 = regex_engine.compile(r"^(?P<gid>\d+)\s+(?P<interface>\S+)\s+(?P<if_id>\w+)\s+(?P<if_type>\w+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -11431,7 +11431,7 @@ class ShowPlatformSoftwareFedSwitchActiveCpuInterfaces(ShowPlatformSoftwareFedSw
         #  L2 Protocol                361037      0           0           0
         #  sw forwarding              113         0           0           0
 
-        p1 = re.compile(r"^(?P<queue>[A-Za-z0-9\- ]+?)\s+(?P<retrieved>\d+)\s+(?P<dropped>\d+)\s+(?P<invalid>\d+)\s+(?P<hol_block>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<queue>[A-Za-z0-9\- ]+?)\s+(?P<retrieved>\d+)\s+(?P<dropped>\d+)\s+(?P<invalid>\d+)\s+(?P<hol_block>\d+)$")
 
         for line in output.splitlines():
             line.strip()
@@ -11479,7 +11479,7 @@ class ShowPlatformSoftwareFedSwitchActiveIfmMappingsL3if_le(ShowPlatformSoftware
         
         # Regex pattern to match the output lines
         # 0x000077ba149b9748 Vlan1   0x000000fa   SVI_L3_LE
-        p1 = re.compile(r"^(?P<l3if_le>0x[0-9a-fA-F]+)\s+(?P<interface>\S+)\s+(?P<if_id>0x[0-9a-fA-F]+)\s+(?P<type>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<l3if_le>0x[0-9a-fA-F]+)\s+(?P<interface>\S+)\s+(?P<if_id>0x[0-9a-fA-F]+)\s+(?P<type>\S+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -11528,7 +11528,7 @@ class ShowPlatformSoftwareFedSwitchActiveIfmMappingsGpn(ShowPlatformSoftwareFedS
         #GPN         Interface                         IF_ID               IF_TYPE
         #1           FortyGigabitEthernet1/0/1         0x00000009          ETHER
 
-        p1 = re.compile(r"^(?P<gpn>\d+)\s+(?P<interface>\S+)\s+(?P<if_id>\S+)\s+(?P<if_type>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<gpn>\d+)\s+(?P<interface>\S+)\s+(?P<if_id>\S+)\s+(?P<if_type>\S+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -11638,49 +11638,49 @@ class ShowPlatformSoftwareFedSwitchActiveAclBindSdkDetail(ShowPlatformSoftwareFe
         current_key_mask = None
 
         # Interface Name: Gi2/0/31
-        p1 = re.compile(r'^Interface Name:\s+(?P<interface_name>\S+)$')
+        p1 = regex_engine.compile(r'^Interface Name:\s+(?P<interface_name>\S+)$')
 
         # Class Group Name: implicit_deny:xACSACLx-IP-PERMIT_ALL_IPV4_TRAFFIC-57f6b0d3:
-        p1_1 = re.compile(r'^Class Group Name:\s+(?P<class_group_name>[\S]+)$')
+        p1_1 = regex_engine.compile(r'^Class Group Name:\s+(?P<class_group_name>[\S]+)$')
 
         # Direction: Ingress
-        p2 = re.compile(r'^Direction:\s+(?P<direction>\S+)$')
+        p2 = regex_engine.compile(r'^Direction:\s+(?P<direction>\S+)$')
 
         # Feature         : Pacl
-        p3 = re.compile(r'^Feature\s+:\s+(?P<feature>\S+)$')
+        p3 = regex_engine.compile(r'^Feature\s+:\s+(?P<feature>\S+)$')
 
         # Protocol        : IPv4
-        p4 = re.compile(r'^Protocol\s+:\s+(?P<protocol>\S+)$')
+        p4 = regex_engine.compile(r'^Protocol\s+:\s+(?P<protocol>\S+)$')
 
         # CG ID           : 19
-        p5 = re.compile(r'^CG ID\s+:\s+(?P<cg_id>\d+)$')
+        p5 = regex_engine.compile(r'^CG ID\s+:\s+(?P<cg_id>\d+)$')
 
         # CG Name         : pre-auth
-        p6 = re.compile(r'^CG Name\s+:\s+(?P<cg_name>\S+)$')
+        p6 = regex_engine.compile(r'^CG Name\s+:\s+(?P<cg_name>\S+)$')
 
         # Pol Hdl         : 0x24073568
-        p6_1 = re.compile(r'^Pol Hdl\s+:\s+(?P<pol_hdl>\S+)$')
+        p6_1 = regex_engine.compile(r'^Pol Hdl\s+:\s+(?P<pol_hdl>\S+)$')
 
         # ACL (OID: 0xB17, No of ACEs: 12)
-        p7 = re.compile(r'^ACL\s+\(OID:\s+(?P<oid>\S+),\s+No\s+of\s+ACEs:\s+(?P<no_of_ace>\d+)\)$')
+        p7 = regex_engine.compile(r'^ACL\s+\(OID:\s+(?P<oid>\S+),\s+No\s+of\s+ACEs:\s+(?P<no_of_ace>\d+)\)$')
 
         # IPV4 ACE Key/Mask        
-        p8 = re.compile(r'^IPV4 ACE Key/Mask$')
+        p8 = regex_engine.compile(r'^IPV4 ACE Key/Mask$')
 
         # ipv4_src: value = 0.0.0.0       mask = 0.0.0.0
-        p9 = re.compile(r'ipv4_src:\s+value\s+=\s+(?P<ipv4_src_value>\S+)\s+mask\s+=\s+(?P<ipv4_src_mask>\S+)')
+        p9 = regex_engine.compile(r'ipv4_src:\s+value\s+=\s+(?P<ipv4_src_value>\S+)\s+mask\s+=\s+(?P<ipv4_src_mask>\S+)')
 
         # ipv4_dst: value = 0.0.0.0       mask = 0.0.0.0
-        p10 = re.compile(r'ipv4_dst:\s+value\s+=\s+(?P<ipv4_dst_value>\S+)\s+mask\s+=\s+(?P<ipv4_dst_mask>\S+)')
+        p10 = regex_engine.compile(r'ipv4_dst:\s+value\s+=\s+(?P<ipv4_dst_value>\S+)\s+mask\s+=\s+(?P<ipv4_dst_mask>\S+)')
 
         # V:  0x11       0x0      0x0         0x0       0x0           0x44          0x43
-        p11 = re.compile(r'^(?P<pro_type>[VM])\s*:\s+(?P<proto>\S+)\s+(?P<tos>\S+)\s+(?P<tcp_flg>\S+)\s+(?P<ttl>\S+)\s+(?P<ipv4_flags>\S+)\s+(?P<src_port>\S+)\s+(?P<dst_port>\S+)$')
+        p11 = regex_engine.compile(r'^(?P<pro_type>[VM])\s*:\s+(?P<proto>\S+)\s+(?P<tos>\S+)\s+(?P<tcp_flg>\S+)\s+(?P<ttl>\S+)\s+(?P<ipv4_flags>\S+)\s+(?P<src_port>\S+)\s+(?P<dst_port>\S+)$')
 
         # Result Action
-        p12 = re.compile(r'^Result Action$')
+        p12 = regex_engine.compile(r'^Result Action$')
 
         # Punt : N    Drop : N    Mirror: N    Counter: 0x0 (0)
-        p13 = re.compile(r'^Punt\s*:\s*(?P<punt>\S+)\s+Drop\s*:\s*(?P<drop>\S+)\s+Mirror\s*:\s*(?P<mirror>\S+)\s+Counter:\s*(?P<counter>\S+)\s*\((?P<counter_value>\d+)\)$')
+        p13 = regex_engine.compile(r'^Punt\s*:\s*(?P<punt>\S+)\s+Drop\s*:\s*(?P<drop>\S+)\s+Mirror\s*:\s*(?P<mirror>\S+)\s+Counter:\s*(?P<counter>\S+)\s*\((?P<counter_value>\d+)\)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -11852,31 +11852,31 @@ class ShowPlatformSoftwareFedSwitchActiveAclBindSdkfeatureCgaclDetail(ShowPlatfo
         ret_dict = {}          
 
         # Interface Name: Gi2/0/10 
-        p1 = re.compile(r'^Interface Name: (?P<interface_name>\S+)$')
+        p1 = regex_engine.compile(r'^Interface Name: (?P<interface_name>\S+)$')
 
         # Direction: Ingress
-        p2 = re.compile(r'^Direction: (?P<direction>\S+)$')
+        p2 = regex_engine.compile(r'^Direction: (?P<direction>\S+)$')
 
         # Feature         : Pacl
-        p3 = re.compile(r'^Feature\s+: (?P<feature>\S+)$')
+        p3 = regex_engine.compile(r'^Feature\s+: (?P<feature>\S+)$')
 
         # Protocol        : MAC
-        p4 = re.compile(r'^Protocol\s+: (?P<protocol>\S+)$')
+        p4 = regex_engine.compile(r'^Protocol\s+: (?P<protocol>\S+)$')
 
         # CG ID           : 1
-        p5 = re.compile(r'^CG ID\s+: (?P<cg_id>\d+)$')
+        p5 = regex_engine.compile(r'^CG ID\s+: (?P<cg_id>\d+)$')
 
         # CG Name         : pacl_mac
-        p6 = re.compile(r'^CG Name\s+: (?P<cg_name>\S+)$')
+        p6 = regex_engine.compile(r'^CG Name\s+: (?P<cg_name>\S+)$')
 
         # Status          : Success
-        p7 = re.compile(r'^Status\s+: (?P<status>\S+)$')
+        p7 = regex_engine.compile(r'^Status\s+: (?P<status>\S+)$')
 
         # Src_og_lkup_hdl : 0
-        p8 = re.compile(r'^Src_og_lkup_hdl\s+: (?P<src_og_lkup_hdl>\d+)$')
+        p8 = regex_engine.compile(r'^Src_og_lkup_hdl\s+: (?P<src_og_lkup_hdl>\d+)$')
 
         # Dst_og_lkup_hdl : 0
-        p9 = re.compile(r'^Dst_og_lkup_hdl\s+: (?P<dst_og_lkup_hdl>\d+)$')
+        p9 = regex_engine.compile(r'^Dst_og_lkup_hdl\s+: (?P<dst_og_lkup_hdl>\d+)$')
 
         current_interface = None
         current_direction = None
@@ -11983,7 +11983,7 @@ class ShowPlatformSoftwareFedSwitchActiveIfmMappings(ShowPlatformSoftwareFedSwit
         # 122881      GigabitEthernet1/0/2              0x00000409          ETHER
         # 122882      GigabitEthernet1/0/3              0x0000040a          ETHER
 
-        p1 = re.compile(r"^(?P<gid>\d+)\s+(?P<interface>\S+)\s+(?P<if_id>\w+)\s+(?P<if_type>\w+)$")
+        p1 = regex_engine.compile(r"^(?P<gid>\d+)\s+(?P<interface>\S+)\s+(?P<if_id>\w+)\s+(?P<if_type>\w+)$")
         for line in output.splitlines():
             line = line.strip()
 
@@ -12058,43 +12058,43 @@ class ShowPlatoformSoftwareFedSwitchActiveInsightNplTable(ShowPlatoformSoftwareF
         result_dict = {}
 
         # - # 1
-        p1 = re.compile(r'^- # (?P<entry_num>\d+)$')
+        p1 = regex_engine.compile(r'^- # (?P<entry_num>\d+)$')
 
         # get_field_by_name: =<bound method npl_dot1x_client_table_key_t.get_field_by_name
-        p22 = re.compile(r"get_field_by_name:\s*=\s*(?P<get_field_by_name>[\s\S]+?)(?=port:|mask:|key:|$)")
+        p22 = regex_engine.compile(r"get_field_by_name:\s*=\s*(?P<get_field_by_name>[\s\S]+?)(?=port:|mask:|key:|$)")
 
         # id: =0x38
-        p3 = re.compile(r"^id:\s*=\s*(?P<id>0x[0-9a-fA-F]+)$")
+        p3 = regex_engine.compile(r"^id:\s*=\s*(?P<id>0x[0-9a-fA-F]+)$")
 
         # smac: =0x222222
-        p4 = re.compile(r"^smac:\s*=\s*(?P<smac>0x[0-9a-fA-F]+)$")
+        p4 = regex_engine.compile(r"^smac:\s*=\s*(?P<smac>0x[0-9a-fA-F]+)$")
 
         # vid: =0x0
-        p5 = re.compile(r"^vid:\s*=\s*(?P<vid>0x[0-9a-fA-F]+)$")
+        p5 = regex_engine.compile(r"^vid:\s*=\s*(?P<vid>0x[0-9a-fA-F]+)$")
 
         # loc: =0x0
-        p6 = re.compile(r"^loc:\s*=\s*(?P<loc>0x[0-9a-fA-F]+)$")
+        p6 = regex_engine.compile(r"^loc:\s*=\s*(?P<loc>0x[0-9a-fA-F]+)$")
 
         # action: NPL_DOT1X_CLIENT_TABLE_ACTION_WRITE(0x0)
-        p7 = re.compile(r"^action:\s*(?P<action>.*)$")
+        p7 = regex_engine.compile(r"^action:\s*(?P<action>.*)$")
 
         # client_policy_id: =0x7
-        p8 = re.compile(r"^client_policy_id:\s*=\s*(?P<client_policy_id>0x[0-9a-fA-F]+)$")
+        p8 = regex_engine.compile(r"^client_policy_id:\s*=\s*(?P<client_policy_id>0x[0-9a-fA-F]+)$")
 
         # client_vlan: =0x32
-        p9 = re.compile(r"^client_vlan:\s*=\s*(?P<client_vlan>0x[0-9a-fA-F]+)$")
+        p9 = regex_engine.compile(r"^client_vlan:\s*=\s*(?P<client_vlan>0x[0-9a-fA-F]+)$")
 
         # drop: =0x0
-        p10 = re.compile(r"^drop:\s*=\s*(?P<drop>0x[0-9a-fA-F]+)$")
+        p10 = regex_engine.compile(r"^drop:\s*=\s*(?P<drop>0x[0-9a-fA-F]+)$")
 
         # ipv4_policy_valid: =0x1
-        p11 = re.compile(r"^ipv4_policy_valid:\s*=\s*(?P<ipv4_policy_valid>0x[0-9a-fA-F]+)$")
+        p11 = regex_engine.compile(r"^ipv4_policy_valid:\s*=\s*(?P<ipv4_policy_valid>0x[0-9a-fA-F]+)$")
 
         # ipv6_policy_valid: =0x1
-        p12 = re.compile(r"^ipv6_policy_valid:\s*=\s*(?P<ipv6_policy_valid>0x[0-9a-fA-F]+)$")
+        p12 = regex_engine.compile(r"^ipv6_policy_valid:\s*=\s*(?P<ipv6_policy_valid>0x[0-9a-fA-F]+)$")
 
         # ipv6_policy_valid: =0x1
-        p13 = re.compile(r"^vlan_overwrite:\s*=\s*(?P<vlan_overwrite>0x[0-9a-fA-F]+)$")
+        p13 = regex_engine.compile(r"^vlan_overwrite:\s*=\s*(?P<vlan_overwrite>0x[0-9a-fA-F]+)$")
 
         inside_mask = False	 
         for line in output.splitlines():
@@ -12255,7 +12255,7 @@ class ShowPlatSoftFedSwAcAccessSecurityClientTableMac(ShowPlatSoftFedSwAcAccessS
         # ---- ------------ ---------------- ---------- ---------- ----- ------------------ ------------------ ------------ ------ ---------- -------- ---------- ----------
         #    1 Gi2/0/10     0000.0022.2421   0          4096       0     FWD_ALL_LRN_DATA   None               NONE         No     0          NONE     1076       3071
         #    2 Gi2/0/10     0000.0022.23D9   1          4097       0     FWD_ALL_LRN_DATA   None               NONE         No     0          NONE     4244       3064
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'(?P<index>\d+)\s+(?P<interface>\S+)\s+(?P<mac>\S+)\s+'
             r'(?P<logical_id>\d+)\s+(?P<position>\d+)\s+(?P<asic>\d+)\s+'
             r'(?P<auth_act>\S+)\s+(?P<restore_auth_act>\S+)\s+(?P<flag>\S+)\s+'
@@ -12453,7 +12453,7 @@ class ShowPlatformSoftwareFedSwitchActiveEtherchannelLoadbalanceProtocols(ShowPl
         ret_dict = {}
 
         # Dest Port: : GigabitEthernet1/0/4
-        p1 = re.compile(r'^Dest\s+Port\S+\s+\S+\s(?P<destinationport>\S+)$')
+        p1 = regex_engine.compile(r'^Dest\s+Port\S+\s+\S+\s(?P<destinationport>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -12531,69 +12531,69 @@ class ShowPlatformSoftwareFedSwitchSecurityFedSisfIfId(ShowPlatformSoftwareFedSw
         parsed_data = {}
 
         # Interface ID (if-id) = 1035
-        p1 = re.compile(r'^Interface ID \(if-id\) = (?P<interface_id>\d+)$')
+        p1 = regex_engine.compile(r'^Interface ID \(if-id\) = (?P<interface_id>\d+)$')
 
         # Interface name = GigabitEthernet1/0/4 
-        p2 = re.compile(r'^Interface name = (?P<interface_name>\S+)$')
+        p2 = regex_engine.compile(r'^Interface name = (?P<interface_name>\S+)$')
 
         # Interface OID = 1090 
-        p3 = re.compile(r'^Interface OID = (?P<interface_oid>\d+)$')
+        p3 = regex_engine.compile(r'^Interface OID = (?P<interface_oid>\d+)$')
 
         # Target Port: TRUE 
-        p4 = re.compile(r'^(Target Port): (?P<target_port>\S+)$')
+        p4 = regex_engine.compile(r'^(Target Port): (?P<target_port>\S+)$')
 
         # SISF enable: TRUE 
-        p5 = re.compile(r'^SISF enable: (?P<sisf_enable>\S+)$')
+        p5 = regex_engine.compile(r'^SISF enable: (?P<sisf_enable>\S+)$')
 
         # Interface Local: TRUE on ASIC 0x1 
-        p6 = re.compile(r'^Interface Local: (?P<interface_local_true>\S+) on ASIC (?P<asic_local>\S+)$')
+        p6 = regex_engine.compile(r'^Interface Local: (?P<interface_local_true>\S+) on ASIC (?P<asic_local>\S+)$')
 
         # EtherChannel member: TRUE (Not programmed)
-        p7 = re.compile(r'^EtherChannel member: (?P<etherchannel_member>\S+)( \((?P<programmed_status>[\S\s]+)\))?$')
+        p7 = regex_engine.compile(r'^EtherChannel member: (?P<etherchannel_member>\S+)( \((?P<programmed_status>[\S\s]+)\))?$')
 
         # Interface active: TRUE
-        p8 = re.compile(r'^Interface active: (?P<interface_active>\S+)$')
+        p8 = regex_engine.compile(r'^Interface active: (?P<interface_active>\S+)$')
 
         # Internal error = None
-        p9 = re.compile(r'^Internal error = (?P<internal_error>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^Internal error = (?P<internal_error>[\S\s]+)$')
 
         # Low-level error = None
-        p10 = re.compile(r'^Low-level error = (?P<low_level_error>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^Low-level error = (?P<low_level_error>[\S\s]+)$')
 
         # EtherChannel: FALSE
-        p11 = re.compile(r'^EtherChannel: (?P<etherchannel>\S+)$')
+        p11 = regex_engine.compile(r'^EtherChannel: (?P<etherchannel>\S+)$')
 
         # EtherChannel ID = 0 
-        p12 = re.compile(r'^EtherChannel ID = (?P<etherchannel_id>\d+)$')
+        p12 = regex_engine.compile(r'^EtherChannel ID = (?P<etherchannel_id>\d+)$')
 
         # Reference count = 0
-        p13 = re.compile(r'^Reference count = (?P<reference_count>\d+)$')
+        p13 = regex_engine.compile(r'^Reference count = (?P<reference_count>\d+)$')
 
         # Number of OIDs programmed = 1 on ASIC 0x1
-        p14 = re.compile(r'^Number of OIDs programmed = (?P<num_oids_programmed>\d+) on ASIC (?P<num_oids_on_asic>\S+)$')
+        p14 = regex_engine.compile(r'^Number of OIDs programmed = (?P<num_oids_programmed>\d+) on ASIC (?P<num_oids_on_asic>\S+)$')
 
         # No ACL diagnostic = 0
-        p15 = re.compile(r'^No ACL diagnostic = (?P<no_acl_diagnostic>\d+)$')
+        p15 = regex_engine.compile(r'^No ACL diagnostic = (?P<no_acl_diagnostic>\d+)$')
 
         # Invalid ACL diagnostic = 0 
-        p16 = re.compile(r'^Invalid ACL diagnostic = (?P<invalid_acl_diagnostic>\d+)$')
+        p16 = regex_engine.compile(r'^Invalid ACL diagnostic = (?P<invalid_acl_diagnostic>\d+)$')
 
         # Redundant active diagnostic = 0 
-        p17 = re.compile(r'^Redundant active diagnostic = (?P<redundant_active_diagnostic>\d+)$')
+        p17 = regex_engine.compile(r'^Redundant active diagnostic = (?P<redundant_active_diagnostic>\d+)$')
 
         # Redundant deactivate diagnostic = 0
-        p18 = re.compile(r'^Redundant deactivate diagnostic = (?P<redundant_deactivate_diagnostic>\d+)$')
+        p18 = regex_engine.compile(r'^Redundant deactivate diagnostic = (?P<redundant_deactivate_diagnostic>\d+)$')
 
         # Information about ACL with OID(557) on ASIC(0) 
-        p19 = re.compile(r'^Information about ACL with OID\((?P<acl_oid>\d+)\) on ASIC\((?P<acl_asic>\d+)\)$')
+        p19 = regex_engine.compile(r'^Information about ACL with OID\((?P<acl_oid>\d+)\) on ASIC\((?P<acl_asic>\d+)\)$')
 
         # Position Protocol Src Port Dst Port Action  Counter OID 
         # 0        UDP      547      0        PUNT    558  
-        p20 = re.compile(r'^(?P<position>\d+)\s+(?P<protocol>\w+)\s+(?P<src_port>\d+)\s+(?P<dst_port>\d+)\s+(?P<action>\S+)\s+(?P<counter_oid>\d+)$')
+        p20 = regex_engine.compile(r'^(?P<position>\d+)\s+(?P<protocol>\w+)\s+(?P<src_port>\d+)\s+(?P<dst_port>\d+)\s+(?P<action>\S+)\s+(?P<counter_oid>\d+)$')
 
         # Position Protocol Message Type                     Code      Action  Counter OID 
         # 3        ICMPv6   Neighbor Solicitation            0         PUNT    561  
-        p21 = re.compile(r'^(?P<position>\d+)\s+(?P<protocol>\w+)\s+(?P<message_type>[\S\s]+?)\s+(?P<code>\d+)\s+(?P<action>\S+)\s+(?P<counter_oid>\d+)$')
+        p21 = regex_engine.compile(r'^(?P<position>\d+)\s+(?P<protocol>\w+)\s+(?P<message_type>[\S\s]+?)\s+(?P<code>\d+)\s+(?P<action>\S+)\s+(?P<counter_oid>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -12806,48 +12806,48 @@ class ShowPlatformSoftwareFedSwitchSecurityFedSisfVlan(ShowPlatformSoftwareFedSw
         current_section = None
 
         #Vlan = 30 
-        p1 = re.compile(r'^Vlan = (?P<vlan>\d+)$')
+        p1 = regex_engine.compile(r'^Vlan = (?P<vlan>\d+)$')
 
         # Interface ID (if-id) = 1035
-        p2 = re.compile(r'^Interface ID \(if-id\) = (?P<interface_id>\d+)$')
+        p2 = regex_engine.compile(r'^Interface ID \(if-id\) = (?P<interface_id>\d+)$')
 
         # Target VLAN: TRUE 
-        p3 = re.compile(r'^Target VLAN: (?P<target_vlan>\S+)$')
+        p3 = regex_engine.compile(r'^Target VLAN: (?P<target_vlan>\S+)$')
 
         # SISF enable: TRUE 
-        p4 = re.compile(r'^SISF enable: (?P<sisf_enable>\S+)$')
+        p4 = regex_engine.compile(r'^SISF enable: (?P<sisf_enable>\S+)$')
 
         # Internal error = None
-        p5 = re.compile(r'^Internal error = (?P<internal_error>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^Internal error = (?P<internal_error>[\S\s]+)$')
 
         # Low-level error = None
-        p6 = re.compile(r'^Low-level error = (?P<low_level_error>[\S\s]+)$')
+        p6 = regex_engine.compile(r'^Low-level error = (?P<low_level_error>[\S\s]+)$')
 
         # Number of OIDs programmed = 1 on ASIC 0x1
-        p7 = re.compile(r'^Number of OIDs programmed = (?P<num_oids_programmed>\d+) on ASIC (?P<num_oids_on_asic>\S+)$')
+        p7 = regex_engine.compile(r'^Number of OIDs programmed = (?P<num_oids_programmed>\d+) on ASIC (?P<num_oids_on_asic>\S+)$')
 
         # No ACL diagnostic = 0
-        p8 = re.compile(r'^No ACL diagnostic = (?P<no_acl_diagnostic>\d+)$')
+        p8 = regex_engine.compile(r'^No ACL diagnostic = (?P<no_acl_diagnostic>\d+)$')
 
         # Invalid ACL diagnostic = 0 
-        p9 = re.compile(r'^Invalid ACL diagnostic = (?P<invalid_acl_diagnostic>\d+)$')
+        p9 = regex_engine.compile(r'^Invalid ACL diagnostic = (?P<invalid_acl_diagnostic>\d+)$')
 
         # Redundant active diagnostic = 0 
-        p10 = re.compile(r'^Redundant active diagnostic = (?P<redundant_active_diagnostic>\d+)$')
+        p10 = regex_engine.compile(r'^Redundant active diagnostic = (?P<redundant_active_diagnostic>\d+)$')
 
         # Redundant deactivate diagnostic = 0
-        p11 = re.compile(r'^Redundant deactivate diagnostic = (?P<redundant_deactivate_diagnostic>\d+)$')
+        p11 = regex_engine.compile(r'^Redundant deactivate diagnostic = (?P<redundant_deactivate_diagnostic>\d+)$')
 
         # Information about ACL with OID(557) on ASIC(0) 
-        p12 = re.compile(r'^Information about ACL with OID\((?P<acl_oid>\d+)\) on ASIC\((?P<acl_asic>\d+)\)$')
+        p12 = regex_engine.compile(r'^Information about ACL with OID\((?P<acl_oid>\d+)\) on ASIC\((?P<acl_asic>\d+)\)$')
 
         # Position Protocol Src Port Dst Port Action  Counter OID 
         # 0        UDP      547      0        PUNT    558  
-        p13 = re.compile(r'^(?P<position>\d+)\s+(?P<protocol>\w+)\s+(?P<src_port>\d+)\s+(?P<dst_port>\d+)\s+(?P<action>\S+)\s+(?P<counter_oid>\d+)$')
+        p13 = regex_engine.compile(r'^(?P<position>\d+)\s+(?P<protocol>\w+)\s+(?P<src_port>\d+)\s+(?P<dst_port>\d+)\s+(?P<action>\S+)\s+(?P<counter_oid>\d+)$')
 
         # Position Protocol Message Type                     Code      Action  Counter OID 
         # 3        ICMPv6   Neighbor Solicitation            0         PUNT    561  
-        p14 = re.compile(r'^(?P<position>\d+)\s+(?P<protocol>\w+)\s+(?P<message_type>[\S\s]+?)\s+(?P<code>\d+)\s+(?P<action>\S+)\s+(?P<counter_oid>\d+)$')
+        p14 = regex_engine.compile(r'^(?P<position>\d+)\s+(?P<protocol>\w+)\s+(?P<message_type>[\S\s]+?)\s+(?P<code>\d+)\s+(?P<action>\S+)\s+(?P<counter_oid>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -12983,7 +12983,7 @@ class ShowPlatformSoftwareFedSwitchActiveSgaclDetail(ShowPlatformSoftwareFedSwit
         ret_dict = {}
 
         # Global Enforcement: On
-        p1 = re.compile(r"^Global\s+Enforcement:\s+(?P<global_enforcement_status>\S+)$")
+        p1 = regex_engine.compile(r"^Global\s+Enforcement:\s+(?P<global_enforcement_status>\S+)$")
     
         for line in output.splitlines():
             line = line.strip()
@@ -13033,7 +13033,7 @@ class ShowPlatformSoftwareFedSwitchActiveSgaclPort(ShowPlatformSoftwareFedSwitch
         # HundredGigE0/26            Enabled                0          No            No              Pending
         # HundredGigE0/27            Enabled                0          No            No              Pending
 
-        p1 = re.compile(r"^(?P<port>\S+)\s+(?P<enforcement>\S+)\s+(?P<port_sgt>\d+)\s+(?P<trust>\S+)\s+(?P<propogate>\S+)\s+(?P<interface_state>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<port>\S+)\s+(?P<enforcement>\S+)\s+(?P<port_sgt>\d+)\s+(?P<trust>\S+)\s+(?P<propogate>\S+)\s+(?P<interface_state>\S+)$")
         for line in output.splitlines():
             line = line.strip()
 
@@ -13106,26 +13106,26 @@ class ShowPlatformSoftwareFedSwitchSecurityFedDhcpVlandetail(ShowPlatformSoftwar
 
         # Define regex patterns
         # Vlan= 50
-        p1 = re.compile(r'^Vlan= +(?P<vlan>\d+)$')
+        p1 = regex_engine.compile(r'^Vlan= +(?P<vlan>\d+)$')
 
         # Multicast Group with OID(2854) on ASIC(0)
-        p2 = re.compile(r'^Multicast Group with OID\((?P<oid>\d+)\) on ASIC\((?P<asic>\d+)\)$')
+        p2 = regex_engine.compile(r'^Multicast Group with OID\((?P<oid>\d+)\) on ASIC\((?P<asic>\d+)\)$')
 
         # Trusted ports multicast group GID:: 0x201C
-        p3 = re.compile(r'^Trusted ports multicast group GID:: +(?P<gid>\S+)$')
+        p3 = regex_engine.compile(r'^Trusted ports multicast group GID:: +(?P<gid>\S+)$')
 
         # Punject Switch Profile: TRUE
-        p4 = re.compile(r'^Punject Switch Profile: +(?P<profile>\S+)$')
+        p4 = regex_engine.compile(r'^Punject Switch Profile: +(?P<profile>\S+)$')
 
         #   Trusted Port                                                      Interface Id      PO ID
         # ----------------------------------------------------------------------------------------------------
         #   GigabitEthernet3/0/3                                              0x00000494        0x000004d9
         #   GigabitEthernet2/0/25                                             0x00000420        0x000004d9
 
-        p5 = re.compile(r'^(?P<port>\S+) +(?P<interface_id>\S+) +(?P<po_id>\S+)$')
+        p5 = regex_engine.compile(r'^(?P<port>\S+) +(?P<interface_id>\S+) +(?P<po_id>\S+)$')
 
         # Information about ACL with OID(547) on ASIC(0)
-        p6 = re.compile(r'^Information about ACL with OID\((?P<oid>\d+)\) on ASIC\((?P<asic>\d+)\)$')
+        p6 = regex_engine.compile(r'^Information about ACL with OID\((?P<oid>\d+)\) on ASIC\((?P<asic>\d+)\)$')
 
         #  Position Protocol Src Port Dst Port Action  Counter OID
         # -------------------------------------------------------
@@ -13133,7 +13133,7 @@ class ShowPlatformSoftwareFedSwitchSecurityFedDhcpVlandetail(ShowPlatformSoftwar
         #  1        UDP      67       68       PUNT    548
         #  2        UDP      67       67       PUNT    548
 
-        p7 = re.compile(r'^(?P<position>\d+) +(?P<protocol>\S+) +(?P<src_port>\d+) +(?P<dst_port>\d+) +(?P<action>\S+) +(?P<counter_oid>\d+)$')
+        p7 = regex_engine.compile(r'^(?P<position>\d+) +(?P<protocol>\S+) +(?P<src_port>\d+) +(?P<dst_port>\d+) +(?P<action>\S+) +(?P<counter_oid>\d+)$')
 
         # Parse each line
         for line in output.splitlines():
@@ -13237,7 +13237,7 @@ class ShowPlatformSoftwareFedSwitchActiveSecurityDhcpStatistics(ShowPlatformSoft
         # DHCP Snoop VLAN                   548       0
         # Other stats
 
-        p1 = re.compile(r'^(?P<name>\S+(\s+\S+)*?)\s+(?P<oid>\d+)\s+(?P<packets_hits>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<name>\S+(\s+\S+)*?)\s+(?P<oid>\d+)\s+(?P<packets_hits>\d+)$')
 
         ret_dict = {}
 
@@ -13316,13 +13316,13 @@ class ShowPlatformSoftwareFedSwitchActiveAccessSecurityTableSummary(ShowPlatform
         ret_dict = {}
 
         # 1 Gi2/0/34     B07D.479E.7D8D   0          4096       0     FWD_ALL_LRN_DATA   None               NONE         No     0          IPv4v6   2796       3
-        p1 = re.compile(r'^\s*(?P<index>\d+)\s+(?P<interface>\S+)\s+(?P<mac>[0-9A-Fa-f\.]+)\s+(?P<logical_id>\d+)\s+(?P<position>\d+)\s+(?P<asic>\d+)\s+(?P<auth_act>\S+)\s+(?P<restore_auth_act>\S+)\s+(?P<flag>\S+)\s+(?P<drop>\S+)\s+(?P<ovrd_vlan>\d+)\s+(?P<policy>\S+)\s+(?P<policy_oid>\d+)\s+(?P<packets>\d+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<index>\d+)\s+(?P<interface>\S+)\s+(?P<mac>[0-9A-Fa-f\.]+)\s+(?P<logical_id>\d+)\s+(?P<position>\d+)\s+(?P<asic>\d+)\s+(?P<auth_act>\S+)\s+(?P<restore_auth_act>\S+)\s+(?P<flag>\S+)\s+(?P<drop>\S+)\s+(?P<ovrd_vlan>\d+)\s+(?P<policy>\S+)\s+(?P<policy_oid>\d+)\s+(?P<packets>\d+)$')
 
         # 1 Gi2/0/37     100        B07D.479E.7D90   0          12288      0     FWD_ALL_LRN_DATA   None               NONE         No     NONE     569        0
-        p2 = re.compile(r'^\s*(?P<index>\d+)\s+(?P<interface>\S+)\s+(?P<vlan>\d+)\s+(?P<mac>[0-9A-Fa-f\.]+)\s+(?P<logical_id>\d+)\s+(?P<position>\d+)\s+(?P<asic>\d+)\s+(?P<auth_act>\S+)\s+(?P<restore_auth_act>\S+)\s+(?P<flag>\S+)\s+(?P<drop>\S+)\s+(?P<policy>\S+)\s+(?P<policy_oid>\d+)\s+(?P<packets>\d+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<index>\d+)\s+(?P<interface>\S+)\s+(?P<vlan>\d+)\s+(?P<mac>[0-9A-Fa-f\.]+)\s+(?P<logical_id>\d+)\s+(?P<position>\d+)\s+(?P<asic>\d+)\s+(?P<auth_act>\S+)\s+(?P<restore_auth_act>\S+)\s+(?P<flag>\S+)\s+(?P<drop>\S+)\s+(?P<policy>\S+)\s+(?P<policy_oid>\d+)\s+(?P<packets>\d+)$')
 
         # 1 Gi2/0/34     0          24576      0     DROP_ALL_LRN_DATA  None               NONE         573        2
-        p3 = re.compile(r'^\s*(?P<index>\d+)\s+(?P<interface>\S+)\s+(?P<logical_id>\d+)\s+(?P<position>\d+)\s+(?P<asic>\d+)\s+(?P<auth_act>\S+)\s+(?P<restore_auth_act>\S+)\s+(?P<flag>\S+)\s+(?P<policy_oid>\d+)\s+(?P<packets>\d+)$')
+        p3 = regex_engine.compile(r'^\s*(?P<index>\d+)\s+(?P<interface>\S+)\s+(?P<logical_id>\d+)\s+(?P<position>\d+)\s+(?P<asic>\d+)\s+(?P<auth_act>\S+)\s+(?P<restore_auth_act>\S+)\s+(?P<flag>\S+)\s+(?P<policy_oid>\d+)\s+(?P<packets>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -13427,7 +13427,7 @@ class ShowPlatformSoftwareFedSwitchActiveSecurityFedArpStatistics(ShowPlatformSo
         ret_dict = {}
 
         # ARP Snoop Port                    551       0   
-        p1 = re.compile(r'(?P<name>[\w\s]+?)\s+(?P<oid>\d+)\s+(?P<packet_hits>\d+)')
+        p1 = regex_engine.compile(r'(?P<name>[\w\s]+?)\s+(?P<oid>\d+)\s+(?P<packet_hits>\d+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -13473,7 +13473,7 @@ class ShowPlatformSoftwareFedSwitchActiveAccessSecurityTableUsage(ShowPlatformSo
         ret_dict = {}
 
         # MAC-Client        Port-VLAN-MAC       0                4096             0                0                0
-        p1 = re.compile(r'(?P<feature>\S+)\s+(?P<mask>\S+)\s+(?P<asic>\d+)\s+(?P<maximum>\d+)\s+(?P<in_use>\d+)\s+(?P<total_allocated>\d+)\s+(?P<total_freed>\d+)')
+        p1 = regex_engine.compile(r'(?P<feature>\S+)\s+(?P<mask>\S+)\s+(?P<asic>\d+)\s+(?P<maximum>\d+)\s+(?P<in_use>\d+)\s+(?P<total_allocated>\d+)\s+(?P<total_freed>\d+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -13524,7 +13524,7 @@ class ShowPlatformSoftwareFedSwitchSecurityFedIpsgIfId(ShowPlatformSoftwareFedSw
 
         # IP                 Handle         Mac                  Handle 
         # 50.0.0.2           1086     00:14:01:00:00:01    1086 
-        p1 = re.compile(r'^(?P<ip>[\d\.]+)\s+(?P<ip_handle>\d+)\s+(?P<mac>[\w:]+)\s+(?P<mac_handle>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<ip>[\d\.]+)\s+(?P<ip_handle>\d+)\s+(?P<mac>[\w:]+)\s+(?P<mac_handle>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -30,13 +30,15 @@
     * 'show platform software fed switch {mode} ipv6 route'
 """
 # Python
-import re
 import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 log = logging.getLogger(__name__)
 
 
@@ -85,32 +87,32 @@ class ShowPlatformSoftwareFedIpv6MldSnoopingGroupsVlan(
         #     nve1.VNI60020(0x200000063)
 
         # Vlan:20 Group:ff1e::50
-        p0 = re.compile(r"(^Vlan:+(?P<vlan>\d+))+\s+(Group:+(?P<group>\w.*))")
+        p0 = regex_engine.compile(r"(^Vlan:+(?P<vlan>\d+))+\s+(Group:+(?P<group>\w.*))")
 
         # Member ports :
-        p1 = re.compile(r"(^Member+ +ports+   :+(?P<mem_port>.*))")
+        p1 = regex_engine.compile(r"(^Member+ +ports+   :+(?P<mem_port>.*))")
         # TenGigabitEthernet1/0/1
-        p1_1 = re.compile(r"([A-Za-z]*\d[-().]*){10,}")
+        p1_1 = regex_engine.compile(r"([A-Za-z]*\d[-().]*){10,}")
         # nve1.VNI60020(0x200000063)
-        p1_2 = re.compile(r"^[A-Za-z]+[\d\/]+$")
+        p1_2 = regex_engine.compile(r"^[A-Za-z]+[\d\/]+$")
 
         # CCK_epoch : 1
-        p2 = re.compile(r"(^CCK_epoch+ +:+ +(?P<cck_ep>\d.*)$)")
+        p2 = regex_engine.compile(r"(^CCK_epoch+ +:+ +(?P<cck_ep>\d.*)$)")
 
         # Failure Flags : 0
-        p3 = re.compile(r"(^Failure+ +Flags+ +:+ +(?P<fail_flag>\d.*)$)")
+        p3 = regex_engine.compile(r"(^Failure+ +Flags+ +:+ +(?P<fail_flag>\d.*)$)")
 
         # DI handle      : 0x7f4f6eb86dd8
-        p4 = re.compile(r"(^DI+ +handle+ +:+ +(?P<di_hand>\w.*)$)")
+        p4 = regex_engine.compile(r"(^DI+ +handle+ +:+ +(?P<di_hand>\w.*)$)")
 
         # REP RI handle  : 0x7f4f6eb87218
-        p5 = re.compile(r"(^REP+ +RI+ +handle+ +:+ +(?P<rep_ri>\w.*)$)")
+        p5 = regex_engine.compile(r"(^REP+ +RI+ +handle+ +:+ +(?P<rep_ri>\w.*)$)")
 
         # SI handle      : 0x7f4f6eb880b8
-        p6 = re.compile(r"(^SI+ +handle+ +:+ +(?P<si_hand>\w.*)$)")
+        p6 = regex_engine.compile(r"(^SI+ +handle+ +:+ +(?P<si_hand>\w.*)$)")
 
         # HTM handle     : 0x7f4f6eb883c8
-        p7 = re.compile(r"(^HTM+ +handle+ +:+ +(?P<htm_hand>\w.*)$)")
+        p7 = regex_engine.compile(r"(^HTM+ +handle+ +:+ +(?P<htm_hand>\w.*)$)")
 
         member_port_flag = 0
         member_list = []
@@ -241,94 +243,94 @@ class ShowPlatformSoftwareFedActiveIpv6MldSnoopingVlan(
         # PIMSN Enabled : Off
     
         # Vlan 20
-        p0 = re.compile(r"^Vlan\s+(?P<vlan>\d+)$")
+        p0 = regex_engine.compile(r"^Vlan\s+(?P<vlan>\d+)$")
     
         # (ipv6, vlan: 13)
-        p0_1 = re.compile(r'\(+(?P<protocol>\S+)+\,+\s+vlan\: +(?P<vlan>\d+)+\)')
+        p0_1 = regex_engine.compile(r'\(+(?P<protocol>\S+)+\,+\s+vlan\: +(?P<vlan>\d+)+\)')
 
         # Vlan: 13
-        p0_2 = re.compile(r"^Vlan:\s+(?P<vlan>\d+)$")
+        p0_2 = regex_engine.compile(r"^Vlan:\s+(?P<vlan>\d+)$")
     
         # MLDSN Enabled : On
-        p1 = re.compile(r"MLDSN+  +Enabled  +: +(?P<mldsn_en>\w+)")
+        p1 = regex_engine.compile(r"MLDSN+  +Enabled  +: +(?P<mldsn_en>\w+)")
     
         # PIMSN Enabled : Off
-        p2 = re.compile(r"PIMSN+ +Enabled+   +:+ +(?P<pimsn_en>\w+)")
+        p2 = regex_engine.compile(r"PIMSN+ +Enabled+   +:+ +(?P<pimsn_en>\w+)")
     
         # Flood Mode : Off
-        p3 = re.compile(r"Flood+ +Mode+      +:+(?P<flood_md>.*)")
+        p3 = regex_engine.compile(r"Flood+ +Mode+      +:+(?P<flood_md>.*)")
     
         # Flood Mode              : OFF
-        p3_1 = re.compile(r'^Flood\s+Mode\s+:\s+(?P<flood_md>[\s\w\s]+)$')
+        p3_1 = regex_engine.compile(r'^Flood\s+Mode\s+:\s+(?P<flood_md>[\s\w\s]+)$')
     
         # Oper State : Up
-        p4 = re.compile(r"Oper+ +State+    +:+ +(?P<op_state>\w+)")
+        p4 = regex_engine.compile(r"Oper+ +State+    +:+ +(?P<op_state>\w+)")
     
         # STP TCN Flood : Off
-        p5 = re.compile(r"STP+ +TCN+ +Flood+   +:+ +(?P<stp_tcn_flood>\w+)")
+        p5 = regex_engine.compile(r"STP+ +TCN+ +Flood+   +:+ +(?P<stp_tcn_flood>\w+)")
     
         # STP TCN State           : OFF
-        p5_1 = re.compile(r'^STP\s+TCN\s+(Flood|State)\s+:\s+(?P<stp_tcn_flood>[\s\w\s]+)$')
+        p5_1 = regex_engine.compile(r'^STP\s+TCN\s+(Flood|State)\s+:\s+(?P<stp_tcn_flood>[\s\w\s]+)$')
     
         # Routing Enabled : On
-        p6 = re.compile(r"Routing+ +Enabled+ +:+ +(?P<route_en>\w+)")
+        p6 = regex_engine.compile(r"Routing+ +Enabled+ +:+ +(?P<route_en>\w+)")
     
         # PIM Enabled : On
-        p7 = re.compile(r"PIM+ +Enabled+ +:+ +(?P<pim_en>\w+)")
+        p7 = regex_engine.compile(r"PIM+ +Enabled+ +:+ +(?P<pim_en>\w+)")
     
         # Pim state               : ON
-        p7_1 = re.compile(r'^Pim\s+state\s+:\s+(?P<pim_en>[\s\w\s]+)$')
+        p7_1 = regex_engine.compile(r'^Pim\s+state\s+:\s+(?P<pim_en>[\s\w\s]+)$')
     
         # PVLAN : No
-        p8 = re.compile(r"PVLAN+ +:+ +(?P<pvlan>\w+)")
+        p8 = regex_engine.compile(r"PVLAN+ +:+ +(?P<pvlan>\w+)")
     
         # In Retry : 0x0
-        p9 = re.compile(r"In+ +Retry+ +:+ +(?P<in_retry>\w+)")
+        p9 = regex_engine.compile(r"In+ +Retry+ +:+ +(?P<in_retry>\w+)")
     
         # CCK Epoch : 0x17
-        p10 = re.compile(r"CCK+ +Epoch+ +:+ +(?P<cck_ep>\w+)")
+        p10 = regex_engine.compile(r"CCK+ +Epoch+ +:+ +(?P<cck_ep>\w+)")
     
         # IOSD Flood Mode : Off
-        p11 = re.compile(r"IOSD+ +Flood+ +Mode+ :+ +(?P<iosd_md>\w+)")
+        p11 = regex_engine.compile(r"IOSD+ +Flood+ +Mode+ :+ +(?P<iosd_md>\w+)")
     
         # IOS Flood Mode          : OFF
-        p11_1 = re.compile(r'^IOS\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$')
+        p11_1 = regex_engine.compile(r'^IOS\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$')
     
         # EVPN Proxy Enabled : On
-        p12 = re.compile(r"EVPN+ +Proxy+ +Enabled+ :+ +(?P<evpn_en>\w+)")
+        p12 = regex_engine.compile(r"EVPN+ +Proxy+ +Enabled+ :+ +(?P<evpn_en>\w+)")
     
         # Evpn Proxy              : OFF
-        p12_1 = re.compile(r'^Evpn\s+Proxy\s+:\s+(?P<evpn_en>[\s\w\s]+)$')
+        p12_1 = regex_engine.compile(r'^Evpn\s+Proxy\s+:\s+(?P<evpn_en>[\s\w\s]+)$')
     
         # L3mcast Adj :
-        p13 = re.compile(r"L3mcast+ +Adj+      :+(?P<l3m_adj>.*)")
+        p13 = regex_engine.compile(r"L3mcast+ +Adj+      :+(?P<l3m_adj>.*)")
     
         # Mrouter PortQ :
-        p14 = re.compile(r"^Mrouter\s+PortQ\s+:\s*")
+        p14 = regex_engine.compile(r"^Mrouter\s+PortQ\s+:\s*")
         # TenGigabitEthernet7/0/13
-        p14_1 = re.compile(r"([A-Za-z]*\d[-().]*){10,}")
+        p14_1 = regex_engine.compile(r"([A-Za-z]*\d[-().]*){10,}")
     
         # Flood PortQ :
-        p15 = re.compile(r"^Flood PortQ\s+:\s*")
+        p15 = regex_engine.compile(r"^Flood PortQ\s+:\s*")
         # TenGigabitEthernet7/0/13
         # FiveGigabitEthernet1/0/2
         # GigabitEthernet2/0/31
-        p15_1 = re.compile(r"^[A-Za-z]+[\d\/]+$")
+        p15_1 = regex_engine.compile(r"^[A-Za-z]+[\d\/]+$")
     
         # REP RI handle : 0x0
-        p16 = re.compile(r"REP+ +RI+ +handle+   :+(?P<rep_han>.*)")
+        p16 = regex_engine.compile(r"REP+ +RI+ +handle+   :+(?P<rep_han>.*)")
     
         # Snoop State             : ON
-        p17 = re.compile(r'^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$')
+        p17 = regex_engine.compile(r'^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$')
     
         # Secondary Vlan          : NO
-        p18 = re.compile(r'^Secondary\s+Vlan\s+:\s+(?P<secondary_vlan>[\s\w\s]+)$')
+        p18 = regex_engine.compile(r'^Secondary\s+Vlan\s+:\s+(?P<secondary_vlan>[\s\w\s]+)$')
     
         # Vlan Urid               : 0x5000000000000008
-        p19 = re.compile(r'^Vlan\s+Urid\s+:\s+(?P<vlan_urid>[\s\w\s]+)$')
+        p19 = regex_engine.compile(r'^Vlan\s+Urid\s+:\s+(?P<vlan_urid>[\s\w\s]+)$')
     
         # Dependant users count   : 0
-        p20 = re.compile(r'^Dependant\s+users\s+count\s+:\s+(?P<d_users_count>[\s\w\s]+)$')
+        p20 = regex_engine.compile(r'^Dependant\s+users\s+count\s+:\s+(?P<d_users_count>[\s\w\s]+)$')
     
         mroute_port_flag = 0
         mroute_list = []
@@ -612,47 +614,47 @@ class ShowPlatformSoftwareFedSwitchActiveIpRouteDetail(
         ipv4_add_dict = {}
 
         # IPV4ROUTE_ID:id:0x5a4d1cf0f4d8 nobj:(IPNEXTHOP_ID,0x40) 2.2.2.3/32 tblid:0 DA:1
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^IPV4ROUTE_ID:id:(?P<ipv4route_id>\w+)(?:\s+)nobj:\((?P<obj_name>\w+)(?:,)"
             r"(?P<obj_id>\w+)\)(?:\s+)(?P<ipv4_add>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})"
             r"(?:\s+)tblid:(?P<tblid>\d+)(?:\s+)DA:(?P<da>\d+)$"
         )
 
         # State:(0) success
-        p1 = re.compile(r"^State:\(0\)\s+(?P<state>\w+)$")
+        p1 = regex_engine.compile(r"^State:\(0\)\s+(?P<state>\w+)$")
 
         # NPD: device:0 lspa_rec:0 api_type:host(1)
-        p2 = re.compile(r'NPD:\sdevice:(?P<device>\d+)\slspa_rec:(?P<lspa_rec>\d+)\sapi_type:route\((?P<api_type>\d+)\)$')
+        p2 = regex_engine.compile(r'NPD:\sdevice:(?P<device>\d+)\slspa_rec:(?P<lspa_rec>\d+)\sapi_type:route\((?P<api_type>\d+)\)$')
 
         # Mac address of Host:00a7.429b.db7f
-        p3 = re.compile(r"^Mac address of Host:(?P<mac_addr>\S+)$")
+        p3 = regex_engine.compile(r"^Mac address of Host:(?P<mac_addr>\S+)$")
 
         # Host L3Port OID:0x460
-        p4 = re.compile(r"^Host L3Port OID:(?P<l3port_oid>\S+)$")
+        p4 = regex_engine.compile(r"^Host L3Port OID:(?P<l3port_oid>\S+)$")
 
         # ADJ:objid:0x40 (IPv4: 2.2.2.3)  nh_type:NHADJ_NORMAL iif_id:0x553 ether_type:0x8 #child:2
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^ADJ:objid:(?P<objid>\w+)\s+\(IPv4:\s+(?P<ipv4_addr>\S+)\)\s+nh_type:(?P<nh_type>\w+)\s+"
             r"iif_id:(?P<iif_id>\w+)\s+ether_type:(?P<ether_type>\w+)\s+#child:\d+$"
         )
 
         # srcmac:40b5.c1ff.d902 dstmac:00a7.429b.db7f
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^srcmac:(?P<srcmac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+dstmac:(?P<dstmac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})$"
         )
         # NPD: fec_oid:0 was_nor_nh:1 cr_def:0 stale:0 l3port_valid:1
-        p7 = re.compile(r'NPD:\sfec_oid:(?P<fec_oid>\d+)\s+was_nor_nh:(?P<was_nor_nh>\d+)\s+cr_def:(?P<cr_def>\d+)\s+stale:(?P<stale>\d+)\s+l3port_valid:(?P<l3port_valid>\d+)$')
+        p7 = regex_engine.compile(r'NPD:\sfec_oid:(?P<fec_oid>\d+)\s+was_nor_nh:(?P<was_nor_nh>\d+)\s+cr_def:(?P<cr_def>\d+)\s+stale:(?P<stale>\d+)\s+l3port_valid:(?P<l3port_valid>\d+)$')
      
         
 
         # NPD: device:0 nh_gid/oid:8/0x466 old_gid/oid:0/0x0 parent_oid:0x6e6
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^NPD:\s+device:(?P<child_device>\d+)\s+nh_gid\/oid:(?P<nh_gid>\d+)\/(?P<nh_oid>\w+)\s+"
             r"old_gid\/oid:(?P<old_gid>\d+)\/(?P<old_oid>\w+)\s+parent_oid:(?P<parent_oid>\w+)$"
         )
 
         #      SDK: cla_nhtype:0
-        p9 = re.compile(r'SDK:\s+cla_nhtype:(?P<cla_nhtype>\d+)$')
+        p9 = regex_engine.compile(r'SDK:\s+cla_nhtype:(?P<cla_nhtype>\d+)$')
 
 
         for line in output.splitlines():
@@ -835,18 +837,18 @@ class ShowPlatformSoftwareFedSwitchActiveIpRoute(
 
         # Object ID           IPv4 Address        Mask Length         Parent Type         Parent ObjectID
         # 0x564ecc0889e8      127.0.0.0           8                   DROP                0x0
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^(?P<object_id>\w+)\s+(?P<ipv4_addr>\S+)\s+(?P<mask_len>\S+)\s+(?P<parent_type>\S+)\s+(?P<parent_object_id>\S+)$"
         )
 
         #Object ID           IPv4 Address        Mask Length         Parent Type         Parent ObjectID     SGT                 
         #0x5bb0d60dd878      100.60.2.200        32                  IPNEXTHOP_ID        0x5f                0 
-        p0_1 = re.compile(
+        p0_1 = regex_engine.compile(
             r"^(?P<object_id>\w+)\s+(?P<ipv4_addr>\S+)\s+(?P<mask_len>\d+)\s+(?P<parent_type>\S+)\s+(?P<parent_object_id>\S+)\s+(?P<sgt>\d+)$"
         )
 
         # Number of npi_ipv4route entries = 6
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Number of npi_ipv4route entries = +(?P<number_of_npi_ipv4route_entries>\d+)$"
         )
 
@@ -954,12 +956,12 @@ class ShowPlatformSoftwareFedSwitchActiveIpAdj(
 
         # Adjacency ID        Adjacency IPAddress                     Dest MacAddr        Nexthop Type        Interface
         # 0xb                 10.1.1.2                                8024.8f24.4902      NORMAL              Port-channel241
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^(?P<adjacency_id>\w+)\s+(?P<adjacency_ip_addr>\S+)\s+(?P<dest_mac>\S+)\s+(?P<nexthop_type>\S+)\s+(?P<interface>\S+)$"
         )
 
         # Number of IPv4 Adjacency entries: 1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Number of IPv4 Adjacency entries: +(?P<number_of_adjacency_entries>\d+)$"
         )
 
@@ -1052,94 +1054,94 @@ class ShowPlatformSoftwareFedActiveIpv6MldSnoopingVlanDetail(
         # PIMSN Enabled : Off
     
         # Vlan 20
-        p0 = re.compile(r"^Vlan\s+(?P<vlan>\d+)$")
+        p0 = regex_engine.compile(r"^Vlan\s+(?P<vlan>\d+)$")
     
         # (ipv6, vlan: 13)
-        p0_1 = re.compile(r'^\(+(?P<protocol>\S+)+\,+\s+vlan\:\s+(?P<vlan>\d+)+\)$')
+        p0_1 = regex_engine.compile(r'^\(+(?P<protocol>\S+)+\,+\s+vlan\:\s+(?P<vlan>\d+)+\)$')
 
         # Vlan: 13
-        p0_2 = re.compile(r"^Vlan:\s+(?P<vlan>\d+)$")
+        p0_2 = regex_engine.compile(r"^Vlan:\s+(?P<vlan>\d+)$")
     
         # MLDSN Enabled : On
-        p1 = re.compile(r"^MLDSN+\s+Enabled+\s+:\s+(?P<mldsn_en>\w+)$")
+        p1 = regex_engine.compile(r"^MLDSN+\s+Enabled+\s+:\s+(?P<mldsn_en>\w+)$")
     
         # PIMSN Enabled : Off
-        p2 = re.compile(r"^PIMSN+\s+Enabled+\s+:+\s+(?P<pimsn_en>\w+)$")
+        p2 = regex_engine.compile(r"^PIMSN+\s+Enabled+\s+:+\s+(?P<pimsn_en>\w+)$")
     
         # Flood Mode : Off
-        p3 = re.compile(r"^Flood+\s+Mode+\s+:+(?P<flood_md>.*)$")
+        p3 = regex_engine.compile(r"^Flood+\s+Mode+\s+:+(?P<flood_md>.*)$")
     
         # Flood Mode              : OFF
-        p3_1 = re.compile(r'^Flood\s+Mode\s+:\s+(?P<flood_md>[\s\w\s]+)$')
+        p3_1 = regex_engine.compile(r'^Flood\s+Mode\s+:\s+(?P<flood_md>[\s\w\s]+)$')
     
         # Oper State : Up
-        p4 = re.compile(r"^Oper+\s+State+\s+:+\s+(?P<op_state>\w+)$")
+        p4 = regex_engine.compile(r"^Oper+\s+State+\s+:+\s+(?P<op_state>\w+)$")
     
         # STP TCN Flood : Off
-        p5 = re.compile(r"^STP+\s+TCN+\s+Flood+\s+:+\s+(?P<stp_tcn_flood>\w+)$")
+        p5 = regex_engine.compile(r"^STP+\s+TCN+\s+Flood+\s+:+\s+(?P<stp_tcn_flood>\w+)$")
     
         # STP TCN State           : OFF
-        p5_1 = re.compile(r'^STP\s+TCN\s+(Flood|State)\s+:\s+(?P<stp_tcn_flood>[\s\w\s]+)$')
+        p5_1 = regex_engine.compile(r'^STP\s+TCN\s+(Flood|State)\s+:\s+(?P<stp_tcn_flood>[\s\w\s]+)$')
     
         # Routing Enabled : On
-        p6 = re.compile(r"^Routing+\s+Enabled+\s+:+\s+(?P<route_en>\w+)$")
+        p6 = regex_engine.compile(r"^Routing+\s+Enabled+\s+:+\s+(?P<route_en>\w+)$")
     
         # PIM Enabled : On
-        p7 = re.compile(r"PIM+\s+Enabled+\s+:+\s+(?P<pim_en>\w+)$")
+        p7 = regex_engine.compile(r"PIM+\s+Enabled+\s+:+\s+(?P<pim_en>\w+)$")
     
         # Pim state               : ON
-        p7_1 = re.compile(r'^Pim\s+state\s+:\s+(?P<pim_en>[\s\w\s]+)$')
+        p7_1 = regex_engine.compile(r'^Pim\s+state\s+:\s+(?P<pim_en>[\s\w\s]+)$')
     
         # PVLAN : No
-        p8 = re.compile(r"^PVLAN+\s+:+\s+(?P<pvlan>\w+)$")
+        p8 = regex_engine.compile(r"^PVLAN+\s+:+\s+(?P<pvlan>\w+)$")
     
         # In Retry : 0x0
-        p9 = re.compile(r"^In+\s+Retry+\s+:+\s+(?P<in_retry>\w+)$")
+        p9 = regex_engine.compile(r"^In+\s+Retry+\s+:+\s+(?P<in_retry>\w+)$")
     
         # CCK Epoch : 0x17
-        p10 = re.compile(r"^CCK+\s+Epoch+\s+:+\s+(?P<cck_ep>\w+)$")
+        p10 = regex_engine.compile(r"^CCK+\s+Epoch+\s+:+\s+(?P<cck_ep>\w+)$")
     
         # IOSD Flood Mode : Off
-        p11 = re.compile(r"^IOSD+\s+Flood+\s+Mode+\s+:+\s+(?P<iosd_md>\w+)$")
+        p11 = regex_engine.compile(r"^IOSD+\s+Flood+\s+Mode+\s+:+\s+(?P<iosd_md>\w+)$")
     
         # IOS Flood Mode          : OFF
-        p11_1 = re.compile(r'^IOS\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$')
+        p11_1 = regex_engine.compile(r'^IOS\s+Flood\s+Mode\s+:\s+(?P<iosd_md>[\s\w\s]+)$')
     
         # EVPN Proxy Enabled : On
-        p12 = re.compile(r"^EVPN+\s+Proxy+\s+Enabled+\s:+\s+(?P<evpn_en>\w+)$")
+        p12 = regex_engine.compile(r"^EVPN+\s+Proxy+\s+Enabled+\s:+\s+(?P<evpn_en>\w+)$")
     
         # Evpn Proxy              : OFF
-        p12_1 = re.compile(r'^Evpn\s+Proxy\s+:\s+(?P<evpn_en>[\s\w\s]+)$')
+        p12_1 = regex_engine.compile(r'^Evpn\s+Proxy\s+:\s+(?P<evpn_en>[\s\w\s]+)$')
     
         # L3mcast Adj :
-        p13 = re.compile(r"^L3mcast+\s+Adj+\s+:+(?P<l3m_adj>.*)$")
+        p13 = regex_engine.compile(r"^L3mcast+\s+Adj+\s+:+(?P<l3m_adj>.*)$")
     
         # Mrouter PortQ :
-        p14 = re.compile(r"^Mrouter\s+PortQ\s+:\s*")
+        p14 = regex_engine.compile(r"^Mrouter\s+PortQ\s+:\s*")
         # TenGigabitEthernet7/0/13
-        p14_1 = re.compile(r"^([A-Za-z]*\d[-().]*){10,}$")
+        p14_1 = regex_engine.compile(r"^([A-Za-z]*\d[-().]*){10,}$")
     
         # Flood PortQ :
-        p15 = re.compile(r"^Flood PortQ\s+:\s*$")
+        p15 = regex_engine.compile(r"^Flood PortQ\s+:\s*$")
         # TenGigabitEthernet7/0/13
         # FiveGigabitEthernet1/0/2
         # GigabitEthernet2/0/31
-        p15_1 = re.compile(r"^[A-Za-z]+[\d\/]+$")
+        p15_1 = regex_engine.compile(r"^[A-Za-z]+[\d\/]+$")
     
         # REP RI handle : 0x0
-        p16 = re.compile(r"^REP+\s+RI+\s+handle+\s+:+(?P<rep_han>.*)$")
+        p16 = regex_engine.compile(r"^REP+\s+RI+\s+handle+\s+:+(?P<rep_han>.*)$")
     
         # Snoop State             : ON
-        p17 = re.compile(r'^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$')
+        p17 = regex_engine.compile(r'^Snoop\s+State\s+:\s+(?P<snoop_state>[\w\s]+)$')
     
         # Secondary Vlan          : NO
-        p18 = re.compile(r'^Secondary\s+Vlan\s+:\s+(?P<secondary_vlan>[\s\w\s]+)$')
+        p18 = regex_engine.compile(r'^Secondary\s+Vlan\s+:\s+(?P<secondary_vlan>[\s\w\s]+)$')
     
         # Vlan Urid               : 0x5000000000000008
-        p19 = re.compile(r'^Vlan\s+Urid\s+:\s+(?P<vlan_urid>[\s\w\s]+)$')
+        p19 = regex_engine.compile(r'^Vlan\s+Urid\s+:\s+(?P<vlan_urid>[\s\w\s]+)$')
     
         # Dependant users count   : 0
-        p20 = re.compile(r'^Dependant\s+users\s+count\s+:\s+(?P<d_users_count>[\s\w\s]+)$')
+        p20 = regex_engine.compile(r'^Dependant\s+users\s+count\s+:\s+(?P<d_users_count>[\s\w\s]+)$')
     
         port_list = None
         mroute_list = []
@@ -1358,7 +1360,7 @@ class ShowPlatformSoftwareFedIpv6MfibCount(ShowPlatformSoftwareFedIpv6MfibCountS
         ret_dict = {}
 
         # Number of entries = 8000
-        p0 = re.compile(r'(Number of entries +\= +(?P<number_of_entries>\d+))')
+        p0 = regex_engine.compile(r'(Number of entries +\= +(?P<number_of_entries>\d+))')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1412,31 +1414,31 @@ class ShowPlatformSoftwareFedIpv6MfibSummary(ShowPlatformSoftwareFedIpv6MfibSumm
         ret_dict = {}
 
         # Multicast Vrf Current Count              : 2
-        p0 = re.compile(r'(Multicast Vrf Current Count +\: +(?P<mcast_vrf_count>\d+))')
+        p0 = regex_engine.compile(r'(Multicast Vrf Current Count +\: +(?P<mcast_vrf_count>\d+))')
 
         # Mroute Current Count/Max Reached         : 7830/10118    
-        p1 = re.compile(r'(Mroute Current .* +Reached +\: +(?P<mcast_current_count_reached>\d+.+)\/(?P<mcast_max_count_reached>\d+))')
+        p1 = regex_engine.compile(r'(Mroute Current .* +Reached +\: +(?P<mcast_current_count_reached>\d+.+)\/(?P<mcast_max_count_reached>\d+))')
 
         # (*,G) Current Count                      : 4001
-        p2 = re.compile(r'(\(+\*+\,+G\) +Current Count +\: +(?P<star_g_current_count>\d+))')    
+        p2 = regex_engine.compile(r'(\(+\*+\,+G\) +Current Count +\: +(?P<star_g_current_count>\d+))')    
 
         # (S,G) Current Count                      : 3829 
-        p3 = re.compile(r'(\(+\S+\,+G\) +Current Count +\: +(?P<s_g_current_count>\d+))') 
+        p3 = regex_engine.compile(r'(\(+\S+\,+G\) +Current Count +\: +(?P<s_g_current_count>\d+))') 
 
         #  (*,G/m) RetryQ Count                     : 0
-        p4 = re.compile(r'(\(+\*+\,+G\/m\) +RetryQ Count +\: +(?P<s_gm_retryq_count>\d+))') 
+        p4 = regex_engine.compile(r'(\(+\*+\,+G\/m\) +RetryQ Count +\: +(?P<s_gm_retryq_count>\d+))') 
 
         # (*,G) RetryQ Count                       : 0
-        p5 = re.compile(r'(\(+\*+\,+G\) +RetryQ Count +\: +(?P<star_g_retryq_count>\d+))') 
+        p5 = regex_engine.compile(r'(\(+\*+\,+G\) +RetryQ Count +\: +(?P<star_g_retryq_count>\d+))') 
 
         #   (S,G) RetryQ Count                       : 0
-        p6 = re.compile(r'(\(+\S+\,+G\) +RetryQ Count +\: +(?P<s_g_retryq_count>\d+))')
+        p6 = regex_engine.compile(r'(\(+\S+\,+G\) +RetryQ Count +\: +(?P<s_g_retryq_count>\d+))')
 
         # Oifs Current Count/Max Reached           : 16126/18354
-        p7 = re.compile(r'(Oifs Current Count.* +Reached +\: +(?P<oifs_current_count_reached>\d+.+)\/(?P<oifs_current_max_reached>\d+))')
+        p7 = regex_engine.compile(r'(Oifs Current Count.* +Reached +\: +(?P<oifs_current_count_reached>\d+.+)\/(?P<oifs_current_max_reached>\d+))')
 
         # Last used Mlist Urid                     : 0x100000000000d3a
-        p8 = re.compile(r'(Last used Mlist Urid  +\: +(?P<last_used_mlist_urid>\d+))')
+        p8 = regex_engine.compile(r'(Last used Mlist Urid  +\: +(?P<last_used_mlist_urid>\d+))')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1544,19 +1546,19 @@ class ShowPlatformSoftwareFedIpv6MldSnoopingSummary(ShowPlatformSoftwareFedIpv6M
         ret_dict = {}
     
         # Vlan Current Count/Max Reached    : 3/3 
-        p0 = re.compile(r'(Vlan Current Count/Max Reached +\: +(?P<vlan_current_count>\d+)\/+(?P<vlan_max_count>\d+))')
+        p0 = regex_engine.compile(r'(Vlan Current Count/Max Reached +\: +(?P<vlan_current_count>\d+)\/+(?P<vlan_max_count>\d+))')
     
         # Group Current Count/Max Reached   : 0/0
-        p1 = re.compile(r'(Group Current Count/Max Reached +\: +(?P<group_current_count>\d+)\/+(?P<group_max_count>\d+))')
+        p1 = regex_engine.compile(r'(Group Current Count/Max Reached +\: +(?P<group_current_count>\d+)\/+(?P<group_max_count>\d+))')
     
         # Port Current Count/Max Reached    : 2001/2057
-        p2 = re.compile(r'(Port Current Count/Max Reached +\: +(?P<port_current_count>\d+)\/+(?P<port_max_count>\d+))')  
+        p2 = regex_engine.compile(r'(Port Current Count/Max Reached +\: +(?P<port_current_count>\d+)\/+(?P<port_max_count>\d+))')  
     
         # Last used Vlan Urid               : 0x4000000000000006
-        p3 = re.compile(r'(Last used Vlan Urid +\: +(?P<last_used_vlan_urid>\S+))') 
+        p3 = regex_engine.compile(r'(Last used Vlan Urid +\: +(?P<last_used_vlan_urid>\S+))') 
     
         # Last Used Group Urid              : 0x600000000000575c
-        p4 = re.compile(r'(Last Used Group Urid  +\: +(?P<last_used_group_urid>\S+))') 
+        p4 = regex_engine.compile(r'(Last Used Group Urid  +\: +(?P<last_used_group_urid>\S+))') 
     
         for line in output.splitlines():
             line = line.strip()
@@ -1630,7 +1632,7 @@ class ShowPlatformSoftwareFedIpMfibCount(ShowPlatformSoftwareFedIpMfibCountSchem
         ret_dict = {}
 
         # Number of entries = 7896
-        p0 = re.compile(r'(Number of entries +\= +(?P<number_of_entries>\d+))')
+        p0 = regex_engine.compile(r'(Number of entries +\= +(?P<number_of_entries>\d+))')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1683,31 +1685,31 @@ class ShowPlatformSoftwareFedIpMfibSummary(ShowPlatformSoftwareFedIpMfibSummaryS
         ret_dict = {}
 
         # Multicast Vrf Current Count              : 2
-        p0 = re.compile(r'(Multicast Vrf Current Count +\: +(?P<mcast_vrf_count>\d+))')
+        p0 = regex_engine.compile(r'(Multicast Vrf Current Count +\: +(?P<mcast_vrf_count>\d+))')
 
         # Mroute Current Count/Max Reached         : 7830/10118
-        p1 = re.compile(r'(Mroute Current .* +Reached +\: +(?P<mcast_count_mac_reached>\d+.+))')
+        p1 = regex_engine.compile(r'(Mroute Current .* +Reached +\: +(?P<mcast_count_mac_reached>\d+.+))')
 
         # (*,G) Current Count                      : 4001
-        p2 = re.compile(r'(\(+\*+\,+G\) +Current Count +\: +(?P<star_g_current_count>\d+))')
+        p2 = regex_engine.compile(r'(\(+\*+\,+G\) +Current Count +\: +(?P<star_g_current_count>\d+))')
 
         # (S,G) Current Count                      : 3829
-        p3 = re.compile(r'(\(+\S+\,+G\) +Current Count +\: +(?P<s_g_current_count>\d+))')
+        p3 = regex_engine.compile(r'(\(+\S+\,+G\) +Current Count +\: +(?P<s_g_current_count>\d+))')
 
         #  (*,G/m) RetryQ Count                     : 0
-        p4 = re.compile(r'(\(+\*+\,+G\/m\) +RetryQ Count +\: +(?P<s_gm_retryq_count>\d+))')
+        p4 = regex_engine.compile(r'(\(+\*+\,+G\/m\) +RetryQ Count +\: +(?P<s_gm_retryq_count>\d+))')
 
         # (*,G) RetryQ Count                       : 0
-        p5 = re.compile(r'(\(+\*+\,+G\) +RetryQ Count +\: +(?P<star_g_retryq_count>\d+))')
+        p5 = regex_engine.compile(r'(\(+\*+\,+G\) +RetryQ Count +\: +(?P<star_g_retryq_count>\d+))')
 
         #   (S,G) RetryQ Count                       : 0
-        p6 = re.compile(r'(\(+\S+\,+G\) +RetryQ Count +\: +(?P<s_g_retryq_count>\d+))')
+        p6 = regex_engine.compile(r'(\(+\S+\,+G\) +RetryQ Count +\: +(?P<s_g_retryq_count>\d+))')
 
         # Oifs Current Count/Max Reached           : 16126/18354
-        p7 = re.compile(r'(Oifs Current Count.* +Reached +\: +(?P<oifs_current_count_reached>\d+.+))')
+        p7 = regex_engine.compile(r'(Oifs Current Count.* +Reached +\: +(?P<oifs_current_count_reached>\d+.+))')
 
         # Last used Mlist Urid                     : 0x100000000000d3a
-        p8 = re.compile(r'(Last used Mlist Urid  +\: +(?P<last_used_mlist_urid>\d+))')
+        p8 = regex_engine.compile(r'(Last used Mlist Urid  +\: +(?P<last_used_mlist_urid>\d+))')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1807,13 +1809,13 @@ class ShowPlatformSoftwareIgmpSnoopingGroupsCount(ShowPlatformSoftwareIgmpSnoopi
         ret_dict = {}
 
         # Total number of entries:8000
-        p1 = re.compile(r'^Total\s+number\s+of\s+entries\:(?P<ip_igmp_snooping_entries>\d+)$')
+        p1 = regex_engine.compile(r'^Total\s+number\s+of\s+entries\:(?P<ip_igmp_snooping_entries>\d+)$')
 
         # Total Group Count       : 9789
-        p2 = re.compile(r'(Total Group Count +\: +(?P<total_group_count>\d+))')
+        p2 = regex_engine.compile(r'(Total Group Count +\: +(?P<total_group_count>\d+))')
 
         # Total Stub Group Count  : 9787
-        p3 = re.compile(r'(Total Stub Group Count +\: +(?P<total_stub_group_count>\d+))')
+        p3 = regex_engine.compile(r'(Total Stub Group Count +\: +(?P<total_stub_group_count>\d+))')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1868,7 +1870,7 @@ class ShowPlatformSoftwareFedIpMfibVrfCount(ShowPlatformSoftwareFedIpMfibVrfCoun
         ret_dict = {}
 
         # Number of entries = 32001
-        p0 = re.compile(r'(Number of entries +\= +(?P<number_of_entries>\d+))')
+        p0 = regex_engine.compile(r'(Number of entries +\= +(?P<number_of_entries>\d+))')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1918,19 +1920,19 @@ class ShowPlatformSoftwareFedIpIgmpSnoopingSummary(ShowPlatformSoftwareFedIpIgmp
         ret_dict = {}
 
         # Vlan Current Count/Max Reached    : 3/3 
-        p0 = re.compile(r'(Vlan Current Count/Max Reached +\: +(?P<vlan_current_count>\d+)\/+(?P<vlan_max_count>\d+))')
+        p0 = regex_engine.compile(r'(Vlan Current Count/Max Reached +\: +(?P<vlan_current_count>\d+)\/+(?P<vlan_max_count>\d+))')
 
         # Group Current Count/Max Reached   : 0/0
-        p1 = re.compile(r'(Group Current Count/Max Reached +\: +(?P<group_current_count>\d+)\/+(?P<group_max_count>\d+))')
+        p1 = regex_engine.compile(r'(Group Current Count/Max Reached +\: +(?P<group_current_count>\d+)\/+(?P<group_max_count>\d+))')
 
         # Port Current Count/Max Reached    : 2001/2057
-        p2 = re.compile(r'(Port Current Count/Max Reached +\: +(?P<port_current_count>\d+)\/+(?P<port_max_count>\d+))')  
+        p2 = regex_engine.compile(r'(Port Current Count/Max Reached +\: +(?P<port_current_count>\d+)\/+(?P<port_max_count>\d+))')  
 
         # Last used Vlan Urid               : 0x4000000000000006
-        p3 = re.compile(r'(Last used Vlan Urid +\: +(?P<last_used_vlan_urid>\S+))') 
+        p3 = regex_engine.compile(r'(Last used Vlan Urid +\: +(?P<last_used_vlan_urid>\S+))') 
 
         # Last Used Group Urid              : 0x600000000000575c
-        p4 = re.compile(r'(Last Used Group Urid  +\: +(?P<last_used_group_urid>\S+))') 
+        p4 = regex_engine.compile(r'(Last Used Group Urid  +\: +(?P<last_used_group_urid>\S+))') 
 
         for line in output.splitlines():
             line = line.strip()
@@ -2003,12 +2005,12 @@ class ShowPlatformSoftwareFedMldSnoopingIpv6GroupsCount(ShowPlatformSoftwareFedM
         ret_dict = {}
 
         # Group Address (Vlan 11)        : FF13::1
-        p0 = re.compile(r'(Group\s+Address\s+\(+(?P<interface>.*)\) +\: +(?P<group_address>[\w\:\.\/]+))')
+        p0 = regex_engine.compile(r'(Group\s+Address\s+\(+(?P<interface>.*)\) +\: +(?P<group_address>[\w\:\.\/]+))')
         # Host type                      : v1
-        p1 = re.compile(r'(Host\s+type\s+\:\s+(?P<host_type>\S+))')
+        p1 = regex_engine.compile(r'(Host\s+type\s+\:\s+(?P<host_type>\S+))')
 
         # Member Ports                   : Po92
-        p2 = re.compile(r'(Member\s+Ports  +\: +(?P<member_ports>\S+))') 
+        p2 = regex_engine.compile(r'(Member\s+Ports  +\: +(?P<member_ports>\S+))') 
 
         for line in output.splitlines():
             line = line.strip()
@@ -2086,12 +2088,12 @@ class ShowPlatformSoftwareFedSwitchActiveIpv6Route(
         # Object ID           IPv6 Address                            Mask Length         Parent Type         Parent ObjectID     SGT                 
         # 0x5c292bc04268      fe80::                                  10                  RECV                0x0                 0                   
 
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^(?P<object_id>\w+)\s+(?P<ipv6_addr>\S+)\s+(?P<mask_len>\d+)\s+(?P<parent_type>\S+)\s+(?P<parent_object_id>\S+)\s+(?P<sgt>\d+)$"
         )
 
         # Number of npi_ipv6route entries = 6
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Number of npi_ipv6route entries = +(?P<number_of_npi_ipv6route_entries>\d+)$"
         )
 
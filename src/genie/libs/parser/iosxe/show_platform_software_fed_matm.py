@@ -9,7 +9,6 @@
     * 'show platform software fed switch active matm macTable vlan {vlan} mac {dynamic_mac} detail'
 """
 # Python
-import re
 import logging
 from collections import OrderedDict
 from sys import int_info
@@ -19,6 +18,7 @@ from xml.dom import minidom
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -77,7 +77,7 @@ class ShowPlatformSoftwareFedMatmMacTable(ShowPlatformSoftwareFedMatmMacTableSch
         # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
         # 10     3c57.3104.6b42  0x5000001       0      0     64  0x7f61dd192978      0x7f61dcfb58a8      0x7f61dd1259e8      0x0                         0      798  VTEP 40.40.40.40 adj_id 1011                                  No
 
-        p = re.compile(
+        p = regex_engine.compile(
             r"(?P<vlanport>\d+) +(?P<mac>[\w\.]+) + "
             r"(?P<type>\w+) +(?P<sequence>\d+) +"
             r"(?P<ecbi>\d+) +(?P<flag>\d+) +"
@@ -161,7 +161,7 @@ class ShowPlatformSoftwareFedSwitchActiveMatmAdjacenciesVlan(
                 )
 
         # v99     966         0x3000003c6      VXLAN  V4     0x0              0x0              0x0              0x0              UC         No
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<vlan_id>\d+)\s+(?P<adj_id>\d+)\s+(?P<adj_key>\S+)\s+(?P<encap>\S+)\s+(?P<link_type>\w+)\s+(?P<si_handle>\w+)\s+(?P<ri_handle>\w+)\s+(?P<l3_mri_handle>\S+)\s+(?P<di_handle>\w+)\s+(?P<obj_type>\S+)\s+(?P<shared>\w+)$"
         )
         ret_dict = {}
@@ -266,68 +266,68 @@ class ShowPlatformSoftwareFedSwitchActiveMatmAdjacenciesAdjkey(
                 )
 
         # 3849        0x420065   200199     60     99     VXLAN  V4     172.11.1.1        172.11.1.22       0x7f95815d74d8       0x7f95815a4528       0x0              0x0          UC
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<adj_id>\d+)\s+(?P<if_number>\S+)\s+(?P<vni_id>\d+)\s+(?P<len>\d+)\s+(?P<vlan_id>\d+)\s+(?P<encap>\w+)\s+(?P<link_type>\S+)\s+(?P<source_ip>(\d{1,3}\.){3}\d{1,3})\s+(?P<destination_ip>(\d{1,3}\.){3}\d{1,3})\s+(?P<si_handle>\S+)\s+(?P<ri_handle>\S+)\s+(?P<l3_mri_handle>\S+)\s+(?P<di_handle>\S+)\s+(?P<object_type>\w+)$"
         )
 
         # Created Time       : 2023/01/24 05:25:43.658
-        p2 = re.compile(r"^Created\s+Time\s+:\s+(?P<created_time>.*)$")
+        p2 = regex_engine.compile(r"^Created\s+Time\s+:\s+(?P<created_time>.*)$")
 
         # Last Modified Time : 2023/01/24 05:25:43.658
-        p3 = re.compile(r"^Last\s+Modified\s+Time\s+:\s+(?P<last_modified>.*)$")
+        p3 = regex_engine.compile(r"^Last\s+Modified\s+Time\s+:\s+(?P<last_modified>.*)$")
 
         # Current Time       : 2023/01/24 07:52:27.709
-        p4 = re.compile(r"^Current\s+Time\s+:\s+(?P<current_time>.*)$")
+        p4 = regex_engine.compile(r"^Current\s+Time\s+:\s+(?P<current_time>.*)$")
 
         # ASIC#:0 RI:226 Rewrite_type:AL_RRM_REWRITE_LVX_IPV4_L2_PAYLOAD_ENCAP_EPG(116) Mapped_rii:LVX_L3_ENCAP_L2_PAYLOAD_EPG(135)
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^ASIC#:+(?P<asic_instance>\d+)\s+RI:+(?P<ri>\d+)+\s+Rewrite_type:+(?P<rewrite_type>\S+)\s+Mapped_rii:+(?P<mapped_ri>\S+)$"
         )
 
         # Src IP:    172.11.1.1
-        p6 = re.compile(r"^Src\s+IP:\s+(?P<src_ip>\S+)$")
+        p6 = regex_engine.compile(r"^Src\s+IP:\s+(?P<src_ip>\S+)$")
 
         # Dst IP:    172.11.1.22
-        p7 = re.compile(r"^Dst\s+IP:\s+(?P<dst_ip>\S+)$")
+        p7 = regex_engine.compile(r"^Dst\s+IP:\s+(?P<dst_ip>\S+)$")
 
         # iVxlan dstMac:     0x9f:0x00:0x00
-        p8 = re.compile(r"^iVxlan\s+dstMac:\s+(?P<dst_mac>\S+)$")
+        p8 = regex_engine.compile(r"^iVxlan\s+dstMac:\s+(?P<dst_mac>\S+)$")
 
         # iVxlan srcMac:     0x00:0x00:0x00
-        p9 = re.compile(r"^iVxlan\s+srcMac:\s+(?P<src_mac>\S+)$")
+        p9 = regex_engine.compile(r"^iVxlan\s+srcMac:\s+(?P<src_mac>\S+)$")
 
         # IPv4 TTL:  0
-        p10 = re.compile(r"^IPv4\s+TTL:\s+(?P<ipv4_ttl>\d+)$")
+        p10 = regex_engine.compile(r"^IPv4\s+TTL:\s+(?P<ipv4_ttl>\d+)$")
 
         # iid present:   0
-        p11 = re.compile(r"^iid\s+present:\s+(?P<iid_present>\d+)$")
+        p11 = regex_engine.compile(r"^iid\s+present:\s+(?P<iid_present>\d+)$")
 
         # lisp iid:  200199
-        p12 = re.compile(r"^lisp\s+iid:\s+(?P<lisp_iid>\d+)$")
+        p12 = regex_engine.compile(r"^lisp\s+iid:\s+(?P<lisp_iid>\d+)$")
 
         # lisp flags:    0
-        p13 = re.compile(r"^lisp\s+flags:\s+(?P<lisp_flags>\d+)$")
+        p13 = regex_engine.compile(r"^lisp\s+flags:\s+(?P<lisp_flags>\d+)$")
 
         # dst Port:  4789
-        p14 = re.compile(r"^dst\s+Port:\s+(?P<dst_port>\d+)$")
+        p14 = regex_engine.compile(r"^dst\s+Port:\s+(?P<dst_port>\d+)$")
 
         # update only l3if:  0
-        p15 = re.compile(r"^update\s+only\s+l3if:\s+(?P<update_l3if>\d+)$")
+        p15 = regex_engine.compile(r"^update\s+only\s+l3if:\s+(?P<update_l3if>\d+)$")
 
         # is Sgt:    0
-        p16 = re.compile(r"^is\s+sgt:\s+(?P<is_sgt>\d+)$")
+        p16 = regex_engine.compile(r"^is\s+sgt:\s+(?P<is_sgt>\d+)$")
 
         # is TTL Prop:   0
-        p17 = re.compile(r"^is\s+TTL\s+Prop:\s+(?P<is_ttl_prop>\d+)$")
+        p17 = regex_engine.compile(r"^is\s+TTL\s+Prop:\s+(?P<is_ttl_prop>\d+)$")
 
         # L3if LE:   126 (0)
-        p18 = re.compile(r"^L3if\s+LE:\s+(?P<l3if_le>.*)$")
+        p18 = regex_engine.compile(r"^L3if\s+LE:\s+(?P<l3if_le>.*)$")
 
         # Port LE:   318 (0)
-        p19 = re.compile(r"^Port\s+LE:\s+(?P<port_le>.*)$")
+        p19 = regex_engine.compile(r"^Port\s+LE:\s+(?P<port_le>.*)$")
 
         # Vlan LE:   68 (0)
-        p20 = re.compile(r"^Vlan\s+LE:\s+(?P<vlan_le>.*)$")
+        p20 = regex_engine.compile(r"^Vlan\s+LE:\s+(?P<vlan_le>.*)$")
 
         ret_dict = {}
 
@@ -532,7 +532,7 @@ class ShowPlatformSoftwareFedSwitchActiveMatmAdjacencies(
         # 201    89          0x100000059      VXLAN  V4     0x7fd728bf1be8   0x7fd728bf17a8   0x0              CP
 
         # 201    89          0x100000059      VXLAN  V4     0x7fd728bf1be8   0x7fd728bf17a8   0x0              CP
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<vlan>\d+)\s+(?P<adj_id>\d+)\s+(?P<adj_key>\S+)\s+(?P<encap>\w+)\s+(?P<link>\S+)\s+(?P<sihandle>\S+)\s+(?P<rihandle>\S+)\s+(?P<dihandle>\S+)\s+(?P<obj_type>\w+)$"
         )
 
@@ -598,7 +598,7 @@ class ShowPlatformSoftwareFedSwitchMatmStats(
         #   Total non-cpu mac entries       : 3
         #   Mac Learn SPI Msg Count         : 0
         #   Mac Learn SPI Err Count         : 0
-        p = re.compile(r"^(?P<key>[\S\s]+)\s+:\s+(?P<count>\d+)$")
+        p = regex_engine.compile(r"^(?P<key>[\S\s]+)\s+:\s+(?P<count>\d+)$")
 
         ret_dict = {}
 
@@ -662,7 +662,7 @@ class ShowPlatformSoftwareFedSwitchActiveMatmAdjacencies(
             output = self.device.execute(self.cli_command)
 
         # 201    89          0x100000059      VXLAN  V4     0x7fd728bf1be8   0x7fd728bf17a8   0x0              CP
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<vlan>\d+)\s+(?P<adj_id>\d+)\s+(?P<adj_key>\S+)\s+(?P<encap>\w+)\s+(?P<link>\S+)\s+(?P<sihandle>\S+)\s+(?P<rihandle>\S+)\s+(?P<dihandle>\S+)\s+(?P<obj_type>\w+)$"
         )
 
@@ -757,25 +757,25 @@ class ShowPlatformSoftwareFedSwitchActiveMatmMacTableVlanMac(
         # VLAN   MAC                  Type  Seq#    EC_Bi  Flags  machandle           siHandle            riHandle            diHandle              *a_time  *e_time  ports                                                         Con
         # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
         # 1      2200.0000.0001        0x1  125648      0      0  0x7429b62dc7c8      0x742904fc2428      0x0                 0x7429b53219d8            300       90  TwoGigabitEthernet1/0/13                                      Yes
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<vlan>\d+)\s+(?P<mac>\S+)\s+(?P<type>\S+)\s+(?P<seq>\d+)\s+(?P<ec_bi>\d+)\s+(?P<flags>\d+)\s+(?P<machandle>\S+)\s+(?P<siHandle>\S+)\s+(?P<riHandle>\S+)\s+(?P<diHandle>\S+)\s+(?P<a_time>\d+)\s+(?P<e_time>\d+)\s+(?P<port>\S+)\s+(?P<con>\w+)$"
         )
 
         # Asic: 0
-        p2 = re.compile(r"^Asic\:\s+(?P<asic>\S+)$")
+        p2 = regex_engine.compile(r"^Asic\:\s+(?P<asic>\S+)$")
 
         # htm-handle = 0x7429b56aaa48 MVID = 4 gpn = 1
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^htm-handle\s+=\s+(?P<htmhandle>\S+)\s+MVID\s+=\s+(?P<mvid>\d+)\s+gpn\s+=\s+(?P<gpn>\d+)$"
         )
 
         # SI = 0xad RI = 0x2 DI = 0x5415
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^SI\s+=\s+(?P<si>\S+)\s+RI\s+=\s+(?P<ri>\S+)\s+DI\s+=\s+(?P<di>\S+)$"
         )
 
         # DI = 0x5415 pmap = 0x00000000 0x00000000 pmap_intf : [TwoGigabitEthernet1/0/13]
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^DI\s+=\s+(?P<di>\S+)\s+pmap\s+=\s+(?P<pmap>\S+\s+\S+)(\s+pmap_intf\s+:\s+\[(?P<pmap_intf>\S+)\])?$"
         )
 
@@ -908,32 +908,32 @@ class ShowPlatformSoftwareFedSwitchActiveMatmMactable(
         # VLAN    MAC               Type      Seq#    EC_Bi    Flags    machandle         siHandle          riHandle    diHandle    *a_time    *e_time      ports    Con
         # ---------------------------------------------------------------------------------------------------------------------------------------------------------------
         # 1       7061.7bb8.c3e7    0x8002    0       0        64       0x71450c35a508    0x71450c355218    0x0         0x0          0          0           Vlan1    Yes
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<vlan>[\d\-\,]+)\s+(?P<mac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})+\s+(?P<type>0x[\w]+)\s+(?P<seq>\d+)\s+(?P<ecbi>\d+)\s+(?P<flags>\d+)\s+(?P<machandle>0x[\w]+)\s+(?P<sihandle>0x[\w]+)\s+(?P<rihandle>0x[\w]+)\s+(?P<dihandle>0x[\w]+)\s+(?P<atime>\d+)\s+(?P<etime>\d+)\s+(?P<ports>[\w\/\.\-\:]+)\s+(?P<con>\w+)$"
         )
 
         # Total Mac number of addresses:: 4
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Total Mac number of addresses:: (?P<number_of_address>(\d+))?"
         )
 
         # Total number of secure addresses:: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Total number of secure addresses:: (?P<number_of_secure_address>(\d+))?"
         )
 
         # Total number of drop addresses:: 0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Total number of drop addresses:: (?P<number_of_drop_address>(\d+))?"
         )
 
         # Total number of lisp local addresses:: 0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^Total number of lisp local addresses:: (?P<number_of_local_lisp_address>(\d+))?"
         )
 
         # Total number of lisp remote addresses:: 0
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Total number of lisp remote addresses:: (?P<number_of_remote_lisp_address>(\d+))?"
         )
 
@@ -1087,64 +1087,64 @@ class ShowPlatformSoftwareFedActiveMatmMacTableVlanMacDetail(ShowPlatformSoftwar
         # VLAN  MAC             Type Seq#    EC_Bi Flags  machandle  siHandle  riHandle  diHandle  *a_time  *e_time   ports  Con   
         # --------------------------------------------------------------------------------------------------------------------------------------------
         # 300   0030.8200.21e7  0x1  166464  2     8      0x0        0x0       0x0       0x0       300      191227           No   
-        p0 = re.compile(r'^(?P<vlan>\d+)\s+(?P<mac>\S+)\s+(?P<type>\S+)\s+(?P<seq>\d+)\s+(?P<ec_bi>\d+)\s+(?P<flags>\d+)\s+(?P<mac_handle>\S+)\s+(?P<si_handle>\S+)\s+(?P<ri_handle>\S+)\s+(?P<di_handle>\S+)\s+(?P<a_time>\d+)\s+(?P<e_time>\d+)\s+(?P<ports>\d+|\s+)\s+(?P<con>\w+)$')
+        p0 = regex_engine.compile(r'^(?P<vlan>\d+)\s+(?P<mac>\S+)\s+(?P<type>\S+)\s+(?P<seq>\d+)\s+(?P<ec_bi>\d+)\s+(?P<flags>\d+)\s+(?P<mac_handle>\S+)\s+(?P<si_handle>\S+)\s+(?P<ri_handle>\S+)\s+(?P<di_handle>\S+)\s+(?P<a_time>\d+)\s+(?P<e_time>\d+)\s+(?P<ports>\d+|\s+)\s+(?P<con>\w+)$')
         
         # ======platform software details ======
-        p1 = re.compile(r'^======platform software details ======$')
+        p1 = regex_engine.compile(r'^======platform software details ======$')
 
         # L2 Service Port OID.........[9333]
-        p2 = re.compile(r'^L2 Service Port OID\.*\[(?P<l2_service_port_oid>\d+)\]$')
+        p2 = regex_engine.compile(r'^L2 Service Port OID\.*\[(?P<l2_service_port_oid>\d+)\]$')
         
         # L2 Service Port GID.........[4266]
-        p3 = re.compile(r'^L2 Service Port GID\.*\[(?P<l2_service_port_gid>\d+)\]$')
+        p3 = regex_engine.compile(r'^L2 Service Port GID\.*\[(?P<l2_service_port_gid>\d+)\]$')
         
         # ======platform hardware details ======
-        p4 = re.compile(r'^======platform hardware details ======$')
+        p4 = regex_engine.compile(r'^======platform hardware details ======$')
         
         # Age Value...................[60]
-        p5 = re.compile(r'^\s+Age Value\.*\[(?P<age_value>\d+)\]$')
+        p5 = regex_engine.compile(r'^\s+Age Value\.*\[(?P<age_value>\d+)\]$')
         
         # Age Remaining...............[0]
-        p6 = re.compile(r'^\s+Age Remaining\.*\[(?P<age_remaining>\d+)\]$')
+        p6 = regex_engine.compile(r'^\s+Age Remaining\.*\[(?P<age_remaining>\d+)\]$')
         
         # -------- L2 Service port OID Info --------
-        p7 = re.compile(r'^-------- L2 Service port OID Info --------$')
+        p7 = regex_engine.compile(r'^-------- L2 Service port OID Info --------$')
         
         # Port Type: AC Port
-        p8 = re.compile(r'^Port Type:\s+(?P<port_type>(.*))$')
+        p8 = regex_engine.compile(r'^Port Type:\s+(?P<port_type>(.*))$')
         
         # STP Type: Forwarding      
-        p9 = re.compile(r'^STP Type:\s+(?P<stp_type>\S+)$')
+        p9 = regex_engine.compile(r'^STP Type:\s+(?P<stp_type>\S+)$')
         
         # VLAN(BD) OID................[1270]
-        p10 = re.compile(r'^VLAN\(BD\) OID\.*\[(?P<vlan_bd_oid>\d+)\]$')
+        p10 = regex_engine.compile(r'^VLAN\(BD\) OID\.*\[(?P<vlan_bd_oid>\d+)\]$')
         
         # VLAN(BD) GID................[300]
-        p11 = re.compile(r'^VLAN\(BD\) GID\.*\[(?P<vlan_bd_gid>\d+)\]$')
+        p11 = regex_engine.compile(r'^VLAN\(BD\) GID\.*\[(?P<vlan_bd_gid>\d+)\]$')
         
         # Ethernet Port OID...........[11059]
-        p12 = re.compile(r'^Ethernet Port OID\.*\[(?P<ether_port_oid>\d+)\]$')
+        p12 = regex_engine.compile(r'^Ethernet Port OID\.*\[(?P<ether_port_oid>\d+)\]$')
         
         # SPA Port OID................[11058]
-        p13 = re.compile(r'^SPA Port OID\.*\[(?P<spa_port_oid>\d+)\]$')
+        p13 = regex_engine.compile(r'^SPA Port OID\.*\[(?P<spa_port_oid>\d+)\]$')
         
         # SPA Port GID................[310]
-        p14 = re.compile(r'^SPA Port GID\.*\[(?P<spa_port_gid>\d+)\]$')
+        p14 = regex_engine.compile(r'^SPA Port GID\.*\[(?P<spa_port_gid>\d+)\]$')
         
         # ====== NPL Hardware Information ======
-        p15 = re.compile(r'^====== NPL Hardware Information ======$')
+        p15 = regex_engine.compile(r'^====== NPL Hardware Information ======$')
         
         # MAC address: 00a7.429b.dae3
-        p16 = re.compile(r'^MAC address:\s+(?P<mac_addr>\S+)$')
+        p16 = regex_engine.compile(r'^MAC address:\s+(?P<mac_addr>\S+)$')
         
         # Relay ID: 100
-        p17 = re.compile(r'^Relay ID:\s+(?P<relay_id>\d+)$')
+        p17 = regex_engine.compile(r'^Relay ID:\s+(?P<relay_id>\d+)$')
         
         # Tag Type: L2 DLP, Destination ID 4266       
-        p18 = re.compile(r'^Tag Type:\s+(?P<tag_type>(.*))\,\s+Destination ID\s+(?P<dest_id>\d+)$')
+        p18 = regex_engine.compile(r'^Tag Type:\s+(?P<tag_type>(.*))\,\s+Destination ID\s+(?P<dest_id>\d+)$')
         
         # Interface Details: Port-channel111
-        p19 = re.compile(r'^Interface Details:\s+(?P<intf_details>\S+)$')
+        p19 = regex_engine.compile(r'^Interface Details:\s+(?P<intf_details>\S+)$')
        
         for line in output.splitlines(): 
             line = line.strip()   
@@ -12,7 +12,6 @@
     * 'show platform software fed {switchvirtualstate} mpls lspa all'
 """
 # Python
-import re
 import logging
 from collections import OrderedDict
 from sys import int_info
@@ -22,6 +21,7 @@ from xml.dom import minidom
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -168,24 +168,24 @@ class ShowPlatformSofwareFedActiveMplsIpv4VrfNameIpAdd(
         ipv4_add_dict = {}
 
         # IPV4ROUTE_ID:id:0x5b36201d0608 nobj:(PUSH_COUNTER,418) 20.1.1.123/32 tblid:2 DA:0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^IPV4ROUTE_ID:id:(?P<ipv4route_id>\w+)(?:\s+)nobj:\((?P<obj_name>\w+)(?:,)"
             r"(?P<obj_id>\d+)\)(?:\s+)(?P<ipv4_add>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})"
             r"(?:\s+)tblid:(?P<tblid>\d+)(?:\s+)DA:(?P<da>\d+)$"
         )
 
         # NPD: device:0 lspa_rec:0 api_type:route(3)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^NPD:\s+device:(?P<device>\d+)(?:\s+)lspa_rec:(?P<lspa_rec>\d+)(?:\s+)api_type:(?P<api_type>\S+)$"
         )
 
         # NPD: SDK oid 534, devid:0, asic:0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^NPD:\sSDK\soid\s(?P<sdk_oid>\d+)(?:,\s+)devid:(?P<devid>\d+)(?:,\s+)asic:(?P<asic>\d+)$"
         )
 
         # SDK: is_host:0 l3_dest:0x62faa7b0fca0 l3_dest:la_vxlan_next_hop_base(oid=2113) vrf(gid/oid):2/697
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^SDK:(?:\s+)is_host:(?P<is_host>\d+)(?:\s+)"
             r"l3_dest:(?P<l3_dest_id>\w+)(?:\s+)"
             r"l3_dest:(?P<l3_dest_name>\S+)(?:\s+)"
@@ -193,62 +193,62 @@ class ShowPlatformSofwareFedActiveMplsIpv4VrfNameIpAdd(
         )
 
         # object type: vxlan_next_hop
-        p5 = re.compile(r"^object type:\s+(?P<object_type>\w+)$")
+        p5 = regex_engine.compile(r"^object type:\s+(?P<object_type>\w+)$")
 
         # sdk nexthop oid:1449,dev:0, gid:0xa,macaddr:a0f8.4910.ab57, nh_type:normal(0)
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^sdk nexthop oid:(?P<oid>\d+),dev:(?P<dev>\d+),\s+gid:(?P<gid>\w+)"
             r",macaddr:(?P<macaddr>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4}),\s+nh_type:(?P<nh_type>\S+)$"
         )
 
         # sdk outgoing port oid 2143, porttype:svi(104)
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^sdk outgoing port oid\s+(?P<out_oid>\d+),\s+porttype:(?P<porttype>\S+)$"
         )
 
         # forus_destination  SPECIAL_IPNEXTHOP_ID:obj_id:0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^forus_destination\s+(?P<forus_name>\w+):obj_id:(?P<forus_obj_id>\d+)$"
         )
 
         # Subnet Present in SDK for L3Port OID:2143
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^Subnet Present in SDK for L3Port OID:(?P<subnet_present_l3port_oid>\d+)$"
         )
 
         # SPECIAL_IPNEXTHOP_ID:obj_id:0
-        p10 = re.compile(r"^(?P<ipnexthop_name>\w+):obj_id:(?P<ipnexthop_obj_id>\d+)$")
+        p10 = regex_engine.compile(r"^(?P<ipnexthop_name>\w+):obj_id:(?P<ipnexthop_obj_id>\d+)$")
 
         # sdk fec destination oid:1449,dev:0, destination_type:4b
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^sdk fec destination oid:(?P<sdk_oid>\d+),dev:(?P<sdk_dev>\d+),\s+destination_type:(?P<dest_type>\S+)$"
         )
 
         # ADJ:objid:101 nh_type:NHADJ_NORMAL iif_id:0x553 ether_type:0x8 #child:2
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^ADJ:objid:(?P<objid>\d+)\s+nh_type:(?P<nh_type>\w+)\s+"
             r"iif_id:(?P<iif_id>\w+)\s+ether_type:(?P<ether_type>\w+)\s+#child:\d+$"
         )
 
         # srcmac:f87a.4125.2f02 dstmac:a0f8.4910.ab57
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^srcmac:(?P<srcmac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})\s+dstmac:(?P<dstmac>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})$"
         )
 
         # NPD: device:0 nh_gid/oid:10/1449 old_gid/oid:0/0 parent_oid:2143
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^NPD:\s+device:(?P<child_device>\d+)\s+nh_gid\/oid:(?P<nh_gid>\d+)\/(?P<nh_oid>\d+)\s+"
             r"old_gid\/oid:(?P<old_gid>\d+)\/(?P<old_oid>\d+)\s+parent_oid:(?P<parent_oid>\d+)$"
         )
 
         # fec_oid:1454 was_nor_nh:1 cr_def:0 stale:0 l3port_valid:1
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^fec_oid:(?P<child_fec_oid>\d+)\s+was_nor_nh:(?P<was_nor_nh>\d+)\s+cr_def:(?P<cr_def>\d+)"
             r"\s+stale:(?P<stale>\d+)\s+l3port_valid:(?P<l3port_valid>\d+)$"
         )
 
         # SDK: cla_nhtype:0
-        p16 = re.compile(r"^SDK:\s+cla_nhtype:(?P<cla_nhtype>\d+)$")
+        p16 = regex_engine.compile(r"^SDK:\s+cla_nhtype:(?P<cla_nhtype>\d+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -529,7 +529,7 @@ class ShowPlatformMplsRlistId(showPlatformMplsRlistIdSchema):
         ret_dict = {}
 
         ###RLIST id: 0xf0001aeb State: 1 {OK} Flags: 0x0 remote_ifs: 0 packets: 0 (0 pps approx.)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^RLIST\s+id:\s+(?P<rlist_id>\S+)\s+State:\s+(?P<state>\d+)\s+\{(?P<status>\S+)\}\s+Flags:\s+(?P<flags>\S+)\s+[A-Z\{\} ]*\s*remote_ifs:\s+(?P<remote_ifs>\d+)\s+packets:\s+(?P<packets>\d+)\s+\((?P<pps>\d+).*$"
         )
 
@@ -580,42 +580,42 @@ class ShowPlatformMplsRlistSummary(ShowPlatformMplsRlistSummarySchema):
             )
 
         # Current Count (RLIST/RENTRY) : 4 / 2
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"Current\s+Count\s+\(RLIST\/RENTRY\)\s+\:\s+(?P<rlist>\d+)\s+\/\s+(?P<rentry>\d+)"
         )
 
         # Maximum Reached (RLIST/RENTRY) : 24 / 48
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"Maximum\s+Reached\s+\(RLIST\/RENTRY\)\s+\:\s+(?P<rlist>\d+)\s+\/\s+(?P<rentry>\d+)"
         )
 
         # Total Retry Count (RLIST/RENTRY) : 0 / 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"Total\s+Retry\s+Count\s+\(RLIST\/RENTRY\)\s+\:\s+(?P<rlist>\d+)\s+\/\s+(?P<rentry>\d+)"
         )
 
         # Current Lspvif Adjacency's Count : 5
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"Current\s+Lspvif\s+Adjacency's\s+Count\s+\:\s+(?P<current_lspvif_adj_count>\d+)"
         )
 
         # Max reached Lspvif Adjacency's : 40
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"Max\s+reached\s+Lspvif\s+Adjacency's\s+\:\s+(?P<max_lspvif_adj>\d+)"
         )
 
         # Current Lspvif Adj label info Count : 1
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"Current\s+Lspvif\s+Adj\s+label\s+info\s+Count\s+\:\s+(?P<current_lspvif_adj_label_count>\d+)"
         )
 
         # Max reached Lspvif Adj label info : 11
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"Max\s+reached\s+Lspvif\s+Adj\s+label\s+info\s+\:\s+(?P<max_lspvif_adj_label_info>\d+)"
         )
 
         # Total Retry Lspvif Adj label info Count : 0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"Total\s+Retry\s+Lspvif\s+Adj\s+label\s+info\s+Count\s+\:\s+(?P<total_lspvif_adj_label_count>\d+)"
         )
 
@@ -898,41 +898,41 @@ class ShowPlatformSoftwareFed(ShowPlatformSoftwareFedSchema):
             out = output
 
         # LENTRY:label:22 nobj:(EOS, 142) lentry_hdl:0xde00000a
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^LENTRY:label:+(?P<label>\d+)\s+nobj:\(+"
             r"(?P<nobj>[\w\, ]+)+\)\s+lentry_hdl:+(?P<lentry_hdl>\S+)$"
         )
 
         # modify_cnt:1 backwalk_cnt:2
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^modify_cnt:+(?P<modify_cnt>\d+)\s+"
             r"backwalk_cnt:+(?P<backwalk_cnt>\d+)$"
         )
 
         # lspa_handle:0
-        p3 = re.compile(r"^lspa_handle:+(?P<lspa_handle>\w+)$")
+        p3 = regex_engine.compile(r"^lspa_handle:+(?P<lspa_handle>\w+)$")
 
         # AAL: id:3724541962 lbl:22
-        p4 = re.compile(r"^AAL:\s+id:+(?P<id>\d+)\s+lbl:+(?P<lbl>\d+)$")
+        p4 = regex_engine.compile(r"^AAL:\s+id:+(?P<id>\d+)\s+lbl:+(?P<lbl>\d+)$")
 
         # eos0:[adj_hdl:0x83000039, hw_hdl:0x7f02737c6628]
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^eos0:\[+adj_hdl:+(?P<adj_hdl>\w+)+,\s+hw_hdl:+(?P<hw_hdl>\w+)+\]+$"
         )
 
         # eos1:[adj_hdl:0x3d000038, hw_hdl:0x7f02737c6478]
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^eos1:\[+adj_hdl:+(?P<adj_hdl>\w+)+,\s+hw_hdl:+" r"(?P<hw_hdl>\w+)+\]+$"
         )
 
         # deagg_vrf_id = 0 lspa_handle:0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^deagg_vrf_id\s+=\s+(?P<deagg_vrf_id>\d+)+\s+lspa_handle:+"
             r"(?P<lspa_handle>\w+)+$"
         )
 
         # EOS:objid:142 local_label:0 flags:0:() pdflags:0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^EOS:+objid:+(?P<objid>\d+)\s+local_label:+"
             r"(?P<local_label>\d+)\s+flags:+\S:+"
             r"(?P<flags>[\S\s]+)\s+pdflags:+"
@@ -940,80 +940,80 @@ class ShowPlatformSoftwareFed(ShowPlatformSoftwareFedSchema):
         )
 
         # nobj0:(LABEL, 143), nobj1:(LABEL, 141) modify:1 bwalk:0
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^nobj0:\(+(?P<nobj0>[\w\,\s]+)+\)+\,\s+nobj1:\(+"
             r"(?P<nobj1>[\w\,\s]+)+\)\s+modify:+(?P<modify>\d+)\s+bwalk:+(?P<bwalk>\d+)$"
         )
 
         # LABEL:objid:143 link_type:MPLS local_label:22 outlabel:(3, 0)
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"LABEL:+objid:+(?P<objid>\d+)\s+link_type:+"
             r"(?P<link_type>\w+)\s+local_label:+"
             r"(?P<local_label>\d+)\s+outlabel:+(?P<outlabel>[\S\s]+)$"
         )
 
         # flags:0x18:(POP,PHP,) pdflags:0:(INSTALL_HW_OK,) adj_handle:0x83000039
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"flags:+(?P<flagid>\w+)+:\(+(?P<flagstr>\S+)+\,+\)+\s+pdflags:+"
             r"(?P<pdflagid>\w+)+:\(+(?P<pdflagstr>\S+)+\,+\)+\s+adj_handle:+(?P<adj_handle>\w+)$"
         )
 
         # unsupported recursion:0 olbl_changed 0 local_adj:0 modify_cnt:0
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^unsupported\s+recursion:+(?P<unsupported_recursion>\d+)\s+olbl_changed\s+"
             r"(?P<olbl_changed>\d+)\s+local_adj:+"
             r"(?P<local_adj>\d+)\s+modify_cnt:+(?P<modify_cnt>\d+)$"
         )
 
         # bwalk_cnt:0 subwalk_cnt:0 collapsed_oce:0
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^bwalk_cnt:+(?P<bwalk_cnt>\d+)\s+subwalk_cnt:+"
             r"(?P<subwalk_cnt>\d+)\s+collapsed_oce:+(?P<collapsed_oce>\d+)$"
         )
 
         # AAL: id:2197815353 lbl:0 smac:00a7.42d6.c41f dmac:0027.90bf.2ee7
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^AAL:\s+id:+(?P<id>\d+)\s+lbl:+(?P<lbl>\d+)\s+smac:+"
             r"(?P<smac>\S+)\s+dmac:+(?P<dmac>\S+)$"
         )
 
         # sub_type:0 link_type:2 adj_flags:0 label_type:1 rewrite_type:POP2MPLS(138)
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^sub_type:+(?P<sub_type>\d+)\s+link_type:+"
             r"(?P<link_type>\d+)\s+adj_flags:+(?P<adj_flags>\w+)\s+label_type:+"
             r"(?P<label_type>\d+)\s+rewrite_type:+(?P<rewrite_type>\S+)$"
         )
 
         # vlan_id:0 vrf_id:0 ri:0x7f02737cc1e8, ri_id:0x3e phdl:0xab000447, ref_cnt:1
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^vlan_id:+(?P<vlan_id>\d+)\s+vrf_id:+(?P<vrf_id>\d+)\s+ri:+"
             r"(?P<ri>\w+)+,\s+ri_id:+(?P<ri_id>\w+)\s+phdl:+"
             r"(?P<phdl>\w+)+,\s+ref_cnt:+(?P<ref_cnt>\d+)$"
         )
 
         # si:0x7f02737cc6b8, si_id:0x4027, di_id:0x526d
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"^si:+(?P<si>\w+)+,\s+si_id:+(?P<si_id>\w+)+,\s+di_id:+(?P<di_id>\w+)$"
         )
 
         # ADJ:objid:139 {link_type:MPLS ifnum:0x36, adj:0x5c000037, si: 0x7f02737a2348  }
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"ADJ:objid:+(?P<objid>\d+) +{link_type:(?P<link_type>\w+) +ifnum:(?P<ifnum>\w+), +adj:(?P<adj>\w+), +si: +(?P<si>\w+) +}$"
         )
 
         # ADJ:objid:137 {link_type:IP ifnum:0x36, adj:0x63000036, si: 0x7f02737a2348  IPv4:     172.16.25.2 }
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"ADJ:objid:+(?P<objid>\d+) +{link_type:(?P<link_type>\w+) +ifnum:(?P<ifnum>\w+), +adj:(?P<adj>\w+), +si: +(?P<si>\w+) +IPv4: +(?P<IPv4>[\d\.]+) +}$"
         )
 
         # LENTRY:label:75 not found...
-        p20 = re.compile(r"^LENTRY:label:+(?P<label>\d+)\snot +found\S+$")
+        p20 = regex_engine.compile(r"^LENTRY:label:+(?P<label>\d+)\snot +found\S+$")
 
         # AAL: Handle not found:0
-        p21 = re.compile(r"^AAL:\s+Handle\ not\ found:\S$")
+        p21 = regex_engine.compile(r"^AAL:\s+Handle\ not\ found:\S$")
 
         # LB:obj_id:38 ecr_map_objid:0 link_type:IP num_choices:2 Flags:0
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r"LB:+obj_id:+(?P<obj_id>\d+)\s+ecr_map_objid:+"
             r"(?P<ecr_map_objid>\d+)\s+link_type:+"
             r"(?P<link_type>\w+)\s+num_choices:+"
@@ -1021,7 +1021,7 @@ class ShowPlatformSoftwareFed(ShowPlatformSoftwareFedSchema):
         )
 
         # mpls_ecr:1 local_label:24 path_inhw:2 ecrh:0xf9000002 old_ecrh:0
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r"mpls_ecr:+(?P<mpls_ecr>\d+)\s+local_label:+"
             r"(?P<local_label>\d+)\s+path_inhw:+"
             r"(?P<path_inhw>\d+)\s+ecrh:+"
@@ -1029,69 +1029,69 @@ class ShowPlatformSoftwareFed(ShowPlatformSoftwareFedSchema):
         )
 
         # modify_cnt:0 bwalk_cnt:0 subwalk_cnt:0 finish_cnt:0
-        p24 = re.compile(
+        p24 = regex_engine.compile(
             r"modify_cnt:+(?P<modify_cnt>\d+)\s+bwalk_cnt:+"
             r"(?P<bwalk_cnt>\d+)\s+subwalk_cnt:+"
             r"(?P<subwalk_cnt>\d+)\s+finish_cnt:+" + r"(?P<finish_cnt>\d+)$"
         )
 
         # bwalk:[req:0 in_prog:0 nested:0]
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r"bwalk:\[+req:+(?P<req>\d+)\s+in_prog:+"
             r"(?P<in_prog>\d+)\s+nested:+(?P<nested>\d+)+\]+$"
         )
 
         # AAL: ecr:id:4177526786 af:0 ecr_type:0 ref:3 ecrh:0x7f02737e49f8(28:2)
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r"AAL:\s+ecr:id:+(?P<ecr_id>\d+)\s+af:(?P<af>\d+)\s+ecr_type:+"
             r"(?P<ecr_type>\w+)\s+ref:+(?P<ref>\d+)\s+ecrh:+(?P<ecrh>\S+)+$"
         )
 
         # hwhdl:1937656312 ::0x7f02737e11c8,0x7f02737e2728,0x7f02737e11c8,0x7f02737e2728
-        p27 = re.compile(r"hwhdl+(?P<hwhdl>[\S\s]+)$")
+        p27 = regex_engine.compile(r"hwhdl+(?P<hwhdl>[\S\s]+)$")
 
         # Sw Enh ECR scale: objid:38 llabel:24 eos:1 #adjs:2 mixed_adj:0
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r"Sw +Enh +ECR +scale:\s+objid:+(?P<objid>\d+)\s+llabel:+"
             r"(?P<llabel>\d+)\s+eos:+(?P<eos>\d+)\s+\#adjs:+"
             r"(?P<adjs>\d+)\s+mixed_adj:+(?P<mixed_adj>\w+)$"
         )
 
         # reprogram_hw:0 ecrhdl:0xf9000002 ecr_hwhdl:0x7f02737e49f8
-        p29 = re.compile(
+        p29 = regex_engine.compile(
             r"reprogram_hw:+(?P<reprogram_hw>\w+)\s+ecrhdl:+"
             r"(?P<ecrhdl>\w+)\s+ecr_hwhdl:+(?P<ecr_hwhdl>\w+)$"
         )
 
         # mod_cnt:0 prev_npath:0 pmismatch:0 pordermatch:0
-        p30 = re.compile(
+        p30 = regex_engine.compile(
             r"mod_cnt:+(?P<mod_cnt>\d+)\s+prev_npath:+"
             r"(?P<prev_npath>\d+)\s+pmismatch:+(?P<pmismatch>\d+)\s+pordermatch:+"
             r"(?P<pordermatch>\d+)$"
         )
 
         # ecr_adj: id:1644167265 is_mpls_adj:1 l3adj_flags:0x100000
-        p31 = re.compile(
+        p31 = regex_engine.compile(
             r"(?P<ecr_adj>\S+):\s+id:+(?P<id>\d+)\s+is_mpls_adj:+"
             r"(?P<is_mpls_adj>\d+)\s+l3adj_flags:+(?P<l3adj_flags>\w+)$"
         )
 
         # recirc_adj_id:3120562239
-        p32 = re.compile(r"recirc_adj_id:+(?P<recirc_adj_id>\d+)$")
+        p32 = regex_engine.compile(r"recirc_adj_id:+(?P<recirc_adj_id>\d+)$")
 
         # sih:0x7f02737e11c8(182) di_id:20499 rih:0x7f02737e0bf8(74)
-        p33 = re.compile(
+        p33 = regex_engine.compile(
             r"sih:+(?P<sih>\S+)\s+di_id:(?P<di_id>\d+)\s+rih:+(?P<rih>\S+)$"
         )
 
         # adj_lentry [eos0:0x7f02734123b8 eos1:0x7f02737ec5e8]
-        p34 = re.compile(r"adj_lentry\s+(?P<adj_lentry>[\S\s]+)$")
+        p34 = regex_engine.compile(r"adj_lentry\s+(?P<adj_lentry>[\S\s]+)$")
 
         # ecr_prefix_adj: id:2483028067 (ref:1)
-        p35 = re.compile(r"(?P<ecr_prefix_adj>\S+):\s+id:+(?P<id>\d+)\s+\S+$")
+        p35 = regex_engine.compile(r"(?P<ecr_prefix_adj>\S+):\s+id:+(?P<id>\d+)\s+\S+$")
 
         # objid:ADJ SPECIAL:0
-        p36 = re.compile(r"objid:+(?P<objid>\S+)\s+SPECIAL:+(?P<SPECIAL>\w+)$")
+        p36 = regex_engine.compile(r"objid:+(?P<objid>\S+)\s+SPECIAL:+(?P<SPECIAL>\w+)$")
 
         # Init vars
         ret_dict = {}
@@ -1534,7 +1534,7 @@ class ShowPlatformSoftwareFedLspaAllPermode(
         ret_dict = {}
 
         # Number of lines which match regexp = 0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Number +of +lines +which +match +regexp+\s+\W+\s+(?P<lspa_mode_count>(\d+))$"
         )
 
@@ -1586,14 +1586,14 @@ class ShowPlatformSoftwareFedLspaAll(ShowPlatformSoftwareFedLspaAllSchema):
         ret_dict = {}
 
         # Detailed LSPA info for all LSPA: (# of entries:2)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Detailed +LSPA +info +for +all +LSPA+\W+of +entries\W+(?P<total_lspa_entries>\d+)\)$"
         )
         # LSPA:NPD:lspa_rec:0x118804cdfb8 lspa:0x118804ce108 rm_hdl:0 mode:PER_VRF ref_cnt:11
         #       lspakey[pfx1_gid,vpnlbl]:[1010,22][0,0] mode:1
         #       lspa:[vrf_id:6 vpn_encap_gid:0 l3nh_oid:1501 paths:1 dst_oid:1495]
         #    SDK: fec:oid:1501 l3_fec_st:1495, type:la_prefix_object_base(oid=1495)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^\S+lspa_rec\W+(?P<lspa_rec>(\S+))+\s+\S+\s+\S+\s+mode\W+(?P<mode>(\S+))+\s+ref_cnt\W+(?P<ref_cnt>(\d+))$"
         )
 
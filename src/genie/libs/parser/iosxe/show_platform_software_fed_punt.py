@@ -10,7 +10,6 @@
     * 'show platform software fed {port_num} punt entries | include {match}'
 """
 # Python
-import re
 import logging
 from collections import OrderedDict
 from sys import int_info
@@ -20,6 +19,7 @@ from xml.dom import minidom
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -101,101 +101,101 @@ class ShowPlatformSoftwareFedSwitchActivePuntCpuq(
         ret_dict = {}
 
         # Punt CPU Q Statistics
-        p0 = re.compile(r"Punt CPU Q Statistics$")
+        p0 = regex_engine.compile(r"Punt CPU Q Statistics$")
 
         # CPU Q Id                       : 18
-        p1 = re.compile(r"CPU Q Id +: +(?P<cpu_q_id>\d+)$")
+        p1 = regex_engine.compile(r"CPU Q Id +: +(?P<cpu_q_id>\d+)$")
 
         # CPU Q Name                     : CPU_Q_TRANSIT_TRAFFIC
-        p2 = re.compile(r"^CPU Q Name +: +(?P<cpu_q_name>\S+)$")
+        p2 = regex_engine.compile(r"^CPU Q Name +: +(?P<cpu_q_name>\S+)$")
 
         # Packets received from ASIC     : 64564
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Packets received from ASIC +: +(?P<packets_received_from_asic>\d+)$"
         )
 
         # Send to IOSd total attempts    : 64564
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Send to IOSd total attempts +: +(?P<send_to_iosd_total_attempts>\d+)$"
         )
 
         # Send to IOSd failed count      : 0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^Send to IOSd failed count +: +(?P<send_to_iosd_failed_count>\d+)$"
         )
 
         # RX suspend count               : 0
-        p6 = re.compile(r"^RX suspend count +: +(?P<rx_suspend_count>\d+)$")
+        p6 = regex_engine.compile(r"^RX suspend count +: +(?P<rx_suspend_count>\d+)$")
 
         # RX unsuspend count             : 0
-        p7 = re.compile(r"^RX unsuspend count +: +(?P<rx_unsuspend_count>\d+)$")
+        p7 = regex_engine.compile(r"^RX unsuspend count +: +(?P<rx_unsuspend_count>\d+)$")
 
         # RX unsuspend send count        : 0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^RX unsuspend send count +: +(?P<rx_unsuspend_send_count>\d+)$"
         )
 
         # RX unsuspend send failed count : 0
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^RX unsuspend send failed count +: +(?P<rx_unsuspend_send_failed_count>\d+)$"
         )
 
         # RX consumed count              : 0
-        p10 = re.compile(r"^RX consumed count +: +(?P<rx_consumed_count>\d+)$")
+        p10 = regex_engine.compile(r"^RX consumed count +: +(?P<rx_consumed_count>\d+)$")
 
         # RX dropped count               : 0
-        p11 = re.compile(r"^RX dropped count +: +(?P<rx_dropped_count>\d+)$")
+        p11 = regex_engine.compile(r"^RX dropped count +: +(?P<rx_dropped_count>\d+)$")
 
         # RX non-active dropped count    : 0
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^RX non-active dropped count +: +(?P<rx_non_active_dropped_count>\d+)$"
         )
 
         # RX conversion failure dropped  : 0
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^RX conversion failure dropped +: +(?P<rx_conversion_failure_dropped>\d+)$"
         )
 
         # RX INTACK count                : 15377
-        p14 = re.compile(r"^RX INTACK count +: +(?P<rx_intack_count>\d+)$")
+        p14 = regex_engine.compile(r"^RX INTACK count +: +(?P<rx_intack_count>\d+)$")
 
         # RX packets dq'd after intack   : 0
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^RX packets dq\'d after intack +: +(?P<rx_packets_dq_d_after_intack>\d+)$"
         )
 
         # Active RxQ event               : 16723
-        p16 = re.compile(r"^Active RxQ event +: +(?P<active_rxq_event>\d+)$")
+        p16 = regex_engine.compile(r"^Active RxQ event +: +(?P<active_rxq_event>\d+)$")
 
         # RX spurious interrupt          : 1831
-        p17 = re.compile(r"^RX spurious interrupt +: +(?P<rx_spurious_interrupt>\d+)$")
+        p17 = regex_engine.compile(r"^RX spurious interrupt +: +(?P<rx_spurious_interrupt>\d+)$")
 
         # RX phy_idb fetch failed: 0
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^RX phy_idb fetch failed+: +(?P<rx_phy_idb_fetch_failed>\d+)$"
         )
 
         # RX table_id fetch failed: 0
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"^RX table_id fetch failed+: +(?P<rx_table_id_fetch_failed>\d+)$"
         )
 
         # RX invalid punt cause: 0
-        p20 = re.compile(r"^RX invalid punt cause+: +(?P<rx_invalid_punt_cause>\d+)$")
+        p20 = regex_engine.compile(r"^RX invalid punt cause+: +(?P<rx_invalid_punt_cause>\d+)$")
 
         # Replenish Stats for all rxq:
-        p21 = re.compile(r"Replenish Stats for all rxq:$")
+        p21 = regex_engine.compile(r"Replenish Stats for all rxq:$")
 
         # Number of replenish            : 20055
-        p22 = re.compile(r"^Number of replenish +: +(?P<number_of_replenish>\d+)$")
+        p22 = regex_engine.compile(r"^Number of replenish +: +(?P<number_of_replenish>\d+)$")
 
         # Number of replenish suspend    : 0
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r"^Number of replenish suspend +: +(?P<number_of_replenish_suspend>\d+)$"
         )
 
         # Number of replenish un-suspend : 0
-        p24 = re.compile(
+        p24 = regex_engine.compile(
             r"^Number of replenish un-suspend +: +(?P<number_of_replenish_unsuspend>\d+)$"
         )
 
@@ -522,10 +522,10 @@ class ShowPlatformSoftwareFedSwitchActivePuntCpuqBrief(
         ret_dict = {}
 
         # Punt CPU Q Statistics
-        p0 = re.compile(r"Punt CPU Q Statistics$")
+        p0 = regex_engine.compile(r"Punt CPU Q Statistics$")
 
         # 2  CPU_Q_FORUS_TRAFFIC             44325    44328    3        0        0        0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<queue_number>\d+) +(?P<queue_name>\w+) +(?P<rx_prev>\d+) +(?P<rx_cur>\d+) +(?P<rx_delta>\d+) +(?P<drop_prev>\d+) +(?P<drop_cur>\d+) +(?P<drop_delta>\d+)$"
         )
 
@@ -592,7 +592,7 @@ class ShowPlatformSoftwareFedSwitchActivePuntBrief(
         # 7      ARP request or response         201                  0
         # 55     For-us control                  685                  0
         # 96     Layer2 control protocols        930                  0
-        p0 = re.compile(
+        p0 = regex_engine.compile(
             r"^(?P<cause>\d+)\s+(?P<cause_info>[\w -]+)\s+(?P<rcvd>\d+)\s+(?P<dropped>\d+)$"
         )
 
@@ -646,7 +646,7 @@ class ShowPlatformSoftwareFedSwitchActivePuntPacketCaptureBriefCount(ShowPlatfor
         res_dict = {}
 
         # Number of lines which match regexp = 778
-        p0 = re.compile(r"Number of lines which match regexp\s+=\s+(?P<total_captured>\d+)")
+        p0 = regex_engine.compile(r"Number of lines which match regexp\s+=\s+(?P<total_captured>\d+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -712,7 +712,7 @@ class ShowPlatformSoftwareFedPuntEntriesInclude(ShowPlatformSoftwareFedPuntEntri
         
         #Source    Name                            Pri  TC  Policy                                    CIR-SW  CIR-HW   Pkts(A)    Bytes(A)   Pkts(D)    Bytes(D)   
         #LPTSv4    WCCP IPv4                        16   0  system-cpp-default-v4                      60000   59127         0           0         0           0  
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<source>\w+(?:\s+\S+)?)  +'
             r'(?P<name>[\w\s\(\)]+)\s+'
             r'(?P<priority>\d+) +'
@@ -18,7 +18,6 @@
     * 'show platform software fed switch {switch} qos policy target status'
 """
 # Python
-import re
 import logging
 from collections import OrderedDict
 from sys import int_info
@@ -28,6 +27,7 @@ from xml.dom import minidom
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.parsergen import oper_fill_tabular
 
@@ -89,9 +89,9 @@ class ShowPlatformSoftwareFedQosPolicyTarget(
         ret_dict = {}
 
         # TCG summary for policy: system-cpp-policy
-        p1 = re.compile(r"TCG\ssummary\sfor\spolicy:\s+(?P<policy>\S+)")
+        p1 = regex_engine.compile(r"TCG\ssummary\sfor\spolicy:\s+(?P<policy>\S+)")
         # L:2 GigabitEthernet4/0/9  0x00000000000056  IN    4     0 3/2/0   VALID,SET_INHW  0x7fe0a79f0b88
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"(?P<loc>\S+)\s+(?P<interface>[\w\-\/\s]+)\s+(?P<iif_id>\S+)\s+(?P<direction>(OUT|IN))\s+(?P<tccg>\d+)\s+(?P<child>\d+)\s+(?P<mpq>[\w//]+)\s+(?P<state_cfg>\w+),(?P<state_opr>\S+)\s+(?P<address>\S+)"
         )
 
@@ -180,9 +180,9 @@ class ShowPlatformSoftwareFedSwitchActiveQosPolicyTarget(
         ret_dict = {}
 
         # TCG summary for policy: system-cpp-policy
-        p1 = re.compile(r"TCG\ssummary\sfor\spolicy:\s+(?P<policy>\S+)")
+        p1 = regex_engine.compile(r"TCG\ssummary\sfor\spolicy:\s+(?P<policy>\S+)")
         # L:2 GigabitEthernet4/0/9  0x00000000000056  IN    4     0 3/2/0   VALID,SET_INHW  0x7fe0a79f0b88
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"(?P<loc>\S+)\s+(?P<interface>[\w\-\/\s]+)\s+(?P<iif_id>\S+)\s+(?P<direction>(OUT|IN))\s+(?P<tccg>\d+)\s+(?P<child>\d+)\s+(?P<mpq>[\w//]+)\s+(?P<state_cfg>\w+),(?P<state_opr>\S+)\s+(?P<address>\S+)"
         )
 
@@ -264,7 +264,7 @@ class ShowPlatformSoftwareFedActiveQosPolicySummary(
             output = self.device.execute(self.cli_command)
 
         # 15212688   22     33      0     0      33    0     system-cpp-policy
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<cg_id>\d+)\s+(?P<classes>\d+)\s+(?P<targets>\d+)\s+(?P<child>\d+)\s+(?P<cfg_err>\d+)\s+(?P<in_hw>\d+)\s+(?P<op_error>\d+)\s+(?P<policy_name>\S+)$"
         )
 
@@ -337,7 +337,7 @@ class ShowPlatformSoftwareFedSwitchQosPolicyTargetStatus(
             output = self.device.execute(cmd)
 
         # L:3 GigabitEthernet3/0/3  0x0000000000006a OUT VALID,SET_INHW  pm1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<loc>\S+)\s+(?P<interface>\S+)\s+(?P<iif_id>\S+)\s+(?P<dir>\w+)\s+(?P<state>[\w,_\-]+)\s+(?P<policy>\S+)$"
         )
 
@@ -598,81 +598,81 @@ class ShowPlatformSoftwareFedQosInterfaceSuperParser(
         # [HundredGigE1/0/5, map1, Ingress]: CGID = 0x738310
         # [HundredGigE1/0/1.1, map1, Ingress]: CGID = 0x738310
         # [Port-channel10, map1, Ingress]: CGID = 0x738310
-        p1 = re.compile(r"^\[(?P<interface>[\w\/\.\-]+),.+$")
+        p1 = regex_engine.compile(r"^\[(?P<interface>[\w\/\.\-]+),.+$")
 
         # cgid: 0x738310
-        p1_1 = re.compile(r"^cgid:\s+(?P<cgid>\w+)$")
+        p1_1 = regex_engine.compile(r"^cgid:\s+(?P<cgid>\w+)$")
 
         # No of classes: 4
-        p1_2 = re.compile(r"^No of classes:\s+(?P<no_of_classes>\d+)$")
+        p1_2 = regex_engine.compile(r"^No of classes:\s+(?P<no_of_classes>\d+)$")
 
         # TCG ref count: 1
-        p1_3 = re.compile(r"^TCG ref count:\s+(?P<tcg_ref_count>\d+)$")
+        p1_3 = regex_engine.compile(r"^TCG ref count:\s+(?P<tcg_ref_count>\d+)$")
 
         # Filter state: UP TO DATE
-        p1_4 = re.compile(r"^Filter state:\s+(?P<filter_state>[\w\s]+)$")
+        p1_4 = regex_engine.compile(r"^Filter state:\s+(?P<filter_state>[\w\s]+)$")
 
         # VMR state: UP TO DATE
-        p1_5 = re.compile(r"^VMR state:\s+(?P<vmr_state>[\w\s]+)$")
+        p1_5 = regex_engine.compile(r"^VMR state:\s+(?P<vmr_state>[\w\s]+)$")
 
         # NPD: Ingress QOS Profile information
         # SDK: Egress QOS Profile information
         # SDK: Ingress QOS Profile information
-        p2 = re.compile(r"^(NPD|SDK): (Ingress|Egress) QOS Profile information$")
+        p2 = regex_engine.compile(r"^(NPD|SDK): (Ingress|Egress) QOS Profile information$")
 
         # OID: 0x82E
-        p2_1 = re.compile(r"^OID:\s+(?P<oid>\w+)$")
+        p2_1 = regex_engine.compile(r"^OID:\s+(?P<oid>\w+)$")
 
         # Ref Count: 1
-        p2_2 = re.compile(r"^Ref Count:\s+(?P<ref_count>\d+)$")
+        p2_2 = regex_engine.compile(r"^Ref Count:\s+(?P<ref_count>\d+)$")
 
         # No of  Counter: 1
-        p2_3 = re.compile(r"^No of\s+Counter:\s+(?P<no_of_counter>\d+)$")
+        p2_3 = regex_engine.compile(r"^No of\s+Counter:\s+(?P<no_of_counter>\d+)$")
 
         # No of meters: 3
-        p2_4 = re.compile(r"^No of meters:\s+(?P<no_of_meters>\d+)$")
+        p2_4 = regex_engine.compile(r"^No of meters:\s+(?P<no_of_meters>\d+)$")
 
         # Tunnel Mode: RE-EVALUATE
-        p2_5 = re.compile(r"^Tunnel Mode:\s+(?P<tunnel_mode>[\w\-\s]+)$")
+        p2_5 = regex_engine.compile(r"^Tunnel Mode:\s+(?P<tunnel_mode>[\w\-\s]+)$")
 
         # Need filter table update: UPTODATE
-        p2_6 = re.compile(
+        p2_6 = regex_engine.compile(
             r"^Need filter table update:\s+(?P<need_filter_table_update>[\w\s]+)$"
         )
 
         # Marking source: Tag
-        p2_7 = re.compile(r"^Marking source:\s+(?P<marking_source>\w+)$")
+        p2_7 = regex_engine.compile(r"^Marking source:\s+(?P<marking_source>\w+)$")
 
         # DSCP      Remap   Encap   Qos Group   TC  DP  Meter MCOffset
         # COS_DEI   Remap   Encap   Qos Group   TC  DP  Meter MCOffset
         # EXP      Remap   Encap   Qos Group   TC  DP  Meter MCOffset
         # DSCP      Remap   ETOS    EPCP    EExp   ILE   CounterOffset
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<table>DSCP|COS_DEI|EXP)\s+Remap\s+(Encap|ETOS)\s+(Qos Group|EPCP)\s+(TC|EExp)\s+(DP|ILE)\s+(Meter|CounterOffset)(\s+MCOffset)?$"
         )
 
         # 0          0       0         0       0   G     N      3
-        p3_1 = re.compile(
+        p3_1 = regex_engine.compile(
             r"^(?P<counter>\d+)\s+(?P<remap>\d+)\s+(?P<encap>\d+)\s+(?P<qos_group>\d+)\s+"
             r"(?P<tc>\d+)\s+(?P<dp>\w+)\s+(?P<meter>\w+)\s+(?P<mc_offset>\d+)$"
         )
 
         # 0          0       0         0       0   G     N      3
-        p3_2 = re.compile(
+        p3_2 = regex_engine.compile(
             r"^(?P<counter>\d+)\s+(?P<remap>\d+)\s+(?P<etos>\d+)\s+(?P<epcp>\d+)\s+"
             r"(?P<eexp>\d+)\s+(?P<ile>\w+)\s+(?P<counteroffset>\w+)$"
         )
 
         # Markdown Table-Map OID: 0x5EE
-        p4 = re.compile(r"^Markdown Table-Map OID: (?P<oid>\w+)$")
+        p4 = regex_engine.compile(r"^Markdown Table-Map OID: (?P<oid>\w+)$")
 
         # DSCP       Green   Yellow     Red
         # PCPDEI      Green   Yellow     Red
         # EXP        Green   Yellow     Red
-        p4_0 = re.compile(r"^(?P<table>\w+)\s+Green\s+Yellow\s+Red$")
+        p4_0 = regex_engine.compile(r"^(?P<table>\w+)\s+Green\s+Yellow\s+Red$")
 
         # 1           1       1        1
-        p4_1 = re.compile(
+        p4_1 = regex_engine.compile(
             r"^(?P<counter>\d+)\s+(?P<green>\d+)\s+(?P<yellow>\d+)\s+(?P<red>\d+)$"
         )
 
@@ -680,148 +680,148 @@ class ShowPlatformSoftwareFedQosInterfaceSuperParser(
         # IPV6 ACL (OID: 0x5DC, No of ACEs: 3)
         # IPV4 ACL (OID(L3/L2): 0xAF6/0xAF5, No of ACEs: 3)
         # IPV6 ACL (OID(L3/L2): 0xAF8/0xAF7, No of ACEs: 3)
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^(?P<acl_version>\w+ ACL) \(OID(\(L3\/L2\))?: ((?P<l3_oid>\w+)\/(?P<l2_oid>\w+))?(?P<oid>\w+)?, No of ACEs: (?P<number_of_aces>\d+)\)$"
         )
 
         # IPV4 ACE Key/Mask
         # IPV6 ACE Key/Mask
-        p5_0 = re.compile(r"^(IPV4|IPV6) ACE Key/Mask$")
+        p5_0 = regex_engine.compile(r"^(IPV4|IPV6) ACE Key/Mask$")
 
         # Class id: 0x0
-        p5_1 = re.compile(r"^Class id: (?P<class_id>\w+)$")
+        p5_1 = regex_engine.compile(r"^Class id: (?P<class_id>\w+)$")
 
         # IPv4 Src/Mask: 0.0.0.0/0.0.0.0
         # IPv6 Src/Mask: ::/::
-        p5_2 = re.compile(
+        p5_2 = regex_engine.compile(
             r"^(?P<ip_version>\w+)\sSrc\/Mask:\s(?P<src_address>\S+)\/(?P<src_mask>\S+)$"
         )
 
         # IPv4 Dst/Mask: 0.0.0.0/0.0.0.0
         # IPv6 Dst/Mask: ::/::
-        p5_3 = re.compile(
+        p5_3 = regex_engine.compile(
             r"^(?P<ip_version>\w+)\sDst\/Mask:\s(?P<dst_address>\S+)\/(?P<dst_mask>\S+)$"
         )
 
         # Protocol/Mask: 0x0/0x0
-        p5_4 = re.compile(
+        p5_4 = regex_engine.compile(
             r"^Protocol\/Mask:\s(?P<protocol>\w+)\/(?P<protocol_mask>\w+)$"
         )
 
         # DSCP/Mask: 0x8/0x3f
-        p5_5 = re.compile(r"^DSCP\/Mask:\s(?P<dscp>\w+)\/(?P<dscp_mask>\w+)$")
+        p5_5 = regex_engine.compile(r"^DSCP\/Mask:\s(?P<dscp>\w+)\/(?P<dscp_mask>\w+)$")
 
         # TTL Start/End: 0x0/0x0
-        p5_6 = re.compile(r"^TTL Start\/End:\s(?P<ttl_start>\w+)\/(?P<ttl_end>\w+)$")
+        p5_6 = regex_engine.compile(r"^TTL Start\/End:\s(?P<ttl_start>\w+)\/(?P<ttl_end>\w+)$")
 
         # TCP Flags/Mask: 0x0/0x0
-        p5_7 = re.compile(r"^TCP Flags\/Mask:\s(?P<tcp_flags>\w+)\/(?P<tcp_mask>\w+)$")
+        p5_7 = regex_engine.compile(r"^TCP Flags\/Mask:\s(?P<tcp_flags>\w+)\/(?P<tcp_mask>\w+)$")
 
         # IP Flags/Mask: 0x0/0x0
-        p5_8 = re.compile(r"^IP Flags\/Mask:\s(?P<ip_flags>\w+)\/(?P<ip_mask>\w+)$")
+        p5_8 = regex_engine.compile(r"^IP Flags\/Mask:\s(?P<ip_flags>\w+)\/(?P<ip_mask>\w+)$")
 
         # Src Port Start/End: 0x0/0x0
-        p5_9 = re.compile(
+        p5_9 = regex_engine.compile(
             r"^Src Port Start\/End:\s(?P<src_port_start>\w+)\/(?P<src_port_end>\w+)$"
         )
 
         # Dst Port Start/End: 0x0/0x0
-        p5_10 = re.compile(
+        p5_10 = regex_engine.compile(
             r"^Dst Port Start\/End:\s(?P<dst_port_start>\w+)\/(?P<dst_port_end>\w+)$"
         )
 
         # Result Action
-        p6 = re.compile(r"^Result Action$")
+        p6 = regex_engine.compile(r"^Result Action$")
 
         # Remark value: 0
-        p6_1 = re.compile(r"^Remark value:\s(?P<remark_value>\w+)$")
+        p6_1 = regex_engine.compile(r"^Remark value:\s(?P<remark_value>\w+)$")
 
         # Encap value: 0
-        p6_2 = re.compile(r"^Encap value:\s(?P<encap_value>\w+)$")
+        p6_2 = regex_engine.compile(r"^Encap value:\s(?P<encap_value>\w+)$")
 
         # QOS Group: 0
-        p6_3 = re.compile(r"^QOS Group:\s(?P<qos_group>\w+)$")
+        p6_3 = regex_engine.compile(r"^QOS Group:\s(?P<qos_group>\w+)$")
 
         # Traffic Class: 0
-        p6_4 = re.compile(r"^Traffic Class:\s(?P<traffic_class>\w+)$")
+        p6_4 = regex_engine.compile(r"^Traffic Class:\s(?P<traffic_class>\w+)$")
 
         # Drop Precedence: G
-        p6_5 = re.compile(r"^Drop Precedence:\s(?P<drop_precedence>\w+)$")
+        p6_5 = regex_engine.compile(r"^Drop Precedence:\s(?P<drop_precedence>\w+)$")
 
         # Overwrite PHB: N
-        p6_6 = re.compile(r"^Overwrite PHB:\s(?P<overwrite_phb>\w+)$")
+        p6_6 = regex_engine.compile(r"^Overwrite PHB:\s(?P<overwrite_phb>\w+)$")
 
         # Overwrite QOS Group: N
-        p6_7 = re.compile(r"^Overwrite QOS Group:\s(?P<overwrite_qos_group>\w+)$")
+        p6_7 = regex_engine.compile(r"^Overwrite QOS Group:\s(?P<overwrite_qos_group>\w+)$")
 
         # Overwrite Encap: N
-        p6_8 = re.compile(r"^Overwrite Encap:\s(?P<overwrite_encap>\w+)$")
+        p6_8 = regex_engine.compile(r"^Overwrite Encap:\s(?P<overwrite_encap>\w+)$")
 
         # Overwrite Fwd Tag: N
-        p6_9 = re.compile(r"^Overwrite Fwd Tag:\s(?P<overwrite_fwd_tag>\w+)$")
+        p6_9 = regex_engine.compile(r"^Overwrite Fwd Tag:\s(?P<overwrite_fwd_tag>\w+)$")
 
         # Meter Enabled: Y
-        p6_10 = re.compile(r"^Meter Enabled:\s(?P<meter_enabled>\w+)$")
+        p6_10 = regex_engine.compile(r"^Meter Enabled:\s(?P<meter_enabled>\w+)$")
 
         # Meter or Counter offset: 0
-        p6_11 = re.compile(r"^Meter or Counter offset:\s(?P<meter_counter_offset>\w+)$")
+        p6_11 = regex_engine.compile(r"^Meter or Counter offset:\s(?P<meter_counter_offset>\w+)$")
 
         # NPD: Bind Information
         # SDK: Bind Information
-        p7 = re.compile(r"^(NPD|SDK): Bind Information$")
+        p7 = regex_engine.compile(r"^(NPD|SDK): Bind Information$")
 
         # Port Type: L3
         # Port Type: L2 ETHER CHANNEL
-        p7_1 = re.compile(r"^Port Type:\s+(?P<port_type>.+)$")
+        p7_1 = regex_engine.compile(r"^Port Type:\s+(?P<port_type>.+)$")
 
         # IQP counter size: 1
-        p7_2 = re.compile(r"^IQP counter size:\s+(?P<iqp_counter_size>\d+)$")
+        p7_2 = regex_engine.compile(r"^IQP counter size:\s+(?P<iqp_counter_size>\d+)$")
 
         # IQP Counter OID: 0x0
-        p7_3 = re.compile(r"^IQP Counter OID:\s+(?P<iqp_counter_oid>\w+)$")
+        p7_3 = regex_engine.compile(r"^IQP Counter OID:\s+(?P<iqp_counter_oid>\w+)$")
 
         # Meter Type: EXACT
         # Meter Type: IFG EXACT
-        p7_4 = re.compile(r"^Meter Type:\s+(?P<meter_type>[\w\s]+)$")
+        p7_4 = regex_engine.compile(r"^Meter Type:\s+(?P<meter_type>[\w\s]+)$")
 
         # Meter set OID: 0x831
-        p7_5 = re.compile(r"^Meter set OID:\s+(?P<meter_set_oid>\w+)$")
+        p7_5 = regex_engine.compile(r"^Meter set OID:\s+(?P<meter_set_oid>\w+)$")
 
         # No of meters: 4
-        p7_6 = re.compile(r"^No of meters:\s+(?P<no_of_meters>\d+)$")
+        p7_6 = regex_engine.compile(r"^No of meters:\s+(?P<no_of_meters>\d+)$")
 
         # System port OID: 0x5ED
-        p7_7 = re.compile(r"^System port OID:\s+(?P<system_port_oid>\w+)$")
+        p7_7 = regex_engine.compile(r"^System port OID:\s+(?P<system_port_oid>\w+)$")
 
         # Port OID: 0x5E9
-        p7_8 = re.compile(r"^Port OID:\s+(?P<port_oid>\w+)$")
+        p7_8 = regex_engine.compile(r"^Port OID:\s+(?P<port_oid>\w+)$")
 
         # Speed: 10000000000
-        p7_9 = re.compile(r"^Speed:\s+(?P<speed>\w+)$")
+        p7_9 = regex_engine.compile(r"^Speed:\s+(?P<speed>\w+)$")
 
         # Port Internal State: Active
-        p7_10 = re.compile(r"^Port Internal State:\s+(?P<port_internal_state>\w+)$")
+        p7_10 = regex_engine.compile(r"^Port Internal State:\s+(?P<port_internal_state>\w+)$")
 
         # EQP counter size: 5
-        p7_11 = re.compile(r"^EQP counter size:\s+(?P<eqp_counter_size>\d+)$")
+        p7_11 = regex_engine.compile(r"^EQP counter size:\s+(?P<eqp_counter_size>\d+)$")
 
         # EQP Counter OID: 0xAC6
-        p7_12 = re.compile(r"^EQP Counter OID:\s+(?P<eqp_counter_oid>\w+)$")
+        p7_12 = regex_engine.compile(r"^EQP Counter OID:\s+(?P<eqp_counter_oid>\w+)$")
 
         # Meter Set info
-        p8 = re.compile(r"^Meter Set info$")
+        p8 = regex_engine.compile(r"^Meter Set info$")
 
         # CIR: 1000000000
-        p8_1 = re.compile(r"^CIR:\s+(?P<cir>\d+)$")
+        p8_1 = regex_engine.compile(r"^CIR:\s+(?P<cir>\d+)$")
 
         # EIR: 1000000000
-        p8_2 = re.compile(r"^EIR:\s+(?P<eir>\d+)$")
+        p8_2 = regex_engine.compile(r"^EIR:\s+(?P<eir>\d+)$")
 
         # Profile OID: 0x832
-        p8_3 = re.compile(r"^Profile OID:\s+(?P<profile_oid>\w+)$")
+        p8_3 = regex_engine.compile(r"^Profile OID:\s+(?P<profile_oid>\w+)$")
 
         # Action Profile OID: 0x110
-        p8_4 = re.compile(r"^Action Profile OID:\s+(?P<action_profile_oid>\w+)$")
+        p8_4 = regex_engine.compile(r"^Action Profile OID:\s+(?P<action_profile_oid>\w+)$")
 
         ret_dict = {}
         meter_set_count = 0
@@ -1467,132 +1467,132 @@ class ShowPlatformSoftwareFedQosInterfaceIngressNpiDetailed(
 
         # [HundredGigE1/0/5, map1, Ingress]: CGID = 0x738310
         # [HundredGigE1/0/5.100, map1, Ingress]: CGID = 0x738310
-        p1 = re.compile(r"^\[(?P<interface>[\w\/\.\-]+),.+$")
+        p1 = regex_engine.compile(r"^\[(?P<interface>[\w\/\.\-]+),.+$")
 
         # cgid: 0x738310
-        p1_1 = re.compile(r"^cgid:\s+(?P<cgid>\w+)$")
+        p1_1 = regex_engine.compile(r"^cgid:\s+(?P<cgid>\w+)$")
         # No of classes: 4
-        p1_2 = re.compile(r"^No of classes:\s+(?P<no_of_classes>\d+)$")
+        p1_2 = regex_engine.compile(r"^No of classes:\s+(?P<no_of_classes>\d+)$")
 
         # TCG ref count: 1
-        p1_3 = re.compile(r"^TCG ref count:\s+(?P<tcg_ref_count>\d+)$")
+        p1_3 = regex_engine.compile(r"^TCG ref count:\s+(?P<tcg_ref_count>\d+)$")
 
         # Filter state: UP TO DATE
-        p1_4 = re.compile(r"^Filter state:\s+(?P<filter_state>[\w\s]+)$")
+        p1_4 = regex_engine.compile(r"^Filter state:\s+(?P<filter_state>[\w\s]+)$")
 
         # VMR state: UP TO DATE
-        p1_5 = re.compile(r"^VMR state:\s+(?P<vmr_state>[\w\s]+)$")
+        p1_5 = regex_engine.compile(r"^VMR state:\s+(?P<vmr_state>[\w\s]+)$")
 
         # Classmap Information
-        p2 = re.compile(r"^Classmap Information$")
+        p2 = regex_engine.compile(r"^Classmap Information$")
 
         # Class name: cs1(cgid: 0x738310, clid: 0x6A611)
-        p2_1 = re.compile(
+        p2_1 = regex_engine.compile(
             r"^Class name: (?P<class_name>[\w\s\-]+)\(cgid: (?P<cgid>\w+)\, clid: (?P<clid>\w+)\)$"
         )
         # TCCG ref count: 1
-        p2_2 = re.compile(r"^TCCG ref count: (?P<tccg_ref_count>\d+)$")
+        p2_2 = regex_engine.compile(r"^TCCG ref count: (?P<tccg_ref_count>\d+)$")
 
         # NULL Bind count: 1
-        p2_3 = re.compile(r"^NULL Bind count: (?P<null_bind_count>\d+)$")
+        p2_3 = regex_engine.compile(r"^NULL Bind count: (?P<null_bind_count>\d+)$")
 
         # Class seq no.: 0x1FFFFF
-        p2_4 = re.compile(r"^Class seq no\.: (?P<class_seq_number>\w+)$")
+        p2_4 = regex_engine.compile(r"^Class seq no\.: (?P<class_seq_number>\w+)$")
         # No of child classes: 0
-        p2_5 = re.compile(r"^No of child classes: (?P<child_classes>\d+)$")
+        p2_5 = regex_engine.compile(r"^No of child classes: (?P<child_classes>\d+)$")
 
         # Filter: FILTER_MATCH_IP_DSCP
-        p2_6 = re.compile(r"^Filter: (?P<filter_name>[\w\s]+)$")
+        p2_6 = regex_engine.compile(r"^Filter: (?P<filter_name>[\w\s]+)$")
 
         # Value: 0x8
-        p2_7 = re.compile(r"^Value: (?P<value>\w+)$")
+        p2_7 = regex_engine.compile(r"^Value: (?P<value>\w+)$")
 
         # TCG Information
-        p3 = re.compile(r"^TCG Information$")
+        p3 = regex_engine.compile(r"^TCG Information$")
 
         # NPI TCG Values:
-        p3_1 = re.compile(r"^NPI TCG Values:$")
+        p3_1 = regex_engine.compile(r"^NPI TCG Values:$")
 
         # Config state: VALID
-        p3_2 = re.compile(r"^Config state: (?P<config_state>[\w\s]+)$")
+        p3_2 = regex_engine.compile(r"^Config state: (?P<config_state>[\w\s]+)$")
         # Operational state: IN HARDWARE
-        p3_3 = re.compile(r"^Operational state: (?P<operational_state>[\w\s]+)$")
+        p3_3 = regex_engine.compile(r"^Operational state: (?P<operational_state>[\w\s]+)$")
 
         # Parent Info: [0x0, 0x0, 0]
-        p3_4 = re.compile(r"^Parent Info: \[(?P<parent_info>[\w\s\,]+)\]$")
+        p3_4 = regex_engine.compile(r"^Parent Info: \[(?P<parent_info>[\w\s\,]+)\]$")
 
         # No of Child TCGs: 0
-        p3_5 = re.compile(r"^No of Child TCGs: (?P<child_tcg>\d+)$")
+        p3_5 = regex_engine.compile(r"^No of Child TCGs: (?P<child_tcg>\d+)$")
 
         # Mark Action count: 1
-        p3_6 = re.compile(r"^Mark Action count: (?P<mark_action>\d+)$")
+        p3_6 = regex_engine.compile(r"^Mark Action count: (?P<mark_action>\d+)$")
 
         # Police Action count: 3
-        p3_7 = re.compile(r"^Police Action count: (?P<police_action>\d+)$")
+        p3_7 = regex_engine.compile(r"^Police Action count: (?P<police_action>\d+)$")
 
         # Queue Action count: 0
-        p3_8 = re.compile(r"^Queue Action count: (?P<queue_action>\d+)$")
+        p3_8 = regex_engine.compile(r"^Queue Action count: (?P<queue_action>\d+)$")
 
         # No of TCCGs: 4
-        p3_9 = re.compile(r"^No of TCCGs: (?P<no_of_tccg>\d+)$")
+        p3_9 = regex_engine.compile(r"^No of TCCGs: (?P<no_of_tccg>\d+)$")
 
         #  TCCG 0:
-        p4 = re.compile(r"^TCCG (?P<tccg>\d+):$")
+        p4 = regex_engine.compile(r"^TCCG (?P<tccg>\d+):$")
 
         # Class-map name: cs5(0x6A651)
-        p4_1 = re.compile(
+        p4_1 = regex_engine.compile(
             r"^Class-map name: (?P<class_map_name>[\w\s\-]+)\((?P<clid>\w+)\)$"
         )
 
         # Child cgid: 0x0
-        p4_2 = re.compile(r"^Child cgid: (?P<child_cgid>\w+)$")
+        p4_2 = regex_engine.compile(r"^Child cgid: (?P<child_cgid>\w+)$")
 
         # Null Bind: True
-        p4_3 = re.compile(r"^Null Bind: (?P<null_bind>\w+)$")
+        p4_3 = regex_engine.compile(r"^Null Bind: (?P<null_bind>\w+)$")
 
         # Action 0
-        p4_4 = re.compile(r"^Action (?P<action>\d+)$")
+        p4_4 = regex_engine.compile(r"^Action (?P<action>\d+)$")
 
         # Action Type: Marking
-        p4_5 = re.compile(r"^Action Type: (?P<action_type>[\w\s]+)$")
+        p4_5 = regex_engine.compile(r"^Action Type: (?P<action_type>[\w\s]+)$")
 
         # Marking Method : Normal
-        p4_6 = re.compile(r"^Marking Method : (?P<marking_method>[\w\s]+)$")
+        p4_6 = regex_engine.compile(r"^Marking Method : (?P<marking_method>[\w\s]+)$")
 
         # Mark value: 32
-        p4_7 = re.compile(r"^Mark value: (?P<mark_value>\d+)$")
+        p4_7 = regex_engine.compile(r"^Mark value: (?P<mark_value>\d+)$")
 
         # Mark Type: DSCP
-        p4_8 = re.compile(r"^Mark Type: (?P<mark_type>\w+)$")
+        p4_8 = regex_engine.compile(r"^Mark Type: (?P<mark_type>\w+)$")
 
         # QoS Group: 255
-        p4_9 = re.compile(r"^QoS Group: (?P<qos_group>\d+)$")
+        p4_9 = regex_engine.compile(r"^QoS Group: (?P<qos_group>\d+)$")
         # Traffic Class: 255
-        p4_10 = re.compile(r"^Traffic Class: (?P<traffic_class>\d+)$")
+        p4_10 = regex_engine.compile(r"^Traffic Class: (?P<traffic_class>\d+)$")
 
         # Discard Class: 255
-        p4_11 = re.compile(r"^Discard Class: (?P<discard_class>\d+)$")
+        p4_11 = regex_engine.compile(r"^Discard Class: (?P<discard_class>\d+)$")
 
         # Table id: 0x3B8D
-        p4_12 = re.compile(r"^Table id: (?P<table_id>\w+)$")
+        p4_12 = regex_engine.compile(r"^Table id: (?P<table_id>\w+)$")
 
         # Table Name: t1
-        p4_13 = re.compile(r"^Table Name: (?P<table_name>\w+)$")
+        p4_13 = regex_engine.compile(r"^Table Name: (?P<table_name>\w+)$")
 
         # Map: L2 COS -> L2 COS
         # Map: DSCP -> DSCP
         # Map: L2 COS -> Traffic Class
-        p4_14 = re.compile(r"^Map: (?P<map>.+\->.+)$")
+        p4_14 = regex_engine.compile(r"^Map: (?P<map>.+\->.+)$")
 
         # 1 -> 7
         # 2 -> 6
-        p4_15 = re.compile(r"^(?P<key>\d+)\s+\->\s+(?P<value>\d+)$")
+        p4_15 = regex_engine.compile(r"^(?P<key>\d+)\s+\->\s+(?P<value>\d+)$")
 
         # Default value: 0
-        p4_16 = re.compile(r"^Default value: (?P<default_value>\d+)$")
+        p4_16 = regex_engine.compile(r"^Default value: (?P<default_value>\d+)$")
 
         # Default Behavior: Copy
-        p4_17 = re.compile(r"^Default Behavior: (?P<default_behavior>.+)$")
+        p4_17 = regex_engine.compile(r"^Default Behavior: (?P<default_behavior>.+)$")
 
         ret_dict = {}
 
@@ -3,13 +3,13 @@
     * "show platform software fed switch active ifm mappings lpn",
     * "sh platform software fed switch {switch_num} ifm mappings lpn"
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================================================
 #  Schema for
 #  * 'show platform software fed switch active ifm mappings lpn'
@@ -61,7 +61,7 @@ class ShowPlatformSoftwareFedSwitchNumberIfmMappingsLpn(
         
         # 19   1     18    TenGigabitEthernet1/0/19   0x0000001b  y
         # 61   1     60    FortyGigabitEthernet2/1/1  0x00000087  Y
-        p = re.compile(
+        p = regex_engine.compile(
             r"^(?P<lpn>\d+)\s+(?P<asic>\d+)\s+(?P<port>\d+)\s+(?P<interfaces>\S+)\s+(?P<if_id>(0x([\da-fA-F]){8}))\s+(?P<active>\S+)$"
         )
 
@@ -107,7 +107,7 @@ class ShowPlatformSoftwareFedSwitchActiveStatisticsInit(ShowPlatformSoftwareFedS
         ret_dict = {}
           # Punject driver                           1911
           # Post/wait stack manager/sif manager events 59008448
-        p1 = re.compile(r"^(?P<function_name>.+?)\s+(?P<initialization_time>\d+)$")        
+        p1 = regex_engine.compile(r"^(?P<function_name>.+?)\s+(?P<initialization_time>\d+)$")        
         for line in output.splitlines():
             line = line.strip()
               # Punject driver                           1911
@@ -168,7 +168,7 @@ class ShowPlatformSoftwareFedSwitchNumberIfmMappingsPortLE(ShowPlatformSoftwareF
             output = self.device.execute(cmd)
 
         # 0x000061c7543a9de8        TwentyFiveGigE1/1/0/10            0x00000012          PORT_LE
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<port_le>0x[\da-fA-F]+)\s+(?P<interface>\S+)\s+(?P<if_id>0x[\da-fA-F]{8})\s+(?P<type>\S+)$"
         )
 
@@ -219,7 +219,7 @@ class ShowPlatformSoftwareFedSwitchActiveIfmInterfacesDetail(ShowPlatformSoftwar
         # Type_n_State      Intializing  Init_Failed  Init_Done    Ready    Pending_Delete  Delete
         # -----------------------------------------------------------------------------------------
         # ETHER                0            0            0          258         0             0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<type_n_state>[A-Za-z0-9 \-]+)\s+(?P<intializing>\d+)\s+(?P<init_failed>\d+)\s+(?P<init_done>\d+)\s+(?P<ready>\d+)\s+(?P<pending_delete>\d+)\s+(?P<delete>\d+)$"
         )
 
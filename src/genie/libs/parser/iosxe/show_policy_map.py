@@ -17,7 +17,6 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 import xmltodict
 import collections
 from netaddr import IPAddress, IPNetwork
@@ -27,6 +26,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, Default, Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -611,124 +611,124 @@ class ShowPolicyMapTypeSuperParser(ShowPolicyMapTypeSchema):
         priority_level_status = False
 
         # To capture the length of whitespaces before start of the string
-        p0 = re.compile(r'^(?P<whitespace>\s*)\S.*$')
+        p0 = regex_engine.compile(r'^(?P<whitespace>\s*)\S.*$')
 
         # Control Plane
         # GigabitEthernet0/1/5
         # Something else
-        p1 = re.compile(r'^(?P<top_level>(Control Plane|Giga.*|FiveGiga.*|[Pp]seudo.*|Fast.*|[Ss]erial.*|'
-                        r'Ten.*|[Ee]thernet.*|[Tt]wentyFiveGigE.+|.+GigabitEthernet.+|FiftyGigE.+|[Tt]wenty.*|[Tt]en.*|[Ff]our.*|[Ff]ortyGigabit.*|[Tt]unnel.*|[Hh]undred.*|Port-channel\d+.\d+|Port-channel\d+))$')
+        p1 = regex_engine.compile(r'^(?P<top_level>(Control Plane|Giga.*|FiveGiga.*|[Pp]seudo.*|Fast.*|[Ss]erial.*|'
+                                  r'Ten.*|[Ee]thernet.*|[Tt]wentyFiveGigE.+|.+GigabitEthernet.+|FiftyGigE.+|[Tt]wenty.*|[Tt]en.*|[Ff]our.*|[Ff]ortyGigabit.*|[Tt]unnel.*|[Hh]undred.*|Port-channel\d+.\d+|Port-channel\d+))$')
 
         # GigabitEthernet0/1/5 : Service Group 1
-        p1_0 = re.compile(r'^(?P<top_level>(Giga.*)): +Service Group +(?P<service_group>(\d+))$')
+        p1_0 = regex_engine.compile(r'^(?P<top_level>(Giga.*)): +Service Group +(?P<service_group>(\d+))$')
 
         # Port-channel1: Service Group 1
-        p1_1 = re.compile(r'^(?P<top_level>([Pp]ort.*)): +Service Group +(?P<service_group>(\d+))$')
+        p1_1 = regex_engine.compile(r'^(?P<top_level>([Pp]ort.*)): +Service Group +(?P<service_group>(\d+))$')
 
         # Service-policy input: Control_Plane_In
         # Service-policy output: shape-out
         # Service-policy input:TEST
-        p2 = re.compile(r'^[Ss]ervice-policy +(?P<service_policy>(input|output)):+ *(?P<policy_name>([\w\-]+).*)')
+        p2 = regex_engine.compile(r'^[Ss]ervice-policy +(?P<service_policy>(input|output)):+ *(?P<policy_name>([\w\-]+).*)')
 
         # service-policy : child
-        p2_1 = re.compile(r'^Service-policy *:+ *(?P<policy_name>(.*))$')
+        p2_1 = regex_engine.compile(r'^Service-policy *:+ *(?P<policy_name>(.*))$')
 
         # Class-map: Ping_Class (match-all)
         # Class-map:TEST (match-all)
         # Class-map: TEST-OTTAWA_CANADA#PYATS (match-any)
-        p3 = re.compile(r'^[Cc]lass-map *:( +)?(?P<class_map>\S+) +(?P<match_all>(.*))$')
+        p3 = regex_engine.compile(r'^[Cc]lass-map *:( +)?(?P<class_map>\S+) +(?P<match_all>(.*))$')
 
         # queue stats for all priority classes:
-        p3_1 = re.compile(r'^queue +stats +for +all +priority +classes:$')
+        p3_1 = regex_engine.compile(r'^queue +stats +for +all +priority +classes:$')
 
 
         # priority level 2
-        p3_1_1 = re.compile(r'^priority +level +(?P<priority_level>(\d+))$')
+        p3_1_1 = regex_engine.compile(r'^priority +level +(?P<priority_level>(\d+))$')
 
         # 8 packets, 800 bytes
-        p4 = re.compile(r'^(?P<packets>(\d+)) packets, (?P<bytes>(\d+)) +bytes$')
+        p4 = regex_engine.compile(r'^(?P<packets>(\d+)) packets, (?P<bytes>(\d+)) +bytes$')
 
         # 8 packets
-        p4_1 = re.compile(r'^(?P<packets>(\d+)) packets$')
+        p4_1 = regex_engine.compile(r'^(?P<packets>(\d+)) packets$')
 
         # 5 minute offered rate 0000 bps, drop rate 0000 bps
-        p5 = re.compile(r'^(?P<interval>(\d+)) +minute +offered +rate +(?P<offered_rate>(\d+)) bps, +drop +rate +(?P<drop_rate>(\d+)) bps$')
+        p5 = regex_engine.compile(r'^(?P<interval>(\d+)) +minute +offered +rate +(?P<offered_rate>(\d+)) bps, +drop +rate +(?P<drop_rate>(\d+)) bps$')
 
         # 5 minute offered rate 0000 bps
         # 5 minute rate 0 bps
-        p5_1 = re.compile(r'^(?P<interval>(\d+)) +minute(offered| )+rate +(?P<offered_rate>(\d+)) bps$')
+        p5_1 = regex_engine.compile(r'^(?P<interval>(\d+)) +minute(offered| )+rate +(?P<offered_rate>(\d+)) bps$')
 
         # 30 second offered rate 15000 bps, drop rate 300 bps
-        p5_2 = re.compile(r'^(?P<interval>(\d+)) +second +offered +rate +(?P<offered_rate>(\d+)) bps, +drop +rate +(?P<drop_rate>(\d+)) bps$')
+        p5_2 = regex_engine.compile(r'^(?P<interval>(\d+)) +second +offered +rate +(?P<offered_rate>(\d+)) bps, +drop +rate +(?P<drop_rate>(\d+)) bps$')
 
         # Match: access-group name Ping_Option
         # Match: access-group name PYATS-MARKING_IN#CUSTOM__ACL
-        p6 = re.compile(r'^[Mm]atch:( +)?(?P<match>([\S\s]+))$')
+        p6 = regex_engine.compile(r'^[Mm]atch:( +)?(?P<match>([\S\s]+))$')
 
         # police:
-        p7 = re.compile(r'^police:+$')
+        p7 = regex_engine.compile(r'^police:+$')
 
         #  police:  cir 64000 bps, bc 8000 bytes
-        p7_1 = re.compile(r'^police: +cir (?P<cir_bps>(\d+)) bps, bc (?P<cir_bc_bytes>(\d+)) bytes$')
+        p7_1 = regex_engine.compile(r'^police: +cir (?P<cir_bps>(\d+)) bps, bc (?P<cir_bc_bytes>(\d+)) bytes$')
 
         # cir 8000 bps, bc 1500 bytes
-        p8 = re.compile(r'^cir (?P<cir_bps>(\d+)) bps, +bc +(?P<cir_bc_bytes>(\d+)) bytes$')
+        p8 = regex_engine.compile(r'^cir (?P<cir_bps>(\d+)) bps, +bc +(?P<cir_bc_bytes>(\d+)) bytes$')
 
         # 8000 bps, 1500 limit, 1500 extended limit
-        p8_1 = re.compile(r'^(?P<police_bps>(\d+)) bps, +(?P<police_limit>(\d+)) limit, +'
-                          r'(?P<extended_limit>(\d+))(.*)$')
+        p8_1 = regex_engine.compile(r'^(?P<police_bps>(\d+)) bps, +(?P<police_limit>(\d+)) limit, +'
+                                    r'(?P<extended_limit>(\d+))(.*)$')
 
         # cir 10000000 bps, be 312500 bytes
-        p8_2 = re.compile(r'^cir (?P<cir_bps>(\d+)) bps, +be +(?P<cir_be_bytes>(\d+)) bytes$')
+        p8_2 = regex_engine.compile(r'^cir (?P<cir_bps>(\d+)) bps, +be +(?P<cir_be_bytes>(\d+)) bytes$')
 
         # pir 20000 bps, be 658 bytes
-        p8_3 = re.compile(r'^pir (?P<pir_bps>(\d+)) bps, +be +(?P<pir_be_bytes>(\d+)) bytes$')
+        p8_3 = regex_engine.compile(r'^pir (?P<pir_bps>(\d+)) bps, +be +(?P<pir_be_bytes>(\d+)) bytes$')
 
         # pir 20000 bps, bc 658 bytes
-        p8_4 = re.compile(r'^pir (?P<pir_bps>(\d+)) bps, +bc +(?P<pir_bc_bytes>(\d+)) bytes$')
+        p8_4 = regex_engine.compile(r'^pir (?P<pir_bps>(\d+)) bps, +bc +(?P<pir_bc_bytes>(\d+)) bytes$')
 
         # cir 10000000000 bps, bc 30000000 bytes, be 60000000 bytes
-        p8_5 = re.compile(r'^cir (?P<cir_bps>(\d+)) bps, +bc +(?P<pir_bc_bytes>(\d+)) bytes, +be +(?P<cir_be_bytes>(\d+)) bytes$')
+        p8_5 = regex_engine.compile(r'^cir (?P<cir_bps>(\d+)) bps, +bc +(?P<pir_bc_bytes>(\d+)) bytes, +be +(?P<cir_be_bytes>(\d+)) bytes$')
 
         # rate 1000000000 bps, burst 1024000 bytes
-        p8_6 = re.compile(r'^rate (?P<rate_bps>\d+) bps, burst (?P<burst_bytes>\d+) bytes$')
+        p8_6 = regex_engine.compile(r'^rate (?P<rate_bps>\d+) bps, burst (?P<burst_bytes>\d+) bytes$')
 
         # conformed 8 packets, 800 bytes; actions:
-        p9 = re.compile(r'^conformed (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes; actions:$')
+        p9 = regex_engine.compile(r'^conformed (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes; actions:$')
 
         # conformed 800 bytes; actions:
-        p9_0 = re.compile(r'^conformed +(?P<bytes>\d+) bytes; actions:$')
+        p9_0 = regex_engine.compile(r'^conformed +(?P<bytes>\d+) bytes; actions:$')
 
         # conformed 15 packets, 6210 bytes; action:transmit
-        p9_1 = re.compile(r'^conformed (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes;'
-                          r' action:(?P<action>(\w+))$')
+        p9_1 = regex_engine.compile(r'^conformed (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes;'
+                                    r' action:(?P<action>(\w+))$')
 
         # exceeded 0 packets, 0 bytes; actions:
-        p10 = re.compile(r'^exceeded (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes; actions:$')
+        p10 = regex_engine.compile(r'^exceeded (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes; actions:$')
 
         # exceeded 0 bytes; actions:
-        p10_0 = re.compile(r'^exceeded +(?P<bytes>\d+) bytes; actions:$')
+        p10_0 = regex_engine.compile(r'^exceeded +(?P<bytes>\d+) bytes; actions:$')
 
         # exceeded 5 packets, 5070 bytes; action:drop
-        p10_1 = re.compile(r'^exceeded (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes;'
-                           r' action:(?P<action>(\w+))$')
+        p10_1 = regex_engine.compile(r'^exceeded (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes;'
+                                     r' action:(?P<action>(\w+))$')
 
         # violated 0 packets, 0 bytes; action:drop
-        p11 = re.compile(r'^violated (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes;'
-                         r' action:(?P<action>(\w+))$')
+        p11 = regex_engine.compile(r'^violated (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes;'
+                                   r' action:(?P<action>(\w+))$')
 
         # violated 0 packets, 0 bytes; actions:
-        p11_1 = re.compile(r'^violated (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes; actions:$')
+        p11_1 = regex_engine.compile(r'^violated (?P<packets>(\d+)) packets, +(?P<bytes>(\d+)) bytes; actions:$')
 
         # violated 0 bytes; actions:
-        p11_2 = re.compile(r'^violated +(?P<bytes>(\d+)) bytes; actions:$')
+        p11_2 = regex_engine.compile(r'^violated +(?P<bytes>(\d+)) bytes; actions:$')
 
         # conformed 0000 bps, exceeded 0000 bps
-        p12 = re.compile(r'^conformed +(?P<c_bps>(\d+)) bps, excee(ded|d) (?P<e_bps>(\d+)) bps$')
+        p12 = regex_engine.compile(r'^conformed +(?P<c_bps>(\d+)) bps, excee(ded|d) (?P<e_bps>(\d+)) bps$')
 
         # conformed 0 bps, exceed 0 bps, violate 0 bps
-        p12_1 = re.compile(r'^conformed +(?P<c_bps>(\d+)) bps,+ excee(d|ded) (?P<e_bps>(\d+)) bps, '
-                           r'violat(e|ed) (?P<v_bps>(\d+)) bps$')
+        p12_1 = regex_engine.compile(r'^conformed +(?P<c_bps>(\d+)) bps,+ excee(d|ded) (?P<e_bps>(\d+)) bps, '
+                                     r'violat(e|ed) (?P<v_bps>(\d+)) bps$')
 
         # drop
         # transmit
@@ -738,10 +738,10 @@ class ShowPolicyMapTypeSuperParser(ShowPolicyMapTypeSchema):
         # set-dscp-transmit ef
         # filter 'Queueing' and 'random-detect'
         # set-dscp-transmit dscp table policed-dscp
-        p13 = re.compile(r'^(?![Qr])(?P<action>drop|transmit|start|set-qos-transmit|set-mpls-exp-imposition-transmit|set-dscp-transmit|filter)( +(?P<value>.+))?$')
+        p13 = regex_engine.compile(r'^(?![Qr])(?P<action>drop|transmit|start|set-qos-transmit|set-mpls-exp-imposition-transmit|set-dscp-transmit|filter)( +(?P<value>.+))?$')
 
         # QoS Set
-        p14 = re.compile(r'^QoS +Set+$')
+        p14 = regex_engine.compile(r'^QoS +Set+$')
 
         # ip precedence 6
         # dscp af41
@@ -750,83 +750,83 @@ class ShowPolicyMapTypeSuperParser(ShowPolicyMapTypeSchema):
         # traffic-class dscp table t1
         # cos cos table t1
         # traffic-class cos table t1
-        p14_1 = re.compile(r'^(?P<key>(ip precedence|qos-group|dscp|cos|traffic-class)) +(?P<value>(\w+|(dscp table|cos table) \w+))$')
+        p14_1 = regex_engine.compile(r'^(?P<key>(ip precedence|qos-group|dscp|cos|traffic-class)) +(?P<value>(\w+|(dscp table|cos table) \w+))$')
 
         # Marker statistics: Disabled
-        p14_2 = re.compile(r'^Marker +statistics: +(?P<marker_statistics>(\w+))$')
+        p14_2 = regex_engine.compile(r'^Marker +statistics: +(?P<marker_statistics>(\w+))$')
 
         # Packets marked 500
-        p14_3 = re.compile(r'^Packets +marked +(?P<packets_marked>(\d+))$')
+        p14_3 = regex_engine.compile(r'^Packets +marked +(?P<packets_marked>(\d+))$')
 
         # mpls experimental imposition 1
-        p14_4 = re.compile(r'^mpls experimental imposition +(?P<value>.+)$')
+        p14_4 = regex_engine.compile(r'^mpls experimental imposition +(?P<value>.+)$')
 
         # Queueing
-        p15 = re.compile(r'^Queueing$')
+        p15 = regex_engine.compile(r'^Queueing$')
 
         # queue size 0, queue limit 4068
-        p16 = re.compile(r'^queue +size +(?P<queue_size>(\d+)), +queue +limit +(?P<queue_limit>(\d+))$')
+        p16 = regex_engine.compile(r'^queue +size +(?P<queue_size>(\d+)), +queue +limit +(?P<queue_limit>(\d+))$')
 
         # queue limit 64 packets
-        p17 = re.compile(r'^queue +limit +(?P<queue_limit>(\d+)) packets')
+        p17 = regex_engine.compile(r'^queue +limit +(?P<queue_limit>(\d+)) packets')
 
         # queue limit 62500 bytes
-        p17_1 = re.compile(r'^queue +limit +(?P<queue_limit_bytes>(\d+)) bytes$')
+        p17_1 = regex_engine.compile(r'^queue +limit +(?P<queue_limit_bytes>(\d+)) bytes$')
 
         # (queue depth/total drops/no-buffer drops) 0/0/0
-        p18 = re.compile(r'^\(+queue +depth/+total +drops/+no-buffer +drops+\) +(?P<queue_depth>(\d+))/'
-                         r'+(?P<total_drops>(\d+))/+(?P<no_buffer_drops>(\d+))$')
+        p18 = regex_engine.compile(r'^\(+queue +depth/+total +drops/+no-buffer +drops+\) +(?P<queue_depth>(\d+))/'
+                                   r'+(?P<total_drops>(\d+))/+(?P<no_buffer_drops>(\d+))$')
 
         # depth/total drops/no-buffer drops) 147/38/0
-        p18_1 = re.compile(r'^depth/+total +drops/+no-buffer +drops+\) +(?P<queue_depth>(\d+))/+'
-                           r'(?P<total_drops>(\d+))/+(?P<no_buffer_drops>(\d+))$')
+        p18_1 = regex_engine.compile(r'^depth/+total +drops/+no-buffer +drops+\) +(?P<queue_depth>(\d+))/+'
+                                     r'(?P<total_drops>(\d+))/+(?P<no_buffer_drops>(\d+))$')
 
         # (pkts output/bytes output) 0/0
-        p19 = re.compile(r'^\(+pkts +output/+bytes +output+\) +(?P<pkts_output>(\d+))/+(?P<bytes_output>(\d+))$')
+        p19 = regex_engine.compile(r'^\(+pkts +output/+bytes +output+\) +(?P<pkts_output>(\d+))/+(?P<bytes_output>(\d+))$')
 
         # (pkts matched/bytes matched) 363/87120
-        p19_0 = re.compile(r'^\(+pkts +matched/+bytes +matched+\) +(?P<pkts_matched>(\d+))/+(?P<bytes_matched>(\d+))$')
+        p19_0 = regex_engine.compile(r'^\(+pkts +matched/+bytes +matched+\) +(?P<pkts_matched>(\d+))/+(?P<bytes_matched>(\d+))$')
 
         # (pkts queued/bytes queued) 0/0
-        p19_1 = re.compile(r'^\(+pkts +queued/+bytes +queued+\) +(?P<pkts_queued>(\d+))/+(?P<bytes_queued>(\d+))$')
+        p19_1 = regex_engine.compile(r'^\(+pkts +queued/+bytes +queued+\) +(?P<pkts_queued>(\d+))/+(?P<bytes_queued>(\d+))$')
 
         # shape (average) cir 474656, bc 1899, be 1899
-        p20 = re.compile(r'^shape +\(+(?P<shape_type>(\w+))+\) +cir +(?P<shape_cir_bps>(\d+)), +'
-                         r'bc +(?P<shape_bc_bps>(\d+)), +be +(?P<shape_be_bps>(\d+))$')
+        p20 = regex_engine.compile(r'^shape +\(+(?P<shape_type>(\w+))+\) +cir +(?P<shape_cir_bps>(\d+)), +'
+                                   r'bc +(?P<shape_bc_bps>(\d+)), +be +(?P<shape_be_bps>(\d+))$')
 
         # target shape rate 474656
-        p21 = re.compile(r'^target +shape +rate +(?P<target_shape_rate>(\d+))$')
+        p21 = regex_engine.compile(r'^target +shape +rate +(?P<target_shape_rate>(\d+))$')
 
         # Output Queue: Conversation 266
-        p22 = re.compile(r'^Output +Queue: +(?P<output_queue>([\w\s]+))$')
+        p22 = regex_engine.compile(r'^Output +Queue: +(?P<output_queue>([\w\s]+))$')
 
         # Bandwidth 10 (%)
-        p23 = re.compile(r'^Bandwidth +(?P<bandwidth>(\d+)) .*$')
+        p23 = regex_engine.compile(r'^Bandwidth +(?P<bandwidth>(\d+)) .*$')
 
         # bandwidth 1000 (kbps)
-        p24 = re.compile(r'^bandwidth (?P<bandwidth_kbps>(\d+)) \(?kbps\)?$')
+        p24 = regex_engine.compile(r'^bandwidth (?P<bandwidth_kbps>(\d+)) \(?kbps\)?$')
 
         # bandwidth 5% (234 kbps)
-        p24_1 = re.compile(r'^bandwidth (?P<bandwidth_percent>(\d+))\% +\((?P<bandwidth_kbps>(\d+)) +kbps\)$')
+        p24_1 = regex_engine.compile(r'^bandwidth (?P<bandwidth_percent>(\d+))\% +\((?P<bandwidth_kbps>(\d+)) +kbps\)$')
 
         # exponential weight: 9
         # exponential weight:9
         # Exp-weight-constant: 9 (1/512)
         # Exp-weight-constant:9 (1/512)
-        p25 = re.compile(r'^(?P<key>(Exp-weight-constant|exponential.*)):+ *(?P<value>([\w\(\)\s\/]+))')
+        p25 = regex_engine.compile(r'^(?P<key>(Exp-weight-constant|exponential.*)):+ *(?P<value>([\w\(\)\s\/]+))')
 
         # mean queue depth: 25920
         # Mean queue depth: 0 bytes
         # Mean queue depth:0
-        p26 = re.compile(r'^(M|m)ean +queue +depth:+ *(?P<mean_queue_depth>(\d+))')
+        p26 = regex_engine.compile(r'^(M|m)ean +queue +depth:+ *(?P<mean_queue_depth>(\d+))')
 
         # class     Transmitted       Random drop      Tail drop     Minimum Maximum Mark
         # class     Transmitted       Random drop      Tail drop     Minimum Maximum Mark
         # dscp      Transmitted       Random drop      Tail drop     Minimum Maximum Mark
-        p27_1 = re.compile(r'^(class|dscp) +Transmitted +Random +drop +(Tail|Tail/Flow) +drop +Minimum +Maximum +Mark$')
+        p27_1 = regex_engine.compile(r'^(class|dscp) +Transmitted +Random +drop +(Tail|Tail/Flow) +drop +Minimum +Maximum +Mark$')
 
         # Class  Random    Tail    Minimum    Maximum     Mark      Output
-        p27_2 = re.compile(r'^Class +Random +Tail +Minimum +Maximum +Mark +Output$')
+        p27_2 = regex_engine.compile(r'^Class +Random +Tail +Minimum +Maximum +Mark +Output$')
 
         # class     Transmitted       Random drop      Tail drop     Minimum Maximum Mark
         #   0             0/0               0/0               0/0      20000    40000  1/10
@@ -836,87 +836,87 @@ class ShowPolicyMapTypeSuperParser(ShowPolicyMapTypeSchema):
         #   4             0/0               0/0               0/0      28000    40000  1/10
         # Class         Random             Tail            Minimum    Maximum   Mark   Output
         #   0             0                 0                 0        0        1/10   0
-        p27 = re.compile(r'^(?P<class>(\w+)) +(?P<value1_pkts>(\d+))/+(?P<value1_bytes>(\d+)) +'
-                         r'(?P<value2_pkts>(\d+))/+(?P<value2_bytes>(\d+)) +'
-                         r'(?P<value3_pkts>(\d+))/+(?P<value3_bytes>(\d+)) +'
-                         r'(?P<value4>([\d\/]+)) +(?P<value5>([\d\/]+)) +(?P<value6>([\d\/]+))$')
+        p27 = regex_engine.compile(r'^(?P<class>(\w+)) +(?P<value1_pkts>(\d+))/+(?P<value1_bytes>(\d+)) +'
+                                   r'(?P<value2_pkts>(\d+))/+(?P<value2_bytes>(\d+)) +'
+                                   r'(?P<value3_pkts>(\d+))/+(?P<value3_bytes>(\d+)) +'
+                                   r'(?P<value4>([\d\/]+)) +(?P<value5>([\d\/]+)) +(?P<value6>([\d\/]+))$')
 
         # policy wred-policy
-        p28 = re.compile(r'^policy +(?P<policy>([\w\-]+))$')
+        p28 = regex_engine.compile(r'^policy +(?P<policy>([\w\-]+))$')
 
         # class prec2
-        p29 = re.compile(r'^class +(?P<class>([\w\-]+))$')
+        p29 = regex_engine.compile(r'^class +(?P<class>([\w\-]+))$')
 
         # bandwidth 1000
-        p30 = re.compile(r'^bandwidth +(?P<bandwidth>(\d+))$')
+        p30 = regex_engine.compile(r'^bandwidth +(?P<bandwidth>(\d+))$')
 
         # bandwidth remaining ratio 1
-        p31 = re.compile(r'^bandwidth +remaining +ratio +(?P<bandwidth_remaining_ratio>(\d+))$')
+        p31 = regex_engine.compile(r'^bandwidth +remaining +ratio +(?P<bandwidth_remaining_ratio>(\d+))$')
 
         # bandwidth:class-based wfq, weight 25
-        p32 = re.compile(r'^bandwidth(:| )?(?P<bandwidth>([\s\w\-\,]+))$')
+        p32 = regex_engine.compile(r'^bandwidth(:| )?(?P<bandwidth>([\s\w\-\,]+))$')
 
         # random-detect
-        p33 = re.compile(r'^random-detect$')
+        p33 = regex_engine.compile(r'^random-detect$')
 
         # random-detect precedence 2 100 bytes 200 bytes 10
-        p33_1 = re.compile(r'^random-detect +precedence +(?P<precedence>(\d+)) +'
-                            r'(?P<bytes1>(\d+)) bytes +(?P<bytes2>(\d+)) bytes +(?P<bytes3>(\d+))$')
+        p33_1 = regex_engine.compile(r'^random-detect +precedence +(?P<precedence>(\d+)) +'
+                                      r'(?P<bytes1>(\d+)) bytes +(?P<bytes2>(\d+)) bytes +(?P<bytes3>(\d+))$')
 
         # packet output 90, packet drop 0
-        p34 = re.compile(r'^packet +output +(?P<packet_output>(\d+)), +packet +drop +(?P<packet_drop>(\d+))$')
+        p34 = regex_engine.compile(r'^packet +output +(?P<packet_output>(\d+)), +packet +drop +(?P<packet_drop>(\d+))$')
 
         # tail/random drop 0, no buffer drop 0, other drop 0
-        p35 = re.compile(r'^tail/random drop +(?P<tail_random_drops>(\d+)), +no buffer drop +(?P<no_buffer_drops>(\d+)), '
-                         r'+other drop +(?P<other_drops>(\d+))$')
+        p35 = regex_engine.compile(r'^tail/random drop +(?P<tail_random_drops>(\d+)), +no buffer drop +(?P<no_buffer_drops>(\d+)), '
+                                   r'+other drop +(?P<other_drops>(\d+))$')
 
         # queue limit 1966 us/ 49152 bytes
-        p36 = re.compile(r'^queue +limit +(?P<queue_limit_us>(\d+)) +us/ +(?P<queue_limit_bytes>(\d+)) bytes$')
+        p36 = regex_engine.compile(r'^queue +limit +(?P<queue_limit_us>(\d+)) +us/ +(?P<queue_limit_bytes>(\d+)) bytes$')
 
         # Priority: 10% (100000 kbps), burst bytes 2500000, b/w exceed drops: 44577300
-        p37 = re.compile(r'^Priority:\s+(?P<percent>(\d+))%\s+\((?P<kbps>(\d+))\s+kbps\),\s+burst\sbytes\s+(?P<burst_bytes>(\d)+),(\s+'
-                         r'b/w\sexceed\sdrops:\s+(?P<exceed_drops>(\d+)))?$')
+        p37 = regex_engine.compile(r'^Priority:\s+(?P<percent>(\d+))%\s+\((?P<kbps>(\d+))\s+kbps\),\s+burst\sbytes\s+(?P<burst_bytes>(\d)+),(\s+'
+                                   r'b/w\sexceed\sdrops:\s+(?P<exceed_drops>(\d+)))?$')
 
         # Priority Level: 1
-        p38 = re.compile(r'^Priority +Level: +(?P<priority_level>(\d+))$')
+        p38 = regex_engine.compile(r'^Priority +Level: +(?P<priority_level>(\d+))$')
 
         # bandwidth remaining 70%
-        p39 = re.compile(r'^bandwidth +remaining +(?P<bandwidth_remaining_percent>(\d+))%$')
+        p39 = regex_engine.compile(r'^bandwidth +remaining +(?P<bandwidth_remaining_percent>(\d+))%$')
 
         # Priority: Strict, b/w exceed drops: 0
-        p40 = re.compile(r'^Priority: +(?P<type>(\w+)), +b/w exceed drops: +(?P<exceed_drops>(\d+))$')
+        p40 = regex_engine.compile(r'^Priority: +(?P<type>(\w+)), +b/w exceed drops: +(?P<exceed_drops>(\d+))$')
 
         # cos 5
         # traffic-class 6
-        p41 = re.compile(r'^(?P<key>cos|traffic\-class)\s+(?P<value>\d+)$')
+        p41 = regex_engine.compile(r'^(?P<key>cos|traffic\-class)\s+(?P<value>\d+)$')
 
         # Virtual Class   min/max        Transmit                 Random drop                 AFD Weight
         #       0         10 / 20    (Byte)33459183360             27374016                     12
-        p42 = re.compile(r'^(?P<virtual_class>\d+)\s+(?P<min>\d+)\s*/\s*(?P<max>\d+)\s+\(Byte\)(?P<tx_bytes>\d+)\s+(?P<random_drop_bytes>\d+)\s+(?P<afd_weight>\d+)\s*$')
+        p42 = regex_engine.compile(r'^(?P<virtual_class>\d+)\s+(?P<min>\d+)\s*/\s*(?P<max>\d+)\s+\(Byte\)(?P<tx_bytes>\d+)\s+(?P<random_drop_bytes>\d+)\s+(?P<afd_weight>\d+)\s*$')
 
         #                                (Pkts)68692637637             0
-        p43 = re.compile(r'^\(Pkts\)(?P<tx_packets>\d+)\s+(?P<random_drop_packets>\d+)')
+        p43 = regex_engine.compile(r'^\(Pkts\)(?P<tx_packets>\d+)\s+(?P<random_drop_packets>\d+)')
 
         #         dscp : 1
-        p44 = re.compile(r'^dscp\s*:\s*(?P<dscp>\d+)$')
+        p44 = regex_engine.compile(r'^dscp\s*:\s*(?P<dscp>\d+)$')
 
         #     Total Drops(Bytes)   : 0
-        p45 = re.compile(r'^Total Drops\(Bytes\)\s*:\s*(?P<total_drops_bytes>\d+)$')
+        p45 = regex_engine.compile(r'^Total Drops\(Bytes\)\s*:\s*(?P<total_drops_bytes>\d+)$')
 
         #     Total Drops(Packets) : 0
-        p46 = re.compile(r'^Total Drops\(Packets\)\s*:\s*(?P<total_drops_packets>\d+)$')
+        p46 = regex_engine.compile(r'^Total Drops\(Packets\)\s*:\s*(?P<total_drops_packets>\d+)$')
 
         # (total drops) 0
-        p47 = re.compile(r'^\(total +drops\) +(?P<total_drops>(\d+))$')
+        p47 = regex_engine.compile(r'^\(total +drops\) +(?P<total_drops>(\d+))$')
 
         # (bytes output) 3392
-        p48 = re.compile(r'^\(bytes +output\) +(?P<bytes_output>(\d+))$')
+        p48 = regex_engine.compile(r'^\(bytes +output\) +(?P<bytes_output>(\d+))$')
 
         # Overhead Accounting Enabled
-        p49 = re.compile(r'Overhead +Accounting +(?P<enabled>([\w\-]+))$')
+        p49 = regex_engine.compile(r'Overhead +Accounting +(?P<enabled>([\w\-]+))$')
 
         # Fair-queue: per-flow queue limit 128 packets
-        p50 = re.compile(r'^Fair-queue: +per-flow +queue +limit +(?P<queue_limit>\d+) +packets$')
+        p50 = regex_engine.compile(r'^Fair-queue: +per-flow +queue +limit +(?P<queue_limit>\d+) +packets$')
 
         # -1 depth since the top policy-map is a child element, but has depth 0
         dict_stack = [(-1, ret_dict)]
@@ -2033,55 +2033,55 @@ class ShowPolicyMapControlPlaneClassMap(ShowPolicyMapControlPlaneClassMapSchema)
         # Class-map: Ping_Class (match-all)
         # Class-map:TEST (match-all)
         # Class-map: TEST-OTTAWA_CANADA#PYATS (match-any)
-        p1 = re.compile(r'^[Cc]lass-map *:( +)?(?P<class_map>\S+) +(?P<match_all>(.*))$')
+        p1 = regex_engine.compile(r'^[Cc]lass-map *:( +)?(?P<class_map>\S+) +(?P<match_all>(.*))$')
 
         # 8 packets, 800 bytes
-        p2 = re.compile(r'^(?P<packets>(\d+)) packets, (?P<bytes>(\d+)) +bytes$')
+        p2 = regex_engine.compile(r'^(?P<packets>(\d+)) packets, (?P<bytes>(\d+)) +bytes$')
 
         # 5 minute offered rate 0000 bps, drop rate 0000 bps
-        p3 = re.compile(r'^(?P<interval>(\d+)) +minute +offered +rate +(?P<offered_rate>(\d+)) bps, +drop +rate +(?P<drop_rate>(\d+)) bps$')
+        p3 = regex_engine.compile(r'^(?P<interval>(\d+)) +minute +offered +rate +(?P<offered_rate>(\d+)) bps, +drop +rate +(?P<drop_rate>(\d+)) bps$')
 
         # 30 second offered rate 15000 bps, drop rate 300 bps
-        p3_1 = re.compile(r'^(?P<interval>(\d+)) +second +offered +rate +(?P<offered_rate>(\d+)) bps, +drop +rate +(?P<drop_rate>(\d+)) bps$')
+        p3_1 = regex_engine.compile(r'^(?P<interval>(\d+)) +second +offered +rate +(?P<offered_rate>(\d+)) bps, +drop +rate +(?P<drop_rate>(\d+)) bps$')
 
         # Match: access-group name Ping_Option
         # Match: access-group name PYATS-MARKING_IN#CUSTOM__ACL
-        p4= re.compile(r'^[Mm]atch:( +)?(?P<match>([\S\s]+))$')
+        p4= regex_engine.compile(r'^[Mm]atch:( +)?(?P<match>([\S\s]+))$')
 
         # police:
-        p5 = re.compile(r'^police:$')
+        p5 = regex_engine.compile(r'^police:$')
 
         #  police:  cir 64000 bps, bc 8000 bytes
-        p5_1 = re.compile(r'^police: +cir (?P<cir_bps>(\d+)) bps, bc (?P<cir_bc_bytes>(\d+)) bytes$')
+        p5_1 = regex_engine.compile(r'^police: +cir (?P<cir_bps>(\d+)) bps, bc (?P<cir_bc_bytes>(\d+)) bytes$')
 
         # cir 8000 bps, bc 1500 bytes
-        p6 = re.compile(r'^cir (?P<cir_bps>(\d+)) bps, +bc +(?P<cir_bc_bytes>(\d+)) bytes$')
+        p6 = regex_engine.compile(r'^cir (?P<cir_bps>(\d+)) bps, +bc +(?P<cir_bc_bytes>(\d+)) bytes$')
 
         # 8000 bps, 1500 limit, 1500 extended limit
-        p6_1 = re.compile(r'^(?P<police_bps>(\d+)) bps, +(?P<police_limit>(\d+)) limit, +'
-                          r'(?P<extended_limit>(\d+))(.*)$')
+        p6_1 = regex_engine.compile(r'^(?P<police_bps>(\d+)) bps, +(?P<police_limit>(\d+)) limit, +'
+                                    r'(?P<extended_limit>(\d+))(.*)$')
 
         # cir 10000000 bps, be 312500 bytes
-        p6_2 = re.compile(r'^cir (?P<cir_bps>(\d+)) bps, +be +(?P<cir_be_bytes>(\d+)) bytes$')
+        p6_2 = regex_engine.compile(r'^cir (?P<cir_bps>(\d+)) bps, +be +(?P<cir_be_bytes>(\d+)) bytes$')
 
         # conformed 8 packets, 800 bytes; actions:
         # conformed 800 bytes; actions:
         # conformed 15 packets, 6210 bytes; action:transmit
-        p7 = re.compile(r'^conformed( (?P<packets>(\d+)) packets,)? +(?P<bytes>(\d+)) bytes; (action:|actions:)((?P<action>(\w+)))?$')
+        p7 = regex_engine.compile(r'^conformed( (?P<packets>(\d+)) packets,)? +(?P<bytes>(\d+)) bytes; (action:|actions:)((?P<action>(\w+)))?$')
 
         # exceeded 0 packets, 0 bytes; actions:
         # exceeded 5 packets, 5070 bytes; action:drop
         # exceeded 0 bytes; actions:
-        p8 = re.compile(r'^exceeded( (?P<packets>(\d+)) packets,)? +(?P<bytes>(\d+)) bytes; (action:|actions:)((?P<action>(\w+)))?$')
+        p8 = regex_engine.compile(r'^exceeded( (?P<packets>(\d+)) packets,)? +(?P<bytes>(\d+)) bytes; (action:|actions:)((?P<action>(\w+)))?$')
 
         # violated 0 packets, 0 bytes; action:drop
         # violated 0 packets, 0 bytes; actions:
         # violated 0 bytes; actions:
-        p9 = re.compile(r'^violated( (?P<packets>(\d+)) packets,)? +(?P<bytes>(\d+)) bytes; (action:|actions:)((?P<action>(\w+)))?$')
+        p9 = regex_engine.compile(r'^violated( (?P<packets>(\d+)) packets,)? +(?P<bytes>(\d+)) bytes; (action:|actions:)((?P<action>(\w+)))?$')
 
         # conformed 0000 bps, exceeded 0000 bps
         # conformed 0 bps, exceed 0 bps, violate 0 bps
-        p10 = re.compile(r'^conformed +(?P<c_bps>(\d+)) bps,+ excee(d|ded) (?P<e_bps>(\d+)) bps(, violat(e|ed) (?P<v_bps>(\d+)) bps)?$')
+        p10 = regex_engine.compile(r'^conformed +(?P<c_bps>(\d+)) bps,+ excee(d|ded) (?P<e_bps>(\d+)) bps(, violat(e|ed) (?P<v_bps>(\d+)) bps)?$')
 
         # drop
         # transmit
@@ -2091,21 +2091,21 @@ class ShowPolicyMapControlPlaneClassMap(ShowPolicyMapControlPlaneClassMapSchema)
         # set-dscp-transmit ef
         # filter 'Queueing' and 'random-detect'
         # set-dscp-transmit dscp table policed-dscp
-        p12 = re.compile(r'^(?![Qr])(?P<action>drop|transmit|start|set-qos-transmit|set-mpls-exp-imposition-transmit|set-dscp-transmit|filter)( +(?P<value>.+))?$')
+        p12 = regex_engine.compile(r'^(?![Qr])(?P<action>drop|transmit|start|set-qos-transmit|set-mpls-exp-imposition-transmit|set-dscp-transmit|filter)( +(?P<value>.+))?$')
 
         # QoS Set
-        p11 = re.compile(r'^QoS +Set$')
+        p11 = regex_engine.compile(r'^QoS +Set$')
 
         # ip precedence 6
         # dscp af41
         # qos-group 20
-        p11_1 = re.compile(r'^(?P<key>(ip precedence|qos-group|dscp)) +(?P<value>(\w+))$')
+        p11_1 = regex_engine.compile(r'^(?P<key>(ip precedence|qos-group|dscp)) +(?P<value>(\w+))$')
 
         # Marker statistics: Disabled
-        p11_2 = re.compile(r'^Marker +statistics: +(?P<marker_statistics>(\w+))$')
+        p11_2 = regex_engine.compile(r'^Marker +statistics: +(?P<marker_statistics>(\w+))$')
         
         #rate 2000 pps, burst 11264 packets
-        p13 = re.compile(r'^rate +(?P<rate_pps>(\d+)) pps, +burst +(?P<burst_pkt>(\d+)) packets$')
+        p13 = regex_engine.compile(r'^rate +(?P<rate_pps>(\d+)) pps, +burst +(?P<burst_pkt>(\d+)) packets$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2434,83 +2434,83 @@ class ShowPolicyMap(ShowPolicyMapSchema):
         # Policy Map police-in
         # Policy Map policy_4-6-3~6
         # Policy-map egress policy
-        p1 = re.compile(r'^Policy(\-map| Map) +(?P<policy_map>([\S\s]+))$')
+        p1 = regex_engine.compile(r'^Policy(\-map| Map) +(?P<policy_map>([\S\s]+))$')
 
         # Class class-default
         # Class class c1
         # Class class_4-6-3
-        p2 = re.compile(r'^Class +(?P<class_map>([\S\s]+))$')
+        p2 = regex_engine.compile(r'^Class +(?P<class_map>([\S\s]+))$')
 
         # police 8000 9216 0
-        p2_0 = re.compile(r'^police +(?P<cir_bps>(\d+)) +(?P<cir_bc_bytes>(\d+)) +(?P<cir_be_bytes>(\d+))$')
+        p2_0 = regex_engine.compile(r'^police +(?P<cir_bps>(\d+)) +(?P<cir_bc_bytes>(\d+)) +(?P<cir_be_bytes>(\d+))$')
 
         # police cir percent 20 bc 300 ms pir percent 40 be 400 ms
-        p2_1 = re.compile(r'^police +cir +percent +(?P<cir_percent>(\d+)) +bc +(?P<bc_ms>(\d+)) +ms +pir +percent +'
-                           r'(?P<pir_percent>(\d+)) +be +(?P<be_ms>(\d+)) ms$')
+        p2_1 = regex_engine.compile(r'^police +cir +percent +(?P<cir_percent>(\d+)) +bc +(?P<bc_ms>(\d+)) +ms +pir +percent +'
+                                     r'(?P<pir_percent>(\d+)) +be +(?P<be_ms>(\d+)) ms$')
 
         # police cir 1000000 bc 31250 pir 2000000 be 31250
-        p2_2 = re.compile(r'^police +cir +(?P<cir_bps>(\d+)) +bc +(?P<cir_bc_bytes>(\d+)) +pir +(?P<pir>(\d+)) +be +(?P<pir_be_bytes>(\d+))$')
+        p2_2 = regex_engine.compile(r'^police +cir +(?P<cir_bps>(\d+)) +bc +(?P<cir_bc_bytes>(\d+)) +pir +(?P<pir>(\d+)) +be +(?P<pir_be_bytes>(\d+))$')
 
         # police rate 2000 pps
         # police rate 10000000000
-        p2_3 = re.compile(r'^police +rate +(?P<rate>\d+)\s*((?P<rate_mode>pps))?$')
+        p2_3 = regex_engine.compile(r'^police +rate +(?P<rate>\d+)\s*((?P<rate_mode>pps))?$')
 
         # police rate percent 10
-        p2_4 = re.compile(r'^police +rate +percent +(?P<rate_percent>\d+)$')
+        p2_4 = regex_engine.compile(r'^police +rate +percent +(?P<rate_percent>\d+)$')
 
         # police cir 445500 bc 83619
-        p3 = re.compile(r'^police +cir +(?P<cir_bps>(\d+)) +bc +(?P<cir_bc_bytes>(\d+))$')
+        p3 = regex_engine.compile(r'^police +cir +(?P<cir_bps>(\d+)) +bc +(?P<cir_bc_bytes>(\d+))$')
 
         # police cir 50000 bc 3000 be 3000
-        p3_0 = re.compile(r'^police +cir +(?P<cir_bps>(\d+)) +bc +(?P<cir_bc_bytes>(\d+)) +be +(?P<cir_be_bytes>(\d+))$')
+        p3_0 = regex_engine.compile(r'^police +cir +(?P<cir_bps>(\d+)) +bc +(?P<cir_bc_bytes>(\d+)) +be +(?P<cir_be_bytes>(\d+))$')
 
         # conform-action transmit
-        p3_1 = re.compile(r'^conform-action +(?P<conform_action>([\w\-\s]+))$')
+        p3_1 = regex_engine.compile(r'^conform-action +(?P<conform_action>([\w\-\s]+))$')
 
         # exceed-action drop
-        p3_2 = re.compile(r'^exceed-action +(?P<exceed_action>([\w\-\s]+))$')
+        p3_2 = regex_engine.compile(r'^exceed-action +(?P<exceed_action>([\w\-\s]+))$')
 
         # conform-color hipri-conform
-        p3_3 = re.compile(r'^conform-color +(?P<conform_color>([\w\-\s]+))$')
+        p3_3 = regex_engine.compile(r'^conform-color +(?P<conform_color>([\w\-\s]+))$')
 
         # violate - action drop
-        p3_4 = re.compile(r'^violate-action +(?P<violate_action>([\w\-\s]+))$')
+        p3_4 = regex_engine.compile(r'^violate-action +(?P<violate_action>([\w\-\s]+))$')
 
         # service-policy child-policy
-        p3_5 = re.compile(r'^service-policy +(?P<service_policy>([\w\-\s]+))$')
+        p3_5 = regex_engine.compile(r'^service-policy +(?P<service_policy>([\w\-\s]+))$')
 
         # Average Rate Traffic Shaping
-        p4 = re.compile(r'^Average +Rate +Traffic +Shaping$')
+        p4 = regex_engine.compile(r'^Average +Rate +Traffic +Shaping$')
 
         # Adaptive Rate Traffic Shaping
-        p4_0 = re.compile(r'Adaptive +Rate +Traffic +Shaping$')
+        p4_0 = regex_engine.compile(r'Adaptive +Rate +Traffic +Shaping$')
 
         #cir upper-bound 2120000 (bps) cir lower-bound 1120000 (bps)
-        p4_1 = re.compile(r'^cir +upper-bound +(?P<cir_upper_bound_bps>(\d+)) \(bps\) +cir +lower-bound +(?P<cir_lower_bound_bps>(\d+)) \(bps\)$')
+        p4_1 = regex_engine.compile(r'^cir +upper-bound +(?P<cir_upper_bound_bps>(\d+)) \(bps\) +cir +lower-bound +(?P<cir_lower_bound_bps>(\d+)) \(bps\)$')
 
         # cir 1000000 (bps) bc 10000000 (bits) be 1000000 (bits)
-        p5 = re.compile(r'^cir +(?P<cir>(\d+)) *\(?(?P<cir_unit>[\w%]+)\)?( +bc +(?P<bc>(\d+)) +\((?P<bc_unit>\w+)\))?( +be +(?P<be>(\d+)) +\((?P<be_unit>\w+)\))?$')
+        p5 = regex_engine.compile(r'^cir +(?P<cir>(\d+)) *\(?(?P<cir_unit>[\w%]+)\)?( +bc +(?P<bc>(\d+)) +\((?P<bc_unit>\w+)\))?( +be +(?P<be>(\d+)) +\((?P<be_unit>\w+)\))?$')
 
         # priority level 1 20000 (kb/s)
-        p6 = re.compile(r'^priority +level +(?P<pri_level>(\d+)) +(?P<kb_per_sec>(\d+)) \(kb\/s\)$')
+        p6 = regex_engine.compile(r'^priority +level +(?P<pri_level>(\d+)) +(?P<kb_per_sec>(\d+)) \(kb\/s\)$')
 
         # bandwidth 20000 (kb/s)
         # bandwidth 100
-        p7_0 = re.compile(r'^bandwidth +(?P<bandwidth>(\d+))(?: \(kb[p/]s\))?$')
+        p7_0 = regex_engine.compile(r'^bandwidth +(?P<bandwidth>(\d+))(?: \(kb[p/]s\))?$')
 
         # Bandwidth 70 (%)
         # bandwidth 80 (%)
         # bandwidth percent 5
-        p7 = re.compile(r'^[bB]andwidth(:? percent)? +(?P<bandwidth>(\d+))(?: \(%\))?$')
+        p7 = regex_engine.compile(r'^[bB]andwidth(:? percent)? +(?P<bandwidth>(\d+))(?: \(%\))?$')
 
         # Weighted Fair Queueing
-        p8 = re.compile(r'^Weighted +Fair +Queueing$')
+        p8 = regex_engine.compile(r'^Weighted +Fair +Queueing$')
 
         # exponential weight 9
-        p8_1 = re.compile(r'^exponential +weight +(?P<exponential_weight>(\d+))$')
+        p8_1 = regex_engine.compile(r'^exponential +weight +(?P<exponential_weight>(\d+))$')
 
         # explicit congestion notification
-        p8_2 = re.compile(r'^explicit +congestion +notification$')
+        p8_2 = regex_engine.compile(r'^explicit +congestion +notification$')
 
         # class    min-threshold    max-threshold    mark-probability
         # ----------------------------------------------------------
@@ -2526,57 +2526,57 @@ class ShowPolicyMap(ShowPolicyMapSchema):
         # rsvp     -                -                1/10
         # default (0)   -                -                1/10
 
-        p8_3 = re.compile(r'^(?P<class_val>(\w+(\s+\(\d+\))?)) +(?P<min_threshold>([\w\-]+)) +(?P<max_threshold>([\w\-]+)) '
-                           r'+(?P<mark_probability>([0-9]+)/([0-9]+))$')
+        p8_3 = regex_engine.compile(r'^(?P<class_val>(\w+(\s+\(\d+\))?)) +(?P<min_threshold>([\w\-]+)) +(?P<max_threshold>([\w\-]+)) '
+                                     r'+(?P<mark_probability>([0-9]+)/([0-9]+))$')
 
         # cir 30% bc 10 (msec) be 10 (msec)
-        p9 = re.compile(r'^cir +(?P<cir_percent>(\d+))% +bc (?P<bc_msec>(\d+)) \(msec\) +'
-                         r'be (?P<be_msec>(\d+)) \(msec\)$')
+        p9 = regex_engine.compile(r'^cir +(?P<cir_percent>(\d+))% +bc (?P<bc_msec>(\d+)) \(msec\) +'
+                                   r'be (?P<be_msec>(\d+)) \(msec\)$')
 
         # priority
-        p10 = re.compile(r'^priority( +(?P<priority_kbps>\d+) +\(kbps\))?$')
+        p10 = regex_engine.compile(r'^priority( +(?P<priority_kbps>\d+) +\(kbps\))?$')
 
         # priority level 1
-        p10_1 = re.compile(r'^priority +level +(?P<priority_levels>(\d+))$')
+        p10_1 = regex_engine.compile(r'^priority +level +(?P<priority_levels>(\d+))$')
         
         # priority 8 (%)
-        p10_2 = re.compile(r'^priority +(?P<priority_percent>(\d+)) .*$')
+        p10_2 = regex_engine.compile(r'^priority +(?P<priority_percent>(\d+)) .*$')
 
         # Set cos 5
         # set dscp cs1
-        p11 = re.compile(r'^[sS]et +(?P<set>([\w\s]+))$')
+        p11 = regex_engine.compile(r'^[sS]et +(?P<set>([\w\s]+))$')
 
         # Shape average 30m
-        p12 = re.compile(r'^Shape +average +(?P<shape_average_min>(\d+))m$')
+        p12 = regex_engine.compile(r'^Shape +average +(?P<shape_average_min>(\d+))m$')
 
         # bandwidth 100
-        p13 = re.compile(r'^bandwidth +(?P<bandwidth>(\d+))$')
+        p13 = regex_engine.compile(r'^bandwidth +(?P<bandwidth>(\d+))$')
 
         # bandwidth remaining percent 50
         # bandwidth remaining 80 (%)
-        p14 = re.compile(r'^^bandwidth remaining(?: percent)? +(?P<bandwidth_remaining_percent>(\d+))(:? \(%\))?$')
+        p14 = regex_engine.compile(r'^^bandwidth remaining(?: percent)? +(?P<bandwidth_remaining_percent>(\d+))(:? \(%\))?$')
 
         # bandwidth remaining ratio 100
-        p14_1 = re.compile(r'^bandwidth remaining ratio +(?P<bandwidth_remaining_ratio>(\d+))$')
+        p14_1 = regex_engine.compile(r'^bandwidth remaining ratio +(?P<bandwidth_remaining_ratio>(\d+))$')
 
         # police cir 500000 conform-burst 10000 pir 1000000 peak-burst 10000 conform-action transmit exceed-action set-prec-transmit 2 violate-action drop
-        p15 = re.compile(r'^police +cir +(?P<cir_bps>(\d+)) +conform-burst +(?P<conform_burst>(\d+)) +'
-                          r'pir +(?P<pir>(\d+)) +peak-burst +(?P<peak_burst>(\d+)) +conform-action +'
-                          r'(?P<conform_action>(\w+)) +exceed-action +(?P<exceed_action>([\w\-\s]+)) +'
-                          r'violate-action +(?P<violate_action>(\w+))$')
+        p15 = regex_engine.compile(r'^police +cir +(?P<cir_bps>(\d+)) +conform-burst +(?P<conform_burst>(\d+)) +'
+                                    r'pir +(?P<pir>(\d+)) +peak-burst +(?P<peak_burst>(\d+)) +conform-action +'
+                                    r'(?P<conform_action>(\w+)) +exceed-action +(?P<exceed_action>([\w\-\s]+)) +'
+                                    r'violate-action +(?P<violate_action>(\w+))$')
 
         # police percent 5 2 ms 0 ms conform-action transmit exceed-action drop violate-action drop
-        p15_1 = re.compile(r'^police +percent +(?P<cir_percent>(\d+)) +(?P<bc_ms>(\d+)) ms +(?P<be_ms>(\d+)) ms +conform-action +(?P<conform_action>(\w+)) '
-                            r'+exceed-action +(?P<exceed_action>([\w\-\s]+)) +violate-action +(?P<violate_action>(\w+))$')
+        p15_1 = regex_engine.compile(r'^police +percent +(?P<cir_percent>(\d+)) +(?P<bc_ms>(\d+)) ms +(?P<be_ms>(\d+)) ms +conform-action +(?P<conform_action>(\w+)) '
+                                      r'+exceed-action +(?P<exceed_action>([\w\-\s]+)) +violate-action +(?P<violate_action>(\w+))$')
 
         # time-based wred, exponential weight 9
-        p16 = re.compile(r'^(?P<wred_type>[\w-]+) +wred, +exponential +weight +(?P<exponential_weight>(\d+))$')
+        p16 = regex_engine.compile(r'^(?P<wred_type>[\w-]+) +wred, +exponential +weight +(?P<exponential_weight>(\d+))$')
 
         # queue-limit 200 ms
-        p17 = re.compile(r'^queue-limit +(?P<queue_limit_ms>(\d+)) ms$')
+        p17 = regex_engine.compile(r'^queue-limit +(?P<queue_limit_ms>(\d+)) ms$')
 
         # queue-limit 77 packets
-        p17_1 = re.compile(r'^queue-limit +(?P<queue_limit_packets>(\d+)) packets$')
+        p17_1 = regex_engine.compile(r'^queue-limit +(?P<queue_limit_packets>(\d+)) packets$')
 
         for line in out.splitlines():
 
@@ -2991,10 +2991,10 @@ class ShowPolicyMapTypeControlSubscriberBindingPolicyName(ShowPolicyMapTypeContr
         ret_dict = {}
 
         #PMAP_DefaultWiredDot1xClosedAuth_1X_MAB          Gi1/0/1
-        p1 = re.compile(r'^(?P<pname>\S+)?\s+(?P<int>[\w\/]+)$')
+        p1 = regex_engine.compile(r'^(?P<pname>\S+)?\s+(?P<int>[\w\/]+)$')
 
         #                                                 Gi1/1/1
-        p2 = re.compile(r'^(?P<int>[\w\/]+)$')
+        p2 = regex_engine.compile(r'^(?P<int>[\w\/]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3057,13 +3057,13 @@ class ShowPolicyMapClass(ShowPolicyMapClassSchema):
             line = line.strip()
 
             # Class AutoQos-4.0-Output-Priority-Queue
-            p1 = re.compile(r'^Class\s+(?P<class_name>\S+)$')
+            p1 = regex_engine.compile(r'^Class\s+(?P<class_name>\S+)$')
 
             # priority level 1 10 (%)
-            p2 = re.compile(r'^priority\slevel\s(?P<priority_level>\d+)\s+(?P<priority_percent>\d+)\s+\(\%\)$')
+            p2 = regex_engine.compile(r'^priority\slevel\s(?P<priority_level>\d+)\s+(?P<priority_percent>\d+)\s+\(\%\)$')
 
             # bandwidth remaining 10 (%)
-            p3 = re.compile(r'^bandwidth\sremaining\s+(?P<bandwidth_remaining_percent>\d+)\s+\(\%\)$')
+            p3 = regex_engine.compile(r'^bandwidth\sremaining\s+(?P<bandwidth_remaining_percent>\d+)\s+\(\%\)$')
 
             # Class AutoQos-4.0-Output-Priority-Queue
             m = p1.match(line)
@@ -3108,80 +3108,80 @@ class ShowPolicyMapTypeQueueingSuperParser(ShowPolicyMapTypeSchema):
         priority_level_status = False
 
         # GigabitEthernet0/1/5
-        p0 = re.compile(r'^(?P<top_level>(Control Plane|Giga.*|FiveGiga.*|[Pp]seudo.*|Fast.*|[Ss]erial.*|'
-                         r'Ten.*|[Ee]thernet.*|[Tt]unnel.*))$')
+        p0 = regex_engine.compile(r'^(?P<top_level>(Control Plane|Giga.*|FiveGiga.*|[Pp]seudo.*|Fast.*|[Ss]erial.*|'
+                                   r'Ten.*|[Ee]thernet.*|[Tt]unnel.*))$')
 
         # Port-channel1: Service Group 1
-        p0_1 = re.compile(r'^(?P<top_level>([Pp]ort.*)): +Service Group +(?P<service_group>(\d+))$')
+        p0_1 = regex_engine.compile(r'^(?P<top_level>([Pp]ort.*)): +Service Group +(?P<service_group>(\d+))$')
 
         # Service-policy queueing output: parent
         # Service-policy queueing : child
-        p1 = re.compile(r'^[Ss]ervice-policy queueing +(?P<service_policy>(|output)):+ *(?P<policy_name>([\w\-]+).*)')
+        p1 = regex_engine.compile(r'^[Ss]ervice-policy queueing +(?P<service_policy>(|output)):+ *(?P<policy_name>([\w\-]+).*)')
 
         # service policy : child
-        p1_1 = re.compile(r'^Service-policy *:+ *(?P<policy_name>([\w\-]+))$')
+        p1_1 = regex_engine.compile(r'^Service-policy *:+ *(?P<policy_name>([\w\-]+))$')
 
         # Class-map: Ping_Class (match-all)
         # Class-map:TEST (match-all)
         # Class-map: TEST-OTTAWA_CANADA#PYATS (match-any)
-        p2 = re.compile(r'^[Cc]lass-map *:(\s*)?(?P<class_map>\S+) +\((?P<match_all>[\w-]+)\)$')
+        p2 = regex_engine.compile(r'^[Cc]lass-map *:(\s*)?(?P<class_map>\S+) +\((?P<match_all>[\w-]+)\)$')
 
         # queue stats for all priority classes:
-        p2_1 = re.compile(r'^queue +stats +for +all +priority +classes:$')
+        p2_1 = regex_engine.compile(r'^queue +stats +for +all +priority +classes:$')
 
         # priority level 2
-        p2_1_1 = re.compile(r'^priority +level +(?P<priority_level>(\d+))$')
+        p2_1_1 = regex_engine.compile(r'^priority +level +(?P<priority_level>(\d+))$')
 
         # 8 packets, 800 bytes
-        p3 = re.compile(r'^(?P<packets>(\d+)) packets(, (?P<bytes>(\d+)) +bytes)?')
+        p3 = regex_engine.compile(r'^(?P<packets>(\d+)) packets(, (?P<bytes>(\d+)) +bytes)?')
 
         # 8 packets
-        p3_1 = re.compile(r'^(?P<packets>(\d+)) packets')
+        p3_1 = regex_engine.compile(r'^(?P<packets>(\d+)) packets')
 
 
         # Match: access-group name Ping_Option
         # Match: access-group name PYATS-MARKING_IN#CUSTOM__ACL
         # Match: traffic-class 7
-        p4 = re.compile(r'^[Mm]atch:( +)?(?P<match>([\S\s]+))$')
+        p4 = regex_engine.compile(r'^[Mm]atch:( +)?(?P<match>([\S\s]+))$')
 
 
         # Queueing
-        p5 = re.compile(r'^Queueing$')
+        p5 = regex_engine.compile(r'^Queueing$')
 
         # queue size 0, queue limit 4068
-        p6 = re.compile(r'^queue +size +(?P<queue_size>(\d+)), +queue +limit +(?P<queue_limit>(\d+))$')
+        p6 = regex_engine.compile(r'^queue +size +(?P<queue_size>(\d+)), +queue +limit +(?P<queue_limit>(\d+))$')
 
         # queue limit 64 packets
-        p7 = re.compile(r'^queue +limit +(?P<queue_limit>(\d+)) packets$')
+        p7 = regex_engine.compile(r'^queue +limit +(?P<queue_limit>(\d+)) packets$')
 
         # queue limit 62500 bytes
-        p8 = re.compile(r'^queue +limit +(?P<queue_limit_bytes>(\d+)) bytes$')
+        p8 = regex_engine.compile(r'^queue +limit +(?P<queue_limit_bytes>(\d+)) bytes$')
 
         # (total drops) 0
-        p9 = re.compile(r'^\(total +drops\) +(?P<total_drops>(\d+))$')
+        p9 = regex_engine.compile(r'^\(total +drops\) +(?P<total_drops>(\d+))$')
 
         # (bytes output) 0
-        p10 = re.compile(r'^\(bytes +output\) +(?P<bytes_output>(\d+))$')
+        p10 = regex_engine.compile(r'^\(bytes +output\) +(?P<bytes_output>(\d+))$')
 
         # shape (average) cir 474656, bc 1899, be 1899
-        p11 = re.compile(r'^shape +\(+(?P<shape_type>(\w+))+\) +cir +(?P<shape_cir_bps>(\d+)), +'
-                            r'bc +(?P<shape_bc_bps>(\d+)), +be +(?P<shape_be_bps>(\d+))$')
+        p11 = regex_engine.compile(r'^shape +\(+(?P<shape_type>(\w+))+\) +cir +(?P<shape_cir_bps>(\d+)), +'
+                                      r'bc +(?P<shape_bc_bps>(\d+)), +be +(?P<shape_be_bps>(\d+))$')
 
         # target shape rate 474656
-        p12 = re.compile(r'^target +shape +rate +(?P<target_shape_rate>(\d+))$')
+        p12 = regex_engine.compile(r'^target +shape +rate +(?P<target_shape_rate>(\d+))$')
 
         # queue limit 1966 us/ 49152 bytes
-        p13 = re.compile(r'^queue +limit +(?P<queue_limit_us>(\d+)) +us/ +(?P<queue_limit_bytes>(\d+)) bytes$')
+        p13 = regex_engine.compile(r'^queue +limit +(?P<queue_limit_us>(\d+)) +us/ +(?P<queue_limit_bytes>(\d+)) bytes$')
 
         # Priority: 10% (100000 kbps), burst bytes 2500000, b/w exceed drops: 44577300
-        p14 = re.compile(r'^Priority:\s+(?P<percent>(\d+))%\s+\((?P<kbps>(\d+))\s+kbps\),\s+burst\sbytes\s+(?P<burst_bytes>(\d)+),(\s+'
-                          r'b/w\sexceed\sdrops:\s+(?P<exceed_drops>(\d+)))?$')
+        p14 = regex_engine.compile(r'^Priority:\s+(?P<percent>(\d+))%\s+\((?P<kbps>(\d+))\s+kbps\),\s+burst\sbytes\s+(?P<burst_bytes>(\d)+),(\s+'
+                                    r'b/w\sexceed\sdrops:\s+(?P<exceed_drops>(\d+)))?$')
 
         # Priority Level: 1
-        p15 = re.compile(r'^Priority +Level: +(?P<priority_level>(\d+))$')
+        p15 = regex_engine.compile(r'^Priority +Level: +(?P<priority_level>(\d+))$')
 
         # Priority: Strict, b/w exceed drops: 0
-        p16 = re.compile(r'^Priority: +(?P<type>(\w+)), +b/w exceed drops: +(?P<exceed_drops>(\d+))$')
+        p16 = regex_engine.compile(r'^Priority: +(?P<type>(\w+)), +b/w exceed drops: +(?P<exceed_drops>(\d+))$')
 
         count=0
 
@@ -3472,37 +3472,37 @@ class ShowPolicyMapTypeQueueingPolicyname(ShowPolicyMapTypeQueueingPolicynameSch
         ret_dict = {}
 
         # Policy Map type queueing RED
-        p1 = re.compile(r'^Policy(\-map| Map) type queueing +(?P<policy_name>([\w\s\-]+))$')
+        p1 = regex_engine.compile(r'^Policy(\-map| Map) type queueing +(?P<policy_name>([\w\s\-]+))$')
 
         # Class class-default
-        p2 = re.compile(r'^Class +(?P<class_map>([\S\s]+))$')
+        p2 = regex_engine.compile(r'^Class +(?P<class_map>([\S\s]+))$')
 
         # Average Rate Traffic Shaping
-        p3 = re.compile(r'^Average +Rate +Traffic +Shaping$')
+        p3 = regex_engine.compile(r'^Average +Rate +Traffic +Shaping$')
 
         # cir 10%
-        p4 = re.compile(r'^cir +(?P<cir_percent>(\d+))%$')
+        p4 = regex_engine.compile(r'^cir +(?P<cir_percent>(\d+))%$')
 
         # cir 100000000 (bps)
-        p4_1 = re.compile(r'^cir +(?P<cir_bps>\d+) \(bps\)$')
+        p4_1 = regex_engine.compile(r'^cir +(?P<cir_bps>\d+) \(bps\)$')
 
         # queue-limit 100000000 bytes
-        p5 = re.compile(r'^queue-limit +(?P<queue_limit_bytes>(\d+)) bytes$')
+        p5 = regex_engine.compile(r'^queue-limit +(?P<queue_limit_bytes>(\d+)) bytes$')
 
         # percent-based wred, exponential weight 1
-        p6 = re.compile(r'^(?P<wred_type>[\w-]+) +wred, +exponential +weight +(?P<exponential_weight>(\d+))$')
+        p6 = regex_engine.compile(r'^(?P<wred_type>[\w-]+) +wred, +exponential +weight +(?P<exponential_weight>(\d+))$')
 
         # discard-class    min-threshold    max-threshold    mark-probablity
         # -------------------------------------------------------------------
         # 0                1                 100                   1/1
         # 1                -                  -                    1/1
-        p7 = re.compile(r'^(?P<class_val>(\w+(\s+\(\d+\))?)) +(?P<min_threshold>([\w\-]+)) +(?P<max_threshold>([\w\-]+)) +(?P<mark_probability>([0-9]+)/([0-9]+))$')
+        p7 = regex_engine.compile(r'^(?P<class_val>(\w+(\s+\(\d+\))?)) +(?P<min_threshold>([\w\-]+)) +(?P<max_threshold>([\w\-]+)) +(?P<mark_probability>([0-9]+)/([0-9]+))$')
 
         # bandwidth remaining ratio 10
-        p8 = re.compile(r'^bandwidth remaining ratio (?P<bandwidth_remaining_ratio>\d+)$')
+        p8 = regex_engine.compile(r'^bandwidth remaining ratio (?P<bandwidth_remaining_ratio>\d+)$')
 
         # priority level 3
-        p9 = re.compile(r'^priority level (?P<priority_level>\d+)$')
+        p9 = regex_engine.compile(r'^priority level (?P<priority_level>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1,11 +1,9 @@
-# Python
-import re
-
 # Genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowPolicyMapTypeInspectZonePairSchema(MetaParser):
@@ -74,51 +72,51 @@ class ShowPolicyMapTypeInspectZonePair(ShowPolicyMapTypeInspectZonePairSchema):
             out = output
 
         #Zone-pair: GREEN->DEFAULT
-        p1=re.compile(r'\s*Zone-pair+\:+\s+(?P<zone_pair_name>\S+)')
+        p1=regex_engine.compile(r'\s*Zone-pair+\:+\s+(?P<zone_pair_name>\S+)')
 
         #Service-policy inspect : TEST
-        p2=re.compile(r'\s*Service-policy+\s+inspect+\s+\:+\s+(?P<service_policy_inspect>[\w\W]+)')
+        p2=regex_engine.compile(r'\s*Service-policy+\s+inspect+\s+\:+\s+(?P<service_policy_inspect>[\w\W]+)')
 
         # Class-map: TEST (match-any)
-        p3=re.compile(r'\s*Class-map+\:+\s+(?P<class_map_name>[\w-]+)+\s+\(+(?P<class_map_type>\S+)+\)')
+        p3=regex_engine.compile(r'\s*Class-map+\:+\s+(?P<class_map_name>[\w-]+)+\s+\(+(?P<class_map_type>\S+)+\)')
 
         # Match: access-group name HBN2
-        p4=re.compile(r'\s*Match+\:+\s+(?P<class_map_match>[\w\W]+)')
+        p4=regex_engine.compile(r'\s*Match+\:+\s+(?P<class_map_match>[\w\W]+)')
 
         #Inspect
         #Pass
         #Drop
-        p5=re.compile(r'\s*(?P<class_map_action>Inspect|Pass|Drop)')
+        p5=regex_engine.compile(r'\s*(?P<class_map_action>Inspect|Pass|Drop)')
 
         # Session creations since subsystem startup or last reset 500445
-        p6=re.compile(r'\s*Session+\s+creations+\s+since+\s+subsystem+\s+startup+\s+or+\s+last+\s+reset+\s(?P<session_since_reset_or_startup>\d+)')
+        p6=regex_engine.compile(r'\s*Session+\s+creations+\s+since+\s+subsystem+\s+startup+\s+or+\s+last+\s+reset+\s(?P<session_since_reset_or_startup>\d+)')
 
         # Current session counts (estab/half-open/terminating) [0:0:0]
-        p7=re.compile(r'\s*Current+\s+session+\s+counts+\s+\(+estab+\/+half-open+\/+terminating+\)+\s+\[+(?P<session_estab>\d+)+\:+(?P<session_half_open>\d+)+\:+(?P<session_terminating>\d+)+\]')
+        p7=regex_engine.compile(r'\s*Current+\s+session+\s+counts+\s+\(+estab+\/+half-open+\/+terminating+\)+\s+\[+(?P<session_estab>\d+)+\:+(?P<session_half_open>\d+)+\:+(?P<session_terminating>\d+)+\]')
 
         # Maxever session counts (estab/half-open/terminating) [500445:428088:0]
-        p8=re.compile(r'\s*Maxever+\s+session+\s+counts+\s+\(+estab+\/+half-open+\/+terminating+\)+\s+\[+(?P<max_session_estab>\d+)+\:+(?P<max_session_half_open>\d+)+\:+(?P<max_session_terminating>\d+)+\]')
+        p8=regex_engine.compile(r'\s*Maxever+\s+session+\s+counts+\s+\(+estab+\/+half-open+\/+terminating+\)+\s+\[+(?P<max_session_estab>\d+)+\:+(?P<max_session_half_open>\d+)+\:+(?P<max_session_terminating>\d+)+\]')
 
         #Last session created 00:16:40
-        p9=re.compile(r'\s*Last+\s+session+\s+created+\s+(?P<last_sess_created>[\w\W]+)')
+        p9=regex_engine.compile(r'\s*Last+\s+session+\s+created+\s+(?P<last_sess_created>[\w\W]+)')
 
         #Last statistic reset never
-        p10=re.compile(r'\s*Last+\s+statistic+\s+reset+\s+(?P<last_statistic_reset>[\w\W]+)')
+        p10=regex_engine.compile(r'\s*Last+\s+statistic+\s+reset+\s+(?P<last_statistic_reset>[\w\W]+)')
 
         #Last session creation rate 0
-        p11=re.compile(r'\s*Last+\s+session+\s+creation+\s+rate+\s+(?P<last_session_creation_rate>\d+)')
+        p11=regex_engine.compile(r'\s*Last+\s+session+\s+creation+\s+rate+\s+(?P<last_session_creation_rate>\d+)')
 
         #Last half-open session total 0
-        p12=re.compile(r'\s*Last+\s+half-open+\s+session+\s+total+\s+(?P<last_half_open_session_total>\d+)')
+        p12=regex_engine.compile(r'\s*Last+\s+half-open+\s+session+\s+total+\s+(?P<last_half_open_session_total>\d+)')
 
         #0 packets, 0 bytes
-        p13=re.compile(r'\s*(?P<packets_total>\d+)+\s+packets+\,+\s+(?P<bytes_total>\d+)+\s+bytes')
+        p13=regex_engine.compile(r'\s*(?P<packets_total>\d+)+\s+packets+\,+\s+(?P<bytes_total>\d+)+\s+bytes')
 
         #Packet inspection statistics [process switch:fast switch]
-        p14=re.compile(r'\s*Packet+\s+inspection+\s+statistics+\s+\[+(?P<switch1_type>[\w\s]+)+\:(?P<switch2_type>[\w\s]+)+\]')
+        p14=regex_engine.compile(r'\s*Packet+\s+inspection+\s+statistics+\s+\[+(?P<switch1_type>[\w\s]+)+\:(?P<switch2_type>[\w\s]+)+\]')
 
         #udp packets: [0:84014582]
-        p15=re.compile(r'\s*(?P<packet_type>\w+)+\s+packets+\:+\s+\[+(?P<packets_switch1>\d+)+\:(?P<packets_switch2>\d+)+\]')
+        p15=regex_engine.compile(r'\s*(?P<packet_type>\w+)+\s+packets+\:+\s+\[+(?P<packets_switch1>\d+)+\:(?P<packets_switch2>\d+)+\]')
 
         parsed_dict={}
 
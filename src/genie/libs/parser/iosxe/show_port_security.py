@@ -6,7 +6,6 @@ IOSXE parsers for the following show commands:
 
 '''
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -17,6 +16,9 @@ from genie.metaparser.util.schemaengine import Schema, \
     Default, \
     Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ==============================================
 # Parser for 'show port-security'
 # ==============================================
@@ -82,17 +84,17 @@ class ShowPortSecurity(ShowPortSecuritySchema):
         #     Te2/0/4              5            3                 0         Shutdown
         #     Tw3/0/4              4            2                 0         Shutdown
         #     Gi4/0/4              3            1                 0         Shutdown
-        p1 = re.compile(r'((^(?P<interface>[\w\/]+)\s+)'
-                        r'(?P<max_secure_addr_cnt>[\d]+)\s+'
-                        r'(?P<current_addr_cnt>[\d]+)\s+'
-                        r'(?P<security_violation_cnt>[\d]+)\s+'
-                        r'(?P<security_action>[\w]+)$)')
+        p1 = regex_engine.compile(r'((^(?P<interface>[\w\/]+)\s+)'
+                                  r'(?P<max_secure_addr_cnt>[\d]+)\s+'
+                                  r'(?P<current_addr_cnt>[\d]+)\s+'
+                                  r'(?P<security_violation_cnt>[\d]+)\s+'
+                                  r'(?P<security_action>[\w]+)$)')
         # Total Addresses in System (excluding one mac per port)     : 0
-        p2 = re.compile(r'^Total +Addresses +in +System +\(excluding +one +mac +per +port\)\s+\:\s('
-                        r'?P<total_addr_in_system>\d+)$')
+        p2 = regex_engine.compile(r'^Total +Addresses +in +System +\(excluding +one +mac +per +port\)\s+\:\s('
+                                  r'?P<total_addr_in_system>\d+)$')
         # Max Addresses limit in System (excluding one mac per port) : 4096
-        p3 = re.compile(r'^Max +Addresses +limit +in +System +\(excluding +one +mac +per +port\)\s+\:\s('
-                        r'?P<max_addr_limit_in_system>\d+)$')
+        p3 = regex_engine.compile(r'^Max +Addresses +limit +in +System +\(excluding +one +mac +per +port\)\s+\:\s('
+                                  r'?P<max_addr_limit_in_system>\d+)$')
         for line in out.splitlines():
             line = line.strip()
             m = p1.match(line)
@@ -186,30 +188,30 @@ class ShowPortSecurityInterface(ShowPortSecurityInterfaceSchema):
             'sec_violation_cnt': 0
             }'''
         # Port Security              : Enabled
-        p1 = re.compile(r'^Port\sSecurity\s+\:\s(?P<port_security>\w+)$')
+        p1 = regex_engine.compile(r'^Port\sSecurity\s+\:\s(?P<port_security>\w+)$')
         # Port Status                : Secure-up
-        p2 = re.compile(r'^Port\sStatus\s+\:\s(?P<port_status>[\w\-]+)$')
+        p2 = regex_engine.compile(r'^Port\sStatus\s+\:\s(?P<port_status>[\w\-]+)$')
         # Violation Mode             : Shutdown
-        p3 = re.compile(r'^Violation\sMode\s+\:\s(?P<violation_mode>\w+)$')
+        p3 = regex_engine.compile(r'^Violation\sMode\s+\:\s(?P<violation_mode>\w+)$')
         # Aging Time                 : 0 mins
-        p4 = re.compile(r'^Aging\sTime\s+\:\s(?P<aging_time>\w+\s\w+)$')
+        p4 = regex_engine.compile(r'^Aging\sTime\s+\:\s(?P<aging_time>\w+\s\w+)$')
         # Aging Type                 : Absolute
-        p5 = re.compile(r'^Aging\sType\s+\:\s(?P<aging_type>\w+)$')
+        p5 = regex_engine.compile(r'^Aging\sType\s+\:\s(?P<aging_type>\w+)$')
         # SecureStatic Address Aging : Disabled
-        p6 = re.compile(r'^SecureStatic\sAddress\sAging\s+\:\s(?P<secure_static_addr_aging>\w+)$')
+        p6 = regex_engine.compile(r'^SecureStatic\sAddress\sAging\s+\:\s(?P<secure_static_addr_aging>\w+)$')
         # Maximum MAC Addresses      : 2
-        p7 = re.compile(r'^Maximum\sMAC\sAddresses\s+\:\s(?P<max_mac_addr>\d+)$')
+        p7 = regex_engine.compile(r'^Maximum\sMAC\sAddresses\s+\:\s(?P<max_mac_addr>\d+)$')
         # Total MAC Addresses        : 1
-        p8 = re.compile(r'^Total\sMAC\sAddresses\s+\:\s(?P<total_mac_addr>\d+)$')
+        p8 = regex_engine.compile(r'^Total\sMAC\sAddresses\s+\:\s(?P<total_mac_addr>\d+)$')
         # Configured MAC Addresses   : 0
-        p9 = re.compile(r'^Configured\sMAC\sAddresses\s+\:\s(?P<cfg_mac_addr>\d+)$')
+        p9 = regex_engine.compile(r'^Configured\sMAC\sAddresses\s+\:\s(?P<cfg_mac_addr>\d+)$')
         # Sticky MAC Addresses       : 0
-        p10 = re.compile(r'^Sticky\sMAC\sAddresses\s+\:\s(?P<sticky_mac_addr>\d+)$')
+        p10 = regex_engine.compile(r'^Sticky\sMAC\sAddresses\s+\:\s(?P<sticky_mac_addr>\d+)$')
         # Last Source Address:Vlan   : 0050.56be.3bd9:200
-        p11 = re.compile(r'^Last\sSource\sAddress\:Vlan\s+\:\s'
-                         r'(?P<last_src_addr>\w+\.\w+\.\w+)\:(?P<last_src_addr_vlan>\d+)$')
+        p11 = regex_engine.compile(r'^Last\sSource\sAddress\:Vlan\s+\:\s'
+                                   r'(?P<last_src_addr>\w+\.\w+\.\w+)\:(?P<last_src_addr_vlan>\d+)$')
         # Security Violation Count   : 0
-        p12 = re.compile(r'^Security\sViolation\sCount\s+\:\s(?P<sec_violation_cnt>\d+)$')
+        p12 = regex_engine.compile(r'^Security\sViolation\sCount\s+\:\s(?P<sec_violation_cnt>\d+)$')
 
         # initial return dictionary
         intf_dict ={}
@@ -343,15 +345,15 @@ class ShowPortSecurityAddress(ShowPortSecurityAddressSchema):
         ret_dict = {}
 
         # 1047    00da.5516.1905    SecureSticky                  Gi3/0/5      -
-        p1 = re.compile(r'(^(?P<vlan>\d+)\s+(?P<mac>[\w\.]+)\s+(?P<type>\w+)\s+(?P<port>[\w\/]+)\s+(?P<remaining_age>[\w\-]+))$')
+        p1 = regex_engine.compile(r'(^(?P<vlan>\d+)\s+(?P<mac>[\w\.]+)\s+(?P<type>\w+)\s+(?P<port>[\w\/]+)\s+(?P<remaining_age>[\w\-]+))$')
 
         # Total Addresses in System (excluding one mac per port)     : 0
-        p2 = re.compile(r'^Total +Addresses +in +System +\(excluding +one +mac +per +port\)\s+\:\s('
-                        r'?P<total_addr_in_system>\d+)$')
+        p2 = regex_engine.compile(r'^Total +Addresses +in +System +\(excluding +one +mac +per +port\)\s+\:\s('
+                                  r'?P<total_addr_in_system>\d+)$')
                         
         # Max Addresses limit in System (excluding one mac per port) : 4096
-        p3 = re.compile(r'^Max +Addresses +limit +in +System +\(excluding +one +mac +per +port\)\s+\:\s('
-                        r'?P<max_addr_limit_in_system>\d+)$')
+        p3 = regex_engine.compile(r'^Max +Addresses +limit +in +System +\(excluding +one +mac +per +port\)\s+\:\s('
+                                  r'?P<max_addr_limit_in_system>\d+)$')
         for line in out.splitlines():
             line = line.strip()
             m = p1.match(line)
@@ -404,7 +406,7 @@ class ShowPortSecurityInterfaceCount(ShowPortSecurityInterfaceCountSchema):
         dict_count = {}
 
         # Number of lines which match regexp = 240
-        p1 = re.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
+        p1 = regex_engine.compile(r"^Number of lines which match regexp\s*=\s*(?P<count>[\d]+)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1,5 +1,5 @@
-import re
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (And, Any, Default, Optional,
@@ -28,7 +28,7 @@ class ShowPortSecurityInterfaceAddressVlan(ShowPortSecurityInterfaceAddressVlanS
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         # 2     default    3
-        p1 = re.compile(r"^(?P<vlan>\d+)\s+(?P<max>\w+)\s+(?P<current>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<vlan>\d+)\s+(?P<max>\w+)\s+(?P<current>\d+)$")
 
         ret_dict = {}
 
@@ -18,12 +18,12 @@ IOSXE parsers for the following show command:
     * 'show power inline module {module}'
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional,Or
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -109,35 +109,35 @@ class ShowStackPower(ShowStackPowerSchema):
         ret_dict = {}
 
         # Powerstack-1          SP-PS   Stndaln  715     30      200     485     1    1
-        p1 = re.compile(r'^(?P<name>[\w\-]+) *'
-                        r'(?P<mode>[\w\-]+) +'
-                        r'(?P<topology>[\w\-]+) +'
-                        r'(?P<total_power>\d+) +'
-                        r'(?P<reserved_power>\d+) +'
-                        r'(?P<allocated_power>\d+) +'
-                        r'(?P<unused_power>\d+) +'
-                        r'(?P<switch_num>\d+) +'
-                        r'(?P<power_supply_num>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<name>[\w\-]+) *'
+                                  r'(?P<mode>[\w\-]+) +'
+                                  r'(?P<topology>[\w\-]+) +'
+                                  r'(?P<total_power>\d+) +'
+                                  r'(?P<reserved_power>\d+) +'
+                                  r'(?P<allocated_power>\d+) +'
+                                  r'(?P<unused_power>\d+) +'
+                                  r'(?P<switch_num>\d+) +'
+                                  r'(?P<power_supply_num>\d+)$')
 
         # 1   Powerstack-1         0        0      1200      240        960     129 /0
         # 1   Powerstack-1         350      0      235       235.0      0.0     136/0.0
-        p2 = re.compile(r'^(?P<switch_num>\d+) +'
-                        r'(?P<name>[\w-]+) *'
-                        r'(?P<power_supply_a>\d+) +'
-                        r'(?P<power_supply_b>\d+) +'
-                        r'(?P<power_budget>\d+) +'
-                        r'(?P<allocated_power>[\d.]+) +'
-                        r'(?P<available_power>[\d.]+) +'
-                        r'(?P<consumed_power_sys>[\d.]+)[ \/]+'
-                        r'(?P<consumed_power_poe>[\d.]+)$')
+        p2 = regex_engine.compile(r'^(?P<switch_num>\d+) +'
+                                  r'(?P<name>[\w-]+) *'
+                                  r'(?P<power_supply_a>\d+) +'
+                                  r'(?P<power_supply_b>\d+) +'
+                                  r'(?P<power_budget>\d+) +'
+                                  r'(?P<allocated_power>[\d.]+) +'
+                                  r'(?P<available_power>[\d.]+) +'
+                                  r'(?P<consumed_power_sys>[\d.]+)[ \/]+'
+                                  r'(?P<consumed_power_poe>[\d.]+)$')
 
         # Totals:                               1150    1050      310/0
         # Totals:                               235.0   0.0       136/0.0
-        p3 = re.compile(r'^Totals: +'
-                        r'(?P<total_allocated_power>[\d.]+) +'
-                        r'(?P<total_available_power>[\d.]+) +'
-                        r'(?P<total_consumed_power_sys>[\d.]+)[ \/]+'
-                        r'(?P<total_consumed_power_poe>[\d.]+)$')
+        p3 = regex_engine.compile(r'^Totals: +'
+                                  r'(?P<total_allocated_power>[\d.]+) +'
+                                  r'(?P<total_available_power>[\d.]+) +'
+                                  r'(?P<total_consumed_power_sys>[\d.]+)[ \/]+'
+                                  r'(?P<total_consumed_power_poe>[\d.]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -242,34 +242,34 @@ class ShowPowerInline(ShowPowerInlineSchema):
 
         # initial regexp pattern
         # Gi1/0/13  auto   on         15.4    AIR-CAP2602I-A-K9   3     30.0
-        p1a = re.compile(r'^(?P<intf>[\w\-\/\.]+)\s*'
-                        r'(?P<admin_state>\w+)\s+'
-                        r'(?P<oper_state>[\w\-]+)\s+'
-                        r'(?P<power>\d+\.\d+)\s+'
-                        r'(?P<device>(?=\S).*(?<=\S))\s+'
-                        r'(?P<class>[\w\/]+)\s+'
-                        r'(?P<max>\d+\.\d+)$')
+        p1a = regex_engine.compile(r'^(?P<intf>[\w\-\/\.]+)\s*'
+                                  r'(?P<admin_state>\w+)\s+'
+                                  r'(?P<oper_state>[\w\-]+)\s+'
+                                  r'(?P<power>\d+\.\d+)\s+'
+                                  r'(?P<device>(?=\S).*(?<=\S))\s+'
+                                  r'(?P<class>[\w\/]+)\s+'
+                                  r'(?P<max>\d+\.\d+)$')
 
         # alternate regexp pattern
         # Gi1/46    auto   on         27.5       26.1       AIR-AP2802I-B-K9    4
-        p1b = re.compile(r'^(?P<intf>[\w\-\/\.]+)\s*'
-                        r'(?P<admin_state>\w+)\s+'
-                        r'(?P<oper_state>[\w\-]+)\s+'
-                        r'(?P<max>\d+\.\d+)\s+'
-                        r'(?P<power>\d+\.\d+)\s+'
-                        r'(?P<device>(?=\S).*(?<=\S))\s+'
-                        r'(?P<class>[\w\/]+)$')
+        p1b = regex_engine.compile(r'^(?P<intf>[\w\-\/\.]+)\s*'
+                                  r'(?P<admin_state>\w+)\s+'
+                                  r'(?P<oper_state>[\w\-]+)\s+'
+                                  r'(?P<max>\d+\.\d+)\s+'
+                                  r'(?P<power>\d+\.\d+)\s+'
+                                  r'(?P<device>(?=\S).*(?<=\S))\s+'
+                                  r'(?P<class>[\w\/]+)$')
 
         # 1          1550.0      147.0      1403.0
-        p2 = re.compile(r'^(?P<module>\d+)\s+'
-                        r'(?P<available>[\d\.]+)\s+'
-                        r'(?P<used>[\d\.]+)\s+'
-                        r'(?P<remaining>[\d\.]+)\s*$')
+        p2 = regex_engine.compile(r'^(?P<module>\d+)\s+'
+                                  r'(?P<available>[\d\.]+)\s+'
+                                  r'(?P<used>[\d\.]+)\s+'
+                                  r'(?P<remaining>[\d\.]+)\s*$')
 
         # Available:1170.0(w)  Used:212.2(w)  Remaining:957.8(w)
-        p3 = re.compile(r'^\s*[Aa]vailable\:(?P<available>[\d\.]+)\(\w+\)\s+'
-                        r'[Uu]sed\:(?P<used>[\d\.]+)\(\w+\)\s+'
-                        r'[Rr]emaining\:(?P<remaining>[\d\.]+)\(\w+\)\s*$')
+        p3 = regex_engine.compile(r'^\s*[Aa]vailable\:(?P<available>[\d\.]+)\(\w+\)\s+'
+                                  r'[Uu]sed\:(?P<used>[\d\.]+)\(\w+\)\s+'
+                                  r'[Rr]emaining\:(?P<remaining>[\d\.]+)\(\w+\)\s*$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -364,19 +364,19 @@ class ShowPowerInlinePriority(ShowPowerInlinePrioritySchema):
         ret_dict = {}
 
         #Gi1/0/1    auto   off        low
-        p1 = re.compile(r'^(?P<intf>[\w\/]+)\s+'
-                        r'(?P<admin_state>auto|off|static)\s+'
-                        r'(?P<oper_state>\w+)\s+'
-                        r'(?P<admin_priority>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<intf>[\w\/]+)\s+'
+                                  r'(?P<admin_state>auto|off|static)\s+'
+                                  r'(?P<oper_state>\w+)\s+'
+                                  r'(?P<admin_priority>\w+)$')
         
         # Te2/0/48   auto   on         n/a        1
-        p1a = re.compile(r'^(?P<intf>[\w\/]+)\s+'
-                        r'(?P<admin_state>auto|off|static)\s+'
-                        r'(?P<oper_state>\w+)\s+'
-                        r'(?P<admin_priority>[\w\/]+)\s+'
-                        r'(?P<oper_priority>[\w]+)$')
+        p1a = regex_engine.compile(r'^(?P<intf>[\w\/]+)\s+'
+                                  r'(?P<admin_state>auto|off|static)\s+'
+                                  r'(?P<oper_state>\w+)\s+'
+                                  r'(?P<admin_priority>[\w\/]+)\s+'
+                                  r'(?P<oper_priority>[\w]+)$')
         
-        p2 = re.compile(r'^Power\s+inline\s+auto\s+shutdown:\s+(?P<power_inline_auto_shutdown>[\w]+)$')
+        p2 = regex_engine.compile(r'^Power\s+inline\s+auto\s+shutdown:\s+(?P<power_inline_auto_shutdown>[\w]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -450,7 +450,7 @@ class ShowPowerInlineUpoePlus(ShowPowerInlineUpoePlusSchema):
         # Gi1/0/15    auto   SS   on,on         60.0      10.5      6       Ieee PD
         # Gi1/0/23    auto   DS   on,on         45.4      26.9      3,4     Ieee PD
         # Tw1/0/25    auto   n/a  lldp-shutdown 0.0       0.0       0  
-        p1 = re.compile(r'^(?P<intf>[\w\/]+)\s+(?P<admin_state>[a-zA-Z]+)\s+(?P<type>[\w\/]+)\s+(?P<oper_state>[\,\-\w+]+)\s+(?P<allocated_power>[\d\.]+)\s+(?P<utilized_power>[\d\.]+)\s+(?P<class>[\w\,\/]+)\s*(?P<device>.*)$')
+        p1 = regex_engine.compile(r'^(?P<intf>[\w\/]+)\s+(?P<admin_state>[a-zA-Z]+)\s+(?P<type>[\w\/]+)\s+(?P<oper_state>[\,\-\w+]+)\s+(?P<allocated_power>[\d\.]+)\s+(?P<utilized_power>[\d\.]+)\s+(?P<class>[\w\,\/]+)\s*(?P<device>.*)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -493,62 +493,62 @@ class ShowStackPowerDetail(ShowStackPowerSchema):
         ret_dict = {}
          
         # Powerstack-1                     SP-PS   Stndaln  1100    0       243     857       1    1  
-        p1 = re.compile(r'^(?P<name>[\w\-]+) *'
-                r'(?P<mode>[\w\-]+) +'
-                r'(?P<topology>[\w\-]+) +'
-                r'(?P<total_power>\d+) +'
-                r'(?P<reserved_power>\d+) +'
-                r'(?P<allocated_power>\d+) +'
-                r'(?P<available_power>\d+) +'
-                r'(?P<switch_num>\d+) +'
-                r'(?P<power_supply_num>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<name>[\w\-]+) *'
+                          r'(?P<mode>[\w\-]+) +'
+                          r'(?P<topology>[\w\-]+) +'
+                          r'(?P<total_power>\d+) +'
+                          r'(?P<reserved_power>\d+) +'
+                          r'(?P<allocated_power>\d+) +'
+                          r'(?P<available_power>\d+) +'
+                          r'(?P<switch_num>\d+) +'
+                          r'(?P<power_supply_num>\d+)$')
 
         # Power stack name: Powerstack-1
-        p2 = re.compile(r"^Power+\s+stack+\s+name:+\s+(?P<name>[\w\-]+)$")
+        p2 = regex_engine.compile(r"^Power+\s+stack+\s+name:+\s+(?P<name>[\w\-]+)$")
 
         # Stack mode: Power sharing 
-        p3 = re.compile(r"^Stack+\s+mode:+\s+(?P<stack_mode>.*)$")
+        p3 = regex_engine.compile(r"^Stack+\s+mode:+\s+(?P<stack_mode>.*)$")
 
         # Stack topology: Standalone
-        p4 = re.compile(r"^Stack+\s+topology:+\s+(?P<stack_topology>[\w\-]+)$")
+        p4 = regex_engine.compile(r"^Stack+\s+topology:+\s+(?P<stack_topology>[\w\-]+)$")
 
         # Switch 1 
-        p5 = re.compile(r"^Switch+\s+\d")
+        p5 = regex_engine.compile(r"^Switch+\s+\d")
 
         # Power budget: 1100
-        p6= re.compile(r"^Power+\s+budget:+\s+(?P<power_budget>\d+)$")
+        p6= regex_engine.compile(r"^Power+\s+budget:+\s+(?P<power_budget>\d+)$")
 
         # Power allocated: 243
-        p7 = re.compile(r"^Power+\s+allocated:+\s+(?P<power_allocated>\d+)$")
+        p7 = regex_engine.compile(r"^Power+\s+allocated:+\s+(?P<power_allocated>\d+)$")
                 
         # Low port priority value: 22
-        p8 = re.compile(r"^Low+\s+port+\s+priority+\s+value:+\s+(?P<low_port_priority_value>\d+)$")
+        p8 = regex_engine.compile(r"^Low+\s+port+\s+priority+\s+value:+\s+(?P<low_port_priority_value>\d+)$")
                 
         # High port priority value: 13
-        p9 = re.compile(r"^High+\s+port+\s+priority+\s+value:+\s+(?P<high_port_priority_value>\d+)$")
+        p9 = regex_engine.compile(r"^High+\s+port+\s+priority+\s+value:+\s+(?P<high_port_priority_value>\d+)$")
 
         # Switch priority value: 4
-        p10 = re.compile(r"^Switch+\s+priority+\s+value:+\s+(?P<switch_priority_value>\d+)$")    
+        p10 = regex_engine.compile(r"^Switch+\s+priority+\s+value:+\s+(?P<switch_priority_value>\d+)$")    
 
         # Port 1 status: Not connected
-        p11 = re.compile(r"^Port+\s+1+\s+status:+\s+(?P<port_1_status>.*)$")
+        p11 = regex_engine.compile(r"^Port+\s+1+\s+status:+\s+(?P<port_1_status>.*)$")
 
         #Port 2 status: Not connected
-        p12 = re.compile(r"^Port+\s+2+\s+status:+\s+(?P<port_2_status>.*)$")
+        p12 = regex_engine.compile(r"^Port+\s+2+\s+status:+\s+(?P<port_2_status>.*)$")
 
         # Neighbor on port 1: 0000.0000.0000
-        p13 = re.compile(r"^Neighbor+\s+on+\s+port+\s+1:+\s+(?P<neighbor_on_port_1>.*)$")
+        p13 = regex_engine.compile(r"^Neighbor+\s+on+\s+port+\s+1:+\s+(?P<neighbor_on_port_1>.*)$")
 
         # Neighbor on port 2: 0000.0000.0000
-        p14 = re.compile(r"^Neighbor+\s+on+\s+port+\s+2:+\s+(?P<neighbor_on_port_2>.*)$")
+        p14 = regex_engine.compile(r"^Neighbor+\s+on+\s+port+\s+2:+\s+(?P<neighbor_on_port_2>.*)$")
 
         # Stack Auto-off: Disable
-        p15 = re.compile(r"^Power+\s+Supply+\s+auto-off:+\s+(?P<power_supply_auto_off>\w+)$")
+        p15 = regex_engine.compile(r"^Power+\s+Supply+\s+auto-off:+\s+(?P<power_supply_auto_off>\w+)$")
 
         # Auto-off: FEP B auto offlined, capacity: 350 
-        p16 = re.compile(r"^Auto+\s+off:+\s+(?P<auto_off>.*),+\s+capacity:+\s+(?P<capacity>\w+)$")
+        p16 = regex_engine.compile(r"^Auto+\s+off:+\s+(?P<auto_off>.*),+\s+capacity:+\s+(?P<capacity>\w+)$")
         
-        p17 = re.compile(r"^Stack+\s+total+\s+input+\s+power:+\s+(?P<Stack_total_input_power>\d+)$")
+        p17 = regex_engine.compile(r"^Stack+\s+total+\s+input+\s+power:+\s+(?P<Stack_total_input_power>\d+)$")
 
         for line in out.splitlines():
             line = line.strip()    
@@ -715,9 +715,9 @@ class ShowPowerInlineConsumption(ShowPowerInlineConsumptionSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<intf>[\w\-\/\.]+)\s*'
-                         r'(?P<consumption_configured>\w+)\s+'
-                         r'(?P<admin_consumption>[\d\.]+)$')
+        p1 = regex_engine.compile(r'^(?P<intf>[\w\-\/\.]+)\s*'
+                                   r'(?P<consumption_configured>\w+)\s+'
+                                   r'(?P<admin_consumption>[\d\.]+)$')
         
         
 
@@ -845,61 +845,61 @@ class ShowPower(ShowPowerSchema):
         result_dict = {}
 
         # Switch:1
-        p1 = re.compile(r'^Switch:(?P<switch>\S+)$')
+        p1 = regex_engine.compile(r'^Switch:(?P<switch>\S+)$')
 
         # PS1     C9K-PWR-1500WAC-R     ac    n.a.      bad-input  n.a.  n.a. 
         # PS2     C9K-PWR-1500WAC-R     ac    1500 W    active     good  n.a.
         # 1B  PWR-C5-1KWAC        DCI22031004  OK              Good     Good     1000
-        p2 = re.compile(r'^(?P<power_supply>\S+) +'
-                        r'(?P<model_no>\S+) +'
-                        r'(?P<type>\S+) +'
-                        r'(?P<capacity>\S+) +W?\s*'
-                        r'(?P<status>\S+) +'
-                        r'(?P<fan_state_0>\S+) +'
-                        r'(?P<fan_state_1>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<power_supply>\S+) +'
+                                  r'(?P<model_no>\S+) +'
+                                  r'(?P<type>\S+) +'
+                                  r'(?P<capacity>\S+) +W?\s*'
+                                  r'(?P<status>\S+) +'
+                                  r'(?P<fan_state_0>\S+) +'
+                                  r'(?P<fan_state_1>\S+)$')
                         
         # FT1     active      good  good
-        p3 = re.compile(r'^(?P<fan_tray>\S+) +'
-                        r'(?P<status>\S+) +'
-                        r'(?P<fan_state_0>\S+) +'
-                        r'(?P<fan_state_1>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<fan_tray>\S+) +'
+                                  r'(?P<status>\S+) +'
+                                  r'(?P<fan_state_0>\S+) +'
+                                  r'(?P<fan_state_1>\S+)$')
         
         # PS Configuration Mode  : Non Redundant
         # PS Operating state     : Standalone
         # PS Current Configuration Mode : Combined
         # PS Current Operating State    : Combined
-        p4 = re.compile(r'^PS\s+(Current )?(?P<mode>[\w\s]+)\s+:\s+(?P<value>[\w\s]+)')
+        p4 = regex_engine.compile(r'^PS\s+(Current )?(?P<mode>[\w\s]+)\s+:\s+(?P<value>[\w\s]+)')
 
         # Power supplies currently active    : 1
         # Power supplies currently available : 1
-        p5 = re.compile(r'^Power supplies currently\s+(?P<power_supply>[\w\s]+)\s+:\s+(?P<value>[\d\s]+)')
+        p5 = regex_engine.compile(r'^Power supplies currently\s+(?P<power_supply>[\w\s]+)\s+:\s+(?P<value>[\d\s]+)')
 
         # 1    C9200-24P             0         accepted  230     26             28    230     0
-        p6 = re.compile(r'^(?P<module>\d+)\s*'
-                        r'(?P<model>[\w\-]+)\s+'
-                        r'(?P<shutdown_priority>\d)\s+'
-                        r'(?P<power_state>\w+)\s+'
-                        r'(?P<budget>\d+)\s+'
-                        r'(?P<instantaneous>\d+)\s+'
-                        r'(?P<peak>\d+)\s+'
-                        r'(?P<outreset>\d+)\s+'
-                        r'(?P<inreset>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<module>\d+)\s*'
+                                  r'(?P<model>[\w\-]+)\s+'
+                                  r'(?P<shutdown_priority>\d)\s+'
+                                  r'(?P<power_state>\w+)\s+'
+                                  r'(?P<budget>\d+)\s+'
+                                  r'(?P<instantaneous>\d+)\s+'
+                                  r'(?P<peak>\d+)\s+'
+                                  r'(?P<outreset>\d+)\s+'
+                                  r'(?P<inreset>\d+)$')
 
         # System Power   230        20           230
         # POE Power      30         5            740
-        p7 = re.compile(r'^(?P<power_summary>System Power|POE Power|Total)\s+'
-                       r'(?P<allocatted>\d+)\s+'
-                        r'(?P<consumption>\d+)\s+'
-                        r'(?P<maximum_available>\d+)$')
+        p7 = regex_engine.compile(r'^(?P<power_summary>System Power|POE Power|Total)\s+'
+                                 r'(?P<allocatted>\d+)\s+'
+                                  r'(?P<consumption>\d+)\s+'
+                                  r'(?P<maximum_available>\d+)$')
 
         # Meter start time 2024-02-29 06:16:34 UTC
-        p8 = re.compile(r'Meter start time\s+(?P<meter_start_time>\d+\-\d+\-\d+ \d+:\d+:\d+) \w+$')
+        p8 = regex_engine.compile(r'Meter start time\s+(?P<meter_start_time>\d+\-\d+\-\d+ \d+:\d+:\d+) \w+$')
 
         # 1    C9200-24P             4779                 2024-01-11 16:55:21 UTC
-        p9 = re.compile(r'^(?P<module>\d+)\s+'
-                        r'(?P<model_num>\S+)\s+'
-                        r'(?P<metered_energy>\d+)\s+'
-                        r'(?P<meter_update_time>\d+\-\d+\-\d+ \d+:\d+:\d+) \w+$')
+        p9 = regex_engine.compile(r'^(?P<module>\d+)\s+'
+                                  r'(?P<model_num>\S+)\s+'
+                                  r'(?P<metered_energy>\d+)\s+'
+                                  r'(?P<meter_update_time>\d+\-\d+\-\d+ \d+:\d+:\d+) \w+$')
         flag = 0         
         for line in output.splitlines():
             line = line.strip()
@@ -1081,19 +1081,19 @@ class ShowPowerInlineUpoePlusModule(ShowPowerInlineUpoePlusModuleSchema):
         ret_dict = {}
 
         # 1           675.0        0.0       675.0
-        p1 = re.compile(r'^(?P<module>\d+)\s+(?P<available>[\d\.]+)\s+(?P<used>[\d\.]+)\s+(?P<remaining>[\d\.]+)$')
+        p1 = regex_engine.compile(r'^(?P<module>\d+)\s+(?P<available>[\d\.]+)\s+(?P<used>[\d\.]+)\s+(?P<remaining>[\d\.]+)$')
         
         # Available:22565.0(w)  Used:244.7(w)  Remaining:22320.3(w)
-        p1a = re.compile(r'^Available:(?P<available>[\d\.]+).*\s+Used:(?P<used>[\d\.]+).*\s+Remaining:(?P<remaining>[\d\.]+)')
+        p1a = regex_engine.compile(r'^Available:(?P<available>[\d\.]+).*\s+Used:(?P<used>[\d\.]+).*\s+Remaining:(?P<remaining>[\d\.]+)')
         
         #Device IEEE Mode - BT
-        p2 = re.compile(r'^Device IEEE Mode\s+\-\s+(?P<ieee_mode>\w+)$')
+        p2 = regex_engine.compile(r'^Device IEEE Mode\s+\-\s+(?P<ieee_mode>\w+)$')
         
         #Gi1/0/1     auto   n/a  off           0.0       0.0       n/a
-        p3 = re.compile(r'^(?P<intf>[\w\/]+)\s+(?P<admin_state>\w+)\s+(?P<type>[\w\/?]+)\s+(?P<operating_state>[\w,?]+)\s+(?P<allocated_power>[\d\.]+)\s+(?P<utilized_power>[\d\.]+)\s+(?P<class>[\w(\/,)?]+)(\s+(?P<device>.*))?')
+        p3 = regex_engine.compile(r'^(?P<intf>[\w\/]+)\s+(?P<admin_state>\w+)\s+(?P<type>[\w\/?]+)\s+(?P<operating_state>[\w,?]+)\s+(?P<allocated_power>[\d\.]+)\s+(?P<utilized_power>[\d\.]+)\s+(?P<class>[\w(\/,)?]+)(\s+(?P<device>.*))?')
         
         #Totals:            0    on          0.0      0.0
-        p4 = re.compile(r'^Totals: +(?P<type>\d+) +(?P<operating_state>\w+) +(?P<allocated_power>[\d\.]+) +(?P<utilized_power>[\d\.]+)$')
+        p4 = regex_engine.compile(r'^Totals: +(?P<type>\d+) +(?P<operating_state>\w+) +(?P<allocated_power>[\d\.]+) +(?P<utilized_power>[\d\.]+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1214,109 +1214,109 @@ class ShowPowerInlineDetail(ShowPowerInlineDetailSchema):
         ret_dict = {}
         
         # Interface: Te2/0/41
-        p1 = re.compile(r'^\s*Interface:\s+(?P<intf>[\w\-\/\.]+)$')
+        p1 = regex_engine.compile(r'^\s*Interface:\s+(?P<intf>[\w\-\/\.]+)$')
 
         # Inline Power Mode: auto
-        p2 = re.compile(r'^\s*Inline\sPower\sMode:\s+(?P<inline_power_mode>\w+)$')
+        p2 = regex_engine.compile(r'^\s*Inline\sPower\sMode:\s+(?P<inline_power_mode>\w+)$')
 
         # Operational status (Alt-A,B): on,off
         # Operational status (Alt-A,B): lldp-shutdown
-        p3 = re.compile(r'^\s*Operational\s+status.*:\s+(?P<operational_status>\S+)$')
+        p3 = regex_engine.compile(r'^\s*Operational\s+status.*:\s+(?P<operational_status>\S+)$')
 
         # Device Detected: yes
-        p4 = re.compile(r'^\s*Device\s+Detected:\s+(?P<device_detected>\w+)$')
+        p4 = regex_engine.compile(r'^\s*Device\s+Detected:\s+(?P<device_detected>\w+)$')
 
         # Device Type: cisco AIR-AP1252G-A
-        p5 = re.compile(r'^\s*Device\s+Type:\s+(?P<device_type>[\w\/\-\s]+)$')
+        p5 = regex_engine.compile(r'^\s*Device\s+Type:\s+(?P<device_type>[\w\/\-\s]+)$')
 
         # Connection Check: SS
-        p6 = re.compile(r'^\s*Connection\s+Check:\s+(?P<connection_check>[\w]+)$')
+        p6 = regex_engine.compile(r'^\s*Connection\s+Check:\s+(?P<connection_check>[\w]+)$')
 
         # IEEE Class (Alt-A,B): 3
-        p7 = re.compile(r'^\s*IEEE\s+Class.*:\s+(?P<ieee_class>[\w\,\/]+)$')
+        p7 = regex_engine.compile(r'^\s*IEEE\s+Class.*:\s+(?P<ieee_class>[\w\,\/]+)$')
 
         # Physical Assigned Class (Alt-A,B): 3
-        p8 = re.compile(r'^\s*Physical\s+Assigned\s+Class.*:\s+(?P<physical_assigned_class>[\w\,\/]*)$')
+        p8 = regex_engine.compile(r'^\s*Physical\s+Assigned\s+Class.*:\s+(?P<physical_assigned_class>[\w\,\/]*)$')
 
         # Discovery mechanism used/configured: Ieee and Cisco
-        p9 = re.compile(r'^\s*Discovery\s+mechanism\s+used\/configured:\s+(?P<discovery_mechanism>[\w\s]+$)')
+        p9 = regex_engine.compile(r'^\s*Discovery\s+mechanism\s+used\/configured:\s+(?P<discovery_mechanism>[\w\s]+$)')
 
         # Police: off
-        p10 = re.compile(r'^\s*Police:\s+(?P<police>[\w]+)$')
+        p10 = regex_engine.compile(r'^\s*Police:\s+(?P<police>[\w]+)$')
 
         # Power Allocated 
         # Admin Value: 90.0
-        p11 = re.compile(r'^\s*Admin\s+Value:\s+(?P<admin_value>[\d\.]+)$')
+        p11 = regex_engine.compile(r'^\s*Admin\s+Value:\s+(?P<admin_value>[\d\.]+)$')
 
         # Power drawn from the source: 0.0
-        p12 = re.compile(r'^\s*Power\s+drawn\s+from\s+the\s+source:\s+(?P<power_drawn>[\d\.]+)$')
+        p12 = regex_engine.compile(r'^\s*Power\s+drawn\s+from\s+the\s+source:\s+(?P<power_drawn>[\d\.]+)$')
 
         # Power available to the device: 0.0
-        p13 = re.compile(r'^\s*Power\s+available\s+to\s+the\s+device:\s+(?P<power_available>[\d\.]+)$')
+        p13 = regex_engine.compile(r'^\s*Power\s+available\s+to\s+the\s+device:\s+(?P<power_available>[\d\.]+)$')
 
         # Allocated Power (Alt-A,B): 0.0
-        p14 = re.compile(r'^\s*Allocated\s+Power.*:\s+(?P<allocated_power>[\d\.\,]+)$')
+        p14 = regex_engine.compile(r'^\s*Allocated\s+Power.*:\s+(?P<allocated_power>[\d\.\,]+)$')
 
         # Measured at the port(watts) (Alt-A,B): 10.0
-        p15 = re.compile(r'^\s*Measured\s+at\s+the\s+port.*:\s+(?P<measured_consumption>[\d\.\,]+)$')
+        p15 = regex_engine.compile(r'^\s*Measured\s+at\s+the\s+port.*:\s+(?P<measured_consumption>[\d\.\,]+)$')
 
         # Maximum Power drawn by the device since powered on: 5.3
-        p16 = re.compile(r'^\s*Maximum\s+Power\s+drawn.*:\s+(?P<max_consumption>[\d\.]+)$')
+        p16 = regex_engine.compile(r'^\s*Maximum\s+Power\s+drawn.*:\s+(?P<max_consumption>[\d\.]+)$')
 
         #Absent Counter: 0
-        p17 = re.compile(r'^\s*Absent\s+Counter:\s+(?P<absent_counter>[\d]+)$')
+        p17 = regex_engine.compile(r'^\s*Absent\s+Counter:\s+(?P<absent_counter>[\d]+)$')
 
         # Over Current Counter: 0
-        p18 = re.compile(r'^\s*Over\s+Current\s+Counter:\s+(?P<over_curent_counter>[\d]+)$')
+        p18 = regex_engine.compile(r'^\s*Over\s+Current\s+Counter:\s+(?P<over_curent_counter>[\d]+)$')
 
         # Short Current Counter: 0
-        p19 = re.compile(r'^\s*Short\s+Current\s+Counter:\s+(?P<short_curent_counter>[\d]+)$')
+        p19 = regex_engine.compile(r'^\s*Short\s+Current\s+Counter:\s+(?P<short_curent_counter>[\d]+)$')
 
         # Invalid Signature Counter: 0
-        p20 = re.compile(r'^\s*Invalid\s+Signature\s+Counter:\s+(?P<invalid_signature_counter>[\d]+)$')
+        p20 = regex_engine.compile(r'^\s*Invalid\s+Signature\s+Counter:\s+(?P<invalid_signature_counter>[\d]+)$')
 
         # Power Denied Counter: 0
-        p21 = re.compile(r'^\s*Power\s+Denied\s+Counter:\s+(?P<power_denied_counter>[\d]+)$')
+        p21 = regex_engine.compile(r'^\s*Power\s+Denied\s+Counter:\s+(?P<power_denied_counter>[\d]+)$')
 
         # Power Negotiation Used: LLDP-MED
-        p22 = re.compile(r'^\s*Power\s+Negotiation\s+Used:\s+(?P<power_negotiation_used>[\w\-\s\.]+)$')
+        p22 = regex_engine.compile(r'^\s*Power\s+Negotiation\s+Used:\s+(?P<power_negotiation_used>[\w\-\s\.]+)$')
 
         # Power Type:                  PSE                  PD
         # Power Type:                  Type 2 PSE           Type 2 PSE
-        p23 = re.compile(r'^\s*Power\s+Type:\s+(?P<power_type_to_pd>[\w\-]+|Type\s\d\s[\w]+)\s{2,}(?P<power_type_from_pd>[\w\-]+|Type\s\d\s[\w]+)$')
+        p23 = regex_engine.compile(r'^\s*Power\s+Type:\s+(?P<power_type_to_pd>[\w\-]+|Type\s\d\s[\w]+)\s{2,}(?P<power_type_from_pd>[\w\-]+|Type\s\d\s[\w]+)$')
 
         # Power Source:                Primary              PSE
-        p24 = re.compile(r'^\s*Power\s+Source:\s+(?P<power_source_to_pd>[\w\-]+)\s+(?P<power_source_from_pd>[\w\-]+)$')
+        p24 = regex_engine.compile(r'^\s*Power\s+Source:\s+(?P<power_source_to_pd>[\w\-]+)\s+(?P<power_source_from_pd>[\w\-]+)$')
 
         # Power Priority:              critical             unknown
-        p25 = re.compile(r'^\s*Power\s+Priority:\s+(?P<power_priority_to_pd>[\w\-]+)\s+(?P<power_priority_from_pd>[\w\-]+)$')
+        p25 = regex_engine.compile(r'^\s*Power\s+Priority:\s+(?P<power_priority_to_pd>[\w\-]+)\s+(?P<power_priority_from_pd>[\w\-]+)$')
 
         # Requested Power(W):          -                    8.5
-        p26 = re.compile(r'^\s*Requested\s+Power\(W\):\s+(?P<requested_power_to_pd>[\d\.\-]+)\s+(?P<requested_power_from_pd>[\d\.\-]+)$')
+        p26 = regex_engine.compile(r'^\s*Requested\s+Power\(W\):\s+(?P<requested_power_to_pd>[\d\.\-]+)\s+(?P<requested_power_from_pd>[\d\.\-]+)$')
 
         # Allocated Power(W):          8.5                    -
-        p27 = re.compile(r'^\s*Allocated\s+Power\(W\):\s+(?P<allocated_power_to_pd>[\d\.\-]+)\s+(?P<allocated_power_from_pd>[\d\.\-]+)$')
+        p27 = regex_engine.compile(r'^\s*Allocated\s+Power\(W\):\s+(?P<allocated_power_to_pd>[\d\.\-]+)\s+(?P<allocated_power_from_pd>[\d\.\-]+)$')
 
         # Four-Pair PoE Supported: Yes
-        p28 = re.compile(r'^\s*Four\-Pair\s+PoE\s+Supported:\s+(?P<four_pair_poe_supported>[\w]+)$')
+        p28 = regex_engine.compile(r'^\s*Four\-Pair\s+PoE\s+Supported:\s+(?P<four_pair_poe_supported>[\w]+)$')
 
         # Spare Pair Power Enabled: No
-        p29 = re.compile(r'^\s*Spare\s+Pair\s+Power\s+Enabled:\s+(?P<spare_pair_power_enabled>[\w]+)$')
+        p29 = regex_engine.compile(r'^\s*Spare\s+Pair\s+Power\s+Enabled:\s+(?P<spare_pair_power_enabled>[\w]+)$')
 
         # Four-Pair PD Architecture: Shared
-        p30 = re.compile(r'^\s*Four\-Pair\s+PD\s+Architecture:\s+(?P<four_pair_pd_architecture>[\w\/]+)$')
+        p30 = regex_engine.compile(r'^\s*Four\-Pair\s+PD\s+Architecture:\s+(?P<four_pair_pd_architecture>[\w\/]+)$')
 
         # Perpetual POE Enabled: TRUE
-        p31 = re.compile(r'^\s*Perpetual\s+POE\s+Enabled:\s+(?P<perpetual_poe_enabled>[\w]+)$')
+        p31 = regex_engine.compile(r'^\s*Perpetual\s+POE\s+Enabled:\s+(?P<perpetual_poe_enabled>[\w]+)$')
 
         # Fast POE Enabled: FALSE
-        p32 = re.compile(r'^\s*Fast\s+POE\s+Enabled:\s+(?P<fast_poe_enabled>[\w]+)$')
+        p32 = regex_engine.compile(r'^\s*Fast\s+POE\s+Enabled:\s+(?P<fast_poe_enabled>[\w]+)$')
         
         # Meter Start Time: 2024-01-24 19:38:12 UTC (24hour counter)
-        p33 = re.compile(r'^Meter\s+Start\s+Time: (?P<meter_start_time>.*)$')
+        p33 = regex_engine.compile(r'^Meter\s+Start\s+Time: (?P<meter_start_time>.*)$')
         
         # Metered Energy Value(WattSec): 0.0 
-        p34 = re.compile(r'^Metered\s+Energy\s+Value\S+(?P<meter_energy_value>.*)$')   
+        p34 = regex_engine.compile(r'^Metered\s+Energy\s+Value\S+(?P<meter_energy_value>.*)$')   
 
         for line in output.splitlines():
             line = line.strip()
@@ -1575,10 +1575,10 @@ class ShowPowerInlinePolice(ShowPowerInlinePoliceSchema):
 
         # Te7/0/28  auto   on         log        overdrawn  15.4   16.0 
         # Te7/0/29  auto   on         none       n/a        n/a    n/a  
-        p1 = re.compile(r'^(?P<intf>[\w\d\/]+)\s+(?P<admin_state>[\w]+)\s+(?P<oper_state>[\,\w]+)\s+(?P<admin_police>[\w]+)\s+(?P<oper_police>[\w\/]+)\s+(?P<cutoff_power>[\w\d\.\/]+)\s+(?P<oper_power>[\w\d\.\/]+)\s*$')
+        p1 = regex_engine.compile(r'^(?P<intf>[\w\d\/]+)\s+(?P<admin_state>[\w]+)\s+(?P<oper_state>[\,\w]+)\s+(?P<admin_police>[\w]+)\s+(?P<oper_police>[\w\/]+)\s+(?P<cutoff_power>[\w\d\.\/]+)\s+(?P<oper_power>[\w\d\.\/]+)\s*$')
         
         # Totals:                               4.1
-        p2 = re.compile(r'^(?P<total>(\w+)):\s+(?P<value>\d+\.\d+)')
+        p2 = regex_engine.compile(r'^(?P<total>(\w+)):\s+(?P<value>\d+\.\d+)')
         
         for line in output.splitlines():
             line = line.strip()
@@ -1643,9 +1643,9 @@ class ShowPowerInlineModule(ShowPowerInlineModuleSchema):
             output = self.device.execute(self.cli_command[0].format(moduleNum=moduleNum))
 
         # 1           675.0       16.6       658.4
-        p1 = re.compile(r"^(?P<mod>\d+)\s+(?P<available_power>\S+)\s+(?P<used_power>\S+)\s+(?P<remaining_power>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<mod>\d+)\s+(?P<available_power>\S+)\s+(?P<used_power>\S+)\s+(?P<remaining_power>\S+)$")
         # Gi1/0/1   auto   off        0.0     n/a                 n/a   60.0 
-        p2 = re.compile(r"^(?P<interface>\S+)\s+(?P<admin>\w+)\s+(?P<oper>\w+)\s+(?P<power>\d+\.\d+)\s+(?P<device>[\S\s]+\S+)\s+(?P<class>\S+)\s+(?P<max>\S+)$")
+        p2 = regex_engine.compile(r"^(?P<interface>\S+)\s+(?P<admin>\w+)\s+(?P<oper>\w+)\s+(?P<power>\d+\.\d+)\s+(?P<device>[\S\s]+\S+)\s+(?P<class>\S+)\s+(?P<max>\S+)$")
 
 
         ret_dict = {}
@@ -1718,10 +1718,10 @@ class ShowPowerInlineMeter(ShowPowerInlineMeterSchema):
         # ----------   -----------------------   ---------------   -----------------------------------------------------------------------
 
         # Gi1/0/1      2024-03-06 10:56:57 UTC                 0   0-0-0-0-0-0-0-0-0-0-0-0
-        p1 = re.compile(r'^(?P<intf>[\w\/]+)\s+'
-                         r'(?P<meter_update_time>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\s+\w+)\s+'
-                         r'(?P<metered_value>\d+)\s+'
-                         r'(?P<bucket>(?:\d+-){11}\d+)$')
+        p1 = regex_engine.compile(r'^(?P<intf>[\w\/]+)\s+'
+                                   r'(?P<meter_update_time>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\s+\w+)\s+'
+                                   r'(?P<metered_value>\d+)\s+'
+                                   r'(?P<bucket>(?:\d+-){11}\d+)$')
         
         # Interface    Meter Update              Hourly Metered    Metered Energy in WattSec (5min Buckets)
         #              Time                      Value (WattSec)                                  
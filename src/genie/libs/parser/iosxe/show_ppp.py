@@ -4,14 +4,12 @@ IOSXE parsers for the following show commands:
     * 'show pppatm session'
     * 'show ppp all'
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowPppStatisticsSchema(MetaParser):
@@ -156,100 +154,100 @@ class ShowPppStatistics(ShowPppStatisticsSchema):
         res_dict = {}
 
         # 14   PPP Handles Allocated                       4          4         
-        p1 = re.compile(r'^(?P<type>\d+)\s+PPP Handles Allocated\s+'
-                r'(?P<total_allocated>\d+)\s+(?P<since_cleared>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<type>\d+)\s+PPP Handles Allocated\s+'
+                          r'(?P<total_allocated>\d+)\s+(?P<since_cleared>\d+)$')
 
         # 15   PPP Handles Freed                           1          1         
-        p2 = re.compile(r'^(?P<type>\d+)\s+PPP Handles Freed\s+'
-                r'(?P<total_freed>\d+)\s+(?P<since_cleared>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<type>\d+)\s+PPP Handles Freed\s+'
+                          r'(?P<total_freed>\d+)\s+(?P<since_cleared>\d+)$')
 
         # 19   PPP Encapped Interfaces                     4          4   
-        p3 = re.compile(r'^(?P<type>\d+)\s+PPP Encapped Interfaces\s+'
-                r'(?P<total_intf>\d+)\s+(?P<since_cleared>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<type>\d+)\s+PPP Encapped Interfaces\s+'
+                          r'(?P<total_intf>\d+)\s+(?P<since_cleared>\d+)$')
 
         # 1    Links at LCP Stage                          1          0         
-        p4 = re.compile(r'^(?P<type>\d+)\s+Links at LCP Stage\s+'
-                        r'(?P<peak>\d+)\s+(?P<current>\d+)$')
+        p4 = regex_engine.compile(r'^(?P<type>\d+)\s+Links at LCP Stage\s+'
+                                  r'(?P<peak>\d+)\s+(?P<current>\d+)$')
 
         # 2    Links at Unauthenticated Name Stage         1          0         
-        p5 = re.compile(r'^(?P<type>\d+)\s+Links at Unauthenticated Name Stage\s+'
-                        r'(?P<peak>\d+)\s+(?P<current>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<type>\d+)\s+Links at Unauthenticated Name Stage\s+'
+                                  r'(?P<peak>\d+)\s+(?P<current>\d+)$')
 
         # 3    Links at Authenticated Name Stage           1          0         
-        p6 = re.compile(r'^(?P<type>\d+)\s+Links at Authenticated Name Stage\s+'
-                        r'(?P<peak>\d+)\s+(?P<current>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<type>\d+)\s+Links at Authenticated Name Stage\s+'
+                                  r'(?P<peak>\d+)\s+(?P<current>\d+)$')
 
         # 6    Links at Forwarded Stage                    1          0         
-        p7 = re.compile(r'^(?P<type>\d+)\s+Links at Forwarded Stage\s+'
-                        r'(?P<peak>\d+)\s+(?P<current>\d+)$')
+        p7 = regex_engine.compile(r'^(?P<type>\d+)\s+Links at Forwarded Stage\s+'
+                                  r'(?P<peak>\d+)\s+(?P<current>\d+)$')
 
         # 7    Links at Local Termination Stage            1          1         
-        p8 = re.compile(r'^(?P<type>\d+)\s+Links at Local Termination Stage\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p8 = regex_engine.compile(r'^(?P<type>\d+)\s+Links at Local Termination Stage\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 20   Successful LCP neogtiations                 66         66        
-        p9 = re.compile(r'^(?P<type>\d+)\s+Successful LCP neogtiations\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p9 = regex_engine.compile(r'^(?P<type>\d+)\s+Successful LCP neogtiations\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 22   Entered Authentication Stage                66         66        
-        p10 = re.compile(r'(?P<type>\d+)\s+Entered Authentication Stage\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p10 = regex_engine.compile(r'(?P<type>\d+)\s+Entered Authentication Stage\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 28   IPCP UP Sessions                            1          1         
-        p11 = re.compile(r'(?P<type>\d+)\s+IPCP UP Sessions\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p11 = regex_engine.compile(r'(?P<type>\d+)\s+IPCP UP Sessions\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 48   CHAP authentication attempts                22         22        
-        p12 = re.compile(r'^(?P<type>\d+)\s+CHAP authentication attempts\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p12 = regex_engine.compile(r'^(?P<type>\d+)\s+CHAP authentication attempts\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 50   CHAP authentication failures                22         22        
-        p13 = re.compile(r'^(?P<type>\d+)\s+CHAP authentication failures\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p13 = regex_engine.compile(r'^(?P<type>\d+)\s+CHAP authentication failures\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 51   PAP authentication attempts                 44         44        
-        p14 = re.compile(r'^(?P<type>\d+)\s+PAP authentication attempts\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p14 = regex_engine.compile(r'^(?P<type>\d+)\s+PAP authentication attempts\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 52   PAP authentication successes                25         25        
-        p15 = re.compile(r'^(?P<type>\d+)\s+PAP authentication successes\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p15 = regex_engine.compile(r'^(?P<type>\d+)\s+PAP authentication successes\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 53   PAP authentication failures                 3          3         
-        p16 = re.compile(r'^(?P<type>\d+)\s+PAP authentication failures\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p16 = regex_engine.compile(r'^(?P<type>\d+)\s+PAP authentication failures\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 95   Total Sessions                              1          1         
-        p17 = re.compile(r'^(?P<type>\d+)\s+Total Sessions\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p17 = regex_engine.compile(r'^(?P<type>\d+)\s+Total Sessions\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 96   Non-MLP Sessions                            1          1         
-        p18 = re.compile(r'^(?P<type>\d+)\s+Non-MLP Sessions\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p18 = regex_engine.compile(r'^(?P<type>\d+)\s+Non-MLP Sessions\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 98   Total Links                                 2          1
-        p19 = re.compile(r'^(?P<type>\d+)\s+Total Links\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p19 = regex_engine.compile(r'^(?P<type>\d+)\s+Total Links\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 99   Non-MLP Links                               2          1
-        p20 = re.compile(r'^(?P<type>\d+)\s+Non-MLP Links\s+'
-                        r'(?P<peak>\d+) +(?P<current>\d+)$')
+        p20 = regex_engine.compile(r'^(?P<type>\d+)\s+Non-MLP Links\s+'
+                                  r'(?P<peak>\d+) +(?P<current>\d+)$')
 
         # 11   Missed too many keepalives                  1          1         
-        p21 = re.compile(r'^(?P<type>\d+)\s+Missed too many keepalives\s+'
-                        r'(?P<total>\d+) +(?P<since_cleared>\d+)$')
+        p21 = regex_engine.compile(r'^(?P<type>\d+)\s+Missed too many keepalives\s+'
+                                  r'(?P<total>\d+) +(?P<since_cleared>\d+)$')
 
         # 17   Received LCP TERMREQ from peer              16         16
-        p22 = re.compile(r'^(?P<type>\d+)\s+Received LCP TERMREQ from peer\s+'
-                        r'(?P<total>\d+) +(?P<since_cleared>\d+)$')
+        p22 = regex_engine.compile(r'^(?P<type>\d+)\s+Received LCP TERMREQ from peer\s+'
+                                  r'(?P<total>\d+) +(?P<since_cleared>\d+)$')
 
         # 29   Lower Layer disconnected                    14         14
-        p23 = re.compile(r'^(?P<type>\d+)\s+Lower Layer disconnected\s+'
-                        r'(?P<total>\d+) +(?P<since_cleared>\d+)$')
+        p23 = regex_engine.compile(r'^(?P<type>\d+)\s+Lower Layer disconnected\s+'
+                                  r'(?P<total>\d+) +(?P<since_cleared>\d+)$')
 
         # 61   User cleared from exec prompt               4          4
-        p24 = re.compile(r'^(?P<type>\d+)\s+User cleared from exec prompt\s+'
-                        r'(?P<total>\d+) +(?P<since_cleared>\d+)$')
+        p24 = regex_engine.compile(r'^(?P<type>\d+)\s+User cleared from exec prompt\s+'
+                                  r'(?P<total>\d+) +(?P<since_cleared>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -586,11 +584,11 @@ class ShowPppAtmSession(ShowPppAtmSessionSchema):
 
         parsed_dict = {}
 
-        p1 = re.compile(r'^(?P<session_number>\d+)\ssession\s+in\s(?P<session_state>\w+\s\(\w+\))\sState$')
+        p1 = regex_engine.compile(r'^(?P<session_number>\d+)\ssession\s+in\s(?P<session_state>\w+\s\(\w+\))\sState$')
 
-        p2 = re.compile(r'^(?P<total_sessions>\d+)\ssession\s+total$')
+        p2 = regex_engine.compile(r'^(?P<total_sessions>\d+)\ssession\s+total$')
 
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<uniq_id>[0-9A-Z\/]+)+\s+(?P<atm_intf>[0-9A-Z\/.]+)+\s+(?P<vpi_vci>[0-9\/]+)\s+(?P<encap>\w+)'
             r'\s+(?P<vt>\w+)\s+(?P<va>\w+)\s+(?P<va_st>\w+)\s+(?P<state>\w+)$')
 
@@ -658,7 +656,7 @@ class ShowPppAll(ShowPppAllSchema):
         #Vi2.1        LCP+ PAP+ IPCP+       LocalT   192.2.0.90      username1 
         #Vi2          LCP+ IPCP+ CDPCP-     LocalT   172.16.0.12     Charon-037-4P
         
-        p1 = re.compile(r'^(?P<interface>(\w+|w+\d+|\w+\d+\.\d+))\s+(?P<open>(\w+|\w+\+|\w+\-))\s+(?P<nego>(\w+|\w+\+|w+\-))\s+(?P<fail>(\w+|\w+\+|\w+\-|\s+))\s+(?P<stage>(\w+))\s+(?P<peeraddress>(\d+\.\d+\.\d+\.\d+))\s*(?P<peername>(\S*))$')
+        p1 = regex_engine.compile(r'^(?P<interface>(\w+|w+\d+|\w+\d+\.\d+))\s+(?P<open>(\w+|\w+\+|\w+\-))\s+(?P<nego>(\w+|\w+\+|w+\-))\s+(?P<fail>(\w+|\w+\+|\w+\-|\s+))\s+(?P<stage>(\w+))\s+(?P<peeraddress>(\d+\.\d+\.\d+\.\d+))\s*(?P<peername>(\S*))$')
 
         for line in output.splitlines():
             line = line.strip()
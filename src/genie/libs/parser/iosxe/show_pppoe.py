@@ -5,13 +5,15 @@ IOSXE parsers for the following show commands:
     * 'show pppoe statistics'
 '''
 # Python
-import re
 import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 log = logging.getLogger(__name__)
 
 # ==========================================
@@ -55,11 +57,11 @@ class ShowPppoeStatistics(ShowPppoeStatisticsSchema):
         res_dict = {}
         # PPPoE Events                   TOTAL         SINCE CLEARED
         # PPPoE Statistics               TOTAL         SINCE CLEARED
-        p1 = re.compile(r'^PPPoE\s+(?P<pppoe_type>\w+)\s+TOTAL\s+SINCE CLEARED$')
+        p1 = regex_engine.compile(r'^PPPoE\s+(?P<pppoe_type>\w+)\s+TOTAL\s+SINCE CLEARED$')
 
         # SSS Request                    146772        146772
         # Base VA Create Errors (sync)   0             0
-        p2 = re.compile(r'^(?P<key>\D+[a-zA-Z)])\s+(?P<total>\d+)\s+(?P<since_cleared>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<key>\D+[a-zA-Z)])\s+(?P<total>\d+)\s+(?P<since_cleared>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -130,21 +132,21 @@ class ShowPppoeSession(ShowPppoeSessionSchema):
         
         #    141    141  c884.a1f5.fb00  Gi0/0/0.555              1  Vi2.1      PTA  
                      
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<uniq_id>([A-Z/]+|\d+))+\s+(?P<pppoe_id>\d+)+\s+(?P<remote_mac>([0-9a-fA-F].?){12}\b)\s+'
             r'(?P<port>\w+[/]+\d[/]+\d+|\w+[/]+\d[/]+\d+.\d+|\w+:\s+\d+)\s+(?P<vt>\w+|\s+)\s+(?P<va>\w+|[A-Z/]+|[A-Za-z0-9.]+|\s+)\s+(?P<state_type>\w+|\s+)')
     
         #                c884.a1f5.f700                   UP 
-        p2 = re.compile(r'^(?P<local_mac>([0-9a-fA-F].?){12}\b)+\s+(?P<va_st>(\w*))$')
+        p2 = regex_engine.compile(r'^(?P<local_mac>([0-9a-fA-F].?){12}\b)+\s+(?P<va_st>(\w*))$')
 
         #            bcd2.95c3.80c8
-        p2_1 = re.compile(r'^(?P<local_mac>([0-9a-fA-F].?){12})$')
+        p2_1 = regex_engine.compile(r'^(?P<local_mac>([0-9a-fA-F].?){12})$')
         
         #                                VLAN: 555                   UP 
-        p2_2 = re.compile(r'^\s+VLAN:(?P<vlan>(\d+))\s+(?P<va_st>(\w+))$')
+        p2_2 = regex_engine.compile(r'^\s+VLAN:(?P<vlan>(\d+))\s+(?P<va_st>(\w+))$')
 
         #                c884.a1f5.f700  VLAN: 555                   UP
-        p2_3 = re.compile(r'^(?P<local_mac>([0-9a-fA-F].?){12}\b)+\s+VLAN:\s+(?P<vlan>(\d+|\s+))\s+(?P<va_st>(\w+))$')
+        p2_3 = regex_engine.compile(r'^(?P<local_mac>([0-9a-fA-F].?){12}\b)+\s+VLAN:\s+(?P<vlan>(\d+|\s+))\s+(?P<va_st>(\w+))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -247,15 +249,15 @@ class ShowPppoeSummary(ShowPppoeSummarySchema):
         res_dict = {}
 
         # 1 client session
-        p1 = re.compile(r'^(?P<client_session>\d+)')
+        p1 = regex_engine.compile(r'^(?P<client_session>\d+)')
 
         # TOTAL                               2       2       0       0
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r'^(TOTAL\s+(?P<total_count>\d+)\s+(?P<total_pta_count>\d+)\s+(?P<total_fwded_count>\d+)+\s+'
             r'(?P<total_trans_count>\d+)$)')
 
         # GigabitEthernet0/1/0                1       1       0       0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^((?P<interface>\D+\d+((/\d+)+(\.\d+)?)?)\s+(?P<total>\d+)\s+(?P<pta>\d+)\s+(?P<fwded>\d+)+\s+'
             r'(?P<trans>\d+)$)')
 
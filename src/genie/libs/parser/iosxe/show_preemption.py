@@ -1,6 +1,6 @@
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =============================
@@ -61,7 +61,7 @@ class ShowPreemptionSummary(ShowPreemptionSummarySchema):
 
         # Matches interface name, preemption supported, configured and operational
         # Interface       Preemption Supported      Premption Configured      Preemption Operational
-        p_preemption_summ= re.compile(r"^(?P<interface>\w+\/\d+\/?\d*)\s+(?P<p_supp>\w+|-+)\s+(?P<p_conf>\w+|-+)\s+(?P<p_oper>\w+|-+)\s*$")
+        p_preemption_summ= regex_engine.compile(r"^(?P<interface>\w+\/\d+\/?\d*)\s+(?P<p_supp>\w+|-+)\s+(?P<p_conf>\w+|-+)\s+(?P<p_oper>\w+|-+)\s*$")
 
         result_dict = {}
         interface_dict = {}
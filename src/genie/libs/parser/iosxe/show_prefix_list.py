@@ -6,13 +6,13 @@ IOSXE parsers for the following show commands:
     * show ipv6 prefix-list detail
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================================
 # Parser for 'show ip prefix-list detail'
@@ -73,7 +73,7 @@ class ShowIpPrefixListDetail(ShowIpPrefixListDetailSchema):
 
             # ip prefix-list test:
             # ipv6 prefix-list test6:
-            p1 = re.compile(r'^(ipv6|ip) +prefix\-list +(?P<name>\S+)\:$')
+            p1 = regex_engine.compile(r'^(ipv6|ip) +prefix\-list +(?P<name>\S+)\:$')
             m = p1.match(line)
             if m:
                 name = m.groupdict()['name']
@@ -88,10 +88,10 @@ class ShowIpPrefixListDetail(ShowIpPrefixListDetailSchema):
 
             # count: 5, range entries: 4, sequences: 5 - 25, refcount: 2
             # count: 0, range entries: 0, refcount: 1
-            p2 = re.compile(r'^count: +(?P<count>\d+), +'
-                             r'range entries: +(?P<entries>\d+),( +'
-                             r'sequences: +(?P<sequences>[\d\-\s]+),)? +'
-                             r'refcount: +(?P<refcount>\d+)$')
+            p2 = regex_engine.compile(r'^count: +(?P<count>\d+), +'
+                                       r'range entries: +(?P<entries>\d+),( +'
+                                       r'sequences: +(?P<sequences>[\d\-\s]+),)? +'
+                                       r'refcount: +(?P<refcount>\d+)$')
             m = p2.match(line)
             if m:
                 ret_dict['prefix_set_name'][name]['count'] = int(m.groupdict()['count'])
@@ -106,10 +106,10 @@ class ShowIpPrefixListDetail(ShowIpPrefixListDetailSchema):
             # seq 5 permit 2001:DB8:1::/64 (hit count: 0, refcount: 1)
             # seq 20 permit 10.94.0.0/8 ge 24 (hit count: 0, refcount: 2)
             # seq 25 permit 10.169.0.0/8 ge 16 le 24 (hit count: 0, refcount: 3)
-            p3 = re.compile(r'^seq +(?P<seq>\d+) +(?P<action>\w+) +'
-                             r'(?P<prefixes>(?P<prefix>[\w\.\|:]+)\/(?P<mask>\d+))'
-                             r'( *(?P<range>[lge\d\s]+))?'
-                             r' +\(hit +count: +(?P<hit_count>\d+), +refcount: +(?P<refcount>\d+)\)$')
+            p3 = regex_engine.compile(r'^seq +(?P<seq>\d+) +(?P<action>\w+) +'
+                                       r'(?P<prefixes>(?P<prefix>[\w\.\|:]+)\/(?P<mask>\d+))'
+                                       r'( *(?P<range>[lge\d\s]+))?'
+                                       r' +\(hit +count: +(?P<hit_count>\d+), +refcount: +(?P<refcount>\d+)\)$')
             m = p3.match(line)
             if m:
                 prefixes = m.groupdict()['prefixes']
@@ -125,20 +125,20 @@ class ShowIpPrefixListDetail(ShowIpPrefixListDetailSchema):
                 else:
                     dummy = dummy.strip()
                     # ge 16 le 24
-                    match = re.compile(r'^ge +(?P<val1>\d+) +le +(?P<val2>\d+)$').match(dummy)
+                    match = regex_engine.compile(r'^ge +(?P<val1>\d+) +le +(?P<val2>\d+)$').match(dummy)
                     if match:
                         masklength_range = '{val1}..{val2}'.format(val1=match.groupdict()['val1'],
                                                                    val2=match.groupdict()['val2'])
 
 
                     # le 16
-                    match = re.compile(r'^le +(?P<val2>\d+)$').match(dummy)
+                    match = regex_engine.compile(r'^le +(?P<val2>\d+)$').match(dummy)
                     if match:
                         masklength_range = '{val1}..{val2}'.format(val1=mask,
                                                                    val2=match.groupdict()['val2'])
 
                     # ge 16
-                    match = re.compile(r'^ge +(?P<val1>\d+)$').match(dummy)
+                    match = regex_engine.compile(r'^ge +(?P<val1>\d+)$').match(dummy)
                     if match:
                         max_val = '32' if af == 'ip' else '128'
                         masklength_range = '{val1}..{val2}'.format(val1=match.groupdict()['val1'],
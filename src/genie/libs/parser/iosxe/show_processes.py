@@ -6,11 +6,13 @@ IOSXE parser for the following show command:
     * show processes platform | include {process}
 '''
 
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==================================================
 # Schema for 'show processes memory platform sorted'
@@ -61,18 +63,18 @@ class ShowProcessesMemoryPlatformSorted(ShowProcessesMemoryPlatformSortedSchema)
 			procmem_dict = mem_dict.setdefault('per_process_memory', {})
 
 		# System memory: 7703908K total, 3863776K used, 3840132K free, 
-		p1 = re.compile(r'System +memory: +(?P<total>(\d+\w?)) +total,'
+		p1 = regex_engine.compile(r'System +memory: +(?P<total>(\d+\w?)) +total,'
 						r' +(?P<used>(\d+\w?)) +used,'
 						r' +(?P<free>(\d+\w?)) +free,')
 
 		# Lowest: 3707912K
-		p2 = re.compile(r'Lowest: (?P<lowest>(\d+\w?))')
+		p2 = regex_engine.compile(r'Lowest: (?P<lowest>(\d+\w?))')
 
 
 		#    Pid    Text      Data   Stack   Dynamic       RSS              Name
 		# ----------------------------------------------------------------------
 		#  16994  233305    887872     136       388    887872   linux_iosd-imag
-		p3 = re.compile(r'(?P<pid>(\d+))(\s+)(?P<text>(\d+))(\s+)(?P<data>(\d+))'
+		p3 = regex_engine.compile(r'(?P<pid>(\d+))(\s+)(?P<text>(\d+))(\s+)(?P<data>(\d+))'
 						r'(\s+)(?P<stack>(\d+))(\s+)(?P<dynamic>(\d+))'
 						r'(\s+)(?P<RSS>(\d+))(\s+)(?P<name>([\w-])+)')
 
@@ -142,7 +144,7 @@ class ShowProcessesPlatformCProcess(ShowProcessesPlatformCProcessSchema):
 		ret_dict = {}
 
         # Number of lines which match regexp = 1
-		p1 = re.compile(r"^Number\s+of\s+lines\s+which\s+match\s+regexp\s=\s+(?P<number_of_matching_lines>\d+)")
+		p1 = regex_engine.compile(r"^Number\s+of\s+lines\s+which\s+match\s+regexp\s=\s+(?P<number_of_matching_lines>\d+)")
 		for line in output.splitlines():
 			line = line.strip()
 
@@ -198,7 +200,7 @@ class ShowProcessesPlatformIProcess(ShowProcessesPlatformIProcessSchema):
 		processes_platform_ret_dict = {}
 
         # Pid	PPid  Status		Size  Name
-		p1 = re.compile(r"^(?P<pid>\S+)\s+(?P<ppid>\S+)\s+(?P<status>\S+)\s+(?P<size>\S+)\s+(?P<name>\S+)")
+		p1 = regex_engine.compile(r"^(?P<pid>\S+)\s+(?P<ppid>\S+)\s+(?P<status>\S+)\s+(?P<size>\S+)\s+(?P<name>\S+)")
 
 		for line in output.splitlines():
 			line = line.strip()
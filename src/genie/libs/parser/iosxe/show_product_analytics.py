@@ -5,11 +5,11 @@ IOSXE C9300 parsers for the following show commands:
     * show product-analytics kpi summary
     * show product-analytics kpi report <id>
 '''
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or, ListOf
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie import parsergen
 
@@ -38,7 +38,7 @@ class ShowProductAnalyticsReportSummary(ShowProductAnalyticsReportSummarySchema)
         # Report ID                   Policy Version   
         # --------------------------- ---------------- 
         # 1664338829                    17.11.1
-        p1 = re.compile(r'^(?P<paReport_id>\d+)\s+(?P<policy_version>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<paReport_id>\d+)\s+(?P<policy_version>\S+)$')
         
         for line in out.splitlines():
            line = line.strip()
@@ -82,7 +82,7 @@ class ShowProductAnalyticsKpiSummary(ShowProductAnalyticsKpiSummarySchema):
         # Time                          Report ID                     KPI Name                   
         # ----------------------------- ----------------------------- ---------------------------
         # 10/05/2022 00:00:00            1664953200                      hardware_inventory 
-        p1 = re.compile(r"^(?P<time_stamp>[\d\/]+ [\d\:]+)\s+(?P<report_id>\d+)\s+(?P<kpi_name>\S+)$")
+        p1 = regex_engine.compile(r"^(?P<time_stamp>[\d\/]+ [\d\:]+)\s+(?P<report_id>\d+)\s+(?P<kpi_name>\S+)$")
 
         for line in out.splitlines():
            line = line.strip()
@@ -128,17 +128,17 @@ class ShowProductAnalyticsKpiReportId(ShowProductAnalyticsKpiReportIdSchema):
         ret_dict = {}
 
         # Report ID     : 1665964800
-        p1 = re.compile(r'^Report +ID +: +(?P<report_id>\d+)$')
+        p1 = regex_engine.compile(r'^Report +ID +: +(?P<report_id>\d+)$')
 
         # Computed at   : 10/16/2022 17:00:00
-        p2 = re.compile(r'^Computed +at +: +(?P<time_stamp>([\d\/]+ [\d\:]+))$')
+        p2 = regex_engine.compile(r'^Computed +at +: +(?P<time_stamp>([\d\/]+ [\d\:]+))$')
 
         # KPI Name      : hardware_inventory
-        p3 = re.compile(r'^KPI +Name +: +(?P<kpi_name>\S+)$')
+        p3 = regex_engine.compile(r'^KPI +Name +: +(?P<kpi_name>\S+)$')
 
         # KPI Value     : [{"cname":"Switch2","serial_no":"FCW2137L0E2","part_no":"C9300-48U"},{"cname":"Switch8","serial_no":"FOC2624Y70Z","part_no":"C9300-48U"},{"cname":"c93xx Stack","serial_no":"FCW2137L0E2","part_no":"C9300-48U"},{"cname":"StackPort2/1","serial_no":"MOC2117A9QX","part_no":"STACK-T1-1M"},{"cname":"StackPort2/2","serial_no":"LCC2109G0LM","part_no":"STACK-T1-1M"},{"cname":"StackPort8/1","serial_no":"LCC2109G0LM","part_no":"STACK-T1-1M"},{"cname":"StackPort8/2","serial_no":"MOC2117A9QX","part_no":"STACK-T1-1M"},{"cname":"PowerSupply2/B","serial_no":"DCA2210G3R5","part_no":"PWR-C1-715WAC"},{"cname":"PowerSupply8/A","serial_no":"DTN2106V0HE","part_no":"PWR-C1-1100WAC"},{"cname":"FRUUplinkModule2/1","serial_no":"FOC19110PQ6","part_no":"C3850-NM-8-10G"},{"cname":"FRUUplinkModule8/1","serial_no":"FOC17167MHJ","part_no":"C3850-NM-4-1G"}]
 
-        p4 = re.compile(r'^KPI +Value +: +(?P<kpi_value>.*)$')
+        p4 = regex_engine.compile(r'^KPI +Value +: +(?P<kpi_value>.*)$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -12,6 +12,7 @@ from netaddr import IPAddress, INET_ATON
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -321,41 +322,41 @@ class ShowIpProtocols(ShowIpProtocolsSchema):
         # Routing Protocol is "isis"
         # Routing Protocol is "isis banana"
         # Routing Protocol is "eigrp 1"
-        p1 = re.compile(r"^Routing +Protocol +is"
-                        r" +\"(?P<protocol>(ospf|bgp|isis|eigrp|application|rip))"
-                        r"(?: *(?P<pid>(\S+)))?\"$")
+        p1 = regex_engine.compile(r"^Routing +Protocol +is"
+                                  r" +\"(?P<protocol>(ospf|bgp|isis|eigrp|application|rip))"
+                                  r"(?: *(?P<pid>(\S+)))?\"$")
 
         # Outgoing update filter list for all interfaces is not set
         # Incoming update filter list for all interfaces is not set
-        p2 = re.compile(r"^(?P<dir>(Outgoing|Incoming)) +update +filter +list"
-                        r" +for +all +interfaces +is +(?P<state>([a-zA-Z\s]+))$")
+        p2 = regex_engine.compile(r"^(?P<dir>(Outgoing|Incoming)) +update +filter +list"
+                                  r" +for +all +interfaces +is +(?P<state>([a-zA-Z\s]+))$")
 
         # Router ID 10.4.1.1
-        p3 = re.compile(r"^Router +ID +(?P<router_id>(\S+))$")
+        p3 = regex_engine.compile(r"^Router +ID +(?P<router_id>(\S+))$")
 
         # Number of areas in this router is 1. 1 normal 0 stub 0 nssa
-        p4 = re.compile(r"^Number +of +areas +in +this +router +is"
-                        r" +(?P<areas>(\d+)). +(?P<normal>(\d+)) +normal"
-                        r" +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+)) +nssa$")
+        p4 = regex_engine.compile(r"^Number +of +areas +in +this +router +is"
+                                  r" +(?P<areas>(\d+)). +(?P<normal>(\d+)) +normal"
+                                  r" +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+)) +nssa$")
 
         # Maximum path: 4
-        p5 = re.compile(r"^Maximum +path: +(?P<max>(\d+))$")
+        p5 = regex_engine.compile(r"^Maximum +path: +(?P<max>(\d+))$")
 
         # Routing for Networks:
-        p6_1 = re.compile(r"^Routing +for +Networks:$")
+        p6_1 = regex_engine.compile(r"^Routing +for +Networks:$")
 
         # Routing on Interfaces Configured Explicitly (Area 0):
-        p6_2 = re.compile(r"^Routing +on +Interfaces +Configured +Explicitly"
-                          r" +\(Area +(?P<area>[\d\.]+)\)\:$")
+        p6_2 = regex_engine.compile(r"^Routing +on +Interfaces +Configured +Explicitly"
+                                    r" +\(Area +(?P<area>[\d\.]+)\)\:$")
 
         # Routing Information Sources:
-        p6_3 = re.compile(r"^Routing +Information +Sources:$")
+        p6_3 = regex_engine.compile(r"^Routing +Information +Sources:$")
 
         # Passive Interface(s):
-        p6_4 = re.compile(r"^Passive +Interface\(s\):$")
+        p6_4 = regex_engine.compile(r"^Passive +Interface\(s\):$")
 
         # Address Summarization:
-        p6_5 = re.compile(r"^Address +Summarization:$")
+        p6_5 = regex_engine.compile(r"^Address +Summarization:$")
 
         # Loopback0
         # GigabitEthernet2
@@ -364,154 +365,154 @@ class ShowIpProtocols(ShowIpProtocolsSchema):
         # Serial0
         # VoIP-Null0
         # Ethernet2/0
-        p7 = re.compile(r"^(?P<interface>(Lo\S*|Gi\S*|Ten\S*|\S*(SL|VL)\S*|Se\S*|VoIP\S*|Et\S*))$")
+        p7 = regex_engine.compile(r"^(?P<interface>(Lo\S*|Gi\S*|Ten\S*|\S*(SL|VL)\S*|Se\S*|VoIP\S*|Et\S*))$")
 
         # Gateway         Distance      Last Update
         # 10.36.3.3            110      07:33:00
         # 10.16.2.2            110      07:33:00
         # 10.64.4.4            110      00:19:15
-        p8 = re.compile(r"^(?P<gateway>([0-9\.]+)) +(?P<distance>(\d+))"
-                         r" +(?P<last_update>([a-zA-Z0-9\:\.]+))$")
+        p8 = regex_engine.compile(r"^(?P<gateway>([0-9\.]+)) +(?P<distance>(\d+))"
+                                   r" +(?P<last_update>([a-zA-Z0-9\:\.]+))$")
 
         # Distance: (default is 110)
-        p9 = re.compile(r"^Distance: +\(default +is +(?P<num>(\d+))\)$")
+        p9 = regex_engine.compile(r"^Distance: +\(default +is +(?P<num>(\d+))\)$")
 
         # Distance: intra-area 112 inter-area 113 external 114
-        p10 = re.compile(r"^Distance: +intra-area +(?P<intra>(\d+)) +inter-area"
-                          r" +(?P<inter>(\d+)) +external +(?P<external>(\d+))$")
+        p10 = regex_engine.compile(r"^Distance: +intra-area +(?P<intra>(\d+)) +inter-area"
+                                    r" +(?P<inter>(\d+)) +external +(?P<external>(\d+))$")
 
         # Sending updates every 0 seconds
-        p11 = re.compile(r"^Sending +updates +every +(?P<update>(\d+)) +seconds$")
+        p11 = regex_engine.compile(r"^Sending +updates +every +(?P<update>(\d+)) +seconds$")
 
         # Invalid after 0 seconds, hold down 0, flushed after 0
-        p12 = re.compile(r"^Invalid +after +(?P<invalid>(\d+)) +seconds, +hold"
-                          r" +down +(?P<holddown>(\d+)), +flushed +after"
-                          r" +(?P<flushed>(\d+))$")
+        p12 = regex_engine.compile(r"^Invalid +after +(?P<invalid>(\d+)) +seconds, +hold"
+                                    r" +down +(?P<holddown>(\d+)), +flushed +after"
+                                    r" +(?P<flushed>(\d+))$")
 
         # IGP synchronization is disabled
-        p13 = re.compile(r"^IGP +synchronization +is +(?P<igp>(enabled|disabled))$")
+        p13 = regex_engine.compile(r"^IGP +synchronization +is +(?P<igp>(enabled|disabled))$")
 
         # Automatic route summarization is disabled
-        p14 = re.compile(r"^Automatic +route +summarization +is"
-                          r" +(?P<route>(enabled|disabled))$")
+        p14 = regex_engine.compile(r"^Automatic +route +summarization +is"
+                                    r" +(?P<route>(enabled|disabled))$")
 
         # Distance: external 20 internal 200 local 200
         # Distance:external 20 internal 200 local 200
-        p15 = re.compile(r"^Distance: *external +(?P<external>(\d+)) +internal"
-                          r" +(?P<internal>(\d+)) +local +(?P<local>(\d+))$")
+        p15 = regex_engine.compile(r"^Distance: *external +(?P<external>(\d+)) +internal"
+                                    r" +(?P<internal>(\d+)) +local +(?P<local>(\d+))$")
 
 
         # Redistributing: isis banana
-        p16 = re.compile(r"^Redistributing: +(?P<redistributing>([a-zA-Z\_\s]+))$")
+        p16 = regex_engine.compile(r"^Redistributing: +(?P<redistributing>([a-zA-Z\_\s]+))$")
 
         # 10.0.0.84 0.0.0.3 area 11
         # 10.0.0.88 0.0.0.3 area 11
         # 192.168.0.10 0.0.0.0 area 11
-        p17 = re.compile(r'(?P<address>[\d\.]+)\s+(?P<mask>[\d\.]+)\s+area\s+(?P<area>[\d\.]+)')
+        p17 = regex_engine.compile(r'(?P<address>[\d\.]+)\s+(?P<mask>[\d\.]+)\s+area\s+(?P<area>[\d\.]+)')
 
         passive_interface_flag = False
         routing_network_flag = False
         neighbors_flag = False
 
         # Routing Protocol is "rip"
-        p100 = re.compile(r'^\s*Routing Protocol +is +\"(?P<protocol>[\w]+)\"$')
+        p100 = regex_engine.compile(r'^\s*Routing Protocol +is +\"(?P<protocol>[\w]+)\"$')
 
         # Output delay 50 milliseconds between packets
-        p102 = re.compile(r'^\s*Output +delay +(?P<output_delay>[\d]+) +milliseconds +between +packets$')
+        p102 = regex_engine.compile(r'^\s*Output +delay +(?P<output_delay>[\d]+) +milliseconds +between +packets$')
 
         # Outgoing update filter list for all interfaces is not set
         # Outgoing update filter list for all interfaces is 150
-        p103 = re.compile(
+        p103 = regex_engine.compile(
             r'^\s*Outgoing +update +filter +list +for all +interfaces +is +(?P<outgoing_update_filterlist>[\S\s]+)$')
 
         # Incoming update filter list for all interfaces is not set
         # Incoming update filter list for all interfaces is 100
-        p104 = re.compile(
+        p104 = regex_engine.compile(
             r'^\s*Incoming +update +filter +list +for all +interfaces +is +(?P<incoming_update_filterlist>[\S\s]+)$')
 
         # GigabitEthernet3.100 filtered by 130 (per-user), default is not set
-        p104_1 = re.compile(
+        p104_1 = regex_engine.compile(
             r'^\s*(?P<interface>\S+) +filtered +by +(?P<filter>\d+)( +\((?P<per_user>\S+)\))?,'
             r' +default +is +(?P<default>[\w\s]+)$')
         # Incoming routes will have 10 added to metric if on list 21
-        p105 = re.compile(r'^\s*Incoming +routes +will +have +(?P<added>\S+) +added +to +metric'
-                          r' +if +on +list +(?P<list>\S+)$')
+        p105 = regex_engine.compile(r'^\s*Incoming +routes +will +have +(?P<added>\S+) +added +to +metric'
+                                    r' +if +on +list +(?P<list>\S+)$')
 
         # Sending updates every 10 seconds, next due in 8 seconds
-        p106 = re.compile(
+        p106 = regex_engine.compile(
             r'^\s*Sending +updates every +(?P<update_interval>\d+) +seconds, +next +due +in (?P<next_update>\d+) +(seconds|sec)$')
 
         # Invalid after 21 seconds, hold down 22, flushed after 23
-        p107 = re.compile(
+        p107 = regex_engine.compile(
             r'^\s*Invalid +after +(?P<invalid_interval>\d+) +seconds, +hold +down +(?P<holddown_interval>\d+)'
             r', +flushed +after +(?P<flush_interval>\d+)$')
 
         # Default redistribution metric is 3
-        p108 = re.compile(r'^\s*Default +redistribution +metric +is +(?P<default_redistribution_metric>\d+)$')
+        p108 = regex_engine.compile(r'^\s*Default +redistribution +metric +is +(?P<default_redistribution_metric>\d+)$')
 
         # Redistributing: connected, static, rip
         # Redistributing:connected, static
-        p109 = re.compile(r'^\s*Redistributing: *(?P<Redistributing>[\w\,\s]+)$')
+        p109 = regex_engine.compile(r'^\s*Redistributing: *(?P<Redistributing>[\w\,\s]+)$')
 
         # Neighbor(s):
-        p110 = re.compile(r'^\s*Neighbor\(s\):$')
+        p110 = regex_engine.compile(r'^\s*Neighbor\(s\):$')
 
         # 172.16.121.101                                        ACCEPT_SCI_RICHEMONT
         # 192.168.1.176                                         INTERNET_EDGE_IN
         # 192.168.1.177                                         INTERNET_EDGE_IN
         # 192.168.0.9
-        p111 = re.compile(r'(?P<neighbor>[\d\.]+)\s*(?P<route_map>[\w]+)?')
+        p111 = regex_engine.compile(r'(?P<neighbor>[\d\.]+)\s*(?P<route_map>[\w]+)?')
 
         # Default version control: send version 2, receive version 2
-        p112 = re.compile(r'^\s*Default +version +control: +send +version +(?P<send_version>\d+)'
-                          r', receive version +(?P<receive_version>\d+)$')
+        p112 = regex_engine.compile(r'^\s*Default +version +control: +send +version +(?P<send_version>\d+)'
+                                    r', receive version +(?P<receive_version>\d+)$')
 
         # Default version control: send version 1, receive any version
-        p112_1 = re.compile(r'^\s*Default +version +control: +send +version +(?P<send_version>\d+)'
-                          r', receive +(?P<receive_version>\w+) version$')
+        p112_1 = regex_engine.compile(r'^\s*Default +version +control: +send +version +(?P<send_version>\d+)'
+                                    r', receive +(?P<receive_version>\w+) version$')
 
         #   Interface                           Send  Recv  Triggered RIP  Key-chain
         #   GigabitEthernet3.100                2     2          No        1
         #   GigabitEthernet3.100                1 2   2          No        none
-        p113 = re.compile(r'^\s*(?P<interface>[\S]+) +(?P<send>\d( \d)?)'
-                          r' +(?P<receive>\d( \d)?)?'
-                          r' +(?P<triggered_rip>\S+) +(?P<key_chain>\S+)$')
+        p113 = regex_engine.compile(r'^\s*(?P<interface>[\S]+) +(?P<send>\d( \d)?)'
+                                    r' +(?P<receive>\d( \d)?)?'
+                                    r' +(?P<triggered_rip>\S+) +(?P<key_chain>\S+)$')
 
         # Automatic network summarization is not in effect
         # Automatic network summarization is in effect
-        p114 = re.compile(
+        p114 = regex_engine.compile(
             r'^\s*Automatic +network +summarization +is( +(?P<automatic_network_summarization>\S+))? +in +effect$')
 
         # Address Summarization:
-        p115 = re.compile(r'^\s*Address +Summarization:$')
+        p115 = regex_engine.compile(r'^\s*Address +Summarization:$')
 
         #   172.16.0.0/17 for GigabitEthernet3.100
-        p116 = re.compile(r'^\s*(?P<prefix>[\d\.\/]+) +for +(?P<interface>[\w\.]+)$')
+        p116 = regex_engine.compile(r'^\s*(?P<prefix>[\d\.\/]+) +for +(?P<interface>[\w\.]+)$')
 
         # Maximum path: 4
-        p117 = re.compile(r'^\s*Maximum +path: +(?P<maximum_path>\d+)$')
+        p117 = regex_engine.compile(r'^\s*Maximum +path: +(?P<maximum_path>\d+)$')
 
         # Routing for Networks:
-        p118 = re.compile(r'^\s*Routing +for +Networks:$')
+        p118 = regex_engine.compile(r'^\s*Routing +for +Networks:$')
 
         #   10.0.0.0
-        p119 = re.compile(r'^\s*(?P<network>[\d\.]+)$')
+        p119 = regex_engine.compile(r'^\s*(?P<network>[\d\.]+)$')
 
         # Passive Interface(s):
-        p120 = re.compile(r'^\s*Passive +Interface\(s\):$')
+        p120 = regex_engine.compile(r'^\s*Passive +Interface\(s\):$')
 
         #   GigabitEthernet2.100
-        p121 = re.compile(r'^\s*(?P<passive_interface>[\w\.]+)$')
+        p121 = regex_engine.compile(r'^\s*(?P<passive_interface>[\w\.]+)$')
 
         # Routing Information Sources:
-        p122 = re.compile(r'^\s*Routing +Information +Sources:$')
+        p122 = regex_engine.compile(r'^\s*Routing +Information +Sources:$')
 
         #   Gateway         Distance      Last Update
         #   10.1.2.2             120      00:00:04
-        p123 = re.compile(r'^\s*(?P<gateway>[\d\.]+) +(?P<distance>\d+) +(?P<last_update>[\w\:]+)$')
+        p123 = regex_engine.compile(r'^\s*(?P<gateway>[\d\.]+) +(?P<distance>\d+) +(?P<last_update>[\w\:]+)$')
 
         # Distance: (default is 120)
-        p124 = re.compile(r'^\s*Distance: +\(default +is +(?P<distance>\d+)\)$')
+        p124 = regex_engine.compile(r'^\s*Distance: +\(default +is +(?P<distance>\d+)\)$')
 
         network_list = []
 
@@ -1247,20 +1248,20 @@ class ShowIpv6ProtocolsSectionRip(ShowIpv6ProtocolsSectionRipSchema):
         address_family= "ipv6"
 
         #IPv6 Routing Protocol is "rip ripng"
-        p1 = re.compile(r'^\s*IPv6 +Routing +Protocol +is +\"(?P<protocol>[\w\s]+)\"$')
+        p1 = regex_engine.compile(r'^\s*IPv6 +Routing +Protocol +is +\"(?P<protocol>[\w\s]+)\"$')
 
         # Interfaces:
-        p2 = re.compile(r'^\s*Interfaces$')
+        p2 = regex_engine.compile(r'^\s*Interfaces$')
 
         #   GigabitEthernet3.200
-        p3 = re.compile(r'^\s*(?P<interface>[\w\.\/]+)$')
+        p3 = regex_engine.compile(r'^\s*(?P<interface>[\w\.\/]+)$')
 
         # Redistribution:
         #   Redistributing protocol connected with metric 3
         #   Redistributing protocol connected with transparent metric 3
-        p4 = re.compile(r'^\s*Redistributing +protocol +(?P<redistribute>\w+) +with( +transparent)? +metric( +(?P<metric>\d+))?$')
+        p4 = regex_engine.compile(r'^\s*Redistributing +protocol +(?P<redistribute>\w+) +with( +transparent)? +metric( +(?P<metric>\d+))?$')
         #   Redistributing protocol static with transparent metric route-map static-to-rip
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^\s*Redistributing +protocol +(?P<redistribute>\w+) +with +transparent +metric( +route-map +(?P<route_policy>[\w\-]+))?$')
 
         result_dict = {}
@@ -1596,48 +1597,48 @@ class ShowIpv6Protocols(ShowIpv6ProtocolsSchema):
         # IPv6 Routing Protocol is "isis"
         # IPv6 Routing Protocol is "isis banana"
         # IPv6 Routing Protocol is "eigrp 1"
-        p1 = re.compile(r"^IPv6 Routing +Protocol +is"
-                        r" +\"(?P<protocol>(ospf|bgp|isis|eigrp|rip))"
-                        r"(?: *(?P<pid>(\S+)))?\"$")
+        p1 = regex_engine.compile(r"^IPv6 Routing +Protocol +is"
+                                  r" +\"(?P<protocol>(ospf|bgp|isis|eigrp|rip))"
+                                  r"(?: *(?P<pid>(\S+)))?\"$")
 
         # Outgoing update filter list for all interfaces is not set
         # Incoming update filter list for all interfaces is not set
-        p2 = re.compile(r"^(?P<dir>(Outgoing|Incoming)) +update +filter +list"
-                        r" +for +all +interfaces +is +(?P<state>([a-zA-Z\s]+))$")
+        p2 = regex_engine.compile(r"^(?P<dir>(Outgoing|Incoming)) +update +filter +list"
+                                  r" +for +all +interfaces +is +(?P<state>([a-zA-Z\s]+))$")
 
         # Router ID 10.4.1.1
-        p3 = re.compile(r"^Router +ID +(?P<router_id>(\S+))$")
+        p3 = regex_engine.compile(r"^Router +ID +(?P<router_id>(\S+))$")
 
         # Number of areas: 1 normal, 0 stub, 0 nssa
-        p4 = re.compile(r"^Number +of +areas:"
-                        r" +(?P<normal>(\d+)) +normal,"
-                        r" +(?P<stub>(\d+)) +stub, +(?P<nssa>(\d+)) +nssa$")
+        p4 = regex_engine.compile(r"^Number +of +areas:"
+                                  r" +(?P<normal>(\d+)) +normal,"
+                                  r" +(?P<stub>(\d+)) +stub, +(?P<nssa>(\d+)) +nssa$")
 
         # EIGRP-IPv6 VR(pyats) Address-Family Protocol for AS(20)
         # EIGRP-IPv6 Protocol for AS(20)
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^EIGRP\-(?P<address_family>IPv4|IPv6)\s+(VR\((?P<name>\w+)\)\s+Address\-Family\s+)?'
             r'Protocol\s+for\s+AS\(\s*(?P<as_num>[\S]+)\)\s*(?:VRF\((?P<vrf>\S+)\))?$'
         )
 
         # Routing for Networks:
-        p6_1 = re.compile(r"^Routing +for +Networks:$")
+        p6_1 = regex_engine.compile(r"^Routing +for +Networks:$")
 
         # Interfaces (Area 0):
         # Interfaces:
-        p6_2 = re.compile(
+        p6_2 = regex_engine.compile(
             r"^Interfaces"
             r"( +\(Area +(?P<area>[\d\.]+)\))?\:$"
         )
 
         # Routing Information Sources:
-        p6_3 = re.compile(r"^Routing +Information +Sources:$")
+        p6_3 = regex_engine.compile(r"^Routing +Information +Sources:$")
 
         # Passive Interface(s):
-        p6_4 = re.compile(r"^Passive +Interface\(s\):$")
+        p6_4 = regex_engine.compile(r"^Passive +Interface\(s\):$")
 
         # Address Summarization:
-        p6_5 = re.compile(r"^Address +Summarization:$")
+        p6_5 = regex_engine.compile(r"^Address +Summarization:$")
 
         # Loopback0
         # GigabitEthernet2
@@ -1646,7 +1647,7 @@ class ShowIpv6Protocols(ShowIpv6ProtocolsSchema):
         # Serial0
         # VoIP-Null0
         # Ethernet2/0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^(?P<interface>(Lo\S*|Gi\S*|Ten\S*|\S*(SL|VL)\S*|Se\S*|VoIP\S*|Vlan\S*|Po\S*|Et\S*))'
             r'( +\((?P<passive>passive)\))?$'
         )
@@ -1655,83 +1656,83 @@ class ShowIpv6Protocols(ShowIpv6ProtocolsSchema):
         # 10.36.3.3            110      07:33:00
         # 10.16.2.2            110      07:33:00
         # 10.64.4.4            110      00:19:15
-        p8 = re.compile(r"^(?P<gateway>([0-9\.]+)) +(?P<distance>(\d+))"
-                         r" +(?P<last_update>([a-zA-Z0-9\:\.]+))$")
+        p8 = regex_engine.compile(r"^(?P<gateway>([0-9\.]+)) +(?P<distance>(\d+))"
+                                   r" +(?P<last_update>([a-zA-Z0-9\:\.]+))$")
         # Metric weight K1=1, K2=0, K3=1, K4=0, K5=0 K6=0
         # Metric weight K1=1, K2=0, K3=1, K4=0, K5=0
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^Metric +weight +K1=(?P<k1>\d+), +K2=(?P<k2>\d+), +K3=(?P<k3>\d+), +K4=(?P<k4>\d+),'
             r' +K5=(?P<k5>\d+)( +K6=(?P<k6>\d+))?$'
         )
 
         # Router ID 10.4.1.1
-        p10 = re.compile(r"^Router\-ID: +(?P<router_id>(\S+))$")
+        p10 = regex_engine.compile(r"^Router\-ID: +(?P<router_id>(\S+))$")
 
         # Topology : 0 (base)
-        p11 = re.compile(r'^Topology +:\s+(?P<topology_id>\d+)')
+        p11 = regex_engine.compile(r'^Topology +:\s+(?P<topology_id>\d+)')
 
         # Active Timer: 3 min
-        p11_1 = re.compile(r'^Active +Timer:\s+(?P<active_timer>\d+) +min$')
+        p11_1 = regex_engine.compile(r'^Active +Timer:\s+(?P<active_timer>\d+) +min$')
 
         # Distance: internal 90 external 170
-        p11_2 = re.compile(r'^Distance:\s+internal\s+(?P<internal>\d+)\s+external\s+(?P<external>\d+)$')
+        p11_2 = regex_engine.compile(r'^Distance:\s+internal\s+(?P<internal>\d+)\s+external\s+(?P<external>\d+)$')
 
         #  Maximum path: 16
-        p11_3 = re.compile(r'^Maximum +path:\s+(?P<max_path>\d+)$')
+        p11_3 = regex_engine.compile(r'^Maximum +path:\s+(?P<max_path>\d+)$')
 
         # Maximum hopcount 100
-        p11_4 = re.compile(r'^Maximum +hopcount\s+(?P<max_hop>\d+)$')
+        p11_4 = regex_engine.compile(r'^Maximum +hopcount\s+(?P<max_hop>\d+)$')
 
         # Maximum metric variance 1
-        p11_5 = re.compile(r'^Maximum +metric +variance\s+(?P<max_variance>\d+)$')
+        p11_5 = regex_engine.compile(r'^Maximum +metric +variance\s+(?P<max_variance>\d+)$')
 
         # IGP synchronization is disabled
-        p12 = re.compile(r"^IGP +synchronization +is +(?P<igp>(enabled|disabled))$")
+        p12 = regex_engine.compile(r"^IGP +synchronization +is +(?P<igp>(enabled|disabled))$")
 
         # Automatic route summarization is disabled
-        p13 = re.compile(r"^Automatic +route +summarization +is"
-                          r" +(?P<route>(enabled|disabled))$")
+        p13 = regex_engine.compile(r"^Automatic +route +summarization +is"
+                                    r" +(?P<route>(enabled|disabled))$")
 
         # Distance: external 20 internal 200 local 200
         # Distance:external 20 internal 200 local 200
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^Distance: *external +(?P<external>(\d+)) +internal"
             r" +(?P<internal>(\d+)) +local +(?P<local>(\d+))$"
         )
 
         # Redistributing: isis banana
-        p15 = re.compile(r"^Redistributing: +(?P<redistributing>([a-zA-Z\_\s]+))$")
+        p15 = regex_engine.compile(r"^Redistributing: +(?P<redistributing>([a-zA-Z\_\s]+))$")
 
         # 10.0.0.84 0.0.0.3 area 11
         # 10.0.0.88 0.0.0.3 area 11
         # 192.168.0.10 0.0.0.0 area 11
-        p16 = re.compile(r'(?P<address>[\d\.]+)\s+(?P<mask>[\d\.]+)\s+area\s+(?P<area>[\d\.]+)')
+        p16 = regex_engine.compile(r'(?P<address>[\d\.]+)\s+(?P<mask>[\d\.]+)\s+area\s+(?P<area>[\d\.]+)')
 
         passive_interface_flag = False
         routing_network_flag = False
         neighbors_flag = False
 
         # Sending updates every 10 seconds, next due in 8 seconds
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r'^\s*Sending +updates every +(?P<update_interval>\d+) +seconds, +next +due +in (?P<next_update>\d+) +(seconds|sec)$')
 
         # Redistributing protocol ospf 1 with metric 5 (internal, external 1 & 2, nssa-external 1 & 2) include-connected
         # Redistributing protocol bgp 65003 with metric 4 route-map test
         # Redistributing protocol eigrp 10 with metric 4 include-connected
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r'^\s*Redistributing +protocol +(?P<redistribute>\w+)( +(?P<instance>[A-Za-z0-9]+))?( +with( +transparent)?'
             r' +metric( +(?P<metric>\d+))?)?( +\([A-Za-z0-9\-,&\s]+\))?( +route-map +(?P<route_policy>[\w\-]+))?'
             r'( +(?P<include_connected>include\-connected))?$'
         )
 
         # Neighbor(s):
-        p19 = re.compile(r'^\s*Neighbor\(s\):$')
+        p19 = regex_engine.compile(r'^\s*Neighbor\(s\):$')
 
         # 172.16.121.101                                        ACCEPT_SCI_RICHEMONT
         # 192.168.1.176                                         INTERNET_EDGE_IN
         # 192.168.1.177                                         INTERNET_EDGE_IN
         # 192.168.0.9
-        p20 = re.compile(r'(?P<neighbor>[\d\.\:\w]+)\s*(?P<route_map>[\w]+)?')
+        p20 = regex_engine.compile(r'(?P<neighbor>[\d\.\:\w]+)\s*(?P<route_map>[\w]+)?')
 
         network_list = []
 
@@ -5,13 +5,13 @@ IOSXE parsers for the following show commands:
     * 'show prp channel detail'
 
 '''
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowPrpChannelDetailsSchema(MetaParser):
     """ Schema for show prp channel detail """
@@ -49,22 +49,22 @@ class ShowPrpChannelDetails(ShowPrpChannelDetailsSchema):
         port_dict = {}
     
         # PRP-channel: PR1
-        p1 = re.compile(r'PRP-channel:\s(?P<prp_channel_id>PR\d+)')
+        p1 = regex_engine.compile(r'PRP-channel:\s(?P<prp_channel_id>PR\d+)')
 
         # Layer type = L2 
-        p2 = re.compile(r'Layer\s*type\s*=\s*(?P<prp_layer_type>\w+)')
+        p2 = regex_engine.compile(r'Layer\s*type\s*=\s*(?P<prp_layer_type>\w+)')
 
         # Ports: 2	Maxports = 2
-        p3 = re.compile(r'Ports:\s*(?P<prp_ports>\d+)\s*Maxports = (?P<prp_max_ports>\d+)')
+        p3 = regex_engine.compile(r'Ports:\s*(?P<prp_ports>\d+)\s*Maxports = (?P<prp_max_ports>\d+)')
 
         # Port state = prp-channel is Inuse
-        p4 = re.compile(r'Port\s*state\s*=\s*prp-channel\s*is\s*(?P<prp_port_state>\w+)')
+        p4 = regex_engine.compile(r'Port\s*state\s*=\s*prp-channel\s*is\s*(?P<prp_port_state>\w+)')
 
         # Logical slot/port = 1/1	Port state = Inuse 
-        p5 = re.compile(r'Logical\s*[a-zA-z\/]+\s*=\s*(?P<prp_slot_port>[\d\/]+)*\s*Port\s*state\s*=\s*(?P<prp_port_state>\S+)')
+        p5 = regex_engine.compile(r'Logical\s*[a-zA-z\/]+\s*=\s*(?P<prp_slot_port>[\d\/]+)*\s*Port\s*state\s*=\s*(?P<prp_port_state>\S+)')
 
         # Protocol = Enabled 
-        p6 = re.compile(r'\s*Protocol\s*=\s*(?P<prp_protocol>\w+)')
+        p6 = regex_engine.compile(r'\s*Protocol\s*=\s*(?P<prp_protocol>\w+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -9,12 +9,12 @@
     * show ptp port {interface}
     
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # =====================================
 #  Schema for 
@@ -56,7 +56,7 @@ class ShowPtpBrief(ShowPtpBriefSchema):
             output = self.device.execute(cmd)    
 
         #TenGigabitEthernet1/0/6    0    MASTER
-        p = re.compile(r'^(?P<interface>[a-zA-Z\d\/\.]+)\s+(?P<domain>\d+)\s+(?P<state>\w+)$')
+        p = regex_engine.compile(r'^(?P<interface>[a-zA-Z\d\/\.]+)\s+(?P<domain>\d+)\s+(?P<state>\w+)$')
         
         # initial return dictionary
         ret_dict ={}
@@ -128,59 +128,59 @@ class ShowPtpClock(ShowPtpClockSchema):
             output = self.device.execute(self.cli_command)
 
         # PTP Device Type: Boundary clock
-        p1 = re.compile(r'^PTP\sDevice\sType\:\s(?P<device_type>.*)$')
+        p1 = regex_engine.compile(r'^PTP\sDevice\sType\:\s(?P<device_type>.*)$')
 
         # PTP Device Profile: Default Profile
-        p2 = re.compile(r'^PTP\sDevice\sProfile\:\s(?P<device_profile>.*)$')
+        p2 = regex_engine.compile(r'^PTP\sDevice\sProfile\:\s(?P<device_profile>.*)$')
 
         # Clock Identity: 0x34:ED:1B:FF:FE:7D:F2:80
-        p3 = re.compile(r'^Clock\sIdentity\:\s(?P<clock_identity>(0x(?:[\da-fA-F]:?).*))$')
+        p3 = regex_engine.compile(r'^Clock\sIdentity\:\s(?P<clock_identity>(0x(?:[\da-fA-F]:?).*))$')
 
         # Clock Domain: 0
-        p4 = re.compile(r'^Clock\sDomain\:\s(?P<clock_domain>\d+)$')
+        p4 = regex_engine.compile(r'^Clock\sDomain\:\s(?P<clock_domain>\d+)$')
 
         # Network Transport Protocol: 802.3
-        p5 = re.compile(r'^Network\sTransport\sProtocol\:\s(?P<network_transport_protocol>\S+)$')
+        p5 = regex_engine.compile(r'^Network\sTransport\sProtocol\:\s(?P<network_transport_protocol>\S+)$')
 
         # Message general ip dscp  : 47
-        p6 = re.compile(r'^Message\sgeneral\sip\sdscp\s+\:\s(?P<message_general_ip_dscp>\d+)$')
+        p6 = regex_engine.compile(r'^Message\sgeneral\sip\sdscp\s+\:\s(?P<message_general_ip_dscp>\d+)$')
 
         # Message event  ip dscp   : 59
-        p7 = re.compile(r'^Message\sevent\s+ip\sdscp\s+\:\s(?P<message_event_ip_dscp>\d+)$')
+        p7 = regex_engine.compile(r'^Message\sevent\s+ip\sdscp\s+\:\s(?P<message_event_ip_dscp>\d+)$')
 
         # Number of PTP ports: 75
-        p8 = re.compile(r'^Number\sof\sPTP\sports\:\s(?P<number_of_ptp_ports>\d+)$')
+        p8 = regex_engine.compile(r'^Number\sof\sPTP\sports\:\s(?P<number_of_ptp_ports>\d+)$')
 
         # Priority1: 128
-        p9 = re.compile(r'^Priority1\:\s(?P<priority1>\d+)$')
+        p9 = regex_engine.compile(r'^Priority1\:\s(?P<priority1>\d+)$')
 
         # Priority2: 128
-        p10 = re.compile(r'^Priority2\:\s(?P<priority2>\d+)$')
+        p10 = regex_engine.compile(r'^Priority2\:\s(?P<priority2>\d+)$')
 
         # Class: 248
-        p11 = re.compile(r'^Class\:\s(?P<class>\d+)$')
+        p11 = regex_engine.compile(r'^Class\:\s(?P<class>\d+)$')
 
         # Accuracy: Unknown
-        p12 = re.compile(r'^Accuracy\:\s(?P<accuracy>\S+)$')
+        p12 = regex_engine.compile(r'^Accuracy\:\s(?P<accuracy>\S+)$')
 
         # Offset (log variance): 17258
-        p13 = re.compile(r'^Offset\s\(log\svariance\)\:\s(?P<offset>\d+)$')
+        p13 = regex_engine.compile(r'^Offset\s\(log\svariance\)\:\s(?P<offset>\d+)$')
 
         # Offset From Master(ns): -19
-        p14 = re.compile(r'^Offset\sFrom\sMaster\(ns\)\:\s(?P<offset_from_master>\S+)$')
+        p14 = regex_engine.compile(r'^Offset\sFrom\sMaster\(ns\)\:\s(?P<offset_from_master>\S+)$')
 
         # Mean Path Delay(ns): 83
         # Mean Path Delay(ns): -265
-        p15 = re.compile(r'^Mean\sPath\sDelay\(ns\)\:\s(?P<mean_path_delay_ns>\S+)$')
+        p15 = regex_engine.compile(r'^Mean\sPath\sDelay\(ns\)\:\s(?P<mean_path_delay_ns>\S+)$')
 
         # Steps Removed: 2
-        p16 = re.compile(r'^Steps\sRemoved\:\s(?P<steps_removed>\d+)$')
+        p16 = regex_engine.compile(r'^Steps\sRemoved\:\s(?P<steps_removed>\d+)$')
 
         # Local clock priority: 128
-        p17 = re.compile(r'^Local\sclock\spriority\:\s(?P<local_clock_priority>\d+)$')
+        p17 = regex_engine.compile(r'^Local\sclock\spriority\:\s(?P<local_clock_priority>\d+)$')
 
         # Holdover Timer : Not Configured
-        p18 = re.compile(r'^Holdover\sTimer\s\:(?P<holdover_timer>.*)$')
+        p18 = regex_engine.compile(r'^Holdover\sTimer\s\:(?P<holdover_timer>.*)$')
 
         # initial return dictionary
         ret_dict ={}
@@ -357,35 +357,35 @@ class ShowPtpParent(ShowPtpParentSchema):
             output = self.device.execute(self.cli_command)
         	
         #Parent Clock Identity: 0xE4:1F:7B:FF:FE:52:5D:0
-        p1 = re.compile(r'^Parent\sClock\sIdentity\:\s(?P<identity>(0x(?:[\da-fA-F]:?).*))$')
+        p1 = regex_engine.compile(r'^Parent\sClock\sIdentity\:\s(?P<identity>(0x(?:[\da-fA-F]:?).*))$')
         
         #Parent Port Number: 9
-        p2 = re.compile(r'^Parent\sPort\sNumber\:\s(?P<port_number>\d+)$')
+        p2 = regex_engine.compile(r'^Parent\sPort\sNumber\:\s(?P<port_number>\d+)$')
         
         #Observed Parent Offset (log variance): 17258
-        p3 = re.compile(r'^Observed\sParent\sOffset\s\(log\svariance\)\:\s(?P<observed_parent_offset>\d+)$')
+        p3 = regex_engine.compile(r'^Observed\sParent\sOffset\s\(log\svariance\)\:\s(?P<observed_parent_offset>\d+)$')
         
         #Observed Parent Clock Phase Change Rate: N/A
-        p4 = re.compile(r'^Observed\sParent\sClock\sPhase\sChange\sRate\:\s(?P<phase_change_rate>\S+)$')
+        p4 = regex_engine.compile(r'^Observed\sParent\sClock\sPhase\sChange\sRate\:\s(?P<phase_change_rate>\S+)$')
         
         #Grandmaster Clock Identity: 0x0:1:2:FF:FE:2:AA:BB
-        p5 = re.compile(r'^Grandmaster\sClock\sIdentity\:\s(?P<identity>(0x(?:[\da-fA-F]:?).*))$')
+        p5 = regex_engine.compile(r'^Grandmaster\sClock\sIdentity\:\s(?P<identity>(0x(?:[\da-fA-F]:?).*))$')
         
         #Class: 248
-        p6 = re.compile(r'^Class\:\s(?P<gd_class>\d+)$')
+        p6 = regex_engine.compile(r'^Class\:\s(?P<gd_class>\d+)$')
         
         #Accuracy: Unknown
         #Accuracy: Within 1s
-        p7 = re.compile(r'^Accuracy\:\s(?P<accuracy>[\w\s]+)$')
+        p7 = regex_engine.compile(r'^Accuracy\:\s(?P<accuracy>[\w\s]+)$')
         
         #Offset (log variance): N/A
-        p8 = re.compile(r'^Offset\s\(log\svariance\)\:\s(?P<offset>\S+)$')
+        p8 = regex_engine.compile(r'^Offset\s\(log\svariance\)\:\s(?P<offset>\S+)$')
         
         #Priority1: 128
-        p9 = re.compile(r'^Priority1\:\s(?P<priority1>\d+)$')
+        p9 = regex_engine.compile(r'^Priority1\:\s(?P<priority1>\d+)$')
         
         #Priority2: 128
-        p10 = re.compile(r'^Priority2\:\s(?P<priority2>\d+)$')
+        p10 = regex_engine.compile(r'^Priority2\:\s(?P<priority2>\d+)$')
         
         # initial return dictionary
         ret_dict ={}
@@ -513,55 +513,55 @@ class ShowPtpPortInterface(ShowPtpPortInterfaceSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         #PTP PORT DATASET: TenGigabitEthernet1/0/33
-        p1 = re.compile(r'^PTP\sPORT\sDATASET\:\s(?P<interface>\S+)$')  
+        p1 = regex_engine.compile(r'^PTP\sPORT\sDATASET\:\s(?P<interface>\S+)$')  
         
         #Port identity: clock identity: 0x34:ED:1B:FF:FE:7D:F2:80
-        p2 = re.compile(r'^Port\sidentity\:\sclock\sidentity:\s(?P<identity>(0x(?:[\da-fA-F]:?).*))$')
+        p2 = regex_engine.compile(r'^Port\sidentity\:\sclock\sidentity:\s(?P<identity>(0x(?:[\da-fA-F]:?).*))$')
         
         #Port identity: port number: 33
-        p3 = re.compile(r'^Port\sidentity\:\sport\snumber:\s(?P<number>\d+)$')
+        p3 = regex_engine.compile(r'^Port\sidentity\:\sport\snumber:\s(?P<number>\d+)$')
         
         #PTP version: 2
-        p4 = re.compile(r'^PTP\sversion\:\s(?P<version>\d+)$')
+        p4 = regex_engine.compile(r'^PTP\sversion\:\s(?P<version>\d+)$')
         
         #PTP port number: 33
-        p5 = re.compile(r'^PTP\sport\snumber\:\s(?P<number>\d+)$')
+        p5 = regex_engine.compile(r'^PTP\sport\snumber\:\s(?P<number>\d+)$')
         
         #PTP slot number: 1
-        p6 = re.compile(r'^PTP\sslot\snumber\:\s(?P<slot_number>\d+)$')
+        p6 = regex_engine.compile(r'^PTP\sslot\snumber\:\s(?P<slot_number>\d+)$')
         
         #Port state: SLAVE
-        p7 = re.compile(r'^Port\sstate\:\s(?P<state>\S+)$')
+        p7 = regex_engine.compile(r'^Port\sstate\:\s(?P<state>\S+)$')
         
         #Delay request interval(log mean): 0
-        p8 = re.compile(r'^Delay\srequest\sinterval\(log\smean\)\:\s(?P<delay_request_interval>\d+)$')
+        p8 = regex_engine.compile(r'^Delay\srequest\sinterval\(log\smean\)\:\s(?P<delay_request_interval>\d+)$')
         
         #Announce receipt time out: 3
-        p9 = re.compile(r'^Announce\sreceipt\stime\sout\:\s(?P<announce_receipt_time_out>\d+)$')
+        p9 = regex_engine.compile(r'^Announce\sreceipt\stime\sout\:\s(?P<announce_receipt_time_out>\d+)$')
         
         #Announce interval(log mean): 0
-        p10 = re.compile(r'^Announce\sinterval\(log\smean\)\:\s(?P<announce_interval>\d+)$')
+        p10 = regex_engine.compile(r'^Announce\sinterval\(log\smean\)\:\s(?P<announce_interval>\d+)$')
         
         #Sync interval(log mean): 0
-        p11 = re.compile(r'^Sync\sinterval\(log\smean\)\:\s(?P<sync_interval>\d+)$')
+        p11 = regex_engine.compile(r'^Sync\sinterval\(log\smean\)\:\s(?P<sync_interval>\d+)$')
         
         #Delay Mechanism: End to End
-        p12 = re.compile(r'^Delay\sMechanism\:\s(?P<delay_mechanism>.*)$')
+        p12 = regex_engine.compile(r'^Delay\sMechanism\:\s(?P<delay_mechanism>.*)$')
         
         #Peer delay request interval(log mean): 0
-        p13 = re.compile(r'^Peer\sdelay\srequest\sinterval\(log\smean\)\:\s(?P<peer_delay_request_interval>\d+)$')
+        p13 = regex_engine.compile(r'^Peer\sdelay\srequest\sinterval\(log\smean\)\:\s(?P<peer_delay_request_interval>\d+)$')
         
         #Sync fault limit: 500000000
-        p14 = re.compile(r'^Sync\sfault\slimit\:\s(?P<sync_fault_limit>\d+)$')
+        p14 = regex_engine.compile(r'^Sync\sfault\slimit\:\s(?P<sync_fault_limit>\d+)$')
         
         #ptp role primary : Disabled
-        p15 = re.compile(r'^ptp\srole\sprimary\s\:\s(?P<ptp_role_primary>\S+)$')
+        p15 = regex_engine.compile(r'^ptp\srole\sprimary\s\:\s(?P<ptp_role_primary>\S+)$')
         
         #Local port priority : 128
-        p16 = re.compile(r'^Local\sport\spriority\s\:\s(?P<local_port_priority>\d+)$')
+        p16 = regex_engine.compile(r'^Local\sport\spriority\s\:\s(?P<local_port_priority>\d+)$')
 
         #ptp destination mac : 01.01.01.01.01.0A
-        p17 = re.compile(r'^ptp\sdestination\smac\s\:\s(?P<ptp_dest_mac>\S+)$')
+        p17 = regex_engine.compile(r'^ptp\sdestination\smac\s\:\s(?P<ptp_dest_mac>\S+)$')
 
         # initial return dictionary
         ret_dict ={}
@@ -721,7 +721,7 @@ class ShowRunIncludePtp(ShowRunIncludePtpSchema):
             output = self.device.execute(self.cli_command)
 
         # ptp mode boundary delay-req
-        p = re.compile(r'^(?P<ptp_mode>(?:(ptp mode|ptp profile).*))$')        
+        p = regex_engine.compile(r'^(?P<ptp_mode>(?:(ptp mode|ptp profile).*))$')        
         # initial return dictionary
         ret_dict ={}
         
@@ -777,31 +777,31 @@ class ShowPtpTimeProperty(ShowPtpTimePropertySchema):
             output = self.device.execute(self.cli_command)
 
         # PTP CLOCK TIME PROPERTY
-        p0 = re.compile(r'^PTP CLOCK TIME PROPERTY$')
+        p0 = regex_engine.compile(r'^PTP CLOCK TIME PROPERTY$')
         
         # Current UTC offset valid: FALSE
-        p1 = re.compile(r'^Current\sUTC\soffset\svalid\:\s(?P<current_utc_offset_valid>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^Current\sUTC\soffset\svalid\:\s(?P<current_utc_offset_valid>[\w\s]+)$')
 
         # Current UTC offset: 0
-        p2 = re.compile(r'^Current\sUTC\soffset\:\s(?P<current_utc_offset>[\d]+)$')
+        p2 = regex_engine.compile(r'^Current\sUTC\soffset\:\s(?P<current_utc_offset>[\d]+)$')
 
         # Leap 59: FALSE
-        p3 = re.compile(r'^Leap\s(?P<leap_number>[\d]+)\:\s(?P<value>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^Leap\s(?P<leap_number>[\d]+)\:\s(?P<value>[\w\s]+)$')
 
         # Time Traceable: FALSE
-        p4 = re.compile(r'^Time\sTraceable\:\s(?P<time_traceable>[\w\s]+)$')
+        p4 = regex_engine.compile(r'^Time\sTraceable\:\s(?P<time_traceable>[\w\s]+)$')
 
         # Frequency Traceable: FALSE
-        p5 = re.compile(r'^Frequency\sTraceable\:\s(?P<frequency_traceable>[\w\s]+)$')
+        p5 = regex_engine.compile(r'^Frequency\sTraceable\:\s(?P<frequency_traceable>[\w\s]+)$')
 
         # PTP Timescale: FALSE
-        p6 = re.compile(r'^PTP\sTimescale\:\s(?P<ptp_timescale>[\w\s]+)$')
+        p6 = regex_engine.compile(r'^PTP\sTimescale\:\s(?P<ptp_timescale>[\w\s]+)$')
 
         # Time Source: GPS
-        p7 = re.compile(r'^Time\sSource\:\s(?P<time_source>[\w\s]+)$')
+        p7 = regex_engine.compile(r'^Time\sSource\:\s(?P<time_source>[\w\s]+)$')
 
         # Time Property Persistence: 300 seconds
-        p8 = re.compile(r'^Time\sProperty\sPersistence\:\s(?P<time_persistence>[\w\s]+)$')
+        p8 = regex_engine.compile(r'^Time\sProperty\sPersistence\:\s(?P<time_persistence>[\w\s]+)$')
 
         # initial return dictionary
         ret_dict ={}
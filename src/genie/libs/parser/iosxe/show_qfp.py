@@ -6,12 +6,14 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 # genie.parsergen
 try:
     import genie.parsergen
@@ -45,7 +47,7 @@ class ShowQfpDropsThresholds(ShowQfpDropsThresholdsSchema):
 
         # total    3
         # 4       40
-        p1 = re.compile(r'^(?P<drop_id>total|\d+)\s+(?P<threshold>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<drop_id>total|\d+)\s+(?P<threshold>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
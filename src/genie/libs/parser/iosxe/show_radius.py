@@ -11,6 +11,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================================
 #  Schema for show radius statistics 
@@ -175,13 +178,13 @@ class ShowRadiusStatistics(ShowRadiusStatisticsSchema):
         # Duplicate ID detects:           0          0          0
         # Buffer Allocation Failures:     0          0          0
         #----------------------------------------------------------------
-        p1 = re.compile(r'(^\w+\s+\w+\s+\w+)\s*:\s+(?P<auth>\w+)\s+(?P<acct>\w+)\s+(?P<both>\w+)\s*')
+        p1 = regex_engine.compile(r'(^\w+\s+\w+\s+\w+)\s*:\s+(?P<auth>\w+)\s+(?P<acct>\w+)\s+(?P<both>\w+)\s*')
         
         # Access Rejects           :          0
-        p2 = re.compile(r'(^Access\s+Rejects)\s+:\s+(?P<auth>\w+)\s*')
+        p2 = regex_engine.compile(r'(^Access\s+Rejects)\s+:\s+(?P<auth>\w+)\s*')
         
         #Access Accepts           :          0
-        p3 = re.compile(r'(^Access\s+Accepts)\s+:\s+(?P<auth>\w+)\s*')
+        p3 = regex_engine.compile(r'(^Access\s+Accepts)\s+:\s+(?P<auth>\w+)\s*')
 
         #----------------------------------------------------------------
         # Number of Radius timeouts:         20          0         20
@@ -190,42 +193,42 @@ class ShowRadiusStatistics(ShowRadiusStatisticsSchema):
         # Radius Timers Add Failed:           0          0          0
         # Radius Timers Jitter Failed:        0          0          0
         #----------------------------------------------------------------
-        p4 = re.compile(r'(^\w+\s+\w+\s+\w+\s+\w+)\s*:\s+(?P<auth>\w+)\s+(?P<acct>\w+)\s+(?P<both>\w+)\s*')
+        p4 = regex_engine.compile(r'(^\w+\s+\w+\s+\w+\s+\w+)\s*:\s+(?P<auth>\w+)\s+(?P<acct>\w+)\s+(?P<both>\w+)\s*')
 
         #----------------------------------------------------------------
         # Average response delay(ms):          0          0          0
         # Maximum response delay(ms):          0          0          0
         # Maximum Buffer Size (bytes):        310          0        310
         #----------------------------------------------------------------
-        p5 = re.compile(r'(^\w+\s+\w+\s+\w+)\s*[(]\w+[)]\s*:\s+(?P<auth>\w+)\s+(?P<acct>\w+)\s+(?P<both>\w+)\s*')
+        p5 = regex_engine.compile(r'(^\w+\s+\w+\s+\w+)\s*[(]\w+[)]\s*:\s+(?P<auth>\w+)\s+(?P<acct>\w+)\s+(?P<both>\w+)\s*')
 
         #----------------------------------------------------------------
         # Malformed Responses        :          0          0          0
         # Bad Authenticators         :          0          0          0
         # Unknown Responses          :          0          0          0
         #----------------------------------------------------------------
-        p6 = re.compile(r'(^\w+\s+\w+)\s*:\s+(?P<auth>\w+)\s+(?P<acct>\w+)\s+(?P<both>\w+)\s*')
+        p6 = regex_engine.compile(r'(^\w+\s+\w+)\s*:\s+(?P<auth>\w+)\s+(?P<acct>\w+)\s+(?P<both>\w+)\s*')
 
         # Source Port Range: (2 ports only)
-        p7 = re.compile(r'(^Source\s+Port\s+Range)\s*:\s*([(]\w+\s+\w+\s+\w+\s*[)])')
+        p7 = regex_engine.compile(r'(^Source\s+Port\s+Range)\s*:\s*([(]\w+\s+\w+\s+\w+\s*[)])')
 
         #1645 - 1646
-        p8 = re.compile(r'(\w+)\s*-\s*(\w+)')
+        p8 = regex_engine.compile(r'(\w+)\s*-\s*(\w+)')
 
         # Last used Source Port/Identifier:
-        p9 = re.compile(r'(^Last\s+used\s+Source\s+Port)[/]Identifier\s*:')
+        p9 = regex_engine.compile(r'(^Last\s+used\s+Source\s+Port)[/]Identifier\s*:')
 
         # 1645/0
-        p10 = re.compile(r'(\d+)\s*[/]\s*(\d+)')
+        p10 = regex_engine.compile(r'(\d+)\s*[/]\s*(\d+)')
 
         # Elapsed time since counters last cleared: 1d11h15m
-        p11 = re.compile(r'(^Elapsed\s+time\s+since\s+counters\s+last\s+cleared)\s*:\s*(\w+)')
+        p11 = regex_engine.compile(r'(^Elapsed\s+time\s+since\s+counters\s+last\s+cleared)\s*:\s*(\w+)')
 
         # Radius Latency Distribution:
-        p12 = re.compile(r'(^Radius\s+Latency\s+Distribution)\s*:')
+        p12 = regex_engine.compile(r'(^Radius\s+Latency\s+Distribution)\s*:')
 
         # <= 2ms :          0          0
-        p13 = re.compile(r'(<=\s*\w+)\s*:\s*(?P<auth>\w+)\s*(?P<acct>\w+)')
+        p13 = regex_engine.compile(r'(<=\s*\w+)\s*:\s*(?P<auth>\w+)\s*(?P<acct>\w+)')
 
         #----------------------------------------------------------------
         # 3-5ms  :          0          0
@@ -234,16 +237,16 @@ class ShowRadiusStatistics(ShowRadiusStatisticsSchema):
         # 20-50ms:          0          0
         # 50-100m:          0          0
         #----------------------------------------------------------------
-        p14 = re.compile(r'(\d+\s*[-]\s*\w+)\s*:\s*(?P<auth>\w+)\s*(?P<acct>\w+)')
+        p14 = regex_engine.compile(r'(\d+\s*[-]\s*\w+)\s*:\s*(?P<auth>\w+)\s*(?P<acct>\w+)')
         
         # >100ms :          0          0
-        p15 = re.compile(r'(>\s*\w+)\s*:\s*(?P<auth>\w+)\s*(?P<acct>\w+)')
+        p15 = regex_engine.compile(r'(>\s*\w+)\s*:\s*(?P<auth>\w+)\s*(?P<acct>\w+)')
 
         # Current inQ length  : 0
-        p16 = re.compile(r'(^Current\s+inQ\s+length)\s*:\s*(\d+)')
+        p16 = regex_engine.compile(r'(^Current\s+inQ\s+length)\s*:\s*(\d+)')
 
         # Current doneQ length: 0
-        p17 = re.compile(r'(^Current\s+doneQ\s+length)\s*:\s*(\d+)')
+        p17 = regex_engine.compile(r'(^Current\s+doneQ\s+length)\s*:\s*(\d+)')
 
         ret_dict = {}
 
@@ -409,26 +412,26 @@ class ShowRadiusServerGroupAll(ShowRadiusServerGroupAllSchema):
             
 
         # Server group radius
-        p1 = re.compile(r'(^Server\s+group)\s+(.*)')
+        p1 = regex_engine.compile(r'(^Server\s+group)\s+(.*)')
         
         # Sharecount = 1  sg_unconfigured = FALSE
-        p2 = re.compile(r'(^Sharecount)\s*\=\s*(?P<sharecount>\d+)\s+(sg_unconfigured)\s*\=\s*(?P<sg_unconfigured>\D+)')
+        p2 = regex_engine.compile(r'(^Sharecount)\s*\=\s*(?P<sharecount>\d+)\s+(sg_unconfigured)\s*\=\s*(?P<sg_unconfigured>\D+)')
         
         # Type = standard  Memlocks = 1
-        p3 = re.compile(r'(^Type)\s*\=\s*(?P<type>\w+)\s+(Memlocks)\s*\=\s*(?P<memlocks>\d+)')
+        p3 = regex_engine.compile(r'(^Type)\s*\=\s*(?P<type>\w+)\s+(Memlocks)\s*\=\s*(?P<memlocks>\d+)')
         
         # 'Server(121.0.0.1:1812,1813,data-rad) Transactions:' |
         # 'Server(44AA::1:1812,1813,ipv6-rad) Transactions:'
-        p4 = re.compile(r'(^Server)\s*[(](?P<address>((\d+\.){3}\d+)|(\w+::\d+))\s*:\s*(?P<auth_port>\d+)\s*,\s*(?P<acct_port>\d+)\s*,\s*(?P<server_name>.*)\s*[)]\s*Transactions\s*:')
+        p4 = regex_engine.compile(r'(^Server)\s*[(](?P<address>((\d+\.){3}\d+)|(\w+::\d+))\s*:\s*(?P<auth_port>\d+)\s*,\s*(?P<acct_port>\d+)\s*,\s*(?P<server_name>.*)\s*[)]\s*Transactions\s*:')
         
         # Authen: 0   Author: 0       Acct: 0
-        p5 = re.compile(r'(^Authen)\s*\:\s*(?P<authen>\d+)\s+(Author)\s*\:\s*(?P<author>\d+)\s+(Acct)\s*\:\s*(?P<acct>\d+)\s*')
+        p5 = regex_engine.compile(r'(^Authen)\s*\:\s*(?P<authen>\d+)\s+(Author)\s*\:\s*(?P<author>\d+)\s+(Acct)\s*\:\s*(?P<acct>\d+)\s*')
         
         # Server_auto_test_enabled: FALSE
-        p6 = re.compile(r'(^Server_auto_test_enabled)\s*\:\s*(?P<auto_test_enabled>\D+)\s*')
+        p6 = regex_engine.compile(r'(^Server_auto_test_enabled)\s*\:\s*(?P<auto_test_enabled>\D+)\s*')
         
         # Keywrap enabled: FALSE
-        p7 = re.compile(r'(^Keywrap\s+enabled)\s*\:\s*(?P<keywrap_enabled>\D+)\s*')
+        p7 = regex_engine.compile(r'(^Keywrap\s+enabled)\s*\:\s*(?P<keywrap_enabled>\D+)\s*')
 
         ret_dict = {}
         server_grp = {}
@@ -12,6 +12,7 @@
 import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Any
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 # ===========================================
 # Parser for 'show raw-socket tcp sessions'
@@ -59,7 +60,7 @@ class ShowRawSocketTcpSessions(ShowRawSocketTcpSessionsSchema):
         # Interface   tty/(Idx)     vrf_name           socket   mode    local_ip_addr  local_port    dest_ip_addr  dest_port    up_time     idle_time/timeout
         # Se0/3/0      50                                 0    server        73.1.1.2     5000          listening     ----      -----            ----- 
         # 0/3/0        50                                 1    server        73.1.1.2     5000           73.1.1.1     4000     00:01:00      00:01:00/300sec
-        p1 = re.compile(r'(?P<interface>(\S+))\s*\(?\s*?(?P<tty>(\d+))\)?\s+?(?P<vrf>(\w+|\d+|\S+))?\s+?(?P<socket_index>(\d+))\s*(?P<mode>(\S+))\s*(?P<localip>(%s))\s*(?P<localport>(\d+))\s*(?P<destip>(\S+|%s))\s*(?P<destport>(\d+|[-]+))\s*(?P<uptime>(\S+|[-]+))\s*(?P<idletime>(\S+|[-]+))'%(ip_expression,ip_expression))
+        p1 = regex_engine.compile(r'(?P<interface>(\S+))\s*\(?\s*?(?P<tty>(\d+))\)?\s+?(?P<vrf>(\w+|\d+|\S+))?\s+?(?P<socket_index>(\d+))\s*(?P<mode>(\S+))\s*(?P<localip>(%s))\s*(?P<localport>(\d+))\s*(?P<destip>(\S+|%s))\s*(?P<destport>(\d+|[-]+))\s*(?P<uptime>(\S+|[-]+))\s*(?P<idletime>(\S+|[-]+))'%(ip_expression,ip_expression))
         
         for line in out.splitlines():
 
@@ -184,7 +185,7 @@ class ShowRawSocketTcpStatistic(ShowRawSocketTcpStatisticSchema):
         # Pattern for parsing raw socket tcp statistics
         # Interface  idx             vrf_name             sessions      tcp_in_bytes         tcp_out_bytes   tcp_to_tty_frames    tty_to_tcp_frames
         # Lo1        35                                       1                 123                 3338                   5                   33 
-        p1 = re.compile(r'(?P<interface>(\S+))\s*(?P<idx>(\d+))\s+(?P<vrf>(\S+))?\s+(?P<sessions>(\d+))\s+(?P<tcp_in_bytes>(\d+))\s+(?P<tcp_out_bytes>(\d+))\s+(?P<tcp_to_tty_frames>(\d+))\s+(?P<tty_to_tcp_frames>(\d+))')
+        p1 = regex_engine.compile(r'(?P<interface>(\S+))\s*(?P<idx>(\d+))\s+(?P<vrf>(\S+))?\s+(?P<sessions>(\d+))\s+(?P<tcp_in_bytes>(\d+))\s+(?P<tcp_out_bytes>(\d+))\s+(?P<tcp_to_tty_frames>(\d+))\s+(?P<tty_to_tcp_frames>(\d+))')
         for line in out.splitlines():
              
              line = line.strip()
@@ -7,11 +7,13 @@ IOSXE Parsers for the following show commands:
     * show redundancy linecard all
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =======================================
 # Schema for:
@@ -53,7 +55,7 @@ class ShowRedundancySwitchoverHistory(ShowRedundancySwitchoverHistorySchema):
 
 
         #    1       1        2     Active lost GW         03:26:09 UTC Wed Sep 23 2020
-        switchover_history_capture = re.compile(
+        switchover_history_capture = regex_engine.compile(
             # 1
             r"^(?P<index>\d+)\s+"
             # 1
@@ -219,149 +221,149 @@ class ShowRedundancyApplicationGroup(ShowRedundancyApplicationGroupSchema):
             out = output
 
         # Faults states Group 1 info:
-        p1 = re.compile(r'^Faults +states +Group +(?P<fault_group_id>\w+) +info+:$')
+        p1 = regex_engine.compile(r'^Faults +states +Group +(?P<fault_group_id>\w+) +info+:$')
 
         # Runtime priority: [200]
-        p2 = re.compile(r'^Runtime priority: +\[(?P<runtime_priority>(\d+))]$')
+        p2 = regex_engine.compile(r'^Runtime priority: +\[(?P<runtime_priority>(\d+))]$')
 
         # RG Faults RG State: Up
-        p3 = re.compile(r'^RG Faults RG State: +(?P<rg_fault_state>\w+)')
+        p3 = regex_engine.compile(r'^RG Faults RG State: +(?P<rg_fault_state>\w+)')
 
         # Total # of switchovers due to faults:           0
-        p4 = re.compile(r'^Total # of switchovers due to faults: +(?P<fault_switchovers>\d+)$')
+        p4 = regex_engine.compile(r'^Total # of switchovers due to faults: +(?P<fault_switchovers>\d+)$')
 
         # Total # of down/up state changes due to faults: 0
-        p5 = re.compile(r'^Total # of down\/up state changes due to faults: +(?P<fault_state_changes>\d+)$')
+        p5 = regex_engine.compile(r'^Total # of down\/up state changes due to faults: +(?P<fault_state_changes>\d+)$')
 
         # Group ID:1
-        p6 = re.compile(r'^Group ID:(?P<group_id>\d+)$')
+        p6 = regex_engine.compile(r'^Group ID:(?P<group_id>\d+)$')
 
         # Group Name:group1
-        p7 = re.compile(r'^Group Name:(?P<group_name>\S+)$')
+        p7 = regex_engine.compile(r'^Group Name:(?P<group_name>\S+)$')
 
         # Administrative State: No Shutdown
-        p8 = re.compile(r'^Administrative State: +(?P<admin_state>[\w\s]+)$')
+        p8 = regex_engine.compile(r'^Administrative State: +(?P<admin_state>[\w\s]+)$')
 
         # Aggregate operational state : Up
-        p9 = re.compile(r'^Aggregate operational state : +(?P<aggregate_state>[\w]+)$')
+        p9 = regex_engine.compile(r'^Aggregate operational state : +(?P<aggregate_state>[\w]+)$')
 
         # My Role: ACTIVE
-        p10 = re.compile(r'^My Role: +(?P<my_role>\w+)$')
+        p10 = regex_engine.compile(r'^My Role: +(?P<my_role>\w+)$')
 
         # Peer Role: STANDBY
-        p11 = re.compile(r'^Peer Role: +(?P<peer_role>\w+)$')
+        p11 = regex_engine.compile(r'^Peer Role: +(?P<peer_role>\w+)$')
 
         # Peer Presence: Yes
-        p12 = re.compile(r'^Peer Presence: +(?P<peer_presence>\w+)$')
+        p12 = regex_engine.compile(r'^Peer Presence: +(?P<peer_presence>\w+)$')
 
         # Peer Comm: Yes
-        p13 = re.compile(r'^Peer Comm: +(?P<peer_comm>\w+)$')
+        p13 = regex_engine.compile(r'^Peer Comm: +(?P<peer_comm>\w+)$')
 
         # Peer Progression Started: Yes
-        p14 = re.compile(r'^Peer Progression Started: +(?P<peer_progress>\w+)$')
+        p14 = regex_engine.compile(r'^Peer Progression Started: +(?P<peer_progress>\w+)$')
 
         # RF Domain: btob-one
-        p15 = re.compile(r'^RF Domain: +(?P<rf_domain>\S+)$')
+        p15 = regex_engine.compile(r'^RF Domain: +(?P<rf_domain>\S+)$')
 
         # RF state: ACTIVE
-        p16 = re.compile(r'^RF state: +(?P<rf_state>[\w\s]+)$')
+        p16 = regex_engine.compile(r'^RF state: +(?P<rf_state>[\w\s]+)$')
 
         # Peer RF state: STANDBY HOT
-        p17 = re.compile(r'^Peer RF state: +(?P<peer_rf_state>[\w\s]+)$')
+        p17 = regex_engine.compile(r'^Peer RF state: +(?P<peer_rf_state>[\w\s]+)$')
 
         # RG Protocol RG 1
-        p18 = re.compile(r'^RG +Protocol +RG +(?P<rg_protocol_id>\w+)$')
+        p18 = regex_engine.compile(r'^RG +Protocol +RG +(?P<rg_protocol_id>\w+)$')
 
         # Role: Standby
-        p19 = re.compile(r'^Role: +(?P<role>[\w-]+)$')
+        p19 = regex_engine.compile(r'^Role: +(?P<role>[\w-]+)$')
 
         # Negotiation: Enabled
-        p20 = re.compile(r'^Negotiation: +(?P<negotiation>[\w]+)$')
+        p20 = regex_engine.compile(r'^Negotiation: +(?P<negotiation>[\w]+)$')
 
         # Priority: 200
-        p21 = re.compile(r'^Priority: +(?P<priority>[\d]+)$')
+        p21 = regex_engine.compile(r'^Priority: +(?P<priority>[\d]+)$')
 
         # Protocol state: Standby-hot
-        p22 = re.compile(r'^Protocol state: +(?P<protocol_state>[\w-]+)$')
+        p22 = regex_engine.compile(r'^Protocol state: +(?P<protocol_state>[\w-]+)$')
 
         # Ctrl Intf(s) state: Up
-        p23 = re.compile(r'^Ctrl Intf\(s\) state: +(?P<ctrl_intf_state>[\w-]+)$')
+        p23 = regex_engine.compile(r'^Ctrl Intf\(s\) state: +(?P<ctrl_intf_state>[\w-]+)$')
 
         # Active Peer: address 9.1.1.1, priority 200, intf Po10.100
         # Active Peer: Local
-        p24 = re.compile(r'^Active Peer: +((?P<local>Local$)|address +(?P<address>\S+), '
-                         r'+priority +(?P<priority>\d+), +intf +(?P<intf>\S+)$)')
+        p24 = regex_engine.compile(r'^Active Peer: +((?P<local>Local$)|address +(?P<address>\S+), '
+                                   r'+priority +(?P<priority>\d+), +intf +(?P<intf>\S+)$)')
 
         # Standby Peer: address 9.1.1.1, priority 200, intf Po10.100
         # Standby Peer: Local
-        p25 = re.compile(r'^Standby Peer: +((?P<local>Local$)|address +(?P<address>\S+), '
-                         r'+priority +(?P<priority>\d+), +intf +(?P<intf>\S+)$)')
+        p25 = regex_engine.compile(r'^Standby Peer: +((?P<local>Local$)|address +(?P<address>\S+), '
+                                   r'+priority +(?P<priority>\d+), +intf +(?P<intf>\S+)$)')
 
         # Log counters:
-        p26 = re.compile(r'\s*Log+\s+counters+:')
+        p26 = regex_engine.compile(r'\s*Log+\s+counters+:')
 
         # role change to active: 0
-        p27 = re.compile(r'^role change to active: +(?P<role_to_active>\d+)$')
+        p27 = regex_engine.compile(r'^role change to active: +(?P<role_to_active>\d+)$')
 
         # role change to standby: 1
-        p28 = re.compile(r'^role change to standby: +(?P<role_to_standby>\d+)$')
+        p28 = regex_engine.compile(r'^role change to standby: +(?P<role_to_standby>\d+)$')
 
         # disable events: rg down state 0, rg shut 0
-        p29 = re.compile(r'^disable events: +rg down state (?P<rg_down>(\d+)), +rg shut (?P<rg_shut>(\d+))$')
+        p29 = regex_engine.compile(r'^disable events: +rg down state (?P<rg_down>(\d+)), +rg shut (?P<rg_shut>(\d+))$')
 
         # ctrl intf events: up 1, down 1, admin_down 0
-        p30 = re.compile(r'^ctrl intf events: +up (?P<up>(\d+)), +down (?P<down>(\d+)), '
-                         r'+admin_down (?P<admin_down>(\d+))$')
+        p30 = regex_engine.compile(r'^ctrl intf events: +up (?P<up>(\d+)), +down (?P<down>(\d+)), '
+                                   r'+admin_down (?P<admin_down>(\d+))$')
 
         # reload events: local request 0, peer request 0
-        p31 = re.compile(r'^reload events: +local request (?P<local>(\d+)), +peer request (?P<peer>(\d+))$')
+        p31 = regex_engine.compile(r'^reload events: +local request (?P<local>(\d+)), +peer request (?P<peer>(\d+))$')
 
         # RG Media Context for RG 1
-        p32 = re.compile(r'^RG Media Context for RG +(?P<rg_media_id>\d+)$')
+        p32 = regex_engine.compile(r'^RG Media Context for RG +(?P<rg_media_id>\d+)$')
 
         # Ctx State: Standby
-        p33 = re.compile(r'^Ctx State: +(?P<ctx_state>[\w-]+)$')
+        p33 = regex_engine.compile(r'^Ctx State: +(?P<ctx_state>[\w-]+)$')
 
         # Protocol ID: 1
-        p34 = re.compile(r'^Protocol +ID: +(?P<protocol_id>\d+)$')
+        p34 = regex_engine.compile(r'^Protocol +ID: +(?P<protocol_id>\d+)$')
 
         # Media type: Default
-        p35 = re.compile(r'^Media type: +(?P<media_type>\w+)$')
+        p35 = regex_engine.compile(r'^Media type: +(?P<media_type>\w+)$')
 
         # Control Interface: Port-channel10.100
-        p36 = re.compile(r'^Control Interface: +(?P<control_interface>\S+)$')
+        p36 = regex_engine.compile(r'^Control Interface: +(?P<control_interface>\S+)$')
 
         # Current Hello timer: 3000
-        p37 = re.compile(r'^Current Hello timer: +(?P<current_hello_timer>\d+)$')
+        p37 = regex_engine.compile(r'^Current Hello timer: +(?P<current_hello_timer>\d+)$')
 
         # Configured Hello timer: 3000, Hold timer: 9000
-        p38 = re.compile(r'^Configured Hello timer: +(?P<conf_hello_timer>\d+), +Hold timer: +(?P<hold_timer>\d+)$')
+        p38 = regex_engine.compile(r'^Configured Hello timer: +(?P<conf_hello_timer>\d+), +Hold timer: +(?P<hold_timer>\d+)$')
 
         # Peer Hello timer: 3000, Peer Hold timer: 9000
-        p39 = re.compile(r'^Peer Hello timer: +(?P<peer_hello_timer>\d+), '
-                         r'+Peer Hold timer: +(?P<peer_hold_timer>\d+)$')
+        p39 = regex_engine.compile(r'^Peer Hello timer: +(?P<peer_hello_timer>\d+), '
+                                   r'+Peer Hold timer: +(?P<peer_hold_timer>\d+)$')
 
         # Stats:
-        p40 = re.compile(r'\s*Stats+:')
+        p40 = regex_engine.compile(r'\s*Stats+:')
 
         # Pkts 144780, Bytes 8976360, HA Seq 0, Seq Number 144780, Pkt Loss 0
-        p41 = re.compile(r'^Pkts +(?P<pkts>\d+), +Bytes +(?P<bytes>\d+), +HA Seq +(?P<ha_seq>\d+), '
-                         r'+Seq Number +(?P<seq_number>\d+), Pkt Loss +(?P<pkt_loss>\d+)$')
+        p41 = regex_engine.compile(r'^Pkts +(?P<pkts>\d+), +Bytes +(?P<bytes>\d+), +HA Seq +(?P<ha_seq>\d+), '
+                                   r'+Seq Number +(?P<seq_number>\d+), Pkt Loss +(?P<pkt_loss>\d+)$')
 
         # Authentication not configured
-        p42 = re.compile(r'^Authentication +(?P<auth_status>configured|not configured)$')
+        p42 = regex_engine.compile(r'^Authentication +(?P<auth_status>configured|not configured)$')
 
         # Authentication Failure: 0
-        p43 = re.compile(r'^Authentication Failure: +(?P<auth_failure>[\d]+)$')
+        p43 = regex_engine.compile(r'^Authentication Failure: +(?P<auth_failure>[\d]+)$')
 
         # Reload Peer: TX 0, RX 0
-        p44 = re.compile(r'^Reload Peer: +TX +(?P<tx>\d+), +RX +(?P<rx>\d+)$')
+        p44 = regex_engine.compile(r'^Reload Peer: +TX +(?P<tx>\d+), +RX +(?P<rx>\d+)$')
 
         # Resign: TX 0, RX 0
-        p45 = re.compile(r'^Resign: +TX +(?P<tx>\d+), +RX +(?P<rx>\d+)$')
+        p45 = regex_engine.compile(r'^Resign: +TX +(?P<tx>\d+), +RX +(?P<rx>\d+)$')
 
         # Active Peer: Present. Hold Timer: 9000
-        p46 = re.compile(r'^Active Peer: +(?P<active_peer>\S+)\. +Hold Timer: +(?P<hold_timer>\d+)$')
+        p46 = regex_engine.compile(r'^Active Peer: +(?P<active_peer>\S+)\. +Hold Timer: +(?P<hold_timer>\d+)$')
 
         # return dictionary
         ret_dict = {}
@@ -800,11 +802,11 @@ class ShowRedundancyrpr(ShowRedundancyrprSchema):
         #Switch 1 Slot 3 Processor Information:
         #---------------------------------------------
     
-        p=re.compile(r'Switch\s+(?P<switch_no>\d+)\s+Slot\s+(?P<slot>\d+)\s')
+        p=regex_engine.compile(r'Switch\s+(?P<switch_no>\d+)\s+Slot\s+(?P<slot>\d+)\s')
         
         #Current Software State = ACTIVE
         
-        p2=re.compile(r'Current\sSoftware\sState\s+\S+\s([a-zA-Z _]+)')
+        p2=regex_engine.compile(r'Current\sSoftware\sState\s+\S+\s([a-zA-Z _]+)')
         for line in out.splitlines():
             line = line.strip()
             m1=p.match(line)
@@ -861,9 +863,9 @@ class ShowRedundancyLinecardAll(ShowRedundancyLinecardAllSchema):
             output = self.device.execute(self.cli_command[0])
 
         #  9   -        0      Active     Stdby Warm 0        -        Active   Primary
-        p1 = re.compile(r'^(?P<slot>\d+)\s+(?P<sub_slot>\S+)\s+(?P<lc_group>\d+|\S+)\s+'
-                        r'(?P<my_state>\S+\s\S+|\S+|\-)\s+(?P<peer_state>\S+\s\S+|\-|\S+)\s+'
-                        r'(?P<peer_slot>\d+|\S+)\s+(?P<peer_sub_slot>\S+)\s+(?P<role>\S+)\s+(?P<mode>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<slot>\d+)\s+(?P<sub_slot>\S+)\s+(?P<lc_group>\d+|\S+)\s+'
+                                  r'(?P<my_state>\S+\s\S+|\S+|\-)\s+(?P<peer_state>\S+\s\S+|\-|\S+)\s+'
+                                  r'(?P<peer_slot>\d+|\S+)\s+(?P<peer_sub_slot>\S+)\s+(?P<role>\S+)\s+(?P<mode>\S+)$')
 
         ret = {}
 
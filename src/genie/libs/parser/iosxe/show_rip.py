@@ -3,12 +3,14 @@ show_rip.py
     * show ip protocols | sec rip
     * show ip protocols vrf {vrf} | sec rip
 '''
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ====================================================
 #  schema for show ip rip database
 # ====================================================
@@ -81,17 +83,17 @@ class ShowIpRipDatabase(ShowIpRipDatabaseSchema):
         route_type_list = ['connected','external','external-backup','rip']
 
         # 0.0.0.0/0    auto-summary
-        p1 = re.compile(r'^\s*(?P<route>[\d\.\/]+)( +(?P<summary_type>\S+))?$')
+        p1 = regex_engine.compile(r'^\s*(?P<route>[\d\.\/]+)( +(?P<summary_type>\S+))?$')
 
         # 10.1.2.0/24    directly connected, GigabitEthernet2.100
-        p2 = re.compile(r'^\s*(?P<route>[\d\.\/]+) +directly +connected, +(?P<interface>\S+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<route>[\d\.\/]+) +directly +connected, +(?P<interface>\S+)$')
 
         #    [1] via 172.16.1.254, from 0.0.0.0,
-        p3 = re.compile(r'^\s*\[(?P<metric>\d+)\] +via +(?P<next_hop>[\d\.]+),( +from +(?P<from>[\d\.]+),)?$')
+        p3 = regex_engine.compile(r'^\s*\[(?P<metric>\d+)\] +via +(?P<next_hop>[\d\.]+),( +from +(?P<from>[\d\.]+),)?$')
 
         #    [4] via 10.1.2.2, 00:00:00, GigabitEthernet2.100
-        p4 = re.compile(r'^\s*\[(?P<metric>\d+)\] +via +(?P<next_hop>[\d\.\/]+),'
-                        r' +(?P<expire_time>[\w\:]+), +(?P<interface>\S+)$')
+        p4 = regex_engine.compile(r'^\s*\[(?P<metric>\d+)\] +via +(?P<next_hop>[\d\.\/]+),'
+                                  r' +(?P<expire_time>[\w\:]+), +(?P<interface>\S+)$')
 
         result_dict = {}
 
@@ -261,44 +263,44 @@ class ShowIpv6Rip(ShowIpv6RipSchema):
         # RIP VRF "VRF1", port 521, multicast-group FF02::9, pid 635
         # RIP VRF "red", port 521, multicast-group 2001:DB8::/32, pid 295
         # RIP process "one", port 521, multicast-group FF02::9, pid 55
-        p1 = re.compile(r'^\s*RIP +(VRF|process)+ +(?P<vrf>[\S\s]+), +port +(?P<port>\d+),'
-                        r' +multicast\-group +(?P<multicast_group>[\w\:\/]+), +pid +(?P<pid>\d+)$')
+        p1 = regex_engine.compile(r'^\s*RIP +(VRF|process)+ +(?P<vrf>[\S\s]+), +port +(?P<port>\d+),'
+                                  r' +multicast\-group +(?P<multicast_group>[\w\:\/]+), +pid +(?P<pid>\d+)$')
         #    Administrative distance is 120. Maximum paths is 16
-        p2 = re.compile(r'^\s*Administrative +distance +is +(?P<distance>\d+). +Maximum +paths +is +(?P<maximum_path>\d+)$')
+        p2 = regex_engine.compile(r'^\s*Administrative +distance +is +(?P<distance>\d+). +Maximum +paths +is +(?P<maximum_path>\d+)$')
         #    Updates every 30 seconds, expire after 180
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^\s*Updates +every +(?P<update>\d+) +seconds, +expire +after +(?P<expire_time>\d+)$')
         #    Holddown lasts 0 seconds, garbage collect after 120
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^\s*Holddown +lasts +(?P<holddown>\d+) +seconds, +garbage +collect +after +(?P<flush_interval>\d+)$')
         #    Split horizon is on; poison reverse is off
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^\s*Split +horizon +is +(?P<split_horizon>(on|off)+); +poison +reverse +is +(?P<poison_reverse>(on|off)+)$')
         #    Default routes are not generated
         #    Default routes are generated
-        p6 = re.compile(r'^\s*Default +routes +are +((?P<default_routes_generated>\w+) )?generated$')
+        p6 = regex_engine.compile(r'^\s*Default +routes +are +((?P<default_routes_generated>\w+) )?generated$')
         #    Periodic updates 399, trigger updates 8
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^\s*Periodic +updates +(?P<perodic_update>\d+), +trigger +updates +(?P<trigger_update>\d+)$')
         #    Full Advertisement 0, Delayed Events 0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^\s*Full +Advertisement +(?P<full_advertisement>\d+), +Delayed +Events +(?P<delay_events>\d+)$')
         # Interfaces:
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^\s*Interfaces:$')
         #   GigabitEthernet3.100
-        p10 = re.compile(r'^\s*(?P<interface>^(?!None)[\w\/\.]+)$')
+        p10 = regex_engine.compile(r'^\s*(?P<interface>^(?!None)[\w\/\.]+)$')
 
         # Redistribution:
         # Redistributing protocol connected with transparent metric
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^\s*Redistributing +protocol +(?P<redistribute>\w+) +with( +transparent)? +metric( +(?P<metric>\d+))?$')
         #   Redistributing protocol static with transparent metric route-map static-to-rip
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^\s*Redistributing +protocol +(?P<redistribute>\w+) +with +transparent +metric( +route-map +(?P<route_policy>[\w\-]+))?$')
 
         # Redistributing protocol bgp 65001 route-map bgp-to-rip
-        p13 = re.compile(r'^Redistributing +protocol +(?P<redistribute>\w+) +(?P<protocol_number>\d+) +route\-map +(?P<route_policy>[\w\-]+)$')
+        p13 = regex_engine.compile(r'^Redistributing +protocol +(?P<redistribute>\w+) +(?P<protocol_number>\d+) +route\-map +(?P<route_policy>[\w\-]+)$')
 
         result_dict = {}
         intf_timers_dict = {}
@@ -500,14 +502,14 @@ class ShowIpv6RipDatabase(ShowIpv6RipDatabaseSchema):
 
         # RIP VRF "Default VRF", local RIB
         # RIP VRF "VRF1", local RIB
-        p1 = re.compile(r'^\s*RIP +VRF +"(?P<vrf>[\S\s]+)", +local +RIB$')
+        p1 = regex_engine.compile(r'^\s*RIP +VRF +"(?P<vrf>[\S\s]+)", +local +RIB$')
 
         # 2001:DB8:1:3::/64, metric 2
         # 2001:DB8:2:3::/64, metric 2, installed
-        p2 = re.compile(r'^\s*(?P<route>[\w\:\/]+), +metric +(?P<metric>\d+)(, +(?P<installed>(installed)+))?$')
+        p2 = regex_engine.compile(r'^\s*(?P<route>[\w\:\/]+), +metric +(?P<metric>\d+)(, +(?P<installed>(installed)+))?$')
 
         #     GigabitEthernet3.100/FE80::F816:3EFF:FEFF:1E3D, expires in 179 secs
-        p3 = re.compile(r'^\s*(?P<interface>\S+), +expires +in +(?P<expire_time>[\d]+) +secs$')
+        p3 = regex_engine.compile(r'^\s*(?P<interface>\S+), +expires +in +(?P<expire_time>[\d]+) +secs$')
 
         result_dict = {}
         for line in out.splitlines():
@@ -4,13 +4,13 @@ IOSXE parsers for the following commands
     * show romvar switch <switch_number>
 '''
 
-# python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ================
 # Schema for:
@@ -178,172 +178,172 @@ class ShowRomvar(ShowRomvarSchema):
 
 
         # ROMMON variables:
-        p_variables = re.compile(r"^ROMMON\s+variables.*$")
+        p_variables = regex_engine.compile(r"^ROMMON\s+variables.*$")
 
         # PS1 = rommon ! >
-        p_ps1 = re.compile(r"^PS1\s*=\s*(?P<ps1>.*)$")
+        p_ps1 = regex_engine.compile(r"^PS1\s*=\s*(?P<ps1>.*)$")
 
         # THRPUT =
-        p_thrput = re.compile(r".*(THRPUT|THPUT)\s*=\s*(?P<thrput>.*)$")
+        p_thrput = regex_engine.compile(r".*(THRPUT|THPUT)\s*=\s*(?P<thrput>.*)$")
 
         # SR_MGMT_VRF = 0
-        p_mgmt_vrf = re.compile(r"^SR_MGMT_VRF\s*=\s*(?P<mgmt_vrf>.*)$")
+        p_mgmt_vrf = regex_engine.compile(r"^SR_MGMT_VRF\s*=\s*(?P<mgmt_vrf>.*)$")
 
         # REAL_MGMTE_DEV =
-        p_mgmte_dev = re.compile(r"^REAL_MGMTE_DEV\s*=\s*(?P<mgmte_dev>.*)$")
+        p_mgmte_dev = regex_engine.compile(r"^REAL_MGMTE_DEV\s*=\s*(?P<mgmte_dev>.*)$")
 
         # IP_ADDRESS = 10.19.92.165
-        p_ip = re.compile(r"^IP_ADDRESS\s*=\s*(?P<ip_address>\S+)$")
+        p_ip = regex_engine.compile(r"^IP_ADDRESS\s*=\s*(?P<ip_address>\S+)$")
 
         # DEFAULT_GATEWAY = 10.19.92.1
-        p_gateway = re.compile(r"^DEFAULT_GATEWAY\s*=\s*(?P<gateway>\S+)$")
+        p_gateway = regex_engine.compile(r"^DEFAULT_GATEWAY\s*=\s*(?P<gateway>\S+)$")
 
         # IP_SUBNET_MASK = 255.255.255.0
-        p_mask = re.compile(r"^IP_SUBNET_MASK\s*=\s*(?P<ip_mask>\S+)$")
+        p_mask = regex_engine.compile(r"^IP_SUBNET_MASK\s*=\s*(?P<ip_mask>\S+)$")
 
         # DEV_MODE0 = FM5R95WUO0WUATJTQX5I5ZQHLWIT6CWKD513RVT9Q5UQKJVKPDSNU7NR1EDU4QWO
-        p_dev_mode_0 = re.compile(r"^DEV_MODE0\s*=\s*(?P<mode_0>\S+)$")
+        p_dev_mode_0 = regex_engine.compile(r"^DEV_MODE0\s*=\s*(?P<mode_0>\S+)$")
 
         # DEV_MODE1 = ICQWTUNIEAVS6DH4X7GBV3917N3M1YNMQC5JDW4GM9OLFOZ0B4XCPXGXE596Z71C
-        p_dev_mode_1 = re.compile(r"^DEV_MODE1\s*=\s*(?P<mode_1>\S+)$")
+        p_dev_mode_1 = regex_engine.compile(r"^DEV_MODE1\s*=\s*(?P<mode_1>\S+)$")
 
         # DEV_MODE2 = 93URXAFOPS1F74TR7LAT9BCAQ5O0LX73WHFMWKRQKZDYFIUCHTPK0SBVEYFZXSAQ
-        p_dev_mode_2 = re.compile(r"^DEV_MODE2\s*=\s*(?P<mode_2>\S+)$")
+        p_dev_mode_2 = regex_engine.compile(r"^DEV_MODE2\s*=\s*(?P<mode_2>\S+)$")
 
         # DEV_MODE3 = 6LQB4NEFCJ1DYOV929FGLMX3XK710QERFA2SWWCE8C08D5WYLS2X6CXDVQY0CFIO
-        p_dev_mode_3 = re.compile(r"^DEV_MODE3\s*=\s*(?P<mode_3>\S+)$")
+        p_dev_mode_3 = regex_engine.compile(r"^DEV_MODE3\s*=\s*(?P<mode_3>\S+)$")
 
         # DEV_MODE4 = 1DY4J4L14FCUYC22JDK8YLQQVF0ZPC9BVT7HM75LF4Z319VKS2WE8XWAUV1PEF27
-        p_dev_mode_4 = re.compile(r"^DEV_MODE4\s*=\s*(?P<mode_4>\S+)$")
+        p_dev_mode_4 = regex_engine.compile(r"^DEV_MODE4\s*=\s*(?P<mode_4>\S+)$")
 
         # DEV_MODE5 = 7YMXKN3FA6X5OEGHUZISA16KC0VAZ51S12JGPMUD3NZCCSTTGZ7O9G58NRUZIKBG
-        p_dev_mode_5 = re.compile(r"^DEV_MODE5\s*=\s*(?P<mode_5>\S+)$")
+        p_dev_mode_5 = regex_engine.compile(r"^DEV_MODE5\s*=\s*(?P<mode_5>\S+)$")
 
         # DEV_MODE6 = AR1PHFLWRD9ZGDSC0BKKIGWQBUJXX0FGJT3EEU8A7MMUVPLS73FP4WBUIZUS3X76
-        p_dev_mode_6 = re.compile(r"^DEV_MODE6\s*=\s*(?P<mode_6>\S+)$")
+        p_dev_mode_6 = regex_engine.compile(r"^DEV_MODE6\s*=\s*(?P<mode_6>\S+)$")
 
         # DEV_MODE7 = H5LF3EG7Y2S45ZFEB3GTDSK5M9XLDH4FUU7BQFZ9JI7PRWAHA3HS27JCU4A7PBN1
-        p_dev_mode_7 = re.compile(r"^DEV_MODE7\s*=\s*(?P<mode_7>\S+)$")
+        p_dev_mode_7 = regex_engine.compile(r"^DEV_MODE7\s*=\s*(?P<mode_7>\S+)$")
 
         # ? = 1
-        p_question = re.compile(r"^/?=1$")
+        p_question = regex_engine.compile(r"^/?=1$")
 
         # MCP_STARTUP_TRACEFLAGS = 00000000:00000000
-        p_mcp = re.compile(r"^MCP_STARTUP_TRACEFLAGS\s*=\s*(?P<tflag>.*)$")
+        p_mcp = regex_engine.compile(r"^MCP_STARTUP_TRACEFLAGS\s*=\s*(?P<tflag>.*)$")
 
         # RET_2_RTS = 23:48:46 Pacific Fri Dec 13 2019
-        p_ret_rts = re.compile(r"^RET_2_RTS\s*=\s*(?P<ret_date>.*)$")
+        p_ret_rts = regex_engine.compile(r"^RET_2_RTS\s*=\s*(?P<ret_date>.*)$")
 
         # CHASSIS_HA_LOCAL_IP = 10.10.68.54
-        p_chassis_ha_ip = re.compile(r"^CHASSIS_HA_LOCAL_IP\s*=\s*(?P<ha_ip>\S+)$")
+        p_chassis_ha_ip = regex_engine.compile(r"^CHASSIS_HA_LOCAL_IP\s*=\s*(?P<ha_ip>\S+)$")
 
         # CHASSIS_HA_REMOTE_IP = 10.10.68.52
-        p_chassis_ha_remote_ip = re.compile(r"CHASSIS_HA_REMOTE_IP\s*=\s*(?P<remote_ha_ip>\S+)$")
+        p_chassis_ha_remote_ip = regex_engine.compile(r"CHASSIS_HA_REMOTE_IP\s*=\s*(?P<remote_ha_ip>\S+)$")
 
         # CHASSIS_HA_LOCAL_MASK = 255.255.255.240
-        p_chassis_ha_mask = re.compile(r"^CHASSIS_HA_LOCAL_MASK\s*=\s*(?P<ha_mask>\S+)$")
+        p_chassis_ha_mask = regex_engine.compile(r"^CHASSIS_HA_LOCAL_MASK\s*=\s*(?P<ha_mask>\S+)$")
 
         # SWITCH_PRIORITY = 1
-        p_switch_priority = re.compile(r"^SWITCH_PRIORITY\s*=\s*(?P<priority>\d+)$")
+        p_switch_priority = regex_engine.compile(r"^SWITCH_PRIORITY\s*=\s*(?P<priority>\d+)$")
 
         # SWITCH_NUMBER = 2
-        p_switch_number = re.compile(r"^SWITCH_NUMBER\s*=\s*(?P<number>\d+)$")
+        p_switch_number = regex_engine.compile(r"^SWITCH_NUMBER\s*=\s*(?P<number>\d+)$")
 
         # LICENSE_ACTIVE_LEVEL = adventerprise,all:c9800lk9;
-        p_lic_active = re.compile(r"^LICENSE_ACTIVE_LEVEL\s*=\s*(?P<lic_active>.*)$")
+        p_lic_active = regex_engine.compile(r"^LICENSE_ACTIVE_LEVEL\s*=\s*(?P<lic_active>.*)$")
 
         # LICENSE_BOOT_LEVEL = adventerprise,all:c980080k9;
-        p_lic_boot = re.compile(r"^LICENSE_BOOT_LEVEL\s*=\s*(?P<lic_boot>.*)$")
+        p_lic_boot = regex_engine.compile(r"^LICENSE_BOOT_LEVEL\s*=\s*(?P<lic_boot>.*)$")
 
         # CONFIG_FILE =
-        p_config_file = re.compile(r"^CONFIG_FILE\s*=\s*(?P<config_file>.*)$")
+        p_config_file = regex_engine.compile(r"^CONFIG_FILE\s*=\s*(?P<config_file>.*)$")
 
         # BOOTLDR =
-        p_bootldr = re.compile(r"^BOOTLDR\s*=\s*(?P<bootldr>.*)$")
+        p_bootldr = regex_engine.compile(r"^BOOTLDR\s*=\s*(?P<bootldr>.*)$")
 
         # BOOT = bootflash:packages.conf,12;bootflash:C9800-L-universalk9_wlc.BLD_V173_THROTTLE_LATEST_20200707_003212_2.SSA.bin,12;
-        p_boot = re.compile(r"^BOOT\s*=\s*(?P<boot>.*)$")
+        p_boot = regex_engine.compile(r"^BOOT\s*=\s*(?P<boot>.*)$")
 
         # BSI = 0
-        p_bsi = re.compile(r"^BSI\s*=\s*(?P<bsi>\d+)$")
+        p_bsi = regex_engine.compile(r"^BSI\s*=\s*(?P<bsi>\d+)$")
 
         # RET_2_RCALTS =
-        p_rcalts = re.compile(r"^RET_2_RCALTS\s*=\s*(?P<rcalts>.*)")
+        p_rcalts = regex_engine.compile(r"^RET_2_RCALTS\s*=\s*(?P<rcalts>.*)")
 
         # RANDOM_NUM = 25654861
-        p_random = re.compile(r"^RANDOM_NUM\s*=\s*(?P<random>\d+)$")
+        p_random = regex_engine.compile(r"^RANDOM_NUM\s*=\s*(?P<random>\d+)$")
 
         # STACK_1_1 = 0_0
-        p_stack = re.compile(r"^STACK_1_1\s*=\s*(?P<stack>.*)$")
+        p_stack = regex_engine.compile(r"^STACK_1_1\s*=\s*(?P<stack>.*)$")
 
         # RMI_INTERFACE_NAME = Vlan10
-        p_rmi_int = re.compile(r"^RMI_INTERFACE_NAME\s*=\s*(?P<rmi_int>\S+)$")
+        p_rmi_int = regex_engine.compile(r"^RMI_INTERFACE_NAME\s*=\s*(?P<rmi_int>\S+)$")
 
         # RMI_CHASSIS_LOCAL_IP = 10.10.30.6
-        p_rmi_ip = re.compile(r"^RMI_CHASSIS_LOCAL_IP\s*=\s*(?P<rmi_ip>\S+)$")
+        p_rmi_ip = regex_engine.compile(r"^RMI_CHASSIS_LOCAL_IP\s*=\s*(?P<rmi_ip>\S+)$")
 
         # RMI_CHASSIS_REMOTE_IP = 10.10.30.7
-        p_rmi_ip_remote = re.compile(r"^RMI_CHASSIS_REMOTE_IP\s*=\s*(?P<rmi_remote_ip>\S+)$")
+        p_rmi_ip_remote = regex_engine.compile(r"^RMI_CHASSIS_REMOTE_IP\s*=\s*(?P<rmi_remote_ip>\S+)$")
 
         # CRASHINFO = bootflash:crashinfo_RP_00_00_20200428-005338-IST
-        p_crash = re.compile(r"^CRASHINFO\s*=\s*(?P<crash>.*)$")
+        p_crash = regex_engine.compile(r"^CRASHINFO\s*=\s*(?P<crash>.*)$")
 
         # NO_CONSOLE = 1
-        p_no_console = re.compile(r"^NO_CONSOLE\s*=\s*(?P<number>\d*)$")
+        p_no_console = regex_engine.compile(r"^NO_CONSOLE\s*=\s*(?P<number>\d*)$")
 
         # BOOT_DEVICE_MODE = meraki
-        p_boot_device_mode= re.compile(r"^BOOT_DEVICE_MODE\s*=\s*(?P<boot_device_mode>.*)$")
+        p_boot_device_mode= regex_engine.compile(r"^BOOT_DEVICE_MODE\s*=\s*(?P<boot_device_mode>.*)$")
 
         # BOARDID = 28755
-        p_boardid = re.compile(r"^BOARDID\s*=\s*(?P<boardid>\d*)$")
+        p_boardid = regex_engine.compile(r"^BOARDID\s*=\s*(?P<boardid>\d*)$")
 
         # MAC_ADDR = 6C:13:D5:1B:5C:80
-        p_mac_addr = re.compile(r"^MAC_ADDR\s*=\s*(?P<mac_addr>\S+)$")
+        p_mac_addr = regex_engine.compile(r"^MAC_ADDR\s*=\s*(?P<mac_addr>\S+)$")
 
         # MANUAL_BOOT = no
-        p_manual_boot = re.compile(r"^MANUAL_BOOT\s*=\s*(?P<manual_boot>\S+)$")
+        p_manual_boot = regex_engine.compile(r"^MANUAL_BOOT\s*=\s*(?P<manual_boot>\S+)$")
 
         # MODEL_NUM = C9300-48U
-        p_model_num = re.compile(r"^MODEL_NUM\s*=\s*(?P<model_num>\S+)$")
+        p_model_num = regex_engine.compile(r"^MODEL_NUM\s*=\s*(?P<model_num>\S+)$")
 
         # MODEL_REVISION_NUM = A0
-        p_model_revision_num = re.compile(r"^MODEL_REVISION_NUM\s*=\s*(?P<model_revision_num>\S+)$")
+        p_model_revision_num = regex_engine.compile(r"^MODEL_REVISION_NUM\s*=\s*(?P<model_revision_num>\S+)$")
 
         # MOTHERBOARD_ASSEMBLY_NUM = 73-19919-04
-        p_motherboard_assembly_num = re.compile(r"^MOTHERBOARD_ASSEMBLY_NUM\s*=\s*(?P<motherboard_assembly_num>\S+)$")
+        p_motherboard_assembly_num = regex_engine.compile(r"^MOTHERBOARD_ASSEMBLY_NUM\s*=\s*(?P<motherboard_assembly_num>\S+)$")
 
         # MOTHERBOARD_REVISION_NUM = A0
-        p_motherboard_revision_num = re.compile(r"^MOTHERBOARD_REVISION_NUM\s*=\s*(?P<motherboard_revision_num>\S+)$")
+        p_motherboard_revision_num = regex_engine.compile(r"^MOTHERBOARD_REVISION_NUM\s*=\s*(?P<motherboard_revision_num>\S+)$")
 
         # MOTHERBOARD_SERIAL_NUM = FOC25124Q2U
-        p_motherboard_serial_num = re.compile(r"^MOTHERBOARD_SERIAL_NUM\s*=\s*(?P<motherboard_serial_num>\S+)$")
+        p_motherboard_serial_num = regex_engine.compile(r"^MOTHERBOARD_SERIAL_NUM\s*=\s*(?P<motherboard_serial_num>\S+)$")
 
         # ROMMON_AUTOBOOT_ATTEMPT = 0
-        p_rommon_autoboot_attempt = re.compile(r"^ROMMON_AUTOBOOT_ATTEMPT\s*=\s*(?P<rommon_autoboot_attempt>\S+)$")
+        p_rommon_autoboot_attempt = regex_engine.compile(r"^ROMMON_AUTOBOOT_ATTEMPT\s*=\s*(?P<rommon_autoboot_attempt>\S+)$")
 
         # SYSTEM_SERIAL_NUM = FOC2514L1HE
-        p_system_serial_num = re.compile(r"^SYSTEM_SERIAL_NUM\s*=\s*(?P<system_serial_num>\S+)$")
+        p_system_serial_num = regex_engine.compile(r"^SYSTEM_SERIAL_NUM\s*=\s*(?P<system_serial_num>\S+)$")
 
         # VERSION_ID = V05
-        p_version_id = re.compile(r"^VERSION_ID\s*=\s*(?P<version_id>\S+)$")
+        p_version_id = regex_engine.compile(r"^VERSION_ID\s*=\s*(?P<version_id>\S+)$")
 
         # DEVICE_MANAGED_MODE = controller
-        p_device_managed_mode = re.compile(r"^\s*DEVICE_MANAGED_MODE\s*=\s+(?P<mode>\S+)$")
+        p_device_managed_mode = regex_engine.compile(r"^\s*DEVICE_MANAGED_MODE\s*=\s+(?P<mode>\S+)$")
 
         # ABNORMAL_RESET_COUNT=0
-        p_abnormal_reset_count = re.compile(r"^ABNORMAL_RESET_COUNT\s*=\s*(?P<abnormal_reset_count>\d+)$")
+        p_abnormal_reset_count = regex_engine.compile(r"^ABNORMAL_RESET_COUNT\s*=\s*(?P<abnormal_reset_count>\d+)$")
 
         # BOOT_LOADER_UPGRADE_DISABLE=1
-        p_boot_loader_upgrade_disable = re.compile(r"^BOOT_LOADER_UPGRADE_DISABLE\s*=\s*(?P<boot_loader_upgrade_disable>\S+)$")
+        p_boot_loader_upgrade_disable = regex_engine.compile(r"^BOOT_LOADER_UPGRADE_DISABLE\s*=\s*(?P<boot_loader_upgrade_disable>\S+)$")
 
         # BOOT_PARAM=console=ttyS0,9600 root=/dev/ram0
-        p_boot_param = re.compile(r"^BOOT_PARAM\s*=(?P<boot_param>.*)$")
+        p_boot_param = regex_engine.compile(r"^BOOT_PARAM\s*=(?P<boot_param>.*)$")
 
         # BOOT_PARAM_BKP=console=ttyS0,9600 root=/dev/ram0
-        p_boot_param_bkp = re.compile(r"^BOOT_PARAM_BKP\s*=(?P<boot_param_bkp>.*)$")
+        p_boot_param_bkp = regex_engine.compile(r"^BOOT_PARAM_BKP\s*=(?P<boot_param_bkp>.*)$")
 
         # SWITCH_IGNORE_STARTUP_CFG=0
-        p_switch_ignore_startup_config = re.compile(r"^SWITCH_IGNORE_STARTUP_CFG\s*=(?P<switch_ignore_startup_config>.*)$")
+        p_switch_ignore_startup_config = regex_engine.compile(r"^SWITCH_IGNORE_STARTUP_CFG\s*=(?P<switch_ignore_startup_config>.*)$")
 
         romvar_dict = {}
 
@@ -674,13 +674,13 @@ class ShowRomMonSwitchR0(ShowRomMonSwitchR0Schema):
             output = self.device.execute(self.cli_command.format(switch_num=switch_num, process=process))
             
         # System Bootstrap, Version 17.11.1r[FC1], DEVELOPMENT SOFTWARE
-        p1 = re.compile(r"^System\s+Bootstrap,\s+Version\s+(?P<version>\S+),\s+(?P<build_type>[\w\(\)\s]+)$")
+        p1 = regex_engine.compile(r"^System\s+Bootstrap,\s+Version\s+(?P<version>\S+),\s+(?P<build_type>[\w\(\)\s]+)$")
         
         # Copyright (c) 1994-2022 by cisco Systems, Inc.
-        p2 = re.compile(r"^Copyright\s+\(c\)\s+(?P<copyright>\S+)\s+by\s+(?P<vendor>\S+\s+\S+),\s+Inc\.$")
+        p2 = regex_engine.compile(r"^Copyright\s+\(c\)\s+(?P<copyright>\S+)\s+by\s+(?P<vendor>\S+\s+\S+),\s+Inc\.$")
         
         # Compiled Wed 02/08/2023 14:20:19.45 by sapitcha
-        p3 = re.compile(r"^Compiled\s+(?P<day>\w+)\s+(?P<date>\S+)\s+(?P<time>\S+)\s+by\s+(?P<username>\w+)$")
+        p3 = regex_engine.compile(r"^Compiled\s+(?P<day>\w+)\s+(?P<date>\S+)\s+(?P<time>\S+)\s+by\s+(?P<username>\w+)$")
 
         ret_dict = {}
 
@@ -9,13 +9,13 @@ IOSXE parsers for the following show commands:
     
 '''
 
-#Python
-import re
-
 #MetaParser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowRouteMapAllSchema(MetaParser):
     """
@@ -104,134 +104,134 @@ class ShowRouteMapAll(ShowRouteMapAllSchema):
         clause_type = ''
 
         # route-map test, permit, sequence 10
-        p1 =  re.compile(r'^\s*route-map *(?P<name>\S+)\,'
-                         r' *(?P<route_disposition>[\w\W]+)\, *sequence'
-                         r' *(?P<statements>[0-9]+)$')
+        p1 =  regex_engine.compile(r'^\s*route-map *(?P<name>\S+)\,'
+                                   r' *(?P<route_disposition>[\w\W]+)\, *sequence'
+                                   r' *(?P<statements>[0-9]+)$')
 
         # Match clauses:
         # Set clauses:
-        p1_2 = re.compile(r'^\s*(?P<clause_type>[a-zA-Z]+) +clauses:$')
+        p1_2 = regex_engine.compile(r'^\s*(?P<clause_type>[a-zA-Z]+) +clauses:$')
 
         # description <description>
-        p1_1 = re.compile(r'^\s*description +(?P<description>.+)$')
+        p1_1 = regex_engine.compile(r'^\s*description +(?P<description>.+)$')
 
         # as-path (as-path filter): aspathlist1
-        p2 = re.compile(r'^\s*as-path *\(as-path *filter\):'
-                        r' *(?P<match_as_path_list>[a-z0-9]+)$')
+        p2 = regex_engine.compile(r'^\s*as-path *\(as-path *filter\):'
+                                  r' *(?P<match_as_path_list>[a-z0-9]+)$')
 
         # as-number (as-path-list filter): List1, List2
-        p2_1 = re.compile(r'^\s*as-number *\(as-path-list *filter\)\:'
-                          r' *(?P<match_as_number_list>[\w\W\,\s]+)$')
+        p2_1 = regex_engine.compile(r'^\s*as-number *\(as-path-list *filter\)\:'
+                                    r' *(?P<match_as_number_list>[\w\W\,\s]+)$')
 
         # ip address prefix-lists: test-test
-        p3 = re.compile(r'^\s*ip *address *prefix-lists:'
-                        r' *(?P<match_prefix_list>.+)$')
+        p3 = regex_engine.compile(r'^\s*ip *address *prefix-lists:'
+                                  r' *(?P<match_prefix_list>.+)$')
         
         #ip address (access-lists): pbr-acl
-        p3_1 = re.compile(r'^\s*ip\saddress\s\(access\-lists\)\:\s(?P<match_access_list>.+)')
+        p3_1 = regex_engine.compile(r'^\s*ip\saddress\s\(access\-lists\)\:\s(?P<match_access_list>.+)')
        
         #ip next-hop prefix-lists: test
         #ip next-hop (access-lists): 1
-        p4 =  re.compile(r'^\s*ip *next-hop *(?P<match_type>[a-zA-Z0-9\S\(\)]+):'
-                         r' *(?P<match_nexthop_in>.+)$')
+        p4 =  regex_engine.compile(r'^\s*ip *next-hop *(?P<match_type>[a-zA-Z0-9\S\(\)]+):'
+                                   r' *(?P<match_nexthop_in>.+)$')
         
         # ipv6 address prefix-list test-test
-        p5 = re.compile(r'^\s*ipv6 *address *prefix-list(?:s\:)?'
-                        r' *(?P<match_prefix_list_v6>.+)$')
+        p5 = regex_engine.compile(r'^\s*ipv6 *address *prefix-list(?:s\:)?'
+                                  r' *(?P<match_prefix_list_v6>.+)$')
 
         # ipv6 next-hop prefix-list test2
-        p6 = re.compile(r'^\s*ipv6 *next-hop *prefix-list(?:s\:)?'
-                        r' *(?P<match_nexthop_in_v6>.+)$')
+        p6 = regex_engine.compile(r'^\s*ipv6 *next-hop *prefix-list(?:s\:)?'
+                                  r' *(?P<match_nexthop_in_v6>.+)$')
 
         #interface GigabitEthernet1
-        p7 = re.compile(r'^\s*interface *(?P<match_interface>[a-zA-Z0-9\/\s]+)$')
+        p7 = regex_engine.compile(r'^\s*interface *(?P<match_interface>[a-zA-Z0-9\/\s]+)$')
 
         #metric 100
-        p8 = re.compile(r'^\s*metric *(?P<match_med_eq>[0-9\-]+)$')
+        p8 = regex_engine.compile(r'^\s*metric *(?P<match_med_eq>[0-9\-]+)$')
 
         #community  (community-list filter): test3
-        p10 = re.compile(r'^\s*community *\(community-list *filter\):'
-                         r' *(?P<match_community_list>.+)$')
+        p10 = regex_engine.compile(r'^\s*community *\(community-list *filter\):'
+                                   r' *(?P<match_community_list>.+)$')
 
         #route-type: level-1 level-2
-        p11 = re.compile(r'^\s*route-type *(?P<match_level_eq>[a-z0-9\-\s]+)$')
+        p11 = regex_engine.compile(r'^\s*route-type *(?P<match_level_eq>[a-z0-9\-\s]+)$')
 
         # extcommunity  (extcommunity-list filter): testing
-        p11_1 = re.compile(r'^\s*extcommunity *\(extcommunity-list *filter\):'
-                           r' *(?P<match_ext_community_list>.+)$')
+        p11_1 = regex_engine.compile(r'^\s*extcommunity *\(extcommunity-list *filter\):'
+                                     r' *(?P<match_ext_community_list>.+)$')
 
         # ip next-hop 10.64.4.4
         # ip next-hop 10.4.1.1 10.16.2.2
-        p12 = re.compile(r'^\s*ip *next-hop *(?P<set_next_hop>[0-9\.\s]+)$')
+        p12 = regex_engine.compile(r'^\s*ip *next-hop *(?P<set_next_hop>[0-9\.\s]+)$')
 
         # ip next-hop self
-        p12_1 = re.compile(r'^\s*ip *next-hop self$')
+        p12_1 = regex_engine.compile(r'^\s*ip *next-hop self$')
 
         #ip default next-hop 100.0.0.2                                          
-        p12_2 = re.compile(r'^\s*ip\s(?P<match_type>\S+)\snext\-hop\s(?P<set_next_hop>.+)$')
+        p12_2 = regex_engine.compile(r'^\s*ip\s(?P<match_type>\S+)\snext\-hop\s(?P<set_next_hop>.+)$')
       
         # ipv6 next-hop 2001:db8:1::1
         # ipv6 next-hop 2001:DB8:1::1 2001:DB8:2::1
-        p13 = re.compile(r'^\s*ipv6 *next-hop *(?P<set_next_hop_v6>[a-zA-Z0-9\:\s]+)$')
+        p13 = regex_engine.compile(r'^\s*ipv6 *next-hop *(?P<set_next_hop_v6>[a-zA-Z0-9\:\s]+)$')
 
         #tag 30
-        p14 = re.compile(r'^\s*tag *(?P<set_tag>[0-9]+)$')
+        p14 = regex_engine.compile(r'^\s*tag *(?P<set_tag>[0-9]+)$')
 
         # weight 50
-        p14_1 = re.compile(r'^\s*weight *(?P<set_weight>[0-9]+)$')
+        p14_1 = regex_engine.compile(r'^\s*weight *(?P<set_weight>[0-9]+)$')
 
         #metric 20
-        p15 = re.compile(r'^\s*metric *(?P<set_med>[0-9]+)$')
+        p15 = regex_engine.compile(r'^\s*metric *(?P<set_med>[0-9]+)$')
 
         #distance: 10
-        p15_1 = re.compile(r'^\s*distance: *(?P<set_distance>[0-9]+)$')
+        p15_1 = regex_engine.compile(r'^\s*distance: *(?P<set_distance>[0-9]+)$')
 
         # metric-type external ---- > set_metric_type
         # metric-type type-1   ---- > set_ospf_metric_type
-        p16 = re.compile(r'^\s*metric-type *(?P<set_ospf_metric_type>[0-9a-z\-]+)$')
+        p16 = regex_engine.compile(r'^\s*metric-type *(?P<set_ospf_metric_type>[0-9a-z\-]+)$')
 
         #level level-1
-        p17 = re.compile(r'^\s*level *(?P<set_level>[a-z0-9\-]+)$')
+        p17 = regex_engine.compile(r'^\s*level *(?P<set_level>[a-z0-9\-]+)$')
 
         #local-preference 111
-        p18 = re.compile(r'^\s*local-preference *(?P<match_local_pref_eq>[0-9]+)$')
+        p18 = regex_engine.compile(r'^\s*local-preference *(?P<match_local_pref_eq>[0-9]+)$')
 
         #origin igp
-        p19 = re.compile(r'^\s*origin *(?P<set_route_origin>[a-z]+)$')
+        p19 = regex_engine.compile(r'^\s*origin *(?P<set_route_origin>[a-z]+)$')
 
         # comm-list test delete
-        p20 = re.compile(r'^\s*comm-list *(?P<set_community_delete>[a-z]+)'
-                         r' *delete$')
+        p20 = regex_engine.compile(r'^\s*comm-list *(?P<set_community_delete>[a-z]+)'
+                                   r' *delete$')
 
         #community 100:1 no-export no-advertise additive
-        p20_1 = re.compile(r'^\s*community *(?P<set_community>[0-9\:]+)(?:'
-                           r' *(?P<set_community_no_export>(no-export)))?(?:'
-                           r' *(?P<set_community_no_advertise>(no-advertise)))?(?:'
-                           r' *(?P<set_community_additive>(additive)))?$')
+        p20_1 = regex_engine.compile(r'^\s*community *(?P<set_community>[0-9\:]+)(?:'
+                                     r' *(?P<set_community_no_export>(no-export)))?(?:'
+                                     r' *(?P<set_community_no_advertise>(no-advertise)))?(?:'
+                                     r' *(?P<set_community_additive>(additive)))?$')
 
         #as-path prepend 10 10 10
-        p21 = re.compile(r'^\s*as-path *prepend'
-                         r' *(?P<set_as_path_prepend>[0-9\s\.]+)$')
+        p21 = regex_engine.compile(r'^\s*as-path *prepend'
+                                   r' *(?P<set_as_path_prepend>[0-9\s\.]+)$')
 
         #extcomm-list cisco delete
-        p22 = re.compile(r'^\s*extcomm-list'
-                         r' *(?P<set_ext_community_delete>[a-z]+) *delete$')
+        p22 = regex_engine.compile(r'^\s*extcomm-list'
+                                   r' *(?P<set_ext_community_delete>[a-z]+) *delete$')
 
         # extended community RT:100:10 RT:100:100 RT:200:200 additive
-        p23 = re.compile(r'^\s*extended community'
-                         r'(?P<set_ext_community_rt>( RT\:[0-9]+\:[0-9]+)*)(\s)?'
-                         r'((?P<set_ext_community_rt_additive>(additive))?)')
+        p23 = regex_engine.compile(r'^\s*extended community'
+                                   r'(?P<set_ext_community_rt>( RT\:[0-9]+\:[0-9]+)*)(\s)?'
+                                   r'((?P<set_ext_community_rt_additive>(additive))?)')
 
         # extended community VD:100:100
-        p24 = re.compile(r'^\s*extended *community'
-                         r' *VD:(?P<set_ext_community_vpn>[0-9\:]+)$')
+        p24 = regex_engine.compile(r'^\s*extended *community'
+                                   r' *VD:(?P<set_ext_community_vpn>[0-9\:]+)$')
 
         # extended community SoO:100:10
-        p25 = re.compile(r'^\s*extended *community'
-                         r' *SoO:(?P<set_ext_community_soo>[0-9\:]+)$')
+        p25 = regex_engine.compile(r'^\s*extended *community'
+                                   r' *SoO:(?P<set_ext_community_soo>[0-9\:]+)$')
 
         # Policy routing matches: 0 packets, 0 bytes
-        p26 = re.compile(r'^\s*Policy\s+routing\s+matches:\s+(?P<packets>\d+)\spackets,\s+(?P<bytes>\d+)\s+bytes')
+        p26 = regex_engine.compile(r'^\s*Policy\s+routing\s+matches:\s+(?P<packets>\d+)\spackets,\s+(?P<bytes>\d+)\s+bytes')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -617,15 +617,15 @@ class ShowTableMap(ShowTableMapSchema):
             output = self.device.execute(cmd)
         
         # Table Map t1
-        p1 = re.compile(r'^Table Map (?P<table_map>\S+)$')
+        p1 = regex_engine.compile(r'^Table Map (?P<table_map>\S+)$')
         
         # from 8 to 16
         # from 16 to 32
-        p2 = re.compile(r'^(from (?P<from>\d+)\s+to\s+(?P<to>\d+))$')
+        p2 = regex_engine.compile(r'^(from (?P<from>\d+)\s+to\s+(?P<to>\d+))$')
 
         # default copy
         # default 8
-        p3 = re.compile(r'^default (?P<default>\w+)$')
+        p3 = regex_engine.compile(r'^default (?P<default>\w+)$')
 
         ret_dict = {}
         
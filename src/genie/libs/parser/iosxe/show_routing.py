@@ -2,12 +2,15 @@
 show_route.py
 
 '''
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine, string_pool
+from genie.libs.parser.utils.common import delegate
+
 
 # ====================================================
 #  distributor class for show ip route
@@ -46,14 +49,10 @@ class ShowIpRouteDistributor(MetaParser):
             out = output
 
         if (route or protocol) in self.protocol_set or (not route and not protocol):
-            parser = ShowIpRoute(self.device)
-            self.schema = parser.schema
-            return parser.parse(output=out)
+            return delegate(self, ShowIpRoute, output=out)
 
         else:
-            parser = ShowIpRouteWord(self.device)
-            self.schema=parser.schema
-            return parser.parse(output=out)
+            return delegate(self, ShowIpRouteWord, output=out)
 
 # ====================================================
 #  distributor class for show ipv6 route
@@ -102,14 +101,12 @@ class ShowIpv6RouteDistributor(MetaParser):
             vrf = 'default'
 
         if (route or protocol) in self.protocol_set or (not route and not protocol):
-            parser = ShowIpv6Route(self.device)
-            self.schema = parser.schema
-            return parser.parse(vrf=vrf, protocol=protocol, output=out)
+            return delegate(self, ShowIpv6Route, vrf=vrf, protocol=protocol,
+                            output=out)
 
         else:
-            parser = ShowIpv6RouteWord(self.device)
-            self.schema=parser.schema
-            return parser.parse(vrf=vrf, route=route, output=out)
+            return delegate(self, ShowIpv6RouteWord, vrf=vrf, route=route,
+                            output=out)
 
 # ====================================================
 #  schema for show ip route
@@ -205,6 +202,9 @@ class ShowIpRoute(ShowIpRouteSchema):
         else:
             out = output
 
+        # share the repeated values of the routes, see utils/string_pool.py
+        pool = string_pool.is_enabled()
+
         af = self.IP_VER
         route = ""
         if not vrf:
@@ -234,31 +234,31 @@ class ShowIpRoute(ShowIpRouteSchema):
         result_dict = {}
 
         # initial regexp pattern
-        p100 = re.compile(r'^Routing +entry +for +'
-                        r'(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
-                        r'(, +(?P<net>[\w\s]+))?$')
-        p200 = re.compile(r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
-                        r'distance +(?P<distance>\d+), +'
-                        r'metric +(?P<metric>\d+)'
-                        r'(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
-        p300 = re.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
-                        r'(?P<redist_via_tag>\d+)?$')
-        p400 = re.compile(r'^Last +update +from +(?P<from>[\w\.]+) +'
-                        r'on +(?P<interface>[\w\.\/\-]+), +'
-                        r'(?P<age>[\w\.\:]+) +ago$')
-        p500 = re.compile(r'^\*? *(?P<nexthop>[\w\.]+)(, +'
-                        r'from +(?P<from>[\w\.]+), +'
-                        r'(?P<age>[\w\.\:]+) +ago, +'
-                        r'via +(?P<interface>[\w\.\/\-]+))?$')
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                        r'traffic +share +count +is +(?P<share_count>\d+)$')
-
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                          r'traffic +share +count +is +(?P<share_count>\d+)$')
-        p700 = re.compile(r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
-                          r'+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
-        p800 = re.compile(r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
-        p900 = re.compile(r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
+        p100 = regex_engine.compile(r'^Routing +entry +for +'
+                                  r'(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
+                                  r'(, +(?P<net>[\w\s]+))?$')
+        p200 = regex_engine.compile(r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
+                                  r'distance +(?P<distance>\d+), +'
+                                  r'metric +(?P<metric>\d+)'
+                                  r'(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
+        p300 = regex_engine.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
+                                  r'(?P<redist_via_tag>\d+)?$')
+        p400 = regex_engine.compile(r'^Last +update +from +(?P<from>[\w\.]+) +'
+                                  r'on +(?P<interface>[\w\.\/\-]+), +'
+                                  r'(?P<age>[\w\.\:]+) +ago$')
+        p500 = regex_engine.compile(r'^\*? *(?P<nexthop>[\w\.]+)(, +'
+                                  r'from +(?P<from>[\w\.]+), +'
+                                  r'(?P<age>[\w\.\:]+) +ago, +'
+                                  r'via +(?P<interface>[\w\.\/\-]+))?$')
+        p600 = regex_engine.compile(r'^Route +metric +is +(?P<metric>\d+), +'
+                                  r'traffic +share +count +is +(?P<share_count>\d+)$')
+
+        p600 = regex_engine.compile(r'^Route +metric +is +(?P<metric>\d+), +'
+                                    r'traffic +share +count +is +(?P<share_count>\d+)$')
+        p700 = regex_engine.compile(r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
+                                    r'+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
+        p800 = regex_engine.compile(r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
+        p900 = regex_engine.compile(r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
 
         # initial variables
         ret_dict = {}
@@ -268,12 +268,12 @@ class ShowIpRoute(ShowIpRouteSchema):
 
         # Routing Table: VRF1
         # Routing Table: VRF-infra
-        p1 = re.compile(r'^Routing Table: +(?P<vrf>[\w?-]+)$')
+        p1 = regex_engine.compile(r'^Routing Table: +(?P<vrf>[\w?-]+)$')
 
         # 10.1.0.0/32 is subnetted, 1 subnets
         # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
-        p2 = re.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
-                        r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
+        p2 = regex_engine.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
+                                  r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
         
         # C        10.4.1.1 is directly connected, Loopback0
         # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
@@ -293,7 +293,7 @@ class ShowIpRoute(ShowIpRouteSchema):
         # ND  ::/0 [2/0]
         # NDp 2001:103::/64 [2/0]
         if self.IP_VER == 'ipv4':
-            p3 = re.compile(
+            p3 = regex_engine.compile(
                 r'^(?P<code>[A-Za-z]{0,2}[0-9]*(\*[A-Za-z]{0,2}[0-9]*)?) +(?P<code1>[A-Z][a-z]|[A-Z][\d]|[a-z]{2}|[A-Z]{2}|[+%&p])?\s*(?P<network>[0-9\.\:\/]+)?( '
                 r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?,?(\s+tag\s(?P<tag_id>\d+))?( *('
                 r'via +)?(?P<next_hop>[\d\.]+))?,?( +\((?P<nh_vrf>[\w+\-]+)\))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
@@ -301,15 +301,15 @@ class ShowIpRoute(ShowIpRouteSchema):
             # B        192.168.1.20/32 [200/0] via 2109:1::2 (red:ipv6), 00:03:46, Vlan500
             # B        192.168.1.40/32 [200/0] via 2109:1::4 (red:ipv6), 00:03:20
             # B        1.1.1.10 [200/0] via FC01:101:8:E007:: (default:ipv6), 1d15h
-            p7 = re.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.]+)\s+\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[0-9a-fA-F\:]+) +\((?P<nh_vrf>[\w\:]+)+\)+, +(?P<date>[dh\d\:]+)+(, +(?P<interface>[\w]+))?$')
+            p7 = regex_engine.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.]+)\s+\[(?P<route_preference>[\d\/]+)\]+ via +(?P<next_hop>[0-9a-fA-F\:]+) +\((?P<nh_vrf>[\w\:]+)\)+, +(?P<date>[dh\d\:]+)(, +(?P<interface>[\w]+))?$')
             # B        192.168.1.20/32
-            p8 = re.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.][\S]+)$')
+            p8 = regex_engine.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.][\S]+)$')
             # [200/0] via 2109:1::2 (default:ipv6), 00:04:15, Vlan500
             # [200/0] via 2109:1::2 (vrf-blue:ipv6), 00:04:15, Vlan500
-            p9 = re.compile(r'^\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)+\)+, +(?P<date>[\d\:]+)+, +(?P<interface>[\w\d]+)$')
+            p9 = regex_engine.compile(r'^\[(?P<route_preference>[\d\/]+)\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)\)+, +(?P<date>[\d\:]+), +(?P<interface>[\w\d]+)$')
 
         else:
-            p3 = re.compile(
+            p3 = regex_engine.compile(
                 r'^(?!via)(?P<code>[A-Za-z]{0,3}[0-9]*(\*[A-Za-z]{0,2}[0-9]*)?) +(?P<code1>[A-Z][a-z]|[A-Z][\d]\s|[a-z]{2}[+%&p])?\s*(?P<network>[\w\.\:\/]+)?'
                 r'( +is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?,?(\s+tag\s(?P<tag_id>\d+))?'
                 r'( *(via +)?(?P<next_hop>[\d\.]+))?,?( +\((?P<nh_vrf>[\w+\-]+)\))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
@@ -317,21 +317,21 @@ class ShowIpRoute(ShowIpRouteSchema):
             # B        192.168.1.20/32 [200/0] via 2109:1::2 (red:ipv6), 00:03:46, Vlan500
             # B        192.168.1.40/32 [200/0] via 2109:1::4 (red:ipv6), 00:03:20, Vlan500
             # B        192.168.1.40/32 [200/0] via 2109:1::4 (vrf-blue:ipv6), 00:03:20, Vlan500
-            p7 = re.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.]+)\s+\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)+\)+, +(?P<date>[\d\:]+)+, +(?P<interface>[\w]+)$')
+            p7 = regex_engine.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.]+)\s+\[(?P<route_preference>[\d\/]+)\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)\)+, +(?P<date>[\d\:]+), +(?P<interface>[\w]+)$')
             # B        192.168.1.20/32
-            p8 = re.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.][\S]+)$')
+            p8 = regex_engine.compile(r'^(?P<code>[\w]+) +(?P<network>[\d\/\.][\S]+)$')
             # [200/0] via 2109:1::2 (default:ipv6), 00:04:15, Vlan500
             # [200/0] via 2109:1::2 (vrf-blue:ipv6), 00:04:15, Vlan500
-            p9 = re.compile(r'^\[(?P<route_preference>[\d\/]+)+\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)+\)+, +(?P<date>[\d\:]+)+, +(?P<interface>[\w\d]+)$')
+            p9 = regex_engine.compile(r'^\[(?P<route_preference>[\d\/]+)\]+ via +(?P<next_hop>[\d\:]+) +\((?P<nh_vrf>[\w\-\:]+)\)+, +(?P<date>[\d\:]+), +(?P<interface>[\w\d]+)$')
 
         #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
-        p4 = re.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
-                        r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
+        p4 = regex_engine.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
+                                  r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
         
         #       is directly connected, GigabitEthernet0/2
-        p5 = re.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
-                        r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
-                        r'( +(?P<interface>[\S]+))?$')
+        p5 = regex_engine.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
+                                  r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
+                                  r'( +(?P<interface>[\S]+))?$')
 
         #      via 2001:DB8:1:1::2
         #      via 10.4.1.1%default, indirectly connected
@@ -339,9 +339,9 @@ class ShowIpRoute(ShowIpRouteSchema):
         #      via 2001:DB8:20:4:6::6%VRF2
         #      via Null0, receive
         #      via 33.33.33.33%default, Vlan100%default
-        p6 = re.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]{4,}),?)?'
-                        r'( +(?P<interface>[\w\.\/\-\_]+[\w\:\.\%]+),?)?,?( +receive)?'
-                        r'( +directly connected)?( +indirectly connected)?$')
+        p6 = regex_engine.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]{4,}),?)?'
+                                  r'( +(?P<interface>[\w\.\/\-\_]+[\w\:\.\%]+),?)?,?( +receive)?'
+                                  r'( +directly connected)?( +indirectly connected)?$')
         
         for line in out.splitlines():
             if line:
@@ -431,6 +431,10 @@ class ShowIpRoute(ShowIpRouteSchema):
                 updated = group.get('date', None)
                 nh_vrf = group.get('nh_vrf', None)
 
+                if pool:
+                    source_protocol_codes, next_hop, interface, updated, nh_vrf = \
+                        map(string_pool.intern, (source_protocol_codes, next_hop, interface, updated, nh_vrf))
+
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
                                         .setdefault('routes', {}).setdefault(route, {})
@@ -532,6 +536,10 @@ class ShowIpRoute(ShowIpRouteSchema):
                     #'vrf': 'vrf-blue:ipv6'
                     if m.groupdict()['nh_vrf']:
                         nh_vrf = m.groupdict()['nh_vrf']
+                    if pool:
+                        source_protocol_codes, next_hop, interface, updated, nh_vrf = \
+                            map(string_pool.intern, (source_protocol_codes, next_hop, interface, updated, nh_vrf))
+
                     route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                             .setdefault('address_family', {}).setdefault(af, {})\
                                             .setdefault('routes', {}).setdefault(route, {})
@@ -627,6 +635,10 @@ class ShowIpRoute(ShowIpRouteSchema):
                     if m.groupdict()['nh_vrf']:
                         nh_vrf = m.groupdict()['nh_vrf']
 
+                    if pool:
+                        source_protocol_codes, next_hop, interface, updated, nh_vrf = \
+                            map(string_pool.intern, (source_protocol_codes, next_hop, interface, updated, nh_vrf))
+
                     route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                             .setdefault('address_family', {}).setdefault(af, {})\
                                             .setdefault('routes', {}).setdefault(route, {})
@@ -683,6 +695,10 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if m.groupdict()['date']:
                     updated = m.groupdict()['date']
 
+                if pool:
+                    next_hop, interface, updated = \
+                        map(string_pool.intern, (next_hop, interface, updated))
+
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
                                         .setdefault('routes', {}).setdefault(route, {})
@@ -734,6 +750,10 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if m.groupdict()['date']:
                     updated = m.groupdict()['date']
 
+                if pool:
+                    next_hop, interface, updated = \
+                        map(string_pool.intern, (next_hop, interface, updated))
+
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
                                         .setdefault('routes', {}).setdefault(route, {})
@@ -784,6 +804,10 @@ class ShowIpRoute(ShowIpRouteSchema):
                     interface = m.groupdict()['interface']
 
                 index += 1
+                if pool:
+                    next_hop, vrf_val, interface = \
+                        map(string_pool.intern, (next_hop, vrf_val, interface))
+
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
                                         .setdefault('routes', {}).setdefault(route, {})
@@ -1026,25 +1050,25 @@ class ShowIpv6RouteUpdated(ShowIpv6RouteUpdatedSchema):
         result_dict = {}
         # IPv6 Routing Table - default - 23 entries
         # IPv6 Routing Table - VRF1 - 104 entries
-        p1 = re.compile(r'^\s*IPv6 +Routing +Table +\- +(?P<vrf>[\w]+) +\- +(?P<entries>[\d]+) +entries$')
+        p1 = regex_engine.compile(r'^\s*IPv6 +Routing +Table +\- +(?P<vrf>[\w]+) +\- +(?P<entries>[\d]+) +entries$')
 
         # LC  2001:1:1:1::1/128 [0/0]
-        p2 = re.compile(r'^\s*(?P<code>[\w]+) +(?P<route>[\w\/\:]+)?'
-                        r' +\[(?P<route_preference>[\d\/]+)\]$')
+        p2 = regex_engine.compile(r'^\s*(?P<code>[\w]+) +(?P<route>[\w\/\:]+)?'
+                                  r' +\[(?P<route_preference>[\d\/]+)\]$')
 
         #   via Loopback0, receive
         #   via 2001:10:1:2::2, GigabitEthernet0/0
         #   via GigabitEthernet0/2, directly connected
         #   via 192.168.51.1%default, indirectly connected
-        p3 = re.compile(r'^\s*via( +(?P<next_hop>[0-9][\w\:\.\%]+),?)?'
-                        r'( +(?P<interface>[\w\.\/\-\_]+[\w\:\.\%]+))?,?( +receive)?( +directly connected)?( +indirectly connected)?$')
+        p3 = regex_engine.compile(r'^\s*via( +(?P<next_hop>[0-9][\w\:\.\%]+),?)?'
+                                  r'( +(?P<interface>[\w\.\/\-\_]+[\w\:\.\%]+))?,?( +receive)?( +directly connected)?( +indirectly connected)?$')
 
         #   via FE80::211:1FF:FE00:1, GigabitEthernet0/0/2.100
-        p4 = re.compile(r'^\s*via +(?P<next_hop>[\w\:\.\%]+),'
-                        r' +(?P<interface>[\S]+)$')
+        p4 = regex_engine.compile(r'^\s*via +(?P<next_hop>[\w\:\.\%]+),'
+                                  r' +(?P<interface>[\S]+)$')
 
         #      Last updated 14:15:23 06 December 2017
-        p5 = re.compile(r'^\s*Last +updated +(?P<last_updated>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^\s*Last +updated +(?P<last_updated>[\S\s]+)$')
 
         for line in out.splitlines():
             if line:
@@ -1392,90 +1416,90 @@ class ShowIpRouteWord(ShowIpRouteWordSchema):
         # Routing entry for 10.151.0.0/24, 1 known subnets
         # Routing entry for 0.0.0.0/0, supernet
         # Routing entry for 192.168.154.0/24
-        p1 = re.compile(r'^Routing +entry +for +(?P<entry>(?P<ip>[\w\:\.]+)'
-                        r'\/(?P<mask>\d+))(?:, +(?P<net>[\w\s]+))?$')
+        p1 = regex_engine.compile(r'^Routing +entry +for +(?P<entry>(?P<ip>[\w\:\.]+)'
+                                  r'\/(?P<mask>\d+))(?:, +(?P<net>[\w\s]+))?$')
 
         # Known via "connected", distance 0, metric 0 (connected)
         # Known via "eigrp 1", distance 130, metric 10880, type internal
         # Known via "bgp 65161", distance 20, metric 0, candidate default path
         # Known via "bgp 100.1", distance 20, metric 0, candidate default path
-        p2 = re.compile(r'^Known +via +\"(?P<known_via>[\w\s\.]+)\", '
-                        r'+distance +(?P<distance>\d+), +metric '
-                        r'+(?P<metric>\d+),? *(?:\S+ (?P<type>[\w\- '
-                        r']+))?,? *.*$')
+        p2 = regex_engine.compile(r'^Known +via +\"(?P<known_via>[\w\s\.]+)\", '
+                                  r'+distance +(?P<distance>\d+), +metric '
+                                  r'+(?P<metric>\d+),? *(?:\S+ (?P<type>[\w\- '
+                                  r']+))?,? *.*$')
 
         # Redistributing via rip
         # Redistributing via eigrp 1
-        p3 = re.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
-                        r'(?P<redist_via_tag>\d+)?$')
+        p3 = regex_engine.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
+                                  r'(?P<redist_via_tag>\d+)?$')
 
         # Last update from 192.168.151.2 on Vlan101, 2w3d ago
         # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
         # Last update from 10.101.146.10 2d07h ago
         # Last update from 192.168.0.3 on GigabitEthernet2, 00:00:14 ago
-        p4 = re.compile(r'^Last +update +from +(?P<from>[\w\.]+) +(?:on '
-                        r'+(?P<interface>[\w\.\/\-]+), )?(?P<age>[ '
-                        r'\w\.\:]+) +ago$')
+        p4 = regex_engine.compile(r'^Last +update +from +(?P<from>[\w\.]+) +(?:on '
+                                  r'+(?P<interface>[\w\.\/\-]+), )?(?P<age>[ '
+                                  r'\w\.\:]+) +ago$')
 
         # 0.0.0.0, from 0.0.0.0, 00:00:00 ago, via GigabitEthernet0/0/0, prefer-non-rib-labels, merge-labels
         # 0.0.0.0, from 0.0.0.0, 00:00:00 ago, via GigabitEthernet0/0/0, merge-labels
         # 0.0.0.0, from 0.0.0.0, 00:00:00 ago, via GigabitEthernet0/0/0
         # * 10.101.146.10, from 10.101.146.10, 2d07h ago
         # * 10.255.207.129
-        p5 = re.compile(r'^(?:\* +)?(?P<nexthop>[\w\.]+)(?:, +from +(?P<from>[\w\.]+)?, +'
-                        r'(?P<age>[\w\.\:]+) +ago(?:, +via +(?P<interface>\S+))?(?:, +'
-                        r'(?P<rib_labels>prefer-non-rib-labels))?(:?, +(?P<merge_labels>merge-labels))?)?$')
+        p5 = regex_engine.compile(r'^(?:\* +)?(?P<nexthop>[\w\.]+)(?:, +from +(?P<from>[\w\.]+)?, +'
+                                  r'(?P<age>[\w\.\:]+) +ago(?:, +via +(?P<interface>\S+))?(?:, +'
+                                  r'(?P<rib_labels>prefer-non-rib-labels))?(:?, +(?P<merge_labels>merge-labels))?)?$')
 
         # * directly connected, via GigabitEthernet1.120
         # directly connected via LISP0
-        p5_1 = re.compile(r'^\*? *directly +connected,? via +(?P<interface>\S+)$')
+        p5_1 = regex_engine.compile(r'^\*? *directly +connected,? via +(?P<interface>\S+)$')
 
         # Route metric is 10880, traffic share count is 1
-        p6 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                        r'traffic +share +count +is +(?P<share_count>\d+)$')
+        p6 = regex_engine.compile(r'^Route +metric +is +(?P<metric>\d+), +'
+                                  r'traffic +share +count +is +(?P<share_count>\d+)$')
 
         # ipv6 specific
-        p7 = re.compile(r'^Route +count +is +(?P<route_count>[\d\/]+), +'
-                        r'share +count +(?P<share_count>[\d\/]+)$')
+        p7 = regex_engine.compile(r'^Route +count +is +(?P<route_count>[\d\/]+), +'
+                                  r'share +count +(?P<share_count>[\d\/]+)$')
 
         # FE80::EEBD:1DFF:FE09:56C2, Vlan202
         # FE80::EEBD:1DFF:FE09:56C2
-        p8 = re.compile(r'^(?P<fwd_ip>[\w\:]+)(, +(?P<fwd_intf>[\w\.\/\-]+)'
-                        r'( indirectly connected)?)?$')
+        p8 = regex_engine.compile(r'^(?P<fwd_ip>[\w\:]+)(, +(?P<fwd_intf>[\w\.\/\-]+)'
+                                  r'( indirectly connected)?)?$')
 
         # receive via Loopback4
-        p8_1 = re.compile(r'^receive +via +(?P<fwd_intf>[\w\.\/\-]+)$')
+        p8_1 = regex_engine.compile(r'^receive +via +(?P<fwd_intf>[\w\.\/\-]+)$')
 
         # Last updated 2w4d ago
-        p9 = re.compile(r'^Last +updated +(?P<age>[\w\:\.]+) +ago$')
+        p9 = regex_engine.compile(r'^Last +updated +(?P<age>[\w\:\.]+) +ago$')
 
         # From FE80::EEBD:1DFF:FE09:56C2
-        p10 = re.compile(r'^From +(?P<from>[\w\:]+)$')
+        p10 = regex_engine.compile(r'^From +(?P<from>[\w\:]+)$')
 
         # MPLS label: implicit-null
-        p11 = re.compile(r'^MPLS +label: +(?P<mpls_label>\S+)$')
+        p11 = regex_engine.compile(r'^MPLS +label: +(?P<mpls_label>\S+)$')
 
         # MPLS Flags: NSF
-        p12 = re.compile(r'^MPLS +Flags: +(?P<mpls_flags>\S+)$')
+        p12 = regex_engine.compile(r'^MPLS +Flags: +(?P<mpls_flags>\S+)$')
 
         # SR Incoming Label: 00000
-        p13 = re.compile(r'^SR +Incoming +Label: +(?P<sr_incoming_label>\d+)')
+        p13 = regex_engine.compile(r'^SR +Incoming +Label: +(?P<sr_incoming_label>\d+)')
 
         # Repair Path: 0.0.0.0, via GigabitEthernet0
-        p14 = re.compile(r'^Repair +Path: +(?P<path>[\d\.]+), +via +(?P<via>\w+)')
+        p14 = regex_engine.compile(r'^Repair +Path: +(?P<path>[\d\.]+), +via +(?P<via>\w+)')
 
         # Tag 65161, type external
         # Tag 2, type LISP destinations-summary
-        p15 = re.compile(r'^Tag (?P<tag_name>\S+), +type +(?P<tag_type>\w+ *[\d\-\w]*)$')
+        p15 = regex_engine.compile(r'^Tag (?P<tag_name>\S+), +type +(?P<tag_type>\w+ *[\d\-\w]*)$')
 
         # AS Hops 9
-        p16 = re.compile(r'^AS +Hops (?P<num_hops>\d+)$')
+        p16 = regex_engine.compile(r'^AS +Hops (?P<num_hops>\d+)$')
 
         # Route tag 65161
-        p17 = re.compile(r'^Route +tag (?P<route_tag>\S+)$')
+        p17 = regex_engine.compile(r'^Route +tag (?P<route_tag>\S+)$')
 
         # Advertised by eigrp 10 route-map GENIE_STATIC_INTO_EIGRP
-        p18 = re.compile(r'^Advertised +by +(?P<advertised_by>[\S ]+)$')
+        p18 = regex_engine.compile(r'^Advertised +by +(?P<advertised_by>[\S ]+)$')
 
         # initial variables
         ret_dict = {}
@@ -1833,12 +1857,12 @@ class ShowIpCef(ShowIpCefSchema):
         # 10.169.197.104/30
         # 2001:DB8:1:3::/64
         # 10.16.2.2/32, epoch 2, per-destination sharing
-        p1 = re.compile(r'^(?P<prefix>[\w\:\.]+[\/]+[\d]+)'
-                        r'(?:, +epoch +(?P<epoch>(\d+)))?'
-                        r'(?:, +(?P<sharing>(per-destination sharing)))?$')
+        p1 = regex_engine.compile(r'^(?P<prefix>[\w\:\.]+[\/]+[\d]+)'
+                                  r'(?:, +epoch +(?P<epoch>(\d+)))?'
+                                  r'(?:, +(?P<sharing>(per-destination sharing)))?$')
 
         # sr local label info: global/16002 [0x1B]
-        p1_1 = re.compile(r'^sr +local +label +info: +(?P<sr_local_label_info>(.*))$')
+        p1_1 = regex_engine.compile(r'^sr +local +label +info: +(?P<sr_local_label_info>(.*))$')
 
         #     nexthop 10.169.197.93 TenGigabitEthernet0/2/0 label 22-(local:2043)
         #     nexthop 10.1.2.2 GigabitEthernet2.100
@@ -1846,36 +1870,36 @@ class ShowIpCef(ShowIpCefSchema):
         #     nexthop 10.2.3.3 FastEthernet1/0/0 label 17 24
         #     nexthop 10.1.2.2 GigabitEthernet0/1/6 label 16063(elc)-(local:17063)
         #     nexthop 10.169.196.213 GigabitEthernet0/3/6 label 16051-(local:16051) 453955
-        p2 = re.compile(r'^nexthop +(?P<nexthop>\S+) +(?P<interface>\S+)'
-                        r'( +label +(?P<outgoing_label>[\w\-\ ]+)(\((?P<outgoing_label_info>\w+)\))?'
-                        r'(-\(local:(?P<local_label>\w+)\))?)?( +(?P<sid>\d+))?(-\(local:(?P<local_sid>\d+)\))?$')
+        p2 = regex_engine.compile(r'^nexthop +(?P<nexthop>\S+) +(?P<interface>\S+)'
+                                  r'( +label +(?P<outgoing_label>[\w\-\ ]+)(\((?P<outgoing_label_info>\w+)\))?'
+                                  r'(-\(local:(?P<local_label>\w+)\))?)?( +(?P<sid>\d+))?(-\(local:(?P<local_sid>\d+)\))?$')
 
         # nexthop 10.0.0.5 GigabitEthernet2 label [16002|16002]-(local:16002)
         # nexthop 10.0.0.9 GigabitEthernet3 label [16022|implicit-null]-(local:16022)
         # nexthop 10.0.0.10 GigabitEthernet3 label [16022|16002](elc)-(local:16022)
         # nexthop 10.169.196.213 GigabitEthernet0/1/6 label [16051|16051]-(local:16051) 64588
         # nexthop 10.169.196.213 GigabitEthernet0/3/6 label [16051|16051]-(local:16051) 453955-(local:223555)
-        p2_1 = re.compile(r'^nexthop +(?P<nexthop>\S+) +(?P<interface>\S+) +label +\[(?P<outgoing_label>[\S]+)\|'
-                          r'(?P<outgoing_label_backup>[\S]+)\](?:\((?P<outgoing_label_info>\w+)\))?'
-                          r'\-\(local\:(?P<local_label>(\d+))\)( +(?P<sid>\d+))?(-\(local:(?P<local_sid>\d+)\))?$')
+        p2_1 = regex_engine.compile(r'^nexthop +(?P<nexthop>\S+) +(?P<interface>\S+) +label +\[(?P<outgoing_label>[\S]+)\|'
+                                    r'(?P<outgoing_label_backup>[\S]+)\](?:\((?P<outgoing_label_info>\w+)\))?'
+                                    r'\-\(local\:(?P<local_label>(\d+))\)( +(?P<sid>\d+))?(-\(local:(?P<local_sid>\d+)\))?$')
 
         #     attached to GigabitEthernet3.100
-        p3 = re.compile(r'^(?P<nexthop>\w+) +(to|for) +(?P<interface>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<nexthop>\w+) +(to|for) +(?P<interface>\S+)$')
 
         #  no route
-        p4 = re.compile(r'^(?P<nexthop>[a-z\ ]+)$')
+        p4 = regex_engine.compile(r'^(?P<nexthop>[a-z\ ]+)$')
 
         # 10.1.2.255/32        receive              GigabitEthernet2.100
         # 10.1.3.0/24          10.1.2.1             GigabitEthernet2.100
         #                      10.2.3.3             GigabitEthernet3.100
         # ::/0, epoch 0, flags [cover, sc, defrt], RIB[S], refcnt 4, per-destination sharing
-        p5 = re.compile(r'^((?P<prefix>[\w\:\.]+[\/]+[\d]+) +)?(?P<nexthop>[\w\.]+)( +(?P<interface>[^a-z][\S]+))?$')
+        p5 = regex_engine.compile(r'^((?P<prefix>[\w\:\.]+[\/]+[\d]+) +)?(?P<nexthop>[\w\.]+)( +(?P<interface>[^a-z][\S]+))?$')
 
         # repair: attached-nexthop 10.0.0.9 GigabitEthernet3
-        p6 = re.compile(r'^repair: +(?P<repair>(.*))$')
+        p6 = regex_engine.compile(r'^repair: +(?P<repair>(.*))$')
 
         # 0.0.0.0/0, epoch 3, flags [default route handler, default route]
-        p7 = re.compile(r'(?P<prefix>\S+)\,\s*epoch\s*(?P<epoch>\d+)\,\s*flags\s*\[(?P<flags>[\w\s\,]+)\]')
+        p7 = regex_engine.compile(r'(?P<prefix>\S+)\,\s*epoch\s*(?P<epoch>\d+)\,\s*flags\s*\[(?P<flags>[\w\s\,]+)\]')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2171,13 +2195,13 @@ class ShowIpRouteSummary(ShowIpRouteSummarySchema):
         # IP routing table name is default (0x0)
         # IP routing table name is VRF-1 (0x27)
         # IP routing table name is Default-IP-Routing-Table(0)
-        p1 = re.compile(r'^IP +routing +table +name +is +(?P<vrf>\S+) *\((?P<vrf_id>\w+)\)$')
+        p1 = regex_engine.compile(r'^IP +routing +table +name +is +(?P<vrf>\S+) *\((?P<vrf_id>\w+)\)$')
         # IP routing table maximum-paths is 32
-        p2 = re.compile(r'^IP +routing +table +maximum-paths +is +(?P<max_path>[\d]+)$')
+        p2 = regex_engine.compile(r'^IP +routing +table +maximum-paths +is +(?P<max_path>[\d]+)$')
 
         # Route Source Networks Subnets Replicates Overhead Memory (bytes)
         # Route Source Networks Subnets Overhead Memory (bytes)
-        p3_0 = re.compile(
+        p3_0 = regex_engine.compile(
             r'^(?P<replicates>(Route +Source +Networks +Subnets +Replicates +Overhead +Memory +\(bytes\)))|'
             r'(?P<no_replicates>(Route +Source +Networks +Subnets +Overhead +Memory +\(bytes\)))$'
         )
@@ -2187,35 +2211,35 @@ class ShowIpRouteSummary(ShowIpRouteSummarySchema):
         # static 0 0 0 0 0
         # eigrp 120 0 54 0 4320 9504
         # ospf 100 0 0 0 0 0
-        p3 = re.compile(r'^(?P<protocol>\w+)\s(?P<instance>\w+)?\s+(?P<networks>\d+)\s+(?P<subnets>\d+)?\s+'
-                        r'(?P<replicates>\d+)?\s+(?P<overhead>\d+)?\s+(?P<memory_bytes>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<protocol>\w+)\s(?P<instance>\w+)?\s+(?P<networks>\d+)\s+(?P<subnets>\d+)?\s+'
+                                  r'(?P<replicates>\d+)?\s+(?P<overhead>\d+)?\s+(?P<memory_bytes>\d+)$')
         
         # Route Source Networks Subnets Overhead Memory (bytes)
         # connected 2 43 9260 6480
         # static 6 58 19508 9216
         # eigrp 1 0 0 0 0
         # ospf 100 101 4344 352008 642124
-        p3_1 = re.compile(r'^(?P<protocol>\w+) +(?P<instance>\w+)*? *(?P<networks>\d+) '
-                          r'+(?P<subnets>\d+)? +(?P<overhead>\d+)? +(?P<memory_bytes>\d+)$')
+        p3_1 = regex_engine.compile(r'^(?P<protocol>\w+) +(?P<instance>\w+)*? *(?P<networks>\d+) '
+                                    r'+(?P<subnets>\d+)? +(?P<overhead>\d+)? +(?P<memory_bytes>\d+)$')
         
         # Intra-area: 1 Inter-area: 0 External-1: 0 External-2: 0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Intra-area: +(?P<intra_area>\d+) +Inter-area: +(?P<inter_area>\d+) '
             r'+External-1: +(?P<external_1>\d+) +External-2: +(?P<external_2>\d+)$')
         #   NSSA External-1: 0 NSSA External-2: 0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^NSSA +External-1: +(?P<nssa_external_1>\d+) +NSSA +External-2: +('
             r'?P<nssa_external_2>\d+)$')
         #   Level 1: 1 Level 2: 0 Inter-area: 0
-        p9_1 = re.compile(
+        p9_1 = regex_engine.compile(
             r'^Level +1: +(?P<level_1>\d+) +Level +2: +(?P<level_2>\d+) +Inter-area: +('
             r'?P<inter_area>\d+)$')
         #   External: 0 Internal: 0 Local: 0
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r'^External: +(?P<external>\d+) +Internal: +(?P<internal>\d+) +Local: +(?P<local>\d+)$')
 
         # Removing Queue Size 0
-        p14 = re.compile(r'^Removing +Queue +Size +(?P<q_size>\d+)')
+        p14 = regex_engine.compile(r'^Removing +Queue +Size +(?P<q_size>\d+)')
 
         ret_dict = {}
         replicates_flag = None
@@ -2591,113 +2615,113 @@ class ShowIpCefInternal(ShowIpCefInternalSchema):
 
         # 10.19.198.239/32, epoch 2, RIB[I], refcnt 7, per-destination sharing
         # 0.0.0.0/8, epoch 2, refcnt 6, per-destination sharing
-        p1 = re.compile(r'^(?P<prefix>[\w:.\/d]+), +epoch '
-                        r'+(?P<epoch>\d+),(?: +RIB(?P<rib>\S+),)? '
-                        r'+refcnt +(?P<refcnt>\d+), +(?P<sharing>\S+) sharing$')
+        p1 = regex_engine.compile(r'^(?P<prefix>[\w:.\/d]+), +epoch '
+                                  r'+(?P<epoch>\d+),(?: +RIB(?P<rib>\S+),)? '
+                                  r'+refcnt +(?P<refcnt>\d+), +(?P<sharing>\S+) sharing$')
 
         # 10.4.1.1/32, epoch 2, flags [att, cnn, rcv, local, SrcElgbl], RIB[C], refcnt 6, per-destination sharing
         # 10.4.1.1/32, epoch 2, flags [att, cnn, rcv, local, SrcElgbl], intf-rcv, RIB[C], refcnt 6, per-destination sharing
         # 0.0.0.0/0, epoch 2, flags [DefRtHndlr, defrt], refcnt 5, per-destination sharing
         # 10.19.198.239/32, epoch 2, RIB[I], refcnt 7, per-packet sharing
-        p1_1 = re.compile(r'^(?P<prefix>[\w:./d]+), +epoch +(?P<epoch>\d+), '
-                          r'+flags +\[(?P<flags>[a-zA-Z, ]+)\],(?:(?: +intf-rcv,)? '
-                          r'+RIB+(?P<rib>\S+),)? +refcnt +(?P<refcnt>\d+), '
-                          r'+(?P<sharing>\S+) sharing$')
+        p1_1 = regex_engine.compile(r'^(?P<prefix>[\w:./d]+), +epoch +(?P<epoch>\d+), '
+                                    r'+flags +\[(?P<flags>[a-zA-Z, ]+)\],(?:(?: +intf-rcv,)? '
+                                    r'+RIB+(?P<rib>\S+),)? +refcnt +(?P<refcnt>\d+), '
+                                    r'+(?P<sharing>\S+) sharing$')
 
         #   sources: RIB, RR, LTE
-        p2 = re.compile(r'^sources: +(?P<sources>[a-zA-Z, ]+)$')
+        p2 = regex_engine.compile(r'^sources: +(?P<sources>[a-zA-Z, ]+)$')
 
         # dflt local label info: global/28 [0x3]
         # sr local label info: global/16073 [0x1B]
-        p3 = re.compile(r'^(?P<local_label>dflt|sr) +local +label +info: +(?P<info>(.*))$')
+        p3 = regex_engine.compile(r'^(?P<local_label>dflt|sr) +local +label +info: +(?P<info>(.*))$')
 
         # path list 7F0FEC884768, 19 locks, per-destination, flags 0x4D [shble, hvsh, rif, hwcn]
-        p5 = re.compile(r'^path +list +(?P<path_list_id>[A-Z0-9]+), '
-                        r'+(?P<locks>\d+) +locks, +(?P<sharing>per-destination),'
-                        r' +flags +(?P<flags>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^path +list +(?P<path_list_id>[A-Z0-9]+), '
+                                  r'+(?P<locks>\d+) +locks, +(?P<sharing>per-destination),'
+                                  r' +flags +(?P<flags>[\S\s]+)$')
 
         # path 7F0FF11E0AE0, share 1/1, type attached nexthop, for IPv4, flags [has-rpr]
-        p6 = re.compile(r'path +(?P<path_id>[A-Z0-9]+), share +(?P<share>\S+), +type '
-                        r'+(?P<type>[\w\s]+), +for +(?P<for>[\w\d\-\s]+)(?:, flags +(?P<flags>\S+))?')
+        p6 = regex_engine.compile(r'path +(?P<path_id>[A-Z0-9]+), share +(?P<share>\S+), +type '
+                                  r'+(?P<type>[\w\s]+), +for +(?P<for>[\w\d\-\s]+)(?:, flags +(?P<flags>\S+))?')
 
         # nexthop 10.169.196.213 GigabitEthernet0/1/6 label [51885|16073]-(local:28), IP adj out of GigabitEthernet0/1/6, addr 10.169.196.213 7F0FF08D4900
-        p7 = re.compile(r'^nexthop +(?P<nexthop>\S+) +(?P<interface>\S+) +label '
-                        r'+\[(?P<outgoing_label>[\S]+)\|(?P<outgoing_label_backup>[\S]+)\]'
-                        r'(?:\((?P<outgoing_label_info>\w+)\))?\-\(local\:(?P<local_label>(\d+))\)'
-                        r'(?:, +(?P<ip_adj>IP adj) +out +of +(?P<interface2>\S+), +addr +(?P<addr>\S+) '
-                        r'+(?P<addr_info>\S+))?(.*)$')
+        p7 = regex_engine.compile(r'^nexthop +(?P<nexthop>\S+) +(?P<interface>\S+) +label '
+                                  r'+\[(?P<outgoing_label>[\S]+)\|(?P<outgoing_label_backup>[\S]+)\]'
+                                  r'(?:\((?P<outgoing_label_info>\w+)\))?\-\(local\:(?P<local_label>(\d+))\)'
+                                  r'(?:, +(?P<ip_adj>IP adj) +out +of +(?P<interface2>\S+), +addr +(?P<addr>\S+) '
+                                  r'+(?P<addr_info>\S+))?(.*)$')
 
         # nexthop 10.169.14.241 MPLS-SR-Tunnel1 label 16073-(local:16073), repair, IP midchain out of MPLS-SR-Tunnel1 7F0FF0AFAE98
-        p7_1 = re.compile(r'^nexthop +(?P<nexthop>\S+) +(?P<interface>\S+)'
-                          r'( +label +(?P<outgoing_label>[\w\-\ ]+)(\((?P<outgoing_label_info>\w+)\))?'
-                          r'(-\(local:(?P<local_label>\w+)\))?)?,.*$')
+        p7_1 = regex_engine.compile(r'^nexthop +(?P<nexthop>\S+) +(?P<interface>\S+)'
+                                    r'( +label +(?P<outgoing_label>[\w\-\ ]+)(\((?P<outgoing_label_info>\w+)\))?'
+                                    r'(-\(local:(?P<local_label>\w+)\))?)?,.*$')
 
         # FRR Primary (0x80007F0FF094DD88)
-        p8_0 = re.compile(r'^FRR +Primary +\((?P<info>\S+)\)$')
+        p8_0 = regex_engine.compile(r'^FRR +Primary +\((?P<info>\S+)\)$')
 
         # TAG midchain out of Tunnel65537 7F4F881C0718
-        p8_1 = re.compile(r'^TAG +midchain +out +of +(?P<tunnel>[a-zA-Z\d]+) +(?P<info>[A-Z\d]+)$')
+        p8_1 = regex_engine.compile(r'^TAG +midchain +out +of +(?P<tunnel>[a-zA-Z\d]+) +(?P<info>[A-Z\d]+)$')
 
         # TAG adj out of GigabitEthernet0/1/7, addr 10.19.198.29 7F9C9D304A90
-        p8_2 = re.compile(r'^TAG +adj +out +of +(?P<interface>\S+), +addr '
-                          r'+(?P<addr>\S+)(?: +(?P<addr_info>[A-Z\d]+))?$')
+        p8_2 = regex_engine.compile(r'^TAG +adj +out +of +(?P<interface>\S+), +addr '
+                                    r'+(?P<addr>\S+)(?: +(?P<addr_info>[A-Z\d]+))?$')
 
         # <primary: TAG adj out of GigabitEthernet0/1/6, addr 10.169.196.213 7F0FF08D46D0>
         # <primary: TAG adj out of GigabitEthernet0/1/6, addr 10.19.198.25>
-        p8 = re.compile(r'^<primary: +TAG +adj +out +of +(?P<interface>\S+), '
-                        r'addr +(?P<addr>[\d.]+)(?: +(?P<addr_info>[A-Z\d]+))?>$')
+        p8 = regex_engine.compile(r'^<primary: +TAG +adj +out +of +(?P<interface>\S+), '
+                                  r'addr +(?P<addr>[\d.]+)(?: +(?P<addr_info>[A-Z\d]+))?>$')
 
         # TAG adj out of GigabitEthernet0/1/7, addr 10.169.196.217 7F0FF0AFB2F8>
         # <repair:  TAG adj out of GigabitEthernet0/1/7, addr 10.19.198.29 7F2B21B24148>
-        p9 = re.compile(r'^(?:<repair: +)?TAG +adj +out +of +(?P<interface>[a-zA-Z\d\/]+), '
-                        r'+addr +(?P<addr>[\d.]+) +(?P<addr_info>[A-Z\d]+)>$')
+        p9 = regex_engine.compile(r'^(?:<repair: +)?TAG +adj +out +of +(?P<interface>[a-zA-Z\d\/]+), '
+                                  r'+addr +(?P<addr>[\d.]+) +(?P<addr_info>[A-Z\d]+)>$')
 
         # <repair:  TAG midchain out of MPLS-SR-Tunnel1 7F0FF0AFAC68
-        p9_1 = re.compile(r'^<repair: +TAG +midchain +out +of '
-                          r'+(?P<interface>[a-zA-Z\d\/-]+) +(?P<addr_info>[A-Z\d]+)$')
+        p9_1 = regex_engine.compile(r'^<repair: +TAG +midchain +out +of '
+                                    r'+(?P<interface>[a-zA-Z\d\/-]+) +(?P<addr_info>[A-Z\d]+)$')
 
         # label 98
         # label implicit-null
         # label [16073|16073]
         # label [51885|16073]-(local:28)
         # label none
-        p10 = re.compile(r'^label +(?P<label>.*)$')
+        p10 = regex_engine.compile(r'^label +(?P<label>.*)$')
 
         # <repair:  label 16061
-        p11 = re.compile(r'<repair: +label +(?P<label>.*)')
+        p11 = regex_engine.compile(r'<repair: +label +(?P<label>.*)')
 
         # IPRM: 0x00018000
-        p12 = re.compile(r'^IPRM: +(?P<iprm>\S+)$')
+        p12 = regex_engine.compile(r'^IPRM: +(?P<iprm>\S+)$')
 
         # Broker: linked, distributed at 2nd priority
-        p13 = re.compile(r'^Broker: +(?P<status>\w+), +distributed +at '
-                         r'+(?P<priority>\d+).* +priority$')
+        p13 = regex_engine.compile(r'^Broker: +(?P<status>\w+), +distributed +at '
+                                   r'+(?P<priority>\d+).* +priority$')
 
         # LFD: 10.13.110.0/24 0 local labels
-        p14 = re.compile(r'^LFD: +(?P<address>\S+) +(?P<labels>\d+) +local +labels$')
+        p14 = regex_engine.compile(r'^LFD: +(?P<address>\S+) +(?P<labels>\d+) +local +labels$')
 
         # dflt disposition chain 0x7F0FF19606C0
         # sr disposition chain 0x7F0FF1960590
         # dflt label switch chain 0x7F0FF19606C0
         # sr label switch chain 0x7F0FF1960590
-        p15 = re.compile(r'^(?P<type>dflt|sr) +(?P<chain_type>label '
-                         r'+switch|disposition) +chain +(?P<id>\S+)$')
+        p15 = regex_engine.compile(r'^(?P<type>dflt|sr) +(?P<chain_type>label '
+                                   r'+switch|disposition) +chain +(?P<id>\S+)$')
 
         # GigabitEthernet0/1/6(15): 10.169.196.213
         # MPLS-SR-Tunnel1(29)
-        p16 = re.compile(r'^(?P<interface>[\w\/-]+)\((?P<ifnum>\d+)\)'
-                         r'(?:\: +(?P<addr>[\d.]+))?$')
+        p16 = regex_engine.compile(r'^(?P<interface>[\w\/-]+)\((?P<ifnum>\d+)\)'
+                                   r'(?:\: +(?P<addr>[\d.]+))?$')
 
         # 1 RR source [non-eos indirection, heavily shared]
-        p17 = re.compile(r'^(?P<counts>\d+) +RR +source +\[(?P<rr_source>[\s\S]+)\]$')
+        p17 = regex_engine.compile(r'^(?P<counts>\d+) +RR +source +\[(?P<rr_source>[\s\S]+)\]$')
 
         # non-eos chain loadinfo 7F0FF16E6F38, per-session, flags 0111, 8 locks
-        p18 = re.compile(r'^non-eos +chain +loadinfo +(?P<non_eos_chain_loadinfo>\S+),'
-                         r' +(?P<per_session>per-session), +flags +(?P<flags>\S+), '
-                         r'+(?P<locks>\d+) +locks$')
+        p18 = regex_engine.compile(r'^non-eos +chain +loadinfo +(?P<non_eos_chain_loadinfo>\S+),'
+                                   r' +(?P<per_session>per-session), +flags +(?P<flags>\S+), '
+                                   r'+(?P<locks>\d+) +locks$')
 
         #  SC owned,sourced: LISP generalised SMR - [disabled, not inheriting, 0x7F0119709CF0 locks: 1]
-        p19 = re.compile(r'^.+LISP generalised SMR - \[(?P<smr_enabled>enabled|disabled)\, .+]')
+        p19 = regex_engine.compile(r'^.+LISP generalised SMR - \[(?P<smr_enabled>enabled|disabled)\, .+]')
 
         label_list = []
         label_list2 = []
@@ -3221,49 +3245,49 @@ class ShowIpv6RouteSummary(ShowIpv6RouteSummarySchema):
             out = output
 
         # IPv6 routing table name is default(0) global scope - 526 entries
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^IPv6\s+routing\s+table\s+name\s+is\s+(?P<vrf>\S+) *\((?P<vrf_id>\w+)\)\sglobal\sscope\s\-\s(?P<total_entries>\d+)\sentries$')
         # IPv6 routing table default maximum-paths is 16
-        p2 = re.compile(r'^IPv6\s+routing\s+table\s+default\s+maximum-paths\s+is\s+(?P<max_path>[\d]+)$')
+        p2 = regex_engine.compile(r'^IPv6\s+routing\s+table\s+default\s+maximum-paths\s+is\s+(?P<max_path>[\d]+)$')
 
         # Route Source    Networks    Overhead    Memory (bytes)
-        p3 = re.compile(r'^(Route\s+Source\s+Networks\s+Overhead\s+Memory\s+\(bytes\))$')
+        p3 = regex_engine.compile(r'^(Route\s+Source\s+Networks\s+Overhead\s+Memory\s+\(bytes\))$')
 
         # Route Source    Networks    Overhead    Memory (bytes)
         # connected       7           1344        1512
         # local           8           1536        1728
         # ND              0           0           0
         # ospf 200        500         96000       108000
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^(?P<protocol>\w+)\s(?P<instance>\d+|\w+)?\s+(?P<networks>\d+)\s+(?P<overhead>\d+)\s+(?P<memory_bytes>\d+)$')
 
         # Default: 0  Prefix: 0  Destination: 0  Redirect: 0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Default:\s+(?P<default>\d+)\s+Prefix\:\s+(?P<prefix>\d+)\s+Destination\:\s+(?P<destination>\d+)\s+Redirect\:\s+(?P<redirect>\d+)$')
 
         # Intra-area: 1 Inter-area: 0 External-1: 0 External-2: 0
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Intra-area:\s+(?P<intra_area>\d+)\s+Inter-area:\s+(?P<inter_area>\d+) '
             r'+External-1:\s+(?P<external_1>\d+)\s+External-2:\s+(?P<external_2>\d+)$')
 
         # NSSA External 1: 0 NSSA External 2: 0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^NSSA\sExternal\s1\:\s+(?P<nssa_external_1>\d+)\s+NSSA\sExternal\s2\:\s+('
             r'?P<nssa_external_2>\d+)$')
 
         # Level 1: 1 Level 2: 0 Inter-area: 0
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Level\s1\:\s+(?P<level_1>\d+)\s+Level\s2:\s+(?P<level_2>\d+)\s+Inter\-area:\s+('
             r'?P<inter_area>\d+)$')
 
         # Internal: 0  External: 0  Local: 0
-        p9 = re.compile(r'^Internal:\s+(?P<external>\d+)\s+External:\s+(?P<internal>\d+)\s+Local:\s+(?P<local>\d+)$')
+        p9 = regex_engine.compile(r'^Internal:\s+(?P<external>\d+)\s+External:\s+(?P<internal>\d+)\s+Local:\s+(?P<local>\d+)$')
 
         # Static: 0  Per-user static: 0
-        p10 = re.compile(r'^Static\:\s+(?P<static>\d+)\s+Per\-user\s+static\:\s+(?P<per_user_static>\d+)$')
+        p10 = regex_engine.compile(r'^Static\:\s+(?P<static>\d+)\s+Per\-user\s+static\:\s+(?P<per_user_static>\d+)$')
 
         # /8: 1, /64: 8, /128: 517
-        p11 = re.compile(r'(?P<prefix>\/\d+):\s+(?P<count>\d+)\,?\s?')
+        p11 = regex_engine.compile(r'(?P<prefix>\/\d+):\s+(?P<count>\d+)\,?\s?')
 
         ret_dict = {}
 
@@ -3428,7 +3452,7 @@ class ShowRibClient(ShowRibClientSchema):
 
 
         # NAT_ROUTE              1          0      0   
-        p1 = re.compile(r'^(?P<client_name>[\S ]+)\b +(?P<handle>\d+) +(?P<walkQ>\d+) +(?P<walkQbyOwner>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<client_name>[\S ]+)\b +(?P<handle>\d+) +(?P<walkQ>\d+) +(?P<walkQbyOwner>\d+)$')
         
         
         ret_dict = {}
@@ -3490,12 +3514,12 @@ class ShowBannerMotd(ShowBannerMotdSchema):
         # There is no expectation of privacy while using this system.
         # ============================================================
         # '''
-        p1 = re.compile(r'[^a-zA-Z0-9.\s]')
+        p1 = regex_engine.compile(r'[^a-zA-Z0-9.\s]')
 
         for line in output.splitlines():
             line = line.strip()
             
-            m = re.sub(p1,'', line)
+            m = p1.sub('', line)
             if m != ' ':
                 strng = strng+m+' '
                 ret_dict['banner_motd'] = strng.strip()
@@ -7,13 +7,13 @@ IOSXE parsers for the following show commands:
     * show ipv6 rpf <mroute address>
     * show ipv6 rpf vrf <WORD> <mroute address>
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================================
 # Parser for 'show ip rpf <mroute address>'
@@ -84,66 +84,66 @@ class ShowIpRpf(ShowIpRpfSchema):
 
         # RPF information for 2001:99:99::99
         # RPF information for sj-eng-mbone.cisco.com
-        p1 = re.compile(r'^RPF +information +for +(?P<mroute>[\S]+)$')
+        p1 = regex_engine.compile(r'^RPF +information +for +(?P<mroute>[\S]+)$')
 
         # RPF information for host1 (172.16.10.13)
         # RPF information for ? (10.1.1.100)
         # RPF information for sj-eng-mbone.cisco.com (172.16.25.13)
         # RPF information for ? (192.168.16.226) MoFRR Enabled
-        p1_1 = re.compile(r'^RPF +information +for +(?P<host>[\S]+) +'
-                          r'\((?P<mroute>[\w\:\.]+)\)( +MoFRR +(?P<mofrr>[\w]+))?$')
+        p1_1 = regex_engine.compile(r'^RPF +information +for +(?P<host>[\S]+) +'
+                                    r'\((?P<mroute>[\w\:\.]+)\)( +MoFRR +(?P<mofrr>[\w]+))?$')
 
         # RPF interface: BRI0
         # RPF interface:GigabitEthernet3/2/0
-        p2 = re.compile(r'^RPF +interface: *(?P<intf>[\S]+)$')
+        p2 = regex_engine.compile(r'^RPF +interface: *(?P<intf>[\S]+)$')
 
         # RPF neighbor: 2001:99:99::99
         # RPF neighbor: eng-isdn-pri3.cisco.com
         # RPF neighbor:FE80::40:1:3
-        p3 = re.compile(r'^RPF +neighbor: *(?P<neighbor>[\S]+)$')
+        p3 = regex_engine.compile(r'^RPF +neighbor: *(?P<neighbor>[\S]+)$')
 
         # RPF neighbor: sj1.cisco.com (172.16.121.10)
         # RPF neighbor: eng-isdn-pri3.cisco.com (172.16.16.10)
         # RPF neighbor: ? (10.1.101.4) - directly connected
-        p3_1 = re.compile(r'^RPF +neighbor: +(?P<host>[\S]+) +'
-                          r'\((?P<neighbor>[\w\.\:]+)\)( - (?P<directly_connected>directly connected))?$')
+        p3_1 = regex_engine.compile(r'^RPF +neighbor: +(?P<host>[\S]+) +'
+                                    r'\((?P<neighbor>[\w\.\:]+)\)( - (?P<directly_connected>directly connected))?$')
 
         # RPF route/mask: 10.1.1.0/24
         # RPF route/mask: 172.16.0.0/255.255.0.0
         # RPF route/mask:2001:db8:400::/64
-        p4 = re.compile(r'^RPF +route\/mask:'
-                        r' *(?P<route>[\w\/\:\.]+)\/(?P<mask>[\d\:\.]+)$')
+        p4 = regex_engine.compile(r'^RPF +route\/mask:'
+                                  r' *(?P<route>[\w\/\:\.]+)\/(?P<mask>[\d\:\.]+)$')
 
         # RPF type: Mroute
         # RPF type: unicast (rip)
         # RPF type: unicast (ospf 2)
         # RPF type:Unicast
         # RPF type: unicast ()
-        p5 = re.compile(r'^RPF +type: *(?P<type>\w+)'
-                        r'( *\((?P<table_feature>\w+)?( *(?P<inst>\d+))?\))?$')
+        p5 = regex_engine.compile(r'^RPF +type: *(?P<type>\w+)'
+                                  r'( *\((?P<table_feature>\w+)?( *(?P<inst>\d+))?\))?$')
 
         # RPF recursion count: 0
         # RPF recursion count:0
-        p6 = re.compile(r'^RPF +recursion +count:'
-                        r' *(?P<count>\d+)$')
+        p6 = regex_engine.compile(r'^RPF +recursion +count:'
+                                  r' *(?P<count>\d+)$')
 
         # Metric preference: 128
         # Metric preference:110
-        p7 = re.compile(r'^Metric +preference: *(?P<preference>\d+)$')
+        p7 = regex_engine.compile(r'^Metric +preference: *(?P<preference>\d+)$')
 
         # Metric: 0
         # Metric:30
-        p8 = re.compile(r'^Metric: *(?P<metric>\d+)$')
+        p8 = regex_engine.compile(r'^Metric: *(?P<metric>\d+)$')
 
         # Doing distance-preferred lookups across tables
-        p9 = re.compile(r'^Doing +distance\-preferred +lookups +across +tables$')
+        p9 = regex_engine.compile(r'^Doing +distance\-preferred +lookups +across +tables$')
 
         # Using Group Based VRF Select, RPF VRF: blue
-        p10 = re.compile(r'^Using +Group +Based +VRF +Select, +RPF +VRF: +(?P<vrf>\S+)$')
+        p10 = regex_engine.compile(r'^Using +Group +Based +VRF +Select, +RPF +VRF: +(?P<vrf>\S+)$')
 
         # RPF topology: ipv4 multicast base, originated from ipv4 unicast base
-        p11 = re.compile(r'^RPF +topology: +(?P<lookup_topology>[\w\s]+)'
-                         r'(, +originated +from +(?P<originated_topology>[\w\s]+))?$')
+        p11 = regex_engine.compile(r'^RPF +topology: +(?P<lookup_topology>[\w\s]+)'
+                                   r'(, +originated +from +(?P<originated_topology>[\w\s]+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -11,15 +11,13 @@ IOSXE parsers for the following show commands:
     * 'show running-config all | section class {class_map}'
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, ListOf, \
                                                Optional, And, Default, Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =================================================
@@ -88,49 +86,49 @@ class ShowRunPolicyMap(ShowRunPolicyMapSchema):
         # police cir 400000 conform-action transmit  exceed-action drop
         # police cir 100000 pir  70000 conform-action transmit  exceed-action drop
         # police cir 8000000 bc 4000 be 1000 conform-action transmit  exceed-action transmit  violate-action drop
-        p1 = re.compile(r'^police +cir +(?P<cir_bps>(\d+))( +pir +(?P<pir_bps>(\d+)))?'
+        p1 = regex_engine.compile(r'^police +cir +(?P<cir_bps>(\d+))( +pir +(?P<pir_bps>(\d+)))?'
             r'( +bc +(?P<cir_bc_bytes>(\d+)))?( +be +(?P<cir_be_bytes>(\d+)))?'
             r' +conform-action +(?P<conformed>(\w+)) +exceed-action +(?P<exceeded>(\w+))'
             r'( +violate-action +(?P<violated>(\w+)))?$')
 
         # policy-map L3VPN-out_child
         # policy-map type queueing child
-        p1_1 = re.compile(r'^policy-map(\s+type\s+queueing\s+|\s+)(?P<policy_map>([\w\-\_]+))$')
+        p1_1 = regex_engine.compile(r'^policy-map(\s+type\s+queueing\s+|\s+)(?P<policy_map>([\w\-\_]+))$')
 
         # class ARP_in
-        p1_2 = re.compile(r'^class +(?P<class_name>([\w\-\_]+))$')
+        p1_2 = regex_engine.compile(r'^class +(?P<class_name>([\w\-\_]+))$')
 
         # shape average 10000000
         # shape average 80000 320 0
-        p2 = re.compile(r'^shape +average +(?P<target_shape_rate>(\d+))$')
+        p2 = regex_engine.compile(r'^shape +average +(?P<target_shape_rate>(\d+))$')
 
         # set ip precedence 4
-        p3_1 = re.compile(r'^set +ip +precedence +(?P<ip_precedence>(\w+))$')
+        p3_1 = regex_engine.compile(r'^set +ip +precedence +(?P<ip_precedence>(\w+))$')
 
         # set precedence 5
-        p3_2 = re.compile(r'^set +precedence +(?P<precedence>(\w+))$')
+        p3_2 = regex_engine.compile(r'^set +precedence +(?P<precedence>(\w+))$')
 
         # set qos-group 4
-        p4 = re.compile(r'^set +qos-group +(?P<qos_group>(\w+))$')
+        p4 = regex_engine.compile(r'^set +qos-group +(?P<qos_group>(\w+))$')
 
         # bandwidth percent 25
-        p5 = re.compile(r'^bandwidth percent +(?P<bandwidth_percent>(\d+))$')
+        p5 = regex_engine.compile(r'^bandwidth percent +(?P<bandwidth_percent>(\d+))$')
 
         # priority level 2
-        p6_1 = re.compile(r'^priority +level +(?P<priority_level>(\d+))$')
+        p6_1 = regex_engine.compile(r'^priority +level +(?P<priority_level>(\d+))$')
 
         # priority percent 20
-        p6_2 = re.compile(r'^priority +percent +(?P<priority_percent>(\d+))$')
+        p6_2 = regex_engine.compile(r'^priority +percent +(?P<priority_percent>(\d+))$')
 
         # service-policy input L3VPN-0_in
-        p7 = re.compile(r'^service-policy( +(?P<direction>(\w+)))? +(?P<service_policy>([\w\-\_]+))$')
+        p7 = regex_engine.compile(r'^service-policy( +(?P<direction>(\w+)))? +(?P<service_policy>([\w\-\_]+))$')
 
         # set dscp ef
         # set dscp 46
-        p8 = re.compile(r'^set +dscp +(?P<dscp>(\w+))$')
+        p8 = regex_engine.compile(r'^set +dscp +(?P<dscp>(\w+))$')
 
         # set cos 0
-        p9 = re.compile(r'^set +cos +(?P<cos>(\d+))$')
+        p9 = regex_engine.compile(r'^set +cos +(?P<cos>(\d+))$')
 
         for line in out.splitlines():
 
@@ -498,357 +496,357 @@ class ShowRunInterface(ShowRunInterfaceSchema):
         config_dict = {}
 
         # interface GigabitEthernet0
-        p1 = re.compile(r'^interface +(?P<interface>[\S]+)$')
+        p1 = regex_engine.compile(r'^interface +(?P<interface>[\S]+)$')
 
         # description "Boot lan interface"
         # description ISE Controlled Port
-        p2 = re.compile(r'^description +(?P<description>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^description +(?P<description>[\S\s]+)$')
 
         # vrf forwarding Mgmt-intf
         # ip vrf forwarding oam
-        p3 = re.compile(r'^(ip )?vrf +forwarding +(?P<vrf>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^(ip )?vrf +forwarding +(?P<vrf>[\S\s]+)$')
 
         # ip address 10.1.21.249 255.255.255.0
-        p4 = re.compile(r'^ip +address +(?P<ip>[\S]+) +(?P<netmask>[\S]+)$')
+        p4 = regex_engine.compile(r'^ip +address +(?P<ip>[\S]+) +(?P<netmask>[\S]+)$')
 
         # ipv6 address 2001:db8:4:1::1/64
         # ipv6 address 2001:db8:400:1::2/112
-        p5 = re.compile(r'^ipv6 address +(?P<ipv6>.+)$')
+        p5 = regex_engine.compile(r'^ipv6 address +(?P<ipv6>.+)$')
 
         # shutdown
-        p6 = re.compile(r'^(?P<shutdown>shutdown)$')
+        p6 = regex_engine.compile(r'^(?P<shutdown>shutdown)$')
 
         # encapsulation dot1Q 201
-        p7 = re.compile(r'^encapsulation +dot1Q +(?P<dot1q>[\d]+)$')
+        p7 = regex_engine.compile(r'^encapsulation +dot1Q +(?P<dot1q>[\d]+)$')
 
         # carrier-delay up 60
         # carrier-delay down 60
-        p8 = re.compile(r'^carrier-delay +(?P<carrier_delay>.+)$')
+        p8 = regex_engine.compile(r'^carrier-delay +(?P<carrier_delay>.+)$')
 
         # negotiation auto
         # no negotiation auto
-        p9 = re.compile(r'^(?P<negotiation>no +)?negotiation +auto$')
+        p9 = regex_engine.compile(r'^(?P<negotiation>no +)?negotiation +auto$')
 
         # cdp enable
-        p10 = re.compile(r'^cdp +(?P<cdp>enable)$')
+        p10 = regex_engine.compile(r'^cdp +(?P<cdp>enable)$')
 
         # no keepalive
-        p11 = re.compile(r'^(?P<keepalive>no +)?keepalive$')
+        p11 = regex_engine.compile(r'^(?P<keepalive>no +)?keepalive$')
 
         # switchport access vlan 70
-        p12 = re.compile(r'^switchport +access +vlan +(?P<vlan>[\d]+)$')
+        p12 = regex_engine.compile(r'^switchport +access +vlan +(?P<vlan>[\d]+)$')
 
         # switchport mode access
-        p13 = re.compile(r'^switchport +mode +(?P<switchport_mode>[\S\s]+)$')
+        p13 = regex_engine.compile(r'^switchport +mode +(?P<switchport_mode>[\S\s]+)$')
 
         # switchport nonegotiate
-        p14 = re.compile(r'^switchport +(?P<nonegotiate>nonegotiate)$')
+        p14 = regex_engine.compile(r'^switchport +(?P<nonegotiate>nonegotiate)$')
 
         # ip arp inspection limit rate 1024
-        p15 = re.compile(r'^ip +arp +inspection +limit +rate +(?P<rate>[\d]+)$')
+        p15 = regex_engine.compile(r'^ip +arp +inspection +limit +rate +(?P<rate>[\d]+)$')
 
         # load-interval 30
-        p16 = re.compile(r'^load-interval +(?P<load_interval>\d+)$')
+        p16 = regex_engine.compile(r'^load-interval +(?P<load_interval>\d+)$')
 
         # authentication control-direction in
-        p17 = re.compile(r'^authentication +control-direction +(?P<direction>\w+)$')
+        p17 = regex_engine.compile(r'^authentication +control-direction +(?P<direction>\w+)$')
 
         # authentication event fail action next-method
-        p18 = re.compile(r'^authentication +event +fail +action +(?P<action>[\S\s]+)$')
+        p18 = regex_engine.compile(r'^authentication +event +fail +action +(?P<action>[\S\s]+)$')
 
         # authentication host-mode multi-auth
-        p19 = re.compile(r'^authentication +host-mode +(?P<host_mode>[\S\s]+)$')
+        p19 = regex_engine.compile(r'^authentication +host-mode +(?P<host_mode>[\S\s]+)$')
 
         # authentication order dot1x mab
-        p20 = re.compile(r'^authentication +order +(?P<order>[\S\s]+)$')
+        p20 = regex_engine.compile(r'^authentication +order +(?P<order>[\S\s]+)$')
 
         # authentication priority dot1x mab
-        p21 = re.compile(r'^authentication +priority +(?P<priority>[\S\s]+)$')
+        p21 = regex_engine.compile(r'^authentication +priority +(?P<priority>[\S\s]+)$')
 
         # authentication port-control auto
-        p22 = re.compile(r'^authentication +port-control +(?P<port_control>[\S\s]+)$')
+        p22 = regex_engine.compile(r'^authentication +port-control +(?P<port_control>[\S\s]+)$')
 
         # authentication periodic
-        p23 = re.compile(r'^(?P<periodic>authentication periodic)$')
+        p23 = regex_engine.compile(r'^(?P<periodic>authentication periodic)$')
 
         # authentication timer reauthenticate server
-        p24 = re.compile(r'^(?P<reauth>authentication +timer +reauthenticate +server)$')
+        p24 = regex_engine.compile(r'^(?P<reauth>authentication +timer +reauthenticate +server)$')
 
         # authentication timer inactivity 65535
-        p24_1 = re.compile(r'^authentication +timer +inactivity +(?P<inactivity>\d+)$')
+        p24_1 = regex_engine.compile(r'^authentication +timer +inactivity +(?P<inactivity>\d+)$')
 
         # authentication timer reauthenticate 6000
-        p24_2 = re.compile(r'^authentication timer reauthenticate (?P<authentication_timer_reauthenticate>\d+)$')
+        p24_2 = regex_engine.compile(r'^authentication timer reauthenticate (?P<authentication_timer_reauthenticate>\d+)$')
 
         # authentication violation restrict
-        p25 = re.compile(r'^authentication +violation +(?P<violation>[\S\s]+)$')
+        p25 = regex_engine.compile(r'^authentication +violation +(?P<violation>[\S\s]+)$')
 
         # authentication fallback dot1x
-        p26 = re.compile(r'^authentication +fallback +(?P<fallback>[\S\s]+)$')
+        p26 = regex_engine.compile(r'^authentication +fallback +(?P<fallback>[\S\s]+)$')
 
         # mab
-        p27 = re.compile(r'^(?P<mab>mab)$')
+        p27 = regex_engine.compile(r'^(?P<mab>mab)$')
 
         # snmp trap mac-notification change added
-        p28 = re.compile(r'^snmp +trap +mac-notification +change +added$')
+        p28 = regex_engine.compile(r'^snmp +trap +mac-notification +change +added$')
 
         # snmp trap mac-notification change removed
-        p29 = re.compile(r'^snmp +trap +mac-notification +change +removed$')
+        p29 = regex_engine.compile(r'^snmp +trap +mac-notification +change +removed$')
 
         # no snmp trap link-status
-        p30 = re.compile(r'^no +snmp +trap +link-status$')
+        p30 = regex_engine.compile(r'^no +snmp +trap +link-status$')
 
         # dot1x pae authenticator
-        p31 = re.compile(r'^dot1x +pae +authenticator$')
+        p31 = regex_engine.compile(r'^dot1x +pae +authenticator$')
 
         # dot1x timeout quiet-period 5
-        p32 = re.compile(r'^dot1x +timeout +quiet-period +(?P<quiet_period>\d+)$')
+        p32 = regex_engine.compile(r'^dot1x +timeout +quiet-period +(?P<quiet_period>\d+)$')
 
         # dot1x timeout server-timeout 10
-        p33 = re.compile(r'^dot1x +timeout +server-timeout +(?P<server_timeout>\d+)$')
+        p33 = regex_engine.compile(r'^dot1x +timeout +server-timeout +(?P<server_timeout>\d+)$')
 
         # dot1x timeout tx-period 5
-        p34 = re.compile(r'^dot1x +timeout +tx-period +(?P<tx_period>\d+)$')
+        p34 = regex_engine.compile(r'^dot1x +timeout +tx-period +(?P<tx_period>\d+)$')
 
         # spanning-tree portfast
-        p35 = re.compile(r'^spanning-tree +portfast$')
+        p35 = regex_engine.compile(r'^spanning-tree +portfast$')
 
         # spanning-tree bpduguard enable
-        p36 = re.compile(r'^spanning-tree +bpduguard +(?P<bpduguard>[\S\s]+)$')
+        p36 = regex_engine.compile(r'^spanning-tree +bpduguard +(?P<bpduguard>[\S\s]+)$')
 
         # ip dhcp snooping limit rate 100
-        p37 = re.compile(r'^ip +dhcp +snooping +limit +rate +(?P<rate>[\d]+)$')
+        p37 = regex_engine.compile(r'^ip +dhcp +snooping +limit +rate +(?P<rate>[\d]+)$')
 
         # ipv6 enable
-        p38 = re.compile(r'^ipv6 enable$')
+        p38 = regex_engine.compile(r'^ipv6 enable$')
 
         # ip ospf 2 area 0
         # ipv6 ospf 1 area 0
-        p39 = re.compile(r'^(?P<ip>ip|ipv6) +ospf +(?P<ospf>\d+) +area +(?P<area>[\d]+)$')
+        p39 = regex_engine.compile(r'^(?P<ip>ip|ipv6) +ospf +(?P<ospf>\d+) +area +(?P<area>[\d]+)$')
 
         # ospfv3 1 ipv6 area 0
-        p40 = re.compile(r'^ospfv3 +(?P<rate>[\d]+) +ipv6 +area +(?P<area>[\d]+)$')
+        p40 = regex_engine.compile(r'^ospfv3 +(?P<rate>[\d]+) +ipv6 +area +(?P<area>[\d]+)$')
 
         # channel-group 1 mode active
-        p41 = re.compile(r'^channel-group +(?P<group>[\d]+) +mode +(?P<mode>[\w]+)$')
+        p41 = regex_engine.compile(r'^channel-group +(?P<group>[\d]+) +mode +(?P<mode>[\w]+)$')
 
         # power inline port priority high
-        p42 = re.compile(r'^power +inline +port +priority +(?P<power_priority>[\w]+)$')
+        p42 = regex_engine.compile(r'^power +inline +port +priority +(?P<power_priority>[\w]+)$')
 
         # power inline static max 20000
-        p43 = re.compile(r'^power +inline +(?P<state>never|static)( +max +(?P<max_watts>[\d]+))?$')
+        p43 = regex_engine.compile(r'^power +inline +(?P<state>never|static)( +max +(?P<max_watts>[\d]+))?$')
 
         # spanning-tree bpdufilter enable
-        p44 = re.compile(r'^spanning-tree +bpdufilter +(?P<bpdufilter>[\S\s]+)$')
+        p44 = regex_engine.compile(r'^spanning-tree +bpdufilter +(?P<bpdufilter>[\S\s]+)$')
 
         # ip flow monitor IPv4NETFLOW input
-        p45 = re.compile(r'^ip +flow +monitor +(?P<flow_monitor_input>[\w]+) +input$')
+        p45 = regex_engine.compile(r'^ip +flow +monitor +(?P<flow_monitor_input>[\w]+) +input$')
 
         # switchport protected
-        p46 = re.compile(r'^switchport +protected$')
+        p46 = regex_engine.compile(r'^switchport +protected$')
 
         # switchport block unicast
-        p47 = re.compile(r'^switchport +block +unicast$')
+        p47 = regex_engine.compile(r'^switchport +block +unicast$')
 
         # switchport block multicast
-        p48 = re.compile(r'^switchport +block +multicast$')
+        p48 = regex_engine.compile(r'^switchport +block +multicast$')
 
         # switchport trunk allowed vlan 820,900-905
         # switchport trunk allowed vlan add 905-908
-        p49 = re.compile(r'^switchport +trunk +allowed +vlan( +add)? (?P<vlans>[\S\s]+)$')
+        p49 = regex_engine.compile(r'^switchport +trunk +allowed +vlan( +add)? (?P<vlans>[\S\s]+)$')
 
         # ip dhcp snooping trust
-        p50 = re.compile(r'^ip +dhcp +snooping +trust$')
+        p50 = regex_engine.compile(r'^ip +dhcp +snooping +trust$')
 
         # ip arp inspection trust
-        p51 = re.compile(r'^ip +arp +inspection +trust$')
+        p51 = regex_engine.compile(r'^ip +arp +inspection +trust$')
 
         #ip unnumbered Loopback0
-        p52 = re.compile(r'^ip unnumbered (?P<src_address>\S+)$')
+        p52 = regex_engine.compile(r'^ip unnumbered (?P<src_address>\S+)$')
 
         # tunnel mode mpls traffic-eng
-        p53 = re.compile(r"^tunnel mode (?P<tunnel_mode>[a-zA-Z\- ]+)$")
+        p53 = regex_engine.compile(r"^tunnel mode (?P<tunnel_mode>[a-zA-Z\- ]+)$")
 
         # tunnel destination 2.2.2.2
-        p54 = re.compile(r"^tunnel destination (?P<tunnel_dst>\S+)$")
+        p54 = regex_engine.compile(r"^tunnel destination (?P<tunnel_dst>\S+)$")
 
         # tunnel mpls traffic-eng priority 7 7
-        p55 = re.compile(r"^tunnel mpls traffic-eng priority (?P<value>[a-zA-Z0-9 ]+)$")
+        p55 = regex_engine.compile(r"^tunnel mpls traffic-eng priority (?P<value>[a-zA-Z0-9 ]+)$")
 
         # tunnel mpls traffic-eng bandwidth 500
-        p56 = re.compile(r"^tunnel mpls traffic-eng bandwidth (?P<value>[0-9 ]+)$")
+        p56 = regex_engine.compile(r"^tunnel mpls traffic-eng bandwidth (?P<value>[0-9 ]+)$")
 
         # tunnel mpls traffic-eng path-option 1 dynamic
-        p57 = re.compile(r"^tunnel mpls traffic-eng path-option (?P<value>[0-9]+)\s*(?:explicit name)? +(?P<path_type>\S+)$")
+        p57 = regex_engine.compile(r"^tunnel mpls traffic-eng path-option (?P<value>[0-9]+)\s*(?:explicit name)? +(?P<path_type>\S+)$")
 
         # mpls ip
-        p58 = re.compile(r"^mpls ip$")
+        p58 = regex_engine.compile(r"^mpls ip$")
 
         # service-policy input AutoQos-4.0-CiscoPhone-Input-Policy
-        p59 = re.compile(r'^service-policy\s+input\s+(?P<input_policy>\S+)$')
+        p59 = regex_engine.compile(r'^service-policy\s+input\s+(?P<input_policy>\S+)$')
 
         # service-policy output AutoQos-4.0-Output-Policy
-        p60 = re.compile(r'^service-policy\s+output\s+(?P<output_policy>\S+)$')
+        p60 = regex_engine.compile(r'^service-policy\s+output\s+(?P<output_policy>\S+)$')
 
         # switchport port-security mac-address sticky 1020.4bb1.6f2f
-        p61 = re.compile(r"^switchport port-security mac-address sticky (?P<value>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})$")
+        p61 = regex_engine.compile(r"^switchport port-security mac-address sticky (?P<value>([a-fA-F\d]{4}\.){2}[a-fA-F\d]{4})$")
 
         # source template USER_NoAuth
-        p62 = re.compile(r"^source template (?P<template>\w+)$")
+        p62 = regex_engine.compile(r"^source template (?P<template>\w+)$")
 
         # host-reachability protocol bgp
-        p63 = re.compile(r'^host-reachability protocol (?P<protocol>[a-zA-Z]+)$')
+        p63 = regex_engine.compile(r'^host-reachability protocol (?P<protocol>[a-zA-Z]+)$')
 
         # source-interface loopback1
-        p64 = re.compile(r'^source-interface (?P<src_intf>[a-zA-Z0-9\-]+)$')
+        p64 = regex_engine.compile(r'^source-interface (?P<src_intf>[a-zA-Z0-9\-]+)$')
 
         # member vni 20011 ingress-replication
-        p65 = re.compile(r'^member vni (?P<vni>[0-9]+) ingress-replication$')
+        p65 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) ingress-replication$')
 
         # member vni 20012 mcast-group 224.1.1.1
-        p66 = re.compile(r'^member vni (?P<vni>[0-9]+) mcast-group (?P<ip>[0-9\.]+)$')
+        p66 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) mcast-group (?P<ip>[0-9\.]+)$')
 
         # member vni 20011 ingress-replication local-routing
-        p67 = re.compile(r'^member vni (?P<vni>[0-9]+) ingress-replication '
-                         r'local-routing$')
+        p67 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) ingress-replication '
+                                   r'local-routing$')
 
         # member vni 20011
-        p68 = re.compile(r'^member vni (?P<vni>[0-9]+)$')
+        p68 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+)$')
 
         # ingress-replication 1.1.1.1
-        p69 = re.compile(r'^ingress-replication (?P<ip>[0-9\.]+)$')
+        p69 = regex_engine.compile(r'^ingress-replication (?P<ip>[0-9\.]+)$')
 
         # member vni 20012 mcast-group 224.1.1.1 local-routing
-        p70 = re.compile(r'^member vni (?P<vni>[0-9]+) mcast-group (?P<ip>[0-9\.]+) '
-                         r'local-routing$')
+        p70 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) mcast-group (?P<ip>[0-9\.]+) '
+                                   r'local-routing$')
 
         # member vni 30000 vrf red
-        p71 = re.compile(r'^member vni (?P<vni>[0-9]+) vrf (?P<vrf>[a-zA-Z\-]+)$')
+        p71 = regex_engine.compile(r'^member vni (?P<vni>[0-9]+) vrf (?P<vrf>[a-zA-Z\-]+)$')
 
         # ip access-group DELETE_ME in ; ip access-group TEST-OUT out
-        p72 = re.compile(r'^ip access-group (?P<acl_name>[\w\-.#<>]+) (?P<direction>\w+)$')
+        p72 = regex_engine.compile(r'^ip access-group (?P<acl_name>[\w\-.#<>]+) (?P<direction>\w+)$')
 
         # lisp mobility 20_1_1_0-global-IPV4
-        p73 = re.compile(r'^\s*lisp mobility +(?P<lisp_mobility>[\w-]+)$')
+        p73 = regex_engine.compile(r'^\s*lisp mobility +(?P<lisp_mobility>[\w-]+)$')
 
         #trust device cisco-phone / trust device ip-camera
-        p74 = re.compile(r'^trust\sdevice\s(?P<trust_device>\S+)$')
+        p74 = regex_engine.compile(r'^trust\sdevice\s(?P<trust_device>\S+)$')
 
         #ipv6 destination-guard attach-policy Univ-v6-IPDG-Policy1
-        p75 = re.compile(r'^ipv6\sdestination-guard\sattach-policy\s(?P<ipv6_destination_guard_attach_policy>\S+)$')
+        p75 = regex_engine.compile(r'^ipv6\sdestination-guard\sattach-policy\s(?P<ipv6_destination_guard_attach_policy>\S+)$')
 
         #ipv6 source-guard attach-policy Univ-v6-IPSG-Policy2
-        p76 = re.compile(r'^ipv6\ssource-guard\sattach-policy\s(?P<ipv6_source_guard_attach_policy>\S+)$')
+        p76 = regex_engine.compile(r'^ipv6\ssource-guard\sattach-policy\s(?P<ipv6_source_guard_attach_policy>\S+)$')
 
         # spanning-tree portfast trunk
-        p77 = re.compile(r"^spanning-tree +portfast +trunk$")
+        p77 = regex_engine.compile(r"^spanning-tree +portfast +trunk$")
 
         #ipv6 nd raguard attach-policy Univ_IPv6_RA_Policy_Host
-        p78 = re.compile(r'^ipv6\snd\sraguard\sattach-policy\s+(?P<ipv6_nd_raguard_attach_policy>\S+)$')
+        p78 = regex_engine.compile(r'^ipv6\snd\sraguard\sattach-policy\s+(?P<ipv6_nd_raguard_attach_policy>\S+)$')
 
         #device-tracking attach-policy IPDT_POLICY
-        p79 = re.compile(r'^device-tracking\sattach-policy\s+(?P<device_tracking_attach_policy>\S+)$')
+        p79 = regex_engine.compile(r'^device-tracking\sattach-policy\s+(?P<device_tracking_attach_policy>\S+)$')
 
         # stackwise-virtual link 1
-        p80 = re.compile(r'^stackwise-virtual\slink\s+(?P<stackwise_virtual_link>\d+)$')
+        p80 = regex_engine.compile(r'^stackwise-virtual\slink\s+(?P<stackwise_virtual_link>\d+)$')
 
         # stackwise-virtual dual-active-detection
-        p81 = re.compile(r'^stackwise-virtual\s+(?P<dual_active_detection>\S+)$')
+        p81 = regex_engine.compile(r'^stackwise-virtual\s+(?P<dual_active_detection>\S+)$')
 
         # ip flow monitor monitor_ipv4_out output
-        p82 = re.compile(r'^ip\s+flow\s+monitor\s+(?P<flow_monitor_output>\S+)\s+output$')
+        p82 = regex_engine.compile(r'^ip\s+flow\s+monitor\s+(?P<flow_monitor_output>\S+)\s+output$')
         
         #ip dhcp snooping information option allow-untrusted
-        p83 = re.compile(r'^ip +dhcp +snooping +information +option +allow-untrusted$')
+        p83 = regex_engine.compile(r'^ip +dhcp +snooping +information +option +allow-untrusted$')
         
         #no ip dhcp snooping information option allow-untrusted
-        p84 = re.compile(r'^no +ip +dhcp +snooping +information +option +allow-untrusted$')
+        p84 = regex_engine.compile(r'^no +ip +dhcp +snooping +information +option +allow-untrusted$')
 
         #ipv6 flow monitor monitor_ipv6_in sampler H_sampler input
-        p85 = re.compile(r'^ipv6\s+flow\s+monitor\s+(?P<flow_monitor_input_v6>[\S]+)\s+sampler\s+[\S]+\s+input$')
+        p85 = regex_engine.compile(r'^ipv6\s+flow\s+monitor\s+(?P<flow_monitor_input_v6>[\S]+)\s+sampler\s+[\S]+\s+input$')
 
         #ipv6 flow monitor monitor_ipv6_out sampler H_sampler output
-        p86 = re.compile(r'^ipv6\s+flow\s+monitor\s+(?P<flow_monitor_output_v6>[\S]+)\s+sampler\s+[\S]+\s+output$')
+        p86 = regex_engine.compile(r'^ipv6\s+flow\s+monitor\s+(?P<flow_monitor_output_v6>[\S]+)\s+sampler\s+[\S]+\s+output$')
 
         # speed 25000
-        p87 = re.compile(r'^speed +(?P<speed>\d+)$')
+        p87 = regex_engine.compile(r'^speed +(?P<speed>\d+)$')
         
         # speed nonegotiate
-        p88 = re.compile(r'^speed +(?P<speed_nonegotiate>nonegotiate)$')
+        p88 = regex_engine.compile(r'^speed +(?P<speed_nonegotiate>nonegotiate)$')
 
         # isis network point-to-point
-        p89 = re.compile(r'^isis +network +(?P<isis_network>\S+)$')
+        p89 = regex_engine.compile(r'^isis +network +(?P<isis_network>\S+)$')
 
         # isis metric 22 level-1
         # isis metric 22 level-2
-        p90 = re.compile(r'^isis +metric +(?P<isis_v4_metric>\d+) +(?P<isis_v4_level>\S+)$')
+        p90 = regex_engine.compile(r'^isis +metric +(?P<isis_v4_metric>\d+) +(?P<isis_v4_level>\S+)$')
 
         # isis ipv6 metric 33 level-1
         # isis ipv6 metric 22 level-2
-        p91 = re.compile(r'^isis +ipv6 +metric +(?P<isis_v6_metric>\d+) +(?P<isis_v6_level>\S+)$')
+        p91 = regex_engine.compile(r'^isis +ipv6 +metric +(?P<isis_v6_metric>\d+) +(?P<isis_v6_level>\S+)$')
 
         # switchport trunk native vlan 101
-        p92 = re.compile(r'^switchport trunk native vlan (?P<switchport_trunk_native_vlan>\d+)$')
+        p92 = regex_engine.compile(r'^switchport trunk native vlan (?P<switchport_trunk_native_vlan>\d+)$')
 
         # access-session host-mode multi-host
-        p93 = re.compile(r'^access-session host-mode (?P<access_session_host_mode>.+)$')
+        p93 = regex_engine.compile(r'^access-session host-mode (?P<access_session_host_mode>.+)$')
 
         # access-session closed
-        p94 = re.compile(r'^access-session (?P<access_session>\w+)$')
+        p94 = regex_engine.compile(r'^access-session (?P<access_session>\w+)$')
 
         # access-session port-control auto
-        p95 = re.compile(r'^access-session port-control (?P<access_session_port_control>.+)$')
+        p95 = regex_engine.compile(r'^access-session port-control (?P<access_session_port_control>.+)$')
 
         # dot1x pae both
-        p96 = re.compile(r'^dot1x pae (?P<dot1x_pae>.+)$')
+        p96 = regex_engine.compile(r'^dot1x pae (?P<dot1x_pae>.+)$')
 
         # dot1x timeout supp-timeout 87
-        p97 = re.compile(r'^dot1x timeout supp-timeout (?P<dot1x_timeout_supp_timeout>\d+)$')
+        p97 = regex_engine.compile(r'^dot1x timeout supp-timeout (?P<dot1x_timeout_supp_timeout>\d+)$')
 
         # dot1x max-req 6
-        p98 = re.compile(r'^dot1x max-req (?P<dot1x_max_req>\d+)$')
+        p98 = regex_engine.compile(r'^dot1x max-req (?P<dot1x_max_req>\d+)$')
 
         # dot1x authenticator eap profile Self
-        p99 = re.compile(r'^dot1x authenticator eap profile (?P<dot1x_authenticator_eap_profile>.+)$')
+        p99 = regex_engine.compile(r'^dot1x authenticator eap profile (?P<dot1x_authenticator_eap_profile>.+)$')
 
         # dot1x timeout held-period 63
-        p100 = re.compile(r'^dot1x timeout held-period (?P<dot1x_timeout_held_period>\d+)$')
+        p100 = regex_engine.compile(r'^dot1x timeout held-period (?P<dot1x_timeout_held_period>\d+)$')
 
         # dot1x credentials EAPTLSCRED-IOSCA
-        p101 = re.compile(r'^dot1x credentials (?P<dot1x_credentials>.+)$')
+        p101 = regex_engine.compile(r'^dot1x credentials (?P<dot1x_credentials>.+)$')
 
         # dot1x supplicant eap profile Self
-        p102 = re.compile(r'^dot1x supplicant eap profile (?P<dot1x_supplicant_eap_profile>.+)$')
+        p102 = regex_engine.compile(r'^dot1x supplicant eap profile (?P<dot1x_supplicant_eap_profile>.+)$')
 
         # macsec
-        p103 = re.compile(r'^\s*macsec$')
+        p103 = regex_engine.compile(r'^\s*macsec$')
 
         # macsec access-control should-secure
-        p104 = re.compile(r'^\s*macsec access-control +(?P<macsec_access_control>[\w\-]+)')
+        p104 = regex_engine.compile(r'^\s*macsec access-control +(?P<macsec_access_control>[\w\-]+)')
 
         #  mka policy MKAPolicy
-        p105 = re.compile(r'^\s*mka policy +(?P<mka_policy>\S+)')
+        p105 = regex_engine.compile(r'^\s*mka policy +(?P<mka_policy>\S+)')
         
         # mka pre-shared-key key-chain KCP256
-        p106 = re.compile(r'^\s*mka pre-shared-key key-chain +(?P<mka_primary_keychain>\S+)$')
+        p106 = regex_engine.compile(r'^\s*mka pre-shared-key key-chain +(?P<mka_primary_keychain>\S+)$')
 
         # mka pre-shared-key key-chain KCP256 fallback-key-chain KCF256
-        p107 = re.compile(r'^\s*mka pre-shared-key key-chain +(?P<mka_primary_keychain>\S+) fallback-key-chain +(?P<mka_fallback_keychain>\S+)')
+        p107 = regex_engine.compile(r'^\s*mka pre-shared-key key-chain +(?P<mka_primary_keychain>\S+) fallback-key-chain +(?P<mka_fallback_keychain>\S+)')
 
         # ip mtu 1468
-        p108 = re.compile(r'^\s*ip mtu (?P<mtu>\d+)')
+        p108 = regex_engine.compile(r'^\s*ip mtu (?P<mtu>\d+)')
         
         # ip flow monitor m4in sampler fnf_sampler input
-        p109 = re.compile(r'^ip +flow +monitor +(?P<flow_monitor_in_sampler>[\w]+) +sampler +(?P<input_sampler>[\w]+) +input$')
+        p109 = regex_engine.compile(r'^ip +flow +monitor +(?P<flow_monitor_in_sampler>[\w]+) +sampler +(?P<input_sampler>[\w]+) +input$')
 
         #  ip flow monitor m4out sampler fnf_sampler output
-        p110 = re.compile(r'^ip +flow +monitor +(?P<flow_monitor_out_sampler>[\w]+) +sampler +(?P<output_sampler>[\w]+) +output$')
+        p110 = regex_engine.compile(r'^ip +flow +monitor +(?P<flow_monitor_out_sampler>[\w]+) +sampler +(?P<output_sampler>[\w]+) +output$')
 
         # ip pim sparse-dense-mode
-        p111 = re.compile(r'^ip +pim +(?P<pim_mode>[\S]+)$')
+        p111 = regex_engine.compile(r'^ip +pim +(?P<pim_mode>[\S]+)$')
 
         # service-policy type queueing output 2p6q
-        p112 = re.compile(r'^service-policy +type +(?P<policy_type>[\S]+) +output +(?P<output_name>[\S]+)$')
+        p112 = regex_engine.compile(r'^service-policy +type +(?P<policy_type>[\S]+) +output +(?P<output_name>[\S]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1170,7 +1168,7 @@ class ShowRunInterface(ShowRunInterfaceSchema):
                 continue
 
             # ospfv3 1 ipv6 area 0
-            p40 = re.compile(r'^ospfv3 +(?P<ospfv3>[\d]+) +(?P<ip>ip|ipv6) +area +(?P<area>[\d]+)$')
+            p40 = regex_engine.compile(r'^ospfv3 +(?P<ospfv3>[\d]+) +(?P<ip>ip|ipv6) +area +(?P<area>[\d]+)$')
             m = p40.match(line)
             if m:
                 group = m.groupdict()
@@ -1866,77 +1864,77 @@ class ShowRunMdnsSd(ShowRunMdnsSdSchema):
         out_dict = {}
 
         # mdns-sd gateway
-        p0 = re.compile(r"^mdns-sd +gateway$")
+        p0 = regex_engine.compile(r"^mdns-sd +gateway$")
 
         # mode service-peer
-        p1 = re.compile(r"^mode +(?P<mode>[\w-]+)$")
+        p1 = regex_engine.compile(r"^mode +(?P<mode>[\w-]+)$")
 
         # active-query timer 10
-        p2 = re.compile(r"^active-query +timer +(?P<act_qry_timer>(\d)+)$")
+        p2 = regex_engine.compile(r"^active-query +timer +(?P<act_qry_timer>(\d)+)$")
 
         # rate-limit 10
-        p3 = re.compile(r"^rate-limit +(?P<rate_limit>[\d]+)$")
+        p3 = regex_engine.compile(r"^rate-limit +(?P<rate_limit>[\d]+)$")
 
         # service-mdns-query all
-        p4 = re.compile(r"^service-mdns-query +(?P<srvc_mdns_qry>[\w]+)$")
+        p4 = regex_engine.compile(r"^service-mdns-query +(?P<srvc_mdns_qry>[\w]+)$")
 
         # cache-memory-max 10
-        p5 = re.compile(r"^cache-memory-max +(?P<cache_mem_max>[\d]+)$")
+        p5 = regex_engine.compile(r"^cache-memory-max +(?P<cache_mem_max>[\d]+)$")
 
         # service-type-enumeration period 15
-        p6 = re.compile(r"^service-type-enumeration +period +(?P<srvc_enu_prd>[\d]+)$")
+        p6 = regex_engine.compile(r"^service-type-enumeration +period +(?P<srvc_enu_prd>[\d]+)$")
 
         # air-print-helper enable
-        p7 = re.compile(r"^air-print-helper +(?P<air_prnt_hlp>[\w]+)$")
+        p7 = regex_engine.compile(r"^air-print-helper +(?P<air_prnt_hlp>[\w]+)$")
 
         # any-query forward
-        p8 = re.compile(r"^any-query +(?P<any_qry>[\w]+)$")
+        p8 = regex_engine.compile(r"^any-query +(?P<any_qry>[\w]+)$")
 
         # cache-sync timer 15
-        p9 = re.compile(r"^cache-sync timer +(?P<cach_sync_timer>(\d)+)$")
+        p9 = regex_engine.compile(r"^cache-sync timer +(?P<cach_sync_timer>(\d)+)$")
 
         # active-response timer 10
-        p10 = re.compile(r"^active-response +timer +(?P<act_res_timer>[\d]+)$")
+        p10 = regex_engine.compile(r"^active-response +timer +(?P<act_res_timer>[\d]+)$")
 
         # mdns-sd location-filter filter1
-        p11 = re.compile(r"^mdns-sd +location-filter +(?P<loc_fil_name>[\d\w-]+)$")
+        p11 = regex_engine.compile(r"^mdns-sd +location-filter +(?P<loc_fil_name>[\d\w-]+)$")
 
         # match location-group all vlan 1101 role none
-        p12 = re.compile(r"^match +location-group +(?P<loc_grp>\d+|\S+) +vlan +(?P<vlan_no>[\d]+) +role +(?P<role>[\w]+)$")
+        p12 = regex_engine.compile(r"^match +location-group +(?P<loc_grp>\d+|\S+) +vlan +(?P<vlan_no>[\d]+) +role +(?P<role>[\w]+)$")
 
         # mdns-sd service-definition custom1
-        p13 = re.compile(r"^mdns-sd +service-definition +(?P<srvc_def_name>[\d\w]+)$")
+        p13 = regex_engine.compile(r"^mdns-sd +service-definition +(?P<srvc_def_name>[\d\w]+)$")
 
         # service-type _airplay._tcp.local
-        p14 = re.compile(r"^service-type +(?P<srvc_type>[\w.-]+)$")
+        p14 = regex_engine.compile(r"^service-type +(?P<srvc_type>[\w.-]+)$")
 
         # mdns-sd service-list policie4 OUT
-        p15 = re.compile(r"^mdns-sd +service-list +(?P<srvc_list_name>[\d\w]+) +(?P<fil_dir>(IN|OUT))$")
+        p15 = regex_engine.compile(r"^mdns-sd +service-list +(?P<srvc_list_name>[\d\w]+) +(?P<fil_dir>(IN|OUT))$")
 
         # match custom1
-        p16 = re.compile(r"^match +(?P<srvc_list_1>[\d\w-]+)$")
+        p16 = regex_engine.compile(r"^match +(?P<srvc_list_1>[\d\w-]+)$")
 
         # match custom1 message-type query
-        p17 = re.compile(r"^match +(?P<srvc_list>[\d\w-]+) +message-type +(?P<service_types>(announcement|any|query))$")
+        p17 = regex_engine.compile(r"^match +(?P<srvc_list>[\d\w-]+) +message-type +(?P<service_types>(announcement|any|query))$")
 
         # mdns-sd service-policy policy2
-        p18 = re.compile(r"^mdns-sd +service-policy +(?P<srvc_poli_name>[\d\w]+)$")
+        p18 = regex_engine.compile(r"^mdns-sd +service-policy +(?P<srvc_poli_name>[\d\w]+)$")
 
         # service-list policie3 IN
-        p19 = re.compile(r"^service-list +(?P<poli_srvc_list>[\d\w-]+) +(?P<bound_dir>(IN|OUT))$")
+        p19 = regex_engine.compile(r"^service-list +(?P<poli_srvc_list>[\d\w-]+) +(?P<bound_dir>(IN|OUT))$")
 
         # mdns-sd location-group 4096 vlan 1101
-        p20 = re.compile(r"^mdns-sd +location-group +(?P<loc_grp_name>\d+|\S+) +vlan +(?P<vl_no>[\d]+)$")
+        p20 = regex_engine.compile(r"^mdns-sd +location-group +(?P<loc_grp_name>\d+|\S+) +vlan +(?P<vl_no>[\d]+)$")
 
         # interface Gi5/0/15
-        p21 = re.compile(r"^interface +(?P<intf>[\w\/]+)$")
+        p21 = regex_engine.compile(r"^interface +(?P<intf>[\w\/]+)$")
 
         # source-interface Vlan4030
-        p22 = re.compile(r"^source-interface +Vlan(?P<src_intf>[\d]+)$")
+        p22 = regex_engine.compile(r"^source-interface +Vlan(?P<src_intf>[\d]+)$")
 
         # sdg-agent 4000:1:30::1
         # sdg-agent 40.1.21.1
-        p23 = re.compile(r"^sdg-agent +(?P<agent_ip>([\d:.]+))$")
+        p23 = regex_engine.compile(r"^sdg-agent +(?P<agent_ip>([\d:.]+))$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2218,142 +2216,142 @@ class ShowRunAllSectionInterface(ShowRunAllSectionInterfaceSchema):
         config_dict = {}
 
         # interface GigabitEthernet0
-        p1 = re.compile(r'^interface +(?P<interface>[\S]+)$')
+        p1 = regex_engine.compile(r'^interface +(?P<interface>[\S]+)$')
 
         # mvrp timer leave-all 1000
-        p2 = re.compile(r'^mvrp +timer +leave-all +(?P<timeout>[\d]+)$')
+        p2 = regex_engine.compile(r'^mvrp +timer +leave-all +(?P<timeout>[\d]+)$')
 
         #  mvrp timer leave 60
-        p3 = re.compile(r'^mvrp +timer +leave +(?P<timeout>[\d]+)$')
+        p3 = regex_engine.compile(r'^mvrp +timer +leave +(?P<timeout>[\d]+)$')
 
         # mvrp timer join 20
-        p4 = re.compile(r'^mvrp +timer +join +(?P<timeout>[\d]+)$')
+        p4 = regex_engine.compile(r'^mvrp +timer +join +(?P<timeout>[\d]+)$')
 
         # no mvrp timer periodic
-        p5 = re.compile(r'^no +mvrp +timer +periodic$')
+        p5 = regex_engine.compile(r'^no +mvrp +timer +periodic$')
 
         # no mvrp
-        p6 = re.compile(r'^no +mvrp$')
+        p6 = regex_engine.compile(r'^no +mvrp$')
 
         # switchport
-        p7 = re.compile(r'^switchport$')
+        p7 = regex_engine.compile(r'^switchport$')
 
         # no shutdown
-        p8 = re.compile(r'^no +(?P<shutdown>shutdown)$')
+        p8 = regex_engine.compile(r'^no +(?P<shutdown>shutdown)$')
 
         # carrier-delay 2
-        p9 = re.compile(r'^carrier-delay +(?P<carrier_delay>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^carrier-delay +(?P<carrier_delay>[\S\s]+)$')
 
         # switchport access vlan 70
-        p10 = re.compile(r'^switchport +access +vlan +(?P<vlan>[\d]+)$')
+        p10 = regex_engine.compile(r'^switchport +access +vlan +(?P<vlan>[\d]+)$')
 
         # switchport mode access
-        p11 = re.compile(r'^switchport +mode +(?P<switchport_mode>[\S\s]+)$')
+        p11 = regex_engine.compile(r'^switchport +mode +(?P<switchport_mode>[\S\s]+)$')
 
         # no switchport nonegotiate
-        p12 = re.compile(r'^no +switchport +(?P<nonegotiate>nonegotiate)$')
+        p12 = regex_engine.compile(r'^no +switchport +(?P<nonegotiate>nonegotiate)$')
 
         # ip arp inspection limit rate 1024
-        p13 = re.compile(r'^ip +arp +inspection +limit +rate +(?P<rate>[\d]+)$')
+        p13 = regex_engine.compile(r'^ip +arp +inspection +limit +rate +(?P<rate>[\d]+)$')
 
         # load-interval 30
-        p14 = re.compile(r'^load-interval +(?P<load_interval>\d+)$')
+        p14 = regex_engine.compile(r'^load-interval +(?P<load_interval>\d+)$')
 
         # access-session control-direction in
-        p15 = re.compile(r'^access-session +control-direction +(?P<direction>\w+)$')
+        p15 = regex_engine.compile(r'^access-session +control-direction +(?P<direction>\w+)$')
 
         # access-session host-mode multi-auth
-        p16 = re.compile(r'^access-session +host-mode +(?P<host_mode>[\S\s]+)$')
+        p16 = regex_engine.compile(r'^access-session +host-mode +(?P<host_mode>[\S\s]+)$')
 
         # authentication port-control auto
-        p17 = re.compile(r'^authentication +port-control +(?P<port_control>[\S\s]+)$')
+        p17 = regex_engine.compile(r'^authentication +port-control +(?P<port_control>[\S\s]+)$')
 
         # authentication periodic
-        p18 = re.compile(r'^(?P<periodic>authentication periodic)$')
+        p18 = regex_engine.compile(r'^(?P<periodic>authentication periodic)$')
 
         # authentication timer reauthenticate server
-        p19 = re.compile(r'^(?P<reauth>authentication +timer +reauthenticate +server)$')
+        p19 = regex_engine.compile(r'^(?P<reauth>authentication +timer +reauthenticate +server)$')
 
         # no switchport protected
-        p20 = re.compile(r'^no +switchport +protected$')
+        p20 = regex_engine.compile(r'^no +switchport +protected$')
 
         # no switchport block unicast
-        p21 = re.compile(r'^no +switchport +block +unicast$')
+        p21 = regex_engine.compile(r'^no +switchport +block +unicast$')
 
         # no switchport block multicast
-        p22 = re.compile(r'^no +switchport +block +multicast$')
+        p22 = regex_engine.compile(r'^no +switchport +block +multicast$')
 
         # switchport trunk allowed vlan all
-        p23 = re.compile(r'^switchport +trunk +allowed +vlan +all$')
+        p23 = regex_engine.compile(r'^switchport +trunk +allowed +vlan +all$')
 
         # no switchport autostate exclude
-        p24 = re.compile(r'^no +switchport +autostate +exclude$')
+        p24 = regex_engine.compile(r'^no +switchport +autostate +exclude$')
 
         # no ip arp inspection trust
-        p25 = re.compile(r'^no +ip +arp +inspection +trust$')
+        p25 = regex_engine.compile(r'^no +ip +arp +inspection +trust$')
 
         # no switchport vepa enabled
-        p26 = re.compile(r'^no +switchport +vepa +enabled$')
+        p26 = regex_engine.compile(r'^no +switchport +vepa +enabled$')
 
         #  ip access-group DEFAULT-ACCESS in
-        p27 = re.compile(r'^ip +access-group +(?P<group_name>[\w]+) +in$')
+        p27 = regex_engine.compile(r'^ip +access-group +(?P<group_name>[\w]+) +in$')
 
         # logging event link-status
-        p28 = re.compile(r'^logging +event +link-status$')
+        p28 = regex_engine.compile(r'^logging +event +link-status$')
 
         #  logging event trunk-status
-        p29 = re.compile(r'^logging +event +trunk-status$')
+        p29 = regex_engine.compile(r'^logging +event +trunk-status$')
 
         # no medium p2p
-        p30 = re.compile(r'^no +medium +p2p$')
+        p30 = regex_engine.compile(r'^no +medium +p2p$')
 
         # no macsec replay-protection
-        p31 = re.compile(r'^no +macsec +replay-protection$')
+        p31 = regex_engine.compile(r'^no +macsec +replay-protection$')
 
         # cdp log mismatch duplex
-        p32 = re.compile(r'^cdp +log +mismatch +duplex$')
+        p32 = regex_engine.compile(r'^cdp +log +mismatch +duplex$')
 
         # cdp tlv location
-        p33 = re.compile(r'^cdp +tlv +location$')
+        p33 = regex_engine.compile(r'^cdp +tlv +location$')
 
         # cdp tlv server-location
-        p34 = re.compile(r'^cdp +tlv +server-location$')
+        p34 = regex_engine.compile(r'^cdp +tlv +server-location$')
 
         # cdp tlv app
-        p35 = re.compile(r'^cdp +tlv +app$')
+        p35 = regex_engine.compile(r'^cdp +tlv +app$')
 
         # ipv6 mld snooping tcn flood
-        p36 = re.compile(r'^ipv6 +mld +snooping +tcn +flood$')
+        p36 = regex_engine.compile(r'^ipv6 +mld +snooping +tcn +flood$')
 
         # authentication linksec policy
-        p37 = re.compile(r'^authentication +linksec +policy$')
+        p37 = regex_engine.compile(r'^authentication +linksec +policy$')
 
         # no access-session closed
-        p38 = re.compile(r'^no +access-session +closed$')
+        p38 = regex_engine.compile(r'^no +access-session +closed$')
         
         #ip dhcp snooping information option allow-untrusted
-        p39 = re.compile(r'^ip +dhcp +snooping +information +option +allow-untrusted$')
+        p39 = regex_engine.compile(r'^ip +dhcp +snooping +information +option +allow-untrusted$')
         
         # no ip dhcp snooping information option allow-untrusted
-        p40 = re.compile(r'^no +ip +dhcp +snooping +information +option +allow-untrusted$')
+        p40 = regex_engine.compile(r'^no +ip +dhcp +snooping +information +option +allow-untrusted$')
 
         # macsec
-        p41 = re.compile(r'^\s*macsec$')
+        p41 = regex_engine.compile(r'^\s*macsec$')
 
         # macsec access-control should-secure
-        p42 = re.compile(r'^\s*macsec access-control +(?P<macsec_access_control>[\w\-]+)')
+        p42 = regex_engine.compile(r'^\s*macsec access-control +(?P<macsec_access_control>[\w\-]+)')
 
         #  mka policy MKAPolicy
-        p43 = re.compile(r'^\s*mka policy +(?P<mka_policy>\S+)')
+        p43 = regex_engine.compile(r'^\s*mka policy +(?P<mka_policy>\S+)')
         
         # mka pre-shared-key key-chain KCP256
-        p44 = re.compile(r'^\s*mka pre-shared-key key-chain +(?P<mka_primary_keychain>\S+)$')
+        p44 = regex_engine.compile(r'^\s*mka pre-shared-key key-chain +(?P<mka_primary_keychain>\S+)$')
 
         # mka pre-shared-key key-chain KCP256 fallback-key-chain KCF256
-        p45 = re.compile(r'^\s*mka pre-shared-key key-chain +(?P<mka_primary_keychain>\S+) fallback-key-chain +(?P<mka_fallback_keychain>\S+)')
+        p45 = regex_engine.compile(r'^\s*mka pre-shared-key key-chain +(?P<mka_primary_keychain>\S+) fallback-key-chain +(?P<mka_fallback_keychain>\S+)')
 
         # ip mtu 1468
-        p46 = re.compile(r'^\s*ip mtu (?P<mtu>\d+)')
+        p46 = regex_engine.compile(r'^\s*ip mtu (?P<mtu>\d+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2723,31 +2721,31 @@ class ShowRunningAAAUserName(ShowRunningConfigAAAUsernameSchema):
             out = output
 
         # user-name testuser
-        p1 = re.compile(r'^user-name +(?P<username>.*)$')
+        p1 = regex_engine.compile(r'^user-name +(?P<username>.*)$')
 
         # creation-time 1628765288
-        p2 = re.compile(r'^creation-time +(?P<creation_time>\d+)$')
+        p2 = regex_engine.compile(r'^creation-time +(?P<creation_time>\d+)$')
 
         # privilege 15
-        p3 = re.compile(r'^privilege +(?P<privilege>\d+)$')
+        p3 = regex_engine.compile(r'^privilege +(?P<privilege>\d+)$')
 
         # common-criteria-policy Test-CC
-        p4 = re.compile(r'^common-criteria-policy +(?P<common_criteria_policy>.*)$')
+        p4 = regex_engine.compile(r'^common-criteria-policy +(?P<common_criteria_policy>.*)$')
 
         # view test
-        p5 = re.compile(r'^view +(?P<view>.*)$')
+        p5 = regex_engine.compile(r'^view +(?P<view>.*)$')
 
         # password 0 P@ssw0rd
-        p6 = re.compile(r'^password +(?P<type>\d) +(?P<password>.*)$')
+        p6 = regex_engine.compile(r'^password +(?P<type>\d) +(?P<password>.*)$')
 
         # type lobby-admin
-        p7 = re.compile(r'^type +(?P<type>lobby-admin|default|mgmt-user)$')
+        p7 = regex_engine.compile(r'^type +(?P<type>lobby-admin|default|mgmt-user)$')
 
         # secret 9 $9$giSG8jar6eJuV.$9Q83x2F4M8cs6UjRqCHSDo6/hrRlHzY5z0IFQOV3lZM
-        p8 = re.compile(r'^secret +(?P<type>\d) +(?P<secret>.*)$')
+        p8 = regex_engine.compile(r'^secret +(?P<type>\d) +(?P<secret>.*)$')
 
         # one-time
-        p9 = re.compile(r'^one-time$')
+        p9 = regex_engine.compile(r'^one-time$')
 
         # Initial return dictionary
         ret_dict = {}
@@ -2843,35 +2841,35 @@ class ShowRunningConfigAAAUsername(ShowRunningConfigAAAUsernameSchema):
             out = output
 
         # username testuser password 0 lab
-        p1 = re.compile(r'^username +(?P<username>\S+) +password +(?P<type>\d) +(?P<password>.*)$')
+        p1 = regex_engine.compile(r'^username +(?P<username>\S+) +password +(?P<type>\d) +(?P<password>.*)$')
 
         # username testuser common-criteria-policy Test-CC password 0 password
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^username +(?P<username>\S+) +common-criteria-policy +(?P<common_criteria_policy>.*) '
             r'+password +(?P<type>\d) +(?P<password>.*)$')
 
         # username testuser secret 9 $9$A2OfV.30kNlIhE$ZEJQIT6aUj.TfCzqGQr.h4AmjQd/bWikQaGRlaLv0nQ
-        p3 = re.compile(r'^username +(?P<username>\S+) +secret +(?P<type>\d) +(?P<secret>.*)$')
+        p3 = regex_engine.compile(r'^username +(?P<username>\S+) +secret +(?P<type>\d) +(?P<secret>.*)$')
 
         # username testuser one-time secret 9 $9$AuJ8xgW8aBBuF.$HyAzLk.3ILFsKrEvd4YjaAHbtonVMLikXw2pnrlkYJY
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^username +(?P<username>\S+) +one-time +(?P<Onetime>)\s*secret +(?P<type>\d+) +(?P<secret>.*)$')
 
         # username testuser privilege 15 password 0 lab
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^username +(?P<username>\S+) +privilege +(?P<privilege>\d+) +password +(?P<type>\d) +(?P<password>.*)$')
 
         # username testuser common-criteria-policy Test-CC secret 9 $9$7K9qbCZMJa2Vuk$6bS3.Bv7AkBXhTHpTH9V9fhMnJCQe1a9O7xBWHtOKo.
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^username +(?P<username>\S+) +common-criteria-policy +(?P<common_criteria_policy>.*) '
             r'+secret +(?P<type>\d) +(?P<secret>.*)$')
 
         # username testuser one-time password 0 password
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^username +(?P<username>\S+) +one-time +(?P<Onetime>)\s*password +(?P<type>\d) +(?P<password>.*)$')
 
         # username developer privilege 15 secret 9 $9$oNguEA9um9vRx.$MsDk0DOy1rzBjKAcySWdNjoKcA7GetG9YNnKOs8S67A
-        p8 = re.compile(r'^username +(?P<username>\S+) +privilege +(?P<privilege>\d+) +secret +(?P<secret_type>\d+) +(?P<secret>\S+)$')
+        p8 = regex_engine.compile(r'^username +(?P<username>\S+) +privilege +(?P<privilege>\d+) +secret +(?P<secret_type>\d+) +(?P<secret>\S+)$')
 
         # Initial return dictionary
         ret_dict = {}
@@ -3014,16 +3012,16 @@ class ShowRunningConfigFlowMonitor(ShowRunningConfigFlowMonitorSchema):
         ret_dict = {}
 
         # flow monitor monitor_l2_in
-        p1 = re.compile(r'^flow\smonitor\s(?P<flow_monitor_name>\S+)$')
+        p1 = regex_engine.compile(r'^flow\smonitor\s(?P<flow_monitor_name>\S+)$')
 
         # exporter StealthWatch_Exporter
-        p2 = re.compile(r'^exporter\s(?P<exporter_name>\S+)$')
+        p2 = regex_engine.compile(r'^exporter\s(?P<exporter_name>\S+)$')
 
         # cache timeout active 60
-        p3 = re.compile(r'^cache\stimeout\s(?P<cache_timeout_type>\S+)\s(?P<cache_timeout_time>\d+)$')
+        p3 = regex_engine.compile(r'^cache\stimeout\s(?P<cache_timeout_type>\S+)\s(?P<cache_timeout_time>\d+)$')
 
         # record record_l2_in
-        p4 = re.compile(r'^record\s(?P<record_name>\S+)$')
+        p4 = regex_engine.compile(r'^record\s(?P<record_name>\S+)$')
 
         for line in out.splitlines():
 
@@ -3125,34 +3123,34 @@ class ShowRunningConfigAAA(ShowRunningConfigAAASchema):
             out = output
 
         # radius server RADIUS_1
-        p1 = re.compile(r'^(?P<server_type>\S+)\sserver\s(?P<server_name>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<server_type>\S+)\sserver\s(?P<server_name>\S+)$')
 
         # address ipv4 11.15.24.213 auth-port 1812 acct-port 1813
-        p2_1 = re.compile(r'^address\s(?P<address_type>\S+)\s(?P<address>\S+)\sauth-port\s(?P<auth_port>\S+)\sacct-port\s(?P<acct_port>\S+)$')
+        p2_1 = regex_engine.compile(r'^address\s(?P<address_type>\S+)\s(?P<address>\S+)\sauth-port\s(?P<auth_port>\S+)\sacct-port\s(?P<acct_port>\S+)$')
 
         # address ipv4 11.15.24.213
-        p2_2 = re.compile(r'^address\s(?P<address_type>\S+)\s(?P<address>\S+)$')
+        p2_2 = regex_engine.compile(r'^address\s(?P<address_type>\S+)\s(?P<address>\S+)$')
 
         # key Cisco123
-        p3 = re.compile(r'^key\s(?P<key>\S+)$')
+        p3 = regex_engine.compile(r'^key\s(?P<key>\S+)$')
 
         # aaa group server radius RADIUS_GROUP
-        p4 = re.compile(r'^aaa\sgroup\sserver\s(?P<server_type>\S+)\s(?P<server>\S+)$')
+        p4 = regex_engine.compile(r'^aaa\sgroup\sserver\s(?P<server_type>\S+)\s(?P<server>\S+)$')
 
         # server name RADIUS_1
-        p5 = re.compile(r'^server\sname\s(?P<server_name>\S+)$')
+        p5 = regex_engine.compile(r'^server\sname\s(?P<server_name>\S+)$')
 
         # ip vrf forwarding newVRF2
-        p6 = re.compile(r'^ip\svrf\sforwarding\s(?P<vrf>\S+)$')
+        p6 = regex_engine.compile(r'^ip\svrf\sforwarding\s(?P<vrf>\S+)$')
 
         # ip radius source-interface TenGigabitEthernet1/0/13
-        p7 = re.compile(r'^ip\s(?P<server_type>\S+)\ssource-interface\s(?P<source_interface>\S+)$')
+        p7 = regex_engine.compile(r'^ip\s(?P<server_type>\S+)\ssource-interface\s(?P<source_interface>\S+)$')
 
         # aaa new-model
-        p8 = re.compile(r'^aaa\s(?P<new_model>\S+)$')
+        p8 = regex_engine.compile(r'^aaa\s(?P<new_model>\S+)$')
 
         # aaa session-id common
-        p9 = re.compile(r'^aaa\ssession-id\s(?P<session_id>\S+)$')
+        p9 = regex_engine.compile(r'^aaa\ssession-id\s(?P<session_id>\S+)$')
 
         ret_dict = {}
 
@@ -3451,80 +3449,87 @@ class ShowRunningConfigNve(ShowRunningConfigNveSchema):
         'show running-config nve'
     ]
 
+    # stanzas needed to parse the other stanzas on their own, see
+    # genie.libs.parser.utils.running_config
+    incremental_context = [
+        r'^l2vpn evpn$',
+        r'^vlan configuration ',
+    ]
+
     def cli(self, output=None):
         if output is None:
             output = self.device.execute(self.cli_command[0])
 
         # l2vpn evpn
-        p1_0 = re.compile(r'^l2vpn evpn$')
+        p1_0 = regex_engine.compile(r'^l2vpn evpn$')
 
         # replication-type ingress
-        p1_1 = re.compile(r'^replication\-type +(?P<rep_type>ingress|static)$')
+        p1_1 = regex_engine.compile(r'^replication\-type +(?P<rep_type>ingress|static)$')
 
         # router-id loopback 0
-        p1_2 = re.compile(r'^router\-id +(?P<router_id>.*)$')
+        p1_2 = regex_engine.compile(r'^router\-id +(?P<router_id>.*)$')
 
         # default-gateway advertise
-        p1_3 = re.compile(r'^default-gateway advertise$')
+        p1_3 = regex_engine.compile(r'^default-gateway advertise$')
 
         # logging peer state
-        p1_4 = re.compile(r'^logging peer state$')
+        p1_4 = regex_engine.compile(r'^logging peer state$')
 
         # mac duplication limit 20 time 5
         # ip duplication limit 20 time 5
-        p1_5 = re.compile(r'^(?P<addr>\w+) duplication limit +(?P<limit_number>\d+) +time (?P<time_limit>\d+)$')
+        p1_5 = regex_engine.compile(r'^(?P<addr>\w+) duplication limit +(?P<limit_number>\d+) +time (?P<time_limit>\d+)$')
 
         # route-target auto vni
-        p1_6 = re.compile(r'^route\-target auto vni$')
+        p1_6 = regex_engine.compile(r'^route\-target auto vni$')
 
         # l2vpn evpn instance 1 vlan-based
-        p1_7 = re.compile(r'^l2vpn evpn instance +(?P<l2vpn_evi>\d+) +vlan-based$')
+        p1_7 = regex_engine.compile(r'^l2vpn evpn instance +(?P<l2vpn_evi>\d+) +vlan-based$')
 
         # encapsulation vxlan
-        p1_8 = re.compile(r'^encapsulation +(?P<encapsulation>\w+)$')
+        p1_8 = regex_engine.compile(r'^encapsulation +(?P<encapsulation>\w+)$')
 
         # default-gateway advertise enable
-        p1_9 = re.compile(r'^default\-gateway advertise +(?P<adv_default_gateway>enable|disable)$')
+        p1_9 = regex_engine.compile(r'^default\-gateway advertise +(?P<adv_default_gateway>enable|disable)$')
 
         # ip local-learning enable
-        p1_10 = re.compile(r'^ip local\-learning +(?P<learn_ip_addr>enable|disable)$')
+        p1_10 = regex_engine.compile(r'^ip local\-learning +(?P<learn_ip_addr>enable|disable)$')
 
         # no auto-route-target
-        p1_11 = re.compile(r'^no auto-route\-target$')
+        p1_11 = regex_engine.compile(r'^no auto-route\-target$')
 
         # rd 65000:100
-        p1_12 = re.compile(r'^rd +(?P<rd>[\d:]+)$')
+        p1_12 = regex_engine.compile(r'^rd +(?P<rd>[\d:]+)$')
 
         # route-target import 3:201
         # route-target export 1:201
         # route-target both 65000:100
         # route-target export 100:1 stitching
-        p1_13 = re.compile(r'^route\-target +(?P<type>import|export|both) +(?P<rt>[\d:]+)(\s+(?P<stitch>stitching))?$')
+        p1_13 = regex_engine.compile(r'^route\-target +(?P<type>import|export|both) +(?P<rt>[\d:]+)(\s+(?P<stitch>stitching))?$')
 
         # flooding-suppression address-resolution disable
-        p1_14 = re.compile(r'^flooding\-suppression address\-resolution disable$')
+        p1_14 = regex_engine.compile(r'^flooding\-suppression address\-resolution disable$')
 
         # vlan configuration 200
-        p2_0 = re.compile(r'^vlan configuration +(?P<vlan_id>\d+)$')
+        p2_0 = regex_engine.compile(r'^vlan configuration +(?P<vlan_id>\d+)$')
 
         #   interface nve1
         #   interface GigabitEthernet1/0/30
         #   interface Loopback14
         #   interface Vlan200
-        p3_0 = re.compile(r'^interface +(?P<if_name>.*)$')
+        p3_0 = regex_engine.compile(r'^interface +(?P<if_name>.*)$')
 
         #   no ip address
-        p3_1 = re.compile(r'^no ip address$')
+        p3_1 = regex_engine.compile(r'^no ip address$')
 
         #   host-reachability protocol bgp
-        p3_2 = re.compile(r'^host-reachability protocol +(?P<host_reachability_protocol>\w+)$')
+        p3_2 = regex_engine.compile(r'^host-reachability protocol +(?P<host_reachability_protocol>\w+)$')
 
         #   source-interface loopback1
-        p3_3 = re.compile(r'^source\-interface +(?P<source_if>\w+)$')
+        p3_3 = regex_engine.compile(r'^source\-interface +(?P<source_if>\w+)$')
 
         #   vxlan encapsulation dual-stack prefer-ipv6 underlay-mcast ipv4
         #   vxlan encapsulation ipv6
-        p3_3_1 = re.compile(r'^vxlan encapsulation +(?P<type>dual-stack|ipv6|ipv4)(.*)?$')
+        p3_3_1 = regex_engine.compile(r'^vxlan encapsulation +(?P<type>dual-stack|ipv6|ipv4)(.*)?$')
 
         #   member vni 5000 vrf green
         #   member vni 6000 ingress-replication
@@ -3532,148 +3537,148 @@ class ShowRunningConfigNve(ShowRunningConfigNveSchema):
         #   member evpn-instance 1 vni 6000
         #   member vni 10101 mcast-group 225.0.0.101 FF0E:225::101
         #   member vni 10101 mcast-group FF0E:225::101
-        p3_4 = re.compile(r'^member +(evpn\-instance +(?P<evi>\d+) )?vni (?P<vni>[\d\-]+)( +vrf\s+(?P<vrf>\w+))?( +(?P<type>ingress\-replication|mcast\-group\s+(?P<mcast_group>([\d.]+))?(\s+)?(?P<mcast_group_ipv6>[\da-fA-F:]+)?))?$')
+        p3_4 = regex_engine.compile(r'^member +(evpn\-instance +(?P<evi>\d+) )?vni (?P<vni>[\d\-]+)( +vrf\s+(?P<vrf>\w+))?( +(?P<type>ingress\-replication|mcast\-group\s+(?P<mcast_group>([\d.]+))?(\s+)?(?P<mcast_group_ipv6>[\da-fA-F:]+)?))?$')
 
         # no shutdown
-        p3_5 = re.compile(r'^no +shutdown$')
+        p3_5 = regex_engine.compile(r'^no +shutdown$')
 
         #   description core svi for l3vni
         #   description access-svi
-        p3_6 = re.compile(r'^description +(?P<descr>.+)$')
+        p3_6 = regex_engine.compile(r'^description +(?P<descr>.+)$')
 
         #   vrf forwarding green
-        p3_7 = re.compile(r'^vrf +forwarding +(?P<vrf_name>.+)$')
+        p3_7 = regex_engine.compile(r'^vrf +forwarding +(?P<vrf_name>.+)$')
 
         #   ip address 192.168.1.201 255.255.255.0
         #   ip address 192.168.1.202 255.255.255.0 secondary
-        p3_8 = re.compile(r'^ip +address +(?P<ipv4>[\d.]+)\s(?P<mask>[\d.]+)(\s+(?P<sec>secondary))?$')
+        p3_8 = regex_engine.compile(r'^ip +address +(?P<ipv4>[\d.]+)\s(?P<mask>[\d.]+)(\s+(?P<sec>secondary))?$')
 
         #   ipv6 address 2001:DB8:201::201/64
-        p3_9 = re.compile(r'^ipv6 +address +(?P<ipv6>[\da-fA-F:]+)(?P<mask>/\d+)$')
+        p3_9 = regex_engine.compile(r'^ipv6 +address +(?P<ipv6>[\da-fA-F:]+)(?P<mask>/\d+)$')
 
         #   ipv6 enable
-        p3_10 = re.compile(r'^ipv6 +enable$')
+        p3_10 = regex_engine.compile(r'^ipv6 +enable$')
 
         #   mac-address aabb.cc01.f100
-        p3_11 = re.compile(r'^mac\-address +(?P<mac>[\da-f.]+)$')
+        p3_11 = regex_engine.compile(r'^mac\-address +(?P<mac>[\da-f.]+)$')
 
         #   ip unnumbered Loopback0
-        p3_12 = re.compile(r'^ip +unnumbered +(?P<if_loopback>.+)$')
+        p3_12 = regex_engine.compile(r'^ip +unnumbered +(?P<if_loopback>.+)$')
 
         #   no autostate
-        p3_13 = re.compile(r'^no +autostate$')
+        p3_13 = regex_engine.compile(r'^no +autostate$')
 
         #   ip pim sparse-mode
-        p3_14 = re.compile(r'^ip +pim +sparse\-mode$')
+        p3_14 = regex_engine.compile(r'^ip +pim +sparse\-mode$')
 
         #   private-vlan mapping 222-224
         #   private-vlan mapping add 303-307,309,440
-        p3_15 = re.compile(r'^private\-vlan +mapping *(?P<action>add|remove)? *(?P<vlan_id>[\d\-,]+)$')
+        p3_15 = regex_engine.compile(r'^private\-vlan +mapping *(?P<action>add|remove)? *(?P<vlan_id>[\d\-,]+)$')
 
         #   ip helper-address 10.1.1.1
         #   ip helper-address global 10.1.1.1
         #   ip helper-address vrf green 10.1.1.1
-        p3_16 = re.compile(r'^ip +helper\-address +((?P<reachable_over>(global|vrf \S+)) +)?(?P<ip>[\d.]+)$')
+        p3_16 = regex_engine.compile(r'^ip +helper\-address +((?P<reachable_over>(global|vrf \S+)) +)?(?P<ip>[\d.]+)$')
 
         #   ip dhcp relay source-interface Loopback12
-        p3_17 = re.compile(r'^ip +dhcp +relay +source\-interface +(?P<if_name>\S+)$')
+        p3_17 = regex_engine.compile(r'^ip +dhcp +relay +source\-interface +(?P<if_name>\S+)$')
 
         #   router bgp 65535.65535
-        p4_0 = re.compile(r'^router +bgp +(?P<asn>[\d.]+)$')
+        p4_0 = regex_engine.compile(r'^router +bgp +(?P<asn>[\d.]+)$')
 
         #   bgp router-id interface Loopback0
-        p4_1 = re.compile(r'^bgp +router\-id +interface +(?P<if_name>\S+)$')
+        p4_1 = regex_engine.compile(r'^bgp +router\-id +interface +(?P<if_name>\S+)$')
 
         #   bgp log-neighbor-changes
-        p4_2 = re.compile(r'^bgp +log\-neighbor\-changes$')
+        p4_2 = regex_engine.compile(r'^bgp +log\-neighbor\-changes$')
 
         #   bgp update-delay 240
-        p4_3 = re.compile(r'^bgp +update\-delay +(?P<delay_time>\d+)$')
+        p4_3 = regex_engine.compile(r'^bgp +update\-delay +(?P<delay_time>\d+)$')
 
         #   bgp graceful-restart
-        p4_4 = re.compile(r'^bgp +graceful\-restart$')
+        p4_4 = regex_engine.compile(r'^bgp +graceful\-restart$')
 
         #   no bgp default ipv4-unicast
-        p4_5 = re.compile(r'^no +bgp +default +ipv4\-unicast$')
+        p4_5 = regex_engine.compile(r'^no +bgp +default +ipv4\-unicast$')
 
         #   neighbor 10.11.11.11 remote-as 1
-        p4_6 = re.compile(r'^neighbor +(?P<ip>[\d.]+) +remote\-as +(?P<remote_as>[\d.]+)$')
+        p4_6 = regex_engine.compile(r'^neighbor +(?P<ip>[\d.]+) +remote\-as +(?P<remote_as>[\d.]+)$')
 
         #   neighbor 10.11.11.11 update-source Loopback0
-        p4_7 = re.compile(r'^neighbor +(?P<ip>[\d.]+) +update\-source +(?P<if_name>\S+)$')
+        p4_7 = regex_engine.compile(r'^neighbor +(?P<ip>[\d.]+) +update\-source +(?P<if_name>\S+)$')
 
         #   address-family l2vpn evpn
         #   address-family ipv4
         #   address-family ipv4 vrf green
         #   address-family ipv4 mvpn
         #   address-family ipv6 mvpn
-        p4_8 = re.compile(r'^address\-family +(?P<family_name>l2vpn evpn|ipv4|ipv6|ipv4 mvpn|ipv6 mvpn)(\s+vrf +(?P<vrf_name>\S+))?$')
+        p4_8 = regex_engine.compile(r'^address\-family +(?P<family_name>l2vpn evpn|ipv4|ipv6|ipv4 mvpn|ipv6 mvpn)(\s+vrf +(?P<vrf_name>\S+))?$')
 
         #   bgp additional-paths select all
-        p4_9 = re.compile(r'^bgp +additional\-paths +select +all$')
+        p4_9 = regex_engine.compile(r'^bgp +additional\-paths +select +all$')
 
         #   bgp additional-paths send
-        p4_10 = re.compile(r'^bgp +additional\-paths +(?P<option>send|receive|send receive)$')
+        p4_10 = regex_engine.compile(r'^bgp +additional\-paths +(?P<option>send|receive|send receive)$')
 
         #   neighbor 10.5.5.50 activate
         #   neighbor FD00:172:16:255::1 activate
-        p4_11 = re.compile(r'^neighbor +(?P<ip>([\d.]+|[a-fA-F\d\:]+)) +activate$')
+        p4_11 = regex_engine.compile(r'^neighbor +(?P<ip>([\d.]+|[a-fA-F\d\:]+)) +activate$')
 
         #   neighbor 10.5.5.50 send-community both
         #   neighbor FD00:172:16:255::1 send-community extended
-        p4_12 = re.compile(r'^neighbor +(?P<ip>([\d.]+|[a-fA-F\d\:]+)) +send\-community +(?P<community_attr>both|extended|standard)$')
+        p4_12 = regex_engine.compile(r'^neighbor +(?P<ip>([\d.]+|[a-fA-F\d\:]+)) +send\-community +(?P<community_attr>both|extended|standard)$')
 
         #   neighbor 10.5.5.50 additional-paths send
         #   neighbor FD00:172:16:255::1 additional-paths send
-        p4_13 = re.compile(r'^neighbor +(?P<ip>([\d.]+|[a-fA-F\d\:]+)) +additional\-paths +(?P<option>send|receive|send receive)$')
+        p4_13 = regex_engine.compile(r'^neighbor +(?P<ip>([\d.]+|[a-fA-F\d\:]+)) +additional\-paths +(?P<option>send|receive|send receive)$')
 
         #   neighbor 10.5.5.50 advertise additional-paths best 2
         #   neighbor 10.5.5.50 advertise additional-paths group-best
         #   neighbor 10.5.5.50 advertise additional-paths all group-best
         #   neighbor FD00:172:16:255::1 advertise additional-paths best 2
-        p4_14 = re.compile(r'^neighbor +(?P<ip>([\d.]+|[a-fA-F\d\:]+)) +advertise +additional\-paths +(?P<option>.*)$')
+        p4_14 = regex_engine.compile(r'^neighbor +(?P<ip>([\d.]+|[a-fA-F\d\:]+)) +advertise +additional\-paths +(?P<option>.*)$')
 
         #   advertise l2vpn evpn
-        p4_15 = re.compile(r'^advertise +l2vpn +evpn$')
+        p4_15 = regex_engine.compile(r'^advertise +l2vpn +evpn$')
 
         #   redistribute connected
-        p4_16 = re.compile(r'^redistribute +connected$')
+        p4_16 = regex_engine.compile(r'^redistribute +connected$')
 
         #   redistribute static
-        p4_17 = re.compile(r'^redistribute +static$')
+        p4_17 = regex_engine.compile(r'^redistribute +static$')
 
         #   maximum-paths 4
-        p4_18 = re.compile(r'^maximum\-paths +(?P<max_path>\d+)$')
+        p4_18 = regex_engine.compile(r'^maximum\-paths +(?P<max_path>\d+)$')
 
         #   default-information originate
-        p4_19 = re.compile(r'^default\-information +originate$')
+        p4_19 = regex_engine.compile(r'^default\-information +originate$')
 
         #   vrf definition green
-        p5_0 = re.compile(r'^vrf +definition +(?P<vrf_name>\S+)$')
+        p5_0 = regex_engine.compile(r'^vrf +definition +(?P<vrf_name>\S+)$')
 
         #   mdt default vxlan 225.2.2.2
-        p5_1 = re.compile(r'^mdt +default +vxlan +(?P<group_addr>\S+)$')
+        p5_1 = regex_engine.compile(r'^mdt +default +vxlan +(?P<group_addr>\S+)$')
 
         #   mdt auto-discovery vxlan
         #   mdt auto-discovery vxlan inter-as
-        p5_2 = re.compile(r'^mdt +auto\-discovery +(?P<option>\S+)(\s+(?P<inter_as>inter\-as))?$')
+        p5_2 = regex_engine.compile(r'^mdt +auto\-discovery +(?P<option>\S+)(\s+(?P<inter_as>inter\-as))?$')
 
         #   mdt strict-rpf interface
-        p5_3 = re.compile(r'^mdt +strict\-rpf +interface$')
+        p5_3 = regex_engine.compile(r'^mdt +strict\-rpf +interface$')
 
         #  ip pim vrf green rp-address 10.2.255.255
         #  ipv6 pim vrf green rp-address FC00:2:255::255
-        p5_4 = re.compile(r'^(?P<ip>ip|ipv6) pim vrf (?P<vrf>\w+) rp\-address (?P<ip_addr>[\da-fA-F:|\d.]+)$')
+        p5_4 = regex_engine.compile(r'^(?P<ip>ip|ipv6) pim vrf (?P<vrf>\w+) rp\-address (?P<ip_addr>[\da-fA-F:|\d.]+)$')
 
         #  ip pim vrf green register-source Loopback11
         #  ipv6 pim vrf green register-source Loopback11
-        p5_5 = re.compile(r'^(?P<ip>ip|ipv6) pim vrf (?P<vrf>\w+) register\-source (?P<reg_source>[\w\d]+)$')
+        p5_5 = regex_engine.compile(r'^(?P<ip>ip|ipv6) pim vrf (?P<vrf>\w+) register\-source (?P<reg_source>[\w\d]+)$')
 
         #  mdt data vxlan 225.2.2.0 0.0.0.255
-        p5_6 = re.compile(r'^mdt +data +vxlan +(?P<group_addr>[\d.]+) +(?P<mask>[\d.]+)$')
+        p5_6 = regex_engine.compile(r'^mdt +data +vxlan +(?P<group_addr>[\d.]+) +(?P<mask>[\d.]+)$')
 
         #  mdt data threshold 111
-        p5_7 = re.compile(r'^mdt +data +threshold +(?P<threshold>\d+)$')
+        p5_7 = regex_engine.compile(r'^mdt +data +threshold +(?P<threshold>\d+)$')
 
         ret_dict = {}
         bgp_asn = ''
@@ -4338,7 +4343,7 @@ class ShowRunRoute(ShowRunRouteSchema):
         res_dict = {}
         
         # ip route 10.64.67.187 255.255.255.255 9.30.0.1
-        p1 = re.compile(r'(?P<routes>ip\s+route\s+\d+\.\d+\.\d+\.\d+\s+\d+\.\d+\.\d+\.\d+\s+\d+\.\d+\.\d+\.\d+)')
+        p1 = regex_engine.compile(r'(?P<routes>ip\s+route\s+\d+\.\d+\.\d+\.\d+\s+\d+\.\d+\.\d+\.\d+\s+\d+\.\d+\.\d+\.\d+)')
         
         for line in output.splitlines():
 
@@ -4419,71 +4424,71 @@ class ShowRunSectionBgp(ShowRunSectionBgpSchema):
         bgp_asn = ''
 
         # router bgp 65535.65535
-        p0 = re.compile(r'^router +bgp +(?P<asn>[\d.]+)$')
+        p0 = regex_engine.compile(r'^router +bgp +(?P<asn>[\d.]+)$')
 
         #   bgp router-id interface Loopback0
         #   bgp router-id 172.16.255.4
-        p1 = re.compile(r'^bgp\s+router-id(?:\s+interface\s+(?P<if_name>\S+))?$|^bgp\s+router-id\s+(?P<ip_address>\S+)\s*$')
+        p1 = regex_engine.compile(r'^bgp\s+router-id(?:\s+interface\s+(?P<if_name>\S+))?$|^bgp\s+router-id\s+(?P<ip_address>\S+)\s*$')
 
         #   bgp log-neighbor-changes
-        p2 = re.compile(r'^bgp +log\-neighbor\-changes$')
+        p2 = regex_engine.compile(r'^bgp +log\-neighbor\-changes$')
 
         #   bgp update-delay 240
-        p3 = re.compile(r'^bgp +update\-delay +(?P<delay_time>\d+)$')
+        p3 = regex_engine.compile(r'^bgp +update\-delay +(?P<delay_time>\d+)$')
 
         #   bgp graceful-restart
-        p4 = re.compile(r'^bgp +graceful\-restart$')
+        p4 = regex_engine.compile(r'^bgp +graceful\-restart$')
 
         #   no bgp default ipv4-unicast
-        p5 = re.compile(r'^no +bgp +default +ipv4\-unicast$')
+        p5 = regex_engine.compile(r'^no +bgp +default +ipv4\-unicast$')
 
         #   neighbor 10.11.11.11 remote-as 1
-        p6 = re.compile(r'^neighbor +(?P<ip>[\d.]+) +remote\-as +(?P<remote_as>[\d.]+)$')
+        p6 = regex_engine.compile(r'^neighbor +(?P<ip>[\d.]+) +remote\-as +(?P<remote_as>[\d.]+)$')
 
         #   neighbor 10.11.11.11 update-source Loopback0
-        p7 = re.compile(r'^neighbor +(?P<ip>[\d.]+) +update\-source +(?P<if_name>\S+)$')
+        p7 = regex_engine.compile(r'^neighbor +(?P<ip>[\d.]+) +update\-source +(?P<if_name>\S+)$')
 
         #   address-family l2vpn evpn
         #   address-family ipv4
         #   address-family ipv4 vrf green
         #   address-family mvpn ipv4
         #   address-family mvpn ipv6
-        p8 = re.compile(r'^address\-family +(?P<family_name>l2vpn evpn|ipv4|ipv6|ipv4 mvpn|ipv6 mvpn)(\s+vrf +(?P<vrf_name>\S+))?$')
+        p8 = regex_engine.compile(r'^address\-family +(?P<family_name>l2vpn evpn|ipv4|ipv6|ipv4 mvpn|ipv6 mvpn)(\s+vrf +(?P<vrf_name>\S+))?$')
 
         #   bgp additional-paths select all
-        p9 = re.compile(r'^bgp +additional\-paths +select +all$')
+        p9 = regex_engine.compile(r'^bgp +additional\-paths +select +all$')
 
         #   bgp additional-paths send
-        p10 = re.compile(r'^bgp +additional\-paths +(?P<option>send|receive|send receive)$')
+        p10 = regex_engine.compile(r'^bgp +additional\-paths +(?P<option>send|receive|send receive)$')
 
         #   neighbor 10.5.5.50 activate
-        p11 = re.compile(r'^neighbor +(?P<ip>[\d.]+) +activate$')
+        p11 = regex_engine.compile(r'^neighbor +(?P<ip>[\d.]+) +activate$')
 
         #   neighbor 10.5.5.50 send-community both
-        p12 = re.compile(r'^neighbor +(?P<ip>[\d.]+) +send\-community +(?P<community_attr>both|extended|standard)$')
+        p12 = regex_engine.compile(r'^neighbor +(?P<ip>[\d.]+) +send\-community +(?P<community_attr>both|extended|standard)$')
 
         #   neighbor 10.5.5.50 additional-paths send
-        p13 = re.compile(r'^neighbor +(?P<ip>[\d.]+) +additional\-paths +(?P<option>send|receive|send receive)$')
+        p13 = regex_engine.compile(r'^neighbor +(?P<ip>[\d.]+) +additional\-paths +(?P<option>send|receive|send receive)$')
 
         #   neighbor 10.5.5.50 advertise additional-paths best 2
         #   neighbor 10.5.5.50 advertise additional-paths group-best
         #   neighbor 10.5.5.50 advertise additional-paths all group-best
-        p14 = re.compile(r'^neighbor +(?P<ip>[\d.]+) +advertise +additional\-paths +(?P<option>.*)$')
+        p14 = regex_engine.compile(r'^neighbor +(?P<ip>[\d.]+) +advertise +additional\-paths +(?P<option>.*)$')
 
         #   advertise l2vpn evpn
-        p15 = re.compile(r'^advertise +l2vpn +evpn$')
+        p15 = regex_engine.compile(r'^advertise +l2vpn +evpn$')
 
         #   redistribute connected
-        p16 = re.compile(r'^redistribute +connected$')
+        p16 = regex_engine.compile(r'^redistribute +connected$')
 
         #   redistribute static
-        p17 = re.compile(r'^redistribute +static$')
+        p17 = regex_engine.compile(r'^redistribute +static$')
 
         #   maximum-paths 4
-        p18 = re.compile(r'^maximum\-paths +(?P<max_path>\d+)$')
+        p18 = regex_engine.compile(r'^maximum\-paths +(?P<max_path>\d+)$')
 
         #   default-information originate
-        p19 = re.compile(r'^default\-information +originate$')
+        p19 = regex_engine.compile(r'^default\-information +originate$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4668,20 +4673,20 @@ class ShowRunSectionVrfDefinition(ShowRunSectionVrfDefinitionSchema):
             output = self.device.execute(self.cli_command)
 
         # vrf definition ce1
-        p0 = re.compile(r'^vrf +definition +(?P<vrf>\S+)$')
+        p0 = regex_engine.compile(r'^vrf +definition +(?P<vrf>\S+)$')
 
         #  rd 2:2
-        p1 = re.compile(r'^rd +(?P<rd>[\d:]+)$')
+        p1 = regex_engine.compile(r'^rd +(?P<rd>[\d:]+)$')
 
         #   address-family ipv4
         #   address-family ipv4 unicast
-        p2 = re.compile(r'^address\-family +(?P<af>ipv4|ipv6|ipv4 unicast|ipv4 multicast|ipv6 unicast|ipv6 multicast)$')
+        p2 = regex_engine.compile(r'^address\-family +(?P<af>ipv4|ipv6|ipv4 unicast|ipv4 multicast|ipv6 unicast|ipv6 multicast)$')
 
         # route-target import 3:201
         # route-target export 1:201
         # route-target both 65000:100
         # route-target export 100:1 stitching
-        p3 = re.compile(r'^route\-target +(?P<type>import|export|both) +(?P<rt>[\d:]+)(\s+(?P<stitch>stitching))?$')
+        p3 = regex_engine.compile(r'^route\-target +(?P<type>import|export|both) +(?P<rt>[\d:]+)(\s+(?P<stitch>stitching))?$')
 
         ret_dict = {}
 
@@ -4760,7 +4765,7 @@ class ShowRunSectionMacAddress(ShowRunSectionMacAddressSchema):
         ret_dict = {}
 
         # mac address-table static 0075.c3e4.b824 vlan 1000 drop
-        p0 = re.compile(r'^mac +address-table +(?P<type>[\w]+)\s+(?P<mac_address>[\w\d\.]+)\s+vlan+\s(?P<vlan>[\d]+)\s+(?P<port>[\w]+)$')
+        p0 = regex_engine.compile(r'^mac +address-table +(?P<type>[\w]+)\s+(?P<mac_address>[\w\d\.]+)\s+vlan+\s(?P<vlan>[\d]+)\s+(?P<port>[\w]+)$')
         for line in output.splitlines():
             line = line.strip()
 
@@ -4817,11 +4822,11 @@ class ShowRunningConfigAllClassMap(ShowRunningConfigAllClassMapSchema):
         class_map_dict={}
 
         # class system-cpp-default-v4
-        p1 = re.compile(r'^class +(?P<class_map>([\w\-\_]+))$')
+        p1 = regex_engine.compile(r'^class +(?P<class_map>([\w\-\_]+))$')
 
         # police rate 2000 pps
         # police rate 10000000000
-        p2 = re.compile(r'^police +rate +(?P<rate>\d+)\s*((?P<rate_mode>pps))?$')
+        p2 = regex_engine.compile(r'^police +rate +(?P<rate>\d+)\s*((?P<rate_mode>pps))?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2,7 +2,6 @@
    supported commands:
      *  show sdm prefer
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -14,6 +13,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -106,165 +106,165 @@ class ShowSdmPrefer(ShowSdmPreferSchema):
         # initial regexp pattern for
 
         # Showing SDM Template Info
-        p0 = re.compile(r'^Showing+\s+(?P<template_title>[\w]+)+\s+Template Info+$')
+        p0 = regex_engine.compile(r'^Showing+\s+(?P<template_title>[\w]+)+\s+Template Info+$')
 
         # "This is the Custom template"
-        p1 = re.compile(r'^This is the+\s+(?P<template_type>[\w]+)+\s+template+\.+$')
+        p1 = regex_engine.compile(r'^This is the+\s+(?P<template_type>[\w]+)+\s+template+\.+$')
 
         #  Security Ingress IPv4 Access Control Entries*:       7168   (current) - 7168   (proposed)
-        p2 = re.compile(r'^Security Ingress IPv4 Access Control Entries\*\:+\s+(?P<current_ingress_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_ingress_ipv4>[\d]+)+\s+\(proposed\)+$')
+        p2 = regex_engine.compile(r'^Security Ingress IPv4 Access Control Entries\*\:+\s+(?P<current_ingress_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_ingress_ipv4>[\d]+)+\s+\(proposed\)+$')
 
         #  Security Ingress Non-IPv4 Access Control Entries*:   5120   (current) - 5120   (proposed)
-        p3 = re.compile(r'^Security Ingress Non-IPv4 Access Control Entries\*\:+\s+(?P<current_ingress_non_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_ingress_non_ipv4>[\d]+)+\s+\(proposed\)+$')
+        p3 = regex_engine.compile(r'^Security Ingress Non-IPv4 Access Control Entries\*\:+\s+(?P<current_ingress_non_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_ingress_non_ipv4>[\d]+)+\s+\(proposed\)+$')
 
         #  Security Egress IPv4 Access Control Entries*:        7168   (current) - 7168   (proposed)
-        p4 = re.compile(r'^Security Egress IPv4 Access Control Entries\*\:+\s+(?P<current_egress_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_egress_ipv4>[\d]+)+\s+\(proposed\)+$')
+        p4 = regex_engine.compile(r'^Security Egress IPv4 Access Control Entries\*\:+\s+(?P<current_egress_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_egress_ipv4>[\d]+)+\s+\(proposed\)+$')
 
         #  Security Egress Non-IPv4 Access Control Entries*:    8192   (current) - 8192   (proposed)
-        p5 = re.compile(r'^Security Egress Non-IPv4 Access Control Entries\*\:+\s+(?P<current_egress_non_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_egress_non_ipv4>[\d]+)+\s+\(proposed\)+$')
+        p5 = regex_engine.compile(r'^Security Egress Non-IPv4 Access Control Entries\*\:+\s+(?P<current_egress_non_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_egress_non_ipv4>[\d]+)+\s+\(proposed\)+$')
 
         #  QoS Ingress IPv4 Access Control Entries*:            5632   (current) - 5632   (proposed)
-        p6 = re.compile(r'^QoS Ingress IPv4 Access Control Entries\*\:+\s+(?P<current_qos_ingress_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_qos_ingress_ipv4>[\d]+)+\s+\(proposed\)+$')
+        p6 = regex_engine.compile(r'^QoS Ingress IPv4 Access Control Entries\*\:+\s+(?P<current_qos_ingress_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_qos_ingress_ipv4>[\d]+)+\s+\(proposed\)+$')
 
         #  QoS Ingress Non-IPv4 Access Control Entries*:        2560   (current) - 2560   (proposed)
-        p7 = re.compile(r'^QoS Ingress Non-IPv4 Access Control Entries\*\:+\s+(?P<current_qos_ingress_non_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_qos_ingress_non_ipv4>[\d]+)+\s+\(proposed\)+$')
+        p7 = regex_engine.compile(r'^QoS Ingress Non-IPv4 Access Control Entries\*\:+\s+(?P<current_qos_ingress_non_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_qos_ingress_non_ipv4>[\d]+)+\s+\(proposed\)+$')
 
         #  QoS Egress IPv4 Access Control Entries*:             6144   (current) - 6144   (proposed)
-        p8 = re.compile(r'^QoS Egress IPv4 Access Control Entries\*\:+\s+(?P<current_qos_egress_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_qos_egress_ipv4>[\d]+)+\s+\(proposed\)+$')
+        p8 = regex_engine.compile(r'^QoS Egress IPv4 Access Control Entries\*\:+\s+(?P<current_qos_egress_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_qos_egress_ipv4>[\d]+)+\s+\(proposed\)+$')
 
         #  QoS Egress Non-IPv4 Access Control Entries*:         2048   (current) - 2048   (proposed)
-        p9 = re.compile(r'^QoS Egress Non-IPv4 Access Control Entries+\*+\:+\s+(?P<current_qos_egress_non_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_qos_egress_non_ipv4>[\d]+)+\s+\(proposed\)+$')
+        p9 = regex_engine.compile(r'^QoS Egress Non-IPv4 Access Control Entries+\*+\:+\s+(?P<current_qos_egress_non_ipv4>[\d]+)+\s+\(current\) -+\s+(?P<proposed_qos_egress_non_ipv4>[\d]+)+\s+\(proposed\)+$')
 
         #  Netflow Input Access Control Entries*:               512    (current) - 512    (proposed)
-        p10 = re.compile(r'^Netflow Input Access Control Entries\*\:+\s+(?P<current_netflow_input_entry>[\d]+)+\s+\(current\) -+\s+(?P<proposed_netflow_input_entry>[\d]+)+\s+\(proposed\)+$')
+        p10 = regex_engine.compile(r'^Netflow Input Access Control Entries\*\:+\s+(?P<current_netflow_input_entry>[\d]+)+\s+\(current\) -+\s+(?P<proposed_netflow_input_entry>[\d]+)+\s+\(proposed\)+$')
 
         #  Netflow Output Access Control Entries*:              512    (current) - 512    (proposed)
-        p11 = re.compile(r'^Netflow Output Access Control Entries\*\:+\s+(?P<current_netflow_output_entry>[\d]+)+\s+\(current\) -+\s+(?P<proposed_netflow_output_entry>[\d]+)+\s+\(proposed\)+$')
+        p11 = regex_engine.compile(r'^Netflow Output Access Control Entries\*\:+\s+(?P<current_netflow_output_entry>[\d]+)+\s+\(current\) -+\s+(?P<proposed_netflow_output_entry>[\d]+)+\s+\(proposed\)+$')
 
         #  Flow SPAN Input Access Control Entries*:             512    (current) - 512    (proposed)
-        p12 = re.compile(r'^Flow SPAN Input Access Control Entries\*\:+\s+(?P<current_flow_span_input_entry>[\d]+)+\s+\(current\) -+\s+(?P<proposed_flow_span_input_entry>[\d]+)+\s+\(proposed\)+$')
+        p12 = regex_engine.compile(r'^Flow SPAN Input Access Control Entries\*\:+\s+(?P<current_flow_span_input_entry>[\d]+)+\s+\(current\) -+\s+(?P<proposed_flow_span_input_entry>[\d]+)+\s+\(proposed\)+$')
 
         #   Flow SPAN Output Access Control Entries*:            512    (current) - 512    (proposed)
-        p13 = re.compile(r'^Flow SPAN Output Access Control Entries\*\:+\s+(?P<current_flow_span_output_entry>[\d]+)+\s+\(current\) -+\s+(?P<proposed_flow_span_output_entry>[\d]+)+\s+\(proposed\)+$')
+        p13 = regex_engine.compile(r'^Flow SPAN Output Access Control Entries\*\:+\s+(?P<current_flow_span_output_entry>[\d]+)+\s+\(current\) -+\s+(?P<proposed_flow_span_output_entry>[\d]+)+\s+\(proposed\)+$')
 
         # Number of VLANs:                                      4094
         # Number of VLANs                                     4094 (**)
-        p14 = re.compile(r'^Number of VLANs\:?\s+(?P<vlan_count>[\d]+)[\s\(\*\)]*$')
+        p14 = regex_engine.compile(r'^Number of VLANs\:?\s+(?P<vlan_count>[\d]+)[\s\(\*\)]*$')
 
         # Unicast MAC addresses*:                              98304
         # Unicast MAC addresses                               65536
-        p15 = re.compile(r'^Unicast MAC addresses+\*?\:?\s+(?P<unicast_mac_addresses_count>[\d]+)$')
+        p15 = regex_engine.compile(r'^Unicast MAC addresses+\*?\:?\s+(?P<unicast_mac_addresses_count>[\d]+)$')
 
         # Overflow Unicast MAC addresses*:                     768
         # Overflow Unicast MAC addresses                      512 (**)
-        p16 = re.compile(r'^Overflow Unicast MAC addresses+\*?\:?\s+(?P<overflow_mac_addresses_count>[\d]+)[\s\(\*\)]*$')
+        p16 = regex_engine.compile(r'^Overflow Unicast MAC addresses+\*?\:?\s+(?P<overflow_mac_addresses_count>[\d]+)[\s\(\*\)]*$')
 
         # Overflow L2 Multicast entries*:                      2048
-        p17 = re.compile(r'^Overflow L2 Multicast entries+\*?\:+\s+(?P<overflow_l2_muticast_entries>[\d]+)$')
+        p17 = regex_engine.compile(r'^Overflow L2 Multicast entries+\*?\:+\s+(?P<overflow_l2_muticast_entries>[\d]+)$')
 
         # L2 Multicast entries*:                               16384
-        p17_1 = re.compile(r'^L2 Multicast entries\*?\:?\s+(?P<l2_muticast_entries>[\d]+)[\s\(\*\)]*$')
+        p17_1 = regex_engine.compile(r'^L2 Multicast entries\*?\:?\s+(?P<l2_muticast_entries>[\d]+)[\s\(\*\)]*$')
 
         # L3 Multicast entries*:                               16384
         # L3 Multicast entries                                8192 (**)
-        p18 = re.compile(r'^L3 Multicast entries\*?\:?\s+(?P<l3_muticast_entries>[\d]+)[\s\(\*\)]*$')
+        p18 = regex_engine.compile(r'^L3 Multicast entries\*?\:?\s+(?P<l3_muticast_entries>[\d]+)[\s\(\*\)]*$')
 
         # Overflow L3 Multicast entries*:                      768
-        p19 = re.compile(r'^Overflow L3 Multicast entries\*?\:+\s+(?P<overflow_l3_muticast_entries>[\d]+)$')
+        p19 = regex_engine.compile(r'^Overflow L3 Multicast entries\*?\:+\s+(?P<overflow_l3_muticast_entries>[\d]+)$')
 
         # Ipv4/Ipv6 shared unicast routes*:                    81920
         # Ipv4/Ipv6 shared unicast routes                     98304 (**)
-        p20 = re.compile(r'^Ipv4\/Ipv6 shared unicast routes\*?\:?\s+(?P<ipv4_v6_shared_unicast_routes>[\d]+)[\s\(\*\)]*$')
+        p20 = regex_engine.compile(r'^Ipv4\/Ipv6 shared unicast routes\*?\:?\s+(?P<ipv4_v6_shared_unicast_routes>[\d]+)[\s\(\*\)]*$')
 
         # Overflow shared unicast routes*:                     1536
         # Overflow shared unicast routes                      196608 (**)
-        p21 = re.compile(r'^Overflow shared unicast routes\*?\:?\s+(?P<overflow_shared_unicast_routes>[\d]+)[\s\(\*\)]*$')
+        p21 = regex_engine.compile(r'^Overflow shared unicast routes\*?\:?\s+(?P<overflow_shared_unicast_routes>[\d]+)[\s\(\*\)]*$')
 
         # Policy Based Routing ACEs / NAT ACEs*:               3072
-        p22 = re.compile(r'^Policy Based Routing ACEs( \/ NAT ACEs)?\*?\:+\s+(?P<policy_based_routing_aces>[\d]+)$')
+        p22 = regex_engine.compile(r'^Policy Based Routing ACEs( \/ NAT ACEs)?\*?\:+\s+(?P<policy_based_routing_aces>[\d]+)$')
 
         # Tunnels*:                                            2816
         # Tunnels                                             1024 (**)
-        p23 = re.compile(r'^Tunnels\*?\:?\s+(?P<tunnels_count>[\d]+)[\s\(\*\)]*$')
+        p23 = regex_engine.compile(r'^Tunnels\*?\:?\s+(?P<tunnels_count>[\d]+)[\s\(\*\)]*$')
 
         # LISP Instance Mapping Entries*:                      2048
-        p24 = re.compile(r'^LISP Instance Mapping Entries\*?\:+\s+(?P<lisp_instance_entries>[\d]+)$')
+        p24 = regex_engine.compile(r'^LISP Instance Mapping Entries\*?\:+\s+(?P<lisp_instance_entries>[\d]+)$')
 
         # Control Plane Entries*:                              512
-        p25 = re.compile(r'^Control Plane Entries\*?\:+\s+(?P<control_plane_entries>[\d]+)$')
+        p25 = regex_engine.compile(r'^Control Plane Entries\*?\:+\s+(?P<control_plane_entries>[\d]+)$')
 
         # Input Netflow flows*:                                49152
-        p26 = re.compile(r'^Input Netflow flows\*?\:+\s+(?P<input_netflow_flows>[\d]+)$')
+        p26 = regex_engine.compile(r'^Input Netflow flows\*?\:+\s+(?P<input_netflow_flows>[\d]+)$')
 
         # Output Netflow flows*:                               49152
-        p27 = re.compile(r'^Output Netflow flows\*?\:+\s+(?P<output_netflow_flows>[\d]+)$')
+        p27 = regex_engine.compile(r'^Output Netflow flows\*?\:+\s+(?P<output_netflow_flows>[\d]+)$')
 
         # SGT/DGT (or) MPLS VPN entries*:                      32768
-        p28 = re.compile(r'^SGT\/DGT \(or\) MPLS VPN entries\*?\:+\s+(?P<sgt_dgt_mpls_vpn_entries>[\d]+)$')
+        p28 = regex_engine.compile(r'^SGT\/DGT \(or\) MPLS VPN entries\*?\:+\s+(?P<sgt_dgt_mpls_vpn_entries>[\d]+)$')
 
         # SGT/DGT (or) MPLS VPN Overflow entries*:             768
-        p29 = re.compile(r'^SGT\/DGT \(or\) MPLS VPN Overflow entries\*?\:+\s+(?P<sgt_dgt_vpn_overflow_entries>[\d]+)$')
+        p29 = regex_engine.compile(r'^SGT\/DGT \(or\) MPLS VPN Overflow entries\*?\:+\s+(?P<sgt_dgt_vpn_overflow_entries>[\d]+)$')
 
         # Wired clients:                                       2048
-        p30 = re.compile(r'^Wired clients\:+\s+(?P<wired_clients>[\d]+)$')
+        p30 = regex_engine.compile(r'^Wired clients\:+\s+(?P<wired_clients>[\d]+)$')
 
         # MACSec SPD Entries*:                                 256
-        p31 = re.compile(r'^MACSec SPD Entries\*?\:+\s+(?P<macsec_spd_entries>[\d]+)$')
+        p31 = regex_engine.compile(r'^MACSec SPD Entries\*?\:+\s+(?P<macsec_spd_entries>[\d]+)$')
 
         # VRF:                                                 1024
         # VRF                                                 256 (**)
-        p32 = re.compile(r'^VRF\:?\s+(?P<vrf_count>[\d]+)[\s\(\*\)]*$')
+        p32 = regex_engine.compile(r'^VRF\:?\s+(?P<vrf_count>[\d]+)[\s\(\*\)]*$')
 
         # MPLS Labels:                                         45056
-        p33 = re.compile(r'^MPLS Labels\:+\s+(?P<mpls_labels>[\d]+)$')
+        p33 = regex_engine.compile(r'^MPLS Labels\:+\s+(?P<mpls_labels>[\d]+)$')
 
         # MPLS L3 VPN Routes VRF Mode*:                        81920
-        p34 = re.compile(r'^MPLS L3 VPN Routes VRF Mode\*?\:+\s+(?P<mpls_l3_vrf_mode>[\d]+)$')
+        p34 = regex_engine.compile(r'^MPLS L3 VPN Routes VRF Mode\*?\:+\s+(?P<mpls_l3_vrf_mode>[\d]+)$')
 
         # MPLS L3 VPN Routes Prefix Mode*:                     32768
-        p35 = re.compile(r'^MPLS L3 VPN Routes Prefix Mode\*?\:+\s+(?P<mpls_l3_prefix_mode>[\d]+)$')
+        p35 = regex_engine.compile(r'^MPLS L3 VPN Routes Prefix Mode\*?\:+\s+(?P<mpls_l3_prefix_mode>[\d]+)$')
 
         # MVPN MDT Tunnels:                                    1024
-        p36 = re.compile(r'^MVPN MDT Tunnels\:+\s+(?P<mvpn_mdt_tunnels>[\d]+)$')
+        p36 = regex_engine.compile(r'^MVPN MDT Tunnels\:+\s+(?P<mvpn_mdt_tunnels>[\d]+)$')
 
         # L2 VPN EOMPLS Attachment Circuit:                    1024
-        p37 = re.compile(r'^L2 VPN EOMPLS Attachment Circuit\:+\s+(?P<l2_vpn_eompls_circuit>[\d]+)$')
+        p37 = regex_engine.compile(r'^L2 VPN EOMPLS Attachment Circuit\:+\s+(?P<l2_vpn_eompls_circuit>[\d]+)$')
 
         # MAX VPLS Bridge Domains :                            1000
-        p38 = re.compile(r'^MAX VPLS Bridge Domains \:+\s+(?P<main_vpls_domains>[\d]+)$')
+        p38 = regex_engine.compile(r'^MAX VPLS Bridge Domains \:+\s+(?P<main_vpls_domains>[\d]+)$')
 
         # MAX VPLS Peers Per Bridge Domain:                    128
-        p39 = re.compile(r'^MAX VPLS Peers Per Bridge Domain\:+\s+(?P<max_vpls_peers_domains>[\d]+)$')
+        p39 = regex_engine.compile(r'^MAX VPLS Peers Per Bridge Domain\:+\s+(?P<max_vpls_peers_domains>[\d]+)$')
 
         # MAX VPLS/VPWS Pseudowires :                          16384
-        p40 = re.compile(r'^MAX VPLS\/VPWS Pseudowires \:+\s+(?P<max_vpls_vpws_pseudowires>[\d]+)$')
+        p40 = regex_engine.compile(r'^MAX VPLS\/VPWS Pseudowires \:+\s+(?P<max_vpls_vpws_pseudowires>[\d]+)$')
 
         # VLAN Filter Entries:                                 16384
-        p41 = re.compile(r'^VLAN Filter Entries\:+\s+(?P<vlan_filters_entries>[\d]+)$')
+        p41 = regex_engine.compile(r'^VLAN Filter Entries\:+\s+(?P<vlan_filters_entries>[\d]+)$')
 
         # STP Instances                                       1024 (**)
-        p42 = re.compile(r'^STP Instances\:?\s+(?P<stp_instances>[\d]+)[\s\(\*\)]*$')
+        p42 = regex_engine.compile(r'^STP Instances\:?\s+(?P<stp_instances>[\d]+)[\s\(\*\)]*$')
 
         # Max L3 adjacency                                    65536 (**)
-        p43 = re.compile(r'^Max L3 adjacency\:?\s+(?P<max_l3_adjacency>\d+)[\s\(\*\)]*$')
+        p43 = regex_engine.compile(r'^Max L3 adjacency\:?\s+(?P<max_l3_adjacency>\d+)[\s\(\*\)]*$')
 
         # Max L3 Interface                                    8192 (**)
-        p44 = re.compile(r'^Max L3 Interface\:?\s+(?P<max_l3_interface>\d+)[\s\(\*\)]*$')
+        p44 = regex_engine.compile(r'^Max L3 Interface\:?\s+(?P<max_l3_interface>\d+)[\s\(\*\)]*$')
 
         # Max MPLS TE TUNNEL                                  4096 (**)
-        p45 = re.compile(r'^Max MPLS TE TUNNEL\:?\s+(?P<max_mpls_te_tunnel>\d+)[\s\(\*\)]*$')
+        p45 = regex_engine.compile(r'^Max MPLS TE TUNNEL\:?\s+(?P<max_mpls_te_tunnel>\d+)[\s\(\*\)]*$')
 
         # MAX NAT ENTRIES                                     63488
-        p46 = re.compile(r'^MAX NAT ENTRIES\:?\s+(?P<max_nat_entries>\d+)[\s\S]*$')
+        p46 = regex_engine.compile(r'^MAX NAT ENTRIES\:?\s+(?P<max_nat_entries>\d+)[\s\S]*$')
 
         # Feature-Name                                        Reserved-Scale
-        p47 = re.compile(r'^Feature\-Name\:?\s+(?P<feature_name>[\w\-]+)$')
+        p47 = regex_engine.compile(r'^Feature\-Name\:?\s+(?P<feature_name>[\w\-]+)$')
 
         # FIB Host Route                                      65536
-        p48 = re.compile(r'^FIB Host Route\:?\s+(?P<fib_host_route>\d+)$')
+        p48 = regex_engine.compile(r'^FIB Host Route\:?\s+(?P<fib_host_route>\d+)$')
 
         # OG/SGACL Hosts/Cells                                2048
-        p49 = re.compile(r'^OG\/SGACL Hosts\/Cells\:?\s+(?P<og_sgacl_hosts>\d+)$')
+        p49 = regex_engine.compile(r'^OG\/SGACL Hosts\/Cells\:?\s+(?P<og_sgacl_hosts>\d+)$')
 
         # loop to split lines of output
         for line in out.splitlines():
@@ -699,13 +699,13 @@ class ShowSdmPreferCustom(ShowSdmPreferCustomSchema):
         result_dict = {}
 
         # Showing SDM Template Info
-        p0 = re.compile(r'^Showing+\s+(?P<template_title>[\w]+)+\s+Template Info+$')
+        p0 = regex_engine.compile(r'^Showing+\s+(?P<template_title>[\w]+)+\s+Template Info+$')
 
         # "This is the Custom template"
-        p1 = re.compile(r'^This is the+\s+(?P<template_type>[\w]+)+\s+template+\.?$')
+        p1 = regex_engine.compile(r'^This is the+\s+(?P<template_type>[\w]+)+\s+template+\.?$')
 
         # initial regexp pattern
-        p2 = re.compile(r'^(?P<pattern>[\S \* ]+): +(?P<value>\d+) ?((?P<pattern1>[\w\s\(\)]+) [\-] (?P<value1>\d+) (?P<pattern2>[\w\s\(\)]+))?$')
+        p2 = regex_engine.compile(r'^(?P<pattern>[\S \* ]+): +(?P<value>\d+) ?((?P<pattern1>[\w\s\(\)]+) [\-] (?P<value1>\d+) (?P<pattern2>[\w\s\(\)]+))?$')
 
         # loop to split lines of output
         for line in output.splitlines():
@@ -1,10 +1,10 @@
-# Metaparser
-import re
-
 from genie import parsergen
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 
 # ==============================================================
@@ -70,162 +70,162 @@ class ShowSdroutingControlLocalPropertiesSummary(ShowSdroutingControlLocalProper
         parsed_dict = {}
 
         # personality                       vedge
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^personality\s+(?P<personality>\S+)$"
         )
 
         # sp_organization_name              SD_WAN_LAB _ 255639
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^sp-organization-name\s+(?P<sp_organization_name>.*)$"
         )
 
         # organization_name                 SD_WAN_LAB _ 255639
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^organization-name\s+(?P<organization_name>.*)$"
         )
 
         # root_ca_chain_status              Installed
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^root-ca-chain-status\s+(?P<root_ca_chain_status>.*)$"
         )
 
         # root_ca_crl_status            Not-Installed
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^root-ca-crl-status\s+(?P<root_ca_crl_status>.*)$"
         )
 
         # certificate_status                Installed
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^certificate-status\s+(?P<certificate_status>.*)$"
         )
 
         # certificate_validity              Valid
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^certificate-validity\s+(?P<certificate_validity>.*)$"
         )
 
         # certificate_not_valid_before      Jan 10 06:58:04 2020 GMT
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^certificate-not-valid-before\s+(?P<certificate_not_valid_before>.*)$"
         )
 
         # certificate_not_valid_after       Aug 09 20:58:26 2099 GMT
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^certificate-not-valid-after\s+(?P<certificate_not_valid_after>.*)$"
         )
 
         # enterprise_cert_status            Not_Applicable
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^enterprise-cert-status\s+(?P<enterprise_cert_status>.*)$"
         )
 
         # enterprise_cert_validity          Not Applicable
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^enterprise-cert-validity\s+(?P<enterprise_cert_validity>.*)$"
         )
 
         # enterprise_cert_not_valid_before  Not Applicable
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^enterprise-cert-not-valid-before\s+(?P<enterprise_cert_not_valid_before>.*)$"
         )
 
         # enterprise_cert_not_valid_after   Not Applicable
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^enterprise-cert-not-valid-after\s+(?P<enterprise_cert_not_valid_after>.*)$"
         )
 
         # dns_name                          vbond_950810.viptela.net
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^dns-name\s+(?P<dns_name>.*)$"
         )
 
         # site_id                           1101
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^site-id\s+(?P<site_id>\d+)$"
         )
 
         # protocol                          dtls
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^protocol\s+(?P<protocol>.*)$"
         )
 
         # tls_port                          0
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"^tls-port\s+(?P<tls_port>\d+)$"
         )
 
         # system_ip                         10.150.74.1
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^system-ip\s+(?P<system_ip>.*)$"
         )
         
         # chassis_num/unique_id             ISR1100_6G_FGL2402LJC8
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"^chassis-num\/unique-id\s+(?P<chassis_num_unique_id>.*)$"
         )
         
         # serial_num                        01F60455
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r"^serial-num\s+(?P<serial_num>.*)$"
         )
 
         # subject-serial-num                        FDO2321A09H
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^subject-serial-num\s+(?P<subject_serial_num>.*)$"
         )
 
         # enterprise_serial_num             No certificate installed
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r"^enterprise-serial-num\s+(?P<enterprise_serial_num>.*)$"
         )
         
         # token                             -NA-
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r"^token\s+(?P<token>.*)$"
         )
         
         # keygen_interval                   1:00:00:00
-        p24 = re.compile(
+        p24 = regex_engine.compile(
             r"^keygen-interval\s+(?P<keygen_interval>.*)$"
         )
         
         # retry_interval                    0:00:00:15
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r"^retry-interval\s+(?P<retry_interval>.*)$"
         )
         
         # no_activity_exp_interval          0:00:00:20
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r"^no-activity-exp-interval\s+(?P<no_activity_exp_interval>.*)$"
         )
         
         # dns_cache_ttl                     0:00:02:00
-        p27 = re.compile(
+        p27 = regex_engine.compile(
             r"^dns-cache-ttl\s+(?P<dns_cache_ttl>.*)$"
         )
         
         # port_hopped                       TRUE
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r"^port-hopped\s+(?P<port_hopped>.*)$"
         )
         
         # time_since_last_port_hop          8:00:54:07
-        p29 = re.compile(
+        p29 = regex_engine.compile(
             r"^time-since-last-port-hop\s+(?P<time_since_last_port_hop>.*)$"
         )        
         
         # embargo_check                     success
-        p30 = re.compile(
+        p30 = regex_engine.compile(
             r"^embargo-check\s+(?P<embargo_check>.*)$"
         )
         
         # number_vbond_peers                0
-        p31 = re.compile(
+        p31 = regex_engine.compile(
             r"^number-vbond-peers\s+(?P<number_vbond_peers>\d+)$"
         )
         
         # number_active_wan_interfaces      2
-        p32 = re.compile(
+        p32 = regex_engine.compile(
             r"^number-active-wan-interfaces\s+(?P<number_active_wan_interfaces>\d+)$"
         )
 
@@ -574,82 +574,82 @@ class ShowSdroutingControlLocalPropertiesWanDetail(ShowSdroutingControlLocalProp
         parsed_dict = {}
 
         # Interface TenGigabitEthernet0/1/0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Interface\s+(?P<interface>\S+)$"
         )
 
         # Public  IPv4       : 75.75.1.2
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Public\s+IPv4\s+:\s+(?P<public_ipv4>.*)$"
         )
 
         # Public  Port       : 65086
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Public\s+Port\s+:\s+(?P<public_port>\d+)$"
         )
 
         # Private IPv4       : 75.75.1.2
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Private\s+IPv4\s+:\s+(?P<private_ipv4>.*)$"
         )
 
         # Private IPv6       : ::
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^Private\s+IPv6\s+:\s+(?P<private_ipv6>.*)$"
         )
 
         # Private Port       : 65086
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Private\s+Port\s+:\s+(?P<private_port>\d+)$"
         )
 
         # State              : up
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^State\s+:\s+(?P<state>.*)$"
         )
 
         # Number of vManages : 1
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^Number\s+of\s+vManages\s+:\s+(?P<vmanage>.*)$"
         )
 
         # Control            : yes
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^Control\s+:\s+(?P<control>.*)$"
         )
 
         # STUN               : no
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^STUN\s+:\s+(?P<stun>.*)$"
         )
 
         # Low Bandwidth Link : no
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^Low\s+Bandwidth\s+Link\s+:\s+(?P<low_bandwidth_link>.*)$"
         )
 
         # Last Connection    : 0:16:05:41
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^Last\s+Connection\s+:\s+(?P<last_connection>.*)$"
         )
 
         # SPI Remaining Time : 0:00:00:00
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^SPI\s+Remaining\s+Time\s+:\s+(?P<spi_time_remaining>.*)$"
         )
 
         # NAT Type           : N
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^NAT\s+Type\s+:\s+(?P<nat_type>.*)$"
         )
 
         # vManage Connection : 5
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^vManage\s+Connection\s+:\s+(?P<vm_con>\d+)$"
         )
 
         # Region IDs         : 0
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^Region\s+IDs\s+:\s+(?P<region_id>\d+)$"
         )
 
@@ -846,7 +846,7 @@ class ShowSdroutingControlLocalPropertiesWanIpv4(ShowSdroutingControlLocalProper
         parsed_dict = {}
 
         # GigabitEthernet0/0/2           145.35.45.12     65052   145.35.45.12     65052    up
-        p = re.compile(
+        p = regex_engine.compile(
             r"^(?P<interface>\S+)\s+(?P<public_ipv4>(?:\d{1,3}\.){3}\d{1,3})\s+" \
             r"(?P<public_port>\d+)\s+(?P<private_ipv4>(?:\d{1,3}\.){3}\d{1,3})\s+" \
             r"(?P<private_port>\d+)\s+(?P<state>\S+)$"
@@ -912,7 +912,7 @@ class ShowSdroutingControlLocalPropertiesWanIpv6(ShowSdroutingControlLocalProper
         parsed_dict = {}
 
         # TenGigabitEthernet0/1/0        65086   ::                                       65086    up
-        p = re.compile(
+        p = regex_engine.compile(
             r"^(?P<interface>\S+)\s+(?P<public_port>\d+)\s+(?P<private_ipv6>\S+)\s+" \
             r"(?P<private_port>\d+)\s+(?P<state>\S+)$"
         )
@@ -974,7 +974,7 @@ class ShowSdroutingControlLocalPropertiesVbond(ShowSdroutingControlLocalProperti
         parsed_dict = {}
 
         # 0        70.70.70.125                             12346
-        p = re.compile(
+        p = regex_engine.compile(
             r"^(?P<index>\d+)\s+(?P<ip>(?:\d{1,3}\.){3}\d{1,3})\s+(?P<port>\d+)$"
         )
 
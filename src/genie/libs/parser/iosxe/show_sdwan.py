@@ -95,6 +95,9 @@ from genie.libs.parser.viptela.show_reboot import ShowRebootHistory as ShowReboo
 from genie.libs.parser.viptela.show_software import ShowSoftwaretab as ShowSoftwaretab_viptela
 from genie.libs.parser.viptela.show_system import ShowSystemStatus as ShowSystemStatus_viptela
 from genie.libs.parser.viptela.show_version import ShowVersion as ShowVersion_viptela
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 class ShowSdwanAppqoeAoimStatisticsSchema(MetaParser):
@@ -146,44 +149,44 @@ class ShowSdwanAppqoeAoimStatistics(ShowSdwanAppqoeAoimStatisticsSchema):
             out = output
 
         #Total Number Of Peer Syncs      : 2
-        p1=re.compile(r'\s*Total Number Of Peer Syncs+\s+\:+\s+(?P<total_peer_syncs>[\d]+)')
+        p1=regex_engine.compile(r'\s*Total Number Of Peer Syncs+\s+\:+\s+(?P<total_peer_syncs>[\d]+)')
 
         #Current Number Of Peer Syncs in Progress      : 0
-        p2=re.compile(r'\s*Current Number Of Peer Syncs in Progress+\s+\:+\s+(?P<current_peer_syncs>[\d]+)')
+        p2=regex_engine.compile(r'\s*Current Number Of Peer Syncs in Progress+\s+\:+\s+(?P<current_peer_syncs>[\d]+)')
 
         #Number Of Peer Re-Syncs Needed      : 0
-        p3=re.compile(r'\s*Number Of Peer Re-Syncs Needed+\s+\:+\s+(?P<peer_resyncs>[\d]+)')
+        p3=regex_engine.compile(r'\s*Number Of Peer Re-Syncs Needed+\s+\:+\s+(?P<peer_resyncs>[\d]+)')
 
         #Total Passthrough Connections Due to Peer Version Mismatch   : 0
-        p4=re.compile(r'\s*Total Passthrough Connections Due to Peer Version Mismatch+\s+\:+\s+(?P<passthrough_connections>[\d]+)')
+        p4=regex_engine.compile(r'\s*Total Passthrough Connections Due to Peer Version Mismatch+\s+\:+\s+(?P<passthrough_connections>[\d]+)')
 
         #AOIM DB Size (Bytes): 4194304
-        p5=re.compile(r'\s*AOIM DB Size +\(+Bytes+\)+\:+\s+(?P<aoim_db_size>\d+)')
+        p5=regex_engine.compile(r'\s*AOIM DB Size +\(+Bytes+\)+\:+\s+(?P<aoim_db_size>\d+)')
 
         #LOCAL AO Statistics
-        p6=re.compile(r'\s*LOCAL AO Statistics')
+        p6=regex_engine.compile(r'\s*LOCAL AO Statistics')
 
         #Number Of AOs      : 2
-        p7=re.compile(r'\s*Number Of AOs +\s+\:+\s+(?P<ao_number>\d+)')
+        p7=regex_engine.compile(r'\s*Number Of AOs +\s+\:+\s+(?P<ao_number>\d+)')
 
         #AO             Version   Registered
         #AO             Version   InCompatible
-        p8=re.compile(r'\s*AO+\s+Version+\s+\w+')
+        p8=regex_engine.compile(r'\s*AO+\s+Version+\s+\w+')
 
         #SSL             1.2        N
-        p9=re.compile(r'\s*(?P<ao_name>\w+)+\s+(?P<ao_version>[\d.]+)+\s+(?P<ao_status>\w+)')
+        p9=regex_engine.compile(r'\s*(?P<ao_name>\w+)+\s+(?P<ao_version>[\d.]+)+\s+(?P<ao_status>\w+)')
 
         #PEER Statistics
-        p10=re.compile(r'\s*PEER Statistics')
+        p10=regex_engine.compile(r'\s*PEER Statistics')
 
         #Number Of Peers      : 2
-        p11=re.compile(r'\s*Number Of Peers+\s+\:+\s+(?P<peer_total>\d+)')
+        p11=regex_engine.compile(r'\s*Number Of Peers+\s+\:+\s+(?P<peer_total>\d+)')
 
         #Peer ID: 10.220.100.214
-        p12=re.compile(r'\s*Peer ID:+\s+(?P<peer_id>[\d.]+)')
+        p12=regex_engine.compile(r'\s*Peer ID:+\s+(?P<peer_id>[\d.]+)')
 
         #Peer Num AOs      : 2
-        p13=re.compile(r'\s*Peer Num AOs+\s+\:+\s+(?P<peer_ao_num>\d+)')
+        p13=regex_engine.compile(r'\s*Peer Num AOs+\s+\:+\s+(?P<peer_ao_num>\d+)')
 
         parsed_dict={}
         check_flag=0
@@ -310,11 +313,11 @@ class ShowSdwanAppqoeTcpoptStatus(ShowSdwanAppqoeTcpoptStatusSchema):
         parsed_dict = {}
 
         # Status
-        p1 = re.compile(r'^Status$')
+        p1 = regex_engine.compile(r'^Status$')
 
         # TCP OPT Operational State      : RUNNING
         # TCP Proxy Operational State    : RUNNING
-        p2 = re.compile(r'^(?P<key>[\s\S]+\w) +: +(?P<value>[\s\S]+)$')
+        p2 = regex_engine.compile(r'^(?P<key>[\s\S]+\w) +: +(?P<value>[\s\S]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -370,7 +373,7 @@ class ShowSdwanAppqoeNatStatistics(ShowSdwanAppqoeNatStatisticsSchema):
         parsed_dict = {}
 
         # NAT Statistics
-        p1 = re.compile(r'^NAT Statistics$')
+        p1 = regex_engine.compile(r'^NAT Statistics$')
 
         #  Insert Success      : 518181
         #  Delete Success      : 518181
@@ -380,7 +383,7 @@ class ShowSdwanAppqoeNatStatistics(ShowSdwanAppqoeNatStatisticsSchema):
         #  Port Alloc Failures : 0
         #  Port Free Success   : 0
         #  Port Free Failures  : 0
-        p2 = re.compile(r'^(?P<key>[\s\S]+\w) +: +(?P<value>[\d]+)$')
+        p2 = regex_engine.compile(r'^(?P<key>[\s\S]+\w) +: +(?P<value>[\d]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -467,19 +470,19 @@ class ShowSdwanAppqoeRmResources(ShowSdwanAppqoeRmResourcesSchema):
             output = self.device.execute(self.cli_command)
 
         # RM Resources
-        p1 = re.compile(r'^RM +Resources$')
+        p1 = regex_engine.compile(r'^RM +Resources$')
 
         # RM Global Resources :
-        p2 = re.compile(r'^RM +Global +Resources +:$')
+        p2 = regex_engine.compile(r'^RM +Global +Resources +:$')
 
         # Registered Service Resources :
-        p3 = re.compile(r'^Registered +Service +Resources +:$')
+        p3 = regex_engine.compile(r'^Registered +Service +Resources +:$')
 
         # TCP Resources:
-        p4 = re.compile(r'^TCP +Resources:$')
+        p4 = regex_engine.compile(r'^TCP +Resources:$')
 
         # SSL Resources:
-        p5 = re.compile(r'^SSL +Resources:$')
+        p5 = regex_engine.compile(r'^SSL +Resources:$')
 
         
         # Max Services Memory (KB)    : 6434914
@@ -492,13 +495,13 @@ class ShowSdwanAppqoeRmResources(ShowSdwanAppqoeRmResourcesSchema):
         # Max Sessions                : 11000
         # Used Sessions               : 0
         # Memory Per Session          : 128
-        p6 = re.compile(r'^(?P<key>[\s\S]+\S) +: +(?P<value>[\S]+)$')
+        p6 = regex_engine.compile(r'^(?P<key>[\s\S]+\S) +: +(?P<value>[\S]+)$')
 
         # DRE Resources:
-        p7 = re.compile(r'^DRE +Resources:$')
+        p7 = regex_engine.compile(r'^DRE +Resources:$')
 
         # HTTP Resources:
-        p8 = re.compile(r'^HTTP +Resources:$')
+        p8 = regex_engine.compile(r'^HTTP +Resources:$')
 
         ret_dict = {}
 
@@ -612,11 +615,11 @@ class ShowSdwanAppqoeFlowAll(ShowSdwanAppqoeFlowAllSchema):
 
         parsed_dict = {}
         # Active Flows: 2139
-        p1 = re.compile(r'^(?P<key>[\s\S]+\w):+\s+(?P<value>[\d]+)$')
+        p1 = regex_engine.compile(r'^(?P<key>[\s\S]+\w):+\s+(?P<value>[\d]+)$')
 
         # Flow ID      VPN  Source IP:Port        Destination IP:Port   Service
         # 171064589     1    10.34.0.2:53350       10.36.211.203:443    TSU
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<flow_id>[\d]+)[\s]+(?P<vpn>[\d]+)[\s]+(?P<source_ip>[\S]+\w)'
             r':(?P<source_port>[\d]+)[\s]+(?P<destination_ip>[\S]+\w)'
             r':(?P<destination_port>[\d]+)[\s]+(?P<service>[\s\S]+)$')
@@ -689,10 +692,10 @@ class ShowSdwanAppqoeServiceControllers(ShowSdwanAppqoeServiceControllersSchema)
         # TCP : Red (0%)
         # SSL : Red (0%)
         # DRE : Green (37%)
-        p1 = re.compile(r'^(?P<service>[\s\S]+)\s+:\s+(?P<service_color>[\s\S]+)\s+\((?P<percent>[\d]+)\%\)$')
+        p1 = regex_engine.compile(r'^(?P<service>[\s\S]+)\s+:\s+(?P<service_color>[\s\S]+)\s+\((?P<percent>[\d]+)\%\)$')
 
         # 193.0.2.2        192.168.13.1            105  193.0.2.3
-        p2 = re.compile(r'^(?P<lan_ip>[\d\.]+)\s+(?P<system_ip>[\d\.]+)\s+(?P<site_id>[\d]+)\s+(?P<sn_lan_ip>[\d\.]+)$')
+        p2 = regex_engine.compile(r'^(?P<lan_ip>[\d\.]+)\s+(?P<system_ip>[\d\.]+)\s+(?P<site_id>[\d]+)\s+(?P<sn_lan_ip>[\d\.]+)$')
 
         # Initialize Return Dictionary...
         ret_dict = {}
@@ -886,7 +889,7 @@ class ShowSdwanControlSummary(ShowSdwanControlSummarySchema):
         #   vmanage_counts 1
         #   vsmart_counts  6
 
-        p1 = re.compile(r"(?P<key>\w+)\s+(?P<value>\d+)")
+        p1 = regex_engine.compile(r"(?P<key>\w+)\s+(?P<value>\d+)")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1028,7 +1031,7 @@ class ShowSdwanIpsecInboundConnections(ShowSdwanIpsecInboundConnectionsSchema):
         parsed_dict = {}
 
         #10.106.2.2 12346   10.106.8.2 12406   10.111.0.6 biz-internet     10.111.0.9 biz-internet     AES-GCM-256           8
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<source_ip>[\S]+) +(?P<source_port>[\d]+) +"
             r"(?P<destination_ip>[\S]+) +(?P<destination_port>[\d]+) +"
             r"(?P<remote_tloc>[\S]+) +(?P<remote_tloc_color>[\S]+) +"
@@ -1090,7 +1093,7 @@ class ShowSdwanIpsecOutboundConnections(ShowSdwanIpsecOutboundConnectionsSchema
         parsed_dict = {}
 
         #10.106.8.2                               12346   10.106.2.2                               12366   271     1438        10.111.0.6        biz-internet     AH_SHA1_HMAC   *****b384  AES-GCM-256           8
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<source_ip>[\S]+) +(?P<source_port>[\d]+) +"
             r"(?P<destination_ip>[\S]+) +(?P<destination_port>[\d]+) +"
             r"(?P<spi>[\d]+) +(?P<tunnel_mtu>[\d]+) +"
@@ -1157,7 +1160,7 @@ class ShowSdwanIpsecLocalsa(ShowSdwanIpsecLocalsaSchema):
 
         #10.111.0.9        biz-internet     259     10.106.8.2        ::                                      12346   *****8d95
         #10.111.0.9        biz-internet     260     10.106.8.2        ::                                      12346   *****4447
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<tloc_address>[\S]+) +(?P<tloc_color>[\S]+) +"
             r"(?P<spi>[\d]+) +(?P<source_ipv4>[\S]+) +"
             r"(?P<source_ipv6>[\S]+) +(?P<source_port>[\d]+) +(?P<key_hash>[\S]+)$"
@@ -1311,7 +1314,7 @@ class ShowSdwanPolicyIpv6AccessListAssociations(ShowSdwanPolicyIpv6AccessListAss
             #               TenGigabitEthernet0/0/0.1002  out
             #               TenGigabitEthernet0/0/2.1002  in
             #               TenGigabitEthernet0/0/2.1002  out
-            p1 = re.compile(r'^(?P<name>[\w\-\s]+) + (?P<interface_name>[\d\w/\.\-]+) + (?P<interface_direction>[\w]+)$')
+            p1 = regex_engine.compile(r'^(?P<name>[\w\-\s]+) + (?P<interface_name>[\d\w/\.\-]+) + (?P<interface_direction>[\w]+)$')
             for line in outlist:
                 m1 = p1.match(line)
                 if m1:
@@ -1356,7 +1359,7 @@ class ShowSdwanPolicyAccessListAssociations(ShowSdwanPolicyIpv6AccessListAssocia
             #               TenGigabitEthernet0/0/2.1002  out
             # acl-v4-apple  TenGigabitEthernet0/0/0.1002  in
             #               TenGigabitEthernet0/0/0.1002  out
-            p1 = re.compile(
+            p1 = regex_engine.compile(
                 r'^(?P<name>[\w\-\s]+) + (?P<interface_name>[\d\w/\.\-]+) + (?P<interface_direction>[\w]+)$')
             for line in outlist:
                 m1 = p1.match(line)
@@ -1450,7 +1453,7 @@ class ShowSdwanPolicyAccessListCounters(ShowSdwanPolicyAccessListCountersSchema)
             # acl-v4  seq1                              8726713375    7977499318508
             # -apple
             #         default_action_count              246601717     239371283918
-            p1=re.compile(r'^(?P<name>[\w\-\s]+) + (?P<counter_name>[\d\w/\.\-]+) + (?P<packets>[\d]+) +(?P<bytes>[\d]+)$')
+            p1=regex_engine.compile(r'^(?P<name>[\w\-\s]+) + (?P<counter_name>[\d\w/\.\-]+) + (?P<packets>[\d]+) +(?P<bytes>[\d]+)$')
             for line in outlist:
                 m1=p1.match(line.rstrip())
                 if m1:
@@ -1491,7 +1494,7 @@ class ShowSdwanPolicyIpv6AccessListCounters(ShowSdwanPolicyAccessListCountersSch
                     outlist[lines - 1] = "  ".join(local_list)
             # acl-v6-apple  vpn1002-v6-traffic    3999853226  3260866067656
             #               default_action_count  248080      22356152
-            p1 = re.compile(
+            p1 = regex_engine.compile(
                 r'^(?P<name>[\w\-\s]+) + (?P<counter_name>[\d\w/\.\-]+) + (?P<packets>[\d]+) +(?P<bytes>[\d]+)$')
             for line in outlist:
                 m1 = p1.match(line.rstrip())
@@ -1616,10 +1619,10 @@ class ShowSdwanZonebfwdpSessions(ShowSdwanZonebfwdpSessionsSchema):
 
 
         #18005202  open    10.76.0.7  172.16.186.50    49873  443   PROTO_L7_HTTPS  2    2    1    0    ZP_lanZone_wanZone_I_-1639760094  Isn4451ZbfPolicy-seq-1-cm_  -      0         3684       67394
-        p1 = re.compile(r'^(?P<sess_id>\d+)\s+(?P<state>\w+)\s+(?P<src_ip>\S+)\s+(?P<dst_ip>\S+)\s+(?P<src_port>\d+)\s+(?P<dst_port>\d+)\s+(?P<proto>\S+)\s+(?P<src_vrf>\d+)\s+(?P<dst_vrf>\d+)\s+(?P<src_vpn_id>\d+)\s+(?P<dst_vpn_id>\d+)\s+(?P<zp_name>\S+)\s+(?P<classmap_name>\S+)\s+(?P<nat_flags>\S+)\s+(?P<internal_flags>\d+)\s+(?P<tot_init_bytes>\d+)\s+(?P<tot_resp_bytes>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<sess_id>\d+)\s+(?P<state>\w+)\s+(?P<src_ip>\S+)\s+(?P<dst_ip>\S+)\s+(?P<src_port>\d+)\s+(?P<dst_port>\d+)\s+(?P<proto>\S+)\s+(?P<src_vrf>\d+)\s+(?P<dst_vrf>\d+)\s+(?P<src_vpn_id>\d+)\s+(?P<dst_vpn_id>\d+)\s+(?P<zp_name>\S+)\s+(?P<classmap_name>\S+)\s+(?P<nat_flags>\S+)\s+(?P<internal_flags>\d+)\s+(?P<tot_init_bytes>\d+)\s+(?P<tot_resp_bytes>\d+)$')
 
         #4583 open 10.225.18.63 10.196.18.63 1024 1024 PROTO_L4_UDP 3 3 20 20 ZP_LAN_ZONE_vpn20_LAN__968352866 ZBFW-seq-1-cm_ - 0 2435061651 2435062756 /statistical-p2p
-        p2 = re.compile(r'^(?P<sess_id>\d+)\s+(?P<state>\w+)\s+(?P<src_ip>\S+)\s+(?P<dst_ip>\S+)\s+(?P<src_port>\d+)\s+(?P<dst_port>\d+)\s+(?P<proto>\S+)\s+(?P<src_vrf>\d+)\s+(?P<dst_vrf>\d+)\s+(?P<src_vpn_id>\d+)\s+(?P<dst_vpn_id>\d+)\s+(?P<zp_name>\S+)\s+(?P<classmap_name>\S+)\s+(?P<nat_flags>\S+)\s+(?P<internal_flags>\d+)\s+(?P<tot_init_bytes>\d+)\s+(?P<tot_resp_bytes>\d+)\s+(?P<app_type>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<sess_id>\d+)\s+(?P<state>\w+)\s+(?P<src_ip>\S+)\s+(?P<dst_ip>\S+)\s+(?P<src_port>\d+)\s+(?P<dst_port>\d+)\s+(?P<proto>\S+)\s+(?P<src_vrf>\d+)\s+(?P<dst_vrf>\d+)\s+(?P<src_vpn_id>\d+)\s+(?P<dst_vpn_id>\d+)\s+(?P<zp_name>\S+)\s+(?P<classmap_name>\S+)\s+(?P<nat_flags>\S+)\s+(?P<internal_flags>\d+)\s+(?P<tot_init_bytes>\d+)\s+(?P<tot_resp_bytes>\d+)\s+(?P<app_type>\S+)$')
 
 
         ret_dict = {}
@@ -1764,29 +1767,29 @@ class ShowSdwanZbfwStatistics(ShowSdwanZbfwStatisticsSchema):
 
         #zbfw zonepair-statistics ZP_lanZone_lanZone_Is_-902685811
         #p1 = re.compile(r'^zbfw zonepair-statistics (?P<zp_name>\S+)$')
-        p1 = re.compile(r'^zbfw\s+zonepair-statistics\s+(?P<zp_name>\S+)$')
+        p1 = regex_engine.compile(r'^zbfw\s+zonepair-statistics\s+(?P<zp_name>\S+)$')
 
         #fw-traffic-class-entry Isn4451ZbfPolicy-seq-1-cm_
-        p2 = re.compile(r'^(?P<class_name>(fw-traffic-class-entry|fw-l7-traffic-class-entry)) (?P<class_entry>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<class_name>(fw-traffic-class-entry|fw-l7-traffic-class-entry)) (?P<class_entry>\S+)$')
 
         #fw-tc-match-entry "match-any Isn4451ZbfPolicy-svrf1-l4-cm_" 11
         #p3 = re.compile(r'^fw-tc-match-entry "(?P<match_crit>\S+)\s+(?P<tc_entry>[\w\d\s-]+)"\s(?P<tc_num>\S+)$')
-        p3 = re.compile(r'^fw-tc-match-entry\s+"(?P<match_crit>\S+)\s+(?P<tc_entry>[\w\d\s-]+)"\s+(?P<tc_num>\S+)$')
+        p3 = regex_engine.compile(r'^fw-tc-match-entry\s+"(?P<match_crit>\S+)\s+(?P<tc_entry>[\w\d\s-]+)"\s+(?P<tc_num>\S+)$')
 
         #fw-tc-match-entry Isn4451ZbfPolicy-seq-vrf5-acl_ 3
         #p4 = re.compile(r'^fw-tc-match-entry (?P<tc_entry>[\w\d\s-]+)\s(?P<tc_num>\S+)$')
-        p4 = re.compile(r'^fw-tc-match-entry\s+(?P<tc_entry>[\w\d\s-]+)\s(?P<tc_num>\S+)$')
+        p4 = regex_engine.compile(r'^fw-tc-match-entry\s+(?P<tc_entry>[\w\d\s-]+)\s(?P<tc_num>\S+)$')
 
         #fw-tc-proto-entry 1
         #p5 = re.compile(r'^(?P<match_name>fw-tc-proto-entry|fw-l7-tc-match-app-entry)\s+(?P<entry_val>[\w\d\-]+)$')
-        p5 = re.compile(r'^(?P<match_name>fw-tc-proto-entry|fw-l7-tc-match-app-entry)\s+(?P<entry_val>[\w\d\-]+)$')
+        p5 = regex_engine.compile(r'^(?P<match_name>fw-tc-proto-entry|fw-l7-tc-match-app-entry)\s+(?P<entry_val>[\w\d\-]+)$')
 
         #l7-policy-name                 NONE
-        p6 = re.compile(r'^(?P<entry_name>l7-policy-name)\s+(?P<entry_val>\S+)$')
+        p6 = regex_engine.compile(r'^(?P<entry_name>l7-policy-name)\s+(?P<entry_val>\S+)$')
 
         #src-zone-name lanZone
         #p5 = re.compile(r'^(?P<key>\S+)\s+(?P<value>\S+)$')
-        p7 = re.compile(r'^(?P<key>\S+)\s+\"?(?P<value>[\w\s\d\-\_]+)\"?$')
+        p7 = regex_engine.compile(r'^(?P<key>\S+)\s+\"?(?P<value>[\w\s\d\-\_]+)\"?$')
 
 
         ret_dict = {}
@@ -1916,7 +1919,7 @@ class ShowSdwanTunnelSlaIndex0(ShowSdwanTunnelSlaIndex0Schema):
 
         result_dict = {}
 
-        p0 = re.compile(r"^(?P<proto>\w+)\s+(?P<srcip>\d+\.\d+\.\d+\.\d+)\s+(?P<destip>\d+\.\d+\.\d+\.\d+)\s+(?P<srcport>\d+)\s+(?P<destport>\d+)\s+(?P<remip>\d+\.\d+\.\d+\.\d+)\s+(?P<localcolor>\w+)\s+(?P<remotecolor>\w+)\s+(?P<loss>\d+)\s+(?P<latency>\d+)\s+(?P<jitter>\d+)\s+(?P<slaclass>\S+)\s+(?P<slaclassname>.*)\s+")
+        p0 = regex_engine.compile(r"^(?P<proto>\w+)\s+(?P<srcip>\d+\.\d+\.\d+\.\d+)\s+(?P<destip>\d+\.\d+\.\d+\.\d+)\s+(?P<srcport>\d+)\s+(?P<destport>\d+)\s+(?P<remip>\d+\.\d+\.\d+\.\d+)\s+(?P<localcolor>\w+)\s+(?P<remotecolor>\w+)\s+(?P<loss>\d+)\s+(?P<latency>\d+)\s+(?P<jitter>\d+)\s+(?P<slaclass>\S+)\s+(?P<slaclassname>.*)\s+")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1979,7 +1982,7 @@ class ShowSdwanSystemOnDemand(ShowSdwanSystemOnDemandSchema):
 
         # 21       21.0.0.21          yes          active              6
         # 23       21.0.0.23          no             -                 -
-        p1 = re.compile(r'^(?P<site_id>[\d]+)\s+(?P<system_ip>[0-9\.]+)\s+(?P<on_demand>[A-Za-z]+)\s+(?P<status>[\S]+)\s+(?P<timeout>[\S]+)')
+        p1 = regex_engine.compile(r'^(?P<site_id>[\d]+)\s+(?P<system_ip>[0-9\.]+)\s+(?P<on_demand>[A-Za-z]+)\s+(?P<status>[\S]+)\s+(?P<timeout>[\S]+)')
 
         for line in output.splitlines():
             # ret_dict_ptr = ret_dict.setdefault('on_demand_tunnel',{})
@@ -2117,7 +2120,7 @@ class ShowSdwanTunnelStatistics(ShowSdwanTunnelStatisticsSchema):
 
         # tunnel stats ipsec 150.0.5.1 150.0.6.1 12346 12346
         # tunnel stats ipsec 150.0.5.1 150.0.7.1 12346 12346
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^tunnel\s+stats\s+(ipsec|gre)\s+(?P<source>[\S]+)\s+(?P<destination>[\S]+)'
             r'\s+(?P<src_port>[\d]+)\s+(?P<dst_port>[\d]+)$')
 
@@ -2125,20 +2128,20 @@ class ShowSdwanTunnelStatistics(ShowSdwanTunnelStatisticsSchema):
         # fec-tx-data-pkts     0
         # fec-capable          true
         # fec-dynamic          false
-        p2 = re.compile(r'^(?P<key>[a-zA-Z0-9\-\_]+)\s+(?P<value>[a-zA-Z0-9\-\_]+)$')
+        p2 = regex_engine.compile(r'^(?P<key>[a-zA-Z0-9\-\_]+)\s+(?P<value>[a-zA-Z0-9\-\_]+)$')
 
         # # ipsec     150.0.5.1  151.0.1.1   12346   12346  21.0.0.21    public-internet  lte             1438    4303977    494629034    8004520    8312606388    1358    0             0               0             0               0                   0                     0                   0
         # # ipsec     150.0.5.1  151.0.2.1   12346   12346  22.0.0.22    public-internet  private2        1438    324964     28472293     324963     39521236      1358    0             0               0             0               0                   0                     0                   0
-        p3 = re.compile(r'^(?P<protocol>[a-z]+)\s+(?P<src_ip>[a-zA-Z0-9\.\:]+)\s+(?P<dest_ip>[a-zA-Z0-9\.\:]+)\s+'
-                        r'(?P<src_port>[\d]+)\s+(?P<dst_port>[\d]+)\s+'
-                        r'(?P<remote_sys_ip>[\S]+)\s+(?P<local_color>[0-9a-zA-Z\-\_]+)'
-                        r'\s+(?P<remote_color>[0-9a-zA-Z\-\_]+)\s+(?P<tunnel_mtu>[\d]+)\s+'
-                        r'(?P<tx_pkts>[\d]+)\s+(?P<tx_octets>[\d]+)\s+'
-                        r'(?P<rx_pkts>[\d]+)\s+(?P<rx_octets>[\d]+)\s+(?P<tcp_mss_adjust>[\d]+)\s+'
-                        r'(?P<ipv6_tx_pkts>[\d]+)\s+(?P<ipv6_tx_octets>[\d]+)'
-                        r'\s+(?P<ipv6_rx_pkts>[\d]+)\s+(?P<ipv6_rx_octets>[\d]+)\s+'
-                        r'(?P<tx_ipv4_mcast_pkts>[\d]+)\s+(?P<tx_ipv4_mcast_octets>[\d]+)'
-                        r'\s+(?P<rx_ipv4_mcast_pkts>[\d]+)\s+(?P<rx_ipv4_mcast_octets>[\d]+)$')
+        p3 = regex_engine.compile(r'^(?P<protocol>[a-z]+)\s+(?P<src_ip>[a-zA-Z0-9\.\:]+)\s+(?P<dest_ip>[a-zA-Z0-9\.\:]+)\s+'
+                                  r'(?P<src_port>[\d]+)\s+(?P<dst_port>[\d]+)\s+'
+                                  r'(?P<remote_sys_ip>[\S]+)\s+(?P<local_color>[0-9a-zA-Z\-\_]+)'
+                                  r'\s+(?P<remote_color>[0-9a-zA-Z\-\_]+)\s+(?P<tunnel_mtu>[\d]+)\s+'
+                                  r'(?P<tx_pkts>[\d]+)\s+(?P<tx_octets>[\d]+)\s+'
+                                  r'(?P<rx_pkts>[\d]+)\s+(?P<rx_octets>[\d]+)\s+(?P<tcp_mss_adjust>[\d]+)\s+'
+                                  r'(?P<ipv6_tx_pkts>[\d]+)\s+(?P<ipv6_tx_octets>[\d]+)'
+                                  r'\s+(?P<ipv6_rx_pkts>[\d]+)\s+(?P<ipv6_rx_octets>[\d]+)\s+'
+                                  r'(?P<tx_ipv4_mcast_pkts>[\d]+)\s+(?P<tx_ipv4_mcast_octets>[\d]+)'
+                                  r'\s+(?P<rx_ipv4_mcast_pkts>[\d]+)\s+(?P<rx_ipv4_mcast_octets>[\d]+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -2345,23 +2348,23 @@ class ShowSdwanTunnelSla(ShowSdwanTunnelSlaSchema):
 
         ret_dict = {}
         # tunnel sla-class 1
-        p1 = re.compile(r'^tunnel\s+sla-class\s+(?P<sla_index>[0-9]+)$')
+        p1 = regex_engine.compile(r'^tunnel\s+sla-class\s+(?P<sla_index>[0-9]+)$')
         # tunnel system-ips 23.0.0.23
-        p1_1 = re.compile(r'^tunnel\s+system-ips\s+(?P<tunnel_system_ips>[0-9\.]+)$')
+        p1_1 = regex_engine.compile(r'^tunnel\s+system-ips\s+(?P<tunnel_system_ips>[0-9\.]+)$')
         #  sla-name    aarSla
-        p2 = re.compile(r'^sla-name\s+(?P<sla_name>[\S]+)$')
+        p2 = regex_engine.compile(r'^sla-name\s+(?P<sla_name>[\S]+)$')
         # sla-loss    3
         # sla-latency 150
         # sla-jitter  50
         # tunnel-count 4
-        p3 = re.compile(r'^(?P<sla_key>[\S]+)\s+(?P<sla_value>[\d]+)$')
+        p3 = regex_engine.compile(r'^(?P<sla_key>[\S]+)\s+(?P<sla_value>[\d]+)$')
         # ipsec  150.0.4.1  29.129.29.1   12346  12366  29.0.0.29    blue   metro-ethernet   0     0        0       0,1    __all_tunnels__, aarSla  None
-        p4 = re.compile(r'(?P<protocol>[a-z]+)\s+(?P<src_ip>[a-zA-Z0-9\.\:]+)\s+(?P<dst_ip>[a-zA-Z0-9\.\:]+)\s+(?P<src_port>[\d]+)\s+'
+        p4 = regex_engine.compile(r'(?P<protocol>[a-z]+)\s+(?P<src_ip>[a-zA-Z0-9\.\:]+)\s+(?P<dst_ip>[a-zA-Z0-9\.\:]+)\s+(?P<src_port>[\d]+)\s+'
         r'(?P<dst_port>[\d]+)\s+(?P<remote_system_ip>[\S]+)\s+(?P<t_local_color>[0-9a-zA-Z\-\_]+)\s+(?P<t_remote_color>[0-9a-zA-Z\-\_]+)'
         r'\s+(?P<mean_loss>[\d]+)\s+(?P<mean_latency>[\d]+)\s+(?P<mean_jitter>[\d]+)\s+(?P<sla_class_index>[\S]+)\s+(?P<sla_class_name>[\S\s]+)'
         r'\s+(?P<fallback_sla_class_index>[\S]+)$')
         # 0  ipsec  150.0.2.1  150.0.3.1  private1  biz-internet  __all_tunnels__, aarSla
-        p4_1 = re.compile(r'^(?P<index>[0-9]+)\s+(?P<protocol>[a-z]+)\s+(?P<src_ip>[a-zA-Z0-9\.\:]+)\s+(?P<dst_ip>[a-zA-Z0-9\.\:]+)\s+'
+        p4_1 = regex_engine.compile(r'^(?P<index>[0-9]+)\s+(?P<protocol>[a-z]+)\s+(?P<src_ip>[a-zA-Z0-9\.\:]+)\s+(?P<dst_ip>[a-zA-Z0-9\.\:]+)\s+'
         r'(?P<local_color>[0-9a-zA-Z\-\_]+)\s+(?P<remote_color>[0-9a-zA-Z\-\_]+)\s+(?P<sla_class_name>[\S\s]+)$')
 
         for line in output.splitlines():
@@ -2505,30 +2508,30 @@ class ShowSdwanAppRouteStatistics(ShowSdwanAppRouteStatisticsSchema):
 
         # app-route statistics 150.0.5.1 150.0.6.1 12346 12346
         # app-route statistics 150.0.5.1 150.0.7.1 12346 12346
-        p1 = re.compile(r'^app-route\s+statistics\s+(?P<source>[\S]+)\s+(?P<destination>[\S]+)\s+(?P<protocol>[a-zA-Z]+)\s+'
+        p1 = regex_engine.compile(r'^app-route\s+statistics\s+(?P<source>[\S]+)\s+(?P<destination>[\S]+)\s+(?P<protocol>[a-zA-Z]+)\s+'
         r'(?P<src_port>[\d]+)\s+(?P<dst_port>[\d]+)$')
 
         # app-probe-class-list None
-        p1_1 = re.compile(r'^app-probe-class-list\s+(?P<app_probe_name>[\S]+)$')
+        p1_1 = regex_engine.compile(r'^app-probe-class-list\s+(?P<app_probe_name>[\S]+)$')
 
         # interval 0
         # interval 1
-        p1_2 = re.compile(r'^interval\s+(?P<interval>[0-9]+)$')
+        p1_2 = regex_engine.compile(r'^interval\s+(?P<interval>[0-9]+)$')
 
         #  remote-system-ip         20.0.0.20
-        p2 = re.compile(r'^remote-system-ip\s+(?P<remote_system_ip>[\S]+)')
+        p2 = regex_engine.compile(r'^remote-system-ip\s+(?P<remote_system_ip>[\S]+)')
 
         #  local-color              blue
-        p3 = re.compile(r'^local-color\s+(?P<local_color>[\S]+)$')
+        p3 = regex_engine.compile(r'^local-color\s+(?P<local_color>[\S]+)$')
 
         #  remote-color             bronze
-        p4 = re.compile(r'^remote-color\s+(?P<remote_color>[\S]+)$')
+        p4 = regex_engine.compile(r'^remote-color\s+(?P<remote_color>[\S]+)$')
 
         #  sla-class-index          0,1
-        p5 = re.compile(r'^sla-class-index\s+(?P<sla_class_index>[\S]+)$')
+        p5 = regex_engine.compile(r'^sla-class-index\s+(?P<sla_class_index>[\S]+)$')
 
         #  fallback-sla-class-index None
-        p6 = re.compile(r'^fallback-sla-class-index\s+(?P<fall_back_sla_index>[\S]+)$')
+        p6 = regex_engine.compile(r'^fallback-sla-class-index\s+(?P<fall_back_sla_index>[\S]+)$')
 
         #  total-packets     638
         #  loss              0
@@ -2538,7 +2541,7 @@ class ShowSdwanAppRouteStatistics(ShowSdwanAppRouteStatisticsSchema):
         #  rx-data-pkts      0
         #  ipv6-tx-data-pkts 0
         #  ipv6-rx-data-pkts 0
-        p7 = re.compile(r'^(?P<key>[\S]+)\s+(?P<value>[0-9]+)$')
+        p7 = regex_engine.compile(r'^(?P<key>[\S]+)\s+(?P<value>[0-9]+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -2686,11 +2689,11 @@ class ShowSdwanAppRouteSlaClass(ShowSdwanAppRouteSlaClassSchema):
                 output = self.device.execute(self.cli_command[0])
 
         # 0       __all_tunnels__       0     0        0        0          None                  None
-        p1 = re.compile(r'^(?P<index>[0-9]+)\s+(?P<name>[\S]+)\s+(?P<loss>[\d]+)\s+(?P<latency>[\d]+)\s+(?P<jitter>[\d]+)'
+        p1 = regex_engine.compile(r'^(?P<index>[0-9]+)\s+(?P<name>[\S]+)\s+(?P<loss>[\d]+)\s+(?P<latency>[\d]+)\s+(?P<jitter>[\d]+)'
         r'\s+(?P<class_id>[\d]+)\s+(?P<app_probe_class>[\S]+)\s+(?P<fallback_best_tunnel>[\S]+)$')
 
         # app-route sla-class 1
-        p2 = re.compile(r'^app-route\s+sla-class\s+(?P<index>[\d]+)$')
+        p2 = regex_engine.compile(r'^app-route\s+sla-class\s+(?P<index>[\d]+)$')
 
         #  name                 aarSla
         #  loss                 3
@@ -2699,7 +2702,7 @@ class ShowSdwanAppRouteSlaClass(ShowSdwanAppRouteSlaClassSchema):
         #  app-probe-class-id   0
         #  app-probe-class      None
         #  fallback-best-tunnel Latency
-        p3 = re.compile(r'^(?P<key>[a-z\-]+)\s+(?P<value>[\S]+)$')
+        p3 = regex_engine.compile(r'^(?P<key>[a-z\-]+)\s+(?P<value>[\S]+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -2811,9 +2814,9 @@ class ShowSdwanAppFwdDpiSummary(ShowSdwanAppFwdDpiSummarySchema):
         # sdwan_flow_monitor  512000   0        7          1590   1591   1355    236
         # sdwan_flow_monitor_2  5120   3        6          1570   1596   1358    2367
 
-        p1 = re.compile(r"(?P<name>[a-z]+\S+)+\s+(?P<cache_size>\d+)+\s+(?P<current_entries>\d+)+\s+"
-                        r"(?P<high_watermark>\d+)+\s+(?P<flows_added>\d+)+\s+(?P<flows_aged>\d+)+\s+"
-                        r"(?P<active_flows_timed_out>\d+)+\s+(?P<inactive_flows_timed_out>\d+)")
+        p1 = regex_engine.compile(r"(?P<name>[a-z]+\S+)+\s+(?P<cache_size>\d+)+\s+(?P<current_entries>\d+)+\s+"
+                                  r"(?P<high_watermark>\d+)+\s+(?P<flows_added>\d+)+\s+(?P<flows_aged>\d+)+\s+"
+                                  r"(?P<active_flows_timed_out>\d+)+\s+(?P<inactive_flows_timed_out>\d+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -2865,28 +2868,28 @@ class ShowSdwanAppfwdCflowdStatistics(ShowSdwanAppfwdCflowdStatisticsSchema):
         ret_dict = {}
 
         # data_packets             :      1371257
-        p1 = re.compile(r'^data_packets\s+:+\s+(?P<data_packets>\d+)$')
+        p1 = regex_engine.compile(r'^data_packets\s+:+\s+(?P<data_packets>\d+)$')
 
         # template_packets         :      5345
-        p2 = re.compile(r'^template_packets\s+:+\s+(?P<template_packets>\d+)$')
+        p2 = regex_engine.compile(r'^template_packets\s+:+\s+(?P<template_packets>\d+)$')
 
         # total-packets            :      57938
-        p3 = re.compile(r'^total-packets\s+:+\s+(?P<total_packets>\d+)$')
+        p3 = regex_engine.compile(r'^total-packets\s+:+\s+(?P<total_packets>\d+)$')
 
         # flow-refresh             :      31713
-        p4 = re.compile(r'^flow-refresh\s+:+\s+(?P<flow_refresh>\d+)$')
+        p4 = regex_engine.compile(r'^flow-refresh\s+:+\s+(?P<flow_refresh>\d+)$')
 
         # flow-ageout              :      18416
-        p5 = re.compile(r'^flow-ageout\s+:+\s+(?P<flow_ageout>\d+)$')
+        p5 = regex_engine.compile(r'^flow-ageout\s+:+\s+(?P<flow_ageout>\d+)$')
 
         # flow-end-detected        :      0
-        p6 = re.compile(r'^flow-end-detected\s+:+\s+(?P<flow_end_detected>\d+)$')
+        p6 = regex_engine.compile(r'^flow-end-detected\s+:+\s+(?P<flow_end_detected>\d+)$')
 
         # flow-end-forced          :      0
-        p7 = re.compile(r'^flow-end-forced\s+:+\s+(?P<flow_end_forced>\d+)$')
+        p7 = regex_engine.compile(r'^flow-end-forced\s+:+\s+(?P<flow_end_forced>\d+)$')
 
         # flow-rate-limit-drop     :      0
-        p8 = re.compile(r'^flow-rate-limit-drop\s+:+\s+(?P<flow_rate_limit_drop>\d+)$')
+        p8 = regex_engine.compile(r'^flow-rate-limit-drop\s+:+\s+(?P<flow_rate_limit_drop>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2979,7 +2982,7 @@ class ShowSdwanAppfwdCflowdFlowCount(ShowSdwanAppfwdCflowdFlowCountSchema):
         vpn_dict = {}
 
         # *    2
-        p1 = re.compile(r'^(?P<vpn>.+?)\s+(?P<count>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<vpn>.+?)\s+(?P<count>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3119,146 +3122,146 @@ class ShowSdwanAppHostingOperData(ShowSdwanAppHostingOperDataSchema):
 
         oper_data_dict = {}
         # app-hosting-oper-data app utd
-        p1 = re.compile(r'^app-hosting-oper-data\sapp\s(?P<app>\w+)$')
+        p1 = regex_engine.compile(r'^app-hosting-oper-data\sapp\s(?P<app>\w+)$')
 
         #  details state            RUNNING
-        p2 = re.compile(r'^details\sstate\s+(?P<state>\w+)$')
+        p2 = regex_engine.compile(r'^details\sstate\s+(?P<state>\w+)$')
 
         #  details package-information name UTD-Snort-Feature
-        p3 = re.compile(r'^details\spackage-information\sname\s+(?P<pkg_info_name>[A-Za-z-]+)$')
+        p3 = regex_engine.compile(r'^details\spackage-information\sname\s+(?P<pkg_info_name>[A-Za-z-]+)$')
 
         #  details package-information path /bootflash/.UTD_IMAGES/iox-utd_1.0.4_SV2.9.16.1_XE17.7.tar
-        p4 = re.compile(r'^details\spackage-information\spath\s+(?P<pkg_info_path>[A-Za-z0-9-\/._]+)$')
+        p4 = regex_engine.compile(r'^details\spackage-information\spath\s+(?P<pkg_info_path>[A-Za-z0-9-\/._]+)$')
 
         # details package-information application name utd
-        p5 = re.compile(r'^details\spackage-information\sapplication\sname\s+(?P<app_name>\w+)$')
+        p5 = regex_engine.compile(r'^details\spackage-information\sapplication\sname\s+(?P<app_name>\w+)$')
 
         # details package-information application installed-version 1.0.4_SV2.9.16.1_XE17.7
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^details\spackage-information\sapplication\sinstalled-version\s+(?P<pkg_version>[A-Z0-9._]+$)')
 
         #  details package-information application description "Unified Threat Defense"
-        p7 = re.compile(r'^details\spackage-information\sapplication\sdescription\s+(?P<pkg_desc_name>\"[A-Za-z ]+\")$')
+        p7 = regex_engine.compile(r'^details\spackage-information\sapplication\sdescription\s+(?P<pkg_desc_name>\"[A-Za-z ]+\")$')
 
         # details package-information application type LXC
-        p8 = re.compile(r'^details\spackage-information\sapplication\stype\s+(?P<pkg_app_type>\w+)$')
+        p8 = regex_engine.compile(r'^details\spackage-information\sapplication\stype\s+(?P<pkg_app_type>\w+)$')
 
         #  details package-information application owner ioxm
-        p9 = re.compile(r'^details\spackage-information\sapplication\sowner\s+(?P<pkg_app_owner>\w+)$')
+        p9 = regex_engine.compile(r'^details\spackage-information\sapplication\sowner\s+(?P<pkg_app_owner>\w+)$')
 
         # details package-information application activation-allowed true
-        p10 = re.compile(r'^details\spackage-information\sapplication\sactivation-allowed\s+(?P<app_act_allowed>\w+)$')
+        p10 = regex_engine.compile(r'^details\spackage-information\sapplication\sactivation-allowed\s+(?P<app_act_allowed>\w+)$')
 
         # details package-information application author ""
-        p11 = re.compile(r'^details\spackage-information\sapplication\sauthor\s+(?P<pkg_app_author>\S+)$')
+        p11 = regex_engine.compile(r'^details\spackage-information\sapplication\sauthor\s+(?P<pkg_app_author>\S+)$')
 
         # details package-information signing key-type ""
-        p12 = re.compile(r'^details\spackage-information\ssigning\skey-type\s+(?P<pkg_info_key_type>\S+)$')
+        p12 = regex_engine.compile(r'^details\spackage-information\ssigning\skey-type\s+(?P<pkg_info_key_type>\S+)$')
 
         # details package-information signing method ""
-        p13 = re.compile(r'^details\spackage-information\ssigning\smethod\s+(?P<pkg_info_method>\S+)$')
+        p13 = regex_engine.compile(r'^details\spackage-information\ssigning\smethod\s+(?P<pkg_info_method>\S+)$')
 
         # details package-information licensing name ""
-        p14 = re.compile(r'^details\spackage-information\slicensing\sname\s+(?P<pkg_lic_name>\S+)$')
+        p14 = regex_engine.compile(r'^details\spackage-information\slicensing\sname\s+(?P<pkg_lic_name>\S+)$')
 
         # details package-information licensing version ""
-        p15 = re.compile(r'^details\spackage-information\slicensing\sversion\s+(?P<pkg_lic_version>\S+)$')
+        p15 = regex_engine.compile(r'^details\spackage-information\slicensing\sversion\s+(?P<pkg_lic_version>\S+)$')
 
         # details package-information url-path ""
-        p16 = re.compile(r'^details\spackage-information\slurl-path\s+(?P<pkg_url_path>\S+)$')
+        p16 = regex_engine.compile(r'^details\spackage-information\slurl-path\s+(?P<pkg_url_path>\S+)$')
 
         # details detailed-guest-status processes name ""
-        p17 = re.compile(r'^details\sdetailed-guest-status\sprocesses\sname\s+(?P<processes_name>\S+)$')
+        p17 = regex_engine.compile(r'^details\sdetailed-guest-status\sprocesses\sname\s+(?P<processes_name>\S+)$')
 
         # details detailed-guest-status processes status ""
-        p18 = re.compile(r'^details\sdetailed-guest-status\sprocesses\sstatus\s+(?P<processes_status>\S+)$')
+        p18 = regex_engine.compile(r'^details\sdetailed-guest-status\sprocesses\sstatus\s+(?P<processes_status>\S+)$')
 
         # details detailed-guest-status processes pid ""
-        p19 = re.compile(r'^details\sdetailed-guest-status\sprocesses\spid\s+(?P<processes_pid>\S+)$')
+        p19 = regex_engine.compile(r'^details\sdetailed-guest-status\sprocesses\spid\s+(?P<processes_pid>\S+)$')
 
         # details detailed-guest-status processes uptime ""
-        p20 = re.compile(r'^details\sdetailed-guest-status\sprocesses\suptime\s+(?P<processes_uptime>\S+)$')
+        p20 = regex_engine.compile(r'^details\sdetailed-guest-status\sprocesses\suptime\s+(?P<processes_uptime>\S+)$')
 
         # details detailed-guest-status processes memory ""
-        p21 = re.compile(r'^details\sdetailed-guest-status\sprocesses\smemory\s+(?P<processes_memory>\S+)$')
+        p21 = regex_engine.compile(r'^details\sdetailed-guest-status\sprocesses\smemory\s+(?P<processes_memory>\S+)$')
 
         # details activated-profile-name cloud-medium
-        p22 = re.compile(r'^details\sactivated-profile-name\s+(?P<profile_name>[a-z-]+)$')
+        p22 = regex_engine.compile(r'^details\sactivated-profile-name\s+(?P<profile_name>[a-z-]+)$')
 
         # details resource-reservation disk 1111
-        p23 = re.compile(r'^details\sresource-reservation\sdisk\s+(?P<disk>\d+)$')
+        p23 = regex_engine.compile(r'^details\sresource-reservation\sdisk\s+(?P<disk>\d+)$')
 
         # details resource-reservation memory 3072
-        p24 = re.compile(r'^details\sresource-reservation\smemory\s+(?P<memory>\d+)$')
+        p24 = regex_engine.compile(r'^details\sresource-reservation\smemory\s+(?P<memory>\d+)$')
 
         # details resource-reservation cpu 0
-        p25 = re.compile(r'^details\sresource-reservation\scpu\s+(?P<cpu>\d+)$')
+        p25 = regex_engine.compile(r'^details\sresource-reservation\scpu\s+(?P<cpu>\d+)$')
 
         # details resource-reservation vcpu 0
-        p26 = re.compile(r'^details\sresource-reservation\svcpu\s+(?P<vcpu>\d+)$')
+        p26 = regex_engine.compile(r'^details\sresource-reservation\svcpu\s+(?P<vcpu>\d+)$')
 
         # details resource-reservation cpu-percent 50
-        p27 = re.compile(r'^details\sresource-reservation\scpu-percent\s+(?P<cpu_percent>\d+)$')
+        p27 = regex_engine.compile(r'^details\sresource-reservation\scpu-percent\s+(?P<cpu_percent>\d+)$')
 
         # details guest-interface  ""
-        p28 = re.compile(r'^details\sguest-interface\s+(?P<guest_intf>\S+)$')
+        p28 = regex_engine.compile(r'^details\sguest-interface\s+(?P<guest_intf>\S+)$')
 
         # details resource-admission state ""
-        p29 = re.compile(r'^details\sresource-admission\sstate\s+(?P<res_add_state>\S+)$')
+        p29 = regex_engine.compile(r'^details\sresource-admission\sstate\s+(?P<res_add_state>\S+)$')
 
         # details resource-admission disk-space ""
-        p30 = re.compile(r'^details\sresource-admission\sdisk-space\s+(?P<res_add_disk_space>\S+)$')
+        p30 = regex_engine.compile(r'^details\sresource-admission\sdisk-space\s+(?P<res_add_disk_space>\S+)$')
 
         # details resource-admission memory ""
-        p31 = re.compile(r'^details\sresource-admission\smemory\s+(?P<res_add_memory>\S+)$')
+        p31 = regex_engine.compile(r'^details\sresource-admission\smemory\s+(?P<res_add_memory>\S+)$')
 
         # details resource-admission cpu 0
-        p32 = re.compile(r'^details\sresource-admission\scpu\s+(?P<res_add_cpu>\S+)$')
+        p32 = regex_engine.compile(r'^details\sresource-admission\scpu\s+(?P<res_add_cpu>\S+)$')
 
         # details resource-admission vcpus ""
-        p33 = re.compile(r'^details\sresource-admission\svcpus\s+(?P<res_add_vcpu>\S+)$')
+        p33 = regex_engine.compile(r'^details\sresource-admission\svcpus\s+(?P<res_add_vcpu>\S+)$')
 
         # details docker-run-opts  ""
-        p34 = re.compile(r'^details\sdocker-run-opts\s+(?P<res_doc_run_opts>\S+)$')
+        p34 = regex_engine.compile(r'^details\sdocker-run-opts\s+(?P<res_doc_run_opts>\S+)$')
 
         # details command          ""
-        p35 = re.compile(r'^details\scommand\s+(?P<details_command>\S+)$')
+        p35 = regex_engine.compile(r'^details\scommand\s+(?P<details_command>\S+)$')
 
         # details entry-point      ""
-        p36 = re.compile(r'^details\sentry-point\s+(?P<details_entry_point>\S+)$')
+        p36 = regex_engine.compile(r'^details\sentry-point\s+(?P<details_entry_point>\S+)$')
 
         # details health-status    0
-        p37 = re.compile(r'^details\shealth-status\s+(?P<details_health_stats>\S+)$')
+        p37 = regex_engine.compile(r'^details\shealth-status\s+(?P<details_health_stats>\S+)$')
 
         # details last-health-probe-error ""
-        p38 = re.compile(r'^details\slast-health-probe-error\s+(?P<details_probe_error>\S+)$')
+        p38 = regex_engine.compile(r'^details\slast-health-probe-error\s+(?P<details_probe_error>\S+)$')
 
         # details last-health-probe-output ""
-        p39 = re.compile(r'^details\slast-health-probe-output\s+(?P<details_probe_output>\S+)$')
+        p39 = regex_engine.compile(r'^details\slast-health-probe-output\s+(?P<details_probe_output>\S+)$')
 
         # details pkg-run-opt      ""
-        p40 = re.compile(r'^details\spkg-run-opt\s+(?P<details_pkg_run_opt>\S+)$')
+        p40 = regex_engine.compile(r'^details\spkg-run-opt\s+(?P<details_pkg_run_opt>\S+)$')
 
         # details ieobc-mac-addr   33:33:3a:33:33:3a
-        p41 = re.compile(r'^details\sieobc-mac-addr\s+(?P<ieobc_mac_address>([0-9a-fA-F].?){12})$')
+        p41 = regex_engine.compile(r'^details\sieobc-mac-addr\s+(?P<ieobc_mac_address>([0-9a-fA-F].?){12})$')
 
         # utilization name utd
-        p42 = re.compile(r'^utilization\sname\s+(?P<utilization_name>\w+)$')
+        p42 = regex_engine.compile(r'^utilization\sname\s+(?P<utilization_name>\w+)$')
 
         # utilization cpu-util requested-application-util 0
-        p43 = re.compile(r'^utilization\scpu-util\srequested-application-util\s+(?P<req_app_util>\w+)$')
+        p43 = regex_engine.compile(r'^utilization\scpu-util\srequested-application-util\s+(?P<req_app_util>\w+)$')
 
         # utilization cpu-util actual-application-util 3
-        p44 = re.compile(r'^utilization\scpu-util\sactual-application-util\s+(?P<actual_app_util>\w+)$')
+        p44 = regex_engine.compile(r'^utilization\scpu-util\sactual-application-util\s+(?P<actual_app_util>\w+)$')
 
         # utilization cpu-util cpu-state ""
-        p45 = re.compile(r'^utilization\scpu-util\scpu-state\s+(?P<cpu_state>\S+)$')
+        p45 = regex_engine.compile(r'^utilization\scpu-util\scpu-state\s+(?P<cpu_state>\S+)$')
 
         # utilization memory-util memory-allocation 3072
-        p46 = re.compile(r'^utilization\smemory-util\smemory-allocation\s+(?P<mem_allocation>\S+)$')
+        p46 = regex_engine.compile(r'^utilization\smemory-util\smemory-allocation\s+(?P<mem_allocation>\S+)$')
 
         # utilization memory-util memory-used 335636
-        p47 = re.compile(r'^utilization\smemory-util\smemory-used\s+(?P<mem_used>\S+)$')
+        p47 = regex_engine.compile(r'^utilization\smemory-util\smemory-used\s+(?P<mem_used>\S+)$')
 
         #                     RX       RX     RX      TX       TX     TX
         #   NAME     ALIAS  PACKETS  BYTES  ERRORS  PACKETS  BYTES  ERRORS
@@ -3267,41 +3270,41 @@ class ShowSdwanAppHostingOperData(ShowSdwanAppHostingOperDataSchema):
         #   dp_1_1   net3   0        0      0       0        0      0
         #   ieobc_1  ieobc  190      11175  0       190      12303  0
 
-        p48 = re.compile(
+        p48 = regex_engine.compile(
             r'(?P<name>[a-z0-9_]+)+\s+(?P<alias>\w+)+\s+(?P<rx_packets>\d+)+\s+(?P<rx_bytes>\d+)+\s+(?P<rx_errors>\d+)+\s+(?P<tx_packets>\d+)+\s+(?P<tx_bytes>\d+)+\s+(?P<tx_errors>\d+)')
 
         # storage-utils storage-util disk
-        p49 = re.compile(r'^storage-utils\sstorage-util\sdisk')
+        p49 = regex_engine.compile(r'^storage-utils\sstorage-util\sdisk')
 
         # alias       ""
-        p50 = re.compile(r'^alias\s+(?P<alias>\S+)$')
+        p50 = regex_engine.compile(r'^alias\s+(?P<alias>\S+)$')
 
         #   rd-bytes    0
-        p51 = re.compile(r'^rd-bytes\s+(?P<rd_bytes>\d+)$')
+        p51 = regex_engine.compile(r'^rd-bytes\s+(?P<rd_bytes>\d+)$')
 
         #   rd-requests 0
-        p52 = re.compile(r'^rd-requests\s+(?P<rd_requests>\d+)$')
+        p52 = regex_engine.compile(r'^rd-requests\s+(?P<rd_requests>\d+)$')
 
         #   errors      0
-        p53 = re.compile(r'^errors\s+(?P<errors>\d+)$')
+        p53 = regex_engine.compile(r'^errors\s+(?P<errors>\d+)$')
 
         #   wr-bytes    0
-        p54 = re.compile(r'^wr-bytes\s+(?P<wr_bytes>\d+)$')
+        p54 = regex_engine.compile(r'^wr-bytes\s+(?P<wr_bytes>\d+)$')
 
         #   wr-requests 0
-        p55 = re.compile(r'^wr-requests\s+(?P<wr_requests>\d+)$')
+        p55 = regex_engine.compile(r'^wr-requests\s+(?P<wr_requests>\d+)$')
 
         #   capacity    1137664
-        p56 = re.compile(r'^capacity\s+(?P<capacity>\d+)$')
+        p56 = regex_engine.compile(r'^capacity\s+(?P<capacity>\d+)$')
 
         #   available   255382
-        p57 = re.compile(r'^available\s+(?P<available>\d+)$')
+        p57 = regex_engine.compile(r'^available\s+(?P<available>\d+)$')
 
         #   used        882282
-        p58 = re.compile(r'^used\s+(?P<used>\d+)$')
+        p58 = regex_engine.compile(r'^used\s+(?P<used>\d+)$')
 
         #   usage       ""
-        p59 = re.compile(r'^usage\s+(?P<usage>\S+)$')
+        p59 = regex_engine.compile(r'^usage\s+(?P<usage>\S+)$')
 
         #                ATTACHED   IPV4       NETWORK  IPV6
         # MAC ADDRESS        str     ERFACE  ADDRESS    NAME     ADDRESS
@@ -3310,71 +3313,71 @@ class ShowSdwanAppHostingOperData(ShowSdwanAppHostingOperDataSchema):
         # f8:6b:d9:c0:cc:5e  eth2       0.0.0.0    dp_1_0   ::
         # f8:6b:d9:c0:cc:5f  eth1       192.0.2.2  dp_1_1   ::
 
-        p60 = re.compile(
+        p60 = regex_engine.compile(
             r'^(?P<mac_address>([0-9a-fA-F].?){12})+\s+(?P<attached_intf>\w+)+\s+(?P<ipv4_address>[0-9.]+)+\s+(?P<network_name>\w+)+\s+(?P<ipv6_address>\S+)$')
 
         # pkg-policy iox-pkg-policy-invalid
-        p61 = re.compile(r'^pkg-policy\s+(?P<pkg_policy>\S+)$')
+        p61 = regex_engine.compile(r'^pkg-policy\s+(?P<pkg_policy>\S+)$')
 
         # app-hosting-oper-data app-resources global
-        p62 = re.compile(r'^app-hosting-oper-data\sapp-resources\sglobal')
+        p62 = regex_engine.compile(r'^app-hosting-oper-data\sapp-resources\sglobal')
 
         # cpu "system CPU"
-        p63 = re.compile(r'^cpu\s+(?P<cpu>\"[A-Za-z ]+\")$')
+        p63 = regex_engine.compile(r'^cpu\s+(?P<cpu>\"[A-Za-z ]+\")$')
 
         # quota          98
-        p64 = re.compile(r'^quota\s+(?P<quota>\S+)$')
+        p64 = regex_engine.compile(r'^quota\s+(?P<quota>\S+)$')
 
         # available      48
-        p65 = re.compile(r'^available\s+(?P<available>\d+)$')
+        p65 = regex_engine.compile(r'^available\s+(?P<available>\d+)$')
 
         # quota-unit     48608
-        p66 = re.compile(r'^quota-unit\s+(?P<quota_unit>\S+)$')
+        p66 = regex_engine.compile(r'^quota-unit\s+(?P<quota_unit>\S+)$')
 
         # available-unit 23808
-        p67 = re.compile(r'^available-unit\s+(?P<available_unit>\S+)$')
+        p67 = regex_engine.compile(r'^available-unit\s+(?P<available_unit>\S+)$')
 
         # memory memory
-        p68 = re.compile(r'^memory\s+(?P<memory>\S+)$')
+        p68 = regex_engine.compile(r'^memory\s+(?P<memory>\S+)$')
 
         # storage-device harddisk
-        p69 = re.compile(r'^storage-device\s+(?P<storage_device>harddisk)$')
+        p69 = regex_engine.compile(r'^storage-device\s+(?P<storage_device>harddisk)$')
 
         # storage-device bootflash
-        p70 = re.compile(r'^storage-device\s+(?P<storage_device>bootflash)$')
+        p70 = regex_engine.compile(r'^storage-device\s+(?P<storage_device>bootflash)$')
 
         # storage-device volume-group
-        p71 = re.compile(r'^storage-device\s+(?P<storage_device>volume-group)$')
+        p71 = regex_engine.compile(r'^storage-device\s+(?P<storage_device>volume-group)$')
 
         # storage-device "CAF persist-disk"
-        p72 = re.compile(r'^storage-device\s+(?P<storage_device>\"[A-Za-z -]+\")$')
+        p72 = regex_engine.compile(r'^storage-device\s+(?P<storage_device>\"[A-Za-z -]+\")$')
 
         # timestamp      2022-04-25T18:08:36.189866+00:00
-        p73 = re.compile(r'^timestamp\s+(?P<timestamp>\S+)$')
+        p73 = regex_engine.compile(r'^timestamp\s+(?P<timestamp>\S+)$')
 
         # severity-level minor
-        p74 = re.compile(r'^severity-level\s+(?P<severity_level>\w+)$')
+        p74 = regex_engine.compile(r'^severity-level\s+(?P<severity_level>\w+)$')
 
         # host-name      pm9005
-        p75 = re.compile(r'^host-name\s+(?P<host_name>\w+)$')
+        p75 = regex_engine.compile(r'^host-name\s+(?P<host_name>\w+)$')
 
         # vrf-name       ""
-        p76 = re.compile(r'^vrf-name\s+(?P<vrf_name>\S+)$')
+        p76 = regex_engine.compile(r'^vrf-name\s+(?P<vrf_name>\S+)$')
 
         # app-id         utd
-        p77 = re.compile(r'^app-id\s+(?P<app_id>\w+)$')
+        p77 = regex_engine.compile(r'^app-id\s+(?P<app_id>\w+)$')
 
         # ev-type        im-iox-enable
-        p78 = re.compile(r'^ev-type\s+(?P<ev_type>\S+)$')
+        p78 = regex_engine.compile(r'^ev-type\s+(?P<ev_type>\S+)$')
 
         # status         im-app-pass
-        p79 = re.compile(r'^status\s+(?P<status>\S+)$')
+        p79 = regex_engine.compile(r'^status\s+(?P<status>\S+)$')
 
         # app-state      im-state-running
-        p80 = re.compile(r'^app-state\s+(?P<app_state>[a-z-]+)$')
+        p80 = regex_engine.compile(r'^app-state\s+(?P<app_state>[a-z-]+)$')
 
         # app-hosting-oper-data app-globals iox-enabled true
-        p81 = re.compile(r'^app-hosting-oper-data\sapp-globals+\siox-enabled+\s+(?P<is_enabled>\w+)$')
+        p81 = regex_engine.compile(r'^app-hosting-oper-data\sapp-globals+\siox-enabled+\s+(?P<is_enabled>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4080,19 +4083,19 @@ class ShowSdwanPolicyAppRoutePolicyFilter(ShowSdwanPolicyAppRoutePolicyFilterSch
         if output is None:
             output = self.device.execute(self.cli_command)
         # VPN_AAR_Policy  VPN1  default_action_count              0             0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"\s*(?P<policy_name>\S+)\s+(?P<vpn_name>\S+)\s+(?P<counter_name>\S+)\s+(?P<packets_counter>\d+)\s+(?P<bytes_counter>\d+)$"
 
         )
 
         # VPN1  default_action_count              0             0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<vpn_name>\S+)\s+(?P<counter_name>\S+)\s+(?P<packets_counter>\d+)\s+(?P<bytes_counter>\d+)$"
 
         )
 
         # AAR_APP_Facebook_963617983        0             0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<counter_name>\S+)\s+(?P<packets_counter>\d+)\s+(?P<bytes_counter>\d+)$"
         )
 
@@ -4385,267 +4388,267 @@ class ShowSdwanPolicyFromVsmart(ShowSdwanPolicyFromVsmartSchema):
             output = self.device.execute(self.cli_command)
 
         # from-vsmart sla-class Realtime
-        p1 = re.compile(r"^from-vsmart+\s+(?P<policy_type>\S+)\s+(?P<policy_type_name>\S+)$")
+        p1 = regex_engine.compile(r"^from-vsmart+\s+(?P<policy_type>\S+)\s+(?P<policy_type_name>\S+)$")
 
         # loss    21
         # latency 300
         # jitter  100
-        p2 = re.compile(r"^(?P<stat_name>(loss|latency|jitter)+)\s+(?P<value>\d+)$")
+        p2 = regex_engine.compile(r"^(?P<stat_name>(loss|latency|jitter)+)\s+(?P<value>\d+)$")
 
         # criteria         loss latency jitter
-        p3 = re.compile(r"^criteria+\s+(?P<fallback_criteria>[\s\S]+)$")
+        p3 = regex_engine.compile(r"^criteria+\s+(?P<fallback_criteria>[\s\S]+)$")
 
         # loss-variance    10
         # latency-variance 100
         # jitter-variance  200
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^(?P<stat_name>(loss-variance|latency-variance|jitter-variance)+)\s+(?P<value>\d+)$"
         )
 
         # rate   3000000
         # burst  150000
-        p5 = re.compile(r"^(?P<stat_name>(rate|burst)+)\s+(?P<value>\d+)$")
+        p5 = regex_engine.compile(r"^(?P<stat_name>(rate|burst)+)\s+(?P<value>\d+)$")
 
         # exceed drop
-        p6 = re.compile(r"^exceed+\s+(?P<action>\S+)$")
+        p6 = regex_engine.compile(r"^exceed+\s+(?P<action>\S+)$")
 
         # direction from-service
-        p7 = re.compile(r"^direction+\s+(?P<direction>\S+)$")
+        p7 = regex_engine.compile(r"^direction+\s+(?P<direction>\S+)$")
 
         # vpn-list VPN1
-        p8 = re.compile(r"^vpn-list+\s+(?P<vpn_list_name>\S+)$")
+        p8 = regex_engine.compile(r"^vpn-list+\s+(?P<vpn_list_name>\S+)$")
 
         # sequence 51
-        p9 = re.compile(r"^sequence+\s+(?P<sequence>\d+)$")
+        p9 = regex_engine.compile(r"^sequence+\s+(?P<sequence>\d+)$")
 
         # source-ip 0.0.0.0/0
-        p10 = re.compile(r"^source-ip+\s+(?P<source_ip>\S+)$")
+        p10 = regex_engine.compile(r"^source-ip+\s+(?P<source_ip>\S+)$")
 
         # destination-ip     0.0.0.0/0
-        p11 = re.compile(r"^destination-ip+\s+(?P<destination_ip>\S+)$")
+        p11 = regex_engine.compile(r"^destination-ip+\s+(?P<destination_ip>\S+)$")
 
         # dscp               15
-        p12 = re.compile(r"^dscp+\s+(?P<dscp_list>[\s\d]+)$")
+        p12 = regex_engine.compile(r"^dscp+\s+(?P<dscp_list>[\s\d]+)$")
 
         # app-list Email
-        p13 = re.compile(r"^app-list+\s+(?P<app_list>\S+)$")
+        p13 = regex_engine.compile(r"^app-list+\s+(?P<app_list>\S+)$")
 
         # source-data-prefix-list site1_vpn10_ipv4
-        p14 = re.compile(r"^source-data-prefix-list+\s+(?P<sdata_prefix_list>\S+)$")
+        p14 = regex_engine.compile(r"^source-data-prefix-list+\s+(?P<sdata_prefix_list>\S+)$")
 
         # destination-data-prefix-list site6_service_ipv4_red
-        p15 = re.compile(r"^destination-data-prefix-list+\s+(?P<ddata_prefix_list>\S+)$")
+        p15 = regex_engine.compile(r"^destination-data-prefix-list+\s+(?P<ddata_prefix_list>\S+)$")
 
         # dns-app-list                 Microsoft_Apps
-        p16 = re.compile(r"^dns-app-list+\s+(?P<dns_app_list>\S+)$")
+        p16 = regex_engine.compile(r"^dns-app-list+\s+(?P<dns_app_list>\S+)$")
 
         # source-port                  1024
-        p17 = re.compile(r"^source-port+\s+(?P<source_port>\d+)$")
+        p17 = regex_engine.compile(r"^source-port+\s+(?P<source_port>\d+)$")
 
         # destination-port             8080
-        p18 = re.compile(r"^destination-port+\s+(?P<destination_port>\d+)$")
+        p18 = regex_engine.compile(r"^destination-port+\s+(?P<destination_port>\d+)$")
 
         # protocol 1 2 3
-        p19 = re.compile(r"^protocol+\s+(?P<protocol>[\s\S]+)$")
+        p19 = regex_engine.compile(r"^protocol+\s+(?P<protocol>[\s\S]+)$")
 
         # tcp                          syn
-        p20 = re.compile(r"^tcp+\s+(?P<tcp_flag>\S+)$")
+        p20 = regex_engine.compile(r"^tcp+\s+(?P<tcp_flag>\S+)$")
 
         # plp                          high
-        p21 = re.compile(r"^plp+\s+(?P<plp>\S+)$")
+        p21 = regex_engine.compile(r"^plp+\s+(?P<plp>\S+)$")
 
         # traffic-to                   core
-        p22 = re.compile(r"^traffic-to+\s+(?P<traffic_to>\S+)$")
+        p22 = regex_engine.compile(r"^traffic-to+\s+(?P<traffic_to>\S+)$")
 
         # destination-region           primary-region
-        p23 = re.compile(r"^destination-region+\s+(?P<destination_region>\S+)$")
+        p23 = regex_engine.compile(r"^destination-region+\s+(?P<destination_region>\S+)$")
 
         # packet-length                1-4096
-        p24 = re.compile(r"^packet-length+\s+(?P<packet_length>\S+)$")
+        p24 = regex_engine.compile(r"^packet-length+\s+(?P<packet_length>\S+)$")
 
         # dns                          request
-        p25 = re.compile(r"^dns+\s+(?P<dns_query>\S+)$")
+        p25 = regex_engine.compile(r"^dns+\s+(?P<dns_query>\S+)$")
 
         # cloud-saas-app-list gotomeeting_apps
-        p26 = re.compile(r"^cloud-saas-app-list+\s+(?P<cloud_saas_app_list>\S+)$")
+        p26 = regex_engine.compile(r"^cloud-saas-app-list+\s+(?P<cloud_saas_app_list>\S+)$")
 
         # action accept
-        p27 = re.compile(r"^action+\s+(?P<action>\S+)$")
+        p27 = regex_engine.compile(r"^action+\s+(?P<action>\S+)$")
 
         # action
-        p27_1 = re.compile(r"^action+$")
+        p27_1 = regex_engine.compile(r"^action+$")
 
         # nat pool 11
-        p28 = re.compile(r"^nat+\s+pool+\s+(?P<nat_pool_number>\d+)$")
-        p28_1 = re.compile(r"^nat+\s+[\s\S]+")
+        p28 = regex_engine.compile(r"^nat+\s+pool+\s+(?P<nat_pool_number>\d+)$")
+        p28_1 = regex_engine.compile(r"^nat+\s+[\s\S]+")
 
         # nat use-vpn 0
-        p29 = re.compile(r"^nat+\s+use-vpn+\s+(?P<use_vpn_number>\d+)$")
+        p29 = regex_engine.compile(r"^nat+\s+use-vpn+\s+(?P<use_vpn_number>\d+)$")
 
         # nat fallback
-        p30 = re.compile(r"^nat+\s+fallback+$")
+        p30 = regex_engine.compile(r"^nat+\s+fallback+$")
 
         # log
-        p31 = re.compile(r"^log+$")
+        p31 = regex_engine.compile(r"^log+$")
 
         # tcp-optimization
-        p32 = re.compile(r"^tcp-optimization+$")
+        p32 = regex_engine.compile(r"^tcp-optimization+$")
 
         # count  testing-counter_-2070586118
-        p33 = re.compile(r"^count+\s+(?P<count_name>\S+)$")
+        p33 = regex_engine.compile(r"^count+\s+(?P<count_name>\S+)$")
 
         # set
-        p34_1 = re.compile(r"^set+$")
+        p34_1 = regex_engine.compile(r"^set+$")
 
         # local-tloc-list
-        p34 = re.compile(r"^local-tloc-list+$")
+        p34 = regex_engine.compile(r"^local-tloc-list+$")
 
         # restrict
-        p35 = re.compile(r"^restrict+$")
+        p35 = regex_engine.compile(r"^restrict+$")
 
         # color mpls public-internet
-        p36 = re.compile(r"^color+\s+(?P<color_types>[\s\S]+)$")
+        p36 = regex_engine.compile(r"^color+\s+(?P<color_types>[\s\S]+)$")
 
         # encap ipsec
-        p37 = re.compile(r"^encap+\s+(?P<encap_type>\S+)$")
+        p37 = regex_engine.compile(r"^encap+\s+(?P<encap_type>\S+)$")
 
         # next-hop         10.0.0.1
-        p38 = re.compile(r"^next-hop+\s+(?P<next_hop>\S+)$")
+        p38 = regex_engine.compile(r"^next-hop+\s+(?P<next_hop>\S+)$")
 
         # next-hop-loose
-        p39 = re.compile(r"^next-hop-loose+$")
+        p39 = regex_engine.compile(r"^next-hop-loose+$")
 
         # policer          site6_policer
-        p40 = re.compile(r"^policer+\s+(?P<policer>\S+)$")
+        p40 = regex_engine.compile(r"^policer+\s+(?P<policer>\S+)$")
 
         # forwarding-class Net-Mgmt
-        p41 = re.compile(r"^forwarding-class+\s+(?P<forwarding_class>\S+)$")
+        p41 = regex_engine.compile(r"^forwarding-class+\s+(?P<forwarding_class>\S+)$")
 
         # vpn              10
-        p42 = re.compile(r"^vpn+\s+(?P<vpn>\d+)$")
+        p42 = regex_engine.compile(r"^vpn+\s+(?P<vpn>\d+)$")
 
         # vip-tloc-pref-list 0
-        p43 = re.compile(r"^vip-tloc-pref-list+\s+(?P<vip_tloc_pref_list>\d+)$")
+        p43 = regex_engine.compile(r"^vip-tloc-pref-list+\s+(?P<vip_tloc_pref_list>\d+)$")
 
         # tloc-label 1002
         # tloc-ip    8.8.8.1
         # tloc-color public-internet
         # tloc-encap ipsec
-        p44 = re.compile(r"^tloc-+(?P<tloc_type>(?!list)\S+)\s+(?P<value>[\s\S]+)$")
+        p44 = regex_engine.compile(r"^tloc-+(?P<tloc_type>(?!list)\S+)\s+(?P<value>[\s\S]+)$")
 
         # tloc-list        HUB2
-        p45 = re.compile(r"^tloc-list+\s+(?P<value>[\s\S]+)$")
+        p45 = regex_engine.compile(r"^tloc-list+\s+(?P<value>[\s\S]+)$")
 
         # service FW
-        p46_1 = re.compile(r"^service+.+$")
-        p46 = re.compile(r"^service+\s+(?P<service_type>\S+)$")
+        p46_1 = regex_engine.compile(r"^service+.+$")
+        p46 = regex_engine.compile(r"^service+\s+(?P<service_type>\S+)$")
 
         # service vpn 23
-        p47 = re.compile(r"^service+\s+vpn+\s(?P<service_vpn_number>\d+)$")
+        p47 = regex_engine.compile(r"^service+\s+vpn+\s(?P<service_vpn_number>\d+)$")
 
         # service tloc
-        p48 = re.compile(r"^service+\s+tloc+\s+.+$")
+        p48 = regex_engine.compile(r"^service+\s+tloc+\s+.+$")
 
         # service tloc-list HUB2
-        p48_1 = re.compile(r"^service+\s+tloc-list+\s+(?P<tloc_list>\S+)$")
+        p48_1 = regex_engine.compile(r"^service+\s+tloc-list+\s+(?P<tloc_list>\S+)$")
 
         # service tloc 10.101.7.2
-        p48_2 = re.compile(r"^service+\s+tloc+\s+(?P<service_tloc_ip>\S+)$")
+        p48_2 = regex_engine.compile(r"^service+\s+tloc+\s+(?P<service_tloc_ip>\S+)$")
 
         # service tloc color public-internet
-        p49 = re.compile(r"^service+\s+tloc+\s+color+\s+(?P<service_tloc_colors>[\S\s]+)$")
+        p49 = regex_engine.compile(r"^service+\s+tloc+\s+color+\s+(?P<service_tloc_colors>[\S\s]+)$")
 
         # service tloc encap ipsec
-        p50 = re.compile(r"^service+\s+tloc+\s+encap+\s+(?P<encap>\S+)$")
+        p50 = regex_engine.compile(r"^service+\s+tloc+\s+encap+\s+(?P<encap>\S+)$")
 
         # loss-protection forward-error-correction adaptive
-        p51_1 = re.compile(r"^loss-protection+.+$")
-        p51 = re.compile(
+        p51_1 = regex_engine.compile(r"^loss-protection+.+$")
+        p51 = regex_engine.compile(
             r"^loss-protection+\s+forward-error-correction+\s+(?P<fw_error_correction_type>\S+)$"
         )
 
         # loss-protection packet-duplication
-        p52 = re.compile(r"^loss-protection+\s+(?P<loss_prot_type>\S+)$")
+        p52 = regex_engine.compile(r"^loss-protection+\s+(?P<loss_prot_type>\S+)$")
 
         # redirect-dns host
-        p53 = re.compile(r"^redirect-dns+\s+(?P<redirect_dns>\S+)$")
+        p53 = regex_engine.compile(r"^redirect-dns+\s+(?P<redirect_dns>\S+)$")
 
         # cflowd
-        p54 = re.compile(r"^cflowd+$")
+        p54 = regex_engine.compile(r"^cflowd+$")
 
         # default-action accept
-        p55 = re.compile(r"^default-action+\s+(?P<default_action>\S+)$")
+        p55 = regex_engine.compile(r"^default-action+\s+(?P<default_action>\S+)$")
 
         # flow-active-timeout    600
         # flow-inactive-timeout  60
-        p57 = re.compile(r"^flow-+(?P<flow_type>\S+)-timeout+\s+(?P<timeout_value>\d+)$")
+        p57 = regex_engine.compile(r"^flow-+(?P<flow_type>\S+)-timeout+\s+(?P<timeout_value>\d+)$")
 
         # template-refresh       600
-        p58 = re.compile(r"^template-refresh+\s+(?P<template_refresh_value>\d+)$")
+        p58 = regex_engine.compile(r"^template-refresh+\s+(?P<template_refresh_value>\d+)$")
 
         # flow-sampling-interval 1
-        p59 = re.compile(r"^flow-sampling-interval+\s+(?P<sampling_interval>\d+)$")
+        p59 = regex_engine.compile(r"^flow-sampling-interval+\s+(?P<sampling_interval>\d+)$")
 
         # customized-ipv4-record-fields
-        p60 = re.compile(r"^customized-ipv4-record-fields+$")
+        p60 = regex_engine.compile(r"^customized-ipv4-record-fields+$")
 
         # collect-tos
-        p61 = re.compile(r"^collect-tos+$")
+        p61 = regex_engine.compile(r"^collect-tos+$")
 
         # no collect-dscp-output
-        p62 = re.compile(r"^no+\s+collect-dscp-output+$")
+        p62 = regex_engine.compile(r"^no+\s+collect-dscp-output+$")
 
         # collector vpn 10 address 10.0.0.1 port 1024 transport transport_udp
-        p63 = re.compile(
+        p63 = regex_engine.compile(
             r"^collector+\s+vpn+\s+(?P<vpn_number>\d+)\s+address+\s+(?P<ip_address>\S+)\s+port+\s+(?P<port_number>\d+)\s+transport+\s+(?P<transport_type>\S+)$"
         )
 
         # source-interface GigabitEthernet0/0/0
-        p64 = re.compile(r"^source-interface+\s+(?P<interface_name>\S+)$")
+        p64 = regex_engine.compile(r"^source-interface+\s+(?P<interface_name>\S+)$")
 
         # backup-sla-preferred-color bronze
-        p65 = re.compile(r"^backup-sla-preferred-color+\s+(?P<color>\S+)$")
+        p65 = regex_engine.compile(r"^backup-sla-preferred-color+\s+(?P<color>\S+)$")
 
         # sla-class
-        p66_1 = re.compile(r"^sla-class+.+$")
+        p66_1 = regex_engine.compile(r"^sla-class+.+$")
 
         # sla-class       raghav-test-Bulk-Data
-        p66 = re.compile(r"^sla-class+\s+(?P<sla_class>\S+)$")
+        p66 = regex_engine.compile(r"^sla-class+\s+(?P<sla_class>\S+)$")
 
         # sla-class preferred-color biz-internet custom1
-        p67 = re.compile(r"^sla-class+\s+preferred-color+\s+(?P<preferred_color>[\S\s]+)$")
+        p67 = regex_engine.compile(r"^sla-class+\s+preferred-color+\s+(?P<preferred_color>[\S\s]+)$")
 
         # cloud-saas allow-local
-        p68 = re.compile(r"^cloud-saas+\s+(?P<cloud_saas>\S+)$")
+        p68 = regex_engine.compile(r"^cloud-saas+\s+(?P<cloud_saas>\S+)$")
 
         # from-vsmart lists vpn-list VPN1
         # from-vsmart lists app-list Email
-        p69 = re.compile(r"^from-vsmart+\s+lists+\s+(?P<lists_type>\S+)+\s+(?P<list_name>\S+)$")
+        p69 = regex_engine.compile(r"^from-vsmart+\s+lists+\s+(?P<lists_type>\S+)+\s+(?P<list_name>\S+)$")
 
         # app cisco-jabber-im
-        p70 = re.compile(r"^app+\s+(?P<app_type>\S+)$")
+        p70 = regex_engine.compile(r"^app+\s+(?P<app_type>\S+)$")
 
         # app-family app-fam-2
-        p71 = re.compile(r"^app-family+\s+(?P<app_family_type>\S+)$")
+        p71 = regex_engine.compile(r"^app-family+\s+(?P<app_family_type>\S+)$")
 
         # ip-prefix 10.10.1.0/24
-        p72 = re.compile(r"^ip-prefix+\s+(?P<ip_prefix>\S+)$")
+        p72 = regex_engine.compile(r"^ip-prefix+\s+(?P<ip_prefix>\S+)$")
 
         # tloc 8.8.8.1 color public-internet encap ipsec
-        p73 = re.compile(
+        p73 = regex_engine.compile(
             r"^tloc+\s+(?P<tloc_ip>\S+)\s+color+\s+(?P<color>\S+)\s+encap+\s+(?P<encap>\S+)$"
         )
 
         # primary-preference
         # secondary-preference
         # tertiary-preference
-        p74 = re.compile(r"^(?P<preference_order>\S+)-preference$")
+        p74 = regex_engine.compile(r"^(?P<preference_order>\S+)-preference$")
 
         # color-preference biz-internet
-        p75 = re.compile(r"^color-preference+\s+(?P<color_preference>\S+)$")
+        p75 = regex_engine.compile(r"^color-preference+\s+(?P<color_preference>\S+)$")
 
         # path-preference  direct-path
-        p76 = re.compile(r"^path-preference+\s+(?P<path_preference>\S+)$")
+        p76 = regex_engine.compile(r"^path-preference+\s+(?P<path_preference>\S+)$")
 
         parser_location = None
         parsed_dict = {}
@@ -5383,10 +5386,10 @@ class ShowSdwanUtdDataplaneConfig(ShowSdwanUtdDataplaneConfigSchema):
             output = self.device.execute(self.cli_command)
 
         # utd-dp config context 0
-        p1 = re.compile(r"^utd-dp+\s+config+\s+context+\s+(?P<context_number>\d+)$")
+        p1 = regex_engine.compile(r"^utd-dp+\s+config+\s+context+\s+(?P<context_number>\d+)$")
 
         # context-flag      25493505
-        p2 = re.compile(r"^context-flag+\s+(?P<context_flag>\d+)$")
+        p2 = regex_engine.compile(r"^context-flag+\s+(?P<context_flag>\d+)$")
 
         # engine            Standard
         # state             enabled
@@ -5398,7 +5401,7 @@ class ShowSdwanUtdDataplaneConfig(ShowSdwanUtdDataplaneConfigSchema):
         # url-filtering     not-enabled
         # all-interface     enabled
         # file-inspection   enabled
-        p3 = re.compile(r"^(?P<option_name>\S+)\s+(?P<option_value>\S+)$")
+        p3 = regex_engine.compile(r"^(?P<option_name>\S+)\s+(?P<option_value>\S+)$")
 
         parsed_dict = {}
 
@@ -5521,7 +5524,7 @@ class ShowSdwanAppFwdDpiFlows(ShowSdwanAppFwdDpiFlowsSchema):
             output = self.device.execute(self.cli_command)
 
         # app-fwd cflowd flows vpn 100 src-ip 184.118.1.123 dest-ip 192.168.101.5 src-port 80 dest-port 1360 dscp 32 ip-proto 6
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^app-fwd+\s+cflowd+\s+flows+\s+vpn+\s+(?P<vpn_id>\d+)\s+src-ip+\s+(?P<source_ip>\S+)"
             r"\s+dest-ip+\s+(?P<dest_ip>\S+)\s+src-port+\s+(?P<src_port>\d+)\s+dest-port+\s+"
             r"(?P<dest_port>\d+)\s+dscp+\s+(?P<dscp>\d+)\s+ip-proto+\s+(?P<ip_proto>\d+)$"
@@ -5568,7 +5571,7 @@ class ShowSdwanAppFwdDpiFlows(ShowSdwanAppFwdDpiFlowsSchema):
         # appqoe-dre-input-bytes   0
         # appqoe-dre-input-packets 0
         # appqoe-flags             0
-        p2 = re.compile(r"^(?P<name>\S+)\s+(?P<value>\S+)$")
+        p2 = regex_engine.compile(r"^(?P<name>\S+)\s+(?P<value>\S+)$")
 
         ret_dict = {}
 
@@ -5679,19 +5682,19 @@ class ShowSdwanAppqoeStatus(ShowSdwanAppqoeStatusSchema):
             output = self.device.execute(self.cli_command)
 
         # APPQOE Status : YELLOW
-        p1 = re.compile(r"^APPQOE\s+Status\s+:\s+(?P<appqoe_st>\S+)$")
+        p1 = regex_engine.compile(r"^APPQOE\s+Status\s+:\s+(?P<appqoe_st>\S+)$")
 
         # SSLPROXY : YELLOW
-        p2 = re.compile(r"^SSLPROXY\s+:\s+(?P<ssl_st>\S+)$")
+        p2 = regex_engine.compile(r"^SSLPROXY\s+:\s+(?P<ssl_st>\S+)$")
 
         # TCPPROXY : GREEN
-        p3 = re.compile(r"^TCPPROXY\s+:\s+(?P<tcp_st>\S+)$")
+        p3 = regex_engine.compile(r"^TCPPROXY\s+:\s+(?P<tcp_st>\S+)$")
 
         # SERVICE CHAIN : GREEN
-        p4 = re.compile(r"^SERVICE\s+CHAIN\s+:\s+(?P<sc_st>\S+)$")
+        p4 = regex_engine.compile(r"^SERVICE\s+CHAIN\s+:\s+(?P<sc_st>\S+)$")
 
         # RESOURCE MANAGER : GREEN
-        p5 = re.compile(r"^RESOURCE\s+MANAGER\s+:\s+(?P<rm_st>\S+)$")
+        p5 = regex_engine.compile(r"^RESOURCE\s+MANAGER\s+:\s+(?P<rm_st>\S+)$")
 
 
         parsed_dict = {}
@@ -5763,13 +5766,13 @@ class ShowSdwanAppqoeServiceChainStatus(ShowSdwanAppqoeServiceChainStatusSchema)
             output = self.device.execute(self.cli_command)
 
         # SNORT Connection          UP
-        p1 = re.compile(r"^SNORT\s+Connection\s+(?P<snort_con_state>\S+)$")
+        p1 = regex_engine.compile(r"^SNORT\s+Connection\s+(?P<snort_con_state>\S+)$")
 
         # DRE   Connection          UP
-        p2 = re.compile(r"^DRE\s+Connection\s+(?P<dre_con_state>\S+)$")
+        p2 = regex_engine.compile(r"^DRE\s+Connection\s+(?P<dre_con_state>\S+)$")
 
         # HTTPOPT   Connection    DOWN
-        p3 = re.compile(r"^HTTPOPT\s+Connection\s+(?P<httpopt_con_state>\S+)$")
+        p3 = regex_engine.compile(r"^HTTPOPT\s+Connection\s+(?P<httpopt_con_state>\S+)$")
 
         parsed_dict = {}
 
@@ -5840,52 +5843,52 @@ class ShowSdwanAppqoeDreoptStatus(ShowSdwanAppqoeDreoptStatusSchema):
             output = self.device.execute(self.cli_command)
 
         # DRE ID                                           : 52:54:dd:bd:23:b2-0184aba9c593-79a4a29c
-        p1 = re.compile(r"^DRE\s+ID\s+:\s+(?P<id>\S+)$")
+        p1 = regex_engine.compile(r"^DRE\s+ID\s+:\s+(?P<id>\S+)$")
 
         # DRE uptime                                       : 07:10:46:10
-        p2 = re.compile(r"^DRE\s+uptime\s+:\s+(?P<uptime>\S+)$")
+        p2 = regex_engine.compile(r"^DRE\s+uptime\s+:\s+(?P<uptime>\S+)$")
 
         # Health status                                    : GREEN
-        p3 = re.compile(r"^Health\s+status\s+:\s+(?P<status>\S+)$")
+        p3 = regex_engine.compile(r"^Health\s+status\s+:\s+(?P<status>\S+)$")
 
         # Health status change reason                      : None
-        p4 = re.compile(r"^Health\s+status\s+change\s+reason\s+:\s+(?P<ch_reason>\S+)$")
+        p4 = regex_engine.compile(r"^Health\s+status\s+change\s+reason\s+:\s+(?P<ch_reason>\S+)$")
 
         # Last health status change time                   : 07:10:46:10
-        p5 = re.compile(r"^Last\s+health\s+status\s+change\s+time\s+:\s+(?P<ch_time>\S+)$")
+        p5 = regex_engine.compile(r"^Last\s+health\s+status\s+change\s+time\s+:\s+(?P<ch_time>\S+)$")
 
         # Last health status notification sent time        : 1 second
-        p6 = re.compile(r"^Last\s+health\s+status\s+notification\s+sent\s+time\s+:\s+(?P<send_time>\d+\s+\S+)$")
+        p6 = regex_engine.compile(r"^Last\s+health\s+status\s+notification\s+sent\s+time\s+:\s+(?P<send_time>\d+\s+\S+)$")
 
         # DRE cache status                                 : Active
-        p7 = re.compile(r"^DRE\s+cache\s+status\s+:\s+(?P<cache_st>\S+)$")
+        p7 = regex_engine.compile(r"^DRE\s+cache\s+status\s+:\s+(?P<cache_st>\S+)$")
 
         # Disk cache usage                                 : 0%
-        p8 = re.compile(r"^Disk\s+cache\s+usage\s+:\s+(?P<cache_use>\d+%)$")
+        p8 = regex_engine.compile(r"^Disk\s+cache\s+usage\s+:\s+(?P<cache_use>\d+%)$")
 
         # Disk latency                                     : 0 ms
-        p9 = re.compile(r"^Disk\s+latency\s+:\s+(?P<latency>\d+\sms)$")
+        p9 = regex_engine.compile(r"^Disk\s+latency\s+:\s+(?P<latency>\d+\sms)$")
 
         # Profile type                               : S
-        p10 = re.compile(r"^Profile type\s+:\s+(?P<type>\S+)$")
+        p10 = regex_engine.compile(r"^Profile type\s+:\s+(?P<type>\S+)$")
 
         # Maximum connections                        : 750
-        p11 = re.compile(r"^Maximum\s+connections\s+:\s+(?P<connection>\d+)$")
+        p11 = regex_engine.compile(r"^Maximum\s+connections\s+:\s+(?P<connection>\d+)$")
 
         # Maximum fanout                             : 35
-        p12 = re.compile(r"^Maximum\s+fanout\s+:\s+(?P<fanout>\d+)$")
+        p12 = regex_engine.compile(r"^Maximum\s+fanout\s+:\s+(?P<fanout>\d+)$")
 
         # Disk size                                  : 60 GB
-        p13 = re.compile(r"^Disk\s+size\s+:\s+(?P<d_size>\d+\s\S+)$")
+        p13 = regex_engine.compile(r"^Disk\s+size\s+:\s+(?P<d_size>\d+\s\S+)$")
 
         # Memory size                                : 2048 MB
-        p14 = re.compile(r"^Memory\s+size\s+:\s+(?P<m_size>\d+\s\S+)$")
+        p14 = regex_engine.compile(r"^Memory\s+size\s+:\s+(?P<m_size>\d+\s\S+)$")
 
         # CPU cores                                  : 1
-        p15 = re.compile(r"^CPU\s+cores\s+:\s+(?P<cores>\d+)$")
+        p15 = regex_engine.compile(r"^CPU\s+cores\s+:\s+(?P<cores>\d+)$")
 
         # Disk encryption                            : ON
-        p16 = re.compile(r"^Disk\s+encryption\s+:\s+(?P<encr>\S+)$")
+        p16 = regex_engine.compile(r"^Disk\s+encryption\s+:\s+(?P<encr>\S+)$")
 
         parsed_dict = {}
 
@@ -6051,31 +6054,31 @@ class ShowSdwanServiceChainDatabase(ShowSdwanServiceChainDatabaseSchema):
             output = self.device.execute(self.cli_command)
 
         # Chain-Name: SC3, VRF: 101, Label: 0x800409, State: Up
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Chain-Name:\s+(?P<sc>\S+),\s+VRF:\s+(?P<vrf>\d+),\s+"
             r"Label:\s+(?P<label>\S+),\s+State:\s+(?P<sc_status>\w+)$"
         )
 
         # Services:
-        p2 = re.compile(r"^Services:$")
+        p2 = regex_engine.compile(r"^Services:$")
 
         # FW, State: Up
-        p3 = re.compile(r"^(?P<service_name>(FW|IDS|IDP|SIG|NETSVC\d+)),\s+State:\s+(?P<ser_state>\S+)$")
+        p3 = regex_engine.compile(r"^(?P<service_name>(FW|IDS|IDP|SIG|NETSVC\d+)),\s+State:\s+(?P<ser_state>\S+)$")
 
         # Sequence   1
-        p4 = re.compile(r"^Sequence\s+(?P<seq_no>\d+)$")
+        p4 = regex_engine.compile(r"^Sequence\s+(?P<seq_no>\d+)$")
 
         # Transport HA pair-1:
-        p5 = re.compile(r"^Transport\s+HA\s+pair-(?P<inst_num>\d+):$")
+        p5 = regex_engine.compile(r"^Transport\s+HA\s+pair-(?P<inst_num>\d+):$")
 
         # Active   Tx (GigabitEthernet3, 192.168.40.42  ): Up*
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^(?P<inst_type>(Active|Backup))\s*Tx\s*\((?P<inst_tx_intf>\S+),\s*"
             r"(?P<inst_tx_ip>\S+)\s*\)\s*:\s*(?P<inst_tx_status>\w+)\*?$"
         )
 
         # Rx (GigabitEthernet3, 192.168.40.42  ): Up*
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Rx\s*\((?P<inst_rx_intf>\S+),\s*(?P<inst_rx_ip>\S+)\s*\)\s*:\s*(?P<inst_rx_status>\w+)\*?$"
         )
         services_db = {}
@@ -6173,19 +6176,19 @@ class ShowSdwanServiceChainStats(ShowSdwanServiceChainStatsSchema):
             output = self.device.execute(self.cli_command)
 
         # Service-Chain ID: 4
-        p1 = re.compile(r"^Service-Chain ID:\s+(?P<sc_id>\S+)$")
+        p1 = regex_engine.compile(r"^Service-Chain ID:\s+(?P<sc_id>\S+)$")
 
         # Global stats: 110167
-        p2 = re.compile(r"^Global stats:\s+(?P<gbl_stats>\S+)$")
+        p2 = regex_engine.compile(r"^Global stats:\s+(?P<gbl_stats>\S+)$")
 
         # Service: Firewall
-        p3 = re.compile(r"^Service:\s+(?P<srv_name>\S+)$")
+        p3 = regex_engine.compile(r"^Service:\s+(?P<srv_name>\S+)$")
 
         # Tx pkt: 110167
-        p4 = re.compile(r"^Tx pkt:\s+(?P<tx_pkt>\S+)$")
+        p4 = regex_engine.compile(r"^Tx pkt:\s+(?P<tx_pkt>\S+)$")
 
         # Rx pkt: 110167
-        p5 = re.compile(r"^Rx pkt:\s+(?P<rx_pkt>\S+)$")
+        p5 = regex_engine.compile(r"^Rx pkt:\s+(?P<rx_pkt>\S+)$")
 
         services_tr_stats = {}
         for line in output.splitlines():
@@ -6267,19 +6270,19 @@ class ShowSdwanPolicyDataPolicyFilter(ShowSdwanPolicyDataPolicyFilterSchema):
 
         ret_dict = {}
         # data-policy-filter DP_HUB_LOCAL_FROM_TUNNEL
-        p1 = re.compile(r'^data-policy-filter\s+(?P<policy_name>\S+)$')
+        p1 = regex_engine.compile(r'^data-policy-filter\s+(?P<policy_name>\S+)$')
 
         # data-policy-vpnlist VPN1
-        p2 = re.compile(r'^data-policy-vpnlist\s+(?P<vpn_name>\S+)$')
+        p2 = regex_engine.compile(r'^data-policy-vpnlist\s+(?P<vpn_name>\S+)$')
 
         # data-policy-counter default_action_count
-        p3 = re.compile(r'^data-policy-counter\s+(?P<counter_name>\S+)$')
+        p3 = regex_engine.compile(r'^data-policy-counter\s+(?P<counter_name>\S+)$')
 
         # packets 0
-        p4 = re.compile(r'^packets\s+(?P<pkts_count>\d+)$')
+        p4 = regex_engine.compile(r'^packets\s+(?P<pkts_count>\d+)$')
 
         # bytes   0
-        p5 = re.compile(r'^bytes\s+(?P<bytes_count>\d+)$')
+        p5 = regex_engine.compile(r'^bytes\s+(?P<bytes_count>\d+)$')
 
         policy_stats = {}
         for line in output.splitlines():
@@ -6358,13 +6361,13 @@ class ShowSdwanTenantSumary(ShowSdwanTenantSumarySchema):
         ret_dict ['org_name'] = {}
 
         #tenants-summary max-tenants 30
-        p1 = re.compile(r'^\s*tenants\-summary max\-tenants\s*(?P<max_tenants>\d+)')
+        p1 = regex_engine.compile(r'^\s*tenants\-summary max\-tenants\s*(?P<max_tenants>\d+)')
 
         #tenants-summary num-active-tenants 20
-        p2 = re.compile(r'^\s*tenants\-summary num\-active\-tenants\s*(?P<active_tenants>\d+)')
+        p2 = regex_engine.compile(r'^\s*tenants\-summary num\-active\-tenants\s*(?P<active_tenants>\d+)')
 
         #mttedge-Tenant42   45187   0bf871da-c63c-4043-8f85-386c1f0db2b8
-        p3 = re.compile(r'^\s*(?P<org_name>[\w\d\-]+)\s*(?P<global_id>\d+)\s*(?P<uuid>[\w\d\-]+)')
+        p3 = regex_engine.compile(r'^\s*(?P<org_name>[\w\d\-]+)\s*(?P<global_id>\d+)\s*(?P<uuid>[\w\d\-]+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6436,7 +6439,7 @@ class ShowSdwanTenantOmpPeers(ShowSdwanTenantOmpPeersSchema):
         ret_dict ['peer'] = {}
 
         #17890     1.0.0.37         vsmart  1         1         37        None      up       1:04:13:23       65/13/25
-        p1 = re.compile(r'^\s*(?P<tenant_id>\d+)\s*(?P<peer>[\d\.]+)\s*(?P<type>\w+)\s*(?P<domain_id>\d+)\s*(?P<overlay_id>\d+)\s*(?P<site_id>\d+)\s*(?P<region_id>\w+)\s*(?P<state>\w+)\s*(?P<uptime>[\d\:]+)\s*(?P<r_i_s>[\d\/]+)')
+        p1 = regex_engine.compile(r'^\s*(?P<tenant_id>\d+)\s*(?P<peer>[\d\.]+)\s*(?P<type>\w+)\s*(?P<domain_id>\d+)\s*(?P<overlay_id>\d+)\s*(?P<site_id>\d+)\s*(?P<region_id>\w+)\s*(?P<state>\w+)\s*(?P<uptime>[\d\:]+)\s*(?P<r_i_s>[\d\/]+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6513,11 +6516,11 @@ class ShowSdwanTenantOmpRoutes(ShowSdwanTenantOmpRoutesSchema):
         vpn1 = "x"
 
         #17890     2      115.1.90.0/24       0.0.0.0          66     1091     C,Red,R   installed  2.0.150.6        mpls             ipsec  -           None        None        -
-        p1 = re.compile(r'^\s*(?P<tenant>\d+)\s+(?P<vpn>\d+)\s+(?P<prefix>[\d\.\/]+)\s+(?P<from_peer>[\d\.]+)\s+(?P<path_id>\d+)\s+(?P<label>\d+)\s+(?P<status>[\w\,]+)\s+(?P<attribute_type>\w+)\s+(?P<tloc_ip>[\d\.]+)\s+(?P<color>\w+)\s+(?P<encap>\w+)\s+(?P<preference>\S+)\s+(?P<affinity_group_number>\w+)\s+(?P<region_id>\w+)\s+(?P<region_path>\S)')
+        p1 = regex_engine.compile(r'^\s*(?P<tenant>\d+)\s+(?P<vpn>\d+)\s+(?P<prefix>[\d\.\/]+)\s+(?P<from_peer>[\d\.]+)\s+(?P<path_id>\d+)\s+(?P<label>\d+)\s+(?P<status>[\w\,]+)\s+(?P<attribute_type>\w+)\s+(?P<tloc_ip>[\d\.]+)\s+(?P<color>\w+)\s+(?P<encap>\w+)\s+(?P<preference>\S+)\s+(?P<affinity_group_number>\w+)\s+(?P<region_id>\w+)\s+(?P<region_path>\S)')
 
 
         #0.0.0.0          70     1091     C,Red,R   installed  2.0.150.6        lte              ipsec  -           None        None        -
-        p2 = re.compile(r'^\s*(?P<from_peer>[\d\.]+)\s+(?P<path_id>\d+)\s+(?P<label>\d+)\s+(?P<status>[\w\,]+)\s+(?P<attribute_type>\w+)\s+(?P<tloc_ip>[\d\.]+)\s+(?P<color>\w+)\s+(?P<encap>\w+)\s+(?P<preference>\S+)\s+(?P<affinity_group_number>\w+)\s+(?P<region_id>\w+)\s+(?P<region_path>\S)')
+        p2 = regex_engine.compile(r'^\s*(?P<from_peer>[\d\.]+)\s+(?P<path_id>\d+)\s+(?P<label>\d+)\s+(?P<status>[\w\,]+)\s+(?P<attribute_type>\w+)\s+(?P<tloc_ip>[\d\.]+)\s+(?P<color>\w+)\s+(?P<encap>\w+)\s+(?P<preference>\S+)\s+(?P<affinity_group_number>\w+)\s+(?P<region_id>\w+)\s+(?P<region_path>\S)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6610,8 +6613,8 @@ class ShowSdwanMulticastRemoteNodes(ShowSdwanMulticastRemoteNodesSchema):
 
         # 5.0.0.2         No       No     1004        0/0        0/0        0/0        0/0
         #*6.0.0.2         No       No     1006        0/0        0/0        0/0        0/0
-        p1 = re.compile(r'^\s*(?P<system_ip>[\*\d\.]+)\s+(?P<spt_mode>\w+)\s+(?P<msdp>\w+)\s+(?P<label>\d+)\s+'
-                        r'(?P<received_xg>\d+\/\d+)\s+(?P<received_sg>\d+\/\d+)\s+(?P<sent_xg>\d+\/\d+)\s+(?P<sent_sg>\d+\/\d+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<system_ip>[\*\d\.]+)\s+(?P<spt_mode>\w+)\s+(?P<msdp>\w+)\s+(?P<label>\d+)\s+'
+                                  r'(?P<received_xg>\d+\/\d+)\s+(?P<received_sg>\d+\/\d+)\s+(?P<sent_xg>\d+\/\d+)\s+(?P<sent_sg>\d+\/\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6676,7 +6679,7 @@ class ShowSdwanMulticastReplicators(ShowSdwanMulticastReplicatorsSchema):
 
         #  6.0.0.2                       0            1         500             489
         # >7.0.0.1                       0            2         100               0
-        p1 = re.compile(r'^\s*(?P<system_ip>[\>\d\.]+)\s+(?P<preference>\d+)\s+(?P<route_count>\d+)\s+(?P<threshold>\d+)\s+(?P<distance>\d+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<system_ip>[\>\d\.]+)\s+(?P<preference>\d+)\s+(?P<route_count>\d+)\s+(?P<threshold>\d+)\s+(?P<distance>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6739,31 +6742,31 @@ class ShowSdwanSecurityInfo(ShowSdwanSecurityInfoSchema):
         ret_dict = {}
 
         #security-info authentication-type deprecated
-        p1 = re.compile(r'^\s*security-info\s+authentication-type\s+(?P<authentication_type>\w+)$')
+        p1 = regex_engine.compile(r'^\s*security-info\s+authentication-type\s+(?P<authentication_type>\w+)$')
 
         #security-info rekey 86400
-        p2 = re.compile(r'^\s*security-info\s+rekey\s+(?P<rekey>\d+)$')
+        p2 = regex_engine.compile(r'^\s*security-info\s+rekey\s+(?P<rekey>\d+)$')
 
         #security-info replay-window 512
-        p3 = re.compile(r'^\s*security-info\s+replay-window\s+(?P<replay_window>\d+)$')
+        p3 = regex_engine.compile(r'^\s*security-info\s+replay-window\s+(?P<replay_window>\d+)$')
 
         #security-info encryption-supported "AES_GCM_256 (and AES_256_CBC for multicast)"
-        p4 = re.compile(r'^\s*security-info\s+encryption-supported\s+(?P<encryption_supported>\w+)$')
+        p4 = regex_engine.compile(r'^\s*security-info\s+encryption-supported\s+(?P<encryption_supported>\w+)$')
 
         #security-info fips-mode Disabled
-        p5 = re.compile(r'^\s*security-info\s+fips-mode\s+(?P<fips_mode>\w+)$')
+        p5 = regex_engine.compile(r'^\s*security-info\s+fips-mode\s+(?P<fips_mode>\w+)$')
 
         #security-info pairwise-keying Disabled
-        p6 = re.compile(r'^\s*security-info\s+pairwise-keying\s+(?P<pairwise_keying>\w+)$')
+        p6 = regex_engine.compile(r'^\s*security-info\s+pairwise-keying\s+(?P<pairwise_keying>\w+)$')
 
         #security-info pwk-sym-rekey Enabled
-        p7 = re.compile(r'^\s*security-info\s+pwk-sym-rekey\s+(?P<pwk_sym_rekey>\w+)$')
+        p7 = regex_engine.compile(r'^\s*security-info\s+pwk-sym-rekey\s+(?P<pwk_sym_rekey>\w+)$')
 
         #security-info extended-ar-window Disabled
-        p8 = re.compile(r'^\s*security-info\s+extended-ar-window\s+(?P<extended_ar_window>\w+)$')
+        p8 = regex_engine.compile(r'^\s*security-info\s+extended-ar-window\s+(?P<extended_ar_window>\w+)$')
 
         #security-info integrity-type "ip-udp-esp esp"
-        p9 = re.compile(r'^\s*security-info\s+integrity-type\s+"(?P<integrity_type>.*)"$')
+        p9 = regex_engine.compile(r'^\s*security-info\s+integrity-type\s+"(?P<integrity_type>.*)"$')
 
         for line in output.splitlines():
             if not line:
@@ -6883,54 +6886,54 @@ class ShowSdwanClientInterface(ShowSdwanClientInterfaceSchema):
         srv_dict = {}
 
         #Tloc extension output uidb  : 0xffffffff
-        p1 = re.compile(r'^\s*Tloc\s+extension\s+output\s+uidb\s+:\s+(?P<tloc_extension_output_uidb>\w+)$')
+        p1 = regex_engine.compile(r'^\s*Tloc\s+extension\s+output\s+uidb\s+:\s+(?P<tloc_extension_output_uidb>\w+)$')
 
         #Interface color        : private1
-        p2 = re.compile(r'^\s*Interface\s+color\s+:\s+(?P<interface_color>(.*))$')
+        p2 = regex_engine.compile(r'^\s*Interface\s+color\s+:\s+(?P<interface_color>(.*))$')
 
         #BFD Default DSCP       : 0x30
-        p3 = re.compile(r'^\s*BFD\s+Default\s+DSCP\s+:\s+(?P<bfd_default_dscp>\w+)$')
+        p3 = regex_engine.compile(r'^\s*BFD\s+Default\s+DSCP\s+:\s+(?P<bfd_default_dscp>\w+)$')
 
         #Interface class exmem address   : 0x0
-        p4 = re.compile(r'^\s*Interface\s+class\s+exmem\s+address\s+:\s+(?P<interface_class_exmem_address>\w+)$')
+        p4 = regex_engine.compile(r'^\s*Interface\s+class\s+exmem\s+address\s+:\s+(?P<interface_class_exmem_address>\w+)$')
 
         #Interface rewrite exmem address   : 0x0
-        p5 = re.compile(r'^\s*Interface\s+rewrite\s+exmem\s+address\s+:\s+(?P<interface_rewrite_exmem_address>\w+)$')
+        p5 = regex_engine.compile(r'^\s*Interface\s+rewrite\s+exmem\s+address\s+:\s+(?P<interface_rewrite_exmem_address>\w+)$')
 
         #Explicit input ACL cfg :  Yes
-        p6 = re.compile(r'^\s*Explicit\s+input\s+ACL\s+cfg\s+:\s+(?P<explicit_input_acl_cfg>\w+)$')
+        p6 = regex_engine.compile(r'^\s*Explicit\s+input\s+ACL\s+cfg\s+:\s+(?P<explicit_input_acl_cfg>\w+)$')
 
         #WAN interface          :  Yes
-        p7 = re.compile(r'^\s*WAN\s+interface\s+:\s+(?P<wan_interface>\w+)$')
+        p7 = regex_engine.compile(r'^\s*WAN\s+interface\s+:\s+(?P<wan_interface>\w+)$')
 
         #SIG Tun src            :  No
-        p8 = re.compile(r'^\s*SIG\s+Tun\s+src\s+:\s+(?P<sig_tun_src>\w+)$')
+        p8 = regex_engine.compile(r'^\s*SIG\s+Tun\s+src\s+:\s+(?P<sig_tun_src>\w+)$')
 
         #Standard IPSec Tun src :  No
-        p9 = re.compile(r'^\s*Standard\s+IPSec\s+Tun\s+src\s+:\s+(?P<standard_ipsec_tun_src>\w+)$')
+        p9 = regex_engine.compile(r'^\s*Standard\s+IPSec\s+Tun\s+src\s+:\s+(?P<standard_ipsec_tun_src>\w+)$')
 
         #Standard IPSec Tun all :  No
-        p10 = re.compile(r'^\s*Standard\s+IPSec\s+Tun\s+all\s+:\s+(?P<standard_ipsec_tun_all>\w+)$')
+        p10 = regex_engine.compile(r'^\s*Standard\s+IPSec\s+Tun\s+all\s+:\s+(?P<standard_ipsec_tun_all>\w+)$')
 
         #Standard SSL Tun all   :  No
-        p11 = re.compile(r'^\s*Standard\s+SSL\s+Tun\s+all\s+:\s+(?P<standard_ssl_tun_all>\w+)$')
+        p11 = regex_engine.compile(r'^\s*Standard\s+SSL\s+Tun\s+all\s+:\s+(?P<standard_ssl_tun_all>\w+)$')
 
         #Interface IP           : 0.0.0.0
-        p12 = re.compile(r'^\s*Interface\s+IP\s+:\s+(?P<interface_ip>.*)$')
+        p12 = regex_engine.compile(r'^\s*Interface\s+IP\s+:\s+(?P<interface_ip>.*)$')
 
         #TLOC Ext GRE Dst IP    : 0.0.0.0
-        p13 = re.compile(r'^\s*TLOC\s+Ext\s+GRE\s+Dst\s+IP\s+:\s+(?P<tloc_ext_gre_dst_ip>.*)$')
+        p13 = regex_engine.compile(r'^\s*TLOC\s+Ext\s+GRE\s+Dst\s+IP\s+:\s+(?P<tloc_ext_gre_dst_ip>.*)$')
 
         #Path Monitor send num  : 0
-        p14 = re.compile(r'^\s*Path\s+Monitor\s+send\s+num\s+:\s+(?P<path_monitor_send_num>\d+)$')
+        p14 = regex_engine.compile(r'^\s*Path\s+Monitor\s+send\s+num\s+:\s+(?P<path_monitor_send_num>\d+)$')
 
         #Path Monitor recv num  : 0
-        p15 = re.compile(r'^\s*Path\s+Monitor\s+recv\s+num\s+:\s+(?P<path_monitor_recv_num>\d+)$')
+        p15 = regex_engine.compile(r'^\s*Path\s+Monitor\s+recv\s+num\s+:\s+(?P<path_monitor_recv_num>\d+)$')
 
         #all       :  Yes
         #bgp       :  No
         #dhcp      :  Yes
-        p16 = re.compile(r'^\s*(?P<service_name>\w+)\s+:\s+(?P<allowed>\w+)$')
+        p16 = regex_engine.compile(r'^\s*(?P<service_name>\w+)\s+:\s+(?P<allowed>\w+)$')
 
         for line in output.splitlines():
             if not line:
@@ -7044,7 +7047,7 @@ class ShowSdwanClientInterface(ShowSdwanClientInterfaceSchema):
             #all       :  Yes
             #bgp       :  No
             #dhcp      :  Yes
-            p16 = re.compile(r'^\s*(?P<service_name>\w+)\s+:\s+(?P<allowed>\w+)$')
+            p16 = regex_engine.compile(r'^\s*(?P<service_name>\w+)\s+:\s+(?P<allowed>\w+)$')
             m = p16.match(line)
             if m:
                 groups = m.groupdict()
@@ -7114,13 +7117,13 @@ class ShowSdwanOmpMulticastRoutes(ShowSdwanOmpMulticastRoutesSchema):
 
         #ipv4     0         (*,G)  2    7.0.0.4     5.0.0.6      225.0.0.1  100.200.2.1  1.0.0.17  100.200.2.1  C,R
         #         0         (*,G)  2    5.0.0.6     6.0.0.2      225.0.0.1  100.200.2.1  0.0.0.0   100.200.2.1  C,Red,R
-        p1 = re.compile(r'^\s*(?P<af>\s+|\S+)\s+(?P<tenant>\d+)\s+(?P<type>\S+)\s+(?P<vpn>\d+)\s+(?P<src_orig>[\d\.]+)\s+(?P<dst>[\d\.]+)\s+'
-                        r'(?P<group>[\d\.]+)\s+(?P<src_mcast>[\d\.]+)\s+(?P<peer>[\d\.]+)\s+(?P<rp>[\d\.]+|-)\s+(?P<status>[\w,]+)\s*$')
+        p1 = regex_engine.compile(r'^\s*(?P<af>\s+|\S+)\s+(?P<tenant>\d+)\s+(?P<type>\S+)\s+(?P<vpn>\d+)\s+(?P<src_orig>[\d\.]+)\s+(?P<dst>[\d\.]+)\s+'
+                                  r'(?P<group>[\d\.]+)\s+(?P<src_mcast>[\d\.]+)\s+(?P<peer>[\d\.]+)\s+(?P<rp>[\d\.]+|-)\s+(?P<status>[\w,]+)\s*$')
 
         #                                                                                1.0.0.18  100.200.2.1  C,R
         #                                                                                1.0.0.19  100.200.2.1  C,R
         #                                                                                1.0.0.20  100.200.2.1  C,I,R
-        p2 = re.compile(r'^\s*(?P<peer>[\d\.]+)\s+(?P<rp>[\d\.]+|-)\s+(?P<status>[\w,]+)\s*$')
+        p2 = regex_engine.compile(r'^\s*(?P<peer>[\d\.]+)\s+(?P<rp>[\d\.]+|-)\s+(?P<status>[\w,]+)\s*$')
 
         for line in output.splitlines():
 
@@ -7216,10 +7219,10 @@ class ShowSdwanOmpMulticastAutoDiscover(ShowSdwanOmpMulticastAutoDiscoverSchema)
         ret_dict = {}
 
         #ipv4     0         2    5.0.0.2     1.0.0.17  C,R
-        p1 = re.compile(r'^\s*(?P<af>\s+|\S+)\s+(?P<tenant>\d+)\s+(?P<vpn>\d+)\s+(?P<src_orig>[\d\.]+)\s+(?P<peer>[\d\.]+)\s+(?P<status>[\w,]+)\s*$')
+        p1 = regex_engine.compile(r'^\s*(?P<af>\s+|\S+)\s+(?P<tenant>\d+)\s+(?P<vpn>\d+)\s+(?P<src_orig>[\d\.]+)\s+(?P<peer>[\d\.]+)\s+(?P<status>[\w,]+)\s*$')
 
         #                                    1.0.0.18  C,R
-        p2 = re.compile(r'^\s*(?P<peer>[\d\.]+)\s+(?P<status>[\w,]+)\s*$')
+        p2 = regex_engine.compile(r'^\s*(?P<peer>[\d\.]+)\s+(?P<status>[\w,]+)\s*$')
 
         for line in output.splitlines():
 
@@ -7322,16 +7325,16 @@ class ShowSdwanPolicyServicePath(ShowSdwanPolicyServicePathSchema):
         index = 0
 
         #Number of possible next hops: 3
-        p1 = re.compile(r'^\s*Number\s+of\s+possible\s+next\s+hops\s*:\s+(?P<number_of_paths>\d+)+$')
+        p1 = regex_engine.compile(r'^\s*Number\s+of\s+possible\s+next\s+hops\s*:\s+(?P<number_of_paths>\d+)+$')
 
         #Next Hop: Remote
-        p2 = re.compile(r'^\s*Next\s+Hop\s*:\s+(?P<next_hop_type>\w+)$')
+        p2 = regex_engine.compile(r'^\s*Next\s+Hop\s*:\s+(?P<next_hop_type>\w+)$')
 
         #Remote IP: 40.187.4.2, Interface TenGigabitEthernet1/0/6 Index: 14
-        p3 = re.compile(r'^\s*Remote\s+IP\s*:\s+(?P<remote_ip>.*),\s+Interface\s+(?P<interface>.*)\s+Index\s*:\s+(?P<index>\d+)$')
+        p3 = regex_engine.compile(r'^\s*Remote\s+IP\s*:\s+(?P<remote_ip>.*),\s+Interface\s+(?P<interface>.*)\s+Index\s*:\s+(?P<index>\d+)$')
 
         #Source: 40.185.4.1 12366 Destination: 40.185.20.1 12406 Local Color: blue Remote Color: blue Remote System IP: 6.0.0.2
-        p4 = re.compile(r'^\s*Source\s*:\s+(?P<source>.*)\s+(?P<source_port>\d+)\s+Destination\s*:\s+(?P<destination>.*)\s+(?P<destination_port>\d+)\s+Local\s+Color\s*:\s+(?P<local_color>.*)\s+Remote\s+Color\s*:\s+(?P<remote_color>.*)\s+Remote\s+System\s+IP\s*:\s+(?P<remote_system_ip>.*)$')
+        p4 = regex_engine.compile(r'^\s*Source\s*:\s+(?P<source>.*)\s+(?P<source_port>\d+)\s+Destination\s*:\s+(?P<destination>.*)\s+(?P<destination_port>\d+)\s+Local\s+Color\s*:\s+(?P<local_color>.*)\s+Remote\s+Color\s*:\s+(?P<remote_color>.*)\s+Remote\s+System\s+IP\s*:\s+(?P<remote_system_ip>.*)$')
 
         for line in output.splitlines():
             if not line:
@@ -7424,43 +7427,43 @@ class ShowSdwanAppqoeDreoptStatistics(ShowSdwanAppqoeDreoptStatisticsSchema):
         # Dreopt Statistics
 
         #Total connections                  : 15297
-        p1 = re.compile(r"^Total\s+connections\s+:\s+(?P<total_connections>\S+)$")
+        p1 = regex_engine.compile(r"^Total\s+connections\s+:\s+(?P<total_connections>\S+)$")
 
         #Max concurrent connections         : 61
-        p2 = re.compile(r"^Max\s+concurrent\s+connections\s+:\s+(?P<max_concurrent_connections>\S+)$")
+        p2 = regex_engine.compile(r"^Max\s+concurrent\s+connections\s+:\s+(?P<max_concurrent_connections>\S+)$")
 
         #Current active connections         : 36
-        p3 = re.compile(r"^Current\s+active\s+connections\s+:\s+(?P<current_active_connections>\S+)$")
+        p3 = regex_engine.compile(r"^Current\s+active\s+connections\s+:\s+(?P<current_active_connections>\S+)$")
 
         #Total connection resets            : 0
-        p4 = re.compile(r"^Total\s+connection\s+resets\s+:\s+(?P<total_connection_resets>\S+)$")
+        p4 = regex_engine.compile(r"^Total\s+connection\s+resets\s+:\s+(?P<total_connection_resets>\S+)$")
 
         #Total original bytes               : 56291 MB
-        p5 = re.compile(r"^Total\s+original\s+bytes\s+:\s+(?P<total_original_bytes>\d+\s\S+)$")
+        p5 = regex_engine.compile(r"^Total\s+original\s+bytes\s+:\s+(?P<total_original_bytes>\d+\s\S+)$")
 
         #Total optimized bytes              : 338 MB
-        p6 = re.compile(r"^Total\s+optimized\s+bytes\s+:\s+(?P<total_optimized_bytes>\d+\s\S+)$")
+        p6 = regex_engine.compile(r"^Total\s+optimized\s+bytes\s+:\s+(?P<total_optimized_bytes>\d+\s\S+)$")
 
         #Overall reduction ratio            : 99%
-        p7 = re.compile(r"^Overall\s+reduction\s+ratio\s+:\s+(?P<overall_reduction_ratio>\S+)$")
+        p7 = regex_engine.compile(r"^Overall\s+reduction\s+ratio\s+:\s+(?P<overall_reduction_ratio>\S+)$")
 
         #Disk size used                     : 0%
-        p8 = re.compile(r"^Disk\s+size\s+used\s+:\s+(?P<disk_size_used>\S+)$")
+        p8 = regex_engine.compile(r"^Disk\s+size\s+used\s+:\s+(?P<disk_size_used>\S+)$")
 
         #Cache status                       : Active
-        p9 = re.compile(r"^Cache\s+status\s+:\s+(?P<cache_status>\S+)$")
+        p9 = regex_engine.compile(r"^Cache\s+status\s+:\s+(?P<cache_status>\S+)$")
 
         #Cache Size                         : 1191047 MB
-        p10 = re.compile(r"^Cache\s+Size\s+:\s+(?P<cache_size>\d+\s\S+)$")
+        p10 = regex_engine.compile(r"^Cache\s+Size\s+:\s+(?P<cache_size>\d+\s\S+)$")
 
         #Cache used                         : 0%
-        p11 = re.compile(r"^Cache\s+used\s+:\s+(?P<cache_used>\S+)$")
+        p11 = regex_engine.compile(r"^Cache\s+used\s+:\s+(?P<cache_used>\S+)$")
 
         #Oldest data in cache               : 86:08:46:46
-        p12 = re.compile(r"^Oldest\s+data\s+in\s+cache\s+:\s+(?P<oldest_data_in_cache>\S+)$")
+        p12 = regex_engine.compile(r"^Oldest\s+data\s+in\s+cache\s+:\s+(?P<oldest_data_in_cache>\S+)$")
 
         #Replaced(last hour): size          : 0 MB
-        p13 = re.compile(r"^Replaced\(last\s+hour\):\s+size\s+:\s+(?P<replaced_last_hour_size>\d+\s\S+)$")
+        p13 = regex_engine.compile(r"^Replaced\(last\s+hour\):\s+size\s+:\s+(?P<replaced_last_hour_size>\d+\s\S+)$")
 
         parsed_dict = {}
 
@@ -7603,40 +7606,40 @@ class ShowSdwanAppqoeAdStatistics(ShSdwanAppqoeAdStatisticsSchema):
         # ad-statistics
 
         #Auto-Discovery Option Length Mismatch       : 0
-        p1 = re.compile(r"^Auto-Discovery\s+Option\s+Length\s+Mismatch\s+:\s+(?P<auto_discovery_option_length>\S+)$")
+        p1 = regex_engine.compile(r"^Auto-Discovery\s+Option\s+Length\s+Mismatch\s+:\s+(?P<auto_discovery_option_length>\S+)$")
 
         #Auto-Discovery Option Version Mismatch      : 0
-        p2 = re.compile(r"^Auto-Discovery\s+Option\s+Version\s+Mismatch\s+:\s+(?P<auto_discovery_option_version>\S+)$")
+        p2 = regex_engine.compile(r"^Auto-Discovery\s+Option\s+Version\s+Mismatch\s+:\s+(?P<auto_discovery_option_version>\S+)$")
 
         #Tcp Option Length Mismatch                  : 0
-        p3 = re.compile(r"^Tcp\s+Option\s+Length\s+Mismatch\s+:\s+(?P<tcp_option_length_mismatch>\S+)$")
+        p3 = regex_engine.compile(r"^Tcp\s+Option\s+Length\s+Mismatch\s+:\s+(?P<tcp_option_length_mismatch>\S+)$")
 
         #AD Role set to NONE                         : 0
-        p4 = re.compile(r"^AD\s+Role\s+set\s+to\s+NONE\s+:\s+(?P<ad_role_set_to_none>\S+)$")
+        p4 = regex_engine.compile(r"^AD\s+Role\s+set\s+to\s+NONE\s+:\s+(?P<ad_role_set_to_none>\S+)$")
 
         #[Edge] AD Negotiation Start                 : 0
-        p5 = re.compile(r"^.Edge.\s+AD\s+Negotiation\s+Start\s+:\s+(?P<edge_ad_negotiation_start>\S+)$")
+        p5 = regex_engine.compile(r"^.Edge.\s+AD\s+Negotiation\s+Start\s+:\s+(?P<edge_ad_negotiation_start>\S+)$")
 
         #[Edge] AD Negotiation Done                  : 0
-        p6 = re.compile(r"^.Edge.\s+AD\s+Negotiation\s+Done\s+:\s+(?P<edge_ad_negotiation_done>\S+)$")
+        p6 = regex_engine.compile(r"^.Edge.\s+AD\s+Negotiation\s+Done\s+:\s+(?P<edge_ad_negotiation_done>\S+)$")
 
         #[Edge] Rcvd SYN-ACK w/o AD options          : 0
-        p7 = re.compile(r"^.Edge.\s+Rcvd\s+SYN-ACK\s+w.o\s+AD\s+options\s+:\s+(?P<edge_rcvd_syn_ack_wo_ad_options>\S+)$")
+        p7 = regex_engine.compile(r"^.Edge.\s+Rcvd\s+SYN-ACK\s+w.o\s+AD\s+options\s+:\s+(?P<edge_rcvd_syn_ack_wo_ad_options>\S+)$")
 
         #[Edge] AOIM sync Needed                     : 0
-        p8 = re.compile(r"^.Edge.\s+AOIM\s+sync\s+Needed\s+:\s+(?P<edge_aoim_sync_needed>\S+)$")
+        p8 = regex_engine.compile(r"^.Edge.\s+AOIM\s+sync\s+Needed\s+:\s+(?P<edge_aoim_sync_needed>\S+)$")
 
         #[Core] AD Negotiation Start                 : 0
-        p9 = re.compile(r"^.Core.\s+AD\s+Negotiation\s+Start\s+:\s+(?P<core_ad_negotiation_start>\S+)$")
+        p9 = regex_engine.compile(r"^.Core.\s+AD\s+Negotiation\s+Start\s+:\s+(?P<core_ad_negotiation_start>\S+)$")
 
         #[Core] AD Negotiation Done                  : 0
-        p10 = re.compile(r"^.Core.\s+AD\s+Negotiation\s+Done\s+:\s+(?P<core_ad_negotiation_done>\S+)$")
+        p10 = regex_engine.compile(r"^.Core.\s+AD\s+Negotiation\s+Done\s+:\s+(?P<core_ad_negotiation_done>\S+)$")
 
         #[Core] Rcvd ACK w/o AD options              : 0
-        p11 = re.compile(r"^.Core.\s+Rcvd\s+ACK\s+w.o\s+AD\s+options\s+:\s+(?P<core_rcvd_ack_wo_ad_options>\S+)$")
+        p11 = regex_engine.compile(r"^.Core.\s+Rcvd\s+ACK\s+w.o\s+AD\s+options\s+:\s+(?P<core_rcvd_ack_wo_ad_options>\S+)$")
 
         #[Core] AOIM sync Needed                     : 0
-        p12 = re.compile(r"^.Core.\s+AOIM\s+sync\s+Needed\s+:\s+(?P<core_aoim_sync_needed>\S+)$")
+        p12 = regex_engine.compile(r"^.Core.\s+AOIM\s+sync\s+Needed\s+:\s+(?P<core_aoim_sync_needed>\S+)$")
 
         parsed_dict = {}
 
@@ -7781,52 +7784,52 @@ class ShowSdwanAppqoeRmStatistics(ShowSdwanAppqoeRmStatisticsSchema):
         # rm-statistics
 
         #Times Sessions Health Changed Yellow      : 0
-        p1 = re.compile(r"^Times\s+Sessions\s+Health\s+Changed\s+Yellow\s+:\s+(?P<session_yellow>\S+)$")
+        p1 = regex_engine.compile(r"^Times\s+Sessions\s+Health\s+Changed\s+Yellow\s+:\s+(?P<session_yellow>\S+)$")
 
         #Times Sessions Health Changed Green       : 0
-        p2 = re.compile(r"^Times\s+Sessions\s+Health\s+Changed\s+Green\s+:\s+(?P<session_green>\S+)$")
+        p2 = regex_engine.compile(r"^Times\s+Sessions\s+Health\s+Changed\s+Green\s+:\s+(?P<session_green>\S+)$")
 
         #Times Service mem Health Changed Yellow   : 0
-        p3 = re.compile(r"^Times\s+Service\s+mem\s+Health\s+Changed\s+Yellow\s+:\s+(?P<service_yellow>\S+)$")
+        p3 = regex_engine.compile(r"^Times\s+Service\s+mem\s+Health\s+Changed\s+Yellow\s+:\s+(?P<service_yellow>\S+)$")
 
         #Times Service mem Health Changed Green    : 0
-        p4 = re.compile(r"^Times\s+Service\s+mem\s+Health\s+Changed\s+Green\s+:\s+(?P<service_green>\S+)$")
+        p4 = regex_engine.compile(r"^Times\s+Service\s+mem\s+Health\s+Changed\s+Green\s+:\s+(?P<service_green>\S+)$")
 
         #Overall Health Changed Yellow             : 0
-        p5 = re.compile(r"^Overall\s+Health\s+Changed\s+Yellow\s+:\s+(?P<overall_health_changed_yellow>\S+)$")
+        p5 = regex_engine.compile(r"^Overall\s+Health\s+Changed\s+Yellow\s+:\s+(?P<overall_health_changed_yellow>\S+)$")
 
         #Overall Health Changed Green              : 0
-        p6 = re.compile(r"^Overall\s+Health\s+Changed\s+Green\s+:\s+(?P<overall_health_changed_green>\S+)$")
+        p6 = regex_engine.compile(r"^Overall\s+Health\s+Changed\s+Green\s+:\s+(?P<overall_health_changed_green>\S+)$")
 
         #DRE Reserve Failures Due to Health Status : 34
-        p7 = re.compile(r"^DRE\s+Reserve\s+Failures\s+Due\s+to\s+Health\s+Status\s+:\s+(?P<overall_health_yellow>\S+)$")
+        p7 = regex_engine.compile(r"^DRE\s+Reserve\s+Failures\s+Due\s+to\s+Health\s+Status\s+:\s+(?P<overall_health_yellow>\S+)$")
 
         #Client: TCP
-        p8 = re.compile(r"^\s*Client:\s+(?P<client>\w+)\s*$")
+        p8 = regex_engine.compile(r"^\s*Client:\s+(?P<client>\w+)\s*$")
 
         #TCP Session Alloc  : 8220905
-        p9 = re.compile(r"^TCP\s+Session\s+Alloc\s+:\s+(?P<tcp_session_alloc>\S+)$")
+        p9 = regex_engine.compile(r"^TCP\s+Session\s+Alloc\s+:\s+(?P<tcp_session_alloc>\S+)$")
 
         #TCP Session Free   : 8220552
-        p10 = re.compile(r"^TCP\s+Session\s+Free\s+:\s+(?P<tcp_session_free>\S+)$")
+        p10 = regex_engine.compile(r"^TCP\s+Session\s+Free\s+:\s+(?P<tcp_session_free>\S+)$")
 
         #SSL Session Alloc  : 0
-        p11 = re.compile(r"^SSL\s+Session\s+Alloc\s+:\s+(?P<ssl_session_alloc>\S+)$")
+        p11 = regex_engine.compile(r"^SSL\s+Session\s+Alloc\s+:\s+(?P<ssl_session_alloc>\S+)$")
 
         #SSL Session Free   : 0
-        p12 = re.compile(r"^SSL\s+Session\s+Free\s+:\s+(?P<ssl_session_free>\S+)$")
+        p12 = regex_engine.compile(r"^SSL\s+Session\s+Free\s+:\s+(?P<ssl_session_free>\S+)$")
 
         #DRE Session Alloc  : 0
-        p13 = re.compile(r"^DRE\s+Session\s+Alloc\s+:\s+(?P<dre_session_alloc>\S+)$")
+        p13 = regex_engine.compile(r"^DRE\s+Session\s+Alloc\s+:\s+(?P<dre_session_alloc>\S+)$")
 
         #DRE Session Free   : 0
-        p14 = re.compile(r"^DRE\s+Session\s+Free\s+:\s+(?P<dre_session_free>\S+)$")
+        p14 = regex_engine.compile(r"^DRE\s+Session\s+Free\s+:\s+(?P<dre_session_free>\S+)$")
 
         #HTTP Session Alloc  : 0
-        p15 = re.compile(r"^HTTP\s+Session\s+Alloc\s+:\s+(?P<http_session_alloc>\S+)$")
+        p15 = regex_engine.compile(r"^HTTP\s+Session\s+Alloc\s+:\s+(?P<http_session_alloc>\S+)$")
 
         #HTTP Session Free   : 0
-        p16 = re.compile(r"^HTTP\s+Session\s+Free\s+:\s+(?P<http_session_free>\S+)$")
+        p16 = regex_engine.compile(r"^HTTP\s+Session\s+Free\s+:\s+(?P<http_session_free>\S+)$")
 
         parsed_dict = {}
 
@@ -8004,31 +8007,31 @@ class ShowL2vpnSdwanAll(ShowL2vpnSdwanAllSchema):
 
 
         # L2VPN sdwan Instance : 1001
-        p1 = re.compile(r'^L2VPN\s+sdwan\s+Instance\s+:\s+(?P<l2vpn_sdwan_instance>\d+)$')
+        p1 = regex_engine.compile(r'^L2VPN\s+sdwan\s+Instance\s+:\s+(?P<l2vpn_sdwan_instance>\d+)$')
 
         # VPN Type : point-to-point
-        p2 = re.compile(r'^VPN\s+Type\s+:\s+(?P<vpn_type>\S+)$')
+        p2 = regex_engine.compile(r'^VPN\s+Type\s+:\s+(?P<vpn_type>\S+)$')
 
         #IP Local-learning    : Disabled
-        p2_1 = re.compile(r'^IP\s+Local-learning\s+:\s+(?P<ip_local_learning>\S+)$')
+        p2_1 = regex_engine.compile(r'^IP\s+Local-learning\s+:\s+(?P<ip_local_learning>\S+)$')
 
         #Flooding Suppression : Disabled
-        p2_2 = re.compile(r'^Flooding\s+Suppression\s+:\s+(?P<flooding_suppression>\S+)$')
+        p2_2 = regex_engine.compile(r'^Flooding\s+Suppression\s+:\s+(?P<flooding_suppression>\S+)$')
 
         #   VC_ID: 1001 Bridge-domain: 1001 UP
-        p3 = re.compile(r'^VC_ID:\s+(?P<vc_id>\d+)\s+Bridge-domain:\s+(?P<bridge_domain>\d+)\s+(?P<bridge_status>\S+)$')
+        p3 = regex_engine.compile(r'^VC_ID:\s+(?P<vc_id>\d+)\s+Bridge-domain:\s+(?P<bridge_domain>\d+)\s+(?P<bridge_status>\S+)$')
         
         #    Local l2vpn status: UP
-        p4 = re.compile(r'^Local\s+l2vpn\s+status:\s+(?P<local_l2vpn_status>\S+)$')
+        p4 = regex_engine.compile(r'^Local\s+l2vpn\s+status:\s+(?P<local_l2vpn_status>\S+)$')
         
         #     Local Pseudoports: HundredGigE0/1/4 service instance 1001
-        p5 = re.compile(r'^Local\s+Pseudoports:\s+(?P<local_pseduoports>.*)$')
+        p5 = regex_engine.compile(r'^Local\s+Pseudoports:\s+(?P<local_pseduoports>.*)$')
         
         #    Remote Site: 603
-        p6 = re.compile(r'^Remote\s+Site:\s+(?P<remote_site>\d+)$')
+        p6 = regex_engine.compile(r'^Remote\s+Site:\s+(?P<remote_site>\d+)$')
 
         #      6.0.0.3            UP           00:26:35   private1        ipsec    1036   N/A 
-        p7 = re.compile(r'^(?P<system_ip>\d+.\d+.\d+.\d+)\s+(?P<status>\S+)\s+(?P<up_down_time>\S+)\s+(?P<color>\S+)\s+(?P<encap>\S+)\s+(?P<label>\d+)\s+(?P<df>\S+)')
+        p7 = regex_engine.compile(r'^(?P<system_ip>\d+.\d+.\d+.\d+)\s+(?P<status>\S+)\s+(?P<up_down_time>\S+)\s+(?P<color>\S+)\s+(?P<encap>\S+)\s+(?P<label>\d+)\s+(?P<df>\S+)')
 
     
         ret_dict = {}
@@ -26,6 +26,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================================
 # Schema for:
 #    * 'show segment-routing mpls connected-prefix-sid-map ipv4'
@@ -157,25 +160,25 @@ class ShowSegmentRoutingMplsConnectedPrefixSidMap(ShowSegmentRoutingMplsConnecte
 
         # PREFIX_SID_CONN_MAP ALGO_0
         # PREFIX_SID_CONN_MAP ALGO_1
-        p1 = re.compile(r'^PREFIX_SID_CONN_MAP +(?P<algorithm>(.*))$')
+        p1 = regex_engine.compile(r'^PREFIX_SID_CONN_MAP +(?P<algorithm>(.*))$')
 
         # PREFIX_SID_PROTOCOL_ADV_MAP ALGO_0
         # PREFIX_SID_PROTOCOL_ADV_MAP ALGO_1
-        p2 = re.compile(r'^PREFIX_SID_PROTOCOL_ADV_MAP +(?P<algorithm>(.*))$')
+        p2 = regex_engine.compile(r'^PREFIX_SID_PROTOCOL_ADV_MAP +(?P<algorithm>(.*))$')
 
         # Prefix/masklen   SID Type Range Flags SRGB
         # 10.4.1.1/32         1 Indx     1         Y
-        p3 = re.compile(r'(?P<prefix>(\S+))\/(?P<masklen>(\d+)) +(?P<sid>(\d+))'
-                         r' +(?P<type>(\S+)) +(?P<range>(\d+))'
-                         r'(?: +(?P<flags>(\S+)))? +(?P<srgb>(Y|N))$')
+        p3 = regex_engine.compile(r'(?P<prefix>(\S+))\/(?P<masklen>(\d+)) +(?P<sid>(\d+))'
+                                   r' +(?P<type>(\S+)) +(?P<range>(\d+))'
+                                   r'(?: +(?P<flags>(\S+)))? +(?P<srgb>(Y|N))$')
 
         # Prefix/masklen   SID Type Range Flags SRGB Source
         # 10.4.1.1/32         1 Indx     1         Y  OSPF Area 8 10.4.1.1
         # 10.16.2.2/32         2 Indx     1         Y  OSPF Area 8 10.16.2.2
-        p4 = re.compile(r'(?P<prefix>(\S+))\/(?P<masklen>(\d+)) +(?P<sid>(\d+))'
-                         r' +(?P<type>(\S+)) +(?P<range>(\d+))'
-                         r'(?: +(?P<flags>(\S+)))? +(?P<srgb>(Y|N))'
-                         r' +(?P<source>(.*))$')
+        p4 = regex_engine.compile(r'(?P<prefix>(\S+))\/(?P<masklen>(\d+)) +(?P<sid>(\d+))'
+                                   r' +(?P<type>(\S+)) +(?P<range>(\d+))'
+                                   r'(?: +(?P<flags>(\S+)))? +(?P<srgb>(Y|N))'
+                                   r' +(?P<source>(.*))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -289,8 +292,8 @@ class ShowSegmentRoutingMplsGb(ShowSegmentRoutingMplsGbSchema):
 
         # LABEL-MIN  LABEL_MAX  STATE           DEFAULT  
         # 16000      23999      ENABLED         Yes  
-        p1 = re.compile(r'^(?P<label_min>(\d+)) +(?P<label_max>(\d+))'
-                         r' +(?P<state>(\S+)) +(?P<default>(\S+))$')
+        p1 = regex_engine.compile(r'^(?P<label_min>(\d+)) +(?P<label_max>(\d+))'
+                                   r' +(?P<state>(\S+)) +(?P<default>(\S+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -335,8 +338,8 @@ class ShowSegmentRoutingMplsLB(ShowSegmentRoutingMplsLBSchema):
         else:
             out = output
         # 15000      15999      ENABLED         Yes
-        p1 = re.compile(r'^(?P<label_min>\d+) +(?P<label_max>\d+) +'
-                        r'(?P<state>\S+) +(?P<default>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<label_min>\d+) +(?P<label_max>\d+) +'
+                                  r'(?P<state>\S+) +(?P<default>\S+)$')
         
         # initial variables
         ret_dict = {}
@@ -385,7 +388,7 @@ class ShowSegmentRoutingMplsState(ShowSegmentRoutingMplsStateSchema):
             out = output
             
         # Segment Routing MPLS State : ENABLED
-        p1 = re.compile(r'^Segment +Routing +MPLS +State +: +(?P<state>\S+)$')
+        p1 = regex_engine.compile(r'^Segment +Routing +MPLS +State +: +(?P<state>\S+)$')
         
         # initial variables
         ret_dict = {}
@@ -426,7 +429,7 @@ class ShowSegmentRoutingMplsLbLock(ShowSegmentRoutingMplsLbLockSchema):
         else:
             out = output
         # SR LB (15000, 15999) Lock Users :
-        p1 = re.compile(r'^SR +LB +\((?P<label_min>\d+)\, +'
+        p1 = regex_engine.compile(r'^SR +LB +\((?P<label_min>\d+)\, +'
             r'(?P<label_max>\d+)\) +Lock +Users +:')
 
         # initial variables
@@ -465,7 +468,7 @@ class ShowSegmentRoutingMplsGbLock(ShowSegmentRoutingMplsLbLockSchema):
             out = output
 
         # SR GB (9000, 10000) Lock Users :
-        p1 = re.compile(r'^SR +GB +\((?P<label_min>\d+), +(?P<label_max>\d+)\) +Lock +Users +:$')
+        p1 = regex_engine.compile(r'^SR +GB +\((?P<label_min>\d+), +(?P<label_max>\d+)\) +Lock +Users +:$')
 
         ret_dict = {}
 
@@ -572,45 +575,45 @@ class ShowSegmentRoutingTrafficEngTopology(ShowSegmentRoutingTrafficEngTopologyS
             out = output
 
         # Node 1:
-        p1 = re.compile(r'^Node +(?P<node>\d+):$')
+        p1 = regex_engine.compile(r'^Node +(?P<node>\d+):$')
 
         #   TE router ID: 10.19.198.239
-        p2 = re.compile(r'^TE +router +ID: +(?P<te_router_id>\S+)\)$')
+        p2 = regex_engine.compile(r'^TE +router +ID: +(?P<te_router_id>\S+)\)$')
 
         #   OSPF router ID: 10.19.198.239 area ID: 8 domain ID: 0 ASN: 65109
-        p3 = re.compile(r'^OSPF router ID: +(?P<ospf_router_id>\S+) +area ID: '
-                         r'+(?P<area_id>\d+) +domain ID: +(?P<domain_id>\d+) '
-                         r'+ASN: +(?P<asn>\d+)$')
+        p3 = regex_engine.compile(r'^OSPF router ID: +(?P<ospf_router_id>\S+) +area ID: '
+                                   r'+(?P<area_id>\d+) +domain ID: +(?P<domain_id>\d+) '
+                                   r'+ASN: +(?P<asn>\d+)$')
 
         #   Prefix SID:
         #     Prefix 10.19.198.239, label 16073 (regular), domain ID 0, flags: N , E
-        p4 = re.compile(r'^Prefix +(?P<prefix>\S+), +label +(?P<label>\d+) '
-                         r'+\((?P<label_type>\S+)\), +domain +ID +(?P<domain_id>\d+), '
-                         r'+flags: +(?P<flags>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^Prefix +(?P<prefix>\S+), +label +(?P<label>\d+) '
+                                   r'+\((?P<label_type>\S+)\), +domain +ID +(?P<domain_id>\d+), '
+                                   r'+flags: +(?P<flags>[\S\s]+)$')
 
         #   Link[0]: local address 10.19.198.26, remote address 10.19.198.25
-        p5 = re.compile(r'^Link\[(?P<link>\d+)\]: +local +address +(?P<local_address>\S+), '
-                         r'+remote +address +(?P<remote_address>\S+)$')
+        p5 = regex_engine.compile(r'^Link\[(?P<link>\d+)\]: +local +address +(?P<local_address>\S+), '
+                                   r'+remote +address +(?P<remote_address>\S+)$')
 
         #     Local node:
-        p6 = re.compile(r'^Local +node:$')
+        p6 = regex_engine.compile(r'^Local +node:$')
 
         #     Remote node:
-        p6_1 = re.compile(r'^Remote +node:$')
+        p6_1 = regex_engine.compile(r'^Remote +node:$')
 
         #     Metric: IGP 1000, TE 1000, Delay 1000
-        p7 = re.compile(r'^Metric: +(?P<metric>[\S\s]+)$')
-        p7_1 = re.compile(r'(?P<type>\w+) +(?P<num>\d+)')
+        p7 = regex_engine.compile(r'^Metric: +(?P<metric>[\S\s]+)$')
+        p7_1 = regex_engine.compile(r'(?P<type>\w+) +(?P<num>\d+)')
 
         #     Bandwidth: Total 125000000, Reservable 0
-        p8 = re.compile(r'^Bandwidth: +Total +(?P<total>\d+), +Reservable +(?P<reservable>\d+)$')
+        p8 = regex_engine.compile(r'^Bandwidth: +Total +(?P<total>\d+), +Reservable +(?P<reservable>\d+)$')
 
         #     Admin-groups: 0x00000000
-        p9 = re.compile(r'^Admin-groups: +(?P<admin_groups>\S+)$')
+        p9 = regex_engine.compile(r'^Admin-groups: +(?P<admin_groups>\S+)$')
 
         #     Adj SID: 18 (unprotected)  36 (protected)
-        p10 = re.compile(r'^Adj +SID: +(?P<adj_sid>[\S\s]+)$')
-        p10_1 = re.compile(r'(?P<num>\d+) +\((?P<state>\S+)\)')
+        p10 = regex_engine.compile(r'^Adj +SID: +(?P<adj_sid>[\S\s]+)$')
+        p10_1 = regex_engine.compile(r'(?P<num>\d+) +\((?P<state>\S+)\)')
 
         # initial variables
         ret_dict = {}
@@ -858,82 +861,82 @@ class ShowSegmentRoutingTrafficEngPolicy(ShowSegmentRoutingTrafficEngPolicySchem
 
         # Name: test1 (Color: 100 End-point: 10.169.196.241)
         # Name: test_genie_1 (Color: 0 End-point: )
-        p1 = re.compile(r'^Name: +(?P<name>\S+) +\(Color: +(?P<color>\d+)\s+End-point: *(?P<end_point>\S+)?\)$')
+        p1 = regex_engine.compile(r'^Name: +(?P<name>\S+) +\(Color: +(?P<color>\d+)\s+End-point: *(?P<end_point>\S+)?\)$')
 
         # Status:
         # Admin: up, Operational: up for 09:38:18 (since 08-28 20:56:55.275)
-        p2 = re.compile(r'^Admin: +(?P<admin>\S+), +Operational: +(?P<oper>\S+)'
-                        r' +for +(?P<time>\S+) +\(since (?P<since>\S+\s+\S+)\)$')
+        p2 = regex_engine.compile(r'^Admin: +(?P<admin>\S+), +Operational: +(?P<oper>\S+)'
+                                  r' +for +(?P<time>\S+) +\(since (?P<since>\S+\s+\S+)\)$')
 
         # Candidate-paths:
         # Preference 400:
         # Preference 1 (CLI):
-        p3 = re.compile(r'^Preference +(?P<preference>\d+)[:\s]*(\((?P<type>\w+)\))?\s*\w*:')
+        p3 = regex_engine.compile(r'^Preference +(?P<preference>\d+)[:\s]*(\((?P<type>\w+)\))?\s*\w*:')
         #     Dynamic (pce) (inactive)
         #     Dynamic (active)
-        p4 = re.compile(r'^Dynamic( +(?P<pce>\(pce.*\)))? +\((?P<status>\w+)\)$')
+        p4 = regex_engine.compile(r'^Dynamic( +(?P<pce>\(pce.*\)))? +\((?P<status>\w+)\)$')
 
         #         Weight: 0, Metric Type: TE
-        p5 = re.compile(r'^Weight: +(?P<weight>[\d]+), +Metric +Type: '
-                         r'+(?P<metric_type>[\S]+)$')
+        p5 = regex_engine.compile(r'^Weight: +(?P<weight>[\d]+), +Metric +Type: '
+                                   r'+(?P<metric_type>[\S]+)$')
 
         #         Metric Type: IGP, Path Accumulated Metric: 2200
-        p6 = re.compile(r'^Metric +Type: +(?P<metric_type>[\S]+)(, Path +Accumulated '
-                r'+Metric: +(?P<path_accumulated_metric>[\d]+))?$')
+        p6 = regex_engine.compile(r'^Metric +Type: +(?P<metric_type>[\S]+)(, Path +Accumulated '
+                          r'+Metric: +(?P<path_accumulated_metric>[\d]+))?$')
         #         16063 [Prefix-SID, 10.169.196.241]
         #         16072 [Prefix-SID, 10.189.5.253 - 10.189.6.253]
         #         16063
-        p7 = re.compile(r'^(?P<sid>[\d]+)(?: +\[(?P<sid_type>[\S]+), +(?P<local_address>[\S]+)'
-                         r'( +- +(?P<remote_address>[\S]+))?\])?$')
+        p7 = regex_engine.compile(r'^(?P<sid>[\d]+)(?: +\[(?P<sid_type>[\S]+), +(?P<local_address>[\S]+)'
+                                   r'( +- +(?P<remote_address>[\S]+))?\])?$')
 
         #     Explicit: segment-list test1 (inactive)
-        p8 = re.compile(r'^Explicit: +(?P<category>\S+) +(?P<name>\S+) +\((?P<status>\w+)\)$')
+        p8 = regex_engine.compile(r'^Explicit: +(?P<category>\S+) +(?P<name>\S+) +\((?P<status>\w+)\)$')
 
         # Attributes:
         #     Binding SID: 15000
-        p9 = re.compile(r'^Binding +SID: +(?P<binding_sid>[\d]+)$')
+        p9 = regex_engine.compile(r'^Binding +SID: +(?P<binding_sid>[\d]+)$')
 
         #     Allocation mode: explicit
-        p10 = re.compile(r'^Allocation +mode: +(?P<allocation_mode>[\S]+)$')
+        p10 = regex_engine.compile(r'^Allocation +mode: +(?P<allocation_mode>[\S]+)$')
 
         #     State: Programmed
-        p11 = re.compile(r'^State: +(?P<state>[\S]+)$')
+        p11 = regex_engine.compile(r'^State: +(?P<state>[\S]+)$')
 
         #  Forwarding-ID: 65536 (0x18)
         #  Forwarding-ID: 65536
-        p12 = re.compile(r'^Forwarding-ID: +(?P<id>[\d]+)(?P<extra>[\S\s]+)?$')
+        p12 = regex_engine.compile(r'^Forwarding-ID: +(?P<id>[\d]+)(?P<extra>[\S\s]+)?$')
 
         # Stats:
         #   Packets: 44         Bytes: 1748
-        p13 = re.compile(r'^Packets:\s+(?P<packets>\d+)\s+Bytes:\s+(?P<bytes>\d+)$')
+        p13 = regex_engine.compile(r'^Packets:\s+(?P<packets>\d+)\s+Bytes:\s+(?P<bytes>\d+)$')
 
         # Event history:
         #   Timestamp                   Client                  Event type              Context: Value
         #   08-29 14:51:29.074          FH Resolution           REOPT triggered         Status: REOPTIMIZED
-        p14 = re.compile(r'^(?P<timestamp>[\d\-]+ [\d:.]+)\s+(?P<client>(?:[\S]+ )+)'
-                          r'\s+(?P<event_type>(?:[\S]+ )+)\s+(?P<context>\S+(\s*\S+))'
-                          r':\s+(?P<value>\S+(\s*\S+)*)\s*(CP:\s+(?P<cp>\d+))?$')
+        p14 = regex_engine.compile(r'^(?P<timestamp>[\d\-]+ [\d:.]+)\s+(?P<client>(?:[\S]+ )+)'
+                                    r'\s+(?P<event_type>(?:[\S]+ )+)\s+(?P<context>\S+(\s*\S+))'
+                                    r':\s+(?P<value>\S+(\s*\S+)*)\s*(CP:\s+(?P<cp>\d+))?$')
 
         # Affinity:
-        p15 = re.compile(r'^Affinity:$')
+        p15 = regex_engine.compile(r'^Affinity:$')
 
         # exclude-any
         # include-all
         # include-any
-        p16 = re.compile(r'^(?P<affinity_type>exclude-any|include-all|include-any):$')
+        p16 = regex_engine.compile(r'^(?P<affinity_type>exclude-any|include-all|include-any):$')
 
         # blue
         # green
-        p17 = re.compile(r'^(?P<affinity>\w+)$')
+        p17 = regex_engine.compile(r'^(?P<affinity>\w+)$')
 
         #Owners : CLI
-        p18 = re.compile(r'^Owners\s*:\s+(?P<owners>\S+)')
+        p18 = regex_engine.compile(r'^Owners\s*:\s+(?P<owners>\S+)')
 
         #  Tunnel ID: 65537 (Interface Handle: 0x81)
-        p19 = re.compile(r'^Tunnel ID:\s+(?P<tunnel_id>\d+)\s+\(Interface Handle:\s+(?P<interface_handle>\S+)\)$')
+        p19 = regex_engine.compile(r'^Tunnel ID:\s+(?P<tunnel_id>\d+)\s+\(Interface Handle:\s+(?P<interface_handle>\S+)\)$')
 
         #Mode: constant, Value: 9
-        p20 = re.compile(r'^Mode:\s+(?P<auto_mode>\S+),\s+Value:\s+(?P<auto_value>\S+)$')
+        p20 = regex_engine.compile(r'^Mode:\s+(?P<auto_mode>\S+),\s+Value:\s+(?P<auto_value>\S+)$')
 
         # initial variables
         auto_route, aff_flag = False, False
@@ -1349,25 +1352,25 @@ class ShowSegmentRoutingMplsMappingServer(ShowSegmentRoutingMplsMappingServerSch
 
         # PREFIX_SID_EXPORT_MAP ALGO_0
         # PREFIX_SID_EXPORT_MAP ALGO_1
-        p1 = re.compile(r'^PREFIX_SID_EXPORT_MAP +(?P<algorithm>(\S+))$')
+        p1 = regex_engine.compile(r'^PREFIX_SID_EXPORT_MAP +(?P<algorithm>(\S+))$')
 
         # PREFIX_SID_REMOTE_EXPORT_MAP ALGO_0
         # PREFIX_SID_REMOTE_EXPORT_MAP ALGO_1
-        p2 = re.compile(r'^PREFIX_SID_REMOTE_EXPORT_MAP +(?P<algorithm>(\S+))$')
+        p2 = regex_engine.compile(r'^PREFIX_SID_REMOTE_EXPORT_MAP +(?P<algorithm>(\S+))$')
 
         # Prefix/masklen   SID Type Range Flags SRGB
         # 10.4.1.1/32         1 Indx     1         Y
-        p3 = re.compile(r'(?P<prefix>(\S+))\/(?P<masklen>(\d+)) +(?P<sid>(\d+))'
-                         r' +(?P<type>(\S+)) +(?P<range>(\d+))'
-                         r'(?: +(?P<flags>(\S+)))? +(?P<srgb>(Y|N))$')
+        p3 = regex_engine.compile(r'(?P<prefix>(\S+))\/(?P<masklen>(\d+)) +(?P<sid>(\d+))'
+                                   r' +(?P<type>(\S+)) +(?P<range>(\d+))'
+                                   r'(?: +(?P<flags>(\S+)))? +(?P<srgb>(Y|N))$')
 
         # Prefix/masklen   SID Type Range Flags SRGB Source
         # 10.4.1.1/32         1 Indx     1         Y  OSPF Area 8 10.4.1.1
         # 10.16.2.2/32         2 Indx     1         Y  OSPF Area 8 10.16.2.2
-        p4 = re.compile(r'(?P<prefix>(\S+))\/(?P<masklen>(\d+)) +(?P<sid>(\d+))'
-                         r' +(?P<type>(\S+)) +(?P<range>(\d+))'
-                         r'(?: +(?P<flags>(\S+)))? +(?P<srgb>(Y|N))'
-                         r' +(?P<source>(.*))$')
+        p4 = regex_engine.compile(r'(?P<prefix>(\S+))\/(?P<masklen>(\d+)) +(?P<sid>(\d+))'
+                                   r' +(?P<type>(\S+)) +(?P<range>(\d+))'
+                                   r'(?: +(?P<flags>(\S+)))? +(?P<srgb>(Y|N))'
+                                   r' +(?P<source>(.*))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1488,9 +1491,9 @@ class ShowSegmentRoutingMplsLbAssignedSids(ShowSegmentRoutingMplsLbAssignedSidsS
 
         # 12345   R
         # 12345    S ISIS     2        N   N   192.168.0.1 Ethernet1
-        p1 = re.compile(r"^(?P<sid>\d+) +(?P<state>\w)(?: +(?P<protocol>\w+) +"
-                        r"(?P<topoid>\d+) +(?P<lan>\w+) +(?P<pro>\w+) +"
-                        r"(?P<neighbor>[\d\.]+) +(?P<interface>[\w\/\.]+))?$")
+        p1 = regex_engine.compile(r"^(?P<sid>\d+) +(?P<state>\w)(?: +(?P<protocol>\w+) +"
+                                  r"(?P<topoid>\d+) +(?P<lan>\w+) +(?P<pro>\w+) +"
+                                  r"(?P<neighbor>[\d\.]+) +(?P<interface>[\w\/\.]+))?$")
 
         ret_dict = {}
 
@@ -1594,26 +1597,26 @@ class ShowSegmentRoutingTrafficEngFirstHopResolution(ShowSegmentRoutingTrafficEn
         ret_dict = {}
 
         # Entry: 16230, Resolved via igp
-        p1 = re.compile(r'^Entry: (?P<entry>\d+), (?P<status>.+)$')
+        p1 = regex_engine.compile(r'^Entry: (?P<entry>\d+), (?P<status>.+)$')
         
         # Route Entry:
-        p2 = re.compile(r'^Route entry:$', re.IGNORECASE)
+        p2 = regex_engine.compile(r'^Route entry:$', re.IGNORECASE)
 
         # Old Route Entry:
-        p3 = re.compile(r'^Old Route entry:$', re.IGNORECASE)
+        p3 = regex_engine.compile(r'^Old Route entry:$', re.IGNORECASE)
 
         # Primary 110.1.1.4 via Eth0/1
-        p4 = re.compile(r'^Primary: (?P<ip>([\d.]+|[a-fA-F\d\:]+)) via (?P<using>.+)$')
+        p4 = regex_engine.compile(r'^Primary: (?P<ip>([\d.]+|[a-fA-F\d\:]+)) via (?P<using>.+)$')
 
         # Repair: 1.2.3.4 via MP2
-        p5 = re.compile(r'^Repair: (?P<ip>([\d.]+|[a-fA-F\d\:]+)) via (?P<using>.+)$')
+        p5 = regex_engine.compile(r'^Repair: (?P<ip>([\d.]+|[a-fA-F\d\:]+)) via (?P<using>.+)$')
         
         # Labels: 16230
         # Labels: pop (implicit-null)
-        p6 = re.compile(r'^Labels: (?P<labels>.+)$')
+        p6 = regex_engine.compile(r'^Labels: (?P<labels>.+)$')
         
         # Weight: 1
-        p7 = re.compile(r'^Weight: (?P<weight>\d+)$')
+        p7 = regex_engine.compile(r'^Weight: (?P<weight>\d+)$')
 
         current_entry = ''
         current_entry_pos = ''
@@ -8,15 +8,13 @@ IOSXE parser for the following show command
         * show service-template
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
             Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -49,7 +47,7 @@ class ShowServiceGroupState(ShowServiceGroupStateSchema):
         ret_dict = {}
 
         #     1            Up
-        p1 = re.compile(r'^\s*(?P<group_number>\d+) +(?P<state>\S+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<group_number>\d+) +(?P<state>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -110,34 +108,34 @@ class ShowServiceGroupStats(ShowServiceGroupStatsSchema):
         group_statistics_found = False
 
         # Service Group global statistics:
-        p1 = re.compile(r'^\s*Service +Group +global +statistics:$')
+        p1 = regex_engine.compile(r'^\s*Service +Group +global +statistics:$')
 
         # Number of groups:          1
-        p2 = re.compile(r'^\s*Number +of +groups: +(?P<num_of_groups>\d+)$')
+        p2 = regex_engine.compile(r'^\s*Number +of +groups: +(?P<num_of_groups>\d+)$')
 
         # Number of members:
-        p3 = re.compile(r'^\s*Number +of +members: +(?P<num_of_members>\d+)$')
+        p3 = regex_engine.compile(r'^\s*Number +of +members: +(?P<num_of_members>\d+)$')
 
         # Service Group 1 statistics:
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^\s*Service +Group +(?P<group_statistics>\d+) +statistics:$')
 
         # Number of Interfaces:      1
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^\s*Number +of +Interfaces: +(?P<num_of_interfaces>\d+)$')
 
         #  Number of members:         2
-        p6 = re.compile(r'^\s*Number +of +members: +(?P<num_of_members>\d+)$')
+        p6 = regex_engine.compile(r'^\s*Number +of +members: +(?P<num_of_members>\d+)$')
 
         #    Sub-interface:           2
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^\s*(?P<interface_name>[\w\W]+):? +(?P<sub_interface>\d+)$')
 
         # Members joined:            103
-        p8 = re.compile(r'^\s*Members +joined: +(?P<members_joined>\d+)$')
+        p8 = regex_engine.compile(r'^\s*Members +joined: +(?P<members_joined>\d+)$')
 
         # Members left:              101
-        p9 = re.compile(r'^\s*Members +left: +(?P<members_left>\d+)$')
+        p9 = regex_engine.compile(r'^\s*Members +left: +(?P<members_left>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -277,7 +275,7 @@ class ShowServiceGroupTrafficStats(ShowServiceGroupTrafficStatsSchema):
 
         # Group    Pkts In   Bytes In   Pkts Out  Bytes Out
         #     1         78      10548        172      18606
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^\s*(?P<num>[\d]+) +(?P<pkts_in>[\d]+) +(?P<bytes_in>[\d]+)'
             r' +(?P<pkts_out>[\d]+) +(?P<bytes_out>[\d]+)$')
 
@@ -348,14 +346,14 @@ class ShowServiceInsertionTypeAppqoeServiceNodeGroup(
                 output = self.device.execute(self.cli_command[0])
 
         # Service Node Group name         : SNG-APPQOE
-        p0 = re.compile(r'^Service +Node +Group +name *: +(?P<name>\S+)$')
+        p0 = regex_engine.compile(r'^Service +Node +Group +name *: +(?P<name>\S+)$')
         #     Service Context             : appqoe/1
-        p0_1 = re.compile(r'^Service +Context *: +(?P<context>\S+)$')
+        p0_1 = regex_engine.compile(r'^Service +Context *: +(?P<context>\S+)$')
         #     Member Service Node count   : 1
-        p0_2 = re.compile(r'^Member +Service +Node +count *: +(?P<count>\d+)$')
+        p0_2 = regex_engine.compile(r'^Member +Service +Node +count *: +(?P<count>\d+)$')
 
         # Health Markers:
-        p0_3 = re.compile(r'^(?P<health_key>[a-zA-Z\s]+):$')
+        p0_3 = regex_engine.compile(r'^(?P<health_key>[a-zA-Z\s]+):$')
 
         # Service Node (SN)                   : 192.168.2.2
         # Auto discovered                     : No
@@ -368,16 +366,16 @@ class ShowServiceInsertionTypeAppqoeServiceNodeGroup(
         # Cluster protocol incarnation number           : 5
         # Cluster protocol last sent sequence number    : 1600512340
         # Cluster protocol last received ack number     : 1600512339
-        p1 = re.compile(r'^(?P<key>[\s\S]+\S) +: +(?P<value>[\s\S]+)$')
+        p1 = regex_engine.compile(r'^(?P<key>[\s\S]+\S) +: +(?P<value>[\s\S]+)$')
 
         # Cluster protocol last received sequence number: 311442
-        p2 = re.compile(r'^(?P<key>[\s\S]+\w)+: +(?P<value>[\S]+)$')
+        p2 = regex_engine.compile(r'^(?P<key>[\s\S]+\w)+: +(?P<value>[\S]+)$')
 
         # tcp           GREEN 6%
-        p3 = re.compile(r'^(?P<service>[\s\S]+)\s+(?P<service_color>[\s\S]+)\s+(?P<percent>[\d]+)\%$')
+        p3 = regex_engine.compile(r'^(?P<service>[\s\S]+)\s+(?P<service_color>[\s\S]+)\s+(?P<percent>[\d]+)\%$')
 
         # http  RED/NOT AVAILABLE  
-        p3_1 = re.compile(r'^^(?P<service>[a-zA-Z0-9]+)\s+(?P<service_color>[\s\S]+)\/(?P<status>[0-aA-Za-z\s]+)$')
+        p3_1 = regex_engine.compile(r'^^(?P<service>[a-zA-Z0-9]+)\s+(?P<service_color>[\s\S]+)\/(?P<status>[0-aA-Za-z\s]+)$')
 
         parsed_dict = {}
         for line in output.splitlines():
@@ -537,30 +535,30 @@ class ShowServiceInsertionTypeAppqoeClusterSummary(ShowServiceInsertionTypeAppqo
         last_dict_ptr = {}
         ret_dict = {}
         # Service Context : appqoe/1
-        p1 = re.compile(r'^Service +Context\s+: +appqoe\/(?P<context>[\s\S]+)$')
+        p1 = regex_engine.compile(r'^Service +Context\s+: +appqoe\/(?P<context>[\s\S]+)$')
         # Enabled : TRUE
-        p1_1 = re.compile(r'^(?P<key>[\s\S]+)\s+:\s+(?P<key_value>[\s\S]+)$')
+        p1_1 = regex_engine.compile(r'^(?P<key>[\s\S]+)\s+:\s+(?P<key_value>[\s\S]+)$')
         
         # Service Node Group            : SNG-APPQOE
-        p1_2 = re.compile(r'^Service +Node +Group\s+: (?P<sng_grp>[\S]+)$')
+        p1_2 = regex_engine.compile(r'^Service +Node +Group\s+: (?P<sng_grp>[\S]+)$')
         
         # Service Node Group            : SNG-APPQOE ID: 1
-        p1_3 = re.compile(r'^Service\s+Node\s+Group\s+:\s+(?P<sng_grp>[\S]+)(\s+ID:\s+(?P<id_val>[\S]+))?$')
+        p1_3 = regex_engine.compile(r'^Service\s+Node\s+Group\s+:\s+(?P<sng_grp>[\S]+)(\s+ID:\s+(?P<id_val>[\S]+))?$')
 
         # Service Controller IP       : 26.126.0.254   VRF : 65500
-        p2 = re.compile(r'^(?P<sc>[\s\S]+)\s+:+(?P<sc_value>[\s\S]+)\s+ +(?P<vrf>[\s\S]+)\s+: +(?P<vrf_val>[\S]+)$')
+        p2 = regex_engine.compile(r'^(?P<sc>[\s\S]+)\s+:+(?P<sc_value>[\s\S]+)\s+ +(?P<vrf>[\s\S]+)\s+: +(?P<vrf_val>[\S]+)$')
         
         # | 26.126.0.1      | 26.1.0.1        | 26        | GREEN   |                        |
-        p3 = re.compile(r'^\| (?P<sn_ip>(\S+))\s+\|\s+(?P<sn_system_ip>(\S+))\s+\|\s+(?P<sn_site_id>(\d+))\s+\|\s+(?P<sn_status>(\w+))\s+\|\s+(?P<sn_error>([\s\S]+))\|')
+        p3 = regex_engine.compile(r'^\| (?P<sn_ip>(\S+))\s+\|\s+(?P<sn_system_ip>(\S+))\s+\|\s+(?P<sn_site_id>(\d+))\s+\|\s+(?P<sn_status>(\w+))\s+\|\s+(?P<sn_error>([\s\S]+))\|')
         
         # Service Controller System IP: 26.0.0.26
-        p4 = re.compile(r"^Service\s+Controller\s+System\s+IP:\s+(?P<systemIp>\S+)$")
+        p4 = regex_engine.compile(r"^Service\s+Controller\s+System\s+IP:\s+(?P<systemIp>\S+)$")
 
         # Service Controller Site ID  : 26
-        p5 = re.compile(r"^Service\s+Controller\s+Site\s+ID\s+:\s+(?P<siteId>\S+)$")
+        p5 = regex_engine.compile(r"^Service\s+Controller\s+Site\s+ID\s+:\s+(?P<siteId>\S+)$")
 
         # Service Controller Group      : ACG-APPQOE
-        p6 = re.compile(r"^Service\s+Controller\s+Group\s+:\s+(?P<group>\S+)$")        
+        p6 = regex_engine.compile(r"^Service\s+Controller\s+Group\s+:\s+(?P<group>\S+)$")        
 
         for line in output.splitlines():
             line = line.strip()
@@ -675,7 +673,7 @@ class ShowServiceTemplate(ShowServiceTemplateSchema):
             output = self.device.execute(self.cli_command)
 
         # DEFAULT_LINKSEC_POLICY_MUST_SECURE               NONE                     
-        p1 = re.compile(r"^(?P<policy_name>\S+)\s+(?P<description>\w+)$")
+        p1 = regex_engine.compile(r"^(?P<policy_name>\S+)\s+(?P<description>\w+)$")
 
         ret_dict = {}
 
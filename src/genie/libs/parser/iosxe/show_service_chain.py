@@ -7,7 +7,6 @@
      * show track dynamic
 """
 #python
-import re
 import logging
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,9 @@ logger = logging.getLogger(__name__)
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema,Any,Optional,Or,And,Default,Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ========================================================================
 # Schema for 'show platform software sdwan service-chain database summary'
 # ========================================================================
@@ -51,7 +53,7 @@ class ShowSdwanServiceChainDatabaseSummary(ShowSdwanServiceChainDatabaseSummaryS
         ret_dict = {}
 
         # SC1   101    4      1014      Up
-        p1 = re.compile(r'^(?P<sc>\S+)\s+(?P<vrf>\d+)\s+(?P<srv_count>\d+)\s+(?P<label>\d+)\s+(?P<status>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<sc>\S+)\s+(?P<vrf>\d+)\s+(?P<srv_count>\d+)\s+(?P<label>\d+)\s+(?P<status>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -133,50 +135,50 @@ class ShowSdwanServiceChainStatsDetail(ShowSdwanServiceChainStatsDetailSchema):
         ha_mode_found = False
 
         # Summary: SC1, VRF: 101, Label: 1014, Status: Up
-        p1 = re.compile(r'^Summary:\s+(?P<sc>\S+)\,\s+VRF:\s+(?P<vrf>\d+)\,\s+Label:\s+(?P<label>\d+)\,\s+Status:\s+(?P<status>\w+)$')
+        p1 = regex_engine.compile(r'^Summary:\s+(?P<sc>\S+)\,\s+VRF:\s+(?P<vrf>\d+)\,\s+Label:\s+(?P<label>\d+)\,\s+Status:\s+(?P<status>\w+)$')
 
         # Service: FW Sent: 3151958519 Rcvd: 3126458239
-        p2 = re.compile(r'^Service:\s+(?P<service>\S+)\s+Sent:\s+(?P<t_send>\d+)\s+Rcvd:\s+(?P<t_rcvd>\d+)$')
+        p2 = regex_engine.compile(r'^Service:\s+(?P<service>\S+)\s+Sent:\s+(?P<t_send>\d+)\s+Rcvd:\s+(?P<t_rcvd>\d+)$')
 
         # HA Pair 1: IPv4
         # HA Pair 1: IPv6
         # HA Pair 2: Tunnel IPv6
         # HA Pair 3: Tunnel IPv4
         # ha_pair 1: ipv4
-        p3 = re.compile(r'^(HA\s+Pair|ha_pair)\s+(?P<ha_num>\d+):\s+(?P<type>.+)$')
+        p3 = regex_engine.compile(r'^(HA\s+Pair|ha_pair)\s+(?P<ha_num>\d+):\s+(?P<type>.+)$')
 
         # Active Sent: 1101144045 Rcvd: 1101143388
-        p4 = re.compile(r'^(?P<ha_mode>(Active|Backup))\s+Sent:\s+(?P<ha_send>\d+)\s+Rcvd:\s+(?P<ha_rcvd>\d+)$')
+        p4 = regex_engine.compile(r'^(?P<ha_mode>(Active|Backup))\s+Sent:\s+(?P<ha_send>\d+)\s+Rcvd:\s+(?P<ha_rcvd>\d+)$')
 
         # Service Chain: SC2
-        p5 = re.compile(r'^Service Chain:\s+(?P<sc>\w+)\s*$')
+        p5 = regex_engine.compile(r'^Service Chain:\s+(?P<sc>\w+)\s*$')
 
         # vrf: 201
-        p6 = re.compile(r'^vrf:\s+(?P<vrf>\d+)\s*$')
+        p6 = regex_engine.compile(r'^vrf:\s+(?P<vrf>\d+)\s*$')
 
         # label: 1015
-        p7 = re.compile(r'^label:\s+(?P<label>\d+)\s*$')
+        p7 = regex_engine.compile(r'^label:\s+(?P<label>\d+)\s*$')
 
         # state: up
-        p8 = re.compile(r'^state:\s+(?P<status>[a-zA-Z]+)\s*$')
+        p8 = regex_engine.compile(r'^state:\s+(?P<status>[a-zA-Z]+)\s*$')
 
         # track obj: 20
-        p9 = re.compile(r'^track obj:\s+(?P<track_obj>\d+)\s*$')
+        p9 = regex_engine.compile(r'^track obj:\s+(?P<track_obj>\d+)\s*$')
 
         # service: FW
         # service: NETSVC2
-        p10 = re.compile(r'^service:\s+(?P<service>\S+)\s*$')
+        p10 = regex_engine.compile(r'^service:\s+(?P<service>\S+)\s*$')
 
         # tx: 570100617 rx: 578128069
-        p11 = re.compile(r'^tx:\s+(?P<t_send>\d+)\s*rx:\s+(?P<t_rcvd>\d+)\s*$')
+        p11 = regex_engine.compile(r'^tx:\s+(?P<t_send>\d+)\s*rx:\s+(?P<t_rcvd>\d+)\s*$')
 
         # active
         # backup
-        p12 = re.compile(r'^(?P<ha_mode>(active|backup))\s*$')
+        p12 = regex_engine.compile(r'^(?P<ha_mode>(active|backup))\s*$')
 
         # tx tracker: sent: 6978 dropped: 15 rtt: 1
         # rx tracker: sent: 0 dropped: 0 rtt: 0
-        p13 = re.compile(r'^(?P<tracker>\w+)\s+tracker:\s+sent:\s+(?P<sent>\d+)\s+dropped:\s+(?P<dropped>\d+)\s+rtt:\s+(?P<rtt>\d+)$')
+        p13 = regex_engine.compile(r'^(?P<tracker>\w+)\s+tracker:\s+sent:\s+(?P<sent>\d+)\s+dropped:\s+(?P<dropped>\d+)\s+rtt:\s+(?P<rtt>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -353,7 +355,7 @@ class ShowSdwanQfpActiveDatapathStats(ShowSdwanQfpActiveDatapathStatsSchema):
         ret_dict = {}
 
         # ipv4-acl-in-sc-strict-drop   57
-        p1 = re.compile(r'^(?P<type>\S+)\s+(?P<drop>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<type>\S+)\s+(?P<drop>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -406,7 +408,7 @@ class ShowEndpointTracker(ShowEndpointTrackerSchema):
         ret_dict = {}
 
         # 201:101:22:t3                    t3                     Up              IPv4             1               1          192.168.46.1
-        p1 = re.compile(r'^(?P<intf>\S+)\s+(?P<ep>\S+)\s+(?P<state>\S+)\s+(?P<addr>\S+)\s+(?P<rt>\S+)\s+(?P<probe>\d+)\s+(?P<hop>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<intf>\S+)\s+(?P<ep>\S+)\s+(?P<state>\S+)\s+(?P<addr>\S+)\s+(?P<rt>\S+)\s+(?P<probe>\d+)\s+(?P<hop>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -464,16 +466,16 @@ class ShowTrackDynamic(ShowTrackDynamicSchema):
         ret_dict = {}
 
         # Track 20
-        p1 = re.compile(r'^Track\s+(?P<id>\d+)$')
+        p1 = regex_engine.compile(r'^Track\s+(?P<id>\d+)$')
 
         # State is Up
-        p2 = re.compile(r'^State\s+is\s+(?P<status>\S+)$')
+        p2 = regex_engine.compile(r'^State\s+is\s+(?P<status>\S+)$')
 
         # 2 changes, last change 16:33:53
-        p3 = re.compile(r'^(?P<num>\d+)\s+changes\,\s+last\s+change\s+(?P<time>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<num>\d+)\s+changes\,\s+last\s+change\s+(?P<time>\S+)$')
 
         # Route Map 0
-        p4 = re.compile(r'^Route\s+Map\s+(?P<map>\d+)$')
+        p4 = regex_engine.compile(r'^Route\s+Map\s+(?P<map>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
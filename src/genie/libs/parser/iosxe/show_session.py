@@ -1,9 +1,9 @@
 """show_session.py
 
 """
-import re
 import genie.parsergen as pg
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.metaparser import MetaParser
@@ -57,13 +57,13 @@ class ShowLine(ShowLineSchema):
         # 0/0/0    2 TTY   9600/9600  -    -      -    -    -   746     61    0/0      -
         # 0/0/3    5 TTY 115200/115200-    -      -    -    -   606 197460 14906/0      -
         # *  322  322 VTY              -    -      -    -    -  1366      0    0/0      -
-        p1 = re.compile(r'^((?P<busy>\*) *)?(?P<tty>[\d\/]+)( +(?P<line>\d+))?'
-                         r' +(?P<type>\w+)( +(?P<tx>\d+)\/(?P<rx>\d+))?'
-                         r' *(?P<a>[\w\-]+) +(?P<modem>[\w\-]+)'
-                         r' +(?P<roty>[\w\-]+) +(?P<acco>[\w\-]+)'
-                         r' +(?P<acci>[\w\-]+) +(?P<uses>\d+)'
-                         r' +(?P<noise>\d+) +(?P<overruns>[\d\/]+)'
-                         r' +(?P<int>[\w\-]+)$')
+        p1 = regex_engine.compile(r'^((?P<busy>\*) *)?(?P<tty>[\d\/]+)( +(?P<line>\d+))?'
+                                   r' +(?P<type>\w+)( +(?P<tx>\d+)\/(?P<rx>\d+))?'
+                                   r' *(?P<a>[\w\-]+) +(?P<modem>[\w\-]+)'
+                                   r' +(?P<roty>[\w\-]+) +(?P<acco>[\w\-]+)'
+                                   r' +(?P<acci>[\w\-]+) +(?P<uses>\d+)'
+                                   r' +(?P<noise>\d+) +(?P<overruns>[\d\/]+)'
+                                   r' +(?P<int>[\w\-]+)$')
 
         idx = 0
         for line in out.splitlines():
@@ -192,21 +192,21 @@ class ShowUsers(ShowUsersSchema):
         #    10 vty 0               Virtual-Access2      0          1212321
         #    0 con 0                idle
         # *   2 vty 0         user1           idle            0   SERVICE1.CISCO.COM
-        p1 = re.compile(r'^(?:(?P<active>\*))?( +)?(?P<line>\d+ \S+ \d+)(?: {1,9}(?P<user>\S+))? '
-                        r'+(?P<host>\S+)( +)?(?P<idle>\S+)?(?: +(?P<location>\S+))?')
+        p1 = regex_engine.compile(r'^(?:(?P<active>\*))?( +)?(?P<line>\d+ \S+ \d+)(?: {1,9}(?P<user>\S+))? '
+                                  r'+(?P<host>\S+)( +)?(?P<idle>\S+)?(?: +(?P<location>\S+))?')
         # counting spaces from 1-9, check if class errors in future releases
 
         #                                                    			 foo-bar.cisco.com
-        p1_1 = re.compile(r'^(?P<location>\S+)$')
+        p1_1 = regex_engine.compile(r'^(?P<location>\S+)$')
 
         #  Interface    User               Mode         Idle     Peer Address
         #  unknown      NETCONF(ONEP)      com.cisco.ne 00:00:49
-        p2 = re.compile(r'^(?P<interface>\S+) +(?P<user>\S+) +(?P<mode>\S+) '
-                        r'+(?P<idle>[\d\:]+)( +(?P<peer_address>\S+)?)?$')
+        p2 = regex_engine.compile(r'^(?P<interface>\S+) +(?P<user>\S+) +(?P<mode>\S+) '
+                                  r'+(?P<idle>[\d\:]+)( +(?P<peer_address>\S+)?)?$')
 
         # Vi2.1        lns@cisco.com      PPPoVPDN     -        21.21.21.7
-        p3 = re.compile(r'^(?P<intf>[A-Za-z\d\.]+) +(?P<u_name>\S+) +(?P<mode>\S+)'
-                        r' +(?P<idle_time>\S+) +(?P<peer_address>[\d\.]+)$')
+        p3 = regex_engine.compile(r'^(?P<intf>[A-Za-z\d\.]+) +(?P<u_name>\S+) +(?P<mode>\S+)'
+                                  r' +(?P<idle_time>\S+) +(?P<peer_address>[\d\.]+)$')
 
         # initial return dictionary
         ret_dict = {}
@@ -5,11 +5,9 @@ IOSXE parsers for the following show commands:
     * show smartpower children
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
@@ -45,7 +43,7 @@ class ShowSmartPowerUsage(ShowSmartPowerUsageSchema):
         # switch-4                 30.0 (W)   consumer  actual
         
         # switch-1                 30.0 (W)  consumer  actual
-        p1 = re.compile(r'^switch-(?P<switch>\d+)+\s+(?P<usage>[\S\s]+)\s+(?P<category>\w+)\s+(?P<caliber>\w+)$')
+        p1 = regex_engine.compile(r'^switch-(?P<switch>\d+)+\s+(?P<usage>[\S\s]+)\s+(?P<category>\w+)\s+(?P<caliber>\w+)$')
         for line in output.splitlines():
             line = line.strip()
 
@@ -113,16 +111,16 @@ class ShowSmartPowerChildren(ShowSmartPowerChildrenSchema):
         
 
         # Tw1/0/1     IP Phone 9971     SEP10BD18DD4A19       8.0   (W)  consumer  10    1    PoE
-        p1 = re.compile(r'^(?P<interface>\S+)\s+(?P<role>IP Phone.*\d+)\s+(?P<name>\w+)\s+(?P<usage>[\S\s]+)\s+(?P<category>\w+)\s+(?P<level>\d+)\s+(?P<imp>\d+)\s+(?P<type>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<role>IP Phone.*\d+)\s+(?P<name>\w+)\s+(?P<usage>[\S\s]+)\s+(?P<category>\w+)\s+(?P<level>\d+)\s+(?P<imp>\d+)\s+(?P<type>\w+)$')
 
         # Subtotals: (Consumer: 424.7 (W), Meter: 0.0 (W), Producer: 0.0 (W))
-        p2 = re.compile(r'^Subtotals: \(Consumer: (?P<consumer>[\S\s]+)\s+Meter: (?P<meter>[\S\s]+)\s+Producer: (?P<producer>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^Subtotals: \(Consumer: (?P<consumer>[\S\s]+)\s+Meter: (?P<meter>[\S\s]+)\s+Producer: (?P<producer>[\S\s]+)$')
 
         # Total: 424.7 (W), Count: 20
-        p3 = re.compile(r'^Total: (?P<total>[\S\s]+)\s+Count: (?P<count>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Total: (?P<total>[\S\s]+)\s+Count: (?P<count>[\S\s]+)$')
 
         # C9300X-24HX       Peer1-topo1-ott-2     110.0 (W)  consumer  10    1    parent
-        p4 = re.compile(r'^(?P<role>[\w\-]+)\s+(?P<name>\S+)\s+(?P<usage>[\S\s]+)\s+(?P<category>\w+)\s+(?P<level>\d+)\s+(?P<imp>\d+)\s+(?P<type>\w+)$')
+        p4 = regex_engine.compile(r'^(?P<role>[\w\-]+)\s+(?P<name>\S+)\s+(?P<usage>[\S\s]+)\s+(?P<category>\w+)\s+(?P<level>\d+)\s+(?P<imp>\d+)\s+(?P<type>\w+)$')
         for line in output.splitlines():
             line = line.strip()
             
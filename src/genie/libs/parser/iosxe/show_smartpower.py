@@ -5,11 +5,13 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowSmartPowerVersionSchema(MetaParser):
     """ schema for show smart power version """
     schema = {
@@ -35,19 +37,19 @@ class ShowSmartPowerVersion(ShowSmartPowerVersionSchema):
         ret_dict = {}
         
         # SmartPower is Enabled
-        p1 = re.compile(r'^SmartPower is (?P<smartpower_mode>\S+)$')
+        p1 = regex_engine.compile(r'^SmartPower is (?P<smartpower_mode>\S+)$')
 
         # IOS Version:  17.15.20240121:114115101
-        p2 = re.compile(r'^IOS Version:\s+(?P<ios_version>\S+)$')
+        p2 = regex_engine.compile(r'^IOS Version:\s+(?P<ios_version>\S+)$')
 
         # SmartPower Specification:  3.5.1
-        p3 = re.compile(r'^SmartPower Specification:\s+(?P<smartpower_specification>\S+)$')
+        p3 = regex_engine.compile(r'^SmartPower Specification:\s+(?P<smartpower_specification>\S+)$')
 
         # SmartPower Version:  1.0
-        p4 = re.compile(r'^SmartPower Version:  (?P<smartpower_version>\S+)$')
+        p4 = regex_engine.compile(r'^SmartPower Version:  (?P<smartpower_version>\S+)$')
 
         # Powernet SDK Version:  4.0.1
-        p5 = re.compile(r'^Powernet SDK Version:  (?P<sdk_version>\S+)$')
+        p5 = regex_engine.compile(r'^Powernet SDK Version:  (?P<sdk_version>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -115,19 +117,19 @@ class ShowSmartPowerDomain(ShowSmartPowerDomainSchema):
         ret_dict = {}
                                                       
         # Name      : switch-2  
-        p1 = re.compile(r'^Name\s+:\s+(?P<switch_name>\S+)$')
+        p1 = regex_engine.compile(r'^Name\s+:\s+(?P<switch_name>\S+)$')
 
         # Domain    : cisco  
-        p2 = re.compile(r'^Domain\s+:\s+(?P<domain>\S+)$')
+        p2 = regex_engine.compile(r'^Domain\s+:\s+(?P<domain>\S+)$')
 
         # Protocol  : udp
-        p3 = re.compile(r'^Protocol\s+:\s+(?P<protocol>\S+)$')
+        p3 = regex_engine.compile(r'^Protocol\s+:\s+(?P<protocol>\S+)$')
 
         # IP        : 10.10.10.1
-        p4 = re.compile(r'^IP\s+:\s+(?P<ip>\S+)$')
+        p4 = regex_engine.compile(r'^IP\s+:\s+(?P<ip>\S+)$')
 
         # Port      : 43440
-        p5 = re.compile(r'^Port\s+:\s+(?P<port>\S+)$')
+        p5 = regex_engine.compile(r'^Port\s+:\s+(?P<port>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -208,7 +210,7 @@ class ShowSmartpowerCategories(ShowSmartpowerCategoriesSchema):
         # 1       Hibernate   Brown       NA
         # 0       Shut        Black       PwrDown
 
-        p1 = re.compile(r'^(?P<level>\d+)+\s+(?P<label>\w+)+\s+(?P<color>\w+)\s+(?P<feature_mapping>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<level>\d+)+\s+(?P<label>\w+)+\s+(?P<color>\w+)\s+(?P<feature_mapping>\w+)$')
         for line in output.splitlines():
             line = line.strip()
 
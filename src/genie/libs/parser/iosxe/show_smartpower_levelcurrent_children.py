@@ -6,11 +6,13 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowSmartPowerLevelCurrentChildrenSchema(MetaParser):
     """ schema for show smart power version """
     schema = {
@@ -50,10 +52,10 @@ class ShowSmartPowerLevelCurrentChildren(ShowSmartPowerLevelCurrentChildrenSchem
         #             Peer1-topo1-ott-2        10     0.0   (W)  
         
         # Te1/0/48    Te1.0.48                 10     60.0  (W)  
-        p1 = re.compile(r'^(?P<interface>\S+)\s+(?P<name>\S+)\s+(?P<level>\d+)\s+(?P<value>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<name>\S+)\s+(?P<level>\d+)\s+(?P<value>[\S\s]+)$')
 
         #             Peer1-topo1-ott-1        10     545.0 (W) 
-        p2 = re.compile(r'^(?P<name>\S+)\s+(?P<level>\d+)\s+(?P<value>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^(?P<name>\S+)\s+(?P<level>\d+)\s+(?P<value>[\S\s]+)$')
         for line in output.splitlines():
             line = line.strip()
 
@@ -6,12 +6,12 @@ IOSXE parsers for the following show commands:
 '''
 
 # Python
-import re
 from urllib.parse import non_hierarchical
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ==========================
@@ -51,13 +51,13 @@ class ShowSnmpMib(ShowSnmpMibSchema):
 
         # lldpLocalSystemData.1
         # dot3adAggPortDebugPartnerSyncTransitionCount
-        p1 = re.compile(r'^(?P<snmp>([a-zA-Z0-9]+))(?:\.(?P<num>(\d+)))?$')
+        p1 = regex_engine.compile(r'^(?P<snmp>([a-zA-Z0-9]+))(?:\.(?P<num>(\d+)))?$')
 
         # optIfObjects.1.1.1
         # mib-10.49.1.3.1.1.9
         # rmon.10.76.1.1
         # rmon.19.1
-        p2 = re.compile(r'^(?P<snmp>([a-zA-Z0-9\-\.]+))$')
+        p2 = regex_engine.compile(r'^(?P<snmp>([a-zA-Z0-9\-\.]+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -183,80 +183,80 @@ class ShowSnmp(ShowSnmpSchema):
         #     Logging to 10.166.67.19.108, 0/10, 102045 sent, 3065 dropped.
 
         # Chassis: FCE2310A48M
-        p_chassis = re.compile(r"Chassis:\s+(?P<chassis>\S+)$")
+        p_chassis = regex_engine.compile(r"Chassis:\s+(?P<chassis>\S+)$")
 
         # Contact: "something@cisco.com"
-        p_contact = re.compile(r"Contact:\s+(?P<contact>.*)$")
+        p_contact = regex_engine.compile(r"Contact:\s+(?P<contact>.*)$")
 
         # Location: "To be filled in"
-        p_location_not_filled = re.compile(r"Location:\s+\"To\s+be\s+filled\s+in\"$")
-        p_location = re.compile(r"Location:\s+(?P<location>.*)$")
+        p_location_not_filled = regex_engine.compile(r"Location:\s+\"To\s+be\s+filled\s+in\"$")
+        p_location = regex_engine.compile(r"Location:\s+(?P<location>.*)$")
 
         # 35072424 SNMP packets input
-        p_input_count = re.compile(r"^(?P<input_count>\d+)\s+SNMP\s+packets\s+input$")
+        p_input_count = regex_engine.compile(r"^(?P<input_count>\d+)\s+SNMP\s+packets\s+input$")
 
         # 0 Bad SNMP version errors
-        p_input_bad = re.compile(r"^(?P<input_bad>\d+)\s+Bad\s+SNMP\s+version\s+errors$")
+        p_input_bad = regex_engine.compile(r"^(?P<input_bad>\d+)\s+Bad\s+SNMP\s+version\s+errors$")
 
         # 2089 Unknown community name
-        p_input_unknown = re.compile(r"^(?P<input_unknown>\d+)\s+Unknown\s+community\s+name$")
+        p_input_unknown = regex_engine.compile(r"^(?P<input_unknown>\d+)\s+Unknown\s+community\s+name$")
 
         # 68 Illegal operation for community name supplied
-        p_input_illegal = re.compile(r"(?P<input_illegal>\d+)\s+Illegal\s+operation\s+for\s+community\s+name\s+supplied$")
+        p_input_illegal = regex_engine.compile(r"(?P<input_illegal>\d+)\s+Illegal\s+operation\s+for\s+community\s+name\s+supplied$")
 
         # 0 Encoding errors
-        p_input_encode = re.compile(r"^(?P<input_encode>\d+)\s+Encoding\s+errors")
+        p_input_encode = regex_engine.compile(r"^(?P<input_encode>\d+)\s+Encoding\s+errors")
 
         # 341796946 Number of requested variables
-        p_input_requested = re.compile(r"^(?P<input_requested>\d+)\s+Number\s+of\s+requested\s+variables$")
+        p_input_requested = regex_engine.compile(r"^(?P<input_requested>\d+)\s+Number\s+of\s+requested\s+variables$")
 
         # 7328 Number of altered variables
-        p_input_altered = re.compile(r"^(?P<input_altered>\d+)\s+Number\s+of\s+altered\s+variables$")
+        p_input_altered = regex_engine.compile(r"^(?P<input_altered>\d+)\s+Number\s+of\s+altered\s+variables$")
 
         # 954173 Get-request PDUs
-        p_input_get_pdu = re.compile(r"^(?P<input_get_pdu>\d+)\s+Get-request\s+PDUs$")
+        p_input_get_pdu = regex_engine.compile(r"^(?P<input_get_pdu>\d+)\s+Get-request\s+PDUs$")
 
         # 31072480 Get-next PDUs
-        p_input_next_pdu = re.compile(r"^(?P<input_next_pdu>\d+)\s+Get-next\s+PDUs$")
+        p_input_next_pdu = regex_engine.compile(r"^(?P<input_next_pdu>\d+)\s+Get-next\s+PDUs$")
 
         # 3878 Set-request PDUs
-        p_input_set_pdu = re.compile(r"^(?P<input_set_pdu>\d+)\s+Set-request\s+PDUs$")
+        p_input_set_pdu = regex_engine.compile(r"^(?P<input_set_pdu>\d+)\s+Set-request\s+PDUs$")
 
         # 0 Input queue packet drops (Maximum queue size 1000)
-        p_input_drops = re.compile(r"^(?P<input_drops>\d+)\s+Input\s+queue\s+packet\s+drops\s+\(Maximum\s+queue\s+size\s+(?P<size>\d+)\)$")
+        p_input_drops = regex_engine.compile(r"^(?P<input_drops>\d+)\s+Input\s+queue\s+packet\s+drops\s+\(Maximum\s+queue\s+size\s+(?P<size>\d+)\)$")
 
         # 35598123 SNMP packets output
-        p_output_count = re.compile(r"^(?P<output_count>\d+)\s+SNMP\s+packets\s+output$")
+        p_output_count = regex_engine.compile(r"^(?P<output_count>\d+)\s+SNMP\s+packets\s+output$")
 
         # 0 Too big errors (Maximum packet size 1500)
-        p_output_big = re.compile(r"^(?P<output_big>\d+)\s+Too\s+big\s+errors\s+\(Maximum\s+packet\s+size\s+(?P<size>\d+)\)$")
+        p_output_big = regex_engine.compile(r"^(?P<output_big>\d+)\s+Too\s+big\s+errors\s+\(Maximum\s+packet\s+size\s+(?P<size>\d+)\)$")
 
         # 1 No such name errors
-        p_output_name = re.compile(r"^(?P<output_name>\d+)\s+No\s+such\s+name\s+errors$")
+        p_output_name = regex_engine.compile(r"^(?P<output_name>\d+)\s+No\s+such\s+name\s+errors$")
 
         # 0 Bad values errors
-        p_output_bad = re.compile(r"^(?P<output_bad>\d+)\s+Bad\s+values\s+errors$")
+        p_output_bad = regex_engine.compile(r"^(?P<output_bad>\d+)\s+Bad\s+values\s+errors$")
 
         # 0 General errors
-        p_output_general = re.compile(r"^(?P<output_general>\d+)\s+General\s+errors$")
+        p_output_general = regex_engine.compile(r"^(?P<output_general>\d+)\s+General\s+errors$")
 
         # 322899 Response PDUs
-        p_output_response_pdu = re.compile(r"^(?P<output_response_pdu>\d+)\s+Response\s+PDUs$")
+        p_output_response_pdu = regex_engine.compile(r"^(?P<output_response_pdu>\d+)\s+Response\s+PDUs$")
 
         # 527788 Trap PDUs
-        p_output_trap_pdu = re.compile(r"^(?P<output_trap>\d+)\s+Trap\s+PDUs")
+        p_output_trap_pdu = regex_engine.compile(r"^(?P<output_trap>\d+)\s+Trap\s+PDUs")
 
         # Packets currently in SNMP process input queue: 0
-        p_packet_queue = re.compile(r"^Packets\s+currently\s+in\s+SNMP\s+process\s+input\s+queue:\s+(?P<queue>\d+)")
+        p_packet_queue = regex_engine.compile(r"^Packets\s+currently\s+in\s+SNMP\s+process\s+input\s+queue:\s+(?P<queue>\d+)")
 
         # SNMP global trap: enabled
-        p_global_trap = re.compile(r"^SNMP\s+global\s+trap:\s+(?P<global_status>enabled|disabled)")
+        p_global_trap = regex_engine.compile(r"^SNMP\s+global\s+trap:\s+(?P<global_status>enabled|disabled)")
 
         # SNMP logging: enabled
-        p_logging = re.compile(r"^SNMP\s+logging:\s+(?P<logging_status>enabled|disabled)$")
+        p_logging = regex_engine.compile(r"^SNMP\s+logging:\s+(?P<logging_status>enabled|disabled)$")
 
         # Logging to 10.76.1.12.151, 0/10, 102045 sent, 3065 dropped.
-        p_logging_endpoint = re.compile(r"^Logging\s+to\s+(?P<endpoint_ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\.(?P<endpoint_port>\d+),\s+(?P<endpoint_queue>\d+)\/(?P<endpoint_queue_size>\d+),\s+(?P<endpoint_sent>\d+)\s+sent,\s+(?P<endpoint_dropped>\d+)\s+dropped.$")
+        p_logging_endpoint = regex_engine.compile(r"^Logging\s+to\s+(?P<endpoint_ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\.(?P<endpoint_port>\d+),\s+(?P<endpoint_queue>\d+)\/(?P<endpoint_queue_size>\d+),\s+(?P<endpoint_sent>\d+)\s+sent,\s+(?P<endpoint_dropped>\d+)\s+dropped.$")
 
         snmp_obj = {}
 
@@ -464,25 +464,25 @@ class ShowSnmpUser(ShowSnmpUserSchema):
         # Group-name: nmcigroup
 
         # User name: SNMPv3-alfa
-        p_user = re.compile(r"^User\s+name:\s+(?P<user>\S+)$")
+        p_user = regex_engine.compile(r"^User\s+name:\s+(?P<user>\S+)$")
 
         # Engine ID: 800000090300002790FBCF00
-        p_engine = re.compile(r"^Engine\s+ID:\s+(?P<engine>\S+)$")
+        p_engine = regex_engine.compile(r"^Engine\s+ID:\s+(?P<engine>\S+)$")
 
         # storage-type: nonvolatile   active access-list: 69
-        p_storage_access = re.compile(r"^storage-type:\s(?P<storage>\S+)\s+active\s+access-list:\s+(?P<access>.*)$")
+        p_storage_access = regex_engine.compile(r"^storage-type:\s(?P<storage>\S+)\s+active\s+access-list:\s+(?P<access>.*)$")
 
         # storage-type: nonvolatile         active
-        p_storage = re.compile(r"^storage-type:\s(?P<storage>\S+)\s+active$")
+        p_storage = regex_engine.compile(r"^storage-type:\s(?P<storage>\S+)\s+active$")
 
         # Authentication Protocol: SHA
-        p_auth = re.compile(r"^Authentication\s+Protocol:\s+(?P<auth>\S+)$")
+        p_auth = regex_engine.compile(r"^Authentication\s+Protocol:\s+(?P<auth>\S+)$")
 
         # Privacy Protocol: AES256
-        p_priv = re.compile(r"^Privacy\s+Protocol:\s+(?P<priv>\S+)$")
+        p_priv = regex_engine.compile(r"^Privacy\s+Protocol:\s+(?P<priv>\S+)$")
 
         # Group-name: group1
-        p_group = re.compile(r"^Group-name:\s+(?P<group>\S+)$")
+        p_group = regex_engine.compile(r"^Group-name:\s+(?P<group>\S+)$")
 
 
         snmp_user_obj = {}
@@ -590,34 +590,34 @@ class ShowSnmpGroup(ShowSnmpGroupSchema):
         # row status: active	access-list: 90
 
         # groupname: 2c                               security model:v1
-        p_group = re.compile(r"^groupname:\s+(?P<group>\S+)\s+security model:(?P<security>.*)$")
+        p_group = regex_engine.compile(r"^groupname:\s+(?P<group>\S+)\s+security model:(?P<security>.*)$")
 
         # contextname: <no context specified>         storage-type: permanent
-        p_context_none = re.compile(r"^contextname:\s+<no context specified>\s+storage-type:\s+(?P<storage>\S+)$")
+        p_context_none = regex_engine.compile(r"^contextname:\s+<no context specified>\s+storage-type:\s+(?P<storage>\S+)$")
 
         # contextname: Alfa         storage-type: permanent
-        p_context = re.compile(r"^contextname:\s+(?P<context>\S+)\s+storage-type:\s+(?P<storage>\S+)$")
+        p_context = regex_engine.compile(r"^contextname:\s+(?P<context>\S+)\s+storage-type:\s+(?P<storage>\S+)$")
 
         # readview : <no readview specified>          writeview: <no writeview specified>   
-        p_rw_none = re.compile(r"^readview :\s+<no readview specified>\s+writeview:\s+<no writeview specified>$")
+        p_rw_none = regex_engine.compile(r"^readview :\s+<no readview specified>\s+writeview:\s+<no writeview specified>$")
 
         # readview : v1default                        writeview: <no writeview specified>
-        p_r_wnone = re.compile(r"^readview :\s+(?P<read>\S+)\s+writeview:\s+<no writeview specified>$")
+        p_r_wnone = regex_engine.compile(r"^readview :\s+(?P<read>\S+)\s+writeview:\s+<no writeview specified>$")
 
         # readview : v1default                        writeview: v1default
-        p_rw = re.compile(r"^readview :\s+(?P<read>\S+)\s+writeview:\s+(?P<write>\S+)$")
+        p_rw = regex_engine.compile(r"^readview :\s+(?P<read>\S+)\s+writeview:\s+(?P<write>\S+)$")
 
         # notifyview: <no notifyview specified>
-        p_notify_none = re.compile(r"^notifyview: <no notifyview specified>$")
+        p_notify_none = regex_engine.compile(r"^notifyview: <no notifyview specified>$")
 
         # notifyview: *tv.FFFF58bf.eaFF58bf.eaFFFFFF.F
-        p_notify = re.compile(r"^notifyview:\s+(?P<notify>\S+)$")
+        p_notify = regex_engine.compile(r"^notifyview:\s+(?P<notify>\S+)$")
 
         # row status: active	access-list: 90
-        p_row = re.compile(r"^row\s+status:\s+active$")
+        p_row = regex_engine.compile(r"^row\s+status:\s+active$")
 
         # row status: active	access-list: 90
-        p_row_ac = re.compile(r"^row\s+status:\s+active\s+access-list:\s+(?P<access>\S+)$")
+        p_row_ac = regex_engine.compile(r"^row\s+status:\s+active\s+access-list:\s+(?P<access>\S+)$")
 
 
         index = 0
@@ -742,25 +742,25 @@ class ShowSnmpUser(ShowSnmpUserSchema):
         # Group-name: nmcigroup
 
         # User name: SNMPv3-alfa
-        p_user = re.compile(r"^User\s+name:\s+(?P<user>\S+)$")
+        p_user = regex_engine.compile(r"^User\s+name:\s+(?P<user>\S+)$")
 
         # Engine ID: 800000090300002790FBCF00
-        p_engine = re.compile(r"^Engine\s+ID:\s+(?P<engine>\S+)$")
+        p_engine = regex_engine.compile(r"^Engine\s+ID:\s+(?P<engine>\S+)$")
 
         # storage-type: nonvolatile   active access-list: 69
-        p_storage_access = re.compile(r"^storage-type:\s(?P<storage>\S+)\s+active\s+access-list:\s+(?P<access>.*)$")
+        p_storage_access = regex_engine.compile(r"^storage-type:\s(?P<storage>\S+)\s+active\s+access-list:\s+(?P<access>.*)$")
 
         # storage-type: nonvolatile         active
-        p_storage = re.compile(r"^storage-type:\s(?P<storage>\S+)\s+active$")
+        p_storage = regex_engine.compile(r"^storage-type:\s(?P<storage>\S+)\s+active$")
 
         # Authentication Protocol: SHA
-        p_auth = re.compile(r"^Authentication\s+Protocol:\s+(?P<auth>\S+)$")
+        p_auth = regex_engine.compile(r"^Authentication\s+Protocol:\s+(?P<auth>\S+)$")
 
         # Privacy Protocol: AES256
-        p_priv = re.compile(r"^Privacy\s+Protocol:\s+(?P<priv>\S+)$")
+        p_priv = regex_engine.compile(r"^Privacy\s+Protocol:\s+(?P<priv>\S+)$")
 
         # Group-name: group1
-        p_group = re.compile(r"^Group-name:\s+(?P<group>\S+)$")
+        p_group = regex_engine.compile(r"^Group-name:\s+(?P<group>\S+)$")
 
 
         snmp_user_obj = {}
@@ -850,7 +850,7 @@ class ShowSnmpMibIfmibIfindex(ShowSnmpMibIfmibIfindexSchema):
 
         #GigabitEthernet3/0/28: Ifindex = 36
         #unrouted VLAN 1003: Ifindex = 7
-        p1 =  re.compile(r'^(?P<interface_index>(unrouted\sVLAN\s)?\S+) +Ifindex = +(?P<ifIndex>\d+)$')
+        p1 =  regex_engine.compile(r'^(?P<interface_index>(unrouted\sVLAN\s)?\S+) +Ifindex = +(?P<ifIndex>\d+)$')
 
         for line in out.splitlines():
             #GigabitEthernet3/0/28: Ifindex = 36
@@ -889,11 +889,11 @@ class ShowSnmpEngineid(ShowSnmpEngineidSchema):
             output = self.device.execute(self.cli_command)
         
         # Local SNMP engineID: 800000090300046C9D014D00
-        p1 = re.compile(r'^Local\s+SNMP\s+engineID:\s+(?P<local_engineid>\w+)$')
+        p1 = regex_engine.compile(r'^Local\s+SNMP\s+engineID:\s+(?P<local_engineid>\w+)$')
 
         # Remote Engine ID          IP-addr    Port
         # 800000090300046C9D014D11       3.3.32.2         4
-        p2 = re.compile(r'^(?P<remote_engineid>\w+)\s+(?P<ip_address>[\d\.]+)\s+(?P<port>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<remote_engineid>\w+)\s+(?P<ip_address>[\d\.]+)\s+(?P<port>\d+)$')
 
         ret_dict = dict()
 
@@ -943,16 +943,16 @@ class ShowSnmpCommunity(ShowSnmpCommunitySchema):
             output = self.device.execute(self.cli_command)
         
         # Community name: admin
-        p1 = re.compile(r'^Community\s+name:\s+(?P<community>\S+)$')
+        p1 = regex_engine.compile(r'^Community\s+name:\s+(?P<community>\S+)$')
 
         # Community Index: admin
-        p2 = re.compile(r'^Community\s+Index:\s+(?P<index>\S+)$')
+        p2 = regex_engine.compile(r'^Community\s+Index:\s+(?P<index>\S+)$')
 
         # Community SecurityName: admin
-        p3 = re.compile(r'^Community\s+SecurityName:\s+(?P<security_name>\w+)$')
+        p3 = regex_engine.compile(r'^Community\s+SecurityName:\s+(?P<security_name>\w+)$')
 
         # storage-type: nonvolatile        active
-        p4 = re.compile(r'^storage-type:\s+(?P<storage_type>\S+)\s+(?P<storage_status>\w+)$')
+        p4 = regex_engine.compile(r'^storage-type:\s+(?P<storage_type>\S+)\s+(?P<storage_status>\w+)$')
 
         ret_dict = dict()
 
@@ -1014,13 +1014,13 @@ class ShowSnmpMibBulkstatTransfer(ShowSnmpMibBulkstatTransferSchema):
             output = self.device.execute(self.cli_command)
         
         # Transfer Name : myTransfer1
-        p1 = re.compile(r'^Transfer\s+Name\s+:\s+(?P<tansfer_name>\S+)$')
+        p1 = regex_engine.compile(r'^Transfer\s+Name\s+:\s+(?P<tansfer_name>\S+)$')
 
         # Primary URL tftp://192.168.0.70/auto/tftp-sjpreg/logsTransfer
-        p2 = re.compile(r'^Primary\s+URL\s+(?P<primary_url>\S+)$')
+        p2 = regex_engine.compile(r'^Primary\s+URL\s+(?P<primary_url>\S+)$')
 
         # ifmib_Router_020421_100554683 : 173 : Retry (2 Retry attempt(s) Left)
-        p3 = re.compile(r'^(?P<file_name>\S+)\s+:\s+(?P<time_left>\d+)\s+:\s+(?P<state>\w+)[\s\()]*(?P<retries_left>\d+)?(Retry)?.*$')
+        p3 = regex_engine.compile(r'^(?P<file_name>\S+)\s+:\s+(?P<time_left>\d+)\s+:\s+(?P<state>\w+)[\s\()]*(?P<retries_left>\d+)?(Retry)?.*$')
 
         ret_dict = dict()
 
@@ -1112,32 +1112,32 @@ class ShowEnvironmentStack(ShowEnvironmentStackSchema):
         ret_dict = {}
 
         # SWITCH: 1
-        p1 = re.compile(r'^\s*SWITCH: (?P<switch_id>\d+)$')
+        p1 = regex_engine.compile(r'^\s*SWITCH: (?P<switch_id>\d+)$')
 
         # Switch	 FAN	 Speed	 State	 Airflow direction
         # ---------------------------------------------------
         #  1       1     14240     OK     Front to Back
         #  1  	  1	0	  NOT PRESENT or FAULTY	 Front to Back
-        p2 = re.compile(r'^\s*(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>(\w+|NOT PRESENT or FAULTY))\s+(?P<airflow_direction>[\w\ ]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>(\w+|NOT PRESENT or FAULTY))\s+(?P<airflow_direction>[\w\ ]+)$')
 
         # FAN PS-1 is NOT PRESENT
         # FAN PS-1 is OK, Airflow is Front to Back
-        p3 = re.compile(r'^\s*FAN (?P<fan_name>\S+) is (?P<fan_status>[\w\s]+)(,\s+Airflow is [\w\s]+)?$')
+        p3 = regex_engine.compile(r'^\s*FAN (?P<fan_name>\S+) is (?P<fan_status>[\w\s]+)(,\s+Airflow is [\w\s]+)?$')
 
         # Switch 1: SYSTEM TEMPERATURE is OK
-        p4 = re.compile(r'^Switch \d+: SYSTEM TEMPERATURE is (?P<sys_temp_status>[\w\s]+)$')
+        p4 = regex_engine.compile(r'^Switch \d+: SYSTEM TEMPERATURE is (?P<sys_temp_status>[\w\s]+)$')
 
         # Inlet Temperature Value: 37 Degree Celsius
-        p5 = re.compile(r'^(?P<type>\w+) Temperature Value: (?P<temp_val>\d+) Degree Celsius$')
+        p5 = regex_engine.compile(r'^(?P<type>\w+) Temperature Value: (?P<temp_val>\d+) Degree Celsius$')
 
         # Temperature State: GREEN
-        p6 = re.compile(r'^Temperature State: (?P<temp_state>\w+)$')
+        p6 = regex_engine.compile(r'^Temperature State: (?P<temp_state>\w+)$')
 
         # Yellow Threshold : 46 Degree Celsius
-        p7 = re.compile(r'^Yellow Threshold *: (?P<yellow_threshold>\d+) Degree Celsius$')
+        p7 = regex_engine.compile(r'^Yellow Threshold *: (?P<yellow_threshold>\d+) Degree Celsius$')
 
         # Red Threshold    : 56 Degree Celsius
-        p8 = re.compile(r'^Red Threshold *: (?P<red_threshold>\d+) Degree Celsius$')
+        p8 = regex_engine.compile(r'^Red Threshold *: (?P<red_threshold>\d+) Degree Celsius$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1255,13 +1255,13 @@ class ShowControllersPowerInlineModule(ShowControllersPowerInlineModuleSchema):
         ret_dict = {}
 
         # Alchemy instance 0, address 0
-        p1 = re.compile(r'^Alchemy instance (?P<alchemy_instance>\S+), address (?P<address>\S+)$')
+        p1 = regex_engine.compile(r'^Alchemy instance (?P<alchemy_instance>\S+), address (?P<address>\S+)$')
 
         # Command 0 on each port : 0    0    0    0    0    0    0    0    0    0    0    0   
-        p2 = re.compile(r'^ *(?P<cmd_id>[\w\s]+) on each port *: *(?P<val>[\w\s\-]+) *$')
+        p2 = regex_engine.compile(r'^ *(?P<cmd_id>[\w\s]+) on each port *: *(?P<val>[\w\s\-]+) *$')
 
         # Pending event flag    : N     N     N     N     N     N     N     N     N     N     N     N    
-        p3 = re.compile(r'^ *(?P<type>[\w\s]+): *(?P<val>[\w\s\-]+) *$')
+        p3 = regex_engine.compile(r'^ *(?P<type>[\w\s]+): *(?P<val>[\w\s\-]+) *$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1352,10 +1352,10 @@ class SnmpGetIfIndex(SnmpGetIfIndexSchema):
         # ifOutUcastPkts.22 = 105xxx 
         # IF-MIB::ifOutUcastPkts.22 = 105xxx
         # IF-MIB::ifOutUcastPkts.22 = 105
-        p1 = re.compile(r'^(IF-MIB::)?(?P<mib>[\w\s]+).(?P<ifindex>[\w]+) = ?(?P<name>[\w]+)?:? ?(?P<counter>[\w\s\-\/\.]+)?$')
+        p1 = regex_engine.compile(r'^(IF-MIB::)?(?P<mib>[\w\s]+).(?P<ifindex>[\w]+) = ?(?P<name>[\w]+)?:? ?(?P<counter>[\w\s\-\/\.]+)?$')
 
         # SNMP Response: reqid 10, errstat 0, erridx 0
-        p2 = re.compile(r'^SNMP Response: reqid (?P<reqid>\d+), errstat (?P<errstat>\d+), erridx (?P<erridx>\d+)$')
+        p2 = regex_engine.compile(r'^SNMP Response: reqid (?P<reqid>\d+), errstat (?P<errstat>\d+), erridx (?P<erridx>\d+)$')
 
         ret_dict = {}
         for line in output.splitlines():
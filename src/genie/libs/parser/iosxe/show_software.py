@@ -1,11 +1,13 @@
 
 # Metaparser
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Optional, ListOf
 
 # pyATS
 from pyats.utils.exceptions import SchemaTypeError
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 class ShowSoftwareAuthenticityRunningSchema(MetaParser):
     """Schema for show software authenticity"""
@@ -88,19 +90,19 @@ class ShowSoftwareAuthenticityRunning(ShowSoftwareAuthenticityRunningSchema):
         current_dict = None
         
         #PACKAGE cat9k-rpbase.BLD_POLARIS_DEV_LATEST_20240415_003241.SSA.pkg
-        p1 = re.compile(r'^PACKAGE (?P<package_name>.+)$')
+        p1 = regex_engine.compile(r'^PACKAGE (?P<package_name>.+)$')
         
         #SYSTEM IMAGE
-        p2 = re.compile(r'^SYSTEM IMAGE(?P<system_image>.+)$')
+        p2 = regex_engine.compile(r'^SYSTEM IMAGE(?P<system_image>.+)$')
         
         #ROMMON
-        p3 = re.compile(r'^ROMMON(?P<rommon>.+)$')
+        p3 = regex_engine.compile(r'^ROMMON(?P<rommon>.+)$')
         
         # Microloader
-        p4 = re.compile(r'^Microloader(?P<microloader>.+)$')
+        p4 = regex_engine.compile(r'^Microloader(?P<microloader>.+)$')
         
         #General- Common Name           : CiscoSystems
-        p5 = re.compile(r'^(?P<key>[\w\s]+): (?P<value>.+)$')
+        p5 = regex_engine.compile(r'^(?P<key>[\w\s]+): (?P<value>.+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -11,7 +11,6 @@
      *  show spanning-tree summary totals
 
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -23,6 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -84,25 +84,25 @@ class ShowSpanningTreeSummary(ShowSpanningTreeSummarySchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Switch +is +in +(?P<mode>[\w\-]+) +mode( *\(IEEE +Standard\))?$')
-        p2 = re.compile(r'^Root +bridge +for: +(?P<root_bridge_for>[\w\-\,\s]+).?$')
+        p1 = regex_engine.compile(r'^Switch +is +in +(?P<mode>[\w\-]+) +mode( *\(IEEE +Standard\))?$')
+        p2 = regex_engine.compile(r'^Root +bridge +for: +(?P<root_bridge_for>[\w\-\,\s]+).?$')
         #p3 = re.compile(r'^(?P<name>\w+(?: \S+){,5}?) +is '
         #                 '+(?P<value>disabled|enabled)(?: +but +inactive +in (?P<simulation_value>\S+) +mode)?$')
-        p3 = re.compile(r'^(?P<name>\w+(?: \S+){,5}?) +is +(?P<value>disable|disabled|enabled)'
-                        r'(?: +but (?P<simulation_value>active|inactive) +in +rapid-pvst +mode)?$')
+        p3 = regex_engine.compile(r'^(?P<name>\w+(?: \S+){,5}?) +is +(?P<value>disable|disabled|enabled)'
+                                  r'(?: +but (?P<simulation_value>active|inactive) +in +rapid-pvst +mode)?$')
 
-        p4 = re.compile(r'^(?P<id>(?!Total)\w+) +(?P<blocking>\d+) +(?P<listening>\d+)'
-                        r' +(?P<learning>\d+) +(?P<forwarding>\d+) +(?P<stp_active>\d+)$')
-        p5 = re.compile(r'^(?P<num>\d+) +(msts?|vlans?) +(?P<blockings>\d+) +(?P<listenings>\d+)'
-                        r' +(?P<learnings>\d+) +(?P<forwardings>\d+) +(?P<stp_actives>\d+)$')
+        p4 = regex_engine.compile(r'^(?P<id>(?!Total)\w+) +(?P<blocking>\d+) +(?P<listening>\d+)'
+                                  r' +(?P<learning>\d+) +(?P<forwarding>\d+) +(?P<stp_active>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<num>\d+) +(msts?|vlans?) +(?P<blockings>\d+) +(?P<listenings>\d+)'
+                                  r' +(?P<learnings>\d+) +(?P<forwardings>\d+) +(?P<stp_actives>\d+)$')
 
-        p6 = re.compile(r'^(?:Configured +)?Pathcost +method +used +is '
-                        r'+(?P<method>\w+)(?: +\(Operational +value +is +(?P<operational_value>\w+)\))?$')
+        p6 = regex_engine.compile(r'^(?:Configured +)?Pathcost +method +used +is '
+                                  r'+(?P<method>\w+)(?: +\(Operational +value +is +(?P<operational_value>\w+)\))?$')
 
-        p7 = re.compile(r'Total +(?P<blockings>\d+) +(?P<listenings>\d+)'
-                        r' +(?P<learnings>\d+) +(?P<forwardings>\d+) +(?P<stp_actives>\d+)$')
+        p7 = regex_engine.compile(r'Total +(?P<blockings>\d+) +(?P<listenings>\d+)'
+                                  r' +(?P<learnings>\d+) +(?P<forwardings>\d+) +(?P<stp_actives>\d+)$')
 
-        p8 = re.compile(r'^(?P<root_bridge_for>(?:(?:[\w-]+, +)+)?[\w-]+)$')
+        p8 = regex_engine.compile(r'^(?P<root_bridge_for>(?:(?:[\w-]+, +)+)?[\w-]+)$')
 
         key_map = {'EtherChannel misconfig guard': 'etherchannel_misconfig_guard',
                    'Extended system ID': 'extended_system_id',
@@ -315,92 +315,92 @@ class ShowSpanningTreeDetail(ShowSpanningTreeDetailSchema):
 
         # initial regexp pattern
         # MST0 is executing the mstp compatible Spanning Tree protocol
-        p1 = re.compile(r'^(MST|VLAN)?(?P<inst>\w+) +is +executing +the +(?P<mode>[\w\-]+) +'
-                        r'compatible +Spanning +Tree +protocol$')
+        p1 = regex_engine.compile(r'^(MST|VLAN)?(?P<inst>\w+) +is +executing +the +(?P<mode>[\w\-]+) +'
+                                  r'compatible +Spanning +Tree +protocol$')
 
         # Bridge Identifier has priority 8192, sysid 0, address 5897.bdff.3b3a 
-        p2 = re.compile(r'^Bridge +Identifier +has +priority +(?P<bridge_priority>\d+), +'
-                        r'sysid +(?P<bridge_sysid>\d+), +'
-                        r'address +(?P<bridge_address>[\w\.]+)$')
+        p2 = regex_engine.compile(r'^Bridge +Identifier +has +priority +(?P<bridge_priority>\d+), +'
+                                  r'sysid +(?P<bridge_sysid>\d+), +'
+                                  r'address +(?P<bridge_address>[\w\.]+)$')
 
         # Configured hello time 2, max age 20, forward delay 15, transmit hold-count 6 
-        p3 = re.compile(r'^Configured +hello +time +(?P<hello_time>\d+), +'
-                        r'max +age +(?P<max_age>\d+), +forward +delay +(?P<forwarding_delay>\d+)(, +'
-                        r'(transmit|tranmsit) +hold\-count +(?P<hold_count>\d+))?$')
+        p3 = regex_engine.compile(r'^Configured +hello +time +(?P<hello_time>\d+), +'
+                                  r'max +age +(?P<max_age>\d+), +forward +delay +(?P<forwarding_delay>\d+)(, +'
+                                  r'(transmit|tranmsit) +hold\-count +(?P<hold_count>\d+))?$')
 
         # We are the root of the spanning tree 
-        p4 = re.compile(r'^We +are +the +root +of +the +spanning +tree$')
+        p4 = regex_engine.compile(r'^We +are +the +root +of +the +spanning +tree$')
 
         # Topology change flag not set, detected flag not set 
-        p5 = re.compile(r'^Topology +change +flag +(?P<topology_change_flag>[\w\s]+), +'
-                        r'detected +flag +(?P<topology_detected_flag>[\w\s]+)$')
+        p5 = regex_engine.compile(r'^Topology +change +flag +(?P<topology_change_flag>[\w\s]+), +'
+                                  r'detected +flag +(?P<topology_detected_flag>[\w\s]+)$')
 
         # Number of topology changes 471 last change occurred 16:02:38 ago 
-        p6 = re.compile(r'^Number +of +topology +changes +(?P<topology_changes>\d+) +'
-                        r'last +change +occurred +(?P<time_since_topology_change>[\w\.\:]+)( +ago)?$')
+        p6 = regex_engine.compile(r'^Number +of +topology +changes +(?P<topology_changes>\d+) +'
+                                  r'last +change +occurred +(?P<time_since_topology_change>[\w\.\:]+)( +ago)?$')
 
         # from TenGigabitEthernet2/3 
-        p7 = re.compile(r'^from +(?P<topology_from_port>[\w\.\/\-]+)$')
+        p7 = regex_engine.compile(r'^from +(?P<topology_from_port>[\w\.\/\-]+)$')
 
         # Times:  hold 1, topology change 35, notification 2
-        p8 = re.compile(r'^Times: +hold +(?P<hold_time>\d+), +'
-                        r'topology +change +(?P<topology_change_times>\d+), +'
-                        r'notification +(?P<notification_times>\d+)$')
+        p8 = regex_engine.compile(r'^Times: +hold +(?P<hold_time>\d+), +'
+                                  r'topology +change +(?P<topology_change_times>\d+), +'
+                                  r'notification +(?P<notification_times>\d+)$')
 
         # hello 2, max age 20, forward delay 15 
-        p9 = re.compile(r'^hello +(?P<hello_time>\d+), '
-                        r'max +age +(?P<max_age>\d+), '
-                        r'+forward +delay +(?P<forwarding_delay>\d+)$')
+        p9 = regex_engine.compile(r'^hello +(?P<hello_time>\d+), '
+                                  r'max +age +(?P<max_age>\d+), '
+                                  r'+forward +delay +(?P<forwarding_delay>\d+)$')
 
         # Timers: hello 0, topology change 0, notification 0
-        p10 = re.compile(r'^Timers: +hello +(?P<hello_timer>\d+), +'
-                         r'topology +change +(?P<topology_change_timer>\d+), +'
-                         r'notification +(?P<notification_timer>\d+)'
-                         r'(, +aging +(?P<aging_timer>\d+))?$')
+        p10 = regex_engine.compile(r'^Timers: +hello +(?P<hello_timer>\d+), +'
+                                   r'topology +change +(?P<topology_change_timer>\d+), +'
+                                   r'notification +(?P<notification_timer>\d+)'
+                                   r'(, +aging +(?P<aging_timer>\d+))?$')
 
         # Port 2 (GigabitEthernet1/2) of MST0 is designated forwarding
-        p11 = re.compile(r'^Port +(?P<port_num>\d+) *\((?P<name>[\w\/\-\.]+)\) +'
-                         r'of +(?P<inst>\w+) +is +(?P<status>.*)$')
+        p11 = regex_engine.compile(r'^Port +(?P<port_num>\d+) *\((?P<name>[\w\/\-\.]+)\) +'
+                                   r'of +(?P<inst>\w+) +is +(?P<status>.*)$')
 
         # Port path cost 20000, Port priority 128, Port Identifier 128.2. 
-        p12 = re.compile(r'^Port +path +cost +(?P<cost>\d+), +'
-                         r'Port +priority +(?P<port_priority>\d+), +'
-                         r'Port +Identifier +(?P<port_identifier>[\w\.]+)$')
+        p12 = regex_engine.compile(r'^Port +path +cost +(?P<cost>\d+), +'
+                                   r'Port +priority +(?P<port_priority>\d+), +'
+                                   r'Port +Identifier +(?P<port_identifier>[\w\.]+)$')
 
         # Designated root has priority 8192, address 5897.bdff.3b3a 
-        p13 = re.compile(r'^Designated +root +has +priority +(?P<designated_root_priority>\d+), +'
-                         r'address +(?P<designated_root_address>[\w\.]+)$')
+        p13 = regex_engine.compile(r'^Designated +root +has +priority +(?P<designated_root_priority>\d+), +'
+                                   r'address +(?P<designated_root_address>[\w\.]+)$')
 
         # Designated bridge has priority 8192, address 5897.bdff.3b3a 
-        p14 = re.compile(r'^Designated +bridge +has +priority +(?P<designated_bridge_priority>\d+), +'
-                         r'address +(?P<designated_bridge_address>[\w\.]+)$')
+        p14 = regex_engine.compile(r'^Designated +bridge +has +priority +(?P<designated_bridge_priority>\d+), +'
+                                   r'address +(?P<designated_bridge_address>[\w\.]+)$')
 
         # Designated port id is 128.2, designated path cost 0 
-        p15 = re.compile(r'^Designated +port +id +is +(?P<designated_port_id>[\w\.]+), +'
-                         r'designated +path +cost +(?P<designated_path_cost>\d+)'
-                         r'( +[\w\s\,]+)?$')
+        p15 = regex_engine.compile(r'^Designated +port +id +is +(?P<designated_port_id>[\w\.]+), +'
+                                   r'designated +path +cost +(?P<designated_path_cost>\d+)'
+                                   r'( +[\w\s\,]+)?$')
 
         # Timers: message age 0, forward delay 0, hold 0 
-        p16 = re.compile(r'^Timers: +message +age +(?P<message_age>\d+), +'
-                         r'forward +delay +(?P<forward_delay>\d+), +hold +(?P<hold>\d+)$')
+        p16 = regex_engine.compile(r'^Timers: +message +age +(?P<message_age>\d+), +'
+                                   r'forward +delay +(?P<forward_delay>\d+), +hold +(?P<hold>\d+)$')
 
         # Number of transitions to forwarding state: 0 
-        p17 = re.compile(r'^Number +of +transitions +to +forwarding +'
-                         r'state: +(?P<number_of_forward_transitions>\d+)$')
+        p17 = regex_engine.compile(r'^Number +of +transitions +to +forwarding +'
+                                   r'state: +(?P<number_of_forward_transitions>\d+)$')
 
         # Link type is point-to-point by default, Internal
         # Link type is point-to-point by default, Internal Pre-STD
         # Link type is point-to-point by default, Boundary PVST
-        p18 = re.compile(r'^Link +type +is +(?P<link_type>[\w\-]+) +by +default'
-                         r'(, *(Boundary +(?P<boundary>\w+)|Peer +is +(?P<peer>\w+)))?'
-                         r'(?:, +(?P<internal>Internal( +\S+)?))?$')
+        p18 = regex_engine.compile(r'^Link +type +is +(?P<link_type>[\w\-]+) +by +default'
+                                   r'(, *(Boundary +(?P<boundary>\w+)|Peer +is +(?P<peer>\w+)))?'
+                                   r'(?:, +(?P<internal>Internal( +\S+)?))?$')
 
         # Loop guard is enabled by default on the port
-        p19 = re.compile(r'^Loop +guard +is +(?P<loop_guard>\w+) +by +default +on +the +port$')
+        p19 = regex_engine.compile(r'^Loop +guard +is +(?P<loop_guard>\w+) +by +default +on +the +port$')
 
         # BPDU: sent 2349185, received 0
-        p20 = re.compile(r'^BPDU: +sent +(?P<bpdu_sent>\d+), +'
-                         r'received +(?P<bpdu_received>\d+)$')
+        p20 = regex_engine.compile(r'^BPDU: +sent +(?P<bpdu_sent>\d+), +'
+                                   r'received +(?P<bpdu_received>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -645,61 +645,61 @@ class ShowSpanningTreeMstDetail(ShowSpanningTreeMstDetailSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^\#+ +MST(?P<inst>\d+) +'
-                        r'vlans +mapped: +(?P<vlan>[\d\-\,\s]+)$')
+        p1 = regex_engine.compile(r'^\#+ +MST(?P<inst>\d+) +'
+                                  r'vlans +mapped: +(?P<vlan>[\d\-\,\s]+)$')
 
-        p2 = re.compile(r'^Bridge +address +(?P<bridge_address>[\w\.]+) +'
-                        r'priority +(?P<bridge_priority>\d+) +'
-                        r'\((\d+) +sysid +(?P<sysid>\d+)\)$')
+        p2 = regex_engine.compile(r'^Bridge +address +(?P<bridge_address>[\w\.]+) +'
+                                  r'priority +(?P<bridge_priority>\d+) +'
+                                  r'\((\d+) +sysid +(?P<sysid>\d+)\)$')
         
-        p3 = re.compile(r'^Root +this +switch +for +(the +)?(?P<root>[\w\.\s]+)$')
+        p3 = regex_engine.compile(r'^Root +this +switch +for +(the +)?(?P<root>[\w\.\s]+)$')
 
         # Root          address 58ac.78ff.c3f5  priority      8198  (8192 sysid 6)
-        p3_1 = re.compile(r'^Root +address +(?P<root_address>[\w\.]+) +'
-                          r'priority +(?P<root_priority>\d+) +'
-                          r'\((\d+) +sysid +(?P<sysid>\d+)\)$')
+        p3_1 = regex_engine.compile(r'^Root +address +(?P<root_address>[\w\.]+) +'
+                                    r'priority +(?P<root_priority>\d+) +'
+                                    r'\((\d+) +sysid +(?P<sysid>\d+)\)$')
         
-        p4 = re.compile(r'^Operational +hello +time +(?P<hello_time>\d+), +'
-                        r'forward +delay +(?P<forward_delay>\d+), +'
-                        r'max +age +(?P<max_age>\d+), +'
-                        r'txholdcount +(?P<tx_hold_count>\d+)$')
+        p4 = regex_engine.compile(r'^Operational +hello +time +(?P<hello_time>\d+), +'
+                                  r'forward +delay +(?P<forward_delay>\d+), +'
+                                  r'max +age +(?P<max_age>\d+), +'
+                                  r'txholdcount +(?P<tx_hold_count>\d+)$')
         
-        p5 = re.compile(r'^Configured +hello +time +(?P<hello_time>\d+), +'
-                        r'forward +delay +(?P<forward_delay>\d+), +'
-                        r'max +age +(?P<max_age>\d+), +'
-                        r'max +hops +(?P<max_hops>\d+)$')
+        p5 = regex_engine.compile(r'^Configured +hello +time +(?P<hello_time>\d+), +'
+                                  r'forward +delay +(?P<forward_delay>\d+), +'
+                                  r'max +age +(?P<max_age>\d+), +'
+                                  r'max +hops +(?P<max_hops>\d+)$')
         
-        p6 = re.compile(r'^(?P<name>[\w\-\.\/]+) +of +'
-                        r'MST(\d+) +is +(?P<status>[\w\s]+)'
-                        r'( +\((?P<broken_reason>.*)\))?$')
+        p6 = regex_engine.compile(r'^(?P<name>[\w\-\.\/]+) +of +'
+                                  r'MST(\d+) +is +(?P<status>[\w\s]+)'
+                                  r'( +\((?P<broken_reason>.*)\))?$')
         
-        p7 = re.compile(r'^Port +info +port +id +'
-                        r'(?P<port_id>[\d\.]+) +'
-                        r'priority +(?P<port_priority>\d+) +'
-                        r'cost +(?P<cost>\d+)$')
+        p7 = regex_engine.compile(r'^Port +info +port +id +'
+                                  r'(?P<port_id>[\d\.]+) +'
+                                  r'priority +(?P<port_priority>\d+) +'
+                                  r'cost +(?P<cost>\d+)$')
         
-        p8 = re.compile(r'^Designated +root +address +'
-                        r'(?P<designated_root_address>[\w\.]+) +'
-                        r'priority +(?P<designated_root_priority>\d+) +'
-                        r'cost +(?P<designated_root_cost>\d+)$')
+        p8 = regex_engine.compile(r'^Designated +root +address +'
+                                  r'(?P<designated_root_address>[\w\.]+) +'
+                                  r'priority +(?P<designated_root_priority>\d+) +'
+                                  r'cost +(?P<designated_root_cost>\d+)$')
         
-        p9 = re.compile(r'^Design\. +regional +root +address +'
-                        r'(?P<designated_regional_root_address>[\w\.]+) +'
-                        r'priority +(?P<designated_regional_root_priority>\d+) +'
-                        r'cost +(?P<designated_regional_root_cost>\d+)$')
+        p9 = regex_engine.compile(r'^Design\. +regional +root +address +'
+                                  r'(?P<designated_regional_root_address>[\w\.]+) +'
+                                  r'priority +(?P<designated_regional_root_priority>\d+) +'
+                                  r'cost +(?P<designated_regional_root_cost>\d+)$')
         
-        p10 = re.compile(r'^Designated +bridge +address +'
-                         r'(?P<designated_bridge_address>[\w\.]+) +'
-                         r'priority +(?P<designated_bridge_priority>\d+) +'
-                         r'port +id +(?P<designated_bridge_port_id>[\d\.]+)$')
+        p10 = regex_engine.compile(r'^Designated +bridge +address +'
+                                   r'(?P<designated_bridge_address>[\w\.]+) +'
+                                   r'priority +(?P<designated_bridge_priority>\d+) +'
+                                   r'port +id +(?P<designated_bridge_port_id>[\d\.]+)$')
         
-        p11 = re.compile(r'^Timers: +message +expires +in +(?P<message_expires>\d+) +sec, +'
-                         r'forward +delay +(?P<forward_delay>\d+), '
-                         r'forward +transitions +(?P<forward_transitions>\d+)$')
+        p11 = regex_engine.compile(r'^Timers: +message +expires +in +(?P<message_expires>\d+) +sec, +'
+                                   r'forward +delay +(?P<forward_delay>\d+), '
+                                   r'forward +transitions +(?P<forward_transitions>\d+)$')
         
-        p12 = re.compile(r'^Bpdus +(\(\w+\) *)?'
-                         r'sent +(?P<bpdu_sent>\d+), +'
-                         r'received +(?P<bpdu_received>\d+)')
+        p12 = regex_engine.compile(r'^Bpdus +(\(\w+\) *)?'
+                                   r'sent +(?P<bpdu_sent>\d+), +'
+                                   r'received +(?P<bpdu_received>\d+)')
 
 
         for line in out.splitlines():
@@ -845,12 +845,12 @@ class ShowErrdisableRecovery(ShowErrdisableRecoverySchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Timer +interval: +(?P<interval>\d+) +seconds$')
-        p2 = re.compile(r'^(?P<name>[\w\-\s\(\)\"\:"]+) +'
-                         r'(?P<status>(Disabled|Enabled)+)$')
-        p3 = re.compile(r'^(?P<interface>[\w\-\/\.]+) +'
-                         r'(?P<errdisable_reason>\w+) +'
-                         r'(?P<time_left>\d+)$')
+        p1 = regex_engine.compile(r'^Timer +interval: +(?P<interval>\d+) +seconds$')
+        p2 = regex_engine.compile(r'^(?P<name>[\w\-\s\(\)\"\:"]+) +'
+                                   r'(?P<status>(Disabled|Enabled)+)$')
+        p3 = regex_engine.compile(r'^(?P<interface>[\w\-\/\.]+) +'
+                                   r'(?P<errdisable_reason>\w+) +'
+                                   r'(?P<time_left>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -964,38 +964,38 @@ class ShowSpanningTree(ShowSpanningTreeSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^(MST|VLAN)(?P<inst>\d+)$')
+        p1 = regex_engine.compile(r'^(MST|VLAN)(?P<inst>\d+)$')
 
         # #####MST1    vlans mapped:   2-25
-        p1_1 = re.compile(r'^\S* MST(?P<inst>\d+)\s+vlans\s+mapped:\s+(?P<vlans_mapped>\d+-\d+)$')
+        p1_1 = regex_engine.compile(r'^\S* MST(?P<inst>\d+)\s+vlans\s+mapped:\s+(?P<vlans_mapped>\d+-\d+)$')
 
         # Bridge        address cc7f.763d.9a00  priority      32769 (32768 sysid 1)
-        p1_2 = re.compile(r'^Bridge\s+address\s+(?P<address>[\w\.]+)\s+priority\s+(?P<priority>\d+)(?:\s+\((?P<configured_bridge_priority>\d+)\s+sysid\s+(?P<sys_id_ext>\d+)\))?$')
+        p1_2 = regex_engine.compile(r'^Bridge\s+address\s+(?P<address>[\w\.]+)\s+priority\s+(?P<priority>\d+)(?:\s+\((?P<configured_bridge_priority>\d+)\s+sysid\s+(?P<sys_id_ext>\d+)\))?$')
 
         # Root          address 40b5.c11e.e000  priority      4097  (4096 sysid 1)
-        p1_3 = re.compile(r'^Root\s+address\s+(?P<address>[\w\.]+)\s+priority\s+(?P<priority>\d+)(?:\s+\((?P<configured_root_priority>\d+)\s+sysid\s+(?P<sys_id_ext>\d+)\))?$')
+        p1_3 = regex_engine.compile(r'^Root\s+address\s+(?P<address>[\w\.]+)\s+priority\s+(?P<priority>\d+)(?:\s+\((?P<configured_root_priority>\d+)\s+sysid\s+(?P<sys_id_ext>\d+)\))?$')
 
         # port    Tw1/0/23        cost          20000     rem hops 19
-        p1_4 = re.compile(r'^\s*port\s+(?P<interface>\S+)\s+cost\s+(?P<cost>\d+)\s+rem\s+hops\s+(?P<rem_hops>\d+)$')
-
-        p2 = re.compile(r'^Spanning +tree +enabled p+rotocol +(?P<mode>\w+)$')
-        p3 = re.compile(r'^Root +ID +Priority +(?P<priority>\d+)$')
-        p4 = re.compile(r'^Bridge +ID +Priority +(?P<priority>\d+)'
-                         r'( *\(priority +(?P<configured_bridge_priority>\d+) +'
-                         r'sys\-id\-ext +(?P<sys_id_ext>\d+)\))?$')
-        p5 = re.compile(r'^Address +(?P<address>[\w\.]+)$')
-        p6 = re.compile(r'^Cost +(?P<cost>\d+)$')
-        p7 = re.compile(r'^Port +(?P<port>\d+) +\((?P<interface>[\w\-\/\.]+)\)$')
-        p8 = re.compile(r'Hello +Time +(?P<hello_time>\d+) +sec +'
-                         r'Max +Age +(?P<max_age>\d+) +sec +'
-                         r'Forward +Delay +(?P<forward_delay>\d+) +sec$')
-        p9 = re.compile(r'^Aging +Time +(?P<aging_time>\d+) +sec$')
-        p10 = re.compile(r'^(?P<interface>[\w\-\/\.]+) +'
-                          r'(?P<role>[\w\*]+) +(?P<port_state>[A-Z\*]+) *'
-                          r'(?P<cost>\d+) +(?P<port_priority>\d+)\.'
-                          r'(?P<port_num>\d+) +(?P<type>[\w\s]+)'
-                          r'( +(Bound\((?P<bound>\w+)\)|Peer\((?P<peer>\w+)\)))?'
-                          r'( +\*\S+)?$')
+        p1_4 = regex_engine.compile(r'^\s*port\s+(?P<interface>\S+)\s+cost\s+(?P<cost>\d+)\s+rem\s+hops\s+(?P<rem_hops>\d+)$')
+
+        p2 = regex_engine.compile(r'^Spanning +tree +enabled p+rotocol +(?P<mode>\w+)$')
+        p3 = regex_engine.compile(r'^Root +ID +Priority +(?P<priority>\d+)$')
+        p4 = regex_engine.compile(r'^Bridge +ID +Priority +(?P<priority>\d+)'
+                                   r'( *\(priority +(?P<configured_bridge_priority>\d+) +'
+                                   r'sys\-id\-ext +(?P<sys_id_ext>\d+)\))?$')
+        p5 = regex_engine.compile(r'^Address +(?P<address>[\w\.]+)$')
+        p6 = regex_engine.compile(r'^Cost +(?P<cost>\d+)$')
+        p7 = regex_engine.compile(r'^Port +(?P<port>\d+) +\((?P<interface>[\w\-\/\.]+)\)$')
+        p8 = regex_engine.compile(r'Hello +Time +(?P<hello_time>\d+) +sec +'
+                                   r'Max +Age +(?P<max_age>\d+) +sec +'
+                                   r'Forward +Delay +(?P<forward_delay>\d+) +sec$')
+        p9 = regex_engine.compile(r'^Aging +Time +(?P<aging_time>\d+) +sec$')
+        p10 = regex_engine.compile(r'^(?P<interface>[\w\-\/\.]+) +'
+                                    r'(?P<role>[\w\*]+) +(?P<port_state>[A-Z\*]+) *'
+                                    r'(?P<cost>\d+) +(?P<port_priority>\d+)\.'
+                                    r'(?P<port_num>\d+) +(?P<type>[\w\s]+)'
+                                    r'( +(Bound\((?P<bound>\w+)\)|Peer\((?P<peer>\w+)\)))?'
+                                    r'( +\*\S+)?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1145,10 +1145,10 @@ class ShowSpanningTreeMstConfiguration(ShowSpanningTreeMstConfigurationSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^Name +\[(?P<name>.*)\]$')
-        p2 = re.compile(r'^Revision +(?P<revision>\d+) +'
-                         r'Instances +configured +(?P<instances_configured>\d+)$')
-        p3 = re.compile(r'^(?P<inst>\d+) +(?P<vlan_mapped>[\d\,\s\-]+)$')
+        p1 = regex_engine.compile(r'^Name +\[(?P<name>.*)\]$')
+        p2 = regex_engine.compile(r'^Revision +(?P<revision>\d+) +'
+                                   r'Instances +configured +(?P<instances_configured>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<inst>\d+) +(?P<vlan_mapped>[\d\,\s\-]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1225,50 +1225,50 @@ class ShowSpanningTreeInterfaceDetail(ShowSpanningTreeInterfaceDetailSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         # Port 13 (TwoGigabitEthernet1/0/13) of VLAN0001 is designated forwarding
-        p1 = re.compile(r"^Port\s+(?P<port>\d+)\s+\((?P<interface>\S+)\)\s+of\s+("
-                        r"?P<vlan>\S+)\s+is\s+(?P<port_span_mode>.+)$")
+        p1 = regex_engine.compile(r"^Port\s+(?P<port>\d+)\s+\((?P<interface>\S+)\)\s+of\s+("
+                                  r"?P<vlan>\S+)\s+is\s+(?P<port_span_mode>.+)$")
 
         #    Port path cost 20000, Port priority 128, Port Identifier 128.13.
-        p2 = re.compile(r"^Port\s+path\s+cost\s+(?P<path_cost>\d+),\s+Port\s+priority\s+(?P<port_priority>\d+),"
-                        r"\s+Port\s+Identifier\s+(?P<port_id>[\d\.]+)$")
+        p2 = regex_engine.compile(r"^Port\s+path\s+cost\s+(?P<path_cost>\d+),\s+Port\s+priority\s+(?P<port_priority>\d+),"
+                                  r"\s+Port\s+Identifier\s+(?P<port_id>[\d\.]+)$")
 
         #    Designated root has priority 32769, address 14a2.a035.b700
-        p3 = re.compile(r"^Designated\s+root\s+has\s+priority\s+(?P<dr_priority>\d+),\s+address\s+(?P<dr_address>[\w\.]+)$")
+        p3 = regex_engine.compile(r"^Designated\s+root\s+has\s+priority\s+(?P<dr_priority>\d+),\s+address\s+(?P<dr_address>[\w\.]+)$")
 
         #    Designated bridge has priority 32769, address cc7f.763d.9a00
-        p4 = re.compile(r"^Designated\s+bridge\s+has\s+priority\s+(?P<dbridge_priority>\d+),"
-                        r"\s+address\s+(?P<dbridge_address>[\w\.]+)$")
+        p4 = regex_engine.compile(r"^Designated\s+bridge\s+has\s+priority\s+(?P<dbridge_priority>\d+),"
+                                  r"\s+address\s+(?P<dbridge_address>[\w\.]+)$")
 
         #    Designated port id is 128.13, designated path cost 40000
-        p5 = re.compile(r"^Designated\s+port\s+id\s+is\s+(?P<dport_id>\S+),\s+designated\s+path\s+cost\s+(?P<des_path_cost>\d+)$")
+        p5 = regex_engine.compile(r"^Designated\s+port\s+id\s+is\s+(?P<dport_id>\S+),\s+designated\s+path\s+cost\s+(?P<des_path_cost>\d+)$")
 
         #    Timers: message age 0, forward delay 0, hold 0
-        p6 = re.compile(r"^Timers:\s+message\s+age\s+(?P<message_age>\d+),\s+forward\s+delay\s+("
-                        r"?P<forward_delay>\d+),\s+hold\s+(?P<hold>\d+)$")
+        p6 = regex_engine.compile(r"^Timers:\s+message\s+age\s+(?P<message_age>\d+),\s+forward\s+delay\s+("
+                                  r"?P<forward_delay>\d+),\s+hold\s+(?P<hold>\d+)$")
 
         # Number of transitions to forwarding state: 1
-        p7 = re.compile(r'^Number\s+of\s+transitions\s+to\s+forwarding\s+state:\s+(?P<forward_trans>\d+)$')
+        p7 = regex_engine.compile(r'^Number\s+of\s+transitions\s+to\s+forwarding\s+state:\s+(?P<forward_trans>\d+)$')
 
         #    The port is in the portfast mode
-        p8 = re.compile(r"^The\s+port\s+is\s+in\s+the\s+(?P<port_mode>\w+)\s+mode$")
+        p8 = regex_engine.compile(r"^The\s+port\s+is\s+in\s+the\s+(?P<port_mode>\w+)\s+mode$")
 
         # Link type is point-to-point by default
-        p9 = re.compile(r'^Link\s+type\s+is\s+(?P<link_type>\S+)\s+.+$')
+        p9 = regex_engine.compile(r'^Link\s+type\s+is\s+(?P<link_type>\S+)\s+.+$')
 
         #    Bpdu guard is enabled
-        p10 = re.compile(r"^Bpdu\s+guard\s+is\s+(?P<bpdu_guard>\w+)$")
+        p10 = regex_engine.compile(r"^Bpdu\s+guard\s+is\s+(?P<bpdu_guard>\w+)$")
 
         #    Bpdu filter is enabled
-        p11 = re.compile(r"^Bpdu\s+filter\s+is\s+(?P<bpdu_filter>\w+)$")
+        p11 = regex_engine.compile(r"^Bpdu\s+filter\s+is\s+(?P<bpdu_filter>\w+)$")
 
         #    Root guard is enabled on the port
-        p12 = re.compile(r"^Root\s+guard\s+is\s+(?P<root_guard>\w+)\s+on\s+the\s+port$")
+        p12 = regex_engine.compile(r"^Root\s+guard\s+is\s+(?P<root_guard>\w+)\s+on\s+the\s+port$")
 
         #    Loop guard is enabled on the port
-        p13 = re.compile(r"^Loop\s+guard\s+is\s+(?P<loop_guard>\w+)\s+on\s+the\s+port$")
+        p13 = regex_engine.compile(r"^Loop\s+guard\s+is\s+(?P<loop_guard>\w+)\s+on\s+the\s+port$")
 
         #    BPDU: sent 22783, received 0
-        p14 = re.compile(r"^BPDU:\s+sent\s+(?P<sent>\d+),\s+received\s+(?P<received>\d+)$")
+        p14 = regex_engine.compile(r"^BPDU:\s+sent\s+(?P<sent>\d+),\s+received\s+(?P<received>\d+)$")
 
         ret_dict = {}
 
@@ -1416,8 +1416,8 @@ class ShowSpanningTreeInterface(ShowSpanningTreeInterfaceSchema):
 
         # VLAN0100            Desg FWD 20000     128.13   P2p Edge
         #                                                 P2p Peer (STP)
-        p1 = re.compile(r"^(?P<vlan>\S+)\s+(?P<role>\S+)\s+(?P<status>\S+)\s+(?P<cost>\d+)\s+(?P<port_priority>\d+)\.("
-                r"?P<port_number>\d+)\s+(?P<type>[\w\s\(\)]*)$") 
+        p1 = regex_engine.compile(r"^(?P<vlan>\S+)\s+(?P<role>\S+)\s+(?P<status>\S+)\s+(?P<cost>\d+)\s+(?P<port_priority>\d+)\.("
+                          r"?P<port_number>\d+)\s+(?P<type>[\w\s\(\)]*)$") 
         ret_dict = {}
 
         for line in output.splitlines():
@@ -1464,10 +1464,10 @@ class ShowSpanningTreeInconsistentports(ShowSpanningTreeInconsistentportsSchema)
         ret_dict = dict()
 
         # VLAN0010             GigabitEthernet1/0/5           Root Inconsistent
-        p1 = re.compile(r'^(?P<vlan>\w+)\s+(?P<interface>[\w\-\/\.]+)\s+(?P<inconsistency>\S+\s+\S+)$')
+        p1 = regex_engine.compile(r'^(?P<vlan>\w+)\s+(?P<interface>[\w\-\/\.]+)\s+(?P<inconsistency>\S+\s+\S+)$')
 
         # Number of inconsistent ports (segments) in the system : 0
-        p2 = re.compile(r"^Number\s+of\s+inconsistent.+system\s+:\s+(?P<total_inconsistent_ports>\d+)$")
+        p2 = regex_engine.compile(r"^Number\s+of\s+inconsistent.+system\s+:\s+(?P<total_inconsistent_ports>\d+)$")
 
 
         for line in output.splitlines():
@@ -1532,10 +1532,10 @@ class ShowSpanningTreeSummaryTotals(ShowSpanningTreeSummaryTotalsSchema):
             output = self.device.execute(self.cli_command)
         
         # Switch is in rapid-pvst mode
-        p1 = re.compile(r'^Switch is in (?P<mode>\S+) mode$')
+        p1 = regex_engine.compile(r'^Switch is in (?P<mode>\S+) mode$')
 
         # Root bridge for: none
-        p2 = re.compile(r'^Root bridge for:\s+(?P<root_bridge>.+)$')
+        p2 = regex_engine.compile(r'^Root bridge for:\s+(?P<root_bridge>.+)$')
 
         # Extended system ID                      is enabled
         # Portfast Default                        is enabled
@@ -1547,15 +1547,15 @@ class ShowSpanningTreeSummaryTotals(ShowSpanningTreeSummaryTotalsSchema):
         # BackboneFast                            is disabled
         # Portfast Edge BPDU Guard Default        is disabled
         # Portfast Edge BPDU Filter Default       is disabled
-        p3 = re.compile(r'^(?P<key>Extended system ID|Portfast|PortFast BPDU Guard|Portfast BPDU Filter|'
+        p3 = regex_engine.compile(r'^(?P<key>Extended system ID|Portfast|PortFast BPDU Guard|Portfast BPDU Filter|'
             r'Portfast Edge BPDU Guard|Portfast Edge BPDU Filter|Loopguard|EtherChannel misconfig guard|'
             r'UplinkFast|BackboneFast)(\sDefault)?\s+is (?P<state>\w+)$')
 
         # Name                   Blocking Listening Learning Forwarding STP Active
-        p4 = re.compile(r'^Name\s+Blocking Listening Learning Forwarding STP Active$')
+        p4 = regex_engine.compile(r'^Name\s+Blocking Listening Learning Forwarding STP Active$')
 
         # 300 vlans                  300         0        0        600        900
-        p5 = re.compile(r'^(?P<spannig_tree_name>[\s\S]+)\s+(?P<blocking>\d+)\s+(?P<listening>\d+)\s+'
+        p5 = regex_engine.compile(r'^(?P<spannig_tree_name>[\s\S]+)\s+(?P<blocking>\d+)\s+(?P<listening>\d+)\s+'
             r'(?P<learning>\d+)\s+(?P<forwarding>\d+)\s+(?P<stp_active>\d+)$')
         
         ret_dict = {}
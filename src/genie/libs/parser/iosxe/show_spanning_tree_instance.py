@@ -3,7 +3,6 @@
      *  show spanning-tree instances
 
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -15,6 +14,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -41,7 +41,7 @@ class ShowSpanningTreeInstances(ShowSpanningTreeInstancesSchema):
 
         # initial regexp pattern for
         # "MAX STP instances supported is 4093"
-        p = re.compile(r'^(?P<summary>[^.]+)\s+(?P<vlan_count>[\d]+)$')
+        p = regex_engine.compile(r'^(?P<summary>[^.]+)\s+(?P<vlan_count>[\d]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5,6 +5,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowSslproxyStatusSchema(MetaParser):
     ''' Schema for show sslproxy status'''
     schema = {
@@ -47,10 +50,10 @@ class ShowSslproxyStatus(ShowSslproxyStatusSchema):
         parsed_dict = {}
 
         # Configuration
-        p1 = re.compile(r'^Configuration$')
+        p1 = regex_engine.compile(r'^Configuration$')
 
         # Status
-        p2 = re.compile(r'^Status$')
+        p2 = regex_engine.compile(r'^Status$')
 
         # CA Cert Bundle                 : /bootflash/vmanage-admin/sslProxyDefaultCAbundle.pem
         # CA TP Label                    : PROXY-SIGNING-CA
@@ -69,7 +72,7 @@ class ShowSslproxyStatus(ShowSslproxyStatusSchema):
         # TCP Proxy Operational State    : RUNNING
         # Clear Mode                     : FALSE
         # Dual-Side Optimization         : TRUE 
-        p3 = re.compile(r'^(?P<key>[\s\S]+\w) +: +(?P<value>[\s\S]+)$')
+        p3 = regex_engine.compile(r'^(?P<key>[\s\S]+\w) +: +(?P<value>[\s\S]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -414,87 +417,87 @@ class ShowSslProxyStatistics(ShowSslProxyStatisticsSchema):
             output = self.device.execute(self.cli_command)
 
         # SSL Proxy Statistics
-        p1 = re.compile(r'^SSL +Proxy +Statistics$')
+        p1 = regex_engine.compile(r'^SSL +Proxy +Statistics$')
 
         # Connection Statistics:
-        p2 = re.compile(r'^Connection +Statistics:$')
+        p2 = regex_engine.compile(r'^Connection +Statistics:$')
 
         # Non-proxied Connection Reasons:
-        p3 = re.compile(r'^Non-proxied +Connection +Reasons:$')
+        p3 = regex_engine.compile(r'^Non-proxied +Connection +Reasons:$')
 
         # Dropped Connection Reasons:
-        p4 = re.compile(r'^Dropped +Connection +Reasons:$')
+        p4 = regex_engine.compile(r'^Dropped +Connection +Reasons:$')
 
         # Alert Generated:
-        p5 = re.compile(r'^Alert +Generated:$')
+        p5 = regex_engine.compile(r'^Alert +Generated:$')
 
         # Alert Received:
-        p6 = re.compile(r'^Alert +Received:$')
+        p6 = regex_engine.compile(r'^Alert +Received:$')
 
         # Connection Closure Statistics:
-        p7 = re.compile(r'^Connection +Closure +Statistics:$')
+        p7 = regex_engine.compile(r'^Connection +Closure +Statistics:$')
 
         # C2S
         # S2C
-        p8 = re.compile(r'^(?P<c2s_s2c_stats>[C2S|S2C]+)$')
+        p8 = regex_engine.compile(r'^(?P<c2s_s2c_stats>[C2S|S2C]+)$')
 
         # Proxy Server:
-        p9 = re.compile(r'^Proxy +Server:$')
+        p9 = regex_engine.compile(r'^Proxy +Server:$')
 
         # Proxy Client:
-        p10 = re.compile(r'^Proxy +Client:$')
+        p10 = regex_engine.compile(r'^Proxy +Client:$')
 
         # ISM:
-        p11 = re.compile(r'^ISM:$')
+        p11 = regex_engine.compile(r'^ISM:$')
 
         # Resource Manager:
-        p12 = re.compile(r'^Resource +Manager:$')
+        p12 = regex_engine.compile(r'^Resource +Manager:$')
 
         # OCSP Statistics:
-        p13 = re.compile(r'^OCSP +Statistics:$')
+        p13 = regex_engine.compile(r'^OCSP +Statistics:$')
 
         # APP Statistics
         # Client Statistics
-        p14 = re.compile(r'^(?P<oscp_stats>[APP Statistics|Client Statistics]+)$')
+        p14 = regex_engine.compile(r'^(?P<oscp_stats>[APP Statistics|Client Statistics]+)$')
 
         # SSL Statistics:
-        p15 = re.compile(r'^SSL +Statistics:$')
+        p15 = regex_engine.compile(r'^SSL +Statistics:$')
 
         # Flow Requested SSL/TLS version:
-        p16 = re.compile(r'^Flow +Requested +SSL/TLS +version:$')
+        p16 = regex_engine.compile(r'^Flow +Requested +SSL/TLS +version:$')
 
         # Flow Selected SSL/TLS version:
-        p17 = re.compile(r'^Flow +Selected +SSL/TLS +version:$')
+        p17 = regex_engine.compile(r'^Flow +Selected +SSL/TLS +version:$')
 
         # Client Hello Extensions:
-        p18 = re.compile(r'^Client +Hello +Extensions:$')
+        p18 = regex_engine.compile(r'^Client +Hello +Extensions:$')
 
         # SSL Handshake Statistics:
-        p19 = re.compile(r'^SSL +Handshake +Statistics:$')
+        p19 = regex_engine.compile(r'^SSL +Handshake +Statistics:$')
 
         # Policy Statistics:
-        p20 = re.compile(r'^Policy +Statistics:$')
+        p20 = regex_engine.compile(r'^Policy +Statistics:$')
 
         # Packet Counters:
-        p21 = re.compile(r'^Packet +Counters:$')
+        p21 = regex_engine.compile(r'^Packet +Counters:$')
 
         # Clear Packets:
-        p22 = re.compile(r'^Clear +Packets:$')
+        p22 = regex_engine.compile(r'^Clear +Packets:$')
 
         # Dropped Packets:
-        p23 = re.compile(r'^Dropped +Packets:$')
+        p23 = regex_engine.compile(r'^Dropped +Packets:$')
 
         # Drop
         # Decrypt
         # No Decrypt
-        p24 = re.compile(r'^(?P<policy_stats>[Drop|Decrypt|No Decrypt]+)$')
+        p24 = regex_engine.compile(r'^(?P<policy_stats>[Drop|Decrypt|No Decrypt]+)$')
 
         # Proxy Server
         # Proxy Client
-        p25 = re.compile(r'^(?P<proxy_type>Proxy +(Server|Client))$')
+        p25 = regex_engine.compile(r'^(?P<proxy_type>Proxy +(Server|Client))$')
 
         # OCSP Stapling:
-        p26 = re.compile(r'^OCSP +Stapling:$')
+        p26 = regex_engine.compile(r'^OCSP +Stapling:$')
 
         # Note - Due to large output limited the sample match string comments
         # Total Connections                  : 0
@@ -508,7 +511,7 @@ class ShowSslProxyStatistics(ShowSslProxyStatisticsSchema):
         # Max Conc Non-proxied Connections   : 0
         # Max Conc Clear Connections         : 0
         # Total Closed Connections           : 0
-        p27 = re.compile(r'^(?P<key>[\s\S]+\S)(\s+:|:) +(?P<value>[\d]+)$')
+        p27 = regex_engine.compile(r'^(?P<key>[\s\S]+\S)(\s+:|:) +(?P<value>[\d]+)$')
 
         parsed_dict = {}
         last_dict_ptr = {}
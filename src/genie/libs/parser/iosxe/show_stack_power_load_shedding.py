@@ -1,5 +1,5 @@
-import re
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (And, Any, Default, Optional,
@@ -57,17 +57,17 @@ class ShowStackPowerLoadShedding(ShowStackPowerLoadSheddingSchema):
             output = self.device.execute(self.cli_command)
 
         # Powerstack-6 SP-PS Stndaln 1100 0 505 595 1 1
-        p1 = re.compile(r"^(?P<power_name>\S+)\s+(?P<stack_mode>\S+)\s+(?P<stack_topology>\w+)\s+(?P<stack_pwr>\d+)"
-                        r"\s+(?P<total_pwr>\d+)\s+(?P<rsvd_pwr>\d+)\s+(?P<alloc_pwr>\d+)\s+(?P<sw_avail_num>\d+)\s+(?P<num_ps>\d+)$")
+        p1 = regex_engine.compile(r"^(?P<power_name>\S+)\s+(?P<stack_mode>\S+)\s+(?P<stack_topology>\w+)\s+(?P<stack_pwr>\d+)"
+                                  r"\s+(?P<total_pwr>\d+)\s+(?P<rsvd_pwr>\d+)\s+(?P<alloc_pwr>\d+)\s+(?P<sw_avail_num>\d+)\s+(?P<num_ps>\d+)$")
         
         # 1 Powerstack-1 2-11-20 108 0.0 0.0 0.0 0.0
         # 1   Powerstack-2           1-12-21  173.8    0.0      8.8      0.0      22.3
-        p2 = re.compile(r"^(?P<sw>\d+)\s+(?P<power_name>\S+)\s+(?P<stack_priority>\d+\s*-\s*\d+\s*-\s*\d+)\s+(?P<consumd_sw>\S+)"
-                        r"\s+(?P<consumd_hi>\S+)\s+(?P<consumd_lo>\S+)\s+(?P<alloc_hi>\S+)\s+(?P<alloc_lo>\S+)$")
+        p2 = regex_engine.compile(r"^(?P<sw>\d+)\s+(?P<power_name>\S+)\s+(?P<stack_priority>\d+\s*-\s*\d+\s*-\s*\d+)\s+(?P<consumd_sw>\S+)"
+                                  r"\s+(?P<consumd_hi>\S+)\s+(?P<consumd_lo>\S+)\s+(?P<alloc_hi>\S+)\s+(?P<alloc_lo>\S+)$")
         
         # 1109 0.0 0.0 0.0 0.0
         # Totals:                             529.1    0.0      54.9     0.0      107.8
-        p3 = re.compile(r"^Totals:\s+(?P<consumd_sw>\S+)\s+(?P<consumd_hi>\S+)\s+(?P<consumd_lo>\S+)\s+(?P<alloc_hi>\S+)\s+(?P<alloc_lo>\S+)$")
+        p3 = regex_engine.compile(r"^Totals:\s+(?P<consumd_sw>\S+)\s+(?P<consumd_hi>\S+)\s+(?P<consumd_lo>\S+)\s+(?P<alloc_hi>\S+)\s+(?P<alloc_lo>\S+)$")
         
         ret_dict = {}
 
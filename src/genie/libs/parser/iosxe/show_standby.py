@@ -5,13 +5,13 @@ IOSXE parsers for show commands:
     * 'show standby internal'
     * 'show standby brief'
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ======================================
 #   Schema for 'show standby internal'
@@ -65,46 +65,46 @@ class ShowStandbyInternal(ShowStandbyInternalSchema):
         standby_internal_dict = {}
         
         # HSRP common process running
-        p1 = re.compile(r'HSRP +common +process'
-                        r' +(?P<hsrp_common_process_state>[a-zA-Z\s]+)$')
+        p1 = regex_engine.compile(r'HSRP +common +process'
+                                  r' +(?P<hsrp_common_process_state>[a-zA-Z\s]+)$')
 
         # MsgQ size 0, max 2
-        p2 = re.compile(r'MsgQ +size +(?P<msgQ_size>\d+),'
-                        r' +max +(?P<msgQ_max_size>\d+)$')
+        p2 = regex_engine.compile(r'MsgQ +size +(?P<msgQ_size>\d+),'
+                                  r' +max +(?P<msgQ_max_size>\d+)$')
 
         # HSRP IPv4 process running
-        p3 = re.compile(r'HSRP +IPv4 +process'
-                        r' +(?P<hsrp_ipv4_process_state>[a-zA-Z\s]+)$')
+        p3 = regex_engine.compile(r'HSRP +IPv4 +process'
+                                  r' +(?P<hsrp_ipv4_process_state>[a-zA-Z\s]+)$')
 
         # HSRP IPv6 process not running
-        p4 = re.compile(r'HSRP +IPv6 +process'
-                        r' +(?P<hsrp_ipv6_process_state>[a-zA-Z\s]+)$')
+        p4 = regex_engine.compile(r'HSRP +IPv6 +process'
+                                  r' +(?P<hsrp_ipv6_process_state>[a-zA-Z\s]+)$')
 
         # HSRP Timer wheel running
-        p5 = re.compile(r'HSRP +Timer +wheel'
-                        r' +(?P<hsrp_timer_wheel_state>[a-zA-Z\s]+)$')
+        p5 = regex_engine.compile(r'HSRP +Timer +wheel'
+                                  r' +(?P<hsrp_timer_wheel_state>[a-zA-Z\s]+)$')
 
         # HSRP HA capable, v3 to v4 transform disabled
-        p6 = re.compile(r'HSRP +HA +(?P<hsrp_ha_state>[a-zA-Z\s]+),'
-                        r' +v3 +to +v4 +transform'
-                        r' +(?P<v3_to_v4_transform>[a-zA-Z\s]+)$')
+        p6 = regex_engine.compile(r'HSRP +HA +(?P<hsrp_ha_state>[a-zA-Z\s]+),'
+                                  r' +v3 +to +v4 +transform'
+                                  r' +(?P<v3_to_v4_transform>[a-zA-Z\s]+)$')
 
         # HSRP virtual IP Hash Table (global)
         # 103 192.168.1.254                    Gi1/0/1    Grp 0
         # HSRP virtual IPv6 Hash Table (global)
         # 78  2001:DB8:10:1:1::254             Gi1        Grp 20
-        p7 = re.compile(r'(?P<hsrp>\d+) +(?P<ip>[\w\.\:]+)'
-                        r' +(?P<interface>[\w\/]+) +Grp +(?P<group>\d+)$')
+        p7 = regex_engine.compile(r'(?P<hsrp>\d+) +(?P<ip>[\w\.\:]+)'
+                                  r' +(?P<interface>[\w\/]+) +Grp +(?P<group>\d+)$')
 
         # HSRP MAC Address Table
         # 240 Gi1/0/1 0000.0cff.909f
-        p8 = re.compile(r'(?P<hsrp_number>\d+)'
-                        r' +(?P<interface>[\w\/]+)'
-                        r' +(?P<mac_address>[\w\.]+)$')
+        p8 = regex_engine.compile(r'(?P<hsrp_number>\d+)'
+                                  r' +(?P<interface>[\w\/]+)'
+                                  r' +(?P<mac_address>[\w\.]+)$')
 
         # HSRP MAC Address Table
         # Gi1/0/1 Grp 0
-        p8_1 = re.compile(r'(?P<interface>[\w\/]+) +Grp +(?P<group>\d+)$')
+        p8_1 = regex_engine.compile(r'(?P<interface>[\w\/]+) +Grp +(?P<group>\d+)$')
 
 
         for line in out.splitlines():
@@ -406,65 +406,65 @@ class ShowStandbyAll(ShowStandbyAllSchema):
         standby_all_dict = {}
 
         # Ethernet4/1 - Group 0 (version 2)
-        p1 = re.compile(r'(?P<intf>[\w\/\.\-]+) +\- +Group +(?P<group>\d+)'
-                        r' *(?:\(version +(?P<version>\d+)\))?$')
+        p1 = regex_engine.compile(r'(?P<intf>[\w\/\.\-]+) +\- +Group +(?P<group>\d+)'
+                                  r' *(?:\(version +(?P<version>\d+)\))?$')
 
         # State is Active
         # State is Disabled
         # State is Init (protocol not cfgd)
-        p2 = re.compile(r'[sS]tate +is +(?P<hsrp_router_state>\S+)'
-                        r'( +\((?P<hsrp_router_state_reason>.+)\))?')
+        p2 = regex_engine.compile(r'[sS]tate +is +(?P<hsrp_router_state>\S+)'
+                                  r'( +\((?P<hsrp_router_state_reason>.+)\))?')
 
         # 8 state changes, last state change 1w0d
-        p3 = re.compile(r'(?P<num_state_changes>\d+) +state'
-                        r' +changes, +last +state +change'
-                        r' +(?P<last_state_change>\w+)$')
+        p3 = regex_engine.compile(r'(?P<num_state_changes>\d+) +state'
+                                  r' +changes, +last +state +change'
+                                  r' +(?P<last_state_change>\w+)$')
 
         # Virtual IP address is 192.168.1.254
         # Virtual IP address is unknown
         # Link-Local Virtual IPv6 address is FE80::5:73FF:FEA0:14 (conf auto EUI64)
         # Link-Local Virtual IPv6 address is FE80::5:73FF:FEA0:A (impl auto EUI64)
         # Virtual IPv6 address 2001:DB8:10:1:1::254/64
-        p4 = re.compile(r'(?P<v6_type>\S+)? *Virtual +(?P<address_family>\S+) '
-                        r'+address( +is)? +(?P<vip>\S+) ?'
-                        r'(\((?P<vip_conf>.*)\))?$')
+        p4 = regex_engine.compile(r'(?P<v6_type>\S+)? *Virtual +(?P<address_family>\S+) '
+                                  r'+address( +is)? +(?P<vip>\S+) ?'
+                                  r'(\((?P<vip_conf>.*)\))?$')
 
         # Secondary virtual IP address 10.1.1.253
-        p5 = re.compile(r'[sS]econdary +virtual +IP +address +'
-                        r'(?P<secondary_ipv4_address>\S+)$')
+        p5 = regex_engine.compile(r'[sS]econdary +virtual +IP +address +'
+                                  r'(?P<secondary_ipv4_address>\S+)$')
 
         # Track object 1 (unknown)
-        p6 = re.compile(r'Track +object +(?P<tracked_object>\d+)'
-                        r' +\((?P<tracked_status>\S+)\)$')
+        p6 = regex_engine.compile(r'Track +object +(?P<tracked_object>\d+)'
+                                  r' +\((?P<tracked_status>\S+)\)$')
 
         # Active virtual MAC address is 0000.0cff.909f (MAC In Use)
         # Active virtual MAC address is unknown (MAC Not In Use)
-        p7 = re.compile(r'Active +virtual +MAC +address +is'
-                        r' +(?P<virtual_mac_address>[\w\.]+)'
-                        r' +\((?P<virtual_mac_address_mac_in_use>'
-                        r'[a-zA-Z\s]+)\)$')
+        p7 = regex_engine.compile(r'Active +virtual +MAC +address +is'
+                                  r' +(?P<virtual_mac_address>[\w\.]+)'
+                                  r' +\((?P<virtual_mac_address_mac_in_use>'
+                                  r'[a-zA-Z\s]+)\)$')
 
         # Local virtual MAC address is 0000.0cff.909f (v2 default)
         # Local virtual MAC address is 5254.00ff.afbf (bia)
         # Local virtual MAC address is aaaa.aaff.5555 (cfgd)
-        p8 = re.compile(r'Local +virtual +MAC +address +is'
-                        r' +(?P<local_virtual_mac_address>[\w\.]+)'
-                        r' +\((?P<local_virtual_mac_address_conf>'
-                        r'[\w\s]+)\)$')
+        p8 = regex_engine.compile(r'Local +virtual +MAC +address +is'
+                                  r' +(?P<local_virtual_mac_address>[\w\.]+)'
+                                  r' +\((?P<local_virtual_mac_address_conf>'
+                                  r'[\w\s]+)\)$')
 
         # Hellotime 1 sec, holdtime 3 sec
         # Hello time 3 sec, hold time 10 sec
         # Hello time 999 msec, hold time 10 sec
         # Hello time 999 msec, hold time 2999 msec
         # Hello time 9 sec (cfgd 999 msec), hold time 27 sec (cfgd 2999 msec)
-        p9 = re.compile(r'Hello ?time +(?P<hellotime>\d+) (?P<hello_unit>\S+)'
-                        r'( \(cfgd (?P<cfgd_hello_msec>\d)+ msec\))?, +hold '
-                        r'?time +(?P<holdtime>\d+) +(?P<hold_unit>\S+)'
-                        r'( \(cfgd (?P<cfgd_hold_msec>\d+) msec\))?$')
+        p9 = regex_engine.compile(r'Hello ?time +(?P<hellotime>\d+) (?P<hello_unit>\S+)'
+                                  r'( \(cfgd (?P<cfgd_hello_msec>\d)+ msec\))?, +hold '
+                                  r'?time +(?P<holdtime>\d+) +(?P<hold_unit>\S+)'
+                                  r'( \(cfgd (?P<cfgd_hold_msec>\d+) msec\))?$')
 
         # Next hello sent in 2.848 secs
-        p10 = re.compile(r'Next +hello +sent +in'
-                         r' +(?P<next_hello_sent>[\d\.]+) secs$')
+        p10 = regex_engine.compile(r'Next +hello +sent +in'
+                                   r' +(?P<next_hello_sent>[\d\.]+) secs$')
 
         # Authentication MD5, key-string "cisco123"
         # Authentication MD5, key-chain "cisco123"
@@ -472,57 +472,57 @@ class ShowStandbyAll(ShowStandbyAllSchema):
         # Authentication text "cisco123"
         # Authentication "cisco123"
         # Authentication text, string "cisco123"
-        p11 = re.compile(r'[aA]uthentication +(?P<authentication_type>\w+)?'
-                         r'(, +)?(key-string|key-chain|string)?( +)?'
-                         r'(\"(?P<authentication>\S+)\")?$')
+        p11 = regex_engine.compile(r'[aA]uthentication +(?P<authentication_type>\w+)?'
+                                   r'(, +)?(key-string|key-chain|string)?( +)?'
+                                   r'(\"(?P<authentication>\S+)\")?$')
 
         # MAC refresh 222 secs (next refresh 0 secs)
-        p12 = re.compile(r'MAC refresh (?P<mac_refresh>\d+) secs '
-                         r'\(next refresh (?P<mac_next_refresh>\d+) secs\)$')
+        p12 = regex_engine.compile(r'MAC refresh (?P<mac_refresh>\d+) secs '
+                                   r'\(next refresh (?P<mac_next_refresh>\d+) secs\)$')
 
         # Preemption enabled, delay min 5 secs, reload 10 secs, sync 20 secs
         # Preemption enabled
-        p13 = re.compile(r'Preemption +(?P<preempt>[a-zA-Z]+)(?:, +delay +min '
-                         r'+(?P<preempt_min_delay>\d+) +secs,)?'
-                         r'(?: +reload +(?P<preempt_reload_delay>\d+)'
-                         r' +secs,)?(?: +sync'
-                         r' +(?P<preempt_sync_delay>\d+) +secs)?$')
+        p13 = regex_engine.compile(r'Preemption +(?P<preempt>[a-zA-Z]+)(?:, +delay +min '
+                                   r'+(?P<preempt_min_delay>\d+) +secs,)?'
+                                   r'(?: +reload +(?P<preempt_reload_delay>\d+)'
+                                   r' +secs,)?(?: +sync'
+                                   r' +(?P<preempt_sync_delay>\d+) +secs)?$')
 
         # Active router is unknown
-        p14 = re.compile(r'Active +router +is'
-                         r' +(?P<active_router>[a-zA-Z\s]+)$')
+        p14 = regex_engine.compile(r'Active +router +is'
+                                   r' +(?P<active_router>[a-zA-Z\s]+)$')
 
         # Active router is 10.1.2.1, priority 120 (expires in 0.816 sec)
-        p15 = re.compile(r'Active +router +is +(?P<active_router>\S+),'
-                         r' +priority +(?P<ar_priority>\d+)'
-                         r' +\(expires in (?P<active_expires_in>'
-                         r'[\w\.]+) sec\)$')
+        p15 = regex_engine.compile(r'Active +router +is +(?P<active_router>\S+),'
+                                   r' +priority +(?P<ar_priority>\d+)'
+                                   r' +\(expires in (?P<active_expires_in>'
+                                   r'[\w\.]+) sec\)$')
 
         # Standby router is unknown
         # Standby router is 10.1.1.2, priority 100 (expires in 10.624 sec)
-        p16 = re.compile(r'Standby +router +is +(?P<standby_router>[\w\.]+)'
-                         r'(, +priority +(?P<standby_priority>\d+) +\(expires '
-                         r'+in +(?P<standby_expires_in>\S+) +sec\))?')
+        p16 = regex_engine.compile(r'Standby +router +is +(?P<standby_router>[\w\.]+)'
+                                   r'(, +priority +(?P<standby_priority>\d+) +\(expires '
+                                   r'+in +(?P<standby_expires_in>\S+) +sec\))?')
 
         # Priority 100 (default 100)
-        p17 = re.compile(r'Priority +(?P<priority>\d+)'
-                         r' +\(default +(?P<default_priority>\d+)\)$')
+        p17 = regex_engine.compile(r'Priority +(?P<priority>\d+)'
+                                   r' +\(default +(?P<default_priority>\d+)\)$')
 
         # Priority 100 (configured 100)
-        p18 = re.compile(r'Priority +(?P<priority>\d+) +\(configured'
-                         r' +(?P<configured_priority>\d+)\)$')
+        p18 = regex_engine.compile(r'Priority +(?P<priority>\d+) +\(configured'
+                                   r' +(?P<configured_priority>\d+)\)$')
 
         # Group name is "hsrp-Gi1/0/1-0" (default)
         # Group name is "gandalf" (cfgd)
         # Group name is "hsrp-Gi4/10.103-100" (default)
-        p19 = re.compile(r'Group +name +is +\"(?P<session_name>[\w\/\-\.]+)\"'
-                         r' +(?:\(default\)|\(cfgd\))$')
+        p19 = regex_engine.compile(r'Group +name +is +\"(?P<session_name>[\w\/\-\.]+)\"'
+                                   r' +(?:\(default\)|\(cfgd\))$')
 
         # Following "group10"
-        p20 = re.compile(r'[fF]ollowing +\"(?P<follow>\S+)\"$')
+        p20 = regex_engine.compile(r'[fF]ollowing +\"(?P<follow>\S+)\"$')
 
         # HSRP ICMP redirects disabled
-        p21 = re.compile(r'HSRP ICMP redirects disabled')
+        p21 = regex_engine.compile(r'HSRP ICMP redirects disabled')
 
         for line in out.splitlines():
             line = line.strip()
@@ -901,8 +901,8 @@ class ShowStandbyDelay(ShowStandbyDelaySchema):
         hsrp_delay_dict = {}
 
         # GigabitEthernet1   99      888
-        p1 = re.compile(r'(?P<interface>\S+) +(?P<minimum_delay>\d+) +'
-                        r'(?P<reload_delay>\d+)')
+        p1 = regex_engine.compile(r'(?P<interface>\S+) +(?P<minimum_delay>\d+) +'
+                                  r'(?P<reload_delay>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -962,15 +962,15 @@ class ShowStandbyBrief(ShowStandbyBriefSchema):
         ret_dict = {}
 
         # Vl11        11   200 P Active  local           11.11.11.4      11.11.11.5
-        p0 = re.compile(r"^(?P<interface>\w+)\s+(?P<grp>\d+)\s+(?P<priority>\d+)\s+((?P<is_preempt_enabled>\S+)\s+)?(?P<state>\w+)\s+(?P<active>[\w:.]+)\s+(?P<standby>[\w:.]+)\s+(?P<virtual_ip>[\w:.]+)$")
+        p0 = regex_engine.compile(r"^(?P<interface>\w+)\s+(?P<grp>\d+)\s+(?P<priority>\d+)\s+((?P<is_preempt_enabled>\S+)\s+)?(?P<state>\w+)\s+(?P<active>[\w:.]+)\s+(?P<standby>[\w:.]+)\s+(?P<virtual_ip>[\w:.]+)$")
         # FE80::5:73FF:FEA0:0
-        p1 = re.compile(r"(?P<virtual_ip>[\w:.]+)$")
+        p1 = regex_engine.compile(r"(?P<virtual_ip>[\w:.]+)$")
         # Vl11        0    200 P Active  local           FE80::2E5A:FFF:FE1C:2064
-        p2 = re.compile(r"^(?P<interface>\w+)\s+(?P<grp>\d+)\s+(?P<priority>\d+)\s+((?P<is_preempt_enabled>\S+)\s+)?(?P<state>\w+)\s+(?P<active>[\w:.]+)\s+(?P<standby>[\w:]+)$")
+        p2 = regex_engine.compile(r"^(?P<interface>\w+)\s+(?P<grp>\d+)\s+(?P<priority>\d+)\s+((?P<is_preempt_enabled>\S+)\s+)?(?P<state>\w+)\s+(?P<active>[\w:.]+)\s+(?P<standby>[\w:]+)$")
         # unknown         FE80::5:73FF:FEA0:0
-        p3 = re.compile(r"(?P<standby>[\w:.]+)\s+(?P<virtual_ip>[\w:.]+)$")
+        p3 = regex_engine.compile(r"(?P<standby>[\w:.]+)\s+(?P<virtual_ip>[\w:.]+)$")
         # Vl11        0    50  P Speak   FE80::2E5A:FFF:FE1C:2064
-        p4 = re.compile(r"^(?P<interface>\w+)\s+(?P<grp>\d+)\s+(?P<priority>\d+)\s+((?P<is_preempt_enabled>\S+)\s+)?(?P<state>\w+)\s+(?P<active>[\w:.]+)$")
+        p4 = regex_engine.compile(r"^(?P<interface>\w+)\s+(?P<grp>\d+)\s+(?P<priority>\d+)\s+((?P<is_preempt_enabled>\S+)\s+)?(?P<state>\w+)\s+(?P<active>[\w:.]+)$")
 
         ret_dict = {}
         last_matched = None
@@ -2,12 +2,14 @@
 show_static_route.py
 
 '''
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================================
 #  schema for show ip static route
@@ -84,7 +86,7 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
                 continue
             # Static local RIB for default
             # Static local RIB for default-thing
-            p1 = re.compile(r'^Static +local +RIB +for +(?P<vrf>[\w-]+)$')
+            p1 = regex_engine.compile(r'^Static +local +RIB +for +(?P<vrf>[\w-]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -96,10 +98,10 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
             # M             [3/0] via 10.186.2.2 [N]
             # M  10.36.3.3/32 [1/0] via GigabitEthernet0/2 [A]
             # M             [1/0] via GigabitEthernet0/3 [A]
-            p2 = re.compile(r'^\s*(?P<code>[A-Z]+) +(?P<route>[\w\/\.]+)?'
-                            r' +\[(?P<if_preference>[\d]+)\/(?P<if_preference2>[\d]+)\]'
-                            r' +via +(?P<interface>[a-zA-Z][\w\/\.]+)?(?P<nexthop>[\d\s\.]+)?'
-                            r' +\[(?P<code_in_bracket>[\w])]$')
+            p2 = regex_engine.compile(r'^\s*(?P<code>[A-Z]+) +(?P<route>[\w\/\.]+)?'
+                                      r' +\[(?P<if_preference>[\d]+)\/(?P<if_preference2>[\d]+)\]'
+                                      r' +via +(?P<interface>[a-zA-Z][\w\/\.]+)?(?P<nexthop>[\d\s\.]+)?'
+                                      r' +\[(?P<code_in_bracket>[\w])]$')
             m = p2.match(line)
             if m:
                 code = m.groupdict()['code']
@@ -277,7 +279,7 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
 
             # IPv6 Static routes Table - default
             # IPv6 Static routes Table - default-table
-            p1 = re.compile(r'^IPv6 +Static +routes +Table +- +(?P<vrf>[\w-]+)$')
+            p1 = regex_engine.compile(r'^IPv6 +Static +routes +Table +- +(?P<vrf>[\w-]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -299,11 +301,11 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
             # *   2001:2:2:2::2/128 via 2001:20:1:2::2, GigabitEthernet0/1, distance 1
             # 2001:2:2:2::2/128 via 2001:10:1:2::2, GigabitEthernet0/0, distance 11, tag 100
             # *   2001:3:3:3::3/128 via GigabitEthernet0/3, distance 1
-            p2 = re.compile(r'^\s*((?P<star>[*]+)  +)?(?P<route>[\w\/\:]+)?'
-                            r' +via +((?P<nexthop>[0-9a-fA-F\:]+), )?'
-                            r'((?P<interface>[a-zA-Z][\w\.\/]+), )?'
-                            r'(distance (?P<distance>[\d]+))?'
-                            r'(, +tag +(?P<tag>[\d]+))?$')
+            p2 = regex_engine.compile(r'^\s*((?P<star>[*]+)  +)?(?P<route>[\w\/\:]+)?'
+                                      r' +via +((?P<nexthop>[0-9a-fA-F\:]+), )?'
+                                      r'((?P<interface>[a-zA-Z][\w\.\/]+), )?'
+                                      r'(distance (?P<distance>[\d]+))?'
+                                      r'(, +tag +(?P<tag>[\d]+))?$')
             m = p2.match(line)
             if m:
                 next_hop = ""
@@ -393,8 +395,8 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
                 continue
 
             # Resolves to 1 paths (max depth 1)
-            p3 = re.compile(r'^\s*Resolves +to +(?P<no_paths>[\d]+)? +paths'
-                            r' +\(max +depth +(?P<max_depth>[\d]+)\)$')
+            p3 = regex_engine.compile(r'^\s*Resolves +to +(?P<no_paths>[\d]+)? +paths'
+                                      r' +\(max +depth +(?P<max_depth>[\d]+)\)$')
             m = p3.match(line)
             if m:
                 resolved_interface = True
@@ -408,7 +410,7 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
                 continue
 
             # via GigabitEthernet0/0
-            p4 = re.compile(r'^\s*via +(?P<resolved_interface>[\w\/\.]+)$')
+            p4 = regex_engine.compile(r'^\s*via +(?P<resolved_interface>[\w\/\.]+)$')
             m = p4.match(line)
             if m:
                 if resolved_interface:
@@ -419,7 +421,7 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
                 continue
 
             # Rejected by routing table
-            p6 = re.compile(r'^\s*Rejected +by +(?P<rejected_by>[\w\s]+)$')
+            p6 = regex_engine.compile(r'^\s*Rejected +by +(?P<rejected_by>[\w\s]+)$')
             m = p6.match(line)
             if m:
                 rejected_by = m.groupdict()['rejected_by']
@@ -428,7 +430,7 @@ class ShowIpv6StaticDetail(ShowIpv6StaticDetailSchema):
                 continue
 
             # Tracked object 1 is Up
-            p7 = re.compile(r'^\s*Tracked +object +(?P<tracked_no>\d+) +is +(?P<interface_status>[\w]+)$')
+            p7 = regex_engine.compile(r'^\s*Tracked +object +(?P<tracked_no>\d+) +is +(?P<interface_status>[\w]+)$')
             m = p7.match(line)
             if m:
                 track = m.groupdict()['tracked_no']
@@ -8,10 +8,12 @@ IOSXE parsers for the following show commands:
     * 'show subscriber lite-session'
     * 'show subscriber statistics'
 """
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowSubscriberSessionSchema(MetaParser):
 
     """Schema for show subscriber session"""
@@ -50,14 +52,14 @@ class ShowSubscriberSession(ShowSubscriberSessionSchema):
         parsed_dict = {}
 
         # Current Subscriber Information: Total sessions 1
-        p1 = re.compile(r'^Current\s+Subscriber\s+Information:\s+Total\s+sessions\s+(?P<total_sessions>\d+)')
+        p1 = regex_engine.compile(r'^Current\s+Subscriber\s+Information:\s+Total\s+sessions\s+(?P<total_sessions>\d+)')
 
         # Uniq ID Interface    State    Service     Up-time  TC Ct. Identifier
         # 5476    Vi2.1        authen   Lterm       00:21:04 0      user1@airtel.com
-        p2 = re.compile(r'^(?P<uniq_ID>(\d+))\s+(?P<interface>(PPPoE|Vi\d+\.\d+))\s+(?P<state>(authen|unauthen))\s+(?P<service>(Lterm|Fwd))\s+(\d+\:\d+\:\d+)\s+\d+\s+(?P<identifier>(\S+$))')
+        p2 = regex_engine.compile(r'^(?P<uniq_ID>(\d+))\s+(?P<interface>(PPPoE|Vi\d+\.\d+))\s+(?P<state>(authen|unauthen))\s+(?P<service>(Lterm|Fwd))\s+(\d+\:\d+\:\d+)\s+\d+\s+(?P<identifier>(\S+$))')
 
         # %No active Subscriber Sessions
-        p3 = re.compile(r'^\%(?P<no_active_session>No\s+active\s+Subscriber\s+Sessions)')
+        p3 = regex_engine.compile(r'^\%(?P<no_active_session>No\s+active\s+Subscriber\s+Sessions)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -127,15 +129,15 @@ class ShowSubscriberLiteSession(ShowSubscriberLiteSessionSchema):
         parsed_dict = {}
 
         # Total lite sessions up: 1
-        p1 = re.compile(r'^Total\s+lite\s+sessions\s+up\: +(?P<total_sessions>(\d+))')
+        p1 = regex_engine.compile(r'^Total\s+lite\s+sessions\s+up\: +(?P<total_sessions>(\d+))')
 
         # Src-IP       VRF      S-VRF   Up-time(sec) Interface    PBHK
         # 100.0.0.10   Default  Default  34          Te1/0/3.100  0.0.0.0:0
 
-        p2 = re.compile(r'^(?P<src_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<vrf>\w+)\s+(?P<s_vrf>\w+)\s+\d+\s+(?P<interface>[a-zA-Z0-9/\.]+)\s+(?P<pbhk>\d+\.\d+\.\d+\.\d+\:\d+)')
+        p2 = regex_engine.compile(r'^(?P<src_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<vrf>\w+)\s+(?P<s_vrf>\w+)\s+\d+\s+(?P<interface>[a-zA-Z0-9/\.]+)\s+(?P<pbhk>\d+\.\d+\.\d+\.\d+\:\d+)')
 
         # # Total lite sessions up: 0
-        p3 = re.compile(r'^Total\s+lite\s+sessions\s+up\: +(?P<no_lite_session>(\d+))')
+        p3 = regex_engine.compile(r'^Total\s+lite\s+sessions\s+up\: +(?P<no_lite_session>(\d+))')
 
         counter = 1
 
@@ -276,121 +278,121 @@ class ShowSubscriberStatistics(ShowSubscriberStatisticsSchema):
 
         # Current Subscriber Statistics:
         # Number of sessions currently up: 2
-        p1 = re.compile(r'^Number\s+of\s+sessions\s+currently\s+up\:\s+(?P<sessions_currently_up>\d+)$')
+        p1 = regex_engine.compile(r'^Number\s+of\s+sessions\s+currently\s+up\:\s+(?P<sessions_currently_up>\d+)$')
 
         # Number of sessions currently pending: 0
-        p2 = re.compile(r'^Number\s+of\s+sessions\s+currently\s+pending\:\s+(?P<sessions_currently_pending>\d+)$')
+        p2 = regex_engine.compile(r'^Number\s+of\s+sessions\s+currently\s+pending\:\s+(?P<sessions_currently_pending>\d+)$')
 
         # Number of sessions currently authenticated: 0
-        p3 = re.compile(r'^Number\s+of\s+sessions\s+currently\s+authenticated\:\s+(?P<sessions_currently_authenticated>\d+)$')
+        p3 = regex_engine.compile(r'^Number\s+of\s+sessions\s+currently\s+authenticated\:\s+(?P<sessions_currently_authenticated>\d+)$')
 
         # Number of sessions currently unauthenticated: 2
-        p4 = re.compile(r'^Number\s+of\s+sessions\s+currently\s+unauthenticated\:\s+(?P<sessions_currently_unauthenticated>\d+)$')
+        p4 = regex_engine.compile(r'^Number\s+of\s+sessions\s+currently\s+unauthenticated\:\s+(?P<sessions_currently_unauthenticated>\d+)$')
 
         # Highest number of sessions ever up at one time: 31998
-        p5 = re.compile(r'^Highest\s+number\s+of\s+sessions\s+ever\s+up\s+at\s+one\s+time\:\s+(?P<highest_number_of_sessions>\d+)$')
+        p5 = regex_engine.compile(r'^Highest\s+number\s+of\s+sessions\s+ever\s+up\s+at\s+one\s+time\:\s+(?P<highest_number_of_sessions>\d+)$')
 
         # Mean up-time duration of sessions: 00:14:58
-        p6 = re.compile(r'^Mean\s+up\-time\s+duration\s+of\s+sessions\:\s+(?P<mean_up_time_duration_session>(\d+\:\d+\:\d+))$')
+        p6 = regex_engine.compile(r'^Mean\s+up\-time\s+duration\s+of\s+sessions\:\s+(?P<mean_up_time_duration_session>(\d+\:\d+\:\d+))$')
 
         # Total number of sessions up so far: 64132
-        p7 = re.compile(r'^Total\s+number\s+of\s+sessions\s+up\s+so\s+far\:\s+(?P<number_of_sessions_up_so_far>\d+)$')
+        p7 = regex_engine.compile(r'^Total\s+number\s+of\s+sessions\s+up\s+so\s+far\:\s+(?P<number_of_sessions_up_so_far>\d+)$')
 
         # Mean call rate per minute: 203, per hour: 12826
-        p8 = re.compile(r'^Mean\s+call\s+rate\s+per\s+minute\:\s+(?P<mean_call_rate_per_minute>\d+),\s+per\s+hour\:\s+(?P<mean_call_rate_per_hour>\d+)$')
+        p8 = regex_engine.compile(r'^Mean\s+call\s+rate\s+per\s+minute\:\s+(?P<mean_call_rate_per_minute>\d+),\s+per\s+hour\:\s+(?P<mean_call_rate_per_hour>\d+)$')
 
         # Number of calls in last one hour: 4
-        p9 = re.compile(r'^Number\s+of\s+calls\s+in\s+last\s+one\s+hour\:\s+(?P<number_of_calls_in_last_one_hour>\d+)$')
+        p9 = regex_engine.compile(r'^Number\s+of\s+calls\s+in\s+last\s+one\s+hour\:\s+(?P<number_of_calls_in_last_one_hour>\d+)$')
 
         # Number of sessions failed to come up: 32045
-        p10 = re.compile(r'^Number\s+of\s+sessions\s+failed\s+to\s+come\s+up\:\s+(?P<number_of_sessions_failed>\d+)$')
+        p10 = regex_engine.compile(r'^Number\s+of\s+sessions\s+failed\s+to\s+come\s+up\:\s+(?P<number_of_sessions_failed>\d+)$')
 
         # Current Lite Session Statistics:
         # Number of lite sessions currently up: 0
-        p11 = re.compile(r'^Number\s+of\s+lite\s+sessions\s+currently\s+up\:\s+(?P<lite_sessions_currently_up>\d+)$')
+        p11 = regex_engine.compile(r'^Number\s+of\s+lite\s+sessions\s+currently\s+up\:\s+(?P<lite_sessions_currently_up>\d+)$')
 
         # Number of lite sessions up so far: 32024
-        p12 = re.compile(r'^Number\s+of\s+lite\s+sessions\s+up\s+so\s+far\:\s+(?P<lite_number_of_sessions_up_so_far>\d+)$')
+        p12 = regex_engine.compile(r'^Number\s+of\s+lite\s+sessions\s+up\s+so\s+far\:\s+(?P<lite_number_of_sessions_up_so_far>\d+)$')
 
         # Number of lite sessions converted to full session: 32014
-        p13 = re.compile(r'^Number\s+of\s+lite\s+sessions\s+converted\s+to\s+full\s+session\:\s+(?P<full_session>\d+)$')
+        p13 = regex_engine.compile(r'^Number\s+of\s+lite\s+sessions\s+converted\s+to\s+full\s+session\:\s+(?P<full_session>\d+)$')
 
         # Number of lite sessions conversion in progress: 0
-        p14 = re.compile(r'^Number\s+of\s+lite\s+sessions\s+conversion\s+in\s+progress\:\s+(?P<conversion_in_progress>\d+)$')
+        p14 = regex_engine.compile(r'^Number\s+of\s+lite\s+sessions\s+conversion\s+in\s+progress\:\s+(?P<conversion_in_progress>\d+)$')
 
         # Number of lite sessions failed to convert to dedicated sessions: 5
-        p15 = re.compile(r'^Number\s+of\s+lite\s+sessions\s+failed\s+to\s+convert\s+to\s+dedicated\s+sessions\:\s+(?P<failed_to_convert>\d+)$')
+        p15 = regex_engine.compile(r'^Number\s+of\s+lite\s+sessions\s+failed\s+to\s+convert\s+to\s+dedicated\s+sessions\:\s+(?P<failed_to_convert>\d+)$')
 
         # Number of account logons failed to find lite sessions: 0
-        p16 = re.compile(r'^Number\s+of\s+account\s+logons\s+failed\s+to\s+find\s+lite\s+sessions\:\s+(?P<account_logons_failed>\d+)$')
+        p16 = regex_engine.compile(r'^Number\s+of\s+account\s+logons\s+failed\s+to\s+find\s+lite\s+sessions\:\s+(?P<account_logons_failed>\d+)$')
 
         # Mean call rate per minute: 101, per hour: 6404
-        p17 = re.compile(r'^Mean\s+call\s+rate\s+per\s+minute\:\s+(?P<mean_call_rate_per_minute>\d+),\s+per\s+hour\:\s+(?P<mean_call_rate_per_hour>\d+)$')
+        p17 = regex_engine.compile(r'^Mean\s+call\s+rate\s+per\s+minute\:\s+(?P<mean_call_rate_per_minute>\d+),\s+per\s+hour\:\s+(?P<mean_call_rate_per_hour>\d+)$')
 
         # Number of lite session failed to come up: 0
-        p18 = re.compile(r'^Number\s+of\s+lite\s+session\s+failed\s+to\s+come\s+up\:\s+(?P<number_of_sessions_failed>\d+)$')
+        p18 = regex_engine.compile(r'^Number\s+of\s+lite\s+session\s+failed\s+to\s+come\s+up\:\s+(?P<number_of_sessions_failed>\d+)$')
 
         #  PBHK zero: 0
-        p19 = re.compile(r'^PBHK\s+zero\:\s+(?P<pbhk_zero>\d+)$')
+        p19 = regex_engine.compile(r'^PBHK\s+zero\:\s+(?P<pbhk_zero>\d+)$')
 
         #  Default Session not in Connected State 0
-        p20 = re.compile(r'^\s*Default\s+Session\s+not\s+in\s+Connected\s+State\s+(?P<not_in_connected_state>\d+)$')
+        p20 = regex_engine.compile(r'^\s*Default\s+Session\s+not\s+in\s+Connected\s+State\s+(?P<not_in_connected_state>\d+)$')
 
         # Current Flow Statistics:
         # Number of flows currently up: 32
-        p21 = re.compile(r'^Number\s+of\s+flows\s+currently\s+up\:\s+(?P<number_of_flows_currently_up>\d+)$')
+        p21 = regex_engine.compile(r'^Number\s+of\s+flows\s+currently\s+up\:\s+(?P<number_of_flows_currently_up>\d+)$')
 
         # Highest number of flows ever up at one time: 71855
-        p22 = re.compile(r'^Highest\s+number\s+of\s+flows\s+ever\s+up\s+at\s+one\s+time\:\s+(?P<highest_number_of_flows_ever_up>\d+)$')
+        p22 = regex_engine.compile(r'^Highest\s+number\s+of\s+flows\s+ever\s+up\s+at\s+one\s+time\:\s+(?P<highest_number_of_flows_ever_up>\d+)$')
 
         # Mean up-time duration of flows: 00:13:19
-        p23 = re.compile(r'^Mean\s+up\-time\s+duration\s+of\s+flows\:\s+(?P<mean_up_time_duration_flow>(\d+\:\d+\:\d+))$')
+        p23 = regex_engine.compile(r'^Mean\s+up\-time\s+duration\s+of\s+flows\:\s+(?P<mean_up_time_duration_flow>(\d+\:\d+\:\d+))$')
 
         # Number of flows failed to come up: 0
-        p24 = re.compile(r'^Number\s+of\s+flows\s+failed\s+to\s+come\s+up\:\s+(?P<number_of_flows_failed>\d+)$')
+        p24 = regex_engine.compile(r'^Number\s+of\s+flows\s+failed\s+to\s+come\s+up\:\s+(?P<number_of_flows_failed>\d+)$')
 
         # Total number of flows up so far: 160306
-        p25 = re.compile(r'^Total\s+number\s+of\s+flows\s+up\s+so\s+far:\s+(?P<flows_up_so_far>\d+)$')
+        p25 = regex_engine.compile(r'^Total\s+number\s+of\s+flows\s+up\s+so\s+far:\s+(?P<flows_up_so_far>\d+)$')
 
         # Access type based session count:
         # IP-Interface sessions = 2
-        p26 = re.compile(r'^(?P<access_type_sessions>(IP\-Interface|PPP|PPPoE|VPDN))\s+sessions\s+\=\s+(?P<access_type_sessions_count>\d+)$')
+        p26 = regex_engine.compile(r'^(?P<access_type_sessions>(IP\-Interface|PPP|PPPoE|VPDN))\s+sessions\s+\=\s+(?P<access_type_sessions_count>\d+)$')
 
         # IP/DHCP session type count:
         # DHCPv4 sessions = 13271
-        p27 = re.compile(r'^(?P<sessions>(DHCPv4))\s+sessions\s*\=\s*(?P<session_type_count>\d+)$')
+        p27 = regex_engine.compile(r'^(?P<sessions>(DHCPv4))\s+sessions\s*\=\s*(?P<session_type_count>\d+)$')
 
         # Feature Installation Count:
         #                                     Direction
         # Feature Name              None       Inbound    Outbound
         # L4 Redirect               0          4          2
-        p28 = re.compile(r'^(?P<feature_name>(\w+|\w+\s\w+|\w+\s\w+\s\w+))\s+(?P<none>\d+)\s+(?P<direction_inbound>\d+)\s+(?P<direction_outbound>\d+)$')
+        p28 = regex_engine.compile(r'^(?P<feature_name>(\w+|\w+\s\w+|\w+\s\w+\s\w+))\s+(?P<none>\d+)\s+(?P<direction_inbound>\d+)\s+(?P<direction_outbound>\d+)$')
 
         # Switch Id Cleanup Statistics:
         # Number of sessions having invalid SIP handle: 0
-        p29 = re.compile(r'^Number\s+of\s+sessions\s+having\s+invalid\s+SMGR\s+handle\:\s+(?P<invalid_smgr_handle>\d+)$')
+        p29 = regex_engine.compile(r'^Number\s+of\s+sessions\s+having\s+invalid\s+SMGR\s+handle\:\s+(?P<invalid_smgr_handle>\d+)$')
 
         # Number of sessions having invalid policy handle: 0
-        p30 = re.compile(r'^Number\s+of\s+sessions\s+having\s+invalid\s+policy\s+handle\:\s+(?P<invalid_policy_handle>\d+)$')
+        p30 = regex_engine.compile(r'^Number\s+of\s+sessions\s+having\s+invalid\s+policy\s+handle\:\s+(?P<invalid_policy_handle>\d+)$')
 
         # Number of sessions having invalid LTERM handle: 0
-        p31 = re.compile(r'^Number\s+of\s+sessions\s+having\s+invalid\s+LTERM\s+handle\:\s+(?P<invalid_lterm_handle>\d+)$')
+        p31 = regex_engine.compile(r'^Number\s+of\s+sessions\s+having\s+invalid\s+LTERM\s+handle\:\s+(?P<invalid_lterm_handle>\d+)$')
 
         # Number of sessions having invalid SMGR handle: 0
-        p32 = re.compile(r'^Number\s+of\s+sessions\s+having\s+invalid\s+SIP\s+handle\:\s+(?P<invalid_sip_handle>\d+)$')
+        p32 = regex_engine.compile(r'^Number\s+of\s+sessions\s+having\s+invalid\s+SIP\s+handle\:\s+(?P<invalid_sip_handle>\d+)$')
 
         # Lterm session delete errors:
         # L2hw Switch:   17
-        p33 = re.compile(r'^L2hw\s+Switch:\s+(?P<l2hw_switch>\d+)$')
+        p33 = regex_engine.compile(r'^L2hw\s+Switch:\s+(?P<l2hw_switch>\d+)$')
 
         # SHDBs in use    : 8
-        p34 = re.compile(r'^SHDBs\s+in\s+use\s+\:\s+(?P<shdbs_in_use>\d+)$')
+        p34 = regex_engine.compile(r'^SHDBs\s+in\s+use\s+\:\s+(?P<shdbs_in_use>\d+)$')
 
         # SHDBs allocated : 64132
-        p35 = re.compile(r'^SHDBs\s+allocated\s+\:\s+(?P<shdbs_allocated>\d+)$')
+        p35 = regex_engine.compile(r'^SHDBs\s+allocated\s+\:\s+(?P<shdbs_allocated>\d+)$')
 
         # SHDBs freed     : 64124
-        p36 = re.compile(r'^SHDBs\s+freed\s+\:\s+(?P<shdbs_freed>\d+)$')
+        p36 = regex_engine.compile(r'^SHDBs\s+freed\s+\:\s+(?P<shdbs_freed>\d+)$')
 
         # SHDB handles associated with each client type
 
@@ -401,7 +403,7 @@ class ShowSubscriberStatistics(ShowSubscriberStatisticsSchema):
         # CCM            2
         # SSS FM         8
         # IPSUB          0
-        p37 = re.compile(r'^(?P<client_name>(\w+|\w+\s{0,1}\w*))\s+(?P<count>\d+)$')
+        p37 = regex_engine.compile(r'^(?P<client_name>(\w+|\w+\s{0,1}\w*))\s+(?P<count>\d+)$')
 
         mean_call_count = 0
 
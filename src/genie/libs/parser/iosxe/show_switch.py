@@ -2,11 +2,13 @@
 show switch stack-ports summary
 show switch stack-ports
 '''
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # import parser utils
 
 class ShowSwitchStackPortsSummarySchema(MetaParser):
@@ -51,15 +53,15 @@ class ShowSwitchStackPortsSummary(ShowSwitchStackPortsSummarySchema):
         
         # index = 0
 
-        p1 = re.compile(r"^(?P<stackport_id>\S+)"
-                        r" +(?P<port_status>\w+)"
-                        r" +(?P<neighbor>[\d+])"
-                        r" +(?P<cable_length>\w+)"
-                        r" +(?P<link_ok>\w+)"
-                        r" +(?P<link_active>\w+)"
-                        r" +(?P<sync_ok>\w+)"
-                        r" +(?P<link_changes_count>\d+)"
-                        r" +(?P<in_loopback>\w+)")
+        p1 = regex_engine.compile(r"^(?P<stackport_id>\S+)"
+                                  r" +(?P<port_status>\w+)"
+                                  r" +(?P<neighbor>[\d+])"
+                                  r" +(?P<cable_length>\w+)"
+                                  r" +(?P<link_ok>\w+)"
+                                  r" +(?P<link_active>\w+)"
+                                  r" +(?P<sync_ok>\w+)"
+                                  r" +(?P<link_changes_count>\d+)"
+                                  r" +(?P<in_loopback>\w+)")
 
         for line in output.splitlines():
             line = line.strip()
@@ -116,7 +118,7 @@ class ShowSwitchStackPorts(ShowSwitchStackPortsSchema):
             output = self.device.execute(self.cli_command)
 
         # 1         OK        OK
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<switch_number>\d+)\s+(?P<port_1>\w+)\s+(?P<port_2>\w+)$")
 
         ret_dict = {}
@@ -162,7 +164,7 @@ class ShowSwitchStackBandwidth(ShowSwitchStackBandwidthSchema):
 
         # *1       Active    160G        Ready
         #  2       Standby    N/A        Removed
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"\*?(?P<sw_no>\d+)\s+(?P<role>\w+)\s+(?P<stack_bw>[\w\/]+)\s+(?P<current_state>\w+)$")
 
         ret_dict = {}
@@ -1,5 +1,5 @@
-import re
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (And, Any, Default, Optional,
@@ -38,7 +38,7 @@ class ShowSwitchStackMode(ShowSwitchStackModeSchema):
 
         # *1      Active   4cbc.4897.ec80    V00     N+1     None       Ready
         # *1      Active   00a5.bf53.d400    V02     N+1'    Active'    Ready               
-        p1 = re.compile(r"\s*\**(?P<switch_id>\d+)\s+(?P<role>\w+)\s+(?P<mac_address>\S+)\s+(?P<version>\S+)\s+(?P<mode>\S+)\s+(?P<configured>\w+)\'?\s+(?P<state>\w+)\s+$")
+        p1 = regex_engine.compile(r"\s*\**(?P<switch_id>\d+)\s+(?P<role>\w+)\s+(?P<mac_address>\S+)\s+(?P<version>\S+)\s+(?P<mode>\S+)\s+(?P<configured>\w+)\'?\s+(?P<state>\w+)\s+$")
 
         ret_dict = {}
 
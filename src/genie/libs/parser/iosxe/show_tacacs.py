@@ -4,12 +4,12 @@
      *  show tacacs private
      *  show tacacs public
 """
-#python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema,Any,Optional,Or,And,Default,Use
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # ==================================================
@@ -68,49 +68,49 @@ class ShowTacacs(ShowTacacsSchema):
 
         # initial regexp patterns
         # Tacacs+ Server -  public  :
-        p1 = re.compile(r'(Tacacs\+?)\s+(Server)\s+\-\s+(\w+)\s*\:')
+        p1 = regex_engine.compile(r'(Tacacs\+?)\s+(Server)\s+\-\s+(\w+)\s*\:')
 
         # Server name: ISE-TAC
-        p2=re.compile(r'Server\s+name\:\s*(?P<server_name>(.*))')
+        p2=regex_engine.compile(r'Server\s+name\:\s*(?P<server_name>(.*))')
 
         # Server address: 11.14.24.174
-        p3=re.compile(r'Server\s+address\:\s*(?P<server_address>(.*))')
+        p3=regex_engine.compile(r'Server\s+address\:\s*(?P<server_address>(.*))')
 
         # Server port: 49
-        p4=re.compile(r'Server\s+port\:\s*(?P<server_port>(.*))')
+        p4=regex_engine.compile(r'Server\s+port\:\s*(?P<server_port>(.*))')
 
         # Socket opens:          0
-        p5= re.compile(r'Socket\s+opens\:\s*(?P<socket_opens>(\d+))')
+        p5= regex_engine.compile(r'Socket\s+opens\:\s*(?P<socket_opens>(\d+))')
 
         # Socket closes:          0
-        p6= re.compile(r'Socket\s+closes\:\s*(?P<socket_closes>(\d+))')
+        p6= regex_engine.compile(r'Socket\s+closes\:\s*(?P<socket_closes>(\d+))')
 
         # Socket aborts:         0
-        p7 = re.compile(r'Socket\s+aborts\:\s*(?P<socket_aborts>(\d+))')
+        p7 = regex_engine.compile(r'Socket\s+aborts\:\s*(?P<socket_aborts>(\d+))')
 
         # Socket errors:         0
-        p8 = re.compile(r'Socket\s+errors\:\s*(?P<socket_errors>(\d+))')
+        p8 = regex_engine.compile(r'Socket\s+errors\:\s*(?P<socket_errors>(\d+))')
 
         # Socket Timeouts:       0
-        p9 = re.compile(r'Socket\s+Timeouts\:\s*(?P<socket_timeouts>(\d+))')
+        p9 = regex_engine.compile(r'Socket\s+Timeouts\:\s*(?P<socket_timeouts>(\d+))')
 
         # Failed Connect Attempts:          0
-        p10 = re.compile(r'\s*Failed\s+Connect\s+Attempts\:\s*(?P<failed_connect_attempts>(\d+))')
+        p10 = regex_engine.compile(r'\s*Failed\s+Connect\s+Attempts\:\s*(?P<failed_connect_attempts>(\d+))')
 
         # Total Packets Sent:          0
-        p11 = re.compile(r'Total\s+Packets\s+Sent\:\s*(?P<total_packets_sent>(\d+))')
+        p11 = regex_engine.compile(r'Total\s+Packets\s+Sent\:\s*(?P<total_packets_sent>(\d+))')
 
         # Total Packets Recv:          0
-        p12 = re.compile(r'Total\s+Packets\s+Recv\:\s*(?P<total_packets_recv>(\d+))')
+        p12 = regex_engine.compile(r'Total\s+Packets\s+Recv\:\s*(?P<total_packets_recv>(\d+))')
 
         # Server Status: Alive
-        p13 = re.compile(r'Server\s+Status\:\s*(?P<server_status>(\w+))')
+        p13 = regex_engine.compile(r'Server\s+Status\:\s*(?P<server_status>(\w+))')
 
         # Continous Authc fail count:          0
-        p14 = re.compile(r'Continous\s+Authc\s+fail\s+count\:\s*(?P<continous_authc_fail_count>(\d+))')
+        p14 = regex_engine.compile(r'Continous\s+Authc\s+fail\s+count\:\s*(?P<continous_authc_fail_count>(\d+))')
 
         # Continous Authz fail count:          0
-        p15 = re.compile(r'Continous\s+Authz\s+fail\s+count\:\s*(?P<continous_authz_fail_count>(\d+))')
+        p15 = regex_engine.compile(r'Continous\s+Authz\s+fail\s+count\:\s*(?P<continous_authz_fail_count>(\d+))')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5,6 +5,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowTcpproxyStatusSchema(MetaParser):
     ''' Schema for show tcpproxy status'''
     schema = {
@@ -38,10 +41,10 @@ class ShowTcpproxyStatus(ShowTcpproxyStatusSchema):
         last_dict_ptr = {}
 
         # Configuration
-        p1 = re.compile(r'^Configuration$')
+        p1 = regex_engine.compile(r'^Configuration$')
 
         # Status
-        p2 = re.compile(r'^Status$')
+        p2 = regex_engine.compile(r'^Status$')
 
         # VPG Name            : VirtualPortGroup2
         # VPG IP Addr         : 192.168.2.1
@@ -49,7 +52,7 @@ class ShowTcpproxyStatus(ShowTcpproxyStatusSchema):
         # SNG Name            : SNG-APPQOE
         # SNG IP Addr         : 192.168.2.2
         # Operational State   : RUNNING
-        p3 = re.compile(r'^(?P<key>[\s\S]+\w) +: +(?P<value>[\s\S]+)$')
+        p3 = regex_engine.compile(r'^(?P<key>[\s\S]+\w) +: +(?P<value>[\s\S]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -279,7 +282,7 @@ class ShowTcpProxyStatistics(ShowTcpProxyStatisticsSchema):
             output = self.device.execute(self.cli_command)
 
         # TCP Proxy Statistics
-        p1 = re.compile(r'^TCP +Proxy +Statistics$')
+        p1 = regex_engine.compile(r'^TCP +Proxy +Statistics$')
 
         # Total Connections                   : 32420
         # Max Concurrent Connections          : 1466
@@ -428,7 +431,7 @@ class ShowTcpProxyStatistics(ShowTcpProxyStatisticsSchema):
         # AOIM Sync Started : 0
         # AOIM Sync Completed : 0
         # AOIM Sync Errored : 0
-        p2 = re.compile(r'^(?P<key>[\s\S]+\S)(\s+:|:) +(?P<value>[\d]+)$')
+        p2 = regex_engine.compile(r'^(?P<key>[\s\S]+\S)(\s+:|:) +(?P<value>[\d]+)$')
 
         parsed_dict = {}
         last_dict_ptr = {}
@@ -1,10 +1,10 @@
 """show_techsupport.py
    IOSXE parsers for the following show commands:
      *  show tech-support | i show
-"""
-# python
-import re
 
+   Full show tech-support bundles are split and parsed section by section
+   with genie.libs.parser.utils.techsupport.parse_tech_support
+"""
 # Metaparser
 from genie.metaparser import MetaParser
 from genie import parsergen
@@ -12,6 +12,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, D
 
 # pyATS
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowTechSupportIncludeShowSchema(MetaParser):
@@ -36,7 +37,7 @@ class ShowTechSupportIncludeShow(ShowTechSupportIncludeShowSchema):
 
         # ------------------ show vlan virtual-port -------------------
         # ------------------ show interfaces history ------------------
-        p1 = re.compile(r"^-+\s(?P<command>[\w\.\:\-\s]+)\s-+$")
+        p1 = regex_engine.compile(r"^-+\s(?P<command>[\w\.\:\-\s]+)\s-+$")
 
         ret_dict = {}
 
@@ -42,6 +42,9 @@ from genie import parsergen
 # pyATS
 from pyats.utils.exceptions import SchemaTypeError
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowTelemetryIETFSubscriptionSchema(MetaParser):
     '''schema for:
         * show telemetry ietf subscription all
@@ -119,11 +122,11 @@ class ShowTelemetryIETFSubscription(ShowTelemetryIETFSubscriptionSchema):
                 ))
         
         # 2147483659       Dynamic     Valid       xpath
-        p = re.compile(r'^(?P<id>\d+) +(?P<type>\S+) +(?P<state>\S+) +(?P<filter_type>\S+)$')
+        p = regex_engine.compile(r'^(?P<id>\d+) +(?P<type>\S+) +(?P<state>\S+) +(?P<filter_type>\S+)$')
 
         #New format was added as 17.7
         #ID         Type       State      State Description
-        pNew = re.compile(r'^(?P<id>\d+) +(?P<type>\S+) +(?P<state>\S+) *(?P<state_description>.*)$')
+        pNew = regex_engine.compile(r'^(?P<id>\d+) +(?P<type>\S+) +(?P<state>\S+) *(?P<state_description>.*)$')
         isLatestFormat = False
 
         if con_idx:
@@ -226,46 +229,46 @@ class ShowTelemetryIETFSubscriptionDetail(ShowTelemetryIETFSubscriptionSchema):
             ))
         
         # Subscription ID: 2147483659
-        p1 = re.compile(r'^Subscription +ID: +(?P<id>\d+)$')
+        p1 = regex_engine.compile(r'^Subscription +ID: +(?P<id>\d+)$')
 
         # State: Valid
-        p2 = re.compile(r'^State: +(?P<state>\S+)$')
+        p2 = regex_engine.compile(r'^State: +(?P<state>\S+)$')
 
         # Stream: yang-push
-        p3 = re.compile(r'^Stream: +(?P<stream>\S+)$')
+        p3 = regex_engine.compile(r'^Stream: +(?P<stream>\S+)$')
 
         #     Filter type: xpath
-        p4 = re.compile(r'^Filter +type: +(?P<filter>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^Filter +type: +(?P<filter>[\S\s]+)$')
 
         #     XPath: /if:interfaces-state/interface/oper-status
-        p5 = re.compile(r'^XPath: +(?P<xpath>\S+)$')
+        p5 = regex_engine.compile(r'^XPath: +(?P<xpath>\S+)$')
 
         #     Update Trigger: periodic
-        p6 = re.compile(r'^Update +Trigger: +(?P<trigger>[\S\s]+)$')
+        p6 = regex_engine.compile(r'^Update +Trigger: +(?P<trigger>[\S\s]+)$')
 
         #     Period: 1000
-        p7 = re.compile(r'^Period: +(?P<period>\d+)$')
+        p7 = regex_engine.compile(r'^Period: +(?P<period>\d+)$')
 
         #     Synch on start: No
-        p7_1 = re.compile(r'^Synch +on +start: +(?P<sync>\S+)$')
+        p7_1 = regex_engine.compile(r'^Synch +on +start: +(?P<sync>\S+)$')
 
         #     Dampening period: 0
-        p7_2 = re.compile(r'^Dampening +period: +(?P<period>\d+)$')
+        p7_2 = regex_engine.compile(r'^Dampening +period: +(?P<period>\d+)$')
 
         # Encoding: encode-xml
-        p8 = re.compile(r'^Encoding: +(?P<encoding>\S+)$')
+        p8 = regex_engine.compile(r'^Encoding: +(?P<encoding>\S+)$')
 
         # Source VRF:
-        p9 = re.compile(r'^Source +VRF: +(?P<source>\S+)$')
+        p9 = regex_engine.compile(r'^Source +VRF: +(?P<source>\S+)$')
 
         # Source Address:
-        p10 = re.compile(r'^Source +Address: +(?P<address>\S+)$')
+        p10 = regex_engine.compile(r'^Source +Address: +(?P<address>\S+)$')
 
         # Notes:
-        p11 = re.compile(r'^Notes: +(?P<notes>\S+)$')
+        p11 = regex_engine.compile(r'^Notes: +(?P<notes>\S+)$')
 
         #     10.69.35.35                                 45128    netconf
-        p12 = re.compile(r'^(?P<address>\S+) +(?P<port>\d+) +(?P<protocol>\S+)( +(?P<protocol_profile>\S+))?$')
+        p12 = regex_engine.compile(r'^(?P<address>\S+) +(?P<port>\d+) +(?P<protocol>\S+)( +(?P<protocol_profile>\S+))?$')
 
 
         ret_dict = dict()
@@ -456,11 +459,11 @@ class ShowTelemetryIETFSubscriptionAllReceivers(ShowTelemetryIETFSubscriptionAll
 
         ret_dict = dict()
         # 101              grpc-tcp                           0      Resolving      Resolution request in progress
-        p1 = re.compile(r'^(?P<id>\d+) +'
-                        r'(?P<name>\S+) +'
-                        r'(?P<connection>\S+) +'
-                        r'(?P<state>.\S+) *'
-                        r'(?P<explanation>.*)$')
+        p1 = regex_engine.compile(r'^(?P<id>\d+) +'
+                                  r'(?P<name>\S+) +'
+                                  r'(?P<connection>\S+) +'
+                                  r'(?P<state>.\S+) *'
+                                  r'(?P<explanation>.*)$')
 
 
         for line in out.splitlines():
@@ -527,33 +530,33 @@ class ShowTelemetryIETFSubscriptionReceiver(ShowTelemetryIETFSubscriptionReceive
             output = self.device.execute(cmd)
         
         # Subscription ID: 2147483659
-        p1 = re.compile(r'^Subscription +ID: +(?P<id>\d+)$')
+        p1 = regex_engine.compile(r'^Subscription +ID: +(?P<id>\d+)$')
 
         # Address: 10.69.35.35
-        p2 = re.compile(r'^Address: +(?P<address>\S+)$')
+        p2 = regex_engine.compile(r'^Address: +(?P<address>\S+)$')
 
         # Port: 45128
-        p3 = re.compile(r'^Port: +(?P<port>\d+)$')
+        p3 = regex_engine.compile(r'^Port: +(?P<port>\d+)$')
 
         # Protocol: netconf
-        p4 = re.compile(r'^Protocol: +(?P<protocol>\S+)$')
+        p4 = regex_engine.compile(r'^Protocol: +(?P<protocol>\S+)$')
 
         # Profile: 
-        p5 = re.compile(r'^Profile: +(?P<profile>\S+)$')
+        p5 = regex_engine.compile(r'^Profile: +(?P<profile>\S+)$')
 
         # Connection: 11
-        p6 = re.compile(r'^Connection: +(?P<connection>\S+)$')
+        p6 = regex_engine.compile(r'^Connection: +(?P<connection>\S+)$')
 
         # State: Valid
         # State: Transport Requested
         # State: Valid
-        p7 = re.compile(r'^State: +(?P<state>.*)$')
+        p7 = regex_engine.compile(r'^State: +(?P<state>.*)$')
 
         # Explanation:
-        p8 = re.compile(r'^Explanation: *(?P<explanation>.*)$')
+        p8 = regex_engine.compile(r'^Explanation: *(?P<explanation>.*)$')
 
         # Name: grpc-tcp
-        p9 = re.compile(r'^Name: +(?P<name>\S+)$')
+        p9 = regex_engine.compile(r'^Name: +(?P<name>\S+)$')
 
         ret_dict = dict()
 
@@ -674,12 +677,12 @@ class ShowTelemetryInternalConnection(ShowTelemetryInternalConnectionSchema):
         # 10.37.174.7    25103   0 10.8.138.4      tls-native Active        sdn-network-101-wan
 
         # 10.37.174.7    25103   0 10.8.138.4      tls-native Active        sdn-network-101-wan
-        no_index_capture = re.compile(
+        no_index_capture = regex_engine.compile(
             r"^(?P<peer_address>[\d.]+)\s+(?P<port>\d+)\s+(?P<vrf>\d+)\s+(?P<source_address>[\d.]+)\s+(?P<transport>\S+)\s+(?P<state>\S+)\s+(?P<profile>\S+)$"
         )
 
         # 6 10.10.76.186              20830   0 10.64.47.177               Active
-        index_capture = re.compile(
+        index_capture = regex_engine.compile(
             r"(?P<index>\d+)\s+(?P<peer_address>[\d.]+)\s+(?P<port>\d+)\s+(?P<vrf>\d+)\s+(?P<source_address>[\d.]+)\s+(?P<state>\S+)"
         )
 
@@ -815,43 +818,43 @@ class ShowTelemetryConnectionDetail(ShowTelemetryConnectionSchema):
         ret_dict = {}
 
         #Index             : 0
-        p1 = re.compile(r'^Index *: *(?P<idx>\d*)$')
+        p1 = regex_engine.compile(r'^Index *: *(?P<idx>\d*)$')
 
         #Peer Address      : 5.40.26.169
-        p2 = re.compile(r'^Peer +Address *: *(?P<peer_addr>\S*)$')
+        p2 = regex_engine.compile(r'^Peer +Address *: *(?P<peer_addr>\S*)$')
 
         #Port              : 49066
-        p3 = re.compile(r'^Port *: *(?P<port>\d*)$')
+        p3 = regex_engine.compile(r'^Port *: *(?P<port>\d*)$')
 
         #VRF               : 0
-        p4 = re.compile(r'^VRF *: *(?P<vrf>\d*)$')
+        p4 = regex_engine.compile(r'^VRF *: *(?P<vrf>\d*)$')
 
         #Source Address    : 0.0.0.0
-        p5 = re.compile(r'^Source +Address *: *(?P<source_addr>\S*)$')
+        p5 = regex_engine.compile(r'^Source +Address *: *(?P<source_addr>\S*)$')
 
         #Type              : PROTOCOL
-        p6 = re.compile(r'^Type *: *(?P<type>\S*)$')
+        p6 = regex_engine.compile(r'^Type *: *(?P<type>\S*)$')
 
         #State             : Active
-        p7 = re.compile(r'^State *: *(?P<state>\S*)$')
+        p7 = regex_engine.compile(r'^State *: *(?P<state>\S*)$')
 
         #State Description : Connection created for protocol netconf
-        p8 = re.compile(r'^State +Description *: *(?P<state_description>.*)$')
+        p8 = regex_engine.compile(r'^State +Description *: *(?P<state_description>.*)$')
 
         #Peer ID           : admin
-        p9 = re.compile(r'^Peer +ID *: *(?P<peer_id>\S*)$')
+        p9 = regex_engine.compile(r'^Peer +ID *: *(?P<peer_id>\S*)$')
 
         #Receiver Name     :
-        p10 = re.compile(r'^Receiver +Name *: *(?P<receiver_name>\S*)$')
+        p10 = regex_engine.compile(r'^Receiver +Name *: *(?P<receiver_name>\S*)$')
 
         #Transport         : netconf
-        p11 = re.compile(r'^Transport *: *(?P<transport>\S*)$')
+        p11 = regex_engine.compile(r'^Transport *: *(?P<transport>\S*)$')
 
         #Use Count         : 1
-        p12 = re.compile(r'^Use +Count *: *(?P<use_count>\d*)$')
+        p12 = regex_engine.compile(r'^Use +Count *: *(?P<use_count>\d*)$')
 
         #State Change Time : 10/26/21 17:27:31
-        p13 = re.compile(r'^State +Change +Time *: +(?P<state_change_time>.*)$')
+        p13 = regex_engine.compile(r'^State +Change +Time *: +(?P<state_change_time>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1037,19 +1040,19 @@ class ShowTelemetryInternalSensor(ShowTelemetryInternalSensorSchema):
                 return {}
 
         # Subscription ID: 2147483659
-        p1 = re.compile(r'^Subscription +ID: *(?P<sub_id>\d*)$')
+        p1 = regex_engine.compile(r'^Subscription +ID: *(?P<sub_id>\d*)$')
 
         #  Sensor Type: yang-push periodic
-        p2 = re.compile(r'^Sensor +Type: *(?P<sensor_type>.*)$')
+        p2 = regex_engine.compile(r'^Sensor +Type: *(?P<sensor_type>.*)$')
 
         #    Filter type: xpath
-        p3 = re.compile(r'^Filter +type: *(?P<filter_type>\S*)$')
+        p3 = regex_engine.compile(r'^Filter +type: *(?P<filter_type>\S*)$')
 
         #    Filter selector: /if:interfaces-state/interface[name="GigabitEthernet0/0"]/oper-status
-        p4 = re.compile(r'^Filter +selector: *(?P<filter_selector>\S*)$')
+        p4 = regex_engine.compile(r'^Filter +selector: *(?P<filter_selector>\S*)$')
 
         #    DC: confd periodic, SubFilter: /if:interfaces-state/interface[name="GigabitEthernet0/0"]/oper-status
-        p5 = re.compile(r'^DC: *(?P<dc_type>.*), SubFilter: *(?P<sub_filter>\S*)$')
+        p5 = regex_engine.compile(r'^DC: *(?P<dc_type>.*), SubFilter: *(?P<sub_filter>\S*)$')
 
         ret_dict = dict()
         dcCtr = 0
@@ -1139,31 +1142,31 @@ class ShowTelemetryReceiverName(ShowTelemetryReceiverNameSchema):
             ))
 
         #Name: test0
-        p1 = re.compile(r"^Name:\s*(?P<name>\S*)$")
+        p1 = regex_engine.compile(r"^Name:\s*(?P<name>\S*)$")
 
         #Profile:
-        p2 = re.compile(r"^Profile:\s*(?P<profile>\S*)$")
+        p2 = regex_engine.compile(r"^Profile:\s*(?P<profile>\S*)$")
 
         #State: Valid
-        p3 = re.compile(r"^State:\s*(?P<state>\S*)$")
+        p3 = regex_engine.compile(r"^State:\s*(?P<state>\S*)$")
 
         #State Description:
-        p4 = re.compile(r"^State Description:\s*(?P<state_description>\S*)$")
+        p4 = regex_engine.compile(r"^State Description:\s*(?P<state_description>\S*)$")
 
         #Last State Change: 10/26/21 17:55:47
-        p5 = re.compile(r"^Last State Change:\s*(?P<last_change>\S* *\S*)$")
+        p5 = regex_engine.compile(r"^Last State Change:\s*(?P<last_change>\S* *\S*)$")
 
         #Type: protocol
-        p6 = re.compile(r"^Type:\s*(?P<type>\S*)$")
+        p6 = regex_engine.compile(r"^Type:\s*(?P<type>\S*)$")
 
         #Protocol: native
-        p7 = re.compile(r"^Protocol:\s*(?P<protocol>\S*)$")
+        p7 = regex_engine.compile(r"^Protocol:\s*(?P<protocol>\S*)$")
 
         #Host: 161.44.223.172
-        p8 = re.compile(r"^Host:\s*(?P<host>\S*)$")
+        p8 = regex_engine.compile(r"^Host:\s*(?P<host>\S*)$")
 
         #Port: 123
-        p9 = re.compile(r"^Port:\s*(?P<port>\S*)$")
+        p9 = regex_engine.compile(r"^Port:\s*(?P<port>\S*)$")
 
         ret_dict = dict()
 
@@ -1280,7 +1283,7 @@ class ShowTelemetryIETFSubscriptionSummary(ShowTelemetryIETFSubscriptionSummaryS
             output = self.device.execute(self.cli_command)
 
         # Maximum supported: 128
-        p1 = re.compile(r'^Maximum +supported: +(?P<max_supported>[0-9]+)$')
+        p1 = regex_engine.compile(r'^Maximum +supported: +(?P<max_supported>[0-9]+)$')
 
         # Subscription     Total       Valid      Invalid
         # -----------------------------------------------
@@ -1288,8 +1291,8 @@ class ShowTelemetryIETFSubscriptionSummary(ShowTelemetryIETFSubscriptionSummaryS
         # Dynamic          0           0          0
         # Configured       0           0          0
         # Permanent        0           0          0
-        p2 = re.compile(r'^(?P<type>(All|Dynamic|Configured|Permanent)+) +(?P<total>[0-9]+) +'
-                        r'(?P<valid>[0-9]+) +(?P<invalid>[0-9]+)$')
+        p2 = regex_engine.compile(r'^(?P<type>(All|Dynamic|Configured|Permanent)+) +(?P<total>[0-9]+) +'
+                                  r'(?P<valid>[0-9]+) +(?P<invalid>[0-9]+)$')
 
         ret_dict = dict()
 
@@ -1376,82 +1379,82 @@ class ShowTelemetryInternalProtocolManager(ShowTelemetryInternalProtocolManagerS
                                                                     source_ip=source_ip))
 
         #Con str                : 161.44.237.28:45000:0:172.16.0.6
-        p1 = re.compile(r'^Con str *: *(?P<con_str>\S*)$')
+        p1 = regex_engine.compile(r'^Con str *: *(?P<con_str>\S*)$')
 
         #Sockfd                 : 138
-        p2 = re.compile(r'^Sockfd *: *(?P<sock_fd>-?\d*)$')
+        p2 = regex_engine.compile(r'^Sockfd *: *(?P<sock_fd>-?\d*)$')
 
         #Protocol               : native
-        p3 = re.compile(r'^Protocol *: *(?P<protocol>\S*)$')
+        p3 = regex_engine.compile(r'^Protocol *: *(?P<protocol>\S*)$')
 
         #State                  : CNDP_STATE_CONNECTED
-        p4 = re.compile(r'^State *: *(?P<state>\w*)$')
+        p4 = regex_engine.compile(r'^State *: *(?P<state>\w*)$')
 
         #Version                :
-        p5 = re.compile(r'^Version *: *(?P<version>\S*)$')
+        p5 = regex_engine.compile(r'^Version *: *(?P<version>\S*)$')
 
         #Profile                :
-        p6 = re.compile(r'^Profile *: *(?P<profile>\S*)$')
+        p6 = regex_engine.compile(r'^Profile *: *(?P<profile>\S*)$')
 
         #Table id               : 0
-        p7 = re.compile(r'^Table id *: *(?P<table_id>\d*)$')
+        p7 = regex_engine.compile(r'^Table id *: *(?P<table_id>\d*)$')
 
         #Wait Mask              :
-        p8 = re.compile(r'^Wait Mask *: *(?P<wait_mask>\S*)$')
+        p8 = regex_engine.compile(r'^Wait Mask *: *(?P<wait_mask>\S*)$')
 
         #Connection Retries     : 0
-        p9 = re.compile(r'^Connection Retries *: *(?P<con_retries>\d*)$')
+        p9 = regex_engine.compile(r'^Connection Retries *: *(?P<con_retries>\d*)$')
 
         #Send Retries           : 0
-        p10 = re.compile(r'^Send Retries *: *(?P<send_retries>\d*)$')
+        p10 = regex_engine.compile(r'^Send Retries *: *(?P<send_retries>\d*)$')
 
         #Pending events         : 0
-        p11 = re.compile(r'^Pending events *: *(?P<pending_events>\d*)$')
+        p11 = regex_engine.compile(r'^Pending events *: *(?P<pending_events>\d*)$')
 
         #Session requests       : 1
-        p12 = re.compile(r'^Session requests *: *(?P<session_reqs>\d*)$')
+        p12 = regex_engine.compile(r'^Session requests *: *(?P<session_reqs>\d*)$')
 
         #Session replies        : 1
-        p13 = re.compile(r'^Session replies *: *(?P<session_resp>\d*)$')
+        p13 = regex_engine.compile(r'^Session replies *: *(?P<session_resp>\d*)$')
 
         #Source ip              : 172.16.0.6
-        p14 = re.compile(r'^Source ip *: *(?P<source_ip>\S*)$')
+        p14 = regex_engine.compile(r'^Source ip *: *(?P<source_ip>\S*)$')
 
         #Bytes Sent             : 4835
-        p15 = re.compile(r'^Bytes Sent *: *(?P<bytes_sent>\d*)$')
+        p15 = regex_engine.compile(r'^Bytes Sent *: *(?P<bytes_sent>\d*)$')
 
         #Msgs Sent              : 8
-        p16 = re.compile(r'^Msgs Sent *: *(?P<msgs_sent>\d*)$')
+        p16 = regex_engine.compile(r'^Msgs Sent *: *(?P<msgs_sent>\d*)$')
 
         #Msgs Received          : 0
-        p17 = re.compile(r'^Msgs Received *: *(?P<msgs_recv>\d*)$')
+        p17 = regex_engine.compile(r'^Msgs Received *: *(?P<msgs_recv>\d*)$')
 
         #Bytes in queue         : 0
-        p18 = re.compile(r'^Bytes in queue *: *(?P<bytes_queued>\d*)$')
+        p18 = regex_engine.compile(r'^Bytes in queue *: *(?P<bytes_queued>\d*)$')
 
         #Creation time:         : Mon Jan 15 21:49:23:54
-        p19 = re.compile(r'^Creation time: *: *(?P<creation_time>.*)$')
+        p19 = regex_engine.compile(r'^Creation time: *: *(?P<creation_time>.*)$')
 
         #Last connected time:   : Mon Jan 15 21:49:23:59
-        p20 = re.compile(r'^Last connected time: *: *(?P<last_con_time>.*)$')
+        p20 = regex_engine.compile(r'^Last connected time: *: *(?P<last_con_time>.*)$')
 
         #Last disconnect time:  :
-        p21 = re.compile(r'^Last disconnect time: *: *(?P<last_discon_time>.*)$')
+        p21 = regex_engine.compile(r'^Last disconnect time: *: *(?P<last_discon_time>.*)$')
 
         #Last error:            :
-        p22 = re.compile(r'^Last error: *: *(?P<last_error>.*)$')
+        p22 = regex_engine.compile(r'^Last error: *: *(?P<last_error>.*)$')
 
         #Connection flaps:      : 0
-        p23 = re.compile(r'^Connection flaps: *: *(?P<con_flaps>\d*)$')
+        p23 = regex_engine.compile(r'^Connection flaps: *: *(?P<con_flaps>\d*)$')
 
         #Last flap Reason:      :
-        p24 = re.compile(r'^Last flap reason: *: *(?P<last_flap_reason>.*)$')
+        p24 = regex_engine.compile(r'^Last flap reason: *: *(?P<last_flap_reason>.*)$')
 
         #Keep Alive Timeouts:   : 0
-        p25 = re.compile(r'^Keep Alive Timeouts: *: *(?P<keep_alive_timeouts>\d*)$')
+        p25 = regex_engine.compile(r'^Keep Alive Timeouts: *: *(?P<keep_alive_timeouts>\d*)$')
 
         #Last Transport Error   :
-        p26 = re.compile(r'^Last Transport Error *: *(?P<last_transport_error>.*)$')
+        p26 = regex_engine.compile(r'^Last Transport Error *: *(?P<last_transport_error>.*)$')
 
         ret_dict = dict()
 
@@ -8,9 +8,6 @@ IOSXE parsers for the following commands
     * show auto configuration template builtin
 '''
 
-# python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie import parsergen
@@ -18,6 +15,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, D
 
 # pyATS
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -50,16 +48,16 @@ class ShowTemplate(ShowTemplateSchema):
             output = self.device.execute(self.cli_command)
 
         # --------                                         -----      ----
-        p1 = re.compile(r"-{3}")
+        p1 = regex_engine.compile(r"-{3}")
 
         # AP_INTERFACE_TEMPLATE                            owner      Built-in
-        p2 = re.compile(r"^(?P<template>\S+)\s+(?P<class>\w+)\s+(?P<type>\S+)$")
+        p2 = regex_engine.compile(r"^(?P<template>\S+)\s+(?P<class>\w+)\s+(?P<type>\S+)$")
 
         #  BOUND: Twe1/0/1               Twe1/0/2               Twe1/0/3
-        p3 = re.compile(r'^\sBOUND:\s+(?P<bound>(.|\n)*)$')
+        p3 = regex_engine.compile(r'^\sBOUND:\s+(?P<bound>(.|\n)*)$')
 
         # NESTED TEMPLATE:  Child
-        p4 = re.compile(r'^\sNESTED TEMPLATE:\s+(?P<nested_template>\S+)$')
+        p4 = regex_engine.compile(r'^\sNESTED TEMPLATE:\s+(?P<nested_template>\S+)$')
 
         ret_dict = {}
         temp_flag = False
@@ -112,10 +110,10 @@ class ShowTemplateInterfaceSourceBuiltInOriginalAll(ShowTemplateInterfaceSourceB
             output = self.device.execute(self.cli_command)
 
         # Template Name:   IP_PHONE_INTERFACE_TEMPLATE
-        p1 = re.compile(r'^Template Name:\s+(?P<template>\w+)$')
+        p1 = regex_engine.compile(r'^Template Name:\s+(?P<template>\w+)$')
 
         # Template Definition:
-        p2 = re.compile(r'^Template Definition:$')
+        p2 = regex_engine.compile(r'^Template Definition:$')
 
         # switchport mode access
         # switchport block unicast
@@ -124,7 +122,7 @@ class ShowTemplateInterfaceSourceBuiltInOriginalAll(ShowTemplateInterfaceSourceB
         # spanning-tree bpduguard enable
         # service-policy input AutoConf-4.0-Trust-Dscp-Input-Policy
         # service-policy output AutoConf-4.0-Output-Policy
-        p3 = re.compile(r'^(?P<definition>.+)$')
+        p3 = regex_engine.compile(r'^(?P<definition>.+)$')
 
         ret_dict = dict()
 
@@ -188,7 +186,7 @@ class ShowTemplateBrief(ShowTemplateBriefSchema):
 
         # Interface Templates
         # Service Templates
-        p1 = re.compile(r'^(?P<template_type>(Interface|Service))\s+Templates$')
+        p1 = regex_engine.compile(r'^(?P<template_type>(Interface|Service))\s+Templates$')
 
         ret_dict = dict()
         res = parsergen.oper_fill_tabular(device_output=output,
@@ -279,7 +277,7 @@ class ShowTemplateTemplate(ShowTemplateTemplateSchema):
         #  Regex everything before "BOUND:", then grab everything after
         #  BOUND: Twe1/0/1               Twe1/0/2               Twe1/0/3
         #         Twe1/0/4               Twe1/0/5
-        p1 = re.compile(r'^(.|\n)*(?P<bound>BOUND:)\s+(?P<targets>(.|\n)*)$')
+        p1 = regex_engine.compile(r'^(.|\n)*(?P<bound>BOUND:)\s+(?P<targets>(.|\n)*)$')
 
         match = p1.match(output)
         if match:
@@ -318,7 +316,7 @@ class ShowTemplateInterfaceBindingTarget(ShowTemplateInterfaceBindingTargetSchem
             output = self.device.execute(self.cli_command.format(interface=interface))
 
         # Interface: Gi1/0/1
-        p1 = re.compile(r'^Interface:\s+(?P<interface>\S+)$')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<interface>\S+)$')
 
         ret_dict = dict()
 
@@ -373,13 +371,13 @@ class ShowTemplateInterfaceSourceUser(ShowTemplateInterfaceSourceUserSchema):
             output = self.device.execute(self.cli_command.format(user=user))
 
         # Template Name       : alpha
-        p1 = re.compile(r'^Template Name\s+:\s+(?P<template>.+)$')
+        p1 = regex_engine.compile(r'^Template Name\s+:\s+(?P<template>.+)$')
 
         # storm-control broadcast level pps 3k
         # storm-control multicast level pps 3k
         # storm-control action trap
         # spanning-tree portfast
-        p2 = re.compile(r'^(?P<definition>(?!!|end|Building configuration.+|Template Definition :).+)$')
+        p2 = regex_engine.compile(r'^(?P<definition>(?!!|end|Building configuration.+|Template Definition :).+)$')
 
         ret_dict = {}
         for line in output.splitlines():
@@ -429,22 +427,22 @@ class ShowTemplateServiceSourceUser(ShowTemplateServiceSourceUserSchema):
             output = self.device.execute(self.cli_command.format(user=user))
 
         # Name                     :  webauth-global-inactive
-        p1 = re.compile(r'^Name\s+:\s+(?P<template>\S+)$')
+        p1 = regex_engine.compile(r'^Name\s+:\s+(?P<template>\S+)$')
 
         # Description              :  NONE
-        p2 = re.compile(r'^Description\s+:\s+(?P<description>.+)$')
+        p2 = regex_engine.compile(r'^Description\s+:\s+(?P<description>.+)$')
 
         # VLAN                     :  5
-        p3 = re.compile(r'^VLAN\s+:\s+(?P<vlan>\d+)$')
+        p3 = regex_engine.compile(r'^VLAN\s+:\s+(?P<vlan>\d+)$')
 
         # VNID                     :  NONE
-        p4 = re.compile(r'^VNID\s+:\s+(?P<vnid>.+)$')
+        p4 = regex_engine.compile(r'^VNID\s+:\s+(?P<vnid>.+)$')
 
         # MDNS POLICY              :  NONE!
-        p5 = re.compile(r'^MDNS POLICY\s+:\s+(?P<mdns_policy>.+)$')
+        p5 = regex_engine.compile(r'^MDNS POLICY\s+:\s+(?P<mdns_policy>.+)$')
 
         # Inactivity-Timer         :  3600 sec
-        p6 = re.compile(r'^Inactivity-Timer\s+:\s+(?P<inactivity_timer>.+)$')
+        p6 = regex_engine.compile(r'^Inactivity-Timer\s+:\s+(?P<inactivity_timer>.+)$')
 
         ret_dict = {}
 
@@ -515,15 +513,15 @@ class ShowAutoConfigurationTemplateBuiltIn(ShowAutoConfigurationTemplateBuiltInS
             output = self.device.execute(cmd)
 
         # Template Name:   IP_PHONE_INTERFACE_TEMPLATE
-        p1 = re.compile(r'^Template Name:\s+(?P<template>\S+)$')
+        p1 = regex_engine.compile(r'^Template Name:\s+(?P<template>\S+)$')
 
         # Template Definition:switchport mode access
-        p2 = re.compile(r'^Template Definition:(?P<definition>.+)$')
+        p2 = regex_engine.compile(r'^Template Definition:(?P<definition>.+)$')
 
         # switchport block unicast
         # switchport port-security maximum 3
         # switchport port-security maximum 2 vlan access
-        p3 = re.compile(r'^(?P<definition>(?!exit).+)$')
+        p3 = regex_engine.compile(r'^(?P<definition>(?!exit).+)$')
 
         ret_dict = {}
         for line in output.splitlines():
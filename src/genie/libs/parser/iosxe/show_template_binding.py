@@ -4,15 +4,13 @@ IOSXE parsers for the following commands
     * 'show template binding target {interface}'
 
 '''
-# python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional, Any
 
 # pyATS
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowTemplateBindingSchema(MetaParser):
@@ -50,14 +48,14 @@ class ShowTemplateBindingTarget(ShowTemplateBindingSchema):
             out = output
 
         #Interface: Gi1/0/12
-        p1 = re.compile(r'^Interface:\s+(?P<Interface>[\w/\-.]+)')
+        p1 = regex_engine.compile(r'^Interface:\s+(?P<Interface>[\w/\-.]+)')
 
                 # Method              Source            Template-Name
         # ------              ------            -------------
         # dynamic             User              cts_dot1x
         # static              User              port-config
         # dynamic             Built-in          IP_PHONE_INTERFACE_TEMPLATE 
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<method>(static|dynamic))\s+"
             r"(?P<source>[\w\-]+)\s+"
             r"(?P<interface_template_name>[\w_\-.]+)"
@@ -66,7 +64,7 @@ class ShowTemplateBindingTarget(ShowTemplateBindingSchema):
         # -------------                                    ------            ----------------
         # DefaultCriticalAuthVlan_SRV_TEMPLATE             User               68-3B-78-7A-2C-90
         # DefaultCriticalVoice_SRV_TEMPLATE                User               68-3B-78-7A-2C-90
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<service_template_name>[\w_]+)\s+"
             r"(?P<source>[\w\-]+)\s+"
             r"(?P<mac>[A-F0-9\-]+)"
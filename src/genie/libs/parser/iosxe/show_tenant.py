@@ -7,11 +7,13 @@
 '''
 
 # Python
-import re
 # Genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 
 class ShowTenantSummarySchema(MetaParser):
@@ -43,15 +45,15 @@ class ShowTenantSummary(ShowTenantSummarySchema):
             localdict = {}
             return_dict['tenant_name'] = {}
             # tenant-summary max-tenants 24
-            p1 = re.compile(r'^tenant-summary +max-tenants +(?P<max_tenants>[0-9]+)$')
+            p1 = regex_engine.compile(r'^tenant-summary +max-tenants +(?P<max_tenants>[0-9]+)$')
             # tenant-summary num-active-tenants 20
-            p2 = re.compile(r'^tenant-summary +num-active-tenants +(?P<active_tenants_num>[0-9]+)$')
+            p2 = regex_engine.compile(r'^tenant-summary +num-active-tenants +(?P<active_tenants_num>[0-9]+)$')
             # Tenanttest12      2       1004
             # Tenanttest13      3       1005
             # apple             4       1006
             # grapes            5       1007
             # orange            6       1008
-            p3 = re.compile(r'^(?P<tenant_name>[\w/\-\.]+) +(?P<tenant_id>[0-9]+) +(?P<tenant_vpnid>[0-9]+)$')
+            p3 = regex_engine.compile(r'^(?P<tenant_name>[\w/\-\.]+) +(?P<tenant_id>[0-9]+) +(?P<tenant_vpnid>[0-9]+)$')
             outlist = out.splitlines()
             for lines in outlist:
                 m1 = p1.match(lines.rstrip())
@@ -168,7 +170,7 @@ class ShowTenantOmpSummary(ShowTenantOmpSummarySchema):
             # vsmart-peers           1
             # vedge-peers            3
             # policy-queue           0
-            p1 = re.compile(r'^(?P<key>[\w/\-\.]+) +(?P<value>[0-9\w\:]+)$')
+            p1 = regex_engine.compile(r'^(?P<key>[\w/\-\.]+) +(?P<value>[0-9\w\:]+)$')
             outlist = out.splitlines()
             for lines in outlist:
                 m1 = p1.match(lines)
@@ -232,7 +234,7 @@ class ShowTenantOmpPeers(ShowTenantOmpPeersSchema):
             # 169.254.10.11    vedge   1         1         503       up       0:21:39:37       84/0/33
             # 169.254.10.12    vedge   1         1         504       up       0:21:39:38       16/0/30
             # 169.254.10.26    vedge   1         1         506       up       0:21:39:37       8/0/70
-            p1 = re.compile(r'^(?P<peer>[\d\.]+) +(?P<type>[0-9\w/\.]+) +(?P<domain_id>[\d]+) +(?P<overlay_id>[\d]+) +(?P<site_id>[\d]+) +(?P<state>[\w]+) +(?P<uptime>[\d\:]+) +(?P<ris>[\d/\.]+)$')
+            p1 = regex_engine.compile(r'^(?P<peer>[\d\.]+) +(?P<type>[0-9\w/\.]+) +(?P<domain_id>[\d]+) +(?P<overlay_id>[\d]+) +(?P<site_id>[\d]+) +(?P<state>[\w]+) +(?P<uptime>[\d\:]+) +(?P<ris>[\d/\.]+)$')
             outlist = out.splitlines()
             for lines in outlist:
                 m1 = p1.match(lines)
@@ -303,7 +305,7 @@ class ShowTenantOmpRoutesAdvertised(ShowTenantOmpRoutesAdvertisedSchema):
             # 1002   10.111.2.0/24
             # 1002   10.154.2.0/24
             # 1002   10.51.2.0/24
-            p1 = re.compile(r'^(?P<vpn>[\d]+) +(?P<prefix>[0-9\w/\.]+)$')
+            p1 = regex_engine.compile(r'^(?P<vpn>[\d]+) +(?P<prefix>[0-9\w/\.]+)$')
             outlist = out.splitlines()
             for lines in outlist:
                 m1 = p1.match(lines)
@@ -345,7 +347,7 @@ class ShowTenantOmpRoutesVpnAdvertised(ShowTenantOmpRoutesAdvertisedSchema):
             # 1002   10.111.2.0/24
             # 1002   10.154.2.0/24
             # 1002   10.51.2.0/24
-            p1 = re.compile(r'^(?P<vpn>[\d]+) +(?P<prefix>[0-9\w/\.]+)$')
+            p1 = regex_engine.compile(r'^(?P<vpn>[\d]+) +(?P<prefix>[0-9\w/\.]+)$')
             outlist = out.splitlines()
             for lines in outlist:
                 m1 = p1.match(lines)
@@ -3,10 +3,12 @@ IOSXE parsers for the following show commands:
     * show terminal
 '''
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Optional, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Schema for 'show terminal'
 # =============================================
@@ -55,23 +57,23 @@ class ShowTerminal(ShowTerminalSchema):
         ret_dict = {}
 
         # Line 0, Location: "", Type: ""
-        p0 = re.compile(r'^Line (?P<line>\w+), Location: "(?P<location>.*?)", Type: "(?P<type>.*?)"$')
+        p0 = regex_engine.compile(r'^Line (?P<line>\w+), Location: "(?P<location>.*?)", Type: "(?P<type>.*?)"$')
 
         # Length: 0 lines, Width: 0 columns
-        p1 = re.compile(r'^Length: (?P<length>\d+) lines, Width: (?P<width>\d+) columns$')
+        p1 = regex_engine.compile(r'^Length: (?P<length>\d+) lines, Width: (?P<width>\d+) columns$')
 
         # Baud rate (TX/RX) is 9600/9600, no parity, 1 stopbits, 8 databits
-        p2 = re.compile(r'^Baud rate \(TX\/RX\) is (?P<tx>\d+)\/(?P<rx>\d+), '
-                        r'(?P<parity>\w+) parity, (?P<stopbits>\d) stopbits, (?P<databits>\w+) databits$')
+        p2 = regex_engine.compile(r'^Baud rate \(TX\/RX\) is (?P<tx>\d+)\/(?P<rx>\d+), '
+                                  r'(?P<parity>\w+) parity, (?P<stopbits>\d) stopbits, (?P<databits>\w+) databits$')
 
         # Status: PSI Enabled, Ready, Active, Automore On
-        p3 = re.compile(r'^Status: (?P<status>.*?)$')
+        p3 = regex_engine.compile(r'^Status: (?P<status>.*?)$')
 
         # Allowed input transports are none
-        p4 = re.compile(r'^Allowed input transports are (?P<input_transport>[\w\s]+)\.?\s*$')
+        p4 = regex_engine.compile(r'^Allowed input transports are (?P<input_transport>[\w\s]+)\.?\s*$')
 
         # Allowed output transports are pad telnet rlogin ssh.
-        p5 = re.compile(r'^Allowed output transports are (?P<output_transport>[\w\s]+)\.?\s*$')
+        p5 = regex_engine.compile(r'^Allowed output transports are (?P<output_transport>[\w\s]+)\.?\s*$')
 
         for line in output.splitlines():
             line = line.strip()
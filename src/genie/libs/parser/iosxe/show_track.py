@@ -3,12 +3,12 @@ IOSXE parser for the following show commands:
     * 'show track'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # =======================
@@ -67,52 +67,52 @@ class ShowTrack(ShowTrackSchema):
         # Interface GigabitEthernet3.420 line-protocol
         # IP route 10.21.12.0 255.255.255.0 reachability
         # IP route 172.16.52.0 255.255.255.0 metric threshold
-        p1 = re.compile(r'^(?P<type>IP route|Interface) +'
+        p1 = regex_engine.compile(r'^(?P<type>IP route|Interface) +'
             r'((?P<address>[\d.]+) +(?P<mask>[\d.]+)|'
             r'(?P<name>[\d\w.]+)) +(?P<parameter>[\w \-]+)')
 
         # IP SLA 34 state
-        p1_1 = re.compile(r'^(?P<type>.*)state')
+        p1_1 = regex_engine.compile(r'^(?P<type>.*)state')
 
         # Line protocol is Up
         # Reachability is Down (no ip route), delayed Up (1 sec remaining) (connected)
         # Metric threshold is Down (no route)
-        p2 = re.compile(r'^(?P<parameter>[\w ]+) +is +(?P<state>Up|Down)'
+        p2 = regex_engine.compile(r'^(?P<parameter>[\w ]+) +is +(?P<state>Up|Down)'
             r'( +\((?P<state_description>[\w ]+)\),*( delayed '
             r'(?P<delayed_state>Up|Down) \((?P<secs_remaining>\d+) sec '
             r'remaining\) \((?P<connection_state>\w+)\))*)*')
 
         # 1 change, last change 00:00:27
-        p3 = re.compile(r'^(?P<change_count>\d+) +change, +last +change'
+        p3 = regex_engine.compile(r'^(?P<change_count>\d+) +change, +last +change'
             r' +(?P<last_change>[\d:]+)')
 
         # 1 changes, last change 1d16h
-        p3_1 = re.compile(r'^(?P<change_count>\d+) +changes, +last +change+(?P<last_change>.*)')
+        p3_1 = regex_engine.compile(r'^(?P<change_count>\d+) +changes, +last +change+(?P<last_change>.*)')
 
         # Delay up 20 secs, down 10 secs
-        p4 = re.compile(r'^Delay +up +(?P<delay_up_secs>\d+)'
+        p4 = regex_engine.compile(r'^Delay +up +(?P<delay_up_secs>\d+)'
             r' +secs,* +down +(?P<delay_down_secs>\d+) +sec')
 
         # First-hop interface is unknown (was Ethernet1/0)
-        p5 = re.compile(r'^First-hop +interface +is +'
+        p5 = regex_engine.compile(r'^First-hop +interface +is +'
             r'(?P<first_hop_interface_state>\w+)( +\(was'
             r' +(?P<prev_first_hop_interface>[\w\d\/\.\-\_]+)\))*')
 
         # Metric threshold down 255 up 254
-        p6 = re.compile(r'^Metric +threshold +down'
+        p6 = regex_engine.compile(r'^Metric +threshold +down'
             r' +(?P<threshold_down>\d+) +up +(?P<threshold_up>\d+)')
 
         # VRRP GigabitEthernet3.420 10
         # HSRP Ethernet0/0 3
         # HSRP Ethernet0/1 3
-        p7 = re.compile(r'^(?P<name>[a-zA-Z]{3,4}) +'
+        p7 = regex_engine.compile(r'^(?P<name>[a-zA-Z]{3,4}) +'
             r'(?P<interface>[A-Za-z0-9/.]+) +((?P<group_id>\d+)|(\n))')
         
         # Latest operation return code: OK
-        p8 = re.compile(r'Latest +operation +return +code: +(?P<latest_op_return_code>\w+)')
+        p8 = regex_engine.compile(r'Latest +operation +return +code: +(?P<latest_op_return_code>\w+)')
 
         # Latest RTT (millisecs) 16
-        p9 = re.compile(r'Latest RTT +\(?millisecs\)? +(?P<latest_rtt_ms>\d+)')
+        p9 = regex_engine.compile(r'Latest RTT +\(?millisecs\)? +(?P<latest_rtt_ms>\d+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -7,7 +7,9 @@ All rights reserved.
 '''
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # ======================================================
 # Schema for 'show platform hardware qfp active feature uni-sr'
@@ -55,52 +57,52 @@ class ShowU2MSR(ShowU2MSRSchema):
             out = output
 
         # Vif1:
-        p1 = re.compile(r'Vif(?P<interface>\d+):')
+        p1 = regex_engine.compile(r'Vif(?P<interface>\d+):')
 
         # unicast service reflect info:
-        p2 = re.compile(r'unicast +service +reflect +info:')
+        p2 = regex_engine.compile(r'unicast +service +reflect +info:')
 
         # vif name: Vif1
-        p3 = re.compile(r'vif +name: *(?P<name>\w+)')
+        p3 = regex_engine.compile(r'vif +name: *(?P<name>\w+)')
 
         # vif if_handle: 5997
-        p4 = re.compile(r'vif +if_handle: *(?P<if_handle>\d+)')
+        p4 = regex_engine.compile(r'vif +if_handle: *(?P<if_handle>\d+)')
 
         # ingress name: GigabitEthernet5
-        p3_1 = re.compile(r'ingress +name: +(?P<ingress_name>\w+)')
+        p3_1 = regex_engine.compile(r'ingress +name: +(?P<ingress_name>\w+)')
 
         # ingress if_handle: 10
-        p4_1 = re.compile(r'ingress +if_handle: +(?P<ingress_hdl>\d+)')
+        p4_1 = regex_engine.compile(r'ingress +if_handle: +(?P<ingress_hdl>\d+)')
 
         # replica count: 1
-        p5 = re.compile(r'replica +count: *(?P<rep_cnt>\d+)')
+        p5 = regex_engine.compile(r'replica +count: *(?P<rep_cnt>\d+)')
 
         # replica rule HW addr: 0x00000000e9d2fd60
-        p6 = re.compile(r'replica +rule +HW +addr: *(?P<rep_hw_addr>\w+)')
+        p6 = regex_engine.compile(r'replica +rule +HW +addr: *(?P<rep_hw_addr>\w+)')
 
         # hash val: 4
-        p7 = re.compile(r'hash +val: *(?P<hash_val>\d+)')
+        p7 = regex_engine.compile(r'hash +val: *(?P<hash_val>\d+)')
 
         # prefix: 200.0.0.0/24
-        p8 = re.compile(r'prefix: +(?P<prefix>\S+)')
+        p8 = regex_engine.compile(r'prefix: +(?P<prefix>\S+)')
 
         # replica node info:
-        p9 = re.compile(r'replica +node +info:')
+        p9 = regex_engine.compile(r'replica +node +info:')
 
         # source filter: 66.1.1.0/24
-        p10_1 = re.compile(r'source +filter: *(?P<src_filter>\S+)')
+        p10_1 = regex_engine.compile(r'source +filter: *(?P<src_filter>\S+)')
 
         # translated source: 100.1.1.1
-        p10 = re.compile(r'translated +source: *(?P<trans_src>\S+)')
+        p10 = regex_engine.compile(r'translated +source: *(?P<trans_src>\S+)')
 
         # translated destination: 225.225.225.0/24
-        p11 = re.compile(r'translated +destination: *(?P<trans_dst>\S+)')
+        p11 = regex_engine.compile(r'translated +destination: *(?P<trans_dst>\S+)')
 
         # replica rule HW addr: 0x00000000ed1a55c0
-        p12 = re.compile(r'replica +rule +HW +addr: *(?P<rep_hw_addr>\w+)')
+        p12 = regex_engine.compile(r'replica +rule +HW +addr: *(?P<rep_hw_addr>\w+)')
 
         # match: octets 0 packets 0
-        p13 = re.compile(r'match: +octets *(?P<octets>\d+) +packets *(?P<pkts>\d+)')
+        p13 = regex_engine.compile(r'match: +octets *(?P<octets>\d+) +packets *(?P<pkts>\d+)')
 
         vif_sr_dict = {}
         uni_sr_num = 0
@@ -7,12 +7,12 @@ IOSXE parsers for the following show command:
 
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional,Or
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowUdldInterfaceSchema(MetaParser):
@@ -67,73 +67,73 @@ class ShowUdldInterface(ShowUdldInterfaceSchema):
         
         ret_dict = {}
         #Interface Gi1/0/7
-        p1 = re.compile(r"^Interface\s(?P<interface>[\w/]+)$")
+        p1 = regex_engine.compile(r"^Interface\s(?P<interface>[\w/]+)$")
 
         #Port enable administrative configuration setting: Enabled
-        p2 = re.compile(r"^Port\s+enable\s+administrative\s+configuration\s+setting:\s+(?P<port_enable_administrative_configuration_setting>\w+)$")
+        p2 = regex_engine.compile(r"^Port\s+enable\s+administrative\s+configuration\s+setting:\s+(?P<port_enable_administrative_configuration_setting>\w+)$")
         
         #Port enable operational state: Enabled
-        p3 = re.compile(r"^Port\s+enable\s+operational\s+state:\s+(?P<port_enable_operational_state>\w+)$")
+        p3 = regex_engine.compile(r"^Port\s+enable\s+operational\s+state:\s+(?P<port_enable_operational_state>\w+)$")
 
         #Current bidirectional state: Bidirectional
-        p4 = re.compile(r"^Current\s+bidirectional\s+state:\s+(?P<current_bidirectional_state>\w+)$")
+        p4 = regex_engine.compile(r"^Current\s+bidirectional\s+state:\s+(?P<current_bidirectional_state>\w+)$")
 
         #Port enable administrative configuration setting: Enabled / in alert mode
-        p5 = re.compile(r"^Port\s+enable\s+administrative\s+configuration\s+setting:\s+(?P<port_enable_administrative_configuration_setting>.+)$")
+        p5 = regex_engine.compile(r"^Port\s+enable\s+administrative\s+configuration\s+setting:\s+(?P<port_enable_administrative_configuration_setting>.+)$")
         
         #Port enable operational state: Enabled / in alert mode
-        p6 = re.compile(r"^Port\s+enable\s+operational\s+state:\s+(?P<port_enable_operational_state>.+)$")
+        p6 = regex_engine.compile(r"^Port\s+enable\s+operational\s+state:\s+(?P<port_enable_operational_state>.+)$")
         
         # Current operational state: Advertisement - Single neighbor detected
-        p7 = re.compile(r"^Current\s+operational\s+state:\s+(?P<current_operational_state>.+)$")
+        p7 = regex_engine.compile(r"^Current\s+operational\s+state:\s+(?P<current_operational_state>.+)$")
         
         # Message interval: 15000 ms
-        p8 = re.compile(r"^Message\s+interval:\s+(?P<message_interval_ms>\d+)")
+        p8 = regex_engine.compile(r"^Message\s+interval:\s+(?P<message_interval_ms>\d+)")
         
         # Time out interval: 5000 ms
-        p9 = re.compile(r"^Time\s+out\s+interval:\s+(?P<time_out_interval_ms>\d+)")
+        p9 = regex_engine.compile(r"^Time\s+out\s+interval:\s+(?P<time_out_interval_ms>\d+)")
         
         # Port fast-hello configuration setting: Disabled
-        p10 = re.compile(r"^Port\s+fast+\-+hello\s+configuration\s+setting:\s+(?P<port_fast_hello_configuration_setting>\w+)$")
+        p10 = regex_engine.compile(r"^Port\s+fast+\-+hello\s+configuration\s+setting:\s+(?P<port_fast_hello_configuration_setting>\w+)$")
         
         # Port fast-hello interval: 0 ms
-        p11 = re.compile(r"^Port\s+fast+\-+hello\s+interval:\s+(?P<port_fast_hello_interval_ms>\d+)")
+        p11 = regex_engine.compile(r"^Port\s+fast+\-+hello\s+interval:\s+(?P<port_fast_hello_interval_ms>\d+)")
         
         # Port fast-hello operational state: Disabled
-        p12 = re.compile(r"^Port\s+fast+\-+hello\s+operational\s+state:\s+(?P<port_fast_hello_operational_state>\w+)$")
+        p12 = regex_engine.compile(r"^Port\s+fast+\-+hello\s+operational\s+state:\s+(?P<port_fast_hello_operational_state>\w+)$")
         
         # Neighbor fast-hello configuration setting: Disabled
-        p13 = re.compile(r"^Neighbor\s+fast+\-+hello\s+configuration\s+setting:\s+(?P<neighbor_fast_hello_configuration_setting>\w+)$")
+        p13 = regex_engine.compile(r"^Neighbor\s+fast+\-+hello\s+configuration\s+setting:\s+(?P<neighbor_fast_hello_configuration_setting>\w+)$")
         
         # Neighbor fast-hello interval: Unknown
-        p14 = re.compile(r"^Neighbor\s+fast+\-+hello\s+interval:\s+(?P<neighbor_fast_hello_interval>\w+)$")
+        p14 = regex_engine.compile(r"^Neighbor\s+fast+\-+hello\s+interval:\s+(?P<neighbor_fast_hello_interval>\w+)$")
         
         # Entry 1
-        p15 = re.compile(r"^Entry\s+1$")
+        p15 = regex_engine.compile(r"^Entry\s+1$")
 
         # Expiration time: 42600 ms
-        p16 = re.compile(r"^Expiration\s+time:\s+(?P<expiration_time_ms>\d+)")
+        p16 = regex_engine.compile(r"^Expiration\s+time:\s+(?P<expiration_time_ms>\d+)")
         
         # Cache Device index: 1
-        p17 = re.compile(r"^Cache\s+Device\s+index:\s+(?P<cache_device_index>\d+)$")
+        p17 = regex_engine.compile(r"^Cache\s+Device\s+index:\s+(?P<cache_device_index>\d+)$")
         
         # Current neighbor state: Bidirectional
-        p18 = re.compile(r"^Current\s+neighbor\s+state:\s+(?P<current_neighbor_state>\w+)$")
+        p18 = regex_engine.compile(r"^Current\s+neighbor\s+state:\s+(?P<current_neighbor_state>\w+)$")
         
         # Device ID: A4B43937780
-        p19 = re.compile(r"^Device\s+ID:\s+(?P<device_id>\w+)$")
+        p19 = regex_engine.compile(r"^Device\s+ID:\s+(?P<device_id>\w+)$")
         
         # Port ID: A4:B4:39:37:78:00/7
-        p20 = re.compile(r"^Port\s+ID:\s+(?P<port_id>([a-fA-F\d]{2}:){5}[a-fA-F\d]{2}\/\d+)$")
+        p20 = regex_engine.compile(r"^Port\s+ID:\s+(?P<port_id>([a-fA-F\d]{2}:){5}[a-fA-F\d]{2}\/\d+)$")
         
         # Neighbor echo 1 device: 70D37984690
-        p21 = re.compile(r"^Neighbor\s+echo\s+1\s+device:\s+(?P<neighbor_echo_1_device>\w+)$")
+        p21 = regex_engine.compile(r"^Neighbor\s+echo\s+1\s+device:\s+(?P<neighbor_echo_1_device>\w+)$")
         
         # Neighbor echo 1 port: 70:D3:79:84:69:00/7
-        p22 = re.compile(r"^Neighbor\s+echo\s+1\s+port:\s+(?P<neighbor_echo_1_port>([a-fA-F\d]{2}:){5}[a-fA-F\d]{2}\/\d+)$")
+        p22 = regex_engine.compile(r"^Neighbor\s+echo\s+1\s+port:\s+(?P<neighbor_echo_1_port>([a-fA-F\d]{2}:){5}[a-fA-F\d]{2}\/\d+)$")
         
         # TLV Message interval: 15 sec
-        p23 = re.compile(r"^TLV\s+Message\s+interval:\s+(?P<tlv_message_interval_sec>\d+)")
+        p23 = regex_engine.compile(r"^TLV\s+Message\s+interval:\s+(?P<tlv_message_interval_sec>\d+)")
         
         for line in output.splitlines():
             line = line.strip()
@@ -319,14 +319,14 @@ class ShowUdldNeighbor(ShowUdldNeighborSchema):
         ret_dict = {}
         
         #Gi1/0/13       9077EEFE7F0     1            70:D3:79:84:69:        Bidirectional
-        p1 = re.compile(r'^(?P<port>\w+\/\d+\/\d+(\/\d)?)\s+'
-                        r'(?P<device_name>\w+)\s+'
-                        r'(?P<device_id>\w+)\s+'
-                        r'(?P<port_id>\w+\/\d+\/\d+(\/\d)?)\s+'
-                        r'(?P<neighbor_state>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<port>\w+\/\d+\/\d+(\/\d)?)\s+'
+                                  r'(?P<device_name>\w+)\s+'
+                                  r'(?P<device_id>\w+)\s+'
+                                  r'(?P<port_id>\w+\/\d+\/\d+(\/\d)?)\s+'
+                                  r'(?P<neighbor_state>\w+)$')
 
         #Total number of bidirectional entries displayed: 1
-        p2 = re.compile(r"^Total\s+number\s+of\s+bidirectional\s+entries\s+displayed:\s+(?P<total_number_of_bidirectional_entries_displayed>\d+)$")
+        p2 = regex_engine.compile(r"^Total\s+number\s+of\s+bidirectional\s+entries\s+displayed:\s+(?P<total_number_of_bidirectional_entries_displayed>\d+)$")
         
                                 
         for line in output.splitlines():
@@ -7,7 +7,6 @@ IOSXE parsers for the following show commands:
 
 # Python
 
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -15,6 +14,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ==============================================================
 # Parser for 'show umbrella deviceid'
 # ==============================================================
@@ -45,9 +47,9 @@ class ShowUmbrellaDeviceid(ShowUmbrellaDeviceidSchema):
         ret_dict = {}
         
         # Te2/0/12                tag_9300         200 SUCCESS     010aa1c364862f56
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) '
-               r'+(?P<tag>[\w\_\-]+) +(?P<status>\w+\s+\w+) '
-               r'+(?P<device_id>[\w\-]+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>[\w\/\.\-]+) '
+                         r'+(?P<tag>[\w\_\-]+) +(?P<status>\w+\s+\w+) '
+                         r'+(?P<device_id>[\w\-]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -129,71 +131,71 @@ class ShowUmbrellaConfig(ShowUmbrellaConfigSchema):
             out = output
  
         #Umbrella Configuration
-        p0 =  re.compile(r'^Umbrella\s+Configuration$')
+        p0 =  regex_engine.compile(r'^Umbrella\s+Configuration$')
 
         #Token: FC4C18E820D29D6CFC9B5224D5EAE8020026E638
-        p1 = re.compile(r'^Token:\s+(?P<TokenKey>\w+)$')
+        p1 = regex_engine.compile(r'^Token:\s+(?P<TokenKey>\w+)$')
 
         #API-KEY: NONE
-        p2 = re.compile(r'^API-KEY:\s+(?P<ApiKey>\w+)$')
+        p2 = regex_engine.compile(r'^API-KEY:\s+(?P<ApiKey>\w+)$')
 
         #OrganizationID: 2549304
-        p3 = re.compile(r'^OrganizationID:\s+(?P<OrgId>\w+)$')
+        p3 = regex_engine.compile(r'^OrganizationID:\s+(?P<OrgId>\w+)$')
 
         #Local Domain Regex parameter-map name: NONE
-        p4 = re.compile(r'^Local\s+Domain\s+Regex\s+parameter-map\s+name:\s+(?P<LocalBypass>[\w\-]+)$')
+        p4 = regex_engine.compile(r'^Local\s+Domain\s+Regex\s+parameter-map\s+name:\s+(?P<LocalBypass>[\w\-]+)$')
 
         #DNSCrypt: Not enabled           
-        p5 = re.compile(r'^DNSCrypt:\s+(?P<DnsyCrypt>Not enabled|Enabled)$')   
+        p5 = regex_engine.compile(r'^DNSCrypt:\s+(?P<DnsyCrypt>Not enabled|Enabled)$')   
 
         #Public-key: NONE           
-        p6 = re.compile(r'^Public-key:\s+(?P<PublicKey>[\w:]+)$')  
+        p6 = regex_engine.compile(r'^Public-key:\s+(?P<PublicKey>[\w:]+)$')  
 
         #UDP Timeout: 5 seconds              
-        p7 = re.compile(r'^UDP\s+Timeout:\s+(?P<UdpTimeout>\d+) +seconds$') 
+        p7 = regex_engine.compile(r'^UDP\s+Timeout:\s+(?P<UdpTimeout>\d+) +seconds$') 
 
         #   Number of interfaces with "umbrella out" config: 1
-        p8 = re.compile(r'^Number\s+of\s+interfaces\s+with\s+"umbrella\s+out"\s+config:\s+(?P<OutCount>\d+)$') 
+        p8 = regex_engine.compile(r'^Number\s+of\s+interfaces\s+with\s+"umbrella\s+out"\s+config:\s+(?P<OutCount>\d+)$') 
 
         #    1. TenGigabitEthernet2/0/1 
-        p9 = re.compile(r'^(?P<Index>[0-9]+).\s+(?P<OutInt>[\w\/\.\-]+\d)$') 
+        p9 = regex_engine.compile(r'^(?P<Index>[0-9]+).\s+(?P<OutInt>[\w\/\.\-]+\d)$') 
 
         #Number of interfaces with "umbrella in" config: 1
-        p10 = re.compile(r'^Number\s+of\s+interfaces\s+with\s+"umbrella\s+in"\s+config:\s+(?P<InCount>\d+)$')
+        p10 = regex_engine.compile(r'^Number\s+of\s+interfaces\s+with\s+"umbrella\s+in"\s+config:\s+(?P<InCount>\d+)$')
 
         #    1. TenGigabitEthernet2/0/12
-        p11 =  re.compile(r'^(?P<Index>[0-9]+).\s+(?P<InInt>[\w\/\.\-]+)$') 
+        p11 =  regex_engine.compile(r'^(?P<Index>[0-9]+).\s+(?P<InInt>[\w\/\.\-]+)$') 
 
         #     Tag        : tag_9300 
-        p12 = re.compile(r'^Tag\s+:\s+(?P<Tag>[\w\-]+)$')
+        p12 = regex_engine.compile(r'^Tag\s+:\s+(?P<Tag>[\w\-]+)$')
 
         #     Device-id  : 010aa1c364862f56
-        p13 = re.compile(r'^Device-id\s+:\s+(?P<DeviceId>[\w\s]+)$')
+        p13 = regex_engine.compile(r'^Device-id\s+:\s+(?P<DeviceId>[\w\s]+)$')
 
         #       Mode     :  OUT
         #       Mode     :  IN
-        p14 = re.compile(r'^Mode\s+:\s+(?P<mode>IN|OUT)$')
+        p14 = regex_engine.compile(r'^Mode\s+:\s+(?P<mode>IN|OUT)$')
 
         #       VRF      : global(Id: 0)
-        p15 = re.compile(r'^VRF\s+:\s+(?P<vrf>\w+)\(Id:\s+(?P<vrf_id>\d+)\)$')
+        p15 = regex_engine.compile(r'^VRF\s+:\s+(?P<vrf>\w+)\(Id:\s+(?P<vrf_id>\d+)\)$')
 
         #   DCA        : Disabled
-        p16 = re.compile(r'^DCA\s+:\s+(?P<dca>\w+)$')
+        p16 = regex_engine.compile(r'^DCA\s+:\s+(?P<dca>\w+)$')
 
         #   Resolver address:
-        p17 = re.compile(r'^Resolver\s+address:$')
+        p17 = regex_engine.compile(r'^Resolver\s+address:$')
 
         #   1. 208.67.220.220
         #   2. 208.67.222.222
         #   3. 2620:119:53::53
         #   4. 2620:119:35::35
-        p18 = re.compile(r'^(?P<ip_index>\d+).\s+(?P<resolver_ip>[\d\.|\w\:]+)$')
+        p18 = regex_engine.compile(r'^(?P<ip_index>\d+).\s+(?P<resolver_ip>[\d\.|\w\:]+)$')
 
         # Configured Umbrella Parameter-maps:
-        p19 = re.compile(r'^Configured\s+Umbrella\s+Parameter-maps:$')
+        p19 = regex_engine.compile(r'^Configured\s+Umbrella\s+Parameter-maps:$')
 
         # 1. global
-        p20 = re.compile(r'^(?P<Index>[0-9]+).\s+(?P<patameter_maps_type>\w+)$')
+        p20 = regex_engine.compile(r'^(?P<Index>[0-9]+).\s+(?P<patameter_maps_type>\w+)$')
 
         ret_dict = {}
         flag = 0
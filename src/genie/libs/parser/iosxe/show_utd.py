@@ -1,10 +1,10 @@
-# Python
-import re
-
 # Genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowSdwanUtdEngineSchema(MetaParser):
     ''' Schema for show sdwan utd engine'''
     schema = {
@@ -43,12 +43,12 @@ class ShowSdwanUtdEngine(ShowSdwanUtdEngineSchema):
         # utd-oper-data utd-engine-status reason ""
         # utd-oper-data utd-engine-status memory-usage 11.3
         # utd-oper-data utd-engine-status memory-status utd-oper-status-green
-        p1 = re.compile(r'utd-oper-data utd-engine-status +(?P<key>[\S]+) +(?P<value>[\s\S]+)')
+        p1 = regex_engine.compile(r'utd-oper-data utd-engine-status +(?P<key>[\S]+) +(?P<value>[\s\S]+)')
 
         # ID  RUNNING  STATUS                 REASON
         # 1   true     utd-oper-status-green 
         # 2   true     utd-oper-status-green 
-        p2 = re.compile(r'^(?P<id>[\d]+)[\s]+(?P<running>[\w]+)[\s]+(?P<status>[s\S]+\S)(?P<reason>($|[\s\S]+))')
+        p2 = regex_engine.compile(r'^(?P<id>[\d]+)[\s]+(?P<running>[\w]+)[\s]+(?P<status>[s\S]+\S)(?P<reason>($|[\s\S]+))')
 
         parsed_dict = {}
         for line in output.splitlines():
@@ -135,16 +135,16 @@ class ShowUtdEngineStandardStatus(ShowUtdEngineStandardStatusSchema):
         # Profile : Cloud-Medium
         # Number of engines : 2
         # Overall system status: Green
-        p1 = re.compile(r'(?P<key>[Engine version|Profile|Number of engines|Overall system status]+\w)(\s+:|:)+\s+(?P<value>[\s\S]+)$')
+        p1 = regex_engine.compile(r'(?P<key>[Engine version|Profile|Number of engines|Overall system status]+\w)(\s+:|:)+\s+(?P<value>[\s\S]+)$')
 
         # System memory :
-        p2 = re.compile(r'^System +memory +:$')
+        p2 = regex_engine.compile(r'^System +memory +:$')
 
         # Engine(#1): Yes Green None
-        p3 = re.compile(r'^(?P<engine>[\s\S]+): +(?P<running_status>[\w]+) +(?P<health>[\w]+) +(?P<reason>[\s\S]+\S)$')
+        p3 = regex_engine.compile(r'^(?P<engine>[\s\S]+): +(?P<running_status>[\w]+) +(?P<health>[\w]+) +(?P<reason>[\s\S]+\S)$')
 
         # Signature update status
-        p4 = re.compile(r'^Signature +update +status:$')
+        p4 = regex_engine.compile(r'^Signature +update +status:$')
 
         # Usage : 8.80 %
         # Status : Green
@@ -155,7 +155,7 @@ class ShowUtdEngineStandardStatus(ShowUtdEngineStandardStatusSchema):
         # Last failed update reason: None\n
         # Next update scheduled at: None\n
         # Current status: Idle\n
-        p5 = re.compile(r'^(?P<key>[\s\S]+\w)(\s+:|:)+\s+(?P<value>[\s\S]+)$')
+        p5 = regex_engine.compile(r'^(?P<key>[\s\S]+\w)(\s+:|:)+\s+(?P<value>[\s\S]+)$')
 
         parsed_dict = {}
         last_dict_ptr = {}
@@ -337,190 +337,190 @@ class ShowUtdEngineStandardStatistics(ShowUtdEngineStandardStatisticsSchema):
         ret_dict = {}
 
         # *************Engine #1*************
-        p1 = re.compile(r'^\*+Engine\s+\S+(?P<engine_number>\d+)+(\*+)$')
+        p1 = regex_engine.compile(r'^\*+Engine\s+\S+(?P<engine_number>\d+)+(\*+)$')
 
         # Total non-mmapped bytes (arena):       24719360
-        p2 = re.compile(r'^Total\snon-mmapped\sbytes\s+\(\w+\):+\s+(?P<total_non_map_byts>\d+)$')
+        p2 = regex_engine.compile(r'^Total\snon-mmapped\sbytes\s+\(\w+\):+\s+(?P<total_non_map_byts>\d+)$')
 
         # Bytes in mapped regions (hblkhd):      437760000
-        p3 = re.compile(r'^Bytes\sin\smapped\sregions\s+\(\w+\):+\s+(?P<byts_in_mapped_regions>\d+)$')
+        p3 = regex_engine.compile(r'^Bytes\sin\smapped\sregions\s+\(\w+\):+\s+(?P<byts_in_mapped_regions>\d+)$')
 
         # Total allocated space (uordblks):      23876960
-        p4 = re.compile(r'^Total\sallocated\sspace\s+\(\w+\):+\s+(?P<total_alloc_space>\d+)$')
+        p4 = regex_engine.compile(r'^Total\sallocated\sspace\s+\(\w+\):+\s+(?P<total_alloc_space>\d+)$')
 
         # Total free space (fordblks):           842400
-        p5 = re.compile(r'^Total\sfree\sspace\s+\(\w+\):+\s+(?P<total_free_space>\d+)$')
+        p5 = regex_engine.compile(r'^Total\sfree\sspace\s+\(\w+\):+\s+(?P<total_free_space>\d+)$')
 
         # Topmost releasable block (keepcost):   45920
-        p6 = re.compile(r'^Topmost\sreleasable\sblock\s+\(\w+\):\s+(?P<topmost_reuse_blk>[\d\.]+)$')
+        p6 = regex_engine.compile(r'^Topmost\sreleasable\sblock\s+\(\w+\):\s+(?P<topmost_reuse_blk>[\d\.]+)$')
 
         # Received:            0
-        p7 = re.compile(r'^Received:\s+(?P<received>\d+)$')
+        p7 = regex_engine.compile(r'^Received:\s+(?P<received>\d+)$')
 
         # Analyzed:            0 (  0.000%)
-        p8 = re.compile(r'^Analyzed:\s+(?P<analyzed>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p8 = regex_engine.compile(r'^Analyzed:\s+(?P<analyzed>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Dropped:            0 (  0.000%)
-        p9 = re.compile(r'^Dropped:\s+(?P<dropped>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p9 = regex_engine.compile(r'^Dropped:\s+(?P<dropped>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Filtered:            0 (  0.000%)
-        p10 = re.compile(r'^Filtered:\s+(?P<filtered>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p10 = regex_engine.compile(r'^Filtered:\s+(?P<filtered>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Outstanding:            0 (  0.000%)
-        p11 = re.compile(r'^Outstanding:\s+(?P<outstanding>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p11 = regex_engine.compile(r'^Outstanding:\s+(?P<outstanding>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Injected:            0
-        p12 = re.compile(r'^Injected:\s+(?P<injected>\d+)$')
+        p12 = regex_engine.compile(r'^Injected:\s+(?P<injected>\d+)$')
 
         # Eth:            0 (  0.000%)
-        p13 = re.compile(r'^Eth:\s+(?P<eth>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p13 = regex_engine.compile(r'^Eth:\s+(?P<eth>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # VLAN:            0 (  0.000%)
-        p14 = re.compile(r'^VLAN:\s+(?P<vlan>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p14 = regex_engine.compile(r'^VLAN:\s+(?P<vlan>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IP4:            0 (  0.000%)
-        p15 = re.compile(r'^IP4:\s+(?P<ip4>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p15 = regex_engine.compile(r'^IP4:\s+(?P<ip4>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Frag:            0 (  0.000%)
-        p16 = re.compile(r'^Frag:\s+(?P<frag>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p16 = regex_engine.compile(r'^Frag:\s+(?P<frag>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # ICMP:            0 (  0.000%)
-        p17 = re.compile(r'^ICMP:\s+(?P<icmp>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p17 = regex_engine.compile(r'^ICMP:\s+(?P<icmp>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # UDP:            0 (  0.000%)
-        p18 = re.compile(r'^UDP:\s+(?P<udp>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p18 = regex_engine.compile(r'^UDP:\s+(?P<udp>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # TCP:            0 (  0.000%)
-        p19 = re.compile(r'^TCP:\s+(?P<tcp>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p19 = regex_engine.compile(r'^TCP:\s+(?P<tcp>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IP6:            0 (  0.000%)
-        p20 = re.compile(r'^IP6:\s+(?P<ip6>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p20 = regex_engine.compile(r'^IP6:\s+(?P<ip6>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IP6 Ext:            0 (  0.000%)
-        p21 = re.compile(r'^IP6\sExt:\s+(?P<ip6_ext>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p21 = regex_engine.compile(r'^IP6\sExt:\s+(?P<ip6_ext>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IP6 Opts:            0 (  0.000%)
-        p22 = re.compile(r'^IP6\sOpts:\s+(?P<ip6_opts>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p22 = regex_engine.compile(r'^IP6\sOpts:\s+(?P<ip6_opts>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Frag6:            0 (  0.000%)
-        p23 = re.compile(r'^Frag6:\s+(?P<frag6>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p23 = regex_engine.compile(r'^Frag6:\s+(?P<frag6>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # ICMP6:            0 (  0.000%)
-        p24 = re.compile(r'^ICMP6:\s+(?P<icmp6>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p24 = regex_engine.compile(r'^ICMP6:\s+(?P<icmp6>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # UDP6:            0 (  0.000%)
-        p25 = re.compile(r'^UDP6:\s+(?P<udp6>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p25 = regex_engine.compile(r'^UDP6:\s+(?P<udp6>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # TCP6:            0 (  0.000%)
-        p26 = re.compile(r'^TCP6:\s+(?P<tcp6>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p26 = regex_engine.compile(r'^TCP6:\s+(?P<tcp6>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Teredo:            0 (  0.000%)
-        p27 = re.compile(r'Teredo:\s+(?P<teredo>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p27 = regex_engine.compile(r'Teredo:\s+(?P<teredo>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # ICMP-IP:            0 (  0.000%)
-        p28 = re.compile(r'ICMP-IP:\s+(?P<icmp_ip>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p28 = regex_engine.compile(r'ICMP-IP:\s+(?P<icmp_ip>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IP4/IP4:            0 (  0.000%)
-        p29 = re.compile(r'IP4/IP4:\s+(?P<ip4_ip4>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p29 = regex_engine.compile(r'IP4/IP4:\s+(?P<ip4_ip4>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IP4/IP6:            0 (  0.000%)
-        p30 = re.compile(r'IP4/IP6:\s+(?P<ip4_ip6>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p30 = regex_engine.compile(r'IP4/IP6:\s+(?P<ip4_ip6>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IP6/IP4:            0 (  0.000%)
-        p31 = re.compile(r'IP6/IP4:\s+(?P<ip6_ip4>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p31 = regex_engine.compile(r'IP6/IP4:\s+(?P<ip6_ip4>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IP6/IP6:            0 (  0.000%)
-        p32 = re.compile(r'IP6/IP6:\s+(?P<ip6_ip6>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p32 = regex_engine.compile(r'IP6/IP6:\s+(?P<ip6_ip6>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # GRE:            0 (  0.000%)
-        p33 = re.compile(r'GRE:\s+(?P<gre>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p33 = regex_engine.compile(r'GRE:\s+(?P<gre>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # GRE Eth:            0 (  0.000%)
-        p34 = re.compile(r'GRE\sEth:\s+(?P<gre_eth>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p34 = regex_engine.compile(r'GRE\sEth:\s+(?P<gre_eth>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # GRE VLAN:            0 (  0.000%)
-        p35 = re.compile(r'GRE\sVLAN:\s+(?P<gre_vlan>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p35 = regex_engine.compile(r'GRE\sVLAN:\s+(?P<gre_vlan>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # GRE IP4:            0 (  0.000%)
-        p36 = re.compile(r'GRE\sIP4:\s+(?P<gre_ip4>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p36 = regex_engine.compile(r'GRE\sIP4:\s+(?P<gre_ip4>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # GRE IP6:            0 (  0.000%)
-        p37 = re.compile(r'GRE\sIP6:\s+(?P<gre_ip6>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p37 = regex_engine.compile(r'GRE\sIP6:\s+(?P<gre_ip6>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # GRE IP6 Ext:            0 (  0.000%)
-        p38 = re.compile(r'GRE\sIP6\sExt:\s+(?P<gre_ip6_ext>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p38 = regex_engine.compile(r'GRE\sIP6\sExt:\s+(?P<gre_ip6_ext>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # GRE PPTP:            0 (  0.000%)
-        p39 = re.compile(r'GRE\sPPTP:\s+(?P<gre_pptp>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p39 = regex_engine.compile(r'GRE\sPPTP:\s+(?P<gre_pptp>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # GRE ARP:            0 (  0.000%)
-        p40 = re.compile(r'GRE\sARP:\s+(?P<gre_arp>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p40 = regex_engine.compile(r'GRE\sARP:\s+(?P<gre_arp>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # GRE IPX:            0 (  0.000%)
-        p41 = re.compile(r'GRE\sIPX:\s+(?P<gre_ipx>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p41 = regex_engine.compile(r'GRE\sIPX:\s+(?P<gre_ipx>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # GRE Loop:            0 (  0.000%)
-        p42 = re.compile(r'GRE\sLoop:\s+(?P<gre_loop>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p42 = regex_engine.compile(r'GRE\sLoop:\s+(?P<gre_loop>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # MPLS:            0 (  0.000%)
-        p43 = re.compile(r'MPLS:\s+(?P<mpls>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p43 = regex_engine.compile(r'MPLS:\s+(?P<mpls>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # ARP:            0 (  0.000%)
-        p44 = re.compile(r'ARP:\s+(?P<arp>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p44 = regex_engine.compile(r'ARP:\s+(?P<arp>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IPX:            0 (  0.000%)
-        p45 = re.compile(r'IPX:\s+(?P<ipx>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p45 = regex_engine.compile(r'IPX:\s+(?P<ipx>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Eth Loop:            0 (  0.000%)
-        p46 = re.compile(r'Eth\sLoop:\s+(?P<eth_loop>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p46 = regex_engine.compile(r'Eth\sLoop:\s+(?P<eth_loop>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Eth Disc:            0 (  0.000%)
-        p47 = re.compile(r'Eth\sDisc:\s+(?P<eth_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p47 = regex_engine.compile(r'Eth\sDisc:\s+(?P<eth_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IP4 Disc:            0 (  0.000%)
-        p48 = re.compile(r'IP4:\sDisc:\s+(?P<ip4_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p48 = regex_engine.compile(r'IP4:\sDisc:\s+(?P<ip4_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # IP6 Disc:            0 (  0.000%)
-        p49 = re.compile(r'IP6\sDisc:\s+(?P<ip6_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p49 = regex_engine.compile(r'IP6\sDisc:\s+(?P<ip6_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # TCP Disc:            0 (  0.000%)
-        p50 = re.compile(r'TCP\sDisc:\s+(?P<tcp_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p50 = regex_engine.compile(r'TCP\sDisc:\s+(?P<tcp_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # UDP Disc:            0 (  0.000%)
-        p51 = re.compile(r'UDP\sDisc:\s+(?P<udp_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p51 = regex_engine.compile(r'UDP\sDisc:\s+(?P<udp_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # ICMP Disc:            0 (  0.000%)
-        p52 = re.compile(r'ICMP\sDisc:\s+(?P<icmp_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p52 = regex_engine.compile(r'ICMP\sDisc:\s+(?P<icmp_disc>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # All Discard:            0 (  0.000%)
-        p53 = re.compile(r'All\sDiscard:\s+(?P<all_discard>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p53 = regex_engine.compile(r'All\sDiscard:\s+(?P<all_discard>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Other:            0 (  0.000%)
-        p54 = re.compile(r'Other:\s+(?P<other>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p54 = regex_engine.compile(r'Other:\s+(?P<other>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Bad Chk Sum:            0 (  0.000%)
-        p55 = re.compile(r'Bad\sChk\sSum:\s+(?P<bad_chk_sum>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p55 = regex_engine.compile(r'Bad\sChk\sSum:\s+(?P<bad_chk_sum>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Bad TTL:            0 (  0.000%)
-        p56 = re.compile(r'Bad\sTTL:\s+(?P<bad_ttl>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p56 = regex_engine.compile(r'Bad\sTTL:\s+(?P<bad_ttl>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # S5 G 1:            0 (  0.000%)
-        p57 = re.compile(r'S5\sG\s1:\s+(?P<s5_g_1>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p57 = regex_engine.compile(r'S5\sG\s1:\s+(?P<s5_g_1>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # S5 G 2:            0 (  0.000%)
-        p58 = re.compile(r'S5\sG\s2:\s+(?P<s5_g_2>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p58 = regex_engine.compile(r'S5\sG\s2:\s+(?P<s5_g_2>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Total:            0
-        p59 = re.compile(r'Total:\s+(?P<total>\d+)$')
+        p59 = regex_engine.compile(r'Total:\s+(?P<total>\d+)$')
 
         # Alerts:            0 (  0.000%)
-        p60 = re.compile(r'Alerts:\s+(?P<alerts>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p60 = regex_engine.compile(r'Alerts:\s+(?P<alerts>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Logged:            0 (  0.000%)
-        p61 = re.compile(r'Logged:\s+(?P<logged>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p61 = regex_engine.compile(r'Logged:\s+(?P<logged>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         # Passed:            0 (  0.000%)
-        p62 = re.compile(r'Passed:\s+(?P<passed>\d+)\s+\(\s+\d+\.\d+\S\)$')
+        p62 = regex_engine.compile(r'Passed:\s+(?P<passed>\d+)\s+\(\s+\d+\.\d+\S\)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1164,457 +1164,457 @@ class ShowUtdEngineStandardStatisticsDaqAll(ShowUtdEngineStandardStatisticsDaqAl
         ret_dict = {}
 
         # IOS-XE DAQ Counters(Engine #1):
-        p1 = re.compile(r'^IOS-XE\sDAQ\sCounters+\(+\w+\s+\#(?P<engine_number>\d+)(\):)$')
+        p1 = regex_engine.compile(r'^IOS-XE\sDAQ\sCounters+\(+\w+\s+\#(?P<engine_number>\d+)(\):)$')
 
         # Frames received                         0
-        p2 = re.compile(r'^Frames\sreceived\s+(?P<frames_recevd>\d+)$')
+        p2 = regex_engine.compile(r'^Frames\sreceived\s+(?P<frames_recevd>\d+)$')
 
         # Bytes received                          0
-        p3 = re.compile(r'^Bytes\sreceived\s+(?P<bytes_recevd>\d+)$')
+        p3 = regex_engine.compile(r'^Bytes\sreceived\s+(?P<bytes_recevd>\d+)$')
         
         # RX frames released                      0
-        p4 = re.compile(r'^RX\sframes\sreleased\s+(?P<rx_frames_released>\d+)$')
+        p4 = regex_engine.compile(r'^RX\sframes\sreleased\s+(?P<rx_frames_released>\d+)$')
         
         # Packets after vPath decap               0
-        p5 = re.compile(r'^Packets\safter\svPath\sdecap\s+(?P<pkts_after_vpath_decap>\d+)$')
+        p5 = regex_engine.compile(r'^Packets\safter\svPath\sdecap\s+(?P<pkts_after_vpath_decap>\d+)$')
         
         # Bytes after vPath decap                 0
-        p6 = re.compile(r'^Bytes\safter\svPath\sdecap\s+(?P<bytes_after_vpath_decap>\d+)$')
+        p6 = regex_engine.compile(r'^Bytes\safter\svPath\sdecap\s+(?P<bytes_after_vpath_decap>\d+)$')
         
         # Packets before vPath encap              0
-        p7 = re.compile(r'^Packets\sbefore\svPath\sencap\s+(?P<pkts_before_vpath_encap>\d+)$')
+        p7 = regex_engine.compile(r'^Packets\sbefore\svPath\sencap\s+(?P<pkts_before_vpath_encap>\d+)$')
         
         # Bytes before vPath encap                0
-        p8 = re.compile(r'^Bytes\sbefore\svPath\sencap\s+(?P<bytes_before_vpath_encap>\d+)$')
+        p8 = regex_engine.compile(r'^Bytes\sbefore\svPath\sencap\s+(?P<bytes_before_vpath_encap>\d+)$')
         
         # Frames transmitted                      0
-        p9 = re.compile(r'^Frames\stransmitted\s+(?P<frames_transmitted>\d+)$')
+        p9 = regex_engine.compile(r'^Frames\stransmitted\s+(?P<frames_transmitted>\d+)$')
         
         # Bytes transmitted                       0
-        p10 = re.compile(r'^Bytes\stransmitted\s+(?P<bytes_transmitted>\d+)$')
+        p10 = regex_engine.compile(r'^Bytes\stransmitted\s+(?P<bytes_transmitted>\d+)$')
         
         # Frames injected                         0
-        p11 = re.compile(r'^Frames\sinjected\s+(?P<frames_injected>\d+)$')
+        p11 = regex_engine.compile(r'^Frames\sinjected\s+(?P<frames_injected>\d+)$')
         
         # Bytes injected                          0
-        p12 = re.compile(r'^Bytes\sinjected\s+(?P<bytes_injected>\d+)$')
+        p12 = regex_engine.compile(r'^Bytes\sinjected\s+(?P<bytes_injected>\d+)$')
         
         # Memory allocation                       388
-        p13 = re.compile(r'^Memory\sallocation\s+(?P<memory_allocation>\d+)$')
+        p13 = regex_engine.compile(r'^Memory\sallocation\s+(?P<memory_allocation>\d+)$')
         
         # Memory free                             0
-        p14 = re.compile(r'^Memory\sfree\s+(?P<memory_free>\d+)$')
+        p14 = regex_engine.compile(r'^Memory\sfree\s+(?P<memory_free>\d+)$')
         
         # Memory free via timer                   0
-        p15 = re.compile(r'^Memory\sfree\svia\stimer\s+(?P<memry_free_via_timer>\d+)$')
+        p15 = regex_engine.compile(r'^Memory\sfree\svia\stimer\s+(?P<memry_free_via_timer>\d+)$')
         
         # Merged packet buffer allocation         0
-        p16 = re.compile(r'^Merged\spacket\sbuffer\sallocation\s+(?P<merged_pkt_buffer_allocation>\d+)$')
+        p16 = regex_engine.compile(r'^Merged\spacket\sbuffer\sallocation\s+(?P<merged_pkt_buffer_allocation>\d+)$')
         
         # Merged packet buffer free               0
-        p17 = re.compile(r'^Merged\spacket\sbuffer\sfree\s+(?P<merged_pkt_buffer_free>\d+)$')
+        p17 = regex_engine.compile(r'^Merged\spacket\sbuffer\sfree\s+(?P<merged_pkt_buffer_free>\d+)$')
         
         # VPL buffer allocation                   0
-        p18 = re.compile(r'^VPL\sbuffer\sallocation\s+(?P<vpl_buffer_allocation>\d+)$')
+        p18 = regex_engine.compile(r'^VPL\sbuffer\sallocation\s+(?P<vpl_buffer_allocation>\d+)$')
         
         # VPL buffer free                         0
-        p19 = re.compile(r'^VPL\sbuffer\sfree\s+(?P<vpl_buffer_free>\d+)$')
+        p19 = regex_engine.compile(r'^VPL\sbuffer\sfree\s+(?P<vpl_buffer_free>\d+)$')
         
         # VPL buffer expand                       0
-        p20 = re.compile(r'^VPL\sbuffer\sexpand\s+(?P<vpl_buffer_expand>\d+)$')
+        p20 = regex_engine.compile(r'^VPL\sbuffer\sexpand\s+(?P<vpl_buffer_expand>\d+)$')
         
         # VPL buffer merge                        0
-        p21 = re.compile(r'^VPL\sbuffer\smerge\s+(?P<vpl_buffer_merge>\d+)$')
+        p21 = regex_engine.compile(r'^VPL\sbuffer\smerge\s+(?P<vpl_buffer_merge>\d+)$')
         
         # VPL buffer split                        0
-        p22 = re.compile(r'^VPL\sbuffer\ssplit\s+(?P<vpl_buffer_split>\d+)$')
+        p22 = regex_engine.compile(r'^VPL\sbuffer\ssplit\s+(?P<vpl_buffer_split>\d+)$')
         
         # VPL packet incomplete                   0
-        p23 = re.compile(r'^VPL\spacket\sincomplete\s+(?P<vpl_pkt_incomplete>\d+)$')
+        p23 = regex_engine.compile(r'^VPL\spacket\sincomplete\s+(?P<vpl_pkt_incomplete>\d+)$')
         
         # VPL API error                           0
-        p24 = re.compile(r'^VPL\sAPI\serror\s+(?P<vpl_api_error>\d+)$')
+        p24 = regex_engine.compile(r'^VPL\sAPI\serror\s+(?P<vpl_api_error>\d+)$')
         
         # Internal error                          0
-        p25 = re.compile(r'^Internal\serror\s+(|:)(?P<internal_error>\d+)$')
+        p25 = regex_engine.compile(r'^Internal\serror\s+(|:)(?P<internal_error>\d+)$')
         
         # External error                          0
-        p26 = re.compile(r'^External\serror\s+(|:)(?P<external_error>\d+)$')
+        p26 = regex_engine.compile(r'^External\serror\s+(|:)(?P<external_error>\d+)$')
         
         # Memory error                            0
-        p27 = re.compile(r'^Memory\serror\s+(|:)(?P<memory_error>\d+)$')
+        p27 = regex_engine.compile(r'^Memory\serror\s+(|:)(?P<memory_error>\d+)$')
         
         # Timer error                             0
-        p28 = re.compile(r'^Timer\serror\s+(|:)(?P<timer_error>\d+)$')
+        p28 = regex_engine.compile(r'^Timer\serror\s+(|:)(?P<timer_error>\d+)$')
         
         # SPPI Receive Packet error               0
-        p29 = re.compile(r'^SPPI\sReceive\sPacket\serror\s+(?P<sppi_receive_pkt_error>\d+)$')
+        p29 = regex_engine.compile(r'^SPPI\sReceive\sPacket\serror\s+(?P<sppi_receive_pkt_error>\d+)$')
         
         # SPPI Acquire Transmit Packet error      0
-        p30 = re.compile(r'^SPPI\sAcquire\sTransmit\sPacket\serror\s+(?P<sppi_acquire_pkt_error>\d+)$')
+        p30 = regex_engine.compile(r'^SPPI\sAcquire\sTransmit\sPacket\serror\s+(?P<sppi_acquire_pkt_error>\d+)$')
         
         # SPPI Inject Transmit Packet error       0
-        p31 = re.compile(r'^SPPI\sInject\sTransmit\sPacket\serror\s+(?P<sppi_inject_pkt_error>\d+)$')
+        p31 = regex_engine.compile(r'^SPPI\sInject\sTransmit\sPacket\serror\s+(?P<sppi_inject_pkt_error>\d+)$')
         
         # SPPI Encap Transmit Packet error        0
-        p32 = re.compile(r'^SPPI\sEncap\sTransmit\s\sPacket\serror\s+(?P<sppi_encap_transmit_pkt_error>\d+)$')
+        p32 = regex_engine.compile(r'^SPPI\sEncap\sTransmit\s\sPacket\serror\s+(?P<sppi_encap_transmit_pkt_error>\d+)$')
         
         # SPPI Internal error                     0
-        p33 = re.compile(r'^SPPI\sInternal\serror\s+(?P<sppi_internal_error>\d+)$')
+        p33 = regex_engine.compile(r'^SPPI\sInternal\serror\s+(?P<sppi_internal_error>\d+)$')
         
         # Kernel frames received                  0
-        p34 = re.compile(r'^Kernel\sframes\sreceived\s+(?P<kernel_frames_rcvd>\d+)$')
+        p34 = regex_engine.compile(r'^Kernel\sframes\sreceived\s+(?P<kernel_frames_rcvd>\d+)$')
         
         # Kernel frames dropped                   0
-        p35 = re.compile(r'^Kernel\sframes\sdropped\s+(?P<kernel_frames_drp>\d+)$')
+        p35 = regex_engine.compile(r'^Kernel\sframes\sdropped\s+(?P<kernel_frames_drp>\d+)$')
         
         # IOS-XE DAQ WCAPI Counters (Engine #1):
-        p36 = re.compile(r'^IOS-XE\sDAQ\sWCAPI\sCounters+\s+\(+\w+\s+\#(?P<engine_number>\d+)(\):)$')
+        p36 = regex_engine.compile(r'^IOS-XE\sDAQ\sWCAPI\sCounters+\s+\(+\w+\s+\#(?P<engine_number>\d+)(\):)$')
 
         # Messages received                       0
-        p37 = re.compile(r'^Messages\sreceived\s+(?P<mesages_recevd>\d+)$')
+        p37 = regex_engine.compile(r'^Messages\sreceived\s+(?P<mesages_recevd>\d+)$')
 
         # Messages transmitted                    0
-        p38 = re.compile(r'^Messages\stransmitted\s+(?P<messages_transmitted>\d+)$')
+        p38 = regex_engine.compile(r'^Messages\stransmitted\s+(?P<messages_transmitted>\d+)$')
         
         # Flow create received                    0
-        p39 = re.compile(r'^Flow\screate\sreceived\s+(?P<flow_create_recvd>\d+)$')
+        p39 = regex_engine.compile(r'^Flow\screate\sreceived\s+(?P<flow_create_recvd>\d+)$')
         
         # Flow create transmitted                 0               0
-        p40 = re.compile(r'^Flow\screate\stransmitted\s+(?P<flow_create_transmitted>\d+)$')
+        p40 = regex_engine.compile(r'^Flow\screate\stransmitted\s+(?P<flow_create_transmitted>\d+)$')
         
         # Flow close received                     0
-        p41 = re.compile(r'^Flow\sclose\sreceived\s+(?P<flow_close_recvd>\d+)$')
+        p41 = regex_engine.compile(r'^Flow\sclose\sreceived\s+(?P<flow_close_recvd>\d+)$')
         
         # Flow close transmitted                  0              0
-        p42 = re.compile(r'^Flow\sclose\stransmitted\s+(?P<flow_close_transmitted>\d+)$')
+        p42 = regex_engine.compile(r'^Flow\sclose\stransmitted\s+(?P<flow_close_transmitted>\d+)$')
         
         # Flow data received                      0
-        p43 = re.compile(r'^Flow\sdata\sreceived\s+(?P<flow_data_recvd>\d+)$')
+        p43 = regex_engine.compile(r'^Flow\sdata\sreceived\s+(?P<flow_data_recvd>\d+)$')
         
         # Flow data bytes received                0
-        p44 = re.compile(r'^Flow\sdata\sbytes\sreceived\s+(?P<flow_data_bytes_recvd>\d+)$$')
+        p44 = regex_engine.compile(r'^Flow\sdata\sbytes\sreceived\s+(?P<flow_data_bytes_recvd>\d+)$$')
         
         # Flow data transmitted                   0
-        p45 = re.compile(r'^Flow\sdata\stransmitted\s+(?P<flow_data_transmitted>\d+)$')
+        p45 = regex_engine.compile(r'^Flow\sdata\stransmitted\s+(?P<flow_data_transmitted>\d+)$')
         
         # Flow data bytes transmitted             0
-        p46 = re.compile(r'^Flow\sdata\sbytes\stransmitted\s+(?P<flow_data_bytes_transmitted>\d+)$')
+        p46 = regex_engine.compile(r'^Flow\sdata\sbytes\stransmitted\s+(?P<flow_data_bytes_transmitted>\d+)$')
         
         # Flow delete received                    0
-        p47 = re.compile(r'^Flow\sdelete\sreceived\s+(?P<flow_delete_recevd>\d+)$')
+        p47 = regex_engine.compile(r'^Flow\sdelete\sreceived\s+(?P<flow_delete_recevd>\d+)$')
         
         # Unknown type messages received          0
-        p48 = re.compile(r'^Unknown\stype\smessages\sreceived\s+(?P<unknown_type_msgs_rcvd>\d+)$')
+        p48 = regex_engine.compile(r'^Unknown\stype\smessages\sreceived\s+(?P<unknown_type_msgs_rcvd>\d+)$')
         
         # EBP cleanup received                    0
-        p49 = re.compile(r'^EBP\scleanup\sreceived\s+(?P<ebp_cleanup_recvd>\d+)$')
+        p49 = regex_engine.compile(r'^EBP\scleanup\sreceived\s+(?P<ebp_cleanup_recvd>\d+)$')
         
         # EBP cleanup transmitted                 0
-        p50 = re.compile(r'^EBP\scleanup\stransmitted\s+(?P<ebp_cleanup_transmitted>\d+)$')
+        p50 = regex_engine.compile(r'^EBP\scleanup\stransmitted\s+(?P<ebp_cleanup_transmitted>\d+)$')
         
         # Flow control injected                   0
-        p51 = re.compile(r'^Flow\scontrol\sinjected\s+(?P<flow_control_injected>\d+)$')
+        p51 = regex_engine.compile(r'^Flow\scontrol\sinjected\s+(?P<flow_control_injected>\d+)$')
         
         # Flow data injected                      0
-        p52 = re.compile(r'^Flow\sdata\sinjected\s+(?P<flow_data_injected>\d+)$')
+        p52 = regex_engine.compile(r'^Flow\sdata\sinjected\s+(?P<flow_data_injected>\d+)$')
         
         # Flow data bytes injected                0
-        p53 = re.compile(r'^Flow\sdata\sbytes\sinjected\s+(?P<flow_data_bytes_injected>\d+)$')
+        p53 = regex_engine.compile(r'^Flow\sdata\sbytes\sinjected\s+(?P<flow_data_bytes_injected>\d+)$')
         
         # Verdict allow                           0
-        p54 = re.compile(r'^Verdict\sallow\s+(?P<verdict_allow>\d+)$')
+        p54 = regex_engine.compile(r'^Verdict\sallow\s+(?P<verdict_allow>\d+)$')
         
         # Verdict deny                            0
-        p55 = re.compile(r'^Verdict\sdeny\s+(?P<verdict_deny>\d+)$')
+        p55 = regex_engine.compile(r'^Verdict\sdeny\s+(?P<verdict_deny>\d+)$')
         
         # Decryption policy verdict no-decrypt    0
-        p56 = re.compile(r'^Decryption\spolicy\sverdict\sno-decrypt\s+(?P<decrypt_policy_ver_no_decrypt>\d+)$')
+        p56 = regex_engine.compile(r'^Decryption\spolicy\sverdict\sno-decrypt\s+(?P<decrypt_policy_ver_no_decrypt>\d+)$')
         
         # Decryption policy verdict decrypt       0
-        p57 = re.compile(r'^Decryption\spolicy\sverdict\sdecrypt\s+(?P<decrypt_policy_ver_decrypt>\d+)$')
+        p57 = regex_engine.compile(r'^Decryption\spolicy\sverdict\sdecrypt\s+(?P<decrypt_policy_ver_decrypt>\d+)$')
         
         # Decryption policy verdict passthrough   0
-        p58 = re.compile(r'^Decryption\spolicy\sverdict\spassthrough\s+(?P<decrypt_policy_ver_passthrough>\d+)$')
+        p58 = regex_engine.compile(r'^Decryption\spolicy\sverdict\spassthrough\s+(?P<decrypt_policy_ver_passthrough>\d+)$')
         
         # Decryption policy verdict unknown       0
-        p59 = re.compile(r'^Decryption\spolicy\sverdict\sunknown\s+(?P<decrypt_policy_ver_unknown>\d+)$')
+        p59 = regex_engine.compile(r'^Decryption\spolicy\sverdict\sunknown\s+(?P<decrypt_policy_ver_unknown>\d+)$')
         
         # Flow create                             0
-        p60 = re.compile(r'^Flow\screate\s+(?P<flow_create>\d+)$')
+        p60 = regex_engine.compile(r'^Flow\screate\s+(?P<flow_create>\d+)$')
         
         # Flow delete                             0
-        p61 = re.compile(r'^Flow\sdelete\s+(?P<flow_delete>\d+)$')
+        p61 = regex_engine.compile(r'^Flow\sdelete\s+(?P<flow_delete>\d+)$')
         
         # Flow duplicate                          0
-        p62 = re.compile(r'^Flow\sduplicate\s+(?P<flow_duplicate>\d+)$')
+        p62 = regex_engine.compile(r'^Flow\sduplicate\s+(?P<flow_duplicate>\d+)$')
         
         # Flow data not found                     0
-        p63 = re.compile(r'^Flow\sdata\snot\sfound\s+(?P<flow_data_not_found>\d+)$')
+        p63 = regex_engine.compile(r'^Flow\sdata\snot\sfound\s+(?P<flow_data_not_found>\d+)$')
         
         # Flow close not found                    0
-        p64 = re.compile(r'^Flow\sclose\snot\sfound\s+(?P<flow_close_not_found>\d+)$')
+        p64 = regex_engine.compile(r'^Flow\sclose\snot\sfound\s+(?P<flow_close_not_found>\d+)$')
         
         # Flow delete not found                   0
-        p65 = re.compile(r'^Flow\sdelete\snot\sfound\s+(?P<flow_delete_not_found>\d+)$')
+        p65 = regex_engine.compile(r'^Flow\sdelete\snot\sfound\s+(?P<flow_delete_not_found>\d+)$')
         
         # Flow enqueue                            0
-        p66 = re.compile(r'^Flow\senqueue\s+(?P<flow_enqueue>\d+)$')
+        p66 = regex_engine.compile(r'^Flow\senqueue\s+(?P<flow_enqueue>\d+)$')
         
         # Flow dequeue                            0
-        p67 = re.compile(r'^Flow\sdequeue\s+(?P<flow_dequeue>\d+)$')
+        p67 = regex_engine.compile(r'^Flow\sdequeue\s+(?P<flow_dequeue>\d+)$')
         
         # Retry enqueue                           0
-        p68 = re.compile(r'^Retry\senqueue\s+(?P<retry_enqueue>\d+)$')
+        p68 = regex_engine.compile(r'^Retry\senqueue\s+(?P<retry_enqueue>\d+)$')
         
         # Retry dequeue                           0
-        p69 = re.compile(r'^Retry\sdequeue\s+(?P<retry_dequeue>\d+)$')
+        p69 = regex_engine.compile(r'^Retry\sdequeue\s+(?P<retry_dequeue>\d+)$')
         
         # Retry hold flow                         0
-        p70 = re.compile(r'^Retry\shold\sflow\s+(?P<retry_hold_flow>\d+)$')
+        p70 = regex_engine.compile(r'^Retry\shold\sflow\s+(?P<retry_hold_flow>\d+)$')
         
         # Retry release flow                      0
-        p71 = re.compile(r'^Retry\srelease\sflow\s+(?P<retry_release_flow>\d+)$')
+        p71 = regex_engine.compile(r'^Retry\srelease\sflow\s+(?P<retry_release_flow>\d+)$')
         
         # Retry add flow                          0
-        p72 = re.compile(r'^Retry\sadd\sflow\s+(?P<retry_add_flow>\d+)$')
+        p72 = regex_engine.compile(r'^Retry\sadd\sflow\s+(?P<retry_add_flow>\d+)$')
         
         # Closed enqueue                          0
-        p73 = re.compile(r'^Closed\senqueue\s+(?P<closed_enqueue>\d+)$')
+        p73 = regex_engine.compile(r'^Closed\senqueue\s+(?P<closed_enqueue>\d+)$')
         
         # Closed dequeue                          0
-        p74 = re.compile(r'^Closed\sdequeue\s+(?P<closed_dequeue>\d+)$')
+        p74 = regex_engine.compile(r'^Closed\sdequeue\s+(?P<closed_dequeue>\d+)$')
         
         # Socket messages received                0
-        p75 = re.compile(r'^Socket\smessages\sreceived\s+(?P<socket_msg_recvd>\d+)$')
+        p75 = regex_engine.compile(r'^Socket\smessages\sreceived\s+(?P<socket_msg_recvd>\d+)$')
         
         # Socket server ready messages received   0
-        p76 = re.compile(r'^Socket\sserver\sready\smessages\sreceived\s+(?P<socket_ser_ready_msg_recvd>\d+)$')
+        p76 = regex_engine.compile(r'^Socket\sserver\sready\smessages\sreceived\s+(?P<socket_ser_ready_msg_recvd>\d+)$')
         
         # Socket sipc open failed msgs received   0
-        p77 = re.compile(r'^Socket\ssipc\sopen\sfailed\smsgs\sreceived\s+(?P<socket_sipc_open_failed_msgs_rcvd>\d+)$')
+        p77 = regex_engine.compile(r'^Socket\ssipc\sopen\sfailed\smsgs\sreceived\s+(?P<socket_sipc_open_failed_msgs_rcvd>\d+)$')
         
         # Socket new sipc msg messages received   0
-        p78 = re.compile(r'^Socket\snew\ssipc\smsg\smessages\sreceived\s+(?P<socket_new_sipc_messages_rcvd>\d+)$')
+        p78 = regex_engine.compile(r'^Socket\snew\ssipc\smsg\smessages\sreceived\s+(?P<socket_new_sipc_messages_rcvd>\d+)$')
         
         # Socket unexpected new sipc msg messages received0
-        p79 = re.compile(r'^Socket\sunexpected\snew\ssipc\smsg\smessages\sreceived(?P<sock_unexp_nw_sipc_msg_msgs_rcvd>\d+)$')
+        p79 = regex_engine.compile(r'^Socket\sunexpected\snew\ssipc\smsg\smessages\sreceived(?P<sock_unexp_nw_sipc_msg_msgs_rcvd>\d+)$')
         
         # Socket server down messages received    0
-        p80 = re.compile(r'^Socket\sserver\sdown\smessages\sreceived\s+(?P<socket_ser_down_msg_recvd>\d+)$')
+        p80 = regex_engine.compile(r'^Socket\sserver\sdown\smessages\sreceived\s+(?P<socket_ser_down_msg_recvd>\d+)$')
         
         # Socket TX socket ready msgs received    0
-        p81 = re.compile(r'^Socket\sTX\ssocket\sready\smsgs\sreceived\s+(?P<socket_tx_socket_ready_msg_recvd>\d+)$')
+        p81 = regex_engine.compile(r'^Socket\sTX\ssocket\sready\smsgs\sreceived\s+(?P<socket_tx_socket_ready_msg_recvd>\d+)$')
         
         # Socket TX sock conn failed msgs rcvd    0
-        p82 = re.compile(r'^Socket\sTX\ssock\sconn\sfailed\smsgs\srcvd\s+(?P<sock_tx_sockconn_failed_msg_rcvd>\d+)$')
+        p82 = regex_engine.compile(r'^Socket\sTX\ssock\sconn\sfailed\smsgs\srcvd\s+(?P<sock_tx_sockconn_failed_msg_rcvd>\d+)$')
         
         # Socket unknown uds msg msgs received    0
-        p83 = re.compile(r'^Socket\sunknown\suds\smsg\smsgs\sreceived\s+(?P<sock_unknown_uds_msg_msgs_rcvd>\d+)$')
+        p83 = regex_engine.compile(r'^Socket\sunknown\suds\smsg\smsgs\sreceived\s+(?P<sock_unknown_uds_msg_msgs_rcvd>\d+)$')
         
         # Socket unknown messages received        0
-        p84 = re.compile(r'^Socket\sunknown\smessages\sreceived\s+(?P<sock_unknown_msgs_rcvd>\d+)$')
+        p84 = regex_engine.compile(r'^Socket\sunknown\smessages\sreceived\s+(?P<sock_unknown_msgs_rcvd>\d+)$')
         
         # TX socket messages received             0
-        p85 = re.compile(r'^TX\ssocket\smessages\sreceived\s+(?P<tx_sock_msgs_rcvd>\d+)$')
+        p85 = regex_engine.compile(r'^TX\ssocket\smessages\sreceived\s+(?P<tx_sock_msgs_rcvd>\d+)$')
         
         # TX socket resume messages received      0
-        p86 = re.compile(r'^TX\ssocket\sresume\smessages\sreceived\s+(?P<tx_sock_resume_msgs_rcvd>\d+)$')
+        p86 = regex_engine.compile(r'^TX\ssocket\sresume\smessages\sreceived\s+(?P<tx_sock_resume_msgs_rcvd>\d+)$')
         
         # TX socket unknown messages received     0
-        p87 = re.compile(r'^TX\ssocket\sunknown\smessages\sreceived\s+(?P<tx_sock_unknown_msgs_rcvd>\d+)$')
+        p87 = regex_engine.compile(r'^TX\ssocket\sunknown\smessages\sreceived\s+(?P<tx_sock_unknown_msgs_rcvd>\d+)$')
         
         # TX paused                               0
-        p88 = re.compile(r'^TX\spaused\s+(?P<tx_paused>\d+)$')
+        p88 = regex_engine.compile(r'^TX\spaused\s+(?P<tx_paused>\d+)$')
         
         # EBP get buffer local                    0
-        p89 = re.compile(r'^EBP\sget\sbuffer\slocal\s+(?P<ebp_get_buffer_local>\d+)$')
+        p89 = regex_engine.compile(r'^EBP\sget\sbuffer\slocal\s+(?P<ebp_get_buffer_local>\d+)$')
         
         # EBP get buffer local error              0
-        p90 = re.compile(r'^EBP\sget\sbuffer\slocal\serror\s+(?P<ebp_get_buffer_local_error>\d+)$')
+        p90 = regex_engine.compile(r'^EBP\sget\sbuffer\slocal\serror\s+(?P<ebp_get_buffer_local_error>\d+)$')
         
         # EBP return buffer local                 0
-        p91 = re.compile(r'^EBP\sreturn\sbuffer\slocal\s+(?P<ebp_return_buffer_local>\d+)$')
+        p91 = regex_engine.compile(r'^EBP\sreturn\sbuffer\slocal\s+(?P<ebp_return_buffer_local>\d+)$')
         
         # EBP return buffer                       0
-        p92 = re.compile(r'^EBP\sreturn\sbuffer\s+(?P<ebp_return_buffer>\d+)$')
+        p92 = regex_engine.compile(r'^EBP\sreturn\sbuffer\s+(?P<ebp_return_buffer>\d+)$')
         
         # Sleep                                   0
-        p93 = re.compile(r'^Sleep\s+(?P<sleep>\d+)$')
+        p93 = regex_engine.compile(r'^Sleep\s+(?P<sleep>\d+)$')
         
         # Sleep set flag                          0
-        p94 = re.compile(r'^Sleep\sset\sflag\s+(?P<sleep_set_flag>\d+)$')
+        p94 = regex_engine.compile(r'^Sleep\sset\sflag\s+(?P<sleep_set_flag>\d+)$')
         
         # HTX up                                  0
-        p95 = re.compile(r'^HTX\sup\s+(?P<htx_up>\d+)$')
+        p95 = regex_engine.compile(r'^HTX\sup\s+(?P<htx_up>\d+)$')
         
         # HTX down                                0
-        p96 = re.compile(r'^HTX\sdown\s+(?P<htx_down>\d+)$')
+        p96 = regex_engine.compile(r'^HTX\sdown\s+(?P<htx_down>\d+)$')
         
         # WCAPI error                             0
-        p97 = re.compile(r'^WCAPI\serror\s+(?P<wcapi_error>\d+)$')
+        p97 = regex_engine.compile(r'^WCAPI\serror\s+(?P<wcapi_error>\d+)$')
         
         # VPL Stats(Engine #1):
-        p98 = re.compile(r'^VPL\sStats+\(+\w+\s+\#(?P<engine_number>\d+)(\):)$')
+        p98 = regex_engine.compile(r'^VPL\sStats+\(+\w+\s+\#(?P<engine_number>\d+)(\):)$')
         
         # vPath 802.3 packets received            0
-        p99 = re.compile(r'^vPath\s802.3\spackets+\sreceived\s+(?P<vpath_802_3_pkts_rcvd>\d+)$')
+        p99 = regex_engine.compile(r'^vPath\s802.3\spackets+\sreceived\s+(?P<vpath_802_3_pkts_rcvd>\d+)$')
         
         # vPath IPv4 packets received             0
-        p100 = re.compile(r'^vPath\sIPv4\spackets+\sreceived\s+(?P<vpath_ipv4_pkts_rcvd>\d+)$')
+        p100 = regex_engine.compile(r'^vPath\sIPv4\spackets+\sreceived\s+(?P<vpath_ipv4_pkts_rcvd>\d+)$')
         
         # vPath packets transmitted               0
-        p101 = re.compile(r'^vPath\spackets+\stransmitted\s+(?P<vpath_pkts_transmitted>\d+)$')
+        p101 = regex_engine.compile(r'^vPath\spackets+\stransmitted\s+(?P<vpath_pkts_transmitted>\d+)$')
         
         # vPath IPv4 ping packets received        0
-        p102 = re.compile(r'^vPath\sIPv4\sping\spackets+\sreceived\s+(?P<vpath_ipv4_ping_pkts_rcvd>\d+)$')
+        p102 = regex_engine.compile(r'^vPath\sIPv4\sping\spackets+\sreceived\s+(?P<vpath_ipv4_ping_pkts_rcvd>\d+)$')
         
         # vPath version 0 packets received        0
-        p103 = re.compile(r'^vPath\sversion\s0\spackets+\sreceived\s+(?P<vpath_ver_0_pkts_rcvd>\d+)$')
+        p103 = regex_engine.compile(r'^vPath\sversion\s0\spackets+\sreceived\s+(?P<vpath_ver_0_pkts_rcvd>\d+)$')
         
         # non-snap 802.3 packets received         0
-        p104 = re.compile(r'^non-snap\s802.3\spackets+\sreceived\s+(?P<non_snap_802_3_pkts_rcvd>\d+)$')
+        p104 = regex_engine.compile(r'^non-snap\s802.3\spackets+\sreceived\s+(?P<non_snap_802_3_pkts_rcvd>\d+)$')
         
         # non-Cisco 802.3 packets received        0
-        p105 = re.compile(r'^non-Cisco\s802.3\spackets+\sreceived\s+(?P<non_cisco_802_3_pkts_rcvd>\d+)$')
+        p105 = regex_engine.compile(r'^non-Cisco\s802.3\spackets+\sreceived\s+(?P<non_cisco_802_3_pkts_rcvd>\d+)$')
         
         # non-IPv4 packets received               0
-        p106 = re.compile(r'^non-IPv4\spackets+\sreceived\s+(?P<non_ipv4_pkts_rcvd>\d+)$')
+        p106 = regex_engine.compile(r'^non-IPv4\spackets+\sreceived\s+(?P<non_ipv4_pkts_rcvd>\d+)$')
         
         # non-IPv4 UDP packets received           0
-        p107 = re.compile(r'^non-IPv4\sUDP\spackets+\sreceived\s+(?P<non_ipv4_udp_pkts_rcvd>\d+)$')
+        p107 = regex_engine.compile(r'^non-IPv4\sUDP\spackets+\sreceived\s+(?P<non_ipv4_udp_pkts_rcvd>\d+)$')
         
         # non-vPath 802.3 packets received        0
-        p108 = re.compile(r'^non-vPath\s802.3\spackets+\sreceived\s+(?P<non_vpath_802_3_pkts_rcvd>\d+)$')
+        p108 = regex_engine.compile(r'^non-vPath\s802.3\spackets+\sreceived\s+(?P<non_vpath_802_3_pkts_rcvd>\d+)$')
         
         # non-vPath dot1q packets received        0
-        p109 = re.compile(r'^non-vPath\sdot1q\spackets+\sreceived\s+(?P<non_vpath_dot1q_pkts_rcvd>\d+)$')
+        p109 = regex_engine.compile(r'^non-vPath\sdot1q\spackets+\sreceived\s+(?P<non_vpath_dot1q_pkts_rcvd>\d+)$')
         
         # non-vPath IPv4 packets received         0
-        p110 = re.compile(r'^non-vPath\sIPv4\spackets\sreceived\s+(?P<non_vpath_ipv4_pkts_rcvd>\d+)$')
+        p110 = regex_engine.compile(r'^non-vPath\sIPv4\spackets\sreceived\s+(?P<non_vpath_ipv4_pkts_rcvd>\d+)$')
         
         # non-vPath IPv4 UDP packets received     0
-        p111 = re.compile(r'^non-vPath\sIPv4\sUDP\spackets\sreceived\s+(?P<non_vpath_ipv4_udp_pkts_rcvd>\d+)$')
+        p111 = regex_engine.compile(r'^non-vPath\sIPv4\sUDP\spackets\sreceived\s+(?P<non_vpath_ipv4_udp_pkts_rcvd>\d+)$')
         
         # non-vPath IPv4 GRE packets received     0
-        p112 = re.compile(r'^non-vPath\sIPv4\sGRE\spackets\sreceived\s+(?P<non_vpath_ipv4_gre_pkts_rcvd>\d+)$')
+        p112 = regex_engine.compile(r'^non-vPath\sIPv4\sGRE\spackets\sreceived\s+(?P<non_vpath_ipv4_gre_pkts_rcvd>\d+)$')
         
         # non-vPath MAC packets received          0
-        p113 = re.compile(r'^non-vPath\sMAC\spackets+\sreceived\s+(?P<non_vpath_mac_pkts_rcvd>\d+)$')
+        p113 = regex_engine.compile(r'^non-vPath\sMAC\spackets+\sreceived\s+(?P<non_vpath_mac_pkts_rcvd>\d+)$')
         
         # vPath version mismatch packets received 0
-        p114 = re.compile(r'^vPath\sversion\smismatch\spackets\sreceived\s+(?P<vpath_ver_mismtch_pkts_rcvd>\d+)$')
+        p114 = regex_engine.compile(r'^vPath\sversion\smismatch\spackets\sreceived\s+(?P<vpath_ver_mismtch_pkts_rcvd>\d+)$')
         
         # checksum mismatch packets received      0
-        p115 = re.compile(r'^checksum\smismatch\spackets\sreceived\s+(?P<checksum_mismtch_pkts_rcvd>\d+)$')
+        p115 = regex_engine.compile(r'^checksum\smismatch\spackets\sreceived\s+(?P<checksum_mismtch_pkts_rcvd>\d+)$')
         
         # IP inst fragments                       0
-        p116 = re.compile(r'^IP\sinst\sfragments\s+(?P<ip_inst_fragments>\d+)$')
+        p116 = regex_engine.compile(r'^IP\sinst\sfragments\s+(?P<ip_inst_fragments>\d+)$')
         
         # IP fragmented packets                   0
-        p117 = re.compile(r'^IP\sfragmented\spackets\s+(?P<ip_fragmented_packets>\d+)$')
+        p117 = regex_engine.compile(r'^IP\sfragmented\spackets\s+(?P<ip_fragmented_packets>\d+)$')
         
         # IP aged fragmented packets              0
-        p118 = re.compile(r'^IP\saged\sfragmented\spackets\s+(?P<ip_aged_fragmented_packets>\d+)$')
+        p118 = regex_engine.compile(r'^IP\saged\sfragmented\spackets\s+(?P<ip_aged_fragmented_packets>\d+)$')
         
         # IP exceed max fragmented packets        0
-        p119 = re.compile(r'^IP\sexceed\smax\sfragmented\spackets\s+(?P<ip_exceed_max_fragmented_packets>\d+)$')
+        p119 = regex_engine.compile(r'^IP\sexceed\smax\sfragmented\spackets\s+(?P<ip_exceed_max_fragmented_packets>\d+)$')
         
         # IP overlapping fragments                0
-        p120 = re.compile(r'^IP\soverlapping\sfragments\s+(?P<ip_overlapping_fragments>\d+)$')
+        p120 = regex_engine.compile(r'^IP\soverlapping\sfragments\s+(?P<ip_overlapping_fragments>\d+)$')
         
         # IP exceed fragments per packet          0
-        p121 = re.compile(r'^IP\sexceed\sfragments\sper\spacket\s+(?P<ip_exceed_fragments_per_pkt>\d+)$')
+        p121 = regex_engine.compile(r'^IP\sexceed\sfragments\sper\spacket\s+(?P<ip_exceed_fragments_per_pkt>\d+)$')
         
         # IP exceed length fragmented packets     0
-        p122 = re.compile(r'^IP\sexceed\slength\sfragmented\spackets\s+(?P<ip_exceed_len_fragmented_pkt>\d+)$')
+        p122 = regex_engine.compile(r'^IP\sexceed\slength\sfragmented\spackets\s+(?P<ip_exceed_len_fragmented_pkt>\d+)$')
         
         # IP tiny fragmented packets              0
-        p123 = re.compile(r'^IP\stiny\sfragmented\spackets\s+(?P<ip_tiny_fragmented_pkt>\d+)$')
+        p123 = regex_engine.compile(r'^IP\stiny\sfragmented\spackets\s+(?P<ip_tiny_fragmented_pkt>\d+)$')
         
         # IP bad length fragmented packets        0
-        p124 = re.compile(r'^IP\sbad\slength\sfragmented\spackets\s+(?P<ip_bad_length_fragmented_pkt>\d+)$')
+        p124 = regex_engine.compile(r'^IP\sbad\slength\sfragmented\spackets\s+(?P<ip_bad_length_fragmented_pkt>\d+)$')
         
         # L2 inst fragments                       0
-        p125 = re.compile(r'^L2\sinst\sfragments\s+(?P<l2_inst_fragments>\d+)$')
+        p125 = regex_engine.compile(r'^L2\sinst\sfragments\s+(?P<l2_inst_fragments>\d+)$')
         
         # L2 fragmented packets                   0
-        p126 = re.compile(r'^L2\sfragmented\spackets\s+(?P<l2_fragmented_packets>\d+)$')
+        p126 = regex_engine.compile(r'^L2\sfragmented\spackets\s+(?P<l2_fragmented_packets>\d+)$')
         
         # L2 aged fragmented packets              0
-        p127 = re.compile(r'^L2\saged\sfragmented\spackets\s+(?P<l2_aged_fragmented_packets>\d+)$')
+        p127 = regex_engine.compile(r'^L2\saged\sfragmented\spackets\s+(?P<l2_aged_fragmented_packets>\d+)$')
         
         # L2 exceed max fragmented packets        0
-        p128 = re.compile(r'^L2\sexceed\smax\sfragmented\spackets\s+(?P<l2_exceed_max_fragmented_packets>\d+)$')
+        p128 = regex_engine.compile(r'^L2\sexceed\smax\sfragmented\spackets\s+(?P<l2_exceed_max_fragmented_packets>\d+)$')
         
         # L2 overlapping fragments                0
-        p129 = re.compile(r'^L2\soverlapping\sfragments\s+(?P<l2_overlapping_fragments>\d+)$')
+        p129 = regex_engine.compile(r'^L2\soverlapping\sfragments\s+(?P<l2_overlapping_fragments>\d+)$')
         
         # L2 exceed fragments per packet          0
-        p130 = re.compile(r'^L2\sexceed\sfragments\sper\spacket\s+(?P<l2_exceed_fragments_per_pkt>\d+)$')
+        p130 = regex_engine.compile(r'^L2\sexceed\sfragments\sper\spacket\s+(?P<l2_exceed_fragments_per_pkt>\d+)$')
         
         # L2 exceed length fragmented packets     0
-        p131 = re.compile(r'^L2\sexceed\slength\sfragmented\spackets\s+(?P<l2_exceed_len_fragmented_pkt>\d+)$')
+        p131 = regex_engine.compile(r'^L2\sexceed\slength\sfragmented\spackets\s+(?P<l2_exceed_len_fragmented_pkt>\d+)$')
         
         # L2 tiny fragmented packets              0
-        p132 = re.compile(r'^L2\stiny\sfragmented\spackets\s+(?P<l2_tiny_fragmented_pkt>\d+)$')
+        p132 = regex_engine.compile(r'^L2\stiny\sfragmented\spackets\s+(?P<l2_tiny_fragmented_pkt>\d+)$')
         
         # L2 bad length fragmented packets        0
-        p133 = re.compile(r'^L2\sbad\slength\sfragmented\spackets\s+(?P<l2_bad_length_fragmented_pkt>\d+)$')
+        p133 = regex_engine.compile(r'^L2\sbad\slength\sfragmented\spackets\s+(?P<l2_bad_length_fragmented_pkt>\d+)$')
         
         # decap packet API calls                  0
-        p134 = re.compile(r'^decap\spacket\sAPI\scalls\s+(?P<deacp_pkt_api_calls>\d+)$')
+        p134 = regex_engine.compile(r'^decap\spacket\sAPI\scalls\s+(?P<deacp_pkt_api_calls>\d+)$')
         
         # encap gen packet API calls              0
-        p135 = re.compile(r'^encap\sgen\spacket\sAPI\scalls\s+(?P<encap_gen_pkt_api_calls>\d+)$')
+        p135 = regex_engine.compile(r'^encap\sgen\spacket\sAPI\scalls\s+(?P<encap_gen_pkt_api_calls>\d+)$')
         
         # encap nw packet API calls               0
-        p136 = re.compile(r'^encap\snw\spacket\sAPI\scalls\s+(?P<encap_nw_pkt_api_calls>\d+)$')
+        p136 = regex_engine.compile(r'^encap\snw\spacket\sAPI\scalls\s+(?P<encap_nw_pkt_api_calls>\d+)$')
         
         # decap packet API errors                 0
-        p137 = re.compile(r'^decap\spacket\sAPI\serrors\s+(?P<deacp_pkt_api_errors>\d+)$')
+        p137 = regex_engine.compile(r'^decap\spacket\sAPI\serrors\s+(?P<deacp_pkt_api_errors>\d+)$')
         
         # encap gen API errors                    0
-        p138 = re.compile(r'^encap\sgen\sAPI\serrors\s+(?P<encap_gen_api_errors>\d+)$')
+        p138 = regex_engine.compile(r'^encap\sgen\sAPI\serrors\s+(?P<encap_gen_api_errors>\d+)$')
         
         # encap nw API errors                     0
-        p139 = re.compile(r'^encap\snw\sAPI\serrors\s+(?P<encap_nw_api_errors>\d+)$')
+        p139 = regex_engine.compile(r'^encap\snw\sAPI\serrors\s+(?P<encap_nw_api_errors>\d+)$')
         
         # IOS-XE DAQ CP Counters(Engine #1):
-        p140 = re.compile(r'^IOS-XE\sDAQ\sCP\sCounters\(+\w+\s+\#(?P<engine_number>\d+)(\):)$')
+        p140 = regex_engine.compile(r'^IOS-XE\sDAQ\sCP\sCounters\(+\w+\s+\#(?P<engine_number>\d+)(\):)$')
         
         # Packets received                        :3488
-        p141 = re.compile(r'^Packets\sreceived\s+:(?P<packet_received>\d+)$')
+        p141 = regex_engine.compile(r'^Packets\sreceived\s+:(?P<packet_received>\d+)$')
         
         # Bytes received                          :237156
-        p142 = re.compile(r'^Bytes\sreceived\s+:(?P<bytes_received>\d+)$')
+        p142 = regex_engine.compile(r'^Bytes\sreceived\s+:(?P<bytes_received>\d+)$')
         
         # Packets transmitted                     :3488
-        p143 = re.compile(r'^Packets\stransmitted\s+:(?P<packets_transmitted>\d+)$')
+        p143 = regex_engine.compile(r'^Packets\stransmitted\s+:(?P<packets_transmitted>\d+)$')
         
         # Bytes transmitted                       :362688
-        p144 = re.compile(r'^Bytes\stransmitted\s+:(?P<bytes_transmitted>\d+)$')
+        p144 = regex_engine.compile(r'^Bytes\stransmitted\s+:(?P<bytes_transmitted>\d+)$')
         
         # Memory allocation                       :3490
-        p145 = re.compile(r'^Memory\sallocation\s+:(?P<memory_allocation>\d+)$')
+        p145 = regex_engine.compile(r'^Memory\sallocation\s+:(?P<memory_allocation>\d+)$')
         
         # Memory free                             :3488
-        p146 = re.compile(r'^Memory\sfree\s+:(?P<memory_free>\d+)$')
+        p146 = regex_engine.compile(r'^Memory\sfree\s+:(?P<memory_free>\d+)$')
         
         # VPL API error                           :0
-        p147 = re.compile(r'^VPL\sAPI\serror\s+:(?P<vpl_api_error>\d+)$')
+        p147 = regex_engine.compile(r'^VPL\sAPI\serror\s+:(?P<vpl_api_error>\d+)$')
         
         # RX ring full                            0
-        p148 = re.compile(r'^RX\sring\sfull\s+(?P<rx_ring_full>\d+)$')
+        p148 = regex_engine.compile(r'^RX\sring\sfull\s+(?P<rx_ring_full>\d+)$')
         
         # Memory status changed to yellow         :0
-        p149 = re.compile(r'^Memory\sstatus\schanged\sto\syellow\s+:(?P<memry_status_changed_to_yellow>\d+)$')
+        p149 = regex_engine.compile(r'^Memory\sstatus\schanged\sto\syellow\s+:(?P<memry_status_changed_to_yellow>\d+)$')
         
         # Memory status changed to red            :0
-        p150 = re.compile(r'^Memory\sstatus\schanged\sto\sred\s+:(?P<memry_status_changed_to_red>\d+)$')
+        p150 = regex_engine.compile(r'^Memory\sstatus\schanged\sto\sred\s+:(?P<memry_status_changed_to_red>\d+)$')
         
         # Process restart notifications           :0
-        p151 = re.compile(r'^Process\srestart\snotifications\s+:(?P<process_restart_notifications>\d+)$')
+        p151 = regex_engine.compile(r'^Process\srestart\snotifications\s+:(?P<process_restart_notifications>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -2732,58 +2732,58 @@ class ShowUtdEngineStandardStatisticsUrl(ShowUtdEngineStandardStatisticsUrlSchem
         utm_data_dict = {}
 
         # URL Filter Requests Sent: 0 0
-        p1 = re.compile(r'^URL\sFilter\sRequests\sSent:\s+(?P<url_filter_request_sent>\d+\s+\d+)$')
+        p1 = regex_engine.compile(r'^URL\sFilter\sRequests\sSent:\s+(?P<url_filter_request_sent>\d+\s+\d+)$')
 
         # URL Filter Response Received: 0 0
-        p2 = re.compile(r'^URL\sFilter\sResponse\sReceived:\s+(?P<url_filter_response_recvd>\d+\s+\d+)$')
+        p2 = regex_engine.compile(r'^URL\sFilter\sResponse\sReceived:\s+(?P<url_filter_response_recvd>\d+\s+\d+)$')
 
         # Blacklist Hit Count: 0 0
-        p3 = re.compile(r'^Blacklist\sHit\sCount:\s+(?P<blacklist_hit_count>\d+\s+\d+)$')
+        p3 = regex_engine.compile(r'^Blacklist\sHit\sCount:\s+(?P<blacklist_hit_count>\d+\s+\d+)$')
 
         # Whitelist Hit Count: 0 0
-        p4 = re.compile(r'^Whitelist\sHit\sCount:\s+(?P<whitelist_hit_count>\d+\s+\d+)$')
+        p4 = regex_engine.compile(r'^Whitelist\sHit\sCount:\s+(?P<whitelist_hit_count>\d+\s+\d+)$')
 
         # Reputation Lookup Count: 0 0
-        p5 = re.compile(r'^Reputation\sLookup\sCount:\s+(?P<reputation_lookup_count>\d+\s+\d+)$')
+        p5 = regex_engine.compile(r'^Reputation\sLookup\sCount:\s+(?P<reputation_lookup_count>\d+\s+\d+)$')
 
         # Reputation Action Block: 0 0
-        p6 = re.compile(r'^Reputation\sAction\sBlock:\s+(?P<reputation_act_block>\d+\s+\d+)$')
+        p6 = regex_engine.compile(r'^Reputation\sAction\sBlock:\s+(?P<reputation_act_block>\d+\s+\d+)$')
 
         #  Reputation Action Pass: 0 0
-        p7 = re.compile(r'^Reputation\sAction\sPass:\s+(?P<reputation_act_pass>\d+\s+\d+)$')
+        p7 = regex_engine.compile(r'^Reputation\sAction\sPass:\s+(?P<reputation_act_pass>\d+\s+\d+)$')
 
         # Reputation Action Default Pass: 0 0
-        p8 = re.compile(r'^Reputation\sAction\sDefault\sPass:\s+(?P<reputation_act_def_pass>\d+\s+\d+)$')
+        p8 = regex_engine.compile(r'^Reputation\sAction\sDefault\sPass:\s+(?P<reputation_act_def_pass>\d+\s+\d+)$')
 
         #  Reputation Action Default Block: 0 0
-        p9 = re.compile(r'^Reputation\sAction\sDefault\sBlock:\s+(?P<reputation_act_def_block>\d+\s+\d+)$')
+        p9 = regex_engine.compile(r'^Reputation\sAction\sDefault\sBlock:\s+(?P<reputation_act_def_block>\d+\s+\d+)$')
 
         # Reputation Score None: 0 0
-        p10 = re.compile(r'^Reputation\sScore\sNone:\s+(?P<reputation_score_none>\d+\s+\d+)$')
+        p10 = regex_engine.compile(r'^Reputation\sScore\sNone:\s+(?P<reputation_score_none>\d+\s+\d+)$')
 
         # Reputation Score Out of Range: 0 0
-        p11 = re.compile(r'^Reputation\sScore\sOut\sof\sRange:\s+(?P<reputation_score_out_range>\d+\s+\d+)$')
+        p11 = regex_engine.compile(r'^Reputation\sScore\sOut\sof\sRange:\s+(?P<reputation_score_out_range>\d+\s+\d+)$')
 
         # Category Lookup Count: 0 0
-        p12 = re.compile(r'^Category\sLookup\sCount:\s+(?P<category_lookup_count>\d+\s+\d+)$')
+        p12 = regex_engine.compile(r'^Category\sLookup\sCount:\s+(?P<category_lookup_count>\d+\s+\d+)$')
 
         # Category Action Block: 0 0
-        p13 = re.compile(r'^Category\sAction\sBlock:\s+(?P<category_act_block>\d+\s+\d+)$')
+        p13 = regex_engine.compile(r'^Category\sAction\sBlock:\s+(?P<category_act_block>\d+\s+\d+)$')
 
         # Category Action Pass: 0 0
-        p14 = re.compile(r'^Category\sAction\sPass:\s+(?P<category_act_pass>\d+\s+\d+)$')
+        p14 = regex_engine.compile(r'^Category\sAction\sPass:\s+(?P<category_act_pass>\d+\s+\d+)$')
 
         # Category Action Default Pass: 0 0
-        p15 = re.compile(r'^Category\sAction\sDefault\sPass:\s+(?P<category_act_def_pass>\d+\s+\d+)$')
+        p15 = regex_engine.compile(r'^Category\sAction\sDefault\sPass:\s+(?P<category_act_def_pass>\d+\s+\d+)$')
 
         # Category Action Default Block: 0 0
-        p16 = re.compile(r'^Category\sAction\sDefault\sBlock:\s+(?P<category_act_def_block>\d+\s+\d+)$')
+        p16 = regex_engine.compile(r'^Category\sAction\sDefault\sBlock:\s+(?P<category_act_def_block>\d+\s+\d+)$')
 
         # Category None: 0 0
-        p17 = re.compile(r'^Category\sNone:\s+(?P<category_none>\d+\s+\d+)$')
+        p17 = regex_engine.compile(r'^Category\sNone:\s+(?P<category_none>\d+\s+\d+)$')
 
         # Category Out of Range: 0 0
-        p18 = re.compile(r'^Category\sOut\sof\sRange:\s+(?P<category_out_range>\d+\s+\d+)$')
+        p18 = regex_engine.compile(r'^Category\sOut\sof\sRange:\s+(?P<category_out_range>\d+\s+\d+)$')
 
 
         for line in output.splitlines():
@@ -2990,52 +2990,52 @@ class ShowUtdEngineStandardConfig(ShowUtdEngineStandardConfigSchema):
         parsed_dict = {}
 
         # Unified Policy: Enabled
-        p1 = re.compile(r'^Unified\s+Policy:\s+(?P<status>\w+)$')
+        p1 = regex_engine.compile(r'^Unified\s+Policy:\s+(?P<status>\w+)$')
 
         # URL-Filtering Cloud Lookup: Enabled
-        p2 = re.compile(r'^URL-Filtering\s+Cloud\s+Lookup:\s+(?P<status>\w+)$')
+        p2 = regex_engine.compile(r'^URL-Filtering\s+Cloud\s+Lookup:\s+(?P<status>\w+)$')
         
         # URL-Filtering On-box Lookup: Disabled
-        p3 = re.compile(r'^URL-Filtering\s+On-box\s+Lookup:\s+(?P<status>\w+)$')
+        p3 = regex_engine.compile(r'^URL-Filtering\s+On-box\s+Lookup:\s+(?P<status>\w+)$')
         
         # File-Reputation Cloud Lookup: Disabled
-        p4 = re.compile(r'^File-Reputation\s+Cloud\s+Lookup:\s+(?P<status>\w+)$')
+        p4 = regex_engine.compile(r'^File-Reputation\s+Cloud\s+Lookup:\s+(?P<status>\w+)$')
         
         # File-Analysis Cloud Submission: Disabled
-        p5 = re.compile(r'^File-Analysis\s+Cloud\s+Submission:\s+(?P<status>\w+)$')
+        p5 = regex_engine.compile(r'^File-Analysis\s+Cloud\s+Submission:\s+(?P<status>\w+)$')
         
         # UTD TLS-Decryption Dataplane Policy: Enabled
-        p6 = re.compile(r'^UTD\s+TLS-Decryption\s+Dataplane\s+Policy:\s+(?P<status>\w+)$')
+        p6 = regex_engine.compile(r'^UTD\s+TLS-Decryption\s+Dataplane\s+Policy:\s+(?P<status>\w+)$')
         
         # Normalizer: Enabled
-        p7 = re.compile(r'^Normalizer:\s+(?P<status>\w+)$')
+        p7 = regex_engine.compile(r'^Normalizer:\s+(?P<status>\w+)$')
         
         # Flow Logging: Disabled
-        p8 = re.compile(r'^Flow\s+Logging:\s+(?P<status>\w+)$')
+        p8 = regex_engine.compile(r'^Flow\s+Logging:\s+(?P<status>\w+)$')
         
         # UTD Policy table entries:
-        p9 = re.compile(r'^(?P<name>(UTD\s+Policy\s+table\s+entries)|UTD\s+threat-inspection\s+profile\s+table\s+entries):$')
+        p9 = regex_engine.compile(r'^(?P<name>(UTD\s+Policy\s+table\s+entries)|UTD\s+threat-inspection\s+profile\s+table\s+entries):$')
         
         # Policy: AIP1
-        p10 = re.compile(r'^Policy:\s+(?P<status>[A-Z0-9]+)$')
+        p10 = regex_engine.compile(r'^Policy:\s+(?P<status>[A-Z0-9]+)$')
         
         # Threat Profile: IPPuni1
-        p11 = re.compile(r'^Threat\s+Profile:\s+(?P<status>\w+)$')
+        p11 = regex_engine.compile(r'^Threat\s+Profile:\s+(?P<status>\w+)$')
         
         # VirtualPortGroup Id: 1
-        p12 = re.compile(r'^VirtualPortGroup\s+Id:\s+(?P<status>\w+)$')
+        p12 = regex_engine.compile(r'^VirtualPortGroup\s+Id:\s+(?P<status>\w+)$')
         
         # Threat profile: IPPuni1
-        p13 = re.compile(r'^Threat\s+profile:\s+(?P<status>\w+)$')
+        p13 = regex_engine.compile(r'^Threat\s+profile:\s+(?P<status>\w+)$')
         
         #  Mode: Intrusion Detection
-        p14 = re.compile(r'^Mode:\s+(?P<status>[A-Za-z ]+)$')
+        p14 = regex_engine.compile(r'^Mode:\s+(?P<status>[A-Za-z ]+)$')
         
         #  Policy: Balanced
-        p15 = re.compile(r'^Policy:\s+(?P<status>[A-Za-z]+)$')
+        p15 = regex_engine.compile(r'^Policy:\s+(?P<status>[A-Za-z]+)$')
         
         #  Logging level: Error
-        p16 = re.compile(r'^Logging\s+level:\s+(?P<status>\w+)$')
+        p16 = regex_engine.compile(r'^Logging\s+level:\s+(?P<status>\w+)$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -4,13 +4,13 @@ IOSXE parsers for show commands:
     * 'show version {switch} {sw_number} {route_processor} {mode}'
     * 'show version {mode}'
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowVersionModeSchema(MetaParser):
     """
@@ -55,20 +55,20 @@ class ShowVersionMode(ShowVersionModeSchema):
             output = self.device.execute(cmd)
         
         # Package: rpbase, version: BLD_POLARIS_DEV_LATEST_20230413_214611_V17_12_0_10, status: active
-        p1 = re.compile(r'^Package: (?P<package>.+), version: (?P<version>\S+), status: (?P<status>.+)$')
+        p1 = regex_engine.compile(r'^Package: (?P<package>.+), version: (?P<version>\S+), status: (?P<status>.+)$')
         
         # Role: rp_iosd
-        p2 = re.compile(r'^Role: (?P<role>.+)$')
+        p2 = regex_engine.compile(r'^Role: (?P<role>.+)$')
         
         # File: consolidated:cat9k-rpbase.BLD_POLARIS_DEV_LATEST_20230413_214611_V17_12_0_10.SSA.pkg, on: RP0/0
         # File: /flash/packages.conf, on: RP0
-        p3 = re.compile(r'^File: ((?P<file_type>.+):)?(?P<file>\S+), on: (?P<location>\S+)$')
+        p3 = regex_engine.compile(r'^File: ((?P<file_type>.+):)?(?P<file>\S+), on: (?P<location>\S+)$')
         
         # Built: 2023-04-13_15.18, by: mcpre
-        p4 = re.compile(r'^Built: (?P<built_date>\S+), by: (?P<owner>\S+)$')
+        p4 = regex_engine.compile(r'^Built: (?P<built_date>\S+), by: (?P<owner>\S+)$')
         
         # File SHA1 checksum: 7cc7035fc0c6b8eb57b5088b86d9ae9e67e67b8b
-        p5 = re.compile(r'^File SHA1 checksum: (?P<checksum>\S+)$')
+        p5 = regex_engine.compile(r'^File SHA1 checksum: (?P<checksum>\S+)$')
 
         ret_dict ={}
 
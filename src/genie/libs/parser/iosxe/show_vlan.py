@@ -5,6 +5,7 @@ import re
 import logging
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import Any, Optional
 
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 def regexp(expression):
     def match(value):
-        if re.match(expression,value):
+        if regex_engine.match(expression,value):
             return value
         else:
             raise TypeError("Value '%s' doesnt match regex '%s'"
@@ -79,7 +80,7 @@ class ShowVlan(ShowVlanSchema):
         # line to wrap around. For example:
         # 1832 blablablablablablablablablablablablablabla
         #                                       active
-        p0 = re.compile(r'^\s*(active|suspended|\w+/lshut|\w+/unsup)+.*$')
+        p0 = regex_engine.compile(r'^\s*(active|suspended|\w+/lshut|\w+/unsup)+.*$')
 
         # VLAN Name                             Status    Ports
         # 1    default                          active    Gi1/0/1, Gi1/0/2, Gi1/0/3, Gi1/0/5, Gi1/0/6, Gi1/0/12,
@@ -87,27 +88,27 @@ class ShowVlan(ShowVlanSchema):
         # 20   VLAN-0020                        active
         # 100  V100                             suspended
         # 105  Misc. Name                       active    Gi1/0/13, Gi1/0/14, Gi1/0/15, Gi1/0/16, Gi1/0/19
-        p1 = re.compile(r'^(?P<vlan_id>[0-9]+)\s+(?P<name>(?=\S).*(?<=\S))'
-                         r'\s+(?P<status>(active|suspended|(.*)lshut|(.*)unsup)+)'
-                         r'(?P<interfaces>[\s\S]+)?$')
+        p1 = regex_engine.compile(r'^(?P<vlan_id>[0-9]+)\s+(?P<name>(?=\S).*(?<=\S))'
+                                   r'\s+(?P<status>(active|suspended|(.*)lshut|(.*)unsup)+)'
+                                   r'(?P<interfaces>[\s\S]+)?$')
 
         #                                                Gi1/0/19, Gi1/0/20, Gi1/0/21, Gi1/0/22
-        p2 = re.compile(r'^\s*(?P<space>\s{48})(?P<interfaces>[\w\s\/\,]+)?$')
+        p2 = regex_engine.compile(r'^\s*(?P<space>\s{48})(?P<interfaces>[\w\s\/\,]+)?$')
 
         # VLAN Type  SAID       MTU   Parent RingNo BridgeNo Stp  BrdgMode Trans1 Trans2
         # ---- ----- ---------- ----- ------ ------ -------- ---- -------- ------ ------
         # 1    enet  100001     1500  -      -      -        -    -        0      0
-        p3 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<type>[a-zA-Z]+)'
-                        r' +(?P<said>\d+) +(?P<mtu>[\d\-]+) +(?P<parent>[\w\-]+)?'
-                        r' +(?P<ring_no>[\w\-]+)? +(?P<bridge_no>[\w\-]+)? +(?P<stp>[\w\-]+)?'
-                        r' +(?P<bridge_mode>[\w\-]+)? +(?P<trans1>[\d\-]+) +(?P<trans2>[\d\-]+)$')
+        p3 = regex_engine.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<type>[a-zA-Z]+)'
+                                  r' +(?P<said>\d+) +(?P<mtu>[\d\-]+) +(?P<parent>[\w\-]+)?'
+                                  r' +(?P<ring_no>[\w\-]+)? +(?P<bridge_no>[\w\-]+)? +(?P<stp>[\w\-]+)?'
+                                  r' +(?P<bridge_mode>[\w\-]+)? +(?P<trans1>[\d\-]+) +(?P<trans2>[\d\-]+)$')
 
         # Remote SPAN VLANs
         # -------------------------------------
         # 201-202
         # 201,202
         # 201,202-205
-        p4 = re.compile(r'^\s*(?P<remote_span_vlans>[^--][0-9\-\,]+)?$')
+        p4 = regex_engine.compile(r'^\s*(?P<remote_span_vlans>[^--][0-9\-\,]+)?$')
 
         # Primary Secondary Type              Ports
         # ------- --------- ----------------- ------------------------------------------
@@ -120,16 +121,16 @@ class ShowVlan(ShowVlanSchema):
         # none    202       community
         #         303       community
         # 101     402       non-operational
-        p5 = re.compile(r'^\s*(?P<primary>[0-9a-zA-Z]+)? +(?P<secondary>\d+)'
-                        r' +(?P<type>[\w\-]+)( +(?P<interfaces>[\s\S]+))?')
+        p5 = regex_engine.compile(r'^\s*(?P<primary>[0-9a-zA-Z]+)? +(?P<secondary>\d+)'
+                                  r' +(?P<type>[\w\-]+)( +(?P<interfaces>[\s\S]+))?')
 
         # VLAN AREHops STEHops Backup CRF
         # ---- ------- ------- ----------
         # 1003 7       7       off
-        p6 = re.compile(r'^\s*(?P<vlan_id>\d+)\s+'
-                         r'(?P<are_hops>\d+)\s+'
-                         r'(?P<ste_hops>\d+)\s+'
-                         r'(?P<backup_crf>\S+)\s*$')
+        p6 = regex_engine.compile(r'^\s*(?P<vlan_id>\d+)\s+'
+                                   r'(?P<are_hops>\d+)\s+'
+                                   r'(?P<ste_hops>\d+)\s+'
+                                   r'(?P<backup_crf>\S+)\s*$')
 
         vlan_dict = {}
         primary = prev_line = ""
@@ -387,12 +388,12 @@ class ShowVlanMtu(ShowVlanMtuSchema):
         vlan_mtu_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*VLAN\s +SVI_MTU\s +interface\s +MinMTU(port)\s +MaxMTU(port)\s +MTU_Mismatch$')
+            p1 = regex_engine.compile(r'^\s*VLAN\s +SVI_MTU\s +interface\s +MinMTU(port)\s +MaxMTU(port)\s +MTU_Mismatch$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<vlan_mtu>[0-9\-]+) +(?P<vlan_min_mtu>[0-9]+) +(?P<vlan_max_mtu>[0-9]+) +(?P<mtu_mismatch>[a-zA-Z]+)$')
+            p2 = regex_engine.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<vlan_mtu>[0-9\-]+) +(?P<vlan_min_mtu>[0-9]+) +(?P<vlan_max_mtu>[0-9]+) +(?P<mtu_mismatch>[a-zA-Z]+)$')
             m = p2.match(line)
             if m:
                 vlan_id = m.groupdict()['vlan_id']
@@ -447,7 +448,7 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
         access_map_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Vlan\s+access-map\s+\"(?P<access_map_id>\S+)\"\s+(?P<access_map_sequence>[0-9]+)$')
+            p1 = regex_engine.compile(r'^\s*Vlan\s+access-map\s+\"(?P<access_map_id>\S+)\"\s+(?P<access_map_sequence>[0-9]+)$')
             m = p1.match(line)
             if m:
                 access_map_id = m.groupdict()['access_map_id']
@@ -463,7 +464,7 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
                     access_map_dict['access_map_id'][map_id]['access_map_sequence'][access_map_sequence] = {}
                 continue
 
-            p2 = re.compile(r'^\s*(?P<access_map_match_protocol>\S+)\s+address:\s+(?P<access_map_match_protocol_value>\S+)$')
+            p2 = regex_engine.compile(r'^\s*(?P<access_map_match_protocol>\S+)\s+address:\s+(?P<access_map_match_protocol_value>\S+)$')
             m = p2.match(line)
             if m:
                 access_map_dict['access_map_id'][map_id]\
@@ -474,7 +475,7 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
                         m.groupdict()['access_map_match_protocol_value']
                 continue
 
-            p3 = re.compile(r'^\s*(?P<access_map_action_value>[a-zA-Z]+)$')
+            p3 = regex_engine.compile(r'^\s*(?P<access_map_action_value>[a-zA-Z]+)$')
             m = p3.match(line)
             if m:
                 access_map_dict['access_map_id'][map_id]\
@@ -512,12 +513,12 @@ class ShowVlanRemoteSpan(ShowVlanRemoteSpanSchema):
         remote_span_vlan_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Remote +SPAN +VLANs$')
+            p1 = regex_engine.compile(r'^\s*Remote +SPAN +VLANs$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*(?P<remote_span_vlan_ids>[0-9\,]+)$')
+            p2 = regex_engine.compile(r'^\s*(?P<remote_span_vlan_ids>[0-9\,]+)$')
             m = p2.match(line)
             if m:
                 if 'vlan_id' not in remote_span_vlan_dict:
@@ -560,7 +561,7 @@ class ShowVlanFilter(ShowVlanFilterSchema):
         vlan_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*VLAN\s+Map\s+(?P<vlan_access_map_tag>\S+)\s+is\s+filtering\s+VLANs:$')
+            p1 = regex_engine.compile(r'^\s*VLAN\s+Map\s+(?P<vlan_access_map_tag>\S+)\s+is\s+filtering\s+VLANs:$')
             m = p1.match(line)
             if m:
                 if 'vlan_id' not in vlan_dict:
@@ -568,7 +569,7 @@ class ShowVlanFilter(ShowVlanFilterSchema):
                 tag = m.groupdict()['vlan_access_map_tag']
                 continue
 
-            p2 = re.compile(r'^\s*(?P<access_map_vlan_ids>[0-9\,\-]+)$')
+            p2 = regex_engine.compile(r'^\s*(?P<access_map_vlan_ids>[0-9\,\-]+)$')
             m = p2.match(line)
             if m:
                 access_map_vlan_ids = m.groupdict()['access_map_vlan_ids']
@@ -621,21 +622,21 @@ class ShowVlanId(ShowVlanIdSchema):
         # initial return dictionary
 
         vlan_dict = {}
-        p1 = re.compile(r'(?P<vlan_id>\d+) +(?P<vlan_name>\S+|\S+.*\S+) +'
-                                r'(?P<status>active|suspended|act/lshut|sus/lshut)'
-                                r'(?:\s+(?P<ports>([A-Za-z\-]+[\/\d\-\:\.]+\d+)(.*)|([A-za-z0-9]+\:\d+(.*))))?')
-        p2 = re.compile(r'(?P<ports>([A-Za-z\-]+[\/\d\-\:\.]+\d+)(.*)|([A-za-z0-9]+\:\d+(.*)))')
-        p3 = re.compile(r'\d+ +'
-                    r'(?P<type>\w+) +'
-                    r'(?P<said>\d+) +'
-                    r'(?P<mtu>\d+) +'
-                    r'(?P<parent>\S+) +'
-                    r'(?P<ring_no>\S+) +'
-                    r'(?P<bridge_no>\S+) +'
-                    r'(?P<stp>\S+) +'
-                    r'(?P<brdg_mode>\S+) +'
-                    r'(?P<trans1>\d+) +'
-                    r'(?P<trans2>\d+)')
+        p1 = regex_engine.compile(r'(?P<vlan_id>\d+) +(?P<vlan_name>\S+|\S+.*\S+) +'
+                                          r'(?P<status>active|suspended|act/lshut|sus/lshut)'
+                                          r'(?:\s+(?P<ports>([A-Za-z\-]+[\/\d\-\:\.]+\d+)(.*)|([A-za-z0-9]+\:\d+(.*))))?')
+        p2 = regex_engine.compile(r'(?P<ports>([A-Za-z\-]+[\/\d\-\:\.]+\d+)(.*)|([A-za-z0-9]+\:\d+(.*)))')
+        p3 = regex_engine.compile(r'\d+ +'
+                              r'(?P<type>\w+) +'
+                              r'(?P<said>\d+) +'
+                              r'(?P<mtu>\d+) +'
+                              r'(?P<parent>\S+) +'
+                              r'(?P<ring_no>\S+) +'
+                              r'(?P<bridge_no>\S+) +'
+                              r'(?P<stp>\S+) +'
+                              r'(?P<brdg_mode>\S+) +'
+                              r'(?P<trans1>\d+) +'
+                              r'(?P<trans2>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -690,13 +691,13 @@ class ShowVlanVirtualport(ShowVlanVirtualportSchema):
             output = self.device.execute(self.cli_command)
 
         # Slot 1
-        p1 = re.compile(r'^Slot +(?P<slot>\d+)$')
+        p1 = regex_engine.compile(r'^Slot +(?P<slot>\d+)$')
 
         # Total slot virtual ports 4796
-        p2 = re.compile(r'^Total +slot +virtual +ports +(?P<ports>\d+)$')
+        p2 = regex_engine.compile(r'^Total +slot +virtual +ports +(?P<ports>\d+)$')
 
         # Total chassis virtual ports 14254
-        p3 = re.compile(r'^Total +chassis +virtual +ports +(?P<ports>\d+)$')
+        p3 = regex_engine.compile(r'^Total +chassis +virtual +ports +(?P<ports>\d+)$')
 
         ret_dict = {}
         slot = None
@@ -774,13 +775,13 @@ class ShowVlansDot1qVlanIdSecondDot1qVlanId(ShowVlansDot1qVlanIdSecondDot1qVlanI
          ret_dict = {}
          vlan = None
          #Total statistics for Outer/Inner VLAN 2/3:        ---> Outer/Inner VLAN case
-         p0 = re.compile(r'^Total statistics for (?P<vlan>[a-zA-Z]+\/[a-zA-Z]+\s+VLAN\s+[0-9]\/[0-9]):$')
+         p0 = regex_engine.compile(r'^Total statistics for (?P<vlan>[a-zA-Z]+\/[a-zA-Z]+\s+VLAN\s+[0-9]\/[0-9]):$')
          #Total statistics for 802.1Q VLAN 1:               ---> Outer VLAN case
-         p0_1 = re.compile(r'^Total statistics for (?P<vlan>[0-9]+.[0-9][A-Z]\s+VLAN\s+[0-9]):$')
+         p0_1 = regex_engine.compile(r'^Total statistics for (?P<vlan>[0-9]+.[0-9][A-Z]\s+VLAN\s+[0-9]):$')
          #105331037 packets, 147884775948 bytes input
-         p1 = re.compile(r'^(?P<in_pkts>\d+)\s+packets,\s+(?P<in_octets>\d+)\s+bytes\s+input$')
+         p1 = regex_engine.compile(r'^(?P<in_pkts>\d+)\s+packets,\s+(?P<in_octets>\d+)\s+bytes\s+input$')
          #105334310 packets, 148310655960 bytes output
-         p2 = re.compile(r'^(?P<out_pkts>\d+)\s+packets,\s+(?P<out_octets>\d+)\s+bytes\s+output$')
+         p2 = regex_engine.compile(r'^(?P<out_pkts>\d+)\s+packets,\s+(?P<out_octets>\d+)\s+bytes\s+output$')
 
          #Total statistics for Outer/Inner VLAN 2/3:
          #   105331037 packets, 147884775948 bytes input
@@ -841,16 +842,16 @@ class ShowVlanSummary(ShowVlanSummarySchema):
         ret_dict = {}
 
         #Number of existing VLANs               : 1009
-        p1 = re.compile(r'Number\sof\sexisting\sVLANs\s+\:\s+(?P<existing_vlans>\d+)')
+        p1 = regex_engine.compile(r'Number\sof\sexisting\sVLANs\s+\:\s+(?P<existing_vlans>\d+)')
 
         #Number of existing VTP VLANs          : 1005
-        p2 = re.compile(r'Number\sof\sexisting\sVTP\sVLANs\s+\:\s+(?P<existing_vtp_vlans>\d+)')
+        p2 = regex_engine.compile(r'Number\sof\sexisting\sVTP\sVLANs\s+\:\s+(?P<existing_vtp_vlans>\d+)')
 
         #Number of existing extended VLANS     : 4
-        p3 = re.compile(r'Number\sof\sexisting\sextended\sVLANS\s+\:\s+(?P<existing_extend_vlans>\d+)')
+        p3 = regex_engine.compile(r'Number\sof\sexisting\sextended\sVLANS\s+\:\s+(?P<existing_extend_vlans>\d+)')
 
         # Number of existing extended VTP VLANS : 0
-        p4 = re.compile(r'Number of existing extended VTP VLANS\s+:\s+(?P<existing_extend_vtp_vlans>\d+)')
+        p4 = regex_engine.compile(r'Number of existing extended VTP VLANS\s+:\s+(?P<existing_extend_vtp_vlans>\d+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -912,7 +913,7 @@ class ShowVlanPrivateVlan(ShowVlanPrivateVlanSchema):
 
         # 500     501       community         Twe1/0/7, Twe1/0/8, Twe1/0/33
         # 500     501       isolated
-        p1 = re.compile(r"^(?P<primary>\d+)\s+(?P<sec>\d+)\s+(?P<type>\w+)+?(?P<ports>.*)$")
+        p1 = regex_engine.compile(r"^(?P<primary>\d+)\s+(?P<sec>\d+)\s+(?P<type>\w+)+?(?P<ports>.*)$")
 
         ret_dict = {}
 
@@ -960,7 +961,7 @@ class ShowVlanPrivateVlanType(ShowVlanPrivateVlanTypeSchema):
             output = self.device.execute(self.cli_command)
 
         # 500  primary
-        p1 = re.compile(r"^(?P<vlan_id>\d+)\s+(?P<type>\w+)$")
+        p1 = regex_engine.compile(r"^(?P<vlan_id>\d+)\s+(?P<type>\w+)$")
         ret_dict = {}
 
         for line in output.splitlines():
@@ -1002,7 +1003,7 @@ class ShowVlanDot1qTagNative(ShowVlanDot1qTagNativeSchema):
         #
         # Tw1/0/4      trunk                 disabled
         # Gi3/0/24     trunk                 disabled
-        p1 = re.compile(r'^(?P<port>[\w\/\-\.]+)\s+(?P<mode>trunk)\s+(?P<state>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<port>[\w\/\-\.]+)\s+(?P<mode>trunk)\s+(?P<state>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1062,7 +1063,7 @@ class ShowPlatformSoftwareFedActiveVtIfId(ShowPlatformSoftwareFedActiveVtIfIdSch
 
         ret_dict = {}
         # 102           40            30                    1
-        p1 = re.compile(r'^(?P<if_id>\d+)\s*(?P<cvlan_id>\d+)\s*(?P<svlan_id>\d+)\s*(?P<action>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<if_id>\d+)\s*(?P<cvlan_id>\d+)\s*(?P<svlan_id>\d+)\s*(?P<action>\d+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1113,11 +1114,11 @@ class ShowVlanMapping(ShowVlanMappingSchema):
             output = self.device.execute(self.cli_command)
 
         # Total no of vlan mappings configured: 1
-        p1 = re.compile(r"^Total\s+no\s+of\s+vlan\s+mappings\s+configured:\s+(?P<no_of_vlans>\d+)$")
+        p1 = regex_engine.compile(r"^Total\s+no\s+of\s+vlan\s+mappings\s+configured:\s+(?P<no_of_vlans>\d+)$")
         # Interface Po6:
-        p2 = re.compile(r"^Interface\s+(?P<interface>\S+):$")
+        p2 = regex_engine.compile(r"^Interface\s+(?P<interface>\S+):$")
         # 20                                    30             1-to-1
-        p3 = re.compile(r"^(?P<vlan_map>\d+)\s+(?P<trans_vlan>\d+)\s+(?P<operation>\S+)$")
+        p3 = regex_engine.compile(r"^(?P<vlan_map>\d+)\s+(?P<trans_vlan>\d+)\s+(?P<operation>\S+)$")
 
         ret_dict = {}
 
@@ -1178,9 +1179,9 @@ class ShowVlanBrief(ShowVlanBriefSchema):
             output = self.device.execute(self.cli_command)
 
         # 10   VLAN0010                         active
-        p1 = re.compile(r"^(?P<vlan>[0-9]+)+\s+(?P<vlan_name>[\w\-]+)+\s+(?P<vlan_status>[a-zA-Z\/\s]+)$")
+        p1 = regex_engine.compile(r"^(?P<vlan>[0-9]+)+\s+(?P<vlan_name>[\w\-]+)+\s+(?P<vlan_status>[a-zA-Z\/\s]+)$")
         # 666  VLAN0666                         active    Te1/1/6, Te1/1/7
-        p2 = re.compile(r"^(?P<vlan>[0-9]+)+\s+(?P<vlan_name>[\w\-]+)+\s+(?P<vlan_status>[a-zA-Z\/]+)\s+(?P<vlan_port>[a-zA-Z0-9\,\/\ ]+)$")
+        p2 = regex_engine.compile(r"^(?P<vlan>[0-9]+)+\s+(?P<vlan_name>[\w\-]+)+\s+(?P<vlan_status>[a-zA-Z\/]+)\s+(?P<vlan_port>[a-zA-Z0-9\,\/\ ]+)$")
 
         ret_dict = {}
         for line in output.splitlines():
@@ -1255,7 +1256,7 @@ class ShowVlanInternalUsage(ShowVlanInternalUsageSchema):
     #1008 GigabitEthernet0/2
 
         #pattern to capture 'VLAN' and 'Usage'
-        p0 = re.compile(r'^(?P<VLAN>[0-9]+)\s+(?P<Usage>.+)$')
+        p0 = regex_engine.compile(r'^(?P<VLAN>[0-9]+)\s+(?P<Usage>.+)$')
         parsed_dict = {}
 
         for line in out.splitlines():
@@ -6,12 +6,10 @@ IOSXE parsers for the following show commands:
 
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -122,91 +120,91 @@ class ShowVmiNeighborsDetail(ShowVmiNeighborsDetailSchema):
         ret_dict = {}
 
         # 1 vmi1 Neighbors
-        p1 = re.compile(r'^(?P<val>\d+)\s+(?P<var>\w+\s+\w+)$')
+        p1 = regex_engine.compile(r'^(?P<val>\d+)\s+(?P<var>\w+\s+\w+)$')
 
         # vmi1   IPV6 Address=FE80::6E13:D5FF:FE3F:9710
-        p2 = re.compile(r'^(?P<var>\w+)\s+(?P<var1>[Ii]\w+\s+\w+)\s*=\s*(?P<val1>.+)$')
+        p2 = regex_engine.compile(r'^(?P<var>\w+)\s+(?P<var1>[Ii]\w+\s+\w+)\s*=\s*(?P<val1>.+)$')
 
 
         # IPV6 Global Addr=::
-        p3 = re.compile(r'^(?P<var1>\w+\s+[Gg]\w+\s+\w+)\s*=\s*(?P<val1>.+)$')
+        p3 = regex_engine.compile(r'^(?P<var1>\w+\s+[Gg]\w+\s+\w+)\s*=\s*(?P<val1>.+)$')
 
         # IPV4 Address=81.0.0.1, Uptime=00:01:26
-        p4 = re.compile(r'^(?P<var1>\w+\s+\w+)\s*=\s*(?P<val1>\S+),\s*(?P<var2>\w+)\s*=\s*(?P<val2>\S+)$')
+        p4 = regex_engine.compile(r'^(?P<var1>\w+\s+\w+)\s*=\s*(?P<val1>\S+),\s*(?P<var2>\w+)\s*=\s*(?P<val2>\S+)$')
 
         # Output pkts=0, Input pkts=0
-        p5 = re.compile(r'^(?P<var1>\w+\s+\w+)\s*=\s*(?P<val1>\d+)\s*,\s*(?P<var2>\w+\s+\w+)\s*=\s*(?P<val2>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<var1>\w+\s+\w+)\s*=\s*(?P<val1>\d+)\s*,\s*(?P<var2>\w+\s+\w+)\s*=\s*(?P<val2>\d+)$')
 
         # Transport PPPoE, Session ID=2
-        p6 = re.compile(r'^(?P<var1>\w+\s+\w+)\s*,\s*(?P<var2>\w+\s+\w+)\s*=\s*(?P<val2>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<var1>\w+\s+\w+)\s*,\s*(?P<var2>\w+\s+\w+)\s*=\s*(?P<val2>\d+)$')
 
         # INTERFACE STATS:
-        p7 = re.compile(r'^(?P<var>[Ii]\w+\s+[Ss]\w+):$')
+        p7 = regex_engine.compile(r'^(?P<var>[Ii]\w+\s+[Ss]\w+):$')
 
         # VMI Interface=vmi1,
-        p8 = re.compile(r'^(?P<var1>[Vv]\w+\s+\w+)\s*=\s*(?P<val1>\w+),$')
+        p8 = regex_engine.compile(r'^(?P<var1>[Vv]\w+\s+\w+)\s*=\s*(?P<val1>\w+),$')
 
         # V-Access intf=Virtual-Access1.1,
-        p9 = re.compile(r'^(?P<var1>[Vv]-\w+\s+\w+)\s*=\s*(?P<val1>\S+),$')
+        p9 = regex_engine.compile(r'^(?P<var1>[Vv]-\w+\s+\w+)\s*=\s*(?P<val1>\S+),$')
 
         # Physical intf=GigabitEthernet0/0/4,
-        p10 = re.compile(r'^(?P<var1>[Pp]\w+\s+\w+)\s*=\s*(?P<val1>\S+),$')
+        p10 = regex_engine.compile(r'^(?P<var1>[Pp]\w+\s+\w+)\s*=\s*(?P<val1>\S+),$')
 
         # Input qcount=0, drops=0, Output qcount=0, drops=0
         # Input qcount=0, drops=0, Output qcount=0, drops=0
         # Input qcount=0, drops=0, Output qcount=0, drops=0
-        p11 = re.compile(r'^(?P<var1>\w+\s+\w+)\s*=\s*(?P<val1>\d+)\s*,\s*(?P<var2>\w+)\s*=\s*(?P<val2>\d+)\s*,\s*(?P<var3>\w+\s+\w+)\s*=\s*(?P<val3>\d+)\s*,\s*(?P<var4>\w+)\s*=\s*(?P<val4>\d+)$')
+        p11 = regex_engine.compile(r'^(?P<var1>\w+\s+\w+)\s*=\s*(?P<val1>\d+)\s*,\s*(?P<var2>\w+)\s*=\s*(?P<val2>\d+)\s*,\s*(?P<var3>\w+\s+\w+)\s*=\s*(?P<val3>\d+)\s*,\s*(?P<var4>\w+)\s*=\s*(?P<val4>\d+)$')
 
         # PPPoE Flow Control Stats
-        p12 = re.compile(r'^(?P<var>PPPoE\s+.+)$')
+        p12 = regex_engine.compile(r'^(?P<var>PPPoE\s+.+)$')
 
         # Local Credits: 1953   Peer Credits: 65535   Local Scaling Value 65534 bytes
-        p13 = re.compile(r'^(?P<var1>\w+\s+\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+\s+\w+)\s*:\s+(?P<val2>\d+)\s+(?P<var3>\w+\s+\w+\s+\w+)\s+(?P<val3>\d+\s+\w+)$')
+        p13 = regex_engine.compile(r'^(?P<var1>\w+\s+\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+\s+\w+)\s*:\s+(?P<val2>\d+)\s+(?P<var3>\w+\s+\w+\s+\w+)\s+(?P<val3>\d+\s+\w+)$')
 
         # Credit Grant Threshold: 28000    Max Credits per grant: 65535
-        p14 = re.compile(r'^(?P<var1>\w+\s+\w+\s+\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+\s+\w+\s+\w+\s+\w+)\s*:\s*(?P<val2>\d+)$')
+        p14 = regex_engine.compile(r'^(?P<var1>\w+\s+\w+\s+\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+\s+\w+\s+\w+\s+\w+)\s*:\s*(?P<val2>\d+)$')
 
         # Credit Starved Packets: 0
-        p15 = re.compile(r'^(?P<var1>\w+\s+[Ss]\w+\s+\w+)\s*:\s*(?P<val1>\d+)$')
+        p15 = regex_engine.compile(r'^(?P<var1>\w+\s+[Ss]\w+\s+\w+)\s*:\s*(?P<val1>\d+)$')
 
         # PADG xmit Seq Num: 884     PADG Timer index: 148
-        p16 = re.compile(r'^(?P<var1>\w+\s+\w+\s+\w+\s+\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+\s+\w+\s+\w+)\s*:\s*(?P<val2>\d+)$')
+        p16 = regex_engine.compile(r'^(?P<var1>\w+\s+\w+\s+\w+\s+\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+\s+\w+\s+\w+)\s*:\s*(?P<val2>\d+)$')
 
         #  PADG last rcvd Seq Num: 0
         #  PADG last nonzero Seq Num: 148
         #  PADG last nonzero rcvd amount: 0
-        p17 = re.compile(r'^(?P<var1>\w+\s+[Ll]\w+\s+\w+\s+\w+\s+\w+)\s*:\s*(?P<val1>\d+)$')
+        p17 = regex_engine.compile(r'^(?P<var1>\w+\s+[Ll]\w+\s+\w+\s+\w+\s+\w+)\s*:\s*(?P<val1>\d+)$')
 
         # PADG Timers: (ms)   [0]-1000    [1]-2000    [2]-3000    [3]-4000    [4]-5000
-        p18 = re.compile(r'^(?P<var>\w+\s+\w+)\s*:\s*\(ms\)\s+\[(?P<var1>\d+)\]-(?P<val1>\d+)\s+\[(?P<var2>\d+)\]-(?P<val2>\d+)\s+\[(?P<var3>\d+)\]-(?P<val3>\d+)\s+\[(?P<var4>\d+)\]-(?P<val4>\d+)\s+\[(?P<var5>\d+)\]-(?P<val5>\d+)$')
+        p18 = regex_engine.compile(r'^(?P<var>\w+\s+\w+)\s*:\s*\(ms\)\s+\[(?P<var1>\d+)\]-(?P<val1>\d+)\s+\[(?P<var2>\d+)\]-(?P<val2>\d+)\s+\[(?P<var3>\d+)\]-(?P<val3>\d+)\s+\[(?P<var4>\d+)\]-(?P<val4>\d+)\s+\[(?P<var5>\d+)\]-(?P<val5>\d+)$')
 
         # PADG xmit: 864  rcvd: 0
         # PADC xmit: 127926272  rcvd: 864
-        p19 = re.compile(r'^(?P<var1>PAD[GC]\s+[Xx]\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+)\s*:\s*(?P<val2>\d+)$')
+        p19 = regex_engine.compile(r'^(?P<var1>PAD[GC]\s+[Xx]\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+)\s*:\s*(?P<val2>\d+)$')
 
         # In-band credit pkt xmit: 0 rcvd: 0
-        p20 = re.compile(r'^(?P<var1>\w+-\w+\s+\w+\s+\w+\s+\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+)\s*:\s*(?P<val2>\d+)$')
+        p20 = regex_engine.compile(r'^(?P<var1>\w+-\w+\s+\w+\s+\w+\s+\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+)\s*:\s*(?P<val2>\d+)$')
 
         # Last credit packet snapshot
-        p21 = re.compile(r'^(?P<var>[Ll]ast.+)$')
+        p21 = regex_engine.compile(r'^(?P<var>[Ll]ast.+)$')
 
         # PADG xmit: seq_num = 884, fcn = 65535, bcn = 0
         # PADC xmit: seq_num = 70, fcn = 1952, bcn = 0
-        p22 = re.compile(r'^(?P<var>\w+\s+[Xx]\w+)\s*:\s*(?P<var1>\w+_\w+)\s*=\s*(?P<val1>\d+)\s*,\s*(?P<var2>\w+)\s*=\s*(?P<val2>\d+),\s*(?P<var3>\w+)\s*=\s*(?P<val3>\d+)$')
+        p22 = regex_engine.compile(r'^(?P<var>\w+\s+[Xx]\w+)\s*:\s*(?P<var1>\w+_\w+)\s*=\s*(?P<val1>\d+)\s*,\s*(?P<var2>\w+)\s*=\s*(?P<val2>\d+),\s*(?P<var3>\w+)\s*=\s*(?P<val3>\d+)$')
 
         # PADC rcvd: seq_num = 884, fcn = 1953, bcn = 65535
         # PADG rcvd: seq_num = 0, fcn = 0, bcn = 72
-        p23 = re.compile(r'^(?P<var>\w+\s+[Rr]\w+)\s*:\s*(?P<var1>\w+_\w+)\s*=\s*(?P<val1>\d+)\s*,\s*(?P<var2>\w+)\s*=\s*(?P<val2>\d+),\s*(?P<var3>\w+)\s*=\s*(?P<val3>\d+)$')
+        p23 = regex_engine.compile(r'^(?P<var>\w+\s+[Rr]\w+)\s*:\s*(?P<var1>\w+_\w+)\s*=\s*(?P<val1>\d+)\s*,\s*(?P<var2>\w+)\s*=\s*(?P<val2>\d+),\s*(?P<var3>\w+)\s*=\s*(?P<val3>\d+)$')
 
         #  In-band credit pkt xmit: fcn = 0, bcn = 0
         #  In-band credit pkt rcvd: fcn = 0, bcn = 0
-        p24 = re.compile(r'^(?P<var>[Ii]n-\w+\s+\w+\s+\w+\s+\w+)\s*:\s*(?P<var1>\w+)\s*=\s*(?P<val1>\d+),\s*(?P<var2>\w+)\s*=\s*(?P<val2>\d+)$')
+        p24 = regex_engine.compile(r'^(?P<var>[Ii]n-\w+\s+\w+\s+\w+\s+\w+)\s*:\s*(?P<var1>\w+)\s*=\s*(?P<val1>\d+),\s*(?P<var2>\w+)\s*=\s*(?P<val2>\d+)$')
 
         # ==== PADQ Statistics ====
-        p25 = re.compile(r'^(=+\s*(?P<var>\w+\s+\w+)\s*=+)$')
+        p25 = regex_engine.compile(r'^(=+\s*(?P<var>\w+\s+\w+)\s*=+)$')
 
         # PADQ xmit: 0  rcvd: 0
-        p26 = re.compile(r'^(?P<var1>PADQ\s+[Xx]\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+)\s*:\s*(?P<val2>\d+)$')
+        p26 = regex_engine.compile(r'^(?P<var1>PADQ\s+[Xx]\w+)\s*:\s*(?P<val1>\d+)\s+(?P<var2>\w+)\s*:\s*(?P<val2>\d+)$')
 
 
         vmi_count = 1
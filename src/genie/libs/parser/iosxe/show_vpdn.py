@@ -3,13 +3,13 @@ IOSXE parsers for the following show commands:
     * 'show vpdn'
     * 'show vpdn tunnel'
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowVpdnSchema(MetaParser):
     ''' Schema for:
@@ -58,21 +58,21 @@ class ShowVpdnSuperParser(ShowVpdnSchema):
         tunnel_index, sesion_index = 1, 1
 
         # L2TP Tunnel and Session Information Total tunnels 1 sessions 1
-        p1 = re.compile(r'L2TP Tunnel and Session Information Total '
-                r'tunnels +(?P<total_tunnels>\d+) +sessions +(?P<total_sessions>\d+)')
+        p1 = regex_engine.compile(r'L2TP Tunnel and Session Information Total '
+                          r'tunnels +(?P<total_tunnels>\d+) +sessions +(?P<total_sessions>\d+)')
 
         # 35231      38883      LAC           est    18.18.18.1      1     1
-        p2 = re.compile(r'(?P<loc_tun_id>\d+) +(?P<rem_tun_id>\d+) +(?P<remote_name>\S+)'
-                r' +(?P<state>\S+) +(?P<remote_ip>[\d\.]+) +(?P<session_count>\d+)'
-                r' +(?P<vpdn_group>\S+)')
+        p2 = regex_engine.compile(r'(?P<loc_tun_id>\d+) +(?P<rem_tun_id>\d+) +(?P<remote_name>\S+)'
+                          r' +(?P<state>\S+) +(?P<remote_ip>[\d\.]+) +(?P<session_count>\d+)'
+                          r' +(?P<vpdn_group>\S+)')
 
         # 57471      22313      35231      lns@cisco.com, Vi2.1 est    00:00:09 2
-        p3 = re.compile(r'(?P<local_id>\d+) +(?P<remote_id>\d+) +(?P<tunnel_id>\d+)'
-                r' +(?P<username>[a-z@\.]+), +(?P<intf>\S+) +(?P<state>[a-z]+) +(?P<last_chg>[\d:]+)'
-                r' +(?P<uniq_id>\d+)')
+        p3 = regex_engine.compile(r'(?P<local_id>\d+) +(?P<remote_id>\d+) +(?P<tunnel_id>\d+)'
+                          r' +(?P<username>[a-z@\.]+), +(?P<intf>\S+) +(?P<state>[a-z]+) +(?P<last_chg>[\d:]+)'
+                          r' +(?P<uniq_id>\d+)')
 
         # %%No active L2TP tunnels
-        p4 = re.compile(r'^\%\%(?P<no_active_tunn>\S+) active L2TP tunnels$')
+        p4 = regex_engine.compile(r'^\%\%(?P<no_active_tunn>\S+) active L2TP tunnels$')
 
         for line in output.splitlines():
             line = line.strip()
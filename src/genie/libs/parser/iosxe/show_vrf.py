@@ -8,7 +8,6 @@ IOSXE parsers for the following show commands:
 """
 
 # Python
-import re
 import xmltodict
 
 # Metaparser
@@ -17,6 +16,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -69,13 +69,13 @@ class ShowVrf(ShowVrfSchema):
         # test                             10.116.83.34:100      ipv4,ipv6   Lo100
         # ce1                              <being deleted>       ipv4,ipv6   Et1/0
         # * ce1                              2:2                   ipv4,ipv6
-        p1 = re.compile(r'^(((?P<being_deleted>\*))\s+)?(?P<vrf>[\w\d\-\.]+)\s+(?P<rd>\<not +set\>|<being deleted>|[\.\d\:]+)(?P<rd_auto>\(auto\)+)?(?:\s+(?P<protocols>[(?:ipv\d)\,]+))?(?:\s+(?P<intf>[\S\s]+))?$')
+        p1 = regex_engine.compile(r'^(((?P<being_deleted>\*))\s+)?(?P<vrf>[\w\d\-\.]+)\s+(?P<rd>\<not +set\>|<being deleted>|[\.\d\:]+)(?P<rd_auto>\(auto\)+)?(?:\s+(?P<protocols>[(?:ipv\d)\,]+))?(?:\s+(?P<intf>[\S\s]+))?$')
 
         # Lo300
         # Gi2.390
         # Gi2.410
         # Te0/0/1
-        p2 = re.compile(r'^(?P<intf>[\w\.\/]+)$')
+        p2 = regex_engine.compile(r'^(?P<intf>[\w\.\/]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -219,86 +219,86 @@ class ShowVrfDetailSuperParser(ShowVrfDetailSchema):
         # VRF Down; default RD 100:1; default VPNID <not set> VRF Table ID = 1
         # VRF 12349; default RD 10.4.1.1:20; default VPNID <not set>
         # VRF DEMO (VRF Id = 12); default RD 65001:1; default VPNID <not set>; being deleted
-        p1 = re.compile(r'^VRF +(?P<vrf>[\S]+)( +\(VRF +Id +\= +'
-                        r'(?P<vrf_id>\d+)\))?; +default +RD +'
-                        r'(?P<rd>[\S\s]+); +default +VPNID +'
-                        r'(?P<vpn_id>[\w\s\:\<\>]+)(?: +VRF +'
-                        r'Table +ID +\= +(?P<alt_vrf_id>\d))?'
-                        r'(?:(?P<being_deleted>; being deleted))?$')
+        p1 = regex_engine.compile(r'^VRF +(?P<vrf>[\S]+)( +\(VRF +Id +\= +'
+                                  r'(?P<vrf_id>\d+)\))?; +default +RD +'
+                                  r'(?P<rd>[\S\s]+); +default +VPNID +'
+                                  r'(?P<vpn_id>[\w\s\:\<\>]+)(?: +VRF +'
+                                  r'Table +ID +\= +(?P<alt_vrf_id>\d))?'
+                                  r'(?:(?P<being_deleted>; being deleted))?$')
 
         # New CLI format, supports multiple address-families
-        p1_1 = re.compile(r'^(?P<cli_format>(New|Old)) +CLI +format,'
-                          r' +supports +(?P<support_af>[\s\S]+)$')
+        p1_1 = regex_engine.compile(r'^(?P<cli_format>(New|Old)) +CLI +format,'
+                                    r' +supports +(?P<support_af>[\s\S]+)$')
         
         #vnid: 30022 evpn-instance vni 4096 core-vlan 300
-        p1_2 = re.compile(r'^vnid:\s+(?P<vnid>\d+)(?:\s+evpn-instance vni\s+(?P<vni>\w+)(?:\s+core-vlan\s+(?P<core_vlan>\d+))?)?$')
+        p1_2 = regex_engine.compile(r'^vnid:\s+(?P<vnid>\d+)(?:\s+evpn-instance vni\s+(?P<vni>\w+)(?:\s+core-vlan\s+(?P<core_vlan>\d+))?)?$')
 
         # Flags: 0x180C
-        p2 = re.compile(r'^Flags: +(?P<flags>\w+)$')
+        p2 = regex_engine.compile(r'^Flags: +(?P<flags>\w+)$')
 
         # Interfaces:
-        p3 = re.compile(r'^Interfaces:$')
+        p3 = regex_engine.compile(r'^Interfaces:$')
 
         #     Gi0/0
-        p3_1 = re.compile(r'^(?P<intf>[\w\s\/\.\-]+)$')
+        p3_1 = regex_engine.compile(r'^(?P<intf>[\w\s\/\.\-]+)$')
 
         # Address family ipv4 unicast (Table ID = 0x1):
         # Address family ipv4 (Table ID = 2 (0x2)):
-        p4 = re.compile(r'^Address +family +(?P<af>[\w\s]+) +'
-                        r'\(Table +ID +\= +(?P<table_id>\w+)'
-                        r'( *[\w\(\)]+)?\)(:|;)?(?: being deleted:)?$')
+        p4 = regex_engine.compile(r'^Address +family +(?P<af>[\w\s]+) +'
+                                  r'\(Table +ID +\= +(?P<table_id>\w+)'
+                                  r'( *[\w\(\)]+)?\)(:|;)?(?: being deleted:)?$')
 
         # VRF Table ID = 2
-        p5 = re.compile(r'^VRF +Table +ID += +(?P<table_id>\d+)$')
+        p5 = regex_engine.compile(r'^VRF +Table +ID += +(?P<table_id>\d+)$')
 
         # No Export VPN route-target communities
         # Export VPN route-target communities
-        p6 = re.compile(r'^Export VPN route-target communities$')
+        p6 = regex_engine.compile(r'^Export VPN route-target communities$')
 
         # No Import VPN route-target communities
         #Import VPN route-target communities
-        p6_1 = re.compile(r'^Import VPN route-target communities$')
+        p6_1 = regex_engine.compile(r'^Import VPN route-target communities$')
 
         #     RT:100:1                 RT:200:1
-        p6_2 = re.compile(r'RT: *(?P<rt>[\w\:\.]+)')
+        p6_2 = regex_engine.compile(r'RT: *(?P<rt>[\w\:\.]+)')
 
         # No import route-map
-        p7 = re.compile(r'^No import route-map$')
+        p7 = regex_engine.compile(r'^No import route-map$')
 
         # Import route-map for ipv4 unicast: import_from_global_map (prefix limit: 1000)
-        p7_1 = re.compile(r'^Import +route-map +for +(?P<af>[\w\s]+): +'
-                          r'(?P<import_map>[\w\-]+) +\(prefix +limit: (?P<limit>\d+)\)$')
+        p7_1 = regex_engine.compile(r'^Import +route-map +for +(?P<af>[\w\s]+): +'
+                                    r'(?P<import_map>[\w\-]+) +\(prefix +limit: (?P<limit>\d+)\)$')
 
         # Import route-map: import-test-map
-        p7_2 = re.compile(r'^Import +route-map: +(?P<import_map>[\w\-]+)$')
+        p7_2 = regex_engine.compile(r'^Import +route-map: +(?P<import_map>[\w\-]+)$')
 
         # No global export route-map
         # No export route-map
-        p8 = re.compile(r'^No( *global)? export route-map$')
+        p8 = regex_engine.compile(r'^No( *global)? export route-map$')
 
         # Global export route-map for ipv4 unicast: export_to_global_map (prefix limit: 1000)
-        p8_1 = re.compile(r'^Global +export +route-map +for +(?P<af>[\w\s]+): +'
-                          r'(?P<export_map>[\w\-]+) +\(prefix +limit: +(?P<limit>\d+)\)$')
+        p8_1 = regex_engine.compile(r'^Global +export +route-map +for +(?P<af>[\w\s]+): +'
+                                    r'(?P<export_map>[\w\-]+) +\(prefix +limit: +(?P<limit>\d+)\)$')
 
         # Export route-map: export-test-map
-        p8_2 = re.compile(r'^Export +route-map: +(?P<export_map>[\w\-]+)$')
+        p8_2 = regex_engine.compile(r'^Export +route-map: +(?P<export_map>[\w\-]+)$')
 
         # Route warning limit 10000, current count 0
         # Route limit 10000, warning limit 70% (7000), current count 1
-        p9 = re.compile(r'^Route( *limit +(?P<limit>\d+),)? +'
-                        r'warning +limit +((?P<warning>\d+)|(?P<percent>\d+)'
-                        r'\% *\((?P<warning_limit>[\d\%]+)\)), +'
-                        r'current +count +(?P<count>\d+)$')
+        p9 = regex_engine.compile(r'^Route( *limit +(?P<limit>\d+),)? +'
+                                  r'warning +limit +((?P<warning>\d+)|(?P<percent>\d+)'
+                                  r'\% *\((?P<warning_limit>[\d\%]+)\)), +'
+                                  r'current +count +(?P<count>\d+)$')
 
         # VRF label distribution protocol: not configured
-        p10 = re.compile(r'^VRF +label +distribution +protocol: +(?P<vrf_label>[\w\s\-]+)$')
+        p10 = regex_engine.compile(r'^VRF +label +distribution +protocol: +(?P<vrf_label>[\w\s\-]+)$')
 
         # VRF label allocation mode: per-prefix
-        p11 = re.compile(r'^VRF +label +allocation +mode: +(?P<mode>[\w\s\-]+)'
-                         r'(?:\s*\(Label\s*(?P<label>\d+)\))?$')
+        p11 = regex_engine.compile(r'^VRF +label +allocation +mode: +(?P<mode>[\w\s\-]+)'
+                                   r'(?:\s*\(Label\s*(?P<label>\d+)\))?$')
 
         # Description: desc
-        p12 = re.compile(r'^Description: +(?P<desc>[\S\s]+)$')
+        p12 = regex_engine.compile(r'^Description: +(?P<desc>[\S\s]+)$')
 
 
         for line in output.splitlines():
@@ -369,7 +369,7 @@ class ShowVrfDetailSuperParser(ShowVrfDetailSchema):
                 intf_conf = True
                 continue
 
-            p3_1 = re.compile(r'^(?P<intf>[\w\s\/\.\-]+)$')
+            p3_1 = regex_engine.compile(r'^(?P<intf>[\w\s\/\.\-]+)$')
             m = p3_1.match(line)
             if m and intf_conf:
                 groups = m.groupdict()
@@ -600,7 +600,7 @@ class ShowVRFIPv6(ShowVRFIPv6Schema):
             output = self.device.execute(self.cli_command.format(vrf=vrf))
             
         res_dict = {}
-        p1 = re.compile(r'^(?P<vrf>[\w\d]+)+\s+(?P<default_rd>[\d\:\d]+)+\s+(?P<protocols>[\w\,\w]+)\s+\s\s(?P<interface>[\w\d]+)*$')
+        p1 = regex_engine.compile(r'^(?P<vrf>[\w\d]+)+\s+(?P<default_rd>[\d\:\d]+)+\s+(?P<protocols>[\w\,\w]+)\s+\s\s(?P<interface>[\w\d]+)*$')
         for line in output.splitlines():
             line = line.strip()
             # vrf21                                21:1              ipv4,ipv6   Vl21'''
@@ -657,30 +657,30 @@ class ShowPlatformSoftwareCefIpVrf(ShowPlatformSoftwareCefIpVrfSchema):
             output = self.device.execute(self.cli_command.format(protocol=protocol, option=option, ip=ip,mask=mask))
 
         # VRF Default
-        p1 = re.compile(r'^VRF\s+(?P<vrf_name>[\w\s\-]+)$')
+        p1 = regex_engine.compile(r'^VRF\s+(?P<vrf_name>[\w\s\-]+)$')
 
         # ------------------ show ip route vrf Default 11.1.6.1 255.255.255.0 ------------------
         # ------------------ show ip cef vrf vrf1000 11.1.6.1 255.255.255.0 internal ------------------
-        p2 = re.compile(r'^[-]+ show ip (?P<process_type>[\w\s]+) vrf +(?P<ip_vrf_name>[\w\s\-]+)\s+(?P<gateway>[\d\.]+)\s+(?P<mask>[\d\.]+)\s+?[internal+\s[-]+$')
+        p2 = regex_engine.compile(r'^[-]+ show ip (?P<process_type>[\w\s]+) vrf +(?P<ip_vrf_name>[\w\s\-]+)\s+(?P<gateway>[\d\.]+)\s+(?P<mask>[\d\.]+)\s+?[internal+\s[-]+$')
 
         # Routing Table: vrf1000
-        p3 = re.compile(r'^Routing Table: +(?P<route_vrf_name>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^Routing Table: +(?P<route_vrf_name>[\w\s]+)$')
 
         # Routing entry for 11.1.6.0/24
-        p4 = re.compile(r'^Routing entry for +(?P<route_ip_address>[\d\.]+)/(?P<route_mask_num>[\d]+)$')
+        p4 = regex_engine.compile(r'^Routing entry for +(?P<route_ip_address>[\d\.]+)/(?P<route_mask_num>[\d]+)$')
 
         # Known via "connected", distance 0, metric 0 (connected, via interface)
-        p5 = re.compile(r'^Known via "+(?P<stage>[\w]+)+",\s+distance+\s(?P<distance>[\d]+),\s+metric+\s(?P<metric>[\d]+)\s+\(connected, via interface\)')
+        p5 = regex_engine.compile(r'^Known via "+(?P<stage>[\w]+)+",\s+distance+\s(?P<distance>[\d]+),\s+metric+\s(?P<metric>[\d]+)\s+\(connected, via interface\)')
 
         # * directly connected, via HundredGigE1/0/3
-        p6 = re.compile(r'^[*] directly connected, via +(?P<interface>[\w\/]+)$')
+        p6 = regex_engine.compile(r'^[*] directly connected, via +(?P<interface>[\w\/]+)$')
 
         # Route metric is 0, traffic share count is 1
-        p7 = re.compile(r'^Route metric is (?P<route_metric>[\d]+), traffic share count is +(?P<traffic_share>[\d]+)$')
+        p7 = regex_engine.compile(r'^Route metric is (?P<route_metric>[\d]+), traffic share count is +(?P<traffic_share>[\d]+)$')
 
         # ------------------ show platform software ip switch active rp active cef prefix 11.1.6.1/24 detail ------------------
         # ------------------ show platform software ip fp active cef prefix 11.1.6.1/24 detail ------------------
-        p8 = re.compile(r'^[-]+ show platform software ip( switch active){0,1} (?P<process_type>[\w]+) active cef prefix +(?P<gateway>[\d\.]+)/(?P<mask_number>[\d]+)\s+detail +[-]+$')
+        p8 = regex_engine.compile(r'^[-]+ show platform software ip( switch active){0,1} (?P<process_type>[\w]+) active cef prefix +(?P<gateway>[\d\.]+)/(?P<mask_number>[\d]+)\s+detail +[-]+$')
 
         ret_dict = {}
 
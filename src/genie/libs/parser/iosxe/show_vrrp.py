@@ -14,14 +14,12 @@ IOSXE parsers for the following show commands:
     * 'show vrrp vpn <vpn_id>'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -157,99 +155,99 @@ class ShowVrrp(ShowVrrpSchema):
         # GigabitEthernet3.415 - Group 13
         # Vlan33 - Group 10 - Address-Family IPv4
         # Vlan33 - Group 10 - Address-Family IPv6
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface>[\w,\.\/]+)\s+-\s+Group\s(?P<group_number>\d+)(\s+-\s+Address-Family\s+(?P<address_family>IPv4|IPv6))?$')
 
         # State is Master
         # State is INIT (No Primary virtual IP address configured)
         # State is BACKUP
-        p2 = re.compile(r'State is (?P<state>(Master|MASTER|Up|UP|Init|INIT|BACKUP)).*$')
+        p2 = regex_engine.compile(r'State is (?P<state>(Master|MASTER|Up|UP|Init|INIT|BACKUP)).*$')
 
         # State duration 8 mins 40.214 secs
         # State duration 49.507 secs
-        p2_1 = re.compile(r'^State\s+duration\s+((?P<minutes>\d+)\s+mins\s+)?(?P<seconds>[\d\.]+)\s+secs$')
+        p2_1 = regex_engine.compile(r'^State\s+duration\s+((?P<minutes>\d+)\s+mins\s+)?(?P<seconds>[\d\.]+)\s+secs$')
 
         # Virtual IP address is 10.2.0.10
         # Virtual IP address is FE80::1
         # Virtual IP address is no address
-        p3 = re.compile(r'^Virtual +IP +address is (?P<vir_ip>[\w\.\:]+.*)$')
+        p3 = regex_engine.compile(r'^Virtual +IP +address is (?P<vir_ip>[\w\.\:]+.*)$')
     
         # Virtual secondary IP addresses:
-        p4 = re.compile(r'^Virtual\ssecondary\sIP\saddresses:$')
+        p4 = regex_engine.compile(r'^Virtual\ssecondary\sIP\saddresses:$')
 
         # 17::154/64
-        p5 = re.compile(r'^(?P<virtual_secondary_address>[\d\:\/\.]+)$')
+        p5 = regex_engine.compile(r'^(?P<virtual_secondary_address>[\d\:\/\.]+)$')
 
         # Virtual MAC address is 0000.5eff.0101
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Virtual +MAC +address +is (?P<vir_mac_addr>[\w,\.]+)$')
 
         # Advertisement interval is 3.000 sec
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Advertisement +interval +is (?P<advrt_interval>[\d,\.]+)\s+(?P<unit>\w+)$')
 
         #Preemption is enabled
-        p8 = re.compile(r'^Preemption +is (?P<state>\w+)$')
+        p8 = regex_engine.compile(r'^Preemption +is (?P<state>\w+)$')
 
         # Preemption enabled
-        p9 = re.compile(r'^Preemption (?P<state>\w+)$')
+        p9 = regex_engine.compile(r'^Preemption (?P<state>\w+)$')
 
         # min delay is 0.000 sec
-        p10 = re.compile(r'^min +delay +is (?P<delay>[\d,\.]+) +sec$')
+        p10 = regex_engine.compile(r'^min +delay +is (?P<delay>[\d,\.]+) +sec$')
 
         # Priority is 115
         # Priority is 70 (Configured 90)
-        p11 = re.compile(r'^Priority +is +(?P<priority>(\d+))|(\s+\(\w+\s+\d+\))$')
+        p11 = regex_engine.compile(r'^Priority +is +(?P<priority>(\d+))|(\s+\(\w+\s+\d+\))$')
 
         # Priority 100
-        p12 = re.compile(r'^Priority (?P<priority>\d+)$')
+        p12 = regex_engine.compile(r'^Priority (?P<priority>\d+)$')
 
         # VRRS Group name DC_LAN
-        p13 = re.compile(r'^VRRS +Group +name (?P<vrrs_grp_name>[\w,\_]+)$')
+        p13 = regex_engine.compile(r'^VRRS +Group +name (?P<vrrs_grp_name>[\w,\_]+)$')
 
         # Track object 1 state down decrement 15
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r'^Track +object (?P<obj_name>\w+) +state (?P<obj_state>(Up|UP|Down|DOWN)) +decrement (?P<value>\w+)$')
 
         # Authentication text "hash"
-        p15 = re.compile(r'^Authentication +text \"(?P<type>[\w,\"]+)\"$')
+        p15 = regex_engine.compile(r'^Authentication +text \"(?P<type>[\w,\"]+)\"$')
 
         # Master Router is 10.2.0.1 (local), priority is 100
         # Master Router is FE80::2A3:D1FF:FE45:BEC5 (local), priority is 150
         # Master Router is 173.29.2.6, priority is 85
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r'^Master +Router +is (?P<mast_ip_addr>[\w\.\:]+)+(,| )( |\((?P<server>\S+)\), )priority +is (?P<digit>\d+)$')
 
         # Master Advertisement interval is 3.000 sec
         # Master Advertisement interval is 1000 msec (expires in 46 msec)
         # Master Advertisement interval is 1000 msec (learned)
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r'^Master +Advertisement +interval +is (?P<mast_adv_interval>[\d,\.]+) +(?P<interval_unit>\w+)(\s+\(expires\s+in\s+(?P<expiration>[\d\.]+)\s+(?P<expiration_unit>\w+)\))?')
 
         # Master Advertisement interval is unknown
-        p17_2 = re.compile(
+        p17_2 = regex_engine.compile(
             r'^Master +Advertisement +interval +is (?P<mast_adv_interval>[\w,\.]+)$')
 
         # Master Down interval is 9.609 sec
         # Master Down interval is unknown
         # Master Down interval is 3726 msec (expires in 3326 msec) 
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r'^Master +Down +interval +is (?P<mast_down_interval>([\w,\.]+))(?P<interval_unit>( +sec)?$|( +msec)?)(\s+\(expires\s+in\s+(?P<expiration>[\d\.]+)\s+(?P<expiration_unit>\w+)\))?$')
 
         # Master Router is 192.168.1.233, priority is 120
         # Master Router is FE80::2A3:D1FF:FE45:BEC5, priority is 150
         # Master Router is unknown, priority is unknown
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r'^Master +Router +is (?P<mast_ip_addr>[\w,\.\:]+)+, +priority +is +(?P<priority>\w+)$')
 
         # FLAGS: 1/1
-        p20 = re.compile(r'^FLAGS:\s+(?P<flags>[\d\/]+)$')
+        p20 = regex_engine.compile(r'^FLAGS:\s+(?P<flags>[\d\/]+)$')
 
         # Description is "WORKING-VRRP"
-        p21 = re.compile(r'Description\s+is\s+(?P<description>\S+)$')
+        p21 = regex_engine.compile(r'Description\s+is\s+(?P<description>\S+)$')
 
         # DC-LAN Subnet
-        p21_1 = re.compile(r'^(?P<description>[\S\s]+)$')
+        p21_1 = regex_engine.compile(r'^(?P<description>[\S\s]+)$')
 
 
         for line in output.splitlines():
@@ -604,14 +602,14 @@ class ShowVrrpBrief(ShowVrrpBriefSchema):
 
         # Interface   Grp Pri Time  Own Pre State   Master addr  Group addr
         # Gi3.420    10  100 3609        Y Master  10.13.120.1  10.13.120.254
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface_name>^\S+)\s+(?P<grp>\d+)'
             r'\s+(?P<pri>\d+)\s+(?P<time>\d+)\s+(?P<pre>\w)\s+'
             r'(?P<state>\w+)\s+(?P<master_addr>[\d\.]+)\s+'
             r'(?P<group_addr>[\d\.]+)')
         #Interface          Grp  A-F Pri  Time Own Pre State   Master addr   Group addr
         #Vl10                 1 IPv4 150     0  N   Y  MASTER  10.1.0.1(local) 10.1.0.3
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
         r'^(?P<interface_name>\S+)\s+(?P<grp>\d+)\s+(?P<version>\w+)\s+(?P<pri>\d+)\s+(?P<time>\d+)\s+(?P<own>\w+)'
         r'\s+(?P<pre>\w+)\s+(?P<state>\w+)\s+(?P<master_addr>[\w\S:.]*)\s+(?P<group_addr>[\w:.]+)$')
 
@@ -764,115 +762,115 @@ class ShowVrrpDetail(ShowVrrpDetailSchema):
         config_dict = {}
 
         # GigabitEthernet0/0/2.150 - Group 2 - Address-Family IPv4
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface>[\w,\.\/]+)\s+-\s+Group\s(?P<group_number>\d+)(\s+-\s+Address-Family\s+(?P<address_family>IPv4|IPv6))?$')
 
         # State is INIT (No layer3 interface address)
         # State is BACKUP
-        p2 = re.compile(r'^State is (?P<state>(Master|MASTER|Up|UP|Init|INIT|BACKUP)).*$')
+        p2 = regex_engine.compile(r'^State is (?P<state>(Master|MASTER|Up|UP|Init|INIT|BACKUP)).*$')
 
         # State duration 6 hours 40 mins 47 secs
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^State\s+duration\s+(?P<hours>\d+)\s+hours\s(?P<minutes>\d+)\s+mins\s+(?P<seconds>[\d\.]+)\s+secs$')
 
         # Virtual IP address is no address
         # Virtual IP address is 192.105.105.201
-        p4 = re.compile(r'^Virtual\sIP\saddress\sis\s(?P<virtual_ip_address>[\w\.\:]+.*)$')
+        p4 = regex_engine.compile(r'^Virtual\sIP\saddress\sis\s(?P<virtual_ip_address>[\w\.\:]+.*)$')
 
         # Virtual MAC address is 0000.5E00.0102
-        p5 = re.compile(r'^Virtual\sMAC\saddress\sis\s(?P<virtual_mac_address>[\w,\.]+)$')
+        p5 = regex_engine.compile(r'^Virtual\sMAC\saddress\sis\s(?P<virtual_mac_address>[\w,\.]+)$')
 
         # Advertisement interval is 1000 msec
-        p6 = re.compile(r'^Advertisement\sinterval\sis\s+(?P<advertise_interval>[\d,\.]+)\s+(?P<unit>\w+)$')
+        p6 = regex_engine.compile(r'^Advertisement\sinterval\sis\s+(?P<advertise_interval>[\d,\.]+)\s+(?P<unit>\w+)$')
 
         # Preemption enabled
-        p7 = re.compile(r'^Preemption\s+(?P<preemption_state>\w+)$')
+        p7 = regex_engine.compile(r'^Preemption\s+(?P<preemption_state>\w+)$')
 
         # Priority is 250
-        p8 = re.compile(r'^Priority\sis\s+(?P<priority>\d+)$')
+        p8 = regex_engine.compile(r'^Priority\sis\s+(?P<priority>\d+)$')
 
         # State change reason is VRRP_INIT
-        p9 = re.compile(r'^State\schange\sreason\sis\s+(?P<state_change_reason>\w+)$')
+        p9 = regex_engine.compile(r'^State\schange\sreason\sis\s+(?P<state_change_reason>\w+)$')
 
         # Tloc preference not configured, value 0
-        p10 = re.compile(r'^Tloc\spreference\snot\sconfigured,\svalue+\s(?P<tloc_preference>\d+)$')
+        p10 = regex_engine.compile(r'^Tloc\spreference\snot\sconfigured,\svalue+\s(?P<tloc_preference>\d+)$')
 
         # Master Router is unknown, priority is unknown
         # Master Router is 192.105.105.91, priority is 220
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^Master\sRouter\sis\s(((?P<master_router>(([\w,\.\:]+) \((?P<server>\S+)\))|[\w,\.\:]+)+)),\spriority\sis\s(?P<master_router_priority>\w+)$')
 
         # Master Advertisement interval is unknown
         # Master Advertisement interval is 1000 msec (learned)
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^Master +Advertisement +interval +is (?P<master_advertisement_interval>([\w,\.]+)|([\d,\.]+) +(?P<interval_unit>\w+)(\s+\(expires\s+in\s+(?P<expiration>[\d\.]+)\s+(?P<expiration_unit>\w+)\)))?')
 
         # Master Down interval is unknown
         # Master Down interval is 3218 msec (expires in 3066 msec)
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r'^Master\sDown\sinterval\sis\s(?P<master_down_interval>([\w,\.]+)|([\d,\.]+) +(?P<interval_unit>\w+)(\s+\(expires\s+in\s+(?P<expiration>[\d\.]+)\s+(?P<expiration_unit>\w+)\)))?$')
 
         # FLAGS: 1/0
-        p14 = re.compile(r'^FLAGS:\s+(?P<flags>[\d\/]+)$')
+        p14 = regex_engine.compile(r'^FLAGS:\s+(?P<flags>[\d\/]+)$')
 
         # VRRPv3 Advertisements: sent 0 (errors 10) - rcvd 0
         # VRRPv3 Advertisements: sent 23 (errors 0) - rcvd 26331
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r'^VRRPv3\sAdvertisements:\ssent\s+(?P<sent>\d+)\s\(\S+\s+(?P<errors>\d+)\)\s+\S+\s+\w+\s+(?P<rcvd>\d+)$')
 
         # VRRPv2 Advertisements: sent 0 (errors 10) - rcvd 0
         # VRRPv2 Advertisements: sent 23 (errors 0) - rcvd 2
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r'^VRRPv2\sAdvertisements:\ssent\s+(?P<sent>\d+)\s\(\S+\s+(?P<errors>\d+)\)\s+\S+\s+\w+\s+(?P<rcvd>\d+)$')
 
         # Group Discarded Packets: 0
-        p17 = re.compile(r'^Group\sDiscarded\sPackets:\s+(?P<group_discarded_packets>\d+)$')
+        p17 = regex_engine.compile(r'^Group\sDiscarded\sPackets:\s+(?P<group_discarded_packets>\d+)$')
 
         # VRRPv2 incompatibility: 0
-        p18 = re.compile(r'^VRRPv2\sincompatibility:\s+(?P<vrrpv2_incompatibility>\d+)$')
+        p18 = regex_engine.compile(r'^VRRPv2\sincompatibility:\s+(?P<vrrpv2_incompatibility>\d+)$')
 
         # IP Address Owner conflicts: 0
-        p19 = re.compile(r'^IP\sAddress\sOwner\sconflicts:\s+(?P<ip_address_owner_conflicts>\d+)$')
+        p19 = regex_engine.compile(r'^IP\sAddress\sOwner\sconflicts:\s+(?P<ip_address_owner_conflicts>\d+)$')
 
         # Invalid address count: 0
-        p20 = re.compile(r'^Invalid\saddress\scount:\s+(?P<invalid_address_count>\d+)$')
+        p20 = regex_engine.compile(r'^Invalid\saddress\scount:\s+(?P<invalid_address_count>\d+)$')
 
         # IP address configuration mismatch : 0
-        p21 = re.compile(r'^IP\saddress\sconfiguration\smismatch\s:\s+(?P<ip_address_configuration_mismatch>\d+)$')
+        p21 = regex_engine.compile(r'^IP\saddress\sconfiguration\smismatch\s:\s+(?P<ip_address_configuration_mismatch>\d+)$')
 
         # Invalid Advert Interval: 0
-        p22 = re.compile(r'^Invalid\sAdvert\sInterval:\s+(?P<invalid_advert_interval>\d+)$')
+        p22 = regex_engine.compile(r'^Invalid\sAdvert\sInterval:\s+(?P<invalid_advert_interval>\d+)$')
 
         # Adverts received in Init state: 0
-        p23 = re.compile(r'^Adverts\sreceived\sin\sInit\sstate:\s+(?P<adverts_received_in_Init_state>\d+)$')
+        p23 = regex_engine.compile(r'^Adverts\sreceived\sin\sInit\sstate:\s+(?P<adverts_received_in_Init_state>\d+)$')
 
         # Invalid group other reason: 0
-        p24 = re.compile(r'^Invalid\sgroup\sother\sreason:\s+(?P<invalid_group_other_reason>\d+)$')
+        p24 = regex_engine.compile(r'^Invalid\sgroup\sother\sreason:\s+(?P<invalid_group_other_reason>\d+)$')
 
         # Init to master: 0
-        p25 = re.compile(r'^Init\sto\smaster:\s+(?P<init_to_master>\d+)')
+        p25 = regex_engine.compile(r'^Init\sto\smaster:\s+(?P<init_to_master>\d+)')
 
         # Init to backup: 0
         # Init to backup: 2 (Last change Tue Feb 15 07:17:16.662)
-        p26 = re.compile(r'^Init\sto\sbackup:\s+(?P<init_to_backup>\d+)')
+        p26 = regex_engine.compile(r'^Init\sto\sbackup:\s+(?P<init_to_backup>\d+)')
 
         # Backup to master: 0
         # Backup to master: 2 (Last change Tue Feb 15 07:17:19.881)
-        p27 = re.compile(r'^Backup\sto\smaster:\s+(?P<backup_to_master>\d+)')
+        p27 = regex_engine.compile(r'^Backup\sto\smaster:\s+(?P<backup_to_master>\d+)')
 
         # Master to backup: 0
         # Master to backup: 1 (Last change Tue Feb 15 07:17:37.384)
-        p28 = re.compile(r'^Master\sto\sbackup:\s+(?P<master_to_backup>\d+)')
+        p28 = regex_engine.compile(r'^Master\sto\sbackup:\s+(?P<master_to_backup>\d+)')
 
         # Master to init: 0
-        p29 = re.compile(r'^Master\sto\sinit:\s+(?P<master_to_init>\d+)')
+        p29 = regex_engine.compile(r'^Master\sto\sinit:\s+(?P<master_to_init>\d+)')
 
         # Backup to init: 0
         # Backup to init: 1 (Last change Tue Feb 15 07:12:56.285)
-        p30 = re.compile(r'^Backup\sto\sinit:\s+(?P<backup_to_init>\d+)')
+        p30 = regex_engine.compile(r'^Backup\sto\sinit:\s+(?P<backup_to_init>\d+)')
 
         # Track object omp state UP shutdown
-        p31 = re.compile(r'^Track\sobject\s(?P<obj_name>\w+)\sstate\s(?P<obj_state>(Up|UP|Down|DOWN))\s\w+$')
+        p31 = regex_engine.compile(r'^Track\sobject\s(?P<obj_name>\w+)\sstate\s(?P<obj_state>(Up|UP|Down|DOWN))\s\w+$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1215,40 +1213,40 @@ class ShowVrrpVpn(ShowVrrpVpnSchema):
         config_dict = {}
 
         # vrrp vpn 1
-        p1 = re.compile(r'^vrrp\svpn\s(?P<vrrp_vpn>\d+)$')
+        p1 = regex_engine.compile(r'^vrrp\svpn\s(?P<vrrp_vpn>\d+)$')
 
         # interfaces ge2/3.101
-        p2 = re.compile(r'^interfaces\s(?P<interfaces>[\w,\.\/]+)$')
+        p2 = regex_engine.compile(r'^interfaces\s(?P<interfaces>[\w,\.\/]+)$')
 
         # groups 1
-        p3 = re.compile(r'^groups\s(?P<groups>\d+)$')
+        p3 = regex_engine.compile(r'^groups\s(?P<groups>\d+)$')
 
         # virtual-ip             182.210.210.201
-        p4 = re.compile(r'^virtual-ip\s+(?P<virtual_ip_address>[\w\.\:]+.*)$')
+        p4 = regex_engine.compile(r'^virtual-ip\s+(?P<virtual_ip_address>[\w\.\:]+.*)$')
 
         # virtual-mac            00:00:5e:00:01:01
-        p5 = re.compile(r'^virtual-mac\s+(?P<virtual_mac_address>[\w,\.:]+)$')
+        p5 = regex_engine.compile(r'^virtual-mac\s+(?P<virtual_mac_address>[\w,\.:]+)$')
 
         # priority            115
-        p6 = re.compile(r'^priority\s+(?P<priority>\d+)$')
+        p6 = regex_engine.compile(r'^priority\s+(?P<priority>\d+)$')
 
         # real-priority          105
-        p7 = re.compile(r'^real-priority\s+(?P<real_priority>\d+)$')
+        p7 = regex_engine.compile(r'^real-priority\s+(?P<real_priority>\d+)$')
 
         # vrrp-state             primary
-        p8 = re.compile(r'^vrrp-state\s+(?P<vrrp_state>\w+)$')
+        p8 = regex_engine.compile(r'^vrrp-state\s+(?P<vrrp_state>\w+)$')
 
         #  omp-state              up
-        p9 = re.compile(r'^omp-state\s+(?P<omp_state>\w+)$')
+        p9 = regex_engine.compile(r'^omp-state\s+(?P<omp_state>\w+)$')
 
         #  advertisement-timer    1
-        p10 = re.compile(r'^advertisement-timer\s+(?P<advertisement_timer>\d+)$')
+        p10 = regex_engine.compile(r'^advertisement-timer\s+(?P<advertisement_timer>\d+)$')
 
         #  primary-down-timer     3
-        p11 = re.compile(r'^primary-down-timer\s+(?P<primary_down_timer>\d+)$')
+        p11 = regex_engine.compile(r'^primary-down-timer\s+(?P<primary_down_timer>\d+)$')
 
         #  last-state-change-time 2022-01-24T06:56:20+00:00
-        p12 = re.compile(r'^last-state-change-time\s+(?P<last_state_change_time>[\w:-]+[+]+[\w:]+)$')
+        p12 = regex_engine.compile(r'^last-state-change-time\s+(?P<last_state_change_time>[\w:-]+[+]+[\w:]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6,12 +6,10 @@ IOSXE parsers for the following show commands:
 
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -106,32 +104,32 @@ class ShowVtemplate(ShowVtemplateSchema):
         ret_dict = {}
 
         # Virtual access subinterface creation is globally enabled
-        p1 = re.compile(r'^(?P<var>[Vv]i\w+\s+\w+\s+\w+\s+\w+)\s+\w+\s+(?P<val>.+)$')
+        p1 = regex_engine.compile(r'^(?P<var>[Vv]i\w+\s+\w+\s+\w+\s+\w+)\s+\w+\s+(?P<val>.+)$')
 
         # Vt1            0           11   Yes   Serial 
-        p2 = re.compile(r'^(?P<var>[Vv]\w+)\s+(?P<val1>\d+)\s+(?P<val2>\d+)\s+(?P<val3>\w+)\s+(?P<val4>\w+)$')
+        p2 = regex_engine.compile(r'^(?P<var>[Vv]\w+)\s+(?P<val1>\d+)\s+(?P<val2>\d+)\s+(?P<val3>\w+)\s+(?P<val4>\w+)$')
 
         # Usage Summary
-        p3 = re.compile(r'^(?P<var>[Uu]\w+\s+\w+)$')
+        p3 = regex_engine.compile(r'^(?P<var>[Uu]\w+\s+\w+)$')
                 
         # Current Serial  in use                2             11
         # Current Ether   in use                0              0
         # Current Tunnel  in use                0              0 
         # Current VPN  in use                0              0
-        p4 = re.compile(r'^(?P<var>\w+\s+\w+\s+\w+\s+\w+)\s+(?P<val1>\d+)\s+(?P<val2>\d+)$')
+        p4 = regex_engine.compile(r'^(?P<var>\w+\s+\w+\s+\w+\s+\w+)\s+(?P<val1>\d+)\s+(?P<val2>\d+)$')
 
         # Current Serial  free                  0              1
         # Current Ether   free                  0              0
         # Current Tunnel  free                  0              0
         # Current VPN  free                  0              0
-        p5 = re.compile(r'^(?P<var>[Cc]\w+\s+\w+\s+\w+)\s+(?P<val1>\d+)\s+(?P<val2>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<var>[Cc]\w+\s+\w+\s+\w+)\s+(?P<val1>\d+)\s+(?P<val2>\d+)$')
 
         # Total                                 2             12
-        p6 = re.compile(r'^(?P<var>[Tt]\w+)\s+(?P<val1>\d+)\s+(?P<val2>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<var>[Tt]\w+)\s+(?P<val1>\d+)\s+(?P<val2>\d+)$')
 
         # Cumulative created                    5             69
         # Cumulative freed                      0             58
-        p7 = re.compile(r'^(?P<var>[Cc]\w+\s+\w+)\s+(?P<val1>\d+)\s+(?P<val2>\d+)$')
+        p7 = regex_engine.compile(r'^(?P<var>[Cc]\w+\s+\w+)\s+(?P<val1>\d+)\s+(?P<val2>\d+)$')
 
         # Base virtual access interfaces: 2
         # Total create or clone requests: 43
@@ -141,7 +139,7 @@ class ShowVtemplate(ShowVtemplateSchema):
         # Current free pending: 0
         # Current recycle pending: 0
         # Current ordered recycle pending: 0
-        p8 = re.compile(r'^(?P<var>\w+.+)\s*:\s*(?P<val1>\d+)$')
+        p8 = regex_engine.compile(r'^(?P<var>\w+.+)\s*:\s*(?P<val1>\d+)$')
 
         # Maximum request duration: 26 msec
         # Average request duration: 5 msec
@@ -149,7 +147,7 @@ class ShowVtemplate(ShowVtemplateSchema):
         # Maximum processing duration: 9 msec
         # Average processing duration: 4 msec
         # Last processing duration: 3 msec
-        p9 = re.compile(r'^(?P<var>\w+\s+\w+\s+[Dd]\w+)\s*:\s*(?P<val1>\d+)\s+\w+$')
+        p9 = regex_engine.compile(r'^(?P<var>\w+\s+\w+\s+[Dd]\w+)\s*:\s*(?P<val1>\d+)\s+\w+$')
 
         for lines in out.splitlines():
             line = lines.strip()
@@ -4,13 +4,13 @@ IOSXE parsers for the following show commands:
     * show vtp status
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Parser for 'show vtp password'
 # =============================================
@@ -40,13 +40,13 @@ class ShowVtpPassword(ShowVtpPasswordSchema):
         ret_dict = {}
 
         # The VTP password is not configured.
-        p1 = re.compile(r'^The +VTP +password +is +not +configured.$')
+        p1 = regex_engine.compile(r'^The +VTP +password +is +not +configured.$')
 
         # VTP Password: password-string
-        p2 = re.compile(r'^VTP +Password: +(?P<val>\S+)$')
+        p2 = regex_engine.compile(r'^VTP +Password: +(?P<val>\S+)$')
 
         # VTP Password: password-string
-        p3 = re.compile(r'^VTP +Password is +(?P<val>\S+)$')
+        p3 = regex_engine.compile(r'^VTP +Password is +(?P<val>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -146,73 +146,73 @@ class ShowVtpStatus(ShowVtpStatusSchema):
         digest = []
 
         # VTP Version capable             : 1 to 3
-        p1 = re.compile(r'^VTP +Version +capable +: +(?P<val>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^VTP +Version +capable +: +(?P<val>[\w\s]+)$')
 
         # VTP version running             : 1
         # VTP Version                     : 2
         # VTP Version : running VTP1 (VTP2 capable)
-        p2 = re.compile(r'^VTP +[Vv]ersion(?: +running)? *: '
-                         r'(running VTP)?(?P<version>\d+)'
-                         r'( +\(VTP+(?P<capable>\d+) capable\))?$')
+        p2 = regex_engine.compile(r'^VTP +[Vv]ersion(?: +running)? *: '
+                                   r'(running VTP)?(?P<version>\d+)'
+                                   r'( +\(VTP+(?P<capable>\d+) capable\))?$')
 
         # VTP Domain Name                 : 
-        p3 = re.compile(r'^VTP +Domain +Name +: +(?P<val>\S+)$')
+        p3 = regex_engine.compile(r'^VTP +Domain +Name +: +(?P<val>\S+)$')
 
         # VTP Pruning Mode                : Disabled
         # VTP Pruning Mode                : 1
-        p4 = re.compile(r'^VTP +Pruning +Mode +: +(?P<val>.*)$')
+        p4 = regex_engine.compile(r'^VTP +Pruning +Mode +: +(?P<val>.*)$')
 
         # VTP Traps Generation            : Disabled
-        p5 = re.compile(r'^VTP +Traps +Generation +: +(?P<val>\w+)$')
+        p5 = regex_engine.compile(r'^VTP +Traps +Generation +: +(?P<val>\w+)$')
 
         # Device ID                       : 3820.56ff.c7a2
-        p6 = re.compile(r'^Device +ID +: +(?P<val>[\w\.\:]+)$')
+        p6 = regex_engine.compile(r'^Device +ID +: +(?P<val>[\w\.\:]+)$')
 
         # Configuration last modified by 192.168.234.1 at 12-5-17 09:35:46
-        p7 = re.compile(r'^Configuration +last +modified +by +'
-                         r'(?P<val>[\w\.\:]+) +at +(?P<val1>[\w\.\:\-\s]+)$')
+        p7 = regex_engine.compile(r'^Configuration +last +modified +by +'
+                                   r'(?P<val>[\w\.\:]+) +at +(?P<val1>[\w\.\:\-\s]+)$')
 
         # Local updater ID is 192.168.234.1 on interface Vl100 (lowest numbered VLAN interface found)
-        p8 = re.compile(r'^Local +updater +ID +is +(?P<id>[\w\.\:]+) +on +'
-                         r'interface +(?P<intf>[\w\.\/\-]+) *'
-                         r'(\((?P<reason>[\S\s]+)\))?$')
+        p8 = regex_engine.compile(r'^Local +updater +ID +is +(?P<id>[\w\.\:]+) +on +'
+                                   r'interface +(?P<intf>[\w\.\/\-]+) *'
+                                   r'(\((?P<reason>[\S\s]+)\))?$')
 
         # Feature VLAN:
-        p17 = re.compile(r'^Feature +VLAN:$')
+        p17 = regex_engine.compile(r'^Feature +VLAN:$')
         # --------------
         # VTP Operating Mode                : Server
-        p9 = re.compile(r'^VTP +Operating +Mode +: (?P<val>\S+\s?\S*)$')
+        p9 = regex_engine.compile(r'^VTP +Operating +Mode +: (?P<val>\S+\s?\S*)$')
 
         # Maximum VLANs supported locally   : 1005
         # Maximum VLANs supported locally   :  2048
-        p10 = re.compile(r'^Maximum +VLANs +supported +locally +: +(?P<val>\d+)$')
+        p10 = regex_engine.compile(r'^Maximum +VLANs +supported +locally +: +(?P<val>\d+)$')
 
         # Number of existing VLANs          : 53
-        p11 = re.compile(r'^Number +of +existing +VLANs +: (?P<val>\d+)$')
+        p11 = regex_engine.compile(r'^Number +of +existing +VLANs +: (?P<val>\d+)$')
 
         # Number of existing extended VLANs : 0
-        p14 = re.compile(r'^Number +of +existing +extended +VLANs +: (?P<val>\d+)$')
+        p14 = regex_engine.compile(r'^Number +of +existing +extended +VLANs +: (?P<val>\d+)$')
 
         # Configuration Revision            : 55
-        p12 = re.compile(r'^Configuration +Revision +: (?P<val>\d+)$')
+        p12 = regex_engine.compile(r'^Configuration +Revision +: (?P<val>\d+)$')
 
         # Primary ID                        : 0000.0000.0000
-        p15 = re.compile(r'^Primary +ID +: (?P<val>([0-9a-f]{4}.?){3})$')
+        p15 = regex_engine.compile(r'^Primary +ID +: (?P<val>([0-9a-f]{4}.?){3})$')
 
         # Primary Description               : SW2
-        p16 = re.compile(r'^Primary +Description +: (?P<val>\S*)$')
+        p16 = regex_engine.compile(r'^Primary +Description +: (?P<val>\S*)$')
 
         # MD5 digest                        : 0x9E 0x35 0x3C 0x74 0xDD 0xE9 0x3D 0x62 
-        p13 = re.compile(r'^MD5 +digest +: (?P<val>[\w\s]+)$')
+        p13 = regex_engine.compile(r'^MD5 +digest +: (?P<val>[\w\s]+)$')
 
         #                                     0xDE 0x2D 0x66 0x67 0x70 0x72 0x55 0x38
-        p13_1 = re.compile(r'^(?P<val>[\w\s]+)$')
+        p13_1 = regex_engine.compile(r'^(?P<val>[\w\s]+)$')
 
         # Feature MST:
-        p18 = re.compile(r'^Feature +MST:.*$')
+        p18 = regex_engine.compile(r'^Feature +MST:.*$')
 
         # Feature UNKNOWN:
-        p19 = re.compile(r'^Feature +UNKNOWN:.*$')
+        p19 = regex_engine.compile(r'^Feature +UNKNOWN:.*$')
 
         for line in out.splitlines():
             line = line.strip()
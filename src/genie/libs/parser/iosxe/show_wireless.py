@@ -3,6 +3,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 
 # ==========================================
@@ -265,225 +268,225 @@ class ShowWirelessProfilePolicyDetailed(ShowWirelessProfilePolicyDetailedSchema)
         # 5Ghz ATF Policy                   : default-atf-policy
         # Policy Profile Name                 : default-policy-profile
 
-        p_policy_profile_name = re.compile(r"^Policy\s+Profile\s+Name\s+:\s+(?P<name>\S+)$")
+        p_policy_profile_name = regex_engine.compile(r"^Policy\s+Profile\s+Name\s+:\s+(?P<name>\S+)$")
         # Description                         : default policy profile
-        p_description = re.compile(r"^Description\s+:\s+(?P<value>.*)$")
+        p_description = regex_engine.compile(r"^Description\s+:\s+(?P<value>.*)$")
         # Status                              : DISABLED
-        p_status = re.compile(r"^Status\s+:\s+(?P<value>\S+)$")
+        p_status = regex_engine.compile(r"^Status\s+:\s+(?P<value>\S+)$")
         # VLAN                                : VLAN0100
-        p_vlan = re.compile(r"^VLAN\s+:\s+(?P<value>\S+)$")
+        p_vlan = regex_engine.compile(r"^VLAN\s+:\s+(?P<value>\S+)$")
         # Multicast VLAN                      : 0
-        p_multi_vlan = re.compile(r"^Multicast\s+VLAN\s+:\s+(?P<value>\S+)$")
+        p_multi_vlan = regex_engine.compile(r"^Multicast\s+VLAN\s+:\s+(?P<value>\S+)$")
         # OSEN client VLAN                    :
-        p_osen = re.compile(r"^OSEN\s+client\s+VLAN\s+:\s+(?P<value>.*)$")
+        p_osen = regex_engine.compile(r"^OSEN\s+client\s+VLAN\s+:\s+(?P<value>.*)$")
         # Wireless management interface VLAN  : 10
-        p_wireless_mgmt = re.compile(r"^Wireless\s+management\s+interface\s+VLAN\s+:\s+(?P<value>\S+)$")
+        p_wireless_mgmt = regex_engine.compile(r"^Wireless\s+management\s+interface\s+VLAN\s+:\s+(?P<value>\S+)$")
         # Multicast Filter                    : DISABLED
-        p_multi_filter = re.compile(r"^Multicast\s+Filter\s+:\s+(?P<value>\S+)$")
+        p_multi_filter = regex_engine.compile(r"^Multicast\s+Filter\s+:\s+(?P<value>\S+)$")
         # QBSS Load                           : ENABLED
-        p_qbss = re.compile(r"^QBSS\s+Load\s+:\s+(?P<value>\S+)$")
+        p_qbss = regex_engine.compile(r"^QBSS\s+Load\s+:\s+(?P<value>\S+)$")
         # Passive Client                      : DISABLED
-        p_passive_client = re.compile(r"^Passive\s+Client\s+:\s+(?P<value>\S+)$")
+        p_passive_client = regex_engine.compile(r"^Passive\s+Client\s+:\s+(?P<value>\S+)$")
         # ET-Analytics                        : DISABLED
-        p_et_analytics = re.compile(r"^ET-Analytics\s+:\s+(?P<value>\S+)$")
+        p_et_analytics = regex_engine.compile(r"^ET-Analytics\s+:\s+(?P<value>\S+)$")
         # StaticIP Mobility                   : DISABLED
-        p_static_ip = re.compile(r"^StaticIP\s+Mobility\s+:\s+(?P<value>\S+)$")
+        p_static_ip = regex_engine.compile(r"^StaticIP\s+Mobility\s+:\s+(?P<value>\S+)$")
         # WLAN Switching Policy
-        p_wlan_switching_policy = re.compile(r"^WLAN\s+Switching\s+Policy$")
+        p_wlan_switching_policy = regex_engine.compile(r"^WLAN\s+Switching\s+Policy$")
         # Flex Central Switching            : ENABLED
-        p_f_central_switch = re.compile(r"^Flex\s+Central\s+Switching\s+:\s+(?P<value>\S+)$")
+        p_f_central_switch = regex_engine.compile(r"^Flex\s+Central\s+Switching\s+:\s+(?P<value>\S+)$")
         # Flex Central Authentication       : ENABLED
-        p_f_central_auth = re.compile(r"^Flex\s+Central\s+Authentication\s+:\s+(?P<value>\S+)$")
+        p_f_central_auth = regex_engine.compile(r"^Flex\s+Central\s+Authentication\s+:\s+(?P<value>\S+)$")
         # Flex Central DHCP                 : ENABLED
-        p_f_central_dhcp = re.compile(r"^Flex\s+Central\s+DHCP\s+:\s+(?P<value>\S+)$")
+        p_f_central_dhcp = regex_engine.compile(r"^Flex\s+Central\s+DHCP\s+:\s+(?P<value>\S+)$")
         # Flex NAT PAT                      : DISABLED
-        p_f_nat_pat = re.compile(r"^Flex\s+NAT\s+PAT\s+:\s+(?P<value>\S+)$")
+        p_f_nat_pat = regex_engine.compile(r"^Flex\s+NAT\s+PAT\s+:\s+(?P<value>\S+)$")
         # Flex Central Assoc                : ENABLED
-        p_f_central_assoc = re.compile(r"^Flex\s+Central\s+Assoc\s+:\s+(?P<value>\S+)$")
+        p_f_central_assoc = regex_engine.compile(r"^Flex\s+Central\s+Assoc\s+:\s+(?P<value>\S+)$")
         # WLAN Flex Policy
-        p_wlan_flex_policy = re.compile(r"^WLAN\s+Flex\s+Policy$")
+        p_wlan_flex_policy = regex_engine.compile(r"^WLAN\s+Flex\s+Policy$")
         # VLAN based Central Switching      : DISABLED
-        p_vlan_central_switching = re.compile(r"^VLAN\s+based\s+Central\s+Switching\s+:\s+(?P<value>\S+)$")
+        p_vlan_central_switching = regex_engine.compile(r"^VLAN\s+based\s+Central\s+Switching\s+:\s+(?P<value>\S+)$")
         # WLAN ACL
-        p_wlan_acl = re.compile(r"^WLAN\s+ACL$")
+        p_wlan_acl = regex_engine.compile(r"^WLAN\s+ACL$")
         # IPv4 ACL                          : Not Configured
-        p_ipv4_acl = re.compile(r"^IPv4\s+ACL\s+:\s+(?P<value>.*)$")
+        p_ipv4_acl = regex_engine.compile(r"^IPv4\s+ACL\s+:\s+(?P<value>.*)$")
         # IPv6 ACL                          : Not Configured
-        p_ipv6_acl = re.compile(r"^IPv6\s+ACL\s+:\s+(?P<value>.*)$")
+        p_ipv6_acl = regex_engine.compile(r"^IPv6\s+ACL\s+:\s+(?P<value>.*)$")
         # Layer2 ACL                        : Not Configured
-        p_l2_acl = re.compile(r"^Layer2\s+ACL\s+:\s+(?P<value>.*)$")
+        p_l2_acl = regex_engine.compile(r"^Layer2\s+ACL\s+:\s+(?P<value>.*)$")
         # Preauth urlfilter list            : Not Configured
-        p_pre_url_filter = re.compile(r"^Preauth\s+urlfilter\s+list\s+:\s+(?P<value>.*)$")
+        p_pre_url_filter = regex_engine.compile(r"^Preauth\s+urlfilter\s+list\s+:\s+(?P<value>.*)$")
         # Postauth urlfilter list           : Not Configured
-        p_post_url_filter = re.compile(r"^Postauth\s+urlfilter\s+list\s+:\s+(?P<value>.*)$")
+        p_post_url_filter = regex_engine.compile(r"^Postauth\s+urlfilter\s+list\s+:\s+(?P<value>.*)$")
         # WLAN Timeout
-        p_wlan_timeout = re.compile(r"^WLAN\s+Timeout$")
+        p_wlan_timeout = regex_engine.compile(r"^WLAN\s+Timeout$")
         # Session Timeout                   : 1800
-        p_session_timeout = re.compile(r"^Session\s+Timeout\s+:\s+(?P<value>\d+)$")
+        p_session_timeout = regex_engine.compile(r"^Session\s+Timeout\s+:\s+(?P<value>\d+)$")
         # Idle Timeout                      : 300
-        p_idle_timeout = re.compile(r"^Idle\s+Timeout\s+:\s+(?P<value>\d+)$")
+        p_idle_timeout = regex_engine.compile(r"^Idle\s+Timeout\s+:\s+(?P<value>\d+)$")
         # Idle Threshold                    : 0
-        p_idle_threshold = re.compile(r"^Idle\s+Threshold\s+:\s+(?P<value>\d+)$")
+        p_idle_threshold = regex_engine.compile(r"^Idle\s+Threshold\s+:\s+(?P<value>\d+)$")
         # Guest LAN Session Timeout         : DISABLED
-        p_guest_timeout = re.compile(r"^Guest\s+LAN\s+Session\s+Timeout\s+:\s+(?P<value>\S+)$")
+        p_guest_timeout = regex_engine.compile(r"^Guest\s+LAN\s+Session\s+Timeout\s+:\s+(?P<value>\S+)$")
         # WLAN Local Profiling
-        p_wlan_local_profiling = re.compile(r"^WLAN\s+Local\s+Profiling$")
+        p_wlan_local_profiling = regex_engine.compile(r"^WLAN\s+Local\s+Profiling$")
         # Subscriber Policy Name            : Not Configured
-        p_subcriber_policy_name = re.compile(r"^Subscriber\s+Policy\s+Name\s+:\s+(?P<name>.*)$")
+        p_subcriber_policy_name = regex_engine.compile(r"^Subscriber\s+Policy\s+Name\s+:\s+(?P<name>.*)$")
         # RADIUS Profiling                  : DISABLED
-        p_radius_profiling = re.compile(r"^RADIUS\s+Profiling\s+:\s+(?P<value>\S+)$")
+        p_radius_profiling = regex_engine.compile(r"^RADIUS\s+Profiling\s+:\s+(?P<value>\S+)$")
         # HTTP TLV caching                  : DISABLED
-        p_hhtp_tlv_cache = re.compile(r"^HTTP\s+TLV\s+caching\s+:\s+(?P<value>\S+)$")
+        p_hhtp_tlv_cache = regex_engine.compile(r"^HTTP\s+TLV\s+caching\s+:\s+(?P<value>\S+)$")
         # DHCP TLV caching                  : DISABLED
-        p_dhcp_tlv_cache = re.compile(r"^DHCP\s+TLV\s+caching\s+:\s+(?P<value>\S+)$")
+        p_dhcp_tlv_cache = regex_engine.compile(r"^DHCP\s+TLV\s+caching\s+:\s+(?P<value>\S+)$")
         # CTS Policy
-        p_cts_policy = re.compile(r"^CTS\s+Policy$")
+        p_cts_policy = regex_engine.compile(r"^CTS\s+Policy$")
         # Inline Tagging                    : DISABLED
-        p_inline_tagging = re.compile(r"^Inline\s+Tagging\s+:\s+(?P<value>\S+)$")
+        p_inline_tagging = regex_engine.compile(r"^Inline\s+Tagging\s+:\s+(?P<value>\S+)$")
         # SGACL Enforcement                 : DISABLED
-        p_sgacl_enforcement = re.compile(r"^SGACL\s+Enforcement\s+:\s+(?P<value>\S+)$")
+        p_sgacl_enforcement = regex_engine.compile(r"^SGACL\s+Enforcement\s+:\s+(?P<value>\S+)$")
         # Default SGT                       : 0
-        p_default_sgt = re.compile(r"^Default\s+SGT\s+:\s+(?P<value>\d+)$")
+        p_default_sgt = regex_engine.compile(r"^Default\s+SGT\s+:\s+(?P<value>\d+)$")
         # WLAN Mobility
-        p_wlan_mobility = re.compile(r"^WLAN\s+Mobility$")
+        p_wlan_mobility = regex_engine.compile(r"^WLAN\s+Mobility$")
         # Anchor                            : DISABLED
-        p_anchor = re.compile(r"^Anchor\s+:\s+(?P<value>\S+)$")
+        p_anchor = regex_engine.compile(r"^Anchor\s+:\s+(?P<value>\S+)$")
         # AVC VISIBILITY                      : Disabled
-        p_avc_visibility = re.compile(r"^AVC\s+VISIBILITY\s+:\s+(?P<value>\S+)$")
+        p_avc_visibility = regex_engine.compile(r"^AVC\s+VISIBILITY\s+:\s+(?P<value>\S+)$")
         # IPv4 Flow Monitors
-        p_ipv4_flow = re.compile(r"^IPv4\s+Flow\s+Monitors$")
+        p_ipv4_flow = regex_engine.compile(r"^IPv4\s+Flow\s+Monitors$")
         # Ingress
-        p_ingress = re.compile(r"^Ingress$")
+        p_ingress = regex_engine.compile(r"^Ingress$")
         # Egress
-        p_egress = re.compile(r"^Egress$")
+        p_egress = regex_engine.compile(r"^Egress$")
         # IPv6 Flow Monitors
-        p_ipv6_flow = re.compile(r"^IPv6\s+Flow\s+Monitors$")
+        p_ipv6_flow = regex_engine.compile(r"^IPv6\s+Flow\s+Monitors$")
         # Ingress
-        p_ingress = re.compile(r"^Ingress$")
+        p_ingress = regex_engine.compile(r"^Ingress$")
         # Egress
-        p_egress = re.compile(r"^Egress$")
+        p_egress = regex_engine.compile(r"^Egress$")
         # NBAR Protocol Discovery             : Disabled
-        p_nbar = re.compile(r"^NBAR\s+Protocol\s+Discovery\s+:\s+(?P<value>\S+)$")
+        p_nbar = regex_engine.compile(r"^NBAR\s+Protocol\s+Discovery\s+:\s+(?P<value>\S+)$")
         # Reanchoring                         : Disabled
-        p_reanchoring = re.compile(r"^Reanchoring\s+:\s+(?P<value>\S+)$")
+        p_reanchoring = regex_engine.compile(r"^Reanchoring\s+:\s+(?P<value>\S+)$")
         # Classmap name for Reanchoring
-        p_reanchor_classmap = re.compile(r"^Classmap\s+name\s+for\s+Reanchoring$")
+        p_reanchor_classmap = regex_engine.compile(r"^Classmap\s+name\s+for\s+Reanchoring$")
         # Reanchoring Classmap Name         : Not Configured
-        p_reanchor_classmap_name = re.compile(r"^Reanchoring\s+Classmap\s+Name\s+:\s+(?P<name>.*)$")
+        p_reanchor_classmap_name = regex_engine.compile(r"^Reanchoring\s+Classmap\s+Name\s+:\s+(?P<name>.*)$")
         # QOS per SSID
-        p_qos_ssid = re.compile(r"^QOS\s+per\s+SSID$")
+        p_qos_ssid = regex_engine.compile(r"^QOS\s+per\s+SSID$")
         # Ingress Service Name              : platinum-up
-        p_ingress_service_name = re.compile(r"^Ingress\s+Service\s+Name\s+:\s+(?P<name>.*)$")
+        p_ingress_service_name = regex_engine.compile(r"^Ingress\s+Service\s+Name\s+:\s+(?P<name>.*)$")
         # Egress Service Name               : platinum
-        p_egress_service_name = re.compile(r"^Egress\s+Service\s+Name\s+:\s+(?P<name>.*)$")
+        p_egress_service_name = regex_engine.compile(r"^Egress\s+Service\s+Name\s+:\s+(?P<name>.*)$")
         # QOS per Client
-        p_qos = re.compile(r"^QOS\s+per\s+Client$")
+        p_qos = regex_engine.compile(r"^QOS\s+per\s+Client$")
         # Ingress Service Name              : Not Configured
-        p_ingress_service_name = re.compile(r"^Ingress\s+Service\s+Name\s+:\s+(?P<name>.*)$")
+        p_ingress_service_name = regex_engine.compile(r"^Ingress\s+Service\s+Name\s+:\s+(?P<name>.*)$")
         # Egress Service Name               : Not Configured
-        p_egress_service_name = re.compile(r"^Egress\s+Service\s+Name\s+:\s+(?P<name>.*)$")
+        p_egress_service_name = regex_engine.compile(r"^Egress\s+Service\s+Name\s+:\s+(?P<name>.*)$")
         # Umbrella information
-        p_umbrella = re.compile(r"^Umbrella\s+information$")
+        p_umbrella = regex_engine.compile(r"^Umbrella\s+information$")
         # Cisco Umbrella Parameter Map      : Not Configured
-        p_umbrella_parameter = re.compile(r"^Cisco\s+Umbrella\s+Parameter\s+Map\s+:\s+(?P<value>.*)$")
+        p_umbrella_parameter = regex_engine.compile(r"^Cisco\s+Umbrella\s+Parameter\s+Map\s+:\s+(?P<value>.*)$")
         # DHCP DNS Option                   : ENABLED
-        p_umbrella_dhcp = re.compile(r"^DHCP\s+DNS\s+Option\s+:\s+(?P<value>.*)$")
+        p_umbrella_dhcp = regex_engine.compile(r"^DHCP\s+DNS\s+Option\s+:\s+(?P<value>.*)$")
         # Mode                              : ignore
-        p_umbrella_mode = re.compile(r"^Mode\s+:\s+(?P<value>.*)$")
+        p_umbrella_mode = regex_engine.compile(r"^Mode\s+:\s+(?P<value>.*)$")
         # Autoqos Mode                        : Voice
-        p_autoqos = re.compile(r"^Autoqos\s+Mode\s+:\s+(?P<value>.*)$")
+        p_autoqos = regex_engine.compile(r"^Autoqos\s+Mode\s+:\s+(?P<value>.*)$")
         # Call Snooping                       : Disabled
-        p_call_snooping = re.compile(r"^Call\s+Snooping\s+:\s+(?P<value>.*)$")
+        p_call_snooping = regex_engine.compile(r"^Call\s+Snooping\s+:\s+(?P<value>.*)$")
         # Tunnel Profile
-        p_tunnel_profile = re.compile(r"^Tunnel\s+Profile$")
+        p_tunnel_profile = regex_engine.compile(r"^Tunnel\s+Profile$")
         # Profile Name                      : Not Configured
-        p_profile_name = re.compile(r"^Profile\s+Name\s+:\s+(?P<name>.*)$")
+        p_profile_name = regex_engine.compile(r"^Profile\s+Name\s+:\s+(?P<name>.*)$")
         # Calendar Profile
-        p_calendar_profile = re.compile(r"^Calendar\s+Profile$")
+        p_calendar_profile = regex_engine.compile(r"^Calendar\s+Profile$")
         # Fabric Profile
-        p_fabric_profile = re.compile(r"^Fabric\s+Profile$")
+        p_fabric_profile = regex_engine.compile(r"^Fabric\s+Profile$")
         # Accounting list
-        p_accounting = re.compile(r"^Accounting\s+list$")
+        p_accounting = regex_engine.compile(r"^Accounting\s+list$")
         # Accounting List                   : Not Configured
-        p_accounting_list = re.compile(r"^Accounting\s+List\s+:\s+(?P<value>.*)$")
+        p_accounting_list = regex_engine.compile(r"^Accounting\s+List\s+:\s+(?P<value>.*)$")
         # DHCP
-        p_dhcp = re.compile(r"^DHCP$")
+        p_dhcp = regex_engine.compile(r"^DHCP$")
         # required                          : DISABLED
-        p_dhcp_required = re.compile(r"^required\s+:\s+(?P<value>\S+)$")
+        p_dhcp_required = regex_engine.compile(r"^required\s+:\s+(?P<value>\S+)$")
         # server address                    : 0.0.0.0
-        p_dhcp_server_address = re.compile(r"^server\s+address\s+:\s+(?P<value>\S+)$")
+        p_dhcp_server_address = regex_engine.compile(r"^server\s+address\s+:\s+(?P<value>\S+)$")
         # Opt82
-        p_dhcp_opt82 = re.compile(r"^Opt82$")
+        p_dhcp_opt82 = regex_engine.compile(r"^Opt82$")
         # DhcpOpt82Enable                   : DISABLED
-        p_dhcp_opt82_on = re.compile(r"^DhcpOpt82Enable\s+:\s+(?P<value>\S+)$")
+        p_dhcp_opt82_on = regex_engine.compile(r"^DhcpOpt82Enable\s+:\s+(?P<value>\S+)$")
         # DhcpOpt82Ascii                    : DISABLED
-        p_dhcp_opt82_ascii = re.compile(r"^DhcpOpt82Ascii\s+:\s+(?P<value>\S+)$")
+        p_dhcp_opt82_ascii = regex_engine.compile(r"^DhcpOpt82Ascii\s+:\s+(?P<value>\S+)$")
         # DhcpOpt82Rid                      : DISABLED
-        p_dhcp_opt82_rid = re.compile(r"^DhcpOpt82Rid\s+:\s+(?P<value>\S+)$")
+        p_dhcp_opt82_rid = regex_engine.compile(r"^DhcpOpt82Rid\s+:\s+(?P<value>\S+)$")
         # APMAC                             : DISABLED
-        p_dhcp_opt82_apmac = re.compile(r"^APMAC\s+:\s+(?P<value>\S+)$")
+        p_dhcp_opt82_apmac = regex_engine.compile(r"^APMAC\s+:\s+(?P<value>\S+)$")
         # SSID                              : DISABLED
-        p_dhcp_opt82_ssid = re.compile(r"^SSID\s+:\s+(?P<value>\S+)$")
+        p_dhcp_opt82_ssid = regex_engine.compile(r"^SSID\s+:\s+(?P<value>\S+)$")
         # AP_ETHMAC                         : DISABLED
-        p_dhcp_opt82_ethmac = re.compile(r"^AP_ETHMAC\s+:\s+(?P<value>\S+)$")
+        p_dhcp_opt82_ethmac = regex_engine.compile(r"^AP_ETHMAC\s+:\s+(?P<value>\S+)$")
         # APNAME                            : DISABLED
-        p_dhcp_opt82_apname = re.compile(r"^APNAME\s+:\s+(?P<value>\S+)$")
+        p_dhcp_opt82_apname = regex_engine.compile(r"^APNAME\s+:\s+(?P<value>\S+)$")
         # POLICY TAG                        : DISABLED
-        p_dhcp_opt82_policy_tag = re.compile(r"^POLICY\s+TAG\s+:\s+(?P<value>\S+)$")
+        p_dhcp_opt82_policy_tag = regex_engine.compile(r"^POLICY\s+TAG\s+:\s+(?P<value>\S+)$")
         # AP_LOCATION                       : DISABLED
-        p_dhcp_opt82_ap_loc = re.compile(r"^AP_LOCATION\s+:\s+(?P<value>\S+)$")
+        p_dhcp_opt82_ap_loc = regex_engine.compile(r"^AP_LOCATION\s+:\s+(?P<value>\S+)$")
         # VLAN_ID                           : DISABLED
-        p_dhcp_opt82_vid = re.compile(r"^VLAN_ID\s+:\s+(?P<value>\S+)$")
+        p_dhcp_opt82_vid = regex_engine.compile(r"^VLAN_ID\s+:\s+(?P<value>\S+)$")
         # Exclusionlist Params
-        p_exclusion_params = re.compile(r"^Exclusionlist\s+Params$")
+        p_exclusion_params = regex_engine.compile(r"^Exclusionlist\s+Params$")
         # Exclusionlist                     : ENABLED
-        p_exclusionlist = re.compile(r"^Exclusionlist\s+:\s+(?P<value>\S+)")
+        p_exclusionlist = regex_engine.compile(r"^Exclusionlist\s+:\s+(?P<value>\S+)")
         # Exclusion Timeout                 : 60
-        p_exclusion_timeout = re.compile(r"Exclusion\s+Timeout\s+:\s+(?P<value>\d+)$")
+        p_exclusion_timeout = regex_engine.compile(r"Exclusion\s+Timeout\s+:\s+(?P<value>\d+)$")
         # AAA Policy Params
-        p_aaa_policy = re.compile(r"^AAA\s+Policy\s+Params$")
+        p_aaa_policy = regex_engine.compile(r"^AAA\s+Policy\s+Params$")
         # AAA Override                      : DISABLED
-        p_aaa_override = re.compile(r"^AAA\s+Override\s+:\s+(?P<value>\S+)$")
+        p_aaa_override = regex_engine.compile(r"^AAA\s+Override\s+:\s+(?P<value>\S+)$")
         # NAC                               : DISABLED
-        p_aaa_nac = re.compile(r"^NAC\s+:\s+(?P<value>\S+)$")
+        p_aaa_nac = regex_engine.compile(r"^NAC\s+:\s+(?P<value>\S+)$")
         # AAA Policy name                   : default-aaa-policy
-        p_aaa_policy_name = re.compile(r"^AAA\s+Policy\s+name\s+:\s+(?P<name>\S+)$")
+        p_aaa_policy_name = regex_engine.compile(r"^AAA\s+Policy\s+name\s+:\s+(?P<name>\S+)$")
         # WGB Policy Params
-        p_wgb_policy = re.compile(r"^WGB\s+Policy\s+Params$")
+        p_wgb_policy = regex_engine.compile(r"^WGB\s+Policy\s+Params$")
         # Broadcast Tagging                 : DISABLED
-        p_wgb_broadcast = re.compile(r"^Broadcast\s+Tagging\s+:\s+(?P<value>\S+)$")
+        p_wgb_broadcast = regex_engine.compile(r"^Broadcast\s+Tagging\s+:\s+(?P<value>\S+)$")
         # Client VLAN                       : DISABLED
-        p_wgb_client_vlan = re.compile(r"^client\s+VLAN\s+:\s+(?P<value>\S+)$")
+        p_wgb_client_vlan = regex_engine.compile(r"^client\s+VLAN\s+:\s+(?P<value>\S+)$")
         # Hotspot 2.0 Server name             : Not Configured
-        p_hotspot_name = re.compile(r"^Hotspot\s+2.0\s+Server\s+name\s+:\s+(?P<name>.*)$")
+        p_hotspot_name = regex_engine.compile(r"^Hotspot\s+2.0\s+Server\s+name\s+:\s+(?P<name>.*)$")
         # Mobility Anchor List
-        p_mobility = re.compile(r"^Mobility\s+Anchor\s+List$")
+        p_mobility = regex_engine.compile(r"^Mobility\s+Anchor\s+List$")
         # IP Address                                  Priority
-        p_mobility_header = re.compile(r"^IP\s+Address\s+Priority$")
+        p_mobility_header = regex_engine.compile(r"^IP\s+Address\s+Priority$")
         # -------------------------------------------------------
-        p_mobility_delimeter = re.compile(r"^-+$")
+        p_mobility_delimeter = regex_engine.compile(r"^-+$")
         # 10.10.10.10                                     1
-        p_mobility_clients = re.compile(r"^(?P<ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+(?P<priority>\S+)$")
+        p_mobility_clients = regex_engine.compile(r"^(?P<ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+(?P<priority>\S+)$")
         # mDNS Gateway
-        p_mdns = re.compile(r"^mDNS\s+Gateway$")
+        p_mdns = regex_engine.compile(r"^mDNS\s+Gateway$")
         # mDNS Service Policy name          : default-mdns-service-policy
-        p_mdns_policy_name = re.compile(r"^mDNS\s+Service\s+Policy\s+name\s+:\s+(?P<value>.*)$")
+        p_mdns_policy_name = regex_engine.compile(r"^mDNS\s+Service\s+Policy\s+name\s+:\s+(?P<value>.*)$")
         # User Defined (Private) Network              : Disabled
-        p_user_private = re.compile(r"^User\s+Defined\s+\(Private\)\s+Network\s+:\s+(?P<value>\S+)$")
+        p_user_private = regex_engine.compile(r"^User\s+Defined\s+\(Private\)\s+Network\s+:\s+(?P<value>\S+)$")
         # User Defined (Private) Network Unicast Drop  : Disabled
-        p_user_private_unicast = re.compile(r"^User\s+Defined\s+\(Private\)\s+Network\s+Unicast\s+Drop\s+:\s+(?P<value>\S+)$")
+        p_user_private_unicast = regex_engine.compile(r"^User\s+Defined\s+\(Private\)\s+Network\s+Unicast\s+Drop\s+:\s+(?P<value>\S+)$")
         # Policy Proxy Settings
-        p_policy_proxy = re.compile(r"^Policy\s+Proxy\s+Settings$")
+        p_policy_proxy = regex_engine.compile(r"^Policy\s+Proxy\s+Settings$")
         # ARP Proxy State                   : DISABLED
-        p_policy_proxy_arp = re.compile(r"^ARP\s+Proxy\s+State\s+:\s+(?P<value>\S+)$")
+        p_policy_proxy_arp = regex_engine.compile(r"^ARP\s+Proxy\s+State\s+:\s+(?P<value>\S+)$")
         # IPv6 Proxy State                  : None
-        p_policy_ipv6_proxy_arp = re.compile(r"^IPv6\s+Proxy\s+State\s+:\s+(?P<value>\S+)$")
+        p_policy_ipv6_proxy_arp = regex_engine.compile(r"^IPv6\s+Proxy\s+State\s+:\s+(?P<value>\S+)$")
         # Airtime-fairness Profile
-        p_airtime = re.compile(r"^Airtime-fairness\s+Profile$")
+        p_airtime = regex_engine.compile(r"^Airtime-fairness\s+Profile$")
         # 2.4Ghz ATF Policy                 : default-atf-policy
-        p_airtime_24 = re.compile(r"^2.4Ghz\s+ATF\s+Policy\s+:\s+(?P<value>.*)$")
+        p_airtime_24 = regex_engine.compile(r"^2.4Ghz\s+ATF\s+Policy\s+:\s+(?P<value>.*)$")
         # 5Ghz ATF Policy                   : default-atf-policy
-        p_airtime_5 = re.compile(r"^5Ghz\s+ATF\s+Policy\s+:\s+(?P<value>.*)$")
+        p_airtime_5 = regex_engine.compile(r"^5Ghz\s+ATF\s+Policy\s+:\s+(?P<value>.*)$")
 
         show_wireless_profile_policy_dict = {}
         checkline_flows = ""
@@ -1098,25 +1101,25 @@ class ShowWirelessCtsSummary(ShowWirelessCtsSummarySchema):
         # default-flex-profile              DISABLED              DISABLED
 
         # Local Mode CTS Configuration
-        p_local = re.compile(r"Local\s+Mode\s+CTS\s+Configuration$")
+        p_local = regex_engine.compile(r"Local\s+Mode\s+CTS\s+Configuration$")
 
         # Policy Profile Name               SGACL Enforcement     Inline-Tagging   Default-Sgt
-        p_local_header = re.compile(r"^Policy\s+Profile\s+Name\s+SGACL\s+Enforcement\s+Inline-Tagging\s+Default-Sgt$")
+        p_local_header = regex_engine.compile(r"^Policy\s+Profile\s+Name\s+SGACL\s+Enforcement\s+Inline-Tagging\s+Default-Sgt$")
 
         # ----------------------------------------------------------------------------------------
-        p_hyphen_delimiter = re.compile(r"^-+$")
+        p_hyphen_delimiter = regex_engine.compile(r"^-+$")
 
         # wip-b60                        DISABLED              DISABLED         0
-        p_local_policy = re.compile(r"^(?P<name>\S+)\s+(?P<sgacl>\S+)\s+(?P<tag>\S+)\s+(?P<sgt>\d+)$")
+        p_local_policy = regex_engine.compile(r"^(?P<name>\S+)\s+(?P<sgacl>\S+)\s+(?P<tag>\S+)\s+(?P<sgt>\d+)$")
 
         # Flex Mode CTS Configuration
-        p_flex = re.compile(r"^Flex\s+Mode\s+CTS\s+Configuration$")
+        p_flex = regex_engine.compile(r"^Flex\s+Mode\s+CTS\s+Configuration$")
 
         # Flex Profile Name                 SGACL Enforcement     Inline-Tagging
-        p_flex_header = re.compile(r"^Flex\s+Profile\s+Name\s+SGACL\s+Enforcement\s+Inline-Tagging$")
+        p_flex_header = regex_engine.compile(r"^Flex\s+Profile\s+Name\s+SGACL\s+Enforcement\s+Inline-Tagging$")
 
         # default-flex-profile              DISABLED              DISABLED
-        p_flex_policy = re.compile(r"(?P<name>\S+)\s+(?P<sgacl>\S+)\s+(?P<tag>\S+)$")
+        p_flex_policy = regex_engine.compile(r"(?P<name>\S+)\s+(?P<sgacl>\S+)\s+(?P<tag>\S+)$")
 
 
         wireless_cts_summary_dict = {}
@@ -1225,14 +1228,14 @@ class ShowWirelessFabricClientSummary(ShowWirelessFabricClientSummarySchema):
         # 58bf.eaff.fc60 a2-12-cap17                   19   Webauth Pending    11ac     MAB
 
         # Number of Fabric Clients : 8
-        p_clients = re.compile(r"^Number\s+of\s+Fabric\s+Clients\s+:\s+(?P<clients>\S+)$")
+        p_clients = regex_engine.compile(r"^Number\s+of\s+Fabric\s+Clients\s+:\s+(?P<clients>\S+)$")
 
         # 58bf.eaff.89a2 a2-11-cap43                   17   Run                11ac     Dot1x
-        p_client_info = re.compile(r"^(?P<mac>\S{4}\.\S{4}\.\S{4})\s+(?P<name>\S+)\s+(?P<wlan>\S+)\s+(?P<state>.*)\s+(?P<protocol>\S+)\s+(?P<method>(Dot1x|MAB|None|SAE))$")
+        p_client_info = regex_engine.compile(r"^(?P<mac>\S{4}\.\S{4}\.\S{4})\s+(?P<name>\S+)\s+(?P<wlan>\S+)\s+(?P<state>.*)\s+(?P<protocol>\S+)\s+(?P<method>(Dot1x|MAB|None|SAE))$")
 
         # MAC Address    AP Name                  Type ID   State              Protocol Method     L2 VNID    RLOC IP
         # dca6.3249.1877 AP-E6-25C0               WLAN 18   Run                11n(2.4) Dot1x      8189       10.240.240.3
-        p_client_info_n = re.compile(r"^(?P<mac>\S{4}\.\S{4}\.\S{4})\s+(?P<name>\S+)\s+(?P<wtype>\w+)\s+(?P<wlan>\d+)\s+(?P<state>(\w+\s*\w+))\s+(?P<protocol>\S+)\s+(?P<method>(Dot1x|MAB|None|SAE))\s+(?P<l2_vnid>\d+)\s+(?P<rloc_ip>((\d{1,3}\.){3}\d{1,3}))$")
+        p_client_info_n = regex_engine.compile(r"^(?P<mac>\S{4}\.\S{4}\.\S{4})\s+(?P<name>\S+)\s+(?P<wtype>\w+)\s+(?P<wlan>\d+)\s+(?P<state>(\w+\s*\w+))\s+(?P<protocol>\S+)\s+(?P<method>(Dot1x|MAB|None|SAE))\s+(?P<l2_vnid>\d+)\s+(?P<rloc_ip>((\d{1,3}\.){3}\d{1,3}))$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1395,34 +1398,34 @@ class ShowWirelessFabricSummary(ShowWirelessFabricSummarySchema):
 
 
         # Fabric Status      : Enabled
-        p_status = re.compile(r"^Fabric\s+Status\s+:\s+(?P<status>(Enabled|Disabled))$")
+        p_status = regex_engine.compile(r"^Fabric\s+Status\s+:\s+(?P<status>(Enabled|Disabled))$")
 
         # Control-plane:
-        p_control = re.compile(r"^Control-plane:$")
+        p_control = regex_engine.compile(r"^Control-plane:$")
 
         # Name                             IP-address        Key                              Status
-        p_header_1 = re.compile(r"^Name\s+IP-address\s+Key\s+Status$")
+        p_header_1 = regex_engine.compile(r"^Name\s+IP-address\s+Key\s+Status$")
 
         # --------------------------------------------------------------------------------------------
-        p_delimiter_1 = re.compile(r"^--------------------------------------------------------------------------------------------$")
+        p_delimiter_1 = regex_engine.compile(r"^--------------------------------------------------------------------------------------------$")
 
         # default-control-plane            10.10.90.11       fa85ff                           Up
-        p_cp_client = re.compile(r"^(?P<cp_name>\S+)\s+(?P<cp_ip_address>\S+)\s+(?P<cp_key>\S+)\s+(?P<cp_status>\S+)$")
+        p_cp_client = regex_engine.compile(r"^(?P<cp_name>\S+)\s+(?P<cp_ip_address>\S+)\s+(?P<cp_key>\S+)\s+(?P<cp_status>\S+)$")
 
         # Fabric VNID Mapping:
-        p_vnid = re.compile(r"^Fabric\s+VNID\s+Mapping:$")
+        p_vnid = regex_engine.compile(r"^Fabric\s+VNID\s+Mapping:$")
 
         # Name               L2-VNID        L3-VNID        IP Address             Subnet        Control plane name
-        p_header_2 = re.compile(r"^Name\s+L2-VNID\s+L3-VNID\s+IP\s+Address\s+Subnet\s+Control\s+plane\s+name$")
+        p_header_2 = regex_engine.compile(r"^Name\s+L2-VNID\s+L3-VNID\s+IP\s+Address\s+Subnet\s+Control\s+plane\s+name$")
 
         # ----------------------------------------------------------------------------------------------------------------------
-        p_delimiter_2 = re.compile(r"^----------------------------------------------------------------------------------------------------------------------$")
+        p_delimiter_2 = regex_engine.compile(r"^----------------------------------------------------------------------------------------------------------------------$")
 
         # Data                8192           0                                  0.0.0.0            default-control-plane
-        p_vnid_mappings = re.compile(r"^(?P<vnid_name>\S+)\s+(?P<vnid_l2>\d+)\s+(?P<vnid_l3>\d+)\s+(?P<vnid_ip_address>\S+)\s+(?P<vnid_subnet>\S+)\s+(?P<vnid_cp_name>\S+)$")
+        p_vnid_mappings = regex_engine.compile(r"^(?P<vnid_name>\S+)\s+(?P<vnid_l2>\d+)\s+(?P<vnid_l3>\d+)\s+(?P<vnid_ip_address>\S+)\s+(?P<vnid_subnet>\S+)\s+(?P<vnid_cp_name>\S+)$")
 
         # Voice               8191           0                                  0.0.0.0            default-control-plane
-        p_vnid_mappings_no_ip = re.compile(r"^(?P<vnid_name>\S+)\s+(?P<vnid_l2>\d+)\s+(?P<vnid_l3>\d+)\s+(?P<vnid_subnet>\S+)\s+(?P<vnid_cp_name>\S+)$")
+        p_vnid_mappings_no_ip = regex_engine.compile(r"^(?P<vnid_name>\S+)\s+(?P<vnid_l2>\d+)\s+(?P<vnid_l3>\d+)\s+(?P<vnid_subnet>\S+)\s+(?P<vnid_cp_name>\S+)$")
 
 
         show_wireless_fabric_summary_dict = {}
@@ -1566,29 +1569,29 @@ class ShowWirelessClientSummary(ShowWirelessClientSummarySchema):
         # 58bf.eaff.7b79 b80-62-cap14                   WLAN 17   Excluded           11ac     Dot1x
 
         # Number of Clients: 13
-        wireless_client_count_capture = re.compile(r"^Number\s+of\s+Clients:\s+(?P<wireless_client_count>\d+)$")
+        wireless_client_count_capture = regex_engine.compile(r"^Number\s+of\s+Clients:\s+(?P<wireless_client_count>\d+)$")
         # MAC Address    AP Name                                        Type ID   State             Protocol Method     Role
-        wireless_client_info_header_capture = re.compile(
+        wireless_client_info_header_capture = regex_engine.compile(
             r"^MAC\s+Address\s+AP\s+Name\s+Type\s+ID\s+State\s+Protocol\s+Method\s+Role$")
         # -------------------------------------------------------------------------------------------------------------------------
-        delimiter_capture = re.compile(
+        delimiter_capture = regex_engine.compile(
             r"^-------------------------------------------------------------------------------------------------------------------------$")
         # 58bf.eaff.0cf1 b80-72-cap16                                 WLAN 17   Run               11ac     Dot1x      Local
         # 200d.b033.01fe Site6-FE2-9162                               WLAN 19   Run              11ac      None        Local
         # 0e4d.72bc.3014 Site6-FE2-9162                               WLAN 19   Run               11ax(5)  SAE        Local
-        wireless_client_info_capture = re.compile(
+        wireless_client_info_capture = regex_engine.compile(
             r"^(?P<mac_address>\S+)\s+(?P<ap_name>\S+)\s+(?P<type>\S+)\s+(?P<id>\d+)\s+(?P<state>.*)\s+(?P<protocol>\S+)\s+(?P<method>(Dot1x|MAB|SAE|None))\s+(?P<role>\S+)$")
         # Number of Excluded Clients: 2
-        wireless_excluded_client_count_capture = re.compile(
+        wireless_excluded_client_count_capture = regex_engine.compile(
             r"^Number\s+of\s+Excluded\s+Clients:\s+(?P<wireless_excluded_client_count>\d+)$")
         # MAC Address    AP Name                          Type ID   State              Protocol Method
-        exclude_client_header_capture = re.compile(
+        exclude_client_header_capture = regex_engine.compile(
             r"^MAC\s+Address\s+AP\s+Name\s+Type\s+ID\s+State\s+Protocol\s+Method$")
         # ------------------------------------------------------------------------------------------------
-        delimiter_2_capture = re.compile(
+        delimiter_2_capture = regex_engine.compile(
             r"^------------------------------------------------------------------------------------------------$")
         # 58bf.eaff.aa71 b80-61-cap20                   WLAN 17   Excluded           11ac     Dot1x
-        wireless_excluded_clients_info_capture = re.compile(
+        wireless_excluded_clients_info_capture = regex_engine.compile(
             r"^(?P<mac_address>\S+)\s+(?P<ap_name>\S+)\s+(?P<type>\S+)\s+(?P<id>\d+)\s+(?P<state>\S+)\s+(?P<protocol>\S+)\s+(?P<method>\S+)$")
 
         include_index = 0
@@ -1749,12 +1752,12 @@ class ShowWirelessMobilityApList(ShowWirelessMobilityApListSchema):
         # b80-52-cap6                     58bf.eaff.88f3    10.10.7.177      Self
 
         # AP name                           AP radio MAC      Controller IP     Learnt from
-        ap_header_capture = re.compile(
+        ap_header_capture = regex_engine.compile(
             r"^AP\s+name\s+AP\s+radio\s+MAC\s+Controller\s+IP\s+Learnt\s+from$"
         )
 
         # b80-72-cap30                    58bf.eaff.c7d3    10.10.7.177      Self
-        ap_info_capture = re.compile(
+        ap_info_capture = regex_engine.compile(
             r"^(?P<ap_name>\S+)\s+(?P<ap_radio_mac>\S{4}\.\S{4}\.\S{4})\s+(?P<controller_ip>\d+\.\d+\.\d+\.\d+)\s+(?P<learnt_from>\S+)$"
         )
 
@@ -1912,7 +1915,7 @@ class ShowWirelessMobilitySummary(ShowWirelessMobilitySummarySchema):
 
         for key, capture in zip(info_dict_keys, info_captures):
 
-            info_search = re.search(capture, output, re.MULTILINE)
+            info_search = regex_engine.search(capture, output, re.MULTILINE)
 
             if info_search:
                 info_group = info_search.groupdict()
@@ -1969,10 +1972,10 @@ class ShowWirelessProfilePolicySummary(ShowWirelessProfilePolicySummarySchema):
         # lizzard_b70_1                  Not required                            ENABLED
 
         # Number of Policy Profiles: 31
-        policy_count_capture = re.compile(r"^Number of Policy Profiles:\s+(?P<policy_count>\d+)$")
+        policy_count_capture = regex_engine.compile(r"^Number of Policy Profiles:\s+(?P<policy_count>\d+)$")
 
         # wip-b60                        b60-voice                             ENABLED
-        policy_info_capture = re.compile(
+        policy_info_capture = regex_engine.compile(
             # wip-b60
             r"^(?P<policy_name>\S+)\s+"
             # b60-voice
@@ -2066,10 +2069,10 @@ class ShowWirelessStatsApJoinSummary(ShowWirelessStatsApJoinSummarySchema):
         # 706d.05ff.7bde  706d.05ff.3717  visitors-mallorca                  10.10.7.234                              Not Joined  Join                  Ap auth pending
 
         # Number of APs: 61
-        ap_count_capture = re.compile(r"^Number of APs:\s+(?P<ap_count>\d+)$")
+        ap_count_capture = regex_engine.compile(r"^Number of APs:\s+(?P<ap_count>\d+)$")
 
         # 706d.05ff.0859  706d.05ff.9bb8  AP706d.05ff.9bb8                  10.10.116.22                             Not Joined  Join                  Ap auth pending
-        ap_join_capture = re.compile(
+        ap_join_capture = regex_engine.compile(
             # 706d.05ff.0859
             r"^(?P<base_mac>[a-f0-9]{4}\.[a-f0-9]{4}\.[a-f0-9]{4})\s+"
             # 706d.05ff.9bb8
@@ -2344,121 +2347,121 @@ class ShowWirelessClientMacDetail(ShowWirelessClientMacDetailSchema):
 
         # Client Mac Address : abcd:1234:dcba
         # Client IPv6 Addresses : fe80::1
-        p0 = re.compile(r'^Client (?P<address_type>\S+) (Address|Addresses) : (?P<address>[\S]+)$')
+        p0 = regex_engine.compile(r'^Client (?P<address_type>\S+) (Address|Addresses) : (?P<address>[\S]+)$')
 
         # Client MAC Type : Locally Administered Address
-        p1 = re.compile(r'^Client MAC Type : (?P<client_mac_type>[\S ]+)$')
+        p1 = regex_engine.compile(r'^Client MAC Type : (?P<client_mac_type>[\S ]+)$')
 
-        p2 = re.compile(r'^Client Username *: (?P<client_username>\S+)')
+        p2 = regex_engine.compile(r'^Client Username *: (?P<client_username>\S+)')
 
         # AP MAC Address : bead:4321:dead
-        p3 = re.compile(r'^AP MAC Address : (?P<ap_mac_address>\S+)$')
+        p3 = regex_engine.compile(r'^AP MAC Address : (?P<ap_mac_address>\S+)$')
 
         # AP Name: b1-11-cap9
-        p4 = re.compile(r'^AP Name: (?P<ap_name>\S+)$')
+        p4 = regex_engine.compile(r'^AP Name: (?P<ap_name>\S+)$')
 
         # AP slot : 0
-        p5 = re.compile(r'^AP slot : (?P<ap_slot>\d+)$')
+        p5 = regex_engine.compile(r'^AP slot : (?P<ap_slot>\d+)$')
 
         # Client State : Associated
-        p6 = re.compile(r'^Client State : (?P<client_state>\S+)$')
+        p6 = regex_engine.compile(r'^Client State : (?P<client_state>\S+)$')
 
         # Policy Profile : profile_1
-        p7 = re.compile(r'^Policy Profile : (?P<policy_profile>\S+)$')
+        p7 = regex_engine.compile(r'^Policy Profile : (?P<policy_profile>\S+)$')
 
         # Flex Profile : N/A
-        p8 = re.compile(r'^Flex Profile : (?P<flex_profile>\S+)$')
+        p8 = regex_engine.compile(r'^Flex Profile : (?P<flex_profile>\S+)$')
 
         # Wireless LAN Id: 20
-        p9 = re.compile(r'^Wireless LAN Id: (?P<wireless_lan_id>\d+)$')
+        p9 = regex_engine.compile(r'^Wireless LAN Id: (?P<wireless_lan_id>\d+)$')
 
         # WLAN Profile Name: lizzard-l_Global
-        p10 = re.compile(r'^WLAN Profile Name: (?P<wlan_profile_name>\S+)$')
+        p10 = regex_engine.compile(r'^WLAN Profile Name: (?P<wlan_profile_name>\S+)$')
 
         # Wireless LAN Network Name (SSID): lizzard-legacy
-        p11 = re.compile(r'^Wireless LAN Network Name \(SSID\): (?P<wireless_lan_network_name_ssid>\S+)$')
+        p11 = regex_engine.compile(r'^Wireless LAN Network Name \(SSID\): (?P<wireless_lan_network_name_ssid>\S+)$')
 
         # BSSID : 70b3.18ff.f478
-        p12 = re.compile(r'^BSSID : (?P<bssid>\S+)$')
+        p12 = regex_engine.compile(r'^BSSID : (?P<bssid>\S+)$')
 
         # Connected For : 3233 seconds
-        p13 = re.compile(r'^Connected For : (?P<connected_for_seconds>\d+) seconds$')
+        p13 = regex_engine.compile(r'^Connected For : (?P<connected_for_seconds>\d+) seconds$')
 
         # Protocol : 802.11n - 2.4 GHz
-        p14 = re.compile(r'^Protocol +: (?P<protocol>[\S ]+)$')
+        p14 = regex_engine.compile(r'^Protocol +: (?P<protocol>[\S ]+)$')
 
         # Protocol : 802.11n - 2.4 GHz
-        p14_1 = re.compile(r'^Device Protocol +: (?P<protocol>[\S ]+)$')
+        p14_1 = regex_engine.compile(r'^Device Protocol +: (?P<protocol>[\S ]+)$')
 
         # Channel : 6
-        p15 = re.compile(r'^Channel : (?P<channel>\d+)$')
+        p15 = regex_engine.compile(r'^Channel : (?P<channel>\d+)$')
 
         # Client IIF-ID : 0xa0000001
-        p16 = re.compile(r'^Client IIF-ID : (?P<client_iif_id>\S+)$')
+        p16 = regex_engine.compile(r'^Client IIF-ID : (?P<client_iif_id>\S+)$')
 
         # Association Id : 1
-        p17 = re.compile(r'^Association Id : (?P<association_id>\d+)$')
+        p17 = regex_engine.compile(r'^Association Id : (?P<association_id>\d+)$')
 
         # Authentication Algorithm : Open System
-        p18 = re.compile(r'^Authentication Algorithm : (?P<authentication_alogrithm>[\S ]+)$')
+        p18 = regex_engine.compile(r'^Authentication Algorithm : (?P<authentication_alogrithm>[\S ]+)$')
 
         # Idle state timeout : N/A
-        p19 = re.compile(r'^Idle state timeout : (?P<idle_state_timeout>\S+)$')
+        p19 = regex_engine.compile(r'^Idle state timeout : (?P<idle_state_timeout>\S+)$')
 
         # Re-Authentication Timeout : 36000 sec (Remaining time: 32768 sec)
-        p20 = re.compile(r'^Re-Authentication Timeout : (?P<configured>\d+) sec '
-                         r'\(Remaining time: (?P<remaining_time>\d+) sec\)$')
+        p20 = regex_engine.compile(r'^Re-Authentication Timeout : (?P<configured>\d+) sec '
+                                   r'\(Remaining time: (?P<remaining_time>\d+) sec\)$')
 
         # Session Warning Time : Timer not running
-        p21 = re.compile(r'^Session Warning Time : (?P<session_warning_time>[\S ]+)$')
+        p21 = regex_engine.compile(r'^Session Warning Time : (?P<session_warning_time>[\S ]+)$')
 
         # Session Timeout : 1800 sec (Timer not running)
-        p21_1 = re.compile(r'^Session Timeout : (?P<session_timeout>[\S ]+)$')
+        p21_1 = regex_engine.compile(r'^Session Timeout : (?P<session_timeout>[\S ]+)$')
 
         # Input Policy Name  : client-default
-        p22 = re.compile(r'^Input Policy Name +: (?P<input_policy_name>\S+)$')
+        p22 = regex_engine.compile(r'^Input Policy Name +: (?P<input_policy_name>\S+)$')
 
         # Input Policy State : Installed
-        p23 = re.compile(r'^Input Policy State : (?P<input_policy_state>\S+)$')
+        p23 = regex_engine.compile(r'^Input Policy State : (?P<input_policy_state>\S+)$')
 
         # Input Policy Source : QOS Internal Policy
-        p24 = re.compile(r'^Input Policy Source : (?P<input_policy_source>[\S ]+)$')
+        p24 = regex_engine.compile(r'^Input Policy Source : (?P<input_policy_source>[\S ]+)$')
 
         # Output Policy Name  : client-default
-        p25 = re.compile(r'^Output Policy Name +: (?P<output_policy_name>\S+)$')
+        p25 = regex_engine.compile(r'^Output Policy Name +: (?P<output_policy_name>\S+)$')
 
         # Output Policy State : Installed
-        p26 = re.compile(r'^Output Policy State : (?P<output_policy_state>\S+)$')
+        p26 = regex_engine.compile(r'^Output Policy State : (?P<output_policy_state>\S+)$')
 
         # Output Policy Source : QOS Internal Policy
-        p27 = re.compile(r'^Output Policy Source : (?P<output_policy_source>[\S ]+)$')
+        p27 = regex_engine.compile(r'^Output Policy Source : (?P<output_policy_source>[\S ]+)$')
 
         # WMM Support : Enabled
-        p28 = re.compile(r'^WMM Support : (?P<wmm_support>\S+)$')
+        p28 = regex_engine.compile(r'^WMM Support : (?P<wmm_support>\S+)$')
 
         # U-APSD Support : Enabled
-        p29 = re.compile(r'^U-APSD Support : (?P<status>\S+)$')
+        p29 = regex_engine.compile(r'^U-APSD Support : (?P<status>\S+)$')
 
         #   U-APSD value : 0
-        p29_1 = re.compile(r'^U-APSD value : (?P<u_apsd_value>\d+)$')
+        p29_1 = regex_engine.compile(r'^U-APSD value : (?P<u_apsd_value>\d+)$')
 
         #   APSD ACs    : BK, BE, VI, VO
-        p29_2 = re.compile(r'^APSD ACs +: (?P<apsd_acs>[\S ]+)$')
+        p29_2 = regex_engine.compile(r'^APSD ACs +: (?P<apsd_acs>[\S ]+)$')
 
         # Fastlane Support : Disabled
-        p30 = re.compile(r'^Fastlane Support : (?P<fastlane_support>\S+)$')
+        p30 = regex_engine.compile(r'^Fastlane Support : (?P<fastlane_support>\S+)$')
 
         # Client Active State : In-Active
-        p31 = re.compile(r'^Client Active State : (?P<client_active_state>\S+)$')
+        p31 = regex_engine.compile(r'^Client Active State : (?P<client_active_state>\S+)$')
 
         # Power Save : ON
-        p32 = re.compile(r'^Power Save : (?P<power_save>\S+)$')
+        p32 = regex_engine.compile(r'^Power Save : (?P<power_save>\S+)$')
 
         # Current Rate : 6.0
-        p33 = re.compile(r'^Current Rate : (?P<current_rate>[\S ]+)$')
+        p33 = regex_engine.compile(r'^Current Rate : (?P<current_rate>[\S ]+)$')
 
         # Supported Rates : 24.0,36.0,48.0,54.0
-        p34 = re.compile(r'^Supported Rates : (?P<supported_rates>\S+)$')
+        p34 = regex_engine.compile(r'^Supported Rates : (?P<supported_rates>\S+)$')
 
         # AAA QoS Rate Limit Parameters:
         #   QoS Average Data Rate Upstream             : 0 (kbps)
@@ -2469,185 +2472,185 @@ class ShowWirelessClientMacDetail(ShowWirelessClientMacDetailSchema):
         #   QoS Realtime Average Data Rate Downstream  : 0 (kbps)
         #   QoS Burst Data Rate Downstream             : 0 (kbps)
         #   QoS Realtime Burst Data Rate Downstream    : 0 (kbps)
-        p35 = re.compile(r'^QoS (?P<type>(Average|Realtime Average|Burst|Realtime Burst)) Data Rate '
-                         r'(?P<direction>(Upstream|Downstream)) +: (?P<rate>\d+) \(kbps\)$')
+        p35 = regex_engine.compile(r'^QoS (?P<type>(Average|Realtime Average|Burst|Realtime Burst)) Data Rate '
+                                   r'(?P<direction>(Upstream|Downstream)) +: (?P<rate>\d+) \(kbps\)$')
 
         # Mobility:
         #   Move Count                  : 0
         #   Mobility Role               : Local
         #   Mobility Roam Type          : None
         #   Mobility Complete Timestamp : 10/22/2020 08:07:55 IST
-        p36 = re.compile(r'^Move Count +: (?P<move_count>\d+)$')
-        p36_1 = re.compile(r'^Mobility (?P<type>Role|Roam Type|Complete Timestamp) +: (?P<value>\S+$|[\S ]+$)')
+        p36 = regex_engine.compile(r'^Move Count +: (?P<move_count>\d+)$')
+        p36_1 = regex_engine.compile(r'^Mobility (?P<type>Role|Roam Type|Complete Timestamp) +: (?P<value>\S+$|[\S ]+$)')
 
         # Client Join Time:
         #   Join Time Of Client : 10/22/2020 08:46:54 IST
-        p37 = re.compile(r'^Join Time Of Client : (?P<client_join_time>[\S ]+)$')
+        p37 = regex_engine.compile(r'^Join Time Of Client : (?P<client_join_time>[\S ]+)$')
 
         # Client State Servers : None
-        p38 = re.compile(r'^Client State Servers : (?P<client_state_servers>\S+)$')
+        p38 = regex_engine.compile(r'^Client State Servers : (?P<client_state_servers>\S+)$')
 
         # Client ACLs : None
-        p39 = re.compile(r'^Client ACLs : (?P<client_acls>\S+)$')
+        p39 = regex_engine.compile(r'^Client ACLs : (?P<client_acls>\S+)$')
 
         # Policy Manager State: Webauth Pending
-        p40 = re.compile(r'^Policy Manager State: (?P<policy_manager_state>[\S ]+)$')
+        p40 = regex_engine.compile(r'^Policy Manager State: (?P<policy_manager_state>[\S ]+)$')
 
         # Last Policy Manager State : IP Learn Complete
-        p41 = re.compile(r'^Last Policy Manager State : (?P<last_policy_manager_state>[\S ]+)$')
+        p41 = regex_engine.compile(r'^Last Policy Manager State : (?P<last_policy_manager_state>[\S ]+)$')
 
         # Client Entry Create Time : 5572 seconds
-        p42 = re.compile(r'^Client Entry Create Time : (?P<client_entry_create_time_secs>\d+) seconds$')
+        p42 = regex_engine.compile(r'^Client Entry Create Time : (?P<client_entry_create_time_secs>\d+) seconds$')
 
         # Policy Type : WPA2
-        p43 = re.compile(r'^Policy Type : (?P<policy_type>\S+)$')
+        p43 = regex_engine.compile(r'^Policy Type : (?P<policy_type>\S+)$')
 
         # Encryption Cipher : CCMP (AES)
-        p44 = re.compile(r'^Encryption Cipher : (?P<encryption_cipher>[\S ]+)$')
+        p44 = regex_engine.compile(r'^Encryption Cipher : (?P<encryption_cipher>[\S ]+)$')
 
         # Authentication Key Management : 802.1x
-        p45 = re.compile(r'^Authentication Key Management : (?P<authentication_key_management>\S+)$')
+        p45 = regex_engine.compile(r'^Authentication Key Management : (?P<authentication_key_management>\S+)$')
 
         # User Defined (Private) Network : Disabled
-        p46 = re.compile(r'^User Defined \(Private\) Network : (?P<user_defined_private_network>\S+)$')
+        p46 = regex_engine.compile(r'^User Defined \(Private\) Network : (?P<user_defined_private_network>\S+)$')
 
         # User Defined (Private) Network Drop Unicast : Disabled
-        p46_1 = re.compile(r'^User Defined \(Private\) Network Drop Unicast : '
-                           r'(?P<user_defined_private_network_drop_unicast>\S+)$')
+        p46_1 = regex_engine.compile(r'^User Defined \(Private\) Network Drop Unicast : '
+                                     r'(?P<user_defined_private_network_drop_unicast>\S+)$')
 
         # Encrypted Traffic Analytics : No
-        p47 = re.compile(r'^Encrypted Traffic Analytics : (?P<encrypted_traffic_analytics>\S+)$')
+        p47 = regex_engine.compile(r'^Encrypted Traffic Analytics : (?P<encrypted_traffic_analytics>\S+)$')
 
         # Protected Management Frame - 802.11w : No
-        p48 = re.compile(r'^Protected Management Frame - 802.11w : (?P<protected_management_frame>\S+)')
+        p48 = regex_engine.compile(r'^Protected Management Frame - 802.11w : (?P<protected_management_frame>\S+)')
 
         # EAP Type : PEAP
-        p49 = re.compile(r'^EAP Type : (?P<eap_type>[\S ]+)$')
+        p49 = regex_engine.compile(r'^EAP Type : (?P<eap_type>[\S ]+)$')
 
         # VLAN Override after Webauth : No
-        p50 = re.compile(r'^VLAN Override after Webauth : (?P<vlan_override_after_webauth>\S+)$')
+        p50 = regex_engine.compile(r'^VLAN Override after Webauth : (?P<vlan_override_after_webauth>\S+)$')
 
         # VLAN : b1-vg-data
-        p51 = re.compile(r'^VLAN +: (?P<vlan>\S+)$')
+        p51 = regex_engine.compile(r'^VLAN +: (?P<vlan>\S+)$')
 
         # Multicast VLAN : 0
-        p52 = re.compile(r'^Multicast VLAN : (?P<multicast_vlan>\d+)$')
+        p52 = regex_engine.compile(r'^Multicast VLAN : (?P<multicast_vlan>\d+)$')
 
         # WiFi Direct Capabilities:
         #   WiFi Direct Capable           : No
-        p53 = re.compile(r'^WiFi Direct Capable +: (?P<wifi_direct_capable>\S+)$')
+        p53 = regex_engine.compile(r'^WiFi Direct Capable +: (?P<wifi_direct_capable>\S+)$')
 
         # Central NAT : DISABLED
-        p54 = re.compile(r'^Central NAT : (?P<central_nat>\S+)$')
+        p54 = regex_engine.compile(r'^Central NAT : (?P<central_nat>\S+)$')
 
         # Session Manager:
-        p55 = re.compile(r'^Session Manager:$')
+        p55 = regex_engine.compile(r'^Session Manager:$')
 
         #   Point of Attachment : capwap_00000aa1
-        p55_1 = re.compile(r'^Point of Attachment : (?P<point_of_attachment>\S+)$')
+        p55_1 = regex_engine.compile(r'^Point of Attachment : (?P<point_of_attachment>\S+)$')
 
         #   IIF ID             : 0x00000AA1
-        p55_2 = re.compile(r'^IIF ID +: (?P<iif_id>\S+)$')
+        p55_2 = regex_engine.compile(r'^IIF ID +: (?P<iif_id>\S+)$')
 
         #   Authorized         : TRUE
-        p55_3 = re.compile(r'^Authorized +: (?P<authorized>\S+)$')
+        p55_3 = regex_engine.compile(r'^Authorized +: (?P<authorized>\S+)$')
 
         #   Session timeout    : 36000
         # Not to be confused with "Session Timeout" which is captured by p22_1
-        p55_4 = re.compile(r'^Session timeout +: (?P<session_timeout>\S+)$')
+        p55_4 = regex_engine.compile(r'^Session timeout +: (?P<session_timeout>\S+)$')
 
         #   Common Session ID: B12A400A000007000000700A
-        p55_5 = re.compile(r'^Common Session ID: (?P<common_session_id>\S+)$')
+        p55_5 = regex_engine.compile(r'^Common Session ID: (?P<common_session_id>\S+)$')
 
         #   Acct Session ID  : 0x00005512
-        p55_6 = re.compile(r'^Acct Session ID +: (?P<acct_session_id>\S+)$')
+        p55_6 = regex_engine.compile(r'^Acct Session ID +: (?P<acct_session_id>\S+)$')
         #   Last Tried Aaa Server Details:
         #   	Server IP : 10.11.12.13
-        p55_7 = re.compile(r'^Server IP +: (?P<server_ip>\S+)$')
+        p55_7 = regex_engine.compile(r'^Server IP +: (?P<server_ip>\S+)$')
 
         #   Auth Method Status List
         #   	Method : Dot1x
-        p56 = re.compile(r'^Method : (?P<method>\S+)$')
+        p56 = regex_engine.compile(r'^Method : (?P<method>\S+)$')
 
         #   		SM State         : AUTHENTICATED
-        p56_1 = re.compile(r'^SM State +: (?P<sm_state>\S+)$')
+        p56_1 = regex_engine.compile(r'^SM State +: (?P<sm_state>\S+)$')
 
         #   		SM Bend State    : IDLE
-        p56_2 = re.compile(r'^SM Bend State +: (?P<sm_bend_state>\S+)$')
+        p56_2 = regex_engine.compile(r'^SM Bend State +: (?P<sm_bend_state>\S+)$')
 
         #           Authen Status   : Success
-        p56_3 = re.compile(r'^Authen Status +: (?P<authen_status>\S+)$')
+        p56_3 = regex_engine.compile(r'^Authen Status +: (?P<authen_status>\S+)$')
 
         #   Local Policies:
         #   	Service Template : wlan_service_template_local (priority 254)
-        p57 = re.compile(r'^Local Policies:$')
-        p57_1 = re.compile(r'^Service Template : (?P<service_template>[\S ]+)$')
+        p57 = regex_engine.compile(r'^Local Policies:$')
+        p57_1 = regex_engine.compile(r'^Service Template : (?P<service_template>[\S ]+)$')
 
         #   Server Policies:
-        p58 = re.compile(r'^Server Policies:$')
+        p58 = regex_engine.compile(r'^Server Policies:$')
 
         #   Resultant Policies:
-        p59 = re.compile(r'^Resultant Policies:$')
+        p59 = regex_engine.compile(r'^Resultant Policies:$')
 
         #   		Vlan Group       : data-group
-        p60 = re.compile(r'^Vlan Group +: (?P<vlan_group>\S+)$')
+        p60 = regex_engine.compile(r'^Vlan Group +: (?P<vlan_group>\S+)$')
 
         #   		Absolute-Timer   : 36000
-        p61 = re.compile(r'^Absolute-Timer +: (?P<absolute_timer>\d+)$')
+        p61 = regex_engine.compile(r'^Absolute-Timer +: (?P<absolute_timer>\d+)$')
 
         #   		Output SGT       : 000a-09
-        p62 = re.compile(r'^Output SGT +: (?P<output_sgt>\S+)$')
+        p62 = regex_engine.compile(r'^Output SGT +: (?P<output_sgt>\S+)$')
 
         #   		VLAN Name        : b1-data-1
-        p63 = re.compile(r'^VLAN Name +: (?P<vlan_name>\S+)$')
+        p63 = regex_engine.compile(r'^VLAN Name +: (?P<vlan_name>\S+)$')
 
         #                 URL Redirect ACL : ACL_WEBAUTH_REDIRECT
-        p64 = re.compile(r'^URL Redirect ACL : (?P<url_redirect_acl>\S+)$')
+        p64 = regex_engine.compile(r'^URL Redirect ACL : (?P<url_redirect_acl>\S+)$')
 
         #                 URL Redirect     : https://web.address:8443/portal/gateway
-        p65 = re.compile(r'URL Redirect +: (?P<url_redirect>\S+)$')
+        p65 = regex_engine.compile(r'URL Redirect +: (?P<url_redirect>\S+)$')
 
         # DNS Snooped IPv4 Addresses : None
         # DNS Snooped IPv6 Addresses : None
-        p66 = re.compile(r'^DNS Snooped (?P<ip_ver>(IPv4|IPv6)) Addresses : (?P<addresses>\S+)$')
+        p66 = regex_engine.compile(r'^DNS Snooped (?P<ip_ver>(IPv4|IPv6)) Addresses : (?P<addresses>\S+)$')
 
         # Client Capabilities
         #   CF Pollable : Not implemented
-        p67 = re.compile(r'^CF Pollable : (?P<cf_pollable>[\S ]+)$')
+        p67 = regex_engine.compile(r'^CF Pollable : (?P<cf_pollable>[\S ]+)$')
 
         #   CF Poll Request : Not implemented
-        p67_1 = re.compile(r'^CF Poll Request : (?P<cf_poll_request>[\S ]+)$')
+        p67_1 = regex_engine.compile(r'^CF Poll Request : (?P<cf_poll_request>[\S ]+)$')
 
         #   Short Preamble : Not implemented
-        p67_2 = re.compile(r'^Short Preamble : (?P<short_preamble>[\S ]+)$')
+        p67_2 = regex_engine.compile(r'^Short Preamble : (?P<short_preamble>[\S ]+)$')
 
         #   PBCC : Not implemented
-        p67_3 = re.compile(r'^PBCC : (?P<pbcc>[\S ]+)$')
+        p67_3 = regex_engine.compile(r'^PBCC : (?P<pbcc>[\S ]+)$')
 
         #   Channel Agility : Not implemented
-        p67_4 = re.compile(r'^Channel Agility : (?P<channel_agility>[\S ]+)$')
+        p67_4 = regex_engine.compile(r'^Channel Agility : (?P<channel_agility>[\S ]+)$')
 
         #   Listen Interval : 0
-        p67_5 = re.compile(r'^Listen Interval : (?P<listen_interval>\d+)$')
+        p67_5 = regex_engine.compile(r'^Listen Interval : (?P<listen_interval>\d+)$')
 
         # Fast BSS Transition Details :
         #   Reassociation Timeout : 0
-        p68 = re.compile(r'^Reassociation Timeout : (?P<reassociation_timeout>\d+)$')
+        p68 = regex_engine.compile(r'^Reassociation Timeout : (?P<reassociation_timeout>\d+)$')
 
         # 11v BSS Transition : Implemented
-        p69 = re.compile(r'^11v BSS Transition : (?P<bss_transition>[\S ]+)$')
+        p69 = regex_engine.compile(r'^11v BSS Transition : (?P<bss_transition>[\S ]+)$')
 
         # 11v DMS Capable : No
-        p70 = re.compile(r'^11v DMS Capable : (?P<dms_capable>\S+)$')
+        p70 = regex_engine.compile(r'^11v DMS Capable : (?P<dms_capable>\S+)$')
 
         # QoS Map Capable : No
-        p71 = re.compile(r'^QoS Map Capable : (?P<qos_map_capable>\S+)$')
+        p71 = regex_engine.compile(r'^QoS Map Capable : (?P<qos_map_capable>\S+)$')
 
         # FlexConnect Data Switching : N/A
         # FlexConnect Dhcp Status : N/A
         # FlexConnect Authentication : N/A
         # FlexConnect Central Association : N/A
-        p72 = re.compile(r'^FlexConnect (?P<type>.+?) : (?P<value>\S+)$')
+        p72 = regex_engine.compile(r'^FlexConnect (?P<type>.+?) : (?P<value>\S+)$')
 
         # Client Statistics:
         #   Number of Bytes Received : 3083748
@@ -2660,76 +2663,76 @@ class ShowWirelessClientMacDetail(ShowWirelessClientMacDetailSchema):
         #   Number of Packets Received : 9048
         #   Number of Packets Sent : 3686
         #   Number of Policy Errors : 0
-        p73 = re.compile(r'^Number of (?P<item>(Bytes|Packets)) (?P<direction>(Sent|Received)) ((to|from) Client )?: '
-                         r'(?P<value>\d+)$')
+        p73 = regex_engine.compile(r'^Number of (?P<item>(Bytes|Packets)) (?P<direction>(Sent|Received)) ((to|from) Client )?: '
+                                   r'(?P<value>\d+)$')
 
         #   Number of Policy Errors : 0
-        p73_1 = re.compile(r'^Number of Policy Errors : (?P<number_of_policy_errors>\d+)$')
+        p73_1 = regex_engine.compile(r'^Number of Policy Errors : (?P<number_of_policy_errors>\d+)$')
 
         #   Radio Signal Strength Indicator : -84 dBm
-        p73_2 = re.compile(r'^Radio Signal Strength Indicator : (?P<rssi>[\d-]+) dBm$')
+        p73_2 = regex_engine.compile(r'^Radio Signal Strength Indicator : (?P<rssi>[\d-]+) dBm$')
 
         #   Signal to Noise Ratio : 10 dB
-        p73_3 = re.compile(r'Signal to Noise Ratio : (?P<snr>\d+) dB$')
+        p73_3 = regex_engine.compile(r'Signal to Noise Ratio : (?P<snr>\d+) dB$')
 
         # Fabric status : Disabled
-        p74 = re.compile(r'^Fabric status : (?P<fabric_status>\S+)$')
+        p74 = regex_engine.compile(r'^Fabric status : (?P<fabric_status>\S+)$')
 
         # Radio Measurement Enabled Capabilities
         #   Capabilities: Link Measurement, Neighbor Report, Repeated Measurements, Passive Beacon Measurement, RM MIB
-        p75 = re.compile(r'^Capabilities: (?P<capabilities>[\S ]+)$')
+        p75 = regex_engine.compile(r'^Capabilities: (?P<capabilities>[\S ]+)$')
 
         # Client Scan Report Time : Timer not running
-        p76 = re.compile(r'^Client Scan Report Time : (?P<client_scan_report_time>[\S ]+)$')
+        p76 = regex_engine.compile(r'^Client Scan Report Time : (?P<client_scan_report_time>[\S ]+)$')
 
         # Nearby AP Statistics:
         #   prateekk_cos_1 (slot 1)
         #   	antenna 0: 13 s ago	........ -25  dBm
         #   	antenna 1: 13 s ago	........ -25  dBm
-        p77 = re.compile(r'^Nearby AP Statistics:$')
-        p77_1 = re.compile(r'^(?P<ap_name>\S+) \(slot (?P<slot>\d+)\)$')
-        p77_2 = re.compile(r'^antenna (?P<antenna>\d+): (?P<time>\d+) s ago\s\.+ (?P<rssi>[\d-]+) +dBm$')
+        p77 = regex_engine.compile(r'^Nearby AP Statistics:$')
+        p77_1 = regex_engine.compile(r'^(?P<ap_name>\S+) \(slot (?P<slot>\d+)\)$')
+        p77_2 = regex_engine.compile(r'^antenna (?P<antenna>\d+): (?P<time>\d+) s ago\s\.+ (?P<rssi>[\d-]+) +dBm$')
 
         # EoGRE : Pending Classification
-        p78 = re.compile(r'^EoGRE : (?P<eogre>[\S ]+)$')
+        p78 = regex_engine.compile(r'^EoGRE : (?P<eogre>[\S ]+)$')
 
         # Device Classification Information:
         # Device Type      : Android
-        p79 = re.compile(r'^Device Type +: (?P<device_type>\S+)$')
+        p79 = regex_engine.compile(r'^Device Type +: (?P<device_type>\S+)$')
 
         # Device Name      : android-dhcp-10
         # Device Name      : MSFT 5.0
-        p79_1 = re.compile(r'^Device Name +: (?P<device_name>[\S ]+)$')
+        p79_1 = regex_engine.compile(r'^Device Name +: (?P<device_name>[\S ]+)$')
 
         # Protocol Map     : 0x000029  (OUI, DHCP, HTTP)
-        p79_2 = re.compile(r'^Protocol Map +: (?P<protocol_map>[\S ]+)$')
+        p79_2 = regex_engine.compile(r'^Protocol Map +: (?P<protocol_map>[\S ]+)$')
 
         # Device OS        : Linux; U; Android 10; RMX1825 Build/QP1A.190711.020
-        p79_3 = re.compile(r'^Device OS +: (?P<device_os>.+?)$')
+        p79_3 = regex_engine.compile(r'^Device OS +: (?P<device_os>.+?)$')
 
         # Type             : 12   12
-        p79_4 = re.compile(r'^Type +: (?P<type>[\d ]+)$')
+        p79_4 = regex_engine.compile(r'^Type +: (?P<type>[\d ]+)$')
 
         # Data             : 0c
-        p79_5 = re.compile(r'^Data +: (?P<data_size>[\da-f]+)$')
+        p79_5 = regex_engine.compile(r'^Data +: (?P<data_size>[\da-f]+)$')
 
         # 00000000  00 0c 00 08 72 65 61 6c  6d 65 2d 33               |....realme-3    |
         # 00000030  42 75 69 6c 64 2f 51 50  31 41 2e 31 39 30 37 31  |Build/QP1A.19071|
         # 00000010  44 4a 30                                          |DJ0             |
-        p79_6 = re.compile(r'^(?P<byte>\d{8}) +(?P<hex>[\da-f ]+?) +(?P<piped>\|.+)$')
+        p79_6 = regex_engine.compile(r'^(?P<byte>\d{8}) +(?P<hex>[\da-f ]+?) +(?P<piped>\|.+)$')
 
         # Max Client Protocol Capability: 802.11ac Wave 2
-        p80 = re.compile(r'^Max Client Protocol Capability: (?P<max_client_protocol_capability>[\S ]+)$')
+        p80 = regex_engine.compile(r'^Max Client Protocol Capability: (?P<max_client_protocol_capability>[\S ]+)$')
 
         # Cellular Capability : N/A
-        p81 = re.compile(r'^Cellular Capability : (?P<cellular_capability>[\S ]+)$')
+        p81 = regex_engine.compile(r'^Cellular Capability : (?P<cellular_capability>[\S ]+)$')
 
         # Advanced Scheduling Requests Details:
         #   Apple Specific Requests(ASR) Capabilities/Statistics:
         #     Regular ASR support: DISABLED
-        p82 = re.compile(r'^Advanced Scheduling Requests Details:$')
-        p82_1 = re.compile(r'^(?P<request_type>Apple Specific Requests.+?):$')
-        p82_2 = re.compile(r'^Regular ASR support: (?P<regular_asr_support>\S+)$')
+        p82 = regex_engine.compile(r'^Advanced Scheduling Requests Details:$')
+        p82_1 = regex_engine.compile(r'^(?P<request_type>Apple Specific Requests.+?):$')
+        p82_2 = regex_engine.compile(r'^Regular ASR support: (?P<regular_asr_support>\S+)$')
 
         ret_dict = {}
         local_policies, server_policies, resultant_policies = None, None, None
@@ -3587,6 +3590,61 @@ class ShowWirelessClientMacDetail(ShowWirelessClientMacDetailSchema):
         return ret_dict
 
 
+# ====================================
+# Schema for:
+#  * 'show wireless client detail'
+# ====================================
+class ShowWirelessClientDetailSchema(MetaParser):
+    """Schema for show wireless client detail."""
+
+    schema = {
+        "clients": {
+            Any(): ShowWirelessClientMacDetailSchema.schema,
+        }
+    }
+
+
+# ====================================
+# Parser for:
+#  * 'show wireless client detail'
+# ====================================
+class ShowWirelessClientDetail(ShowWirelessClientDetailSchema):
+    """
+    Parser for show wireless client detail
+
+    One command for every client instead of one
+    'show wireless client mac {mac_address} detail' per client. The output
+    is split per client and each client is parsed by ShowWirelessClientMacDetail.
+    """
+
+    cli_command = 'show wireless client detail'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # Client MAC Address : 0aba.ddff.40c9
+        p1 = regex_engine.compile(r'^Client MAC Address : \S+$')
+
+        # one block of lines per client
+        blocks = []
+        for line in output.splitlines():
+            if p1.match(line.strip()):
+                blocks.append([])
+            if blocks:
+                blocks[-1].append(line)
+
+        client_parser = ShowWirelessClientMacDetail(device=self.device)
+
+        ret_dict = {}
+        for block in blocks:
+            client_dict = client_parser.cli(output='\n'.join(block))
+            if client_dict.get('client_mac_address'):
+                ret_dict.setdefault('clients', {})[client_dict['client_mac_address']] = client_dict
+
+        return ret_dict
+
+
 # ======================================
 # Schema for:
 #  * 'show wireless fabric vnid mapping'
@@ -3634,18 +3692,18 @@ class ShowWirelessFabricVnidMapping(ShowWirelessFabricVnidMappingSchema):
         #   Physical_Security     8192           0                                  0.0.0.0            default-control-plane
 
         # Fabric VNID Mapping:
-        p_fabric_mapping = re.compile(r"^Fabric\s+VNID\s+Mapping:")
+        p_fabric_mapping = regex_engine.compile(r"^Fabric\s+VNID\s+Mapping:")
 
         # Data                8190           0                                  0.0.0.0            default-control-plane
-        p_fabric_row_4 = re.compile(r"^(?P<name>\S+)\s+(?P<l2_vnid>\d+)\s+(?P<l3_vnid>\d+)"
-                                    r"\s+(?P<subnet>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
-                                    r"\s+(?P<control_name>\S+)$")
+        p_fabric_row_4 = regex_engine.compile(r"^(?P<name>\S+)\s+(?P<l2_vnid>\d+)\s+(?P<l3_vnid>\d+)"
+                                              r"\s+(?P<subnet>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
+                                              r"\s+(?P<control_name>\S+)$")
 
         # Fabric_A_INF_VN     8188           4097           10.8.132.0          255.255.254.0      default-control-plane
-        p_fabric_row_5 = re.compile(r"^(?P<name>\S+)\s+(?P<l2_vnid>\d+)\s+(?P<l3_vnid>\d+)\s+"
-                                    r"(?P<ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+"
-                                    r"(?P<subnet>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+"
-                                    r"(?P<control_name>\S+)")
+        p_fabric_row_5 = regex_engine.compile(r"^(?P<name>\S+)\s+(?P<l2_vnid>\d+)\s+(?P<l3_vnid>\d+)\s+"
+                                              r"(?P<ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+"
+                                              r"(?P<subnet>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+"
+                                              r"(?P<control_name>\S+)")
 
 
         fabric_dict = {}
@@ -3939,22 +3997,22 @@ class ShowWirelessStatsClientDeleteReasons(ShowWirelessStatsClientDeleteReasonsS
         client_delete_dict = {}
         
         # Total client delete reasons
-        p_total_client_delete_reasons = re.compile(r"^Total\s+client\s+delete\s+reasons$")
+        p_total_client_delete_reasons = regex_engine.compile(r"^Total\s+client\s+delete\s+reasons$")
 
         # Controller deletes
-        p_controller_deletes = re.compile(r"^Controller\s+deletes$")
+        p_controller_deletes = regex_engine.compile(r"^Controller\s+deletes$")
 
         # Informational Delete Reason
-        p_informational_delete = re.compile(r"^Informational\s+Delete\s+Reason$")
+        p_informational_delete = regex_engine.compile(r"^Informational\s+Delete\s+Reason$")
 
         # Client initiate delete
-        p_client_initiate_delete = re.compile(r"^Client\s+initiate\s+delete$")
+        p_client_initiate_delete = regex_engine.compile(r"^Client\s+initiate\s+delete$")
 
         # AP Deletes
-        p_ap_deletes = re.compile(r"^AP\s+Deletes$")
+        p_ap_deletes = regex_engine.compile(r"^AP\s+Deletes$")
 
         # [key] : [value]
-        p_colon_split = re.compile(r"^(?P<key>[\S\s]+\S)\s*: +(?P<value>\d+)$")
+        p_colon_split = regex_engine.compile(r"^(?P<key>[\S\s]+\S)\s*: +(?P<value>\d+)$")
 
 
         for line in output.splitlines():
@@ -4526,124 +4584,124 @@ class ShowWirelessStatsClientDetail(ShowWirelessStatsClientDetailSchema):
           output = output
             
         # Total Number of Clients : 16
-        p_total_client = re.compile(r"^Total\s+Number\s+of\s+Clients\s+:\s+(?P<value>\d+)$")
+        p_total_client = regex_engine.compile(r"^Total\s+Number\s+of\s+Clients\s+:\s+(?P<value>\d+)$")
 
         # Protocol Statistics
-        p_protocol_stats_section = re.compile(r"^Protocol\s+Statistics$")
+        p_protocol_stats_section = regex_engine.compile(r"^Protocol\s+Statistics$")
 
         # Current client state statistics:
-        p_current_client_stats_section = re.compile(r"^Current\s+client\s+state\s+statistics:$")
+        p_current_client_stats_section = regex_engine.compile(r"^Current\s+client\s+state\s+statistics:$")
 
         # Client Summary
-        p_client_summary_section = re.compile(r"^Client\s+Summary$")
+        p_client_summary_section = regex_engine.compile(r"^Client\s+Summary$")
 
         # client global statistics:
-        p_client_global_s1 = re.compile(r"^client\s+global\s+statistics:$")
+        p_client_global_s1 = regex_engine.compile(r"^client\s+global\s+statistics:$")
 
         # Total roam attempts                              : 4200
-        p_client_global_s2 = re.compile(r"^Total\s+roam\s+attempts\s+:\s+(?P<total_roam>\d+)$")
+        p_client_global_s2 = regex_engine.compile(r"^Total\s+roam\s+attempts\s+:\s+(?P<total_roam>\d+)$")
 
         # Total roam failures in dot11                     : 5
-        p_client_global_s3 = re.compile(r"Total\s+roam\s+failures\s+in\s+dot11\s+:\s+(?P<dot11>\d+)$")
+        p_client_global_s3 = regex_engine.compile(r"Total\s+roam\s+failures\s+in\s+dot11\s+:\s+(?P<dot11>\d+)$")
 
         # Total WPA3 SAE attempts                          : 0
-        p_client_global_s4 = re.compile(r"Total\s+WPA3\s+SAE\s+attempts\s+:\s+(?P<wpa3_sae>\d+)$")
+        p_client_global_s4 = regex_engine.compile(r"Total\s+WPA3\s+SAE\s+attempts\s+:\s+(?P<wpa3_sae>\d+)$")
 
         # Total Flexconnect local-auth roam attempts       : 0
-        p_client_global_s5 = re.compile(r"^Total\s+Flexconnect\s+local-auth\s+roam\s+attempts\s+:\s+(?P<flex_roam>\d+)$")
+        p_client_global_s5 = regex_engine.compile(r"^Total\s+Flexconnect\s+local-auth\s+roam\s+attempts\s+:\s+(?P<flex_roam>\d+)$")
 
         # Total client state starts                        : 41695
-        p_client_global_s6 = re.compile(r"^Total\s+client\s+state\s+starts\s+:\s+(?P<start_state>\d+)$")
+        p_client_global_s6 = regex_engine.compile(r"^Total\s+client\s+state\s+starts\s+:\s+(?P<start_state>\d+)$")
 
         # client state statistics:
-        p_client_state_stats = re.compile(r"^client\s+state\s+statistics:$")
+        p_client_state_stats = regex_engine.compile(r"^client\s+state\s+statistics:$")
 
         # Total clients recovered from idle state:
-        p_total_clients_recovered_idle = re.compile(r"^Total\s+clients\s+recovered\s+from\s+idle\s+state:$")
+        p_total_clients_recovered_idle = regex_engine.compile(r"^Total\s+clients\s+recovered\s+from\s+idle\s+state:$")
 
         # Average Time in Each State (ms)
-        p_average_time_state = re.compile(r"Average\s+Time\s+in\s+Each\s+State\s+\(ms\)")
+        p_average_time_state = regex_engine.compile(r"Average\s+Time\s+in\s+Each\s+State\s+\(ms\)")
 
         # Average Run State Latency (ms) : 5
-        p_average_run_latency = re.compile(r"^Average\s+Run\s+State\s+Latency\s+\(ms\)\s+:\s+(?P<run_latency>\d+)$")
+        p_average_run_latency = regex_engine.compile(r"^Average\s+Run\s+State\s+Latency\s+\(ms\)\s+:\s+(?P<run_latency>\d+)$")
 
         # Average Run State Latency without user delay (ms) : 1
-        p_average_run_latency_user = re.compile(r"^Average\s+Run\s+State\s+Latency\s+without\s+user\s+delay\s+\(ms\)\s+:\s+(?P<run_latency_user>\d+)$")
+        p_average_run_latency_user = regex_engine.compile(r"^Average\s+Run\s+State\s+Latency\s+without\s+user\s+delay\s+\(ms\)\s+:\s+(?P<run_latency_user>\d+)$")
 
         # Latency Distribution (ms)
-        p_latency_distribution = re.compile(r"^Latency\s+Distribution\s+\(ms\)$")
+        p_latency_distribution = regex_engine.compile(r"^Latency\s+Distribution\s+\(ms\)$")
 
         # Webauth HTTP Statistics
-        p_webhttp_stats = re.compile(r"^Webauth\s+HTTP\s+Statistics$")
+        p_webhttp_stats = regex_engine.compile(r"^Webauth\s+HTTP\s+Statistics$")
 
         # Time spent in each httpd states (in msecs)
-        p_time_spent_http_states_section = re.compile(r"Time\s+spent\s+in\s+each\s+httpd\s+states\s+\(in\s+msecs\)")
+        p_time_spent_http_states_section = regex_engine.compile(r"Time\s+spent\s+in\s+each\s+httpd\s+states\s+\(in\s+msecs\)")
 
         # IO Reading state          4654682      58788          0     294534
-        p_time_spent_io_read = re.compile(r"IO\s+Reading\s+state\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
+        p_time_spent_io_read = regex_engine.compile(r"IO\s+Reading\s+state\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
 
         # IO Writing state             6445          1          0     293834
-        p_time_spent_io_write = re.compile(r"IO\s+Writing\s+state\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
+        p_time_spent_io_write = regex_engine.compile(r"IO\s+Writing\s+state\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
 
         # IO AAA state                    0          0          0          0
-        p_time_spent_io_aaa = re.compile(r"IO\s+AAA\s+state\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
+        p_time_spent_io_aaa = regex_engine.compile(r"IO\s+AAA\s+state\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
 
         # Method after reading         9865          1          0     294534
-        p_time_spent_method_read = re.compile(r"Method\s+after\s+reading\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
+        p_time_spent_method_read = regex_engine.compile(r"Method\s+after\s+reading\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
 
         # Method after writing           31          1          0     293834
-        p_time_spent_method_writing = re.compile(r"Method\s+after\s+writing\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
+        p_time_spent_method_writing = regex_engine.compile(r"Method\s+after\s+writing\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
 
         # Method after AAA                0          0          0          0
-        p_time_spent_method_aaa = re.compile(r"Method\s+after\s+AAA\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
+        p_time_spent_method_aaa = regex_engine.compile(r"Method\s+after\s+AAA\s+(?P<total>\d+)\s+(?P<max>\d+)\s+(?P<min>\d+)\s+(?P<samples>\d+)")
 
         # Webauth HTTP status counts
-        p_webauth_http_status_counts = re.compile(r"^Webauth\s+HTTP\s+status\s+counts$")
+        p_webauth_http_status_counts = regex_engine.compile(r"^Webauth\s+HTTP\s+status\s+counts$")
 
         # Webauth backpressure queue counters
-        p_webauth_backpressure = re.compile(r"Webauth\s+backpressure\s+queue\s+counters")
+        p_webauth_backpressure = regex_engine.compile(r"Webauth\s+backpressure\s+queue\s+counters")
 
         # Dot1x Global Statistics
-        p_dot1x_global_section = re.compile(r"Dot1x\s+Global\s+Statistics")
+        p_dot1x_global_section = regex_engine.compile(r"Dot1x\s+Global\s+Statistics")
 
         # RxStart = 6657 RxLogoff = 18  RxResp = 104310 RxRespID = 15453
-        p_dot1x_rxstart = re.compile(r"^RxStart\s+=\s+(?P<start>\d+)\s+RxLogoff\s+=\s+(?P<logoff>\d+)\s+RxResp\s+=\s+(?P<resp>\d+)\s+RxRespID\s+=\s+(?P<respid>\d+)$")
+        p_dot1x_rxstart = regex_engine.compile(r"^RxStart\s+=\s+(?P<start>\d+)\s+RxLogoff\s+=\s+(?P<logoff>\d+)\s+RxResp\s+=\s+(?P<resp>\d+)\s+RxRespID\s+=\s+(?P<respid>\d+)$")
 
         # RxReq = 0 RxInvalid = 0  RxLenErr = 0
-        p_dot1x_req = re.compile(r"^RxReq\s+=\s+(?P<req>\d+)\s+RxInvalid\s+=\s+(?P<invalid>\d+)\s+RxLenErr\s+=\s+(?P<lenerror>\d+)$")
+        p_dot1x_req = regex_engine.compile(r"^RxReq\s+=\s+(?P<req>\d+)\s+RxInvalid\s+=\s+(?P<invalid>\d+)\s+RxLenErr\s+=\s+(?P<lenerror>\d+)$")
 
         # RxTotal = 126939
-        p_dot1x_rx_total = re.compile(r"^RxTotal\s+=\s+(?P<total>\d+)$")
+        p_dot1x_rx_total = regex_engine.compile(r"^RxTotal\s+=\s+(?P<total>\d+)$")
 
         # TxStart = 0 TxLogoff = 0  TxResp = 0
-        p_dot1x_txstart = re.compile(r"^TxStart\s+=\s+(?P<start>\d+)\s+TxLogoff\s+=\s+(?P<logoff>\d+)\s+TxResp\s+=\s+(?P<resp>\d+)$")
+        p_dot1x_txstart = regex_engine.compile(r"^TxStart\s+=\s+(?P<start>\d+)\s+TxLogoff\s+=\s+(?P<logoff>\d+)\s+TxResp\s+=\s+(?P<resp>\d+)$")
 
         # TxReq = 117345 ReTxReq = 3909  ReTxReqFail = 11528
-        p_dot1_tx_req = re.compile(r"^TxReq\s+=\s+(?P<req>\d+)\s+ReTxReq\s+=\s+(?P<rereq>\d+)\s+ReTxReqFail\s+=\s+(?P<txfail>\d+)$")
+        p_dot1_tx_req = regex_engine.compile(r"^TxReq\s+=\s+(?P<req>\d+)\s+ReTxReq\s+=\s+(?P<rereq>\d+)\s+ReTxReqFail\s+=\s+(?P<txfail>\d+)$")
 
         # TxReqID = 67670 ReTxReqID = 29908  ReTxReqIDFail = 1310
-        p_dot1_tx_reqid = re.compile(r"TxReqID\s+=\s+(?P<reqid>\d+)\s+ReTxReqID\s+=\s+(?P<rereqid>\d+)\s+ReTxReqIDFail\s+=\s+(?P<reqidfail>\d+)$")
+        p_dot1_tx_reqid = regex_engine.compile(r"TxReqID\s+=\s+(?P<reqid>\d+)\s+ReTxReqID\s+=\s+(?P<rereqid>\d+)\s+ReTxReqIDFail\s+=\s+(?P<reqidfail>\d+)$")
 
         # TxTotal = 185057
-        p_dot1_tx_total = re.compile(r"TxTotal\s+=\s+(?P<tx_total>\d+)$")
+        p_dot1_tx_total = regex_engine.compile(r"TxTotal\s+=\s+(?P<tx_total>\d+)$")
         
         # Total client delete reasons
-        p_total_client_delete_reasons = re.compile(r"^Total\s+client\s+delete\s+reasons$")
+        p_total_client_delete_reasons = regex_engine.compile(r"^Total\s+client\s+delete\s+reasons$")
 
         # Controller deletes
-        p_controller_deletes = re.compile(r"^Controller\s+deletes$")
+        p_controller_deletes = regex_engine.compile(r"^Controller\s+deletes$")
 
         # Informational Delete Reason
-        p_informational_delete = re.compile(r"^Informational\s+Delete\s+Reason$")
+        p_informational_delete = regex_engine.compile(r"^Informational\s+Delete\s+Reason$")
 
         # Client initiate delete
-        p_client_initiate_delete = re.compile(r"^Client\s+initiate\s+delete$")
+        p_client_initiate_delete = regex_engine.compile(r"^Client\s+initiate\s+delete$")
 
         # AP Deletes
-        p_ap_deletes = re.compile(r"^AP\s+Deletes$")
+        p_ap_deletes = regex_engine.compile(r"^AP\s+Deletes$")
 
         # [key] : [value]
-        p_colon_split = re.compile(r"^(?P<key>[\S\s]+\S)\s*: +(?P<value>\d+)$")
+        p_colon_split = regex_engine.compile(r"^(?P<key>[\S\s]+\S)\s*: +(?P<value>\d+)$")
         
         def change_data_type(self, value):
             if value.isdigit():
@@ -5062,53 +5120,53 @@ class ShowWirelessStatsMobility(ShowWirelessStatsMobilitySchema):
           out = output
 
         # Mobility event statistics:
-        mobility_event_statistics_capture = re.compile(r"^Mobility event statistics:$")
+        mobility_event_statistics_capture = regex_engine.compile(r"^Mobility event statistics:$")
 
         # Joined as
-        joined_as_capture = re.compile(r"^Joined as$")
+        joined_as_capture = regex_engine.compile(r"^Joined as$")
 
         # Delete
-        delete_capture = re.compile(r"^Delete$")
+        delete_capture = regex_engine.compile(r"^Delete$")
 
         # Role changes
-        role_changes_capture = re.compile(r"^Role changes$")
+        role_changes_capture = regex_engine.compile(r"^Role changes$")
 
         # Roam stats
-        roam_stats_capture = re.compile(r"^Roam stats$")
+        roam_stats_capture = regex_engine.compile(r"^Roam stats$")
 
         # Anchor Request
-        anchor_request_capture = re.compile(r"^Anchor Request$")
+        anchor_request_capture = regex_engine.compile(r"^Anchor Request$")
 
         # Handoff Status Received
-        handoff_status_received_capture = re.compile(r"^Handoff Status Received$")
+        handoff_status_received_capture = regex_engine.compile(r"^Handoff Status Received$")
 
         # Handoff Status Sent
-        handoff_status_sent_capture = re.compile(r"^Handoff Status Sent$")
+        handoff_status_sent_capture = regex_engine.compile(r"^Handoff Status Sent$")
 
         # Export Anchor
-        export_anchor_capture = re.compile(r"^Export Anchor$")
+        export_anchor_capture = regex_engine.compile(r"^Export Anchor$")
 
         # Response Received             :
-        export_anchor_response_received_capture = re.compile(r"Response Received\s+:")
+        export_anchor_response_received_capture = regex_engine.compile(r"Response Received\s+:")
 
         # Response Sent             :
-        export_anchor_response_sent_capture = re.compile(r"Response Sent\s+:")
+        export_anchor_response_sent_capture = regex_engine.compile(r"Response Sent\s+:")
 
         # MM mobility event statistics:
-        mm_mobility_event_statistics_capture = re.compile(
+        mm_mobility_event_statistics_capture = regex_engine.compile(
             r"^MM mobility event statistics:$"
         )
 
         # MMIF mobility event statistics:
-        mmif_mobility_event_statistics_capture = re.compile(
+        mmif_mobility_event_statistics_capture = regex_engine.compile(
             r"^MMIF mobility event statistics:$"
         )
 
         # MMIF internal errors:
-        mmif_internal_errors_capture = re.compile(r"^MMIF internal errors:$")
+        mmif_internal_errors_capture = regex_engine.compile(r"^MMIF internal errors:$")
 
         # key : value
-        key_value_capture = re.compile(r"^(?P<key>[\S\s]+\S)\s*:\s+(?P<value>\d+)$")
+        key_value_capture = regex_engine.compile(r"^(?P<key>[\S\s]+\S)\s*:\s+(?P<value>\d+)$")
 
         wireless_info_obj = {}
 
@@ -5221,22 +5279,22 @@ class ShowWirelessManagementTrustPoint(ShowWirelessManagementTrustPointSchema):
         ret_dict = {}
 
         # Trustpoint Name : ewlc-tp1  
-        p1 = re.compile(r'^Trustpoint +Name +:( +(?P<trustpoint_name>.*))?$')
+        p1 = regex_engine.compile(r'^Trustpoint +Name +:( +(?P<trustpoint_name>.*))?$')
         
         # Certificate Info : Available
-        p2 = re.compile(r'^Certificate +Info +: +(?P<certificate_info>.*)$')
+        p2 = regex_engine.compile(r'^Certificate +Info +: +(?P<certificate_info>.*)$')
         
         # Certificate Type : SSC
-        p3 = re.compile(r'^Certificate +Type +: +(?P<certificate_type>.*)$')
+        p3 = regex_engine.compile(r'^Certificate +Type +: +(?P<certificate_type>.*)$')
         
         # FIPS suitability : Not Applicable
-        p4 = re.compile(r'^FIPS +suitability +: +(?P<fips_suitability>.*)$')
+        p4 = regex_engine.compile(r'^FIPS +suitability +: +(?P<fips_suitability>.*)$')
         
         # Private key Info : Available
-        p5 = re.compile(r'^Private +key +Info +: +(?P<private_key_info>.*)$')
+        p5 = regex_engine.compile(r'^Private +key +Info +: +(?P<private_key_info>.*)$')
         
         # Certificate Hash : 4a5d777c5b2071c17faef376febc08398702184e       
-        p6 = re.compile(r'^Certificate +Hash +: +(?P<certificate_hash>.*)$')
+        p6 = regex_engine.compile(r'^Certificate +Hash +: +(?P<certificate_hash>.*)$')
         
          
         for line in out.splitlines():
@@ -5343,49 +5401,49 @@ class ShowWirelessMulticast(ShowWirelessMulticastSchema):
         for line in out.splitlines():
 
             # # Multicast                               : Enabled
-            m = re.search(p1_rgx, line)
+            m = regex_engine.search(p1_rgx, line)
             if m:
                 multicast = m.groupdict()['multicast']
                 ret_dict['multicast'] = str_to_bool_map[multicast]
                 continue
 
             # AP Capwap Multicast                     : Unicast
-            m = re.search(p2_rgx, line)
+            m = regex_engine.search(p2_rgx, line)
             if m:
                 ap_capwap_multicast = m.groupdict()['ap_capwap_multicast']
                 ret_dict['ap_capwap_multicast'] = ap_capwap_multicast
                 continue
 
             # Wireless Broadcast                      : Disabled
-            m = re.search(p3_rgx, line)
+            m = regex_engine.search(p3_rgx, line)
             if m:
                 wireless_broadcast = m.groupdict()['wireless_broadcast']
                 ret_dict['wireless_broadcast'] = str_to_bool_map[wireless_broadcast]
                 continue
 
             # Wireless Multicast non-ip-mcast         : Disabled
-            m = re.search(p4_rgx, line)
+            m = regex_engine.search(p4_rgx, line)
             if m:
                 mcast_no_ip_mcast = m.groupdict()['mcast_no_ip_mcast']
                 ret_dict['mcast_no_ip_mcast'] = str_to_bool_map[mcast_no_ip_mcast]
                 continue
 
             # Wireless Multicast link-local           : Enabled
-            m = re.search(p5_rgx, line)
+            m = regex_engine.search(p5_rgx, line)
             if m:
                 mcast_link_local = m.groupdict()['mcast_link_local']
                 ret_dict['mcast_link_local'] = str_to_bool_map[mcast_link_local]
                 continue
 
             # AP Capwap IPv4 Multicast group Address  : 239.1.1.1
-            m = re.search(p6_rgx, line)
+            m = regex_engine.search(p6_rgx, line)
             if m:
                 ipv4 = m.groupdict()['ipv4']
                 ret_dict['ipv4_mcast_group_address'] = ipv4
                 continue
 
             # AP Capwap IPv6 Multicast group Address  : ff11::1
-            m = re.search(p7_rgx, line)
+            m = regex_engine.search(p7_rgx, line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
                 ret_dict['ipv6_mcast_group_address'] = ipv6
@@ -5427,35 +5485,35 @@ class ShowWirelessProfileFlexSummary(ShowWirelessProfileFlexSummarySchema):
 
         ret_dict = {}
         # Number of Flex Profiles: 4
-        p_count = re.compile(r'Number\sof\sFlex\sProfiles:\s(?P<count>\d+)')
+        p_count = regex_engine.compile(r'Number\sof\sFlex\sProfiles:\s(?P<count>\d+)')
         # ------------------------------------------------------------------------
-        p_line = re.compile(r'-+$')
+        p_line = regex_engine.compile(r'-+$')
         # Flex Profile Name                 Description
-        p_header = re.compile(r'Flex\sProfile\sName\s+Description')
+        p_header = regex_engine.compile(r'Flex\sProfile\sName\s+Description')
         # myflexp1                          My first profile
         # myflexp2
         # myflexp3                          2023 profile
-        p_line_double = re.compile(r'^(?P<flexp_name>[\w\.-]+)\s+(?P<desc>(\w+\s?)+)$|(?P<flexp_name_single>[\w\.-]+)')
+        p_line_double = regex_engine.compile(r'^(?P<flexp_name>[\w\.-]+)\s+(?P<desc>(\w+\s?)+)$|(?P<flexp_name_single>[\w\.-]+)')
         for line in output.splitlines():
             line = line.strip()
             flex_dict = ret_dict.setdefault('flex_profiles', {})
             # Flex Profile Name                 Description
-            m = re.match(p_header, line)
+            m = regex_engine.match(p_header, line)
             if m:
                 continue
             # ------------------------------------------------------------------------
-            m = re.match(p_line, line)
+            m = regex_engine.match(p_line, line)
             if m:
                 continue
             # Number of Flex Profiles: 4
-            m = re.match(p_count, line)
+            m = regex_engine.match(p_count, line)
             if m:
                 ret_dict.update({'count': int(m.groupdict().get('count'))})
                 continue
             # myflexp1                          My first profile
             # myflexp2
             # myflexp3                          2023 profile
-            m = re.match(p_line_double, line)
+            m = regex_engine.match(p_line_double, line)
             if m:
                 m_dict = m.groupdict()
                 flexp_name_single = m_dict.get('flexp_name_single')
@@ -5502,33 +5560,33 @@ class ShowWirelessTagSiteSummary(ShowWirelessTagSiteSummarySchema):
             output = self.device.execute(self.cli_command)
         ret_dict = {}
         # Number of Site Tags: 7
-        p_count = re.compile(r'Number\sof\sSite\sTags:\s(?P<count>\d+)')
+        p_count = regex_engine.compile(r'Number\sof\sSite\sTags:\s(?P<count>\d+)')
         # ------------------------------------------------------------------------
-        p_line = re.compile(r'-+$')
+        p_line = regex_engine.compile(r'-+$')
         # Site Tag Name                     Description
-        p_header = re.compile(r'Site\sTag\sName\s+Description')
+        p_header = regex_engine.compile(r'Site\sTag\sName\s+Description')
         # sometag                           Some description
         # sometagwithnodescription
-        p_line_double = re.compile(r'^(?P<site_name>[\w\.-]+)\s+(?P<desc>(\w+\s?)+)$|(?P<site_name_single>[\w\.-]+)')
+        p_line_double = regex_engine.compile(r'^(?P<site_name>[\w\.-]+)\s+(?P<desc>(\w+\s?)+)$|(?P<site_name_single>[\w\.-]+)')
         for line in output.splitlines():
             line = line.strip()
             site_dict = ret_dict.setdefault('site_tags', {})
             # Site Tag Name                     Description
-            m = re.match(p_header, line)
+            m = regex_engine.match(p_header, line)
             if m:
                 continue
             # ------------------------------------------------------------------------
-            m = re.match(p_line, line)
+            m = regex_engine.match(p_line, line)
             if m:
                 continue
             # Number of Site Tags: 7
-            m = re.match(p_count, line)
+            m = regex_engine.match(p_count, line)
             if m:
                 ret_dict.update({'count': int(m.groupdict().get('count'))})
                 continue
             # sometag                           Some description
             # sometagwithnodescription
-            m = re.match(p_line_double, line)
+            m = regex_engine.match(p_line_double, line)
             if m:
                 m_dict = m.groupdict()
                 site_name_single = m_dict.get('site_name_single')
@@ -5578,83 +5636,83 @@ class ShowWirelessMeshApBackhaul(ShowWirelessMeshApBackhaulSchema):
 
         ret_dict = {}
         # MAC Address : 488b.0a78.c8a0
-        p_mac_addr = re.compile(r"MAC\sAddress\s:\s+(?P<mac_add>(([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}))")
+        p_mac_addr = regex_engine.compile(r"MAC\sAddress\s:\s+(?P<mac_add>(([0-9a-fA-F]{4}\.){2}[0-9a-fA-F]{4}))")
         # Current Backhaul Slot: 1
-        p_backhaul_slot = re.compile(r"^Current\sBackhaul\sSlot:\s+(?P<backhaul_slot>(\d))$")
+        p_backhaul_slot = regex_engine.compile(r"^Current\sBackhaul\sSlot:\s+(?P<backhaul_slot>(\d))$")
         # Radio Type: Main
-        p_radio_type = re.compile(r"^Radio\sType:\s+(?P<radio_type>(\w+))$")
+        p_radio_type = regex_engine.compile(r"^Radio\sType:\s+(?P<radio_type>(\w+))$")
         # Radio Subband: All
-        p_radio_subband = re.compile(r"^Radio\sSubband:\s+(?P<radio_subband>(\w+))$")
+        p_radio_subband = regex_engine.compile(r"^Radio\sSubband:\s+(?P<radio_subband>(\w+))$")
         # Mesh Radio Role: Downlink
-        p_mesh_radio_role = re.compile(r"^Mesh\sRadio\sRole:\s+(?P<mesh_radio_role>(\w+))$")
+        p_mesh_radio_role = regex_engine.compile(r"^Mesh\sRadio\sRole:\s+(?P<mesh_radio_role>(\w+))$")
         # Administrative State: Disabled
-        p_admin_state = re.compile(r"^Administrative\sState:\s+(?P<admin_state>(\w+))$")
+        p_admin_state = regex_engine.compile(r"^Administrative\sState:\s+(?P<admin_state>(\w+))$")
         # Operation State: Down
-        p_oper_state = re.compile(r"^Operation\sState:\s+(?P<oper_state>(\w+))$")
+        p_oper_state = regex_engine.compile(r"^Operation\sState:\s+(?P<oper_state>(\w+))$")
         # Current Tx Power Level: *4
-        p_current_tx_power = re.compile(r"^CurrentsTx\sPower\sLevel:\s+(?P<current_tx_power>(\*?\d+))$")
+        p_current_tx_power = regex_engine.compile(r"^CurrentsTx\sPower\sLevel:\s+(?P<current_tx_power>(\*?\d+))$")
         # Current Channel: (157,161)*
-        p_current_channel = re.compile(r"^Current\sChannel:\s+(?P<current_channel>(\(\d+[,\d]+?\)\*?))$")
+        p_current_channel = regex_engine.compile(r"^Current\sChannel:\s+(?P<current_channel>(\(\d+[,\d]+?\)\*?))$")
         # Antenna Type: C-ANT-DART-RPTNC
-        p_antenna_type = re.compile(r"^Antenna\sType:\s?(?P<antenna_type>(N\/A|[\w-]+|$))")
+        p_antenna_type = regex_engine.compile(r"^Antenna\sType:\s?(?P<antenna_type>(N\/A|[\w-]+|$))")
         # Internal Antenna Gain (in .5 dBm units): 1
-        p_antenna_gain = re.compile(r".* Gain \(.*\):\s(?P<antenna_gain>(\d+))$")
+        p_antenna_gain = regex_engine.compile(r".* Gain \(.*\):\s(?P<antenna_gain>(\d+))$")
 
         for line in output.splitlines():
             line = line.strip()
             # MAC Address : 488b.0a78.c8a0
-            m = re.match(p_mac_addr, line)
+            m = regex_engine.match(p_mac_addr, line)
             if m:
                 curr_mac = m.groupdict().get('mac_add').strip()
                 mac_dict = ret_dict.setdefault(curr_mac, {})
                 continue
             # Current Backhaul Slot: 1
-            m = re.match(p_backhaul_slot, line)
+            m = regex_engine.match(p_backhaul_slot, line)
             if m:
                 mac_dict['backhaul_slot'] = m.groupdict().get('backhaul_slot')
                 continue
             # Radio Type: Main
-            m = re.match(p_radio_type, line)
+            m = regex_engine.match(p_radio_type, line)
             if m:
                 mac_dict['radio_type'] = m.groupdict().get('radio_type')
                 continue
             # Radio Subband: All
-            m = re.match(p_radio_subband, line)
+            m = regex_engine.match(p_radio_subband, line)
             if m:
                 mac_dict['radio_subband'] = m.groupdict().get('radio_subband')
                 continue
             # Mesh Radio Role: Downlink
-            m = re.match(p_mesh_radio_role, line)
+            m = regex_engine.match(p_mesh_radio_role, line)
             if m:
                 mac_dict['mesh_radio_role'] = m.groupdict().get('mesh_radio_role')
                 continue
             # Administrative State: Disabled
-            m = re.match(p_admin_state, line)
+            m = regex_engine.match(p_admin_state, line)
             if m:
                 mac_dict['admin_state'] = m.groupdict().get('admin_state')
                 continue
             # Operation State: Down
-            m = re.match(p_oper_state, line)
+            m = regex_engine.match(p_oper_state, line)
             if m:
                 mac_dict['oper_state'] = m.groupdict().get('oper_state')
                 continue
             # Current Tx Power Level: *4
-            m = re.match(p_current_tx_power, line)
+            m = regex_engine.match(p_current_tx_power, line)
             if m:
                 mac_dict['current_tx_power'] = m.groupdict().get('current_tx_power')
                 continue
             # Current Channel: (157,161)*
-            m = re.match(p_current_channel, line)
+            m = regex_engine.match(p_current_channel, line)
             if m:
                 mac_dict['current_channel'] = m.groupdict().get('current_channel')
                 continue
             # Antenna Type: C-ANT-DART-RPTNC|N/A
-            m = re.match(p_antenna_type, line)
+            m = regex_engine.match(p_antenna_type, line)
             if m:
                 mac_dict['antenna_type'] = m.groupdict().get('antenna_type')
                 continue
             # Internal Antenna Gain (in .5 dBm units): 1
-            m = re.match(p_antenna_gain, line)
+            m = regex_engine.match(p_antenna_gain, line)
             if m:
                 mac_dict['antenna_gain'] = m.groupdict().get('antenna_gain')
                 continue
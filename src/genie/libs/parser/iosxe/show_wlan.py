@@ -3,6 +3,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ======================
 # Schema for:
@@ -53,14 +56,14 @@ class ShowWlanSummary(ShowWlanSummarySchema):
         # 20   lizzard-l_Global                lizzard-legacy                  UP     [WPA2][802.1x][AES]
 
         # Number of WLANs: 4
-        wlan_count_capture = re.compile(r"^Number\s+of\s+WLANs:\s+(?P<wlan_count>\d+)$")
+        wlan_count_capture = regex_engine.compile(r"^Number\s+of\s+WLANs:\s+(?P<wlan_count>\d+)$")
         # ID   Profile Name                     SSID                             Status Security
-        wlan_info_header_capture = re.compile(r"^ID\s+Profile\s+Name\s+SSID\s+Status\s+Security$")
+        wlan_info_header_capture = regex_engine.compile(r"^ID\s+Profile\s+Name\s+SSID\s+Status\s+Security$")
         # ----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        delimiter_capture = re.compile(
+        delimiter_capture = regex_engine.compile(
             r"^----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------$")
         # 17   lizzard_Global                  lizzard                         UP     [WPA2][802.1x][FT + 802.1x][AES],[FT Enabled]
-        wlan_info_capture = re.compile(
+        wlan_info_capture = regex_engine.compile(
             r"^(?P<wlan_id>\d+)\s+(?P<profile_name>\S+)\s+(?P<ssid>.*?)(?:\s{2,})\s+(?P<wlan_status>\S+)\s+(?P<status_security>.*$)")
 
         for line in out.splitlines():
@@ -381,362 +384,362 @@ class ShowWlanAll(ShowWlanAllSchema):
         # WiFi to Cellular Steering                      : Disabled        
 
         # WLAN Profile Name     : north
-        p_name = re.compile(r"^WLAN\s+Profile\s+Name\s+:\s+(?P<value>\S+)$")
+        p_name = regex_engine.compile(r"^WLAN\s+Profile\s+Name\s+:\s+(?P<value>\S+)$")
 
         # ================================================
-        p_delimeter = re.compile(r"^=+$")
+        p_delimeter = regex_engine.compile(r"^=+$")
 
         # Identifier                                     : 1
-        p_identifier = re.compile(r"^Identifier\s+:\s+(?P<value>\d+)$")
+        p_identifier = regex_engine.compile(r"^Identifier\s+:\s+(?P<value>\d+)$")
 
         # Description                                    :
-        p_description = re.compile(r"^Description\s+:\s+(?P<value>.*)$")
+        p_description = regex_engine.compile(r"^Description\s+:\s+(?P<value>.*)$")
 
         # Network Name (SSID)                            : north
-        p_name_ssid = re.compile(r"^Network\s+Name\s+\(SSID\)\s+:\s+(?P<value>.*)$")
+        p_name_ssid = regex_engine.compile(r"^Network\s+Name\s+\(SSID\)\s+:\s+(?P<value>.*)$")
 
         # Status                                         : Enabled
-        p_status = re.compile(r"^Status\s+:\s+(?P<value>\S+)$")
+        p_status = regex_engine.compile(r"^Status\s+:\s+(?P<value>\S+)$")
 
         # Broadcast SSID                                 : Enabled
-        p_broadcast = re.compile(r"^Broadcast\s+SSID\s+:\s+(?P<value>\S+)$")
+        p_broadcast = regex_engine.compile(r"^Broadcast\s+SSID\s+:\s+(?P<value>\S+)$")
 
         # Advertise-Apname                               : Disabled
-        p_advertise = re.compile(r"^Advertise-Apname\s+:\s+(?P<value>\S+)$")
+        p_advertise = regex_engine.compile(r"^Advertise-Apname\s+:\s+(?P<value>\S+)$")
 
         # Universal AP Admin                             : Disabled
-        p_universal_admin = re.compile(r"^Universal\s+AP\s+Admin\s+:\s+(?P<value>\S+)$")
+        p_universal_admin = regex_engine.compile(r"^Universal\s+AP\s+Admin\s+:\s+(?P<value>\S+)$")
 
         # Max Associated Clients per WLAN                : 0
-        p_max_clients_wlan = re.compile(r"^Max\s+Associated\s+Clients\s+per\s+WLAN\s+:\s+(?P<value>\d+)$")
+        p_max_clients_wlan = regex_engine.compile(r"^Max\s+Associated\s+Clients\s+per\s+WLAN\s+:\s+(?P<value>\d+)$")
 
         # Max Associated Clients per AP per WLAN         : 0
-        p_max_clients_ap = re.compile(r"^Max\s+Associated\s+Clients\s+per\s+AP\s+per\s+WLAN\s+:\s+(?P<value>\d+)$")
+        p_max_clients_ap = regex_engine.compile(r"^Max\s+Associated\s+Clients\s+per\s+AP\s+per\s+WLAN\s+:\s+(?P<value>\d+)$")
 
         # Max Associated Clients per AP Radio per WLAN   : 200
-        p_max_clients_radio = re.compile(r"^Max\s+Associated\s+Clients\s+per\s+AP\s+Radio\s+per\s+WLAN\s+:\s+(?P<value>\d+)$")
+        p_max_clients_radio = regex_engine.compile(r"^Max\s+Associated\s+Clients\s+per\s+AP\s+Radio\s+per\s+WLAN\s+:\s+(?P<value>\d+)$")
 
         # OKC                                            : Enabled
-        p_okc = re.compile(r"^OKC\s+:\s+(?P<value>\S+)$")
+        p_okc = regex_engine.compile(r"^OKC\s+:\s+(?P<value>\S+)$")
 
         # Number of Active Clients                       : 4
-        p_active_clients = re.compile(r"^Number\s+of\s+Active\s+Clients\s+:\s+(?P<value>\d+)$")
+        p_active_clients = regex_engine.compile(r"^Number\s+of\s+Active\s+Clients\s+:\s+(?P<value>\d+)$")
 
         # CHD per WLAN                                   : Enabled
-        p_chd = re.compile(r"^CHD\s+per\s+WLAN\s+:\s+(?P<value>\S+)$")
+        p_chd = regex_engine.compile(r"^CHD\s+per\s+WLAN\s+:\s+(?P<value>\S+)$")
 
         # WMM                                            : Allowed
-        p_wmm = re.compile(r"^WMM\s+:\s+(?P<value>\S+)$")
+        p_wmm = regex_engine.compile(r"^WMM\s+:\s+(?P<value>\S+)$")
 
         # WiFi Direct Policy                             : Disabled
-        p_direct_policy = re.compile(r"^WiFi\s+Direct\s+Policy\s+:\s+(?P<value>\S+)$")
+        p_direct_policy = regex_engine.compile(r"^WiFi\s+Direct\s+Policy\s+:\s+(?P<value>\S+)$")
 
         # Channel Scan Defer Priority:
-        p_channel_scan = re.compile(r"Channel\s+Scan\s+Defer\s+Priority:$")
+        p_channel_scan = regex_engine.compile(r"Channel\s+Scan\s+Defer\s+Priority:$")
 
         # Priority (default)                           : 5
         # Priority (default)                           : 6
-        p_priority = re.compile(r"^Priority\s+\(default\)\s+:\s+(?P<value>\d+)$")
+        p_priority = regex_engine.compile(r"^Priority\s+\(default\)\s+:\s+(?P<value>\d+)$")
 
         # Scan Defer Time (msecs)                        : 100
-        p_scan_defer = re.compile(r"^Scan\s+Defer\s+Time\s+\(msecs\)\s+:\s+(?P<value>\d+)$")
+        p_scan_defer = regex_engine.compile(r"^Scan\s+Defer\s+Time\s+\(msecs\)\s+:\s+(?P<value>\d+)$")
 
         # Media Stream Multicast-direct                  : Disabled
-        p_media_multi = re.compile(r"^Media\s+Stream\s+Multicast-direct\s+:\s+(?P<value>\S+)$")
+        p_media_multi = regex_engine.compile(r"^Media\s+Stream\s+Multicast-direct\s+:\s+(?P<value>\S+)$")
 
         # CCX - AironetIe Support                        : Disabled
-        p_ccx_aironet = re.compile(r"^CCX\s+-\s+AironetIe\s+Support\s+:\s+(?P<value>\S+)$")
+        p_ccx_aironet = regex_engine.compile(r"^CCX\s+-\s+AironetIe\s+Support\s+:\s+(?P<value>\S+)$")
 
         # Peer-to-Peer Blocking Action                   : Disabled
-        p_p2p_block = re.compile(r"^Peer-to-Peer\s+Blocking\s+Action\s+:\s+(?P<value>\S+)$")
+        p_p2p_block = regex_engine.compile(r"^Peer-to-Peer\s+Blocking\s+Action\s+:\s+(?P<value>\S+)$")
 
         # Radio Policy                                   : 802.11a only
-        p_radio_policy = re.compile(r"^Radio\s+Policy\s+:\s+(?P<value>.*)$")
+        p_radio_policy = regex_engine.compile(r"^Radio\s+Policy\s+:\s+(?P<value>.*)$")
 
         # DTIM period for 802.11a radio                  :
-        p_dtim_a = re.compile(r"^DTIM\s+period\s+for\s+802.11a\s+radio\s+:\s+(?P<value>.*)$")
+        p_dtim_a = regex_engine.compile(r"^DTIM\s+period\s+for\s+802.11a\s+radio\s+:\s+(?P<value>.*)$")
 
         # DTIM period for 802.11b radio                  :
-        p_dtim_b = re.compile(r"^DTIM\s+period\s+for\s+802.11b\s+radio\s+:\s+(?P<value>.*)$")
+        p_dtim_b = regex_engine.compile(r"^DTIM\s+period\s+for\s+802.11b\s+radio\s+:\s+(?P<value>.*)$")
 
         # Local EAP Authentication                       : Disabled
-        p_local_eap = re.compile(r"^Local\s+EAP\s+Authentication\s+:\s+(?P<value>\S+)$")
+        p_local_eap = regex_engine.compile(r"^Local\s+EAP\s+Authentication\s+:\s+(?P<value>\S+)$")
 
         # Mac Filter Authorization list name             : Disabled
-        p_mac_filter_auth = re.compile(r"^Mac\s+Filter\s+Authorization\s+list\s+name\s+:\s+(?P<value>\S+)$")
+        p_mac_filter_auth = regex_engine.compile(r"^Mac\s+Filter\s+Authorization\s+list\s+name\s+:\s+(?P<value>\S+)$")
 
         # Mac Filter Override Authorization list name    : Disabled
-        p_mac_filter_override = re.compile(r"^Mac\s+Filter\s+Override\s+Authorization\s+list\s+name\s+:\s+(?P<value>\S+)$")
+        p_mac_filter_override = regex_engine.compile(r"^Mac\s+Filter\s+Override\s+Authorization\s+list\s+name\s+:\s+(?P<value>\S+)$")
 
         # Accounting list name                           :
-        p_accounting_list = re.compile(r"^Accounting\s+list\s+name\s+:\s+(?P<value>.*)$")
+        p_accounting_list = regex_engine.compile(r"^Accounting\s+list\s+name\s+:\s+(?P<value>.*)$")
 
         # 802.1x authentication list name                : default
-        p_dot1x_authen = re.compile(r"^802.1x\s+authentication\s+list\s+name\s+:\s+(?P<value>\S+)$")
+        p_dot1x_authen = regex_engine.compile(r"^802.1x\s+authentication\s+list\s+name\s+:\s+(?P<value>\S+)$")
 
         # 802.1x authorization list name                 : Disabled
-        p_dot1x_author = re.compile(r"^802.1x\s+authorization\s+list\s+name\s+:\s+(?P<value>\S+)$")
+        p_dot1x_author = regex_engine.compile(r"^802.1x\s+authorization\s+list\s+name\s+:\s+(?P<value>\S+)$")
 
         # Security
-        p_security = re.compile(r"^Security$")
+        p_security = regex_engine.compile(r"^Security$")
 
         # 802.11 Authentication                      : Open System
-        p_dot11_authen = re.compile(r"^802.11\s+Authentication\s+:\s+(?P<value>.*)$")
+        p_dot11_authen = regex_engine.compile(r"^802.11\s+Authentication\s+:\s+(?P<value>.*)$")
 
         # Static WEP Keys                            : Disabled
-        p_static_wep = re.compile(r"^Static\s+WEP\s+Keys\s+:\s+(?P<value>.*)$")
+        p_static_wep = regex_engine.compile(r"^Static\s+WEP\s+Keys\s+:\s+(?P<value>.*)$")
 
         # Wi-Fi Protected Access (WPA/WPA2/WPA3)     : Enabled
-        p_pro_access = re.compile(r"^Wi-Fi\s+Protected\s+Access\s+\(WPA\/WPA2\/WPA3\)\s+:\s+(?P<value>\S+)$")
+        p_pro_access = regex_engine.compile(r"^Wi-Fi\s+Protected\s+Access\s+\(WPA\/WPA2\/WPA3\)\s+:\s+(?P<value>\S+)$")
 
         # WPA (SSN IE)                           : Disabled
-        p_wpa_ssn = re.compile(r"^WPA\s+\(SSN\s+IE\)\s+:\s+(?P<value>\S+)$")
+        p_wpa_ssn = regex_engine.compile(r"^WPA\s+\(SSN\s+IE\)\s+:\s+(?P<value>\S+)$")
 
         # WPA2 (RSN IE)                          : Enabled
-        p_wpa2_rsn = re.compile(r"^WPA2\s+\(RSN\s+IE\)\s+:\s+(?P<value>\S+)$")
+        p_wpa2_rsn = regex_engine.compile(r"^WPA2\s+\(RSN\s+IE\)\s+:\s+(?P<value>\S+)$")
 
         # MPSK                               : Disabled
-        p_mpsk = re.compile(r"^MPSK\s+:\s+(?P<value>\S+)$")
+        p_mpsk = regex_engine.compile(r"^MPSK\s+:\s+(?P<value>\S+)$")
 
         # AES Cipher                         : Enabled
-        p_aes = re.compile(r"^AES\s+Cipher\s+:\s+(?P<value>\S+)$")
+        p_aes = regex_engine.compile(r"^AES\s+Cipher\s+:\s+(?P<value>\S+)$")
 
         # CCMP256 Cipher                     : Disabled
-        p_ccmp256 = re.compile(r"^CCMP256\s+Cipher\s+:\s+(?P<value>\S+)$")
+        p_ccmp256 = regex_engine.compile(r"^CCMP256\s+Cipher\s+:\s+(?P<value>\S+)$")
 
         # GCMP128 Cipher                     : Disabled
-        p_gcmp128 = re.compile(r"^GCMP128\s+Cipher\s+:\s+(?P<value>\S+)$")
+        p_gcmp128 = regex_engine.compile(r"^GCMP128\s+Cipher\s+:\s+(?P<value>\S+)$")
 
         # GCMP256 Cipher                     : Disabled
-        p_gcmp256 = re.compile(r"^GCMP256\s+Cipher\s+:\s+(?P<value>\S+)$")
+        p_gcmp256 = regex_engine.compile(r"^GCMP256\s+Cipher\s+:\s+(?P<value>\S+)$")
 
         # Randomized GTK                     : Disabled
-        p_gtk = re.compile(r"^Randomized\s+GTK\s+:\s+(?P<value>\S+)$")
+        p_gtk = regex_engine.compile(r"^Randomized\s+GTK\s+:\s+(?P<value>\S+)$")
 
         # WPA3 (WPA3 IE)                         : Disabled
-        p_wpa3 = re.compile(r"^WPA3\s+\(WPA3\s+IE\)\s+:\s+(?P<value>\S+)$")
+        p_wpa3 = regex_engine.compile(r"^WPA3\s+\(WPA3\s+IE\)\s+:\s+(?P<value>\S+)$")
 
         # Auth Key Management
-        p_auth_key_mgmt = re.compile(r"^Auth\s+Key\s+Management$")
+        p_auth_key_mgmt = regex_engine.compile(r"^Auth\s+Key\s+Management$")
 
         # 802.1x                             : Enabled
-        p_key_dot1x = re.compile(r"^802.1x\s+:\s+(?P<value>\S+)$")
+        p_key_dot1x = regex_engine.compile(r"^802.1x\s+:\s+(?P<value>\S+)$")
 
         # PSK                                : Disabled
-        p_key_psk = re.compile(r"^PSK\s+:\s+(?P<value>\S+)$")
+        p_key_psk = regex_engine.compile(r"^PSK\s+:\s+(?P<value>\S+)$")
 
         # CCKM                               : Disabled
-        p_key_cckm = re.compile(r"^CCKM\s+:\s+(?P<value>\S+)$")
+        p_key_cckm = regex_engine.compile(r"^CCKM\s+:\s+(?P<value>\S+)$")
 
         # FT dot1x                           : Disabled
-        p_key_ftdot1x = re.compile(r"^FT\s+dot1x\s+:\s+(?P<value>\S+)$")
+        p_key_ftdot1x = regex_engine.compile(r"^FT\s+dot1x\s+:\s+(?P<value>\S+)$")
 
         # FT PSK                             : Disabled
-        p_key_ftpsk = re.compile(r"^FT\s+PSK\s+:\s+(?P<value>\S+)$")
+        p_key_ftpsk = regex_engine.compile(r"^FT\s+PSK\s+:\s+(?P<value>\S+)$")
 
         # Dot1x-SHA256                       : Disabled
-        p_key_dot1xsha = re.compile(r"^Dot1x-SHA256\s+:\s+(?P<value>\S+)$")
+        p_key_dot1xsha = regex_engine.compile(r"^Dot1x-SHA256\s+:\s+(?P<value>\S+)$")
 
         # PSK-SHA256                         : Disabled
-        p_key_psksha = re.compile(r"^PSK-SHA256\s+:\s+(?P<value>\S+)$")
+        p_key_psksha = regex_engine.compile(r"^PSK-SHA256\s+:\s+(?P<value>\S+)$")
 
         # SAE                                : Disabled
-        p_key_sae = re.compile(r"^SAE\s+:\s+(?P<value>\S+)$")
+        p_key_sae = regex_engine.compile(r"^SAE\s+:\s+(?P<value>\S+)$")
 
         # OWE                                : Disabled
-        p_key_owe = re.compile(r"^OWE\s+:\s+(?P<value>\S+)$")
+        p_key_owe = regex_engine.compile(r"^OWE\s+:\s+(?P<value>\S+)$")
 
         # SUITEB-1X                          : Disabled
-        p_key_suiteb = re.compile(r"^SUITEB-1X\s+:\s+(?P<value>\S+)$")
+        p_key_suiteb = regex_engine.compile(r"^SUITEB-1X\s+:\s+(?P<value>\S+)$")
 
         # SUITEB192-1X                       : Disabled
-        p_key_suiteb192 = re.compile(r"^SUITEB192-1X\s+:\s+(?P<value>\S+)$")
+        p_key_suiteb192 = regex_engine.compile(r"^SUITEB192-1X\s+:\s+(?P<value>\S+)$")
 
         # CCKM TSF Tolerance (msecs)                 : 1000
-        p_cckm_tsf_msec = re.compile(r"^CCKM\s+TSF\s+Tolerance\s+\(msecs\)\s+:\s+(?P<value>\d+)$")
+        p_cckm_tsf_msec = regex_engine.compile(r"^CCKM\s+TSF\s+Tolerance\s+\(msecs\)\s+:\s+(?P<value>\d+)$")
 
         # CCKM TSF Tolerance                 : 1000
-        p_cckm_tsf = re.compile(r"^CCKM\s+TSF\s+Tolerance\s+:\s+(?P<value>\d+)$")
+        p_cckm_tsf = regex_engine.compile(r"^CCKM\s+TSF\s+Tolerance\s+:\s+(?P<value>\d+)$")
 
         # OWE Transition Mode                        : Disabled
-        p_owe_transition = re.compile(r"^OWE\s+Transition\s+Mode\s+:\s+(?P<value>\S+)$")
+        p_owe_transition = regex_engine.compile(r"^OWE\s+Transition\s+Mode\s+:\s+(?P<value>\S+)$")
 
         # OSEN                                       : Disabled
-        p_osen = re.compile(r"^OSEN\s+:\s+(?P<value>\S+)$")
+        p_osen = regex_engine.compile(r"^OSEN\s+:\s+(?P<value>\S+)$")
 
         # FT Support                                 : Adaptive
-        p_ftsupport = re.compile(r"^FT\s+Support\s+:\s+(?P<value>\S+)$")
+        p_ftsupport = regex_engine.compile(r"^FT\s+Support\s+:\s+(?P<value>\S+)$")
 
         # FT Reassociation Timeout (secs)        : 20
-        p_ft_re_timeout_secs = re.compile(r"^FT\s+Reassociation\s+Timeout\s+\(secs\)\s+:\s+(?P<value>\d+)$")
+        p_ft_re_timeout_secs = regex_engine.compile(r"^FT\s+Reassociation\s+Timeout\s+\(secs\)\s+:\s+(?P<value>\d+)$")
 
         # FT Reassociation Timeout        : 20
-        p_ft_re_timeout = re.compile(r"^FT\s+Reassociation\s+Timeout\s+:\s+(?P<value>\d+)$")
+        p_ft_re_timeout = regex_engine.compile(r"^FT\s+Reassociation\s+Timeout\s+:\s+(?P<value>\d+)$")
 
         # FT Over-The-DS mode                    : Disabled
-        p_ft_dst = re.compile(r"^FT\s+Over-The-DS\s+mode\s+:\s+(?P<value>\S+)$")
+        p_ft_dst = regex_engine.compile(r"^FT\s+Over-The-DS\s+mode\s+:\s+(?P<value>\S+)$")
 
         # PMF Support                                : Disabled
-        p_pmf = re.compile(r"^PMF\s+Support\s+:\s+(?P<value>\S+)$")
+        p_pmf = regex_engine.compile(r"^PMF\s+Support\s+:\s+(?P<value>\S+)$")
 
         # PMF Association Comeback Timeout (secs): 1
-        p_association_comeback_secs = re.compile(r"^PMF\s+Association\s+Comeback\s+Timeout\s+\(secs\):\s+(?P<value>\d+)$")
+        p_association_comeback_secs = regex_engine.compile(r"^PMF\s+Association\s+Comeback\s+Timeout\s+\(secs\):\s+(?P<value>\d+)$")
 
         # PMF Association Comeback Timeout : 1
-        p_association_comeback = re.compile(r"^PMF\s+Association\s+Comeback\s+Timeout\s+:\s+(?P<value>\d+)$")
+        p_association_comeback = regex_engine.compile(r"^PMF\s+Association\s+Comeback\s+Timeout\s+:\s+(?P<value>\d+)$")
 
         # PMF SA Query Time (msecs)              : 200
-        p_pmf_sa_msecs = re.compile(r"^PMF\s+SA\s+Query\s+Time\s+\(msecs\)\s+:\s+(?P<value>\d+)$")
+        p_pmf_sa_msecs = regex_engine.compile(r"^PMF\s+SA\s+Query\s+Time\s+\(msecs\)\s+:\s+(?P<value>\d+)$")
 
         # PMF SA Query Time              : 200
-        p_pmf_sa = re.compile(r"^PMF\s+SA\s+Query\s+Time\s+:\s+(?P<value>\d+)$")
+        p_pmf_sa = regex_engine.compile(r"^PMF\s+SA\s+Query\s+Time\s+:\s+(?P<value>\d+)$")
 
         # Web Based Authentication                   : Disabled
-        p_web_authen = re.compile(r"^Web\s+Based\s+Authentication\s+:\s+(?P<value>\S+)$")
+        p_web_authen = regex_engine.compile(r"^Web\s+Based\s+Authentication\s+:\s+(?P<value>\S+)$")
 
         # Conditional Web Redirect                   : Disabled
-        p_web_redirect = re.compile(r"^Conditional\s+Web\s+Redirect\s+:\s+(?P<value>\S+)$")
+        p_web_redirect = regex_engine.compile(r"^Conditional\s+Web\s+Redirect\s+:\s+(?P<value>\S+)$")
 
         # Splash-Page Web Redirect                   : Disabled
-        p_splash_page = re.compile(r"^Splash-Page\s+Web\s+Redirect\s+:\s+(?P<value>\S+)$")
+        p_splash_page = regex_engine.compile(r"^Splash-Page\s+Web\s+Redirect\s+:\s+(?P<value>\S+)$")
 
         # Webauth On-mac-filter Failure              : Disabled
-        p_webauth_mac = re.compile(r"^Webauth\s+On-mac-filter\s+Failure\s+:\s+(?P<value>\S+)$")
+        p_webauth_mac = regex_engine.compile(r"^Webauth\s+On-mac-filter\s+Failure\s+:\s+(?P<value>\S+)$")
 
         # Webauth Authentication List Name           : Disabled
-        p_webauthen_list = re.compile(r"^Webauth\s+Authentication\s+List\s+Name\s+:\s+(?P<value>\S+)$")
+        p_webauthen_list = regex_engine.compile(r"^Webauth\s+Authentication\s+List\s+Name\s+:\s+(?P<value>\S+)$")
 
         # Webauth Authorization List Name            : Disabled
-        p_webauthor_list = re.compile(r"^Webauth\s+Authorization\s+List\s+Name\s+:\s+(?P<value>\S+)$")
+        p_webauthor_list = regex_engine.compile(r"^Webauth\s+Authorization\s+List\s+Name\s+:\s+(?P<value>\S+)$")
 
         # Webauth Parameter Map                      : Disabled
-        p_webauthen_map = re.compile(r"^Webauth\s+Parameter\s+Map\s+:\s+(?P<value>\S+)$")
+        p_webauthen_map = regex_engine.compile(r"^Webauth\s+Parameter\s+Map\s+:\s+(?P<value>\S+)$")
 
         # Band Select                                    : Disabled
-        p_band_select = re.compile(r"^Band\s+Select\s+:\s+(?P<value>\S+)$")
+        p_band_select = regex_engine.compile(r"^Band\s+Select\s+:\s+(?P<value>\S+)$")
 
         # Load Balancing                                 : Disabled
-        p_load_balancing = re.compile(r"^Load\s+Balancing\s+:\s+(?P<value>\S+)$")
+        p_load_balancing = regex_engine.compile(r"^Load\s+Balancing\s+:\s+(?P<value>\S+)$")
 
         # Multicast Buffer                               : Disabled
-        p_multi_buffer = re.compile(r"^Multicast\s+Buffer\s+:\s+(?P<value>\S+)$")
+        p_multi_buffer = regex_engine.compile(r"^Multicast\s+Buffer\s+:\s+(?P<value>\S+)$")
 
         # Multicast Buffers (frames)                     : 0
-        p_multi_buffer_frames = re.compile(r"^Multicast\s+Buffers?\s+\(frames\)\s+:\s+(?P<value>\d+)$")
+        p_multi_buffer_frames = regex_engine.compile(r"^Multicast\s+Buffers?\s+\(frames\)\s+:\s+(?P<value>\d+)$")
 
         # Multicast Buffer Size                          : 0
-        p_multi_buffer_size = re.compile(r"^Multicast\s+Buffer\s+Size\s+:\s+(?P<value>\d+)$")
+        p_multi_buffer_size = regex_engine.compile(r"^Multicast\s+Buffer\s+Size\s+:\s+(?P<value>\d+)$")
 
         # IP Source Guard                                : Disabled
-        p_ip_sourceguard = re.compile(r"^IP\s+Source\s+Guard\s+:\s+(?P<value>\S+)$")
+        p_ip_sourceguard = regex_engine.compile(r"^IP\s+Source\s+Guard\s+:\s+(?P<value>\S+)$")
 
         # Assisted-Roaming
-        p_assisted_roaming = re.compile(r"^Assisted-Roaming$")
+        p_assisted_roaming = regex_engine.compile(r"^Assisted-Roaming$")
 
         # Neighbor List                              : Enabled
-        p_ar_neighbor_list = re.compile(r"^Neighbor\s+List\s+:\s+(?P<value>\S+)$")
+        p_ar_neighbor_list = regex_engine.compile(r"^Neighbor\s+List\s+:\s+(?P<value>\S+)$")
 
         # Prediction List                            : Disabled
-        p_ar_prediction = re.compile(r"^Prediction\s+List\s+:\s+(?P<value>\S+)$")
+        p_ar_prediction = regex_engine.compile(r"^Prediction\s+List\s+:\s+(?P<value>\S+)$")
 
         # Dual Band Support                          : Disabled
-        p_ar_db = re.compile(r"^Dual\s+Band\s+Support\s+:\s+(?P<value>\S+)$")
+        p_ar_db = regex_engine.compile(r"^Dual\s+Band\s+Support\s+:\s+(?P<value>\S+)$")
 
         # IEEE 802.11v parameters
-        p_ieee_11v = re.compile(r"^IEEE\s+802.11v\s+parameters$")
+        p_ieee_11v = regex_engine.compile(r"^IEEE\s+802.11v\s+parameters$")
 
         # Directed Multicast Service                 : Enabled
-        p_11v_multicast = re.compile(r"^Directed\s+Multicast\s+Service\s+:\s+(?P<value>\S+)$")
+        p_11v_multicast = regex_engine.compile(r"^Directed\s+Multicast\s+Service\s+:\s+(?P<value>\S+)$")
 
         # BSS Max Idle                               : Enabled
-        p_11v_bss = re.compile(r"^BSS\s+Max\s+Idle\s+:\s+(?P<value>\S+)$")
+        p_11v_bss = regex_engine.compile(r"^BSS\s+Max\s+Idle\s+:\s+(?P<value>\S+)$")
 
         # Protected Mode                         : Disabled
-        p_11v_bss_protected = re.compile(r"^Protected\s+Mode\s+:\s+(?P<value>\S+)$")
+        p_11v_bss_protected = regex_engine.compile(r"^Protected\s+Mode\s+:\s+(?P<value>\S+)$")
 
         # Traffic Filtering Service                  : Disabled
-        p_11v_filtering = re.compile(r"^Traffic\s+Filtering\s+Service\s+:\s+(?P<value>\S+)$")
+        p_11v_filtering = regex_engine.compile(r"^Traffic\s+Filtering\s+Service\s+:\s+(?P<value>\S+)$")
 
         # BSS Transition                             : Enabled
-        p_11v_bss_trans = re.compile(r"^BSS\s+Transition\s+:\s+(?P<value>\S+)$")
+        p_11v_bss_trans = regex_engine.compile(r"^BSS\s+Transition\s+:\s+(?P<value>\S+)$")
 
         # Disassociation Imminent                : Disabled
-        p_11v_bss_trans_disassoc = re.compile(r"^Disassociation\s+Imminent\s+:\s+(?P<value>\S+)$")
+        p_11v_bss_trans_disassoc = regex_engine.compile(r"^Disassociation\s+Imminent\s+:\s+(?P<value>\S+)$")
 
         # Optimised Roaming Timer (TBTTS)    : 40
-        p_11v_bss_trans_disassoc_tbtts = re.compile(r"^Optimised\s+Roaming\s+Timer\s+\(TBTTS\)\s+:\s+(?P<value>\d+)$")
+        p_11v_bss_trans_disassoc_tbtts = regex_engine.compile(r"^Optimised\s+Roaming\s+Timer\s+\(TBTTS\)\s+:\s+(?P<value>\d+)$")
 
         # Timer (TBTTS)                      : 200
-        p_11v_bss_trans_disassoc_timer = re.compile(r"^Timer\s+\(TBTTS\)\s+:\s+(?P<value>\d+)$")
+        p_11v_bss_trans_disassoc_timer = regex_engine.compile(r"^Timer\s+\(TBTTS\)\s+:\s+(?P<value>\d+)$")
 
         # Optimised Roaming Timer (TBTTS)    : 40
-        p_11v_bss_trans_disassoc_tbtts_extra = re.compile(r"^Optimised\s+Roaming\s+Timer\s+\(TBTTS\)\s+:\s+(?P<value>\d+)$")
+        p_11v_bss_trans_disassoc_tbtts_extra = regex_engine.compile(r"^Optimised\s+Roaming\s+Timer\s+\(TBTTS\)\s+:\s+(?P<value>\d+)$")
 
         # Timer (TBTTS)                      : 200
-        p_11v_bss_trans_disassoc_timer_extra = re.compile(r"^Timer\s+\(TBTTS\)\s+:\s+(?P<value>\d+)$")
+        p_11v_bss_trans_disassoc_timer_extra = regex_engine.compile(r"^Timer\s+\(TBTTS\)\s+:\s+(?P<value>\d+)$")
 
         # Optimised Roaming Timer    : 40
-        p_11v_bss_trans_disassoc_tbtts = re.compile(r"^Optimised\s+Roaming\s+Timer\s+:\s+(?P<value>\d+)$")
+        p_11v_bss_trans_disassoc_tbtts = regex_engine.compile(r"^Optimised\s+Roaming\s+Timer\s+:\s+(?P<value>\d+)$")
 
         # Timer                       : 200
-        p_11v_bss_trans_disassoc_timer = re.compile(r"^Timer\s+:\s+(?P<value>\d+)$")
+        p_11v_bss_trans_disassoc_timer = regex_engine.compile(r"^Timer\s+:\s+(?P<value>\d+)$")
 
         # Dual Neighbor List                     : Disabled
-        p_11v_dual_neighbor = re.compile(r"^Dual\s+Neighbor\s+List\s+:\s+(?P<value>\S+)$")
+        p_11v_dual_neighbor = regex_engine.compile(r"^Dual\s+Neighbor\s+List\s+:\s+(?P<value>\S+)$")
 
         # WNM Sleep Mode                             : Disabled
-        p_11v_wnm = re.compile(r"^WNM\s+Sleep\s+Mode\s+:\s+(?P<value>\S+)$")
+        p_11v_wnm = regex_engine.compile(r"^WNM\s+Sleep\s+Mode\s+:\s+(?P<value>\S+)$")
 
         # 802.11ac MU-MIMO                               : Enabled
-        p_11ac_mimo = re.compile(r"^802.11ac\s+MU-MIMO\s+:\s+(?P<value>\S+)$")
+        p_11ac_mimo = regex_engine.compile(r"^802.11ac\s+MU-MIMO\s+:\s+(?P<value>\S+)$")
 
         # 802.11ax parameters
-        p_11ax_params = re.compile(r"^802.11ax\s+parameters$")
+        p_11ax_params = regex_engine.compile(r"^802.11ax\s+parameters$")
 
         # OFDMA Downlink                             : Enabled
-        p_11ax_ofdma_down = re.compile(r"^OFDMA\s+Downlink\s+:\s+(?P<value>\S+)$")
+        p_11ax_ofdma_down = regex_engine.compile(r"^OFDMA\s+Downlink\s+:\s+(?P<value>\S+)$")
 
         # OFDMA Uplink                               : Enabled
-        p_11ax_ofdma_up = re.compile(r"^OFDMA\s+Uplink\s+:\s+(?P<value>\S+)$")
+        p_11ax_ofdma_up = regex_engine.compile(r"^OFDMA\s+Uplink\s+:\s+(?P<value>\S+)$")
 
         # MU-MIMO Downlink                           : Enabled
-        p_11ax_mimo_down = re.compile(r"^MU-MIMO\s+Downlink\s+:\s+(?P<value>\S+)$")
+        p_11ax_mimo_down = regex_engine.compile(r"^MU-MIMO\s+Downlink\s+:\s+(?P<value>\S+)$")
 
         # MU-MIMO Uplink                             : Enabled
-        p_11ax_mimo_up = re.compile(r"^MU-MIMO\s+Uplink\s+:\s+(?P<value>\S+)$")
+        p_11ax_mimo_up = regex_engine.compile(r"^MU-MIMO\s+Uplink\s+:\s+(?P<value>\S+)$")
 
         # BSS Target Wake Up Time                    : Enabled
-        p_11ax_bss = re.compile(r"^BSS\s+Target\s+Wake\s+Up\s+Time\s+:\s+(?P<value>\S+)$")
+        p_11ax_bss = regex_engine.compile(r"^BSS\s+Target\s+Wake\s+Up\s+Time\s+:\s+(?P<value>\S+)$")
 
         # BSS Target Wake Up Time Broadcast Support  : Enabled
-        p_11ax_bss_broad = re.compile(r"^BSS\s+Target\s+Wake\s+Up\s+Time\s+Broadcast\s+Support\s+:\s+(?P<value>\S+)$")
+        p_11ax_bss_broad = regex_engine.compile(r"^BSS\s+Target\s+Wake\s+Up\s+Time\s+Broadcast\s+Support\s+:\s+(?P<value>\S+)$")
 
         # mDNS Gateway Status                            : Bridge
-        p_mdns = re.compile(r"^mDNS\s+Gateway\s+Status\s+:\s+(?P<value>\S+)$")
+        p_mdns = regex_engine.compile(r"^mDNS\s+Gateway\s+Status\s+:\s+(?P<value>\S+)$")
 
         # WIFI Alliance Agile Multiband                  : Disabled
-        p_wifi_alliance = re.compile(r"^WIFI\s+Alliance\s+Agile\s+Multiband\s+:\s+(?P<value>\S+)$")
+        p_wifi_alliance = regex_engine.compile(r"^WIFI\s+Alliance\s+Agile\s+Multiband\s+:\s+(?P<value>\S+)$")
 
         # Device Analytics
-        p_device_analytics = re.compile(r"^Device\s+Analytics$")
+        p_device_analytics = regex_engine.compile(r"^Device\s+Analytics$")
 
         # Advertise Support                          : Enabled
-        p_da_advetise = re.compile(r"^Advertise\s+Support\s+:\s+(?P<value>\S+)$")
+        p_da_advetise = regex_engine.compile(r"^Advertise\s+Support\s+:\s+(?P<value>\S+)$")
 
         # Share Data with Client                     : Disabled
-        p_da_share = re.compile(r"^Share\s+Data\s+with\s+Client\s+:\s+(?P<value>\S+)$")
+        p_da_share = regex_engine.compile(r"^Share\s+Data\s+with\s+Client\s+:\s+(?P<value>\S+)$")
 
         # Client Scan Report (11k Beacon Radio Measurement)
-        p_client_11k = re.compile(r"^Client\s+Scan\s+Report\s+\(11k\s+Beacon\s+Radio\s+Measurement\)$")
+        p_client_11k = regex_engine.compile(r"^Client\s+Scan\s+Report\s+\(11k\s+Beacon\s+Radio\s+Measurement\)$")
 
         # Request on Association                     : Disabled
-        p_client_11k_assoc = re.compile(r"^Request\s+on\s+Association\s+:\s+(?P<value>\S+)$")
+        p_client_11k_assoc = regex_engine.compile(r"^Request\s+on\s+Association\s+:\s+(?P<value>\S+)$")
 
         # Request on Roam                            : Disabled
-        p_client_11k_roam = re.compile(r"^Request\s+on\s+Roam\s+:\s+(?P<value>\S+)$")
+        p_client_11k_roam = regex_engine.compile(r"^Request\s+on\s+Roam\s+:\s+(?P<value>\S+)$")
 
         # WiFi to Cellular Steering                      : Disabled
-        P_wifi_steering = re.compile(r"^WiFi\s+to\s+Cellular\s+Steering\s+:\s+(?P<value>\S+)$")
+        P_wifi_steering = regex_engine.compile(r"^WiFi\s+to\s+Cellular\s+Steering\s+:\s+(?P<value>\S+)$")
 
 
         wlan_dict = {}
@@ -1617,19 +1620,19 @@ class ShowWlanIdClientStats(ShowWlanIdClientStatsSchema):
         #     Mobility peer delete                                            : 0
         #     NACK IFID mismatch                                              : 0
 
-        wlan_info_capture = re.compile(
+        wlan_info_capture = regex_engine.compile(
             # Wlan Profile Name: lizzard_Global, Wlan Id: 17
             r"^Wlan Profile Name:\s+(?P<profile_name>\S+), Wlan Id: (?P<wlan_id>\d+)$"
         )
 
         # Current client state statistics:
-        client_stats_capture = re.compile(r"^Current client state statistics:$")
+        client_stats_capture = regex_engine.compile(r"^Current client state statistics:$")
 
         # Total client delete reasons
-        client_delete_capture = re.compile(r"^Total client delete reasons$")
+        client_delete_capture = regex_engine.compile(r"^Total client delete reasons$")
 
         # key : value
-        key_value_capture = re.compile(r"^(?P<key>[\S\s]+\S)\s*:\s+(?P<value>\d+)$")
+        key_value_capture = regex_engine.compile(r"^(?P<key>[\S\s]+\S)\s*:\s+(?P<value>\d+)$")
         
         header_group = {}
 
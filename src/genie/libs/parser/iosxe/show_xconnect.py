@@ -1,7 +1,6 @@
 """show_xconnect_all.py
 
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -12,6 +11,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                                Default, \
                                                Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowXconnectAllSchema(MetaParser):
     """Schema for show xconnect all"""
@@ -54,7 +56,7 @@ class ShowXconnectAll(ShowXconnectAllSchema):
             # UP pri mpls 10.16.2.2:888                  UP   ac Gi3:9(Ethernet)              UP
             # -- pri  vfi sample-vfi                   UP unkn Invalid Segment              --
             # UP pri   bd 300                          UP  vfi sample-vfi                   UP
-            p1 = re.compile(r'^(?P<xc>(UP|DN|AD|IA|SB|HS|RV|NH|\-\-))\s+(?P<st>(pri|sec))\s+(?P<segment1>.*)\s+(?P<s1>(UP|DN|AD|IA|SB|HS|RV|NH|\-\-))\s+(?P<segment2>.*)\s+(?P<s2>(UP|DN|AD|IA|SB|HS|RV|NH|\-\-))')
+            p1 = regex_engine.compile(r'^(?P<xc>(UP|DN|AD|IA|SB|HS|RV|NH|\-\-))\s+(?P<st>(pri|sec))\s+(?P<segment1>.*)\s+(?P<s1>(UP|DN|AD|IA|SB|HS|RV|NH|\-\-))\s+(?P<segment2>.*)\s+(?P<s2>(UP|DN|AD|IA|SB|HS|RV|NH|\-\-))')
             m = p1.match(line)
             if m:
                 group = m.groupdict()
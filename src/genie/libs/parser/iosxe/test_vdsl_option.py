@@ -5,10 +5,10 @@ IOSXE parsers for the following test commands:
     * 'test vdsl option {option1} {option2}'
 '''
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ==================================================================
@@ -71,58 +71,58 @@ class TestVdslOption(TestVdslOptionSchema):
         ctrl_dict = {}
 
         #Debug flags: 0x8000
-        p1 = re.compile(r'^(Debug\s+flags):\s+(?P<v1>\w+)$')
+        p1 = regex_engine.compile(r'^(Debug\s+flags):\s+(?P<v1>\w+)$')
         
         #Seq 0: slot=0 slot_port=0 bay=0 port=0 Name:MetaMgr0_0_0
-        p2 = re.compile(r'^(Seq\s+\d+):\s+(?P<v1>.+)\s+Name:(?P<v2>\w+)')
+        p2 = regex_engine.compile(r'^(Seq\s+\d+):\s+(?P<v1>.+)\s+Name:(?P<v2>\w+)')
 
         #MetanoiaPort=0 SFP type: 1 State: 2 cnt=290
-        p3 = re.compile(r'^(MetanoiaPort)=(?P<v1>\d+)\s+(SFP\s+type):\s+(?P<v2>\d+)\s+(State):\s+(?P<v3>\d+)\s+(cnt)=(?P<v4>\d+)')
+        p3 = regex_engine.compile(r'^(MetanoiaPort)=(?P<v1>\d+)\s+(SFP\s+type):\s+(?P<v2>\d+)\s+(State):\s+(?P<v3>\d+)\s+(cnt)=(?P<v4>\d+)')
         
         #MAC:00:00:00:00:00:00 Choice:0
-        p4 = re.compile(r'^(MAC):(?P<v1>([0-9a-fA-F].?){12})\s+(Choice):(?P<v2>\d+)')
+        p4 = regex_engine.compile(r'^(MAC):(?P<v1>([0-9a-fA-F].?){12})\s+(Choice):(?P<v2>\d+)')
         
         #hw interface:GigabitEthernet0/0/0 sw interface:GigabitEthernet0/0/0
-        p5 = re.compile(r'^(hw\s+interface):(?P<v1>.+)\s+sw\s+(interface):(?P<v2>.+)')
+        p5 = regex_engine.compile(r'^(hw\s+interface):(?P<v1>.+)\s+sw\s+(interface):(?P<v2>.+)')
         
         #Firmware file: /etc/SFP_V5311-T-R_CSP.b, size=491520, version=1_62_8463
-        p6 = re.compile(r'^(Firmware\s+file):\s+(?P<v1>.*)$')
+        p6 = regex_engine.compile(r'^(Firmware\s+file):\s+(?P<v1>.*)$')
         
         #Upgrade file: [], size=0, version= offset=0x0
-        p7 = re.compile(r'^(Upgrade\s+file):\s+(?P<v1>.*)$')
+        p7 = regex_engine.compile(r'^(Upgrade\s+file):\s+(?P<v1>.*)$')
         
         #Upgrade file info: 
-        p8 = re.compile(r'^(Upgrade\s+file info):(?P<v1>.*)$')
+        p8 = regex_engine.compile(r'^(Upgrade\s+file info):(?P<v1>.*)$')
         
         #SFP version: 1_62_8463
-        p9 = re.compile(r'^(SFP\s+version):\s+(?P<v1>.+)$')
+        p9 = regex_engine.compile(r'^(SFP\s+version):\s+(?P<v1>.+)$')
         
         #Notification Seq: 0x3 cnt: 0x23 Stat Cycle:255 
-        p10 = re.compile(r'^(Notification\s+Seq):\s+(?P<v1>.+)$')     
+        p10 = regex_engine.compile(r'^(Notification\s+Seq):\s+(?P<v1>.+)$')     
 
         #VDSL State: 5
-        p11 = re.compile(r'^(VDSL\s+State):\s+(?P<v1>\d+)$') 
+        p11 = regex_engine.compile(r'^(VDSL\s+State):\s+(?P<v1>\d+)$') 
         
         #EBM Tx: 709799 Rx: 709799
-        p12 = re.compile(r'^(EBM\s+Tx):\s+(?P<v1>\d+)\s+Rx:\s+(?P<v2>\d+)')
+        p12 = regex_engine.compile(r'^(EBM\s+Tx):\s+(?P<v1>\d+)\s+Rx:\s+(?P<v2>\d+)')
         
         #EBM Wait Timeout: 0 Rx Loss: 0
-        p13 = re.compile(r'^(EBM\s+Wait\s+Timeout):\s+(?P<v1>\d+)\s+Rx\s+Loss:\s+(?P<v2>\d+)')
+        p13 = regex_engine.compile(r'^(EBM\s+Wait\s+Timeout):\s+(?P<v1>\d+)\s+Rx\s+Loss:\s+(?P<v2>\d+)')
         
         #G994 vid CO: BDCM CPE: META
-        p14 = re.compile(r'^(.*\s+vid\s+CO):\s+(?P<v1>\w+)\s+CPE:\s+(?P<v2>\w+)')
+        p14 = regex_engine.compile(r'^(.*\s+vid\s+CO):\s+(?P<v1>\w+)\s+CPE:\s+(?P<v2>\w+)')
         
         #Serial No CO: eq_nr multiline_cpe software_rev CPE: MET211611AC V5311TR 1_62_8463
-        p15 = re.compile(r'^(Serial\s+No\s+CO):(?P<v1>.+)\s+CPE:\s+(?P<v2>.+)')
+        p15 = regex_engine.compile(r'^(Serial\s+No\s+CO):(?P<v1>.+)\s+CPE:\s+(?P<v2>.+)')
         
         #Version CO: v11.02.31       CPE: 1_62_8463 MT5311
-        p16 = re.compile(r'^(Version\s+CO):(?P<v1>.+)\s+CPE:\s+(?P<v2>.+)')
+        p16 = regex_engine.compile(r'^(Version\s+CO):(?P<v1>.+)\s+CPE:\s+(?P<v2>.+)')
         
         #Capability CO: 000000000000000200 CPE: 040004000C01000300
-        p17 = re.compile(r'^(Capability\s+CO):(?P<v1>.+)\s+CPE:\s+(?P<v2>.+)')
+        p17 = regex_engine.compile(r'^(Capability\s+CO):(?P<v1>.+)\s+CPE:\s+(?P<v2>.+)')
         
         #Line Attn: UP: 65535 DOWN: 22 
-        p18 = re.compile(r'^(Line\s+Attn:\s+UP):\s+(?P<v1>\d+)\s+DOWN:\s+(?P<v2>\d+)')  
+        p18 = regex_engine.compile(r'^(Line\s+Attn:\s+UP):\s+(?P<v1>\d+)\s+DOWN:\s+(?P<v2>\d+)')  
         
         for line in out.splitlines():
             line = line.strip()
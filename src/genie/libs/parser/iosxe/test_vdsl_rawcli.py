@@ -5,9 +5,9 @@ IOSXE parsers for the following test commands:
     * 'test vdsl rawcli "basic show summary <number>"'
 '''
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ==================================================================
@@ -49,7 +49,7 @@ class TestVdslRawCli(TestVdslRawcliSchema):
 
         #Link time Rate US/DS     Mode      Status    Annex  Profile TxPkts/RxPkts
         #1032746   60014/149783 VDSL2     Showtime  AnnexB 17a     1688269/1654598        
-        p1 = re.compile(r'^(?P<link_time>(\d+))\s+(?P<rate_us>(\d+))\/(?P<rate_ds>(\d+))\s+(?P<mode>([A-Z0-9+-]+))\s+(?P<status>(\w+))\s+(?P<annex>([0-9a-zA-Z]+))\s+(?P<profile>([A-Za-z0-9]+))\s+(?P<txpkts>(\d+))\/(?P<rxpkts>(\d+))$')
+        p1 = regex_engine.compile(r'^(?P<link_time>(\d+))\s+(?P<rate_us>(\d+))\/(?P<rate_ds>(\d+))\s+(?P<mode>([A-Z0-9+-]+))\s+(?P<status>(\w+))\s+(?P<annex>([0-9a-zA-Z]+))\s+(?P<profile>([A-Za-z0-9]+))\s+(?P<txpkts>(\d+))\/(?P<rxpkts>(\d+))$')
               
         for line in out.splitlines():
             line = line.strip()
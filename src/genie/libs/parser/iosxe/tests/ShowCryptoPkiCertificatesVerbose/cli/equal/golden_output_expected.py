@@ -0,0 +1,261 @@
+expected_output = {'trustpoints': {'client': {'certificates': {'certificate': {'status': 'Available',
+                                                             'serial': '02',
+                                                             'usage': 'General '
+                                                                      'Purpose',
+                                                             'issuer': {'common_name': 'ROOT'},
+                                                             'subject': {'name': 'pki-reg7',
+                                                                         'serial_number': '9HI3W7WA3K8'},
+                                                             'validity_date': {'start_date': '21:58:50 '
+                                                                                             'IST '
+                                                                                             'Nov '
+                                                                                             '10 '
+                                                                                             '2021',
+                                                                               'end_date': '21:58:50 '
+                                                                                           'IST '
+                                                                                           'Nov '
+                                                                                           '10 '
+                                                                                           '2022'},
+                                                             'subject_key_info': {'key_algorithm': 'rsaEncryption',
+                                                                                  'key_length': '2048'},
+                                                             'signature_algorithm': 'SHA1 '
+                                                                                    'with '
+                                                                                    'RSA '
+                                                                                    'Encryption',
+                                                             'fingerprint_md5': 'D9E4599D '
+                                                                                'C573463B '
+                                                                                '07F2FBD6 '
+                                                                                '620DB523',
+                                                             'fingerprint_sha1': 'E8E0731C '
+                                                                                 'D31EA142 '
+                                                                                 'A23066D7 '
+                                                                                 '4178D696 '
+                                                                                 '2D9815E0',
+                                                             'key_usage_hex': 'A0000000',
+                                                             'key_usage': {'key_usage_1': 'Digital '
+                                                                                          'Signature',
+                                                                           'key_usage_2': 'Key '
+                                                                                          'Encipherment'},
+                                                             'subject_key_id': '2F6A8670 '
+                                                                               '6934D26E '
+                                                                               'C27965E8 '
+                                                                               '67C70441 '
+                                                                               'BEF2EAFC',
+                                                             'authority_key_id': '31DEF8AC '
+                                                                                 '8ED9E5F0 '
+                                                                                 'CDBC4749 '
+                                                                                 '61BED767 '
+                                                                                 '0CF75DB2',
+                                                             'cert_install_time': '21:58:51 '
+                                                                                  'IST '
+                                                                                  'Nov '
+                                                                                  '10 '
+                                                                                  '2021',
+                                                             'trustpoints': 'client',
+                                                             'key_label': 'client'},
+                                             'ca_certificate': {'status': 'Available',
+                                                                'serial': '01',
+                                                                'usage': 'Signature',
+                                                                'issuer': {'common_name': 'ROOT'},
+                                                                'subject': {'common_name': 'ROOT'},
+                                                                'validity_date': {'start_date': '21:57:41 '
+                                                                                                'IST '
+                                                                                                'Nov '
+                                                                                                '10 '
+                                                                                                '2021',
+                                                                                  'end_date': '21:57:41 '
+                                                                                              'IST '
+                                                                                              'Nov '
+                                                                                              '9 '
+                                                                                              '2024'},
+                                                                'subject_key_info': {'key_algorithm': 'rsaEncryption',
+                                                                                     'key_length': '2048'},
+                                                                'signature_algorithm': 'MD5 '
+                                                                                       'with '
+                                                                                       'RSA '
+                                                                                       'Encryption',
+                                                                'fingerprint_md5': '4465EC15 '
+                                                                                   'A40804EF '
+                                                                                   'B989164B '
+                                                                                   '461B7E42',
+                                                                'fingerprint_sha1': '5C3C2759 '
+                                                                                    '5E925BEA '
+                                                                                    '0B6C8ADE '
+                                                                                    '7844278A '
+                                                                                    '49E2D60B',
+                                                                'key_usage_hex': '86000000',
+                                                                'key_usage': {'key_usage_1': 'Digital '
+                                                                                             'Signature',
+                                                                              'key_usage_2': 'Key '
+                                                                                             'Cert '
+                                                                                             'Sign',
+                                                                              'key_usage_3': 'CRL '
+                                                                                             'Signature'},
+                                                                'subject_key_id': '31DEF8AC '
+                                                                                  '8ED9E5F0 '
+                                                                                  'CDBC4749 '
+                                                                                  '61BED767 '
+                                                                                  '0CF75DB2',
+                                                                'ca_flag': 'TRUE',
+                                                                'authority_key_id': '31DEF8AC '
+                                                                                    '8ED9E5F0 '
+                                                                                    'CDBC4749 '
+                                                                                    '61BED767 '
+                                                                                    '0CF75DB2',
+                                                                'cert_install_time': '21:57:41 '
+                                                                                     'IST '
+                                                                                     'Nov '
+                                                                                     '10 '
+                                                                                     '2021',
+                                                                'trustpoints': 'client '
+                                                                               'ROOT'}}},
+                 'ROOT': {'certificates': {'ca_certificate': {'status': 'Available',
+                                                              'serial': '01',
+                                                              'usage': 'Signature',
+                                                              'issuer': {'common_name': 'ROOT'},
+                                                              'subject': {'common_name': 'ROOT'},
+                                                              'validity_date': {'start_date': '21:57:41 '
+                                                                                              'IST '
+                                                                                              'Nov '
+                                                                                              '10 '
+                                                                                              '2021',
+                                                                                'end_date': '21:57:41 '
+                                                                                            'IST '
+                                                                                            'Nov '
+                                                                                            '9 '
+                                                                                            '2024'},
+                                                              'subject_key_info': {'key_algorithm': 'rsaEncryption',
+                                                                                   'key_length': '2048'},
+                                                              'signature_algorithm': 'MD5 '
+                                                                                     'with '
+                                                                                     'RSA '
+                                                                                     'Encryption',
+                                                              'fingerprint_md5': '4465EC15 '
+                                                                                 'A40804EF '
+                                                                                 'B989164B '
+                                                                                 '461B7E42',
+                                                              'fingerprint_sha1': '5C3C2759 '
+                                                                                  '5E925BEA '
+                                                                                  '0B6C8ADE '
+                                                                                  '7844278A '
+                                                                                  '49E2D60B',
+                                                              'key_usage_hex': '86000000',
+                                                              'key_usage': {'key_usage_1': 'Digital '
+                                                                                           'Signature',
+                                                                            'key_usage_2': 'Key '
+                                                                                           'Cert '
+                                                                                           'Sign',
+                                                                            'key_usage_3': 'CRL '
+                                                                                           'Signature'},
+                                                              'subject_key_id': '31DEF8AC '
+                                                                                '8ED9E5F0 '
+                                                                                'CDBC4749 '
+                                                                                '61BED767 '
+                                                                                '0CF75DB2',
+                                                              'ca_flag': 'TRUE',
+                                                              'authority_key_id': '31DEF8AC '
+                                                                                  '8ED9E5F0 '
+                                                                                  'CDBC4749 '
+                                                                                  '61BED767 '
+                                                                                  '0CF75DB2',
+                                                              'cert_install_time': '21:57:41 '
+                                                                                   'IST '
+                                                                                   'Nov '
+                                                                                   '10 '
+                                                                                   '2021',
+                                                              'trustpoints': 'client '
+                                                                             'ROOT'}}},
+                 'openssl_test': {'certificates': {'certificate': {'status': 'Available',
+                                                                   'serial': '03',
+                                                                   'usage': 'General '
+                                                                            'Purpose',
+                                                                   'issuer': {'common_name': 'RSA-CA',
+                                                                              'organization': 'cisco'},
+                                                                   'subject': {'name': 'ROUTER',
+                                                                               'common_name': 'ROUTER',
+                                                                               'organizational_unit': 'PKI',
+                                                                               'organization': 'cisco'},
+                                                                   'validity_date': {'start_date': '23:09:23 '
+                                                                                                   'IST '
+                                                                                                   'Nov '
+                                                                                                   '17 '
+                                                                                                   '2021',
+                                                                                     'end_date': '23:09:23 '
+                                                                                                 'IST '
+                                                                                                 'Nov '
+                                                                                                 '16 '
+                                                                                                 '2026'},
+                                                                   'subject_key_info': {'key_algorithm': 'rsaEncryption',
+                                                                                        'key_length': '2048'},
+                                                                   'signature_algorithm': 'SHA256 '
+                                                                                          'with '
+                                                                                          'RSA '
+                                                                                          'Encryption',
+                                                                   'fingerprint_md5': '63B03B57 '
+                                                                                      '6ADB6EB8 '
+                                                                                      'A525E53A '
+                                                                                      'F8478A34',
+                                                                   'fingerprint_sha1': '8C78B5ED '
+                                                                                       '59B6EC2E '
+                                                                                       '645DB494 '
+                                                                                       '998657E6 '
+                                                                                       '290DA64C',
+                                                                   'key_usage_hex': 'B0000000',
+                                                                   'key_usage': {'key_usage_1': 'Digital '
+                                                                                                'Signature',
+                                                                                 'key_usage_2': 'Key '
+                                                                                                'Encipherment',
+                                                                                 'key_usage_3': 'Data '
+                                                                                                'Encipherment'},
+                                                                   'cert_install_time': '23:09:51 '
+                                                                                        'IST '
+                                                                                        'Nov '
+                                                                                        '17 '
+                                                                                        '2021',
+                                                                   'trustpoints': 'openssl_test',
+                                                                   'key_label': 'openssl_test'},
+                                                   'ca_certificate': {'status': 'Available',
+                                                                      'serial': '4BE62C7CF3A30DDB6F133B50B2CFDCCD4F84D0B0',
+                                                                      'usage': 'Signature',
+                                                                      'issuer': {'common_name': 'RSA-CA',
+                                                                                 'organization': 'cisco'},
+                                                                      'subject': {'common_name': 'RSA-CA',
+                                                                                  'organization': 'cisco'},
+                                                                      'validity_date': {'start_date': '23:08:44 '
+                                                                                                      'IST '
+                                                                                                      'Nov '
+                                                                                                      '17 '
+                                                                                                      '2021',
+                                                                                        'end_date': '23:08:44 '
+                                                                                                    'IST '
+                                                                                                    'Nov '
+                                                                                                    '15 '
+                                                                                                    '2031'},
+                                                                      'subject_key_info': {'key_algorithm': 'rsaEncryption',
+                                                                                           'key_length': '2048'},
+                                                                      'signature_algorithm': 'SHA256 '
+                                                                                             'with '
+                                                                                             'RSA '
+                                                                                             'Encryption',
+                                                                      'fingerprint_md5': '1E534C29 '
+                                                                                         '1DC463F6 '
+                                                                                         '90544209 '
+                                                                                         '26C218F6',
+                                                                      'fingerprint_sha1': '0A21682B '
+                                                                                          '2C484AC6 '
+                                                                                          '1CE09935 '
+                                                                                          '2132CA62 '
+                                                                                          '686ACA1D',
+                                                                      'key_usage_hex': '86000000',
+                                                                      'key_usage': {'key_usage_1': 'Digital '
+                                                                                                   'Signature',
+                                                                                    'key_usage_2': 'Key '
+                                                                                                   'Cert '
+                                                                                                   'Sign',
+                                                                                    'key_usage_3': 'CRL '
+                                                                                                   'Signature'},
+                                                                      'cert_install_time': '23:09:50 '
+                                                                                           'IST '
+                                                                                           'Nov '
+                                                                                           '17 '
+                                                                                           '2021',
+                                                                      'trustpoints': 'openssl_test'}}}}}
@@ -0,0 +1,663 @@
+expected_output = {'clients': {'0aba.ddff.40c9': {'client_mac_address': '0aba.ddff.40c9',
+                                'client_mac_type': 'Locally Administered '
+                                                   'Address',
+                                'client_ipv4_address': '10.22.4.19',
+                                'client_ipv6_addresses': 'fe80::8ba:ddff:feff:40c9',
+                                'client_username': 'aking',
+                                'ap_mac_address': '70b3.18ff.f475',
+                                'ap_name': 'b1-11-cap9',
+                                'ap_slot': 0,
+                                'client_state': 'Associated',
+                                'policy_profile': 'lizzard_b1',
+                                'flex_profile': 'N/A',
+                                'wireless_lan_id': 20,
+                                'wlan_profile_name': 'lizzard-l_Global',
+                                'wireless_lan_network_name_ssid': 'lizzard-legacy',
+                                'bssid': '70b3.18ff.f478',
+                                'connected_for_seconds': 3233,
+                                'protocol': '802.11n - 2.4 GHz',
+                                'channel': 6,
+                                'client_iif_id': '0xa0000012',
+                                'association_id': 1,
+                                'authentication_alogrithm': 'Open System',
+                                'idle_state_timeout': 'N/A',
+                                're_authentication_timeout_secs': {'configured': 36000,
+                                                                   'remaining_time': 32768},
+                                'session_warning_time': 'Timer not running',
+                                'input_policy_name': 'client-default',
+                                'input_policy_state': 'Installed',
+                                'input_policy_source': 'QOS Internal Policy',
+                                'output_policy_name': 'client-default',
+                                'output_policy_state': 'Installed',
+                                'output_policy_source': 'QOS Internal Policy',
+                                'wmm_support': 'Enabled',
+                                'u_apsd_support': {'status': 'Enabled',
+                                                   'u_apsd_value': 0,
+                                                   'apsd_acs': ['BK',
+                                                                'BE',
+                                                                'VI',
+                                                                'VO']},
+                                'fastlane_support': 'Disabled',
+                                'client_active_state': 'In-Active',
+                                'power_save': 'ON',
+                                'current_rate': 6.0,
+                                'supported_rates': [24.0, 36.0, 48.0, 54.0],
+                                'mobility': {'move_count': 0,
+                                             'mobility_role': 'Local',
+                                             'mobility_roam_type': 'None',
+                                             'mobility_complete_timestamp': '10/22/2020 '
+                                                                            '08:07:55 '
+                                                                            'IST'},
+                                'client_join_time': '10/22/2020 08:46:54 IST',
+                                'client_state_servers': 'None',
+                                'client_acls': 'None',
+                                'policy_manager_state': 'Run',
+                                'last_policy_manager_state': 'IP Learn '
+                                                             'Complete',
+                                'client_entry_create_time_secs': 5572,
+                                'policy_type': 'WPA2',
+                                'encryption_cipher': 'CCMP (AES)',
+                                'authentication_key_management': '802.1x',
+                                'user_defined_private_network': 'Disabled',
+                                'user_defined_private_network_drop_unicast': 'Disabled',
+                                'encrypted_traffic_analytics': 'No',
+                                'protected_management_frame__802.11w': 'No',
+                                'eap_type': 'PEAP',
+                                'vlan_override_after_webauth': 'No',
+                                'vlan': 'b1-vg-data',
+                                'multicast_vlan': 0,
+                                'wifi_direct_capabilities': {'wifi_direct_capable': 'No'},
+                                'central_nat': 'DISABLED',
+                                'session_manager': {'point_of_attachment': 'capwap_90000cc1',
+                                                    'iif_id': '0x90000CC1',
+                                                    'authorized': 'TRUE',
+                                                    'session_timeout': 36000,
+                                                    'common_session_id': 'B12F400A0002770E4E2B7E5A',
+                                                    'acct_session_id': '0x00005912',
+                                                    'last_tried_aaa_server_details': {'server_ip': '10.19.10.150'},
+                                                    'auth_method_status_list': {'method': {'Dot1x': {'sm_state': 'AUTHENTICATED',
+                                                                                                     'sm_bend_state': 'IDLE'}}},
+                                                    'local_policies': {'service_template': {'wlan_svc_lizzard_b1_local (priority 254)': {'vlan_group': 'b1-vg-data',
+                                                                                                                                         'absolute_timer': 36000}}},
+                                                    'server_policies': {'output_sgt': '000a-09'},
+                                                    'resultant_policies': {'output_sgt': '000a-09',
+                                                                           'vlan_name': 'b1-data-1',
+                                                                           'vlan_group': 'b1-vg-data',
+                                                                           'vlan': 224,
+                                                                           'absolute_timer': 36000}},
+                                'dns_snooped_ipv4_addresses': 'None',
+                                'dns_snooped_ipv6_addresses': 'None',
+                                'client_capabilities': {'cf_pollable': 'Not '
+                                                                       'implemented',
+                                                        'cf_poll_request': 'Not '
+                                                                           'implemented',
+                                                        'short_preamble': 'Not '
+                                                                          'implemented',
+                                                        'pbcc': 'Not '
+                                                                'implemented',
+                                                        'channel_agility': 'Not '
+                                                                           'implemented',
+                                                        'listen_interval': 0},
+                                'fast_bss_transition_details': {'reassociation_timeout': 0},
+                                '11v_bss_transition': 'Implemented',
+                                '11v_dms_capable': 'No',
+                                'qos_map_capable': 'No',
+                                'flexconnect_data_switching': 'N/A',
+                                'flexconnect_dhcp_status': 'N/A',
+                                'flexconnect_authentication': 'N/A',
+                                'flexconnect_central_association': 'N/A',
+                                'client_statistics': {'number_of_bytes_received': 3083748,
+                                                      'number_of_bytes_sent': 2063114,
+                                                      'number_of_packets_received': 9048,
+                                                      'number_of_packets_sent': 3686,
+                                                      'number_of_policy_errors': 0,
+                                                      'radio_signal_strength_indicator_dbm': -84,
+                                                      'signal_to_noise_ration_db': 10},
+                                'fabric_status': 'Disabled',
+                                'radio_measurement_enabled_capabilities': {'capabilities': ['Link '
+                                                                                            'Measurement',
+                                                                                            'Neighbor '
+                                                                                            'Report',
+                                                                                            'Repeated '
+                                                                                            'Measurements',
+                                                                                            'Passive '
+                                                                                            'Beacon '
+                                                                                            'Measurement',
+                                                                                            'Active '
+                                                                                            'Beacon '
+                                                                                            'Measurement',
+                                                                                            'Table '
+                                                                                            'Beacon '
+                                                                                            'Measurement',
+                                                                                            'RM '
+                                                                                            'MIB']},
+                                'client_scan_report_time': 'Timer not running',
+                                'nearby_ap_statistics': {'ap_names': {'prateekk_cos_1 (slot 1)': {'antenna': {'antenna 0': {'seconds_ago': 13,
+                                                                                                                            'dbm': -25},
+                                                                                                              'antenna 1': {'seconds_ago': 13,
+                                                                                                                            'dbm': -25}}}}},
+                                'eogre': 'Pending Classification',
+                                'device_info': {'device_type': 'Android',
+                                                'device_name': 'android-dhcp-10',
+                                                'protocol_map': '0x000029  '
+                                                                '(OUI, DHCP, '
+                                                                'HTTP)',
+                                                'device_os': 'Linux; U; '
+                                                             'Android 10; '
+                                                             'RMX1825 '
+                                                             'Build/QP1A.190711.020',
+                                                'protocols': {'DHCP': {1: {'type': '12   '
+                                                                                   '12',
+                                                                           'data_size': '0c',
+                                                                           'data': ['00000000 '
+                                                                                    '00 '
+                                                                                    '0c '
+                                                                                    '00 '
+                                                                                    '08 '
+                                                                                    '72 '
+                                                                                    '65 '
+                                                                                    '61 '
+                                                                                    '6c  '
+                                                                                    '6d '
+                                                                                    '65 '
+                                                                                    '2d '
+                                                                                    '33 '
+                                                                                    '|....realme-3    '
+                                                                                    '|']},
+                                                                       2: {'type': '60   '
+                                                                                   '19',
+                                                                           'data_size': '13',
+                                                                           'data': ['00000000 '
+                                                                                    '00 '
+                                                                                    '3c '
+                                                                                    '00 '
+                                                                                    '0f '
+                                                                                    '61 '
+                                                                                    '6e '
+                                                                                    '64 '
+                                                                                    '72  '
+                                                                                    '6f '
+                                                                                    '69 '
+                                                                                    '64 '
+                                                                                    '2d '
+                                                                                    '64 '
+                                                                                    '68 '
+                                                                                    '63 '
+                                                                                    '70 '
+                                                                                    '|.<..android-dhcp|',
+                                                                                    '00000010 '
+                                                                                    '2d '
+                                                                                    '31 '
+                                                                                    '30 '
+                                                                                    '|-10             '
+                                                                                    '|']},
+                                                                       3: {'type': '55   '
+                                                                                   '14',
+                                                                           'data_size': '0e',
+                                                                           'data': ['00000000 '
+                                                                                    '00 '
+                                                                                    '37 '
+                                                                                    '00 '
+                                                                                    '0a '
+                                                                                    '01 '
+                                                                                    '03 '
+                                                                                    '06 '
+                                                                                    '0f  '
+                                                                                    '1a '
+                                                                                    '1c '
+                                                                                    '33 '
+                                                                                    '3a '
+                                                                                    '3b '
+                                                                                    '2b '
+                                                                                    '|.7........3:;+  '
+                                                                                    '|']}},
+                                                              'HTTP': {1: {'type': '1    '
+                                                                                   '70',
+                                                                           'data_size': '46',
+                                                                           'data': ['00000000 '
+                                                                                    '00 '
+                                                                                    '01 '
+                                                                                    '00 '
+                                                                                    '42 '
+                                                                                    '44 '
+                                                                                    '61 '
+                                                                                    '6c '
+                                                                                    '76  '
+                                                                                    '69 '
+                                                                                    '6b '
+                                                                                    '2f '
+                                                                                    '32 '
+                                                                                    '2e '
+                                                                                    '31 '
+                                                                                    '2e '
+                                                                                    '30 '
+                                                                                    '|...BDalvik/2.1.0|',
+                                                                                    '00000010 '
+                                                                                    '20 '
+                                                                                    '28 '
+                                                                                    '4c '
+                                                                                    '69 '
+                                                                                    '6e '
+                                                                                    '75 '
+                                                                                    '78 '
+                                                                                    '3b  '
+                                                                                    '20 '
+                                                                                    '55 '
+                                                                                    '3b '
+                                                                                    '20 '
+                                                                                    '41 '
+                                                                                    '6e '
+                                                                                    '64 '
+                                                                                    '72 '
+                                                                                    '| '
+                                                                                    '(Linux; '
+                                                                                    'U; '
+                                                                                    'Andr|',
+                                                                                    '00000020 '
+                                                                                    '6f '
+                                                                                    '69 '
+                                                                                    '64 '
+                                                                                    '20 '
+                                                                                    '31 '
+                                                                                    '30 '
+                                                                                    '3b '
+                                                                                    '20  '
+                                                                                    '52 '
+                                                                                    '4d '
+                                                                                    '58 '
+                                                                                    '31 '
+                                                                                    '38 '
+                                                                                    '32 '
+                                                                                    '35 '
+                                                                                    '20 '
+                                                                                    '|oid '
+                                                                                    '10; '
+                                                                                    'RMX1825 '
+                                                                                    '|',
+                                                                                    '00000030 '
+                                                                                    '42 '
+                                                                                    '75 '
+                                                                                    '69 '
+                                                                                    '6c '
+                                                                                    '64 '
+                                                                                    '2f '
+                                                                                    '51 '
+                                                                                    '50  '
+                                                                                    '31 '
+                                                                                    '41 '
+                                                                                    '2e '
+                                                                                    '31 '
+                                                                                    '39 '
+                                                                                    '30 '
+                                                                                    '37 '
+                                                                                    '31 '
+                                                                                    '|Build/QP1A.19071|',
+                                                                                    '00000040 '
+                                                                                    '31 '
+                                                                                    '2e '
+                                                                                    '30 '
+                                                                                    '32 '
+                                                                                    '30 '
+                                                                                    '29 '
+                                                                                    '|1.020)          '
+                                                                                    '|']}}}},
+                                'max_client_protocol_capability': '802.11n',
+                                'cellular_capability': 'N/A'},
+             'dca6.325d.150f': {'client_mac_address': 'dca6.325d.150f',
+                                'client_mac_type': 'Universally Administered '
+                                                   'Address',
+                                'client_ipv4_address': '46.123.31.1',
+                                'client_ipv6_addresses': 'fe80::dc86:d296:e307:c8ce',
+                                'client_username': 'DC-A6-32-5D-15-0F',
+                                'ap_mac_address': '10b3.d63e.5ce0',
+                                'ap_name': 'AP084F.A9A2.86A4',
+                                'ap_slot': 1,
+                                'client_state': 'Associated',
+                                'policy_profile': 'IOSXE-D1-INETIU-WLANID-512',
+                                'flex_profile': 'N/A',
+                                'wireless_lan_id': 512,
+                                'wlan_profile_name': 'IOSXE-D1-INetIU-CWA',
+                                'wireless_lan_network_name_ssid': 'IOSXE-D1-INetiU-CWA',
+                                'bssid': '10b3.d63e.5cee',
+                                'connected_for_seconds': 166,
+                                'protocol': '802.11ac',
+                                'channel': 128,
+                                'client_iif_id': '0xa0000001',
+                                'association_id': 1,
+                                'authentication_alogrithm': 'Open System',
+                                'idle_state_timeout': 'N/A',
+                                'session_timeout': '1800 sec (Timer not '
+                                                   'running)',
+                                'session_warning_time': 'Timer not running',
+                                'input_policy_name': 'None',
+                                'input_policy_state': 'None',
+                                'input_policy_source': 'None',
+                                'output_policy_name': 'None',
+                                'output_policy_state': 'None',
+                                'output_policy_source': 'None',
+                                'wmm_support': 'Enabled',
+                                'u_apsd_support': {'status': 'Enabled',
+                                                   'u_apsd_value': 0,
+                                                   'apsd_acs': ['BK',
+                                                                'BE',
+                                                                'VI',
+                                                                'VO']},
+                                'fastlane_support': 'Disabled',
+                                'client_active_state': 'Active',
+                                'power_save': 'OFF',
+                                'current_rate': 'm9 ss1',
+                                'supported_rates': [9.0,
+                                                    18.0,
+                                                    36.0,
+                                                    48.0,
+                                                    54.0],
+                                'mobility': {'move_count': 0,
+                                             'mobility_role': 'Local',
+                                             'mobility_roam_type': 'None',
+                                             'mobility_complete_timestamp': '06/15/2021 '
+                                                                            '15:06:12 '
+                                                                            'British'},
+                                'client_join_time': '06/15/2021 15:06:12 '
+                                                    'British',
+                                'client_state_servers': 'None',
+                                'client_acls': 'None',
+                                'policy_manager_state': 'Webauth Pending',
+                                'last_policy_manager_state': 'IP Learn '
+                                                             'Complete',
+                                'client_entry_create_time_secs': 166,
+                                'policy_type': 'N/A',
+                                'encryption_cipher': 'None',
+                                'user_defined_private_network': 'Disabled',
+                                'user_defined_private_network_drop_unicast': 'Disabled',
+                                'encrypted_traffic_analytics': 'No',
+                                'protected_management_frame__802.11w': 'No',
+                                'eap_type': 'Not Applicable',
+                                'vlan_override_after_webauth': 'No',
+                                'vlan': 'WLC-DATA',
+                                'multicast_vlan': 0,
+                                'wifi_direct_capabilities': {'wifi_direct_capable': 'No'},
+                                'central_nat': 'DISABLED',
+                                'session_manager': {'point_of_attachment': 'capwap_90000004',
+                                                    'iif_id': '0x90000004',
+                                                    'authorized': 'TRUE',
+                                                    'session_timeout': 1800,
+                                                    'common_session_id': '445A583B000011D9103562E6',
+                                                    'acct_session_id': '0x0000005e',
+                                                    'last_tried_aaa_server_details': {'server_ip': '120.11.78.100'},
+                                                    'auth_method_status_list': {'method': {'MAB': {'sm_state': 'TERMINATE',
+                                                                                                   'authen_status': 'Success'}}},
+                                                    'local_policies': {'service_template': {'wlan_svc_IOSXE-D1-INETIU-WLANID-512_local (priority 254)': {'vlan': 'WLC-DATA',
+                                                                                                                                                         'absolute_timer': 1800}}},
+                                                    'server_policies': {'url_redirect_acl': 'ACL_WEBAUTH_REDIRECT',
+                                                                        'url_redirect': 'https://<placeholder>-WLAN-ISE.lab.<placeholder>:8443/portal/gateway?sessionId=445A583B000011D9103562E6&portal=f0ae43f0-7159-11e7-a355-005056aba474&action=cwa&token=5041ffbf4f184469c4db42e2a92ea637'},
+                                                    'resultant_policies': {'url_redirect_acl': 'ACL_WEBAUTH_REDIRECT',
+                                                                           'url_redirect': 'https://<placeholder>-WLAN-ISE.lab.<placeholder>:8443/portal/gateway?sessionId=445A583B000011D9103562E6&portal=f0ae43f0-7159-11e7-a355-005056aba474&action=cwa&token=5041ffbf4f184469c4db42e2a92ea637',
+                                                                           'vlan_name': 'WLC-DATA',
+                                                                           'vlan': 145,
+                                                                           'absolute_timer': 1800}},
+                                'dns_snooped_ipv4_addresses': 'None',
+                                'dns_snooped_ipv6_addresses': 'None',
+                                'client_capabilities': {'cf_pollable': 'Not '
+                                                                       'implemented',
+                                                        'cf_poll_request': 'Not '
+                                                                           'implemented',
+                                                        'short_preamble': 'Not '
+                                                                          'implemented',
+                                                        'pbcc': 'Not '
+                                                                'implemented',
+                                                        'channel_agility': 'Not '
+                                                                           'implemented',
+                                                        'listen_interval': 0},
+                                'fast_bss_transition_details': {'reassociation_timeout': 20},
+                                '11v_bss_transition': 'Implemented',
+                                '11v_dms_capable': 'No',
+                                'qos_map_capable': 'No',
+                                'flexconnect_data_switching': 'N/A',
+                                'flexconnect_dhcp_status': 'N/A',
+                                'flexconnect_authentication': 'N/A',
+                                'flexconnect_central_association': 'N/A',
+                                'client_statistics': {'number_of_bytes_received': 208,
+                                                      'number_of_bytes_sent': 0,
+                                                      'number_of_packets_received': 4,
+                                                      'number_of_packets_sent': 2,
+                                                      'number_of_policy_errors': 0,
+                                                      'radio_signal_strength_indicator_dbm': -37,
+                                                      'signal_to_noise_ration_db': 54},
+                                'fabric_status': 'Disabled',
+                                'radio_measurement_enabled_capabilities': {'capabilities': ['Neighbor '
+                                                                                            'Report',
+                                                                                            'Passive '
+                                                                                            'Beacon '
+                                                                                            'Measurement',
+                                                                                            'Active '
+                                                                                            'Beacon '
+                                                                                            'Measurement',
+                                                                                            'Table '
+                                                                                            'Beacon '
+                                                                                            'Measurement',
+                                                                                            'Statistics '
+                                                                                            'Measurement',
+                                                                                            'AP '
+                                                                                            'Channel '
+                                                                                            'Report']},
+                                'client_scan_report_time': 'Timer not running',
+                                'nearby_ap_statistics': {},
+                                'eogre': 'Pending Classification',
+                                'max_client_protocol_capability': '802.11ac '
+                                                                  'Wave 2',
+                                'cellular_capability': 'N/A'},
+             '1cbf.cee6.9419': {'client_mac_address': '1cbf.cee6.9419',
+                                'client_mac_type': 'Universally Administered '
+                                                   'Address',
+                                'client_ipv4_address': '10.28.50.67',
+                                'client_username': 'Cisco',
+                                'ap_mac_address': '3c41.0e3b.c420',
+                                'ap_name': 'DMZ-AP-1',
+                                'ap_slot': 1,
+                                'client_state': 'Associated',
+                                'policy_profile': 'TEST-DMZ-En_Global_NF_5d6f92e7',
+                                'flex_profile': 'default-flex-profile',
+                                'wireless_lan_id': 17,
+                                'wlan_profile_name': 'TEST-DMZ-En_Global_NF_5d6f92e7',
+                                'wireless_lan_network_name_ssid': 'TEST-DMZ-Enterprise',
+                                'bssid': '3c41.0e3b.c42f',
+                                'connected_for_seconds': 396317,
+                                'protocol': '802.11ac',
+                                'channel': 48,
+                                'client_iif_id': '0xa0000002',
+                                'association_id': 1,
+                                'authentication_alogrithm': 'Open System',
+                                'idle_state_timeout': 'N/A',
+                                're_authentication_timeout_secs': {'configured': 1800,
+                                                                   'remaining_time': 1574},
+                                'session_warning_time': 'Timer not running',
+                                'input_policy_name': 'None',
+                                'input_policy_state': 'None',
+                                'input_policy_source': 'None',
+                                'output_policy_name': 'None',
+                                'output_policy_state': 'None',
+                                'output_policy_source': 'None',
+                                'wmm_support': 'Enabled',
+                                'u_apsd_support': {'status': 'Disabled'},
+                                'fastlane_support': 'Disabled',
+                                'client_active_state': 'Active',
+                                'power_save': 'OFF',
+                                'current_rate': 'm8 ss2',
+                                'supported_rates': [6.0,
+                                                    9.0,
+                                                    12.0,
+                                                    18.0,
+                                                    24.0,
+                                                    36.0,
+                                                    48.0,
+                                                    54.0],
+                                'aaa_qos_rate_limit_parameters': {'upstream': {'qos_average_data_rate_kbps': 0,
+                                                                               'qos_realtime_average_data_rate_kbps': 0,
+                                                                               'qos_burst_data_rate_kbps': 0,
+                                                                               'qos_realtime_burst_data_rate_kbps': 0},
+                                                                  'downstream': {'qos_average_data_rate_kbps': 0,
+                                                                                 'qos_realtime_average_data_rate_kbps': 0,
+                                                                                 'qos_burst_data_rate_kbps': 0,
+                                                                                 'qos_realtime_burst_data_rate_kbps': 0}},
+                                'mobility': {'move_count': 0,
+                                             'mobility_role': 'Local',
+                                             'mobility_roam_type': 'None',
+                                             'mobility_complete_timestamp': '02/15/2022 '
+                                                                            '18:02:56 '
+                                                                            'UTC'},
+                                'client_join_time': '02/17/2022 16:33:45 UTC',
+                                'client_state_servers': 'None',
+                                'client_acls': 'None',
+                                'policy_manager_state': 'Run',
+                                'last_policy_manager_state': 'IP Learn '
+                                                             'Complete',
+                                'client_entry_create_time_secs': 563766,
+                                'policy_type': 'WPA2',
+                                'encryption_cipher': 'CCMP (AES)',
+                                'authentication_key_management': '802.1x',
+                                'user_defined_private_network': 'Disabled',
+                                'user_defined_private_network_drop_unicast': 'Disabled',
+                                'encrypted_traffic_analytics': 'No',
+                                'protected_management_frame__802.11w': 'No',
+                                'eap_type': 'EAP-TLS',
+                                'vlan_override_after_webauth': 'No',
+                                'vlan': 'ENT-VLAN-DMZ',
+                                'multicast_vlan': 0,
+                                'wifi_direct_capabilities': {'wifi_direct_capable': 'No'},
+                                'central_nat': 'DISABLED',
+                                'session_manager': {'point_of_attachment': 'capwap_90000006',
+                                                    'iif_id': '0x90000006',
+                                                    'authorized': 'TRUE',
+                                                    'session_timeout': 1800,
+                                                    'common_session_id': '02321C0A00000026FE8D3B2D',
+                                                    'acct_session_id': '0x00000007',
+                                                    'last_tried_aaa_server_details': {'server_ip': '172.16.18.2'},
+                                                    'auth_method_status_list': {'method': {'Dot1x': {'sm_state': 'AUTHENTICATED',
+                                                                                                     'sm_bend_state': 'IDLE'}}},
+                                                    'local_policies': {'service_template': {'wlan_svc_TEST-DMZ-En_Global_NF_5d6f92e7_local (priority 254)': {'absolute_timer': 1800}}},
+                                                    'server_policies': {'vlan': 'ENT-VLAN-DMZ'},
+                                                    'resultant_policies': {'vlan_name': 'ENT-VLAN-DMZ',
+                                                                           'vlan': 20,
+                                                                           'absolute_timer': 1800}},
+                                'dns_snooped_ipv4_addresses': 'None',
+                                'dns_snooped_ipv6_addresses': 'None',
+                                'client_capabilities': {'cf_pollable': 'Not '
+                                                                       'implemented',
+                                                        'cf_poll_request': 'Not '
+                                                                           'implemented',
+                                                        'short_preamble': 'Not '
+                                                                          'implemented',
+                                                        'pbcc': 'Not '
+                                                                'implemented',
+                                                        'channel_agility': 'Not '
+                                                                           'implemented',
+                                                        'listen_interval': 0},
+                                'fast_bss_transition_details': {'reassociation_timeout': 20},
+                                '11v_bss_transition': 'Implemented',
+                                '11v_dms_capable': 'No',
+                                'qos_map_capable': 'No',
+                                'flexconnect_data_switching': 'Central',
+                                'flexconnect_dhcp_status': 'Central',
+                                'flexconnect_authentication': 'Central',
+                                'client_statistics': {'number_of_bytes_received': 12844445,
+                                                      'number_of_bytes_sent': 10484743,
+                                                      'number_of_packets_received': 102748,
+                                                      'number_of_packets_sent': 58259,
+                                                      'number_of_policy_errors': 0,
+                                                      'radio_signal_strength_indicator_dbm': -27,
+                                                      'signal_to_noise_ration_db': 56},
+                                'fabric_status': 'Disabled',
+                                'radio_measurement_enabled_capabilities': {'capabilities': ['Neighbor '
+                                                                                            'Report',
+                                                                                            'Passive '
+                                                                                            'Beacon '
+                                                                                            'Measurement',
+                                                                                            'Active '
+                                                                                            'Beacon '
+                                                                                            'Measurement',
+                                                                                            'AP '
+                                                                                            'Channel '
+                                                                                            'Report']},
+                                'client_scan_report_time': 'Timer not running',
+                                'nearby_ap_statistics': {},
+                                'eogre': 'Pending Classification',
+                                'device_info': {'device_type': 'Microsoft-Workstation',
+                                                'device_name': 'MSFT 5.0',
+                                                'protocol_map': '0x000009  '
+                                                                '(OUI, DHCP)',
+                                                'protocols': {'DHCP': {1: {'type': '12   '
+                                                                                   '19',
+                                                                           'data_size': '13',
+                                                                           'data': ['00000000 '
+                                                                                    '00 '
+                                                                                    '0c '
+                                                                                    '00 '
+                                                                                    '0f '
+                                                                                    '44 '
+                                                                                    '45 '
+                                                                                    '53 '
+                                                                                    '4b  '
+                                                                                    '54 '
+                                                                                    '4f '
+                                                                                    '50 '
+                                                                                    '2d '
+                                                                                    '37 '
+                                                                                    '51 '
+                                                                                    '55 '
+                                                                                    '36 '
+                                                                                    '|....DESKTOP-7QU6|',
+                                                                                    '00000010 '
+                                                                                    '44 '
+                                                                                    '4a '
+                                                                                    '30 '
+                                                                                    '|DJ0             '
+                                                                                    '|']},
+                                                                       2: {'type': '60   '
+                                                                                   '12',
+                                                                           'data_size': '0c',
+                                                                           'data': ['00000000 '
+                                                                                    '00 '
+                                                                                    '3c '
+                                                                                    '00 '
+                                                                                    '08 '
+                                                                                    '4d '
+                                                                                    '53 '
+                                                                                    '46 '
+                                                                                    '54  '
+                                                                                    '20 '
+                                                                                    '35 '
+                                                                                    '2e '
+                                                                                    '30 '
+                                                                                    '|.<..MSFT '
+                                                                                    '5.0    '
+                                                                                    '|']},
+                                                                       3: {'type': '55   '
+                                                                                   '18',
+                                                                           'data_size': '12',
+                                                                           'data': ['00000000 '
+                                                                                    '00 '
+                                                                                    '37 '
+                                                                                    '00 '
+                                                                                    '0e '
+                                                                                    '01 '
+                                                                                    '03 '
+                                                                                    '06 '
+                                                                                    '0f  '
+                                                                                    '1f '
+                                                                                    '21 '
+                                                                                    '2b '
+                                                                                    '2c '
+                                                                                    '2e '
+                                                                                    '2f '
+                                                                                    '77 '
+                                                                                    '79 '
+                                                                                    '|.7.......!+,./wy|',
+                                                                                    '00000010 '
+                                                                                    'f9 '
+                                                                                    'fc '
+                                                                                    '|..              '
+                                                                                    '|']}}}},
+                                'max_client_protocol_capability': '802.11ac '
+                                                                  'Wave 2',
+                                'cellular_capability': 'N/A',
+                                'advanced_scheduling_requests_details': {'Apple Specific Requests(ASR) Capabilities/Statistics': {'regular_asr_support': 'DISABLED'}}}}}
@@ -15,6 +15,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ================
 # Schema for:
@@ -91,58 +94,58 @@ class Traceroute(TracerouteSchema):
         # Type escape sequence to abort.
         # traceroute 10.151.22.22
         # traceroute vrf MG501 192.168.1.1 numeric
-        p1 = re.compile(r'^traceroute( +vrf +(?P<vrf>\S+))? +[\S ]+$')
+        p1 = regex_engine.compile(r'^traceroute( +vrf +(?P<vrf>\S+))? +[\S ]+$')
 
         # Tracing the route to 172.16.166.253
-        p1_1 = re.compile(r'^Tracing +the +route +to +(?P<traceroute>(\S+))$')
+        p1_1 = regex_engine.compile(r'^Tracing +the +route +to +(?P<traceroute>(\S+))$')
 
         # Tracing MPLS Label Switched Path to 172.31.165.220/32, timeout is 2 seconds
-        p1_2 = re.compile(r'^Tracing +MPLS +Label +Switched +Path +to'
-                          r' +(?P<traceroute>\S+), +timeout +is'
-                          r' +(?P<timeout>(\d+)) +seconds$')
+        p1_2 = regex_engine.compile(r'^Tracing +MPLS +Label +Switched +Path +to'
+                                    r' +(?P<traceroute>\S+), +timeout +is'
+                                    r' +(?P<timeout>(\d+)) +seconds$')
 
         # Tracing the route to www.cisco.com (10.36.3.3)
-        p1_3 = re.compile(r'^Tracing +the +route +to +(?P<name_of_address>\S+)'
-                          r' \(+(?P<traceroute>\S+)\)$')
+        p1_3 = regex_engine.compile(r'^Tracing +the +route +to +(?P<name_of_address>\S+)'
+                                    r' \(+(?P<traceroute>\S+)\)$')
 
         # Tracing MPLS TE Label Switched Path on Tunnel100 Active LSP, timeout is 2 seconds
-        p1_4 = re.compile(r'^Tracing +MPLS +TE +Label +Switched +Path +on'
-                          r' +(?P<traceroute>\S+) +Active +LSP, +timeout +is'
-                          r' +(?P<timeout>(\d+)) +seconds$')
+        p1_4 = regex_engine.compile(r'^Tracing +MPLS +TE +Label +Switched +Path +on'
+                                    r' +(?P<traceroute>\S+) +Active +LSP, +timeout +is'
+                                    r' +(?P<timeout>(\d+)) +seconds$')
 
         # VRF info: (vrf in name/id, vrf out name/id)
 
         # 1 10.1.1.2 (red/1001, red/1001)
         # 2 10.2.1.2 (red/1001, red/1001)
-        p2 = re.compile(r'^((?P<hop>(\d+)) +)?(?P<address>([a-zA-Z0-9\.\:]+))'
-                        r' +\((?P<vrf_in_name>(\S+))\/(?P<vrf_in_id>(\d+)),'
-                        r' +(?P<vrf_out_name>(\S+))\/(?P<vrf_out_id>(\d+))\)$')
+        p2 = regex_engine.compile(r'^((?P<hop>(\d+)) +)?(?P<address>([a-zA-Z0-9\.\:]+))'
+                                  r' +\((?P<vrf_in_name>(\S+))\/(?P<vrf_in_id>(\d+)),'
+                                  r' +(?P<vrf_out_name>(\S+))\/(?P<vrf_out_id>(\d+))\)$')
 
         # L 1 10.169.197.93 MRU 1552 [Labels: implicit-null Exp: 0] 1 ms
         # ! 2 10.169.197.102 1 ms
-        p3_1 = re.compile(r'^(?P<code>(!|Q|.|L|D|M|P|R|I|X)) +(?P<hop>(\d+))'
-                          r' +(?P<address>([a-zA-Z0-9\.\:]+))'
-                          r'(?: +MRU +(?P<mru>(\d+)))?'
-                          r'(?: +\[Labels: +(?P<label_name>(\S+)) +Exp: +(?P<exp>(\d+))\])?'
-                          r' +(?P<probe_msec>(.*))$')
+        p3_1 = regex_engine.compile(r'^(?P<code>(!|Q|.|L|D|M|P|R|I|X)) +(?P<hop>(\d+))'
+                                    r' +(?P<address>([a-zA-Z0-9\.\:]+))'
+                                    r'(?: +MRU +(?P<mru>(\d+)))?'
+                                    r'(?: +\[Labels: +(?P<label_name>(\S+)) +Exp: +(?P<exp>(\d+))\])?'
+                                    r' +(?P<probe_msec>(.*))$')
 
         # 0 192.168.197.94 MRU 1552 [Labels: 1015 Exp: 0]
-        p3_2 = re.compile(r'^((?P<hop>(\d+)) +)?(?P<address>([a-zA-Z0-9\.\:]+))'
-                          r' +MRU +(?P<mru>(\d+)) +\[Labels: +(?P<label_name>(\S+))'
-                          r' +Exp: +(?P<exp>(\d+))\]$')
+        p3_2 = regex_engine.compile(r'^((?P<hop>(\d+)) +)?(?P<address>([a-zA-Z0-9\.\:]+))'
+                                    r' +MRU +(?P<mru>(\d+)) +\[Labels: +(?P<label_name>(\S+))'
+                                    r' +Exp: +(?P<exp>(\d+))\]$')
 
         # 192.168.100.18 [AS 2516] 2 msec
         # 3  192.168.100.18 [AS 2516] 2 msec
         # 3 fakeaddress.cisco.com (192.168.0.20) [AS 2516] 2 msec 2 msec 2 msec
-        p4 = re.compile(r'^((?P<hop>(\d+)) +)?((?P<name>\S+) +)?\(?(?P<address>[\d.]+)\)? +\[AS +(?P<asn>\d+)\] +(?P<probe_msec>(\d+.*))$')
+        p4 = regex_engine.compile(r'^((?P<hop>(\d+)) +)?((?P<name>\S+) +)?\(?(?P<address>[\d.]+)\)? +\[AS +(?P<asn>\d+)\] +(?P<probe_msec>(\d+.*))$')
 
         # 1 p5DC5A26A.dip0.t-ipconnect.de (10.169.197.93) 0 msec *  1 msec *  0 msec
-        p5 = re.compile(r'^((?P<hop>(\d+)) +)?(?P<name>[\S]+)'
-                        r' +\(+(?P<address>([\d\.]+))\) +(?P<probe_msec>(.*))$')
+        p5 = regex_engine.compile(r'^((?P<hop>(\d+)) +)?(?P<name>[\S]+)'
+                                  r' +\(+(?P<address>([\d\.]+))\) +(?P<probe_msec>(.*))$')
         # 1  *
         # 2  *  *
         # 3  *  *  *
-        p6 = re.compile(r'^((?P<hop>(\d+)) +)?(?P<address>\*( +\*)*)$')
+        p6 = regex_engine.compile(r'^((?P<hop>(\d+)) +)?(?P<address>\*( +\*)*)$')
 
         # 1 172.31.255.125 [MPLS: Label 624 Exp 0] 70 msec 200 msec 19 msec
         # 2 10.0.9.1 [MPLS: Label 300678 Exp 0] 177 msec 150 msec 9 msec
@@ -153,9 +156,9 @@ class Traceroute(TracerouteSchema):
         # 7 172.31.166.10 92 msec 51 msec 148 msec
         # 8 10.169.197.101 1 msec 1 msec *
         # 1 10.19.198.29 [MPLS: Labels 16052/16062/16063/39 Exp 0] 2 msec 2 msec 2 msec
-        p7 = re.compile(r'^((?P<hop>(\d+)) +)?((?P<name>\S+) +\()?(?P<address>[\d.]+)\)?'
-                        r'(?: +\[(?P<label_name>(MPLS)): +Labels? (?P<label>(\S+)) +'
-                        r'Exp +(?P<exp>(\d+))\])? +(?P<probe_msec>(\d+.*))$')
+        p7 = regex_engine.compile(r'^((?P<hop>(\d+)) +)?((?P<name>\S+) +\()?(?P<address>[\d.]+)\)?'
+                                  r'(?: +\[(?P<label_name>(MPLS)): +Labels? (?P<label>(\S+)) +'
+                                  r'Exp +(?P<exp>(\d+))\])? +(?P<probe_msec>(\d+.*))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -473,12 +476,12 @@ class TracerouteIpv6(TracerouteIpv6Schema):
             output = self.device.execute(self.cli_command.format(address=address))
 
         # Tracing the route to 1100::1
-        p1 = re.compile(r'^Tracing the route to\s(?P<destination>[\S]+)$')
+        p1 = regex_engine.compile(r'^Tracing the route to\s(?P<destination>[\S]+)$')
 
         # 1 2001:db8::a:1c:e3:3           0 ms   0 ms   0 ms
         # 2 2001:db8:0:7::5               7 ms   3 ms   0 ms
         # 1 4::1 9 msec *  2 msec
-        p2 = re.compile(r'^(?P<hop_id>\d+)\s+(?P<hop_address>\S+)\s+(?P<probe>[\S\ ]+)$')
+        p2 = regex_engine.compile(r'^(?P<hop_id>\d+)\s+(?P<hop_address>\S+)\s+(?P<probe>[\S\ ]+)$')
 
         #initialising index
         index=1
@@ -16,6 +16,7 @@ import time
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, SchemaTypeError, Schema)
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -157,134 +158,134 @@ class MonitorInterface(MonitorInterfaceSchema):
         control_flag = None
 
         # F17-ASR9922          Monitor Time: 00:00:00          SysUptime: 09:47:06
-        p1 = re.compile(r'^(?P<hostname>[\S]+)\s+Monitor Time:\s+(?P<monitor_time>'
-                        r'[\S]+)\s+SysUptime:\s+(?P<sys_up_time>[\S]+)$')
+        p1 = regex_engine.compile(r'^(?P<hostname>[\S]+)\s+Monitor Time:\s+(?P<monitor_time>'
+                                  r'[\S]+)\s+SysUptime:\s+(?P<sys_up_time>[\S]+)$')
 
         # Protocol:General
-        p2 = re.compile(r'^Protocol:(?P<protocol>\S+)$')
+        p2 = regex_engine.compile(r'^Protocol:(?P<protocol>\S+)$')
 
         # Hu0/0/0/0             22000/  0%    23000/  0%   114.6M/0        280.5M/0
         # Te0/0/1/0                 0/  0%        0/  0%    81.1G/305       68.9G/0             0/0             0/0
-        p3 = re.compile(r'^(?P<interface>\S+)\s+(?P<input_bps>\d+)\/\s*(?P<input_bps_percent>[\S]+)%\s+'
-                r'(?P<output_bps>\d+)\/\s*(?P<output_bps_percent>[\S]+)%\s+'
-                r'(?P<input_bytes>[\d\.]+)(?P<int_bytes>\w?)\/(?P<input_delta>\d+)\s+'
-                r'(?P<output_bytes>[\d\.]+)(?P<out_bytes>\w?)\/(?P<output_delta>\d+)'
-                r'(?:\s+(?P<input_drops>\d+)\/(?P<input_drops_delta>\d+)\s+'
-                r'(?P<output_drops>\d+)\/(?P<output_drops_delta>\d+))?$')
+        p3 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<input_bps>\d+)\/\s*(?P<input_bps_percent>[\S]+)%\s+'
+                          r'(?P<output_bps>\d+)\/\s*(?P<output_bps_percent>[\S]+)%\s+'
+                          r'(?P<input_bytes>[\d\.]+)(?P<int_bytes>\w?)\/(?P<input_delta>\d+)\s+'
+                          r'(?P<output_bytes>[\d\.]+)(?P<out_bytes>\w?)\/(?P<output_delta>\d+)'
+                          r'(?:\s+(?P<input_drops>\d+)\/(?P<input_drops_delta>\d+)\s+'
+                          r'(?P<output_drops>\d+)\/(?P<output_drops_delta>\d+))?$')
 
         #      0/  0%        0/  0%    81.1G/0         68.9G/0             0/0             0/0        TenGigE0/0/1/0
-        p3_1 = re.compile(r'^\s*(?P<input_bps>\d+)\/\s*'
-                          r'(?P<input_bps_percent>\S+)%\s+'
-                          r'(?P<output_bps>\d+)\/\s*'
-                          r'(?P<output_bps_percent>\S+)%\s+'
-                          r'(?P<input_bytes>[\d\.]+)(?P<int_bytes>\w?)\/'
-                          r'(?P<input_delta>\d+)\s+'
-                          r'(?P<output_bytes>[\d\.]+)(?P<out_bytes>\w?)\/'
-                          r'(?P<output_delta>\d+)'
-                          r'(?:\s+(?P<input_drops>\d+)\/(?P<input_drops_delta>\d+)\s+'
-                          r'(?P<output_drops>\d+)\/(?P<output_drops_delta>\d+))?\s*'
-                          r'(?P<interface>\S+)?$')
+        p3_1 = regex_engine.compile(r'^\s*(?P<input_bps>\d+)\/\s*'
+                                    r'(?P<input_bps_percent>\S+)%\s+'
+                                    r'(?P<output_bps>\d+)\/\s*'
+                                    r'(?P<output_bps_percent>\S+)%\s+'
+                                    r'(?P<input_bytes>[\d\.]+)(?P<int_bytes>\w?)\/'
+                                    r'(?P<input_delta>\d+)\s+'
+                                    r'(?P<output_bytes>[\d\.]+)(?P<out_bytes>\w?)\/'
+                                    r'(?P<output_delta>\d+)'
+                                    r'(?:\s+(?P<input_drops>\d+)\/(?P<input_drops_delta>\d+)\s+'
+                                    r'(?P<output_drops>\d+)\/(?P<output_drops_delta>\d+))?\s*'
+                                    r'(?P<interface>\S+)?$')
 
         # Gi0/0/0/1            (statistics not available)
-        p3_2 = re.compile(r'^(?P<interface>\S+)\s+\((?P<statistics>[\s\S]+)\)')
+        p3_2 = regex_engine.compile(r'^(?P<interface>\S+)\s+\((?P<statistics>[\s\S]+)\)')
 
         #                    (statistics not available)                                              EINT0/RSP1/CPU0
-        p3_3 = re.compile(r'^\s*(?P<statistics>\(statistics not available\))\s+(?P<interface>\S+)$')
+        p3_3 = regex_engine.compile(r'^\s*(?P<statistics>\(statistics not available\))\s+(?P<interface>\S+)$')
 
         # Interface : TenGigE0/0/1/0
-        p3_4 = re.compile(r'^Interface\s*:\s*(?P<interface>\S+)$')
+        p3_4 = regex_engine.compile(r'^Interface\s*:\s*(?P<interface>\S+)$')
 
         #      0/  0%        0/  0%    81.1G/0         68.9G/0           0/0             0/0           1/0           0/0           0/0           0/0           0/0           0/0
-        p3_5 = re.compile(r'^\s*(?P<input_bps>\d+)\/\s*(?P<input_bps_percent>\S+)%\s+'
-                          r'(?P<output_bps>\d+)\/\s*(?P<output_bps_percent>\S+)%\s+'
-                          r'(?P<input_bytes>[\d\.]+)(?P<int_bytes>\w?)\/(?P<input_delta>\d+)\s+'
-                          r'(?P<output_bytes>[\d\.]+)(?P<out_bytes>\w?)\/(?P<output_delta>\d+)'
-                          r'(?:\s+(?P<input_drops>\d+)\/(?P<input_drops_delta>\d+)\s+'
-                          r'(?P<output_drops>\d+)\/(?P<output_drops_delta>\d+))?\s+'
-                          r'(?P<err_in>\d+)\/(?P<err_in_delta>\d+)\s+'
-                          r'(?P<err_crc>\d+)\/(?P<err_crc_delta>\d+)\s+'
-                          r'(?P<err_fr>\d+)\/(?P<err_fr_delta>\d+)\s+'
-                          r'(?P<err_ovr>\d+)\/(?P<err_ovr_delta>\d+)\s+'
-                          r'(?P<err_out>\d+)\/(?P<err_out_delta>\d+)\s+'
-                          r'(?P<err_und>\d+)\/(?P<err_und_delta>\d+)\s*$')
+        p3_5 = regex_engine.compile(r'^\s*(?P<input_bps>\d+)\/\s*(?P<input_bps_percent>\S+)%\s+'
+                                    r'(?P<output_bps>\d+)\/\s*(?P<output_bps_percent>\S+)%\s+'
+                                    r'(?P<input_bytes>[\d\.]+)(?P<int_bytes>\w?)\/(?P<input_delta>\d+)\s+'
+                                    r'(?P<output_bytes>[\d\.]+)(?P<out_bytes>\w?)\/(?P<output_delta>\d+)'
+                                    r'(?:\s+(?P<input_drops>\d+)\/(?P<input_drops_delta>\d+)\s+'
+                                    r'(?P<output_drops>\d+)\/(?P<output_drops_delta>\d+))?\s+'
+                                    r'(?P<err_in>\d+)\/(?P<err_in_delta>\d+)\s+'
+                                    r'(?P<err_crc>\d+)\/(?P<err_crc_delta>\d+)\s+'
+                                    r'(?P<err_fr>\d+)\/(?P<err_fr_delta>\d+)\s+'
+                                    r'(?P<err_ovr>\d+)\/(?P<err_ovr_delta>\d+)\s+'
+                                    r'(?P<err_out>\d+)\/(?P<err_out_delta>\d+)\s+'
+                                    r'(?P<err_und>\d+)\/(?P<err_und_delta>\d+)\s*$')
 
         # MgmtEth0/RP0/CPU0/0 is up, line protocol is up
-        p4 = re.compile(r'^(?P<interface>\S+) +is +(?P<interface_status>\S+), '
-                        r'+line +protocol +is +(?P<line_protocol_status>\S+)$')
+        p4 = regex_engine.compile(r'^(?P<interface>\S+) +is +(?P<interface_status>\S+), '
+                                  r'+line +protocol +is +(?P<line_protocol_status>\S+)$')
 
         # Encapsulation 802.1Q
-        p5 = re.compile(r'^Encapsulation\s+(?P<encapsulation>.+)$')
+        p5 = regex_engine.compile(r'^Encapsulation\s+(?P<encapsulation>.+)$')
 
         # Input  Packets:                    282171                            0
-        p6 = re.compile(r'^Input\s+Packets:\s+(?P<input_packets>\d+)\s+'
-                        r'(?P<input_packets_delta>\d+)$')
+        p6 = regex_engine.compile(r'^Input\s+Packets:\s+(?P<input_packets>\d+)\s+'
+                                  r'(?P<input_packets_delta>\d+)$')
 
         # Input  pps:                           133
-        p7 = re.compile(r'^Input\s+pps:\s+(?P<input_pps>\d+)$')
+        p7 = regex_engine.compile(r'^Input\s+pps:\s+(?P<input_pps>\d+)$')
 
         # Input  Bytes:                   261447750                        40913
-        p8 = re.compile(r'^Input\s+Bytes:\s+(?P<input_bytes>\d+)\s+(?P<input_bytes_delta>\d+)$')
+        p8 = regex_engine.compile(r'^Input\s+Bytes:\s+(?P<input_bytes>\d+)\s+(?P<input_bytes_delta>\d+)$')
 
         # Input  Kbps (rate):                   176                       (  0%)
-        p9 = re.compile(r'^Input\s+Kbps\s+\(rate\):\s+(?P<input_kbps_rate>\S+)'
-                        r'\s+\((?P<input_kbps_delta>.*)\)$')
+        p9 = regex_engine.compile(r'^Input\s+Kbps\s+\(rate\):\s+(?P<input_kbps_rate>\S+)'
+                                  r'\s+\((?P<input_kbps_delta>.*)\)$')
 
         # Output Packets:                      1178                            0
-        p10 = re.compile(r'^Output\s+Packets:\s+(?P<output_packets>\d+)\s+'
-                         r'(?P<output_packets_delta>\d+)$')
+        p10 = regex_engine.compile(r'^Output\s+Packets:\s+(?P<output_packets>\d+)\s+'
+                                   r'(?P<output_packets_delta>\d+)$')
 
         # Output  pps:                           133
-        p11 = re.compile(r'^Output\s+pps:\s+(?P<output_pps>\d+)$')
+        p11 = regex_engine.compile(r'^Output\s+pps:\s+(?P<output_pps>\d+)$')
 
         # Output  Bytes:                   261447750                        40913
-        p12 = re.compile(r'^Output\s+Bytes:\s+(?P<output_bytes>\d+)\s+(?P<output_bytes_delta>\d+)$')
+        p12 = regex_engine.compile(r'^Output\s+Bytes:\s+(?P<output_bytes>\d+)\s+(?P<output_bytes_delta>\d+)$')
 
         # Output  Kbps (rate):                   176                       (  0%)
-        p13 = re.compile(r'^Output\s+Kbps\s+\(rate\):\s+(?P<output_kbps_rate>\S+)'
-                         r'\s+\((?P<output_kbps_delta>.*)\)$')
+        p13 = regex_engine.compile(r'^Output\s+Kbps\s+\(rate\):\s+(?P<output_kbps_rate>\S+)'
+                                   r'\s+\((?P<output_kbps_delta>.*)\)$')
 
         # Input  Total:                           0                            0
-        p14 = re.compile(r'^Input\s+Total:\s+(?P<input_total>\d+)\s+(?P<input_total_delta>\d+)$')
+        p14 = regex_engine.compile(r'^Input\s+Total:\s+(?P<input_total>\d+)\s+(?P<input_total_delta>\d+)$')
 
         # Input  CRC:                           0                            0
-        p15 = re.compile(r'^Input\s+CRC:\s+(?P<input_crc>\d+)\s+(?P<input_crc_delta>\d+)$')
+        p15 = regex_engine.compile(r'^Input\s+CRC:\s+(?P<input_crc>\d+)\s+(?P<input_crc_delta>\d+)$')
 
         # Input  Frame:                           0                            0
-        p16 = re.compile(r'^Input\s+Frame:\s+(?P<input_frame>\d+)\s+(?P<input_frame_delta>\d+)$')
+        p16 = regex_engine.compile(r'^Input\s+Frame:\s+(?P<input_frame>\d+)\s+(?P<input_frame_delta>\d+)$')
 
         # Input  Frame:
-        p16_1 = re.compile(r'^Input\s+Frame:$')
+        p16_1 = regex_engine.compile(r'^Input\s+Frame:$')
 
         #0                            0
-        p16_2 = re.compile(r'^(?P<input_frame>\d+)\s+(?P<input_frame_delta>\d+)$')
+        p16_2 = regex_engine.compile(r'^(?P<input_frame>\d+)\s+(?P<input_frame_delta>\d+)$')
 
         # Input  Overrun:                         0                            0
-        p17 = re.compile(r'^Input\s+Overrun:\s+(?P<input_overrun>\d+)\s+'
-                         r'(?P<input_overrun_delta>\d+)$')
+        p17 = regex_engine.compile(r'^Input\s+Overrun:\s+(?P<input_overrun>\d+)\s+'
+                                   r'(?P<input_overrun_delta>\d+)$')
 
         # Output  Total:                           0                            0
-        p18 = re.compile(r'^Output\s+Total:\s+(?P<output_total>\d+)\s+(?P<output_total_delta>\d+)$')
+        p18 = regex_engine.compile(r'^Output\s+Total:\s+(?P<output_total>\d+)\s+(?P<output_total_delta>\d+)$')
 
         # Output Underrun:                        0                            0
-        p19 = re.compile(r'^Output\s+Underrun:\s+(?P<output_underrun>\d+)\s+'
-                         r'(?P<output_underrun_delta>\d+)$')
+        p19 = regex_engine.compile(r'^Output\s+Underrun:\s+(?P<output_underrun>\d+)\s+'
+                                   r'(?P<output_underrun_delta>\d+)$')
 
         # Output Underrun:                        0
-        p19_1 = re.compile(r'^Output\s+Underrun:\s+(?P<output_underrun>\d+)$')
+        p19_1 = regex_engine.compile(r'^Output\s+Underrun:\s+(?P<output_underrun>\d+)$')
 
         #0
-        p19_2 = re.compile(r'^(?P<output_underrun_delta>\d+)$')
+        p19_2 = regex_engine.compile(r'^(?P<output_underrun_delta>\d+)$')
 
         # Input  Total Drops:                     0                            0
-        p20 = re.compile(r'^Input\s+Total Drops:\s*(?P<input_total_drops>\d+)\s*(?P<input_total_drops_delta>\d+)$')
+        p20 = regex_engine.compile(r'^Input\s+Total Drops:\s*(?P<input_total_drops>\d+)\s*(?P<input_total_drops_delta>\d+)$')
 
         # Output Total Drops:                     0                            0
-        p21 = re.compile(r'^Output Total Drops:\s*(?P<output_total_drops>\d+)\s*(?P<output_total_drops_delta>\d+)$')
+        p21 = regex_engine.compile(r'^Output Total Drops:\s*(?P<output_total_drops>\d+)\s*(?P<output_total_drops_delta>\d+)$')
 
         for line in out.splitlines():
 
             #To remove all ANSI directives
-            ansi_escape3 = re.compile(r'(\x9B|\x1B\[)[0-?]*[ -/]*[@-~]', flags=re.IGNORECASE)
+            ansi_escape3 = regex_engine.compile(r'(\x9B|\x1B\[)[0-?]*[ -/]*[@-~]', flags=re.IGNORECASE)
             line = ansi_escape3.sub('', line)
             line = line.strip()
 
@@ -4,14 +4,14 @@ IOSXR parsers for the following show commands:
     * ping {addr}
     * ping {addr} source {source} repeat {count}
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, SchemaTypeError, Schema)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class PingSchema(MetaParser):
     """ Schema for
             * ping {addr}
@@ -96,18 +96,18 @@ class Ping(PingSchema):
         result_per_line = []
         # Sending 10, 100-byte ICMP Echos to 192.168.0.1 timeout is 2 seconds:
         # Sending 10, 100-byte ICMP Echos to 10.229.1.1, timeout is 2 seconds:
-        p1 = re.compile(r'Sending +(?P<repeat>\d+), +(?P<data_bytes>\d+)-byte +ICMP +Echos +to +(?P<address>[\S\s]+),? +timeout +is +(?P<timeout>\d+) +seconds:')
+        p1 = regex_engine.compile(r'Sending +(?P<repeat>\d+), +(?P<data_bytes>\d+)-byte +ICMP +Echos +to +(?P<address>[\S\s]+),? +timeout +is +(?P<timeout>\d+) +seconds:')
 
         #Packet sent with a source address of 10.4.1.1
-        p2 = re.compile(r'Packet +sent +with +a +source +address +of +(?P<source>[\S\s]+)')
+        p2 = regex_engine.compile(r'Packet +sent +with +a +source +address +of +(?P<source>[\S\s]+)')
 
         # !!!!!!!
         # !.UQM?&
-        p3 = re.compile(r'[!\.UQM\?&]+')
+        p3 = regex_engine.compile(r'[!\.UQM\?&]+')
 
         # Success rate is 100 percent (100/100), round-trip min/avg/max = 1/2/14 ms
         # Success rate is 0 percent (0/5)
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'Success +rate +is +(?P<success_percent>\d+) +percent +\((?P<received>\d+)\/(?P<send>\d+)\)(, +round-trip +min/avg/max *= *(?P<min>\d+)/(?P<avg>\d+)/(?P<max>\d+) +(?P<unit>\w+))?'
         )
 
@@ -3,12 +3,12 @@
 show l2vpn bridge-domain
 """
 # Python
-import re
 from ipaddress import ip_address
 
 # Genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ====================================
@@ -113,55 +113,55 @@ class ShowL2vpnBridgeDomain(ShowL2vpnBridgeDomainSchema):
         # Bridge group: g1, bridge-domain: bd1, id: 0, state: up, ShgId: 0, MSTi: 0
         # Bridge group: ev-Multicast, bridge-domain: ev-Multicast-TV, id: 1, state: up, ShgId: 0, MSTi: 0
         # Bridge group: a_b, bridge-domain: CD, id: 2, state: admin down (Shutdown), ShgId: 0, MSTi: 0
-        p1 = re.compile(r'^Bridge +group: +(?P<bridge_group>\S+), +bridge\-domain: +'
+        p1 = regex_engine.compile(r'^Bridge +group: +(?P<bridge_group>\S+), +bridge\-domain: +'
             r'(?P<bridge_domain>\S+), +id: +(?P<id>\d+), +state: +(?P<state>[\w\s\(\)]+), +'
             r'ShgId: +(?P<shg_id>\d+), +MSTi: +(?P<mst_i>\d+)$')
 
         # Aging: 300 s, MAC limit: 4000, Action: none, Notification: syslog
         # Aging: 300 s, MAC limit: 100, Action: limit, no-flood, Notification: syslog, trap
-        p2 = re.compile(r'^Aging: +(?P<mac_aging_time>\d+) s, +MAC +limit: +(?P<mac_limit>\d+), +'
-                r'Action: +(?P<mac_limit_action>[\S ]+), +Notification: +'
-                r'(?P<mac_limit_notification>[\S ]+)$')
+        p2 = regex_engine.compile(r'^Aging: +(?P<mac_aging_time>\d+) s, +MAC +limit: +(?P<mac_limit>\d+), +'
+                          r'Action: +(?P<mac_limit_action>[\S ]+), +Notification: +'
+                          r'(?P<mac_limit_notification>[\S ]+)$')
 
         # Filter MAC addresses: 0
-        p3 = re.compile(r'^Filter +MAC +addresses: +(?P<filter_mac_address>\d+)$')
+        p3 = regex_engine.compile(r'^Filter +MAC +addresses: +(?P<filter_mac_address>\d+)$')
 
         # ACs: 1 (1 up), VFIs: 1, PWs: 1 (1 up)
-        p4 = re.compile(r'^ACs: +(?P<ac>\d+) +\((?P<ac_up>\d+) +up\), +VFIs: +(?P<vfi>\d+), +'
+        p4 = regex_engine.compile(r'^ACs: +(?P<ac>\d+) +\((?P<ac_up>\d+) +up\), +VFIs: +(?P<vfi>\d+), +'
             r'PWs: +(?P<pw>\d+) +\((?P<pw_up>\d+) +\w+\)(, +PBBs: +(?P<pbb>\d+)'
             r' +\((?P<pbb_up>\d+) +up\))?(, +VNIs: +(?P<vni>\d+) +\((?P<vni_up>\d+) +up\))?$')
 
         # Gi0/1/0/0, state: up, Static MAC addresses: 2, MSTi: 0 (unprotected)
-        p5 = re.compile(r'^(?P<interface>\S+), +state: +(?P<state>\w+), +Static +'
+        p5 = regex_engine.compile(r'^(?P<interface>\S+), +state: +(?P<state>\w+), +Static +'
             r'MAC +addresses: +(?P<static_mac_address>\d+)(, +MSTi: +(?P<mst_i>\d+)'
             r'( +\((?P<mst_i_state>\w+)\))?)?$')
         
         # BV100, state: up, BVI MAC addresses: 1
-        p5_1 = re.compile(r'^(?P<interface>\S+), +state: +(?P<state>\w+), +BVI +'
+        p5_1 = regex_engine.compile(r'^(?P<interface>\S+), +state: +(?P<state>\w+), +BVI +'
             r'MAC +addresses: +(?P<bvi_mac_address>\S+)$')
 
         # VFI 1
         # VFI vfi60 (up)
         # VFI string_LABEL_01 (up)
-        p6 = re.compile(r'^VFI\s+(?P<vfi>\S+)(\s*(\((?P<state>[\w\s]+)\))?\s*)$')
+        p6 = regex_engine.compile(r'^VFI\s+(?P<vfi>\S+)(\s*(\((?P<state>[\w\s]+)\))?\s*)$')
 
         # Neighbor 10.1.1.1 pw-id 1, state: up, Static MAC addresses: 0
         # Neighbor 172.16.152.13 pw-id 20161:10090, state: up, Static MAC addresses: 0
-        p7 = re.compile(r'Neighbor +(?P<neighbor>\S+) +pw-id +(?P<pw_id>[\d\:]+), +state: +'
+        p7 = regex_engine.compile(r'Neighbor +(?P<neighbor>\S+) +pw-id +(?P<pw_id>[\d\:]+), +state: +'
             r'(?P<state>\w+), +Static +MAC +addresses: +(?P<static_mac_address>\d+)$')
 
         # g1/bd1                           0     up         1/1            1/1 
-        p8 = re.compile(r'^(?P<bridge_group>\S+)\/(?P<bridge_domain_name>\S+) +(?P<id>\d+) +'
+        p8 = regex_engine.compile(r'^(?P<bridge_group>\S+)\/(?P<bridge_domain_name>\S+) +(?P<id>\d+) +'
             r'(?P<state>\w+) +(?P<ac>\d+)\/(?P<ac_up>\d+) +(?P<pw>\d+)\/(?P<pw_up>\d+)$')
         
         # EVPN, state: up
-        p9 = re.compile(r'^(?P<evpn>\S+), +state: +(?P<state>\w+)$')
+        p9 = regex_engine.compile(r'^(?P<evpn>\S+), +state: +(?P<state>\w+)$')
 
         # List of Access PWs:
-        p10 = re.compile(r'^List +of +Access +PWs:$')
+        p10 = regex_engine.compile(r'^List +of +Access +PWs:$')
 
         # List of VFIs:
-        p11 = re.compile(r'^List +of +VFIs:$')
+        p11 = regex_engine.compile(r'^List +of +VFIs:$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -4,14 +4,12 @@ IOSXR parsers for the following show commands:
     * show access-lists afi-all
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 # =======================================
 # Schema for 'show access-lists afi-all'
@@ -114,7 +112,7 @@ class ShowAclAfiAll(ShowAclAfiAllSchema):
 
         # ipv4 access-list acl_name
         # ipv6 access-list ipv6_acl
-        p1 = re.compile(r'^(?P<ip>(ipv4|ipv6)) +access\-list +(?P<name>[\w\-\.#]+)$')
+        p1 = regex_engine.compile(r'^(?P<ip>(ipv4|ipv6)) +access\-list +(?P<name>[\w\-\.#]+)$')
 
         # 10 permit tcp any any eq www
         # 30 permit tcp any any eq 443
@@ -122,7 +120,7 @@ class ShowAclAfiAll(ShowAclAfiAllSchema):
         # 20 permit tcp host 10.16.2.2 eq www any precedence network ttl eq 255
         # 30 deny ipv4 any any
         # 10 permit ipv4 10.1.21.0 0.0.0.255 10.196.6.0 0.0.0.255
-        p2 = re.compile(r'^(?P<seq>\d+) +(?P<actions_forwarding>permit|deny) +'
+        p2 = regex_engine.compile(r'^(?P<seq>\d+) +(?P<actions_forwarding>permit|deny) +'
             r'(?P<protocol>tcp|ipv4|ipv6) +(?P<src>(([\d\.]+ +[\d\.]+)|any|'
             r'(host +[\d\.:]+))|([\d\.]+ +[\d\.]+))( ?(?P<src_operator>eq) +'
             r'(?P<src_port>\w+))? +(?P<dst>(host +[\d\.:]+)|any|([\d\.]+ +'
@@ -228,13 +226,13 @@ class ShowAclEthernetServices(ShowAclAfiAllSchema):
             out = output
 
         # ethernet-services access-list eth_acl
-        p1 = re.compile(r'^(?P<ip>(ethernet-services)) +access\-list +(?P<name>[\w\-\.#]+)$')
+        p1 = regex_engine.compile(r'^(?P<ip>(ethernet-services)) +access\-list +(?P<name>[\w\-\.#]+)$')
 
         # 10 permit host 0000.0000.0000 host 0000.0000.0000
         # 20 deny host 0000.0000.0000 host 0000.0000.0000 8041
         # 30 deny host 0000.0000.0000 host 0000.0000.0000 vlan 10
         # 40 permit host aaaa.aaff.5555 host bbbb.bbff.7777 80f3
-        p2 = re.compile(r'^(?P<seq>\d+) +(?P<actions_forwarding>permit|deny)? +'
+        p2 = regex_engine.compile(r'^(?P<seq>\d+) +(?P<actions_forwarding>permit|deny)? +'
             r'(?P<source_mac_address>(any|(host +[\d\.\w]+))|([\d\.]+ +[\d\.]+))'
             r' +(?P<destination_mac_address>(host +[\d\.\w]+)|any)( +'
             r'(?P<ether_type_dynamic>\w+) +(?P<ether_type_value>\d+))?'
@@ -6,10 +6,8 @@ IOSXR parsers for the following commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
@@ -65,13 +63,13 @@ class ShowArmIpv4Conflicts(ShowArmIpv4ConflictsSchema):
         result_dict = {}    
         
         # F Forced down
-        p1 = re.compile(r'^(?P<forced_down>\D) +Forced down')
+        p1 = regex_engine.compile(r'^(?P<forced_down>\D) +Forced down')
            
         # F Lo2 10.1.1.2/24                          Lo1 10.1.1.1/24
-        p2 = re.compile(r'^(?:F +(?P<down_interface>\S+) +(?P<down_address>\S+))? +(?:(?P<up_interface>\S+) +(?P<up_address>\S+))?')
+        p2 = regex_engine.compile(r'^(?:F +(?P<down_interface>\S+) +(?P<down_address>\S+))? +(?:(?P<up_interface>\S+) +(?P<up_address>\S+))?')
         
         # tu2->tu1                       tu1->Lo1
-        p3 = re.compile(r'^(?:(?P<unnumbered_down_interface>\w+)->(?P<unnum_down_due>\w+))? +(?:(?P<unnumbered_up_interface>\w+)->(?P<unnum_up_due>\w+))?')
+        p3 = regex_engine.compile(r'^(?:(?P<unnumbered_down_interface>\w+)->(?P<unnum_down_due>\w+))? +(?:(?P<unnumbered_up_interface>\w+)->(?P<unnum_up_due>\w+))?')
         
         for line in output.splitlines():
             line = line.strip()
@@ -14,6 +14,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =============================================
@@ -62,23 +63,23 @@ class ShowBfdSession(ShowBfdSessionSchema):
         result_dict = {}
         
         #Gi0/0/0/36.52       10.129.196.34   450ms(150ms*3)   6s(2s*3)         UP
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<intf>\S+) +(?P<dest>\d+\.\d+\.\d+\.\d+) +(?P<echo_total_msec>\d+\w+)\((?P<echo_msec>\d+\w+)\*(?P<echo_multiplier>\d+)\) +(?P<async_total_msec>\d+\w+)\((?P<async_msec>\d+\w+)\*(?P<async_multiplier>\d+)\) +(?P<state>\S+)')
         
         #Gi0/0/0/26.110      10.0.221.98     0s               0s               DOWN DAMP
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<intf>\S+) +(?P<dest>\d+\.\d+\.\d+\.\d+) +(?P<echo_total_msec>\d+\w+) +(?P<async_total_msec>\d+\w+) +(?P<state>\S+) ?(?P<damp>\S+)?')
         
         #BE300               172.16.253.53   n/a              n/a              UP
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<intf>\S+) +(?P<dest>\d+\.\d+\.\d+\.\d+) +(?P<echo_total_msec>\w+\/\w+) +(?P<async_total_msec>\w+\/\w+) +(?P<state>\S+) ?(?P<damp>\S+)?')
         
         #                                                             No    n/a
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'(?P<hw>[No|Yes]+) +(?P<npu>\S+)')
 
         #Gi0/0/0/1.10        192.168.1.2     0s               10s(2s*5)        INIT
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^(?P<intf>\S+) +(?P<dest>\d+\.\d+\.\d+\.\d+) +(?P<echo_total_msec>\d+\w+) +(?P<async_total_msec>\d+\w+)\((?P<async_msec>\d+\w+)\*(?P<async_multiplier>\d+)\) +(?P<state>\S+)')
 
         for line in out.splitlines():
@@ -305,110 +306,110 @@ class ShowBfdSessionDestinationDetails(ShowBfdSessionDestinationDetailsSchema):
         result_dict = {}
 
         # I/f: GigabitEthernet0/0/0/0, Location: 0/0/CPU0
-        p1 = re.compile(r'I/f: +(?P<interface>[\S\s]+), '
-                        r'+Location: +(?P<location>[\S\s]+)')
+        p1 = regex_engine.compile(r'I/f: +(?P<interface>[\S\s]+), '
+                                  r'+Location: +(?P<location>[\S\s]+)')
 
         # Dest: 10.4.1.1
-        p2 = re.compile(r'Dest: +(?P<dest>[\S\s]+)')
+        p2 = regex_engine.compile(r'Dest: +(?P<dest>[\S\s]+)')
 
         # Src: 10.4.1.2
-        p3 = re.compile(r'Src: +(?P<src>[\S\s]+)')
+        p3 = regex_engine.compile(r'Src: +(?P<src>[\S\s]+)')
 
         #  State: UP for 0d:0h:5m:50s, number of times UP: 1
-        p4 = re.compile(r'State: +(?P<state>UP|DOWN|Up|Down|up|down)'
-                        r' +for +(?P<duration>[\S\s]+),'
-                        r' +number +of +times +UP: +(?P<num_of_times_up>[\d]+)')
+        p4 = regex_engine.compile(r'State: +(?P<state>UP|DOWN|Up|Down|up|down)'
+                                  r' +for +(?P<duration>[\S\s]+),'
+                                  r' +number +of +times +UP: +(?P<num_of_times_up>[\d]+)')
 
         #  Session type: PR/V4/SH
-        p5 = re.compile(r'Session +type: +(?P<type>[\S\s]+)')
+        p5 = regex_engine.compile(r'Session +type: +(?P<type>[\S\s]+)')
 
         # Received parameters:
         # Transmitted parameters:
-        p6 = re.compile(r'(?P<param>Received|Transmitted) +parameters')
+        p6 = regex_engine.compile(r'(?P<param>Received|Transmitted) +parameters')
 
         #  Version: 1, desired tx interval: 500 ms, required rx interval: 500 ms
-        p7 = re.compile(r'Version: +(?P<version>\d+),'
-                        r' +desired +tx +interval:'
-                        r' +(?P<tx_interval>\d+) +(?P<tx_interval_unit>\w+),'
-                        r' +required +rx +interval: +(?P<rx_interval>\d+)'
-                        r' +(?P<rx_interval_unit>\w+)')
+        p7 = regex_engine.compile(r'Version: +(?P<version>\d+),'
+                                  r' +desired +tx +interval:'
+                                  r' +(?P<tx_interval>\d+) +(?P<tx_interval_unit>\w+),'
+                                  r' +required +rx +interval: +(?P<rx_interval>\d+)'
+                                  r' +(?P<rx_interval_unit>\w+)')
 
         #  Required echo rx interval: 0 ms, multiplier: 6, diag: None
-        p8 = re.compile(r'Required echo rx interval:'
-                        r' +(?P<echo_rx_interval>\d+)'
-                        r' +(?P<echo_rx_interval_unit>[\w]+),'
-                        r' +multiplier: (?P<multiplier>\d+),'
-                        r' +diag: +(?P<diag>[\S\s]+)')
+        p8 = regex_engine.compile(r'Required echo rx interval:'
+                                  r' +(?P<echo_rx_interval>\d+)'
+                                  r' +(?P<echo_rx_interval_unit>[\w]+),'
+                                  r' +multiplier: (?P<multiplier>\d+),'
+                                  r' +diag: +(?P<diag>[\S\s]+)')
 
         # My discr: 18, your discr: 2148532226, state UP, D/F/P/C/A: 0/0/0/1/0
-        p9 = re.compile(r'My +discr: +(?P<my_discr>\d+), +your +discr:'
-                        r' +(?P<your_discr>\d+), +state +(?P<state>(ADMIN +)?(UP|DOWN)),'
-                        r' +D\/F\/P\/C\/A: +(?P<d_f_p_c_a>[\d\/]+)')
+        p9 = regex_engine.compile(r'My +discr: +(?P<my_discr>\d+), +your +discr:'
+                                  r' +(?P<your_discr>\d+), +state +(?P<state>(ADMIN +)?(UP|DOWN)),'
+                                  r' +D\/F\/P\/C\/A: +(?P<d_f_p_c_a>[\d\/]+)')
         
         # Timer Values:
-        p10 = re.compile(r'Timer +Values:')
+        p10 = regex_engine.compile(r'Timer +Values:')
 
         # Local negotiated async tx interval: 500 ms
-        p11 = re.compile(r'Local +negotiated +async +tx +interval:'
-                         r' +(?P<tx_interval>\d+) +(?P<tx_interval_unit>[\w]+)')
+        p11 = regex_engine.compile(r'Local +negotiated +async +tx +interval:'
+                                   r' +(?P<tx_interval>\d+) +(?P<tx_interval_unit>[\w]+)')
 
         # Remote negotiated async tx interval: 500 ms
-        p12 = re.compile(r'Remote +negotiated +async +tx +interval:'
-                         r' +(?P<tx_interval>\d+) +(?P<tx_interval_unit>[\w]+)')
+        p12 = regex_engine.compile(r'Remote +negotiated +async +tx +interval:'
+                                   r' +(?P<tx_interval>\d+) +(?P<tx_interval_unit>[\w]+)')
         
         # Desired echo tx interval: 500 ms, local negotiated echo tx interval: 0 ms
-        p13 = re.compile(r'Desired +echo +tx +interval:'
-                         r' +(?P<echo_tx>\d+) +(?P<echo_tx_unit>\w+),'
-                         r' +local +negotiated +echo +tx +interval:'
-                         r' +(?P<local_echo_tx>\d+) +(?P<local_echo_tx_unit>\w+)')
+        p13 = regex_engine.compile(r'Desired +echo +tx +interval:'
+                                   r' +(?P<echo_tx>\d+) +(?P<echo_tx_unit>\w+),'
+                                   r' +local +negotiated +echo +tx +interval:'
+                                   r' +(?P<local_echo_tx>\d+) +(?P<local_echo_tx_unit>\w+)')
 
         # Echo detection time: 0 ms(0 ms*6), async detection time: 3 s(500 ms*6)
-        p14 = re.compile(r'Echo +detection +time:'
-                         r' +(?P<echo_time>\d+) +(?P<echo_time_unit>\w+)(\([\S\s]+\))?,'
-                         r' +async +detection +time:'
-                         r' +(?P<async_time>\d+) +(?P<async_time_unit>\w+)(\([\S\s]+\))?')
+        p14 = regex_engine.compile(r'Echo +detection +time:'
+                                   r' +(?P<echo_time>\d+) +(?P<echo_time_unit>\w+)(\([\S\s]+\))?,'
+                                   r' +async +detection +time:'
+                                   r' +(?P<async_time>\d+) +(?P<async_time_unit>\w+)(\([\S\s]+\))?')
         
         # Local Stats:
-        p15 = re.compile(r'Local +Stats:')
+        p15 = regex_engine.compile(r'Local +Stats:')
 
         #  Intervals between async packets:
         #  Intervals between echo packets:
-        p16 = re.compile(r'Intervals +between +(?P<packet_type>async|echo) packets:')
+        p16 = regex_engine.compile(r'Intervals +between +(?P<packet_type>async|echo) packets:')
 
         #   Tx: Number of intervals=100, min=1 ms, max=500 ms, avg=229 ms
         #   Rx: Number of intervals=100, min=490 ms, max=513 ms, avg=500 ms
-        p17 = re.compile(r'(?P<rx_tx>Tx|Rx): +Number +of +intervals=(?P<num_intervals>\d+),'
-                         r' +min=(?P<min>\d+) +(?P<min_unit>\w+),'
-                         r' +max=(?P<max>\d+) +(?P<max_unit>\w+),'
-                         r' +avg=(?P<avg>\d+) +(?P<avg_unit>\w+)')
+        p17 = regex_engine.compile(r'(?P<rx_tx>Tx|Rx): +Number +of +intervals=(?P<num_intervals>\d+),'
+                                   r' +min=(?P<min>\d+) +(?P<min_unit>\w+),'
+                                   r' +max=(?P<max>\d+) +(?P<max_unit>\w+),'
+                                   r' +avg=(?P<avg>\d+) +(?P<avg_unit>\w+)')
 
         #       Last packet transmitted 48 ms ago
         #       Last packet received 304 ms ago
         #       Last packet transmitted 0 s ago
         #       Last packet received 0 s ago
-        p18 = re.compile(r'Last +packet +(?P<packet_direction>transmitted|received) +(?P<packet>\d+)'
-                         r' +(?P<packet_unit>\w+) +ago')
+        p18 = regex_engine.compile(r'Last +packet +(?P<packet_direction>transmitted|received) +(?P<packet>\d+)'
+                                   r' +(?P<packet_unit>\w+) +ago')
 
         # Latency of echo packets (time between tx and rx):
-        p19 = re.compile(r'Latency +of +echo +packets +\(time +between +tx +and +rx\):')
+        p19 = regex_engine.compile(r'Latency +of +echo +packets +\(time +between +tx +and +rx\):')
 
         #   Number of packets: 0, min=0 ms, max=0 ms, avg=0 ms 
-        p20 = re.compile(r'Number +of +packets: +(?P<num_packets>\d+),'
-                         r' +min=(?P<min>\d+) +(?P<min_unit>\w+),'
-                         r' +max=(?P<max>\d+) +(?P<max_unit>\w+),'
-                         r' +avg=(?P<avg>\d+) +(?P<avg_unit>\w+)')
+        p20 = regex_engine.compile(r'Number +of +packets: +(?P<num_packets>\d+),'
+                                   r' +min=(?P<min>\d+) +(?P<min_unit>\w+),'
+                                   r' +max=(?P<max>\d+) +(?P<max_unit>\w+),'
+                                   r' +avg=(?P<avg>\d+) +(?P<avg_unit>\w+)')
 
         # Session owner information:
-        p21 = re.compile(r'Session +owner +information:')
+        p21 = regex_engine.compile(r'Session +owner +information:')
 
         #   ipv4_static          500 ms     6          500 ms     6
-        p22 = re.compile(r'(?P<client>[\S\s]+)'
-                         r' +(?P<desired_interval>\d+)'
-                         r' +(?P<desired_interval_unit>\w+)'
-                         r' +(?P<desired_multiplier>\d+)'
-                         r' +(?P<adjusted_interval>\d+)'
-                         r' +(?P<adjusted_interval_unit>\w+)'
-                         r' +(?P<adjusted_multiplier>\d+)')
+        p22 = regex_engine.compile(r'(?P<client>[\S\s]+)'
+                                   r' +(?P<desired_interval>\d+)'
+                                   r' +(?P<desired_interval_unit>\w+)'
+                                   r' +(?P<desired_multiplier>\d+)'
+                                   r' +(?P<adjusted_interval>\d+)'
+                                   r' +(?P<adjusted_interval_unit>\w+)'
+                                   r' +(?P<adjusted_multiplier>\d+)')
 
         dfpca_dict = {'d': 'demand_bit',
                       'f': 'final_bit',
@@ -733,20 +734,20 @@ class ShowBfdSessionDestination(ShowBfdSessionDestinationSchema):
         ret_dict = {}
         
         # Gi0/0/0/0           2001:10::1 
-        p1 = re.compile(r'^(((?P<hardware>(No|Yes)) +(?P<npu>\S+))|(?P<interface>\S+) +(?P<dest>[\w\:\/]+))$')
+        p1 = regex_engine.compile(r'^(((?P<hardware>(No|Yes)) +(?P<npu>\S+))|(?P<interface>\S+) +(?P<dest>[\w\:\/]+))$')
 
         # Te0/0/2/2           10.0.0.1        0s(0s*0)         450ms(150ms*3)   UP
         # Gi0/0/0/0           10.0.0.1        0s               12s              DOWN
-        p2 = re.compile(r'^(((?P<hardware>(No|Yes)) +(?P<npu>\S+))|((?P<interface>\S+) +(?P<dest>\S+))) +'
+        p2 = regex_engine.compile(r'^(((?P<hardware>(No|Yes)) +(?P<npu>\S+))|((?P<interface>\S+) +(?P<dest>\S+))) +'
             r'(?P<echo_detection_time>(?P<echo_time>\d+) *(?P<echo_time_unit>\w+)(\((?P<echo_detection_interval_ms>\d+)[\w ]+\*(?P<echo_detection_multiplier>\d+)\))?) +'
             r'(?P<async_detection_time>(?P<async_time>\d+) *(?P<async_time_unit>\w+)(\((?P<async_detection_interval_ms>\d+)[\w ]+\*(?P<async_detection_multiplier>\d+)\))?) +'
             r'(?P<state>\S+)$')
 
         # No                  n/a             n/a              n/a              UP
-        p3 = re.compile(r'(?P<hardware>(No|Yes))\s+(?P<npu>[n\/a]+)\s+(?P<echo_detection_time>[n\/a]+)\s+(?P<async_detection_time>[n\/a]+)\s+(?P<state>\S+)')
+        p3 = regex_engine.compile(r'(?P<hardware>(No|Yes))\s+(?P<npu>[n\/a]+)\s+(?P<echo_detection_time>[n\/a]+)\s+(?P<async_detection_time>[n\/a]+)\s+(?P<state>\S+)')
 
         # BE10                1.1.1.1         n/a              n/a              DOWN
-        p4 = re.compile(r'^(?P<interface>\S+)\s+(?P<dest>\S+)\s+(?P<echo_detection_time>[n\/a]+)\s+(?P<async_detection_time>[n\/a]+)\s+(?P<state>\S+)$')
+        p4 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<dest>\S+)\s+(?P<echo_detection_time>[n\/a]+)\s+(?P<async_detection_time>[n\/a]+)\s+(?P<state>\S+)$')
 
 
         for line in out.splitlines():
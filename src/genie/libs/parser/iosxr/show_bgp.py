@@ -58,7 +58,6 @@ IOSXR parsers for the following show commands:
 """
 
 # Python
-import re
 import logging
 import collections
 from ipaddress import ip_address, ip_network
@@ -73,6 +72,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 # Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # Logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -124,11 +126,11 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
         ret_dict = {}
 
         #  Egress Engineering Peer Set: 192.168.1.2/32 (10b87210)
-        p1 = re.compile(r'Egress +Engineering +Peer +Set: +(?P<prefix>[\d\/\.]+) '
+        p1 = regex_engine.compile(r'Egress +Engineering +Peer +Set: +(?P<prefix>[\d\/\.]+) '
         r'+(?P<peer_set_id>\S+)')
 
         #   Version: 2, rn_version: 2
-        p2 = re.compile(r'(?P<key_1>[\w\s]+): +(?P<value_1>[\S\s]+), +(?P<key_2>[\w\s]+): '
+        p2 = regex_engine.compile(r'(?P<key_1>[\w\s]+): +(?P<value_1>[\S\s]+), +(?P<key_2>[\w\s]+): '
         r'+(?P<value_2>\d+)')
 
         #    Local ASN: 1
@@ -137,7 +139,7 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
         #     Remote RID: 10.4.1.4
         #     First Hop: 192.168.1.2
         #         NHID: 3
-        p3 = re.compile(r'(?P<key>[\w\s]+): (?P<value>[\S\s]+)')
+        p3 = regex_engine.compile(r'(?P<key>[\w\s]+): (?P<value>[\S\s]+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -226,14 +228,14 @@ class ShowBgpInstances(ShowBgpInstancesSchema):
         else:
             out = output
 
-        p1 = re.compile(r'^(?P<instance_id>\d+) +(?P<placed_grp>[\w\_|\-]+) '
-                        r'+(?P<instance>[\w\-]+) +(?P<bgp_id>[\d\.]+) '
-                        r'+(?P<num_vrfs>\d+)? +(?P<address_family>[\w\s\,\-]+)$')
+        p1 = regex_engine.compile(r'^(?P<instance_id>\d+) +(?P<placed_grp>[\w\_|\-]+) '
+                                  r'+(?P<instance>[\w\-]+) +(?P<bgp_id>[\d\.]+) '
+                                  r'+(?P<num_vrfs>\d+)? +(?P<address_family>[\w\s\,\-]+)$')
 
-        p1_1 = re.compile(r'(ID +Placed-Grp +Name +AS +VRFs +Address +Families)|(\-)+')
-        p2 = re.compile(r'^(?P<address_family>[(IPv|VPNv)\d Unicast\,]+)$')
-        p3 = re.compile(r'^Number +of +BGP +instances\: '
-                        r'+(?P<number_of_bgp_instances>\d+)$')
+        p1_1 = regex_engine.compile(r'(ID +Placed-Grp +Name +AS +VRFs +Address +Families)|(\-)+')
+        p2 = regex_engine.compile(r'^(?P<address_family>[(IPv|VPNv)\d Unicast\,]+)$')
+        p3 = regex_engine.compile(r'^Number +of +BGP +instances\: '
+                                  r'+(?P<number_of_bgp_instances>\d+)$')
 
         ret_dict = {}
 
@@ -345,14 +347,14 @@ class ShowPlacementProgramAll(ShowPlacementProgramAllSchema):
             out = output
 
         ret_dict = {}
-        p1 = re.compile(r'^\s*(?P<program>[a-zA_Z0-9\_\-]+)'
-                        r'(?:\((?P<instance>\S+)\))?'
-                        r' +(?P<group>\S+)'
-                        r' +(?P<jid>\S+)'
-                        r' +(?P<active_rp>\S+)'
-                        r' +(?P<active_state>\S+)'
-                        r' +(?P<standby_rp>\S+)'
-                        r' +(?P<standby_state>\S+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<program>[a-zA_Z0-9\_\-]+)'
+                                  r'(?:\((?P<instance>\S+)\))?'
+                                  r' +(?P<group>\S+)'
+                                  r' +(?P<jid>\S+)'
+                                  r' +(?P<active_rp>\S+)'
+                                  r' +(?P<active_state>\S+)'
+                                  r' +(?P<standby_rp>\S+)'
+                                  r' +(?P<standby_state>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -455,37 +457,37 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
             out = output
 
         ret_dict = {}
-        pp1 = re.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
-                         r'(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
-                         r' +af-group +(?P<pp_name>[a-zA-Z0-9\-\_]+)')
-        p1 = re.compile(r'^af\-group +(?P<pp>[\w\-\.\:]+) +'
-                        r'address\-family +(?P<af>[\w\s]+)$')
-        p2 = re.compile(r'^default\-originate *(policy)? *'
-                        r'(?P<policy>[\w\-\.\:\s]+)? +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p3 = re.compile(r'^maximum\-prefix +'
-                        r'(?P<no>[\d]+)? +(?P<th>[\d]+)? +(?P<re>[\d]+)? +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p4 = re.compile(r'^next\-hop\-self +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p5 = re.compile(r'^policy +(?P<map>[\w]+) +in +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p6 = re.compile(r'^policy +(?P<map>[\w]+) +out +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p7 = re.compile(r'^route\-reflector\-client +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p8 = re.compile(r'^send\-community\-ebgp +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p9 = re.compile(r'^send\-extended\-community\-ebgp +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p10 = re.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+) +'
-                         r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p11 = re.compile(r'^soft\-reconfiguration +(?P<soft>[\w\s]+) +'
-                         r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p12 = re.compile(r'^allowas\-in +(?P<al>\d+)? *'
-                         r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p13 = re.compile(r'^as\-override *'
-                         r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        pp1 = regex_engine.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
+                                   r'(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
+                                   r' +af-group +(?P<pp_name>[a-zA-Z0-9\-\_]+)')
+        p1 = regex_engine.compile(r'^af\-group +(?P<pp>[\w\-\.\:]+) +'
+                                  r'address\-family +(?P<af>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^default\-originate *(policy)? *'
+                                  r'(?P<policy>[\w\-\.\:\s]+)? +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p3 = regex_engine.compile(r'^maximum\-prefix +'
+                                  r'(?P<no>[\d]+)? +(?P<th>[\d]+)? +(?P<re>[\d]+)? +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p4 = regex_engine.compile(r'^next\-hop\-self +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p5 = regex_engine.compile(r'^policy +(?P<map>[\w]+) +in +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p6 = regex_engine.compile(r'^policy +(?P<map>[\w]+) +out +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p7 = regex_engine.compile(r'^route\-reflector\-client +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p8 = regex_engine.compile(r'^send\-community\-ebgp +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p9 = regex_engine.compile(r'^send\-extended\-community\-ebgp +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p10 = regex_engine.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+) +'
+                                   r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p11 = regex_engine.compile(r'^soft\-reconfiguration +(?P<soft>[\w\s]+) +'
+                                   r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p12 = regex_engine.compile(r'^allowas\-in +(?P<al>\d+)? *'
+                                   r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p13 = regex_engine.compile(r'^as\-override *'
+                                   r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
 
         cmd = ''
 
@@ -775,36 +777,36 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
         ret_dict = {}
 
         cmd = ''
-        pp1 = re.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
-                         r'(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
-                         r'(?: +neighbor +(?P<neighbor_id>[0-9\.\:]+) +use)?'
-                         r' +session-group +(?P<ps_name>[a-zA-Z0-9\-\_]+)')
-        p2 = re.compile(r'^remote\-as +(?P<as>\d+)? +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p3 = re.compile(r'^description +(?P<descr>[\w\,\.\:\-\s]+) +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p4 = re.compile(r'^ebgp\-multihop +(?P<num>\d+)? *'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p5 = re.compile(r'^local\-as +(?P<as>\d+) +(?P<v1>no\-prepend)? +'
-                        r'(?P<v2>replace\-as)? *(?P<v3>dual\-as)? *'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p6 = re.compile(r'^password +encrypted +(?P<psw>\w+) +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p7 = re.compile(r'^shutdown +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p8 = re.compile(r'^timers +(?P<keep>\d+) +'
-                        r'(?P<hold>\d+) +(?P<mim>\d+)? *'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p9 = re.compile(r'^update\-source +(?P<intf>[\w\.\/]+) +'
-                        r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p10 = re.compile(r'^suppress\-4byteas +'
-                         r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p11 = re.compile(r'^session\-open\-mode +(?P<mode>[\w\-]+) +'
-                         r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p12 = re.compile(r'^bfd fast-detect +'
-                         r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p13 = re.compile(r'^ignore\-connected *'
-                         r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        pp1 = regex_engine.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
+                                   r'(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
+                                   r'(?: +neighbor +(?P<neighbor_id>[0-9\.\:]+) +use)?'
+                                   r' +session-group +(?P<ps_name>[a-zA-Z0-9\-\_]+)')
+        p2 = regex_engine.compile(r'^remote\-as +(?P<as>\d+)? +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p3 = regex_engine.compile(r'^description +(?P<descr>[\w\,\.\:\-\s]+) +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p4 = regex_engine.compile(r'^ebgp\-multihop +(?P<num>\d+)? *'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p5 = regex_engine.compile(r'^local\-as +(?P<as>\d+) +(?P<v1>no\-prepend)? +'
+                                  r'(?P<v2>replace\-as)? *(?P<v3>dual\-as)? *'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p6 = regex_engine.compile(r'^password +encrypted +(?P<psw>\w+) +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p7 = regex_engine.compile(r'^shutdown +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p8 = regex_engine.compile(r'^timers +(?P<keep>\d+) +'
+                                  r'(?P<hold>\d+) +(?P<mim>\d+)? *'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p9 = regex_engine.compile(r'^update\-source +(?P<intf>[\w\.\/]+) +'
+                                  r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p10 = regex_engine.compile(r'^suppress\-4byteas +'
+                                   r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p11 = regex_engine.compile(r'^session\-open\-mode +(?P<mode>[\w\-]+) +'
+                                   r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p12 = regex_engine.compile(r'^bfd fast-detect +'
+                                   r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+        p13 = regex_engine.compile(r'^ignore\-connected *'
+                                   r'\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
 
         for line1 in out.splitlines():
             line1 = line1.strip()
@@ -1208,109 +1210,109 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                                                    vrf=vrf))
         else:
             out = output
-        p1 = re.compile(r'^\s*BGP +instance +(?P<num>\S+): +\'(?P<instance>\S+)\'$')
-        p1_1 = re.compile(r'^\s*VRF: +(?P<vrf>[a-zA-Z0-9\_]+)$')
-        p1_1_1 = re.compile(r'^BGP +Process +Information: +VRF +(?P<vrf>[\S]+)$')
-        p1_2 = re.compile(r'^\s*BGP *Route *Distinguisher:'
-                          r' *(?P<route_distinguisher>\S+)$')
-        p2 = re.compile(r'BGP *is *operating *in *'
-                        r'(?P<operation_mode>\w+) *mode$')
-        p3 = re.compile(r'^Autonomous *System *number *format: *'
-                        r'(?P<as_format>[a-zA-Z]+)$')
+        p1 = regex_engine.compile(r'^\s*BGP +instance +(?P<num>\S+): +\'(?P<instance>\S+)\'$')
+        p1_1 = regex_engine.compile(r'^\s*VRF: +(?P<vrf>[a-zA-Z0-9\_]+)$')
+        p1_1_1 = regex_engine.compile(r'^BGP +Process +Information: +VRF +(?P<vrf>[\S]+)$')
+        p1_2 = regex_engine.compile(r'^\s*BGP *Route *Distinguisher:'
+                                    r' *(?P<route_distinguisher>\S+)$')
+        p2 = regex_engine.compile(r'BGP *is *operating *in *'
+                                  r'(?P<operation_mode>\w+) *mode$')
+        p3 = regex_engine.compile(r'^Autonomous *System *number *format: *'
+                                  r'(?P<as_format>[a-zA-Z]+)$')
 
         #Autonomous System: 65108.65108
-        p4 = re.compile(r'^Autonomous *System: *(?P<as_number>[0-9\.]+)$')
-        p5 = re.compile(r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
-                        r'(\([\w\s]+\))?$')
-        p6_1 = re.compile(r'^Default *Cluster *ID: *'
-                          r'(?P<default_cluster_id>[\w\.\:]+) *'
-                          r'(\([\w\s\:\.\,]+\))?$')
-        p6_2 = re.compile(r'^Active *Cluster *IDs: *'
-                          r'(?P<active_cluster_id>[\w\.\:]+)$')
-        p7_1 = re.compile(r'^Always compare MED is enabled$')
-        p7_2 = re.compile(r'^Comparing router ID for eBGP paths$')
-        p7_4 = re.compile(r'^Treating missing MED as worst$')
-        p8 = re.compile(r'^Fast +external +fallover +enabled$')
-        p9 = re.compile(r'^Platform *RLIMIT *max: *'
-                        r'(?P<platform_rlimit_max>[0-9\,]+) *bytes$')
-        p10 = re.compile(r'^Maximum +limit +for +BMP +buffer +size: *'
-                         r'(?P<size>[a-zA-Z0-9]+) *MB$')
-        p11 = re.compile(r'^Default *value *for *BMP *buffer *size: *'
-                         r'(?P<size>[a-zA-Z0-9]+) *MB$')
-        p12 = re.compile(r'^Current *limit *for *BMP *buffer *size: *'
-                         r'(?P<size>[a-zA-Z0-9]+) *MB$')
-        p13 = re.compile(r'^Current *utilization *of *BMP *buffer *'
-                         r'limit: *(?P<limit>[a-zA-Z0-9]+) *B$')
-        p14 = re.compile(r'^Neighbor *logging *is *(?P<nbr_logging>\w+)$')
-        p15 = re.compile(r'^Enforce +first +AS +(?P<as_enabled>\w+)$')
-        p16 = re.compile(r'^Default *local *preference: *'
-                         r'(?P<preference>[0-9]+)$')
-        p17 = re.compile(r'^Default *keepalive: *(?P<keepalive>[0-9]+)$')
-        p18 = re.compile(r'^Non\-stop *routing *is +(?P<status>[a-zA-Z]+)$')
-        p19 = re.compile(r'^Update *delay: *(?P<update_delay>[0-9]+)$')
-        p20 = re.compile(r'^Generic *scan *interval: *'
-                         r'(?P<scan_interval>[0-9]+)$')
-        p21 = re.compile(r'^BGP *Speaker *process: *'
-                         r'(?P<speaker>\w+), +Node: +(?P<node>\w+)$')
-        p22 = re.compile(r'^Restart *count: *(?P<restart_count>[0-9]+)$')
-        p23 = re.compile(r'^(?P<vrf_info>[\w\-]+) +VRFs: +'
-                         r'(?P<total>[0-9]+) +'
-                         r'(?P<nbrs_estab>[0-9]+)/(?P<cfg>[0-9]+)$')
-        p24_1 = re.compile(r'^Updates:'
-                           r' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
-        p24_2 = re.compile(r'^Notifications:'
-                           r' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
-        p26 = re.compile(r'^Pool +(?P<pool>\w+): +(?P<alloc>\d+) +'
-                         r'(?P<free>\d+)$')
-        p25 = re.compile(r'^(?P<att>[\w\s]+): +(?P<number>[0-9]+) +'
-                         r'(?P<memory_used>[0-9]+)$')
-        p29 = re.compile(r'^Address *family: *(?P<af>[a-zA-Z0-9\s\-\_]+)$')
-        p29_1 = re.compile(r'^VRF +(?P<current_vrf>(\S+)) +Address +family:'
-                           r' +(?P<af>[a-zA-Z0-9\s\-\_]+)'
-                           r'(?: +\(Table +(?P<table_state>[a-z]+)\))?$')
-        p30 = re.compile(r'^Dampening +is +(?P<dampening>[\w\s]+)$')
-        p31 = re.compile(r'^Client +reflection +is +enabled +in +global +config$')
-        p31_1 = re.compile(r'^Client +reflection +is +not +enabled +in +global +config$')
-        p32 = re.compile(r'^Dynamic *MED *is *(?P<dynamic_med>\w+)$')
-        p33 = re.compile(r'^Dynamic *MED *interval *: *'
-                         r'(?P<interval>[a-zA-Z0-9\s]+)$')
-        p34 = re.compile(r'^Dynamic *MED *Timer *: *'
-                         r'(?P<dynamic_med_timer>[a-zA-Z0-9\s]+)$')
-        p35 = re.compile(r'^Dynamic *MED *Periodic *Timer *: *'
-                         r'(?P<timer>[a-zA-Z0-9\s]+)$')
-        p36 = re.compile(r'^Scan *interval: *(?P<scan_interval>[\w\s]+)$')
-        p37 = re.compile(r'^Total *prefixes *scanned: *'
-                         r'(?P<scan>[a-zA-Z0-9\s]+)$')
-        p38 = re.compile(r'^Prefixes *scanned *per *segment: *'
-                         r'(?P<prefix_scan>[a-zA-Z0-9\s]+)$')
-        p39 = re.compile(r'^Number *of *scan *segments: *'
-                         r'(?P<num_of_scan_segments>[a-zA-Z0-9\s]+)$')
-        p40 = re.compile(r'^Nexthop *resolution *minimum *prefix\-length: *'
-                         r'(?P<length>[\w\s\(\)]+)$')
-        p41 = re.compile(r'^Main *Table *Version: *(?P<main_tab_ver>[\w\s]+)$')
-        p42 = re.compile(r'^Table *version *synced *to *RIB: *'
-                         r'(?P<rib>[a-zA-Z0-9\s]+)$')
-        p43 = re.compile(r'^Table *version *acked *by *RIB: *'
-                         r'(?P<rib>[a-zA-Z0-9\s]+)$')
-        p44 = re.compile(r'^RIB *has *not *converged: *'
-                         r'(?P<rib>[a-zA-Z0-9\s]+)$')
-        p54 = re.compile(r'^RIB *table *prefix\-limit *reached +\? *'
-                         r'\[(?P<rib>\w+)\], +version +(?P<ver>\d+)$')
-        p45 = re.compile(r'^Permanent +Network +(?P<status>\w+)$')
-        p46 = re.compile(r'^State: *(?P<state>[a-zA-Z\s]+).$')
-        p47 = re.compile(r'^BGP *Table *Version: *(?P<tab_ver>\w+)$')
-        p48 = re.compile(r'^Attribute *download: *(?P<attr>[\w\s]+)$')
-        p49 = re.compile(r'^Label *retention *timer *value *'
-                         r'(?P<timer>[a-zA-Z0-9\s]+)$')
-        p50 = re.compile(r'^Soft *Reconfig *Entries: *(?P<ent>\d+)$')
-        p51 = re.compile(r'^Table *bit\-field *size *: *'
-                         r'(?P<size>[0-9\s]+) *Chunk *element *size *: *'
-                         r'(?P<elememt_size>\d+)$')
-        p52 = re.compile(r'^(?P<thread>\w+\s\w+) *'
-                         r'(?P<trigger>\w+\s\d+\s[\d\:\.]+) +(?P<ver>[0-9]+) +'
-                         r'(?P<tbl_ver>[0-9]+) +(?P<trig_tid>[0-9]+)$')
-        p53 = re.compile(r'^(?P<remote>[\w\s\-]+): *(?P<v1>\d+) *'
-                         r'(?P<v2>[0-9]+)$')
+        p4 = regex_engine.compile(r'^Autonomous *System: *(?P<as_number>[0-9\.]+)$')
+        p5 = regex_engine.compile(r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
+                                  r'(\([\w\s]+\))?$')
+        p6_1 = regex_engine.compile(r'^Default *Cluster *ID: *'
+                                    r'(?P<default_cluster_id>[\w\.\:]+) *'
+                                    r'(\([\w\s\:\.\,]+\))?$')
+        p6_2 = regex_engine.compile(r'^Active *Cluster *IDs: *'
+                                    r'(?P<active_cluster_id>[\w\.\:]+)$')
+        p7_1 = regex_engine.compile(r'^Always compare MED is enabled$')
+        p7_2 = regex_engine.compile(r'^Comparing router ID for eBGP paths$')
+        p7_4 = regex_engine.compile(r'^Treating missing MED as worst$')
+        p8 = regex_engine.compile(r'^Fast +external +fallover +enabled$')
+        p9 = regex_engine.compile(r'^Platform *RLIMIT *max: *'
+                                  r'(?P<platform_rlimit_max>[0-9\,]+) *bytes$')
+        p10 = regex_engine.compile(r'^Maximum +limit +for +BMP +buffer +size: *'
+                                   r'(?P<size>[a-zA-Z0-9]+) *MB$')
+        p11 = regex_engine.compile(r'^Default *value *for *BMP *buffer *size: *'
+                                   r'(?P<size>[a-zA-Z0-9]+) *MB$')
+        p12 = regex_engine.compile(r'^Current *limit *for *BMP *buffer *size: *'
+                                   r'(?P<size>[a-zA-Z0-9]+) *MB$')
+        p13 = regex_engine.compile(r'^Current *utilization *of *BMP *buffer *'
+                                   r'limit: *(?P<limit>[a-zA-Z0-9]+) *B$')
+        p14 = regex_engine.compile(r'^Neighbor *logging *is *(?P<nbr_logging>\w+)$')
+        p15 = regex_engine.compile(r'^Enforce +first +AS +(?P<as_enabled>\w+)$')
+        p16 = regex_engine.compile(r'^Default *local *preference: *'
+                                   r'(?P<preference>[0-9]+)$')
+        p17 = regex_engine.compile(r'^Default *keepalive: *(?P<keepalive>[0-9]+)$')
+        p18 = regex_engine.compile(r'^Non\-stop *routing *is +(?P<status>[a-zA-Z]+)$')
+        p19 = regex_engine.compile(r'^Update *delay: *(?P<update_delay>[0-9]+)$')
+        p20 = regex_engine.compile(r'^Generic *scan *interval: *'
+                                   r'(?P<scan_interval>[0-9]+)$')
+        p21 = regex_engine.compile(r'^BGP *Speaker *process: *'
+                                   r'(?P<speaker>\w+), +Node: +(?P<node>\w+)$')
+        p22 = regex_engine.compile(r'^Restart *count: *(?P<restart_count>[0-9]+)$')
+        p23 = regex_engine.compile(r'^(?P<vrf_info>[\w\-]+) +VRFs: +'
+                                   r'(?P<total>[0-9]+) +'
+                                   r'(?P<nbrs_estab>[0-9]+)/(?P<cfg>[0-9]+)$')
+        p24_1 = regex_engine.compile(r'^Updates:'
+                                     r' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
+        p24_2 = regex_engine.compile(r'^Notifications:'
+                                     r' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
+        p26 = regex_engine.compile(r'^Pool +(?P<pool>\w+): +(?P<alloc>\d+) +'
+                                   r'(?P<free>\d+)$')
+        p25 = regex_engine.compile(r'^(?P<att>[\w\s]+): +(?P<number>[0-9]+) +'
+                                   r'(?P<memory_used>[0-9]+)$')
+        p29 = regex_engine.compile(r'^Address *family: *(?P<af>[a-zA-Z0-9\s\-\_]+)$')
+        p29_1 = regex_engine.compile(r'^VRF +(?P<current_vrf>(\S+)) +Address +family:'
+                                     r' +(?P<af>[a-zA-Z0-9\s\-\_]+)'
+                                     r'(?: +\(Table +(?P<table_state>[a-z]+)\))?$')
+        p30 = regex_engine.compile(r'^Dampening +is +(?P<dampening>[\w\s]+)$')
+        p31 = regex_engine.compile(r'^Client +reflection +is +enabled +in +global +config$')
+        p31_1 = regex_engine.compile(r'^Client +reflection +is +not +enabled +in +global +config$')
+        p32 = regex_engine.compile(r'^Dynamic *MED *is *(?P<dynamic_med>\w+)$')
+        p33 = regex_engine.compile(r'^Dynamic *MED *interval *: *'
+                                   r'(?P<interval>[a-zA-Z0-9\s]+)$')
+        p34 = regex_engine.compile(r'^Dynamic *MED *Timer *: *'
+                                   r'(?P<dynamic_med_timer>[a-zA-Z0-9\s]+)$')
+        p35 = regex_engine.compile(r'^Dynamic *MED *Periodic *Timer *: *'
+                                   r'(?P<timer>[a-zA-Z0-9\s]+)$')
+        p36 = regex_engine.compile(r'^Scan *interval: *(?P<scan_interval>[\w\s]+)$')
+        p37 = regex_engine.compile(r'^Total *prefixes *scanned: *'
+                                   r'(?P<scan>[a-zA-Z0-9\s]+)$')
+        p38 = regex_engine.compile(r'^Prefixes *scanned *per *segment: *'
+                                   r'(?P<prefix_scan>[a-zA-Z0-9\s]+)$')
+        p39 = regex_engine.compile(r'^Number *of *scan *segments: *'
+                                   r'(?P<num_of_scan_segments>[a-zA-Z0-9\s]+)$')
+        p40 = regex_engine.compile(r'^Nexthop *resolution *minimum *prefix\-length: *'
+                                   r'(?P<length>[\w\s\(\)]+)$')
+        p41 = regex_engine.compile(r'^Main *Table *Version: *(?P<main_tab_ver>[\w\s]+)$')
+        p42 = regex_engine.compile(r'^Table *version *synced *to *RIB: *'
+                                   r'(?P<rib>[a-zA-Z0-9\s]+)$')
+        p43 = regex_engine.compile(r'^Table *version *acked *by *RIB: *'
+                                   r'(?P<rib>[a-zA-Z0-9\s]+)$')
+        p44 = regex_engine.compile(r'^RIB *has *not *converged: *'
+                                   r'(?P<rib>[a-zA-Z0-9\s]+)$')
+        p54 = regex_engine.compile(r'^RIB *table *prefix\-limit *reached +\? *'
+                                   r'\[(?P<rib>\w+)\], +version +(?P<ver>\d+)$')
+        p45 = regex_engine.compile(r'^Permanent +Network +(?P<status>\w+)$')
+        p46 = regex_engine.compile(r'^State: *(?P<state>[a-zA-Z\s]+).$')
+        p47 = regex_engine.compile(r'^BGP *Table *Version: *(?P<tab_ver>\w+)$')
+        p48 = regex_engine.compile(r'^Attribute *download: *(?P<attr>[\w\s]+)$')
+        p49 = regex_engine.compile(r'^Label *retention *timer *value *'
+                                   r'(?P<timer>[a-zA-Z0-9\s]+)$')
+        p50 = regex_engine.compile(r'^Soft *Reconfig *Entries: *(?P<ent>\d+)$')
+        p51 = regex_engine.compile(r'^Table *bit\-field *size *: *'
+                                   r'(?P<size>[0-9\s]+) *Chunk *element *size *: *'
+                                   r'(?P<elememt_size>\d+)$')
+        p52 = regex_engine.compile(r'^(?P<thread>\w+\s\w+) *'
+                                   r'(?P<trigger>\w+\s\d+\s[\d\:\.]+) +(?P<ver>[0-9]+) +'
+                                   r'(?P<tbl_ver>[0-9]+) +(?P<trig_tid>[0-9]+)$')
+        p53 = regex_engine.compile(r'^(?P<remote>[\w\s\-]+): *(?P<v1>\d+) *'
+                                   r'(?P<v2>[0-9]+)$')
         # Init dict
         ret_dict = {}
 
@@ -1678,10 +1680,10 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # BMP pool summary:
             #                            Alloc           Free
             # Pool 100:                  0               0
-            if re.compile(r'Message +logging +pool +summary:$').match(line):
+            if regex_engine.compile(r'Message +logging +pool +summary:$').match(line):
                 flag = 'message'
 
-            if re.compile(r'BMP +pool +summary:').match(line):
+            if regex_engine.compile(r'BMP +pool +summary:').match(line):
                 flag = 'bmp'
 
             m = p26.match(line)
@@ -2135,9 +2137,9 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Remote Prefixes:      10              920         
             # Remote Path-elems:    10              630
 
-            if re.compile(r'^Allocated +Freed$').match(line):
+            if regex_engine.compile(r'^Allocated +Freed$').match(line):
                 flag = 'allocated'
-            if re.compile(r'^Number +Mem Used$').match(line):
+            if regex_engine.compile(r'^Number +Mem Used$').match(line):
                 flag = 'number'
 
 
@@ -2544,109 +2546,109 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             out = output
         # Init variables
         ret_dict = {}
-        p1 = re.compile(r'^BGP +instance +(?P<instance_number>[0-9]+): +'
-                            r'(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p2 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p2_1 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>\S+)$')
-        p3 = re.compile(r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS +(?P<local_as_as_no>[0-9]+)(?:, +(?P<local_as_no_prepend>no-prepend))?(?:, +(?P<local_as_replace_as>replace-as))?(?:, +(?P<local_as_dual_as>dual-as))?(?:, +(?P<link_state>[a-zA-Z\s]+))?$')
-        p4 = re.compile(r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$')
-        p5 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
-                            r'(?:, +up +for +(?P<up_time>[\w\:]+))?$')
-        p5_1 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)(?:(?P<reason>.*))')
-        p6 = re.compile(r'^NSR *State: *(?P<nsr_state>[a-zA-Z]+)$')
-        p7 = re.compile(r'^Last *read *(?P<last_read>[0-9\:]+), *Last *read *before *reset *(?P<last_read_before_reset>[0-9\:]+)$')
-        p8 = re.compile(r'^Hold +time +is +(?P<holdtime>[0-9]+), +keepalive'
-                            r' +interval +is +(?P<keepalive_interval>[0-9]+)'
-                            r' +seconds$')
-        p9 = re.compile(r'^Configured +hold +time:'
-                            r' +(?P<holdtime>[0-9]+), +keepalive:'
-                            r' +(?P<keepalive_interval>[0-9]+), +min'
-                            r' +acceptable +hold +time:'
-                            r' +(?P<min_acceptable_hold_time>[0-9]+)$')
-        p10 = re.compile(r'^Last *write *(?P<last_write>[0-9\:]+), *attempted *(?P<attempted>[0-9]+), *written *(?P<written>[0-9]+)$')
-        p11 = re.compile(r'^Second *last *write *(?P<second_last_write>[0-9\:]+), *attempted *(?P<second_attempted>[0-9]+), *written *(?P<second_written>[0-9]+)$')
-        p12 = re.compile(r'^Last *write *before *reset *(?P<last_write_before_reset>[0-9\:]+), *attempted *(?P<last_write_attempted>[0-9]+), *written *(?P<last_write_written>[0-9]+)$')
-        p13 = re.compile(r'^Second *last *write *before *reset *(?P<second_last_write_before_reset>[0-9\:]+), *attempted *(?P<second_last_write_before_attempted>[0-9]+), written *(?P<second_last_write_before_written>[0-9]+)$')
-        p14 =  re.compile(r'^Last *write *pulse *rcvd *(?P<last_write_pulse_rcvd>[a-zA-Z0-9\:\.\s]+) *last *full *not *set *pulse *count *(?P<last_full_not_set_pulse_count>[0-9]+)$')
-        p15 = re.compile(r'^Last +write +pulse +rcvd +before +reset +(?P<last_write_pulse_rcvd_before_reset>[0-9\:]+)$')
-        p15_1 = re.compile(r'^Socket *(?P<socket_status>[a-z\s\,])$')
-        p16 =  re.compile(r'^Last *write *thread *event *before *reset *(?P<last_write_thread_event_before_reset>[0-9\:]+), *second *last *(?P<last_write_thread_event_second_last>[0-9\:]+)$')
-        p17 = re.compile(r'^Last *KA *expiry *before *reset *(?P<last_ka_expiry_before_reset>[0-9\:]+), *second *last *(?P<last_ka_expiry_before_second_last>[0-9\:]+)$')
-        p18 = re.compile(r'^Last *KA *error *before *reset *(?P<last_ka_error_before_reset>[0-9\:]+), *KA *not *sent *(?P<last_ka_error_ka_not_sent>[0-9\:]+)$')
-        p19 =  re.compile(r'^Last *KA *start *before *reset *(?P<last_ka_start_before_reset>[0-9\:]+), *second *last *(?P<last_ka_start_before_second_last>[0-9\:]+)$')
-        p20 =  re.compile(r'^Precedence: *(?P<precedence>[a-z]+)$')
-        p21 =  re.compile(r'^Non-stop +routing +is +enabled$')
-        p22 =  re.compile(r'^TCP *Initial *Sync :(?: *(?P<tcp_initial_sync>[a-zA-Z0-9\-\s]+))?$')
-        p23 = re.compile(r'^TCP *Initial *Sync *phase *Two :(?: *(?P<tcp_initial_sync_phase_two>[a-zA-Z0-9\-\s]+))?$')
-        p24 = re.compile(r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$')
-        p25 = re.compile(r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$')
-        p26 =  re.compile(r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$')
-        p27 = re.compile(r'^Neighbor +capabilities:?:( +Adv +Rcvd)?$')
-        p27_1= re.compile(r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+)(?: +\(GR Awareness\))?: *(?:(?P<adv>(Y|y)es|(N|n)o|advertised+)'
-                          r'(?: \(old \+ new\))?)?(?:( +and))? *(?:(?P<rcvd>(Y|y)es|(N|n)o|received+)(?: \(old \+ new\))?)$')
-        p28 = re.compile(r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$')
-        p29 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
-                            r'(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
-                            r'(?P<sent>[0-9]+) *'
-                            r'(?P<last_received>\w+ *\d+ *[\d\:\.\-]+) *'
-                            r'(?P<received>[0-9]+)$')
-        p29_1 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
-                            r'(?P<last_sent>[\-]+) *'
-                            r'(?P<sent>[0-9]+) *'
-                            r'(?P<last_received>[\-]+) *'
-                            r'(?P<received>[0-9]+)$')
-        p30 = re.compile(r'^Minimum *time *between *advertisement *runs *is *(?P<minimum_time_between_adv_runs>[0-9]+) *secs$')
-        p31 = re.compile(r'^Inbound *message *logging *enabled, *(?P<inbound_message>[0-9]+) *messages *buffered$')
-        p32 = re.compile(r'^Outbound *message *logging *enabled, *(?P<outbound_message>[0-9]+) *messages *buffered$')
-        p33 = re.compile(r'^For +Address +Family *: +(?P<address_family>[\S\s]+)$')
-        p34 = re.compile(r'^BGP +neighbor +version'
-                            r' +(?P<neighbor_version>[0-9]+)$')
-        p35 = re.compile(r'^Update +group: +(?P<update_group>[0-9\.]+) +Filter-group: +(?P<filter_group>[0-9\.]+) +(?P<refresh_request_status>[a-zA-Z\s]+)$')
-        p36 = re.compile(r'^Route *refresh *request: *received *(?P<route_refresh_request_received>[0-9]+), *sent *(?P<route_refresh_request_sent>[0-9]+)$')
-        p37 = re.compile(r'^Policy *for *incoming *advertisements *is *(?P<route_map_name_in>[\w\-\_]+)$')
-        p38 = re.compile(r'^Policy *for *outgoing *advertisements *is *(?P<route_map_name_out>[\w\-\_]+)$')
-        p39 = re.compile(r'^(?P<accepted_prefixes>[0-9]+) *accepted *prefixes, *(?P<best_paths>[0-9]+) *are *bestpaths$')
-        p40 = re.compile(r'^Exact *no\. *of *prefixes *denied *: *(?P<exact_no_prefixes_denied>[0-9]+)\.$')
-        p41 = re.compile(r'^Cumulative *no\. *of *prefixes *denied: *(?P<cummulative_no_prefixes_denied>[0-9]+)\.$')
-        p42 = re.compile(r'^No *policy: *(?P<cummulative_no_no_policy>[0-9]+), *Failed *RT *match: *(?P<cummulative_no_failed_rt_match>[0-9]+)$')
-        p43 = re.compile(r'^By *ORF *policy: *(?P<cummulative_no_by_orf_policy>[0-9]+), *By *policy: *(?P<cummulative_no_by_policy>[0-9]+)$')
-        p44 = re.compile(r'^Prefix +advertised +(?P<prefix_advertised>[0-9]+), +suppressed +(?P<prefix_suppressed>[0-9]+), +withdrawn +(?P<prefix_withdrawn>[0-9]+)$')
-        p45 = re.compile(r'^Maximum +prefixes +allowed'
-                        r' +(?P<maximum_prefix_max_prefix_no>[0-9]+)$')
-        p46 = re.compile(r'^Threshold +for +(?P<warn>warning)? *message +(?P<threshold_warning_message>[0-9\%]+), +restart +interval +(?P<threshold_restart_interval>[0-9]+) +min$')
-        p47 = re.compile(r'^An *EoR *(?P<eor_status>[a-z\-\s]+)$')
-        p48 = re.compile(r'^Last *ack *version *(?P<last_ack_version>[0-9]+), *Last *synced *ack *version *(?P<last_synced_ack_version>[0-9]+)$')
-        p49 = re.compile(r'^Outstanding +version +objects: +current +(?P<outstanding_version_objects_current>[0-9]+), +max +(?P<outstanding_version_objects_max>[0-9]+)$')
-        p50 = re.compile(r'^Additional-paths +operation: +(?P<additional_paths_operation>[a-zA-Z]+)$')
-        p50_1 = re.compile(r'^Advertise +routes +with +local-label +via +(?P<additional_routes_local_label>[a-zA-Z\s]+)$')
-        p50_2 = re.compile(r'^Send +Multicast +Attributes$')
-        p51 = re.compile(r'^Connections *(?P<bgp_state>\w+) *'
-                            r'(?P<num>[0-9]+)\; *dropped *(?P<connections_dropped>[0-9]+)$')
-        p52 = re.compile(r'^Local *host: *(?P<local_host>[\w\.\:]+), *Local *port: *(?P<local_port>[0-9]+), *IF *Handle: *(?P<if_handle>[a-z0-9]+)$')
-        p53 = re.compile(r'^Foreign *host: *(?P<foreign_host>[\w\.\:]+), *Foreign *port: *(?P<foreign_port>[0-9]+)$')
-        p54 = re.compile(r'^Last *reset *(?P<last_reset>[0-9\:]+)$')
-        p55 = re.compile(r'^Capability +4-byte-as +suppress +is +configured$')
-        p56 = re.compile(r'^Description: +(?P<description>[\w\s\,\.\:\-]+)$')
-        p57 = re.compile(r'^Private +AS +number +removed +from +updates +to +this +neighbor$')
-        p58 = re.compile(r'^Administratively +shut +down$')
-        p59 = re.compile(r'^External +BGP +neighbor +may +be +up +to +'
-                            r'(?P<hop>\d+) +hops +away$')
-        p60 = re.compile(r'^TCP +open +mode: +(?P<mode>[\w\s]+)$')
-        p61 = re.compile(r'^My +AS +number +is +allowed +(?P<num>\d+) +'
-                            r'times +in +received +updates$')
-        p62 = re.compile(r'^Route\-Reflector +Client$')
-        p63 = re.compile(r'^(?P<send_com>\w+) +community +attribute +sent +to +this +neighbor$')
-        p64 = re.compile(r'^Inbound +soft +reconfiguration +allowed$')
-        p65 = re.compile(r'^AS +override +is +set$')
-        p66 = re.compile(r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$')
-        p67 = re.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+)$')
-        p68 = re.compile(r'^TTL\s+security\s+is\s+(?P<ttl_security>\w+)$')
-        p69 = re.compile(r'^External\s+BGP\s+neighbor\s+may\s+be\s+up\s+to\s+(?P<external_bgp_neighbor_hop_count>\d+)\s+hops\s+away\.$')
-        p70 = re.compile(r'^BFD\s+(?P<bfd_status>\w+)\s+\(session\s+(?P<session_status>\w+)\):\s+mininterval:\s+(?P<mininterval>\d+)\s+multiplier:\s+(?P<multiplier>\d+)$')
-        p71 = re.compile(r'^Graceful\s+restart\s+is\s+(?P<graceful_restart>[a-zA-Z]+)$')
-        p72 = re.compile(r'^Restart\s+time\s+is\s+(?P<graceful_restart_restart_time>\d+)\s+seconds$')
-        p73 = re.compile(r'^Stale\s+path\s+timeout\s+time\s+is\s+(?P<graceful_restart_stalepath_time>\d+)\s+seconds$')
-        p74 = re.compile(r'^(?P<messages_type>[Received|Sent]+)\s+(?P<messages_count>\d+)\s+messages,\s+(?P<notifications>\d+)\s+notifications,\s+(?P<queue>\d+)\s+in\s+queue$')
+        p1 = regex_engine.compile(r'^BGP +instance +(?P<instance_number>[0-9]+): +'
+                                      r'(?P<instance>[a-zA-Z0-9\-\_\']+)$')
+        p2 =  regex_engine.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
+        p2_1 =  regex_engine.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>\S+)$')
+        p3 = regex_engine.compile(r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS +(?P<local_as_as_no>[0-9]+)(?:, +(?P<local_as_no_prepend>no-prepend))?(?:, +(?P<local_as_replace_as>replace-as))?(?:, +(?P<local_as_dual_as>dual-as))?(?:, +(?P<link_state>[a-zA-Z\s]+))?$')
+        p4 = regex_engine.compile(r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$')
+        p5 = regex_engine.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
+                                      r'(?:, +up +for +(?P<up_time>[\w\:]+))?$')
+        p5_1 = regex_engine.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)(?:(?P<reason>.*))')
+        p6 = regex_engine.compile(r'^NSR *State: *(?P<nsr_state>[a-zA-Z]+)$')
+        p7 = regex_engine.compile(r'^Last *read *(?P<last_read>[0-9\:]+), *Last *read *before *reset *(?P<last_read_before_reset>[0-9\:]+)$')
+        p8 = regex_engine.compile(r'^Hold +time +is +(?P<holdtime>[0-9]+), +keepalive'
+                                      r' +interval +is +(?P<keepalive_interval>[0-9]+)'
+                                      r' +seconds$')
+        p9 = regex_engine.compile(r'^Configured +hold +time:'
+                                      r' +(?P<holdtime>[0-9]+), +keepalive:'
+                                      r' +(?P<keepalive_interval>[0-9]+), +min'
+                                      r' +acceptable +hold +time:'
+                                      r' +(?P<min_acceptable_hold_time>[0-9]+)$')
+        p10 = regex_engine.compile(r'^Last *write *(?P<last_write>[0-9\:]+), *attempted *(?P<attempted>[0-9]+), *written *(?P<written>[0-9]+)$')
+        p11 = regex_engine.compile(r'^Second *last *write *(?P<second_last_write>[0-9\:]+), *attempted *(?P<second_attempted>[0-9]+), *written *(?P<second_written>[0-9]+)$')
+        p12 = regex_engine.compile(r'^Last *write *before *reset *(?P<last_write_before_reset>[0-9\:]+), *attempted *(?P<last_write_attempted>[0-9]+), *written *(?P<last_write_written>[0-9]+)$')
+        p13 = regex_engine.compile(r'^Second *last *write *before *reset *(?P<second_last_write_before_reset>[0-9\:]+), *attempted *(?P<second_last_write_before_attempted>[0-9]+), written *(?P<second_last_write_before_written>[0-9]+)$')
+        p14 =  regex_engine.compile(r'^Last *write *pulse *rcvd *(?P<last_write_pulse_rcvd>[a-zA-Z0-9\:\.\s]+) *last *full *not *set *pulse *count *(?P<last_full_not_set_pulse_count>[0-9]+)$')
+        p15 = regex_engine.compile(r'^Last +write +pulse +rcvd +before +reset +(?P<last_write_pulse_rcvd_before_reset>[0-9\:]+)$')
+        p15_1 = regex_engine.compile(r'^Socket *(?P<socket_status>[a-z\s\,])$')
+        p16 =  regex_engine.compile(r'^Last *write *thread *event *before *reset *(?P<last_write_thread_event_before_reset>[0-9\:]+), *second *last *(?P<last_write_thread_event_second_last>[0-9\:]+)$')
+        p17 = regex_engine.compile(r'^Last *KA *expiry *before *reset *(?P<last_ka_expiry_before_reset>[0-9\:]+), *second *last *(?P<last_ka_expiry_before_second_last>[0-9\:]+)$')
+        p18 = regex_engine.compile(r'^Last *KA *error *before *reset *(?P<last_ka_error_before_reset>[0-9\:]+), *KA *not *sent *(?P<last_ka_error_ka_not_sent>[0-9\:]+)$')
+        p19 =  regex_engine.compile(r'^Last *KA *start *before *reset *(?P<last_ka_start_before_reset>[0-9\:]+), *second *last *(?P<last_ka_start_before_second_last>[0-9\:]+)$')
+        p20 =  regex_engine.compile(r'^Precedence: *(?P<precedence>[a-z]+)$')
+        p21 =  regex_engine.compile(r'^Non-stop +routing +is +enabled$')
+        p22 =  regex_engine.compile(r'^TCP *Initial *Sync :(?: *(?P<tcp_initial_sync>[a-zA-Z0-9\-\s]+))?$')
+        p23 = regex_engine.compile(r'^TCP *Initial *Sync *phase *Two :(?: *(?P<tcp_initial_sync_phase_two>[a-zA-Z0-9\-\s]+))?$')
+        p24 = regex_engine.compile(r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$')
+        p25 = regex_engine.compile(r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$')
+        p26 =  regex_engine.compile(r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$')
+        p27 = regex_engine.compile(r'^Neighbor +capabilities:?:( +Adv +Rcvd)?$')
+        p27_1= regex_engine.compile(r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+)(?: +\(GR Awareness\))?: *(?:(?P<adv>(Y|y)es|(N|n)o|advertised+)'
+                                    r'(?: \(old \+ new\))?)?(?:( +and))? *(?:(?P<rcvd>(Y|y)es|(N|n)o|received+)(?: \(old \+ new\))?)$')
+        p28 = regex_engine.compile(r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$')
+        p29 = regex_engine.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
+                                      r'(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
+                                      r'(?P<sent>[0-9]+) *'
+                                      r'(?P<last_received>\w+ *\d+ *[\d\:\.\-]+) *'
+                                      r'(?P<received>[0-9]+)$')
+        p29_1 = regex_engine.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
+                                      r'(?P<last_sent>[\-]+) *'
+                                      r'(?P<sent>[0-9]+) *'
+                                      r'(?P<last_received>[\-]+) *'
+                                      r'(?P<received>[0-9]+)$')
+        p30 = regex_engine.compile(r'^Minimum *time *between *advertisement *runs *is *(?P<minimum_time_between_adv_runs>[0-9]+) *secs$')
+        p31 = regex_engine.compile(r'^Inbound *message *logging *enabled, *(?P<inbound_message>[0-9]+) *messages *buffered$')
+        p32 = regex_engine.compile(r'^Outbound *message *logging *enabled, *(?P<outbound_message>[0-9]+) *messages *buffered$')
+        p33 = regex_engine.compile(r'^For +Address +Family *: +(?P<address_family>[\S\s]+)$')
+        p34 = regex_engine.compile(r'^BGP +neighbor +version'
+                                      r' +(?P<neighbor_version>[0-9]+)$')
+        p35 = regex_engine.compile(r'^Update +group: +(?P<update_group>[0-9\.]+) +Filter-group: +(?P<filter_group>[0-9\.]+) +(?P<refresh_request_status>[a-zA-Z\s]+)$')
+        p36 = regex_engine.compile(r'^Route *refresh *request: *received *(?P<route_refresh_request_received>[0-9]+), *sent *(?P<route_refresh_request_sent>[0-9]+)$')
+        p37 = regex_engine.compile(r'^Policy *for *incoming *advertisements *is *(?P<route_map_name_in>[\w\-\_]+)$')
+        p38 = regex_engine.compile(r'^Policy *for *outgoing *advertisements *is *(?P<route_map_name_out>[\w\-\_]+)$')
+        p39 = regex_engine.compile(r'^(?P<accepted_prefixes>[0-9]+) *accepted *prefixes, *(?P<best_paths>[0-9]+) *are *bestpaths$')
+        p40 = regex_engine.compile(r'^Exact *no\. *of *prefixes *denied *: *(?P<exact_no_prefixes_denied>[0-9]+)\.$')
+        p41 = regex_engine.compile(r'^Cumulative *no\. *of *prefixes *denied: *(?P<cummulative_no_prefixes_denied>[0-9]+)\.$')
+        p42 = regex_engine.compile(r'^No *policy: *(?P<cummulative_no_no_policy>[0-9]+), *Failed *RT *match: *(?P<cummulative_no_failed_rt_match>[0-9]+)$')
+        p43 = regex_engine.compile(r'^By *ORF *policy: *(?P<cummulative_no_by_orf_policy>[0-9]+), *By *policy: *(?P<cummulative_no_by_policy>[0-9]+)$')
+        p44 = regex_engine.compile(r'^Prefix +advertised +(?P<prefix_advertised>[0-9]+), +suppressed +(?P<prefix_suppressed>[0-9]+), +withdrawn +(?P<prefix_withdrawn>[0-9]+)$')
+        p45 = regex_engine.compile(r'^Maximum +prefixes +allowed'
+                                  r' +(?P<maximum_prefix_max_prefix_no>[0-9]+)$')
+        p46 = regex_engine.compile(r'^Threshold +for +(?P<warn>warning)? *message +(?P<threshold_warning_message>[0-9\%]+), +restart +interval +(?P<threshold_restart_interval>[0-9]+) +min$')
+        p47 = regex_engine.compile(r'^An *EoR *(?P<eor_status>[a-z\-\s]+)$')
+        p48 = regex_engine.compile(r'^Last *ack *version *(?P<last_ack_version>[0-9]+), *Last *synced *ack *version *(?P<last_synced_ack_version>[0-9]+)$')
+        p49 = regex_engine.compile(r'^Outstanding +version +objects: +current +(?P<outstanding_version_objects_current>[0-9]+), +max +(?P<outstanding_version_objects_max>[0-9]+)$')
+        p50 = regex_engine.compile(r'^Additional-paths +operation: +(?P<additional_paths_operation>[a-zA-Z]+)$')
+        p50_1 = regex_engine.compile(r'^Advertise +routes +with +local-label +via +(?P<additional_routes_local_label>[a-zA-Z\s]+)$')
+        p50_2 = regex_engine.compile(r'^Send +Multicast +Attributes$')
+        p51 = regex_engine.compile(r'^Connections *(?P<bgp_state>\w+) *'
+                                      r'(?P<num>[0-9]+)\; *dropped *(?P<connections_dropped>[0-9]+)$')
+        p52 = regex_engine.compile(r'^Local *host: *(?P<local_host>[\w\.\:]+), *Local *port: *(?P<local_port>[0-9]+), *IF *Handle: *(?P<if_handle>[a-z0-9]+)$')
+        p53 = regex_engine.compile(r'^Foreign *host: *(?P<foreign_host>[\w\.\:]+), *Foreign *port: *(?P<foreign_port>[0-9]+)$')
+        p54 = regex_engine.compile(r'^Last *reset *(?P<last_reset>[0-9\:]+)$')
+        p55 = regex_engine.compile(r'^Capability +4-byte-as +suppress +is +configured$')
+        p56 = regex_engine.compile(r'^Description: +(?P<description>[\w\s\,\.\:\-]+)$')
+        p57 = regex_engine.compile(r'^Private +AS +number +removed +from +updates +to +this +neighbor$')
+        p58 = regex_engine.compile(r'^Administratively +shut +down$')
+        p59 = regex_engine.compile(r'^External +BGP +neighbor +may +be +up +to +'
+                                      r'(?P<hop>\d+) +hops +away$')
+        p60 = regex_engine.compile(r'^TCP +open +mode: +(?P<mode>[\w\s]+)$')
+        p61 = regex_engine.compile(r'^My +AS +number +is +allowed +(?P<num>\d+) +'
+                                      r'times +in +received +updates$')
+        p62 = regex_engine.compile(r'^Route\-Reflector +Client$')
+        p63 = regex_engine.compile(r'^(?P<send_com>\w+) +community +attribute +sent +to +this +neighbor$')
+        p64 = regex_engine.compile(r'^Inbound +soft +reconfiguration +allowed$')
+        p65 = regex_engine.compile(r'^AS +override +is +set$')
+        p66 = regex_engine.compile(r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$')
+        p67 = regex_engine.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+)$')
+        p68 = regex_engine.compile(r'^TTL\s+security\s+is\s+(?P<ttl_security>\w+)$')
+        p69 = regex_engine.compile(r'^External\s+BGP\s+neighbor\s+may\s+be\s+up\s+to\s+(?P<external_bgp_neighbor_hop_count>\d+)\s+hops\s+away\.$')
+        p70 = regex_engine.compile(r'^BFD\s+(?P<bfd_status>\w+)\s+\(session\s+(?P<session_status>\w+)\):\s+mininterval:\s+(?P<mininterval>\d+)\s+multiplier:\s+(?P<multiplier>\d+)$')
+        p71 = regex_engine.compile(r'^Graceful\s+restart\s+is\s+(?P<graceful_restart>[a-zA-Z]+)$')
+        p72 = regex_engine.compile(r'^Restart\s+time\s+is\s+(?P<graceful_restart_restart_time>\d+)\s+seconds$')
+        p73 = regex_engine.compile(r'^Stale\s+path\s+timeout\s+time\s+is\s+(?P<graceful_restart_stalepath_time>\d+)\s+seconds$')
+        p74 = regex_engine.compile(r'^(?P<messages_type>[Received|Sent]+)\s+(?P<messages_count>\d+)\s+messages,\s+(?P<notifications>\d+)\s+notifications,\s+(?P<queue>\d+)\s+in\s+queue$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3727,39 +3729,39 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
         # handle route table name
         routes = 'received' if 'received' in route_type else 'routes'
-        p1 = re.compile(r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p15 = re.compile(r'^BGP *VRF *(?P<vrf>[a-zA-Z0-9]+), *'
-                            r'state: *(?P<state>[a-zA-Z]+)$')
-        p15_1 = re.compile(r'^BGP Route Distinguisher: *(?P<route_distinguisher>\S+)')
-        p16 = re.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
-        p2 = re.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
-        p3 = re.compile(r'^BGP *router *identifier *(?P<router_identifier>[0-9\.]+), *'
-                        r'local *AS *number *(?P<local_as>[0-9\.]+)$')
-        p4 = re.compile(r'^BGP *generic *scan *interval *(?P<generic_scan_interval>[0-9]+) +secs$')
-        p5 = re.compile(r'^(?P<non_stop_routing>(Non-stop routing is enabled))$')
-        p6 = re.compile(r'^BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
-        p7 = re.compile(r'^Table *ID: *(?P<table_id>[a-z0-9]+) *RD *version: *(?P<rd_version>[0-9]+)$')
-        p8 = re.compile(r'^BGP *main *routing *table *version *(?P<bgp_table_version>[0-9]+)$')
-        p9 = re.compile(r'^BGP *NSR *Initial *initsync *version *(?P<nsr_initial_initsync_version>[0-9]+) *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p10 = re.compile(r'^BGP *NSR/ISSU *Sync-Group *versions *(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
-        p11 = re.compile(r'^BGP *scan *interval *(?P<scan_interval>[0-9\S]+) *secs$')
-        p12 = re.compile(r'^Route +Distinguisher: *(?P<route_distinguisher>\S+) *'
-                            r'(\(default +for +vrf +(?P<default_vrf>[a-zA-Z0-9]+)\))?$')
-        p13 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)? *'
-                            r'(?P<prefix>(?P<ip>[\w\.\:\/\[\]]+)\/(?P<mask>\d+))?( +'
-                            r'(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\.\s\{\}]+)?'
-                            r'(?: *(?P<origin_codes>(i|e|\?)))?)?$')      
-        p13_1 = re.compile(r'(?P<path>[\d\.\s]+)'
-                        r' *(?P<origin_codes>(i|e|\?))?$')
-
-        p14 = re.compile(r'^Processed *(?P<processed_prefixes>[0-9]+) *'
-                            r'prefixes, *(?P<processed_paths>[0-9]+) *paths$')
+        p1 = regex_engine.compile(r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
+        p15 = regex_engine.compile(r'^BGP *VRF *(?P<vrf>[a-zA-Z0-9]+), *'
+                                      r'state: *(?P<state>[a-zA-Z]+)$')
+        p15_1 = regex_engine.compile(r'^BGP Route Distinguisher: *(?P<route_distinguisher>\S+)')
+        p16 = regex_engine.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
+        p2 = regex_engine.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
+        p3 = regex_engine.compile(r'^BGP *router *identifier *(?P<router_identifier>[0-9\.]+), *'
+                                  r'local *AS *number *(?P<local_as>[0-9\.]+)$')
+        p4 = regex_engine.compile(r'^BGP *generic *scan *interval *(?P<generic_scan_interval>[0-9]+) +secs$')
+        p5 = regex_engine.compile(r'^(?P<non_stop_routing>(Non-stop routing is enabled))$')
+        p6 = regex_engine.compile(r'^BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
+        p7 = regex_engine.compile(r'^Table *ID: *(?P<table_id>[a-z0-9]+) *RD *version: *(?P<rd_version>[0-9]+)$')
+        p8 = regex_engine.compile(r'^BGP *main *routing *table *version *(?P<bgp_table_version>[0-9]+)$')
+        p9 = regex_engine.compile(r'^BGP *NSR *Initial *initsync *version *(?P<nsr_initial_initsync_version>[0-9]+) *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p10 = regex_engine.compile(r'^BGP *NSR/ISSU *Sync-Group *versions *(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p11 = regex_engine.compile(r'^BGP *scan *interval *(?P<scan_interval>[0-9\S]+) *secs$')
+        p12 = regex_engine.compile(r'^Route +Distinguisher: *(?P<route_distinguisher>\S+) *'
+                                      r'(\(default +for +vrf +(?P<default_vrf>[a-zA-Z0-9]+)\))?$')
+        p13 = regex_engine.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)? *'
+                                      r'(?P<prefix>(?P<ip>[\w\.\:\/\[\]]+)\/(?P<mask>\d+))?( +'
+                                      r'(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\.\s\{\}]+)?'
+                                      r'(?: *(?P<origin_codes>(i|e|\?)))?)?$')      
+        p13_1 = regex_engine.compile(r'(?P<path>[\d\.\s]+)'
+                                  r' *(?P<origin_codes>(i|e|\?))?$')
+
+        p14 = regex_engine.compile(r'^Processed *(?P<processed_prefixes>[0-9]+) *'
+                                      r'prefixes, *(?P<processed_paths>[0-9]+) *paths$')
 
         #    Network            Next Hop            Metric LocPrf Weight Path
         #                       10.4.1.1                    100      0    i
-        p17 = re.compile(r'^(?P<next_hop>[\w\.\:]+) +((?P<metric>[0-9]+))? +'
-                            r'(?P<locprf>[0-9]+) +(?P<weight>[0-9]+) '
-                            r'*(?P<path>[\S]+)$')
+        p17 = regex_engine.compile(r'^(?P<next_hop>[\w\.\:]+) +((?P<metric>[0-9]+))? +'
+                                      r'(?P<locprf>[0-9]+) +(?P<weight>[0-9]+) '
+                                      r'*(?P<path>[\S]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4117,25 +4119,25 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                 if group_num:
                     # metric   locprf  weight path
                     # 2219      211       0 200 33299 51178 47751 {27016}
-                    m1 = re.compile(r'^(?P<metric>[0-9]+)  +'
-                                 r'(?P<locprf>[0-9]+)  +'
-                                 r'(?P<weight>[0-9]+) '
-                                 r'(?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                    m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)  +'
+                                           r'(?P<locprf>[0-9]+)  +'
+                                           r'(?P<weight>[0-9]+) '
+                                           r'(?P<path>[0-9\.\{\}\s]+)$').match(group_num)
     
                     # metric   locprf  weight path
                     # 2219                0 200 33299 51178 47751 {27016}
                     # locprf   weight path
                     # 211         0 200 33299 51178 47751 {27016} 65000.65000
     
-                    m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                r'(?P<space>\s{2,20})'
-                                 r'(?P<weight>[0-9]+) '
-                                 r'(?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                    m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                          r'(?P<space>\s{2,20})'
+                                           r'(?P<weight>[0-9]+) '
+                                           r'(?P<path>[0-9\.\{\}\s]+)$').match(group_num)
     
                     # weight path
                     # 0 200 33299 51178 47751 {27016} 65000.65000
-                    m3 = re.compile(r'^(?P<weight>[0-9]+) '
-                                 r'(?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$')\
+                    m3 = regex_engine.compile(r'^(?P<weight>[0-9]+) '
+                                           r'(?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$')\
                                .match(group_num)
 
                     if m1:
@@ -4302,21 +4304,21 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
         # p0 is for instances where the line has been wrapped around due to the network name being too long
         # [5][0][64][2002:60:60:60::]/176
-        p0 = re.compile(r'^[\d\:\[\]\.]+/\d+$')
+        p0 = regex_engine.compile(r'^[\d\:\[\]\.]+/\d+$')
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>['
             r'a-zA-Z0-9\-\_\']+)$')
-        p2 = re.compile(r'^VRF: *(?P<vrf>[a-zA-Z0-9\_]+)$')
-        p7 = re.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
-        p3 = re.compile(r'^Route *Distinguisher: *(?P<route_distinguisher>\S+) *'
-                        r'(\(default *for *vrf (?P<default_vrf>[0-9A-Z]+)\))?$')
-        p4 = re.compile(
+        p2 = regex_engine.compile(r'^VRF: *(?P<vrf>[a-zA-Z0-9\_]+)$')
+        p7 = regex_engine.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
+        p3 = regex_engine.compile(r'^Route *Distinguisher: *(?P<route_distinguisher>\S+) *'
+                                  r'(\(default *for *vrf (?P<default_vrf>[0-9A-Z]+)\))?$')
+        p4 = regex_engine.compile(
             r'^(?P<prefix>(?P<ip>[\w\.\:\[\]]+)/(?P<mask>\d+)) *(?P<next_hop>[\w\.\:]+) *('
             r'?P<froms>[\w\.\:]+) *'
             r'(?P<path>[\d\.\{\}\s]+)?(?P<origin_code>[e|i\?])?$')
-        p5_1 = re.compile(r'(?P<path>[\d\.\{\}\s]+)(?P<origin_code>e|i)?$')
-        p6 = re.compile(
+        p5_1 = regex_engine.compile(r'(?P<path>[\d\.\{\}\s]+)(?P<origin_code>e|i)?$')
+        p6 = regex_engine.compile(
             r'^Processed *(?P<processed_prefixes>[0-9]+) *prefixes, *(?P<processed_paths>[0-9]+) *paths$')
 
         line_iterator = iter(out.splitlines())
@@ -4494,7 +4496,7 @@ class ShowBgpNeighborsAdvertisedCount(ShowBgpNeighborsAdvertisedCountSchema):
         ret_dict = {}
 
         # No of prefixes Advertised: 673
-        p0 = re.compile(r'^No of prefixes Advertised: (?P<prefixes_advertised>\d+)$')
+        p0 = regex_engine.compile(r'^No of prefixes Advertised: (?P<prefixes_advertised>\d+)$')
 
         line_iterator = iter(out.splitlines())
         for line in line_iterator:
@@ -4709,54 +4711,54 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
                                                                      vrf=vrf))
         else:
             out = output
-        p1 = re.compile(r'^\s*BGP *instance *(?P<instance_number>[0-9]+):'
-                        r' *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p2 = re.compile(r'^\s*VRF: *(?P<vrf>[\S]+)$')
-        p3 = re.compile(r'^\s*Address *Family:'
-                        r' *(?P<address_family>[\S\s]+)$')
-        p4 = re.compile(r'^\s*BGP *VRF *(?P<bgp_vrf>[a-zA-Z0-9]+), *state:'
-                        r' *(?P<vrf_state>[a-zA-Z]+)$')
-        p5 = re.compile(r'^\s*BGP *Route *Distinguisher:'
-                        r' *(?P<route_distinguisher>\S+)$')
-        p6 = re.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
-        p7 = re.compile(r'^\s*BGP *router *identifier'
-                        r' *(?P<router_id>[0-9\.]+)\, *local *AS *number'
-                        r' *(?P<local_as>[0-9\.]+)$')
-        p8 = re.compile(r'^\s*BGP *generic *scan *interval'
-                        r' *(?P<generic_scan_interval>[0-9]+) *secs$')
-        p9 = re.compile(r'^\s*Non-stop *routing *is'
-                        r' *(?P<non_stop_routing>[A-Za-z]+)$')
-        p10 = re.compile(r'^\s*BGP *table *state:'
-                         r' *(?P<table_state>[a-zA-Z]+)$')
-        p11 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         r'(?: *RD *version: (?P<rd_version>[0-9]+))?$')
-        p12 = re.compile(r'^\s*BGP *main *routing *table *version'
-                         r' *(?P<bgp_table_version>[0-9]+)$')
-        p13 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version'
-                         r' *(?P<nsr_initial_initsync_version>[0-9]+)'
-                         r' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p14 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions'
-                         r' *(?P<nsr_issu_sync_group_versions>[0-9\/]+)$')
-        p15 = re.compile(
+        p1 = regex_engine.compile(r'^\s*BGP *instance *(?P<instance_number>[0-9]+):'
+                                  r' *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
+        p2 = regex_engine.compile(r'^\s*VRF: *(?P<vrf>[\S]+)$')
+        p3 = regex_engine.compile(r'^\s*Address *Family:'
+                                  r' *(?P<address_family>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^\s*BGP *VRF *(?P<bgp_vrf>[a-zA-Z0-9]+), *state:'
+                                  r' *(?P<vrf_state>[a-zA-Z]+)$')
+        p5 = regex_engine.compile(r'^\s*BGP *Route *Distinguisher:'
+                                  r' *(?P<route_distinguisher>\S+)$')
+        p6 = regex_engine.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
+        p7 = regex_engine.compile(r'^\s*BGP *router *identifier'
+                                  r' *(?P<router_id>[0-9\.]+)\, *local *AS *number'
+                                  r' *(?P<local_as>[0-9\.]+)$')
+        p8 = regex_engine.compile(r'^\s*BGP *generic *scan *interval'
+                                  r' *(?P<generic_scan_interval>[0-9]+) *secs$')
+        p9 = regex_engine.compile(r'^\s*Non-stop *routing *is'
+                                  r' *(?P<non_stop_routing>[A-Za-z]+)$')
+        p10 = regex_engine.compile(r'^\s*BGP *table *state:'
+                                   r' *(?P<table_state>[a-zA-Z]+)$')
+        p11 = regex_engine.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
+                                   r'(?: *RD *version: (?P<rd_version>[0-9]+))?$')
+        p12 = regex_engine.compile(r'^\s*BGP *main *routing *table *version'
+                                   r' *(?P<bgp_table_version>[0-9]+)$')
+        p13 = regex_engine.compile(r'^\s*BGP *NSR *Initial *initsync *version'
+                                   r' *(?P<nsr_initial_initsync_version>[0-9]+)'
+                                   r' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p14 = regex_engine.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions'
+                                   r' *(?P<nsr_issu_sync_group_versions>[0-9\/]+)$')
+        p15 = regex_engine.compile(
             r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9]+) *secs$')
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r'^\s*BGP *is *operating *in *(?P<operation_mode>[a-zA-Z]+) *mode.$')
-        p17 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
-                         r' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
-                         r' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
-                         r' *(?P<standbyver>[0-9]+)$')
-        p17_1 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p17_2 = re.compile(r'^\s*(?P<spk>[0-9]+)\s+(?P<remote_as>[0-9\.]+)'
-                           r'\s+(?P<msg_rcvd>[0-9]+)\s+(?P<msg_sent>[0-9]+)'
-                           r'\s+(?P<tbl_ver>[0-9]+)\s+(?P<input_queue>[0-9]+)'
-                           r'\s+(?P<output_queue>[0-9]+)\s+(?P<up_down>[a-z0-9\:]+)'
-                           r'\s+(?P<state_pfxrcd>.+)$')
-        p17_3 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
-                           r' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
-                           r' +(?P<msg_sent>[0-9]+)'
-                           r' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
-                           r' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
-                           r' +(?P<state_pfxrcd>.+)$')
+        p17 = regex_engine.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
+                                   r' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
+                                   r' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
+                                   r' *(?P<standbyver>[0-9]+)$')
+        p17_1 = regex_engine.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
+        p17_2 = regex_engine.compile(r'^\s*(?P<spk>[0-9]+)\s+(?P<remote_as>[0-9\.]+)'
+                                     r'\s+(?P<msg_rcvd>[0-9]+)\s+(?P<msg_sent>[0-9]+)'
+                                     r'\s+(?P<tbl_ver>[0-9]+)\s+(?P<input_queue>[0-9]+)'
+                                     r'\s+(?P<output_queue>[0-9]+)\s+(?P<up_down>[a-z0-9\:]+)'
+                                     r'\s+(?P<state_pfxrcd>.+)$')
+        p17_3 = regex_engine.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
+                                     r' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
+                                     r' +(?P<msg_sent>[0-9]+)'
+                                     r' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+                                     r' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+                                     r' +(?P<state_pfxrcd>.+)$')
 
         # Init vars
         bgp_instance_summary_dict = {}
@@ -5191,88 +5193,88 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 af_default = 'vpnv4 unicast'
 
         # BGP instance 0: 'default'
-        p1 = re.compile(r'^\s*BGP +instance +(?P<instance_number>[0-9]+):'
-                        r' +(?P<instance>(\S+))$')
+        p1 = regex_engine.compile(r'^\s*BGP +instance +(?P<instance_number>[0-9]+):'
+                                  r' +(?P<instance>(\S+))$')
 
         # VRF: VRF1
-        p2 = re.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
+        p2 = regex_engine.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
 
         # Address Family: VPNv6 Unicast
-        p3 = re.compile(r'^\s*Address +Family: +(?P<address_family>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^\s*Address +Family: +(?P<address_family>[\S\s]+)$')
 
         # BGP VRF VRF1, state: Active
-        p4 = re.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
-                        r' +(?P<vrf_state>(\S+))$')
+        p4 = regex_engine.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
+                                  r' +(?P<vrf_state>(\S+))$')
 
         # BGP Route Distinguisher: 200:1
         # BGP Route Distinguisher: 172.16.2.90:1
 
         # VRF ID: 0x60000001
-        p5 = re.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
+        p5 = regex_engine.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
 
         # BGP router identifier 10.4.1.1, local AS number 100
         # BGP router identifier 10.10.10.108, local AS number 65108.65108
-        p6 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
+        p6 = regex_engine.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+                                  r' +local +AS +number +(?P<local_as>([\d\.]+))$')
 
         # BGP generic scan interval 60 secs
-        p7 =  re.compile(r'^\s*BGP +generic +scan +interval'
-                         r' +(?P<interval>(\d+)) +secs$')
+        p7 =  regex_engine.compile(r'^\s*BGP +generic +scan +interval'
+                                   r' +(?P<interval>(\d+)) +secs$')
 
         # Non-stop routing is enabled
-        p8 = re.compile(r'^\s*Non-stop +routing is enabled$')
+        p8 = regex_engine.compile(r'^\s*Non-stop +routing is enabled$')
 
         # BGP table state: Active
-        p9 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+        p9 = regex_engine.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
 
         # Table ID: 0xe0000010   RD version: 43
-        p10 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
-                         r' +(?P<rd_version>[0-9]+)$')
+        p10 = regex_engine.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+                                   r' +(?P<rd_version>[0-9]+)$')
 
         # BGP main routing table version 43
-        p11 = re.compile(r'^\s*BGP +main +routing +table +version'
-                         r' +(?P<bgp_table_version>[0-9]+)$')
+        p11 = regex_engine.compile(r'^\s*BGP +main +routing +table +version'
+                                   r' +(?P<bgp_table_version>[0-9]+)$')
 
         # BGP NSR Initial initsync version 11 (Reached)
-        p12 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
-                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
-                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p12 = regex_engine.compile(r'^\s*BGP +NSR +Initial +initsync +version'
+                                   r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+                                   r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
 
         # BGP NSR/ISSU Sync-Group versions 0/0
-        p13 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
-                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p13 = regex_engine.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+                                   r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
 
         # BGP scan interval 60 secs 
-        p14 = re.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
-                         r' +secs$')
+        p14 = regex_engine.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
+                                   r' +secs$')
 
         # Route Distinguisher: 200:1 (default for vrf VRF1)
         # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
         # Route Distinguisher: 172.16.2.88:1000
-        p15 = re.compile(r'^\s*Route +Distinguisher:'
-                         r' +(?P<route_distinguisher>\S+)'
-                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+        p15 = regex_engine.compile(r'^\s*Route +Distinguisher:'
+                                   r' +(?P<route_distinguisher>\S+)'
+                                   r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
 
         # *> 2001:db8:cdc9:190::/64   2001:db8:20:1:5::5
         # *>i[2][0][48][0014.01ff.0001][32][10.249.249.10]/136
         # *> [1][10.4.1.1:1][1234.bcff.5d7f.3e11.0505][12564523]/111
-        p16_1 = re.compile(r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                           r' *(?P<prefix>(?P<ip>[a-z0-9\.\:\[\]]+)\/(?P<mask>\d+))'
-                           r'(?: +(?P<next_hop>\S+))?$')
+        p16_1 = regex_engine.compile(r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+                                     r' *(?P<prefix>(?P<ip>[a-z0-9\.\:\[\]]+)\/(?P<mask>\d+))'
+                                     r'(?: +(?P<next_hop>\S+))?$')
 
         # 2219             0 200 33299 51178 47751 {27016} e
         # 2219             0 200 33299 51178 47751 {27016} 65107.65107 e
-        p16_2 = re.compile(r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
-                           r' +(?P<path>[0-9\.\{\}\s]+) '
-                           r'+(?P<origin_codes>(i|e|\?))$')
+        p16_2 = regex_engine.compile(r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
+                                     r' +(?P<path>[0-9\.\{\}\s]+) '
+                                     r'+(?P<origin_codes>(i|e|\?))$')
 
         # Network            Next Hop   Metric LocPrf Weight Path
         # 172.16.2.88                        0    100      0 ?
         # 172.16.2.88                             100      0 i
         # 0.0.0.0                                          0 i
-        p16_3 = re.compile(r'^\s*(?P<next_hop>(\S+))(?: +(?P<metric>(\d+)))?'
-                           r'(?: +(?P<locprf>(\d+)))? +(?P<weight>(\d+))'
-                           r' +(?P<origin_codes>(\?|i|e))$')
+        p16_3 = regex_engine.compile(r'^\s*(?P<next_hop>(\S+))(?: +(?P<metric>(\d+)))?'
+                                     r'(?: +(?P<locprf>(\d+)))? +(?P<weight>(\d+))'
+                                     r' +(?P<origin_codes>(\?|i|e))$')
 
         # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
         # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
@@ -5280,18 +5282,18 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
         # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
         # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
         # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
-        p16 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                         r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)\/(?P<mask>\d+))?'
-                         r' +(?P<next_hop>\S+) +(?P<number>[\d\.\s\{\}]+)'
-                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+        p16 = regex_engine.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+                                   r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)\/(?P<mask>\d+))?'
+                                   r' +(?P<next_hop>\S+) +(?P<number>[\d\.\s\{\}]+)'
+                                   r'(?: *(?P<origin_codes>(i|e|\?)))?$')
 
         #                                                                 65107.65107 ?
-        p17 = re.compile(r'(?P<path>[\d\.\s]+)'
-                         r' *(?P<origin_codes>(i|e|\?))?$')
+        p17 = regex_engine.compile(r'(?P<path>[\d\.\s]+)'
+                                   r' *(?P<origin_codes>(i|e|\?))?$')
 
         # Processed 40 prefixes, 50 paths
-        p18 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
-                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+        p18 = regex_engine.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+                                   r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -5513,10 +5515,10 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 
                 # Parse and set the numbers
                 group_num = group['number']
-                m1 = re.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
-                m2 = re.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
-                m3 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$').match(group_num)
-                m4 = re.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+) (?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$').match(group_num)
+                m4 = regex_engine.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
                 if m1:
                     pfx_dict['metric'] = m1.groupdict()['metric']
                     pfx_dict['locprf'] = m1.groupdict()['locprf']
@@ -5606,20 +5608,20 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
         # 10.36.3.3         default                 0 65000     0     0  Established  None
         # 2001:1:1:1::1   default                 0 65000     0     0  Established  None
         # 10.1.7.212     default                 0 10396     0     0  Established  NSR Ready
-        p1 = re.compile(r'^(?P<neighbor>\S+) +(?P<vrf>\S+) +(?P<spk>\d+) +'
+        p1 = regex_engine.compile(r'^(?P<neighbor>\S+) +(?P<vrf>\S+) +(?P<spk>\d+) +'
             r'(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
             r'(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$')
 
         # 2001:db8:4401:4453::6f9
-        p1_1 = re.compile(r'^(?P<neighbor>[\w\d:]+)$')
+        p1_1 = regex_engine.compile(r'^(?P<neighbor>[\w\d:]+)$')
 
         # default 0 65000 0 0 Established NSR Ready
-        p1_2 = re.compile(r'^(?P<vrf>\S+) +(?P<spk>\d+) +'
-                          r'(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
-                          r'(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$')
+        p1_2 = regex_engine.compile(r'^(?P<vrf>\S+) +(?P<spk>\d+) +'
+                                    r'(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
+                                    r'(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$')
 
         # BGP instance 0: 'default'
-        p2 = re.compile(r'^BGP +instance +\d+: +\'(?P<instance>\S+)\'$')
+        p2 = regex_engine.compile(r'^BGP +instance +\d+: +\'(?P<instance>\S+)\'$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5766,11 +5768,11 @@ class ShowBgpVrfDbVrfAll(ShowBgpVrfDbVrfAllSchema):
         # VPWS:2078                        -           172.16.2.88:2078  2   L2evpn
         # VPWS:10293                       -           172.16.2.88:10293 2   L2evpn
         # EVPN-Multicast-BTV               -           172.16.2.88:1000  2   L2evpn
-        p1 = re.compile(r'^(?P<vrf>(\S+)) +(?P<id>([x0-9\-]+)) +(?P<rd>(\S+))'
-                         r' +(?P<ref>(\d+)) +(?P<afs>(.*))$')
+        p1 = regex_engine.compile(r'^(?P<vrf>(\S+)) +(?P<id>([x0-9\-]+)) +(?P<rd>(\S+))'
+                                   r' +(?P<ref>(\d+)) +(?P<afs>(.*))$')
 
         #                                                                  Vv6u, L2evpn
-        p2 = re.compile(r'^(?P<item>([a-zA-Z0-9\,\s]+))$')
+        p2 = regex_engine.compile(r'^(?P<item>([a-zA-Z0-9\,\s]+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5906,79 +5908,79 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
         bgp_table_version = local_router_id = ''
         prefix = ''
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF'
-                            r' +(?P<vrf_name>\S+), +address +family'
-                            r' +(?P<address_family>[\w\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            r' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
-                            r' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'(?P<prefix>[\w\.\:\/\[\]\,]{3,})'
-                            r'(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
-        p3_1_1 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
-                            r'(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) '
-                            r'+(?P<next_hop>[\w\.\/]+) +'
-                            r'(?P<metric>\d+) +(?P<localprf>\d+) '
-                            r'+(?P<weight>\d+) +(?P<path>[\d ]+) +'
-                            r'(?P<origin_codes>(i|e|\?|\||&))$')
-        p3_1_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            r' (?P<path_type>(i|e|c|l|a|r|I)) '
-                            r'(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))'
-                            r'(?P<prefix>[\w\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[\w\.\:]+)'
-                            r' +(?P<numbers>[\w\s\(\)\{\}]+)'
-                            r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            r'(?P<prefix>[\w\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[\w\.\:]+)'
-                            r' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r' *(?P<next_hop>[\w\.\:]{8,})'
-                            r'(?: +(?P<numbers>[\w\s\(\)\{\}]+))?'
-                            r' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            r' +(?P<next_hop>[\w\.\:]+)'
-                            r' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
-        p3_3_2 = re.compile(r'^\s*(?P<numbers>[0-9\s\(\)\{\}]+)? +'
-                            r'(?P<origin_codes>(i|e|\?|\|))$')
-        p3_4 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>(\S+))'
-                            r'(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            r'((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)'
-                            r'|(default +for +vrf +(?P<default_vrf2>\S+))))\))?$')
+        p = regex_engine.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
+        p1 = regex_engine.compile(r'^\s*BGP +routing +table +information +for +VRF'
+                                      r' +(?P<vrf_name>\S+), +address +family'
+                                      r' +(?P<address_family>[\w\s\-\_]+)$')
+        p2 = regex_engine.compile(r'^\s*BGP +table +version +is'
+                                      r' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
+                                      r' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
+        p3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r'(?P<prefix>[\w\.\:\/\[\]\,]{3,})'
+                                      r'(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
+        p3_1_1 = regex_engine.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
+                                      r'(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) '
+                                      r'+(?P<next_hop>[\w\.\/]+) +'
+                                      r'(?P<metric>\d+) +(?P<localprf>\d+) '
+                                      r'+(?P<weight>\d+) +(?P<path>[\d ]+) +'
+                                      r'(?P<origin_codes>(i|e|\?|\||&))$')
+        p3_1_2 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                      r' (?P<path_type>(i|e|c|l|a|r|I)) '
+                                      r'(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
+        p3_2 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))'
+                                      r'(?P<prefix>[\w\.\:\/\[\]\,]+)'
+                                      r' +(?P<next_hop>[\w\.\:]+)'
+                                      r' +(?P<numbers>[\w\s\(\)\{\}]+)'
+                                      r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_2_1 = regex_engine.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                      r'(?P<prefix>[\w\.\:\/\[\]\,]+)'
+                                      r' +(?P<next_hop>[\w\.\:]+)'
+                                      r' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
+        p3_3 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r' *(?P<next_hop>[\w\.\:]{8,})'
+                                      r'(?: +(?P<numbers>[\w\s\(\)\{\}]+))?'
+                                      r' +(?P<origin_codes>(i|e|\?|\|))$')
+        p3_3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                      r' +(?P<next_hop>[\w\.\:]+)'
+                                      r' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
+        p3_3_2 = regex_engine.compile(r'^\s*(?P<numbers>[0-9\s\(\)\{\}]+)? +'
+                                      r'(?P<origin_codes>(i|e|\?|\|))$')
+        p3_4 = regex_engine.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
+        p4 = regex_engine.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>(\S+))'
+                                      r'(?: +\(((VRF +(?P<default_vrf>\S+))|'
+                                      r'((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)'
+                                      r'|(default +for +vrf +(?P<default_vrf2>\S+))))\))?$')
         
-        p5 = re.compile(r'^\s*BGP *router *identifier *(?P<router_identifier>[0-9\.]+)'
-                         r', *local *AS *number *(?P<local_as>[0-9]+)$')
-        p6 =  re.compile(r'^\s*BGP *generic *scan *interval *'
-                            r'(?P<generic_scan_interval>[0-9]+) *secs$')
-        p7 = re.compile(r'^\s*Non-stop *routing *is'
-                        r' *(?P<non_stop_routing>[A-Za-z]+)$')
-        p8 = re.compile(r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
-        p9 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         r' *RD *version: (?P<rd_version>[0-9]+)$')
-        p10 = re.compile(r'^\s*BGP *main *routing *table *version'
-                         r' *(?P<bgp_table_version>[0-9]+)$')
-        p11 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version *'
-                            r'(?P<nsr_initial_initsync_version>[0-9]+)'
-                          r' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p12 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
-                            r'(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
-        p13 = re.compile(r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$')
-        p14 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))? *(?P<prefix>[\w\.\/\[\]\,]+)$')
-        p15 = re.compile(r'^(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
-                            r'(?: *(?P<origin_codes>(i|e|\?)))$')
-        p16 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+) +prefixes, +'
-                            r'(?P<processed_paths>[0-9]+) +paths$')
+        p5 = regex_engine.compile(r'^\s*BGP *router *identifier *(?P<router_identifier>[0-9\.]+)'
+                                   r', *local *AS *number *(?P<local_as>[0-9]+)$')
+        p6 =  regex_engine.compile(r'^\s*BGP *generic *scan *interval *'
+                                      r'(?P<generic_scan_interval>[0-9]+) *secs$')
+        p7 = regex_engine.compile(r'^\s*Non-stop *routing *is'
+                                  r' *(?P<non_stop_routing>[A-Za-z]+)$')
+        p8 = regex_engine.compile(r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
+        p9 = regex_engine.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
+                                   r' *RD *version: (?P<rd_version>[0-9]+)$')
+        p10 = regex_engine.compile(r'^\s*BGP *main *routing *table *version'
+                                   r' *(?P<bgp_table_version>[0-9]+)$')
+        p11 = regex_engine.compile(r'^\s*BGP *NSR *Initial *initsync *version *'
+                                      r'(?P<nsr_initial_initsync_version>[0-9]+)'
+                                    r' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p12 = regex_engine.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
+                                      r'(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p13 = regex_engine.compile(r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$')
+        p14 = regex_engine.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))? *(?P<prefix>[\w\.\/\[\]\,]+)$')
+        p15 = regex_engine.compile(r'^(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
+                                      r'(?: *(?P<origin_codes>(i|e|\?)))$')
+        p16 = regex_engine.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+) +prefixes, +'
+                                      r'(?P<processed_paths>[0-9]+) +paths$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6172,25 +6174,25 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{5,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{5,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     index_dict.update({'metric': int(m1.groupdict()['metric'])})
@@ -6222,25 +6224,25 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{5,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{5,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     index_dict.update({'metric': int(m1.groupdict()['metric'])})
@@ -6334,25 +6336,25 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{5,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{5,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     index_dict.update({'metric': int(m1.groupdict()['metric'])})
@@ -6510,25 +6512,25 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                     if group_num:
                         # metric   locprf  weight path
                         # 2219      211       0 200 33299 51178 47751 {27016}
-                        m1 = re.compile(r'^(?P<metric>[0-9]+)  +'
-                                    r'(?P<locprf>[0-9]+)  +'
-                                    r'(?P<weight>[0-9]+) '
-                                    r'(?P<path>[0-9\{\}\s]+)$').match(group_num)
+                        m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)  +'
+                                              r'(?P<locprf>[0-9]+)  +'
+                                              r'(?P<weight>[0-9]+) '
+                                              r'(?P<path>[0-9\{\}\s]+)$').match(group_num)
         
                         # metric   locprf  weight path
                         # 2219                0 200 33299 51178 47751 {27016}
                         # locprf   weight path
                         # 211         0 200 33299 51178 47751 {27016}
         
-                        m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                    r'(?P<space>\s{2,20})'
-                                    r'(?P<weight>[0-9]+) '
-                                    r'(?P<path>[0-9\{\}\s]+)$').match(group_num)
+                        m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                              r'(?P<space>\s{2,20})'
+                                              r'(?P<weight>[0-9]+) '
+                                              r'(?P<path>[0-9\{\}\s]+)$').match(group_num)
         
                         # weight path
                         # 0 200 33299 51178 47751 {27016}
-                        m3 = re.compile(r'^(?P<weight>[0-9]+) '
-                                    r'(?P<path>((\d+\s)|(\{\d+\}\s))+)$')\
+                        m3 = regex_engine.compile(r'^(?P<weight>[0-9]+) '
+                                              r'(?P<path>((\d+\s)|(\{\d+\}\s))+)$')\
                                 .match(group_num)
         
                         if m1:
@@ -6639,52 +6641,52 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
         index = 1
 
         # Route Distinguisher: 10.196.7.7:3
-        p1 = re.compile(r'^Route +Distinguisher: +(?P<rd>(\S+))$')
+        p1 = regex_engine.compile(r'^Route +Distinguisher: +(?P<rd>(\S+))$')
 
         # [2][0][48][7777.77ff.7779][0]/104 is advertised to 10.55.0.10
         # [1][0009.08ff.0d0c.0403.0201][0]/120 is advertised to 10.100.5.5
-        p2 = re.compile(r'^(?P<prefix>\[[^/]+\])/(?P<prefix_length>(\d+)) +is'
-                         r' +advertised +to +(?P<neighbor>(\S+))$')
+        p2 = regex_engine.compile(r'^(?P<prefix>\[[^/]+\])/(?P<prefix_length>(\d+)) +is'
+                                   r' +advertised +to +(?P<neighbor>(\S+))$')
 
         #  Path info:
-        p3 = re.compile(r'^Path info:$')
+        p3 = regex_engine.compile(r'^Path info:$')
 
         #    neighbor: Local           neighbor router id: 10.1.8.8
         #    neighbor: Local           neighbor router id: 10.196.7.7
-        p4 = re.compile(r'^neighbor: +(?P<neighbor>(\S+)) +neighbor +router'
-                         r' +id: +(?P<neighbor_router_id>(\S+))$')
+        p4 = regex_engine.compile(r'^neighbor: +(?P<neighbor>(\S+)) +neighbor +router'
+                                   r' +id: +(?P<neighbor_router_id>(\S+))$')
 
         #    valid  redistributed  best  import-candidate
-        p5 = re.compile(r'^(?P<flags>(valid.*))$')
+        p5 = regex_engine.compile(r'^(?P<flags>(valid.*))$')
 
         #    Received Path ID 0, Local Path ID 0, version 12
-        p6 = re.compile(r'^Received +Path +ID +(?P<rx_path_id>(\d+)), +Local'
-                         r' +Path +ID +(?P<local_path_id>(\d+)), +version'
-                         r' (?P<version>(\d+))$')
+        p6 = regex_engine.compile(r'^Received +Path +ID +(?P<rx_path_id>(\d+)), +Local'
+                                   r' +Path +ID +(?P<local_path_id>(\d+)), +version'
+                                   r' (?P<version>(\d+))$')
 
         #  Attributes after inbound policy was applied:
         #  Attributes after outbound policy was applied:
-        p7 = re.compile(r'^Attributes +after +(?P<type>(outbound|inbound))'
-                         r' +policy +was +applied:$')
+        p7 = regex_engine.compile(r'^Attributes +after +(?P<type>(outbound|inbound))'
+                                   r' +policy +was +applied:$')
 
         #    next hop: 10.1.8.8
-        p8 = re.compile(r'^next +hop:(?: +(?P<nexthop>(\S+)))?$')
+        p8 = regex_engine.compile(r'^next +hop:(?: +(?P<nexthop>(\S+)))?$')
 
         #    EXTCOMM
         #    ORG AS EXTCOMM
-        p9 = re.compile(r'^(?P<community_attributes>(EXTCOMM|ORG AS EXTCOMM))$')
+        p9 = regex_engine.compile(r'^(?P<community_attributes>(EXTCOMM|ORG AS EXTCOMM))$')
 
         #    origin: IGP  
-        p10 = re.compile(r'^origin:(?: +(?P<origin>.*))?$')
+        p10 = regex_engine.compile(r'^origin:(?: +(?P<origin>.*))?$')
 
         #    aspath: 
-        p11 = re.compile(r'^aspath:(?: +(?P<aspath>.*))?$')
+        p11 = regex_engine.compile(r'^aspath:(?: +(?P<aspath>.*))?$')
 
         #    community: no-export
-        p12 = re.compile(r'^community:(?: +(?P<community>.*))?$')
+        p12 = regex_engine.compile(r'^community:(?: +(?P<community>.*))?$')
 
         #    extended community: SoO:0.0.0.0:0 RT:100:7
-        p13 = re.compile(r'^extended +community:(?: +(?P<extended_community>.*))?$')
+        p13 = regex_engine.compile(r'^extended +community:(?: +(?P<extended_community>.*))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6988,73 +6990,73 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
 
 
         # VRF: default
-        p1 = re.compile(r'^VRF:\s+(?P<vrf>([\w]+))$')
+        p1 = regex_engine.compile(r'^VRF:\s+(?P<vrf>([\w]+))$')
 
         # Nexthop ID: 0x6000074, Version: 0x0
-        p2 = re.compile(r'^Nexthop ID:\s+(?P<nexthop_id>([\w]+)),\s+Version:\s+((?P<version>[\w]+))$')
+        p2 = regex_engine.compile(r'^Nexthop ID:\s+(?P<nexthop_id>([\w]+)),\s+Version:\s+((?P<version>[\w]+))$')
 
         # Nexthop Flags: 0x00000000
-        p3 = re.compile(r'^Nexthop Flags:\s+((?P<nexthop_flags>[\w]+))$')
+        p3 = regex_engine.compile(r'^Nexthop Flags:\s+((?P<nexthop_flags>[\w]+))$')
 
         # Nexthop Handle: 0x7fba00aafccc
-        p4 = re.compile(r'^Nexthop Handle:\s+((?P<nexthop_handle>[\w]+))$')
+        p4 = regex_engine.compile(r'^Nexthop Handle:\s+((?P<nexthop_handle>[\w]+))$')
 
         # Firsthop interface handle 0x0c001cc0
-        p5 = re.compile(r'^Firsthop interface handle\s+((?P<first_interface_handle>[\w]+))$')
+        p5 = regex_engine.compile(r'^Firsthop interface handle\s+((?P<first_interface_handle>[\w]+))$')
 
         # Gateway TBL Id: 0xe0000000    Gateway Flags: 0x00000080
-        p6 = re.compile(r'^Gateway TBL Id:\s+((?P<gateway_tbl_id>[\w]+)\s+)Gateway Flags:\s+((?P<gateway_flags>[\w]+))$')
+        p6 = regex_engine.compile(r'^Gateway TBL Id:\s+((?P<gateway_tbl_id>[\w]+)\s+)Gateway Flags:\s+((?P<gateway_flags>[\w]+))$')
 
         # Gateway Handle: 0x7fba14059ce0
-        p7 = re.compile(r'^Gateway Handle:\s+((?P<gateway_handle>[\w]+))$')
+        p7 = regex_engine.compile(r'^Gateway Handle:\s+((?P<gateway_handle>[\w]+))$')
 
         # Gateway: reachable, non-Connected route, prefix length 32
-        p8 = re.compile(r'^Gateway:\s+((?P<gateway>[\s\S]+))$')
+        p8 = regex_engine.compile(r'^Gateway:\s+((?P<gateway>[\s\S]+))$')
 
         # Resolving Route: 10.4.16.16/32 (static)
-        p9 = re.compile(r'^Resolving Route:\s+((?P<resolving_route>[\s\S]+))$')        
+        p9 = regex_engine.compile(r'^Resolving Route:\s+((?P<resolving_route>[\s\S]+))$')        
 
         # Paths: 0
-        p10 = re.compile(r'^Paths:\s+((?P<paths>[\d]+)\s*)$')
+        p10 = regex_engine.compile(r'^Paths:\s+((?P<paths>[\d]+)\s*)$')
 
         # RIB Nexhop ID: 0x0
-        p11 = re.compile(r'^RIB Nexhop ID:\s+((?P<rib_nexthop_id>[\w]+))$')
+        p11 = regex_engine.compile(r'^RIB Nexhop ID:\s+((?P<rib_nexthop_id>[\w]+))$')
 
         # Status: [Reachable][Not Connected][Not Local]
-        p12 = re.compile(r'^Status:\s+((?P<status>[\s\S]+))$')
+        p12 = regex_engine.compile(r'^Status:\s+((?P<status>[\s\S]+))$')
 
         # Metric: 0
-        p13 = re.compile(r'^Metric:\s+((?P<metric>[\d]+))$')
+        p13 = regex_engine.compile(r'^Metric:\s+((?P<metric>[\d]+))$')
 
         # Registration: Asynchronous, Completed: 00:02:15
-        p14 = re.compile(r'^Registration:\s+(?P<registration>[\w]+),\s+Completed:\s+((?P<completed>[\w\:]+))$')
+        p14 = regex_engine.compile(r'^Registration:\s+(?P<registration>[\w]+),\s+Completed:\s+((?P<completed>[\w\:]+))$')
 
         # Events: Critical (1)/Non-critical (0)
-        p15 = re.compile(r'^Events:\s+((?P<events>[\s\S]+))$')
+        p15 = regex_engine.compile(r'^Events:\s+((?P<events>[\s\S]+))$')
 
         # Last Received: 00:02:14 (Critical)
-        p16 = re.compile(r'^Last Received:\s+((?P<last_received>[\s\S]+))$')
+        p16 = regex_engine.compile(r'^Last Received:\s+((?P<last_received>[\s\S]+))$')
 
         # Last gw update: (Crit-notif) 00:02:14(rib)
-        p17 = re.compile(r'^Last gw update:\s+((?P<last_gw_update>[\s\S]+))$')
+        p17 = regex_engine.compile(r'^Last gw update:\s+((?P<last_gw_update>[\s\S]+))$')
 
         # Reference Count: 1
-        p18 = re.compile(r'^Reference Count:\s+((?P<reference_count>[\d]+))$')
+        p18 = regex_engine.compile(r'^Reference Count:\s+((?P<reference_count>[\d]+))$')
 
         # Active Tables: [IPv4 Unicast]
-        p19 = re.compile(r'^Active Tables:\s+((?P<active_tables>[\s\S]+))$')
+        p19 = regex_engine.compile(r'^Active Tables:\s+((?P<active_tables>[\s\S]+))$')
 
         # Metrices: [0x0]
-        p20 = re.compile(r'^Metrices:\s+((?P<metrics>[\s\S]+))$')
+        p20 = regex_engine.compile(r'^Metrices:\s+((?P<metrics>[\s\S]+))$')
 
         # Reference Counts: [1]
-        p21 = re.compile(r'^Reference Counts:\s+(\[(?P<reference_counts>[\d]+)\])$')
+        p21 = regex_engine.compile(r'^Reference Counts:\s+(\[(?P<reference_counts>[\d]+)\])$')
 
         # Interface Handle: 0x0
-        p22 = re.compile(r'^Interface Handle:\s+((?P<interface_handle>[\w]+))$')                        
+        p22 = regex_engine.compile(r'^Interface Handle:\s+((?P<interface_handle>[\w]+))$')                        
 
         # Attr ref-count: 4
-        p23 = re.compile(r'^Attr ref-count:\s+((?P<attr_ref_count>[\d]+))$')
+        p23 = regex_engine.compile(r'^Attr ref-count:\s+((?P<attr_ref_count>[\d]+))$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -7351,67 +7353,67 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
         ref_dict = {}
 
         # Address Family: VPNv4 Unicast
-        p1 =  re.compile(r'^Address +Family: +(?P<address_family>[\S\s]+)$')
+        p1 =  regex_engine.compile(r'^Address +Family: +(?P<address_family>[\S\s]+)$')
 
         # Total Nexthop Processing
-        p2 = re.compile(r'^Total +Nexthop +Processing$')
+        p2 = regex_engine.compile(r'^Total +Nexthop +Processing$')
 
         # Maximum Nexthop Processing
-        p3 = re.compile(r'^Maximum +Nexthop +Processing$')
+        p3 = regex_engine.compile(r'^Maximum +Nexthop +Processing$')
 
         # Last Notification Processing
-        p4 = re.compile(r'^Last +Notification +Processing$')
+        p4 = regex_engine.compile(r'^Last +Notification +Processing$')
 
         # Time Spent: 0.000 secs
-        p5 = re.compile(r'^Time +Spent: +(?P<time_spent_secs>[\d\.]+) secs$')
+        p5 = regex_engine.compile(r'^Time +Spent: +(?P<time_spent_secs>[\d\.]+) secs$')
 
         # Received: 00:00:00
-        p6 = re.compile(r'^Received: +(?P<received>.+)$')
+        p6 = regex_engine.compile(r'^Received: +(?P<received>.+)$')
 
         # Bestpaths Deleted: 0
-        p7 = re.compile(r'^Bestpaths +Deleted: +(?P<best_paths_deleted>[\S\s]+)$')
+        p7 = regex_engine.compile(r'^Bestpaths +Deleted: +(?P<best_paths_deleted>[\S\s]+)$')
 
         # Bestpaths Changed: 0
-        p8 = re.compile(r'^Bestpaths +Changed: +(?P<best_paths_changed>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^Bestpaths +Changed: +(?P<best_paths_changed>[\S\s]+)$')
 
         # Gateway Address Family: IPv4 Unicast
-        p9 = re.compile(r'^Gateway +Address +Family: +(?P<gateway_address_family>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^Gateway +Address +Family: +(?P<gateway_address_family>[\S\s]+)$')
 
         # Table ID: 0xe0000000
-        p10 = re.compile(r'^Table +ID: +(?P<table_id>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^Table +ID: +(?P<table_id>[\S\s]+)$')
 
         # Nexthop Count: 2
-        p11 = re.compile(r'^Nexthop +Count: +(?P<next_hop_count>[\S\s]+)$')
+        p11 = regex_engine.compile(r'^Nexthop +Count: +(?P<next_hop_count>[\S\s]+)$')
 
         # Critical Trigger Delay: 0msec
-        p12 = re.compile(r'^Critical +Trigger +Delay: +(?P<critical_trigger_delay>[\S\s]+)$')
+        p12 = regex_engine.compile(r'^Critical +Trigger +Delay: +(?P<critical_trigger_delay>[\S\s]+)$')
 
         # Non-critical Trigger Delay: 10000msec
-        p13 = re.compile(r'^Non-critical +Trigger +Delay: +(?P<non_critical_trigger_delay>[\S\s]+)$')
+        p13 = regex_engine.compile(r'^Non-critical +Trigger +Delay: +(?P<non_critical_trigger_delay>[\S\s]+)$')
 
         # Nexthop Version: 1, RIB version: 1
-        p14 = re.compile(r'^Nexthop +Version: +(?P<next_hop_version>[\d]+), +RIB +version:'
-                         r' +(?P<rib_version>\d+)$')
+        p14 = regex_engine.compile(r'^Nexthop +Version: +(?P<next_hop_version>[\d]+), +RIB +version:'
+                                   r' +(?P<rib_version>\d+)$')
 
         # EPE Table Version: 1, EPE Label version: 1
-        p15 = re.compile(r'^EPE +Table +Version: +(?P<epe_table_version>[\d]+), +EPE +Label '
-                         r'+version: +(?P<epe_label_version>[\d]+)$')
+        p15 = regex_engine.compile(r'^EPE +Table +Version: +(?P<epe_table_version>[\d]+), +EPE +Label '
+                                   r'+version: +(?P<epe_label_version>[\d]+)$')
 
         # EPE Downloaded Version: 1, EPE Standby Version: 1
-        p16 = re.compile(r'^EPE +Downloaded +Version: +(?P<epe_downloaded_version>[\d]+), '
-                         r'+EPE +Standby +Version: +(?P<epe_standby_version>[\d]+)$')
+        p16 = regex_engine.compile(r'^EPE +Downloaded +Version: +(?P<epe_downloaded_version>[\d]+), '
+                                   r'+EPE +Standby +Version: +(?P<epe_standby_version>[\d]+)$')
 
         # 108.10.10.1     [R][NC][NL]          2   e0000000   1/0    00:13:49 (Cri)        1/4
-        p17 = re.compile(r'^(?P<next_hop>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+(?P<status>[\S]+)\s+'
-                         r'(?P<metric>\d+)\s+(?P<tbl_id>\S+)\s+(?P<notf>\S+)\s+(?P<last_rib_event>\S+'
-                         r'\s\(\w+\))\s+(?P<ref_count>\S+)$')
+        p17 = regex_engine.compile(r'^(?P<next_hop>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+(?P<status>[\S]+)\s+'
+                                   r'(?P<metric>\d+)\s+(?P<tbl_id>\S+)\s+(?P<notf>\S+)\s+(?P<last_rib_event>\S+'
+                                   r'\s\(\w+\))\s+(?P<ref_count>\S+)$')
 
         # 2000:108:10:10::1
-        p18 = re.compile(r'^(?P<next_hop_ipv6>[a-fA-F\d\:]+)$')
+        p18 = regex_engine.compile(r'^(?P<next_hop_ipv6>[a-fA-F\d\:]+)$')
 
         # [R][NC][NL]          1   e0800000   1/0    00:12:06 (Cri)        0/3
-        p19 = re.compile(r'^(?P<status>[\S]+)\s+(?P<metric>\d+)\s+(?P<tbl_id>\S+)\s+(?P<notf>\S+)\s+'
-                         r'(?P<last_rib_event>\S+\s\(\w+\))\s+(?P<ref_count>\S+)$')
+        p19 = regex_engine.compile(r'^(?P<status>[\S]+)\s+(?P<metric>\d+)\s+(?P<tbl_id>\S+)\s+(?P<notf>\S+)\s+'
+                                   r'(?P<last_rib_event>\S+\s\(\w+\))\s+(?P<ref_count>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -7652,9 +7654,9 @@ class ShowBgpBrief(ShowBgpBriefSchema):
 
         # *> 111.111.111.111/32 108.10.0.2               0           100 65401 i
         # *                     108.11.0.2               0             0 65401 i
-        p1 = re.compile(r'^.*\s(?P<next_hop>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
-                        r'(?P<metric>\d+)\s+(?P<locprf>\d+)\s+(?P<weight>\d+)\s+'
-                        r'(?P<path>\D)$')
+        p1 = regex_engine.compile(r'^.*\s(?P<next_hop>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+                                  r'(?P<metric>\d+)\s+(?P<locprf>\d+)\s+(?P<weight>\d+)\s+'
+                                  r'(?P<path>\D)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -7771,46 +7773,46 @@ class ShowBgpBestpathCompare(ShowBgpBestpathCompareSchema):
         next_line_update_group = False
 
         # Speaker                  5           5
-        p1 = re.compile(r'^(?P<process>\w+)\s+(?P<brib_rib>\d+)\s+(?P<send_tbl_ver>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<process>\w+)\s+(?P<brib_rib>\d+)\s+(?P<send_tbl_ver>\d+)$')
 
         # Last Modified: Mar  9 02:23:41.504 for 00:00:35
-        p2 = re.compile(r'^Last +Modified: (?P<last_modified>.*)$')
+        p2 = regex_engine.compile(r'^Last +Modified: (?P<last_modified>.*)$')
 
         # Paths: (2 available, best #1)
-        p3 = re.compile(r'^Paths: +\((?P<available_paths>\d+) +available\, '
-                        r'+best +\#(?P<best_path>\d+)\)$')
+        p3 = regex_engine.compile(r'^Paths: +\((?P<available_paths>\d+) +available\, '
+                                  r'+best +\#(?P<best_path>\d+)\)$')
 
         # Path #1: Received by speaker 0
-        p4 = re.compile(r'^Path+ #(?P<path_num>\d+).*$')
+        p4 = regex_engine.compile(r'^Path+ #(?P<path_num>\d+).*$')
 
         # Advertised IPv4 Unicast paths to update-groups (with more than one peer):
-        p5 = re.compile(r'^.*(?P<group2>update-groups).*$')
+        p5 = regex_engine.compile(r'^.*(?P<group2>update-groups).*$')
 
         # Not advertised to any peer
-        p6 = re.compile(r'^Not +advertised +to +any +peer$')
+        p6 = regex_engine.compile(r'^Not +advertised +to +any +peer$')
 
         # 0.1 0.3
-        p7 = re.compile(r'^(?P<group1>[\d\.]+)(?: +(?P<group2>[\d\.]+))$')
+        p7 = regex_engine.compile(r'^(?P<group1>[\d\.]+)(?: +(?P<group2>[\d\.]+))$')
 
         # 108.10.0.2 from 108.10.0.2 (192.68.33.108)
-        p8 = re.compile(r'^((?P<next_hop>[0-9\.]+)+ from +(?P<gateway>[0-9\.]+) '
-                        r'+\((?P<originator>[0-9\.]+)\))$')
+        p8 = regex_engine.compile(r'^((?P<next_hop>[0-9\.]+)+ from +(?P<gateway>[0-9\.]+) '
+                                  r'+\((?P<originator>[0-9\.]+)\))$')
 
         # Origin IGP, metric 0, localpref 100, weight 100, valid, external, best, group-best
-        p9 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),(?: '
-                        r'+metric (?P<metric>[0-9]+),?)?(?: '
-                        r'+localpref (?P<localpref>[0-9]+),?)?(?: '
-                        r'+weight (?P<weight>[0-9]+),?)?(?: '
-                        r'+(?P<valid>valid?,))?(?: '
-                        r'+(?P<state>(internal|external|local)\,?))?(\,)?(?: '
-                        r'(?P<best>best))?(\,)?(?: (?P<group_best>group-best))?$')
+        p9 = regex_engine.compile(r'^Origin +(?P<origin>[a-zA-Z]+),(?: '
+                                  r'+metric (?P<metric>[0-9]+),?)?(?: '
+                                  r'+localpref (?P<localpref>[0-9]+),?)?(?: '
+                                  r'+weight (?P<weight>[0-9]+),?)?(?: '
+                                  r'+(?P<valid>valid?,))?(?: '
+                                  r'+(?P<state>(internal|external|local)\,?))?(\,)?(?: '
+                                  r'(?P<best>best))?(\,)?(?: (?P<group_best>group-best))?$')
 
         #  Received Path ID 0, Local Path ID 0, version 0
-        p10 = re.compile(r'^Received Path ID (?P<received_path_id>(\d+)), Local Path ID '
-                        r'(?P<local_path_id>(\d+)), version (?P<version>(\d+))$')
+        p10 = regex_engine.compile(r'^Received Path ID (?P<received_path_id>(\d+)), Local Path ID '
+                                  r'(?P<local_path_id>(\d+)), version (?P<version>(\d+))$')
 
         # Origin-AS validity: (disabled)
-        p11 = re.compile(r'^Origin-AS validity: \((?P<origin_as_validity>\w+)\)$')
+        p11 = regex_engine.compile(r'^Origin-AS validity: \((?P<origin_as_validity>\w+)\)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -8107,105 +8109,105 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
         # BGP routing table entry for 2000:71:1:1::1/128, Route Distinguisher: 50.1.1.4:2
         # BGP routing table entry for [1][0000.0000.0000.0001.0500][10001]/120, Route Distinguisher: 10.0.0.1:1001
         # BGP routing table entry for fc00:a000:1000:101::2/128
-        p1 = re.compile(r'^BGP\s+routing\s+table\s+entry\s+for\s+(?P<prefix>(?P<ip>[a-z0-9.:\/\[\]]+)\/(?P<mask>\d+))'
-                        r'(?:,\s+Route\s+Distinguisher:\s+(?P<rd>[\d.:]+))?$')
+        p1 = regex_engine.compile(r'^BGP\s+routing\s+table\s+entry\s+for\s+(?P<prefix>(?P<ip>[a-z0-9.:\/\[\]]+)\/(?P<mask>\d+))'
+                                  r'(?:,\s+Route\s+Distinguisher:\s+(?P<rd>[\d.:]+))?$')
         
         # SRv6-VPN SID: fc00:c000:1002:e008::/64
-        p1_1 = re.compile(r'^SRv6-VPN\s+SID:\s+(?P<vpn_sid>\S+)')
+        p1_1 = regex_engine.compile(r'^SRv6-VPN\s+SID:\s+(?P<vpn_sid>\S+)')
 
         # Last Modified: Mar 27 02:45:20.105 for 1d15h
-        p2 = re.compile(r'^Last +Modified: (?P<last_modified>.*)$')
+        p2 = regex_engine.compile(r'^Last +Modified: (?P<last_modified>.*)$')
 
         # Paths: (1 available, best #1)
-        p3 = re.compile(r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$')
+        p3 = regex_engine.compile(r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$')
 
         # Not advertised to any peer
-        p4 = re.compile(r'^Not\s+advertised\s+to\s+any\s+peer$')
+        p4 = regex_engine.compile(r'^Not\s+advertised\s+to\s+any\s+peer$')
 
         # Advertised to PE peers (in unique update groups):
         # Advertised to CE peers (in unique update groups):
-        p5 = re.compile(r'^Advertised\s+to\s+(?P<peer_name>[a-zA-Z0-9]+)\s+peers\s+\(in\s+unique\s+update\s+groups\):$')
+        p5 = regex_engine.compile(r'^Advertised\s+to\s+(?P<peer_name>[a-zA-Z0-9]+)\s+peers\s+\(in\s+unique\s+update\s+groups\):$')
 
         # Path #1: Received by speaker 0
-        p6 = re.compile(r'^Path\s+#(?P<path_num>\d+):.*$')
+        p6 = regex_engine.compile(r'^Path\s+#(?P<path_num>\d+):.*$')
 
         # 50.1.1.8
         # 2000:90:11:1::2
         # fd00:ffff:100:11::2
-        p7 = re.compile(r'^(?P<advertised_peer>[a-f0-9.:]+)$') # ^(?P<advertised_peer>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$
+        p7 = regex_engine.compile(r'^(?P<advertised_peer>[a-f0-9.:]+)$') # ^(?P<advertised_peer>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$
 
         # 7000
         # Local
-        p8 = re.compile(r'^(?P<as_path>[a-zA-Z0-9]+)$')
+        p8 = regex_engine.compile(r'^(?P<as_path>[a-zA-Z0-9]+)$')
 
         # 50.1.1.1 (metric 4) from 50.1.1.8 (50.1.1.1)
         # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
         # :: from :: (50.1.1.4)
         # fc00:a000:1000::1 (metric 30) from fc00:a000:2000::14 (10.0.0.1), if-handle 0x00000000
-        p9 = re.compile(r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?'
-                        r'from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?'
-                        r'(?:,\s+if-handle\s+(?P<if_handle>[\w]+))?')
+        p9 = regex_engine.compile(r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?'
+                                  r'from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?'
+                                  r'(?:,\s+if-handle\s+(?P<if_handle>[\w]+))?')
 
         # Local Label: 24023
         # Received Label 24000
         # Received Label 0xe0030
-        p10 = re.compile(r'^(?P<label_name>\w+)\s+Label:*\s+(?P<label_value>\w+)$')
+        p10 = regex_engine.compile(r'^(?P<label_name>\w+)\s+Label:*\s+(?P<label_value>\w+)$')
 
         # Origin incomplete, metric 0, localpref 100, valid, internal, best, group-best, import-candidate, imported
         # Origin IGP, metric 0, localpref 100, valid, external, best, group-best, import-candidate
         # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best, import-candidate
         # Origin incomplete, metric 0, localpref 100, valid, internal, backup, add-path, import-candidate, imported
         # Origin IGP, localpref 100, valid, internal, best, group-best, import-candidate, not-in-vrf
-        p11 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),'
-                         r'(?: +metric (?P<metric>[0-9]+),?)?'
-                         r'(?: +localpref (?P<localpref>[0-9]+),?)?'
-                         r'(?: +weight (?P<weight>[0-9]+),?)?'
-                         r'(?: +(?P<valid>valid?),)?'
-                         r'(?: (?P<redistributed>redistributed?),)?'
-                         r'(?: +(?P<state>(internal|external|local)?),)?(\,*)?'
-                         r'(?: (?P<best>best))?(\,*)?'
-                         r'(?: (?P<group_best>group-best?),*)?'
-                         r'(?: (?P<backup>backup),*)?'
-                         r'(?: (?P<add_path>add-path),*)?'
-                         r'(?: (?P<import_candidate>import-candidate?),*)?'
-                         r'(?: (?P<imported>imported?),*)?'
-                         r'(?:\s+(?P<not_in_vrf>not-in-vrf))?')
+        p11 = regex_engine.compile(r'^Origin +(?P<origin>[a-zA-Z]+),'
+                                   r'(?: +metric (?P<metric>[0-9]+),?)?'
+                                   r'(?: +localpref (?P<localpref>[0-9]+),?)?'
+                                   r'(?: +weight (?P<weight>[0-9]+),?)?'
+                                   r'(?: +(?P<valid>valid?),)?'
+                                   r'(?: (?P<redistributed>redistributed?),)?'
+                                   r'(?: +(?P<state>(internal|external|local)?),)?(\,*)?'
+                                   r'(?: (?P<best>best))?(\,*)?'
+                                   r'(?: (?P<group_best>group-best?),*)?'
+                                   r'(?: (?P<backup>backup),*)?'
+                                   r'(?: (?P<add_path>add-path),*)?'
+                                   r'(?: (?P<import_candidate>import-candidate?),*)?'
+                                   r'(?: (?P<imported>imported?),*)?'
+                                   r'(?:\s+(?P<not_in_vrf>not-in-vrf))?')
 
         #  Received Path ID 0, Local Path ID 0, version 715
-        p12 = re.compile(r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
-                         r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
-                         r'version\s+(?P<version>(\d+))$')
+        p12 = regex_engine.compile(r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
+                                   r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
+                                   r'version\s+(?P<version>(\d+))$')
 
         # Extended community: RT:100:1001
-        p13 = re.compile(r'^Extended\s+community:(?:\s+(?P<extended_community>.*))?$')
+        p13 = regex_engine.compile(r'^Extended\s+community:(?:\s+(?P<extended_community>.*))?$')
 
         # Originator: 50.1.1.1, Cluster list: 50.1.1.8
         # Originator: 10.0.0.3, Cluster list: 10.0.0.11, 10.0.0.13
-        p14 = re.compile(r'^Originator:\s+(?P<originator>[\d.]+),\s+Cluster\s+list:\s+(?P<cluster_list>[\d., ]+)$')
+        p14 = regex_engine.compile(r'^Originator:\s+(?P<originator>[\d.]+),\s+Cluster\s+list:\s+(?P<cluster_list>[\d., ]+)$')
 
         # Source AFI: VPNv6 Unicast, Source VRF: default, Source Route Distinguisher: 50.1.1.1:0
         # Source AFI: VPNv6 Unicast, Source VRF: SRV6_L3VPN_BE, Source Route Distinguisher: 100:1
-        p15 = re.compile(r'^Source\s+AFI:\s+(?P<source_afi>[a-zA-Z0-9 ]+),\s+Source\s+VRF:\s+(?P<source_vrf>[a-zA-Z0-9_]+)'
-                         r',\s+Source\s+Route\s+Distinguisher:\s+(?P<source_rd>[\d.:]+)$')
+        p15 = regex_engine.compile(r'^Source\s+AFI:\s+(?P<source_afi>[a-zA-Z0-9 ]+),\s+Source\s+VRF:\s+(?P<source_vrf>[a-zA-Z0-9_]+)'
+                                   r',\s+Source\s+Route\s+Distinguisher:\s+(?P<source_rd>[\d.:]+)$')
         
         # PSID-Type:L3, SubTLV Count:1, R:0x00,
-        p16 = re.compile(r'^PSID-Type:(?P<psid_type>\w+),\s+SubTLV\s+Count:(?P<subtlv_count>\d+)(?:(,\s+R:(?P<r_value>\w+),))?$')
+        p16 = regex_engine.compile(r'^PSID-Type:(?P<psid_type>\w+),\s+SubTLV\s+Count:(?P<subtlv_count>\d+)(?:(,\s+R:(?P<r_value>\w+),))?$')
 
         # SubTLV:
         # SubSubTLV:
-        p17 = re.compile(r'^(?P<tlv_name>SubTLV|SubSubTLV):$')
+        p17 = regex_engine.compile(r'^(?P<tlv_name>SubTLV|SubSubTLV):$')
 
         # T:1(Sid information), Sid:fc00:c000:2003::, F:0x00, R2:0x00, Behavior:62, R3:0x00, SS-TLV Count:1
-        p18 = re.compile(r'^T:(?P<t_value>\d+)\(Sid\s+information\),\s+Sid:(?P<sid_value>[a-f0-9.:]+),\s+'
-                         r'F:(?P<f_value>\w+),\s+R2:(?P<r2_value>\w+),\s+Behavior:(?P<behaviour>\d+),\s+'
-                         r'R3:(?P<r3_value>\w+),\s+SS-TLV\s+Count:(?P<sstlv_count>\d+)$')
+        p18 = regex_engine.compile(r'^T:(?P<t_value>\d+)\(Sid\s+information\),\s+Sid:(?P<sid_value>[a-f0-9.:]+),\s+'
+                                   r'F:(?P<f_value>\w+),\s+R2:(?P<r2_value>\w+),\s+Behavior:(?P<behaviour>\d+),\s+'
+                                   r'R3:(?P<r3_value>\w+),\s+SS-TLV\s+Count:(?P<sstlv_count>\d+)$')
         
         # T:1(Sid structure):
-        p19 = re.compile(r'^T:(?P<t_value>\d+)\(Sid\s+structure\):$')
+        p19 = regex_engine.compile(r'^T:(?P<t_value>\d+)\(Sid\s+structure\):$')
 
         # Length [Loc-blk,Loc-node,Func,Arg]:[32,16,16,0], Tpose-len:16, Tpose-offset:48
-        p20 = re.compile(r'^Length\s+\[Loc-blk,Loc-node,Func,Arg\]:\[(?P<loc_blk>\d+),(?P<loc_node>\d+),'
-                         r'(?P<func>\d+),(?P<arg>\d+)\],\s+Tpose-len:(?P<tpose_len>\d+),\s+Tpose-offset:(?P<tpose_offset>\d+)$')
+        p20 = regex_engine.compile(r'^Length\s+\[Loc-blk,Loc-node,Func,Arg\]:\[(?P<loc_blk>\d+),(?P<loc_node>\d+),'
+                                   r'(?P<func>\d+),(?P<arg>\d+)\],\s+Tpose-len:(?P<tpose_len>\d+),\s+Tpose-offset:(?P<tpose_offset>\d+)$')
 
         # Initialize dictionary
         ret_dict = {}
@@ -8652,54 +8654,54 @@ class ShowBgpVrf(ShowBgpVrfSchema):
                 address_family = 'ipv6 unicast'
 
         # VRF: VRF1
-        p1 = re.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
+        p1 = regex_engine.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
 
         # BGP VRF VRF1, state: Active
-        p2 = re.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
-                        r' +(?P<vrf_state>(\S+))$')
+        p2 = regex_engine.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
+                                  r' +(?P<vrf_state>(\S+))$')
 
         # BGP Route Distinguisher: 1.100.1.1:0
         # BGP Route Distinguisher: 200:1
         # BGP Route Distinguisher: 172.16.2.90:1
-        p3 = re.compile(r'^BGP\s+Route\s+Distinguisher:\s+(?P<route_distinguisher>\S+)$')
+        p3 = regex_engine.compile(r'^BGP\s+Route\s+Distinguisher:\s+(?P<route_distinguisher>\S+)$')
 
         # VRF ID: 0x60000001
-        p4 = re.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
+        p4 = regex_engine.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
 
         # BGP router identifier 10.4.1.1, local AS number 100
         # BGP router identifier 10.10.10.108, local AS number 65108.65108
-        p5 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
+        p5 = regex_engine.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+                                  r' +local +AS +number +(?P<local_as>([\d\.]+))$')
 
         # Non-stop routing is enabled
-        p6 = re.compile(r'^\s*Non-stop +routing is enabled$')
+        p6 = regex_engine.compile(r'^\s*Non-stop +routing is enabled$')
 
         # BGP table state: Active
-        p7 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+        p7 = regex_engine.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
 
         # Table ID: 0xe0000010   RD version: 43
-        p8 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
-                         r' +(?P<rd_version>[0-9]+)$')
+        p8 = regex_engine.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+                                   r' +(?P<rd_version>[0-9]+)$')
 
         # BGP main routing table version 43
-        p9 = re.compile(r'^\s*BGP +main +routing +table +version'
-                         r' +(?P<bgp_table_version>[0-9]+)$')
+        p9 = regex_engine.compile(r'^\s*BGP +main +routing +table +version'
+                                   r' +(?P<bgp_table_version>[0-9]+)$')
 
         # BGP NSR Initial initsync version 11 (Reached)
-        p10 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
-                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
-                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p10 = regex_engine.compile(r'^\s*BGP +NSR +Initial +initsync +version'
+                                   r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+                                   r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
 
         # BGP NSR/ISSU Sync-Group versions 0/0
-        p11 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
-                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p11 = regex_engine.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+                                   r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
 
         # Route Distinguisher: 200:1 (default for vrf VRF1)
         # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
         # Route Distinguisher: 172.16.2.88:1000
-        p12 = re.compile(r'^\s*Route +Distinguisher:'
-                         r' +(?P<route_distinguisher>\S+)'
-                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+        p12 = regex_engine.compile(r'^\s*Route +Distinguisher:'
+                                   r' +(?P<route_distinguisher>\S+)'
+                                   r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
 
         # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
         # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
@@ -8714,52 +8716,52 @@ class ShowBgpVrf(ShowBgpVrfSchema):
         #                       10.2.8.1                 0    100      0 i
         # s i                   10.2.8.1                 0    100      0 i
         # s>i2001:718::2:116/128
-        p13 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                         r' *(?P<prefix>(?P<ip>[0-9a-f\.\:\[\]]+)\/(?P<mask>\d+))?[\n\r]*'
-                         r' +(?P<next_hop>\S+)[\n\r]* +(?P<number>[\d\.\s\{\}]+)'
-                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+        p13 = regex_engine.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+                                   r' *(?P<prefix>(?P<ip>[0-9a-f\.\:\[\]]+)\/(?P<mask>\d+))?[\n\r]*'
+                                   r' +(?P<next_hop>\S+)[\n\r]* +(?P<number>[\d\.\s\{\}]+)'
+                                   r'(?: *(?P<origin_codes>(i|e|\?)))?$')
 
         # Processed 40 prefixes, 50 paths
-        p14 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
-                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+        p14 = regex_engine.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+                                   r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
 
         # BGP is operating in STANDALONE mode.
-        p15 = re.compile(r'BGP *is *operating *in *'
-                        r'(?P<operation_mode>\w+) *mode$')
+        p15 = regex_engine.compile(r'BGP *is *operating *in *'
+                                  r'(?P<operation_mode>\w+) *mode$')
 
         # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
         #Speaker              19         19         19         19          19           0
-        p16 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
-                         r' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
-                         r' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
-                         r' *(?P<standbyver>[0-9]+)$')
+        p16 = regex_engine.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
+                                   r' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
+                                   r' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
+                                   r' *(?P<standbyver>[0-9]+)$')
 
         # Neighbor        Spk    AS MsgRcvd MsgSent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
         # 192.168.2.2       0   200     353     353       19    0    0 05:49:05          3
-        p17 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
-                           r' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
-                           r' +(?P<msg_sent>[0-9]+)'
-                           r' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
-                           r' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
-                           r' +(?P<state_pfxrcd>.+)$')
+        p17 = regex_engine.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
+                                     r' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
+                                     r' +(?P<msg_sent>[0-9]+)'
+                                     r' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+                                     r' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+                                     r' +(?P<state_pfxrcd>.+)$')
 
         # *> 1.1.1.1/32         fc00:c000:1001:e000::                       per-vrf      MAIN
         # *>i3.3.3.3/32         NO SRv6 Sid                                 -            -
         # * i                   NO SRv6 Sid                                 -            -
-        p18 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)\s*'
-                         r'(?P<prefix>(?P<ip>[.0-9a-fA-F:]+)\/(?P<mask>\d+))?\s+'
-                         r'(?P<local_sid>[ \w:]+)\s+(?P<alloc_mode>[\w-]+)\s+'
-                         r'(?P<locator>[\w-]+)$')
+        p18 = regex_engine.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)\s*'
+                                   r'(?P<prefix>(?P<ip>[.0-9a-fA-F:]+)\/(?P<mask>\d+))?\s+'
+                                   r'(?P<local_sid>[ \w:]+)\s+(?P<alloc_mode>[\w-]+)\s+'
+                                   r'(?P<locator>[\w-]+)$')
 
         # *>ifc00:a000:2000:200::3/128
         # *> fd00:ffff:100:11::/64
-        p19 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)\s*'
-                         r'(?P<prefix>(?P<ip>[\w:]+)\/(?P<mask>\d+))$')
+        p19 = regex_engine.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)\s*'
+                                   r'(?P<prefix>(?P<ip>[\w:]+)\/(?P<mask>\d+))$')
 
         # fc00:c000:1001:e001::                       per-vrf      MAIN
         # NO SRv6 Sid                                 -            -
-        p20 = re.compile(r'^(?P<local_sid>[\da-fA-F:|NO SRv6 Sid]+)\s+(?P<alloc_mode>[\w-]+)'
-                         r'\s+(?P<locator>[\w-]+)$')
+        p20 = regex_engine.compile(r'^(?P<local_sid>[\da-fA-F:|NO SRv6 Sid]+)\s+(?P<alloc_mode>[\w-]+)'
+                                   r'\s+(?P<locator>[\w-]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -8900,10 +8902,10 @@ class ShowBgpVrf(ShowBgpVrfSchema):
                 
                 # Parse and set the numbers
                 group_num = group['number']
-                m1 = re.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
-                m2 = re.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
-                m3 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$').match(group_num)
-                m4 = re.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+) (?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$').match(group_num)
+                m4 = regex_engine.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
                 if m1:
                     pfx_dict['metric'] = m1.groupdict()['metric']
                     pfx_dict['locprf'] = m1.groupdict()['locprf']
@@ -9171,46 +9173,46 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
 
         # BGP router identifier 10.4.1.1, local AS number 100
         # BGP router identifier 10.10.10.108, local AS number 65108.65108
-        p1 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
+        p1 = regex_engine.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+                                  r' +local +AS +number +(?P<local_as>([\d\.]+))$')
 
         # BGP generic scan interval 60 secs
-        p2 =  re.compile(r'^\s*BGP +generic +scan +interval'
-                         r' +(?P<interval>(\d+)) +secs$')
+        p2 =  regex_engine.compile(r'^\s*BGP +generic +scan +interval'
+                                   r' +(?P<interval>(\d+)) +secs$')
 
         # Non-stop routing is enabled
-        p3 = re.compile(r'^\s*Non-stop +routing is enabled$')
+        p3 = regex_engine.compile(r'^\s*Non-stop +routing is enabled$')
 
         # BGP table state: Active
-        p4 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+        p4 = regex_engine.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
 
         # Table ID: 0xe0000010   RD version: 43
-        p5 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
-                         r' +(?P<rd_version>[0-9]+)$')
+        p5 = regex_engine.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+                                   r' +(?P<rd_version>[0-9]+)$')
 
         # BGP main routing table version 43
-        p6 = re.compile(r'^\s*BGP +main +routing +table +version'
-                         r' +(?P<bgp_table_version>[0-9]+)$')
+        p6 = regex_engine.compile(r'^\s*BGP +main +routing +table +version'
+                                   r' +(?P<bgp_table_version>[0-9]+)$')
 
         # BGP NSR Initial initsync version 11 (Reached)
-        p7 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
-                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
-                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p7 = regex_engine.compile(r'^\s*BGP +NSR +Initial +initsync +version'
+                                   r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+                                   r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
 
         # BGP NSR/ISSU Sync-Group versions 0/0
-        p8 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
-                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p8 = regex_engine.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+                                   r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
 
         # BGP scan interval 60 secs 
-        p9 = re.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
-                         r' +secs$')
+        p9 = regex_engine.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
+                                   r' +secs$')
 
         # Route Distinguisher: 200:1 (default for vrf VRF1)
         # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
         # Route Distinguisher: 172.16.2.88:1000
-        p10 = re.compile(r'^\s*Route +Distinguisher:'
-                         r' +(?P<route_distinguisher>\S+)'
-                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+        p10 = regex_engine.compile(r'^\s*Route +Distinguisher:'
+                                   r' +(?P<route_distinguisher>\S+)'
+                                   r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
 
         # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
         # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
@@ -9225,38 +9227,38 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
         #                       10.2.8.1                 0    100      0 i
         # s i                   10.2.8.1                 0    100      0 i
         # s>i2001:718::2:116/128
-        p11 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                         r' *(?P<prefix>(?P<ip>[0-9a-f\.\:\[\]]+)\/(?P<mask>\d+))?[\n\r]*'
-                         r' +(?P<next_hop>\S+)[\n\r]* +(?P<number>[\d\.\s\{\}]+)'
-                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+        p11 = regex_engine.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+                                   r' *(?P<prefix>(?P<ip>[0-9a-f\.\:\[\]]+)\/(?P<mask>\d+))?[\n\r]*'
+                                   r' +(?P<next_hop>\S+)[\n\r]* +(?P<number>[\d\.\s\{\}]+)'
+                                   r'(?: *(?P<origin_codes>(i|e|\?)))?$')
 
         # Processed 40 prefixes, 50 paths
-        p12 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
-                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+        p12 = regex_engine.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+                                   r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
 
         # BGP is operating in STANDALONE mode.
-        p13 = re.compile(r'BGP *is *operating *in *'
-                        r'(?P<operation_mode>\w+) *mode.$')
+        p13 = regex_engine.compile(r'BGP *is *operating *in *'
+                                  r'(?P<operation_mode>\w+) *mode.$')
 
         # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
         #Speaker              19         19         19         19          19           0
-        p14 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
-                         r' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
-                         r' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
-                         r' *(?P<standbyver>[0-9]+)$')
+        p14 = regex_engine.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
+                                   r' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
+                                   r' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
+                                   r' *(?P<standbyver>[0-9]+)$')
 
         # Neighbor        Spk    AS MsgRcvd MsgSent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
         # 192.168.2.2       0   200     353     353       19    0    0 05:49:05          3
-        p15 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
-                           r' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
-                           r' +(?P<msg_sent>[0-9]+)'
-                           r' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
-                           r' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
-                           r' +(?P<state_pfxrcd>.+)$')
+        p15 = regex_engine.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
+                                     r' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
+                                     r' +(?P<msg_sent>[0-9]+)'
+                                     r' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+                                     r' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+                                     r' +(?P<state_pfxrcd>.+)$')
         
         # Dampening is not enabled
         # Dampening enabled
-        p16 = re.compile(r'^Dampening +(?:(is +))?(?P<dampening_status>[\w\s]+)$')
+        p16 = regex_engine.compile(r'^Dampening +(?:(is +))?(?P<dampening_status>[\w\s]+)$')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -9373,10 +9375,10 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
                 
                 # Parse and set the numbers
                 group_num = group['number']
-                m1 = re.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
-                m2 = re.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
-                m3 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$').match(group_num)
-                m4 = re.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)  +(?P<locprf>[0-9]+)  +(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)(?P<space>\s{2,20})(?P<weight>[0-9]+) (?P<path>[0-9\.\{\}\s]+)$').match(group_num)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+) (?P<path>(([\d\.]+\s)|(\{[\d\.]+\}\s))+)$').match(group_num)
+                m4 = regex_engine.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
                 if m1:
                     pfx_dict['metric'] = m1.groupdict()['metric']
                     pfx_dict['locprf'] = m1.groupdict()['locprf']
@@ -9537,76 +9539,76 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
             out = output
         
         # BGP routing table entry for fc00:a000:1000:101::1/128    
-        p1 = re.compile(r'^BGP +routing +table +entry +for +(?P<prefix>[a-z0-9+.:]+.[0-9]+)')
+        p1 = regex_engine.compile(r'^BGP +routing +table +entry +for +(?P<prefix>[a-z0-9+.:]+.[0-9]+)')
         
         # Last Modified: Nov  2 09:48:44.893 for 05:33:53
-        p2 = re.compile(r'^Last +Modified: (?P<last_modified>.*)$')
+        p2 = regex_engine.compile(r'^Last +Modified: (?P<last_modified>.*)$')
         
         # Paths: (2 available, best #1)
-        p3 = re.compile(r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$')
+        p3 = regex_engine.compile(r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$')
         
         # Not advertised to any peer
-        p4 = re.compile(r'^Not\s+advertised\s+to\s+any\s+peer$')
+        p4 = regex_engine.compile(r'^Not\s+advertised\s+to\s+any\s+peer$')
 
         # Advertised to PE peers (in unique update groups):
         # Advertised to CE peers (in unique update groups):
-        p5 = re.compile(r'^Advertised\s+to\s+(?P<peer_name>[a-zA-Z0-9]+)\s+peers\s+\(in\s+unique\s+update\s+groups\):$')
+        p5 = regex_engine.compile(r'^Advertised\s+to\s+(?P<peer_name>[a-zA-Z0-9]+)\s+peers\s+\(in\s+unique\s+update\s+groups\):$')
         
         # Path #1: Received by speaker 0
-        p6 = re.compile(r'^Path\s+#(?P<path_num>\d+):.*$')
+        p6 = regex_engine.compile(r'^Path\s+#(?P<path_num>\d+):.*$')
         
         # 7000
         # Local
-        p7 = re.compile(r'^(?P<as_path>[a-zA-Z0-9]+)$')
+        p7 = regex_engine.compile(r'^(?P<as_path>[a-zA-Z0-9]+)$')
 
         # 50.1.1.1 (metric 4) from 50.1.1.8 (50.1.1.1)
         # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
         # :: from :: (50.1.1.4)
-        p8 = re.compile(r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?'
-                        r'from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?')
+        p8 = regex_engine.compile(r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?'
+                                  r'from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?')
         
         # Origin incomplete, metric 0, localpref 100, valid, internal, best, group-best, import-candidate, imported
         # Origin IGP, metric 0, localpref 100, valid, external, best, group-best, import-candidate
         # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best, import-candidate
         # Origin incomplete, metric 0, localpref 100, valid, internal, backup, add-path, import-candidate, imported
-        p9 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),'
-                         r'(?: +metric (?P<metric>[0-9]+),?)?'
-                         r'(?: +localpref (?P<localpref>[0-9]+),?)?'
-                         r'(?: +weight (?P<weight>[0-9]+),?)?'
-                         r'(?: +(?P<valid>valid?),)?'
-                         r'(?: (?P<redistributed>redistributed?),)?'
-                         r'(?: +(?P<state>(internal|external|local)?),)?(\,*)?'
-                         r'(?: (?P<best>best))?(\,*)?'
-                         r'(?: (?P<group_best>group-best?),*)?'
-                         r'(?: (?P<backup>backup),*)?'
-                         r'(?: (?P<add_path>add-path),*)?'
-                         r'(?: (?P<import_candidate>import-candidate?),*)?'
-                         r'(?: (?P<imported>imported?),*)?')
+        p9 = regex_engine.compile(r'^Origin +(?P<origin>[a-zA-Z]+),'
+                                   r'(?: +metric (?P<metric>[0-9]+),?)?'
+                                   r'(?: +localpref (?P<localpref>[0-9]+),?)?'
+                                   r'(?: +weight (?P<weight>[0-9]+),?)?'
+                                   r'(?: +(?P<valid>valid?),)?'
+                                   r'(?: (?P<redistributed>redistributed?),)?'
+                                   r'(?: +(?P<state>(internal|external|local)?),)?(\,*)?'
+                                   r'(?: (?P<best>best))?(\,*)?'
+                                   r'(?: (?P<group_best>group-best?),*)?'
+                                   r'(?: (?P<backup>backup),*)?'
+                                   r'(?: (?P<add_path>add-path),*)?'
+                                   r'(?: (?P<import_candidate>import-candidate?),*)?'
+                                   r'(?: (?P<imported>imported?),*)?')
                          
          #  Received Path ID 0, Local Path ID 0, version 715
-        p10 = re.compile(r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
-                         r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
-                         r'version\s+(?P<version>(\d+))$')
+        p10 = regex_engine.compile(r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
+                                   r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
+                                   r'version\s+(?P<version>(\d+))$')
                          
         # Extended community: RT:100:1001
-        p11 = re.compile(r'^Extended\s+community:(?:\s+(?P<extended_community>.*))?$')
+        p11 = regex_engine.compile(r'^Extended\s+community:(?:\s+(?P<extended_community>.*))?$')
         
         # Originator: 50.1.1.1, Cluster list: 50.1.1.8
         # Originator: 10.0.0.3, Cluster list: 10.0.0.11, 10.0.0.13
-        p12 = re.compile(r'^Originator:\s+(?P<originator>[\d.]+),\s+Cluster\s+list:\s+(?P<cluster_list>[\d., ]+)$')
+        p12 = regex_engine.compile(r'^Originator:\s+(?P<originator>[\d.]+),\s+Cluster\s+list:\s+(?P<cluster_list>[\d., ]+)$')
         
         # PSID-Type:L3, SubTLV Count:1, R:0x00,
-        p13 = re.compile(r'^PSID-Type:(?P<psid_type>\w+),\s+SubTLV\s+Count:(?P<subtlv_count>\d+)$')
+        p13 = regex_engine.compile(r'^PSID-Type:(?P<psid_type>\w+),\s+SubTLV\s+Count:(?P<subtlv_count>\d+)$')
         
          # SubTLV:
         # SubSubTLV:
-        p14 = re.compile(r'^(?P<tlv_name>SubTLV|SubSubTLV):$')
+        p14 = regex_engine.compile(r'^(?P<tlv_name>SubTLV|SubSubTLV):$')
         
         # T:1(Sid information), Sid:fc00:c000:2003::, F:0x00, R2:0x00, Behavior:62, R3:0x00, SS-TLV Count:1
-        p15 = re.compile(r'T:(?P<t_value>\d+)\(Sid\s+information\),\s+Sid:(?P<sid_value>[a-f0-9.:]+),\s+Behavior:(?P<behaviour>\d+),\s+SS-TLV\s+Count:(?P<sstlv_count>\d+)$')
+        p15 = regex_engine.compile(r'T:(?P<t_value>\d+)\(Sid\s+information\),\s+Sid:(?P<sid_value>[a-f0-9.:]+),\s+Behavior:(?P<behaviour>\d+),\s+SS-TLV\s+Count:(?P<sstlv_count>\d+)$')
         
         # T:1(Sid structure):
-        p16 = re.compile(r'^T:(?P<t_value>\d+)\(Sid\s+structure\):$')
+        p16 = regex_engine.compile(r'^T:(?P<t_value>\d+)\(Sid\s+structure\):$')
         
         # Initialize dictionary
        
@@ -9851,46 +9853,46 @@ class ShowBgpDampedPaths(ShowBgpDampedPathsSchema):
         ret_dict = {}
         
         # BGP router identifier 50.1.1.1, local AS number 100    
-        p1 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
+        p1 = regex_engine.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+                                  r' +local +AS +number +(?P<local_as>([\d\.]+))$')
         
         # BGP generic scan interval 60 secs
-        p2 =  re.compile(r'^\s*BGP *generic *scan *interval *'
-                            r'(?P<generic_scan_interval>[0-9]+) *secs$')
+        p2 =  regex_engine.compile(r'^\s*BGP *generic *scan *interval *'
+                                      r'(?P<generic_scan_interval>[0-9]+) *secs$')
         
         # Non-stop routing is enabled
-        p3 = re.compile(r'^\s*Non-stop *routing *is'
-                        r' *(?P<non_stop_routing>[A-Za-z]+)$')
+        p3 = regex_engine.compile(r'^\s*Non-stop *routing *is'
+                                  r' *(?P<non_stop_routing>[A-Za-z]+)$')
         
         # BGP table state: Active
-        p4 = re.compile(r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
+        p4 = regex_engine.compile(r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
         
         # Table ID: 0xe0000000   RD version: 177
-        p5 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         r' *RD *version: (?P<rd_version>[0-9]+)$')
+        p5 = regex_engine.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
+                                   r' *RD *version: (?P<rd_version>[0-9]+)$')
         
         # BGP main routing table version 177
-        p6 = re.compile(r'^\s*BGP *main *routing *table *version'
-                         r' *(?P<bgp_table_version>[0-9]+)$')
+        p6 = regex_engine.compile(r'^\s*BGP *main *routing *table *version'
+                                   r' *(?P<bgp_table_version>[0-9]+)$')
         
         # BGP NSR Initial initsync version 38 (Reached)
-        p7 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version *'
-                            r'(?P<nsr_initial_initsync_version>[0-9]+)'
-                          r' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p7 = regex_engine.compile(r'^\s*BGP *NSR *Initial *initsync *version *'
+                                      r'(?P<nsr_initial_initsync_version>[0-9]+)'
+                                    r' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
         
         # BGP NSR/ISSU Sync-Group versions 0/0
-        p8 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
-                            r'(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p8 = regex_engine.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
+                                      r'(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
         
         # BGP scan interval 60 secs
-        p9 = re.compile(r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$')
+        p9 = regex_engine.compile(r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$')
         
         # BGP scan interval 60 secs
-        p10 = re.compile(r'^Dampening +(?:(is +))?(?P<dampening_status>[\w\s]+)$')
+        p10 = regex_engine.compile(r'^Dampening +(?:(is +))?(?P<dampening_status>[\w\s]+)$')
         
         # Network            From            Reuse    Path
         # *d 80.21.1.0/30       80.11.10.2      00:07:40 5000 ?
-        p11 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)\s+(?P<network>[\w\.\/]+)\s+(?P<from>[\w\.]+)\s+(?P<reuse>\d+:\d+\d+:\d+)\s+(?P<path>\d+)')
+        p11 = regex_engine.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)\s+(?P<network>[\w\.\/]+)\s+(?P<from>[\w\.]+)\s+(?P<reuse>\d+:\d+\d+:\d+)\s+(?P<path>\d+)')
                         
         for line in output.splitlines():
             line = line.strip()
@@ -14,6 +14,7 @@ IOSXR parsers for the following commands:
 import re
 
 # Metaparser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
@@ -58,7 +59,7 @@ class ShowCdpNeighbors(ShowCdpNeighborsSchema):
 
         # Specifically for situations when Platform and Port Id are
         # concatenated
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<device_id>\S+) +'
             r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
             r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIrPDCM\s]+) +'
@@ -66,7 +67,7 @@ class ShowCdpNeighbors(ShowCdpNeighborsSchema):
             r'(?P<port_id>(Fa|Gi|GE).\s*\d*\/*\d*)$')
 
         # No platform
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<device_id>\S+) +'
             r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
             r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIrPDCM\s]+)'
@@ -74,15 +75,15 @@ class ShowCdpNeighbors(ShowCdpNeighborsSchema):
             r'(?P<port_id>[a-zA-Z0-9\/\s]+)$')
 
         # device6 Gig 0 157 R S I C887VA-W-W Gi 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<device_id>\S+) +'
             r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
             r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIrPDCM\s]+) +'
             r'(?P<platform>\S+) (?P<port_id>[a-zA-Z0-9\/\s]+)$')
 
         # p4 and p5 for two-line output, where device id is on a separate line
-        p4 = re.compile(r'^(?P<device_id>\S+)$')
-        p5 = re.compile(
+        p4 = regex_engine.compile(r'^(?P<device_id>\S+)$')
+        p5 = regex_engine.compile(
             r'(?P<local_interface>[a-zA-Z]+[\s]*[\d/.]+) +'
             r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIrPDCM\s]+) +'
             r'(?P<platform>\S+) (?P<port_id>[a-zA-Z0-9/\s]+)$')
@@ -208,60 +209,60 @@ class ShowCdpNeighborsDetail(ShowCdpNeighborsDetailSchema):
             out = output
 
         # Device ID: R3_nx.cisco.com(972ZZK4REQK)
-        deviceid_re = re.compile(r'Device\s+ID:\s*(?P<device_id>\S+)')
+        deviceid_re = regex_engine.compile(r'Device\s+ID:\s*(?P<device_id>\S+)')
 
         # SysName:R3_nx
-        system_name_re = re.compile(r''
-                                    r'SysName\s*:\s*(?P<system_name>\S+)')
+        system_name_re = regex_engine.compile(r''
+                                              r'SysName\s*:\s*(?P<system_name>\S+)')
 
         # Entry address(es):
-        entry_address_re = re.compile(
+        entry_address_re = regex_engine.compile(
             r''
             r'Entry\s*address\s*\(\w+\)\s*\:\s*')
 
         # IPv4 address: 172.16.1.204
-        ipv4_address_re = re.compile(
+        ipv4_address_re = regex_engine.compile(
             r'\S*IPv4\s*'
             r'address:\s*(?P<ip_address>\S*)')
 
         # Platform: N9K-9000v,  Capabilities: Router Switch
-        platf_cap_re = re.compile(
+        platf_cap_re = regex_engine.compile(
             r'Platform:\s*(?P<platform>[a-zA-Z\d +\-\/]+)'
             r'\s*\,\s*Capabilities:\s*'
             r'(?P<capabilities>[a-zA-Z\d\s*\-\/]+)')
 
         # Interface: GigabitEthernet0/0/0/5
-        interface_re = re.compile(
+        interface_re = regex_engine.compile(
             r'Interface:\s*'
             r'(?P<local_interface>[\w\s\-\/\/]+)\s*')
 
         # Port ID (outgoing port): Ethernet1/2
-        port_re = re.compile(
+        port_re = regex_engine.compile(
             r'Port\s*ID\s*[\(\w\)\s]+:\s*'
             r'(?P<port_id>\S+)')
 
         # Holdtime : 126 sec
-        hold_time_re = re.compile(r'Holdtime\s*:\s*\s*(?P<hold_time>\d+)')
+        hold_time_re = regex_engine.compile(r'Holdtime\s*:\s*\s*(?P<hold_time>\d+)')
 
         # Version: Cisco IOS Software, IOSv Software (VIOS-ADVENTERPRISEK9-M),
         # Version 15.7(3)M3, RELEASE SOFTWARE (fc2)
-        software_version_re = re.compile(r'(?P<software_version>[\s\S]+)')
+        software_version_re = regex_engine.compile(r'(?P<software_version>[\s\S]+)')
 
         # Regexes for Flags:
         # Version:
-        software_version_flag_re = re.compile(r'Version\s*:\s*')
+        software_version_flag_re = regex_engine.compile(r'Version\s*:\s*')
 
         # advertisement version: 2
-        advertver_re = re.compile(r'advertisement\s*version:\s*'
-                                  r'(?P<advertisement_ver>\d+)')
+        advertver_re = regex_engine.compile(r'advertisement\s*version:\s*'
+                                            r'(?P<advertisement_ver>\d+)')
 
         # Native VLAN: 42
-        native_vlan_re = re.compile(r'Native\s*VLAN\s*:\s*'
-                                    r'(?P<native_vlan>\d+)')
+        native_vlan_re = regex_engine.compile(r'Native\s*VLAN\s*:\s*'
+                                              r'(?P<native_vlan>\d+)')
 
         # Duplex: full
         # Duplex Mode: half
-        duplex_re = re.compile(r'Duplex\s*(Mode)*:\s*(?P<duplex_mode>\w+)')
+        duplex_re = regex_engine.compile(r'Duplex\s*(Mode)*:\s*(?P<duplex_mode>\w+)')
 
         # 0 or 1 flags
         entry_address_flag = 0
@@ -412,20 +413,20 @@ class ShowCdp(ShowCdpSchema):
         ret_dict = {}
 
         # Global CDP information:
-        p1 = re.compile(r'^Global\s+CDP\s+information:$')
+        p1 = regex_engine.compile(r'^Global\s+CDP\s+information:$')
 
         # Sending CDP packets every 60 seconds
-        p2 = re.compile(r'^Sending\s+CDP\s+packets\s+every\s+(?P<cdp_packets>\d+)\s+seconds$')
+        p2 = regex_engine.compile(r'^Sending\s+CDP\s+packets\s+every\s+(?P<cdp_packets>\d+)\s+seconds$')
 
         # Sending a holdtime value of 180 seconds
-        p3 = re.compile(r'^Sending\s+a\s+holdtime\s+value\s+of\s+(?P<hold_timer>\d+)\s+seconds$')
+        p3 = regex_engine.compile(r'^Sending\s+a\s+holdtime\s+value\s+of\s+(?P<hold_timer>\d+)\s+seconds$')
 
         # Sending CDPv2 advertisements is not enabled
         # Sending CDPv2 advertisements is enabled
-        p4 = re.compile(r'^Sending\s+CDPv2\s+advertisements\s+is\s+(?P<cdpv2_advertisements>[\w ]+)$')
+        p4 = regex_engine.compile(r'^Sending\s+CDPv2\s+advertisements\s+is\s+(?P<cdpv2_advertisements>[\w ]+)$')
 
         # % CDP is not enabled
-        p5 = re.compile(r'^%\s+CDP\s+is\s+not\s+enabled$')
+        p5 = regex_engine.compile(r'^%\s+CDP\s+is\s+not\s+enabled$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -517,16 +518,16 @@ class ShowCdpInterface(ShowCdpInterfaceSchema):
         # GigabitEthernet0/0/0/18 is Administratively Down
         # TenGigE0/0/2/0 is Down
         # TenGigE0/0/2/1 is Up
-        p1 = re.compile(r'^(?P<interface_name>\S+)\s+is\s+(?P<status>[a-zA-Z ]+)$')
+        p1 = regex_engine.compile(r'^(?P<interface_name>\S+)\s+is\s+(?P<status>[a-zA-Z ]+)$')
 
         # Encapsulation ether
-        p2 = re.compile(r'^Encapsulation\s+(?P<encapsulation>\w+)$')
+        p2 = regex_engine.compile(r'^Encapsulation\s+(?P<encapsulation>\w+)$')
 
         # Sending CDP packets every 60 seconds
-        p3 = re.compile(r'^Sending\s+CDP\s+packets\s+every\s+(?P<cdp_packets>\d+)\s+seconds$')
+        p3 = regex_engine.compile(r'^Sending\s+CDP\s+packets\s+every\s+(?P<cdp_packets>\d+)\s+seconds$')
 
         # Holdtime is 180 seconds
-        p4 = re.compile(r'^Holdtime\s+is\s+(?P<hold_timer>\d+)\s+seconds$')
+        p4 = regex_engine.compile(r'^Holdtime\s+is\s+(?P<hold_timer>\d+)\s+seconds$')
 
         for line in output.splitlines():
             line = line.strip() # strip whitespace from beginning and end
@@ -9,7 +9,7 @@ IOSXR parsers for the following show commands:
 '''
 
 # Python
-import re
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # Genie
@@ -69,17 +69,17 @@ class ShowControllersFiaDiagshellL2showLocation(ShowControllersFiaDiagshellL2sho
         parsed_dict = {}
 
         # Node ID: 0/0/CPU0
-        p1 = re.compile(r'^Node +ID: +(?P<node_id>(\S+))$')
+        p1 = regex_engine.compile(r'^Node +ID: +(?P<node_id>(\S+))$')
 
         # mac=fc:00:00:ff:01:9c vlan=2544 GPORT=0x8000048 encap_id=0x2007
         # mac=fc:00:00:ff:01:03 vlan=2522 GPORT=0x9800401d Static encap_id=0xffffffff
         # mac=fc:00:00:ff:01:9c vlan=2544 GPORT=0x8000048 Trunk=0 encap_id=0x2007
         # mac=fc:00:00:ff:01:0c vlan=2524 GPORT=0xc000000 Trunk=0 Static encap_id=0x3001'
-        p2 = re.compile(r'^mac\=(?P<mac>[A-Fa-f0-9:]+) +vlan=(?P<vlan>\d+)'
-                         r' +GPORT\=(?P<gport>\d+|0x[A-Fa-f0-9]+)'
-                         r'(?: +Trunk\=(?P<trunk>\d+))?'
-                         r'(?: +(?P<b_static>(Static)))?'
-                         r' +encap_id\=(?P<encap_id>\d+|0x[A-Fa-f0-9\']+)$')
+        p2 = regex_engine.compile(r'^mac\=(?P<mac>[A-Fa-f0-9:]+) +vlan=(?P<vlan>\d+)'
+                                   r' +GPORT\=(?P<gport>\d+|0x[A-Fa-f0-9]+)'
+                                   r'(?: +Trunk\=(?P<trunk>\d+))?'
+                                   r'(?: +(?P<b_static>(Static)))?'
+                                   r' +encap_id\=(?P<encap_id>\d+|0x[A-Fa-f0-9\']+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -180,60 +180,60 @@ class ShowControllersCoherentDSP(ShowControllersCoherentDSPSchema):
         result_dict = {}
 
         # Port   : CoherentDSP 0/0/1/2
-        p1 = re.compile(r'^Port +: +(?P<port>[\s\S]+)$')
+        p1 = regex_engine.compile(r'^Port +: +(?P<port>[\s\S]+)$')
 
         # Controller State    : Up
-        p2 = re.compile(r'^Controller +State +: +(?P<controller_state>\w+)$')
+        p2 = regex_engine.compile(r'^Controller +State +: +(?P<controller_state>\w+)$')
 
         # Inherited Secondary State   : Normal
-        p3 = re.compile(r'^Inherited +Secondary +State +: +(?P<inherited_secondary_state>\w+)$')
+        p3 = regex_engine.compile(r'^Inherited +Secondary +State +: +(?P<inherited_secondary_state>\w+)$')
 
         # Configured Secondary State   : Normal
-        p4 = re.compile(r'^Configured +Secondary +State +: +(?P<configured_secondary_state>\w+)$')
+        p4 = regex_engine.compile(r'^Configured +Secondary +State +: +(?P<configured_secondary_state>\w+)$')
 
         # Derived State      : In Service
-        p5 = re.compile(r'^Derived +State +: +(?P<derived_state>[\w\s]+)$')
+        p5 = regex_engine.compile(r'^Derived +State +: +(?P<derived_state>[\w\s]+)$')
 
         # Loopback mode      : None
-        p6 = re.compile(r'^Loopback +mode +: +(?P<loopback_mode>\w+)$')
+        p6 = regex_engine.compile(r'^Loopback +mode +: +(?P<loopback_mode>\w+)$')
 
         # BER Thresholds     : SF = 1.0E-5  SD = 1.0E-7
-        p7 = re.compile(r'^BER +Thresholds +: SF += +(?P<sf>\S+) +SD += +(?P<sd>\S+)$')
+        p7 = regex_engine.compile(r'^BER +Thresholds +: SF += +(?P<sf>\S+) +SD += +(?P<sd>\S+)$')
 
         # Performance Monitoring    : Enable
-        p8 = re.compile(r'^Performance +Monitoring +: +(?P<performance_monitoring>\w+)$')
+        p8 = regex_engine.compile(r'^Performance +Monitoring +: +(?P<performance_monitoring>\w+)$')
 
         # Alarm Information:
         # LOS = 1 LOF = 0 LOM = 0
-        p9 = re.compile(r'^LOS += +(?P<los>\d+) +LOF += +(?P<lof>\d+) +LOM += +(?P<lom>\d+)$')
+        p9 = regex_engine.compile(r'^LOS += +(?P<los>\d+) +LOF += +(?P<lof>\d+) +LOM += +(?P<lom>\d+)$')
 
         # OOF = 0 OOM = 0 AIS = 0
-        p10 = re.compile(r'^OOF += +(?P<oof>\d+) +OOM += +(?P<oom>\d+) +AIS += +(?P<ais>\d+)$')
+        p10 = regex_engine.compile(r'^OOF += +(?P<oof>\d+) +OOM += +(?P<oom>\d+) +AIS += +(?P<ais>\d+)$')
 
         # IAE = 0 BIAE = 0    SF_BER = 0
-        p11 = re.compile(r'^IAE += +(?P<iae>\d+) +BIAE += +(?P<biae>\d+) +SF_BER += +(?P<sf_ber>\d+)$')
+        p11 = regex_engine.compile(r'^IAE += +(?P<iae>\d+) +BIAE += +(?P<biae>\d+) +SF_BER += +(?P<sf_ber>\d+)$')
 
         # SD_BER = 0     BDI = 2 TIM = 0
-        p12 = re.compile(r'^SD_BER += +(?P<sd_ber>\d+) +BDI += +(?P<bdi>\d+) +TIM += +(?P<tim>\d+)$')
+        p12 = regex_engine.compile(r'^SD_BER += +(?P<sd_ber>\d+) +BDI += +(?P<bdi>\d+) +TIM += +(?P<tim>\d+)$')
 
         # FECMISMATCH = 0  FEC-UNC = 0
-        p13 = re.compile(r'^FECMISMATCH += +(?P<fecmis_match>\d+) +FEC-UNC += +(?P<fec_unc>\d+)$')
+        p13 = regex_engine.compile(r'^FECMISMATCH += +(?P<fecmis_match>\d+) +FEC-UNC += +(?P<fec_unc>\d+)$')
 
         # Detected Alarms    : None
-        p14 = re.compile(r'^Detected +Alarms +: +(?P<detected_alarms>\w+)$')
+        p14 = regex_engine.compile(r'^Detected +Alarms +: +(?P<detected_alarms>\w+)$')
 
         # Bit Error Rate Information
         # PREFEC  BER        : 0.0E+00
-        p15 = re.compile(r'^PREFEC +BER +: +(?P<prefec_ber>\S+)$')
+        p15 = regex_engine.compile(r'^PREFEC +BER +: +(?P<prefec_ber>\S+)$')
 
         # POSTFEC BER        : 0.0E+00
-        p16 = re.compile(r'^POSTFEC +BER +: +(?P<postfec_ber>\S+)$')
+        p16 = regex_engine.compile(r'^POSTFEC +BER +: +(?P<postfec_ber>\S+)$')
 
         # OTU TTI Received
-        p17 = re.compile(r'^OTU +TTI +(?P<otu_tti>\w+)$')
+        p17 = regex_engine.compile(r'^OTU +TTI +(?P<otu_tti>\w+)$')
 
         # FEC mode           : STANDARD
-        p18 = re.compile(r'^FEC +mode +: +(?P<fec_mode>\w+)$')
+        p18 = regex_engine.compile(r'^FEC +mode +: +(?P<fec_mode>\w+)$')
 
         for line in out.splitlines():
             line = line.replace('\t', ' ').strip()
@@ -494,162 +494,162 @@ class ShowControllersOptics(ShowControllersOpticsSchema):
         result_dict = {}
 
         # Controller State:  Up
-        p1 = re.compile(r'^Controller +State: +(?P<controller_state>\w+)$')
+        p1 = regex_engine.compile(r'^Controller +State: +(?P<controller_state>\w+)$')
 
         # Transport Admin State: In Service
-        p2 = re.compile(r'^Transport +Admin +State: +(?P<transport_admin_state>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^Transport +Admin +State: +(?P<transport_admin_state>[\w\s]+)$')
 
         # Laser State: On
         # Laser State: N/A 
-        p3 = re.compile(r'^Laser +State: +(?P<laser_state>.+)$')
+        p3 = regex_engine.compile(r'^Laser +State: +(?P<laser_state>.+)$')
 
         # LED State: Green
         # LED State: Not Applicable
-        p4 = re.compile(r'^LED +State: +(?P<led_state>.+)$')
+        p4 = regex_engine.compile(r'^LED +State: +(?P<led_state>.+)$')
 
         # FEC State: FEC DISABLED 
-        p4_1 = re.compile(r'^FEC +State: +(?P<fec_state>.+)$')
+        p4_1 = regex_engine.compile(r'^FEC +State: +(?P<fec_state>.+)$')
 
         # Optics Type:  CFP2 DWDM
-        p5 = re.compile(r'^Optics +Type: +(?P<optics_type>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^Optics +Type: +(?P<optics_type>[\S\s]+)$')
 
         # DWDM carrier Info: C BAND, MSA ITU Channel=97, Frequency=191.30THz,
         # DWDM Carrier Info: Unavailable, MSA ITU Channel= Unavailable, Frequency= Unavailable , Wavelength= Unavailable
-        p6 = re.compile(r'^DWDM +[Cc]arrier +Info: +(?P<dwdm_carrier_info>[\w\s]+), '
-                         r'+MSA +ITU +Channel *= *(?P<msa_itu_channel>[\w]+), '
-                         r'+Frequency *= *(?P<frequency>[\w\.]+) *,'
-                         r'( +Wavelength *= *(?P<wavelength>[\S\s]+))?$')
+        p6 = regex_engine.compile(r'^DWDM +[Cc]arrier +Info: +(?P<dwdm_carrier_info>[\w\s]+), '
+                                   r'+MSA +ITU +Channel *= *(?P<msa_itu_channel>[\w]+), '
+                                   r'+Frequency *= *(?P<frequency>[\w\.]+) *,'
+                                   r'( +Wavelength *= *(?P<wavelength>[\S\s]+))?$')
 
         # Wavelength=1567.133nm
-        p7 = re.compile(r'^Wavelength *= *(?P<wavelength>[\S\s]+)$')
+        p7 = regex_engine.compile(r'^Wavelength *= *(?P<wavelength>[\S\s]+)$')
 
         # Detected Alarms: None
-        p8 = re.compile(r'^Detected +Alarms: +(?P<detected_alarms>\w+)$')
+        p8 = regex_engine.compile(r'^Detected +Alarms: +(?P<detected_alarms>\w+)$')
 
         # Detected Alarms:
         #          LOW-RX1-PWR
-        p9 = re.compile(r'^(?!-)(?P<alarm>[\w-]+)$')
+        p9 = regex_engine.compile(r'^(?!-)(?P<alarm>[\w-]+)$')
 
         # LOS/LOL/Fault Status:
-        p10 = re.compile(r'^LOS\/LOL\/Fault +Status:$')
+        p10 = regex_engine.compile(r'^LOS\/LOL\/Fault +Status:$')
 
         # Detected LOS/LOL/FAULT: RX-LOS
-        p10_1 = re.compile(r'^Detected +LOS\/LOL\/FAULT: +(?P<detected_los_lol_fault>\S+)$')
+        p10_1 = regex_engine.compile(r'^Detected +LOS\/LOL\/FAULT: +(?P<detected_los_lol_fault>\S+)$')
 
         # HIGH-RX-PWR = 0            LOW-RX-PWR = 1
-        p11 = re.compile(r'^HIGH-RX-PWR *= *(?P<high_rx_pwr>\d+) +LOW-RX-PWR *= *(?P<low_rx_pwr>\d+)$')
+        p11 = regex_engine.compile(r'^HIGH-RX-PWR *= *(?P<high_rx_pwr>\d+) +LOW-RX-PWR *= *(?P<low_rx_pwr>\d+)$')
 
         # HIGH-TX-PWR = 0            LOW-TX-PWR = 1
-        p12 = re.compile(r'^HIGH-TX-PWR *= *(?P<high_tx_pwr>\d+) +LOW-TX-PWR *= *(?P<low_tx_pwr>\d+)$')
+        p12 = regex_engine.compile(r'^HIGH-TX-PWR *= *(?P<high_tx_pwr>\d+) +LOW-TX-PWR *= *(?P<low_tx_pwr>\d+)$')
 
         # HIGH-LBC = 0               HIGH-DGD = 0
-        p13 = re.compile(r'^HIGH-LBC *= *(?P<high_lbc>\d+) +HIGH-DGD *= *(?P<high_dgd>\d+)$')
+        p13 = regex_engine.compile(r'^HIGH-LBC *= *(?P<high_lbc>\d+) +HIGH-DGD *= *(?P<high_dgd>\d+)$')
 
         # OOR-CD = 0                 OSNR = 0
-        p14 = re.compile(r'^OOR-CD *= *(?P<oor_cd>\d+) +OSNR *= *(?P<osnr>\d+)$')
+        p14 = regex_engine.compile(r'^OOR-CD *= *(?P<oor_cd>\d+) +OSNR *= *(?P<osnr>\d+)$')
 
         # WVL-OOL = 0                MEA  = 0
-        p15 = re.compile(r'^WVL-OOL *= *(?P<wvl_ool>\d+) +MEA *= *(?P<mea>\d+)$')
+        p15 = regex_engine.compile(r'^WVL-OOL *= *(?P<wvl_ool>\d+) +MEA *= *(?P<mea>\d+)$')
 
         # IMPROPER-REM = 0
-        p16 = re.compile(r'^IMPROPER-REM *= *(?P<improper_rem>\d+)$')
+        p16 = regex_engine.compile(r'^IMPROPER-REM *= *(?P<improper_rem>\d+)$')
 
         # TX-POWER-PROV-MISMATCH = 0
-        p17 = re.compile(r'^TX-POWER-PROV-MISMATCH *= *(?P<tc_power_prov_mismatch>\d+)$')
+        p17 = regex_engine.compile(r'^TX-POWER-PROV-MISMATCH *= *(?P<tc_power_prov_mismatch>\d+)$')
 
         # Laser Bias Current = 0.0 mA
-        p18 = re.compile(r'^Laser +Bias +Current *= *(?P<laser_bias_current>[\s\S]+)$')
+        p18 = regex_engine.compile(r'^Laser +Bias +Current *= *(?P<laser_bias_current>[\s\S]+)$')
 
         # Actual TX Power = -17.25 dBm
         # TX Power = Unavailable
-        p19 = re.compile(r'^(Actual *)?TX +Power *= *(?P<actual_tx_power>[\s\S]+)$')
+        p19 = regex_engine.compile(r'^(Actual *)?TX +Power *= *(?P<actual_tx_power>[\s\S]+)$')
 
         # RX Power = -40.00 dBm
-        p20 = re.compile(r'^RX +Power *= *(?P<rx_power>[\s\S]+)$')
+        p20 = regex_engine.compile(r'^RX +Power *= *(?P<rx_power>[\s\S]+)$')
 
         # Performance Monitoring: Enable
-        p21 = re.compile(r'^Performance +Monitoring: +(?P<performance_monitoring>\w+)$')
+        p21 = regex_engine.compile(r'^Performance +Monitoring: +(?P<performance_monitoring>\w+)$')
 
         # Parameter                 High Alarm  Low Alarm  High Warning  Low Warning
         # ------------------------  ----------  ---------  ------------  -----------
         # Rx Power Threshold(dBm)          2.0      -13.9          -1.0         -9.9
-        p22 = re.compile(r'^(?P<parameter>[\w\s(.]+\)) +(?P<high_alarm>[\w\/.-]+) '
-                         r'+(?P<low_alarm>[\w\/.-]+) +(?P<high_warning>[\w\/.-]+) '
-                         r'+(?P<low_warning>[\w\/.-]+)$')
+        p22 = regex_engine.compile(r'^(?P<parameter>[\w\s(.]+\)) +(?P<high_alarm>[\w\/.-]+) '
+                                   r'+(?P<low_alarm>[\w\/.-]+) +(?P<high_warning>[\w\/.-]+) '
+                                   r'+(?P<low_warning>[\w\/.-]+)$')
 
         # Lane Laser Bias TX Power   RX Power    Output Frequency
         # ---- ---------- ---------- ----------  ----------------
         # 0    38.9 mA    1.42 dBm   -2.04 dBm   N/A
-        p22_2 = re.compile(r'^(?P<lane>\d+) +(?P<laser_bias>[\w.-]+ +\w+) '
-                           r'+(?P<tx_power>[\w.-]+ +\w+) +(?P<rx_power>[\w.-]+ +\w+) '
-                           r'+(?P<output_frequency>[\S\s]+)$')
+        p22_2 = regex_engine.compile(r'^(?P<lane>\d+) +(?P<laser_bias>[\w.-]+ +\w+) '
+                                     r'+(?P<tx_power>[\w.-]+ +\w+) +(?P<rx_power>[\w.-]+ +\w+) '
+                                     r'+(?P<output_frequency>[\S\s]+)$')
 
         # Temperature = 35.00 Celsius 
-        p23 = re.compile(r'^Temperature *= *(?P<temperature>[\s\S]+)$')
+        p23 = regex_engine.compile(r'^Temperature *= *(?P<temperature>[\s\S]+)$')
 
         # Voltage = 3.26 V 
-        p24 = re.compile(r'^Voltage *= *(?P<voltage>[\s\S]+)$')
+        p24 = regex_engine.compile(r'^Voltage *= *(?P<voltage>[\s\S]+)$')
 
         # LBC High Threshold = 98 %
-        p25 = re.compile(r'^LBC +High +Threshold *= *(?P<lbc_high_threshold>[\s\S]+)$')
+        p25 = regex_engine.compile(r'^LBC +High +Threshold *= *(?P<lbc_high_threshold>[\s\S]+)$')
 
         # Configured Tx Power = 1.00 dBm
-        p26 = re.compile(r'^Configured +Tx +Power *= *(?P<configured_tx_power>[\s\S]+)$')
+        p26 = regex_engine.compile(r'^Configured +Tx +Power *= *(?P<configured_tx_power>[\s\S]+)$')
 
         # Configured OSNR lower Threshold = 0.00 dB
-        p27 = re.compile(r'^Configured +OSNR +lower +Threshold *= *(?P<configured_osnr_lower_threshold>[\s\S]+)$')
+        p27 = regex_engine.compile(r'^Configured +OSNR +lower +Threshold *= *(?P<configured_osnr_lower_threshold>[\s\S]+)$')
 
         # Configured DGD Higher Threshold = 180.00 ps
-        p28 = re.compile(r'^Configured +DGD +Higher +Threshold *= *(?P<configured_dgd_higher_threshold>[\s\S]+)$')
+        p28 = regex_engine.compile(r'^Configured +DGD +Higher +Threshold *= *(?P<configured_dgd_higher_threshold>[\s\S]+)$')
 
         # Chromatic Dispersion 5 ps/nm
-        p29 = re.compile(r'^Chromatic +Dispersion +(?P<chromatic_dispersion>[\s\S]+)$')
+        p29 = regex_engine.compile(r'^Chromatic +Dispersion +(?P<chromatic_dispersion>[\s\S]+)$')
 
         # Configured CD-MIN -10000 ps/nm  CD-MAX 16000 ps/nm
-        p30 = re.compile(r'^Configured CD-MIN +(?P<configured_cd_min>[\s\S]+) +CD-MAX +(?P<configured_cd_max>[\s\S]+)$')
+        p30 = regex_engine.compile(r'^Configured CD-MIN +(?P<configured_cd_min>[\s\S]+) +CD-MAX +(?P<configured_cd_max>[\s\S]+)$')
 
         # Optical Signal to Noise Ratio = 27.00 dB
-        p31 = re.compile(r'^Optical +Signal +to +Noise +Ratio *= *(?P<optical_snr>[\s\S]+)$')
+        p31 = regex_engine.compile(r'^Optical +Signal +to +Noise +Ratio *= *(?P<optical_snr>[\s\S]+)$')
 
         # Polarization Dependent Loss = 0.00 dB
-        p32 = re.compile(r'^Polarization +Dependent +Loss *= *(?P<polarization_dependent_loss>[\s\S]+)$')
+        p32 = regex_engine.compile(r'^Polarization +Dependent +Loss *= *(?P<polarization_dependent_loss>[\s\S]+)$')
 
         # Polarization parameters not supported by optics
-        p32_1 = re.compile(r'^Polarization +parameters +(?P<polarization_parameters>[\s\S]+)$')
+        p32_1 = regex_engine.compile(r'^Polarization +parameters +(?P<polarization_parameters>[\s\S]+)$')
 
         # Differential Group Delay = 2.00 ps
-        p33 = re.compile(r'^Differential +Group +Delay *= *(?P<differential_group_delay>[\s\S]+)$')
+        p33 = regex_engine.compile(r'^Differential +Group +Delay *= *(?P<differential_group_delay>[\s\S]+)$')
 
         # Form Factor            : SFP+
-        p34 = re.compile(r'^Form +Factor +: +(?P<form_factor>[\S\s]+)$')
+        p34 = regex_engine.compile(r'^Form +Factor +: +(?P<form_factor>[\S\s]+)$')
 
         # Optics type            : SFP+ 10G SR
-        p35 = re.compile(r'^Optics +type +: +(?P<optics_type>[\S\s]+)$')
+        p35 = regex_engine.compile(r'^Optics +type +: +(?P<optics_type>[\S\s]+)$')
 
         # Name                   : CISCO-AVAGO
-        p36 = re.compile(r'^Name +: +(?P<name>\S+)$')
+        p36 = regex_engine.compile(r'^Name +: +(?P<name>\S+)$')
 
         # OUI Number             : 00.17.6a
-        p37 = re.compile(r'^OUI +Number +: +(?P<oui_number>\S+)$')
+        p37 = regex_engine.compile(r'^OUI +Number +: +(?P<oui_number>\S+)$')
 
         # Part Number            : SFBR-7702SDZ-CS5
-        p38 = re.compile(r'^Part +Number +: +(?P<part_number>\S+)$')
+        p38 = regex_engine.compile(r'^Part +Number +: +(?P<part_number>\S+)$')
 
         # Rev Number             : G2.5
-        p39 = re.compile(r'^Rev +Number +: +(?P<rev_number>\S+)$')
+        p39 = regex_engine.compile(r'^Rev +Number +: +(?P<rev_number>\S+)$')
 
         # Serial Number          : AGD162040SP
         # Serial Number          : N/A
-        p40 = re.compile(r'^Serial +Number +: +(?P<serial_number>.+)$')
+        p40 = regex_engine.compile(r'^Serial +Number +: +(?P<serial_number>.+)$')
 
         # PID                    : SFP-10G-SR
-        p41 = re.compile(r'^PID +: +(?P<pid>\S+)$')
+        p41 = regex_engine.compile(r'^PID +: +(?P<pid>\S+)$')
 
         # VID                    : V03
-        p42 = re.compile(r'^VID +: +(?P<vid>\S+)$')
+        p42 = regex_engine.compile(r'^VID +: +(?P<vid>\S+)$')
 
         # Date Code(yy/mm/dd)    : 12/05/20
-        p43 = re.compile(r'^Date +Code.*: +(?P<date_code>\S+)$')
+        p43 = regex_engine.compile(r'^Date +Code.*: +(?P<date_code>\S+)$')
 
         for line in out.splitlines():
             line = line.replace('\t', ' ').strip()
@@ -1061,14 +1061,14 @@ class ShowControllersFiaDiagshellDiagEgrCalendarsLocation(ShowControllersFiaDiag
         ret_dict = {}
 
         # Node ID: 0/0/CPU0
-        p1 = re.compile(r'^Node +ID: +(?P<node_id>\S+)$')
+        p1 = regex_engine.compile(r'^Node +ID: +(?P<node_id>\S+)$')
 
         # 0  |    LOW   |       255     |        4     |   28   |    4   |      336671   |     990000  |      350000   |    1050000
-        p2 = re.compile(r'^(?P<port>\d+) +\| +(?P<priority>\S+) +\| +'
-                r'(?P<high_calendar>\d+) +\| +(?P<low_calendar>\d+) +\| +'
-                r'(?P<egq_if>\d+) +\| +(?P<e2e_if>\d+) +\| +(?P<egq_port_rate>\d+) +\| +'
-                r'(?P<egq_if_rate>\d+) +\| +(?P<e2e_port_rate>\d+) +\| +'
-                r'(?P<e2e_if_rate>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<port>\d+) +\| +(?P<priority>\S+) +\| +'
+                          r'(?P<high_calendar>\d+) +\| +(?P<low_calendar>\d+) +\| +'
+                          r'(?P<egq_if>\d+) +\| +(?P<e2e_if>\d+) +\| +(?P<egq_port_rate>\d+) +\| +'
+                          r'(?P<egq_if_rate>\d+) +\| +(?P<e2e_port_rate>\d+) +\| +'
+                          r'(?P<e2e_if_rate>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1148,12 +1148,12 @@ class ShowControllersNpuInterfaceInstanceLocation(ShowControllersNpuInterfaceIns
             out = output
 
         # Node ID: 0/0/CPU0
-        p1 = re.compile(r'^Node +ID: +(?P<node_id>\S+)$')
+        p1 = regex_engine.compile(r'^Node +ID: +(?P<node_id>\S+)$')
         # Gi0/0/0/0    108       0   0   33    33   1024   5384 local     1G
-        p2 = re.compile(r'^(?P<interface>\S+) +(?P<interface_handle_hex>[0-9a-f]+) +'
-                r'(?P<npu_number>\d+) +(?P<npu_core>\d+) +(?P<pp_port>\d+) +'
-                r'(?P<sys_port>\d+) +(?P<voq_base>\d+) +(?P<flow_base>\d+) +'
-                r'(?P<voq_port_type>\S+) +(?P<port_speed>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<interface>\S+) +(?P<interface_handle_hex>[0-9a-f]+) +'
+                          r'(?P<npu_number>\d+) +(?P<npu_core>\d+) +(?P<pp_port>\d+) +'
+                          r'(?P<sys_port>\d+) +(?P<voq_base>\d+) +(?P<flow_base>\d+) +'
+                          r'(?P<voq_port_type>\S+) +(?P<port_speed>\S+)$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -1236,17 +1236,17 @@ class ShowControllersFiaDiagshellDiagCosqQpairEgpMap(ShowControllersFiaDiagshell
         ret_dict = {}
 
         # Node ID: 0/0/CPU0
-        p1 = re.compile(r'^Node +ID: +(?P<node_id>\S+)$')
+        p1 = regex_engine.compile(r'^Node +ID: +(?P<node_id>\S+)$')
 
         # EGQ MAPPING:
-        p2 = re.compile(r'^(?P<mapping>[\S ]+):$')
+        p2 = regex_engine.compile(r'^(?P<mapping>[\S ]+):$')
 
         # Port #  |  Priorities  |  Base Q-Pair  |   PS #  | Core | TM Port |
         # ---------|--------------|---------------|---------|------|---------|
         # 0    |       2      |      200      |    25   |   0  |     0   |
-        p3 = re.compile(r'^(?P<port_number>\d+) +\| +(?P<priorities>\d+) +\| +'
-                        r'(?P<base_q_pair>\d+) +\| +(?P<ps_number>\d+) +\| +'
-                        r'(?P<core>\d+) +\| +(?P<tm_port>\d+) +\|$')
+        p3 = regex_engine.compile(r'^(?P<port_number>\d+) +\| +(?P<priorities>\d+) +\| +'
+                                  r'(?P<base_q_pair>\d+) +\| +(?P<ps_number>\d+) +\| +'
+                                  r'(?P<core>\d+) +\| +(?P<tm_port>\d+) +\|$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -5,12 +5,12 @@
 """
 
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =============================================
@@ -56,7 +56,7 @@ class ShowImDampening(ShowImDampeningSchema):
         interface = ""
         # GigabitEthernet0/0/0/1                                               2389 YES
         # POS0/2/0/0                  <base>             ppp                      0 NO
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface>\S+) +(?P<prot>\S+)? +(?P<cap>\S+)? +(?P<pen>\d+) +(?P<sup>YES|NO)')
 
         for line in out.splitlines():
@@ -142,35 +142,35 @@ class ShowImDampeningIntf(ShowImDampeningIntfSchema):
         index = 0
         # TenGigE 0/1/0/0 (0x01180020)
         # GigabitEthernet0/2/0/0 (0x080002c0)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface>[a-zA-Z]+\s?[\/\d]+)( +\((?P<intf_hand>\S+)\))?$')
 
         # Dampening enabled: Penalty 1625, SUPPRESSED (42 secs remaining)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'Dampening\s(?P<stat>\w+): +Penalty\s(?P<pen>\d+), +SUPPRESSED\s\((?P<sup>\d+)')
 
         # Dampening enabled: Penalty 0, not suppressed
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'Dampening\s(?P<stat_ns>\w+): +Penalty\s(?P<pen_ns>\d+), +not\ssupp.+')
 
         # underlying-state:  Up
         # Underlying state: Down
-        p4 = re.compile(r'^[a-z-A-Z\s]+state:\s+(?P<und_stat>\S+)')
+        p4 = regex_engine.compile(r'^[a-z-A-Z\s]+state:\s+(?P<und_stat>\S+)')
 
         #  half-life: 1        reuse:             1000
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'half-life:\s+(?P<half_life>\d+) +reuse:\s+(?P<reuse>\d+)')
 
         # suppress:  1500     max-suppress-time: 4
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'suppress:\s+(?P<suppress>\d+) +max-suppress-time:\s(?P<max_suppress>\d+)')
 
         # ipv6           ipv6               1625  YES    42s  remaining        Down
-        p7 = re.compile(r'^(?P<prot>\S+)? +(?P<prot_cap>\S+)? +(?P<prot_pen>\d+) +(?P<prot_sup>YES|NO)'
-                        r' +(?P<prot_sup_time>\d+). +remaining\s+(?P<prot_state>\S+)')
+        p7 = regex_engine.compile(r'^(?P<prot>\S+)? +(?P<prot_cap>\S+)? +(?P<prot_pen>\d+) +(?P<prot_sup>YES|NO)'
+                                  r' +(?P<prot_sup_time>\d+). +remaining\s+(?P<prot_state>\S+)')
 
         # Dampening not enabled
-        p8 = re.compile(r'^(?P<stat>Dampening not enabled)')
+        p8 = regex_engine.compile(r'^(?P<stat>Dampening not enabled)')
 
         for line in out.splitlines():
 
@@ -10,7 +10,6 @@ IOSXR parsers for the following show commands:
 """
 
 # Python
-import re
 import logging
 import collections
 from ipaddress import ip_address, ip_network
@@ -22,6 +21,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # Logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -75,10 +77,10 @@ class ShowDhcpIpv4ProxyBinding(ShowDhcpIpv4ProxyBindingSchema):
         result_dict = {}
 
         # 5001.0009.0002  51.1.1.3        BOUND      80989      Gi0/0/0/3.500        DHCP-VRF   0x0
-        p1 = re.compile(r'^((?P<mac_address>[\w\.]+)\s+(?P<ip_address>[\w\.]+)'
-                        r'\s+(?P<state>\w+)\s+(?P<lease_remaining>\d+)\s+'
-                        r'(?P<interface_name>\S+)\s+(?P<vrf_name>\S+)\s+'
-                        r'(?P<sublabel>\S+))$')
+        p1 = regex_engine.compile(r'^((?P<mac_address>[\w\.]+)\s+(?P<ip_address>[\w\.]+)'
+                                  r'\s+(?P<state>\w+)\s+(?P<lease_remaining>\d+)\s+'
+                                  r'(?P<interface_name>\S+)\s+(?P<vrf_name>\S+)\s+'
+                                  r'(?P<sublabel>\S+))$')
 
 
         for line in output.splitlines():
@@ -162,7 +164,7 @@ class ShowDhcpIpInterface(ShowDhcpIpInterfaceSchema):
 
         # Interface:          Bundle-Ether15.1001
         # Profile Name:       CATL
-        p1 = re.compile(r'^(?P<key>[\S\s]+):\s+(?P<value>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<key>[\S\s]+):\s+(?P<value>[\S\s]+)$')
 
         ret_dict = {}
 
@@ -226,11 +228,11 @@ class ShowDhcpVrfIpStatistics(ShowDhcpVrfIpStatisticsSchema):
         # DHCP IPv4 Proxy/Server Statistics for VRF default:
         # DHCP IPv4 Relay Statistics for VRF default:
         # DHCP IPv4 Relay Statistics for VRF DHCP-VRF:
-        p1 = re.compile(r'^DHCP\s+IPv4\s+\S+\s+Statistics\s+for\s+VRF\s+(?P<vrf_name>\S+):$')
+        p1 = regex_engine.compile(r'^DHCP\s+IPv4\s+\S+\s+Statistics\s+for\s+VRF\s+(?P<vrf_name>\S+):$')
 
         # DISCOVER         |            0  |            0  |            0  |
         # BOOTP-REQUEST    |            0  |            0  |            0  |
-        p2 = re.compile(r'^(?P<type>[\w-]+)\s+\|\s+(?P<receive>\d+)\s+\|\s+(?P<transmit>\d+)\s+\|\s+(?P<drop>\d+)\s+\|$')
+        p2 = regex_engine.compile(r'^(?P<type>[\w-]+)\s+\|\s+(?P<receive>\d+)\s+\|\s+(?P<transmit>\d+)\s+\|\s+(?P<drop>\d+)\s+\|$')
 
         ret_dict = {}
 
@@ -14,14 +14,12 @@ IOSXR parser for the following commands
     * 'show eigrp ipv6 vrf {vrf} neighbors detail'
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
 # Libs
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -80,9 +78,9 @@ class ShowEigrpNeighborsSuperParser(ShowEigrpNeighborsSchema):
         # IPv4-EIGRP VR(test) Neighbors for AS(100) VRF VRF1
         # IPv6-EIGRP VR(test) Neighbors for AS(100) VRF default
         # IPv6-EIGRP VR(test) Neighbors for AS(100) VRF VRF1
-        r1 = re.compile(r'^(?P<address_family>IPv4|IPv6)\-EIGRP\s+'
-                        r'(?:VR\(?(?P<name>\S+)\))?\s*Neighbors\s*for\s*'
-                        r'AS\(\s*(?P<as_num>\d+)\)\s*VRF\s*(?P<vrf>\S+)$')
+        r1 = regex_engine.compile(r'^(?P<address_family>IPv4|IPv6)\-EIGRP\s+'
+                                  r'(?:VR\(?(?P<name>\S+)\))?\s*Neighbors\s*for\s*'
+                                  r'AS\(\s*(?P<as_num>\d+)\)\s*VRF\s*(?P<vrf>\S+)$')
 
         # H   Address                 Interface       Hold Uptime   SRTT   RTO  Q  Seq
         #                                             (sec)         (ms)       Cnt Num
@@ -90,27 +88,27 @@ class ShowEigrpNeighborsSuperParser(ShowEigrpNeighborsSchema):
         # 0   10.12.90.1              Gi0/0/0/0.90      14 02:55:10    1   200  0  17
         # 1   10.23.90.3              Gi0/0/0/1.390     12 01:40:17    4   200  0  15
         # 0   10.12.90.1              Gi0/0/0/0.390     12 02:52:31  816  4896  0  8
-        r2 = re.compile(r'^(?P<peer_handle>\d+) +'
-                        r'(?P<nbr_address>\S+) +'
-                        r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
-                        r'(?P<hold>\d+) +(?P<uptime>\S+) +'
-                        r'(?P<srtt>\d+) +'
-                        r'(?P<rto>\d+) +'
-                        r'(?P<q_cnt>\d+) +'
-                        r'(?P<last_seq_number>\d+)$')
+        r2 = regex_engine.compile(r'^(?P<peer_handle>\d+) +'
+                                  r'(?P<nbr_address>\S+) +'
+                                  r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
+                                  r'(?P<hold>\d+) +(?P<uptime>\S+) +'
+                                  r'(?P<srtt>\d+) +'
+                                  r'(?P<rto>\d+) +'
+                                  r'(?P<q_cnt>\d+) +'
+                                  r'(?P<last_seq_number>\d+)$')
 
         # H   Address                 Interface       Hold Uptime   SRTT   RTO  Q  Seq
         #                                             (sec)         (ms)       Cnt Num
         # 1   Link Local Address:     Gi0/0/0/1.90      12 01:36:14   11   200  0  28
-        r3 = re.compile(r'^(?P<peer_handle>\d+) +Link\s+Local\s+Address: +'
-                        r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
-                        r'(?P<hold>\d+) +(?P<uptime>\S+) +(?P<srtt>\d+) +'
-                        r'(?P<rto>\d+) +(?P<q_cnt>\d+) +'
-                        r'(?P<last_seq_number>\d+)$')
+        r3 = regex_engine.compile(r'^(?P<peer_handle>\d+) +Link\s+Local\s+Address: +'
+                                  r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
+                                  r'(?P<hold>\d+) +(?P<uptime>\S+) +(?P<srtt>\d+) +'
+                                  r'(?P<rto>\d+) +(?P<q_cnt>\d+) +'
+                                  r'(?P<last_seq_number>\d+)$')
 
         # fe80::5c00:ff:fe02:7
         # fe80::5c00:ff:fe02:7
-        r4 = re.compile(r'^(?P<nbr_address>\S+)$')
+        r4 = regex_engine.compile(r'^(?P<nbr_address>\S+)$')
 
         parsed_dict = {}
 
@@ -344,45 +342,45 @@ class ShowEigrpNeighborsDetailSuperParser(ShowEigrpNeighborsDetailSchema):
         # IPv4-EIGRP VR(test) Neighbors for AS(100) VRF default
         # IPv6-EIGRP VR(test) Neighbors for AS(100) VRF default
         # IPv6-EIGRP VR(test) Neighbors for AS(100) VRF VRF1
-        r1 = re.compile(r'^(?P<address_family>IPv4|IPv6)\-EIGRP\s+'
-                        r'(?:VR\(?(?P<name>\S+)\))?\s*Neighbors\s*for\s*'
-                        r'AS\(\s*(?P<as_num>\d+)\)\s*VRF\s*(?P<vrf>\S+)$')
+        r1 = regex_engine.compile(r'^(?P<address_family>IPv4|IPv6)\-EIGRP\s+'
+                                  r'(?:VR\(?(?P<name>\S+)\))?\s*Neighbors\s*for\s*'
+                                  r'AS\(\s*(?P<as_num>\d+)\)\s*VRF\s*(?P<vrf>\S+)$')
 
         # 1   10.23.90.3              Gi0/0/0/1.90      11 01:43:15   13   200  0  23
         # 1   10.23.90.3              Gi0/0/0/1.390     14 01:41:47    4   200  0  15
         # 0   10.12.90.1              Gi0/0/0/0.390     13 02:54:01  816  4896  0  8
-        r2 = re.compile(r'^(?P<peer_handle>\d+) +'
-                        r'(?P<nbr_address>\S+) +'
-                        r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
-                        r'(?P<hold>\d+) +(?P<uptime>\S+) +'
-                        r'(?P<srtt>\d+) +'
-                        r'(?P<rto>\d+) +'
-                        r'(?P<q_cnt>\d+) +'
-                        r'(?P<last_seq_number>\d+)$')
+        r2 = regex_engine.compile(r'^(?P<peer_handle>\d+) +'
+                                  r'(?P<nbr_address>\S+) +'
+                                  r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
+                                  r'(?P<hold>\d+) +(?P<uptime>\S+) +'
+                                  r'(?P<srtt>\d+) +'
+                                  r'(?P<rto>\d+) +'
+                                  r'(?P<q_cnt>\d+) +'
+                                  r'(?P<last_seq_number>\d+)$')
 
         # 1   Link Local Address:     Gi0/0/0/1.390     11 01:42:44    9   200  0  14
         # 0   Link Local Address:     Gi0/0/0/0.390     12 02:31:47    4   200  0  9
-        r3 = re.compile(r'^(?P<peer_handle>\d+) +Link\s+Local\s+Address: +'
-                        r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
-                        r'(?P<hold>\d+) +(?P<uptime>\S+) +(?P<srtt>\d+) +'
-                        r'(?P<rto>\d+) +(?P<q_cnt>\d+) +'
-                        r'(?P<last_seq_number>\d+)$')
+        r3 = regex_engine.compile(r'^(?P<peer_handle>\d+) +Link\s+Local\s+Address: +'
+                                  r'(?P<eigrp_interface>[A-Za-z]+\s*[\d\/\.]+) +'
+                                  r'(?P<hold>\d+) +(?P<uptime>\S+) +(?P<srtt>\d+) +'
+                                  r'(?P<rto>\d+) +(?P<q_cnt>\d+) +'
+                                  r'(?P<last_seq_number>\d+)$')
 
         # fe80::5c00:ff:fe02:7
         # fe80::5c00:ff:fe02:7
-        r4 = re.compile(r'^(?P<nbr_address>\S+)$')
+        r4 = regex_engine.compile(r'^(?P<nbr_address>\S+)$')
 
         # Version 23.0/2.0, Retrans: 1, Retries: 0, Prefixes: 6
         # Version 8.0/1.2, Retrans: 1, Retries: 0, Prefixes: 5
-        r5 = re.compile(r'Version\s*'
-                        r'(?P<os_majorver>\d+)\.(?P<os_minorver>\d+)\/'
-                        r'(?P<tlv_majorrev>\d+)\.(?P<tlv_minorrev>\d+), +'
-                        r'Retrans\s*:\s*(?P<retransmit_count>\d+)\, +'
-                        r'Retries\s*:\s*(?P<retry_count>\d+)\,* *'
-                        r'(?:Prefixes\s*:\s*(?P<prefixes>\d+))?')
+        r5 = regex_engine.compile(r'Version\s*'
+                                  r'(?P<os_majorver>\d+)\.(?P<os_minorver>\d+)\/'
+                                  r'(?P<tlv_majorrev>\d+)\.(?P<tlv_minorrev>\d+), +'
+                                  r'Retrans\s*:\s*(?P<retransmit_count>\d+)\, +'
+                                  r'Retries\s*:\s*(?P<retry_count>\d+)\,* *'
+                                  r'(?:Prefixes\s*:\s*(?P<prefixes>\d+))?')
 
         # BFD disabled
-        r6 = re.compile(r'^BFD\s+(?P<bfd>\w+)$')
+        r6 = regex_engine.compile(r'^BFD\s+(?P<bfd>\w+)$')
 
         parsed_dict = {}
 
@@ -21,6 +21,7 @@ import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowEthernetCfmMepsSchema(MetaParser):
@@ -95,15 +96,15 @@ class ShowEthernetCfmMeps(ShowEthernetCfmMepsSchema):
         ret_dict = {}
         
         # Domain dom3 (level 5), Service ser3
-        p1 = re.compile(r'^Domain +(?P<domain>\S+) +\(level +(?P<level>\d+)\), +Service +(?P<service>\S+)$')
+        p1 = regex_engine.compile(r'^Domain +(?P<domain>\S+) +\(level +(?P<level>\d+)\), +Service +(?P<service>\S+)$')
         
         # Down MEP on GigabitEthernet0/0/0/0 MEP-ID 1
         # Up MEP on GigabitEthernet0/6/0/23.1 MEP-ID 500
-        p2 = re.compile(r'^(?P<mep_type>\w+) +MEP +on +(?P<interface>\S+) +MEP-ID +(?P<mep_id>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<mep_type>\w+) +MEP +on +(?P<interface>\S+) +MEP-ID +(?P<mep_id>\d+)$')
 
         # V     10 0001.02ff.0706 Up      00:01:35            2      0     0     2
         # >    20 0001.02ff.0705 Up      00:00:03            4      1     0     0
-        p3 = re.compile(r'^(?P<st>(>|R|L|C|X|\*|I|V|T|M|U)) +(?P<id>\d+) +(?P<mac_address>\S+) +'
+        p3 = regex_engine.compile(r'^(?P<st>(>|R|L|C|X|\*|I|V|T|M|U)) +(?P<id>\d+) +(?P<mac_address>\S+) +'
             r'(?P<port>\w+) +(?P<up_down_time>\S+) +(?P<ccm_rcvd>\d+) +(?P<seq_err>\d+) +'
             r'(?P<rdi>\d+) +(?P<error>\d+)$')
 
@@ -210,7 +211,7 @@ class ShowEthernetTrunkDetail(ShowEthernetTrunkDetailSchema):
         trunk_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*(?P<interface_name>[A-Z][a-z])([A-Za-z]+)(?P<interface_number>[0-9\/]+) +is +(?P<status>[a-z]+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<interface_name>[A-Z][a-z])([A-Za-z]+)(?P<interface_number>[0-9\/]+) +is +(?P<status>[a-z]+)$')
             m = p1.match(line)
             if m:
                 interface_name = m.groupdict()['interface_name']
@@ -222,7 +223,7 @@ class ShowEthernetTrunkDetail(ShowEthernetTrunkDetailSchema):
                     trunk_dict['interface'][interface] = {}
                     continue
 
-            p2 = re.compile(r'^\s*Dot1Q +Tunneling +Ethertype +is +(?P<dot1q_tunneling_ethertype>[a-z0-9]+)$')
+            p2 = regex_engine.compile(r'^\s*Dot1Q +Tunneling +Ethertype +is +(?P<dot1q_tunneling_ethertype>[a-z0-9]+)$')
             m = p2.match(line)
             if m:
                 trunk_dict['interface'][interface]['dot1q_tunneling_ethertype'] = \
@@ -279,12 +280,12 @@ class ShowEthernetTags(ShowEthernetTagsSchema):
         stage = ''
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Interface\s +St\s +MTU\s +Ly\s +Outer\s +Inner\s +Xtra\s +-,+$')
+            p1 = regex_engine.compile(r'^\s*Interface\s +St\s +MTU\s +Ly\s +Outer\s +Inner\s +Xtra\s +-,+$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*(?P<sub_interface>[A-Za-z0-9\/\.]+) +(?P<status>[A-Za-z]+) +(?P<mtu>[0-9]+) +(?P<layer>[A-Z0-9]+) +(\.)(?P<outer_encapsulation_type>[A-Za-z0-9]+)(\:)(?P<outer_encapsulation_value>[0-9]+) +((\.)(?P<inner_encapsulation_type>[A-Za-z0-9]+)(\:)(?P<inner_encapsulation_value>[0-9]+))?')
+            p2 = regex_engine.compile(r'^\s*(?P<sub_interface>[A-Za-z0-9\/\.]+) +(?P<status>[A-Za-z]+) +(?P<mtu>[0-9]+) +(?P<layer>[A-Z0-9]+) +(\.)(?P<outer_encapsulation_type>[A-Za-z0-9]+)(\:)(?P<outer_encapsulation_value>[0-9]+) +((\.)(?P<inner_encapsulation_type>[A-Za-z0-9]+)(\:)(?P<inner_encapsulation_value>[0-9]+))?')
             m = p2.match(line)
             if m:
                 sub_interface = m.groupdict()['sub_interface']
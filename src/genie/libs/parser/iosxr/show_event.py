@@ -11,11 +11,11 @@
    * show event manager policy registered user | include <eem_file_name>	
 """
 
-# python
-import re
-
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 class ShowEventManagerEnvSchema(MetaParser):
@@ -50,7 +50,7 @@ class ShowEventManagerEnv(ShowEventManagerEnvSchema):
 
         #1   _eem_int                      Loopback2                                         
         #2   _eem_event_trigger_log        eem trigger logs jun24     
-        p = re.compile(r'^(?P<num>\d+) +(?P<event_name>\w+) +((?P<value>.+))?$')
+        p = regex_engine.compile(r'^(?P<num>\d+) +(?P<event_name>\w+) +((?P<value>.+))?$')
 
         ret_dict = {}
 
@@ -123,7 +123,7 @@ class ShowEventManagerPolicyAvailable(ShowEventManagerPolicyAvailableSchema):
 
 	#1   user      Mon Jun 28 11:52:14 2021      eem_cli_exec_file.tcl                             
         #2   user      Thu Jun 24 09:33:26 2021      eem_int_shut.tcl    
-        p = re.compile(r'^(?P<num>\d+) +(?P<type>\w+) +(?P<time_created>.+[^ ]) +(?P<eemfile_name>.+)$')
+        p = regex_engine.compile(r'^(?P<num>\d+) +(?P<type>\w+) +(?P<time_created>.+[^ ]) +(?P<eemfile_name>.+)$')
 
         ret_dict = {}
         
@@ -191,22 +191,22 @@ class ShowEventManagerPolicyRegistered(ShowEventManagerPolicyRegisteredSchema):
             output = self.device.execute(cmd)
         
         #1    script    user    syslog              Off   Mon Jun 28 14:55:59 2021  eem_int_shut.tcl
-        p1 = re.compile(r'^(?P<num>\d+) + (?P<class>[a-z]+) '
-                       r'+ (?P<type>[a-z]+) + (?P<event_type>[a-z\s]+)\s'
-                       r'+ (?P<trap>[A-Za-z]+) + (?P<time_registered>[A-Za-z0-9\s\:]+) '
-                       r'+ (?P<eemfile_name>[\w\-.]+)?$')
+        p1 = regex_engine.compile(r'^(?P<num>\d+) + (?P<class>[a-z]+) '
+                                 r'+ (?P<type>[a-z]+) + (?P<event_type>[a-z\s]+)\s'
+                                 r'+ (?P<trap>[A-Za-z]+) + (?P<time_registered>[A-Za-z0-9\s\:]+) '
+                                 r'+ (?P<eemfile_name>[\w\-.]+)?$')
 
         #  pattern {eem trigger logs jun24}
         #  name {watchtimer} time 180.000
         #  name {crontimer2} cron entry {0-59/2 0-23/1 * * 0-7}
-        p2 = re.compile(r'^(?P<pattern_name>[\w\s]+ \{[\w\s]+\}.*)$')
+        p2 = regex_engine.compile(r'^(?P<pattern_name>[\w\s]+ \{[\w\s]+\}.*)$')
 
         #  nice 0 queue-priority normal maxrun 100.000 scheduler rp_primary Secu none
-        p3 = re.compile(r'^nice +(?P<nice_value>\d+) +queue-priority +(?P<queue_priority>\w+) +maxrun +(?P<maxrun>[\d.]+) '
-                        r'+scheduler +(?P<scheduler>[\w\_]+) +Secu +(?P<secu>\w+)$')
+        p3 = regex_engine.compile(r'^nice +(?P<nice_value>\d+) +queue-priority +(?P<queue_priority>\w+) +maxrun +(?P<maxrun>[\d.]+) '
+                                  r'+scheduler +(?P<scheduler>[\w\_]+) +Secu +(?P<secu>\w+)$')
 
         #  persist_time: 3600 seconds,  username: lab
-        p4 = re.compile(r'^persist_time: +(?P<persist_time>\d+) seconds,  +username: +(?P<username>\w+)$')
+        p4 = regex_engine.compile(r'^persist_time: +(?P<persist_time>\d+) seconds,  +username: +(?P<username>\w+)$')
 
         ret_dict = {}
 
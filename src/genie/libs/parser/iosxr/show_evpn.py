@@ -8,6 +8,7 @@ import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -44,19 +45,19 @@ class ShowEvpnEvi(ShowEvpnEviSchema):
         # 1000  VPWS:1000       VPWS (vlan-unaware)
         # 2000  XC-POD1-EVPN    EVPN
         # 2001  XC-POD2-EVPN    EVPN
-        p1 = re.compile(r'^(?P<evi>\d+) +(?P<bridge_domain>\S+) +(?P<type>.+)$')
+        p1 = regex_engine.compile(r'^(?P<evi>\d+) +(?P<bridge_domain>\S+) +(?P<type>.+)$')
 
         # 100:145                        Import
         # 100:145                        Export
-        p2 = re.compile(r'^(?P<route_target_in_use>[\d+:\d+]+) +(?P<type>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<route_target_in_use>[\d+:\d+]+) +(?P<type>\S+)$')
 
         # ------------------------------ -------
-        p3 = re.compile(r'(-+ *)+$')
+        p3 = regex_engine.compile(r'(-+ *)+$')
 
         # Unicast Label  : 24001
         # Multicast Label: 16001
         # RD Auto  : (auto) 10.1.100.100:145
-        p4 = re.compile(r'^(?P<key>[\S ]+) *: +(?P<value>[\S ]+)$')
+        p4 = regex_engine.compile(r'^(?P<key>[\S ]+) *: +(?P<value>[\S ]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -262,43 +263,43 @@ class ShowEvpnInternalLabelDetail(ShowEvpnInternalLabelDetailSchema):
 
         # 5     0012.12ff.0000.0000.0002                0        24114
         # 100   0100.00ff.acce.5500.0100                0        24005
-        p1 = re.compile(r'^(?P<evi>(\d+)) +(?P<esi>([a-z0-9\.]+))'
-                        r' +(?P<eth_tag>(\d+))( +(?P<label>(\d+)))?$')
+        p1 = regex_engine.compile(r'^(?P<evi>(\d+)) +(?P<esi>([a-z0-9\.]+))'
+                                  r' +(?P<eth_tag>(\d+))( +(?P<label>(\d+)))?$')
 
         # 16001      VXLAN  0001.04ff.0b0c.0607.0811    0          24002
         # 16003      VXLAN  0001.04ff.0b0c.0607.0811    0          24004
         # 1000       MPLS   0001.00ff.0102.0000.0011    0
-        p2 = re.compile(r'^(?P<vpn_id>(\d+)) +(?P<encap>([a-zA-Z]+))'
-                        r' +(?P<esi>([a-z0-9\.]+)) +(?P<eth_tag>(\d+))'
-                        r'( +(?P<mp_internal_label>(\d+)))?$')
+        p2 = regex_engine.compile(r'^(?P<vpn_id>(\d+)) +(?P<encap>([a-zA-Z]+))'
+                                  r' +(?P<esi>([a-z0-9\.]+)) +(?P<eth_tag>(\d+))'
+                                  r'( +(?P<mp_internal_label>(\d+)))?$')
 
         # Multi-paths resolved: TRUE
         # Multi-paths resolved: TRUE (Remote single-active)
-        p3 = re.compile(r'^Multi-paths +resolved: +(?P<mp_resolved>(\S+))'
-                        r' +\((?P<mp_info>(.*))\)$')
+        p3 = regex_engine.compile(r'^Multi-paths +resolved: +(?P<mp_resolved>(\S+))'
+                                  r' +\((?P<mp_info>(.*))\)$')
 
         # Multi-paths Internal label: 24002
-        p4 = re.compile(r'^Multi-paths +Internal +label: +(?P<internal>(\d+))$')
+        p4 = regex_engine.compile(r'^Multi-paths +Internal +label: +(?P<internal>(\d+))$')
         # Pathlists:
         # MAC     10.70.20.20                              24212
         # EAD/ES  10.10.10.10                              0
         # EAD/EVI 10.10.10.10                              24012
         # Summary 10.70.20.20                              24212
-        p5 = re.compile(r'^(?P<type>(MAC|EAD\/ES|EAD\/EVI|Summary))'
-                        r' +(?P<nexthop>(\S+)) +(?P<label>(\d+))$')
+        p5 = regex_engine.compile(r'^(?P<type>(MAC|EAD\/ES|EAD\/EVI|Summary))'
+                                  r' +(?P<nexthop>(\S+)) +(?P<label>(\d+))$')
 
         #         10.70.20.20                              0
         #         10.10.10.10 (B)                          24012
-        p6 = re.compile(r'^(?P<nexthop>(\S+))(?: +\((?P<df_role>(\S+))\))?'
-                        r' +(?P<label>(\d+))$')
+        p6 = regex_engine.compile(r'^(?P<nexthop>(\S+))(?: +\((?P<df_role>(\S+))\))?'
+                                  r' +(?P<label>(\d+))$')
 
         # Summary pathlist:
-        p7 = re.compile(r'^Summary pathlist:$')
+        p7 = regex_engine.compile(r'^Summary pathlist:$')
 
         #   0x03000001 10.76.1.2                                16002
         #   0xffffffff (P) 10.16.2.2                              100001
-        p8 = re.compile(r'^(?P<value>(\S+))(?: +(?P<df_role>\(\S+\)))? '
-                        r'+(?P<nexthop>(\S+)) +(?P<label>(\d+))$')
+        p8 = regex_engine.compile(r'^(?P<value>(\S+))(?: +(?P<df_role>\(\S+\)))? '
+                                  r'+(?P<nexthop>(\S+)) +(?P<label>(\d+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -527,145 +528,145 @@ class ShowEvpnEviMac(ShowEvpnEviMacSchema):
         # 750       SRv6       0011.0002.02ee ::    TenGigE0/1/0/6/0.1750      0        cafe:0:128:eef2::
         # 1750       SRv6       0044.0002.02ee ::   4.4.4.4                    IMP-NULL cafe:0:400:ebb6::
         # 65535      N/A        fe1d.1d95.8480 ::   Local                      0
-        p1 = re.compile(r'^(?P<vpn_id>\d+)( +(?P<encap>[\w\/]+))? +(?P<mac_address>[\w\.]+) +'
-                        r'(?P<ip_address>[\w:\.]+) +(?P<next_hop>[\w:\.\d\-\/]+) +(?P<label>(\d+|IMP-NULL))'
-                        r'(?:\s+(?P<sid>[\da-fA-F:]+))?$')
+        p1 = regex_engine.compile(r'^(?P<vpn_id>\d+)( +(?P<encap>[\w\/]+))? +(?P<mac_address>[\w\.]+) +'
+                                  r'(?P<ip_address>[\w:\.]+) +(?P<next_hop>[\w:\.\d\-\/]+) +(?P<label>(\d+|IMP-NULL))'
+                                  r'(?:\s+(?P<sid>[\da-fA-F:]+))?$')
 
         # 001b.01ff.0001 N/A                                     24014    7
-        p1_1 = re.compile(r'^(?P<mac_address>(?:\w+\.){2}\w+) +(?P<next_hop>\S+) +(?P<label>(\d+|IMP-NULL)) +(?P<vpn_id>\d+)$')
+        p1_1 = regex_engine.compile(r'^(?P<mac_address>(?:\w+\.){2}\w+) +(?P<next_hop>\S+) +(?P<label>(\d+|IMP-NULL)) +(?P<vpn_id>\d+)$')
 
         # IP Address   : 10.196.7.8
-        p1_2 = re.compile(r'^IP +Address +: +(?P<ip_address>\S+)$')
+        p1_2 = regex_engine.compile(r'^IP +Address +: +(?P<ip_address>\S+)$')
 
         # SID flags: 0, Endpt behavior: 67
-        p2 = re.compile(r'^SID +flags: +(?P<sid_flags>\d+), +Endpt +behavior: +(?P<endpt_behavior>\d+)$')
+        p2 = regex_engine.compile(r'^SID +flags: +(?P<sid_flags>\d+), +Endpt +behavior: +(?P<endpt_behavior>\d+)$')
 
         # SID struct: Block  Node  Func  Arg
         #             32     16    16    0
-        p3 = re.compile(r'^(?P<block>\d+)\s+(?P<node>\d+)\s+(?P<func>\d+)\s+(?P<arg>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<block>\d+)\s+(?P<node>\d+)\s+(?P<func>\d+)\s+(?P<arg>\d+)$')
 
         # Transposition (len, offset): 16, 48
-        p4 = re.compile(r'^Transposition\s+\(len,\s+offset\):\s+(?P<len>\d+),\s+(?P<offset>\d+)$')
+        p4 = regex_engine.compile(r'^Transposition\s+\(len,\s+offset\):\s+(?P<len>\d+),\s+(?P<offset>\d+)$')
 
         # Ethernet Tag                            : 0
-        p5 = re.compile(r'^Ethernet +Tag +: +(?P<ethernet_tag>\d+)$')
+        p5 = regex_engine.compile(r'^Ethernet +Tag +: +(?P<ethernet_tag>\d+)$')
 
         # Multi-paths Resolved                    : False
-        p6 = re.compile(r'^Multi-paths +Resolved +: +(?P<multipaths_resolved>\S+)$')
+        p6 = regex_engine.compile(r'^Multi-paths +Resolved +: +(?P<multipaths_resolved>\S+)$')
 
         # Multi-paths Internal label              : 0
-        p7 = re.compile(r'^Multi-paths +Internal +label +: +(?P<multipaths_internal_label>\d+)$')
+        p7 = regex_engine.compile(r'^Multi-paths +Internal +label +: +(?P<multipaths_internal_label>\d+)$')
 
         # Multi-paths Local Label
-        p7_1 = re.compile(r'^Multi-paths +Local +Label +: +(?P<multipaths_local_label>\d+)$')
+        p7_1 = regex_engine.compile(r'^Multi-paths +Local +Label +: +(?P<multipaths_local_label>\d+)$')
 
         # Local Static                            : No
-        p8 = re.compile(r'^Local +Static +: +(?P<local_static>\S+)$')
+        p8 = regex_engine.compile(r'^Local +Static +: +(?P<local_static>\S+)$')
 
         # Remote Static                           : No
-        p9 = re.compile(r'^Remote +Static +: +(?P<remote_static>\S+)$')
+        p9 = regex_engine.compile(r'^Remote +Static +: +(?P<remote_static>\S+)$')
 
         # Local Ethernet Segment                  : 0000.0000.0000.0000.0000
-        p10 = re.compile(r'^Local +Ethernet +Segment +: +(?P<local_ethernet_segment>\S+)$')
+        p10 = regex_engine.compile(r'^Local +Ethernet +Segment +: +(?P<local_ethernet_segment>\S+)$')
 
         # Ether.Segment: 0000.0000.0000.0000.0000
-        p10_1 = re.compile(r'^Ether\S+Segment *: +(?P<ethernet_segment>\S+)$')
+        p10_1 = regex_engine.compile(r'^Ether\S+Segment *: +(?P<ethernet_segment>\S+)$')
 
         # Remote Ethernet Segment                 : 0000.0000.0000.0000.0000
-        p11 = re.compile(r'^Remote +Ethernet +Segment +: +(?P<remote_ethernet_segment>\S+)$')
+        p11 = regex_engine.compile(r'^Remote +Ethernet +Segment +: +(?P<remote_ethernet_segment>\S+)$')
 
         # Local Sequence Number                   : 0
-        p12 = re.compile(r'^Local +Sequence +Number +: +(?P<local_sequence_number>\d+)$')
+        p12 = regex_engine.compile(r'^Local +Sequence +Number +: +(?P<local_sequence_number>\d+)$')
 
         # Remote Sequence Number                  : 0
-        p13 = re.compile(r'^Remote +Sequence +Number +: +(?P<remote_sequence_number>\d+)$')
+        p13 = regex_engine.compile(r'^Remote +Sequence +Number +: +(?P<remote_sequence_number>\d+)$')
 
         # Local Encapsulation                     : N/A
-        p14 = re.compile(r'^Local +Encapsulation +: +(?P<local_encapsulation>\S+)$')
+        p14 = regex_engine.compile(r'^Local +Encapsulation +: +(?P<local_encapsulation>\S+)$')
 
         # Remote Encapsulation                    : N/A
-        p15 = re.compile(r'^Remote +Encapsulation +: +(?P<remote_encapsulation>\S+)$')
+        p15 = regex_engine.compile(r'^Remote +Encapsulation +: +(?P<remote_encapsulation>\S+)$')
 
         # Local E-Tree                            : Root
-        p16 = re.compile(r'^Local +E-Tree +: +(?P<local_e_tree>\S+)$')
+        p16 = regex_engine.compile(r'^Local +E-Tree +: +(?P<local_e_tree>\S+)$')
 
         # Remote E-Tree                           : Root
-        p17 = re.compile(r'^Remote +E-Tree +: +(?P<remote_e_tree>\S+)$')
+        p17 = regex_engine.compile(r'^Remote +E-Tree +: +(?P<remote_e_tree>\S+)$')
 
         # Remote matching E-Tree RT               : No
-        p18 = re.compile(r'^Remote +matching +E-Tree +RT +: +(?P<remote_matching_e_tree_rt>\S+)$')
+        p18 = regex_engine.compile(r'^Remote +matching +E-Tree +RT +: +(?P<remote_matching_e_tree_rt>\S+)$')
 
         # Local AC-ID                             : 0x0
-        p19 = re.compile(r'^Local +AC-ID +: +(?P<local_ac_id>\S+)$')
+        p19 = regex_engine.compile(r'^Local +AC-ID +: +(?P<local_ac_id>\S+)$')
 
         # Remote AC-ID                            : 0x2
-        p20 = re.compile(r'^Remote +AC-ID +: +(?P<remote_ac_id>\S+)$')
+        p20 = regex_engine.compile(r'^Remote +AC-ID +: +(?P<remote_ac_id>\S+)$')
 
         # ESI Port Key                            : 0
         # ESI Port Key                            : bef5
-        p21 = re.compile(r'^ESI +Port +Key +: +(?P<esi_port_key>\w+)$')
+        p21 = regex_engine.compile(r'^ESI +Port +Key +: +(?P<esi_port_key>\w+)$')
 
         # Source                                  : Local
-        p22 = re.compile(r'^Source +: +(?P<source>\S+)$')
+        p22 = regex_engine.compile(r'^Source +: +(?P<source>\S+)$')
 
         # Flush Requested                         : 0
-        p23 = re.compile(r'^Flush +Requested +: +(?P<flush_requested>\d+)$')
+        p23 = regex_engine.compile(r'^Flush +Requested +: +(?P<flush_requested>\d+)$')
 
         # Flush Received                          : 0
-        p24 = re.compile(r'^Flush +Received +: +(?P<flush_received>\d+)$')
+        p24 = regex_engine.compile(r'^Flush +Received +: +(?P<flush_received>\d+)$')
 
         # SOO Nexthop                             : ::
-        p25 = re.compile(r'^SOO +Nexthop +: +(?P<soo_nexthop>\S+)$')
+        p25 = regex_engine.compile(r'^SOO +Nexthop +: +(?P<soo_nexthop>\S+)$')
 
         # Ext Flags                               : 0x00000000
-        p26 = re.compile(r'^Ext +Flags +: +(?P<ext_flags>\S+)$')
+        p26 = regex_engine.compile(r'^Ext +Flags +: +(?P<ext_flags>\S+)$')
 
         # BP XCID                                 : 0xffffffff
-        p27 = re.compile(r'^BP +XCID +: +(?P<bp_xcid>\S+)$')
+        p27 = regex_engine.compile(r'^BP +XCID +: +(?P<bp_xcid>\S+)$')
 
         # Stamped XCID                            : 0xffffffff
-        p28 = re.compile(r'^Stamped +XCID +: +(?P<stamped_xcid>\S+)$')
+        p28 = regex_engine.compile(r'^Stamped +XCID +: +(?P<stamped_xcid>\S+)$')
 
         # MAC State                               : Init
-        p29 = re.compile(r'^MAC +State +: +(?P<mac_state>[\S ]+)$')
+        p29 = regex_engine.compile(r'^MAC +State +: +(?P<mac_state>[\S ]+)$')
 
         # MAC Producers                           : 0x0 (Best: 0x0)
-        p30 = re.compile(r'^MAC +Producers +: +(?P<mac_producers>[\S ]+)$')
+        p30 = regex_engine.compile(r'^MAC +Producers +: +(?P<mac_producers>[\S ]+)$')
 
         # Local Router MAC                        : 0000.0000.0000
-        p31 = re.compile(r'^Local +Router +MAC +: +(?P<local_router_mac>\S+)$')
+        p31 = regex_engine.compile(r'^Local +Router +MAC +: +(?P<local_router_mac>\S+)$')
 
         # L3 Label                                : 0
-        p32 = re.compile(r'^L3 +Label +: +(?P<l3_label>\d+)$')
+        p32 = regex_engine.compile(r'^L3 +Label +: +(?P<l3_label>\d+)$')
 
         # Object: EVPN MAC
-        p33 = re.compile(r'^Object: +(?P<object_name>[\S ]+)$')
+        p33 = regex_engine.compile(r'^Object: +(?P<object_name>[\S ]+)$')
 
         # Base info: version=0xdbdb0008, flags=0x4000, type=8, reserved=0
-        p34 = re.compile(r'^Base info: +version=(?P<version>\S+), +flags=(?P<flags>\S+)'
-                         r', +type=(?P<type>\d+), +reserved=(?P<reserved>\d+)$')
+        p34 = regex_engine.compile(r'^Base info: +version=(?P<version>\S+), +flags=(?P<flags>\S+)'
+                                   r', +type=(?P<type>\d+), +reserved=(?P<reserved>\d+)$')
 
         # EVPN MAC event history  [Num events: 0]
-        p35 = re.compile(r'^EVPN +MAC +event +history +\[Num +events: +(?P<num_events>\d+)\]$')
+        p35 = regex_engine.compile(r'^EVPN +MAC +event +history +\[Num +events: +(?P<num_events>\d+)\]$')
 
         # Jun 14 14:02:12.864 Create                        00000000, 00000000 -  -
         # Jun 14 14:02:12.864 MAC advertise rejected        00000003, 00000000 -  -
         # Aug 15 22:10:12.736  Create                       00000000 00000001 -  -
         # Sep 24 07:09:27.424 L2RIB Download                0001888a, 01010000 -  -
-        p36 = re.compile(r'^(?P<time>\w+ +\d+ +\S+) +(?P<event>[\S ]+) +(?P<flag_1>\w+)'
-                         r',? +(?P<flag_2>\w+) +(?P<code_1>\S+) +(?P<code_2>\S+)$')
+        p36 = regex_engine.compile(r'^(?P<time>\w+ +\d+ +\S+) +(?P<event>[\S ]+) +(?P<flag_1>\w+)'
+                                   r',? +(?P<flag_2>\w+) +(?P<code_1>\S+) +(?P<code_2>\S+)$')
 
         # Flush Count  : 0
-        p37 = re.compile(r'^Flush +Count *: +(?P<flush_count>\d+)$')
+        p37 = regex_engine.compile(r'^Flush +Count *: +(?P<flush_count>\d+)$')
 
         # BP IFH: 0
-        p38 = re.compile(r'^BP +IFH: +(?P<bp_ifh>\d+)$')
+        p38 = regex_engine.compile(r'^BP +IFH: +(?P<bp_ifh>\d+)$')
 
         # Flush Seq ID : 0
-        p39 = re.compile(r'^Flush +Seq +ID +: +(?P<flush_seq_id>\d+)$')
+        p39 = regex_engine.compile(r'^Flush +Seq +ID +: +(?P<flush_seq_id>\d+)$')
 
         # Static: No
-        p40 = re.compile(r'^Static *: +(?P<static>\S+)$')
+        p40 = regex_engine.compile(r'^Static *: +(?P<static>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1221,125 +1222,125 @@ class ShowEvpnEthernetSegment(ShowEvpnEthernetSegmentSchema):
 
         # 0210.03ff.9e00.0210.0000 Gi0/3/0/0      10.1.100.100
         # 0210.03ff.9e00.0210.0000 BE4                                78.81.321.95<
-        p1 = re.compile(r'^(?P<segment_id>(\w+\.\w+\.\w+\.\w+\.\w+|N/A)) +(?P<interface>\S+) +(?P<next_hop>[\d\.\<]+)$')
+        p1 = regex_engine.compile(r'^(?P<segment_id>(\w+\.\w+\.\w+\.\w+\.\w+|N/A)) +(?P<interface>\S+) +(?P<next_hop>[\d\.\<]+)$')
 
         # 10.204.100.100
-        p1_1 = re.compile(r'^(?P<next_hop>[\d\.]+)$')
+        p1_1 = regex_engine.compile(r'^(?P<next_hop>[\d\.]+)$')
 
         # ES to BGP Gates   : Ready
-        p2 = re.compile(r'^ES +to +BGP +Gates +: +(?P<es_to_bgp_gates>\S+)$')
+        p2 = regex_engine.compile(r'^ES +to +BGP +Gates +: +(?P<es_to_bgp_gates>\S+)$')
 
         # ES to L2FIB Gates : Ready
-        p3 = re.compile(r'^ES +to +L2FIB +Gates +: +(?P<es_to_l2fib_gates>\S+)$')
+        p3 = regex_engine.compile(r'^ES +to +L2FIB +Gates +: +(?P<es_to_l2fib_gates>\S+)$')
 
         # Interface name : GigabitEthernet0/3/0/0
-        p4 = re.compile(r'^Interface name +: +(?P<interface>\S+)$')
+        p4 = regex_engine.compile(r'^Interface name +: +(?P<interface>\S+)$')
 
         # Interface MAC  : 008a.96ff.1d22
-        p4_1 = re.compile(r'^Interface +MAC *: +(?P<interface_mac>[\S ]+)$')
+        p4_1 = regex_engine.compile(r'^Interface +MAC *: +(?P<interface_mac>[\S ]+)$')
 
         # IfHandle       : 0x1800300
-        p5 = re.compile(r'^IfHandle +: +(?P<if_handle>\S+)$')
+        p5 = regex_engine.compile(r'^IfHandle +: +(?P<if_handle>\S+)$')
 
         # State          : Up
-        p6 = re.compile(r'^State + : +(?P<state>\S+)$')
+        p6 = regex_engine.compile(r'^State + : +(?P<state>\S+)$')
 
         # Redundancy     : Not Defined
-        p7 = re.compile(r'^Redundancy +: +(?P<redundancy>[\S ]+)$')
+        p7 = regex_engine.compile(r'^Redundancy +: +(?P<redundancy>[\S ]+)$')
 
         # Source MAC        : 0001.edff.9e9f (PBB BSA)
-        p8 = re.compile(r'^Source +MAC +: +(?P<source_mac>[\S ]+)$')
+        p8 = regex_engine.compile(r'^Source +MAC +: +(?P<source_mac>[\S ]+)$')
 
         # Operational    : MHN
         # Operational    : MH, All-active
-        p9 = re.compile(r'^Operational +: +(?P<operational>[\S+ ]+)$')
+        p9 = regex_engine.compile(r'^Operational +: +(?P<operational>[\S+ ]+)$')
 
         # Configured     : A/A per service (default)
-        p10 = re.compile(r'^Configured +: +(?P<configured>[\S ]+)$')
+        p10 = regex_engine.compile(r'^Configured +: +(?P<configured>[\S ]+)$')
 
         # Primary Services  : Auto-selection
-        p11 = re.compile(r'^Primary +Services +: +(?P<primary_services>\S+)$')
+        p11 = regex_engine.compile(r'^Primary +Services +: +(?P<primary_services>\S+)$')
 
         # Secondary Services: Auto-selection
-        p12 = re.compile(r'^Secondary +Services *: +(?P<secondary_services>\S+)$')
+        p12 = regex_engine.compile(r'^Secondary +Services *: +(?P<secondary_services>\S+)$')
 
         # Bridge ports   : 3
-        p13 = re.compile(r'^Bridge +ports +: +(?P<bridge_ports>\d+)$')
+        p13 = regex_engine.compile(r'^Bridge +ports +: +(?P<bridge_ports>\d+)$')
 
         # Elected        : 0
-        p14 = re.compile(r'^Elected +: +(?P<elected>\d+)$')
+        p14 = regex_engine.compile(r'^Elected +: +(?P<elected>\d+)$')
 
         # Not Elected    : 3
-        p15 = re.compile(r'^Not +Elected +: +(?P<not_elected>\d+)$')
+        p15 = regex_engine.compile(r'^Not +Elected +: +(?P<not_elected>\d+)$')
 
         # I-Sid E  :  1450101, 1650205, 1850309
-        p16 = re.compile(r'^I-Sid +E +: +(?P<i_sid_e>[\S ]+)$')
+        p16 = regex_engine.compile(r'^I-Sid +E +: +(?P<i_sid_e>[\S ]+)$')
 
         # I-Sid NE  :  1450101, 1650205, 1850309
-        p16_1 = re.compile(r'^I-Sid +NE +: +(?P<i_sid_ne>[\S ]+)$')
+        p16_1 = regex_engine.compile(r'^I-Sid +NE +: +(?P<i_sid_ne>[\S ]+)$')
 
         # MAC Flushing mode : STP-TCN
-        p17 = re.compile(r'^MAC +Flushing +mode +: +(?P<mac_flushing_mode>\S+)$')
+        p17 = regex_engine.compile(r'^MAC +Flushing +mode +: +(?P<mac_flushing_mode>\S+)$')
 
         # Peering timer     : 45 sec [not running]
-        p18 = re.compile(r'^Peering +timer +: +(?P<peering_timer>[\S ]+)$')
+        p18 = regex_engine.compile(r'^Peering +timer +: +(?P<peering_timer>[\S ]+)$')
 
         # Recovery timer    : 20 sec [not running]
-        p19 = re.compile(r'^Recovery +timer +: +(?P<recovery_timer>[\S ]+)$')
+        p19 = regex_engine.compile(r'^Recovery +timer +: +(?P<recovery_timer>[\S ]+)$')
 
         # Flushagain timer  : 60 sec
-        p20 = re.compile(r'^Flushagain +timer +: +(?P<flush_again_timer>[\S ]+)$')
+        p20 = regex_engine.compile(r'^Flushagain +timer +: +(?P<flush_again_timer>[\S ]+)$')
 
         # ESI type          : 0
-        p21 = re.compile(r'^ESI +type *: +(?P<esi_type>\S+)$')
+        p21 = regex_engine.compile(r'^ESI +type *: +(?P<esi_type>\S+)$')
 
         # Value          : 36.3700.00ff.0000.1100
-        p22 = re.compile(r'^Value *: +(?P<value>[\S ]+)$')
+        p22 = regex_engine.compile(r'^Value *: +(?P<value>[\S ]+)$')
 
         # ES Import RT      : 3637.00ff.0000 (from ESI)
-        p23 = re.compile(r'^ES +Import +RT *: +(?P<es_import_rt>[\S ]+)$')
+        p23 = regex_engine.compile(r'^ES +Import +RT *: +(?P<es_import_rt>[\S ]+)$')
 
         # Service Carving   : Auto-selection
-        p24 = re.compile(r'^Service +Carving *: +(?P<service_carving>[\S ]+)$')
+        p24 = regex_engine.compile(r'^Service +Carving *: +(?P<service_carving>[\S ]+)$')
 
         # Peering Details   : 10.36.3.36[MOD:P:00] 10.36.3.37[MOD:P:00]
-        p25 = re.compile(r'^Peering +Details *: +(?P<peering_details>[\S ]+)$')
+        p25 = regex_engine.compile(r'^Peering +Details *: +(?P<peering_details>[\S ]+)$')
 
         # Forwarders     : 1
-        p26 = re.compile(r'^Forwarders *: +(?P<forwarders>\d+)$')
+        p26 = regex_engine.compile(r'^Forwarders *: +(?P<forwarders>\d+)$')
 
         # Permanent      : 0
-        p27 = re.compile(r'^Permanent *: +(?P<permanent>\d+)$')
+        p27 = regex_engine.compile(r'^Permanent *: +(?P<permanent>\d+)$')
 
         # Carving timer     : 0 sec [not running]
-        p28 = re.compile(r'^Carving +timer *: +(?P<carving_timer>[\S ]+)$')
+        p28 = regex_engine.compile(r'^Carving +timer *: +(?P<carving_timer>[\S ]+)$')
 
         # Local SHG label   : 64005
         # Local SHG label   : None
-        p29 = re.compile(r'^Local +SHG +label *: +(?P<local_shg_label>\S+)$')
+        p29 = regex_engine.compile(r'^Local +SHG +label *: +(?P<local_shg_label>\S+)$')
 
         # Remote SHG labels : 1
-        p30 = re.compile(r'^Remote +SHG +labels? *: +(?P<remote_shg_label>\d+)$')
+        p30 = regex_engine.compile(r'^Remote +SHG +labels? *: +(?P<remote_shg_label>\d+)$')
 
         # 64005 : nexthop 10.36.3.37
-        p31 = re.compile(r'^(?P<shg_label>\d+) *: +nexthop +(?P<next_hop>\S+)$')
+        p31 = regex_engine.compile(r'^(?P<shg_label>\d+) *: +nexthop +(?P<next_hop>\S+)$')
 
         # Object: EVPN MAC
-        p32 = re.compile(r'^Object: +(?P<object_name>[\S ]+)$')
+        p32 = regex_engine.compile(r'^Object: +(?P<object_name>[\S ]+)$')
 
         # Base info: version=0xdbdb0008, flags=0x4000, type=8, reserved=0
-        p33 = re.compile(r'^Base info: +version=(?P<version>\S+), +flags=(?P<flags>\S+)'
-                         r', +type=(?P<type>\d+), +reserved=(?P<reserved>\d+)$')
+        p33 = regex_engine.compile(r'^Base info: +version=(?P<version>\S+), +flags=(?P<flags>\S+)'
+                                   r', +type=(?P<type>\d+), +reserved=(?P<reserved>\d+)$')
 
         # EVPN ES event history  [Num events: 0]
-        p34 = re.compile(r'^EVPN +ES +event +history +\[Num +events: +(?P<num_events>\d+)\]$')
+        p34 = regex_engine.compile(r'^EVPN +ES +event +history +\[Num +events: +(?P<num_events>\d+)\]$')
 
         # Jun 14 14:02:12.864 Create                        00000000, 00000000 -  -
         # Jun 14 14:02:12.864 MAC advertise rejected        00000003, 00000000 -  -
         # Aug 15 22:10:12.992 API Provision                 00000000 00000000 -  -
         # Aug 15 22:10:12.992 API BP Ifname delete          45138200 0aa6ab70 M  -
-        p35 = re.compile(r'^(?P<time>\w+ +\d+ +\S+) +(?P<event>[\S ]+) +(?P<flag_1>[\d\w]+)'
-                         r',? +(?P<flag_2>[\d\w]+) +(?P<code_1>\S+) +(?P<code_2>\S+)$')
+        p35 = regex_engine.compile(r'^(?P<time>\w+ +\d+ +\S+) +(?P<event>[\S ]+) +(?P<flag_1>[\d\w]+)'
+                                   r',? +(?P<flag_2>[\d\w]+) +(?P<code_1>\S+) +(?P<code_2>\S+)$')
 
         # EVPN ES Statistics
         # p36 = re.compile(r'^EVPN +ES +Statistics$')
@@ -1347,60 +1348,60 @@ class ShowEvpnEthernetSegment(ShowEvpnEthernetSegmentSchema):
         # RT|   1 27/08 09:49:15.582 00000000|   0                    00000000
         # LocalBMAC|   0                    00000000|   0                    00000000
         # ESI|   0                    00000000|   0                    00000000
-        p37 = re.compile(r'^(?P<label>[\S ]+)\| +(?P<adv_cnt>\d+)( +(?P<adv_last_time>\d+\/\d+ +\S+))?'
-                         r' +(?P<adv_last_arg>[\w\d]+)\|( +(?P<wdw_cnt>\d+))?( +(?P<wdw_last_time>\d+\/\d+ +\S+))?'
-                         r'( +(?P<wdw_last_arg>[\w\d]+))?$')
+        p37 = regex_engine.compile(r'^(?P<label>[\S ]+)\| +(?P<adv_cnt>\d+)( +(?P<adv_last_time>\d+\/\d+ +\S+))?'
+                                   r' +(?P<adv_last_arg>[\w\d]+)\|( +(?P<wdw_cnt>\d+))?( +(?P<wdw_last_time>\d+\/\d+ +\S+))?'
+                                   r'( +(?P<wdw_last_arg>[\w\d]+))?$')
 
         # Num RDs:       : 1
-        p38 = re.compile(r'^Num +RDs: *: +(?P<num_rds>\d+)$')
+        p38 = regex_engine.compile(r'^Num +RDs: *: +(?P<num_rds>\d+)$')
 
         # Diagnostic ESI : N/A                     Interface Name : N/A
         # Diagnostic Flag: 0x00000043              DiagnosticES-RT: 0000.0000.0000
         # Port Key       : 0x000088d4              MAC winner     : 1
-        p39 = re.compile(r'^(?P<label_1>[\S ]+): +(?P<val_1>\S+)( +\((?P<per_es_1>\w+)\))? +(?P<label_2>[\S ]+): +(?P<val_2>\S+)( +\((?P<per_es_2>\w+)\))?$')  # noqa
+        p39 = regex_engine.compile(r'^(?P<label_1>[\S ]+): +(?P<val_1>\S+)( +\((?P<per_es_1>\w+)\))? +(?P<label_2>[\S ]+): +(?P<val_2>\S+)( +\((?P<per_es_2>\w+)\))?$')  # noqa
 
         # Carving Timer  : 0    (global)
         # Number of EVIs : 1
-        p40 = re.compile(r'^(?P<label_1>[\S ]+): +(?P<val_1>\S+)( +\((?P<per_es_1>\w+)\))?$')
+        p40 = regex_engine.compile(r'^(?P<label_1>[\S ]+): +(?P<val_1>\S+)( +\((?P<per_es_1>\w+)\))?$')
 
         # RD: 10.154.219.84:1, Num RTs: 1      RT List:
-        p41 = re.compile(r'^RD: +(?P<rd>\S+), +Num +RTs: +(?P<num_rts>\d+) +RT +List:( +(?P<rt_list>\d+:\d+))?$')
+        p41 = regex_engine.compile(r'^RD: +(?P<rd>\S+), +Num +RTs: +(?P<num_rts>\d+) +RT +List:( +(?P<rt_list>\d+:\d+))?$')
 
         # 4:1000,
         # 00:1, 100:2, 100:3, 100:4, 100:5,
         # 100:6, 100:13, 100:14, 100:15, 100:16,
         # 100:17, 100:18,
-        p42 = re.compile(r'^(?P<rt_list>((\d+:\d+), ?)+)$')
+        p42 = regex_engine.compile(r'^(?P<rt_list>((\d+:\d+), ?)+)$')
 
         # Chkpt ObjId    : 0x40002f18
-        p43 = re.compile(r'^Chkpt +ObjId *: +(?P<chkpt_objid>\S+)$')
+        p43 = regex_engine.compile(r'^Chkpt +ObjId *: +(?P<chkpt_objid>\S+)$')
 
         # MSTi Mask      : 0x7fff
-        p44 = re.compile(r'^MSTi +Mask *: +(?P<msti_mask>\S+)$')
+        p44 = regex_engine.compile(r'^MSTi +Mask *: +(?P<msti_mask>\S+)$')
 
         # 192.168.0.1 [MOD:P:00][1]
-        p45 = re.compile(r'^(?P<nexthop>\d+\.\d+\.\d+\.\d+) +(?P<nexthopinfo>\[\S+\])$')
+        p45 = regex_engine.compile(r'^(?P<nexthop>\d+\.\d+\.\d+\.\d+) +(?P<nexthopinfo>\[\S+\])$')
 
         # IF Type      : 1
-        p46 = re.compile(r'^IF +Type *: +(?P<if_type>\d+)$')
+        p46 = regex_engine.compile(r'^IF +Type *: +(?P<if_type>\d+)$')
 
         # Peering Details   :
-        p47 = re.compile(r'^Peering +Details *:$')
+        p47 = regex_engine.compile(r'^Peering +Details *:$')
 
         # EVPN-VPWS Service Carving Results:
-        p48 = re.compile(r'^EVPN-VPWS +Service +Carving +Results:$')
+        p48 = regex_engine.compile(r'^EVPN-VPWS +Service +Carving +Results:$')
 
         # Primary        : 0
-        p49 = re.compile(r'^Primary +: +(?P<primary>\d+)$')
+        p49 = regex_engine.compile(r'^Primary +: +(?P<primary>\d+)$')
 
         # Backup         : 0
-        p50 = re.compile(r'^Backup +: +(?P<backup>\d+)$')
+        p50 = regex_engine.compile(r'^Backup +: +(?P<backup>\d+)$')
 
         # Non-DF         : 18
-        p51 = re.compile(r'^Non-DF +: +(?P<non_df>\d+)$')
+        p51 = regex_engine.compile(r'^Non-DF +: +(?P<non_df>\d+)$')
 
         # Checkpoint Info:
-        p52 = re.compile(r'^Checkpoint +Info:$')
+        p52 = regex_engine.compile(r'^Checkpoint +Info:$')
 
         interface_dict = {}
         for line in out.splitlines():
@@ -2024,12 +2025,12 @@ class ShowEvpnInternalLabel(ShowEvpnInternalLabelSchema):
 
         # 1000 0000.01ff.0506.0506.07aa 0 None
         # 1000 0000.01ff.0506.0506.07aa 200 24011
-        p1 = re.compile(r'^(?P<evi>\d+)( +(?P<encap>\S+))? +'
-                        r'(?P<ethernet_segment_id>[\w\.]+) +(?P<ether_tag>\S+) +(?P<label>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<evi>\d+)( +(?P<encap>\S+))? +'
+                                  r'(?P<ethernet_segment_id>[\w\.]+) +(?P<ether_tag>\S+) +(?P<label>\S+)$')
 
         # 0xffffffff (P) 192.168.0.3                              29213
-        p2 = re.compile(r'^(?P<tep_id>\S+) +(?P<df_role>\(\w\)) +'
-                        r'(?P<nexthop>\S+) +(?P<label>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<tep_id>\S+) +(?P<df_role>\(\w\)) +'
+                                  r'(?P<nexthop>\S+) +(?P<label>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2139,30 +2140,30 @@ class ShowEvpnEviInclusiveMulticast(ShowEvpnEviInclusiveMulticastSchema):
             out = output
 
         # 1          SRv6   0          1.1.1.1
-        p1 = re.compile(r'^(?P<vpn_id>\d+)\s+(?P<encap>\w+)\s+(?P<ethertag>\d+)'
-                        r'\s+(?P<originating_ip>[\da-fA-F:.]+)$')
+        p1 = regex_engine.compile(r'^(?P<vpn_id>\d+)\s+(?P<encap>\w+)\s+(?P<ethertag>\d+)'
+                                  r'\s+(?P<originating_ip>[\da-fA-F:.]+)$')
 
         #    TEPid  : 0xffffffff
-        p2 = re.compile(r'^TEPid *: +(?P<tepid>[\da-fA-F:x]+)$')
+        p2 = regex_engine.compile(r'^TEPid *: +(?P<tepid>[\da-fA-F:x]+)$')
 
         #  PMSI Type: 6
-        p3 = re.compile(r'^PMSI +Type *: +(?P<pmsi_type>\d)$')
+        p3 = regex_engine.compile(r'^PMSI +Type *: +(?P<pmsi_type>\d)$')
 
         #   Nexthop: ::
         #   Nexthop: 2.2.2.2
-        p4 = re.compile(r'^Nexthop *: +(?P<nexthop>[\da-fA-F:.]+)$')
+        p4 = regex_engine.compile(r'^Nexthop *: +(?P<nexthop>[\da-fA-F:.]+)$')
 
         #     SR-TE Info: N/A
-        p5 = re.compile(r'^SR-TE +Info *: +(?P<sr_te_info>\S+)$')
+        p5 = regex_engine.compile(r'^SR-TE +Info *: +(?P<sr_te_info>\S+)$')
 
         #  SID    : cafe:0:300:e001::
-        p6 = re.compile(r'^SID *: +(?P<sid>[\da-fA-F:]+)$')
+        p6 = regex_engine.compile(r'^SID *: +(?P<sid>[\da-fA-F:]+)$')
 
         # Source : Remote
-        p7 = re.compile(r'^Source *: +(?P<source>\w+)$')
+        p7 = regex_engine.compile(r'^Source *: +(?P<source>\w+)$')
 
         # E-Tree : Root
-        p8 = re.compile(r'^E-Tree *: +(?P<e_tree>\w+)$')
+        p8 = regex_engine.compile(r'^E-Tree *: +(?P<e_tree>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2334,37 +2335,37 @@ class ShowEvpnInternalId(ShowEvpnInternalIdSchema):
 
         # 2201       SRv6   0044.4444.4444.4444.4444    2201         ::ffff:10.0.7.63
         # 2201       SRv6   0044.4444.4444.4444.4444    4294967295   None
-        p1 = re.compile(r'^(?P<vpn_id>\d+)\s+(?P<encap>SRv6)\s+(?P<es_id>[\da-fA-F.]+) +'
-                        r'\s+(?P<ether_tag>\d+)\s+(?P<internal_id>[\da-fA-F:.]+|None)$')
+        p1 = regex_engine.compile(r'^(?P<vpn_id>\d+)\s+(?P<encap>SRv6)\s+(?P<es_id>[\da-fA-F.]+) +'
+                                  r'\s+(?P<ether_tag>\d+)\s+(?P<internal_id>[\da-fA-F:.]+|None)$')
 
         #   Multi-paths resolved: TRUE (Remote single-active)
-        p2 = re.compile(r'^Multi-paths\s+resolved:\s+(?P<mp_resolved>TRUE|FALSE)'
-                        r'(\s+\((?P<mp_info>.*?)\))?$')
+        p2 = regex_engine.compile(r'^Multi-paths\s+resolved:\s+(?P<mp_resolved>TRUE|FALSE)'
+                                  r'(\s+\((?P<mp_info>.*?)\))?$')
 
         #     Reason: No valid MAC paths
-        p3 = re.compile(r'^Reason:\s+(?P<reason>.*)$')
+        p3 = regex_engine.compile(r'^Reason:\s+(?P<reason>.*)$')
 
         #   Multi-paths Internal ID: ::ffff:10.0.7.63
-        p4 = re.compile(r'^Multi-paths\s+Internal\s+ID:\s+(?P<mp_iid>[\da-fA-F:.]+|None)$')
+        p4 = regex_engine.compile(r'^Multi-paths\s+Internal\s+ID:\s+(?P<mp_iid>[\da-fA-F:.]+|None)$')
 
         #     MAC         3.3.3.3                                   cafe:0:300:e000::
         #     EAD/ES  (P) 3.3.3.3
         #     EAD/EVI     3.3.3.3                                   cafe:0:300:e000::
-        p5 = re.compile(r'^(?P<type>(?:MAC|EAD\/ES|EAD\/EVI)) +'
-                        r'(?:\s+\((?P<df_role>\w+)\))?\s+(?P<nexthop>[\d\w.:]+)(?:\s+(?P<sid>[\da-fA-F:]+))?$')
+        p5 = regex_engine.compile(r'^(?P<type>(?:MAC|EAD\/ES|EAD\/EVI)) +'
+                                  r'(?:\s+\((?P<df_role>\w+)\))?\s+(?P<nexthop>[\d\w.:]+)(?:\s+(?P<sid>[\da-fA-F:]+))?$')
 
         #            (B) 4.4.4.4
         #                4.4.4.4                                   cafe:0:400:e000::
-        p6 = re.compile(r'^(?:\((?P<df_role>\w+)\)\s+)?(?P<nexthop>[\d\w.:]+)'
-                        r'(?:\s+(?P<sid>[\da-fA-F:]+))?$')
+        p6 = regex_engine.compile(r'^(?:\((?P<df_role>\w+)\)\s+)?(?P<nexthop>[\d\w.:]+)'
+                                  r'(?:\s+(?P<sid>[\da-fA-F:]+))?$')
 
         # Summary pathlist:
-        p7 = re.compile(r'^Summary\s+pathlist:$')
+        p7 = regex_engine.compile(r'^Summary\s+pathlist:$')
 
         #  0x05000003 (P) 3.3.3.3                                   cafe:0:300:e000::
         #  0x00000000 (B) 4.4.4.4                                   cafe:0:400:e000::
-        p8 = re.compile(r'^(?P<tep_id>[\da-fA-Fx]+)(?:\s+\((?P<df_role>\w+)\))?'
-                        r'\s+(?P<nexthop>[\d\w.:]+)\s+(?P<sid>([\da-fA-F:]+))$')
+        p8 = regex_engine.compile(r'^(?P<tep_id>[\da-fA-Fx]+)(?:\s+\((?P<df_role>\w+)\))?'
+                                  r'\s+(?P<nexthop>[\d\w.:]+)\s+(?P<sid>([\da-fA-F:]+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2516,20 +2517,20 @@ class ShowEvpnGroup(ShowEvpnGroupSchema):
         else:
             out = output
         # EVPN Group: 1
-        p1 = re.compile(r'^EVPN +Group *: +(?P<group_id>\d+)$')
+        p1 = regex_engine.compile(r'^EVPN +Group *: +(?P<group_id>\d+)$')
 
         # state: Ready
-        p2 = re.compile(r'^state *: +(?P<state>[a-zA-Z]+)$')
+        p2 = regex_engine.compile(r'^state *: +(?P<state>[a-zA-Z]+)$')
 
         #  Core Interfaces:
-        p3 = re.compile(r'^Core +Interfaces *:$')
+        p3 = regex_engine.compile(r'^Core +Interfaces *:$')
 
         #   Access Interfaces:
-        p4 = re.compile(r'^Access +Interfaces *:$')
+        p4 = regex_engine.compile(r'^Access +Interfaces *:$')
 
         # Bundle-Ether2: up
         # TenGigE0/1/0/6/1: up
-        p5 = re.compile(r'^(?P<intf>[\w\-\/]+) *: +(?P<state>[a-zA-Z]+)$')
+        p5 = regex_engine.compile(r'^(?P<intf>[\w\-\/]+) *: +(?P<state>[a-zA-Z]+)$')
 
         for line in out.splitlines():
             line = line.strip()
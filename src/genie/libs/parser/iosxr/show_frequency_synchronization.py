@@ -7,10 +7,8 @@ IOSXR parsers for the following commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
@@ -91,58 +89,58 @@ class ShowFrequencySynchronizationInterfaces(ShowFrequencySynchronizationInterfa
 
         # Interface GigabitEthernet0/0/0/16 (up)
         # Interface TenGigE0/0/2/0 (shutdown)
-        p1 = re.compile(r'^Interface\s+(?P<interface>\S+)\s+\((?P<interface_status>(up|shutdown|down))\)$')
+        p1 = regex_engine.compile(r'^Interface\s+(?P<interface>\S+)\s+\((?P<interface_status>(up|shutdown|down))\)$')
 
         # Assigned as input for selection
-        p2 = re.compile(r'^Assigned\s+as\s+(?P<selection>\w+)\s+for\s+selection$')
+        p2 = regex_engine.compile(r'^Assigned\s+as\s+(?P<selection>\w+)\s+for\s+selection$')
 
         # Wait-to-restore time 0 minutes
-        p3 = re.compile(r'^Wait-to-restore\s+time\s+(?P<wait_to_restore_time>\d+)\s+minutes$')
+        p3 = regex_engine.compile(r'^Wait-to-restore\s+time\s+(?P<wait_to_restore_time>\d+)\s+minutes$')
 
         # SSM Enabled
         # SSM Disabled
-        p4 = re.compile(r'^SSM\s+(?P<ssm_status>[Enabled|Disabled]+)$')
+        p4 = regex_engine.compile(r'^SSM\s+(?P<ssm_status>[Enabled|Disabled]+)$')
 
         # Sent:          97832        97830         2          0
-        p5 = re.compile(r'^Sent+:\s+(?P<total>\d+)\s+(?P<information>\d+)\s+(?P<event>\d+)\s+(?P<dnu_dus>\d+)$')
+        p5 = regex_engine.compile(r'^Sent+:\s+(?P<total>\d+)\s+(?P<information>\d+)\s+(?P<event>\d+)\s+(?P<dnu_dus>\d+)$')
 
         # Received:      97831        97830         1          0
-        p6 = re.compile(r'^Received+:\s+(?P<total>\d+)\s+(?P<information>\d+)\s+(?P<event>\d+)\s+(?P<dnu_dus>\d+)$')
+        p6 = regex_engine.compile(r'^Received+:\s+(?P<total>\d+)\s+(?P<information>\d+)\s+(?P<event>\d+)\s+(?P<dnu_dus>\d+)$')
 
         # Up
         # Down
-        p7 = re.compile(r'^(?P<input>[Up|Down]+)$')
+        p7 = regex_engine.compile(r'^(?P<input>[Up|Down]+)$')
 
         # Down - not assigned for selection
-        p8 = re.compile(r'^(?P<input>[Up|Down]+)\s+-\s+(?P<selection>[\w\s]+)\s+for\s+selection$')
+        p8 = regex_engine.compile(r'^(?P<input>[Up|Down]+)\s+-\s+(?P<selection>[\w\s]+)\s+for\s+selection$')
 
         # Last received QL: Failed
         # Last received QL: Opt-I/PRC
-        p9 = re.compile(r'^Last\s+received\s+QL:\s(?P<last_received_ql>.*)$')
+        p9 = regex_engine.compile(r'^Last\s+received\s+QL:\s(?P<last_received_ql>.*)$')
 
         # Effective QL: Opt-I/PRC, Priority: 15, Time-of-day Priority 101
         # Effective QL: Failed, Priority: 15, Time-of-day Priority 101
-        p10 = re.compile(r'^Effective\s+QL:\s+(?P<effective_ql>.*),\s+Priority:\s+(?P<priority>\d+),'
-                         r'\s+Time-of-day\s+Priority\s+(?P<time_of_day_priority>\d+)$')
+        p10 = regex_engine.compile(r'^Effective\s+QL:\s+(?P<effective_ql>.*),\s+Priority:\s+(?P<priority>\d+),'
+                                   r'\s+Time-of-day\s+Priority\s+(?P<time_of_day_priority>\d+)$')
 
         # Restore in 00:04:33
-        p11 = re.compile(r'^Restore\s+in\s+(?P<restore>[\d:]+)$')
+        p11 = regex_engine.compile(r'^Restore\s+in\s+(?P<restore>[\d:]+)$')
 
         # Selected source: TenGigE0/0/2/1
-        p12 = re.compile(r'^Selected\s+source:\s+(?P<selected_source>.*)$')
+        p12 = regex_engine.compile(r'^Selected\s+source:\s+(?P<selected_source>.*)$')
 
         # Selected source QL: Opt-I/PRC
-        p13 = re.compile(r'^Selected\s+source\s+QL:\s+(?P<selected_source_ql>\S+)$')
+        p13 = regex_engine.compile(r'^Selected\s+source\s+QL:\s+(?P<selected_source_ql>\S+)$')
 
         # Effective QL: Opt-I/PRC
-        p14 = re.compile(r'^Effective\s+QL:\s+(?P<effective_ql>\S+)$')
+        p14 = regex_engine.compile(r'^Effective\s+QL:\s+(?P<effective_ql>\S+)$')
 
         # Next selection points: SPA_RX_0
-        p15 = re.compile(r'^Next\s+selection\s+points:\s+(?P<next_selection_points>.*)$')
+        p15 = regex_engine.compile(r'^Next\s+selection\s+points:\s+(?P<next_selection_points>.*)$')
 
         # Peer Up for 1d02h, last SSM received 0.837s ago
         # p16 = re.compile(r'^Peer\s+Up\s+for\s+(?P<peer_up_time>\w+),\s+last\s+SSM\s+received\s+(?P<last_ssm_received>[\w.]+)\s+ago$')
-        p16 = re.compile(r'^Peer\s+[Up|Timed Out]+\s+for\s+(?P<peer_time>\w+),\s+last\s+SSM\s+received\s+(?P<last_ssm_received>[\w .]+)')
+        p16 = regex_engine.compile(r'^Peer\s+[Up|Timed Out]+\s+for\s+(?P<peer_time>\w+),\s+last\s+SSM\s+received\s+(?P<last_ssm_received>[\w .]+)')
 
         for line in output.splitlines():
             line = line.strip() # strip whitespace from beginning and end
@@ -323,7 +321,7 @@ class ShowFrequencySynchronizationInterfacesBrief(ShowFrequencySynchronizationIn
         #==== ======================== ===== ===== === ===== ========================
         #>S   TenGigE0/0/0/1/0         PRC   PRC   100 PRC   Internal0 [0/RP0/CPU0]  
         #>S   TenGigE0/0/0/1/1         PRC   PRC   100 PRC   Internal0 [0/RP0/CPU0]  
-        p1 = re.compile(r'^(?P<flag>\S+)\s+(?P<interface>\S+)\s+(?P<qlrcv>\S+)\s+(?P<qluse>\S+)\s+(?P<priority>\S+)\s+(?P<qlsnd>\S+)\s+(?P<output_driven_by>.+\s+(\[.+?\]))')
+        p1 = regex_engine.compile(r'^(?P<flag>\S+)\s+(?P<interface>\S+)\s+(?P<qlrcv>\S+)\s+(?P<qluse>\S+)\s+(?P<priority>\S+)\s+(?P<qlsnd>\S+)\s+(?P<output_driven_by>.+\s+(\[.+?\]))')
  
         for line in output.splitlines():
             line = line.strip()
@@ -7,12 +7,10 @@ IOSXR parsers for show commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ======================================
@@ -70,41 +68,41 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
         ipv6_set = False
 
         # ALL            2      0     2         0      0     0
-        p1 = re.compile(r'(?P<state_name>[a-zA-Z]+)'
-                        r' +(?P<v4_sessions>\d+) +(?P<v4_slaves>\d+)'
-                        r' +(?P<v4_total>\d+) +(?P<v6_sessions>\d+)'
-                        r' +(?P<v6_slaves>\d+) +(?P<v6_total>\d+)$')
+        p1 = regex_engine.compile(r'(?P<state_name>[a-zA-Z]+)'
+                                  r' +(?P<v4_sessions>\d+) +(?P<v4_slaves>\d+)'
+                                  r' +(?P<v4_total>\d+) +(?P<v6_sessions>\d+)'
+                                  r' +(?P<v6_slaves>\d+) +(?P<v6_total>\d+)$')
         
         # 2    HSRP IPv4 interfaces    (1    up, 1    down)
-        p2 = re.compile(r'(?P<num_intf>\d+) +HSRP +IPv4 +interfaces'
-                        r' +\(+(?P<intf_up>\d+) +up,'
-                        r' +(?P<intf_down>\d+) +down\)$')
+        p2 = regex_engine.compile(r'(?P<num_intf>\d+) +HSRP +IPv4 +interfaces'
+                                  r' +\(+(?P<intf_up>\d+) +up,'
+                                  r' +(?P<intf_down>\d+) +down\)$')
 
         # 0    HSRP IPv6 interfaces    (0    up, 0    down)
-        p3 = re.compile(r'(?P<num_intf>\d+) +HSRP +IPv6 +interfaces'
-                        r' +\(+(?P<intf_up>\d+) +up,'
-                        r' +(?P<intf_down>\d+) +down\)$')
+        p3 = regex_engine.compile(r'(?P<num_intf>\d+) +HSRP +IPv6 +interfaces'
+                                  r' +\(+(?P<intf_up>\d+) +up,'
+                                  r' +(?P<intf_down>\d+) +down\)$')
 
         # 2    Virtual IPv4 addresses  (1    active, 1    inactive)
-        p4 = re.compile(r'(?P<num_addresses>\d+) +Virtual +IPv4'
-                        r' +addresses +\((?P<active>\d+) +active,'
-                        r' +(?P<inactive>\d+) +inactive\)$')
+        p4 = regex_engine.compile(r'(?P<num_addresses>\d+) +Virtual +IPv4'
+                                  r' +addresses +\((?P<active>\d+) +active,'
+                                  r' +(?P<inactive>\d+) +inactive\)$')
 
         # 0    Virtual IPv6 addresses  (0    active, 0    inactive)
-        p5 = re.compile(r'(?P<num_addresses>\d+) +Virtual +IPv6'
-                        r' +addresses +\((?P<active>\d+) +active,'
-                        r' +(?P<inactive>\d+) +inactive\)$')
+        p5 = regex_engine.compile(r'(?P<num_addresses>\d+) +Virtual +IPv6'
+                                  r' +addresses +\((?P<active>\d+) +active,'
+                                  r' +(?P<inactive>\d+) +inactive\)$')
 
         # 3    Tracked Objects    (1    up, 2    down)
-        p6 = re.compile(r'\s*(?P<num_tracked_objects>\d+) +Tracked'
-                        r' +Objects +\((?P<tracked_objects_up>\d+) +up,'
-                        r' +(?P<tracked_objects_down>\d+) +down\)$')
+        p6 = regex_engine.compile(r'\s*(?P<num_tracked_objects>\d+) +Tracked'
+                                  r' +Objects +\((?P<tracked_objects_up>\d+) +up,'
+                                  r' +(?P<tracked_objects_down>\d+) +down\)$')
 
         # 0    BFD sessions       (0    up, 0    down, 0    inactive)
-        p7 = re.compile(r'\s*(?P<num_bfd_sessions>\d+) +BFD +sessions'
-                        r' +\((?P<bfd_sessions_up>\d+) +up,'
-                        r' +(?P<bfd_sessions_down>\d+) +down,'
-                        r' +(?P<bfd_sessions_inactive>\d+) +inactive\)$')
+        p7 = regex_engine.compile(r'\s*(?P<num_bfd_sessions>\d+) +BFD +sessions'
+                                  r' +\((?P<bfd_sessions_up>\d+) +up,'
+                                  r' +(?P<bfd_sessions_down>\d+) +down,'
+                                  r' +(?P<bfd_sessions_inactive>\d+) +inactive\)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -426,120 +424,120 @@ class ShowHsrpDetail(ShowHsrpDetailSchema):
         
         # GigabitEthernet0/0/0/1 - IPv4 Group 5 (version 1)
         # Bundle-Ether4.1296 - IPv4 Group 1296 (version 2)
-        p1 = re.compile(r'(?P<interface>[\w\/\.-]+)'
-                        r' +\- +(?P<address_family>\w+)'
-                        r' +Group +(?P<group_number>\d+)'
-                        r' +\(version +(?P<version>\d+)\)$')
+        p1 = regex_engine.compile(r'(?P<interface>[\w\/\.-]+)'
+                                  r' +\- +(?P<address_family>\w+)'
+                                  r' +Group +(?P<group_number>\d+)'
+                                  r' +\(version +(?P<version>\d+)\)$')
 
         # Label group10 (1 slaves)
-        p2 = re.compile(r'[lL]abel +(?P<session_name>\S+) +'
-                        r'\((?P<num_of_slaves>\d+) slaves\)')
+        p2 = regex_engine.compile(r'[lL]abel +(?P<session_name>\S+) +'
+                                  r'\((?P<num_of_slaves>\d+) slaves\)')
 
         # Slave to group10
-        p3 = re.compile(r'[sS]lave +to +(?P<follow>\S+)$')
+        p3 = regex_engine.compile(r'[sS]lave +to +(?P<follow>\S+)$')
 
         # Local state is Active, priority 110, may preempt
         # Local state is Init, priority 100, use bia
         # Local state is Init, priority 100, may preempt, use bia
         # Local state is Init
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'Local +state +is +(?P<hsrp_router_state>[a-zA-Z]+)'
             r'(, +priority +(?P<priority>\d+))?'
             r'(?P<preempt>, may preempt)?(?P<use_bia>, use bia)?$')
 
         # Preemption delay for at least 10 secs
-        p5 = re.compile(r'Preemption +delay +for +at +least'
-                        r' +(?P<preempt_delay>\d+) +secs$')
+        p5 = regex_engine.compile(r'Preemption +delay +for +at +least'
+                                  r' +(?P<preempt_delay>\d+) +secs$')
                     
         # Hellotime 1000 msec holdtime 3000 msec
-        p6 = re.compile(r'Hellotime +(?P<hello_msec>\d+) +msec'
-                        r' +holdtime +(?P<hold_msec>\d+) +msec$')
+        p6 = regex_engine.compile(r'Hellotime +(?P<hello_msec>\d+) +msec'
+                                  r' +holdtime +(?P<hold_msec>\d+) +msec$')
 
         # Configured hellotime 1000 msec holdtime 3000 msec
-        p7 = re.compile(r'Configured +hellotime'
-                        r' +(?P<cfgd_hello_msec>\d+) msec +holdtime'
-                        r' +(?P<cfgd_hold_msec>\d+) +msec$')
+        p7 = regex_engine.compile(r'Configured +hellotime'
+                                  r' +(?P<cfgd_hello_msec>\d+) msec +holdtime'
+                                  r' +(?P<cfgd_hold_msec>\d+) +msec$')
 
         # Minimum delay 5 sec, reload delay 10 sec
-        p8 = re.compile(r'Minimum +delay +(?P<minimum_delay>\d+) +sec, +'
-                        r'reload +delay +(?P<reload_delay>\d+) +sec$')
+        p8 = regex_engine.compile(r'Minimum +delay +(?P<minimum_delay>\d+) +sec, +'
+                                  r'reload +delay +(?P<reload_delay>\d+) +sec$')
 
         # BFD enabled (GigabitEthernet0/0/0/1, 10.1.1.1): state inactive, interval 15 ms multiplier 3
         # BFD enabled (Unknown, 0.0.0.0): state inactive, interval 0 ms multiplier 0
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'BFD enabled \((?P<bfd_interface_name>\S+), (?P<bfd_address>\S+)\)'
             r': state (?P<bfd_state>\S+), interval (?P<bfd_interval>\d+) ms '
             r'multiplier (?P<bfd_detection_multiplier>\d+)$')
 
         # Hot standby IP address is 192.168.1.254 configured
         # Hot standby IP address is fe80::205:73ff:fea0:1 configured
-        p10 = re.compile(r'Hot +standby +IP +address +is'
-                         r' +(?P<vip>[\w\:\.]+) +configured$')
+        p10 = regex_engine.compile(r'Hot +standby +IP +address +is'
+                                   r' +(?P<vip>[\w\:\.]+) +configured$')
 
         # Active router is 
         # Active router is 192.168.1.2 expires in 00:00:02
         # Active router is 192.168.1.2, priority 90 expires in 00:00:02
-        p11 = re.compile(r'Active +router +is +(?P<active_router>([\w\:\.]+)'
-                         r'(, *[\w\.\:]+)?)(, *priority (?P<priority>\d+))?'
-                         r'( *(expired|expires +in +(?P<expire>[\w\:\.]+)))?$')
+        p11 = regex_engine.compile(r'Active +router +is +(?P<active_router>([\w\:\.]+)'
+                                   r'(, *[\w\.\:]+)?)(, *priority (?P<priority>\d+))?'
+                                   r'( *(expired|expires +in +(?P<expire>[\w\:\.]+)))?$')
 
         # Standby router is unknown expired
         # Standby router is 192.168.1.2 expires in 00:00:02
         # Standby router is fe80::5000:1cff:feff:a0b, 5200.1cff.0a0b expires in 00:00:02
-        p12 = re.compile(r'Standby +router +is +(?P<standby_router>([\w\:\.]+)'
-                         r'(, *[\w\.\:]+)?)( *(expired|expires +in +(?P<expire>'
-                         r'[\w\:\.]+)))?$')
+        p12 = regex_engine.compile(r'Standby +router +is +(?P<standby_router>([\w\:\.]+)'
+                                   r'(, *[\w\.\:]+)?)( *(expired|expires +in +(?P<expire>'
+                                   r'[\w\:\.]+)))?$')
 
         # Standby virtual mac address is 0000.0cff.b30c, state is active
         # Standby virtual mac address is 549f.c66e.9aa3 configured, state is active
-        p13 = re.compile(r'Standby +virtual +mac +address +is'
-                         r' +(?P<virtual_mac_address>[\w\.]+)( configured)?,'
-                         r' +state +is +(?P<standby_state>[a-zA-Z ]+)$')
+        p13 = regex_engine.compile(r'Standby +virtual +mac +address +is'
+                                   r' +(?P<virtual_mac_address>[\w\.]+)( configured)?,'
+                                   r' +state +is +(?P<standby_state>[a-zA-Z ]+)$')
 
         # Authentication text, string "cisco123"
-        p14 = re.compile(r'Authentication +text, +string'
-                         r' +\"(?P<authentication>\w+)\"$')
+        p14 = regex_engine.compile(r'Authentication +text, +string'
+                                   r' +\"(?P<authentication>\w+)\"$')
 
         # 4 state changes, last state change 2d03h
         # 2 state changes, last state change 01:18:43
-        p15 = re.compile(r'(?P<num_state_changes>\d+) +state'
-                         r' +changes, +last +state +change'
-                         r' +(?P<last_state_change>[\w\:\.]+)$')
+        p15 = regex_engine.compile(r'(?P<num_state_changes>\d+) +state'
+                                   r' +changes, +last +state +change'
+                                   r' +(?P<last_state_change>[\w\:\.]+)$')
 
         # Standby ICMP redirects disabled
-        p16 = re.compile(r'Standby ICMP redirects disabled')
+        p16 = regex_engine.compile(r'Standby ICMP redirects disabled')
 
         # Last coup sent:       Never
         # Last coup sent:       Aug 11 08:26:25.272 UTC
-        p17 = re.compile(r'Last +coup +sent: +(?P<last_coup_sent>[\w\s\:\.]+)$')
+        p17 = regex_engine.compile(r'Last +coup +sent: +(?P<last_coup_sent>[\w\s\:\.]+)$')
 
         # Last coup received:   Never
-        p18 = re.compile(r'Last +coup +received:'
-                         r' +(?P<last_coup_received>[\w\s\:\.]+)$')
+        p18 = regex_engine.compile(r'Last +coup +received:'
+                                   r' +(?P<last_coup_received>[\w\s\:\.]+)$')
 
         # Last resign sent:     Never
-        p19 = re.compile(r'Last +resign +sent:'
-                         r' +(?P<last_resign_sent>[\w\s\:\.]+)$')
+        p19 = regex_engine.compile(r'Last +resign +sent:'
+                                   r' +(?P<last_resign_sent>[\w\s\:\.]+)$')
 
         # Last resign received: Never
         # Last resign received: Aug 11 08:26:25.272 UTC
-        p20 = re.compile(r'Last +resign +received:'
-                         r' +(?P<last_resign_received>[\w\s\:\.]+)$')
+        p20 = regex_engine.compile(r'Last +resign +received:'
+                                   r' +(?P<last_resign_received>[\w\s\:\.]+)$')
 
         # Tracking states for 1 object, 1 up:
         # Tracking states for 2 objects, 1 up:
-        p21 = re.compile(r'Tracking +states +for'
-                         r' +(?P<num_tracked_objects>\d+) +objects?,'
-                         r' +(?P<num_tracked_objects_up>\d+) up:$')
+        p21 = regex_engine.compile(r'Tracking +states +for'
+                                   r' +(?P<num_tracked_objects>\d+) +objects?,'
+                                   r' +(?P<num_tracked_objects_up>\d+) up:$')
 
         # Up   banana               Priority decrement: 20
         # Down   apple               Priority decrement: 50
         # Up   GigabitEthernet0/0/0/1 Priority decrement: 123
-        p22 = re.compile(r'(?P<tracked_status>\S+) +'
-                         r'((?P<tracked_object>\w+)|'
-                         r'(?P<tracked_interface>[\w\/\.\-]+)) +'
-                         r'Priority +decrement: +'
-                         r'(?P<tracked_object_priority_decrement>\d+)$')
+        p22 = regex_engine.compile(r'(?P<tracked_status>\S+) +'
+                                   r'((?P<tracked_object>\w+)|'
+                                   r'(?P<tracked_interface>[\w\/\.\-]+)) +'
+                                   r'Priority +decrement: +'
+                                   r'(?P<tracked_object_priority_decrement>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -941,10 +939,10 @@ class ShowHsrpBfd(ShowHsrpBfdSchema):
         # BFD Interface    Destination IP  State    Intv Mult HSRP Interface   Grp 
         # -------------    --------------  -----    ---- ---- --------------   ----
         # Gi0/0/0/5        10.1.1.3          up     15    3 Gi0/0/0/5           1
-        r1 = re.compile(r'(?P<interface>\S+) +(?P<dest_address>\S+)'
-                        r' +(?P<state>\S+) +(?P<interval>\d+)'                    
-                        r' +(?P<multiplier>\d+)'
-                        r' +(?P<hsrp_intf>\S+) +(?P<group>\S+)$')
+        r1 = regex_engine.compile(r'(?P<interface>\S+) +(?P<dest_address>\S+)'
+                                  r' +(?P<state>\S+) +(?P<interval>\d+)'                    
+                                  r' +(?P<multiplier>\d+)'
+                                  r' +(?P<hsrp_intf>\S+) +(?P<group>\S+)$')
      
         parsed_dict = {} 
 			
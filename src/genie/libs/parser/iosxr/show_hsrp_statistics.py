@@ -7,12 +7,10 @@ IOSXR parsers for the following show commands:
     * show hsrp status
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowHsrpStatisticsSchema(MetaParser):
@@ -85,78 +83,78 @@ class ShowHsrpStatistics(ShowHsrpStatisticsSchema):
             out = output
  
         # Protocol:
-        r1 = re.compile(r'(?P<protocol>Protocol):')
+        r1 = regex_engine.compile(r'(?P<protocol>Protocol):')
 
         # Transitions to Active 2
-        r2 = re.compile(r'Transitions +to +Active: +(?P<active>\d+)')
+        r2 = regex_engine.compile(r'Transitions +to +Active: +(?P<active>\d+)')
 
         # Transitions to Standby 2
-        r3 = re.compile(r'Transitions +to +Standby: +(?P<standby>\d+)')
+        r3 = regex_engine.compile(r'Transitions +to +Standby: +(?P<standby>\d+)')
 
         # Transitions to Speak 0
-        r4 = re.compile(r'Transitions +to +Speak: +(?P<speak>\d+)')
+        r4 = regex_engine.compile(r'Transitions +to +Speak: +(?P<speak>\d+)')
 
         # Transitions to Listen 2
-        r5 = re.compile(r'Transitions +to +Listen: +(?P<listen>\d+)')
+        r5 = regex_engine.compile(r'Transitions +to +Listen: +(?P<listen>\d+)')
 
 
         # Transitions to Learn 0
-        r6 = re.compile(r'Transitions +to +Learn: +(?P<learn>\d+)')
+        r6 = regex_engine.compile(r'Transitions +to +Learn: +(?P<learn>\d+)')
 
         # Transitions to Init 0
-        r7 = re.compile(r'Transitions +to\s+Init: +(?P<init>\d+)')
+        r7 = regex_engine.compile(r'Transitions +to\s+Init: +(?P<init>\d+)')
 
         # Packets Sent: 12
-        r8 = re.compile(r'(?P<packets_sent>Packets Sent): +(?P<total_sent>\d+)')
+        r8 = regex_engine.compile(r'(?P<packets_sent>Packets Sent): +(?P<total_sent>\d+)')
 
         # Hello: 7
-        r9 = re.compile(r'Hello: +(?P<hello>\d+)')
+        r9 = regex_engine.compile(r'Hello: +(?P<hello>\d+)')
 
         # Resign: 0 
-        r10 = re.compile(r'Resign: +(?P<resign>\d+)')
+        r10 = regex_engine.compile(r'Resign: +(?P<resign>\d+)')
 
         # Coup: 2
-        r11 = re.compile(r'Coup: +(?P<coup>\d+)')
+        r11 = regex_engine.compile(r'Coup: +(?P<coup>\d+)')
 
         # Adver: 3 
-        r12 = re.compile(r'Adver: +(?P<adver>\d+)')
+        r12 = regex_engine.compile(r'Adver: +(?P<adver>\d+)')
 
         # Valid Packets Received: 13
-        r13 = re.compile(r'Valid Packets Received: +(?P<total_received>\d+)') 
+        r13 = regex_engine.compile(r'Valid Packets Received: +(?P<total_received>\d+)') 
    
         # Invalid Packets Received: 0
-        r14 = re.compile(r'(?P<invalid_packets_received>Invalid Packets Received:)'
-                        r' +(?P<total_invalid_received>\d+)')
+        r14 = regex_engine.compile(r'(?P<invalid_packets_received>Invalid Packets Received:)'
+                                  r' +(?P<total_invalid_received>\d+)')
         # Too long: 0
-        r15 = re.compile(r'Too long: +(?P<too_long>\d+)')
+        r15 = regex_engine.compile(r'Too long: +(?P<too_long>\d+)')
 
         # Too short: 0 
-        r16 = re.compile(r'Too short: +(?P<too_short>\d+)')
+        r16 = regex_engine.compile(r'Too short: +(?P<too_short>\d+)')
 
         # Mismatching/unsupported versions: 0
-        r17 = re.compile(r'Mismatching\/unsupported versions:'
-                        r' +(?P<mismatching_unsupported_versions>\d+)')
+        r17 = regex_engine.compile(r'Mismatching\/unsupported versions:'
+                                  r' +(?P<mismatching_unsupported_versions>\d+)')
 
         # Invalid opcode: 0
-        r18 = re.compile(r'Invalid opcode: +(?P<invalid_opcode>\d+)') 
+        r18 = regex_engine.compile(r'Invalid opcode: +(?P<invalid_opcode>\d+)') 
 
         # Unknown group: 0
-        r19 = re.compile(r'Unknown group: +(?P<unknown_group>\d+)')
+        r19 = regex_engine.compile(r'Unknown group: +(?P<unknown_group>\d+)')
 
         # Inoperational group: 0
-        r20 = re.compile(r'Inoperational group: +(?P<inoperational_group>\d+)') 
+        r20 = regex_engine.compile(r'Inoperational group: +(?P<inoperational_group>\d+)') 
 
         # Conflicting Source IP: 0
-        r21 = re.compile(r'Conflicting Source IP: +(?P<conflicting_source_ip>\d+)') 
+        r21 = regex_engine.compile(r'Conflicting Source IP: +(?P<conflicting_source_ip>\d+)') 
 
         # Failed Authentication: 2
-        r22 = re.compile(r'Failed Authentication: +(?P<failed_authentication>\d+)') 
+        r22 = regex_engine.compile(r'Failed Authentication: +(?P<failed_authentication>\d+)') 
 
         # Invalid Hello Time: 0
-        r23 = re.compile(r'Invalid Hello Time: +(?P<invalid_hello_time>\d+)')
+        r23 = regex_engine.compile(r'Invalid Hello Time: +(?P<invalid_hello_time>\d+)')
 
         # Mismatching Virtual IP: 0
-        r24 = re.compile(r'Mismatching Virtual IP: +(?P<mismatching_virtual_ip>\d+)')
+        r24 = regex_engine.compile(r'Mismatching Virtual IP: +(?P<mismatching_virtual_ip>\d+)')
 
         parsed_dict = {} 
         vrf = 'default' 
@@ -375,28 +373,28 @@ class ShowHsrpStatus(ShowHsrpStatusSchema):
             output = self.device.execute(self.cli_command)
 
         # Sun Mar 27 20:41:21.974 UTC
-        r1 = re.compile(r'(?P<clock_time>\S{3}\s+\S{3}\s+\d+\s+\d+\:\d+\:\d+\.\d+\s+\S+)$')
+        r1 = regex_engine.compile(r'(?P<clock_time>\S{3}\s+\S{3}\s+\d+\s+\d+\:\d+\:\d+\.\d+\s+\S+)$')
      
         # Process started at Mar 10 20:37:22.290 UTC
-        r2 = re.compile(r'^Process started at +(?P<process_started>[\w\s\.\:]+)$')
+        r2 = regex_engine.compile(r'^Process started at +(?P<process_started>[\w\s\.\:]+)$')
      
         # Checkpoint recovered Mar 10 20:37:22.385 UTC
-        r3 = re.compile(r'^Checkpoint recovered +(?P<checkpoint_recovered>[\w\s\.\:]+)$')
+        r3 = regex_engine.compile(r'^Checkpoint recovered +(?P<checkpoint_recovered>[\w\s\.\:]+)$')
 
         # Mode is Primary
-        r4 = re.compile(r'Mode +is +(?P<mode_state>[a-zA-Z]+)$')
+        r4 = regex_engine.compile(r'Mode +is +(?P<mode_state>[a-zA-Z]+)$')
 
         #   ISSU is not in progress
-        r5 = re.compile(r'ISSU is +(?P<issu_state>[a-zA-Z ]+)$')
+        r5 = regex_engine.compile(r'ISSU is +(?P<issu_state>[a-zA-Z ]+)$')
 
         #   Big Bang notification received Never
-        r6 = re.compile(r'Big Bang notification +(?P<big_bang_notification>[a-zA-Z ]+)$')
+        r6 = regex_engine.compile(r'Big Bang notification +(?P<big_bang_notification>[a-zA-Z ]+)$')
 
         # ISSU completed Never
-        r7 = re.compile(r'^ISSU completed +(?P<issu_completed>[a-zA-Z ]+)$')
+        r7 = regex_engine.compile(r'^ISSU completed +(?P<issu_completed>[a-zA-Z ]+)$')
 
         # ISSU aborted Never
-        r8 = re.compile(r'^ISSU aborted +(?P<issu_aborted>[a-zA-Z ]+)$')
+        r8 = regex_engine.compile(r'^ISSU aborted +(?P<issu_aborted>[a-zA-Z ]+)$')
 
         parsed_dict = {} 
 
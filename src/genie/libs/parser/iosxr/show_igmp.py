@@ -11,7 +11,6 @@
 """
 
 # python
-import re
 import logging
 
 from genie.metaparser import MetaParser
@@ -24,6 +23,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 logger = logging.getLogger(__name__)
@@ -105,44 +105,44 @@ class ShowIgmpInterface(ShowIgmpInterfaceSchema):
         result_dict = {}
 
         # Loopback0 is up, line protocol is up
-        p1 = re.compile(r'^(?P<interface>\S+) +is +(?P<interface_status>[\w\s]+), '
-                        r'+line +protocol +is +(?P<line_protocol>[\w\s]+)$') 
+        p1 = regex_engine.compile(r'^(?P<interface>\S+) +is +(?P<interface_status>[\w\s]+), '
+                                  r'+line +protocol +is +(?P<line_protocol>[\w\s]+)$') 
 
         # Internet address is 10.16.2.2/32
-        p2 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ip_address>[\d\.\/]+)$')
+        p2 = regex_engine.compile(r'^Internet +[A|a]ddress +is +(?P<ip_address>[\d\.\/]+)$')
 
         # IGMP is enabled on interface
-        p3 = re.compile(r'^IGMP +is +(?P<igmp_state>[a-zA-Z]+) +on +interface$')
+        p3 = regex_engine.compile(r'^IGMP +is +(?P<igmp_state>[a-zA-Z]+) +on +interface$')
         
         # Current IGMP version is 3
-        p4 = re.compile(r'^Current +IGMP +version +is +(?P<igmp_version>[\d]+)')
+        p4 = regex_engine.compile(r'^Current +IGMP +version +is +(?P<igmp_version>[\d]+)')
         
         # IGMP query interval is 60 seconds
-        p5 = re.compile(r'^IGMP +query +interval +is +(?P<igmp_query_interval>[\d]+) +seconds$')
+        p5 = regex_engine.compile(r'^IGMP +query +interval +is +(?P<igmp_query_interval>[\d]+) +seconds$')
         
         # IGMP querier timeout is 125 seconds
-        p6 = re.compile(r'^IGMP +querier +timeout +is +(?P<igmp_querier_timeout>[\d]+) +seconds$')
+        p6 = regex_engine.compile(r'^IGMP +querier +timeout +is +(?P<igmp_querier_timeout>[\d]+) +seconds$')
         
         # IGMP max query response time is 10 seconds
-        p7 = re.compile(r'^IGMP +max +query +response +time +is +(?P<igmp_max_query_response_time>[\d]+) +seconds$')
+        p7 = regex_engine.compile(r'^IGMP +max +query +response +time +is +(?P<igmp_max_query_response_time>[\d]+) +seconds$')
         
         # Last member query response interval is 1 seconds
-        p8 = re.compile(r'^Last +member +query +response +interval +is +(?P<last_member_query_response_interval>[\d]+) +seconds$')
+        p8 = regex_engine.compile(r'^Last +member +query +response +interval +is +(?P<last_member_query_response_interval>[\d]+) +seconds$')
         
         # IGMP activity: 6 joins, 0 leaves
-        p9 = re.compile(r'^IGMP +activity: +(?P<joins>[\d]+) +joins, +(?P<leaves>[\d]+) +leaves$')
+        p9 = regex_engine.compile(r'^IGMP +activity: +(?P<joins>[\d]+) +joins, +(?P<leaves>[\d]+) +leaves$')
         
         # IGMP querying router is 10.16.2.2 (this system)
-        p10 = re.compile(r'^IGMP +querying +router +is +(?P<igmp_querying_router>[\d\.]+)+([\s*]+\(+(?P<igmp_querying_router_info>[\S\s*]+)+\))?$')
+        p10 = regex_engine.compile(r'^IGMP +querying +router +is +(?P<igmp_querying_router>[\d\.]+)+([\s*]+\(+(?P<igmp_querying_router_info>[\S\s*]+)+\))?$')
         
         # Time elapsed since last query sent 00:00:53
-        p11 = re.compile(r'^Time +elapsed +since +last +query +sent +(?P<time_elapsed_since_last_query_sent>[\d\:]+)$')
+        p11 = regex_engine.compile(r'^Time +elapsed +since +last +query +sent +(?P<time_elapsed_since_last_query_sent>[\d\:]+)$')
         
         # Time elapsed since IGMP router enabled 02:46:41
-        p12 = re.compile(r'^Time +elapsed +since +IGMP +router +enabled +(?P<time_elapsed_since_router_enabled>[\d\:]+)$')
+        p12 = regex_engine.compile(r'^Time +elapsed +since +IGMP +router +enabled +(?P<time_elapsed_since_router_enabled>[\d\:]+)$')
         
         # Time elapsed since last report received 00:00:51
-        p13 = re.compile(r'^Time +elapsed +since +last +report +received +(?P<time_elapsed_since_last_report_received>[\d\:]+)$')
+        p13 = regex_engine.compile(r'^Time +elapsed +since +last +report +received +(?P<time_elapsed_since_last_report_received>[\d\:]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -316,28 +316,28 @@ class ShowIgmpSummary(ShowIgmpSummarySchema):
         result_dict = {}
 
         # Robustness Value 2
-        p1 = re.compile(r'^Robustness +Value +(?P<robustness_value>[\d]+)$') 
+        p1 = regex_engine.compile(r'^Robustness +Value +(?P<robustness_value>[\d]+)$') 
 
         # No. of Group x Interfaces 25
-        p2 = re.compile(r'^No. +of +Group +x +Interfaces +(?P<no_of_group_x_interface>[\d]+)$')
+        p2 = regex_engine.compile(r'^No. +of +Group +x +Interfaces +(?P<no_of_group_x_interface>[\d]+)$')
         
         # Maximum number of Groups for this VRF 50000
-        p3 = re.compile(r'^Maximum +number +of +Groups +for +this +VRF +(?P<maximum_number_of_groups_for_vrf>[\d]+)$')
+        p3 = regex_engine.compile(r'^Maximum +number +of +Groups +for +this +VRF +(?P<maximum_number_of_groups_for_vrf>[\d]+)$')
         
         # Supported Interfaces   : 9
-        p4 = re.compile(r'^Supported +Interfaces +: +(?P<supported_interfaces>[\d]+)$')
+        p4 = regex_engine.compile(r'^Supported +Interfaces +: +(?P<supported_interfaces>[\d]+)$')
         
         # Unsupported Interfaces : 0
-        p5 = re.compile(r'^Unsupported +Interfaces +: +(?P<unsupported_interfaces>[\d]+)$')
+        p5 = regex_engine.compile(r'^Unsupported +Interfaces +: +(?P<unsupported_interfaces>[\d]+)$')
         
         # Enabled Interfaces     : 3
-        p6 = re.compile(r'^Enabled +Interfaces +: +(?P<enabled_interfaces>[\d]+)$')
+        p6 = regex_engine.compile(r'^Enabled +Interfaces +: +(?P<enabled_interfaces>[\d]+)$')
         
         # Disabled Interfaces    : 6
-        p7 = re.compile(r'^Disabled +Interfaces +: +(?P<disabled_interfaces>[\d]+)$')
+        p7 = regex_engine.compile(r'^Disabled +Interfaces +: +(?P<disabled_interfaces>[\d]+)$')
         
         # MTE tuple count        : 0
-        p8 = re.compile(r'^MTE +tuple +count +: +(?P<mte_tuple_count>[\d]+)$')
+        p8 = regex_engine.compile(r'^MTE +tuple +count +: +(?P<mte_tuple_count>[\d]+)$')
         
         # Interface                       Number  Max #
         #                                 Groups  Groups
@@ -351,7 +351,7 @@ class ShowIgmpSummary(ShowIgmpSummarySchema):
         # GigabitEthernet0/0/0/1.115      0       25000
         # GigabitEthernet0/0/0/1.120      1       25000
         
-        p9 = re.compile(r'(?P<interface>(\S+)) +(?P<number_groups>(\d+)) +(?P<max_groups>(\d+))?$')
+        p9 = regex_engine.compile(r'(?P<interface>(\S+)) +(?P<number_groups>(\d+)) +(?P<max_groups>(\d+))?$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -505,33 +505,33 @@ class ShowIgmpGroupsDetail(ShowIgmpGroupsDetailSchema):
         result_dict = {}
 
         # Interface:	Loopback0
-        p1 = re.compile(r'^Interface:+[\s]+(?P<interface>[\S]+)$') 
+        p1 = regex_engine.compile(r'^Interface:+[\s]+(?P<interface>[\S]+)$') 
         
         # Group:		224.0.0.2
-        p2 = re.compile(r'^Group:+[\s*]+(?P<group>[\d\.]+)$')
+        p2 = regex_engine.compile(r'^Group:+[\s*]+(?P<group>[\d\.]+)$')
         
         # Uptime:		02:44:55
-        p3 = re.compile(r'^Uptime:+[\s*]+(?P<up_time>[\d\:\S]+)$')
+        p3 = regex_engine.compile(r'^Uptime:+[\s*]+(?P<up_time>[\d\:\S]+)$')
         
         # Router mode:	EXCLUDE (Expires: never)
-        p4 = re.compile(r'^Router mode:+[\s*]+(?P<router_mode>[\S]+)+([\s*]+\(Expires: +(?P<router_mode_expires>[\S]+)+\))?$')
+        p4 = regex_engine.compile(r'^Router mode:+[\s*]+(?P<router_mode>[\S]+)+([\s*]+\(Expires: +(?P<router_mode_expires>[\S]+)+\))?$')
         
         # Host mode:	EXCLUDE
-        p5 = re.compile(r'^Host mode:+[\s*]+(?P<host_mode>[\S]+)$')
+        p5 = regex_engine.compile(r'^Host mode:+[\s*]+(?P<host_mode>[\S]+)$')
         
         # Last reporter:	10.16.2.2
-        p6 = re.compile(r'^Last reporter:+[\s*]+(?P<last_reporter>[\d\.]+)$')
+        p6 = regex_engine.compile(r'^Last reporter:+[\s*]+(?P<last_reporter>[\d\.]+)$')
         
         # Suppress:	0
-        p7 = re.compile(r'^Suppress:+[\s*]+(?P<suppress>[\d]+)$')
+        p7 = regex_engine.compile(r'^Suppress:+[\s*]+(?P<suppress>[\d]+)$')
         
         # Source Address   Uptime    Expires   Fwd  Flags
         # 192.168.1.18     00:04:55  00:01:28  Yes  Remote
-        p8 = re.compile(r'^(?P<source>[\d\.\:]+) +'
-                             r'(?P<up_time>[\w\.\:]+) +'
-                             r'(?P<expire>[\w\:]+) +'
-                             r'(?P<forward>\w+)? +'
-                             r'(?P<flags>\w+)?$')
+        p8 = regex_engine.compile(r'^(?P<source>[\d\.\:]+) +'
+                                       r'(?P<up_time>[\w\.\:]+) +'
+                                       r'(?P<expire>[\w\:]+) +'
+                                       r'(?P<forward>\w+)? +'
+                                       r'(?P<flags>\w+)?$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -678,17 +678,17 @@ class ShowIgmpGroupsSummary(ShowIgmpGroupsSummarySchema):
         parsed_dict = {}
 
         # IGMP Route Summary for vrf default
-        p1 = re.compile(r"IGMP +Route +Summary +for +vrf +(?P<vrf>\S+)")
+        p1 = regex_engine.compile(r"IGMP +Route +Summary +for +vrf +(?P<vrf>\S+)")
 
         # No. of (*,G) routes = 4
-        p2 = re.compile(r"No\. +of +\(\*,G\) +routes += +(?P<no_g_routes>\d+)")
+        p2 = regex_engine.compile(r"No\. +of +\(\*,G\) +routes += +(?P<no_g_routes>\d+)")
 
         # No. of (S,G) routes = 2
-        p3 = re.compile(r"No\. +of +\(\S,G\) +routes += +(?P<no_sg_routes>\d+)")
+        p3 = regex_engine.compile(r"No\. +of +\(\S,G\) +routes += +(?P<no_sg_routes>\d+)")
 
         # No. of Group x Interfaces = 27
-        p4 = re.compile(r"No\. +of +Group +x +Interfaces += +"
-                        r"(?P<no_group_x_intfs>\d+)")
+        p4 = regex_engine.compile(r"No\. +of +Group +x +Interfaces += +"
+                                  r"(?P<no_group_x_intfs>\d+)")
 
         for line in out.splitlines():
             line = line.strip()
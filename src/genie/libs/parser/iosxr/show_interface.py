@@ -32,6 +32,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 logger = logging.getLogger(__name__)
@@ -80,9 +81,9 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
 
         # Loopback500                    192.168.220.1       Up              Up       default
         # BVI123                         10.12.34.56         Up              Up       MyOrg-MyGroup_Channel_Zone
-        p = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) '
-                       r'+(?P<ip_address>[a-z0-9\.]+) +(?P<interface_status>[a-zA-Z]+) '
-                       r'+(?P<protocol_status>[a-zA-Z]+)( +(?P<vrf_name>[\w\:-]+))?$')
+        p = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) '
+                                 r'+(?P<ip_address>[a-z0-9\.]+) +(?P<interface_status>[a-zA-Z]+) '
+                                 r'+(?P<protocol_status>[a-zA-Z]+)( +(?P<vrf_name>[\w\:-]+))?$')
 
         interface_dict = {}
         for line in out.splitlines():
@@ -220,7 +221,7 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
         interface_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Port +VRF +Status +IP Address +Speed +MTU$')
+            p1 = regex_engine.compile(r'^\s*Port +VRF +Status +IP Address +Speed +MTU$')
             m = p1.match(line)
             if m:
                 if 'interface' not in interface_dict:
@@ -229,10 +230,10 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     interface_dict['interface']['port'] = {}
                 continue
 
-            p2 = re.compile(r'^\s*(?P<port>[a-zA-Z0-9\/\.]+)'
-                             r' +(?P<vrf>[a-zA-Z0-9\-]+)'
-                             r' +(?P<status>[a-zA-Z\-]+) +(?P<ip_address>[0-9\.]+)'
-                             r' +(?P<speed>[0-9]+) +(?P<mtu>[0-9]+)$')
+            p2 = regex_engine.compile(r'^\s*(?P<port>[a-zA-Z0-9\/\.]+)'
+                                       r' +(?P<vrf>[a-zA-Z0-9\-]+)'
+                                       r' +(?P<status>[a-zA-Z\-]+) +(?P<ip_address>[0-9\.]+)'
+                                       r' +(?P<speed>[0-9]+) +(?P<mtu>[0-9]+)$')
             m = p2.match(line)
             if m:
                 port = m.groupdict()['port']
@@ -250,8 +251,8 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     m.groupdict()['mtu']
                 continue
 
-            p3 = re.compile(r'^\s*Ethernet +VLAN +Type +Mode +Status'
-                             r' +Reason +Speed +Port$')
+            p3 = regex_engine.compile(r'^\s*Ethernet +VLAN +Type +Mode +Status'
+                                       r' +Reason +Speed +Port$')
             m = p3.match(line)
             if m:
                 if 'interface' not in interface_dict:
@@ -260,12 +261,12 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     interface_dict['interface']['ethernet'] = {}
                 continue
 
-            p4 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
-                             r' +(?P<vlan>[a-zA-Z0-9\-]+)'
-                             r' +(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+)'
-                             r' +(?P<status>[a-z]+) +(?P<reason>[a-zA-Z\s]+)'
-                             r' +(?P<speed>[0-9a-zA-Z\(\)\s]+)'
-                             r' +(?P<port>[0-9\-]+)$')
+            p4 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
+                                       r' +(?P<vlan>[a-zA-Z0-9\-]+)'
+                                       r' +(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+)'
+                                       r' +(?P<status>[a-z]+) +(?P<reason>[a-zA-Z\s]+)'
+                                       r' +(?P<speed>[0-9a-zA-Z\(\)\s]+)'
+                                       r' +(?P<port>[0-9\-]+)$')
             m = p4.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -287,8 +288,8 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     m.groupdict()['port']
                 continue
 
-            p5 = re.compile(r'^\s*Port-channel +VLAN +Type +Mode +Status'
-                             r' +Reason +Speed +Protocol$')
+            p5 = regex_engine.compile(r'^\s*Port-channel +VLAN +Type +Mode +Status'
+                                       r' +Reason +Speed +Protocol$')
             m = p5.match(line)
             if m:
                 if 'interface' not in interface_dict:
@@ -297,12 +298,12 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     interface_dict['interface']['port_channel'] = {}
                 continue
 
-            p6 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
-                             r' +(?P<vlan>[a-zA-Z0-9\-]+)'
-                             r' +(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+)'
-                             r' +(?P<status>[a-z]+) +(?P<reason>[a-zA-Z\s]+)'
-                             r' +(?P<speed>[0-9a-zA-Z\(\)\s]+)'
-                             r' +(?P<protocol>[a-zA-Z0-9\-]+)$')
+            p6 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
+                                       r' +(?P<vlan>[a-zA-Z0-9\-]+)'
+                                       r' +(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+)'
+                                       r' +(?P<status>[a-z]+) +(?P<reason>[a-zA-Z\s]+)'
+                                       r' +(?P<speed>[0-9a-zA-Z\(\)\s]+)'
+                                       r' +(?P<protocol>[a-zA-Z0-9\-]+)$')
             m = p6.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -325,7 +326,7 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                 continue
 
 
-            p7 = re.compile(r'^\s*Interface +Status +Description$')
+            p7 = regex_engine.compile(r'^\s*Interface +Status +Description$')
             m = p7.match(line)
             if m:
                 if 'interface' not in interface_dict:
@@ -334,9 +335,9 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                     interface_dict['interface']['loopback'] = {}
                 continue
 
-            p8 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
-                             r' +(?P<status>[a-z]+)'
-                             r' +(?P<description>[a-zA-Z\s\-]+)$')
+            p8 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
+                                       r' +(?P<status>[a-z]+)'
+                                       r' +(?P<description>[a-zA-Z\s\-]+)$')
             m = p8.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -349,12 +350,12 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
                 continue
 
 
-            p9 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
-                             r' +(?P<intf_state>[a-zA-Z0-9\-]+)'
-                             r' +(?P<line_state>[a-zA-Z0-9\-]+)'
-                             r' +(?P<type>[a-zA-Z]+)'
-                             r' +(?P<mtu>\d+)'
-                             r' +(?P<bw>\d+)$')
+            p9 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/]+)'
+                                       r' +(?P<intf_state>[a-zA-Z0-9\-]+)'
+                                       r' +(?P<line_state>[a-zA-Z0-9\-]+)'
+                                       r' +(?P<type>[a-zA-Z]+)'
+                                       r' +(?P<mtu>\d+)'
+                                       r' +(?P<bw>\d+)$')
             m = p9.match(line)
             if m:
                 group = m.groupdict()
@@ -507,10 +508,10 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
             line = line.strip()
 
             # MgmtEth0/0/CPU0/0 is administratively down, line protocol is administratively down
-            p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
-                             r' +(?P<enabled>(administratively down|down))(?:,'
-                             r' +line +protocol +is +(?P<line_protocol>'
-                             r'(administratively down|down)))?$')
+            p1 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
+                                       r' +(?P<enabled>(administratively down|down))(?:,'
+                                       r' +line +protocol +is +(?P<line_protocol>'
+                                       r'(administratively down|down)))?$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -524,10 +525,10 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['enabled'] = False
                 continue
 
-            p1_1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
-                               r' +(?P<enabled>(administratively up|up))(?:,'
-                               r' +line +protocol +is +(?P<line_protocol>'
-                               r'(administratively up|up)))?$')
+            p1_1 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
+                                         r' +(?P<enabled>(administratively up|up))(?:,'
+                                         r' +line +protocol +is +(?P<line_protocol>'
+                                         r'(administratively up|up)))?$')
             m = p1_1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -542,8 +543,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Interface state transitions: 1
-            p2 = re.compile(r'^\s*Interface +state +transitions:'
-                             r' +(?P<interface_state>[0-9]+)$')
+            p2 = regex_engine.compile(r'^\s*Interface +state +transitions:'
+                                       r' +(?P<interface_state>[0-9]+)$')
             m = p2.match(line)
             if m:
                 interface_state = int(m.groupdict()['interface_state'])
@@ -553,9 +554,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
             # Hardware is Null interface
             # Hardware is Management Ethernet, address is 5254.00ff.3007 (bia 5254.00ff.3007)
 
-            p3 = re.compile(r'^\s*Hardware is (?P<types>[a-zA-Z\,\s]+)(?:'
-                             r' +address +is (?P<mac_address>[a-z0-9\.]+) +\(bia'
-                             r' +(?P<phys_address>[a-z0-9\.]+)\))?$')
+            p3 = regex_engine.compile(r'^\s*Hardware is (?P<types>[a-zA-Z\,\s]+)(?:'
+                                       r' +address +is (?P<mac_address>[a-z0-9\.]+) +\(bia'
+                                       r' +(?P<phys_address>[a-z0-9\.]+)\))?$')
             m = p3.match(line)
             if m:
                 types = m.groupdict()['types'].lower()
@@ -573,8 +574,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Hardware is VLAN sub-interface(s), address is aaaa.bbff.8888
-            p3_1 = re.compile(r'^\s*Hardware is (?P<types>[\w\W]+) +address'
-                               r' +is +(?P<mac_address>[a-z0-9\.]+)$')
+            p3_1 = regex_engine.compile(r'^\s*Hardware is (?P<types>[\w\W]+) +address'
+                                         r' +is +(?P<mac_address>[a-z0-9\.]+)$')
             m = p3_1.match(line)
             if m:
                 types = m.groupdict()['types'].lower()
@@ -588,7 +589,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             #Description: desc
-            p3_2 = re.compile(r'^\s*Description: +(?P<description>[\w\W]+)$')
+            p3_2 = regex_engine.compile(r'^\s*Description: +(?P<description>[\w\W]+)$')
             m = p3_2.match(line)
             if m:
                 interface_detail_dict[interface]['description']\
@@ -596,8 +597,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Internet address is 10.1.1.1/24
-            p4 = re.compile(r'^\s*Internet +address +is +(?P<ip>[a-z0-9\.]+)'
-                             r'(\/(?P<prefix_length>[0-9]+))?$')
+            p4 = regex_engine.compile(r'^\s*Internet +address +is +(?P<ip>[a-z0-9\.]+)'
+                                       r'(\/(?P<prefix_length>[0-9]+))?$')
             m = p4.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -616,9 +617,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
 
             # MTU 1500 bytes, BW 0 Kbit (Max: 1000000 Kbit)
             # MTU 6000 bytes, BW 20000000 Kbit (Max: 20000000 Kbit)
-            p5 = re.compile(r'^\s*MTU +(?P<mtu>[0-9]+) +bytes, +BW'
-                             r' +(?P<bandwidth>[0-9]+) +Kbit(?: *\(Max: +\d+'
-                             r' +Kbit\))?$')
+            p5 = regex_engine.compile(r'^\s*MTU +(?P<mtu>[0-9]+) +bytes, +BW'
+                                       r' +(?P<bandwidth>[0-9]+) +Kbit(?: *\(Max: +\d+'
+                                       r' +Kbit\))?$')
             m = p5.match(line)
             if m:
                 mtu = int(m.groupdict()['mtu'])
@@ -629,9 +630,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # reliability 255/255, txload Unknown, rxload Unknown
-            p6 = re.compile(r'^\s*reliability +(?P<reliability>[a-zA-Z0-9\/]+),'
-                             r' +txload +(?P<txload>[a-zA-Z0-9\/]+), +rxload'
-                             r' +(?P<rxload>[a-zA-Z0-9\/]+)$')
+            p6 = regex_engine.compile(r'^\s*reliability +(?P<reliability>[a-zA-Z0-9\/]+),'
+                                       r' +txload +(?P<txload>[a-zA-Z0-9\/]+), +rxload'
+                                       r' +(?P<rxload>[a-zA-Z0-9\/]+)$')
             m = p6.match(line)
             if m:
                 reliability = m.groupdict()['reliability']
@@ -644,9 +645,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-            p7 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                             r' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN'
-                             r' +Id +(?P<second_dot1q>[0-9]+),$')
+            p7 = regex_engine.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                                       r' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN'
+                                       r' +Id +(?P<second_dot1q>[0-9]+),$')
             m = p7.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
@@ -663,9 +664,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Encapsulation 802.1Q Virtual LAN, VLAN Id 20,  loopback not set,
-            p7_1 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               r' +VLAN +Id +(?P<first_dot1q>[0-9]+), +loopback'
-                               r' +(?P<loopback_status>[a-zA-Z\s]+),$')
+            p7_1 = regex_engine.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                                         r' +VLAN +Id +(?P<first_dot1q>[0-9]+), +loopback'
+                                         r' +(?P<loopback_status>[a-zA-Z\s]+),$')
             m = p7_1.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
@@ -684,10 +685,10 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                     = m.groupdict()['loopback_status']
                 continue
 
-            p7_2 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               r' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN +Id'
-                               r' +(?P<second_dot1q>[0-9]+),(?: +loopback'
-                               r' +(?P<loopback_status>[a-zA-Z\s]+),)?$')
+            p7_2 = regex_engine.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                                         r' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN +Id'
+                                         r' +(?P<second_dot1q>[0-9]+),(?: +loopback'
+                                         r' +(?P<loopback_status>[a-zA-Z\s]+),)?$')
             m = p7_2.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
@@ -709,7 +710,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Encapsulation ARPA,
-            p7_3 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),$')
+            p7_3 = regex_engine.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),$')
             m = p7_3.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
@@ -722,8 +723,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Encapsulation Null,  loopback not set,
-            p7_4 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               r' +loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
+            p7_4 = regex_engine.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                                         r' +loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
             m = p7_4.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
@@ -742,7 +743,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # loopback not set,
-            p7_5 = re.compile(r'^\s*loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
+            p7_5 = regex_engine.compile(r'^\s*loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
             m = p7_5.match(line)
             if m:
                 loopback_status = str(m.groupdict()['loopback_status'])
@@ -753,8 +754,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Last input never, output never
-            p8 = re.compile(r'^\s*Last +input +(?P<last_input>[\w\W]+),'
-                             r' +output +(?P<last_output>[\w\W]+)$')
+            p8 = regex_engine.compile(r'^\s*Last +input +(?P<last_input>[\w\W]+),'
+                                       r' +output +(?P<last_output>[\w\W]+)$')
             m = p8.match(line)
             if m:
                 interface_detail_dict[interface]['last_input']\
@@ -764,8 +765,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # ARP type ARPA, ARP timeout 04:00:00
-            p8_1 = re.compile(r'^\s*ARP +type +(?P<arp_type>\S+), +ARP +timeout'
-                               r' +(?P<arp_timeout>\S+)')
+            p8_1 = regex_engine.compile(r'^\s*ARP +type +(?P<arp_type>\S+), +ARP +timeout'
+                                         r' +(?P<arp_timeout>\S+)')
             m = p8_1.match(line)
             if m:
                 arp_type = str(m.groupdict()['arp_type']).lower()
@@ -776,7 +777,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                  = m.groupdict()['arp_timeout']
                 continue
 
-            p8_2 = re.compile(r'^\s*Last +link +flapped +(?P<last_link_flapped>\S+)$')
+            p8_2 = regex_engine.compile(r'^\s*Last +link +flapped +(?P<last_link_flapped>\S+)$')
             m = p8_2.match(line)
             if m:
                 interface_detail_dict[interface]['last_link_flapped']\
@@ -784,17 +785,17 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Last clearing of "show interface" counters never
-            p8_3 = re.compile(r'^\s*Last +clearing +of +"show interface"'
-                               r' +counters +(?P<last_clear>[\w\W]+)$')
+            p8_3 = regex_engine.compile(r'^\s*Last +clearing +of +"show interface"'
+                                         r' +counters +(?P<last_clear>[\w\W]+)$')
             m = p8_3.match(line)
             if m:
                 last_clear = str(m.groupdict()['last_clear'])
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            p9 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
-                             r' +input +rate +(?P<in_rate>[0-9]+) +bits/sec,'
-                             r' +(?P<in_rate_pkts>[0-9]+) +packets/sec$')
+            p9 = regex_engine.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
+                                       r' +input +rate +(?P<in_rate>[0-9]+) +bits/sec,'
+                                       r' +(?P<in_rate_pkts>[0-9]+) +packets/sec$')
             m = p9.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
@@ -822,9 +823,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
 
             # Full-duplex, 1000Mb/s, unknown, link type is autonegotiation
             # Duplex unknown, 0Kb/s, unknown, link type is autonegotiation
-            p9_1 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+)(Mb/s|Kb/s|Gb/s),'
-                               r' +(?P<location>\S+), +link +type +is'
-                               r' +(?P<auto_negotiate>(autonegotiation))$')
+            p9_1 = regex_engine.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+)(Mb/s|Kb/s|Gb/s),'
+                                         r' +(?P<location>\S+), +link +type +is'
+                                         r' +(?P<auto_negotiate>(autonegotiation))$')
             m = p9_1.match(line)
             if m:
                 auto_negotiate = m.groupdict()['auto_negotiate']
@@ -837,8 +838,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['auto_negotiate'] = True
                 continue
 
-            p9_2 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+),'
-                               r' +(?P<location>\S+), +link +type +is +(?P<auto_negotiate>(force-up))$')
+            p9_2 = regex_engine.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+),'
+                                         r' +(?P<location>\S+), +link +type +is +(?P<auto_negotiate>(force-up))$')
             m = p9_2.match(line)
             if m:
                 auto_negotiate = m.groupdict()['auto_negotiate']
@@ -852,8 +853,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # output flow control is off, input flow control is off
-            p9_3 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
-                               r' +input +flow +control +is +(?P<flow_control_receive>(off))$')
+            p9_3 = regex_engine.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
+                                         r' +input +flow +control +is +(?P<flow_control_receive>(off))$')
             m = p9_3.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
@@ -866,8 +867,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
                 continue
 
-            p9_4 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
-                               r' +input +flow +control +is +(?P<flow_control_receive>(on))$')
+            p9_4 = regex_engine.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
+                                         r' +input +flow +control +is +(?P<flow_control_receive>(on))$')
             m = p9_4.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
@@ -880,8 +881,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = True
                 continue
 
-            p9_5 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
-                               r' +input +flow +control +is +(?P<flow_control_receive>(off))$')
+            p9_5 = regex_engine.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
+                                         r' +input +flow +control +is +(?P<flow_control_receive>(off))$')
             m = p9_5.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
@@ -894,8 +895,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
                 continue
 
-            p9_6 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
-                               r' +input +flow +control +is +(?P<flow_control_receive>(on))$')
+            p9_6 = regex_engine.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
+                                         r' +input +flow +control +is +(?P<flow_control_receive>(on))$')
             m = p9_6.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
@@ -909,8 +910,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Carrier delay (up) is 10 msec
-            p9_7 = re.compile(r'^\s*Carrier +delay +\(up\) +is'
-                               r' +(?P<carrier_delay>[0-9]+) +msec$')
+            p9_7 = regex_engine.compile(r'^\s*Carrier +delay +\(up\) +is'
+                                         r' +(?P<carrier_delay>[0-9]+) +msec$')
             m = p9_7.match(line)
             if m:
                 carrier_delay = m.groupdict()['carrier_delay']
@@ -919,9 +920,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            p10 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
-                              r' +output +rate +(?P<out_rate>[0-9]+) +bits/sec,'
-                              r' +(?P<out_rate_pkts>[0-9]+) +packets/sec$')
+            p10 = regex_engine.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
+                                        r' +output +rate +(?P<out_rate>[0-9]+) +bits/sec,'
+                                        r' +(?P<out_rate_pkts>[0-9]+) +packets/sec$')
             m = p10.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
@@ -946,9 +947,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 total input drops
-            p11 = re.compile(r'^\s*(?P<in_pkts>[0-9]+) +packets +input,'
-                              r' +(?P<in_octets>[0-9]+) +bytes, +(?P<in_discards>[0-9]+)'
-                              r' +total +input +drops$')
+            p11 = regex_engine.compile(r'^\s*(?P<in_pkts>[0-9]+) +packets +input,'
+                                        r' +(?P<in_octets>[0-9]+) +bytes, +(?P<in_discards>[0-9]+)'
+                                        r' +total +input +drops$')
             m = p11.match(line)
             if m:
                 in_pkts = int(m.groupdict()['in_pkts'])
@@ -964,8 +965,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 drops for unrecognized upper-level protocol
-            p12 = re.compile(r'^\s*(?P<in_unknown_protos>[0-9]+) +drops +for +unrecognized'
-                              r' +upper-level +protocol$')
+            p12 = regex_engine.compile(r'^\s*(?P<in_unknown_protos>[0-9]+) +drops +for +unrecognized'
+                                        r' +upper-level +protocol$')
             m = p12.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -973,9 +974,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Received 0 broadcast packets, 0 multicast packets
-            p13 = re.compile(r'^\s*Received +(?P<in_broadcast_pkts>[0-9]+)'
-                              r' +broadcast +packets, +(?P<in_multicast_pkts>[0-9]+)'
-                              r' +multicast +packets$')
+            p13 = regex_engine.compile(r'^\s*Received +(?P<in_broadcast_pkts>[0-9]+)'
+                                        r' +broadcast +packets, +(?P<in_multicast_pkts>[0-9]+)'
+                                        r' +multicast +packets$')
             m = p13.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -985,9 +986,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles, 0 parity
-            p14 = re.compile(r'^\s*(?P<in_runts>[0-9]+) +runts, +(?P<in_giants>[0-9]+)'
-                              r' +giants, +(?P<in_throttles>[0-9]+) +throttles,'
-                              r' +(?P<in_parity>[0-9]+) parity$')
+            p14 = regex_engine.compile(r'^\s*(?P<in_runts>[0-9]+) +runts, +(?P<in_giants>[0-9]+)'
+                                        r' +giants, +(?P<in_throttles>[0-9]+) +throttles,'
+                                        r' +(?P<in_parity>[0-9]+) parity$')
             m = p14.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1001,12 +1002,12 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            p15 = re.compile(r'^\s*(?P<in_frame_errors>[0-9]+) +input +errors,'
-                              r' +(?P<in_crc_errors>[0-9]+) +CRC,'
-                              r' +(?P<in_frame>[0-9]+)'
-                              r' +frame, +(?P<in_overrun>[0-9]+) +overrun,'
-                              r' +(?P<in_ignored>[0-9]+) +ignored,'
-                              r' +(?P<in_abort>[0-9]+) +abort$')
+            p15 = regex_engine.compile(r'^\s*(?P<in_frame_errors>[0-9]+) +input +errors,'
+                                        r' +(?P<in_crc_errors>[0-9]+) +CRC,'
+                                        r' +(?P<in_frame>[0-9]+)'
+                                        r' +frame, +(?P<in_overrun>[0-9]+) +overrun,'
+                                        r' +(?P<in_ignored>[0-9]+) +ignored,'
+                                        r' +(?P<in_abort>[0-9]+) +abort$')
             m = p15.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1024,9 +1025,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 packets output, 0 bytes, 0 total output drops
-            p16 = re.compile(r'^\s*(?P<out_pkts>[0-9]+) +packets +output,'
-                              r' +(?P<out_octets>[0-9]+) +bytes, +(?P<out_discards>[0-9]+)'
-                              r' +total +output +drops$')
+            p16 = regex_engine.compile(r'^\s*(?P<out_pkts>[0-9]+) +packets +output,'
+                                        r' +(?P<out_octets>[0-9]+) +bytes, +(?P<out_discards>[0-9]+)'
+                                        r' +total +output +drops$')
             m = p16.match(line)
             if m:
                 interface_detail_dict[interface].setdefault('counters', {})
@@ -1039,9 +1040,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Output 0 broadcast packets, 0 multicast packets
-            p17 = re.compile(r'^\s*Output +(?P<out_broadcast_pkts>[0-9]+)'
-                              r' +broadcast +packets, +(?P<out_multicast_pkts>[0-9]+)'
-                              r' +multicast +packets$')
+            p17 = regex_engine.compile(r'^\s*Output +(?P<out_broadcast_pkts>[0-9]+)'
+                                        r' +broadcast +packets, +(?P<out_multicast_pkts>[0-9]+)'
+                                        r' +multicast +packets$')
             m = p17.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1051,10 +1052,10 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 output errors, 0 underruns, 0 applique, 0 resets
-            p18 = re.compile(r'^\s*(?P<out_errors>[0-9]+) +output +errors,'
-                              r' +(?P<out_underruns>[0-9]+) +underruns,'
-                              r' +(?P<out_applique>[0-9]+) +applique,'
-                              r' +(?P<out_resets>[0-9]+) +resets$')
+            p18 = regex_engine.compile(r'^\s*(?P<out_errors>[0-9]+) +output +errors,'
+                                        r' +(?P<out_underruns>[0-9]+) +underruns,'
+                                        r' +(?P<out_applique>[0-9]+) +applique,'
+                                        r' +(?P<out_resets>[0-9]+) +resets$')
             m = p18.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1068,9 +1069,9 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            p19 = re.compile(r'^\s*(?P<out_buffer_failures>[0-9]+) +output'
-                              r' +buffer +failures, +(?P<out_buffer_swapped_out>[0-9]+)'
-                              r' +output +buffers +swapped +out$')
+            p19 = regex_engine.compile(r'^\s*(?P<out_buffer_failures>[0-9]+) +output'
+                                        r' +buffer +failures, +(?P<out_buffer_swapped_out>[0-9]+)'
+                                        r' +output +buffers +swapped +out$')
             m = p19.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1080,7 +1081,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 carrier transitions
-            p20 = re.compile(r'^\s*(?P<carrier_transitions>[0-9]+) +carrier +transitions$')
+            p20 = regex_engine.compile(r'^\s*(?P<carrier_transitions>[0-9]+) +carrier +transitions$')
             m = p20.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
@@ -1122,11 +1123,11 @@ class ShowVlanInterface(ShowVlanInterfaceSchema):
 
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.]+)'
-                             r' +(?P<encapsulation>[A-Z0-9\.]+)'
-                             r' +(?P<outer_vlan>[0-9]+)(?: +(?P<second_vlan>[0-9]+))?'
-                             r' +(?P<service>[A-Z0-9]+) +(?P<mtu>[0-9]+)'
-                             r' +(?P<linep_state>\S+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.]+)'
+                                       r' +(?P<encapsulation>[A-Z0-9\.]+)'
+                                       r' +(?P<outer_vlan>[0-9]+)(?: +(?P<second_vlan>[0-9]+))?'
+                                       r' +(?P<service>[A-Z0-9]+) +(?P<mtu>[0-9]+)'
+                                       r' +(?P<linep_state>\S+)$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1148,11 +1149,11 @@ class ShowVlanInterface(ShowVlanInterfaceSchema):
                 vlan_interface_dict[interface]['linep_state'] = linep_state
                 continue
 
-            p1_1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.]+)'
-                               r' +(?P<encapsulation>[a-zA-Z]+ [A-Z0-9\.]+)'
-                               r' +(?P<outer_vlan>[0-9]+)(?: +(?P<second_vlan>[0-9]+))?'
-                               r' +(?P<service>[A-Z0-9]+) +(?P<mtu>[0-9]+)'
-                               r' +(?P<linep_state>\S+)$')
+            p1_1 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.]+)'
+                                         r' +(?P<encapsulation>[a-zA-Z]+ [A-Z0-9\.]+)'
+                                         r' +(?P<outer_vlan>[0-9]+)(?: +(?P<second_vlan>[0-9]+))?'
+                                         r' +(?P<service>[A-Z0-9]+) +(?P<mtu>[0-9]+)'
+                                         r' +(?P<linep_state>\S+)$')
             m = p1_1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1244,8 +1245,8 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
             line = line.rstrip()
 
             # GigabitEthernet0/0/0/0 is Shutdown, ipv4 protocol is Down
-            p1 = re.compile(r'^\s*(?P<interface>\S+) +is (?P<int_status>\S+),'
-                             r' +ipv4 +protocol +is +(?P<oper_status>[a-zA-Z]+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<interface>\S+) +is (?P<int_status>\S+),'
+                                       r' +ipv4 +protocol +is +(?P<oper_status>[a-zA-Z]+)$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1262,7 +1263,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Vrf is VRF1 (vrfid 0x60000002)
-            p2 = re.compile(r'^\s*Vrf +is +(?P<vrf>\S+) \(vrfid +(?P<vrf_id>[a-z0-9]+)\)$')
+            p2 = regex_engine.compile(r'^\s*Vrf +is +(?P<vrf>\S+) \(vrfid +(?P<vrf_id>[a-z0-9]+)\)$')
             m = p2.match(line)
             if m:
                 vrf = str(m.groupdict()['vrf'])
@@ -1273,9 +1274,9 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Interface is unnumbered.  Using address of Loopback11 (10.69.111.111/32)
-            p2_1 = re.compile(r'^\s*Interface is unnumbered. +Using +address'
-                               r' +of +(?P<unnumbered_intf_ref>\S+)'
-                               r' +\((?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)\)$')
+            p2_1 = regex_engine.compile(r'^\s*Interface is unnumbered. +Using +address'
+                                         r' +of +(?P<unnumbered_intf_ref>\S+)'
+                                         r' +\((?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)\)$')
             m = p2_1.match(line)
             if m:
                 unnumbered_intf_ref = m.groupdict()['unnumbered_intf_ref']
@@ -1305,9 +1306,9 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Internet address is 10.1.1.1/24 with route-tag 50
-            p3 = re.compile(r'^\s*Internet +address +is +(?P<ip>[0-9\.]+)\/'
-                             r'(?P<prefix_length>[0-9]+)(?: +with +route-tag'
-                             r' +(?P<route_tag>[0-9]+))?$')
+            p3 = regex_engine.compile(r'^\s*Internet +address +is +(?P<ip>[0-9\.]+)\/'
+                                       r'(?P<prefix_length>[0-9]+)(?: +with +route-tag'
+                                       r' +(?P<route_tag>[0-9]+))?$')
             m = p3.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -1329,9 +1330,9 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Secondary address 10.2.2.2/24
-            p4 = re.compile(r'^\s*(?P<secondary>(Secondary)) +address'
-                             r' +(?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)(?:'
-                             r' +with +route-tag +(?P<route_tag>[0-9]+))?$')
+            p4 = regex_engine.compile(r'^\s*(?P<secondary>(Secondary)) +address'
+                                       r' +(?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)(?:'
+                                       r' +with +route-tag +(?P<route_tag>[0-9]+))?$')
             m = p4.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -1356,9 +1357,9 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # MTU is 1600 (1586 is available to IP)
-            p5 = re.compile(r'^\s*MTU is +(?P<mtu>[0-9]+)'
-                             r' +\((?P<mtu_available>[0-9]+) +is +available +to'
-                             r' +IP\)$')
+            p5 = regex_engine.compile(r'^\s*MTU is +(?P<mtu>[0-9]+)'
+                                       r' +\((?P<mtu_available>[0-9]+) +is +available +to'
+                                       r' +IP\)$')
             m = p5.match(line)
             if m:
                 mtu = m.groupdict()['mtu']
@@ -1373,7 +1374,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Helper address is not set
-            p6 = re.compile(r'^\s*Helper +address +is +(?P<helper_address>[a-z\s]+)$')
+            p6 = regex_engine.compile(r'^\s*Helper +address +is +(?P<helper_address>[a-z\s]+)$')
             m = p6.match(line)
             if m:
                 helper_address = str(m.groupdict()['helper_address'])
@@ -1384,7 +1385,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Multicast reserved groups joined: 224.0.0.2 224.0.0.1 224.0.0.2
-            p6_1 = re.compile(r'^\s*Multicast +reserved +groups +joined: +(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
+            p6_1 = regex_engine.compile(r'^\s*Multicast +reserved +groups +joined: +(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
             m = p6_1.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups_address'])
@@ -1400,7 +1401,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # 224.0.0.5 224.0.0.6
-            p6_2 = re.compile(r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
+            p6_2 = regex_engine.compile(r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
             m = p6_2.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups_address'])
@@ -1416,8 +1417,8 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Directed broadcast forwarding is disabled
-            p7 = re.compile(r'^\s*Directed +broadcast +forwarding +is'
-                             r' +(?P<broadcast_forwarding>[a-zA-Z]+)$')
+            p7 = regex_engine.compile(r'^\s*Directed +broadcast +forwarding +is'
+                                       r' +(?P<broadcast_forwarding>[a-zA-Z]+)$')
             m = p7.match(line)
             if m:
                 broadcast_forwarding = str(m.groupdict()['broadcast_forwarding'])
@@ -1427,8 +1428,8 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Outgoing access list is not set
-            p8 = re.compile(r'^\s*Outgoing +access +list +is'
-                             r' +(?P<out_access_list>[a-zA-Z\s]+)$')
+            p8 = regex_engine.compile(r'^\s*Outgoing +access +list +is'
+                                       r' +(?P<out_access_list>[a-zA-Z\s]+)$')
             m = p8.match(line)
             if m:
                 out_access_list = str(m.groupdict()['out_access_list'])
@@ -1439,8 +1440,8 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Inbound  access list is not set
-            p9 = re.compile(r'^\s*Inbound +access +list +is'
-                             r' +(?P<in_access_list>[a-zA-Z\s]+)$')
+            p9 = regex_engine.compile(r'^\s*Inbound +access +list +is'
+                                       r' +(?P<in_access_list>[a-zA-Z\s]+)$')
             m = p9.match(line)
             if m:
                 in_access_list = str(m.groupdict()['in_access_list'])
@@ -1451,9 +1452,9 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Inbound  common access list is not set, access list is not set
-            p9_1 = re.compile(r'^\s*Inbound +common +access +list +is'
-                               r' +(?P<in_common_access_list>[a-zA-Z\s]+), '
-                               r'+access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$')
+            p9_1 = regex_engine.compile(r'^\s*Inbound +common +access +list +is'
+                                         r' +(?P<in_common_access_list>[a-zA-Z\s]+), '
+                                         r'+access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$')
             m = p9_1.match(line)
             if m:
                 in_common_access_list = str(m.groupdict()['in_common_access_list'])
@@ -1469,7 +1470,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Proxy ARP is disabled
-            p10 = re.compile(r'^\s*Proxy +ARP +is +(?P<proxy_arp>[a-zA-Z]+)$')
+            p10 = regex_engine.compile(r'^\s*Proxy +ARP +is +(?P<proxy_arp>[a-zA-Z]+)$')
             m = p10.match(line)
             if m:
                 proxy_arp = str(m.groupdict()['proxy_arp'])
@@ -1478,7 +1479,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # ICMP redirects are never sent
-            p11 = re.compile(r'^\s*ICMP +redirects +(are|is) +(?P<icmp_redirects>[a-zA-Z\s]+)$')
+            p11 = regex_engine.compile(r'^\s*ICMP +redirects +(are|is) +(?P<icmp_redirects>[a-zA-Z\s]+)$')
             m = p11.match(line)
             if m:
                 icmp_redirects = str(m.groupdict()['icmp_redirects'])
@@ -1487,8 +1488,8 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # ICMP unreachables are always sent
-            p12 = re.compile(r'^\s*ICMP +unreachables +(are|is)'
-                              r' +(?P<icmp_unreachables>[a-zA-Z\s]+)$')
+            p12 = regex_engine.compile(r'^\s*ICMP +unreachables +(are|is)'
+                                        r' +(?P<icmp_unreachables>[a-zA-Z\s]+)$')
             m = p12.match(line)
             if m:
                 icmp_unreachables = str(m.groupdict()['icmp_unreachables'])
@@ -1498,7 +1499,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # ICMP mask replies are never sent
-            p13 = re.compile(r'^\s*ICMP +mask +replies +(are|is) +(?P<icmp_replies>[a-zA-Z\s]+)$')
+            p13 = regex_engine.compile(r'^\s*ICMP +mask +replies +(are|is) +(?P<icmp_replies>[a-zA-Z\s]+)$')
             m = p13.match(line)
             if m:
                 icmp_replies = str(m.groupdict()['icmp_replies'])
@@ -1507,7 +1508,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Table Id is 0xe0000011
-            p13 = re.compile(r'^\s*Table +Id +is +(?P<table_id>[a-z0-9]+)$')
+            p13 = regex_engine.compile(r'^\s*Table +Id +is +(?P<table_id>[a-z0-9]+)$')
             m = p13.match(line)
             if m:
                 table_id = str(m.groupdict()['table_id'])
@@ -1602,16 +1603,16 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # show ipv6 vrf {vrf} interface {interface}
             # show ipv6 vrf {vrf} interface', 'show ipv6 vrf all interface
-            p1 = re.compile(r'^show +[\S\s]+$')
+            p1 = regex_engine.compile(r'^show +[\S\s]+$')
             m = p1.match(line)
             if m:
                 continue
 
             # GigabitEthernet0/0/0/0 is Shutdown, ipv6 protocol is Down, Vrfid is VRF1 (0x60000002)
             # nve100 is Up, ipv6 protocol is Unknown, Vrfid is default (0x60000000)
-            p1_1 = re.compile(r'^\s*(?P<interface>\S+) +is +(?P<int_status>[a-zA-Z]+),'
-                             r' +ipv6 +protocol +is +(?P<oper_status>[a-zA-Z]+),'
-                             r' +Vrfid +is +(?P<vrf>\S+) +\((?P<vrf_id>[a-z0-9]+)\)$')
+            p1_1 = regex_engine.compile(r'^\s*(?P<interface>\S+) +is +(?P<int_status>[a-zA-Z]+),'
+                                       r' +ipv6 +protocol +is +(?P<oper_status>[a-zA-Z]+),'
+                                       r' +Vrfid +is +(?P<vrf>\S+) +\((?P<vrf_id>[a-z0-9]+)\)$')
             m = p1_1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1638,9 +1639,9 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # IPv6 is enabled, link-local address is fe80::a8aa:bbff:feff:8888 [TENTATIVE]
-            p2 = re.compile(r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
-                             r' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)'
-                             r' +\[(?P<ipv6_link_local_state>[A-Z]+)\]$')
+            p2 = regex_engine.compile(r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
+                                       r' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)'
+                                       r' +\[(?P<ipv6_link_local_state>[A-Z]+)\]$')
             m = p2.match(line)
             if m:
                 enabled = bool(m.groupdict()['enabled'])
@@ -1651,8 +1652,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # IPv6 is enabled, link-local address is fe80::a8aa:bbff:feff:8888
-            p2_1 = re.compile(r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
-                               r' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)$')
+            p2_1 = regex_engine.compile(r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
+                                         r' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)$')
             m = p2_1.match(line)
             if m:
                 enabled = bool(m.groupdict()['enabled'])
@@ -1661,8 +1662,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # IPv6 is disabled, link-local address unassigned
-            p2_2 = re.compile(r'^\s*(?P<enabled>(IPv6 is disabled)),'
-                               r' +link-local +address +(?P<ipv6_link_local>[a-zA-Z]+)$')
+            p2_2 = regex_engine.compile(r'^\s*(?P<enabled>(IPv6 is disabled)),'
+                                         r' +link-local +address +(?P<ipv6_link_local>[a-zA-Z]+)$')
             m = p2_2.match(line)
             if m:
                 enabled = bool(m.groupdict()['enabled'])
@@ -1672,10 +1673,10 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # Global unicast address(es):
             # 2001:db8:3:3:a8aa:bbff:feff:8888, subnet is 2001:db8:3:3::/64 [TENTATIVE]
-            p3 = re.compile(r'^\s*(?P<ipv6>(.+)(ff:fe)(.+)), +subnet +is'
-                             r' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/(?P<ipv6_prefix_length>[0-9]+)'
-                             r' +\[(?P<ipv6_status>[A-Z]+)\](?: +with +route-tag'
-                             r' +(?P<ipv6_route_tag>[0-9]+))?$')
+            p3 = regex_engine.compile(r'^\s*(?P<ipv6>(.+)(ff:fe)(.+)), +subnet +is'
+                                       r' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/(?P<ipv6_prefix_length>[0-9]+)'
+                                       r' +\[(?P<ipv6_status>[A-Z]+)\](?: +with +route-tag'
+                                       r' +(?P<ipv6_route_tag>[0-9]+))?$')
             m = p3.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
@@ -1715,11 +1716,11 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # Global unicast address(es):
             # 2001:db8:4:4::4, subnet is 2001:db8:4:4::/64 [TENTATIVE] with route-tag 10
-            p3_1 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
-                               r' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
-                               r'(?P<ipv6_prefix_length>[0-9]+)'
-                               r' +\[(?P<ipv6_status>[A-Z]+)\] +with +route-tag'
-                               r' +(?P<ipv6_route_tag>[0-9]+)$')
+            p3_1 = regex_engine.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
+                                         r' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
+                                         r'(?P<ipv6_prefix_length>[0-9]+)'
+                                         r' +\[(?P<ipv6_status>[A-Z]+)\] +with +route-tag'
+                                         r' +(?P<ipv6_route_tag>[0-9]+)$')
             m = p3_1.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
@@ -1756,10 +1757,10 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # Global unicast address(es):
             # 2001:db8:1:1::1, subnet is 2001:db8:1:1::/64 [TENTATIVE]
-            p3_2 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
-                               r' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
-                               r'(?P<ipv6_prefix_length>[0-9]+)'
-                               r' +\[(?P<ipv6_status>[A-Z]+)\]?$')
+            p3_2 = regex_engine.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
+                                         r' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
+                                         r'(?P<ipv6_prefix_length>[0-9]+)'
+                                         r' +\[(?P<ipv6_status>[A-Z]+)\]?$')
             m = p3_2.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
@@ -1793,9 +1794,9 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # Global unicast address(es):
             # 2001:db8:1:1::1, subnet is 2001:db8:1:1::/64
-            p3_3 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
-                               r' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
-                               r'(?P<ipv6_prefix_length>[0-9]+)$')
+            p3_3 = regex_engine.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
+                                         r' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
+                                         r'(?P<ipv6_prefix_length>[0-9]+)$')
             m = p3_3.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
@@ -1824,7 +1825,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # Joined group address(es): ff02::1:ff00:1 ff02::1:ffa6:78c5 ff02::2
             #ff02::1
-            p4 = re.compile(r'^\s*Joined +group +address\(es\): +(?P<ipv6_group_address>[a-z0-9\:\s]+)$')
+            p4 = regex_engine.compile(r'^\s*Joined +group +address\(es\): +(?P<ipv6_group_address>[a-z0-9\:\s]+)$')
             m = p4.match(line)
             if m:
                 ipv6_group_address = str(m.groupdict()['ipv6_group_address'])
@@ -1840,7 +1841,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ipv6_vrf_all_interface_dict[interface]['ipv6']['ipv6_groups'] = ipv6_groups
                 continue
 
-            p4_1 = re.compile(r'^\s*(?P<ipv6_group_address>[a-z0-9\:\s]+)$')
+            p4_1 = regex_engine.compile(r'^\s*(?P<ipv6_group_address>[a-z0-9\:\s]+)$')
             m = p4_1.match(line)
             if m:
                 ipv6_group_address = str(m.groupdict()['ipv6_group_address'])
@@ -1856,9 +1857,9 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # MTU is 1600 (1586 is available to IPv6)
-            p5 = re.compile(r'^\s*MTU +is +(?P<ipv6_mtu>[0-9]+)'
-                             r' +\((?P<ipv6_mtu_available>[0-9]+) +is +available'
-                             r' +to +IPv6\)$')
+            p5 = regex_engine.compile(r'^\s*MTU +is +(?P<ipv6_mtu>[0-9]+)'
+                                       r' +\((?P<ipv6_mtu_available>[0-9]+) +is +available'
+                                       r' +to +IPv6\)$')
             m = p5.match(line)
             if m:
                 ipv6_mtu = m.groupdict()['ipv6_mtu']
@@ -1871,7 +1872,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ICMP redirects are disabled
-            p6 = re.compile(r'^\s*ICMP +redirects +are +(?P<icmp_redirects>[a-z]+)$')
+            p6 = regex_engine.compile(r'^\s*ICMP +redirects +are +(?P<icmp_redirects>[a-z]+)$')
             m = p6.match(line)
             if m:
                 icmp_redirects = m.groupdict()['icmp_redirects']
@@ -1881,8 +1882,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ICMP unreachables are enabled
-            p7 = re.compile(r'^\s*ICMP +unreachables +are'
-                             r' +(?P<icmp_unreachables>[a-z]+)$')
+            p7 = regex_engine.compile(r'^\s*ICMP +unreachables +are'
+                                       r' +(?P<icmp_unreachables>[a-z]+)$')
             m = p7.match(line)
             if m:
                 icmp_unreachables = m.groupdict()['icmp_unreachables']
@@ -1892,8 +1893,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND DAD is enabled, number of DAD attempts 1
-            p8 = re.compile(r'^\s*ND +DAD +is +(?P<nd_dad>[a-z]+), +number +of +DAD'
-                             r' +attempts +(?P<dad_attempts>[0-9]+)$')
+            p8 = regex_engine.compile(r'^\s*ND +DAD +is +(?P<nd_dad>[a-z]+), +number +of +DAD'
+                                       r' +attempts +(?P<dad_attempts>[0-9]+)$')
             m = p8.match(line)
             if m:
                 nd_dad = m.groupdict()['nd_dad']
@@ -1906,8 +1907,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND reachable time is 0 milliseconds
-            p9 = re.compile(r'^\s*ND +reachable +time +is'
-                             r' +(?P<nd_reachable_time>[0-9]+) +milliseconds$')
+            p9 = regex_engine.compile(r'^\s*ND +reachable +time +is'
+                                       r' +(?P<nd_reachable_time>[0-9]+) +milliseconds$')
             m = p9.match(line)
             if m:
                 nd_reachable_time = m.groupdict()['nd_reachable_time']
@@ -1917,8 +1918,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND cache entry limit is 1000000000
-            p10 = re.compile(r'^\s*ND +cache +entry +limit +is'
-                              r' +(?P<nd_cache_limit>[0-9]+)$')
+            p10 = regex_engine.compile(r'^\s*ND +cache +entry +limit +is'
+                                        r' +(?P<nd_cache_limit>[0-9]+)$')
             m = p10.match(line)
             if m:
                 nd_cache_limit = m.groupdict()['nd_cache_limit']
@@ -1928,8 +1929,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND advertised retransmit interval is 0 milliseconds
-            p11 = re.compile(r'^\s*ND +advertised +retransmit +interval +is'
-                              r' +(?P<nd_adv_retrans_int>[0-9]+) +milliseconds$')
+            p11 = regex_engine.compile(r'^\s*ND +advertised +retransmit +interval +is'
+                                        r' +(?P<nd_adv_retrans_int>[0-9]+) +milliseconds$')
             m = p11.match(line)
             if m:
                 nd_adv_retrans_int = m.groupdict()['nd_adv_retrans_int']
@@ -1939,8 +1940,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND router advertisements are sent every 160 to 240 seconds
-            p11_1 = re.compile(r'^\s*ND +router +advertisements +are +sent'
-                                r' +every +(?P<nd_adv_duration>[a-z0-9\s]+) +seconds$')
+            p11_1 = regex_engine.compile(r'^\s*ND +router +advertisements +are +sent'
+                                          r' +every +(?P<nd_adv_duration>[a-z0-9\s]+) +seconds$')
             m = p11_1.match(line)
             if m:
                 nd_adv_duration = m.groupdict()['nd_adv_duration']
@@ -1952,8 +1953,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND router advertisements live for 1800 seconds
-            p11_2 = re.compile(r'^\s*ND +router +advertisements +live +for'
-                                r' +(?P<nd_router_adv>[0-9]+) +seconds$')
+            p11_2 = regex_engine.compile(r'^\s*ND +router +advertisements +live +for'
+                                          r' +(?P<nd_router_adv>[0-9]+) +seconds$')
             m = p11_2.match(line)
             if m:
                 nd_router_adv = m.groupdict()['nd_router_adv']
@@ -1962,8 +1963,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Hosts use stateless autoconfig for addresses.
-            p12 = re.compile(r'^\s*Hosts +use +(?P<stateless_autoconfig>(stateless))'
-                              r' +autoconfig +for +addresses.$')
+            p12 = regex_engine.compile(r'^\s*Hosts +use +(?P<stateless_autoconfig>(stateless))'
+                                        r' +autoconfig +for +addresses.$')
             m = p12.match(line)
             if m:
                 stateless_autoconfig = m.groupdict()['stateless_autoconfig']
@@ -1973,8 +1974,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Outgoing access list is not set
-            p13 = re.compile(r'^\s*Outgoing +access +list +is'
-                              r' +(?P<out_access_list>[a-zA-Z\s]+)$')
+            p13 = regex_engine.compile(r'^\s*Outgoing +access +list +is'
+                                        r' +(?P<out_access_list>[a-zA-Z\s]+)$')
             m = p13.match(line)
             if m:
                 out_access_list = m.groupdict()['out_access_list']
@@ -1985,8 +1986,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Inbound  access list is not set
-            p14 = re.compile(r'^\s*Inbound +access +list +is'
-                              r' +(?P<in_access_list>[a-zA-Z\s]+)$')
+            p14 = regex_engine.compile(r'^\s*Inbound +access +list +is'
+                                        r' +(?P<in_access_list>[a-zA-Z\s]+)$')
             m = p14.match(line)
             if m:
                 in_access_list = m.groupdict()['in_access_list']
@@ -1996,9 +1997,9 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Inbound  common access list is not set, access list is not set
-            p14_1 = re.compile(r'^\s*Inbound +common +access +list +is'
-                                r' +(?P<in_common_access_list>[a-zA-Z\s]+),'
-                                r' +access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$')
+            p14_1 = regex_engine.compile(r'^\s*Inbound +common +access +list +is'
+                                          r' +(?P<in_common_access_list>[a-zA-Z\s]+),'
+                                          r' +access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$')
             m = p14_1.match(line)
             if m:
                 in_common_access_list = m.groupdict()['in_common_access_list']
@@ -2012,7 +2013,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Table Id is 0xe0800011
-            p15 = re.compile(r'^\s*Table +Id +is +(?P<table_id>[a-z0-9]+)$')
+            p15 = regex_engine.compile(r'^\s*Table +Id +is +(?P<table_id>[a-z0-9]+)$')
             m = p15.match(line)
             if m:
                 table_id = m.groupdict()['table_id']
@@ -2022,8 +2023,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Complete protocol adjacency: 0
-            p16 = re.compile(r'^\s*Complete +protocol +adjacency:'
-                              r' +(?P<complete_protocol_adj>[0-9]+)$')
+            p16 = regex_engine.compile(r'^\s*Complete +protocol +adjacency:'
+                                        r' +(?P<complete_protocol_adj>[0-9]+)$')
             m = p16.match(line)
             if m:
                 complete_protocol_adj = m.groupdict()['complete_protocol_adj']
@@ -2033,8 +2034,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             #Complete glean adjacency: 0
-            p17 = re.compile(r'^\s*Complete +glean +adjacency:'
-                              r' +(?P<complete_glean_adj>[0-9]+)$')
+            p17 = regex_engine.compile(r'^\s*Complete +glean +adjacency:'
+                                        r' +(?P<complete_glean_adj>[0-9]+)$')
             m = p17.match(line)
             if m:
                 complete_glean_adj = m.groupdict()['complete_glean_adj']
@@ -2044,8 +2045,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Incomplete protocol adjacency: 0
-            p18 = re.compile(r'^\s*Incomplete +protocol +adjacency:'
-                              r' +(?P<incomplete_protocol_adj>[0-9]+)$')
+            p18 = regex_engine.compile(r'^\s*Incomplete +protocol +adjacency:'
+                                        r' +(?P<incomplete_protocol_adj>[0-9]+)$')
             m = p18.match(line)
             if m:
                 incomplete_protocol_adj = m.groupdict()['incomplete_protocol_adj']
@@ -2055,8 +2056,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Incomplete glean adjacency: 0
-            p19 = re.compile(r'^\s*Incomplete +glean +adjacency:'
-                              r' +(?P<incomplete_glean_adj>[0-9]+)$')
+            p19 = regex_engine.compile(r'^\s*Incomplete +glean +adjacency:'
+                                        r' +(?P<incomplete_glean_adj>[0-9]+)$')
             m = p19.match(line)
             if m:
                 incomplete_glean_adj = m.groupdict()['incomplete_glean_adj']
@@ -2066,8 +2067,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Dropped protocol request: 0
-            p20 = re.compile(r'^\s*Dropped +protocol +request:'
-                              r' +(?P<dropped_protocol_req>[0-9]+)$')
+            p20 = regex_engine.compile(r'^\s*Dropped +protocol +request:'
+                                        r' +(?P<dropped_protocol_req>[0-9]+)$')
             m = p20.match(line)
             if m:
                 dropped_protocol_req = m.groupdict()['dropped_protocol_req']
@@ -2077,8 +2078,8 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Dropped glean request: 0
-            p21 = re.compile(r'^\s*Dropped +glean +request:'
-                              r' +(?P<dropped_glean_req>[0-9]+)$')
+            p21 = regex_engine.compile(r'^\s*Dropped +glean +request:'
+                                        r' +(?P<dropped_glean_req>[0-9]+)$')
             m = p21.match(line)
             if m:
                 dropped_glean_req = m.groupdict()['dropped_glean_req']
@@ -2132,15 +2133,15 @@ class ShowEthernetTags(ShowEthernetTagsSchema):
             line = line.strip()
             # Interface               St  MTU  Ly Outer            Inner            Xtra -,+
             # Gi0/0/0/0.501           Up  1518 L3 .1Q:501          -                -    1 0
-            p1 = re.compile(r'^(?P<interface>[\w\/\.]+)'
-                             r' +(?P<status>\w+)'
-                             r' +(?P<mtu>\d+)'
-                             r' +(?P<layer>\w+)'
-                             r' +(?P<outer_vlan>\S+)'
-                             r' +(?P<inner_vlan>\S+)'
-                             r' +(?P<xtra>\S+)'
-                             r' +(?P<rewrite_num_of_tags_pop>\d+)'
-                             r' +(?P<rewrite_num_of_tags_push>\d+)$')
+            p1 = regex_engine.compile(r'^(?P<interface>[\w\/\.]+)'
+                                       r' +(?P<status>\w+)'
+                                       r' +(?P<mtu>\d+)'
+                                       r' +(?P<layer>\w+)'
+                                       r' +(?P<outer_vlan>\S+)'
+                                       r' +(?P<inner_vlan>\S+)'
+                                       r' +(?P<xtra>\S+)'
+                                       r' +(?P<rewrite_num_of_tags_pop>\d+)'
+                                       r' +(?P<rewrite_num_of_tags_push>\d+)$')
             m = p1.match(line)
             if m:
                 interface = Common.convert_intf_name(m.groupdict()['interface'], os="iosxr")
@@ -2231,10 +2232,10 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^\s*(?P<interface>\S+)\s*$')
-        p2 = re.compile(r'^\s*(?P<protocol>\S+)\s+(?P<pkts_in>\d+)\s+'
-                         r'(?P<chars_in>\d+)\s+(?P<pkts_out>\d+)\s+'
-                         r'(?P<chars_out>\d+)')
+        p1 = regex_engine.compile(r'^\s*(?P<interface>\S+)\s*$')
+        p2 = regex_engine.compile(r'^\s*(?P<protocol>\S+)\s+(?P<pkts_in>\d+)\s+'
+                                   r'(?P<chars_in>\d+)\s+(?P<pkts_out>\d+)\s+'
+                                   r'(?P<chars_out>\d+)')
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
@@ -2394,173 +2395,173 @@ class ShowInterfaces(ShowInterfacesSchema):
 
         # GigabitEthernet1 is up, line protocol is up
         # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-        p1 = re.compile(r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
-                         r'+line +protocol +is +(?P<line_protocol>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
+                                   r'+line +protocol +is +(?P<line_protocol>[\w\s]+)$')
 
         # Interface state transitions: 9
-        p2 = re.compile(r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$')
+        p2 = regex_engine.compile(r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$')
 
         # Hardware is Loopback
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-        p3 = re.compile(r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
-                         r'(, *address +is +(?P<mac_address>[\w\.]+))?'
-                         r'( *\(bia *(?P<phys_address>[\w\.]+)\))?$')
+        p3 = regex_engine.compile(r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
+                                   r'(, *address +is +(?P<mac_address>[\w\.]+))?'
+                                   r'( *\(bia *(?P<phys_address>[\w\.]+)\))?$')
 
         # Layer 2 Transport Mode
-        p4 = re.compile(r'^Layer +2 +Transport +Mode$')
+        p4 = regex_engine.compile(r'^Layer +2 +Transport +Mode$')
 
         # Description: to-ML26-BE1
-        p5 = re.compile(r'^Description: *(?P<description>.*)$')
+        p5 = regex_engine.compile(r'^Description: *(?P<description>.*)$')
 
         # Internet address is 10.4.4.4/24
         # Internet address is Unknown
-        p6 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
-                         r'\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$')
+        p6 = regex_engine.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
+                                   r'\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$')
 
         # MTU 1500 bytes, BW 10000 Kbit
         # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-        p7 = re.compile(r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
-                         r'(.*Max: +(?P<bandwidth_max>[\d]+).*)?$')
+        p7 = regex_engine.compile(r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
+                                   r'(.*Max: +(?P<bandwidth_max>[\d]+).*)?$')
 
         # reliability 255/255, txload 1/255, rxload 1/255
         # reliability Unknown, txload Unknown, rxload Unknown
-        p8 = re.compile(r'^reliability +(?P<reliability>[\w\/]+), '
-                         r'+txload +(?P<txload>[\w\/]+), +rxload '
-                         r'+(?P<rxload>[\w\/]+)$')
+        p8 = regex_engine.compile(r'^reliability +(?P<reliability>[\w\/]+), '
+                                   r'+txload +(?P<txload>[\w\/]+), +rxload '
+                                   r'+(?P<rxload>[\w\/]+)$')
 
         # Encapsulation ARPA,
         # Encapsulation 802.1Q Virtual LAN,
         # Encapsulation ARPA,  loopback not set,
         # Encapsulation 802.1Q Virtual LAN, VLAN Id 10,  loopback not set,
         # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-        p9 = re.compile(r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
-                         r'( +VLAN +Id +(?P<first_dot1q>\d+),)?'
-                         r'( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
-                         r'( +loopback +(?P<loopback>[\w\s]+),)?$')
+        p9 = regex_engine.compile(r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
+                                   r'( +VLAN +Id +(?P<first_dot1q>\d+),)?'
+                                   r'( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
+                                   r'( +loopback +(?P<loopback>[\w\s]+),)?$')
 
         # Outer Match: Dot1Q VLAN 300
-        p10 = re.compile(r'^Outer +Match: +(?P<outer_match>[\w\s]+)$')
+        p10 = regex_engine.compile(r'^Outer +Match: +(?P<outer_match>[\w\s]+)$')
 
         # Ethertype Any, MAC Match src any, dest any
-        p11 = re.compile(r'^Ethertype +(?P<ethertype>\w+), '
-                           r'+MAC +Match +(?P<mac_match>[\w\s]+), '
-                           r'+dest +(?P<dest>\w+)$')
+        p11 = regex_engine.compile(r'^Ethertype +(?P<ethertype>\w+), '
+                                     r'+MAC +Match +(?P<mac_match>[\w\s]+), '
+                                     r'+dest +(?P<dest>\w+)$')
 
         # Full-duplex, 0Kb/s
         # Full-duplex, 1000Mb/s, link type is force-up
         # Full-duplex, Auto Speed, SR, link type is force-up
         # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-        p12 = re.compile(r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
-                          r'+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
-                          r'(, +link +type +is +(?P<link_type>\S+))?$')
+        p12 = regex_engine.compile(r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
+                                    r'+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
+                                    r'(, +link +type +is +(?P<link_type>\S+))?$')
 
         # output flow control is off, input flow control is off
         # output flow control is off, input flow control is unsupported
-        p13 = re.compile(r'^output +flow +control +is +(?P<send>\w+), +'
-                          r'input +flow +control +is +(?P<receive>\w+)$')
+        p13 = regex_engine.compile(r'^output +flow +control +is +(?P<send>\w+), +'
+                                    r'input +flow +control +is +(?P<receive>\w+)$')
 
         # Carrier delay (up) is 10 msec
         # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-        p14 = re.compile(r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
-                r'(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$')
+        p14 = regex_engine.compile(r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
+                          r'(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$')
 
         # loopback not set,
-        p15 = re.compile(r'^loopback +(?P<loopback>[\w\s]+),$')
+        p15 = regex_engine.compile(r'^loopback +(?P<loopback>[\w\s]+),$')
 
         # Last link flapped 5w6d
-        p16 = re.compile(r'^Last +link +flapped +(?P<last_link_flapped>\S+)$')
+        p16 = regex_engine.compile(r'^Last +link +flapped +(?P<last_link_flapped>\S+)$')
 
         # ARP type ARPA, ARP timeout 04:00:00
-        p17 = re.compile(r'^ARP +type +(?P<arp_type>\w+), +'
-                          r'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$')
+        p17 = regex_engine.compile(r'^ARP +type +(?P<arp_type>\w+), +'
+                                    r'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$')
 
         # Last input never, output 00:01:05
-        p18 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          r'output +(?P<last_output>[\w\.\:]+)$')
+        p18 = regex_engine.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+                                    r'output +(?P<last_output>[\w\.\:]+)$')
 
         # No. of members in this bundle: 1
-        p19 = re.compile(r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$')
+        p19 = regex_engine.compile(r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$')
 
         # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-        p20 = re.compile(r'^(?P<interface>[\w\/\.]+) '
-                          r'+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
-                          r'+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$')
+        p20 = regex_engine.compile(r'^(?P<interface>[\w\/\.]+) '
+                                    r'+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
+                                    r'+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$')
 
         # Last clearing of "show interface" counters 1d02h
-        p21 = re.compile(r'^Last +clearing +of +"show +interface" +counters +'
-                          r'(?P<last_clear>[\w\:\.]+)$')
+        p21 = regex_engine.compile(r'^Last +clearing +of +"show +interface" +counters +'
+                                    r'(?P<last_clear>[\w\:\.]+)$')
 
         # Input/output data rate is disabled.
-        p22 = re.compile(r'^Input\/output +data +rate +is +disabled\.$')
+        p22 = regex_engine.compile(r'^Input\/output +data +rate +is +disabled\.$')
 
         # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p23 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          r' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
-                          r' +(?P<in_rate>[\d]+) +bits/sec,'
-                          r' +(?P<in_rate_pkts>[\d]+) +packets/sec$')
+        p23 = regex_engine.compile(r'^(?P<load_interval>[\d\#]+)'
+                                    r' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
+                                    r' +(?P<in_rate>[\d]+) +bits/sec,'
+                                    r' +(?P<in_rate_pkts>[\d]+) +packets/sec$')
 
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p24 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          r' *(minute|second|minutes|seconds) +output +rate'
-                          r' +(?P<out_rate>[\d]+) +bits/sec,'
-                          r' +(?P<out_rate_pkts>[\d]+) +packets/sec$')
+        p24 = regex_engine.compile(r'^(?P<load_interval>[\d\#]+)'
+                                    r' *(minute|second|minutes|seconds) +output +rate'
+                                    r' +(?P<out_rate>[\d]+) +bits/sec,'
+                                    r' +(?P<out_rate_pkts>[\d]+) +packets/sec$')
 
         # 0 packets input, 0 bytes
         # 0 packets input, 0 bytes, 0 total input drops
-        p25 = re.compile(r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
-                          r'(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$')
+        p25 = regex_engine.compile(r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
+                                    r'(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$')
 
         # 1258859 drops for unrecognized upper-level protocol
-        p26 = re.compile(r'(?P<in_unknown_protos>[\d]+) +drops +for '
-                          r'+unrecognized +upper-level +protocol$')
+        p26 = regex_engine.compile(r'(?P<in_unknown_protos>[\d]+) +drops +for '
+                                    r'+unrecognized +upper-level +protocol$')
 
         # 0 input drops, 0 queue drops, 0 input errors
-        p27 = re.compile(r'(?P<in_drops>[\d]+) +input +drops, '
-                          r'+(?P<in_queue_drops>[\d]+) +queue +drops, '
-                          r'+(?P<in_errors>[\d]+) +input +errors$')
+        p27 = regex_engine.compile(r'(?P<in_drops>[\d]+) +input +drops, '
+                                    r'+(?P<in_queue_drops>[\d]+) +queue +drops, '
+                                    r'+(?P<in_errors>[\d]+) +input +errors$')
 
         # Received 0 broadcast packets, 0 multicast packets
-        p28 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
-                          r'+(?P<in_multicast_pkts>\d+) +multicast +packets$')
+        p28 = regex_engine.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
+                                    r'+(?P<in_multicast_pkts>\d+) +multicast +packets$')
 
         # 0 runts, 0 giants, 0 throttles, 0 parity
-        p29 = re.compile(r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
-                          r'+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$')
+        p29 = regex_engine.compile(r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
+                                    r'+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$')
 
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p30 = re.compile(r'^(?P<in_errors>[\d]+) +input +errors, +'
-                          r'(?P<in_crc_errors>[\d]+) +CRC, +'
-                          r'(?P<in_frame>[\d]+) +frame, +'
-                          r'(?P<in_overrun>[\d]+) +overrun, +'
-                          r'(?P<in_ignored>[\d]+) +ignored, +'
-                          r'(?P<in_abort>[\d]+) +abort$')
+        p30 = regex_engine.compile(r'^(?P<in_errors>[\d]+) +input +errors, +'
+                                    r'(?P<in_crc_errors>[\d]+) +CRC, +'
+                                    r'(?P<in_frame>[\d]+) +frame, +'
+                                    r'(?P<in_overrun>[\d]+) +overrun, +'
+                                    r'(?P<in_ignored>[\d]+) +ignored, +'
+                                    r'(?P<in_abort>[\d]+) +abort$')
 
         # 0 packets output, 0 bytes
         # 0 packets output, 0 bytes, 0 total output drops
-        p31 = re.compile(r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
-                          r'(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$')
+        p31 = regex_engine.compile(r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
+                                    r'(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$')
 
         # Output 0 broadcast packets, 178045 multicast packets
-        p32 = re.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
-                          r'+(?P<out_multicast_pkts>\d+) +multicast +packets$')
+        p32 = regex_engine.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
+                                    r'+(?P<out_multicast_pkts>\d+) +multicast +packets$')
 
         # 0 output errors, 0 underruns, 0 applique, 0 resets
-        p33 = re.compile(r'^(?P<out_errors>[\d]+) +output +errors, '
-                          r'+(?P<out_underruns>[\d]+) +underruns, '
-                          r'+(?P<out_applique>[\d]+) +applique, '
-                          r'+(?P<out_resets>[\d]+) +resets$')
+        p33 = regex_engine.compile(r'^(?P<out_errors>[\d]+) +output +errors, '
+                                    r'+(?P<out_underruns>[\d]+) +underruns, '
+                                    r'+(?P<out_applique>[\d]+) +applique, '
+                                    r'+(?P<out_resets>[\d]+) +resets$')
 
         # 0 output drops, 0 queue drops, 0 output errors
-        p34 = re.compile(r'(?P<out_drops>[\d]+) +output +drops, '
-                          r'+(?P<out_queue_drops>[\d]+) +queue +drops, '
-                          r'+(?P<out_errors>[\d]+) +output +errors$')
+        p34 = regex_engine.compile(r'(?P<out_drops>[\d]+) +output +drops, '
+                                    r'+(?P<out_queue_drops>[\d]+) +queue +drops, '
+                                    r'+(?P<out_errors>[\d]+) +output +errors$')
 
         # 0 output buffer failures, 0 output buffers swapped out
-        p35 = re.compile(r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
-                          r'+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$')
+        p35 = regex_engine.compile(r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
+                                    r'+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$')
 
         # 0 carrier transitions
-        p36 = re.compile(r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$')
+        p36 = regex_engine.compile(r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2990,11 +2991,11 @@ class ShowInterfacesDescription(ShowInterfacesDescriptionSchema):
 
 
         # Interface 		Status 		Protocol 	Description
-        p1 = re.compile(r'^Interface\s+Status\s+Protocol\s+Description$')
+        p1 = regex_engine.compile(r'^Interface\s+Status\s+Protocol\s+Description$')
 
         # PO0/0     		admin down  down 		First POS interface
-        p2 = re.compile(r'^(?P<interface>\S+)\s+(?P<status>\S+([\s+](\S+))?)\s+'
-                        r'(?P<protocol>\S+)\s*(?: +(?P<description>.*))?$')
+        p2 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<status>\S+([\s+](\S+))?)\s+'
+                                  r'(?P<protocol>\S+)\s*(?: +(?P<description>.*))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3080,7 +3081,7 @@ class ShowInterfaceSummary(ShowInterfaceSummarySchema):
         ret_dict = {}
 
         # IFT_FORTYGETHERNET      2        1        0        1
-        p1 = re.compile(r'^(?P<type>\w+|ALL TYPES)\s+(?P<total>\d+)\s+(?P<up>\d+)\s+(?P<down>\d+)\s+(?P<admin_down>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<type>\w+|ALL TYPES)\s+(?P<total>\d+)\s+(?P<up>\d+)\s+(?P<down>\d+)\s+(?P<admin_down>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6,15 +6,13 @@
 
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ======================================================
@@ -79,46 +77,46 @@ class ShowIpBgp(ShowIpBgpSchema):
             output = self.device.execute(self.cli_command[0].format(route=route))
 
         # BGP routing table entry for 70.3.3.3/32
-        p1 = re.compile(r'^BGP\s+routing\s+table\s+entry\s+for\s+(?P<prefix>(?P<ip>[a-z0-9.:\/]+)\/(?P<mask>\d+))$')
+        p1 = regex_engine.compile(r'^BGP\s+routing\s+table\s+entry\s+for\s+(?P<prefix>(?P<ip>[a-z0-9.:\/]+)\/(?P<mask>\d+))$')
 
         # Last Modified: Mar 27 02:45:20.105 for 1d15h
-        p2 = re.compile(r'^Last +Modified: (?P<last_modified>.*)$')
+        p2 = regex_engine.compile(r'^Last +Modified: (?P<last_modified>.*)$')
 
         # Paths: (1 available, best #1)
-        p3 = re.compile(r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$')
+        p3 = regex_engine.compile(r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$')
 
         # Path #1: Received by speaker 0
-        p4 = re.compile(r'^Path\s+#(?P<path_num>\d+):.*$')
+        p4 = regex_engine.compile(r'^Path\s+#(?P<path_num>\d+):.*$')
 
         # 0.2
-        p5 = re.compile(r'^(?P<advertised_peer>[\d\.]+)$')
+        p5 = regex_engine.compile(r'^(?P<advertised_peer>[\d\.]+)$')
 
         # 7000, (Received from a RR-client)
         # Local, (Received from a RR-client)
-        p6 = re.compile(r'^(?P<as_path>[a-zA-Z0-9]+),.*$')
+        p6 = regex_engine.compile(r'^(?P<as_path>[a-zA-Z0-9]+),.*$')
 
         # 50.1.1.1 (metric 4) from 50.1.1.8 (50.1.1.1)
         # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
         # :: from :: (50.1.1.4)
-        p7 = re.compile(r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?')
+        p7 = regex_engine.compile(r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?')
 
         # Origin incomplete, metric 0, localpref 100, valid, internal, best, group-best
         # Origin IGP, metric 0, localpref 100, valid, external, best, group-best
         # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best
-        p8 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),'
-                         r'(?: +metric (?P<metric>[0-9]+),?)?'
-                         r'(?: +localpref (?P<localpref>[0-9]+),?)?'
-                         r'(?: +weight (?P<weight>[0-9]+),?)?'
-                         r'(?: +(?P<valid>valid?),)?'
-                         r'(?: (?P<redistributed>redistributed?),)?'
-                         r'(?: +(?P<state>(internal|external|local)?),)?'
-                         r'(\,*)?(?: (?P<best>best))?'
-                         r'(\,*)?(?: (?P<group_best>group-best?),*)?$')
+        p8 = regex_engine.compile(r'^Origin +(?P<origin>[a-zA-Z]+),'
+                                   r'(?: +metric (?P<metric>[0-9]+),?)?'
+                                   r'(?: +localpref (?P<localpref>[0-9]+),?)?'
+                                   r'(?: +weight (?P<weight>[0-9]+),?)?'
+                                   r'(?: +(?P<valid>valid?),)?'
+                                   r'(?: (?P<redistributed>redistributed?),)?'
+                                   r'(?: +(?P<state>(internal|external|local)?),)?'
+                                   r'(\,*)?(?: (?P<best>best))?'
+                                   r'(\,*)?(?: (?P<group_best>group-best?),*)?$')
 
         #  Received Path ID 0, Local Path ID 0, version 715
-        p9 = re.compile(r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
-                         r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
-                         r'version\s+(?P<version>(\d+))$')
+        p9 = regex_engine.compile(r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
+                                   r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
+                                   r'version\s+(?P<version>(\d+))$')
 
         # Initialize dictionary
         ret_dict = {}
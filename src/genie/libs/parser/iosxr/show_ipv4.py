@@ -5,10 +5,10 @@
     * show ipv4 virtual address status
 
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, ListOf
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -40,28 +40,28 @@ class ShowIpv4VirtualAddressStatus(ShowIpv4VirtualAddressStatusSchema):
         ret_dict = {}
 
         # VRF Name: default
-        p0 = re.compile(r'VRF Name:\s+(?P<vrf_name>\w+)$')
+        p0 = regex_engine.compile(r'VRF Name:\s+(?P<vrf_name>\w+)$')
 
         # Virtual IP: 5.2.21.22/16
-        p1 = re.compile(r'Virtual IP:\s+(?P<virtual_ip>.+)$')
+        p1 = regex_engine.compile(r'Virtual IP:\s+(?P<virtual_ip>.+)$')
 
         # Active Interface Name: MgmtEth0/RP0/CPU0/0
-        p2 = re.compile(r'Active Interface Name:\s+(?P<active_interface_name>.+)$')
+        p2 = regex_engine.compile(r'Active Interface Name:\s+(?P<active_interface_name>.+)$')
 
         # Active Interface MAC Address: 88fc.5dc4.9d90
-        p3 = re.compile(r'Active Interface MAC Address:\s+(?P<active_interface_mac>.+)$')
+        p3 = regex_engine.compile(r'Active Interface MAC Address:\s+(?P<active_interface_mac>.+)$')
 
         # VRF Node Create Timestamp   : .7337
-        p4 = re.compile(r'VRF Node Create Timestamp\s+:\s+(?P<vrf_node>.+)$')
+        p4 = regex_engine.compile(r'VRF Node Create Timestamp\s+:\s+(?P<vrf_node>.+)$')
 
         # ARP Add Timestamp           : Sat Jul 01 2002241054 16:32:19.1471
-        p5 = re.compile(r'ARP Add Timestamp\s+:\s+(?P<arp_add_timestamp>.+)$')
+        p5 = regex_engine.compile(r'ARP Add Timestamp\s+:\s+(?P<arp_add_timestamp>.+)$')
 
         # RIB Add Timestamp           : .7337
-        p6 = re.compile(r'RIB Add Timestamp\s+:\s+(?P<rib_add_timestamp>.+)$')
+        p6 = regex_engine.compile(r'RIB Add Timestamp\s+:\s+(?P<rib_add_timestamp>.+)$')
 
         # SNMAC Add Timestamp         : N/A
-        p7 = re.compile(r'SNMAC Add Timestamp\s+:\s+(?P<snmac_add_timestamp>.+)$')
+        p7 = regex_engine.compile(r'SNMAC Add Timestamp\s+:\s+(?P<snmac_add_timestamp>.+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -24,12 +24,12 @@ IOSXR parsers for the following show commands:
 """
 
 # Python
-import re
 from netaddr import IPAddress, IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, ListOf
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 #============================================
@@ -90,10 +90,10 @@ class ShowIsisFastRerouteSummary(ShowIsisFastRerouteSummarySchema):
 
 
         # IS-IS SR IPv4 Unicast FRR summary
-        p1 = re.compile(r'IS-IS +(?P<instance>\S+) +(?P<topology>\S+\s+\S+) +FRR +summary')
+        p1 = regex_engine.compile(r'IS-IS +(?P<instance>\S+) +(?P<topology>\S+\s+\S+) +FRR +summary')
 
         # Prefixes reachable in L1
-        p2 = re.compile(r'Prefixes +reachable +in +L(?P<level>\d+)')
+        p2 = regex_engine.compile(r'Prefixes +reachable +in +L(?P<level>\d+)')
 
         #                       Critical   High       Medium     Low        Total
         #                       Priority   Priority   Priority   Priority
@@ -101,10 +101,10 @@ class ShowIsisFastRerouteSummary(ShowIsisFastRerouteSummarySchema):
         # All paths protected     0          0          0          0          0
         # Some paths protected    0          0          0          0          0
         # Unprotected             0          0          4          6          10
-        p3 = re.compile(r'(?P<name>[\S\s]+) +(?P<critical_priority>\d+) +(?P<high_priority>\d+) +(?P<medium_priority>\d+) +(?P<low_priority>\d+) +(?P<total>\d+)')
+        p3 = regex_engine.compile(r'(?P<name>[\S\s]+) +(?P<critical_priority>\d+) +(?P<high_priority>\d+) +(?P<medium_priority>\d+) +(?P<low_priority>\d+) +(?P<total>\d+)')
 
         # Protection coverage     0.00%      0.00%      0.00%      0.00%      0.00%
-        p4 = re.compile(r'Protection +coverage +(?P<critical_priority>[\d\.\%]+) +(?P<high_priority>[\d\.\%]+) +(?P<medium_priority>[\d\.\%]+) +(?P<low_priority>[\d\.\%]+) +(?P<total>[\d\.\%]+)')
+        p4 = regex_engine.compile(r'Protection +coverage +(?P<critical_priority>[\d\.\%]+) +(?P<high_priority>[\d\.\%]+) +(?P<medium_priority>[\d\.\%]+) +(?P<low_priority>[\d\.\%]+) +(?P<total>[\d\.\%]+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -206,18 +206,18 @@ class ShowIsisAdjacency(ShowIsisAdjacencySchema):
         vrf = 'default'
 
         # IS-IS p Level-1 adjacencies:
-        p1 = re.compile(r'^IS-IS +(?P<isis_name>\w+) +(?P<level_name>\S+) adjacencies:$')
+        p1 = regex_engine.compile(r'^IS-IS +(?P<isis_name>\w+) +(?P<level_name>\S+) adjacencies:$')
 
         # 12a4           PO0/1/0/1        *PtoP*         Up    23       00:00:06 Capable  None
-        p2 = re.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None)) +(?P<hold>\S+) '
-                         r'+(?P<changed>\S+) +(?P<nsf>\S+) +(?P<bfd>(Up|Down|None|Init))$')
+        p2 = regex_engine.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None)) +(?P<hold>\S+) '
+                                   r'+(?P<changed>\S+) +(?P<nsf>\S+) +(?P<bfd>(Up|Down|None|Init))$')
 
         # Total adjacency count: 1
-        p3 = re.compile(r'^Total +adjacency +count: +(?P<adjacency_count>(\d+))$')
+        p3 = regex_engine.compile(r'^Total +adjacency +count: +(?P<adjacency_count>(\d+))$')
 
         # R1_xe          Gi0/0/0/0.115    fa16.3eff.4f49 Up    26   22:30:26 Yes None None
-        p4 = re.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None)) +(?P<hold>\S+) '
-                         r'+(?P<changed>\S+) +(?P<nsf>\S+) +(?P<ipv4_bfd>([\s\w]+)) +(?P<ipv6_bfd>([\w\s]+))$')
+        p4 = regex_engine.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None)) +(?P<hold>\S+) '
+                                   r'+(?P<changed>\S+) +(?P<nsf>\S+) +(?P<ipv4_bfd>([\s\w]+)) +(?P<ipv6_bfd>([\w\s]+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -343,14 +343,14 @@ class ShowIsisNeighbors(ShowIsisNeighborsSchema):
         vrf = 'default'
 
         # IS-IS 4445 neighbors:
-        p1 = re.compile(r'^IS-IS\s+(?P<isis_name>\S+)\s*neighbors:$')
+        p1 = regex_engine.compile(r'^IS-IS\s+(?P<isis_name>\S+)\s*neighbors:$')
 
         # R1_xe          Gi0/0/0/0.115    fa16.3eff.4f49 Up    24       L1L2 Capable
-        p2 = re.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None|Init)+) +(?P<holdtime>\S+) '
-                         r'+(?P<type>\S+) +(?P<ietf_nsf>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<system_id>\S+) +(?P<interface>\S+) +(?P<snpa>\S+) +(?P<state>(Up|Down|None|Init)+) +(?P<holdtime>\S+) '
+                                   r'+(?P<type>\S+) +(?P<ietf_nsf>\S+)$')
 
         # Total neighbor count: 1
-        p3 = re.compile(r'^Total\sneighbor\scount:\s+(?P<neighbor_count>\S+)$')
+        p3 = regex_engine.compile(r'^Total\sneighbor\scount:\s+(?P<neighbor_count>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -428,13 +428,13 @@ class ShowIsisSegmentRoutingLabelTable(ShowIsisSegmentRoutingLabelTableSchema):
         isis_dict = {}
 
         # IS-IS SR IS Label Table
-        p1 = re.compile(r'^IS-IS\s+(?P<instance>\S+)\s+IS\s+Label\s+Table$')
+        p1 = regex_engine.compile(r'^IS-IS\s+(?P<instance>\S+)\s+IS\s+Label\s+Table$')
 
         # Label         Prefix/Interface
         # ----------    ----------------
         # 16001         Loopback0
         # 16002         10.2.2.2/32
-        p2 = re.compile(r'^(?P<label>\d+)\s+(?P<prefix_interface>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<label>\d+)\s+(?P<prefix_interface>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -537,97 +537,97 @@ class ShowIsis(ShowIsisSchema):
             output = self.device.execute(self.cli_command)
 
         # IS-IS Router: test
-        r1 = re.compile(r'IS\-IS\s+Router\s*:\s*(?P<isis_router>\S+)')
+        r1 = regex_engine.compile(r'IS\-IS\s+Router\s*:\s*(?P<isis_router>\S+)')
 
         # VRF context: VRF1
-        r2 = re.compile(r'VRF\s+context\s*:\s*(?P<vrf>.+)')
+        r2 = regex_engine.compile(r'VRF\s+context\s*:\s*(?P<vrf>.+)')
 
         # System Id: 3333.33ff.6666
-        r3 = re.compile(r'System\s+Id\s*:\s*(?P<system_id>\S+)')
+        r3 = regex_engine.compile(r'System\s+Id\s*:\s*(?P<system_id>\S+)')
 
         # Instance Id: 0
-        r4 = re.compile(r'Instance\s+Id\s*:\s*(?P<instance_id>\S+)')
+        r4 = regex_engine.compile(r'Instance\s+Id\s*:\s*(?P<instance_id>\S+)')
 
         # IS Levels: level-1-2
         # IS Levels: level-2-only
         # IS Levels: level-1-only
         # IS Levels: level-1
-        r5 = re.compile(r'IS\s+Levels\s*:\s*(?P<is_levels>\S+)')
+        r5 = regex_engine.compile(r'IS\s+Levels\s*:\s*(?P<is_levels>\S+)')
 
         # Manual area address(es):
-        r6 = re.compile(r'Manual\s+area\s+address\(es\):')
+        r6 = regex_engine.compile(r'Manual\s+area\s+address\(es\):')
 
         # Routing for area address(es):
-        r7 = re.compile(r'Routing\s+for\s+area\s+address\(es\):')
+        r7 = regex_engine.compile(r'Routing\s+for\s+area\s+address\(es\):')
 
         # 49.0002
-        r8 = re.compile(r'(?P<area_address>\d+\.\d+)')
+        r8 = regex_engine.compile(r'(?P<area_address>\d+\.\d+)')
 
         # Non-stop forwarding: Disabled
-        r9 = re.compile(r'Non\-stop\s+forwarding\s*:\s*(?P<non_stop_forwarding>\w+)')
+        r9 = regex_engine.compile(r'Non\-stop\s+forwarding\s*:\s*(?P<non_stop_forwarding>\w+)')
 
         # Most recent startup mode: Cold Restart
-        r10 = re.compile(r'Most\s+recent\s+startup\s+mode\s*:\s*(?P<most_recent_startup_mode>.+)')
+        r10 = regex_engine.compile(r'Most\s+recent\s+startup\s+mode\s*:\s*(?P<most_recent_startup_mode>.+)')
 
         # TE connection status: Down
-        r11 = re.compile(r'TE\s+connection\s+status\s*:\s*(?P<te_connection_status>.+)')
+        r11 = regex_engine.compile(r'TE\s+connection\s+status\s*:\s*(?P<te_connection_status>.+)')
 
         # Topologies supported by IS-IS:
-        r12 = re.compile(r'Topologies\s+supported\s+by\s+IS\-IS:')
+        r12 = regex_engine.compile(r'Topologies\s+supported\s+by\s+IS\-IS:')
 
         # IPv4 Unicast
         # IPv6 Unicast
         # IPv4 Unicast VRF VRF1
-        r13 = re.compile(r'(?P<topology>(IPv6|IPv4)\s+Unicast)'
-                          r'(\s*VRF\s*(?P<topology_vrf>\S+))?')
+        r13 = regex_engine.compile(r'(?P<topology>(IPv6|IPv4)\s+Unicast)'
+                                    r'(\s*VRF\s*(?P<topology_vrf>\S+))?')
 
         # Level-1
         # Level-2
-        r14 = re.compile(r'Level\-(?P<level>\d+)')
+        r14 = regex_engine.compile(r'Level\-(?P<level>\d+)')
 
         # Metric style (generate/accept): Wide/Wide
-        r15 = re.compile(r'Metric\s+style\s*\(generate\/accept\)\s*:\s*'
-                          r'(?P<generate_style>\w+)\/(?P<accept_style>\w+)')
+        r15 = regex_engine.compile(r'Metric\s+style\s*\(generate\/accept\)\s*:\s*'
+                                    r'(?P<generate_style>\w+)\/(?P<accept_style>\w+)')
 
         # Metric: 10
-        r16 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)')
+        r16 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)')
 
         # ISPF status: Disabled
-        r17 = re.compile(r'ISPF\s+status\s*:\s*(?P<ispf_status>\w+)')
+        r17 = regex_engine.compile(r'ISPF\s+status\s*:\s*(?P<ispf_status>\w+)')
 
         # No protocols redistributed
-        r18 = re.compile(r'No\s+protocols\s+redistributed')
+        r18 = regex_engine.compile(r'No\s+protocols\s+redistributed')
 
         # Distance: 115
-        r19 = re.compile(r'Distance\s*:\s*(?P<distance>\d+)')
+        r19 = regex_engine.compile(r'Distance\s*:\s*(?P<distance>\d+)')
 
         # Advertise Passive Interface Prefixes Only: No
-        r20 = re.compile(r'Advertise\s+Passive\s+Interface\s+Prefixes\s+Only'
-                          r'\s*:\s*(?P<adv_passive_only>\S+)')
+        r20 = regex_engine.compile(r'Advertise\s+Passive\s+Interface\s+Prefixes\s+Only'
+                                    r'\s*:\s*(?P<adv_passive_only>\S+)')
 
         # SRLB not allocated
         # SRLB allocated: 15000 - 15999
-        r21 = re.compile(r'SRLB\s*(?P<srlb>[\w\s]+)'
-                          r'(\:\s*(?P<start>\d+)\s*\-\s*(?P<end>\d+))?')
+        r21 = regex_engine.compile(r'SRLB\s*(?P<srlb>[\w\s]+)'
+                                    r'(\:\s*(?P<start>\d+)\s*\-\s*(?P<end>\d+))?')
 
         # SRGB allocated: 16000 - 81534
         # SRGB not allocated
-        r22 = re.compile(r'SRGB\s*(?P<srgb>[\w\s]+)'
-                          r'(\:\s*(?P<start>\d+)\s*\-\s*(?P<end>\d+))?')
+        r22 = regex_engine.compile(r'SRGB\s*(?P<srgb>[\w\s]+)'
+                                    r'(\:\s*(?P<start>\d+)\s*\-\s*(?P<end>\d+))?')
 
         # Loopback0 is running actively (active in configuration)
         # GigabitEthernet0/0/0/0 is running actively (active in configuration)
-        r23 = re.compile(r'(?P<interface>\S+)\s+is\s+(?P<running_state>[\s\w]+)'
-                          r'\s+\((?P<configuration_state>[\w\s]+)\)')
+        r23 = regex_engine.compile(r'(?P<interface>\S+)\s+is\s+(?P<running_state>[\s\w]+)'
+                                    r'\s+\((?P<configuration_state>[\w\s]+)\)')
 
         # OSPF process 75688
-        r24 = re.compile(r'^(?P<protocol>\S+) process +(?P<process>\d+)$')
+        r24 = regex_engine.compile(r'^(?P<protocol>\S+) process +(?P<process>\d+)$')
 
         # Connected
-        r25 = re.compile(r'^Connected$')
+        r25 = regex_engine.compile(r'^Connected$')
 
         # Static
-        r26 = re.compile(r'^Static$')
+        r26 = regex_engine.compile(r'^Static$')
 
 
         parsed_output = {}
@@ -974,13 +974,13 @@ class ShowIsisHostname(ShowIsisHostnameSchema):
             output = self.device.execute(command)
 
         # IS-IS TEST1 hostnames
-        r1 = re.compile(r'IS\-IS\s(?P<isis>.+)\s+hostnames')
+        r1 = regex_engine.compile(r'IS\-IS\s(?P<isis>.+)\s+hostnames')
 
         # 2     1720.18ff.0254 tor-28.tenlab-cloud
         # 2     1720.18ff.0213 leaf-2.qa-site1
         # 2     1720.18ff.0250 tor-23.tenlab-cloud
-        r2 = re.compile(r'(?P<level>[\d\,]+)\s+(?P<local_router>\**)\s+'
-                         r'(?P<system_id>\S+)\s+(?P<dynamic_hostname>\S+)')
+        r2 = regex_engine.compile(r'(?P<level>[\d\,]+)\s+(?P<local_router>\**)\s+'
+                                   r'(?P<system_id>\S+)\s+(?P<dynamic_hostname>\S+)')
 
         parsed_output = {}
         vrf = 'default'
@@ -1166,136 +1166,136 @@ class ShowIsisStatistics(ShowIsisStatisticsSchema):
             output = self.device.execute(self.cli_command)
 
         # IS-IS test statistics:
-        r1 = re.compile(r'IS\-IS\s+(?P<isis>.+)\s+statistics\:')
+        r1 = regex_engine.compile(r'IS\-IS\s+(?P<isis>.+)\s+statistics\:')
 
         # Fast PSNP cache (hits/tries): 21/118
-        r2 = re.compile(r'Fast\s+PSNP\s+cache\s*\(hits/tries\): '
-                        r'(?P<psnp_cach_hits>\d+)/(?P<psnp_cach_tries>\d+)')
+        r2 = regex_engine.compile(r'Fast\s+PSNP\s+cache\s*\(hits/tries\): '
+                                  r'(?P<psnp_cach_hits>\d+)/(?P<psnp_cach_tries>\d+)')
 
         # Fast CSNP cache (hits/tries): 1398/1501
-        r3 = re.compile(r'Fast\s+CSNP\s+cache\s*\(hits/tries\): '
-                        r'(?P<csnp_cach_hits>\d+)/(?P<csnp_cach_tries>\d+)')
+        r3 = regex_engine.compile(r'Fast\s+CSNP\s+cache\s*\(hits/tries\): '
+                                  r'(?P<csnp_cach_hits>\d+)/(?P<csnp_cach_tries>\d+)')
 
         # Fast CSNP cache updates: 204
-        r4 = re.compile(r'Fast\s+CSNP\s+cache\s+updates\s*:\s*'
-                        r'(?P<csnp_cache_updates>\d+)')
+        r4 = regex_engine.compile(r'Fast\s+CSNP\s+cache\s+updates\s*:\s*'
+                                  r'(?P<csnp_cache_updates>\d+)')
 
         # LSP checksum errors received: 0
-        r5 = re.compile(r'LSP\s+checksum\s+errors\s+received\s*:\s*'
-                        r'(?P<lsp_checksum_errors_received>\d+)')
+        r5 = regex_engine.compile(r'LSP\s+checksum\s+errors\s+received\s*:\s*'
+                                  r'(?P<lsp_checksum_errors_received>\d+)')
 
         # LSP Dropped: 0
-        r6 = re.compile(r'LSP\s+Dropped\s*:\s*(?P<lsp_dropped>\d+)')
+        r6 = regex_engine.compile(r'LSP\s+Dropped\s*:\s*(?P<lsp_dropped>\d+)')
 
         # SNP Dropped: 0
-        r7 = re.compile(r'SNP\s+Dropped\s*:\s*(?P<snp_dropped>\d+)')
+        r7 = regex_engine.compile(r'SNP\s+Dropped\s*:\s*(?P<snp_dropped>\d+)')
 
         # UPD Max Queue size: 3
-        r8 = re.compile(r'UPD\s+Max\s+Queue\s+size\s*:\s*'
-                        r'(?P<upd_max_queue_size>\d+)')
+        r8 = regex_engine.compile(r'UPD\s+Max\s+Queue\s+size\s*:\s*'
+                                  r'(?P<upd_max_queue_size>\d+)')
 
         # UPD Queue size: 0
-        r9 = re.compile(r'UPD\s+Queue\s+size\s*:\s*(?P<upd_queue_size>\d+)')
+        r9 = regex_engine.compile(r'UPD\s+Queue\s+size\s*:\s*(?P<upd_queue_size>\d+)')
 
         # Average transmit times and rate:
         # Average transmit times and rates:
-        r10 = re.compile(r'Average\s+transmit\s+times\s+and\s+rates?\s*:')
+        r10 = regex_engine.compile(r'Average\s+transmit\s+times\s+and\s+rates?\s*:')
 
         # Average process times and rate:
         # Average process times and rates:
-        r11 = re.compile(r'Average\s+process\s+times\s+and\s+rates?\s*:')
+        r11 = regex_engine.compile(r'Average\s+process\s+times\s+and\s+rates?\s*:')
 
         # Hello:          0 s,      66473 ns,         15/s
         # Hello:          0 us          2/s
-        r12 = re.compile(r'Hello\s*:\s+(?P<time_s>\d+)\s*\w+(\,\s+'
-                         r'(?P<time_ns>\d+)\s*\w+\,)?\s+(?P<rate>\d+)/\w+')
+        r12 = regex_engine.compile(r'Hello\s*:\s+(?P<time_s>\d+)\s*\w+(\,\s+'
+                                   r'(?P<time_ns>\d+)\s*\w+\,)?\s+(?P<rate>\d+)/\w+')
 
         # CSNP:           0 s,      26914 ns,          1/s
         # CSNP:           0 us          0/s
-        r13 = re.compile(r'CSNP\s*:\s+(?P<time_s>\d+)\s*\w+(\,\s+'
-                         r'(?P<time_ns>\d+)\s*\w+\,)?\s+(?P<rate>\d+)/\w+')
+        r13 = regex_engine.compile(r'CSNP\s*:\s+(?P<time_s>\d+)\s*\w+(\,\s+'
+                                   r'(?P<time_ns>\d+)\s*\w+\,)?\s+(?P<rate>\d+)/\w+')
 
         # PSNP:           0 s,       4113 ns,          0/s
         # PSNP:           0 us          0/s
-        r14 = re.compile(r'PSNP\s*:\s+(?P<time_s>\d+)\s*\w+(\,\s+'
-                         r'(?P<time_ns>\d+)\s*\w+\,)?\s+(?P<rate>\d+)/\w+')
+        r14 = regex_engine.compile(r'PSNP\s*:\s+(?P<time_s>\d+)\s*\w+(\,\s+'
+                                   r'(?P<time_ns>\d+)\s*\w+\,)?\s+(?P<rate>\d+)/\w+')
 
         # LSP:            0 s,      52706 ns,          0/s
         # LSP:            0 us          0/s
-        r15 = re.compile(r'LSP\s*:\s+(?P<time_s>\d+)\s*\w+(\,\s+(?P<time_ns>'
-                         r'\d+)\s*\w+\,)?\s+(?P<rate>\d+)/\w+')
+        r15 = regex_engine.compile(r'LSP\s*:\s+(?P<time_s>\d+)\s*\w+(\,\s+(?P<time_ns>'
+                                   r'\d+)\s*\w+\,)?\s+(?P<rate>\d+)/\w+')
 
         # Level-1:
-        r16 = re.compile(r'Level\-(?P<level>\d+):')
+        r16 = regex_engine.compile(r'Level\-(?P<level>\d+):')
 
         # LSPs sourced (new/refresh): 11/15
         # LSPs sourced (new/refresh): 13/11
-        r17 = re.compile(r'LSPs\s+sourced\s*\(new/refresh\)\s*:\s*'
-                         r'(?P<lsp_source_new>\d+)\/(?P<lsp_source_refresh>\d+)')
+        r17 = regex_engine.compile(r'LSPs\s+sourced\s*\(new/refresh\)\s*:\s*'
+                                   r'(?P<lsp_source_new>\d+)\/(?P<lsp_source_refresh>\d+)')
 
         # IPv4 Unicast
         # IPv6 Unicast
-        r18 = re.compile(r'(?P<address_family>(IPv4|IPv6) Unicast)')
+        r18 = regex_engine.compile(r'(?P<address_family>(IPv4|IPv6) Unicast)')
 
         # Total SPF calculations     : 23
-        r19 = re.compile(r'Total\s+SPF\s+calculations\s*:\s*'
-                         r'(?P<total_spf_calculation>\d+)')
+        r19 = regex_engine.compile(r'Total\s+SPF\s+calculations\s*:\s*'
+                                   r'(?P<total_spf_calculation>\d+)')
 
         # Full SPF calculations      : 16
-        r20 = re.compile(r'Full\s+SPF\s+calculations\s*:\s*'
-                         r'(?P<full_spf_calculation>\d+)')
+        r20 = regex_engine.compile(r'Full\s+SPF\s+calculations\s*:\s*'
+                                   r'(?P<full_spf_calculation>\d+)')
 
         # ISPF calculations          : 0
-        r21 = re.compile(r'ISPF\s+calculations\s*:\s*'
-                         r'(?P<ispf_calculation>\d+)')
+        r21 = regex_engine.compile(r'ISPF\s+calculations\s*:\s*'
+                                   r'(?P<ispf_calculation>\d+)')
 
         # Next Hop Calculations      : 0
-        r22 = re.compile(r'Next\s+Hop\s+Calculations\s*:\s*'
-                         r'(?P<next_hop_calculation>\d+)')
+        r22 = regex_engine.compile(r'Next\s+Hop\s+Calculations\s*:\s*'
+                                   r'(?P<next_hop_calculation>\d+)')
 
         # Partial Route Calculations : 2
-        r23 = re.compile(r'Partial\s+Route\s+Calculations\s*:\s*'
-                         r'(?P<partial_route_calculation>\d+)')
+        r23 = regex_engine.compile(r'Partial\s+Route\s+Calculations\s*:\s*'
+                                   r'(?P<partial_route_calculation>\d+)')
 
         # Periodic SPF calculations  : 3
-        r24 = re.compile(r'Periodic\s+SPF\s+calculations\s*:\s*'
-                         r'(?P<periodic_spf_calculation>\d+)')
+        r24 = regex_engine.compile(r'Periodic\s+SPF\s+calculations\s*:\s*'
+                                   r'(?P<periodic_spf_calculation>\d+)')
 
         # Interface Loopback0:
         # Interface GigabitEthernet0/0/0/1:
-        r25 = re.compile(r'Interface\s+(?P<interface>\S+):')
+        r25 = regex_engine.compile(r'Interface\s+(?P<interface>\S+):')
 
         # Level-1 LSPs (sent/rcvd)  : 0/0
         # Level-2 LSPs (sent/rcvd)  : 0/0
-        r26 = re.compile(r'Level\-(?P<level>\d+)\s+LSPs\s+\(sent\/rcvd\)\s*:'
-                         r'\s*(?P<lsp_sent>\d+)/(?P<lsp_received>\d+)')
+        r26 = regex_engine.compile(r'Level\-(?P<level>\d+)\s+LSPs\s+\(sent\/rcvd\)\s*:'
+                                   r'\s*(?P<lsp_sent>\d+)/(?P<lsp_received>\d+)')
 
         # Level-2 CSNPs (sent/rcvd) : 0/0
         # Level-1 CSNPs (sent/rcvd) : 339/0
-        r27 = re.compile(r'Level\-(?P<level>\d+)\s+CSNPs\s+\(sent\/rcvd\)\s*:'
-                         r'\s*(?P<csnp_sent>\d+)/(?P<csnp_received>\d+)')
+        r27 = regex_engine.compile(r'Level\-(?P<level>\d+)\s+CSNPs\s+\(sent\/rcvd\)\s*:'
+                                   r'\s*(?P<csnp_sent>\d+)/(?P<csnp_received>\d+)')
 
         # Level-1 PSNPs (sent/rcvd) : 0/0
-        r28 = re.compile(r'Level\-(?P<level>\d+)\s+PSNPs\s+\(sent/rcvd\)\s*:'
-                         r'\s*(?P<psnp_sent>\d+)\/(?P<psnp_received>\d+)')
+        r28 = regex_engine.compile(r'Level\-(?P<level>\d+)\s+PSNPs\s+\(sent/rcvd\)\s*:'
+                                   r'\s*(?P<psnp_sent>\d+)\/(?P<psnp_received>\d+)')
 
         # Level-1 LSP Flooding Duplicates     : 51
-        r29 = re.compile(r'Level-(?P<level>\d+)\s+LSP\s+Flooding\s+Duplicates'
-                         r'\s*:\s*(?P<lsp_flooding_duplicates>\d+)')
+        r29 = regex_engine.compile(r'Level-(?P<level>\d+)\s+LSP\s+Flooding\s+Duplicates'
+                                   r'\s*:\s*(?P<lsp_flooding_duplicates>\d+)')
 
         # Level-1 LSPs Arrival Time Throttled : 0
         # Level-2 LSPs Arrival Time Throttled : 0
-        r30 = re.compile(r'Level-(?P<level>\d+)\s+LSPs\s+Arrival\s+Time\s+'
-                         r'Throttled\s*:\s*(?P<lsp_arrival_time_throttled>\d+)')
+        r30 = regex_engine.compile(r'Level-(?P<level>\d+)\s+LSPs\s+Arrival\s+Time\s+'
+                                   r'Throttled\s*:\s*(?P<lsp_arrival_time_throttled>\d+)')
 
         # Level-1 Hellos (sent/rcvd): 594/593
-        r31 = re.compile(r'Level-(?P<level>\d+)\s+Hellos\s+\(sent/rcvd\)\s*:'
-                         r'\s*(?P<hello_sent>\d+)/(?P<hello_received>\d+)')
+        r31 = regex_engine.compile(r'Level-(?P<level>\d+)\s+Hellos\s+\(sent/rcvd\)\s*:'
+                                   r'\s*(?P<hello_sent>\d+)/(?P<hello_received>\d+)')
 
         # Level-1 DR Elections      : 3
         # Level-2 DR Elections      : 3
-        r32 = re.compile(r'Level-(?P<level>\d+)\s+DR\s+Elections\s*:'
-                         r'\s*(?P<dr_elections>\d+)')
+        r32 = regex_engine.compile(r'Level-(?P<level>\d+)\s+DR\s+Elections\s*:'
+                                   r'\s*(?P<dr_elections>\d+)')
 
         parsed_dict = {}
         vrf = 'default'
@@ -1716,20 +1716,20 @@ class ShowIsisSpfLog(ShowIsisSpfLogSchema):
             output = self.device.execute(self.cli_command)
 
         # IS-IS TEST Level 2 IPv4 Unicast Route Calculation Log
-        r1 = re.compile(r'IS\-IS\s+(?P<instance>\S+)\s+Level\s+(?P<level>\d+)'
-                         r'\s+(?P<address_family>.+)\s+Route\s+Calculation\s+Log')
+        r1 = regex_engine.compile(r'IS\-IS\s+(?P<instance>\S+)\s+Level\s+(?P<level>\d+)'
+                                   r'\s+(?P<address_family>.+)\s+Route\s+Calculation\s+Log')
 
         # --- Mon Oct  7 2019 ---
-        r2 = re.compile(r'\-\-\-\s+(?P<log_date>[\s\w]+)\s+\-\-\-')
+        r2 = regex_engine.compile(r'\-\-\-\s+(?P<log_date>[\s\w]+)\s+\-\-\-')
 
         #                     Time Total Trig.
         # Timestamp    Type   (ms) Nodes Count First Trigger LSP    Triggers
         # ------------ ----- ----- ----- ----- -------------------- -----------------------
         # 00:00:17.514   PRC     0    64     6      bla-host1.12-34 PREFIXBAD
         # 23:42:51.522 PPFRR     0    64     1                      PERPREFIXFRR
-        r3 = re.compile(r'(?P<timestamp>[0-9\:\.]+)\s+(?P<log_type>\S+)\s+(?P<time_ms>\d+)'
-                         r'\s+(?P<total_nodes>\d+)\s+(?P<trigger_count>\d+)\s+'
-                         r'(?P<first_trigger_lsp>\S*)\s+(?P<triggers>[\w\s]+)')
+        r3 = regex_engine.compile(r'(?P<timestamp>[0-9\:\.]+)\s+(?P<log_type>\S+)\s+(?P<time_ms>\d+)'
+                                   r'\s+(?P<total_nodes>\d+)\s+(?P<trigger_count>\d+)\s+'
+                                   r'(?P<first_trigger_lsp>\S*)\s+(?P<triggers>[\w\s]+)')
 
         parsed_output = {}
         log_index = 1
@@ -1925,54 +1925,54 @@ class ShowIsisSpfLogDetail(ShowIsisSpfLogDetailSchema):
             output = self.device.execute(self.cli_command)
 
         # ISIS isp Level 1 IPv4 Unicast Route Calculation Log
-        r1 = re.compile(r'IS\-*IS\s+(?P<instance>\S+)\s+Level\s+(?P<level>\d+)'
-                        r'\s+(?P<address_family>.+)\s+Route\s+Calculation\s+Log')
+        r1 = regex_engine.compile(r'IS\-*IS\s+(?P<instance>\S+)\s+Level\s+(?P<level>\d+)'
+                                  r'\s+(?P<address_family>.+)\s+Route\s+Calculation\s+Log')
 
         #                    Time  Total Trig
         # Timestamp     Type (ms)  Nodes Count  First Trigger LSP   Triggers
         # 19:25:35.140  FSPF  1    1     1             12a5.00-00   NEWLSP0
-        r2 = re.compile(r'^(?P<timestamp>[\d\:\.]+)\s+(?P<type>\w+)\s+'
-                r'(?P<time_ms>\d+)\s+(?P<nodes>\d+)\s+(?P<count>\d+)'
-                r'(\s+(?P<first_trigger_lsp>[\w\-\.]+))?\s+(?P<triggers>\w+)')
+        r2 = regex_engine.compile(r'^(?P<timestamp>[\d\:\.]+)\s+(?P<type>\w+)\s+'
+                          r'(?P<time_ms>\d+)\s+(?P<nodes>\d+)\s+(?P<count>\d+)'
+                          r'(\s+(?P<first_trigger_lsp>[\w\-\.]+))?\s+(?P<triggers>\w+)')
 
         # Delay:              51ms (since first trigger)
-        r3 = re.compile(r'Delay\s*:\s*(?P<delay>\d+)ms\s+'
-                        r'\((?P<delay_info>[\w\s]+)\)')
+        r3 = regex_engine.compile(r'Delay\s*:\s*(?P<delay>\d+)ms\s+'
+                                  r'\((?P<delay_info>[\w\s]+)\)')
 
         # SPT Calculation
-        r4 = re.compile(r'SPT\s+Calculation$')
+        r4 = regex_engine.compile(r'SPT\s+Calculation$')
 
         # SPT Calculation:         5     5
-        r4_1 = re.compile(r'^SPT +Calculation: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
+        r4_1 = regex_engine.compile(r'^SPT +Calculation: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
 
         # Prefix Updates
-        r5 = re.compile(r'Prefix\s+Updates')
+        r5 = regex_engine.compile(r'Prefix\s+Updates')
 
         # Route Update:            0     0
-        r5_1 = re.compile(r'^Route +Update: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
+        r5_1 = regex_engine.compile(r'^Route +Update: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
 
         # Full Calculation:        0     0
-        r5_2 = re.compile(r'^Full +Calculation: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
+        r5_2 = regex_engine.compile(r'^Full +Calculation: +(?P<cpu_time>\d+) +(?P<real_time>\d+)$')
 
         # CPU Time:         1ms
         # CPU Time:         0ms
-        r6 = re.compile(r'CPU\s+Time\s*:\s*(?P<cpu_time>\d+)\w+')
+        r6 = regex_engine.compile(r'CPU\s+Time\s*:\s*(?P<cpu_time>\d+)\w+')
 
         # Real Time:        0ms
-        r7 = re.compile(r'Real\s+Time\s*:\s*(?P<real_time>\d+)\w+')
+        r7 = regex_engine.compile(r'Real\s+Time\s*:\s*(?P<real_time>\d+)\w+')
 
         # New LSP Arrivals:    0
-        r8 = re.compile(r'New\s+LSP\s+Arrivals\s*:\s*(?P<new_lsp_arrival>\d+)')
+        r8 = regex_engine.compile(r'New\s+LSP\s+Arrivals\s*:\s*(?P<new_lsp_arrival>\d+)')
 
         # Next Wait Interval: 200ms
-        r9 = re.compile(r'Next\s+Wait\s+Interval\s*:\s*(?P<next_wait_interval>\d+)\w+')
+        r9 = regex_engine.compile(r'Next\s+Wait\s+Interval\s*:\s*(?P<next_wait_interval>\d+)\w+')
 
         # Nodes:                   1       0     1
-        r10 = re.compile(r'Nodes\s*:\s*(?P<reach>\d+)\s+(?P<unreach>\d+)\s+(?P<total>\d+)')
+        r10 = regex_engine.compile(r'Nodes\s*:\s*(?P<reach>\d+)\s+(?P<unreach>\d+)\s+(?P<total>\d+)')
 
         # Prefixes (Items)
         # Prefixes (Routes)
-        r11 = re.compile(r'Prefixes\s*\((?P<prefixes>\w+)\)')
+        r11 = regex_engine.compile(r'Prefixes\s*\((?P<prefixes>\w+)\)')
 
         # Critical Priority:     0       0     0
         # Critical Priority:     0       -     0
@@ -1984,30 +1984,30 @@ class ShowIsisSpfLogDetail(ShowIsisSpfLogDetailSchema):
         # Low Priority:          0        -    0
         # All Priorities         0        -    0
         # All Priorities         0       0     0
-        r12 = re.compile(r'(?P<priority_level>\w+)\s+Priorit(y|ies)\s*:*\s+'
-                          r'(?P<reach>\d+)\s+(?P<unreach>\d+|\-)\s+'
-                          r'(?P<total>\d+)')
+        r12 = regex_engine.compile(r'(?P<priority_level>\w+)\s+Priorit(y|ies)\s*:*\s+'
+                                    r'(?P<reach>\d+)\s+(?P<unreach>\d+|\-)\s+'
+                                    r'(?P<total>\d+)')
 
         # SR uloop:              No
-        r13 = re.compile(r'^SR +uloop: +(?P<sr_uloop>\w+)$')
+        r13 = regex_engine.compile(r'^SR +uloop: +(?P<sr_uloop>\w+)$')
 
         # Interrupted:           No
-        r14 = re.compile(r'^Interrupted: +(?P<interrupted>\w+)$')
+        r14 = regex_engine.compile(r'^Interrupted: +(?P<interrupted>\w+)$')
 
         # RIB Batches:           0
-        r15 = re.compile(r'^RIB +Batches: +(?P<total>\d+)( +\((?P<critical>\d+) '
-                r'critical, +(?P<high>\d+) +high, +(?P<medium>\d+) +medium, +'
-                r'(?P<low>\d+) +low\))?$')
+        r15 = regex_engine.compile(r'^RIB +Batches: +(?P<total>\d+)( +\((?P<critical>\d+) '
+                          r'critical, +(?P<high>\d+) +high, +(?P<medium>\d+) +medium, +'
+                          r'(?P<low>\d+) +low\))?$')
 
         # 899545ms (since end of last calculation)
-        r16 = re.compile(r'^(?P<since_end_of_last_calculation_ms>\d+)ms +\(since '
-                r'+end +of +last +calculation\)$')
+        r16 = regex_engine.compile(r'^(?P<since_end_of_last_calculation_ms>\d+)ms +\(since '
+                          r'+end +of +last +calculation\)$')
 
         # Trigger Prefix:        10.234.81.14/32 (optional field)
-        r17 = re.compile(r'^Trigger +Prefix: +(?P<trigger_prefix>\S+) +\(optional +field\)$')
+        r17 = regex_engine.compile(r'^Trigger +Prefix: +(?P<trigger_prefix>\S+) +\(optional +field\)$')
 
         # Mon Aug 16 2004
-        rd = re.compile(r'(?P<timestamp_date>[\w\d\s]+)')
+        rd = regex_engine.compile(r'(?P<timestamp_date>[\w\d\s]+)')
 
         parsed_dict = {}
         log_index = 1
@@ -2306,20 +2306,20 @@ class ShowIsisLspLog(ShowIsisLspLogSchema):
         # IS-IS TEST Level 2 LSP log
         # ISIS isp Level 1 LSP log
         # Level 1 LSP log
-        r1 = re.compile(r'(IS\-*IS\s+(?P<instance>.+)\s+)?Level\s+'
-                         r'(?P<level>\d+)\s+LSP\s+log')
+        r1 = regex_engine.compile(r'(IS\-*IS\s+(?P<instance>.+)\s+)?Level\s+'
+                                   r'(?P<level>\d+)\s+LSP\s+log')
 
         # --- Thu Sep 26 2019 ---
         # --- Mon Sep 30 2019 ---
-        r2 = re.compile(r'\-\-\-\s+(?P<log_date>[\w\s]+)\s+\-\-\-')
+        r2 = regex_engine.compile(r'\-\-\-\s+(?P<log_date>[\w\s]+)\s+\-\-\-')
 
         # 09:39:16.648     1                   IPEXT
         # 07:05:24         2                   CONFIG NEWADJ
         # 16:15:03.822     2  BE2              DELADJ
         # 00:02:36         1
-        r3 = re.compile(r'(?P<timestamp>[0-9\:\.]+)\s+(?P<count>\d+)\s*'
-                         r'(?P<interface>[A-Z]+[a-z]*[\/*\d\.]+)?\s*'
-                         r'(?P<triggers>[\w*\s]*)')
+        r3 = regex_engine.compile(r'(?P<timestamp>[0-9\:\.]+)\s+(?P<count>\d+)\s*'
+                                   r'(?P<interface>[A-Z]+[a-z]*[\/*\d\.]+)?\s*'
+                                   r'(?P<triggers>[\w*\s]*)')
 
         parsed_output = {}
         log_date = ''
@@ -2550,241 +2550,241 @@ class ShowIsisInterface(ShowIsisInterfaceSchema):
             output = self.device.execute(command)
 
         # IS-IS test Interfaces
-        r1 = re.compile(r'IS\-IS\s+(?P<instance>.+)\s+Interfaces')
+        r1 = regex_engine.compile(r'IS\-IS\s+(?P<instance>.+)\s+Interfaces')
 
         # Loopback0                   Enabled
         # GigabitEthernet0/0/0/0      Enabled
         # TenGigE0/0/0/0/0            Disabled (No topologies cfg on the intf)
-        r2 = re.compile(r'^(?P<interface>[\w\-\d+\/\.]+)\s+(?P<interface_state>Enabled|Disabled)( +[\S ]+)?$')
+        r2 = regex_engine.compile(r'^(?P<interface>[\w\-\d+\/\.]+)\s+(?P<interface_state>Enabled|Disabled)( +[\S ]+)?$')
 
         # Adjacency Formation:    Running
         # Adjacency Formation:      Enabled
-        r3 = re.compile(r'Adjacency\s+Formation\s*:\s*'
-                        r'(?P<adjacency_formation_state>\w+)')
+        r3 = regex_engine.compile(r'Adjacency\s+Formation\s*:\s*'
+                                  r'(?P<adjacency_formation_state>\w+)')
 
         # Prefix Advertisement:     Enabled
         # Prefix Advertisement:   Running
-        r4 = re.compile(r'Prefix\s+Advertisement\s*:\s*'
-                        r'(?P<prefix_advertisement_state>.+)')
+        r4 = regex_engine.compile(r'Prefix\s+Advertisement\s*:\s*'
+                                  r'(?P<prefix_advertisement_state>.+)')
 
         # IPv4 BFD:                 Disabled
         # IPv6 BFD:                 Disabled
-        r5 = re.compile(r'(?P<address_family>IPv4|IPv6)\s+BFD\s*:\s*'
-                        r'(?P<ip_bfd_state>\w+)')
+        r5 = regex_engine.compile(r'(?P<address_family>IPv4|IPv6)\s+BFD\s*:\s*'
+                                  r'(?P<ip_bfd_state>\w+)')
 
         # BFD Min Interval:         150
-        r6 = re.compile(r'BFD\s+Min\s+Interval\s*:\s*(?P<bfd_min_interval>\d+)')
+        r6 = regex_engine.compile(r'BFD\s+Min\s+Interval\s*:\s*(?P<bfd_min_interval>\d+)')
 
         # BFD Multiplier:           3
-        r7 = re.compile(r'BFD\s+Multiplier\s*:\s*(?P<bfd_multiplier>\d+)')
+        r7 = regex_engine.compile(r'BFD\s+Multiplier\s*:\s*(?P<bfd_multiplier>\d+)')
 
         # Bandwidth:                0
         # Bandwidth:                1000000
-        r8 = re.compile(r'Bandwidth\s*:\s*(?P<bandwidth>\d+)')
+        r8 = regex_engine.compile(r'Bandwidth\s*:\s*(?P<bandwidth>\d+)')
 
         # Circuit Type:             level-1-2
-        r9 = re.compile(r'Circuit\s+Type\s*:\s*(?P<circuit_type>\S+)')
+        r9 = regex_engine.compile(r'Circuit\s+Type\s*:\s*(?P<circuit_type>\S+)')
 
         # Media Type:               LAN
         # Media Type:               Loop
-        r10 = re.compile(r'Media\s+Type\s*:\s*(?P<media_type>\S+)')
+        r10 = regex_engine.compile(r'Media\s+Type\s*:\s*(?P<media_type>\S+)')
 
         # Circuit Number:           0
-        r11 = re.compile(r'Circuit\s+Number\s*:\s*(?P<circuit_number>\d+)')
+        r11 = regex_engine.compile(r'Circuit\s+Number\s*:\s*(?P<circuit_number>\d+)')
 
         # Level-1
         # Level-2
-        r12 = re.compile(r'^Level\-(?P<level>\d+)')
+        r12 = regex_engine.compile(r'^Level\-(?P<level>\d+)')
 
         # Adjacency Count:        0
-        r13 = re.compile(r'Adjacency\s+Count\s*:\s*(?P<adjacency_count>\d+)')
+        r13 = regex_engine.compile(r'Adjacency\s+Count\s*:\s*(?P<adjacency_count>\d+)')
 
         # LSP Pacing Interval:    33 ms
-        r14 = re.compile(r'LSP\s+Pacing\s+Interval\s*:\s*'
-                         r'(?P<lsp_pacing_interval>\d+)\s+ms')
+        r14 = regex_engine.compile(r'LSP\s+Pacing\s+Interval\s*:\s*'
+                                   r'(?P<lsp_pacing_interval>\d+)\s+ms')
 
         # PSNP Entry Queue Size:  0
-        r15 = re.compile(r'PSNP\s+Entry\s+Queue\s+Size\s*:\s*'
-                         r'(?P<psnp_entry_queue_size>\d+)')
+        r15 = regex_engine.compile(r'PSNP\s+Entry\s+Queue\s+Size\s*:\s*'
+                                   r'(?P<psnp_entry_queue_size>\d+)')
 
         # Hello Interval:         10 s
-        r16 = re.compile(r'Hello\s+Interval\s*:\s*(?P<hello_interval>\d+)\s*s')
+        r16 = regex_engine.compile(r'Hello\s+Interval\s*:\s*(?P<hello_interval>\d+)\s*s')
 
         # Hello Multiplier:       3
-        r17 = re.compile(r'Hello\s+Multiplier\a*:\s*(?P<hello_multiplier>\d+)')
+        r17 = regex_engine.compile(r'Hello\s+Multiplier\a*:\s*(?P<hello_multiplier>\d+)')
 
         # CLNS I/O
-        r18 = re.compile(r'CLNS\s+I\/O')
+        r18 = regex_engine.compile(r'CLNS\s+I\/O')
 
         # Protocol State:         Up
         # Protocol State:         Down (Intf not up in CLNS proto stack)
-        r19 = re.compile(r'Protocol\s+State\s*:\s*(?P<protocol_state>[\S\s]+)')
+        r19 = regex_engine.compile(r'Protocol\s+State\s*:\s*(?P<protocol_state>[\S\s]+)')
 
         # MTU:                    1500
-        r20 = re.compile(r'MTU\s*:\s*(?P<mtu>\S+)')
+        r20 = regex_engine.compile(r'MTU\s*:\s*(?P<mtu>\S+)')
 
         # IPv4 Unicast Topology:    Enabled
         # IPv6 Unicast Topology:    Enabled
-        r21 = re.compile(r'(?P<topology>(IPv4|IPv6)[\s\w]+)\s+Topology\s*:'
-                         r'\s*(?P<topology_state>\w+)')
+        r21 = regex_engine.compile(r'(?P<topology>(IPv4|IPv6)[\s\w]+)\s+Topology\s*:'
+                                   r'\s*(?P<topology_state>\w+)')
 
         # Metric (L1/L2):         10/10
-        r22 = re.compile(r'Metric\s+\(L(?P<level_1>\d+)/L(?P<level_2>\d+)\)\s*'
-                         r':\s*(?P<metric_level_1>\d+)\/(?P<metric_level_2>\d+)')
+        r22 = regex_engine.compile(r'Metric\s+\(L(?P<level_1>\d+)/L(?P<level_2>\d+)\)\s*'
+                                   r':\s*(?P<metric_level_1>\d+)\/(?P<metric_level_2>\d+)')
 
         # Weight (L1/L2):         0/0
-        r23 = re.compile(r'Weight\s+\(L(?P<level_1>\d+)/L(?P<level_2>\d+)\)\s*:'
-                         r'\s*(?P<weight_level_1>\d+)\/(?P<weight_level_2>\d+)')
+        r23 = regex_engine.compile(r'Weight\s+\(L(?P<level_1>\d+)/L(?P<level_2>\d+)\)\s*:'
+                                   r'\s*(?P<weight_level_1>\d+)\/(?P<weight_level_2>\d+)')
 
         # MPLS Max Label Stack:   1/3/10 (PRI/BKP/SRTE)
         # MPLS Max Label Stack(PRI/BKP/SRTE):2/2/10
-        r24 = re.compile(r'MPLS\s+Max\s+Label\s+Stack(?P<mpls_max_label_stack>.+)')
+        r24 = regex_engine.compile(r'MPLS\s+Max\s+Label\s+Stack(?P<mpls_max_label_stack>.+)')
 
         # MPLS LDP Sync (L1/L2):  Disabled/Disabled
-        r25 = re.compile(r'MPLS\s+LDP\s+Sync\s+\(L(?P<level_1>\d+)/L'
-                         r'(?P<level_2>\d+)\)\s*:\s*(?P<state_level_1>\w+)\/(?P<state_level_2>\w+)')
+        r25 = regex_engine.compile(r'MPLS\s+LDP\s+Sync\s+\(L(?P<level_1>\d+)/L'
+                                   r'(?P<level_2>\d+)\)\s*:\s*(?P<state_level_1>\w+)\/(?P<state_level_2>\w+)')
 
         # FRR (L1/L2):            L1 Not Enabled     L2 Not Enabled
-        r26 = re.compile(r'FRR\s+\(L\d+\/L\d+\)\s*:\s*L(?P<level_1>\d+)\s+'
-                         r'(?P<level_1_state>[\w\s]+)\s+L(?P<level_2>\d+)\s+(?P<level_2_state>[\w\s]+)')
+        r26 = regex_engine.compile(r'FRR\s+\(L\d+\/L\d+\)\s*:\s*L(?P<level_1>\d+)\s+'
+                                   r'(?P<level_1_state>[\w\s]+)\s+L(?P<level_2>\d+)\s+(?P<level_2_state>[\w\s]+)')
 
         # FRR Type:             None               None
-        r27 = re.compile(r'FRR\s+Type\s*:\s*(?P<frr_type_level_1>\S+)\s*'
-                         r'(?P<frr_type_level_2>\S+)')
+        r27 = regex_engine.compile(r'FRR\s+Type\s*:\s*(?P<frr_type_level_1>\S+)\s*'
+                                   r'(?P<frr_type_level_2>\S+)')
 
         # IPv4 Address Family:      Enabled
         # IPv6 Address Family:      Enabled
-        r28 = re.compile(r'(?P<address_family>IPv4|IPv6)\s+Address\s+Family\s*:'
-                         r'\s*(?P<address_family_state>\w+)')
+        r28 = regex_engine.compile(r'(?P<address_family>IPv4|IPv6)\s+Address\s+Family\s*:'
+                                   r'\s*(?P<address_family_state>\w+)')
 
         # Forwarding Address(es): 0.0.0.0
         # Forwarding Address(es): ::
-        r29 = re.compile(r'Forwarding\s+Address\(es\)\s*:\s*'
-                         r'(?P<forwarding_address>\S+)')
+        r29 = regex_engine.compile(r'Forwarding\s+Address\(es\)\s*:\s*'
+                                   r'(?P<forwarding_address>\S+)')
 
         # Global Prefix(es):      10.36.3.0/24
         # Global Prefix(es):      2001:db8:3:3:3::3/128
         # Global Prefix(es):      None (No global addresses are configured)
-        r30 = re.compile(r'Global\s+Prefix\(es\)\s*:\s*(?P<global_prefix>.+)')
+        r30 = regex_engine.compile(r'Global\s+Prefix\(es\)\s*:\s*(?P<global_prefix>.+)')
 
         # LSP transmit timer expires in 0 ms
-        r31 = re.compile(r'LSP\s+transmit\s+timer\s+expires\s+in\s+'
-                         r'(?P<lsp_timer>\d+)\s+ms')
+        r31 = regex_engine.compile(r'LSP\s+transmit\s+timer\s+expires\s+in\s+'
+                                   r'(?P<lsp_timer>\d+)\s+ms')
 
         # LSP transmission is idle
-        r32 = re.compile(r'LSP\s+transmission\s+is\s+'
-                         r'(?P<lsp_transmission_state>\w+)')
+        r32 = regex_engine.compile(r'LSP\s+transmission\s+is\s+'
+                                   r'(?P<lsp_transmission_state>\w+)')
 
         # Can send up to 10 back-to-back LSPs in the next 0 ms
-        r33 = re.compile(r'Can\s+send\s+up\s+to\s+(?P<number_lsp_send>\d+)'
-                         r'\s+back\-to\-back\s+LSPs\s+in\s+the\s+next\s+'
-                         r'(?P<time_to_sent>\d+)\s+ms')
+        r33 = regex_engine.compile(r'Can\s+send\s+up\s+to\s+(?P<number_lsp_send>\d+)'
+                                   r'\s+back\-to\-back\s+LSPs\s+in\s+the\s+next\s+'
+                                   r'(?P<time_to_sent>\d+)\s+ms')
 
         # LAN ID:                 R3.07
-        r34 = re.compile(r'LAN\s+ID\s*:\s*(?P<lan_id>\S+)')
+        r34 = regex_engine.compile(r'LAN\s+ID\s*:\s*(?P<lan_id>\S+)')
 
         # Priority (Local/DIS):   64/none (no DIS elected)
         # Priority (Local/DIS):   64/64
-        r35 = re.compile(r'Priority\s*\(Local/DIS\)\s*:\s*'
-                         r'(?P<priority_local>\S+)/(?P<priority_dis>.+)')
+        r35 = regex_engine.compile(r'Priority\s*\(Local/DIS\)\s*:\s*'
+                                   r'(?P<priority_local>\S+)/(?P<priority_dis>.+)')
 
         # Next LAN IIH in:        5 s
         # Next LAN IIH in:        3 s
-        r36 = re.compile(r'Next\s+LAN\s+IIH\s+in\s*:\s*'
-                         r'(?P<next_lan_iih>\d+)\s*s')
+        r36 = regex_engine.compile(r'Next\s+LAN\s+IIH\s+in\s*:\s*'
+                                   r'(?P<next_lan_iih>\d+)\s*s')
 
         # SNPA:                   fa16.3eff.86bf
-        r37 = re.compile(r'SNPA\s*:\s*(?P<snpa>\S+)')
+        r37 = regex_engine.compile(r'SNPA\s*:\s*(?P<snpa>\S+)')
 
         # Layer-2 MCast Groups Membership:
         # Layer-2 Multicast:
-        r38 = re.compile(r'^Layer-(?P<layer>\d+)\s*(?:(?P<mcast>MCast\s+Groups\s+Membership))?(?:(?P<multicast>Multicast))?:$')
+        r38 = regex_engine.compile(r'^Layer-(?P<layer>\d+)\s*(?:(?P<mcast>MCast\s+Groups\s+Membership))?(?:(?P<multicast>Multicast))?:$')
 
         # All Level-1 ISs:      Yes
         # All Level-2 ISs:      Yes
-        r39 = re.compile(r'All\s+Level\-(?P<level>\d+)\s+ISs\s*:\s*'
-                         r'(?P<iss_state>\S+)')
+        r39 = regex_engine.compile(r'All\s+Level\-(?P<level>\d+)\s+ISs\s*:\s*'
+                                   r'(?P<iss_state>\S+)')
 
         # All ISs:              Yes
         # All ISs:              Listening
-        r40 = re.compile(r'All\s+ISs\s*:\s*(?P<all_iss>(Yes|No|Listening))')
+        r40 = regex_engine.compile(r'All\s+ISs\s*:\s*(?P<all_iss>(Yes|No|Listening))')
 
         # Extended Circuit Number:  20
-        r41 = re.compile(r'^Extended +Circuit +Number: +(?P<extended_circuit_number>\d+)$')
+        r41 = regex_engine.compile(r'^Extended +Circuit +Number: +(?P<extended_circuit_number>\d+)$')
 
         # Next P2P IIH in:          3 s
-        r42 = re.compile(r'^Next +P2P +IIH +in: +(?P<next_p2p_iih_in>\d+) +m?s$')
+        r42 = regex_engine.compile(r'^Next +P2P +IIH +in: +(?P<next_p2p_iih_in>\d+) +m?s$')
 
         # LSP Rexmit Queue Size:    0
-        r43 = re.compile(r'^LSP +Rexmit +Queue +Size: +(?P<lsp_rexmit_queue_size>\d+)$')
+        r43 = regex_engine.compile(r'^LSP +Rexmit +Queue +Size: +(?P<lsp_rexmit_queue_size>\d+)$')
 
         # RSI SRLG:                 Registered
-        r44 = re.compile(r'^RSI +SRLG: +(?P<rsi_srlg>\S+)$')
+        r44 = regex_engine.compile(r'^RSI +SRLG: +(?P<rsi_srlg>\S+)$')
 
         # Direct LFA:           Enabled            Enabled
-        r45 = re.compile(r'^Direct +LFA: +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r45 = regex_engine.compile(r'^Direct +LFA: +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Remote LFA:           Not Enabled        Not Enabled
-        r46 = re.compile(r'^Remote +LFA: +(?P<level_1>(Not +)?Enabled) +(?P<level_2>(Not +)?Enabled)$')
+        r46 = regex_engine.compile(r'^Remote +LFA: +(?P<level_1>(Not +)?Enabled) +(?P<level_2>(Not +)?Enabled)$')
 
         # Tie Breaker          Default            Default
-        r47 = re.compile(r'^Tie +Breaker +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r47 = regex_engine.compile(r'^Tie +Breaker +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Line-card disjoint   30                 30
-        r48 = re.compile(r'^Line-card +disjoint +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r48 = regex_engine.compile(r'^Line-card +disjoint +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Lowest backup metric 20                 20
-        r49 = re.compile(r'^Lowest +backup +metric +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r49 = regex_engine.compile(r'^Lowest +backup +metric +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Node protecting      40                 40
-        r50 = re.compile(r'^Node +protecting +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r50 = regex_engine.compile(r'^Node +protecting +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Primary path         10                 10
-        r51 = re.compile(r'^Primary +path +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r51 = regex_engine.compile(r'^Primary +path +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # TI LFA:               Enabled            Enabled
-        r52 = re.compile(r'^TI +LFA: +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r52 = regex_engine.compile(r'^TI +LFA: +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # Link Protecting      Enabled            Enabled
-        r53 = re.compile(r'^Link +Protecting +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r53 = regex_engine.compile(r'^Link +Protecting +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # SRLG disjoint        0                  0
-        r54 = re.compile(r'^SRLG +disjoint +(?P<level_1>\w+) +(?P<level_2>\w+)$')
+        r54 = regex_engine.compile(r'^SRLG +disjoint +(?P<level_1>\w+) +(?P<level_2>\w+)$')
 
         # IfName: Hu0/0/0/1 IfIndex: 0x55
-        r55 = re.compile(r'^IfName: +(?P<if_name>\S+) +IfIndex: +(?P<if_index>\S+)$')
+        r55 = regex_engine.compile(r'^IfName: +(?P<if_name>\S+) +IfIndex: +(?P<if_index>\S+)$')
 
         # LDPv4 Sync Status:    Achieved
         # LDPv6 Sync Status:    Not Achieved
-        r56 = re.compile(r'^(?P<ldp_type>LDPv(4|6))\s+Sync\s+Status:\s+(?P<status>[\w\s]+)$')
+        r56 = regex_engine.compile(r'^(?P<ldp_type>LDPv(4|6))\s+Sync\s+Status:\s+(?P<status>[\w\s]+)$')
 
         # Total bandwidth:                0
         # Total bandwidth:                1000000
-        r57 = re.compile(r'Total\s+bandwidth\s*:\s*(?P<total_bandwidth>\d+)')
+        r57 = regex_engine.compile(r'Total\s+bandwidth\s*:\s*(?P<total_bandwidth>\d+)')
 
         # Metric fallback:
-        r58 = re.compile(r'Metric\s+fallback:')
+        r58 = regex_engine.compile(r'Metric\s+fallback:')
 
         # Bandwidth (L1/L2):    Inactive/Inactive
-        r59 = re.compile(r'Bandwidth\s+\(L(?P<level_1>\d+)/L'
-                         r'(?P<level_2>\d+)\)\s*:\s*(?P<bandwidth_level_1>\w+)\/(?P<bandwidth_level_2>\w+)')
+        r59 = regex_engine.compile(r'Bandwidth\s+\(L(?P<level_1>\d+)/L'
+                                   r'(?P<level_2>\d+)\)\s*:\s*(?P<bandwidth_level_1>\w+)\/(?P<bandwidth_level_2>\w+)')
 
         # Anomaly (L1/L2):    Inactive/Inactive
-        r60 = re.compile(r'Anomaly\s+\(L(?P<level_1>\d+)/L'
-                         r'(?P<level_2>\d+)\)\s*:\s*(?P<anomaly_level_1>\w+)\/(?P<anomaly_level_2>\w+)')
+        r60 = regex_engine.compile(r'Anomaly\s+\(L(?P<level_1>\d+)/L'
+                                   r'(?P<level_2>\d+)\)\s*:\s*(?P<anomaly_level_1>\w+)\/(?P<anomaly_level_2>\w+)')
 
         # Delay Normalization:      Interval:0 Offset:0
-        r61 = re.compile(r'Delay\s+Normalization:\s*Interval:(?P<interval>'
-                         r'\d+)\s+Offset:(?P<offset>\d+)')
+        r61 = regex_engine.compile(r'Delay\s+Normalization:\s*Interval:(?P<interval>'
+                                   r'\d+)\s+Offset:(?P<offset>\d+)')
 
         # Link Loss:                -
         # Link Loss:                1
-        r62 = re.compile(r'Link\s+Loss:\s*(?P<link_loss>[\d-]+)')
+        r62 = regex_engine.compile(r'Link\s+Loss:\s*(?P<link_loss>[\d-]+)')
 
         # Measured Delay:           Min:- Avg:- Max:- usec
         # Normalized Delay:         Min:- Avg:- Max:- usec
-        r63 = re.compile(r'^(?P<delay_name>[a-zA-Z ]+):\s+Min:(?P<min>[-\d]+)\s+'
-                         r'Avg:(?P<avg>[-\d]+)\s+Max:(?P<max>[-\d]+)\s+usec$')
+        r63 = regex_engine.compile(r'^(?P<delay_name>[a-zA-Z ]+):\s+Min:(?P<min>[-\d]+)\s+'
+                                   r'Avg:(?P<avg>[-\d]+)\s+Max:(?P<max>[-\d]+)\s+usec$')
 
         parsed_output = {}
         interface_flag = False
@@ -2979,7 +2979,7 @@ class ShowIsisInterface(ShowIsisInterfaceSchema):
                 continue
 
             # CLNS I/O
-            r18 = re.compile(r'CLNS\s+I\/O')
+            r18 = regex_engine.compile(r'CLNS\s+I\/O')
             result = r18.match(line)
             if result:
                 clns_dict = interface_dict.setdefault('clns_io', {})
@@ -3753,8 +3753,8 @@ class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
         # IS-IS test (Level-1) Link State Database
         # IS-IS test (Level-2) Link State Database
         # IS-IS Level-1 Link State Database
-        r1 = re.compile(r'IS\-IS\s+(?P<instance>\S+)?\s*\(*Level\-'
-                        r'(?P<level>\d+)\)*\s+Link\s+State\s+Database')
+        r1 = regex_engine.compile(r'IS\-IS\s+(?P<instance>\S+)?\s*\(*Level\-'
+                                  r'(?P<level>\d+)\)*\s+Link\s+State\s+Database')
 
         # LSPID                 LSP Seq Num   LSP Checksum  LSP Holdtime/Rcvd  ATT/P/OL
         # R3.00-00            * 0x0000000d    0x0476        578  /*            1/0/0
@@ -3762,129 +3762,129 @@ class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
         # router-5.00-00        0x00000005 0x807997c        457                0/0/0
         # 0000.0CFF.0C35.00-00  0x0000000C    0x5696        325                0/0/0
         # 0000.0CFF.40AF.00-00* 0x00000009    0x8452        608                1/0/0
-        r2 = re.compile(r'^(?P<lspid>[\w\-\.]+)( *(?P<local_router>\*))? +'
-                r'(?P<lsp_seq_num>\w+) +(?P<lsp_checksum>\w+) +(?P<lsp_holdtime>\d+|\*)'
-                r'( *\/(?P<lsp_rcvd>\d+|\*))? +(?P<attach_bit>\d+)\/(?P<p_bit>\d+)\/'
-                r'(?P<overload_bit>\d+)$')
+        r2 = regex_engine.compile(r'^(?P<lspid>[\w\-\.]+)( *(?P<local_router>\*))? +'
+                          r'(?P<lsp_seq_num>\w+) +(?P<lsp_checksum>\w+) +(?P<lsp_holdtime>\d+|\*)'
+                          r'( *\/(?P<lsp_rcvd>\d+|\*))? +(?P<attach_bit>\d+)\/(?P<p_bit>\d+)\/'
+                          r'(?P<overload_bit>\d+)$')
 
         # Area Address:   49.0002
-        r3 = re.compile(r'Area\s+Address\s*:\s*(?P<area_address>\S+)')
+        r3 = regex_engine.compile(r'Area\s+Address\s*:\s*(?P<area_address>\S+)')
 
         # NLPID: 0xcc
         # NLPID: 0xCC 0x8E
-        r4 = re.compile(r'NLPID\s*:\s*(?P<nlpid>[\w\s]+)')
+        r4 = regex_engine.compile(r'NLPID\s*:\s*(?P<nlpid>[\w\s]+)')
 
         # IP Address:     10.36.3.3
-        r5 = re.compile(r'IP\s*Address\s*:\s*(?P<ip_address>\S+)')
+        r5 = regex_engine.compile(r'IP\s*Address\s*:\s*(?P<ip_address>\S+)')
 
         # Metric: 10         IP-Extended 10.36.3.0/24
         # Metric: 10         IP-Extended 10.2.3.0/24
-        r6 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\-Extended\s+'
-                        r'(?P<ip_address>[\d\.\/]+)')
+        r6 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\-Extended\s+'
+                                  r'(?P<ip_address>[\d\.\/]+)')
 
         # Hostname:       R3
-        r7 = re.compile(r'Hostname\s*:\s+(?P<hostname>\S+)')
+        r7 = regex_engine.compile(r'Hostname\s*:\s+(?P<hostname>\S+)')
 
         # IPv6 Address:   2001:db8:3:3:3::3
-        r8 = re.compile(r'IPv6\s+Address\s*:\s*(?P<ipv6_address>\S+)')
+        r8 = regex_engine.compile(r'IPv6\s+Address\s*:\s*(?P<ipv6_address>\S+)')
 
         # Metric: 10         MT (IPv6 Unicast) IPv6 2001:db8:3:3:3::3/128
         # Metric: 10         MT (IPv6 Unicast) IPv6 2001:db8:10:2::/64
-        r9 = re.compile(r'^Metric\s*:\s*(?P<metric>\d+)\s+MT\s*\(IPv(4|6)\s+'
-                        r'\w+\)\s*(?P<ip_version>IPv(4|6))\s+(?P<ip_address>\S+)$')
+        r9 = regex_engine.compile(r'^Metric\s*:\s*(?P<metric>\d+)\s+MT\s*\(IPv(4|6)\s+'
+                                  r'\w+\)\s*(?P<ip_version>IPv(4|6))\s+(?P<ip_address>\S+)$')
 
         # Metric: 10   IPv6 (MT-IPv6) 2001:0DB8::/64
         # Metric: 10         IPv6 2001:2:2:2::2/128
-        r9_2 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+(?P<ip_version>'
-                          r'IPv(4|6))\s+(\(MT-IPv6\))?\s*(?P<ip_address>'
-                          r'[\w\:\/]+)')
+        r9_2 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+(?P<ip_version>'
+                                    r'IPv(4|6))\s+(\(MT-IPv6\))?\s*(?P<ip_address>'
+                                    r'[\w\:\/]+)')
 
         # MT:             Standard (IPv4 Unicast)
         # MT:             Standard (IPv6 Unicast)
-        r10 = re.compile(r'MT\s*:\s*(?P<mt>\w+\s+\(IPv(4|6)\s*\w+\))\s*'
-                         r'(:?(?P<attach_bit>\d+)\/(?P<p_bit>\d+)\/'
-                         r'(?P<overload_bit>\d+))?')
+        r10 = regex_engine.compile(r'MT\s*:\s*(?P<mt>\w+\s+\(IPv(4|6)\s*\w+\))\s*'
+                                   r'(:?(?P<attach_bit>\d+)\/(?P<p_bit>\d+)\/'
+                                   r'(?P<overload_bit>\d+))?')
 
         # MT:             IPv6 Unicast                                 1/0/0
         # MT:             IPv4 Unicast                                 0/0/0
-        r11 = re.compile(r'MT\s*:\s*(?P<mt>IPv(4|6)\s+\w+)\s+'
-                         r'(?P<attach_bit>\d+)/(?P<p_bit>\d+)/'
-                         r'(?P<overload_bit>\d+)')
+        r11 = regex_engine.compile(r'MT\s*:\s*(?P<mt>IPv(4|6)\s+\w+)\s+'
+                                   r'(?P<attach_bit>\d+)/(?P<p_bit>\d+)/'
+                                   r'(?P<overload_bit>\d+)')
 
         # Metric: 10         IS-Extended R3.03
         # Metric: 10         IS-Extended R5.01
-        r12 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IS\-Extended\s+'
-                         r'(?P<is_extended>\S+)')
+        r12 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IS\-Extended\s+'
+                                   r'(?P<is_extended>\S+)')
 
         # Metric: 10         MT (IPv6 Unicast) IS-Extended R3.03
         # Metric: 10         MT (IPv6 Unicast) IS-Extended R5.01
-        r13 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+'
-                         r'(?P<mt_id>[\w\(\)\s]+)\s+IS-Extended\s+'
-                         r'(?P<is_extended>\S+)')
+        r13 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+'
+                                   r'(?P<mt_id>[\w\(\)\s]+)\s+IS-Extended\s+'
+                                   r'(?P<is_extended>\S+)')
 
         # Router ID:      10.144.6.6
         # Router ID:      10.196.7.7
-        r14 = re.compile(r'Router\s+ID\s*:\s*(?P<router_id>\S+)')
+        r14 = regex_engine.compile(r'Router\s+ID\s*:\s*(?P<router_id>\S+)')
 
         # Metric: 40         IP-Extended-Interarea 10.7.8.0/24
-        r15 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\-Extended\-'
-                          r'Interarea\s+(?P<ip_interarea>\S+)')
+        r15 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\-Extended\-'
+                                    r'Interarea\s+(?P<ip_interarea>\S+)')
 
         # Metric: 40         MT (IPv6 Unicast) IPv6-Interarea 2001:db8:10:7::/64
-        r16 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+MT\s+\('
-                         r'(?P<address_family>.+)\)\s+IPv6-Interarea\s+'
-                         r'(?P<ipv6_interarea>\S+)')
+        r16 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+MT\s+\('
+                                   r'(?P<address_family>.+)\)\s+IPv6-Interarea\s+'
+                                   r'(?P<ipv6_interarea>\S+)')
 
         # Total Level-1 LSP count: 11     Local Level-1 LSP count: 1
         # Total Level-2 LSP count: 11     Local Level-2 LSP count: 1
-        r17 = re.compile(r'Total\s+Level\-(?P<total_level>\d+)\s+LSP\s+count\s*:'
-                         r'\s*(?P<total_lsp_count>\d+)\s+Local\s*Level-'
-                         r'(?P<local_level>\d+)\s+LSP\s+count\s*:\s*'
-                         r'(?P<local_lsp_count>\d+)')
+        r17 = regex_engine.compile(r'Total\s+Level\-(?P<total_level>\d+)\s+LSP\s+count\s*:'
+                                   r'\s*(?P<total_lsp_count>\d+)\s+Local\s*Level-'
+                                   r'(?P<local_level>\d+)\s+LSP\s+count\s*:\s*'
+                                   r'(?P<local_lsp_count>\d+)')
 
         # Total LSP count: 3 (L1: 0, L2 3, local L1: 0, local L2 2)
-        r17_2 = re.compile(r'Total\s*LSP\s+count\s*:\s*(?P<total_lsp_count>\d+)'
-                           r'\s*\(L1\s*:\s*(?P<total_l1>\d+)\s*,\s*L2\s*'
-                           r'(?P<total_l2>\d+)\s*,\s*local\s*L1\s*:\s*'
-                           r'(?P<local_l1>\d+),\s*local\s*L2\s*'
-                           r'(?P<local_l2>\d+)\)')
+        r17_2 = regex_engine.compile(r'Total\s*LSP\s+count\s*:\s*(?P<total_lsp_count>\d+)'
+                                     r'\s*\(L1\s*:\s*(?P<total_l1>\d+)\s*,\s*L2\s*'
+                                     r'(?P<total_l2>\d+)\s*,\s*local\s*L1\s*:\s*'
+                                     r'(?P<local_l1>\d+),\s*local\s*L2\s*'
+                                     r'(?P<local_l2>\d+)\)')
 
         # Metric: 10   IS 0000.0CFF.62E6.03
-        r18 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IS\s+'
-                         r'(?P<is_neighbor>[\w\.\-]+)')
+        r18 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IS\s+'
+                                   r'(?P<is_neighbor>[\w\.\-]+)')
 
         # Metric: 0    ES 0000.0CFF.0C35
-        r19 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+ES\s+'
-                         r'(?P<es_neighbor>[\w\.]+)')
+        r19 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+ES\s+'
+                                   r'(?P<es_neighbor>[\w\.]+)')
 
         # Topology: IPv4 (0x0) IPv6 (0x2)
         # Topology: IPv4 (0x0)
         # Topology: IPv6 (0x0)
-        r20 = re.compile(r'Topology\s*:\s*(?P<topology_1>IPv(4|6)\s+\(0x0\))'
-                         r'\s*(?P<topology_2>IPv(4|6)\s+\(0x2\))?')
+        r20 = regex_engine.compile(r'Topology\s*:\s*(?P<topology_1>IPv(4|6)\s+\(0x0\))'
+                                   r'\s*(?P<topology_2>IPv(4|6)\s+\(0x2\))?')
 
         # Metric: 10    IS (MT-IPv6) cisco.03
-        r21 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s*IS\s+\(MT-IPv(4|6)\)'
-                         r'\s+(?P<is_neighbor>[\w\.]+)')
+        r21 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)\s*IS\s+\(MT-IPv(4|6)\)'
+                                   r'\s+(?P<is_neighbor>[\w\.]+)')
 
         # Metric: 0          IP 172.16.115.0/24
-        r22 = re.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\s+'
-                         r'(?P<ip_address>[\d\.\/]+)')
+        r22 = regex_engine.compile(r'Metric\s*:\s*(?P<metric>\d+)\s+IP\s+'
+                                   r'(?P<ip_address>[\d\.\/]+)')
 
         # Router Cap:     172.19.1.2 D:0 S:0
-        r23 = re.compile(r'^Router +Cap: +(?P<router_cap>[\S ]+)$')
+        r23 = regex_engine.compile(r'^Router +Cap: +(?P<router_cap>[\S ]+)$')
 
         # TLV 14:         Length: 2
-        r24 = re.compile(r'^TLV +(?P<tlv>\d+): +Length: +(?P<length>\d+)$')
+        r24 = regex_engine.compile(r'^TLV +(?P<tlv>\d+): +Length: +(?P<length>\d+)$')
 
         # SRv6 Locator:   MT (IPv6 Unicast) fc00:c000:1001::/48 D:0 Metric: 0 Algorithm: 0
-        r25 = re.compile(r'^SRv6\s+Locator:\s+MT\s+\(.*\)\s+(?P<locator_prefix>[\w:]+)\/'
-                         r'(?P<locator_prefix_length>\d+)\s+D:(?P<d_flag>\d+)\s+Metric:\s+'
-                         r'(?P<metric>\d+)\s+Algorithm:\s+(?P<algorithm>\d+)$')
+        r25 = regex_engine.compile(r'^SRv6\s+Locator:\s+MT\s+\(.*\)\s+(?P<locator_prefix>[\w:]+)\/'
+                                   r'(?P<locator_prefix_length>\d+)\s+D:(?P<d_flag>\d+)\s+Metric:\s+'
+                                   r'(?P<metric>\d+)\s+Algorithm:\s+(?P<algorithm>\d+)$')
 
         # Metric: 10         MT (IPv6 Unicast) IPv6-Ext-InAr fc00:a000:2000::3/128
-        r26 = re.compile(r'^Metric\s*:\s*(?P<metric>\d+)\s+MT\s*\(IPv(4|6)\s+'
-                        r'\w+\)\s*((?P<ip_version>IPv(4|6))[\-a-zA-Z]*)\s+(?P<ip_address>\S+)$')
+        r26 = regex_engine.compile(r'^Metric\s*:\s*(?P<metric>\d+)\s+MT\s*\(IPv(4|6)\s+'
+                                  r'\w+\)\s*((?P<ip_version>IPv(4|6))[\-a-zA-Z]*)\s+(?P<ip_address>\S+)$')
 
         parsed_output = {}
 
@@ -5056,73 +5056,73 @@ class ShowIsisPrivateAll(ShowIsisPrivateAllSchema):
         # +++++++++++++++++++++++ IS-IS TEST Global Private Data ++++++++++++++++++++++++
 
         # ISIS Test private data:
-        r1 = re.compile(r'^(?P<indent>\s*)ISIS +(?P<instance>\w+) +private +data:$')
+        r1 = regex_engine.compile(r'^(?P<indent>\s*)ISIS +(?P<instance>\w+) +private +data:$')
 
         # Address Family Table
-        r2 = re.compile(r'^(?P<indent>\s*)Address +Family +Table$')
+        r2 = regex_engine.compile(r'^(?P<indent>\s*)Address +Family +Table$')
 
         # IPv4
         # IPv6
-        r3 = re.compile(r'^(?P<indent>\s*)IPv(4|6)$')
+        r3 = regex_engine.compile(r'^(?P<indent>\s*)IPv(4|6)$')
 
         # Link Topology Table
-        r4 = re.compile(r'^(?P<indent>\s*)Link +Topology +Table$')
+        r4 = regex_engine.compile(r'^(?P<indent>\s*)Link +Topology +Table$')
 
         # Standard (IPv4 Unicast)
-        r5 = re.compile(r'^(?P<indent>\s*)Standard +\(IPv4 +Unicast\)$')
+        r5 = regex_engine.compile(r'^(?P<indent>\s*)Standard +\(IPv4 +Unicast\)$')
 
         # Topology Table
-        r6 = re.compile(r'^(?P<indent>\s*)Topology +Table$')
+        r6 = regex_engine.compile(r'^(?P<indent>\s*)Topology +Table$')
 
         # IPv4 Unicast
         # IPv4 Unicast VRF VRF1
-        r7 = re.compile(r'^(?P<indent>\s*)IPv(4|6) +Unicast( +VRF +\S+)?$')
+        r7 = regex_engine.compile(r'^(?P<indent>\s*)IPv(4|6) +Unicast( +VRF +\S+)?$')
 
         # Configuration:
-        r8 = re.compile(r'^(?P<indent>\s*)Configuration:$')
+        r8 = regex_engine.compile(r'^(?P<indent>\s*)Configuration:$')
 
         # Area Configuration Table
-        r9 = re.compile(r'^(?P<indent>\s*)Area +Configuration +Table$')
+        r9 = regex_engine.compile(r'^(?P<indent>\s*)Area +Configuration +Table$')
 
         # Cross Levels
-        r10 = re.compile(r'^(?P<indent>\s*)Cross +Levels$')
+        r10 = regex_engine.compile(r'^(?P<indent>\s*)Cross +Levels$')
 
         # Level-1
-        r11 = re.compile(r'^(?P<indent>\s*)Level\-(?P<level>\d+)$')
+        r11 = regex_engine.compile(r'^(?P<indent>\s*)Level\-(?P<level>\d+)$')
 
         # Area Table
-        r12 = re.compile(r'^(?P<indent>\s*)Area +Table$')
+        r12 = regex_engine.compile(r'^(?P<indent>\s*)Area +Table$')
 
         # per_af[IPv4]
         # per_topo[IPv4 Unicast]   :
         # prefix_priority_acl[ISIS_PREFIX_PRIORITY_CRITICAL]: 0x0
-        r13 = re.compile(r'^(?P<indent>\s*)(?P<key>\w+)\[(?P<type>.+)\]( *:)?'
-                         r'( +(?P<value>.*))?$')
+        r13 = regex_engine.compile(r'^(?P<indent>\s*)(?P<key>\w+)\[(?P<type>.+)\]( *:)?'
+                                   r'( +(?P<value>.*))?$')
 
         # [000] is_spf_prefix_priority_acl_names_set : FALSE
-        r14 = re.compile(r'^(?P<indent>\s*)\[(?P<idx>\d+)\] +(?P<key>\w+) *: +'
-                         r'(?P<value>.*)$')
+        r14 = regex_engine.compile(r'^(?P<indent>\s*)\[(?P<idx>\d+)\] +(?P<key>\w+) *: +'
+                                   r'(?P<value>.*)$')
 
 
         # ++++++++++++++++++++++ IS-IS Test Interface Private Data ++++++++++++++++++++++
 
         # Interface TenGigE0/0/1/2
-        r15 = re.compile(r'^(?P<indent>\s*)Interface +(?P<interface>\S+)$')
+        r15 = regex_engine.compile(r'^(?P<indent>\s*)Interface +(?P<interface>\S+)$')
 
         #   media             : 0x440cc90
-        r16 = re.compile(r'^(?P<indent>\s*)media *: +(?P<media>\S+)$')
+        r16 = regex_engine.compile(r'^(?P<indent>\s*)media *: +(?P<media>\S+)$')
 
         # cfg.cross_levels   :
         # cfg.per_level[Level-1]    :
         # cfg.per_level[Level-2]    :
-        r17 = re.compile(r'^(?P<indent>\s*)(?P<key>cfg\.(cross_levels|per_level\[.*\])) +:$')
+        r17 = regex_engine.compile(r'^(?P<indent>\s*)(?P<key>cfg\.(cross_levels|per_level\[.*\])) +:$')
 
         # media_specific.p2p.nsf_ietf
         # media_specific.p2p.p2p_over_lan
-        r18 = re.compile(r'^(?P<indent>\s*)(?P<key>[\w]+\.[\S]+)$')
+        r18 = regex_engine.compile(r'^(?P<indent>\s*)(?P<key>[\w]+\.[\S]+)$')
 
         #   lsp_arrivaltime_parameter.backoff_cfg.secondary_wait_msecs: 200
-        r99 = re.compile(r'^(?P<indent>\s*)(?P<key>[\w\.]+) *: +(?P<value>.*)$')
+        r99 = regex_engine.compile(r'^(?P<indent>\s*)(?P<key>[\w\.]+) *: +(?P<value>.*)$')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -5420,7 +5420,7 @@ class ShowIsisSegmentRoutingSrv6Locators(ShowIsisSegmentRoutingSrv6LocatorsSchem
 
         isis_dict = {}
         # IS-IS 1 SRv6 Locators
-        p0 =  re.compile(r'^IS-IS\s+(?P<instance>\S+)\s+SRv6\s+Locators$')
+        p0 =  regex_engine.compile(r'^IS-IS\s+(?P<instance>\S+)\s+SRv6\s+Locators$')
 
         # Name                  ID       Algo  Prefix                    Status
         # ------                ----     ----  ------                    ------
@@ -5428,9 +5428,9 @@ class ShowIsisSegmentRoutingSrv6Locators(ShowIsisSegmentRoutingSrv6LocatorsSchem
         # ALGO_128              2        128   cafe:0:128::/48           Active
         # ALGO_129              3        129   cafe:0:129::/48           Active
 
-        p1 = re.compile(r'^(?P<name>\w+)\s+(?P<id>\d+)\s+(?P<algo>\d+) +'
-                        r'\s+(?P<prefix>[a-fA-F\d\:]+\/\d{1,3}) +'
-                        r'\s+(?P<status>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<name>\w+)\s+(?P<id>\d+)\s+(?P<algo>\d+) +'
+                                  r'\s+(?P<prefix>[a-fA-F\d\:]+\/\d{1,3}) +'
+                                  r'\s+(?P<status>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5508,17 +5508,17 @@ class ShowIsisInterfaceBrief(ShowIsisInterfaceBriefSchema):
 
         # IS-IS 1 Interfaces
         # IS-IS SR Interfaces
-        p1 = re.compile(r'^IS-IS\s+(?P<process_id>\w+)\s+Interfaces$')
+        p1 = regex_engine.compile(r'^IS-IS\s+(?P<process_id>\w+)\s+Interfaces$')
 
         # BE10               Yes    -    0      2/2        2/2     Up    1497    -    -
         # BE10.10            Yes    -    1*      2/2        2/2     Up    1497    -   64
         # Gi0/0/0/1.19       No     -    1      1/2        1/2     Up    1497    -   64
         # Gi0/0/0/1.20       No
         # Lo0                No
-        p2 = re.compile(r'^(?P<interface_name>[\w\/.]+)\s+(?P<all_status>Yes|No)'
-                        r'(?:\s+(?P<adjs_l1>[\d\*-]+)\s+(?P<adjs_l2>[\d\*-]+)\s+'
-                        r'(?P<adj_topos_run_cfg>[\d\/]+)\s+(?P<adv_topos_run_cfg>[\d\/]+)\s+'
-                        r'(?P<clns>Up|Down)\s+(?P<mtu_value>\d+)\s+(?P<prio_l1>[\d-]+)\s+(?P<prio_l2>[\d-]+))?$')
+        p2 = regex_engine.compile(r'^(?P<interface_name>[\w\/.]+)\s+(?P<all_status>Yes|No)'
+                                  r'(?:\s+(?P<adjs_l1>[\d\*-]+)\s+(?P<adjs_l2>[\d\*-]+)\s+'
+                                  r'(?P<adj_topos_run_cfg>[\d\/]+)\s+(?P<adv_topos_run_cfg>[\d\/]+)\s+'
+                                  r'(?P<clns>Up|Down)\s+(?P<mtu_value>\d+)\s+(?P<prio_l1>[\d-]+)\s+(?P<prio_l2>[\d-]+))?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -5602,25 +5602,25 @@ class ShowIsisDatabase(ShowIsisDatabaseSchema):
         result_dict = {}
 
         # No IS-IS 1 levels found
-        p1 = re.compile(r'^No\s+IS-IS\s+(?P<process_id>\d+)\s+levels\s+found$')
+        p1 = regex_engine.compile(r'^No\s+IS-IS\s+(?P<process_id>\d+)\s+levels\s+found$')
 
         # IS-IS 10 (Level-2) Link State Database
         # IS-IS 99 (Level-1) Link State Database
         # IS-IS CORE (Level-1) Link State Database
-        p2 = re.compile(r'^IS-IS\s+(?P<process_id>\w+)\s+\(Level-(?P<level>\d+)\)\s+Link\s+State\s+Database$')
+        p2 = regex_engine.compile(r'^IS-IS\s+(?P<process_id>\w+)\s+\(Level-(?P<level>\d+)\)\s+Link\s+State\s+Database$')
 
         # P-9001-1.00-00 * 0x000003a8 0x4012 901 /* 0/0/0
         # P-9001-1.05-00 0x00005acb 0xd1aa 1199 /* 0/0/0
         # PE-9001-1.00-00 0x0000039f 0xa464 931 /1199 0/0/0
         # XRv9k-PE1.00-00     * 0x0000141f   0xfc84        432             0/0/0
         # AGG-PE-A.00-00        0x00001430   0x09c6        917             0/0/0
-        p3 = re.compile(r'^(?P<lspid>[A-Za-z\-0-9\.]+)\s+(?P<lsp_seq_num>[\w \*]+)\s+'
-                        r'(?P<lsp_checksum>\w+)\s+(?P<lsp_holdtime>\d+)\s+(?:\/'
-                        r'(?P<rcvd>[\d\*]+)\s+)?(?P<attach_bit>[\d]+)\/(?P<p_bit>[\d]+)\/(?P<overload_bit>[\d]+)$')
+        p3 = regex_engine.compile(r'^(?P<lspid>[A-Za-z\-0-9\.]+)\s+(?P<lsp_seq_num>[\w \*]+)\s+'
+                                  r'(?P<lsp_checksum>\w+)\s+(?P<lsp_holdtime>\d+)\s+(?:\/'
+                                  r'(?P<rcvd>[\d\*]+)\s+)?(?P<attach_bit>[\d]+)\/(?P<p_bit>[\d]+)\/(?P<overload_bit>[\d]+)$')
 
         # Total Level-2 LSP count: 4 Local Level-2 LSP count: 1
-        p4 = re.compile(r'^Total\s+Level-(?P<total_level>\d+)\s+LSP\s+count:\s+(?P<total_lsp_count>\d+)\s+'
-                        r'Local\s+Level-(?P<local_level>\d+)\s+LSP\s+count:\s+(?P<local_lsp_count>\d+)$')
+        p4 = regex_engine.compile(r'^Total\s+Level-(?P<total_level>\d+)\s+LSP\s+count:\s+(?P<total_lsp_count>\d+)\s+'
+                                  r'Local\s+Level-(?P<local_level>\d+)\s+LSP\s+count:\s+(?P<local_lsp_count>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5731,17 +5731,17 @@ class ShowIsisIpv4Topology(ShowIsisIpv4TopologySchema):
         result_dict = {}
 
         # No IS-IS 1 IPv4 Unicast levels found
-        p1 = re.compile(r'^No\s+IS-IS\s+(?P<process_id>\d+)\s+IPv4\s+Unicast\s+levels\s+found$')
+        p1 = regex_engine.compile(r'^No\s+IS-IS\s+(?P<process_id>\d+)\s+IPv4\s+Unicast\s+levels\s+found$')
 
         # IS-IS 99 paths to IPv4 Unicast (Level-1) routers
         # IS-IS CORE paths to IPv4 Unicast (Level-1) routers
-        p2 = re.compile(r'^IS-IS\s+(?P<process_id>\w+)\s+paths\s+to\s+IPv4\s+Unicast\s+\(Level-(?P<level>\d+)\)\s+routers$')
+        p2 = regex_engine.compile(r'^IS-IS\s+(?P<process_id>\w+)\s+paths\s+to\s+IPv4\s+Unicast\s+\(Level-(?P<level>\d+)\)\s+routers$')
 
         # PE-9001-1 10 PE-9001-1 Gi0/0/0/1.19 28c7.cebd.7c23
         # XRv9k-PE1       --
         # AGG-PE-A        10      AGG-PE-A        Gi0/0/0/0       5001.0002.0001
-        p3 = re.compile(r'^(?P<system_id>[\w-]+)\s+(?P<metric>[\d-]+)'
-                        r'(?:\s+(?P<next_hop>[\w-]+)\s+(?P<interface_name>[\w.\/]+)\s+(?P<snpa>[\w.]+))?$')
+        p3 = regex_engine.compile(r'^(?P<system_id>[\w-]+)\s+(?P<metric>[\d-]+)'
+                                  r'(?:\s+(?P<next_hop>[\w-]+)\s+(?P<interface_name>[\w.\/]+)\s+(?P<snpa>[\w.]+))?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6,11 +6,13 @@ show l2route evpn mac-ip all
 
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class AutoTree(dict):
     def __missing__(self, key):
@@ -52,9 +54,9 @@ class ShowL2routeTopology(ShowL2routeTopologySchema):
         # 4294967294     GLOBAL           N/A
         # 4294967295     ALL              N/A
 
-        p = re.compile(r'^(?P<topo_id>\d+) +'
-                       r'(?P<topo_name>\S+) +'
-                       r'(?P<topo_type>\S+)')
+        p = regex_engine.compile(r'^(?P<topo_id>\d+) +'
+                                 r'(?P<topo_name>\S+) +'
+                                 r'(?P<topo_type>\S+)')
 
         parsed_dict = {}
 
@@ -119,10 +121,10 @@ class ShowL2routeEvpnMacAll(ShowL2routeEvpnMacAllSchema):
         # 0        0012.01ff.0005 L2VPN       172.16.2.89/100001/ME
         # 0        0012.01ff.0006 L2VPN       172.16.2.89/100001/ME
 
-        p = re.compile(r'^(?P<topo_id>\d+) +'
-                       r'(?P<mac_address>\S+) +'
-                       r'(?P<producer>\S+) +'
-                       r'(?P<next_hop>\S+)')
+        p = regex_engine.compile(r'^(?P<topo_id>\d+) +'
+                                 r'(?P<mac_address>\S+) +'
+                                 r'(?P<producer>\S+) +'
+                                 r'(?P<next_hop>\S+)')
 
         parsed_dict = {}
 
@@ -194,11 +196,11 @@ class ShowL2routeEvpnMacIpAll(ShowL2routeEvpnMacIpAllSchema):
         # 0        fc00.00ff.0107 192.168.166.3   L2VPN  Bundle-Ether1.0
         # 0        fc00.00ff.0109 192.168.49.3    L2VPN  68101/I/ME
 
-        p = re.compile(r'^(?P<topo_id>\d+) +'
-                       r'(?P<mac_address>\S+) +'
-                       r'(?P<ip_address>\S+) +'
-                       r'(?P<producer>\S+) +'
-                       r'(?P<next_hop>\S+)')
+        p = regex_engine.compile(r'^(?P<topo_id>\d+) +'
+                                 r'(?P<mac_address>\S+) +'
+                                 r'(?P<ip_address>\S+) +'
+                                 r'(?P<producer>\S+) +'
+                                 r'(?P<next_hop>\S+)')
 
         parsed_dict = {}
 
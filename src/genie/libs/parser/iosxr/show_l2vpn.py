@@ -14,6 +14,7 @@ from ipaddress import ip_address
 # Genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -64,11 +65,11 @@ class ShowL2vpnMacLearning(ShowL2vpnMacLearningSchema):
         # 6        0/0/CPU0   BV1        0000.f6ff.8fd6      fe80::200:f6ff:feff:8fd6
         # 1        0/0/CPU0   BE1.7      7777.77ff.7779
 
-        p = re.compile(r'^(?P<topo_id>\d+) +'
-                       r'(?P<producer>\S+) +'
-                       r'(?P<next_hop>\S+) +'
-                       r'(?P<mac_address>\S+)'
-                       r'( +(?P<ip_address>\S+))?$')
+        p = regex_engine.compile(r'^(?P<topo_id>\d+) +'
+                                 r'(?P<producer>\S+) +'
+                                 r'(?P<next_hop>\S+) +'
+                                 r'(?P<mac_address>\S+)'
+                                 r'( +(?P<ip_address>\S+))?$')
 
         parsed_dict = {}
 
@@ -155,25 +156,25 @@ class ShowL2vpnForwardingBridgeDomainMacAddress(
 
         # Mac Address Type Learned from/Filtered on LC learned Resync Age/Last
         # Change Mapped to
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Mac +Address +Type +Learned +from\/Filtered +on +LC +learned +Resync Age\/Last +Change +Mapped +to$')
 
         # 1.01.1 EVPN    BD id: 0                    N/A        N/A
         # N/A
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<mac_address>\S+) +(?P<type>\S+) +BD +id: +(?P<bridge_domain>\d+)'
             r' +(?P<lc_learned>\S+) +(?P<resync_age>[\S\s]+) +(?P<mapped_to>\S+)$')
 
         # 3.3.5          dynamic BE1.2                       N/A        14 Mar 12:46:04        N/A
         # 0001.00ff.0002 dynamic Te0/0/1/0/3.3               N/A        0d 0h
         # 0m 14s           N/A
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<mac_address>\S+) +(?P<type>\S+) +(?P<learned_from>[\w\/\.\d]+)'
             r' +(?P<lc_learned>\S+) +(?P<resync_age>[\S\s]+) +(?P<mapped_to>\S+)$')
 
         # 2.2.2          dynamic (10.25.40.40, 10007)        N/A        14 Mar
         # 12:46:04        N/A
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^(?P<mac_address>\S+) +(?P<type>\w+) +(?P<learned_from>[\d\(\)\.\,\s]+)'
             r' +(?P<lc_learned>\S+) +(?P<resync_age>[\S\s]+) +(?P<mapped_to>\S+)$')
 
@@ -302,11 +303,11 @@ class ShowL2vpnForwardingProtectionMainInterface(
             out = output
 
         # Main Interface ID                Instance      State
-        p1 = re.compile(r'^Main +Interface +ID +Instance +State$')
+        p1 = regex_engine.compile(r'^Main +Interface +ID +Instance +State$')
 
         # VFI:ves-vfi-1                    0          FORWARDING
         # PW:10.25.40.40,10001             0          FORWARDING
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<main_interface_id>\S+) +(?P<instance>\d+) +(?P<state>\S+)$')
 
         # Init dict
@@ -451,48 +452,48 @@ class ShowL2vpnBridgeDomain(ShowL2vpnBridgeDomainSchema):
         # Bridge group: g1, bridge-domain: bd1, id: 0, state: up, ShgId: 0, MSTi: 0
         # Bridge group: ev-Multicast, bridge-domain: ev-Multicast-TV, id: 1, state: up, ShgId: 0, MSTi: 0
         # Bridge group: a_b, bridge-domain: CD, id: 2, state: admin down (Shutdown), ShgId: 0, MSTi: 0
-        p1 = re.compile(r'^Bridge +group: +(?P<bridge_group>\S+), +bridge\-domain: +'
+        p1 = regex_engine.compile(r'^Bridge +group: +(?P<bridge_group>\S+), +bridge\-domain: +'
             r'(?P<bridge_domain>\S+), +id: +(?P<id>\d+), +state: +(?P<state>[\w\s\(\)]+), +'
             r'ShgId: +(?P<shg_id>\d+), +MSTi: +(?P<mst_i>\d+)$')
 
         # Aging: 300 s, MAC limit: 4000, Action: none, Notification: syslog
         # Aging: 300 s, MAC limit: 100, Action: limit, no-flood, Notification: syslog, trap
-        p2 = re.compile(r'^Aging: +(?P<mac_aging_time>\d+) s, +MAC +limit: +(?P<mac_limit>\d+), +'
-                r'Action: +(?P<mac_limit_action>[\S ]+), +Notification: +'
-                r'(?P<mac_limit_notification>[\S ]+)$')
+        p2 = regex_engine.compile(r'^Aging: +(?P<mac_aging_time>\d+) s, +MAC +limit: +(?P<mac_limit>\d+), +'
+                          r'Action: +(?P<mac_limit_action>[\S ]+), +Notification: +'
+                          r'(?P<mac_limit_notification>[\S ]+)$')
 
         # Filter MAC addresses: 0
-        p3 = re.compile(r'^Filter +MAC +addresses: +(?P<filter_mac_address>\d+)$')
+        p3 = regex_engine.compile(r'^Filter +MAC +addresses: +(?P<filter_mac_address>\d+)$')
 
         # ACs: 1 (1 up), VFIs: 1, PWs: 1 (1 up)
-        p4 = re.compile(r'^ACs: +(?P<ac>\d+) +\((?P<ac_up>\d+) +up\), +VFIs: +(?P<vfi>\d+), +'
+        p4 = regex_engine.compile(r'^ACs: +(?P<ac>\d+) +\((?P<ac_up>\d+) +up\), +VFIs: +(?P<vfi>\d+), +'
             r'PWs: +(?P<pw>\d+) +\((?P<pw_up>\d+) +\w+\)(, +PBBs: +(?P<pbb>\d+)'
             r' +\((?P<pbb_up>\d+) +up\))?(, +VNIs: +(?P<vni>\d+) +\((?P<vni_up>\d+) +up\))?$')
 
         # Gi0/1/0/0, state: up, Static MAC addresses: 2, MSTi: 0 (unprotected)
-        p5 = re.compile(r'^(?P<interface>\S+), +state: +(?P<state>\w+), +Static +'
+        p5 = regex_engine.compile(r'^(?P<interface>\S+), +state: +(?P<state>\w+), +Static +'
             r'MAC +addresses: +(?P<static_mac_address>\d+)(, +MSTi: +(?P<mst_i>\d+)'
             r'( +\((?P<mst_i_state>\w+)\))?)?$')
         
         # BV100, state: up, BVI MAC addresses: 1
-        p5_1 = re.compile(r'^(?P<interface>\S+), +state: +(?P<state>\w+), +BVI +'
+        p5_1 = regex_engine.compile(r'^(?P<interface>\S+), +state: +(?P<state>\w+), +BVI +'
             r'MAC +addresses: +(?P<bvi_mac_address>\S+)$')
 
         # VFI 1
         # VFI vfi60 (up)
         # VFI string_LABEL_01 (up)
-        p6 = re.compile(r'^VFI\s+(?P<vfi>\S+)(\s*(\((?P<state>[\w\s]+)\))?\s*)$')
+        p6 = regex_engine.compile(r'^VFI\s+(?P<vfi>\S+)(\s*(\((?P<state>[\w\s]+)\))?\s*)$')
 
         # Neighbor 10.1.1.1 pw-id 1, state: up, Static MAC addresses: 0
-        p7 = re.compile(r'Neighbor +(?P<neighbor>\S+) +pw-id +(?P<pw_id>\d+), +state: +'
+        p7 = regex_engine.compile(r'Neighbor +(?P<neighbor>\S+) +pw-id +(?P<pw_id>\d+), +state: +'
             r'(?P<state>\w+), +Static +MAC +addresses: +(?P<static_mac_address>\d+)$')
 
         # g1/bd1                           0     up         1/1            1/1 
-        p8 = re.compile(r'^(?P<bridge_group>\S+)\/(?P<bridge_domain_name>\S+) +(?P<id>\d+) +'
+        p8 = regex_engine.compile(r'^(?P<bridge_group>\S+)\/(?P<bridge_domain_name>\S+) +(?P<id>\d+) +'
             r'(?P<state>\w+) +(?P<ac>\d+)\/(?P<ac_up>\d+) +(?P<pw>\d+)\/(?P<pw_up>\d+)$')
         
         # EVPN, state: up
-        p9 = re.compile(r'^(?P<evpn>\S+), +state: +(?P<state>\w+)$')
+        p9 = regex_engine.compile(r'^(?P<evpn>\S+), +state: +(?P<state>\w+)$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -746,23 +747,23 @@ class ShowL2vpnBridgeDomainBrief(ShowL2vpnBridgeDomainBriefSchema):
         # g1/bd1                           0     up         1/1            1/1
         # G-t:BDA                  1     up             3/2          3/2           0/0         0/0
         # g_D:a1                     2     admin down     1/0          1/0           0/0         0/0
-        p1 = re.compile(r"^(?P<group>([\w\-]+))(?:\:|\/)(?P<domain>([\w\-]+)) "
-                        r"+(?P<id>([\d]+)) +(?P<state>(\S+(?: \S+)?)) "
-                        r"+(?P<acs>([\d]+))\/(?P<acup>([\d]+)) "
-                        r"+(?P<pws>([\d]+))\/(?P<pwup>([\d]+))(?: "
-                        r"+(?P<pbbs>([\d]+))\/(?P<pbbup>([\d]+)) "
-                        r"+(?P<vnis>([\d]+))\/(?P<vniup>([\d]+)))?$")
+        p1 = regex_engine.compile(r"^(?P<group>([\w\-]+))(?:\:|\/)(?P<domain>([\w\-]+)) "
+                                  r"+(?P<id>([\d]+)) +(?P<state>(\S+(?: \S+)?)) "
+                                  r"+(?P<acs>([\d]+))\/(?P<acup>([\d]+)) "
+                                  r"+(?P<pws>([\d]+))\/(?P<pwup>([\d]+))(?: "
+                                  r"+(?P<pbbs>([\d]+))\/(?P<pbbup>([\d]+)) "
+                                  r"+(?P<vnis>([\d]+))\/(?P<vniup>([\d]+)))?$")
         # regex only takes values from under the table headers. Table headers static, so no regex needed.
 
         # Dasdnalsdnalk:D-dasdasdasdwa
-        p2 = re.compile(r"^(?P<group>([\w\-]+))(?:\:|\/)(?P<domain>([\w\-]+))$")
+        p2 = regex_engine.compile(r"^(?P<group>([\w\-]+))(?:\:|\/)(?P<domain>([\w\-]+))$")
 
         # 0     up             1/1          1/1           0/0         0/0
-        p3 = re.compile(r"^(?P<id>([\d]+)) +(?P<state>(\S+(?: \S+)?)) "
-                    r"+(?P<acs>([\d]+))\/(?P<acup>([\d]+)) "
-                    r"+(?P<pws>([\d]+))\/(?P<pwup>([\d]+))(?: "
-                    r"+(?P<pbbs>([\d]+))\/(?P<pbbup>([\d]+)) "
-                    r"+(?P<vnis>([\d]+))\/(?P<vniup>([\d]+)))?$")
+        p3 = regex_engine.compile(r"^(?P<id>([\d]+)) +(?P<state>(\S+(?: \S+)?)) "
+                              r"+(?P<acs>([\d]+))\/(?P<acup>([\d]+)) "
+                              r"+(?P<pws>([\d]+))\/(?P<pwup>([\d]+))(?: "
+                              r"+(?P<pbbs>([\d]+))\/(?P<pbbup>([\d]+)) "
+                              r"+(?P<vnis>([\d]+))\/(?P<vniup>([\d]+)))?$")
 
         ret_dict = {}
         for line in out.splitlines():
@@ -873,16 +874,16 @@ class ShowL2vpnBridgeDomainSummary(ShowL2vpnBridgeDomainSummarySchema):
         ret_dict = {}
 
         # Number of groups: 1, bridge-domains: 1, Up: 1, Shutdown: 0
-        p1 = re.compile(r'^Number +of +groups: +(?P<number_of_groups>\d+), +'
+        p1 = regex_engine.compile(r'^Number +of +groups: +(?P<number_of_groups>\d+), +'
             r'bridge-domains: +(?P<bridge_domains>\d+), +Up: +(?P<up>\d+), +Shutdown: +'
             r'(?P<shutdown>\d+)$')
         
         # Number of ACs: 1 Up: 1, Down: 0
-        p2 = re.compile(r'^Number +of +ACs: +(?P<ac>\d+) +Up: +(?P<up>\d+), +Down: +'
+        p2 = regex_engine.compile(r'^Number +of +ACs: +(?P<ac>\d+) +Up: +(?P<up>\d+), +Down: +'
             r'(?P<down>\d+)$')
         
         # Number of PWs: 1 Up: 1, Down: 0
-        p3 = re.compile(r'^Number +of +PWs: +(?P<pw>\d+) +Up: +(?P<up>\d+), +Down: +'
+        p3 = regex_engine.compile(r'^Number +of +PWs: +(?P<pw>\d+) +Up: +(?P<up>\d+), +Down: +'
             r'(?P<down>\d+)$')
 
         for line in out.splitlines():
@@ -1345,321 +1346,321 @@ class ShowL2vpnBridgeDomainDetail(ShowL2vpnBridgeDomainDetailSchema):
         
         # Bridge group: g1, bridge-domain: bd1, id: 0, state: up, ShgId: 0, MSTi: 0
         # Bridge group: EVPN-Multicast, bridge-domain: EVPN-Multicast-BTV, id: 0, state: up, ShgId: 0, MSTi: 0
-        p1 = re.compile(r'^Bridge +group: +(?P<bridge_group>\S+), +bridge\-domain: +'
-                        r'(?P<bridge_domain>\S+), +id: +(?P<id>\d+), +state: +(?P<state>\w+), +'
-                        r'ShgId: +(?P<shg_id>\d+)(, +MSTi: +(?P<mst_i>\d+))?$')
+        p1 = regex_engine.compile(r'^Bridge +group: +(?P<bridge_group>\S+), +bridge\-domain: +'
+                                  r'(?P<bridge_domain>\S+), +id: +(?P<id>\d+), +state: +(?P<state>\w+), +'
+                                  r'ShgId: +(?P<shg_id>\d+)(, +MSTi: +(?P<mst_i>\d+))?$')
         
         # VPWS Mode
-        p1_1 = re.compile(r'^(?P<mode>\S+) +Mode$')
+        p1_1 = regex_engine.compile(r'^(?P<mode>\S+) +Mode$')
         
         # MAC learning: enabled
-        p2 = re.compile(r'^MAC +learning: +(?P<mac_learning>\S+)$')
+        p2 = regex_engine.compile(r'^MAC +learning: +(?P<mac_learning>\S+)$')
 
         # MAC withdraw: disabled
-        p3 = re.compile(r'^MAC +withdraw: +(?P<mac_withdraw>\S+)$')
+        p3 = regex_engine.compile(r'^MAC +withdraw: +(?P<mac_withdraw>\S+)$')
 
         # Flooding:
-        p4 = re.compile(r'^Flooding:$')
+        p4 = regex_engine.compile(r'^Flooding:$')
 
         # Broadcast & Multicast: enabled
-        p5 = re.compile(r'^Broadcast +& +Multicast: +(?P<enabled>\S+)$')
+        p5 = regex_engine.compile(r'^Broadcast +& +Multicast: +(?P<enabled>\S+)$')
 
         # Unknown unicast: enabled
-        p6 = re.compile(r'^Unknown +unicast: +(?P<enabled>\S+)$')
+        p6 = regex_engine.compile(r'^Unknown +unicast: +(?P<enabled>\S+)$')
 
         # MAC aging time: 300 s, Type: inactivity
-        p7 = re.compile(r'^MAC +aging +time: +(?P<mac_aging_time>\d+) +s, +Type: +(?P<mac_aging_type>\S+)$')
+        p7 = regex_engine.compile(r'^MAC +aging +time: +(?P<mac_aging_time>\d+) +s, +Type: +(?P<mac_aging_type>\S+)$')
 
         # MAC limit: 4000, Action: none, Notification: syslog
-        p8 = re.compile(r'^MAC +limit: +(?P<mac_limit>\d+), +Action: +(?P<action>\S+),'
-                        r' +Notification: +(?P<notification>\S+)$')
+        p8 = regex_engine.compile(r'^MAC +limit: +(?P<mac_limit>\d+), +Action: +(?P<action>\S+),'
+                                  r' +Notification: +(?P<notification>\S+)$')
 
         # MAC limit reached: yes
         # MAC limit reached: no, threshold: 75%
-        p9 = re.compile(r'^MAC +limit +reached: +(?P<mac_limit_reached>\S+)'
-                        r'(, +threshold: +(?P<threshold>\S+))?$')
+        p9 = regex_engine.compile(r'^MAC +limit +reached: +(?P<mac_limit_reached>\S+)'
+                                  r'(, +threshold: +(?P<threshold>\S+))?$')
 
         # Security: disabled
-        p10 = re.compile(r'^Security: +(?P<security>\S+)$')
+        p10 = regex_engine.compile(r'^Security: +(?P<security>\S+)$')
 
         # DHCPv4 snooping: disabled
         # DHCPv4 Snooping: disabled
-        p11 = re.compile(r'^DHCPv4 +(s|S)nooping: +(?P<dhcp_v4_snooping>\S+)$')
+        p11 = regex_engine.compile(r'^DHCPv4 +(s|S)nooping: +(?P<dhcp_v4_snooping>\S+)$')
 
         # DHCPv4 Snooping profile: none
-        p11_1 = re.compile(r'^DHCPv4 +(s|S)nooping profile: +(?P<dhcp_v4_snooping_profile>\S+)$')
+        p11_1 = regex_engine.compile(r'^DHCPv4 +(s|S)nooping profile: +(?P<dhcp_v4_snooping_profile>\S+)$')
 
         # IGMP Snooping: disabled
-        p11_2 = re.compile(r'IGMP +(s|S)nooping: +(?P<igmp_snooping>\S+)$')
+        p11_2 = regex_engine.compile(r'IGMP +(s|S)nooping: +(?P<igmp_snooping>\S+)$')
 
         # IGMP Snooping profile: none
-        p11_3 = re.compile(r'^IGMP +(s|S)nooping profile: +(?P<igmp_snooping_profile>\S+)$')
+        p11_3 = regex_engine.compile(r'^IGMP +(s|S)nooping profile: +(?P<igmp_snooping_profile>\S+)$')
 
         # MLD Snooping profile: none
-        p11_4 = re.compile(r'^MLD +(s|S)nooping profile: +(?P<mld_snooping_profile>\S+)$')
+        p11_4 = regex_engine.compile(r'^MLD +(s|S)nooping profile: +(?P<mld_snooping_profile>\S+)$')
         
         # MTU: 1500
-        p12 = re.compile(r'^MTU: +(?P<mtu>\d+)$')
+        p12 = regex_engine.compile(r'^MTU: +(?P<mtu>\d+)$')
 
         # Filter MAC addresses:
-        p13 = re.compile(r'^Filter +MAC +addresses:( +(?P<filter_mac_addresses>\d+))?$')
+        p13 = regex_engine.compile(r'^Filter +MAC +addresses:( +(?P<filter_mac_addresses>\d+))?$')
 
         # ACs: 1 (1 up), VFIs: 1, PWs: 1 (1 up)
         # ACs: 3 (2 up), VFIs: 0, PWs: 0 (0 up), PBBs: 0 (0 up), VNIs: 0 (0 up)
-        p14 = re.compile(r'^ACs: +(?P<ac>\d+) +\((?P<ac_up>\d+) +up\), +VFIs: +(?P<vfi>\d+), +'
-                         r'PWs: +(?P<pw>\d+) +\((?P<pw_up>\d+) +up\)(, +PBBs: +(?P<pbb>\d+) +\('
-                         r'(?P<pbb_up>\d+) +up\))?(, +VNIs: +(?P<vni>\d+) +\((?P<vni_up>\d+) +up\))?$')
+        p14 = regex_engine.compile(r'^ACs: +(?P<ac>\d+) +\((?P<ac_up>\d+) +up\), +VFIs: +(?P<vfi>\d+), +'
+                                   r'PWs: +(?P<pw>\d+) +\((?P<pw_up>\d+) +up\)(, +PBBs: +(?P<pbb>\d+) +\('
+                                   r'(?P<pbb_up>\d+) +up\))?(, +VNIs: +(?P<vni>\d+) +\((?P<vni_up>\d+) +up\))?$')
 
         # List of ACs:
-        p15 = re.compile(r'^List +of +ACs:$')
+        p15 = regex_engine.compile(r'^List +of +ACs:$')
 
         # AC: GigabitEthernet0/1/0/0, state is up
         # AC: GigabitEthernet0/5/1/4, state is admin down
-        p16 = re.compile(r'^AC: +(?P<interface>\S+), +state +is +(?P<state>[\S ]+)$')
+        p16 = regex_engine.compile(r'^AC: +(?P<interface>\S+), +state +is +(?P<state>[\S ]+)$')
 
         # Type Ethernet
         # Type VLAN; Num Ranges: 1
-        p17 = re.compile(r'^Type +(?P<type>\S+)(; +Num +Ranges: +(?P<num_ranges>\d+))?$')
+        p17 = regex_engine.compile(r'^Type +(?P<type>\S+)(; +Num +Ranges: +(?P<num_ranges>\d+))?$')
 
         # MTU 1500; XC ID 0x2000001; interworking none; MSTi 0 (unprotected)
         # MTU 1514; XC ID 0x8000000b; interworking none
         # MTU 9202; XC ID 0xc0000002; interworking none; MSTi 5
-        p18 = re.compile(r'^MTU +(?P<mtu>\d+); +XC +ID +(?P<xc_id>\S+); +interworking +'
-                        r'(?P<interworking>\S+)(; +MSTi +(?P<mst_i>\d+))?( +\((?P<mst_i_state>\w+)\))?$')
+        p18 = regex_engine.compile(r'^MTU +(?P<mtu>\d+); +XC +ID +(?P<xc_id>\S+); +interworking +'
+                                  r'(?P<interworking>\S+)(; +MSTi +(?P<mst_i>\d+))?( +\((?P<mst_i_state>\w+)\))?$')
 
         # Type Ethernet      MTU 1500; XC ID 1; interworking none
-        p18_1 = re.compile(r'Type +(?P<pw_type>\S+) +MTU +(?P<mtu>\d+); +XC +ID +(?P<xc_id>\d+);'
-                            r' +interworking +(?P<interworking>\S+)$')
+        p18_1 = regex_engine.compile(r'Type +(?P<pw_type>\S+) +MTU +(?P<mtu>\d+); +XC +ID +(?P<xc_id>\d+);'
+                                      r' +interworking +(?P<interworking>\S+)$')
         
         # 0000.0000.0000
-        p19 = re.compile(r'(?P<static_mac_address>[a-zA-Z\d\.]+)$')
+        p19 = regex_engine.compile(r'(?P<static_mac_address>[a-zA-Z\d\.]+)$')
 
         # Statistics:
-        p20 = re.compile(r'Statistics:')
+        p20 = regex_engine.compile(r'Statistics:')
 
         # packet totals: receive 3919680,send 9328
         # packets: received 0 (unicast 0), sent 0
-        p21 = re.compile(r'packet(s)?( +totals)?: +receive(d)? +(?P<receive>\d+)( +\(( *multicast +'
-                        r'(?P<multicast>\d+),?)?( *broadcast +(?P<broadcast>\d+),?)?( *unknown +'
-                        r'unicast +(?P<unknown_unicast>\d+),?)? *unicast +(?P<unicast>\d+)\))?, '
-                        r'*sen(d|t) +(?P<send>\d+)$')
+        p21 = regex_engine.compile(r'packet(s)?( +totals)?: +receive(d)? +(?P<receive>\d+)( +\(( *multicast +'
+                                  r'(?P<multicast>\d+),?)?( *broadcast +(?P<broadcast>\d+),?)?( *unknown +'
+                                  r'unicast +(?P<unknown_unicast>\d+),?)? *unicast +(?P<unicast>\d+)\))?, '
+                                  r'*sen(d|t) +(?P<send>\d+)$')
 
         # byte totals: receive 305735040,send 15022146
         # bytes: received 0 (unicast 0), sent 0
-        p22 = re.compile(r'byte(s)?( +totals)?: +receive(d)? +(?P<receive>\d+)( +\(( *multicast +'
-                        r'(?P<multicast>\d+),?)?( *broadcast +(?P<broadcast>\d+),?)?( *unknown +'
-                        r'unicast +(?P<unknown_unicast>\d+),?)? *unicast +(?P<unicast>\d+)\))?, '
-                        r'*sen(d|t) +(?P<send>\d+)$')
+        p22 = regex_engine.compile(r'byte(s)?( +totals)?: +receive(d)? +(?P<receive>\d+)( +\(( *multicast +'
+                                  r'(?P<multicast>\d+),?)?( *broadcast +(?P<broadcast>\d+),?)?( *unknown +'
+                                  r'unicast +(?P<unknown_unicast>\d+),?)? *unicast +(?P<unicast>\d+)\))?, '
+                                  r'*sen(d|t) +(?P<send>\d+)$')
 
         # List of Access PWs:
-        p23 = re.compile(r'^List +of +Access +PWs:$')
+        p23 = regex_engine.compile(r'^List +of +Access +PWs:$')
 
         # List of VFIs:
-        p24 = re.compile(r'^List +of +VFIs:$')
+        p24 = regex_engine.compile(r'^List +of +VFIs:$')
 
         # VFI 1
         # VFI vfi100 (up)
-        p25 = re.compile(r'^VFI +(?P<vfi>\S+)( +\((?P<state>\w+)\))?$')
+        p25 = regex_engine.compile(r'^VFI +(?P<vfi>\S+)( +\((?P<state>\w+)\))?$')
 
         # PW: neighbor 10.4.1.1, PW ID 1, state is up ( established )
-        p26 = re.compile(r'^PW: +neighbor +(?P<neighbor>\S+), +PW +ID +(?P<pw_id>\d+), +state +'
-                        r'is +(?P<state>[\S ]+)$')
+        p26 = regex_engine.compile(r'^PW: +neighbor +(?P<neighbor>\S+), +PW +ID +(?P<pw_id>\d+), +state +'
+                                  r'is +(?P<state>[\S ]+)$')
 
         # PW class mpls, XC ID 0xff000001
-        p27 = re.compile(r'^PW +class +(?P<pw_class>.+), +XC +ID +(?P<xc_id>\S+)$')
+        p27 = regex_engine.compile(r'^PW +class +(?P<pw_class>.+), +XC +ID +(?P<xc_id>\S+)$')
 
         # PW class not set
-        p27_1 = re.compile(r'^PW +class +(?P<pw_class>[\S ]+)$')
+        p27_1 = regex_engine.compile(r'^PW +class +(?P<pw_class>[\S ]+)$')
 
         # Encapsulation MPLS, protocol LDP
-        p28 = re.compile(r'^Encapsulation +(?P<encapsulation>\S+)(, +protocol +(?P<protocol>\S+))?$')
+        p28 = regex_engine.compile(r'^Encapsulation +(?P<encapsulation>\S+)(, +protocol +(?P<protocol>\S+))?$')
 
         # PW type Ethernet, control word disabled, interworking none
-        p29 = re.compile(r'^(?P<type>PW|Encap) +type +(?P<pw_type>\S+), +control +word +(?P<control_word>\S+)(, +interworking +(?P<interworking>\S+))?$')
+        p29 = regex_engine.compile(r'^(?P<type>PW|Encap) +type +(?P<pw_type>\S+), +control +word +(?P<control_word>\S+)(, +interworking +(?P<interworking>\S+))?$')
 
         # PW backup disable delay 0 sec
-        p30 = re.compile(r'PW +backup +disable +delay +(?P<delay>\d+) +sec$')
+        p30 = regex_engine.compile(r'PW +backup +disable +delay +(?P<delay>\d+) +sec$')
 
         # Sequencing not set
-        p31 = re.compile(r'Sequencing +(?P<sequencing>[\S ]+)$')
+        p31 = regex_engine.compile(r'Sequencing +(?P<sequencing>[\S ]+)$')
 
         # MPLS         Local                          Remote
         # EVPN         Local                          Remote
-        p32 = re.compile(r'^(?P<type>MPLS|EVPN) +Local +Remote$')
+        p32 = regex_engine.compile(r'^(?P<type>MPLS|EVPN) +Local +Remote$')
 
         # Label        30005                          unknown
         # Group ID     0x5000300                      0x0
         # VCCV CV type 0x2                            0x0
         # Avoid show commands: show l2vpn xconnect detail
         # Avoid Date and Time: Wed Sep 25 20:09:36.362 UTC
-        p33 = re.compile(r'^(?P<mpls>.{1,12}\S) +(?P<local>.+\S) +(?P<remote>.+)$')
+        p33 = regex_engine.compile(r'^(?P<mpls>.{1,12}\S) +(?P<local>.+\S) +(?P<remote>.+)$')
 
         # (control word)                 (control word)
         # (router alert label)           (router alert label)
-        p33_1 = re.compile(r'^\((?P<local>.+)(\) +\()(?P<remote>.+)\)$')
+        p33_1 = regex_engine.compile(r'^\((?P<local>.+)(\) +\()(?P<remote>.+)\)$')
 
         # ------------ ------------------------------ -----------------------------
-        p34 = re.compile(r'^-+ +-+ +-+$')
+        p34 = regex_engine.compile(r'^-+ +-+ +-+$')
 
         # Create time: 12/03/2008 14:03:00 (17:17:30 ago)
-        p36 = re.compile(r'Create +time: +(?P<create_time>[\S ]+)$')
+        p36 = regex_engine.compile(r'Create +time: +(?P<create_time>[\S ]+)$')
 
         # Last time status changed: 13/03/2008 05:57:58 (01:22:31 ago)
-        p37 = re.compile(r'Last +time +status +changed: +(?P<last_time_status_changed>[\S ]+)$')
+        p37 = regex_engine.compile(r'Last +time +status +changed: +(?P<last_time_status_changed>[\S ]+)$')
 
         # MAC withdraw message: send 0 receive 0
-        p38 = re.compile(r'^MAC +withdraw +message(s)?: +sen(d|t) +(?P<send>\d+),? +receive(d)? +(?P<receive>\d+)$')
+        p38 = regex_engine.compile(r'^MAC +withdraw +message(s)?: +sen(d|t) +(?P<send>\d+),? +receive(d)? +(?P<receive>\d+)$')
 
         # Static MAC addresses:
-        p39 = re.compile(r'Static +MAC +addresses:$')
+        p39 = regex_engine.compile(r'Static +MAC +addresses:$')
 
         # VFI Statistics:
-        p40 = re.compile(r'VFI +Statistics:$')
+        p40 = regex_engine.compile(r'VFI +Statistics:$')
 
         # drops: illegal VLAN 0, illegal length 0
-        p41 = re.compile(r'drops: +(?P<drops>\S+) VLAN +(?P<vlan>\d+), +illegal +length '
-                        r'+(?P<illegal_length>\d+)$')
+        p41 = regex_engine.compile(r'drops: +(?P<drops>\S+) VLAN +(?P<vlan>\d+), +illegal +length '
+                                  r'+(?P<illegal_length>\d+)$')
 
         # (control word)                 (control word)  
-        p42 = re.compile(r'^\([\S ]+\)$')
+        p42 = regex_engine.compile(r'^\([\S ]+\)$')
 
         # Mon Oct  7 16:18:59.168 EDT
-        p43 = re.compile(r'^[Wed|Thu|Fri|Sat|Sun|Mon|Tue]+ +'
-                        r'[Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec]+ +'
-                        r'\d{1,2} +\d{1,2}:\d{1,2}:\d{1,2}[\.]\d{1,3} +[A-Z]{3}')
+        p43 = regex_engine.compile(r'^[Wed|Thu|Fri|Sat|Sun|Mon|Tue]+ +'
+                                  r'[Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec]+ +'
+                                  r'\d{1,2} +\d{1,2}:\d{1,2}:\d{1,2}[\.]\d{1,3} +[A-Z]{3}')
 
         # Legend: pp = Partially Programmed.
-        p44 = re.compile(r'^Legend: +(?P<legend>[\S ]+)$')
+        p44 = regex_engine.compile(r'^Legend: +(?P<legend>[\S ]+)$')
 
         # Coupled state: disabled
-        p45 = re.compile(r'^Coupled +state: +(?P<coupled_state>\S+)$')
+        p45 = regex_engine.compile(r'^Coupled +state: +(?P<coupled_state>\S+)$')
 
         # VINE state: EVPN-IRB
-        p46 = re.compile(r'^VINE +state: +(?P<vine_state>\S+)')
+        p46 = regex_engine.compile(r'^VINE +state: +(?P<vine_state>\S+)')
 
         # MAC withdraw for Access PW: enabled
-        p47 = re.compile(r'^MAC +withdraw +for +Access +PW: +(?P<mac_withdraw_for_access_pw>\S+)$')
+        p47 = regex_engine.compile(r'^MAC +withdraw +for +Access +PW: +(?P<mac_withdraw_for_access_pw>\S+)$')
 
         # MAC withdraw sent on: bridge port up
-        p48 = re.compile(r'^MAC +withdraw +sent +on: +(?P<mac_withdraw_sent_on>[\S ]+)$')
+        p48 = regex_engine.compile(r'^MAC +withdraw +sent +on: +(?P<mac_withdraw_sent_on>[\S ]+)$')
 
         # MAC withdraw relaying (access to access): disabled
-        p49 = re.compile(r'^MAC +withdraw +relaying \(access +to +access\): +(?P<mac_withdraw_relaying>[\S ]+)$')
+        p49 = regex_engine.compile(r'^MAC +withdraw +relaying \(access +to +access\): +(?P<mac_withdraw_relaying>[\S ]+)$')
 
         # MAC port down flush: enabled
-        p50 = re.compile(r'^MAC +port +down +flush: +(?P<mac_port_down_flush>\S+)$')
+        p50 = regex_engine.compile(r'^MAC +port +down +flush: +(?P<mac_port_down_flush>\S+)$')
 
         #  MAC Secure: disabled, Logging: disabled
-        p51 = re.compile(r'^MAC +Secure: +(?P<mac_secure>\w+), +Logging: +(?P<mac_secure_logging>\w+)$')
+        p51 = regex_engine.compile(r'^MAC +Secure: +(?P<mac_secure>\w+), +Logging: +(?P<mac_secure_logging>\w+)$')
 
         # Split Horizon Group: none
-        p52 = re.compile(r'^Split +Horizon +Group: +(?P<split_horizon_group>\S+)$')
+        p52 = regex_engine.compile(r'^Split +Horizon +Group: +(?P<split_horizon_group>\S+)$')
 
         # Dynamic ARP Inspection: disabled, Logging: disabled
-        p53 = re.compile(r'^Dynamic +ARP +Inspection: +(?P<dynamic_arp_inspection>\w+), +Logging'
-                        r': +(?P<dynamic_arp_logging>\w+)$')
+        p53 = regex_engine.compile(r'^Dynamic +ARP +Inspection: +(?P<dynamic_arp_inspection>\w+), +Logging'
+                                  r': +(?P<dynamic_arp_logging>\w+)$')
 
         # IP Source Guard: disabled, Logging: disabled
-        p54 = re.compile(r'^IP +Source +Guard: +(?P<ip_source_guard>\w+), +Logging: +(?P<ip_source_logging>\w+)$')
+        p54 = regex_engine.compile(r'^IP +Source +Guard: +(?P<ip_source_guard>\w+), +Logging: +(?P<ip_source_logging>\w+)$')
 
         # Storm Control: disabled
         # Storm Control: bridge-domain policer
-        p56 = re.compile(r'^Storm +Control: +(?P<storm_control>[\S ]+)$')
+        p56 = regex_engine.compile(r'^Storm +Control: +(?P<storm_control>[\S ]+)$')
 
         # Bridge MTU: 1500
-        p57 = re.compile(r'^Bridge +MTU: +(?P<bridge_mtu>\S+)$')
+        p57 = regex_engine.compile(r'^Bridge +MTU: +(?P<bridge_mtu>\S+)$')
 
         # MIB cvplsConfigIndex: 1
-        p58 = re.compile(r'^MIB +cvplsConfigIndex: (?P<mid_cvpls_config_index>\d+)$')
+        p58 = regex_engine.compile(r'^MIB +cvplsConfigIndex: (?P<mid_cvpls_config_index>\d+)$')
 
         # P2MP PW: disabled
-        p59 = re.compile(r'^P2MP +PW: +(?P<p2mp_pw>\S+)$')
+        p59 = regex_engine.compile(r'^P2MP +PW: +(?P<p2mp_pw>\S+)$')
 
         # No status change since creation
-        p60 = re.compile(r'^No +status +change +since +creation$')
+        p60 = regex_engine.compile(r'^No +status +change +since +creation$')
 
         # List of EVPNs:
-        p61 = re.compile(r'^List +of +EVPNs:$')
+        p61 = regex_engine.compile(r'^List +of +EVPNs:$')
 
         # EVPN, state: up
-        p62 = re.compile(r'^(?P<evpn>\S+), +state: +(?P<state>\S+)$')
+        p62 = regex_engine.compile(r'^(?P<evpn>\S+), +state: +(?P<state>\S+)$')
 
         # evi: 1000
-        p63 = re.compile(r'^evi: +(?P<evi>\d+)$')
+        p63 = regex_engine.compile(r'^evi: +(?P<evi>\d+)$')
 
         # XC ID 0x80000009
-        p64 = re.compile(r'^XC +ID (?P<xc_id>\S+)$')
+        p64 = regex_engine.compile(r'^XC +ID (?P<xc_id>\S+)$')
 
         # MAC move: 0
-        p65 = re.compile(r'^MAC +move: +(?P<mac_move>\d+)$')
+        p65 = regex_engine.compile(r'^MAC +move: +(?P<mac_move>\d+)$')
 
         # BVI MAC address:
-        p66 = re.compile(r'^BVI +MAC +address:$')
+        p66 = regex_engine.compile(r'^BVI +MAC +address:$')
 
         # 1000.10ff.1000
-        p67 = re.compile(r'^(?P<bvi_mac_address>\w+\.\w+\.\w+)$')
+        p67 = regex_engine.compile(r'^(?P<bvi_mac_address>\w+\.\w+\.\w+)$')
 
         # Rewrite Tags: []
-        p68 = re.compile(r'^Rewrite +Tags: +\[(?P<rewrite_tags>\S+)?\]$')
+        p68 = regex_engine.compile(r'^Rewrite +Tags: +\[(?P<rewrite_tags>\S+)?\]$')
 
         # VLAN ranges: [100, 100]
-        p69 = re.compile(r'^VLAN +ranges: +\[(?P<vlan_ranges>[\S ]+)?\]$')
+        p69 = regex_engine.compile(r'^VLAN +ranges: +\[(?P<vlan_ranges>[\S ]+)?\]$')
 
         # Storm control drop counters:
-        p70 = re.compile(r'^Storm +control +drop +counters:$')
+        p70 = regex_engine.compile(r'^Storm +control +drop +counters:$')
 
         # packets: broadcast 0, multicast 0, unknown unicast 0
-        p71 = re.compile(r'^packets: +broadcast +(?P<broadcast>\d+), +multicast +(?P<multicast>\d+)'
-                        r', +unknown +unicast +(?P<unknown_unicast>\d+)$')
+        p71 = regex_engine.compile(r'^packets: +broadcast +(?P<broadcast>\d+), +multicast +(?P<multicast>\d+)'
+                                  r', +unknown +unicast +(?P<unknown_unicast>\d+)$')
 
         # bytes: broadcast 0, multicast 0, unknown unicast 0
-        p72 = re.compile(r'^bytes: +broadcast +(?P<broadcast>\d+), +multicast +(?P<multicast>\d+),'
-                        r' +unknown +unicast +(?P<unknown_unicast>\d+)$')
+        p72 = regex_engine.compile(r'^bytes: +broadcast +(?P<broadcast>\d+), +multicast +(?P<multicast>\d+),'
+                                  r' +unknown +unicast +(?P<unknown_unicast>\d+)$')
 
         # Dynamic ARP inspection drop counters:
-        p73 = re.compile(r'^Dynamic +ARP +inspection +drop +counters:$')
+        p73 = regex_engine.compile(r'^Dynamic +ARP +inspection +drop +counters:$')
 
         # packets: 0, bytes: 0
-        p74 = re.compile(r'^packets: +(?P<packets>\d+), +bytes: +(?P<bytes>\d+)$')
+        p74 = regex_engine.compile(r'^packets: +(?P<packets>\d+), +bytes: +(?P<bytes>\d+)$')
 
         # IP source guard drop counters:
-        p75 = re.compile(r'^IP +source +guard +drop +counters:$')
+        p75 = regex_engine.compile(r'^IP +source +guard +drop +counters:$')
 
         # List of Access VFIs:
-        p76 = re.compile(r'^List +of +Access +VFIs:$')
+        p76 = regex_engine.compile(r'^List +of +Access +VFIs:$')
 
         # Error: Need at least 1 bridge port up
-        p77 = re.compile(r'^Error: +(?P<error>[\S ]+)$')
+        p77 = regex_engine.compile(r'^Error: +(?P<error>[\S ]+)$')
 
         # EVPN: neighbor 0.0.0.0, PW ID: evi 601, ac-id 1, state is down ( local ready ) (Transport LSP Down)
-        p78 = re.compile(r'^(?P<type>EVPN): neighbor +(?P<neighbor>\S+), +PW +ID: +(?P<pw_id>evi +\d+), +ac-id +(?P<ac_id>\d+), +state +is +(?P<state>[\S ]+)$')
+        p78 = regex_engine.compile(r'^(?P<type>EVPN): neighbor +(?P<neighbor>\S+), +PW +ID: +(?P<pw_id>evi +\d+), +ac-id +(?P<ac_id>\d+), +state +is +(?P<state>[\S ]+)$')
 
         # Source address 10.154.219.85
-        p79 = re.compile(r'^Source +address +(?P<source_address>\S+)$')
+        p79 = regex_engine.compile(r'^Source +address +(?P<source_address>\S+)$')
 
         # LSP : Up
-        p80 = re.compile(r'^LSP *: +(?P<lsp>\S+)$')
+        p80 = regex_engine.compile(r'^LSP *: +(?P<lsp>\S+)$')
 
         # Forward-class: 0
-        p81 = re.compile(r'^Forward-class: +(?P<forward_class>\d+)$')
+        p81 = regex_engine.compile(r'^Forward-class: +(?P<forward_class>\d+)$')
 
         # Multicast Source: Not Set
-        p82 = re.compile(r'^Multicast +Source: +(?P<multicast_source>[\S ]+)$')
+        p82 = regex_engine.compile(r'^Multicast +Source: +(?P<multicast_source>[\S ]+)$')
         
         # PD System Data: AF-LIF-IPv4: 0x00000000  AF-LIF-IPv6: 0x00000000
-        p83 = re.compile(r'^PD +System +Data: +(?P<key_1>\S+): +(?P<val_1>\S+) +(?P<key_2>\S+): +(?P<val_2>\S+)$')
+        p83 = regex_engine.compile(r'^PD +System +Data: +(?P<key_1>\S+): +(?P<val_1>\S+) +(?P<key_2>\S+): +(?P<val_2>\S+)$')
 
         # Virtual MAC addresses:
-        p84 = re.compile(r'^Virtual +MAC +addresses:$')
+        p84 = regex_engine.compile(r'^Virtual +MAC +addresses:$')
 
         # Incoming Status (PW Status TLV):
-        p85 = re.compile(r'^Incoming Status \([\S ]+\):$')
+        p85 = regex_engine.compile(r'^Incoming Status \([\S ]+\):$')
 
         # Status code: 0x0 (Up) in Notification message
-        p86 = re.compile(r'^Status code: +(?P<code>.+) in [\w ]+$')
+        p86 = regex_engine.compile(r'^Status code: +(?P<code>.+) in [\w ]+$')
 
         # Flow Label flags configured (Tx=1,Rx=1), negotiated (Tx=0,Rx=0)
-        p87 = re.compile(r'Flow Label flags \w+ (?P<configured>[\(\w=\,\)]+),\s+\w+\s+(?P<negotiated>[\(\w=\,\)]+)')
+        p87 = regex_engine.compile(r'Flow Label flags \w+ (?P<configured>[\(\w=\,\)]+),\s+\w+\s+(?P<negotiated>[\(\w=\,\)]+)')
 
         for index, line in enumerate(out.splitlines(), start=1):
             original_line = line
@@ -2766,22 +2767,22 @@ class ShowL2vpnForwardingXconnectDetailLocation(
             output = self.device.execute(cmd)
 
         # Local interface: Bundle-Ether5.1001, Xconnect id: 0xc0000002, Status: up
-        p1 = re.compile(r'^Local\s+interface:\s+(?P<local_interface>[\w.-]+),\s+Xconnect\s+id:\s+(?P<xconnect_id>\w+),\s+Status:\s+(?P<status>\S+)$')
+        p1 = regex_engine.compile(r'^Local\s+interface:\s+(?P<local_interface>[\w.-]+),\s+Xconnect\s+id:\s+(?P<xconnect_id>\w+),\s+Status:\s+(?P<status>\S+)$')
 
         # Segment 1
-        p2 = re.compile(r'^Segment\s+(?P<segment>\d+)$')
+        p2 = regex_engine.compile(r'^Segment\s+(?P<segment>\d+)$')
 
         # AC, Bundle-Ether5.1001, status: Bound
         # SRv6 EVPN, Internal ID: ::ffff:10.0.0.1, evi: 1001, ac-id: 10001, status: Bound
-        p3 = re.compile(r'^(?P<segment_type>[\w\s]+),\s+(?:(?P<ac_interface>[\w.-]+),)?(?:Internal\s+ID:\s+(?P<internal_id>[\w:.]+),)?'
-                        r'(?:\s+evi:\s+(?P<evi>\d+),)?(?:\s+ac-id:\s+(?P<ac_id>\d+),)?\s+status:\s+(?P<status>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<segment_type>[\w\s]+),\s+(?:(?P<ac_interface>[\w.-]+),)?(?:Internal\s+ID:\s+(?P<internal_id>[\w:.]+),)?'
+                                  r'(?:\s+evi:\s+(?P<evi>\d+),)?(?:\s+ac-id:\s+(?P<ac_id>\d+),)?\s+status:\s+(?P<status>\S+)$')
         
         # Control word disabled
-        p4 = re.compile(r'^Control\s+word\s+(?P<control_word>\S+)$')
+        p4 = regex_engine.compile(r'^Control\s+word\s+(?P<control_word>\S+)$')
 
         # packets: received 2426, sent 2461
         # bytes: received 275480, sent 280300
-        p5 = re.compile(r'^(?P<packets_bytes>\w+):\s+received\s+(?P<received>\d+),\s+sent\s+(?P<sent>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<packets_bytes>\w+):\s+received\s+(?P<received>\d+),\s+sent\s+(?P<sent>\d+)$')
 
         ret_dict = {}
 
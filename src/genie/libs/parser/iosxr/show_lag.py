@@ -8,14 +8,12 @@
      *  show lacp
      *  show lacp <interface>
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -43,7 +41,7 @@ class ShowLacpSystemId(ShowLacpSystemIdSchema):
         # Priority  MAC Address
         # --------  -----------------
         #   0x0064  00-1b-0c-ff-6a-36
-        p1 = re.compile(r'^(?P<system_priority>[\w]+) +(?P<system_id_mac>[\w\.\-]+)$')
+        p1 = regex_engine.compile(r'^(?P<system_priority>[\w]+) +(?P<system_id_mac>[\w\.\-]+)$')
 
         for line in out.splitlines():
             if line:
@@ -163,118 +161,118 @@ class ShowBundle(ShowBundleSchema):
 
         # Bundle-Ether1
         # Bundle-Ether 2
-        p1 = re.compile(r'^Bundle-Ether *(?P<bundle_id>[\d]+)$')
+        p1 = regex_engine.compile(r'^Bundle-Ether *(?P<bundle_id>[\d]+)$')
 
         # Status:  Up
         # Status: mLACP hot standby
-        p2 = re.compile(r'^Status: +(?P<oper_status>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^Status: +(?P<oper_status>[\w\s]+)$')
 
         # Local links <active/standby/configured>:  2 / 0 / 2
-        p3 = re.compile(r'^Local +links.*: *(?P<active>[\d]+)'
-                        r' *\/ *(?P<standby>[\d]+) *\/ *(?P<configured>[\d]+)$')
+        p3 = regex_engine.compile(r'^Local +links.*: *(?P<active>[\d]+)'
+                                  r' *\/ *(?P<standby>[\d]+) *\/ *(?P<configured>[\d]+)$')
 
         # Local bandwidth <effective/available>:  2000000 (2000000) kbps
         # Local bandwidth <effective/available>:  100000 / 100000 kbps
-        p4 = re.compile(r'^Local +bandwidth.*: *(?P<effective>[\d]+) *(\/ *|\()(?P<available>[\d]+)\)?.*$')
+        p4 = regex_engine.compile(r'^Local +bandwidth.*: *(?P<effective>[\d]+) *(\/ *|\()(?P<available>[\d]+)\)?.*$')
 
         # MAC address (source):  001b.0cff.6a34 (Chassis pool)
-        p5 = re.compile(r'^MAC address.*: *(?P<mac_address>[\w.-]+) +\((?P<mac_address_source>.*)\)$')
+        p5 = regex_engine.compile(r'^MAC address.*: *(?P<mac_address>[\w.-]+) +\((?P<mac_address_source>.*)\)$')
 
         # Inter-chassis link:  No
-        p6 = re.compile(r'^Inter-chassis +link: *(?P<inter_chassis_link>[\w]+)$')
+        p6 = regex_engine.compile(r'^Inter-chassis +link: *(?P<inter_chassis_link>[\w]+)$')
 
         # Minimum active links / bandwidth:  1 / 1 kbps
-        p7 = re.compile(r'^Minimum +active +links.*: *(?P<min_active_link>[\d]+)'
-                        r' *\/ *(?P<min_active_bw_kbps>[\d]+).*$')
+        p7 = regex_engine.compile(r'^Minimum +active +links.*: *(?P<min_active_link>[\d]+)'
+                                  r' *\/ *(?P<min_active_bw_kbps>[\d]+).*$')
 
         # Maximum active links:  8
         # Maximum active links:  32 (from partner)
-        p8 = re.compile(r'^Maximum +active +links: *(?P<max_active_link>[\d]+).*$')
+        p8 = regex_engine.compile(r'^Maximum +active +links: *(?P<max_active_link>[\d]+).*$')
 
         # Wait while timer:  2000 ms
         # Wait-while timer:  2000 ms
         # Wait while timer:                          Off
-        p9 = re.compile(r'^Wait( +|-)while +timer: *(?P<wait_while_timer_ms>(\d|\w)+).*$')
+        p9 = regex_engine.compile(r'^Wait( +|-)while +timer: *(?P<wait_while_timer_ms>(\d|\w)+).*$')
 
         # Load balancing:
         # Load-balancing:  Default
-        p10 = re.compile(r'^Load( +|-)balancing: *(?P<load_balance>[\w]+)$')
+        p10 = regex_engine.compile(r'^Load( +|-)balancing: *(?P<load_balance>[\w]+)$')
 
         # Link order signaling:  Not configured
-        p10_1 = re.compile(r'^Link +order +signaling: *(?P<link_order_signaling>[\w\s]+)$')
+        p10_1 = regex_engine.compile(r'^Link +order +signaling: *(?P<link_order_signaling>[\w\s]+)$')
 
         # Hash type:  Default
         # Hash type:  Src-IP
-        p10_2 = re.compile(r'^Hash +type: *(?P<hash_type>[\S]+)$')
+        p10_2 = regex_engine.compile(r'^Hash +type: *(?P<hash_type>[\S]+)$')
 
         # Locality threshold:  None
-        p10_3 = re.compile(r'^Locality +threshold: *(?P<locality_threshold>[\w]+)$')
+        p10_3 = regex_engine.compile(r'^Locality +threshold: *(?P<locality_threshold>[\w]+)$')
 
         # LACP:  Operational
-        p11 = re.compile(r'^LACP: *(?P<lacp>[\w\s]+)$')
+        p11 = regex_engine.compile(r'^LACP: *(?P<lacp>[\w\s]+)$')
 
         # Flap suppression timer:  Off
         # Flap suppression timer:  2500 ms
-        p11_1 = re.compile(r'^Flap +suppression +timer: *(?P<flap_suppression_timer>[\w\s]+)$')
+        p11_1 = regex_engine.compile(r'^Flap +suppression +timer: *(?P<flap_suppression_timer>[\w\s]+)$')
 
         # Cisco extensions:  Disabled
-        p11_2 = re.compile(r'^Cisco +extensions: *(?P<cisco_extensions>[\w]+)$')
+        p11_2 = regex_engine.compile(r'^Cisco +extensions: *(?P<cisco_extensions>[\w]+)$')
 
         # Non-revertive:  Disabled
-        p11_3 = re.compile(r'^Non-revertive: *(?P<non_revertive>[\w]+)$')
+        p11_3 = regex_engine.compile(r'^Non-revertive: *(?P<non_revertive>[\w]+)$')
 
         # mLACP:  Not configured
-        p12 = re.compile(r'^mLACP: *(?P<mlacp>[\w\s]+)$')
+        p12 = regex_engine.compile(r'^mLACP: *(?P<mlacp>[\w\s]+)$')
 
         # Interchassis group:  3
         # ICCP group:  1
-        p12_1 = re.compile(r'^(Interchassis|ICCP) +group: *(?P<iccp_group>[\w\s]+)$')
+        p12_1 = regex_engine.compile(r'^(Interchassis|ICCP) +group: *(?P<iccp_group>[\w\s]+)$')
 
         # Role: Active
-        p12_2 = re.compile(r'^Role: *(?P<role>[\w]+)$')
+        p12_2 = regex_engine.compile(r'^Role: *(?P<role>[\w]+)$')
 
         # Foreign links <active/configured>:  1 / 1
-        p12_3 = re.compile(r'^Foreign +links.*: *(?P<foreign_links_active>[\d]+)'
-                           r' *\/ *(?P<foreign_links_configured>[\d]+)$')
+        p12_3 = regex_engine.compile(r'^Foreign +links.*: *(?P<foreign_links_active>[\d]+)'
+                                     r' *\/ *(?P<foreign_links_configured>[\d]+)$')
 
         # Switchover type:  Revertive
-        p12_4 = re.compile(r'^Switchover +type: *(?P<switchover_type>[\w\s\-]+)$')
+        p12_4 = regex_engine.compile(r'^Switchover +type: *(?P<switchover_type>[\w\s\-]+)$')
 
         # Recovery delay:  300 s
-        p12_5 = re.compile(r'^Recovery delay: *(?P<recovery_delay>[\w\s]+)$')
+        p12_5 = regex_engine.compile(r'^Recovery delay: *(?P<recovery_delay>[\w\s]+)$')
 
         # Maximize threshold: 2 links
-        p12_6 = re.compile(r'^Maximize +threshold: *(?P<maximize_threshold>[\w\s]+)$')
+        p12_6 = regex_engine.compile(r'^Maximize +threshold: *(?P<maximize_threshold>[\w\s]+)$')
 
         # IPv4 BFD:  Not configured
         # IPv6 BFD:  Not configured
-        p13 = re.compile(r'^(?P<type>[\w]+) +BFD: *(?P<ip_bfd>[\w\s]+)$')
+        p13 = regex_engine.compile(r'^(?P<type>[\w]+) +BFD: *(?P<ip_bfd>[\w\s]+)$')
 
         # State:   Off
-        p13_1 = re.compile(r'^State: *(?P<state>[\w]+)$')
+        p13_1 = regex_engine.compile(r'^State: *(?P<state>[\w]+)$')
 
         # Fast detect:  Enabled
-        p13_2 = re.compile(r'^Fast +detect: *(?P<fast_detect>[\w]+)$')
+        p13_2 = regex_engine.compile(r'^Fast +detect: *(?P<fast_detect>[\w]+)$')
 
         # Start timer:  Off
-        p13_3 = re.compile(r'^Start +timer: *(?P<start_timer>[\w\s]+)$')
+        p13_3 = regex_engine.compile(r'^Start +timer: *(?P<start_timer>[\w\s]+)$')
 
         # Neighbor-unconfigured timer:   Off
-        p13_4 = re.compile(r'^Neighbor-unconfigured +timer: *(?P<neighbor_unconfigured_timer>[\w\s]+)$')
+        p13_4 = regex_engine.compile(r'^Neighbor-unconfigured +timer: *(?P<neighbor_unconfigured_timer>[\w\s]+)$')
 
         # Preferred min interval:    150 ms
-        p13_5 = re.compile(r'^Preferred +min +interval: *(?P<preferred_min_interval_ms>[\d]+).*$')
+        p13_5 = regex_engine.compile(r'^Preferred +min +interval: *(?P<preferred_min_interval_ms>[\d]+).*$')
 
         # Preferred multiple:   3
-        p13_6 = re.compile(r'^Preferred +multiple: *(?P<preferred_multiple>[\d]+)$')
+        p13_6 = regex_engine.compile(r'^Preferred +multiple: *(?P<preferred_multiple>[\d]+)$')
 
         # Destination address:  Not Configured
-        p13_7 = re.compile(r'^Destination +address: *(?P<destination_address>[\w\s\.]+)$')
+        p13_7 = regex_engine.compile(r'^Destination +address: *(?P<destination_address>[\w\s\.]+)$')
 
         # Port                  Device           State        Port ID         B/W, kbps
         # Gi0/0/0/0             Local            Active       0x000a, 0x0001     1000000
-        p14 = re.compile(r'^(?P<interface>[\S]+) +(?P<device>[\S]+) +(?P<state>[\w]+)'
-                         r' +(?P<port_id>[\w]+, *[\w]+) +(?P<bw_kbps>[\d]+)$')
+        p14 = regex_engine.compile(r'^(?P<interface>[\S]+) +(?P<device>[\S]+) +(?P<state>[\w]+)'
+                                   r' +(?P<port_id>[\w]+, *[\w]+) +(?P<bw_kbps>[\d]+)$')
 
         # Link is Active
         # Link is Standby due to maximum-active links configuration
@@ -289,7 +287,7 @@ class ShowBundle(ShowBundleSchema):
         # Bundle has been shut down
         # Bundle is in the process of being replicated to this location
         # Incompatible with other links in the bundle (bandwidth out of range)Loopback: Actor and Partner have the same System ID and Key
-        p15 = re.compile(r'(?P<link_state>[\S\s]+)')
+        p15 = regex_engine.compile(r'(?P<link_state>[\S\s]+)')
 
         for line in out.splitlines():
             if line:
@@ -496,7 +494,7 @@ class ShowBundle(ShowBundleSchema):
                 continue
 
             # State:   Off
-            p13_1 = re.compile(r'^State: *(?P<state>[\w]+)$')
+            p13_1 = regex_engine.compile(r'^State: *(?P<state>[\w]+)$')
             m = p13_1.match(line)
             if m:
                 group = m.groupdict()
@@ -504,7 +502,7 @@ class ShowBundle(ShowBundleSchema):
                 continue
 
             # Fast detect:  Enabled
-            p13_2 = re.compile(r'^Fast +detect: *(?P<fast_detect>[\w]+)$')
+            p13_2 = regex_engine.compile(r'^Fast +detect: *(?P<fast_detect>[\w]+)$')
             m = p13_2.match(line)
             if m:
                 group = m.groupdict()
@@ -512,7 +510,7 @@ class ShowBundle(ShowBundleSchema):
                 continue
 
             # Start timer:  Off
-            p13_3 = re.compile(r'^Start +timer: *(?P<start_timer>[\w\s]+)$')
+            p13_3 = regex_engine.compile(r'^Start +timer: *(?P<start_timer>[\w\s]+)$')
             m = p13_3.match(line)
             if m:
                 group = m.groupdict()
@@ -520,7 +518,7 @@ class ShowBundle(ShowBundleSchema):
                 continue
 
             # Neighbor-unconfigured timer:   Off
-            p13_4 = re.compile(r'^Neighbor-unconfigured +timer: *(?P<neighbor_unconfigured_timer>[\w\s]+)$')
+            p13_4 = regex_engine.compile(r'^Neighbor-unconfigured +timer: *(?P<neighbor_unconfigured_timer>[\w\s]+)$')
             m = p13_4.match(line)
             if m:
                 group = m.groupdict()
@@ -528,7 +526,7 @@ class ShowBundle(ShowBundleSchema):
                 continue
 
             # Preferred min interval:    150 ms
-            p13_5 = re.compile(r'^Preferred +min +interval: *(?P<preferred_min_interval_ms>[\d]+).*$')
+            p13_5 = regex_engine.compile(r'^Preferred +min +interval: *(?P<preferred_min_interval_ms>[\d]+).*$')
             m = p13_5.match(line)
             if m:
                 group = m.groupdict()
@@ -536,7 +534,7 @@ class ShowBundle(ShowBundleSchema):
                 continue
 
             # Preferred multiple:   3
-            p13_6 = re.compile(r'^Preferred +multiple: *(?P<preferred_multiple>[\d]+)$')
+            p13_6 = regex_engine.compile(r'^Preferred +multiple: *(?P<preferred_multiple>[\d]+)$')
             m = p13_6.match(line)
             if m:
                 group = m.groupdict()
@@ -544,7 +542,7 @@ class ShowBundle(ShowBundleSchema):
                 continue
 
             # Destination address:  Not Configured
-            p13_7 = re.compile(r'^Destination +address: *(?P<destination_address>[\w\s\.]+)$')
+            p13_7 = regex_engine.compile(r'^Destination +address: *(?P<destination_address>[\w\s\.]+)$')
             m = p13_7.match(line)
             if m:
                 group = m.groupdict()
@@ -670,20 +668,20 @@ class ShowLacp(ShowLacpSchema):
 
         # Bundle-Ether1
         # Bundle-Ether13 (ICCP Group 13)
-        p1 = re.compile(r'^(?P<name>Bundle-Ether(?P<bundle_id>[\d]+))( \(ICCP Group (?P<iccp_group>\d+)\))?$')
+        p1 = regex_engine.compile(r'^(?P<name>Bundle-Ether(?P<bundle_id>[\d]+))( \(ICCP Group (?P<iccp_group>\d+)\))?$')
 
         #   Port          (rate)  State    Port ID       Key    System ID
         #   Gi0/0/0/0        30s  ascdA--- 0x000a,0x0001 0x0001 0x0064,00-1b-0c-ff-6a-36
         #    Partner         30s  as--A--- 0x8000,0x0004 0x0002 0x8000,00-0c-86-ff-c6-81
         #   Te0/1/0/8             a---AF-- 0x8003,0x9001 0x000d 0x0001,40-55-39-63-6c-e5
-        p2 = re.compile(r'^(?P<interface>[\S]+)( +(?P<rate>[\d]+)s)? +(?P<state>[\w-]+)'
-                        r' +(?P<port_id>[\w,]+) +(?P<key>[\w]+)'
-                        r' +(?P<system_id>[\w\-,]+)$')
+        p2 = regex_engine.compile(r'^(?P<interface>[\S]+)( +(?P<rate>[\d]+)s)? +(?P<state>[\w-]+)'
+                                  r' +(?P<port_id>[\w,]+) +(?P<key>[\w]+)'
+                                  r' +(?P<system_id>[\w\-,]+)$')
 
         #   Port                  Receive    Period Selection  Mux       A Churn P Churn
         #   Gi0/0/0/0             Current    Slow   Selected   Distrib   None    None
-        p3 = re.compile(r'^(?P<interface>[\S]+) +(?P<receive>[\w]+) +(?P<period>[\w]+) +(?P<selection>[\w]+)'
-                        r' +(?P<mux>[\w]+) +(?P<a_churn>[\w]+) +(?P<p_churn>[\w]+)$')
+        p3 = regex_engine.compile(r'^(?P<interface>[\S]+) +(?P<receive>[\w]+) +(?P<period>[\w]+) +(?P<selection>[\w]+)'
+                                  r' +(?P<mux>[\w]+) +(?P<a_churn>[\w]+) +(?P<p_churn>[\w]+)$')
 
         for line in out.splitlines():
             if line:
@@ -15,6 +15,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -43,11 +44,11 @@ class ShowLldp(ShowLldpSchema):
         ret_dict = {}
         # initial regexp pattern
         # Status: ACTIVE
-        p1 = re.compile(r'^Status: +(?P<status>\w+)$')
+        p1 = regex_engine.compile(r'^Status: +(?P<status>\w+)$')
         # LLDP advertisements are sent every 30 seconds
         # LLDP hold time advertised is 120 seconds
         # LLDP interface reinitialisation delay is 2 seconds
-        p2 = re.compile(r'^LLDP( +advertisements +are +sent +every +'
+        p2 = regex_engine.compile(r'^LLDP( +advertisements +are +sent +every +'
             r'(?P<hello_timer>\d+))?( +hold +time +advertised +is +'
             r'(?P<hold_timer>\d+))?( +interface +reinitialisation '
             r'+delay +is +(?P<reinit_delay>\d+))? +seconds$')
@@ -142,12 +143,12 @@ class ShowLldpEntry(ShowLldpEntrySchema):
         sub_dict_inserted = False
 
         # Local Interface: GigabitEthernet0/0/0/0
-        p1 = re.compile(r'^Local +Interface: +(?P<local_interface>\S+)$')
+        p1 = regex_engine.compile(r'^Local +Interface: +(?P<local_interface>\S+)$')
         # Chassis id: 001e.49ff.24f7
-        p2 = re.compile(r'^Chassis +id: +(?P<chassis_id>[\w\.]+)$')
+        p2 = regex_engine.compile(r'^Chassis +id: +(?P<chassis_id>[\w\.]+)$')
         # Port id: Gi2
         # Port id: xe-0/1/2
-        p3 = re.compile(r'^Port +id: +(?P<port_id>\S+)$')
+        p3 = regex_engine.compile(r'^Port +id: +(?P<port_id>\S+)$')
 
         # Port Description: GigabitEthernet2
         # Port Description - not advertised
@@ -156,38 +157,38 @@ class ShowLldpEntry(ShowLldpEntrySchema):
         # Port Description: "10G link to Genie2 port Ge8/8/8/8/8"
         # Port Description: 10G link to genie3-genie port GEN 8/8/8/8 in BE 43 (with port 0/4/0/3)
         # Port Description: PHY|BW|L3|CORE|type:CRAN-P2P|rhost:ASR-01|rport:TenGigE0/0/0/1
-        p4 = re.compile(r'^Port +Description(\:|\s\-) '
-                        r'+(?P<port_description>[\s\S]+)$')
+        p4 = regex_engine.compile(r'^Port +Description(\:|\s\-) '
+                                  r'+(?P<port_description>[\s\S]+)$')
 
         # System Name: R1_csr1000v.openstacklocal
-        p5 = re.compile(r'System +Name: +(?P<system_name>\S+)$')
+        p5 = regex_engine.compile(r'System +Name: +(?P<system_name>\S+)$')
         # System Description: 
-        p6 = re.compile(r'^System +Description:$')
+        p6 = regex_engine.compile(r'^System +Description:$')
         # Cisco IOS Software [Everest], Virtual XE Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.6.1, RELEASE SOFTWARE (fc2)
         # Cisco Nexus Operating System (NX-OS) Software 7.0(3)I7(1)
-        p7 = re.compile(r'^(?P<system_description>Cisco +[\S\s]+)$')
+        p7 = regex_engine.compile(r'^(?P<system_description>Cisco +[\S\s]+)$')
         # Copyright (c) 1986-2017 by Cisco Systems, Inc.
-        p8 = re.compile(r'^(?P<copyright>Copyright +\(c\) +[\S\s]+)$')
+        p8 = regex_engine.compile(r'^(?P<copyright>Copyright +\(c\) +[\S\s]+)$')
         # Compiled Sat 22-Jul-17 05:51 by 
-        p9 = re.compile(r'^(?P<compiled_by>Compiled +[\S\s]+)$')
+        p9 = regex_engine.compile(r'^(?P<compiled_by>Compiled +[\S\s]+)$')
         # Technical Support: http://www.cisco.com/techsupport
-        p10 = re.compile(r'^(?P<technical_support>(Technical|TAC) (S|s)upport: +[\S\s]+)$')
+        p10 = regex_engine.compile(r'^(?P<technical_support>(Technical|TAC) (S|s)upport: +[\S\s]+)$')
         # Time remaining: 117 seconds
-        p11 = re.compile(r'Time +remaining: +(?P<time_remaining>\d+) +seconds$')
+        p11 = regex_engine.compile(r'Time +remaining: +(?P<time_remaining>\d+) +seconds$')
         # Hold Time: 120 seconds
-        p12 = re.compile(r'Hold +Time: +(?P<hold_time>\d+) +seconds$')
+        p12 = regex_engine.compile(r'Hold +Time: +(?P<hold_time>\d+) +seconds$')
         # Age: 142641 seconds
-        p18 = re.compile(r'Age: +(?P<age>\d+) +seconds$')
+        p18 = regex_engine.compile(r'Age: +(?P<age>\d+) +seconds$')
         # System Capabilities: B,R
-        p13 = re.compile(r'System +Capabilities: +(?P<system>[\w+,]+)$')
+        p13 = regex_engine.compile(r'System +Capabilities: +(?P<system>[\w+,]+)$')
         # Enabled Capabilities: R
-        p14 = re.compile(r'Enabled +Capabilities: +(?P<enabled>[\w+,]+)$')
+        p14 = regex_engine.compile(r'Enabled +Capabilities: +(?P<enabled>[\w+,]+)$')
         # IPv4 address: 10.1.2.1
-        p15 = re.compile(r'IPv4 +address: +(?P<management_address>[\d\.]+)$')
+        p15 = regex_engine.compile(r'IPv4 +address: +(?P<management_address>[\d\.]+)$')
         # Total entries displayed: 2
-        p16 = re.compile(r'Total +entries +displayed: +(?P<total_entries>\d+)$')
+        p16 = regex_engine.compile(r'Total +entries +displayed: +(?P<total_entries>\d+)$')
         # Peer MAC Address: 30:b2:b1:ff:ce:56
-        p17 = re.compile(r'Peer +MAC +Address: +(?P<mac>[\s\S]+)$')
+        p17 = regex_engine.compile(r'Peer +MAC +Address: +(?P<mac>[\s\S]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -390,23 +391,23 @@ class ShowLldpTraffic(ShowLldpTrafficSchema):
         # Total frames in: 399
         # Total frames received in error: 0
         # Total frames discarded: 0
-        p1 = re.compile(r'^Total +frames +(in: +(?P<frame_in>\d+))?(out: +'
+        p1 = regex_engine.compile(r'^Total +frames +(in: +(?P<frame_in>\d+))?(out: +'
             r'(?P<frame_out>\d+))?(received +in +error: +(?P<frame_error_in>'
             r'\d+))?(discarded: +(?P<frame_discard>\d+))?$')
 
         # Total entries aged: 0
-        p2 = re.compile(r'Total +entries +aged: +(?P<entries_aged_out>\d+)$')
+        p2 = regex_engine.compile(r'Total +entries +aged: +(?P<entries_aged_out>\d+)$')
 
         # Total TLVs discarded: 119
         # Total TLVs unrecognized: 119
-        p3 = re.compile(r'Total +TLVs +(discarded: +(?P<tlv_discard>\d+))?'
+        p3 = regex_engine.compile(r'Total +TLVs +(discarded: +(?P<tlv_discard>\d+))?'
             r'(unrecognized: +(?P<tlv_unknown>\d+))?')
         
         #Total TLVs accepted: 1183
-        p4 = re.compile(r'^Total TLVs accepted: (?P<tlv_accepted>\d+)$')
+        p4 = regex_engine.compile(r'^Total TLVs accepted: (?P<tlv_accepted>\d+)$')
 
         # Last Clear: 245522 seconds
-        p5 = re.compile(r'Last +Clear: +(?P<last_clear>\d+) +seconds$')
+        p5 = regex_engine.compile(r'Last +Clear: +(?P<last_clear>\d+) +seconds$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -482,12 +483,12 @@ class ShowLldpInterface(ShowLldpInterfaceSchema):
 
         # initial regexp pattern
         # GigabitEthernet0/0/0/0:
-        p1 = re.compile(r'^(?P<interface>[\w\/\-\.]+):$')
+        p1 = regex_engine.compile(r'^(?P<interface>[\w\/\-\.]+):$')
         # Tx: enabled
         # Rx: enabled
         # Tx state: IDLE
         # Rx state: WAIT FOR FRAME
-        p2 = re.compile(r'^(Tx: (?P<tx>\w+))?(Rx: (?P<rx>\w+))?(Tx +state: +'
+        p2 = regex_engine.compile(r'^(Tx: (?P<tx>\w+))?(Rx: (?P<rx>\w+))?(Tx +state: +'
             r'(?P<tx_state>\w+))?(Rx +state: +(?P<rx_state>[\w ]+))?$')
 
         for line in out.splitlines():
@@ -546,28 +547,28 @@ class ShowLldpTrafficInterfaceId(ShowLldpTrafficInterfaceIdSchema):
         # initial regexp pattern
 
         # Total frames out: 1777
-        p1 = re.compile(r'^Total frames out: (?P<frame_out>\d+)$')
+        p1 = regex_engine.compile(r'^Total frames out: (?P<frame_out>\d+)$')
 
         # Total frames in: 1776
-        p2 = re.compile(r'^Total frames in: (?P<frame_in>\d+)$')
+        p2 = regex_engine.compile(r'^Total frames in: (?P<frame_in>\d+)$')
 
         # Total frames received in error: 0
-        p3 = re.compile(r'^Total frames received in error: (?P<frame_error_in>\d+)$')
+        p3 = regex_engine.compile(r'^Total frames received in error: (?P<frame_error_in>\d+)$')
 
         # Total frames out error: 0
-        p4 = re.compile(r'^Total frames out error: (?P<frame_error_out>\d+)$')
+        p4 = regex_engine.compile(r'^Total frames out error: (?P<frame_error_out>\d+)$')
 
         # Total frames discarded: 9
-        p5 = re.compile(r'^Total frames discarded: (?P<frame_discard>\d+)$')
+        p5 = regex_engine.compile(r'^Total frames discarded: (?P<frame_discard>\d+)$')
 
         # Total TLVs discarded: 0
-        p6 = re.compile(r'^Total TLVs discarded: (?P<tlv_discard>\d+)$')
+        p6 = regex_engine.compile(r'^Total TLVs discarded: (?P<tlv_discard>\d+)$')
 
         # Total TLVs unrecognized: 0
-        p7 = re.compile(r'^Total TLVs unrecognized: (?P<tlv_unknown>\d+)$')
+        p7 = regex_engine.compile(r'^Total TLVs unrecognized: (?P<tlv_unknown>\d+)$')
         
         # Last Clear: 245522 seconds
-        p8 = re.compile(r'Last +Clear: +(?P<last_clear>\d+) +seconds$')
+        p8 = regex_engine.compile(r'Last +Clear: +(?P<last_clear>\d+) +seconds$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -701,41 +702,41 @@ class ShowLldpNeighborsInterfaceIdDetail(ShowLldpNeighborsInterfaceIdDetailSchem
         sub_dict_inserted = False
 
         # Local Interface: GigabitEthernet0/0/0/0
-        p1 = re.compile(r'^Local +Interface: +(?P<local_interface>\S+)$')
+        p1 = regex_engine.compile(r'^Local +Interface: +(?P<local_interface>\S+)$')
         # Chassis id: 001e.49ff.24f7
-        p2 = re.compile(r'^Chassis +id: +(?P<chassis_id>[\w\.]+)$')
+        p2 = regex_engine.compile(r'^Chassis +id: +(?P<chassis_id>[\w\.]+)$')
         # Port id: Gi2
         # Port id: xe-0/1/2
-        p3 = re.compile(r'^Port +id: +(?P<port_id>\S+)$')
+        p3 = regex_engine.compile(r'^Port +id: +(?P<port_id>\S+)$')
 
         #Port Description - not advertised
-        p4 = re.compile(r'^Port +Description(\:|\s\-) '
-                        r'+(?P<port_description>[\s\S]+)$')
+        p4 = regex_engine.compile(r'^Port +Description(\:|\s\-) '
+                                  r'+(?P<port_description>[\s\S]+)$')
 
         # System Name: ncs540
-        p5 = re.compile(r'System +Name: +(?P<system_name>\S+)$')
+        p5 = regex_engine.compile(r'System +Name: +(?P<system_name>\S+)$')
         # System Description:
                 #7.8.1.02I, NCS-540 
-        p6 = re.compile(r'^System +Description:$')
+        p6 = regex_engine.compile(r'^System +Description:$')
         # Cisco IOS Software [Everest], Virtual XE Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.6.1, RELEASE SOFTWARE (fc2)
         # Cisco Nexus Operating System (NX-OS) Software 7.0(3)I7(1)
-        p15 = re.compile(r'^(?P<system_description>\d+[\S\s]+)$')
+        p15 = regex_engine.compile(r'^(?P<system_description>\d+[\S\s]+)$')
         # Time remaining: 117 seconds
-        p7 = re.compile(r'Time +remaining: +(?P<time_remaining>\d+) +seconds$')
+        p7 = regex_engine.compile(r'Time +remaining: +(?P<time_remaining>\d+) +seconds$')
         # Hold Time: 120 seconds
-        p8 = re.compile(r'Hold +Time: +(?P<hold_time>\d+) +seconds$')
+        p8 = regex_engine.compile(r'Hold +Time: +(?P<hold_time>\d+) +seconds$')
         # Age: 142641 seconds
-        p9 = re.compile(r'Age: +(?P<age>\d+) +seconds$')
+        p9 = regex_engine.compile(r'Age: +(?P<age>\d+) +seconds$')
         # System Capabilities: B,R
-        p10 = re.compile(r'System +Capabilities: +(?P<system>[\w+,]+)$')
+        p10 = regex_engine.compile(r'System +Capabilities: +(?P<system>[\w+,]+)$')
         # Enabled Capabilities: R
-        p11 = re.compile(r'Enabled +Capabilities: +(?P<enabled>[\w+,]+)$')
+        p11 = regex_engine.compile(r'Enabled +Capabilities: +(?P<enabled>[\w+,]+)$')
         # IPv4 address: 10.1.2.1
-        p12 = re.compile(r'IPv4 +address: +(?P<management_address>[\d\.]+)$')
+        p12 = regex_engine.compile(r'IPv4 +address: +(?P<management_address>[\d\.]+)$')
         # Total entries displayed: 2
-        p13 = re.compile(r'Total +entries +displayed: +(?P<total_entries>\d+)$')
+        p13 = regex_engine.compile(r'Total +entries +displayed: +(?P<total_entries>\d+)$')
         # Peer MAC Address: 30:b2:b1:ff:ce:56
-        p14 = re.compile(r'Peer +MAC +Address: +(?P<mac>[\s\S]+)$')
+        p14 = regex_engine.compile(r'Peer +MAC +Address: +(?P<mac>[\s\S]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -4,13 +4,13 @@ IOSXR parsers for the following show commands:
     * show logging
     * show logging | include {include}
 '''
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================================
 # Schema for:
@@ -185,79 +185,79 @@ class ShowLogging(ShowLoggingSchema):
         no_logs_read = True
 
         # Wed Feb 10 16:49:33.170 UTC
-        p0 = re.compile(r'^[a-zA-Z]+\s+[a-zA-Z]+\s+\d+\s+\d+:\d+:\d+(\.\d+)?\s+[a-zA-Z]+')
+        p0 = regex_engine.compile(r'^[a-zA-Z]+\s+[a-zA-Z]+\s+\d+\s+\d+:\d+:\d+(\.\d+)?\s+[a-zA-Z]+')
 
         #Syslog logging: enabled (0 messages dropped, 0 messages rate-limited, 0 flushes, 0 overruns, xml disabled, filtering disabled)
-        p1 = re.compile(r'Syslog +logging: +(?P<enable_disable>\S+) '
-                        r'+\(+(?P<messages_dropped>\d+) +messages +dropped, '
-                        r'+((?P<messages_rate_limited>\d+) +messages +rate-limited, +)'
-                        r'?(?P<flushes>\d+) +flushes, +(?P<overruns>\d+) '
-                        r'+overruns(, +xml +(?P<xml>\S+), filtering +(?P<filtering>\S+))?\)$')
+        p1 = regex_engine.compile(r'Syslog +logging: +(?P<enable_disable>\S+) '
+                                  r'+\(+(?P<messages_dropped>\d+) +messages +dropped, '
+                                  r'+((?P<messages_rate_limited>\d+) +messages +rate-limited, +)'
+                                  r'?(?P<flushes>\d+) +flushes, +(?P<overruns>\d+) '
+                                  r'+overruns(, +xml +(?P<xml>\S+), filtering +(?P<filtering>\S+))?\)$')
         
         #Console logging: disabled
-        p2 = re.compile(r'(?P<tag>Console) +logging: +(?P<status>\S+)$')
+        p2 = regex_engine.compile(r'(?P<tag>Console) +logging: +(?P<status>\S+)$')
 
         #Monitor logging: level debugging, 13 messages logged, xml disabled,
         #Monitor logging: level debugging, 0 messages logged
-        p3 = re.compile(r'(?P<tag>Monitor) +logging: +level +(?P<level>\S+), '
-                        r'+(?P<messages_logged>\d+) +messages +logged(, +xml '
-                        r'+(?P<xml>\S+),)?$')
+        p3 = regex_engine.compile(r'(?P<tag>Monitor) +logging: +level +(?P<level>\S+), '
+                                  r'+(?P<messages_logged>\d+) +messages +logged(, +xml '
+                                  r'+(?P<xml>\S+),)?$')
 
         #filtering disabled
-        p4 = re.compile(r'filtering +(?P<filtering>\S+)$')
+        p4 = regex_engine.compile(r'filtering +(?P<filtering>\S+)$')
 
         #Buffer logging:  level debugging, 1566 messages logged, xml disabled,
-        p5 = re.compile(r'(?P<tag>Buffer) +logging: +level '
-                        r'+(?P<level>\S+), +(?P<messages_logged>\d+) '
-                        r'+messages +logged(, +xml +(?P<xml>\S+),)?$')
+        p5 = regex_engine.compile(r'(?P<tag>Buffer) +logging: +level '
+                                  r'+(?P<level>\S+), +(?P<messages_logged>\d+) '
+                                  r'+messages +logged(, +xml +(?P<xml>\S+),)?$')
 
         #Exception Logging: size (4096 bytes)
-        p6 = re.compile(r'Exception +Logging: size +\((?P<size_bytes>\d+) +bytes+\)$')
+        p6 = regex_engine.compile(r'Exception +Logging: size +\((?P<size_bytes>\d+) +bytes+\)$')
 
         #Count and timestamp logging messages: disabled
-        p7 = re.compile(r'Count +and +timestamp +logging +messages: '
-                        r'+(?P<count_and_time_stamp_logging_messages>\S+)$')
+        p7 = regex_engine.compile(r'Count +and +timestamp +logging +messages: '
+                                  r'+(?P<count_and_time_stamp_logging_messages>\S+)$')
 
         #File logging: disabled
-        p8 = re.compile(r'(?P<tag>File +logging): +(?P<status>\S+)$')
+        p8 = regex_engine.compile(r'(?P<tag>File +logging): +(?P<status>\S+)$')
 
         #Persistent logging: disabled
-        p9 = re.compile(r'(?P<tag>Persistent +logging): +(?P<status>\S+)$')
+        p9 = regex_engine.compile(r'(?P<tag>Persistent +logging): +(?P<status>\S+)$')
 
         #Trap logging: level informational, 1570 message lines logged
-        p10 = re.compile(r'(?P<tag>Trap +logging): +level +(?P<level>\S+),'
-                         r'( +(?P<messages_logged>\d+) +messages +logged)?'
-                         r'( +(?P<message_lines_logged>\d+) +message +lines +logged)?$')
+        p10 = regex_engine.compile(r'(?P<tag>Trap +logging): +level +(?P<level>\S+),'
+                                   r'( +(?P<messages_logged>\d+) +messages +logged)?'
+                                   r'( +(?P<message_lines_logged>\d+) +message +lines +logged)?$')
 
         #Logging to 192.168.1.3  (tcp port 1514, audit disabled,
-        p11 = re.compile(r'Logging +to (?P<logging_to>[\d\.]+) +\((?P<protocol>\S+) '
-                        r'+port +(?P<port>\d+), +audit +(?P<audit>\S+),$')
+        p11 = regex_engine.compile(r'Logging +to (?P<logging_to>[\d\.]+) +\((?P<protocol>\S+) '
+                                  r'+port +(?P<port>\d+), +audit +(?P<audit>\S+),$')
 
         #link down),
-        p12 = re.compile(r'link +(?P<link>\S+)\),$')
+        p12 = regex_engine.compile(r'link +(?P<link>\S+)\),$')
 
         #787 message lines logged,
-        p13 = re.compile(r'(?P<message_lines_logged>\d+) +message +lines +logged,$')
+        p13 = regex_engine.compile(r'(?P<message_lines_logged>\d+) +message +lines +logged,$')
 
         #0 message lines rate-limited,
-        p14 = re.compile(r'(?P<message_lines_rate_limited>\d+) '
-                         r'+message +lines +rate-limited,$')
+        p14 = regex_engine.compile(r'(?P<message_lines_rate_limited>\d+) '
+                                   r'+message +lines +rate-limited,$')
 
         #0 message lines dropped-by-MD,
-        p15 = re.compile(r'(?P<message_lines_dropped_by_md>\d+) '
-                         r'+message +lines +dropped-by-MD,$')
+        p15 = regex_engine.compile(r'(?P<message_lines_dropped_by_md>\d+) '
+                                   r'+message +lines +dropped-by-MD,$')
 
         #xml disabled, sequence number disabled
-        p16 = re.compile(r'xml +(?P<xml>\S+), +sequence +number +(?P<sequence_number>\S+)$')
+        p16 = regex_engine.compile(r'xml +(?P<xml>\S+), +sequence +number +(?P<sequence_number>\S+)$')
 
         #Logging Source-Interface:       VRF Name:
-        p17 = re.compile(r'Logging Source-Interface: +VRF +Name:$')
+        p17 = regex_engine.compile(r'Logging Source-Interface: +VRF +Name:$')
 
         #Vlan200
-        p18 = re.compile(r'(?P<interface>\S+)+(?P<vrf>\S+)?$')
+        p18 = regex_engine.compile(r'(?P<interface>\S+)+(?P<vrf>\S+)?$')
 
         #Log Buffer (32000 bytes):
-        p19 = re.compile(r'Log +Buffer +\((?P<vrf>\d+) +bytes+\):$')
+        p19 = regex_engine.compile(r'Log +Buffer +\((?P<vrf>\d+) +bytes+\):$')
                          
         ret_dict = {}
         read_logs_in_list = False
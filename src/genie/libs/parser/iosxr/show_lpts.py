@@ -4,13 +4,13 @@ IOSXR parsers for the following show commands:
     * 'show lpts pfib hardware police'
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ==========================
 # Parser for 'show lpts pfib hardware police'
 # ==========================
@@ -48,12 +48,12 @@ class ShowLptsPfibHardwarePolice(ShowLptsPfibHardwarePoliceSchema):
             out = output
 
         # Node 0/RP0/CPU0:
-        p1 = re.compile(r'^(Node)\s(?P<node>[a-zA-Z0-9\/]+)')
+        p1 = regex_engine.compile(r'^(Node)\s(?P<node>[a-zA-Z0-9\/]+)')
 
         # BFD-MP-known           11      np      7864      1000      0            0            0
         # BGP-known              16      np      16272     1000      120267993    0            0
-        p2 = re.compile(r'^(?P<flow_type>[a-zA-Z-]+)\s+(?P<policer>\d+)\s+(?P<type>\S+)\s+(?P<current_rate>\d+)\s+('
-                        r'?P<burst>\d+)\s+(?P<accepted>\d+)\s+(?P<dropped>\d+)\s+(?P<npu>\d+)$') 
+        p2 = regex_engine.compile(r'^(?P<flow_type>[a-zA-Z-]+)\s+(?P<policer>\d+)\s+(?P<type>\S+)\s+(?P<current_rate>\d+)\s+('
+                                  r'?P<burst>\d+)\s+(?P<accepted>\d+)\s+(?P<dropped>\d+)\s+(?P<npu>\d+)$') 
 
 
         # Init vars
@@ -8,14 +8,14 @@ IOSXR parsers for the following show commands:
     * show mfib platform evpn bucket location {location}
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==========================================================================
 # Schema for 'show mfib route summary'
@@ -89,15 +89,15 @@ class ShowMfibRouteSummary(ShowMfibRouteSummarySchema):
         parsed_dict = {}
 
         # IP Multicast Forwarding Information Base Summary for VRF vpn1
-        p1 = re.compile(r"IP +Multicast +Forwarding +Information +Base +"
-                        r"Summary +for +(?:ALL +VRFs|VRF +(?P<vrf>\S+))"
-                        r"(?: +\(num +VRFs: +(?P<num_vrfs>\d+)\))?")
+        p1 = regex_engine.compile(r"IP +Multicast +Forwarding +Information +Base +"
+                                  r"Summary +for +(?:ALL +VRFs|VRF +(?P<vrf>\S+))"
+                                  r"(?: +\(num +VRFs: +(?P<num_vrfs>\d+)\))?")
 
         # No. of (*,G) routes = 20
-        p2 = re.compile(r"No\. +of +\(\*,G\) +routes += +(?P<no_g_routes>\d+)")
+        p2 = regex_engine.compile(r"No\. +of +\(\*,G\) +routes += +(?P<no_g_routes>\d+)")
 
         # No. of (S,G) routes = 176
-        p3 = re.compile(r"No\. +of +\(S,G\) +routes += +(?P<no_sg_routes>\d+)")
+        p3 = regex_engine.compile(r"No\. +of +\(S,G\) +routes += +(?P<no_sg_routes>\d+)")
 
         for line in out.splitlines():
             line = line.strip()
@@ -200,11 +200,11 @@ class ShowMfibPlatformEvpnBucketLocation(ShowMfibPlatformEvpnBucketLocationSchem
         parsed_dict = {}
 
         # ESI Interface     Handle     Bucket ID   State   Stale
-        p1 = re.compile(r"ESI Interface +Handle +Bucket ID +State +Stale")
+        p1 = regex_engine.compile(r"ESI Interface +Handle +Bucket ID +State +Stale")
 
         # Bundle-Ether1        0x4000660          0       DF     F
-        p2 = re.compile(r"(?P<esi_interface>\S+) +(?P<handle>0x[a-fA-F\d]+) +"
-                        r"(?P<bucket_id>\d+) +(?P<state>\S+) +(?P<stale>\S+)")
+        p2 = regex_engine.compile(r"(?P<esi_interface>\S+) +(?P<handle>0x[a-fA-F\d]+) +"
+                                  r"(?P<bucket_id>\d+) +(?P<state>\S+) +(?P<stale>\S+)")
 
         for line in out.splitlines():
             line = line.strip()
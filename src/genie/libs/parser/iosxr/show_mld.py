@@ -13,14 +13,12 @@ IOSXR parsers for the following show commands:
     * show mld groups {group} detail
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ==============================================================================
@@ -97,45 +95,45 @@ class ShowMldSummaryInternal(ShowMldSummaryInternalSchema):
         # regex
 
         # Robustness Value 10
-        p1 = re.compile(r'^Robustness +Value +(?P<robustness_value>\d+)$')
+        p1 = regex_engine.compile(r'^Robustness +Value +(?P<robustness_value>\d+)$')
         
         # No. of Group x Interfaces 13
-        p2 = re.compile(r'^No\. +of +Group +x +Interfaces +(?P<num_groups_x_intf>\d+)$')
+        p2 = regex_engine.compile(r'^No\. +of +Group +x +Interfaces +(?P<num_groups_x_intf>\d+)$')
         
         # Maximum number of Group x Interfaces 75000
-        p3 = re.compile(r'^Maximum +number +of +Group +x +Interfaces +'
-            			 r'(?P<max_num_groups_x_intfs>\d+)$')
+        p3 = regex_engine.compile(r'^Maximum +number +of +Group +x +Interfaces +'
+                      			 r'(?P<max_num_groups_x_intfs>\d+)$')
         
         # Supported Interfaces   : 1
-        p4 = re.compile(r'^Supported +Interfaces +: +(?P<supported_intf>\d+)$')
+        p4 = regex_engine.compile(r'^Supported +Interfaces +: +(?P<supported_intf>\d+)$')
         
         # Unsupported Interfaces : 0
-        p5 = re.compile(r'^Unsupported +Interfaces +: +(?P<unsupported_intf>\d+)$')
+        p5 = regex_engine.compile(r'^Unsupported +Interfaces +: +(?P<unsupported_intf>\d+)$')
         
         # Enabled Interfaces     : 1
-        p6 = re.compile(r'^Enabled +Interfaces +: +(?P<enabled_intf>\d+)$')
+        p6 = regex_engine.compile(r'^Enabled +Interfaces +: +(?P<enabled_intf>\d+)$')
         
         # Disabled Interfaces    : 0
-        p7 = re.compile(r'^Disabled +Interfaces +: +(?P<disabled_intf>\d+)$')
+        p7 = regex_engine.compile(r'^Disabled +Interfaces +: +(?P<disabled_intf>\d+)$')
         
         # MTE tuple count        : 0
-        p8 = re.compile(r'^MTE +tuple +count +: +(?P<mte_tuple_count>\d+)$')
+        p8 = regex_engine.compile(r'^MTE +tuple +count +: +(?P<mte_tuple_count>\d+)$')
         
         # Interface                       Number  Max #   On Parent     Last     Last     IGMP R
-        p9_1 = re.compile(r'^Interface +Number +Max +# +On +Parent +Last +Last +IGMP +R$')
+        p9_1 = regex_engine.compile(r'^Interface +Number +Max +# +On +Parent +Last +Last +IGMP +R$')
         
         #                                 Groups  Groups                query    Report   Uptime
-        p9_2 = re.compile(r'^\s|\sGroups +Groups +query +Report +Uptime$')
+        p9_2 = regex_engine.compile(r'^\s|\sGroups +Groups +query +Report +Uptime$')
         
         # GigabitEthernet0/0/0/0          13      6400    Y  0x0        00:29:26 00:04:16    1d06h
-        p9 = re.compile(r'^(?P<interface>[\w\-\.\/]+) +'
-                         r'(?P<num_groups>\d+) +'
-                         r'(?P<max_groups>\d+) +'
-                         r'(?P<on>\w+) +'
-                         r'(?P<parent>[\w]+) +'
-                         r'(?P<last_query>[\w\:]+) +'
-                         r'(?P<last_report>[\w\:]+) +'
-                         r'(?P<igmp_r_uptime>[\w\:]+)$')
+        p9 = regex_engine.compile(r'^(?P<interface>[\w\-\.\/]+) +'
+                                   r'(?P<num_groups>\d+) +'
+                                   r'(?P<max_groups>\d+) +'
+                                   r'(?P<on>\w+) +'
+                                   r'(?P<parent>[\w]+) +'
+                                   r'(?P<last_query>[\w\:]+) +'
+                                   r'(?P<last_report>[\w\:]+) +'
+                                   r'(?P<igmp_r_uptime>[\w\:]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -305,50 +303,50 @@ class ShowMldInterface(ShowMldInterfaceSchema):
     	# regex
 
     	# GigabitEthernet0/0/0/0 is up, line protocol is up
-        p1 = re.compile(r'^(?P<intf>[\w\-\.\/]+) +is +(?P<intf_status>[\w\s]+), +'
-                         r'line +protocol +is +(?P<oper_status>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<intf>[\w\-\.\/]+) +is +(?P<intf_status>[\w\s]+), +'
+                                   r'line +protocol +is +(?P<oper_status>\w+)$')
         
         # Internet address is fe80::5054:ff:fefa:9ad7
-        p2 = re.compile(r'^Internet +address +is +(?P<ip>[\w\/\.\:]+)$')
+        p2 = regex_engine.compile(r'^Internet +address +is +(?P<ip>[\w\/\.\:]+)$')
 
         # MLD is enabled on interface
-        p3 = re.compile(r'^MLD +is +(?P<status>\w+) +on +interface$')
+        p3 = regex_engine.compile(r'^MLD +is +(?P<status>\w+) +on +interface$')
 
         # Current MLD version is 2
-        p4 = re.compile(r'^Current +MLD +version +is +(?P<ver>\d+)$')
+        p4 = regex_engine.compile(r'^Current +MLD +version +is +(?P<ver>\d+)$')
 
         # MLD query interval is 366 seconds
-        p5 = re.compile(r'^MLD +query +interval +is +(?P<query_interval>\d+) +seconds$')
+        p5 = regex_engine.compile(r'^MLD +query +interval +is +(?P<query_interval>\d+) +seconds$')
 
         # MLD querier timeout is 3666 seconds
-        p6 = re.compile(r'^MLD +querier +timeout +is +'
-                         r'(?P<timeout>\d+) +seconds$')
+        p6 = regex_engine.compile(r'^MLD +querier +timeout +is +'
+                                   r'(?P<timeout>\d+) +seconds$')
 
         # MLD max query response time is 12 seconds
-        p7 = re.compile(r'^MLD +max +query +response +time +is +'
-                         r'(?P<time>\d+) +seconds$')
+        p7 = regex_engine.compile(r'^MLD +max +query +response +time +is +'
+                                   r'(?P<time>\d+) +seconds$')
 
         # Last member query response interval is 1 seconds
-        p8 = re.compile(r'^Last +member +query +response +interval +is '
-                         r'+(?P<time>\d+) +(seconds|ms)$')
+        p8 = regex_engine.compile(r'^Last +member +query +response +interval +is '
+                                   r'+(?P<time>\d+) +(seconds|ms)$')
 
         # MLD activity: 18 joins, 5 leaves
-        p9 = re.compile(r'^MLD +activity: +(?P<joins>\d+) +joins, +(?P<leaves>\d+) +leaves$')
+        p9 = regex_engine.compile(r'^MLD +activity: +(?P<joins>\d+) +joins, +(?P<leaves>\d+) +leaves$')
 
         # MLD querying router is FE80::5054:FF:FE7C:DC70
-        p10 = re.compile(r'^MLD +querying +router +is +(?P<querier>[\w\.\:]+)$')
+        p10 = regex_engine.compile(r'^MLD +querying +router +is +(?P<querier>[\w\.\:]+)$')
 
         # Time elapsed since last query sent 00:30:16
-        p11 = re.compile(r'^Time +elapsed +since +last +query +sent +'
-              			  r'(?P<time_elapsed_since_last_query_sent>[\w\:]+)$')
+        p11 = regex_engine.compile(r'^Time +elapsed +since +last +query +sent +'
+                        			  r'(?P<time_elapsed_since_last_query_sent>[\w\:]+)$')
 
         # Time elapsed since IGMP router enabled 1d06h
-        p12 = re.compile(r'^Time +elapsed +since +IGMP +router +enabled +'
-                		  r'(?P<time_elapsed_since_igmp_router_enabled>[\w\:]+)$')
+        p12 = regex_engine.compile(r'^Time +elapsed +since +IGMP +router +enabled +'
+                          		  r'(?P<time_elapsed_since_igmp_router_enabled>[\w\:]+)$')
 
         # Time elapsed since last report received 00:00:51
-        p13 = re.compile(r'^Time +elapsed +since +last +report +received +'
-                		  r'(?P<time_elapsed_since_last_report_received>[\w\:]+)$')
+        p13 = regex_engine.compile(r'^Time +elapsed +since +last +report +received +'
+                          		  r'(?P<time_elapsed_since_last_report_received>[\w\:]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -547,37 +545,37 @@ class ShowMldGroupsDetail(ShowMldGroupsDetailSchema):
         # regex
 
         # Interface:      GigabitEthernet0/0/0/0
-        p1 = re.compile(r'^Interface: +(?P<intf>[\w\.\-\/]+)$')
+        p1 = regex_engine.compile(r'^Interface: +(?P<intf>[\w\.\-\/]+)$')
 
         # Group:          ff15:1::1
-        p2 = re.compile(r'^Group: +(?P<group>[\w\.\:]+)$')
+        p2 = regex_engine.compile(r'^Group: +(?P<group>[\w\.\:]+)$')
 
         # Host mode:      INCLUDE
-        p3 = re.compile(r'^Host +mode: +(?P<host_mode>\w+)$')
+        p3 = regex_engine.compile(r'^Host +mode: +(?P<host_mode>\w+)$')
 
 		# Uptime:         08:06:00
-        p4 = re.compile(r'^Uptime: +(?P<up_time>[\w\:\.]+)$')
+        p4 = regex_engine.compile(r'^Uptime: +(?P<up_time>[\w\:\.]+)$')
 
         # Router mode:    INCLUDE
         # Router mode:    EXCLUDE (Expires: 00:29:15)
-        p5 = re.compile(r'^Router +mode: +(?P<router_mode>\w+)'
-                         r'( *\(Expires: +(?P<expire>[\w\.\:]+)\))?$')
+        p5 = regex_engine.compile(r'^Router +mode: +(?P<router_mode>\w+)'
+                                   r'( *\(Expires: +(?P<expire>[\w\.\:]+)\))?$')
 
        	# Last reporter:  fe80::5054:ff:fefa:9ad7
-        p6 = re.compile(r'^Last +reporter: +(?P<last_reporter>[\w\.\:]+)$')
+        p6 = regex_engine.compile(r'^Last +reporter: +(?P<last_reporter>[\w\.\:]+)$')
 
         # Suppress:       0
-        p7 = re.compile(r'^Suppress: +(?P<suppress>(\d+))$')
+        p7 = regex_engine.compile(r'^Suppress: +(?P<suppress>(\d+))$')
 
         # Source Address                          Uptime    Expires   Fwd  Flags
-        p8_1 = re.compile(r'^Source +Address +Uptime +Expires +Fwd +Flags$')
+        p8_1 = regex_engine.compile(r'^Source +Address +Uptime +Expires +Fwd +Flags$')
         
         # 2001:db8:2:2::2                       08:06:00  01:00:00  Yes  Remote Local 2d
-        p8 = re.compile(r'^(?P<source>(?!No)[\w\.\:]+) +'
-                         r'(?P<up_time>[\w\.\:]+) +'
-                         r'(?P<expire>[\w\.\:]+) +'
-                         r'(?P<forward>\w+) +'
-                         r'(?P<flags>[\w\s]+)$')
+        p8 = regex_engine.compile(r'^(?P<source>(?!No)[\w\.\:]+) +'
+                                   r'(?P<up_time>[\w\.\:]+) +'
+                                   r'(?P<expire>[\w\.\:]+) +'
+                                   r'(?P<forward>\w+) +'
+                                   r'(?P<flags>[\w\s]+)$')
 
 
         for line in out.splitlines():
@@ -23,15 +23,13 @@ IOSXR parsers for the following show commands:
     * 'show mpls ldp interface brief'
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, ListOf, And,\
                                          Default, Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ======================================================
@@ -96,17 +94,17 @@ class ShowMplsLdpInterface(ShowMplsLdpInterfaceSchema):
         ret_dict = {}
 
         #Interface HundredGigE0/5/0/0.100 (0xe0001c0)
-        p1 = re.compile(r'Interface\s+(?P<interface_name>[\w\/\.]+)\s+\((?P<interface_index>[\w]+)\)\s*$') 
+        p1 = regex_engine.compile(r'Interface\s+(?P<interface_name>[\w\/\.]+)\s+\((?P<interface_index>[\w]+)\)\s*$') 
 
         #VRF: 'default' (0x60000000)
-        p2_1 = re.compile(r'(^VRF\:\s+(?P<vrf>\'(\w)+\')\s+\((?P<vrf_index>[\s\S]+)\)\s*$)') 
+        p2_1 = regex_engine.compile(r'(^VRF\:\s+(?P<vrf>\'(\w)+\')\s+\((?P<vrf_index>[\s\S]+)\)\s*$)') 
 
         #Enabled via config: LDP interface
-        p2_2 = re.compile(r'^Enabled\s+via\s+(?P<via>[\w]+):\s+(?P<enabled>.*?)$') 
+        p2_2 = regex_engine.compile(r'^Enabled\s+via\s+(?P<via>[\w]+):\s+(?P<enabled>.*?)$') 
 
         #Disabled:
         #Disabled via config: LDP interface
-        p2_3 = re.compile(r'^(?P<dis>Disabled\:)|Disabled\s+via\s+(?P<via>[\w]+):\s+(?P<disabled>.*?)$')                 
+        p2_3 = regex_engine.compile(r'^(?P<dis>Disabled\:)|Disabled\s+via\s+(?P<via>[\w]+):\s+(?P<disabled>.*?)$')                 
 
         for line in out.splitlines():
             line = line.strip()
@@ -219,7 +217,7 @@ class ShowMplsLabelRange(ShowMplsLabelRangeSchema):
         mpls_dict = {}
         #Range for dynamic labels: Min/Max: 24000/1048575
         
-        p1 = re.compile(r'Range +for +dynamic +labels: +Min/Max: +(?P<min_range>\d+)/(?P<max_range>\d+)')
+        p1 = regex_engine.compile(r'Range +for +dynamic +labels: +Min/Max: +(?P<min_range>\d+)/(?P<max_range>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -343,51 +341,51 @@ class ShowMplsLdpDiscovery(ShowMplsLdpDiscoverySchema):
         targeted_flag = False
 
         # Local LDP Identifier: 10.52.26.119:0 
-        p1 = re.compile(r'^Local +LDP +Identifier: ' 
-                        r'(?P<local_ldp_identifier>[\d\.\:]+)$') 
+        p1 = regex_engine.compile(r'^Local +LDP +Identifier: ' 
+                                  r'(?P<local_ldp_identifier>[\d\.\:]+)$') 
 
         # Discovery Sources: 
-        p2 = re.compile(r'^Discovery +Sources:$') 
+        p2 = regex_engine.compile(r'^Discovery +Sources:$') 
 
         # Bundle-Ether1 : xmit/recv 
         # TenGigE0/0/0/4.2096 (0x14c0) : xmit
         # Bundle-Ether3 (0x8000260) : xmit/recv
-        p3 = re.compile(r'^((?P<interface>\S+) +)(\S.*|): *(?P<xmit>xmit)?\/?(?P<recv>recv)?$') 
+        p3 = regex_engine.compile(r'^((?P<interface>\S+) +)(\S.*|): *(?P<xmit>xmit)?\/?(?P<recv>recv)?$') 
 
         # VRF: 'default' (0x60000000) 
-        p4 = re.compile(r'^VRF: \'(?P<vrf>\S+)\' +\(\d+x\d+\)$') 
+        p4 = regex_engine.compile(r'^VRF: \'(?P<vrf>\S+)\' +\(\d+x\d+\)$') 
 
         # LDP Id: 10.12.31.251:0
         # LDP Id: 10.52.31.244:0, Transport address: 10.52.31.244 
-        p5 = re.compile(r'^(?P<ldp_tdp>\w+) +Id:(?P<space>\s{1,2})?(?P<ldp_tdp_id>[\d\.\:]+)(,' 
-                        r' +Transport +address: +(?P<transport_ip_addr>[\d\.]+)|)$')
+        p5 = regex_engine.compile(r'^(?P<ldp_tdp>\w+) +Id:(?P<space>\s{1,2})?(?P<ldp_tdp_id>[\d\.\:]+)(,' 
+                                  r' +Transport +address: +(?P<transport_ip_addr>[\d\.]+)|)$')
 
         # Hold time: 15 sec (local:15 sec, peer:15 sec) 
-        p6 = re.compile(r'^Hold +time: +(?P<holdtime_sec>\d+) +sec ' 
-                        r'\(local:(?P<proposed_local>\d+) +sec, ' 
-                        r'peer:(?P<proposed_peer>\d+) +sec\)$') 
+        p6 = regex_engine.compile(r'^Hold +time: +(?P<holdtime_sec>\d+) +sec ' 
+                                  r'\(local:(?P<proposed_local>\d+) +sec, ' 
+                                  r'peer:(?P<proposed_peer>\d+) +sec\)$') 
 
         # (expiring in 12.5 sec)
-        p7 = re.compile(r'\(expiring +in +(?P<expiring_in>\d.*) +sec\)$')
+        p7 = regex_engine.compile(r'\(expiring +in +(?P<expiring_in>\d.*) +sec\)$')
 
         # Established: Nov  6 14:39:26.164 (5w2d ago) 
-        p8 = re.compile(r'^Established: +(?P<established_date>\S.*) +\((?P<established_elapsed>\S*) +ago\)$') 
+        p8 = regex_engine.compile(r'^Established: +(?P<established_date>\S.*) +\((?P<established_elapsed>\S*) +ago\)$') 
 
         # Source address: 10.166.0.57; Transport address: 10.52.31.247
-        p9 = re.compile(r'^Source +address: +(?P<source_ip_addr>[\d\.]+);'
-                        r' +Transport +address: +(?P<transport_ip_addr>[\d\.]+)$')
+        p9 = regex_engine.compile(r'^Source +address: +(?P<source_ip_addr>[\d\.]+);'
+                                  r' +Transport +address: +(?P<transport_ip_addr>[\d\.]+)$')
 
         # Hello interval: 5 sec (due in 2.3 sec)
-        p10 = re.compile(r'^Hello +interval: +(?P<hello_interval>\d+) +sec'
-                        r' +\(due +in +(?P<hello_due_time>\S+ \S+)\)$')
+        p10 = regex_engine.compile(r'^Hello +interval: +(?P<hello_interval>\d+) +sec'
+                                  r' +\(due +in +(?P<hello_due_time>\S+ \S+)\)$')
 
         # Quick-start: Enabled
-        p11 = re.compile(r'^Quick-start: +(?P<quick_start>\S+)$')
+        p11 = regex_engine.compile(r'^Quick-start: +(?P<quick_start>\S+)$')
 
         # 10.1.1.1 -> 10.3.3.3 (active), xmit/recv
-        p12 = re.compile(r'^(?P<source>[\d\.]+) +\-> +(?P<destination>[\d\.]+)'
-                            r' +\((?P<status>(active|passive|active\/passive)+)\),'
-                            r' +(?P<xmit>xmit)?\/?(?P<recv>recv)?$')
+        p12 = regex_engine.compile(r'^(?P<source>[\d\.]+) +\-> +(?P<destination>[\d\.]+)'
+                                      r' +\((?P<status>(active|passive|active\/passive)+)\),'
+                                      r' +(?P<xmit>xmit)?\/?(?P<recv>recv)?$')
 
         # TODO Unlike iosxe, 'Hello interval', 'quick-start', 'hold time', 'established' 
         # are also used for interfaces, hence Targeted Hello is omitted.
@@ -582,57 +580,57 @@ class ShowMplsLdpDiscoveryDetail(ShowMplsLdpDiscoveryDetailSchema):
         discovery_flag = False
 
         # Local LDP Identifier: 10.94.1.1:0
-        p1 = re.compile(r'^Local +LDP +Identifier: '
-                        r'(?P<local_ldp_identifier>[\d\.\:]+)$')
+        p1 = regex_engine.compile(r'^Local +LDP +Identifier: '
+                                  r'(?P<local_ldp_identifier>[\d\.\:]+)$')
 
         # Discovery Sources:
-        p2 = re.compile(r'^Discovery +Sources:$')
+        p2 = regex_engine.compile(r'^Discovery +Sources:$')
 
         # TenGigE0/3/0/0 (0xa0004c0) : xmit/recv
-        p3 = re.compile(r'^(?P<interface>\S+) \((?P<interface_hex>[\w]+)\)'
-                        r' : (?P<xmit>xmit)?\/?(?P<recv>recv)?$')
+        p3 = regex_engine.compile(r'^(?P<interface>\S+) \((?P<interface_hex>[\w]+)\)'
+                                  r' : (?P<xmit>xmit)?\/?(?P<recv>recv)?$')
 
         # VRF: 'default' (0x60000000)
-        p4 = re.compile(r'^VRF: \'(?P<vrf>\S+)\' +\((?P<vrf_hex>[\w]+)\)$')
+        p4 = regex_engine.compile(r'^VRF: \'(?P<vrf>\S+)\' +\((?P<vrf_hex>[\w]+)\)$')
 
         # LDP Id: 10.144.96.96:0
-        p5 = re.compile(r'^(?P<ldp_tdp>\w+) +Id:\s*(?P<ldp_tdp_id>[\S]+)$')
+        p5 = regex_engine.compile(r'^(?P<ldp_tdp>\w+) +Id:\s*(?P<ldp_tdp_id>[\S]+)$')
 
         # Source address: 10.120.0.1; Transport address: 10.94.1.1
-        p6 = re.compile(r'^Source +address: +(?P<source_ip_addr>[\d\.]+);'
-                        r' +Transport +address: +(?P<transport_ip_addr>[\d\.]+)$')
+        p6 = regex_engine.compile(r'^Source +address: +(?P<source_ip_addr>[\d\.]+);'
+                                  r' +Transport +address: +(?P<transport_ip_addr>[\d\.]+)$')
 
         # Hold time: 15 sec (local:15 sec, peer:45 sec)
-        p7 = re.compile(r'^Hold +time: +(?P<holdtime_sec>\d+) +sec '
-                        r'\(local:(?P<proposed_local>\d+) +sec, '
-                        r'peer:(?P<proposed_peer>\d+) +sec\)$')
+        p7 = regex_engine.compile(r'^Hold +time: +(?P<holdtime_sec>\d+) +sec '
+                                  r'\(local:(?P<proposed_local>\d+) +sec, '
+                                  r'peer:(?P<proposed_peer>\d+) +sec\)$')
 
         # (expiring in 11 sec)
         # (expiring in 14.5 sec)
-        p8 = re.compile(r'^\(expiring +in +(?P<expiring_in>\d.*) +sec\)$')
+        p8 = regex_engine.compile(r'^\(expiring +in +(?P<expiring_in>\d.*) +sec\)$')
 
         # Established: Nov  6 14:39:26.164 (5w2d ago)
-        p9 = re.compile(r'^Established: +(?P<established_date>\S.*) '
-                        r'+\((?P<established_elapsed>\S*) +ago\)$')
+        p9 = regex_engine.compile(r'^Established: +(?P<established_date>\S.*) '
+                                  r'+\((?P<established_elapsed>\S*) +ago\)$')
 
         # Hello interval: 5 sec (due in 563 msec)
-        p10 = re.compile(r'^Hello +interval: +(?P<hello_interval>\d+) +sec'
-                        r' +\(due +in +(?P<hello_due_time>\S+ +\S+)\)$')
+        p10 = regex_engine.compile(r'^Hello +interval: +(?P<hello_interval>\d+) +sec'
+                                  r' +\(due +in +(?P<hello_due_time>\S+ +\S+)\)$')
 
         # Quick-start: Enabled
-        p11 = re.compile(r'^Quick-start: +(?P<quick_start>\S+)$')
+        p11 = regex_engine.compile(r'^Quick-start: +(?P<quick_start>\S+)$')
 
         # Last session connection failures:
-        p12 = re.compile(r'^Last +session +connection +failures:$')
+        p12 = regex_engine.compile(r'^Last +session +connection +failures:$')
 
         #     Jan  4 05:20:34.814: User cleared session manually
         #     Jan  4 05:28:48.641: User cleared session manually
-        p13 = re.compile(r'^(?P<timestamp>[A-Z][a-z]{2}\s+[0-9]{1,2}\s[0-9:.]+)'
-                         r':\s+(?P<reason>[\w\s]+)$')
+        p13 = regex_engine.compile(r'^(?P<timestamp>[A-Z][a-z]{2}\s+[0-9]{1,2}\s[0-9:.]+)'
+                                   r':\s+(?P<reason>[\w\s]+)$')
 
         #         (Last up for 00:06:56)
         #         (Last up for 00:08:05)
-        p14 = re.compile(r'\(Last +up +for +(?P<last_up_for>[\d:]+)\)$')
+        p14 = regex_engine.compile(r'\(Last +up +for +(?P<last_up_for>[\d:]+)\)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -929,35 +927,35 @@ class ShowMplsLdpNeighbor(ShowMplsLdpNeighborSchema):
 
         # Peer LDP Identifier: 10.16.0.2:0
         # Peer LDP Ident: 10.169.197.252:0; Local LDP Ident 10.169.197.254:0
-        p1 = re.compile(r'^Peer +LDP +(Ident|Identifier): *'
+        p1 = regex_engine.compile(r'^Peer +LDP +(Ident|Identifier): *'
         r'(?P<peer_ldp>[\d\.]+):(?P<label_space_id>\d+)(; '
         r'+Local +LDP +(Ident|Identifier) +(?P<local_ldp>\S+)$)?')
 
         # TCP connection: 10.16.0.2:646 - 10.16.0.9:38143
-        p2 = re.compile(r'^TCP +connection: *(?P<tcp_connection>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^TCP +connection: *(?P<tcp_connection>[\S\s]+)$')
         
         # Graceful Restart: No
-        p3 = re.compile(r'^Graceful +Restart: +(?P<graceful_restart>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Graceful +Restart: +(?P<graceful_restart>[\S\s]+)$')
 
         # Session Holdtime: 180 sec
-        p4 = re.compile(r'Session Holdtime: +(?P<session_holdtime>\d+)'
+        p4 = regex_engine.compile(r'Session Holdtime: +(?P<session_holdtime>\d+)'
         r' +(?P<rate>(sec|ms))$')
 
         # Password: not required, none, in use
-        p5 = re.compile(r'^Password: +(?P<password>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^Password: +(?P<password>[\S\s]+)$')
 
         #     State: Oper; Msgs sent/rcvd: 824/825; Downstream
         #     State: Oper; Msgs sent/rcvd: 824/825; Downstream; Last TIB rev sent 4103
         #     State: Oper; Msgs sent/rcvd: 5855/6371; Downstream on demand
         #     State: Oper; Msgs sent/rcvd: 24710/24702; Downstream-Unsolicited
-        p6 = re.compile(r'^State: *(?P<state>\w+); +Msgs +sent\/rcvd:'
+        p6 = regex_engine.compile(r'^State: *(?P<state>\w+); +Msgs +sent\/rcvd:'
         r' *(?P<msg_sent>\d+)\/(?P<msg_rcvd>\d+)(;'
         r' +(?P<neighbor>[\w\s/-]+))?(; +Last +TIB +rev +sent +'
         r'(?P<last_tib_rev_sent>\d+))?$')
 
         #  Up time: 04:26:14
         #  Up time: 3d21h; UID: 4; Peer Id 0
-        p7 = re.compile(r'^Up +time: *(?P<up_time>[\w\:]+)(; '
+        p7 = regex_engine.compile(r'^Up +time: *(?P<up_time>[\w\:]+)(; '
         r'+UID: *(?P<uid>\d+); +Peer +Id +(?P<peer_id>\d+);?)?$')
 
         #     LDP discovery sources:
@@ -966,10 +964,10 @@ class ShowMplsLdpNeighbor(ShowMplsLdpNeighborSchema):
         #      IPv4: (1)
         #       GigabitEthernet0/0/0/1
         #      IPv6: (0)
-        p8 = re.compile(r'(?P<address_family>(IPv4|IPv6)): +\((?P<number>\d)\)')
+        p8 = regex_engine.compile(r'(?P<address_family>(IPv4|IPv6)): +\((?P<number>\d)\)')
 
         #       GigabitEthernet0/0/0, Src IP addr: 10.169.197.93
-        p9 = re.compile(r'(?P<interface>[A-Za-z-]+[\d/.]+)((,|;)'
+        p9 = regex_engine.compile(r'(?P<interface>[A-Za-z-]+[\d/.]+)((,|;)'
         r' +Src +IP +addr: *(?P<src_ip_address>[\d\.]+))?$')
 
         #'Targeted Hello (10.36.3.3 ->172.20.22.22, active, passive)'
@@ -982,13 +980,13 @@ class ShowMplsLdpNeighbor(ShowMplsLdpNeighborSchema):
         #'Targeted Hello 10.4.1.1 ->10.16.2.2, active'
         #'Targeted Hello 10.36.3.3 ->172.20.22.22'
         # 'Targeted Hello (10.36.3.3 ->172.20.22.22)'
-        p10 = re.compile(r'Targeted +Hello +\(?(?P<ldp_ip>[\d/.]+)'
+        p10 = regex_engine.compile(r'Targeted +Hello +\(?(?P<ldp_ip>[\d/.]+)'
         r'\s*->\s*(?P<tdp_ip>[\d/.]+),?\s*'
         r'(?P<key1>[\S\s]+)+(,|;)? +(?P<key2>passive)?')
 
         # holdtime: 15000 ms, hello interval: 5000 ms
         # holdtime: infinite, hello interval: 10000 ms
-        p11 = re.compile(r'^holdtime: *(?P<holdtime>(\d+|\w+)) '
+        p11 = regex_engine.compile(r'^holdtime: *(?P<holdtime>(\d+|\w+)) '
         r'*(?P<hold_rate>(ms|sec))?, +hello +interval: '
         r'*(?P<hello_interval>\d+) +(?P<hello_rate>(ms|sec))$')
 
@@ -996,48 +994,48 @@ class ShowMplsLdpNeighbor(ShowMplsLdpNeighborSchema):
         # IPv4: (4)
         #   10.16.0.7        10.16.27.7       10.16.78.7       10.16.79.7       
         # IPv6: (0)
-        p12 = re.compile(r'(?P<address_bound_peer_ldp>[\d\.\s]+)$')
+        p12 = regex_engine.compile(r'(?P<address_bound_peer_ldp>[\d\.\s]+)$')
 
         # Peer holdtime: 180000 ms; KA interval: 60000 ms; Peer state: estab
-        p13 = re.compile(r'^Peer +holdtime: *(?P<peer_holdtime>\d+) +'
+        p13 = regex_engine.compile(r'^Peer +holdtime: *(?P<peer_holdtime>\d+) +'
         r'(?P<peer_rate>(ms|sec)); +KA +interval: '
         r'*(?P<ka_interval>\d+) +(?P<ka_rate>(ms|sec));'
         r' +Peer +state: +(?P<peer_state>\S+)$')
         
         # Clients: Dir Adj Client
-        p14 = re.compile(r'^Clients: +(?P<clients>[\S\s]+)$')
+        p14 = regex_engine.compile(r'^Clients: +(?P<clients>[\S\s]+)$')
 
         # Inbound label filtering: accept acl 'pfx_acl2'
-        p15 = re.compile(r'^Inbound +label +filtering: +'
+        p15 = regex_engine.compile(r'^Inbound +label +filtering: +'
         r'(?P<inbound_label_filtering>[\S\s]+)$') 
 
         #Enabled, state: Ready
         #LDP Session Protection: enabled, state: protecting
-        p16 = re.compile(r'(LDP +Session +Protection:? )?(E|e)nabled, +state: '
+        p16 = regex_engine.compile(r'(LDP +Session +Protection:? )?(E|e)nabled, +state: '
         r'+(?P<session_state>\w+)$')
 
         #Duration: 30 seconds
         #duration: infinite
-        p17 = re.compile(r'(D|d)uration: +(?P<duration>(\d+|\w+)) *(seconds)?')
+        p17 = regex_engine.compile(r'(D|d)uration: +(?P<duration>(\d+|\w+)) *(seconds)?')
 
         # NSR: Disabled
         # LDP NSR: Enabled
-        p18 = re.compile(r'(LDP\s+)?NSR: +(?P<nsr>\w+)$')
+        p18 = regex_engine.compile(r'(LDP\s+)?NSR: +(?P<nsr>\w+)$')
 
         #  Capabilities:
         #  Capabilities Sent:
-        p19 = re.compile(r'^Capabilities+(\sSent)?:')
+        p19 = regex_engine.compile(r'^Capabilities+(\sSent)?:')
 
         #  Capabilities Recieved:
         #  Recieved:
-        p20 = re.compile(r'(Capabilities\s+)?Received:')
+        p20 = regex_engine.compile(r'(Capabilities\s+)?Received:')
 
         # 0x508  (MP: Point-to-Multipoint (P2MP))
         # 0x509  (MP: Multipoint-to-Multipoint (MP2MP))
-        p21 = re.compile(r'(?P<key>\S+) +\((?P<value>MP: +\S+ +\(\S+\))\)')
+        p21 = regex_engine.compile(r'(?P<key>\S+) +\((?P<value>MP: +\S+ +\(\S+\))\)')
 
         # 0x50b  (Typed Wildcard FEC)
-        p22 = re.compile(r'(?P<key>\S+) +\((?P<value>Typed +Wildcard +FEC)\)')
+        p22 = regex_engine.compile(r'(?P<key>\S+) +\((?P<value>Typed +Wildcard +FEC)\)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1390,25 +1388,25 @@ class ShowMplsLdpNeighborBrief(ShowMplsLdpNeighborBriefSchema):
         #                                         ipv4  ipv6  ipv4  ipv6  ipv4   ipv6
         # -----------------  --  ---  ----------  ----------  ----------  ------------
         # 10.205.2.254:0     Y   Y    31w0d       2     0     10    0     77     0
-        p1 = re.compile(r'^(?P<peer>[\d\.:]+)\s+(?P<gr>[\w]+)\s+'
-                         r'(?P<nsr>[\w]+)\s+(?P<up_time>[\w\d\:]+)\s+'
-                         r'(?P<discovery_ipv4>[\d]+)\s+(?P<discovery_ipv6>[\d]+)\s+'
-                         r'(?P<addresses_ipv4>[\d]+)\s+(?P<addresses_ipv6>[\d]+)\s+'
-                         r'(?P<labels_ipv4>[\d]+)\s+(?P<labels_ipv6>[\d]+)$')
+        p1 = regex_engine.compile(r'^(?P<peer>[\d\.:]+)\s+(?P<gr>[\w]+)\s+'
+                                   r'(?P<nsr>[\w]+)\s+(?P<up_time>[\w\d\:]+)\s+'
+                                   r'(?P<discovery_ipv4>[\d]+)\s+(?P<discovery_ipv6>[\d]+)\s+'
+                                   r'(?P<addresses_ipv4>[\d]+)\s+(?P<addresses_ipv6>[\d]+)\s+'
+                                   r'(?P<labels_ipv4>[\d]+)\s+(?P<labels_ipv6>[\d]+)$')
 
         # Peer              GR Up Time         Discovery Address
         # ----------------- -- --------------- --------- -------
         # 10.36.3.3:0         Y  00:01:04                3       8
         # 10.16.2.2:0         N  00:01:02                2       5
-        p2 = re.compile(r'^(?P<peer>[\d\.:]+) +(?P<gr>[\w]+) +(?P<up_time>[\d\:]+) +'
-                         r'(?P<discovery>(\d+)) +(?P<address>(\d+))$')
+        p2 = regex_engine.compile(r'^(?P<peer>[\d\.:]+) +(?P<gr>[\w]+) +(?P<up_time>[\d\:]+) +'
+                                   r'(?P<discovery>(\d+)) +(?P<address>(\d+))$')
 
         # Peer               GR  NSR  Up Time     Discovery  Address  IPv4 Label
         # -----------------  --  ---  ----------  ---------  -------  ----------
         # 10.16.2.2:0          N   Y    01:39:50            1        4          19
         # 10.36.3.3:0          N   N    01:38:04            1        3           5
-        p3 = re.compile(r'^(?P<peer>[\d\.:]+) +(?P<gr>(\w+)) +(?P<nsr>(\w+)) +(?P<up_time>[\d\:]+) +'
-                         r'(?P<discovery>(\d+)) +(?P<address>(\d+)) +(?P<labels_ipv4>(\d+))$')
+        p3 = regex_engine.compile(r'^(?P<peer>[\d\.:]+) +(?P<gr>(\w+)) +(?P<nsr>(\w+)) +(?P<up_time>[\d\:]+) +'
+                                   r'(?P<discovery>(\d+)) +(?P<address>(\d+)) +(?P<labels_ipv4>(\d+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1563,23 +1561,23 @@ class ShowMplsLabelTableDetail(ShowMplsLabelTableDetailSchema):
         # 0     16000   ISIS(A):SR                      InUse  No
         # 0     16001   LDP:lsd_test_ut                 InUse  No
         #               Static:lsd_test_ut              InUse  No
-        p1 = re.compile(r'(?P<table>\d+\s+)?(?P<label>\d+\s+)?(?P<owner>[\S]+)'
+        p1 = regex_engine.compile(r'(?P<table>\d+\s+)?(?P<label>\d+\s+)?(?P<owner>[\S]+)'
         r'\s+(?P<state>\S+)\s+(?P<rewrite>\w+)$')
 
         # (Lbl-blk SRGB, vers:0, (start_label=16000, size=8000)
         # (Lbl-blk SRLB, vers:0, (start_label=15000, size=1000, app_notify=0)
-        p2 = re.compile(r'^\((?P<label_type>[\S\s]+),\s+vers:(?P<vers>\d+),'
+        p2 = regex_engine.compile(r'^\((?P<label_type>[\S\s]+),\s+vers:(?P<vers>\d+),'
             r'\s+\(start_label=(?P<start_label>\d+),\s+size=(?P<size>\d+)'
             r'(,\s+app_notify=(?P<app_notify>\d+))?\)$')
 
         # (SR Adj Segment IPv4, vers:0, index=0, type=0, intf=Gi0/0/0/1, nh=10.1.2.2)
-        p3 = re.compile(r'^\((?P<sr_label_type>[\S\s]+),\s+vers:(?P<vers>\d+),'
+        p3 = regex_engine.compile(r'^\((?P<sr_label_type>[\S\s]+),\s+vers:(?P<vers>\d+),'
             r'\s+index=(?P<index>\d+),\s+type=(?P<type>\d+),\s+intf=(?P<interface>\S+),'
             r'\s+nh=(?P<nh>\S+)\)$')
             
         # (IPv4, vers:0, default, 10.4.1.1/24)
         # (IPv4, vers:0, , 10.229.10.10/15)
-        p4 = re.compile(r'^\((?P<label_type>[\S\s]+),\s+vers:(?P<vers>\d+),'
+        p4 = regex_engine.compile(r'^\((?P<label_type>[\S\s]+),\s+vers:(?P<vers>\d+),'
         r' +(?P<default>default)?, +(?P<prefix>\S+)\)$')
 
         for line in out.splitlines():
@@ -1706,9 +1704,9 @@ class ShowMplsInterfaces(ShowMplsInterfacesSchema):
             out = output
 
         # GigabitEthernet0/0/0/0     No       No       No       Yes
-        p1 = re.compile(r'^(?P<interface>\S+) +(?P<ldp>No|Yes) +'
-                r'(?P<tunnel>No|Yes) +(?P<static>No|Yes) +'
-                r'(?P<enabled>No|Yes)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+) +(?P<ldp>No|Yes) +'
+                          r'(?P<tunnel>No|Yes) +(?P<static>No|Yes) +'
+                          r'(?P<enabled>No|Yes)$')
 
         ret_dict = {}
 
@@ -1784,23 +1782,23 @@ class ShowMplsForwardingVrf(ShowMplsForwardingVrfSchema):
         ret_dict = {}
 
         # 16001  Pop         SR Pfx (idx 1)     Gi0/0/0/0    10.1.3.1        0
-        p1 = re.compile(r'^((?P<local_label>\d+) +)?(?P<outgoing_label>\S+) '
-                        r'+(?P<prefix_or_id>.+?) +(?P<outgoing_interface>\S+) '
-                        r'+(?P<next_hop>\S+) +(?P<bytes_switched>\d+)$')
+        p1 = regex_engine.compile(r'^((?P<local_label>\d+) +)?(?P<outgoing_label>\S+) '
+                                  r'+(?P<prefix_or_id>.+?) +(?P<outgoing_interface>\S+) '
+                                  r'+(?P<next_hop>\S+) +(?P<bytes_switched>\d+)$')
 
         # 24006  Aggregate   VRF1: Per-VRF Aggr[V]   \
-        p2 = re.compile(r'^(?P<local_label>\d+) +(?P<outgoing_label>\S+) '
-                        r'+(?P<prefix_or_id>.+?) +\\$')
+        p2 = regex_engine.compile(r'^(?P<local_label>\d+) +(?P<outgoing_label>\S+) '
+                                  r'+(?P<prefix_or_id>.+?) +\\$')
 
         # VRF1                         832
-        p3 = re.compile(r'^(?P<outgoing_interface>\S+) +((?P<next_hop>\S+) +)?'
-                        r'(?P<bytes_switched>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<outgoing_interface>\S+) +((?P<next_hop>\S+) +)?'
+                                  r'(?P<bytes_switched>\d+)$')
 
         # Gi0/0/0/0.390 fe80::f816:3eff:fe53:2cc7   \
-        p4 = re.compile(r'^(?P<outgoing_interface>\S+) +(?P<next_hop>\S+) +\\$')
+        p4 = regex_engine.compile(r'^(?P<outgoing_interface>\S+) +(?P<next_hop>\S+) +\\$')
 
         # 3747484
-        p5 = re.compile(r'^(?P<bytes_switched>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<bytes_switched>\d+)$')
 
         pre_label = ''
         for line in out.splitlines():
@@ -1992,19 +1990,19 @@ class ShowMplsLdpBindings(ShowMplsLdpBindingsSchema):
 
         # 10.145.95.95/32, rev 20
         # 10.9.9.98/32 , rev 6 
-        p1 = re.compile(r'^(?P<lib_entry>[\d\.\/]+) ?, +rev +(?P<rev>\d+)')
+        p1 = regex_engine.compile(r'^(?P<lib_entry>[\d\.\/]+) ?, +rev +(?P<rev>\d+)')
         
         # Local binding: label: ImpNull
         # local binding: label:IMP-NULL
-        p2 = re.compile(r'^[lL]ocal +binding: +label: ?(?P<local_label>\S+)')
+        p2 = regex_engine.compile(r'^[lL]ocal +binding: +label: ?(?P<local_label>\S+)')
         
         # Remote bindings: (2 peers)
         # remote bindings : 
-        p3 = re.compile(r'^[rR]emote +bindings ?:(?: +\((?P<peer_count>\d+) +peers\))?')
+        p3 = regex_engine.compile(r'^[rR]emote +bindings ?:(?: +\((?P<peer_count>\d+) +peers\))?')
         
         # 10.145.95.95:0       16002
         # lsr:10.255.255.255:0, label:16 
-        p4 = re.compile(r'^(?:lsr:)?(?P<lsr_id>[\d\.\:]+),? +(?:label:)?(?P<remote_label>\S+)')
+        p4 = regex_engine.compile(r'^(?:lsr:)?(?P<lsr_id>[\d\.\:]+),? +(?:label:)?(?P<remote_label>\S+)')
 
         for line in output.splitlines():
             line = line.strip() # strip whitespace from beginning and end
@@ -2148,118 +2146,118 @@ class ShowMplsLdpParameters(ShowMplsLdpParametersSchema):
         ret_dict = {}
 
         # LDP Parameters:
-        p1 = re.compile(r'^LDP +Parameters:$')
+        p1 = regex_engine.compile(r'^LDP +Parameters:$')
 
         # Role: Active
-        p2 = re.compile(r'^Role: +(?P<role_value>\w+)$')
+        p2 = regex_engine.compile(r'^Role: +(?P<role_value>\w+)$')
 
         # Protocol Version: 1
-        p3 = re.compile(r'^Protocol +Version: +(?P<protocol_version_number>\S+)$')
+        p3 = regex_engine.compile(r'^Protocol +Version: +(?P<protocol_version_number>\S+)$')
 
         # Router ID: 10.4.1.1
-        p4 = re.compile(r'^Router +ID: +(?P<router_id_ip>[\d.]+)$')
+        p4 = regex_engine.compile(r'^Router +ID: +(?P<router_id_ip>[\d.]+)$')
 
         # Null Label:
-        p5 = re.compile(r'^Null +Label:$')
+        p5 = regex_engine.compile(r'^Null +Label:$')
 
         # IPv4: Implicit
-        p6 = re.compile(r'^IPv4: +(?P<null_labels_ipv4>\w+)$')
+        p6 = regex_engine.compile(r'^IPv4: +(?P<null_labels_ipv4>\w+)$')
 
         # Session:
-        p7 = re.compile(r'^Session:$')
+        p7 = regex_engine.compile(r'^Session:$')
 
         # Hold time: 180 sec
-        p8 = re.compile(r'^Hold +time: +(?P<hold_time_seconds>\d+) +sec$')
+        p8 = regex_engine.compile(r'^Hold +time: +(?P<hold_time_seconds>\d+) +sec$')
 
         # Keepalive interval: 60 sec
-        p9 = re.compile(r'^Keepalive +interval: +(?P<keepalive_interval_seconds>\d+) +sec$')
+        p9 = regex_engine.compile(r'^Keepalive +interval: +(?P<keepalive_interval_seconds>\d+) +sec$')
 
         # Backoff: Initial:15 sec, Maximum:120 sec
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^Backoff: +Initial:(?P<initial_seconds>\d+) +sec'
             r', +Maximum:(?P<maximum_seconds>\d+) +sec$')
 
         # Global MD5 password: Disabled
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^Global +MD5 +password: +(?P<global_md5_password>\w+)$')
 
         # Discovery:
-        p12 = re.compile(r'^Discovery:$')
+        p12 = regex_engine.compile(r'^Discovery:$')
 
         # Link Hellos: Holdtime:15 sec, Interval:5 sec
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r'^Link +Hellos: +Holdtime:(?P<link_hellos_hold_time_seconds>\d+) +sec,'
             r' +Interval:(?P<link_hellos_interval_seconds>\d+) +sec$')
 
         # Targeted Hellos: Holdtime:90 sec, Interval:10 sec
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r'^Targeted +Hellos: +Holdtime:(?P<targeted_hellos_hold_time_seconds>\d+) +sec'
             r', +Interval:(?P<targeted_hellos_interval_seconds>\d+) +sec$')
 
         # Quick-start: Enabled (by default)
-        p15 = re.compile(r'^Quick-start: +(?P<quick_start>.*)$')
+        p15 = regex_engine.compile(r'^Quick-start: +(?P<quick_start>.*)$')
 
         # Transport address:
-        p16 = re.compile(r'^Transport +address:$')
+        p16 = regex_engine.compile(r'^Transport +address:$')
 
         # IPv4: 10.4.1.1
-        p17 = re.compile(r'^IPv4: +(?P<transport_address_ipv4_ip>[\d.]+)$')
+        p17 = regex_engine.compile(r'^IPv4: +(?P<transport_address_ipv4_ip>[\d.]+)$')
 
         # Graceful Restart:
-        p18 = re.compile(r'^Graceful +Restart:$')
+        p18 = regex_engine.compile(r'^Graceful +Restart:$')
 
         # Enabled
-        p19 = re.compile(r'^(?P<graceful_restart_value>(Enabled|Disabled))$')
+        p19 = regex_engine.compile(r'^(?P<graceful_restart_value>(Enabled|Disabled))$')
 
         # Reconnect Timeout:120 sec, Forwarding State Holdtime:180 sec
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r'^Reconnect +Timeout:(?P<reconnect_timeout_seconds>\d+) +sec,'
             r' +Forwarding +State +Holdtime:(?P<forwarding_state_holdtime_seconds>\d+) +sec$')
 
         # NSR: Enabled, Sync-ed
         # NSR: Enabled, Not Sync-ed
-        p21 = re.compile(r'^NSR: +(?P<nsr_value>\w+)(, +(?P<synced_value>Sync-ed|Not Sync-ed))?$')
+        p21 = regex_engine.compile(r'^NSR: +(?P<nsr_value>\w+)(, +(?P<synced_value>Sync-ed|Not Sync-ed))?$')
 
         # Timeouts:
-        p22 = re.compile(r'^Timeouts:$')
+        p22 = regex_engine.compile(r'^Timeouts:$')
 
         # Housekeeping periodic timer: 10 sec
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r'^Housekeeping +periodic +timer: +(?P<housekeeping_periodic_timer_seconds>\d+) +sec$')
 
         # Local binding: 300 sec
-        p24 = re.compile(r'^Local +binding: +(?P<local_binding_seconds>\d+) +sec$')
+        p24 = regex_engine.compile(r'^Local +binding: +(?P<local_binding_seconds>\d+) +sec$')
 
         # Forwarding state in LSD: 360 sec
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r'^Forwarding +state +in +LSD: +(?P<forwarding_state_lsd_seconds>\d+) +sec$')
 
         # Delay in AF Binding withdrawl from peer: 180 sec
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r'^Delay +in +AF +Binding +Withdrawl +from +peer:'
             r' +(?P<delay_af_binding_peer_seconds>\d+) +sec$')
 
         # Max:
-        p27 = re.compile(r'^Max:$')
+        p27 = regex_engine.compile(r'^Max:$')
 
         # 5000 interfaces (4000 attached, 1000 TE tunnel), 2000 peers
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r'^(?P<max_interface_number>\d+) +interfaces(,| )(\(| )'
             r'((?P<attached_interfaces_number>\d+) +attached(\)|,))?'
             r'((,| )*)?((?P<te_tunnel_number>\d+) +TE +tunnel\))?((,| )*)?((?P<peers_number>\d+) +peers)?')
 
         # OOR state
-        p29 = re.compile(r'^OOR +state$')
+        p29 = regex_engine.compile(r'^OOR +state$')
 
         # Memory: Normal
-        p30 = re.compile(
+        p30 = regex_engine.compile(
             r'^Memory: +(?P<oor_memory_value>(Normal|Major|Critical))$')
 
         # IGP sync delay:
-        p31 = re.compile(r'^IGP +sync +delay:$')
+        p31 = regex_engine.compile(r'^IGP +sync +delay:$')
 
         # Interface up: 20 sec
-        p32 = re.compile(r'^Interface +up: +(?P<interface_up_time>\d+) +sec$')
+        p32 = regex_engine.compile(r'^Interface +up: +(?P<interface_up_time>\d+) +sec$')
 
         # Looping through each line
         for line in out.splitlines():
@@ -2563,21 +2561,21 @@ class ShowMplsLdpIgpSync(ShowMplsLdpIgpSyncSchema):
 
         # HundredGigE0/0/0/0:
         # Bundle-Ether40051:
-        p1 = re.compile(r'^(?P<interface>[\w-]+[\/\d]+):$')
+        p1 = regex_engine.compile(r'^(?P<interface>[\w-]+[\/\d]+):$')
 
         # VRF: 'default' (0x60000000)
-        p2 = re.compile(r'^VRF:\s+\'(?P<vrf>\S+)\'\s+\((?P<vrf_index>.+)\)$')
+        p2 = regex_engine.compile(r'^VRF:\s+\'(?P<vrf>\S+)\'\s+\((?P<vrf_index>.+)\)$')
 
         # Sync delay: Disabled
         # Sync delay: 5 sec
-        p3 = re.compile(r'^Sync +delay:\s+(?P<delay>\w+)(?: sec)?$')
+        p3 = regex_engine.compile(r'^Sync +delay:\s+(?P<delay>\w+)(?: sec)?$')
 
         # Sync status: Ready
-        p4 = re.compile(r'^Sync +status:\s+(?P<status>.+)$')
+        p4 = regex_engine.compile(r'^Sync +status:\s+(?P<status>.+)$')
 
         # 63.63.63.63:0   (GR)
         # 10.120.0.10:0
-        p5 = re.compile(r'^(?P<peers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d{1,3})\s*(?P<gr_flag>\(GR\))?$')
+        p5 = regex_engine.compile(r'^(?P<peers>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d{1,3})\s*(?P<gr_flag>\(GR\))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2682,16 +2680,16 @@ class ShowMplsLdpGracefulRestart(ShowMplsLdpGracefulRestartSchema):
         ret_dict = {}
 
         # Forwarding State Hold timer : Not Running
-        p1 = re.compile(r'^Forwarding +State +Hold +timer\s+:\s+(?P<state_hold_timer>.+)$')
+        p1 = regex_engine.compile(r'^Forwarding +State +Hold +timer\s+:\s+(?P<state_hold_timer>.+)$')
 
         # GR Neighbors                : 1
-        p2 = re.compile(r'^GR +Neighbors\s+:\s+(?P<gr_neighbors>.+)$')
+        p2 = regex_engine.compile(r'^GR +Neighbors\s+:\s+(?P<gr_neighbors>.+)$')
 
         # 17.17.17.17      Y        4                -                   -
         # 17.17.17.17      Y        4                5                   6
-        p3 = re.compile(r'^(?P<neighbor_id>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+(?P<up>\w+)\s+'
-                        r'(?P<connect_count>[\d\-]+)\s+(?P<liveness_timer>[\d\-]+)\s+'
-                        r'(?P<recovery_timer>[\d\-]+)$')
+        p3 = regex_engine.compile(r'^(?P<neighbor_id>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+(?P<up>\w+)\s+'
+                                  r'(?P<connect_count>[\d\-]+)\s+(?P<liveness_timer>[\d\-]+)\s+'
+                                  r'(?P<recovery_timer>[\d\-]+)$')
 
 
         for line in out.splitlines():
@@ -2762,14 +2760,14 @@ class ShowMplsLdpNsrSummary(ShowMplsLdpNsrSummarySchema):
         ret_dict = {}
 
         # Total: 1, NSR-eligible: 1, Sync-ed: 1
-        p1 = re.compile(r'^Total:\s+(?P<total>\d+)\,\s+NSR-eligible:\s+'
-                        r'(?P<nsr_eligible>\d+)\,\s+Sync-ed:\s+(?P<sync_ed>\d+)$')
+        p1 = regex_engine.compile(r'^Total:\s+(?P<total>\d+)\,\s+NSR-eligible:\s+'
+                                  r'(?P<nsr_eligible>\d+)\,\s+Sync-ed:\s+(?P<sync_ed>\d+)$')
 
         # (1 Oper)
-        p2 = re.compile(r'^\((?P<oper>\d+)\s+Oper\)$')
+        p2 = regex_engine.compile(r'^\((?P<oper>\d+)\s+Oper\)$')
 
         # (1 Ready)
-        p3 = re.compile(r'^\((?P<ready>\d+)\s+Ready\)$')
+        p3 = regex_engine.compile(r'^\((?P<ready>\d+)\s+Ready\)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2845,9 +2843,9 @@ class ShowMplsTrafficEngTunnelsTabular(ShowMplsTrafficEngTunnelsTabularSchema):
         ret_dict = {}
 
         # tunnel-te50000     4 109.109.109.109     17.17.17.17     up  Ready Head Inact
-        p1 = re.compile(r'^(?P<tunnel>\S+)\s+(?P<lsp_id>\d+)\s+(?P<destination_address>\S+)\s+'
-                        r'(?P<source_address>\S+)\s+(?P<tunnel_state>\w+)\s+(?P<frr_state>\w+)\s+'
-                        r'(?P<lsp_role>\w+)[\s+]?(?P<path_prot>[\w]+)?$')
+        p1 = regex_engine.compile(r'^(?P<tunnel>\S+)\s+(?P<lsp_id>\d+)\s+(?P<destination_address>\S+)\s+'
+                                  r'(?P<source_address>\S+)\s+(?P<tunnel_state>\w+)\s+(?P<frr_state>\w+)\s+'
+                                  r'(?P<lsp_role>\w+)[\s+]?(?P<path_prot>[\w]+)?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3006,146 +3004,146 @@ class ShowMplsTrafficEngTunnelsTunnelid(ShowMplsTrafficEngTunnelsTunnelidSchema)
         ret_dict = {}
 
         # Name: tunnel-te50000  Destination: 109.109.109.109  Ifhandle:0x20e0
-        p1 = re.compile(r'^Name:\s+(?P<tunnel>\S+)\s+Destination:\s+(?P<destination>\S+)'
-                        r'\s+Ifhandle:(?P<ifhandle>\S+)$')
+        p1 = regex_engine.compile(r'^Name:\s+(?P<tunnel>\S+)\s+Destination:\s+(?P<destination>\S+)'
+                                  r'\s+Ifhandle:(?P<ifhandle>\S+)$')
 
         # Signalled-Name: 50000_F17-ASR9922_F109-ASR9001
-        p2 = re.compile(r'^Signalled-Name:\s+(?P<signalled_name>\S+)$')
+        p2 = regex_engine.compile(r'^Signalled-Name:\s+(?P<signalled_name>\S+)$')
 
         # Admin:    up Oper:   up   Path:  valid   Signalling: connected
-        p3 = re.compile(r'^Admin:\s+(?P<admin>\S+)\s+Oper:\s+(?P<oper>\S+)\s+Path:\s+(?P<path>\S+)'
-                        r'\s+Signalling:\s+(?P<signalling>\S+)$')
+        p3 = regex_engine.compile(r'^Admin:\s+(?P<admin>\S+)\s+Oper:\s+(?P<oper>\S+)\s+Path:\s+(?P<path>\S+)'
+                                  r'\s+Signalling:\s+(?P<signalling>\S+)$')
 
         # path option 10,  type explicit 50000-EPath_10 (Basis for Setup, path weight 160)
-        p4 = re.compile(r'^path +option\s+(?P<path_option>\d+),\s+type\s+(?P<type>\S+)'
-                        r'\s+?(?P<path_name>\S+)?\s+\((?P<path_status>.*),\s+path weight\s+(?P<path_weight>\d+)\)$')
+        p4 = regex_engine.compile(r'^path +option\s+(?P<path_option>\d+),\s+type\s+(?P<type>\S+)'
+                                  r'\s+?(?P<path_name>\S+)?\s+\((?P<path_status>.*),\s+path weight\s+(?P<path_weight>\d+)\)$')
 
         # path option 20,  type explicit 50000-EPath_20
         # path option 100,  type dynamic
-        p4_1 = re.compile(r'^path +option\s+(?P<path_option>\d+),\s+type\s+(?P<type>\S+)'
-                          r'[\s+]?(?P<path_name>\S+)?$')
+        p4_1 = regex_engine.compile(r'^path +option\s+(?P<path_option>\d+),\s+type\s+(?P<type>\S+)'
+                                    r'[\s+]?(?P<path_name>\S+)?$')
 
         # Accumulative metrics: TE 160 IGP 160 Delay 600000
-        p5 = re.compile(r'^Accumulative +metrics:\s+TE\s+(?P<te>\d+)\s+IGP\s+'
-                        r'(?P<igp>\d+)\s+Delay\s+(?P<path>\d+)$')
+        p5 = regex_engine.compile(r'^Accumulative +metrics:\s+TE\s+(?P<te>\d+)\s+IGP\s+'
+                                  r'(?P<igp>\d+)\s+Delay\s+(?P<path>\d+)$')
 
         # Last PCALC Error: Tue Apr 27 16:21:21 2021
-        p6 = re.compile(r'^Last PCALC Error:(?P<last_pcalc_error>.+)$')
+        p6 = regex_engine.compile(r'^Last PCALC Error:(?P<last_pcalc_error>.+)$')
 
         # Info: No path to destination, 109.109.109.109 (reverselink)
-        p7 = re.compile(r'^Info:\s+(?P<info>.*)\, (?P<reverselink>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}).+$')
+        p7 = regex_engine.compile(r'^Info:\s+(?P<info>.*)\, (?P<reverselink>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}).+$')
 
         # G-PID: 0x0800 (derived from egress interface properties)
-        p8 = re.compile(r'^G-PID:\s+(?P<g_pid>\S+).+$')
+        p8 = regex_engine.compile(r'^G-PID:\s+(?P<g_pid>\S+).+$')
 
         # Bandwidth Requested: 0 kbps  CT0
-        p9 = re.compile(r'^Bandwidth Requested:\s+(?P<bandwidth_requested>\S+)\s+'
-                        r'(?P<bandwidth_requested_unit>\S+).+$')
+        p9 = regex_engine.compile(r'^Bandwidth Requested:\s+(?P<bandwidth_requested>\S+)\s+'
+                                  r'(?P<bandwidth_requested_unit>\S+).+$')
 
         # Creation Time: Tue Apr 27 16:21:14 2021 (01:36:30 ago)
-        p10 = re.compile(r'^Creation Time:\s+(?P<creation_time>.+)$')
+        p10 = regex_engine.compile(r'^Creation Time:\s+(?P<creation_time>.+)$')
 
         # Bandwidth:        0 kbps (CT0) Priority:  3  3 Affinity: 0x0/0xffff
-        p11 = re.compile(r'^Bandwidth:\s+(?P<bandwidth>\d+)\s+(?P<bandwidth_unit>\S+)'
-                         r'.*Priority:\s+(?P<priority>\d+).*Affinity:\s+(?P<affinity>\S+)$')
+        p11 = regex_engine.compile(r'^Bandwidth:\s+(?P<bandwidth>\d+)\s+(?P<bandwidth_unit>\S+)'
+                                   r'.*Priority:\s+(?P<priority>\d+).*Affinity:\s+(?P<affinity>\S+)$')
 
         # Metric Type: IGP (interface)
-        p12 = re.compile(r'^Metric Type:\s+(?P<metric_type>.+)$')
+        p12 = regex_engine.compile(r'^Metric Type:\s+(?P<metric_type>.+)$')
 
         # Tiebreaker: Min-fill (default)
-        p13 = re.compile(r'^Tiebreaker:\s+(?P<tiebreaker>.+)$')
+        p13 = regex_engine.compile(r'^Tiebreaker:\s+(?P<tiebreaker>.+)$')
 
         # Hop-limit: disabled
-        p14 = re.compile(r'^Hop-limit:\s+(?P<hop_limit>.+)$')
+        p14 = regex_engine.compile(r'^Hop-limit:\s+(?P<hop_limit>.+)$')
 
         # Cost-limit: disabled
-        p15 = re.compile(r'^Cost-limit:\s+(?P<cost_limit>.+)$')
+        p15 = regex_engine.compile(r'^Cost-limit:\s+(?P<cost_limit>.+)$')
 
         # Delay-limit: disabled
-        p16 = re.compile(r'^Delay-limit:\s+(?P<delay_limit>.+)$')
+        p16 = regex_engine.compile(r'^Delay-limit:\s+(?P<delay_limit>.+)$')
 
         # Delay-measurement: disabled
-        p17 = re.compile(r'^Delay-measurement:\s+(?P<delay_measurement>.+)$')
+        p17 = regex_engine.compile(r'^Delay-measurement:\s+(?P<delay_measurement>.+)$')
 
         # Path-invalidation timeout: 10000 msec (default), Action: Tear (default)
-        p18 = re.compile(r'^Path-invalidation timeout:\s+(?P<timeout>\d+)\s+(?P<timeout_unit>\S+)'
-                         r'.*,\s+Action:\s+(?P<action>\S+).+$')
+        p18 = regex_engine.compile(r'^Path-invalidation timeout:\s+(?P<timeout>\d+)\s+(?P<timeout_unit>\S+)'
+                                   r'.*,\s+Action:\s+(?P<action>\S+).+$')
 
         # AutoRoute:  enabled  LockDown: disabled   Policy class: not set
-        p19 = re.compile(r'^AutoRoute:\s+(?P<autoroute>\S+)\s+LockDown:\s+(?P<lockdown>.+)\s+'
-                         r'Policy class:\s+(?P<policy_class>.+)$')
+        p19 = regex_engine.compile(r'^AutoRoute:\s+(?P<autoroute>\S+)\s+LockDown:\s+(?P<lockdown>.+)\s+'
+                                   r'Policy class:\s+(?P<policy_class>.+)$')
 
         # Forward class: 0 (not enabled)
-        p20 = re.compile(r'^Forward class:\s+(?P<forward_class>\S+)\s+\((?P<forward_class_state>.+)?\)$')
+        p20 = regex_engine.compile(r'^Forward class:\s+(?P<forward_class>\S+)\s+\((?P<forward_class_state>.+)?\)$')
 
         # Forwarding-Adjacency: disabled
-        p21 = re.compile(r'^Forwarding-Adjacency:\s+(?P<forwarding_adjacency>.+)$')
+        p21 = regex_engine.compile(r'^Forwarding-Adjacency:\s+(?P<forwarding_adjacency>.+)$')
 
         # Autoroute Destinations: 0
-        p22 = re.compile(r'^Autoroute Destinations:\s+(?P<autoroute_destinations>.+)$')
+        p22 = regex_engine.compile(r'^Autoroute Destinations:\s+(?P<autoroute_destinations>.+)$')
 
         # Loadshare:          0 equal loadshares
-        p23 = re.compile(r'^Loadshare:\s+(?P<loadshare>\d+)\s+(?P<loadshare_state>.+)$')
+        p23 = regex_engine.compile(r'^Loadshare:\s+(?P<loadshare>\d+)\s+(?P<loadshare_state>.+)$')
 
         # Auto-bw: disabled
-        p24 = re.compile(r'^Auto-bw:\s+(?P<auto_bw>.+)$')
+        p24 = regex_engine.compile(r'^Auto-bw:\s+(?P<auto_bw>.+)$')
 
         # Auto-Capacity: Disabled:
-        p25 = re.compile(r'^Auto-Capacity:\s+(?P<auto_capacity>\w+)\:?$')
+        p25 = regex_engine.compile(r'^Auto-Capacity:\s+(?P<auto_capacity>\w+)\:?$')
 
         # Fast Reroute: Enabled, Protection Desired: Any
-        p26 = re.compile(r'^Fast Reroute:\s+(?P<fast_reroute>\S+), Protection Desired:'
-                         r'\s+(?P<protection_desired>.+)$')
+        p26 = regex_engine.compile(r'^Fast Reroute:\s+(?P<fast_reroute>\S+), Protection Desired:'
+                                   r'\s+(?P<protection_desired>.+)$')
 
         # Path Protection: Not Enabled
-        p27 = re.compile(r'^Path Protection:\s+(?P<path_protection>.+)$')
+        p27 = regex_engine.compile(r'^Path Protection:\s+(?P<path_protection>.+)$')
 
         # BFD Fast Detection: Disabled
-        p28 = re.compile(r'^BFD Fast Detection:\s+(?P<bfd_fast_detection>.+)$')
+        p28 = regex_engine.compile(r'^BFD Fast Detection:\s+(?P<bfd_fast_detection>.+)$')
 
         # Reoptimization after affinity failure: Enabled
-        p29 = re.compile(r'^Reoptimization after affinity failure:\s+(?P<reoptimization>.+)$')
+        p29 = regex_engine.compile(r'^Reoptimization after affinity failure:\s+(?P<reoptimization>.+)$')
 
         # Soft Preemption: Disabled
-        p30 = re.compile(r'^Soft Preemption:\s+(?P<soft_preemption>.+)$')
+        p30 = regex_engine.compile(r'^Soft Preemption:\s+(?P<soft_preemption>.+)$')
 
         # Tunnel has been up for: 01:36:23 (since Tue Apr 27 16:21:21 JST 2021)
-        p31 = re.compile(r'^Tunnel has been up for:\s+(?P<tunnel_up_time>.+)$')
+        p31 = regex_engine.compile(r'^Tunnel has been up for:\s+(?P<tunnel_up_time>.+)$')
 
         # Uptime: 00:26:32 (since Tue Apr 27 17:31:12 JST 2021)
-        p32 = re.compile(r'^Uptime:\s+(?P<uptime>.+)$')
+        p32 = regex_engine.compile(r'^Uptime:\s+(?P<uptime>.+)$')
 
         # LSP not signalled, identical to the [CURRENT] LSP
-        p33 = re.compile(r'^LSP\s+(?P<lsp>.+),\s+(?P<lsp_status>.+)$')
+        p33 = regex_engine.compile(r'^LSP\s+(?P<lsp>.+),\s+(?P<lsp_status>.+)$')
 
         # Date/Time: Tue Apr 27 16:26:11 JST 2021 [01:31:33 ago]
-        p34 = re.compile(r'^Date/Time:\s+(?P<date_time>.+)$')
+        p34 = regex_engine.compile(r'^Date/Time:\s+(?P<date_time>.+)$')
 
         # ID: 5 Path Option: 20
-        p35 = re.compile(r'^ID:\s+(?P<id>\d+)\s+Path Option:\s+(?P<path_option>\d+)$')
+        p35 = regex_engine.compile(r'^ID:\s+(?P<id>\d+)\s+Path Option:\s+(?P<path_option>\d+)$')
 
         # Removal Trigger: reoptimization completed
-        p36 = re.compile(r'^Removal Trigger:\s+(?P<removal_trigger>.+)$')
+        p36 = regex_engine.compile(r'^Removal Trigger:\s+(?P<removal_trigger>.+)$')
 
         # Path info (OSPF mpls1 area 0):
-        p37 = re.compile(r'^Path info \((?P<path_info>.+)\):$')
+        p37 = regex_engine.compile(r'^Path info \((?P<path_info>.+)\):$')
 
         # Node hop count: 2
-        p38 = re.compile(r'^Node hop count:\s+(?P<node_hop_count>.+)$')
+        p38 = regex_engine.compile(r'^Node hop count:\s+(?P<node_hop_count>.+)$')
 
         # Hop0: 20.50.0.1
         # Hop1: 21.50.0.2
         # Hop2: 109.109.109.109
-        p39 = re.compile(r'^Hop(?P<hop>\d+):\s+(?P<ip_address>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$')
+        p39 = regex_engine.compile(r'^Hop(?P<hop>\d+):\s+(?P<ip_address>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$')
 
         # Displayed 1 (of 9) heads, 0 (of 10) midpoints, 0 (of 6) tails
-        p40 = re.compile(r'^Displayed\s+(?P<heads_displayed>\d+)\s+\(of\s+(?P<total_heads>\d+)\)'
-                         r'\s+heads,\s+(?P<midpoints_displayed>\d+)\s+\(of\s+(?P<total_midpoints>\d+)'
-                         r'\)\s+midpoints,\s+(?P<tails_displayed>\d+)\s+\(of\s+(?P<total_tails>\d+)\)\s+tails$')
+        p40 = regex_engine.compile(r'^Displayed\s+(?P<heads_displayed>\d+)\s+\(of\s+(?P<total_heads>\d+)\)'
+                                   r'\s+heads,\s+(?P<midpoints_displayed>\d+)\s+\(of\s+(?P<total_midpoints>\d+)'
+                                   r'\)\s+midpoints,\s+(?P<tails_displayed>\d+)\s+\(of\s+(?P<total_tails>\d+)\)\s+tails$')
 
         # Displayed 1 up, 0 down, 0 recovering, 0 recovered heads
-        p41 = re.compile(r'^Displayed\s+(?P<up>\d+)\s+up,\s+(?P<down>\d+)\s+down,'
-                         r'\s+(?P<recovering>\d+)\s+recovering,\s+(?P<recovered_heads>\d+).+$')
+        p41 = regex_engine.compile(r'^Displayed\s+(?P<up>\d+)\s+up,\s+(?P<down>\d+)\s+down,'
+                                   r'\s+(?P<recovering>\d+)\s+recovering,\s+(?P<recovered_heads>\d+).+$')
 
 
         for line in out.splitlines():
@@ -3543,7 +3541,7 @@ class ShowMplsLdpInterfaceBrief(ShowMplsLdpInterfaceBriefSchema):
         # Gi0/0/0/1       default             Y      Y       1            N/A
         # Gi0/0/0/2       vrf_1             Y      Y       1            N/A
         # Gi0/0/0/2.200   -                   N      N       0            N/A
-        p1 = re.compile(r'^(?P<interface_name>\S+)\s+(?P<vrf_name>[_\w-]+)\s+(?P<config>[Y|N])\s+(?P<enabled>[Y|N])\s+(?P<igp_auto_cfg>\d+)\s+(?P<te_mesh_grp_cfg>[N\/A]+)$')
+        p1 = regex_engine.compile(r'^(?P<interface_name>\S+)\s+(?P<vrf_name>[_\w-]+)\s+(?P<config>[Y|N])\s+(?P<enabled>[Y|N])\s+(?P<igp_auto_cfg>\d+)\s+(?P<te_mesh_grp_cfg>[N\/A]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -18,13 +18,13 @@ IOSXR parsers for the following commands
     * 'show msdp vrf {vrf} statistics peer {peer}'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowMsdpPeerSchema(MetaParser):
     """Schema for:
@@ -122,80 +122,80 @@ class ShowMsdpPeer(ShowMsdpPeerSchema):
 
         # MSDP Peer 192.168.229.3 (?), AS 65109
         # MSDP Peer 10.1.1.1 (R1.cisco.com), AS 65109
-        r1 = re.compile(r'MSDP +Peer +(?P<peer>\S+) \((?P<peer_name>\S+)\), +'
-                        r'AS (?P<peer_as>\d+)')
+        r1 = regex_engine.compile(r'MSDP +Peer +(?P<peer>\S+) \((?P<peer_name>\S+)\), +'
+                                  r'AS (?P<peer_as>\d+)')
 
         # Description: R1
         # Description:
-        r2 = re.compile(r'Description:(?: +(?P<description>\S+))?$')
+        r2 = regex_engine.compile(r'Description:(?: +(?P<description>\S+))?$')
 
         # State: Inactive, Resets: 999, Connection Source: 192.168.100.1
-        r3 = re.compile(r'State: +(?P<session_state>\S+),'
-                        r' +Resets: +(?P<reset>\d+),'
-                        r' +Connection +Source: +(?P<connect_source_address>\S+)')
+        r3 = regex_engine.compile(r'State: +(?P<session_state>\S+),'
+                                  r' +Resets: +(?P<reset>\d+),'
+                                  r' +Connection +Source: +(?P<connect_source_address>\S+)')
 
         # Uptime(Downtime): 00:00:09, SA messages received: 0
-        r4 = re.compile(r'Uptime\(Downtime\): +(?P<elapsed_time>\S+), +'
-                        r'SA messages received: +(?P<sa_message_in>\d+)')
+        r4 = regex_engine.compile(r'Uptime\(Downtime\): +(?P<elapsed_time>\S+), +'
+                                  r'SA messages received: +(?P<sa_message_in>\d+)')
 
         # TLV messages sent/received: 3/0
-        r5 = re.compile(r'TLV messages +sent\/received: +'
-                        r'(?P<tlv_message_sent>\d+)\/'
-                        r'(?P<tlv_message_received>\d+)$')
+        r5 = regex_engine.compile(r'TLV messages +sent\/received: +'
+                                  r'(?P<tlv_message_sent>\d+)\/'
+                                  r'(?P<tlv_message_received>\d+)$')
 
         # Output messages discarded: 0
-        r6 = re.compile(r'Output +messages +discarded: +'
-                        r'(?P<output_message_discarded>\d+)')
+        r6 = regex_engine.compile(r'Output +messages +discarded: +'
+                                  r'(?P<output_message_discarded>\d+)')
 
         # Connection and counters cleared 00:01:25 ago
-        r7 = re.compile(r'Connection +and +counters +cleared +'
-                        r'(?P<conn_count_cleared>\S+)\s+ago$')
+        r7 = regex_engine.compile(r'Connection +and +counters +cleared +'
+                                  r'(?P<conn_count_cleared>\S+)\s+ago$')
 
         # Input (S,G) filter: none
         # Input RP filter: none
-        r8 = re.compile(r'Input +(?P<filter_in>\S+) +'
-                        r'filter: +(?P<filter>\S+)$')
+        r8 = regex_engine.compile(r'Input +(?P<filter_in>\S+) +'
+                                  r'filter: +(?P<filter>\S+)$')
 
         # Output (S,G) filter: none
         # Output RP filter: none
-        r9 = re.compile(r'Output +(?P<filter_out>\S+) +filter:'
-                        r' +(?P<filter>\S+)$')
+        r9 = regex_engine.compile(r'Output +(?P<filter_out>\S+) +filter:'
+                                  r' +(?P<filter>\S+)$')
 
         # Input filter: none
-        r10 = re.compile(r'Input +filter: +(?P<input_filter>\S+)')
+        r10 = regex_engine.compile(r'Input +filter: +(?P<input_filter>\S+)')
 
         # Sending SA-Requests to peer: disabled
-        r11 = re.compile(r'Sending +SA-Requests +to +peer:'
-                         r' +(?P<sa_request_to_peer>\S+)')
+        r11 = regex_engine.compile(r'Sending +SA-Requests +to +peer:'
+                                   r' +(?P<sa_request_to_peer>\S+)')
 
         # Password: None
-        r12 = re.compile(r'Password: +'
-                         r'(?P<password>\S+)')
+        r12 = regex_engine.compile(r'Password: +'
+                                   r'(?P<password>\S+)')
 
         # Peer ttl threshold: 2
-        r13 = re.compile(r'^Peer +ttl +threshold:'
-                         r' +(?P<ttl_threshold>\d+)')
+        r13 = regex_engine.compile(r'^Peer +ttl +threshold:'
+                                   r' +(?P<ttl_threshold>\d+)')
 
         # Input queue size: 0, Output queue size: 0
-        r14 = re.compile(r'^Input +queue +size: +(?P<size_in>\d+),'
-                         r' +Output +queue +size: +(?P<size_out>\d+)$')
+        r14 = regex_engine.compile(r'^Input +queue +size: +(?P<size_in>\d+),'
+                                   r' +Output +queue +size: +(?P<size_out>\d+)$')
 
         # KeepAlive timer period: 30
-        r15 = re.compile(r'^KeepAlive +timer +period:'
-                         r' +(?P<keepalive_interval>\d+)')
+        r15 = regex_engine.compile(r'^KeepAlive +timer +period:'
+                                   r' +(?P<keepalive_interval>\d+)')
 
         # Peer Timeout timer period: 75
-        r16 = re.compile(r'^Peer +Timeout +timer +period:'
-                         r' +(?P<peer_timeout_interval>\d+)')
+        r16 = regex_engine.compile(r'^Peer +Timeout +timer +period:'
+                                   r' +(?P<peer_timeout_interval>\d+)')
 
         # State: StopRead, Oper-Downs: 0
-        r17 = re.compile(r'^State: +(?P<state>\S+)'
-                         r', +Oper-Downs:'
-                         r' +(?P<oper_downs>\d+)')
+        r17 = regex_engine.compile(r'^State: +(?P<state>\S+)'
+                                   r', +Oper-Downs:'
+                                   r' +(?P<oper_downs>\d+)')
 
         # NSR-Uptime(NSR-Downtime): 1d02h
-        r18 = re.compile(r'NSR-Uptime\(NSR-Downtime\):'
-                         r' +(?P<up_down_time>\S+)')
+        r18 = regex_engine.compile(r'NSR-Uptime\(NSR-Downtime\):'
+                                   r' +(?P<up_down_time>\S+)')
 
         parsed_dict = {}
 
@@ -501,13 +501,13 @@ class ShowMsdpContext(ShowMsdpContextSchema):
         # VRF ID                     : 0x60000000
         # Table ID                   : 0xe0000000
         # Table Count (Active/Total) : 2/2
-        r1 = re.compile(r'^VRF +ID +: +(?P<vrf_id>\S+)')
+        r1 = regex_engine.compile(r'^VRF +ID +: +(?P<vrf_id>\S+)')
 
-        r2 = re.compile(r'Table +ID +: +(?P<table_id>\S+)')
+        r2 = regex_engine.compile(r'Table +ID +: +(?P<table_id>\S+)')
 
-        r3 = re.compile(r'Table +Count +\(Active\/Total\) +: +'
-                        r'(?P<table_count_active>\d+)\/'
-                        r'(?P<table_count_total>\d+)')
+        r3 = regex_engine.compile(r'Table +Count +\(Active\/Total\) +: +'
+                                  r'(?P<table_count_active>\d+)\/'
+                                  r'(?P<table_count_total>\d+)')
 
         # TTL                 : 2
         # Maximum SAs         : 0
@@ -518,23 +518,23 @@ class ShowMsdpContext(ShowMsdpContextSchema):
         # SA Filter Out       :
         # RP Filter In        :
         # RP Filter Out       :
-        r4 = re.compile(r'TTL +: +(?P<ttl>\d+)')
+        r4 = regex_engine.compile(r'TTL +: +(?P<ttl>\d+)')
 
-        r5 = re.compile(r'Maximum +SAs +: +(?P<maximum_sa>\d+)')
+        r5 = regex_engine.compile(r'Maximum +SAs +: +(?P<maximum_sa>\d+)')
 
-        r6 = re.compile(r'Keepalive Period +: +(?P<keepalive_period>\d+)')
+        r6 = regex_engine.compile(r'Keepalive Period +: +(?P<keepalive_period>\d+)')
 
-        r7 = re.compile(r'Peer +Timeout +Period +: +(?P<peer_timeout_period>\d+)')
+        r7 = regex_engine.compile(r'Peer +Timeout +Period +: +(?P<peer_timeout_period>\d+)')
 
-        r8 = re.compile(r'Connect Source +: +(?:(?P<connect_source>\S+))?')
+        r8 = regex_engine.compile(r'Connect Source +: +(?:(?P<connect_source>\S+))?')
 
-        r9 = re.compile(r'SA +Filter +In +: +(?:(?P<sa_filter_in>\S+))?')
+        r9 = regex_engine.compile(r'SA +Filter +In +: +(?:(?P<sa_filter_in>\S+))?')
 
-        r10 = re.compile(r'SA +Filter +Out +: +(?:(?P<sa_filter_out>\S+))?')
+        r10 = regex_engine.compile(r'SA +Filter +Out +: +(?:(?P<sa_filter_out>\S+))?')
 
-        r11 = re.compile(r'RP +Filter +In +: +(?:(?P<rp_filter_in>\S+))?')
+        r11 = regex_engine.compile(r'RP +Filter +In +: +(?:(?P<rp_filter_in>\S+))?')
 
-        r12 = re.compile(r'RP +Filter +Out +: +(?:(?P<rp_filter_out>\S+))?')
+        r12 = regex_engine.compile(r'RP +Filter +Out +: +(?:(?P<rp_filter_out>\S+))?')
 
         # Originator Address         : 172.16.76.1
         # Originator Interface Name  : Loopback150
@@ -542,47 +542,47 @@ class ShowMsdpContext(ShowMsdpContextSchema):
         # SA Holdtime                : 150
         # Allow Encaps Count         : 0
         # Context Maximum SAs        : 20000
-        r13 = re.compile(r'Originator +Address +: +(?P<originator_address>\S+)')
+        r13 = regex_engine.compile(r'Originator +Address +: +(?P<originator_address>\S+)')
 
-        r14 = re.compile(r'Originator +Interface +Name +: +(?P<originator_interface>\S+)')
+        r14 = regex_engine.compile(r'Originator +Interface +Name +: +(?P<originator_interface>\S+)')
 
-        r15 = re.compile(r'Default +Peer +Address +: +(?P<default_peer_address>\S+)')
+        r15 = regex_engine.compile(r'Default +Peer +Address +: +(?P<default_peer_address>\S+)')
 
-        r16 = re.compile(r'SA +Holdtime +: +(?P<sa_holdtime>\d+)')
+        r16 = regex_engine.compile(r'SA +Holdtime +: +(?P<sa_holdtime>\d+)')
 
-        r17 = re.compile(r'Allow +Encaps +Count +: +(?P<allow_encaps_count>\d+)')
+        r17 = regex_engine.compile(r'Allow +Encaps +Count +: +(?P<allow_encaps_count>\d+)')
 
-        r18 = re.compile(r'Context +Maximum +SAs +: +(?P<config_maximum_sa>\d+)')
+        r18 = regex_engine.compile(r'Context +Maximum +SAs +: +(?P<config_maximum_sa>\d+)')
 
         # Groups       :          2/2
         # Sources      :         12/12
         # RPs          :          3/0
         # External SAs :          3/3
-        r19 = re.compile(r'Groups +: +(?P<groups_current>\d+)\/(?P<groups_high>\d+)')
+        r19 = regex_engine.compile(r'Groups +: +(?P<groups_current>\d+)\/(?P<groups_high>\d+)')
 
-        r20 = re.compile(r'Sources +: +(?P<sources_current>\d+)\/(?P<sources_high>\d+)')
+        r20 = regex_engine.compile(r'Sources +: +(?P<sources_current>\d+)\/(?P<sources_high>\d+)')
 
-        r21 = re.compile(r'RPs +: +(?P<rps_current>\d+)\/(?P<rps_high>\d+)')
+        r21 = regex_engine.compile(r'RPs +: +(?P<rps_current>\d+)\/(?P<rps_high>\d+)')
 
-        r22 = re.compile(r'External +SAs +: +(?P<sas_current>\d+)\/(?P<sas_high>\d+)')
+        r22 = regex_engine.compile(r'External +SAs +: +(?P<sas_current>\d+)\/(?P<sas_high>\d+)')
 
         # Total updates        : 473
         # With no changes      : 0
         # (*,G) routes         : 26
         # (S,G) routes         : 447
-        r23 = re.compile(r'Total +updates +: +(?P<total_updates>\d+)')
-        r24 = re.compile(r'With +no +changes +: +(?P<with_no_changes>\d+)')
-        r25 = re.compile(r'\(\*,G\) +routes +: +(?P<g_routes>\d+)')
-        r26 = re.compile(r'\(S,G\) +routes +: +(?P<sg_routes>\d+)')
+        r23 = regex_engine.compile(r'Total +updates +: +(?P<total_updates>\d+)')
+        r24 = regex_engine.compile(r'With +no +changes +: +(?P<with_no_changes>\d+)')
+        r25 = regex_engine.compile(r'\(\*,G\) +routes +: +(?P<g_routes>\d+)')
+        r26 = regex_engine.compile(r'\(S,G\) +routes +: +(?P<sg_routes>\d+)')
 
         # Invalid group        : 0
         # Invalid group length : 0
         # Invalid source       : 0
         # Auto-RP Address      : 2
-        r27 = re.compile(r'Invalid +group +: +(?P<invalid_group>\d+)')
-        r28 = re.compile(r'Invalid +group +length +: +(?P<invalid_group_length>\d+)')
-        r29 = re.compile(r'Invalid +source +: +(?P<invalid_source>\d+)')
-        r30 = re.compile(r'Auto\-RP +Address +: +(?P<auto_rp_address>\d+)')
+        r27 = regex_engine.compile(r'Invalid +group +: +(?P<invalid_group>\d+)')
+        r28 = regex_engine.compile(r'Invalid +group +length +: +(?P<invalid_group_length>\d+)')
+        r29 = regex_engine.compile(r'Invalid +source +: +(?P<invalid_source>\d+)')
+        r30 = regex_engine.compile(r'Auto\-RP +Address +: +(?P<auto_rp_address>\d+)')
 
         parsed_dict = {}
         for line in out.splitlines():
@@ -892,22 +892,22 @@ class ShowMsdpSummary(ShowMsdpSummarySchema):
             out = output
 
         # Maximum External SA's Global : 20000
-        r1 = re.compile(r'Maximum +External +SA\'s +Global +:'
-                        r' +(?P<maximum_external_sa_global>\d+)')
+        r1 = regex_engine.compile(r'Maximum +External +SA\'s +Global +:'
+                                  r' +(?P<maximum_external_sa_global>\d+)')
 
         # Current External Active SAs : 0
-        r2 = re.compile(r'Current +External +Active +SAs'
-                        r' +: +(?P<current_external_active_sa>\d+)')
+        r2 = regex_engine.compile(r'Current +External +Active +SAs'
+                                  r' +: +(?P<current_external_active_sa>\d+)')
 
         # Peer Address	  AS		   State    Uptime/    Reset Peer    Active Cfg.Max    TLV
         #             Downtime    Count Name    SA Cnt Ext.SAs recv/sent
         # 10.64.4.4    200    Connect    20:35:48    0    R4    0   444    0/0
         # 10.229.11.11    0    Listen    18:14:53    0    ?    0    0   0/0
-        r3 = re.compile(r'(?P<address>\S+) +(?P<as>\d+)'
-                        r' +(?P<state>\S+) +(?P<uptime_downtime>\S+)'
-                        r' +(?P<reset_count>\d+) +(?P<name>\S+)'
-                        r' +(?P<active_sa_cnt>\d+) +(?P<cfg_max_ext_sas>\d+)'
-                        r' +(?P<receive>\d+)\/(?P<sent>\d+)')
+        r3 = regex_engine.compile(r'(?P<address>\S+) +(?P<as>\d+)'
+                                  r' +(?P<state>\S+) +(?P<uptime_downtime>\S+)'
+                                  r' +(?P<reset_count>\d+) +(?P<name>\S+)'
+                                  r' +(?P<active_sa_cnt>\d+) +(?P<cfg_max_ext_sas>\d+)'
+                                  r' +(?P<receive>\d+)\/(?P<sent>\d+)')
 
         parsed_dict = {}
 
@@ -1022,22 +1022,22 @@ class ShowMsdpSaCache(ShowMsdpSaCacheSchema):
             out = output
 
         # (10.1.1.10, 239.1.1.1), RP 192.168.1.1, MBGP/AS 200, 00:01:02/00:01:32
-        r1 = re.compile(r'\((?P<source_addr>\S+), +(?P<group>\S+)\),'
-                        r' +RP +(?P<rp_address>\S+), +(?:MBGP\/)?'
-                        r'AS +(?P<peer_as>\S+), +(?P<up_time>\S+)\/(?P<expire>\S+)')
+        r1 = regex_engine.compile(r'\((?P<source_addr>\S+), +(?P<group>\S+)\),'
+                                  r' +RP +(?P<rp_address>\S+), +(?:MBGP\/)?'
+                                  r'AS +(?P<peer_as>\S+), +(?P<up_time>\S+)\/(?P<expire>\S+)')
 
         #    Learned from peer 192.168.1.1, RPF peer 192.168.1.1
-        r2 = re.compile(r'Learned +from +peer +(?P<peer_learned_from>\S+),'
-                        r' +RPF +peer +(?P<rpf_peer>\S+)')
+        r2 = regex_engine.compile(r'Learned +from +peer +(?P<peer_learned_from>\S+),'
+                                  r' +RPF +peer +(?P<rpf_peer>\S+)')
 
         # SAs recvd 2, Encapsulated data received: 0
-        r3 = re.compile(r'SAs +recvd +(?P<sa_received>\d+),'
-                        r' +Encapsulated\s+data\s+received:'
-                        r' +(?P<encapsulated_data_received>\d+)')
+        r3 = regex_engine.compile(r'SAs +recvd +(?P<sa_received>\d+),'
+                                  r' +Encapsulated\s+data\s+received:'
+                                  r' +(?P<encapsulated_data_received>\d+)')
 
         # grp flags: PI,    src flags: E, EA, PI
-        r4 = re.compile(r'grp +flags: +(?P<grp_flag>\S+), +src'
-                        r' +flags: +(?P<src_flag>[\S\s]+)')
+        r4 = regex_engine.compile(r'grp +flags: +(?P<grp_flag>\S+), +src'
+                                  r' +flags: +(?P<src_flag>[\S\s]+)')
 
         parsed_dict = {}
 
@@ -1172,28 +1172,28 @@ class ShowMsdpStatisticsPeer(ShowMsdpStatisticsPeerSchema):
             out = output
 
         # Peer 10.64.4.4 : AS is 200, State is Connect, 0 active SAs
-        r1 = re.compile(r'Peer +(?P<peer_address>\d+.+) : '
-                        r'+AS +is +(?P<as>\d+), +State +is +(?P<state>\S+), '
-                        r'+(?P<active_sa>\d+) +active SAs$')
+        r1 = regex_engine.compile(r'Peer +(?P<peer_address>\d+.+) : '
+                                  r'+AS +is +(?P<as>\d+), +State +is +(?P<state>\S+), '
+                                  r'+(?P<active_sa>\d+) +active SAs$')
 
         #     TLV Rcvd : 0 total
-        r2 = re.compile(r'TLV +Rcvd +: +(?P<total>\d+) +total$')
+        r2 = regex_engine.compile(r'TLV +Rcvd +: +(?P<total>\d+) +total$')
 
         # 0 keepalives, 0 notifications
-        r3 = re.compile(r'(?P<keepalives>\d+) +keepalives, +(?P<notifications>\d+) +notifications$')
+        r3 = regex_engine.compile(r'(?P<keepalives>\d+) +keepalives, +(?P<notifications>\d+) +notifications$')
 
         # 0 SAs, 0 SA Requests
-        r4 = re.compile(r'(?P<sa>\d+) +SAs, +(?P<request>\d+) +SA Requests$')
+        r4 = regex_engine.compile(r'(?P<sa>\d+) +SAs, +(?P<request>\d+) +SA Requests$')
 
         # 0 SA responses, 0 unknowns
         # 0 SA responses
-        r5 = re.compile(r'(?P<sa_response>\d+) +SA responses(?:, +(?P<unknowns>\d+) +unknowns$)?')
+        r5 = regex_engine.compile(r'(?P<sa_response>\d+) +SA responses(?:, +(?P<unknowns>\d+) +unknowns$)?')
 
         # TLV Sent : 0 total
-        r6 = re.compile(r'TLV +Sent +: +(?P<total>\d+) +total')
+        r6 = regex_engine.compile(r'TLV +Sent +: +(?P<total>\d+) +total')
 
         # SA msgs  : 0 received, 0 sent
-        r7 = re.compile(r'SA +msgs +: +(?P<received>\d+) +received, +(?P<sent>\d+) +sent$')
+        r7 = regex_engine.compile(r'SA +msgs +: +(?P<received>\d+) +received, +(?P<sent>\d+) +sent$')
 
         parsed_dict = {}
 
@@ -7,13 +7,13 @@ IOSXR parsers for the following show commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================================
 #  Schema for show ntp associations
@@ -107,21 +107,21 @@ class ShowNtpAssociations(ShowNtpAssociationsSchema):
         mode_code = None
 
         #  ~10.16.2.2          127.127.1.1       9    52    64  377   69.18  -518066   4.702
-        p1 = re.compile(r'^(?P<mode_code>[x\*\#\+\- ])?(?P<configured>[\~])? *(?P<remote>[\w\.\:]+) +'
-                         r'(?P<refid>[\w\.]+) +(?P<stratum>\d+) +'
-                         r'(?P<receive_time>[\d\-]+) +(?P<poll>\d+) +'
-                         r'(?P<reach>\d+) +(?P<delay>[\d\.]+) +'
-                         r'(?P<offset>[\d\.\-]+) +(?P<disp>[\d\.\-]+)$')
+        p1 = regex_engine.compile(r'^(?P<mode_code>[x\*\#\+\- ])?(?P<configured>[\~])? *(?P<remote>[\w\.\:]+) +'
+                                   r'(?P<refid>[\w\.]+) +(?P<stratum>\d+) +'
+                                   r'(?P<receive_time>[\d\-]+) +(?P<poll>\d+) +'
+                                   r'(?P<reach>\d+) +(?P<delay>[\d\.]+) +'
+                                   r'(?P<offset>[\d\.\-]+) +(?P<disp>[\d\.\-]+)$')
 
         #  ~10.4.1.1 vrf VRF1
-        p2 = re.compile(r'^(?P<mode_code>[x\*\#\+\- ])?(?P<configured>[\~])? *(?P<remote>[\w\.\:]+) +'
-                         r'vrf +(?P<vrf>\w+)$')
+        p2 = regex_engine.compile(r'^(?P<mode_code>[x\*\#\+\- ])?(?P<configured>[\~])? *(?P<remote>[\w\.\:]+) +'
+                                   r'vrf +(?P<vrf>\w+)$')
 
         #                    .INIT.           16     -  1024    0    0.00   0.000   15937
-        p3 = re.compile(r'^(?P<refid>[\w\.]+) +(?P<stratum>\d+) +'
-                         r'(?P<receive_time>[\d\-]+) +(?P<poll>\d+) +'
-                         r'(?P<reach>\d+) +(?P<delay>[\d\.]+) +'
-                         r'(?P<offset>[\d\.\-]+) +(?P<disp>[\d\.\-]+)$')
+        p3 = regex_engine.compile(r'^(?P<refid>[\w\.]+) +(?P<stratum>\d+) +'
+                                   r'(?P<receive_time>[\d\-]+) +(?P<poll>\d+) +'
+                                   r'(?P<reach>\d+) +(?P<delay>[\d\.]+) +'
+                                   r'(?P<offset>[\d\.\-]+) +(?P<disp>[\d\.\-]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -345,42 +345,42 @@ class ShowNtpStatus(ShowNtpStatusSchema):
         ret_dict = {}
 
         # Clock is synchronized, stratum 1, reference is .LOCL.
-        p1 = re.compile(r'^Clock +is +(?P<clock_state>\w+), +stratum'
+        p1 = regex_engine.compile(r'^Clock +is +(?P<clock_state>\w+), +stratum'
             r' +(?P<stratum>\d+), +reference +is +(?P<refid>[\w\.]+)$')
 
         # Clock is unsynchronized, stratum 16, no reference clock
-        p1_1 = re.compile(r'^Clock +is +(?P<clock_state>\w+), +stratum'
+        p1_1 = regex_engine.compile(r'^Clock +is +(?P<clock_state>\w+), +stratum'
             r' +(?P<stratum>\d+), +no +reference +clock$')
 
         # nominal freq is 250.0000 Hz, actual freq is 250.0000 Hz, precision is 2**10
-        p2 = re.compile(r'^nominal +freq +is +(?P<nom_freq>[\d\.]+) +Hz,'
+        p2 = regex_engine.compile(r'^nominal +freq +is +(?P<nom_freq>[\d\.]+) +Hz,'
             r' actual +freq +is +(?P<act_freq>[\d\.]+) +Hz, precision +is +(?P<precision>[\d\*]+)$')
 
         # ntp uptime is 1921500 (1/100 of seconds), resolution is 4000
-        p3 = re.compile(r'^ntp +uptime +is +(?P<uptime>[\d\s\w\/\(\)]+),'
+        p3 = regex_engine.compile(r'^ntp +uptime +is +(?P<uptime>[\d\s\w\/\(\)]+),'
             r' +resolution +is +(?P<resolution>[\d]+)$')
 
         # reference time is DF9FFBA0.8B020DC8 (15:43:28.543 UTC Wed Nov 21 2018)
-        p4 = re.compile(r'^reference +time +is +(?P<reftime>[\w\s\.\:\(\)]+)$')
+        p4 = regex_engine.compile(r'^reference +time +is +(?P<reftime>[\w\s\.\:\(\)]+)$')
 
         # clock offset is 0.0000 msec, root delay is 0.00 msec
-        p5 = re.compile(r'^clock +offset +is +(?P<offset>[\d\.\-]+) +msec,'
+        p5 = regex_engine.compile(r'^clock +offset +is +(?P<offset>[\d\.\-]+) +msec,'
             r' +root +delay +is +(?P<rootdelay>[\d\.]+) +msec$')
 
         # root dispersion is 2.31 msec, peer dispersion is 1.20 msec
-        p6 = re.compile(r'^root +dispersion +is +(?P<rootdispersion>[\d\.]+)'
+        p6 = regex_engine.compile(r'^root +dispersion +is +(?P<rootdispersion>[\d\.]+)'
             r' +msec, +peer +dispersion +is +(?P<peerdispersion>[\d\.]+) +msec$')
 
         # loopfilter state is 'CTRL' (Normal Controlled Loop), drift is 0.000000000 s/s
-        p7 = re.compile(r'^loopfilter +state +is +(?P<leap_status>[\'\s\w\(\)]+),'
+        p7 = regex_engine.compile(r'^loopfilter +state +is +(?P<leap_status>[\'\s\w\(\)]+),'
             r' +drift +is +(?P<drift>[\d\.\s\w\/\-]+)$')
 
         # system poll interval is 16, last update was 9 sec ago.
-        p8 = re.compile(r'^system +poll +interval +is +(?P<poll>\d+),'
+        p8 = regex_engine.compile(r'^system +poll +interval +is +(?P<poll>\d+),'
             r' +last +update +was +(?P<last_update>[\d\s\w]+).*$')
 
         # system poll interval is 64, never updated
-        p8_1 = re.compile(r'^system +poll +interval +is +(?P<poll>\d+),'
+        p8_1 = regex_engine.compile(r'^system +poll +interval +is +(?P<poll>\d+),'
             r' +never +updated.*$')
 
         for line in out.splitlines():
@@ -521,10 +521,10 @@ class ShowRunningConfigNtp(ShowRunningConfigNtpSchema):
         ret_dict = {}
 
         # peer 10.16.2.2
-        p1 = re.compile(r'^(?P<type>\w+)( +vrf +(?P<vrf>\S+))? +(?P<address>[\d\.]+)$')
+        p1 = regex_engine.compile(r'^(?P<type>\w+)( +vrf +(?P<vrf>\S+))? +(?P<address>[\d\.]+)$')
 
         # source Loopback0
-        p2 = re.compile(r'^source +(?P<intf>\S+)$')
+        p2 = regex_engine.compile(r'^source +(?P<intf>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -31,6 +31,9 @@ from netaddr import IPAddress, IPNetwork, INET_ATON
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==================================================
 # Schema for 'show ospf vrf all-inclusive interface'
@@ -305,95 +308,95 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
         # Mapping dict
         bool_dict = {"up": True, "down": False, "unknown": False}
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Interfaces +for +OSPF +(?P<instance>(\S+))"
             r"(?:, +VRF +(?P<vrf>(\S+)))?$"
         )
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<interface>(\S+)) +is( +administratively)?"
             r" +(?P<enable>(unknown|up|down)), +line +protocol"
             r" +is +(?P<line_protocol>(up|down))$"
         )
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Internet +Address +(?P<address>(\S+)),"
             r" +Area +(?P<area>(\S+))"
             r"(, +(?P<dummy>.+))?$"
         )
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Process +ID +(?P<pid>(\S+))"
             r"(?:, +VRF +(?P<vrf>(\S+)))?"
             r", +Router +ID +(?P<router_id>(\S+))"
             r", +Network +Type +(?P<interface_type>(\S+))"
             r"(?:, +Cost: +(?P<cost>(\d+))( \([A-Z\-]+\))?)?$"
         )
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^Transmit +Delay is +(?P<delay>(\d+)) +sec,"
             r" +State +(?P<state>(\S+)),"
             r"(?: +Priority +(?P<priority>(\d+)),)?"
             r" +MTU +(?P<mtu>(\d+)),"
             r" +MaxPktSz +(?P<max_pkt_sz>(\d+))$"
         )
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Designated +(R|r)outer +\(ID\)"
             r" +(?P<dr_router_id>(\S+)), +(I|i)nterface"
             r" +(A|a)ddress +(?P<dr_ip_addr>(\S+))$"
         )
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Backup +(D|d)esignated +(R|r)outer +\(ID\)"
             r" +(?P<bdr_router_id>(\S+)), +(I|i)nterface"
             r" +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$"
         )
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^Timer +intervals +configured,"
             r" +Hello +(?P<hello>(\d+)),"
             r" +Dead +(?P<dead>(\d+)),"
             r" +Wait +(?P<wait>(\d+)),"
             r" +Retransmit +(?P<retransmit>(\d+))$"
         )
-        p9_1 = re.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
-        p9_2 = re.compile(r"^No +Hellos +\(Passive +interface\)$")
-        p10 = re.compile(
+        p9_1 = regex_engine.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
+        p9_2 = regex_engine.compile(r"^No +Hellos +\(Passive +interface\)$")
+        p10 = regex_engine.compile(
             r"^Index +(?P<index>(\S+)), +flood +queue +length +(?P<length>(\d+))$"
         )
-        p22 = re.compile(r"^Next +(?P<next>(\S+))$")
-        p11 = re.compile(
+        p22 = regex_engine.compile(r"^Next +(?P<next>(\S+))$")
+        p11 = regex_engine.compile(
             r"^Last +flood +scan +length +is +(?P<num>(\d+)),"
             r" +maximum +is +(?P<max>(\d+))$"
         )
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^Last +flood +scan +time +is +(?P<time1>(\d+))"
             r" +msec, +maximum +is +(?P<time2>(\d+)) +msec$"
         )
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^LS +Ack +List: +(?P<ls_ack_list>(\S+)) +length"
             r" +(?P<num>(\d+)), +high +water +mark"
             r" +(?P<num2>(\d+))$"
         )
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^Neighbor +Count +is +(?P<nbr_count>(\d+)),"
             r" +Adjacent +neighbor +count +is"
             r" +(?P<adj_nbr_count>(\d+))$"
         )
-        p15_1 = re.compile(
+        p15_1 = regex_engine.compile(
             r"^Adjacent +with +neighbor +(?P<nbr>(\S+))"
             r" +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$"
         )
-        p15_2 = re.compile(
+        p15_2 = regex_engine.compile(
             r"^Adjacent +with +neighbor +(?P<nbr>(\S+))"
             r" +\((D|d)esignated +(R|r)outer\)$"
         )
-        p15_3 = re.compile(
+        p15_3 = regex_engine.compile(
             r"^Adjacent +with +neighbor +(?P<nbr>(\S+)) +\(Hello suppressed\)$"
         )
-        p16 = re.compile(r"^Suppress +hello +for +(?P<sup>(\d+)) +neighbor\(s\)$")
-        p17 = re.compile(r"^Multi-area +interface +Count +is +(?P<count>(\d+))$")
-        p18 = re.compile(r"^Configured as demand circuit\.$")
-        p19 = re.compile(r"^Run as demand circuit\.$")
-        p20 = re.compile(
+        p16 = regex_engine.compile(r"^Suppress +hello +for +(?P<sup>(\d+)) +neighbor\(s\)$")
+        p17 = regex_engine.compile(r"^Multi-area +interface +Count +is +(?P<count>(\d+))$")
+        p18 = regex_engine.compile(r"^Configured as demand circuit\.$")
+        p19 = regex_engine.compile(r"^Run as demand circuit\.$")
+        p20 = regex_engine.compile(
             r"^DoNotAge +LSA +not +allowed +\(Number +of"
             r" +DCbitless +LSA +is +(?P<num>(\d+))\)\.$"
         )
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^BFD enabled"
             r"(?:, +BFD +interval +(?P<interval>(\d+)) +msec)?"
             r"(?:, +BFD +multiplier +(?P<multi>(\d+)))?"
@@ -1057,55 +1060,55 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
         ret_dict = {}
         af = "ipv4"  # this is ospf - always ipv4
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^Neighbors +for +OSPF +(?P<instance>(\S+))(?:, +VRF +(?P<vrf>(\S+)))?$"
         )
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Neighbor +(?P<neighbor>(\S+)), +interface"
             r" +address +(?P<address>(\S+))$"
         )
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^In +the +area +(?P<area>\S+) +via +interface"
             r" +(?P<interface>\S+)( +, +BFD +(?P<bfd_status>\w+), +Mode: (?P<mode>\w+))?$"
         )
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Neighbor +priority +is +(?P<priority>(\d+)),"
             r" +State +is +(?P<state>(\S+)),"
             r" +(?P<num>(\d+)) +state +changes$"
         )
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^DR +is +(?P<dr_ip_addr>(\S+)) +BDR +is +(?P<bdr_ip_addr>(\S+))$"
         )
-        p6_1 = re.compile(r"^Options +is +(?P<options>(\S+))$")
-        p6_2 = re.compile(r"^LLS +Options +is +(?P<lls_options>(.*))$")
-        p7 = re.compile(r"^Dead +timer +due +in +(?P<dead_timer>(\S+))$")
-        p8 = re.compile(r"^Neighbor +is +up +for +(?P<uptime>(\S+))$")
-        p9 = re.compile(
+        p6_1 = regex_engine.compile(r"^Options +is +(?P<options>(\S+))$")
+        p6_2 = regex_engine.compile(r"^LLS +Options +is +(?P<lls_options>(.*))$")
+        p7 = regex_engine.compile(r"^Dead +timer +due +in +(?P<dead_timer>(\S+))$")
+        p8 = regex_engine.compile(r"^Neighbor +is +up +for +(?P<uptime>(\S+))$")
+        p9 = regex_engine.compile(
             r"^Number +of +DBD +retrans +during +last"
             r" +exchange +(?P<dbd_retrans>(\d+))$"
         )
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^Index +(?P<index>(\S+)) +retransmission +queue"
             r" +length +(?P<ql>(\d+)), +number +of"
             r" +retransmission +(?P<num_retrans>(\d+))$"
         )
-        p11 = re.compile(r"^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$")
-        p12 = re.compile(
+        p11 = regex_engine.compile(r"^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$")
+        p12 = regex_engine.compile(
             r"^Last +retransmission +scan +length +is"
             r" +(?P<num1>(\d+)), +maximum +is"
             r" +(?P<num2>(\d+))$"
         )
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^Last +retransmission +scan +time +is"
             r" +(?P<num1>(\d+)) +msec, +maximum +is"
             r" +(?P<num2>(\d+)) +msec$"
         )
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^LS +Ack +list: +(?P<ls_ack_list>(\S+))"
             r" +pending +(?P<pending>(\d+)), +high +water"
             r" +mark +(?P<mark>(\d+))$"
         )
-        p15 = re.compile(r"^Total +neighbor +count: +(?P<num>(\d+))$")
+        p15 = regex_engine.compile(r"^Total +neighbor +count: +(?P<num>(\d+))$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -1642,224 +1645,224 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
         condition = "always"
         block_name = ""
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process"
             r' +"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))"'
             r" +with +ID +(?P<router_id>(\S+))$"
         )
-        p2 = re.compile(r"^Role *: +(?P<role>([a-zA-z0-9\s]+))$")
-        p3 = re.compile(r"^NSR +\(Non-stop routing\) +is +(?P<nsr>(\S+))$")
-        p3_1 = re.compile(r"^Supports +only +single +TOS(TOS0) routes$")
-        p3_2 = re.compile(r"^Supports +opaque +LSA$")
-        p4 = re.compile(r"^Redistributing +External +Routes +from,$")
-        p4_1 = re.compile(
+        p2 = regex_engine.compile(r"^Role *: +(?P<role>([a-zA-z0-9\s]+))$")
+        p3 = regex_engine.compile(r"^NSR +\(Non-stop routing\) +is +(?P<nsr>(\S+))$")
+        p3_1 = regex_engine.compile(r"^Supports +only +single +TOS(TOS0) routes$")
+        p3_2 = regex_engine.compile(r"^Supports +opaque +LSA$")
+        p4 = regex_engine.compile(r"^Redistributing +External +Routes +from,$")
+        p4_1 = regex_engine.compile(
             r"^(?P<type>(connected|static))(?: +with +metric"
             r" +mapped +to +(?P<metric>(\d+)))?$"
         )
-        p4_2 = re.compile(
+        p4_2 = regex_engine.compile(
             r"^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))(?: +with"
             r" +metric +mapped +to +(?P<metric>(\d+)))?$"
         )
-        p4_3 = re.compile(
+        p4_3 = regex_engine.compile(
             r"^Maximum +number +of +redistributed +prefixes"
             r" +(?P<num_prefix>(\d+))"
             r"(?: +\((?P<warn>(warning-only))\))?"
         )
-        p4_4 = re.compile(r"^Threshold +for +warning +message +(?P<thld>(\d+))\%$")
-        p5_0 = re.compile(
+        p4_4 = regex_engine.compile(r"^Threshold +for +warning +message +(?P<thld>(\d+))\%$")
+        p5_0 = regex_engine.compile(
             r"^It +is +an"
             r"(?: +(?P<abr>(area border)))?"
             r"(?: +and)?"
             r"(?: +(?P<asbr>(autonomous system boundary)))?"
             r" +router$"
         )
-        p5_1 = re.compile(
+        p5_1 = regex_engine.compile(
             r"^Router +is +not +originating +router-LSAs +with +maximum +metric$"
         )
-        p5_2 = re.compile(r"^Originating +router-LSAs +with +maximum +metric$")
-        p5_3 = re.compile(
+        p5_2 = regex_engine.compile(r"^Originating +router-LSAs +with +maximum +metric$")
+        p5_3 = regex_engine.compile(
             r"^Condition:"
             r" +(?P<condition>(always|on switch-over|on start-up|on proc-restart))"
             r"(?: +for +(?P<seconds>(\d+)) +seconds,)?"
             r" +State: +(?P<state>(\S+))$"
         )
-        p5_4 = re.compile(
+        p5_4 = regex_engine.compile(
             r"^Advertise +stub +links +with +maximum +metric +in +router\-LSAs$"
         )
-        p5_5 = re.compile(
+        p5_5 = regex_engine.compile(
             r"^Advertise +summary\-LSAs +with +metric +(?P<metric>(\d+))$"
         )
-        p5_6 = re.compile(
+        p5_6 = regex_engine.compile(
             r"^^Advertise +external\-LSAs +with +metric +(?P<metric>(\d+))$"
         )
-        p6 = re.compile(r"^Initial +SPF +schedule +delay +(?P<time>(\S+)) +msecs$")
-        p7 = re.compile(
+        p6 = regex_engine.compile(r"^Initial +SPF +schedule +delay +(?P<time>(\S+)) +msecs$")
+        p7 = regex_engine.compile(
             r"^Minimum +hold +time +between +two +consecutive"
             r" +SPFs +(?P<time>(\S+)) +msecs$"
         )
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^Maximum +wait +time +between +two +consecutive"
             r" +SPFs +(?P<time>(\S+)) +msecs$"
         )
-        p9 = re.compile(r"^Initial +LSA +throttle +delay +(?P<time>(\S+)) +msecs$")
-        p10 = re.compile(
+        p9 = regex_engine.compile(r"^Initial +LSA +throttle +delay +(?P<time>(\S+)) +msecs$")
+        p10 = regex_engine.compile(
             r"^Minimum +hold +time +for +LSA +throttle +(?P<time>(\S+)) +msecs$"
         )
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^Maximum +wait +time +for +LSA +throttle +(?P<time>(\S+)) +msecs$"
         )
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^Minimum +LSA +interval +(?P<interval>(\S+))"
             r" +msecs. +Minimum +LSA +arrival"
             r" +(?P<arrival>(\S+)) +msecs$"
         )
-        p13 = re.compile(r"^LSA +refresh +interval +(?P<refresh>(\S+)) +seconds$")
-        p14 = re.compile(
+        p13 = regex_engine.compile(r"^LSA +refresh +interval +(?P<refresh>(\S+)) +seconds$")
+        p14 = regex_engine.compile(
             r"^Flood +pacing +interval +(?P<flood>(\d+))"
             r" +msecs\. +Retransmission +pacing +interval"
             r" +(?P<retransmission>(\d+)) +msecs$"
         )
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^Adjacency +stagger +(?P<adj>(\S+)); +initial"
             r" +\(per +area\): +(?P<init>(\d+)),"
             r" +maximum: +(?P<max>(\d+))$"
         )
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^Number +of +neighbors +forming:"
             r" +(?P<form>(\d+)), +(?P<full>(\d+)) +full$"
         )
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"^Maximum +number +of +configured +interfaces +(?P<max>(\d+))$"
         )
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^Number +of +external +LSA +(?P<ext>(\d+))\."
             r" +Checksum +Sum +(?P<checksum>(\S+))$"
         )
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\."
             r" +Checksum +Sum +(?P<checksum>(\S+))$"
         )
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r"^Number +of +DCbitless +external +and +opaque"
             r" +AS +LSA +(?P<num>(\d+))$"
         )
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^Number +of +DoNotAge +external +and +opaque +AS +LSA +(?P<num>(\d+))$"
         )
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r"^Number +of +areas +in +this +router +is"
             r" +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))"
             r" +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))"
             r" +nssa$"
         )
-        p23 = re.compile(r"^External +flood +list +length +(?P<num>(\d+))$")
-        p43 = re.compile(
+        p23 = regex_engine.compile(r"^External +flood +list +length +(?P<num>(\d+))$")
+        p43 = regex_engine.compile(
             r"^LDP +Sync +(?P<sync>(Enabled|Disabled)),"
             r" +Sync +Status: +(?P<status>(.*))$"
         )
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r"^LSD +(?P<lsd>([a-zA-Z\,\s]+)), +revision +(?P<revision>(\d+))$"
         )
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r"^Segment +Routing +Global +Block +default"
             r" +\((?P<sr_block>([0-9\-]+))\),"
             r" +(?P<status>(.*))$"
         )
-        p27 = re.compile(r"^Strict-SPF +capability +is +(?P<state>(\S+))$")
-        p28_1 = re.compile(r"^Area +(?P<area>(\S+))(?: +(inactive|\(Inactive\)))?$")
-        p28_2 = re.compile(
+        p27 = regex_engine.compile(r"^Strict-SPF +capability +is +(?P<state>(\S+))$")
+        p28_1 = regex_engine.compile(r"^Area +(?P<area>(\S+))(?: +(inactive|\(Inactive\)))?$")
+        p28_2 = regex_engine.compile(
             r"^It +is +a +(?P<area_type>(\S+)) +area"
             r"(?:, +(?P<summary>(no +summary +LSA +in +this"
             r" +area)))?$"
         )
-        p28_3 = re.compile(
+        p28_3 = regex_engine.compile(
             r"^generates +stub +default +route +with +cost +(?P<default_cost>(\d+))$"
         )
-        p28_4 = re.compile(r"^Perform +(?P<trans>(\S+)) +LSA +translation$")
-        p28_5 = re.compile(r"^Area ranges are$")
-        p28_6 = re.compile(
+        p28_4 = regex_engine.compile(r"^Perform +(?P<trans>(\S+)) +LSA +translation$")
+        p28_5 = regex_engine.compile(r"^Area ranges are$")
+        p28_6 = regex_engine.compile(
             r"^(?P<prefix>([0-9\.\/]+)) +Passive"
             r" +(?P<advertise>(Advertise|DoNotAdvertise))$"
         )
-        p29 = re.compile(
+        p29 = regex_engine.compile(
             r"^Number +of +interfaces +in +this +area +is +(?P<num_intf>(\d+))$"
         )
-        p30 = re.compile(
+        p30 = regex_engine.compile(
             r"^Area +has +RRR +enabled, +topology +version +(?P<topo_version>(\d+))$"
         )
-        p31 = re.compile(r"^SPF +algorithm +executed +(?P<count>(\d+)) +times$")
-        p32 = re.compile(
+        p31 = regex_engine.compile(r"^SPF +algorithm +executed +(?P<count>(\d+)) +times$")
+        p32 = regex_engine.compile(
             r"^Number +of +LSA +(?P<lsa_count>(\d+))\."
             r" +Checksum +Sum +(?P<checksum_sum>(\S+))$"
         )
-        p33 = re.compile(
+        p33 = regex_engine.compile(
             r"^Number +of opaque +link +LSA"
             r" +(?P<opaque_count>(\d+))\. +Checksum +Sum"
             r" +(?P<checksum_sum>(\S+))$"
         )
-        p34 = re.compile(r"^Number +of +DCbitless +LSA +(?P<count>(\d+))$")
-        p35 = re.compile(r"^Number +of +indication +LSA +(?P<count>(\d+))$")
-        p36 = re.compile(r"^Number +of +DoNotAge +LSA +(?P<count>(\d+))$")
-        p37 = re.compile(r"^Flood +list +length +(?P<len>(\d+))$")
-        p38 = re.compile(
+        p34 = regex_engine.compile(r"^Number +of +DCbitless +LSA +(?P<count>(\d+))$")
+        p35 = regex_engine.compile(r"^Number +of +indication +LSA +(?P<count>(\d+))$")
+        p36 = regex_engine.compile(r"^Number +of +DoNotAge +LSA +(?P<count>(\d+))$")
+        p37 = regex_engine.compile(r"^Flood +list +length +(?P<len>(\d+))$")
+        p38 = regex_engine.compile(
             r"^Number +of +LFA +enabled +interfaces"
             r" +(?P<count>(\d+)), +LFA +revision"
             r" +(?P<revision>(\d+))$"
         )
-        p39 = re.compile(
+        p39 = regex_engine.compile(
             r"^Number +of +Per +Prefix +LFA +enabled +interfaces +(?P<count>(\d+))$"
         )
-        p40 = re.compile(
+        p40 = regex_engine.compile(
             r"^Number +of +neighbors +forming +in +staggered"
             r" +mode +(?P<mode>(\d+)), +(?P<full>(\d+)) +full$"
         )
-        p41 = re.compile(
+        p41 = regex_engine.compile(
             r"^Maximum +number +of +non +self-generated +LSA"
             r" +allowed +(?P<max_lsa>(\d+))$"
         )
-        p42 = re.compile(r"^Non-Stop +Forwarding +enabled$")
+        p42 = regex_engine.compile(r"^Non-Stop +Forwarding +enabled$")
         #  IPFRR per-prefix tiebreakers:
-        p43_2 = re.compile(
+        p43_2 = regex_engine.compile(
             r"^(?P<per_prefix_tiebreakers>\S+) +per-prefix +tiebreakers:$"
         )
         # Name                    Index
-        p44 = re.compile(r"^Name +(?P<name>\S+)$")
+        p44 = regex_engine.compile(r"^Name +(?P<name>\S+)$")
         # No Tunnel (Implicit)    255
-        p45 = re.compile(r"^No +Tunnel +\(Implicit\) +(?P<no_tunnel>\S+)$")
+        p45 = regex_engine.compile(r"^No +Tunnel +\(Implicit\) +(?P<no_tunnel>\S+)$")
         # Node Protection         40
-        p46 = re.compile(r"^Node +Protection +(?P<node_protection>\S+)$")
+        p46 = regex_engine.compile(r"^Node +Protection +(?P<node_protection>\S+)$")
         # Line-card Disjoint      30
-        p47 = re.compile(r"^Line-card +Disjoint +(?P<line_card_disjoint>\S+)$")
+        p47 = regex_engine.compile(r"^Line-card +Disjoint +(?P<line_card_disjoint>\S+)$")
         # Lowest Metric           20
-        p48 = re.compile(r"^Lowest +Metric +(?P<lowest_metric>\S+)$")
+        p48 = regex_engine.compile(r"^Lowest +Metric +(?P<lowest_metric>\S+)$")
         # Primary Path            10
-        p49 = re.compile(r"^Primary +Path +(?P<primary_path>\S+)$")
+        p49 = regex_engine.compile(r"^Primary +Path +(?P<primary_path>\S+)$")
         # Downstream              0
-        p50 = re.compile(r"^Downstream +(?P<downstream>\S+)$")
+        p50 = regex_engine.compile(r"^Downstream +(?P<downstream>\S+)$")
         # Secondary Path          0
-        p51 = re.compile(r"^Secondary +Path +(?P<secondary_path>\S+)$")
+        p51 = regex_engine.compile(r"^Secondary +Path +(?P<secondary_path>\S+)$")
         # SRLG Disjoint           0
-        p52 = re.compile(r"^SRLG +Disjoint +(?P<srlg_disjoint>\S+)$")
+        p52 = regex_engine.compile(r"^SRLG +Disjoint +(?P<srlg_disjoint>\S+)$")
         # Post Convergence Path   0
-        p53 = re.compile(r"^Post +Convergence +Path +(?P<post_convergence_path>\S+)$")
+        p53 = regex_engine.compile(r"^Post +Convergence +Path +(?P<post_convergence_path>\S+)$")
 
         # Current number of non self-generated LSA 4
-        p54 = re.compile(r"^Current number of non self-generated LSA (?P<current_lsa>\d+)$")
+        p54 = regex_engine.compile(r"^Current number of non self-generated LSA (?P<current_lsa>\d+)$")
 
         # Ignore-time 5 minutes, reset-time 10 minutes
-        p55 = re.compile(r"^Ignore-time (?P<ignore_time>\d+) minutes, "
-                         r"reset-time (?P<reset_time>\d+) minutes$")
+        p55 = regex_engine.compile(r"^Ignore-time (?P<ignore_time>\d+) minutes, "
+                                   r"reset-time (?P<reset_time>\d+) minutes$")
 
         # Ignore-count allowed 5, current ignore-count 0
-        p56 = re.compile(r"^Ignore-count allowed (?P<allowed_ignore_count>\d+), "
-                         r"current ignore-count (?P<current_ignore_count>\d+)$")
+        p56 = regex_engine.compile(r"^Ignore-count allowed (?P<allowed_ignore_count>\d+), "
+                                   r"current ignore-count (?P<current_ignore_count>\d+)$")
 
         # Maximum number of external prefixes per router 50000 (suppress-neighbor)
-        p57 = re.compile(r"^Maximum number of external prefixes per router "
-                         r"(?P<max_external_prefix>\d+) \(suppress-neighbor\)$")
+        p57 = regex_engine.compile(r"^Maximum number of external prefixes per router "
+                                   r"(?P<max_external_prefix>\d+) \(suppress-neighbor\)$")
 
         # Warning threshold 75%
-        p58 = re.compile(r"^Warning threshold (?P<warning_threshold>\d+)\%$")
+        p58 = regex_engine.compile(r"^Warning threshold (?P<warning_threshold>\d+)\%$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -2283,7 +2286,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # SNMP trap is enabled
-            p24 = re.compile(r"^SNMP +trap +is +(?P<snmp>(\S+))$")
+            p24 = regex_engine.compile(r"^SNMP +trap +is +(?P<snmp>(\S+))$")
             m = p24.match(line)
             if m:
                 if "enabled" in m.groupdict()["snmp"]:
@@ -2764,7 +2767,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Virtual Links for OSPF 1
             # Sham Links for OSPF 1, VRF VRF1
-            p1 = re.compile(
+            p1 = regex_engine.compile(
                 r"^(Virtual|Sham) +Links +for +OSPF"
                 r" +(?P<instance>([a-zA-Z0-9\s]+))"
                 r"(?:, +VRF +(?P<vrf>(\S+)))?$"
@@ -2799,7 +2802,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Sham Link OSPF_SL0 to address 10.151.22.22 is up
             # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-            p2 = re.compile(
+            p2 = regex_engine.compile(
                 r"^(Virtual|Sham) +Link +(?P<link>(\S+)) +to"
                 r" +(address|router) +(?P<address>(\S+)) +is"
                 r" +(?P<link_state>(up|down))$"
@@ -2818,7 +2821,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                     continue
 
             # Area 1, source address 10.21.33.33
-            p3_1 = re.compile(
+            p3_1 = regex_engine.compile(
                 r"^Area +(?P<area>(\S+)), +source +address"
                 r" +(?P<source_address>(\S+))$"
             )
@@ -2890,7 +2893,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                 continue
 
             # Transit area 1, via interface GigabitEthernet0/0/0/3, Cost of using 65535
-            p3_2 = re.compile(
+            p3_2 = regex_engine.compile(
                 r"^Transit +area +(?P<area>(\S+)),"
                 r"(?: +via +interface +(?P<intf>(\S+)),)?"
                 r" +Cost +of +using +(?P<cost>(\d+))$"
@@ -2967,14 +2970,14 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                 continue
 
             # IfIndex = 2
-            p4 = re.compile(r"^IfIndex += +(?P<if_index>(\d+))$")
+            p4 = regex_engine.compile(r"^IfIndex += +(?P<if_index>(\d+))$")
             m = p4.match(line)
             if m:
                 sub_dict["if_index"] = int(m.groupdict()["if_index"])
                 continue
 
             # Run as demand circuit
-            p5 = re.compile(r"^Run +as +demand +circuit$")
+            p5 = regex_engine.compile(r"^Run +as +demand +circuit$")
             m = p5.match(line)
             if m:
                 if link_type == "sham_links":
@@ -2985,7 +2988,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 1)., Cost of using 111
             # DoNotAge LSA not allowed Run as demand circuit (Number of DCbitless LSA is 1).
-            p6 = re.compile(
+            p6 = regex_engine.compile(
                 r"^DoNotAge +LSA +not +allowed"
                 r"(?: +(?P<demand>(Run +as +demand +circuit)))?"
                 r" +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).,?"
@@ -3007,7 +3010,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Transmit Delay is 7 sec, State POINT_TO_POINT,
             # Transmit Delay is 5 sec, State POINT_TO_POINT,
-            p7 = re.compile(
+            p7 = regex_engine.compile(
                 r"^Transmit +Delay +is +(?P<transmit_delay>(\d+))"
                 r" +sec, +State +(?P<state>(\S+)),?$"
             )
@@ -3021,7 +3024,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
             # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
-            p8 = re.compile(
+            p8 = regex_engine.compile(
                 r"^Timer +intervals +configured,"
                 r" +Hello +(?P<hello>(\d+)),"
                 r" +Dead +(?P<dead>(\d+)),"
@@ -3038,14 +3041,14 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Hello due in 00:00:00:772
             # Hello due in 00:00:03:179
-            p9 = re.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
+            p9 = regex_engine.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
             m = p9.match(line)
             if m:
                 sub_dict["hello_timer"] = str(m.groupdict()["hello_timer"])
                 continue
 
             # Non-Stop Forwarding (NSF) enabled, last NSF restart 00:18:16 ago
-            p10 = re.compile(
+            p10 = regex_engine.compile(
                 r"^Non-Stop +Forwarding +\(NSF\)"
                 r" +(?P<state>(enabled|disabled)), +last +NSF"
                 r" +restart +(?P<restart>(\S+)) +ago$"
@@ -3063,7 +3066,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 
             # Clear text authentication enabled
             # Message digest authentication enabled
-            p11 = re.compile(r"^(?P<auth>([a-zA-Z\s]+)) +authentication +enabled$")
+            p11 = regex_engine.compile(r"^(?P<auth>([a-zA-Z\s]+)) +authentication +enabled$")
             m = p11.match(line)
             if m:
                 auth = str(m.groupdict()["auth"]).lower()
@@ -3077,7 +3080,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
                 continue
 
             # Youngest key id is 1
-            p12 = re.compile(r"^Youngest +key +id +is +(?P<young>(\d+))$")
+            p12 = regex_engine.compile(r"^Youngest +key +id +is +(?P<young>(\d+))$")
             m = p12.match(line)
             if m:
                 if "authentication" not in sub_dict:
@@ -3330,39 +3333,39 @@ class ShowOspfMplsTrafficEngLink(ShowOspfMplsTrafficEngLinkSchema):
         ret_dict = {}
         af = "ipv4"
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)"
             r" +\(Process +ID +(?P<instance>(\S+))\)$"
         )
-        p2_1 = re.compile(
+        p2_1 = regex_engine.compile(
             r"^Area +(?P<area>(\S+)) +has"
             r" +(?P<total_links>(\d+)) +MPLS +TE links\."
             r" +Area +instance +is +(?P<instance>(\d+))\.$"
         )
-        p2_2 = re.compile(r"^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$")
-        p3 = re.compile(
+        p2_2 = regex_engine.compile(r"^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$")
+        p3 = regex_engine.compile(
             r"^Link +is +associated +with +fragment"
             r" +(?P<fragment>(\d+))\. +Link +instance +is"
             r" +(?P<link_instance>(\d+))$"
         )
-        p4 = re.compile(r"^Link +connected +to +(?P<net>(\S+)) +network$")
-        p5 = re.compile(r"^Link +ID *: +(?P<link_id>(\S+))$")
-        p6 = re.compile(r"^Interface +Address *: +(?P<address>(\S+))$")
-        p7 = re.compile(r"^Admin +Metric *: +TE *: +(?P<metric>(\d+))$")
-        p8 = re.compile(r"^Maximum +bandwidth *: +(?P<max_band>(\d+))$")
-        p9 = re.compile(
+        p4 = regex_engine.compile(r"^Link +connected +to +(?P<net>(\S+)) +network$")
+        p5 = regex_engine.compile(r"^Link +ID *: +(?P<link_id>(\S+))$")
+        p6 = regex_engine.compile(r"^Interface +Address *: +(?P<address>(\S+))$")
+        p7 = regex_engine.compile(r"^Admin +Metric *: +TE *: +(?P<metric>(\d+))$")
+        p8 = regex_engine.compile(r"^Maximum +bandwidth *: +(?P<max_band>(\d+))$")
+        p9 = regex_engine.compile(
             r"^Maximum +global +pool +reservable +bandwidth *:"
             r" +(?P<max_reserve_band>(\d+))$"
         )
-        p15 = re.compile(r"^Number +of +Priority *: +(?P<priority>(\d+))$")
-        p10 = re.compile(
+        p15 = regex_engine.compile(r"^Number +of +Priority *: +(?P<priority>(\d+))$")
+        p10 = regex_engine.compile(
             r"^Priority +(?P<priority1>(\d+)) *: +(?P<band1>(\d+))"
             r" *Priority +(?P<priority2>(\d+)) *: +(?P<band2>(\d+))$"
         )
-        p11 = re.compile(r"^Out +Interface +ID *: +(?P<out_id>(\d+))$")
-        p12 = re.compile(r"^Affinity +Bit *: +(?P<affinity>(\S+))$")
-        p13 = re.compile(r"^Extended +Admin +Group *: +(?P<eag>(\d+))$")
-        p14 = re.compile(r"^EAG\[(?P<group_num>(\d+))\]: +(?P<value>(\d+))$")
+        p11 = regex_engine.compile(r"^Out +Interface +ID *: +(?P<out_id>(\d+))$")
+        p12 = regex_engine.compile(r"^Affinity +Bit *: +(?P<affinity>(\S+))$")
+        p13 = regex_engine.compile(r"^Extended +Admin +Group *: +(?P<eag>(\d+))$")
+        p14 = regex_engine.compile(r"^EAG\[(?P<group_num>(\d+))\]: +(?P<value>(\d+))$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -3683,181 +3686,181 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
             "opaque": 10,
         }
 
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)"
             r" +\(Process +ID +(?P<instance>(\S+))"
             r"(?:, +VRF +(?P<vrf>(\S+)))?\)$"
         )
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<lsa_type_name>(.*)) +Link +States"
             r"(?: +\(Area +(?P<area>(\S+))\))?$"
         )
-        p3_1 = re.compile(r"^Routing +Bit +Set +on +this +LSA$")
-        p3_2 = re.compile(r"^LS +age: +(?P<age>(\d+))$")
-        p4 = re.compile(
+        p3_1 = regex_engine.compile(r"^Routing +Bit +Set +on +this +LSA$")
+        p3_2 = regex_engine.compile(r"^LS +age: +(?P<age>(\d+))$")
+        p4 = regex_engine.compile(
             r"^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?"
             r"(?: *\((?P<option_desc>(.*))\))?$"
         )
-        p5_1 = re.compile(r"^LS +Type: +(?P<lsa_type>(.*))$")
-        p5_2 = re.compile(r"^Link +State +ID: +(?P<lsa_id>(\S+))(?: +\(.*\))?$")
-        p6 = re.compile(r"^Advertising +Router: +(?P<adv_router>(\S+))$")
-        p7 = re.compile(r"^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$")
-        p8 = re.compile(r"^Checksum: +(?P<checksum>(\S+))$")
-        p9 = re.compile(r"^Length: +(?P<length>(\d+))$")
-        p10 = re.compile(r"^Network +Mask: +\/(?P<net_mask>(\S+))$")
-        p11_1 = re.compile(r"^Metric +Type: +2 +\(.*\)$")
-        p11_2 = re.compile(r"^Metric +Type: +1 +\(.*\)$")
-        p12 = re.compile(
+        p5_1 = regex_engine.compile(r"^LS +Type: +(?P<lsa_type>(.*))$")
+        p5_2 = regex_engine.compile(r"^Link +State +ID: +(?P<lsa_id>(\S+))(?: +\(.*\))?$")
+        p6 = regex_engine.compile(r"^Advertising +Router: +(?P<adv_router>(\S+))$")
+        p7 = regex_engine.compile(r"^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$")
+        p8 = regex_engine.compile(r"^Checksum: +(?P<checksum>(\S+))$")
+        p9 = regex_engine.compile(r"^Length: +(?P<length>(\d+))$")
+        p10 = regex_engine.compile(r"^Network +Mask: +\/(?P<net_mask>(\S+))$")
+        p11_1 = regex_engine.compile(r"^Metric +Type: +2 +\(.*\)$")
+        p11_2 = regex_engine.compile(r"^Metric +Type: +1 +\(.*\)$")
+        p12 = regex_engine.compile(
             r"^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?: +(?P<metric>(\d+)))?$"
         )
-        p13 = re.compile(r"^Metric: +(?P<metric>(\d+))$")
-        p14 = re.compile(r"^Forward +Address: +(?P<addr>(\S+))$")
-        p15 = re.compile(r"^External +Route +Tag: +(?P<tag>(\d+))$")
-        p16 = re.compile(r"^Attached +Router: +(?P<att_router>(\S+))$")
+        p13 = regex_engine.compile(r"^Metric: +(?P<metric>(\d+))$")
+        p14 = regex_engine.compile(r"^Forward +Address: +(?P<addr>(\S+))$")
+        p15 = regex_engine.compile(r"^External +Route +Tag: +(?P<tag>(\d+))$")
+        p16 = regex_engine.compile(r"^Attached +Router: +(?P<att_router>(\S+))$")
 
         # Number of Links : 1
         # Number of Links: 3
-        p17 = re.compile(r"^Number +of +(l|L)inks *: +(?P<num>(\d+))$")
-        p18 = re.compile(r"^Link +connected +to: +a +(?P<type>(.*))$")
-        p18_1 = re.compile(r"^Link +connected +to: +(?P<type>(.*))$")
-        p19_1 = re.compile(
+        p17 = regex_engine.compile(r"^Number +of +(l|L)inks *: +(?P<num>(\d+))$")
+        p18 = regex_engine.compile(r"^Link +connected +to: +a +(?P<type>(.*))$")
+        p18_1 = regex_engine.compile(r"^Link +connected +to: +(?P<type>(.*))$")
+        p19_1 = regex_engine.compile(
             r"^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber: +(?P<link_id>(\S+))$"
         )
-        p19_2 = re.compile(
+        p19_2 = regex_engine.compile(
             r"^\(Link +ID\) +(D|d)esignated +(R|r)outer"
             r" +(a|A)ddress: +(?P<link_id>(\S+))$"
         )
-        p19_3 = re.compile(
+        p19_3 = regex_engine.compile(
             r"^\(Link +ID\) +(N|n)eighboring +(R|r)outer"
             r" +(I|d)D: +(?P<link_id>(\S+))$"
         )
-        p20_1 = re.compile(r"^\(Link +Data\) +Network +Mask: +(?P<link_data>(\S+))$")
-        p20_2 = re.compile(
+        p20_1 = regex_engine.compile(r"^\(Link +Data\) +Network +Mask: +(?P<link_data>(\S+))$")
+        p20_2 = regex_engine.compile(
             r"^\(Link +Data\) +Router +Interface +address: +(?P<link_data>(\S+))$"
         )
-        p21 = re.compile(r"^Number +of +TOS +metrics: +(?P<num>(\d+))$")
-        p22 = re.compile(r"^Opaque +Type: +(?P<type>(\d+))$")
-        p23 = re.compile(r"^Opaque +ID: +(?P<id>(\d+))$")
-        p24 = re.compile(r"^Fragment +number: +(?P<num>(\d+))$")
-        p25 = re.compile(r"^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$")
-        p26_1 = re.compile(r"^AS +Boundary +Router$")
-        p26_2 = re.compile(r"^Area +Border +Router$")
-        p27 = re.compile(r"^Link +connected +to +(?P<link>(.*))$")
-        p28 = re.compile(r"^Link +ID *: +(?P<id>(\S+))$")
-        p29 = re.compile(r"^Interface +Address *: +(?P<addr>(\S+))$")
-        p30 = re.compile(r"^Admin +Metric *: +(?P<te_metric>(\d+))$")
-        p31 = re.compile(r"^Maximum +(B|b)andwidth *: +(?P<max_band>(\d+))$")
-        p32 = re.compile(
+        p21 = regex_engine.compile(r"^Number +of +TOS +metrics: +(?P<num>(\d+))$")
+        p22 = regex_engine.compile(r"^Opaque +Type: +(?P<type>(\d+))$")
+        p23 = regex_engine.compile(r"^Opaque +ID: +(?P<id>(\d+))$")
+        p24 = regex_engine.compile(r"^Fragment +number: +(?P<num>(\d+))$")
+        p25 = regex_engine.compile(r"^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$")
+        p26_1 = regex_engine.compile(r"^AS +Boundary +Router$")
+        p26_2 = regex_engine.compile(r"^Area +Border +Router$")
+        p27 = regex_engine.compile(r"^Link +connected +to +(?P<link>(.*))$")
+        p28 = regex_engine.compile(r"^Link +ID *: +(?P<id>(\S+))$")
+        p29 = regex_engine.compile(r"^Interface +Address *: +(?P<addr>(\S+))$")
+        p30 = regex_engine.compile(r"^Admin +Metric *: +(?P<te_metric>(\d+))$")
+        p31 = regex_engine.compile(r"^Maximum +(B|b)andwidth *: +(?P<max_band>(\d+))$")
+        p32 = regex_engine.compile(
             r"^Maximum +(R|r)eservable +(B|b)andwidth"
             r"(?: +global)? *: +(?P<max_res_band>(\d+))$"
         )
-        p33 = re.compile(r"^Affinity +Bit *: +(?P<admin_group>(\S+))$")
-        p33_1 = re.compile(r"^IGP +Metric *: +(?P<igp_metric>(\d+))$")
-        p33_2 = re.compile(r"^Number +of +Priority *: +(?P<num>(\d+))$")
-        p34 = re.compile(
+        p33 = regex_engine.compile(r"^Affinity +Bit *: +(?P<admin_group>(\S+))$")
+        p33_1 = regex_engine.compile(r"^IGP +Metric *: +(?P<igp_metric>(\d+))$")
+        p33_2 = regex_engine.compile(r"^Number +of +Priority *: +(?P<num>(\d+))$")
+        p34 = regex_engine.compile(
             r"^Priority +(?P<num1>(\d+)) *:"
             r" +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))"
             r" *: +(?P<band2>(\d+)))?$"
         )
-        p35 = re.compile(
+        p35 = regex_engine.compile(
             r"^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),"
             r" +Length += +(?P<length>(\d+))"
             r" +Value += +(?P<value>(.*))$"
         )
-        p36 = re.compile(
+        p36 = regex_engine.compile(
             r"^Extended +Administrative +Group *: +Length *: +(?P<eag_length>(\d+))$"
         )
-        p37 = re.compile(r"^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$")
+        p37 = regex_engine.compile(r"^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$")
 
         # --regex for opaque-- #
         # Router Information TLV: Length: 4
-        p38 = re.compile(r"^Router +Information +TLV: +Length: +(?P<length>\d+)$")
+        p38 = regex_engine.compile(r"^Router +Information +TLV: +Length: +(?P<length>\d+)$")
 
         # Capabilities:
         #   Graceful Restart Helper Capable
-        p39 = re.compile(r"^Graceful +Restart +Helper +Capable$")
+        p39 = regex_engine.compile(r"^Graceful +Restart +Helper +Capable$")
 
         #   Stub Router Capable
-        p40 = re.compile(r"^Stub +Router +Capable$")
+        p40 = regex_engine.compile(r"^Stub +Router +Capable$")
 
         #   All capability bits: 0x60000000
-        p41 = re.compile(r"^All +capability +bits: +(?P<bits>\w+)$")
+        p41 = regex_engine.compile(r"^All +capability +bits: +(?P<bits>\w+)$")
 
         # Segment Routing Algorithm TLV: Length: 2
-        p42 = re.compile(
+        p42 = regex_engine.compile(
             r"^Segment +Routing +Algorithm +TLV: +Length: +(?P<length>\d+)$"
         )
 
         #   Algorithm: 0
         #   Algorithm: 1
-        p43 = re.compile(r"^Algorithm: +(?P<algo>\d+)$")
+        p43 = regex_engine.compile(r"^Algorithm: +(?P<algo>\d+)$")
 
         # Segment Routing Range TLV: Length: 12
-        p44 = re.compile(r"^Segment +Routing +Range +TLV: +Length: +(?P<length>\d+)$")
+        p44 = regex_engine.compile(r"^Segment +Routing +Range +TLV: +Length: +(?P<length>\d+)$")
 
         #   Range Size: 65535
-        p45 = re.compile(r"^Range +Size: +(?P<range_size>\d+)$")
+        p45 = regex_engine.compile(r"^Range +Size: +(?P<range_size>\d+)$")
 
         #     SID sub-TLV: Length 3
         #     SID sub-TLV: Length: 8
-        p46 = re.compile(r"^(?P<type>[\S\s]+) +sub-TLV: +Length:? +(?P<length>\d+)$")
+        p46 = regex_engine.compile(r"^(?P<type>[\S\s]+) +sub-TLV: +Length:? +(?P<length>\d+)$")
 
         #      Label: 16000
-        p47 = re.compile(r"^Label *: +(?P<label>\d+)$")
+        p47 = regex_engine.compile(r"^Label *: +(?P<label>\d+)$")
 
         # Node MSD TLV: Length: 2
-        p48 = re.compile(r"^Node MSD TLV: +Length: +(?P<length>\d+)$")
+        p48 = regex_engine.compile(r"^Node MSD TLV: +Length: +(?P<length>\d+)$")
 
         #     Type: 1, Value 10
-        p49 = re.compile(r"^Type: +(?P<type>\d+), +Value +(?P<value>\d+)$")
+        p49 = regex_engine.compile(r"^Type: +(?P<type>\d+), +Value +(?P<value>\d+)$")
 
         # Segment Routing Local Block TLV: Length: 12
-        p50 = re.compile(
+        p50 = regex_engine.compile(
             r"^Segment +Routing +Local +Block +TLV: +Length: +(?P<length>\d+)$"
         )
 
         # Extended Prefix Range TLV: Length: 24
         # Extended Prefix TLV: Length: 24
-        p51 = re.compile(r"^Extended +Prefix +(Range +)?TLV: +Length: +(?P<length>\d+)$")
+        p51 = regex_engine.compile(r"^Extended +Prefix +(Range +)?TLV: +Length: +(?P<length>\d+)$")
 
         #   AF        : 0
-        p52 = re.compile(r"^AF *: +(?P<af>\d+)$")
+        p52 = regex_engine.compile(r"^AF *: +(?P<af>\d+)$")
 
         #   Prefix    : 10.246.254.0/32
-        p53 = re.compile(r"^Prefix *: +(?P<prefix>\S+)$")
+        p53 = regex_engine.compile(r"^Prefix *: +(?P<prefix>\S+)$")
 
         #   Flags     : 0x0
-        p54 = re.compile(r"^Flags *: +(?P<flags>\S+)$")
+        p54 = regex_engine.compile(r"^Flags *: +(?P<flags>\S+)$")
 
         #     MTID      : 0
-        p55 = re.compile(r"^MTID *: +(?P<mt_id>\d+)$")
+        p55 = regex_engine.compile(r"^MTID *: +(?P<mt_id>\d+)$")
 
         #     Algo      : 0
-        p56 = re.compile(r"^Algo *: +(?P<algo>\d+)$")
+        p56 = regex_engine.compile(r"^Algo *: +(?P<algo>\d+)$")
 
         #     SID Index : 1028
-        p57 = re.compile(r"^SID +Index *: +(?P<sid_index>\d+)$")
+        p57 = regex_engine.compile(r"^SID +Index *: +(?P<sid_index>\d+)$")
 
         # Extended Link TLV: Length: 76
-        p58 = re.compile(r"^Extended +Link +TLV: +Length: +(?P<length>\d+)$")
+        p58 = regex_engine.compile(r"^Extended +Link +TLV: +Length: +(?P<length>\d+)$")
 
         #   Link-type : 1
-        p59 = re.compile(r"^Link-type *: +(?P<link_type>\d+)$")
+        p59 = regex_engine.compile(r"^Link-type *: +(?P<link_type>\d+)$")
 
         #   Link Data : 172.16.0.91
-        p60 = re.compile(r"^Link +Data *: +(?P<link_data>\S+)$")
+        p60 = regex_engine.compile(r"^Link +Data *: +(?P<link_data>\S+)$")
 
         #     Weight    : 0
-        p61 = re.compile(r"^Weight *: +(?P<weight>\d+)$")
+        p61 = regex_engine.compile(r"^Weight *: +(?P<weight>\d+)$")
 
         #     Local Interface ID: 78
-        p62 = re.compile(r"^Local +Interface +ID *: +(?P<local_id>\d+)$")
+        p62 = regex_engine.compile(r"^Local +Interface +ID *: +(?P<local_id>\d+)$")
 
         #     Remote Interface ID: 76
-        p63 = re.compile(r"^Remote +Interface +ID *: +(?P<remote_id>\d+)$")
+        p63 = regex_engine.compile(r"^Remote +Interface +ID *: +(?P<remote_id>\d+)$")
 
         #     Neighbor Address: 172.16.0.90
-        p64 = re.compile(r"^Neighbor +Address *: +(?P<nbr_addr>\S+)$")
+        p64 = regex_engine.compile(r"^Neighbor +Address *: +(?P<nbr_addr>\S+)$")
 
         for line in out.splitlines():
             line = line.strip()
@@ -5511,31 +5514,31 @@ class ShowOspfDatabase(ShowOspfDatabaseSchema):
         parsed_dict = {}
 
         #OSPF Router with ID (10.94.1.1) (Process ID mpls1)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\) '
-                        r'+\(Process +ID +(?P<instance>(\S+))(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = regex_engine.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\) '
+                                  r'+\(Process +ID +(?P<instance>(\S+))(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
         #Router Link States (Area 0)
         #Type-10 Opaque Link Area Link States (Area 0)
-        p2 = re.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States +\(Area'
-                        r' +(?P<area>(\S+))\)$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States +\(Area'
+                                  r' +(?P<area>(\S+))\)$')
 
         #10.94.1.1       10.94.1.1       86          0x800080ff 0x0043de 5
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<link_id>[\w\.]+)\s+(?P<adv_router>[\w\.]+)\s+(?P<age>[\w]+)\s+"
             r"(?P<seq_num>[\w]+)\s+(?P<checksum>[\w]+)\s(?P<link_count>[\w]+)$")
 
         #10.1.0.0         10.94.1.1       54          0x8003b136     0x009cb2        0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^(?P<link_id>[\w\.]+)\s+(?P<adv_router>[\w\.]+)\s+(?P<age>[\w]+)"
             r"\s+(?P<seq_num>[\w]+)\s+(?P<checksum>[\w]+)\s+(?P<opaque_id>[\w]+)$")
 
         #60.111.3.0      50.1.1.2        292         0x800000f9 0x00471a
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^(?P<link_id>[\w\.]+)\s+(?P<adv_router>[\w\.]+)\s+(?P<age>[\w]+)\s+"
             r"(?P<seq_num>[\w]+)\s+(?P<checksum>[\w]+)$")
 
         # Type-5 AS External Link States
-        p6 = re.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States$')
+        p6 = regex_engine.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States$')
 
 
         for line in output.splitlines():
@@ -5794,24 +5797,24 @@ class ShowOspfNeighbor(ShowOspfNeighborSchema):
 
 
         # Neighbors for OSPF
-        p1 = re.compile(r'^Neighbors +for +OSPF')
+        p1 = regex_engine.compile(r'^Neighbors +for +OSPF')
         # Neighbors for OSPFv3 mpls1
-        p1_1 = re.compile(r'^Neighbors +for +OSPF\w* +(?P<process_name>\w+)$')
+        p1_1 = regex_engine.compile(r'^Neighbors +for +OSPF\w* +(?P<process_name>\w+)$')
         # Neighbors for OSPFv3 mpls1, VRF 1
-        p1_2 = re.compile(r'Neighbors +for +OSPF\w* +(?P<process_name>\w+), VRF +(?P<vrf>\S+)')
+        p1_2 = regex_engine.compile(r'Neighbors +for +OSPF\w* +(?P<process_name>\w+), VRF +(?P<vrf>\S+)')
 
         # Neighbor ID     Pri   State           Dead Time   Address         Interface
         # 100.100.100.100 1     FULL/  -        00:00:38    100.10.0.2      GigabitEthernet0/0/0/0
         # 95.95.95.95     1     FULL/  -        00:00:38    100.20.0.2      GigabitEthernet0/0/0/1
         # 192.168.199.137 1    FULL/DR       0:00:31    172.31.80.37      GigabitEthernet 0/3/0/2
-        p2 = re.compile(r'^(?P<neighbor_id>\S+)\s+(?P<priority>\d+) +(?P<state>[A-Z]+/\s*[A-Z-]*)'
-                        r' +(?P<dead_time>(\d+:){2}\d+) +(?P<address>[\d\.\/]+) +(?P<interface>\w+\s*\S+)$')
+        p2 = regex_engine.compile(r'^(?P<neighbor_id>\S+)\s+(?P<priority>\d+) +(?P<state>[A-Z]+/\s*[A-Z-]*)'
+                                  r' +(?P<dead_time>(\d+:){2}\d+) +(?P<address>[\d\.\/]+) +(?P<interface>\w+\s*\S+)$')
 
         # Neighbor is up for 2d18h
-        p3 = re.compile(r'^Neighbor +is +up +for +(?P<up_time>\S+)$')
+        p3 = regex_engine.compile(r'^Neighbor +is +up +for +(?P<up_time>\S+)$')
 
         # Total neighbor count: 2
-        p4 = re.compile(r'^Total +neighbor +count: +(?P<total_neighbor_count>\S+)$')
+        p4 = regex_engine.compile(r'^Total +neighbor +count: +(?P<total_neighbor_count>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5960,7 +5963,7 @@ class ShowOspfInterfaceBrief(ShowOspfInterfaceBriefSchema):
         ret_dict = {}
 
         # Lo0                mpls1 0               17.17.17.17/32     1     LOOP  0/0
-        p1 = re.compile(r'^(?P<interface>\S+) +(?P<pid>\S+) +(?P<area>\S+) +'
+        p1 = regex_engine.compile(r'^(?P<interface>\S+) +(?P<pid>\S+) +(?P<area>\S+) +'
             r'(?P<ip_addr>\S+) +(?P<cost>[0-9]+) +(?P<state>\S+) +(?P<nbrs_count>[0-9]+)\/(?P<nbrs_f>[0-9]+).*$')
 
         for line in out.splitlines():
@@ -6160,122 +6163,122 @@ class ShowOspfInterface(ShowOspfInterfaceSchema):
             vrfs_dict = ret_dict.setdefault('vrf', {})
 
         # Interfaces for OSPF mpls1
-        p1 = re.compile(r'^Interfaces +for +OSPF +(?P<ospf_instance>\S+)$')
+        p1 = regex_engine.compile(r'^Interfaces +for +OSPF +(?P<ospf_instance>\S+)$')
 
         # Interfaces for OSPF 1, VRF VRF1
-        p2 = re.compile(r'^Interfaces +for +OSPF +(?P<ospf_instance>\S+), +VRF +(?P<vrf_name>\S+)$')
+        p2 = regex_engine.compile(r'^Interfaces +for +OSPF +(?P<ospf_instance>\S+), +VRF +(?P<vrf_name>\S+)$')
 
         # Loopback0 is up, line protocol is up
-        p3 = re.compile(r'^(?P<interface>\S+) +is +(?P<interface_enable>unknown|up|down|administratively down), +line +protocol +is +'
-                        r'(?P<line_protocol>up|down)$')
+        p3 = regex_engine.compile(r'^(?P<interface>\S+) +is +(?P<interface_enable>unknown|up|down|administratively down), +line +protocol +is +'
+                                  r'(?P<line_protocol>up|down)$')
 
         # Internet Address 10.36.3.3/32, Area 0
-        p4 = re.compile(r'^Internet +Address +(?P<ip_address>(\d+.){3}\d+/\d+), +Area +(?P<area>\w+)')
+        p4 = regex_engine.compile(r'^Internet +Address +(?P<ip_address>(\d+.){3}\d+/\d+), +Area +(?P<area>\w+)')
         
         # Internet Address 25.97.1.1/32, Area 0, SID 0, Strict-SPF SID 0
-        p4_1 = re.compile(r'^Internet +Address +(?P<ip_address>(\d+.){3}\d+/\d+), +Area +(?P<area>\w+), +SID +'
-                          r'(?P<sid>\d+), +Strict-SPF +SID +(?P<strict_spf_sid>\d+)$')
+        p4_1 = regex_engine.compile(r'^Internet +Address +(?P<ip_address>(\d+.){3}\d+/\d+), +Area +(?P<area>\w+), +SID +'
+                                    r'(?P<sid>\d+), +Strict-SPF +SID +(?P<strict_spf_sid>\d+)$')
 
         # Process ID 1, Router ID 10.36.3.3, Network Type LOOPBACK, Cost: 1
-        p5 = re.compile(r'^Process +ID +(?P<process_id>\w+), +Router +ID +(?P<router_id>(\d+.){3}\d+), +'
-                        r'Network +Type +(?P<interface_type>\w+)(, +Cost: +(?P<cost>\d+))?$')
+        p5 = regex_engine.compile(r'^Process +ID +(?P<process_id>\w+), +Router +ID +(?P<router_id>(\d+.){3}\d+), +'
+                                  r'Network +Type +(?P<interface_type>\w+)(, +Cost: +(?P<cost>\d+))?$')
 
         # Transmit Delay is 1 sec, State BDR, Priority 1, MTU 1500, MaxPktSz 1500
         # Transmit Delay is 1 sec, State POINT_TO_POINT, MTU 1500, MaxPktSz 1500
         # Transmit Delay is 1 sec, State POINT_TO_POINT,
-        p6 = re.compile(r'Transmit +Delay +is +(?P<transmit_delay>\d+) +sec, +State +(?P<state>\S+),'
-                        r'((( +(Priority +(?P<priority>\w+),)|) +MTU +(?P<mtu>\d+), +MaxPktSz +(?P<max_pkt_sz>\d+))|)$')
+        p6 = regex_engine.compile(r'Transmit +Delay +is +(?P<transmit_delay>\d+) +sec, +State +(?P<state>\S+),'
+                                  r'((( +(Priority +(?P<priority>\w+),)|) +MTU +(?P<mtu>\d+), +MaxPktSz +(?P<max_pkt_sz>\d+))|)$')
 
         # Designated Router (ID) 10.64.4.4, Interface address 10.3.4.4
-        p7 = re.compile(r'^Designated +(R|r)outer +\(ID\) +(?P<dr_router_id>(\S+)), +(I|i)nterface +(A|a)ddress +'
-                        r'(?P<dr_ip_addr>(\S+))$')
+        p7 = regex_engine.compile(r'^Designated +(R|r)outer +\(ID\) +(?P<dr_router_id>(\S+)), +(I|i)nterface +(A|a)ddress +'
+                                  r'(?P<dr_ip_addr>(\S+))$')
 
         # Backup Designated router (ID) 10.36.3.3, Interface address 10.3.4.3
-        p8 = re.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\) +(?P<bdr_router_id>(\S+)), +(I|i)nterface +'
-                        r'(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
+        p8 = regex_engine.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\) +(?P<bdr_router_id>(\S+)), +(I|i)nterface +'
+                                  r'(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
 
         # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-        p9 = re.compile(r'^Timer +intervals +configured, +Hello +(?P<hello>(\d+)), +Dead +(?P<dead>(\d+)), +Wait +'
-                        r'(?P<wait>(\d+)), +Retransmit +(?P<retransmit>(\d+))$')
+        p9 = regex_engine.compile(r'^Timer +intervals +configured, +Hello +(?P<hello>(\d+)), +Dead +(?P<dead>(\d+)), +Wait +'
+                                  r'(?P<wait>(\d+)), +Retransmit +(?P<retransmit>(\d+))$')
 
         # Hello due in 00:00:07:171
-        p10_1 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p10_1 = regex_engine.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
         
         # No Hellos (Passive interface)
-        p10_2 = re.compile(r"^No +Hellos +\(Passive +interface\)$")
+        p10_2 = regex_engine.compile(r"^No +Hellos +\(Passive +interface\)$")
 
         # Index 1/1, flood queue length 0
-        p11 = re.compile(r'^Index +(?P<index>(\S+)), +flood +queue +length +(?P<length>(\d+))$')
+        p11 = regex_engine.compile(r'^Index +(?P<index>(\S+)), +flood +queue +length +(?P<length>(\d+))$')
 
         # Next 0(0)/0(0)
-        p12 = re.compile(r'^Next +(?P<next>(\S+))$')
+        p12 = regex_engine.compile(r'^Next +(?P<next>(\S+))$')
 
         # Last flood scan length is 1, maximum is 3
-        p13 = re.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)), +maximum +is +(?P<max>(\d+))$')
+        p13 = regex_engine.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)), +maximum +is +(?P<max>(\d+))$')
 
         # Last flood scan time is 0 msec, maximum is 0 msec
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r'^Last +flood +scan +time +is +(?P<time1>(\d+)) +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
 
         # LS Ack List: current length 0, high water mark 5
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r'^LS +Ack +List: +(?P<ls_ack_list>(\S+)) +length +(?P<num>(\d+)), +high +water +mark +(?P<num2>(\d+))$')
 
         # Neighbor Count is 1, Adjacent neighbor count is 1
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r'^Neighbor +Count +is +(?P<nbr_count>(\d+)), +Adjacent +neighbor +count +is +(?P<adj_nbr_count>(\d+))$')
 
         # Adjacent with neighbor 10.64.4.4  (Designated Router)
         # Adjacent with neighbor 10.16.2.2  (Backup Designated Router)
         # Adjacent with neighbor 101.3.3.3
-        p17 = re.compile(r'^Adjacent +with +neighbor +(?P<neighbors_router_id>(\S+))')
+        p17 = regex_engine.compile(r'^Adjacent +with +neighbor +(?P<neighbors_router_id>(\S+))')
 
         # Suppress hello for 0 neighbor(s)
-        p18 = re.compile(r'^Suppress +hello +for +(?P<sup>(\d+)) +neighbor\(s\)$')
+        p18 = regex_engine.compile(r'^Suppress +hello +for +(?P<sup>(\d+)) +neighbor\(s\)$')
 
         # Multi-area interface Count is 0
-        p19 = re.compile(r'^Multi-area +interface +Count +is +(?P<count>(\d+))$')
+        p19 = regex_engine.compile(r'^Multi-area +interface +Count +is +(?P<count>(\d+))$')
 
         # Label stack Primary label 0 Backup label 0 SRTE label 0
-        p20 = re.compile(r'^Label stack +Primary +label +(?P<primary_label>\d+) +Backup +label +'
-                         r'(?P<backup_label>\d+) +SRTE +label +(?P<srte_label>\d+)$')
+        p20 = regex_engine.compile(r'^Label stack +Primary +label +(?P<primary_label>\d+) +Backup +label +'
+                                   r'(?P<backup_label>\d+) +SRTE +label +(?P<srte_label>\d+)$')
 
         # Forward reference No, Unnumbered no,  Bandwidth 1000000
-        p21 = re.compile(r'^Forward +reference +(?P<forward_reference>\w+), +Unnumbered +'
-                         r'(?P<unnumbered_bool>\w+), +Bandwidth +(?P<bandwidth>\S+)$')
+        p21 = regex_engine.compile(r'^Forward +reference +(?P<forward_reference>\w+), +Unnumbered +'
+                                   r'(?P<unnumbered_bool>\w+), +Bandwidth +(?P<bandwidth>\S+)$')
 
         # BFD enabled, BFD interval 150 msec, BFD multiplier 3, Mode: Default
-        p22 = re.compile(r'^BFD enabled(?:, +BFD +interval +(?P<interval>(\d+)) +msec)?(?:, +BFD +multiplier +('
-                         r'?P<multi>(\d+)))?(?:, +Mode: +(?P<mode>(\S+)))?$')
+        p22 = regex_engine.compile(r'^BFD enabled(?:, +BFD +interval +(?P<interval>(\d+)) +msec)?(?:, +BFD +multiplier +('
+                                   r'?P<multi>(\d+)))?(?:, +Mode: +(?P<mode>(\S+)))?$')
 
         # Non-Stop Forwarding (NSF) enabled
-        p23 = re.compile(r'^Non-Stop +Forwarding +\(NSF\) +(?P<nsf_status>\w+)$')
+        p23 = regex_engine.compile(r'^Non-Stop +Forwarding +\(NSF\) +(?P<nsf_status>\w+)$')
 
         # Adjacent with neighbor 100.100.100.100
-        p24 = re.compile(r'^Adjacent +with +neighbor +(?P<neighbors_dr_router_id>(\S+))$')
+        p24 = regex_engine.compile(r'^Adjacent +with +neighbor +(?P<neighbors_dr_router_id>(\S+))$')
 
         # Configured as demand circuit
-        p25 = re.compile(r'^Configured as demand circuit$')
+        p25 = regex_engine.compile(r'^Configured as demand circuit$')
 
         # Run as demand circuit.
-        p26 = re.compile(r"^Run as demand circuit\.$")
+        p26 = regex_engine.compile(r"^Run as demand circuit\.$")
 
         # DoNotAge LSA not allowed (Number of DCbitless LSA is 1).
-        p27 = re.compile(r"^DoNotAge +LSA +not +allowed +\(Number +of +DCbitless +LSA +is +(?P<num>(\d+))\)\.$")
+        p27 = regex_engine.compile(r"^DoNotAge +LSA +not +allowed +\(Number +of +DCbitless +LSA +is +(?P<num>(\d+))\)\.$")
 
         # Loopback interface is treated as a stub Host
-        p28 = re.compile(r'^Loopback +interface +is +treated +as +a +stub +Host$')
+        p28 = regex_engine.compile(r'^Loopback +interface +is +treated +as +a +stub +Host$')
 
         # Clear text authentication enabled
         # Message digest authentication enabled
-        p29 = re.compile(r"^(?P<auth>([a-zA-Z\s]+)) +authentication +enabled$")
+        p29 = regex_engine.compile(r"^(?P<auth>([a-zA-Z\s]+)) +authentication +enabled$")
 
         # Youngest key id is 1
-        p30 = re.compile(r"^Youngest +key +id +is +(?P<young>(\d+))$")
+        p30 = regex_engine.compile(r"^Youngest +key +id +is +(?P<young>(\d+))$")
 
         # LDP Sync Enabled, Sync Status: Achieved
         # LDP Sync Enabled, Sync Status: Not Achieved
-        p31 = re.compile(r"^LDP\s+Sync\s+(?P<ldp_sync>[a-zA-Z]+),\s+Sync\s+Status:\s+(?P<sync_status>[a-zA-Z ]+)$")
+        p31 = regex_engine.compile(r"^LDP\s+Sync\s+(?P<ldp_sync>[a-zA-Z]+),\s+Sync\s+Status:\s+(?P<sync_status>[a-zA-Z ]+)$")
 
         
         for line in out.splitlines():
@@ -6723,16 +6726,16 @@ class ShowOspfSummary(ShowOspfSummarySchema):
 
         # Routing process "ospf 1"
         # Routing process "ospf 1000 VRF v5000"
-        p1 = re.compile(r'^Routing\s+process\s+"ospf\s+(?P<routing_process>\d+)(?:\s+VRF\s+(?P<vrf_name>\w+))?"$')
+        p1 = regex_engine.compile(r'^Routing\s+process\s+"ospf\s+(?P<routing_process>\d+)(?:\s+VRF\s+(?P<vrf_name>\w+))?"$')
 
         # Number of OSPF interfaces 4
         # Number of OSPF interfaces up 4
-        p2 = re.compile(r'^Number\s+of\s+(?P<key_name>[A-Za-z -]+)\s+(?P<value_name>\d+)$')
+        p2 = regex_engine.compile(r'^Number\s+of\s+(?P<key_name>[A-Za-z -]+)\s+(?P<value_name>\d+)$')
 
         # Summary ASBR : 0
         # Type-7 Ext : 0
         # Opaque Link : 0
-        p3 = re.compile(r'^(?P<key_name>[\w\- ]+)\s+:\s+(?P<value_name>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<key_name>[\w\- ]+)\s+:\s+(?P<value_name>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6894,161 +6897,161 @@ class ShowOspfProcessName(ShowOspfProcessNameSchema):
         # Routing Process "ospf 100" with ID 1.100.1.1 in OSPF ADMIN DOWN state
         # Routing Process "ospf 200" with ID 100.1.1.200
         # Routing Process "ospfv3 200" with ID 1.100.1.1
-        p1 = re.compile(r'^Routing\s+Process\s+"(?P<process_name>ospf|ospfv3)\s+(?P<process_id>\d+)"\s+'
-                        r'with\s+ID\s+(?P<router_id>[\d.]+)(?: in\s+OSPF\s+(?P<status>[A-Z\s]+)\s+state)?$')
+        p1 = regex_engine.compile(r'^Routing\s+Process\s+"(?P<process_name>ospf|ospfv3)\s+(?P<process_id>\d+)"\s+'
+                                  r'with\s+ID\s+(?P<router_id>[\d.]+)(?: in\s+OSPF\s+(?P<status>[A-Z\s]+)\s+state)?$')
 
         # Role: Primary Active
-        p2 = re.compile(r'^Role:\s+(?P<role>.*)$')
+        p2 = regex_engine.compile(r'^Role:\s+(?P<role>.*)$')
 
         # NSR (Non-stop routing) is Enabled
         # NSR (Non-stop routing) is Disabled
-        p3 = re.compile(r'^NSR\s+\(Non-stop\s+routing\)\s+is\s+(?P<nsr_status>Enabled|Disabled)$')
+        p3 = regex_engine.compile(r'^NSR\s+\(Non-stop\s+routing\)\s+is\s+(?P<nsr_status>Enabled|Disabled)$')
 
         # Initial SPF schedule delay 50 msecs
         # Initial LSA throttle delay 50 msecs
-        p4 = re.compile(r'^Initial\s+(?P<key_name>SPF\s+schedule|LSA\s+throttle)\s+delay\s+(?P<value>.*)$')
+        p4 = regex_engine.compile(r'^Initial\s+(?P<key_name>SPF\s+schedule|LSA\s+throttle)\s+delay\s+(?P<value>.*)$')
 
         # Minimum hold time between two consecutive SPFs 200 msecs
         # Maximum wait time between two consecutive SPFs 5000 msecs
-        p5 = re.compile(r'^(?P<key_name>Minimum\s+hold|Maximum\s+wait)\s+time\s+between\s+'
-                        r'two\s+consecutive\s+SPFs\s+(?P<value>.*)$')
+        p5 = regex_engine.compile(r'^(?P<key_name>Minimum\s+hold|Maximum\s+wait)\s+time\s+between\s+'
+                                  r'two\s+consecutive\s+SPFs\s+(?P<value>.*)$')
 
         # Minimum hold time for LSA throttle 200 msecs
         # Maximum wait time for LSA throttle 5000 msecs
-        p6 = re.compile(r'^(?P<key_name>Minimum\s+hold|Maximum\s+wait)\s+time\s+for\s+LSA\s+throttle\s+(?P<value>.*)$')
+        p6 = regex_engine.compile(r'^(?P<key_name>Minimum\s+hold|Maximum\s+wait)\s+time\s+for\s+LSA\s+throttle\s+(?P<value>.*)$')
 
         # Minimum LSA interval 200 msecs. Minimum LSA arrival 100 msecs
-        p7 = re.compile(r'^Minimum\s+LSA\s+interval\s+(?P<min_lsa_interval>[\w ]+).\s+Minimum\s+LSA\s+arrival\s+(?P<min_lsa_arrival>[\w ]+)$')
+        p7 = regex_engine.compile(r'^Minimum\s+LSA\s+interval\s+(?P<min_lsa_interval>[\w ]+).\s+Minimum\s+LSA\s+arrival\s+(?P<min_lsa_arrival>[\w ]+)$')
 
         # LSA refresh interval 1800 seconds
-        p8 = re.compile(r'^LSA\s+refresh\s+interval\s+(?P<lsa_refresh_interval>.*)$')
+        p8 = regex_engine.compile(r'^LSA\s+refresh\s+interval\s+(?P<lsa_refresh_interval>.*)$')
 
         # Flood pacing interval 33 msecs. Retransmission pacing interval 66 msecs
-        p9 = re.compile(r'^Flood\s+pacing\s+interval\s+(?P<flood_pacing_interval>.*)\.'
-                        r'\s+Retransmission\s+pacing\s+interval\s+(?P<retransmission_pacing_interval>.*)$')
+        p9 = regex_engine.compile(r'^Flood\s+pacing\s+interval\s+(?P<flood_pacing_interval>.*)\.'
+                                  r'\s+Retransmission\s+pacing\s+interval\s+(?P<retransmission_pacing_interval>.*)$')
         
         # Maximum number of configured interfaces 1024
-        p10 = re.compile(r'^Maximum\s+number\s+of\s+configured\s+interfaces\s+(?P<maximum_configured_interfaces>\d+)$')
+        p10 = regex_engine.compile(r'^Maximum\s+number\s+of\s+configured\s+interfaces\s+(?P<maximum_configured_interfaces>\d+)$')
 
         # Non-Stop Forwarding enabled
         # Non-Stop Forwarding enabled, last NSF restart 4w0d ago (took 21 secs)
-        p11 = re.compile(r'^Non-Stop\s+Forwarding\s+(?P<nsf_status>enabled|disabled)(?:,\s+last\s+NSF\s+restart\s+(?P<last_nsf_restart>.*))?$')
+        p11 = regex_engine.compile(r'^Non-Stop\s+Forwarding\s+(?P<nsf_status>enabled|disabled)(?:,\s+last\s+NSF\s+restart\s+(?P<last_nsf_restart>.*))?$')
 
         # SNMP trap is enabled
         # Strict-SPF capability is enabled
-        p12 = re.compile(r'^(?P<key_name>[a-zA-Z -]+)\s+is\s+(?P<value>enabled)$')
+        p12 = regex_engine.compile(r'^(?P<key_name>[a-zA-Z -]+)\s+is\s+(?P<value>enabled)$')
 
         # It is an autonomous system boundary router
         # It is an area border router
         # It is an area border and autonomous system boundary router
-        p13 = re.compile(r'^It\s+is\s+an'
-                        r'(?:\s+(?P<abr>(area border)))?'
-                        r'(?:\s+and)?'
-                        r'(?:\s+(?P<asbr>(autonomous system boundary)))?'
-                        r'\s+router$')
+        p13 = regex_engine.compile(r'^It\s+is\s+an'
+                                  r'(?:\s+(?P<abr>(area border)))?'
+                                  r'(?:\s+and)?'
+                                  r'(?:\s+(?P<asbr>(autonomous system boundary)))?'
+                                  r'\s+router$')
 
         # Number of areas in this router is 2. 2 normal 0 stub 0 nssa
-        p14 = re.compile(r'^Number\s+of\s+areas\s+in\s+this\s+router\s+is\s+(?P<total_router_areas>\d+)'
-                         r'.\s+(?P<normal_area>\d+)\s+normal\s+(?P<stub_area>\d+)\s+stub\s+(?P<nssa_area>\d+)\s+nssa$')
+        p14 = regex_engine.compile(r'^Number\s+of\s+areas\s+in\s+this\s+router\s+is\s+(?P<total_router_areas>\d+)'
+                                   r'.\s+(?P<normal_area>\d+)\s+normal\s+(?P<stub_area>\d+)\s+stub\s+(?P<nssa_area>\d+)\s+nssa$')
 
         # Supports only single TOS(TOS0) routes
-        p15 = re.compile(r'^Supports\s+only\s+single\s+TOS\(TOS0\)\s+routes$')
+        p15 = regex_engine.compile(r'^Supports\s+only\s+single\s+TOS\(TOS0\)\s+routes$')
 
         # Supports opaque LSA
-        p16 = re.compile(r'^Supports\s+opaque\s+LSA$')
+        p16 = regex_engine.compile(r'^Supports\s+opaque\s+LSA$')
 
         # Originating router-LSAs with maximum metric
-        p17_1 = re.compile(r'^Originating\s+router-LSAs\s+with\s+maximum'
-                        r'\s+metric$')
+        p17_1 = regex_engine.compile(r'^Originating\s+router-LSAs\s+with\s+maximum'
+                                  r'\s+metric$')
 
         # Condition: always State: active
         # Condition: always, State: active
         # Condition: on start-up for 5 seconds, State: inactive
         # Condition: on startup for 300 seconds, State: inactive
-        p17_2 = re.compile(r'^Condition:'
-                        r'\s+(?P<condition>(always|on\s+\S+))'
-                        r'(?:\s+for\s+(?P<seconds>(\d+))\s+seconds,)?'
-                        r'\s+State:\s+(?P<state>(\S+))$')
+        p17_2 = regex_engine.compile(r'^Condition:'
+                                  r'\s+(?P<condition>(always|on\s+\S+))'
+                                  r'(?:\s+for\s+(?P<seconds>(\d+))\s+seconds,)?'
+                                  r'\s+State:\s+(?P<state>(\S+))$')
 
         # Number of external LSA 1. Checksum Sum 0x003b22
-        p18 = re.compile(r'^Number\s+of\s+external\s+LSA\s+(?P<ext>(\d+))\.'
-                        r'\s+Checksum\s+Sum\s+(?P<checksum>(\S+))$')
+        p18 = regex_engine.compile(r'^Number\s+of\s+external\s+LSA\s+(?P<ext>(\d+))\.'
+                                  r'\s+Checksum\s+Sum\s+(?P<checksum>(\S+))$')
 
         # Number of opaque AS LSA 0. Checksum Sum 00000000
-        p19 = re.compile(r'^Number\s+of\s+opaque\s+AS\s+LSA\s+(?P<opq>(\d+))\.'
-                        r'\s+Checksum\s+Sum\s+(?P<checksum>(\S+))$')
+        p19 = regex_engine.compile(r'^Number\s+of\s+opaque\s+AS\s+LSA\s+(?P<opq>(\d+))\.'
+                                  r'\s+Checksum\s+Sum\s+(?P<checksum>(\S+))$')
 
         # Number of DCbitless external and opaque AS LSA 0
-        p20 = re.compile(r'^Number\s+of\s+DCbitless\s+external\s+and\s+opaque'
-                        r'\s+AS\s+LSA\s+(?P<num>(\d+))$')
+        p20 = regex_engine.compile(r'^Number\s+of\s+DCbitless\s+external\s+and\s+opaque'
+                                  r'\s+AS\s+LSA\s+(?P<num>(\d+))$')
 
         # Number of DoNotAge external and opaque AS LSA 0
-        p21 = re.compile(r'^Number\s+of\s+DoNotAge\s+external\s+and\s+opaque'
-                        r'\s+AS\s+LSA\s+(?P<num>(\d+))$')
+        p21 = regex_engine.compile(r'^Number\s+of\s+DoNotAge\s+external\s+and\s+opaque'
+                                  r'\s+AS\s+LSA\s+(?P<num>(\d+))$')
 
         # External flood list length 0
-        p22 = re.compile(r'^External\s+flood\s+list\s+length\s+(?P<num>(\d+))$')
+        p22 = regex_engine.compile(r'^External\s+flood\s+list\s+length\s+(?P<num>(\d+))$')
 
         # Area BACKBONE(0)
         # Area 1
         # Area BACKBONE(0) (Inactive)
-        p23 = re.compile(r'^Area\s+(?P<area>[\w\(\)]+)(?:\s+\((?P<key_name>\w+)\))?$')
+        p23 = regex_engine.compile(r'^Area\s+(?P<area>[\w\(\)]+)(?:\s+\((?P<key_name>\w+)\))?$')
 
         # Number of interfaces in this area is 0
         # Number of interfaces in this area is 3 (1 loopback)
-        p24 = re.compile(r'^Number\s+of\s+interfaces\s+in\s+this\s+area\s+is'
-                        r'\s+(?P<num_intf>(\d+))(?:'
-                        r'\s*\((?P<loopback>(\d+))\s+loopback\))?$')
+        p24 = regex_engine.compile(r'^Number\s+of\s+interfaces\s+in\s+this\s+area\s+is'
+                                  r'\s+(?P<num_intf>(\d+))(?:'
+                                  r'\s*\((?P<loopback>(\d+))\s+loopback\))?$')
 
         # SPF algorithm executed 1 times
-        p25 = re.compile(r'^SPF\s+algorithm\s+executed\s+(?P<count>(\d+))'
-                        r'\s+times$')
+        p25 = regex_engine.compile(r'^SPF\s+algorithm\s+executed\s+(?P<count>(\d+))'
+                                  r'\s+times$')
 
         # Number of LSA 0.  Checksum Sum 00000000
-        p26 = re.compile(r'^Number\s+of\s+LSA\s+(?P<lsa_count>(\d+))\.'
-                        r'\s+Checksum\s+Sum\s+(?P<checksum_sum>(\S+))$')
+        p26 = regex_engine.compile(r'^Number\s+of\s+LSA\s+(?P<lsa_count>(\d+))\.'
+                                  r'\s+Checksum\s+Sum\s+(?P<checksum_sum>(\S+))$')
 
         # Number of opaque link LSA 0.  Checksum Sum 00000000
-        p27 = re.compile(r'^Number\s+of\s+opaque\s+link\s+LSA'
-                        r'\s+(?P<opaque_count>(\d+))\.\s+Checksum\s+Sum'
-                        r'\s+(?P<checksum_sum>(\S+))$')
+        p27 = regex_engine.compile(r'^Number\s+of\s+opaque\s+link\s+LSA'
+                                  r'\s+(?P<opaque_count>(\d+))\.\s+Checksum\s+Sum'
+                                  r'\s+(?P<checksum_sum>(\S+))$')
 
         # Number of DCbitless LSA 0
-        p28 = re.compile(r'^Number\s+of\s+DCbitless\s+LSA\s+(?P<count>(\d+))$')
+        p28 = regex_engine.compile(r'^Number\s+of\s+DCbitless\s+LSA\s+(?P<count>(\d+))$')
 
         # Number of indication LSA 0
-        p29 = re.compile(r'^Number\s+of\s+indication\s+LSA\s+(?P<count>(\d+))$')
+        p29 = regex_engine.compile(r'^Number\s+of\s+indication\s+LSA\s+(?P<count>(\d+))$')
 
         # Number of DoNotAge LSA 0
-        p30 = re.compile(r'^Number\s+of\s+DoNotAge\s+LSA\s+(?P<count>(\d+))$')
+        p30 = regex_engine.compile(r'^Number\s+of\s+DoNotAge\s+LSA\s+(?P<count>(\d+))$')
 
         # Flood list length 0
-        p31 = re.compile(r'^Flood\s+list\s+length\s+(?P<len>(\d+))$')
+        p31 = regex_engine.compile(r'^Flood\s+list\s+length\s+(?P<len>(\d+))$')
 
         # Adjacency stagger enabled; initial (per area): 2, maximum: 64
-        p32 = re.compile(r'^Adjacency +stagger +(?P<adj>(\S+)); +initial'
-                         r' +\(per +area\): +(?P<init>(\d+)),'
-                         r' +maximum: +(?P<max>(\d+))$')
+        p32 = regex_engine.compile(r'^Adjacency +stagger +(?P<adj>(\S+)); +initial'
+                                   r' +\(per +area\): +(?P<init>(\d+)),'
+                                   r' +maximum: +(?P<max>(\d+))$')
 
         # Number of neighbors forming: 0, 0 full
-        p33 = re.compile(r'^Number +of +neighbors +forming:'
-                         r' +(?P<form>(\d+)), +(?P<full>(\d+)) +full$')
+        p33 = regex_engine.compile(r'^Number +of +neighbors +forming:'
+                                   r' +(?P<form>(\d+)), +(?P<full>(\d+)) +full$')
 
         # Segment Routing Global Block default (16000-23999), not allocated
-        p34 = re.compile(r'^Segment +Routing +Global +Block +default'
-                         r' +\((?P<sr_global_block>([0-9\-]+))\), +(?P<status>(.*))$')
+        p34 = regex_engine.compile(r'^Segment +Routing +Global +Block +default'
+                                   r' +\((?P<sr_global_block>([0-9\-]+))\), +(?P<status>(.*))$')
 
         # Segment Routing Local Block (15000-15999), allocated
-        p35 = re.compile(r'^Segment +Routing +Local +Block'
-                         r' +\((?P<sr_local_block>([0-9\-]+))\), +(?P<status>(.*))$')
+        p35 = regex_engine.compile(r'^Segment +Routing +Local +Block'
+                                   r' +\((?P<sr_local_block>([0-9\-]+))\), +(?P<status>(.*))$')
         
         # Microloop avoidance Enabled, Type: Local (Protected), Delay Time: 5000
-        p36 = re.compile(r'^Microloop\s+avoidance\s+(?P<state>Enabled|Disabled)'
-                         r',\s+Type:\s+(?P<type>.*)'
-                         r',\s+Delay\s+Time:\s+(?P<delay_time>\d+)$')
+        p36 = regex_engine.compile(r'^Microloop\s+avoidance\s+(?P<state>Enabled|Disabled)'
+                                   r',\s+Type:\s+(?P<type>.*)'
+                                   r',\s+Delay\s+Time:\s+(?P<delay_time>\d+)$')
         
         # Microloop avoidance is not active
-        p37 = re.compile(r'^Microloop\s+avoidance\s+is\s+(?P<status>.*)$')
+        p37 = regex_engine.compile(r'^Microloop\s+avoidance\s+is\s+(?P<status>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -7546,61 +7549,61 @@ class ShowOspfNeighborInterfaceDetail(ShowOspfNeighborInterfaceDetailSchema):
         ret_dict = {}
         
         # Neighbors for OSPF 37
-        p1 = re.compile(r"^Neighbors +for +OSPF +(?P<instance>(\S+))?$")
+        p1 = regex_engine.compile(r"^Neighbors +for +OSPF +(?P<instance>(\S+))?$")
         
         # Neighbor 10.0.0.4, interface address 10.3.4.2
-        p2 = re.compile(r"^Neighbor +(?P<neighbor>(\S+)), +interface +address +(?P<address>(\S+))$")
+        p2 = regex_engine.compile(r"^Neighbor +(?P<neighbor>(\S+)), +interface +address +(?P<address>(\S+))$")
         
         # In the area 37 via interface Bundle-Ether34 
-        p3 = re.compile(r"^In +the +area +(?P<area>\S+) +via +interface +(?P<interface>\S+)( +, +BFD +(?P<bfd_status>\w+), +Mode: (?P<mode>\w+))?$")
+        p3 = regex_engine.compile(r"^In +the +area +(?P<area>\S+) +via +interface +(?P<interface>\S+)( +, +BFD +(?P<bfd_status>\w+), +Mode: (?P<mode>\w+))?$")
         
         # Neighbor priority is 1, State is FULL, 6 state changes
-        p4 = re.compile(r"^Neighbor +priority +is +(?P<priority>(\d+)),\s+State\sis\s+(?P<state>(\w+)),\s+(?P<num>(\d+))\s+state\s+changes$")
+        p4 = regex_engine.compile(r"^Neighbor +priority +is +(?P<priority>(\d+)),\s+State\sis\s+(?P<state>(\w+)),\s+(?P<num>(\d+))\s+state\s+changes$")
         
         # DR is 10.3.4.2 BDR is 10.3.4.1
-        p5 = re.compile(r"^DR +is +(?P<dr_ip_addr>(\S+)) +BDR +is +(?P<bdr_ip_addr>(\S+))$")
+        p5 = regex_engine.compile(r"^DR +is +(?P<dr_ip_addr>(\S+)) +BDR +is +(?P<bdr_ip_addr>(\S+))$")
         
         # Options is 0x52
-        p6_1 = re.compile(r"^Options +is +(?P<options>(\S+))$")
+        p6_1 = regex_engine.compile(r"^Options +is +(?P<options>(\S+))$")
         
         # LLS Options is 0x1 (LR)
-        p6_2 = re.compile(r"^LLS +Options +is +(?P<lls_options>(.*))$")
+        p6_2 = regex_engine.compile(r"^LLS +Options +is +(?P<lls_options>(.*))$")
         
         # Dead timer due in 00:00:36
-        p7 = re.compile(r"^Dead +timer +due +in +(?P<dead_timer>(\S+))$")
+        p7 = regex_engine.compile(r"^Dead +timer +due +in +(?P<dead_timer>(\S+))$")
         
         # Neighbor is up for 12w5d
-        p8 = re.compile(r"^Neighbor +is +up +for +(?P<uptime>(\S+))$")
+        p8 = regex_engine.compile(r"^Neighbor +is +up +for +(?P<uptime>(\S+))$")
         
         # Number of DBD retrans during last exchange 0
-        p9 = re.compile(r"^Number +of +DBD +retrans +during +last"
+        p9 = regex_engine.compile(r"^Number +of +DBD +retrans +during +last"
             r" +exchange +(?P<dbd_retrans>(\d+))$")
         
         # Index 2/2, retransmission queue length 0, number of retransmission 22
-        p10 = re.compile(r"^Index +(?P<index>(\S+)) +retransmission +queue"
+        p10 = regex_engine.compile(r"^Index +(?P<index>(\S+)) +retransmission +queue"
             r" +length +(?P<ql>(\d+)), +number +of"
             r" +retransmission +(?P<num_retrans>(\d+))$")
         
         #  First 0(0)/0(0) Next 0(0)/0(0)
-        p11 = re.compile(r"^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$")
+        p11 = regex_engine.compile(r"^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$")
        
         # Last retransmission scan length is 1, maximum is 4
-        p12 = re.compile(r"^Last +retransmission +scan +length +is"
+        p12 = regex_engine.compile(r"^Last +retransmission +scan +length +is"
             r" +(?P<num1>(\d+)), +maximum +is"
             r" +(?P<num2>(\d+))$")
         
         # Last retransmission scan time is 0 msec, maximum is 0 msec
-        p13 = re.compile(r"^Last +retransmission +scan +time +is"
+        p13 = regex_engine.compile(r"^Last +retransmission +scan +time +is"
             r" +(?P<num1>(\d+)) +msec, +maximum +is"
             r" +(?P<num2>(\d+)) +msec$")
         
         # LS Ack list: NSR-sync pending 0, high water mark 0
-        p14 = re.compile(r"^LS +Ack +list: +(?P<ls_ack_list>(\S+))"
+        p14 = regex_engine.compile(r"^LS +Ack +list: +(?P<ls_ack_list>(\S+))"
             r" +pending +(?P<pending>(\d+)), +high +water"
             r" +mark +(?P<mark>(\d+))$")
         
         # Neighbor Interface ID: 10    
-        p15 = re.compile(r"^Neighbor\s+Interface\s+ID:\s+(?P<nbr_interface_id>\d+)")
+        p15 = regex_engine.compile(r"^Neighbor\s+Interface\s+ID:\s+(?P<nbr_interface_id>\d+)")
         
         for line in output.splitlines():
             line = line.strip()
@@ -7809,57 +7812,57 @@ class ShowOspfProcessIdVrfName(ShowOspfProcessIdVrfNameSchema):
             
         
         # GigabitEthernet0/0/0/3.200 is up, line protocol is up
-        p1=re.compile(r'^(?P<interface>\S+)\s+is\s+(?P<status>\w+),\s+line\s+protocol\s+is\s+(?P<protocol_status>\w+)')
+        p1=regex_engine.compile(r'^(?P<interface>\S+)\s+is\s+(?P<status>\w+),\s+line\s+protocol\s+is\s+(?P<protocol_status>\w+)')
         
         #Internet Address 90.11.1.1/30, Area 0, SID 0, Strict-SPF SID 0
-        p2 = re.compile(r'^Internet +Address +(?P<ip_address>(\d+.){3}\d+/\d+), +Area +(?P<area>\w+), +SID +'
-                          r'(?P<sid>\d+), +Strict-SPF +SID +(?P<strict_spf_sid>\d+)$')
+        p2 = regex_engine.compile(r'^Internet +Address +(?P<ip_address>(\d+.){3}\d+/\d+), +Area +(?P<area>\w+), +SID +'
+                                    r'(?P<sid>\d+), +Strict-SPF +SID +(?P<strict_spf_sid>\d+)$')
         
         # Label stack Primary label 0 Backup label 0 SRTE label 0
-        p3 = re.compile(r'^Label stack +Primary +label +(?P<primary_label>\d+) +Backup +label +'
-                         r'(?P<backup_label>\d+) +SRTE +label +(?P<srte_label>\d+)$')
+        p3 = regex_engine.compile(r'^Label stack +Primary +label +(?P<primary_label>\d+) +Backup +label +'
+                                   r'(?P<backup_label>\d+) +SRTE +label +(?P<srte_label>\d+)$')
                           
         # Process ID 1, Router ID 10.36.3.3, Network Type LOOPBACK, Cost: 1
-        p4 = re.compile(r'Process\s+ID\s+(?P<process_id>\d+),\s+VRF\s+(?P<vrf_name>\w+),\s+Router\s+ID\s+(?P<router_id>[\d.]+),\s+Network\s+Type\s+(?P<network_type>\w+),\s+Cost:\s+(?P<cost>\d+)')
+        p4 = regex_engine.compile(r'Process\s+ID\s+(?P<process_id>\d+),\s+VRF\s+(?P<vrf_name>\w+),\s+Router\s+ID\s+(?P<router_id>[\d.]+),\s+Network\s+Type\s+(?P<network_type>\w+),\s+Cost:\s+(?P<cost>\d+)')
         
         # Transmit Delay is 1 sec, State POINT_TO_POINT, MTU 1500, MaxPktSz 1500
-        p5 = re.compile(r'Transmit\s+Delay\s+is\s+(?P<transmit_delay>\d+\s+\w+),\s+State\s+(?P<state>\w+),\s+MTU\s+(?P<mtu>\d+),\s+MaxPktSz\s+(?P<paket_size>\d+)$')
+        p5 = regex_engine.compile(r'Transmit\s+Delay\s+is\s+(?P<transmit_delay>\d+\s+\w+),\s+State\s+(?P<state>\w+),\s+MTU\s+(?P<mtu>\d+),\s+MaxPktSz\s+(?P<paket_size>\d+)$')
         
         
         # Forward reference No, Unnumbered no,  Bandwidth 1000000
-        p6 = re.compile(r'^Forward +reference +(?P<forward_reference>\w+), +Unnumbered +'
-                         r'(?P<unnumbered_bool>\w+), +Bandwidth +(?P<bandwidth>\S+)$')
+        p6 = regex_engine.compile(r'^Forward +reference +(?P<forward_reference>\w+), +Unnumbered +'
+                                   r'(?P<unnumbered_bool>\w+), +Bandwidth +(?P<bandwidth>\S+)$')
                          
         # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-        p7 = re.compile(r'^Timer +intervals +configured, +Hello +(?P<hello>(\d+)), +Dead +(?P<dead>(\d+)), +Wait +'
-                        r'(?P<wait>(\d+)), +Retransmit +(?P<retransmit>(\d+))$')
+        p7 = regex_engine.compile(r'^Timer +intervals +configured, +Hello +(?P<hello>(\d+)), +Dead +(?P<dead>(\d+)), +Wait +'
+                                  r'(?P<wait>(\d+)), +Retransmit +(?P<retransmit>(\d+))$')
         
         # Hello Due in 00:00:04:764 
-        p8 = re.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
+        p8 = regex_engine.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
         
         
         # Index 1/1, flood queue length 0
-        p9 = re.compile(r'^Index +(?P<index>(\S+)), +flood +queue +length +(?P<length>(\d+))$')
+        p9 = regex_engine.compile(r'^Index +(?P<index>(\S+)), +flood +queue +length +(?P<length>(\d+))$')
 
         # Next 0(0)/0(0)
-        p10 = re.compile(r'^Next +(?P<next>(\S+))$')
+        p10 = regex_engine.compile(r'^Next +(?P<next>(\S+))$')
 
         # Last flood scan length is 1, maximum is 3
-        p11 = re.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)), +maximum +is +(?P<max>(\d+))$')
+        p11 = regex_engine.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)), +maximum +is +(?P<max>(\d+))$')
 
         # Last flood scan time is 0 msec, maximum is 0 msec
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^Last +flood +scan +time +is +(?P<time1>(\d+)) +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
 
         # LS Ack List: current length 0, high water mark 5
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r'^LS +Ack +List: +(?P<ls_ack_list>(\S+)) +length +(?P<num>(\d+)), +high +water +mark +(?P<num2>(\d+))$')
 
         # Neighbor Count is 1, Adjacent neighbor count is 1
-        p14 = re.compile(r'^Neighbor\s+Count\s+is\s+(?P<neighbor_count>\d+),\s+Adjacent\s+neighbor\s+count\s+is(?P<adj_neighbor_count>\s+\d+)')
+        p14 = regex_engine.compile(r'^Neighbor\s+Count\s+is\s+(?P<neighbor_count>\d+),\s+Adjacent\s+neighbor\s+count\s+is(?P<adj_neighbor_count>\s+\d+)')
         
         # Adjacent with neighbor 90.11.1.2
-        p15 = re.compile(r'^Adjacent +with +neighbor +(?P<neighbors_router_id>(\S+))')
+        p15 = regex_engine.compile(r'^Adjacent +with +neighbor +(?P<neighbors_router_id>(\S+))')
         
         ret_dict = {}
         
@@ -7,7 +7,6 @@ Parser for the following commands:
     * show ospfv3 database
     * show ospfv3 {process_id} database
 '''
-import re
 
 import genie.metaparser.util.exceptions
 from netaddr import IPAddress, INET_ATON
@@ -15,6 +14,9 @@ from netaddr import IPAddress, INET_ATON
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowOspfv3NeighborSchema(MetaParser):
     """ Schema for:
@@ -73,23 +75,23 @@ class ShowOspfv3Neighbor(ShowOspfv3NeighborSchema):
         # Neighbors for OSPFv3 1
         # Neighbors for OSPFv3 1, VRF default
         # Neighbors for OSPFv3 1, VRF VRF1
-        p1 = re.compile(r'^Neighbors +for +OSPFv3 +(?P<process>\w+)'
-                        r'(, +VRF (?P<vrf>[\w-]+))?$')
+        p1 = regex_engine.compile(r'^Neighbors +for +OSPFv3 +(?P<process>\w+)'
+                                  r'(, +VRF (?P<vrf>[\w-]+))?$')
 
         # Neighbor ID     Pri   State           Dead Time   Interface ID    Interface
         # 10.145.95.95     1     FULL/  -        00:00:37    5               GigabitEthernet0/0/0/1
         # 10.220.100.100 1     FULL/  -        00:00:38    6               GigabitEthernet0/0/0/0
-        p2 = re.compile(r'^(?P<neighbor_id>\S+) +(?P<priority>\d+)'
-                        r' +(?P<state>\S+\s*\S+) +(?P<dead_time>\S+)'
-                        r' +(?P<address>\S+) +(?P<interface>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<neighbor_id>\S+) +(?P<priority>\d+)'
+                                  r' +(?P<state>\S+\s*\S+) +(?P<dead_time>\S+)'
+                                  r' +(?P<address>\S+) +(?P<interface>\S+)$')
 
         # Neighbor is up for 2d18h
         # Neighbor is up for 2d19h
-        p3 = re.compile(r'^Neighbor +is +up +for +(?P<up_time>\S+)$')
+        p3 = regex_engine.compile(r'^Neighbor +is +up +for +(?P<up_time>\S+)$')
 
         # Total neighbor count: 2
-        p4 = re.compile(r'^Total +neighbor +count:'
-                        r' +(?P<total_neighbor_count>\d+)$')
+        p4 = regex_engine.compile(r'^Total +neighbor +count:'
+                                  r' +(?P<total_neighbor_count>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -243,30 +245,30 @@ class ShowOspfv3Database(ShowOspfv3DatabaseSchema):
         }
 
         # OSPFv3 Router with ID(10.94.1.1) (Process ID mpls1)
-        p1 = re.compile(r'^OSPFv3 +Router +with +ID +\((?P<router_id>(\S+))\) '
-                        r'+\(Process +ID +(?P<instance>(\S+))(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = regex_engine.compile(r'^OSPFv3 +Router +with +ID +\((?P<router_id>(\S+))\) '
+                                  r'+\(Process +ID +(?P<instance>(\S+))(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
         # Router Link States (Area 0)
         # Link (Type-8) Link States (Area 0)
         # Intra Area Prefix Link States (Area 0)
-        p2 = re.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States +\(Area'
-                        r' +(?P<area>(\S+))\)$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States +\(Area'
+                                  r' +(?P<area>(\S+))\)$')
 
         # 10.94.1.1       2019        0x8000007d 0            2           E
         # 10.145.95.95     607         0x80000097 0            2           E
-        p3 = re.compile(r'^(?P<adv_router>(\S+)) +(?P<age>(\d+)) +(?P<seq_num>(\S+))'
-                        r' +(?P<fragment_id>(\d+)) +(?P<link_count>(\d+)) +(?P<bits>(\w+))$')
+        p3 = regex_engine.compile(r'^(?P<adv_router>(\S+)) +(?P<age>(\d+)) +(?P<seq_num>(\S+))'
+                                  r' +(?P<fragment_id>(\d+)) +(?P<link_count>(\d+)) +(?P<bits>(\w+))$')
 
         # 10.94.1.1       1518        0x80000086 7          Gi0/0/0/0
         # 10.220.100.100 1841        0x80000079 6          Gi0/0/0/0
-        p4 = re.compile(r'^(?P<adv_router>(\S+)) +(?P<age>(\d+)) +(?P<seq_num>(\S+))'
-                        r' +(?P<link_id>(\d+)) +(?P<interface>([a-zA-Z0-9\/])+)$')
+        p4 = regex_engine.compile(r'^(?P<adv_router>(\S+)) +(?P<age>(\d+)) +(?P<seq_num>(\S+))'
+                                  r' +(?P<link_id>(\d+)) +(?P<interface>([a-zA-Z0-9\/])+)$')
 
         # 10.94.1.1       2019        0x80000078 0          0x2001      0
         # 10.145.95.95     1583        0x80000086 0          0x2001      0
-        p5 = re.compile(r'^(?P<adv_router>(\S+)) +(?P<age>(\d+)) +(?P<seq_num>(\S+))'
-                        r' +(?P<link_id>(\d+)) +(?P<ref_lstype>(\S)+)'
-                        r' +(?P<ref_lsid>(\d)+)$')
+        p5 = regex_engine.compile(r'^(?P<adv_router>(\S+)) +(?P<age>(\d+)) +(?P<seq_num>(\S+))'
+                                  r' +(?P<link_id>(\d+)) +(?P<ref_lstype>(\S)+)'
+                                  r' +(?P<ref_lsid>(\d)+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -480,51 +482,51 @@ class ShowOspfv3VrfAllInclusiveNeighborDetail(ShowOspfv3VrfAllInclusiveNeighborD
         af = "ipv6"
 
         # Neighbors for OSPFv3 mpls1, VRF default
-        p1 = re.compile(r"^Neighbors +for +OSPFv3 +(?P<instance>(\S+)), +(?P<vrf>(VRF \S+))$")
+        p1 = regex_engine.compile(r"^Neighbors +for +OSPFv3 +(?P<instance>(\S+)), +(?P<vrf>(VRF \S+))$")
 
         # Neighbor 10.94.1.1
-        p2 = re.compile(r"^Neighbor +(?P<neighbor>(\S+))$")
+        p2 = regex_engine.compile(r"^Neighbor +(?P<neighbor>(\S+))$")
 
         # In the area 0 via interface GigabitEthernet0/0/0/0.1
         # In the area 0 via interface GigabitEthernet0/0/0/1.500     BFD enabled, Mode: Default
-        p3 = re.compile(r"^In the area +(?P<area>([0-9]+)) via interface +(?P<interface>(\S+))"
-                        r"( +BFD (?P<enable>\w+), Mode: (?P<mode>\w+))*")
+        p3 = regex_engine.compile(r"^In the area +(?P<area>([0-9]+)) via interface +(?P<interface>(\S+))"
+                                  r"( +BFD (?P<enable>\w+), Mode: (?P<mode>\w+))*")
 
         # Neighbor: interface-id 14, link-local address fe80::20c:29ff:fe6b:1a0
-        p4 = re.compile(r"^Neighbor: interface-id +(?P<interface_id>([0-9]+)), "
-                        r"link-local address +(?P<link_local>(['a-z:0-9']+))$")
+        p4 = regex_engine.compile(r"^Neighbor: interface-id +(?P<interface_id>([0-9]+)), "
+                                  r"link-local address +(?P<link_local>(['a-z:0-9']+))$")
 
         # Neighbor priority is 1, State is FULL, 6 state changes
-        p5 = re.compile(r"^Neighbor priority is +(?P<neighbor_priority>([0-9])+), "
-                        r"State is +(?P<state>([A-Z]+)), "
-                        r"+(?P<state_changes>([0-9]+)) state changes$")
+        p5 = regex_engine.compile(r"^Neighbor priority is +(?P<neighbor_priority>([0-9])+), "
+                                  r"State is +(?P<state>([A-Z]+)), "
+                                  r"+(?P<state_changes>([0-9]+)) state changes$")
 
         # Options is 0x13
-        p6 = re.compile(r"^Options +is +(?P<options>(\S+))$")
+        p6 = regex_engine.compile(r"^Options +is +(?P<options>(\S+))$")
 
         # Dead timer due in 00:00:38
-        p7 = re.compile(r"^Dead timer due in (?P<time>[0-9:]+)$")
+        p7 = regex_engine.compile(r"^Dead timer due in (?P<time>[0-9:]+)$")
 
         # Neighbor is up for 00:31:44
-        p8 = re.compile(r"^Neighbor is up for (?P<time>[0-9:]+)$")
+        p8 = regex_engine.compile(r"^Neighbor is up for (?P<time>[0-9:]+)$")
 
         # Index 1/46/46, retransmission queue length 0, number of retransmission 0
-        p9 = re.compile(r"^Index +(?P<index>(\S+)) +retransmission +queue +length +(?P<ql>(\d+)), "
-                        r"+number +of +retransmission +(?P<num_retrans>(\d+))$")
+        p9 = regex_engine.compile(r"^Index +(?P<index>(\S+)) +retransmission +queue +length +(?P<ql>(\d+)), "
+                                  r"+number +of +retransmission +(?P<num_retrans>(\d+))$")
 
         # First 0(0)/0(0)/0(0) Next 0(0)/0(0)/0(0)
-        p10 = re.compile(r"^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$")
+        p10 = regex_engine.compile(r"^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$")
 
         # Last retransmission scan length is 0, maximum is 0
-        p11 = re.compile(r"^Last retransmission scan length is +(?P<length>([0-9]+)), "
-                         r"maximum is +(?P<maximum>([0-9]+))$")
+        p11 = regex_engine.compile(r"^Last retransmission scan length is +(?P<length>([0-9]+)), "
+                                   r"maximum is +(?P<maximum>([0-9]+))$")
 
         # Last retransmission scan time is 0 msec, maximum is 0 msec
-        p12 = re.compile(r"^Last retransmission scan time is (?P<scan_time>([0-9]+)), "
-                         r"maximum is (?P<max_time>([0-9]+))")
+        p12 = regex_engine.compile(r"^Last retransmission scan time is (?P<scan_time>([0-9]+)), "
+                                   r"maximum is (?P<max_time>([0-9]+))")
 
         # Total neighbor count: 24
-        p13 = re.compile(r"^Total +neighbor +count: +(?P<num>(\d+))$")
+        p13 = regex_engine.compile(r"^Total +neighbor +count: +(?P<num>(\d+))$")
 
         # loop through output and add to ret_dict
         for line in output.splitlines():
@@ -748,42 +750,42 @@ class ShowOspfv3Interface(ShowOspfv3InterfaceSchema):
 
         # GigabitEthernet0/0/0/0 is up, line protocol is up
         # Loopback0 is up, line protocol is up
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<interface>(\S+)) +is( +administratively)?"
             r" +(?P<enable>(unknown|up|down)), +line +protocol +is"
             r" +(?P<line_protocol>(up|down))$")
 
         # Link Local address fe80:100:10::1, Interface ID 7
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^Link +Local +address +(?P<link_local_address>(\S+)),"
             r" +Interface ID +(?P<interface_id>(\S+))$")
 
         # Area 0, Process ID mpls1, Instance ID 0, Router ID 10.94.1.1
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^Area +(?P<area>(\S+))"
             r", +Process +ID +(?P<pid>(\S+))"
             r", +Instance +ID +(?P<instance>(\S+))"
             r", +Router +ID +(?P<router_id>(\S+))$")
 
         # Network Type POINT_TO_POINT, Cost: 1
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Network +Type +(?P<network_type>(\S+))"
             r", +Cost: +(?P<cost>(\S+))$")
 
         # BFD enabled, interval 150 msec, multiplier 3, mode Default
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^BFD +(?P<bfd_status>(\S+))"
             r"(?:, +interval +(?P<interval>(\d+)) +msec)?"
             r"(?:, +multiplier +(?P<multi>(\d+)))?"
             r"(?:, +mode +(?P<mode>(\S+)))?$")
 
         # Transmit Delay is 1 sec, State POINT_TO_POINT,
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Transmit +Delay is +(?P<delay>(\d+)) +sec"
             r", +State +(?P<state>(\w)+),$")
 
         # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Timer +intervals +configured"
             r", +Hello +(?P<hello>(\d+))"
             r", +Dead +(?P<dead>(\d+))"
@@ -791,41 +793,41 @@ class ShowOspfv3Interface(ShowOspfv3InterfaceSchema):
             r", +Retransmit +(?P<retransmit>(\d+))$")
 
         # Hello due in 00:00:08
-        p8 = re.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
+        p8 = regex_engine.compile(r"^Hello +due +in +(?P<hello_timer>(\S+))$")
 
         # Index 1/1/1, flood queue length 0
-        p9 = re.compile(r"^Index +(?P<index>(\S+)), +flood +queue +length +(?P<flood_queue_length>(\d+))$")
+        p9 = regex_engine.compile(r"^Index +(?P<index>(\S+)), +flood +queue +length +(?P<flood_queue_length>(\d+))$")
 
         # Next 0(0)/0(0)/0(0)
-        p10 = re.compile(r"^Next +(?P<next>(\S+))$")
+        p10 = regex_engine.compile(r"^Next +(?P<next>(\S+))$")
 
         # Last flood scan length is 1, maximum is 4
-        p11 = re.compile(r"^Last +flood +scan +length +is +(?P<last_flood_scan_length>(\d+))"
-                         r", +maximum +is +(?P<max_flood_scan_length>(\d+))$")
+        p11 = regex_engine.compile(r"^Last +flood +scan +length +is +(?P<last_flood_scan_length>(\d+))"
+                                   r", +maximum +is +(?P<max_flood_scan_length>(\d+))$")
 
         # Last flood scan time is 0 msec, maximum is 0 msec
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^Last +flood +scan +time +is +(?P<last_flood_scan_time_msec>(\d+))"
             r" +msec, +maximum +is +(?P<max_flood_scan_time_msec>(\d+)) +msec$")
 
         # Neighbor Count is 1, Adjacent neighbor count is 1
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^Neighbor +Count +is +(?P<nbr_count>(\d+))"
             r", +Adjacent +neighbor +count +is"
             r" +(?P<adj_nbr_count>(\d+))$")
 
         # Adjacent with neighbor 10.220.100.100
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^Adjacent +with +neighbor +(?P<adj_with_nbr>(\S+))$")
 
         # Suppress hello for 0 neighbor(s)
-        p15 = re.compile(r"^Suppress +hello +for +(?P<num_nbrs_suppress_hello>(\d+)) +neighbor\(s\)$")
+        p15 = regex_engine.compile(r"^Suppress +hello +for +(?P<num_nbrs_suppress_hello>(\d+)) +neighbor\(s\)$")
 
         # Reference count is 6
-        p16 = re.compile(r"^Reference +count +is +(?P<refrence_count>(\d+))$")
+        p16 = regex_engine.compile(r"^Reference +count +is +(?P<refrence_count>(\d+))$")
 
         # Loopback interface is treated as a stub Host
-        p17 = re.compile(r"^(?P<loopback_txt>Loopback interface is treated as a stub Host)$")
+        p17 = regex_engine.compile(r"^(?P<loopback_txt>Loopback interface is treated as a stub Host)$")
 
         # Init vars
         ret_dict = {}
@@ -1107,63 +1109,63 @@ class ShowOspfv3VrfAllInclusiveDatabaseRouter(ShowOspfv3VrfAllInclusiveDatabaseR
         }
 
         # OSPFv3 Router with ID (96.96.96.96) (Process ID mpls1 VRF default)
-        p1 = re.compile(r'^OSPFv3 +Router +with +ID +\((?P<router_id>(\S+))\) +\(Process +ID +(?P<instance>(\S+))(?: +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = regex_engine.compile(r'^OSPFv3 +Router +with +ID +\((?P<router_id>(\S+))\) +\(Process +ID +(?P<instance>(\S+))(?: +VRF +(?P<vrf>(\S+)))?\)$')
         
         # Router Link States (Area 0)
-        p2 = re.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States +\(Area'
-                        r' +(?P<area>(\S+))\)$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States +\(Area'
+                                  r' +(?P<area>(\S+))\)$')
 
         # Routing Bit Set on this LSA
-        p3 = re.compile(r"^Routing +Bit +Set +on +this +LSA$")
+        p3 = regex_engine.compile(r"^Routing +Bit +Set +on +this +LSA$")
 
         # LS age: 1472
-        p4 = re.compile(r"^LS +age: +(?P<age>(\d+))$")
+        p4 = regex_engine.compile(r"^LS +age: +(?P<age>(\d+))$")
  
         # Options: (V6-Bit E-Bit R-Bit DC-Bit)
-        p5 = re.compile(r"^Options: +\((?P<options>(.*))\)$")
+        p5 = regex_engine.compile(r"^Options: +\((?P<options>(.*))\)$")
 
         # LS Type: Router Links
-        p6 = re.compile(r"^LS +Type: +(?P<lsa_type>(.*))$")
+        p6 = regex_engine.compile(r"^LS +Type: +(?P<lsa_type>(.*))$")
         
         # Link State ID: 0
-        p7 = re.compile(r"^Link +State +ID: +(?P<lsa_id>(\d+))(?: +\(.*\))?$")
+        p7 = regex_engine.compile(r"^Link +State +ID: +(?P<lsa_id>(\d+))(?: +\(.*\))?$")
 
         # Advertising Router: 25.97.1.1
-        p8 = re.compile(r"^Advertising +Router: +(?P<adv_router>(\S+))$")
+        p8 = regex_engine.compile(r"^Advertising +Router: +(?P<adv_router>(\S+))$")
 
         # LS Seq Number: 80000007
-        p9 = re.compile(r"^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$")
+        p9 = regex_engine.compile(r"^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$")
 
         # Checksum: 0x2132
-        p10 = re.compile(r"^Checksum: +(?P<checksum>(\S+))$")
+        p10 = regex_engine.compile(r"^Checksum: +(?P<checksum>(\S+))$")
 
         # Length: 56
-        p11 = re.compile(r"^Length: +(?P<length>(\d+))$")
+        p11 = regex_engine.compile(r"^Length: +(?P<length>(\d+))$")
 
         # AS Boundary Router
-        p12 = re.compile(r"^AS +Boundary +Router$")
+        p12 = regex_engine.compile(r"^AS +Boundary +Router$")
 
         # Number of Links: 2
-        p13 = re.compile(r"^Number +of +(l|L)inks *: +(?P<num>(\d+))$")
+        p13 = regex_engine.compile(r"^Number +of +(l|L)inks *: +(?P<num>(\d+))$")
    
         # Link connected to: a Transit Network
-        p14_1 = re.compile(r"^Link +connected +to: +a +(?P<type>(.*))$")
+        p14_1 = regex_engine.compile(r"^Link +connected +to: +a +(?P<type>(.*))$")
         # Link connected to: another Router (point-to-point)
-        p14_2 = re.compile(r"^Link +connected +to: +(?P<type>(.*))$")
+        p14_2 = regex_engine.compile(r"^Link +connected +to: +(?P<type>(.*))$")
 
         # Link Metric: 65535
-        p15 = re.compile(r"^Link +Metric: +(?P<link_metric>(\d+))$")
+        p15 = regex_engine.compile(r"^Link +Metric: +(?P<link_metric>(\d+))$")
 
         # Local Interface ID: 7
-        p16 = re.compile(r"^Local +Interface +ID: +(?P<local_interface_id>(\d+))$")
+        p16 = regex_engine.compile(r"^Local +Interface +ID: +(?P<local_interface_id>(\d+))$")
 
         # Neighbor Interface ID: 6
         # Neighbor (DR) Interface ID: 6
-        p17 = re.compile(r"^Neighbor.*Interface +ID: +(?P<neighbor_interface_id>(\d+))$")
+        p17 = regex_engine.compile(r"^Neighbor.*Interface +ID: +(?P<neighbor_interface_id>(\d+))$")
 
         # Neighbor Router ID: 95.95.95.95
         # Neighbor (DR) Router ID: 96.96.96.96
-        p18 = re.compile(r"^Neighbor.*Router +ID: +(?P<neighbor_router_id>(\S+))$")
+        p18 = regex_engine.compile(r"^Neighbor.*Router +ID: +(?P<neighbor_router_id>(\S+))$")
 
 
         for line in out.splitlines():
@@ -1488,52 +1490,52 @@ class ShowOspfv3VrfAllInclusiveDatabasePrefix(ShowOspfv3VrfAllInclusiveDatabaseP
         }
 
         # OSPFv3 Router with ID (25.97.1.1) (Process ID mpls1 VRF default)
-        p1 = re.compile(r'^OSPFv3 +Router +with +ID +\(\S+\) +\(Process +ID +(?P<instance>(\S+))(?: +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = regex_engine.compile(r'^OSPFv3 +Router +with +ID +\(\S+\) +\(Process +ID +(?P<instance>(\S+))(?: +VRF +(?P<vrf>(\S+)))?\)$')
 
         # Intra Area Prefix Link States (Area 0)
-        p2 = re.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States +\(Area'
-                        r' +(?P<area>(\S+))\)$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States +\(Area'
+                                  r' +(?P<area>(\S+))\)$')
 
         # Routing Bit Set on this LSA
-        p3 = re.compile(r'^Routing +Bit +Set +on +this +LSA$')
+        p3 = regex_engine.compile(r'^Routing +Bit +Set +on +this +LSA$')
         # LS age: 852
-        p4 = re.compile(r'^LS +age: +(?P<age>(\d+))$')
+        p4 = regex_engine.compile(r'^LS +age: +(?P<age>(\d+))$')
 
         # LS Type: Intra-Area-Prefix-LSA
-        p5 = re.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
+        p5 = regex_engine.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
 
         # Link State ID: 0
-        p6 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\d+))(?: +\(.*\))?$')
+        p6 = regex_engine.compile(r'^Link +State +ID: +(?P<lsa_id>(\d+))(?: +\(.*\))?$')
 
         # Advertising Router: 25.97.1.1
-        p7 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
+        p7 = regex_engine.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
 
         # LS Seq Number: 80000002
-        p8 = re.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
+        p8 = regex_engine.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
 
         # Checksum: 0x66cb
-        p9 = re.compile(r'^Checksum: +(?P<checksum>(\S+))$')
+        p9 = regex_engine.compile(r'^Checksum: +(?P<checksum>(\S+))$')
 
         # Length: 76
-        p10 = re.compile(r'^Length: +(?P<length>(\d+))$')
+        p10 = regex_engine.compile(r'^Length: +(?P<length>(\d+))$')
 
         # Referenced LSA Type: 2001
-        p11 = re.compile(r'^Referenced +LSA +Type: +(?P<ref_lsa_type>(.*))$')
+        p11 = regex_engine.compile(r'^Referenced +LSA +Type: +(?P<ref_lsa_type>(.*))$')
 
         # Referenced Link State ID: 0
-        p12 = re.compile(r'^Referenced +Link +State +ID: +(?P<ref_lsa_id>(\d+))(?: +\(.*\))?$')
+        p12 = regex_engine.compile(r'^Referenced +Link +State +ID: +(?P<ref_lsa_id>(\d+))(?: +\(.*\))?$')
 
         # Referenced Advertising Router: 25.97.1.1
-        p13 = re.compile(r'^Referenced +Advertising +Router: +(?P<ref_adv_router>(\S+))$')
+        p13 = regex_engine.compile(r'^Referenced +Advertising +Router: +(?P<ref_adv_router>(\S+))$')
 
         # Number of Prefixes: 3
-        p14 = re.compile(r'^Number +of +Prefixes: +(?P<number_of_prefix>(\S+))$')
+        p14 = regex_engine.compile(r'^Number +of +Prefixes: +(?P<number_of_prefix>(\S+))$')
 
         # Prefix Address: 2001:1100::1001
-        p15 = re.compile(r'^Prefix +Address: +(?P<prefix_address>(\S+))$')
+        p15 = regex_engine.compile(r'^Prefix +Address: +(?P<prefix_address>(\S+))$')
 
         # Prefix Length: 128, Options: None, Metric: 65535, Priority: Medium
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r'^Prefix +Length: +(?P<prefix_length>(\d+))\s*,'
             r' +Options: +(?P<options>(\S+))\s*,'
             r' +Metric: +(?P<metric>(\d+))\s*,'
@@ -1762,18 +1764,18 @@ class ShowOspfv3DatabaseprefixAdvRouter(ShowOspfv3DatabaseprefixAdvRouterSchema)
 
 
         #OSPF Router with ID (10.0.0.3) (Process ID 37)
-        p1 = re.compile(r'^OSPFv3 +Router +with +ID +\((?P<router_id>(\S+))\) '
-                        r'+\(Process +ID +(?P<instance>(\S+))(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1 = regex_engine.compile(r'^OSPFv3 +Router +with +ID +\((?P<router_id>(\S+))\) '
+                                  r'+\(Process +ID +(?P<instance>(\S+))(?:, +VRF +(?P<vrf>(\S+)))?\)$')
         
         #Router Link States (Area 0)
-        p2 = re.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States +\(Area'
-                        r' +(?P<area>(\S+))\)$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type>([a-zA-Z0-9\s\D]+)) +Link +States +\(Area'
+                                  r' +(?P<area>(\S+))\)$')
         
         #Advertising Router: 10.0.0.3
-        p3 = re.compile(r'^Advertising Router: +(?P<advertising_router>(\S+))$')
+        p3 = regex_engine.compile(r'^Advertising Router: +(?P<advertising_router>(\S+))$')
         
         #Prefix Address: fc00:a000:2000::3
-        p4 = re.compile(r'^Prefix Address: +(?P<prefix_address>(\S+))$')
+        p4 = regex_engine.compile(r'^Prefix Address: +(?P<prefix_address>(\S+))$')
         
         for line in output.splitlines():
             line = line.strip()
@@ -8,14 +8,14 @@ IOSXR parsers for the following show commands:
     * 'show pim vrf <vrf> topology summary
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ===============================================
 # Schema for 'show pim vrf <vrf> <address_family> mstatic'
 # ===============================================
@@ -68,12 +68,12 @@ class ShowPimVrfMstatic(ShowPimVrfMstaticSchema):
             line = line.rstrip()
 
             # * 10.10.10.10/32 via GigabitEthernet0/0/0/0 with nexthop 192.168.1.1 and distance 0
-            p1 = re.compile(r'^\s*(?P<var>(\*))'
-                             r' *(?P<address>(\S+))'
-                             r'\/(?P<prefix_mask>[0-9]+) +via'
-                             r' +(?P<interface_name>(\S+)) +with +nexthop'
-                             r' +(?P<neighbor_address>(\S+)) +and +distance'
-                             r' +(?P<admin_distance>[0-9]+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<var>(\*))'
+                                       r' *(?P<address>(\S+))'
+                                       r'\/(?P<prefix_mask>[0-9]+) +via'
+                                       r' +(?P<interface_name>(\S+)) +with +nexthop'
+                                       r' +(?P<neighbor_address>(\S+)) +and +distance'
+                                       r' +(?P<admin_distance>[0-9]+)$')
             m = p1.match(line)
             if m:
                 # Get values
@@ -183,8 +183,8 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
             line = line.strip()
 
             # PIM interfaces in VRF default
-            p1 = re.compile(r'^PIM +interfaces +in +VRF'
-                             r' +(?P<vrf_name>[a-zA-Z0-9\-]+)$')
+            p1 = regex_engine.compile(r'^PIM +interfaces +in +VRF'
+                                       r' +(?P<vrf_name>[a-zA-Z0-9\-]+)$')
             m = p1.match(line)
             if m:
                 vrf_name = str(m.groupdict()['vrf_name'])
@@ -195,7 +195,7 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                 continue
 
             # IP PIM Multicast Interface State
-            p2 = re.compile(r'^IP +PIM +Multicast +Interface +State$')
+            p2 = regex_engine.compile(r'^IP +PIM +Multicast +Interface +State$')
             m = p2.match(line)
             if m:
                 continue
@@ -209,9 +209,9 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
 
             # Loopback0                   on   1     30     1
             # Loopback0off                  1     30     1
-            p3 = re.compile(r'^(?P<interface>(\S+)) *(?P<oper_status>(on|off)) +'
-                             '(?P<nbr_count>[0-9]+) +(?P<hello_interval>[0-9]+) +'
-                             '(?P<dr_priority>[0-9]+)$')
+            p3 = regex_engine.compile(r'^(?P<interface>(\S+)) *(?P<oper_status>(on|off)) +'
+                                       '(?P<nbr_count>[0-9]+) +(?P<hello_interval>[0-9]+) +'
+                                       '(?P<dr_priority>[0-9]+)$')
             m = p3.match(line)
             if m:
                 # Get values
@@ -243,8 +243,8 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                 continue
 
             # Primary Address : fe80::85c6:bdff:fe62:61e
-            p4 = re.compile(r'^Primary +Address *:'
-                             r' +(?P<primary_address>(\S+))$')
+            p4 = regex_engine.compile(r'^Primary +Address *:'
+                                       r' +(?P<primary_address>(\S+))$')
             m = p4.match(line)
             if m:
                 if m.groupdict()['primary_address']:
@@ -254,7 +254,7 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                 continue
 
             # Address : 2001:db8:2:2::2
-            p5 = re.compile(r'^Address *: +(?P<address>(\S+))$')
+            p5 = regex_engine.compile(r'^Address *: +(?P<address>(\S+))$')
             m = p5.match(line)
             if m:
                 if m.groupdict()['address']:
@@ -263,16 +263,16 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                 continue
 
             # Flags : B P NA V
-            p6 = re.compile(r'^Flags *: +(?P<flags>[a-zA-Z\s]+)$')
+            p6 = regex_engine.compile(r'^Flags *: +(?P<flags>[a-zA-Z\s]+)$')
             m = p6.match(line)
             if m:
                 sub_dict['flags'] = m.groupdict()['flags']
                 continue
 
             # BFD : Off/150 ms/3
-            p7 = re.compile(r'^BFD *: (?P<enable>(Off|On))'
-                             r'\/(?P<interval>[0-9]+)'
-                             r' *ms\/(?P<dmultiplier>[0-9]+)$')
+            p7 = regex_engine.compile(r'^BFD *: (?P<enable>(Off|On))'
+                                       r'\/(?P<interval>[0-9]+)'
+                                       r' *ms\/(?P<dmultiplier>[0-9]+)$')
             m = p7.match(line)
             if m:
                 # Get values
@@ -292,7 +292,7 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
 
             # DR : 10.0.0.2
             # DR : this system
-            p8 = re.compile(r'^DR *: (?P<dr>[\s\w\.\:]+)$')
+            p8 = regex_engine.compile(r'^DR *: (?P<dr>[\s\w\.\:]+)$')
             m = p8.match(line)
             if m:
                 sub_dict['dr'] = m.groupdict()['dr']
@@ -300,8 +300,8 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
 
             # Propagation delay : 500
             # Propagation delay : 500   (config: 500)
-            p9 = re.compile(r'^Propagation +delay *:'
-                             r' +(?P<propagation_delay>[0-9]+)')
+            p9 = regex_engine.compile(r'^Propagation +delay *:'
+                                       r' +(?P<propagation_delay>[0-9]+)')
             m = p9.match(line)
             if m:
                 sub_dict['propagation_delay'] = \
@@ -310,8 +310,8 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
 
             # Override Interval : 2500
             # Override Interval : 2500   (config: 2500)
-            p10 = re.compile(r'^Override +Interval *:'
-                              r' +(?P<override_interval>[0-9]+)')
+            p10 = regex_engine.compile(r'^Override +Interval *:'
+                                        r' +(?P<override_interval>[0-9]+)')
             m = p10.match(line)
             if m:
                 sub_dict['override_interval'] = \
@@ -319,15 +319,15 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
                 continue
 
             # Hello Timer : 00:00:19
-            p11 = re.compile(r'^Hello +Timer *: +(?P<hello_expiration>(\S+))$')
+            p11 = regex_engine.compile(r'^Hello +Timer *: +(?P<hello_expiration>(\S+))$')
             m = p11.match(line)
             if m:
                 sub_dict['hello_expiration'] = m.groupdict()['hello_expiration']
                 continue
 
             # Neighbor Filter : -
-            p12 = re.compile(r'^Neighbor +Filter *:'
-                              r' +(?P<neighbor_filter>(\S+))$')
+            p12 = regex_engine.compile(r'^Neighbor +Filter *:'
+                                        r' +(?P<neighbor_filter>(\S+))$')
             m = p12.match(line)
             if m:
                 sub_dict['neighbor_filter'] = m.groupdict()['neighbor_filter']
@@ -407,8 +407,8 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 created = True
 
             # ISIS Mcast Topology Not configured
-            p1 = re.compile(r'^\s*ISIS +Mcast +Topology'
-                             r' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+            p1 = regex_engine.compile(r'^\s*ISIS +Mcast +Topology'
+                                       r' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p1.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -419,8 +419,8 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 continue
 
             # MoFRR Flow-based    Not configured
-            p2 = re.compile(r'^\s*MoFRR +Flow-based'
-                             r' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+            p2 = regex_engine.compile(r'^\s*MoFRR +Flow-based'
+                                       r' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p2.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -431,7 +431,7 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 continue
 
             # MoFRR RIB           Not configured
-            p3 = re.compile(r'^\s*MoFRR +RIB +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+            p3 = regex_engine.compile(r'^\s*MoFRR +RIB +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p3.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -442,7 +442,7 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 continue
 
             # RUMP MuRIB          Not enabled
-            p4 = re.compile(r'^\s*RUMP +MuRIB +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+            p4 = regex_engine.compile(r'^\s*RUMP +MuRIB +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p4.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -453,8 +453,8 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 continue
 
             # PIM RPFs registered with Unicast RIB table
-            p5 = re.compile(r'^\s*PIM +RPFs +registered +with'
-                             r' +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
+            p5 = regex_engine.compile(r'^\s*PIM +RPFs +registered +with'
+                                       r' +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
             m = p5.match(line)
             if m:
                 if m.groupdict()['table']:
@@ -463,8 +463,8 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 continue
 
             # Default RPF Table: IPv4-Unicast-default
-            p6 = re.compile(r'^\s*Default +RPF +Table:'
-                             r' +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
+            p6 = regex_engine.compile(r'^\s*Default +RPF +Table:'
+                                       r' +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
             m = p6.match(line)
             if m:
                 if m.groupdict()['table']:
@@ -472,8 +472,8 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 continue
 
             # RIB Convergence Timeout Value: 00:30:00
-            p7 = re.compile(r'^\s*RIB +Convergence +Timeout +Value:'
-                             r' +(?P<time>(\S+))$')
+            p7 = regex_engine.compile(r'^\s*RIB +Convergence +Timeout +Value:'
+                                       r' +(?P<time>(\S+))$')
             m = p7.match(line)
             if m:
                 if m.groupdict()['time']:
@@ -482,8 +482,8 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 continue
 
             # RIB Convergence Time Left:     00:00:00
-            p8 = re.compile(r'^\s*RIB +Convergence +Time Left:'
-                             r' +(?P<time>(\S+))$')
+            p8 = regex_engine.compile(r'^\s*RIB +Convergence +Time Left:'
+                                       r' +(?P<time>(\S+))$')
             m = p8.match(line)
             if m:
                 if m.groupdict()['time']:
@@ -492,8 +492,8 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 continue
 
             # Multipath RPF Selection is Enabled
-            p9 = re.compile(r'^\s*Multipath +RPF +Selection +is'
-                             r' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+            p9 = regex_engine.compile(r'^\s*Multipath +RPF +Selection +is'
+                                       r' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p9.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -504,7 +504,7 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 continue
 
             # Table: IPv6-Unicast-default
-            p10 = re.compile(r'^\s*Table: +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
+            p10 = regex_engine.compile(r'^\s*Table: +(?P<table>[a-zA-Z0-9\s\_\-]+)$')
             m = p10.match(line)
             if m:
                 if m.groupdict()['table']:
@@ -516,7 +516,7 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                     continue
 
             # PIM RPF Registrations = 0
-            p10 = re.compile(r'^\s*PIM +RPF +Registrations += (?P<var>[0-9]+)$')
+            p10 = regex_engine.compile(r'^\s*PIM +RPF +Registrations += (?P<var>[0-9]+)$')
             m = p10.match(line)
             if m:
                 sub_dict['table'][table]['pim_rpf_registrations'] = \
@@ -524,8 +524,8 @@ class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
                 continue
 
             # RIB Table converged
-            p11 = re.compile(r'^\s*RIB +Table'
-                              r' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
+            p11 = regex_engine.compile(r'^\s*RIB +Table'
+                                        r' +(?P<status>[a-zA-Z0-9\s\_\-]+)$')
             m = p11.match(line)
             if m:
                 status = m.groupdict()['status']
@@ -610,20 +610,20 @@ class ShowPimTopologySummary(ShowPimTopologySummarySchema):
         parsed_dict = {}
 
         # PIM Topology Summary for VRF vpn1
-        p1 = re.compile(r"PIM Topology Summary for VRF (?P<vrf>\S+)")
+        p1 = regex_engine.compile(r"PIM Topology Summary for VRF (?P<vrf>\S+)")
 
         # No. of group ranges = 6 (Active group ranges = 5)
-        p2 = re.compile(r"No\. of group ranges = (?P<no_group_ranges>\d+) "
-                        r"\(Active group ranges = (?P<active_group_ranges>\d+)\)")
+        p2 = regex_engine.compile(r"No\. of group ranges = (?P<no_group_ranges>\d+) "
+                                  r"\(Active group ranges = (?P<active_group_ranges>\d+)\)")
 
         # No. of (*,G) routes = 1
-        p3 = re.compile(r"No\. of \(\*,G\) routes = (?P<no_g_routes>\d+)")
+        p3 = regex_engine.compile(r"No\. of \(\*,G\) routes = (?P<no_g_routes>\d+)")
 
         # No. of (S,G) routes = 1100
-        p4 = re.compile(r"No\. of \(S,G\) routes = (?P<no_sg_routes>\d+)")
+        p4 = regex_engine.compile(r"No\. of \(S,G\) routes = (?P<no_sg_routes>\d+)")
 
         # No. of (S,G)RPT routes = 0
-        p5 = re.compile(r"No\. of \(S,G\)RPT routes = (?P<no_sg_rpt_routes>\d+)")
+        p5 = regex_engine.compile(r"No\. of \(S,G\)RPT routes = (?P<no_sg_rpt_routes>\d+)")
 
         for line in out.splitlines():
             line = line.strip()
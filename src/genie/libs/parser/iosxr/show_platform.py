@@ -32,13 +32,16 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 logger = logging.getLogger(__name__)
 
 
 def regexp(expression):
     def match(value):
-        if re.match(expression,value):
+        if regex_engine.match(expression,value):
             return value
         else:
             raise TypeError("Value '%s' doesnt match regex '%s'"
@@ -85,51 +88,51 @@ class ShowVersion(ShowVersionSchema):
 
         # Cisco IOS XR Software, Version 6.3.1.15I
         # Cisco IOS XR Software, Version 6.1.4.10I[Default]
-        p1 = re.compile(r'\s*Cisco +IOS +XR +Software, +Version'
-                        r' +(?P<software_version>[A-Z0-9\.]+)(?:\[Default\])?(\sLNT)?$')
+        p1 = regex_engine.compile(r'\s*Cisco +IOS +XR +Software, +Version'
+                                  r' +(?P<software_version>[A-Z0-9\.]+)(?:\[Default\])?(\sLNT)?$')
 
         # System uptime is 1 week, 1 day, 5 hours, 47 minutes
         # PE1 uptime is 3 hours, 11 minutes
-        p2 = re.compile(r'\s*.* +uptime +is +(?P<uptime>[a-zA-Z0-9\s\,]+)$')
+        p2 = regex_engine.compile(r'\s*.* +uptime +is +(?P<uptime>[a-zA-Z0-9\s\,]+)$')
 
         # System image file is "disk0:asr9k-os-mbi-6.1.4.10I/0x100305/mbiasr9k-rsp3.vm"
-        p3 = re.compile(r'\s*System +image +file +is'
-                        r' +\"(?P<image>[a-zA-Z0-9\:\/\.\-]+)\"$')
+        p3 = regex_engine.compile(r'\s*System +image +file +is'
+                                  r' +\"(?P<image>[a-zA-Z0-9\:\/\.\-]+)\"$')
 
         # cisco IOS-XRv 9000 () processor
-        p4 = re.compile(r'\s*cisco +(?P<device_family>[a-zA-Z0-9\-\s]+)'
-                        r' +\(\) +processor$')
+        p4 = regex_engine.compile(r'\s*cisco +(?P<device_family>[a-zA-Z0-9\-\s]+)'
+                                  r' +\(\) +processor$')
 
         # cisco ASR9K Series (Intel 686 F6M14S4) processor with 6291456K bytes of memory.
         # cisco CRS-16/S-B (Intel 686 F6M14S4) processor with 12582912K bytes of memory.
-        p5 = re.compile(r'^cisco +(?P<device_family>[a-zA-Z0-9\/\-\s]+)'
-                        r'(?:( +Series))? +\((?P<processor>[a-zA-Z0-9\s]+)\)'
-                        r' +processor +with +(?P<processor_memory_bytes>[0-9A-Z]+)'
-                        r' +bytes +of +memory.$')
+        p5 = regex_engine.compile(r'^cisco +(?P<device_family>[a-zA-Z0-9\/\-\s]+)'
+                                  r'(?:( +Series))? +\((?P<processor>[a-zA-Z0-9\s]+)\)'
+                                  r' +processor +with +(?P<processor_memory_bytes>[0-9A-Z]+)'
+                                  r' +bytes +of +memory.$')
 
         # cisco 8201-32FH (Intel(R) Xeon(R) CPU D-1530 @ 2.40GHz) processor with 32GB of memory
         # cisco 8202-32FH-M (Intel(R) Xeon(R) CPU D-1530 @ 2.40GHz) processor with 64GB of memory
-        p5_1 = re.compile(r'^cisco +(?P<pid>[a-zA-Z0-9\/\-\s]+)'
-                          r' +\((?P<processor>.+)\)'
-                          r' +processor +with +(?P<processor_memory_bytes>[0-9A-Z]+)'
-                          r' +of +memory$')
+        p5_1 = regex_engine.compile(r'^cisco +(?P<pid>[a-zA-Z0-9\/\-\s]+)'
+                                    r' +\((?P<processor>.+)\)'
+                                    r' +processor +with +(?P<processor_memory_bytes>[0-9A-Z]+)'
+                                    r' +of +memory$')
 
         # Configuration register on node 0/RSP0/CPU0 is 0x1922
-        p6 = re.compile(r'\s*Configuration +register +on +node'
-                        r' +(?P<node>[A-Z0-9\/]+) +is'
-                        r' +(?P<config_register>[x0-9]+)$')
+        p6 = regex_engine.compile(r'\s*Configuration +register +on +node'
+                                  r' +(?P<node>[A-Z0-9\/]+) +is'
+                                  r' +(?P<config_register>[x0-9]+)$')
 
         # ASR 9006 4 Line Card Slot Chassis with V2 AC PEM
-        p7 = re.compile(r'\s*.*Chassis.*$')
+        p7 = regex_engine.compile(r'\s*.*Chassis.*$')
 
         # Built By     : xyz
-        p8 = re.compile(r'^Built\s+By\s*:\s+(?P<built_by>\S+)$')
+        p8 = regex_engine.compile(r'^Built\s+By\s*:\s+(?P<built_by>\S+)$')
 
         # Built On     : Fri Dec 13 16:42:11 PST 2019
-        p9 = re.compile(r'^Built\s+On\s*:\s+(?P<built_on>[a-zA-Z0-9\:\/\.\-\s]+)$')
+        p9 = regex_engine.compile(r'^Built\s+On\s*:\s+(?P<built_on>[a-zA-Z0-9\:\/\.\-\s]+)$')
 
         # Built Host   : iox-abc-123
-        p10 = re.compile(r'^Built\s+Host\s*:\s*(?P<built_host>\S+)$')
+        p10 = regex_engine.compile(r'^Built\s+Host\s*:\s*(?P<built_host>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -255,7 +258,7 @@ class ShowSdrDetail(ShowSdrDetailSchema):
 
             # SDR_id               : 0
             # SDR ID             : 2
-            p1 = re.compile(r'\s*(SDR_id|SDR ID) *: +(?P<sdr_id>[0-9]+)$')
+            p1 = regex_engine.compile(r'\s*(SDR_id|SDR ID) *: +(?P<sdr_id>[0-9]+)$')
             m = p1.match(line)
             if m:
                 if 'sdr_id' not in sdr_detail:
@@ -267,8 +270,8 @@ class ShowSdrDetail(ShowSdrDetailSchema):
 
             # SDR_name             : Owner
             # SDR name           : default-sdr
-            p2 = re.compile(r'\s*(SDR_name|SDR name) *:'
-                             r' +(?P<sdr_name>[a-zA-Z\-]+)$')
+            p2 = regex_engine.compile(r'\s*(SDR_name|SDR name) *:'
+                                       r' +(?P<sdr_name>[a-zA-Z\-]+)$')
             m = p2.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['sdr_name'] = \
@@ -276,8 +279,8 @@ class ShowSdrDetail(ShowSdrDetailSchema):
                 continue
 
             # dSDRsc node          : 0/0/CPU0
-            p3 = re.compile(r'\s*dSDRsc +node *:'
-                             r' +(?P<dsdrsc_node>[a-zA-Z0-9\/]+)$')
+            p3 = regex_engine.compile(r'\s*dSDRsc +node *:'
+                                       r' +(?P<dsdrsc_node>[a-zA-Z0-9\/]+)$')
             m = p3.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['dsdrsc_node'] \
@@ -285,8 +288,8 @@ class ShowSdrDetail(ShowSdrDetailSchema):
                 continue
 
             # dSDRsc partner node  : NONE
-            p4 = re.compile(r'\s*dSDRsc +partner +node *:'
-                             r' +(?P<dsdrsc_partner_node>[a-zA-Z0-9\/]+)$')
+            p4 = regex_engine.compile(r'\s*dSDRsc +partner +node *:'
+                                       r' +(?P<dsdrsc_partner_node>[a-zA-Z0-9\/]+)$')
             m = p4.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['dsdrsc_partner_node'] = \
@@ -295,8 +298,8 @@ class ShowSdrDetail(ShowSdrDetailSchema):
 
             # primary node1        : 0/0/CPU0
             # SDR lead (Primary) : 0x1000
-            p5 = re.compile(r'\s*(primary +node1|SDR +lead +\(Primary\)) *:'
-                             r' +(?P<primary_node1>[a-zA-Z0-9\/]+)$')
+            p5 = regex_engine.compile(r'\s*(primary +node1|SDR +lead +\(Primary\)) *:'
+                                       r' +(?P<primary_node1>[a-zA-Z0-9\/]+)$')
             m = p5.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['primary_node1'] = \
@@ -305,8 +308,8 @@ class ShowSdrDetail(ShowSdrDetailSchema):
 
             # primary node2        : NONE
             # SDR lead (Backup)  : 0xffffffff
-            p6 = re.compile(r'\s*(primary +node2|SDR +lead +\(Backup\)) *:'
-                             r' +(?P<primary_node2>[a-zA-Z0-9\/]+)$')
+            p6 = regex_engine.compile(r'\s*(primary +node2|SDR +lead +\(Backup\)) *:'
+                                       r' +(?P<primary_node2>[a-zA-Z0-9\/]+)$')
             m = p6.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['primary_node2'] = \
@@ -314,8 +317,8 @@ class ShowSdrDetail(ShowSdrDetailSchema):
                 continue
 
             # mac addr             : 025e.eaff.fb57
-            p7 = re.compile(r'\s*mac +addr *:'
-                             r' +(?P<mac_address>[a-zA-Z0-9\.]+)$')
+            p7 = regex_engine.compile(r'\s*mac +addr *:'
+                                       r' +(?P<mac_address>[a-zA-Z0-9\.]+)$')
             m = p7.match(line)
             if m:
                 sdr_detail['sdr_id'][sdr_id]['mac_address'] = \
@@ -325,11 +328,11 @@ class ShowSdrDetail(ShowSdrDetailSchema):
             # RP         0/0/CPU0      IOS XR RUN        Primary    NONE
             # RP         0/RSP0/CPU0   IOS XR RUN        Primary    0/RSP1/CPU0
             # RP         0/RSP0/CPU0   IOS XR RUN        Primary    0/RSP1/CPU0
-            p8 = re.compile(r'\s*(?P<type>[a-zA-Z0-9\-]+)'
-                             r' +(?P<node_name>[a-zA-Z0-9\/]+)'
-                             r' +(?P<node_status>[IOS XR RUN|OPERATIONAL|POWERED_ON]+)'
-                             r' +(?P<red_state>[a-zA-Z\/\-]+)?'
-                             r' +(?P<partner_name>[a-zA-Z0-9\/]+)$')
+            p8 = regex_engine.compile(r'\s*(?P<type>[a-zA-Z0-9\-]+)'
+                                       r' +(?P<node_name>[a-zA-Z0-9\/]+)'
+                                       r' +(?P<node_status>[IOS XR RUN|OPERATIONAL|POWERED_ON]+)'
+                                       r' +(?P<red_state>[a-zA-Z\/\-]+)?'
+                                       r' +(?P<partner_name>[a-zA-Z0-9\/]+)$')
             m = p8.match(line)
             if m:
                 if 'membership' not in sdr_detail['sdr_id'][sdr_id]:
@@ -402,12 +405,12 @@ class ShowPlatform(ShowPlatformSchema):
         # 1/3/3         MSC(SPA)          OC192RPR-XFP       DISABLED        NPWR,SHUT,MON
         # 1/10/CPU0     FP-X              N/A                UNPOWERED       NPWR,NSHUT,MON
 
-        p1 = re.compile(r'^\s*(?P<node>[a-zA-Z0-9\/]+)'
-                            r'\s+(?P<name>[a-zA-Z0-9\-\.]+)'
-                            r'(?:\((?P<redundancy_state>[a-zA-Z]+)\))?'
-                            r'(?: +(?P<plim>[a-zA-Z0-9(\/|\-| )]+))?'
-                            r'\s+(?P<state>(SW_INACTIVE|IN-RESET|UNPOWERED|DISABLED|IOS XR RUN|OK|OPERATIONAL|POWERED_ON))'
-                            r'\s+(?P<config_state>[a-zA-Z\,]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<node>[a-zA-Z0-9\/]+)'
+                                      r'\s+(?P<name>[a-zA-Z0-9\-\.]+)'
+                                      r'(?:\((?P<redundancy_state>[a-zA-Z]+)\))?'
+                                      r'(?: +(?P<plim>[a-zA-Z0-9(\/|\-| )]+))?'
+                                      r'\s+(?P<state>(SW_INACTIVE|IN-RESET|UNPOWERED|DISABLED|IOS XR RUN|OK|OPERATIONAL|POWERED_ON))'
+                                      r'\s+(?P<config_state>[a-zA-Z\,]+)$')
 
         # Init vars
         show_platform = {}
@@ -429,7 +432,7 @@ class ShowPlatform(ShowPlatformSchema):
                 config_state = str(m.groupdict()['config_state']).strip()
 
                 # Parse node for rack, slot, subslot details
-                parse_node = re.compile(r'\s*(?P<rack>[A-Z0-9]+)\/(?P<slot>[0-9A-Z]+)(?:\/(?P<last_entry>[0-9A-Z]+))?$').match(node)
+                parse_node = regex_engine.compile(r'\s*(?P<rack>[A-Z0-9]+)\/(?P<slot>[0-9A-Z]+)(?:\/(?P<last_entry>[0-9A-Z]+))?$').match(node)
                 rack = str(parse_node.groupdict()['rack'])
                 slot = rack + '/' + str(parse_node.groupdict()['slot'])
                 last_entry = str(parse_node.groupdict()['last_entry'])
@@ -437,17 +440,17 @@ class ShowPlatform(ShowPlatformSchema):
                 # Check if subslot/daughtercard
                 # 0/3/0
                 # 1/3/0
-                parse_subslot = re.compile(r'.*(0\/[0-9]\/[0-9]+).*').match(node)
-                parse_subslot2 = re.compile(r'.*(1\/[0-9]\/[0-9]+).*').match(node)
+                parse_subslot = regex_engine.compile(r'.*(0\/[0-9]\/[0-9]+).*').match(node)
+                parse_subslot2 = regex_engine.compile(r'.*(1\/[0-9]\/[0-9]+).*').match(node)
                 if (parse_subslot or parse_subslot2) and last_entry.isdigit():
                     # This entry is a daughtercard/subslot
                     entry_is_daughter = True
                     subslot = last_entry
 
                 # Determine if slot is RP/LineCard/OtherCard
-                parse_rp = re.compile(r'.*(RSP|RP).*').match(slot)
-                parse_lc = re.compile(r'.*(0\/)\d').match(slot)
-                parse_name = re.compile(r'.*(RSP|RP).*').match(name)
+                parse_rp = regex_engine.compile(r'.*(RSP|RP).*').match(slot)
+                parse_lc = regex_engine.compile(r'.*(0\/)\d').match(slot)
+                parse_name = regex_engine.compile(r'.*(RSP|RP).*').match(name)
                 if parse_rp or parse_name:
                     slot_type = 'rp'
                 elif parse_lc:
@@ -543,9 +546,9 @@ class ShowPlatformVm(ShowPlatformVmSchema):
             # 0/RSP0/CPU0     RP(ACTIVE)     0/RSP1/CPU0     FINAL Band      192.0.0.4
             # 0/RSP1/CPU0     RP(STANDBY)    0/RSP0/CPU0     FINAL Band      192.168.166.4
 
-            p1 = re.compile(r'^(?P<node>[\S\/]+) +(?P<type>[(RP|LC)\s*\((ACTIVE|STANDBY)\)]+)'
-                             r' +(?P<partner_name>[NONE|(?:\S)]+) +(?P<sw_status>[a-zA-Z\s]+)'
-                             r' +(?P<ip_address>[\S]+)$')
+            p1 = regex_engine.compile(r'^(?P<node>[\S\/]+) +(?P<type>[(RP|LC)\s*\((ACTIVE|STANDBY)\)]+)'
+                                       r' +(?P<partner_name>[NONE|(?:\S)]+) +(?P<sw_status>[a-zA-Z\s]+)'
+                                       r' +(?P<ip_address>[\S]+)$')
 
             m = p1.match(line)
             if m:
@@ -597,41 +600,41 @@ class ShowInstallActiveSummary(ShowInstallActiveSummarySchema):
         previous_line_sdr = False
         previous_line_active_packages = False
         #   SDRs:
-        p1 = re.compile(r'\s*SDRs:*$')
+        p1 = regex_engine.compile(r'\s*SDRs:*$')
 
         # disk0:xrvr-full-x-6.2.1.23I
         # disk0:asr9k-mini-px-6.1.21.15I
         # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
-        p2 = re.compile(r'\s*Active +Packages:'
-                                r' *(?P<num_active_packages>[0-9]+)?$')
+        p2 = regex_engine.compile(r'\s*Active +Packages:'
+                                          r' *(?P<num_active_packages>[0-9]+)?$')
 
         # Active Packages: XR: 201    All: 1532
-        p3 = re.compile(r'^Active +Packages: +XR: +(?P<xr>[\d]+)\s+All: +(?P<all>[\d]+)$')
+        p3 = regex_engine.compile(r'^Active +Packages: +XR: +(?P<xr>[\d]+)\s+All: +(?P<all>[\d]+)$')
 
         # Label:              7.10.2-meta_7102_fcs_01_25_2024
-        p4 = re.compile(r'^Label:\s+(?P<label>[\w\.\-]+)$')
+        p4 = regex_engine.compile(r'^Label:\s+(?P<label>[\w\.\-]+)$')
 
         # Software Hash:      454175afbe3ad586c3b39a79db238b53844fe794723ea99fa00ac1acd5442359
-        p5 = re.compile(r'^Software +Hash:\s+(?P<sh>[\w]+)$')
+        p5 = regex_engine.compile(r'^Software +Hash:\s+(?P<sh>[\w]+)$')
 
         # Optional Packages                                                        Version
         # ---------------------------------------------------- ---------------------------
         # xr-8000-netflow                                                   7.10.2v1.0.0-1
         # xr-bgp                                                            7.10.2v1.0.0-1
-        p6 = re.compile(r'^(?P<optional_packages>[\w\-]+)\s+(?P<version>[\w\.\-]+)$')
+        p6 = regex_engine.compile(r'^(?P<optional_packages>[\w\-]+)\s+(?P<version>[\w\.\-]+)$')
 
         # Mandatory Packages with Committed Bugfixes                               Version
         # xr-8000-core                                                      7.10.2v1.0.1-1
         # xr-8000-cpa-npu                                                   7.10.2v1.0.2-1
-        p7 = re.compile(r'^(?P<mandatory_packages>[\w\-]+)\s+(?P<version>[\w\.\-]+)$')
+        p7 = regex_engine.compile(r'^(?P<mandatory_packages>[\w\-]+)\s+(?P<version>[\w\.\-]+)$')
 
         # Active Fixes (count: 6):
-        p8 = re.compile(r"Active Fixes \(count: (?P<count>\d+)\):")
+        p8 = regex_engine.compile(r"Active Fixes \(count: (?P<count>\d+)\):")
 
         # CSCwh02785: xr-fib
         # CSCwh80170: xr-8000-cpa-npu
         # CSCwi62344: xr-8000-core, xr-8000-cpa-npu, xr-8000-leabaofa, xr-networkboot
-        p9 = re.compile(r'^\s*(?P<bug_id>CSC\w+): (?P<package_name>[\w\-\,\ ]+)$')
+        p9 = regex_engine.compile(r'^\s*(?P<bug_id>CSC\w+): (?P<package_name>[\w\-\,\ ]+)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -736,7 +739,7 @@ class ShowInstallInactiveSummary(ShowInstallInactiveSummarySchema):
         for line in out.splitlines():
             line = line.rstrip()
 
-            p1 = re.compile(r'\s*SDRs:*$')
+            p1 = regex_engine.compile(r'\s*SDRs:*$')
             m = p1.match(line)
             if m:
                 previous_line_sdr = True
@@ -751,8 +754,8 @@ class ShowInstallInactiveSummary(ShowInstallInactiveSummarySchema):
             # disk0:xrvr-full-x-6.2.1.23I
             # disk0:asr9k-mini-px-6.1.21.15I
             # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
-            p2 = re.compile(r'\s*Inactive +Packages:'
-                             r' *(?P<num_inactive_packages>[0-9]+)?$')
+            p2 = regex_engine.compile(r'\s*Inactive +Packages:'
+                                       r' *(?P<num_inactive_packages>[0-9]+)?$')
             m = p2.match(line)
             if m:
                 previous_line_inactive_packages = True
@@ -806,47 +809,47 @@ class ShowInstallCommitSummary(ShowInstallCommitSummarySchema):
         previous_line_active_packages = False
 
         #SDRs:
-        p1 = re.compile(r'\s*SDRs:*$')
+        p1 = regex_engine.compile(r'\s*SDRs:*$')
 
         # disk0:xrvr-full-x-6.2.1.23I
         # disk0:asr9k-mini-px-6.1.21.15I
         # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
-        p2 = re.compile(r'\s*Committed +Packages:'
-                        r' *(?P<num_committed_packages>[0-9]+)?$')
+        p2 = regex_engine.compile(r'\s*Committed +Packages:'
+                                  r' *(?P<num_committed_packages>[0-9]+)?$')
         
         # disk0:xrvr-full-x-6.2.1.23I
         # disk0:asr9k-mini-px-6.1.21.15I
         # xrv9k-xr-6.2.2.14I version=6.2.2.14I [Boot image]
-        p3 = re.compile(r'\s*Active +Packages:'
-                        r' *(?P<num_active_packages>[0-9]+)?$')
+        p3 = regex_engine.compile(r'\s*Active +Packages:'
+                                  r' *(?P<num_active_packages>[0-9]+)?$')
         
         # Committed Packages: XR: 201    All: 1532
-        p4 = re.compile(r'^Committed +Packages: +XR: +(?P<xr>[\d]+)\s+All: +(?P<all>[\d]+)$')
+        p4 = regex_engine.compile(r'^Committed +Packages: +XR: +(?P<xr>[\d]+)\s+All: +(?P<all>[\d]+)$')
 
         # Label:              7.10.2-meta_7102_fcs_01_25_2024
-        p5 = re.compile(r'^Label:\s+(?P<label>[\w\.\-]+)$')
+        p5 = regex_engine.compile(r'^Label:\s+(?P<label>[\w\.\-]+)$')
 
         # Software Hash:      454175afbe3ad586c3b39a79db238b53844fe794723ea99fa00ac1acd5442359
-        p6 = re.compile(r'^Software +Hash:\s+(?P<sh>[\w]+)$')
+        p6 = regex_engine.compile(r'^Software +Hash:\s+(?P<sh>[\w]+)$')
 
         # Optional Packages                                                        Version
         # ---------------------------------------------------- ---------------------------
         # xr-8000-netflow                                                   7.10.2v1.0.0-1
         # xr-bgp                                                            7.10.2v1.0.0-1
-        p7 = re.compile(r'^(?P<optionalpackages>[\w\-]+)\s+(?P<version>[\w\.\-]+)$')
+        p7 = regex_engine.compile(r'^(?P<optionalpackages>[\w\-]+)\s+(?P<version>[\w\.\-]+)$')
 
         # Mandatory Packages with Committed Bugfixes                               Version
         # xr-8000-core                                                      7.10.2v1.0.1-1
         # xr-8000-cpa-npu                                                   7.10.2v1.0.2-1
-        p8 = re.compile(r'^(?P<mandatory_packages>[\w\-]+)\s+(?P<version>[\w\.\-]+)$')
+        p8 = regex_engine.compile(r'^(?P<mandatory_packages>[\w\-]+)\s+(?P<version>[\w\.\-]+)$')
 
         # Committed Fixes (count: 6):
-        p9 = re.compile(r"Committed Fixes \(count: (?P<count>\d+)\):")
+        p9 = regex_engine.compile(r"Committed Fixes \(count: (?P<count>\d+)\):")
 
         # CSCwh02785: xr-fib
         # CSCwh80170: xr-8000-cpa-npu
         # CSCwi62344: xr-8000-core, xr-8000-cpa-npu, xr-8000-leabaofa, xr-networkboot
-        p10 = re.compile(r'^\s*(?P<bug_id>CSC\w+): (?P<package_name>[\w\-\,\ ]+)$')
+        p10 = regex_engine.compile(r'^\s*(?P<bug_id>CSC\w+): (?P<package_name>[\w\-\,\ ]+)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -998,15 +1001,15 @@ class ShowInventory(ShowInventorySchema):
         # NAME: "Rack 0", DESCR: "Sherman 1RU Chassis with 24x400GE QSFP56-DD & 12x100G QSFP28"
         # NAME: "0/FT4", DESCR: "Sherman Fan Module Reverse Airflow / exhaust, BLUE"
         # NAME: "TenGigE0/0/0/0", DESCR: "Cisco SFP+ 10G SR Pluggable Optics Module"
-        p1 = re.compile(r'^NAME: +\"(?P<module_name>[\S\s]*)\",'
-                         r' +DESCR: +\"(?P<descr>[\S\s]*)\"$')
+        p1 = regex_engine.compile(r'^NAME: +\"(?P<module_name>[\S\s]*)\",'
+                                   r' +DESCR: +\"(?P<descr>[\S\s]*)\"$')
 
         # PID: A9K-MPA-20X1GE, VID: V02, SN: FOC1811N49J
         # PID: SFP-1G-NIC-X      , VID: N/A, SN: N/A
         # PID: N/A, VID: N/A, SN:
-        p2 = re.compile(r'^PID: *(?P<pid>[\S\s]*),'
-                         r' +VID: *(?P<vid>[\S\s]*),'
-                         r' SN: *(?P<sn>[\S\s]*)$')
+        p2 = regex_engine.compile(r'^PID: *(?P<pid>[\S\s]*),'
+                                   r' +VID: *(?P<vid>[\S\s]*),'
+                                   r' SN: *(?P<sn>[\S\s]*)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1102,12 +1105,12 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
             # Rack 0 - ASR 9006 4 Line Card Slot Chassis with V2 AC PEM
             # Rack 0 - Cisco CRS Series 16 Slots Line Card Chassis
             # Rack 0 - CRS 16 Slots Line Card Chassis for CRS-16/S-B
-            p1 = re.compile(r'Rack +(?P<rack_num>\d+) +-'
-                            r' +(?P<device_group>[a-zA-Z0-9\s]+)'
-                            r' +(?P<num_line_cards>\d+)'
-                            r' +((Line +Card +Slot +Chassis +with *)|'
-                            r'Slots +Line +Card +Chassis(?:( +for))? *)'
-                            r'(?P<chassis_feature>[\S ]+)?$')
+            p1 = regex_engine.compile(r'Rack +(?P<rack_num>\d+) +-'
+                                      r' +(?P<device_group>[a-zA-Z0-9\s]+)'
+                                      r' +(?P<num_line_cards>\d+)'
+                                      r' +((Line +Card +Slot +Chassis +with *)|'
+                                      r'Slots +Line +Card +Chassis(?:( +for))? *)'
+                                      r'(?P<chassis_feature>[\S ]+)?$')
 
             m = p1.match(line)
             if m:
@@ -1138,7 +1141,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # RACK NUM: 0
-            p2 = re.compile(r'RACK NUM\: *(?P<rack_num>[0-9]+)$')
+            p2 = regex_engine.compile(r'RACK NUM\: *(?P<rack_num>[0-9]+)$')
             m = p2.match(line)
             if m:
                 admin_show_diag_dict['rack_num'] = \
@@ -1150,7 +1153,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
             # Serial Number   : FOC23158L99
             # Chassis Serial Number    : FOC23158L99
             # PCB Serial Number        : CAT2311B0AK
-            p3 = re.compile(r'^(S\/N|((Chassis|PCB) +)?Serial +Number)(\s+)?(\:)? +(?P<serial_number>\S+)$')
+            p3 = regex_engine.compile(r'^(S\/N|((Chassis|PCB) +)?Serial +Number)(\s+)?(\:)? +(?P<serial_number>\S+)$')
             m = p3.match(line)
             if m:
                 serial_num = str(m.groupdict()['serial_number'])
@@ -1165,8 +1168,8 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
 
             # PID:   ASR-9006-AC-V2
             # Product ID      : NCS-5501
-            p4 = re.compile(r'(PID|Product ID)(\s+)?\: '
-                            r'+(?P<pid>[a-zA-Z0-9\-]+)$')
+            p4 = regex_engine.compile(r'(PID|Product ID)(\s+)?\: '
+                                      r'+(?P<pid>[a-zA-Z0-9\-]+)$')
             m = p4.match(line)
             if m:
                 admin_show_diag_dict['pid'] = \
@@ -1176,7 +1179,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
             # VID:   V02
             # VID             : V01
             # Version Identifier       : V01
-            p5 = re.compile(r'(?:VID|Version +Identifier)(\s+)?\: +(?P<vid>[a-zA-Z0-9\-]+)$')
+            p5 = regex_engine.compile(r'(?:VID|Version +Identifier)(\s+)?\: +(?P<vid>[a-zA-Z0-9\-]+)$')
             m = p5.match(line)
             if m:
                 admin_show_diag_dict['vid'] = \
@@ -1185,7 +1188,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
 
             # Desc:  ASR 9006 4 Line Card Slot Chassis with V2 AC PEM
             # UDI Description          : Network Convergence System 1004 4 line card slots
-            p6 = re.compile(r'^(Desc\:|UDI Description\s+:) *(?P<desc>[\S\s]+)$')
+            p6 = regex_engine.compile(r'^(Desc\:|UDI Description\s+:) *(?P<desc>[\S\s]+)$')
             m = p6.match(line)
             if m:
                 admin_show_diag_dict['desc'] = \
@@ -1194,7 +1197,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
 
             # CLEI:  IPMUP00BRB
             # CLEI Code       : INM1J10ARA
-            p7 = re.compile(r'CLEI( +Code\s+)?: +(?P<clei>[a-zA-Z0-9\-]+)$')
+            p7 = regex_engine.compile(r'CLEI( +Code\s+)?: +(?P<clei>[a-zA-Z0-9\-]+)$')
             m = p7.match(line)
             if m:
                 admin_show_diag_dict['clei'] = \
@@ -1202,8 +1205,8 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # Top Assy. Number:   68-4235-02
-            p8 = re.compile(r'Top +Assy. +Number\:'
-                            r' *(?P<top_assy_num>[a-zA-Z0-9\-\s]+)$')
+            p8 = regex_engine.compile(r'Top +Assy. +Number\:'
+                                      r' *(?P<top_assy_num>[a-zA-Z0-9\-\s]+)$')
             m = p8.match(line)
             if m:
                 admin_show_diag_dict['top_assy_num'] = \
@@ -1211,7 +1214,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # PCA:   73-7806-01 rev B0
-            p9 = re.compile(r'^PCA\: +(?P<pca>[\S ]+)$')
+            p9 = regex_engine.compile(r'^PCA\: +(?P<pca>[\S ]+)$')
             m = p9.match(line)
             if m:
                 admin_show_diag_dict['pca'] = \
@@ -1219,7 +1222,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # ECI:   459651
-            p10 = re.compile(r'^ECI\: +(?P<eci>[\S ]+)$')
+            p10 = regex_engine.compile(r'^ECI\: +(?P<eci>[\S ]+)$')
             m = p10.match(line)
             if m:
                 admin_show_diag_dict['eci'] = \
@@ -1227,7 +1230,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # MAIN: board type 500060
-            p11 = re.compile(r'^MAIN\: +board +type +(?P<board_type>[\S ]+)$')
+            p11 = regex_engine.compile(r'^MAIN\: +board +type +(?P<board_type>[\S ]+)$')
             m = p11.match(line)
             if m:
                 main_dict = admin_show_diag_dict.setdefault('main', {})
@@ -1236,7 +1239,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # 800-25021-05 rev B0
-            p12 = re.compile(r'^\S+ +rev +\S+')
+            p12 = regex_engine.compile(r'^\S+ +rev +\S+')
             m = p12.match(line)
             if m:
                 main_dict = admin_show_diag_dict.setdefault('main', {})
@@ -1244,7 +1247,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # dev 080366, 080181
-            p13 = re.compile(r'\s*dev +(?P<dev>[\S ]+)')
+            p13 = regex_engine.compile(r'\s*dev +(?P<dev>[\S ]+)')
             m = p13.match(line)
             if m:
                 dev = m.groupdict()['dev']
@@ -1256,7 +1259,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
             # 0 Rack 0-IDPROM Info
             # Rack 0-IDPROM Info
             # Rack 0-Chassis IDPROM Info
-            p15 = re.compile(r'^(?:[0-9]+ +)?Rack +(?P<rack_num>[0-9]+)-(Chassis )?IDPROM +Info$')
+            p15 = regex_engine.compile(r'^(?:[0-9]+ +)?Rack +(?P<rack_num>[0-9]+)-(Chassis )?IDPROM +Info$')
             m15 = p15.match(line)
             if m15:
                 admin_show_diag_dict['rack_num'] = \
@@ -1264,7 +1267,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # Top +Assembly +Block\:$
-            p16 = re.compile(r'Top +Assembly +Block\:$')
+            p16 = regex_engine.compile(r'Top +Assembly +Block\:$')
             m16 = p16.match(line)
             if m16:
                 top_assembly_flag = True
@@ -1273,7 +1276,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # Part Number     : 73-101057-02
-            p17 = re.compile(r'^Part +(n|N)umber(\s+)?\: +(?P<part_number>\S+)$')
+            p17 = regex_engine.compile(r'^Part +(n|N)umber(\s+)?\: +(?P<part_number>\S+)$')
             m17 = p17.match(line)
             if m17:
                 part_num = str(m17.groupdict()['part_number'])
@@ -1285,7 +1288,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # Top Assy. Part Number    : 73-101057-02
-            p17_1 = re.compile(r'^Top +Assy\. +Part +Number +: +(?P<part_number>\S+)$')
+            p17_1 = regex_engine.compile(r'^Top +Assy\. +Part +Number +: +(?P<part_number>\S+)$')
             m = p17_1.match(line)
             if m:
                 part_num = str(m.groupdict()['part_number'])
@@ -1293,7 +1296,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 top_assembly_dict.update({'part_number': part_num})
 
             # Top Assy. Revision       : A0
-            p17_2 = re.compile(r'^Top +Assy\. +Revision\s+: *(?P<revision>[\S\s]+)$')
+            p17_2 = regex_engine.compile(r'^Top +Assy\. +Revision\s+: *(?P<revision>[\S\s]+)$')
             m = p17_2.match(line)
             if m:
                 revision = m.groupdict()['revision']
@@ -1302,7 +1305,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # Part Revision   : D0
-            p18 = re.compile(r'^Part +(r|R)evision(\s+)?\: +(?P<part_revision>\S+)$')
+            p18 = regex_engine.compile(r'^Part +(r|R)evision(\s+)?\: +(?P<part_revision>\S+)$')
             m18 = p18.match(line)
             if m18:
                 part_rev = str(m18.groupdict()['part_revision'])
@@ -1314,7 +1317,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # H/W Version     : 1.0
-            p19 = re.compile(r'^H\/W +[v|V]ersion(\s+)?\: +(?P<hw_version>\S+)$')
+            p19 = regex_engine.compile(r'^H\/W +[v|V]ersion(\s+)?\: +(?P<hw_version>\S+)$')
             m19 = p19.match(line)
             if m19:
                 hw_ver = str(m19.groupdict()['hw_version'])
@@ -1324,8 +1327,8 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                     admin_show_diag_dict['hw_version'] = hw_ver
 
             # Mfg Deviation   : 0
-            p20 = re.compile(r'^[M|m]fg +[D|d]eviation(\s+)?\: '
-                             r'+(?P<mfg_deviation>\S+)$')
+            p20 = regex_engine.compile(r'^[M|m]fg +[D|d]eviation(\s+)?\: '
+                                       r'+(?P<mfg_deviation>\S+)$')
             m20 = p20.match(line)
             if m20:
                 mfg_dev = str(m20.groupdict()['mfg_deviation'])
@@ -1334,7 +1337,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # Mfg Bits        : 1
-            p21 = re.compile(r'^[M|m]fg +Bits(\s+)?\: +(?P<mfg_bits>\S+)$')
+            p21 = regex_engine.compile(r'^[M|m]fg +Bits(\s+)?\: +(?P<mfg_bits>\S+)$')
             m21 = p21.match(line)
 
             if m21:
@@ -1344,7 +1347,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # Controller Family        : 0009
-            p22 = re.compile(r'^Controller\s+Family\s+:\s+(?P<controller_family>\S+)$')
+            p22 = regex_engine.compile(r'^Controller\s+Family\s+:\s+(?P<controller_family>\S+)$')
             m = p22.match(line)
             if m:
                 controller_family = m.groupdict()['controller_family']
@@ -1352,7 +1355,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
                 continue
 
             # Controller Type          : 09d2
-            p23 = re.compile(r'^Controller\s+Type\s+:\s+(?P<controller_type>\S+)$')
+            p23 = regex_engine.compile(r'^Controller\s+Type\s+:\s+(?P<controller_type>\S+)$')
             m = p23.match(line)
             if m:
                 controller_type = m.groupdict()['controller_type']
@@ -1533,367 +1536,367 @@ class ShowDiagDetails(ShowDiagDetailsSchema):
 
         # Rack 0-Chassis IDPROM - Cisco 8000 Series 32x400G QSFPDD 1RU Fixed System w/HBM
         # 0/0-DB-IDPROM - 400G Modular Linecard, Service Edge Optimized
-        p0 = re.compile(r'(?P<item>.+?)[\s-]IDPROM\s+\-\s+(?P<description>.+?)\s*$')
+        p0 = regex_engine.compile(r'(?P<item>.+?)[\s-]IDPROM\s+\-\s+(?P<description>.+?)\s*$')
 
         # Controller Family          : 0045
-        p1 = re.compile(r'^Controller Family\s+:\s+(?P<controller_family>\w+)$')
+        p1 = regex_engine.compile(r'^Controller Family\s+:\s+(?P<controller_family>\w+)$')
 
         # Controller Type            : 06b1
-        p2 = re.compile(r'^Controller Type\s+:\s+(?P<controller_type>\w+)$')
+        p2 = regex_engine.compile(r'^Controller Type\s+:\s+(?P<controller_type>\w+)$')
 
         # PID                        : 8201-32FH
-        p3 = re.compile(r'^(PID|Product ID)\s+:\s+(?P<pid>[\w-]+)$')
+        p3 = regex_engine.compile(r'^(PID|Product ID)\s+:\s+(?P<pid>[\w-]+)$')
 
         # Version Identifier         : V03
-        p4 = re.compile(r'^(VID|Version Identifier)\s+:\s+(?P<version_identifier>.+?)$')
+        p4 = regex_engine.compile(r'^(VID|Version Identifier)\s+:\s+(?P<version_identifier>.+?)$')
 
         # UDI Description            : Cisco 8000 Series 32x400G QSFPDD 1RU Fixed System w/HBM
-        p5 = re.compile(r'^UDI Description\s+:\s+(?P<udi_description>.+?)$')
+        p5 = regex_engine.compile(r'^UDI Description\s+:\s+(?P<udi_description>.+?)$')
 
         # Chassis Serial Number      : FLM263401XF
-        p6 = re.compile(r'^Chassis Serial\s+Number\s+:\s+(?P<serial_number>\w+)$')
+        p6 = regex_engine.compile(r'^Chassis Serial\s+Number\s+:\s+(?P<serial_number>\w+)$')
 
         # Top Assy. Part Number      : 68-7325-05
-        p7 = re.compile(r'^Top Assy. Part Number\s+:\s+(?P<part_number>[\w-]+)$')
+        p7 = regex_engine.compile(r'^Top Assy. Part Number\s+:\s+(?P<part_number>[\w-]+)$')
 
         # Top Assy. Revision         : B0
-        p8 = re.compile(r'^Top Assy. Revision\s+:\s+(?P<revision>[\w-]+)$')
+        p8 = regex_engine.compile(r'^Top Assy. Revision\s+:\s+(?P<revision>[\w-]+)$')
 
         # PCB Serial Number          : FLM263303GJ
-        p9 = re.compile(r'^PCB Serial Number\s+:\s+(?P<serial_number>.+?)$')
+        p9 = regex_engine.compile(r'^PCB Serial Number\s+:\s+(?P<serial_number>.+?)$')
 
         # PCA Number                 : 73-20364-02
-        p10 = re.compile(r'^PCA Number\s+:\s+(?P<serial_number>.+?)$')
+        p10 = regex_engine.compile(r'^PCA Number\s+:\s+(?P<serial_number>.+?)$')
 
         # PCA Revision               : E0
-        p11 = re.compile(r'^PCA Revision\s+:\s+(?P<serial_number>.+?)$')
+        p11 = regex_engine.compile(r'^PCA Revision\s+:\s+(?P<serial_number>.+?)$')
 
         # CLEI Code                  : CMM6210ARC
-        p12 = re.compile(r'^CLEI Code\s+:\s+(?P<clei_code>\w+)$')
+        p12 = regex_engine.compile(r'^CLEI Code\s+:\s+(?P<clei_code>\w+)$')
 
         # ECI Number                 : 477690
-        p13 = re.compile(r'^ECI Number\s+:\s+(?P<eci_num>\w+)$')
+        p13 = regex_engine.compile(r'^ECI Number\s+:\s+(?P<eci_num>\w+)$')
 
         # Deviation Number # 1       : 0
-        p14 = re.compile(r'^Deviation Number # (?P<num>\d)\s+:\s+(?P<deviation_num>\w+)$')
+        p14 = regex_engine.compile(r'^Deviation Number # (?P<num>\d)\s+:\s+(?P<deviation_num>\w+)$')
 
         # Manufacturing Test Data    : 00 00 00 00 00 00 00 00
-        p15 = re.compile(r'^Manufacturing Test Data\s+:\s+(?P<manufacturing_num>[\w\s]+)$')
+        p15 = regex_engine.compile(r'^Manufacturing Test Data\s+:\s+(?P<manufacturing_num>[\w\s]+)$')
 
         # Calibration Data           : 00000000
-        p16 = re.compile(r'^Calibration Data\s+:\s+(?P<calibration_data>\d+)$')
+        p16 = regex_engine.compile(r'^Calibration Data\s+:\s+(?P<calibration_data>\d+)$')
 
         # Chassis MAC Address        : 3c26.e4b6.8c00
-        p17 = re.compile(r'^Chassis MAC Address\s+:\s+(?P<chassis_mac_addr>[\w.]+)$')
+        p17 = regex_engine.compile(r'^Chassis MAC Address\s+:\s+(?P<chassis_mac_addr>[\w.]+)$')
 
         # MAC Addr. Block Size       : 512
-        p18 = re.compile(r'^MAC Addr. Block Size\s+:\s+(?P<mac_addr>\d+)$')
+        p18 = regex_engine.compile(r'^MAC Addr. Block Size\s+:\s+(?P<mac_addr>\d+)$')
 
         # Hardware Revision          : 1.0
-        p19 = re.compile(r'^Hardware Revision\s+:\s+(?P<hardware_revision>[\w.]+)$')
+        p19 = regex_engine.compile(r'^Hardware Revision\s+:\s+(?P<hardware_revision>[\w.]+)$')
 
         # Device values # 1          : 42 e0 00 08 28 00 00 00
-        p20 = re.compile(r'^Device values # 1\s+:\s+(?P<device_value>[\w\s]+)$')
+        p20 = regex_engine.compile(r'^Device values # 1\s+:\s+(?P<device_value>[\w\s]+)$')
 
         # Power Supply Type          : AC
-        p21 = re.compile(r'^Power Supply Type\s+:\s+(?P<power_supply>\w+)$')
+        p21 = regex_engine.compile(r'^Power Supply Type\s+:\s+(?P<power_supply>\w+)$')
 
         # Power Consumption          : 2000 Watts (Maximum)
         # Power Consump   : 0 W
-        p22 = re.compile(r'^Power (Consumption|Consump)\s+:\s+(?P<power_consump>.+?)$')
+        p22 = regex_engine.compile(r'^Power (Consumption|Consump)\s+:\s+(?P<power_consump>.+?)$')
 
         # Asset ID                 :
-        p23 = re.compile(r'^Asset ID\s+:\s+(?P<asset_id>.+?)$')
+        p23 = regex_engine.compile(r'^Asset ID\s+:\s+(?P<asset_id>.+?)$')
 
         # Asset Alias              :
-        p24 = re.compile(r'^Asset Alias\s+:\s+(?P<asset_alias>.+?)$')
+        p24 = regex_engine.compile(r'^Asset Alias\s+:\s+(?P<asset_alias>.+?)$')
 
         # ECI Number               :
-        p25 = re.compile(r'^ECI Number\s+:\s+(?P<eci_number>.+?)$')
+        p25 = regex_engine.compile(r'^ECI Number\s+:\s+(?P<eci_number>.+?)$')
 
         # IDPROM Format Revision   : A
-        p26 = re.compile(r'^IDPROM Format Revision\s+:\s+(?P<idprom_format_revision>\w+)$')
+        p26 = regex_engine.compile(r'^IDPROM Format Revision\s+:\s+(?P<idprom_format_revision>\w+)$')
 
         # Common Blocks:
-        p27 = re.compile(r'^Common Blocks:$')
+        p27 = regex_engine.compile(r'^Common Blocks:$')
 
         # Block Signature : 0xabab
-        p28 = re.compile(r'^Block Signature\s+:\s+(?P<block_signature>\w+)$')
+        p28 = regex_engine.compile(r'^Block Signature\s+:\s+(?P<block_signature>\w+)$')
 
         # Block Version   : 3
-        p29 = re.compile(r'^Block Version\s+:\s+(?P<block_version>\d+)$')
+        p29 = regex_engine.compile(r'^Block Version\s+:\s+(?P<block_version>\d+)$')
 
         # Block Length    : 160
-        p30 = re.compile(r'^Block Length\s+:\s+(?P<block_length>\d+)$')
+        p30 = regex_engine.compile(r'^Block Length\s+:\s+(?P<block_length>\d+)$')
 
         # Block Checksum  : 0x1b10
-        p31 = re.compile(r'^Block Checksum\s+:\s+(?P<block_checksum>.+?)$')
+        p31 = regex_engine.compile(r'^Block Checksum\s+:\s+(?P<block_checksum>.+?)$')
 
         # EEPROM Size     : 65535
-        p32 = re.compile(r'^EEPROM Size\s+:\s+(?P<eeprom_size>\d+)$')
+        p32 = regex_engine.compile(r'^EEPROM Size\s+:\s+(?P<eeprom_size>\d+)$')
 
         # Block Count     : 4
-        p33 = re.compile(r'^Block Count\s+:\s+(?P<block_count>\d+)$')
+        p33 = regex_engine.compile(r'^Block Count\s+:\s+(?P<block_count>\d+)$')
 
         # FRU Major Type  : 0x6003
-        p34 = re.compile(r'^FRU Major Type\s+:\s+(?P<fru_major_type>\w+)$')
+        p34 = regex_engine.compile(r'^FRU Major Type\s+:\s+(?P<fru_major_type>\w+)$')
 
         # FRU Minor Type  : 0x0
-        p35 = re.compile(r'^FRU Minor Type\s+:\s+(?P<fru_minor_type>\w+)$')
+        p35 = regex_engine.compile(r'^FRU Minor Type\s+:\s+(?P<fru_minor_type>\w+)$')
 
         # OEM String      : Cisco Systems, Inc.
-        p36 = re.compile(r'^OEM String\s+:\s+(?P<oem_string>.+?)$')
+        p36 = regex_engine.compile(r'^OEM String\s+:\s+(?P<oem_string>.+?)$')
 
         # Serial Number   : JAE24480QCT
-        p37 = re.compile(r'^Serial Number\s+:\s+(?P<serial_number>\w+)$')
+        p37 = regex_engine.compile(r'^Serial Number\s+:\s+(?P<serial_number>\w+)$')
 
         # Part Number     : 73-102072-04
-        p38 = re.compile(r'^Part Number\s+:\s+(?P<part_number>.+?)$')
+        p38 = regex_engine.compile(r'^Part Number\s+:\s+(?P<part_number>.+?)$')
 
         # Part Revision   : 05
-        p39 = re.compile(r'^Part Revision\s+:\s+(?P<part_revision>\w+)$')
+        p39 = regex_engine.compile(r'^Part Revision\s+:\s+(?P<part_revision>\w+)$')
 
         # Mfg Deviation   : 000000000
-        p40 = re.compile(r'^Mfg Deviation\s+:\s+(?P<mfg_deviation>\w+)$')
+        p40 = regex_engine.compile(r'^Mfg Deviation\s+:\s+(?P<mfg_deviation>\w+)$')
 
         # H/W Version     : 0.300
-        p41 = re.compile(r'^H/W Version\s+:\s+(?P<hw_version>.+?)$')
+        p41 = regex_engine.compile(r'^H/W Version\s+:\s+(?P<hw_version>.+?)$')
 
         # Mfg Bits        : 0
-        p42 = re.compile(r'^Mfg Bits\s+:\s+(?P<mfg_bits>\w+)$')
+        p42 = regex_engine.compile(r'^Mfg Bits\s+:\s+(?P<mfg_bits>\w+)$')
 
         # Engineer Use    : 0
-        p43 = re.compile(r'^Engineer Use\s+:\s+(?P<engineer_use>\w+)$')
+        p43 = regex_engine.compile(r'^Engineer Use\s+:\s+(?P<engineer_use>\w+)$')
 
         # snmpOID         : 9.12.3.1.9.2.708.0
-        p44 = re.compile(r'^snmpOID\s+:\s+(?P<snmpoid>.+?)$')
+        p44 = regex_engine.compile(r'^snmpOID\s+:\s+(?P<snmpoid>.+?)$')
 
         # RMA Code        : 0-0-0-0
-        p45 = re.compile(r'^RMA Code\s+:\s+(?P<rma_code>.+?)$')
+        p45 = regex_engine.compile(r'^RMA Code\s+:\s+(?P<rma_code>.+?)$')
 
         # Card Specific Block:
-        p46 = re.compile(r'^Card Specific Block:$')
+        p46 = regex_engine.compile(r'^Card Specific Block:$')
 
         # Feature Bits    : 0x0
-        p47 = re.compile(r'^Feature Bits\s+:\s+(?P<feature_bits>\w+)$')
+        p47 = regex_engine.compile(r'^Feature Bits\s+:\s+(?P<feature_bits>\w+)$')
 
         # HW Changes Bits : 0x77ce
-        p48 = re.compile(r'^HW Changes Bits\s+:\s+(?P<hw_change_bit>\w+)$')
+        p48 = regex_engine.compile(r'^HW Changes Bits\s+:\s+(?P<hw_change_bit>\w+)$')
 
         # Card Index      : 27061
-        p49 = re.compile(r'^Card Index\s+:\s+(?P<card_index>\d+)$')
+        p49 = regex_engine.compile(r'^Card Index\s+:\s+(?P<card_index>\d+)$')
 
         # MAC Addresses   : 90-77-ee-75-70-f2
-        p50 = re.compile(r'^MAC Addresses\s+:\s+(?P<mac_address>.+?)$')
+        p50 = regex_engine.compile(r'^MAC Addresses\s+:\s+(?P<mac_address>.+?)$')
 
         # Number of MACs  : 18
-        p51 = re.compile(r'^Number of MACs\s+:\s+(?P<num_macs>\d+)$')
+        p51 = regex_engine.compile(r'^Number of MACs\s+:\s+(?P<num_macs>\d+)$')
 
         # Number of EOBC links : 2
-        p52 = re.compile(r'^Number of EOBC links\s+:\s+(?P<num_eobc_links>\d+)$')
+        p52 = regex_engine.compile(r'^Number of EOBC links\s+:\s+(?P<num_eobc_links>\d+)$')
 
         # Number of EPLD  : 2
-        p53 = re.compile(r'^Number of EPLD\s+:\s+(?P<num_epld>\d+)$')
+        p53 = regex_engine.compile(r'^Number of EPLD\s+:\s+(?P<num_epld>\d+)$')
 
         # EPLD A          : 0x0
-        p54 = re.compile(r'^EPLD A\s+:\s+(?P<epld_a>.+?)$')
+        p54 = regex_engine.compile(r'^EPLD A\s+:\s+(?P<epld_a>.+?)$')
 
         # EPLD B          : 0x0
-        p55 = re.compile(r'^EPLD B\s+:\s+(?P<epld_b>.+?)$')
+        p55 = regex_engine.compile(r'^EPLD B\s+:\s+(?P<epld_b>.+?)$')
 
         # Port Type-Num   : 0-0
-        p56 = re.compile(r'^Port Type-Num\s+:\s+(?P<port_type_num>.+?)$')
+        p56 = regex_engine.compile(r'^Port Type-Num\s+:\s+(?P<port_type_num>.+?)$')
 
         # SRAM size       : 0
-        p57 = re.compile(r'^SRAM size\s+:\s+(?P<sram_size>\d+)$')
+        p57 = regex_engine.compile(r'^SRAM size\s+:\s+(?P<sram_size>\d+)$')
 
         # Sensor #1       : 115,105
-        p58 = re.compile(r'^Sensor #(?P<num>\d)\s+:\s+(?P<sensor>.+?)$')
+        p58 = regex_engine.compile(r'^Sensor #(?P<num>\d)\s+:\s+(?P<sensor>.+?)$')
 
         # Max Connector Power: 1800 W
-        p59 = re.compile(r'^Max Connector Power:\s+(?P<max_connector_power>.+?)$')
+        p59 = regex_engine.compile(r'^Max Connector Power:\s+(?P<max_connector_power>.+?)$')
 
         # Cooling Requirement: 75
-        p60 = re.compile(r'^Cooling Requirement:\s+(?P<cooling_req>\d+)$')
+        p60 = regex_engine.compile(r'^Cooling Requirement:\s+(?P<cooling_req>\d+)$')
 
         # Ambient Temperature: 55
-        p61 = re.compile(r'^Ambient Temperature:\s+(?P<ambient_temp>\d+)$')
+        p61 = regex_engine.compile(r'^Ambient Temperature:\s+(?P<ambient_temp>\d+)$')
 
         # Temperature Sensor Block:
-        p62 = re.compile(r'^Temperature Sensor Block:$')
+        p62 = regex_engine.compile(r'^Temperature Sensor Block:$')
 
         # Number of Valid Sensors : 0
-        p63 = re.compile(r'^Number of Valid Sensors\s+:\s+(?P<valid_sensor>\d+)$')
+        p63 = regex_engine.compile(r'^Number of Valid Sensors\s+:\s+(?P<valid_sensor>\d+)$')
 
         # Hardware Configuration Block:
-        p64 = re.compile(r'^Hardware Configuration Block:$')
+        p64 = regex_engine.compile(r'^Hardware Configuration Block:$')
 
         # NODE module 0/RSP0/CPU0  ASR9K Route Switch Processor with 440G/slot Fabric and 12GB
-        p65 = re.compile(r'^NODE module (?P<item>.+?)\s+(?P<description>.+)$')
+        p65 = regex_engine.compile(r'^NODE module (?P<item>.+?)\s+(?P<description>.+)$')
 
         # MAIN:  board type 0x100307
-        p66 = re.compile(r'^MAIN:\s+board type (?P<board_type>.+?)$')
+        p66 = regex_engine.compile(r'^MAIN:\s+board type (?P<board_type>.+?)$')
 
         # S/N:   FOC1910NMC0
-        p67 = re.compile(r'^S\/N:\s+(?P<sn>.+)$')
+        p67 = regex_engine.compile(r'^S\/N:\s+(?P<sn>.+)$')
 
         # Top Assy. Number:   68-3661-04
-        p68 = re.compile(r'^Top Assy. Number:\s+(?P<top_assy_num>.+)$')
+        p68 = regex_engine.compile(r'^Top Assy. Number:\s+(?P<top_assy_num>.+)$')
 
         # HwRev (UDI_VID):   V06
-        p69 = re.compile(r'^HwRev \(UDI_VID\):\s+(?P<hwrev>.+)$')
+        p69 = regex_engine.compile(r'^HwRev \(UDI_VID\):\s+(?P<hwrev>.+)$')
 
         # Chip HwRev: V1.0
-        p70 = re.compile(r'^Chip HwRev:\s+(?P<chip_hwrev>.+)$')
+        p70 = regex_engine.compile(r'^Chip HwRev:\s+(?P<chip_hwrev>.+)$')
 
         # New Deviation Number: 0
-        p71 = re.compile(r'^New Deviation Number:\s+(?P<new_deviation_num>\d+)$')
+        p71 = regex_engine.compile(r'^New Deviation Number:\s+(?P<new_deviation_num>\d+)$')
 
         # CLEI:  IPUCBB4BTD
-        p72 = re.compile(r'^CLEI:\s+(?P<clei>.+)$')
+        p72 = regex_engine.compile(r'^CLEI:\s+(?P<clei>.+)$')
 
         # Board State : IOS XR RUN
-        p73 = re.compile(r'^Board State\s+:\s+(?P<board_state>.+)$')
+        p73 = regex_engine.compile(r'^Board State\s+:\s+(?P<board_state>.+)$')
 
         # PLD:    Motherboard: N/A, Processor version: 0x0 (rev: 2.174), Power: N/A
-        p74 = re.compile(r'^PLD:\s+Motherboard:\s+(?P<motherboard>[\w\/]+),'
-                           r'\s+Processor version:\s+(?P<processor_version>\w+)\s+'
-                           r'\(rev:\s+(?P<rev>[\d.]+)\),\s+Power:\s+(?P<power>[\w\/]+)$')
+        p74 = regex_engine.compile(r'^PLD:\s+Motherboard:\s+(?P<motherboard>[\w\/]+),'
+                                     r'\s+Processor version:\s+(?P<processor_version>\w+)\s+'
+                                     r'\(rev:\s+(?P<rev>[\d.]+)\),\s+Power:\s+(?P<power>[\w\/]+)$')
 
         # MONLIB:
-        p75 = re.compile(r'^MONLTB:(?P<monltb>.+)$')
+        p75 = regex_engine.compile(r'^MONLTB:(?P<monltb>.+)$')
 
         # ROMMON: Version 0.76 [ASR9K x86 ROMMON],
-        p76 = re.compile(r'^ROMMON:\s+Version\s+(?P<rommon_version>.+)$')
+        p76 = regex_engine.compile(r'^ROMMON:\s+Version\s+(?P<rommon_version>.+)$')
 
         # CPU0: Intel 686 F6M14S4
-        p77 = re.compile(r'^CPU0:\s+(?P<cpu>.+)$')
+        p77 = regex_engine.compile(r'^CPU0:\s+(?P<cpu>.+)$')
 
         # Board FPGA/CPLD/ASIC Hardware Revision:
-        p78 = re.compile(r'^Board FPGA/CPLD/ASIC Hardware Revision:$')
+        p78 = regex_engine.compile(r'^Board FPGA/CPLD/ASIC Hardware Revision:$')
 
         # FabSwitch0  : V1.5
-        p79 = re.compile(r'^FabSwitch0\s+:\s+(?P<fabswitch0>.+)$')
+        p79 = regex_engine.compile(r'^FabSwitch0\s+:\s+(?P<fabswitch0>.+)$')
 
         # FabSwitch1  : V1.5
-        p80 = re.compile(r'^FabSwitch1\s+:\s+(?P<fabswitch1>.+)$')
+        p80 = regex_engine.compile(r'^FabSwitch1\s+:\s+(?P<fabswitch1>.+)$')
 
         # FabArbiter  : V0.1
-        p81 = re.compile(r'^FabArbiter\s+:\s+(?P<fabarbiter>.+)$')
+        p81 = regex_engine.compile(r'^FabArbiter\s+:\s+(?P<fabarbiter>.+)$')
 
         # FIA  : V0.2
-        p82 = re.compile(r'^FIA\s+:\s+(?P<fia>.+)$')
+        p82 = regex_engine.compile(r'^FIA\s+:\s+(?P<fia>.+)$')
 
         # IntCtrl  : V0.11
-        p83 = re.compile(r'^IntCtrl\s+:\s+(?P<intctrl>.+)$')
+        p83 = regex_engine.compile(r'^IntCtrl\s+:\s+(?P<intctrl>.+)$')
 
         # ClkCtrl  : V2.10
-        p84 = re.compile(r'^ClkCtrl\s+:\s+(?P<clkctrl>.+)$')
+        p84 = regex_engine.compile(r'^ClkCtrl\s+:\s+(?P<clkctrl>.+)$')
 
         # 10GPuntFPGA  : V1.10
-        p85 = re.compile(r'^10GPuntFPGA\s+:\s+(?P<puntfpga>.+)$')
+        p85 = regex_engine.compile(r'^10GPuntFPGA\s+:\s+(?P<puntfpga>.+)$')
 
         # HD  : V2.16
-        p86 = re.compile(r'^HD\s+:\s+(?P<hd>.+)$')
+        p86 = regex_engine.compile(r'^HD\s+:\s+(?P<hd>.+)$')
 
         # USB0  : V2.16
-        p87 = re.compile(r'^USB0\s+:\s+(?P<usb0>.+)$')
+        p87 = regex_engine.compile(r'^USB0\s+:\s+(?P<usb0>.+)$')
 
         # USB1  : V0.0
-        p88 = re.compile(r'^USB1\s+:\s+(?P<usb1>.+)$')
+        p88 = regex_engine.compile(r'^USB1\s+:\s+(?P<usb1>.+)$')
 
         # CpuCtrl  : V0.11
-        p89 = re.compile(r'^CpuCtrl\s+:\s+(?P<cpuctrl>.+)$')
+        p89 = regex_engine.compile(r'^CpuCtrl\s+:\s+(?P<cpuctrl>.+)$')
 
         # YDTI  : V4.9
-        p90 = re.compile(r'^YDTI\s+:\s+(?P<ydti>.+)$')
+        p90 = regex_engine.compile(r'^YDTI\s+:\s+(?P<ydti>.+)$')
 
         # LIU  : V0.0
-        p91 = re.compile(r'^LIU\s+:\s+(?P<liu>.+)$')
+        p91 = regex_engine.compile(r'^LIU\s+:\s+(?P<liu>.+)$')
 
         # MLANSwitch  : V0.0
-        p92 = re.compile(r'^MLANSwitch\s+:\s+(?P<mlanswitch>.+)$')
+        p92 = regex_engine.compile(r'^MLANSwitch\s+:\s+(?P<mlanswitch>.+)$')
 
         # EOBCSwitch  : V0.0
-        p93 = re.compile(r'^EOBCSwitch\s+:\s+(?P<eobcswitch>.+)$')
+        p93 = regex_engine.compile(r'^EOBCSwitch\s+:\s+(?P<eobcswitch>.+)$')
 
         # HostInftCtrl  : V0.0
-        p94 = re.compile(r'^HostInftCtrl\s+:\s+(?P<hostinftctrl>.+)$')
+        p94 = regex_engine.compile(r'^HostInftCtrl\s+:\s+(?P<hostinftctrl>.+)$')
 
         # PHY  : V0.0
-        p95 = re.compile(r'^PHY\s+:\s+(?P<phy>.+)$')
+        p95 = regex_engine.compile(r'^PHY\s+:\s+(?P<phy>.+)$')
 
         # Offload10GE  : V0.0
-        p96 = re.compile(r'^Offload10GE\s+:\s+(?P<offload10ge>.+)$')
+        p96 = regex_engine.compile(r'^Offload10GE\s+:\s+(?P<offload10ge>.+)$')
 
         # E10GEDualMAC0  : V0.0
-        p97 = re.compile(r'^E10GEDualMAC0\s+:\s+(?P<e10gedualmac0>.+)$')
+        p97 = regex_engine.compile(r'^E10GEDualMAC0\s+:\s+(?P<e10gedualmac0>.+)$')
 
         # E10GEDualMAC1  : V0.0
-        p98 = re.compile(r'^E10GEDualMAC1\s+:\s+(?P<e10gedualmac1>.+)$')
+        p98 = regex_engine.compile(r'^E10GEDualMAC1\s+:\s+(?P<e10gedualmac1>.+)$')
 
         # EGEDualMAC0  : V0.0
-        p99 = re.compile(r'^EGEDualMAC0\s+:\s+(?P<egedualmac0>.+)$')
+        p99 = regex_engine.compile(r'^EGEDualMAC0\s+:\s+(?P<egedualmac0>.+)$')
 
         # EGEDualMAC1  : V0.0
-        p100 = re.compile(r'^EGEDualMAC1\s+:\s+(?P<egedualmac1>.+)$')
+        p100 = regex_engine.compile(r'^EGEDualMAC1\s+:\s+(?P<egedualmac1>.+)$')
 
         # CBC (active partition)  : v16.117
-        p101 = re.compile(r'^CBC \(active partition\)\s+:\s+(?P<cbc_active_partition>.+)$')
+        p101 = regex_engine.compile(r'^CBC \(active partition\)\s+:\s+(?P<cbc_active_partition>.+)$')
 
         # CBC (inactive partition)  : v16.116
-        p102 = re.compile(r'^CBC \(inactive partition\)\s+:\s+(?P<cbc_inactive_partition>.+)$')
+        p102 = regex_engine.compile(r'^CBC \(inactive partition\)\s+:\s+(?P<cbc_inactive_partition>.+)$')
 
         # NP0  : V4.194
-        p103 = re.compile(r'^NP(?P<np>\d+)\s+:\s+(?P<np0>.+)$')
+        p103 = regex_engine.compile(r'^NP(?P<np>\d+)\s+:\s+(?P<np0>.+)$')
 
         # FIA0  : V0.2
-        p104 = re.compile(r'^FIA(?P<fia>\d+)\s+:\s+(?P<fia0>.+)$')
+        p104 = regex_engine.compile(r'^FIA(?P<fia>\d+)\s+:\s+(?P<fia0>.+)$')
 
         # X-Bar  : V1.5
-        p105 = re.compile(r'^X-Bar\s+:\s+(?P<xbar>.+)$')
+        p105 = regex_engine.compile(r'^X-Bar\s+:\s+(?P<xbar>.+)$')
 
         # Arbiter  : V0.2
-        p106 = re.compile(r'^Arbiter\s+:\s+(?P<arbiter>.+)$')
+        p106 = regex_engine.compile(r'^Arbiter\s+:\s+(?P<arbiter>.+)$')
 
         # PortCtrl  : V1.0
-        p107 = re.compile(r'^PortCtrl\s+:\s+(?P<portctrl>.+)$')
+        p107 = regex_engine.compile(r'^PortCtrl\s+:\s+(?P<portctrl>.+)$')
 
         # PHYCtrl  : V1.1
-        p108 = re.compile(r'^PHYCtrl\s+:\s+(?P<phyctrl>.+)$')
+        p108 = regex_engine.compile(r'^PHYCtrl\s+:\s+(?P<phyctrl>.+)$')
 
         # USB  : V17.0
-        p109 = re.compile(r'^USB\s+:\s+(?P<usb>.+)$')
+        p109 = regex_engine.compile(r'^USB\s+:\s+(?P<usb>.+)$')
 
         # PHY0  : V0.4(HwRev)	V0.0(FwRev)	V8.0(SwRev)
-        p110 = re.compile(r'^(?P<phy>\w+)\s+:\s+(?P<hwrev>.+)\(HwRev\)\s+(?P<fwrev>.+)\(FwRev\)\s+(?P<swrev>.+)\(SwRev\)$')
+        p110 = regex_engine.compile(r'^(?P<phy>\w+)\s+:\s+(?P<hwrev>.+)\(HwRev\)\s+(?P<fwrev>.+)\(FwRev\)\s+(?P<swrev>.+)\(SwRev\)$')
 
         # Base MAC Address         : 00a7.428b.f4b0
-        p111 = re.compile(r'^Base MAC Address\s+:\s+(?P<base_mac_address>.+)$')
+        p111 = regex_engine.compile(r'^Base MAC Address\s+:\s+(?P<base_mac_address>.+)$')
 
         # Capabilities             : 00
-        p112 = re.compile(r'^Capabilities\s+:\s+(?P<capabilities>.+)$')
+        p112 = regex_engine.compile(r'^Capabilities\s+:\s+(?P<capabilities>.+)$')
 
         # ENVMON Information       : 2 86 0 0 0 0 0 0
         # 	                         0 0 0 0 0 0 0 0
         # 	                         0 0 0 0 0 0 0 0
         # 	                         0 0 0 0 0 0 0 0
-        p113 = re.compile(r'ENVMON Information\s+:\s+(?P<envmon_information>.+)')
+        p113 = regex_engine.compile(r'ENVMON Information\s+:\s+(?P<envmon_information>.+)')
 
         # 0 0 0 0 0 0 0 0
-        p113_1 = re.compile(r'^(?P<env_info>[\d\s]{15})$')
+        p113_1 = regex_engine.compile(r'^(?P<env_info>[\d\s]{15})$')
 
         # RMA Test History         : 00
-        p114 = re.compile(r'^RMA Test History\s+:\s+(?P<rma_test_history>.+)$')
+        p114 = regex_engine.compile(r'^RMA Test History\s+:\s+(?P<rma_test_history>.+)$')
 
         # RMA Number               : 0-0-0-0
-        p115 = re.compile(r'^RMA Number\s:\s+(?P<rma_number>.+)$')
+        p115 = regex_engine.compile(r'^RMA Number\s:\s+(?P<rma_number>.+)$')
 
         # RMA History              : 00
-        p116 = re.compile(r'^RMA History\s:\s(?P<rma_history>.+)$')
+        p116 = regex_engine.compile(r'^RMA History\s:\s(?P<rma_history>.+)$')
 
         # Device values            : 0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0
-        p117 = re.compile(r'^Device values\s+:\s+(?P<device_values>.+)$')
+        p117 = regex_engine.compile(r'^Device values\s+:\s+(?P<device_values>.+)$')
 
         pointer_block = {}
 
@@ -2722,15 +2725,15 @@ class ShowRedundancySummary(ShowRedundancySummarySchema):
         for line in out.splitlines():
             line = line.rstrip()
 
-            p0 = re.compile(r'\s*Active.*$')
+            p0 = regex_engine.compile(r'\s*Active.*$')
             m = p0.match(line)
             if m:
                 continue
 
             # 0/RSP0/CPU0(A)   0/RSP1/CPU0(S) (Node Not Ready, NSR: Not Configured)
-            p1 = re.compile(r'\s*(?P<node>[a-zA-Z0-9\/\(\)]+)'
-                             r' +(?P<standby_node>[a-zA-Z0-9\/\(\)]+)'
-                             r' +\((?P<node_detail>[a-zA-Z\,\:\s]+)\)$')
+            p1 = regex_engine.compile(r'\s*(?P<node>[a-zA-Z0-9\/\(\)]+)'
+                                       r' +(?P<standby_node>[a-zA-Z0-9\/\(\)]+)'
+                                       r' +\((?P<node_detail>[a-zA-Z\,\:\s]+)\)$')
             m = p1.match(line)
             if m:
                 if 'node' not in redundancy_summary:
@@ -2768,8 +2771,8 @@ class ShowRedundancySummary(ShowRedundancySummarySchema):
                     continue
 
             # 0/0/CPU0             N/A
-            p2 = re.compile(r'\s*(?P<node>[a-zA-Z0-9\/\(\)]+)'
-                             r' +(?P<standby_node>[a-zA-Z0-9\/\(\)]+)$')
+            p2 = regex_engine.compile(r'\s*(?P<node>[a-zA-Z0-9\/\(\)]+)'
+                                       r' +(?P<standby_node>[a-zA-Z0-9\/\(\)]+)$')
             m = p2.match(line)
             if m:
                 if 'node' not in redundancy_summary:
@@ -2864,8 +2867,8 @@ class ShowRedundancy(ShowRedundancySchema):
             line = line.rstrip()
 
             # Redundancy information for node 0/RP0/CPU0
-            p1 = re.compile(r'\s*Redundancy +information +for +node'
-                             r' +(?P<node>[a-zA-Z0-9\/]+):$')
+            p1 = regex_engine.compile(r'\s*Redundancy +information +for +node'
+                                       r' +(?P<node>[a-zA-Z0-9\/]+):$')
             m = p1.match(line)
             if m:
                 if 'node' not in redundancy_dict:
@@ -2876,8 +2879,8 @@ class ShowRedundancy(ShowRedundancySchema):
                     continue
 
             # Node 0/RSP0/CPU0 is in ACTIVE role
-            p2 = re.compile(r'\s*Node +([a-zA-Z0-9\/]+) +is +in'
-                             r' +(?P<role>[a-zA-Z]+) +role$')
+            p2 = regex_engine.compile(r'\s*Node +([a-zA-Z0-9\/]+) +is +in'
+                                       r' +(?P<role>[a-zA-Z]+) +role$')
             m = p2.match(line)
             if m:
                 redundancy_dict['node'][node]['role'] = \
@@ -2885,9 +2888,9 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # Node Redundancy Partner (0/RSP1/CPU0) is in STANDBY role
-            p3_1 =  re.compile(r'\s*Node *Redundancy *Partner'
-                                r' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
-                                r' *(?P<role>[a-zA-Z]+) *role$')
+            p3_1 =  regex_engine.compile(r'\s*Node *Redundancy *Partner'
+                                          r' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
+                                          r' *(?P<role>[a-zA-Z]+) *role$')
             m = p3_1.match(line)
             if m:
                 if 'standby' in str(m.groupdict()['role']).lower():
@@ -2895,9 +2898,9 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # Partner node (0/RP1/CPU0) is in STANDBY role (eXR)
-            p3_2 =  re.compile(r'\s*Partner *node'
-                                r' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
-                                r' *(?P<role>[a-zA-Z]+) *role$')
+            p3_2 =  regex_engine.compile(r'\s*Partner *node'
+                                          r' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
+                                          r' *(?P<role>[a-zA-Z]+) *role$')
             m = p3_2.match(line)
             if m:
                 if 'standby' in str(m.groupdict()['role']).lower():
@@ -2905,9 +2908,9 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # Process Redundancy Partner (0/RSP0/CPU0) is in BACKUP role
-            p3_3 =  re.compile(r'\s*Process *Redundancy *Partner'
-                                r' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
-                                r' *(?P<role>[a-zA-Z]+) *role$')
+            p3_3 =  regex_engine.compile(r'\s*Process *Redundancy *Partner'
+                                          r' *\((?P<node>[a-zA-Z0-9\/]+)\) *is *in'
+                                          r' *(?P<role>[a-zA-Z]+) *role$')
             m = p3_3.match(line)
             if m:
                 if 'backup' in str(m.groupdict()['role']).lower():
@@ -2916,8 +2919,8 @@ class ShowRedundancy(ShowRedundancySchema):
 
             # Standby node in 0/RSP1/CPU0 is ready
             # Standby node in 0/RSP1/CPU0 is NSR-ready
-            p3_2 = re.compile(r'\s*Standby *node *in *([a-zA-Z0-9\/]+)'
-                               r' *is *(?P<ready>[a-zA-Z\-]+)$')
+            p3_2 = regex_engine.compile(r'\s*Standby *node *in *([a-zA-Z0-9\/]+)'
+                                         r' *is *(?P<ready>[a-zA-Z\-]+)$')
             m = p3_2.match(line)
             if m:
                 redundancy_dict['node'][node]['ready'] = \
@@ -2925,8 +2928,8 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # Node 0/RP0/CPU0 has no valid partner
-            p3 = re.compile(r'\s*Node +([a-zA-Z0-9\/]+) +has +(?P<valid_partner>\S+)'
-                             r' +valid +partner$')
+            p3 = regex_engine.compile(r'\s*Node +([a-zA-Z0-9\/]+) +has +(?P<valid_partner>\S+)'
+                                       r' +valid +partner$')
             m = p3.match(line)
             if m:
                 redundancy_dict['node'][node]['valid_partner'] = \
@@ -2934,10 +2937,10 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # v6-routing       0/RSP0/CPU0     N/A             Not Ready
-            p4 = re.compile(r'\s*(?P<group>[a-zA-Z0-9\-]+)'
-                             r' +(?P<primary>[A-Z0-9\/]+)'
-                             r' +(?P<backup>[A-Z0-9\/]+)'
-                             r' +(?P<status>[a-zA-Z\-\s]+)$')
+            p4 = regex_engine.compile(r'\s*(?P<group>[a-zA-Z0-9\-]+)'
+                                       r' +(?P<primary>[A-Z0-9\/]+)'
+                                       r' +(?P<backup>[A-Z0-9\/]+)'
+                                       r' +(?P<status>[a-zA-Z\-\s]+)$')
             m = p4.match(line)
             if m:
                 if 'group' not in redundancy_dict['node'][node]:
@@ -2955,8 +2958,8 @@ class ShowRedundancy(ShowRedundancySchema):
                     continue
 
             # NSR not ready since Backup is not Present
-            p5 = re.compile(r'\s*NSR +(?P<primary_rmf_state>[a-zA-Z\s]+) +since'
-                             r' +(?P<primary_rmf_state_reason>[a-zA-Z\s]+)$')
+            p5 = regex_engine.compile(r'\s*NSR +(?P<primary_rmf_state>[a-zA-Z\s]+) +since'
+                                       r' +(?P<primary_rmf_state_reason>[a-zA-Z\s]+)$')
             m = p5.match(line)
             if m:
                 redundancy_dict['node'][node]['primary_rmf_state'] = \
@@ -2967,9 +2970,9 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # A9K-RSP440-TR reloaded Thu Apr 27 02:14:12 2017: 1 hour, 16 minutes ago
-            p6 = re.compile(r'\s*(?P<node_name>[a-zA-Z0-9\-]+) +reloaded'
-                             r' +(?P<last_reload_timestamp>[a-zA-Z0-9\:\s]+):'
-                             r' +(?P<time_since_last_reload>[a-zA-Z0-9\,\s]+)$')
+            p6 = regex_engine.compile(r'\s*(?P<node_name>[a-zA-Z0-9\-]+) +reloaded'
+                                       r' +(?P<last_reload_timestamp>[a-zA-Z0-9\:\s]+):'
+                                       r' +(?P<time_since_last_reload>[a-zA-Z0-9\,\s]+)$')
             m = p6.match(line)
             if m:
                 redundancy_dict['node'][node]['last_reload_timestamp'] =\
@@ -2982,11 +2985,11 @@ class ShowRedundancy(ShowRedundancySchema):
             # Active node booted Thu Jan 11 12:31:59 2018: 5 days, 23 hours,  ago
             # Active node booted Tue Jan  2 07:32:33 2018: 1 day, 1 hour, 6 minutes ago
             # Active node booted Thu Jan 11 12:32:03 2018: 1 week, 4 days, 20 hours, 19 minutes ago
-            p7 = re.compile(r'\s*Active +node +booted'
-                            r' +(?P<node_uptime_timestamp>[a-zA-Z0-9\:\s]+):'
-                            r' +(?P<node_uptime>((?P<ignore>\d+ \w+, *)?((?P<week>\d+) +(week|weeks), )?'
-                            r'(((?P<day>\d+) +(day|days))?, )?)?(((?P<hour>\d+) +(hour|hours))?, )?'
-                            r'(((?P<minute>\d+) +(minute|minutes))|((?P<second>\d+) +(seconds|seconds)))?) +ago$')
+            p7 = regex_engine.compile(r'\s*Active +node +booted'
+                                      r' +(?P<node_uptime_timestamp>[a-zA-Z0-9\:\s]+):'
+                                      r' +(?P<node_uptime>((?P<ignore>\d+ \w+, *)?((?P<week>\d+) +(week|weeks), )?'
+                                      r'(((?P<day>\d+) +(day|days))?, )?)?(((?P<hour>\d+) +(hour|hours))?, )?'
+                                      r'(((?P<minute>\d+) +(minute|minutes))|((?P<second>\d+) +(seconds|seconds)))?) +ago$')
             m = p7.match(line)
             if m:
                 redundancy_dict['node'][node]['node_uptime_timestamp'] = \
@@ -3009,9 +3012,9 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # Standby node boot Thu Aug 10 08:29:18 2017: 1 day, 32 minutes ago
-            p7_1 = re.compile(r'\s*Standby +node +boot'
-                               r' +(?P<standby_node_timestamp>[a-zA-Z0-9\:\s]+):'
-                               r' +(?P<time_since_standby_boot>[a-zA-Z0-9\,\s]+)$')
+            p7_1 = regex_engine.compile(r'\s*Standby +node +boot'
+                                         r' +(?P<standby_node_timestamp>[a-zA-Z0-9\:\s]+):'
+                                         r' +(?P<time_since_standby_boot>[a-zA-Z0-9\,\s]+)$')
             m = p7_1.match(line)
             if m:
                 standby_node_timestamp = str(m.groupdict()['standby_node_timestamp'])
@@ -3026,9 +3029,9 @@ class ShowRedundancy(ShowRedundancySchema):
             # Standby node last went not ready Fri Aug 11 07:13:26 2017: 1 hour, 48 minutes ago
             # Standby node last went ready Fri Aug 11 07:13:26 2017: 1 hour, 48 minutes ago
 
-            p7_2 = re.compile(r'\s*Standby *node *last *went *not *ready'
-                               r' *(?P<standby_node_not_ready>[a-zA-Z0-9\:\s]+):'
-                               r' *(?P<time_since_standby_node_not_ready>[a-zA-Z0-9\,\s]+)$')
+            p7_2 = regex_engine.compile(r'\s*Standby *node *last *went *not *ready'
+                                         r' *(?P<standby_node_not_ready>[a-zA-Z0-9\:\s]+):'
+                                         r' *(?P<time_since_standby_node_not_ready>[a-zA-Z0-9\,\s]+)$')
             m = p7_2.match(line)
             if m:
                 standby_node_not_ready = str(m.groupdict()['standby_node_not_ready'])
@@ -3040,9 +3043,9 @@ class ShowRedundancy(ShowRedundancySchema):
                 time_since_standby_node_not_ready
                 continue
 
-            p7_3 = re.compile(r'\s*Standby *node *last *went *ready'
-                               r' *(?P<standby_node_ready>[a-zA-Z0-9\:\s]+):'
-                               r' *(?P<time_since_standby_node_ready>[a-zA-Z0-9\,\s]+)$')
+            p7_3 = regex_engine.compile(r'\s*Standby *node *last *went *ready'
+                                         r' *(?P<standby_node_ready>[a-zA-Z0-9\:\s]+):'
+                                         r' *(?P<time_since_standby_node_ready>[a-zA-Z0-9\,\s]+)$')
             m = p7_3.match(line)
             if m:
                 standby_node_ready = str(m.groupdict()['standby_node_ready'])
@@ -3055,9 +3058,9 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # Last switch-over Thu Apr 27 03:29:57 2017: 1 minute ago
-            p8 = re.compile(r'\s*Last +switch-over'
-                        r' +(?P<last_switchover_timepstamp>[a-zA-Z0-9\:\s]+):'
-                        r' +(?P<time_since_last_switchover>[a-zA-Z0-9\,\s]+)$')
+            p8 = regex_engine.compile(r'\s*Last +switch-over'
+                                  r' +(?P<last_switchover_timepstamp>[a-zA-Z0-9\:\s]+):'
+                                  r' +(?P<time_since_last_switchover>[a-zA-Z0-9\,\s]+)$')
             m = p8.match(line)
             if m:
                 redundancy_dict['node'][node]['last_switchover_timepstamp'] = \
@@ -3067,8 +3070,8 @@ class ShowRedundancy(ShowRedundancySchema):
                 continue
 
             # Active node reload  Cause: Initiating switch-over.
-            p9 = re.compile(r'\s*Active +node +reload *(?:Cause)?:'
-                             r' +(?P<reload_cause>[a-zA-Z\-\s]+).$')
+            p9 = regex_engine.compile(r'\s*Active +node +reload *(?:Cause)?:'
+                                       r' +(?P<reload_cause>[a-zA-Z\-\s]+).$')
             m = p9.match(line)
             if m:
                 redundancy_dict['node'][node]['reload_cause'] = \
@@ -3146,7 +3149,7 @@ class Dir(DirSchema):
             # Directory of /misc/scratch
             # Directory of disk0a:/usr
             # Directory of net/node0_RSP1_CPU0/harddisk:/dumper
-            p1 = re.compile(r'\s*Directory\s+of\s+(?P<dir_name>\S+)$')
+            p1 = regex_engine.compile(r'\s*Directory\s+of\s+(?P<dir_name>\S+)$')
             m = p1.match(line)
             if m:
                 if 'dir' not in dir_dict:
@@ -3158,9 +3161,9 @@ class Dir(DirSchema):
 
             # 1012660 kbytes total (939092 kbytes free)
             # 2562719744 bytes total (1918621184 bytes free)
-            p2 = re.compile(r'\s*(?P<total_bytes>[0-9]+ +(kbytes|bytes))'
-                             r' +total +\((?P<total_free_bytes>[0-9]+'
-                             r' +(kbytes|bytes)) +free\)$')
+            p2 = regex_engine.compile(r'\s*(?P<total_bytes>[0-9]+ +(kbytes|bytes))'
+                                       r' +total +\((?P<total_free_bytes>[0-9]+'
+                                       r' +(kbytes|bytes)) +free\)$')
             m = p2.match(line)
             if m:
                 dir_dict['dir']['total_bytes'] = \
@@ -3175,10 +3178,10 @@ class Dir(DirSchema):
             # 14 -rw-r--r--. 1 10429 Oct 26 16:17 pnet_cfg.log
             # 10541310    -rwx  6142        Mon May 18 19:16:01 2020  prod2_vxlan_config
 
-            p3 = re.compile(r'^\s*(?P<index>[0-9]+) +(?P<permission>[a-z\-]+)(\.)?('
-                            r' +(?P<unknown>[0-9]+))? +(?P<size>[0-9]+)( +(?P<date>[a-zA-Z]{3}))? '
-                            r'+(?P<month>[a-zA-Z]{3}) +(?P<day>[0-9]{,3})( +(?P<time>[\d\:]+))?( '
-                            r'+(?P<year>[0-9]{4}))? +(?P<file>[a-zA-Z0-9\.\/\_\-\+\>\s]+)$')
+            p3 = regex_engine.compile(r'^\s*(?P<index>[0-9]+) +(?P<permission>[a-z\-]+)(\.)?('
+                                      r' +(?P<unknown>[0-9]+))? +(?P<size>[0-9]+)( +(?P<date>[a-zA-Z]{3}))? '
+                                      r'+(?P<month>[a-zA-Z]{3}) +(?P<day>[0-9]{,3})( +(?P<time>[\d\:]+))?( '
+                                      r'+(?P<year>[0-9]{4}))? +(?P<file>[a-zA-Z0-9\.\/\_\-\+\>\s]+)$')
             m = p3.match(line)
             if m:
                 file = m.groupdict()['file']
@@ -3254,7 +3257,7 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
             out = output
 
         #  8178  45387776  4294967295  1029939200  ffc31360/ffc311a0  bgp
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(\s+)?(?P<jid>\d+)\s+(?P<text>\d+)\s+(?P<data>\d+)\s+(?P<stack>\d+)\s+(?P<dynamic>\S+)\s+(?P<process>\S+)'
         )
 
@@ -3334,7 +3337,7 @@ class ShowProcessesMemoryDetail(ShowProcessesMemoryDetailSchema):
 
         #  1078           2M      1021M       136K        39M     14894M        23M        62M bgp
         #  1257          60K       261M       136K         1M  unlimited         6M         9M bgp_epe
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(\s+)?(?P<jid>\d+)\s+(?P<text>\S+)\s+(?P<data>\S+)\s+(?P<stack>\S+)\s+(?P<dynamic>\S+)\s+(?P<dyn_limit>\S+)\s+(?P<shm_tot>\S+)\s+(?P<phy_tot>\S+)\s+(?P<process>\S+)'
         )
 
@@ -3394,10 +3397,10 @@ class ShowFilesystemLocationAll(ShowFilesystemLocationAllSchema):
             output = self.device.execute(self.cli_command[0])
 
         # node:  node0_RP0_CPU0
-        p1 = re.compile(r'^node:\s+(?P<node>\S+)$')
+        p1 = regex_engine.compile(r'^node:\s+(?P<node>\S+)$')
 
         # 3962216448   3926405120  flash-disk     rw  apphost:
-        p2 = re.compile(r'^(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\S*)\s*(?P<flags>\S*)\s*(?P<prefixes>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\S*)\s*(?P<flags>\S*)\s*(?P<prefixes>[\S\s]+)$')
 
         # initial return dictionary
         ret_dict = {}
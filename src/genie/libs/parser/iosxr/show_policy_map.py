@@ -5,7 +5,6 @@ IOSXR parser for the following show command:
 '''
 
 # Python
-import re
 import xmltodict
 import collections
 from netaddr import IPAddress, IPNetwork
@@ -15,6 +14,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, Default, Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ================================================================================
@@ -110,88 +110,88 @@ class ShowPolicyMapInterface(ShowPolicyMapInterfaceSchema):
         wred_curve=None
 
         # TenGigE0/2/0/3 direction input: Service Policy not installed
-        p1 = re.compile(r'^.*direction +input: +Service +Policy +not +installed$')
+        p1 = regex_engine.compile(r'^.*direction +input: +Service +Policy +not +installed$')
 
         # TenGigE0/2/0/3 direction input: cap
         # GigabitEthernet0/0/0/1 input: 4gig
         # Bundle-Ether203 input: SERVICE-BPS
-        p2 = re.compile(r'^.*(direction)? +input: +(?P<input>[-\w]+)$')
+        p2 = regex_engine.compile(r'^.*(direction)? +input: +(?P<input>[-\w]+)$')
 
         # TenGigE0/2/0/3 output: Service Policy not installed
-        p3 = re.compile(r'^.*output: +Service +Policy +not +installed$')
+        p3 = regex_engine.compile(r'^.*output: +Service +Policy +not +installed$')
 
         # TenGigE0/2/0/3 output: cap
-        p4 = re.compile(r'^.*output: +(?P<output>[-\w]+)$')
+        p4 = regex_engine.compile(r'^.*output: +(?P<output>[-\w]+)$')
 
         # Class cap
         # Class IPV4-PACKET-IS-00
-        p5 = re.compile(r'^Class +(?P<class_name>[-\w]+)$')
+        p5 = regex_engine.compile(r'^Class +(?P<class_name>[-\w]+)$')
 
         # Matched             : N / A
-        p6 = re.compile(r'^Matched\s+: +(?P<matched>[\D\s]+)$')
+        p6 = regex_engine.compile(r'^Matched\s+: +(?P<matched>[\D\s]+)$')
 
         # Matched             :                 638/42108                10
-        p7 =  re.compile(r'^Matched\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
+        p7 =  regex_engine.compile(r'^Matched\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
 
         # Transmitted         : N / A
-        p8 = re.compile(r'^Transmitted\s+: +(?P<transmitted>[\D\s]+)$')
+        p8 = regex_engine.compile(r'^Transmitted\s+: +(?P<transmitted>[\D\s]+)$')
 
         # Transmitted             :                 638/42108                10
-        p9 = re.compile(r'^Transmitted\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
+        p9 = regex_engine.compile(r'^Transmitted\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
 
         # Total Dropped       : N/A
-        p10 = re.compile(r'^Total Dropped\s+: +(?P<total_dropped>[\D\s]+)$')
+        p10 = regex_engine.compile(r'^Total Dropped\s+: +(?P<total_dropped>[\D\s]+)$')
 
         # Total Dropped             :                 638/42108                10
-        p11 = re.compile(r'^Total Dropped\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
+        p11 = regex_engine.compile(r'^Total Dropped\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
 
         # Queue ID                             : 44
-        p12 = re.compile(r'^Queue ID\s+: +(?P<queue_id>[\d]+)$')
+        p12 = regex_engine.compile(r'^Queue ID\s+: +(?P<queue_id>[\d]+)$')
 
         # High watermark  (bytes)/(ms)         : 0/0
-        p13 = re.compile(r'^High +watermark[\S\D]+:\s+(?P<high_watermark>[\d\S]+)$')
+        p13 = regex_engine.compile(r'^High +watermark[\S\D]+:\s+(?P<high_watermark>[\d\S]+)$')
 
         # Inst-queue-len  (bytes)/(ms)         : 0/0
-        p14 = re.compile(r'^Inst-queue-len[\S\D]+:\s+(?P<inst_queue_len>[\d\S]+)$')
+        p14 = regex_engine.compile(r'^Inst-queue-len[\S\D]+:\s+(?P<inst_queue_len>[\d\S]+)$')
 
         # Avg-queue-len   (bytes)/(ms)         : 0/0
-        p15 = re.compile(r'^Avg-queue-len[\S\D]+:\s+(?P<avg_queue_len>[\d\S]+)$')
+        p15 = regex_engine.compile(r'^Avg-queue-len[\S\D]+:\s+(?P<avg_queue_len>[\d\S]+)$')
 
         # Taildropped(packets/bytes)           : 0/0
-        p16 = re.compile(r'^Taildropped[\S\D]+:\s+(?P<taildropped>[\d\S]+)$')
+        p16 = regex_engine.compile(r'^Taildropped[\S\D]+:\s+(?P<taildropped>[\d\S]+)$')
 
         # Queue(conform)      :                   0/0                    0
-        p17 = re.compile(r'^Queue\(conform\)\s*:\s*(?P<packets>\d+)\/(?P<bytes>\d+)\s+(?P<rate>\d+)$')
+        p17 = regex_engine.compile(r'^Queue\(conform\)\s*:\s*(?P<packets>\d+)\/(?P<bytes>\d+)\s+(?P<rate>\d+)$')
 
         # RED random drops(packets/bytes)      : 0/0
-        p18 = re.compile(r'^RED\s+random\s+drops\(packets/bytes\)\s*:\s*(?P<packets>\d+)\/(?P<bytes>\d+)$')
+        p18 = regex_engine.compile(r'^RED\s+random\s+drops\(packets/bytes\)\s*:\s*(?P<packets>\d+)\/(?P<bytes>\d+)$')
 
         # Policed(conform)    :              219590/167414590            0
-        p19 = re.compile(r'^Policed\(conform\)\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
+        p19 = regex_engine.compile(r'^Policed\(conform\)\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
 
         # Policed(exceed)     :                   0/0                    0
-        p20 = re.compile(r'^Policed\(exceed\)\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
+        p20 = regex_engine.compile(r'^Policed\(exceed\)\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
 
         # Policed(violate)    :                   0/0                    0
-        p21 = re.compile(r'^Policed\(violate\)\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
+        p21 = regex_engine.compile(r'^Policed\(violate\)\s+\:\s+(?P<packets_bytes>[\d\/]+)\s+(?P<rate_kbps>[\d]+)$')
 
         # Policed and dropped :                   0/0
-        p22 = re.compile(r'^Policed and dropped\s+\:\s+(?P<packets_bytes>[\d\/]+)')
+        p22 = regex_engine.compile(r'^Policed and dropped\s+\:\s+(?P<packets_bytes>[\d\/]+)')
 
         # Queue(exceed)       :                   0/0                    0
-        p23 = re.compile(r'^Queue\(exceed\)\s*:\s*(?P<packets>\d+)\/(?P<bytes>\d+)\s+(?P<rate>\d+)$')
+        p23 = regex_engine.compile(r'^Queue\(exceed\)\s*:\s*(?P<packets>\d+)\/(?P<bytes>\d+)\s+(?P<rate>\d+)$')
 
         # WRED profile for WRED Curve 1
-        p24 = re.compile(r'^WRED\s+profile\s+for\s+WRED\s+(?P<wred_curve>[\w\s]+)$')
+        p24 = regex_engine.compile(r'^WRED\s+profile\s+for\s+WRED\s+(?P<wred_curve>[\w\s]+)$')
 
         # RED Transmitted (packets/bytes)            : N/A
-        p25 = re.compile(r'^RED\s+Transmitted\s+\(packets\/bytes\)\s+:\s+(?P<red_transmitted>[\D]+)$')
+        p25 = regex_engine.compile(r'^RED\s+Transmitted\s+\(packets\/bytes\)\s+:\s+(?P<red_transmitted>[\D]+)$')
 
         # RED maxthreshold drops(packets/bytes)      : N/A
-        p26 = re.compile(r'^RED\s+maxthreshold\s+drops\(packets\/bytes\)\s+:\s+(?P<red_maxthreshold_drops>[\D]+)$')
+        p26 = regex_engine.compile(r'^RED\s+maxthreshold\s+drops\(packets\/bytes\)\s+:\s+(?P<red_maxthreshold_drops>[\D]+)$')
 
         # RED ecn marked & transmitted(packets/bytes): N/A
-        p27 = re.compile(r'^RED\s+ecn\s+marked\s+&\s+transmitted\(packets\/bytes\)\s*:\s+(?P<red_ecn_marked_transmitted>[\D]+)$')
+        p27 = regex_engine.compile(r'^RED\s+ecn\s+marked\s+&\s+transmitted\(packets\/bytes\)\s*:\s+(?P<red_ecn_marked_transmitted>[\D]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1,10 +1,10 @@
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==================================================
 # Schema for 'show pool {address_family} name {pool_name}'
@@ -56,52 +56,52 @@ class ShowPoolAddressFamilyPool(ShowPoolAddressFamilyPoolSchema):
         ret_dict = {} 
         
         #  Pool CATL_POOL Allocations
-        p1 = re.compile(r'^(Pool\s+(?P<pool_name>\S+)\s+Allocations)$')
+        p1 = regex_engine.compile(r'^(Pool\s+(?P<pool_name>\S+)\s+Allocations)$')
         
         # VRF: default
-        p2 = re.compile(r'^VRF:\s+(?P<vrf_name>\w+)$')
+        p2 = regex_engine.compile(r'^VRF:\s+(?P<vrf_name>\w+)$')
         
         # Pool Id: 0
-        p3 = re.compile(r'^Pool\s+Id:\s+(?P<pool_id>\d+)$')
+        p3 = regex_engine.compile(r'^Pool\s+Id:\s+(?P<pool_id>\d+)$')
         
         # Pool Scope: VRF Specific Pool
-        p4 = re.compile(r'^Pool\s+Scope:\s+(?P<pool_scope>\w+\s+\w+\s+\w+)$')
+        p4 = regex_engine.compile(r'^Pool\s+Scope:\s+(?P<pool_scope>\w+\s+\w+\s+\w+)$')
         
         # Prefix Length: 32
-        p5 = re.compile(r'^Prefix\s+Length:\s+(?P<prefix_length>\d+)$')
+        p5 = regex_engine.compile(r'^Prefix\s+Length:\s+(?P<prefix_length>\d+)$')
         
         # Used:             0
-        p6 = re.compile(r'^Used:\s+(?P<used>\d+)$')
+        p6 = regex_engine.compile(r'^Used:\s+(?P<used>\d+)$')
         
         # Excl:             0
-        p7 = re.compile(r'^Excl:\s+(?P<excl>\d+)$')
+        p7 = regex_engine.compile(r'^Excl:\s+(?P<excl>\d+)$')
         
         # Free:           253
-        p8 = re.compile(r'^Free:\s+(?P<free>\d+)$')
+        p8 = regex_engine.compile(r'^Free:\s+(?P<free>\d+)$')
         
         # Total:          253
-        p9 = re.compile(r'^Total:\s+(?P<total>\d+)$')
+        p9 = regex_engine.compile(r'^Total:\s+(?P<total>\d+)$')
         
         # Utilization:    0%
-        p10 = re.compile(r'^Utilization:\s+(?P<utilization>\S+)$')
+        p10 = regex_engine.compile(r'^Utilization:\s+(?P<utilization>\S+)$')
         
         # Range Start        :  192.168.1.2
-        p11 = re.compile(r'^Range\s+Start\s+:\s+(?P<range_start>\S+)$')
+        p11 = regex_engine.compile(r'^Range\s+Start\s+:\s+(?P<range_start>\S+)$')
         
         # Range End          :  192.168.1.254 
-        p12 = re.compile(r'^Range\s+End\s+:\s+(?P<range_end>\S+)$')
+        p12 = regex_engine.compile(r'^Range\s+End\s+:\s+(?P<range_end>\S+)$')
         
         # Default Router     :  0.0.0.0 
-        p13 = re.compile(r'^Default\s+Router\s+:\s+(?P<default_router>\S+)$')
+        p13 = regex_engine.compile(r'^Default\s+Router\s+:\s+(?P<default_router>\S+)$')
         
         # Used Addresses     :  0
-        p14 = re.compile(r'^Used\s+Addresses\s+:\s+(?P<used_address>\S+)$')
+        p14 = regex_engine.compile(r'^Used\s+Addresses\s+:\s+(?P<used_address>\S+)$')
         
         # Excluded Addresses :  0 
-        p15 = re.compile(r'^Excluded\s+Addresses\s+:\s+(?P<excluded_address>\S+)$')
+        p15 = regex_engine.compile(r'^Excluded\s+Addresses\s+:\s+(?P<excluded_address>\S+)$')
         
         # Free Addresses     :  253
-        p16 = re.compile(r'^Free\s+Addresses\s+:\s+(?P<free_address>\S+)$')
+        p16 = regex_engine.compile(r'^Free\s+Addresses\s+:\s+(?P<free_address>\S+)$')
         
         for line in output.splitlines():
             line = line.strip()
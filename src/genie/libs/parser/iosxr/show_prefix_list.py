@@ -6,13 +6,13 @@ IOSXR parser for the following show command:
     * show rpl prefix-set <name>
 """
 
-# Python
-import re
-
 # MetaParser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowRplPrefixSetSchema(MetaParser):
     """Schema for:
@@ -62,7 +62,7 @@ class ShowRplPrefixSet(ShowRplPrefixSetSchema):
 
         # prefix-set test
         # prefix-set test6
-        p1 = re.compile(r"^prefix\-set +(?P<name>\S+)$")
+        p1 = regex_engine.compile(r"^prefix\-set +(?P<name>\S+)$")
 
         # ipv4 version of below
         # 2001:db8:1::/64,
@@ -71,7 +71,7 @@ class ShowRplPrefixSet(ShowRplPrefixSetSchema):
         # 2001:db8:4::/64 ge 65 le 98
         # 10.246.192.0/24 eq 32,
         # 192.168.131.0/24,
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<prefix>[\w\.:]+)"
             r"(?:(\/(?P<mask>\d+)))?"
             r"(?:(\s*(?P<range>[lgeq\d\s]+)))?,?$"
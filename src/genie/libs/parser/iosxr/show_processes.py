@@ -4,13 +4,13 @@ IOSXR parsers for the following commands:
     * show processes cpu
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowProcessesSchema(MetaParser):
     ''' Schema for commands:
         * show processes 
@@ -76,70 +76,70 @@ class ShowProcesses(ShowProcessesSchema):
         parsed_output = {}
 
         # Job Id: 1011
-        r1 = re.compile(r'Job\s+Id\s*:\s*(?P<job_id>\d+)')
+        r1 = regex_engine.compile(r'Job\s+Id\s*:\s*(?P<job_id>\d+)')
 
         # PID: 22464
-        r2 = re.compile(r'PID\s*:\s*(?P<pid>\d+)')
+        r2 = regex_engine.compile(r'PID\s*:\s*(?P<pid>\d+)')
 
         # Process name: isis
-        r3 = re.compile(r'Process\s+name\s*:\s+(?P<process_name>\S+)')
+        r3 = regex_engine.compile(r'Process\s+name\s*:\s+(?P<process_name>\S+)')
 
         # Executable path: /opt/cisco/XR/packages/xrv9k-isis-10.9.0.0-r651/rp/bin/isis
-        r4 = re.compile(r'Executable\s+path\s*:\s*(?P<executable_path>\S+)')
+        r4 = regex_engine.compile(r'Executable\s+path\s*:\s*(?P<executable_path>\S+)')
 
         # Instance #: 1
-        r5 = re.compile(r'Instance\s+\#\s*:\s*(?P<instance_number>\d+)')
+        r5 = regex_engine.compile(r'Instance\s+\#\s*:\s*(?P<instance_number>\d+)')
 
         # Version ID: 00.00.0000
-        r6 = re.compile(r'Version\s+ID\s*:\s*(?P<version_id>\S+)')
+        r6 = regex_engine.compile(r'Version\s+ID\s*:\s*(?P<version_id>\S+)')
 
         # Respawn: ON
-        r7 = re.compile(r'Respawn\s*:\s*(?P<respawn>(ON|OFF))')
+        r7 = regex_engine.compile(r'Respawn\s*:\s*(?P<respawn>(ON|OFF))')
 
         # Respawn count: 1
-        r8 = re.compile(r'Respawn\s+count\s*:\s*(?P<respawn_count>\d+)')
+        r8 = regex_engine.compile(r'Respawn\s+count\s*:\s*(?P<respawn_count>\d+)')
 
         # Last started: Wed Jan 30 20:43:04 2019
-        r9 = re.compile(r'Last\s+started\s*:\s*(?P<last_started>.+)')
+        r9 = regex_engine.compile(r'Last\s+started\s*:\s*(?P<last_started>.+)')
 
         # Process state: Run
-        r10 = re.compile(r'Process\s+state\s*:\s*(?P<process_state>.+)')
+        r10 = regex_engine.compile(r'Process\s+state\s*:\s*(?P<process_state>.+)')
 
         # Package state: Normal
-        r11 = re.compile(r'Package\s+state\s*:\s*(?P<package_state>.+)')
+        r11 = regex_engine.compile(r'Package\s+state\s*:\s*(?P<package_state>.+)')
 
         # Started on config: cfg/gl/isis/instance/test/ord_A/running
-        r12 = re.compile(r'Started\s+on\s+config\s*:\s*'
-                          r'(?P<started_on_config>\S+)')
+        r12 = regex_engine.compile(r'Started\s+on\s+config\s*:\s*'
+                                    r'(?P<started_on_config>\S+)')
 
         # Process group: v4-routing
-        r13 = re.compile(r'Process\s+group\s*:\s*(?P<process_group>\S+)')
+        r13 = regex_engine.compile(r'Process\s+group\s*:\s*(?P<process_group>\S+)')
 
         # core: COPY
-        r14 = re.compile(r'core\s*:\s*(?P<core>\S+)')
+        r14 = regex_engine.compile(r'core\s*:\s*(?P<core>\S+)')
 
         # Max. core: 0
-        r15 = re.compile(r'Max\.\s+core\s*:\s*(?P<max_core>\d+)')
+        r15 = regex_engine.compile(r'Max\.\s+core\s*:\s*(?P<max_core>\d+)')
 
         # Placement: Placeable
-        r16 = re.compile(r'Placement\s*:\s*(?P<placement>.+)')
+        r16 = regex_engine.compile(r'Placement\s*:\s*(?P<placement>.+)')
 
         # startup_path: /opt/cisco/XR/packages/xrv9k-isis-10.9.0.0-r651/rp/startup/isis.startup
-        r17 = re.compile(r'startup\_path\s*:\s*(?P<startup_path>\S+)')
+        r17 = regex_engine.compile(r'startup\_path\s*:\s*(?P<startup_path>\S+)')
 
         # Ready: 1.804s
-        r18 = re.compile(r'Ready\s*:\s*(?P<ready>.+)')
+        r18 = regex_engine.compile(r'Ready\s*:\s*(?P<ready>.+)')
 
         # Available: 1.892s
-        r19 = re.compile(r'Available\s*:\s*(?P<available>.+)')
+        r19 = regex_engine.compile(r'Available\s*:\s*(?P<available>.+)')
 
         # Process cpu time: 2.690 user, 0.640 kernel, 3.330 total
-        r20 = re.compile(r'Process\s+cpu\s+time\s*:\s*(?P<cpu_time_user>\S+)'
-                          r'\s+user,\s+(?P<cpu_time_kernel>\S+)\s+kernel,\s+'
-                          r'(?P<cpu_time_total>\S+)\s+total')
+        r20 = regex_engine.compile(r'Process\s+cpu\s+time\s*:\s*(?P<cpu_time_user>\S+)'
+                                    r'\s+user,\s+(?P<cpu_time_kernel>\S+)\s+kernel,\s+'
+                                    r'(?P<cpu_time_total>\S+)\s+total')
 
         #Registered item(s): cfg/gl/isis/instance/.*/ord_A/
-        r21 = re.compile(r'Registered\s+item\(s\)\s*:\s*(?P<registered_item>.+)')
+        r21 = regex_engine.compile(r'Registered\s+item\(s\)\s*:\s*(?P<registered_item>.+)')
 
         # JID    TID   Stack  pri  state        NAME             rt_pri
         # 1011   22511    0K  20   Sleeping     Decision         0
@@ -148,9 +148,9 @@ class ShowProcesses(ShowProcessesSchema):
         # 1011   22514    0K  20   Sleeping     Protect Infra    0
         # 1011   22494    0K  20   Sleeping     telemetry_evtli  0
         # 1011   22487    0K  20   Sleeping     lspv_lib ISIS    0
-        r22 = re.compile(r'(?P<jid>\d+)\s+(?P<tid>\d+)\s+(?P<stack>\S+)\s+'
-                          r'(?P<pri>\d+)\s+(?P<state>\S+)\s+\s'
-                          r'(?P<name>[\sa-zA-Z\_\-\.]+)\s+(?P<rt_pri>\d+)')
+        r22 = regex_engine.compile(r'(?P<jid>\d+)\s+(?P<tid>\d+)\s+(?P<stack>\S+)\s+'
+                                    r'(?P<pri>\d+)\s+(?P<state>\S+)\s+\s'
+                                    r'(?P<name>[\sa-zA-Z\_\-\.]+)\s+(?P<rt_pri>\d+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -429,15 +429,15 @@ class ShowProcessesCpu(ShowProcessesCpuSchema):
         index = 0
 
         # ---- node0_RP0_CPU0 ----
-        p1 = re.compile(r'^----\s+(?P<location>\S+)\s+----$')
+        p1 = regex_engine.compile(r'^----\s+(?P<location>\S+)\s+----$')
 
         # CPU utilization for one minute: 0%; five minutes: 0%; fifteen minutes: 0%
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^CPU\s+utilization\s+for\s+one\s+minute:\s+(?P<one_min_cpu>\d+)\%;\s+five\s+minutes:\s+(?P<five_min_cpu>\d+)\%;\s+fifteen\s+minutes:\s+(?P<fifteen_min_cpu>\d+)%$'
         )
 
         # 1        0%      0%       0% init
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<pid>\d+)\s+(?P<one_min_cpu>\d+)%\s+(?P<five_min_cpu>\d+)%\s+(?P<fifteen_min_cpu>\d+)%\s+(?P<process>\S+)$'
         )
 
@@ -5,13 +5,13 @@ IOSXR parsers for the following show commands:
 '''
 
 # Python
-import re
 import xmltodict
 from netaddr import IPAddress, INET_ATON
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -174,7 +174,7 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
             line = line.strip()
 
             # Routing Protocol OSPF 1
-            p1 = re.compile(r'^Routing +Protocol +(?P<pro>OSPF|OSPFv3) +(?P<pid>\S+)$')
+            p1 = regex_engine.compile(r'^Routing +Protocol +(?P<pro>OSPF|OSPFv3) +(?P<pid>\S+)$')
             m = p1.match(line)
             if m:
                 instance = str(m.groupdict()['pid'])
@@ -187,14 +187,14 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 continue
 
             # Router Id: 10.36.3.3
-            p2 = re.compile(r'^Router +Id: +(?P<router_id>\S+)$')
+            p2 = regex_engine.compile(r'^Router +Id: +(?P<router_id>\S+)$')
             m = p2.match(line)
             if m:
                 ospf_dict['router_id'] = str(m.groupdict()['router_id'])
                 continue
 
             # Distance: 110
-            p3_1 = re.compile(r'^Distance: +(?P<distance>\d+)$')
+            p3_1 = regex_engine.compile(r'^Distance: +(?P<distance>\d+)$')
             m = p3_1.match(line)
             if m:
                 try:
@@ -208,9 +208,9 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 continue
 
             # Distance: IntraArea 112 InterArea 113 External/NSSA 114
-            p3_2 = re.compile(r'^Distance: +IntraArea +(?P<intra>\d+)'
-                               r' +InterArea +(?P<inter>\d+) +External\/NSSA'
-                               r' +(?P<external>\d+)$')
+            p3_2 = regex_engine.compile(r'^Distance: +IntraArea +(?P<intra>\d+)'
+                                         r' +InterArea +(?P<inter>\d+) +External\/NSSA'
+                                         r' +(?P<external>\d+)$')
             m = p3_2.match(line)
             if m:
                 sub_dict = ospf_dict.setdefault('preference', {}) \
@@ -224,8 +224,8 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 continue
 
             # Non-Stop Forwarding: Disabled
-            p4 = re.compile(r'^Non-Stop +Forwarding:'
-                             ' +(?P<nsf>(Disabled|Enabled))$')
+            p4 = regex_engine.compile(r'^Non-Stop +Forwarding:'
+                                       ' +(?P<nsf>(Disabled|Enabled))$')
             m = p4.match(line)
             if m:
                 if 'Disabled' in m.groupdict()['nsf']:
@@ -239,8 +239,8 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
             #   connected with metric 10
             #   static
             #   static with metric 10
-            p14 = re.compile(r'^(?P<type>(connected|static))(?: +with +metric'
-                               r' +(?P<metric>\d+))?$')
+            p14 = regex_engine.compile(r'^(?P<type>(connected|static))(?: +with +metric'
+                                         r' +(?P<metric>\d+))?$')
             m = p14.match(line)
             if m:
                 the_type = str(m.groupdict()['type'])
@@ -254,8 +254,8 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
             #   bgp 100 with metric 111
             #   isis 10 with metric 3333
             #   ospf 99
-            p15 = re.compile(r'^(?!Area)(?P<prot>\w+) +(?P<pid>\d+)(?: +with'
-                               r' +metric +(?P<metric>\d+))?$')
+            p15 = regex_engine.compile(r'^(?!Area)(?P<prot>\w+) +(?P<pid>\d+)(?: +with'
+                                         r' +metric +(?P<metric>\d+))?$')
             m = p15.match(line)
             if m:
                 group = m.groupdict()
@@ -270,7 +270,7 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 continue
 
             # Area 0
-            p5 = re.compile(r'^Area +(?P<area>\S+)$')
+            p5 = regex_engine.compile(r'^Area +(?P<area>\S+)$')
             m = p5.match(line)
             if m:
                 area = str(IPAddress(m.groupdict()['area'], flags=INET_ATON))
@@ -280,7 +280,7 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 continue
 
             # MPLS/TE enabled
-            p6 = re.compile(r'^MPLS\/TE +(?P<te>(enabled|disabled))$')
+            p6 = regex_engine.compile(r'^MPLS\/TE +(?P<te>(enabled|disabled))$')
             m = p6.match(line)
             if m:
                 sub_dict = area_dict.setdefault('mpls', {}).setdefault('te', {})
@@ -294,14 +294,14 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
             # GigabitEthernet0/0/0/0
             # GigabitEthernet0/0/0/2
             # TenGigabitEthernet0/0/0/2
-            p6 = re.compile(r'^(?P<intf>(Lo|Gi|Te|Bu)[\w\/\.\-]+)$')
+            p6 = regex_engine.compile(r'^(?P<intf>(Lo|Gi|Te|Bu)[\w\/\.\-]+)$')
             m = p6.match(line)
             if m:
                 area_interfaces.append(m.groupdict()['intf'])
                 continue
 
             # Routing Protocol "BGP 100"
-            p8 = re.compile(r'^Routing +Protocol +\"BGP +(?P<bgp_pid>\d+)\"$')
+            p8 = regex_engine.compile(r'^Routing +Protocol +\"BGP +(?P<bgp_pid>\d+)\"$')
             m = p8.match(line)
             if m:
                 # Set sub_dict
@@ -310,7 +310,7 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 continue
 
             # Non-stop routing is enabled
-            p8 = re.compile(r'^Non-stop +routing +is +(?P<nsr>(enabled|disabled))$')
+            p8 = regex_engine.compile(r'^Non-stop +routing +is +(?P<nsr>(enabled|disabled))$')
             m = p8.match(line)
             if m:
                 nsr_dict = bgp_dict.setdefault('nsr', {})
@@ -321,7 +321,7 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 continue
 
             # Graceful restart is not enabled
-            p9 = re.compile(r'^Graceful restart is not +enabled$')
+            p9 = regex_engine.compile(r'^Graceful restart is not +enabled$')
             m = p9.match(line)
             if m:
                 sub_dict = bgp_dict.setdefault('graceful_restart', {})
@@ -329,8 +329,8 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 continue
 
             # Current BGP NSR state - Active Ready
-            p10 = re.compile(r'^Current +BGP +NSR +state +\-'
-                              r' +(?P<state>([\w\s]+))$')
+            p10 = regex_engine.compile(r'^Current +BGP +NSR +state +\-'
+                                        r' +(?P<state>([\w\s]+))$')
             m = p10.match(line)
             if m:
                 nsr_dict = bgp_dict.setdefault('nsr', {})
@@ -340,7 +340,7 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
 
             # Address Family VPNv4 Unicast:
             # Address Family VPNv6 Unicast:
-            p11 = re.compile(r'^Address +Family +(?P<af>[\w\s\-]+):$')
+            p11 = regex_engine.compile(r'^Address +Family +(?P<af>[\w\s\-]+):$')
             m = p11.match(line)
             if m:
                 af = m.groupdict()['af'].lower()
@@ -348,8 +348,8 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 continue
 
             # Distance: external 20 internal 200 local 200
-            p12 = re.compile(r'^Distance: +external +(?P<external>\d+) +internal'
-                              r' +(?P<internal>\d+) +local +(?P<local>\d+)$')
+            p12 = regex_engine.compile(r'^Distance: +external +(?P<external>\d+) +internal'
+                                        r' +(?P<internal>\d+) +local +(?P<local>\d+)$')
             m = p12.match(line)
             if m:
                 group = m.groupdict()
@@ -358,7 +358,7 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
                 continue
 
             # Sourced Networks:
-            p_sn = re.compile(r'(?i)^Sourced +Networks:$')
+            p_sn = regex_engine.compile(r'(?i)^Sourced +Networks:$')
             m = p_sn.match(line)
             if m:
                 src_networks = []
@@ -367,7 +367,7 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
 
             # 10.10.10.0/30
             # 2001:db8:7000:8::/64
-            p_sn2 = re.compile(r'^(?P<src>[\d\.\:\/]+)$')
+            p_sn2 = regex_engine.compile(r'^(?P<src>[\d\.\:\/]+)$')
             m = p_sn2.match(line)
             if m:
                 try:
@@ -382,8 +382,8 @@ class ShowProtocolsAfiAllAll(ShowProtocolsAfiAllAllSchema):
             # 10.64.4.4       08:05:59                    None       No
             # 172.25.12.17    1w0d                        None       Yes
             # 2001:db8:7000:13::1   1w0d                 None       Yes
-            p13 = re.compile(r'^(?P<nbr>[\d\:\.]+) +(?P<last_update>[\w\:]+)'
-                              r' +(?P<nsr_state>\S+) +(?P<gr_enable>No|Yes)$')
+            p13 = regex_engine.compile(r'^(?P<nbr>[\d\:\.]+) +(?P<last_update>[\w\:]+)'
+                                        r' +(?P<nsr_state>\S+) +(?P<gr_enable>No|Yes)$')
             m = p13.match(line)
             if m:
                 group = m.groupdict()
@@ -566,86 +566,86 @@ class ShowProtocols(ShowProtocolsSchema):
         result_dict = {}
 
         # Routing Protocol OSPF mpls1
-        p1 = re.compile(r'^Routing +Protocol +(?P<protocol>(OSPF(v3)?))'
-                        r' +(?P<pid>\S+)$')
+        p1 = regex_engine.compile(r'^Routing +Protocol +(?P<protocol>(OSPF(v3)?))'
+                                  r' +(?P<pid>\S+)$')
 
         # Router Id: 10.94.1.1
-        p2 = re.compile(r'^Router +Id: +(?P<router_id>\S+)$')
+        p2 = regex_engine.compile(r'^Router +Id: +(?P<router_id>\S+)$')
 
         # Distance: 110
-        p3 = re.compile(r'^Distance: +(?P<distance>\d+)$')
+        p3 = regex_engine.compile(r'^Distance: +(?P<distance>\d+)$')
 
         # Distance: IntraArea 112 InterArea 113 External/NSSA 114
-        p4 = re.compile(r'^Distance: +IntraArea +(?P<intra>\d+)'
-                        r' +InterArea +(?P<inter>\d+) +External\/NSSA'
-                        r' +(?P<external>\d+)$')
+        p4 = regex_engine.compile(r'^Distance: +IntraArea +(?P<intra>\d+)'
+                                  r' +InterArea +(?P<inter>\d+) +External\/NSSA'
+                                  r' +(?P<external>\d+)$')
 
         # Non-Stop Forwarding: Enabled
         # Non-Stop Forwarding: Disabled
-        p5 = re.compile(r'^Non-Stop +Forwarding:'
-                        r' +(?P<nsf>(Disabled|Enabled))$')
+        p5 = regex_engine.compile(r'^Non-Stop +Forwarding:'
+                                  r' +(?P<nsf>(Disabled|Enabled))$')
 
         # Redistribution:
         #   connected
         #   connected with metric 10
         #   static
         #   static with metric 100
-        p6 = re.compile(r'^(?P<type>(connected|static))(?: +with +metric'
-                        r' +(?P<metric>\d+))?$')
+        p6 = regex_engine.compile(r'^(?P<type>(connected|static))(?: +with +metric'
+                                  r' +(?P<metric>\d+))?$')
 
         # Redistribution:
         #   bgp 100 with metric 111
         #   isis 10 with metric 3333
-        p7 = re.compile(r'^(?!Area)(?P<prot>\w+) +(?P<pid>\d+)(?: +with'
-                        r' +metric +(?P<metric>\d+))?$')
+        p7 = regex_engine.compile(r'^(?!Area)(?P<prot>\w+) +(?P<pid>\d+)(?: +with'
+                                  r' +metric +(?P<metric>\d+))?$')
 
         # Area 0
-        p8 = re.compile(r'^Area +(?P<area>\S+)$')
+        p8 = regex_engine.compile(r'^Area +(?P<area>\S+)$')
 
         #   MPLS/TE enabled
-        p9 = re.compile(r'^MPLS\/TE +(?P<mpls_te>(enabled|disabled))$')
+        p9 = regex_engine.compile(r'^MPLS\/TE +(?P<mpls_te>(enabled|disabled))$')
 
         #   Loopback0
         #   GigabitEthernet0/0/0/0
         #   GigabitEthernet0/0/0/1
-        p10 = re.compile(r'^(?P<interface>(Loopback|(Ten)?GigabitEthernet)'
-                        r'[\d\/]+)$')
+        p10 = regex_engine.compile(r'^(?P<interface>(Loopback|(Ten)?GigabitEthernet)'
+                                  r'[\d\/]+)$')
 
         # Routing Protocol "BGP 40"
-        p11 = re.compile(r'^Routing +Protocol +\"BGP +(?P<bgp_pid>\d+)\"$')
+        p11 = regex_engine.compile(r'^Routing +Protocol +\"BGP +(?P<bgp_pid>\d+)\"$')
 
         # Non-stop routing is enabled
-        p12 = re.compile(r'^Non-stop +routing +is +'
-                         r'(?P<nsr>(enabled|disabled))$')
+        p12 = regex_engine.compile(r'^Non-stop +routing +is +'
+                                   r'(?P<nsr>(enabled|disabled))$')
 
         # Graceful restart is enabled
-        p13 = re.compile(r'^Graceful restart is not +enabled$')
+        p13 = regex_engine.compile(r'^Graceful restart is not +enabled$')
 
         # Current BGP NSR state - TCP Initial Sync
-        p14 = re.compile(r'^Current +BGP +NSR +state +\-'
-                         r' +(?P<state>([\w\s]+))$')
+        p14 = regex_engine.compile(r'^Current +BGP +NSR +state +\-'
+                                   r' +(?P<state>([\w\s]+))$')
 
         # Address Family IPv4 Unicast:
         # Address Family VPNv6 Unicast:
-        p15 = re.compile(r'^Address +Family +(?P<af>[\w\s\-]+):$')
+        p15 = regex_engine.compile(r'^Address +Family +(?P<af>[\w\s\-]+):$')
 
         # Distance: external 20 internal 200 local 200
-        p16 = re.compile(r'^Distance: +external +(?P<external>\d+) +internal'
-                         r' +(?P<internal>\d+) +local +(?P<local>\d+)$')
+        p16 = regex_engine.compile(r'^Distance: +external +(?P<external>\d+) +internal'
+                                   r' +(?P<internal>\d+) +local +(?P<local>\d+)$')
 
         # Sourced Networks:
-        p17 = re.compile(r'^Sourced +Networks:$')
+        p17 = regex_engine.compile(r'^Sourced +Networks:$')
 
         # 10.100.0.0/16 backdoor
         # 10.100.1.0/24
-        p18 = re.compile(r'^(?P<src>[\d\.\:\/]+ *(backdoor)?)$')
+        p18 = regex_engine.compile(r'^(?P<src>[\d\.\:\/]+ *(backdoor)?)$')
 
         # Neighbor          State/Last update received
         # 10.5.0.2          Idle
         # Neighbor      State/Last update received  NSR-State  GR-Enabled
         # 10.64.4.4       08:05:59                    None       No
-        p19 = re.compile(r'^(?P<nbr>[\d\:\.]+) +(?P<last_update>[\w\:]+)'
-                         r'( +(?P<nsr_state>\S+) +(?P<gr_enable>No|Yes))?$')
+        p19 = regex_engine.compile(r'^(?P<nbr>[\d\:\.]+) +(?P<last_update>[\w\:]+)'
+                                   r'( +(?P<nsr_state>\S+) +(?P<gr_enable>No|Yes))?$')
 
         for line in out.splitlines():
             line = line.strip()
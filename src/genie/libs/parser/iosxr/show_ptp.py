@@ -4,10 +4,8 @@ IOSXR parsers for the following commands:
     * 'show ptp foreign-masters brief'
 """
 
-# Python
-import re
-
 # Metaparser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
@@ -72,61 +70,61 @@ class ShowPtpPlatformServo(ShowPtpPlatformServoSchema):
         ret_dict = {}
 
         # Servo status: Running
-        p1 = re.compile(r'^Servo\s+status:\s+(?P<servo_status>[a-zA-Z]+)$')
+        p1 = regex_engine.compile(r'^Servo\s+status:\s+(?P<servo_status>[a-zA-Z]+)$')
 
         # Servo stat_index: 2
-        p2 = re.compile(r'^Servo\s+stat_index:\s+(?P<servo_stat_index>\d+)$')
+        p2 = regex_engine.compile(r'^Servo\s+stat_index:\s+(?P<servo_stat_index>\d+)$')
 
         # Device status: PHASE_LOCKED
         # Device status: FREQ_LOCKED
-        p3 = re.compile(r'^Device\s+status:\s+(?P<device_status>[\w]+)$')
+        p3 = regex_engine.compile(r'^Device\s+status:\s+(?P<device_status>[\w]+)$')
 
         # Servo Mode: Hybrid
         # Servo Mode: Non Hybrid
-        p4 = re.compile(r'^Servo\s+Mode:\s+(?P<servo_mode>[a-zA-Z ]+)$')
+        p4 = regex_engine.compile(r'^Servo\s+Mode:\s+(?P<servo_mode>[a-zA-Z ]+)$')
 
         # Servo log level: 0
-        p5 = re.compile(r'^Servo\s+log\s+level:\s+(?P<servo_log_level>\d+)$')
+        p5 = regex_engine.compile(r'^Servo\s+log\s+level:\s+(?P<servo_log_level>\d+)$')
 
         # Phase Alignment Accuracy: -8 ns
         # Phase Alignment Accuracy: -17034645174 ns
-        p6 = re.compile(r'^Phase\s+Alignment\s+Accuracy:\s+(?P<phase_alignment_accuracy>[-\w ]+)$')
+        p6 = regex_engine.compile(r'^Phase\s+Alignment\s+Accuracy:\s+(?P<phase_alignment_accuracy>[-\w ]+)$')
 
         # Sync timestamp updated: 9848934
-        p7 = re.compile(r'^Sync\s+timestamp\s+updated:\s+(?P<sync_timestamp_updated>\d+)$')
+        p7 = regex_engine.compile(r'^Sync\s+timestamp\s+updated:\s+(?P<sync_timestamp_updated>\d+)$')
 
         # Sync timestamp discarded: 0
-        p8 = re.compile(r'^Sync\s+timestamp\s+discarded:\s+(?P<sync_timestamp_discarded>\d+)$')
+        p8 = regex_engine.compile(r'^Sync\s+timestamp\s+discarded:\s+(?P<sync_timestamp_discarded>\d+)$')
 
         # Delay timestamp updated: 9848973
-        p9 = re.compile(r'^Delay\s+timestamp\s+updated:\s+(?P<delay_timestamp_updated>\d+)$')
+        p9 = regex_engine.compile(r'^Delay\s+timestamp\s+updated:\s+(?P<delay_timestamp_updated>\d+)$')
 
         # Delay timestamp discarded: 0
-        p10 = re.compile(r'^Delay\s+timestamp\s+discarded:\s+(?P<delay_timestamp_discarded>\d+)$')
+        p10 = regex_engine.compile(r'^Delay\s+timestamp\s+discarded:\s+(?P<delay_timestamp_discarded>\d+)$')
 
         # Previous Received Timestamp T1: 1674467002.900294787  T2: 1674467002.900304552  T3: 1674467002.905436033  T4: 1674467002.905445830
-        p11 = re.compile(r'^Previous\s+Received\s+Timestamp\s+T1:\s+(?P<t1>[\d.]+)\s+T2:\s+(?P<t2>[\d.]+)\s+T3:\s+(?P<t3>[\d.]+)\s+T4:\s+(?P<t4>[\d.]+)$')
+        p11 = regex_engine.compile(r'^Previous\s+Received\s+Timestamp\s+T1:\s+(?P<t1>[\d.]+)\s+T2:\s+(?P<t2>[\d.]+)\s+T3:\s+(?P<t3>[\d.]+)\s+T4:\s+(?P<t4>[\d.]+)$')
 
         # Last Received Timestamp T1: 1671703729.684676938 T2: 1671703746.719324326 T3: 1671703746.779917501 T4: 1671703729.745274543
-        p12 = re.compile(r'^Last\s+Received\s+Timestamp\s+T1:\s+(?P<t1>[\d.]+)\s+T2:\s+(?P<t2>[\d.]+)\s+T3:\s+(?P<t3>[\d.]+)\s+T4:\s+(?P<t4>[\d.]+)$')
+        p12 = regex_engine.compile(r'^Last\s+Received\s+Timestamp\s+T1:\s+(?P<t1>[\d.]+)\s+T2:\s+(?P<t2>[\d.]+)\s+T3:\s+(?P<t3>[\d.]+)\s+T4:\s+(?P<t4>[\d.]+)$')
 
         # Offset from master: 17 secs, 34645173 nsecs
         # Offset from master: -0 secs, 22 nsecs
-        p13 = re.compile(r'^Offset\s+from\s+master:\s+(?P<offset_from_master>[-\w ]+),\s+\d+\s+nsecs$')
+        p13 = regex_engine.compile(r'^Offset\s+from\s+master:\s+(?P<offset_from_master>[-\w ]+),\s+\d+\s+nsecs$')
 
         # Mean path delay : 0 secs, 2215 nsecs
         # Mean path delay   :  0 secs, 9732 nsecs
-        p14 = re.compile(r'^Mean\s+path\s+delay\s+:\s+(?P<mean_path_delay>[\w ]+),\s+\d+\s+nsecs$')
+        p14 = regex_engine.compile(r'^Mean\s+path\s+delay\s+:\s+(?P<mean_path_delay>[\w ]+),\s+\d+\s+nsecs$')
 
         # setTime():1854 stepTime():7989 adjustFreq():789 adjustFreqTime():437113
         # setTime():2  stepTime():1  adjustFreq():420942 adjustFreqTime():0
         # setTime():0  stepTime():0 adjustFreq():0
-        p15 = re.compile(r'^setTime\(\):(?P<set_time>\d+)\s+stepTime\(\):(?P<step_time>\d+)\s+adjustFreq\(\):(?P<adjust_freq>\d+)(?:\s+adjustFreqTime\(\):(?P<adjust_freq_time>\d+))?$')
+        p15 = regex_engine.compile(r'^setTime\(\):(?P<set_time>\d+)\s+stepTime\(\):(?P<step_time>\d+)\s+adjustFreq\(\):(?P<adjust_freq>\d+)(?:\s+adjustFreqTime\(\):(?P<adjust_freq_time>\d+))?$')
 
         # Last setTime: 1.000000000 flag:0 Last stepTime:262310484, Last adjustFreq:9999988
         # Last setTime: 273.000000000 flag:0  Last stepTime:105006084, Last adjustFreq:-19615
         # Last setTime: 0.000000000 flag:0  Last stepTime:0 Last adjustFreq:0
-        p16 = re.compile(r'^Last\s+setTime:\s+(?P<last_set_time>[-\d.]+)\s+flag:(?P<flag>\d+)\s+Last\s+stepTime:(?P<last_step_time>[-\d]+)(?:(,))?\s+Last\s+adjustFreq:(?P<last_adjust_freq>[-\d]+)$')
+        p16 = regex_engine.compile(r'^Last\s+setTime:\s+(?P<last_set_time>[-\d.]+)\s+flag:(?P<flag>\d+)\s+Last\s+stepTime:(?P<last_step_time>[-\d]+)(?:(,))?\s+Last\s+adjustFreq:(?P<last_adjust_freq>[-\d]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -326,7 +324,7 @@ class ShowPtpForeignMastersBrief(ShowPtpForeignMastersBriefSchema):
         # Gi0/0/0/19 IPv4 192.168.254.1 None 128 Q,GM
         # Gi0/0/0/16        Ethernet  8478.ac6c.0aa2            None     128    M,Q
         # Te0/0/2/1         Ethernet  8478.ac6c.0a91            None     128    M,Q,GM
-        p1 = re.compile(r'^(?P<interface_name>\S+)\s+(?P<transport>\w+)\s+(?P<address>\S+)\s+(?P<cfg_pri>[None]+)\s+(?P<priority1>\d+)\s+(?P<state>[A-Z,]+)$')
+        p1 = regex_engine.compile(r'^(?P<interface_name>\S+)\s+(?P<transport>\w+)\s+(?P<address>\S+)\s+(?P<cfg_pri>[None]+)\s+(?P<priority1>\d+)\s+(?P<state>[A-Z,]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -406,45 +404,45 @@ class ShowPtpForeignMastersInterface(ShowPtpForeignMastersInterfaceSchema):
             output = self.device.execute(self.cli_command.format(interface=interface))
         
         # Interface GigabitEthernet0/0/0/2 (PTP port number 2)    
-        p1 = re.compile(r'^Interface\s+(?P<interface>\S+)\s\(?PTP\s+port\s+number\s+(?P<port_number>\d+)\)$')
+        p1 = regex_engine.compile(r'^Interface\s+(?P<interface>\S+)\s\(?PTP\s+port\s+number\s+(?P<port_number>\d+)\)$')
         
         # IPv4, Address 192.168.254.1, Unicast
-        p2 = re.compile(r'^(?P<address_family>\S+),\s+Address\s+(?P<ip_address>[\d.]+),\s+Unicast$')
+        p2 = regex_engine.compile(r'^(?P<address_family>\S+),\s+Address\s+(?P<ip_address>[\d.]+),\s+Unicast$')
         
         # Configured priority: None (128)
-        p3 = re.compile(r'^Configured\s+priority:\s+(?P<priority>\S+\s+\S+)$')
+        p3 = regex_engine.compile(r'^Configured\s+priority:\s+(?P<priority>\S+\s+\S+)$')
         
         # Configured clock class: None
-        p4 = re.compile(r'^Configured\s+clock\s+class:\s+(?P<clock_class>\w+)$')
+        p4 = regex_engine.compile(r'^Configured\s+clock\s+class:\s+(?P<clock_class>\w+)$')
         
         # Configured delay asymmetry: None
-        p5 = re.compile(r'^Configured\s+delay\s+asymmetry:\s+(?P<delay_asymmetry>\w+)$')
+        p5 = regex_engine.compile(r'^Configured\s+delay\s+asymmetry:\s+(?P<delay_asymmetry>\w+)$')
         
         # Announce granted:   8 per-second,      300 seconds
         # Sync granted:       64 per-second,     300 seconds
         # Delay-resp granted: 64 per-second,     300 seconds
-        p6 = re.compile(r'^(?P<announce_message>\w+-?\w+\s+\w+):\s+(?P<rate_limit>\d+\s+\w+-?\w+),\s+(?P<duration>\d+\s+\w+)$')
+        p6 = regex_engine.compile(r'^(?P<announce_message>\w+-?\w+\s+\w+):\s+(?P<rate_limit>\d+\s+\w+-?\w+),\s+(?P<duration>\d+\s+\w+)$')
         
         # Qualified for 8 hours, 26 minutes, 9 seconds
-        p7 = re.compile(r'^Qualified\s+for\s(?P<qualified_period>\d+\s+\w+,\s+\d+\s+\w+,\s+\d+\s+\w+)$')
+        p7 = regex_engine.compile(r'^Qualified\s+for\s(?P<qualified_period>\d+\s+\w+,\s+\d+\s+\w+,\s+\d+\s+\w+)$')
        
         # Clock ID: b0aefffe04cc9b
-        p8 = re.compile(r'Clock\s+ID:\s+(?P<clock_id>\S+)')
+        p8 = regex_engine.compile(r'Clock\s+ID:\s+(?P<clock_id>\S+)')
         
         # Domain: 44, Priority1: 128, Priority2: 128, Class: 6
-        p9 = re.compile(r'Domain:\s+(?P<domain>\d+),\s+Priority1:\s+(?P<priority1>\d+),\s+Priority2:\s+(?P<priority2>\d+),\s+Class:\s+(?P<class>\d+)')
+        p9 = regex_engine.compile(r'Domain:\s+(?P<domain>\d+),\s+Priority1:\s+(?P<priority1>\d+),\s+Priority2:\s+(?P<priority2>\d+),\s+Class:\s+(?P<class>\d+)')
         
         #  Accuracy: 0x21, Offset scaled log variance: 0x4e5d
-        p10 = re.compile(r'Accuracy:\s+(?P<accuracy>\w+),\s+Offset\s+scaled\s+log\s+variance:\s+(?P<offset_scaled_log_variance>\S+)')
+        p10 = regex_engine.compile(r'Accuracy:\s+(?P<accuracy>\w+),\s+Offset\s+scaled\s+log\s+variance:\s+(?P<offset_scaled_log_variance>\S+)')
         
         # Steps-removed: 1, Time source: GPS, Timescale: PTP
-        p11 = re.compile(r'Steps-removed:\s+(?P<steps_removed>\d+),\s+Time\s+source:\s+(?P<time_source>\w+),\s+Timescale:\s+(?P<time_scale>\w+)')
+        p11 = regex_engine.compile(r'Steps-removed:\s+(?P<steps_removed>\d+),\s+Time\s+source:\s+(?P<time_source>\w+),\s+Timescale:\s+(?P<time_scale>\w+)')
         
         # Frequency-traceable, Time-traceable
-        p12 = re.compile(r'(?P<frequency>\w+-\w+),\s+(?P<time>\w+-\w+)')
+        p12 = regex_engine.compile(r'(?P<frequency>\w+-\w+),\s+(?P<time>\w+-\w+)')
         
         # Current UTC offset: 37 seconds (valid)
-        p13 = re.compile(r'Current\s+UTC\s+offset:\s+(?P<current_utc_offset>\d+\s+\w+\s+\(valid)')
+        p13 = regex_engine.compile(r'Current\s+UTC\s+offset:\s+(?P<current_utc_offset>\d+\s+\w+\s+\(valid)')
         
         ret_dict = {}
 
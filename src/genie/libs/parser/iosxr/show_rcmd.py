@@ -1,10 +1,12 @@
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
                                          Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================================
 #  schema for show rcmd node
@@ -44,7 +46,7 @@ class ShowRcmdNode(ShowRcmdNodeSchema):
         rcmd_dict = {}
 
         #1     | 0/RSP0/CPU0    | rp | Enbl/Yes| Jul 14 13:29:48.906 | No/6/0/0/1
-        p0 = re.compile(r'^\s*(?P<node_id>\d+).*?\|\s*(?P<node_name>[a-zA-Z0-9/]+)\s*\|\s*(?P<node_type>\w+)\s*\|\s*(?P<rcmd_state>\w+)/(?P<rcmd_oper_state>\w+)\s*\|\s*(?P<last_upd_time>[\w\s\*:.]+)\s+\|\s*(?P<node_status>[\w/]+)')
+        p0 = regex_engine.compile(r'^\s*(?P<node_id>\d+).*?\|\s*(?P<node_name>[a-zA-Z0-9/]+)\s*\|\s*(?P<node_type>\w+)\s*\|\s*(?P<rcmd_state>\w+)/(?P<rcmd_oper_state>\w+)\s*\|\s*(?P<last_upd_time>[\w\s\*:.]+)\s+\|\s*(?P<node_status>[\w/]+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -119,19 +121,19 @@ class ShowRcmdMemory(ShowRcmdMemorySchema):
         rcmd_dict = {}
 
         #rcmd_server                 |          1 |          0 |          1 |          0
-        p0 = re.compile(r'^\s*(?P<struct_name>\w+).*?\|\s*(?P<curr_cnt>\d+).*?\|\s*(?P<alloc_fail_cnt>\d+).*?\|\s*(?P<alloc_cnt>\d+).*?\|\s*(?P<free_cnt>\d+)')
+        p0 = regex_engine.compile(r'^\s*(?P<struct_name>\w+).*?\|\s*(?P<curr_cnt>\d+).*?\|\s*(?P<alloc_fail_cnt>\d+).*?\|\s*(?P<alloc_cnt>\d+).*?\|\s*(?P<free_cnt>\d+)')
 
         #RCMD EDM memory manager information
-        p1 = re.compile(r'^RCMD EDM.*')
+        p1 = regex_engine.compile(r'^RCMD EDM.*')
         
         #        64 |         12 |         11 |          1
-        p2 = re.compile(r'^\s*(?P<size>\w+).*?\|\s*(?P<total>\d+).*?\|\s*(?P<success>\d+).*?\|\s*(?P<failure>\d+).*')
+        p2 = regex_engine.compile(r'^\s*(?P<size>\w+).*?\|\s*(?P<total>\d+).*?\|\s*(?P<success>\d+).*?\|\s*(?P<failure>\d+).*')
 
         #RCMD String memory manager information
-        p3 = re.compile(r'^RCMD String.*')
+        p3 = regex_engine.compile(r'^RCMD String.*')
 
         #        32 |        936 |        864 |       72
-        p4 = re.compile(r'^\s*(?P<str_len>\w+).*?\|\s*(?P<total>\d+).*?\|\s*(?P<success>\d+).*?\|\s*(?P<failure>\d+).*')
+        p4 = regex_engine.compile(r'^\s*(?P<str_len>\w+).*?\|\s*(?P<total>\d+).*?\|\s*(?P<success>\d+).*?\|\s*(?P<failure>\d+).*')
 
         for line in output.splitlines():
             line = line.strip()
@@ -250,67 +252,67 @@ class ShowRcmdServer(ShowRcmdServerSchema):
         rcmd_dict = {}
 
         # Routing Convergence Monitoring & Diagnostics (RCMD)
-        p0 = re.compile(r'^.*RCMD.*')
+        p0 = regex_engine.compile(r'^.*RCMD.*')
 
         # HostName                 : hulk-asr9
-        p1 = re.compile(r'^\s*HostName *: *(?P<host_name>\S+) *')
+        p1 = regex_engine.compile(r'^\s*HostName *: *(?P<host_name>\S+) *')
 
         # Status                   : Enable
-        p2 = re.compile(r'^\s*Status *: *(?P<status>\S+) *')
+        p2 = regex_engine.compile(r'^\s*Status *: *(?P<status>\S+) *')
 
         # Max Events Stored        : 500        Event Buffer Size        : 500
-        p3 = re.compile(r'^\s*Max Events Stored *: *(?P<max_events>\d+) *Event Buffer Size *: *(?P<event_buffer>\d+) *')
+        p3 = regex_engine.compile(r'^\s*Max Events Stored *: *(?P<max_events>\d+) *Event Buffer Size *: *(?P<event_buffer>\d+) *')
 
         # Monitoring Interval(mins): 5          Next Processing due(secs): 8
-        p4 = re.compile(r'^\s*Monitoring Interval.*?: *(?P<monitoring_interval>\d+) *Next Processing due.*: *(?P<next_processing_due>\d+) *')
+        p4 = regex_engine.compile(r'^\s*Monitoring Interval.*?: *(?P<monitoring_interval>\d+) *Next Processing due.*: *(?P<next_processing_due>\d+) *')
 
         # Last Processing Started  : Jul 26 09:14:58.511
-        p5 = re.compile(r'^\s*Last Processing Started *: *(?P<last_processing_started>[\w\s:.]+) *')
+        p5 = regex_engine.compile(r'^\s*Last Processing Started *: *(?P<last_processing_started>[\w\s:.]+) *')
 
         # Duration(ms)             : 367        Last Processing Status   : Success
-        p6 = re.compile(r'^\s*Duration.*?: *(?P<duration>\d+) *Last Processing Status.*: *(?P<last_processing_status>\w+) *')
+        p6 = regex_engine.compile(r'^\s*Duration.*?: *(?P<duration>\d+) *Last Processing Status.*: *(?P<last_processing_status>\w+) *')
 
         # Processing count         : 3474       SPF Processed count      : 0
-        p7 = re.compile(r'^\s*Processing count.*?: *(?P<processing_cnt>\d+) *SPF Processed count.*: *(?P<spf_processed_cnt>\d+) *')
+        p7 = regex_engine.compile(r'^\s*Processing count.*?: *(?P<processing_cnt>\d+) *SPF Processed count.*: *(?P<spf_processed_cnt>\d+) *')
 
         # No. of RP Nodes          : 2          No. of LC Nodes          : 2
-        p8 = re.compile(r'^\s*No. of RP Nodes.*?: *(?P<rp_nodes_cnt>\d+) *No. of LC Nodes.*: *(?P<lc_nodes_cnt>\d+) *')
+        p8 = regex_engine.compile(r'^\s*No. of RP Nodes.*?: *(?P<rp_nodes_cnt>\d+) *No. of LC Nodes.*: *(?P<lc_nodes_cnt>\d+) *')
 
         # Diag Mode Nodes          : 0          Disabled Nodes           : 0
-        p9 = re.compile(r'^\s*Diag Mode Nodes.*?: *(?P<diag_mode_nodes_cnt>\d+) *Disabled Nodes.*: *(?P<disabled_nodes_cnt>\d+) *')
+        p9 = regex_engine.compile(r'^\s*Diag Mode Nodes.*?: *(?P<diag_mode_nodes_cnt>\d+) *Disabled Nodes.*: *(?P<disabled_nodes_cnt>\d+) *')
 
         # InActive Nodes           : 0
-        p10 = re.compile(r'^\s*InActive Nodes.*?: *(?P<inactive_nodes_cnt>\d+) *')
+        p10 = regex_engine.compile(r'^\s*InActive Nodes.*?: *(?P<inactive_nodes_cnt>\d+) *')
 
         # Archival Path
-        p11 = re.compile(r'^.*Archival Path.*')
+        p11 = regex_engine.compile(r'^.*Archival Path.*')
 
         #   Reports                : Not-Configured
-        p12 = re.compile(r'^\s*Reports.*?: *(?P<reports>.+) *')
+        p12 = regex_engine.compile(r'^\s*Reports.*?: *(?P<reports>.+) *')
 
         #   Diagnostics            : Not-Configured
-        p13 = re.compile(r'^\s*Diagnostics.*?: *(?P<diagnostics>.+) *')
+        p13 = regex_engine.compile(r'^\s*Diagnostics.*?: *(?P<diagnostics>.+) *')
 
         # Archival count           : 0           Last Archival Status    : 'No error'
-        p14 = re.compile(r'^\s*Archival count.*?: *(?P<arch_cnt>\d+) *Last Archival Status.*: *(?P<last_arch_status>.+) *')
+        p14 = regex_engine.compile(r'^\s*Archival count.*?: *(?P<arch_cnt>\d+) *Last Archival Status.*: *(?P<last_arch_status>.+) *')
 
         # Last Archival Error      : 'No error'
-        p15 = re.compile(r'^\s*Last Archival Error\s+: *(?P<last_arch_err>.+) *')
+        p15 = regex_engine.compile(r'^\s*Last Archival Error\s+: *(?P<last_arch_err>.+) *')
 
         # Last Archival Error Time : '*'
-        p16 = re.compile(r'^\s*Last Archival Error Time\s*: *(?P<last_arch_err_time>.+) *')
+        p16 = regex_engine.compile(r'^\s*Last Archival Error Time\s*: *(?P<last_arch_err_time>.+) *')
 
         # Protocol Configuration   :
-        p17 = re.compile(r'^.*Protocol Configuration.*')
+        p17 = regex_engine.compile(r'^.*Protocol Configuration.*')
 
         #   OSPF:    Priority     Threshold    Disabled
-        p18 = re.compile(r'^\s*OSPF\s*:')
+        p18 = regex_engine.compile(r'^\s*OSPF\s*:')
 
         #             Critical          0        No
-        p19 = re.compile(r'^\s*(?P<priority>\w+) *(?P<threshold>\d+) *(?P<disabled>\w+)')
+        p19 = regex_engine.compile(r'^\s*(?P<priority>\w+) *(?P<threshold>\d+) *(?P<disabled>\w+)')
 
         #   ISIS:    Priority     Threshold    Disabled
-        p20 = re.compile(r'^\s*ISIS\s*:')
+        p20 = regex_engine.compile(r'^\s*ISIS\s*:')
 
         for line in output.splitlines():
             line = line.strip()
@@ -525,10 +527,10 @@ class ShowRcmdIsisEventSpf(ShowRcmdIsisEventSpfSchema):
         rcmd_dict = {}
 
         # Reporting SPF Events for ISIS Instance : isis1
-        p0 = re.compile(r'^\s*Reporting SPF Events for ISIS Instance.*: *(?P<isis_inst_id>.+) *$')
+        p0 = regex_engine.compile(r'^\s*Reporting SPF Events for ISIS Instance.*: *(?P<isis_inst_id>.+) *$')
 
         #  2        Aug  9 05:47:43.340     0     FULL    9              5 / - / -                     0 / - / -                     0 / - / -                     0 / - / -
-        p1 = re.compile(r'^\s*(?P<spf>[~*#^\s]* *\d+) *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *(?P<duration_time>\d+) *(?P<type>\w+) *(?P<lsp>\d+) *(?P<total_prefixes_affected_critical>[\d-]+) */ *(?P<time_taken_ip_critical>[\d-]+) */ *(?P<time_taken_mpls_critical>[\d-]+) *(?P<total_prefixes_affected_high>[\d-]+) */ *(?P<time_taken_ip_high>[\d-]+) */ *(?P<time_taken_mpls_high>[\d-]+) *(?P<total_prefixes_affected_medium>[\d-]+) */ *(?P<time_taken_ip_medium>[\d-]+) */ *(?P<time_taken_mpls_medium>[\d-]+) *(?P<total_prefixes_affected_low>[\d-]+) */ *(?P<time_taken_ip_low>[\d-]+) */ *(?P<time_taken_mpls_low>[\d-]+) *$')
+        p1 = regex_engine.compile(r'^\s*(?P<spf>[~*#^\s]* *\d+) *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *(?P<duration_time>\d+) *(?P<type>\w+) *(?P<lsp>\d+) *(?P<total_prefixes_affected_critical>[\d-]+) */ *(?P<time_taken_ip_critical>[\d-]+) */ *(?P<time_taken_mpls_critical>[\d-]+) *(?P<total_prefixes_affected_high>[\d-]+) */ *(?P<time_taken_ip_high>[\d-]+) */ *(?P<time_taken_mpls_high>[\d-]+) *(?P<total_prefixes_affected_medium>[\d-]+) */ *(?P<time_taken_ip_medium>[\d-]+) */ *(?P<time_taken_mpls_medium>[\d-]+) *(?P<total_prefixes_affected_low>[\d-]+) */ *(?P<time_taken_ip_low>[\d-]+) */ *(?P<time_taken_mpls_low>[\d-]+) *$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -631,10 +633,10 @@ class ShowRcmdIsisEventPrefix(ShowRcmdIsisEventPrefixSchema):
         rcmd_dict = {}
 
         # ISIS process : isis1
-        p0 = re.compile(r'^\s*ISIS process.*: *(?P<isis_inst_id>.+) *')
+        p0 = regex_engine.compile(r'^\s*ISIS process.*: *(?P<isis_inst_id>.+) *')
 
         #        1   4.4.4.4/32           Aug 11 07:53:16.105   Medium    Primary      Add         L1          40
-        p1 = re.compile(r'^\s*(?P<event_id>[~*#^\s]* *\d+) *(?P<prefix>[\d\.\/]+) *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *(?P<priority>\w+) *(?P<path_type>\w+) *(?P<change_type>\w+) *(?P<route>\w+) *(?P<cost>\d+) *$')
+        p1 = regex_engine.compile(r'^\s*(?P<event_id>[~*#^\s]* *\d+) *(?P<prefix>[\d\.\/]+) *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *(?P<priority>\w+) *(?P<path_type>\w+) *(?P<change_type>\w+) *(?P<route>\w+) *(?P<cost>\d+) *$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -712,10 +714,10 @@ class ShowRcmdIsisEventStatisticsPrefix(ShowRcmdIsisEventStatisticsPrefixSchema)
         rcmd_dict = {}
 
         # ISIS process : isis1
-        p0 = re.compile(r'^\s*ISIS process.*: *(?P<isis_inst_id>.+) *')
+        p0 = regex_engine.compile(r'^\s*ISIS process.*: *(?P<isis_inst_id>.+) *')
 
         #  4.4.4.4/32          Aug 11 07:53:17.007       1/2/0          0/0/2/1          L1          30  Modify      Low
-        p1 = re.compile(r'^\s*(?P<prefix>[\d\.\/]+) *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *(?P<events_added>\d+)/(?P<events_modified>\d+)/(?P<events_deleted>\d+) *(?P<events_processed_critical>\d+)/(?P<events_processed_high>\d+)/(?P<events_processed_medium>\d+)/(?P<events_processed_low>\d+) *(?P<route>\S+) *(?P<cost>\d+) *(?P<change_type>\w+) *(?P<priority>\w+)')
+        p1 = regex_engine.compile(r'^\s*(?P<prefix>[\d\.\/]+) *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *(?P<events_added>\d+)/(?P<events_modified>\d+)/(?P<events_deleted>\d+) *(?P<events_processed_critical>\d+)/(?P<events_processed_high>\d+)/(?P<events_processed_medium>\d+)/(?P<events_processed_low>\d+) *(?P<route>\S+) *(?P<cost>\d+) *(?P<change_type>\w+) *(?P<priority>\w+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -798,10 +800,10 @@ class ShowRcmdIsisEventIpfrr(ShowRcmdIsisEventIpfrrSchema):
         rcmd_dict = {}
 
         # Reporting IP-FRR Events for ISIS Instance: isis1
-        p0 = re.compile(r'^\s*Reporting IP-FRR Events for ISIS Instance.*: *(?P<isis_inst_id>.+) *')
+        p0 = regex_engine.compile(r'^\s*Reporting IP-FRR Events for ISIS Instance.*: *(?P<isis_inst_id>.+) *')
 
         #        1  Aug 11 07:52:07.820          2       0       5 ( 0%)               -               1 ( 0%)               -               4 ( 0%)
-        p1 = re.compile(r'^\s*(?P<event_id>\d+) *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *(?P<spf>\d+) *(?P<nodes>\d+) *(?P<total>\d+|-) *(\( *(?P<total_percent>\S+)%\))* *(?P<critical>\d+|-) *(\( *(?P<critical_percent>\S+)%\))* *(?P<high>\d+|-) *(\( *(?P<high_percent>\S+)%\))* *(?P<medium>\d+|-) *(\( *(?P<medium_percent>\S+)%\))* *(?P<low>\d+|-) *(\( *(?P<low_percent>\S+)%\))*')
+        p1 = regex_engine.compile(r'^\s*(?P<event_id>\d+) *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *(?P<spf>\d+) *(?P<nodes>\d+) *(?P<total>\d+|-) *(\( *(?P<total_percent>\S+)%\))* *(?P<critical>\d+|-) *(\( *(?P<critical_percent>\S+)%\))* *(?P<high>\d+|-) *(\( *(?P<high_percent>\S+)%\))* *(?P<medium>\d+|-) *(\( *(?P<medium_percent>\S+)%\))* *(?P<low>\d+|-) *(\( *(?P<low_percent>\S+)%\))*')
 
         for line in output.splitlines():
             line = line.strip()
@@ -863,7 +865,7 @@ class ShowRcmdLdpEventRemotelfa(ShowRcmdLdpEventRemotelfaSchema):
         rcmd_dict = {}
 
         #        2   Aug 16 04:43:50.791        2 / 0 / 2                 3            3            0          0%
-        p1 = re.compile(r'^\s*(?P<event_id>[*#\s]* *\d+) *(?P<snapshot_time>\w+ *\d+ *[\d:.]+) *(?P<total_nodes>\d+) *\/ *(?P<converged_nodes>\d+) *\/ *(?P<down_nodes>\d+) *(?P<prefixes>\d+) *(?P<paths>\d+) *(?P<labels>\d+) *(?P<coverage>\d+)%')
+        p1 = regex_engine.compile(r'^\s*(?P<event_id>[*#\s]* *\d+) *(?P<snapshot_time>\w+ *\d+ *[\d:.]+) *(?P<total_nodes>\d+) *\/ *(?P<converged_nodes>\d+) *\/ *(?P<down_nodes>\d+) *(?P<prefixes>\d+) *(?P<paths>\d+) *(?P<labels>\d+) *(?P<coverage>\d+)%')
 
         for line in output.splitlines():
             line = line.strip()
@@ -925,7 +927,7 @@ class ShowRcmdLdpEventSession(ShowRcmdLdpEventSessionSchema):
         rcmd_dict = {}
 
         #     2      | Aug 16 04:42:32.269 |    Adjacency     |     5.5.5.5      |      HundredGigE0/0/0/1      |     10.5.1.2      |   Up
-        p1 = re.compile(r'^\s*(?P<event_id>\d+) *?\| *(?P<session_time>\w+ *\d+ *[\d:.]+) *?\| *(?P<type>\S+) *?\| *(?P<lsr_id>\S+) *?\| *(?P<interface>\S+) *?\| *(?P<labels>\S+) *?\| *(?P<state>\S+)')
+        p1 = regex_engine.compile(r'^\s*(?P<event_id>\d+) *?\| *(?P<session_time>\w+ *\d+ *[\d:.]+) *?\| *(?P<type>\S+) *?\| *(?P<lsr_id>\S+) *?\| *(?P<interface>\S+) *?\| *(?P<labels>\S+) *?\| *(?P<state>\S+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1051,76 +1053,76 @@ class ShowRcmdIsisEventPrefixLastDetail(ShowRcmdIsisEventPrefixLastDetailSchema)
         rcmd_dict = {}
 
         #ISIS process: isis1
-        p0 = re.compile(r'^ *ISIS process: *(?P<isis_id>\S+) *$')
+        p0 = regex_engine.compile(r'^ *ISIS process: *(?P<isis_id>\S+) *$')
 
         #Event: 6
-        p1 = re.compile(r'^ *Event: *(?P<event_id>\d+) *$')
+        p1 = regex_engine.compile(r'^ *Event: *(?P<event_id>\d+) *$')
 
         #    Prefix: 5.5.5.5/32            Metric: 20          Priority: Low
-        p2 = re.compile(r'^ *Prefix: *(?P<prefix_name>\S+) *Metric: *(?P<metric>\d+) *Priority: *(?P<priority>\w+) *$')
+        p2 = regex_engine.compile(r'^ *Prefix: *(?P<prefix_name>\S+) *Metric: *(?P<metric>\d+) *Priority: *(?P<priority>\w+) *$')
 
         #    Route Type: L1                Path-Type: Backup   Chg-Type: Modify    IP-FRR Event ID: 7
         #    Route Type: L1                Path-Type: Primary  Chg-Type: Modify    SPF Run: 8
-        p3 = re.compile(r'^ *Route Type: *(?P<route_type>\S+) *Path-Type: *(?P<path_type>\w+) *Chg-Type: *(?P<change_type>\w+) *(IP-FRR Event ID: *(?P<ip_frr_event_id>\d+))*(SPF Run: *(?P<spf_run_id>\d+))* *$')
+        p3 = regex_engine.compile(r'^ *Route Type: *(?P<route_type>\S+) *Path-Type: *(?P<path_type>\w+) *Chg-Type: *(?P<change_type>\w+) *(IP-FRR Event ID: *(?P<ip_frr_event_id>\d+))*(SPF Run: *(?P<spf_run_id>\d+))* *$')
 
         #    Paths: HundredGigE0/0/0/1             NextHop: 10.5.1.2           Metric: 10     Chg-Type: NoChange
-        p4 = re.compile(r'^ *Paths: *(?P<interface>\S+) *NextHop: *(?P<next_hop>\S+) *Metric: *(?P<metric>\d+) *Chg-Type: *(?P<change_type>\w+) *$')
+        p4 = regex_engine.compile(r'^ *Paths: *(?P<interface>\S+) *NextHop: *(?P<next_hop>\S+) *Metric: *(?P<metric>\d+) *Chg-Type: *(?P<change_type>\w+) *$')
 
         #           ^ HundredGigE0/0/0/0           NextHop: 10.1.1.2           Metric: 10     Chg-Type: Add         Remote-Node: 3.3.3.3
         #           * HundredGigE0/0/0/0           NextHop: 10.1.1.2           Metric: 10     Chg-Type: Add
         #           HundredGigE0/0/0/0             NextHop: 10.1.1.2           Metric: 10     Chg-Type: Delete
-        p5 = re.compile(r'^ *((?P<ip_frr_path>[*^]))* *(?P<interface>\S+) *NextHop: *(?P<next_hop>\S+) *Metric: *(?P<metric>\d+) *Chg-Type: *(?P<change_type>\w+) *(Remote-Node: *(?P<remote_node>\S+))* *$')
+        p5 = regex_engine.compile(r'^ *((?P<ip_frr_path>[*^]))* *(?P<interface>\S+) *NextHop: *(?P<next_hop>\S+) *Metric: *(?P<metric>\d+) *Chg-Type: *(?P<change_type>\w+) *(Remote-Node: *(?P<remote_node>\S+))* *$')
 
         #    Trigger Time: Sep 14 09:00:36.587
-        p6 = re.compile(r'^ *Trigger Time: *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *$')
+        p6 = regex_engine.compile(r'^ *Trigger Time: *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *$')
 
         #    Summary:
-        p7 = re.compile(r'^ *Summary: *$')
+        p7 = regex_engine.compile(r'^ *Summary: *$')
 
         #        IP Route Program Time:        Min: 65(0/0/CPU0)             Max: 65(0/0/CPU0)
-        p8 = re.compile(r'^ *IP Route Program Time: *Min: *(?P<min_time>\d+)\((?P<min_node_id>\S+)\) *Max: *(?P<max_time>\d+)\((?P<max_node_id>\S+)\) *$')
+        p8 = regex_engine.compile(r'^ *IP Route Program Time: *Min: *(?P<min_time>\d+)\((?P<min_node_id>\S+)\) *Max: *(?P<max_time>\d+)\((?P<max_node_id>\S+)\) *$')
 
         #        MPLS Label Program Time:      Min: 70(0/0/CPU0)             Max: 70(0/0/CPU0)
-        p9 = re.compile(r'^ *MPLS Label Program Time: *Min: *(?P<min_time>\d+)\((?P<min_node_id>\S+)\) *Max: *(?P<max_time>\d+)\((?P<max_node_id>\S+)\) *$')
+        p9 = regex_engine.compile(r'^ *MPLS Label Program Time: *Min: *(?P<min_time>\d+)\((?P<min_node_id>\S+)\) *Max: *(?P<max_time>\d+)\((?P<max_node_id>\S+)\) *$')
 
         #    Timeline:
-        p10 = re.compile(r'^ *Timeline: *$')
+        p10 = regex_engine.compile(r'^ *Timeline: *$')
 
         #        Details:
-        p11 = re.compile(r'^ *Details:.*$')
+        p11 = regex_engine.compile(r'^ *Details:.*$')
 
         #            ISIS:                0
-        p12 = re.compile(r'^ *ISIS: *(?P<isis>\d+) *$')
+        p12 = regex_engine.compile(r'^ *ISIS: *(?P<isis>\d+) *$')
 
         #            RIBv4-Enter:         2
-        p13 = re.compile(r'^ *RIBv4-Enter: *(?P<ribv4_enter>\d+) *$')
+        p13 = regex_engine.compile(r'^ *RIBv4-Enter: *(?P<ribv4_enter>\d+) *$')
 
         #            RIBv4-Exit:          5
-        p14 = re.compile(r'^ *RIBv4-Exit: *(?P<ribv4_exit>\d+) *$')
+        p14 = regex_engine.compile(r'^ *RIBv4-Exit: *(?P<ribv4_exit>\d+) *$')
 
         #            RIBv4-Redist:        5
-        p15 = re.compile(r'^ *RIBv4-Redist: *(?P<ribv4_redist>\d+) *$')
+        p15 = regex_engine.compile(r'^ *RIBv4-Redist: *(?P<ribv4_redist>\d+) *$')
 
         #            LDP Enter:           5
-        p16 = re.compile(r'^ *LDP Enter: *(?P<ldp_enter>\d+) *$')
+        p16 = regex_engine.compile(r'^ *LDP Enter: *(?P<ldp_enter>\d+) *$')
 
         #            LDP Exit:           11
-        p17 = re.compile(r'^ *LDP Exit: *(?P<ldp_exit>\d+) *$')
+        p17 = regex_engine.compile(r'^ *LDP Exit: *(?P<ldp_exit>\d+) *$')
 
         #            LSD Enter:          12
-        p18 = re.compile(r'^ *LSD Enter: *(?P<lsd_enter>\d+) *$')
+        p18 = regex_engine.compile(r'^ *LSD Enter: *(?P<lsd_enter>\d+) *$')
 
         #            LSD Exit:           14
-        p19 = re.compile(r'^ *LSD Exit: *(?P<lsd_exit>\d+) *$')
+        p19 = regex_engine.compile(r'^ *LSD Exit: *(?P<lsd_exit>\d+) *$')
 
         #            LC Details(IP Path):
-        p20 = re.compile(r'^ *LC Details\(IP Path\):.*$')
+        p20 = regex_engine.compile(r'^ *LC Details\(IP Path\):.*$')
 
         #              F  0/0/CPU0       65
-        p21 = re.compile(r'^ *((?P<path>\w) +)?(?P<node_id>\S+) *(?P<time>\d+) *$')
+        p21 = regex_engine.compile(r'^ *((?P<path>\w) +)?(?P<node_id>\S+) *(?P<time>\d+) *$')
 
         #            LC Details(MPLS Path):
-        p22 = re.compile(r'^ *LC Details\(MPLS Path\):.*$')
+        p22 = regex_engine.compile(r'^ *LC Details\(MPLS Path\):.*$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1508,111 +1510,111 @@ class ShowRcmdIsisEventSpfLastDetail(ShowRcmdIsisEventSpfLastDetailSchema):
         rcmd_dict = {}
 
         #ISIS process: isis1
-        p0 = re.compile(r'^ *ISIS process: *(?P<isis_id>\S+) *$')
+        p0 = regex_engine.compile(r'^ *ISIS process: *(?P<isis_id>\S+) *$')
 
         #SPF Info:
-        p1 = re.compile(r'^ *SPF Info: *$')
+        p1 = regex_engine.compile(r'^ *SPF Info: *$')
 
         #   Run: 459       Topology: 0              Level: L1                Type: Full
         #   ^Run: 459       Topology: 0              Level: L1                Type: Full
-        p2 = re.compile(r'^ *((?P<run_event_status>[#^~*]))* *Run: *(?P<run_event_id>\d+) *Topology: *(?P<topology>\d+) *Level: *(?P<level>\S+) *Type: *(?P<type>\S+) *$')
+        p2 = regex_engine.compile(r'^ *((?P<run_event_status>[#^~*]))* *Run: *(?P<run_event_id>\d+) *Topology: *(?P<topology>\d+) *Level: *(?P<level>\S+) *Type: *(?P<type>\S+) *$')
 
         #    Trigger: Sep 19 18:11:17.193            Trigger:  lt lo lp
-        p3 = re.compile(r'^ *Trigger: *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *Trigger: *(?P<trigger_values>[\w ]*) *$')
+        p3 = regex_engine.compile(r'^ *Trigger: *(?P<trigger_time>\w+ *\d+ *[\d:.]+) *Trigger: *(?P<trigger_values>[\w ]*) *$')
 
         #                   Wait: 3981               Start: 3982              Duration: 0
-        p4 = re.compile(r'^ *Wait: *(?P<wait>\d+) *Start: *(?P<start>\d+) *Duration: *(?P<duration>\d+) *$')
+        p4 = regex_engine.compile(r'^ *Wait: *(?P<wait>\d+) *Start: *(?P<start>\d+) *Duration: *(?P<duration>\d+) *$')
 
         #    Trigger LSP:   2037.0685.b002.00-00  Seq: b  Change-type: Modify  Time: Sep 19 18:11:17.193
-        p5 = re.compile(r'^ *Trigger LSP: *(?P<trigger_lsp>\S+) *Seq: *(?P<seq>\w+) *Change-type: *(?P<change_type>\S+) *Time: *(?P<trigger_lsp_time>\w+ *\d+ *[\d:.]+) *$')
+        p5 = regex_engine.compile(r'^ *Trigger LSP: *(?P<trigger_lsp>\S+) *Seq: *(?P<seq>\w+) *Change-type: *(?P<change_type>\S+) *Time: *(?P<trigger_lsp_time>\w+ *\d+ *[\d:.]+) *$')
 
         #    Node Stats:    Added: 0                 Deleted: 0               Modified: 0
-        p6 = re.compile(r'^ *Node Stats: *Added: *(?P<added>\d+) *Deleted: *(?P<deleted>\d+) *Modified: *(?P<modified>\d+) *$')
+        p6 = regex_engine.compile(r'^ *Node Stats: *Added: *(?P<added>\d+) *Deleted: *(?P<deleted>\d+) *Modified: *(?P<modified>\d+) *$')
 
         #                   Reachable: 2             Unreachable: 0           Touched: 2
-        p7 = re.compile(r'^ *Reachable: *(?P<reachable>\d+) *Unreachable: *(?P<unreachable>\d+) *Touched: *(?P<touched>\d+) *$')
+        p7 = regex_engine.compile(r'^ *Reachable: *(?P<reachable>\d+) *Unreachable: *(?P<unreachable>\d+) *Touched: *(?P<touched>\d+) *$')
 
         #    Summary:
-        p8 = re.compile(r'^ *Summary: *$')
+        p8 = regex_engine.compile(r'^ *Summary: *$')
 
         #        Priority: Critical
-        p9 = re.compile(r'.*Priority: *Critical *$')
+        p9 = regex_engine.compile(r'.*Priority: *Critical *$')
 
         #            Route Count:                  Added: 0            Deleted: 0          Modified: 1
-        p10 = re.compile(r'^ *Route Count: *Added: *(?P<added>\d+) *Deleted: *(?P<deleted>\d+) *Modified: *(?P<modified>\d+) *$')
+        p10 = regex_engine.compile(r'^ *Route Count: *Added: *(?P<added>\d+) *Deleted: *(?P<deleted>\d+) *Modified: *(?P<modified>\d+) *$')
 
         #            FRR Coverage:                 Total: 2            Full: 0             Partial: 0          Total:  0%
-        p11 = re.compile(r'^ *FRR Coverage: *Total: *(?P<total>\d+) *Full: *(?P<full>\d+) *Partial: *(?P<partial>\d+) *Total: *(?P<total_percent>[\d.]*)% *$')
+        p11 = regex_engine.compile(r'^ *FRR Coverage: *Total: *(?P<total>\d+) *Full: *(?P<full>\d+) *Partial: *(?P<partial>\d+) *Total: *(?P<total_percent>[\d.]*)% *$')
 
         #            IP Route Program Time:        Min: 3987(0/0/CPU0)           Max: 3987(0/0/CPU0)
-        p12 = re.compile(r'^ *IP Route Program Time: *Min: *(?P<min_time>\d+)\((?P<min_node_id>\S+)\) *Max: *(?P<max_time>\d+)\((?P<max_node_id>\S+)\) *$')
+        p12 = regex_engine.compile(r'^ *IP Route Program Time: *Min: *(?P<min_time>\d+)\((?P<min_node_id>\S+)\) *Max: *(?P<max_time>\d+)\((?P<max_node_id>\S+)\) *$')
 
         #            MPLS Label Program Time:      Min: 403(0/0/CPU0)            Max: 403(0/0/CPU0)
-        p13 = re.compile(r'^ *MPLS Label Program Time: *Min: *(?P<min_time>\d+)\((?P<min_node_id>\S+)\) *Max: *(?P<max_time>\d+)\((?P<max_node_id>\S+)\) *$')
+        p13 = regex_engine.compile(r'^ *MPLS Label Program Time: *Min: *(?P<min_time>\d+)\((?P<min_node_id>\S+)\) *Max: *(?P<max_time>\d+)\((?P<max_node_id>\S+)\) *$')
 
         #        Priority: High
-        p14 = re.compile(r'.*Priority: *High *$')
+        p14 = regex_engine.compile(r'.*Priority: *High *$')
 
         #        Priority: Medium
-        p15 = re.compile(r'.*Priority: *Medium *$')
+        p15 = regex_engine.compile(r'.*Priority: *Medium *$')
 
         #        Priority: Low
-        p16 = re.compile(r'.*Priority: *Low *$')
+        p16 = regex_engine.compile(r'.*Priority: *Low *$')
 
         #        Details:                     Start               End          Duration
-        p17 = re.compile(r'^ *Details: *Start *End *Duration *$')
+        p17 = regex_engine.compile(r'^ *Details: *Start *End *Duration *$')
 
         #              ISIS:                   3982              3982                 0
-        p18 = re.compile(r'^ *ISIS: *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
+        p18 = regex_engine.compile(r'^ *ISIS: *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
 
         #              RIBv4-Enter             3982              3982                 0
-        p19 = re.compile(r'^ *RIBv4-Enter *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
+        p19 = regex_engine.compile(r'^ *RIBv4-Enter *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
 
         #              RIBv4-Exit              3986              3986                 0
-        p20 = re.compile(r'^ *RIBv4-Exit *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
+        p20 = regex_engine.compile(r'^ *RIBv4-Exit *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
 
         #              RIBv4-Redist              3986              3986                 0
-        p21 = re.compile(r'^ *RIBv4-Redist *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
+        p21 = regex_engine.compile(r'^ *RIBv4-Redist *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
 
         #              LDP Enter              3986              3986                 0
-        p22 = re.compile(r'^ *LDP Enter *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
+        p22 = regex_engine.compile(r'^ *LDP Enter *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
 
         #              LDP Exit              3986              3986                 0
-        p23 = re.compile(r'^ *LDP Exit *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
+        p23 = regex_engine.compile(r'^ *LDP Exit *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
 
         #              LSD Enter              3986              3986                 0
-        p24 = re.compile(r'^ *LSD Enter *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
+        p24 = regex_engine.compile(r'^ *LSD Enter *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
 
         #              LSD Exit              3986              3986                 0
-        p25 = re.compile(r'^ *LSD Exit *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
+        p25 = regex_engine.compile(r'^ *LSD Exit *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
 
         #            LC Details(IP Path):
-        p26 = re.compile(r'^ *LC Details\(IP Path\):.*$')
+        p26 = regex_engine.compile(r'^ *LC Details\(IP Path\):.*$')
 
         #                F 0/0/CPU0            3987              3987                 0
-        p27 = re.compile(r'^ *((?P<path>\w) +)?(?P<node_id>\S+) *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
+        p27 = regex_engine.compile(r'^ *((?P<path>\w) +)?(?P<node_id>\S+) *(?P<start>\d+) *(?P<end>\d+) *(?P<duration>\d+) *$')
 
         #            LC Details(MPLS Path):
-        p28 = re.compile(r'^ *LC Details\(MPLS Path\):.*$')
+        p28 = regex_engine.compile(r'^ *LC Details\(MPLS Path\):.*$')
 
         #        Leaf Networks Added:
-        p29 = re.compile(r'^ *Leaf Networks Added: *$')
+        p29 = regex_engine.compile(r'^ *Leaf Networks Added: *$')
 
         #            3.3.3.3/32                  10.3.1.0/24
         #            4.4.4.4/32
-        p30 = re.compile(r'^ *(?P<interface_ip>[\d./]+) *((?P<router_id>\S+))* *$')
+        p30 = regex_engine.compile(r'^ *(?P<interface_ip>[\d./]+) *((?P<router_id>\S+))* *$')
 
         #        Leaf Networks Deleted:
-        p31 = re.compile(r'^ *Leaf Networks Deleted: *$')
+        p31 = regex_engine.compile(r'^ *Leaf Networks Deleted: *$')
 
         #    LSP Processed:
-        p32 = re.compile(r'^ *LSP Processed: *$')
+        p32 = regex_engine.compile(r'^ *LSP Processed: *$')
 
         #        Id: 2037.0685.b002.00-00  Seq: b  Change-type: Modify  Recv-Time: Sep 19 18:11:17.193
-        p33 = re.compile(r'^ *Id: *(?P<id>\S+) *Seq: *(?P<seq>\w+) *Change-type: *(?P<change_type>\S+) *Recv-Time: *(?P<recv_time>\w+ *\d+ *[\d:.]+) *$')
+        p33 = regex_engine.compile(r'^ *Id: *(?P<id>\S+) *Seq: *(?P<seq>\w+) *Change-type: *(?P<change_type>\S+) *Recv-Time: *(?P<recv_time>\w+ *\d+ *[\d:.]+) *$')
 
         #    LSP Regenerated:
-        p34 = re.compile(r'^ *LSP Regenerated: *$')
+        p34 = regex_engine.compile(r'^ *LSP Regenerated: *$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3089,19 +3091,19 @@ class ShowRcmdProcess(ShowRcmdProcessSchema):
         rcmd_dict = {}
 
         #Protocol: ISIS    Process Name: isis1
-        p0 = re.compile(r'^(Protocol): +(?P<protocol>[\w+]+)\s+(Process +Name): +(?P<process>[\w+]+)$')
+        p0 = regex_engine.compile(r'^(Protocol): +(?P<protocol>[\w+]+)\s+(Process +Name): +(?P<process>[\w+]+)$')
 
         #    Inst-Name: default:default:0 Upd-Time: Oct 17 11:52:13.768
-        p1 = re.compile(r'^(Inst-Name): +(?P<inst_name>[\w:\-]+)\s+(Upd-Time): +(?P<upd_time>[a-zA-Z]+\s+\d{2}\s+\d{2}\:\d{2}\:\d{2}\.\d+)$')
+        p1 = regex_engine.compile(r'^(Inst-Name): +(?P<inst_name>[\w:\-]+)\s+(Upd-Time): +(?P<upd_time>[a-zA-Z]+\s+\d{2}\s+\d{2}\:\d{2}\:\d{2}\.\d+)$')
 
         #      Spf(T/RC/NR/NI): 8/0/0/0 LSP(C/L): 0/11 Arch(Spf/Lsp): 0/0
-        p2 = re.compile(r'^ *Spf\(T/RC/NR/NI\): *(?P<inst_name_spf>\S+) *LSP\(C/L\): *(?P<lsp_details>\S+) *Arch\(Spf/Lsp\): *(?P<arch_details>\S+) *$')
+        p2 = regex_engine.compile(r'^ *Spf\(T/RC/NR/NI\): *(?P<inst_name_spf>\S+) *LSP\(C/L\): *(?P<lsp_details>\S+) *Arch\(Spf/Lsp\): *(?P<arch_details>\S+) *$')
 
         #        Inst-Id: 213166328 Upd-Time: Oct 17 05:25:24.102 State: InActive Deleted: No FwdRef: No SpfOff: 0
-        p3 = re.compile(r'^(Inst-Id):\s+(?P<id>\S+[\d]+)\s+(Upd-Time):\s+(?P<upd_time_id>\S+[a-zA-Z]+\s+\d{2}\s+\d{2}\:\d{2}\:\d{2}\.\d+)\s+(State):\s+(?P<state>\S+[\w]+)\s+(Deleted):\s+(?P<deleted>\S+[\w]+)\s+(FwdRef):\s+(?P<fwdref>\S+[\w]+)\s+(SpfOff):\s+(?P<spfoff>\S+)+$')
+        p3 = regex_engine.compile(r'^(Inst-Id):\s+(?P<id>\S+[\d]+)\s+(Upd-Time):\s+(?P<upd_time_id>\S+[a-zA-Z]+\s+\d{2}\s+\d{2}\:\d{2}\:\d{2}\.\d+)\s+(State):\s+(?P<state>\S+[\w]+)\s+(Deleted):\s+(?P<deleted>\S+[\w]+)\s+(FwdRef):\s+(?P<fwdref>\S+[\w]+)\s+(SpfOff):\s+(?P<spfoff>\S+)+$')
 
         #          Spf(T/RC/NR/NI): 6/4/2/0 Arch(Spf): 0 Total(Spt): 0
-        p4 = re.compile(r'^ *Spf\(T/RC/NR/NI\): *(?P<inst_id_spf>\S+) *Arch\(Spf\): *(?P<arch_cnt>\S+) *Total\(Spt\): *(?P<total_cnt>\S+) *$')
+        p4 = regex_engine.compile(r'^ *Spf\(T/RC/NR/NI\): *(?P<inst_id_spf>\S+) *Arch\(Spf\): *(?P<arch_cnt>\S+) *Total\(Spt\): *(?P<total_cnt>\S+) *$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3234,7 +3236,7 @@ class ShowRcmdInterfaceEvent(ShowRcmdInterfaceEventSchema):
         rcmd_dict = {}
 
         #  4  |  ISIS  |     HundredGigE0/0/0/0     |     LinkUp     | Oct 17 05:25:25.109 |    10.1.1.1
-        p0 = re.compile(r'^(?P<sno>\d+)\s+\|\s+(?P<protocol>\S+)\s+\|\s+(?P<interface>\S+)\s+\|\s+(?P<event_type>\S+)\s+\|\s+(?P<time>[a-zA-Z]+\s+\d{1,2}\s+\d{2}\:\d{2}\:\d{2}\.\d+)\s+\|\s+(?P<address>[\d\.\/]+)$')
+        p0 = regex_engine.compile(r'^(?P<sno>\d+)\s+\|\s+(?P<protocol>\S+)\s+\|\s+(?P<interface>\S+)\s+\|\s+(?P<event_type>\S+)\s+\|\s+(?P<time>[a-zA-Z]+\s+\d{1,2}\s+\d{2}\:\d{2}\:\d{2}\.\d+)\s+\|\s+(?P<address>[\d\.\/]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -6,12 +6,12 @@
 """
 
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =============================================
@@ -59,10 +59,10 @@ class ShowRibTables(ShowRibTablesSchema):
         # default/default        uni   0xe0000000  10000000            12              13  
         # Prefix Limit Notified Forward Referenced Table Deleted   Table Reached Convergence
         #         N                      N                N                 Y
-        p1 = re.compile(r'^(?P<vrf>\S+)\/(?P<table>\w+) +(?P<safi>\w+)'
-                        r' +(?P<table_id>\S+) +(?P<prfx_lmt>\d+) +(?P<prfx_cnt>\d+)'
-                        r' +(?P<tbl_ver>\d+) +(?P<pfx_notif>\w) +(?P<forw_refe>\w)'
-                        r' +(?P<tbl_del>\w) +(?P<tbl_conv>\w)')
+        p1 = regex_engine.compile(r'^(?P<vrf>\S+)\/(?P<table>\w+) +(?P<safi>\w+)'
+                                  r' +(?P<table_id>\S+) +(?P<prfx_lmt>\d+) +(?P<prfx_cnt>\d+)'
+                                  r' +(?P<tbl_ver>\d+) +(?P<pfx_notif>\w) +(?P<forw_refe>\w)'
+                                  r' +(?P<tbl_del>\w) +(?P<tbl_conv>\w)')
         
         for line in out.splitlines():
 
@@ -148,15 +148,15 @@ class ShowRibTablesSummary(ShowRibTablesSummarySchema):
         
         result_dict.setdefault('rib_table', {})
         # Summary of number of tables and cumulative prefix counts in <IPv4> RIB:
-        p1 = re.compile(r'^Summary\sof.+in +(?P<rib>\S+)')
+        p1 = regex_engine.compile(r'^Summary\sof.+in +(?P<rib>\S+)')
         # Number of unicast tables:          <3>
-        p2 = re.compile(r'^Number of unicast tables:\s+(?P<uni_tbl>\d+)')
+        p2 = regex_engine.compile(r'^Number of unicast tables:\s+(?P<uni_tbl>\d+)')
         # Total number of unicast prefixes:         <4>
-        p3 = re.compile(r'^Total number of unicast prefixes:\s+(?P<uni_pfx>\d+)')
+        p3 = regex_engine.compile(r'^Total number of unicast prefixes:\s+(?P<uni_pfx>\d+)')
         # Number of multicast tables:          <1>
-        p4 = re.compile(r'^Number of multicast tables:\s+(?P<multi_tbl>\d+)')
+        p4 = regex_engine.compile(r'^Number of multicast tables:\s+(?P<multi_tbl>\d+)')
         # Total number of multicast prefixes:          <0>
-        p5 = re.compile(r'^Total number of multicast prefixes:\s+(?P<multi_pfx>\d+)')
+        p5 = regex_engine.compile(r'^Total number of multicast prefixes:\s+(?P<multi_pfx>\d+)')
 
         for line in out.splitlines():
     
@@ -230,7 +230,7 @@ class ShowRibIpv6Iid(ShowRibIpv6IidSchema):
 
         # 0xa000001   ::ffff:10.0.0.1       [EVPN-VPWS:evi=1001:eth_tag=10001:type=0]          l2vpn_iid          InUse      Y 
         # 0xa000002   ::ffff:10.0.0.2       [EVPN-ELAN:evi=1002:esi=0194.aef0.f99c.dd00.2400:nh=:::eth_tag=0:type=0] l2vpn_iid          InUse      Y
-        p1 = re.compile(r'^(?P<iid>\w+)\s+(?P<prefix>[\w:.]+)\s+(?P<context>[\w\[:.=\]-]+)\s+(?P<owner>[\w_]+)\s+(?P<state>\S+)\s+(?P<read_write>[Y|N])$')
+        p1 = regex_engine.compile(r'^(?P<iid>\w+)\s+(?P<prefix>[\w:.]+)\s+(?P<context>[\w\[:.=\]-]+)\s+(?P<owner>[\w_]+)\s+(?P<state>\S+)\s+(?P<read_write>[Y|N])$')
 
         # initial return dictionary
         ret_dict = {}
@@ -11,13 +11,13 @@ IOSXR parser for the following show commands:
     * show rip vrf {vrf} statistics
 """
 
-# Python
-import re
-
 # MetaParser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================
 # Schema for:
@@ -91,51 +91,51 @@ class ShowRip(ShowRipSchema):
         ret_dict = {}
 
         # RIP config:
-        p1 = re.compile(r'^RIP +config:$')
+        p1 = regex_engine.compile(r'^RIP +config:$')
 
         # Active:                    Yes
-        p2 = re.compile(r'^Active\??:\s+(?P<active>\w+)$')
+        p2 = regex_engine.compile(r'^Active\??:\s+(?P<active>\w+)$')
 
         # Added to socket:           Yes
-        p3 = re.compile(r'^Added +to +socket\??:\s+(?P<added_to_socket>\w+)$')
+        p3 = regex_engine.compile(r'^Added +to +socket\??:\s+(?P<added_to_socket>\w+)$')
 
         # Out-of-memory state:        Normal
-        p4 = re.compile(r'^Out-of-memory +state:\s+(?P<memory_state>\w+)$')
+        p4 = regex_engine.compile(r'^Out-of-memory +state:\s+(?P<memory_state>\w+)$')
 
         # Version:                    2.3
-        p5 = re.compile(r'^Version:\s+(?P<version>[\d.]+)$')
+        p5 = regex_engine.compile(r'^Version:\s+(?P<version>[\d.]+)$')
 
         # Default metric:             3
-        p6 = re.compile(r'^Default +metric:\s+(?P<default_metric>[\w\s]+)$')
+        p6 = regex_engine.compile(r'^Default +metric:\s+(?P<default_metric>[\w\s]+)$')
 
         # Maximum paths:              4
-        p7 = re.compile(r'^Maximum +paths:\s+(?P<max_paths>\d+)$')
+        p7 = regex_engine.compile(r'^Maximum +paths:\s+(?P<max_paths>\d+)$')
 
         # Auto summarize:            No
-        p8 = re.compile(r'^Auto +summarize\??:\s+(?P<auto_summarize>\w+)$')
+        p8 = regex_engine.compile(r'^Auto +summarize\??:\s+(?P<auto_summarize>\w+)$')
 
         # Broadcast for V2:          No
-        p9 = re.compile(r'^Broadcast +for +V2\??:\s+(?P<broadcast>\w+)$')
+        p9 = regex_engine.compile(r'^Broadcast +for +V2\??:\s+(?P<broadcast>\w+)$')
 
         # Packet source validation:  Yes
-        p10 = re.compile(r'^Packet +source +validation\??:\s+(?P<'
-                         r'packet_validation>\w+)$')
+        p10 = regex_engine.compile(r'^Packet +source +validation\??:\s+(?P<'
+                                   r'packet_validation>\w+)$')
 
         # NSF:                        Disabled
-        p11 = re.compile(r'^NSF:\s+(?P<nsf>\w+)$')
+        p11 = regex_engine.compile(r'^NSF:\s+(?P<nsf>\w+)$')
 
         # Timers: Update:             10 seconds (7 seconds until next update)
-        p12 = re.compile(r'^Timers: +Update:\s+(?P<update_timer>\d+) +seconds'
-                         r' +\((?P<next_update>\d+)[\s\w]+\)$')
+        p12 = regex_engine.compile(r'^Timers: +Update:\s+(?P<update_timer>\d+) +seconds'
+                                   r' +\((?P<next_update>\d+)[\s\w]+\)$')
 
         # Invalid:            31 seconds
-        p13 = re.compile(r'^Invalid:\s+(?P<invalid_timer>\d+)[\s\w]+$')
+        p13 = regex_engine.compile(r'^Invalid:\s+(?P<invalid_timer>\d+)[\s\w]+$')
 
         # Holddown:           32 seconds
-        p14 = re.compile(r'^Holddown:\s+(?P<holddown_timer>\d+)[\s\w]+$')
+        p14 = regex_engine.compile(r'^Holddown:\s+(?P<holddown_timer>\d+)[\s\w]+$')
 
         # Flush:              33 seconds
-        p15 = re.compile(r'^Flush:\s+(?P<flush_timer>\d+)[\s\w]+$')
+        p15 = regex_engine.compile(r'^Flush:\s+(?P<flush_timer>\d+)[\s\w]+$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -321,46 +321,46 @@ class ShowRipStatistics(ShowRipStatisticsSchema):
         ret_dict = {}
 
         # RIP statistics:
-        p1 = re.compile(r'^RIP +statistics:$')
+        p1 = regex_engine.compile(r'^RIP +statistics:$')
 
         # Total messages sent:        5294
-        p2 = re.compile(r'^Total +messages +sent:\s+(?P<number_of_messages>\d+)$')
+        p2 = regex_engine.compile(r'^Total +messages +sent:\s+(?P<number_of_messages>\d+)$')
 
         # Message send failures:      0
-        p3 = re.compile(r'^Message +send +failures:\s+(?P<number_of_failures>\d+)$')
+        p3 = regex_engine.compile(r'^Message +send +failures:\s+(?P<number_of_failures>\d+)$')
 
         # Regular updates sent:       2944
-        p4 = re.compile(r'^Regular +updates +sent:\s+(?P<number_of_updates>\d+)$')
+        p4 = regex_engine.compile(r'^Regular +updates +sent:\s+(?P<number_of_updates>\d+)$')
 
         # Queries responsed to:       0
-        p5 = re.compile(r'^Queries +responsed +to:\s+(?P<number_of_queries>\d+)$')
+        p5 = regex_engine.compile(r'^Queries +responsed +to:\s+(?P<number_of_queries>\d+)$')
 
         # RIB updates:                4365
-        p6 = re.compile(r'^RIB +updates:\s+(?P<number_of_rib_updates>\d+)$')
+        p6 = regex_engine.compile(r'^RIB +updates:\s+(?P<number_of_rib_updates>\d+)$')
 
         # Total packets received:     4896
-        p7 = re.compile(r'^Total +packets +received:\s+(?P<packets_received>\d+)$')
+        p7 = regex_engine.compile(r'^Total +packets +received:\s+(?P<packets_received>\d+)$')
 
         # Discarded packets:          0
-        p8 = re.compile(r'^Discarded +packets:\s+(?P<discarded_packets>\d+)$')
+        p8 = regex_engine.compile(r'^Discarded +packets:\s+(?P<discarded_packets>\d+)$')
 
         # Discarded routes:           4760
-        p9 = re.compile(r'^Discarded +routes:\s+(?P<discarded_routes>\d+)$')
+        p9 = regex_engine.compile(r'^Discarded +routes:\s+(?P<discarded_routes>\d+)$')
 
         # Packet received at standby: 0
-        p10 = re.compile(r'^Packet +received +at +standby:\s+(?P<packets_received>\d+)$')
+        p10 = regex_engine.compile(r'^Packet +received +at +standby:\s+(?P<packets_received>\d+)$')
 
         # Number of routes allocated: 9
-        p11 = re.compile(r'^Number +of +routes +allocated:\s+(?P<number_of_routes>\d+)$')
+        p11 = regex_engine.compile(r'^Number +of +routes +allocated:\s+(?P<number_of_routes>\d+)$')
 
         # Number of paths allocated:  6
-        p12 = re.compile(r'^Number +of +paths +allocated:\s+(?P<number_of_paths>\d+)$')
+        p12 = regex_engine.compile(r'^Number +of +paths +allocated:\s+(?P<number_of_paths>\d+)$')
 
         # Route malloc failures:      0
-        p13 = re.compile(r'^Route +malloc +failures:\s+(?P<route_malloc_failures>\d+)$')
+        p13 = regex_engine.compile(r'^Route +malloc +failures:\s+(?P<route_malloc_failures>\d+)$')
 
         # Path malloc failures:       0
-        p14 = re.compile(r'^Path +malloc +failures:\s+(?P<path_malloc_failures>\d+)$')
+        p14 = regex_engine.compile(r'^Path +malloc +failures:\s+(?P<path_malloc_failures>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -540,17 +540,17 @@ class ShowRipDatabase(ShowRipDatabaseSchema):
         # 172.16.0.0/16    auto-summary
         # 192.168.1.1/32
         # 2001:DB8:2:3::/64
-        p1 = re.compile(r'^(?P<route>[\w\.\/:]+)(\s+(?P<summary_type>[\(\)\w-]+))?$')
+        p1 = regex_engine.compile(r'^(?P<route>[\w\.\/:]+)(\s+(?P<summary_type>[\(\)\w-]+))?$')
 
         # [0]    directly connected, GigabitEthernet0/0/0/1.100
-        p2 = re.compile(r'^\[(?P<metric>\d+)\]\s+directly +connected, +(?P<interface>[\w\d/\.]+)$')
+        p2 = regex_engine.compile(r'^\[(?P<metric>\d+)\]\s+directly +connected, +(?P<interface>[\w\d/\.]+)$')
 
         # [3] distance: 1    redistributed
-        p3 = re.compile(r'^\[(?P<metric>\d+)\]\s+distance: +(?P<distance>\d+)\s+redistributed$')
+        p3 = regex_engine.compile(r'^\[(?P<metric>\d+)\]\s+distance: +(?P<distance>\d+)\s+redistributed$')
 
         # [11] via 10.1.2.2, next hop 10.1.2.2, Uptime: 15s, GigabitEthernet0/0/0/0.100
-        p4 = re.compile(r'^\[(?P<metric>\d+)\] +via +[\d\.]+, +next +hop +(?P<next_hop>[\d\.]+)'
-                        r', +Uptime: +(?P<up_time>\w+), +(?P<interface>[\w\d/\.]+)$')
+        p4 = regex_engine.compile(r'^\[(?P<metric>\d+)\] +via +[\d\.]+, +next +hop +(?P<next_hop>[\d\.]+)'
+                                  r', +Uptime: +(?P<up_time>\w+), +(?P<interface>[\w\d/\.]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -726,72 +726,72 @@ class ShowRipInterface(ShowRipInterfaceSchema):
         # GigabitEthernet0/0/0/0.100
         # GigabitEthernet0/0/0/1.420 (Forward Reference)
         # Loopback300
-        p1 = re.compile(r'^(?P<interface>\w+[\d\/]+\.?\d+)(?: +\([\S\s]+)?$')
+        p1 = regex_engine.compile(r'^(?P<interface>\w+[\d\/]+\.?\d+)(?: +\([\S\s]+)?$')
 
         # Rip enabled?:               Passive
-        p2 = re.compile(r'^Rip +enabled\?:\s+(?P<passive>\w+)$')
+        p2 = regex_engine.compile(r'^Rip +enabled\?:\s+(?P<passive>\w+)$')
 
         # Out-of-memory state:        Normal
-        p3 = re.compile(r'^Out-of-memory +state:\s+(?P<state>\w+)$')
+        p3 = regex_engine.compile(r'^Out-of-memory +state:\s+(?P<state>\w+)$')
 
         # Broadcast for V2:           No
-        p4 = re.compile(r'^Broadcast +for +V2:\s+(?P<broadcast>\w+)$')
+        p4 = regex_engine.compile(r'^Broadcast +for +V2:\s+(?P<broadcast>\w+)$')
 
         # Accept Metric 0:           No
-        p5 = re.compile(r'^Accept +Metric +0:\s+(?P<accept_metric>\w+)$')
+        p5 = regex_engine.compile(r'^Accept +Metric +0:\s+(?P<accept_metric>\w+)$')
 
         # Send versions:              2
-        p6 = re.compile(r'^Send +versions:\s+(?P<version>\d+)$')
+        p6 = regex_engine.compile(r'^Send +versions:\s+(?P<version>\d+)$')
 
         # Receive versions:           2
-        p7 = re.compile(r'^Receive +versions:\s+(?P<version>\d+)$')
+        p7 = regex_engine.compile(r'^Receive +versions:\s+(?P<version>\d+)$')
 
         # Interface state:            Up
         # Interface state:            Unknown State
-        p8 = re.compile(r'^Interface +state:\s+(?P<state>[\w ]+)$')
+        p8 = regex_engine.compile(r'^Interface +state:\s+(?P<state>[\w ]+)$')
 
         # IP address:                 10.1.2.1/24
-        p9 = re.compile(r'^IP +address:\s+(?P<ip_address>[\d\/\.]+)$')
+        p9 = regex_engine.compile(r'^IP +address:\s+(?P<ip_address>[\d\/\.]+)$')
 
         # Metric Cost:                0
-        p10 = re.compile(r'^Metric +Cost:\s+(?P<cost>\d+)$')
+        p10 = regex_engine.compile(r'^Metric +Cost:\s+(?P<cost>\d+)$')
 
         # Split horizon:              Enabled
-        p11 = re.compile(r'^Split +horizon:\s+(?P<split_horizon>\w+)$')
+        p11 = regex_engine.compile(r'^Split +horizon:\s+(?P<split_horizon>\w+)$')
 
         # Poison Reverse:             Disabled
-        p12 = re.compile(r'^Poison +Reverse:\s+(?P<poison_reverse>\w+)$')
+        p12 = regex_engine.compile(r'^Poison +Reverse:\s+(?P<poison_reverse>\w+)$')
 
         # Socket set options:
-        p13 = re.compile(r'^Socket +set +options:$')
+        p13 = regex_engine.compile(r'^Socket +set +options:$')
 
         # Joined multicast group:    Yes
-        p14 = re.compile(r'^Joined +multicast +group:\s+(?P<joined>\w+)$')
+        p14 = regex_engine.compile(r'^Joined +multicast +group:\s+(?P<joined>\w+)$')
 
         # LPTS filter set:           Yes
-        p15 = re.compile(r'^LPTS +filter +set:\s+(?P<filter_set>\w+)$')
+        p15 = regex_engine.compile(r'^LPTS +filter +set:\s+(?P<filter_set>\w+)$')
 
         # Authentication mode:        None
-        p16 = re.compile(r'^Authentication +mode:\s+(?P<mode>\w+)$')
+        p16 = regex_engine.compile(r'^Authentication +mode:\s+(?P<mode>\w+)$')
 
         # Authentication keychain:    Not set
-        p17 = re.compile(r'^Authentication +keychain:\s+(?P<keychain>[\w\s]+)$')
+        p17 = regex_engine.compile(r'^Authentication +keychain:\s+(?P<keychain>[\w\s]+)$')
 
         # Total packets received: 4877
-        p18 = re.compile(r'^Total +packets +received:\s+(?P<packets_received>\d+)$')
+        p18 = regex_engine.compile(r'^Total +packets +received:\s+(?P<packets_received>\d+)$')
 
         # RIP peers attached to this interface:
-        p19 = re.compile(r'^RIP +peers +attached +to +this +interface:$')
+        p19 = regex_engine.compile(r'^RIP +peers +attached +to +this +interface:$')
 
         # 10.1.2.2
-        p20 = re.compile(r'^(?P<peer_address>[\d\.]+)$')
+        p20 = regex_engine.compile(r'^(?P<peer_address>[\d\.]+)$')
 
         # uptime (sec): 2    version: 2
-        p21 = re.compile(r'^uptime \(sec\): +(?P<uptime>\d+)\s+version: +(?P<version>\d+)$')
+        p21 = regex_engine.compile(r'^uptime \(sec\): +(?P<uptime>\d+)\s+version: +(?P<version>\d+)$')
 
         # packets discarded: 0    routes discarded: 4733
-        p22 = re.compile(r'packets +discarded: +(?P<packets_discarded>\d+)\s+routes +'
-                        r'discarded: +(?P<routes_discarded>\d+)$')
+        p22 = regex_engine.compile(r'packets +discarded: +(?P<packets_discarded>\d+)\s+routes +'
+                                  r'discarded: +(?P<routes_discarded>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -8,6 +8,9 @@ from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================================
 #  schema for show cef {afi} {prefix} detail
@@ -158,106 +161,106 @@ class ShowCefDetail(ShowCefDetailSchema):
         # fd00::3/128, version 103, SRv6 Headend, internal 0x5000001 0x30 (ptr 0xeb4f580) [1], 0x400 (0xda89410), 0x0 (0xf580648)
         # 10.255.255.224/32, version 2, drop adjacency, internal 0x1000001 0x30 (ptr 0x79125568) [1], 0x0 (0x0), 0x0 (0x0)
         # ::ffff:10.0.0.1/128, version 32, SRv6 Headend, IID (EVPN-MH), internal 0x1000001 0x0 (ptr 0x78d3fe50) [1], 0x0 (0x0), 0x0 (0x7a0cfaf8)
-        p1 = re.compile(r'^(?P<ip>[a-zA-Z0-9:.\/]+), +version +(?P<version>[\d]+),( +drop +(?P<drop>[\w]+),)?(?: SRv6 Headend,*)?' \
-                        r'(?: +IID +\((?P<iid>[\w-]+)\),)?(?: internal +(?P<internal>.+)+)?$')
+        p1 = regex_engine.compile(r'^(?P<ip>[a-zA-Z0-9:.\/]+), +version +(?P<version>[\d]+),( +drop +(?P<drop>[\w]+),)?(?: SRv6 Headend,*)?' \
+                                  r'(?: +IID +\((?P<iid>[\w-]+)\),)?(?: internal +(?P<internal>.+)+)?$')
 
         # Updated Oct 13 18:18:19.680
-        p2 = re.compile(r'^Updated +(?P<updated>[\w\s:.]+)$')
+        p2 = regex_engine.compile(r'^Updated +(?P<updated>[\w\s:.]+)$')
 
         # Prefix Len 32, traffic index 0, precedence n/a, priority 3
-        p3 = re.compile(r'^Prefix +Len +(?P<length>[\d]+), +traffic +index'
-                        r' +(?P<traffic_index>[\d]+), +precedence'
-                        r' +(?P<precedence>[\S]+), +priority'
-                        r' +(?P<priority>[\d]+)$')
+        p3 = regex_engine.compile(r'^Prefix +Len +(?P<length>[\d]+), +traffic +index'
+                                  r' +(?P<traffic_index>[\d]+), +precedence'
+                                  r' +(?P<precedence>[\S]+), +priority'
+                                  r' +(?P<priority>[\d]+)$')
 
         # gateway array (0x78967928) reference count 2, flags 0x8078, source lsd (5), 1 backups
-        p4 = re.compile(r'^gateway +array +\((?P<gateway_array>[\w\d]+)\)'
-                        r' +reference +count +(?P<reference_count>[\d]+),'
-                        r' +flags +(?P<flag_hex>[\w\d]+), +source +(?P<source_type>lsd|rib)'
-                        r' +\((?P<source_lsd_rib>[\d]+)\), (?P<backups>[\d]+) +backups$')
+        p4 = regex_engine.compile(r'^gateway +array +\((?P<gateway_array>[\w\d]+)\)'
+                                  r' +reference +count +(?P<reference_count>[\d]+),'
+                                  r' +flags +(?P<flag_hex>[\w\d]+), +source +(?P<source_type>lsd|rib)'
+                                  r' +\((?P<source_lsd_rib>[\d]+)\), (?P<backups>[\d]+) +backups$')
 
         # [3 type 4 flags 0x108441 (0x793d4b28) ext 0x0 (0x0)]
-        p5 = re.compile(r'^\[(?P<flag_count>[\d]+) +type +(?P<flag_type>[\d]+)'
-                        r' +flags +(?P<flags>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^\[(?P<flag_count>[\d]+) +type +(?P<flag_type>[\d]+)'
+                                  r' +flags +(?P<flags>[\S\s]+)$')
 
         # LW-LDI[type=1, refc=1, ptr=0x78b064d8, sh-ldi=0x793d4b28]
-        p6 = re.compile(r'^LW-LDI\[type=(?P<type>[\d]+),'
-                        r' +refc=(?P<refc>[\d]+), +ptr=(?P<ptr>[\w]+),'
-                        r' +sh-ldi=(?P<sh_ldi>[\w]+)\]$')
+        p6 = regex_engine.compile(r'^LW-LDI\[type=(?P<type>[\d]+),'
+                                  r' +refc=(?P<refc>[\d]+), +ptr=(?P<ptr>[\w]+),'
+                                  r' +sh-ldi=(?P<sh_ldi>[\w]+)\]$')
 
         # gateway array update type-time 1 Oct 13 18:18:19.680
-        p7 = re.compile(r'^gateway +array +update +type-time'
-                        r' +(?P<type_time>[\d]+) +(?P<updated_at>[\w\s:.]+)$')
+        p7 = regex_engine.compile(r'^gateway +array +update +type-time'
+                                  r' +(?P<type_time>[\d]+) +(?P<updated_at>[\w\s:.]+)$')
 
         # LDI Update time Oct 13 18:18:19.691
         # LW-LDI-TS Oct 13 18:18:19.691
-        p9 = re.compile(r'^(LDI Update time|LW-LDI-TS) (?P<datetime>[\w\s:.]+)$')
+        p9 = regex_engine.compile(r'^(LDI Update time|LW-LDI-TS) (?P<datetime>[\w\s:.]+)$')
 
         # via 10.55.0.2/32, 4 dependencies, recursive [flags 0x0]
         # via 10.1.15.2/32, 4 dependencies, recursive [flags 0x0]
-        p10 = re.compile(r'^via +(?P<via>[\S]+), +(?P<dependencies>[\w]{1,})'
-                         r' +dependencies, +(?P<via_flags>[\w]+)'
-                         r' +\[([\S\s]+)\]$')
+        p10 = regex_engine.compile(r'^via +(?P<via>[\S]+), +(?P<dependencies>[\w]{1,})'
+                                   r' +dependencies, +(?P<via_flags>[\w]+)'
+                                   r' +\[([\S\s]+)\]$')
         
         #via 10.10.32.141/32, TenGigE0/1/0/30.4, 8 dependencies, weight 0, class 0 [flags 0x0]
-        p10_1 = re.compile(r'^via +(?P<via>[\S]+),+ (?P<via_interface>[\S]+),'
-                           r' +(?P<dependencies>\d+) +dependencies, +weight +(?P<weight>\d+),'
-                           r'+ class +(?P<via_class>\d+)+ \[([\S\s]+)\]$')
+        p10_1 = regex_engine.compile(r'^via +(?P<via>[\S]+),+ (?P<via_interface>[\S]+),'
+                                     r' +(?P<dependencies>\d+) +dependencies, +weight +(?P<weight>\d+),'
+                                     r'+ class +(?P<via_class>\d+)+ \[([\S\s]+)\]$')
 
         # path-idx 0 NHID 0x0 [0x78b4cbf8 0x0]
         # path-idx 1 NHID 0x0 [0x78b4fbf8 0x0]
         # path-idx 0 NHID 0x0 [0x8b001f38 0x0], Internal 0x89d70af0
-        p11 = re.compile(r'^path-idx +(?P<idx>[\w]+) +NHID +(?P<nhid>[\S]+)'
-                         r' +\[(?P<nhid_hex>[\w\s]+)\](?:, +Internal +(?P<idx_internal>\w+))?$')
+        p11 = regex_engine.compile(r'^path-idx +(?P<idx>[\w]+) +NHID +(?P<nhid>[\S]+)'
+                                   r' +\[(?P<nhid_hex>[\w\s]+)\](?:, +Internal +(?P<idx_internal>\w+))?$')
 
         # next hop 10.55.0.2/32 via 10.55.0.2/32
         # next hop 10.1.15.2/32 via 10.1.15.2/32
-        p12 = re.compile(r'^next +hop +(?P<path_idx_address>[\S]+)'
-                         r' +via +(?P<path_idx_via>[\S]+)$')
+        p12 = regex_engine.compile(r'^next +hop +(?P<path_idx_address>[\S]+)'
+                                   r' +via +(?P<path_idx_via>[\S]+)$')
 
         # local label 24006
-        p13 = re.compile(r'^local +label +(?P<local_label>[\d]+)$')
+        p13 = regex_engine.compile(r'^local +label +(?P<local_label>[\d]+)$')
 
         # next hop 10.55.0.2/32 Te0/4/0/15.1 labels imposed {None}
         # next hop 10.1.15.2/32 Te0/3/0/15.16 labels imposed {None}
-        p14 = re.compile(r'^next +hop +(?P<address>[\S]+)'
-                         r' +(?P<interface>[\S]+) +labels'
-                         r' +imposed +\{(?P<labels>[\S]+)\}')
+        p14 = regex_engine.compile(r'^next +hop +(?P<address>[\S]+)'
+                                   r' +(?P<interface>[\S]+) +labels'
+                                   r' +imposed +\{(?P<labels>[\S]+)\}')
 
         # Weight distribution:
-        p15 = re.compile(r'^Weight +distribution:$')
+        p15 = regex_engine.compile(r'^Weight +distribution:$')
 
         # slot 0, weight 1, normalized_weight 1, class 0
         # slot 31, weight 1, normalized_weight 1, class 0
-        p16 = re.compile(r'^slot +(?P<slot>[\d]+), +weight'
-                         r' +(?P<weight>[\d]+), +normalized_weight'
-                         r' +(?P<normalized_weight>[\d]+), +class'
-                         r' +(?P<class>[\d]+)$')
+        p16 = regex_engine.compile(r'^slot +(?P<slot>[\d]+), +weight'
+                                   r' +(?P<weight>[\d]+), +normalized_weight'
+                                   r' +(?P<normalized_weight>[\d]+), +class'
+                                   r' +(?P<class>[\d]+)$')
 
         # Load distribution: 0 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 25 26 27 28 29 30 31 (refcount 3)
-        p17 = re.compile(r'^Load +distribution: +'
-                         r'(?P<distribution>[\d\s]+) +'
-                         r'\(refcount (?P<refcount>[\d]+)\)$')
+        p17 = regex_engine.compile(r'^Load +distribution: +'
+                                   r'(?P<distribution>[\d\s]+) +'
+                                   r'\(refcount (?P<refcount>[\d]+)\)$')
 
         # Hash  OK  Interface                 Address
         # 0     Y   recursive                 10.55.0.2
         # 31    Y   recursive                 10.1.15.2
         # 0     Y   Bundle-Ether313           fe80::96ae:f0ff:fe72:6cda
-        p18 = re.compile(r'^(?P<hash>[\d]+)\s+(?P<ok>[Y|N])\s+(?P<interface>[\w\/-]+)\s+(?P<address>[\S]+)$')
+        p18 = regex_engine.compile(r'^(?P<hash>[\d]+)\s+(?P<ok>[Y|N])\s+(?P<interface>[\w\/-]+)\s+(?P<address>[\S]+)$')
 
         # Level 1 - Load distribution: 0 1 2 3
         # Level 1 - Load distribution: 0
-        p19 = re.compile(r'^Level\s+(?P<level>\d+)\s+-\s+Load\s+distribution:\s+(?P<load_distribution>[\d\s]+)$')
+        p19 = regex_engine.compile(r'^Level\s+(?P<level>\d+)\s+-\s+Load\s+distribution:\s+(?P<load_distribution>[\d\s]+)$')
 
         # [0] via 10.20.240.49, recursive
         # [0] via fc00:c000:2003::/128, recursive
-        p20 = re.compile(r'^\[(?P<load>\d+)\]\s+via\s+(?P<via_address>[a-zA-Z0-9.:\/]+),\s+(?P<via_flags>\w+)$')
+        p20 = regex_engine.compile(r'^\[(?P<load>\d+)\]\s+via\s+(?P<via_address>[a-zA-Z0-9.:\/]+),\s+(?P<via_flags>\w+)$')
 
         # next hop VRF - 'default', table - 0xe0800000
-        p21 = re.compile(r"^next\s+hop\s+VRF\s+-\s+'(?P<next_hop_vrf>\w+)',\s+table\s+-\s+(?P<next_hop_table>\w+)$")
+        p21 = regex_engine.compile(r"^next\s+hop\s+VRF\s+-\s+'(?P<next_hop_vrf>\w+)',\s+table\s+-\s+(?P<next_hop_table>\w+)$")
 
         # SRv6 H.Encaps.L2.Red SID-list {fc00:c000:1001:e006::}
-        p22 = re.compile(r'^SRv6 +H.Encaps(?:.L2)?.Red +SID-list +{(?P<sid_list>[\w.:]+)}')
+        p22 = regex_engine.compile(r'^SRv6 +H.Encaps(?:.L2)?.Red +SID-list +{(?P<sid_list>[\w.:]+)}')
 
         result_dict = {}
 
@@ -703,7 +706,7 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
 
         # VRF: VRF501
         # VRF: L:123
-        p1 = re.compile(r'^\s*VRF: +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^\s*VRF: +(?P<vrf>\S+)$')
 
         # R    10.1.0.0/8 [120/1] via 10.12.120.1, 1w0d, GigabitEthernet0/0/0/0.120
         # B    10.21.33.33/32 [200/0] via 10.166.13.13, 00:52:31
@@ -714,56 +717,56 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
         # S*   192.168.4.4/10 [111/10] via 172.16.84.11, 1w0d
         # R    10.145.110.10/4 [10/10] via 192.168.10.12, 12:03:42, GigabitEthernet0/0/1/1.1
         # B    10.100.3.160/31 [200/0] via 172.23.6.198 (nexthop in vrf default), 5d13h
-        p2 = re.compile(r'^(?P<code1>[\w](\*)*)\s*(?P<code2>\S+)? +(?P<network>\S+) +'
-                        r'\[(?P<route_preference>\d+)\/(?P<metric>\d+)\] +via +'
-                        r'(?P<next_hop>\S+)( +\(nexthop +in +vrf +\w+\))?,'
-                        r'( +(?P<date>[\w:]+),?)?( +(?P<interface>[\w\/\.\-]+))?'
-                        r'( +(?P<code3>[\w\*\(\>\)\!]+))?$')
+        p2 = regex_engine.compile(r'^(?P<code1>[\w](\*)*)\s*(?P<code2>\S+)? +(?P<network>\S+) +'
+                                  r'\[(?P<route_preference>\d+)\/(?P<metric>\d+)\] +via +'
+                                  r'(?P<next_hop>\S+)( +\(nexthop +in +vrf +\w+\))?,'
+                                  r'( +(?P<date>[\w:]+),?)?( +(?P<interface>[\w\/\.\-]+))?'
+                                  r'( +(?P<code3>[\w\*\(\>\)\!]+))?$')
 
         # [90/15360] via 10.23.90.3, 1w0d, GigabitEthernet0/0/0/1.90
         # [110/2] via 10.1.2.1, 01:50:49, GigabitEthernet0/0/0/3
         # [110/2] via 10.1.3.1, 3w3d
-        p3 = re.compile(r'^\[(?P<route_preference>\d+)\/(?P<metric>\d+)\] +'
-                        r'via +(?P<next_hop>\S+)( +\(nexthop +in +vrf +\w+\))?,'
-                        r'( +(?P<date>[\w:]+))?,?( +(?P<interface>[\w\/\.\-]+))?$')
+        p3 = regex_engine.compile(r'^\[(?P<route_preference>\d+)\/(?P<metric>\d+)\] +'
+                                  r'via +(?P<next_hop>\S+)( +\(nexthop +in +vrf +\w+\))?,'
+                                  r'( +(?P<date>[\w:]+))?,?( +(?P<interface>[\w\/\.\-]+))?$')
 
         # L    10.16.2.2/32 is directly connected, 3w5d, Loopback0
         # is directly connected, 01:51:13, GigabitEthernet0/0/0/3
         # S    10.4.1.1/32 is directly connected, 01:51:13, GigabitEthernet0/0/0/0
         # S 10.2.2.2/32 is directly connected, 00:06:36, Null0
-        p4 = re.compile(r'^((?P<code1>[\w])\s*(?P<code2>\S+)?(\s+'
-                        r'(?P<network>\S+)\s+))?(is\s+directly\s+connected,\s+'
-                        r'(?P<date>[\w:]+))?,?\s+(?P<interface>[\w\/\.\-]+)?$')
+        p4 = regex_engine.compile(r'^((?P<code1>[\w])\s*(?P<code2>\S+)?(\s+'
+                                  r'(?P<network>\S+)\s+))?(is\s+directly\s+connected,\s+'
+                                  r'(?P<date>[\w:]+))?,?\s+(?P<interface>[\w\/\.\-]+)?$')
 
         # Routing entry for 10.151.0.0/24, 1 known subnets
         # Routing entry for 0.0.0.0/0, supernet
         # Routing entry for 192.168.154.0/24
-        p5 = re.compile(r'^Routing +entry +for +(?P<network>(?P<ip>[\w\:\.]+)'
-                        r'\/(?P<mask>\d+))(?:, +(?P<net>[\w\s]+))?$')
+        p5 = regex_engine.compile(r'^Routing +entry +for +(?P<network>(?P<ip>[\w\:\.]+)'
+                                  r'\/(?P<mask>\d+))(?:, +(?P<net>[\w\s]+))?$')
         
         # Known via "connected", distance 0, metric 0 (connected)
         # Known via "eigrp 1", distance 130, metric 10880, type internal
         # Known via "bgp 65161", distance 20, metric 0, candidate default path
         # Known via "ospf 3", distance 110, metric 32001, type extern 1
         # Known via "isis RAN", distance 115, metric 101, candidate default path, type level-2
-        p6 = re.compile(r'^Known +via +"(?P<known_via>[\w ]+)", +distance +(?P<distance>\d+), +metric +(?P<metric>\d+)'
-                        r'( \(connected\))?(, +candidate +default +path)?(, +type +(?P<type>.+))?$')
+        p6 = regex_engine.compile(r'^Known +via +"(?P<known_via>[\w ]+)", +distance +(?P<distance>\d+), +metric +(?P<metric>\d+)'
+                                  r'( \(connected\))?(, +candidate +default +path)?(, +type +(?P<type>.+))?$')
 
         # * directly connected, via GigabitEthernet1.120
-        p7 = re.compile(r'^(\* +)?directly +connected, via +(?P<interface>\S+)$')
+        p7 = regex_engine.compile(r'^(\* +)?directly +connected, via +(?P<interface>\S+)$')
         
         # Route metric is 10880, traffic share count is 1
         # Route metric is 0, Wt is 1
-        p8 = re.compile(r'^Route +metric +is +(?P<metric>\d+)(, +'
-                        r'traffic +share +count +is +(?P<share_count>\d+))?'
-                        r'(, +Wt +is +\d+)?$')
+        p8 = regex_engine.compile(r'^Route +metric +is +(?P<metric>\d+)(, +'
+                                  r'traffic +share +count +is +(?P<share_count>\d+))?'
+                                  r'(, +Wt +is +\d+)?$')
 
         # eigrp/100 (protoid=5, clientid=22)
-        p9 = re.compile(r'^(?P<redist_advertiser>\S+) +\(protoid=(?P<protoid>\d+)'
-                        r', +clientid=(?P<clientid>\d+)\)$')
+        p9 = regex_engine.compile(r'^(?P<redist_advertiser>\S+) +\(protoid=(?P<protoid>\d+)'
+                                  r', +clientid=(?P<clientid>\d+)\)$')
         
         # Installed Oct 23 22:09:38.380 for 5d21h
-        p10 = re.compile(r'^Installed +(?P<date>[\S\s]+) +for +(?P<for>\S+)$')
+        p10 = regex_engine.compile(r'^Installed +(?P<date>[\S\s]+) +for +(?P<for>\S+)$')
 
         # 10.12.90.1, from 10.12.90.1, via GigabitEthernet0/0/0/0.90
         # 172.23.6.96, from 172.23.15.196
@@ -771,50 +774,50 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
         # 2001:10::1, via GigabitEthernet0/0/0/0
         # 100.72.21.206, from 116.119.10.251, via Bundle-Ether104, Protected
         # 100.72.21.209, from 116.119.10.251, via Bundle-Ether105, Backup (Local-LFA)
-        p11 = re.compile(r'^(?P<nexthop>[\w.:]+)(,\s+from\s+(?P<from>\S+))?(, '
-                         r'+via\s+(?P<interface>\S+))?'
-                         r'(, +(BGP external|Protected|Backup \(Local-LFA\)))?$')
+        p11 = regex_engine.compile(r'^(?P<nexthop>[\w.:]+)(,\s+from\s+(?P<from>\S+))?(, '
+                                   r'+via\s+(?P<interface>\S+))?'
+                                   r'(, +(BGP external|Protected|Backup \(Local-LFA\)))?$')
         
         # R2_xrv#show route ipv4
         # Routing Descriptor Blocks
         # No advertising protos.
-        p12 = re.compile(r'^((\S+#)?(show +route))|(Routing +Descriptor +'
-                r'Blocks)|(No +advertising +protos\.)|(Redist +Advertisers:)')
+        p12 = regex_engine.compile(r'^((\S+#)?(show +route))|(Routing +Descriptor +'
+                          r'Blocks)|(No +advertising +protos\.)|(Redist +Advertisers:)')
         
         # Tag 10584, type internal
-        p13 = re.compile(r'^Tag\s+(?P<tag>\d+)\,\s+type\s+(?P<type>\w+)$')
+        p13 = regex_engine.compile(r'^Tag\s+(?P<tag>\d+)\,\s+type\s+(?P<type>\w+)$')
 
         # Nexthop in Vrf: "default", Table: "default", IPv4 Unicast, Table Id: 0xe0000000
-        p14 = re.compile(r'^Nexthop\s+in\s+[V|v]rf\:\s+\"(?P<interface>\w+)\"\, '
-                         r'+[T|t]able\:\s+\"(?P<table>\w+)\"\, '
-                         r'+(?P<address_family>[\w\s]+)\,\s+[T|t]able '
-                         r'+[I|i]d\:\s+(?P<table_id>\S+)$')
+        p14 = regex_engine.compile(r'^Nexthop\s+in\s+[V|v]rf\:\s+\"(?P<interface>\w+)\"\, '
+                                   r'+[T|t]able\:\s+\"(?P<table>\w+)\"\, '
+                                   r'+(?P<address_family>[\w\s]+)\,\s+[T|t]able '
+                                   r'+[I|i]d\:\s+(?P<table_id>\S+)$')
 
         # Gateway of last resort is 172.16.0.88 to network 0.0.0.0
-        p15 = re.compile(r'^Gateway +of +last +resort +is '
-                         r'+(?P<gateway>(not +set)|\S+)( +to +network '
-                         r'+(?P<to_network>\S+))?$')
+        p15 = regex_engine.compile(r'^Gateway +of +last +resort +is '
+                                   r'+(?P<gateway>(not +set)|\S+)( +to +network '
+                                   r'+(?P<to_network>\S+))?$')
 
         # Label: None
-        p16 = re.compile(r'^Label:\s+(?P<label>\S+)$')
+        p16 = regex_engine.compile(r'^Label:\s+(?P<label>\S+)$')
 
         # Tunnel ID: None
-        p17 = re.compile(r'^Tunnel\s+ID:\s+(?P<tunnel_id>\S+)$')
+        p17 = regex_engine.compile(r'^Tunnel\s+ID:\s+(?P<tunnel_id>\S+)$')
 
         # Binding Label: None
-        p18 = re.compile(r'^Binding\s+Label:\s+(?P<binding_label>\S+)$')
+        p18 = regex_engine.compile(r'^Binding\s+Label:\s+(?P<binding_label>\S+)$')
 
         # Extended communities count: 0
-        p19 = re.compile(r'^Extended\s+communities\s+count:\s+(?P<extended_communites_count>\d+)$')
+        p19 = regex_engine.compile(r'^Extended\s+communities\s+count:\s+(?P<extended_communites_count>\d+)$')
 
         # NHID:0x0(Ref:0)
-        p20 = re.compile(r'^NHID:(?P<nhid>\S+)$')
+        p20 = regex_engine.compile(r'^NHID:(?P<nhid>\S+)$')
 
         # Path Grouping ID: 100
-        p21 = re.compile(r'^Path\s+Grouping\s+ID:\s+(?P<path_grouping_id>\d+)$')
+        p21 = regex_engine.compile(r'^Path\s+Grouping\s+ID:\s+(?P<path_grouping_id>\d+)$')
 
         # SRv6 Headend: H.Encaps.Red [f3216], SID-list {fc00:c000:1002:e002::}
-        p22 = re.compile(r'^SRv6\s+Headend:\s+(?P<srv6_headend>(.*)),\s+SID-list\s+{(?P<sid_list>[\w:]+)}$')
+        p22 = regex_engine.compile(r'^SRv6\s+Headend:\s+(?P<srv6_headend>(.*)),\s+SID-list\s+{(?P<sid_list>[\w:]+)}$')
 
         # initial variables
         ret_dict = {}
@@ -1299,7 +1302,7 @@ class ShowRouteIpv6(ShowRouteIpv4Schema):
 
         # VRF: VRF501
         # VRF: L:123
-        p1 = re.compile(r'^\s*VRF: +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^\s*VRF: +(?P<vrf>\S+)$')
 
         # S    2001:1:1:1::1/128
         # S    2001:1:1:a::1/128
@@ -1310,88 +1313,88 @@ class ShowRouteIpv6(ShowRouteIpv4Schema):
         # a*   ::/0
         # L    fc00:c000:1001::/48, SRv6 Endpoint uN (shift)
         # L    fc00:c000:1001::/64, SRv6 Endpoint uN (PSP/USD)
-        p2 = re.compile(r'^((?P<code1>[\w](\*)*)(\s*)?(?P<code2>\w+)? '
-                        r'+(?P<network>([\d:.\/a-f]+)))?\,?\s*(is +directly +connected)?'
-                        r'\,?( +SRv6 +Endpoint (?P<behaviour>[\w \/\(\)]+))?$')
+        p2 = regex_engine.compile(r'^((?P<code1>[\w](\*)*)(\s*)?(?P<code2>\w+)? '
+                                  r'+(?P<network>([\d:.\/a-f]+)))?\,?\s*(is +directly +connected)?'
+                                  r'\,?( +SRv6 +Endpoint (?P<behaviour>[\w \/\(\)]+))?$')
 
         # [1/0] via 2001:20:1:2::1, 01:52:23, GigabitEthernet0/0/0/0
         # [200/0] via 2001:13:13:13::13, 00:53:22
         # [0/0] via ::, 5w2d
         # [0/0] via ::ffff:0.0.0.0 (nexthop in vrf SRV6_L3VPN_BE), 23:09:19
         # [0/0] via :: (nexthop in vrf SRV6_L3VPN_BE), 23:09:19
-        p3 = re.compile(r'^\[(?P<route_preference>\d+)\/(?P<metric>\d+)\] +'
-                        r'via +(?P<next_hop>\S+)( +\(nexthop +in +vrf +(?P<nexthop_in_vrf>\w+)\))?,'
-                        r'( +(?P<date>[\w:]+))?,?( +(?P<interface>[\w\/\.\-]+))?$')
+        p3 = regex_engine.compile(r'^\[(?P<route_preference>\d+)\/(?P<metric>\d+)\] +'
+                                  r'via +(?P<next_hop>\S+)( +\(nexthop +in +vrf +(?P<nexthop_in_vrf>\w+)\))?,'
+                                  r'( +(?P<date>[\w:]+))?,?( +(?P<interface>[\w\/\.\-]+))?$')
 
         # 01:52:24, Loopback0
-        p5 = re.compile(r'^(?P<date>[\w+:]+), +(?P<interface>\S+)$')
+        p5 = regex_engine.compile(r'^(?P<date>[\w+:]+), +(?P<interface>\S+)$')
 
         # Routing entry for 2001:1:1:1::1/128, 1 known subnets
         # Routing entry for 2001:1:1:1::1/128, supernet
         # Routing entry for 2001:1:1:1::1/128
         # Routing entry for 2001:1:1:a::1/128
-        p6 = re.compile(r'^Routing +entry +for +(?P<network>(?P<ip>[\w\:\.]+)'
-                        r'\/(?P<mask>\d+))(?:, +(?P<net>[\w\s]+))?$')
+        p6 = regex_engine.compile(r'^Routing +entry +for +(?P<network>(?P<ip>[\w\:\.]+)'
+                                  r'\/(?P<mask>\d+))(?:, +(?P<net>[\w\s]+))?$')
 
         # Known via "connected", distance 0, metric 0 (connected)
         # Known via "eigrp 1", distance 130, metric 10880, type internal
         # Known via "bgp 65161", distance 20, metric 0, candidate default path
-        p7 = re.compile(r'^Known +via +\"(?P<known_via>[\w ]+)\", +'
-                        r'distance +(?P<distance>\d+), +metric +(?P<metric>\d+)'
-                        r'( \(connected\))?(, +type +(?P<type>\S+))?(, +candidate +'
-                        r'default +path)?$')
+        p7 = regex_engine.compile(r'^Known +via +\"(?P<known_via>[\w ]+)\", +'
+                                  r'distance +(?P<distance>\d+), +metric +(?P<metric>\d+)'
+                                  r'( \(connected\))?(, +type +(?P<type>\S+))?(, +candidate +'
+                                  r'default +path)?$')
 
         # * directly connected, via GigabitEthernet1.120
-        p8 = re.compile(r'^(\* +)?directly +connected, via +(?P<interface>\S+)$')
+        p8 = regex_engine.compile(r'^(\* +)?directly +connected, via +(?P<interface>\S+)$')
 
         # Route metric is 10880, traffic share count is 1
-        p9 = re.compile(r'^Route +metric +is +(?P<metric>\d+)(, +'
-                        r'traffic +share +count +is +(?P<share_count>\d+))?'
-                        r'(, +Wt +is +\d+)?$')
+        p9 = regex_engine.compile(r'^Route +metric +is +(?P<metric>\d+)(, +'
+                                  r'traffic +share +count +is +(?P<share_count>\d+))?'
+                                  r'(, +Wt +is +\d+)?$')
 
         # eigrp/100 (protoid=5, clientid=22)
-        p10 = re.compile(r'^(?P<redist_advertiser>\S+) +\(protoid=(?P<protoid>\d+)'
-                         r', +clientid=(?P<clientid>\d+)\)$')
+        p10 = regex_engine.compile(r'^(?P<redist_advertiser>\S+) +\(protoid=(?P<protoid>\d+)'
+                                   r', +clientid=(?P<clientid>\d+)\)$')
 
         # Installed Oct 23 22:09:38.380 for 5d21h
-        p11 = re.compile(r'^Installed +(?P<date>[\S\s]+) +for +(?P<for>\S+)$')
+        p11 = regex_engine.compile(r'^Installed +(?P<date>[\S\s]+) +for +(?P<for>\S+)$')
 
         # fe80::f816:3eff:fe76:b56d, from fe80::f816:3eff:fe76:b56d, via GigabitEthernet0/0/0/0.390
         # ::ffff:50.1.1.1, from ::ffff:50.1.1.8
-        p12 = re.compile(r'^(?P<nexthop>\S+)(, from +(?P<from>\S+))(?:, '
-                         r'+via +(?P<interface>\S+))?$')
+        p12 = regex_engine.compile(r'^(?P<nexthop>\S+)(, from +(?P<from>\S+))(?:, '
+                                   r'+via +(?P<interface>\S+))?$')
 
         # R2_xrv#show route ipv6
-        p13 = re.compile(r'^((\S+#)?(show +route))|(Routing +Descriptor +'
-                         r'Blocks)|(No +advertising +protos\.)|(Redist +Advertisers:)')
+        p13 = regex_engine.compile(r'^((\S+#)?(show +route))|(Routing +Descriptor +'
+                                   r'Blocks)|(No +advertising +protos\.)|(Redist +Advertisers:)')
 
         # Gateway of last resort is fe80::10ff:fe04:209e to network ::
         # Gateway of last resort is not set
         # Gateway of last resort is 10.50.15.1 to network 0.0.0.0
-        p14 = re.compile(r'^Gateway +of +last +resort +is '
-                         r'+(?P<gateway>(not +set)|\S+)( +to +network '
-                         r'+(?P<to_network>\S+))?$')
+        p14 = regex_engine.compile(r'^Gateway +of +last +resort +is '
+                                   r'+(?P<gateway>(not +set)|\S+)( +to +network '
+                                   r'+(?P<to_network>\S+))?$')
 
         # Label: None
-        p15 = re.compile(r'^Label:\s+(?P<label>\S+)$')
+        p15 = regex_engine.compile(r'^Label:\s+(?P<label>\S+)$')
 
         # Tunnel ID: None
-        p16 = re.compile(r'^Tunnel\s+ID:\s+(?P<tunnel_id>\S+)$')
+        p16 = regex_engine.compile(r'^Tunnel\s+ID:\s+(?P<tunnel_id>\S+)$')
 
         # Binding Label: None
-        p17 = re.compile(r'^Binding\s+Label:\s+(?P<binding_label>\S+)$')
+        p17 = regex_engine.compile(r'^Binding\s+Label:\s+(?P<binding_label>\S+)$')
 
         # Extended communities count: 0
-        p18 = re.compile(r'^Extended\s+communities\s+count:\s+(?P<extended_communites_count>\d+)$')
+        p18 = regex_engine.compile(r'^Extended\s+communities\s+count:\s+(?P<extended_communites_count>\d+)$')
 
         # NHID:0x0(Ref:0)
-        p19 = re.compile(r'^NHID:(?P<nhid>\S+)$')
+        p19 = regex_engine.compile(r'^NHID:(?P<nhid>\S+)$')
 
         # Path Grouping ID: 100
-        p20 = re.compile(r'^Path\s+Grouping\s+ID:\s+(?P<path_grouping_id>\d+)$')
+        p20 = regex_engine.compile(r'^Path\s+Grouping\s+ID:\s+(?P<path_grouping_id>\d+)$')
 
         # SRv6 Headend: H.Encaps.Red [f3216], SID-list {fc00:c000:1002:e003::}
-        p21 = re.compile(r'^SRv6\s+Headend:\s+(?P<srv6_headend>(.*)),\s+SID-list\s+{(?P<sid_list>[\w:]+)}$')
+        p21 = regex_engine.compile(r'^SRv6\s+Headend:\s+(?P<srv6_headend>(.*)),\s+SID-list\s+{(?P<sid_list>[\w:]+)}$')
 
         ret_dict = {}
         outgoing_interface_dict = {}
@@ -1776,11 +1779,11 @@ class ShowRouteAllSummary(ShowRouteAllSummarySchema):
             out = output
 
         # VRF: VRF_NAME
-        p1 = re.compile(r'^VRF: (?P<vrf>.*)')
+        p1 = regex_engine.compile(r'^VRF: (?P<vrf>.*)')
         # IPv4 Unicast:
-        p2 = re.compile(r'(?P<address_family>^IPv.*)+:')
+        p2 = regex_engine.compile(r'(?P<address_family>^IPv.*)+:')
         # connected                        0          0          0           0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<protocol>[a-zA-Z0-9(\-|\_)]+) +(?P<instance>[a-zA-Z0-9\.(\-|\_)]+)* * +('
             r'?P<routes>\d+) +(?P<backup>\d+) +(?P<deleted>\d+) +(?P<memory_bytes>\d+)')
 
@@ -1882,7 +1885,7 @@ class ShowRouteSummary(ShowRouteSummarySchema):
         # application fib_mgr              0          0          0           0            
         # Total                            14         2          0           3456 
         
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<protocol>[a-zA-Z0-9(\-|\_)]+) +(?P<instance>[a-zA-Z0-9\.(\-|\_)]+)* * +('
             r'?P<routes>\d+) +(?P<backup>\d+) +(?P<deleted>\d+) +(?P<memory_bytes>\d+)')
 
@@ -6,6 +6,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowRplRoutePolicySchema(MetaParser):
     """Schema for show rpl route-policy"""
@@ -93,7 +96,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
 
             # route-policy test
 
-            p1 = re.compile(r'^\s*route-policy +(?P<name>[\w\W\s]+)$')
+            p1 = regex_engine.compile(r'^\s*route-policy +(?P<name>[\w\W\s]+)$')
             m = p1.match(line)
             if m:
                 name = str(m.groupdict()['name'])
@@ -123,7 +126,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                     rpl_route_policy_dict[name]['statements'][statements]['conditions'] = {}
 
             # test
-            p1_1 = re.compile(r'^\s*# *(?P<description>[a-zA-Z\W]+)$')
+            p1_1 = regex_engine.compile(r'^\s*# *(?P<description>[a-zA-Z\W]+)$')
             m = p1_1.match(line)
             if m:
                 description = str(m.groupdict()['description'])
@@ -132,7 +135,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # 36
-            p1_2 = re.compile(r'^\s*# *(?P<statements>[0-9]+)$')
+            p1_2 = regex_engine.compile(r'^\s*# *(?P<statements>[0-9]+)$')
             m = p1_2.match(line)
             if m:
 
@@ -151,7 +154,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set med 113
-            p2 = re.compile(r'^\s*set +med +(?P<set_med>[0-9]+)$')
+            p2 = regex_engine.compile(r'^\s*set +med +(?P<set_med>[0-9]+)$')
             m = p2.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -159,7 +162,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set origin egp
-            p3 = re.compile(r'^\s*set +origin +(?P<set_route_origin>[a-z]+)$')
+            p3 = regex_engine.compile(r'^\s*set +origin +(?P<set_route_origin>[a-z]+)$')
             m = p3.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -167,7 +170,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set local-preference 100
-            p4 = re.compile(r'^\s*set +local-preference +(?P<set_local_pref>[0-9]+)$')
+            p4 = regex_engine.compile(r'^\s*set +local-preference +(?P<set_local_pref>[0-9]+)$')
             m = p4.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -175,7 +178,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set next-hop 10.4.1.1
-            p5 = re.compile(r'^\s*set +next-hop +(?P<set_next_hop>[0-9\.]+)$')
+            p5 = regex_engine.compile(r'^\s*set +next-hop +(?P<set_next_hop>[0-9\.]+)$')
             m = p5.match(line)
             if m:
                 set_next_hop = m.groupdict()['set_next_hop']
@@ -184,7 +187,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set next-hop self
-            p5_1 = re.compile(r'^\s*(?P<set_next_hop_self>(self))$')
+            p5_1 = regex_engine.compile(r'^\s*(?P<set_next_hop_self>(self))$')
             m = p5_1.match(line)
             if m:
                 set_next_hop_self = m.groupdict()['set_next_hop_self']
@@ -193,8 +196,8 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # prepend as-path 100 10
-            p6 = re.compile(r'\s*prepend +as-path +(?P<set_as_path_prepend>[0-9]+)'
-                            r' *(?P<set_as_path_prepend_repeat_n>[0-9]+)$')
+            p6 = regex_engine.compile(r'\s*prepend +as-path +(?P<set_as_path_prepend>[0-9]+)'
+                                      r' *(?P<set_as_path_prepend_repeat_n>[0-9]+)$')
             m = p6.match(line)
             if m:
                 set_as_path_prepend = int(m.groupdict()['set_as_path_prepend'])
@@ -207,7 +210,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set community test
-            p7 = re.compile(r'^\s*set +community +(?P<set_community_list>\S+)$')
+            p7 = regex_engine.compile(r'^\s*set +community +(?P<set_community_list>\S+)$')
             m = p7.match(line)
             if m:
                 set_community_list = m.groupdict()['set_community_list']
@@ -219,8 +222,8 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set community test additive
-            p7_1 = re.compile(r'^\s*set +community +(?P<set_community_list>\S+)'
-                              r' *(?P<set_community_additive>(additive))$')
+            p7_1 = regex_engine.compile(r'^\s*set +community +(?P<set_community_list>\S+)'
+                                        r' *(?P<set_community_additive>(additive))$')
             m = p7_1.match(line)
             if m:
                 set_community_list = m.groupdict()['set_community_list']
@@ -235,10 +238,10 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set community (100:100, no-export, no-advertise) additive
-            p8 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
-                            r' *(?P<set_community_no_export>(no-export)),'
-                            r' *(?P<set_community_no_advertise>(no-advertise))\)'
-                            r' *(?P<set_community_additive>(additive))$')
+            p8 = regex_engine.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
+                                      r' *(?P<set_community_no_export>(no-export)),'
+                                      r' *(?P<set_community_no_advertise>(no-advertise))\)'
+                                      r' *(?P<set_community_additive>(additive))$')
             m = p8.match(line)
             if m:
                 set_community_no_export = m.groupdict()['set_community_no_export']
@@ -259,9 +262,9 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             #  set community (111:1, 222:1, no-advertise) additive
-            p8_1 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
-                              r' *(?P<set_community_no_advertise>(no-advertise))\)'
-                              r'(?: *(?P<set_community_additive>(additive)))?$')
+            p8_1 = regex_engine.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
+                                        r' *(?P<set_community_no_advertise>(no-advertise))\)'
+                                        r'(?: *(?P<set_community_additive>(additive)))?$')
             m = p8_1.match(line)
             if m:
                 set_community_no_advertise = m.groupdict()['set_community_no_advertise']
@@ -279,9 +282,9 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set community (100:100, no-export) additive
-            p8_2 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
-                              r' *(?P<set_community_no_export>(no-export))\)'
-                              r'(?: *(?P<set_community_additive>(additive)))?$')
+            p8_2 = regex_engine.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
+                                        r' *(?P<set_community_no_export>(no-export))\)'
+                                        r'(?: *(?P<set_community_additive>(additive)))?$')
             m = p8_2.match(line)
             if m:
                 set_community_no_export = m.groupdict()['set_community_no_export']
@@ -299,9 +302,9 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set community (100:1, 200:1, 300:1, no-export, no-advertise)
-            p8_3 = re.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
-                              r' *(?P<set_community_no_export>(no-export)),'
-                              r' *(?P<set_community_no_advertise>(no-advertise))\)$')
+            p8_3 = regex_engine.compile(r'^\s*set +community +\((?P<set_community>[0-9\:\s\,]+),'
+                                        r' *(?P<set_community_no_export>(no-export)),'
+                                        r' *(?P<set_community_no_advertise>(no-advertise))\)$')
             m = p8_3.match(line)
             if m:
                 set_community_no_export = m.groupdict()['set_community_no_export']
@@ -319,10 +322,10 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set community (100:100, no-export, no-advertise) additive
-            p8_4 = re.compile(r'^\s*set +community +\((?:(?P<set_community>[0-9\:\s\,]+),)?'
-                              r'(?: *(?P<set_community_no_export>(no-export)),)?'
-                              r'(?: *(?P<set_community_no_advertise>(no-advertise)))?\)'
-                              r'(?: *(?P<set_community_additive>(additive)))?$')
+            p8_4 = regex_engine.compile(r'^\s*set +community +\((?:(?P<set_community>[0-9\:\s\,]+),)?'
+                                        r'(?: *(?P<set_community_no_export>(no-export)),)?'
+                                        r'(?: *(?P<set_community_no_advertise>(no-advertise)))?\)'
+                                        r'(?: *(?P<set_community_additive>(additive)))?$')
             m = p8_4.match(line)
             if m:
                 set_community_no_export = m.groupdict()['set_community_no_export']
@@ -343,8 +346,8 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # delete community in test
-            p9 = re.compile(r'^\s*delete +community *in'
-                            r' *(?P<set_community_delete>[a-zA-Z]+)$')
+            p9 = regex_engine.compile(r'^\s*delete +community *in'
+                                      r' *(?P<set_community_delete>[a-zA-Z]+)$')
             m = p9.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -353,9 +356,9 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
 
             # set extcommunity rt (100:100, 200:200) additive
             # set extcommunity rt (300:1, 300:2) additive
-            p10 = re.compile(r'^\s*set +extcommunity +rt'
-                             r' *\((?P<set_ext_community_rt>[0-9\:\,\s]+)\)(?:'
-                             r' *(?P<set_ext_community_rt_additive>(additive)))?$')
+            p10 = regex_engine.compile(r'^\s*set +extcommunity +rt'
+                                       r' *\((?P<set_ext_community_rt>[0-9\:\,\s]+)\)(?:'
+                                       r' *(?P<set_ext_community_rt_additive>(additive)))?$')
             m = p10.match(line)
             if m:
                 set_ext_community_rt_additive = m.groupdict()['set_ext_community_rt_additive']
@@ -370,9 +373,9 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set extcommunity soo (100:100) additive
-            p11 = re.compile(r'^\s*set extcommunity +soo'
-                             r' +\((?P<set_ext_community_soo>[0-9\:]+)\)(?:'
-                             r' *(?P<set_ext_community_soo_additive>(additive)))?$')
+            p11 = regex_engine.compile(r'^\s*set extcommunity +soo'
+                                       r' +\((?P<set_ext_community_soo>[0-9\:]+)\)(?:'
+                                       r' *(?P<set_ext_community_soo_additive>(additive)))?$')
             m = p11.match(line)
             if m:
                 set_ext_community_soo_additive = m.groupdict()['set_ext_community_soo_additive']
@@ -384,8 +387,8 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # delete extcommunity rt in test
-            p12 = re.compile(r'^\s*delete +extcommunity +rt *in'
-                             r' +(?P<set_ext_community_delete>[a-z]+)$')
+            p12 = regex_engine.compile(r'^\s*delete +extcommunity +rt *in'
+                                       r' +(?P<set_ext_community_delete>[a-z]+)$')
             m = p12.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -395,7 +398,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
             # set level level-1
             # set level level-2
             # set level level-1-2
-            p13 = re.compile(r'^\s*set +level +(?P<set_level>[a-z0-9\-]+)$')
+            p13 = regex_engine.compile(r'^\s*set +level +(?P<set_level>[a-z0-9\-]+)$')
             m = p13.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -404,7 +407,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
 
             # set metric-type internal
             # set metric-type external
-            p14 = re.compile(r'^\s*set +metric-type +(?P<set_metric_type>[a-z0-9\-]+)$')
+            p14 = regex_engine.compile(r'^\s*set +metric-type +(?P<set_metric_type>[a-z0-9\-]+)$')
             m = p14.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -412,7 +415,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set isis-metric 100
-            p15 = re.compile(r'^\s*set +isis-metric +(?P<set_metric>[0-9]+)$')
+            p15 = regex_engine.compile(r'^\s*set +isis-metric +(?P<set_metric>[0-9]+)$')
             m = p15.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -420,7 +423,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set ospf-metric 100
-            p16 = re.compile(r'^\s*set +ospf-metric +(?P<set_ospf_metric>[0-9]+)$')
+            p16 = regex_engine.compile(r'^\s*set +ospf-metric +(?P<set_ospf_metric>[0-9]+)$')
             m = p16.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -428,7 +431,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set weight 111
-            p16_1 = re.compile(r'^\s*set +weight +(?P<set_weight>[0-9\s]+)$')
+            p16_1 = regex_engine.compile(r'^\s*set +weight +(?P<set_weight>[0-9\s]+)$')
             m = p16_1.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -436,7 +439,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set tag 111
-            p17 = re.compile(r'^\s*set +tag +(?P<set_tag>[0-9\s]+)$')
+            p17 = regex_engine.compile(r'^\s*set +tag +(?P<set_tag>[0-9\s]+)$')
             m = p17.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -444,7 +447,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # set spf-priority medium
-            p20 = re.compile(r'^\s*set +spf-priority +(?P<spf_priority>[a-z]+)$')
+            p20 = regex_engine.compile(r'^\s*set +spf-priority +(?P<spf_priority>[a-z]+)$')
             m = p20.match(line)
             if m:
                 rpl_route_policy_dict[name]['statements'][statements]['actions'] \
@@ -452,7 +455,7 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
                 continue
 
             # pass|done|drop
-            p18 = re.compile(r'^\s*(?P<actions>(pass|done|drop))$')
+            p18 = regex_engine.compile(r'^\s*(?P<actions>(pass|done|drop))$')
             m = p18.match(line)
             if m:
                 actions = m.groupdict()['actions']
@@ -463,11 +466,11 @@ class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
 
             # if med eq 100 and local-preference eq 100 and ospf-area is 0 then
             # m.groupdict()[cond] == None - set to none if there is no parsed condition
-            p19 = re.compile(r'^\s*(if|elseif|else) *(?P<condition1>\S+ \S+ \S+)'
-                             r'( *and)?(?: *(?P<condition2>\S+ \S+ \S+))?( *and)?'
-                             r'(?: *(?P<condition3>\S+ \S+ \S+))?( *and)?(?:'
-                             r' *(?P<condition4>\S+ \S+ \S+))?( *and)?(?:'
-                             r' *(?P<condition5>\S+ \S+ \S+))? *then$')
+            p19 = regex_engine.compile(r'^\s*(if|elseif|else) *(?P<condition1>\S+ \S+ \S+)'
+                                       r'( *and)?(?: *(?P<condition2>\S+ \S+ \S+))?( *and)?'
+                                       r'(?: *(?P<condition3>\S+ \S+ \S+))?( *and)?(?:'
+                                       r' *(?P<condition4>\S+ \S+ \S+))?( *and)?(?:'
+                                       r' *(?P<condition5>\S+ \S+ \S+))? *then$')
             m = p19.match(line)
             if m:
                 for cond in m.groupdict().keys():
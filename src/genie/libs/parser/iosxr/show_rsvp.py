@@ -9,11 +9,11 @@ IOSXR parsers for the following commands:
     * show rsvp session detail
     * show rsvp session destination {ip_address} detail dst-port {tunnel_id}
 """
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -65,10 +65,10 @@ class ShowRSVPSession(ShowRSVPSessionSchema):
         ret_dict = {}
 
         # LSP4     17.17.17.17 15060 141.141.141.141     1     1     1
-        p1 = re.compile(r'^(?P<type>\S+)\s+(?P<destination_address>\d{1,3}\.\d{1,3}'
-                        r'\.\d{1,3}\.\d{1,3})\s+(?P<d_port>\d+)\s+'
-                        r'(?P<proto_exttun_id>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
-                        r'(?P<psb>\d+)\s+(?P<rsb>\d+)\s+(?P<req>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<type>\S+)\s+(?P<destination_address>\d{1,3}\.\d{1,3}'
+                                  r'\.\d{1,3}\.\d{1,3})\s+(?P<d_port>\d+)\s+'
+                                  r'(?P<proto_exttun_id>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+                                  r'(?P<psb>\d+)\s+(?P<rsb>\d+)\s+(?P<req>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -129,11 +129,11 @@ class ShowRSVPNeighbor(ShowRSVPNeighborSchema):
         ret_dict = {}
 
         # Global Neighbor: 106.106.106.106
-        p1 = re.compile(r'^Global +Neighbor:\s+(?P<global_neighbor>.+)$')
+        p1 = regex_engine.compile(r'^Global +Neighbor:\s+(?P<global_neighbor>.+)$')
 
         # 99.33.0.2            TenGigE0/2/0/0
-        p2 = re.compile(r'^(?P<intf_neighbor>\d{1,3}\.\d{1,3}\.'
-                        r'\d{1,3}\.\d{1,3})\s+(?P<interface>.+)$')
+        p2 = regex_engine.compile(r'^(?P<intf_neighbor>\d{1,3}\.\d{1,3}\.'
+                                  r'\d{1,3}\.\d{1,3})\s+(?P<interface>.+)$')
 
 
         for line in out.splitlines():
@@ -216,9 +216,9 @@ class ShowRSVPGracefulRestartNeighbors(ShowRSVPGracefulRestartNeighborsSchema):
         ret_dict = {}
 
         # 106.106.106.106  MPLS    N/A     DONE          N/A                  N/A        0
-        p1 = re.compile(r'^(?P<neighbor>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
-                        r'(?P<app>\w+)\s+(?P<state>\S+)\s+(?P<recovery>\w+)\s+'
-                        r'(?P<reason>\S+)\s+(?P<since>\S+)\s+(?P<lost_cnt>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<neighbor>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+                                  r'(?P<app>\w+)\s+(?P<state>\S+)\s+(?P<recovery>\w+)\s+'
+                                  r'(?P<reason>\S+)\s+(?P<since>\S+)\s+(?P<lost_cnt>\d+)$')
 
 
         for line in out.splitlines():
@@ -258,35 +258,35 @@ class ShowRSVPGracefulRestartNeighborsDetail(ShowRSVPGracefulRestartNeighborsSch
         ret_dict = {}
 
         # Neighbor: 106.106.106.106 Source: 17.17.17.17 (MPLS)
-        p1 = re.compile(r'^Neighbor:\s+(?P<neighbor>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-                        r'\s+Source:\s+(?P<source>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-                        r'\s+\((?P<protocol>\w+)\)$')
+        p1 = regex_engine.compile(r'^Neighbor:\s+(?P<neighbor>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+                                  r'\s+Source:\s+(?P<source>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+                                  r'\s+\((?P<protocol>\w+)\)$')
 
         # Recovery State: DONE
-        p2 = re.compile(r'^Recovery +State:\s+(?P<recovery_state>\S+)$')
+        p2 = regex_engine.compile(r'^Recovery +State:\s+(?P<recovery_state>\S+)$')
 
         # Number of Interface neighbors: 1
-        p3 = re.compile(r'^Number +of +Interface +neighbors:\s+(?P<number_of_intf>\d+)$')
+        p3 = regex_engine.compile(r'^Number +of +Interface +neighbors:\s+(?P<number_of_intf>\d+)$')
 
         # address: 99.33.0.2
-        p4 =  re.compile(r'^address:\s+(?P<address>.+)$')
+        p4 =  regex_engine.compile(r'^address:\s+(?P<address>.+)$')
 
         # Restart time: 0 seconds  Recovery time: 0 seconds
-        p5 = re.compile(r'^Restart +time:\s+(?P<restart_time>\d+) +(?P<restart_time_unit>\w+)'
-                        r'\s+Recovery +time:\s+(?P<recovery_time>\d+) +(?P<recovery_time_unit>\w+)$')
+        p5 = regex_engine.compile(r'^Restart +time:\s+(?P<restart_time>\d+) +(?P<restart_time_unit>\w+)'
+                                  r'\s+Recovery +time:\s+(?P<recovery_time>\d+) +(?P<recovery_time_unit>\w+)$')
 
         # Restart timer: Not running
-        p6 = re.compile(r'^Restart +timer:\s+(?P<restart_time>.+)$')
+        p6 = regex_engine.compile(r'^Restart +timer:\s+(?P<restart_time>.+)$')
 
         # Recovery timer: Not running
-        p7 = re.compile(r'^Recovery +timer:\s+(?P<recovery_time>.+)$')
+        p7 = regex_engine.compile(r'^Recovery +timer:\s+(?P<recovery_time>.+)$')
 
         # Hello interval: 5000 milliseconds  Maximum allowed missed Hello messages: 3
-        p8 = re.compile(r'^Hello +interval:\s+(?P<hello_interval>\d+)\s+(?P<hello_interval_unit>\w+)'
-                        r'\s+Maximum +allowed +missed +Hello +messages:\s?(?P<max_allowed_msg>\d+)$')
+        p8 = regex_engine.compile(r'^Hello +interval:\s+(?P<hello_interval>\d+)\s+(?P<hello_interval_unit>\w+)'
+                                  r'\s+Maximum +allowed +missed +Hello +messages:\s?(?P<max_allowed_msg>\d+)$')
 
         # Pending states: 0
-        p9 = re.compile(r'^Pending +states:\s+(?P<pending_states>\d+)$')
+        p9 = regex_engine.compile(r'^Pending +states:\s+(?P<pending_states>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -490,59 +490,59 @@ class ShowRSVPSessionDetail(ShowRSVPSessionDetailSchema):
         rsvp_flag_dict = {}
 
         # SESSION: IPv4-LSP Addr: 17.17.17.17, TunID: 15060, ExtID: 141.141.141.141
-        p1 = re.compile(r'^SESSION:\s+(?P<session>\S+)\s+Addr:\s+(?P<address>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}),'
-                        r'\s+TunID:\s+(?P<tun_id>\d+),\s+ExtID:\s+(?P<ext_id>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$')
+        p1 = regex_engine.compile(r'^SESSION:\s+(?P<session>\S+)\s+Addr:\s+(?P<address>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}),'
+                                  r'\s+TunID:\s+(?P<tun_id>\d+),\s+ExtID:\s+(?P<ext_id>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$')
 
         # PSBs: 1, RSBs: 1, Requests: 1
-        p2 = re.compile(r'^PSBs:\s+(?P<psbs>\d+),\s+RSBs:\s+(?P<rsbs>\d+),\s+Requests:\s+(?P<requests>\d+)$')
+        p2 = regex_engine.compile(r'^PSBs:\s+(?P<psbs>\d+),\s+RSBs:\s+(?P<rsbs>\d+),\s+Requests:\s+(?P<requests>\d+)$')
 
         # LSPId: 5
-        p3 = re.compile(r'^LSPId:\s+(?P<lsp_id>\d+)$')
+        p3 = regex_engine.compile(r'^LSPId:\s+(?P<lsp_id>\d+)$')
 
         # Tunnel Name: NHOP_15060_F141-ASR9912_Hu0000_F17-ASR922_Hu0000
-        p4 = re.compile(r'^Tunnel +Name:\s+(?P<tunnel_name>.+)$')
+        p4 = regex_engine.compile(r'^Tunnel +Name:\s+(?P<tunnel_name>.+)$')
 
         # RSVP Path Info
-        p5 = re.compile(r'^RSVP Path Info:$')
+        p5 = regex_engine.compile(r'^RSVP Path Info:$')
 
         # InLabel: TenGigE0/2/0/0, 3
-        p6 = re.compile(r'^InLabel:\s+(?P<interface>.+),\s+(?P<label>.+)$')
+        p6 = regex_engine.compile(r'^InLabel:\s+(?P<interface>.+),\s+(?P<label>.+)$')
 
         # Incoming Address: 99.33.0.1
-        p7 = re.compile(r'^Incoming Address:\s+(?P<incoming_address>.+)$')
+        p7 = regex_engine.compile(r'^Incoming Address:\s+(?P<incoming_address>.+)$')
 
         # Explicit Route: None
-        p8 = re.compile(r'^Explicit Route:\s+(?P<explicit_route>.+)$')
+        p8 = regex_engine.compile(r'^Explicit Route:\s+(?P<explicit_route>.+)$')
 
         # Strict, 99.33.0.1/32
-        p8_1 = re.compile(r'^(?P<path_status>\S+),\s+(?P<route_address>.+)')
+        p8_1 = regex_engine.compile(r'^(?P<path_status>\S+),\s+(?P<route_address>.+)')
 
         # Record Route: None
-        p9 = re.compile(r'^Record Route:\s+(?P<record_route>.+)$')
+        p9 = regex_engine.compile(r'^Record Route:\s+(?P<record_route>.+)$')
 
         # IPv4 99.33.0.2, flags 0x0
-        p9_1 = re.compile(r'^IPv4\s+(?P<address>.+),\s+flags\s+(?P<flag>.+)$')
+        p9_1 = regex_engine.compile(r'^IPv4\s+(?P<address>.+),\s+flags\s+(?P<flag>.+)$')
 
         # Label 24023, flags 0x1
-        p9_2 = re.compile(r'^Label\s+(?P<label>.+),\s+flags\s+(?P<flag>.+)$')
+        p9_2 = regex_engine.compile(r'^Label\s+(?P<label>.+),\s+flags\s+(?P<flag>.+)$')
 
         # Tspec: avg rate=0, burst=1K, peak rate=0
-        p10 = re.compile(r'^Tspec: +avg +rate=(?P<avg_rate>\d+),\s+burst=(?P<burst>\d+)'
-                         r'(?P<burst_unit>\w+), +peak +rate=(?P<peak_rate>\d+)$')
+        p10 = regex_engine.compile(r'^Tspec: +avg +rate=(?P<avg_rate>\d+),\s+burst=(?P<burst>\d+)'
+                                   r'(?P<burst_unit>\w+), +peak +rate=(?P<peak_rate>\d+)$')
 
         # RSVP Resv Info:
-        p11 = re.compile(r'RSVP Resv Info:')
+        p11 = regex_engine.compile(r'RSVP Resv Info:')
 
         # OutLabel: No intf, No label
         # OutLabel: HundredGigE0/0/0/0, 24023
-        p12 = re.compile(r'^OutLabel:\s+(?P<interface>.+),\s+(?P<label>.+)$')
+        p12 = regex_engine.compile(r'^OutLabel:\s+(?P<interface>.+),\s+(?P<label>.+)$')
 
         # FRR OutLabel: tunnel-te53300, 3
-        p13 = re.compile(r'^FRR +OutLabel:\s+(?P<interface>.+),\s+(?P<label>.+)$')
+        p13 = regex_engine.compile(r'^FRR +OutLabel:\s+(?P<interface>.+),\s+(?P<label>.+)$')
 
         # Fspec: avg rate=0, burst=1K, peak rate=0
-        p14 = re.compile(r'^Fspec: +avg +rate=(?P<avg_rate>\d+),\s+burst=(?P<burst>\d+)'
-                         r'(?P<burst_unit>\w+), +peak +rate=(?P<peak_rate>\d+)$')
+        p14 = regex_engine.compile(r'^Fspec: +avg +rate=(?P<avg_rate>\d+),\s+burst=(?P<burst>\d+)'
+                                   r'(?P<burst_unit>\w+), +peak +rate=(?P<peak_rate>\d+)$')
 
 
         for line in out.splitlines():
@@ -8,13 +8,15 @@ IOSXR parsers for the following show commands:
 """
 
 # Python
-import re
 from collections import OrderedDict
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================
 # Schema for 'show run key chain'
@@ -55,25 +57,25 @@ class ShowRunKeyChain(ShowRunKeyChainSchema):
         ret_dict = {}
 
         # key chain ISIS-HELLO-CORE
-        p1 = re.compile(r'^key +chain +(?P<key_chain_name>.*)$')
+        p1 = regex_engine.compile(r'^key +chain +(?P<key_chain_name>.*)$')
 
         # key 1
-        p2 = re.compile(r'^key +(?P<key_name>(\w+))$')
+        p2 = regex_engine.compile(r'^key +(?P<key_name>(\w+))$')
 
         # accept-lifetime 00:01:00 january 01 2013 infinite
-        p3 = re.compile(r'^accept-lifetime +(?P<accept_lifetime>.*)$')
+        p3 = regex_engine.compile(r'^accept-lifetime +(?P<accept_lifetime>.*)$')
 
         # key-string password 020F175218
-        p4 = re.compile(r'^key-string +(?P<key_string>.*)$')
+        p4 = regex_engine.compile(r'^key-string +(?P<key_string>.*)$')
 
         # send-lifetime 00:01:00 january 01 2013 infinite
-        p5 = re.compile(r'^send-lifetime +(?P<send_lifetime>.*)$')
+        p5 = regex_engine.compile(r'^send-lifetime +(?P<send_lifetime>.*)$')
 
         # cryptographic-algorithm HMAC-MD5
-        p6 = re.compile(r'^cryptographic-algorithm +(?P<cryptographic_algorithm>.*)$')
+        p6 = regex_engine.compile(r'^cryptographic-algorithm +(?P<cryptographic_algorithm>.*)$')
 
         # accept-tolerance infinite
-        p7 = re.compile(r'^accept-tolerance +(?P<accept_tolerance>(\w+)) !$')
+        p7 = regex_engine.compile(r'^accept-tolerance +(?P<accept_tolerance>(\w+)) !$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -204,7 +206,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
         for line in out.splitlines():
             line = line.strip()
 
-            p0 = re.compile(r'^\s*!+\s*$')
+            p0 = regex_engine.compile(r'^\s*!+\s*$')
             m = p0.match(line)
             if m:
                 is_address_family = False
@@ -213,7 +215,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
             if is_address_family:
                 # fast-reroute per-prefix tiebreaker srlg-disjoint index 255
                 # fast-reroute per-prefix tiebreaker node-protecting index 100
-                a1 = re.compile(r'^\s*fast-reroute\sper-prefix\stiebreaker\s+(?P<key>\S+)\s+(?P<value>.+)$')
+                a1 = regex_engine.compile(r'^\s*fast-reroute\sper-prefix\stiebreaker\s+(?P<key>\S+)\s+(?P<value>.+)$')
                 m = a1.match(line)
                 if m:
                     if is_interface:
@@ -233,7 +235,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                     continue
                 
                 # mpls traffic-eng level-2-only
-                a2 = re.compile(r'^\s*mpls\straffic-eng\s+(?P<mpls_traffic_eng>.+)$')
+                a2 = regex_engine.compile(r'^\s*mpls\straffic-eng\s+(?P<mpls_traffic_eng>.+)$')
                 m = a2.match(line)
                 if m:
                     if is_interface:
@@ -250,7 +252,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                     continue
                 
                 # segment-routing mpls sr-prefer
-                a3 = re.compile(r'^\s*segment-routing\s+(?P<segment_key>\S+)\s+(?P<segment_value>.+)$')
+                a3 = regex_engine.compile(r'^\s*segment-routing\s+(?P<segment_key>\S+)\s+(?P<segment_value>.+)$')
                 m = a3.match(line)
                 if m:
                     if not 'segment_routing' in router_isis_dict['isis'][isis_name]['address_family'][address_family]:
@@ -260,7 +262,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                     continue
                 
                 # spf prefix-priority critical tag 1000
-                a4 = re.compile(r'^\s*spf\sprefix-priority\s+(?P<tag_key>\S+\stag+)\s+(?P<tag_value>.+)$')
+                a4 = regex_engine.compile(r'^\s*spf\sprefix-priority\s+(?P<tag_key>\S+\stag+)\s+(?P<tag_value>.+)$')
                 m = a4.match(line)
                 if m:
                     if not 'spf_prefix_priority' in router_isis_dict['isis'][isis_name]['address_family'][address_family]:
@@ -270,11 +272,11 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                     continue
                 
                 # spf-interval maximum-wait 8000 initial-wait 300 secondary-wait 500
-                a5 = re.compile(r'^\s*spf-interval\s+(?P<spf_interval>.+)$')
+                a5 = regex_engine.compile(r'^\s*spf-interval\s+(?P<spf_interval>.+)$')
                 m = a5.match(line)
                 if m:
                     spf_interval = m.groupdict()['spf_interval']
-                    pattern = re.compile(r'(\S+-wait)\s([0-9]+)')
+                    pattern = regex_engine.compile(r'(\S+-wait)\s([0-9]+)')
                     matches = pattern.findall(spf_interval)
                     spf_interval_pairs = {key.replace('-', '_'):val for key,val in matches}
                     router_isis_dict['isis'][isis_name]['address_family'][address_family]['spf_interval'] = spf_interval_pairs
@@ -282,7 +284,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                 
                    
                 # Generic, catch all key/value
-                a9 = re.compile(r'^\s*(?P<generic_key>\S+)\s+(?P<generic_value>.+)$')
+                a9 = regex_engine.compile(r'^\s*(?P<generic_key>\S+)\s+(?P<generic_value>.+)$')
                 m = a9.match(line)
                 if m:
                     if is_interface:
@@ -301,7 +303,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
             
             
             # router isis 65109
-            p1 = re.compile(r'^\s*router\sisis\s+(?P<isis_name>.+)$')
+            p1 = regex_engine.compile(r'^\s*router\sisis\s+(?P<isis_name>.+)$')
             m = p1.match(line)
             if m:
                 router_isis_dict.setdefault('isis', {})
@@ -313,7 +315,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                 continue
             
             # segment-routing global-block 160000 167999
-            p2 = re.compile(r'^\s*segment-routing\s+(?P<segment_routing_key>\S+)\s+(?P<segment_routing_value>.+)$')
+            p2 = regex_engine.compile(r'^\s*segment-routing\s+(?P<segment_routing_key>\S+)\s+(?P<segment_routing_value>.+)$')
             m = p2.match(line)
             if m:
                 router_isis_dict['isis'][isis_name]['segment_routing'][m.groupdict()['segment_routing_key'].replace('-', '_')] = \
@@ -321,18 +323,18 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                 continue
             
             # lsp-gen-interval maximum-wait 8000 initial-wait 1 secondary-wait 250
-            p3 = re.compile(r'^\s*lsp-gen-interval\s+(?P<lsp_gen_interval>.+)$')
+            p3 = regex_engine.compile(r'^\s*lsp-gen-interval\s+(?P<lsp_gen_interval>.+)$')
             m = p3.match(line)
             if m:
                 lsp_gen_interval = m.groupdict()['lsp_gen_interval']
-                pattern = re.compile(r'(\S+-wait)\s([0-9]+)')
+                pattern = regex_engine.compile(r'(\S+-wait)\s([0-9]+)')
                 matches = pattern.findall(lsp_gen_interval)
                 lsp_gen_pairs = {key.replace('-', '_'):val for key,val in matches}
                 router_isis_dict['isis'][isis_name]['lsp_gen_interval'] = lsp_gen_pairs
                 continue
             
             # address-family ipv4 unicast 
-            p4 = re.compile(r'^\s*address-family\s+(?P<address_family>.+)$')
+            p4 = regex_engine.compile(r'^\s*address-family\s+(?P<address_family>.+)$')
             m = p4.match(line)
             if m:
                 is_address_family = True
@@ -344,7 +346,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                 continue
             
             # interface Bundle-Ether2
-            p5 = re.compile(r'^\s*interface\s+(?P<interface>\S+)\s*$')
+            p5 = regex_engine.compile(r'^\s*interface\s+(?P<interface>\S+)\s*$')
             m = p5.match(line)
             if m:
                 is_interface = True
@@ -355,7 +357,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
             # Parsers for Interface Only
             if is_interface:
                 # interface Bundle-Ether2
-                i1 = re.compile(r'^\s*bfd\s+(?P<bfd_key>\S+)\s+(?P<bfd_value>.+)$')
+                i1 = regex_engine.compile(r'^\s*bfd\s+(?P<bfd_key>\S+)\s+(?P<bfd_value>.+)$')
                 m = i1.match(line)
                 if m:
                     if not 'bfd' in router_isis_dict['isis'][isis_name]['interfaces'][interface]:
@@ -364,7 +366,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
                         m.groupdict()['bfd_value']
                     continue
                 # passive
-                i1 = re.compile(r'^\s*(?P<other>[^\s!]+)\s*$')
+                i1 = regex_engine.compile(r'^\s*(?P<other>[^\s!]+)\s*$')
                 m = i1.match(line)
                 if m:
                     if not 'other' in router_isis_dict['isis'][isis_name]['interfaces'][interface]:
@@ -376,7 +378,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
             # Generic, catch all key/value
             # Skip if isis_name has not been found yet - skip timestamp value
             if not isis_name == None:
-                p9 = re.compile(r'^\s*(?P<generic_key>\S+)\s+(?P<generic_value>.+)$')
+                p9 = regex_engine.compile(r'^\s*(?P<generic_key>\S+)\s+(?P<generic_value>.+)$')
                 m = p9.match(line)
                 if m:
                     if not is_interface:
@@ -4,13 +4,13 @@ IOSXR parsers for the following show commands:
     * show run ipsla operation
 """
 
-# Python regex and rich module
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ====================================
 # Schema for 'show run ipsla operation'
 # ====================================
@@ -64,46 +64,46 @@ class ShowRunIpslaOperation(ShowRunIpslaOperationSchema):
         config_dict = {}
 
         # ipsla 
-        p0 = re.compile(r'^(?P<ipsla>ipsla)$') 
+        p0 = regex_engine.compile(r'^(?P<ipsla>ipsla)$') 
 
         # operation 100
-        p1 = re.compile(r'^oper\S+\s(?P<oper_id>\d+)$') 
+        p1 = regex_engine.compile(r'^oper\S+\s(?P<oper_id>\d+)$') 
 
         # type udp jitter
-        p2 = re.compile(r'^type\s(?P<oper_type_name>\S+.*)$')
+        p2 = regex_engine.compile(r'^type\s(?P<oper_type_name>\S+.*)$')
 
         # tag ABC
-        p3 = re.compile(r'^tag.(?P<tag>\S+)$')
+        p3 = regex_engine.compile(r'^tag.(?P<tag>\S+)$')
         
         # source address 1.1.1.1
-        p4 = re.compile(r'^sour\w+\s\w+\s(?P<src_addr>\w+.*)$')
+        p4 = regex_engine.compile(r'^sour\w+\s\w+\s(?P<src_addr>\w+.*)$')
         
         # destination address 2.2.2.2
-        p5 = re.compile(r'^dest\w+\saddress\s(?P<dest_addr>\w+.*)$')
+        p5 = regex_engine.compile(r'^dest\w+\saddress\s(?P<dest_addr>\w+.*)$')
         
         # destination port 15000
-        p6 = re.compile(r'^dest\w+\sport\s(?P<dest_port>\d+)$')
+        p6 = regex_engine.compile(r'^dest\w+\sport\s(?P<dest_port>\d+)$')
 
         # packet count 1000
-        p7 = re.compile(r'^pac\w+\scount\s(?P<pkt_cnt>\d+)$')
+        p7 = regex_engine.compile(r'^pac\w+\scount\s(?P<pkt_cnt>\d+)$')
 
         # packet interval 20 
-        p8 = re.compile(r'^pac\w+\sinterval\s(?P<pkt_int>\d+)$')
+        p8 = regex_engine.compile(r'^pac\w+\sinterval\s(?P<pkt_int>\d+)$')
 
         # datasize request 500
-        p9 = re.compile(r'^data\w+\sreq\w+\s(?P<data_size_req>\d+)$')
+        p9 = regex_engine.compile(r'^data\w+\sreq\w+\s(?P<data_size_req>\d+)$')
 
         # timeout 3000
-        p10 = re.compile(r'^time\w+\s(?P<time_out>\d+)$')
+        p10 = regex_engine.compile(r'^time\w+\s(?P<time_out>\d+)$')
 
         # frequency 60
-        p11 = re.compile(r'^freq\w+\s(?P<freq>\d+)$')
+        p11 = regex_engine.compile(r'^freq\w+\s(?P<freq>\d+)$')
 
         # vrf VRF-1
-        p12 = re.compile(r'^vrf\s(?P<vrf>\S+)$')
+        p12 = regex_engine.compile(r'^vrf\s(?P<vrf>\S+)$')
 
         # verify-data
-        p13 = re.compile(r'^(?P<verify_data>verify\-\w+)$')
+        p13 = regex_engine.compile(r'^(?P<verify_data>verify\-\w+)$')
 
         # breakpoint()
 
@@ -19,13 +19,13 @@ Parser for the following show commands:
     * show segment-routing srv6 locator {locator_name}
 '''
 
-# !/bin/env python
-import re
-
 # Genie
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowIsisSegmentRoutingPrefixSidMapSchema(MetaParser):
     ''' Schema for:
@@ -71,16 +71,16 @@ class ShowIsisSegmentRoutingPrefixSidMap(ShowIsisSegmentRoutingPrefixSidMapSchem
         # p2 = re.compile(r'^SRMS \w+ policy for Process ID (?P<process_id>\d+)$')
 
         # IS-IS 1 active policy
-        p1 = re.compile(r'^IS-IS (?P<isis_id>\d+) (?P<status>\w+) policy$')
+        p1 = regex_engine.compile(r'^IS-IS (?P<isis_id>\d+) (?P<status>\w+) policy$')
 
         # Prefix               SID Index    Range        Flags
         # 10.4.1.100/32         100          20          
         # 10.4.1.150/32         150          10          
-        p2 = re.compile(r'(?P<prefix>[\w\.\/]+)\s+(?P<sid_index>\d+)'
-                        r'\s+(?P<range>\d+)(\s+(?P<flags>)[\w\s]+$)?')
+        p2 = regex_engine.compile(r'(?P<prefix>[\w\.\/]+)\s+(?P<sid_index>\d+)'
+                                  r'\s+(?P<range>\d+)(\s+(?P<flags>)[\w\s]+$)?')
 
         # Number of mapping entries: 2
-        p3 = re.compile(r'Number of mapping entries:\s+(?P<entries>\d+)')
+        p3 = regex_engine.compile(r'Number of mapping entries:\s+(?P<entries>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -155,17 +155,17 @@ class ShowOspfSegmentRoutingPrefixSidMap(ShowOspfSegmentRoutingPrefixSidMapSchem
 
         ret_dict = {}
         # SRMS active policy for Process ID 1
-        p1 = re.compile(r'^SRMS (?P<status>\w+) policy for Process '
-                        r'ID (?P<process_id>\d+)$')
+        p1 = regex_engine.compile(r'^SRMS (?P<status>\w+) policy for Process '
+                                  r'ID (?P<process_id>\d+)$')
 
         # Prefix               SID Index    Range        Flags
         # 10.4.1.100/32         100          20          
         # 10.4.1.150/32         150          10          
-        p2 = re.compile(r'(?P<prefix>[\w\.\/]+)\s+(?P<sid_index>\d+)'
-                        r'\s+(?P<range>\d+)(\s+(?P<flags>)[\w\s]+$)?')
+        p2 = regex_engine.compile(r'(?P<prefix>[\w\.\/]+)\s+(?P<sid_index>\d+)'
+                                  r'\s+(?P<range>\d+)(\s+(?P<flags>)[\w\s]+$)?')
 
         # Number of mapping entries: 2
-        p3 = re.compile(r'Number of mapping entries:\s+(?P<entries>\d+)')
+        p3 = regex_engine.compile(r'Number of mapping entries:\s+(?P<entries>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -232,12 +232,12 @@ class ShowPceIPV4Peer(ShowPceIPV4PeerSchema):
         ret_dict = {}
 
         # Peer address: 192.168.0.1
-        p1 = re.compile(r'^Peer address: (?P<address>[\d\.]+)$')
+        p1 = regex_engine.compile(r'^Peer address: (?P<address>[\d\.]+)$')
 
-        p2 = re.compile(r'^State: (?P<state>\w+)$')
+        p2 = regex_engine.compile(r'^State: (?P<state>\w+)$')
 
-        p3 = re.compile(r'Capabilities: (?P<stateful>\w+)\,\s+'
-                        r'(?P<segment_routing>[\w\-]+)\,\s+(?P<update>\w+)$')
+        p3 = regex_engine.compile(r'Capabilities: (?P<stateful>\w+)\,\s+'
+                                  r'(?P<segment_routing>[\w\-]+)\,\s+(?P<update>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -344,69 +344,69 @@ class ShowPceIPV4PeerDetail(ShowPceIPV4PeerDetailSchema):
         pcep_dict = {}
         ka_dict = {}
 
-        p1 = re.compile(r'^Peer address: (?P<address>[\d\.]+)$')
+        p1 = regex_engine.compile(r'^Peer address: (?P<address>[\d\.]+)$')
 
-        p2 = re.compile(r'^State: (?P<state>\w+)$')
+        p2 = regex_engine.compile(r'^State: (?P<state>\w+)$')
 
-        p3 = re.compile(r'^Capabilities: (?P<stateful>\w+)\,\s+'
-                        r'(?P<segment_routing>[\w\-]+)\,\s+(?P<update>\w+)$')
+        p3 = regex_engine.compile(r'^Capabilities: (?P<stateful>\w+)\,\s+'
+                                  r'(?P<segment_routing>[\w\-]+)\,\s+(?P<update>\w+)$')
             
-        p4 = re.compile(r'^PCEP has been up for: (?P<pcep_up_time>[\w+\:]+)$')
+        p4 = regex_engine.compile(r'^PCEP has been up for: (?P<pcep_up_time>[\w+\:]+)$')
 
-        p5 = re.compile(r'^PCEP session ID: local (?P<local_id>\d+)\, remote '
-                        r'(?P<remote_id>\d+)$')
+        p5 = regex_engine.compile(r'^PCEP session ID: local (?P<local_id>\d+)\, remote '
+                                  r'(?P<remote_id>\d+)$')
 
-        p6 = re.compile(r'^Sending KA every (?P<ka_time_intervals>\d+)'
-                        r'\s+seconds$')
+        p6 = regex_engine.compile(r'^Sending KA every (?P<ka_time_intervals>\d+)'
+                                  r'\s+seconds$')
 
-        p7 = re.compile(r'^Minimum acceptable KA interval: '
-                        r'(?P<minimum_ka_interval>\d+)\s+seconds$')
+        p7 = regex_engine.compile(r'^Minimum acceptable KA interval: '
+                                  r'(?P<minimum_ka_interval>\d+)\s+seconds$')
 
-        p8 = re.compile(r'^Peer timeout after (?P<peer_timeout>\d+)\sseconds$')
+        p8 = regex_engine.compile(r'^Peer timeout after (?P<peer_timeout>\d+)\sseconds$')
 
-        p9 = re.compile(r'^Keepalive messages:\s+rx\s+'
-                        r'(?P<keepalive_messages_rx>\d+)\s+tx\s+(?P<keepalive_messages_tx>\d+)$')
+        p9 = regex_engine.compile(r'^Keepalive messages:\s+rx\s+'
+                                  r'(?P<keepalive_messages_rx>\d+)\s+tx\s+(?P<keepalive_messages_tx>\d+)$')
 
-        p10 = re.compile(r'Request messages:\s+rx\s+(?P<request_messages_rx>'
-                         r'\d+)\s+tx\s+(?P<request_messages_tx>\d+)$')
+        p10 = regex_engine.compile(r'Request messages:\s+rx\s+(?P<request_messages_rx>'
+                                   r'\d+)\s+tx\s+(?P<request_messages_tx>\d+)$')
 
-        p11 = re.compile(r'^Reply messages:\s+rx\s+(?P<reply_messages_rx>\d+)'
-                         r'\s+tx\s+(?P<reply_messages_tx>\d+)$')
+        p11 = regex_engine.compile(r'^Reply messages:\s+rx\s+(?P<reply_messages_rx>\d+)'
+                                   r'\s+tx\s+(?P<reply_messages_tx>\d+)$')
 
-        p12 = re.compile(r'^Error messages:\s+rx\s+(?P<error_messages_rx>\d+)'
-                         r'\s+tx\s+(?P<error_messages_tx>\d+)$')
+        p12 = regex_engine.compile(r'^Error messages:\s+rx\s+(?P<error_messages_rx>\d+)'
+                                   r'\s+tx\s+(?P<error_messages_tx>\d+)$')
 
-        p13 = re.compile(r'^Open messages:\s+rx\s+(?P<open_messages_rx>\d+)\s+'
-                         r'tx\s+(?P<open_messages_tx>\d+)$')
+        p13 = regex_engine.compile(r'^Open messages:\s+rx\s+(?P<open_messages_rx>\d+)\s+'
+                                   r'tx\s+(?P<open_messages_tx>\d+)$')
 
-        p14 = re.compile(r'^Report messages:\s+rx\s+(?P<report_messages_rx>\d+)'
-                         r'\s+tx\s+(?P<report_messages_tx>\d+)$')
+        p14 = regex_engine.compile(r'^Report messages:\s+rx\s+(?P<report_messages_rx>\d+)'
+                                   r'\s+tx\s+(?P<report_messages_tx>\d+)$')
 
-        p15 = re.compile(r'^Update messages:\s+rx\s+(?P<update_messages_rx>\d+)'
-                         r'\s+tx\s+(?P<update_messages_tx>\d+)$')
+        p15 = regex_engine.compile(r'^Update messages:\s+rx\s+(?P<update_messages_rx>\d+)'
+                                   r'\s+tx\s+(?P<update_messages_tx>\d+)$')
 
-        p16 = re.compile(r'^Initiate messages:\s+rx\s+(?P<initiate_messages_rx>'
-                         r'\d+)\s+tx\s+(?P<initiate_messages_tx>\d+)$')
+        p16 = regex_engine.compile(r'^Initiate messages:\s+rx\s+(?P<initiate_messages_rx>'
+                                   r'\d+)\s+tx\s+(?P<initiate_messages_tx>\d+)$')
         
         # Capabilities: Stateful, Segment-Routing, Update, Instantiation
-        p17 = re.compile(r'^Capabilities: (?P<stateful>\w+)\,\s+'
-                        r'(?P<segment_routing>[\w\-]+)\,\s+(?P<update>\w+)'
-                        r'\,\s+(?P<instantiation>\w+)')
+        p17 = regex_engine.compile(r'^Capabilities: (?P<stateful>\w+)\,\s+'
+                                  r'(?P<segment_routing>[\w\-]+)\,\s+(?P<update>\w+)'
+                                  r'\,\s+(?P<instantiation>\w+)')
         
         # MD5: Enabled
-        p18 = re.compile(r'^MD5:\s+(?P<md5>\w+)$')
+        p18 = regex_engine.compile(r'^MD5:\s+(?P<md5>\w+)$')
 
         # Maximum SID Depth: 10
-        p19 = re.compile(r'^Maximum SID Depth:\s+(?P<maximum_sid_depth>\d+)$')
+        p19 = regex_engine.compile(r'^Maximum SID Depth:\s+(?P<maximum_sid_depth>\d+)$')
 
         # Last PCError:
-        p20 = re.compile(r'^Last\s+PCError:$')
+        p20 = regex_engine.compile(r'^Last\s+PCError:$')
 
         # Received: None
-        p21 = re.compile(r'^Received:\s+(?P<received_pcerror>\w+)$')
+        p21 = regex_engine.compile(r'^Received:\s+(?P<received_pcerror>\w+)$')
 
         # Sent: None
-        p22 = re.compile(r'^Sent:\s+(?P<sent_pcerror>\w+)$')
+        p22 = regex_engine.compile(r'^Sent:\s+(?P<sent_pcerror>\w+)$')
             
         for line in out.splitlines():
             line = line.strip()
@@ -600,16 +600,16 @@ class ShowPceIPV4PeerPrefix(ShowPceIPV4PeerprefixSchema):
 
         ret_dict = {}
 
-        p1 = re.compile(r'Node (?P<node_number>\d+)')
+        p1 = regex_engine.compile(r'Node (?P<node_number>\d+)')
 
-        p2 = re.compile(r'^TE router ID: (?P<router_id>[\d\.]+)$')
+        p2 = regex_engine.compile(r'^TE router ID: (?P<router_id>[\d\.]+)$')
 
-        p3 = re.compile(r'^Host name: (?P<host_name>\w+)$')
+        p3 = regex_engine.compile(r'^Host name: (?P<host_name>\w+)$')
 
-        p4 = re.compile(r'^ISIS system ID: (?P<system_id>[\w\.]+\s+level-\d+)'
-                        r'( ASN: (?P<asn>\w+) domain ID: (?P<domain_id>\d+))*')
+        p4 = regex_engine.compile(r'^ISIS system ID: (?P<system_id>[\w\.]+\s+level-\d+)'
+                                  r'( ASN: (?P<asn>\w+) domain ID: (?P<domain_id>\d+))*')
 
-        p5 = re.compile(r'^(?P<adv_prefixes>\d+\.\d+\.\d+\.\d+)$')
+        p5 = regex_engine.compile(r'^(?P<adv_prefixes>\d+\.\d+\.\d+\.\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -708,32 +708,32 @@ class ShowPceIpv4TopologySummary(ShowPceIpv4TopologySummarySchema):
         else:
             out = output
 
-        p1 = re.compile(r'^Topology nodes:\s+(?P<topology_nodes>\d+)$')
+        p1 = regex_engine.compile(r'^Topology nodes:\s+(?P<topology_nodes>\d+)$')
 
-        p2 = re.compile(r'^Prefixes:\s+(?P<prefixes>\d+)$')
+        p2 = regex_engine.compile(r'^Prefixes:\s+(?P<prefixes>\d+)$')
 
-        p3 = re.compile(r'^Prefix +SIDs: +(?:(?P<prefix_sids>\d+))?$')
+        p3 = regex_engine.compile(r'^Prefix +SIDs: +(?:(?P<prefix_sids>\d+))?$')
 
-        p4 = re.compile(r'^Links: +(?:(?P<links>\d+))?$')
+        p4 = regex_engine.compile(r'^Links: +(?:(?P<links>\d+))?$')
 
-        p5 = re.compile(r'^Adjacency +SIDs: +(?:(?P<adjacency>\d+))?$')
+        p5 = regex_engine.compile(r'^Adjacency +SIDs: +(?:(?P<adjacency>\d+))?$')
 
-        p6 = re.compile(r'^Total: +(?P<total>\d+)$')
-        p7 = re.compile(r'^Regular: +(?P<regular>\d+)$')
-        p8 = re.compile(r'^Strict: +(?P<strict>\d+)$')
-        p9 = re.compile(r'^EPE: +(?P<epe>\d+)$')
-        p10 = re.compile(r'^Unprotected: +(?P<unprotected>\d+)$')
-        p11 = re.compile(r'^Protected: +(?P<protected>\d+)$')
-        p12 = re.compile(r'^Lookup +Nodes +(?P<lookup>\d+)$')
-        p13 = re.compile(r'^Consistent +(?P<consistent>\S+)$')
-        p14 = re.compile(r'^Noded +added: +(?P<added>\d+)$')
-        p15 = re.compile(r'^Noded +deleted: +(?P<deleted>\d+)$')
+        p6 = regex_engine.compile(r'^Total: +(?P<total>\d+)$')
+        p7 = regex_engine.compile(r'^Regular: +(?P<regular>\d+)$')
+        p8 = regex_engine.compile(r'^Strict: +(?P<strict>\d+)$')
+        p9 = regex_engine.compile(r'^EPE: +(?P<epe>\d+)$')
+        p10 = regex_engine.compile(r'^Unprotected: +(?P<unprotected>\d+)$')
+        p11 = regex_engine.compile(r'^Protected: +(?P<protected>\d+)$')
+        p12 = regex_engine.compile(r'^Lookup +Nodes +(?P<lookup>\d+)$')
+        p13 = regex_engine.compile(r'^Consistent +(?P<consistent>\S+)$')
+        p14 = regex_engine.compile(r'^Noded +added: +(?P<added>\d+)$')
+        p15 = regex_engine.compile(r'^Noded +deleted: +(?P<deleted>\d+)$')
 
-        p16 = re.compile(r'^Links +added: +(?P<added>\d+)$')
-        p17 = re.compile(r'^Links +deleted: +(?P<deleted>\d+)$')
+        p16 = regex_engine.compile(r'^Links +added: +(?P<added>\d+)$')
+        p17 = regex_engine.compile(r'^Links +deleted: +(?P<deleted>\d+)$')
 
-        p18 = re.compile(r'^Prefix +added: +(?P<added>\d+)$')
-        p19 = re.compile(r'^Prefix +deleted: +(?P<deleted>\d+)$')
+        p18 = regex_engine.compile(r'^Prefix +added: +(?P<added>\d+)$')
+        p19 = regex_engine.compile(r'^Prefix +deleted: +(?P<deleted>\d+)$')
 
         parsed_dict = {}
 
@@ -929,22 +929,22 @@ class ShowPceLsp(ShowPceLspSchema):
         else:
             out = output
 
-        p1 = re.compile(r'^PCC (?P<pcc_id>[\d\.]+):$')
+        p1 = regex_engine.compile(r'^PCC (?P<pcc_id>[\d\.]+):$')
 
-        p2 = re.compile(r'^Tunnel Name: (?P<tunnel_name>\w+)$')
+        p2 = regex_engine.compile(r'^Tunnel Name: (?P<tunnel_name>\w+)$')
 
-        p3 = re.compile(r'^LSP\[(?P<lsp_number>\d+)\]:$')
+        p3 = regex_engine.compile(r'^LSP\[(?P<lsp_number>\d+)\]:$')
 
-        p4 = re.compile(r'^source (?P<lsp_source>[\d\.]+), destination '
-                        r'(?P<lsp_destination>[\d\.]+), tunnel ID (?P<tunnel_id>\d+), '
-                        r'LSP ID (?P<lsp_id>\d+)$')
+        p4 = regex_engine.compile(r'^source (?P<lsp_source>[\d\.]+), destination '
+                                  r'(?P<lsp_destination>[\d\.]+), tunnel ID (?P<tunnel_id>\d+), '
+                                  r'LSP ID (?P<lsp_id>\d+)$')
 
-        p5 = re.compile(r'State: Admin (?P<admin_state>\w+), Operation '
-                        r'(?P<operation_state>\w+)$')
+        p5 = regex_engine.compile(r'State: Admin (?P<admin_state>\w+), Operation '
+                                  r'(?P<operation_state>\w+)$')
 
-        p6 = re.compile(r'^Setup type: (?P<setup_type>[\w\s]+)$')
+        p6 = regex_engine.compile(r'^Setup type: (?P<setup_type>[\w\s]+)$')
 
-        p7 = re.compile(r'^Binding SID: (?P<binding_sid>\d+)$')
+        p7 = regex_engine.compile(r'^Binding SID: (?P<binding_sid>\d+)$')
 
         ret_dict = {}
 
@@ -1081,54 +1081,54 @@ class ShowPceLspDetail(ShowPceLspDetailSchema):
         else:
             out = output
 
-        p1 = re.compile(r'^PCC (?P<pcc_id>[\d\.]+):$')
+        p1 = regex_engine.compile(r'^PCC (?P<pcc_id>[\d\.]+):$')
 
-        p2 = re.compile(r'^Tunnel Name: (?P<tunnel_name>\w+)$')
+        p2 = regex_engine.compile(r'^Tunnel Name: (?P<tunnel_name>\w+)$')
 
-        p3 = re.compile(r'^LSP\[(?P<lsp_number>\d+)\]:$')
+        p3 = regex_engine.compile(r'^LSP\[(?P<lsp_number>\d+)\]:$')
 
-        p4 = re.compile(r'^source (?P<lsp_source>[\d\.]+), destination '
-                        r'(?P<lsp_destination>[\d\.]+), tunnel ID '
-                        r'(?P<tunnel_id>\d+), LSP ID (?P<lsp_id>\d+)$')
+        p4 = regex_engine.compile(r'^source (?P<lsp_source>[\d\.]+), destination '
+                                  r'(?P<lsp_destination>[\d\.]+), tunnel ID '
+                                  r'(?P<tunnel_id>\d+), LSP ID (?P<lsp_id>\d+)$')
 
-        p5 = re.compile(r'State: Admin (?P<admin_state>\w+), Operation '
-                        r'(?P<operation_state>\w+)$')
+        p5 = regex_engine.compile(r'State: Admin (?P<admin_state>\w+), Operation '
+                                  r'(?P<operation_state>\w+)$')
 
-        p6 = re.compile(r'^Setup type: (?P<setup_type>[\w\s]+)$')
+        p6 = regex_engine.compile(r'^Setup type: (?P<setup_type>[\w\s]+)$')
 
-        p7 = re.compile(r'^Binding SID: (?P<binding_sid>\d+)$')
+        p7 = regex_engine.compile(r'^Binding SID: (?P<binding_sid>\d+)$')
 
-        p8 = re.compile(r'^plsp-id (?P<plsp_id>\d+), flags: D:(?P<d_flag>\d+) '
-                        r'S:(?P<s_flag>\d+) R:(?P<r_flag>\d+) A:'
-                        r'(?P<a_flag>\d+) O:(?P<o_flag>\d+)$')
+        p8 = regex_engine.compile(r'^plsp-id (?P<plsp_id>\d+), flags: D:(?P<d_flag>\d+) '
+                                  r'S:(?P<s_flag>\d+) R:(?P<r_flag>\d+) A:'
+                                  r'(?P<a_flag>\d+) O:(?P<o_flag>\d+)$')
 
         #   Reported path: 
-        p9 = re.compile(r'^(?P<specified_path>\w+) path:$')
+        p9 = regex_engine.compile(r'^(?P<specified_path>\w+) path:$')
 
-        p10 = re.compile(r'^Metric type: (?P<metric_type>\w+), '
-                         r'Accumulated Metric (?P<accumulated_metric>\d+)$')
+        p10 = regex_engine.compile(r'^Metric type: (?P<metric_type>\w+), '
+                                   r'Accumulated Metric (?P<accumulated_metric>\d+)$')
 
         # SID[0]: Adj, Label 24000, Address: local 10.10.10.1 remote 10.10.10.2
-        p11 = re.compile(r'^SID\[(?P<sid_number>\d+)\]: (?P<sid_type>\w+), '
-                         r'Label (?P<sid_label>\d+), Address: local '
-                         r'(?P<sid_local_address>[\d\.]+) remote '
-                         r'(?P<sid_remote_address>[\d\.]+)$')
+        p11 = regex_engine.compile(r'^SID\[(?P<sid_number>\d+)\]: (?P<sid_type>\w+), '
+                                   r'Label (?P<sid_label>\d+), Address: local '
+                                   r'(?P<sid_local_address>[\d\.]+) remote '
+                                   r'(?P<sid_remote_address>[\d\.]+)$')
         # June 13 2016 13:28:29     Report
-        p12 = re.compile(r'^(?P<event_time>\w+ \d+ \d+ [\d\:]+)\s+ '
-                         r'(?P<event_type>\w+)$')
+        p12 = regex_engine.compile(r'^(?P<event_time>\w+ \d+ \d+ [\d\:]+)\s+ '
+                                   r'(?P<event_type>\w+)$')
         # Symbolic-name: rtrA_t1, LSP-ID: 2,
-        p13 = re.compile(r'^Symbolic-name: (?P<symbolic_name>\w+), '
-                         r'(?P<id_name>[\w\-]+): (?P<symbolic_id>\d+),$')
+        p13 = regex_engine.compile(r'^Symbolic-name: (?P<symbolic_name>\w+), '
+                                   r'(?P<id_name>[\w\-]+): (?P<symbolic_id>\d+),$')
         # Source: 192.168.0.1 Destination: 192.168.0.4,
-        p14 = re.compile(r'^Source: (?P<event_source>[\d\.]+) Destination: '
-                         r'(?P<dest_source>[\d\.]+),$')
+        p14 = regex_engine.compile(r'^Source: (?P<event_source>[\d\.]+) Destination: '
+                                   r'(?P<dest_source>[\d\.]+),$')
 
         # D:1, R:0, A:1 O:1, Sig.BW: 0, Act.BW: 0
-        p15 = re.compile(r'^D:(?P<d_event>\d+), R:(?P<r_event>\d+), '
-                         r'A:(?P<a_event>\d+) O:(?P<o_event>\d+), Sig\.BW: '
-                         r'(?P<event_sig>\d+), Act.BW: (?P<event_act>\d+)$')
+        p15 = regex_engine.compile(r'^D:(?P<d_event>\d+), R:(?P<r_event>\d+), '
+                                   r'A:(?P<a_event>\d+) O:(?P<o_event>\d+), Sig\.BW: '
+                                   r'(?P<event_sig>\d+), Act.BW: (?P<event_act>\d+)$')
 
-        p16 = re.compile(r'Peer: (?P<event_peer>[\d\.]+)')
+        p16 = regex_engine.compile(r'Peer: (?P<event_peer>[\d\.]+)')
 
         ret_dict = {}
 
@@ -1274,8 +1274,8 @@ class ShowSegmentRoutingLocalBlockInconsistencies(ShowSegmentRoutingLocalBlockIn
         else:
             out = output
         # SRLB inconsistencies range: Start/End: 30000/30009
-        p1 = re.compile(r'(?P<inconsistency_type>\w+) inconsistencies range: '
-                        r'Start\/End: (?P<start>\d+)\/(?P<end>\d+)')
+        p1 = regex_engine.compile(r'(?P<inconsistency_type>\w+) inconsistencies range: '
+                                  r'Start\/End: (?P<start>\d+)\/(?P<end>\d+)')
 
         ret_dict = {}
 
@@ -1328,10 +1328,10 @@ class ShowSegmentRoutingMappingServerPrefixSidMapIPV4(ShowSegmentRoutingMappingS
         ret_dict = {}
 
         # 10.186.1.0/24          400          300          
-        p1 = re.compile(r'(?P<prefix>[\w\.\/]+)\s+(?P<sid_index>\d+)'
-                        r'\s+(?P<range>\d+)(\s+(?P<flags>)[\w\s]+$)?')
+        p1 = regex_engine.compile(r'(?P<prefix>[\w\.\/]+)\s+(?P<sid_index>\d+)'
+                                  r'\s+(?P<range>\d+)(\s+(?P<flags>)[\w\s]+$)?')
         # Number of mapping entries: 2
-        p2 = re.compile(r'Number of mapping entries:\s+(?P<entries>\d+)')
+        p2 = regex_engine.compile(r'Number of mapping entries:\s+(?P<entries>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1393,22 +1393,22 @@ class ShowSegmentRoutingMappingServerPrefixSidMapIPV4Detail(
             out = output
 
         # 10.186.1.0/24
-        p1 = re.compile(r'^(?P<prefix>\d+\.\d+\.\d+\.\d+\/\d+)$')
+        p1 = regex_engine.compile(r'^(?P<prefix>\d+\.\d+\.\d+\.\d+\/\d+)$')
 
         # SID Index:      400
-        p2 = re.compile(r'^SID Index:\s+(?P<sid_index>\d+)$')
+        p2 = regex_engine.compile(r'^SID Index:\s+(?P<sid_index>\d+)$')
 
         # Range:          300
-        p3 = re.compile(r'^Range:\s+(?P<range>\d+)$')
+        p3 = regex_engine.compile(r'^Range:\s+(?P<range>\d+)$')
 
         # Last Prefix:    10.229.44.0/24
-        p4 = re.compile(r'^Last Prefix:\s+(?P<last_prefix>[\d\.\/]+)$')
+        p4 = regex_engine.compile(r'^Last Prefix:\s+(?P<last_prefix>[\d\.\/]+)$')
 
         # Last SID Index: 699
-        p5 = re.compile(r'^Last SID Index: (?P<last_sid_index>\d+)$')
+        p5 = regex_engine.compile(r'^Last SID Index: (?P<last_sid_index>\d+)$')
 
         # Flags
-        p6 = re.compile(r'^Flags:\s+(?P<flags>\w+)$')
+        p6 = regex_engine.compile(r'^Flags:\s+(?P<flags>\w+)$')
 
         ret_dict = {}
 
@@ -1490,15 +1490,15 @@ class ShowSegmentRoutingSrv6LocatorSid(ShowSegmentRoutingSrv6LocatorSidSchema):
         ret_dict = {}
 
         # SID    Behavior    Context    Owner    State    RW
-        p = re.compile(r'SID\s+Behavior\s+Context\s+Owner\s+State\s+RW')
+        p = regex_engine.compile(r'SID\s+Behavior\s+Context\s+Owner\s+State\s+RW')
         
         # *** Locator: 'ALGO_0' ***
-        p1 = re.compile(r'^\*+\s+Locator:\s+\'(?P<locator>\S+)\'\s+\*+$')
+        p1 = regex_engine.compile(r'^\*+\s+Locator:\s+\'(?P<locator>\S+)\'\s+\*+$')
         
         # cafe:0:200::                uN (PSP/USD)      'default':512                     sidmgr              InUse  Y
         # cafe:0:200:e000::           uDT2U             1:0                               l2vpn_srv6          InUse  Y
-        p2 = re.compile(r'^(?P<sid>[\w+:]+)\s+(?P<behavior>\S+\s?\S+) +'
-                        r'\s+(?P<context>\S+\s?\S+)\s+(?P<owner>\S+)\s+(?P<state>\S+)\s+(?P<rw>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<sid>[\w+:]+)\s+(?P<behavior>\S+\s?\S+) +'
+                                  r'\s+(?P<context>\S+\s?\S+)\s+(?P<owner>\S+)\s+(?P<state>\S+)\s+(?P<rw>\S+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1560,7 +1560,7 @@ class ShowSegmentRoutingSrv6Locator(ShowSegmentRoutingSrv6LocatorSchema):
 
         # LL                    1        128   fc00:c001:1001::/48       Up       U
         # MAIN                  2        0     fc00:c000:1001::/48       Up       U
-        p1 = re.compile(r'^(?P<name>\w+)\s+(?P<id>\d+)\s+(?P<algorithm>\d+)\s+(?P<prefix>[\w:\/]+)\s+(?P<status>[Up|Dn]+)\s+(?P<flags>[U])$')
+        p1 = regex_engine.compile(r'^(?P<name>\w+)\s+(?P<id>\d+)\s+(?P<algorithm>\d+)\s+(?P<prefix>[\w:\/]+)\s+(?P<status>[Up|Dn]+)\s+(?P<flags>[U])$')
 
         ret_dict = {}
 
@@ -1621,25 +1621,25 @@ class ShowSegmentRoutingTrafficEnggPccLsp(
             out = output
 
         # Symbolic Name: cfg_srte_c_30_ep_10.0.0.14_discr_100
-        p1 = re.compile(r'^Symbolic Name: (?P<symbolic_name>[A-Za-z0-9_?.?]+)$')
+        p1 = regex_engine.compile(r'^Symbolic Name: (?P<symbolic_name>[A-Za-z0-9_?.?]+)$')
         
         # LSP[0]:
-        p2 = re.compile(r'^LSP\[(?P<lsp_number>\d+)\]:$')
+        p2 = regex_engine.compile(r'^LSP\[(?P<lsp_number>\d+)\]:$')
  
         # Source 10.0.0.2, Destination 10.0.0.14, Tunnel ID 1, LSP ID 1048
-        p3 = re.compile(r'^Source (?P<lsp_source>[\d\.]+), Destination '
-                        r'(?P<lsp_destination>[\d\.]+), Tunnel ID (?P<tunnel_id>\d+), '
-                        r'LSP ID (?P<lsp_id>\d+)$')
+        p3 = regex_engine.compile(r'^Source (?P<lsp_source>[\d\.]+), Destination '
+                                  r'(?P<lsp_destination>[\d\.]+), Tunnel ID (?P<tunnel_id>\d+), '
+                                  r'LSP ID (?P<lsp_id>\d+)$')
         
         # State: Admin up, Operation up
-        p4 = re.compile(r'State: Admin (?P<admin_state>\w+), Operation '
-                          r'(?P<operation_state>\w+)$')
+        p4 = regex_engine.compile(r'State: Admin (?P<admin_state>\w+), Operation '
+                                    r'(?P<operation_state>\w+)$')
         
         # Setup type: SR
-        p5 = re.compile(r'^Setup type: (?P<setup_type>[\w\s]+)$')
+        p5 = regex_engine.compile(r'^Setup type: (?P<setup_type>[\w\s]+)$')
 
         # Binding SID: 26276
-        p6 = re.compile(r'^Binding SID: (?P<binding_sid>\d+)$')
+        p6 = regex_engine.compile(r'^Binding SID: (?P<binding_sid>\d+)$')
 
         ret_dict = {}
 
@@ -1775,67 +1775,67 @@ class ShowSegmentRoutingTrafficEngPolicyColorEndpoint(ShowSegmentRoutingTrafficE
             output = self.device.execute(cmd)
 
         # Color: 30, End-point: 10.0.0.14
-        p1 = re.compile(r'^Color: +(?P<color>\d+), +End-point: *(?P<end_point>\S+)')
+        p1 = regex_engine.compile(r'^Color: +(?P<color>\d+), +End-point: *(?P<end_point>\S+)')
         
         # Name: srte_c_30_ep_10.0.0.14
-        p2 = re.compile(r'^Name: +(?P<name>\S+)')
+        p2 = regex_engine.compile(r'^Name: +(?P<name>\S+)')
         
         # Admin: up  Operational: up for N/A (since Oct 25 07:51:47.805)
-        p3 = re.compile(r'^Admin: (?P<admin>\w+)\s+Operational:\s+(?P<oper>\w+)\s+for\s+(?P<time>\S+) \(since\s(?P<since>\S+\s+\S+\s\S+)')
+        p3 = regex_engine.compile(r'^Admin: (?P<admin>\w+)\s+Operational:\s+(?P<oper>\w+)\s+for\s+(?P<time>\S+) \(since\s(?P<since>\S+\s+\S+\s\S+)')
         
         # Preference: 100 (configuration) (active) (reoptimizing)
-        p4 = re.compile(r'^Preference:\s+(?P<preference>\d+)')
+        p4 = regex_engine.compile(r'^Preference:\s+(?P<preference>\d+)')
         
         # Name: srte_c_30_ep_10.0.0.14    
-        p5 = re.compile(r'^Name: +(?P<per_name>\S+)')
+        p5 = regex_engine.compile(r'^Name: +(?P<per_name>\S+)')
         
         #  Requested BSID: dynamic
-        p6 = re.compile(r'^Requested\s+BSID:\s+(?P<bsid>\w+)')
+        p6 = regex_engine.compile(r'^Requested\s+BSID:\s+(?P<bsid>\w+)')
        
         # Symbolic name: cfg_srte_c_30_ep_10.0.0.14_discr_100
-        p7 = re.compile(r'^Symbolic name: (?P<symbolic_name>[A-Za-z0-9_?.?]+)$')
+        p7 = regex_engine.compile(r'^Symbolic name: (?P<symbolic_name>[A-Za-z0-9_?.?]+)$')
         
         # PLSP-ID: 1
-        p8 = re.compile(r'^PLSP-ID:\s+(?P<plsp_id>\d+)')
+        p8 = regex_engine.compile(r'^PLSP-ID:\s+(?P<plsp_id>\d+)')
         
         # Protection Type: protected-preferred
-        p9 = re.compile(r'^Protection\s+Type:\s(?P<protection_type>\S+)')
+        p9 = regex_engine.compile(r'^Protection\s+Type:\s(?P<protection_type>\S+)')
         
         # Maximum SID Depth: 12
-        p10 = re.compile(r'^Maximum\s+SID\s+Depth:\s+(?P<maximum_sid_depth>\d+)')
+        p10 = regex_engine.compile(r'^Maximum\s+SID\s+Depth:\s+(?P<maximum_sid_depth>\d+)')
         
         # Dynamic (pce 10.0.0.11) (valid)
-        p11 = re.compile(r'^Dynamic( +(?P<pce>\(pce.*\)))? +\((?P<status>\w+)\)$')
+        p11 = regex_engine.compile(r'^Dynamic( +(?P<pce>\(pce.*\)))? +\((?P<status>\w+)\)$')
 
         # Metric Type: IGP, Path Accumulated Metric: 2200
-        p12 = re.compile(r'^Metric +Type: +(?P<metric_type>[\S]+)\s+Path\s+Accumulated\s+Metric:\s+(?P<path_accumulated_metric>\d+)')
+        p12 = regex_engine.compile(r'^Metric +Type: +(?P<metric_type>[\S]+)\s+Path\s+Accumulated\s+Metric:\s+(?P<path_accumulated_metric>\d+)')
         
         #         16063 [Prefix-SID, 10.169.196.241]
         #         16072 [Prefix-SID, 10.189.5.253 - 10.189.6.253]
         #         16063
-        p13 = re.compile(r'^(?P<sid>[\d]+)(?: +\[(?P<sid_type>[\S]+), +(?P<local_address>[\S]+)'
-                         r'( +- +(?P<remote_address>[\S]+))?\])?$')
+        p13 = regex_engine.compile(r'^(?P<sid>[\d]+)(?: +\[(?P<sid_type>[\S]+), +(?P<local_address>[\S]+)'
+                                   r'( +- +(?P<remote_address>[\S]+))?\])?$')
         
         #     Binding SID: 15000
-        p14 = re.compile(r'^Binding +SID: +(?P<binding_sid>[\d]+)$')
+        p14 = regex_engine.compile(r'^Binding +SID: +(?P<binding_sid>[\d]+)$')
         
         # Forward Class: Not Configured
-        p15 = re.compile(r'^Forward\s+Class:\s+(?P<forward_class>\w+\s?\w+)$')
+        p15 = regex_engine.compile(r'^Forward\s+Class:\s+(?P<forward_class>\w+\s?\w+)$')
         
         # Steering labeled-services disabled: no
-        p16 = re.compile(r'^Steering\s+labeled.?services\s+disabled:\s+(?P<steering_labled_services_status>\w+)')
+        p16 = regex_engine.compile(r'^Steering\s+labeled.?services\s+disabled:\s+(?P<steering_labled_services_status>\w+)')
         
         #Steering BGP disabled: no
-        p17 = re.compile(r'^Steering\s+BGP\s+disabled:\s+(?P<steering_bgp_status>\w+)$')
+        p17 = regex_engine.compile(r'^Steering\s+BGP\s+disabled:\s+(?P<steering_bgp_status>\w+)$')
         
         # IPv6 caps enable: yes
-        p18 = re.compile(r'^IPv6\s+caps\s+enable:\s+(?P<ipv6_caps_status>\w+)$')
+        p18 = regex_engine.compile(r'^IPv6\s+caps\s+enable:\s+(?P<ipv6_caps_status>\w+)$')
         
         # Invalidation drop enabled: no
-        p19 = re.compile(r'^Invalidation\s+drop\s+enabled:\s+(?P<invalidation_drop_status>\w+)$')
+        p19 = regex_engine.compile(r'^Invalidation\s+drop\s+enabled:\s+(?P<invalidation_drop_status>\w+)$')
         
         # Max Install Standby Candidate Paths: 0
-        p20 = re.compile(r'^Max\s+Install\s+Standby\s+Candidate\s+Paths:\s+(?P<max_install_standby_pats>\d+)$')
+        p20 = regex_engine.compile(r'^Max\s+Install\s+Standby\s+Candidate\s+Paths:\s+(?P<max_install_standby_pats>\d+)$')
         
         # initial variables
         ret_dict = {}
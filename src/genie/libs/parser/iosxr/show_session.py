@@ -3,11 +3,13 @@ parser for:
 * show line
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowLineSchema(MetaParser):
     """Schema for show line"""
@@ -42,7 +44,7 @@ class ShowLine(ShowLineSchema):
         #    con0/RP1/CPU0  115200          0/0                 -/-
         #    vty0               0          0/0                 -/-
 
-        p1 = re.compile(r'(?P<active>\*)?\s*(?P<tty>[/\w]+)\s*(?P<speed>\d+)\s*(?P<overruns>\S+)\s*(?P<acci>\S+)/(?P<acco>\S+)$')
+        p1 = regex_engine.compile(r'(?P<active>\*)?\s*(?P<tty>[/\w]+)\s*(?P<speed>\d+)\s*(?P<overruns>\S+)\s*(?P<acci>\S+)/(?P<acco>\S+)$')
 
         ret_dict = {}
 
@@ -6,11 +6,13 @@ IOSXR parsers for the following show commands:
     * show shmwin summary location <WORD>
 '''
 
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==================================================
 # Parser for 'show shmwin summary [location <WORD>]'
@@ -66,10 +68,10 @@ class ShowShmwinSummary(ShowShmwinSummarySchema):
 
         # Virtual Memory size  : 1536 MBytes
         # Virtual Memory Group 2 size  : 384 MBytes
-        p1 = re.compile(r'Virtual Memory\s+(Group (?P<group>\d+)\s+)?size\s+:\s+(?P<virtual_mem_size>\d+) +MBytes')
+        p1 = regex_engine.compile(r'Virtual Memory\s+(Group (?P<group>\d+)\s+)?size\s+:\s+(?P<virtual_mem_size>\d+) +MBytes')
         # Virtual Memory Range : 0x50000000 - 0xb0000000
         # Virtual Memory Group 2 Range : 0xb8000000 - 0xd0000000
-        p2 = re.compile(r'Virtual Memory\s+(Group (?P<group>\d+)\s+)?Range\s+:\s+(?P<virtual_mem_range_start>\S+) +- +(?P<virtual_mem_range_end>\w+)')
+        p2 = regex_engine.compile(r'Virtual Memory\s+(Group (?P<group>\d+)\s+)?Range\s+:\s+(?P<virtual_mem_range_start>\S+) +- +(?P<virtual_mem_range_end>\w+)')
 
         # Window Name      ID  GRP #Usrs #Wrtrs Ownr Usage(KB) Peak(KB) Peak Timestamp
         # ---------------- --- --- ----- ------ ---- --------- -------- -------------------
@@ -83,14 +85,14 @@ class ShowShmwinSummary(ShowShmwinSummarySchema):
         # -----------------------------
         # ifo_ea_shm       130 P   1     1      0    2795      2795     03/18/2021 02:09:01
 
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'\s*(?P<window_name>\S+)\s+(?P<id>\d+)\s+(?P<group>\S+)\s+(?P<num_users>\d+)\s+(?P<num_writers>\d+)'
             r'\s+(?P<owner>\S+)\s+(?P<usage>\d+)\s+(?P<peak>\d+)\s+(?P<peak_date>\S+)\s+(?P<peak_time>\S+)'
         )
 
         # ---------------------------------------------
         # Total SHMWIN memory usage : 984 MBytes
-        p4 = re.compile(r'Total SHMWIN memory usage\s+:\s+(?P<total_shmwin_usage>\d+) +MBytes')
+        p4 = regex_engine.compile(r'Total SHMWIN memory usage\s+:\s+(?P<total_shmwin_usage>\d+) +MBytes')
 
         # initial variables
         ret_dict = {}
@@ -5,13 +5,13 @@ IOSXR parsers for the following show commands:
     * show snmp host
 '''
 
-# Python regex module
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ==========================
 # Schema for 'show snmp'
 # ==========================
@@ -86,91 +86,91 @@ class ShowSnmp(ShowSnmpSchema):
             output = output
 
         # Chassis: ABC0123A19Z
-        p0 = re.compile(r"^Chassis:\s?(?P<chassis>\S+|z{0,})$")
+        p0 = regex_engine.compile(r"^Chassis:\s?(?P<chassis>\S+|z{0,})$")
 
         # 34854563 SNMP packets input
-        p1 = re.compile(r"^(?P<input_pkts>\d+)\s+SNMP\s+packets\s+input$")
+        p1 = regex_engine.compile(r"^(?P<input_pkts>\d+)\s+SNMP\s+packets\s+input$")
 
         # 0 Bad SNMP version errors
-        p2 = re.compile(r"^(?P<bad_version>\d+)\s+Bad\s+SNMP\s+version\s+errors$")
+        p2 = regex_engine.compile(r"^(?P<bad_version>\d+)\s+Bad\s+SNMP\s+version\s+errors$")
 
         # 105 Unknown community name
-        p3 = re.compile(r"^(?P<unknown_community>\d+)\s+Unknown\s+community\s+name$")
+        p3 = regex_engine.compile(r"^(?P<unknown_community>\d+)\s+Unknown\s+community\s+name$")
 
         # 45 Illegal operation for community name supplied
-        p4 = re.compile(r"(?P<illegal_oper>\d+)\s+Illegal\s+operation\s+for\s+community\s+name\s+supplied$")
+        p4 = regex_engine.compile(r"(?P<illegal_oper>\d+)\s+Illegal\s+operation\s+for\s+community\s+name\s+supplied$")
 
         # 0 Encoding errors
-        p5 = re.compile(r"^(?P<encoding_errors>\d+)\s+Encoding\s+errors")
+        p5 = regex_engine.compile(r"^(?P<encoding_errors>\d+)\s+Encoding\s+errors")
 
         # 2415368 Number of requested variables
-        p6= re.compile(r"^(?P<requested_variables>\d+)\s+Number\s+of\s+requested\s+variables$")
+        p6= regex_engine.compile(r"^(?P<requested_variables>\d+)\s+Number\s+of\s+requested\s+variables$")
 
         # 68954 Number of altered variables
-        p7 = re.compile(r"^(?P<altered_variables>\d+)\s+Number\s+of\s+altered\s+variables$")
+        p7 = regex_engine.compile(r"^(?P<altered_variables>\d+)\s+Number\s+of\s+altered\s+variables$")
 
         # 22102104 Get-request PDUs
-        p8 = re.compile(r"^(?P<get_request_pdus>\d+)\s+Get-request\s+PDUs$")
+        p8 = regex_engine.compile(r"^(?P<get_request_pdus>\d+)\s+Get-request\s+PDUs$")
 
         # 972411 Get-next PDUs
-        p9 = re.compile(r"^(?P<get_next_pdus>\d+)\s+Get-next\s+PDUs$")
+        p9 = regex_engine.compile(r"^(?P<get_next_pdus>\d+)\s+Get-next\s+PDUs$")
 
         # 3878 Set-request PDUs
-        p10 = re.compile(r"^(?P<set_request_pdus>\d+)\s+Set-request\s+PDUs$")
+        p10 = regex_engine.compile(r"^(?P<set_request_pdus>\d+)\s+Set-request\s+PDUs$")
 
         # 42531179 SNMP packets output
-        p11 = re.compile(r"^(?P<output_pkts>\d+)\s+SNMP\s+packets\s+output$")
+        p11 = regex_engine.compile(r"^(?P<output_pkts>\d+)\s+SNMP\s+packets\s+output$")
 
         # 0 Too big errors (Maximum packet size 1500)
-        p12 = re.compile(r"^(?P<big_errors>\d+)\s+Too\s+big\s+errors\s+\(Maximum\s+packet\s+size\s+(?P<max_pkt_size>\d+)\)$")
+        p12 = regex_engine.compile(r"^(?P<big_errors>\d+)\s+Too\s+big\s+errors\s+\(Maximum\s+packet\s+size\s+(?P<max_pkt_size>\d+)\)$")
 
         # 160671 No such name errors
-        p13 = re.compile(r"^(?P<name_errors>\d+)\s+No\s+such\s+name\s+errors$")
+        p13 = regex_engine.compile(r"^(?P<name_errors>\d+)\s+No\s+such\s+name\s+errors$")
 
         # 0 Bad values errors
-        p14 = re.compile(r"^(?P<value_errors>\d+)\s+Bad\s+values\s+errors$")
+        p14 = regex_engine.compile(r"^(?P<value_errors>\d+)\s+Bad\s+values\s+errors$")
 
         # 0 General errors
-        p15 = re.compile(r"^(?P<general_errors>\d+)\s+General\s+errors$")
+        p15 = regex_engine.compile(r"^(?P<general_errors>\d+)\s+General\s+errors$")
 
         # 34854547 Response PDUs
-        p16 = re.compile(r"^(?P<response_pdus>\d+)\s+Response\s+PDUs$")
+        p16 = regex_engine.compile(r"^(?P<response_pdus>\d+)\s+Response\s+PDUs$")
 
         # 7676632 Trap PDUs
-        p17 = re.compile(r"^(?P<trap_pdus>\d+)\s+Trap\s+PDUs$")
+        p17 = regex_engine.compile(r"^(?P<trap_pdus>\d+)\s+Trap\s+PDUs$")
 
         # SNMP logging: Enabled
-        p18 = re.compile(r"^SNMP\s+logging:\s+(?P<logging_status>Enabled|Disabled)$")
+        p18 = regex_engine.compile(r"^SNMP\s+logging:\s+(?P<logging_status>Enabled|Disabled)$")
 
         # Logging to Notification host: 10.0.0.1, udp-port: 162
-        p19 = re.compile(r"^Logging\sto\sNotification\shost:\s(?P<logging_host>[a-fA-F\d.:]+),\sudp-port:\s(?P<udp_port>\d+)$")
+        p19 = regex_engine.compile(r"^Logging\sto\sNotification\shost:\s(?P<logging_host>[a-fA-F\d.:]+),\sudp-port:\s(?P<udp_port>\d+)$")
 
         # Trap Host Statistics
-        p20 = re.compile(r"^(?P<notification_type>(Trap|Inform))\sHost\sStatistics$")
+        p20 = regex_engine.compile(r"^(?P<notification_type>(Trap|Inform))\sHost\sStatistics$")
 
         # Number of pkts in Trap Queue: 0
-        p21 = re.compile(r"^Number\sof\spkts\sin\sTrap\sQueue:\s(?P<pkts_in_trap_queue>\d+)$")
+        p21 = regex_engine.compile(r"^Number\sof\spkts\sin\sTrap\sQueue:\s(?P<pkts_in_trap_queue>\d+)$")
 
         # Maximum length of Trap Queue: 100
-        p22 = re.compile(r"^Maximum\slength\sof\sTrap\sQueue:\s(?P<max_len_trap_queue>\d+)$")
+        p22 = regex_engine.compile(r"^Maximum\slength\sof\sTrap\sQueue:\s(?P<max_len_trap_queue>\d+)$")
 
         # Number of pkts sent: 0
-        p23 = re.compile(r"^Number\sof\spkts\ssent:\s(?P<pkts_sent>\d+)$")
+        p23 = regex_engine.compile(r"^Number\sof\spkts\ssent:\s(?P<pkts_sent>\d+)$")
 
         # Number of pkts dropped: 0
-        p24 = re.compile(r"^Number\sof\spkts\sdropped:\s(?P<pkts_dropped>\d+)$")
+        p24 = regex_engine.compile(r"^Number\sof\spkts\sdropped:\s(?P<pkts_dropped>\d+)$")
 
         # Number of Informs sent: 0
-        p25 = re.compile(r"^Number\sof\sInforms\ssent:\s(?P<informs_sent>\d+)$")
+        p25 = regex_engine.compile(r"^Number\sof\sInforms\ssent:\s(?P<informs_sent>\d+)$")
 
         # Number of Informs retries: 0
-        p26 = re.compile(r"^Number\sof\sInforms\sretries:\s(?P<informs_retries>\d+)$")
+        p26 = regex_engine.compile(r"^Number\sof\sInforms\sretries:\s(?P<informs_retries>\d+)$")
 
         # Number of Informs pending: 0
-        p27 = re.compile(r"^Number\sof\sInforms\spending:\s(?P<informs_pending>\d+)")
+        p27 = regex_engine.compile(r"^Number\sof\sInforms\spending:\s(?P<informs_pending>\d+)")
 
         # Number of Informs dropped: 0 
-        p28 = re.compile(r"^Number\sof\sInforms\sdropped:\s(?P<informs_dropped>\d+)$")
+        p28 = regex_engine.compile(r"^Number\sof\sInforms\sdropped:\s(?P<informs_dropped>\d+)$")
 
         snmp_dict = {}
 
@@ -534,16 +534,16 @@ class ShowSnmpHost(ShowSnmpHostSchema):
         # Notification host: 10.0.0.2 udp-port: 162  type: trap
         # Notification host: 2001:ab8::1 udp-port: 162  type: trap
         # Notification host: 2001:0:ab00:1234:0:2552:7777:1313 udp-port: 162  type: trap
-        p0 = re.compile(r"^Notification\shost:\s(?P<host>[a-fA-F\d.:]+)\sudp-port:\s(?P<udp_port>\d+)\s+type:\s(?P<type>\S+)$")
+        p0 = regex_engine.compile(r"^Notification\shost:\s(?P<host>[a-fA-F\d.:]+)\sudp-port:\s(?P<udp_port>\d+)\s+type:\s(?P<type>\S+)$")
 
         # Notification host: 10.0.0.4 udp-port: 162-VRFA  type: trap
-        p1 = re.compile(r"^Notification\shost:\s(?P<host>[a-fA-F\d.:]+)\sudp-port:\s(?P<udp_port>\d+)-(?P<vrf>\S+)\s*type:\s(?P<type>\S+)$")
+        p1 = regex_engine.compile(r"^Notification\shost:\s(?P<host>[a-fA-F\d.:]+)\sudp-port:\s(?P<udp_port>\d+)-(?P<vrf>\S+)\s*type:\s(?P<type>\S+)$")
 
         # user: public      security model: v2c
-        p2 = re.compile(r"^user:\s(?P<user>\S+)\s+security\smodel:\s(?P<version>\S+)$")
+        p2 = regex_engine.compile(r"^user:\s(?P<user>\S+)\s+security\smodel:\s(?P<version>\S+)$")
 
         # user: public3      security model: v3 priv
-        p3 = re.compile(r"^user:\s(?P<user>\S+)\s+security\smodel:\s(?P<version>\S+)\s(?P<v3_sec_level>\S+)$")
+        p3 = regex_engine.compile(r"^user:\s(?P<user>\S+)\s+security\smodel:\s(?P<version>\S+)\s(?P<v3_sec_level>\S+)$")
 
 
         for line in output.splitlines():
@@ -8,7 +8,6 @@ IOSXR parser for the following show commands:
 	* show spanning-tree pvstag {pvstag_domain}
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -20,6 +19,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 										 Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 """Schema for 'show spanning-tree mst {mst_id}'"""
@@ -88,39 +88,39 @@ class ShowSpanningTreeMst(ShowSpanningTreeMstSchema):
 		# initial return dictionary
 		ret_dict = {}
 		# MSTI 0 (CIST):
-		p1 = re.compile(r'^MSTI +(?P<mst_id>\d+)([\s\S]+)?:$')
+		p1 = regex_engine.compile(r'^MSTI +(?P<mst_id>\d+)([\s\S]+)?:$')
 		# VLANS Mapped: 1-4094
-		p2 = re.compile(r'^VLANS +Mapped: +(?P<vlan>\S+)$')
+		p2 = regex_engine.compile(r'^VLANS +Mapped: +(?P<vlan>\S+)$')
 		# CIST Root  Priority	32768
-		p3 = re.compile(r'^CIST\s+Root\s+Priority\s+'
+		p3 = regex_engine.compile(r'^CIST\s+Root\s+Priority\s+'
 			r'(?P<cist_root_priority>\d+)')
 		# Address	 0021.1bff.0e05
-		p4 = re.compile(r'^Address\s+(?P<address>[\w\.]+)$')
+		p4 = regex_engine.compile(r'^Address\s+(?P<address>[\w\.]+)$')
 		# Ext Cost    2000
-		p5 = re.compile(r'^Ext\s+Cost\s+(?P<cist_root_cost>\d+)$')
+		p5 = regex_engine.compile(r'^Ext\s+Cost\s+(?P<cist_root_cost>\d+)$')
 		# Root ID    Priority    32768
-		p6 = re.compile(r'^Root\s+ID\s+Priority\s+(?P<designated_root_priority>'
+		p6 = regex_engine.compile(r'^Root\s+ID\s+Priority\s+(?P<designated_root_priority>'
 			r'\d+)')
 		# Int Cost    0
-		p7 = re.compile(r'^Int\s+Cost\s+(?P<root_cost>\d+)$')
+		p7 = regex_engine.compile(r'^Int\s+Cost\s+(?P<root_cost>\d+)$')
 		# Max Age 20 sec, Forward Delay 15 sec
-		p8 = re.compile(r'^Max\s+Age\s+(?P<max_age>\d+)\s+sec,'
+		p8 = regex_engine.compile(r'^Max\s+Age\s+(?P<max_age>\d+)\s+sec,'
 			r'\s+Forward\s+Delay\s+(?P<forward_delay>\d+)\s+sec$')
 		# Max Hops 20, Transmit Hold count	6
-		p9 = re.compile(r'^Max\s+Hops\s+(?P<bridge_max_hops>\d+),'
+		p9 = regex_engine.compile(r'^Max\s+Hops\s+(?P<bridge_max_hops>\d+),'
 			r'\s+Transmit\s+Hold\s+count\s+(?P<bridge_transmit_hold_count>\d+)$')
 		# Bridge ID Priority 32768 (priority 32768 sys-id-ext 0)
-		p10 = re.compile(r'^Bridge\s+ID\s+Priority\s+(?P<bridge_priority>\d+)'
+		p10 = regex_engine.compile(r'^Bridge\s+ID\s+Priority\s+(?P<bridge_priority>\d+)'
 			r'(\s+\(priority\s+\d+\s+sys\-id\-ext\s+(?P<sys_id_ext>\d+)\))?')
 		# Te0/0/0/16   128.1   2000      ROOT FWD   32768 0021.1bff.0e05 128.1  
-		p11 = re.compile(r'^(?P<name>\S+)\s+(?P<port_priority>\d+)\.'
+		p11 = regex_engine.compile(r'^(?P<name>\S+)\s+(?P<port_priority>\d+)\.'
 			r'(?P<port_num>\d+)\s+(?P<cost>\d+)\s+(?P<role>\w+)\s+'
 			r'(?P<port_state>\w+)\s+((?P<designated_cost>\d+)\s+)?'
 			r'(?P<designated_bridge_priority>\d+)\s+(?P<designated_bridge_address>'
 			r'[\w\.]+)\s+(?P<designated_port_priority>\d+)\.'
 			r'(?P<designated_port_num>\d+)$')
 		# This bridge is the root
-		p12 = re.compile(r'This +bridge +is +(?P<this_bridge_is>[\w ]+)$')
+		p12 = regex_engine.compile(r'This +bridge +is +(?P<this_bridge_is>[\w ]+)$')
 		
 		for line in out.splitlines():
 			line = line.strip()
@@ -303,48 +303,48 @@ class ShowSpanningTreeMstag(ShowSpanningTreeMstagSchema):
 		ret_dict = {}
 
 		# Bundle-Ether10.0
-		p1 = re.compile(r'^(?P<mag_interface>\S+)$')
+		p1 = regex_engine.compile(r'^(?P<mag_interface>\S+)$')
 		# Pre-empt delay is disabled
 		# Preempt delay is disabled.
-		p2 = re.compile(r'^Pre(\-)?empt +delay +is +(?P<preempt_delay>\w+)\.?'
+		p2 = regex_engine.compile(r'^Pre(\-)?empt +delay +is +(?P<preempt_delay>\w+)\.?'
 			r'( +)?(?P<preempt_delay_state>Sending +(startup|standard) '
 			r'+BPDU( +until \S+)?)?')
 		# Name:            risc
-		p3 = re.compile(r'^Name:\s+(?P<name>\S+)$')
+		p3 = regex_engine.compile(r'^Name:\s+(?P<name>\S+)$')
 		# Revision: 1
-		p4 = re.compile(r'^Revision:\s+(?P<revision>\d+)$')
+		p4 = regex_engine.compile(r'^Revision:\s+(?P<revision>\d+)$')
 		# Max Age: 20
-		p5 = re.compile(r'^Max Age:\s+(?P<max_age>\d+)$')
+		p5 = regex_engine.compile(r'^Max Age:\s+(?P<max_age>\d+)$')
 		# Provider Bridge: no
-		p6 = re.compile(r'^Provider +Bridge:\s+(?P<provider_bridge>\w+)$')
+		p6 = regex_engine.compile(r'^Provider +Bridge:\s+(?P<provider_bridge>\w+)$')
 		# Bridge ID:       0000.00ff.0002
-		p7 = re.compile(r'^Bridge +ID:\s+(?P<bridge_id>[\w\.]+)$')
+		p7 = regex_engine.compile(r'^Bridge +ID:\s+(?P<bridge_id>[\w\.]+)$')
 		# Port ID:         1
-		p8 = re.compile(r'^Port +ID:\s+(?P<port_id>\d+)$')
+		p8 = regex_engine.compile(r'^Port +ID:\s+(?P<port_id>\d+)$')
 		# External Cost:   0
-		p9 = re.compile(r'^External +Cost:\s+(?P<external_cost>\d+)$')
+		p9 = regex_engine.compile(r'^External +Cost:\s+(?P<external_cost>\d+)$')
 		# Hello Time:      2
-		p10 = re.compile(r'^Hello +Time:\s+(?P<hello_time>\d+)$')
+		p10 = regex_engine.compile(r'^Hello +Time:\s+(?P<hello_time>\d+)$')
 		# Active:          yes
-		p11 = re.compile(r'^Active:\s+(?P<active>\w+)$')
+		p11 = regex_engine.compile(r'^Active:\s+(?P<active>\w+)$')
 		# BPDUs sent:      39921
-		p12 = re.compile(r'^BPDUs +sent:\s+(?P<bdpu_sent>\d+)$')
+		p12 = regex_engine.compile(r'^BPDUs +sent:\s+(?P<bdpu_sent>\d+)$')
 		# MSTI 0 (CIST):
-		p13 = re.compile(r'^MSTI +(?P<mst_id>\d+)( +\(CIST\))?:?$')
+		p13 = regex_engine.compile(r'^MSTI +(?P<mst_id>\d+)( +\(CIST\))?:?$')
 		#     VLAN IDs:         1-2,4-4094
-		p14 = re.compile(r'^VLAN +IDs:\s+(?P<vlans>\S+)$')
+		p14 = regex_engine.compile(r'^VLAN +IDs:\s+(?P<vlans>\S+)$')
 		#     Bridge Priority:  8192
-		p15 = re.compile(r'^Bridge +Priority:\s+(?P<priority>\d+)$')
+		p15 = regex_engine.compile(r'^Bridge +Priority:\s+(?P<priority>\d+)$')
 		#     Port Priority:    128
-		p16 = re.compile(r'^Port +Priority:\s+(?P<port_priority>\d+)$')
+		p16 = regex_engine.compile(r'^Port +Priority:\s+(?P<port_priority>\d+)$')
 		#     Cost:             0
-		p17 = re.compile(r'^Cost:\s+(?P<cost>\d+)$')
+		p17 = regex_engine.compile(r'^Cost:\s+(?P<cost>\d+)$')
 		#     Root Bridge:      0000.00ff.0001
-		p18 = re.compile(r'^Root +Bridge:\s+(?P<root_bridge>[\w\.]+)$')
+		p18 = regex_engine.compile(r'^Root +Bridge:\s+(?P<root_bridge>[\w\.]+)$')
 		#     Root Priority:    4096
-		p19 = re.compile(r'^Root +Priority:\s+(?P<root_priority>\d+)$')
+		p19 = regex_engine.compile(r'^Root +Priority:\s+(?P<root_priority>\d+)$')
 		#     Topology Changes: 31
-		p20 = re.compile(r'^Topology +Changes:\s+(?P<topology_changes>\d+)$')
+		p20 = regex_engine.compile(r'^Topology +Changes:\s+(?P<topology_changes>\d+)$')
 
 		for line in out.splitlines():
 			line = line.strip()
@@ -566,22 +566,22 @@ class ShowSpanningTreePvrst(ShowSpanningTreePvrstSchema):
 		ret_dict = {}
 
 		# VLAN 2:
-		p1 = re.compile(r'^VLAN +(?P<vlan_id>\d+):$')
+		p1 = regex_engine.compile(r'^VLAN +(?P<vlan_id>\d+):$')
 		# Root ID    Priority    32768
-		p2 = re.compile(r'^Root\s+ID\s+Priority\s+'
+		p2 = regex_engine.compile(r'^Root\s+ID\s+Priority\s+'
 			r'(?P<designated_root_priority>\d+)')
 		# Address     0021.1bff.d973
-		p3 = re.compile(r'^Address\s+(?P<address>[\w\.]+)$')
+		p3 = regex_engine.compile(r'^Address\s+(?P<address>[\w\.]+)$')
 		# Max Age 20 sec, Forward Delay 15 sec
-		p4 = re.compile(r'^Max\s+Age\s+(?P<max_age>\d+)\s+sec,'
+		p4 = regex_engine.compile(r'^Max\s+Age\s+(?P<max_age>\d+)\s+sec,'
 			r'\s+Forward\s+Delay\s+(?P<forward_delay>\d+)\s+sec$')
 		# Bridge ID  Priority    32768 (priority 32768 sys-id-ext 0)
-		p5 = re.compile(r'^Bridge\s+ID\s+Priority\s+(?P<bridge_priority>\d+)'
+		p5 = regex_engine.compile(r'^Bridge\s+ID\s+Priority\s+(?P<bridge_priority>\d+)'
 			r'(\s+\(priority\s+\d+\s+sys\-id\-ext\s+(?P<sys_id_ext>\d+)\))?')
 		# Transmit Hold count   6
-		p6 = re.compile(r'^Transmit\s+Hold\s+count\s+(?P<bridge_transmit_hold_count>\d+)')
+		p6 = regex_engine.compile(r'^Transmit\s+Hold\s+count\s+(?P<bridge_transmit_hold_count>\d+)')
 		# Gi0/7/0/0	128.1   20000	 DSGN FWD   32768 8cb6.4fff.6588 128.1
-		p7 = re.compile(r'^(?P<name>\S+)\s+(?P<port_priority>\d+)\.'
+		p7 = regex_engine.compile(r'^(?P<name>\S+)\s+(?P<port_priority>\d+)\.'
 			r'(?P<port_num>\d+)\s+(?P<cost>\d+)\s+(?P<role>\w+)\s+(?P<port_state>'
 			r'\w+)\s+(?P<designated_bridge_priority>\d+)\s+'
 			r'(?P<designated_bridge_address>[\w\.]+)\s+'
@@ -725,43 +725,43 @@ class ShowSpanningTreePvrsTag(ShowSpanningTreePvrsTagSchema):
 		ret_dict = {}
 
 		# VLAN 2:
-		p1 = re.compile(r'^VLAN\s+(?P<vlan_id>\d+)$')
+		p1 = regex_engine.compile(r'^VLAN\s+(?P<vlan_id>\d+)$')
 		# Pre-empt delay is enabled. Sending startup BPDU until 13:38:03
 		# Pre-empt delay is enabled. Sending standard BPDU
 		# Pre-empt delay is disabled
-		p2 = re.compile(r'^Pre\-empt +delay +is +(?P<preempt_delay>\w+)'
+		p2 = regex_engine.compile(r'^Pre\-empt +delay +is +(?P<preempt_delay>\w+)'
 			r'\.?( +)?(?P<preempt_delay_state>Sending +'
 			r'(startup|standard) +BPDU( +until \S+)?)?')
 		# Sub-interface:	GigabitEthernet0/0/0/1.5 (Up)
 		# Sub-interface:	Bundle-Ether1000.2100 (Up)
-		p3 = re.compile(r'^Sub\-interface:\s+(?P<sub_interface>\S+)\s+'
+		p3 = regex_engine.compile(r'^Sub\-interface:\s+(?P<sub_interface>\S+)\s+'
 			r'\((?P<sub_interface_state>\w+)\)$')
 		# Max Age:			20
-		p4 = re.compile(r'^Max\s+Age:\s+(?P<max_age>\d+)$')
+		p4 = regex_engine.compile(r'^Max\s+Age:\s+(?P<max_age>\d+)$')
 		# Root Priority:    0
-		p5 = re.compile(r'^Root\s+Priority:\s+(?P<root_priority>\d+)$')
+		p5 = regex_engine.compile(r'^Root\s+Priority:\s+(?P<root_priority>\d+)$')
 		# Root Bridge: 0000.0000.0000
-		p6 = re.compile(r'^Root\s+Bridge:\s+(?P<root_bridge>[\w\.]+)$')
+		p6 = regex_engine.compile(r'^Root\s+Bridge:\s+(?P<root_bridge>[\w\.]+)$')
 		# Cost:             1
-		p7 = re.compile(r'^Cost:\s+(?P<root_cost>\d+)$')
+		p7 = regex_engine.compile(r'^Cost:\s+(?P<root_cost>\d+)$')
 		# Bridge Priority:  32768
-		p8 = re.compile(r'^Bridge\s+Priority:\s+(?P<bridge_priority>\d+)$')
+		p8 = regex_engine.compile(r'^Bridge\s+Priority:\s+(?P<bridge_priority>\d+)$')
 		# Bridge ID:        0255.1dff.3c70
-		p9 = re.compile(r'^Bridge\s+ID:\s+(?P<bridge_id>[\w\.]+)$')
+		p9 = regex_engine.compile(r'^Bridge\s+ID:\s+(?P<bridge_id>[\w\.]+)$')
 		# Port Priority:    128
-		p10 = re.compile(r'^Port\s+Priority:\s+(?P<port_priority>\d+)$')
+		p10 = regex_engine.compile(r'^Port\s+Priority:\s+(?P<port_priority>\d+)$')
 		# Port ID           1
-		p11 = re.compile(r'^Port\s+ID:?\s+(?P<port_id>\d+)$')
+		p11 = regex_engine.compile(r'^Port\s+ID:?\s+(?P<port_id>\d+)$')
 		# Hello Time:       2
-		p12 = re.compile(r'^Hello\s+Time:\s+(?P<hello_time>\d+)$')
+		p12 = regex_engine.compile(r'^Hello\s+Time:\s+(?P<hello_time>\d+)$')
 		# Active:           Yes
-		p13 = re.compile(r'^Active:\s+(?P<active>\w+)$')
+		p13 = regex_engine.compile(r'^Active:\s+(?P<active>\w+)$')
 		# BPDUs sent:       6
-		p14 = re.compile(r'^BPDUs\s+sent:\s+(?P<bdpu_sent>\d+)$')
+		p14 = regex_engine.compile(r'^BPDUs\s+sent:\s+(?P<bdpu_sent>\d+)$')
 		# Topology Changes: 0
-		p15 = re.compile(r'^Topology\s+Changes:\s+(?P<topology_changes>\d+)$')
+		p15 = regex_engine.compile(r'^Topology\s+Changes:\s+(?P<topology_changes>\d+)$')
 		# GigabitEthernet0/0/0/1
-		p16 = re.compile(r'^(?P<interface>\S+)$')
+		p16 = regex_engine.compile(r'^(?P<interface>\S+)$')
 
 
 		for line in out.splitlines():
@@ -936,42 +936,42 @@ class ShowSpanningTreePvsTag(ShowSpanningTreePvsTagSchema):
 		ret_dict = {}
 
 		# VLAN 2:
-		p1 = re.compile(r'^VLAN\s+(?P<vlan_id>\d+)$')
+		p1 = regex_engine.compile(r'^VLAN\s+(?P<vlan_id>\d+)$')
 		# Pre-empt delay is enabled. Sending startup BPDU until 13:38:03
 		# Pre-empt delay is enabled. Sending standard BPDU
 		# Pre-empt delay is disabled
-		p2 = re.compile(r'^Pre\-empt +delay +is +(?P<preempt_delay>\w+)'
+		p2 = regex_engine.compile(r'^Pre\-empt +delay +is +(?P<preempt_delay>\w+)'
 			r'\.?( +Sending +(startup|standard) +BPDU( +until \S+)?)?')
 		# Sub-interface:	GigabitEthernet0/0/0/1.5 (Up)
 		# Sub-interface:	Bundle-Ether1000.2100 (Up)
-		p3 = re.compile(r'^Sub\-interface:\s+(?P<sub_interface>\S+)'
+		p3 = regex_engine.compile(r'^Sub\-interface:\s+(?P<sub_interface>\S+)'
 			r'\s+\((?P<sub_interface_state>\w+)\)$')
 		# Max Age:			20
-		p4 = re.compile(r'^Max\s+Age:\s+(?P<max_age>\d+)$')
+		p4 = regex_engine.compile(r'^Max\s+Age:\s+(?P<max_age>\d+)$')
 		# Root Priority:    0
-		p5 = re.compile(r'^Root\s+Priority:\s+(?P<root_priority>\d+)$')
+		p5 = regex_engine.compile(r'^Root\s+Priority:\s+(?P<root_priority>\d+)$')
 		# Root Bridge: 0000.0000.0000
-		p6 = re.compile(r'^Root\s+Bridge:\s+(?P<root_bridge>[\w\.]+)$')
+		p6 = regex_engine.compile(r'^Root\s+Bridge:\s+(?P<root_bridge>[\w\.]+)$')
 		# Cost:             1
-		p7 = re.compile(r'^Cost:\s+(?P<root_cost>\d+)$')
+		p7 = regex_engine.compile(r'^Cost:\s+(?P<root_cost>\d+)$')
 		# Bridge Priority:  32768
-		p8 = re.compile(r'^Bridge\s+Priority:\s+(?P<bridge_priority>\d+)$')
+		p8 = regex_engine.compile(r'^Bridge\s+Priority:\s+(?P<bridge_priority>\d+)$')
 		# Bridge ID:        0255.1dff.3c70
-		p9 = re.compile(r'^Bridge\s+ID:\s+(?P<bridge_id>[\w\.]+)$')
+		p9 = regex_engine.compile(r'^Bridge\s+ID:\s+(?P<bridge_id>[\w\.]+)$')
 		# Port Priority:    128
-		p10 = re.compile(r'^Port\s+Priority:\s+(?P<port_priority>\d+)$')
+		p10 = regex_engine.compile(r'^Port\s+Priority:\s+(?P<port_priority>\d+)$')
 		# Port ID           1
-		p11 = re.compile(r'^Port\s+ID:?\s+(?P<port_id>\d+)$')
+		p11 = regex_engine.compile(r'^Port\s+ID:?\s+(?P<port_id>\d+)$')
 		# Hello Time:       2
-		p12 = re.compile(r'^Hello\s+Time:\s+(?P<hello_time>\d+)$')
+		p12 = regex_engine.compile(r'^Hello\s+Time:\s+(?P<hello_time>\d+)$')
 		# Active:           Yes
-		p13 = re.compile(r'^Active:\s+(?P<active>\w+)$')
+		p13 = regex_engine.compile(r'^Active:\s+(?P<active>\w+)$')
 		# BPDUs sent:       6
-		p14 = re.compile(r'^BPDUs\s+sent:\s+(?P<bdpu_sent>\d+)$')
+		p14 = regex_engine.compile(r'^BPDUs\s+sent:\s+(?P<bdpu_sent>\d+)$')
 		# Topology Changes: 0
-		p15 = re.compile(r'^Topology\s+Changes:\s+(?P<topology_changes>\d+)$')
+		p15 = regex_engine.compile(r'^Topology\s+Changes:\s+(?P<topology_changes>\d+)$')
 		# GigabitEthernet0/0/0/1
-		p16 = re.compile(r'^(?P<interface>\S+)$')
+		p16 = regex_engine.compile(r'^(?P<interface>\S+)$')
 
 
 		for line in out.splitlines():
@@ -7,12 +7,10 @@ IOSXR parsers for the following show commands:
 '''
 
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
@@ -71,19 +69,19 @@ class ShowSsh(ShowSshSchema):
 
         # 1       ecdh-sha2-nistp256     ssh-rsa              aes128-ctr  aes128-ctr  hmac-sha2-256 hmac-sha2-256
         # 1       ecdh-sha2-nistp521     ecdsa-sha2-nistp256  aes128-ctr  aes128-ctr  hmac-sha2-512 hmac-sha2-512
-        p1 = re.compile(r'^(?P<id>(\d+))\s+(?P<key_exchange>(\S+))'
-                         r'\s+(?P<pubkey>(\S+))\s+(?P<incipher>(\S+))'
-                         r'\s+(?P<outcipher>(\S+))\s+(?P<inmac>(\S+))'
-                         r'\s+(?P<outmac>(\S+))$')
+        p1 = regex_engine.compile(r'^(?P<id>(\d+))\s+(?P<key_exchange>(\S+))'
+                                   r'\s+(?P<pubkey>(\S+))\s+(?P<incipher>(\S+))'
+                                   r'\s+(?P<outcipher>(\S+))\s+(?P<inmac>(\S+))'
+                                   r'\s+(?P<outmac>(\S+))$')
 
         # Incoming Session
-        p2 = re.compile(r'^Incoming Session')
+        p2 = regex_engine.compile(r'^Incoming Session')
 
         # Outgoing connection
-        p3 = re.compile(r'^Outgoing connection')
+        p3 = regex_engine.compile(r'^Outgoing connection')
 
         # SSH version : Cisco-2.0
-        p4 = re.compile(r'^SSH version : (?P<version>(\S+))')
+        p4 = regex_engine.compile(r'^SSH version : (?P<version>(\S+))')
     
         isIncoming = None
  
@@ -162,10 +160,10 @@ class ShowSshHistory(ShowSshHistorySchema):
         
         # Defines the regex for the lines of device output, which is
         #Incoming sessions
-        p1 = re.compile(r'^(Incoming sessions)')
+        p1 = regex_engine.compile(r'^(Incoming sessions)')
         
         #1        1    vty0    0/RP0/CPU0      admin     172.16.1.254          v2  key-intr       Command-Line-Interface
-        p2 = re.compile(r'(?P<id>\d+) +(?P<chan>\d+) +(?P<pty>\S+) +(?P<location>\S+) +(?P<userid>\S+) +(?P<host>\S+) +(?P<ver>\S+) +(?P<authentication>\S+) +(?P<connection_type>\S+)')
+        p2 = regex_engine.compile(r'(?P<id>\d+) +(?P<chan>\d+) +(?P<pty>\S+) +(?P<location>\S+) +(?P<userid>\S+) +(?P<host>\S+) +(?P<ver>\S+) +(?P<authentication>\S+) +(?P<connection_type>\S+)')
 
          # Defines the "for" loop, to pattern match each line of output
         for line in out.splitlines():
@@ -2,8 +2,8 @@
 show_static_route.py
 
 """
-import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
@@ -115,11 +115,11 @@ class ShowStaticTopologyDetail(ShowStaticTopologyDetailSchema):
         # regex
 
         # No routes in this topology
-        p = re.compile(r'^\s*No routes in this topology$')
+        p = regex_engine.compile(r'^\s*No routes in this topology$')
 
         # VRF: default Table Id: 0xe0000000 AFI: IPv4 SAFI: Unicast
-        p1 = re.compile(r'^\s*VRF: +(?P<vrf>[\w]+) +Table +Id: +(?P<table_id>[\w]+) +AFI: +(?P<af>[\w]+)'
-                        r' +SAFI: +(?P<safi>[\w]+)$')
+        p1 = regex_engine.compile(r'^\s*VRF: +(?P<vrf>[\w]+) +Table +Id: +(?P<table_id>[\w]+) +AFI: +(?P<af>[\w]+)'
+                                  r' +SAFI: +(?P<safi>[\w]+)$')
 
         # Prefix/Len          Interface                Nexthop             Object              Explicit-path       Metrics
         # 2001:1:1:1::1/128   GigabitEthernet0_0_0_3   2001:10:1:2::1      None                None                [0/0/1/0/1]
@@ -128,30 +128,30 @@ class ShowStaticTopologyDetail(ShowStaticTopologyDetailSchema):
         # Prefix/Len          Interface                Nexthop             Object         Explicit-path       Metrics          Local-Label
         # 172.16.0.89/32      TenGigE0_0_1_2           None                None          None                [0/4096/1/0/1]    No label    Path is configured at Sep 11 08:29:25.605
         # 10.00.00.0/00       Bundle-Ether2.25         10.01.02.03         None                None                [0/0/1/0/1]
-        p2 = re.compile(r'^(?P<route>([\s]+)?|([a-fA-F\d\/\.\:]+)?) '
-                        r'*(?P<interface>[a-zA-Z][\w\/\.-]+) '
-                        r'+(?P<nexthop>[\w\/\.\:]+) +(?P<object>[\w]+) '
-                        r'+(?P<explicit_path>[\w]+) +(?P<metrics>[\w\/\[\]]+)'
-                        r'(\s+(?P<local_label>[\w\s]+?))?'
-                        r'(\s+(?P<path_event>(Path|Last).*))?$')
+        p2 = regex_engine.compile(r'^(?P<route>([\s]+)?|([a-fA-F\d\/\.\:]+)?) '
+                                  r'*(?P<interface>[a-zA-Z][\w\/\.-]+) '
+                                  r'+(?P<nexthop>[\w\/\.\:]+) +(?P<object>[\w]+) '
+                                  r'+(?P<explicit_path>[\w]+) +(?P<metrics>[\w\/\[\]]+)'
+                                  r'(\s+(?P<local_label>[\w\s]+?))?'
+                                  r'(\s+(?P<path_event>(Path|Last).*))?$')
 
         # Path is installed into RIB at Dec  7 21:52:00.853
-        p3 = re.compile(r'^\s*(?P<path_event>Path +is +installed +into +RIB +at +(?P<date>[\S\s]+))$')
+        p3 = regex_engine.compile(r'^\s*(?P<path_event>Path +is +installed +into +RIB +at +(?P<date>[\S\s]+))$')
 
         # Path is configured at Dec  7 21:47:43.624
-        p3_1 = re.compile(r'^\s*(?P<path_event>Path +is +configured +at +(?P<date>[\S\s]+))$')
+        p3_1 = regex_engine.compile(r'^\s*(?P<path_event>Path +is +configured +at +(?P<date>[\S\s]+))$')
 
         # Path is removed from RIB at Dec  7 21:47:43.624
-        p3_2 = re.compile(r'^\s*(?P<path_event>Path +is +removed +from +RIB +at +(?P<date>[\S\s]+))$')
+        p3_2 = regex_engine.compile(r'^\s*(?P<path_event>Path +is +removed +from +RIB +at +(?P<date>[\S\s]+))$')
 
         # Last RIB event is at Dec  7 21:47:43.624
-        p3_3 = re.compile(r'^\s*(?P<path_event>Last +RIB +event +is +at +(?P<date>[\S\s]+))$')
+        p3_3 = regex_engine.compile(r'^\s*(?P<path_event>Last +RIB +event +is +at +(?P<date>[\S\s]+))$')
 
         # Path version: 1, Path status: 0x21
-        p4 = re.compile(r'^\s*Path +version: +(?P<path_version>[\d]+), +Path +status: +(?P<path_status>[\w]+)$')
+        p4 = regex_engine.compile(r'^\s*Path +version: +(?P<path_version>[\d]+), +Path +status: +(?P<path_status>[\w]+)$')
 
         # Path has best tag: 0
-        p5 = re.compile(r'^\s*Path +has +best +tag: +(?P<tag>[\d]+)$')
+        p5 = regex_engine.compile(r'^\s*Path +has +best +tag: +(?P<tag>[\d]+)$')
 
         for line in out.splitlines():
             if line:
@@ -6,12 +6,14 @@
 
 # Metaparser
 # python
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==================================================
 # Schema for 'show tacacs'
@@ -57,21 +59,21 @@ class ShowTacacs(ShowTacacsSchema):
         ret_dict = {}
 
         # Server: 127.0.0.1/24 vrf=default [private]
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Server:\s(?P<ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})\svrf=(?P<vrf>[A-Za-z0-9]+)\s?\[(?P<server_type>\w+)\]$')
 
         # Server: opens=123309 closes=123309 aborts=592 errors=0
-        p1_1 = re.compile(
+        p1_1 = regex_engine.compile(
             r'^Server:\s(?P<ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,2})\sopens=(?P<opens>\d+)\scloses=(?P<closes>\d+)\saborts=(?P<aborts>\d+)\serrors=(?P<errors>\d+)$')
 
         # opens=123309 closes=123309 aborts=592 errors=0
-        p2 = re.compile(r'^opens=(?P<opens>\d+)\scloses=(?P<closes>\d+)\saborts=(?P<aborts>\d+)\serrors=(?P<errors>\d+)$')
+        p2 = regex_engine.compile(r'^opens=(?P<opens>\d+)\scloses=(?P<closes>\d+)\saborts=(?P<aborts>\d+)\serrors=(?P<errors>\d+)$')
 
         #  packets in=134136 packets out=134161
-        p3 = re.compile(r'^packets\sin=(?P<packets_in>\d+)\spackets\sout=(?P<packets_out>\d+)$')
+        p3 = regex_engine.compile(r'^packets\sin=(?P<packets_in>\d+)\spackets\sout=(?P<packets_out>\d+)$')
 
         # status=up single-connect=false family=IPv4
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^status=(?P<status>\w+)\ssingle-connect=(?P<single_connect>\w+)\sfamily=(?P<family>\S+)$')
 
         # IP which is processed right now, will be used as dictionary index
@@ -3,7 +3,6 @@
 IOSXR parser for the following show command:
     * 'show tcp detail pcb all '
 """
-import re
 from typing import Dict, Any
 
 import genie.parsergen as pg
@@ -13,6 +12,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 import logging
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 log = logging.getLogger(__name__)
 
 
@@ -197,216 +199,216 @@ class ShowTcpDetailPcbAll(ShowTcpDetailPcbAllSchema):
         temp_data = {}
 
         # Connection state is ESTAB, I/O status: 0, socket status: 0
-        p1 = re.compile(r'^Connection +state +is *(?P<connection_state>\S+)'
-                        r'(, *(I\/O +status: *(?P<io_status>\d+))?)?'
-                        r'(, *(socket +status: *(?P<socket_status>\d+))?)?$')
+        p1 = regex_engine.compile(r'^Connection +state +is *(?P<connection_state>\S+)'
+                                  r'(, *(I\/O +status: *(?P<io_status>\d+))?)?'
+                                  r'(, *(socket +status: *(?P<socket_status>\d+))?)?$')
 
         # Established at Mon Jul 12 09:44:25 2021
-        p2 = re.compile(r'^Established +at +(?P<established_datetime>.+)$')
+        p2 = regex_engine.compile(r'^Established +at +(?P<established_datetime>.+)$')
 
         # PCB 0x00007f553800d8f8, SO 0x7f5538008698, TCPCB 0x7f5538008b58, vrfid 0x60000000,
-        p3 = re.compile(r'^PCB *(?P<pcb>\w+),? *'
-                        r'((SO *(?P<so>\w+))?)?,? *'
-                        r'((TCPCB *(?P<tcpcb>\w+))?)?,? *'
-                        r'((vrfid *(?P<vrfid>\w+))?)?,?$')
+        p3 = regex_engine.compile(r'^PCB *(?P<pcb>\w+),? *'
+                                  r'((SO *(?P<so>\w+))?)?,? *'
+                                  r'((TCPCB *(?P<tcpcb>\w+))?)?,? *'
+                                  r'((vrfid *(?P<vrfid>\w+))?)?,?$')
 
         # Pak Prio: Medium, TOS: 192, TTL: 1, Hash index: 26
-        p4 = re.compile(r'^Pak Prio: *(?P<pak_prio>\w+),?'
-                        r' *(TOS: *(?P<tos>\d+))?,?'
-                        r' *(TTL: *(?P<ttl>\d+))?,?'
-                        r' *(Hash index: *(?P<hash_index>\d+))?$')
+        p4 = regex_engine.compile(r'^Pak Prio: *(?P<pak_prio>\w+),?'
+                                  r' *(TOS: *(?P<tos>\d+))?,?'
+                                  r' *(TTL: *(?P<ttl>\d+))?,?'
+                                  r' *(Hash index: *(?P<hash_index>\d+))?$')
 
         # Local host: 2000:108:10::1, Local port: 179 (Local App PID: 11298)
-        p5 = re.compile(r'^Local host: *(?P<local_host>((\d{1,5}:)+:\d+))'
-                        r'(,? *(Local port: *(?P<local_port>\d+))?,? *)?'
-                        r'(\(Local App PID: *(?P<local_app_pid>\d+)\))?$')
+        p5 = regex_engine.compile(r'^Local host: *(?P<local_host>((\d{1,5}:)+:\d+))'
+                                  r'(,? *(Local port: *(?P<local_port>\d+))?,? *)?'
+                                  r'(\(Local App PID: *(?P<local_app_pid>\d+)\))?$')
 
         # Foreign host: 2000:108:10::2, Foreign port: 56357
-        p6 = re.compile(r'^Foreign host: *(?P<foreign_host>\S+), '
-                        r'(Foreign port: *(?P<foreign_port>\d+))?$')
+        p6 = regex_engine.compile(r'^Foreign host: *(?P<foreign_host>\S+), '
+                                  r'(Foreign port: *(?P<foreign_port>\d+))?$')
 
         # (Local App PID/instance/SPL_APP_ID: 11298/1/0)
-        p7 = re.compile(r'^\(Local App PID\/instance\/SPL_APP_ID: *(?P<local_instance_spl>\S+)\)$')
+        p7 = regex_engine.compile(r'^\(Local App PID\/instance\/SPL_APP_ID: *(?P<local_instance_spl>\S+)\)$')
 
         # Current send queue size in bytes: 0 (max 24576)
-        p8 = re.compile(r'^Current send queue size in bytes: *(?P<send_queue_size_bytes>\d+)'
-                        r' *(\(max *(?P<send_max_bytes>\d+)\))?$')
+        p8 = regex_engine.compile(r'^Current send queue size in bytes: *(?P<send_queue_size_bytes>\d+)'
+                                  r' *(\(max *(?P<send_max_bytes>\d+)\))?$')
 
         # Current receive queue size in bytes: 0 (max 32768)  mis-ordered: 0 bytes
-        p9 = re.compile(r'^Current receive queue size in bytes: *(?P<receive_queue_size_bytes>\d+) *'
-                        r'(\(max *(?P<receive_max_bytes>\d+)\))? *'
-                        r'(mis-ordered: *(?P<receive_mis_ordered_bytes>\d+) * bytes)?$')
+        p9 = regex_engine.compile(r'^Current receive queue size in bytes: *(?P<receive_queue_size_bytes>\d+) *'
+                                  r'(\(max *(?P<receive_max_bytes>\d+)\))? *'
+                                  r'(mis-ordered: *(?P<receive_mis_ordered_bytes>\d+) * bytes)?$')
 
         # Current receive queue size in packets: 0 (max 0)
-        p10 = re.compile(r'^Current receive queue size in packets: *(?P<receive_queue_packages>\d+) *'
-                         r'(\(max *(?P<receive_max_packages>\d+)\))?$')
+        p10 = regex_engine.compile(r'^Current receive queue size in packets: *(?P<receive_queue_packages>\d+) *'
+                                   r'(\(max *(?P<receive_max_packages>\d+)\))?$')
 
         # Timer          Starts    Wakeups         Next(msec)
-        p11 = re.compile(r'^Timer +Starts +Wakeups +Next\(msec\)$')
+        p11 = regex_engine.compile(r'^Timer +Starts +Wakeups +Next\(msec\)$')
 
         # Retrans             3          0                0
-        p12 = re.compile(r'^Retrans +(?P<retrans_starts>\d+) +'
-                         r'(?P<retrans_wakeups>\d+) +'
-                         r'(?P<retrans_next_msec>\d+)$')
+        p12 = regex_engine.compile(r'^Retrans +(?P<retrans_starts>\d+) +'
+                                   r'(?P<retrans_wakeups>\d+) +'
+                                   r'(?P<retrans_next_msec>\d+)$')
 
         # SendWnd             0          0                0
-        p13 = re.compile(r'^SendWnd +(?P<sendwnd_starts>\d+) +'
-                         r'(?P<sendwnd_wakeups>\d+) +'
-                         r'(?P<sendwnd_next_msec>\d+)$')
+        p13 = regex_engine.compile(r'^SendWnd +(?P<sendwnd_starts>\d+) +'
+                                   r'(?P<sendwnd_wakeups>\d+) +'
+                                   r'(?P<sendwnd_next_msec>\d+)$')
 
         # TimeWait            0          0                0
-        p14 = re.compile(r'^TimeWait +(?P<timewait_starts>\d+) +'
-                         r'(?P<timewait_wakeups>\d+) +'
-                         r'(?P<timewait_next_msec>\d+)$')
+        p14 = regex_engine.compile(r'^TimeWait +(?P<timewait_starts>\d+) +'
+                                   r'(?P<timewait_wakeups>\d+) +'
+                                   r'(?P<timewait_next_msec>\d+)$')
 
         # AckHold             4          3                0
-        p15 = re.compile(r'^AckHold +(?P<ackhold_starts>\d+) +'
-                         r'(?P<ackhold_wakeups>\d+) +'
-                         r'(?P<ackhold_next_msec>\d+)$')
+        p15 = regex_engine.compile(r'^AckHold +(?P<ackhold_starts>\d+) +'
+                                   r'(?P<ackhold_wakeups>\d+) +'
+                                   r'(?P<ackhold_next_msec>\d+)$')
 
         # KeepAlive           1          0                0
-        p16 = re.compile(r'^KeepAlive +(?P<keepalive_starts>\d+) +'
-                         r'(?P<keepalive_wakeups>\d+) +'
-                         r'(?P<keepalive_next_msec>\d+)$')
+        p16 = regex_engine.compile(r'^KeepAlive +(?P<keepalive_starts>\d+) +'
+                                   r'(?P<keepalive_wakeups>\d+) +'
+                                   r'(?P<keepalive_next_msec>\d+)$')
 
         # PmtuAger            0          0                0
-        p17 = re.compile(r'^PmtuAger +(?P<pmtuager_starts>\d+) +'
-                         r'(?P<pmtuager_wakeups>\d+) +'
-                         r'(?P<pmtuager_next_msec>\d+)$')
+        p17 = regex_engine.compile(r'^PmtuAger +(?P<pmtuager_starts>\d+) +'
+                                   r'(?P<pmtuager_wakeups>\d+) +'
+                                   r'(?P<pmtuager_next_msec>\d+)$')
 
         # GiveUp              0          0                0
-        p18 = re.compile(r'^GiveUp +(?P<giveup_starts>\d+) +'
-                         r'(?P<giveup_wakeups>\d+) +'
-                         r'(?P<giveup_next_msec>\d+)$')
+        p18 = regex_engine.compile(r'^GiveUp +(?P<giveup_starts>\d+) +'
+                                   r'(?P<giveup_wakeups>\d+) +'
+                                   r'(?P<giveup_next_msec>\d+)$')
 
         # Throttle            0          0                0
-        p19 = re.compile(r'^Throttle +(?P<throttle_starts>\d+) +'
-                         r'(?P<throttle_wakeups>\d+) +'
-                         r'(?P<throttle_next_msec>\d+)$')
+        p19 = regex_engine.compile(r'^Throttle +(?P<throttle_starts>\d+) +'
+                                   r'(?P<throttle_wakeups>\d+) +'
+                                   r'(?P<throttle_next_msec>\d+)$')
 
         #    iss: 1042166212  snduna: 1042166346  sndnxt: 1042166346
-        p20 = re.compile(r'^(iss: *(?P<iss_sequence>\d+))? *'
-                         r'(snduna: *(?P<snduna_sequence>\d+))? *'
-                         r'(sndnxt: *(?P<sndnxt_sequence>\d+))?$')
+        p20 = regex_engine.compile(r'^(iss: *(?P<iss_sequence>\d+))? *'
+                                   r'(snduna: *(?P<snduna_sequence>\d+))? *'
+                                   r'(sndnxt: *(?P<sndnxt_sequence>\d+))?$')
 
         #    sndmax: 1042166346  sndwnd: 32739       sndcwnd: 2880
-        p21 = re.compile(r'(sndmax: *(?P<sndmax_sequence>\d+) *)?'
-                         r'(sndwnd: *(?P<sndwnd_sequence>\d+))? *'
-                         r'(sndcwnd: *(?P<sndcwnd_sequence>\d+))?$')
+        p21 = regex_engine.compile(r'(sndmax: *(?P<sndmax_sequence>\d+) *)?'
+                                   r'(sndwnd: *(?P<sndwnd_sequence>\d+))? *'
+                                   r'(sndcwnd: *(?P<sndcwnd_sequence>\d+))?$')
 
         #    irs: 309426134   rcvnxt: 309426287   rcvwnd: 32701   rcvadv: 309458988
-        p22 = re.compile(r'(irs: *(?P<irs_sequence>\d+) *)?'
-                         r'(rcvnxt: *(?P<rcvnxt_sequence>\d+))? *'
-                         r'(rcvwnd: *(?P<rcvwnd_sequence>\d+))? *'
-                         r'(rcvadv: *(?P<rcvadv_sequence>\d+))?$')
+        p22 = regex_engine.compile(r'(irs: *(?P<irs_sequence>\d+) *)?'
+                                   r'(rcvnxt: *(?P<rcvnxt_sequence>\d+))? *'
+                                   r'(rcvwnd: *(?P<rcvwnd_sequence>\d+))? *'
+                                   r'(rcvadv: *(?P<rcvadv_sequence>\d+))?$')
 
         # SRTT: 28 ms,  RTTO: 300 ms,  RTV: 214 ms,  KRTT: 0 ms
-        p23 = re.compile(r'^SRTT: *(?P<srtt_round_trips>\d+) ms, *'
-                         r'(RTTO: *(?P<rtto_round_trips>\d+) ms)?, *'
-                         r'(RTV: *(?P<rtv_round_trips>\d+) ms)?, *'
-                         r'(KRTT: *(?P<krtt_round_trips>\d+) ms)?$')
+        p23 = regex_engine.compile(r'^SRTT: *(?P<srtt_round_trips>\d+) ms, *'
+                                   r'(RTTO: *(?P<rtto_round_trips>\d+) ms)?, *'
+                                   r'(RTV: *(?P<rtv_round_trips>\d+) ms)?, *'
+                                   r'(KRTT: *(?P<krtt_round_trips>\d+) ms)?$')
 
         # minRTT: 2 ms,  maxRTT: 213 ms
-        p24 = re.compile(r'^minRTT: *(?P<minrtt_round_trips>\d+) ms,? *'
-                         r'(maxRTT: *(?P<maxrtt_round_trips>\d+) ms)?$')
+        p24 = regex_engine.compile(r'^minRTT: *(?P<minrtt_round_trips>\d+) ms,? *'
+                                   r'(maxRTT: *(?P<maxrtt_round_trips>\d+) ms)?$')
 
         # ACK hold time: 200 ms, Keepalive time: 0 sec, SYN waittime: 30 sec
-        p25 = re.compile(r'^ACK hold time: *(?P<ack_holdtime_ms>\d+) ms,? *'
-                         r'(Keepalive time: *(?P<keepalive_time_sec>\d+) sec)?,? *'
-                         r'(SYN waittime: *(?P<syn_waittime_sec>\d+) sec)?$')
+        p25 = regex_engine.compile(r'^ACK hold time: *(?P<ack_holdtime_ms>\d+) ms,? *'
+                                   r'(Keepalive time: *(?P<keepalive_time_sec>\d+) sec)?,? *'
+                                   r'(SYN waittime: *(?P<syn_waittime_sec>\d+) sec)?$')
 
         # Giveup time: 0 ms, Retransmission retries: 0, Retransmit forever: FALSE
-        p26 = re.compile(r'^Giveup time: *(?P<giveup_time_ms>\d+) ms,? *'
-                         r'(Retransmission retries: *(?P<retransmission_retries>\d+))?,? *'
-                         r'(Retransmit forever: *(?P<retransmit_forever>\S+))?$')
+        p26 = regex_engine.compile(r'^Giveup time: *(?P<giveup_time_ms>\d+) ms,? *'
+                                   r'(Retransmission retries: *(?P<retransmission_retries>\d+))?,? *'
+                                   r'(Retransmit forever: *(?P<retransmit_forever>\S+))?$')
 
         # Connect retries remaining: 0, connect retry interval: 0 secs
-        p27 = re.compile(r'^Connect retries remaining: *(?P<connect_retries_remaining>\d+)'
-                         r',? *(connect retry interval: *(?P<connect_retry_interval>\d+) secs)?$')
+        p27 = regex_engine.compile(r'^Connect retries remaining: *(?P<connect_retries_remaining>\d+)'
+                                   r',? *(connect retry interval: *(?P<connect_retry_interval>\d+) secs)?$')
 
         # State flags: none
-        p28 = re.compile(r'^State flags: *(?P<states_flags>.+)$')
+        p28 = regex_engine.compile(r'^State flags: *(?P<states_flags>.+)$')
 
         # Feature flags: Win Scale, Nagle
-        p29 = re.compile(r'^Feature flags: *(?P<feature_flags>.+)$')
+        p29 = regex_engine.compile(r'^Feature flags: *(?P<feature_flags>.+)$')
 
         # Request flags: Win Scale
-        p30 = re.compile(r'^Request flags: *(?P<request_flags>.+)$')
+        p30 = regex_engine.compile(r'^Request flags: *(?P<request_flags>.+)$')
 
         # Datagrams (in bytes): MSS 1440, peer MSS 1440, min MSS 1440, max MSS 1440
-        p31 = re.compile(r'^Datagrams *(\(in bytes\))?: *(MSS *(?P<mss>\d+))?,? *'
-                         r'(peer MSS *(?P<peer_mss>\d+))?,? *'
-                         r'(min MSS *(?P<min_mss>\d+))?,? *'
-                         r'(max MSS *(?P<max_mss>\d+))?$')
+        p31 = regex_engine.compile(r'^Datagrams *(\(in bytes\))?: *(MSS *(?P<mss>\d+))?,? *'
+                                   r'(peer MSS *(?P<peer_mss>\d+))?,? *'
+                                   r'(min MSS *(?P<min_mss>\d+))?,? *'
+                                   r'(max MSS *(?P<max_mss>\d+))?$')
 
         # Window scales: rcv 0, snd 0, request rcv 0, request snd 0
-        p32 = re.compile(r'^Window scales: *(rcv *(?P<rcv>\d+))?,? *'
-                         r'(snd *(?P<snd>\d+))?,? *'
-                         r'(request rcv *(?P<request_rcv>\d+))?,? *'
-                         r'(request snd *(?P<request_snd>\d+))?$')
+        p32 = regex_engine.compile(r'^Window scales: *(rcv *(?P<rcv>\d+))?,? *'
+                                   r'(snd *(?P<snd>\d+))?,? *'
+                                   r'(request rcv *(?P<request_rcv>\d+))?,? *'
+                                   r'(request snd *(?P<request_snd>\d+))?$')
 
         # Timestamp option: recent 0, recent age 0, last ACK sent 0
-        p33 = re.compile(r'^Timestamp option: *(recent *(?P<recent>\d+))?,? *'
-                         r'(recent age *(?P<recent_age>\d+))?,? *'
-                         r'(last ACK sent *(?P<last_ACK_sent>\d+))?$')
+        p33 = regex_engine.compile(r'^Timestamp option: *(recent *(?P<recent>\d+))?,? *'
+                                   r'(recent age *(?P<recent_age>\d+))?,? *'
+                                   r'(last ACK sent *(?P<last_ACK_sent>\d+))?$')
 
         # Sack blocks {start, end}: none
         # Sack blocks {start, end}: 100/200
-        p34 = re.compile(r'^Sack blocks {start, end}: *(?P<blocks_start_end>(\d+\/\d+|\w+))$')
+        p34 = regex_engine.compile(r'^Sack blocks {start, end}: *(?P<blocks_start_end>(\d+\/\d+|\w+))$')
 
         # Sack holes {start, end, dups, rxmit}: none
-        p35 = re.compile(r'^Sack holes {start, end, dups, rxmit}: *(?P<holes_start_end>.+)$')
+        p35 = regex_engine.compile(r'^Sack holes {start, end, dups, rxmit}: *(?P<holes_start_end>.+)$')
 
         # Socket options: SO_REUSEADDR, SO_REUSEPORT, SO_NBIO
-        p36 = re.compile(r'^Socket options: *(?P<socket_options>.+)$')
+        p36 = regex_engine.compile(r'^Socket options: *(?P<socket_options>.+)$')
 
         # Socket states: SS_ISCONNECTED, SS_PRIV
-        p37 = re.compile(r'^Socket states: *(?P<socket_states>.+)$')
+        p37 = regex_engine.compile(r'^Socket states: *(?P<socket_states>.+)$')
 
         # Socket receive buffer states: SB_DEL_WAKEUP
-        p38 = re.compile(r'^Socket receive buffer states: *(?P<receive_buffer_states>.+)$')
+        p38 = regex_engine.compile(r'^Socket receive buffer states: *(?P<receive_buffer_states>.+)$')
 
         # Socket send buffer states: SB_DEL_WAKEUP
-        p39 = re.compile(r'^Socket send buffer states: *(?P<send_buffer_states>.+)$')
+        p39 = regex_engine.compile(r'^Socket send buffer states: *(?P<send_buffer_states>.+)$')
 
         # Socket receive buffer: Low/High watermark 1/32768
-        p40 = re.compile(r'^Socket receive buffer: *(Low\/High watermark *(?P<receive_buffer>\S+))?$')
+        p40 = regex_engine.compile(r'^Socket receive buffer: *(Low\/High watermark *(?P<receive_buffer>\S+))?$')
 
         # Socket send buffer   : Low/High watermark 2048/24576, Notify threshold 0
-        p41 = re.compile(r'^Socket send buffer +: '
-                         r'(Low\/High watermark *(?P<send_low_high_watermark>\d+\/\d+))?,? *'
-                         r'(Notify threshold *(?P<send_notify_threshold>\d+))?$')
+        p41 = regex_engine.compile(r'^Socket send buffer +: '
+                                   r'(Low\/High watermark *(?P<send_low_high_watermark>\d+\/\d+))?,? *'
+                                   r'(Notify threshold *(?P<send_notify_threshold>\d+))?$')
 
         # Socket misc info     : Rcv data size (sb_cc) 0, so_qlen 0,
-        p42 = re.compile(r'^Socket misc info +: *(Rcv data size \(sb_cc\) *'
-                         r'(?P<rcv_data_size>\d+))?(,? *'
-                         r'(so_qlen *(?P<misc_so_qlen>\d+))?)?,?$')
+        p42 = regex_engine.compile(r'^Socket misc info +: *(Rcv data size \(sb_cc\) *'
+                                   r'(?P<rcv_data_size>\d+))?(,? *'
+                                   r'(so_qlen *(?P<misc_so_qlen>\d+))?)?,?$')
 
         #           so_q0len 0, so_qlimit 0, so_error 0
-        p43 = re.compile(r'so_q0len *(?P<so_q0len>\d+),? *'
-                         r'(so_qlimit *(?P<so_qlimit>\d+))?,? *'
-                         r'(so_error *(?P<so_error>\d+))?$')
+        p43 = regex_engine.compile(r'so_q0len *(?P<so_q0len>\d+),? *'
+                                   r'(so_qlimit *(?P<so_qlimit>\d+))?,? *'
+                                   r'(so_error *(?P<so_error>\d+))?$')
 
         #            so_auto_rearm 1
-        p44 = re.compile(r'so_auto_rearm *(?P<so_auto_rearm>\d+)$')
+        p44 = regex_engine.compile(r'so_auto_rearm *(?P<so_auto_rearm>\d+)$')
 
         # PDU information:
-        p45 = re.compile(r'^PDU information:$')
+        p45 = regex_engine.compile(r'^PDU information:$')
 
         #  #PDU's in buffer: 0
-        p46 = re.compile(r'#?PDU\'s in buffer: *(?P<pdu_in_buffer>\d+)$')
+        p46 = regex_engine.compile(r'#?PDU\'s in buffer: *(?P<pdu_in_buffer>\d+)$')
 
         # FIB Lookup Cache:  IFH: 0x1000058  PD ctx: size: 8  data: 0x0 0xa6fe66ce
-        p47 = re.compile(r'^FIB Lookup Cache: *'
-                         r'(IFH: *(?P<fib_ifh>\S+))? *'
-                         r'(PD ctx: size: *(?P<pd_ctx_size>\d+))? *'
-                         r'(data: *(?P<pd_ctx_data>.+))?$')
+        p47 = regex_engine.compile(r'^FIB Lookup Cache: *'
+                                   r'(IFH: *(?P<fib_ifh>\S+))? *'
+                                   r'(PD ctx: size: *(?P<pd_ctx_size>\d+))? *'
+                                   r'(data: *(?P<pd_ctx_data>.+))?$')
 
         # Num Labels: 0  Label Stack: 0
-        p48 = re.compile(r'^Num Labels: *(?P<num_label>\d+) *(Label Stack:)?$')
+        p48 = regex_engine.compile(r'^Num Labels: *(?P<num_label>\d+) *(Label Stack:)?$')
 
         # Num of peers with authentication info: 0
-        p49 = re.compile(r'^Num of peers with authentication info: *(?P<num_peer_with_auth>\d+)$')
+        p49 = regex_engine.compile(r'^Num of peers with authentication info: *(?P<num_peer_with_auth>\d+)$')
 
         pcb_key = None
         current_queue = None
@@ -3,10 +3,12 @@ IOSXR parsers for the following show commands:
     * show terminal
 '''
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Optional, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Schema for 'show terminal'
 # =============================================
@@ -55,23 +57,23 @@ class ShowTerminal(ShowTerminalSchema):
         ret_dict = {}
 
         # Line 0, Location: "", Type: ""
-        p0 = re.compile(r'^Line "(?P<line>.*?)", Location "(?P<location>.*?)", Type "(?P<type>.*?)"$')
+        p0 = regex_engine.compile(r'^Line "(?P<line>.*?)", Location "(?P<location>.*?)", Type "(?P<type>.*?)"$')
 
         # Length: 0 lines, Width: 0 columns
-        p1 = re.compile(r'^Length: (?P<length>\d+) lines, Width: (?P<width>\d+) columns$')
+        p1 = regex_engine.compile(r'^Length: (?P<length>\d+) lines, Width: (?P<width>\d+) columns$')
 
         # Baud rate (TX/RX) is 9600/9600, no parity, 1 stopbits, 8 databits
-        p2 = re.compile(r'^Baud rate \(TX\/RX\) is (?P<baud_rate>\d+), '
-                        r'"(?P<parity>\w+)" Parity, (?P<stopbits>\d) stopbits, (?P<databits>\w+) databits$')
+        p2 = regex_engine.compile(r'^Baud rate \(TX\/RX\) is (?P<baud_rate>\d+), '
+                                  r'"(?P<parity>\w+)" Parity, (?P<stopbits>\d) stopbits, (?P<databits>\w+) databits$')
 
         # Template: console
-        p3 = re.compile(r'^Template: (?P<template>\w+)$')
+        p3 = regex_engine.compile(r'^Template: (?P<template>\w+)$')
 
         # Capabilities: Timestamp Enabled
-        p4 = re.compile(r'Capabilities: (?P<capabilities>[\w\s]+)')
+        p4 = regex_engine.compile(r'Capabilities: (?P<capabilities>[\w\s]+)')
 
         # Allowed transports are none.
-        p5 = re.compile(r'^Allowed transports are (?P<allowed_transport>[\w\s]+)\.?\s*$')
+        p5 = regex_engine.compile(r'^Allowed transports are (?P<allowed_transport>[\w\s]+)\.?\s*$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -8,14 +8,12 @@ Parser for the following show commands:
 
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -55,7 +53,7 @@ class ShowTrafficCollecterExternalInterface(ShowTrafficCollecterExternalInterfac
         # Te0/1/0/3             Enabled 
         # Te0/1/0/4             Enabled
 
-        p1 = re.compile(r'(?P<interface>^\w+[\.\/\d]+) +(?P<status>\S+)')
+        p1 = regex_engine.compile(r'(?P<interface>^\w+[\.\/\d]+) +(?P<status>\S+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -123,24 +121,24 @@ class ShowTrafficCollecterIpv4CountersPrefixDetail(ShowTrafficCollecterIpv4Count
         ret_dict = {}
 
         # Prefix: 10.4.1.10/32  Label: 16010 State: Active
-        p1 = re.compile(r'Prefix: +(?P<prefix>[\d\.\/]+) +'
+        p1 = regex_engine.compile(r'Prefix: +(?P<prefix>[\d\.\/]+) +'
         r'Label: +(?P<label>\d+) +State: (?P<state>\S+)')
 
         #Base:
         #TM Counters:
-        p2 = re.compile(r'(?P<counters>(Base|TM Counters)):')
+        p2 = regex_engine.compile(r'(?P<counters>(Base|TM Counters)):')
 
         # Average over the last 5 collection intervals:
-        p3 = re.compile(r'Average +over +the +last +(?P<interval>\d+) +collection '
+        p3 = regex_engine.compile(r'Average +over +the +last +(?P<interval>\d+) +collection '
         r'+intervals:')
             
         # Packet rate: 9496937 pps, Byte rate: 9363979882 Bps
-        p4 = re.compile (r'Packet +rate: +(?P<packet_rate>\d+) +pps, Byte '
+        p4 = regex_engine.compile (r'Packet +rate: +(?P<packet_rate>\d+) +pps, Byte '
         r'+rate: +(?P<byte_rate>\d+) +Bps')
         
         # History of counters:
         #     23:01 - 23:02: Packets 9379529, Bytes: 9248215594 
-        p5 = re.compile(r'(?P<time_slot>[\d\:\-\s]+): +Packets +(?P<packets>\d+), '
+        p5 = regex_engine.compile(r'(?P<time_slot>[\d\:\-\s]+): +Packets +(?P<packets>\d+), '
         r'+Bytes: +(?P<bytes>\d+)')
 
         for line in out.splitlines():
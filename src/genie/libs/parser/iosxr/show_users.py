@@ -1,10 +1,10 @@
 """show_users.py
 
 """
-import re
 import genie.parsergen as pg
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.metaparser import MetaParser
@@ -52,7 +52,7 @@ class ShowUsers(ShowUsersSchema):
         ret_dict = {}
         
         # * con0/RP0/CPU0   admin   hardware     0  00:00:00
-        p = re.compile(r'(?P<active>\*)? *(?P<line>\S+) +(?P<user>\S+) +(?P<service>\S+) +(?P<conns>\d+) +(?P<idle>[\d:]+)*(?P<location>[^*]+)?$')
+        p = regex_engine.compile(r'(?P<active>\*)? *(?P<line>\S+) +(?P<user>\S+) +(?P<service>\S+) +(?P<conns>\d+) +(?P<idle>[\d:]+)*(?P<location>[^*]+)?$')
 
         for cur_line in out.splitlines():
             cur_line = cur_line.strip()
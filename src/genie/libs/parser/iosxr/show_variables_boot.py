@@ -4,13 +4,13 @@ IOSXR parser for the following show command:
     * 'show variables boot'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =======================================
 # Schema for 'show variables boot'
 # =======================================
@@ -60,22 +60,22 @@ class ShowVariablesBoot(ShowVariablesBootSchema):
         parsed_dict = {}
         
         # root=/dev/panini_vol_grp/xr_lv68 platform=asr9k boardtype=RP cardtype=0x101014 iputype=0x02f52029 vmtype=xr-vm quiet virtvm bigphysarea="12M" chassis_type=0xef1015 intel_idle.max_cstate=0 processor.max_cstate=1 chassis_serial=FOC2412N8LP chassis_pid=ASR-9901 console=tty0 console=hvc0 prod=1 pci=hpmemsize=0M,hpiosize=0M
-        p = re.compile(r'^root=(?P<root>[\w\/]+) +'
-                       r'platform=(?P<platform>[\w]+) +'
-                       r'boardtype=(?P<boardtype>[\w]+) +'
-                       r'cardtype=(?P<cardtype>[\w]+) +'
-                       r'iputype=(?P<iputype>[\w]+) +'
-                       r'vmtype=(?P<vmtype>[\w -]+) +'
-                       r'bigphysarea="?(?P<bigphysarea>[\w]+)"? +'
-                       r'chassis_type=(?P<chassis_type>[\w]+) +'
-                       r'intel_idle\.max_cstate=(?P<intel_idle_max_cstate>[\d]+) +'
-                       r'processor\.max_cstate=(?P<processor_max_cstate>[\d]+) +'
-                       r'chassis_serial=(?P<chassis_serial>[\w]+) +'
-                       r'chassis_pid=(?P<chassis_pid>[\w-]+) +'
-                       r'console=(?P<primary_console>[\w]+) +'
-                       r'(console=(?P<secondary_console>[\w]+) +)?'
-                       r'prod=(?P<prod>[\d]+) +'
-                       r'pci=(?P<pci>hpmemsize=(?P<hpmemsize>[\w]+)\,\s*hpiosize=(?P<hpiosize>[\w]+))$')
+        p = regex_engine.compile(r'^root=(?P<root>[\w\/]+) +'
+                                 r'platform=(?P<platform>[\w]+) +'
+                                 r'boardtype=(?P<boardtype>[\w]+) +'
+                                 r'cardtype=(?P<cardtype>[\w]+) +'
+                                 r'iputype=(?P<iputype>[\w]+) +'
+                                 r'vmtype=(?P<vmtype>[\w -]+) +'
+                                 r'bigphysarea="?(?P<bigphysarea>[\w]+)"? +'
+                                 r'chassis_type=(?P<chassis_type>[\w]+) +'
+                                 r'intel_idle\.max_cstate=(?P<intel_idle_max_cstate>[\d]+) +'
+                                 r'processor\.max_cstate=(?P<processor_max_cstate>[\d]+) +'
+                                 r'chassis_serial=(?P<chassis_serial>[\w]+) +'
+                                 r'chassis_pid=(?P<chassis_pid>[\w-]+) +'
+                                 r'console=(?P<primary_console>[\w]+) +'
+                                 r'(console=(?P<secondary_console>[\w]+) +)?'
+                                 r'prod=(?P<prod>[\d]+) +'
+                                 r'pci=(?P<pci>hpmemsize=(?P<hpmemsize>[\w]+)\,\s*hpiosize=(?P<hpiosize>[\w]+))$')
 
         # Processes the matched patterns
         for line in out.splitlines():
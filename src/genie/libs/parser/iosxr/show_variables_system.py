@@ -2,14 +2,12 @@
 show variables system
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Schema, Any, Optional)
 
 # Parser Utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -114,11 +112,11 @@ class ShowVariablesSystem(ShowVariablesSystemSchema):
             out = output
 
         # MIB_PATH = / pkg / mib
-        p1 = re.compile(r'^.+_PATH=.+$')
+        p1 = regex_engine.compile(r'^.+_PATH=.+$')
 
         # GDB_PDEBUG=-P1
         # parse every basic key value pair
-        p2 = re.compile(r'^(?P<key>.+)=(?P<value>.+$)')
+        p2 = regex_engine.compile(r'^(?P<key>.+)=(?P<value>.+$)')
 
         term_list = []
         ret_dict = {}
@@ -5,7 +5,6 @@ IOSXR parsers for the following show commands:
 """
 
 # Python
-import re
 import xmltodict
 
 # Metaparser
@@ -13,6 +12,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowVrfAllDetailSchema(MetaParser):
     """Schema for show vrf all detail"""
@@ -69,9 +71,9 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
             # VRF VRF1; RD 200:1; VPN ID not set
             # VRF A:MGMT; RD 1:100; VPN ID not set
             # RD 172.16.94.0:1000
-            p1 = re.compile(r'^VRF +(?P<vrf>[\w\-:]+); +'
-                             r'RD +(?P<rd>[\w\s\:\<\>\.]+); +'
-                             r'VPN +ID +(?P<vpn_id>[\w\s\:]+)$')
+            p1 = regex_engine.compile(r'^VRF +(?P<vrf>[\w\-:]+); +'
+                                       r'RD +(?P<rd>[\w\s\:\<\>\.]+); +'
+                                       r'VPN +ID +(?P<vpn_id>[\w\s\:]+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -88,14 +90,14 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
                 continue
 
             # VRF mode: Regular
-            p2 = re.compile(r'^VRF +mode: +(?P<mode>[\w\-]+)$')
+            p2 = regex_engine.compile(r'^VRF +mode: +(?P<mode>[\w\-]+)$')
             m = p2.match(line)
             if m:
                 vrf_dict[vrf]['vrf_mode'] = m.groupdict()['mode'].lower()
                 continue
 
             # Description not set
-            p3 = re.compile(r'^Description *(?P<desc>[\w\:\s\-]+)$')
+            p3 = regex_engine.compile(r'^Description *(?P<desc>[\w\:\s\-]+)$')
             m = p3.match(line)
             if m:
                 vrf_dict[vrf]['description'] = m.groupdict()['desc']
@@ -103,16 +105,16 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
 
             # Interfaces:
             #     GigabitEthernet0/0/0/1
-            p4 = re.compile(r'^Interfaces:$')
+            p4 = regex_engine.compile(r'^Interfaces:$')
             m = p4.match(line)
             if m:
                 vrf_dict[vrf]['interfaces'] = []
                 continue
             #   GigabitEthernet0/0/0/0.390
             #   Bundle-Ether15.514
-            p4_1 = re.compile(r'^(?P<intf>([G|g]i.*|[B|b]un.*|'
-                              r'[T|t]en.*|[P|p]o.*|[V|v]lan.*|'
-                              r'[L|l]o.*))$')
+            p4_1 = regex_engine.compile(r'^(?P<intf>([G|g]i.*|[B|b]un.*|'
+                                        r'[T|t]en.*|[P|p]o.*|[V|v]lan.*|'
+                                        r'[L|l]o.*))$')
 
             m = p4_1.match(line)
             if m:
@@ -121,7 +123,7 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
                 continue
 
             # Address family IPV4 Unicast
-            p5 = re.compile(r'^Address +family +(?P<af>[\w\s]+)$')
+            p5 = regex_engine.compile(r'^Address +family +(?P<af>[\w\s]+)$')
             m = p5.match(line)
             if m:
                 af = m.groupdict()['af'].lower()
@@ -135,7 +137,7 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
 
             # No Export VPN route-target communities
             # Export VPN route-target communities:
-            p6 = re.compile(r'^Export +VPN +route\-target communities:$')
+            p6 = regex_engine.compile(r'^Export +VPN +route\-target communities:$')
             m = p6.match(line)
             if m:
                 rt_type = 'export'
@@ -145,7 +147,7 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
 
             # No import VPN route-target communities
             # Import VPN route-target communities:
-            p6_1 = re.compile(r'^Import +VPN +route\-target +communities:$')
+            p6_1 = regex_engine.compile(r'^Import +VPN +route\-target +communities:$')
             m = p6_1.match(line)
             if m:
                 rt_type = 'import'
@@ -154,7 +156,7 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
                 continue
 
             #     RT:100:1
-            p6_1 = re.compile(r'RT: *(?P<rt>[\w\:\.]+)$')
+            p6_1 = regex_engine.compile(r'RT: *(?P<rt>[\w\:\.]+)$')
             m = p6_1.match(line)
             if m and rt_type:
                 rt = m.groupdict()['rt']
@@ -168,14 +170,14 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
                 continue
 
             # No import route policy
-            p7 = re.compile(r'^No +import +route +policy$')
+            p7 = regex_engine.compile(r'^No +import +route +policy$')
             m = p7.match(line)
             if m:
                 rt_type = None
                 continue
 
             # Import route policy: all-pass
-            p7_1 = re.compile(r'^Import +route +policy: +(?P<route_map>[\w\-]+)$')
+            p7_1 = regex_engine.compile(r'^Import +route +policy: +(?P<route_map>[\w\-]+)$')
             m = p7_1.match(line)
             if m:
                 rt_type = None
@@ -186,14 +188,14 @@ class ShowVrfAllDetail(ShowVrfAllDetailSchema):
 
 
             # No export route policy
-            p8 = re.compile(r'^No +export +route +policy$')
+            p8 = regex_engine.compile(r'^No +export +route +policy$')
             m = p8.match(line)
             if m:
                 rt_type = None
                 continue
 
             # Export route policy: allpass
-            p8_1 = re.compile(r'^Export +route +policy: +(?P<route_map>[\w\-]+)$')
+            p8_1 = regex_engine.compile(r'^Export +route +policy: +(?P<route_map>[\w\-]+)$')
             m = p8_1.match(line)
             if m:
                 rt_type = None
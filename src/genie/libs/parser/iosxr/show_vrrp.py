@@ -7,13 +7,13 @@ IOSXR parser for the following show commands:
     * 'show vrrp statistics'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ======================================
 #   Schema for 'show vrrp summary'
@@ -67,50 +67,50 @@ class ShowVrrpSummary(ShowVrrpSummarySchema):
         parsed_dict = {}
 
         # ALL            2      0     2         0      0     0
-        p1 = re.compile(r'(?P<state_name>^[a-zA-Z]+)'
-                        r' +(?P<v4_sessions>\d+) +(?P<v4_slaves>\d+)'
-                        r' +(?P<v4_total>\d+) +(?P<v6_sessions>\d+)'
-                        r' +(?P<v6_slaves>\d+) +(?P<v6_total>\d+)$')
+        p1 = regex_engine.compile(r'(?P<state_name>^[a-zA-Z]+)'
+                                  r' +(?P<v4_sessions>\d+) +(?P<v4_slaves>\d+)'
+                                  r' +(?P<v4_total>\d+) +(?P<v6_sessions>\d+)'
+                                  r' +(?P<v6_slaves>\d+) +(?P<v6_total>\d+)$')
 
         # 2    VRRP IPv4 interfaces    (1    up, 1    down)
-        p2 = re.compile(r'(?P<num_intf>^\d+) +VRRP +IPv4 +interfaces'
-                        r' +\(+(?P<intf_up>\d+) +up,'
-                        r' +(?P<intf_down>\d+) +down\)$')
+        p2 = regex_engine.compile(r'(?P<num_intf>^\d+) +VRRP +IPv4 +interfaces'
+                                  r' +\(+(?P<intf_up>\d+) +up,'
+                                  r' +(?P<intf_down>\d+) +down\)$')
 
         # 0    VRRP IPv6 interfaces    (0    up, 0    down)
-        p3 = re.compile(r'(?P<num_intf>^\d+) +VRRP +IPv6 +interfaces'
-                        r' +\(+(?P<intf_up>\d+) +up,'
-                        r' +(?P<intf_down>\d+) +down\)$')
+        p3 = regex_engine.compile(r'(?P<num_intf>^\d+) +VRRP +IPv6 +interfaces'
+                                  r' +\(+(?P<intf_up>\d+) +up,'
+                                  r' +(?P<intf_down>\d+) +down\)$')
 
         # 2    Virtual IPv4 addresses  (1    active, 1    inactive)
-        p4 = re.compile(r'(?P<num_addresses>^\d+) +Virtual +IPv4'
-                        r' +addresses +\((?P<active>\d+) +active,'
-                        r' +(?P<inactive>\d+) +inactive\)$')
+        p4 = regex_engine.compile(r'(?P<num_addresses>^\d+) +Virtual +IPv4'
+                                  r' +addresses +\((?P<active>\d+) +active,'
+                                  r' +(?P<inactive>\d+) +inactive\)$')
 
         # 0    Virtual IPv6 addresses  (0    active, 0    inactive)
-        p5 = re.compile(r'(?P<num_addresses>^\d+) +Virtual +IPv6'
-                        r' +addresses +\((?P<active>\d+) +active,'
-                        r' +(?P<inactive>\d+) +inactive\)$')
+        p5 = regex_engine.compile(r'(?P<num_addresses>^\d+) +Virtual +IPv6'
+                                  r' +addresses +\((?P<active>\d+) +active,'
+                                  r' +(?P<inactive>\d+) +inactive\)$')
 
         # 3    Tracked Objects    (1    up, 2    down)
-        p6 = re.compile(r'\s*(?P<num_tracked_objects>^\d+) +Tracked'
-                        r' +Objects +\((?P<tracked_objects_up>\d+) +up,'
-                        r' +(?P<tracked_objects_down>\d+) +down\)$')
+        p6 = regex_engine.compile(r'\s*(?P<num_tracked_objects>^\d+) +Tracked'
+                                  r' +Objects +\((?P<tracked_objects_up>\d+) +up,'
+                                  r' +(?P<tracked_objects_down>\d+) +down\)$')
 
         # 0   IPv4 BFD sessions      (0    up, 0    down, 0    inactive)
-        p7 = re.compile(r'\s*(?P<num_bfd_sessions>^\d+) +IPv4 +BFD +sessions'
-                        r' +\((?P<bfd_sessions_up>\d+) +up,'
-                        r' +(?P<bfd_sessions_down>\d+) +down,'
-                        r' +(?P<bfd_sessions_inactive>\d+) +inactive\)$')
+        p7 = regex_engine.compile(r'\s*(?P<num_bfd_sessions>^\d+) +IPv4 +BFD +sessions'
+                                  r' +\((?P<bfd_sessions_up>\d+) +up,'
+                                  r' +(?P<bfd_sessions_down>\d+) +down,'
+                                  r' +(?P<bfd_sessions_inactive>\d+) +inactive\)$')
 
         # 0   IPv6 BFD sessions      (0    up, 0    down, 0    inactive)
-        p8 = re.compile(r'\s*(?P<num_bfd_sessions>^\d+) +IPv6 +BFD +sessions'
-                        r' +\((?P<bfd_sessions_up>\d+) +up,'
-                        r' +(?P<bfd_sessions_down>\d+) +down,'
-                        r' +(?P<bfd_sessions_inactive>\d+) +inactive\)$')
+        p8 = regex_engine.compile(r'\s*(?P<num_bfd_sessions>^\d+) +IPv6 +BFD +sessions'
+                                  r' +\((?P<bfd_sessions_up>\d+) +up,'
+                                  r' +(?P<bfd_sessions_down>\d+) +down,'
+                                  r' +(?P<bfd_sessions_inactive>\d+) +inactive\)$')
 
         # MASTER (owner)    0      0     0        0      0     0
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'(?P<state_name>^[a-zA-Z]+) +(?P<sub_name>\([a-zA-Z]+\))'
             r' +(?P<v4_sessions>\d+) +(?P<v4_slaves>\d+) +(?P<v4_total>\d+)'
             r'  +(?P<v6_sessions>\d+) +(?P<v6_slaves>\d+) +(?P<v6_total>\d+)')
@@ -339,93 +339,93 @@ class ShowVrrpDetail(ShowVrrpDetailSchema):
         parsed_dict = {}
 
         # GigabitEthernet0/2/0/1 - IPv4 vrID 100
-        p1 = re.compile(r'(?P<interface>^[\w\/\.-]+)'
-                        r' +\- +(?P<address_family>\w+)'
-                        r' +vrID +(?P<vrid>\d+)$')
+        p1 = regex_engine.compile(r'(?P<interface>^[\w\/\.-]+)'
+                                  r' +\- +(?P<address_family>\w+)'
+                                  r' +vrID +(?P<vrid>\d+)$')
 
         # State is Backup
-        p2 = re.compile(r'^State +is +(?P<router_state>[a-zA-Z]+)')
+        p2 = regex_engine.compile(r'^State +is +(?P<router_state>[a-zA-Z]+)')
 
         # 1 state changes, last state change 03:50:23
-        p3 = re.compile(r'(?P<num_state_changes>^\d+) +state +changes,'
-                        r' +last +state +change +(?P<last_state_change>[\w\:]+)$')
+        p3 = regex_engine.compile(r'(?P<num_state_changes>^\d+) +state +changes,'
+                                  r' +last +state +change +(?P<last_state_change>[\w\:]+)$')
 
         # Last resign sent: Never
-        p4 = re.compile(r'^Last +resign +sent:'
-                        r' +(?P<last_resign_sent>[\S ]+)$')
+        p4 = regex_engine.compile(r'^Last +resign +sent:'
+                                  r' +(?P<last_resign_sent>[\S ]+)$')
 
         # Last resign received: Never
-        p5 = re.compile(r'^Last +resign +received:'
-                        r' +(?P<last_resign_received>[\S ]+)$')
+        p5 = regex_engine.compile(r'^Last +resign +received:'
+                                  r' +(?P<last_resign_received>[\S ]+)$')
 
         # Virtual IP address is 10.1.1.1
-        p6 = re.compile(r'^Virtual +IP +address'
-                        r' +is +(?P<virtual_ip_address>[\w\:\.]+)$')
+        p6 = regex_engine.compile(r'^Virtual +IP +address'
+                                  r' +is +(?P<virtual_ip_address>[\w\:\.]+)$')
 
         # Virtual MAC address is 0000.5E00.0101, state is stored
-        p7 = re.compile(r'^Virtual +MAC +address +is'
-                        r' +(?P<virtual_mac_address>[\w\.]+),'
-                        r' +state +is +(?P<mac_state>[a-zA-Z ]+)$')
+        p7 = regex_engine.compile(r'^Virtual +MAC +address +is'
+                                  r' +(?P<virtual_mac_address>[\w\.]+),'
+                                  r' +state +is +(?P<mac_state>[a-zA-Z ]+)$')
 
         # Master router is 10.1.1.2, priority 254
-        p8 = re.compile(r'^Master +router +is +(?P<master_router_ip>\S+)(,'
-                        r' +priority +(?P<master_router_priority>\d+))?$')
+        p8 = regex_engine.compile(r'^Master +router +is +(?P<master_router_ip>\S+)(,'
+                                  r' +priority +(?P<master_router_priority>\d+))?$')
 
         # Version is 3
-        p9 = re.compile(r'^Version +is +(?P<version>\d+)$')
+        p9 = regex_engine.compile(r'^Version +is +(?P<version>\d+)$')
 
         # Advertise time 0.100 secs (forced)
-        p10 = re.compile(r'^Advertise +time +(?P<advertise_time>[\d\.]+)'
-                         r' +secs( +(?P<advertise_time_force>\(forced\)))?$')
+        p10 = regex_engine.compile(r'^Advertise +time +(?P<advertise_time>[\d\.]+)'
+                                   r' +secs( +(?P<advertise_time_force>\(forced\)))?$')
 
         # Master Down Timer 12.031 (3 x 4 + (2 x 4/256))
-        p11 = re.compile(r'^Master +Down +Timer +(?P<master_down_time>[\d\.]+)')
+        p11 = regex_engine.compile(r'^Master +Down +Timer +(?P<master_down_time>[\d\.]+)')
 
         # Minimum delay 2 sec, reload delay 10 sec
-        p12 = re.compile(r'^Minimum +delay +(?P<minimum_delay>\d+)'
-                         r' +sec, +reload +delay +(?P<reload_delay>\d+) +sec$')
+        p12 = regex_engine.compile(r'^Minimum +delay +(?P<minimum_delay>\d+)'
+                                   r' +sec, +reload +delay +(?P<reload_delay>\d+) +sec$')
 
         # Current priority 254
-        p13 = re.compile(r'^Current +priority +(?P<current_priority>\d+)')
+        p13 = regex_engine.compile(r'^Current +priority +(?P<current_priority>\d+)')
 
         # Configured priority 100, may preempt
-        p14 = re.compile(r'^Configured +priority'
-                         r' +(?P<configured_priority>\d+)'
-                         r'(, (?P<may_preempt>may preempt))?')
+        p14 = regex_engine.compile(r'^Configured +priority'
+                                   r' +(?P<configured_priority>\d+)'
+                                   r'(, (?P<may_preempt>may preempt))?')
 
         # minimum delay 0 secs
-        p15 = re.compile(r'^minimum +delay (?P<preempt_minimum_delay>\d+) +secs$')
+        p15 = regex_engine.compile(r'^minimum +delay (?P<preempt_minimum_delay>\d+) +secs$')
 
         # BFD enabled: state inactive, interval 15 ms multiplier 3 remote IP 151.1.0.2
-        p16 = re.compile(r'^BFD +enabled: +state (?P<bfd_state>[a-zA-Z]+),'
-                         r' +interval +(?P<bfd_interval>\d+) +ms +multiplier'
-                         r' +(?P<bfd_multiplier>\d+) +remote IP'
-                         r' +(?P<remote_ip>\S+)$')
+        p16 = regex_engine.compile(r'^BFD +enabled: +state (?P<bfd_state>[a-zA-Z]+),'
+                                   r' +interval +(?P<bfd_interval>\d+) +ms +multiplier'
+                                   r' +(?P<bfd_multiplier>\d+) +remote IP'
+                                   r' +(?P<remote_ip>\S+)$')
 
         # Tracked items: 1/1 up: 0 decrement
-        p17 = re.compile(r'^Tracked +items: +(?P<up_count>\d+)\/(?P<total_count>\d+) +up:'
-                         r' +(?P<decrement_priority>\d+) +decrement$')
+        p17 = regex_engine.compile(r'^Tracked +items: +(?P<up_count>\d+)\/(?P<total_count>\d+) +up:'
+                                   r' +(?P<decrement_priority>\d+) +decrement$')
 			
         #Object name                State     Decrement
         #GigabitEthernet0/0/0/2        Up            30
-        p18 = re.compile(r'(?P<object_name>^\S+) +(?P<object_state>Down|Up) +(?P<object_decrement>\d+)')
+        p18 = regex_engine.compile(r'(?P<object_name>^\S+) +(?P<object_state>Down|Up) +(?P<object_decrement>\d+)')
 
         # Secondary Virtual IP address is 12::1
-        p19 = re.compile(r'^Secondary +Virtual +IP +address'
-                         r' +is +(?P<secondary_virtual_ip>[\w\:\.]+)$')
+        p19 = regex_engine.compile(r'^Secondary +Virtual +IP +address'
+                                   r' +is +(?P<secondary_virtual_ip>[\w\:\.]+)$')
 						 
         #Label masterv6 (1 slaves)
-        p20 = re.compile(r'^Label +(?P<lname>(\w+)) +\((?P<lnumber>(\d+)) +(?P<lstatus>(\w+)\))')
+        p20 = regex_engine.compile(r'^Label +(?P<lname>(\w+)) +\((?P<lnumber>(\d+)) +(?P<lstatus>(\w+)\))')
 
         #Slave to masterv6
-        p21 = re.compile(r'^Slave +to +(?P<sname>(\w+))$')
+        p21 = regex_engine.compile(r'^Slave +to +(?P<sname>(\w+))$')
 	
         #Authentication enabled, string cisco
-        p22 = re.compile(r'^Authentication +(?P<auth_status>enabled), +string +(?P<auth_string>(\S+))$')
+        p22 = regex_engine.compile(r'^Authentication +(?P<auth_status>enabled), +string +(?P<auth_string>(\S+))$')
 
         # Master router is IP Address owner (12.0.0.2), priority 255
-        p23 = re.compile(r'^Master +router +is +IP +Address owner +\((?P<master_router_ip>\S+)\)(,'
-                         r' +priority +(?P<master_router_priority>\d+))?$')
+        p23 = regex_engine.compile(r'^Master +router +is +IP +Address owner +\((?P<master_router_ip>\S+)\)(,'
+                                   r' +priority +(?P<master_router_priority>\d+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -683,74 +683,74 @@ class ShowVrrpStatistics(ShowVrrpStatisticsSchema):
             out = output
 
         # Invalid packets:
-        p0 = re.compile(r'Invalid +(?P<invalid_packets>packets):')
+        p0 = regex_engine.compile(r'Invalid +(?P<invalid_packets>packets):')
 
         # Invalid checksum: 0
-        p1 = re.compile(r'Invalid +checksum: +(?P<invalid_checksum>\d+)')
+        p1 = regex_engine.compile(r'Invalid +checksum: +(?P<invalid_checksum>\d+)')
 
         # Unknown/unsupported versions: 0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'Unknown\/unsupported +versions: +(?P<unknown_unsupported_versions>\d+)'
         )
 
         # Invalid vrID: 42
-        p3 = re.compile(r'Invalid +vrID: +(?P<invalid_vrid>\d+)')
+        p3 = regex_engine.compile(r'Invalid +vrID: +(?P<invalid_vrid>\d+)')
 
         #  Too short:  0
-        p4 = re.compile(r'Too +short: +(?P<too_short>\d+)')
+        p4 = regex_engine.compile(r'Too +short: +(?P<too_short>\d+)')
 
         # Protocol:
-        p5 = re.compile(r'Protocol:')
+        p5 = regex_engine.compile(r'Protocol:')
 
         # Transitions to Master 5
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'Transitions +to +Master +(?P<transitions_to_master>\d+)')
 
         # Packets:
-        p7 = re.compile(r'Packets:')
+        p7 = regex_engine.compile(r'Packets:')
 
         # Total received: 87209
-        p8 = re.compile(r'Total +received: +(?P<total_received>\d+)')
+        p8 = regex_engine.compile(r'Total +received: +(?P<total_received>\d+)')
 
         # Adverts sent: 344811478
-        p9 = re.compile(r'Adverts sent: +(?P<adverts_sent>\d+)')
+        p9 = regex_engine.compile(r'Adverts sent: +(?P<adverts_sent>\d+)')
 
         # Bad TTL: 0
-        p10 = re.compile(r'Bad TTL: +(?P<bad_ttl>\d+)')
+        p10 = regex_engine.compile(r'Bad TTL: +(?P<bad_ttl>\d+)')
 
         # Short Packets: 0
-        p11 = re.compile(r'Short +Packets: +(?P<short_packets>\d+)')
+        p11 = regex_engine.compile(r'Short +Packets: +(?P<short_packets>\d+)')
 
         # Failed authentication: 0
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'Failed authentication: +(?P<failed_authentication>\d+)')
 
         # Unknown authentication: 0
-        p13 = re.compile(r'Unknown +authentication:'
-                         r' +(?P<unknown_authentication>\d+)')
+        p13 = regex_engine.compile(r'Unknown +authentication:'
+                                   r' +(?P<unknown_authentication>\d+)')
 
         # Conflicting authentication: 0
-        p14 = re.compile(r'Conflicting +authentication:'
-                         r' +(?P<conflicting_authentication>\d+)')
+        p14 = regex_engine.compile(r'Conflicting +authentication:'
+                                   r' +(?P<conflicting_authentication>\d+)')
 
         # Unknown Type field: 0
-        p15 = re.compile(r'Unknown +Type +field: +(?P<unknown_type_field>\d+)')
+        p15 = regex_engine.compile(r'Unknown +Type +field: +(?P<unknown_type_field>\d+)')
 
         # Conflicting Advertise time: 0
-        p16 = re.compile(r'Conflicting +Advertise +time:'
-                         r' +(?P<conflicting_advertise_time>\d+)')
+        p16 = regex_engine.compile(r'Conflicting +Advertise +time:'
+                                   r' +(?P<conflicting_advertise_time>\d+)')
 
         # Conflicting Addresses: 0
-        p17 = re.compile(r'Conflicting +Addresses:'
-                         r' +(?P<conflicting_addresses>\d+)')
+        p17 = regex_engine.compile(r'Conflicting +Addresses:'
+                                   r' +(?P<conflicting_addresses>\d+)')
 
         # Received with zero priority: 0
-        p18 = re.compile(r'Received +with +zero +priority:'
-                         r' +(?P<received_with_zero_priority>\d+)')
+        p18 = regex_engine.compile(r'Received +with +zero +priority:'
+                                   r' +(?P<received_with_zero_priority>\d+)')
 
         # Sent with zero priority: 6
-        p19 = re.compile(r'Sent +with +zero +priority:'
-                         r' +(?P<sent_with_zero_priority>\d+)')
+        p19 = regex_engine.compile(r'Sent +with +zero +priority:'
+                                   r' +(?P<sent_with_zero_priority>\d+)')
 
         parsed_dict = {}
 
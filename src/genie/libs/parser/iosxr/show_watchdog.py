@@ -2,15 +2,13 @@
 show watchdog memory-state
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Schema, Any, Optional,
                                                 Or, And, Default, Use)
 
 # Parser Utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.libs.sdk.apis.utils import unit_convert
 
@@ -50,19 +48,19 @@ class ShowWatchdogMemoryState(ShowWatchdogMemoryStateSchema):
             out = output
 
         # ---- node0_RP0_CPU0 ----
-        p1 = re.compile(r'^-+\s(?P<location>\S+)\s-+$')
+        p1 = regex_engine.compile(r'^-+\s(?P<location>\S+)\s-+$')
 
         #     Physical Memory     : 4608.0   MB
         #     Free Memory         : 1778.906 MB
         #   or
         #     Physical Memory: 32768     MB
         #     Free Memory:     25621.476 MB
-        p2 = re.compile(r'^(?P<type>.+\b)\s*:\s+(?P<amount>\d+(\.\d+)?)\s+(?P<unit>\w+\b)$')
+        p2 = regex_engine.compile(r'^(?P<type>.+\b)\s*:\s+(?P<amount>\d+(\.\d+)?)\s+(?P<unit>\w+\b)$')
 
         #     Memory State        :   Normal
         #  or
         #     Memory State:         Normal
-        p3 = re.compile(r'^(Memory\s+State)\s*:\s+(?P<state>.+)$')
+        p3 = regex_engine.compile(r'^(Memory\s+State)\s*:\s+(?P<state>.+)$')
 
         ret_dict = {}
         current_node_dict = {}
@@ -20,6 +20,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                                Use
 
 from genie.libs.parser.base import *
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -89,24 +90,24 @@ class ShowL2VpnXconnectBrief(ShowL2VpnXconnectBriefSchema):
         parsed_dict = {}
 
         # Locally Switching
-        p1 = re.compile(r'^Locally Switching$')
+        p1 = regex_engine.compile(r'^Locally Switching$')
 
         # AToM
-        p2 = re.compile(r'^AToM$')
+        p2 = regex_engine.compile(r'^AToM$')
 
         # Like-to-Like                        UP       DOWN        UNR
-        p3 = re.compile(r'^Like-to-Like.*$')
+        p3 = regex_engine.compile(r'^Like-to-Like.*$')
 
         #   Invalid AC                         0          0          1
         #   EFP/Invalid AC                     0          0          1
         #   EFP                                3          0          0
         #   Total                              3          0          2
-        p4 = re.compile(r'^(?P<item>([a-zA-Z\-\/\s]+)) +(?P<up>(\d+))'
-                         r' +(?P<down>(\d+)) +(?P<unr>(\d+))$')
+        p4 = regex_engine.compile(r'^(?P<item>([a-zA-Z\-\/\s]+)) +(?P<up>(\d+))'
+                                   r' +(?P<down>(\d+)) +(?P<unr>(\d+))$')
 
         # Total: 0 UP, 0 DOWN, 0 UNRESOLVED
-        p5 = re.compile(r'^Total: +(?P<up>(\d+)) +UP, +(?P<down>(\d+)) +DOWN,'
-                         r' +(?P<unr>(\d+)) +UNRESOLVED$')
+        p5 = regex_engine.compile(r'^Total: +(?P<up>(\d+)) +UP, +(?P<down>(\d+)) +DOWN,'
+                                   r' +(?P<unr>(\d+)) +UNRESOLVED$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -405,192 +406,192 @@ class ShowL2vpnXconnectDetail(ShowL2vpnXconnectDetailSchema):
         interface_found = False
         label_found = False
         # Group siva_xc, XC siva_p2p, state is down; Interworking none
-        p1 = re.compile(r'^Group +(?P<group>\S+), +XC +(?P<xc>\S+), +'
+        p1 = regex_engine.compile(r'^Group +(?P<group>\S+), +XC +(?P<xc>\S+), +'
             r'state +is +(?P<state>\S+); +Interworking +(?P<interworking>\S+)')
 
         # Monitor-Session: pw-span-test, state is configured
-        p2 = re.compile(r'^Monitor\-Session: +(?P<monitor_session>\S+)'
+        p2 = regex_engine.compile(r'^Monitor\-Session: +(?P<monitor_session>\S+)'
             r', +state +is +(?P<state>\S+)$')
 
         # AC: GigabitEthernet0/4/0/1, state is up
         # AC: GigabitEthernet0/4/0/1, state is down (Admin)
-        p3 = re.compile(r'^AC: +(?P<ac>\S+), +state +is +(?P<state>[\S ]+)$')
+        p3 = regex_engine.compile(r'^AC: +(?P<ac>\S+), +state +is +(?P<state>[\S ]+)$')
 
         # Type Ethernet
-        p4 = re.compile(r'^Type +(?P<type>\S+)$')
+        p4 = regex_engine.compile(r'^Type +(?P<type>\S+)$')
 
         # MTU 1500; XC ID 0x5000001; interworking none; MSTi 0
         # MTU 1500; XC ID 0x2000013; interworking none
-        p5 = re.compile(r'^MTU +(?P<mtu>\d+); +XC +ID +(?P<xc_id>\S+); +'
+        p5 = regex_engine.compile(r'^MTU +(?P<mtu>\d+); +XC +ID +(?P<xc_id>\S+); +'
             r'interworking +(?P<interworking>\S+)(; +MSTi +(?P<msti>\d+))?$')
 
         # packet totals: send 98
-        p6 = re.compile(r'^packet +totals: +send +(?P<send>\d+)$')
+        p6 = regex_engine.compile(r'^packet +totals: +send +(?P<send>\d+)$')
         
         # packet totals: receive 98
-        p6_1 = re.compile(r'^packet +totals: +receive +(?P<receive>\d+)$')
+        p6_1 = regex_engine.compile(r'^packet +totals: +receive +(?P<receive>\d+)$')
 
         # packets: received 3, sent 0
-        p6_2 = re.compile(r'^packets: +received +(?P<received>\d+), +sent +(?P<send>\d+)')
+        p6_2 = regex_engine.compile(r'^packets: +received +(?P<received>\d+), +sent +(?P<send>\d+)')
 
         # byte totals: send 20798
-        p7 = re.compile(r'^byte +totals: +send +(?P<send>\d+)$')
+        p7 = regex_engine.compile(r'^byte +totals: +send +(?P<send>\d+)$')
 
         # byte totals: send 20798
-        p7_1 = re.compile(r'^byte +totals: +receive +(?P<receive>\d+)$')
+        p7_1 = regex_engine.compile(r'^byte +totals: +receive +(?P<receive>\d+)$')
 
         # packets: received 3, sent 0
-        p7_2 = re.compile(r'^bytes: +received +(?P<received>\d+), +sent +(?P<send>\d+)')
+        p7_2 = regex_engine.compile(r'^bytes: +received +(?P<received>\d+), +sent +(?P<send>\d+)')
 
         # drops: illegal VLAN 0, illegal length 0
-        p7_3 = re.compile(r'^drops: +illegal +VLAN +(?P<illegal_vlan>\d+), +illegal +'
+        p7_3 = regex_engine.compile(r'^drops: +illegal +VLAN +(?P<illegal_vlan>\d+), +illegal +'
             r'length +(?P<illegal_length>\d+)$')
 
         # PW: neighbor 10.1.1.1, PW ID 1, state is down ( local ready )
-        p8 = re.compile(r'^PW: +neighbor +(?P<neighbor>\S+), +PW +ID +'
+        p8 = regex_engine.compile(r'^PW: +neighbor +(?P<neighbor>\S+), +PW +ID +'
             r'(?P<id>\d+), state +is +(?P<state>[\S ]+)$')
         
         # EVPN: neighbor 10.154.219.82, PW ID: evi 10200, ac-id 30200, state is up ( established )
-        p8_1 = re.compile(r'^EVPN: +neighbor +(?P<neighbor>\S+), +PW +ID: +'
+        p8_1 = regex_engine.compile(r'^EVPN: +neighbor +(?P<neighbor>\S+), +PW +ID: +'
             r'(?P<pw_id>[\S ]+), +ac-id +(?P<ac_id>\d+), +state +is +(?P<state>[\S ]+)$')
         
         # PW class not set, XC ID 0x5000001
-        p9 = re.compile(r'^PW +class +(?P<pw_class>[\S ]+), +XC +ID +(?P<xc_id>\S+)$')
+        p9 = regex_engine.compile(r'^PW +class +(?P<pw_class>[\S ]+), +XC +ID +(?P<xc_id>\S+)$')
 
         # Encapsulation MPLS, protocol LDP
-        p10 = re.compile(r'^Encapsulation +(?P<encapsulation>\S+)(, +Auto-discovered +'
+        p10 = regex_engine.compile(r'^Encapsulation +(?P<encapsulation>\S+)(, +Auto-discovered +'
             r'\((?P<auto_discovered>\S+)\))?, +protocol +(?P<protocol>\S+)$')
 
         # PW type Ethernet, control word enabled, interworking none
-        p11 = re.compile(r'^PW +type +(?P<type>\S+), +control +word +(?P<control_word>\S+)'
+        p11 = regex_engine.compile(r'^PW +type +(?P<type>\S+), +control +word +(?P<control_word>\S+)'
             r', +interworking +(?P<interworking>\S+)$')
 
         # PW backup disable delay 0 sec
-        p12 = re.compile(r'^PW +backup +disable +delay +(?P<backup_disable_delay>\d+) +sec$')
+        p12 = regex_engine.compile(r'^PW +backup +disable +delay +(?P<backup_disable_delay>\d+) +sec$')
 
         # Sequencing not set
-        p13 = re.compile(r'^Sequencing +(?P<sequencing>[\S ]+)$')
+        p13 = regex_engine.compile(r'^Sequencing +(?P<sequencing>[\S ]+)$')
 
         # PW Status TLV in use
-        p13_1 = re.compile(r'^PW +Status +TLV +(?P<status_tlv>[\S ]+)$')
+        p13_1 = regex_engine.compile(r'^PW +Status +TLV +(?P<status_tlv>[\S ]+)$')
 
         # MPLS         Local                          Remote
         # EVPN         Local                          Remote
         # SRv6         Local                          Remote
-        p14 = re.compile(r'^(?P<label_name>MPLS|EVPN|SRv6) +Local +Remote$')
+        p14 = regex_engine.compile(r'^(?P<label_name>MPLS|EVPN|SRv6) +Local +Remote$')
 
         # Label        30005                          unknown
         # Group ID     0x5000300                      0x0
         # VCCV CV type 0x2                            0x0
         # Avoid show commands: show l2vpn xconnect detail
         # Avoid Date and Time: Wed Sep 25 20:09:36.362 UTC
-        p15 = re.compile(r'^(?!(show +l2vpn))[\S ]+$')
+        p15 = regex_engine.compile(r'^(?!(show +l2vpn))[\S ]+$')
 
         # Create time: 20/11/2007 21:45:06 (00:53:31 ago)
-        p16 = re.compile(r'^Create +time: +(?P<create_time>[\S ]+)$')
+        p16 = regex_engine.compile(r'^Create +time: +(?P<create_time>[\S ]+)$')
 
         # Last time status changed: 20/11/2007 22:38:14 (00:00:23 ago)
-        p17 = re.compile(r'^Last +time +status +changed: +(?P<last_time_status_changed>[\S ]+)$')
+        p17 = regex_engine.compile(r'^Last +time +status +changed: +(?P<last_time_status_changed>[\S ]+)$')
 
         # Backup PW:
-        p18 = re.compile(r'^Backup +PW:$')
+        p18 = regex_engine.compile(r'^Backup +PW:$')
 
         # ------------ ------------------------------ -----------------------------
-        p19 = re.compile(r'^-+ +-+ +-+$')
+        p19 = regex_engine.compile(r'^-+ +-+ +-+$')
 
         # (control word)                 (control word)  
-        p20 = re.compile(r'^\([\S ]+\)$')
+        p20 = regex_engine.compile(r'^\([\S ]+\)$')
 
         # Backup for neighbor 10.1.1.1 PW ID 1 ( active )
-        p21 = re.compile(r'^Backup( +PW)? +for +neighbor +\S+ +PW +ID +\d+( +\( +\w+ +\))?$')
+        p21 = regex_engine.compile(r'^Backup( +PW)? +for +neighbor +\S+ +PW +ID +\d+( +\( +\w+ +\))?$')
 
         # Avoid Device name : Device#
         # Avoid Date and Time: Wed Sep 25 20:09:36.362 UTC
-        p22 = re.compile(r'^(\w+ +\w+ \d+ +\S+ +\w+)|(\S+\#)$')
+        p22 = regex_engine.compile(r'^(\w+ +\w+ \d+ +\S+ +\w+)|(\S+\#)$')
 
         # Local CE ID: 1, Remote CE ID: 2, Discovery State: Advertised
-        p23 = re.compile(r'^Local +CE +ID: +(?P<local_ce_id>\d+), +Remote +CE +ID: +'
+        p23 = regex_engine.compile(r'^Local +CE +ID: +(?P<local_ce_id>\d+), +Remote +CE +ID: +'
             r'(?P<remote_ce_id>\d+), Discovery +State: +(?P<state>\S+)$')
 
         # Type VLAN; Num Ranges: 1
-        p24 = re.compile(r'^Type +(?P<type>\S+); +Num +Ranges: +(?P<num_ranges>\d+)$')
+        p24 = regex_engine.compile(r'^Type +(?P<type>\S+); +Num +Ranges: +(?P<num_ranges>\d+)$')
 
         # VLAN ranges: [1, 1]
-        p25 = re.compile(r'^VLAN +ranges: +\[(?P<vlan_ranges>[\S ]+)\]$')
+        p25 = regex_engine.compile(r'^VLAN +ranges: +\[(?P<vlan_ranges>[\S ]+)\]$')
 
         # Group gr1, MP2MP mp1, state: up
-        p26 = re.compile(r'^Group +(?P<group_name>\S+), +MP2MP +(?P<mp2mp>\S+), +state: +(?P<state>\S+)$')
+        p26 = regex_engine.compile(r'^Group +(?P<group_name>\S+), +MP2MP +(?P<mp2mp>\S+), +state: +(?P<state>\S+)$')
 
         # VPN ID: 100
-        p27 = re.compile(r'^VPN +ID: +(?P<vpn_id>\d+)$')
+        p27 = regex_engine.compile(r'^VPN +ID: +(?P<vpn_id>\d+)$')
 
         # VPN MTU: 1500
-        p28 = re.compile(r'^VPN +MTU: +(?P<vpn_mtu>\d+)$')
+        p28 = regex_engine.compile(r'^VPN +MTU: +(?P<vpn_mtu>\d+)$')
 
         # L2 Encapsulation: VLAN
-        p29 = re.compile(r'^L2 +Encapsulation: +(?P<l2_encapsulation>\S+)$')
+        p29 = regex_engine.compile(r'^L2 +Encapsulation: +(?P<l2_encapsulation>\S+)$')
 
         # Auto Discovery: BGP, state is Advertised (Service Connected)
-        p30 = re.compile(r'^Auto +Discovery: +(?P<auto_discovery>\S+), +state +is +'
+        p30 = regex_engine.compile(r'^Auto +Discovery: +(?P<auto_discovery>\S+), +state +is +'
             r'(?P<state>\S+) +\((?P<event_name>[\S ]+)\)$')
 
         # Route Distinguisher: (auto) 10.36.3.3:32770
-        p31 = re.compile(r'^Route +Distinguisher: +(?P<route_distinguisher>[\S ]+)$')
+        p31 = regex_engine.compile(r'^Route +Distinguisher: +(?P<route_distinguisher>[\S ]+)$')
 
         # Import Route Targets:
-        p32 = re.compile(r'^Import +Route +Targets:$')
+        p32 = regex_engine.compile(r'^Import +Route +Targets:$')
 
         # Export Route Targets:
-        p33 = re.compile(r'^Export +Route +Targets:$')
+        p33 = regex_engine.compile(r'^Export +Route +Targets:$')
 
         # 10.16.2.2:100
-        p34 = re.compile(r'^(?P<route_target>[\d\.:]+)$')
+        p34 = regex_engine.compile(r'^(?P<route_target>[\d\.:]+)$')
 
         # Signaling protocol:BGP
-        p35 = re.compile(r'^Signaling +protocol: *(?P<signaling_protocol>\S+)$')
+        p35 = regex_engine.compile(r'^Signaling +protocol: *(?P<signaling_protocol>\S+)$')
 
         # CE Range:10
-        p36 = re.compile(r'^CE +Range: *(?P<ce_range>\d+)$')
+        p36 = regex_engine.compile(r'^CE +Range: *(?P<ce_range>\d+)$')
 
         # Statistics:
-        p37 = re.compile(r'^Statistics:$')
+        p37 = regex_engine.compile(r'^Statistics:$')
 
         # Wed Oct  2 14:36:55.184 EDT
-        p38 = re.compile(r'^[Wed|Thu|Fri|Sat|Sun|Mon|Tue]+ +'
-                        r'[Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec]+ +'
-                        r'\d{1,2} +\d{1,2}:\d{1,2}:\d{1,2}[\.]\d{1,3} +[A-Z]{3}')
+        p38 = regex_engine.compile(r'^[Wed|Thu|Fri|Sat|Sun|Mon|Tue]+ +'
+                                  r'[Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec]+ +'
+                                  r'\d{1,2} +\d{1,2}:\d{1,2}:\d{1,2}[\.]\d{1,3} +[A-Z]{3}')
 
         # Rewrite Tags: [] 
-        p39 = re.compile(r'^Rewrite +Tags: +\[(?P<rewrite_tags>[\S ]+)?\]$')
+        p39 = regex_engine.compile(r'^Rewrite +Tags: +\[(?P<rewrite_tags>[\S ]+)?\]$')
 
         # XC ID 0xc0000001
-        p40 = re.compile(r'^XC +ID +(?P<xc_id>\S+)$')
+        p40 = regex_engine.compile(r'^XC +ID +(?P<xc_id>\S+)$')
 
         # Encapsulation MPLS
-        p41 = re.compile(r'^Encapsulation +(?P<encapsulation>\S+)$')
+        p41 = regex_engine.compile(r'^Encapsulation +(?P<encapsulation>\S+)$')
 
         # Source address 10.154.219.88
-        p42 = re.compile(r'^Source +address +(?P<source_address>\S+)$')
+        p42 = regex_engine.compile(r'^Source +address +(?P<source_address>\S+)$')
 
         # Encap type Ethernet, control word enabled
         # Encap type Ethernet
-        p43 = re.compile(r'^Encap +type +(?P<encap_type>\S+)(?:, +control +'
-                            r'word +(?P<control_word>\S+))?$')
+        p43 = regex_engine.compile(r'^Encap +type +(?P<encap_type>\S+)(?:, +control +'
+                                      r'word +(?P<control_word>\S+))?$')
 
         # LSP : Up
-        p44 = re.compile(r'^LSP +: +(?P<lsp>\S+)$')
+        p44 = regex_engine.compile(r'^LSP +: +(?P<lsp>\S+)$')
 
         # Ignore MTU mismatch: Enabled
-        p45 = re.compile(r'^Ignore\s+MTU\s+mismatch:\s+(?P<ignore_mtu_mismatch>\S+)$')
+        p45 = regex_engine.compile(r'^Ignore\s+MTU\s+mismatch:\s+(?P<ignore_mtu_mismatch>\S+)$')
 
         # Transmit MTU zero: Enabled
-        p46 = re.compile(r'^Transmit\s+MTU\s+zero:\s+(?P<transmit_mtu_zero>\S+)$')
+        p46 = regex_engine.compile(r'^Transmit\s+MTU\s+zero:\s+(?P<transmit_mtu_zero>\S+)$')
 
         # Reachability: Up
-        p47 = re.compile(r'^Reachability:\s+(?P<reachability>\S+)$')
+        p47 = regex_engine.compile(r'^Reachability:\s+(?P<reachability>\S+)$')
 
         #Last time PW went down: 13/03/2024 07:31:51 (7w1d ago)
-        p48 = re.compile(r'^Last +time +PW +went +down: +(?P<last_time_pw_went_down>[\S ]+)$')
+        p48 = regex_engine.compile(r'^Last +time +PW +went +down: +(?P<last_time_pw_went_down>[\S ]+)$')
 
         for line in out.splitlines():
             original_line = line
@@ -1222,69 +1223,69 @@ class ShowL2vpnXconnect(ShowL2vpnXconnectSchema):
 
         # L2TPV3_V4_XC_GRP
         #           L2TPV3_P2P_1
-        p1 = re.compile(r'^(?P<group>[\w\-]+)$')
+        p1 = regex_engine.compile(r'^(?P<group>[\w\-]+)$')
 
         # SB = Standby, SR = Standby Ready, (PP) = Partially Programmed
         # SB = Standby, SR = Standby Ready, (PP) = Partially Programmed,
-        p1_1 = re.compile(r'^SB = Standby, SR = Standby Ready, \(PP\) = Partially Programmed,?$')
+        p1_1 = regex_engine.compile(r'^SB = Standby, SR = Standby Ready, \(PP\) = Partially Programmed,?$')
 
         # BL-PE-BG   G1-1-1-23-311
-        p1_2 = re.compile(r'^(?P<group>\S+) +(?P<name>\S+)$')
+        p1_2 = regex_engine.compile(r'^(?P<group>\S+) +(?P<name>\S+)$')
 
         # LU = Local Up, RU = Remote Up, CO = Connected
-        p1_3 = re.compile(r'^LU = Local Up, RU = Remote Up, CO = Connected$')
+        p1_3 = regex_engine.compile(r'^LU = Local Up, RU = Remote Up, CO = Connected$')
 
         #               1000     DN   Gi0/0/0/5.1000    UP   10.4.1.206       1000   DN
-        p2 = re.compile(r'^(?P<name>[a-zA-Z0-9]+) '
-                        r'+(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
-                        r'+(?P<segment_1>.*?) ' 
-                        r'+(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
-                        r'+(?P<segment_2>[\S ]+) '
-                        r'+(?P<status_seg2>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO))$')
+        p2 = regex_engine.compile(r'^(?P<name>[a-zA-Z0-9]+) '
+                                  r'+(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
+                                  r'+(?P<segment_1>.*?) ' 
+                                  r'+(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
+                                  r'+(?P<segment_2>[\S ]+) '
+                                  r'+(?P<status_seg2>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO))$')
 
         #                        UP   Gi0/2/0/1.2            UP       10.154.26.26     100    UP
         #                       UR   Te0/1/0/11.100         UR       EVPN 100,100,None      DN(PP)
-        p3 = re.compile(r'^(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
-                        r'+(?P<segment_1>.*?) ' 
-                        r'+(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
-                        r'+(?P<segment_2>[\S ]+) '
-                        r'+(?P<status_seg2>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)(\(PP\))?)$')
+        p3 = regex_engine.compile(r'^(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
+                                  r'+(?P<segment_1>.*?) ' 
+                                  r'+(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
+                                  r'+(?P<segment_2>[\S ]+) '
+                                  r'+(?P<status_seg2>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)(\(PP\))?)$')
 
         #                        UP   Gi0/2/0/1.2            UP       10.154.26.26     100
-        p3_1 = re.compile(r'^(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
-                          r'+(?P<segment_1>\S*) ' 
-                          r'+(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
-                          r'+(?P<segment_2>[\S ]+)$')
+        p3_1 = regex_engine.compile(r'^(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
+                                    r'+(?P<segment_1>\S*) ' 
+                                    r'+(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) '
+                                    r'+(?P<segment_2>[\S ]+)$')
 
         # T-0-5-0-0  UR   Te0/5/0/0              UR       10.154.219.75    4293089094
-        p3_2 = re.compile(r'^(?P<name>\S+) +(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +'
-                          r'(?P<segment_1>.*?) +(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +'
-                          r'(?P<segment_2>[\S ]+)$')
+        p3_2 = regex_engine.compile(r'^(?P<name>\S+) +(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +'
+                                    r'(?P<segment_1>.*?) +(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +'
+                                    r'(?P<segment_2>[\S ]+)$')
 
         # CRS-CRS    T-0-5-0-8  UP   Te0/5/0/8              UP       10.19.196.51   9651100
-        p3_3 = re.compile(r'^(?P<group>\S+) +(?P<name>\S+) +'
-                          r'(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +(?P<segment_1>.*?) +'
-                          r'(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +(?P<segment_2>[\S ]+)$')
+        p3_3 = regex_engine.compile(r'^(?P<group>\S+) +(?P<name>\S+) +'
+                                    r'(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +(?P<segment_1>.*?) +'
+                                    r'(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +(?P<segment_2>[\S ]+)$')
 
         # vpws       vpws       UR   Te0/2/1/0              UR       EVPN 302,302,0.0.0.0   DN
-        p3_4 = re.compile(r'^(?P<group>\S+) +(?P<name>\S+) +'
-                          r'(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +(?P<segment_1>.*?) +'
-                          r'(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +(?P<segment_2>[\S ]+)'
-                          r' +(?P<status_segment2>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO))$')
+        p3_4 = regex_engine.compile(r'^(?P<group>\S+) +(?P<name>\S+) +'
+                                    r'(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +(?P<segment_1>.*?) +'
+                                    r'(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +(?P<segment_2>[\S ]+)'
+                                    r' +(?P<status_segment2>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO))$')
 
         #                                                             UP
-        p4 = re.compile(r'^(?P<status_segment2>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO))$')
+        p4 = regex_engine.compile(r'^(?P<status_segment2>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO))$')
 
         # UP       10.19.196.10   1152   DN
-        p5 = re.compile(r'^(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO))'
-                        r' +(?P<segment_2>[\S ]+) +(?P<status_seg2>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO))$')
+        p5 = regex_engine.compile(r'^(?P<status_seg1>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO))'
+                                  r' +(?P<segment_2>[\S ]+) +(?P<status_seg2>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO))$')
 
         # UR   10.154.219.75    2015030201
-        p6 = re.compile(r'^(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +(?P<segment_1>[\s\d\.]+)$')
+        p6 = regex_engine.compile(r'^(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +(?P<segment_1>[\s\d\.]+)$')
 
         # T-0-4-0-2  UR   10.154.219.98    4293089094
-        p7 = re.compile(r'^(?P<name>\S+) +(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +'
-                        r'(?P<segment_1>[\S ]+)$')
+        p7 = regex_engine.compile(r'^(?P<name>\S+) +(?P<status_group>(UP|DN|AD|UR|SB|SR|\(PP\)|LU|RU|CO)) +'
+                                  r'(?P<segment_1>[\S ]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1508,41 +1509,41 @@ class ShowL2vpnXconnectSummary(ShowL2vpnXconnectSummarySchema):
         ret_dict = {}
 
         # Number of groups: 0
-        p1 = re.compile(r'^Number +of +groups: +(?P<number_of_groups>\d+)$')
+        p1 = regex_engine.compile(r'^Number +of +groups: +(?P<number_of_groups>\d+)$')
         
         # Number of xconnects: 0
-        p2 = re.compile(r'^Number +of +xconnects: +(?P<number_of_xconnects>\d+)$')
+        p2 = regex_engine.compile(r'^Number +of +xconnects: +(?P<number_of_xconnects>\d+)$')
 
         # Up: 0  Down: 0  Unresolved: 0 Partially-programmed: 0
-        p3 = re.compile(r'^Up: (?P<up>\d+) +Down: +(?P<down>\d+) +Unresolved: +'
+        p3 = regex_engine.compile(r'^Up: (?P<up>\d+) +Down: +(?P<down>\d+) +Unresolved: +'
             r'(?P<unresolved>\d+) +Partially-programmed: +(?P<partially_programmed>\d+)$')
 
         # AC-PW: 0  AC-AC: 0  PW-PW: 0 Monitor-Session-PW: 0
-        p4 = re.compile(r'^AC-PW: +(?P<ac_pw>\d+) +AC-AC: +(?P<ac_ac>\d+) +PW-PW: +'
+        p4 = regex_engine.compile(r'^AC-PW: +(?P<ac_pw>\d+) +AC-AC: +(?P<ac_ac>\d+) +PW-PW: +'
             r'(?P<pw_pw>\d+) +Monitor-Session-PW: +(?P<monitor_session_pw>\d+)$')
 
         # Number of Admin Down segments: 0
-        p5 = re.compile(r'^Number +of +Admin +Down +segments: +'
+        p5 = regex_engine.compile(r'^Number +of +Admin +Down +segments: +'
             r'(?P<number_of_admin_down_segments>\d+)$')
 
         # Number of MP2MP xconnects: 0
-        p6 = re.compile(r'^Number +of +MP2MP +xconnects: +(?P<number_of_mp2mp_xconnects>\d+)$')
+        p6 = regex_engine.compile(r'^Number +of +MP2MP +xconnects: +(?P<number_of_mp2mp_xconnects>\d+)$')
         
         # Up 0 Down 0
-        p7 = re.compile(r'^Up +(?P<up>\d+) +Down +(?P<down>\d+)$')
+        p7 = regex_engine.compile(r'^Up +(?P<up>\d+) +Down +(?P<down>\d+)$')
 
         # Advertised: 0 Non-Advertised: 0
-        p8 = re.compile(r'^Advertised: +(?P<advertised>\d+) +Non-Advertised: +'
+        p8 = regex_engine.compile(r'^Advertised: +(?P<advertised>\d+) +Non-Advertised: +'
             r'(?P<non_advertised>\d+)$')
 
         # Number of CE Connections: 0
-        p9 = re.compile(r'^Number +of +CE +Connections: +(?P<number_of_ce_connections>\d+)$')
+        p9 = regex_engine.compile(r'^Number +of +CE +Connections: +(?P<number_of_ce_connections>\d+)$')
 
         # Backup PW:
-        p10 = re.compile(r'^Backup +PW:$')
+        p10 = regex_engine.compile(r'^Backup +PW:$')
 
         # Backup Interface: 
-        p11 = re.compile(r'^Backup +Interface:$')
+        p11 = regex_engine.compile(r'^Backup +Interface:$')
         
         # Configured   : 0
         # UP           : 0
@@ -1551,7 +1552,7 @@ class ShowL2vpnXconnectSummary(ShowL2vpnXconnectSummarySchema):
         # Unresolved   : 0
         # Standby      : 0
         # Standby Ready: 0
-        p12 = re.compile(r'^(?P<key>[\S ]+): +(?P<value>\d+)$')
+        p12 = regex_engine.compile(r'^(?P<key>[\S ]+): +(?P<value>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
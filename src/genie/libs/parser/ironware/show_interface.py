@@ -17,6 +17,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 import re
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 __author__ = 'James Di Trapani <james@ditrapani.com.au>'
 
 
@@ -76,18 +79,18 @@ class ShowInterfacesBrief(ShowInterfacesBriefSchema):
         }
 
         # 1/1    Disabled None         None  No  cc4e.24ff.5242 description1
-        p1 = re.compile(r'((?P<interface>^\d+\/\d+|mgmt\d+|lb\d+|tn\d+|ve\d+)'
-                        r'\s+(?P<link>Up|Down|Disabled)\s+'
-                        r'(?P<state>None|Forward|N\/A)\s+'
-                        r'(?P<speed>\d+\w|None|N\/A)\s+'
-                        r'(?P<tag>No|Yes|N\/A)\s+'
-                        r'(?P<mac>\w+.\w+.\w+|N\/A)'
-                        r'(\s+(?P<desc>[^$]+)|$))')
+        p1 = regex_engine.compile(r'((?P<interface>^\d+\/\d+|mgmt\d+|lb\d+|tn\d+|ve\d+)'
+                                  r'\s+(?P<link>Up|Down|Disabled)\s+'
+                                  r'(?P<state>None|Forward|N\/A)\s+'
+                                  r'(?P<speed>\d+\w|None|N\/A)\s+'
+                                  r'(?P<tag>No|Yes|N\/A)\s+'
+                                  r'(?P<mac>\w+.\w+.\w+|N\/A)'
+                                  r'(\s+(?P<desc>[^$]+)|$))')
 
         # mgmt1
         # tn30
         # Used when pattern for the interface isnt just a port number (1/3)
-        p2 = re.compile(r'((?P<int>^[^\d]+)(?P<num>\d+$))')
+        p2 = regex_engine.compile(r'((?P<int>^[^\d]+)(?P<num>\d+$))')
 
         for line in out.splitlines():
             line = line.strip()
@@ -170,15 +173,15 @@ loopback 1   10.69.9.9  YES  NVRAM  up         up       default-vrf
 
         # eth 1/1      10.254.32.221  YES  NVRAM  admin/down down default-vrf
         # loopback 1   10.69.9.9  YES  NVRAM  up         up       default-vrf
-        p1 = re.compile(r'(^(?P<int_name>eth|mgmt|loopback|ve|tn|tunnel)\s+'
-                        r'(?P<int_num>\d+/\d+|\d+)\s+'
-                        r'(?P<ip>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
-                        r'(?P<ok>\w+)\s+'
-                        r'(?P<method>\w+)\s+'
-                        r'(?P<status>up|down|admin\/down)\s+'
-                        r'(?P<protocol>up|down)\s+'
-                        r'(?P<vrf>[\S]+)($|\s+'
-                        r'(?P<flag>US|VE|VS|V|U|S)))')
+        p1 = regex_engine.compile(r'(^(?P<int_name>eth|mgmt|loopback|ve|tn|tunnel)\s+'
+                                  r'(?P<int_num>\d+/\d+|\d+)\s+'
+                                  r'(?P<ip>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
+                                  r'(?P<ok>\w+)\s+'
+                                  r'(?P<method>\w+)\s+'
+                                  r'(?P<status>up|down|admin\/down)\s+'
+                                  r'(?P<protocol>up|down)\s+'
+                                  r'(?P<vrf>[\S]+)($|\s+'
+                                  r'(?P<flag>US|VE|VS|V|U|S)))')
 
         interface_def = {
             'mgmt': 'management',
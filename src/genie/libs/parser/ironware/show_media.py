@@ -14,7 +14,9 @@ Parsers:
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 __author__ = 'James Di Trapani <james@ditrapani.com.au>'
 
@@ -59,15 +61,15 @@ class ShowMediaInterface(ShowMediaInterfaceSchema):
         result_dict = {}
 
         # Type  : 10GE LR 10km SFP+
-        p1 = re.compile(r'(^Type\s+:\s+(?P<type>[^\n]+))')
+        p1 = regex_engine.compile(r'(^Type\s+:\s+(?P<type>[^\n]+))')
 
         # Vendor:          FIBERSTORE, Version:   A
-        p2 = re.compile(r'(^Vendor:\s+(?P<vendor>[^\s|,]+)(\s+,|,)\s+'
-                        r'Version:(\s+(?P<ver>[^\n]+)|$))')
+        p2 = regex_engine.compile(r'(^Vendor:\s+(?P<vendor>[^\s|,]+)(\s+,|,)\s+'
+                                  r'Version:(\s+(?P<ver>[^\n]+)|$))')
 
         # Part# :  SFP-10GLR-31, Serial#: J0612100048
-        p3 = re.compile(r'(^Part#\s+:\s+(?P<part>[^\s|,]+)(\s+,|,)\s+'
-                        r'Serial#:\s+(?P<serial>[^$]+))')
+        p3 = regex_engine.compile(r'(^Part#\s+:\s+(?P<part>[^\s|,]+)(\s+,|,)\s+'
+                                  r'Serial#:\s+(?P<serial>[^$]+))')
 
         for line in out.splitlines():
             line = line.strip()
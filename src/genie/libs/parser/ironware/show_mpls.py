@@ -17,7 +17,9 @@ Parsers:
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 __author__ = 'James Di Trapani <james@ditrapani.com.au>'
 
@@ -72,7 +74,7 @@ class ShowMPLSLSP(ShowMPLSLSPSchema):
         result_dict = {}
 
         # mlx8.1_to_ces.2      10.4.1.1  UP    UP    tnl0     1     0     --
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'(^(?P<name>\S+)\s+'
             r'(?P<endpoint>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
             r'(?P<adminstate>UP|DOWN)\s+(?P<operationstate>UP|DOWN)\s+'
@@ -206,79 +208,79 @@ class ShowMPLSVLL(ShowMPLSVLLSchema):
         }
 
         # VLL VLL-TEST1, VC-ID 2456, VLL-INDEX 2
-        p1 = re.compile(r'(^(VLL|vll|Vll)\s+(?P<name>[^,]+),+\s+VC-ID\s+'
-                        r'(?P<vcid>[^,]+),'
-                        r'\s+VLL-INDEX\s+(?P<vllindex>\d+$))')
+        p1 = regex_engine.compile(r'(^(VLL|vll|Vll)\s+(?P<name>[^,]+),+\s+VC-ID\s+'
+                                  r'(?P<vcid>[^,]+),'
+                                  r'\s+VLL-INDEX\s+(?P<vllindex>\d+$))')
 
         # End-point: tagged vlan 2501 e 2/10
         # End-point: untagged e 2/2
         # End-point: tagged vlan 100 inner-vlan 45 e 2/1
-        p2 = re.compile(r'(^End-point\s+:\s+'
-                        r'(?P<type>tagged|untagged|undefined)'
-                        r'(\s+vlan\s+(?P<vid>\d+)|)(\s+inner-vlan\s+'
-                        r'(?P<innerid>\d+)|)\s+(?P<interface_name>\w+)\s+'
-                        r'(?P<interface>\d+\/\d+$))')
+        p2 = regex_engine.compile(r'(^End-point\s+:\s+'
+                                  r'(?P<type>tagged|untagged|undefined)'
+                                  r'(\s+vlan\s+(?P<vid>\d+)|)(\s+inner-vlan\s+'
+                                  r'(?P<innerid>\d+)|)\s+(?P<interface_name>\w+)\s+'
+                                  r'(?P<interface>\d+\/\d+$))')
 
         # End-Point state  : Up
-        p3 = re.compile(r'(^End-Point state\s+:\s+(?P<state>Up|Down))')
+        p3 = regex_engine.compile(r'(^End-Point state\s+:\s+(?P<state>Up|Down))')
 
         # MCT state        : None
-        p4 = re.compile(r'(^MCT state\s+:\s+(?P<mctstate>\S+$))')
+        p4 = regex_engine.compile(r'(^MCT state\s+:\s+(?P<mctstate>\S+$))')
 
         # IFL-ID           : --
         # IFL-ID           : n/a
         # IFL-ID           : 1234
-        p5 = re.compile(r'(^IFL-ID\s+:\s+(?P<iflid>n\/a$|\d+$|--$))')
+        p5 = regex_engine.compile(r'(^IFL-ID\s+:\s+(?P<iflid>n\/a$|\d+$|--$))')
 
         # Local VC type    : tag
         # Local VC type : raw-pass-through
-        p6 = re.compile(r'(^Local VC type\s+:\s+'
-                        r'(?P<vctype>tag$|raw-pass-through$|--$|raw-mode$))')
+        p6 = regex_engine.compile(r'(^Local VC type\s+:\s+'
+                                  r'(?P<vctype>tag$|raw-pass-through$|--$|raw-mode$))')
 
         # Local VC MTU     : 9190
-        p7 = re.compile(r'(^Local VC MTU\s+:\s+(?P<mtu>\d+$|--$))')
+        p7 = regex_engine.compile(r'(^Local VC MTU\s+:\s+(?P<mtu>\d+$|--$))')
 
         # COS              : --
-        p8 = re.compile(r'(^COS\s+:\s+(?P<cos>\S+$))')
+        p8 = regex_engine.compile(r'(^COS\s+:\s+(?P<cos>\S+$))')
 
         # Extended Counters: Enabled
-        p9 = re.compile(r'(^Extended Counters:\s+'
-                        r'(?P<extcounters>[e|E]nabled|[d|D]isabled)$)')
+        p9 = regex_engine.compile(r'(^Extended Counters:\s+'
+                                  r'(?P<extcounters>[e|E]nabled|[d|D]isabled)$)')
 
         # Counter          : disabled
-        p10 = re.compile(r'(^Counter\s+:\s+'
-                         r'(?P<counter>[e|E]nabled|[d|D]isabled)$)')
+        p10 = regex_engine.compile(r'(^Counter\s+:\s+'
+                                   r'(?P<counter>[e|E]nabled|[d|D]isabled)$)')
 
         # Vll-Peer         : 192.168.1.1
-        p11 = re.compile(r'(^Vll-Peer\s+:\s+'
-                         r'(?P<ip>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}$))')
+        p11 = regex_engine.compile(r'(^Vll-Peer\s+:\s+'
+                                   r'(?P<ip>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}$))')
 
         # State          : UP
         # State          : DOWN - PW is Down (Reason:Wait for peer label)
         # For all states see page 550 in reference material
-        p12 = re.compile(r'(^State\s+:\s+(?P<state>UP|DOWN)(\s-\s'
-                         r'(?P<reason>\w.+$)|$))')
+        p12 = regex_engine.compile(r'(^State\s+:\s+(?P<state>UP|DOWN)(\s-\s'
+                                   r'(?P<reason>\w.+$)|$))')
 
         # Remote VC type : tag               Remote VC MTU  : 9190
-        p13 = re.compile(r'(^Remote VC type\s+:\s+'
-                         r'(?P<vctype>tag|raw-pass-through|--)\s+'
-                         r'Remote VC MTU\s+:\s+(?P<mtu>\d+$|--$))')
+        p13 = regex_engine.compile(r'(^Remote VC type\s+:\s+'
+                                   r'(?P<vctype>tag|raw-pass-through|--)\s+'
+                                   r'Remote VC MTU\s+:\s+(?P<mtu>\d+$|--$))')
 
         # Local label    : 852217            Remote label   : 852417
         # Local label    : --                Remote label   : --
-        p14 = re.compile(r'(^Local label\s+:\s(?P<local>\d+|--)\s+'
-                         r'Remote label\s+:\s+(?P<remote>\d+$|--$))')
+        p14 = regex_engine.compile(r'(^Local label\s+:\s(?P<local>\d+|--)\s+'
+                                   r'Remote label\s+:\s+(?P<remote>\d+$|--$))')
 
         # Local group-id : 0                 Remote group-id: 0
-        p15 = re.compile(r'(^Local group-id\s+:\s+(?P<localgid>\d+|--)\s+'
-                         r'Remote group-id:\s+(?P<remotegid>\d+$|--$))')
+        p15 = regex_engine.compile(r'(^Local group-id\s+:\s+(?P<localgid>\d+|--)\s+'
+                                   r'Remote group-id:\s+(?P<remotegid>\d+$|--$))')
 
         # Tunnel LSP     : mlx8.1_to_ces.2 (tnl15)
-        p16 = re.compile(r'(^Tunnel LSP\s+:\s+'
-                         r'(?P<lspname>[^+\s]+)\s+\((?P<tunnel>\w+)\)$)')
+        p16 = regex_engine.compile(r'(^Tunnel LSP\s+:\s+'
+                                   r'(?P<lspname>[^+\s]+)\s+\((?P<tunnel>\w+)\)$)')
 
         # LSPs assigned  : No LSPs assigned
-        p17 = re.compile(r'(^LSPs\s+assigned\s+:\s+(?P<lsps>\w+.*$))')
+        p17 = regex_engine.compile(r'(^LSPs\s+assigned\s+:\s+(?P<lsps>\w+.*$))')
 
         for line in out.splitlines():
             line = line.strip()
@@ -557,33 +559,33 @@ class ShowMPLSVLLLocal(ShowMPLSVLLLocalSchema):
         }
 
         # Vll test-4 VLL-ID 4 IFL-ID 4096
-        p1 = re.compile(r'(^(VLL|vll|Vll)\s+(?P<name>[^\s]+)\s+VLL-ID\s+'
-                        r'(?P<vllid>\d+)\s+IFL-ID\s+(?P<iflid>--$|\d+$))')
+        p1 = regex_engine.compile(r'(^(VLL|vll|Vll)\s+(?P<name>[^\s]+)\s+VLL-ID\s+'
+                                  r'(?P<vllid>\d+)\s+IFL-ID\s+(?P<iflid>--$|\d+$))')
 
         # State: UP
-        p2 = re.compile(r'(^State:\s+(?P<state>UP|DOWN)(\s+-\s+'
-                        r'(?P<reason>configuration incomplete|'
-                        r'endpoint port is down)|$))')
+        p2 = regex_engine.compile(r'(^State:\s+(?P<state>UP|DOWN)(\s+-\s+'
+                                  r'(?P<reason>configuration incomplete|'
+                                  r'endpoint port is down)|$))')
 
         # End-point 1: tagged vlan 2501 e 2/10
         # End-point 1: untagged e 2/2
         # End-point 1: tagged vlan 100 inner-vlan 45 e 2/1
-        p3 = re.compile(r'(^End-point (?P<endpoint>1|2):\s+'
-                        r'(?P<type>tagged|untagged|undefined)'
-                        r'(\s+vlan\s+(?P<vid>\d+)|)(\s+inner-vlan\s+'
-                        r'(?P<innerid>\d+)|)\s+(?P<interface_name>\w+)\s+'
-                        r'(?P<interface>\d+\/\d+$))')
+        p3 = regex_engine.compile(r'(^End-point (?P<endpoint>1|2):\s+'
+                                  r'(?P<type>tagged|untagged|undefined)'
+                                  r'(\s+vlan\s+(?P<vid>\d+)|)(\s+inner-vlan\s+'
+                                  r'(?P<innerid>\d+)|)\s+(?P<interface_name>\w+)\s+'
+                                  r'(?P<interface>\d+\/\d+$))')
 
         # COS: 6
-        p4 = re.compile(r'(^COS:\s+(?P<cos>--$|\d+$))')
+        p4 = regex_engine.compile(r'(^COS:\s+(?P<cos>--$|\d+$))')
 
         # Extended Counters: Enabled
-        p5 = re.compile(r'(^Extended Counters:\s+'
-                        r'(?P<extcounters>[e|E]nabled|[d|D]isabled)$)')
+        p5 = regex_engine.compile(r'(^Extended Counters:\s+'
+                                  r'(?P<extcounters>[e|E]nabled|[d|D]isabled)$)')
 
         # Counter          : disabled
-        p6 = re.compile(r'(^Counter\s+:\s+'
-                        r'(?P<counter>[e|E]nabled|[d|D]isabled)$)')
+        p6 = regex_engine.compile(r'(^Counter\s+:\s+'
+                                  r'(?P<counter>[e|E]nabled|[d|D]isabled)$)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -719,10 +721,10 @@ class ShowMPLSLDPNeighbor(ShowMPLSLDPNeighborSchema):
 
         # 10.1.1.1      p4/1       10.1.1.1:0  15       14
         # 10.4.4.4      (targeted) 10.4.4.4:0  15       13
-        p1 = re.compile(r'(^(?P<neighbor>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
-                        r'(?P<int>\S+)\s+'
-                        r'(?P<ldpid>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}:\d+)\s+'
-                        r'(?P<hold>\d+)\s+(?P<time>\d+)$)')
+        p1 = regex_engine.compile(r'(^(?P<neighbor>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
+                                  r'(?P<int>\S+)\s+'
+                                  r'(?P<ldpid>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}:\d+)\s+'
+                                  r'(?P<hold>\d+)\s+(?P<time>\d+)$)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -14,7 +14,9 @@ Parsers:
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 __author__ = 'James Di Trapani <james@ditrapani.com.au>'
 
@@ -83,23 +85,23 @@ class ShowOptic(ShowOpticSchema):
         result_dict = {}
 
         # 1/1   31.3789 C  -040.0000 dBm -040.0000 dBm    0.000 mA
-        p1 = re.compile(r'(^(?P<port>\d+\/\d+)\s+'
-                        r'(?P<temp>\d+.\d+|N\/A)(\sC|)\s+'
-                        r'(?P<tx>[-]?\d+.\d+|N\/A|NONE)(\s+dBm|'
-                        r'\s+dBm\/\s*\d+\s+uW|)\s+'
-                        r'(?P<rx>[-]?\d+.\d+|N\/A|NONE)(\s+dBm|'
-                        r'\s+dBm\/\s*\d+\s+uW|)\s+'
-                        r'(?P<tbc>[-]?\d+.\d+|N\/A)(\s+mA|))')
+        p1 = regex_engine.compile(r'(^(?P<port>\d+\/\d+)\s+'
+                                  r'(?P<temp>\d+.\d+|N\/A)(\sC|)\s+'
+                                  r'(?P<tx>[-]?\d+.\d+|N\/A|NONE)(\s+dBm|'
+                                  r'\s+dBm\/\s*\d+\s+uW|)\s+'
+                                  r'(?P<rx>[-]?\d+.\d+|N\/A|NONE)(\s+dBm|'
+                                  r'\s+dBm\/\s*\d+\s+uW|)\s+'
+                                  r'(?P<tbc>[-]?\d+.\d+|N\/A)(\s+mA|))')
 
         # Normal      Low-Alarm      Low-Alarm     Low-Warn
-        p2 = re.compile(r'(^(?P<temp>Normal|Low-Alarm|Low-Warn|'
-                        r'High-Warn|High-Alarm)\s+'
-                        r'(?P<tx>Normal|Low-Alarm|Low-Warn|'
-                        r'High-Warn|High-Alarm)\s+'
-                        r'(?P<rx>Normal|Low-Alarm|Low-Warn|'
-                        r'High-Warn|High-Alarm)\s+'
-                        r'(?P<tbc>Normal|Low-Alarm|Low-Warn|'
-                        r'High-Warn|High-Alarm))')
+        p2 = regex_engine.compile(r'(^(?P<temp>Normal|Low-Alarm|Low-Warn|'
+                                  r'High-Warn|High-Alarm)\s+'
+                                  r'(?P<tx>Normal|Low-Alarm|Low-Warn|'
+                                  r'High-Warn|High-Alarm)\s+'
+                                  r'(?P<rx>Normal|Low-Alarm|Low-Warn|'
+                                  r'High-Warn|High-Alarm)\s+'
+                                  r'(?P<tbc>Normal|Low-Alarm|Low-Warn|'
+                                  r'High-Warn|High-Alarm))')
 
         for line in out.splitlines():
             line = line.strip()
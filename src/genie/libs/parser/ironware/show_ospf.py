@@ -15,7 +15,9 @@ Parsers:
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 __author__ = 'James Di Trapani <james@ditrapani.com.au>'
 
@@ -74,17 +76,17 @@ v10    10.1.10.1       1   FULL/DR    10.1.10.2       10.65.12.1 5 2 0
         result_dict = {}
 
         # Number of Neighbors is 2, in FULL state 2
-        p1 = re.compile(r'(^Number\s+of\s+Neighbors\s+is\s+(?P<num>\d+),\s'
-                        r'+in\s+FULL\s+state\s+(?P<full>\d+))')
+        p1 = regex_engine.compile(r'(^Number\s+of\s+Neighbors\s+is\s+(?P<num>\d+),\s'
+                                  r'+in\s+FULL\s+state\s+(?P<full>\d+))')
 
         # 5/1    10.254.251.3 1 FULL/OTHER 10.254.251.2 10.9.3.4  61 82  0
-        p2 = re.compile(r'(^(?P<port>\d+\/\d+|v\d+|tn\d+)\s+'
-                        r'(?P<local>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
-                        r'(?P<pri>\d+)\s+(?P<state>\S+)\s+'
-                        r'(?P<neighbor>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
-                        r'(?P<neighrid>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
-                        r'(?P<changes>\d+)\s+'
-                        r'(?P<opt>\d+)\s+(?P<lsaretrans>\d+)$)')
+        p2 = regex_engine.compile(r'(^(?P<port>\d+\/\d+|v\d+|tn\d+)\s+'
+                                  r'(?P<local>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
+                                  r'(?P<pri>\d+)\s+(?P<state>\S+)\s+'
+                                  r'(?P<neighbor>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
+                                  r'(?P<neighrid>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\s+'
+                                  r'(?P<changes>\d+)\s+'
+                                  r'(?P<opt>\d+)\s+(?P<lsaretrans>\d+)$)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -179,14 +181,14 @@ class ShowIPOSPFInterfaceBrief(ShowIPOSPFInterfaceBriefSchema):
         result_dict = {}
 
         # Number of Interfaces is 3
-        p1 = re.compile(r'(^Number\s+of\s+Interfaces\s+is\s+(?P<num>\d+)$)')
+        p1 = regex_engine.compile(r'(^Number\s+of\s+Interfaces\s+is\s+(?P<num>\d+)$)')
 
         # eth 5/1     0         10.254.251.21/31   20    ptpt     1/1
-        p2 = re.compile(r'(^(?P<int_name>eth|mgmt|loopback|ve|tn|tunnel)\s+'
-                        r'(?P<int_num>\d+\/\d+|\d+)\s+(?P<area>\d+)\s+'
-                        r'(?P<net>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}\/\d{1,2})\s+'
-                        r'(?P<cost>\d+)\s+(?P<state>\S+)\s+'
-                        r'(?P<fullneigh>\d+)\/(?P<configdneigh>\d+))')
+        p2 = regex_engine.compile(r'(^(?P<int_name>eth|mgmt|loopback|ve|tn|tunnel)\s+'
+                                  r'(?P<int_num>\d+\/\d+|\d+)\s+(?P<area>\d+)\s+'
+                                  r'(?P<net>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}\/\d{1,2})\s+'
+                                  r'(?P<cost>\d+)\s+(?P<state>\S+)\s+'
+                                  r'(?P<fullneigh>\d+)\/(?P<configdneigh>\d+))')
 
         for line in out.splitlines():
             line = line.strip()
@@ -15,7 +15,9 @@ Parsers:
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 __author__ = 'James Di Trapani <james@ditrapani.com.au>'
 
@@ -94,12 +96,12 @@ STATIC Codes - d:DHCPv6
         result_dict = {}
 
         # Total number of IP routes: 13
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'(^Total number of IP routes:\s+(?P<total>\d+))'
         )
 
         # 10  10.200.0.85/32 10.254.248.10 eth 2/2 110/27 O  40d0h  -
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'((?P<number>^\d+)\s+'
             r'(?P<network>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\/'
             r'(?P<netmask>\d{1,2})\s+'
@@ -112,7 +114,7 @@ STATIC Codes - d:DHCPv6
         # Used when src-vrf output wraps to the next line,
         # Brocade has no terminal-width
         # 11  192.168.195.200/32   DIRECT   loopback 1 0/0   D   248d
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'((?P<number>^\d+)\s+'
             r'(?P<network>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\/'
             r'(?P<netmask>\d{1,2})\s+'
@@ -123,7 +125,7 @@ STATIC Codes - d:DHCPv6
 
         # Used when equal cost paths exist
         #     10.4.1.1/32   10.254.251.108  eth 7/1  110/52  O  15h47m -
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'(^(?P<network>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3})\/'
             r'(?P<netmask>\d{1,2})\s+'
             r'(?P<gateway>\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}|DIRECT)\s+'
@@ -273,24 +275,24 @@ class ShowIPRouteSummary(ShowIPRouteSummarySchema):
         result_dict = {}
 
         # IP Routing Table - 449 entries
-        p1 = re.compile(r'(^IP\s+Routing\s+Table\s+-\s+'
-                        r'(?P<entries>\S+)\s+entries)')
+        p1 = regex_engine.compile(r'(^IP\s+Routing\s+Table\s+-\s+'
+                                  r'(?P<entries>\S+)\s+entries)')
 
         # 3 connected, 0 static, 0 RIP, 446 OSPF, 0 BGP, 0 ISIS
-        p2 = re.compile(r'(^(?P<connected>\S+)\s+connected,\s+'
-                        r'(?P<static>\S+)\s+static,\s+(?P<rip>\S+)\s+'
-                        r'RIP,\s+(?P<ospf>\S+)\s+OSPF,\s+(?P<bgp>\S+)\s+'
-                        r'BGP,\s+(?P<isis>\S+)\s+ISIS)')
+        p2 = regex_engine.compile(r'(^(?P<connected>\S+)\s+connected,\s+'
+                                  r'(?P<static>\S+)\s+static,\s+(?P<rip>\S+)\s+'
+                                  r'RIP,\s+(?P<ospf>\S+)\s+OSPF,\s+(?P<bgp>\S+)\s+'
+                                  r'BGP,\s+(?P<isis>\S+)\s+ISIS)')
 
         # /24: 1 /26: 2 /27: 3 /28: 5 /29: 1 /30: 34 /31: 242 /32: 161
-        p3 = re.compile(r'(\/\d{1,2}:\s+\d+)')
+        p3 = regex_engine.compile(r'(\/\d{1,2}:\s+\d+)')
 
         # /27: 3
-        p4 = re.compile(r'(^\/(?P<key>\d{1,2}):\s+(?P<num>\d+))')
+        p4 = regex_engine.compile(r'(^\/(?P<key>\d{1,2}):\s+(?P<num>\d+))')
 
         # Nexthop Table Entry - 5 entries
-        p5 = re.compile(r'(^Nexthop\s+Table\s+Entry\s+\-\s+'
-                        r'(?P<entries>\d+)\s+entries$)')
+        p5 = regex_engine.compile(r'(^Nexthop\s+Table\s+Entry\s+\-\s+'
+                                  r'(?P<entries>\d+)\s+entries$)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4,13 +4,15 @@ JunOS parsers for the following show commands:
     * monitor interface traffic
 """
 # Python
-import re
 import time
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any, 
         Optional, Use, SchemaTypeError, Schema)
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 """ Schema for:
             * monitor interface traffic
 """
@@ -54,7 +56,7 @@ class MonitorInterfaceTraffic(MonitorInterfaceTrafficSchema):
                     [r'{}[\S\s]+Time:\s+\S+'.format(self.device._hostname)],
                     timeout=timeout)
                 skip_timeout=True
-            ansi_escape = re.compile(r'(\x00|\x9B|\x1B\[[0-?]*[ -\/]*[@-~])')
+            ansi_escape = regex_engine.compile(r'(\x00|\x9B|\x1B\[[0-?]*[ -\/]*[@-~])')
             out = ansi_escape.sub('\t', out)
             self.device.sendline('q')
             if not skip_timeout:
@@ -66,13 +68,13 @@ class MonitorInterfaceTraffic(MonitorInterfaceTrafficSchema):
         ret_dict = {}
         monitor_time_sub_dict = {}
         
-        p1 = re.compile(r'^(?P<hostname>\S+)\s+Seconds:\s+(?P<seconds>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<hostname>\S+)\s+Seconds:\s+(?P<seconds>\d+)$')
 
-        p2 = re.compile(r'^(?P<interface>\S+)\s+(?P<link>Up|Down)\s+'
+        p2 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<link>Up|Down)\s+'
             r'(?P<input_packets>\d+)(\s+\((?P<input_pps>\d+)\))?\s+'
             r'(?P<output_packets>\d+)(\s+\((?P<output_pps>\d+)\))?$')
         
-        p3 = re.compile(r'Time:\s+(?P<monitor_time>\S+)$')
+        p3 = regex_engine.compile(r'Time:\s+(?P<monitor_time>\S+)$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -9,14 +9,14 @@ JunOS parsers for the following show commands:
     * ping {addr} source {source} size {size} do-not-fragment count {count}
     * ping {addr} size {size} count {count} do-not-fragment
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, SchemaTypeError, Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class PingSchema(MetaParser):
     """
@@ -141,35 +141,35 @@ class Ping(PingSchema):
         ret_dict = {}
 
         # PING 10.189.5.94 (10.189.5.94): 56 data bytes
-        p1 = re.compile(r'^PING +(?P<address>\S+) +\((?P<source>\S+)\): +'
-                r'(?P<data_bytes>\d+) +data +bytes$')
+        p1 = regex_engine.compile(r'^PING +(?P<address>\S+) +\((?P<source>\S+)\): +'
+                          r'(?P<data_bytes>\d+) +data +bytes$')
 
         # PING6(56=40+8+8 bytes) 2001:db8:223c:2c16::1 --> 2001:db8:223c:2c16::2
-        p1_1 = re.compile(r'^PING6\((?P<data_bytes>\d+)=\S+ +bytes\) +'
-                r'(?P<source>\S+) --> +(?P<address>\S+)$')
+        p1_1 = regex_engine.compile(r'^PING6\((?P<data_bytes>\d+)=\S+ +bytes\) +'
+                          r'(?P<source>\S+) --> +(?P<address>\S+)$')
 
         # 64 bytes from 10.189.5.94: icmp_seq=0 ttl=62 time=2.261 ms
-        p2 = re.compile(r'^(?P<bytes>\d+)\s+bytes\s+from\s+(?P<from>\S+)'
-                r'(:|,)\s+icmp_seq=(?P<icmp_seq>\d+)\s+'
-                r'(ttl=(?P<ttl>\d+)|hlim=(?P<hlim>\d+)) +'
-                r'time=(?P<time>\S+) +ms$')
+        p2 = regex_engine.compile(r'^(?P<bytes>\d+)\s+bytes\s+from\s+(?P<from>\S+)'
+                          r'(:|,)\s+icmp_seq=(?P<icmp_seq>\d+)\s+'
+                          r'(ttl=(?P<ttl>\d+)|hlim=(?P<hlim>\d+)) +'
+                          r'time=(?P<time>\S+) +ms$')
 
         # 36 bytes from 10.136.0.1: frag needed and DF set (MTU 1186)
         # 1240 bytes from 2001:34::1: Packet too big mtu = 1386
-        p2_2 = re.compile(r'^(?P<bytes>\d+)\s+bytes\s+from\s+(?P<from>\S+)'
-                          r':\s+(?P<message>[\s\w]+)(\(MTU\s|mtu\s=\s)(?P<mtu>\d+)(\))?$')
+        p2_2 = regex_engine.compile(r'^(?P<bytes>\d+)\s+bytes\s+from\s+(?P<from>\S+)'
+                                    r':\s+(?P<message>[\s\w]+)(\(MTU\s|mtu\s=\s)(?P<mtu>\d+)(\))?$')
 
         # 5 packets transmitted, 5 packets received, 0% packet loss
         # 5 packets transmitted, 0 packets received, 100% packet loss
-        p3 = re.compile(r'^(?P<send>\d+) +packets +transmitted, +'
-                r'(?P<received>\d+) +packets +received, +'
-                r'(?P<loss_rate>\d+)\% +packet +loss$')
+        p3 = regex_engine.compile(r'^(?P<send>\d+) +packets +transmitted, +'
+                          r'(?P<received>\d+) +packets +received, +'
+                          r'(?P<loss_rate>\d+)\% +packet +loss$')
 
         # round-trip min/avg/max/stddev = 1.823/2.175/2.399/0.191 ms
         # round-trip min/avg/max/std-dev = 0.677/98.186/973.514/291.776 ms
-        p4 = re.compile(r'^round-trip +min\/avg\/max\/std(\-)?'
-                r'dev +\= +(?P<min>[\d\.]+)\/(?P<avg>[\d\.]+)\/'
-                r'(?P<max>[\d\.]+)\/(?P<stddev>[\d\.]+) +ms$')
+        p4 = regex_engine.compile(r'^round-trip +min\/avg\/max\/std(\-)?'
+                          r'dev +\= +(?P<min>[\d\.]+)\/(?P<avg>[\d\.]+)\/'
+                          r'(?P<max>[\d\.]+)\/(?P<stddev>[\d\.]+) +ms$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -249,9 +249,9 @@ class PingMplsRsvp(PingMplsRsvpSchema):
         ret_dict = {}
 
         # 5 packets transmitted, 5 packets received, 0% packet loss
-        p1 = re.compile(r'^(?P<send>\d+) +packets +transmitted, +'
-                r'(?P<received>\d+) packets +received, +'
-                r'(?P<loss_rate>\d+)\% +packet +loss$')
+        p1 = regex_engine.compile(r'^(?P<send>\d+) +packets +transmitted, +'
+                          r'(?P<received>\d+) packets +received, +'
+                          r'(?P<loss_rate>\d+)\% +packet +loss$')
 
         for line in out.splitlines():
             line = line.strip()
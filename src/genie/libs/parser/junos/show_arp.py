@@ -4,15 +4,15 @@ JunOS parsers for the following show commands:
     * show arp
     * show arp | no-more
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowArpSchema(MetaParser):
     """ Schema for:
@@ -64,11 +64,11 @@ class ShowArp(ShowArpSchema):
         ret_dict = {}
 
         # 00:50:56:ff:ba:6f 10.1.0.1         10.1.0.1                   fxp0.0                  none
-        p1 = re.compile(r'^(?P<mac_address>[\w:]+) +(?P<ip_address>\S+) +(?P<hostname>\S+) +'
-                r'(?P<interface_name>\S+) +(?P<arp_table_entry_flags>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<mac_address>[\w:]+) +(?P<ip_address>\S+) +(?P<hostname>\S+) +'
+                          r'(?P<interface_name>\S+) +(?P<arp_table_entry_flags>\S+)$')
 
         # Total entries: 7
-        p2 = re.compile(r'^Total +entries: +(?P<total_entries>\d+)$')
+        p2 = regex_engine.compile(r'^Total +entries: +(?P<total_entries>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -159,12 +159,12 @@ class ShowArpNoResolve(ShowArpNoResolveSchema):
         ret_dict = {}
 
         #00:50:56:ff:ba:6f 10.1.0.1         fxp0.0                   none
-        p1 = re.compile(r'^(?P<mac_address>[\w:]+) +'
-                        r'(?P<ip_address>\S+) +(?P<interface_name>\S+) '
-                        r'+(?P<arp_table_entry_flags>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<mac_address>[\w:]+) +'
+                                  r'(?P<ip_address>\S+) +(?P<interface_name>\S+) '
+                                  r'+(?P<arp_table_entry_flags>\S+)$')
 
         # Total entries: 7
-        p2 = re.compile(r'^Total +entries: +(?P<total_entries>\d+)$')
+        p2 = regex_engine.compile(r'^Total +entries: +(?P<total_entries>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
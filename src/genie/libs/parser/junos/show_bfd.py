@@ -4,13 +4,15 @@ JUNOS parsers for the following commands:
     * show bfd session
 """
 
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowBFDSessionSchema(MetaParser):
     """ Schema for
@@ -52,19 +54,19 @@ class ShowBFDSession(ShowBFDSessionSchema):
 
         # 10.0.0.1                        Operational Open          26         DU
         # 10.0.0.2               Up        ge-0/0/0.0     1.500     0.500        3
-        p1 = re.compile(r'^(?P<session_neighbor>\S+) +'
-                        r'(?P<session_state>\S+)'
-                        r'( +(?P<session_interface>\S+))? +'
-                        r'(?P<session_detection_time>[\d\.]+) +'
-                        r'(?P<session_transmission_interval>[\d\.]+) +'
-                        r'(?P<session_adaptive_multiplier>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<session_neighbor>\S+) +'
+                                  r'(?P<session_state>\S+)'
+                                  r'( +(?P<session_interface>\S+))? +'
+                                  r'(?P<session_detection_time>[\d\.]+) +'
+                                  r'(?P<session_transmission_interval>[\d\.]+) +'
+                                  r'(?P<session_adaptive_multiplier>\S+)$')
 
         #     1 sessions, 1 clients
-        p2 = re.compile(r'^(?P<sessions>\S+) +sessions, +(?P<clients>\S+) +clients$')
+        p2 = regex_engine.compile(r'^(?P<sessions>\S+) +sessions, +(?P<clients>\S+) +clients$')
 
         #     Cumulative transmit rate 2.0 pps, cumulative receive rate 2.0 pps
-        p3 = re.compile(r'^Cumulative transmit rate (?P<cumulative_reception_rate>\S+) pps, '
-                        r'cumulative receive rate (?P<cumulative_transmission_rate>\S+) pps$')
+        p3 = regex_engine.compile(r'^Cumulative transmit rate (?P<cumulative_reception_rate>\S+) pps, '
+                                  r'cumulative receive rate (?P<cumulative_transmission_rate>\S+) pps$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -152,39 +154,39 @@ class ShowBFDSessionDetail(ShowBFDSessionDetailSchema):
         #                                                       Detect   Transmit
         #     Address                  State     Interface      Time     Interval  Multiplier
         #     10.34.2.250             Up                       1.500     0.500        3
-        p1 = re.compile(r'^(?P<session_neighbor>\S+) +'
-                        r'(?P<session_state>\S+)'
-                        r'( +(?P<session_interface>\S+))? +'
-                        r'(?P<session_detection_time>[\d\.]+) +'
-                        r'(?P<session_transmission_interval>[\d\.]+) +'
-                        r'(?P<session_adaptive_multiplier>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<session_neighbor>\S+) +'
+                                  r'(?P<session_state>\S+)'
+                                  r'( +(?P<session_interface>\S+))? +'
+                                  r'(?P<session_detection_time>[\d\.]+) +'
+                                  r'(?P<session_transmission_interval>[\d\.]+) +'
+                                  r'(?P<session_adaptive_multiplier>\S+)$')
 
         #      Client LDP-OAM, TX interval 0.050, RX interval 0.050
         #      Client LDP-OAM ipv4-unicast Area0.0.0.0, TX interval 0.050, RX interval 0.050
-        p2 = re.compile(r'^Client +(?P<client_name>\S+)([\S\s]+)?, +TX +interval '
-                        r'(?P<client_transmission_interval>\S+), +RX +interval '
-                        r'(?P<client_reception_interval>\S+)$')
+        p2 = regex_engine.compile(r'^Client +(?P<client_name>\S+)([\S\s]+)?, +TX +interval '
+                                  r'(?P<client_transmission_interval>\S+), +RX +interval '
+                                  r'(?P<client_reception_interval>\S+)$')
 
         #      Session up time 00:02:46
-        p3 = re.compile(r'^Session +up +time +(?P<session_up_time>\S+)$')
+        p3 = regex_engine.compile(r'^Session +up +time +(?P<session_up_time>\S+)$')
 
         #      Local diagnostic None, remote diagnostic None
-        p4 = re.compile(r'^Local +diagnostic +(?P<local_diagnostic>\S+), '
-                        r'remote +diagnostic +(?P<remote_diagnostic>\S+)$')
+        p4 = regex_engine.compile(r'^Local +diagnostic +(?P<local_diagnostic>\S+), '
+                                  r'remote +diagnostic +(?P<remote_diagnostic>\S+)$')
 
         #      Remote state Up, version 1
-        p5 = re.compile(r'^Remote +state +(?P<remote_state>\S+), '
-                        r'+version +(?P<session_version>\S+)$')
+        p5 = regex_engine.compile(r'^Remote +state +(?P<remote_state>\S+), '
+                                  r'+version +(?P<session_version>\S+)$')
 
         #      Session type: Multi hop BFD
-        p6 = re.compile(r'^Session +type: +(?P<session_type>[\S\s]+)$')
+        p6 = regex_engine.compile(r'^Session +type: +(?P<session_type>[\S\s]+)$')
 
         #     1 sessions, 1 clients
-        p7 = re.compile(r'^(?P<sessions>\S+) +sessions, +(?P<clients>\S+) +clients$')
+        p7 = regex_engine.compile(r'^(?P<sessions>\S+) +sessions, +(?P<clients>\S+) +clients$')
 
         #     Cumulative transmit rate 2.0 pps, cumulative receive rate 2.0 pps
-        p8 = re.compile(r'^Cumulative transmit rate (?P<cumulative_reception_rate>\S+) pps, '
-                        r'cumulative receive rate (?P<cumulative_transmission_rate>\S+) pps$')
+        p8 = regex_engine.compile(r'^Cumulative transmit rate (?P<cumulative_reception_rate>\S+) pps, '
+                                  r'cumulative receive rate (?P<cumulative_transmission_rate>\S+) pps$')
 
         # ========================================================
         # Build output
@@ -317,71 +319,71 @@ class ShowBFDSessionAddressExtensive(ShowBFDSessionAddressExtensiveSchema):
         #                                                       Detect   Transmit
         #     Address                  State     Interface      Time     Interval  Multiplier
         #     10.34.2.250             Up                       1.500     0.500        3
-        p1 = re.compile(r'^(?P<session_neighbor>\S+) +'
-                        r'(?P<session_state>\S+)'
-                        r'( +(?P<session_interface>\S+))? +'
-                        r'(?P<session_detection_time>[\d\.]+) +'
-                        r'(?P<session_transmission_interval>[\d\.]+) +'
-                        r'(?P<session_adaptive_multiplier>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<session_neighbor>\S+) +'
+                                  r'(?P<session_state>\S+)'
+                                  r'( +(?P<session_interface>\S+))? +'
+                                  r'(?P<session_detection_time>[\d\.]+) +'
+                                  r'(?P<session_transmission_interval>[\d\.]+) +'
+                                  r'(?P<session_adaptive_multiplier>\S+)$')
 
         #      Client LDP-OAM, TX interval 0.050, RX interval 0.050
-        p2 = re.compile(r'^Client +(?P<client_name>\S+)([\s\S]+)?, '
-                        r'+TX +interval (?P<client_transmission_interval>\S+), '
-                        r'+RX +interval (?P<client_reception_interval>\S+)$')
+        p2 = regex_engine.compile(r'^Client +(?P<client_name>\S+)([\s\S]+)?, '
+                                  r'+TX +interval (?P<client_transmission_interval>\S+), '
+                                  r'+RX +interval (?P<client_reception_interval>\S+)$')
 
         #      Session up time 00:02:46
-        p3 = re.compile(r'^Session +up +time +(?P<session_up_time>\S+)$')
+        p3 = regex_engine.compile(r'^Session +up +time +(?P<session_up_time>\S+)$')
 
         #      Local diagnostic None, remote diagnostic None
-        p4 = re.compile(r'^Local +diagnostic +(?P<local_diagnostic>\S+), '
-                        r'remote +diagnostic +(?P<remote_diagnostic>\S+)$')
+        p4 = regex_engine.compile(r'^Local +diagnostic +(?P<local_diagnostic>\S+), '
+                                  r'remote +diagnostic +(?P<remote_diagnostic>\S+)$')
 
         #      Remote state Up, version 1
-        p5 = re.compile(r'^Remote +state +(?P<remote_state>\S+), '
-                        r'+version +(?P<session_version>\S+)$')
+        p5 = regex_engine.compile(r'^Remote +state +(?P<remote_state>\S+), '
+                                  r'+version +(?P<session_version>\S+)$')
 
         #      Session type: Multi hop BFD
-        p6 = re.compile(r'^Session +type: +(?P<session_type>[\S\s]+)$')
+        p6 = regex_engine.compile(r'^Session +type: +(?P<session_type>[\S\s]+)$')
 
 
         # Min async interval 1.000, min slow interval 1.000
-        p7 = re.compile(r'^Min +async +interval +(?P<minimum_asynchronous_interval>'
-                        r'[\d\.]+), min +slow +interval +(?P<minimum_slow_interval>[\d\.]+)$')
+        p7 = regex_engine.compile(r'^Min +async +interval +(?P<minimum_asynchronous_interval>'
+                                  r'[\d\.]+), min +slow +interval +(?P<minimum_slow_interval>[\d\.]+)$')
 
         #Adaptive async TX interval 1.000, RX interval 1.000
-        p8 = re.compile(r'^Adaptive +async +TX +interval +'
-                        r'(?P<adap_transmission_interval>[\d\.]+), RX +interval '
-                        r'+(?P<adap_reception_interval>[\d\.]+)$')
+        p8 = regex_engine.compile(r'^Adaptive +async +TX +interval +'
+                                  r'(?P<adap_transmission_interval>[\d\.]+), RX +interval '
+                                  r'+(?P<adap_reception_interval>[\d\.]+)$')
 
         #Local min TX interval 1.000, minimum RX interval 1.000, multiplier 3
-        p9 = re.compile(r'^Local +min +TX +interval +(?P<minimum_transmission_interval>[\d\.]+), '
-                        r'minimum +RX +interval +(?P<minimum_reception_interval>[\d\.]+), '
-                        r'+multiplier +(?P<detection_multiplier>\d+)$')
+        p9 = regex_engine.compile(r'^Local +min +TX +interval +(?P<minimum_transmission_interval>[\d\.]+), '
+                                  r'minimum +RX +interval +(?P<minimum_reception_interval>[\d\.]+), '
+                                  r'+multiplier +(?P<detection_multiplier>\d+)$')
 
         #Remote min TX interval 1.000, min RX interval 1.000, multiplier 3
-        p10 = re.compile(r'^Remote +min +TX +interval +(?P<neighbor_min_trans_interval>[\d\.]+), '
-                         r'min +RX +interval +(?P<neighbor_min_rec_interval>[\d\.]+), +multiplier '
-                         r'+(?P<neighbor_session_multiplier>\d+)$')
+        p10 = regex_engine.compile(r'^Remote +min +TX +interval +(?P<neighbor_min_trans_interval>[\d\.]+), '
+                                   r'min +RX +interval +(?P<neighbor_min_rec_interval>[\d\.]+), +multiplier '
+                                   r'+(?P<neighbor_session_multiplier>\d+)$')
 
         #Local discriminator 350, remote discriminator 772
-        p11 = re.compile(r'^Local +discriminator +(?P<local_discriminator>\d+), '
-                        r'remote +discriminator +(?P<remote_discriminator>\d+)$')
+        p11 = regex_engine.compile(r'^Local +discriminator +(?P<local_discriminator>\d+), '
+                                  r'remote +discriminator +(?P<remote_discriminator>\d+)$')
 
         #Echo mode disabled/inactive
-        p12 = re.compile(r'^Echo +mode +(?P<echo_mode_desired>\S+)+\/+(?P<echo_mode_state>\S+)$')
+        p12 = regex_engine.compile(r'^Echo +mode +(?P<echo_mode_desired>\S+)+\/+(?P<echo_mode_state>\S+)$')
 
         #Remote is control-plane independent
-        p13 = re.compile(r'^(?P<neighbor_fate>Remote+ is+[\s\S]+)$')
+        p13 = regex_engine.compile(r'^(?P<neighbor_fate>Remote+ is+[\s\S]+)$')
 
         #Session ID: 0x1b3
-        p14 = re.compile(r'^(?P<no_refresh>Session+ ID:+[\s\S]+)$')
+        p14 = regex_engine.compile(r'^(?P<no_refresh>Session+ ID:+[\s\S]+)$')
 
         #     1 sessions, 1 clients
-        p15 = re.compile(r'^(?P<sessions>\S+) +sessions, +(?P<clients>\S+) +clients$')
+        p15 = regex_engine.compile(r'^(?P<sessions>\S+) +sessions, +(?P<clients>\S+) +clients$')
 
         #     Cumulative transmit rate 2.0 pps, cumulative receive rate 2.0 pps
-        p16 = re.compile(r'^Cumulative transmit rate (?P<cumulative_reception_rate>\S+) pps, '
-                        r'cumulative receive rate (?P<cumulative_transmission_rate>\S+) pps$')
+        p16 = regex_engine.compile(r'^Cumulative transmit rate (?P<cumulative_reception_rate>\S+) pps, '
+                                  r'cumulative receive rate (?P<cumulative_transmission_rate>\S+) pps$')
 
         # ========================================================
         # Build output
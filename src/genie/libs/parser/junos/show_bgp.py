@@ -12,14 +12,15 @@ JunOs parsers for the following show commands:
     * show bgp summary instance {instance}
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use, Schema, ListOf)
 
+# Parser utils
+from genie.libs.parser.utils import regex_engine
+from genie.libs.parser.utils.junos_structured import StructuredOutputMixin
+
 
 class ShowBgpGroupBriefSchema(MetaParser):
     """ Schema for:
@@ -181,137 +182,137 @@ class ShowBgpGroupBrief(ShowBgpGroupBriefSchema):
         table_found = None
 
         # Group Type: Internal    AS: 65171                  Local AS: 65171
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Group +Type: +(?P<type>\S+)( +AS: +(?P<peer_as>\d+))? +'
             r'Local +AS: +(?P<local_as>\d+)$')
 
         # Name: hktGCS002       Index: 0                   Flags: <Export Eval>
-        p2 = re.compile(r'^Name: +(?P<name>\S+) +Index: +(?P<index>\d+) +'
-                        r'Flags: +\<(?P<flags>[\S ]+)\>$')
+        p2 = regex_engine.compile(r'^Name: +(?P<name>\S+) +Index: +(?P<index>\d+) +'
+                                  r'Flags: +\<(?P<flags>[\S ]+)\>$')
 
         # Export: [ (v4_WATARI && NEXT-HOP-SELF) ]
-        p3 = re.compile(r'^Export: +\[ +(?P<export>(\()?[\S ]+(\))?) +\]$')
+        p3 = regex_engine.compile(r'^Export: +\[ +(?P<export>(\()?[\S ]+(\))?) +\]$')
 
         # Options: <Confed>
-        p4 = re.compile(r'^Options: +\<(?P<options>Confed|'
-                        r'Cluster +Confed|Multihop Confed)\>$')
+        p4 = regex_engine.compile(r'^Options: +\<(?P<options>Confed|'
+                                  r'Cluster +Confed|Multihop Confed)\>$')
 
         # Options: <GracefulShutdownRcv>
-        p5 = re.compile(r'^Options: +\<(?P<options>GracefulShutdownRcv)\>$')
+        p5 = regex_engine.compile(r'^Options: +\<(?P<options>GracefulShutdownRcv)\>$')
 
         # Holdtime: 0
-        p6 = re.compile(r'^Holdtime: +(?P<holdtime>\d+)$')
+        p6 = regex_engine.compile(r'^Holdtime: +(?P<holdtime>\d+)$')
 
         # Graceful Shutdown Receiver local-preference: 0
-        p7 = re.compile(r'^Graceful +Shutdown +Receiver +local-preference: +'
-                        r'(?P<gshut_recv_local_preference>\d+)$')
+        p7 = regex_engine.compile(r'^Graceful +Shutdown +Receiver +local-preference: +'
+                                  r'(?P<gshut_recv_local_preference>\d+)$')
 
         # Total peers: 1        Established: 1
-        p8 = re.compile(r'^Total +peers: +(?P<total_peers>\d+) +'
-                        r'Established: +(?P<established>\d+)$')
+        p8 = regex_engine.compile(r'^Total +peers: +(?P<total_peers>\d+) +'
+                                  r'Established: +(?P<established>\d+)$')
 
         # inet6.0: 0/0/0/0
         # inet.0           : 0/682/682/0
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^(?P<name>inet(\d+)?\.\d+) *: +(?P<active_prefix_count>\d+)'
             r'\/(?P<received_prefix_count>\d+)\/(?P<accepted_prefix_count>\d+)'
             r'\/(?P<advertised_prefix_count>\d+)$')
 
         # Groups: 14 Peers: 19   External: 6    Internal: 13   Down peers: 15  Flaps: 359
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^Groups:\s+(?P<group_count>\d+)\s+Peers:\s+'
             r'(?P<peer_count>\d+)\s+External:\s+(?P<external_peer_count>\d+)'
             r'\s+Internal:\s+(?P<internal_peer_count>\d+)\s+Down\s+peers:\s+'
             r'(?P<down_peer_count>\d+)\s+Flaps:\s+(?P<flap_count>\d+)$')
 
         # 1366        682          0          0          0          0
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^(?P<tot_paths>\d+) +(?P<act_paths>\d+) +'
             r'(?P<suppressed>\d+) +(?P<history>\d+) +(?P<damp_state>\d+) +'
             r'(?P<pending>\d+)$')
 
         # Table inet.0
-        p12 = re.compile(r'^Table +(?P<name>\S+)$')
+        p12 = regex_engine.compile(r'^Table +(?P<name>\S+)$')
 
         # Active prefixes:              0
-        p13 = re.compile(r'^Active +prefixes: +(?P<active_prefix_count>\d+)$')
+        p13 = regex_engine.compile(r'^Active +prefixes: +(?P<active_prefix_count>\d+)$')
 
         # Received prefixes:            682
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r'^Received +prefixes: +(?P<received_prefix_count>\d+)$')
 
         # Accepted prefixes:            682
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r'^Accepted +prefixes: +(?P<accepted_prefix_count>\d+)$')
 
         # Suppressed due to damping:    0
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r'^Suppressed +due +to +damping: +(?P<suppressed_prefix_count>\d+)$'
         )
 
         # Advertised prefixes:          682
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r'^Advertised +prefixes: +(?P<advertised_prefix_count>\d+)$')
 
         # Received external prefixes:   684
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r'^Received +external +prefixes: +(?P<received_external_prefixes>\d+)$'
         )
 
         # Active external prefixes:     682
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r'^Active +external +prefixes: +(?P<active_external_prefixes>\d+)$'
         )
 
         # Externals suppressed:         0
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r'^Externals +suppressed: +(?P<externals_suppressed>\d+)$')
 
         # Received internal prefixes:   682
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r'^Received +internal +prefixes: +(?P<received_internal_prefixes>\d+)$'
         )
 
         # Active internal prefixes:     0
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r'^Active +internal +prefixes: +(?P<active_internal_prefixes>\d+)$'
         )
 
         # Internals suppressed:         0
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r'^Internals +suppressed: +(?P<internal_suppressed>\d+)$')
 
         # RIB State: BGP restart is complete
-        p24 = re.compile(r'^RIB +State: +(?P<rib_state>[\S\s]+)$')
+        p24 = regex_engine.compile(r'^RIB +State: +(?P<rib_state>[\S\s]+)$')
 
         # Route Queue Timer: unset Route Queue: empty
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r'^Route +Queue +Timer: +(?P<timer>\w+) +Route +Queue: +(?P<state>\w+)$'
         )
 
         # 10.189.5.253+179
-        pIp = re.compile(r'^(?P<peer_address>\S+)$')
+        pIp = regex_engine.compile(r'^(?P<peer_address>\S+)$')
 
         # hktGCS002    Internal   1         1
         # v6_hktGCS002 Internal   1         1
         # sjkGDS221-EC11 External 1         1
-        p26 = re.compile(r'^(?P<name>\S+) +(?P<type>Internal|External) '
-                         r'+(?P<peer_count>\d+) +(?P<established_count>\d+)$')
+        p26 = regex_engine.compile(r'^(?P<name>\S+) +(?P<type>Internal|External) '
+                                   r'+(?P<peer_count>\d+) +(?P<established_count>\d+)$')
 
         # inet.3           : 2/2/2/0 External: 2/2/2/0 Internal: 0/0/0/0
-        p27 = re.compile(r'^(?P<name>inet(\d+)?\.\d+) *: '
-                         r'+(?P<active_prefix_count>\d+)\/'
-                         r'(?P<received_prefix_count>\d+)\/'
-                         r'(?P<accepted_prefix_count>\d+)\/'
-                         r'(?P<suppressed_prefix_count>\d+) '
-                         r'+External: +(?P<active_external_prefix_count>\d+)\/'
-                         r'(?P<total_external_prefix_count>\d+)\/'
-                         r'(?P<accepted_external_prefix_count>\d+)\/'
-                         r'(?P<suppressed_external_prefix_count>\d+) '
-                         r'+Internal: +(?P<active_internal_prefix_count>\d+)\/'
-                         r'(?P<total_internal_prefix_count>\d+)\/'
-                         r'(?P<accepted_internal_prefix_count>\d+)\/'
-                         r'(?P<suppressed_internal_prefix_count>\d+)$')
+        p27 = regex_engine.compile(r'^(?P<name>inet(\d+)?\.\d+) *: '
+                                   r'+(?P<active_prefix_count>\d+)\/'
+                                   r'(?P<received_prefix_count>\d+)\/'
+                                   r'(?P<accepted_prefix_count>\d+)\/'
+                                   r'(?P<suppressed_prefix_count>\d+) '
+                                   r'+External: +(?P<active_external_prefix_count>\d+)\/'
+                                   r'(?P<total_external_prefix_count>\d+)\/'
+                                   r'(?P<accepted_external_prefix_count>\d+)\/'
+                                   r'(?P<suppressed_external_prefix_count>\d+) '
+                                   r'+Internal: +(?P<active_internal_prefix_count>\d+)\/'
+                                   r'(?P<total_internal_prefix_count>\d+)\/'
+                                   r'(?P<accepted_internal_prefix_count>\d+)\/'
+                                   r'(?P<suppressed_internal_prefix_count>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -843,7 +844,7 @@ class ShowBgpSummarySchema(MetaParser):
     }
 
 
-class ShowBgpSummary(ShowBgpSummarySchema):
+class ShowBgpSummary(StructuredOutputMixin, ShowBgpSummarySchema):
     """
     Parser for:
         * show bgp summary
@@ -866,12 +867,12 @@ class ShowBgpSummary(ShowBgpSummarySchema):
         # 'bgp-information' dict
         # ------------------------------------------------------------
         # Threading mode: BGP I/O
-        p1 = re.compile(r'^Threading +mode: +(?P<bgp_thread_mode>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^Threading +mode: +(?P<bgp_thread_mode>[\S\s]+)$')
 
         # Groups: 14 Peers: 19 Down peers: 15
-        p2 = re.compile(r'^Groups: +(?P<group_count>\d+) +Peers: '
-                        r'+(?P<peer_count>\d+) +Down +peers: '
-                        r'+(?P<down_peer_count>\d+)$')
+        p2 = regex_engine.compile(r'^Groups: +(?P<group_count>\d+) +Peers: '
+                                  r'+(?P<peer_count>\d+) +Down +peers: '
+                                  r'+(?P<down_peer_count>\d+)$')
 
         # ------------------------------------------------------------
         # p3, p4
@@ -881,10 +882,10 @@ class ShowBgpSummary(ShowBgpSummarySchema):
         # inet.0
         # inet6.0
         # VRF-TEST001.inet.0
-        p3 = re.compile(r'.*(?P<name>(inet|mdt)(\d+)?.\d)$')
+        p3 = regex_engine.compile(r'.*(?P<name>(inet|mdt)(\d+)?.\d)$')
 
         # 1366        682          0          0          0          0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^(?P<total_prefix_count>\d+) +(?P<active_prefix_count>\d+) +'
             r'(?P<suppressed_prefix_count>\d+) +(?P<history_prefix_count>\d+) +'
             r'(?P<damped_prefix_count>\d+) +(?P<pending_prefix_count>\d+)$')
@@ -897,7 +898,7 @@ class ShowBgpSummary(ShowBgpSummarySchema):
         # 10.49.216.179           65171          0          0       0       0 29w5d 22:42:36 Connect
         # 2001:db8:eb18:ca45::11       65151          0          0       0       0 29w5d 22:42:36 Connect
         # 10.145.0.2                  3          2          3       0       1           9 0/0/0/0              0/0/0/0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^(?P<peer_address>[\d\w:.]+)\s+(?P<peer_as>\d+)\s+'
             r'(?P<input_messages>\d+)\s+(?P<output_messages>\d+)\s+'
             r'(?P<route_queue_count>\d+)\s+(?P<flap_count>\d+)\s+'
@@ -912,7 +913,7 @@ class ShowBgpSummary(ShowBgpSummarySchema):
         #       ]
         # ------------------------------------------------------------
         # inet.0: 682/684/684/0
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^(?P<name>inet(\d+)?\.\d+) *: +(?P<active_prefix_count>\d+)'
             r'\/(?P<received_prefix_count>\d+)\/(?P<accepted_prefix_count>\d+)'
             r'\/(?P<suppressed_prefix_count>\d+)$')
@@ -1022,7 +1023,7 @@ class ShowBgpSummary(ShowBgpSummarySchema):
                 group = m.groupdict()
                 bgp_peer_dict = {}
 
-                special_case_state = re.compile(r'([\d\/]+\s+[\d\/]+)')
+                special_case_state = regex_engine.compile(r'([\d\/]+\s+[\d\/]+)')
 
                 for key, value in group.items():
                     if key == 'text':
@@ -1204,7 +1205,7 @@ class ShowBgpNeighborSchema(MetaParser):
         }
 
 
-class ShowBgpNeighbor(ShowBgpNeighborSchema):
+class ShowBgpNeighbor(StructuredOutputMixin, ShowBgpNeighborSchema):
     """ Parser for:
             * show bgp neighbor
             * show bgp neighbor {neighbor_address}
@@ -1214,202 +1215,198 @@ class ShowBgpNeighbor(ShowBgpNeighborSchema):
 
     def cli(self, neighbor_address=None, output=None):
         if not output:
-            if neighbor_address:
-                out = self.device.execute(self.cli_command[1].format(
-                    neighbor_address=neighbor_address
-                ))
-            else:
-                out = self.device.execute(self.cli_command[0])
+            out = self.device.execute(self._get_command(
+                neighbor_address=neighbor_address))
         else:
             out = output
 
         # Peer: 10.49.216.179 AS 65171   Local: 10.189.5.252 AS 65171
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Peer: +(?P<peer_address>\S+) +AS +(?P<peer_as>\d+) +Local: +(?P<local_address>\S+) +AS +(?P<local_as>\d+)$'
         )
         # Description: v4_pyats
-        p2 = re.compile(r'^Description: +(?P<description>\S+)$')
+        p2 = regex_engine.compile(r'^Description: +(?P<description>\S+)$')
         # Group: v4_pyats             Routing-Instance: master
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Group: +(?P<peer_group>\S+) +Routing-Instance: +(?P<peer_cfg_rti>\S+)$'
         )
         # Forwarding routing-instance: master
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Forwarding +routing-instance: +(?P<peer_fwd_rti>\S+)$')
         # Type: Internal    State: Active       (route reflector client)Flags: <>
         # Type: External    State: Established    Flags: <Sync InboundConvergencePending>
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Type: +(?P<peer_type>\S+) +State: +(?P<peer_state>\S+) +(?P<route_reflector>\(route +reflector +client\))?Flags: +<(?P<peer_flags>[\s\S]*)>$'
         )
         # Last State: Idle          Last Event: Start
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Last +State: +(?P<last_state>\S+) +Last +Event: +(?P<last_event>\S+)'
         )
         # Last Error: None
-        p7 = re.compile(r'^Last +Error: +(?P<last_error>[\S\s]+)$')
+        p7 = regex_engine.compile(r'^Last +Error: +(?P<last_error>[\S\s]+)$')
         # Export: [ v4_pyats_NO-DEFAULT ] Import: [ 11 ]
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Export: +\[ +(?P<export_policy>\S+) +\] +Import: +\[ +(?P<import_policy>\S+) +\]$'
         )
 
         # Export: [ v4_pyats_NO-DEFAULT ]
-        p8_1 = re.compile(
+        p8_1 = regex_engine.compile(
             r'^Export: +\[ +(?P<export_policy>\S+) +\]$'
         )
 
         # Import: [ as-path-limit ]
-        p8_2 = re.compile(
+        p8_2 = regex_engine.compile(
             r'^Import: +\[ +(?P<import_policy>\S+) +\]$'
         )
 
         # Options: <Preference LocalAddress HoldTime LogUpDown Cluster PeerAS Refresh Confed>
         # Options: <GracefulShutdownRcv>
-        p9 = re.compile(r'^Options: +<(?P<options>[\S\s]+)>$')
+        p9 = regex_engine.compile(r'^Options: +<(?P<options>[\S\s]+)>$')
 
         # Holdtime: 30 Preference: 170
         # Local Address: 10.189.5.252 Holdtime: 720 Preference: 170
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^(Local +Address: +(?P<local_address>\S+) +)?Holdtime: +(?P<holdtime>\S+) +Preference: +(?P<preference>\S+)$'
         )
         # Graceful Shutdown Receiver local-preference: 0
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^Graceful +Shutdown +Receiver +local-preference: +(?P<gshut_recv_local_preference>\d+)$'
         )
         # Number of flaps: 0
-        p12 = re.compile(r'^Number +of +flaps: +(?P<flap_count>\d+)$')
+        p12 = regex_engine.compile(r'^Number +of +flaps: +(?P<flap_count>\d+)$')
         # Authentication key is configured
-        p13 = re.compile(r'^Authentication +key +is +configured$')
+        p13 = regex_engine.compile(r'^Authentication +key +is +configured$')
         # Export: [ ((LABELSTACK_O2B || HKG-EC_out) && (NEXT-HOP-SELF && HKG-EC_AddMED)) ]
-        p14 = re.compile(r'^Export: +\[ +(?P<export_policy>[\s\S]+) +\]$')
+        p14 = regex_engine.compile(r'^Export: +\[ +(?P<export_policy>[\s\S]+) +\]$')
         # Address families configured: inet-unicast inet-labeled-unicast
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r'^Address +families +configured: +(?P<address_families>[\S\s]+)$')
         # Type: External    State: Established    Flags: <Sync>
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r'^Type: +(?P<peer_type>\S+) +State: +(?P<peer_state>\S+) +Flags: +<(?P<peer_flags>\S*)>$'
         )
         # Last flap event: HoldTime
-        p17 = re.compile(r'^Last +flap +event: +(?P<last_flap_event>\S+)')
+        p17 = regex_engine.compile(r'^Last +flap +event: +(?P<last_flap_event>\S+)')
         # Error: 'Hold Timer Expired Error' Sent: 27 Recv: 40
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r'^Error: +\'(?P<name>[\S\s]+)\' +Sent: +(?P<send_count>\d+) +Recv: +(?P<receive_count>\d+)$'
         )
         # Peer ID: 10.169.14.240  Local ID: 10.189.5.252      Active Holdtime: 30
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r'^Peer +ID: +(?P<peer_id>[\d\.]+) +Local +ID: +(?P<local_id>[\d\.]+) +Active +Holdtime: +(?P<active_holdtime>\d+)$'
         )
         # Keepalive Interval: 10         Group index: 10   Peer index: 0    SNMP index: 15
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r'^Keepalive +Interval: +(?P<keepalive_interval>\d+) +Group +index: +(?P<group_index>\d+) +Peer +index: +(?P<peer_index>\d+) +SNMP +index: +(?P<snmp_index>\d+)$'
         )
         # I/O Session Thread: bgpio-0 State: Enabled
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r'^I\/O +Session +Thread: +(?P<iosession_thread_name>\S+) +State: +(?P<iosession_state>\S+)$'
         )
         # BFD: disabled, down
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r'^BFD: +(?P<bfd_configuration_state>\S+), +(?P<bfd_operational_state>\S+)$'
         )
         # NLRI for restart configured on peer: inet-unicast inet-labeled-unicast
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r'^NLRI +for +restart +configured +on +peer: +(?P<peer_restart_nlri_configured>[\S\s]+)$'
         )
         # NLRI advertised by peer: inet-unicast inet-labeled-unicast
-        p24 = re.compile(
+        p24 = regex_engine.compile(
             r'^NLRI +advertised +by +peer: +(?P<nlri_type_peer>[\s\S]+)$')
         # NLRI for this session: inet-unicast inet-labeled-unicast
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r'^NLRI +for +this +session: +(?P<nlri_type_session>[\s\S]+)$')
         # Peer supports Refresh capability (2)
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r'^Peer +supports +Refresh +capability +\((?P<peer_refresh_capability>\d+)\)$'
         )
         # Stale routes from peer are kept for: 300
-        p27 = re.compile(
+        p27 = regex_engine.compile(
             r'^Stale +routes +from +peer +are +kept +for: +(?P<peer_stale_route_time_configured>\d+)$'
         )
         # Peer does not support Restarter functionality
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r'^Peer +does +not +support +Restarter +functionality$')
         # Restart flag received from the peer: Notification
         # Restart flag received from the peer: Restarting Notification
-        p29 = re.compile(
+        p29 = regex_engine.compile(
             r'^Restart +flag +received +from +the +peer: +(?P<peer_restart_flags_received>[\S\s]+)$'
         )
         # NLRI that restart is negotiated for: inet-unicast inet-labeled-unicast
-        p30 = re.compile(
+        p30 = regex_engine.compile(
             r'^NLRI +that +restart +is +negotiated +for: +(?P<peer_restart_nlri_negotiated>[\S\s]+)$'
         )
         # NLRI of received end-of-rib markers: inet-unicast inet-labeled-unicast
-        p31 = re.compile(
+        p31 = regex_engine.compile(
             r'^NLRI +of +received +end-of-rib +markers: +(?P<peer_end_of_rib_received>[\S\s]+)$'
         )
         # NLRI of all end-of-rib markers sent: inet-unicast inet-labeled-unicast
-        p32 = re.compile(
+        p32 = regex_engine.compile(
             r'^NLRI +of +all +end-of-rib +markers +sent: +(?P<peer_end_of_rib_sent>[\S\s]+)$'
         )
         # Peer does not support LLGR Restarter functionality
-        p33 = re.compile(
+        p33 = regex_engine.compile(
             r'^Peer +does +not +support +LLGR +Restarter +functionality$')
         # Peer supports 4 byte AS extension (peer-as 65151)
-        p34 = re.compile(
+        p34 = regex_engine.compile(
             r'^Peer +supports +4 +byte +AS +extension +\(peer-as +(?P<peer_4byte_as_capability_advertised>\S+)\)$'
         )
         # Peer does not support Addpath
-        p35 = re.compile(r'^Peer +does +not +support +Addpath$')
+        p35 = regex_engine.compile(r'^Peer +does +not +support +Addpath$')
         # NLRI(s) enabled for color nexthop resolution: inet-unicast
-        p36 = re.compile(
+        p36 = regex_engine.compile(
             r'^NLRI\(s\) +enabled +for +color +nexthop +resolution: +(?P<local_ext_nh_color_nlri>\S+)$'
         )
         # Entropy label NLRI: inet-labeled-unicast
-        p37 = re.compile(r'^Entropy +label +NLRI: +(?P<nlri_type>[\S\s]+)$')
+        p37 = regex_engine.compile(r'^Entropy +label +NLRI: +(?P<nlri_type>[\S\s]+)$')
         #     Entropy label: No; next hop validation: Yes
-        p38 = re.compile(
+        p38 = regex_engine.compile(
             r'^Entropy +label: +(?P<entropy_label>\S+); +next +hop +validation: +(?P<entropy_label_no_next_hop_validation>\S+)$'
         )
         #     Local entropy label capability: Yes; stitching capability: Yes
-        p39 = re.compile(
+        p39 = regex_engine.compile(
             r'^Local +entropy +label +capability: +(?P<entropy_label_capability>\S+); +stitching +capability: +(?P<entropy_label_stitching_capability>\S+)$'
         )
         # Table inet.0 Bit: 20000
-        p40 = re.compile(r'Table +(?P<name>\S+) +Bit: +(?P<rib_bit>\S+)')
+        p40 = regex_engine.compile(r'Table +(?P<name>\S+) +Bit: +(?P<rib_bit>\S+)')
         #     RIB State: BGP restart is complete
-        p41 = re.compile(r'^RIB +State: +(?P<bgp_rib_state>[\S\s]+)$')
+        p41 = regex_engine.compile(r'^RIB +State: +(?P<bgp_rib_state>[\S\s]+)$')
         #     Send state: in sync
-        p42 = re.compile(r'^Send +state: +(?P<send_state>[\S\s]+)$')
+        p42 = regex_engine.compile(r'^Send +state: +(?P<send_state>[\S\s]+)$')
         #     Active prefixes:              682
-        p43 = re.compile(r'^Active +prefixes: +(?P<active_prefix_count>\d+)$')
+        p43 = regex_engine.compile(r'^Active +prefixes: +(?P<active_prefix_count>\d+)$')
         #     Received prefixes:            684
-        p44 = re.compile(
+        p44 = regex_engine.compile(
             r'^Received +prefixes: +(?P<received_prefix_count>\d+)$')
         #     Accepted prefixes:            684
-        p45 = re.compile(
+        p45 = regex_engine.compile(
             r'^Accepted +prefixes: +(?P<accepted_prefix_count>\d+)$')
         #     Suppressed due to damping:    0
-        p46 = re.compile(
+        p46 = regex_engine.compile(
             r'^Suppressed +due +to +damping: +(?P<suppressed_prefix_count>\d+)$'
         )
         #     Advertised prefixes:          0
-        p47 = re.compile(
+        p47 = regex_engine.compile(
             r'^Advertised +prefixes: +(?P<advertised_prefix_count>\d+)$')
         # Last traffic (seconds): Received 3    Sent 3    Checked 1999164
-        p48 = re.compile(
+        p48 = regex_engine.compile(
             r'^Last +traffic +\(seconds\): +Received +(?P<last_received>\S+) +Sent +(?P<last_sent>\S+) +Checked +(?P<last_checked>\S+)$'
         )
         # Input messages:  Total 280022 Updates 61419   Refreshes 0     Octets 7137084
-        p49 = re.compile(
+        p49 = regex_engine.compile(
             r'^Input +messages: +Total +(?P<input_messages>\S+) +Updates +(?P<input_updates>\S+) +Refreshes +(?P<input_refreshes>\S+) +Octets +(?P<input_octets>\S+)$'
         )
         # Output messages: Total 221176 Updates 0       Refreshes 0     Octets 4202359
-        p50 = re.compile(
+        p50 = regex_engine.compile(
             r'^Output +messages: +Total +(?P<output_messages>\S+) +Updates +(?P<output_updates>\S+) +Refreshes +(?P<output_refreshes>\S+) +Octets +(?P<output_octets>\S+)$'
         )
         # Output Queue[1]: 0            (inet.0, inet-unicast)
-        p51 = re.compile(
+        p51 = regex_engine.compile(
             r'^Output +Queue\[(?P<number>\d+)\]: +(?P<count>\d+) +\((?P<table_name>\S+), +(?P<rib_adv_nlri>\S+)\)$'
         )
         # BGP is not running
-        p52 = re.compile(r'^BGP +is +not +running+$')
+        p52 = regex_engine.compile(r'^BGP +is +not +running+$')
 
         ret_dict = {}
 
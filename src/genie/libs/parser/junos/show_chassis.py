@@ -24,14 +24,14 @@ Parser for the following show commands:
     * show chassis power
     * show chassis pic fpc-slot {fpc-slot} pic-slot {pic-slot}
 '''
-# python
-import re
-
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, Or, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowChassisFpcDetailSchema(MetaParser):
 
     schema = {
@@ -78,34 +78,34 @@ class ShowChassisFpcDetail(ShowChassisFpcDetailSchema):
             out = output
 
         #Slot 0 information:
-        p1 = re.compile(r'^Slot +(?P<slot>\d+) +information:$')
+        p1 = regex_engine.compile(r'^Slot +(?P<slot>\d+) +information:$')
 
         #State                               Online
-        p2 = re.compile(r'^State +(?P<state>\S+)$')
+        p2 = regex_engine.compile(r'^State +(?P<state>\S+)$')
 
         #Temperature                      Testing
-        p3 = re.compile(r'^Temperature +(?P<temperature>\S+)$')
+        p3 = regex_engine.compile(r'^Temperature +(?P<temperature>\S+)$')
 
         #Total CPU DRAM                  511 MB
-        p4 = re.compile(r'^Total CPU DRAM +(?P<memory_dram_size>\d+)\sMB$')
+        p4 = regex_engine.compile(r'^Total CPU DRAM +(?P<memory_dram_size>\d+)\sMB$')
 
         #Total RLDRAM                     10 MB
-        p5 = re.compile(r'^Total RLDRAM +(?P<memory_rldram_size>\d+)\sMB$')
+        p5 = regex_engine.compile(r'^Total RLDRAM +(?P<memory_rldram_size>\d+)\sMB$')
 
         #Total DDR DRAM                    0 MB
-        p6 = re.compile(r'^Total DDR DRAM +(?P<memory_ddr_dram_size>\d+)\sMB$')
+        p6 = regex_engine.compile(r'^Total DDR DRAM +(?P<memory_ddr_dram_size>\d+)\sMB$')
 
         #FIPS Capable                        False
-        p7 = re.compile(r'^FIPS Capable +(?P<fips_capable>\S+)$')
+        p7 = regex_engine.compile(r'^FIPS Capable +(?P<fips_capable>\S+)$')
 
         #FIPS Mode                           False
-        p8 = re.compile(r'^FIPS Mode +(?P<fips_mode>\S+)$')
+        p8 = regex_engine.compile(r'^FIPS Mode +(?P<fips_mode>\S+)$')
 
         #Start time                          2019-08-29 09:09:16 UTC
-        p9 = re.compile(r'^Start time +(?P<start_time>[\d\-\:A-Za-z ]+)$')
+        p9 = regex_engine.compile(r'^Start time +(?P<start_time>[\d\-\:A-Za-z ]+)$')
 
         #Uptime                              208 days, 22 hours, 50 minutes, 26 seconds
-        p10 = re.compile(r'^Uptime +(?P<up_time>[\d\-\,A-Za-z ]+)$')
+        p10 = regex_engine.compile(r'^Uptime +(?P<up_time>[\d\-\,A-Za-z ]+)$')
 
         ret_dict = {}
 
@@ -221,10 +221,10 @@ class ShowChassisEnvironmentRoutingEngine(ShowChassisEnvironmentRoutingEngineSch
             out = output
 
         #Routing Engine 0 status:
-        p1 = re.compile(r'^(?P<name>[\S\s]+) +status:$')
+        p1 = regex_engine.compile(r'^(?P<name>[\S\s]+) +status:$')
 
         #State                      Online Master
-        p2 = re.compile(r'^State +(?P<name>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^State +(?P<name>[\S\s]+)$')
 
 
         ret_dict = {}
@@ -303,13 +303,13 @@ class ShowChassisFirmware(ShowChassisFirmwareSchema):
             out = output
 
         #Part                     Type       Version
-        p0 = re.compile(r'^Part +Type +Version$')
+        p0 = regex_engine.compile(r'^Part +Type +Version$')
 
         #FPC 0                    ROM        PC Bios
-        p1 = re.compile(r'^(?P<name>\S+\s+\d+) +(?P<type>\S+) +(?P<firmware>\S+\s+\S+)$')
+        p1 = regex_engine.compile(r'^(?P<name>\S+\s+\d+) +(?P<type>\S+) +(?P<firmware>\S+\s+\S+)$')
 
         #O/S        Version 19.2R1.8 by builder on 2019-06-21 17:52:23 UTC
-        p2 = re.compile(r'^(?P<type>\S+) +(?P<firmware>[\s\S]+)$')
+        p2 = regex_engine.compile(r'^(?P<type>\S+) +(?P<firmware>[\s\S]+)$')
 
 
         ret_dict = {}
@@ -483,20 +483,20 @@ class ShowChassisHardware(ShowChassisHardwareSchema):
             out = output
 
         #Hardware inventory:
-        p1 = re.compile(r'^Hardware +(?P<style>\S+):$')
+        p1 = regex_engine.compile(r'^Hardware +(?P<style>\S+):$')
 
         # Chassis                                VM5D4C6B3599      VMX
-        p_chassis = re.compile(r'^(?P<name>Chassis) +(?P<serial_number>[A-Z\d]+)'
-                               r' +(?P<description>\S+)$')
+        p_chassis = regex_engine.compile(r'^(?P<name>Chassis) +(?P<serial_number>[A-Z\d]+)'
+                                         r' +(?P<description>\S+)$')
 
         # -------------------------------------------------------------------------------------
         # For general chassis modules, for example:
         # -------------------------------------------------------------------------------------
         # Midplane         REV 64   750-040240   ABAC9716          Lower Backplane
         # Midplane 1       REV 06   711-032386   ABAC9742          Upper Backplane
-        p_module0 = re.compile(r'(?P<name>Midplane( \d+)?) +(?P<version>\w+ \d+)'
-                               r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+) '
-                               r'+(?P<description>[\s\S]+)$')        
+        p_module0 = regex_engine.compile(r'(?P<name>Midplane( \d+)?) +(?P<version>\w+ \d+)'
+                                         r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+) '
+                                         r'+(?P<description>[\s\S]+)$')        
 
         # Routing Engine 0 REV 01   740-052100   9009237267        RE-S-1800x4
         # CB 0             REV 10   750-051985   CAFC0322          Control Board
@@ -509,12 +509,12 @@ class ShowChassisHardware(ShowChassisHardwareSchema):
         # PDM 3            REV 01   740-050036   1EFD3390136       DC Power Dist Module
         # PSM 11           REV 04   740-050037   1EDB527002P       DC 52V Power Supply Module
         # PMP 1            REV 01   711-051408   ACAJ5284          Upper Power Midplane
-        p_module1 = re.compile(r'^(?P<name>(Routing Engine|CB|FPC|SPMB|SFB|ADC|Fan Tray|FPM|PDM|PSM|PMP) (\d+|Board))( +(?P<version>\w+ \d+)'
-                               r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+))? '
-                               r'+(?P<description>[\s\S]+)$')
+        p_module1 = regex_engine.compile(r'^(?P<name>(Routing Engine|CB|FPC|SPMB|SFB|ADC|Fan Tray|FPM|PDM|PSM|PMP) (\d+|Board))( +(?P<version>\w+ \d+)'
+                                         r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+))? '
+                                         r'+(?P<description>[\s\S]+)$')
 
         # Midplane   
-        p_module2 = re.compile(r'^(?P<name>\S+)$')
+        p_module2 = regex_engine.compile(r'^(?P<name>\S+)$')
 
         # -------------------------------------------------------------------------------------
         # For chassis-sub-module, for example:
@@ -522,32 +522,32 @@ class ShowChassisHardware(ShowChassisHardwareSchema):
         # CPU            REV 12   711-045719   ABDF7304          RMPC PMB
         # MIC 0          REV 19   750-049457   ABDJ2346          2X100GE CFP2 OTN 
         # XLM 0          REV 14   711-046638   ABDF2862          MPC6E XL
-        p_sub_module = re.compile(r'^(?P<name>CPU|(MIC|XLM)\s\d+) +(?P<version>\w+ \d+)'
-                                  r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+) '
-                                  r'+(?P<description>[\s\S]+)$')
+        p_sub_module = regex_engine.compile(r'^(?P<name>CPU|(MIC|XLM)\s\d+) +(?P<version>\w+ \d+)'
+                                            r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+) '
+                                            r'+(?P<description>[\s\S]+)$')
 
         # CPU            Rev. 1.0 RIOT-LITE    BUILTIN     
-        p_sub_module_2 = re.compile(r'(?P<name>CPU) +(?P<version>[\s\S]+) +(?P<part_number>[A-Z\-]+)'
-                                    r' +(?P<serial_number>[A-Z]+)')
+        p_sub_module_2 = regex_engine.compile(r'(?P<name>CPU) +(?P<version>[\s\S]+) +(?P<part_number>[A-Z\-]+)'
+                                              r' +(?P<serial_number>[A-Z]+)')
 
         # MIC 0                                                  Virtual     
-        p_sub_module_3 = re.compile(r'(?P<name>MIC\s\d+) +(?P<description>\S+)')
+        p_sub_module_3 = regex_engine.compile(r'(?P<name>MIC\s\d+) +(?P<description>\S+)')
 
         # -------------------------------------------------------------------------------------
         # For chassis-sub-sub-module, for example:
         # -------------------------------------------------------------------------------------
         # PIC 0                 BUILTIN      BUILTIN           2X100GE CFP2 OTN
-        p_sub_sub_module = re.compile(r'^(?P<name>PIC\s\d+) +(?P<part_number>[A-Z]+) '
-                                      r'+(?P<serial_number>[A-Z]+) +(?P<description>[\s\S]+)$')
+        p_sub_sub_module = regex_engine.compile(r'^(?P<name>PIC\s\d+) +(?P<part_number>[A-Z]+) '
+                                                r'+(?P<serial_number>[A-Z]+) +(?P<description>[\s\S]+)$')
 
 
         # -------------------------------------------------------------------------------------
         # For chassis-sub-sub-sub-module, for example:
         # -------------------------------------------------------------------------------------
         # Xcvr 0     REV 01   740-052504   UW811XC           CFP2-100G-LR4
-        p_sub_sub_sub_module = re.compile(r'^(?P<name>Xcvr\s\d+)( +(?P<version>(\w+ \d+)|(\S+)))?'
-                                          r' +(?P<part_number>[\d\-]+|NON-JNPR) +(?P<serial_number>[A-Z\d]+)'
-                                          r' +(?P<description>[\s\S]+)$')                                      
+        p_sub_sub_sub_module = regex_engine.compile(r'^(?P<name>Xcvr\s\d+)( +(?P<version>(\w+ \d+)|(\S+)))?'
+                                                    r' +(?P<part_number>[\d\-]+|NON-JNPR) +(?P<serial_number>[A-Z\d]+)'
+                                                    r' +(?P<description>[\s\S]+)$')                                      
 
         res = {}
 
@@ -836,20 +836,20 @@ class ShowChassisHardwareDetail(ShowChassisHardwareDetailSchema):
             out = output
 
         # Hardware inventory:
-        p1 = re.compile(r'^Hardware +(?P<style>\S+):$')
+        p1 = regex_engine.compile(r'^Hardware +(?P<style>\S+):$')
 
         # Chassis                                VM5D4C6B3599      VMX
-        p_chassis = re.compile(r'^(?P<name>Chassis) +(?P<serial_number>[A-Z\d]+)'
-                               r' +(?P<description>\S+)$')
+        p_chassis = regex_engine.compile(r'^(?P<name>Chassis) +(?P<serial_number>[A-Z\d]+)'
+                                         r' +(?P<description>\S+)$')
 
         # -------------------------------------------------------------------------------------
         # For general chassis modules, for example:
         # -------------------------------------------------------------------------------------
         # Midplane         REV 64   750-040240   ABAC9716          Lower Backplane
         # Midplane 1       REV 06   711-032386   ABAC9742          Upper Backplane
-        p_module0 = re.compile(r'(?P<name>Midplane( \d+)?) +(?P<version>\w+ \d+)'
-                               r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+) '
-                               r'+(?P<description>[\s\S]+)$')
+        p_module0 = regex_engine.compile(r'(?P<name>Midplane( \d+)?) +(?P<version>\w+ \d+)'
+                                         r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+) '
+                                         r'+(?P<description>[\s\S]+)$')
         
         # Routing Engine 0 REV 01   740-052100   9009237267        RE-S-1800x4
         # Routing Engine 0                                         RE-VMX
@@ -861,12 +861,12 @@ class ShowChassisHardwareDetail(ShowChassisHardwareDetailSchema):
         # Fan Tray 0       REV 01   760-052467   ACAY4748          172mm FanTray - 6 Fans
         # FPM Board        REV 13   760-040242   ABDD0194          Front Panel Display
         # PDM 3            REV 01   740-050036   1EFD3390136       DC Power Dist Module
-        p_module1 = re.compile(r'^(?P<name>(Routing Engine|CB|FPC|SPMB|SFB|ADC|Fan Tray|FPM|PDM|PSM|PMP) (\d+|Board))( +(?P<version>\w+ \d+)'
-                               r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+))? '
-                               r'+(?P<description>[\s\S]+)$')
+        p_module1 = regex_engine.compile(r'^(?P<name>(Routing Engine|CB|FPC|SPMB|SFB|ADC|Fan Tray|FPM|PDM|PSM|PMP) (\d+|Board))( +(?P<version>\w+ \d+)'
+                                         r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+))? '
+                                         r'+(?P<description>[\s\S]+)$')
 
         # Midplane
-        p_module2 = re.compile(r'^(?P<name>Midplane)$')
+        p_module2 = regex_engine.compile(r'^(?P<name>Midplane)$')
         
 
         # -------------------------------------------------------------------------------------
@@ -874,8 +874,8 @@ class ShowChassisHardwareDetail(ShowChassisHardwareDetailSchema):
         # -------------------------------------------------------------------------------------
         # ad0    3919 MB  604784               000060095234B000018D Compact Flash
         # ad1   28496 MB  StorFly - VSFA18PI032G- P1T12003591504100303 Disk 1
-        p_re_disk = re.compile(r'^(?P<name>\w+) +(?P<disk_size>\d+) +MB +(?P<model>[\s\S]+) '
-                               r'+(?P<serial_number>[A-Z\d]{20}) +(?P<description>[\s\S]+)$')
+        p_re_disk = regex_engine.compile(r'^(?P<name>\w+) +(?P<disk_size>\d+) +MB +(?P<model>[\s\S]+) '
+                                         r'+(?P<serial_number>[A-Z\d]{20}) +(?P<description>[\s\S]+)$')
 
 
         # -------------------------------------------------------------------------------------
@@ -883,18 +883,18 @@ class ShowChassisHardwareDetail(ShowChassisHardwareDetailSchema):
         # -------------------------------------------------------------------------------------
         # usb0 (addr 1)  EHCI root hub 0       Intel             uhub0
         # usb0 (addr 2)  product 0x0020 32     vendor 0x8087     uhub1
-        p_re_usb = re.compile(r'^(?P<name>usb\d +\(addr +\d\)) +(?P<product>[\s\S]+) '
-                              r'+(?P<product_number>\d+) +(?P<vendor>[\s\S]+) '
-                              r'+(?P<description>[a-z0-9]+)$')
+        p_re_usb = regex_engine.compile(r'^(?P<name>usb\d +\(addr +\d\)) +(?P<product>[\s\S]+) '
+                                        r'+(?P<product_number>\d+) +(?P<vendor>[\s\S]+) '
+                                        r'+(?P<description>[a-z0-9]+)$')
 
 
         # -------------------------------------------------------------------------------------
         # For chassis-re-dimm-module, for example:
         # -------------------------------------------------------------------------------------
         # DIMM 0         VL33B1G63F-K9SQ-KC DIE REV-0 PCB REV-0  MFR ID-ce80
-        p_re_dimm = re.compile(r'^(?P<name>[A-Z\s\d]+) +(?P<part_number>[A-Z\d\-]+) '
-                               r'+(?P<die_rev>DIE REV-\d+) +(?P<pcb_rev>PCB REV-\d+) '
-                               r'+(?P<mfr_id>MFR ID\-\w+)$')
+        p_re_dimm = regex_engine.compile(r'^(?P<name>[A-Z\s\d]+) +(?P<part_number>[A-Z\d\-]+) '
+                                         r'+(?P<die_rev>DIE REV-\d+) +(?P<pcb_rev>PCB REV-\d+) '
+                                         r'+(?P<mfr_id>MFR ID\-\w+)$')
 
 
         # -------------------------------------------------------------------------------------
@@ -903,24 +903,24 @@ class ShowChassisHardwareDetail(ShowChassisHardwareDetailSchema):
         # CPU            REV 12   711-045719   ABDF7304          RMPC PMB
         # MIC 0          REV 19   750-049457   ABDJ2346          2X100GE CFP2 OTN 
         # XLM 0          REV 14   711-046638   ABDF2862          MPC6E XL
-        p_sub_module = re.compile(r'^(?P<name>CPU|(MIC|XLM)\s\d+) +(?P<version>\w+ \d+)'
-                                  r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+) '
-                                  r'+(?P<description>[\s\S]+)$')
+        p_sub_module = regex_engine.compile(r'^(?P<name>CPU|(MIC|XLM)\s\d+) +(?P<version>\w+ \d+)'
+                                            r' +(?P<part_number>[\d\-]+) +(?P<serial_number>[A-Z\d]+) '
+                                            r'+(?P<description>[\s\S]+)$')
 
         # CPU            Rev. 1.0 RIOT-LITE    BUILTIN     
-        p_sub_module_2 = re.compile(r'(?P<name>CPU) +(?P<version>[\s\S]+) +(?P<part_number>[A-Z\-]+)'
-                                    r' +(?P<serial_number>[A-Z]+)')
+        p_sub_module_2 = regex_engine.compile(r'(?P<name>CPU) +(?P<version>[\s\S]+) +(?P<part_number>[A-Z\-]+)'
+                                              r' +(?P<serial_number>[A-Z]+)')
 
         # MIC 0                                                  Virtual     
-        p_sub_module_3 = re.compile(r'(?P<name>MIC\s\d+) +(?P<description>\S+)')
+        p_sub_module_3 = regex_engine.compile(r'(?P<name>MIC\s\d+) +(?P<description>\S+)')
 
 
         # -------------------------------------------------------------------------------------
         # For chassis-sub-sub-module, for example:
         # -------------------------------------------------------------------------------------
         # PIC 0                 BUILTIN      BUILTIN           2X100GE CFP2 OTN
-        p_sub_sub_module = re.compile(r'^(?P<name>PIC\s\d+) +(?P<part_number>[A-Z]+) '
-                                      r'+(?P<serial_number>[A-Z]+) +(?P<description>[\s\S]+)$')
+        p_sub_sub_module = regex_engine.compile(r'^(?P<name>PIC\s\d+) +(?P<part_number>[A-Z]+) '
+                                                r'+(?P<serial_number>[A-Z]+) +(?P<description>[\s\S]+)$')
 
 
         # -------------------------------------------------------------------------------------
@@ -930,9 +930,9 @@ class ShowChassisHardwareDetail(ShowChassisHardwareDetailSchema):
         # Xcvr 5              NON-JNPR     AGM1049Q4E4       SFP-T
         # Xcvr 8     l*       NON-JNPR     AGM17082139       SFP-T
         # Xcvr 9     }        NON-JNPR     AGM1708212S       SFP-T
-        p_sub_sub_sub_module = re.compile(r'^(?P<name>Xcvr\s\d+)( +(?P<version>(\w+ \d+)|(\S+)))?'
-                                          r' +(?P<part_number>[\d\-]+|NON-JNPR) +(?P<serial_number>[A-Z\d]+)'
-                                          r' +(?P<description>[\s\S]+)$')                                      
+        p_sub_sub_sub_module = regex_engine.compile(r'^(?P<name>Xcvr\s\d+)( +(?P<version>(\w+ \d+)|(\S+)))?'
+                                                    r' +(?P<part_number>[\d\-]+|NON-JNPR) +(?P<serial_number>[A-Z\d]+)'
+                                                    r' +(?P<description>[\s\S]+)$')                                      
 
         res = {}
 
@@ -1308,93 +1308,93 @@ class ShowChassisHardwareExtensive(ShowChassisHardwareExtensiveSchema):
             out = output
 
         #Hardware inventory:
-        p1 = re.compile(r'^Hardware +(?P<style>\S+):$')
+        p1 = regex_engine.compile(r'^Hardware +(?P<style>\S+):$')
 
         #Jedec Code:   0x7fb0            EEPROM Version:    0x02
-        p2 = re.compile(r'^Jedec Code: +(?P<jedec_code>\S+) '
-                        r'+EEPROM Version: +(?P<eeprom_version>\S+)$')
+        p2 = regex_engine.compile(r'^Jedec Code: +(?P<jedec_code>\S+) '
+                                  r'+EEPROM Version: +(?P<eeprom_version>\S+)$')
 
         
         #S/N:               VM5D4C6B3599
-        p3 = re.compile(r'^S/N: +(?P<serial_number>\S+)$')
+        p3 = regex_engine.compile(r'^S/N: +(?P<serial_number>\S+)$')
 
         
 
         #Assembly ID:  0x0567            Assembly Version:  00.00
-        p4 = re.compile(r'^Assembly ID: +(?P<assembly_identifier>\S+) '
-                        r'+Assembly Version: +(?P<assembly_version>\S+)$')
+        p4 = regex_engine.compile(r'^Assembly ID: +(?P<assembly_identifier>\S+) '
+                                  r'+Assembly Version: +(?P<assembly_version>\S+)$')
 
         
 
         
 
         #Date:         00-00-0000        Assembly Flags:    0x00
-        p5 = re.compile(r'^Date: +(?P<manufacture_date>\S+) +Assembly Flags: '
-                        r'+(?P<assembly_flags>\S+)$')
+        p5 = regex_engine.compile(r'^Date: +(?P<manufacture_date>\S+) +Assembly Flags: '
+                                  r'+(?P<assembly_flags>\S+)$')
 
         
 
         #ID: VMX
-        p6 = re.compile(r'^ID: +(?P<i2c_identifier>[\S\s]+)$')
+        p6 = regex_engine.compile(r'^ID: +(?P<i2c_identifier>[\S\s]+)$')
 
         
 
         #Board Information Record:
-        p7 = re.compile(r'^(?P<address_type>\ABoard Information Record):$')
+        p7 = regex_engine.compile(r'^(?P<address_type>\ABoard Information Record):$')
 
         
 
         #I2C Hex Data:
-        p8 = re.compile(r'^(?P<address_type>\AI2C Hex Data:)$')
+        p8 = regex_engine.compile(r'^(?P<address_type>\AI2C Hex Data:)$')
 
         
 
         #Address 0x00: 7f b0 02 00 fa 4e 01 00 52 65 76 2e 20 31 2e 30
-        p9 = re.compile(r'^(?P<address_info>\AAddress[\s\S]+)$')
+        p9 = regex_engine.compile(r'^(?P<address_info>\AAddress[\s\S]+)$')
 
 
 
         #FPC 0                                                    Virtual FPC
         #CB 0                                                     VMX SCB
-        p10 = re.compile(r'^(?P<name>(\S+\s\d+)) +(?P<description>\S+\s\S+)$')
+        p10 = regex_engine.compile(r'^(?P<name>(\S+\s\d+)) +(?P<description>\S+\s\S+)$')
 
 
 
 
         #Routing Engine 0                                         RE-VMX
-        p11 = re.compile(r'^(?P<name>\S+\s+\S+\s+\d+) +(?P<description>\S+)$')
+        p11 = regex_engine.compile(r'^(?P<name>\S+\s+\S+\s+\d+) +(?P<description>\S+)$')
 
 
 
         #cd0   27649 MB  VMware Virtual IDE Har 00000000000000000001 Hard Disk
-        p12 = re.compile(r'^(?P<name>\S+) +(?P<disk_size>\d+) '
-                         r'+MB +(?P<model>\S+\s+\S+\s+\S+\s+\S+) '
-                         r'+(?P<serial_number>\d+) +(?P<description>'
-                         r'\S+\s+\S+)$')
+        p12 = regex_engine.compile(r'^(?P<name>\S+) +(?P<disk_size>\d+) '
+                                   r'+MB +(?P<model>\S+\s+\S+\s+\S+\s+\S+) '
+                                   r'+(?P<serial_number>\d+) +(?P<description>'
+                                   r'\S+\s+\S+)$')
 
         #CPU            Rev. 1.0 RIOT-LITE    BUILTIN
-        p13 = re.compile(r'^(?P<name>\S+) +(?P<version>[\S\.\d]+ '
-                         r'[\S\.\d]+) +(?P<part_number>[\S\-]+) +'
-                         r'(?P<serial_number>\S+)$')
+        p13 = regex_engine.compile(r'^(?P<name>\S+) +(?P<version>[\S\.\d]+ '
+                                   r'[\S\.\d]+) +(?P<part_number>[\S\-]+) +'
+                                   r'(?P<serial_number>\S+)$')
 
         #MIC 0                                                  Virtual
-        p14 = re.compile(r'^(?P<name>\S+ \d+) +(?P<description>\S+)$')
+        p14 = regex_engine.compile(r'^(?P<name>\S+ \d+) +(?P<description>\S+)$')
 
         #PIC 0                 BUILTIN      BUILTIN           Virtual
-        p15 = re.compile(r'^(?P<name>\S+ \d+) +(?P<part_number>\S+) '
-                         r'+(?P<serial_number>\S+) +(?P<description>\S+)$')
+        p15 = regex_engine.compile(r'^(?P<name>\S+ \d+) +(?P<part_number>\S+) '
+                                   r'+(?P<serial_number>\S+) +(?P<description>\S+)$')
 
         
         #Version:      Rev. 1.0
-        p111 = re.compile(r'^Version: +(?P<version>[\S\s]+)$')
+        p111 = regex_engine.compile(r'^Version: +(?P<version>[\S\s]+)$')
 
         
         #Chassis                                VM5D4C6B3599      VMX
-        p16 = re.compile(r'^(?P<name>\S+) +(?P<serial_number>\S+) +'
-                         r'(?P<description>\S+)$')
+        p16 = regex_engine.compile(r'^(?P<name>\S+) +(?P<serial_number>\S+) +'
+                                   r'(?P<description>\S+)$')
 
         #Midplane
-        p17 = re.compile(r'^(?P<name>\S+)$')
+        p17 = regex_engine.compile(r'^(?P<name>\S+)$')
 
         ret_dict = {}
 
@@ -1768,17 +1768,17 @@ class ShowChassisFpc(ShowChassisFpcSchema):
 
         # 0  Online           Testing   3         0        2      2      2    511        31          0
         # 0  Present          Testing
-        p1 = re.compile(r'^(?P<slot>\d+) +(?P<state>\S+) '
-                        r'+(?P<text>\S+)( +(?P<cpu_total>\d+) '
-                        r'+(?P<cpu_interrupt>\d+)( +(?P<cpu_1min>\d+) '
-                        r'+(?P<cpu_5min>\d+) +(?P<cpu_15min>\d+))? +'
-                        r'(?P<dram>\d+) +(?P<heap>\d+) +(?P<buffer>\d+))?$')
+        p1 = regex_engine.compile(r'^(?P<slot>\d+) +(?P<state>\S+) '
+                                  r'+(?P<text>\S+)( +(?P<cpu_total>\d+) '
+                                  r'+(?P<cpu_interrupt>\d+)( +(?P<cpu_1min>\d+) '
+                                  r'+(?P<cpu_5min>\d+) +(?P<cpu_15min>\d+))? +'
+                                  r'(?P<dram>\d+) +(?P<heap>\d+) +(?P<buffer>\d+))?$')
 
         #2  Empty
-        p2 = re.compile(r'^(?P<slot>\d+) +(?P<state>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<slot>\d+) +(?P<state>\S+)$')
         
         # 0  Offline         ---Offlined by cli command---
-        p3 = re.compile(r'^(?P<slot>\d+)\s+(?P<state>\S+)\s+---(?P<comment>Offlined\s+by\s+cli\s+command)---$')
+        p3 = regex_engine.compile(r'^(?P<slot>\d+)\s+(?P<state>\S+)\s+---(?P<comment>Offlined\s+by\s+cli\s+command)---$')
 
         ret_dict = {}
 
@@ -1983,66 +1983,66 @@ class ShowChassisRoutingEngine(ShowChassisRoutingEngineSchema):
             out = output
             
         #Slot 0:
-        p1 = re.compile(r'^Slot +(?P<slot>\d+):$')
+        p1 = regex_engine.compile(r'^Slot +(?P<slot>\d+):$')
 
         #Current state                  Master
-        p2 = re.compile(r'^Current state +(?P<mastership_state>\S+)$')
+        p2 = regex_engine.compile(r'^Current state +(?P<mastership_state>\S+)$')
 
         #Election priority              Master (default)
-        p3 = re.compile(r'^Election priority +(?P<mastership_priority>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Election priority +(?P<mastership_priority>[\S\s]+)$')
 
         #DRAM                      2002 MB (2048 MB installed)
-        p4 = re.compile(r'^DRAM +(?P<memory_dram_size>\S+\s\S+) +(?P<memory_installed_size>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^DRAM +(?P<memory_dram_size>\S+\s\S+) +(?P<memory_installed_size>[\S\s]+)$')
 
         #Memory utilization          19 percent
-        p5 = re.compile(r'^Memory utilization +(?P<memory_buffer_utilization>\d+) +percent$')
+        p5 = regex_engine.compile(r'^Memory utilization +(?P<memory_buffer_utilization>\d+) +percent$')
 
         #5 sec CPU utilization:
-        p6 = re.compile(r'^(?P<state>\d+\s+\S+) +CPU utilization:$')
+        p6 = regex_engine.compile(r'^(?P<state>\d+\s+\S+) +CPU utilization:$')
 
         #User                       1 percent
-        p7 = re.compile(r'^User +(?P<user>\d+) +percent$')
+        p7 = regex_engine.compile(r'^User +(?P<user>\d+) +percent$')
 
         #Background                 0 percent
-        p8 = re.compile(r'^Background +(?P<background>\d+) +percent$')
+        p8 = regex_engine.compile(r'^Background +(?P<background>\d+) +percent$')
 
         #Kernel                     1 percent
-        p9 = re.compile(r'^Kernel +(?P<system>\d+) +percent$')
+        p9 = regex_engine.compile(r'^Kernel +(?P<system>\d+) +percent$')
 
         #Temperature                 42 degrees C / 107 degrees F
-        p9_1 = re.compile(r'^Temperature +(?P<cpu_temperature>[\S\s]+)$')
+        p9_1 = regex_engine.compile(r'^Temperature +(?P<cpu_temperature>[\S\s]+)$')
 
         #Interrupt                  0 percent
-        p10 = re.compile(r'^Interrupt +(?P<interrupt>\d+) +percent$')
+        p10 = regex_engine.compile(r'^Interrupt +(?P<interrupt>\d+) +percent$')
 
         #Idle                      98 percent
-        p11 = re.compile(r'^Idle +(?P<idle>\d+) +percent$')
+        p11 = regex_engine.compile(r'^Idle +(?P<idle>\d+) +percent$')
 
         #Model                          RE-VMX
-        p12 = re.compile(r'^Model +(?P<system>\S+)$')
+        p12 = regex_engine.compile(r'^Model +(?P<system>\S+)$')
 
         #Serial ID                      9009237474
-        p12_1 = re.compile(r'^Serial +ID +(?P<serial_number>\d+)$')
+        p12_1 = regex_engine.compile(r'^Serial +ID +(?P<serial_number>\d+)$')
 
         #Start time                     2019-08-29 09:02:22 UTC
-        p13 = re.compile(r'^Start time +(?P<start_time>[\S\s]+)$')
+        p13 = regex_engine.compile(r'^Start time +(?P<start_time>[\S\s]+)$')
 
         #CPU temperature             38 degrees C / 100 degrees F
-        p13_1 = re.compile(r'^CPU +[tT]emperature +(?P<cpu_temperature>[\S\s]+)$')
+        p13_1 = regex_engine.compile(r'^CPU +[tT]emperature +(?P<cpu_temperature>[\S\s]+)$')
 
         #Uptime                         208 days, 23 hours, 14 minutes, 9 seconds
-        p14 = re.compile(r'^Uptime +(?P<uptime>[\S\s]+)$')
+        p14 = regex_engine.compile(r'^Uptime +(?P<uptime>[\S\s]+)$')
 
         #Last reboot reason             Router rebooted after a normal shutdown.
-        p15 = re.compile(r'^Last reboot reason +(?P<last_reboot_reason>[\S\s]+)$')
+        p15 = regex_engine.compile(r'^Last reboot reason +(?P<last_reboot_reason>[\S\s]+)$')
 
         #0.72       0.46       0.40
-        p16 = re.compile(r'^(?P<load_average_one>[\d\.]+) '
-                         r'+(?P<load_average_five>[\d\.]+) '
-                         r'+(?P<load_average_fifteen>[\d\.]+)$')
+        p16 = regex_engine.compile(r'^(?P<load_average_one>[\d\.]+) '
+                                   r'+(?P<load_average_five>[\d\.]+) '
+                                   r'+(?P<load_average_fifteen>[\d\.]+)$')
 
         #{master}
-        p17 = re.compile(r'^(?P<re_state>[\{\S\s]+\})$')
+        p17 = regex_engine.compile(r'^(?P<re_state>[\{\S\s]+\})$')
 
         ret_dict = {}
 
@@ -2267,11 +2267,11 @@ class ShowChassisEnvironment(ShowChassisEnvironmentSchema):
         #         PSM 4                          Check        
         #         Fan Tray 2 Fan 2               OK         2640 RPM  
         #   FPC 0 Intake                   Testing
-        p1 = re.compile(r'^((?P<class>Temp|Fans) +)?(?P<name>[\s\S]+) '
-                        r'+(?P<status>OK|Check|Testing)( +(?P<measurement>[\s\S]+))?$')
+        p1 = regex_engine.compile(r'^((?P<class>Temp|Fans) +)?(?P<name>[\s\S]+) '
+                                  r'+(?P<status>OK|Check|Testing)( +(?P<measurement>[\s\S]+))?$')
 
         # 24 degrees C / 75 degrees F
-        celsius_pattern = re.compile(r'(?P<celsius>\d+) degrees C / (?P<fahr>\d+) degrees F')
+        celsius_pattern = regex_engine.compile(r'(?P<celsius>\d+) degrees C / (?P<fahr>\d+) degrees F')
         
         res = {}
         environment_item_list = []
@@ -2406,27 +2406,27 @@ class ShowChassisEnvironmentFpc(ShowChassisEnvironmentFpcSchema):
 
         # Regex
         # FPC 0 status:
-        p1 = re.compile(r'^(?P<name>.*) +status:$')
+        p1 = regex_engine.compile(r'^(?P<name>.*) +status:$')
 
         # State                      Online
-        p2 = re.compile(r'^State+\s+(?P<state>\S+)$')
+        p2 = regex_engine.compile(r'^State+\s+(?P<state>\S+)$')
 
         # Temperature Intake         27 degrees C / 80 degrees F
         # Temperature I3 0 Chip      38 degrees C / 100 degrees F 
-        p_temp = re.compile(r'^(?P<temperature_name>[\s\S]+) '
-                            r'+(?P<text>(?P<celsius>\d+)\sdegrees\sC) +.*')
+        p_temp = regex_engine.compile(r'^(?P<temperature_name>[\s\S]+) '
+                                      r'+(?P<text>(?P<celsius>\d+)\sdegrees\sC) +.*')
 
         # Power
         # Power Disabled
-        p_power = re.compile(r'^Power(\s+Disabled)?$')
+        p_power = regex_engine.compile(r'^Power(\s+Disabled)?$')
 
         # 1.2 V PFE 0               1231 mV
         # 1.5 V                     1498 mV
-        p_voltage = re.compile(r'(?P<reference_voltage>[\s\S]+) '
-                               r'+(?P<actual_voltage>\d+) +mV')
+        p_voltage = regex_engine.compile(r'(?P<reference_voltage>[\s\S]+) '
+                                         r'+(?P<actual_voltage>\d+) +mV')
 
         # I2C Slave Revision         42
-        p_slave_revision = re.compile(r'^.* +Slave +Revision +(?P<slave_revision>\S+)$')
+        p_slave_revision = regex_engine.compile(r'^.* +Slave +Revision +(?P<slave_revision>\S+)$')
 
 
         # Read line from output and build parsed output
@@ -2570,15 +2570,15 @@ class ShowChassisAlarms(ShowChassisAlarmsSchema):
             out = output
 
         # 1 alarms currently active
-        p1 = re.compile(r'^(?P<active_alarms>\d+) +alarms +currently +active$')
+        p1 = regex_engine.compile(r'^(?P<active_alarms>\d+) +alarms +currently +active$')
 
         # Alarm time               Class  Description
         # 2020-07-16 13:38:21 EST  Major  PSM 15 Not OK 
-        p2 = re.compile(r'^(?P<text>\S+ +\d\d\:\d\d\:\d\d +\S+) '
-                        r'+(?P<alarm_class>\S+) +(?P<description>[\s\S]+)$')
+        p2 = regex_engine.compile(r'^(?P<text>\S+ +\d\d\:\d\d\:\d\d +\S+) '
+                                  r'+(?P<alarm_class>\S+) +(?P<description>[\s\S]+)$')
 
         # No alarms currently active
-        p3 = re.compile(r'^No alarms currently active$')
+        p3 = regex_engine.compile(r'^No alarms currently active$')
 
         res = {}
 
@@ -2691,7 +2691,7 @@ class ShowChassisFabricSummary(ShowChassisFabricSummarySchema):
 
         # 0      Online   34 days, 18 hours, 43 minutes, 48 seconds
         # 0      Online   
-        p1 = re.compile(r'^(?P<plane_slot>\d+) +(?P<state>\S+)( +(?P<up_time>[\S\s]+))?$')
+        p1 = regex_engine.compile(r'^(?P<plane_slot>\d+) +(?P<state>\S+)( +(?P<up_time>[\S\s]+))?$')
 
 
         ret_dict = {}
@@ -2763,16 +2763,16 @@ class ShowChassisFabricPlane(ShowChassisFabricPlaneSchema):
             out = output
 
         # Plane 0
-        p1 = re.compile(r'^Plane +(?P<slot>\d+)$')
+        p1 = regex_engine.compile(r'^Plane +(?P<slot>\d+)$')
 
         # Plane state: ACTIVE
-        p2 = re.compile(r'^Plane +state: +(?P<state>\S+)$')
+        p2 = regex_engine.compile(r'^Plane +state: +(?P<state>\S+)$')
 
         # FPC 0
-        p3 = re.compile(r'^(?P<fpc_name>\S+) +(?P<fpc_slot>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<fpc_name>\S+) +(?P<fpc_slot>\d+)$')
 
         # PFE 1 :Links ok
-        p4 = re.compile(r'^PFE +(?P<pfe>\d+) +:+(?P<links>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^PFE +(?P<pfe>\d+) +:+(?P<links>[\S\s]+)$')
 
 
         ret_dict = {}
@@ -2887,42 +2887,42 @@ class ShowChassisPower(ShowChassisPowerSchema):
             out = output
 
         # PSM 0:
-        p1 = re.compile(r'^(?P<name>\S+ +\d+):$')
+        p1 = regex_engine.compile(r'^(?P<name>\S+ +\d+):$')
 
         # State                      Online Master
-        p2 = re.compile(r'^State: +(?P<state>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^State: +(?P<state>[\S\s]+)$')
 
         # Input:                      Absent
-        p2_1 = re.compile(r'^Input: +(?P<input>[\S\s]+)$')
+        p2_1 = regex_engine.compile(r'^Input: +(?P<input>[\S\s]+)$')
 
         # DC input:  OK (INP0 feed expected, INP0 feed connected)
-        p3 = re.compile(r'^DC +input: +(?P<dc_input_status>[\S\s]+)( +\((?P<str_dc_expect_feed>\S+) +'
+        p3 = regex_engine.compile(r'^DC +input: +(?P<dc_input_status>[\S\s]+)( +\((?P<str_dc_expect_feed>\S+) +'
             r'feed +expected, +(?P<str_dc_actual_feed>\S+) +feed +connected\))?$')
         
         # Capacity:  2100 W (maximum 2500 W)
-        p4 = re.compile(r'^Capacity: +(?P<capacity_actual>\d+) +\S+ +\(maximum +(?P<capacity_max>\d+) +\S+\)$')
+        p4 = regex_engine.compile(r'^Capacity: +(?P<capacity_actual>\d+) +\S+ +\(maximum +(?P<capacity_max>\d+) +\S+\)$')
 
         # DC output: 489.25 W (Lower Zone, 9.50 A at 51.50 V, 23.30% of capacity)
-        p5 = re.compile(r'^DC +output: +(?P<str_dc_power>\S+) +\S+ +\((?P<str_zone>\S+) +'
+        p5 = regex_engine.compile(r'^DC +output: +(?P<str_dc_power>\S+) +\S+ +\((?P<str_zone>\S+) +'
             r'Zone, +(?P<str_dc_current>\S+) +\S+ +at +(?P<str_dc_voltage>\S+) +\S+, +'
             r'(?P<str_dc_load>\S+)\% +of +capacity\)$')
         
         # Total system capacity: 14700 W (maximum 17500 W)
-        p6 = re.compile(r'^Total +system +capacity: +(?P<capacity_sys_actual>\S+) +\S+ +'
+        p6 = regex_engine.compile(r'^Total +system +capacity: +(?P<capacity_sys_actual>\S+) +\S+ +'
             r'\(maximum +(?P<capacity_sys_max>\S+) +\S+\)$')
         
         # Total remaining power: 5074 W
-        p7 = re.compile(r'^Total +remaining +power: +(?P<capacity_sys_remaining>\S+) +\S+$')
+        p7 = regex_engine.compile(r'^Total +remaining +power: +(?P<capacity_sys_remaining>\S+) +\S+$')
 
         # Upper Zone:
         # Lower Zone:
-        p8 = re.compile(r'^(?P<str_zone>\S+) +Zone:$')
+        p8 = regex_engine.compile(r'^(?P<str_zone>\S+) +Zone:$')
 
         # Allocated power:   3332 W (2968 W remaining)
-        p9 = re.compile(r'^Allocated +power: +(?P<capacity_allocated>\S+) +\S+ +\((?P<capacity_remaining>\S+) +\S+ +remaining\)$')
+        p9 = regex_engine.compile(r'^Allocated +power: +(?P<capacity_allocated>\S+) +\S+ +\((?P<capacity_remaining>\S+) +\S+ +remaining\)$')
 
         # Actual usage:      925.50 W
-        p10 = re.compile(r'^Actual +usage: +(?P<capacity_actual_usage>\S+) +\S+$')
+        p10 = regex_engine.compile(r'^Actual +usage: +(?P<capacity_actual_usage>\S+) +\S+$')
 
         ret_dict = {}
         power_usage_system_found = False
@@ -3080,12 +3080,12 @@ class ShowChassisFpcPicStatus(ShowChassisFpcPicStatusSchema):
 
         # Regex patterns
         # Slot 0   Online       DPCE 2x 10GE R
-        p_fpc = re.compile(r'Slot +(?P<slot>\d+) +(?P<state>\S+)'
-                           r' +(?P<description>[\s\S]+)')
+        p_fpc = regex_engine.compile(r'Slot +(?P<slot>\d+) +(?P<state>\S+)'
+                                     r' +(?P<description>[\s\S]+)')
 
         # PIC 0  Online       1x 10GE(LAN/WAN)
-        p_pic = re.compile(r'PIC +(?P<pic_slot>\d+) '
-                           r'+(?P<pic_state>\S+) +(?P<pic_type>[\s\S]+)')
+        p_pic = regex_engine.compile(r'PIC +(?P<pic_slot>\d+) '
+                                     r'+(?P<pic_state>\S+) +(?P<pic_type>[\s\S]+)')
 
         # Build result dictionary
         res = {}
@@ -3206,41 +3206,41 @@ class ShowChassisEnvironmentComponent(ShowChassisEnvironmentComponentSchema):
         ret_dict = {}
 
         # CB 0 status:
-        p1 = re.compile(r'^(?P<name>\S+ +\d+) +status:$')
+        p1 = regex_engine.compile(r'^(?P<name>\S+ +\d+) +status:$')
 
         # State                      Online Master
-        p2 = re.compile(r'^State +(?P<state>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^State +(?P<state>[\S\s]+)$')
 
         # Power 1
         # Power
-        p3 = re.compile(r'^\w+( +(?P<power_type>\d+))?$')
+        p3 = regex_engine.compile(r'^\w+( +(?P<power_type>\d+))?$')
 
         # 1.0 V                     1005 mV
-        p4 = re.compile(r'^(?P<temperature_name>.*) +(?P<text>\d+ +degrees +\w+ +\/ +\d+ +degrees +\w+)$')
+        p4 = regex_engine.compile(r'^(?P<temperature_name>.*) +(?P<text>\d+ +degrees +\w+ +\/ +\d+ +degrees +\w+)$')
         
         # TCBC-Zone0 Temperature     45 degrees C / 113 degrees F
-        p5 = re.compile(r'^(?P<reference_voltage>[\d\.]+ +\w+( +\w+)?) +(?P<actual_voltage>\d+) +\w+$')
+        p5 = regex_engine.compile(r'^(?P<reference_voltage>[\d\.]+ +\w+( +\w+)?) +(?P<actual_voltage>\d+) +\w+$')
 
         # Bus Revision               100
-        p6 = re.compile(r'^Bus +Revision +(?P<bus_revision>\d+)$')
+        p6 = regex_engine.compile(r'^Bus +Revision +(?P<bus_revision>\d+)$')
 
         # FPGA Revision              272
-        p7 = re.compile(r'^FPGA +Revision +(?P<fpga_revision>\d+)$')
+        p7 = regex_engine.compile(r'^FPGA +Revision +(?P<fpga_revision>\d+)$')
 
         # DC Input                   Feed       Voltage(V)  Current(A) Power(W)
-        p8 = re.compile(r'^DC +Input +Feed +Voltage\S+ +Current\S+ +Power\S+$')
+        p8 = regex_engine.compile(r'^DC +Input +Feed +Voltage\S+ +Current\S+ +Power\S+$')
 
         # INP0         50.00       11.20     560.00
-        p9 = re.compile(r'^\w+ +(?P<voltage>[\d\.]+) +(?P<current>[\d\.]+) +(?P<power>[\d\.]+)$')
+        p9 = regex_engine.compile(r'^\w+ +(?P<voltage>[\d\.]+) +(?P<current>[\d\.]+) +(?P<power>[\d\.]+)$')
 
         # DC Output                  Voltage(V) Current(A)  Power(W)   Load(%)
-        p10 = re.compile(r'^DC +Output +Voltage\S+ +Current\S+ +Power\S+ +Load\S+$')
+        p10 = regex_engine.compile(r'^DC +Output +Voltage\S+ +Current\S+ +Power\S+ +Load\S+$')
 
         # 50.1         50.00       11.20     560.00
-        p11 = re.compile(r'^(?P<voltage>[\d\.]+) +(?P<current>[\d\.]+) +(?P<power>[\d\.]+) +(?P<load>[\d\.]+)$')        
+        p11 = regex_engine.compile(r'^(?P<voltage>[\d\.]+) +(?P<current>[\d\.]+) +(?P<power>[\d\.]+) +(?P<load>[\d\.]+)$')        
 
         # Hours Used                 45607
-        p12 = re.compile(r'^Hours +Used +(?P<psm_hours_used>\d+)$')
+        p12 = regex_engine.compile(r'^Hours +Used +(?P<psm_hours_used>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3448,32 +3448,32 @@ class ShowChassisPicFpcSlotPicSlot(ShowChassisPicFpcSlotPicSlotSchema):
         # Regular Expressions
 
         # FPC slot 0, PIC slot 0 information:
-        p1 = re.compile(r'^FPC +slot +(?P<slot>\d+), +PIC +slot +(?P<pic_slot>\d+) +information:$')
+        p1 = regex_engine.compile(r'^FPC +slot +(?P<slot>\d+), +PIC +slot +(?P<pic_slot>\d+) +information:$')
 
         # Type                             2X100GE CFP2 OTN
-        p2 = re.compile(r'^Type +(?P<pic_type>[\s\S]+)$')
+        p2 = regex_engine.compile(r'^Type +(?P<pic_type>[\s\S]+)$')
 
         # State                            Online
-        p3 = re.compile(r'^State +(?P<state>\S+)$')
+        p3 = regex_engine.compile(r'^State +(?P<state>\S+)$')
         
         # PIC version                 1.19
-        p4 = re.compile(r'^PIC version +(?P<pic_version>\S+)$')
+        p4 = regex_engine.compile(r'^PIC version +(?P<pic_version>\S+)$')
 
         # Uptime			 18 minutes, 56 seconds
         # Uptime			 6 hours, 24 minutes, 1 second
         # Uptime			 2 hours, 36 minutes, 32 seconds
-        p5 = re.compile(r'^Uptime\s+(?P<up_time>((?P<hours>\d+) +hours, +)?(?P<minutes>\d+) +minutes, +(?P<seconds>\d+) +seconds?)$')
+        p5 = regex_engine.compile(r'^Uptime\s+(?P<up_time>((?P<hours>\d+) +hours, +)?(?P<minutes>\d+) +minutes, +(?P<seconds>\d+) +seconds?)$')
 
         # PIC port information:
-        p6 = re.compile(r'PIC port information:')
+        p6 = regex_engine.compile(r'PIC port information:')
 
         #                        Fiber                    Xcvr vendor       Wave-    Xcvr
         # Port Cable type        type  Xcvr vendor        part number       length   Firmware
         # 0    100GBASE LR4      SM    FINISAR CORP.      FTLC1121RDNL-J3   1310 nm  1.5
-        p7 = re.compile(r'(?P<port_number>\d+) +(?P<cable_type>[0-9A-Z\s]+) '
-                        r'+(?P<fiber_mode>[A-Z]{2}) +(?P<sfp_vendor_name>[A-Z\s.]+) '
-                        r'+(?P<sfp_vendor_pno>[A-Z0-9\-]+) +(?P<wavelength>\d+ nm) '
-                        r'+(?P<sfp_vendor_fw_ver>\S+)')
+        p7 = regex_engine.compile(r'(?P<port_number>\d+) +(?P<cable_type>[0-9A-Z\s]+) '
+                                  r'+(?P<fiber_mode>[A-Z]{2}) +(?P<sfp_vendor_name>[A-Z\s.]+) '
+                                  r'+(?P<sfp_vendor_pno>[A-Z0-9\-]+) +(?P<wavelength>\d+ nm) '
+                                  r'+(?P<sfp_vendor_fw_ver>\S+)')
 
         # Build output
         res = {}
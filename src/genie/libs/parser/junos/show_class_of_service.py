@@ -3,13 +3,13 @@
 JunOS parsers for the following show commands:
     * show class-of-service interface {interface}
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use, Schema)
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 class ShowClassOfServiceSchema(MetaParser):
@@ -64,35 +64,35 @@ class ShowClassOfService(ShowClassOfServiceSchema):
         ret_dict = {}
         
         # Physical interface: ge-0/0/2, Index: 150
-        p1 = re.compile(r'^Physical +interface: +(?P<interface_name>\S+), +'
+        p1 = regex_engine.compile(r'^Physical +interface: +(?P<interface_name>\S+), +'
             r'Index: +(?P<interface_index>\d+)$')
 
         # Maximum usable queues: 8, Queues in use: 4
         # Queues supported: 8, Queues in use: 4
-        p2 = re.compile(r'^(Maximum +usable +queues|Queues +supported): +(?P<interface_queues_supported>\d+), +'
+        p2 = regex_engine.compile(r'^(Maximum +usable +queues|Queues +supported): +(?P<interface_queues_supported>\d+), +'
             r'Queues +in +use: +(?P<interface_queues_in_use>\d+)$')
 
         # Exclude aggregate overhead bytes: disabled
-        p3 = re.compile(r'^Exclude +aggregate +overhead +bytes: +(?P<overhead_bytes>\S+)$')
+        p3 = regex_engine.compile(r'^Exclude +aggregate +overhead +bytes: +(?P<overhead_bytes>\S+)$')
 
         # Logical interface aggregate statistics: disabled
-        p4 = re.compile(r'^Logical +interface +aggregate +statistics: +(?P<aggregate_statistics>\S+)$')
+        p4 = regex_engine.compile(r'^Logical +interface +aggregate +statistics: +(?P<aggregate_statistics>\S+)$')
 
         # Shaping rate: 1000000 bps
-        p5 = re.compile(r'^Shaping +rate: +(?P<interface_shaping_rate>\d+) +bps$')
+        p5 = regex_engine.compile(r'^Shaping +rate: +(?P<interface_shaping_rate>\d+) +bps$')
 
         # Scheduler map: <default>, Index: 2
-        p6 = re.compile(r'^Scheduler +map: +(?P<scheduler_map_name>\S+), +Index: +(?P<scheduler_map_index>\d+)$')
+        p6 = regex_engine.compile(r'^Scheduler +map: +(?P<scheduler_map_name>\S+), +Index: +(?P<scheduler_map_index>\d+)$')
 
         # Congestion-notification: Disabled
-        p7 = re.compile(r'^Congestion-notification: +(?P<congestion_notification_map>\S+)$')
+        p7 = regex_engine.compile(r'^Congestion-notification: +(?P<congestion_notification_map>\S+)$')
 
         # Logical interface: ge-0/0/2.0, Index: 335
-        p8 = re.compile(r'^Logical +interface: +(?P<i_logical_name>\S+), +Index: +(?P<i_logical_index>\S+)$')
+        p8 = regex_engine.compile(r'^Logical +interface: +(?P<i_logical_name>\S+), +Index: +(?P<i_logical_index>\S+)$')
 
         # Classifier              dscp-ipv6-compatibility dscp-ipv6                  9
         # Rewrite-Output          EXP-test               exp (mpls-any)          49467
-        p9 = re.compile(r'^(?P<object_type>\S+) +(?P<object_name>\S+) +(?P<object_subtype>\S+( +\(\S+\))?) +'
+        p9 = regex_engine.compile(r'^(?P<object_type>\S+) +(?P<object_name>\S+) +(?P<object_subtype>\S+( +\(\S+\))?) +'
             r'(?P<index>\d+)$')
 
         for line in out.splitlines():
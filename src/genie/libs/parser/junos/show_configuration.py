@@ -6,13 +6,15 @@ JUNOS parsers for the following commands:
     * show configuration interfaces {interface} unit {unit} family bridge vlan-id
 """
 
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowConfigurationProtocolsMplsLabelSwitchedPathSchema(MetaParser):
     """ Schema for:
@@ -56,21 +58,21 @@ class ShowConfigurationProtocolsMplsLabelSwitchedPath(ShowConfigurationProtocols
         ret_dict = {}
 
         # to 10.49.194.125;
-        p1 = re.compile(r'^to +(?P<to>[\S]+);$')
+        p1 = regex_engine.compile(r'^to +(?P<to>[\S]+);$')
 
         # revert-timer 0;
-        p2 = re.compile(r'^revert-timer +(?P<revert_timer>[\S]+);$')
+        p2 = regex_engine.compile(r'^revert-timer +(?P<revert_timer>[\S]+);$')
 
         # priority 3 3;
-        p3 = re.compile(r'^priority +(?P<setup_priority>[\S]+) +(?P<reservation_priority>[\S]+);$')
+        p3 = regex_engine.compile(r'^priority +(?P<setup_priority>[\S]+) +(?P<reservation_priority>[\S]+);$')
 
         # primary test_path_01;
-        p4 = re.compile(r'^primary +(?P<primary>[\S]+);$')
+        p4 = regex_engine.compile(r'^primary +(?P<primary>[\S]+);$')
 
         # no-cspf;
         # record;
         # inter-domain;
-        p5 = re.compile(r'^(?P<flag>[^\s;]+);$')
+        p5 = regex_engine.compile(r'^(?P<flag>[^\s;]+);$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -156,7 +158,7 @@ class ShowConfigurationProtocolsMplsPath(ShowConfigurationProtocolsMplsPathSchem
         ret_dict = {}
 
         # 10.0.0.1 strict;
-        p1 = re.compile(r'^(?P<name>\S+) +(?P<type>[\S]+);$')
+        p1 = regex_engine.compile(r'^(?P<name>\S+) +(?P<type>[\S]+);$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -219,7 +221,7 @@ class ShowConfigurationFamilyBridgeVlanId(ShowConfigurationFamilyBridgeVlanIdSch
         ret_dict = {}
         
         # vlan-id 10;
-        p1 = re.compile(r'^vlan-id +(?P<vlan_id>\S+);$')
+        p1 = regex_engine.compile(r'^vlan-id +(?P<vlan_id>\S+);$')
         
         for line in out.splitlines():
             line = line.strip()
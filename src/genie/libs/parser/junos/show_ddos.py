@@ -5,13 +5,15 @@ JUNOS parsers for the following commands:
 
 """
 
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowDdosProtectionStatisticsSchema(MetaParser):
     """
     Schema for:
@@ -53,7 +55,7 @@ class ShowDdosProtectionStatistics(ShowDdosProtectionStatisticsSchema):
         res = {}        
 
         # DDOS protection global statistics:
-        p1 = re.compile(r'^DDOS protection global statistics:$')
+        p1 = regex_engine.compile(r'^DDOS protection global statistics:$')
 
         # Policing on routing engine:         Yes
         # Policing on FPC:                    Yes
@@ -69,7 +71,7 @@ class ShowDdosProtectionStatistics(ShowDdosProtectionStatisticsSchema):
         # Total violation counts:             0
         # Currently tracked flows:            0
         # Total detected flows:               0
-        p2 = re.compile(r'(?P<key>[\s\S]+)(:|mode) +(?P<value>[\w\d]+)')
+        p2 = regex_engine.compile(r'(?P<key>[\s\S]+)(:|mode) +(?P<value>[\w\d]+)')
 
         keys_dict = {
             'Policing on routing engine': 'ddos-policing-re-enabled',
@@ -206,69 +208,69 @@ class ShowDDosProtectionProtocol(ShowDDosProtectionProtocolSchema):
         ret_dict = {}
 
         # Packet types: 1, Modified: 0, Received traffic: 0, Currently violated: 0
-        p1 = re.compile(r'^Packet +types: +(?P<total_packet_types>\d+), +'
+        p1 = regex_engine.compile(r'^Packet +types: +(?P<total_packet_types>\d+), +'
             r'Modified: +(?P<mod_packet_types>\d+), +Received +traffic: +(?P<packet_types_rcvd_packets>\d+), +'
             r'Currently +violated: +(?P<packet_types_in_violation>\d+)$')
         
         # Currently tracked flows: 0, Total detected flows: 0
-        p2 = re.compile(r'^Currently +tracked +flows: +(?P<flows_current>\d+), +'
+        p2 = regex_engine.compile(r'^Currently +tracked +flows: +(?P<flows_current>\d+), +'
             r'Total +detected +flows: +(?P<flows_cumulative>\d+)$')
         
         # Protocol Group: ARP
-        p3 = re.compile(r'^Protocol +Group: +(?P<group_name>\S+)$')
+        p3 = regex_engine.compile(r'^Protocol +Group: +(?P<group_name>\S+)$')
 
         # Packet type: aggregate (Aggregate for all arp traffic)
-        p4 = re.compile(r'^Packet +type: +(?P<packet_type>\S+) +\((?P<packet_type_description>[\S\s]+)\)$')
+        p4 = regex_engine.compile(r'^Packet +type: +(?P<packet_type>\S+) +\((?P<packet_type_description>[\S\s]+)\)$')
 
         # Bandwidth:        20000 pps
-        p5 = re.compile(r'^Bandwidth: +(?P<policer_bandwidth>\d+) +pps$')
+        p5 = regex_engine.compile(r'^Bandwidth: +(?P<policer_bandwidth>\d+) +pps$')
 
         # Burst:            20000 packets
-        p6 = re.compile(r'^Burst: +(?P<policer_burst>\d+) +packets$')
+        p6 = regex_engine.compile(r'^Burst: +(?P<policer_burst>\d+) +packets$')
 
         # Recover time:     300 seconds
-        p7 = re.compile(r'^Recover +time: +(?P<policer_time_recover>\d+) +seconds$')
+        p7 = regex_engine.compile(r'^Recover +time: +(?P<policer_time_recover>\d+) +seconds$')
 
         # Enabled:          Yes
-        p8 = re.compile(r'^Enabled: +(?P<policer_enable>\S+)$')
+        p8 = regex_engine.compile(r'^Enabled: +(?P<policer_enable>\S+)$')
 
         # Detection mode: Automatic  Detect time:  3 seconds
-        p9 = re.compile(r'^Detection +mode: +(?P<detection_mode>\S+) +Detect +time: +(?P<detect_time>\d+) +seconds$')
+        p9 = regex_engine.compile(r'^Detection +mode: +(?P<detection_mode>\S+) +Detect +time: +(?P<detect_time>\d+) +seconds$')
 
         # Log flows:      Yes        Recover time: 60 seconds
-        p10 = re.compile(r'^Log +flows: +(?P<log_flows>\S+) +Recover +time: +(?P<recover_time>\d+) +seconds$')
+        p10 = regex_engine.compile(r'^Log +flows: +(?P<log_flows>\S+) +Recover +time: +(?P<recover_time>\d+) +seconds$')
 
         # Timeout flows:  No         Timeout time: 300 seconds
-        p11 = re.compile(r'^Timeout +flows: +(?P<timeout_active_flows>\S+) +Timeout +time: +(?P<timeout_time>\d+) +seconds$')
+        p11 = regex_engine.compile(r'^Timeout +flows: +(?P<timeout_active_flows>\S+) +Timeout +time: +(?P<timeout_time>\d+) +seconds$')
 
         # Subscriber          Automatic       Drop          10 pps
-        p12 = re.compile(r'^Subscriber +(?P<sub_detection_mode>\S+) +(?P<sub_control_mode>\S+) +(?P<sub_bandwidth>\d+) +pps$')
+        p12 = regex_engine.compile(r'^Subscriber +(?P<sub_detection_mode>\S+) +(?P<sub_control_mode>\S+) +(?P<sub_bandwidth>\d+) +pps$')
 
         # Logical interface   Automatic       Drop          10 pps
-        p13 = re.compile(r'^Logical +interface +(?P<ifl_detection_mode>\S+) +(?P<ifl_control_mode>\S+) +(?P<ifl_bandwidth>\d+) +pps$')
+        p13 = regex_engine.compile(r'^Logical +interface +(?P<ifl_detection_mode>\S+) +(?P<ifl_control_mode>\S+) +(?P<ifl_bandwidth>\d+) +pps$')
 
         # Physical interface  Automatic       Drop          20000 pps
-        p14 = re.compile(r'^Physical +interface +(?P<ifd_detection_mode>\S+) +(?P<ifd_control_mode>\S+) +(?P<ifd_bandwidth>\d+) +pps$')
+        p14 = regex_engine.compile(r'^Physical +interface +(?P<ifd_detection_mode>\S+) +(?P<ifd_control_mode>\S+) +(?P<ifd_bandwidth>\d+) +pps$')
 
         # System-wide information:
-        p15 = re.compile(r'^System-wide +information:$')
+        p15 = regex_engine.compile(r'^System-wide +information:$')
 
         # Received:  0                   Arrival rate:     0 pps
-        p16 = re.compile(r'^Received: +(?P<packet_received>\d+) +Arrival +rate: +(?P<packet_arrival_rate>\d+) +pps$')
+        p16 = regex_engine.compile(r'^Received: +(?P<packet_received>\d+) +Arrival +rate: +(?P<packet_arrival_rate>\d+) +pps$')
 
         # Dropped:   0                   Max arrival rate: 0 pps
-        p17 = re.compile(r'^Dropped: +(?P<packet_dropped>\d+) +Max +arrival +rate: +(?P<packet_arrival_rate_max>\d+) +pps$')
+        p17 = regex_engine.compile(r'^Dropped: +(?P<packet_dropped>\d+) +Max +arrival +rate: +(?P<packet_arrival_rate_max>\d+) +pps$')
 
         # Routing Engine information:
-        p18 = re.compile(r'^Routing +Engine +information:$')
+        p18 = regex_engine.compile(r'^Routing +Engine +information:$')
 
         # FPC slot 0 information:
         # FPC slot 9 information:
-        p18_1 = re.compile(r'^FPC +slot +\d+ +information:$')
+        p18_1 = regex_engine.compile(r'^FPC +slot +\d+ +information:$')
 
         # Bandwidth: 20000 pps, Burst: 20000 packets, enabled
         # Bandwidth: 100% (20000 pps), Burst: 100% (20000 packets), enabled
-        p19 = re.compile(r'^Bandwidth: +((?P<policer_bandwidth_scale>\d+)% +\()?(?P<policer_bandwidth>\d+) +pps\)?, +Burst: +((?P<policer_burst_scale>\d+)% +\()?(?P<policer_burst>\d+) +packets\)?, +(?P<policer_enable>\S+)$')
+        p19 = regex_engine.compile(r'^Bandwidth: +((?P<policer_bandwidth_scale>\d+)% +\()?(?P<policer_bandwidth>\d+) +pps\)?, +Burst: +((?P<policer_burst_scale>\d+)% +\()?(?P<policer_burst>\d+) +packets\)?, +(?P<policer_enable>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -314,7 +316,7 @@ class ShowDDosProtectionProtocol(ShowDDosProtectionProtocolSchema):
                 continue
 
             # Burst:            20000 packets
-            p6 = re.compile(r'^Burst: +(?P<policer_burst>\d+) +packets$')
+            p6 = regex_engine.compile(r'^Burst: +(?P<policer_burst>\d+) +packets$')
             m = p6.match(line)
             if m:
                 group = m.groupdict()
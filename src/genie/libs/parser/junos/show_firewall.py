@@ -5,15 +5,15 @@ JunOs parsers for the following show commands:
     * show firewall counter filter v6_local-access-control v6_last_policer
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, Or, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowFirewallSchema(MetaParser):
 
     """ Schema for:
@@ -75,16 +75,16 @@ class ShowFirewall(ShowFirewallSchema):
             out = output
 
         # Filter: catch_all
-        p1 = re.compile(r'^Filter: +(?P<filter_name>\S+)$')
+        p1 = regex_engine.compile(r'^Filter: +(?P<filter_name>\S+)$')
 
         # cflow_counter_v4                              28553344730            151730215
-        p2 = re.compile(r'^(?P<counter_name>\S+) +(?P<byte_count>\d+) +(?P<packet_count>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<counter_name>\S+) +(?P<byte_count>\d+) +(?P<packet_count>\d+)$')
 
         # Policers:
-        p3 = re.compile(r'^Policers:$')
+        p3 = regex_engine.compile(r'^Policers:$')
 
         # Counters:
-        p4 = re.compile(r'^Counters:$')
+        p4 = regex_engine.compile(r'^Counters:$')
         
         ret_dict = {}
         pol_coun = None
@@ -171,13 +171,13 @@ class ShowFirewallCounterFilter(ShowFirewallCounterFilterSchema):
             out = output
 
         #Filter: catch_all
-        p1 = re.compile(r'^Filter: +(?P<filter_name>\S+)$')
+        p1 = regex_engine.compile(r'^Filter: +(?P<filter_name>\S+)$')
 
         #cflow_counter_v4                              28553344730            151730215
-        p2 = re.compile(r'^(?P<counter_name>\S+) +(?P<byte_count>\d+) +(?P<packet_count>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<counter_name>\S+) +(?P<byte_count>\d+) +(?P<packet_count>\d+)$')
 
         #Policers:
-        p3 = re.compile(r'^(?P<filter_name>\APolicers:)$')
+        p3 = regex_engine.compile(r'^(?P<filter_name>\APolicers:)$')
         
         ret_dict = {}
 
@@ -261,10 +261,10 @@ class ShowFirewallLog(ShowFirewallLogSchema):
             out = output
 
         #10:28:22  pfe       D      ge-0/0/0.0    TCP             10.70.0.2                         10.70.0.1
-        p1 = re.compile(r'^(?P<time>[\d\:]+) +(?P<filter_name>\S+) '
-                        r'+(?P<action_name>\S+) +(?P<interface_name>\S+) '
-                        r'+(?P<protocol_name>\S+) +(?P<source_address>\S+) '
-                        r'+(?P<destination_address>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<time>[\d\:]+) +(?P<filter_name>\S+) '
+                                  r'+(?P<action_name>\S+) +(?P<interface_name>\S+) '
+                                  r'+(?P<protocol_name>\S+) +(?P<source_address>\S+) '
+                                  r'+(?P<destination_address>\S+)$')
 
         ret_dict = {}
 
@@ -17,16 +17,15 @@ JunOS parsers for the following show commands:
     * show interfaces extensive {interface}
 """
 
-# python
-import re
-
 # metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, Or, ListOf
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.junos_structured import StructuredOutputMixin
 
 
 # =======================================================
@@ -87,15 +86,15 @@ class ShowInterfacesTerse(ShowInterfacesTerseSchema):
         ret_dict = {}
 
         # error: interface ge-0/0/3.0 not found
-        p0 = re.compile(r'^error:\s+interface\s+\S+\s+not\s+found$')
+        p0 = regex_engine.compile(r'^error:\s+interface\s+\S+\s+not\s+found$')
 
         # Interface               Admin Link Proto    Local                 Remote
         # lo0.0                   up    up   inet     10.1.1.1            --> 0/0
         # em1.0                   up    up   inet     10.0.0.4/8
         # fxp0                    up    up
-        p1 =  re.compile(r'^(?P<interface>\S+) +(?P<admin_state>\w+) +(?P<link_state>\w+) *'
-                          r'(?P<protocol>\S+)? *(?P<local>[\w\.\:\/]+)?( *'
-                          r'[\-\>]+? *(?P<remote>[\w\.\:\/]+))?$')
+        p1 =  regex_engine.compile(r'^(?P<interface>\S+) +(?P<admin_state>\w+) +(?P<link_state>\w+) *'
+                                    r'(?P<protocol>\S+)? *(?P<local>[\w\.\:\/]+)?( *'
+                                    r'[\-\>]+? *(?P<remote>[\w\.\:\/]+))?$')
 
 
         #                                             172.16.64.1/2
@@ -103,10 +102,10 @@ class ShowInterfacesTerse(ShowInterfacesTerseSchema):
         #                                             2001:db8:8d82:0:a::4/64
         #                                    tnp      0x4
         #                                             10.11.11.11         --> 0/0
-        p2 =  re.compile(r'^((?P<protocol>\S+) +)?(?P<local>((\d+\.[\d\.\/]+)|(\w+\:[\w\:\/]+)|(0x\d+))+)'
-                          r' *(([\-\>]+) *(?P<remote>[\w\.\:\/]+))?$')
+        p2 =  regex_engine.compile(r'^((?P<protocol>\S+) +)?(?P<local>((\d+\.[\d\.\/]+)|(\w+\:[\w\:\/]+)|(0x\d+))+)'
+                                    r' *(([\-\>]+) *(?P<remote>[\w\.\:\/]+))?$')
         #                                    multiservice
-        p3 = re.compile(r'^((?P<protocol>\S+))$')
+        p3 = regex_engine.compile(r'^((?P<protocol>\S+))$')
 
 
 
@@ -240,11 +239,11 @@ class ShowInterfacesDescriptions(ShowInterfacesDescriptionsSchema):
         ret_dict = {}
 
         # Interface       Admin Link Description
-        p1 = re.compile(r'^Interface +Admin +Link +Description$')
+        p1 = regex_engine.compile(r'^Interface +Admin +Link +Description$')
 
         # resolving parser issue to display Interface when Description containing spaces
         # ge-0/0/1.0      up    up   LBT0 link to LABP1 (GigabitEthernet0/0/0/0) - backbone
-        p2 = re.compile(r'^(?P<name>\S+)\s+(?P<admin_status>\S+)\s+(?P<oper_status>\S+)\s+(?P<description>.*)$')
+        p2 = regex_engine.compile(r'^(?P<name>\S+)\s+(?P<admin_status>\S+)\s+(?P<oper_status>\S+)\s+(?P<description>.*)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1022,16 +1021,18 @@ class ShowInterfacesSchema(MetaParser):
         }
     }
 
-class ShowInterfaces(ShowInterfacesSchema):
+class ShowInterfaces(StructuredOutputMixin, ShowInterfacesSchema):
     cli_command = ['show interfaces', 'show interfaces {interface}']
 
+    def _get_command(self, interface=None):
+        if interface:
+            return self.cli_command[1].format(interface=interface)
+        return self.cli_command[0]
+
     def cli(self, interface=None, output=None):
 
         if not output:
-            if interface:
-                out = self.device.execute(self.cli_command[1].format(interface=interface))
-            else:
-                out = self.device.execute(self.cli_command[0])
+            out = self.device.execute(self._get_command(interface=interface))
         else:
             out = output
         
@@ -1040,171 +1041,171 @@ class ShowInterfaces(ShowInterfacesSchema):
         statistics_type = None
 
         # Physical interface: ge-0/0/0, Enabled, Physical link is Up
-        p1 = re.compile(r'^Physical +interface: +(?P<name>\S+), +'
+        p1 = regex_engine.compile(r'^Physical +interface: +(?P<name>\S+), +'
             r'(?P<admin_status>\S+), +Physical +link +is +(?P<oper_status>\S+)$')
 
         # Interface index: 148, SNMP ifIndex: 526
-        p2 = re.compile(r'^Interface +index: +(?P<local_index>\d+), +'
+        p2 = regex_engine.compile(r'^Interface +index: +(?P<local_index>\d+), +'
             r'SNMP +ifIndex: +(?P<snmp_index>\d+)'
             r'(, +Generation: +\S+)?$')
 
         # Description: none/100G/in/hktGCS002_ge-0/0/0
         # Description: TEST-DESC:1|TEST#1234 DEV
-        p3 = re.compile(r'^Description: +(?P<description>.+)$')
+        p3 = regex_engine.compile(r'^Description: +(?P<description>.+)$')
 
         # Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None,
         # Link-level type: Ethernet, MTU: 1514, MRU: 1522, Speed: 100Gbps, BPDU Error: None, Loopback: Disabled,
         # Link-level type: Ethernet, MTU: 1514, Link-mode: Full-duplex, Speed: 1000mbps,
         # Link-level type: Ethernet, MTU: 1514, Speed: 1Gbps, BPDU Error: None, MAC-REWRITE Error: None, Loopback: Disabled, Source filtering: Disabled, Flow control: Disabled
-        p4 = re.compile(r'^(Type: +\S+, )?Link-level +type: +(?P<link_level_type>\S+), '
-                        r'+MTU: +(?P<mtu>\S+)(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
-                        r'(, +Link-mode: +(?P<link_mode>\S+))?(, +Speed: +(?P<speed>\S+))?'
-                        r'(, +BPDU +Error: +(?P<bpdu_error>\w+))?'
-                        r'(, +MAC-REWRITE Error: +(?P<mac_rewrite_error>\S+))?'
-                        r'(, +Loopback: +(?P<loopback>\S+))?'
-                        r'(, Source +filtering: +(?P<source_filtering>\S+))?'
-                        r'(, +Flow +control: +(?P<if_flow_control>\S+))?(,)?$')
+        p4 = regex_engine.compile(r'^(Type: +\S+, )?Link-level +type: +(?P<link_level_type>\S+), '
+                                  r'+MTU: +(?P<mtu>\S+)(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
+                                  r'(, +Link-mode: +(?P<link_mode>\S+))?(, +Speed: +(?P<speed>\S+))?'
+                                  r'(, +BPDU +Error: +(?P<bpdu_error>\w+))?'
+                                  r'(, +MAC-REWRITE Error: +(?P<mac_rewrite_error>\S+))?'
+                                  r'(, +Loopback: +(?P<loopback>\S+))?'
+                                  r'(, Source +filtering: +(?P<source_filtering>\S+))?'
+                                  r'(, +Flow +control: +(?P<if_flow_control>\S+))?(,)?$')
         
         # Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None,
-        p4_1 = re.compile(r'^(Speed: +(?P<speed>[^\s,]+))(, +)?'
-                          r'(BPDU +Error: +(?P<bpdu_error>[^\s,]+))?(, +)?'
-                          r'(Loop +Detect +PDU +Error: +(?P<ld_pdu_error>[^\s,]+))?(, +)?')
+        p4_1 = regex_engine.compile(r'^(Speed: +(?P<speed>[^\s,]+))(, +)?'
+                                    r'(BPDU +Error: +(?P<bpdu_error>[^\s,]+))?(, +)?'
+                                    r'(Loop +Detect +PDU +Error: +(?P<ld_pdu_error>[^\s,]+))?(, +)?')
 
         # Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None,
-        p4_2 = re.compile(r'^Link-level +type: +(?P<link_level_type>\S+), +MTU: +(?P<mtu>\S+)'
-                          r'(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
-                          r'(, +Speed: +(?P<speed>\S+))?(, +BPDU +Error: +(?P<bpdu_error>\S+),)?'
-                          r'( +Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+),)?'
-                          r'( +Ethernet-Switching +Error: +(?P<eth_switch_error>\S+),)?'
-                          r'( +MAC-REWRITE +Error: +\S+)?$')
+        p4_2 = regex_engine.compile(r'^Link-level +type: +(?P<link_level_type>\S+), +MTU: +(?P<mtu>\S+)'
+                                    r'(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
+                                    r'(, +Speed: +(?P<speed>\S+))?(, +BPDU +Error: +(?P<bpdu_error>\S+),)?'
+                                    r'( +Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+),)?'
+                                    r'( +Ethernet-Switching +Error: +(?P<eth_switch_error>\S+),)?'
+                                    r'( +MAC-REWRITE +Error: +\S+)?$')
 
         # Link-level type: Ethernet, MTU: 1514, MRU: 1522, Speed: 100Gbps, BPDU Error: None, Loopback: Disabled,
 
         # Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
-        p5 = re.compile(r'^Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+), +'
+        p5 = regex_engine.compile(r'^Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+), +'
             r'Ethernet-Switching +Error: +(?P<eth_switch_error>\S+), +MAC-REWRITE +'
             r'Error: +\S+, +Loopback: +(?P<loopback>\S+),$')
 
         # Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
         # BPDU Error: None, MAC-REWRITE Error: None, Loopback: Disabled
-        p5_1 = re.compile(r'^((Ethernet-Switching +Error: +(?P<eth_switch_error>[^\s,]+))|(BPDU +Error: +(?P<bpdu_error>[^\s,]+)))(, +)?(MAC-REWRITE +Error: +[^\s,]+)?(, +)?(Loopback: +(?P<loopback>[^\s,]+))(, +)?')
+        p5_1 = regex_engine.compile(r'^((Ethernet-Switching +Error: +(?P<eth_switch_error>[^\s,]+))|(BPDU +Error: +(?P<bpdu_error>[^\s,]+)))(, +)?(MAC-REWRITE +Error: +[^\s,]+)?(, +)?(Loopback: +(?P<loopback>[^\s,]+))(, +)?')
 
         # Loopback: Disabled, Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
-        p5_2 = re.compile(r'^(Loopback: +(?P<loopback>\S+),)?'
-                          r'( +Source +filtering: +(?P<source_filtering>\S+),)?'
-                          r'( +Flow +control: +(?P<if_flow_control>\S+),)?'
-                          r'( +Auto-negotiation: +(?P<if_auto_negotiation>\S+),)?'
-                          r'( +Remote +fault: +(?P<if_remote_fault>\S+))$')
+        p5_2 = regex_engine.compile(r'^(Loopback: +(?P<loopback>\S+),)?'
+                                    r'( +Source +filtering: +(?P<source_filtering>\S+),)?'
+                                    r'( +Flow +control: +(?P<if_flow_control>\S+),)?'
+                                    r'( +Auto-negotiation: +(?P<if_auto_negotiation>\S+),)?'
+                                    r'( +Remote +fault: +(?P<if_remote_fault>\S+))$')
 
         # Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
         # Source filtering: Disabled, Flow control: Disabled
-        p6 = re.compile(r'^Source +filtering: +(?P<source_filtering>\S+), +Flow +control: +(?P<if_flow_control>\S+)(, +Auto-negotiation: +(?P<if_auto_negotiation>\S+), +Remote +fault: +(?P<if_remote_fault>\S+))?$')
+        p6 = regex_engine.compile(r'^Source +filtering: +(?P<source_filtering>\S+), +Flow +control: +(?P<if_flow_control>\S+)(, +Auto-negotiation: +(?P<if_auto_negotiation>\S+), +Remote +fault: +(?P<if_remote_fault>\S+))?$')
 
         # Pad to minimum frame size: Disabled
-        p7 = re.compile(r'^Pad +to +minimum +frame +size: +'
+        p7 = regex_engine.compile(r'^Pad +to +minimum +frame +size: +'
             r'(?P<pad_to_minimum_frame_size>\S+)$')
 
         # Minimum links needed: 1, Minimum bandwidth needed: 1bps
-        p7_1 = re.compile(r'^Minimum +links +needed: +(?P<minimum_links_in_aggregate>\d+), +Minimum +bandwidth +needed: +(?P<minimum_bandwidth_in_aggregate>\S+)$')
+        p7_1 = regex_engine.compile(r'^Minimum +links +needed: +(?P<minimum_links_in_aggregate>\d+), +Minimum +bandwidth +needed: +(?P<minimum_bandwidth_in_aggregate>\S+)$')
 
         # Device flags   : Present Running
-        p8 = re.compile(r'^Device +flags +: +(?P<if_device_flags>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^Device +flags +: +(?P<if_device_flags>[\S\s]+)$')
 
         # Interface flags: SNMP-Traps Internal: 0x4000
-        p9 = re.compile(r'^Interface +flags:( +(?P<hardware_down>Hardware-Down))? +'
-                r'(?P<iff_snmp_traps>\S+)( +Internal: +(?P<internal_flags>\S+))?$')
+        p9 = regex_engine.compile(r'^Interface +flags:( +(?P<hardware_down>Hardware-Down))? +'
+                          r'(?P<iff_snmp_traps>\S+)( +Internal: +(?P<internal_flags>\S+))?$')
 
         # Link flags     : None
-        p10 = re.compile(r'^Link +flags +: +(?P<if_media_flags>\S+)$')
+        p10 = regex_engine.compile(r'^Link +flags +: +(?P<if_media_flags>\S+)$')
 
         # Link type      : Full-Duplex
-        p10_1 = re.compile(r'^Link +type +: +(?P<link_type>\S+)$')
+        p10_1 = regex_engine.compile(r'^Link +type +: +(?P<link_type>\S+)$')
 
         # CoS queues     : 8 supported, 8 maximum usable queues
-        p11 = re.compile(r'^CoS +queues +: +(?P<physical_interface_cos_hw_max_queues>\d+) +'
+        p11 = regex_engine.compile(r'^CoS +queues +: +(?P<physical_interface_cos_hw_max_queues>\d+) +'
             r'supported, +(?P<physical_interface_cos_use_max_queues>\d+) maximum +'
             r'usable +queues$')
 
         # Current address: 00:50:56:ff:56:b6, Hardware address: 00:50:56:ff:56:b6
-        p12 = re.compile(r'^Current +address: +(?P<current_physical_address>\S+), +'
+        p12 = regex_engine.compile(r'^Current +address: +(?P<current_physical_address>\S+), +'
             r'Hardware +address: +(?P<hardware_physical_address>\S+)$')
 
         # Last flapped   : 2019-08-29 09:09:19 UTC (29w6d 18:56 ago)
-        p13 = re.compile(r'^Last +flapped +: +(?P<interface_flapped>[\S\s]+)$')
+        p13 = regex_engine.compile(r'^Last +flapped +: +(?P<interface_flapped>[\S\s]+)$')
 
         # Input rate     : 2952 bps (5 pps)
-        p14 = re.compile(r'^Input +rate +: +(?P<input_bps>\d+) +'
+        p14 = regex_engine.compile(r'^Input +rate +: +(?P<input_bps>\d+) +'
             r'bps +\((?P<input_pps>\d+) +pps\)$')
         
         # Input  bytes  :          19732539397                 3152 bps
-        p14_1 = re.compile(r'^Input +bytes *: +(?P<input_bytes>\S+)'
+        p14_1 = regex_engine.compile(r'^Input +bytes *: +(?P<input_bytes>\S+)'
             r'( +(?P<input_bps>\S+) +bps)?$')
         # Output bytes  :          16367814635                 3160 bps
-        p14_2 = re.compile(r'^Output +bytes *: +(?P<output_bytes>\S+)'
+        p14_2 = regex_engine.compile(r'^Output +bytes *: +(?P<output_bytes>\S+)'
             r'( +(?P<output_bps>\S+) +bps)?$')
         # Input  packets:            133726363                    5 pps
-        p14_3 = re.compile(r'^Input +packets *: +(?P<input_packets>\S+)'
+        p14_3 = regex_engine.compile(r'^Input +packets *: +(?P<input_packets>\S+)'
             r'( +(?P<input_pps>\S+) +pps)?$')
         # Output packets:            129306863                    4 pps
-        p14_4 = re.compile(r'^Output +packets *: +(?P<output_packets>\S+)'
+        p14_4 = regex_engine.compile(r'^Output +packets *: +(?P<output_packets>\S+)'
             r'( +(?P<output_pps>\S+) +pps)?$')
         
         # Output rate    : 3080 bps (3 pps)
-        p15 = re.compile(r'^Output +rate +: +(?P<output_bps>\d+) +'
+        p15 = regex_engine.compile(r'^Output +rate +: +(?P<output_bps>\d+) +'
             r'bps +\((?P<output_pps>\d+) +pps\)$')
         
         # Active alarms  : None
-        p16 = re.compile(r'^Active +alarms *: +(?P<active_alarms>\S+)$')
+        p16 = regex_engine.compile(r'^Active +alarms *: +(?P<active_alarms>\S+)$')
 
         # Active defects : None
-        p17 = re.compile(r'^Active +defects *: +(?P<active_defects>\S+)$')
+        p17 = regex_engine.compile(r'^Active +defects *: +(?P<active_defects>\S+)$')
         
         # PCS statistics                      Seconds
-        p18 = re.compile(r'^PCS +statistics +Seconds$')
+        p18 = regex_engine.compile(r'^PCS +statistics +Seconds$')
 
         # Bit errors                             0
-        p19 = re.compile(r'^Bit +errors +(?P<bit_error_seconds>\d+)$')
+        p19 = regex_engine.compile(r'^Bit +errors +(?P<bit_error_seconds>\d+)$')
 
         # Errored blocks                         0
-        p20 = re.compile(r'^Errored +blocks +(?P<errored_blocks_seconds>\d+)$')
+        p20 = regex_engine.compile(r'^Errored +blocks +(?P<errored_blocks_seconds>\d+)$')
         
         # Ethernet FEC statistics              Errors
-        p21 = re.compile(r'^Ethernet +FEC +statistics +Errors$')
+        p21 = regex_engine.compile(r'^Ethernet +FEC +statistics +Errors$')
 
         # FEC Corrected Errors                    0
         # FEC Uncorrected Errors                  0
         # FEC Corrected Errors Rate               0
         # FEC Uncorrected Errors Rate             0
-        p22 = re.compile(r'^FEC +Corrected +Errors +(?P<fec_ccw_count>\d+)$')
-        p22_1 = re.compile(r'^FEC +Uncorrected +Errors +(?P<fec_nccw_count>\d+)$')
-        p22_2 = re.compile(r'^FEC +Corrected +Errors +Rate +(?P<fec_ccw_error_rate>\d+)$')
-        p22_3 = re.compile(r'^FEC +Uncorrected +Errors +Rate +(?P<fec_nccw_error_rate>\d+)$')
+        p22 = regex_engine.compile(r'^FEC +Corrected +Errors +(?P<fec_ccw_count>\d+)$')
+        p22_1 = regex_engine.compile(r'^FEC +Uncorrected +Errors +(?P<fec_nccw_count>\d+)$')
+        p22_2 = regex_engine.compile(r'^FEC +Corrected +Errors +Rate +(?P<fec_ccw_error_rate>\d+)$')
+        p22_3 = regex_engine.compile(r'^FEC +Uncorrected +Errors +Rate +(?P<fec_nccw_error_rate>\d+)$')
 
         # Interface transmit statistics: Disabled
-        p23 = re.compile(r'^Interface +transmit +statistics: +'
+        p23 = regex_engine.compile(r'^Interface +transmit +statistics: +'
             r'(?P<interface_transmit_statistics>\S+)$')
 
         # Logical interface ge-0/0/0.0 (Index 333) (SNMP ifIndex 606)
-        p24 = re.compile(r'^Logical +interface +(?P<name>\S+) +'
+        p24 = regex_engine.compile(r'^Logical +interface +(?P<name>\S+) +'
             r'\(Index +(?P<local_index>\d+)\) +\(SNMP +ifIndex +'
             r'(?P<snmp_index>\d+)\)( +\(Generation +\S+\))?$')
 
         # Flags: Up SNMP-Traps 0x4004000 Encapsulation: ENET2
         # Flags: Up SNMP-Traps 0x4000 VLAN-Tag [ 0x8100.1 ]  Encapsulation: ENET2
         # Flags: Hardware-Down Device-Down SNMP-Traps 0x4000 VLAN-Tag [ 0x8100.1 ]  Encapsulation: ENET2
-        p25 = re.compile(r'^Flags: +(?P<iff_up>(\S+|Hardware-Down Device-Down))'
-                         r'( +SNMP-Traps)?( +(?P<internal_flags>\S+))?( +VLAN-Tag +\[[\S\s]+\])?'
-                         r' +Encapsulation: +(?P<encapsulation>\S+)$')
+        p25 = regex_engine.compile(r'^Flags: +(?P<iff_up>(\S+|Hardware-Down Device-Down))'
+                                   r'( +SNMP-Traps)?( +(?P<internal_flags>\S+))?( +VLAN-Tag +\[[\S\s]+\])?'
+                                   r' +Encapsulation: +(?P<encapsulation>\S+)$')
 
         # Input packets : 133657033
-        p26 = re.compile(r'^Input +packets *: +(?P<input_packets>\S+)$')
+        p26 = regex_engine.compile(r'^Input +packets *: +(?P<input_packets>\S+)$')
 
         # Output packets: 129243982
-        p27 = re.compile(r'^Output +packets *: +(?P<output_packets>\S+)$')
+        p27 = regex_engine.compile(r'^Output +packets *: +(?P<output_packets>\S+)$')
 
         # Protocol inet, MTU: 1500, Maximum labels: 2
         # Protocol inet, MTU: 1500, Generation: 150, Route table: 0
-        p28 = re.compile(r'^Protocol +(?P<address_family_name>\S+), +'
+        p28 = regex_engine.compile(r'^Protocol +(?P<address_family_name>\S+), +'
             r'MTU: +(?P<mtu>\S+)(, +Maximum labels: +'
             r'(?P<maximum_labels>\S+))?(, +Generation: +'
             r'(?P<generation>\S+))?(, +Route table: +'
@@ -1212,56 +1213,56 @@ class ShowInterfaces(ShowInterfacesSchema):
 
         # Max nh cache: 75000, New hold nh limit: 75000, Curr nh cnt: 1, Curr new hold cnt: 0, NH drop cnt: 0
         # Max nh cache: 75000, New hold nh limit: 75000, Curr nh cnt: 1,
-        p30 = re.compile(r'^Max +nh +cache: +(?P<max_local_cache>\d+), +New +hold +nh +limit: +(?P<new_hold_limit>\d+), Curr +nh +cnt: +(?P<intf_curr_cnt>\d+),( +Curr +new +hold +cnt: +(?P<intf_unresolved_cnt>\d+), +NH +drop +cnt: +(?P<intf_dropcnt>\d+))?$')
+        p30 = regex_engine.compile(r'^Max +nh +cache: +(?P<max_local_cache>\d+), +New +hold +nh +limit: +(?P<new_hold_limit>\d+), Curr +nh +cnt: +(?P<intf_curr_cnt>\d+),( +Curr +new +hold +cnt: +(?P<intf_unresolved_cnt>\d+), +NH +drop +cnt: +(?P<intf_dropcnt>\d+))?$')
 
         # Curr new hold cnt: 0, NH drop cnt: 0
-        p30_1 = re.compile(r'^Curr +new +hold +cnt: +(?P<intf_unresolved_cnt>\d+), +NH +drop +cnt: +(?P<intf_dropcnt>\d+)$')
+        p30_1 = regex_engine.compile(r'^Curr +new +hold +cnt: +(?P<intf_unresolved_cnt>\d+), +NH +drop +cnt: +(?P<intf_dropcnt>\d+)$')
 
         # Flags: No-Redirects, Sendbcast-pkt-to-re
         # Flags: Is-Primary, User-MTU
         # Flags: Up SNMP-Traps 0x4000 Encapsulation: ENET2
-        p31 = re.compile(r'^Flags: +(?P<flags>[\S\s]+)')
+        p31 = regex_engine.compile(r'^Flags: +(?P<flags>[\S\s]+)')
 
         # Addresses, Flags: Is-Preferred Is-Primary
-        p32 = re.compile(r'^Addresses, +Flags: +(?P<flags>[\S\s]+)$')
+        p32 = regex_engine.compile(r'^Addresses, +Flags: +(?P<flags>[\S\s]+)$')
 
         # Addresses
-        p32_1 = re.compile(r'^Addresses$')
+        p32_1 = regex_engine.compile(r'^Addresses$')
 
         # Destination: 10.189.5.92/30, Local: 10.189.5.93, Broadcast: 10.189.5.95
-        p33 = re.compile(r'^Destination: +(?P<ifa_destination>\S+), +Local: +(?P<ifa_local>\S+)(, +Broadcast: +(?P<ifa_broadcast>\S+))?(, +Generation: +(?P<generation>\S+))?$')
+        p33 = regex_engine.compile(r'^Destination: +(?P<ifa_destination>\S+), +Local: +(?P<ifa_local>\S+)(, +Broadcast: +(?P<ifa_broadcast>\S+))?(, +Generation: +(?P<generation>\S+))?$')
 
         # Broadcast: 10.0.0.255, Generation: 8336
-        p33_1 = re.compile(r'^Broadcast: +(?P<ifa_broadcast>\S+), +Generation: +(?P<generation>\S+)$')
+        p33_1 = regex_engine.compile(r'^Broadcast: +(?P<ifa_broadcast>\S+), +Generation: +(?P<generation>\S+)$')
 
         # Bandwidth: 0
-        p34 = re.compile(r'^Bandwidth: +(?P<logical_interface_bandwidth>\S+)$')
+        p34 = regex_engine.compile(r'^Bandwidth: +(?P<logical_interface_bandwidth>\S+)$')
 
         # Local: fe80::250:560f:fc8d:7c08
-        p35 = re.compile(r'^Local: +(?P<ifa_local>\S+)$')
+        p35 = regex_engine.compile(r'^Local: +(?P<ifa_local>\S+)$')
 
         # IPv6 transit statistics:
-        p36 = re.compile(r'^IPv6 +transit +statistics:$')
+        p36 = regex_engine.compile(r'^IPv6 +transit +statistics:$')
 
         # Dropped traffic statistics due to STP State:
-        p37 = re.compile(r'^Dropped +traffic +statistics +due +to +'
+        p37 = regex_engine.compile(r'^Dropped +traffic +statistics +due +to +'
             r'STP +State:$')
 
         # Transit statistics:
-        p38 = re.compile(r'^Transit +statistics:$')
+        p38 = regex_engine.compile(r'^Transit +statistics:$')
 
         # Hold-times     : Up 2000 ms, Down 0 ms
-        p39 = re.compile(r'^Hold-times +: +Up +\d+ +ms, +Down +\d+ +ms$')
+        p39 = regex_engine.compile(r'^Hold-times +: +Up +\d+ +ms, +Down +\d+ +ms$')
 
         # Damping        : half-life: 0 sec, max-suppress: 0 sec, reuse: 0, suppress: 0, state: unsuppressed
-        p40 = re.compile(r'^Damping +: +half-life: +\d+ +sec, +max-suppress: +'
+        p40 = regex_engine.compile(r'^Damping +: +half-life: +\d+ +sec, +max-suppress: +'
             r'\d+ +sec, +reuse: +\d+, +suppress: +\d+, +state: +\S+$')
 
         # Input errors:
-        p41 = re.compile(r'^Input +errors:$')
+        p41 = regex_engine.compile(r'^Input +errors:$')
 
         # Output errors:
-        p42 = re.compile(r'^Output +errors:$')
+        p42 = regex_engine.compile(r'^Output +errors:$')
 
         # Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0, L3 incompletes: 0, L2 channel errors: 0,
 
@@ -1273,207 +1274,207 @@ class ShowInterfaces(ShowInterfacesSchema):
         # L3 incompletes: 0, L2 channel errors: 0, L2 mismatch timeouts: 0,
         # FIFO errors: 0, Resource errors: 0
         # Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Giants: 0, Policed discards: 0, Resource errors: 0
-        p43 = re.compile(r'^(Errors: +(?P<input_errors>\d+),)?'
-                           r'( *Drops: +(?P<input_drops>\d+),)?'
-                           r'( *Framing +errors: +(?P<framing_errors>\d+),)?'
-                           r'( *Runts: +(?P<input_runts>\d+),)?'
-                           r'( *Giants: +(?P<input_giants>\d+),)?'
-                           r'( *Policed +discards: +(?P<input_discards>\d+),)?'
-                           r'( *L3 +incompletes: +(?P<input_l3_incompletes>\d+),)?'
-                           r'( *L2 +channel +errors: +(?P<input_l2_channel_errors>\d+),)?'
-                           r'( *L2 +mismatch +timeouts: +(?P<input_l2_mismatch_timeouts>\d+),?)?'
-                           r'( *FIFO +errors: +(?P<input_fifo_errors>\d+),?)?'
-                           r'( *Resource +errors: +(?P<input_resource_errors>\d+))?$')
+        p43 = regex_engine.compile(r'^(Errors: +(?P<input_errors>\d+),)?'
+                                     r'( *Drops: +(?P<input_drops>\d+),)?'
+                                     r'( *Framing +errors: +(?P<framing_errors>\d+),)?'
+                                     r'( *Runts: +(?P<input_runts>\d+),)?'
+                                     r'( *Giants: +(?P<input_giants>\d+),)?'
+                                     r'( *Policed +discards: +(?P<input_discards>\d+),)?'
+                                     r'( *L3 +incompletes: +(?P<input_l3_incompletes>\d+),)?'
+                                     r'( *L2 +channel +errors: +(?P<input_l2_channel_errors>\d+),)?'
+                                     r'( *L2 +mismatch +timeouts: +(?P<input_l2_mismatch_timeouts>\d+),?)?'
+                                     r'( *FIFO +errors: +(?P<input_fifo_errors>\d+),?)?'
+                                     r'( *Resource +errors: +(?P<input_resource_errors>\d+))?$')
 
         # Carrier transitions: 1, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0, FIFO errors: 0, HS link CRC errors: 0,
         # Carrier transitions: 0, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0,
         # Carrier transitions: 0, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0, FIFO errors: 0, HS link CRC errors: 0, MTU errors: 0, Resource errors: 0
-        p44_1 = re.compile(r'^Carrier +transitions: +(?P<carrier_transitions>\d+),'
-                           r' +Errors: +(?P<output_errors>\d+),'
-                           r' +Drops: +(?P<output_drops>\d+),'
-                           r'( +Collisions: +(?P<output_collisions>\d+),)?'
-                           r'( +Aged+ packets: +(?P<aged_packets>\d+),)?'
-                           r'(( +FIFO +errors: +(?P<output_fifo_errors>\d+),)?'
-                           r' +HS +link +CRC +errors: +(?P<hs_link_crc_errors>\d+),)?'
-                           r'( +MTU +errors: +(?P<mtu_errors>\d+),?)?'
-                           r'( +Resource +errors: +(?P<output_resource_errors>\d+))?$')
+        p44_1 = regex_engine.compile(r'^Carrier +transitions: +(?P<carrier_transitions>\d+),'
+                                     r' +Errors: +(?P<output_errors>\d+),'
+                                     r' +Drops: +(?P<output_drops>\d+),'
+                                     r'( +Collisions: +(?P<output_collisions>\d+),)?'
+                                     r'( +Aged+ packets: +(?P<aged_packets>\d+),)?'
+                                     r'(( +FIFO +errors: +(?P<output_fifo_errors>\d+),)?'
+                                     r' +HS +link +CRC +errors: +(?P<hs_link_crc_errors>\d+),)?'
+                                     r'( +MTU +errors: +(?P<mtu_errors>\d+),?)?'
+                                     r'( +Resource +errors: +(?P<output_resource_errors>\d+))?$')
 
         # MTU errors: 0, Resource errors: 0
-        p44_2 = re.compile(r'^MTU +errors: +(?P<mtu_errors>\d+), +Resource +'
+        p44_2 = regex_engine.compile(r'^MTU +errors: +(?P<mtu_errors>\d+), +Resource +'
             r'errors: +(?P<output_resource_errors>\d+)$')
 
         # FIFO errors: 0, HS link CRC errors: 0, MTU errors: 0, Resource errors: 0
-        p44_3 = re.compile(r'^FIFO +errors: +(?P<output_fifo_errors>\d+), +'
-                           r'(HS +link +CRC +errors: +(?P<hs_link_crc_errors>\d+),)?'
-                           r'( +MTU +errors: +(?P<mtu_errors>\d+),?)?'
-                           r'( +Resource +errors: +(?P<output_resource_errors>\d+))?')
+        p44_3 = regex_engine.compile(r'^FIFO +errors: +(?P<output_fifo_errors>\d+), +'
+                                     r'(HS +link +CRC +errors: +(?P<hs_link_crc_errors>\d+),)?'
+                                     r'( +MTU +errors: +(?P<mtu_errors>\d+),?)?'
+                                     r'( +Resource +errors: +(?P<output_resource_errors>\d+))?')
 
         # Total octets                   21604601324      16828244544
-        p45 = re.compile(r'^Total +octets +(?P<input_bytes>\d+) +'
+        p45 = regex_engine.compile(r'^Total +octets +(?P<input_bytes>\d+) +'
             r'(?P<output_bytes>\d+)$')
 
         # MAC statistics:                      Receive         Transmit
-        p45_1 = re.compile(r'^MAC +statistics: +Receive +Transmit$')
+        p45_1 = regex_engine.compile(r'^MAC +statistics: +Receive +Transmit$')
 
         # Total packets                    133726919        129183374
-        p46 = re.compile(r'^Total +packets +(?P<input_packets>\d+) +'
+        p46 = regex_engine.compile(r'^Total +packets +(?P<input_packets>\d+) +'
             r'(?P<output_packets>\d+)')
 
         # Unicast packets                  133726908        129183361
-        p47 = re.compile(r'^Unicast +packets +(?P<input_unicasts>\d+) +'
+        p47 = regex_engine.compile(r'^Unicast +packets +(?P<input_unicasts>\d+) +'
             r'(?P<output_unicasts>\d+)$')
 
         # Broadcast packets                        0                0
-        p48 = re.compile(r'^Broadcast +packets +(?P<input_broadcasts>\d+) +'
+        p48 = regex_engine.compile(r'^Broadcast +packets +(?P<input_broadcasts>\d+) +'
             r'(?P<output_broadcasts>\d+)$')
 
         # Multicast packets                        0                0
-        p49 = re.compile(r'^Multicast +packets +(?P<input_multicasts>\d+) +'
+        p49 = regex_engine.compile(r'^Multicast +packets +(?P<input_multicasts>\d+) +'
             r'(?P<output_multicasts>\d+)$')
 
         # CRC/Align errors                         0                0
-        p50 = re.compile(r'^CRC\/Align +errors +(?P<input_crc_errors>\d+) +'
+        p50 = regex_engine.compile(r'^CRC\/Align +errors +(?P<input_crc_errors>\d+) +'
             r'(?P<output_crc_errors>\d+)$')
 
         # FIFO errors                              0                0
-        p51 = re.compile(r'^FIFO +errors +(?P<input_fifo_errors>\d+) +'
+        p51 = regex_engine.compile(r'^FIFO +errors +(?P<input_fifo_errors>\d+) +'
             r'(?P<output_fifo_errors>\d+)$')
 
         # MAC control frames                       0                0
-        p52 = re.compile(r'^MAC +control +frames +(?P<input_mac_control_frames>\d+) +'
+        p52 = regex_engine.compile(r'^MAC +control +frames +(?P<input_mac_control_frames>\d+) +'
             r'(?P<output_mac_control_frames>\d+)$')
 
         # MAC pause frames                         0                0
-        p53 = re.compile(r'^MAC +pause +frames +(?P<input_mac_pause_frames>\d+) +'
+        p53 = regex_engine.compile(r'^MAC +pause +frames +(?P<input_mac_pause_frames>\d+) +'
             r'(?P<output_mac_pause_frames>\d+)$')
 
         # Oversized frames                         0
-        p54 = re.compile(r'^Oversized +frames +(?P<input_oversized_frames>\d+)$')
+        p54 = regex_engine.compile(r'^Oversized +frames +(?P<input_oversized_frames>\d+)$')
 
         # Jabber frames                            0
-        p56 = re.compile(r'^Jabber +frames +(?P<input_jabber_frames>\d+)$')
+        p56 = regex_engine.compile(r'^Jabber +frames +(?P<input_jabber_frames>\d+)$')
 
         # Fragment frames                          0
-        p57 = re.compile(r'^Fragment +frames +(?P<input_fragment_frames>\d+)$')
+        p57 = regex_engine.compile(r'^Fragment +frames +(?P<input_fragment_frames>\d+)$')
 
         # VLAN tagged frames                       0
-        p58 = re.compile(r'^VLAN +tagged +frames +(?P<input_vlan_tagged_frames>\d+)$')
+        p58 = regex_engine.compile(r'^VLAN +tagged +frames +(?P<input_vlan_tagged_frames>\d+)$')
 
         # Code violations                          0
-        p59 = re.compile(r'^Code +violations +(?P<input_code_violations>\d+)$')
+        p59 = regex_engine.compile(r'^Code +violations +(?P<input_code_violations>\d+)$')
 
         # Total errors                             0                0
-        p60 = re.compile(r'^Total +errors +(?P<input_total_errors>\d+) +(?P<output_total_errors>\d+)$')
+        p60 = regex_engine.compile(r'^Total +errors +(?P<input_total_errors>\d+) +(?P<output_total_errors>\d+)$')
 
         # Label-switched interface (LSI) traffic statistics:
-        p61 = re.compile(r'^Label-switched +interface +\(LSI\) +traffic +statistics:$')
+        p61 = regex_engine.compile(r'^Label-switched +interface +\(LSI\) +traffic +statistics:$')
 
         # Ingress queues: 8 supported, 4 in use
         # Egress queues: 8 supported, 4 in use
-        p62 = re.compile(r'^((?P<intf_cos_queue_type>(Ingress|Egress) +queues)): +(?P<intf_cos_num_queues_supported>\d+) +supported, +(?P<intf_cos_num_queues_in_use>\d+) +in +use$')
+        p62 = regex_engine.compile(r'^((?P<intf_cos_queue_type>(Ingress|Egress) +queues)): +(?P<intf_cos_num_queues_supported>\d+) +supported, +(?P<intf_cos_num_queues_in_use>\d+) +in +use$')
 
         # 0                                0                    0                    0
-        p63 = re.compile(r'^(?P<queue_number>\d+) +(?P<queue_counters_queued_packets>\d+) +'
+        p63 = regex_engine.compile(r'^(?P<queue_number>\d+) +(?P<queue_counters_queued_packets>\d+) +'
             r'(?P<queue_counters_trans_packets>\d+) +(?P<drop_packets>\d+)$')
 
         # Hold-times     : Up 0 ms, Down 0 ms
-        p64 = re.compile(r'^Hold-times +: +Up +(?P<up_hold_time>\d+) +ms, +Down +(?P<down_hold_time>\d+) +ms$')
+        p64 = regex_engine.compile(r'^Hold-times +: +Up +(?P<up_hold_time>\d+) +ms, +Down +(?P<down_hold_time>\d+) +ms$')
 
         # Statistics last cleared: 2020-10-14 13:18:51 EST (00:12:30 ago)
-        p65 = re.compile(r'^Statistics +last +cleared: +(?P<statistics_cleared>[\S\s]+)$')
+        p65 = regex_engine.compile(r'^Statistics +last +cleared: +(?P<statistics_cleared>[\S\s]+)$')
 
         # 0                   best-effort
         # 1                   expedited-forwarding
         # 2                   assured-forwarding
         # 3                   network-control
-        p66 = re.compile(r'^(?P<queue_number>\d+) +(?P<forwarding_class_name>best-effort|expedited-forwarding|assured-forwarding|network-control)$')
+        p66 = regex_engine.compile(r'^(?P<queue_number>\d+) +(?P<forwarding_class_name>best-effort|expedited-forwarding|assured-forwarding|network-control)$')
 
         # Filter statistics:
-        p67 = re.compile(r'^Filter +statistics:$')
+        p67 = regex_engine.compile(r'^Filter +statistics:$')
 
         # Input packet count                   38089
-        p68 = re.compile(r'^Input +packet +count +(?P<input_packets>\d+)$')
+        p68 = regex_engine.compile(r'^Input +packet +count +(?P<input_packets>\d+)$')
 
         # Input packet rejects                    24
-        p69 = re.compile(r'^Input +packet +rejects +(?P<input_reject_count>\d+)$')
+        p69 = regex_engine.compile(r'^Input +packet +rejects +(?P<input_reject_count>\d+)$')
 
         # Input DA rejects                         0
-        p70 = re.compile(r'^Input +DA +rejects +(?P<input_reject_da_count>\d+)$')
+        p70 = regex_engine.compile(r'^Input +DA +rejects +(?P<input_reject_da_count>\d+)$')
 
         # Input SA rejects                         0
-        p71 = re.compile(r'^Input +SA +rejects +(?P<input_reject_sa_count>\d+)$')
+        p71 = regex_engine.compile(r'^Input +SA +rejects +(?P<input_reject_sa_count>\d+)$')
 
         # Output packet count                                    8798
-        p72 = re.compile(r'^Output +packet +count +(?P<output_packets>\d+)$')
+        p72 = regex_engine.compile(r'^Output +packet +count +(?P<output_packets>\d+)$')
 
         # Output packet pad count                                   0
-        p73 = re.compile(r'^Output +packet +pad +count +(?P<output_packet_pad_count>\d+)$')
+        p73 = regex_engine.compile(r'^Output +packet +pad +count +(?P<output_packet_pad_count>\d+)$')
 
         # Output packet error count                                 0
-        p74 = re.compile(r'^Output +packet +error +count +(?P<output_packet_error_count>\d+)$')
+        p74 = regex_engine.compile(r'^Output +packet +error +count +(?P<output_packet_error_count>\d+)$')
 
         # CAM destination filters: 0, CAM source filters: 0
-        p75 = re.compile(r'^CAM +destination +filters: (?P<cam_destination_filter_count>\d+), +CAM +source +filters: (?P<cam_source_filter_count>\d+)$')
+        p75 = regex_engine.compile(r'^CAM +destination +filters: (?P<cam_destination_filter_count>\d+), +CAM +source +filters: (?P<cam_source_filter_count>\d+)$')
 
         # Destination slot: 0 (0x00)
-        p76 = re.compile(r'^Destination +slot: +(?P<destination_slot>\d+) +(?P<destination_mask>\S+)$')
+        p76 = regex_engine.compile(r'^Destination +slot: +(?P<destination_slot>\d+) +(?P<destination_mask>\S+)$')
 
         # 0 best-effort            95     9500000000    95              0      low    none
-        p77 = re.compile(r'^(?P<cos_queue_number>\d+) +(?P<cos_queue_forwarding_class>\S+) +(?P<cos_queue_bandwidth>\d+) +(?P<cos_queue_bandwidth_bps>\d+) +(?P<cos_queue_buffer>\d+) +(?P<cos_queue_buffer_bytes>\d+) +(?P<cos_queue_priority>\w+) +(?P<cos_queue_limit>\w+)$')
+        p77 = regex_engine.compile(r'^(?P<cos_queue_number>\d+) +(?P<cos_queue_forwarding_class>\S+) +(?P<cos_queue_bandwidth>\d+) +(?P<cos_queue_bandwidth_bps>\d+) +(?P<cos_queue_buffer>\d+) +(?P<cos_queue_buffer_bytes>\d+) +(?P<cos_queue_priority>\w+) +(?P<cos_queue_limit>\w+)$')
 
         # Direction : Output
-        p78 = re.compile(r'^Direction : +(?P<cos_direction>\S+)$')
+        p78 = regex_engine.compile(r'^Direction : +(?P<cos_direction>\S+)$')
 
         # Generation: 9549, Route table: 0
-        p79 = re.compile(r'^Generation: +(?P<generation>\d+)(, +Route +table: +(?P<route_table>\d+))?$')
+        p79 = regex_engine.compile(r'^Generation: +(?P<generation>\d+)(, +Route +table: +(?P<route_table>\d+))?$')
 
         # Policer: Input: GE_1M-xe-0/1/7.0-log_int-i, Output: GE_1M-xe-0/1/7.0-log_int-o
-        p80 = re.compile(r'^Policer: +Input: +(?P<policer_input>\S+)(, +Output: +(?P<policer_output>\S+))?$')
+        p80 = regex_engine.compile(r'^Policer: +Input: +(?P<policer_input>\S+)(, +Output: +(?P<policer_output>\S+))?$')
 
         # Bundle:
         # Link:
-        p81 = re.compile(r'^(?P<lag_int_type>(Bundle)|(Link)):$')
+        p81 = regex_engine.compile(r'^(?P<lag_int_type>(Bundle)|(Link)):$')
 
         # xe-0/1/10.0
         # xe-0/1/10
-        p81_1 = re.compile(r'^(?P<name>[a-z]{2}-\d+/\d+/\d+(\.\d+)?)$')
+        p81_1 = regex_engine.compile(r'^(?P<name>[a-z]{2}-\d+/\d+/\d+(\.\d+)?)$')
 
         # Input :           225          0         14514         1952
         # Output:            16          0          1188            0
-        p82 = re.compile(r'^(?P<in_out>(Input\s*)|(Output)):\s+(?P<packets>\d+)\s+(?P<pps>\d+)\s+(?P<bytes>\d+)\s+(?P<bps>\d+)$')
+        p82 = regex_engine.compile(r'^(?P<in_out>(Input\s*)|(Output)):\s+(?P<packets>\d+)\s+(?P<pps>\d+)\s+(?P<bytes>\d+)\s+(?P<bps>\d+)$')
 
         # Adaptive Adjusts:          0
         # Adaptive Scans  :          0
         # Adaptive Updates:          0
-        p83 = re.compile(r'^(?P<adaptive>Adaptive\s+(Adjusts|Scans|Updates))\s*:\s+(?P<adaptive_value>\d+)$')
+        p83 = regex_engine.compile(r'^(?P<adaptive>Adaptive\s+(Adjusts|Scans|Updates))\s*:\s+(?P<adaptive_value>\d+)$')
 
         # Aggregate member links: 2
-        p84 = re.compile(r'^Aggregate\s+member\s+links:\s+(?P<aggregate_member_count>\d+)$')
+        p84 = regex_engine.compile(r'^Aggregate\s+member\s+links:\s+(?P<aggregate_member_count>\d+)$')
 
         # LACP info:        Role     System             System       Port     Port    Port
         # LACP Statistics:       LACP Rx     LACP Tx   Unknown Rx   Illegal Rx
         # Marker Statistics:   Marker Rx     Resp Tx   Unknown Rx   Illegal Rx
-        p85 = re.compile(r'^(?P<lacp_flag>(LACP info)|(LACP Statistics)|(Marker Statistics)):\s+.+$')
+        p85 = regex_engine.compile(r'^(?P<lacp_flag>(LACP info)|(LACP Statistics)|(Marker Statistics)):\s+.+$')
 
         # ge-0/0/6.0     Actor        127  2c:6b:f5:ff:cf:97        127        2       1
         # ge-0/0/6.0   Partner        127  2c:6b:f5:ff:08:d8        127        2       1
-        p86 = re.compile(r'^(?P<name>\S+)\s+(?P<lacp_role>\S+)\s+(?P<lacp_sys_priority>\d+)\s+(?P<lacp_system_id>\S+)\s+(?P<lacp_port_priority>\d+)\s+(?P<lacp_port_number>\d+)\s+(?P<lacp_port_key>\d+)$')
+        p86 = regex_engine.compile(r'^(?P<name>\S+)\s+(?P<lacp_role>\S+)\s+(?P<lacp_sys_priority>\d+)\s+(?P<lacp_system_id>\S+)\s+(?P<lacp_port_priority>\d+)\s+(?P<lacp_port_number>\d+)\s+(?P<lacp_port_key>\d+)$')
 
         # For LACP Statistics
         # ge-0/0/6.0                 0           0            0            0
-        p87 = re.compile(r'(?P<name>\S+)\s+(?P<lacp_rx_packets>\d+)\s+(?P<lacp_tx_packets>\d+)\s+(?P<unknown_rx_packets>\d+)\s+(?P<illegal_rx_packets>\d+)$')
+        p87 = regex_engine.compile(r'(?P<name>\S+)\s+(?P<lacp_rx_packets>\d+)\s+(?P<lacp_tx_packets>\d+)\s+(?P<unknown_rx_packets>\d+)\s+(?P<illegal_rx_packets>\d+)$')
 
         # For Marker Statistics
         # ge-0/0/6.0                 0           0            0            0
-        p88 = re.compile(r'(?P<name>\S+)\s+(?P<marker_rx_packets>\d+)\s+(?P<marker_response_tx_packets>\d+)\s+(?P<unknown_rx_packets>\d+)\s+(?P<illegal_rx_packets>\d+)$')
+        p88 = regex_engine.compile(r'(?P<name>\S+)\s+(?P<marker_rx_packets>\d+)\s+(?P<marker_response_tx_packets>\d+)\s+(?P<unknown_rx_packets>\d+)\s+(?P<illegal_rx_packets>\d+)$')
 
         # Primary         Active
         # Backup          Down
         # Standby         Down
-        p89 = re.compile(r'^(?P<list_type>(Primary)|(Backup)|(Standby))\s+(?P<list_status>(Active)|(Down))$')
+        p89 = regex_engine.compile(r'^(?P<list_type>(Primary)|(Backup)|(Standby))\s+(?P<list_status>(Active)|(Down))$')
 
         # ge-0/0/7        Up
-        p90 = re.compile(r'^(?P<if_child_name>\S+)\s+(?P<if_status>(Up)|(Down))$')
+        p90 = regex_engine.compile(r'^(?P<if_child_name>\S+)\s+(?P<if_status>(Up)|(Down))$')
 
         cnt = 0
         queue_name = ''
@@ -2419,7 +2420,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # xe-0/1/10.0
             # xe-0/1/10
-            p81_1 = re.compile(r'^(?P<name>[a-z]{2}-\d+/\d+/\d+(\.\d+)?)$')
+            p81_1 = regex_engine.compile(r'^(?P<name>[a-z]{2}-\d+/\d+/\d+(\.\d+)?)$')
             m = p81_1.match(line)
             if m and lag_int_type == 'Link':
                 in_out_dict = {}
@@ -2534,6 +2535,13 @@ class ShowInterfaces(ShowInterfacesSchema):
 class ShowInterfacesExtensive(ShowInterfaces):
     cli_command = ['show interfaces extensive',
         'show interfaces {interface} extensive']
+
+    def _get_command(self, interface=None):
+        if interface:
+            return 'show interfaces {interface} extensive'.format(
+                interface=interface)
+        return 'show interfaces extensive'
+
     def cli(self, interface=None, output=None):
 
         if not output:
@@ -2550,6 +2558,10 @@ class ShowInterfacesExtensive(ShowInterfaces):
 
 class ShowInterfacesExtensiveNoForwarding(ShowInterfacesExtensive):
     cli_command = ['show interfaces extensive no-forwarding']
+
+    def _get_command(self):
+        return 'show interfaces extensive no-forwarding'
+
     def cli(self, output=None):
 
         if not output:
@@ -2701,120 +2713,120 @@ class ShowInterfacesStatistics(ShowInterfacesStatisticsSchema):
         ret_dict = {}
 
         # Physical interface: ge-0/0/0, Enabled, Physical link is Up
-        p1 = re.compile(r'^Physical +interface: +(?P<name>[^\s,]+), +'
-                        r'(?P<admin_status>[^\s,]+), +Physical +link +is +'
-                        r'(?P<oper_status>\S+)$')
+        p1 = regex_engine.compile(r'^Physical +interface: +(?P<name>[^\s,]+), +'
+                                  r'(?P<admin_status>[^\s,]+), +Physical +link +is +'
+                                  r'(?P<oper_status>\S+)$')
 
         # Interface index: 133, SNMP ifIndex: 506
-        p2 = re.compile(r'^Interface +index: +(?P<local_index>\d+), +'
-                        r'SNMP +ifIndex: +(?P<snmp_index>\d+)$')
+        p2 = regex_engine.compile(r'^Interface +index: +(?P<local_index>\d+), +'
+                                  r'SNMP +ifIndex: +(?P<snmp_index>\d+)$')
 
         # Link-level type: Ethernet, MTU: 1514, Link-mode: Full-duplex, Speed: 1000mbps,
-        p3 = re.compile(r'^Link-level +type: +(?P<link_level_type>[^\s,]+), +'
-                        r'MTU: +(?P<mtu>\d+), +Link-mode: +(?P<link_mode>[^\s,]+), +'
-                        r'Speed: +(?P<speed>[^\s,]+),$')
+        p3 = regex_engine.compile(r'^Link-level +type: +(?P<link_level_type>[^\s,]+), +'
+                                  r'MTU: +(?P<mtu>\d+), +Link-mode: +(?P<link_mode>[^\s,]+), +'
+                                  r'Speed: +(?P<speed>[^\s,]+),$')
 
         # BPDU Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
-        p4 = re.compile(r'^BPDU +Error: +(?P<bpdu_error>[^\s,]+), +'
-                        r'MAC-REWRITE +Error: +(?P<l2pt_error>[^\s,]+), +'
-                        r'Loopback: +(?P<loopback>[^\s,]+),$')
+        p4 = regex_engine.compile(r'^BPDU +Error: +(?P<bpdu_error>[^\s,]+), +'
+                                  r'MAC-REWRITE +Error: +(?P<l2pt_error>[^\s,]+), +'
+                                  r'Loopback: +(?P<loopback>[^\s,]+),$')
 
         # Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled,
-        p5 = re.compile(r'^Source +filtering: +(?P<source_filtering>[^\s,]+), +'
-                        r'Flow +control: +(?P<if_flow_control>[^\s,]+), +'
-                        r'Auto-negotiation: +(?P<if_auto_negotiation>[^\s,]+),$')
+        p5 = regex_engine.compile(r'^Source +filtering: +(?P<source_filtering>[^\s,]+), +'
+                                  r'Flow +control: +(?P<if_flow_control>[^\s,]+), +'
+                                  r'Auto-negotiation: +(?P<if_auto_negotiation>[^\s,]+),$')
 
         # Remote fault: Online
-        p6 = re.compile(r'^Remote +fault: +(?P<if_remote_fault>[^\s,]+)$')
+        p6 = regex_engine.compile(r'^Remote +fault: +(?P<if_remote_fault>[^\s,]+)$')
 
         # Device flags   : Present Running
-        p7 = re.compile(r'^Device +flags *: +((?P<ifdf_none>None+) *)?'
-                        r'((?P<ifdf_present>Present+) *)?'
-                        r'((?P<ifdf_running>Running+) *)?$')
+        p7 = regex_engine.compile(r'^Device +flags *: +((?P<ifdf_none>None+) *)?'
+                                  r'((?P<ifdf_present>Present+) *)?'
+                                  r'((?P<ifdf_running>Running+) *)?$')
 
         # Interface flags: SNMP-Traps Internal: 0x4000
-        p8 = re.compile(r'^Interface +flags: +(?P<iff_snmp_traps>\S+) +'
-                        r'Internal: +(?P<internal_flags>\S+)$')
+        p8 = regex_engine.compile(r'^Interface +flags: +(?P<iff_snmp_traps>\S+) +'
+                                  r'Internal: +(?P<internal_flags>\S+)$')
 
         # Link flags     : None
-        p9 = re.compile(r'^Link +flags *: +((?P<ifmf_none>None) *)?$')
+        p9 = regex_engine.compile(r'^Link +flags *: +((?P<ifmf_none>None) *)?$')
 
         # CoS queues     : 8 supported, 8 maximum usable queues
-        p10 = re.compile(r'^CoS +queues *: +(?P<physical_interface_cos_hw_max_queues>\d+) +'
-                         r'supported, +(?P<physical_interface_cos_use_max_queues>\d+) +'
-                         r'maximum +usable +queues$')
+        p10 = regex_engine.compile(r'^CoS +queues *: +(?P<physical_interface_cos_hw_max_queues>\d+) +'
+                                   r'supported, +(?P<physical_interface_cos_use_max_queues>\d+) +'
+                                   r'maximum +usable +queues$')
 
         # Current address: 5e:00:40:ff:00:00, Hardware address: 5e:00:40:ff:00:00
-        p11 = re.compile(r'^Current +address: +(?P<current_physical_address>[^\s,]+), +'
-                         r'Hardware +address: +(?P<hardware_physical_address>[^\s,]+)$')
+        p11 = regex_engine.compile(r'^Current +address: +(?P<current_physical_address>[^\s,]+), +'
+                                   r'Hardware +address: +(?P<hardware_physical_address>[^\s,]+)$')
 
         # Last flapped   : 2020-06-22 22:33:51 EST (4d 06:59 ago)
-        p12 = re.compile(r'^Last +flapped *: +(?P<interface_flapped>.*)$')
+        p12 = regex_engine.compile(r'^Last +flapped *: +(?P<interface_flapped>.*)$')
 
         # Statistics last cleared: 2020-06-27 05:22:04 EST (00:11:36 ago)
-        p13 = re.compile(r'^Statistics last cleared: +(?P<statistics_cleared>.*)$')
+        p13 = regex_engine.compile(r'^Statistics last cleared: +(?P<statistics_cleared>.*)$')
 
         # Input rate     : 2144 bps (4 pps)
-        p14 = re.compile(r'^Input rate *: +(?P<input_bps>\d+) +bps +'
-                         r'\((?P<input_pps>\d+) +pps\)$')
+        p14 = regex_engine.compile(r'^Input rate *: +(?P<input_bps>\d+) +bps +'
+                                   r'\((?P<input_pps>\d+) +pps\)$')
 
         # Output rate    : 0 bps (0 pps)
-        p15 = re.compile(r'^Output rate *: +(?P<output_bps>\d+) +bps +'
-                         r'\((?P<output_pps>\d+) +pps\)$')
+        p15 = regex_engine.compile(r'^Output rate *: +(?P<output_bps>\d+) +bps +'
+                                   r'\((?P<output_pps>\d+) +pps\)$')
 
         # Input errors: 552, Output errors: 0
-        p16 = re.compile(r'^Input errors: +(?P<input_error_count>\d+), +'
-                         r'Output errors: +(?P<output_error_count>\d+)$')
+        p16 = regex_engine.compile(r'^Input errors: +(?P<input_error_count>\d+), +'
+                                   r'Output errors: +(?P<output_error_count>\d+)$')
 
         # Active alarms  : None
-        p17 = re.compile(r'^Active +alarms *: +(?P<alarm_not_present>None)?$')
+        p17 = regex_engine.compile(r'^Active +alarms *: +(?P<alarm_not_present>None)?$')
 
         # Active defects : None
-        p18 = re.compile(r'^Active +defects *: +(?P<alarm_not_present>None)?$')
+        p18 = regex_engine.compile(r'^Active +defects *: +(?P<alarm_not_present>None)?$')
 
         # Interface transmit statistics: Disabled
-        p19 = re.compile(r'^Interface +transmit +statistics: +'
-                         r'(?P<interface_transmit_statistics>\S+)$')
+        p19 = regex_engine.compile(r'^Interface +transmit +statistics: +'
+                                   r'(?P<interface_transmit_statistics>\S+)$')
 
         # Logical interface ge-0/0/0.0 (Index 70) (SNMP ifIndex 507)
-        p20 = re.compile(r'^Logical +interface +(?P<name>\S+) +'
-                         r'\(Index +(?P<local_index>\d+)\) +'
-                         r'\(SNMP +ifIndex +(?P<snmp_index>\d+)\)$')
+        p20 = regex_engine.compile(r'^Logical +interface +(?P<name>\S+) +'
+                                   r'\(Index +(?P<local_index>\d+)\) +'
+                                   r'\(SNMP +ifIndex +(?P<snmp_index>\d+)\)$')
 
         # Flags: SNMP-Traps 0x4000 Encapsulation: ENET2
-        p21 = re.compile(r'^Flags: +(?P<iff_snmp_traps>SNMP-Traps) +'
-                         r'(?P<internal_flags>\S+) +Encapsulation: +'
-                         r'(?P<encapsulation>\S+)$')
+        p21 = regex_engine.compile(r'^Flags: +(?P<iff_snmp_traps>SNMP-Traps) +'
+                                   r'(?P<internal_flags>\S+) +Encapsulation: +'
+                                   r'(?P<encapsulation>\S+)$')
 
         # Input packets : 1684
-        p22 = re.compile(r'^Input +packets *: +(?P<input_packets>\d+)$')
+        p22 = regex_engine.compile(r'^Input +packets *: +(?P<input_packets>\d+)$')
 
         # Output packets: 49
-        p23 = re.compile(r'^Output +packets *: +(?P<output_packets>\d+)$')
+        p23 = regex_engine.compile(r'^Output +packets *: +(?P<output_packets>\d+)$')
 
         # Security: Zone: trust
-        p24 = re.compile(r'^Security: +Zone: (?P<logical_interface_zone_name>\S+)$')
+        p24 = regex_engine.compile(r'^Security: +Zone: (?P<logical_interface_zone_name>\S+)$')
 
         # Allowed host-inbound traffic : dhcp http https ssh telnet
-        p25 = re.compile(r'^Allowed +host-inbound +traffic *: +'
-                         r'(?P<inbound_dhcp>dhcp)( +)?(?P<inbound_http>http)( +)?'
-                         r'(?P<inbound_https>https)( +)?(?P<inbound_ssh>ssh)( +)?'
-                         r'(?P<inbound_telnet>telnet)( +)?$')
+        p25 = regex_engine.compile(r'^Allowed +host-inbound +traffic *: +'
+                                   r'(?P<inbound_dhcp>dhcp)( +)?(?P<inbound_http>http)( +)?'
+                                   r'(?P<inbound_https>https)( +)?(?P<inbound_ssh>ssh)( +)?'
+                                   r'(?P<inbound_telnet>telnet)( +)?$')
 
         # Protocol inet, MTU: 1500
-        p26 = re.compile(r'^Protocol +(?P<address_family_name>[^\s,]+), +MTU: +(?P<mtu>\S+)$')
+        p26 = regex_engine.compile(r'^Protocol +(?P<address_family_name>[^\s,]+), +MTU: +(?P<mtu>\S+)$')
 
         # Flags: Sendbcast-pkt-to-re, Is-Primary
-        p27 = re.compile(r'^Flags: +(?P<ifff_sendbcast_pkt_to_re>Sendbcast-pkt-to-re)'
-                         r'(, +)?(?P<ifff_is_primary>Is-Primary)?$')
+        p27 = regex_engine.compile(r'^Flags: +(?P<ifff_sendbcast_pkt_to_re>Sendbcast-pkt-to-re)'
+                                   r'(, +)?(?P<ifff_is_primary>Is-Primary)?$')
 
         # Addresses, Flags: Is-Preferred Is-Primary
-        p28 = re.compile(r'^Addresses(, Flags: +)?(?P<flags>.+)?$')
+        p28 = regex_engine.compile(r'^Addresses(, Flags: +)?(?P<flags>.+)?$')
 
         # Destination: 172.16.1/24, Local: 172.16.1.55, Broadcast: 172.16.1.255
-        p29 = re.compile(r'^(Destination: +(?P<ifa_destination>[^\s,]+))?(, +)?'
-                         r'(Local: +(?P<ifa_local>[^\s,]+))?(, +)?'
-                         r'(Broadcast: +(?P<ifa_broadcast>[^\s,]+))?$')
+        p29 = regex_engine.compile(r'^(Destination: +(?P<ifa_destination>[^\s,]+))?(, +)?'
+                                   r'(Local: +(?P<ifa_local>[^\s,]+))?(, +)?'
+                                   r'(Broadcast: +(?P<ifa_broadcast>[^\s,]+))?$')
 
 
         for line in out.splitlines():
@@ -3140,12 +3152,12 @@ class ShowInterfacesPolicersInterface(ShowInterfacesPolicersInterfaceSchema):
         ret_dict = {}
 
         # ge-0/0/2        up    up
-        p1 =  re.compile(r'^(?P<interface>[a-zA-Z\-\d\/]+)((?P<physical_interface_value>[\.\d]+))? +(?P<admin>\w+) +(?:(?P<link>\w+))?$')
+        p1 =  regex_engine.compile(r'^(?P<interface>[a-zA-Z\-\d\/]+)((?P<physical_interface_value>[\.\d]+))? +(?P<admin>\w+) +(?:(?P<link>\w+))?$')
 
 
         # inet  GE_1M-ge-0/0/2.0-log_int-i GE_1M-ge-0/0/2.0-log_int-o
         # multiservice __default_arp_policer__
-        p2 =  re.compile(r'^(?P<policer_family>\w+) +(?P<policer_input>\S+)( +((?P<policer_output>\S+)))?$')
+        p2 =  regex_engine.compile(r'^(?P<policer_family>\w+) +(?P<policer_input>\S+)( +((?P<policer_output>\S+)))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3306,49 +3318,49 @@ class ShowInterfacesQueue(ShowInterfacesQueueSchema):
         # Regex patterns
         # -------------------------------------------------
         # Physical interface: ge-0/0/2, Enabled, Physical link is Up
-        p1 = re.compile(r"^Physical interface: (?P<name>\S+), Enabled, "
-                        r"Physical link is (?P<oper_status>\S+)$")
+        p1 = regex_engine.compile(r"^Physical interface: (?P<name>\S+), Enabled, "
+                                  r"Physical link is (?P<oper_status>\S+)$")
         #           Interface index: 143, SNMP ifIndex: 601
-        p2 = re.compile(r"^Interface index: (?P<local_index>\S+), "
-                       r"SNMP ifIndex: (?P<snmp_index>\S+)$")
+        p2 = regex_engine.compile(r"^Interface index: (?P<local_index>\S+), "
+                                 r"SNMP ifIndex: (?P<snmp_index>\S+)$")
         #           Description: to_ixia_2/4
-        p3 = re.compile(r"^Description: (?P<description>\S+)$")
+        p3 = regex_engine.compile(r"^Description: (?P<description>\S+)$")
         #         Forwarding classes: 16 supported, 5 in use
-        p4 = re.compile(r"^Forwarding classes: "
-                        r"(?P<intf_cos_forwarding_classes_supported>\S+) supported, "
-                        r"(?P<intf_cos_forwarding_classes_in_use>\S+) in use$")
+        p4 = regex_engine.compile(r"^Forwarding classes: "
+                                  r"(?P<intf_cos_forwarding_classes_supported>\S+) supported, "
+                                  r"(?P<intf_cos_forwarding_classes_in_use>\S+) in use$")
         #         Egress queues: 8 supported, 5 in use
-        p5 = re.compile(r"^(?P<intf_cos_queue_type>Egress queues): (?P<intf_cos_num_queues_supported>\S+) supported, "
-                        r"(?P<intf_cos_num_queues_in_use>\S+) in use$")
+        p5 = regex_engine.compile(r"^(?P<intf_cos_queue_type>Egress queues): (?P<intf_cos_num_queues_supported>\S+) supported, "
+                                  r"(?P<intf_cos_num_queues_in_use>\S+) in use$")
         #         Queue: 0, Forwarding classes: Bronze-FC
-        p6 = re.compile(r"^Queue: (?P<queue_number>\S+), "
-                        r"Forwarding classes: (?P<forwarding_class_name>\S+)$")
+        p6 = regex_engine.compile(r"^Queue: (?P<queue_number>\S+), "
+                                  r"Forwarding classes: (?P<forwarding_class_name>\S+)$")
         #           Queued:
         #             Packets              :            1470816406                     0 pps <-- rate
         #             Bytes                :          564883280956                     0 bps
         #           Transmitted:
-        p8 = re.compile(r"^(?P<name>Transmitted):$")
+        p8 = regex_engine.compile(r"^(?P<name>Transmitted):$")
         #             Packets              :            1470816406                      0 pps
         #             Bytes                :          564883280956                     0 bps
         #             Tail-dropped packets :                     0                     0 pps
         #             RED-dropped packets  :                     0                     0 pps
-        p9 = re.compile(r"^(?P<name>RED-dropped packets) +: +(?P<counts>\S+) +(?P<rates>\S+) +pps$")
+        p9 = regex_engine.compile(r"^(?P<name>RED-dropped packets) +: +(?P<counts>\S+) +(?P<rates>\S+) +pps$")
         #              Low                 :                     0                     0 pps
         #              Medium-low          :                     0                     0 pps
         #              Medium-high         :                     0                     0 pps
         #              High                :                     0                     0 pps
         #             RED-dropped bytes    :                     0                     0 bps
-        p10 = re.compile(r"^(?P<name>RED-dropped bytes) +: +(?P<counts>\S+) +(?P<rates>\S+) +bps$")
+        p10 = regex_engine.compile(r"^(?P<name>RED-dropped bytes) +: +(?P<counts>\S+) +(?P<rates>\S+) +bps$")
         #              Low                 :                     0                     0 bps
         #              Medium-low          :                     0                     0 bps
         #              Medium-high         :                     0                     0 bps
         #              High                :                     0                     0 bps
         #              RL-dropped packets   :                     0                     0 pps
         #              Tail-dropped packets :                     0                     0 pps
-        p7 = re.compile(r"^(?P<name>Packets|Bytes|Tail-dropped +packets|"
-                        r"RL-dropped +packets|"
-                        r"Low|Medium-low|Medium-high|High) +: "
-                        r"+(?P<counts>\S+) +(?P<rates>\S+) +[p|b]ps$")
+        p7 = regex_engine.compile(r"^(?P<name>Packets|Bytes|Tail-dropped +packets|"
+                                  r"RL-dropped +packets|"
+                                  r"Low|Medium-low|Medium-high|High) +: "
+                                  r"+(?P<counts>\S+) +(?P<rates>\S+) +[p|b]ps$")
 
         # -------------------------------------------------
         # Build parsed output
@@ -3514,6 +3526,10 @@ class ShowInterfacesQueue(ShowInterfacesQueueSchema):
 
 class ShowInterfacesExtensiveInterface(ShowInterfaces):
     cli_command = 'show interfaces extensive {interface}'
+
+    def _get_command(self, interface):
+        return self.cli_command.format(interface=interface)
+
     def cli(self, interface, output=None):
 
         if not output:
@@ -3656,15 +3672,15 @@ class ShowInterfacesDiagnosticsOptics(ShowInterfacesDiagnosticsOpticsSchema):
         ret_dict = {}
 
         # Physical interface: et-0/0/0
-        p1 = re.compile(r'^Physical +interface: +(?P<name>\S+)$')
+        p1 = regex_engine.compile(r'^Physical +interface: +(?P<name>\S+)$')
 
         # Module temperature                        :  48 degrees C / 119 degrees F
         # Module voltage                            :  3.3340 V
         # Module temperature high alarm             :  Off
-        p2 = re.compile(r'^(?P<key>[\S ]+) +: +(?P<value>[\S ]+)$')
+        p2 = regex_engine.compile(r'^(?P<key>[\S ]+) +: +(?P<value>[\S ]+)$')
 
         # Lane 0
-        p3 = re.compile(r'^Lane +(?P<lane>\d+)$')
+        p3 = regex_engine.compile(r'^Lane +(?P<lane>\d+)$')
 
         lane = None
 
@@ -3716,6 +3732,10 @@ class ShowInterfacesDiagnosticsOptics(ShowInterfacesDiagnosticsOpticsSchema):
 
 class ShowInterfacesInterfaceDetail(ShowInterfaces):
     cli_command = 'show interfaces {interface} detail'
+
+    def _get_command(self, interface):
+        return self.cli_command.format(interface=interface)
+
     def cli(self, interface, output=None):
 
         if not output:
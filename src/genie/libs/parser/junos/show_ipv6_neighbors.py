@@ -3,15 +3,15 @@
 JunOS parsers for the following show commands:
     * show ipv6 neighbors
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, 
         Optional, Use, Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowIpv6NeighborsSchema(MetaParser):
     """ Schema for:
             * show ipv6 neighbors
@@ -72,14 +72,14 @@ class ShowIpv6Neighbors(ShowIpv6NeighborsSchema):
         ret_dict = {}
 
         #2001:db8:eb18:6337::1           00:50:56:ff:00:4b  reachable   28    yes  no      ge-0/0/1.0
-        p1 = re.compile(r'^(?P<ipv6_nd_neighbor_address>[\w:]+) '
-                        r'+(?P<ipv6_nd_neighbor_l2_address>[\w:]+) '
-                        r'+(?P<ipv6_nd_state>\S+) +(?P<ipv6_nd_expire>\d+) '
-                        r'+(?P<ipv6_nd_isrouter>\S+) +(?P<ipv6_nd_issecure>\S+) '
-                        r'+(?P<ipv6_nd_interface_name>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<ipv6_nd_neighbor_address>[\w:]+) '
+                                  r'+(?P<ipv6_nd_neighbor_l2_address>[\w:]+) '
+                                  r'+(?P<ipv6_nd_state>\S+) +(?P<ipv6_nd_expire>\d+) '
+                                  r'+(?P<ipv6_nd_isrouter>\S+) +(?P<ipv6_nd_issecure>\S+) '
+                                  r'+(?P<ipv6_nd_interface_name>\S+)$')
         
         #Total entries: 3
-        p2 = re.compile(r'^Total +entries: +(?P<ipv6_nd_total>\d+)$')
+        p2 = regex_engine.compile(r'^Total +entries: +(?P<ipv6_nd_total>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
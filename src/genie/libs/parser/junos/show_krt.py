@@ -5,13 +5,15 @@ JunOs parsers for the following show commands:
     * show krt queue
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowKrtStateSchema(MetaParser):
 
     schema = {
@@ -61,65 +63,65 @@ class ShowKrtState(ShowKrtStateSchema):
         ret_dict = {}
 
         #Number of operations queued: 0
-        p1 = re.compile(r'^Number of operations queued: +(?P<krtq_operations_queued>\d+)$')
+        p1 = regex_engine.compile(r'^Number of operations queued: +(?P<krtq_operations_queued>\d+)$')
 
         #Routing table adds: 0
-        p2 = re.compile(r'^Routing table adds: +(?P<krtq_rt_table_adds>\d+)$')
+        p2 = regex_engine.compile(r'^Routing table adds: +(?P<krtq_rt_table_adds>\d+)$')
 
         #Interface routes: 0
-        p3 = re.compile(r'^Interface routes: +(?P<krtq_interface_routes>\d+)$')
+        p3 = regex_engine.compile(r'^Interface routes: +(?P<krtq_interface_routes>\d+)$')
 
         #High pri multicast   Adds/Changes: 0
-        p4 = re.compile(r'^High pri multicast +Adds\/Changes: +'
-                        r'(?P<krtq_high_multicast_adds_changes>\d+)$')
+        p4 = regex_engine.compile(r'^High pri multicast +Adds\/Changes: +'
+                                  r'(?P<krtq_high_multicast_adds_changes>\d+)$')
 
         #Indirect Next Hop    Adds/Changes: 0       Deletes: 0
-        p5 = re.compile(r'^Indirect Next Hop +Adds\/Changes: +(?P<krtq_indirect_adds_changes>\d+) +'
-                        r'Deletes: +(?P<krtq_indirect_deletes>\d+)$')
+        p5 = regex_engine.compile(r'^Indirect Next Hop +Adds\/Changes: +(?P<krtq_indirect_adds_changes>\d+) +'
+                                  r'Deletes: +(?P<krtq_indirect_deletes>\d+)$')
 
         #MPLS        Adds: 0       Changes: 0
-        p6 = re.compile(r'^MPLS +Adds: +(?P<krtq_high_mpls_adds>\d+) +Changes: +'
-                        r'(?P<krtq_high_mpls_changes>\d+)$')
+        p6 = regex_engine.compile(r'^MPLS +Adds: +(?P<krtq_high_mpls_adds>\d+) +Changes: +'
+                                  r'(?P<krtq_high_mpls_changes>\d+)$')
 
         #High pri    Adds: 0       Changes: 0       Deletes: 0
-        p7 = re.compile(r'^High pri\s+Adds: +(?P<krtq_high_priority_adds>\d+)\s+Changes: +'
-                        r'(?P<krtq_high_priority_changes>\d+)\s+Deletes: +'
-                        r'(?P<krtq_high_priority_deletes>\d+)$')
+        p7 = regex_engine.compile(r'^High pri\s+Adds: +(?P<krtq_high_priority_adds>\d+)\s+Changes: +'
+                                  r'(?P<krtq_high_priority_changes>\d+)\s+Deletes: +'
+                                  r'(?P<krtq_high_priority_deletes>\d+)$')
         
         #Normal pri Indirects: 0
-        p8 = re.compile(r'^Normal pri Indirects: +(?P<krtq_normal_priority_indirects>\d+)$')
+        p8 = regex_engine.compile(r'^Normal pri Indirects: +(?P<krtq_normal_priority_indirects>\d+)$')
 
         #Normal pri  Adds: 0       Changes: 0       Deletes: 0
-        p9 = re.compile(r'^Normal pri\s+Adds: +(?P<krtq_normal_priority_adds>\d+)\s+Changes: +'
-                        r'(?P<krtq_normal_priority_changes>\d+)\s+Deletes: +'
-                        r'(?P<krtq_normal_priority_deletes>\d+)$')
+        p9 = regex_engine.compile(r'^Normal pri\s+Adds: +(?P<krtq_normal_priority_adds>\d+)\s+Changes: +'
+                                  r'(?P<krtq_normal_priority_changes>\d+)\s+Deletes: +'
+                                  r'(?P<krtq_normal_priority_deletes>\d+)$')
 
         #GMP GENCFG Objects: 0
-        p10 = re.compile(r'^GMP GENCFG Objects: +(?P<krtq_normal_priority_gmp>\d+)$')
+        p10 = regex_engine.compile(r'^GMP GENCFG Objects: +(?P<krtq_normal_priority_gmp>\d+)$')
 
         #Routing Table deletes: 0
-        p11 = re.compile(r'^Routing Table deletes: +(?P<krtq_rt_table_deletes>\d+)$')
+        p11 = regex_engine.compile(r'^Routing Table deletes: +(?P<krtq_rt_table_deletes>\d+)$')
 
         #Number of operations deferred: 0
-        p12 = re.compile(r'^Number of operations deferred: +(?P<krtq_operations_deferred>\d+)$')
+        p12 = regex_engine.compile(r'^Number of operations deferred: +(?P<krtq_operations_deferred>\d+)$')
 
         #Number of operations canceled: 0
-        p13 = re.compile(r'^Number of operations canceled: +(?P<krtq_operations_canceled>\d+)$')
+        p13 = regex_engine.compile(r'^Number of operations canceled: +(?P<krtq_operations_canceled>\d+)$')
 
         #Number of async queue entries: 0
-        p14 = re.compile(r'^Number of async queue entries: +(?P<krtq_async_count>\d+)$')
+        p14 = regex_engine.compile(r'^Number of async queue entries: +(?P<krtq_async_count>\d+)$')
 
         #Number of async non queue entries: 0
-        p15 = re.compile(r'^Number of async non queue entries: +(?P<krtq_async_non_q_count>\d+)$')
+        p15 = regex_engine.compile(r'^Number of async non queue entries: +(?P<krtq_async_non_q_count>\d+)$')
 
         #Time until next queue run: 0
-        p16 = re.compile(r'^Time until next queue run: +(?P<krtq_time_until_next_run>\d+)$')
+        p16 = regex_engine.compile(r'^Time until next queue run: +(?P<krtq_time_until_next_run>\d+)$')
 
         #Routes learned from kernel: 34
-        p17 = re.compile(r'^Routes learned from kernel: +(?P<krtq_kernel_rt_learnt>\d+)$')
+        p17 = regex_engine.compile(r'^Routes learned from kernel: +(?P<krtq_kernel_rt_learnt>\d+)$')
 
         #Time until next scan: 58
-        p18 = re.compile(r'^Time until next scan: +(?P<rtsock_time_until_next_scan>\d+)$')
+        p18 = regex_engine.compile(r'^Time until next scan: +(?P<rtsock_time_until_next_scan>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -301,7 +303,7 @@ class ShowKrtQueue(ShowKrtQueueSchema):
         ret_dict = {}
 
         #Routing table add queue: 0 queued
-        p1 = re.compile(r'^(?P<krtq_type>([^:(]+?))(\s*[:(]) (?P<krtq_queue_length>\d+) queued$')
+        p1 = regex_engine.compile(r'^(?P<krtq_type>([^:(]+?))(\s*[:(]) (?P<krtq_queue_length>\d+) queued$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5,15 +5,15 @@ JunOs parsers for the following show commands:
     * show lacp statistics interfaces {interface}
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowLacpInterfacesInterfaceSchema(MetaParser):
     """ Schema for:
@@ -64,10 +64,10 @@ class ShowLacpInterfacesInterface(ShowLacpInterfacesInterfaceSchema):
         ret_dict = {}
 
         # Aggregated interface: ae4
-        p1 = re.compile(r'^Aggregated +interface: +(?P<aggregate_name>\S+)$')
+        p1 = regex_engine.compile(r'^Aggregated +interface: +(?P<aggregate_name>\S+)$')
 
         #     xe-3/0/1       Actor    No    No   Yes  Yes  Yes   Yes     Fast    Active
-        p2 = re.compile(r'^(?P<name>\S+) +(?P<lacp_role>\S+) +(?P<lacp_expired>\S+)'
+        p2 = regex_engine.compile(r'^(?P<name>\S+) +(?P<lacp_role>\S+) +(?P<lacp_expired>\S+)'
             r' +(?P<lacp_defaulted>\S+) +(?P<lacp_distributing>\S+) +(?P<lacp_collecting>\S+)'
             r' +(?P<lacp_synchronization>\S+) +(?P<lacp_aggregation>\S+) +(?P<lacp_timeout>\S+)'
             r' +(?P<lacp_activity>\S+)$')
@@ -75,8 +75,8 @@ class ShowLacpInterfacesInterface(ShowLacpInterfacesInterfaceSchema):
         #     xe-3/0/1                  Current   Fast periodic Collecting distributing
         #     xe-3/0/2                  Defaulted   Fast periodic Collecting distributing
         #     xe-3/0/3                  Port disabled   Fast periodic Collecting distributing
-        p3 = re.compile(r'^(?P<name>\S+) +(?P<lacp_receive_state>(Current|Defaulted|Port +disabled)) +'
-                        r'(?P<lacp_transmit_state>\S+( +\S+)?) +(?P<lacp_mux_state>\S+( +\S+)?)$')
+        p3 = regex_engine.compile(r'^(?P<name>\S+) +(?P<lacp_receive_state>(Current|Defaulted|Port +disabled)) +'
+                                  r'(?P<lacp_transmit_state>\S+( +\S+)?) +(?P<lacp_mux_state>\S+( +\S+)?)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -184,10 +184,10 @@ class ShowLacpStatisticsInterfacesInterface(ShowLacpStatisticsInterfacesInterfac
         ret_dict = {}
 
         # Aggregated interface: ae4
-        p1 = re.compile(r'^Aggregated +interface: +(?P<aggregate_name>\S+)$')
+        p1 = regex_engine.compile(r'^Aggregated +interface: +(?P<aggregate_name>\S+)$')
 
         #      ge-0/0/6                 286         291            0            0
-        p2 = re.compile(r'(?P<name>\S+)\s+(?P<lacp_rx_packets>\d+)\s+(?P<lacp_tx_packets>\d+)\s+(?P<unknown_rx_packets>\d+)\s+(?P<illegal_rx_packets>\d+)')
+        p2 = regex_engine.compile(r'(?P<name>\S+)\s+(?P<lacp_rx_packets>\d+)\s+(?P<lacp_tx_packets>\d+)\s+(?P<unknown_rx_packets>\d+)\s+(?P<illegal_rx_packets>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
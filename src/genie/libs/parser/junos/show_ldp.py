@@ -9,13 +9,15 @@ JUNOS parsers for the following commands:
     * show ldp interface {interface} detail
 """
 
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowLDPSessionSchema(MetaParser):
     """ Schema for
@@ -51,11 +53,11 @@ class ShowLDPSession(ShowLDPSessionSchema):
         ret_dict = {}
 
         # 10.34.2.250                        Operational Open          26         DU
-        p1 = re.compile(r'^(?P<ldp_neighbor_address>\S+) +'
-                        r'(?P<ldp_session_state>\S+) +'
-                        r'(?P<ldp_connection_state>\S+) +'
-                        r'(?P<ldp_remaining_time>\d+)( +)?'
-                        r'(?P<ldp_session_adv_mode>\S+)?$')
+        p1 = regex_engine.compile(r'^(?P<ldp_neighbor_address>\S+) +'
+                                  r'(?P<ldp_session_state>\S+) +'
+                                  r'(?P<ldp_connection_state>\S+) +'
+                                  r'(?P<ldp_remaining_time>\d+)( +)?'
+                                  r'(?P<ldp_session_adv_mode>\S+)?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -124,7 +126,7 @@ class ShowLdpNeighbor(ShowLdpNeighborSchema):
         ret_dict = {}
 
         # 10.169.14.158                      ge-0/0/0.0      10.34.2.250:0       14
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<ldp_neighbor_address>\S+) '
             r'+(?P<interface_name>\S+) +(?P<ldp_label_space_id>\S+) '
             r'+(?P<ldp_remaining_time>\S+)$'
@@ -207,18 +209,18 @@ class ShowLdpDatabaseSessionIpaddress(ShowLdpDatabaseSessionIpaddressSchema):
         ret_dict = {}
 
         # Input label database, 10.169.14.240:0--10.34.2.250:0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<ldp_database_type>[\S\s]+), '
             r'+(?P<ldp_session_id>[\d\.\:\-]+)$'
         )
 
         # Labels received: 2
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^Labels +(?P<label_type>\S+): +(?P<ldp_label_received>\d+)$'
         )
 
         # 3      10.34.2.250/32
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<ldp_label>\d+) +(?P<ldp_prefix>[\d\.\/]+)$'
         )
 
@@ -500,49 +502,49 @@ class ShowLDPOverview(ShowLDPOverviewSchema):
         # Instance: master
         # Reconnect time: 60000, Max neighbor reconnect time: 120000
         # Restart: disabled, Helper: enabled, Restart in process: false
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<var>[\w\s]+)\: +(?P<value>\S+)'
             r'(, +(?P<var2>[\w\s]+)\: +(?P<value2>\S+))?'
             r'(, +(?P<var3>[\w\s]+)\: +(?P<value3>\S+))?$')
 
         # Downstream unsolicited Sessions:
-        p2 = re.compile(r'^Downstream +unsolicited +Sessions\:$')
+        p2 = regex_engine.compile(r'^Downstream +unsolicited +Sessions\:$')
 
         # Auto targeted sessions:
-        p3 = re.compile(r'^Auto +targeted +sessions\:$')
+        p3 = regex_engine.compile(r'^Auto +targeted +sessions\:$')
 
         # P2MP:
-        p4 = re.compile(r'^P2MP\:$')
+        p4 = regex_engine.compile(r'^P2MP\:$')
 
         # Timers:
-        p5 = re.compile(r'^Timers\:$')
+        p5 = regex_engine.compile(r'^Timers\:$')
 
         # Graceful restart:
-        p6 = re.compile(r'^Graceful +restart\:$')
+        p6 = regex_engine.compile(r'^Graceful +restart\:$')
 
         # IGP:
-        p7 = re.compile(r'^IGP\:$')
+        p7 = regex_engine.compile(r'^IGP\:$')
 
         # Session protection:
-        p8 = re.compile(r'^Session +protection\:$')
+        p8 = regex_engine.compile(r'^Session +protection\:$')
 
         # Traffic Engineering:
-        p9 = re.compile(r'^Traffic +Engineering\:$')
+        p9 = regex_engine.compile(r'^Traffic +Engineering\:$')
 
         # LDP Job:
-        p10 = re.compile(r'^LDP +Job\:$')
+        p10 = regex_engine.compile(r'^LDP +Job\:$')
 
         # Label allocation:
-        p11 = re.compile(r'^Label +allocation\:$')
+        p11 = regex_engine.compile(r'^Label +allocation\:$')
 
         # 10.1.2.2
-        p12 = re.compile(r'^(?P<ip>[\d\.]+)$')
+        p12 = regex_engine.compile(r'^(?P<ip>[\d\.]+)$')
 
         # Protocol modes:
-        p13 = re.compile(r'^Protocol +modes\:$')
+        p13 = regex_engine.compile(r'^Protocol +modes\:$')
 
         # Sessions:
-        p14 = re.compile(r'Sessions\:$')
+        p14 = regex_engine.compile(r'Sessions\:$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -814,13 +816,13 @@ class ShowLDPInterface(ShowLDPInterfaceSchema):
 
         # ge-0/0/0.0         10.1.2.2                   10.204.14.100:0  1      3
         # et-0/0/0.0           10.4.14.240:0         1           3
-        p1 = re.compile(r'^(?P<interface_name>\S+)( +(?P<local_address>\S+))? +'
-                        r'(?P<space_id>\S+) +(?P<neighbor_count>\d+) +(?P<next_hello>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<interface_name>\S+)( +(?P<local_address>\S+))? +'
+                                  r'(?P<space_id>\S+) +(?P<neighbor_count>\d+) +(?P<next_hello>\d+)$')
 
         # Hello interval: 5, Hold time: 15, Transport address: 10.204.14.100
-        p2 = re.compile(r'^Hello +interval: +(?P<ldp_hello_interval>\d+), +'
-                        r'Hold +time: +(?P<ldp_holdtime>\d+), +'
-                        r'Transport +address: +(?P<ldp_transport_address>\S+)')
+        p2 = regex_engine.compile(r'^Hello +interval: +(?P<ldp_hello_interval>\d+), +'
+                                  r'Hold +time: +(?P<ldp_holdtime>\d+), +'
+                                  r'Transport +address: +(?P<ldp_transport_address>\S+)')
 
         ret_dict = {}
 
@@ -948,7 +950,7 @@ class ShowLdpSessionIpaddressDetail(ShowLdpSessionIpaddressDetailSchema):
         ret_dict = {}
 
         # Address: 10.169.14.240, State: Operational, Connection: Open, Hold time: 23
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Address: +(?P<ldp_neighbor_address>\S+), '
             r'+State: +(?P<ldp_session_state>\S+), '
             r'+Connection: +(?P<ldp_connection_state>\S+), '
@@ -956,122 +958,122 @@ class ShowLdpSessionIpaddressDetail(ShowLdpSessionIpaddressDetailSchema):
         )
 
         # Session ID: 10.34.2.250:0--10.169.14.240:0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^Session ID: +(?P<ldp_session_id>\S+)$'
         )
 
         # Next keepalive in 3 seconds
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Next +keepalive +in +(?P<ldp_keepalive_time>\S+) +seconds$'
         )
 
         # Passive, Maximum PDU: 4096, Hold time: 30, Neighbor count: 1
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^(?P<ldp_session_role>\S+), +Maximum +PDU: '
             r'+(?P<ldp_session_max_pdu>\d+), +Hold +time: '
             r'(?P<ldp_holdtime>\d+), Neighbor +count: (?P<ldp_neighbor_count>\d+)$'
         )
 
         # Neighbor types: discovered
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Neighbor +types: +(?P<ldp_neighbor_type>\S+)$'
         )
 
         # Keepalive interval: 10, Connect retry interval: 1
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Keepalive +interval: +(?P<ldp_keepalive_interval>\d+)+, '
             r'+Connect +retry +interval: (?P<ldp_retry_interval>\d+)$'
         )
 
         # Local address: 10.34.2.250, Remote address: 10.169.14.240
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Local +address: +(?P<ldp_local_address>\S+), '
             r'+Remote +address: +(?P<ldp_remote_address>\S+)$'
         )
 
         # Up for 00:00:47
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Up +for +(?P<ldp_up_time>\S+)$'
         )
 
         # Capabilities advertised: none
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^Capabilities +advertised: +(?P<ldp_capability_advertised>\S+)$'
         )
 
         # Capabilities received: none
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^Capabilities +received: +(?P<ldp_capability_received>\S+)$'
         )
 
         # Protection: disabled
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^Protection: +(?P<ldp_session_protection_state>\S+)$'
         )
 
         # Session flags: none
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^Session +flags: +(?P<ldp_session_flag>\S+)$'
         )
 
         # Local - Restart: disabled, Helper mode: enabled
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r'^Local +- +Restart: +(?P<ldp_graceful_restart_local>\S+), '
             r'Helper +mode: +(?P<ldp_local_helper_mode>\S+)$'
         )
 
         # Remote - Restart: disabled, Helper mode: enabled
         # Remote - Restart: enabled, Helper mode: enabled, Reconnect time: 60000
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r'^Remote +- +Restart: +(?P<ldp_graceful_restart_remote>\S+), '
             r'Helper +mode: +(?P<ldp_remote_helper_mode>\w+)(, +Reconnect +time: '
             r'+(?P<ldp_remote_reconnect_time>\S+))?$'
         )
 
         # Local maximum neighbor reconnect time: 120000 msec
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r'^Local +maximum +neighbor +reconnect +time: '
             r'+(?P<ldp_local_maximum_reconnect>\S+) +msec$'
         )
 
         # Local maximum neighbor recovery time: 240000 msec
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r'^Local +maximum +neighbor +recovery +time: '
             r'+(?P<ldp_local_maximum_recovery>\S+) +msec$'
         )
 
         # Local Label Advertisement mode: Downstream unsolicited
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r'^Local +Label +Advertisement +mode: '
             r'+(?P<ldp_local_label_adv_mode>[\S\s]+)$'
         )
 
         # Remote Label Advertisement mode: Downstream unsolicited
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r'^Remote +Label +Advertisement +mode: '
             r'+(?P<ldp_remote_label_adv_mode>[\S\s]+)$'
         )
 
         # Negotiated Label Advertisement mode: Downstream unsolicited
-        p18_2 = re.compile(
+        p18_2 = regex_engine.compile(
             r'^Negotiated +Label +Advertisement +mode: '
             r'+(?P<ldp_neg_label_adv_mode>[\S\s]+)$'
         )
 
         # MTU discovery: disabled
-        p19 = re.compile(r'^MTU +discovery: +(?P<ldp_mtu_discovery>\S+)$'
+        p19 = regex_engine.compile(r'^MTU +discovery: +(?P<ldp_mtu_discovery>\S+)$'
         )
 
         # Nonstop routing state: Not in sync
-        p20 = re.compile(r'^Nonstop +routing +state: +(?P<ldp_session_nsr_state>[\S\s]+)$'
+        p20 = regex_engine.compile(r'^Nonstop +routing +state: +(?P<ldp_session_nsr_state>[\S\s]+)$'
         )
 
         # Next-hop addresses received:
-        p21 = re.compile(r'^(?P<next_hop_flag>Next-hop +addresses +received:)$'
+        p21 = regex_engine.compile(r'^(?P<next_hop_flag>Next-hop +addresses +received:)$'
         )
 
         # Next-hop addresses received:
-        p22 = re.compile(r'^(?P<interface_address>[\d\.]+)$'
+        p22 = regex_engine.compile(r'^(?P<interface_address>[\d\.]+)$'
         )
 
         
@@ -4,15 +4,15 @@ JunOs parsers for the following show commands:
     * show lldp
 """
 
-# Python
-import re
-
 # ==============================
 # Schema for 'show lldp'
 # ==============================
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowLldpSchema(MetaParser):
     """ Schema for:
@@ -63,46 +63,46 @@ class ShowLldp(ShowLldpSchema):
         parsed_dict = {}
 
         # LLDP : Disabled
-        p1 = re.compile(r'^LLDP\s*:\s*(?P<lldp_global_status>\w+)$')
+        p1 = regex_engine.compile(r'^LLDP\s*:\s*(?P<lldp_global_status>\w+)$')
 
         # Advertisement interval    : 30 seconds
-        p2 = re.compile(r'^Advertisement\s+interval\s*:\s*('
-                        r'?P<lldp_advertisement_interval>\d+) +seconds?$')
+        p2 = regex_engine.compile(r'^Advertisement\s+interval\s*:\s*('
+                                  r'?P<lldp_advertisement_interval>\d+) +seconds?$')
 
         # Transmit delay            : 0 seconds
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Transmit\s+delay\s*:\s*(?P<lldp_transmit_delay_interval>\d+) '
             r'+seconds?$')
 
         # Hold timer                : 120 seconds
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Hold\s+timer\s*:\s*(?P<lldp_hold_time_interval>\d+) '
             r'+seconds?$')
 
         # Notification interval     : 5 Second(s)
-        p5 = re.compile(r'^Notification\s+interval\s*:\s*('
-                        r'?P<lldp_notification_interval>\d+) +Second\(s\)$')
+        p5 = regex_engine.compile(r'^Notification\s+interval\s*:\s*('
+                                  r'?P<lldp_notification_interval>\d+) +Second\(s\)$')
 
         # Config Trap Interval      : 0 seconds
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Config\s+Trap\s+Interval\s*:\s*('
             r'?P<ptopo_configuration_trap_interval>\d+) +seconds?$')
 
         # Connection Hold timer     : 300 seconds
-        p7 = re.compile(r'^Connection\s+Hold\s+timer\s*:\s*('
-                        r'?P<ptopo_maximum_hold_time>\d+) +seconds?$')
+        p7 = regex_engine.compile(r'^Connection\s+Hold\s+timer\s*:\s*('
+                                  r'?P<ptopo_maximum_hold_time>\d+) +seconds?$')
 
         # LLDP MED                  : Disabled
-        p8 = re.compile(r'^LLDP\s+MED\s*:\s*(?P<lldp_med_global_status>\w+)$')
+        p8 = regex_engine.compile(r'^LLDP\s+MED\s*:\s*(?P<lldp_med_global_status>\w+)$')
 
         # Port ID TLV subtype       : locally-assigned
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^Port\s+ID\s+TLV\s+subtype\s*:\s*(?P<lldp_port_id_subtype>['
             r'-\w\s]+)$')
 
         # Port Description TLV type : interface-alias (ifAlias)
-        p10 = re.compile(r'^Port\s+Description\s+TLV\s+type\s*:\s*('
-                         r'?P<lldp_port_description_type>[\s\S]+)$')
+        p10 = regex_engine.compile(r'^Port\s+Description\s+TLV\s+type\s*:\s*('
+                                   r'?P<lldp_port_description_type>[\s\S]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5,14 +5,14 @@ JunOs parsers for the following show commands:
     * show log {filename} | match {match}
     * show log {filename} | except {except_show_log} | match {match}
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowLogFilenameSchema(MetaParser):
     """ Schema for:
@@ -53,7 +53,7 @@ class ShowLogFilename(ShowLogFilenameSchema):
         lines = out.splitlines()
         if len(lines) > 1:
             ret_dict['file-content'] = []
-        p = re.compile(r"^(?!{).*")
+        p = regex_engine.compile(r"^(?!{).*")
 
         for line in lines:
             line = line.strip()
@@ -82,7 +82,7 @@ class ShowLogFilenameMatchExcept(ShowLogFilenameSchema):
         lines = out.splitlines()
         if len(lines) > 1:
             ret_dict['file-content'] = []
-        p = re.compile(r"^(?!{).*")
+        p = regex_engine.compile(r"^(?!{).*")
 
         for line in lines:
             line = line.strip()
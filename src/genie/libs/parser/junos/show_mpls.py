@@ -14,6 +14,9 @@ from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================================
 #   Show mpls ldp discovery
@@ -78,58 +81,58 @@ class ShowMplsLdpDiscoveryDetail(ShowMplsLdpDiscoveryDetailSchema):
         discovery_flag = False
 
         # Local LDP Identifier: 10.94.1.1:0
-        p1 = re.compile(r'^Local +LDP +Identifier: '
-                        r'(?P<local_ldp_identifier>[\d\.\:]+)$')
+        p1 = regex_engine.compile(r'^Local +LDP +Identifier: '
+                                  r'(?P<local_ldp_identifier>[\d\.\:]+)$')
 
         # Discovery Sources:
-        p2 = re.compile(r'^Discovery +Sources:$')
+        p2 = regex_engine.compile(r'^Discovery +Sources:$')
 
         # TenGigE0/3/0/0 (0xa0004c0) : xmit/recv
         # TenGigE0/3/0/26 (0xa000e00) : xmit/recv
-        p3 = re.compile(r'^(?P<interface>\S+) \((?P<interface_hex>[\w]+)\)'
-                        r' : (?P<xmit>xmit)?\/?(?P<recv>recv)?$')
+        p3 = regex_engine.compile(r'^(?P<interface>\S+) \((?P<interface_hex>[\w]+)\)'
+                                  r' : (?P<xmit>xmit)?\/?(?P<recv>recv)?$')
 
         # VRF: 'default' (0x60000000)
-        p4 = re.compile(r'^VRF: \'(?P<vrf>\S+)\' +\((?P<vrf_hex>[\w]+)\)$')
+        p4 = regex_engine.compile(r'^VRF: \'(?P<vrf>\S+)\' +\((?P<vrf_hex>[\w]+)\)$')
 
         # LDP Id: 10.144.96.96:0
-        p5 = re.compile(r'^(?P<ldp_tdp>\w+) +Id:\s*(?P<ldp_tdp_id>[\S]+)$')
+        p5 = regex_engine.compile(r'^(?P<ldp_tdp>\w+) +Id:\s*(?P<ldp_tdp_id>[\S]+)$')
 
         # Source address: 10.120.0.1; Transport address: 10.94.1.1
-        p6 = re.compile(r'^Source +address: +(?P<source_ip_addr>[\d\.]+);'
-                        r' +Transport +address: +(?P<transport_ip_addr>[\d\.]+)$')
+        p6 = regex_engine.compile(r'^Source +address: +(?P<source_ip_addr>[\d\.]+);'
+                                  r' +Transport +address: +(?P<transport_ip_addr>[\d\.]+)$')
 
         # Hold time: 15 sec (local:15 sec, peer:45 sec)
-        p7 = re.compile(r'^Hold +time: +(?P<holdtime_sec>\d+) +sec '
-                        r'\(local:(?P<proposed_local>\d+) +sec, '
-                        r'peer:(?P<proposed_peer>\d+) +sec\)$')
+        p7 = regex_engine.compile(r'^Hold +time: +(?P<holdtime_sec>\d+) +sec '
+                                  r'\(local:(?P<proposed_local>\d+) +sec, '
+                                  r'peer:(?P<proposed_peer>\d+) +sec\)$')
 
         # (expiring in 11 sec)
         # (expiring in 14.5 sec)
-        p8 = re.compile(r'^\(expiring +in +(?P<expiring_in>\d.*) +sec\)$')
+        p8 = regex_engine.compile(r'^\(expiring +in +(?P<expiring_in>\d.*) +sec\)$')
 
         # Established: Nov  6 14:39:26.164 (5w2d ago)
-        p9 = re.compile(r'^Established: +(?P<established_date>\S.*) '
-                        r'+\((?P<established_elapsed>\S*) +ago\)$')
+        p9 = regex_engine.compile(r'^Established: +(?P<established_date>\S.*) '
+                                  r'+\((?P<established_elapsed>\S*) +ago\)$')
 
         # Hello interval: 5 sec (due in 563 msec)
-        p10 = re.compile(r'^Hello +interval: +(?P<hello_interval>\d+) +sec'
-                        r' +\(due +in +(?P<hello_due_time>\S+ +\S+)\)$')
+        p10 = regex_engine.compile(r'^Hello +interval: +(?P<hello_interval>\d+) +sec'
+                                  r' +\(due +in +(?P<hello_due_time>\S+ +\S+)\)$')
 
         # Quick-start: Enabled
-        p11 = re.compile(r'^Quick-start: +(?P<quick_start>\S+)$')
+        p11 = regex_engine.compile(r'^Quick-start: +(?P<quick_start>\S+)$')
 
         # Last session connection failures:
-        p12 = re.compile(r'^Last +session +connection +failures:$')
+        p12 = regex_engine.compile(r'^Last +session +connection +failures:$')
 
         #     Jan  4 05:20:34.814: User cleared session manually
         #     Jan  4 05:28:48.641: User cleared session manually
-        p13 = re.compile(r'^(?P<timestamp>[A-Z][a-z]{2}\s+[0-9]{1,2}\s[0-9:.]+)'
-                         r':\s+(?P<reason>[\w\s]+)$')
+        p13 = regex_engine.compile(r'^(?P<timestamp>[A-Z][a-z]{2}\s+[0-9]{1,2}\s[0-9:.]+)'
+                                   r':\s+(?P<reason>[\w\s]+)$')
 
         #         (Last up for 00:06:56)
         #         (Last up for 00:08:05)
-        p14 = re.compile(r'\(Last +up +for +(?P<last_up_for>[\d:]+)\)$')
+        p14 = regex_engine.compile(r'\(Last +up +for +(?P<last_up_for>[\d:]+)\)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -384,93 +387,93 @@ class ShowMPLSLSPNameDetail(ShowMPLSLSPNameDetailSchema):
         # Ingress LSP: 0 sessions
         # Egress LSP: 0 sessions
         # Transit LSP: 30 sessions
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<session_type>\S+) +LSP: +(?P<count>\d+) +sessions$')
 
         # Total 0 displayed, Up 0, Down 0
-        p2 = re.compile(r'^Total (?P<display_count>\d+) +displayed, +Up +'
-                        r'(?P<up_count>\d+), +Down +(?P<down_count>\d+)$')
+        p2 = regex_engine.compile(r'^Total (?P<display_count>\d+) +displayed, +Up +'
+                                  r'(?P<up_count>\d+), +Down +(?P<down_count>\d+)$')
 
         # 10.49.194.125
-        p3 = re.compile(r'^[\d\.]+')
+        p3 = regex_engine.compile(r'^[\d\.]+')
 
         # From: 10.49.194.127, LSPstate: Up, ActiveRoute: 0
-        p4 = re.compile(r'^From: +(?P<source_address>[\d+\.]+), +LSPstate: +'
-                        r'(?P<lsp_state>[^\s,]+), +ActiveRoute: +'
-                        r'(?P<route_count>\d+)$')
+        p4 = regex_engine.compile(r'^From: +(?P<source_address>[\d+\.]+), +LSPstate: +'
+                                  r'(?P<lsp_state>[^\s,]+), +ActiveRoute: +'
+                                  r'(?P<route_count>\d+)$')
 
         # LSPname: test_lsp_01, LSPpath: Primary
-        p5 = re.compile(r'^LSPname: +(?P<name>[^\s,]+), +'
-                        r'LSPpath: +(?P<lsp_path_type>\S+)$')
+        p5 = regex_engine.compile(r'^LSPname: +(?P<name>[^\s,]+), +'
+                                  r'LSPpath: +(?P<lsp_path_type>\S+)$')
 
         # Suggested label received: -, Suggested label sent: -
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Suggested +label +received: +(?P<suggested_label_in>[^\s,]+), +'
             r'Suggested +label +sent: +(?P<suggested_label_out>\S+)$')
 
         # Recovery label received: -, Recovery label sent: 44
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Recovery +label +received: +(?P<recovery_label_in>[^\s,]+), +'
             r'Recovery +label +sent: +(?P<recovery_label_out>\S+)$')
 
         # Resv style: 1 FF, Label in: 46, Label out: 44
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Resv +style: +(?P<rsb_count>\d+) +(?P<resv_style>[^\s,]+), +'
             r'Label +in: +(?P<label_in>[^\s,]+), +'
             r'Label +out: +(?P<label_out>\S+)$')
 
         # Time left:  138, Since: Tue Jun 30 07:22:02 2020
-        p9 = re.compile(r'^Time +left: +(?P<psb_lifetime>\d+), +'
-                        r'Since: +(?P<psb_creation_time>.+)$')
+        p9 = regex_engine.compile(r'^Time +left: +(?P<psb_lifetime>\d+), +'
+                                  r'Since: +(?P<psb_creation_time>.+)$')
 
         # Tspec: rate 0bps size 0bps peak Infbps m 20 M 1500
-        p10 = re.compile(r'^Tspec: +(?P<sender_tspec>.+)$')
+        p10 = regex_engine.compile(r'^Tspec: +(?P<sender_tspec>.+)$')
 
         # Port number: sender 1 receiver 50088 protocol 0
-        p11 = re.compile(r'^Port +number: +sender +(?P<lsp_id>\d+) +'
-                         r'receiver +(?P<tunnel_id>\d+) +'
-                         r'protocol +(?P<proto_id>\d+)$')
+        p11 = regex_engine.compile(r'^Port +number: +sender +(?P<lsp_id>\d+) +'
+                                   r'receiver +(?P<tunnel_id>\d+) +'
+                                   r'protocol +(?P<proto_id>\d+)$')
 
         # PATH rcvfrom: 10.169.14.157 (ge-0/0/0.0) 1 pkts
         # PATH sentto: 192.168.145.218 (ge-0/0/1.1) 1 pkts
         # RESV rcvfrom: 192.168.145.218 (ge-0/0/1.1) 1 pkts, Entropy label: Yes
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^(?P<heading>(PATH|RESV)) +'
             r'((rcvfrom: +(?P<previous_hop>\S+))|(sentto: +(?P<next_hop>\S+))) +'
             r'(?P<interface_name>\S+) +(?P<count>\d+) +pkts'
             r'(, +Entropy +label: +(?P<entropy_label>\S+))?$')
 
         # RESV
-        p12_1 = re.compile(r'^(?P<heading>(PATH|RESV))$')
+        p12_1 = regex_engine.compile(r'^(?P<heading>(PATH|RESV))$')
 
         # incoming message handle: P-8/1, Message ID: 23, Epoch: 385353
-        p12_2 = re.compile(r'incoming +message +handle: +'
-                           r'(?P<in_message_handle>\S+), +Message +ID: +'
-                           r'(?P<in_message_id>\S+), +Epoch: +(?P<in_epoch>\S+)')
+        p12_2 = regex_engine.compile(r'incoming +message +handle: +'
+                                     r'(?P<in_message_handle>\S+), +Message +ID: +'
+                                     r'(?P<in_message_id>\S+), +Epoch: +(?P<in_epoch>\S+)')
 
         # outgoing message state: refreshing, Message ID: 23, Epoch: 385318
-        p12_3 = re.compile(r'outgoing +message +state: +'
-                           r'(?P<out_message_state>\S+), +Message +ID: +'
-                           r'(?P<out_message_id>\S+), +Epoch: +(?P<out_epoch>\S+)')
+        p12_3 = regex_engine.compile(r'outgoing +message +state: +'
+                                     r'(?P<out_message_state>\S+), +Message +ID: +'
+                                     r'(?P<out_message_id>\S+), +Epoch: +(?P<out_epoch>\S+)')
 
         # Adspec: received MTU 1500 sent MTU 1500
-        p13 = re.compile(r'^Adspec: +(?P<adspec>.+)$')
+        p13 = regex_engine.compile(r'^Adspec: +(?P<adspec>.+)$')
 
         # Explct route: 192.168.145.218 10.49.194.65 10.49.194.66
-        p14 = re.compile(r'^Explct +route: +(?P<addresses>.+)$')
+        p14 = regex_engine.compile(r'^Explct +route: +(?P<addresses>.+)$')
 
         # Record route: 10.49.194.2 10.169.14.157 <self> 192.168.145.218
-        p15 = re.compile(r'^Record +route: +(?P<addresses>.+)$')
+        p15 = regex_engine.compile(r'^Record +route: +(?P<addresses>.+)$')
 
         # Enhanced FRR: Disabled (Upstream), Reason: Compatibility, Refresh: 30 secs
-        p16_1 = re.compile(r'Enhanced +FRR: (?P<rsvp_lsp_enh_lp_upstream_status>\S+)'
-                           r' +\(Upstream\), +Reason: +Compatibility, +Refresh: '
-                           r'+(?P<rsvp_lsp_enh_local_prot_refresh_interval>[\s\S]+)')
+        p16_1 = regex_engine.compile(r'Enhanced +FRR: (?P<rsvp_lsp_enh_lp_upstream_status>\S+)'
+                                     r' +\(Upstream\), +Reason: +Compatibility, +Refresh: '
+                                     r'+(?P<rsvp_lsp_enh_local_prot_refresh_interval>[\s\S]+)')
 
         # Enhanced FRR: Disabled (Downstream), Reason: Compatibility, Refresh: 30 secs
-        p16_2 = re.compile(r'Enhanced +FRR: (?P<rsvp_lsp_enh_lp_downstream_status>\S+)'
-                           r' +\(Downstream\), +Reason: +Compatibility, +Refresh: '
-                           r'+(?P<rsvp_lsp_enh_local_prot_refresh_interval>[\s\S]+)')
+        p16_2 = regex_engine.compile(r'Enhanced +FRR: (?P<rsvp_lsp_enh_lp_downstream_status>\S+)'
+                                     r' +\(Downstream\), +Reason: +Compatibility, +Refresh: '
+                                     r'+(?P<rsvp_lsp_enh_local_prot_refresh_interval>[\s\S]+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -847,110 +850,110 @@ class ShowMplsLdpParameters(ShowMplsLdpParametersSchema):
         ret_dict = {}
 
         # LDP Parameters:
-        p1 = re.compile(r'^LDP +Parameters:$')
+        p1 = regex_engine.compile(r'^LDP +Parameters:$')
 
         # Role: Active
-        p2 = re.compile(r'^Role: +(?P<role_value>\w+)$')
+        p2 = regex_engine.compile(r'^Role: +(?P<role_value>\w+)$')
 
         # Protocol Version: 1
-        p3 = re.compile(r'^Protocol +Version: +(?P<protocol_version_number>\S+)$')
+        p3 = regex_engine.compile(r'^Protocol +Version: +(?P<protocol_version_number>\S+)$')
 
         # Router ID: 10.4.1.1
-        p4 = re.compile(r'^Router +ID: +(?P<router_id_ip>[\d.]+)$')
+        p4 = regex_engine.compile(r'^Router +ID: +(?P<router_id_ip>[\d.]+)$')
 
         # Null Labels:
-        p5 = re.compile(r'^Null +Label:$')
+        p5 = regex_engine.compile(r'^Null +Label:$')
 
         # IPv4: Implicit
-        p6 = re.compile(r'^IPv4: +(?P<null_labels_ipv4>\w+)$')
+        p6 = regex_engine.compile(r'^IPv4: +(?P<null_labels_ipv4>\w+)$')
 
         # Session:
-        p7 = re.compile(r'^Session:$')
+        p7 = regex_engine.compile(r'^Session:$')
 
         # Hold time: 180 sec
-        p8 = re.compile(r'^Hold +time: +(?P<hold_time_seconds>\d+) +sec$')
+        p8 = regex_engine.compile(r'^Hold +time: +(?P<hold_time_seconds>\d+) +sec$')
 
         # Keepalive interval: 60 sec
-        p9 = re.compile(r'^Keepalive +interval: +(?P<keepalive_interval_seconds>\d+) +sec$')
+        p9 = regex_engine.compile(r'^Keepalive +interval: +(?P<keepalive_interval_seconds>\d+) +sec$')
 
         # Backoff: Initial:15 sec, Maximum:120 sec
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^Backoff: +Initial:(?P<initial_seconds>\d+) +sec'
             r', +Maximum:(?P<maximum_seconds>\d+) +sec$')
 
         # Global MD5 password: Disabled
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^Global +MD5 +password: +(?P<global_md5_password>\w+)$')
 
         # Discovery:
-        p12 = re.compile(r'^Discovery:$')
+        p12 = regex_engine.compile(r'^Discovery:$')
 
         # Link Hellos: Holdtime:15 sec, Interval:5 sec
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r'^Link +Hellos: +Holdtime:(?P<link_hellos_hold_time_seconds>\d+) +sec,'
             r' +Interval:(?P<link_hellos_interval_seconds>\d+) +sec$')
 
         # Targeted Hellos: Holdtime:90 sec, Interval:10 sec
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r'^Targeted +Hellos: +Holdtime:(?P<targeted_hellos_hold_time_seconds>\d+) +sec'
             r', +Interval:(?P<targeted_hellos_interval_seconds>\d+) +sec$')
 
         # Quick-start: Enabled (by default)
-        p15 = re.compile(r'^Quick-start: +(?P<quick_start>.*)$')
+        p15 = regex_engine.compile(r'^Quick-start: +(?P<quick_start>.*)$')
 
         # Transport address:
-        p16 = re.compile(r'^Transport +address:$')
+        p16 = regex_engine.compile(r'^Transport +address:$')
 
         # IPv4: 10.4.1.1
-        p17 = re.compile(r'^IPv4: +(?P<transport_address_ipv4_ip>[\d.]+)$')
+        p17 = regex_engine.compile(r'^IPv4: +(?P<transport_address_ipv4_ip>[\d.]+)$')
 
         # Graceful Restart:
-        p18 = re.compile(r'^Graceful +Restart:$')
+        p18 = regex_engine.compile(r'^Graceful +Restart:$')
 
         # Enabled
-        p19 = re.compile(r'^(?P<graceful_restart_value>(Enabled|Disabled))$')
+        p19 = regex_engine.compile(r'^(?P<graceful_restart_value>(Enabled|Disabled))$')
 
         # Reconnect Timeout:120 sec, Forwarding State Holdtime:180 sec
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r'^Reconnect +Timeout:(?P<reconnect_timeout_seconds>\d+) +sec,'
             r' +Forwarding +State +Holdtime:(?P<forwarding_state_holdtime_seconds>\d+) +sec$')
 
         # NSR: Enabled, Sync-ed
-        p21 = re.compile(r'^NSR: +(?P<nsr_value>\w+)(, +(?P<synced_value>Sync-ed))?$')
+        p21 = regex_engine.compile(r'^NSR: +(?P<nsr_value>\w+)(, +(?P<synced_value>Sync-ed))?$')
 
         # Timeouts:
-        p22 = re.compile(r'^Timeouts:$')
+        p22 = regex_engine.compile(r'^Timeouts:$')
 
         # Housekeeping periodic timer: 10 sec
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r'^Housekeeping +periodic +timer: +(?P<housekeeping_periodic_timer_seconds>\d+) +sec$')
 
         # Local binding: 300 sec
-        p24 = re.compile(r'^Local +binding: +(?P<local_binding_seconds>\d+) +sec$')
+        p24 = regex_engine.compile(r'^Local +binding: +(?P<local_binding_seconds>\d+) +sec$')
 
         # Forwarding state in LSD: 360 sec
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r'^Forwarding +state +in +LSD: +(?P<forwarding_state_lsd_seconds>\d+) +sec$')
 
         # Delay in AF Binding withdrawl from peer: 180 sec
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r'^Delay +in +AF +Binding +Withdrawl +from +peer:'
             r' +(?P<delay_af_binding_peer_seconds>\d+) +sec$')
 
         # Max:
-        p27 = re.compile(r'^Max:$')
+        p27 = regex_engine.compile(r'^Max:$')
 
         # 5000 interfaces (4000 attached, 1000 TE tunnel), 2000 peers
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r'^(?P<max_interface_number>\d+) +interfaces(,| )(\(| )'
             r'((?P<attached_interfaces_number>\d+) +attached(\)|,))?'
             r'((,| )*)?((?P<te_tunnel_number>\d+) +TE +tunnel\))?((,| )*)?((?P<peers_number>\d+) +peers)?')
 
         # OOR state
-        p29 = re.compile(r'^OOR +state$')
+        p29 = regex_engine.compile(r'^OOR +state$')
 
         # Memory: Normal
-        p30 = re.compile(
+        p30 = regex_engine.compile(
             r'^Memory: +(?P<oor_memory_value>(Normal|Major|Critical))$')
 
         # Looping through each line
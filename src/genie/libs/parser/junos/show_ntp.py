@@ -8,9 +8,6 @@ JunOS parsers for the following show commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, ListOf
@@ -18,6 +15,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, ListO
 # pyats
 from pyats.utils.exceptions import SchemaError
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================================
 #  Schema for show ntp associations
@@ -99,11 +99,11 @@ class ShowNtpAssociations(ShowNtpAssociationsSchema):
         # ===============================================================================
         # x10.2.2.2         172.16.229.65     2 -   84  128  271    1.470  -46.760  52.506
         # *gnlab4.int-gw.k 192.168.137.1    3 -    5   64  177    0.192   -0.022   0.091
-        p1 = re.compile(r'^(?P<mode_code>[xo\*\-\+\=]+)? *(?P<remote>[\w\.\:\-]+) +'
-                         r'(?P<refid>[\S]+) +(?P<stratum>\d+) +(?P<type>[blmu\-]+) +'
-                         r'(?P<receive_time>[\d\-]+) +(?P<poll>\d+) +'
-                         r'(?P<reach>\d+) +(?P<delay>[\d\.]+) +'
-                         r'(?P<offset>[\d\.\-]+) +(?P<jitter>[\d\.\-]+)$')
+        p1 = regex_engine.compile(r'^(?P<mode_code>[xo\*\-\+\=]+)? *(?P<remote>[\w\.\:\-]+) +'
+                                   r'(?P<refid>[\S]+) +(?P<stratum>\d+) +(?P<type>[blmu\-]+) +'
+                                   r'(?P<receive_time>[\d\-]+) +(?P<poll>\d+) +'
+                                   r'(?P<reach>\d+) +(?P<delay>[\d\.]+) +'
+                                   r'(?P<offset>[\d\.\-]+) +(?P<jitter>[\d\.\-]+)$')
 
 
         for line in out.splitlines():
@@ -229,21 +229,21 @@ class ShowNtpStatus(ShowNtpStatusSchema):
 
         # status=0644 leap_none, sync_ntp, 4 events, event_peer/strat_chg,
         # assID=0 status=0544 leap_none, sync_local_proto, 4 events, event_peer/strat_chg,
-        p1 = re.compile(r'^(assID\=(?P<ass_id>\d+) *)?status\=(?P<status>\d+) *(?P<leap_status>\w+), +'
-                         r'(?P<synch_source>\w+), +(?P<number_of_events>\d+) +events, +(?P<recent_event>\S+),$')
+        p1 = regex_engine.compile(r'^(assID\=(?P<ass_id>\d+) *)?status\=(?P<status>\d+) *(?P<leap_status>\w+), +'
+                                   r'(?P<synch_source>\w+), +(?P<number_of_events>\d+) +events, +(?P<recent_event>\S+),$')
 
         # reftime=df981acf.bfa97435  Thu, Nov 15 2018 11:18:23.748, poll=6,
-        p2 = re.compile(r'^reftime\=(?P<reftime>[\w\s\,\.\:]+), +poll\=(?P<poll>\d+),$')
+        p2 = regex_engine.compile(r'^reftime\=(?P<reftime>[\w\s\,\.\:]+), +poll\=(?P<poll>\d+),$')
 
         # clock=df981ae8.eb6e7ee8  Thu, Nov 15 2018 11:18:48.919, state=4,
-        p3 = re.compile(r'^clock\=(?P<clock>[\w\s\,\.\:]+), +state\=(?P<state>\d+),$')
+        p3 = regex_engine.compile(r'^clock\=(?P<clock>[\w\s\,\.\:]+), +state\=(?P<state>\d+),$')
 
         # version="ntpd 4.2.0-a Tue Dec 19 21:12:44  2017 (1)", processor="amd64",
         # system="FreeBSDJNPR-11.0-20171206.f4cad52_buil", leap=00, stratum=2,
         # precision=-23, rootdelay=1.434, rootdispersion=82.589, peer=22765,
         # refid=172.16.229.65,
         # offset=67.812, frequency=4.968, jitter=12.270, stability=0.890
-        p4 = re.compile(r'(?P<key>\w+)\=\"?(?P<value>[\w\.\:\s\(\)\-\@\/\_]+)\"?')
+        p4 = regex_engine.compile(r'(?P<key>\w+)\=\"?(?P<value>[\w\.\:\s\(\)\-\@\/\_]+)\"?')
 
         for line in out.splitlines():
             line = line.strip()
@@ -349,8 +349,8 @@ class ShowConfigurationSystemNtpSet(ShowConfigurationSystemNtpSetSchema):
         # set system ntp server 172.16.229.66 routing-instance mgmt_junos
         # set system ntp server 10.145.32.44 routing-instance mgmt_junos
 
-        p1 = re.compile(r'^set +system +ntp +(?P<type>\w+) +(?P<address>[\w\.\:]+)'
-                         r'( *routing-instance +(?P<vrf>\S+))?$')
+        p1 = regex_engine.compile(r'^set +system +ntp +(?P<type>\w+) +(?P<address>[\w\.\:]+)'
+                                   r'( *routing-instance +(?P<vrf>\S+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -415,10 +415,10 @@ class ShowConfigurationSystemNtp(ShowConfigurationSystemNtpSchema):
         ret_dict = {}
 
         # server 10.1.0.1;
-        p1 = re.compile(r'^server +(?P<server_name>[\s\S]+);$')
+        p1 = regex_engine.compile(r'^server +(?P<server_name>[\s\S]+);$')
 
         # source-address 10.1.0.184;
-        p2 = re.compile(r'^source-address +(?P<source_address>[\s\S]+);$')
+        p2 = regex_engine.compile(r'^source-address +(?P<source_address>[\s\S]+);$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -42,6 +42,10 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema, Or, ListOf)
 
+# Parser utils
+from genie.libs.parser.utils import regex_engine
+from genie.libs.parser.utils.junos_structured import StructuredOutputMixin
+
 
 class ShowOspfInterfaceBriefSchema(MetaParser):
     """ Schema for:
@@ -103,7 +107,7 @@ class ShowOspfInterfaceBrief(ShowOspfInterfaceBriefSchema):
         instance = instance if instance else 'master'
 
         # ge-0/0/2.0    BDR    0.0.0.1    10.16.2.2    10.64.4.4     5
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface>\S+) +(?P<state>\S+) '
             r'+(?P<area>\S+) +(?P<dr_id>\S+) +(?P<bdr_id>\S+) +(?P<nbrs_count>\d+)$'
         )
@@ -251,45 +255,45 @@ class ShowOspfInterfaceDetail(ShowOspfInterfaceDetailSchema):
         instance = 'master'
 
         # ge-0/0/2.0    BDR    0.0.0.1        10.64.4.4     5
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface>\S+) +(?P<state>\S+) '
             r'+(?P<area>\S+) +(?P<dr_id>\S+) +(?P<bdr_id>\S+) +(?P<nbrs_count>\d+)$'
         )
 
         # Type: P2P, Address: 172.16.76.25, Mask: 255.255.255.0, MTU: 1200, Cost: 100
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^Type: +(?P<interface_type>\w+), +Address: +(?P<interface_address>[\d.]+)'
             r', +Mask: +(?P<address_mask>[\d.]+), +MTU: +(?P<mtu>\d+), +Cost: +(?P<interface_cost>\d+)$'
         )
 
         # Adj count: 4
-        p3 = re.compile(r'^Adj +count: +(?P<adj_count>\d+)$')
+        p3 = regex_engine.compile(r'^Adj +count: +(?P<adj_count>\d+)$')
 
         # Hello: 10, Dead: 40, ReXmit: 5, Not Stub
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Hello: +(?P<hello_interval>\d+), +Dead: +(?P<dead_interval>\d+), +'
             r'ReXmit: +(?P<retransmit_interval>\d+), +(?P<ospf_stub_type>[\w ]+)$'
         )
 
         # Auth type: None
-        p5 = re.compile(r'^Auth +type: +(?P<authentication_type>[\w ]+)$')
+        p5 = regex_engine.compile(r'^Auth +type: +(?P<authentication_type>[\w ]+)$')
 
         # Protection type: Post Convergence
-        p6 = re.compile(r'^Protection +type: +(?P<protection_type>[\w ]+)$')
+        p6 = regex_engine.compile(r'^Protection +type: +(?P<protection_type>[\w ]+)$')
 
         # Post convergence protection: Enabled, Fate sharing: No, SRLG: No, Node cost: 150
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Post +convergence +protection: +(?P<prot_link>\w+), +Fate +sharing: +'
             r'(?P<prot_fate>\w+), +SRLG: +(?P<prot_srlg>\w+), +Node +cost: +(?P<prot_node>\d+)$'
         )
 
         # Topology default (ID 0) -> Cost: 1000
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Topology +(?P<name>\w+) +\(ID +(?P<id>\d+)\) +-> +Cost: +(?P<metric>\d+)$'
         )
 
         # DR addr: 10.16.2.2, Priority: 128
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^DR +addr: +(?P<dr_address>[\d.]+), +Priority: +(?P<router_priority>\d+)$'
         )
 
@@ -433,22 +437,19 @@ Parser for:
 '''
 
 
-class ShowOspfNeighbor(ShowOspfNeighborSchema):
+class ShowOspfNeighbor(StructuredOutputMixin, ShowOspfNeighborSchema):
     cli_command = ['show ospf neighbor', 'show ospf neighbor instance {name}']
 
     def cli(self, name=None, output=None):
         if not output:
-            if name:
-                out = self.device.execute(self.cli_command[1].format(name=name))
-            else:
-                out = self.device.execute(self.cli_command[0])
+            out = self.device.execute(self._get_command(name=name))
         else:
             out = output
 
         ret_dict = {}
 
         # 10.189.5.94      ge-0/0/0.0             Full      10.189.5.253     128    32
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<neighbor>\S+) +(?P<interface>\S+) +'
             r'(?P<state>\S+) +(?P<id>\S+) +(?P<pri>\d+) +(?P<dead>\d+)$')
 
@@ -558,10 +559,10 @@ class ShowOspfNeighborInstanceAll(ShowOspfNeighborInstanceAllSchema):
         ret_dict = {}
 
         # Instance: master
-        p0 = re.compile(r'^Instance: +(?P<instance_name>\S+)$')
+        p0 = regex_engine.compile(r'^Instance: +(?P<instance_name>\S+)$')
 
         # 10.189.5.94      ge-0/0/0.0             Full      10.189.5.253     128    32
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<neighbor>\S+) +(?P<interface>\S+) +'
             r'(?P<state>\S+) +(?P<id>\S+) +(?P<pri>\d+) +(?P<dead>\d+)$')
 
@@ -663,11 +664,11 @@ class ShowOspfDatabase(ShowOspfDatabaseSchema):
         ret_dict = {}
 
         #OSPF database, Area 0.0.0.8
-        p1 = re.compile(r'^OSPF database, Area +(?P<ospf_area>[\w\.\:\/]+)$')
+        p1 = regex_engine.compile(r'^OSPF database, Area +(?P<ospf_area>[\w\.\:\/]+)$')
 
         #Router   10.36.3.3          10.36.3.3          0x80004d2d    61  0x22 0xa127 2496
         #Router  *10.189.5.252     10.189.5.252     0x80001b9e  1608  0x22 0x1e2  120
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<lsa_type>[a-zA-Z]+) *(?P<our_entry>\*)'
             r'?(?P<lsa_id>[\d\.]+) +(?P<advertising_router>'
             r'[\d\.]+) +(?P<sequence_number>\S+) +(?P<age>\d+) '
@@ -762,23 +763,23 @@ class ShowOspfDatabaseSummary(ShowOspfDatabaseSummarySchema):
         ret_dict = {}
 
         #Area 0.0.0.8:
-        p1 = re.compile(r'^Area +(?P<ospf_area1>[\w\.\/]+):$')
+        p1 = regex_engine.compile(r'^Area +(?P<ospf_area1>[\w\.\/]+):$')
 
         #12 Router LSAs
-        p2 = re.compile(r'^(?P<area_value>\d+) +(?P<area_name>\S+) +LSAs$')
+        p2 = regex_engine.compile(r'^(?P<area_value>\d+) +(?P<area_name>\S+) +LSAs$')
 
         #Externals:
-        p3 = re.compile(r'^(?P<externals>\S+):$')
+        p3 = regex_engine.compile(r'^(?P<externals>\S+):$')
 
         #19 Extern LSAs
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^(?P<external_value>\d+) +(?P<external_name>\S+) +LSAs$')
 
         #Area 0.0.0.8:
-        p5 = re.compile(r'^Area +(?P<ospf_area2>[\w\.\/]+):$')
+        p5 = regex_engine.compile(r'^Area +(?P<ospf_area2>[\w\.\/]+):$')
 
         #Interface ge-0/0/3.0:
-        p6 = re.compile(r'^Interface +(?P<interface>\S+):$')
+        p6 = regex_engine.compile(r'^Interface +(?P<interface>\S+):$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -799,7 +800,7 @@ class ShowOspfDatabaseSummary(ShowOspfDatabaseSummarySchema):
                 ospf_database_entry_intf_list = []
 
                 ospf_database_entry_dict1['ospf-area'] = group['ospf_area1']
-                p1 = re.compile(r'^empty$')
+                p1 = regex_engine.compile(r'^empty$')
                 continue
 
             #12 Router LSAs
@@ -817,8 +818,8 @@ class ShowOspfDatabaseSummary(ShowOspfDatabaseSummarySchema):
                 group = m.groupdict()
                 ospf_database_entry_dict2['@external-heading'] = group[
                     'externals']
-                p1 = re.compile(r'^empty$')
-                p2 = re.compile(r'^empty$')
+                p1 = regex_engine.compile(r'^empty$')
+                p2 = regex_engine.compile(r'^empty$')
                 continue
 
             #19 Extern LSAs
@@ -991,44 +992,44 @@ class ShowOspfDatabaseExternalExtensive(ShowOspfDatabaseExternalExtensiveSchema
         ret_dict = {}
 
         #OSPF AS SCOPE link state database
-        p1 = re.compile(r'^(?P<external_heading>\AOSPF AS[\S\s]+)$')
+        p1 = regex_engine.compile(r'^(?P<external_heading>\AOSPF AS[\S\s]+)$')
 
         #Type       ID               Adv Rtr           Seq      Age  Opt  Cksum  Len
-        p2 = re.compile(r'^(?P<heading>\AType +ID[\S\s]+)$')
+        p2 = regex_engine.compile(r'^(?P<heading>\AType +ID[\S\s]+)$')
 
         #Extern   0.0.0.0          10.34.2.251     0x800019e3  2728  0x22 0x6715  36
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<lsa_type>\S+)\s+(?P<lsa_id>[\d+\.]+)\s+'
             r'(?P<advertising_router>[\d+\.]+)\s+(?P<sequence_number>\S+)'
             r'\s+(?P<age>\d+)\s+(?P<options>[\S]+)\s+(?P<checksum>[\S]+)'
             r'\s+(?P<lsa_length>\d+)$')
 
         #mask 0.0.0.0
-        p4 = re.compile(r'^mask +(?P<address_mask>\S+)$')
+        p4 = regex_engine.compile(r'^mask +(?P<address_mask>\S+)$')
 
         #Topology default (ID 0)
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Topology (?P<ospf_topology_name>\S+) +\(ID +(?P<ospf_topology_id>\d+)\)$'
         )
 
         #Type: 1, Metric: 1, Fwd addr: 0.0.0.0, Tag: 0.0.0.0
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Type: +(?P<type_value>\d+), Metric: +(?P<ospf_topology_metric>\d+), '
             r'Fwd addr: +(?P<forward_address>[\w\.\/]+), '
             r'Tag: +(?P<tag>[\w\.\/]+)$')
 
         #Aging timer 00:14:32
-        p7 = re.compile(r'^Aging timer +(?P<text>[\w\:]+)$')
+        p7 = regex_engine.compile(r'^Aging timer +(?P<text>[\w\:]+)$')
 
         #Installed 00:45:19 ago, expires in 00:14:32, sent 00:45:17 ago
-        p8 = re.compile(r'^Installed +(?P<installed_time>[\w\.\/\:]+) '
-                        r'ago, expires in +(?P<expired_time>[\w\.\/\:]+), '
-                        r'sent +(?P<sent_time>[\w\.\/\:]+) ago$')
+        p8 = regex_engine.compile(r'^Installed +(?P<installed_time>[\w\.\/\:]+) '
+                                  r'ago, expires in +(?P<expired_time>[\w\.\/\:]+), '
+                                  r'sent +(?P<sent_time>[\w\.\/\:]+) ago$')
 
         #Last changed 30w0d 01:34:30 ago, Change count: 1
-        p9 = re.compile(r'Last changed +(?P<installed_time>[\S]+) '
-                        r'+(?P<installed_time2>[\S]+) ago, Change count: '
-                        r'+(?P<lsa_change_count>[\S]+)$')
+        p9 = regex_engine.compile(r'Last changed +(?P<installed_time>[\S]+) '
+                                  r'+(?P<installed_time2>[\S]+) ago, Change count: '
+                                  r'+(?P<lsa_change_count>[\S]+)$')
 
         for line in out.splitlines()[2:]:
             line = line.strip()
@@ -1242,97 +1243,97 @@ class ShowOspfOverview(ShowOspfOverviewSchema):
         spring_dict = {}
 
         #Instance: master
-        p1 = re.compile(r'^Instance: +(?P<instance_name>\S+)$')
+        p1 = regex_engine.compile(r'^Instance: +(?P<instance_name>\S+)$')
 
         #Router ID: 10.189.5.252
-        p2 = re.compile(r'^Router ID: +(?P<ospf_router_id>[\w\.\:\/]+)$')
+        p2 = regex_engine.compile(r'^Router ID: +(?P<ospf_router_id>[\w\.\:\/]+)$')
 
         #Route table index: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Route table index: +(?P<ospf_route_table_index>\d+)$')
 
         #LSA refresh time: 50 minutes
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^LSA refresh time: +(?P<ospf_lsa_refresh_time>\d+) minutes$')
 
         #SPRING: Enabled
-        p5 = re.compile(r'^SPRING: +(?P<ospf_spring_enabled>\S+)$')
+        p5 = regex_engine.compile(r'^SPRING: +(?P<ospf_spring_enabled>\S+)$')
 
         #SRGB Start-Label : 16000, SRGB Index-Range : 8000
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^SRGB +Start-Label : +(?P<ospf_srgb_start_label>\d+), SRGB +Index-Range : '
             r'+(?P<ospf_srgb_index_range>\d+)$')
 
         #SRGB Block Allocation: Success
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^SRGB Block Allocation: +(?P<ospf_srgb_allocation>\S+)$')
 
         #SRGB Start Index : 16000, SRGB Size : 8000, Label-Range: [ 16000, 23999 ]
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^SRGB +Start +Index : +(?P<ospf_srgb_start_index>\d+), +SRGB Size : '
             r'+(?P<ospf_srgb_size>\d+), +Label-Range: \[ +(?P<ospf_srgb_first_label>\d+), '
             r'+(?P<ospf_srgb_last_label>\d+) \]$')
 
         #Node Segments: Enabled
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^Node +Segments: +(?P<ospf_node_segment_enabled>\S+)$')
 
         #Ipv4 Index : 71
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^Ipv4 +Index : +(?P<ospf_node_segment_ipv4_index>\d+)$')
 
         #Post Convergence Backup: Enabled
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^Post +Convergence +Backup: +(?P<ospf_tilfa_enabled>\S+)$')
 
         #Max labels: 3, Max spf: 100, Max Ecmp Backup: 1
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^Max +labels: +(?P<ospf_tilfa_max_labels>\d+), '
             r'Max +spf: +(?P<ospf_tilfa_max_spf>\d+), +Max +Ecmp +Backup: '
             r'+(?P<ospf_tilfa_ecmp_backup>\d+)$')
 
         #Area: 0.0.0.8
-        p13 = re.compile(r'^Area: +(?P<ospf_area>[\w\.\:\/]+)$')
+        p13 = regex_engine.compile(r'^Area: +(?P<ospf_area>[\w\.\:\/]+)$')
 
         #Stub type: Not Stub
-        p14 = re.compile(r'^Stub +type: +(?P<ospf_stub_type>[\S+\s]+)$')
+        p14 = regex_engine.compile(r'^Stub +type: +(?P<ospf_stub_type>[\S+\s]+)$')
 
         #Authentication Type: None
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r'^Authentication +Type: +(?P<authentication_type>\S+)$')
 
         #Area border routers: 0, AS boundary routers: 7
-        p16 = re.compile(r'^Area +border +routers: +(?P<ospf_abr_count>\d+), +'
-                         r'AS +boundary +routers: +(?P<ospf_asbr_count>\d+)$')
+        p16 = regex_engine.compile(r'^Area +border +routers: +(?P<ospf_abr_count>\d+), +'
+                                   r'AS +boundary +routers: +(?P<ospf_asbr_count>\d+)$')
 
         #Up (in full state): 3
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r'^Up +\(in full state\): +(?P<ospf_nbr_up_count>\d+)$')
 
         #Topology: default (ID 0)
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r'^Topology: +(?P<ospf_topology_name>\S+) \(ID +(?P<ospf_topology_id>\d+)\)$'
         )
 
         #Prefix export count: 1
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r'^Prefix +export +count: +(?P<ospf_prefix_export_count>\d+)$')
 
         #Full SPF runs: 173416
-        p20 = re.compile(r'^Full +SPF +runs: +(?P<ospf_full_spf_count>\d+)$')
+        p20 = regex_engine.compile(r'^Full +SPF +runs: +(?P<ospf_full_spf_count>\d+)$')
 
         #SPF delay: 0.200000 sec, SPF holddown: 2 sec, SPF rapid runs: 3
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r'^SPF +delay: +(?P<ospf_spf_delay>[\w\.]+) +sec, +SPF +holddown: '
             r'+(?P<ospf_spf_holddown>[\w\.]+) +sec, +SPF +rapid +runs: +'
             r'(?P<ospf_spf_rapid_runs>[\w\.]+)$')
 
         #Backup SPF: Not Needed
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r'^Backup +SPF: +(?P<ospf_backup_spf_status>[\S\s]+)$')
 
         # Configured overload, expires in 14 seconds
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r'^Configured +overload, +expires +in +'
             r'(?P<ospf_configured_overload_remaining_time>\d+) +\S+$'
         )
@@ -1746,72 +1747,72 @@ class ShowOspfDatabaseAdvertisingRouterSelfDetail(
             out = output
 
         # OSPF database, Area 0.0.0.8
-        p1 = re.compile(r'^OSPF +database, +Area +(?P<ospf_area>[\d\.]+)$')
+        p1 = regex_engine.compile(r'^OSPF +database, +Area +(?P<ospf_area>[\d\.]+)$')
 
         # Router  *10.189.5.252     10.189.5.252     0x80001b9e  1801  0x22 0x1e2  120
         # Network *10.145.0.3         10.36.3.3          0x80000002    65  0x22 0x9958  36
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<lsa_type>[a-zA-Z]+)( *)(?P<lsa_id>\*?[\d\.]+)'
             r'( +)(?P<advertising_router>\S+)( +)(?P<sequence_number>\S+)( +)(?P<age>\S+)'
             r'( +)(?P<options>\S+)( +)(?P<checksum>\S+)( +)(?P<lsa_length>\S+)$'
         )
 
         # bits 0x2, link count 8
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^bits +(?P<bits>\S+), +link +count +(?P<link_count>\d+)$')
 
         # id 10.189.5.253, data 10.189.5.93, Type PointToPoint (1)
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^id +(?P<link_id>[\d\.]+), +data +(?P<link_data>[\d\.]+)'
             r', +Type +(?P<link_type_name>\S+) +\((?P<link_type_value>\S+)\)$')
 
         # Topology count: 0, Default metric: 5
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Topology +count: +(?P<ospf_topology_count>\d+), +Default'
             r' +metric: +(?P<metric>\d+)$')
 
         # Topology default (ID 0)
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Topology +(?P<ospf_topology_name>\S+) +\(ID +(?P<ospf_topology_id>\S+)\)$'
         )
 
         # Type: PointToPoint, Node ID: 10.19.198.239
-        p7 = re.compile(r'^Type: +(?P<link_type_name>\S+), +Node +ID: +'
-                        r'(?P<ospf_lsa_topology_link_node_id>[\d\.]+)$')
+        p7 = regex_engine.compile(r'^Type: +(?P<link_type_name>\S+), +Node +ID: +'
+                                  r'(?P<ospf_lsa_topology_link_node_id>[\d\.]+)$')
 
         # Metric: 1000, Bidirectional
-        p8 = re.compile(r'^Metric: +(?P<ospf_lsa_topology_link_metric>\d+), +'
-                        r'(?P<ospf_lsa_topology_link_state>\S+)$')
+        p8 = regex_engine.compile(r'^Metric: +(?P<ospf_lsa_topology_link_metric>\d+), +'
+                                  r'(?P<ospf_lsa_topology_link_state>\S+)$')
 
         # RtrAddr (1), length 4:
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^(?P<tlv_type_name>[\s\S]+) +\((?P<tlv_type_value>\d+)\)'
             r', +length +(?P<tlv_length>\d+):$')
 
         # 10.189.5.252
-        p10 = re.compile(r'^(?P<formatted_tlv_data>\S+)$')
+        p10 = regex_engine.compile(r'^(?P<formatted_tlv_data>\S+)$')
 
         # Priority 0, 1000Mbps
-        p11 = re.compile(r'^Priority (?P<priority_number>\d+), \S+$')
+        p11 = regex_engine.compile(r'^Priority (?P<priority_number>\d+), \S+$')
 
         # Local 336, Remote 0
-        p12 = re.compile(r'^(?P<formatted_tlv_data>Local +\d+, +Remote +\d+)$')
+        p12 = regex_engine.compile(r'^(?P<formatted_tlv_data>Local +\d+, +Remote +\d+)$')
 
         # mask 255.255.255.255
-        p13 = re.compile(r'^mask +(?P<address_mask>[\d\.]+)$')
+        p13 = regex_engine.compile(r'^mask +(?P<address_mask>[\d\.]+)$')
 
         # Topology default (ID 0)
-        p14 = re.compile(r'^Topology +(?P<ospf_topology_name>\S+) +'
-                         r'\(ID +(?P<ospf_topology_id>\S+)\)$')
+        p14 = regex_engine.compile(r'^Topology +(?P<ospf_topology_name>\S+) +'
+                                   r'\(ID +(?P<ospf_topology_id>\S+)\)$')
 
         # Type: 1, Metric: 50, Fwd addr: 0.0.0.0, Tag: 0.0.0.0
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r'^Type: +(?P<type_value>\d+), +Metric: +(?P<ospf_topology_metric>\d+)'
             r', +Fwd +addr: +(?P<forward_address>[\d\.]+), +Tag: +(?P<tag>[\d\.]+)$'
         )
 
         # attached router 192.168.219.235
-        p16 = re.compile(r'^attached router +(?P<attached_router>\S+)$')
+        p16 = regex_engine.compile(r'^attached router +(?P<attached_router>\S+)$')
 
         ret_dict = {}
 
@@ -2421,97 +2422,97 @@ class ShowOspfDatabaseExtensive(ShowOspfDatabaseExtensiveSchema):
             out = output
 
         # OSPF database, Area 0.0.0.8
-        p1 = re.compile(r'^OSPF +database, +Area +(?P<ospf_area>[\d\.]+)$')
+        p1 = regex_engine.compile(r'^OSPF +database, +Area +(?P<ospf_area>[\d\.]+)$')
 
         # Router  *10.189.5.252     10.189.5.252     0x80001b9e  1801  0x22 0x1e2  120
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<lsa_type>[a-zA-Z]+)( *)(?P<lsa_id>\*?[\d\.]+)'
             r'( +)(?P<advertising_router>\S+)( +)(?P<sequence_number>\S+)( +)(?P<age>\S+)'
             r'( +)(?P<options>\S+)( +)(?P<checksum>\S+)( +)(?P<lsa_length>\S+)$'
         )
 
         # bits 0x2, link count 8
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^bits +(?P<bits>\S+), +link +count +(?P<link_count>\d+)$')
 
         # id 10.189.5.253, data 10.189.5.93, Type PointToPoint (1)
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^id +(?P<link_id>[\d\.]+), +data +(?P<link_data>[\d\.]+)'
             r', +Type +(?P<link_type_name>\S+) +\((?P<link_type_value>\S+)\)$')
 
         # Topology count: 0, Default metric: 5
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Topology +count: +(?P<ospf_topology_count>\d+), +Default'
             r' +metric: +(?P<metric>\d+)$')
 
         # Topology default (ID 0)
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Topology +(?P<ospf_topology_name>\S+) +\(ID +(?P<ospf_topology_id>\S+)\)$'
         )
 
         # Type: PointToPoint, Node ID: 10.19.198.239
-        p7 = re.compile(r'^Type: +(?P<link_type_name>\S+), +Node +ID: +'
-                        r'(?P<ospf_lsa_topology_link_node_id>[\d\.]+)$')
+        p7 = regex_engine.compile(r'^Type: +(?P<link_type_name>\S+), +Node +ID: +'
+                                  r'(?P<ospf_lsa_topology_link_node_id>[\d\.]+)$')
 
         # Metric: 1000, Bidirectional
-        p8 = re.compile(r'^Metric: +(?P<ospf_lsa_topology_link_metric>\d+), +'
-                        r'(?P<ospf_lsa_topology_link_state>\S+)$')
+        p8 = regex_engine.compile(r'^Metric: +(?P<ospf_lsa_topology_link_metric>\d+), +'
+                                  r'(?P<ospf_lsa_topology_link_state>\S+)$')
 
         # RtrAddr (1), length 4:
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^(?P<tlv_type_name>[\s\S]+) +\((?P<tlv_type_value>\d+)\)'
             r', +length +(?P<tlv_length>\d+):$')
 
         # 10.189.5.252
-        p10 = re.compile(r'^(?P<formatted_tlv_data>\S+)$')
+        p10 = regex_engine.compile(r'^(?P<formatted_tlv_data>\S+)$')
 
         # Priority 0, 1000Mbps
-        p11 = re.compile(r'^Priority (?P<priority_number>\d+), \S+$')
+        p11 = regex_engine.compile(r'^Priority (?P<priority_number>\d+), \S+$')
 
         # Local 336, Remote 0
-        p12 = re.compile(r'^(?P<formatted_tlv_data>Local +\d+, +Remote +\d+)$')
+        p12 = regex_engine.compile(r'^(?P<formatted_tlv_data>Local +\d+, +Remote +\d+)$')
 
         # mask 255.255.255.255
-        p13 = re.compile(r'^mask +(?P<address_mask>[\d\.]+)$')
+        p13 = regex_engine.compile(r'^mask +(?P<address_mask>[\d\.]+)$')
 
         # Topology default (ID 0)
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r'^Topology +(?P<ospf_topology_name>\S+) +\(ID +(?P<ospf_topology_id>\S+)\)$'
         )
 
         # Topology default (ID 0) -> Metric: 0
-        p14_1 = re.compile(
+        p14_1 = regex_engine.compile(
             r'^Topology +(?P<ospf_topology_name>\S+) +\(ID +(?P<ospf_topology_id>\S+)\) +'
             r'-> +Metric: +(?P<ospf_topology_metric>\d+)$'
         )
 
         # Type: 1, Metric: 50, Fwd addr: 0.0.0.0, Tag: 0.0.0.0
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r'^Type: +(?P<type_value>\d+), +Metric: +(?P<ospf_topology_metric>\d+)'
             r', +Fwd +addr: +(?P<forward_address>[\d\.]+), +Tag: +(?P<tag>[\d\.]+)$'
         )
 
         # Aging timer 00:18:16
-        p16 = re.compile(r"^Aging timer +(?P<aging_timer>(\S+ ){0,1}[\d\:]+)$")
+        p16 = regex_engine.compile(r"^Aging timer +(?P<aging_timer>(\S+ ){0,1}[\d\:]+)$")
 
         # Installed 00:10:20 ago, expires in 00:49:31, sent 00:10:18 ago
         # Installed 00:10:20 ago, expires in 00:49:31
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"^Installed +(?P<installation_time>(\S+ ){0,1}[\d\:]+) +ago, +expires +in +"
             r"(?P<expiration_time>(\S+ ){0,1}[\d\:]+)(, +sent +(?P<send_time>(\S+ ){0,1}[\d\:]+) +ago)?$"
         )
 
         # Last changed 2w6d 04:50:31 ago, Change count: 196
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^Last +changed +(?P<lsa_changed_time>(\S+ +){0,1}[\d\:]+) +ago, +Change +"
             r"count: +(?P<lsa_change_count>\d+)(, +(?P<database_entry_state>\S+)"
             r"(, +TE +Link +ID: +(?P<database_telink_id>\S+)))?$")
 
         # Gen timer 00:49:49
-        p19 = re.compile(r"^Gen +timer +(?P<generation_timer>\S+)$")
+        p19 = regex_engine.compile(r"^Gen +timer +(?P<generation_timer>\S+)$")
 
         # attached router 10.169.14.240
-        p20 = re.compile(r'^attached +router +(?P<attached_router>[\d\.]+)$')
+        p20 = regex_engine.compile(r'^attached +router +(?P<attached_router>[\d\.]+)$')
 
         ret_dict = {}
 
@@ -3364,26 +3365,26 @@ class ShowOspfNeighborExtensive(ShowOspfNeighborExtensiveSchema):
             out = output
 
         # 10.189.5.94      ge-0/0/0.0             Full      10.189.5.253     128    39
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<neighbor_address>[\d\.]+) +(?P<interface_name>\S+)'
             r' +(?P<ospf_neighbor_state>\S+) +(?P<neighbor_id>[\d\.]+) +'
             r'(?P<neighbor_priority>\d+) +(?P<activity_timer>\d+)$')
 
         # Area 0.0.0.8, opt 0x52, DR 0.0.0.0, BDR 0.0.0.0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^Area +(?P<ospf_area>[\d\.]+), +opt +(?P<options>\S+),'
             r' +DR +(?P<dr_address>[\.\d]+), +BDR +(?P<bdr_address>[\.\d]+)$')
 
         # Up 3w0d 16:50:35, adjacent 3w0d 16:50:35
-        p3 = re.compile(r'^Up +(?P<neighbor_up_time>\S+ +[\d:]+), +adjacent +'
-                        r'(?P<neighbor_adjacency_time>\S+ +[\d:]+)$')
+        p3 = regex_engine.compile(r'^Up +(?P<neighbor_up_time>\S+ +[\d:]+), +adjacent +'
+                                  r'(?P<neighbor_adjacency_time>\S+ +[\d:]+)$')
 
         #     28985       BVL         Protected
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^(?P<label>\d+) +(?P<flags>\S+) + (?P<adj_sid_type>\S+)$')
 
         # Topology default (ID 0) -> Bidirectional
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Topology +(?P<ospf_topology_name>\S+) +\(ID +(?P<ospf_topology_id>\d+)\)'
             r' +-> +(?P<ospf_neighbor_topology_state>\S+)$')
 
@@ -3528,37 +3529,37 @@ class ShowOspfInterfaceExtensive(ShowOspfInterfaceExtensiveSchema):
             out = output
 
         # ge-0/0/0.0          PtToPt  0.0.0.8         0.0.0.0         0.0.0.0            1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface_name>\S+) +(?P<ospf_interface_state>\S+)'
             r' +(?P<ospf_area>[\d\.]+) +(?P<dr_id>[\d\.]+) +(?P<bdr_id>[\d\.]+) +'
             r'(?P<neighbor_count>\d+)$')
 
         # Type: P2P, Address: 10.189.5.93, Mask: 255.255.255.252, MTU: 1500, Cost: 5
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^Type: +(?P<interface_type>\S+), +Address: +(?P<interface_address>[\w\.\:]+)'
             r', +Mask: +(?P<address_mask>[\d\.]+), +MTU: +(?P<mtu>\d+), +Cost: +(?P<interface_cost>\d+)$'
         )
 
         # Adj count: 1
         # Adj count: 0, Passive
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Adj +count: +(?P<adj_count>\d+)(, +(?P<passive>\S+))?$')
 
         # Hello: 10, Dead: 40, ReXmit: 5, Not Stub
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Hello: +(?P<hello_interval>\d+), +Dead: +(?P<dead_interval>\d+)'
             r', +ReXmit: +(?P<retransmit_interval>\d+), +(?P<ospf_stub_type>.+)$'
         )
 
         # Auth type: None
-        p5 = re.compile(r'^Auth +type: +(?P<authentication_type>\S+)$')
+        p5 = regex_engine.compile(r'^Auth +type: +(?P<authentication_type>\S+)$')
 
         # Protection type: Post Convergence
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Protection +type: +(?P<ospf_interface_protection_type>.+)$')
 
         # Post convergence protection: Enabled, Fate sharing: No, SRLG: No, Node cost: 100
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Post +convergence +protection: +(?P<ospf_interface_tilfa_prot_link>\S+)'
             r', +Fate +sharing: +(?P<ospf_interface_tilfa_prot_srlg>\S+), +SRLG: +'
             r'(?P<ospf_interface_tilfa_prot_fate>\S+), +Node +cost: +'
@@ -3566,14 +3567,14 @@ class ShowOspfInterfaceExtensive(ShowOspfInterfaceExtensiveSchema):
 
         # Topology default (ID 0) -> Cost: 5
         # Topology default (ID 0) -> Passive, Cost: 100
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Topology +(?P<ospf_topology_name>\S+) +\(ID +(?P<ospf_topology_id>\d+)\)'
             r' +->(?P<ospf_topology_passive> +Passive,)? +Cost: +(?P<ospf_topology_metric>\d+)$'
         )
 
         # DR addr: 10.189.5.252, Priority: 128
-        p9 = re.compile(r'^DR +addr: +(?P<dr_address>[\d\.]+), +Priority: +'
-                        r'(?P<router_priority>\d+)$')
+        p9 = regex_engine.compile(r'^DR +addr: +(?P<dr_address>[\d\.]+), +Priority: +'
+                                  r'(?P<router_priority>\d+)$')
 
         ret_dict = {}
 
@@ -3809,13 +3810,13 @@ class ShowOspfRouteBrief(ShowOspfRouteBriefSchema):
         # 10.19.198.28/30    Intra Network    IP         1005 ge-0/0/0.0    10.189.5.94
         # 2568 (S=0)         Intra Network    Mpls          0 ge-0/0/1.0    10.169.14.121
         # 10.169.14.120/30  Intra Network    IP          100 ge-0/0/1.0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<address_prefix>[\d\.\/]+( \(S=\d+\))?) +(?P<route_path_type>\S+)'
             r' +(?P<route_type>\S+|(AS BR)) +(?P<next_hop_type>\S+) +(?P<interface_cost>\S+)'
             r' +(?P<interface_name>\S+)( +(?P<interface_address>[\d\.]+))?$')
 
         # Bkup SPRING     ge-0/0/0.0    10.189.5.94
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<ospf_backup_next_hop_type>Bkup +\S+) +'
             r'(?P<ospf_backup_next_hop_interface>\S+) +(?P<ospf_backup_next_hop_address>[\d\.]+)$'
         )
@@ -3991,37 +3992,37 @@ class ShowOspfDatabaseNetworkLsaidDetail(
             out = output
 
         # Type       ID               Adv Rtr           Seq      Age  Opt  Cksum  Len
-        p0 = re.compile(r'^(?P<heading>Type \s+ID[\s\S]+)$')
+        p0 = regex_engine.compile(r'^(?P<heading>Type \s+ID[\s\S]+)$')
 
         # OSPF database, Area 192.168.76.0
-        p1 = re.compile(r'^OSPF +database, +Area +(?P<ospf_area>\S+)$')
+        p1 = regex_engine.compile(r'^OSPF +database, +Area +(?P<ospf_area>\S+)$')
 
         # Network *10.69.197.1    192.168.219.235   0x80000026  1730  0x22 0x1b56  36
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<lsa_type>\S+) *(?P<our_entry>\*)?(?P<lsa_id>[\d\.]+) '
             r'+(?P<advertising_router>\S+) +(?P<sequence_number>\S+) +'
             r'(?P<age>\S+) +(?P<options>\S+) +(?P<checksum>\S+) +'
             r'(?P<lsa_length>\S+)$')
 
         # mask 255.255.255.128
-        p3 = re.compile(r'^mask +(?P<address_mask>\S+)$')
+        p3 = regex_engine.compile(r'^mask +(?P<address_mask>\S+)$')
 
         # attached router 192.168.219.235
-        p4 = re.compile(r'^attached router +(?P<attached_router>\S+)$')
+        p4 = regex_engine.compile(r'^attached router +(?P<attached_router>\S+)$')
 
         # Topology default (ID 0)
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Topology +(?P<ospf_topology_name>\S+) +\(ID +(?P<ospf_topology_id>\S+)+\)$'
         )
 
         # Type: Transit, Node ID: 192.168.219.236
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Type: +(?P<link_type_name>\S+)+, '
             r'+Node +ID: +(?P<ospf_lsa_topology_link_node_id>\S+)$')
 
         # Metric: 0, Bidirectional
-        p7 = re.compile(r'^Metric: +(?P<ospf_lsa_topology_link_metric>\S+)+, '
-                        r'+(?P<ospf_lsa_topology_link_state>\S+)$')
+        p7 = regex_engine.compile(r'^Metric: +(?P<ospf_lsa_topology_link_metric>\S+)+, '
+                                  r'+(?P<ospf_lsa_topology_link_state>\S+)$')
 
         ret_dict = {}
 
@@ -4216,18 +4217,18 @@ class ShowOspfRouteNetworkExtensive(ShowOspfRouteNetworkExtensiveSchema):
         ret_dict = {}
 
         # Topology default Route Table:
-        p1 = re.compile(r'^Topology +(?P<ospf_topology_name>\S+) +Route +Table:$')
+        p1 = regex_engine.compile(r'^Topology +(?P<ospf_topology_name>\S+) +Route +Table:$')
 
         #10.1.0.0/24         Ext2  Network    IP            0 ge-0/0/0.0    10.70.0.4
-        p2 = re.compile(r'^(?P<address_prefix>\S+) +(?P<route_path_type>\S+) '
-                        r'+(?P<route_type>\S+) +(?P<next_hop_type>\S+) +'
-                        r'(?P<interface_cost>\d+) +(?P<interface_name>\S+)'
-                        r'( +(?P<interface_address>\S+))?$')
+        p2 = regex_engine.compile(r'^(?P<address_prefix>\S+) +(?P<route_path_type>\S+) '
+                                  r'+(?P<route_type>\S+) +(?P<next_hop_type>\S+) +'
+                                  r'(?P<interface_cost>\d+) +(?P<interface_name>\S+)'
+                                  r'( +(?P<interface_address>\S+))?$')
 
         #area 0.0.0.0, origin 10.64.4.4, priority medium
-        p3 = re.compile(r'^area +(?P<ospf_area>[\d\.]+)+, +origin '
-                        r'+(?P<route_origin>[\d\.]+), +priority +'
-                        r'(?P<route_priority>\w+)$')
+        p3 = regex_engine.compile(r'^area +(?P<ospf_area>[\d\.]+)+, +origin '
+                                  r'+(?P<route_origin>[\d\.]+), +priority +'
+                                  r'(?P<route_priority>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4347,14 +4348,14 @@ class ShowOspfDatabaseOpaqueArea(ShowOspfDatabaseOpaqueAreaSchema):
         ret_dict = {}   
   
         # OSPF database, Area 0.0.0.8
-        p1 = re.compile(r'^OSPF database, Area +(?P<ospf_area>\S+)$')
+        p1 = regex_engine.compile(r'^OSPF database, Area +(?P<ospf_area>\S+)$')
       
         # OpaqArea 10.1.0.1          10.49.194.125    0x80000002   359  0x22 0x6f5d  28
         # OpaqArea*10.1.0.1          10.34.2.250     0x80000003   227  0x22 0xa11a  28
-        p2 = re.compile(r'^(?P<lsa_type>[a-zA-Z]+) *(?P<lsa_id>\*?[\d\.]+) +' 
-                        r'(?P<advertising_router>\S+) +(?P<sequence_number>\S+) +' 
-                        r'(?P<age>\S+) +(?P<options>\S+) +(?P<checksum>\S+) +' 
-                        r'(?P<lsa_length>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type>[a-zA-Z]+) *(?P<lsa_id>\*?[\d\.]+) +' 
+                                  r'(?P<advertising_router>\S+) +(?P<sequence_number>\S+) +' 
+                                  r'(?P<age>\S+) +(?P<options>\S+) +(?P<checksum>\S+) +' 
+                                  r'(?P<lsa_length>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4472,21 +4473,21 @@ class ShowOspfRoutePrefix(ShowOspfRoutePrefixSchema):
         ret_dict = {}
 
         # Topology default Route Table:
-        p1 = re.compile(r'^Topology +(?P<ospf_topology_name>\S+) +Route +Table:$')
+        p1 = regex_engine.compile(r'^Topology +(?P<ospf_topology_name>\S+) +Route +Table:$')
 
         #10.1.0.0/24         Ext2  Network    IP            0 ge-0/0/0.0    10.70.0.4
-        p2 = re.compile(r'^(?P<address_prefix>\S+) +(?P<route_path_type>\S+) '
-                        r'+(?P<route_type>\S+) +(?P<next_hop_type>\S+) +'
-                        r'(?P<interface_cost>\d+) +(?P<interface_name>\S+)'
-                        r'( +(?P<interface_address>\S+))?$')
+        p2 = regex_engine.compile(r'^(?P<address_prefix>\S+) +(?P<route_path_type>\S+) '
+                                  r'+(?P<route_type>\S+) +(?P<next_hop_type>\S+) +'
+                                  r'(?P<interface_cost>\d+) +(?P<interface_name>\S+)'
+                                  r'( +(?P<interface_address>\S+))?$')
 
         #                                                    ge-0/0/4.0    10.0.0.2
-        p2_1 = re.compile(r'^(?P<interface_name>[a-z]{2}-\d+/\d+/\d+(\.\d+))?\s+(?P<interface_address>\d+.\d+\.\d+\.\d+)$')
+        p2_1 = regex_engine.compile(r'^(?P<interface_name>[a-z]{2}-\d+/\d+/\d+(\.\d+))?\s+(?P<interface_address>\d+.\d+\.\d+\.\d+)$')
 
         #area 0.0.0.0, origin 10.64.4.4, priority medium
-        p3 = re.compile(r'^area +(?P<ospf_area>[\d\.]+)+, +origin '
-                        r'+(?P<route_origin>[\d\.]+), +priority +'
-                        r'(?P<route_priority>\w+)$')
+        p3 = regex_engine.compile(r'^area +(?P<ospf_area>[\d\.]+)+, +origin '
+                                  r'+(?P<route_origin>[\d\.]+), +priority +'
+                                  r'(?P<route_priority>\w+)$')
 
         ospf_topology_name = ''
 
@@ -4648,50 +4649,50 @@ class ShowOspfStatistics(ShowOspfStatisticsSchema):
             out = output
 
         #Packet type             Total                  Last 5 seconds
-        p0 = re.compile(r'^(?P<heading>\APacket +type[\S\s]+)$')
+        p0 = regex_engine.compile(r'^(?P<heading>\APacket +type[\S\s]+)$')
 
         #Hello        6202169       5703920           0             3
-        p1 = re.compile(r'^(?P<ospf_packet_type>\S+) +(?P<packets_sent>\d+) '
-                        r'+(?P<packets_received>\d+) +'
-                        r'(?P<packets_sent_5seconds>\d+) '
-                        r'+(?P<packets_received_5seconds>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<ospf_packet_type>\S+) +(?P<packets_sent>\d+) '
+                                  r'+(?P<packets_received>\d+) +'
+                                  r'(?P<packets_sent_5seconds>\d+) '
+                                  r'+(?P<packets_received_5seconds>\d+)$')
 
         #DBDs retransmitted     :               203656, last 5 seconds :          0
-        p2 = re.compile(r'^DBDs retransmitted +: +(?P<dbds_retransmit>\d+), '
-                        r'+last +5 +seconds +: +(?P<dbds_retransmit_5seconds>\d+)$')
+        p2 = regex_engine.compile(r'^DBDs retransmitted +: +(?P<dbds_retransmit>\d+), '
+                                  r'+last +5 +seconds +: +(?P<dbds_retransmit_5seconds>\d+)$')
   
         #LSAs flooded           :             66582263, last 5 seconds :          0
-        p3 = re.compile(r'^LSAs flooded +: +(?P<lsas_flooded>\d+), '
-                        r'+last +5 +seconds +: +(?P<lsas_flooded_5seconds>\d+)$')
+        p3 = regex_engine.compile(r'^LSAs flooded +: +(?P<lsas_flooded>\d+), '
+                                  r'+last +5 +seconds +: +(?P<lsas_flooded_5seconds>\d+)$')
 
         #LSAs flooded high-prio :            375568998, last 5 seconds :          0
-        p4 = re.compile(r'^LSAs flooded high-prio +: +(?P<lsas_high_prio_flooded>\d+), '
-                        r'+last +5 +seconds +: +(?P<lsas_high_prio_flooded_5seconds>\d+)$')
+        p4 = regex_engine.compile(r'^LSAs flooded high-prio +: +(?P<lsas_high_prio_flooded>\d+), '
+                                  r'+last +5 +seconds +: +(?P<lsas_high_prio_flooded_5seconds>\d+)$')
 
         #LSAs retransmitted     :              8064643, last 5 seconds :          0
-        p5 = re.compile(r'^LSAs retransmitted +: +(?P<lsas_retransmit>\d+), '
-                        r'+last +5 +seconds +: +(?P<lsas_retransmit_5seconds>\d+)$')
+        p5 = regex_engine.compile(r'^LSAs retransmitted +: +(?P<lsas_retransmit>\d+), '
+                                  r'+last +5 +seconds +: +(?P<lsas_retransmit_5seconds>\d+)$')
 
         #LSAs transmitted to nbr:              3423982, last 5 seconds :          0
-        p6 = re.compile(r'^LSAs transmitted to nbr+: +(?P<lsas_nbr_transmit>\d+), '
-                        r'+last +5 +seconds +: +(?P<lsas_nbr_transmit_5seconds>\d+)$')
+        p6 = regex_engine.compile(r'^LSAs transmitted to nbr+: +(?P<lsas_nbr_transmit>\d+), '
+                                  r'+last +5 +seconds +: +(?P<lsas_nbr_transmit_5seconds>\d+)$')
 
         #LSAs requested         :                 3517, last 5 seconds :          0
-        p7 = re.compile(r'^LSAs requested +: +(?P<lsas_requested>\d+), '
-                        r'+last +5 +seconds +: +(?P<lsas_requested_5seconds>\d+)$')
+        p7 = regex_engine.compile(r'^LSAs requested +: +(?P<lsas_requested>\d+), '
+                                  r'+last +5 +seconds +: +(?P<lsas_requested_5seconds>\d+)$')
 
         #LSAs acknowledged      :            225554974, last 5 seconds :          0
-        p8 = re.compile(r'^LSAs acknowledged +: +(?P<lsas_acknowledged>\d+), +last '
-                        r'+5 +seconds +: +(?P<lsas_acknowledged_5seconds>\d+)$')
+        p8 = regex_engine.compile(r'^LSAs acknowledged +: +(?P<lsas_acknowledged>\d+), +last '
+                                  r'+5 +seconds +: +(?P<lsas_acknowledged_5seconds>\d+)$')
 
         #Flood queue depth      :               0
         #Total rexmit entries   :               0
         #db summaries           :               0
         #lsreq entries          :               0
-        p9 = re.compile(r'^(?P<pattern>[\w\s]+): +(?P<value>\d+)$')
+        p9 = regex_engine.compile(r'^(?P<pattern>[\w\s]+): +(?P<value>\d+)$')
         
         #12 subnet mismatches
-        p10 = re.compile(r'^(?P<subnet_mismatch_error>\d+) +subnet +mismatches$')
+        p10 = regex_engine.compile(r'^(?P<subnet_mismatch_error>\d+) +subnet +mismatches$')
 
         ret_dict = {}
 
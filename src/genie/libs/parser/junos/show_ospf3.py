@@ -16,13 +16,15 @@ Parser for the following show commands:
     * show ospf3 neighbor instance {instance_name}
     * show ospf3 neighbor instance all
 '''
-import re
 
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowOspf3InterfaceSchema(MetaParser):
     '''schema = {
@@ -67,7 +69,7 @@ class ShowOspf3Interface(ShowOspf3InterfaceSchema):
             out = output
 
         # ge-0/0/0.0          PtToPt  0.0.0.8         0.0.0.0         0.0.0.0            1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface_name>\S+) +(?P<ospf_interface_state>\S+)'
             r' +(?P<ospf_area>[0-9]{1,3}(\.[0-9]{1,3}){3}) +(?P<dr_id>[0-9]{1,3}'
             r'(\.[0-9]{1,3}){3}) +(?P<bdr_id>[0-9]{1,3}(\.[0-9]{1,3}){3}) +(?P<neighbor_count>\S+)$'
@@ -172,24 +174,24 @@ class ShowOspf3NeighborExtensive(ShowOspf3NeighborExtensiveSchema):
         ret_dict = {}
 
         #10.189.5.253     ge-0/0/0.0             Full      128     35
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<neighborid>[\w\.\:\/]+) +(?P<interfacename>\S+) '
             r'+(?P<ospfneighborstate>\S+) +(?P<pri>\S+) +(?P<dead>\d+)$')
 
         #Neighbor-address fe80::250:56ff:fe8d:53c0
-        p2 = re.compile(r'^Neighbor-address +(?P<neighbor_address>\S+)$')
+        p2 = regex_engine.compile(r'^Neighbor-address +(?P<neighbor_address>\S+)$')
 
         #Area 0.0.0.8, opt 0x13, OSPF3-Intf-Index 2
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Area +(?P<area>\S+), opt +(?P<opt>\S+), OSPF3-Intf-Index +(?P<ospf3>\d+)$'
         )
 
         #DR-ID 0.0.0.0, BDR-ID 0.0.0.0
-        p4 = re.compile(r'^DR-ID +(?P<drid>\S+), BDR-ID +(?P<bdrid>\S+)$')
+        p4 = regex_engine.compile(r'^DR-ID +(?P<drid>\S+), BDR-ID +(?P<bdrid>\S+)$')
 
         #Up 3w0d 17:07:00, adjacent 3w0d 17:07:00
         #Up 00:00:08
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Up +(?P<up>\S+( +[\d\:]+)?)(, +adjacent +(?P<adjacent>\S+ +[\d\:]+))?$'
         )
 
@@ -309,11 +311,11 @@ class ShowOspf3Neighbor(ShowOspf3NeighborSchema):
         ret_dict = {}
 
         #10.189.5.253     ge-0/0/0.0             Full      128     35
-        p1 = re.compile(r'^(?P<id>[\d\.]+) +(?P<interface>\S+) '
-                        r'+(?P<state>\S+) +(?P<pri>\S+) +(?P<dead>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<id>[\d\.]+) +(?P<interface>\S+) '
+                                  r'+(?P<state>\S+) +(?P<pri>\S+) +(?P<dead>\d+)$')
 
         #Neighbor-address fe80::250:56ff:fe8d:53c0
-        p2 = re.compile(r'^Neighbor-address +(?P<neighbor_address>\S+)$')
+        p2 = regex_engine.compile(r'^Neighbor-address +(?P<neighbor_address>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -445,20 +447,20 @@ class ShowOspf3Database(ShowOspf3DatabaseSchema):
             out = output
 
         #    OSPF3 database, Area 0.0.0.8
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^OSPF3( +)database,( +)Area( +)'
             r'(?P<ospf_area>(\*{0,1})[0-9]{1,3}(\.[0-9]{1,3}){3})$')
 
         # Type       ID               Adv Rtr           Seq         Age  Cksum  Len
         # Router      0.0.0.0          10.34.2.250     0x800018ed  2407  0xaf2d  56
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<lsa_type>\S+) +(?P<lsa_id>(\*{0,1})[0-9]{1,3}'
             r'(\.[0-9]{1,3}){3}) +(?P<advertising_router>[0-9]{1,3}(\.[0-9]{1,3})'
             r'{3}) +(?P<sequence_number>\S+) +(?P<age>\d+) +(?P<checksum>\S+) +(?P<lsa_length>\d+)$'
         )
 
         # OSPF3 Link-Local database, interface ge-0/0/0.0 Area 0.0.0.8
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^OSPF3( +)Link-Local( +)database,( +)interface( +)'
             r'(?P<ospf_intf>\S+)( +)Area( +)(?P<ospf_area>[0-9]{1,3}(\.[0-9]{1,3}){3})$'
         )
@@ -577,50 +579,50 @@ class ShowOspf3InterfaceExtensive(ShowOspf3InterfaceExtensiveSchema):
         ret_dict = {}
 
         # ge-0/0/0.0          PtToPt  0.0.0.8         0.0.0.0         0.0.0.0            1
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface_name>\S+)( +)(?P<ospf_interface_state>\S+)'
             r'( +)(?P<ospf_area>[\d\.]+)( +)(?P<dr_id>[\d\.]+)( +)'
             r'(?P<bdr_id>[\d\.]+)( +)(?P<neighbor_count>\d+)$')
 
         # Address fe80::250:56ff:fe8d:c829, Prefix-length 64
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'Address( +)(?P<interface_address>\S+),( +)Prefix-length'
             r'( +)(?P<prefix_length>\d+)')
 
         # OSPF3-Intf-index 2, Type P2P, MTU 1500, Cost 5
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^OSPF3-Intf-index( +)(?P<ospf3_interface_index>\d+),( +)'
             r'Type( +)(?P<interface_type>\S+),( +)MTU( +)(?P<mtu>\d+),( +)Cost( +)'
             r'(?P<interface_cost>\d+)$')
 
         # Adj count: 1, Router LSA ID: 0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Adj( +)count:( +)(?P<adj_count>\d+),( +)Router( +)LSA'
             r'( +)ID:( +)(?P<ospf3_router_lsa_id>\S+)(, \S+)?$')
 
         # Hello 10, Dead 40, ReXmit 5, Not Stub
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Hello( +)(?P<hello_interval>\d+),( +)Dead( +)'
             r'(?P<dead_interval>\d+),( +)ReXmit( +)(?P<retransmit_interval>\d+),'
             r'( +)(?P<ospf_stub_type>(\S+ ){0,1}\S+)$')
 
         # Protection type: None
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Protection( +)type:( +)(?P<ospf_interface_protection_type>\S+)$'
         )
 
         #   OSPF3-Intf-index 1, Type LAN, MTU 65535, Cost 0, Priority 128
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^OSPF3-Intf-index( +)(?P<ospf3_interface_index>\d+),( +)'
             r'Type( +)(?P<interface_type>\S+),( +)MTU( +)(?P<mtu>\d+),( +)Cost( +)'
             r'(?P<interface_cost>\d+),( +)Priority( +)(?P<router_priority>\d+)$'
         )
 
         # DR addr fe80::250:560f:fc8d:7c08
-        p8 = re.compile(r'^DR( +)addr( +)(?P<dr_address>\S+)$')
+        p8 = regex_engine.compile(r'^DR( +)addr( +)(?P<dr_address>\S+)$')
 
         # DR addr fe80::250:560f:fc8d:7c08 BDR addr fe80::250:560f:fc8d:7c08
-        p9 = re.compile(r'^DR addr +(?P<dr_address>\S+), BDR addr +(?P<br_address>\S+)$')
+        p9 = regex_engine.compile(r'^DR addr +(?P<dr_address>\S+), BDR addr +(?P<br_address>\S+)$')
 
         # Validate each dictionary in list
         for line in out.splitlines():
@@ -823,38 +825,38 @@ class ShowOspf3DatabaseExternalExtensive(
         ret_dict = {}
 
         # Extern      0.0.0.1          10.34.2.250     0x8000178e  1412  0x3c81  28
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<lsa_type>\S+) +(?P<lsa_id>(\*{0,1})[\d\.]+) +'
             r'(?P<advertising_router>[\d\.]+) +(?P<sequence_number>\S+) +(?P<age>\d+)'
             r' +(?P<checksum>\S+) +(?P<lsa_length>\d+)$')
 
         # Prefix ::/0
-        p2 = re.compile(r'^Prefix +(?P<ospf3_prefix>\S+)$')
+        p2 = regex_engine.compile(r'^Prefix +(?P<ospf3_prefix>\S+)$')
 
         # Prefix-options 0x0, Metric 1, Type 1,
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Prefix-options +(?P<ospf3_prefix_options>\S+),'
             r' Metric +(?P<metric>\d+), +Type +(?P<type_value>\d+),$')
 
         # Aging timer 00:36:27
-        p4 = re.compile(r'^Aging +timer +(?P<aging_timer>(\S+ ){0,1}[\d:]+)$')
+        p4 = regex_engine.compile(r'^Aging +timer +(?P<aging_timer>(\S+ ){0,1}[\d:]+)$')
 
         # Gen timer 00:49:49
-        p5 = re.compile(r'^Gen +timer +(?P<generation_timer>\S+)$')
+        p5 = regex_engine.compile(r'^Gen +timer +(?P<generation_timer>\S+)$')
 
         # Installed 00:23:26 ago, expires in 00:36:28, sent 00:23:24 ago
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Installed +(?P<installation_time>(\S+ ){0,1}[\d:]+)'
             r' ago, +expires +in +(?P<expiration_time>(\S+ ){0,1}[\d:]+),'
             r' sent +(?P<send_time>(\S+ ){0,1}[\d:]+) +ago$')
 
         # Last changed 29w5d 21:04:29 ago, Change count: 1
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^Last +changed +(?P<lsa_changed_time>(\S+ ){0,1}[\d:]+)'
             r' ago, +Change +count: +(?P<lsa_change_count>\d+)$')
 
         # Last changed 3w0d 17:02:47 ago, Change count: 2, Ours
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Last +changed +(?P<lsa_changed_time>(\S+ ){0,1}[\d:]+)'
             r' ago, +Change +count: +(?P<lsa_change_count>\d+), +(?P<database_entry_state>\S+)$'
         )
@@ -1060,60 +1062,60 @@ class ShowOspf3Overview(ShowOspf3OverviewSchema):
         ret_dict = {}
 
         #Instance: master
-        p1 = re.compile(r'^Instance: +(?P<instance_name>\S+)$')
+        p1 = regex_engine.compile(r'^Instance: +(?P<instance_name>\S+)$')
 
         #Router ID: 10.189.5.252
-        p2 = re.compile(r'^Router ID: +(?P<ospf_router_id>[\w\.\:\/]+)$')
+        p2 = regex_engine.compile(r'^Router ID: +(?P<ospf_router_id>[\w\.\:\/]+)$')
 
         #Route table index: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Route table index: +(?P<ospf_route_table_index>\d+)$')
 
         #LSA refresh time: 50 minutes
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^LSA refresh time: +(?P<ospf_lsa_refresh_time>\d+) minutes$')
 
         #Post Convergence Backup: Disabled
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Post Convergence Backup: +(?P<ospf_tilfa_enabled>\S+)$')
 
         #Area: 0.0.0.8
-        p7 = re.compile(r'^Area: +(?P<ospf_area>[\w\.\:\/]+)$')
+        p7 = regex_engine.compile(r'^Area: +(?P<ospf_area>[\w\.\:\/]+)$')
 
         #Stub type: Not Stub
-        p8 = re.compile(r'^Stub type: +(?P<ospf_stub_type>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^Stub type: +(?P<ospf_stub_type>[\S\s]+)$')
 
         #Area border routers: 0, AS boundary routers: 5
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^Area border routers: +(?P<ospf_abr_count>\d+), AS boundary routers: +(?P<ospf_asbr_count>\d+)$'
         )
 
         #Up (in full state): 2
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^Up \(in full state\): +(?P<ospf_nbr_up_count>\d+)$')
 
         #Topology: default (ID 0)
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^Topology: +(?P<ospf_topology_name>\S+) \(ID +(?P<ospf_topology_id>\d+)\)$'
         )
 
         #Prefix export count: 1
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^Prefix export count: +(?P<ospf_prefix_export_count>\d+)$')
 
         #Full SPF runs: 1934
-        p13 = re.compile(r'^Full SPF runs: +(?P<ospf_full_spf_count>\d+)$')
+        p13 = regex_engine.compile(r'^Full SPF runs: +(?P<ospf_full_spf_count>\d+)$')
 
         #SPF delay: 0.200000 sec, SPF holddown: 2 sec, SPF rapid runs: 3
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r'^SPF delay: +(?P<ospf_spf_delay>[\w\.\:\/]+) sec, SPF holddown: +(?P<ospf_spf_holddown>[\w\.]+) sec, SPF rapid runs: +(?P<ospf_spf_rapid_runs>[\w\.]+)$'
         )
 
         #Backup SPF: Not Needed
-        p15 = re.compile(r'^Backup SPF: +(?P<ospf_backup_spf_status>[\S\s]+)$')
+        p15 = regex_engine.compile(r'^Backup SPF: +(?P<ospf_backup_spf_status>[\S\s]+)$')
 
         # Configured overload, expires in 14 seconds
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r'^Configured +overload, +expires +in +'
             r'(?P<ospf_configured_overload_remaining_time>\d+) +\S+$'
         )
@@ -1522,100 +1524,100 @@ class ShowOspf3DatabaseExtensive(ShowOspf3DatabaseExtensiveSchema):
         self.state = None
 
         #    OSPF3 database, Area 0.0.0.8
-        p1 = re.compile(r"^OSPF3( +)database,( +)Area( +)"
-                        r"(?P<ospf_area>[\d\.]+)$")
+        p1 = regex_engine.compile(r"^OSPF3( +)database,( +)Area( +)"
+                                  r"(?P<ospf_area>[\d\.]+)$")
 
         # Type       ID               Adv Rtr           Seq         Age  Cksum  Len
         # Router      0.0.0.0          10.34.2.250     0x800018ed  2407  0xaf2d  56
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<lsa_type>\S+) +(?P<lsa_id>(\*{0,1})[\d\.]+) +(?P<advertising_router>[0-9][\d\.]+)"
             r" +(?P<sequence_number>\S+) +(?P<age>\d+) +(?P<checksum>\S+) +(?P<lsa_length>\d+)$"
         )
 
         # bits 0x2, Options 0x33
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^bits +(?P<bits>\S+), +Options +(?P<ospf3_options>\S+)$")
 
         #  Type: PointToPoint, Node ID: 10.169.14.240, Metric: 100, Bidirectional
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^Type: +(?P<link_type_name>\S+), +Node +ID: +(?P<ospf_lsa_topology_link_node_id>[\d\.]+)"
             r", +Metric: +(?P<ospf_lsa_topology_link_metric>\d+), +(?P<ospf_lsa_topology_link_state>\S+)$"
         )
 
         # Aging timer 00:18:16
-        p5 = re.compile(r"^Aging timer +(?P<aging_timer>(\S+ ){0,1}[\d\:]+)$")
+        p5 = regex_engine.compile(r"^Aging timer +(?P<aging_timer>(\S+ ){0,1}[\d\:]+)$")
 
         # Installed 00:10:20 ago, expires in 00:49:31, sent 00:10:18 ago
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^Installed +(?P<installation_time>(\S+ ){0,1}[\d\:]+) +ago, +expires +in +"
             r"(?P<expiration_time>(\S+ ){0,1}[\d\:]+), +sent +(?P<send_time>(\S+ ){0,1}[\d\:]+) +ago$"
         )
 
         # Last changed 2w6d 04:50:31 ago, Change count: 196
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^Last changed +(?P<lsa_changed_time>(\S+ ){0,1}[\d\:]+) +ago, +Change +"
             r"count: +(?P<lsa_change_count>\d+)$")
 
         # Ref-lsa-type Router, Ref-lsa-id 0.0.0.0, Ref-router-id 10.34.2.250
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^Ref-lsa-type +(?P<reference_lsa_type>\S+), +Ref-lsa-id +(?P<reference_lsa_id>[\d\.]+)"
             r", +Ref-router-id +(?P<reference_lsa_router_id>[\d\.]+)$")
 
         # Prefix-count 3
-        p9 = re.compile(r"^Prefix-count +(?P<prefix_count>\d+)$")
+        p9 = regex_engine.compile(r"^Prefix-count +(?P<prefix_count>\d+)$")
 
         # Prefix 2001:db8:b0f8:3ab::/64
-        p10 = re.compile(r"^Prefix +(?P<ospf3_prefix>\S+)$")
+        p10 = regex_engine.compile(r"^Prefix +(?P<ospf3_prefix>\S+)$")
 
         # Prefix-options 0x0, Metric 5
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^Prefix-options +(?P<ospf3_prefix_options>\S+), +Metric +(?P<metric>\d+)$"
         )
 
         # fe80::250:56ff:fe8d:a96c
-        p12 = re.compile(r"^(?P<linklocal_address>[a-fA-F\d\:]+)$")
+        p12 = regex_engine.compile(r"^(?P<linklocal_address>[a-fA-F\d\:]+)$")
 
         # Gen timer 00:49:49
-        p13 = re.compile(r"^Gen +timer +(?P<generation_timer>\S+)$")
+        p13 = regex_engine.compile(r"^Gen +timer +(?P<generation_timer>\S+)$")
 
         # OSPF3 Link-Local database, interface ge-0/0/0.0 Area 0.0.0.8
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^OSPF3 +Link-Local +database, +interface +(?P<ospf_intf>\S+) +"
             r"Area +(?P<ospf_area>\S+)$")
 
         # Type PointToPoint (1), Metric 5
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^Type +(?P<link_type_name>\S+) +\((?P<link_type_value>\S+)\), +"
             r"Metric +(?P<link_metric>\S+)$")
 
         # Loc-If-Id 2, Nbr-If-Id 2, Nbr-Rtr-Id 10.189.5.253
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^Loc-If-Id +(?P<link_intf_id>\S+), +Nbr-If-Id +(?P<nbr_intf_id>\S+)"
             r", +Nbr-Rtr-Id +(?P<nbr_rtr_id>\S+)$")
 
         # Options 0x33, Priority 128
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"^Options +(?P<ospf3_options>\S+), +Priority +(?P<router_priority>\S+)$"
         )
 
         #   Prefix-options 0x0, Metric 50, Type 1,
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^Prefix-options +(?P<ospf3_prefix_options>\S+), +Metric +(?P<metric>\S+)"
             r", +Type +(?P<type_value>\S+),$")
 
         # Last changed 29w5d 21:40:56 ago, Change count: 1, Ours
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"^Last +changed +(?P<lsa_changed_time>(\S+ ){0,1}[\d\:]+) +ago, +"
             r"Change +count: +(?P<lsa_change_count>\d+), +(?P<database_entry_state>\S+)$"
         )
 
         # Installed 00:41:50 ago, expires in 00:18:10
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r"^Installed +(?P<installation_time>(\S+ ){0,1}[\d\:]+) +ago, +expires +"
             r"in +(?P<expiration_time>(\S+ ){0,1}[\d\:]+)$")
 
         # Prefix 2001:db8:eb18:6337::/64 Prefix-options 0x0
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^Prefix +(?P<ospf3_prefix>\S+) +Prefix-options +(?P<ospf3_prefix_options>\S+)$"
         )
 
@@ -2098,23 +2100,23 @@ class ShowOspf3DatabaseNetworkDetail(ShowOspf3DatabaseNetworkDetailSchema):
             out = output
 
         # OSPF3 database, Area 0.0.0.0
-        p1 = re.compile(r'^OSPF3 +database, +Area +(?P<ospf_area>\S+)$')
+        p1 = regex_engine.compile(r'^OSPF3 +database, +Area +(?P<ospf_area>\S+)$')
 
         # Network    *0.0.0.9          192.168.219.235   0x8000001d   892  0xf99f  36
         # Network     0.0.0.3          192.168.219.236   0x80000b14  2142  0x1983  36
-        p2 = re.compile(r'^(?P<lsa_type>\S+) *(?P<our_entry>\*)?'
-                        r'(?P<lsa_id>[\d\.]+) +(?P<advertising_router>\S+) '
-                        r'+(?P<sequence_number>\S+) +(?P<age>\S+) '
-                        r'+(?P<checksum>\S+) +(?P<lsa_length>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type>\S+) *(?P<our_entry>\*)?'
+                                  r'(?P<lsa_id>[\d\.]+) +(?P<advertising_router>\S+) '
+                                  r'+(?P<sequence_number>\S+) +(?P<age>\S+) '
+                                  r'+(?P<checksum>\S+) +(?P<lsa_length>\S+)$')
 
         # Options 0x33
-        p3 = re.compile(r'^Options +(?P<ospf3_options>\S+)$')
+        p3 = regex_engine.compile(r'^Options +(?P<ospf3_options>\S+)$')
 
         # Attached router 192.168.219.235
-        p4 = re.compile(r'^Attached router +(?P<attached_router>\S+)$')
+        p4 = regex_engine.compile(r'^Attached router +(?P<attached_router>\S+)$')
 
         # Type: Transit, Node ID: 192.168.219.236, Metric: 0, Bidirectional
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Type: +(?P<link_type_name>\S+)+, '
             r'+Node +ID: +(?P<ospf_lsa_topology_link_node_id>\S+), '
             r'+Metric: +(?P<ospf_lsa_topology_link_metric>\d+), '
@@ -2280,32 +2282,32 @@ class ShowOspf3DatabaseLinkAdvertisingRouter(
             out = output
 
         # Type       ID               Adv Rtr           Seq      Age  Opt  Cksum  Len
-        p0 = re.compile(r'^(?P<heading>Type \s+ID[\s\S]+)$')
+        p0 = regex_engine.compile(r'^(?P<heading>Type \s+ID[\s\S]+)$')
 
         # OSPF3 Link-Local database, interface ge-0/0/2.0 Area 0.0.0.0
-        p1 = re.compile(r'^OSPF3 +Link-Local +database, +interface '
-                        r'+(?P<ospf_intf>\S+) +Area +(?P<ospf_area>\S+)$')
+        p1 = regex_engine.compile(r'^OSPF3 +Link-Local +database, +interface '
+                                  r'+(?P<ospf_intf>\S+) +Area +(?P<ospf_area>\S+)$')
 
         # Link       *0.0.0.9          192.168.219.235   0x80000b10  1379  0xd3b0  56
-        p2 = re.compile(r'^(?P<lsa_type>\S+) *(?P<our_entry>\*)?'
-                        r'(?P<lsa_id>[\d\.]+) +(?P<advertising_router>\S+) '
-                        r'+(?P<sequence_number>\S+) +(?P<age>\S+) '
-                        r'+(?P<checksum>\S+) +(?P<lsa_length>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type>\S+) *(?P<our_entry>\*)?'
+                                  r'(?P<lsa_id>[\d\.]+) +(?P<advertising_router>\S+) '
+                                  r'+(?P<sequence_number>\S+) +(?P<age>\S+) '
+                                  r'+(?P<checksum>\S+) +(?P<lsa_length>\S+)$')
 
         # fe80::20c:2900:3367:243d
-        p3 = re.compile(r'^(?P<linklocal_address>fe80+[\s\S]+)$')
+        p3 = regex_engine.compile(r'^(?P<linklocal_address>fe80+[\s\S]+)$')
 
         # Options 0x33, Priority 20
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Options +(?P<ospf3_options>\S+), Priority +(?P<router_priority>\S+)$'
         )
 
         # Prefix-count 1
-        p5 = re.compile(r'^Prefix-count +(?P<prefix_count>\S+)$')
+        p5 = regex_engine.compile(r'^Prefix-count +(?P<prefix_count>\S+)$')
 
         # Prefix 2001:db8:dae9:cf16::/64 Prefix-options 0x0
-        p6 = re.compile(r'^Prefix +(?P<ospf3_prefix>\S+) '
-                        r'+Prefix-options +(?P<ospf3_prefix_options>\S+)$')
+        p6 = regex_engine.compile(r'^Prefix +(?P<ospf3_prefix>\S+) '
+                                  r'+Prefix-options +(?P<ospf3_prefix_options>\S+)$')
 
         ret_dict = {}
 
@@ -2463,17 +2465,17 @@ class ShowOspf3RouteNetworkExtensive(ShowOspf3RouteNetworkExtensiveSchema):
         ret_dict = {}
 
         #2001::4/128                                  Intra Network    IP   0
-        p1 = re.compile(r'^(?P<address_prefix>[\d\:\/]+) '
-                        r'+(?P<route_path_type>\S+) +(?P<route_type>\S+) '
-                        r'+(?P<next_hop_type>\S+) +(?P<interface_cost>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<address_prefix>[\d\:\/]+) '
+                                  r'+(?P<route_path_type>\S+) +(?P<route_type>\S+) '
+                                  r'+(?P<next_hop_type>\S+) +(?P<interface_cost>\d+)$')
 
         #NH-interface lo0.0
         #NH-interface et-0/0/0.0, NH-addr fe80::96f7:adff:fe5a:4840
-        p2 = re.compile(r'^NH-interface +(?P<interface_name>[\w\d\-\/\.]+)(, +NH-addr +(?P<interface_address>\S+))?$')
+        p2 = regex_engine.compile(r'^NH-interface +(?P<interface_name>[\w\d\-\/\.]+)(, +NH-addr +(?P<interface_address>\S+))?$')
 
         #Area 0.0.0.0, Origin 10.64.4.4, Priority low
         #Area 0.0.0.0, Origin 10.36.3.3, Fwd NZ, Priority medium
-        p3 = re.compile(r'^Area +(?P<ospf_area>\S+),+ Origin +(?P<route_origin>\S+),( +Fwd +(?P<forward>\S+),)? +Priority +(?P<route_priority>\S+)$')
+        p3 = regex_engine.compile(r'^Area +(?P<ospf_area>\S+),+ Origin +(?P<route_origin>\S+),( +Fwd +(?P<forward>\S+),)? +Priority +(?P<route_priority>\S+)$')
 
 
         for line in out.splitlines():
@@ -2583,17 +2585,17 @@ class ShowOspf3NeighborInstanceAll(ShowOspf3NeighborInstanceAllSchema):
         ret_dict = {}
 
         # Instance: master
-        p0 = re.compile(r'^Instance: +(?P<instance_name>\S+)$')
+        p0 = regex_engine.compile(r'^Instance: +(?P<instance_name>\S+)$')
 
         # Realm: ipv6-unicast
-        p1 = re.compile(r'^Realm: +(?P<realm_name>\S+)$')
+        p1 = regex_engine.compile(r'^Realm: +(?P<realm_name>\S+)$')
 
         #10.189.5.253     ge-0/0/0.0             Full      128     35
-        p2 = re.compile(r'^(?P<id>[\d\.]+) +(?P<interface>\S+) '
-                        r'+(?P<state>\S+) +(?P<pri>\S+) +(?P<dead>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<id>[\d\.]+) +(?P<interface>\S+) '
+                                  r'+(?P<state>\S+) +(?P<pri>\S+) +(?P<dead>\d+)$')
 
         #Neighbor-address fe80::250:56ff:fe8d:53c0
-        p3 = re.compile(r'^Neighbor-address +(?P<neighbor_address>\S+)$')
+        p3 = regex_engine.compile(r'^Neighbor-address +(?P<neighbor_address>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2711,12 +2713,12 @@ class ShowOspf3RoutePrefix(ShowOspf3RouteRouteSchema):
         ret_dict = {}
 
         #2001:30::/64                                 Intra Network    IP   2
-        p1 = re.compile(r'^(?P<address_prefix>[\d\:\/]+) '
-                        r'+(?P<route_path_type>\S+) +(?P<route_type>\S+) '
-                        r'+(?P<next_hop_type>\S+) +(?P<interface_cost>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<address_prefix>[\d\:\/]+) '
+                                  r'+(?P<route_path_type>\S+) +(?P<route_type>\S+) '
+                                  r'+(?P<next_hop_type>\S+) +(?P<interface_cost>\d+)$')
 
         #NH-interface ge-0/0/4.0, NH-addr fe80::250:56ff:fe8d:351d
-        p2 = re.compile(r'^NH-interface +(?P<interface_name>[\w\d\-\/\.]+)(, +NH-addr +(?P<interface_address>\S+))?$')
+        p2 = regex_engine.compile(r'^NH-interface +(?P<interface_name>[\w\d\-\/\.]+)(, +NH-addr +(?P<interface_address>\S+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6,15 +6,15 @@ JunOs parsers for the following show commands:
     * show pfe statistics ip icmp
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowPfeStatisticsTrafficSchema(MetaParser):
     """ Schema for:
@@ -96,143 +96,143 @@ class ShowPfeStatisticsTraffic(ShowPfeStatisticsTrafficSchema):
         ret_dict = {}
 
         # Input  packets:            763584752                   14 pps
-        p1 = re.compile(r'^Input +packets: +(?P<pfe_input_packets>\d+)'
-                        r' +(?P<input_pps>\d+) +pps$')
+        p1 = regex_engine.compile(r'^Input +packets: +(?P<pfe_input_packets>\d+)'
+                                  r' +(?P<input_pps>\d+) +pps$')
 
         # Output packets:            728623201                   16 pps
-        p2 = re.compile(r'^Output +packets: +(?P<pfe_output_packets>\d+)'
-                        r' +(?P<output_pps>\d+) +pps$')
+        p2 = regex_engine.compile(r'^Output +packets: +(?P<pfe_output_packets>\d+)'
+                                  r' +(?P<output_pps>\d+) +pps$')
 
         #    Fabric Input  :                    0                    0 pps
-        p3 = re.compile(r'^Fabric +Input +: +(?P<pfe_fabric_input>\d+)'
-                        r' +(?P<pfe_fabric_input_pps>\d+) +pps$')
+        p3 = regex_engine.compile(r'^Fabric +Input +: +(?P<pfe_fabric_input>\d+)'
+                                  r' +(?P<pfe_fabric_input_pps>\d+) +pps$')
 
         #    Fabric Output :                    0                    0 pps
-        p4 = re.compile(r'^Fabric +Output +: +(?P<pfe_fabric_output>\d+)'
-                        r' +(?P<pfe_fabric_output_pps>\d+) +pps$')
+        p4 = regex_engine.compile(r'^Fabric +Output +: +(?P<pfe_fabric_output>\d+)'
+                                  r' +(?P<pfe_fabric_output_pps>\d+) +pps$')
 
         # Local packets input                 :            184259247
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Local +packets +input +: +(?P<pfe_input_packets>\d+)$')
 
         # Local packets output                :            370506284
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Local +packets +output +: +(?P<pfe_output_packets>\d+)$')
 
         # Software input control plane drops  :                    0
-        p7 = re.compile(r'^Software +input +control +plane +drops +:'
-                        r' +(?P<software_input_control_drops>\d+)$')
+        p7 = regex_engine.compile(r'^Software +input +control +plane +drops +:'
+                                  r' +(?P<software_input_control_drops>\d+)$')
 
         # Software input high drops           :                    0
-        p8 = re.compile(r'^Software +input +high +drops +:'
-                        r' +(?P<software_input_high_drops>\d+)$')
+        p8 = regex_engine.compile(r'^Software +input +high +drops +:'
+                                  r' +(?P<software_input_high_drops>\d+)$')
 
         # Software input medium drops         :                    0
-        p9 = re.compile(r'^Software +input +medium +drops +:'
-                        r' +(?P<software_input_medium_drops>\d+)$')
+        p9 = regex_engine.compile(r'^Software +input +medium +drops +:'
+                                  r' +(?P<software_input_medium_drops>\d+)$')
 
         # Software input low drops            :                    0
-        p10 = re.compile(r'^Software +input +low +drops +:'
-                         r' +(?P<software_input_low_drops>\d+)$')
+        p10 = regex_engine.compile(r'^Software +input +low +drops +:'
+                                   r' +(?P<software_input_low_drops>\d+)$')
 
         # Software output drops               :                    0
-        p11 = re.compile(r'^Software +output +drops +:'
-                         r' +(?P<software_output_low_drops>\d+)$')
+        p11 = regex_engine.compile(r'^Software +output +drops +:'
+                                   r' +(?P<software_output_low_drops>\d+)$')
 
         # Hardware input drops                :                    0
-        p12 = re.compile(r'^Hardware +input +drops +:'
-                         r' +(?P<hardware_input_drops>\d+)$')
+        p12 = regex_engine.compile(r'^Hardware +input +drops +:'
+                                   r' +(?P<hardware_input_drops>\d+)$')
 
         # HDLC keepalives            :                    0
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r'^HDLC +keepalives +: +(?P<hdlc_keepalive_count>\d+)$')
 
         # ATM OAM                    :                    0
-        p14 = re.compile(r'^ATM +OAM +: +(?P<atm_oam_count>\d+)$')
+        p14 = regex_engine.compile(r'^ATM +OAM +: +(?P<atm_oam_count>\d+)$')
 
         # Frame Relay LMI            :                    0
-        p15 = re.compile(r'^Frame +Relay +LMI +: +(?P<fr_lmi_count>\d+)$')
+        p15 = regex_engine.compile(r'^Frame +Relay +LMI +: +(?P<fr_lmi_count>\d+)$')
 
         # PPP LCP/NCP                :                    0
-        p16 = re.compile(r'^PPP +LCP/NCP +: +(?P<ppp_lcp_ncp_count>\d+)$')
+        p16 = regex_engine.compile(r'^PPP +LCP/NCP +: +(?P<ppp_lcp_ncp_count>\d+)$')
 
         # OSPF hello                 :              5732336
-        p17 = re.compile(r'^OSPF +hello +: +(?P<ospf_hello_count>\d+)$')
+        p17 = regex_engine.compile(r'^OSPF +hello +: +(?P<ospf_hello_count>\d+)$')
 
         # OSPF3 hello                :              4146329
-        p18 = re.compile(r'^OSPF3 +hello +: +(?P<ospf3_hello_count>\d+)$')
+        p18 = regex_engine.compile(r'^OSPF3 +hello +: +(?P<ospf3_hello_count>\d+)$')
 
         # RSVP hello                 :              7040269
-        p19 = re.compile(r'^RSVP +hello +: +(?P<rsvp_hello_count>\d+)$')
+        p19 = regex_engine.compile(r'^RSVP +hello +: +(?P<rsvp_hello_count>\d+)$')
 
         # LDP hello                  :              3462026
-        p20 = re.compile(r'^LDP +hello +: +(?P<ldp_hello_count>\d+)$')
+        p20 = regex_engine.compile(r'^LDP +hello +: +(?P<ldp_hello_count>\d+)$')
 
         # BFD                        :             82347033
-        p21 = re.compile(r'^BFD +: +(?P<bfd_count>\d+)$')
+        p21 = regex_engine.compile(r'^BFD +: +(?P<bfd_count>\d+)$')
 
         # IS-IS IIH                  :                    0
-        p22 = re.compile(r'^IS-IS +IIH +: +(?P<isis_iih_count>\d+)$')
+        p22 = regex_engine.compile(r'^IS-IS +IIH +: +(?P<isis_iih_count>\d+)$')
 
         # LACP                       :                    0
-        p23 = re.compile(r'^LACP +: +(?P<lacp_count>\d+)$')
+        p23 = regex_engine.compile(r'^LACP +: +(?P<lacp_count>\d+)$')
 
         # ARP                        :                56818
-        p24 = re.compile(r'^ARP +: +(?P<arp_count>\d+)$')
+        p24 = regex_engine.compile(r'^ARP +: +(?P<arp_count>\d+)$')
 
         # ETHER OAM                  :                    0
-        p25 = re.compile(r'^ETHER +OAM +: +(?P<ether_oam_count>\d+)$')
+        p25 = regex_engine.compile(r'^ETHER +OAM +: +(?P<ether_oam_count>\d+)$')
 
         # Unknown                    :                    0
-        p26 = re.compile(r'^Unknown +: +(?P<unknown_count>\d+)$')
+        p26 = regex_engine.compile(r'^Unknown +: +(?P<unknown_count>\d+)$')
 
         # Timeout                    :                    0
-        p27 = re.compile(r'^Timeout +: +(?P<timeout_discard>\d+)$')
+        p27 = regex_engine.compile(r'^Timeout +: +(?P<timeout_discard>\d+)$')
 
         # Truncated key              :                    0
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r'^Truncated +key +: +(?P<truncated_key_discard>\d+)$')
 
         # Bits to test               :                    0
-        p29 = re.compile(r'^Bits +to +test +: +(?P<bits_to_test_discard>\d+)$')
+        p29 = regex_engine.compile(r'^Bits +to +test +: +(?P<bits_to_test_discard>\d+)$')
 
         # Data error                 :                    0
-        p30 = re.compile(r'^Data +error +: +(?P<data_error_discard>\d+)$')
+        p30 = regex_engine.compile(r'^Data +error +: +(?P<data_error_discard>\d+)$')
 
         # TCP header length error    :                    0
-        p31 = re.compile(
+        p31 = regex_engine.compile(
             r'^TCP +header +length +error +: +(?P<tcp_header_error_discard>\d+)$'
         )
 
         # Stack underflow            :                    0
-        p32 = re.compile(
+        p32 = regex_engine.compile(
             r'^Stack +underflow +: +(?P<stack_underflow_discard>\d+)$')
 
         # Stack overflow             :                    0
-        p33 = re.compile(
+        p33 = regex_engine.compile(
             r'^Stack +overflow +: +(?P<stack_overflow_discard>\d+)$')
 
         # Normal discard             :               962415
-        p34 = re.compile(r'^Normal +discard +: +(?P<bad_route_discard>\d+)$')
+        p34 = regex_engine.compile(r'^Normal +discard +: +(?P<bad_route_discard>\d+)$')
 
         # Extended discard           :                    0
-        p35 = re.compile(r'^Extended +discard +: +(?P<nexthop_discard>\d+)$')
+        p35 = regex_engine.compile(r'^Extended +discard +: +(?P<nexthop_discard>\d+)$')
 
         # Invalid interface          :                    0
-        p36 = re.compile(
+        p36 = regex_engine.compile(
             r'^Invalid +interface +: +(?P<invalid_iif_discard>\d+)$')
 
         # Info cell drops            :                    0
-        p37 = re.compile(r'^Info +cell +drops +: +(?P<info_cell_discard>\d+)$')
+        p37 = regex_engine.compile(r'^Info +cell +drops +: +(?P<info_cell_discard>\d+)$')
 
         # Fabric drops               :                    0
-        p38 = re.compile(r'^Fabric +drops +: +(?P<fabric_discard>\d+)$')
+        p38 = regex_engine.compile(r'^Fabric +drops +: +(?P<fabric_discard>\d+)$')
 
         # Input Checksum             :                    0
-        p39 = re.compile(r'^Input +Checksum +: +(?P<input_checksum>\d+)$')
+        p39 = regex_engine.compile(r'^Input +Checksum +: +(?P<input_checksum>\d+)$')
 
         # Output MTU                 :                    0
-        p40 = re.compile(r'^Output +MTU +: +(?P<output_mtu>\d+)$')
+        p40 = regex_engine.compile(r'^Output +MTU +: +(?P<output_mtu>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -734,11 +734,11 @@ class ShowPfeStatisticsIpIcmp(ShowPfeStatisticsIpIcmpSchema):
         ret_dict = {}
 
         #         ICMP Statistics:
-        p1 = re.compile(r'^(?P<state>[\S\s]+):$')
+        p1 = regex_engine.compile(r'^(?P<state>[\S\s]+):$')
 
         #       246259 requests
         #          311 network unreachables
-        p2 = re.compile(r'^(?P<value>\d+) +(?P<key>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^(?P<value>\d+) +(?P<key>[\S\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -875,13 +875,13 @@ class ShowPfeRouteSummary(ShowPfeRouteSummarySchema):
             out = output
 
         # Slot 0
-        p1 = re.compile(r'^Slot +(?P<slot>\S+)$')
+        p1 = regex_engine.compile(r'^Slot +(?P<slot>\S+)$')
 
         # IPv4 Route Tables:
-        p2 = re.compile(r'^(?P<route_tables>\S+) +Route +Tables:$')
+        p2 = regex_engine.compile(r'^(?P<route_tables>\S+) +Route +Tables:$')
 
         # Default          944      132156
-        p3 = re.compile(r'^(?P<index>\S+) +(?P<routes>\d+) +(?P<size>\d+)$')
+        p3 = regex_engine.compile(r'^(?P<index>\S+) +(?P<routes>\d+) +(?P<size>\d+)$')
 
         ret_dict = {}
 
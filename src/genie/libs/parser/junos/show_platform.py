@@ -14,6 +14,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, \
                     Optional, Use, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ===========================
 # Schema for:
@@ -68,18 +71,18 @@ class FileList(FileListSchema):
         ret_dict = {}
 
         # /root/:
-        p1 = re.compile(r'^\/(?P<dir>(\S+))\/\:$')
+        p1 = regex_engine.compile(r'^\/(?P<dir>(\S+))\/\:$')
 
         # filename
         # .profile@ -> /packages/mnt/os-runtime/root/.profile
-        p2 = re.compile(r'^(?P<file>([a-zA-Z0-9\-\_\.\@]+))(?: +\-\> +(?P<path>(.*)))?$')
+        p2 = regex_engine.compile(r'^(?P<file>([a-zA-Z0-9\-\_\.\@]+))(?: +\-\> +(?P<path>(.*)))?$')
 
         # /root/filename999
         # /root/filename999.cfg
         # /root/filename999: No such file or directory
         # /root/filename999.cfg: No such file or directory
-        p3 = re.compile(r'^\/(?P<dir>(\S+))\/(?P<file>([a-zA-Z0-9\-\_\/\.]+))'
-                         r'(?P<missing>(?:\: +No +such +file +or +directory)?)$')
+        p3 = regex_engine.compile(r'^\/(?P<dir>(\S+))\/(?P<file>([a-zA-Z0-9\-\_\/\.]+))'
+                                   r'(?P<missing>(?:\: +No +such +file +or +directory)?)$')
 
         for line in out.splitlines():
             line = line.replace('\t', '    ')
@@ -175,16 +178,16 @@ class ShowVersion(ShowVersionSchema):
         # -----------------------------------------------------------
 
         # Junos: 15.1R1-S1
-        p1 = re.compile(r'^Junos: +(?P<junosversion>\S+)$')
+        p1 = regex_engine.compile(r'^Junos: +(?P<junosversion>\S+)$')
 
         # Model: ex4300-24p
-        p2 = re.compile(r'^Model: +(?P<productmodel>\S+)$')
+        p2 = regex_engine.compile(r'^Model: +(?P<productmodel>\S+)$')
 
         # Hostname: myJunosDevice
-        p3 = re.compile(r'^Hostname: +(?P<hostname>\S+)$')
+        p3 = regex_engine.compile(r'^Hostname: +(?P<hostname>\S+)$')
 
         # JUNOS EX  Software Suite [18.2R2-S1]
-        p4 = re.compile(r'^JUNOS +(?P<package>.*)$')
+        p4 = regex_engine.compile(r'^JUNOS +(?P<package>.*)$')
 
         show_version_dict["software-information"] = {}
         show_version_dict["software-information"]["package-information"] = []
@@ -294,12 +297,12 @@ class FileListDetail(FileListDetailSchema):
         ret_dict = {}
 
         # -rw-r-----  1 root  wheel     525672 May 22 02:40 /var/log/trace-static
-        p1 = re.compile(r'^(?P<file_permissions>\S+)\s+(?P<file_links>\d+)\s+'
+        p1 = regex_engine.compile(r'^(?P<file_permissions>\S+)\s+(?P<file_links>\d+)\s+'
             r'(?P<file_owner>\S+)\s+(?P<file_group>\S+)\s+(?P<file_size>\d+)\s+'
             r'(?P<file_date>[\S\s]+)\s+(?P<file_name>\S+)$')
 
         # total files: 2
-        p2 = re.compile(r'^total\s+files:\s+(?P<total_files>\d+)$')
+        p2 = regex_engine.compile(r'^total\s+files:\s+(?P<total_files>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
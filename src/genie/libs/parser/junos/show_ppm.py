@@ -4,15 +4,15 @@ JunOS parsers for the following show commands:
     * show ppm transmissions protocol bfd detail
 '''
 
-# Python
-import re
-
 # Genie
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Schema, Any, \
                     Optional, Use, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ===========================
 # Schema for:
@@ -89,27 +89,27 @@ class ShowPPMTransmissionsProtocolBfdDetail(ShowPPMTransmissionsProtocolBfdDetai
         ret_dict = {}
 
         # Destination: 10.49.194.102, Protocol: BFD, Transmission interval: 300
-        p1 = re.compile(r'^Destination: +(?P<transmission_destination>\S+), '
-                        r'+Protocol: +(?P<protocol>\S+), Transmission +interval: '
-                        r'+(?P<transmission_interval>\d+)$')
+        p1 = regex_engine.compile(r'^Destination: +(?P<transmission_destination>\S+), '
+                                  r'+Protocol: +(?P<protocol>\S+), Transmission +interval: '
+                                  r'+(?P<transmission_interval>\d+)$')
 
         # Distributed: TRUE, Distribution handle: 6918, Distribution address: fpc9
-        p2 = re.compile(r'^Distributed: +(?P<transmission_distributed>\S+)'
-                        r'(, +Distribution +handle: +(?P<transmission_pfe_handle>\d+), '
-                        r'Distribution +address: +(?P<transmission_pfe_addr>\S+))?$')
+        p2 = regex_engine.compile(r'^Distributed: +(?P<transmission_distributed>\S+)'
+                                  r'(, +Distribution +handle: +(?P<transmission_pfe_handle>\d+), '
+                                  r'Distribution +address: +(?P<transmission_pfe_addr>\S+))?$')
 
         # IFL-index: 783
-        p3 = re.compile(r'^IFL-index: +(?P<transmission_interface_index>\d+)$')
+        p3 = regex_engine.compile(r'^IFL-index: +(?P<transmission_interface_index>\d+)$')
 
         # Tx Jitter: 25, Tx Delayed: FALSE, Delay Difference: 0, Last Tx Interval: 821, Tx Delayed count: 0, Tx Interval Threshold: 1250, Tx Largest Interval: 0, Tx Counter: 15891
-        p4 = re.compile(r'^Tx +Jitter: +(?P<transmission_jitter>[\d\.]+), Tx +Delayed: +'
-                        r'(?P<transmission_delayed>\S+), +Delay +Difference: +(?P<transmission_delay_difference>\d+), '
-                        r'Last+ Tx +Interval: +(?P<transmission_last_interval>\d+), +Tx +Delayed +count: +'
-                        r'(?P<transmission_delayed_count>\d+), +Tx +Interval +Threshold: +(?P<transmission_interval_threshold>\d+), '
-                        r'+Tx +Largest +Interval: +(?P<transmission_largest_difference>\d+), +Tx +Counter: (?P<transmission_count>\d+)$')
+        p4 = regex_engine.compile(r'^Tx +Jitter: +(?P<transmission_jitter>[\d\.]+), Tx +Delayed: +'
+                                  r'(?P<transmission_delayed>\S+), +Delay +Difference: +(?P<transmission_delay_difference>\d+), '
+                                  r'Last+ Tx +Interval: +(?P<transmission_last_interval>\d+), +Tx +Delayed +count: +'
+                                  r'(?P<transmission_delayed_count>\d+), +Tx +Interval +Threshold: +(?P<transmission_interval_threshold>\d+), '
+                                  r'+Tx +Largest +Interval: +(?P<transmission_largest_difference>\d+), +Tx +Counter: (?P<transmission_count>\d+)$')
 
         # Transmission entries: 6, Remote transmission entries: 3
-        p5 = re.compile(r'^Transmission +entries: +(?P<total_transmissions>\d+), +Remote +transmission +entries: +(?P<remote_transmissions>\d+)$')
+        p5 = regex_engine.compile(r'^Transmission +entries: +(?P<total_transmissions>\d+), +Remote +transmission +entries: +(?P<remote_transmissions>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
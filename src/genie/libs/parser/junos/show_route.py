@@ -23,12 +23,16 @@ JUNOS parsers for the following commands:
     * show route extensive {destination}
 '''
 
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema, ListOf, Or
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+from genie.libs.parser.utils.junos_structured import StructuredOutputMixin, \
+    fit_to_schema
 '''
 Schema for:
     * show route table {table}
@@ -107,38 +111,38 @@ class ShowRouteTable(ShowRouteTableSchema):
 
 
         # inet.3: 3 destinations, 3 routes (3 active, 0 holddown, 0 hidden)
-        r1 = re.compile(r'(?P<table_name>\S+):\s+(?P<destination_count>\d+)\s+'
-                        r'destinations\,\s+(?P<total_route_count>\d+)\s+routes\s+'
-                        r'\((?P<active_route_count>\d+)\s+active\,\s+(?P<holddown_route_count>\d+)'
-                        r'\s+holddown\,\s+(?P<hidden_route_count>\d+)\s+hidden\)')
+        r1 = regex_engine.compile(r'(?P<table_name>\S+):\s+(?P<destination_count>\d+)\s+'
+                                  r'destinations\,\s+(?P<total_route_count>\d+)\s+routes\s+'
+                                  r'\((?P<active_route_count>\d+)\s+active\,\s+(?P<holddown_route_count>\d+)'
+                                  r'\s+holddown\,\s+(?P<hidden_route_count>\d+)\s+hidden\)')
 
         # 192.168.51.1/32    *[Local/0] 00:02:35
         # 10.64.4.4/32         *[LDP/9] 03:40:50, metric 110
         # 10.64.4.4/32   *[L-OSPF/9/5] 1d 02:16:51, metric 110
         # 118420             *[VPN/170] 31w3d 20:13:54
         # ff02::2/128 *[INET6/0] 00:05:35
-        r2 = re.compile(r'^ *(?P<rt_destination>\S+) +(?P<active_tag>\*)?\[(?P<protocol_name>[\w\-]+)\/(?P<preference>\d+)\/?(?P<preference2>\d+)?\] +(?P<age>[\d\:wd ]+)(, +metric +(?P<metric>\d+))?(, +tag +(?P<rt_tag>\d+))?(, +localpref +(?P<local_preference>\d+))?(, +from +(?P<learned_from>\S+))?$')
+        r2 = regex_engine.compile(r'^ *(?P<rt_destination>\S+) +(?P<active_tag>\*)?\[(?P<protocol_name>[\w\-]+)\/(?P<preference>\d+)\/?(?P<preference2>\d+)?\] +(?P<age>[\d\:wd ]+)(, +metric +(?P<metric>\d+))?(, +tag +(?P<rt_tag>\d+))?(, +localpref +(?P<local_preference>\d+))?(, +from +(?P<learned_from>\S+))?$')
 
         # > to 192.168.220.6 via ge-0/0/1.0
         # > to 192.168.220.6 via ge-0/0/1.0, Push 305550
         # > to 192.168.220.6 via ge-0/0/1.0, Pop
         # Local via ge-0/0/4.11
         # >  via ge-0/0/2.1
-        r3 = re.compile(r'^(?P<best_route>>)?(Local)? *(to +(?P<to>\S+))? *via +(?P<via>[^,\s]+)(, +(?P<mpls_label>[\S ]+))?')
+        r3 = regex_engine.compile(r'^(?P<best_route>>)?(Local)? *(to +(?P<to>\S+))? *via +(?P<via>[^,\s]+)(, +(?P<mpls_label>[\S ]+))?')
 
         # fe80::250:5600:b8d:fea3/128
         # this regex widely match other pattern. intendedly exclude below `Reject`
         # 192.168.51.1/32    *[Local/0] 00:02:35
         #                Reject # <-----
-        r4 = re.compile(r'^(?!.*Reject)(?P<rt_destination>[\w\:\/]+)$')
+        r4 = regex_engine.compile(r'^(?!.*Reject)(?P<rt_destination>[\w\:\/]+)$')
 
         # *[Local/0] 00:26:06
-        r5 = re.compile(r'^(?P<active_tag>\*)?\[(?P<protocol_name>[\w\-]+)\/'
+        r5 = regex_engine.compile(r'^(?P<active_tag>\*)?\[(?P<protocol_name>[\w\-]+)\/'
             r'(?P<preference>\d+)\/?(?P<preference2>\d+)?\] +(?P<age>[\d\:wd ]+)'
             r'(, +metric +(?P<metric>\d+))?(, +tag +(?P<rt_tag>\d+))?$')
 
         # Reject
-        r6 = re.compile(r'^(?P<nh_type>Reject)$')
+        r6 = regex_engine.compile(r'^(?P<nh_type>Reject)$')
 
         parsed_output = {}
 
@@ -345,7 +349,7 @@ class ShowRouteSchema(MetaParser):
         }
     }
 
-class ShowRoute(ShowRouteSchema):
+class ShowRoute(StructuredOutputMixin, ShowRouteSchema):
     """ Parser for:
             * show route
             * show route {ip_address}
@@ -360,30 +364,31 @@ class ShowRoute(ShowRouteSchema):
                     'show route protocol {protocol} {ip_address}',
                     'show route protocol {protocol} table {table}']
 
+    def _get_command(self, protocol=None, ip_address=None, table=None):
+        if protocol and table:
+            return self.cli_command[4].format(
+                protocol=protocol,
+                table=table
+            )
+        elif ip_address and not protocol:
+            return self.cli_command[1].format(
+                ip_address=ip_address
+            )
+        elif protocol and not ip_address:
+            return self.cli_command[2].format(
+                protocol=protocol
+            )
+        elif ip_address and protocol:
+            return self.cli_command[3].format(
+                ip_address=ip_address,
+                protocol=protocol
+            )
+        return self.cli_command[0]
+
     def cli(self, protocol=None, ip_address=None, table=None, output=None):
         if not output:
-            if protocol and table:
-                cmd = self.cli_command[4].format(
-                    protocol=protocol,
-                    table=table
-                )
-            elif ip_address and not protocol:
-                cmd = self.cli_command[1].format(
-                    ip_address=ip_address
-                )
-            elif protocol and not ip_address:
-                cmd = self.cli_command[2].format(
-                    protocol=protocol
-                )
-            elif ip_address and protocol:
-                cmd = self.cli_command[3].format(
-                    ip_address=ip_address,
-                    protocol=protocol
-                )
-            else:
-                cmd = self.cli_command[0]
-
-            out = self.device.execute(cmd)
+            out = self.device.execute(self._get_command(
+                protocol=protocol, ip_address=ip_address, table=table))
         else:
             out = output
 
@@ -392,10 +397,10 @@ class ShowRoute(ShowRouteSchema):
 
 
         # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                r'destinations, +(?P<total_route_count>\d+) +routes +'
-                r'\((?P<active_route_count>\d+) +active, +(?P<holddown>\d+) +'
-                r'holddown, +(?P<hidden>\d+) +hidden\)$')
+        p1 = regex_engine.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+                          r'destinations, +(?P<total_route_count>\d+) +routes +'
+                          r'\((?P<active_route_count>\d+) +active, +(?P<holddown>\d+) +'
+                          r'holddown, +(?P<hidden>\d+) +hidden\)$')
         
         # 10.220.0.0/16      *[BGP/170] 3w3d 03:12:24, MED 12003, localpref 120, from 10.169.14.240
         # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
@@ -403,29 +408,29 @@ class ShowRoute(ShowRouteSchema):
         # 0.0.0.0/0          *[OSPF/150/10] 3w3d 03:24:58, metric 101, tag 0
         # 167963             *[LDP/9] 1w6d 20:41:01, metric 1, metric2 100, tag 65000500
         # 10.16.2.2/32         *[Static/5] 00:00:02
-        p2 = re.compile(r'^((?P<rt_destination>\S+) +)?(?P<active_tag>[\*\+\-])?\[(?P<protocol>[\w\-]+)\/(?P<preference>\d+)(\/(?P<preference2>\d+))?\] +(?P<text>\S+( +\S+)?)(, +metric +(?P<metric>\d+))?(, +metric2 +(?P<metric2>\d+))?(, +tag +(?P<rt_tag>\d+))?(, +MED +(?P<med>\w+))?(, +localpref +(?P<local_preference>\d+))?(, +from +(?P<learned_from>\S+))?$')
+        p2 = regex_engine.compile(r'^((?P<rt_destination>\S+) +)?(?P<active_tag>[\*\+\-])?\[(?P<protocol>[\w\-]+)\/(?P<preference>\d+)(\/(?P<preference2>\d+))?\] +(?P<text>\S+( +\S+)?)(, +metric +(?P<metric>\d+))?(, +metric2 +(?P<metric2>\d+))?(, +tag +(?P<rt_tag>\d+))?(, +MED +(?P<med>\w+))?(, +localpref +(?P<local_preference>\d+))?(, +from +(?P<learned_from>\S+))?$')
 
         # MultiRecv
-        p2_1 = re.compile(r'^(?P<nh_type>MultiRecv)$')
+        p2_1 = regex_engine.compile(r'^(?P<nh_type>MultiRecv)$')
         
         # >  to 10.169.14.121 via ge-0/0/1.0
-        p3 = re.compile(r'^(\> +)?(to +(?P<to>\S+) +)?via +(?P<via>\S+)'
-                        r'(, +(?P<mpls_label>[\S\s]+))?$')
+        p3 = regex_engine.compile(r'^(\> +)?(to +(?P<to>\S+) +)?via +(?P<via>\S+)'
+                                  r'(, +(?P<mpls_label>[\S\s]+))?$')
         
         # Local via fxp0.0
-        p3_1 = re.compile(r'^Local +via +(?P<nh_local_interface>\S+)$')
+        p3_1 = regex_engine.compile(r'^Local +via +(?P<nh_local_interface>\S+)$')
 
         # AS path: (65151 65000) I, validation-state: unverified
         # AS path: I
         # AS path: 3 4 I, validation-state: unverified
-        p4 = re.compile(r'AS +path:(?P<as_path>([()\d\s]+ )?\w)'
-                        r'(, validation-state: +(?P<validation_state>\S+))?$')
+        p4 = regex_engine.compile(r'AS +path:(?P<as_path>([()\d\s]+ )?\w)'
+                                  r'(, validation-state: +(?P<validation_state>\S+))?$')
         
         # to table inet.0
-        p5 = re.compile(r'^to +table +(?P<nh_table>\S+)$')
+        p5 = regex_engine.compile(r'^to +table +(?P<nh_table>\S+)$')
 
         # 2001:db8:eb18:ca45::1/128
-        pIP = re.compile(r'^(?P<rt_destination>[\w:\/]+)$')
+        pIP = regex_engine.compile(r'^(?P<rt_destination>[\w:\/]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -552,11 +557,31 @@ class ShowRoute(ShowRouteSchema):
                 continue
         return ret_dict
 
+    def _fit_structured(self, tree):
+        # One 'rt' per 'rt-entry', only the first one of a destination
+        # holds 'rt-destination', as parsed from the cli
+        for route_information in tree.get('route-information', []):
+            for route_table in route_information.get('route-table', []):
+                rt_list = []
+                for rt in route_table.get('rt', []):
+                    for index, rt_entry in enumerate(rt.get('rt-entry', [])):
+                        if index:
+                            rt_list.append({'rt-entry': [rt_entry]})
+                        else:
+                            rt_list.append(dict(rt, **{'rt-entry': [rt_entry]}))
+                if rt_list:
+                    route_table['rt'] = rt_list
+        return fit_to_schema(tree, self.schema)
+
 class ShowRouteLogicalSystem(ShowRoute):
     """ Parser for:
             * show route logical-system {logical_name}
     """
     cli_command = 'show route logical-system {logical_name}'
+
+    def _get_command(self, logical_name):
+        return self.cli_command.format(logical_name=logical_name)
+
     def cli(self, logical_name, output=None):
         if not output:
             cmd = self.cli_command.format(
@@ -572,6 +597,11 @@ class ShowRouteProtocolNoMore(ShowRoute):
             * show route protocol {protocol} {ip_address} | no-more
     """
     cli_command = 'show route protocol {protocol} {ip_address} | no-more'
+
+    def _get_command(self, protocol, ip_address):
+        return self.cli_command.format(protocol=protocol,
+                                       ip_address=ip_address)
+
     def cli(self, protocol, ip_address, output=None):
         if not output:
             cmd = self.cli_command.format(
@@ -859,129 +889,129 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
         originating_rib_found = None
 
         # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p1 = regex_engine.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+                                  r'destinations, +(?P<total_route_count>\d+) +routes +'
+                                  r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
+                                  r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
 
         # 0.0.0.0/0 (1 entry, 1 announced)
         # 10.1.0.0/24 (2 entries, 1 announced)
         # 0.0.0.0 (1 entry, 1 announced)
-        p2 = re.compile(r'^(?P<rt_destination>\S+)(\/(?P<rt_prefix_length>\d+))? +'
-                        r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<announced>\d+) +announced\)$')
+        p2 = regex_engine.compile(r'^(?P<rt_destination>\S+)(\/(?P<rt_prefix_length>\d+))? +'
+                                  r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<announced>\d+) +announced\)$')
 
         # State: <FlashAll>
         # State: <Active Int Ext>
-        p3 = re.compile(r'State: +\<(?P<rt_state>[\S\s]+)\>$')
+        p3 = regex_engine.compile(r'State: +\<(?P<rt_state>[\S\s]+)\>$')
 
         # *OSPF   Preference: 150/10
         # *BGP    Preference: 170/-121
-        p4 = re.compile(r'^(?P<active_tag>\*)?(?P<protocol>\S+)\s+'
-                        r'Preference:\s+(?P<preference>\d+)(\/(\-)?(?P<preference2>\d+))?$')
+        p4 = regex_engine.compile(r'^(?P<active_tag>\*)?(?P<protocol>\S+)\s+'
+                                  r'Preference:\s+(?P<preference>\d+)(\/(\-)?(?P<preference2>\d+))?$')
 
         # Next hop type: Router, Next hop index: 613
-        p5 = re.compile(r'^Next +hop type: +(?P<nh_type>\S+), +Next +hop +'
-                        r'index: +(?P<nh_index>\d+)$')
+        p5 = regex_engine.compile(r'^Next +hop type: +(?P<nh_type>\S+), +Next +hop +'
+                                  r'index: +(?P<nh_index>\d+)$')
 
         # Address: 0xdfa7934
-        p6 = re.compile(r'^Address: +(?P<nh_address>\S+)$')
+        p6 = regex_engine.compile(r'^Address: +(?P<nh_address>\S+)$')
 
         # Next-hop reference count: 458
-        p7 = re.compile(r'^Next-hop +reference +count: +(?P<nh_reference_count>\d+)$')
+        p7 = regex_engine.compile(r'^Next-hop +reference +count: +(?P<nh_reference_count>\d+)$')
 
         # Source: 10.16.2.2
-        p7_1 = re.compile(r'^Source: +(?P<gateway>\S+)$')
+        p7_1 = regex_engine.compile(r'^Source: +(?P<gateway>\S+)$')
 
         # Next hop: 10.169.14.121 via ge-0/0/1.0 weight 0x1, selected
         # Nexthop: 10.169.14.121 via ge-0/0/1.0
-        p8 = re.compile(r'^(?P<nh_string>Next *hop):( +(?P<to>\S+))? +via +(?P<via>\S+)'
-                        r'( +weight +(?P<weight>\w+))?(, +(?P<selected_next_hop>\w+))?$')
+        p8 = regex_engine.compile(r'^(?P<nh_string>Next *hop):( +(?P<to>\S+))? +via +(?P<via>\S+)'
+                                  r'( +weight +(?P<weight>\w+))?(, +(?P<selected_next_hop>\w+))?$')
 
         # Protocol next hop: 10.169.14.240
-        p8_1 = re.compile(r'^Protocol +next +hop: +(?P<to>\S+)( +Metric: +(?P<metric>\d+))?$')
+        p8_1 = regex_engine.compile(r'^Protocol +next +hop: +(?P<to>\S+)( +Metric: +(?P<metric>\d+))?$')
 
         # Session Id: 0x141
-        p9 = re.compile(r'^Session +Id: +\d+[a-z]+(?P<session_id>\w+)$')
+        p9 = regex_engine.compile(r'^Session +Id: +\d+[a-z]+(?P<session_id>\w+)$')
 
         # Local AS: 65171 
         # Local AS: 65171 Peer AS: 65171
         # Local AS:     1 Peer AS:     3
-        p10 = re.compile(r'^Local +AS: +(?P<local_as>\d+)( +Peer +AS: +(?P<peer_as>\d+))?$')
+        p10 = regex_engine.compile(r'^Local +AS: +(?P<local_as>\d+)( +Peer +AS: +(?P<peer_as>\d+))?$')
 
         # Age: 3w2d 4:43:35   Metric: 101 
         # Age: 3:07:25    Metric: 200
         # Age: 29w6d 21:42:46
-        p11 = re.compile(r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric:\s+(?P<metric>\d+))?$')
+        p11 = regex_engine.compile(r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric:\s+(?P<metric>\d+))?$')
 
         # Age: 12 Metric2: 50
-        p11_2 = re.compile(r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric2:\s+(?P<metric2>\d+))?$')
+        p11_2 = regex_engine.compile(r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric2:\s+(?P<metric2>\d+))?$')
 
         # Validation State: unverified 
-        p12 = re.compile(r'^Validation +State: +(?P<validation_state>\S+)$')
+        p12 = regex_engine.compile(r'^Validation +State: +(?P<validation_state>\S+)$')
 
         # Tag: 0 
-        p13 = re.compile(r'^Tag: +(?P<rt_tag>\d+)$')
+        p13 = regex_engine.compile(r'^Tag: +(?P<rt_tag>\d+)$')
         
         # Task: OSPF
-        p14 = re.compile(r'^Task: +(?P<task>\S+)$')
+        p14 = regex_engine.compile(r'^Task: +(?P<task>\S+)$')
 
         # Announcement bits (3): 0-KRT 5-LDP 7-Resolve tree 3 
-        p15 = re.compile(r'^Announcement +bits +\((?P<announce_bits>\d+)\): +'
-                         r'(?P<announce_tasks>[\S\s]+)$')
+        p15 = regex_engine.compile(r'^Announcement +bits +\((?P<announce_bits>\d+)\): +'
+                                   r'(?P<announce_tasks>[\S\s]+)$')
 
         # AS path: I 
         # AS path: 30000 4 103 104 105 106 107 108 109 I
         # AS path: I (Originator) Cluster list:  0.0.0.1 0.0.0.2 0.0.0.4
-        p16 = re.compile(r'^(?P<aspath_effective_string>AS +path:) '
-                         r'+((?P<attr_value>[\S\s]+) +Cluster +list: '
-                         r'(?P<cluster_list>[\d\.\s]+)|(?P<attr_value2>[\S\s]+))$')
+        p16 = regex_engine.compile(r'^(?P<aspath_effective_string>AS +path:) '
+                                   r'+((?P<attr_value>[\S\s]+) +Cluster +list: '
+                                   r'(?P<cluster_list>[\d\.\s]+)|(?P<attr_value2>[\S\s]+))$')
 
         # Accepted Multipath
-        p16_1 = re.compile(r'^Accepted +(?P<accepted>\S+)$')
+        p16_1 = regex_engine.compile(r'^Accepted +(?P<accepted>\S+)$')
 
         # KRT in-kernel 0.0.0.0/0 -> {10.169.14.121}
-        p17 = re.compile(r'^(?P<text>KRT +in-kernel+[\S\s]+)$')
+        p17 = regex_engine.compile(r'^(?P<text>KRT +in-kernel+[\S\s]+)$')
 
         # Inactive reason: Route Preference
-        p18 = re.compile(r'^Inactive\s+reason: +(?P<inactive_reason>[\S\s]+)$')
+        p18 = regex_engine.compile(r'^Inactive\s+reason: +(?P<inactive_reason>[\S\s]+)$')
 
         # Area: 0.0.0.8
-        p19 = re.compile(r'^Area: +(?P<rt_ospf_area>\S+)$')
+        p19 = regex_engine.compile(r'^Area: +(?P<rt_ospf_area>\S+)$')
 
         # Label operation: Push 17000
         # Label operation: Push 17000, Push 1650, Push 1913(top)
-        p20 = re.compile(r'^Label +operation: +(?P<mpls_label>[\S\s]+)$')
+        p20 = regex_engine.compile(r'^Label +operation: +(?P<mpls_label>[\S\s]+)$')
 
         # Label TTL action: no-prop-ttl
         # Label TTL action: no-prop-ttl, no-prop-ttl, no-prop-ttl(top)
-        p21 = re.compile(r'^Label +TTL +action: +(?P<label_ttl_action>[\S\s]+)$')
+        p21 = regex_engine.compile(r'^Label +TTL +action: +(?P<label_ttl_action>[\S\s]+)$')
 
         # Load balance label: Label 17000: None; Label 1650: None; Label 1913: None;
-        p22 = re.compile(r'^Load +balance +label: +(?P<load_balance_label>[\S\s]+)$')
+        p22 = regex_engine.compile(r'^Load +balance +label: +(?P<load_balance_label>[\S\s]+)$')
 
         # Label element ptr: 0xc5f6ec0
-        p23 = re.compile(r'^Label +element +ptr: +(?P<label_element>\S+)$')
+        p23 = regex_engine.compile(r'^Label +element +ptr: +(?P<label_element>\S+)$')
 
         # Label parent element ptr: 0x0
-        p24 = re.compile(r'^Label +parent +element +ptr: +(?P<label_element_parent>\S+)$')
+        p24 = regex_engine.compile(r'^Label +parent +element +ptr: +(?P<label_element_parent>\S+)$')
         
         # Label element references: 2
-        p25 = re.compile(r'^Label +element +references: +(?P<label_element_refcount>\d+)$')
+        p25 = regex_engine.compile(r'^Label +element +references: +(?P<label_element_refcount>\d+)$')
 
         # Label element child references: 1
-        p26 = re.compile(r'^Label +element +child +references: +(?P<label_element_childcount>\d+)$')
+        p26 = regex_engine.compile(r'^Label +element +child +references: +(?P<label_element_childcount>\d+)$')
 
         # Label element lsp id: 0
-        p27 = re.compile(r'^Label +element +lsp +id: +(?P<label_element_lspid>\d+)$')
+        p27 = regex_engine.compile(r'^Label +element +lsp +id: +(?P<label_element_lspid>\d+)$')
 
         # Task: OSPF3 I/O./var/run/ppmd_control
-        p28 = re.compile(r'^Task: +(?P<task_name>[\S\s]+)$')
+        p28 = regex_engine.compile(r'^Task: +(?P<task_name>[\S\s]+)$')
 
         # OSPF3 realm ipv6-unicast area : 0.0.0.0, LSA ID : 0.0.0.1, LSA type : Extern
-        p29 = re.compile(r'^OSPF3\s+realm\s+ipv6-unicast\s+area\s:[\S\s]+$')
+        p29 = regex_engine.compile(r'^OSPF3\s+realm\s+ipv6-unicast\s+area\s:[\S\s]+$')
 
         # Page 0 idx 1, (group hktGCS002 type Internal) Type 1 val 0x10c0b9b0 (adv_entry)
-        p30 = re.compile(r'^Page +\d+ +idx +\d+[\S\s]+$')
+        p30 = regex_engine.compile(r'^Page +\d+ +idx +\d+[\S\s]+$')
         
         # Advertised metrics:
         #     Flags: Nexthop Change
@@ -993,29 +1023,29 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
         # Path 10.220.0.0
         # from 10.169.14.240
         # Vector len 4.  Val: 1
-        p31 = re.compile(r'^(Advertised +metrics:)|'
-                         r'(Flags: +)|(Nexthop: +)|(MED: +)|'
-                         r'(Localpref: +)|(AS +path:)|(Communities:)|'
-                         r'(Path +\S+)|(from +\S+)|(Vector +len)')
+        p31 = regex_engine.compile(r'^(Advertised +metrics:)|'
+                                   r'(Flags: +)|(Nexthop: +)|(MED: +)|'
+                                   r'(Localpref: +)|(AS +path:)|(Communities:)|'
+                                   r'(Path +\S+)|(from +\S+)|(Vector +len)')
         
         # Indirect next hop: 0xc285884 1048574 INH Session ID: 0x1ac
-        p32 = re.compile(r'^Indirect +next +hop: +(?P<indirect_nh>[\S\s]+)$')
+        p32 = regex_engine.compile(r'^Indirect +next +hop: +(?P<indirect_nh>[\S\s]+)$')
 
         # Indirect next hops: 1
-        p33 = re.compile(r'^Indirect +next +hops: +(?P<forwarding_nh_count>\d+)$')
+        p33 = regex_engine.compile(r'^Indirect +next +hops: +(?P<forwarding_nh_count>\d+)$')
 
         # 10.169.14.240/32 Originating RIB: inet.0
-        p34 = re.compile(r'^\S+ +Originating +RIB: +[\S\s]+$')
+        p34 = regex_engine.compile(r'^\S+ +Originating +RIB: +[\S\s]+$')
 
         # Node path count: 1
         # Forwarding nexthops: 1
-        p35 = re.compile(r'^(Node +path +count: +)|(Forwarding +nexthops: +)[\S\s]+$')
+        p35 = regex_engine.compile(r'^(Node +path +count: +)|(Forwarding +nexthops: +)[\S\s]+$')
 
         # Cluster list:  10.16.2.2 10.64.4.4
-        p36 = re.compile(r'^Cluster +list: +(?P<cluster_list>[\S\s]+)$')
+        p36 = regex_engine.compile(r'^Cluster +list: +(?P<cluster_list>[\S\s]+)$')
 
         # Router ID: 10.16.2.2
-        p37 = re.compile(r'^Router +ID: +(?P<peer_id>\S+)$')
+        p37 = regex_engine.compile(r'^Router +ID: +(?P<peer_id>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1533,17 +1563,17 @@ class ShowRouteForwardingTableSummary(ShowRouteForwardingTableSummarySchema):
         ret_dict = {}
 
         # Routing table: default.inet
-        p1 = re.compile(r'^Routing +table: +(?P<table_name>\S+)$')
+        p1 = regex_engine.compile(r'^Routing +table: +(?P<table_name>\S+)$')
 
         # Internet:
         # DHCP Snooping:
-        p2 = re.compile(r'^(?P<address_family>\S+( +\S+)?):$')
+        p2 = regex_engine.compile(r'^(?P<address_family>\S+( +\S+)?):$')
 
         # Enabled protocols: Bridging, 
-        p3 = re.compile(r'^Enabled +protocols: +(?P<enabled_protocols>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^Enabled +protocols: +(?P<enabled_protocols>[\S\s]+)$')
 
         # perm:          1 routes
-        p4 = re.compile(r'^(?P<route_table_type>\S+): +(?P<route_count>\d+) +routes$')
+        p4 = regex_engine.compile(r'^(?P<route_table_type>\S+): +(?P<route_count>\d+) +routes$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1677,33 +1707,33 @@ class ShowRouteReceiveProtocol(ShowRouteReceiveProtocolSchema):
         ret_dict = {}
         
         # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p1 = regex_engine.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+                                  r'destinations, +(?P<total_route_count>\d+) +routes +'
+                                  r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
+                                  r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
 
         # * 10.220.0.0/16           Self                 12003   120        (65151 65000) I
         # 10.220.0.0/16           10.189.5.253         12003   120        (65151 65000) I
         # * 10.4.1.1/32              Self                                    I
         # * 10.36.3.3/32              Self                                    2 I     
         # * 192.168.225.0/24           10.64.4.4                      100        200000 4 5 6 I   
-        p2 = re.compile(r'^((?P<active_tag>\*) +)?(?P<rt_destination>[\d\.\:\/]+) '
-                        r'+(?P<to>\S+)( +(?P<med>\d+)? +(?P<local_preference>\d+))? '
-                        r'+(?P<as_path>(\(([\S\s]+\)) +\w+)|([\d\s]+?\S))$')
+        p2 = regex_engine.compile(r'^((?P<active_tag>\*) +)?(?P<rt_destination>[\d\.\:\/]+) '
+                                  r'+(?P<to>\S+)( +(?P<med>\d+)? +(?P<local_preference>\d+))? '
+                                  r'+(?P<as_path>(\(([\S\s]+\)) +\w+)|([\d\s]+?\S))$')
 
         # * 2001:db8:3000::/48      2001:db8:7fc5:ca45::2 1000               65509 I
         # * 2001:db8:3000::/48      2001:db8:7fc5:ca45::2 1000     100       65509 I
         # * 2001:db8:3000::/48      2001:db8:7fc5:ca45::2          100       65509 I
-        p2_1 = re.compile(r'^((?P<active_tag>\*) +)?(?P<rt_destination>[\d\w\:]+\/[\d]+) '
-                          r'+(?P<to>\S+) (((?P<med>\d+)? +)(?P<local_preference>\d+)?)? '
-                          r'+(?P<as_path>(\(([\S\s]+\)) +\w+)|([\d\s]+?\S))$')
+        p2_1 = regex_engine.compile(r'^((?P<active_tag>\*) +)?(?P<rt_destination>[\d\w\:]+\/[\d]+) '
+                                    r'+(?P<to>\S+) (((?P<med>\d+)? +)(?P<local_preference>\d+)?)? '
+                                    r'+(?P<as_path>(\(([\S\s]+\)) +\w+)|([\d\s]+?\S))$')
 
         # 2001:db8:7fc5:ca45::1
-        p3 = re.compile(r'^(?P<rt_destination>[\d\:\w\/]+)$')
+        p3 = regex_engine.compile(r'^(?P<rt_destination>[\d\:\w\/]+)$')
 
         # *                         2001:db8:7fc5:ca45::4             100        I
         # *                         Self                 2       100        I
-        p4 = re.compile(r'^((?P<active_tag>\*) +)?(?P<to>[\d\:\w]+)( +(?P<med>\d+)? +(?P<local_preference>\d+))? +(?P<as_path>(\(([\S\s]+\)) +\w+)|((\d\s)?\w))$')
+        p4 = regex_engine.compile(r'^((?P<active_tag>\*) +)?(?P<to>[\d\:\w]+)( +(?P<med>\d+)? +(?P<local_preference>\d+))? +(?P<as_path>(\(([\S\s]+\)) +\w+)|((\d\s)?\w))$')
                         
 
         for line in out.splitlines():
@@ -1884,24 +1914,24 @@ class ShowRouteAdvertisingProtocol(ShowRouteAdvertisingProtocolSchema):
         ret_dict = {}
         
         # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p1 = regex_engine.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+                                  r'destinations, +(?P<total_route_count>\d+) +routes +'
+                                  r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
+                                  r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
 
         # * 10.220.0.0/16           Self                 12003   120        (65151 65000) I
         # * 10.4.1.1/32              Self                                    I
         # * 10.36.3.3/32              Self                                    2 I
         # * 10.81.123.0/32        Self                                    67890 [1] I
-        p2 = re.compile(r'((?P<active_tag>\*) +)?(?P<rt_destination>[\d\.\:\/]+)'
-                        r' +(?P<to>\S+)( +(?P<med>\d+) +(?P<local_preference>\d+))? '
-                        r'+(?P<as_path>[\s\S]+)')
+        p2 = regex_engine.compile(r'((?P<active_tag>\*) +)?(?P<rt_destination>[\d\.\:\/]+)'
+                                  r' +(?P<to>\S+)( +(?P<med>\d+) +(?P<local_preference>\d+))? '
+                                  r'+(?P<as_path>[\s\S]+)')
         
         # 2001:db8:7fc5:ca45::1
-        p3 = re.compile(r'^(?P<rt_destination>[\d\:\w\/]+)$')
+        p3 = regex_engine.compile(r'^(?P<rt_destination>[\d\:\w\/]+)$')
 
         # *                         Self                 2       100        I
-        p4 = re.compile(r'^((?P<active_tag>\*) +)?(?P<to>\S+)( +(?P<med>\d+)? +(?P<local_preference>\d+))? +(?P<as_path>(\(([\S\s]+\)) +\w+)|((\d\s)?\w))$')
+        p4 = regex_engine.compile(r'^((?P<active_tag>\*) +)?(?P<to>\S+)( +(?P<med>\d+)? +(?P<local_preference>\d+))? +(?P<as_path>(\(([\S\s]+\)) +\w+)|((\d\s)?\w))$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -2034,20 +2064,20 @@ class ShowRouteSummary(ShowRouteSummarySchema):
         ret_dict = {}
 
         # Autonomous system number: 65171
-        p1 = re.compile(r'^Autonomous +system +number: +(?P<as_number>\d+)$')
+        p1 = regex_engine.compile(r'^Autonomous +system +number: +(?P<as_number>\d+)$')
 
         # Router ID: 10.189.5.252
-        p2 = re.compile(r'^Router +ID: +(?P<router_id>\S+)$')
+        p2 = regex_engine.compile(r'^Router +ID: +(?P<router_id>\S+)$')
 
         # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-        p3 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p3 = regex_engine.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+                                  r'destinations, +(?P<total_route_count>\d+) +routes +'
+                                  r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
+                                  r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
         
         #  Direct:      6 routes,      6 active
-        p4 = re.compile(r'^(?P<protocol_name>\S+): +(?P<protocol_route_count>\d+) +'
-                        r'routes, +(?P<active_route_count>\d+) +\w+$')
+        p4 = regex_engine.compile(r'^(?P<protocol_name>\S+): +(?P<protocol_route_count>\d+) +'
+                                  r'routes, +(?P<active_route_count>\d+) +\w+$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2166,29 +2196,29 @@ class ShowRouteInstanceDetail(ShowRouteInstanceDetailSchema):
 
         ret_dict = {}
         # Router ID: 0.0.0.0
-        p1 = re.compile(r'^Router +ID: +(?P<router_id>\S+)$')
+        p1 = regex_engine.compile(r'^Router +ID: +(?P<router_id>\S+)$')
 
         # Type: forwarding        State: Active        
-        p2 = re.compile(r'^Type: +(?P<instance_type>\S+) +State: +(?P<instance_state>\S+)$')
+        p2 = regex_engine.compile(r'^Type: +(?P<instance_type>\S+) +State: +(?P<instance_state>\S+)$')
 
         # Tables:
-        p3 = re.compile(r'^Tables:$')
+        p3 = regex_engine.compile(r'^Tables:$')
 
         # Interfaces:
-        p4 = re.compile(r'^Interfaces:$')
+        p4 = regex_engine.compile(r'^Interfaces:$')
 
         # inet.0                 : 1615 routes (929 active, 0 holddown, 0 hidden)
         # __juniper_private1__.inet.0: 6 routes (5 active, 0 holddown, 0 hidden)
-        p5 = re.compile(r'^(?P<irib_name>\S+) *: +(?P<irib_route_count>\d+) +'
-                r'routes +\((?P<irib_active_count>\d+) +active, +'
-                r'(?P<irib_holddown_count>\d+) +holddown, +'
-                r'(?P<irib_hidden_count>\d+) +hidden\)$')
+        p5 = regex_engine.compile(r'^(?P<irib_name>\S+) *: +(?P<irib_route_count>\d+) +'
+                          r'routes +\((?P<irib_active_count>\d+) +active, +'
+                          r'(?P<irib_holddown_count>\d+) +holddown, +'
+                          r'(?P<irib_hidden_count>\d+) +hidden\)$')
 
         # master:
-        p6 = re.compile(r'^(?P<instance_name>\S+):$')
+        p6 = regex_engine.compile(r'^(?P<instance_name>\S+):$')
 
         # pfh-0/0/0.16383
-        p7 = re.compile(r'^(?P<interface_name>\S+)$')
+        p7 = regex_engine.compile(r'^(?P<interface_name>\S+)$')
 
 
         for line in out.splitlines():
@@ -2341,45 +2371,45 @@ class ShowRouteAdvertisingProtocolDetail(ShowRouteAdvertisingProtocolDetailSchem
         ret_dict = {}
 
         # inet.0: 60 destinations, 66 routes (60 active, 1 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>[^:]+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +'
-                        r'routes +\((?P<active_route_count>\d+) +'
-                        r'active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p1 = regex_engine.compile(r'^(?P<table_name>[^:]+): +(?P<destination_count>\d+) +'
+                                  r'destinations, +(?P<total_route_count>\d+) +'
+                                  r'routes +\((?P<active_route_count>\d+) +'
+                                  r'active, +(?P<holddown_route_count>\d+) +'
+                                  r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
 
         # * 10.36.255.252/32 (1 entry, 1 announced)
         # * 2001:3/128 (2 entries, 2 announced)
-        p2 = re.compile(r'^(?P<active_tag>\*)? *(?P<rt_destination>[\s\S]+)'
-                        r'/(?P<rt_prefix_length>\d+)'
-                        r' +\((?P<rt_entry_count>\d+) +\S+, +'
-                        r'(?P<rt_announced_count>\d+) +announced\)$')
+        p2 = regex_engine.compile(r'^(?P<active_tag>\*)? *(?P<rt_destination>[\s\S]+)'
+                                  r'/(?P<rt_prefix_length>\d+)'
+                                  r' +\((?P<rt_entry_count>\d+) +\S+, +'
+                                  r'(?P<rt_announced_count>\d+) +announced\)$')
 
         # BGP group lacGCS001 type External
-        p3 = re.compile(r'^BGP group +(?P<bgp_group_name>\S+)'
-                        r' +type +(?P<bgp_group_type>Internal|External)$')
+        p3 = regex_engine.compile(r'^BGP group +(?P<bgp_group_name>\S+)'
+                                  r' +type +(?P<bgp_group_type>Internal|External)$')
 
         # Route Label: 118071
-        p4 = re.compile(r'^Route Label: +(?P<route_label>\S+)$')
+        p4 = regex_engine.compile(r'^Route Label: +(?P<route_label>\S+)$')
 
         # Nexthop: 10.189.5.252
-        p5 = re.compile(r'^Nexthop: +(?P<to>\S+)$')
+        p5 = regex_engine.compile(r'^Nexthop: +(?P<to>\S+)$')
 
         # MED: 29012
-        p6 = re.compile(r'^MED: +(?P<med>\S+)$')
+        p6 = regex_engine.compile(r'^MED: +(?P<med>\S+)$')
 
         # Localpref: 4294967285
-        p7 = re.compile(r'^Localpref: +(?P<local_preference>\S+)$')
+        p7 = regex_engine.compile(r'^Localpref: +(?P<local_preference>\S+)$')
 
         # AS path: [65151] (65171) I
-        p8 = re.compile(r'^AS +path: +(?P<as_path>.*)$')
+        p8 = regex_engine.compile(r'^AS +path: +(?P<as_path>.*)$')
 
 
         # Communities: 65151:65109
         # Communities: 2:2 4:4 no-export
-        p9 = re.compile(r'^Communities: +(?P<communities>[\s\S]+)$')
+        p9 = regex_engine.compile(r'^Communities: +(?P<communities>[\s\S]+)$')
 
         # Flags: Nexthop Change
-        p10 = re.compile(r'^Flags: +(?P<flags>.*)$')
+        p10 = regex_engine.compile(r'^Flags: +(?P<flags>.*)$')
 
 
         for line in out.splitlines():
@@ -2510,26 +2540,26 @@ class ShowRouteForwardingTableLabel(ShowRouteForwardingTableLabelSchema):
 
         # Routing table: default.mpls
         # Routing table: __mpls-oam__.mpls
-        p1 = re.compile(r'^Routing +table: +(?P<table_name>\S+)$')
+        p1 = regex_engine.compile(r'^Routing +table: +(?P<table_name>\S+)$')
 
         # MPLS:
-        p2 = re.compile(r'^(?P<address_family>[^\s:]+):$')
+        p2 = regex_engine.compile(r'^(?P<address_family>[^\s:]+):$')
 
         # Enabled protocols: Bridging, Single VLAN, Dual VLAN,
-        p3 = re.compile(r'^Enabled +protocols: +(?P<enabled_protocols>.*)$')
+        p3 = regex_engine.compile(r'^Enabled +protocols: +(?P<enabled_protocols>.*)$')
 
         # Destination        Type RtRef Next hop           Type Index    NhRef Netif
-        p4 = re.compile(r'^Destination +Type +RtRef +Next hop +Type Index  +NhRef +Netif$')
+        p4 = regex_engine.compile(r'^Destination +Type +RtRef +Next hop +Type Index  +NhRef +Netif$')
 
         # 16                 user     0 10.169.14.158    Pop        578     2 ge-0/0/0.0
         # 16(S=0)            user     0 10.169.14.158    Pop        579     2 ge-0/0/0.0
         # 16(S=0) user 0 2001:AE Pop 579 2 ge-0/0/0.0
         # default            perm     0                    dscd      535     1
         # 575                user     0 192.168.145.218   Swap 526      590     2 ge-0/0/1.0
-        p5 = re.compile(r'^(?P<rt_destination>\S+) +(?P<destination_type>\S+) +'
-                        r'(?P<route_reference_count>\d+) +(?P<to>[\d\.|\d\:a-fA-F]+)? +'
-                        r'(?P<nh_type>\S+( \S+)?) +(?P<nh_index>\d+) +'
-                        r'(?P<nh_reference_count>\d+)( +)?(?P<via>\S+)?$')
+        p5 = regex_engine.compile(r'^(?P<rt_destination>\S+) +(?P<destination_type>\S+) +'
+                                  r'(?P<route_reference_count>\d+) +(?P<to>[\d\.|\d\:a-fA-F]+)? +'
+                                  r'(?P<nh_type>\S+( \S+)?) +(?P<nh_index>\d+) +'
+                                  r'(?P<nh_reference_count>\d+)( +)?(?P<via>\S+)?$')
 
 
         for line in out.splitlines():
@@ -2638,20 +2668,20 @@ class ShowRouteTableLabelSwitchedName(ShowRouteTableLabelSwitchedNameSchema):
         ret_dict = {}
 
         # mpls.0: 36 destinations, 36 routes (36 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>[^\s:]+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +'
-                        r'(?P<holddown_route_count>\d+) +holddown, +'
-                        r'(?P<hidden_route_count>\d+) +hidden\)$')
+        p1 = regex_engine.compile(r'^(?P<table_name>[^\s:]+): +(?P<destination_count>\d+) +'
+                                  r'destinations, +(?P<total_route_count>\d+) +routes +'
+                                  r'\((?P<active_route_count>\d+) +active, +'
+                                  r'(?P<holddown_route_count>\d+) +holddown, +'
+                                  r'(?P<hidden_route_count>\d+) +hidden\)$')
 
         # 46                 *[RSVP/7/1] 00:10:22, metric 1
-        p2 = re.compile(r'^(?P<rt_destination>\S+) +(?P<active_tag>\*)?'
-                        r'\[(?P<protocol_name>[^\s/]+)/(?P<preference>\d+)/(?P<preference2>\d+)\] +'
-                        r'(?P<age>[\d:]+), +metric +(?P<metric>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<rt_destination>\S+) +(?P<active_tag>\*)?'
+                                  r'\[(?P<protocol_name>[^\s/]+)/(?P<preference>\d+)/(?P<preference2>\d+)\] +'
+                                  r'(?P<age>[\d:]+), +metric +(?P<metric>\d+)$')
 
         # >  to 192.168.145.218 via ge-0/0/1.1, label-switched-path test_lsp_01
-        p3 = re.compile(r'^(?P<selected_next_hop>\> +)?to +(?P<to>\S+) +via +'
-                        r'(?P<via>[^\s,]+), +label-switched-path +(?P<lsp_name>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<selected_next_hop>\> +)?to +(?P<to>\S+) +via +'
+                                  r'(?P<via>[^\s,]+), +label-switched-path +(?P<lsp_name>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2789,73 +2819,73 @@ class ShowRouteProtocolProtocolExtensiveIpaddress(ShowRouteProtocolProtocolExten
         ret_dict = {}
 
         # inet.0: 8 destinations, 8 routes (8 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p1 = regex_engine.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+                                  r'destinations, +(?P<total_route_count>\d+) +routes +'
+                                  r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
+                                  r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
 
         
         # 10.16.2.2/32 (1 entry, 1 announced)
         # 2001:db8:4885:2101::1/128 (1 entry, 1 announced)
-        p2 = re.compile(r'^(?P<rt_destination>[\d\:\.]+)+\/+(?P<rt_prefix_length>\d+) +\((?P<text>\d+) +entry, +(?P<rt_announced_count>\d+) +announced\)$')
+        p2 = regex_engine.compile(r'^(?P<rt_destination>[\d\:\.]+)+\/+(?P<rt_prefix_length>\d+) +\((?P<text>\d+) +entry, +(?P<rt_announced_count>\d+) +announced\)$')
 
         # KRT in-kernel 10.16.2.2/32 -> {10.145.0.3}
-        p3 = re.compile(r'^(?P<text>KRT +in-kernel+[\S\s]+)$')
+        p3 = regex_engine.compile(r'^(?P<text>KRT +in-kernel+[\S\s]+)$')
 
         # *BGP Preference: 170/-101
-        p4 = re.compile(r'^(?P<active_tag>\*)?(?P<protocol_name>\S+)\s+'
-                        r'Preference:\s+(?P<preference>\d+)(\/(\-)?(?P<preference2>\d+))?$')
+        p4 = regex_engine.compile(r'^(?P<active_tag>\*)?(?P<protocol_name>\S+)\s+'
+                                  r'Preference:\s+(?P<preference>\d+)(\/(\-)?(?P<preference2>\d+))?$')
 
         # Next hop type: Router, Next hop index: 604
-        p5 = re.compile(r'^Next +hop type: +(?P<nh_type>\S+), +Next +hop +'
-                        r'index: +(?P<nh_index>\d+)$')
+        p5 = regex_engine.compile(r'^Next +hop type: +(?P<nh_type>\S+), +Next +hop +'
+                                  r'index: +(?P<nh_index>\d+)$')
 
         # Address: 0xf991014
-        p6 = re.compile(r'^Address: +(?P<nh_address>\S+)$')
+        p6 = regex_engine.compile(r'^Address: +(?P<nh_address>\S+)$')
 
         # Next-hop reference count: 2
-        p7 = re.compile(r'^Next-hop +reference +count: +(?P<nh_reference_count>\d+)$')
+        p7 = regex_engine.compile(r'^Next-hop +reference +count: +(?P<nh_reference_count>\d+)$')
 
         # Source: 10.145.0.3
-        p8 = re.compile(r'^Source: +(?P<gateway>\S+)$')
+        p8 = regex_engine.compile(r'^Source: +(?P<gateway>\S+)$')
 
         # Next hop: 10.145.0.3 via ge-0/0/0.0, selected
-        p9 = re.compile(r'^(?P<nh_string>Next hop):( +(?P<to>\S+))? '
-                        r'+via +(?P<via>\S+), +selected$')
+        p9 = regex_engine.compile(r'^(?P<nh_string>Next hop):( +(?P<to>\S+))? '
+                                  r'+via +(?P<via>\S+), +selected$')
 
         # Session Id: 0xe78
-        p10 = re.compile(r'^Session +Id: +(?P<session>\S+)$')
+        p10 = regex_engine.compile(r'^Session +Id: +(?P<session>\S+)$')
 
         # State: <Active Ext>
-        p11 = re.compile(r'State: +\<(?P<rt_entry_state>[\S\s]+)\>$')
+        p11 = regex_engine.compile(r'State: +\<(?P<rt_entry_state>[\S\s]+)\>$')
 
         # Local AS:     1 Peer AS: 30000
-        p12 = re.compile(r'^Local +AS: +(?P<local_as>\d+) +Peer +AS: +(?P<peer_as>\d+)$')
+        p12 = regex_engine.compile(r'^Local +AS: +(?P<local_as>\d+) +Peer +AS: +(?P<peer_as>\d+)$')
 
         # Age: 7:14:16
-        p13 = re.compile(r'^Age: +(?P<text>[\d\:]+)$')
+        p13 = regex_engine.compile(r'^Age: +(?P<text>[\d\:]+)$')
 
         # Validation State: unverified 
-        p14 = re.compile(r'^Validation +State: +(?P<validation_state>\S+)$')
+        p14 = regex_engine.compile(r'^Validation +State: +(?P<validation_state>\S+)$')
 
         # Task: BGP_30000.10.145.0.3
-        p15 = re.compile(r'^Task: +(?P<task_name>\S+)$')
+        p15 = regex_engine.compile(r'^Task: +(?P<task_name>\S+)$')
 
         # Announcement bits (1): 0-KRT
-        p16 = re.compile(r'^Announcement +bits +\((?P<announce_bits>\d+)\): '
-                         r'+(?P<announce_tasks>[\S\s]+)$')
+        p16 = regex_engine.compile(r'^Announcement +bits +\((?P<announce_bits>\d+)\): '
+                                   r'+(?P<announce_tasks>[\S\s]+)$')
 
         # AS path: I 
-        p17 = re.compile(r'^(?P<aspath_effective_string>AS +path:) +(?P<attr_value>[\d\w\s]+)$')
+        p17 = regex_engine.compile(r'^(?P<aspath_effective_string>AS +path:) +(?P<attr_value>[\d\w\s]+)$')
 
         # Accepted 
-        p18 = re.compile(r'^(?P<bgp_rt_flag>\w+)$')
+        p18 = regex_engine.compile(r'^(?P<bgp_rt_flag>\w+)$')
 
         # Localpref: 100 
-        p19 = re.compile(r'^Localpref: +(?P<local_preference>\d+)$')
+        p19 = regex_engine.compile(r'^Localpref: +(?P<local_preference>\d+)$')
 
         # Router ID: 10.16.2.2
-        p20 = re.compile(r'^Router +ID: +(?P<peer_id>[\d\.]+)$')
+        p20 = regex_engine.compile(r'^Router +ID: +(?P<peer_id>[\d\.]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3153,29 +3183,29 @@ class ShowRouteReceiveProtocolExtensive(ShowRouteReceiveProtocolExtensiveSchema)
         ret_dict = {}
 
         # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p1 = regex_engine.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+                                  r'destinations, +(?P<total_route_count>\d+) +routes +'
+                                  r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
+                                  r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
 
         # 0.0.0.0/0 (1 entry, 1 announced)
         # * 10.60.1.0/24 (1 entry, 1 announced)
         # * 2001:db8:4401:19::/64 (1 entry, 1 announced)
-        p2 = re.compile(r'^(?P<active_tag>\*)? *(?P<rt_destination>[\w.:]+)(\/(?P<rt_prefix_length>\d+))? +'
-                        r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<rt_announced_count>\d+) +announced\)$')        
+        p2 = regex_engine.compile(r'^(?P<active_tag>\*)? *(?P<rt_destination>[\w.:]+)(\/(?P<rt_prefix_length>\d+))? +'
+                                  r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<rt_announced_count>\d+) +announced\)$')        
 
         # Accepted
-        p3 = re.compile(r'^(?P<bgp_rt_flag>Accepted)$')
+        p3 = regex_engine.compile(r'^(?P<bgp_rt_flag>Accepted)$')
 
         # Nexthop: 10.64.4.4
-        p4 = re.compile(r'^Nexthop: +(?P<to>[0-9a-f.:]+)$')
+        p4 = regex_engine.compile(r'^Nexthop: +(?P<to>[0-9a-f.:]+)$')
 
         # Localpref: 100
-        p5 = re.compile(r'^Localpref: +(?P<local_preference>\d+)$')
+        p5 = regex_engine.compile(r'^Localpref: +(?P<local_preference>\d+)$')
 
         # AS path: I 
         # AS path: 30000 4 103 104 105 106 107 108 109 I
-        p6 = re.compile(r'^(?P<aspath_effective_string>AS +path:) +(?P<attr_value>([\S]+( +)?)+)$')        
+        p6 = regex_engine.compile(r'^(?P<aspath_effective_string>AS +path:) +(?P<attr_value>([\S]+( +)?)+)$')        
 
         for line in out.splitlines():
             line = line.strip()     
@@ -3317,28 +3347,28 @@ class ShowRouteReceiveProtocolPeerAddressExtensive(ShowRouteReceiveProtocolPeerA
         ret_dict = {}
 
         # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p1 = regex_engine.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+                                  r'destinations, +(?P<total_route_count>\d+) +routes +'
+                                  r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
+                                  r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
 
         # 0.0.0.0/0 (1 entry, 1 announced)
         # * 192.168.115.0/24 (1 entry, 1 announced)
-        p2 = re.compile(r'^(?P<active_tag>\* )?(?P<rt_destination>[0-9a-f.:]+)(\/(?P<rt_prefix_length>\d+))? +'
-                        r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<rt_announced_count>\d+) +announced\)$')        
+        p2 = regex_engine.compile(r'^(?P<active_tag>\* )?(?P<rt_destination>[0-9a-f.:]+)(\/(?P<rt_prefix_length>\d+))? +'
+                                  r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<rt_announced_count>\d+) +announced\)$')        
 
         # Accepted
-        p3 = re.compile(r'^(?P<bgp_rt_flag>Accepted)$')
+        p3 = regex_engine.compile(r'^(?P<bgp_rt_flag>Accepted)$')
 
         # Nexthop: 10.64.4.4
-        p4 = re.compile(r'^Nexthop: +(?P<to>[0-9a-f.:]+)$')
+        p4 = regex_engine.compile(r'^Nexthop: +(?P<to>[0-9a-f.:]+)$')
 
         # Localpref: 100
-        p5 = re.compile(r'^Localpref: +(?P<local_preference>\d+)$')
+        p5 = regex_engine.compile(r'^Localpref: +(?P<local_preference>\d+)$')
 
         # AS path: I 
         # AS path: 30000 4 103 104 105 106 107 108 109 I
-        p6 = re.compile(r'^(?P<aspath_effective_string>AS +path:) +(?P<attr_value>([\S]+( +)?)+)$')        
+        p6 = regex_engine.compile(r'^(?P<aspath_effective_string>AS +path:) +(?P<attr_value>([\S]+( +)?)+)$')        
 
         for line in out.splitlines():
             line = line.strip()     
@@ -3463,11 +3493,11 @@ class ShowRouteInstanceName(ShowRouteInstanceNameSchema):
         # NF-TEST              non-forwarding 
         # VR-TEST001           virtual-router
         # VRF-TEST001          vrf
-        p1 = re.compile(r'^(?P<instance_name>\S+) +(?P<instance_type>(non-forwarding|virtual-router|vrf))$')  
+        p1 = regex_engine.compile(r'^(?P<instance_name>\S+) +(?P<instance_type>(non-forwarding|virtual-router|vrf))$')  
 
         # NF-TEST.inet.0                                  106/0/0
-        p2 = re.compile(r'^(?P<irib_name>\S+) +(?P<irib_active_count>\d+)/'
-                        r'(?P<irib_holddown_count>\d+)/(?P<irib_hidden_count>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<irib_name>\S+) +(?P<irib_active_count>\d+)/'
+                                  r'(?P<irib_holddown_count>\d+)/(?P<irib_hidden_count>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6,13 +6,15 @@ JUNOS parsers for the following commands:
     * show rsvp session
     * show rsvp session transit
 """
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowRSVPNeighborSchema(MetaParser):
     """ Schema for:
         * show rsvp neighbor
@@ -51,18 +53,18 @@ class ShowRSVPNeighbor(ShowRSVPNeighborSchema):
         ret_dict = {}
 
         # RSVP neighbor: 4 learned
-        p1 = re.compile(r'^RSVP +neighbor: +(?P<rsvp_neighbor_count>\d+) +learned$')
+        p1 = regex_engine.compile(r'^RSVP +neighbor: +(?P<rsvp_neighbor_count>\d+) +learned$')
 
         # 10.34.3.252      15:55  0/0       15:52        9   106/0    0
         # 10.169.14.240    34:15  0/0       34:13        9   229/0    0
         # 10.169.14.157        0  1/0       34:13        9   230/229  333
         # 2001::AF       0  1/0       15:55        9   105/105  197
-        p2 = re.compile(r'^(?P<rsvp_neighbor_address>\S+) +'
-                        r'(?P<neighbor_idle>\S+) +'
-                        r'((?P<neighbor_up_count>\d+)/(?P<neighbor_down_count>\d+)) +'
-                        r'(?P<last_changed_time>\S+) +(?P<hello_interval>\d+) +'
-                        r'((?P<hellos_sent>\d+)/(?P<hellos_received>\d+)) +'
-                        r'(?P<messages_received>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<rsvp_neighbor_address>\S+) +'
+                                  r'(?P<neighbor_idle>\S+) +'
+                                  r'((?P<neighbor_up_count>\d+)/(?P<neighbor_down_count>\d+)) +'
+                                  r'(?P<last_changed_time>\S+) +(?P<hello_interval>\d+) +'
+                                  r'((?P<hellos_sent>\d+)/(?P<hellos_received>\d+)) +'
+                                  r'(?P<messages_received>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -144,50 +146,50 @@ class ShowRSVPNeighborDetail(ShowRSVPNeighborDetailSchema):
         ret_dict = {}
 
         # RSVP neighbor: 4 learned
-        p1 = re.compile(r'^RSVP +neighbor: +(?P<rsvp_neighbor_count>\d+) +learned$')
+        p1 = regex_engine.compile(r'^RSVP +neighbor: +(?P<rsvp_neighbor_count>\d+) +learned$')
 
         # Address: 10.34.3.252 status: Down (Node neighbor)
         # Address: 10.169.14.157 via: ge-0/0/0.0 status: Up
-        p2 = re.compile(r'^Address: +(?P<rsvp_neighbor_address>\S+) +'
-                        r'(via: +(?P<rsvp_neighbor_interface>\S+) +)?'
-                        r'status: +(?P<rsvp_neighbor_status>\S+)'
-                        r'( +(?P<rsvp_neighbor_node>\(Node neighbor\)))?$')
+        p2 = regex_engine.compile(r'^Address: +(?P<rsvp_neighbor_address>\S+) +'
+                                  r'(via: +(?P<rsvp_neighbor_interface>\S+) +)?'
+                                  r'status: +(?P<rsvp_neighbor_status>\S+)'
+                                  r'( +(?P<rsvp_neighbor_node>\(Node neighbor\)))?$')
 
         # Last changed time: 27:54, Idle: 27:55 sec, Up cnt: 0, Down cnt: 0
         # Last changed time: 46:15, Idle: 0 sec, Up cnt: 1, Down cnt: 0
-        p3 = re.compile(r'^Last +changed +time: +(?P<last_changed_time>[^\s,]+), +'
-                        r'Idle: +(?P<neighbor_idle>\S+) +sec, +'
-                        r'Up +cnt: +(?P<neighbor_up_count>\d+), +'
-                        r'Down +cnt: +(?P<neighbor_down_count>\d+)$')
+        p3 = regex_engine.compile(r'^Last +changed +time: +(?P<last_changed_time>[^\s,]+), +'
+                                  r'Idle: +(?P<neighbor_idle>\S+) +sec, +'
+                                  r'Up +cnt: +(?P<neighbor_up_count>\d+), +'
+                                  r'Down +cnt: +(?P<neighbor_down_count>\d+)$')
 
         # Message received: 695
-        p4 = re.compile(r'^Message +received: +(?P<messages_received>\d+)$')
+        p4 = regex_engine.compile(r'^Message +received: +(?P<messages_received>\d+)$')
 
         # Hello: sent 187, received: 0, interval: 9 sec
-        p5 = re.compile(r'^Hello: +sent:? (?P<hellos_sent>\d+), +'
-                        r'received: +(?P<hellos_received>\d+), +'
-                        r'interval: +(?P<hello_interval>\d+) +sec$')
+        p5 = regex_engine.compile(r'^Hello: +sent:? (?P<hellos_sent>\d+), +'
+                                  r'received: +(?P<hellos_received>\d+), +'
+                                  r'interval: +(?P<hello_interval>\d+) +sec$')
 
         # Remote instance: 0xa1a75540, Local instance: 0x41ad0a42
-        p6 = re.compile(r'^Remote +instance: +(?P<rsvp_neighbor_remote_instance>[^\s,]+), +'
-                        r'Local +instance: +(?P<rsvp_neighbor_local_instance>\S+)$')
+        p6 = regex_engine.compile(r'^Remote +instance: +(?P<rsvp_neighbor_remote_instance>[^\s,]+), +'
+                                  r'Local +instance: +(?P<rsvp_neighbor_local_instance>\S+)$')
 
         # Refresh reduction:  operational
-        p7 = re.compile(r'^Refresh +reduction: +(?P<rsvp_refresh_reduct_status>.*)$')
+        p7 = regex_engine.compile(r'^Refresh +reduction: +(?P<rsvp_refresh_reduct_status>.*)$')
 
         # Remote end: disabled, Ack-extension: disabled
-        p8 = re.compile(r'^Remote +end: +(?P<rsvp_refresh_reduct_remote_status>[^\s,]+), +'
-                        r'Ack-extension: +(?P<rsvp_refresh_reduct_ack_status>[^\s,]+)$')
+        p8 = regex_engine.compile(r'^Remote +end: +(?P<rsvp_refresh_reduct_remote_status>[^\s,]+), +'
+                                  r'Ack-extension: +(?P<rsvp_refresh_reduct_ack_status>[^\s,]+)$')
 
         # Enhanced FRR: Enabled
-        p9 = re.compile(r'^Enhanced +FRR: +(?P<rsvp_nbr_enh_lp_status>\S+)$')
+        p9 = regex_engine.compile(r'^Enhanced +FRR: +(?P<rsvp_nbr_enh_lp_status>\S+)$')
 
         # LSPs (total 30): Phop 30, PPhop 0, Nhop 0, NNhop 0
-        p10 = re.compile(r'^LSPs +\(total +(?P<rsvp_nbr_enh_lp_total_lsp_count>\d+)\): +'
-                         r'Phop +(?P<rsvp_nbr_enh_lp_phop_lsp_count>\d+), +'
-                         r'PPhop +(?P<rsvp_nbr_enh_lp_pphop_lsp_count>\d+), +'
-                         r'Nhop +(?P<rsvp_nbr_enh_lp_nhop_lsp_count>\d+), +'
-                         r'NNhop +(?P<rsvp_nbr_enh_lp_nnhop_lsp_count>\d+)')
+        p10 = regex_engine.compile(r'^LSPs +\(total +(?P<rsvp_nbr_enh_lp_total_lsp_count>\d+)\): +'
+                                   r'Phop +(?P<rsvp_nbr_enh_lp_phop_lsp_count>\d+), +'
+                                   r'PPhop +(?P<rsvp_nbr_enh_lp_pphop_lsp_count>\d+), +'
+                                   r'Nhop +(?P<rsvp_nbr_enh_lp_nhop_lsp_count>\d+), +'
+                                   r'NNhop +(?P<rsvp_nbr_enh_lp_nnhop_lsp_count>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -332,18 +334,18 @@ class ShowRSVPSession(ShowRSVPSessionSchema):
         # Ingress RSVP: 0 sessions
         # Egress RSVP: 0 sessions
         # Transit RSVP: 30 sessions
-        p1 = re.compile(r'^(?P<session_type>\S+) RSVP: +(?P<count>\d+) +sessions$')
+        p1 = regex_engine.compile(r'^(?P<session_type>\S+) RSVP: +(?P<count>\d+) +sessions$')
 
         # Total 30 displayed, Up 30, Down 0
-        p2 = re.compile(r'^Total +(?P<display_count>\d+) +displayed, +'
-                        r'Up +(?P<up_count>\d+), +Down +(?P<down_count>\d+)$')
+        p2 = regex_engine.compile(r'^Total +(?P<display_count>\d+) +displayed, +'
+                                  r'Up +(?P<up_count>\d+), +Down +(?P<down_count>\d+)$')
 
         # 10.49.194.125 10.49.194.127 Up 0 1 FF 46 44 test_lsp_01
-        p3 = re.compile(r'^(?P<destination_address>[\d\.]+) +'
-                        r'(?P<source_address>[\d\.]+) +(?P<lsp_state>\S+) +'
-                        r'(?P<route_count>\d+) +(?P<rsb_count>\d+) +'
-                        r'(?P<resv_style>\S+) +(?P<label_in>\S+) +'
-                        r'(?P<label_out>\S+) +(?P<name>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<destination_address>[\d\.]+) +'
+                                  r'(?P<source_address>[\d\.]+) +(?P<lsp_state>\S+) +'
+                                  r'(?P<route_count>\d+) +(?P<rsb_count>\d+) +'
+                                  r'(?P<resv_style>\S+) +(?P<label_in>\S+) +'
+                                  r'(?P<label_out>\S+) +(?P<name>\S+)$')
         
 
         for line in out.splitlines():
@@ -2,14 +2,14 @@
 JunOS parsers for the following show commands:
     * show security policies hit-count
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Schema, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowSecurityPoliciesHitCountSchema(MetaParser):
     """ Schema for:
@@ -49,14 +49,14 @@ class ShowSecurityPoliciesHitCount(ShowSecurityPoliciesHitCountSchema):
         ret_dict = {}
 
         # Logical system: root-logical-system
-        p1 = re.compile(r'^(Logical system:)\s(?P<logical_system>\S+)$')
+        p1 = regex_engine.compile(r'^(Logical system:)\s(?P<logical_system>\S+)$')
 
         # 9       junos-global     junos-global      GLOBAL-PERMIT-SSH-IN 541543
         # 11      untrust          UNTRUST-STRICT        STRICT-PERMIT-NTP-IN 1243
-        p2 = re.compile(r'^(?P<index>\d+)\s+(?P<from_zone>\S+)\s+(?P<to_zone>\S+)\s+(?P<name>\S+)\s+(?P<policy_hit_count>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<index>\d+)\s+(?P<from_zone>\S+)\s+(?P<to_zone>\S+)\s+(?P<name>\S+)\s+(?P<policy_hit_count>\d+)$')
 
         # Number of policy: 12
-        p3 = re.compile(r'(Number of policy:)\s(?P<total_policies>\d+)$')
+        p3 = regex_engine.compile(r'(Number of policy:)\s(?P<total_policies>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
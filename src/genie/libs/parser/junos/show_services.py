@@ -12,15 +12,15 @@ JUNOS parsers for the following commands:
     * show services accounting status
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowServicesAccountingAggregationTemplateSchema(MetaParser):
     """ Schema for:
@@ -81,41 +81,41 @@ class ShowServicesAccountingAggregationTemplate(ShowServicesAccountingAggregatio
         # Source address: 10.120.202.64, Destination address: 10.169.14.158, Top Label Address: 121
         # Source address: 10.120.202.64, Destination address: 10.169.14.158
         # Source address: 10.120.202.64
-        p1 = re.compile(r'^Source +address: +(?P<source_address>\S+)(, +Destination +address: '
-                        r'+(?P<destination_address>\S+))?(, Top +Label +Address: +'
-                        r'(?P<top_label_address>\S+))?$')
+        p1 = regex_engine.compile(r'^Source +address: +(?P<source_address>\S+)(, +Destination +address: '
+                                  r'+(?P<destination_address>\S+))?(, Top +Label +Address: +'
+                                  r'(?P<top_label_address>\S+))?$')
 
         # Destination address: 000:0:0:0:0:0:0:0
-        p1_2 = re.compile(r'^Destination +address: +(?P<destination_address>\S+)$')
+        p1_2 = regex_engine.compile(r'^Destination +address: +(?P<destination_address>\S+)$')
 
         # Source port: 8, Destination port: 0
-        p2 = re.compile(r'^Source +port: +(?P<source_port>\d+), '
-                       r'+Destination +port: +(?P<destination_port>\d+)$')
+        p2 = regex_engine.compile(r'^Source +port: +(?P<source_port>\d+), '
+                                 r'+Destination +port: +(?P<destination_port>\d+)$')
 
         # Protocol: 1, TOS: 0, TCP flags: 0
-        p3 = re.compile(r'^Protocol: +(?P<protocol>\d+), +'
-                       r'TOS: +(?P<tos>\d+), +'
-                       r'TCP +flags: +(?P<tcp_flags>\d+)$')
+        p3 = regex_engine.compile(r'^Protocol: +(?P<protocol>\d+), +'
+                                 r'TOS: +(?P<tos>\d+), +'
+                                 r'TCP +flags: +(?P<tcp_flags>\d+)$')
 
         # Source mask: 32, Destination mask: 30
-        p4 = re.compile(r'^Source +mask: +(?P<source_mask>\d+), '
-                       r'+Destination +mask: +(?P<destination_mask>\d+)$')
+        p4 = regex_engine.compile(r'^Source +mask: +(?P<source_mask>\d+), '
+                                 r'+Destination +mask: +(?P<destination_mask>\d+)$')
 
         # Input SNMP interface index: 618, Output SNMP interface index: 620
-        p5 = re.compile(r'^Input +SNMP +interface +index: +(?P<input_snmp_interface_index>\d+), +'
-                       r'Output +SNMP +interface index: +(?P<output_snmp_interface_index>\d+)$')
+        p5 = regex_engine.compile(r'^Input +SNMP +interface +index: +(?P<input_snmp_interface_index>\d+), +'
+                                 r'Output +SNMP +interface index: +(?P<output_snmp_interface_index>\d+)$')
 
         # Start time: 79167425, End time: 79167425
-        p6 = re.compile(r'^Start +time: +(?P<start_time>\d+), +'
-                       r'End +time: +(?P<end_time>\d+)$')
+        p6 = regex_engine.compile(r'^Start +time: +(?P<start_time>\d+), +'
+                                 r'End +time: +(?P<end_time>\d+)$')
 
         # Packet count: 1, Byte count: 84
-        p7 = re.compile(r'^Packet +count: +(?P<packet_count>\d+), +'
-                       r'Byte +count: +(?P<byte_count>\d+)$')
+        p7 = regex_engine.compile(r'^Packet +count: +(?P<packet_count>\d+), +'
+                                 r'Byte +count: +(?P<byte_count>\d+)$')
 
         # MPLS label 1: 299888, MPLS label 2: 16, MPLS label 3: 0
-        p8 = re.compile(r'^MPLS +label 1: +(?P<mpls_label_1>\d+), +MPLS +label 2: '
-                        r'+(?P<mpls_label_2>\d+), MPLS +label 3: +(?P<mpls_label_3>\d+)$')
+        p8 = regex_engine.compile(r'^MPLS +label 1: +(?P<mpls_label_1>\d+), +MPLS +label 2: '
+                                  r'+(?P<mpls_label_2>\d+), MPLS +label 3: +(?P<mpls_label_3>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -241,19 +241,19 @@ class ShowServicesAccountingUsage(ShowServicesAccountingUsageSchema):
         ret_dict = {}
 
         # CPU utilization
-        p1 = re.compile(r'^CPU +utilization$')
-        p1_1 = re.compile(r'^{master}$')
+        p1 = regex_engine.compile(r'^CPU +utilization$')
+        p1_1 = regex_engine.compile(r'^{master}$')
 
         # ms-9/0/0
-        p2 = re.compile(r'^(?P<interface_name>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<interface_name>\S+)$')
 
         # Uptime: 79203479 milliseconds, Interrupt time: 0 microseconds
-        p3 = re.compile(r'^Uptime: (?P<uptime>\d+) +milliseconds, '
-                        r'+Interrupt +time: +(?P<inttime>\d+) +microseconds$')
+        p3 = regex_engine.compile(r'^Uptime: (?P<uptime>\d+) +milliseconds, '
+                                  r'+Interrupt +time: +(?P<inttime>\d+) +microseconds$')
 
         # Load (5 second): 1%, Load (1 minute): 1%
-        p4 = re.compile(r'^Load +\(5 +second\): +(?P<five_second_load>\d+)%, '
-                        r'+Load +\(1 +minute\): +(?P<one_minute_load>\d+)%$')
+        p4 = regex_engine.compile(r'^Load +\(5 +second\): +(?P<five_second_load>\d+)%, '
+                                  r'+Load +\(1 +minute\): +(?P<one_minute_load>\d+)%$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -337,22 +337,22 @@ class ShowServicesAccountingErrors(ShowServicesAccountingErrorsSchema):
         ret_dict = {}
 
         # Error information
-        p1 = re.compile(r'^Error +information$')
-        p1_1 = re.compile(r'^{master}$')
+        p1 = regex_engine.compile(r'^Error +information$')
+        p1_1 = regex_engine.compile(r'^{master}$')
 
         # Service Accounting interface: ms-9/0/0
-        p2 = re.compile(r'^Service +Accounting +interface: +(?P<interface_name>\S+)$')
+        p2 = regex_engine.compile(r'^Service +Accounting +interface: +(?P<interface_name>\S+)$')
 
         # Service sets dropped: 0, Active timeout failures: 0
-        p3 = re.compile(r'^Service +sets +dropped: +(?P<service_set_dropped>\d+), +'
-                        r'Active +timeout +failures: +(?P<active_timeout_failures>\d+)$')
+        p3 = regex_engine.compile(r'^Service +sets +dropped: +(?P<service_set_dropped>\d+), +'
+                                  r'Active +timeout +failures: +(?P<active_timeout_failures>\d+)$')
 
         # Export packet failures: 0, Flow creation failures: 0
-        p4 = re.compile(r'^Export +packet +failures: +(?P<export_packet_failures>\d+), +'
-                        r'Flow +creation +failures: +(?P<flow_creation_failures>\d+)$')
+        p4 = regex_engine.compile(r'^Export +packet +failures: +(?P<export_packet_failures>\d+), +'
+                                  r'Flow +creation +failures: +(?P<flow_creation_failures>\d+)$')
 
         # Memory overload: No
-        p5 = re.compile(r'^Memory +overload: +(?P<memory_overload>\S+)$')
+        p5 = regex_engine.compile(r'^Memory +overload: +(?P<memory_overload>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -452,32 +452,32 @@ class ShowServicesAccountingFlow(ShowServicesAccountingFlowSchema):
         ret_dict = {}
 
         # Flow information
-        p1 = re.compile(r'^Flow +information$')
-        p1_1 = re.compile(r'^{master}$')
+        p1 = regex_engine.compile(r'^Flow +information$')
+        p1_1 = regex_engine.compile(r'^{master}$')
 
         # Service Accounting interface: ms-9/0/0, Local interface index: 140
-        p2 = re.compile(r'^Service +Accounting +interface: +(?P<interface_name>\S+), +'
-                        r'Local +interface +index: +(?P<local_ifd_index>\d+)$')
+        p2 = regex_engine.compile(r'^Service +Accounting +interface: +(?P<interface_name>\S+), +'
+                                  r'Local +interface +index: +(?P<local_ifd_index>\d+)$')
 
         # Flow packets: 0, Flow bytes: 0
-        p3 = re.compile(r'^Flow +packets: +(?P<flow_packets>\d+), +'
-                        r'Flow +bytes: +(?P<flow_bytes>\d+)$')
+        p3 = regex_engine.compile(r'^Flow +packets: +(?P<flow_packets>\d+), +'
+                                  r'Flow +bytes: +(?P<flow_bytes>\d+)$')
 
         # Export packet failures: 0, Flow creation failures: 0
-        p4 = re.compile(r'^Flow +packets +10-second +rate: +(?P<flow_packets_ten_second_rate>\d+), +'
-                        r'Flow +bytes +10-second +rate: +(?P<flow_bytes_ten_second_rate>\d+)$')
+        p4 = regex_engine.compile(r'^Flow +packets +10-second +rate: +(?P<flow_packets_ten_second_rate>\d+), +'
+                                  r'Flow +bytes +10-second +rate: +(?P<flow_bytes_ten_second_rate>\d+)$')
 
         # Active flows: 0, Total flows: 0
-        p5 = re.compile(r'^Active +flows: +(?P<active_flows>\d+), +'
-                        r'Total +flows: +(?P<flows>\d+)$')
+        p5 = regex_engine.compile(r'^Active +flows: +(?P<active_flows>\d+), +'
+                                  r'Total +flows: +(?P<flows>\d+)$')
 
         # Flows exported: 0, Flows packets exported: 9
-        p6 = re.compile(r'^Flows +exported: +(?P<flows_exported>\d+), +'
-                        r'Flows +packets +exported: +(?P<flow_packets_exported>\d+)$')
+        p6 = regex_engine.compile(r'^Flows +exported: +(?P<flows_exported>\d+), +'
+                                  r'Flows +packets +exported: +(?P<flow_packets_exported>\d+)$')
 
         # Flows inactive timed out: 0, Flows active timed out: 0
-        p7 = re.compile(r'^Flows +inactive +timed +out: +(?P<flows_expired>\d+), +'
-                        r'Flows +active +timed +out: +(?P<flows_aged>\d+)$')
+        p7 = regex_engine.compile(r'^Flows +inactive +timed +out: +(?P<flows_expired>\d+), +'
+                                  r'Flows +active +timed +out: +(?P<flows_aged>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -598,26 +598,26 @@ class ShowServicesAccountingMemory(ShowServicesAccountingMemorySchema):
         ret_dict = {}
 
         # Memory information
-        p1 = re.compile(r'^Memory +utilization$')
-        p1_1 = re.compile(r'^{master}$')
+        p1 = regex_engine.compile(r'^Memory +utilization$')
+        p1_1 = regex_engine.compile(r'^{master}$')
 
         # Service Accounting interface: ms-9/0/0
-        p2 = re.compile(r'^Service +Accounting +interface: +(?P<interface_name>\S+)')
+        p2 = regex_engine.compile(r'^Service +Accounting +interface: +(?P<interface_name>\S+)')
 
         # Allocation count: 1, Free count: 0
-        p3 = re.compile(r'^Allocation +count: +(?P<allocation_count>\d+), +'
-                        r'Free +count: +(?P<free_count>\d+)$')
+        p3 = regex_engine.compile(r'^Allocation +count: +(?P<allocation_count>\d+), +'
+                                  r'Free +count: +(?P<free_count>\d+)$')
 
         # Allocations per second: 0, Frees per second: 0
-        p4 = re.compile(r'^Allocations +per +second: +(?P<allocations_per_second>\d+), +'
-                        r'Frees +per +second: +(?P<frees_per_second>\d+)$')
+        p4 = regex_engine.compile(r'^Allocations +per +second: +(?P<allocations_per_second>\d+), +'
+                                  r'Frees +per +second: +(?P<frees_per_second>\d+)$')
 
         # Total memory used (in bytes): 862529184, Total memory free (in bytes): 3164002312
-        p5 = re.compile(r'^Total +memory +used +\(in bytes\): +(?P<memory_used>\d+), +'
-                        r'Total +memory +free +\(in bytes\): +(?P<memory_free>\d+)$')
+        p5 = regex_engine.compile(r'^Total +memory +used +\(in bytes\): +(?P<memory_used>\d+), +'
+                                  r'Total +memory +free +\(in bytes\): +(?P<memory_free>\d+)$')
 
         # Memory used by Jflow-v9 (in bytes): 48
-        p6 = re.compile(r'^Memory +used +by +Jflow-v9 +\(in bytes\): +(?P<v9_memory_used>\d+)')
+        p6 = regex_engine.compile(r'^Memory +used +by +Jflow-v9 +\(in bytes\): +(?P<v9_memory_used>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -726,20 +726,20 @@ class ShowServicesAccountingStatus(ShowServicesAccountingStatusSchema):
         ret_dict = {}
 
         # Service Accounting interface: ms-9/0/0
-        p1 = re.compile(r'^Service +Accounting +interface: +(?P<interface_name>\S+)')
+        p1 = regex_engine.compile(r'^Service +Accounting +interface: +(?P<interface_name>\S+)')
 
         # Export format: 9, Route record count: 902244
-        p2 = re.compile(r'^Export +format: +(?P<status_export_format>\d+), +'
-                        r'Route +record +count: +(?P<status_route_record_count>\d+)$')
+        p2 = regex_engine.compile(r'^Export +format: +(?P<status_export_format>\d+), +'
+                                  r'Route +record +count: +(?P<status_route_record_count>\d+)$')
 
         # IFL to SNMP index count: 296, AS count: 0
-        p3 = re.compile(r'^IFL +to +SNMP +index +count: +(?P<status_ifl_snmp_map_count>\d+), +'
-                        r'AS +count: +(?P<status_as_count>\d+)$')
+        p3 = regex_engine.compile(r'^IFL +to +SNMP +index +count: +(?P<status_ifl_snmp_map_count>\d+), +'
+                                  r'AS +count: +(?P<status_as_count>\d+)$')
 
         # Configuration set: Yes, Route record set: No, IFL SNMP map set: Yes
-        p4 = re.compile(r'^Configuration +set: +(?P<status_monitor_config_set>\S+), +'
-                        r'Route +record +set: +(?P<status_monitor_route_record_set>\S+), +'
-                        r'IFL +SNMP +map +set: +(?P<status_monitor_ifl_snmp_set>\S+)$')
+        p4 = regex_engine.compile(r'^Configuration +set: +(?P<status_monitor_config_set>\S+), +'
+                                  r'Route +record +set: +(?P<status_monitor_route_record_set>\S+), +'
+                                  r'IFL +SNMP +map +set: +(?P<status_monitor_ifl_snmp_set>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
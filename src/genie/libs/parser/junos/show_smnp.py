@@ -5,15 +5,15 @@ JUNOS parsers for the following commands:
     * show configuration snmp
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
     # Sub Schema snmp-object
 class ShowSnmpMibWalkSystemSchema(MetaParser):
@@ -47,7 +47,7 @@ class ShowSnmpMibWalkSystem(ShowSnmpMibWalkSystemSchema):
             out = output
 
         # sysContact.0  = KHK
-        p1 = re.compile(r'^(?P<name>\S+) += +(?P<object_value>.+)$')
+        p1 = regex_engine.compile(r'^(?P<name>\S+) += +(?P<object_value>.+)$')
 
         ret_dict = {}
 
@@ -157,10 +157,10 @@ class ShowSnmpConfiguration(ShowSnmpConfigurationSchema):
             out = output
 
         # location TH-HK2/floor_1B-002/rack_KHK1104;
-        p1 = re.compile(r'^location +(?P<location>.+);+$')
+        p1 = regex_engine.compile(r'^location +(?P<location>.+);+$')
 
         # contact KHK;
-        p2 = re.compile(r'^contact +(?P<contact>.+);+$')
+        p2 = regex_engine.compile(r'^contact +(?P<contact>.+);+$')
 
         # community safaripub {
         #     authorization read-only;
@@ -171,14 +171,14 @@ class ShowSnmpConfiguration(ShowSnmpConfigurationSchema):
         #         2001:db8:d38a:d3e9::/64;
         #     }
         # }
-        p3 = re.compile(r'^(community +(?P<name>.+) +\{)$')
-        p4 = re.compile(r'^(authorization +(?P<authorization>.+);)$')
-        p5 = re.compile(r'^(?P<client>((\d+\.[\d\.]+\/[\d]+)|(\w+\:[\w\:]+\/[\d]+)|(0x\d+))([\s\S])*);$')
+        p3 = regex_engine.compile(r'^(community +(?P<name>.+) +\{)$')
+        p4 = regex_engine.compile(r'^(authorization +(?P<authorization>.+);)$')
+        p5 = regex_engine.compile(r'^(?P<client>((\d+\.[\d\.]+\/[\d]+)|(\w+\:[\w\:]+\/[\d]+)|(0x\d+))([\s\S])*);$')
 
         # trap-options {
         #     source-address lo0;
         # }
-        p6 = re.compile(r'^source-address +(?P<source_address>.+);$')
+        p6 = regex_engine.compile(r'^source-address +(?P<source_address>.+);$')
 
         # trap-group safaripub {
         #     version v1;
@@ -192,10 +192,10 @@ class ShowSnmpConfiguration(ShowSnmpConfigurationSchema):
         #         10.169.249.67;
         #     }
         # }
-        p7 = re.compile(r'^trap-group +(?P<name>.+) +\{$')
-        p8 = re.compile(r'^version +(?P<version>.+);$')
-        p9 = re.compile(r'^categories +\{(?P<categories>.+);$')
-        p10 = re.compile(r'^(?P<target>((\d+\.[\d\.]+)|(\w+\:[\w\:]+)|(0x\d+)));$')
+        p7 = regex_engine.compile(r'^trap-group +(?P<name>.+) +\{$')
+        p8 = regex_engine.compile(r'^version +(?P<version>.+);$')
+        p9 = regex_engine.compile(r'^categories +\{(?P<categories>.+);$')
+        p10 = regex_engine.compile(r'^(?P<target>((\d+\.[\d\.]+)|(\w+\:[\w\:]+)|(0x\d+)));$')
 
         ret_dict = {}
         inner_block_text = ''
@@ -515,10 +515,10 @@ class ShowSnmpStatistics(ShowSnmpStatisticsSchema):
             out = output
 
         # SNMP statistics:
-        p1 = re.compile(r'^SNMP +statistics:$')
+        p1 = regex_engine.compile(r'^SNMP +statistics:$')
 
         # Input:
-        p2 = re.compile(r'^Input:$')
+        p2 = regex_engine.compile(r'^Input:$')
 
         # Packets: 8, Bad versions: 0, Bad community names: 0,
         # Bad community uses: 0, ASN parse errors: 0,
@@ -529,7 +529,7 @@ class ShowSnmpStatistics(ShowSnmpStatisticsSchema):
         # Get responses: 0, Traps: 0,
         # Silent drops: 0, Proxy drops: 0, Commit pending drops: 0,
         # Throttle drops: 0, Duplicate request drops: 0
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(Packets: (?P<packets>\S+))|(Bad versions: (?P<bad_versions>\S+))|(Bad community names: (?P<bad_community_names>\S+))'
             r'|(Bad community uses: (?P<bad_community_uses>\S+))|(ASN parse errors: (?P<asn_parse_errors>\S+))'
             r'|(Too bigs: (?P<too_bigs>\S+))|(No such names: (?P<no_such_names>\S+))|(Bad values: (?P<bad_values>\S+))'
@@ -541,14 +541,14 @@ class ShowSnmpStatistics(ShowSnmpStatisticsSchema):
             r'|(Throttle drops: (?P<throttle_drops>\S+))|(Duplicate request drops: (?P<duplicate_request_drops>\S+))$')
 
         # V3 Input:
-        p4 = re.compile(r'^V3 Input:$')
+        p4 = regex_engine.compile(r'^V3 Input:$')
 
         # Unknown security models: 0, Invalid messages: 0
         # Unknown pdu handlers: 0, Unavailable contexts: 0
         # Unknown contexts: 0, Unsupported security levels: 0
         # Not in time windows: 0, Unknown user names: 0
         # Unknown engine ids: 0, Wrong digests: 0, Decryption errors: 0
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^(Unknown security models: (?P<unknown_secmodels>\S+))|(Invalid messages: (?P<invalid_msgs>\S+))'
             r'|(Unknown pdu handlers: (?P<unknown_pduhandlers>\S+))|(Unavailable contexts: (?P<unavail_contexts>\S+))'
             r'|(Unknown contexts: (?P<unknown_contexts>\S+))|(Unsupported security levels: (?P<unsupported_seclevels>\S+))'
@@ -556,39 +556,39 @@ class ShowSnmpStatistics(ShowSnmpStatisticsSchema):
             r'|(Unknown engine ids: (?P<unknown_eids>\S+))|(Wrong digests: (?P<wrong_digests>\S+))|(Decryption errors: (?P<decrypt_errors>\S+))$')
 
         # Output:
-        p6 = re.compile(r'^Output:$')
+        p6 = regex_engine.compile(r'^Output:$')
 
         # Packets: 8, Too bigs: 0, No such names: 0,
         # Bad values: 0, General errors: 0,
         #   Get requests: 0, Get nexts: 0, Set requests: 0,
         # Get responses: 8, Traps: 0
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^(Packets: (?P<packets>\S+))|(Too bigs: (?P<too_bigs>\S+))|(No such names: (?P<no_such_names>\S+))'
             r'|(Bad values: (?P<bad_values>\S+))|(General errors: (?P<general_errors>\S+))'
             r'|(Get requests: (?P<get_requests>\S+))|(Get nexts: (?P<get_nexts>\S+))|(Set requests: (?P<set_requests>\S+))'
             r'|(Get responses: (?P<get_responses>\S+))|(Traps: (?P<traps>\S+))$')
 
         # Performance:
-        p8 = re.compile(r'^Performance:$')
+        p8 = regex_engine.compile(r'^Performance:$')
 
         # Average response time(ms): 10.91
-        p9 = re.compile(r'^(Average response time\(ms\): (?P<average_response_time>\S+))$')
+        p9 = regex_engine.compile(r'^(Average response time\(ms\): (?P<average_response_time>\S+))$')
 
         # Number of requests dispatched to subagents in last:
-        p10 = re.compile(r'Number of requests dispatched to subagents in last:$')
+        p10 = regex_engine.compile(r'Number of requests dispatched to subagents in last:$')
 
         # 1 minute:0, 5 minutes:0, 15 minutes:0
-        p11 = re.compile(r'(1 minute:(?P<one_minute_request_throughput>\S+))'
-                        r'|(5 minutes:(?P<five_minute_request_throughput>\S+))'
-                        r'|(15 minutes:(?P<fifteen_minute_request_throughput>\S+))$')
+        p11 = regex_engine.compile(r'(1 minute:(?P<one_minute_request_throughput>\S+))'
+                                  r'|(5 minutes:(?P<five_minute_request_throughput>\S+))'
+                                  r'|(15 minutes:(?P<fifteen_minute_request_throughput>\S+))$')
 
         # Number of responses dispatched to NMS in last:
-        p12 = re.compile(r'Number of responses dispatched to NMS in last:$')
+        p12 = regex_engine.compile(r'Number of responses dispatched to NMS in last:$')
 
         # 1 minute:0, 5 minutes:0, 15 minutes:0
-        p13 = re.compile(r'(1 minute:(?P<one_minute_response_throughput>\S+))'
-                        r'|(5 minutes:(?P<five_minute_response_throughput>\S+))'
-                        r'|(15 minutes:(?P<fifteen_minute_response_throughput>\S+))$')
+        p13 = regex_engine.compile(r'(1 minute:(?P<one_minute_response_throughput>\S+))'
+                                  r'|(5 minutes:(?P<five_minute_response_throughput>\S+))'
+                                  r'|(15 minutes:(?P<fifteen_minute_response_throughput>\S+))$')
 
         ret_dict = {}
         performance_request = False
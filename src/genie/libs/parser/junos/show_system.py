@@ -16,14 +16,14 @@ JunOS parsers for the following show commands:
     - 'show system connections'
 """
 
-# python
-import re
-
 # metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowSystemBuffersSchema(MetaParser):
     """ Schema for:
@@ -86,71 +86,71 @@ class ShowSystemBuffers(ShowSystemBuffersSchema):
         ret_dict = {}
 
         # 588/2142/2730 mbufs in use (current/cache/total)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^(?P<current_mbufs>\S+)/(?P<cached_mbufs>\S+)/"
             r"(?P<total_mbufs>\S+) +mbufs +in +use +\(current/cache/total\)$")
 
         # 516/714/1230/124756 mbuf clusters in use (current/cache/total/max)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<current_mbuf_clusters>\S+)/(?P<cached_mbuf_clusters>\S+)"
             r"/(?P<total_mbuf_clusters>\S+)/(?P<max_mbuf_clusters>\S+) +mbuf +clusters"
             r" +in use +\(current/cache/total/max\)$")
 
         # 513/499 mbuf+clusters out of packet secondary zone in use (current/cache)
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<packet_count>\S+)/(?P<packet_free>\S+) +mbuf\+clusters"
             r" +out +of +packet +secondary +zone +in +use +\(current/cache\)$")
 
         # 0/2/2/62377 4k (page size) jumbo clusters in use (current/cache/total/max)
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^(?P<current_jumbo_clusters_4k>\S+)/"
             r"(?P<cached_jumbo_clusters_4k>\S+)/(?P<total_jumbo_clusters_4k>\S+)/"
             r"(?P<max_jumbo_clusters_4k>\S+) +4k +\(page +size\) +jumbo +clusters +in"
             r" +use +\(current/cache/total/max\)$")
 
         # 0/0/0/18482 9k (page size) jumbo clusters in use (current/cache/total/max)
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^(?P<current_jumbo_clusters_9k>\S+)/"
             r"(?P<cached_jumbo_clusters_9k>\S+)/(?P<total_jumbo_clusters_9k>\S+)/"
             r"(?P<max_jumbo_clusters_9k>\S+) +9k +\(page +size\) +jumbo +clusters +in"
             r" +use +\(current/cache/total/max\)$")
 
         # 0/0/0/10396 16k (page size) jumbo clusters in use (current/cache/total/max)
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r"^(?P<current_jumbo_clusters_16k>\S+)/"
             r"(?P<cached_jumbo_clusters_16k>\S+)/(?P<total_jumbo_clusters_16k>\S+)/"
             r"(?P<max_jumbo_clusters_16k>\S+) +16k +\(page +size\) +jumbo +clusters"
             r" +in +use +\(current/cache/total/max\)$")
 
         # 1179K/1971K/3150K bytes allocated to network (current/cache/total)
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^(?P<current_bytes_in_use>\S+)K/(?P<cached_bytes>\S+)K/"
             r"(?P<total_bytes>\S+)K +bytes +allocated +to +network +\(current/cache/total\)$"
         )
 
         # 0/0/0 requests for mbufs denied (mbufs/clusters/mbuf+clusters)
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^(?P<mbuf_failures>\S+)/(?P<cluster_failures>\S+)/"
             r"(?P<packet_failures>\S+) +requests +for +mbufs +denied +\(mbufs/clusters/mbuf\+clusters\)$"
         )
 
         # 0/0/0 requests for jumbo clusters denied (4k/9k/16k)
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^(?P<jumbo_cluster_failures_4k>\S+)/(?P<jumbo_cluster_failures_9k>\S+)"
             r"/(?P<jumbo_cluster_failures_16k>\S+) +requests +for +jumbo +clusters +denied +\(4k/9k/16k\)$"
         )
 
         # 0 requests for sfbufs denied
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^(?P<sfbuf_requests_denied>\S+) +requests +for +sfbufs"
             r" +denied$")
 
         # 0 requests for sfbufs delayed
-        p11 = re.compile(r"^(?P<sfbuf_requests_delayed>\S+) +requests +for"
-                         r" +sfbufs +delayed$")
+        p11 = regex_engine.compile(r"^(?P<sfbuf_requests_delayed>\S+) +requests +for"
+                                   r" +sfbufs +delayed$")
 
         # 0 requests for I/O initiated by sendfile
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^(?P<io_initiated>\S+) +requests +for +I/O +initiated"
             r" +by +sendfile$")
 
@@ -403,18 +403,18 @@ class ShowSystemUsers(ShowSystemUsersSchema):
         # 10:08PM up 7 days, 10:56, 1 user, load averages: 0.02, 0.02, 0.00
         # 1:08AM up 8 days, 5 hrs, 1 user, load averages: 0.07, 0.02, 0.01
         # 9:38AM up 209 day, 37 mins, 3 users, load averages: 0.28, 0.39, 0.37
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<time>[\d\:a-zA-Z]+) +up +'
             r'(?P<up_time>(\d+ +(days|day), +)?([\d:]+( +mins)?( +hrs)?)), +'
             r'(?P<user_count>\d+) +user(s)?, +'
             r'load +averages: (?P<avg1>[\d\.]+), +'
             r'(?P<avg2>[\d\.]+), +(?P<avg3>[\d\.]+)$')
 
-        p1_2 = re.compile(r'^USER +TTY +FROM +LOGIN@ +IDLE +WHAT *$')
+        p1_2 = regex_engine.compile(r'^USER +TTY +FROM +LOGIN@ +IDLE +WHAT *$')
 
         #cisco     pts/0    10.1.0.1                          2:35AM      - -cl
-        p2 = re.compile(r'^(?P<user>\S+) +(?P<tty>\S+) +(?P<from>\S+) +'
-                        r'(?P<login>\S+) +(?P<idle>\S+) +(?P<command>.*)$')
+        p2 = regex_engine.compile(r'^(?P<user>\S+) +(?P<tty>\S+) +(?P<from>\S+) +'
+                                  r'(?P<login>\S+) +(?P<idle>\S+) +(?P<command>.*)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -515,7 +515,7 @@ class ShowSystemCommit(ShowSystemCommitSchema):
             out = output
 
         # 0   2020-03-05 16:04:34 UTC by cisco via cli
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<sequence_number>\d+) +(?P<date_time>([\d\-]+) +'
             r'(([\d\:]+)) (\S+)) +by +(?P<user>\S+) +via +(?P<client>\S+)$')
 
@@ -616,13 +616,13 @@ class ShowSystemQueues(ShowSystemQueuesSchema):
             out = output
 
         # lsi                             0        12500        0       41        0
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<name>\S+) +(?P<octets_in_queue>\d+)'
             r' +(?P<max_octets_allowed>\d+) +(?P<packets_in_queue>\d+) +'
             r'(?P<max_packets_allowed>\d+) +(?P<number_of_queue_drops>\d+)$')
 
         # input protocol              bytes          max  packets      max    drops
-        p2 = re.compile(r'^input +protocol +bytes +max +packets +max +drops$')
+        p2 = regex_engine.compile(r'^input +protocol +bytes +max +packets +max +drops$')
 
         interface_flag = True
         ret_dict = {}
@@ -739,7 +739,7 @@ class ShowSystemStorage(ShowSystemStorageSchema):
         ret_dict = {}
 
         # /dev/gpt/junos           20G       1.2G        17G        7%  /.mount
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<filesystem_name>\S+) +(?P<total_blocks>\S+) +'
             r'(?P<used_blocks>\S+) +(?P<available_blocks>\S+) +(?P<used_percent>\S+)'
             r' +(?P<mounted_on>\S+)$')
@@ -860,16 +860,16 @@ class ShowSystemCoreDumps(ShowSystemCoreDumpsSchema):
             out = output
 
         # -rw-r--r--  1 root  wheel    1252383 Aug 8   2019 /var/crash/core.riot.mpc0.1565307741.1716.gz
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<file_permissions>\S+) +(?P<file_links>\S+) +'
             r'(?P<file_owner>\S+)  +(?P<file_group>\S+) +(?P<file_size>\S+) +'
             r'(?P<file_date>\S+ +\d+ +\d+) +(?P<file_name>\S+)$')
 
         # /var/tmp/*core*: No such file or directory
-        p2 = re.compile(r'^(?P<output>\S+: +No +such +file +or +directory)$')
+        p2 = regex_engine.compile(r'^(?P<output>\S+: +No +such +file +or +directory)$')
 
         # total files: 6
-        p3 = re.compile(r'^total +files: +(?P<total_files>\d)$')
+        p3 = regex_engine.compile(r'^total +files: +(?P<total_files>\d)$')
 
         ret_dict = {}
 
@@ -1017,32 +1017,32 @@ class ShowSystemUptime(ShowSystemUptimeSchema):
         ret_dict = {}
 
         #Current time: 2020-03-26 08:16:41 UTC
-        p1 = re.compile(r'^Current time: +(?P<current_time>[\S\s]+)$')
+        p1 = regex_engine.compile(r'^Current time: +(?P<current_time>[\S\s]+)$')
 
         #Time Source:  LOCAL CLOCK
-        p2 = re.compile(r'^Time Source: +(?P<time_source>[\w\s\.]+)$')
+        p2 = regex_engine.compile(r'^Time Source: +(?P<time_source>[\w\s\.]+)$')
 
         #System booted: 2019-08-29 09:02:22 UTC (29w6d 23:14 ago)
-        p3 = re.compile(r'^System booted: +(?P<date_time>[\w\s\-\:]+) '
-                        r'+\((?P<time_length>[\w\s\:]+)\s+ago\)$')
+        p3 = regex_engine.compile(r'^System booted: +(?P<date_time>[\w\s\-\:]+) '
+                                  r'+\((?P<time_length>[\w\s\:]+)\s+ago\)$')
 
         #Protocols started: 2019-08-29 09:03:25 UTC (29w6d 23:13 ago)
-        p4 = re.compile(r'^Protocols started: +(?P<date_time>[\w\s\-\:]+) '
-                        r'+\((?P<time_length>[\w\s\:]+)\s+ago\)$')
+        p4 = regex_engine.compile(r'^Protocols started: +(?P<date_time>[\w\s\-\:]+) '
+                                  r'+\((?P<time_length>[\w\s\:]+)\s+ago\)$')
 
         #Last configured: 2020-03-05 16:04:34 UTC (2w6d 16:12 ago) by cisco
-        p5 = re.compile(r'^Last configured: +(?P<date_time>'
-                        r'[A-Za-z\t .\d\-\:]+)+\((?P<time_length>'
-                        r'[\w+\s\d+\:\d]+) ago\) by (?P<user>\S+)$')
+        p5 = regex_engine.compile(r'^Last configured: +(?P<date_time>'
+                                  r'[A-Za-z\t .\d\-\:]+)+\((?P<time_length>'
+                                  r'[\w+\s\d+\:\d]+) ago\) by (?P<user>\S+)$')
 
         # 8:16AM  up 209 days, 23:14, 5 users, load averages: 0.43, 0.43, 0.42
         # 2:08PM  up 11:03, 1 users, load averages: 0.31, 0.48, 0.50
         # 3:57AM  up 1 day, 16:57, 1 users, load averages: 0.55, 0.46, 0.44
         # 12:31PM  up 15 days, 5 mins, 1 user, load averages: 0.07, 0.09, 0.04
-        p6 = re.compile(r'^(?P<date_time>\d+\:\w+)\s+up\s+((?P<days>\d+)\s+day(s)?,\s+)?'
-                        r'(?P<mins>((\d+ mins|[\w\:]+)))[^,]*,\s+(?P<user_count>\d+)\s+user(s)?'
-                        r',\s+load\s+averages:\s+(?P<avg1>[\d\.]+),\s+(?P<avg2>[\d\.]+)'
-                        r',\s+(?P<avg3>[\d\.]+)$')
+        p6 = regex_engine.compile(r'^(?P<date_time>\d+\:\w+)\s+up\s+((?P<days>\d+)\s+day(s)?,\s+)?'
+                                  r'(?P<mins>((\d+ mins|[\w\:]+)))[^,]*,\s+(?P<user_count>\d+)\s+user(s)?'
+                                  r',\s+load\s+averages:\s+(?P<avg1>[\d\.]+),\s+(?P<avg2>[\d\.]+)'
+                                  r',\s+(?P<avg3>[\d\.]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2683,34 +2683,34 @@ class ShowSystemStatistics(ShowSystemStatisticsSchema):
             out = output
 
         #Tcp:
-        p1 = re.compile(r"^(?P<state>\S+):$")
+        p1 = regex_engine.compile(r"^(?P<state>\S+):$")
 
         # 265063785 packets sent
         # 0 interface-restricted dad proxy duplicates
         # 4214 IPv4->MPLS L3 packets received
         # 5 LSP ping packets (ttl-expired/router alert)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^(?P<number_value>\d+) +(?P<key>([\w\-\'\>\,\/\.\<\s]|\([(\D+)\s]+\))+)$"
         )
 
         # 52538606 data packets (49634888 bytes)
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^(?P<number_value_one>\d+) +(?P<key>[\D\s]+)\([(\D+)\s]*"
             r"(?P<number_value_two>\d+)[(\D+)\s]*\)$")
 
         # Output Histogram
-        p4 = re.compile(r"^(?P<histogram_type>\S+) +Histogram$")
+        p4 = regex_engine.compile(r"^(?P<histogram_type>\S+) +Histogram$")
 
         # source addresses on an outgoing I/F
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^(?P<header_for_source_address_selection>source +addresses +[\S\s]+)$"
         )
 
         # Output histogram:
-        p6 = re.compile(r"^(?P<histogram_type>\S+) +histogram:$")
+        p6 = regex_engine.compile(r"^(?P<histogram_type>\S+) +histogram:$")
 
         # histogram by message type:
-        p7 = re.compile(r"^histogram +by +message +type:$")
+        p7 = regex_engine.compile(r"^histogram +by +message +type:$")
 
         ret_dict = {}
 
@@ -4807,16 +4807,16 @@ class ShowSystemInformation(ShowSystemInformationSchema):
         ret_dict = {}
 
         # Model: vmx
-        p1 = re.compile(r'^Model: +(?P<hardware_model>\S+)$')
+        p1 = regex_engine.compile(r'^Model: +(?P<hardware_model>\S+)$')
 
         # Family: junos
-        p2 = re.compile(r'^Family: +(?P<os_name>\S+)$')
+        p2 = regex_engine.compile(r'^Family: +(?P<os_name>\S+)$')
 
         # Junos: 19.2R1.8
-        p3 = re.compile(r'^Junos: +(?P<os_version>\S+)$')
+        p3 = regex_engine.compile(r'^Junos: +(?P<os_version>\S+)$')
 
         # Hostname: P4
-        p4 = re.compile(r'^Hostname: +(?P<host_name>\S+)$')
+        p4 = regex_engine.compile(r'^Hostname: +(?P<host_name>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4912,14 +4912,14 @@ class ShowSystemConnections(ShowSystemConnectionsSchema):
         ret_dict = {}
 
         # Active Internet connections (including servers)
-        p1 = re.compile(r'^Active +Internet +connections +\(including servers\) *$')
+        p1 = regex_engine.compile(r'^Active +Internet +connections +\(including servers\) *$')
 
         # Proto Recv-Q Send-Q  Local Address                                 Foreign Address                               (state)
-        p2 = re.compile(r'^Proto +Recv-Q +Send-Q +Local +Address +Foreign +Address +\(state\) *$')
+        p2 = regex_engine.compile(r'^Proto +Recv-Q +Send-Q +Local +Address +Foreign +Address +\(state\) *$')
 
         # tcp4       0      0  10.1.0.192.22                                  10.1.0.1.56714                                 ESTABLISHED
-        p3 = re.compile(r'^(?P<proto>\S+) +(?P<recv_q>\S+) +(?P<send_q>\S+) +'
-                        r'(?P<local_address>\S+) +(?P<foreign_address>\S+) +(?P<state>.*)$')
+        p3 = regex_engine.compile(r'^(?P<proto>\S+) +(?P<recv_q>\S+) +(?P<send_q>\S+) +'
+                                  r'(?P<local_address>\S+) +(?P<foreign_address>\S+) +(?P<state>.*)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5,14 +5,14 @@ JunOS parsers for the following show commands:
       'show task memory'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowTaskReplicationSchema(MetaParser):
     """ Schema for:
@@ -41,16 +41,16 @@ class ShowTaskReplication(ShowTaskReplicationSchema):
             out = output
 
         # Stateful Replication: Disabled
-        p1 = re.compile(r'^Stateful +Replication: +(?P<task_gres_state>\S+)$')
+        p1 = regex_engine.compile(r'^Stateful +Replication: +(?P<task_gres_state>\S+)$')
 
         # RE mode: Master
-        p2 = re.compile(r'^RE +mode: +(?P<task_re_mode>\S+)$')
+        p2 = regex_engine.compile(r'^RE +mode: +(?P<task_re_mode>\S+)$')
 
         # Protocol                Synchronization Status
         # OSPF                    Complete              
         # OSPF3                   Complete              
         # BGP                     Complete  
-        p3 = re.compile(r'(?P<name>[A-Z0-6]+)\s+(?P<state>\S+)')
+        p3 = regex_engine.compile(r'(?P<name>[A-Z0-6]+)\s+(?P<state>\S+)')
 
         ret_dict = {}
 
@@ -127,18 +127,18 @@ class ShowTaskMemory(ShowTaskMemorySchema):
             out = output
 
         # Currently In Use:        26857          1%  now
-        p1 = re.compile(r'Currently +In +Use: +(?P<task_memory_in_use_size>\d+) '
-                        r'+(?P<task_memory_in_use_avail>\d+)% +(?P<task_memory_in_use_size_status>\S+)$')
+        p1 = regex_engine.compile(r'Currently +In +Use: +(?P<task_memory_in_use_size>\d+) '
+                                  r'+(?P<task_memory_in_use_avail>\d+)% +(?P<task_memory_in_use_size_status>\S+)$')
 
         # Maximum Ever Used:       27300          1%  20/10/01 01:27:19
-        p2 = re.compile(r'^Maximum +Ever +Used: +(?P<task_memory_max_size>\d+) '
-                        r'+(?P<task_memory_max_avail>\d+)% +(?P<task_memory_max_when>'
-                        r'[\d\/\s\:]+)$')
+        p2 = regex_engine.compile(r'^Maximum +Ever +Used: +(?P<task_memory_max_size>\d+) '
+                                  r'+(?P<task_memory_max_avail>\d+)% +(?P<task_memory_max_when>'
+                                  r'[\d\/\s\:]+)$')
 
         # Available:             2078171        100%  now
-        p3 = re.compile(r'Available: +(?P<task_memory_free_size>\d+) +'
-                        r'(?P<task_memory_free_size_avail>\d+)% +'
-                        r'(?P<task_memory_free_size_status>\S+)$')
+        p3 = regex_engine.compile(r'Available: +(?P<task_memory_free_size>\d+) +'
+                                  r'(?P<task_memory_free_size_avail>\d+)% +'
+                                  r'(?P<task_memory_free_size_status>\S+)$')
 
         ret_dict = {}
 
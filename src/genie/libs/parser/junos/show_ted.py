@@ -6,14 +6,14 @@ JunOS parsers for the following show commands:
     - 'show ted database {ipaddress}'
 """
 
-# python
-import re
-
 # metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowTedDatabaseExtensiveSchema(MetaParser):
     """ Schema for:
@@ -127,73 +127,73 @@ class ShowTedDatabaseExtensive(ShowTedDatabaseExtensiveSchema):
         ret_dict = {}
 
         # TED database: 0 ISIS nodes 0 INET nodes
-        p1 = re.compile(r'^TED +database: +(?P<isis_nodes>\d+) +ISIS +nodes +(?P<inet_nodes>\d+) +INET +nodes$')
+        p1 = regex_engine.compile(r'^TED +database: +(?P<isis_nodes>\d+) +ISIS +nodes +(?P<inet_nodes>\d+) +INET +nodes$')
 
         # NodeID: 172.16.1.1
-        p2 = re.compile(r'^NodeID: +(?P<node_id>\S+)$')
+        p2 = regex_engine.compile(r'^NodeID: +(?P<node_id>\S+)$')
 
         # Type: Rtr, Age: 1000 secs, LinkIn: 0, LinkOut: 0
-        p3 = re.compile(r'^Type: +(?P<type>[\w-]+), +Age: +(?P<age>\d+) +secs, +LinkIn: '
-                        r'+(?P<link_in>\d+), +LinkOut: +(?P<link_out>\d+)$')
+        p3 = regex_engine.compile(r'^Type: +(?P<type>[\w-]+), +Age: +(?P<age>\d+) +secs, +LinkIn: '
+                                  r'+(?P<link_in>\d+), +LinkOut: +(?P<link_out>\d+)$')
 
         # Protocol: OSPF(0.0.0.1)
-        p4 = re.compile(r'^Protocol: +(?P<protocol>[\w().]+)$')
+        p4 = regex_engine.compile(r'^Protocol: +(?P<protocol>[\w().]+)$')
 
         # To: 172.16.1.1, Local: 10.16.0.1, Remote: 10.16.0.2
-        p5 = re.compile(r'^To: +(?P<to>\S+), +Local: +(?P<local>\S+), +Remote: +(?P<remote>\S+)$')
+        p5 = regex_engine.compile(r'^To: +(?P<to>\S+), +Local: +(?P<local>\S+), +Remote: +(?P<remote>\S+)$')
 
         # Local interface index: 0, Remote interface index: 0
-        p6 = re.compile(r'^Local +interface +index: +(?P<local_interface_index>\d+), +'
-                        r'Remote +interface +index: +(?P<remote_interface_index>\d+)$')
+        p6 = regex_engine.compile(r'^Local +interface +index: +(?P<local_interface_index>\d+), +'
+                                  r'Remote +interface +index: +(?P<remote_interface_index>\d+)$')
 
         # Color: 0 blue
-        p7 = re.compile(r'^Color: +(?P<color>[\w<> ]+)$')
+        p7 = regex_engine.compile(r'^Color: +(?P<color>[\w<> ]+)$')
 
         # Metric: 0
-        p8 = re.compile(r'^Metric: +(?P<metric>\d+)$')
+        p8 = regex_engine.compile(r'^Metric: +(?P<metric>\d+)$')
 
         # Static BW: 100Mbps
-        p9 = re.compile(r'^Static +BW: +(?P<static_bw>\w+)$')
+        p9 = regex_engine.compile(r'^Static +BW: +(?P<static_bw>\w+)$')
 
         # Reservable BW: 100bps
-        p10 = re.compile(r'^Reservable +BW: +(?P<reservable_bw>\w+)$')
+        p10 = regex_engine.compile(r'^Reservable +BW: +(?P<reservable_bw>\w+)$')
 
         # [0] 0bps
         # [0] 0bps         [1] 0bps
         # [0] 0bps         [1] 0bps        [2] 0bps
         # [0] 0bps         [1] 0bps        [2] 0bps        [3] 0bps
-        p11 = re.compile(r'\[(?P<priority>\d+)\] +(?P<bw>\w+)')
+        p11 = regex_engine.compile(r'\[(?P<priority>\d+)\] +(?P<bw>\w+)')
 
         # Interface Switching Capability Descriptor(1):
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^Interface +Switching +Capability +Descriptor\((?P<descriptor>[\w ]+)\):$')
 
         # Switching type: Packet
-        p13 = re.compile(r'^Switching +type: +(?P<switching_type>\w+)$')
+        p13 = regex_engine.compile(r'^Switching +type: +(?P<switching_type>\w+)$')
 
         # Encoding type: Packet
-        p14 = re.compile(r'^Encoding +type: +(?P<encoding_type>\w+)$')
+        p14 = regex_engine.compile(r'^Encoding +type: +(?P<encoding_type>\w+)$')
 
         # IPV4, SID: 12345, Flags: 0x00, Weight: 0
-        p15 = re.compile(r'^(?P<address_family>\w+), +SID: +(?P<sid>\d+), +Flags: +'
-                         r'(?P<flags>\w+), +Weight: +(?P<weight>\d+)$')
+        p15 = regex_engine.compile(r'^(?P<address_family>\w+), +SID: +(?P<sid>\d+), +Flags: +'
+                                   r'(?P<flags>\w+), +Weight: +(?P<weight>\d+)$')
 
         # 172.16.1.1/32
-        p16 = re.compile(r'^(?P<prefix>\S+/\d+)$')
+        p16 = regex_engine.compile(r'^(?P<prefix>\S+/\d+)$')
 
         # Flags: 0x60
-        p17 = re.compile(r'^Flags: +(?P<flags>\w+)$')
+        p17 = regex_engine.compile(r'^Flags: +(?P<flags>\w+)$')
 
         # SID: 1234, Flags: 0x00, Algo: 0
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r'^SID: +(?P<sid>\d+), +Flags: +(?P<flags>\w+), +Algo: +(?P<algo>\d+)$')
 
         # SRGB block [Start: 12345, Range: 1234, Flags: 0x00]
-        p19 = re.compile(r'^SRGB +block +\[Start: +(?P<start>\d+), +Range: +'
-                         r'(?P<range>\d+), +Flags: +(?P<flags>\w+)\]$')
+        p19 = regex_engine.compile(r'^SRGB +block +\[Start: +(?P<start>\d+), +Range: +'
+                                   r'(?P<range>\d+), +Flags: +(?P<flags>\w+)\]$')
 
         # Algo: 0
-        p20 = re.compile(r'^Algo: +(?P<algo>\d+)$')
+        p20 = regex_engine.compile(r'^Algo: +(?P<algo>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -426,23 +426,23 @@ class ShowTedDatabaseIpAddress(ShowTedDatabaseIpAddressSchema):
         ret_dict = {}
 
         # TED database: 0 ISIS nodes 0 INET nodes
-        p1 = re.compile(r'^TED +database: +(?P<isis_nodes>\d+) +ISIS +nodes +' 
-                  r'(?P<inet_nodes>\d+) +INET +nodes$')
+        p1 = regex_engine.compile(r'^TED +database: +(?P<isis_nodes>\d+) +ISIS +nodes +' 
+                            r'(?P<inet_nodes>\d+) +INET +nodes$')
         
         # 10.34.2.250                  Rtr    1876     2      2 OSPF(0.0.0.8)
-        p2 = re.compile(r'^(?P<ted_database_id>\S+) +(?P<ted_database_type>\S+) +'
-                        r'(?P<ted_database_age>\d+) +(?P<ted_database_link_in>\d+) +'
-                        r'(?P<ted_database_link_out>\d+) +(?P<ted_database_protocol>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<ted_database_id>\S+) +(?P<ted_database_type>\S+) +'
+                                  r'(?P<ted_database_age>\d+) +(?P<ted_database_link_in>\d+) +'
+                                  r'(?P<ted_database_link_out>\d+) +(?P<ted_database_protocol>\S+)$')
 
         # To: 10.169.14.240, Local: 10.169.14.158, Remote: 10.169.14.157
-        p3 = re.compile(r'^To: +(?P<ted_link_to>\S+), +Local: +'
-                        r'(?P<ted_link_local_address>\S+), +Remote: +' 
-                        r'(?P<ted_link_remote_address>\S+)$')
+        p3 = regex_engine.compile(r'^To: +(?P<ted_link_to>\S+), +Local: +'
+                                  r'(?P<ted_link_local_address>\S+), +Remote: +' 
+                                  r'(?P<ted_link_remote_address>\S+)$')
   
         # Local interface index: 333, Remote interface index: 0
-        p4 = re.compile(r'^Local +interface +index: +' 
-                  r'(?P<ted_link_local_ifindex>\d+), +Remote +interface +index: +' 
-                  r'(?P<ted_link_remote_ifindex>\d+)$')
+        p4 = regex_engine.compile(r'^Local +interface +index: +' 
+                            r'(?P<ted_link_local_ifindex>\d+), +Remote +interface +index: +' 
+                            r'(?P<ted_link_remote_ifindex>\d+)$')
         
         for line in out.splitlines():
             line = line.strip()
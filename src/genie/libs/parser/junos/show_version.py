@@ -6,13 +6,15 @@ JunOs parsers for the following show commands:
     * show version invoke-on all-routing-engines
 """
 
-import re
 
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowVersionDetailSchema(MetaParser):
 
@@ -95,32 +97,32 @@ class ShowVersionDetail(ShowVersionDetailSchema):
         ret_dict = {}
 
         #Hostname: sr_hktGDS201
-        p1 = re.compile(r'^Hostname: +(?P<host_name>\S+)$')
+        p1 = regex_engine.compile(r'^Hostname: +(?P<host_name>\S+)$')
 
         #Model: vmx
-        p2 = re.compile(r'^Model: +(?P<product_model>\S+)$')
+        p2 = regex_engine.compile(r'^Model: +(?P<product_model>\S+)$')
 
         #Junos: 19.2R1.8
-        p3 = re.compile(r'^Junos: +(?P<junos_version>\S+)$')
+        p3 = regex_engine.compile(r'^Junos: +(?P<junos_version>\S+)$')
 
         #JLAUNCHD release 19.2R1.8 built by builder on 2019-06-21 17:47:00 UTC
-        p4 = re.compile(r'^(?P<output>\AJLAUNCHD+[\S\s]+)$')
+        p4 = regex_engine.compile(r'^(?P<output>\AJLAUNCHD+[\S\s]+)$')
 
         #smartd 6.4 2015-06-04 r4109 [FreeBSD JNPR-11.0-20190517.f0321c3_buil amd64] Junos Build
-        p5 = re.compile(r'^(?P<output>\Asmartd+[\S\s]+)$')
+        p5 = regex_engine.compile(r'^(?P<output>\Asmartd+[\S\s]+)$')
 
         #Copyright (C) 2002-15, Bruce Allen, Christian Franke, www.smartmontools.org
-        p6 = re.compile(r'^(?P<output>\ACopyright+[\S\s]+)$')
+        p6 = regex_engine.compile(r'^(?P<output>\ACopyright+[\S\s]+)$')
 
         #JUNOS OS Kernel 64-bit  [20190517.f0321c3_builder_stable_11]
-        p7 = re.compile(r'^(?P<comment>JUNOS[\S\s]+)$')
+        p7 = regex_engine.compile(r'^(?P<comment>JUNOS[\S\s]+)$')
 
         #KERNEL JNPR-11.0-20190517.f0321c3_builder_stable_11 #0 r356482+f0321c3e9c9(HEAD) built
-        p8 = re.compile(r'^(?P<comment>KERNEL[\S\s]+)$')
+        p8 = regex_engine.compile(r'^(?P<comment>KERNEL[\S\s]+)$')
 
         #MGD release 20190606.224121_builder.r1033375 built by builder on 2019-06-06 22:58:49 UTC
         #COMMIT-SYNCD release 20190606.224121_builder.r1033375 built by builder on 2019-06-06 22:58:46 UTC
-        p9 = re.compile(r'^(?P<component>[\w\s\-]+)release +(?P<release>\S+) +built +by +(?P<builder>\S+) +on +(?P<build_date>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^(?P<component>[\w\s\-]+)release +(?P<release>\S+) +built +by +(?P<builder>\S+) +on +(?P<build_date>[\S\s]+)$')
 
         package_map = {"JUNOS OS Kernel 64-bit  [20190517.f0321c3_builder_stable_11]":"os-kernel",
                             "JUNOS OS libs [20190517.f0321c3_builder_stable_11]":"os-libs",
@@ -358,35 +360,35 @@ class ShowVersionInvokeOnAllRoutingEngines(ShowVersionInvokeOnAllRoutingEnginesS
         ret_dict = {}
 
         #re0:
-        p0 = re.compile(r'^(?P<re_name>\Are0+)+:$')
+        p0 = regex_engine.compile(r'^(?P<re_name>\Are0+)+:$')
 
         #Hostname: sr_hktGDS201
-        p1 = re.compile(r'^Hostname: +(?P<host_name>\S+)$')
+        p1 = regex_engine.compile(r'^Hostname: +(?P<host_name>\S+)$')
 
         #Model: vmx
-        p2 = re.compile(r'^Model: +(?P<product_model>\S+)$')
+        p2 = regex_engine.compile(r'^Model: +(?P<product_model>\S+)$')
 
         #Junos: 19.2R1.8
-        p3 = re.compile(r'^Junos: +(?P<junos_version>\S+)$')
+        p3 = regex_engine.compile(r'^Junos: +(?P<junos_version>\S+)$')
 
         #JLAUNCHD release 19.2R1.8 built by builder on 2019-06-21 17:47:00 UTC
-        p4 = re.compile(r'^(?P<output>\AJLAUNCHD+[\S\s]+)$')
+        p4 = regex_engine.compile(r'^(?P<output>\AJLAUNCHD+[\S\s]+)$')
 
         #smartd 6.4 2015-06-04 r4109 [FreeBSD JNPR-11.0-20190517.f0321c3_buil amd64] Junos Build
-        p5 = re.compile(r'^(?P<output>\Asmartd+[\S\s]+)$')
+        p5 = regex_engine.compile(r'^(?P<output>\Asmartd+[\S\s]+)$')
 
         #Copyright (C) 2002-15, Bruce Allen, Christian Franke, www.smartmontools.org
-        p6 = re.compile(r'^(?P<output>\ACopyright+[\S\s]+)$')
+        p6 = regex_engine.compile(r'^(?P<output>\ACopyright+[\S\s]+)$')
 
         #JUNOS OS Kernel 64-bit  [20190517.f0321c3_builder_stable_11]
-        p7 = re.compile(r'^(?P<comment>JUNOS[\S\s]+)$')
+        p7 = regex_engine.compile(r'^(?P<comment>JUNOS[\S\s]+)$')
 
         #KERNEL JNPR-11.0-20190517.f0321c3_builder_stable_11 #0 r356482+f0321c3e9c9(HEAD) built
-        p8 = re.compile(r'^(?P<comment>KERNEL[\S\s]+)$')
+        p8 = regex_engine.compile(r'^(?P<comment>KERNEL[\S\s]+)$')
 
         #MGD release 20190606.224121_builder.r1033375 built by builder on 2019-06-06 22:58:49 UTC
         #COMMIT-SYNCD release 20190606.224121_builder.r1033375 built by builder on 2019-06-06 22:58:46 UTC
-        p9 = re.compile(r'^(?P<component>[\w\s\-]+)release +(?P<release>\S+) +built +by +(?P<builder>\S+) +on +(?P<build_date>[\S\s]+)$')
+        p9 = regex_engine.compile(r'^(?P<component>[\w\s\-]+)release +(?P<release>\S+) +built +by +(?P<builder>\S+) +on +(?P<build_date>[\S\s]+)$')
 
         package_map = {"JUNOS OS Kernel 64-bit  [20190517.f0321c3_builder_stable_11]":"os-kernel",
                             "JUNOS OS libs [20190517.f0321c3_builder_stable_11]":"os-libs",
@@ -0,0 +1,250 @@
+expected_output = {
+    "bgp-information": {
+        "bgp-peer": [
+            {
+                "bgp-option-information": {
+                    "bgp-options": "Preference PeerAS Refresh",
+                    "export-policy": "export2bgp",
+                    "holdtime": "90",
+                    "preference": "170",
+                },
+                "active-holdtime": "90",
+                "local-id": "10.4.1.1",
+                "peer-id": "10.16.2.2",
+                "flap-count": "0",
+                "last-error": "None",
+                "last-event": "RecvKeepAlive",
+                "last-state": "OpenConfirm",
+                "local-as": "1",
+                "peer-address": "10.145.0.3+64180",
+                "peer-as": "30000",
+                "peer-state": "Established",
+                "peer-type": "External",
+                "peer-flags": "ImportEval Sync",
+                "local-address": "10.145.0.1+179",
+                "peer-addpath-not-supported": True,
+                "bgp-rib": [
+                    {
+                        "accepted-prefix-count": "1",
+                        "active-prefix-count": "1",
+                        "advertised-prefix-count": "2",
+                        "bgp-rib-state": "BGP restart is complete",
+                        "name": "inet.0",
+                        "received-prefix-count": "1",
+                        "rib-bit": "10000",
+                        "send-state": "in sync",
+                        "suppressed-prefix-count": "0",
+                    },
+                ],
+                "bgp-bfd": {
+                    "bfd-configuration-state": "disabled",
+                    "bfd-operational-state": "down",
+                },
+                "peer-no-restart": True,
+                "last-checked": "52",
+                "input-refreshes": "0",
+                "input-messages": "9",
+                "peer-stale-route-time-configured": "300",
+                "nlri-type-session": "inet-unicast",
+                "nlri-type-peer": "inet-unicast",
+                "output-octets": "315",
+                "input-updates": "2",
+                "peer-end-of-rib-received": "inet-unicast",
+                "peer-end-of-rib-sent": "inet-unicast",
+                "output-updates": "2",
+                "last-received": "6",
+                "input-octets": "244",
+                "peer-4byte-as-capability-advertised": "30000",
+                "peer-restart-nlri-configured": "inet-unicast",
+                "peer-restart-nlri-negotiated": "inet-unicast",
+                "output-messages": "10",
+                "output-refreshes": "0",
+                "last-sent": "1",
+                "peer-refresh-capability": "2",
+            },
+            {
+                "bgp-option-information": {
+                    "bgp-options": "Preference PeerAS Refresh",
+                    "export-policy": "export2bgp",
+                    "holdtime": "90",
+                    "preference": "170",
+                },
+                "active-holdtime": "90",
+                "local-id": "10.4.1.1",
+                "peer-id": "10.36.3.3",
+                "flap-count": "0",
+                "last-error": "None",
+                "last-event": "RecvKeepAlive",
+                "last-state": "OpenConfirm",
+                "local-as": "1",
+                "peer-address": "10.135.0.2+55323",
+                "peer-as": "2",
+                "peer-state": "Established",
+                "peer-type": "External",
+                "peer-flags": "ImportEval Sync",
+                "local-address": "10.135.0.1+179",
+                "peer-addpath-not-supported": True,
+                "bgp-rib": [
+                    {
+                        "accepted-prefix-count": "1",
+                        "active-prefix-count": "1",
+                        "advertised-prefix-count": "2",
+                        "bgp-rib-state": "BGP restart is complete",
+                        "name": "inet.0",
+                        "received-prefix-count": "1",
+                        "rib-bit": "10001",
+                        "send-state": "in sync",
+                        "suppressed-prefix-count": "0",
+                    },
+                ],
+                "bgp-bfd": {
+                    "bfd-configuration-state": "disabled",
+                    "bfd-operational-state": "down",
+                },
+                "peer-no-restart": True,
+                "last-checked": "35",
+                "input-refreshes": "0",
+                "input-messages": "8",
+                "peer-stale-route-time-configured": "300",
+                "nlri-type-session": "inet-unicast",
+                "nlri-type-peer": "inet-unicast",
+                "output-octets": "296",
+                "input-updates": "2",
+                "peer-end-of-rib-received": "inet-unicast",
+                "peer-end-of-rib-sent": "inet-unicast",
+                "output-updates": "2",
+                "last-received": "18",
+                "input-octets": "225",
+                "peer-4byte-as-capability-advertised": "2",
+                "peer-restart-nlri-configured": "inet-unicast",
+                "peer-restart-nlri-negotiated": "inet-unicast",
+                "output-messages": "9",
+                "output-refreshes": "0",
+                "last-sent": "12",
+                "peer-refresh-capability": "2",
+            },
+            {
+                "bgp-option-information": {
+                    "bgp-options": "Preference PeerAS Refresh",
+                    "export-policy": "export2bgp",
+                    "holdtime": "90",
+                    "preference": "170",
+                },
+                "active-holdtime": "90",
+                "local-id": "10.4.1.1",
+                "peer-id": "10.16.2.2",
+                "flap-count": "0",
+                "last-error": "None",
+                "last-event": "RecvKeepAlive",
+                "last-state": "OpenConfirm",
+                "local-as": "1",
+                "peer-address": "2001:20::3+179",
+                "peer-as": "30000",
+                "peer-state": "Established",
+                "peer-type": "External",
+                "peer-flags": "ImportEval Sync",
+                "local-address": "2001:20::1+62643",
+                "peer-addpath-not-supported": True,
+                "bgp-rib": [
+                    {
+                        "accepted-prefix-count": "1",
+                        "active-prefix-count": "1",
+                        "advertised-prefix-count": "2",
+                        "bgp-rib-state": "BGP restart is complete",
+                        "name": "inet6.0",
+                        "received-prefix-count": "1",
+                        "rib-bit": "20000",
+                        "send-state": "in sync",
+                        "suppressed-prefix-count": "0",
+                    },
+                ],
+                "bgp-bfd": {
+                    "bfd-configuration-state": "disabled",
+                    "bfd-operational-state": "down",
+                },
+                "peer-no-restart": True,
+                "last-checked": "29",
+                "input-refreshes": "0",
+                "input-messages": "7",
+                "peer-stale-route-time-configured": "300",
+                "nlri-type-session": "inet6-unicast",
+                "nlri-type-peer": "inet6-unicast",
+                "output-octets": "395",
+                "input-updates": "2",
+                "peer-end-of-rib-received": "inet6-unicast",
+                "peer-end-of-rib-sent": "inet6-unicast",
+                "output-updates": "2",
+                "last-received": "15",
+                "input-octets": "219",
+                "peer-4byte-as-capability-advertised": "30000",
+                "peer-restart-nlri-configured": "inet6-unicast",
+                "peer-restart-nlri-negotiated": "inet6-unicast",
+                "output-messages": "9",
+                "output-refreshes": "0",
+                "last-sent": "10",
+                "peer-refresh-capability": "2",
+            },
+            {
+                "bgp-option-information": {
+                    "bgp-options": "Preference PeerAS Refresh",
+                    "export-policy": "export2bgp",
+                    "holdtime": "90",
+                    "preference": "170",
+                },
+                "active-holdtime": "90",
+                "local-id": "10.4.1.1",
+                "peer-id": "10.36.3.3",
+                "flap-count": "0",
+                "last-error": "None",
+                "last-event": "RecvKeepAlive",
+                "last-state": "OpenConfirm",
+                "local-as": "1",
+                "peer-address": "2001:30::2+179",
+                "peer-as": "2",
+                "peer-state": "Established",
+                "peer-type": "External",
+                "peer-flags": "ImportEval Sync",
+                "local-address": "2001:30::1+61370",
+                "peer-addpath-not-supported": True,
+                "bgp-rib": [
+                    {
+                        "accepted-prefix-count": "1",
+                        "active-prefix-count": "1",
+                        "advertised-prefix-count": "2",
+                        "bgp-rib-state": "BGP restart is complete",
+                        "name": "inet6.0",
+                        "received-prefix-count": "1",
+                        "rib-bit": "20001",
+                        "send-state": "in sync",
+                        "suppressed-prefix-count": "0",
+                    },
+                ],
+                "bgp-bfd": {
+                    "bfd-configuration-state": "disabled",
+                    "bfd-operational-state": "down",
+                },
+                "peer-no-restart": True,
+                "last-checked": "21",
+                "input-refreshes": "0",
+                "input-messages": "7",
+                "peer-stale-route-time-configured": "300",
+                "nlri-type-session": "inet6-unicast",
+                "nlri-type-peer": "inet6-unicast",
+                "output-octets": "395",
+                "input-updates": "2",
+                "peer-end-of-rib-received": "inet6-unicast",
+                "peer-end-of-rib-sent": "inet6-unicast",
+                "output-updates": "2",
+                "last-received": "2",
+                "input-octets": "219",
+                "peer-4byte-as-capability-advertised": "2",
+                "peer-restart-nlri-configured": "inet6-unicast",
+                "peer-restart-nlri-negotiated": "inet6-unicast",
+                "output-messages": "9",
+                "output-refreshes": "0",
+                "last-sent": "1",
+                "peer-refresh-capability": "2",
+            },
+        ],
+    },
+}
@@ -0,0 +1,329 @@
+expected_output = {
+    "bgp-information": {
+        "bgp-peer": [
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "10.49.216.179",
+                "peer-as": "65171",
+                "peer-state": "Connect",
+                "route-queue-count": "0",
+            },
+            {
+                "bgp-rib": [
+                    {
+                        "accepted-prefix-count": "684",
+                        "active-prefix-count": "682",
+                        "name": "inet.0",
+                        "received-prefix-count": "684",
+                        "suppressed-prefix-count": "0",
+                    },
+                    {
+                        "accepted-prefix-count": "2",
+                        "active-prefix-count": "2",
+                        "name": "inet.3",
+                        "received-prefix-count": "2",
+                        "suppressed-prefix-count": "0",
+                    },
+                ],
+                "elapsed-time": {
+                    "#text": "3w2d 4:19:15",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "127",
+                "input-messages": "280414",
+                "output-messages": "221573",
+                "peer-address": "10.169.14.240",
+                "peer-as": "65151",
+                "peer-state": "Establ",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "10.169.14.249",
+                "peer-as": "65151",
+                "peer-state": "Active",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "10.189.5.240",
+                "peer-as": "65171",
+                "peer-state": "Connect",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "10.189.5.241",
+                "peer-as": "65171",
+                "peer-state": "Connect",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "10.189.5.242",
+                "peer-as": "65171",
+                "peer-state": "Active",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "10.189.5.243",
+                "peer-as": "65171",
+                "peer-state": "Active",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "10.189.5.245",
+                "peer-as": "65171",
+                "peer-state": "Active",
+                "route-queue-count": "0",
+            },
+            {
+                "bgp-rib": [
+                    {
+                        "accepted-prefix-count": "682",
+                        "active-prefix-count": "0",
+                        "name": "inet.0",
+                        "received-prefix-count": "682",
+                        "suppressed-prefix-count": "0",
+                    },
+                ],
+                "elapsed-time": {
+                    "#text": "3w2d 4:18:45",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "44",
+                "input-messages": "110832",
+                "output-messages": "172140",
+                "peer-address": "10.189.5.253",
+                "peer-as": "65171",
+                "peer-state": "Establ",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "10.189.6.250",
+                "peer-as": "65181",
+                "peer-state": "Active",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "2001:db8:6be:89bb::1:140",
+                "peer-as": "65171",
+                "peer-state": "Connect",
+                "route-queue-count": "0",
+            },
+            {
+                "bgp-rib": [
+                    {
+                        "accepted-prefix-count": "0",
+                        "active-prefix-count": "0",
+                        "name": "inet6.0",
+                        "received-prefix-count": "0",
+                        "suppressed-prefix-count": "0",
+                    },
+                ],
+                "elapsed-time": {
+                    "#text": "3w2d 4:19:10",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "133",
+                "input-messages": "218994",
+                "output-messages": "221571",
+                "peer-address": "2001:db8:eb18:ca45::1",
+                "peer-as": "65151",
+                "peer-state": "Establ",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "2001:db8:eb18:ca45::11",
+                "peer-as": "65151",
+                "peer-state": "Connect",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "2001:db8:223c:ca45::7",
+                "peer-as": "65171",
+                "peer-state": "Active",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "2001:db8:223c:ca45::8",
+                "peer-as": "65171",
+                "peer-state": "Connect",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "2001:db8:223c:ca45::9",
+                "peer-as": "65171",
+                "peer-state": "Connect",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "2001:db8:223c:ca45::a",
+                "peer-as": "65171",
+                "peer-state": "Connect",
+                "route-queue-count": "0",
+            },
+            {
+                "bgp-rib": [
+                    {
+                        "accepted-prefix-count": "0",
+                        "active-prefix-count": "0",
+                        "name": "inet6.0",
+                        "received-prefix-count": "0",
+                        "suppressed-prefix-count": "0",
+                    },
+                ],
+                "elapsed-time": {
+                    "#text": "3w2d 4:27:54",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "55",
+                "input-messages": "110861",
+                "output-messages": "110862",
+                "peer-address": "2001:db8:223c:ca45::c",
+                "peer-as": "65171",
+                "peer-state": "Establ",
+                "route-queue-count": "0",
+            },
+            {
+                "elapsed-time": {
+                    "#text": "29w5d 22:42:36",
+                    "@junos:seconds": "1234",
+                },
+                "flap-count": "0",
+                "input-messages": "0",
+                "output-messages": "0",
+                "peer-address": "2001:db8:5961:ca45::1",
+                "peer-as": "65181",
+                "peer-state": "Connect",
+                "route-queue-count": "0",
+            },
+        ],
+        "bgp-rib": [
+            {
+                "active-prefix-count": "682",
+                "damped-prefix-count": "0",
+                "history-prefix-count": "0",
+                "name": "inet.0",
+                "pending-prefix-count": "0",
+                "suppressed-prefix-count": "0",
+                "total-prefix-count": "1366",
+            },
+            {
+                "active-prefix-count": "2",
+                "damped-prefix-count": "0",
+                "history-prefix-count": "0",
+                "name": "inet.3",
+                "pending-prefix-count": "0",
+                "suppressed-prefix-count": "0",
+                "total-prefix-count": "2",
+            },
+            {
+                "active-prefix-count": "0",
+                "damped-prefix-count": "0",
+                "history-prefix-count": "0",
+                "name": "inet6.0",
+                "pending-prefix-count": "0",
+                "suppressed-prefix-count": "0",
+                "total-prefix-count": "0",
+            },
+        ],
+        "bgp-thread-mode": "BGP I/O",
+        "down-peer-count": "15",
+        "group-count": "14",
+        "peer-count": "19",
+    },
+}
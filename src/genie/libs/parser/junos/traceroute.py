@@ -4,15 +4,15 @@ JunOS parsers for the following command:
     * traceroute {ipaddress} no-resolve
     * traceroute {ipaddress} source {ipaddress2} no-resolve
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, ListOf)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class TracerouteNoResolveSchema(MetaParser):
     """ Schema for:
@@ -80,13 +80,13 @@ class TracerouteNoResolve(TracerouteNoResolveSchema):
 
         # traceroute to 10.135.0.2 (10.135.0.2) 30 hops max 52 byte packets
         # traceroute6 to 2001::2 (2001::2) from 2001::1, 64 hops max, 12 byte packets
-        p1 = re.compile(r'^traceroute(6)? +to +(?P<domain>\S+) +\((?P<address>\S+)\)'
-                        r'( +from +(?P<source>\S+))?, +(?P<max_hops>\S+) +hops +max, '
-                        r'+(?P<packet_size>\S+) +byte +packets$')
+        p1 = regex_engine.compile(r'^traceroute(6)? +to +(?P<domain>\S+) +\((?P<address>\S+)\)'
+                                  r'( +from +(?P<source>\S+))?, +(?P<max_hops>\S+) +hops +max, '
+                                  r'+(?P<packet_size>\S+) +byte +packets$')
 
         #  1  10.135.0.2  1.792 ms  1.142 ms  0.831 ms
-        p2 = re.compile(r'^(?P<hop_number>\S+) +( +(?P<router_name>\S+))? +'
-                        r'(?P<address>\S+) +(?P<round_trip_time>\S+ +ms +\S+ +ms +\S+ +ms)$')
+        p2 = regex_engine.compile(r'^(?P<hop_number>\S+) +( +(?P<router_name>\S+))? +'
+                                  r'(?P<address>\S+) +(?P<round_trip_time>\S+ +ms +\S+ +ms +\S+ +ms)$')
 
         for line in out.splitlines():
             line = line.strip()
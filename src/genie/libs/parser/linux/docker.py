@@ -4,13 +4,13 @@ Linux parsers for the following commands:
     * 'docker stats --no-stream'
 """
 
-# python
-import re
-
 # metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ========================================================
 # Schema for "docker stats --no-stream"
 # ========================================================
@@ -53,7 +53,7 @@ class DockerStatsNoStream(DockerStatsNoStreamSchema):
         if output is None:
             output = self.device.execute(self.cli_command)
         # a3f78cb32a8e        foo-bar               0.06%               55.69MiB / 1.025GiB   5.31%               31.1kB / 0B         0B / 0B             1
-        p = re.compile(
+        p = regex_engine.compile(
             r"^(?P<container_id>\S+)\s+(?P<container_name>\S+)\s+(?P<cpu_usage>\S+)\s+(?P<mem_usage>\S+)\s+\/\s+(?P<mem_limit>\S+)\s+(?P<percent_mem_usage>\S+)\s+(?P<net_input>\S+)\s+\/\s+(?P<net_output>\S+)\s+(?P<block_input>\S+)\s+\/\s+(?P<block_output>\S+)\s+(?P<pids>\d+)$"
         )
 
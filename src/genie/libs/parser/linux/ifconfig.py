@@ -5,13 +5,13 @@ Linux parsers for the following commands:
     * ifconfig <interface>
 """
 
-# python
-import re
-
 # metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =======================================================
 # Schema for 'ifconfig [<interface>]'
 # =======================================================
@@ -84,80 +84,80 @@ class Ifconfig(IfconfigSchema):
         result_dict = {}
 
         # enp0s31f6: flags=4163<UP,BROADCAST,RUNNING,MULTICAST>  mtu 1500
-        p1 = re.compile(r'^(?P<interface>\S+): +flags=(?P<flags>\S+) +mtu +(?P<mtu>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+): +flags=(?P<flags>\S+) +mtu +(?P<mtu>\d+)$')
 
         #  inet 192.168.100.51  netmask 255.255.255.0  broadcast 192.168.100.255
-        p2 = re.compile(r'^inet +(?P<ip>\S+) +netmask +(?P<netmask>\S+) '
-                         r'+broadcast +(?P<broadcast>\S+)$')
+        p2 = regex_engine.compile(r'^inet +(?P<ip>\S+) +netmask +(?P<netmask>\S+) '
+                                   r'+broadcast +(?P<broadcast>\S+)$')
 
         #  inet6 fe80::39:1a5c:726d:b23e  prefixlen 64  scopeid 0x20<link>
-        p3 = re.compile(r'^inet6 +(?P<ip>\S+) +prefixlen +(?P<prefixlen>\d+) '
-                         r'+scopeid +(?P<scopeid>\S+)$')
+        p3 = regex_engine.compile(r'^inet6 +(?P<ip>\S+) +prefixlen +(?P<prefixlen>\d+) '
+                                   r'+scopeid +(?P<scopeid>\S+)$')
 
         #  ether 48:2a:e3:ff:58:55  txqueuelen 1000  (Ethernet)
         #  ether 00:50:b6:ff:4b:83  (Ethernet)
         #  loop  txqueuelen 1000  (Local Loopback)
         #  loop  (Local Loopback)
-        p4 = re.compile(r'^(?P<type>\S+)( +(?P<mac>\S+))?( +txqueuelen +(?P<txqueuelen>\d+))? '
-                         r'+\((?P<description>.*)\)$')
+        p4 = regex_engine.compile(r'^(?P<type>\S+)( +(?P<mac>\S+))?( +txqueuelen +(?P<txqueuelen>\d+))? '
+                                   r'+\((?P<description>.*)\)$')
 
         #  RX packets 66766  bytes 4274334 (4.0 MiB)
-        p5 = re.compile(r'^RX +packets +(?P<rx_pkts>\d+) +bytes +(?P<rx_bytes>\d+) '
-                         r'+\((?P<rx_value>.*)\)$')
+        p5 = regex_engine.compile(r'^RX +packets +(?P<rx_pkts>\d+) +bytes +(?P<rx_bytes>\d+) '
+                                   r'+\((?P<rx_value>.*)\)$')
 
         #  RX errors 0  dropped 0  overruns 0  frame 0
-        p6 = re.compile(r'^RX +errors +(?P<rx_errors>\d+) +dropped +(?P<rx_dropped>\d+) '
-                         r'+overruns +(?P<rx_overruns>\d+) +frame +(?P<rx_frame>\d+)$')
+        p6 = regex_engine.compile(r'^RX +errors +(?P<rx_errors>\d+) +dropped +(?P<rx_dropped>\d+) '
+                                   r'+overruns +(?P<rx_overruns>\d+) +frame +(?P<rx_frame>\d+)$')
 
         #  TX packets 365916  bytes 67689136 (64.5 MiB)
-        p7 = re.compile(r'^TX +packets +(?P<tx_pkts>\d+) +bytes +(?P<tx_bytes>\d+) '
-                         r'+\((?P<tx_value>.*)\)$')
+        p7 = regex_engine.compile(r'^TX +packets +(?P<tx_pkts>\d+) +bytes +(?P<tx_bytes>\d+) '
+                                   r'+\((?P<tx_value>.*)\)$')
 
         #  TX errors 0  dropped 0 overruns 0  carrier 0  collisions 0
-        p8 = re.compile(r'^TX +errors +(?P<tx_errors>\d+) +dropped +(?P<tx_dropped>\d+) '
-                         r'+overruns +(?P<tx_overruns>\d+) +carrier +(?P<tx_carrier>\d+) '
-                         r'+collisions +(?P<tx_collisions>\d+)$')
+        p8 = regex_engine.compile(r'^TX +errors +(?P<tx_errors>\d+) +dropped +(?P<tx_dropped>\d+) '
+                                   r'+overruns +(?P<tx_overruns>\d+) +carrier +(?P<tx_carrier>\d+) '
+                                   r'+collisions +(?P<tx_collisions>\d+)$')
 
         #  device interrupt 16  memory 0xe9200000-e9220000
         #  device memory 0xdea00000-deafffff
-        p9 = re.compile(r'^device( +interrupt +(?P<device_interrupt>\d+))? '
-                         r'+memory +(?P<device_memory>\S+)$')
+        p9 = regex_engine.compile(r'^device( +interrupt +(?P<device_interrupt>\d+))? '
+                                   r'+memory +(?P<device_memory>\S+)$')
         
         # eth0      Link encap:Ethernet  HWaddr 00:50:56:FF:01:14
         # lo        Link encap:Local Loopback
-        p10 = re.compile(r'^(?P<interface>\S+)\s+Link\s+encap:(?P<description>' + 
-                         r'\S+(\s+\S+)*?)(\s+HWaddr\s+\S+)?$') 
+        p10 = regex_engine.compile(r'^(?P<interface>\S+)\s+Link\s+encap:(?P<description>' + 
+                                   r'\S+(\s+\S+)*?)(\s+HWaddr\s+\S+)?$') 
 
         # UP BROADCAST RUNNING MULTICAST  MTU:1500  Metric:1
-        p11 = re.compile(r'^(?P<flags>[\S+|\s]+?)\s+MTU:(?P<mtu>\d+)\s+\S+$')
+        p11 = regex_engine.compile(r'^(?P<flags>[\S+|\s]+?)\s+MTU:(?P<mtu>\d+)\s+\S+$')
 
         # Match anything that doesn't have 'bytes'
-        p12 = re.compile(r'^((?!bytes).)*$')
+        p12 = regex_engine.compile(r'^((?!bytes).)*$')
 
         # inet addr:192.168.122.1  Bcast:192.168.122.255  Mask:255.255.255.0
         # inet addr:127.0.0.1  Mask:255.0.0.0
-        p13 = re.compile(r'^inet\s+addr:(?P<ip>(\S+))\s+(Bcast:' +
-                         r'(?P<broadcast>\S+)\s+)?Mask:(?P<netmask>\S+)$')
+        p13 = regex_engine.compile(r'^inet\s+addr:(?P<ip>(\S+))\s+(Bcast:' +
+                                   r'(?P<broadcast>\S+)\s+)?Mask:(?P<netmask>\S+)$')
 
         # RX packets:1892776 errors:0 dropped:0 overruns:0 frame:0
-        p14 = re.compile(r'^RX\spackets:(?P<rx_pkts>\d+)\serrors:(?P<rx_errors>' + 
-                         r'\d+)\sdropped:(?P<rx_dropped>\d+)\soverruns:' +
-                         r'(?P<rx_overruns>\d+)\sframe:(?P<rx_frame>\d+)$')
+        p14 = regex_engine.compile(r'^RX\spackets:(?P<rx_pkts>\d+)\serrors:(?P<rx_errors>' + 
+                                   r'\d+)\sdropped:(?P<rx_dropped>\d+)\soverruns:' +
+                                   r'(?P<rx_overruns>\d+)\sframe:(?P<rx_frame>\d+)$')
 
         # TX packets:1892776 errors:0 dropped:0 overruns:0 carrier:0
-        p15 = re.compile(r'^TX\spackets:(?P<tx_pkts>\d+)\serrors:(' + 
-                         r'?P<tx_errors>\d+)\sdropped:(?P<tx_dropped>\d+)' + 
-                         r'\soverruns:(?P<tx_overruns>\d+)\scarrier:' + 
-                         r'(?P<tx_carrier>\d+)$')
+        p15 = regex_engine.compile(r'^TX\spackets:(?P<tx_pkts>\d+)\serrors:(' + 
+                                   r'?P<tx_errors>\d+)\sdropped:(?P<tx_dropped>\d+)' + 
+                                   r'\soverruns:(?P<tx_overruns>\d+)\scarrier:' + 
+                                   r'(?P<tx_carrier>\d+)$')
 
         # collisions:0 txqueuelen:0
-        p16 = re.compile(r'^collisions:(?P<tx_collisions>\d+)\s' +
-                         r'txqueuelen:(?P<txqueuelen>\d+)$')
+        p16 = regex_engine.compile(r'^collisions:(?P<tx_collisions>\d+)\s' +
+                                   r'txqueuelen:(?P<txqueuelen>\d+)$')
 
         # RX bytes:0 (0.0 b)  TX bytes:0 (0.0 b)
-        p17 = re.compile(r'^RX\sbytes:(?P<rx_bytes>\d+)\s\((?P<rx_value>.*?)' +
-                         r'\)\s+TX\sbytes:(?P<tx_bytes>\d+)\s\((' + 
-                         r'?P<tx_value>.*?)\)$')
+        p17 = regex_engine.compile(r'^RX\sbytes:(?P<rx_bytes>\d+)\s\((?P<rx_value>.*?)' +
+                                   r'\)\s+TX\sbytes:(?P<tx_bytes>\d+)\s\((' + 
+                                   r'?P<tx_value>.*?)\)$')
 
         for line in out.splitlines():
             line = line.replace('\t', '    ')
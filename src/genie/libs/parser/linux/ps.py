@@ -5,14 +5,12 @@ Linux parsers for the following commands:
     * ps -ef | grep {grep}
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ===================
@@ -60,7 +58,7 @@ class Ps(PsSchema):
         # root      2328     1  0  2019 tty4     00:00:00 /sbin/mingetty /dev/tty4                                       
         # root      2334     1  0  2019 tty5     00:00:00 /sbin/mingetty /dev/tty5                  
         # root      2341     1  0  2019 tty6     00:00:00 /sbin/mingetty /dev/tty6
-        p1 = re.compile(r'^(?P<uid>\S+)\s+(?P<pid>\d+)\s+(?P<ppid>\d+)'
+        p1 = regex_engine.compile(r'^(?P<uid>\S+)\s+(?P<pid>\d+)\s+(?P<ppid>\d+)'
             + r'\s+(?P<c>\S+)\s+(?P<stime>\S+)\s+(?P<tty>\S+)'
             + r'\s+(?P<time>\S+)\s+(?P<cmd>.+)$')
  
@@ -5,13 +5,13 @@ Linux parsers for the following commands:
     * vim-cmd vmsvc/snapshot.get {vmid}
 """
 
-# python
-import re
-
 # metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =======================================================
 # Schema for 'vim-cmd vmsvc/getallvms'
 # =======================================================
@@ -58,14 +58,14 @@ class VimCmdVmsvcGetAllVms(VimCmdVmsvcGetAllVmsSchema):
         #      51     n9kv1_1       [VM_storage] n9kv1_1/n9kv1_1.vmx           otherGuest64           vmx-10              
         #      52     n9kv2_1       [VM_storage] n9kv2_1/n9kv2_1.vmx           otherGuest64           vmx-10              
         #       9     PE1-2         [VM_storage] PE1/PE1.vmx                   other24xLinuxGuest     vmx-08
-        p1 = re.compile(r'^(?P<vmid>\S+)\s+(?P<name>\S+)\s+' + 
-                        r'(?P<file>\S+\s+\S+)\s+(?P<guest_os>\S+)\s+' + 
-                        r'(?P<version>\S+)')
+        p1 = regex_engine.compile(r'^(?P<vmid>\S+)\s+(?P<name>\S+)\s+' + 
+                                  r'(?P<file>\S+\s+\S+)\s+(?P<guest_os>\S+)\s+' + 
+                                  r'(?P<version>\S+)')
         
         #       9     PE1-2         [VM_storage] PE1/PE1.vmx                   other24xLinuxGuest     vmx-08    - machine 2
-        p2 = re.compile(r'^(?P<vmid>\S+)\s+(?P<name>\S+)\s+' + 
-                        r'(?P<file>\S+\s+\S+)\s+(?P<guest_os>\S+)\s+' + 
-                        r'(?P<version>\S+)\s+(?P<annotation>[\s\S]+)$')
+        p2 = regex_engine.compile(r'^(?P<vmid>\S+)\s+(?P<name>\S+)\s+' + 
+                                  r'(?P<file>\S+\s+\S+)\s+(?P<guest_os>\S+)\s+' + 
+                                  r'(?P<version>\S+)\s+(?P<annotation>[\s\S]+)$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -133,23 +133,23 @@ class VimCmdVmsvcSnapshotGetVmId(VimCmdVmsvcSnapshotGetVmIdSchema):
         
         # --Snapshot Id        : 8
         # ----Snapshot Id        : 13
-        p1 = re.compile(r'^.*Snapshot\s+Id\s+:\s+(?P<id>\S+)$')
+        p1 = regex_engine.compile(r'^.*Snapshot\s+Id\s+:\s+(?P<id>\S+)$')
         
         # --Snapshot Name        : PE1RebootGoldenSnapshot
         # ----Snapshot Name        : PE1-2NEWGOLDENSNAPSHOT
-        p2 = re.compile(r'^.*Snapshot\s+Name\s+:\s+(?P<name>\S+)$')
+        p2 = regex_engine.compile(r'^.*Snapshot\s+Name\s+:\s+(?P<name>\S+)$')
         
         # --Snapshot Desciption  :
         # ----Snapshot Desciption  :
-        p3 = re.compile(r'^.*Snapshot\s+Desciption\s+:\s+(?P<description>\S+)$')
+        p3 = regex_engine.compile(r'^.*Snapshot\s+Desciption\s+:\s+(?P<description>\S+)$')
         
         # --Snapshot Created On  : 12/1/2014 14:39:4
         # ----Snapshot Created On  : 10/2/2015 9:13:45
-        p4 = re.compile(r'^.*Snapshot\s+Created\s+On\s+:\s+(?P<created>\S+\s+\S+)$')
+        p4 = regex_engine.compile(r'^.*Snapshot\s+Created\s+On\s+:\s+(?P<created>\S+\s+\S+)$')
         
         # --Snapshot State       : powered off
         # ----Snapshot State       : powered off
-        p5 = re.compile(r'^.*Snapshot\s+State\s+:\s+(?P<state>\S+\s+\S+)$')
+        p5 = regex_engine.compile(r'^.*Snapshot\s+State\s+:\s+(?P<state>\S+\s+\S+)$')
         
         snapshot_name = ''
         for line in out.splitlines():
@@ -1,7 +1,6 @@
 """aci implementation of show_platform.py
 
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -12,6 +11,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowPlatformInternalHalPolicyRedirdstSchema(MetaParser):
     """Schema for 'vsh_lc -c "show platform internal hal policy redirdst group_id {group_id} {address_family} src_ip {src_ip} dst_ip {dst_ip} protocol {protocol}'"""
@@ -58,31 +60,31 @@ class ShowPlatformInternalHalPolicyRedirdst(ShowPlatformInternalHalPolicyRedirds
 
         # initial regexp pattern
         # Group Id                                                 : 0x224 
-        p1 = re.compile(r'^Group +Id +: +(?P<group_id>\S+)$')
+        p1 = regex_engine.compile(r'^Group +Id +: +(?P<group_id>\S+)$')
 
         # Src IP                                                    : 10.1.1.1/32 
-        p2 = re.compile(r'^Src +IP +: +(?P<src_ip>\S+)$')
+        p2 = regex_engine.compile(r'^Src +IP +: +(?P<src_ip>\S+)$')
 
         # Dst +IP +: +(?P<dst_ip>\S+)
-        p3 = re.compile(r'^Dst +IP +: +(?P<dst_ip>\S+)$')
+        p3 = regex_engine.compile(r'^Dst +IP +: +(?P<dst_ip>\S+)$')
 
         # Protocol                                                  : 0x1
-        p4 = re.compile(r'^Protocol +: +(?P<protocol>\S+)$')
+        p4 = regex_engine.compile(r'^Protocol +: +(?P<protocol>\S+)$')
 
         # Rewrite MAC                                               : 00:00:00:ff:02:03 
-        p5 = re.compile(r'^Rewrite +MAC +: +(?P<rewrite_mac>\S+)$')
+        p5 = regex_engine.compile(r'^Rewrite +MAC +: +(?P<rewrite_mac>\S+)$')
 
         # Rewrite VNID                                              : 0xf08007
-        p6 = re.compile(r'^Rewrite +VNID +: +(?P<rewrite_vnid>\S+)$')
+        p6 = regex_engine.compile(r'^Rewrite +VNID +: +(?P<rewrite_vnid>\S+)$')
 
         # Outgoing L2 IfIndex                                       : 0x1801001e
-        p7 = re.compile(r'^Outgoing +L2 +IfIndex +: +(?P<outgoing_l2_ifindex>\S+)$')
+        p7 = regex_engine.compile(r'^Outgoing +L2 +IfIndex +: +(?P<outgoing_l2_ifindex>\S+)$')
 
         # Outgoing IfName                                           : Tunnel30
-        p8 = re.compile(r'^Outgoing +IfName +: +(?P<outgoing_ifname>\S+)$')
+        p8 = regex_engine.compile(r'^Outgoing +IfName +: +(?P<outgoing_ifname>\S+)$')
 
         # Packet's Hash                                             : 0x29d2 
-        p9 = re.compile(r'^Packet\'s +Hash +: +(?P<packets_hash>\S+)$')
+        p9 = regex_engine.compile(r'^Packet\'s +Hash +: +(?P<packets_hash>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
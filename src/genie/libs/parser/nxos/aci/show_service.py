@@ -1,7 +1,6 @@
 """aci implementation of show_service.py
 
 """
-import re
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -12,6 +11,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowServiceRedirInfoGroupSchema(MetaParser):
     """Schema for show service redir info group"""
@@ -54,15 +56,15 @@ class ShowServiceRedirInfoGroup(ShowServiceRedirInfoGroupSchema):
         # 366   destgrp-366     dest-[2001:172:16:32::10]-[vxlan-2424832 Not attached    enabled    no-oper-grp     0    0     srconly    no      
         # 367   destgrp-367     dest-[172.16.32.40]-[vxlan-2424832]      shangl-PBR::LB4 disabled   tracked-as-down 0    0     srconly    yes
         # 394   destgrp-394     No valid destinations                    Not attached    disabled   no-oper-grp     0    0     srconly    no      
-        p1 = re.compile(r'^(?P<group_id>\d+) +(?P<name>\S+) +(?P<destination>'
-                        r'(No +valid +destinations)|(\S+)) +(?P<hg_name>'
-                        r'(Not +attached)|(\S+)) +(?P<oper_st>\S+) +'
-                        r'(?P<oper_st_qual>\S+) +(?P<tl>\d+) +(?P<th>\d+) +'
-                        r'(?P<hp>\S+) +(?P<tracking>\S+)$')
+        p1 = regex_engine.compile(r'^(?P<group_id>\d+) +(?P<name>\S+) +(?P<destination>'
+                                  r'(No +valid +destinations)|(\S+)) +(?P<hg_name>'
+                                  r'(Not +attached)|(\S+)) +(?P<oper_st>\S+) +'
+                                  r'(?P<oper_st_qual>\S+) +(?P<tl>\d+) +(?P<th>\d+) +'
+                                  r'(?P<hp>\S+) +(?P<tracking>\S+)$')
 
         # dest-[172.16.32.20]-[vxlan-2424832]      shangl-PBR::LB2
-        p2 = re.compile(r'^(?P<destination>(No +valid +destinations)|(dest-\S+)) +'
-                        r'(?P<hg_name>(Not +attached)|(\S+))$')
+        p2 = regex_engine.compile(r'^(?P<destination>(No +valid +destinations)|(dest-\S+)) +'
+                                  r'(?P<hg_name>(Not +attached)|(\S+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -12,6 +12,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, SchemaTypeError, Schema)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class PingSchema(MetaParser):
     """ Schema for
             * ping {addr}
@@ -98,26 +101,26 @@ class Ping(PingSchema):
 
         # PING 10.2.2.2 (10.2.2.2): 56 data bytes
         # PING R2_xr (10.2.2.2) from 10.3.3.3: 56 data bytes
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^PING\s+(?P<address>[\S]+)\s+\((?P<ip>\S+)\)(\s+from\s+(?P<source>\S+))?:\s+(?P<data_bytes>\d+)\s+data\s+bytes'
         )
 
         # 64 bytes from 10.2.2.2: icmp_seq=0 ttl=254 time=4.669 ms
-        p2 = re.compile(r'^\d+\s+bytes\s+from')
+        p2 = regex_engine.compile(r'^\d+\s+bytes\s+from')
 
         # Request 0 timed out
-        p2_1 = re.compile(r'^Request\s+\d+\s+timed\s+out')
+        p2_1 = regex_engine.compile(r'^Request\s+\d+\s+timed\s+out')
 
         # ping: sendto 10.1.1.5 64 chars, No route to host
-        p2_2 = re.compile(r'^ping:\ssendto\s')
+        p2_2 = regex_engine.compile(r'^ping:\ssendto\s')
 
         # 10 packets transmitted, 0 packets received, 100.00% packet loss
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<send>\d+)\s+packets\s+transmitted,\s+(?P<received>\d+)\s+packets\s+received,\s+(?P<loss_percent>\S+)%\s+packet\s+loss'
         )
 
         # round-trip min/avg/max = 2.334/3.74/5.13 ms
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^round-trip\smin/avg/max\s=\s+(?P<min_ms>\d+\.\d+)/(?P<avg_ms>\d+\.\d+)/(?P<max_ms>\d+\.\d+)\s+ms'
         )
 
@@ -3,14 +3,14 @@
 NXOS parsers for the following show commands:
     * run bash & top -n 1
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, SchemaTypeError, Schema)
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class RunBashTopSchema(MetaParser):
     """ Schema for
             * run bash & top -n 1
@@ -92,46 +92,46 @@ class RunBashTop(RunBashTopSchema):
 
         # top - 15:39:21 up 3 days, 21:35,  1 user,  load average: 0.69, 1.11, 1.21
         # top - 19:10:21 up 18 min,  2 users,  load average: 6.11, 3.33, 2.27
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^\s*top\s+-\s+(?P<time>\S+)\s+up\s+(?P<up>.*),\s+(?P<user>\d)\s+user(s)?,\s+load\s+average:\s+(?P<one_min>\d+\.\d+),\s+(?P<five_mins>\d+\.\d+),\s+(?P<fifteen_mins>\d+\.\d+)'
         )
 
         # Tasks: 187 total,   2 running, 185 sleeping,   0 stopped,   0 zombie
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^\s*Tasks:\s+(?P<total>\d+)\s+total,\s+(?P<running>\d+)\s+running,\s+(?P<sleeping>\d+)\s+sleeping,\s+(?P<stopped>\d+)\s+stopped,\s+(?P<zombie>\d+)\s+zombie'
         )
 
         # %Cpu(s):  2.9 us, 11.8 sy,  0.0 ni, 76.5 id,  0.0 wa,  5.9 hi,  2.9 si,  0.0 st
         #  Cpu(s):  2.8%us,  3.5%sy,  0.1%ni, 92.6%id,  0.3%wa,  0.6%hi,  0.2%si,  0.0%st
 
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^\s*^\s*(%Cpu|Cpu)\(s\):\s+(?P<us>\d+\.\d+)(\s+|%)us,\s+(?P<sy>\d+\.\d+)(\s+|%)sy,\s+(?P<ni>\d+\.\d+)(\s+|%)ni,\s+(?P<id>\d+\.\d+)(\s+|%)id,\s+(?P<wa>\d+\.\d+)(\s+|%)wa,\s+(?P<hi>\d+\.\d+)(\s+|%)hi,\s+(?P<si>\d+\.\d+)(\s+|%)si,\s+(?P<st>\d+\.\d+)(\s+|%)st'
         )
 
         # MiB Mem :   5735.5 total,   1039.1 free,   2568.2 used,   2128.2 buff/cache
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^\s*MiB\s+Mem\s+:\s+(?P<total>\d+\.\d+)\s+total,\s+(?P<free>\d+\.\d+)\s+free,\s+(?P<used>\d+\.\d+)\s+used,\s+(?P<buff_cache>\d+\.\d+)\s+buff/cache'
         )
 
         # Mem:   8134344k total,  1732452k used,  3825700k free,    86800k buffers
-        p4_1 = re.compile(
+        p4_1 = regex_engine.compile(
             r'\s*Mem:\s+(?P<total>\d+k)\s+total,\s+(?P<free>\d+k)\s+used,\s+(?P<used>\d+k)\s+free,\s+(?P<buff_cache>\d+k)\s+buffers'
         )
 
         # MiB Swap:      0.0 total,      0.0 free,      0.0 used.   1473.4 avail Mem
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^\s*MiB\s+Swap(\s+)*:\s+(?P<total>\d+\.\d+)\s+total,\s+(?P<free>\d+\.\d+)\s+free,\s+(?P<used>\d+\.\d+)\s+used(\.|,)\s+(?P<avail_mem>\d+\.\d+)\s+avail\s+Mem'
         )
 
         # Swap:        0k total,        0k used,        0k free,  2489392k cached
-        p5_1 = re.compile(
+        p5_1 = regex_engine.compile(
             r'^\s*Swap(\s+)*:\s+(?P<total>\d+k)\s+total,\s+(?P<used>\d+k)\s+used,\s+(?P<free>\d+k)\s+free,\s+(?P<avail_mem>\d+k)\s+cached'
         )
 
         #   PID USER      PR  NI    VIRT    RES    SHR S  %CPU  %MEM     TIME+ COMMAND
         #  1530 root      20   0  697668  79708  46992 S   6.7   1.4  80:09.11 svc_ifc_eventmg
         # 28216 root      20   0    396m    52m    33m S    14   0.7   7:13.20 l2fwder  
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^\s*(?P<pid>\d+)\s+(?P<user>\S+)\s+(?P<pr>\d+)\s+(?P<ni>\d+)\s+(?P<virt>(\d+|\d+m))\s+(?P<res>(\d+|\d+m))\s+(?P<shr>(\d+|\d+m))\s+(?P<s>\S+)\s+(?P<cpu_percent>(\d+\.\d+|\d+))\s+(?P<mem_percent>\d+\.\d+)\s+(?P<time>\S+)\s+(?P<command>.*)'
         )
 
@@ -4,13 +4,13 @@ NXOS revision parser for the following show commands:
     * show ip igmp snooping vlan {vlan}
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ==============================================
 #  Schema for show ip igmp snooping
 # ==============================================
@@ -80,79 +80,79 @@ class ShowIpIgmpSnooping(ShowIpIgmpSnoopingSchema):
 
         # Global IGMP Snooping Information:
         #  IGMP Snooping enabled
-        p1 = re.compile(r'^\s*IGMP +Snooping +(?P<enabled>\w+)$')
+        p1 = regex_engine.compile(r'^\s*IGMP +Snooping +(?P<enabled>\w+)$')
 
         #  IGMPv1/v2 Report Suppression enabled
         #  IGMPv1/v2 Report Suppression enabled
-        p2 = re.compile(r'^\s*IGMPv1\/v2 +Report +Suppression +(?P<v1v2_report_suppression_enabled>\w+)$')
+        p2 = regex_engine.compile(r'^\s*IGMPv1\/v2 +Report +Suppression +(?P<v1v2_report_suppression_enabled>\w+)$')
 
         #  IGMPv3 Report Suppression disabled
-        p3 = re.compile(r'^\s*IGMPv3 +Report +Suppression +(?P<v3_report_suppression_enabled>\w+)$')
+        p3 = regex_engine.compile(r'^\s*IGMPv3 +Report +Suppression +(?P<v3_report_suppression_enabled>\w+)$')
 
         #  Link Local Groups Suppression enabled
-        p4 = re.compile(r'^\s*Link +Local +Groups +Suppression +(?P<link_local_group_suppression_enabled>\w+)$')
+        p4 = regex_engine.compile(r'^\s*Link +Local +Groups +Suppression +(?P<link_local_group_suppression_enabled>\w+)$')
 
         #  VPC Multicast optimization disabled
-        p5 = re.compile(r'^\s*VPC +Multicast +optimization +(?P<vpc_multicast_optimization_enabled>\w+)$')
+        p5 = regex_engine.compile(r'^\s*VPC +Multicast +optimization +(?P<vpc_multicast_optimization_enabled>\w+)$')
 
         # IGMP Snooping information for vlan 1
-        p6 = re.compile(r'^\s*IGMP +Snooping +information +for +vlan +(?P<vlan_id>\d+)$')
+        p6 = regex_engine.compile(r'^\s*IGMP +Snooping +information +for +vlan +(?P<vlan_id>\d+)$')
 
         #  IGMP snooping enabled
-        p7 = re.compile(r'^\s*IGMP +snooping +(?P<ip_igmp_snooping>\w+)$')
+        p7 = regex_engine.compile(r'^\s*IGMP +snooping +(?P<ip_igmp_snooping>\w+)$')
 
         #  Lookup mode: IP
-        p8 = re.compile(r'^\s*Lookup +mode: +(?P<lookup_mode>\w+)$')
+        p8 = regex_engine.compile(r'^\s*Lookup +mode: +(?P<lookup_mode>\w+)$')
 
         #  IGMP querier none
         #  IGMP querier present, address: 10.51.1.1, version: 2, i/f Vlan100
-        p9 = re.compile(r'^\s*IGMP +querier +(?P<igmp_querier>\S+)'
+        p9 = regex_engine.compile(r'^\s*IGMP +querier +(?P<igmp_querier>\S+)'
             r'(, +address: +(?P<address>\S+))?'
             r'(, +version: +(?P<version>\d))?'
             r'(, +i\/f +(?P<vlan>\w+))?$')
         
         # Querier interval: 125 secs
-        p9_1 = re.compile(r'^\s*Querier +interval: +(?P<querier_interval>\d+) +secs$')
+        p9_1 = regex_engine.compile(r'^\s*Querier +interval: +(?P<querier_interval>\d+) +secs$')
 
         # Querier last member query interval: 1 secs
-        p9_2 = re.compile(r'^\s*Querier +last +member +query +interval: +(?P<querier_last_member_query_interval>\d+) +secs$')
+        p9_2 = regex_engine.compile(r'^\s*Querier +last +member +query +interval: +(?P<querier_last_member_query_interval>\d+) +secs$')
 
         # Querier robustness: 2
-        p9_3 = re.compile(r'^\s*Querier +robustness: +(?P<querier_robustness>\d+)$')
+        p9_3 = regex_engine.compile(r'^\s*Querier +robustness: +(?P<querier_robustness>\d+)$')
 
         # Switch-querier disabled
         # Switch-querier enabled, address XXX.XXX.XXX.XXX, currently running
         # Switch-querier enabled, address 1.2.3.200, currently not running
         # Switch-querier enabled, address 1.2.3.200, currently running
-        p10 = re.compile(r'^\s*Switch\-querier +(?P<type>\S+)(, +address +(?P<ip_address>(\S+)), +currently +(?P<state>[\s\w]+))?$')
+        p10 = regex_engine.compile(r'^\s*Switch\-querier +(?P<type>\S+)(, +address +(?P<ip_address>(\S+)), +currently +(?P<state>[\s\w]+))?$')
 
         #  IGMP Explicit tracking enabled
-        p11 = re.compile(r'^\s*IGMP +Explicit +tracking +(?P<igmp_explicit_tracking>\w+)$')
+        p11 = regex_engine.compile(r'^\s*IGMP +Explicit +tracking +(?P<igmp_explicit_tracking>\w+)$')
 
         #  IGMPv2 Fast leave disabled
-        p12 = re.compile(r'^\s*IGMPv2 +Fast +leave +(?P<v2_fast_leave>\w+)$')
+        p12 = regex_engine.compile(r'^\s*IGMPv2 +Fast +leave +(?P<v2_fast_leave>\w+)$')
 
         #  Number of router-ports: 1
-        p13 = re.compile(r'^\s*Number +of +router\-ports: +(?P<router_ports_count>\d+)$')
+        p13 = regex_engine.compile(r'^\s*Number +of +router\-ports: +(?P<router_ports_count>\d+)$')
 
         #  Number of groups: 0
-        p14 = re.compile(r'^\s*Number +of +groups: +(?P<groups_count>\d+)$')
+        p14 = regex_engine.compile(r'^\s*Number +of +groups: +(?P<groups_count>\d+)$')
 
         #  VLAN vPC function enabled
-        p14_1 = re.compile(r'^\s*VLAN +vPC +function +(?P<vlan_vpc_function>\w+)$')
+        p14_1 = regex_engine.compile(r'^\s*VLAN +vPC +function +(?P<vlan_vpc_function>\w+)$')
 
         #  Active ports:
         #    Po20        Po30
-        p15_1 = re.compile(r'^(?P<space>\s{4})(?P<active_ports>[\w\s]+)$')
+        p15_1 = regex_engine.compile(r'^(?P<space>\s{4})(?P<active_ports>[\w\s]+)$')
 
         #  Report Flooding: Disabled
-        p16 = re.compile(r'^\s*Report +Flooding: +(?P<report_flooding>\w+)$')
+        p16 = regex_engine.compile(r'^\s*Report +Flooding: +(?P<report_flooding>\w+)$')
 
         #  Interfaces for Report Flooding: n/a
-        p17 = re.compile(r'^\s*Interfaces +for +Report +Flooding: +(?P<report_flooding_interfaces>\S+)$')
+        p17 = regex_engine.compile(r'^\s*Interfaces +for +Report +Flooding: +(?P<report_flooding_interfaces>\S+)$')
 
         #  Use Group Address for Proxy Leaves: no
-        p18 = re.compile(r'^\s*Use +Group +Address +for +Proxy +Leaves: +(?P<group_address_for_proxy_leaves>\S+)$')
+        p18 = regex_engine.compile(r'^\s*Use +Group +Address +for +Proxy +Leaves: +(?P<group_address_for_proxy_leaves>\S+)$')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -273,7 +273,7 @@ class ShowIpIgmpSnooping(ShowIpIgmpSnoopingSchema):
             # Switch-querier enabled, address XXX.XXX.XXX.XXX, currently running
             # Switch-querier enabled, address 1.2.3.200, currently not running
             # Switch-querier enabled, address 1.2.3.200, currently running
-            p10 = re.compile(r'^\s*Switch\-querier +(?P<type>\S+)(, +address +(?P<ip_address>(\S+)), +currently +(?P<state>[\s\w]+))?$')
+            p10 = regex_engine.compile(r'^\s*Switch\-querier +(?P<type>\S+)(, +address +(?P<ip_address>(\S+)), +currently +(?P<state>[\s\w]+))?$')
             m = p10.match(line)
             if m:
                 switch_querier = {}
@@ -5,13 +5,13 @@ NXOS revision parser for the following show commands:
     * show nve ethernet-segment esi <esi_id>
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =====================================================================================
 #   Schema for 'show nve ethernet-segment' and 'show nve ethernet-segment esi <esi_id>' 
@@ -99,67 +99,67 @@ class ShowNveEthernetSegment(ShowNveEthernetSegmentSchema):
 
         
         # ESI: 0300.0000.0186.a000.0309
-        p1 = re.compile(r'^ESI:\s+(?P<esi>[\w\.]+)$')
+        p1 = regex_engine.compile(r'^ESI:\s+(?P<esi>[\w\.]+)$')
 
         # Parent interface: nve1
-        p2 = re.compile(r'^Parent\s+interface:\s+(?P<parent_intf>[\w\.\/-]+)$')
+        p2 = regex_engine.compile(r'^Parent\s+interface:\s+(?P<parent_intf>[\w\.\/-]+)$')
 
         # ES State: Up
-        p3 = re.compile(r'^ES\s+State:\s+(?P<es_state>[\w\/]+)$')
+        p3 = regex_engine.compile(r'^ES\s+State:\s+(?P<es_state>[\w\/]+)$')
 
         # Port-channel state: N/A
-        p4 = re.compile(r'^Port-channel\s+state:\s+(?P<po_state>[\w\/]+)$')
+        p4 = regex_engine.compile(r'^Port-channel\s+state:\s+(?P<po_state>[\w\/]+)$')
 
         # NVE Interface: nve1
-        p5 = re.compile(r'^NVE\s+Interface:\s+(?P<nve_intf>[\w\.\/]+)$')
+        p5 = regex_engine.compile(r'^NVE\s+Interface:\s+(?P<nve_intf>[\w\.\/]+)$')
 
         # NVE State: Up
-        p6 = re.compile(r'^NVE\s+State:\s+(?P<nve_state>[\w\/]+)$')
+        p6 = regex_engine.compile(r'^NVE\s+State:\s+(?P<nve_state>[\w\/]+)$')
 
         # Host Learning Mode: control-plane
-        p7 = re.compile(r'^Host\s+Learning\s+Mode:\s+(?P<host_learning_mode>[\w\-]+)$')
+        p7 = regex_engine.compile(r'^Host\s+Learning\s+Mode:\s+(?P<host_learning_mode>[\w\-]+)$')
 
         # Active Vlans: 1,1001-2000,2501-2550,2601-2650,2701-2750,2801-2850,2901-2950
-        p8 = re.compile(r'^Active\s+Vlans:\s+(?P<active_vlans>[\d\-\,]+)$')
+        p8 = regex_engine.compile(r'^Active\s+Vlans:\s+(?P<active_vlans>[\d\-\,]+)$')
 
         # DF Vlans: 1001,1004,1007,1010,1013,1016,1019,1022,1025,1028,1031,1034,1037,1040,1043,2948
-        p9 = re.compile(r'^DF\sVlans:\s+(?P<df_vlans>[\d\-\,]+)$')
+        p9 = regex_engine.compile(r'^DF\sVlans:\s+(?P<df_vlans>[\d\-\,]+)$')
 
         # Active VNIs: 10001-10200,10501-11000,12501-13000,22001-22200,24001-24100
-        p10 = re.compile(r'^Active\s+VNIs:\s+(?P<active_vnis>[\d\-\,]+)$')
+        p10 = regex_engine.compile(r'^Active\s+VNIs:\s+(?P<active_vnis>[\d\-\,]+)$')
 
         # DF BDs: 8193,8196,8199,8202,8205,8208,8211,8214,8217,8220,8223,8226,8229,8232,12998
-        p11 = re.compile(r'^DF\s+BDs:\s+(?P<df_bds>[\d\-\,]+)$')
+        p11 = regex_engine.compile(r'^DF\s+BDs:\s+(?P<df_bds>[\d\-\,]+)$')
 
         # DF VNIs: 12551,12554,12557,12560,12563,12566,12569,12572,12575,12578,12581,12584,12587
-        p12 = re.compile(r'^DF\s+VNIs:\s+(?P<df_vnis>[\d\-\,]+)$')
+        p12 = regex_engine.compile(r'^DF\s+VNIs:\s+(?P<df_vnis>[\d\-\,]+)$')
 
         # Number of ES members: 3
-        p13 = re.compile(r'^Number\s+of\s+ES\s+members:\s+(?P<num_es_mem>[\d]+)?$')
+        p13 = regex_engine.compile(r'^Number\s+of\s+ES\s+members:\s+(?P<num_es_mem>[\d]+)?$')
 
         # My ordinal: 2
-        p14 = re.compile(r'^My\s+ordinal:\s+(?P<local_ordinal>[\d]+)$')
+        p14 = regex_engine.compile(r'^My\s+ordinal:\s+(?P<local_ordinal>[\d]+)$')
 
         # DF timer start time: 00:00:00
-        p15 = re.compile(r'^DF\s+timer\s+start\s+time:\s+(?P<df_timer_start_time>[\w\:]+)$')
+        p15 = regex_engine.compile(r'^DF\s+timer\s+start\s+time:\s+(?P<df_timer_start_time>[\w\:]+)$')
 
         # Config State: N/A
-        p16 = re.compile(r'^Config\s+State:\s+(?P<config_status>[\w\/-]+)$')
+        p16 = regex_engine.compile(r'^Config\s+State:\s+(?P<config_status>[\w\/-]+)$')
 
         # DF List: 100:100:100::1 100:100:100::2 100:100:100::7
-        p17 = re.compile(r'^DF\s+List:\s+(?P<df_list>[\d\s\.:]+)$')
+        p17 = regex_engine.compile(r'^DF\s+List:\s+(?P<df_list>[\d\s\.:]+)$')
 
         # ES route added to L2RIB: True
-        p18 = re.compile(r'^ES\s+route\s+added\s+to\s+L2RIB:\s+(?P<is_es_added_to_l2rib>[\w]+)$')
+        p18 = regex_engine.compile(r'^ES\s+route\s+added\s+to\s+L2RIB:\s+(?P<is_es_added_to_l2rib>[\w]+)$')
 
         # EAD/ES routes added to L2RIB: False
-        p19 = re.compile(r'^EAD\/ES\s+routes\s+added\s+to\s+L2RIB:\s+(?P<ead_rt_added>[\w]+)$')
+        p19 = regex_engine.compile(r'^EAD\/ES\s+routes\s+added\s+to\s+L2RIB:\s+(?P<ead_rt_added>[\w]+)$')
 
         # ESI type: Ether-segment
-        p20 = re.compile(r'^ESI\s+type:\s+(?P<esi_type>[\w\s-]+)$')
+        p20 = regex_engine.compile(r'^ESI\s+type:\s+(?P<esi_type>[\w\s-]+)$')
 
         # ESI DF election mode: Modulo
-        p21 = re.compile(r'^ESI\s+DF\s+election\s+mode:\s+(?P<esi_df_election_mode>[\w\s-]+)$')
+        p21 = regex_engine.compile(r'^ESI\s+DF\s+election\s+mode:\s+(?P<esi_df_election_mode>[\w\s-]+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -7,14 +7,12 @@ NXOS parsers for the following show commands:
     * show access-lists summary
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =======================================
@@ -137,13 +135,13 @@ class ShowAccessLists(ShowAccessListsSchema):
         # IP access list test22
         # IP access list NTP-ACL
         # IPV4 ACL 1
-        p1_ip = re.compile(r'^((IP +access +list)|(IPV4 +ACL)) +(?P<name>\S+)$')
+        p1_ip = regex_engine.compile(r'^((IP +access +list)|(IPV4 +ACL)) +(?P<name>\S+)$')
 
         # IPv6 access list ipv6_acl
-        p1_ipv6 = re.compile(r'^IPv6 +access +list +(?P<name>\S+)$')
+        p1_ipv6 = regex_engine.compile(r'^IPv6 +access +list +(?P<name>\S+)$')
 
         # MAC access list mac_acl
-        p1_mac = re.compile(r'^MAC +access +list +(?P<name>\S+)$')
+        p1_mac = regex_engine.compile(r'^MAC +access +list +(?P<name>\S+)$')
 
         # --- IP access list ---
         # 10 permit ip any any
@@ -160,14 +158,14 @@ class ShowAccessLists(ShowAccessListsSchema):
         # 20 permit ipv6 2001::1/128 2001:1::2/128
         # 30 permit tcp any eq 8443 2001:2::2/128
         # 10 permit udp any any
-        p2_ip = re.compile(r'^(?P<seq>\S+) +(?P<actions_forwarding>permit|deny)'
-                           r' +(?P<protocol>(?:ip|tcp|ipv6|udp)+) +(?P<source_network>(?:any|host|[\d.]+|[\d:.]+(?:\/\d+)?)?'
-                           r'(?: [\d.]+)?)(?:( +(?P<src_operator>eq|gt|lt|neq|range)'
-                           r' +(?P<src_port>[a-z\d ]{1,20})))? +(?P<destination_network>(?:any|host|[\d:.]+(?:\/\d+)?)'
-                           r'(?: +[\d.]+)?)(?: +(?P<dst_operator>eq|gt|lt|neq|range)'
-                           r' +(?P<dst_port>(?:\S ?)+\S))?(?P<established_log> +established +log)?'
-                           r'(?: +precedence +(?P<precedence>network) +ttl +(?P<ttl>\d+))?'
-                           r'(?: +\[match=(?P<match>\d+)\])?(?: +(?P<logging>log))?$')
+        p2_ip = regex_engine.compile(r'^(?P<seq>\S+) +(?P<actions_forwarding>permit|deny)'
+                                     r' +(?P<protocol>(?:ip|tcp|ipv6|udp)+) +(?P<source_network>(?:any|host|[\d.]+|[\d:.]+(?:\/\d+)?)?'
+                                     r'(?: [\d.]+)?)(?:( +(?P<src_operator>eq|gt|lt|neq|range)'
+                                     r' +(?P<src_port>[a-z\d ]{1,20})))? +(?P<destination_network>(?:any|host|[\d:.]+(?:\/\d+)?)'
+                                     r'(?: +[\d.]+)?)(?: +(?P<dst_operator>eq|gt|lt|neq|range)'
+                                     r' +(?P<dst_port>(?:\S ?)+\S))?(?P<established_log> +established +log)?'
+                                     r'(?: +precedence +(?P<precedence>network) +ttl +(?P<ttl>\d+))?'
+                                     r'(?: +\[match=(?P<match>\d+)\])?(?: +(?P<logging>log))?$')
 
         # --- MAC access list ---
         # 10 permit aaaa.bbff.8888 0000.0000.0000 bbbb.ccff.aaaa bbbb.ccff.aaaa aarp
@@ -175,12 +173,12 @@ class ShowAccessLists(ShowAccessListsSchema):
         # 30 deny 0000.0000.0000 0000.0000.0000 aaaa.bbff.8888 0000.0000.0000 0x8041
         # 40 deny any any vlan 10
         # 50 permit aaaa.aaff.5555 ffff.ffff.0000 any aarp
-        p2_mac = re.compile(r'^(?P<seq>\S+) +(?P<actions_forwarding>permit|deny) '
-                            r'+(?P<source_mac_address>any|host|[\w]{4}.[\w]{4}.[\w]{4}'
-                            r'(?: [\w]{4}.[\w]{4}.[\w]{4})?) '
-                            r'+(?P<destination_mac_address>(?:any|host|[\w.]+|[\d.]+)(?: +[\w]{4}.[\w]{4}.[\w]{4})?)'
-                            r'(?: +any)?(?: +(?P<ether_type>aarp))?(?: +vlan +(?P<vlan>\d+))?'
-                            r'(?: (?P<mac_protocol_number>\w+))?$')
+        p2_mac = regex_engine.compile(r'^(?P<seq>\S+) +(?P<actions_forwarding>permit|deny) '
+                                      r'+(?P<source_mac_address>any|host|[\w]{4}.[\w]{4}.[\w]{4}'
+                                      r'(?: [\w]{4}.[\w]{4}.[\w]{4})?) '
+                                      r'+(?P<destination_mac_address>(?:any|host|[\w.]+|[\d.]+)(?: +[\w]{4}.[\w]{4}.[\w]{4})?)'
+                                      r'(?: +any)?(?: +(?P<ether_type>aarp))?(?: +vlan +(?P<vlan>\d+))?'
+                                      r'(?: (?P<mac_protocol_number>\w+))?$')
 
         result_dict = {}
 
@@ -366,26 +364,26 @@ class ShowAccessListsSummary(ShowAccessListsSummarySchema):
         # IPV4 ACL acl_name
         # IPV4 ACL sl_def_acl
         # IP access list 199
-        p1=re.compile(r'^(?P<type>[\w\d]+|IP) +(ACL|access list) +(?P<name>[\w\-_]+)(\s+(Statistics +(?P<status>\w+)))?$')
+        p1=regex_engine.compile(r'^(?P<type>[\w\d]+|IP) +(ACL|access list) +(?P<name>[\w\-_]+)(\s+(Statistics +(?P<status>\w+)))?$')
 
         # Statistics enabled
-        p1_1 = re.compile(r'^Statistics\s+(?P<status>\w+)$')
+        p1_1 = regex_engine.compile(r'^Statistics\s+(?P<status>\w+)$')
 
         # fragments permit-all
-        p1_2 = re.compile(r'^(fragments +(?P<Fragments>[\w\-]+))?$')
+        p1_2 = regex_engine.compile(r'^(fragments +(?P<Fragments>[\w\-]+))?$')
 
         # Total ACEs Configured: 10
-        p2=re.compile(r'^Total +ACEs +Configured: +(?P<total_aces_configured>\d+)$')
+        p2=regex_engine.compile(r'^Total +ACEs +Configured: +(?P<total_aces_configured>\d+)$')
 
         # VTY         - ingress
         # Vlan2472 - egress (Router ACL)
         # Ethernetxx/x.xxx - egress (Router ACL)
-        p3 = re.compile(r'^((?P<interface>[\w\d\/\.]+)\s+-\s+(?P<traffic>ingress|egress)( +\((?P<route>[\w\s]+)\))?)?$')
+        p3 = regex_engine.compile(r'^((?P<interface>[\w\d\/\.]+)\s+-\s+(?P<traffic>ingress|egress)( +\((?P<route>[\w\s]+)\))?)?$')
 
         #Active on interfaces:
         #        Vlan2472 - egress (Router ACL)
         #        Vlan2474 - egress (Router ACL)
-        p4 = re.compile(r'^(?P<active>Active) +on +interfaces:(?:\n +(?P<interface2>[\w\d\/]+) - (?P<traffic2>ingress|egress+) (\((?P<type2>[\w\s]+))\)?)?$')
+        p4 = regex_engine.compile(r'^(?P<active>Active) +on +interfaces:(?:\n +(?P<interface2>[\w\d\/]+) - (?P<traffic2>ingress|egress+) (\((?P<type2>[\w\s]+))\)?)?$')
 
 
         result_dict = {}
@@ -5,14 +5,12 @@ NXOS parsers for the following show commands:
 	* 'show ip arp detail vrf all'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 										Default, Use
 from genie import parsergen
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -61,6 +59,20 @@ class ShowIpArp(ShowIpArpSchema):
 	cli_command = ['show ip arp', 'show ip arp vrf {vrf}']
 	exclude = ['age']
 
+	# '| json' output is parsed with context='json'
+	CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+	# json adjacency attribute: flag shown by the cli
+	json_flags = {
+		'adj-on-nonactive-fhrp': '*',
+		'syncedatt': '+',
+		'glean-throttled': '#',
+		'cp-adj': 'CP',
+		'ps-adj': 'PS',
+		'ro-adj': 'RO',
+		'static-adj-down': 'D',
+	}
+
 	def cli(self, vrf='', output=None):
 		if vrf:
 			cmd = self.cli_command[1].format(vrf=vrf)
@@ -78,16 +90,16 @@ class ShowIpArp(ShowIpArpSchema):
 		# IP ARP Table for all contexts
 		# IP ARP Table for context vni_10100
 		# IP ARP Table for context default
-		p1 = re.compile(r'^IP +ARP +Table +for +(context +)?(?P<vrf>[\S]+)( +contexts)?$')
+		p1 = regex_engine.compile(r'^IP +ARP +Table +for +(context +)?(?P<vrf>[\S]+)( +contexts)?$')
 
 		# Total number of entries: 11
-		p2 = re.compile(r'^Total +number +of +entries:\s+(?P<num_entries>\d+)$')
+		p2 = regex_engine.compile(r'^Total +number +of +entries:\s+(?P<num_entries>\d+)$')
 
 		# 192.168.16.226 0 0006.d6ff.632b ARPA GigabitEthernet1/1
 		# 10.111.1.3     00:09:20  fa16.3eff.0987  Vlan101         +
 		# 10.111.1.4     00:01:53  fa16.3eff.c271  Vlan101
         # 10.23.90.2      00:01:05  fa16.3eff.f80e  Ethernet1/1.390
-		p3 = re.compile(r'^(?P<ip_address>[\d\.]+)\s+(?P<age>[\d:-]+)\s+(?P<mac_address>[\w\.]+)\s+'
+		p3 = regex_engine.compile(r'^(?P<ip_address>[\d\.]+)\s+(?P<age>[\d:-]+)\s+(?P<mac_address>[\w\.]+)\s+'
 						r'((?P<encap_type>ARPA)\s+)?(?P<interface>\S+)(\s+(?P<flags>\S))?$')
 
 		for line in out.splitlines():
@@ -151,6 +163,51 @@ class ShowIpArp(ShowIpArpSchema):
 		
 		return res_dict
 
+	def json(self, vrf='', output=None):
+		if vrf:
+			cmd = self.cli_command[1].format(vrf=vrf)
+		else:
+			cmd = self.cli_command[0]
+
+		if output is None:
+			out = self.device.execute(cmd + ' | json')
+		else:
+			out = output
+
+		res_dict = {}
+		entries_total = None
+
+		for vrf_row in Common.retrieve_json_rows(Common.load_json_output(out), 'TABLE_vrf'):
+			# "cnt-total": 6
+			if 'cnt-total' in vrf_row:
+				entries_total = (entries_total or 0) + int(vrf_row['cnt-total'])
+
+			for adj_row in Common.retrieve_json_rows(vrf_row, 'TABLE_adj'):
+				# {"intf-out": "Vlan101", "ip-addr-out": "10.111.1.3",
+				#  "time-stamp": "00:10:42", "mac": "fa16.3eff.0987"}
+				interface = adj_row['intf-out']
+				ip_address = adj_row['ip-addr-out']
+				age = adj_row.get('time-stamp', '-')
+
+				ip_dict = res_dict.setdefault('interfaces', {}).setdefault(interface, {}).\
+					setdefault('ipv4', {}).setdefault('neighbors', {}).setdefault(ip_address, {})
+				ip_dict.update({'ip': ip_address})
+				ip_dict.update({'link_layer_address': adj_row.get('mac', 'INCOMPLETE')})
+				ip_dict.update({'physical_interface': interface})
+				ip_dict.update({'origin': 'static' if '-' in age else 'dynamic'})
+				ip_dict.update({'age': age})
+
+				# "syncedatt": "true"
+				for key, flag in self.json_flags.items():
+					if str(adj_row.get(key, '')).lower() == 'true':
+						ip_dict.update({'flags': flag})
+						break
+
+		if res_dict and entries_total is not None:
+			res_dict.setdefault('statistics', {}).update({'entries_total': entries_total})
+
+		return res_dict
+
 
 # =======================================
 # Schema for 'show ip arp detail vrf all'
@@ -217,7 +274,7 @@ class ShowIpArpDetailVrfAll(ShowIpArpDetailVrfAllSchema):
 		# 10.1.7.1        00:17:15  0012.7fff.04d7  mgmt0            mgmt0
 		# 172.16.23.22    00:13:48  00a0.98ff.16cc  Vlan651          port-channel1050    +
 		# 172.16.8.178    00:00:04  INCOMPLETE      Vlan392          Vlan392
-		p1 = re.compile(r'^(?P<address>[\d\.]+) +(?P<age>[\d+\-\:]+) '
+		p1 = regex_engine.compile(r'^(?P<address>[\d\.]+) +(?P<age>[\d+\-\:]+) '
 						r'+(?P<mac>[\w\.]+) +(?P<interface>\S+) '
 						r'+(?P<physical_interface>\S+)'
 						r'( +(?P<flag>[\*\w\+\#]+))?'
@@ -293,17 +350,17 @@ class ShowIpArpSummaryVrfAll(ShowIpArpSummaryVrfAllSchema):
 		ret_dict = {}
 
 		# Resolved   : 12
-		p1 = re.compile(r'^\s*Resolved +: +(?P<resolved>[\d]+)$')
+		p1 = regex_engine.compile(r'^\s*Resolved +: +(?P<resolved>[\d]+)$')
 
 		# Incomplete : 0 (Throttled : 0)
-		p2 = re.compile(r'^\s*Incomplete +: +(?P<incomplete>\w+)'
+		p2 = regex_engine.compile(r'^\s*Incomplete +: +(?P<incomplete>\w+)'
 			r' +\(Throttled +: +(?P<throttled>\w+)\)$')
 
 		# Unknown    : 0
-		p3 = re.compile(r'^\s*Unknown +: +(?P<unknown>[\d]+)$')
+		p3 = regex_engine.compile(r'^\s*Unknown +: +(?P<unknown>[\d]+)$')
 
 		# Total      : 12
-		p4 = re.compile(r'^\s*Total +: +(?P<total>[\d]+)$')
+		p4 = regex_engine.compile(r'^\s*Total +: +(?P<total>[\d]+)$')
 
 		for line in out.splitlines():
 			line = line.strip()
@@ -459,26 +516,26 @@ class ShowIpArpstatisticsVrfAll(ShowIpArpstatisticsVrfAllSchema):
 		key = ''
 
 		#  Sent:
-		p1 = re.compile(r'^\s*Sent:$')
+		p1 = regex_engine.compile(r'^\s*Sent:$')
 
 		#  Received:
-		p1_1 = re.compile(r'^\s*Received:$')
+		p1_1 = regex_engine.compile(r'^\s*Received:$')
 
 		# Total 0, Requests 22632, Replies 6582, Requests on L2 0, Replies on L2 0,
 		# Total 24812, RewritePkt 0, Requests 12466, Replies 136320, Requests on L2 0, Replies on L2 0,
-		p2 = re.compile(r'^\s*Total +(?P<total>[\w]+)(, +RewritePkt +(?P<rewritepkt>[\w]+))?, +Requests '
+		p2 = regex_engine.compile(r'^\s*Total +(?P<total>[\w]+)(, +RewritePkt +(?P<rewritepkt>[\w]+))?, +Requests '
 			r'+(?P<requests>[\w]+), +Replies +(?P<replies>[\w]+), '
 			r'+Requests +on +L2 +(?P<l2_requests>[\w]+), +Replies +on +L2 '
 			r'+(?P<l2_replies>[\w]+)(,)?$')
 
 		# Gratuitous 58, Tunneled 0, Dropped 0
 		# Gratuitous 64, Tunneled 0, Dropped 0, DroppedRewritePkt 0,
-		p3 = re.compile(r'^\s*Gratuitous +(?P<gratuitous>[\w]+), +Tunneled '
+		p3 = regex_engine.compile(r'^\s*Gratuitous +(?P<gratuitous>[\w]+), +Tunneled '
 			r'+(?P<tunneled>[\w]+), +Dropped +(?P<dropped>[\w]+)(, +DroppedRewritePkt +(?P<droppedrewritepkt>[\w]+),)?$')
 
 		# Proxy arp 0, Local-Proxy arp 0,  Enhanced Proxy arp 0, Anycast proxy Proxy arp 0,  L2 Port-track Proxy arp 0,  Tunneled 0, Fastpath 0, Snooped 0, Dropped 28218  on Server Port 0 
 		# Proxy arp 0, Local-Proxy arp 0, Tunneled 0, Fastpath 0, Snooped 0, Dropped 4
-		p4 = re.compile(r'^Proxy +arp +(?P<proxy_arp>[\w]+), +Local-Proxy +'
+		p4 = regex_engine.compile(r'^Proxy +arp +(?P<proxy_arp>[\w]+), +Local-Proxy +'
 			r'arp +(?P<local_proxy_arp>[\w]+),( +Enhanced +Proxy +arp +'
 			r'(?P<enhanced_proxy_arp>[\w]+),)?( +Anycast +proxy +Proxy +'
 			r'arp +(?P<anycast_proxy_arp>[\w]+),)?( +L2 +Port-track +Proxy +'
@@ -488,205 +545,205 @@ class ShowIpArpstatisticsVrfAll(ShowIpArpstatisticsVrfAllSchema):
 			r'?,?( +on +Server +Port +(?P<dropped_server_port>[\w]+))?')
 
 		# MBUF operation failed               : 0
-		p5 = re.compile(r'^\s*MBUF +operation +failed +: '
+		p5 = regex_engine.compile(r'^\s*MBUF +operation +failed +: '
 						r'+(?P<mbuf_operation_failed>[\d]+)$')
 
 		# Context not yet created             : 0
-		p6 = re.compile(r'^\s*Context +not +yet +created +: '
+		p6 = regex_engine.compile(r'^\s*Context +not +yet +created +: '
 						r'+(?P<context_not_created>[\d]+)$')
 
 		# Invalid context                     : 0
-		p7 = re.compile(r'^\s*Invalid +context +: +(?P<invalid_context>[\d]+)$')
+		p7 = regex_engine.compile(r'^\s*Invalid +context +: +(?P<invalid_context>[\d]+)$')
 
 		# Invalid ifindex                     : 0
-		p8 = re.compile(r'^\s*Invalid +ifindex +: +(?P<invalid_ifindex>[\d]+)$')
+		p8 = regex_engine.compile(r'^\s*Invalid +ifindex +: +(?P<invalid_ifindex>[\d]+)$')
 
 		# Invalid SRC IP                      : 0
-		p9 = re.compile(r'^\s*Invalid +SRC +IP +: +(?P<invalid_src_ip>[\d]+)$')
+		p9 = regex_engine.compile(r'^\s*Invalid +SRC +IP +: +(?P<invalid_src_ip>[\d]+)$')
 
 		# Invalid DEST IP                     : 0
-		p10 = re.compile(r'^\s*Invalid +DEST +IP +: +(?P<invalid_dest_ip>[\d]+)$')
+		p10 = regex_engine.compile(r'^\s*Invalid +DEST +IP +: +(?P<invalid_dest_ip>[\d]+)$')
 
 		# Destination is our own IP           :  26
-		p11 = re.compile(r'^\s*Destination +is +our +own +IP +: '
+		p11 = regex_engine.compile(r'^\s*Destination +is +our +own +IP +: '
 						 r'+(?P<destnination_is_our_own_ip>[\d]+)$')
 
 		# Unattached IP                       :  0
-		p12 = re.compile(r'^\s*Unattached +IP +: +(?P<unattached_ip>[\d]+)$')
+		p12 = regex_engine.compile(r'^\s*Unattached +IP +: +(?P<unattached_ip>[\d]+)$')
 
 		# Adjacency Couldn't be added         :  0
-		p13 = re.compile(r'^\s*Adjacency +Couldn\'t +be +added +: '
+		p13 = regex_engine.compile(r'^\s*Adjacency +Couldn\'t +be +added +: '
 						 r'+(?P<adjacency_couldnt_be_added>[\d]+)$')
 
 		# Null Source IP                      :  0
-		p14 = re.compile(r'^\s*Null +Source +IP +: +(?P<null_source_ip>[\d]+)$')
+		p14 = regex_engine.compile(r'^\s*Null +Source +IP +: +(?P<null_source_ip>[\d]+)$')
 
 		# Null Source MAC                     :  0
-		p15 = re.compile(r'^\s*Null +Source +MAC +: +(?P<null_source_mac>[\d]+)$')
+		p15 = regex_engine.compile(r'^\s*Null +Source +MAC +: +(?P<null_source_mac>[\d]+)$')
 
 		# Client Enqueue Failed               :  0
-		p16 = re.compile(r'^\s*Client +Enqueue +Failed +: +(?P<client_enqueue_failed>[\d]+)$')
+		p16 = regex_engine.compile(r'^\s*Client +Enqueue +Failed +: +(?P<client_enqueue_failed>[\d]+)$')
 
 		# Dest. not reachable for proxy arp   :  0
-		p17 = re.compile(r'^\s*Dest. +not +reachable +for +proxy +arp +: '
+		p17 = regex_engine.compile(r'^\s*Dest. +not +reachable +for +proxy +arp +: '
 						 r'+(?P<dest_not_reachable_for_proxy_arp>[\d]+)$')
 
 		# Dest. unreachable for enhanced proxy:  0
 		# Dest. unreachable for enhanced proxy :  0
-		p18 = re.compile(r'^\s*Dest. +unreachable +for +enhanced +proxy( +)?: '
+		p18 = regex_engine.compile(r'^\s*Dest. +unreachable +for +enhanced +proxy( +)?: '
 						 r'+(?P<dest_unreachable_for_enhanced_proxy>[\d]+)$')
 
 		# Dest. on L2 port being tracked      :  0
-		p19 = re.compile(r'^\s*Dest. +on +L2 +port +being +tracked +: '
+		p19 = regex_engine.compile(r'^\s*Dest. +on +L2 +port +being +tracked +: '
 						 r'+(?P<destnination_on_l2_port_tracked>[\d]+)$')
 
 		# Invalid Local proxy arp             :  0
-		p20 = re.compile(r'^\s*Invalid +Local +proxy +arp +: '
+		p20 = regex_engine.compile(r'^\s*Invalid +Local +proxy +arp +: '
 						 r'+(?P<invalid_local_proxy_arp>[\d]+)$')
 
 		# Invalid proxy arp                   :  0
-		p21 = re.compile(r'^\s*Invalid +proxy +arp +: +(?P<invalid_proxy_arp>[\d]+)$')
+		p21 = regex_engine.compile(r'^\s*Invalid +proxy +arp +: +(?P<invalid_proxy_arp>[\d]+)$')
 
 		# VIP is not active                   :  0
-		p22 = re.compile(r'^\s*VIP +is +not +active +: +(?P<vip_is_not_active>[\d]+)$')
+		p22 = regex_engine.compile(r'^\s*VIP +is +not +active +: +(?P<vip_is_not_active>[\d]+)$')
 
 		# ARP refresh skipped over core and flooded on server :  0
-		p23 = re.compile(r'^\s*ARP +refresh +skipped +over +core +and +flooded '
+		p23 = regex_engine.compile(r'^\s*ARP +refresh +skipped +over +core +and +flooded '
 						 r'+on +server +: +(?P<arp_refresh_skipped_over_core_'
 						 r'and_flooded>[\d]+)$')
 
 		# Appeared on a wrong interface :  0
-		p24 = re.compile(r'^\s*Appeared +on +a +wrong +interface +: '
+		p24 = regex_engine.compile(r'^\s*Appeared +on +a +wrong +interface +: '
 					 	 r'+(?P<appeared_on_a_wrong_interface>[\d]+)$')
 
 		# Incorrect length                    : 0
-		p25 = re.compile(r'^\s*Incorrect +length +: +(?P<incorrect_length>[\d]+)$')
+		p25 = regex_engine.compile(r'^\s*Incorrect +length +: +(?P<incorrect_length>[\d]+)$')
 
 		# Invalid protocol packet                    : 0
-		p26 = re.compile(r'^\s*Invalid +protocol +packet +: '
+		p26 = regex_engine.compile(r'^\s*Invalid +protocol +packet +: '
 						 r'+(?P<invalid_protocol_packet>[\d]+)$')
 
 		# Invalid Hardware type                  : 0
-		p27 = re.compile(r'^\s*Invalid +Hardware +type +: '
+		p27 = regex_engine.compile(r'^\s*Invalid +Hardware +type +: '
 						 r'+(?P<invalid_hardwaretype>[\d]+)$')
 
 		# ARP adjacency statistics
-		p27_1 = re.compile(r'^\s*ARP adjacency statistics$')
+		p27_1 = regex_engine.compile(r'^\s*ARP adjacency statistics$')
 
 		# Invalid layer 2 address length      : 0
-		p30 = re.compile(r'^\s*Invalid +layer +2 +address +length +: '
+		p30 = regex_engine.compile(r'^\s*Invalid +layer +2 +address +length +: '
 						 r'+(?P<invalid_layer2_address_length>[\d]+)$')
 
 		# Invalid source IP address           : 28
-		p31 = re.compile(r'^\s*Invalid +source +IP +address +: '
+		p31 = regex_engine.compile(r'^\s*Invalid +source +IP +address +: '
 						 r'+(?P<invalid_source_ip_address>[\d]+)$')
 
 		# Source IP address is our own        : 0
-		p32 = re.compile(r'^\s*Source +IP +address +is +our +own +: '
+		p32 = regex_engine.compile(r'^\s*Source +IP +address +is +our +own +: '
 						 r'+(?P<source_ip_address_is_our_own>[\d]+)$')
 
 		# No mem to create per intf structure : 0
-		p32 = re.compile(r'^\s*No +mem +to +create +per +intf +structure +: '
+		p32 = regex_engine.compile(r'^\s*No +mem +to +create +per +intf +structure +: '
 						 r'+(?P<no_mem_to_create_per_intf_structure>[\d]+)$')
 
 		# Invalid layer 3 address length      : 0
-		p33 = re.compile(r'^\s*Invalid +layer +3 +address +length +: '
+		p33 = regex_engine.compile(r'^\s*Invalid +layer +3 +address +length +: '
 						 r'+(?P<invalid_layer3_address_length>[\d]+)$')
 
 		# Source address mismatch with subnet : 0
-		p34 = re.compile(r'^\s*Source +address +mismatch +with +subnet +: '
+		p34 = regex_engine.compile(r'^\s*Source +address +mismatch +with +subnet +: '
 						 r'+(?P<source_address_mismatch_with_subnet>[\d]+)$')
 
 		# Directed broadcast source           : 0
-		p35 = re.compile(r'^\s*Directed +broadcast +source +: '
+		p35 = regex_engine.compile(r'^\s*Directed +broadcast +source +: '
 						 r'+(?P<directed_broadcast_source>[\d]+)$')
 
 		# Invalid destination IP address      : 0
-		p36 = re.compile(r'^\s*Invalid +destination +IP +address +: '
+		p36 = regex_engine.compile(r'^\s*Invalid +destination +IP +address +: '
 						 r'+(?P<invalid_destination_ip_address>[\d]+)$')
 
 		# Non-local destination IP address    : 20421
-		p37 = re.compile(r'^\s*Non-local +destination +IP +address +: '
+		p37 = regex_engine.compile(r'^\s*Non-local +destination +IP +address +: '
 						 r'+(?P<non_local_destination_ip_address>[\d]+)$')
 
 		# Invalid source MAC address          : 0
-		p38 = re.compile(r'^\s*Invalid +source +MAC +address +: '
+		p38 = regex_engine.compile(r'^\s*Invalid +source +MAC +address +: '
 						 r'+(?P<invalid_source_mac_address>[\d]+)$')
 
 		# Source MAC address is our own       : 0
-		p39 = re.compile(r'^\s*Source +MAC +address +is +our +own +: '
+		p39 = regex_engine.compile(r'^\s*Source +MAC +address +is +our +own +: '
 						 r'+(?P<source_mac_address_is_our_own>[\d]+)$')
 
 		# Received before arp initialization  : 0
-		p40 = re.compile(r'^\s*Received +before +arp +initialization +: '
+		p40 = regex_engine.compile(r'^\s*Received +before +arp +initialization +: '
 						 r'+(?P<received_before_arp_initialization>[\d]+)$')
 
 		# L2 packet on untrusted L2 port      : 0
-		p41 = re.compile(r'^\s*L2 +packet +on +untrusted +L2 +port +: '
+		p41 = regex_engine.compile(r'^\s*L2 +packet +on +untrusted +L2 +port +: '
 						 r'+(?P<l2_packet_on_untrusted_l2_port>[\d]+)$')
 
 		# Packet with VIP on standby FHRP     : 0
-		p42 = re.compile(r'^\s*Packet +with +VIP +on +standby +FHRP +: '
+		p42 = regex_engine.compile(r'^\s*Packet +with +VIP +on +standby +FHRP +: '
 						 r'+(?P<packet_with_vip_on_standby_fhrp>[\d]+)$')
 
 		# Requests came for exising entries   : 15
-		p43 = re.compile(r'^\s*Requests +came +for +exising +entries +: '
+		p43 = regex_engine.compile(r'^\s*Requests +came +for +exising +entries +: '
 						 r'+(?P<requests_came_for_exising_entries>[\d]+)$')
 
 		# Requests came on a L2 interface     : 0
 		# Requests came on a l2 interface     : 0
-		p44 = re.compile(r'^\s*Requests +came +on +a +(l|L)2 +interface +: '
+		p44 = regex_engine.compile(r'^\s*Requests +came +on +a +(l|L)2 +interface +: '
 						 r'+(?P<requests_came_on_a_l2_interface>[\d]+)$')
 
 		# L2FM query failed for a L2 Address  : 0
-		p45 = re.compile(r'^\s*L2FM +query +failed +for +a +L2 +Address +: '
+		p45 = regex_engine.compile(r'^\s*L2FM +query +failed +for +a +L2 +Address +: '
 						 r'+(?P<l2fm_query_failed_for_a_l2address>[\d]+)$')
 
 		# Dropping due to tunneling failures  : 0
-		p46 = re.compile(r'^\s*Dropping due to tunneling failures +: '
+		p46 = regex_engine.compile(r'^\s*Dropping due to tunneling failures +: '
 						 r'+(?P<dropping_due_to_tunneling_failures>[\d]+)$')
 
 		# Glean requests recv count : 71
-		p47 = re.compile(r'^\s*Glean +requests +recv +count +: '
+		p47 = regex_engine.compile(r'^\s*Glean +requests +recv +count +: '
 						 r'+(?P<glean_requests_recv_count>[\d]+)$')
 
 		# ARP refresh requests received from clients: 0
-		p48 = re.compile(r'^\s*ARP +refresh +requests +received +from +clients: '
+		p48 = regex_engine.compile(r'^\s*ARP +refresh +requests +received +from +clients: '
 					 	 r'+(?P<arp_refresh_requests_received_from_clients>[\d]+)$')
 
 		# Number of Signals received from L2rib : 0
-		p49 = re.compile(r'^\s*Number +of +Signals +received +from +L2rib +: '
+		p49 = regex_engine.compile(r'^\s*Number +of +Signals +received +from +L2rib +: '
 						 r'+(?P<number_of_signals_received_from_l2rib>[\d]+)$')
 
 		# Adds 43, Deletes 12, Timeouts 12
 		# Adds 32, Deletes 0, Timeouts 0, delDynamicOnStaticAdd 0
-		p50 = re.compile(r'^\s*Adds +(?P<adjacency_adds>[\w]+), +Deletes '
+		p50 = regex_engine.compile(r'^\s*Adds +(?P<adjacency_adds>[\w]+), +Deletes '
 						 r'+(?P<adjacency_deletes>[\w]+), +Timeouts '
 						 r'+(?P<adjacency_timeouts>[\w]+)'
 						 r'(, +delDynamicOnStaticAdd +(?P<del_dynamic_on_static_add>[\w]+))?$')
 
 		# Failed due to limits: 0
-		p51 = re.compile(r'^\s*Failed +due +to +limits: '
+		p51 = regex_engine.compile(r'^\s*Failed +due +to +limits: '
 						 r'+(?P<failed_due_to_limits>[\d]+)$')
 
 		# Non-active FHRP dest IP address. Learn and drop
-		p52 = re.compile(r'^\s*Non-active +FHRP +dest +IP +address. '
+		p52 = regex_engine.compile(r'^\s*Non-active +FHRP +dest +IP +address. '
 						 r'+Learn +and +drop$')
 
 		# Grat arp received on proxy-arp-enabled interface
-		p53 = re.compile(r'^\s*Grat +arp +received +on +proxy-arp-enabled '
+		p53 = regex_engine.compile(r'^\s*Grat +arp +received +on +proxy-arp-enabled '
 						 r'+interface$')
 
 		#                                     : 0
-		p54 = re.compile(r'^\s*: +(?P<statistic_number>[\d]+)$')
+		p54 = regex_engine.compile(r'^\s*: +(?P<statistic_number>[\d]+)$')
 
 		# 0, Snooped 0, Dropped 181721798, on Server Port 0
-		p55 = re.compile(r'(?P<fastpath>[\w]+)\,( +Snooped +(?P<snooped>[\w]+))'
+		p55 = regex_engine.compile(r'(?P<fastpath>[\w]+)\,( +Snooped +(?P<snooped>[\w]+))'
 						 r'?\,?( +Dropped +(?P<dropped>[\w]+))\,?( +on +Server '
 						 r'+Port +(?P<dropped_server_port>[\w]+))')
 		
 		# Source IP address is our own        : 1
-		p56 = re.compile(r'^Source +IP +address +is +our +own +\: '
+		p56 = regex_engine.compile(r'^Source +IP +address +is +our +own +\: '
 						 r'+(?P<source_ip_address_is_our_own>\d+)$')
 
 		for line in out.splitlines():
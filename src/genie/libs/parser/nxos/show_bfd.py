@@ -8,14 +8,12 @@ NXOS parser for the following show commands
     * show bfd ipv6 {ipv6_address} neighbors vrf {vrf}
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Optional, Any, Or
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -97,7 +95,7 @@ class ShowBfdIpv4Session(ShowBfdSessionSchema):
 
         # regex pattern for
         # 10.10.12.1      10.10.12.2      1090519053/1090519042 Up              6000(3)           Up          Eth1/35               default                          SH       N/A
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<our_address>[\w\.\:]+)\s+'
             r'(?P<our_neighbor>[\w\.\:]+)\s+'
             r'(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\w+)\s+'
@@ -175,11 +173,11 @@ class ShowBfdIpv6Session(ShowBfdSessionSchema):
 
         # regex pattern for
         # 2001:db8:12::1                   2001:db8:12::2
-        p1 = re.compile(r'^(?P<our_address>[0-9A-Fa-f]+:[0-9A-Fa-f:]+)\s+(?P<our_neighbor>'
-                        r'[0-9A-Fa-f]+:[0-9A-Fa-f:]+)$')
+        p1 = regex_engine.compile(r'^(?P<our_address>[0-9A-Fa-f]+:[0-9A-Fa-f:]+)\s+(?P<our_neighbor>'
+                                  r'[0-9A-Fa-f]+:[0-9A-Fa-f:]+)$')
 
         # 1090519054/1090519043 Up              6000(3)           Up          Eth1/35               default                          SH
-        p2 = re.compile(r'^(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\w+)\s+(?P<holdown_timer>N\/A|\d+)\((?P<holdown_timer_multiplier>\d+)\)\s+(?P<state>\S+)\s+(?P<interface>\S+)\s+(?P<vrf>\S+)\s+(?P<type>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\w+)\s+(?P<holdown_timer>N\/A|\d+)\((?P<holdown_timer_multiplier>\d+)\)\s+(?P<state>\S+)\s+(?P<interface>\S+)\s+(?P<vrf>\S+)\s+(?P<type>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -235,10 +233,10 @@ class ShowBfdNeighbor(ShowBfdSessionSchema):
         # OurAddr         NeighAddr       LD/RD                 RH/RS           Holdown(mult)     State       Int               Vrf                       Type
         # 21.1.1.1        21.1.1.2        1090519041/1090519041 Up              1271181547(3)     Up          Eth1/17/1         default                   SH
         # *22.1.1.1        22.1.1.2        1090519042/1090519042 Up              1271183236(3)     Up          Eth1/17/2.5       default                   SH
-        p1 = re.compile(r'^(\*)?(?P<our_address>[\w\.\:]+)\s+(?P<our_neighbor>[\w\.\:]+)' \
-                        r'\s+(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\S+)\s+(?P<holdown_timer>\d+)' \
-                        r'(\s+)?\((?P<holdown_timer_multiplier>\d+)(\s+)?\)\s+(?P<state>\w+)\s+' \
-                        r'(?P<interface>[\w\/\.]+)(\s+(?P<vrf>[\w]+)\s+(?P<type>[\w]+))?$')
+        p1 = regex_engine.compile(r'^(\*)?(?P<our_address>[\w\.\:]+)\s+(?P<our_neighbor>[\w\.\:]+)' \
+                                  r'\s+(?P<ld_rd>\d+\/\d+)\s+(?P<rh_rs>\S+)\s+(?P<holdown_timer>\d+)' \
+                                  r'(\s+)?\((?P<holdown_timer_multiplier>\d+)(\s+)?\)\s+(?P<state>\w+)\s+' \
+                                  r'(?P<interface>[\w\/\.]+)(\s+(?P<vrf>[\w]+)\s+(?P<type>[\w]+))?$')
         for line in out.splitlines():
             line = line.strip()
 
@@ -369,88 +367,88 @@ class ShowBfdNeighborDetail(ShowBfdNeighborDetailSchema):
             
         ret_dict = {}
         # 21.1.1.1        21.1.1.2        1090519041/1090519041 Up              1271180418(3)     Up          Eth1/17/1         default                   SH
-        p1 = re.compile(r'^(\*)?(?P<our_address>[\w\.\:]+)\s+(?P<our_neighbor>[\w\.\:]+)\s+(?P<ld_rd>\d+\/\d+)\s+'\
-                        r'(?P<rh_rs>\S+)\s+(?P<holdown_timer>(\d+)?(\w\/\w)?)(\s+)?\((?P<holdown_timer_multiplier>\d+)'\
-                        r'(\s+)?\)\s+(?P<state>\w+)\s+(?P<interface>[\w\/\.]+)(\s+(?P<vrf>[\w]+)\s+(?P<type>[\w]+))?$')
+        p1 = regex_engine.compile(r'^(\*)?(?P<our_address>[\w\.\:]+)\s+(?P<our_neighbor>[\w\.\:]+)\s+(?P<ld_rd>\d+\/\d+)\s+'\
+                                  r'(?P<rh_rs>\S+)\s+(?P<holdown_timer>(\d+)?(\w\/\w)?)(\s+)?\((?P<holdown_timer_multiplier>\d+)'\
+                                  r'(\s+)?\)\s+(?P<state>\w+)\s+(?P<interface>[\w\/\.]+)(\s+(?P<vrf>[\w]+)\s+(?P<type>[\w]+))?$')
 
         # Session state is Up and not using echo function
         # Session state is Up and not using echo functioax/avg: 0/1691/46 last: 36 ms ago
-        p2 = re.compile(r'^\s*Session +state +is +(?P<state>\S+) +and +not '\
-                        r'+using +echo +((\w+)?(\/)?(\w+)?(\:)?(\/)?( )?)+')
+        p2 = regex_engine.compile(r'^\s*Session +state +is +(?P<state>\S+) +and +not '\
+                                  r'+using +echo +((\w+)?(\/)?(\w+)?(\:)?(\/)?( )?)+')
 
         # Session state is Up and using echo function with 50 ms interval  
-        p2_1 = re.compile(r'^\s*Session +state +is +(?P<state>\S+) +and +using +echo '\
-                          r'+function +with +(?P<echo>\d+) +ms+ interval')
+        p2_1 = regex_engine.compile(r'^\s*Session +state +is +(?P<state>\S+) +and +using +echo '\
+                                    r'+function +with +(?P<echo>\d+) +ms+ interval')
 
         # Session type: Singlehop
-        p3 = re.compile(r'^\s*Session\s+type:\s+(?P<session_host>\S+)$')
+        p3 = regex_engine.compile(r'^\s*Session\s+type:\s+(?P<session_host>\S+)$')
 
         # Local Diag: 0, Demand mode: 0, Poll bit: 0, Authentication: None
-        p4 = re.compile(r'^\s*Local +Diag: +(?P<local_diag>\d+), +Demand '\
-                        r'+mode: +(?P<demand_mode>\d+), +Poll +bit: +(?P<poll_bit>\d+)(, +Authentication: +(?P<authenticate>[\w]+))?$')
+        p4 = regex_engine.compile(r'^\s*Local +Diag: +(?P<local_diag>\d+), +Demand '\
+                                  r'+mode: +(?P<demand_mode>\d+), +Poll +bit: +(?P<poll_bit>\d+)(, +Authentication: +(?P<authenticate>[\w]+))?$')
 
         # MinTxInt: 50000 us, MinRxInt: 50000 us, Multiplier: 3
-        p5 = re.compile(r'^\s*MinTxInt:\s+(?P<min_tx_interface>\d+) +us,\s+MinRxInt:\s+'\
-                        r'(?P<min_rx_interface>\d+) +us,\s+Multiplier:\s+(?P<multiplier>\d+)$')
+        p5 = regex_engine.compile(r'^\s*MinTxInt:\s+(?P<min_tx_interface>\d+) +us,\s+MinRxInt:\s+'\
+                                  r'(?P<min_rx_interface>\d+) +us,\s+Multiplier:\s+(?P<multiplier>\d+)$')
 
         # Received MinRxInt: 50000 us, Received Multiplier: 3
-        p6 = re.compile(r'^\s*Received +MinRxInt:\s+'\
-                        r'(?P<received_min_rx_interface>\d+) +us,\s+'\
-                        r'Received\s+Multiplier:\s+(?P<received_multiplier>\d+)$')
+        p6 = regex_engine.compile(r'^\s*Received +MinRxInt:\s+'\
+                                  r'(?P<received_min_rx_interface>\d+) +us,\s+'\
+                                  r'Received\s+Multiplier:\s+(?P<received_multiplier>\d+)$')
 
         # Holdown (hits): 0 ms (0), Hello (hits): 50 ms (2703)
-        p7 = re.compile(r'^\s*Hold(d)?own +\(hits\): '\
-                        r'+(?P<holddown>\d+)( ms )?\((?P<holddown_hits>\d+)\), '\
-                        r'+Hello +\(hits\): +(?P<hello>\d+)( ms )?\((?P<hello_hits>\d+)\)$')
+        p7 = regex_engine.compile(r'^\s*Hold(d)?own +\(hits\): '\
+                                  r'+(?P<holddown>\d+)( ms )?\((?P<holddown_hits>\d+)\), '\
+                                  r'+Hello +\(hits\): +(?P<hello>\d+)( ms )?\((?P<hello_hits>\d+)\)$')
 
         # Rx Count: 2703, Rx Interval (ms) min/max/avg: 0/2185/879 last: 129901 ms ago
-        p8 = re.compile(r'^\s*Rx +Count: +(?P<count>\d+), +Rx +'\
-                        r'Interval +\(ms\) +min\/max\/avg: +(?P<min_int_ms>\d+)'\
-                        r'\/(?P<max_int_ms>\d+)\/(?P<avg_int_ms>\d+) +'\
-                        r'last: +(?P<last_ms_ago>\d+) +ms +ago$')
+        p8 = regex_engine.compile(r'^\s*Rx +Count: +(?P<count>\d+), +Rx +'\
+                                  r'Interval +\(ms\) +min\/max\/avg: +(?P<min_int_ms>\d+)'\
+                                  r'\/(?P<max_int_ms>\d+)\/(?P<avg_int_ms>\d+) +'\
+                                  r'last: +(?P<last_ms_ago>\d+) +ms +ago$')
 
         # Tx Count: 2703, Tx Interval (ms) min/max/avg: 0/0/0 last: 0 ms ago
-        p9 = re.compile(r'^\s*Tx +Count: +(?P<count>\d+), +Tx +Interval +'\
-                        r'\(ms\) +min\/max\/avg: +(?P<min_int_ms>\d+)\/(?P<max_int_ms>\d+)'\
-                        r'\/(?P<avg_int_ms>\d+) +last: +(?P<last_ms_ago>\d+) +ms +ago$')
+        p9 = regex_engine.compile(r'^\s*Tx +Count: +(?P<count>\d+), +Tx +Interval +'\
+                                  r'\(ms\) +min\/max\/avg: +(?P<min_int_ms>\d+)\/(?P<max_int_ms>\d+)'\
+                                  r'\/(?P<avg_int_ms>\d+) +last: +(?P<last_ms_ago>\d+) +ms +ago$')
 
         # Registered protocols:  ospf
-        p10 = re.compile(r'^\s*Registered +protocols: +(?P<registered_protocols>[\w]+)$')
+        p10 = regex_engine.compile(r'^\s*Registered +protocols: +(?P<registered_protocols>[\w]+)$')
 
         # Uptime: 0 days 0 hrs 2 mins 11 secs
-        p11 = re.compile(r'^\s*Uptime: +(?P<days>\S+)\s+days\s+(?P<hrs>[\d]+)\s+hrs\s+(?P<mins>[\d]+)\s+mins\s+(?P<secs>[\d]+)\s+secs$')
+        p11 = regex_engine.compile(r'^\s*Uptime: +(?P<days>\S+)\s+days\s+(?P<hrs>[\d]+)\s+hrs\s+(?P<mins>[\d]+)\s+mins\s+(?P<secs>[\d]+)\s+secs$')
 
         # Last packet: Version: 1
-        p12 = re.compile(r'^\s*Last\s+packet:\s+Version:\s+(?P<version>\d+)'\
-                        r'\s+\-\s+Diagnostic:\s+(?P<diagnostic>\d+)$')
+        p12 = regex_engine.compile(r'^\s*Last\s+packet:\s+Version:\s+(?P<version>\d+)'\
+                                  r'\s+\-\s+Diagnostic:\s+(?P<diagnostic>\d+)$')
 
         #              State bit: Up             - Demand bit: 0
-        p13 = re.compile(r'^\s*State +bit: +(?P<state_bit>\S+)\s+\-\s+'\
-                         r'Demand +bit:\s+(?P<demand_bit>\d+)$')
+        p13 = regex_engine.compile(r'^\s*State +bit: +(?P<state_bit>\S+)\s+\-\s+'\
+                                   r'Demand +bit:\s+(?P<demand_bit>\d+)$')
 
         #              Poll bit: 0               - Final bit: 0
-        p14 = re.compile(r'^\s*Poll\s+bit:\s+(?P<poll_bit>\d+)\s+\-\s+'\
-                         r'Final\s+bit:\s+(?P<final_bit>\d+)$')
+        p14 = regex_engine.compile(r'^\s*Poll\s+bit:\s+(?P<poll_bit>\d+)\s+\-\s+'\
+                                   r'Final\s+bit:\s+(?P<final_bit>\d+)$')
 
         #              C bit : 1
-        p15 = re.compile(r'^\s*C +bit: +(?P<c_bit>\d+)$')
+        p15 = regex_engine.compile(r'^\s*C +bit: +(?P<c_bit>\d+)$')
 
         #              Multiplier: 3             - Length: 24
-        p16 = re.compile(r'^\s*Multiplier: +(?P<multiplier>\d+)\s+\-\s+'\
-                         r'Length:\s+(?P<length>\d+)$')
+        p16 = regex_engine.compile(r'^\s*Multiplier: +(?P<multiplier>\d+)\s+\-\s+'\
+                                   r'Length:\s+(?P<length>\d+)$')
 
         #              My Discr.: 1090519041     - Your Discr.: 1090519041
-        p17 = re.compile(r'^\s*My +Discr\.: +(?P<my_discr>\d+)\s+\-\s+'\
-                         r'Your +Discr\.:\s+(?P<your_discr>\d+)')
+        p17 = regex_engine.compile(r'^\s*My +Discr\.: +(?P<my_discr>\d+)\s+\-\s+'\
+                                   r'Your +Discr\.:\s+(?P<your_discr>\d+)')
 
         #              Min tx interval: 50000    - Min rx interval: 50000
-        p18 = re.compile(r'^\s*Min +tx +interval: +(?P<min_tx_interval>\d+)'\
-                         r'\s+\-\s+Min +rx +interval:\s+(?P<min_rx_interval>\d+)$')
+        p18 = regex_engine.compile(r'^\s*Min +tx +interval: +(?P<min_tx_interval>\d+)'\
+                                   r'\s+\-\s+Min +rx +interval:\s+(?P<min_rx_interval>\d+)$')
 
         # Hosting LC: 1, Down reason: None, Reason not-hosted: None, Offloaded: Yes
-        p19 = re.compile(r'^\s*Hosting +LC: +(?P<lc>[\d]+), '\
-                        r'+Down +reason: +(?P<down_reason>[\w ]+), +Reason +not-hosted: '\
-                        r'+(?P<hosted>[\w]+), Offloaded: +(?P<offloaded>[\w]+)$')
+        p19 = regex_engine.compile(r'^\s*Hosting +LC: +(?P<lc>[\d]+), '\
+                                  r'+Down +reason: +(?P<down_reason>[\w ]+), +Reason +not-hosted: '\
+                                  r'+(?P<hosted>[\w]+), Offloaded: +(?P<offloaded>[\w]+)$')
 
         for line in out.splitlines():
             line = line.strip()
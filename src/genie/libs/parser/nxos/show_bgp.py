@@ -34,9 +34,7 @@ NXOS parsers for the following show commands:
 """
 
 # Python
-import re
 from copy import deepcopy
-import xml.etree.ElementTree as ET
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -48,7 +46,10 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 from genie.libs.parser.nxos.show_bgp_vrf import *
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.xml_stream import XmlStream, map_leaves, \
+    xml_bool
 
 
 # =====================================
@@ -189,109 +190,109 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
         # Init vars
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*BGP +Process +ID *: +(?P<bgp_pid>[0-9]+)$')
-        p2 = re.compile(r'^\s*BGP Protocol Started, +reason: *:'
-                            r' +(?P<reason>[a-zA-Z\s]+)$')
-        p2_1 = re.compile(r'^\s*BGP +Performance +Mode: *:'
-                            r' +(?P<performance_mode>[a-zA-Z\s]+)$')
-        p3 = re.compile(r'^\s*BGP +Protocol +Tag *:'
-                            r' +(?P<bgp_tag>[a-zA-Z0-9]+)$')
-        p4 = re.compile(r'^\s*BGP +Protocol +State *:'
-                            r' +(?P<protocol_state>[a-zA-Z\(\)\s]+)$')
-        p4_1 = re.compile(r'^\s*BGP +Isolate +Mode *:'
-                            r' +(?P<isolate_mode>[a-zA-Z\s]+)$')
-        p4_3 = re.compile(r'^\s*BGP +MMODE *:'
-                            r' +(?P<mmode>[a-zA-Z\s]+)$')
-        p5 = re.compile(r'^\s*BGP +Memory +State *:'
-                            r' +(?P<memory_state>[\w\s]+)$')
-        p5_1 = re.compile(r'^\s*BGP +asformat *:'
-                            r' +(?P<asformat>[a-zA-Z\s]+)$')
-        p5_2 = re.compile(r'^\s*Segment +Routing +Global +Block *:'
-                            r' +(?P<segment>[0-9\-]+)$')
-        p6 = re.compile(r'^\s*Number +of +attribute +entries *:'
-                            r' +(?P<num_attr_entries>[0-9]+)$')
-        p7 = re.compile(r'^\s*HWM +of +attribute +entries *:'
-                            r' +(?P<hwm_attr_entries>[0-9]+)$')
-        p8 = re.compile(r'^\s*Bytes +used +by +entries *:'
-                            r' +(?P<bytes_used>[0-9]+)$')
-        p9 = re.compile(r'^\s*Entries +pending +delete *:'
-                            r' +(?P<entries_pending_delete>[0-9]+)$')
-        p10 = re.compile(r'^\s*HWM +of +entries +pending +delete *:'
-                            r' +(?P<hwm_entries_pending_delete>[0-9]+)$')
-        p11 = re.compile(r'^\s*BGP +paths +per +attribute +HWM *:'
-                            r' +(?P<bgp_paths_per_hwm_attr>[0-9]+)$')
-        p12 = re.compile(r'^\s*BGP +AS +path +entries *:'
-                            r' +(?P<bgp_as_path_entries>[0-9]+)$')
-        p13 = re.compile(r'^\s*Bytes +used +by +AS +path +entries *:'
-                            r' +(?P<bytes_used_as_path_entries>[0-9]+)$')
-        p14 = re.compile(r'^\s*BGP +Information +for +VRF'
-                            r' +(?P<vrf_name>(\S+))$')
-        p15 = re.compile(r'^\s*VRF +Id *:'
-                            r' +(?P<vrf_id>[a-zA-Z0-9]+)$')
-        p16 = re.compile(r'^\s*VRF +state *:'
-                            r' +(?P<vrf_state>[a-zA-Z]+)$')
-        p16_1 = re.compile(r'^\s*VNID *:'
-                            r' +(?P<vnid>[a-zA-Z0-9]+)(?: +\((\S+)\))?$')
-        p16_2 = re.compile(r'^\s*Topo +Id *: +(?P<topo_id>(\d+))$')
-        p16_3 = re.compile(r'^\s*Encap +type *: +(?P<etype>(\S+))$')
-        p16_4 = re.compile(r'^\s*VTEP +IP *: +(?P<vtep_ip>(\S+))$')
-        p16_5 = re.compile(r'^\s*VTEP +Virtual +IP *: +(?P<vtep_vip>(\S+))$')
-        p16_6 = re.compile(r'^\s*VTEP +VIP-R *: +(?P<vipr>(\S+))$')
-        p16_7 = re.compile(r'^\s*Router-MAC *: +(?P<router_mac>(\S+))$')
-        p16_8 = re.compile(r'^\s*VIP +Derived +MAC *: +(?P<vipd_mac>(\S+))$')
-        p17 = re.compile(r'^\s*Router-ID *:'
-                            r' +(?P<router_id>[0-9\.]+)$')
-        p18 = re.compile(r'^\s*Configured +Router-ID *:'
-                            r' +(?P<conf_router_id>[0-9\.]+)$')
-        p19 = re.compile(r'^\s*Confed-ID *:'
-                            r' +(?P<confed_id>[0-9]+)$')
-        p20 = re.compile(r'^\s*Cluster-ID *:'
-                            r' +(?P<cluster_id>[0-9\.]+)$')
-        p21 = re.compile(r'^\s*No. +of +configured +peers *:'
-                            r' +(?P<num_conf_peers>[0-9]+)$')
-        p22 = re.compile(r'^\s*No. +of +pending +config +peers *:'
-                            r' +(?P<num_pending_conf_peers>[0-9]+)$')
-        p23 = re.compile(r'^\s*No. +of +established +peers *:'
-                            r' +(?P<num_established_peers>[0-9]+)$')
-        p24 = re.compile(r'^\s*VRF +RD *:'
-                            r' +(?P<vrf_rd>[a-zA-Z0-9\:\.\s]+)$')
-        p24_1 = re.compile(r'^\s*VRF +EVPN +RD *:'
-                            r' +(?P<vrf_evpn_rd>[a-zA-Z0-9\:\.\s]+)$')
-        p25 = re.compile(r'^\s*Information +for +address +family'
-                            r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)'
-                            r' +in +VRF +(?P<vrf>(\S+))$')
-        p26 = re.compile(r'^\s*Table +Id *: +(?P<table_id>(\S+))$')
-        p27 = re.compile(r'^\s*Table +state *: +(?P<table_state>[a-zA-Z]+)$')
-        p28 = re.compile(r'^\s*(?P<peers>[0-9]+) +(?P<active_peers>[0-9]+)'
-                            r' +(?P<routes>[0-9]+) +(?P<paths>[0-9]+)'
-                            r' +(?P<networks>[0-9]+) +(?P<aggregates>[0-9]+)$')
-        p29 = re.compile(r'^\s*(?P<name>[a-zA-Z]+),'
-                            r' +route-map +(?P<route_map>[a-zA-Z0-9\-\_]+)$')
-        p30 = re.compile(r'^\s*(?P<type>(Export|Import|EVPN Export|'
-                            r'EVPN Import|MVPN Export|MVPN Import)) +RT +list'
-                            r' *:(?: +(?P<rt_list>[0-9\:]+))?$')
-        p31 = re.compile(r'^\s*(?P<rt_list>((\w+)\:(\d+))(\s+(\w+)\:(\d+))?)$')
-        p32 = re.compile(r'^\s*Label +mode *: +(?P<label_mode>[a-zA-Z\-]+)$')
-        p32_1 = re.compile(r'^\s*Is +a +Route\-reflector$')
-        p33 = re.compile(r'^\s*Aggregate +label *:'
-                            r' +(?P<aggregate_label>[a-zA-Z0-9\-]+)$')
-        p33_1 = re.compile(r'^\s*Allocate-index *:'
-                           r' +(?P<allocate_index>[a-zA-Z0-9\-]+)$')
-        p34 = re.compile(r'^\s*Import +default +limit *:'
-                            r' +(?P<import_default_prefix_limit>[0-9]+)$')
-        p35 = re.compile(r'^\s*Import +default +prefix +count *:'
-                            r' +(?P<import_default_prefix_count>[0-9]+)$')
-        p36 = re.compile(r'^\s*Import +default +map *:'
-                            r' +(?P<import_default_map>[a-zA-Z0-9\_\-]+)$')
-        p37 = re.compile(r'^\s*Export +default +limit *:'
-                            r' +(?P<export_default_prefix_limit>[0-9]+)$')
-        p38 = re.compile(r'^\s*Export +default +prefix +count *:'
-                            r' +(?P<export_default_prefix_count>[0-9]+)$')
-        p39 = re.compile(r'^\s*Export +default +map *:'
-                            r' +(?P<export_default_map>[a-zA-Z0-9\_\-]+)$')
-        p40 = re.compile(r'^\s*Nexthop +trigger-delay$')
-        p41 = re.compile(r'^\s*critical +(?P<critical>[0-9]+) +ms$')
-        p42 = re.compile(r'^\s*non-critical +(?P<non_critical>[0-9]+) +ms$')
+        p1 = regex_engine.compile(r'^\s*BGP +Process +ID *: +(?P<bgp_pid>[0-9]+)$')
+        p2 = regex_engine.compile(r'^\s*BGP Protocol Started, +reason: *:'
+                                      r' +(?P<reason>[a-zA-Z\s]+)$')
+        p2_1 = regex_engine.compile(r'^\s*BGP +Performance +Mode: *:'
+                                      r' +(?P<performance_mode>[a-zA-Z\s]+)$')
+        p3 = regex_engine.compile(r'^\s*BGP +Protocol +Tag *:'
+                                      r' +(?P<bgp_tag>[a-zA-Z0-9]+)$')
+        p4 = regex_engine.compile(r'^\s*BGP +Protocol +State *:'
+                                      r' +(?P<protocol_state>[a-zA-Z\(\)\s]+)$')
+        p4_1 = regex_engine.compile(r'^\s*BGP +Isolate +Mode *:'
+                                      r' +(?P<isolate_mode>[a-zA-Z\s]+)$')
+        p4_3 = regex_engine.compile(r'^\s*BGP +MMODE *:'
+                                      r' +(?P<mmode>[a-zA-Z\s]+)$')
+        p5 = regex_engine.compile(r'^\s*BGP +Memory +State *:'
+                                      r' +(?P<memory_state>[\w\s]+)$')
+        p5_1 = regex_engine.compile(r'^\s*BGP +asformat *:'
+                                      r' +(?P<asformat>[a-zA-Z\s]+)$')
+        p5_2 = regex_engine.compile(r'^\s*Segment +Routing +Global +Block *:'
+                                      r' +(?P<segment>[0-9\-]+)$')
+        p6 = regex_engine.compile(r'^\s*Number +of +attribute +entries *:'
+                                      r' +(?P<num_attr_entries>[0-9]+)$')
+        p7 = regex_engine.compile(r'^\s*HWM +of +attribute +entries *:'
+                                      r' +(?P<hwm_attr_entries>[0-9]+)$')
+        p8 = regex_engine.compile(r'^\s*Bytes +used +by +entries *:'
+                                      r' +(?P<bytes_used>[0-9]+)$')
+        p9 = regex_engine.compile(r'^\s*Entries +pending +delete *:'
+                                      r' +(?P<entries_pending_delete>[0-9]+)$')
+        p10 = regex_engine.compile(r'^\s*HWM +of +entries +pending +delete *:'
+                                      r' +(?P<hwm_entries_pending_delete>[0-9]+)$')
+        p11 = regex_engine.compile(r'^\s*BGP +paths +per +attribute +HWM *:'
+                                      r' +(?P<bgp_paths_per_hwm_attr>[0-9]+)$')
+        p12 = regex_engine.compile(r'^\s*BGP +AS +path +entries *:'
+                                      r' +(?P<bgp_as_path_entries>[0-9]+)$')
+        p13 = regex_engine.compile(r'^\s*Bytes +used +by +AS +path +entries *:'
+                                      r' +(?P<bytes_used_as_path_entries>[0-9]+)$')
+        p14 = regex_engine.compile(r'^\s*BGP +Information +for +VRF'
+                                      r' +(?P<vrf_name>(\S+))$')
+        p15 = regex_engine.compile(r'^\s*VRF +Id *:'
+                                      r' +(?P<vrf_id>[a-zA-Z0-9]+)$')
+        p16 = regex_engine.compile(r'^\s*VRF +state *:'
+                                      r' +(?P<vrf_state>[a-zA-Z]+)$')
+        p16_1 = regex_engine.compile(r'^\s*VNID *:'
+                                      r' +(?P<vnid>[a-zA-Z0-9]+)(?: +\((\S+)\))?$')
+        p16_2 = regex_engine.compile(r'^\s*Topo +Id *: +(?P<topo_id>(\d+))$')
+        p16_3 = regex_engine.compile(r'^\s*Encap +type *: +(?P<etype>(\S+))$')
+        p16_4 = regex_engine.compile(r'^\s*VTEP +IP *: +(?P<vtep_ip>(\S+))$')
+        p16_5 = regex_engine.compile(r'^\s*VTEP +Virtual +IP *: +(?P<vtep_vip>(\S+))$')
+        p16_6 = regex_engine.compile(r'^\s*VTEP +VIP-R *: +(?P<vipr>(\S+))$')
+        p16_7 = regex_engine.compile(r'^\s*Router-MAC *: +(?P<router_mac>(\S+))$')
+        p16_8 = regex_engine.compile(r'^\s*VIP +Derived +MAC *: +(?P<vipd_mac>(\S+))$')
+        p17 = regex_engine.compile(r'^\s*Router-ID *:'
+                                      r' +(?P<router_id>[0-9\.]+)$')
+        p18 = regex_engine.compile(r'^\s*Configured +Router-ID *:'
+                                      r' +(?P<conf_router_id>[0-9\.]+)$')
+        p19 = regex_engine.compile(r'^\s*Confed-ID *:'
+                                      r' +(?P<confed_id>[0-9]+)$')
+        p20 = regex_engine.compile(r'^\s*Cluster-ID *:'
+                                      r' +(?P<cluster_id>[0-9\.]+)$')
+        p21 = regex_engine.compile(r'^\s*No. +of +configured +peers *:'
+                                      r' +(?P<num_conf_peers>[0-9]+)$')
+        p22 = regex_engine.compile(r'^\s*No. +of +pending +config +peers *:'
+                                      r' +(?P<num_pending_conf_peers>[0-9]+)$')
+        p23 = regex_engine.compile(r'^\s*No. +of +established +peers *:'
+                                      r' +(?P<num_established_peers>[0-9]+)$')
+        p24 = regex_engine.compile(r'^\s*VRF +RD *:'
+                                      r' +(?P<vrf_rd>[a-zA-Z0-9\:\.\s]+)$')
+        p24_1 = regex_engine.compile(r'^\s*VRF +EVPN +RD *:'
+                                      r' +(?P<vrf_evpn_rd>[a-zA-Z0-9\:\.\s]+)$')
+        p25 = regex_engine.compile(r'^\s*Information +for +address +family'
+                                      r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)'
+                                      r' +in +VRF +(?P<vrf>(\S+))$')
+        p26 = regex_engine.compile(r'^\s*Table +Id *: +(?P<table_id>(\S+))$')
+        p27 = regex_engine.compile(r'^\s*Table +state *: +(?P<table_state>[a-zA-Z]+)$')
+        p28 = regex_engine.compile(r'^\s*(?P<peers>[0-9]+) +(?P<active_peers>[0-9]+)'
+                                      r' +(?P<routes>[0-9]+) +(?P<paths>[0-9]+)'
+                                      r' +(?P<networks>[0-9]+) +(?P<aggregates>[0-9]+)$')
+        p29 = regex_engine.compile(r'^\s*(?P<name>[a-zA-Z]+),'
+                                      r' +route-map +(?P<route_map>[a-zA-Z0-9\-\_]+)$')
+        p30 = regex_engine.compile(r'^\s*(?P<type>(Export|Import|EVPN Export|'
+                                      r'EVPN Import|MVPN Export|MVPN Import)) +RT +list'
+                                      r' *:(?: +(?P<rt_list>[0-9\:]+))?$')
+        p31 = regex_engine.compile(r'^\s*(?P<rt_list>((\w+)\:(\d+))(\s+(\w+)\:(\d+))?)$')
+        p32 = regex_engine.compile(r'^\s*Label +mode *: +(?P<label_mode>[a-zA-Z\-]+)$')
+        p32_1 = regex_engine.compile(r'^\s*Is +a +Route\-reflector$')
+        p33 = regex_engine.compile(r'^\s*Aggregate +label *:'
+                                      r' +(?P<aggregate_label>[a-zA-Z0-9\-]+)$')
+        p33_1 = regex_engine.compile(r'^\s*Allocate-index *:'
+                                     r' +(?P<allocate_index>[a-zA-Z0-9\-]+)$')
+        p34 = regex_engine.compile(r'^\s*Import +default +limit *:'
+                                      r' +(?P<import_default_prefix_limit>[0-9]+)$')
+        p35 = regex_engine.compile(r'^\s*Import +default +prefix +count *:'
+                                      r' +(?P<import_default_prefix_count>[0-9]+)$')
+        p36 = regex_engine.compile(r'^\s*Import +default +map *:'
+                                      r' +(?P<import_default_map>[a-zA-Z0-9\_\-]+)$')
+        p37 = regex_engine.compile(r'^\s*Export +default +limit *:'
+                                      r' +(?P<export_default_prefix_limit>[0-9]+)$')
+        p38 = regex_engine.compile(r'^\s*Export +default +prefix +count *:'
+                                      r' +(?P<export_default_prefix_count>[0-9]+)$')
+        p39 = regex_engine.compile(r'^\s*Export +default +map *:'
+                                      r' +(?P<export_default_map>[a-zA-Z0-9\_\-]+)$')
+        p40 = regex_engine.compile(r'^\s*Nexthop +trigger-delay$')
+        p41 = regex_engine.compile(r'^\s*critical +(?P<critical>[0-9]+) +ms$')
+        p42 = regex_engine.compile(r'^\s*non-critical +(?P<non_critical>[0-9]+) +ms$')
 
 
         for line in out.splitlines():
@@ -784,6 +785,66 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
         return parsed_dict
 
+    # __readonly__ leaves
+    xml_process_mapping = {
+        'processid': ('bgp_pid', int),
+        'protocolstartedreason': 'bgp_protocol_started_reason',
+        'protocoltag': 'bgp_tag',
+        'protocolstate': ('bgp_protocol_state', str.lower),
+        'isolatemode': 'bgp_isolate_mode',
+        'mmode': 'bgp_mmode',
+        'memorystate': ('bgp_memory_state', str.lower),
+        'asformat': 'bgp_asformat',
+        'attributeentries': ('num_attr_entries', int),
+        'hwmattributeentries': ('hwm_attr_entries', int),
+        'bytesused': ('bytes_used', int),
+        'entriespendingdelete': ('entries_pending_delete', int),
+        'hwmentriespendingdelete': ('hwm_entries_pending_delete', int),
+        'pathsperattribute': ('bgp_paths_per_hwm_attr', int),
+        'aspathentries': ('bgp_as_path_entries', int),
+        'aspathbytes': ('bytes_used_as_path_entries', int),
+    }
+
+    # ROW_vrf leaves
+    xml_vrf_mapping = {
+        'vrf-id': 'vrf_id',
+        'vrf-state': ('vrf_state', str.lower),
+        'vrf-router-id': 'router_id',
+        'vrf-cfgd-id': 'conf_router_id',
+        'vrf-confed-id': ('confed_id', int),
+        'vrf-cluster-id': 'cluster_id',
+        'vrf-peers': ('num_conf_peers', int),
+        'vrf-pending-peers': ('num_pending_conf_peers', int),
+        'vrf-est-peers': ('num_established_peers', int),
+        'vrf-rd': 'vrf_rd',
+    }
+
+    # ROW_af leaves
+    xml_af_mapping = {
+        'af-state': ('table_state', str.lower),
+        'nexthop-trigger-delay-critical':
+            (('next_hop_trigger_delay', 'critical'), int),
+        'nexthop-trigger-delay-non-critical':
+            (('next_hop_trigger_delay', 'non_critical'), int),
+        'af-aggregate-label': 'aggregate_label',
+        'af-label-mode': 'label_mode',
+        'importdefault_map': 'import_default_map',
+        'importdefault_prefixlimit': ('import_default_prefix_limit', int),
+        'importdefault_prefixcount': ('import_default_prefix_count', int),
+        'exportdefault_map': 'export_default_map',
+        'exportdefault_prefixlimit': ('export_default_prefix_limit', int),
+        'exportdefault_prefixcount': ('export_default_prefix_count', int),
+    }
+
+    # ROW_af leaves, under the af-num-peers key
+    xml_af_peers_mapping = {
+        'af-num-active-peers': ('active_peers', int),
+        'af-peer-routes': ('routes', int),
+        'af-peer-paths': ('paths', int),
+        'af-peer-networks': ('networks', int),
+        'af-peer-aggregates': ('aggregates', int),
+    }
+
     def xml(self, vrf='', output=None):
         if output is None:
             if vrf:
@@ -794,259 +855,96 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             out = output
 
         etree_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        xml_output = ET.fromstring(out)
-
-        for item in xml_output:
-            for data in item:
-                for show in data:
-                    for bgp in show:
-                        for __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf in bgp:
-                            for process in __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf:
-                                for __XML__OPT_Cmd_show_bgp_process_cmd_vrf in process:
-                                    for __XML__OPT_Cmd_show_bgp_process_cmd___readonly__ in __XML__OPT_Cmd_show_bgp_process_cmd_vrf:
-                                        for key in __XML__OPT_Cmd_show_bgp_process_cmd___readonly__:
-                                            # Get key text
-                                            text = key.tag[key.tag.find('}')+1:]
-                                            # bgp_pid
-                                            if text == 'processid':
-                                                etree_dict['bgp_pid'] = int(key.text)
-                                            # bgp_protocol_started_reason
-                                            if text == 'protocolstartedreason':
-                                                etree_dict['bgp_protocol_started_reason'] = key.text
-                                            # bgp_tag
-                                            if text == 'protocoltag':
-                                                etree_dict['bgp_tag'] = key.text
-                                            # bgp_protocol_state
-                                            if text == 'protocolstate':
-                                                etree_dict['bgp_protocol_state'] = str(key.text).lower()
-                                            # bgp_isolate_mode
-                                            if text == 'isolatemode':
-                                                etree_dict['bgp_isolate_mode'] = key.text
-                                            # bgp_mmode
-                                            if text == 'mmode':
-                                                etree_dict['bgp_mmode'] = key.text
-                                            # bgp_memory_state
-                                            if text == 'memorystate':
-                                                etree_dict['bgp_memory_state'] = str(key.text).lower()
-                                            # bgp_performance_mode
-                                            if text == 'forwardingstatesaved':
-                                                if key.text == 'false':
-                                                    etree_dict['bgp_performance_mode'] = 'No'
-                                                else:
-                                                    etree_dict['bgp_performance_mode'] = 'Yes'
-                                            # bgp_asformat
-                                            if text == 'asformat':
-                                                etree_dict['bgp_asformat'] = key.text
-                                            if text == 'srgbmin':
-                                                srgbin = key.text
-                                            if text == 'srgbmax':
-                                                srgmax = key.text
-                                                try:
-                                                    etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
-                                                except Exception:
-                                                    pass
-                                            # num_attr_entries
-                                            if text == 'attributeentries':
-                                                etree_dict['num_attr_entries'] = int(key.text)
-                                            # hwm_attr_entries
-                                            if text == 'hwmattributeentries':
-                                                etree_dict['hwm_attr_entries'] = int(key.text)
-                                            # bytes_used
-                                            if text == 'bytesused':
-                                                etree_dict['bytes_used'] = int(key.text)
-                                            # entries_pending_delete
-                                            if text == 'entriespendingdelete':
-                                                etree_dict['entries_pending_delete'] = int(key.text)
-                                            # hwm_entries_pending_delete
-                                            if text == 'hwmentriespendingdelete':
-                                                etree_dict['hwm_entries_pending_delete'] = int(key.text)
-                                            # bgp_paths_per_hwm_attr
-                                            if text == 'pathsperattribute':
-                                                etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
-                                            # bgp_as_path_entries
-                                            if text == 'aspathentries':
-                                                etree_dict['bgp_as_path_entries'] = int(key.text)
-                                            # bytes_used_as_path_entries
-                                            if text == 'aspathbytes':
-                                                etree_dict['bytes_used_as_path_entries'] = int(key.text)
-                                            
-                                            if text == 'TABLE_vrf':
-                                                for table_vrf in key:
-                                                    for row_vrf in table_vrf:
-                                                        vrf_tag = row_vrf.tag[row_vrf.tag.find('}')+1:]
-
-                                                        # vrf
-                                                        #   vrf_name
-                                                        if vrf_tag == 'vrf-name-out':
-                                                            vrf_name = row_vrf.text
-                                                            if 'vrf' not in etree_dict:
-                                                                etree_dict['vrf'] = {}
-                                                            if vrf_name not in etree_dict['vrf']:
-                                                                etree_dict['vrf'][vrf_name] = {}
-                                                                vrf_dict = etree_dict['vrf'][vrf_name]
-                                                        # vrf_id
-                                                        if vrf_tag == 'vrf-id':
-                                                            vrf_dict['vrf_id'] = row_vrf.text
-                                                        # vrf_state
-                                                        if vrf_tag == 'vrf-state':
-                                                            vrf_dict['vrf_state'] = str(row_vrf.text).lower()
-                                                        # router_id
-                                                        if vrf_tag == 'vrf-router-id':
-                                                            vrf_dict['router_id'] = row_vrf.text
-                                                        # conf_router_id
-                                                        if vrf_tag == 'vrf-cfgd-id':
-                                                            vrf_dict['conf_router_id'] = row_vrf.text
-                                                        # confed_id
-                                                        if vrf_tag == 'vrf-confed-id':
-                                                            vrf_dict['confed_id'] = int(row_vrf.text)
-                                                        # cluster_id
-                                                        if vrf_tag == 'vrf-cluster-id':
-                                                           vrf_dict['cluster_id'] = row_vrf.text
-                                                        # num_conf_peers
-                                                        if vrf_tag == 'vrf-peers':
-                                                            vrf_dict['num_conf_peers'] = int(row_vrf.text)
-                                                        # num_pending_conf_peers
-                                                        if vrf_tag == 'vrf-pending-peers':
-                                                            vrf_dict['num_pending_conf_peers'] = int(row_vrf.text)
-                                                        # num_established_peers
-                                                        if vrf_tag == 'vrf-est-peers':
-                                                            vrf_dict['num_established_peers'] = int(row_vrf.text)
-                                                            vrf_dict['vrf_rd'] = 'not configured'
-                                                        # vrf_rd
-                                                        if vrf_tag == 'vrf-rd':
-                                                            vrf_dict['vrf_rd'] = row_vrf.text
-
-                                                        if vrf_tag == 'TABLE_af':
-                                                            for table_af in row_vrf:
-                                                                for row_af in table_af:
-                                                                    af_tag = row_af.tag[row_af.tag.find('}')+1:]
-
-                                                                    # address_family
-                                                                    #   address_family_name
-                                                                    if af_tag == 'af-name':
-                                                                        address_family_name = str(row_af.text).lower()
-                                                                        if 'address_family' not in etree_dict['vrf'][vrf_name]:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'] = {}
-                                                                        if address_family_name not in etree_dict['vrf'][vrf_name]['address_family']:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'][address_family_name] = {}
-                                                                            af_dict = etree_dict['vrf'][vrf_name]['address_family'][address_family_name]
-                                                                        # Initialize empty lists
-                                                                        export_rt_list = ''
-                                                                        import_rt_list = ''
-                                                                    # table_id
-                                                                    if af_tag == 'af-table-id':
-                                                                        table_id = str(row_af.text)
-                                                                        if '0x' in table_id:
-                                                                            af_dict['table_id'] = table_id
-                                                                        else:
-                                                                            af_dict['table_id'] = '0x' + table_id
-                                                                    # table_state
-                                                                    if af_tag == 'af-state':
-                                                                        af_dict['table_state'] = str(row_af.text).lower()
-                                                                    # peers
-                                                                    if af_tag == 'af-num-peers':
-                                                                        peers = int(row_af.text)
-                                                                        if 'peers' not in af_dict:
-                                                                            af_dict['peers'] = {}
-                                                                        if peers not in af_dict['peers']:
-                                                                            af_dict['peers'][peers] = {}
-                                                                    # active_peers
-                                                                    if af_tag == 'af-num-active-peers':
-                                                                        af_dict['peers'][peers]['active_peers'] = int(row_af.text)
-                                                                    # routes
-                                                                    if af_tag == 'af-peer-routes':
-                                                                        af_dict['peers'][peers]['routes'] = int(row_af.text)
-                                                                    # paths
-                                                                    if af_tag == 'af-peer-paths':
-                                                                        af_dict['peers'][peers]['paths'] = int(row_af.text)
-                                                                    # networks
-                                                                    if af_tag == 'af-peer-networks':
-                                                                        af_dict['peers'][peers]['networks'] = int(row_af.text)
-                                                                    # aggregates
-                                                                    if af_tag == 'af-peer-aggregates':
-                                                                        af_dict['peers'][peers]['aggregates'] = int(row_af.text)
-                                                                    # route_reflector
-                                                                    if af_tag == 'af-rr':
-                                                                        if row_af.text == 'true':
-                                                                            af_dict['route_reflector'] = True
-                                                                    # next_hop_trigger_delay
-                                                                    #   critical
-                                                                    if af_tag == 'nexthop-trigger-delay-critical':
-                                                                        if 'next_hop_trigger_delay' not in af_dict:
-                                                                            af_dict['next_hop_trigger_delay'] = {}
-                                                                        af_dict['next_hop_trigger_delay']['critical'] = int(row_af.text)
-                                                                    # next_hop_trigger_delay
-                                                                    #   non_critical
-                                                                    if af_tag == 'nexthop-trigger-delay-non-critical':
-                                                                        af_dict['next_hop_trigger_delay']['non_critical'] = int(row_af.text)
-                                                                    # aggregate_label
-                                                                    if af_tag == 'af-aggregate-label':
-                                                                        af_dict['aggregate_label'] = row_af.text
-                                                                    # label_mode
-                                                                    if af_tag == 'af-label-mode':
-                                                                        af_dict['label_mode'] = row_af.text
-                                                                    # import_default_map
-                                                                    if af_tag == 'importdefault_map':
-                                                                        af_dict['import_default_map'] = row_af.text
-                                                                    # import_default_prefix_limit
-                                                                    if af_tag == 'importdefault_prefixlimit':
-                                                                        af_dict['import_default_prefix_limit'] = int(row_af.text)
-                                                                    # import_default_prefix_count
-                                                                    if af_tag == 'importdefault_prefixcount':
-                                                                        af_dict['import_default_prefix_count'] = int(row_af.text)
-                                                                    # export_default_map
-                                                                    if af_tag == 'exportdefault_map':
-                                                                        af_dict['export_default_map'] = row_af.text
-                                                                    # export_default_prefix_limit
-                                                                    if af_tag == 'exportdefault_prefixlimit':
-                                                                        af_dict['export_default_prefix_limit'] = int(row_af.text)
-                                                                    # export_default_prefix_count
-                                                                    if af_tag == 'exportdefault_prefixcount':
-                                                                        af_dict['export_default_prefix_count'] = int(row_af.text)
-
-                                                                    # TABLE_redist
-                                                                    #   ROW_redist
-                                                                    if af_tag == 'TABLE_redist':
-                                                                        for table_redist in row_af:
-                                                                            for row_redist in table_redist:
-                                                                                row_redist_tag = row_redist.tag[row_redist.tag.find('}')+1:]
-                                                                                # protocol
-                                                                                if row_redist_tag == 'protocol':
-                                                                                    protocol = row_redist.text
-                                                                                    if 'redistribution' not in af_dict:
-                                                                                        af_dict['redistribution'] = {}
-                                                                                    if protocol not in af_dict['redistribution']:
-                                                                                        af_dict['redistribution'][protocol] = {}
-                                                                                # route_map
-                                                                                if row_redist_tag == 'route-map':
-                                                                                    af_dict['redistribution'][protocol]['route_map'] = row_redist.text
-
-                                                                    # TABLE_evpn_export_rt
-                                                                    #   ROW_evpn_export_rt
-                                                                    if af_tag == 'TABLE_evpn_export_rt':
-                                                                        for table_evpn_export in row_af:
-                                                                            for row_export in table_evpn_export:
-                                                                                row_export_tag = row_export.tag[row_export.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_export_tag == 'evpn-export-rt':
-                                                                                    export_rt_list = str(export_rt_list + ' ' + row_export.text).strip()
-                                                                                    af_dict['export_rt_list'] = export_rt_list
-                                                                    # TABLE_evpn_import_rt
-                                                                    #   ROW_evpn_import_rt
-                                                                    if af_tag == 'TABLE_evpn_import_rt':
-                                                                        for table_evpn_import in row_af:
-                                                                            for row_import in table_evpn_import:
-                                                                                row_import_tag = row_import.tag[row_import.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_import_tag == 'evpn-import-rt':
-                                                                                    import_rt_list = str(import_rt_list + ' ' + row_import.text).strip()
-                                                                                    af_dict['import_rt_list'] = import_rt_list
-
-                                                                    # parsed all tags
-                                                                    continue
-                                                                                    
+
+        def get_vrf_dict(vrf_leaves):
+            return etree_dict.setdefault('vrf', {}).\
+                setdefault(vrf_leaves['vrf-name-out'], {})
+
+        def get_af_dict(vrf_leaves, af_leaves):
+            return get_vrf_dict(vrf_leaves).\
+                setdefault('address_family', {}).\
+                setdefault(af_leaves['af-name'].lower(), {})
+
+        stream = XmlStream(out, records=[
+            '__readonly__', 'ROW_vrf', 'ROW_af', 'ROW_redist',
+            'ROW_evpn_export_rt', 'ROW_evpn_import_rt'])
+        for record, leaves, parents in stream:
+
+            # TABLE_redist
+            #   ROW_redist
+            # TABLE_evpn_export_rt
+            #   ROW_evpn_export_rt
+            # TABLE_evpn_import_rt
+            #   ROW_evpn_import_rt
+            if record in ('ROW_redist', 'ROW_evpn_export_rt',
+                          'ROW_evpn_import_rt'):
+                vrf_leaves, af_leaves = parents[-2], parents[-1]
+                if not vrf_leaves.get('vrf-name-out') or \
+                        not af_leaves.get('af-name'):
+                    continue
+                af_dict = get_af_dict(vrf_leaves, af_leaves)
+
+                if record == 'ROW_redist':
+                    protocol = leaves.get('protocol')
+                    if protocol:
+                        map_leaves(leaves, {'route-map': 'route_map'},
+                                   af_dict.setdefault('redistribution', {}).\
+                                   setdefault(protocol, {}))
+                elif record == 'ROW_evpn_export_rt':
+                    if leaves.get('evpn-export-rt'):
+                        af_dict['export_rt_list'] = ' '.join(filter(None, [
+                            af_dict.get('export_rt_list'),
+                            leaves['evpn-export-rt']]))
+                elif leaves.get('evpn-import-rt'):
+                    af_dict['import_rt_list'] = ' '.join(filter(None, [
+                        af_dict.get('import_rt_list'),
+                        leaves['evpn-import-rt']]))
+
+            # address_family
+            #   address_family_name
+            elif record == 'ROW_af':
+                if not parents[-1].get('vrf-name-out') or \
+                        not leaves.get('af-name'):
+                    continue
+                af_dict = get_af_dict(parents[-1], leaves)
+                map_leaves(leaves, self.xml_af_mapping, af_dict)
+
+                # table_id
+                table_id = leaves.get('af-table-id')
+                if table_id:
+                    af_dict['table_id'] = table_id if '0x' in table_id \
+                        else '0x' + table_id
+                # peers
+                if leaves.get('af-num-peers'):
+                    map_leaves(leaves, self.xml_af_peers_mapping,
+                               af_dict.setdefault('peers', {}).setdefault(
+                                   int(leaves['af-num-peers']), {}))
+                # route_reflector
+                if leaves.get('af-rr') == 'true':
+                    af_dict['route_reflector'] = True
+
+            # vrf
+            #   vrf_name
+            elif record == 'ROW_vrf':
+                if not leaves.get('vrf-name-out'):
+                    continue
+                vrf_dict = get_vrf_dict(leaves)
+                if 'vrf-est-peers' in leaves:
+                    vrf_dict['vrf_rd'] = 'not configured'
+                map_leaves(leaves, self.xml_vrf_mapping, vrf_dict)
+
+            elif record == '__readonly__':
+                map_leaves(leaves, self.xml_process_mapping, etree_dict)
+
+                # bgp_performance_mode
+                if 'forwardingstatesaved' in leaves:
+                    etree_dict['bgp_performance_mode'] = 'No' \
+                        if leaves['forwardingstatesaved'] == 'false' else 'Yes'
+                # segment_routing_global_block
+                if leaves.get('srgbmin') and leaves.get('srgbmax'):
+                    etree_dict['segment_routing_global_block'] = \
+                        leaves['srgbmin'] + '-' + leaves['srgbmax']
+
         return etree_dict
 
     def yang(self, vrf=''):
@@ -1138,27 +1036,27 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
         peer_sessions = []
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*template +peer-session '
-                    r'+(?P<session_name>[a-zA-Z\-\_0-9]+)$')
-        r1 = re.compile(r'^\s*Shutdown$')
-        r2 = re.compile(r'^\s*Update +Source +-'
-                    r' +(?P<update_source>[a-zA-Z0-9\:\s]+)$')
-        r3 = re.compile(r'^\s*Description +- +description *:'
-                    r' +(?P<desc>[a-zA-Z\-]+)$')
-        r4 = re.compile(r'^\s*Password$')
-        r5 = re.compile(r'^\s*EBGP +Multihop +- +hop +limit *:'
-                    r' +(?P<ebgp_multihop_limit>[0-9]+)$')
-        r6 = re.compile(r'^\s*Disable +Connectivity +Check$')
-        r7 = re.compile(r'^\s*Suppress +Capabilities$')
-        r8 = re.compile(r'^\s*Passive Only$')
-        r9 = re.compile(r'^\s*Timers +- +hold +time *:'
-                    r' +(?P<holdtime>[0-9]+), keepalive *:'
-                    r' +(?P<keepalive>[0-9]+)$')
-        r10 = re.compile(r'^\s*Remote AS$')
-        r11 = re.compile(r'^\s*Local AS$')
-        r12 = re.compile(r'^\s*Enable Bfd$')
-        r13 = re.compile(r'^\s*VRF +default *:'
-                    r' +(?P<vrf_default>[0-9\.]+)$')
+        p1 = regex_engine.compile(r'^\s*template +peer-session '
+                              r'+(?P<session_name>[a-zA-Z\-\_0-9]+)$')
+        r1 = regex_engine.compile(r'^\s*Shutdown$')
+        r2 = regex_engine.compile(r'^\s*Update +Source +-'
+                              r' +(?P<update_source>[a-zA-Z0-9\:\s]+)$')
+        r3 = regex_engine.compile(r'^\s*Description +- +description *:'
+                              r' +(?P<desc>[a-zA-Z\-]+)$')
+        r4 = regex_engine.compile(r'^\s*Password$')
+        r5 = regex_engine.compile(r'^\s*EBGP +Multihop +- +hop +limit *:'
+                              r' +(?P<ebgp_multihop_limit>[0-9]+)$')
+        r6 = regex_engine.compile(r'^\s*Disable +Connectivity +Check$')
+        r7 = regex_engine.compile(r'^\s*Suppress +Capabilities$')
+        r8 = regex_engine.compile(r'^\s*Passive Only$')
+        r9 = regex_engine.compile(r'^\s*Timers +- +hold +time *:'
+                              r' +(?P<holdtime>[0-9]+), keepalive *:'
+                              r' +(?P<keepalive>[0-9]+)$')
+        r10 = regex_engine.compile(r'^\s*Remote AS$')
+        r11 = regex_engine.compile(r'^\s*Local AS$')
+        r12 = regex_engine.compile(r'^\s*Enable Bfd$')
+        r13 = regex_engine.compile(r'^\s*VRF +default *:'
+                              r' +(?P<vrf_default>[0-9\.]+)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -1329,26 +1227,26 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
         policy_names = []
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*template +peer-policy'
-                    r' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
-        r1 = re.compile(r'^\s*Send +Community$')
-        r2 = re.compile(r'^\s*Send +Ext-community$')
-        r3 = re.compile(r'^\s*Route +Reflector +Client$')
-        r4 = re.compile(r'^\s*Route-map +Inbound +- +policy-name *:'
-                            r' +(?P<inbound_name>[a-zA-Z\-]+)$')
-        r5 = re.compile(r'^\s*Route-map +Outbound +- +policy-name *:'
-                            r' +(?P<outbound_name>[a-zA-Z\-]+)$')
-        r6 = re.compile(r'^\s*Maximum +Prefixes +- +prefix +limit *:'
-                            r' +(?P<max_prefix_no>[0-9]+)$')
-        r7 = re.compile(r'^\s*Default +Originate(?: +- +route-map *:'
-                            r' +(?P<route_map>[a-zA-Z]+))?$')
-        r8 = re.compile(r'^\s*Soft-Reconfig$')
-        r9 = re.compile(r'^\s*Site-of-origin$')
-        r10 = re.compile(r'^\s*Allowas-in$')
-        r11 = re.compile(r'^\s*AS-override$')
-        r12 = re.compile(r'^\s*VRF +default *:'
-                            r' +(?P<vrf_default>[0-9\.]+)$')
-        r13 = re.compile(r'^\s*Nexthop +Self$')
+        p1 = regex_engine.compile(r'^\s*template +peer-policy'
+                              r' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
+        r1 = regex_engine.compile(r'^\s*Send +Community$')
+        r2 = regex_engine.compile(r'^\s*Send +Ext-community$')
+        r3 = regex_engine.compile(r'^\s*Route +Reflector +Client$')
+        r4 = regex_engine.compile(r'^\s*Route-map +Inbound +- +policy-name *:'
+                                      r' +(?P<inbound_name>[a-zA-Z\-]+)$')
+        r5 = regex_engine.compile(r'^\s*Route-map +Outbound +- +policy-name *:'
+                                      r' +(?P<outbound_name>[a-zA-Z\-]+)$')
+        r6 = regex_engine.compile(r'^\s*Maximum +Prefixes +- +prefix +limit *:'
+                                      r' +(?P<max_prefix_no>[0-9]+)$')
+        r7 = regex_engine.compile(r'^\s*Default +Originate(?: +- +route-map *:'
+                                      r' +(?P<route_map>[a-zA-Z]+))?$')
+        r8 = regex_engine.compile(r'^\s*Soft-Reconfig$')
+        r9 = regex_engine.compile(r'^\s*Site-of-origin$')
+        r10 = regex_engine.compile(r'^\s*Allowas-in$')
+        r11 = regex_engine.compile(r'^\s*AS-override$')
+        r12 = regex_engine.compile(r'^\s*VRF +default *:'
+                                      r' +(?P<vrf_default>[0-9\.]+)$')
+        r13 = regex_engine.compile(r'^\s*Nexthop +Self$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -1515,32 +1413,32 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
         else:
             out = output
 
-        p0 = re.compile(r'^\s*template +peer'
-                        r' +(?P<peer_template>[a-zA-Z0-9\-\_]+)$')
-        p1 = re.compile(r'^\s*Remote +AS +(?P<remote_as>[0-9]+)$')
-        p2 = re.compile(r'^\s*Inherits +session +configuration'
-                            r' +from session-template'
-                            r' +(?P<inherit_template>(\S+))$')
-        p3 = re.compile(r'^\s*Description *: +(?P<desc>(\S+))$')
-        p4 = re.compile(r'^\s*Using +(?P<update_source>(\S+)) +as'
-                            r' +update +source +for +this +peer$')
-        p5 = re.compile(r'^\s*Connected check is disabled$')
-        p6 = re.compile(r'^\s*BFD live-detection +is +configured$')
-        p7 = re.compile(r'^\s*External +BGP +peer +might +be +upto'
-                            r' +(?P<num_hops_bgp_peer>[0-9]+) +hops'
-                            r' +away$')
-        p8 = re.compile(r'^\s*TCP +MD5 +authentication +is'
-                            r' +(?P<tcp_md5_auth>(\S+))$')
-        p9 = re.compile(r'^\s*Only +passive +connection +setup'
-                            r' +allowed$')
-        p10 = re.compile(r'^\s*Neighbor +local-as +command'
-                            r' +(?P<nbr_local_as_cmd>(\S+))$')
-        p11 = re.compile(r'^\s*Private +AS +numbers +removed +from'
-                            r' +updates +sent +to +this +neighbor$')
-        p12 = re.compile(r'^\s*Hold +time += +(?P<holdtime>[0-9]+),'
-                            r' +keepalive +interval +is'
-                            r' +(?P<keepalive_interval>[0-9]+)'
-                            r' +seconds$')
+        p0 = regex_engine.compile(r'^\s*template +peer'
+                                  r' +(?P<peer_template>[a-zA-Z0-9\-\_]+)$')
+        p1 = regex_engine.compile(r'^\s*Remote +AS +(?P<remote_as>[0-9]+)$')
+        p2 = regex_engine.compile(r'^\s*Inherits +session +configuration'
+                                      r' +from session-template'
+                                      r' +(?P<inherit_template>(\S+))$')
+        p3 = regex_engine.compile(r'^\s*Description *: +(?P<desc>(\S+))$')
+        p4 = regex_engine.compile(r'^\s*Using +(?P<update_source>(\S+)) +as'
+                                      r' +update +source +for +this +peer$')
+        p5 = regex_engine.compile(r'^\s*Connected check is disabled$')
+        p6 = regex_engine.compile(r'^\s*BFD live-detection +is +configured$')
+        p7 = regex_engine.compile(r'^\s*External +BGP +peer +might +be +upto'
+                                      r' +(?P<num_hops_bgp_peer>[0-9]+) +hops'
+                                      r' +away$')
+        p8 = regex_engine.compile(r'^\s*TCP +MD5 +authentication +is'
+                                      r' +(?P<tcp_md5_auth>(\S+))$')
+        p9 = regex_engine.compile(r'^\s*Only +passive +connection +setup'
+                                      r' +allowed$')
+        p10 = regex_engine.compile(r'^\s*Neighbor +local-as +command'
+                                      r' +(?P<nbr_local_as_cmd>(\S+))$')
+        p11 = regex_engine.compile(r'^\s*Private +AS +numbers +removed +from'
+                                      r' +updates +sent +to +this +neighbor$')
+        p12 = regex_engine.compile(r'^\s*Hold +time += +(?P<holdtime>[0-9]+),'
+                                      r' +keepalive +interval +is'
+                                      r' +(?P<keepalive_interval>[0-9]+)'
+                                      r' +seconds$')
                                     
         # Init vars
         peer_templates = []
@@ -1920,125 +1818,125 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
         else:
             out = output
 
-        p1 = re.compile(r'^\s*router +bgp +(?P<bgp_id>[0-9]+)$')
-        p2 = re.compile(r'^\s*shutdown$')
-        p2_1 = re.compile(r'^\s*evpn$')
-        p2_2 = re.compile(r'^\s*vni +(?P<evpn_vni>\d+) +l2$')
-        p2_3 = re.compile(r'^\s*rd +(?P<rd>[\w]+)$')
-        p2_4 = re.compile(r'^\s*route-target +(?P<evpn_vni_rt_type>[\w]+) +(?P<evpn_vni_rt>[\w\s]+)$')
-        p3 = re.compile(r'^\s*vrf +(?P<vrf>[\w\-]+)$')
-        p3_1 = re.compile(r'^\s*rd +(?P<rd>[\w]+)$')
-        p4 = re.compile(r'^\s*bestpath +(?P<best_path>[a-z\-\s]+)$')
-        p5 = re.compile(r'^\s*cluster-id +(?P<cluster_id>[0-9\.]+)$')
-        p6 = re.compile(r'^\s*confederation +identifier +(?P<confederation_identifier>[0-9]+)$')
-        p7 = re.compile(r'^\s*confederation +peers +(?P<confederation_peers_as>[0-9]+)$')
-        p8 = re.compile(r'^\s*no graceful-restart$')
-        p9 = re.compile(r'^\s*graceful-restart'
-                    r' +(?P<graceful_restart_type>[a-z\-]+)'
-                    r' +(?P<time>[0-9]+)$')
-        p10 = re.compile(r'^\s*log-neighbor-changes$')
-        p11 = re.compile(r'^\s*router-id +(?P<router_id>[0-9\.]+)$')
-        p12 = re.compile(r'^\s*timers +bgp +(?P<keepalive_interval>[0-9]+)'
-                    r' +(?P<holdtime>[0-9]+)$')
-        p13 = re.compile(r'^\s*no enforce-first-as$')
-        p14 = re.compile(r'^\s*no fast-external-fallover$')
-        p15 = re.compile(r'^\s*dynamic-med-interval +(?P<dynamic_med_interval>[0-9]+)$')
-        p16 = re.compile(r'^\s*flush-routes$')
-        p17 = re.compile(r'^\s*isolate$')
-        p18 = re.compile(r'^\s*disable-policy-batching ipv4 prefix-list +(?P<disable_policy_batching_ipv4>[a-zA-Z0-9]+)$')
-        p19 = re.compile(r'^\s*disable-policy-batching ipv6 prefix-list +(?P<disable_policy_batching_ipv6>[a-zA-Z0-9]+)$')
-        p20 = re.compile(r'^\s*address-family +(?P<af_name>[a-z0-9\-\s]+)$')
-        p21_1 = re.compile(r'^\s*route-target +(?P<af_evpn_vni_rt_type>[\w]+) +(?P<af_evpn_vni_rt>[\w\s]+)$')
-        p21 = re.compile(r'^\s*dampening '
-                        r'+(?P<af_dampening_half_life_time>[0-9]+) '
-                        r'+(?P<af_dampening_reuse_time>[0-9]+) '
-                        r'+(?P<af_dampening_suppress_time>[0-9]+) '
-                        r'+(?P<af_dampening_max_suppress_time>[0-9]+)$')
-        p22 = re.compile(r'^\s*dampening +route-map +(?P<af_dampening_route_map>[A-Z0-9\-\_]+)$')
-        p23 = re.compile(r'^\s*nexthop +route-map +(?P<af_nexthop_route_map>[A-Za-z0-9\-\_]+)$')
-        p24 = re.compile(r'^\s*nexthop +trigger-delay +critical +(?P<af_nexthop_trigger_delay_critical>[0-9]+) +non-critical +(?P<af_nexthop_trigger_delay_non_critical>[0-9]+)$')
-        p25 = re.compile(r'^\s*no nexthop trigger-delay$')
-        p26 = re.compile(r'^\s*no client-to-client reflection$')
-        p27 = re.compile(r'^\s*distance +(?P<af_distance_extern_as>[0-9]+) +(?P<af_distance_internal_as>[0-9]+) +(?P<af_distance_local>[0-9]+)$')
-        p28 = re.compile(r'^\s*maximum-paths( +(?P<af_maximum_paths_type>[a-z]+))? +(?P<af_maximum_paths_value>[0-9]+)$')
-        p28_1 = re.compile(r'additional-paths send')
-        p28_2 = re.compile(r'additional-paths receive')
-        p28_3 = re.compile(r'default-information originate')
-        p29 = re.compile(r'^\s*maximum-paths +eibgp +(?P<af_maximum_paths_eibgp>[0-9]+)$')
-        p30 = re.compile(r'^\s*aggregate-address +(?P<af_aggregate_address_address>[a-z0-9\.\:]+)(\/(?P<af_aggregate_address_ipv4_mask>[0-9]+))?( +(?P<extra_line>[a-z\-\s]+))?$')
-        p31 = re.compile(r'^\s*network +(?P<af_network_number>[0-9\.\:]+)( +mask +(?P<af_network_mask>[0-9\.]+))?( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
-        p32 = re.compile(r'^\s*network +(?P<af_network_number>[0-9\.]+)\/(?P<af_network_mask>[0-9]+)( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
-        p33 = re.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
-        p34 = re.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
-        p35 = re.compile(r'^\s*redistribute +(ospf|ospfv3) +(?P<af_redist_ospf>[0-9]+) +route-map +(?P<af_redist_ospf_route_policy>[A-Za-z0-9\-\_]+)$')
-        p36 = re.compile(r'^\s*redistribute +rip +(?P<af_redist_rip>[0-9]+) +route-map +(?P<af_redist_rip_route_policy>[A-Za-z0-9\-\_]+)$')
-        p37 = re.compile(r'^\s*redistribute +static +route-map +(?P<af_redist_static_route_policy>[A-Za-z0-9\-\_]+)$')
-        p38 = re.compile(r'^\s*redistribute +direct +route-map +(?P<af_redist_connected_route_policy>[A-Za-z0-9\-\_]+)$')
-        p39 = re.compile(r'^\s*allocate-label all$')
-        p40 = re.compile(r'^\s*retain route-target all$')
-        p41 = re.compile(r'^\s*label-allocation-mode +(?P<per_vrf>[A-Za-z0-9]+)$')
-        p103 = re.compile(r'^\s*advertise-pip$')
-        p42 = re.compile(r'^\s*neighbor +(?P<neighbor_id>[a-z0-9\.\:]+)$')
-        p43 = re.compile(r'^\s*bfd$')
-        p44 = re.compile(r'^\s*capability suppress 4-byte-as$')
-        p45 = re.compile(r'^\s*description +(?P<nbr_description>.+)$')
-        p46 = re.compile(r'^\s*disable-connected-check$')
-        p47 = re.compile(r'^\s*ebgp-multihop +(?P<nbr_ebgp_multihop_max_hop>[0-9]+)$')
-        p48 = re.compile(r'^\s*inherit peer-session +(?P<nbr_inherit_peer_session>[A-Za-z0-9\-]+)$')
-        p49 = re.compile(r'^\s*local-as +(?P<nbr_local_as_as_no>[0-9\.]+)( +(?P<no_prepend>no-prepend)( +(?P<replace_as>replace-as)( +(?P<dual_as>dual-as))?)?)?$')
-        p50 = re.compile(r'^\s*remote-as +(?P<nbr_remote_as>[0-9]+)$')
-        p51 = re.compile(r'^\s*remove-private-as$')
-        p52 = re.compile(r'^\s*shutdown$')
-        p53 = re.compile(r'^\s*timers +(?P<nbr_keepalive_interval>[0-9]+) +(?P<nbr_holdtime>[0-9]+)$')
-        p54 = re.compile(r'^\s*update-source +(?P<nbr_update_source>[A-Za-z0-9\/\.]+)$')
-        p55 = re.compile(r'^\s*password +(?P<nbr_password_text>.*)$')
-        p56 = re.compile(r'^\s*transport connection-mode +(?P<nbr_transport_connection_mode>[a-z]+)$')
-        p101 = re.compile(r'^\s*peer-type +(?P<nbr_peer_type>[\w\-]+)$')
-        p104 = re.compile(r'^\s*inherit peer +(?P<nbr_inherit_peer>\S+)$')
-        p57 = re.compile(r'^\s*address-family +(?P<nbr_af_name>[A-Za-z0-9\s\-]+)$')
-        p58 = re.compile(r'^\s*allowas-in( +(?P<nbr_af_allowas_in_as_number>[0-9]+))?$')
-        p59 = re.compile(r'^\s*inherit peer-policy +(?P<nbr_af_inherit_peer_policy>[A-Za-z0-9\-]+) +(?P<nbr_af_inherit_peer_seq>[0-9]+)$')
-        p60 = re.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
-        p61 = re.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +(?P<nbr_af_maximum_prefix_warning_only>warning-only))?$')
-        p62 = re.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_in>.*) in$')
-        p63 = re.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_out>.*) out$')
-        p64 = re.compile(r'^\s*route-reflector-client$')
-        p65 = re.compile(r'^\s*send-community$')
-        p66 = re.compile(r'^\s*send-community +extended$')
-        p100 = re.compile(r'^\s*rewrite-evpn-rt-asn$')
-        p67 = re.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
-        p68 = re.compile(r'^\s*next-hop-self$')
-        p69 = re.compile(r'^\s*as-override$')
-        p70 = re.compile(r'^\s*default-originate( +route-map +(?P<nbr_af_default_originate_route_map>.*))?$')
-        p71 = re.compile(r'^\s*soo +(?P<nbr_af_soo>.*)$')
-        p72 = re.compile(r'^\s*template peer-session +(?P<ps_name>.*)$')
-        p73 = re.compile(r'^\s*bfd$')
-        p74 = re.compile(r'^\s*bfd$')
-        p75 = re.compile(r'^\s*description +(?P<ps_description>.*)$')
-        p76 = re.compile(r'^\s*disable-connected-check$')
-        p77 = re.compile(r'^\s*ebgp-multihop +(?P<ps_ebgp_multihop_max_hop>[0-9]+)$$')
-        p78 = re.compile(r'^\s*local-as +(?P<ps_local_as_as_no>[0-9\.]+)( +no-prepend( +replace-as( +dual-as)?)?)?$')
-        p79 = re.compile(r'^\s*password +(?P<ps_password_text>.*)$')
-        p80 = re.compile(r'^\s*remote-as +(?P<ps_remote_as>[0-9]+)$')
-        p81 = re.compile(r'^\s*shutdown$')
-        p82 = re.compile(r'^\s*timers +(?P<ps_keepalive_interval>[0-9]+) +(?P<ps_hodltime>[0-9]+)$')
-        p83 = re.compile(r'^\s*transport connection-mode +(?P<ps_transport_connection_mode>[a-z]+)$')
-        p84 = re.compile(r'^\s*update-source +(?P<ps_update_source>[A-Za-z0-9\/\.]+)$')
-        p85 = re.compile(r'^\s*template peer-policy +(?P<pp_name>.*)$')
-        p86 = re.compile(r'^\s*allowas-in( +(?P<pp_allowas_in_as_number>[0-9]+))?$')
-        p87 = re.compile(r'^\s*as-override$')
-        p88 = re.compile(r'^\s*default-originate( +route-map +(?P<pp_default_originate_route_map>.*))?$')
-        p89 = re.compile(r'^\s*route-map +(?P<pp_route_map_name_in>.*) in$')
-        p90 = re.compile(r'^\s*route-map +(?P<pp_route_map_name_out>.*) out$')
-        p91 = re.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?(restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
-        p92 = re.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<pp_maximum_prefix_threshold>[0-9]+))?( +(?P<pp_maximum_prefix_warning_only>warning-only))?$')
-        p93 = re.compile(r'^\s*next-hop-self$')
-        p94 = re.compile(r'^\s*route-reflector-client$')
-        p95 = re.compile(r'^\s*send-community$')
-        p96 = re.compile(r'^\s*send-community +extended$')
-        p97 = re.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
-        p98 = re.compile(r'^\s*soo +(?P<pp_soo>.*)$')
-        peer_1 = re.compile(r'template peer +(?P<peer_name>\S+)')
+        p1 = regex_engine.compile(r'^\s*router +bgp +(?P<bgp_id>[0-9]+)$')
+        p2 = regex_engine.compile(r'^\s*shutdown$')
+        p2_1 = regex_engine.compile(r'^\s*evpn$')
+        p2_2 = regex_engine.compile(r'^\s*vni +(?P<evpn_vni>\d+) +l2$')
+        p2_3 = regex_engine.compile(r'^\s*rd +(?P<rd>[\w]+)$')
+        p2_4 = regex_engine.compile(r'^\s*route-target +(?P<evpn_vni_rt_type>[\w]+) +(?P<evpn_vni_rt>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^\s*vrf +(?P<vrf>[\w\-]+)$')
+        p3_1 = regex_engine.compile(r'^\s*rd +(?P<rd>[\w]+)$')
+        p4 = regex_engine.compile(r'^\s*bestpath +(?P<best_path>[a-z\-\s]+)$')
+        p5 = regex_engine.compile(r'^\s*cluster-id +(?P<cluster_id>[0-9\.]+)$')
+        p6 = regex_engine.compile(r'^\s*confederation +identifier +(?P<confederation_identifier>[0-9]+)$')
+        p7 = regex_engine.compile(r'^\s*confederation +peers +(?P<confederation_peers_as>[0-9]+)$')
+        p8 = regex_engine.compile(r'^\s*no graceful-restart$')
+        p9 = regex_engine.compile(r'^\s*graceful-restart'
+                              r' +(?P<graceful_restart_type>[a-z\-]+)'
+                              r' +(?P<time>[0-9]+)$')
+        p10 = regex_engine.compile(r'^\s*log-neighbor-changes$')
+        p11 = regex_engine.compile(r'^\s*router-id +(?P<router_id>[0-9\.]+)$')
+        p12 = regex_engine.compile(r'^\s*timers +bgp +(?P<keepalive_interval>[0-9]+)'
+                              r' +(?P<holdtime>[0-9]+)$')
+        p13 = regex_engine.compile(r'^\s*no enforce-first-as$')
+        p14 = regex_engine.compile(r'^\s*no fast-external-fallover$')
+        p15 = regex_engine.compile(r'^\s*dynamic-med-interval +(?P<dynamic_med_interval>[0-9]+)$')
+        p16 = regex_engine.compile(r'^\s*flush-routes$')
+        p17 = regex_engine.compile(r'^\s*isolate$')
+        p18 = regex_engine.compile(r'^\s*disable-policy-batching ipv4 prefix-list +(?P<disable_policy_batching_ipv4>[a-zA-Z0-9]+)$')
+        p19 = regex_engine.compile(r'^\s*disable-policy-batching ipv6 prefix-list +(?P<disable_policy_batching_ipv6>[a-zA-Z0-9]+)$')
+        p20 = regex_engine.compile(r'^\s*address-family +(?P<af_name>[a-z0-9\-\s]+)$')
+        p21_1 = regex_engine.compile(r'^\s*route-target +(?P<af_evpn_vni_rt_type>[\w]+) +(?P<af_evpn_vni_rt>[\w\s]+)$')
+        p21 = regex_engine.compile(r'^\s*dampening '
+                                  r'+(?P<af_dampening_half_life_time>[0-9]+) '
+                                  r'+(?P<af_dampening_reuse_time>[0-9]+) '
+                                  r'+(?P<af_dampening_suppress_time>[0-9]+) '
+                                  r'+(?P<af_dampening_max_suppress_time>[0-9]+)$')
+        p22 = regex_engine.compile(r'^\s*dampening +route-map +(?P<af_dampening_route_map>[A-Z0-9\-\_]+)$')
+        p23 = regex_engine.compile(r'^\s*nexthop +route-map +(?P<af_nexthop_route_map>[A-Za-z0-9\-\_]+)$')
+        p24 = regex_engine.compile(r'^\s*nexthop +trigger-delay +critical +(?P<af_nexthop_trigger_delay_critical>[0-9]+) +non-critical +(?P<af_nexthop_trigger_delay_non_critical>[0-9]+)$')
+        p25 = regex_engine.compile(r'^\s*no nexthop trigger-delay$')
+        p26 = regex_engine.compile(r'^\s*no client-to-client reflection$')
+        p27 = regex_engine.compile(r'^\s*distance +(?P<af_distance_extern_as>[0-9]+) +(?P<af_distance_internal_as>[0-9]+) +(?P<af_distance_local>[0-9]+)$')
+        p28 = regex_engine.compile(r'^\s*maximum-paths( +(?P<af_maximum_paths_type>[a-z]+))? +(?P<af_maximum_paths_value>[0-9]+)$')
+        p28_1 = regex_engine.compile(r'additional-paths send')
+        p28_2 = regex_engine.compile(r'additional-paths receive')
+        p28_3 = regex_engine.compile(r'default-information originate')
+        p29 = regex_engine.compile(r'^\s*maximum-paths +eibgp +(?P<af_maximum_paths_eibgp>[0-9]+)$')
+        p30 = regex_engine.compile(r'^\s*aggregate-address +(?P<af_aggregate_address_address>[a-z0-9\.\:]+)(\/(?P<af_aggregate_address_ipv4_mask>[0-9]+))?( +(?P<extra_line>[a-z\-\s]+))?$')
+        p31 = regex_engine.compile(r'^\s*network +(?P<af_network_number>[0-9\.\:]+)( +mask +(?P<af_network_mask>[0-9\.]+))?( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
+        p32 = regex_engine.compile(r'^\s*network +(?P<af_network_number>[0-9\.]+)\/(?P<af_network_mask>[0-9]+)( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
+        p33 = regex_engine.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
+        p34 = regex_engine.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
+        p35 = regex_engine.compile(r'^\s*redistribute +(ospf|ospfv3) +(?P<af_redist_ospf>[0-9]+) +route-map +(?P<af_redist_ospf_route_policy>[A-Za-z0-9\-\_]+)$')
+        p36 = regex_engine.compile(r'^\s*redistribute +rip +(?P<af_redist_rip>[0-9]+) +route-map +(?P<af_redist_rip_route_policy>[A-Za-z0-9\-\_]+)$')
+        p37 = regex_engine.compile(r'^\s*redistribute +static +route-map +(?P<af_redist_static_route_policy>[A-Za-z0-9\-\_]+)$')
+        p38 = regex_engine.compile(r'^\s*redistribute +direct +route-map +(?P<af_redist_connected_route_policy>[A-Za-z0-9\-\_]+)$')
+        p39 = regex_engine.compile(r'^\s*allocate-label all$')
+        p40 = regex_engine.compile(r'^\s*retain route-target all$')
+        p41 = regex_engine.compile(r'^\s*label-allocation-mode +(?P<per_vrf>[A-Za-z0-9]+)$')
+        p103 = regex_engine.compile(r'^\s*advertise-pip$')
+        p42 = regex_engine.compile(r'^\s*neighbor +(?P<neighbor_id>[a-z0-9\.\:]+)$')
+        p43 = regex_engine.compile(r'^\s*bfd$')
+        p44 = regex_engine.compile(r'^\s*capability suppress 4-byte-as$')
+        p45 = regex_engine.compile(r'^\s*description +(?P<nbr_description>.+)$')
+        p46 = regex_engine.compile(r'^\s*disable-connected-check$')
+        p47 = regex_engine.compile(r'^\s*ebgp-multihop +(?P<nbr_ebgp_multihop_max_hop>[0-9]+)$')
+        p48 = regex_engine.compile(r'^\s*inherit peer-session +(?P<nbr_inherit_peer_session>[A-Za-z0-9\-]+)$')
+        p49 = regex_engine.compile(r'^\s*local-as +(?P<nbr_local_as_as_no>[0-9\.]+)( +(?P<no_prepend>no-prepend)( +(?P<replace_as>replace-as)( +(?P<dual_as>dual-as))?)?)?$')
+        p50 = regex_engine.compile(r'^\s*remote-as +(?P<nbr_remote_as>[0-9]+)$')
+        p51 = regex_engine.compile(r'^\s*remove-private-as$')
+        p52 = regex_engine.compile(r'^\s*shutdown$')
+        p53 = regex_engine.compile(r'^\s*timers +(?P<nbr_keepalive_interval>[0-9]+) +(?P<nbr_holdtime>[0-9]+)$')
+        p54 = regex_engine.compile(r'^\s*update-source +(?P<nbr_update_source>[A-Za-z0-9\/\.]+)$')
+        p55 = regex_engine.compile(r'^\s*password +(?P<nbr_password_text>.*)$')
+        p56 = regex_engine.compile(r'^\s*transport connection-mode +(?P<nbr_transport_connection_mode>[a-z]+)$')
+        p101 = regex_engine.compile(r'^\s*peer-type +(?P<nbr_peer_type>[\w\-]+)$')
+        p104 = regex_engine.compile(r'^\s*inherit peer +(?P<nbr_inherit_peer>\S+)$')
+        p57 = regex_engine.compile(r'^\s*address-family +(?P<nbr_af_name>[A-Za-z0-9\s\-]+)$')
+        p58 = regex_engine.compile(r'^\s*allowas-in( +(?P<nbr_af_allowas_in_as_number>[0-9]+))?$')
+        p59 = regex_engine.compile(r'^\s*inherit peer-policy +(?P<nbr_af_inherit_peer_policy>[A-Za-z0-9\-]+) +(?P<nbr_af_inherit_peer_seq>[0-9]+)$')
+        p60 = regex_engine.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
+        p61 = regex_engine.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +(?P<nbr_af_maximum_prefix_warning_only>warning-only))?$')
+        p62 = regex_engine.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_in>.*) in$')
+        p63 = regex_engine.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_out>.*) out$')
+        p64 = regex_engine.compile(r'^\s*route-reflector-client$')
+        p65 = regex_engine.compile(r'^\s*send-community$')
+        p66 = regex_engine.compile(r'^\s*send-community +extended$')
+        p100 = regex_engine.compile(r'^\s*rewrite-evpn-rt-asn$')
+        p67 = regex_engine.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
+        p68 = regex_engine.compile(r'^\s*next-hop-self$')
+        p69 = regex_engine.compile(r'^\s*as-override$')
+        p70 = regex_engine.compile(r'^\s*default-originate( +route-map +(?P<nbr_af_default_originate_route_map>.*))?$')
+        p71 = regex_engine.compile(r'^\s*soo +(?P<nbr_af_soo>.*)$')
+        p72 = regex_engine.compile(r'^\s*template peer-session +(?P<ps_name>.*)$')
+        p73 = regex_engine.compile(r'^\s*bfd$')
+        p74 = regex_engine.compile(r'^\s*bfd$')
+        p75 = regex_engine.compile(r'^\s*description +(?P<ps_description>.*)$')
+        p76 = regex_engine.compile(r'^\s*disable-connected-check$')
+        p77 = regex_engine.compile(r'^\s*ebgp-multihop +(?P<ps_ebgp_multihop_max_hop>[0-9]+)$$')
+        p78 = regex_engine.compile(r'^\s*local-as +(?P<ps_local_as_as_no>[0-9\.]+)( +no-prepend( +replace-as( +dual-as)?)?)?$')
+        p79 = regex_engine.compile(r'^\s*password +(?P<ps_password_text>.*)$')
+        p80 = regex_engine.compile(r'^\s*remote-as +(?P<ps_remote_as>[0-9]+)$')
+        p81 = regex_engine.compile(r'^\s*shutdown$')
+        p82 = regex_engine.compile(r'^\s*timers +(?P<ps_keepalive_interval>[0-9]+) +(?P<ps_hodltime>[0-9]+)$')
+        p83 = regex_engine.compile(r'^\s*transport connection-mode +(?P<ps_transport_connection_mode>[a-z]+)$')
+        p84 = regex_engine.compile(r'^\s*update-source +(?P<ps_update_source>[A-Za-z0-9\/\.]+)$')
+        p85 = regex_engine.compile(r'^\s*template peer-policy +(?P<pp_name>.*)$')
+        p86 = regex_engine.compile(r'^\s*allowas-in( +(?P<pp_allowas_in_as_number>[0-9]+))?$')
+        p87 = regex_engine.compile(r'^\s*as-override$')
+        p88 = regex_engine.compile(r'^\s*default-originate( +route-map +(?P<pp_default_originate_route_map>.*))?$')
+        p89 = regex_engine.compile(r'^\s*route-map +(?P<pp_route_map_name_in>.*) in$')
+        p90 = regex_engine.compile(r'^\s*route-map +(?P<pp_route_map_name_out>.*) out$')
+        p91 = regex_engine.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?(restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
+        p92 = regex_engine.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<pp_maximum_prefix_threshold>[0-9]+))?( +(?P<pp_maximum_prefix_warning_only>warning-only))?$')
+        p93 = regex_engine.compile(r'^\s*next-hop-self$')
+        p94 = regex_engine.compile(r'^\s*route-reflector-client$')
+        p95 = regex_engine.compile(r'^\s*send-community$')
+        p96 = regex_engine.compile(r'^\s*send-community +extended$')
+        p97 = regex_engine.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
+        p98 = regex_engine.compile(r'^\s*soo +(?P<pp_soo>.*)$')
+        peer_1 = regex_engine.compile(r'template peer +(?P<peer_name>\S+)')
         # Init vars
         bgp_dict = {}
         bgp_id = ''
@@ -3253,37 +3151,37 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
         sub_dict = {}
         history_paths = None
         dampened_paths = None
-        p1 = re.compile(r'^Flap +Statistics +for +VRF +'
-                            r'(?P<vrf_name>[\w\-]+), +address +family +'
-                            r'(?P<address_family>[\w\s\-]+):$')
-        p2 = re.compile(r'^Dampening +configured, +'
-                            r'(?P<history_paths>\d+) +history +paths, +'
-                            r'(?P<dampened_paths>\d+) +dampened +paths$')
-        p2_1 = re.compile(r'^Dampening +not +configured, +'
-                            r'(?P<history_paths>\d+) +history +paths, +'
-                            r'(?P<dampened_paths>\d+) +dampened +paths$')
-        p3 = re.compile(r'^Route +Distinguisher: +'
-                            r'(?P<route_identifier>[\w\.\:]+)$')
-        p4 = re.compile(r'^(?P<status>[\*|d|s|h|\s])?'
-                            r'(?P<best>[\>|\s])?'
-                            r'(?P<pathtype>[e|i])?'
-                            r' +(?P<network>\S+)'
-                            r' +(?P<peer>[\w\/\.\:]+)'
-                            r' +(?P<flaps>\d+)'
-                            r' +(?P<duration>[\w\:\.]+)'
-                            r'(?: +(?P<reuse_time>[\w\:\.]+))?'
-                            r' +(?P<current_penalty>\d+)\/'
-                            r'(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
-        p4_1 = re.compile(r'^(?P<status>[\*|d|s|h|\s])?'
-                            r'(?P<best>[\>|\s])?'
-                            r'(?P<pathtype>[e|i|\s])?'
-                            r' +(?P<network>\S+\/\d{1,3})'
-                            r'(?P<peer>[1|2][\d\.\:]+)'
-                            r' +(?P<flaps>\d+)'
-                            r' +(?P<duration>[\w\:\.]+)'
-                            r'(?: +(?P<reuse_time>[\w\:\.]+))?'
-                            r' +(?P<current_penalty>\d+)\/'
-                            r'(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
+        p1 = regex_engine.compile(r'^Flap +Statistics +for +VRF +'
+                                      r'(?P<vrf_name>[\w\-]+), +address +family +'
+                                      r'(?P<address_family>[\w\s\-]+):$')
+        p2 = regex_engine.compile(r'^Dampening +configured, +'
+                                      r'(?P<history_paths>\d+) +history +paths, +'
+                                      r'(?P<dampened_paths>\d+) +dampened +paths$')
+        p2_1 = regex_engine.compile(r'^Dampening +not +configured, +'
+                                      r'(?P<history_paths>\d+) +history +paths, +'
+                                      r'(?P<dampened_paths>\d+) +dampened +paths$')
+        p3 = regex_engine.compile(r'^Route +Distinguisher: +'
+                                      r'(?P<route_identifier>[\w\.\:]+)$')
+        p4 = regex_engine.compile(r'^(?P<status>[\*|d|s|h|\s])?'
+                                      r'(?P<best>[\>|\s])?'
+                                      r'(?P<pathtype>[e|i])?'
+                                      r' +(?P<network>\S+)'
+                                      r' +(?P<peer>[\w\/\.\:]+)'
+                                      r' +(?P<flaps>\d+)'
+                                      r' +(?P<duration>[\w\:\.]+)'
+                                      r'(?: +(?P<reuse_time>[\w\:\.]+))?'
+                                      r' +(?P<current_penalty>\d+)\/'
+                                      r'(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
+        p4_1 = regex_engine.compile(r'^(?P<status>[\*|d|s|h|\s])?'
+                                      r'(?P<best>[\>|\s])?'
+                                      r'(?P<pathtype>[e|i|\s])?'
+                                      r' +(?P<network>\S+\/\d{1,3})'
+                                      r'(?P<peer>[1|2][\d\.\:]+)'
+                                      r' +(?P<flaps>\d+)'
+                                      r' +(?P<duration>[\w\:\.]+)'
+                                      r'(?: +(?P<reuse_time>[\w\:\.]+))?'
+                                      r' +(?P<current_penalty>\d+)\/'
+                                      r'(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3390,222 +3288,94 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
         return ret_dict
 
 
-    def xml(self):
-        out = self.device.execute(self.xml_command)
-
-        etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-        if not vrf_root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_afi'.format(namespace))
-
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_afi'.format(namespace)):
+    # ROW_prefix leaves
+    xml_prefix_mapping = {
+        'status': 'status',
+        'pathtype': 'pathtype',
+        'peer': 'peer',
+        'ipv6peer': 'peer',
+        'flapcount': ('flaps', int),
+        'duration': 'duration',
+        'reuse': 'reuse_time',
+        'penalty': ('current_penalty', int),
+        'suppresslimit': ('suppress_limit', int),
+        'reuselimit': ('reuse_limit', int),
+    }
 
-                # address_family
-                row_safi = af_root.find('{}TABLE_safi'.format(namespace))
-                row_safi = row_safi.find('{}ROW_safi'.format(namespace))
+    def xml(self, output=None):
+        if output is None:
+            output = self.device.execute(self.xml_command)
 
-                try:
-                    af = row_safi.find('{}af-name'.format(namespace)).text.lower()
-                except Exception:
+        etree_dict = {}
+        # prefixes of the rd being read
+        prefixes = []
+
+        stream = XmlStream(output, records=['ROW_vrf', 'ROW_safi', 'ROW_rd',
+                                            'ROW_prefix'])
+        for record, leaves, parents in stream:
+
+            # -----   prefix  -----
+            if record == 'ROW_prefix':
+                prefixes.append(leaves)
+                continue
+
+            if record != 'ROW_rd':
+                continue
+            rd_prefixes, prefixes = prefixes, []
+
+            # <vrf-name-out>default</vrf-name-out>
+            # <af-name>IPv4 Unicast</af-name>
+            vrf_name = parents[1].get('vrf-name-out')
+            af = parents[2].get('af-name')
+            if not vrf_name or not af:
+                continue
+            af_dict = etree_dict.setdefault('vrf', {}).\
+                setdefault(vrf_name, {}).setdefault('address_family', {}).\
+                setdefault(af.lower(), {})
+
+            # <dampeningenabled>true</dampeningenabled>
+            # <dampening>true</dampening>
+            # <historypaths>0</historypaths>
+            # <dampenedpaths>2</dampenedpaths>
+            rd_attributes = map_leaves(leaves, {
+                'historypaths': ('history_paths', int),
+                'dampenedpaths': ('dampened_paths', int)})
+            if leaves.get('dampeningenabled',
+                          leaves.get('dampening')) == 'true':
+                rd_attributes['dampening_enabled'] = True
+
+            # <rd_val>1:100</rd_val>
+            rd = leaves.get('rd_val')
+            if rd:
+                # set default attributes under address family
+                af_dict.update(rd_attributes)
+                sub_dict = af_dict.setdefault('route_identifier', {}).\
+                    setdefault(rd, {})
+            else:
+                sub_dict = af_dict
+            sub_dict.update(rd_attributes)
+
+            # -----   loop prefix  -----
+            for prefix_leaves in rd_prefixes:
+                # <ipprefix>10.25.1.0/24</ipprefix>
+                # <ipv6prefix>2001::/112</ipv6prefix>
+                # <nonipprefix>[2]:[0]:[0]:[48]:[0201.02ff.0302]:[32]:[10.81.1.1]/248</nonipprefix>
+                network = prefix_leaves.get('nonipprefix') or \
+                    prefix_leaves.get('ipv6prefix') or \
+                    prefix_leaves.get('ipprefix')
+                if not network:
                     continue
+                network_dict = map_leaves(
+                    prefix_leaves, self.xml_prefix_mapping,
+                    sub_dict.setdefault('network', {}).setdefault(network, {}))
 
-                # rd table
-                rd = row_safi.find('{}TABLE_rd'.format(namespace))
-                if not rd:
-                    continue
-                else:
-                    if 'vrf' not in etree_dict:
-                        etree_dict['vrf'] = {}
-                    if vrf not in etree_dict['vrf']:
-                        etree_dict['vrf'][vrf] = {}
-
-                    if 'address_family' not in etree_dict['vrf'][vrf]:
-                        etree_dict['vrf'][vrf]['address_family'] = {}
-                    if af not in etree_dict['vrf'][vrf]['address_family']:
-                        etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                # -----   loop rd  -----
-                for rd_root in rd.findall('{}ROW_rd'.format(namespace)):
-                    # rd
-                    try:
-                        rd = rd_root.find('{}rd_val'.format(namespace)).text
-                    except Exception:
-                        rd = None
-
-                    # <dampeningenabled>true</dampeningenabled>
-                    try:
-                        dampeningenabled = rd_root.find('{}dampeningenabled'
-                                                        .format(namespace)).text
-                    except Exception:
-                        # <dampening>true</dampening>
-                        try:
-                            dampeningenabled = rd_root.find('{}dampening'
-                                                            .format(namespace)).text
-                        except Exception:
-                            pass
-                            
-                    # <historypaths>0</historypaths>
-                    historypaths = int(rd_root.find('{}historypaths'
-                                                    .format(namespace)).text)
-                    # <dampenedpaths>2</dampenedpaths>
-                    dampenedpaths = int(rd_root.find('{}dampenedpaths'
-                                                     .format(namespace)).text)
-
-                    if rd:
-                        # set default attributes under address family 
-                        # <dampeningenabled>true</dampeningenabled>
-                        if dampeningenabled == 'true':
-                            etree_dict['vrf'][vrf]['address_family'][af]['dampening_enabled'] = True
-
-                        # <historypaths>0</historypaths>
-                        etree_dict['vrf'][vrf]['address_family'][af]['history_paths'] = historypaths
-                        
-                        # <dampenedpaths>2</dampenedpaths>
-                        etree_dict['vrf'][vrf]['address_family'][af]['dampened_paths'] = dampenedpaths
-
-                        if 'route_identifier' not in etree_dict['vrf'][vrf]\
-                            ['address_family'][af]:
-                            etree_dict['vrf'][vrf]['address_family'][af]\
-                                ['route_identifier'] = {}
-
-                        if rd not in etree_dict['vrf'][vrf]\
-                            ['address_family'][af]['route_identifier']:
-                            etree_dict['vrf'][vrf]['address_family'][af]\
-                                ['route_identifier'][rd] = {}
-
-                        sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['route_identifier'][rd]
-                    else:
-                        sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
+                # <best>false</best>
+                network_dict['best'] = prefix_leaves.get('best') != 'false'
 
-                    # <dampeningenabled>true</dampeningenabled>
-                    if dampeningenabled == 'true':
-                        sub_dict['dampening_enabled'] = True
-
-                    # <historypaths>0</historypaths>
-                    sub_dict['history_paths'] = historypaths
-
-                    # <dampenedpaths>2</dampenedpaths>
-                    sub_dict['dampened_paths'] = dampenedpaths
-
-                    # prefix table
-                    prefix = rd_root.find('{}TABLE_prefix'.format(namespace))
-                    if not prefix:
-                        continue
-
-                    # -----   loop prefix  -----
-                    for prefix_root in prefix.findall('{}ROW_prefix'.format(namespace)):
-
-                        # <ipprefix>10.25.1.0/24</ipprefix>
-                        try:
-                            network = prefix_root.find('{}ipprefix'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # ipv6prefix>2001::/112</ipv6prefix>
-                        try:
-                            network = prefix_root.find('{}ipv6prefix'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <nonipprefix>[2]:[0]:[0]:[48]:[0201.02ff.0302]:[32]:[10.81.1.1]/248</nonipprefix>
-                        try:
-                            network = prefix_root.find('{}nonipprefix'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'network' not in sub_dict:
-                            sub_dict['network'] = {}
-
-                        if network not in sub_dict['network']:
-                            sub_dict['network'][network] = {}
-
-                        # <status>d</status>
-                        sub_dict['network'][network]['status'] = \
-                            prefix_root.find('{}status'.format(namespace)).text
-
-                        # <pathtype>e</pathtype>
-                        sub_dict['network'][network]['pathtype'] = \
-                            prefix_root.find('{}pathtype'.format(namespace)).text
-
-                        # <peer>10.106.102.3</peer>
-                        try:
-                            sub_dict['network'][network]['peer'] = \
-                                prefix_root.find('{}peer'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <ipv6peer>2001:db8:8d82::2002</ipv6peer>
-                        try:
-                            sub_dict['network'][network]['peer'] = \
-                                prefix_root.find('{}ipv6peer'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <flapcount>39</flapcount>
-                        sub_dict['network'][network]['flaps'] = \
-                            int(prefix_root.find('{}flapcount'.format(namespace)).text)
-                            
-                        # <duration>00:09:53</duration>
-                        sub_dict['network'][network]['duration'] = \
-                            prefix_root.find('{}duration'.format(namespace)).text
-                            
-                        # <reuse>00:01:40</reuse>
-                        reuse = prefix_root.find('{}reuse'.format(namespace)).text
-                        if reuse:
-                            sub_dict['network'][network]['reuse_time'] = reuse
-                            
-                            
-                        # <penalty>34</penalty>
-                        penalty = prefix_root.find('{}penalty'.format(namespace)).text
-                        if penalty:
-                            sub_dict['network'][network]['current_penalty'] = int(penalty)
-                            
-                        # <suppresslimit>30</suppresslimit>
-                        sub_dict['network'][network]['suppress_limit'] = \
-                            int(prefix_root.find('{}suppresslimit'.format(namespace)).text)
-
-                       # <reuselimit>10</reuselimit>
-                        sub_dict['network'][network]['reuse_limit'] = \
-                            int(prefix_root.find('{}reuselimit'.format(namespace)).text)
+        # compare cli command
+        if stream.command:
+            stream.compare_command(self.cli_command)
 
-                       # <best>false</best>
-                        if prefix_root.find('{}best'.format(namespace)).text == 'false':
-                            sub_dict['network'][network]['best'] = False
-                        else:
-                            sub_dict['network'][network]['best'] = True                                                                                    
         return etree_dict
 
 
@@ -3632,230 +3402,120 @@ class ShowBgpAllNexthopDatabase(ShowBgpVrfAllAllNextHopDatabase):
     def cli(self,output=None):
         return super().cli(cmd=self.cli_command,output=output)
 
-    def xml(self):
-        out = self.device.execute(self.xml_command)
-
-        etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_nhvrf')
-        if not vrf_root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_nhvrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}nhvrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
+    # ROW_nexthop leaves
+    xml_nexthop_mapping = {
+        'refcount': ('refcount', int),
+        'igpmetric': ('igp_cost', int),
+        'igptype': ('igp_route_type', int),
+        'igppref': ('igp_preference', int),
+        'resolvetime': 'resolve_time',
+        'ribroute': 'rib_route',
+        'ipv6ribroute': 'rib_route',
+        'nextadvertise': ('metric_next_advertise', str.lower),
+        'rnhepoch': ('rnh_epoch', int),
+    }
 
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_nhafi'.format(namespace))
+    # ROW_nexthop true/false leaves
+    xml_nexthop_flags = {
+        'attached': 'attached',
+        'local': 'local',
+        'reachable': 'reachable',
+        'labeled': 'labeled',
+        'filtered': 'filtered',
+        'pendingupdate': 'pending_update',
+    }
 
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_nhafi'.format(namespace)):
+    def xml(self, output=None):
+        if output is None:
+            output = self.device.execute(self.xml_command)
 
-                # address_family
-                row_safi = af_root.find('{}TABLE_nhsafi'.format(namespace))
-                af_root = row_safi.find('{}ROW_nhsafi'.format(namespace))
-                try:
-                    af = af_root.find('{}af-name'.format(namespace)).text.lower()
-                except Exception:
+        etree_dict = {}
+        # nexthops of the address family being read: [(leaves, attachedhops)]
+        nexthops = []
+        attached_hops = []
+
+        stream = XmlStream(output, records=['ROW_nhvrf', 'ROW_nhsafi',
+                                            'ROW_nexthop', 'ROW_attachedhops'])
+        for record, leaves, parents in stream:
+
+            # -----   attachedhops  -----
+            if record == 'ROW_attachedhops':
+                attached_hops.append(leaves)
+
+            # -----   nexthop  -----
+            elif record == 'ROW_nexthop':
+                nexthops.append((leaves, attached_hops))
+                attached_hops = []
+
+            # -----   address_family  -----
+            elif record == 'ROW_nhsafi':
+                af_nexthops, nexthops = nexthops, []
+                vrf_name = parents[1].get('nhvrf-name-out')
+                af = leaves.get('af-name')
+                if not vrf_name or not af:
                     continue
-
-                if 'address_family' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['address_family'] = {}
-                if af not in etree_dict['vrf'][vrf]['address_family']:
-                    etree_dict['vrf'][vrf]['address_family'][af] = {}
+                af_dict = etree_dict.setdefault('vrf', {}).\
+                    setdefault(vrf_name, {}).\
+                    setdefault('address_family', {}).setdefault(af.lower(), {})
 
                 # af_nexthop_trigger_enable
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['af_nexthop_trigger_enable'] = True
+                af_dict['af_nexthop_trigger_enable'] = True
 
                 # <nhnoncriticaldelay>10000</nhnoncriticaldelay>
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_non_critical'] = int(af_root.find('{}nhnoncriticaldelay'
-                                                             .format(namespace)).text)
                 # <nhcriticaldelay>3000</nhcriticaldelay>
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_critical'] = int(af_root.find('{}nhcriticaldelay'
-                                                             .format(namespace)).text)
-
-                # nexthop table
-                next_hop = af_root.find('{}TABLE_nexthop'.format(namespace))
-                if not next_hop:
-                    continue
+                map_leaves(leaves, {
+                    'nhnoncriticaldelay':
+                        ('nexthop_trigger_delay_non_critical', int),
+                    'nhcriticaldelay':
+                        ('nexthop_trigger_delay_critical', int)}, af_dict)
 
                 # -----   loop nexthop  -----
-                for nexthop_root in next_hop.findall('{}ROW_nexthop'.format(namespace)):
-                    # nexthop
+                for nexthop_leaves, nexthop_attached_hops in af_nexthops:
                     # <ipnexthop-out>192.168.154.1</ipnexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipnexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
-
                     # <ipv6nexthop-out>2001:db8:400::3:1</ipv6nexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipv6nexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    if 'next_hop' not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'] = {}
-
-                    if nexthop not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]['next_hop']:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'][nexthop] = {}
-
-                    sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                        ['next_hop'][nexthop]
-
-                    # <refcount>1</refcount>
-                    sub_dict['refcount'] = int(nexthop_root.find(
-                                                '{}refcount'.format(namespace)).text)
-
-                    # <igpmetric>3</igpmetric>
-                    sub_dict['igp_cost'] = \
-                        int(nexthop_root.find('{}igpmetric'.format(namespace)).text)
+                    nexthop = nexthop_leaves.get('ipv6nexthop-out') or \
+                        nexthop_leaves.get('ipnexthop-out')
+                    if not nexthop:
+                        continue
+                    sub_dict = map_leaves(
+                        nexthop_leaves, self.xml_nexthop_mapping,
+                        af_dict.setdefault('next_hop', {}).\
+                        setdefault(nexthop, {}))
 
                     # <multipath>false</multipath>
-                    try:
-                        if nexthop_root.find('{}multipath'.format(namespace)).text == 'false':
-                            sub_dict['multipath'] = 'No'
-                        else:
-                            sub_dict['multipath'] = 'Yes'
-                    except Exception:
-                        pass
-
-                    # <igptype>0</igptype>
-                    sub_dict['igp_route_type'] = \
-                        int(nexthop_root.find('{}igptype'.format(namespace)).text)
-
-                    # <igppref>110</igppref>
-                    sub_dict['igp_preference'] = \
-                        int(nexthop_root.find('{}igppref'.format(namespace)).text)
+                    if 'multipath' in nexthop_leaves:
+                        sub_dict['multipath'] = 'No' \
+                            if nexthop_leaves['multipath'] == 'false' else 'Yes'
 
                     # <attached>false</attached>
-                    if nexthop_root.find('{}attached'.format(namespace)).text == 'false':
-                        sub_dict['attached'] = False
-                    else:
-                        sub_dict['attached'] = True
-
-
-                    # <local>false</local>
-                    if nexthop_root.find('{}local'.format(namespace)).text == 'false':
-                        sub_dict['local'] = False
-                    else:
-                        sub_dict['local'] = True
-
-                    # <reachable>true</reachable>
-                    if nexthop_root.find('{}reachable'.format(namespace)).text == 'false':
-                        sub_dict['reachable'] = False
-                    else:
-                        sub_dict['reachable'] = True
-
-                    # <labeled>true</labeled>
-                    if nexthop_root.find('{}labeled'.format(namespace)).text == 'false':
-                        sub_dict['labeled'] = False
-                    else:
-                        sub_dict['labeled'] = True
-
-                    # <filtered>false</filtered>
-                    if nexthop_root.find('{}filtered'.format(namespace)).text == 'false':
-                        sub_dict['filtered'] = False
-                    else:
-                        sub_dict['filtered'] = True
-
-                    # <pendingupdate>false</pendingupdate>
-                    if nexthop_root.find('{}pendingupdate'.format(namespace)).text == 'false':
-                        sub_dict['pending_update'] = False
-                    else:
-                        sub_dict['pending_update'] = True
-
-                    # <resolvetime>18:38:21</resolvetime>
-                    sub_dict['resolve_time'] = \
-                        nexthop_root.find('{}resolvetime'.format(namespace)).text
-
-                    # <ribroute>192.168.154.1/32</ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ribroute'.format(namespace)).text
-                    except Exception:
-                        pass                    
-
-                    # <ipv6ribroute>0::/0</ipv6ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ipv6ribroute'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    # <nextadvertise>Never</nextadvertise>
-                    sub_dict['metric_next_advertise'] = \
-                        nexthop_root.find('{}nextadvertise'.format(namespace)).text.lower()
-
-                    # <rnhepoch>1</rnhepoch>
-                    sub_dict['rnh_epoch'] = \
-                        int(nexthop_root.find('{}rnhepoch'.format(namespace)).text)
-
-
-                    # attachedhops table
-                    attached = nexthop_root.find('{}TABLE_attachedhops'.format(namespace))
-                    if not attached:
-                        continue
+                    for tag, key in self.xml_nexthop_flags.items():
+                        if tag in nexthop_leaves:
+                            sub_dict[key] = nexthop_leaves[tag] != 'false'
 
                     # -----   loop attachedhops  -----
-                    for attach_root in attached.findall('{}ROW_attachedhops'.format(namespace)):
-
+                    for hop_leaves in nexthop_attached_hops:
                         # <attachedhop>192.168.66.2</attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
-
                         # <ipv6attachedhop>fe80::6e9c:edff:fe4d:ff41</ipv6attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}ipv6attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'attached_nexthop' not in sub_dict:
-                            sub_dict['attached_nexthop'] = {}
+                        att_hop = hop_leaves.get('ipv6attachedhop') or \
+                            hop_leaves.get('attachedhop')
+                        if not att_hop:
+                            continue
+                        # <interface>port-channel2.100</interface>
+                        map_leaves(hop_leaves,
+                                   {'interface': 'attached_nexthop_interface'},
+                                   sub_dict.setdefault('attached_nexthop', {}).\
+                                   setdefault(att_hop, {}))
 
-                        if att_hop not in sub_dict['attached_nexthop']:
-                            sub_dict['attached_nexthop'][att_hop] = {}
+            # -----   vrf  -----
+            elif record == 'ROW_nhvrf':
+                if leaves.get('nhvrf-name-out'):
+                    etree_dict.setdefault('vrf', {}).\
+                        setdefault(leaves['nhvrf-name-out'], {})
+
+        # compare cli command
+        if stream.command:
+            stream.compare_command(self.cli_command)
 
-                        # <interface>port-channel2.100</interface>
-                        sub_dict['attached_nexthop'][att_hop]['attached_nexthop_interface'] = \
-                            attach_root.find('{}interface'.format(namespace)).text                                                                                                          
         return etree_dict
 
 
@@ -3944,42 +3604,42 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
         sub_dict = {}
         tem_peer = None
 
-        p1 = re.compile(r'^BGP +peer\-template +is +'
-                            r'(?P<template>[\w\-]+)$')
-        p2 = re.compile(r'^Using +(?P<intf>[\w\-\/\.]+) +as'
-                            r' +update +source +for +this +peer$')
-        p3 = re.compile(r'^Peer +is +low\-memory +exempt$')
-        p4 = re.compile(r'^Disable +logging +neighbor +events$')
-        p5 = re.compile(r'^External +BGP +peer +might +be +up +to'
-                            r' +(?P<hops>\d+) +hops +away$')
-        p6 = re.compile(r'^Only +passive +connection +setup +allowed$')
-        p23 = re.compile(r'^Neighbor +local\-as +command +not +active$')
-        p7 = re.compile(r'^For +address +family: +(?P<af>[\w\s\-]+)$')
-        p8 = re.compile(r'^Condition\-map +(?P<con_map>[\w\-]+), +'
-                            r'Advertise\-map +(?P<adv_map>[\w\-]+), +'
-                            r'Status +(?P<status>[\w\-]+)$')
-        p25 = re.compile(r'^Inbound +soft +reconfiguration +allowed(?: *\(always\))?$')
-        p9 = re.compile(r'^Community +attribute +sent +to +this +neighbor$')
-        p10 = re.compile(r'^Extended +community +attribute +sent +'
-                            r'to +this +neighbor$')
-        p11 = re.compile(r'^Nexthop(?: +always)? +set +to +local +'
-                            r'peering +address, +(?P<local_nexthop>[\w\.\:]+)$')
-        p12 = re.compile(r'^Third\-party +Nexthop +will +not +be +computed.$')
-        p13 = re.compile(r'^Maximum +prefixes +allowed +(?P<max_pfx>\d+)$')
-        p14 = re.compile(r'^SOO +Extcommunity: +(?P<soo>[\w\:\.]+)$')
-        p15 = re.compile(r'^Weight: +(?P<weight>\d+)$')
-        p16 = re.compile(r'^Allow +my +ASN +(?P<asn>\d+) +times$')
-        p17 = re.compile(r'^ASN +override +is +(?P<status>\w+)$')
-        p24 = re.compile(r'^Peer +ASN +check +is +disabled$')
-        p18 = re.compile(r'^Inbound +(?P<type>[\w\-\s]+) +configured'
-                            r' +is +(?P<name>[\w\-]+)$')
-        p19 = re.compile(r'^Outbound +(?P<type>[\w\-\s]+) +configured'
-                            r' +is +(?P<name>[\w\-]+)$')
-        p20 = re.compile(r'^Default +information +originate(, +'
-                            r'route-map +(?P<map>[\w\-]+))? +(?P<dummy>.*)$')
-        p21 = re.compile(r'^Unsuppress\-map +(?P<map>[\w\-]+) +configured$')
-        p22 = re.compile(r'^Members +of +peer\-template +(?P<peer>[\w\-]+):$')
-        p22_1 = re.compile(r'^(?P<vrf>[\w\-]+): +(?P<neighbor>[\w\:\.]+)$')
+        p1 = regex_engine.compile(r'^BGP +peer\-template +is +'
+                                      r'(?P<template>[\w\-]+)$')
+        p2 = regex_engine.compile(r'^Using +(?P<intf>[\w\-\/\.]+) +as'
+                                      r' +update +source +for +this +peer$')
+        p3 = regex_engine.compile(r'^Peer +is +low\-memory +exempt$')
+        p4 = regex_engine.compile(r'^Disable +logging +neighbor +events$')
+        p5 = regex_engine.compile(r'^External +BGP +peer +might +be +up +to'
+                                      r' +(?P<hops>\d+) +hops +away$')
+        p6 = regex_engine.compile(r'^Only +passive +connection +setup +allowed$')
+        p23 = regex_engine.compile(r'^Neighbor +local\-as +command +not +active$')
+        p7 = regex_engine.compile(r'^For +address +family: +(?P<af>[\w\s\-]+)$')
+        p8 = regex_engine.compile(r'^Condition\-map +(?P<con_map>[\w\-]+), +'
+                                      r'Advertise\-map +(?P<adv_map>[\w\-]+), +'
+                                      r'Status +(?P<status>[\w\-]+)$')
+        p25 = regex_engine.compile(r'^Inbound +soft +reconfiguration +allowed(?: *\(always\))?$')
+        p9 = regex_engine.compile(r'^Community +attribute +sent +to +this +neighbor$')
+        p10 = regex_engine.compile(r'^Extended +community +attribute +sent +'
+                                      r'to +this +neighbor$')
+        p11 = regex_engine.compile(r'^Nexthop(?: +always)? +set +to +local +'
+                                      r'peering +address, +(?P<local_nexthop>[\w\.\:]+)$')
+        p12 = regex_engine.compile(r'^Third\-party +Nexthop +will +not +be +computed.$')
+        p13 = regex_engine.compile(r'^Maximum +prefixes +allowed +(?P<max_pfx>\d+)$')
+        p14 = regex_engine.compile(r'^SOO +Extcommunity: +(?P<soo>[\w\:\.]+)$')
+        p15 = regex_engine.compile(r'^Weight: +(?P<weight>\d+)$')
+        p16 = regex_engine.compile(r'^Allow +my +ASN +(?P<asn>\d+) +times$')
+        p17 = regex_engine.compile(r'^ASN +override +is +(?P<status>\w+)$')
+        p24 = regex_engine.compile(r'^Peer +ASN +check +is +disabled$')
+        p18 = regex_engine.compile(r'^Inbound +(?P<type>[\w\-\s]+) +configured'
+                                      r' +is +(?P<name>[\w\-]+)$')
+        p19 = regex_engine.compile(r'^Outbound +(?P<type>[\w\-\s]+) +configured'
+                                      r' +is +(?P<name>[\w\-]+)$')
+        p20 = regex_engine.compile(r'^Default +information +originate(, +'
+                                      r'route-map +(?P<map>[\w\-]+))? +(?P<dummy>.*)$')
+        p21 = regex_engine.compile(r'^Unsuppress\-map +(?P<map>[\w\-]+) +configured$')
+        p22 = regex_engine.compile(r'^Members +of +peer\-template +(?P<peer>[\w\-]+):$')
+        p22_1 = regex_engine.compile(r'^(?P<vrf>[\w\-]+): +(?P<neighbor>[\w\:\.]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4229,347 +3889,110 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
         return ret_dict
 
 
-    def xml(self):
-        out = self.device.execute(self.xml_command)
-
-        etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_neighbor')
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for peer_tree in root.findall('{}ROW_neighbor'.format(namespace)):
-            # vrf
-            try:
-                template = peer_tree.find('{}templatepeer'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'template' not in etree_dict:
-                etree_dict['template'] = {}
-            if template not in etree_dict['template']:
-                etree_dict['template'][template] = {}
-
-            # <sourceif>loopback1</sourceif>
-            try:
-                etree_dict['template'][template]['source_interface'] = \
-                    peer_tree.find('{}sourceif'.format(namespace)).text
-            except Exception:
-                pass
-
-            # <lowmemexempt>true</lowmemexempt>
-            try:
-                if peer_tree.find('{}lowmemexempt'.format(namespace)).text == 'true':
-                    etree_dict['template'][template]['low_mem_exempt'] = True
-                else:
-                    etree_dict['template'][template]['low_mem_exempt'] = False
-            except Exception:
-                pass
-
-            # <ttlsecurity>false</ttlsecurity>
-            if peer_tree.find('{}ttlsecurity'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['logging_neighbor_events'] = True
-            else:
-                etree_dict['template'][template]['logging_neighbor_events'] = False
-
-            # <passiveonly>true</passiveonly>
-            if peer_tree.find('{}passiveonly'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['passive_only'] = True
-            else:
-                etree_dict['template'][template]['passive_only'] = False
-
-            # <localas-inactive>false</localas-inactive>
-            if peer_tree.find('{}localas-inactive'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['local_as_inactive'] = True
-            else:
-                etree_dict['template'][template]['local_as_inactive'] = False
-
-            # <remove-privateas>false</remove-privateas>
-            if peer_tree.find('{}remove-privateas'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['remove_private_as'] = True
-            else:
-                etree_dict['template'][template]['remove_private_as'] = False
-
-            # <ttllimit>100</ttllimit>
-            try:
-                etree_dict['template'][template]['external_bgp_peer_hops_limit'] = \
-                    int(peer_tree.find('{}ttllimit'.format(namespace)).text)
-            except Exception:
-                pass
-
-             # vrf table
-            vrf_tree = peer_tree.find('{}TABLE_vrf'.format(namespace))
-            if vrf_tree:
-                # -----   loop vrf  -----
-                for vrf_root in vrf_tree.findall('{}ROW_vrf'.format(namespace)):
-                    # <vrf-name>default</vrf-name>
-                    try:
-                        vrf = vrf_root.find('{}vrf-name'.format(namespace)).text.lower()
-                    except Exception:
-                        continue
-
-                    # inheritingpeer table
-                    inherit_tree = vrf_root.find('{}TABLE_inheritingpeer'.format(namespace))
-                    if not inherit_tree:
-                        continue
-
-                    # -----   loop inheritingpeer  -----
-                    for inherit_root in inherit_tree.findall('{}ROW_inheritingpeer'
-                                                             .format(namespace)):
-
-                        # <inheritingpeer>10.186.201.1</inheritingpeer>
-                        try:
-                            inherit_peer = inherit_root.find('{}inheritingpeer'
-                                                             .format(namespace)).text.lower()
-                        except Exception:
-                            continue
-                        if 'vrf' not in etree_dict['template'][template]:
-                            etree_dict['template'][template]['vrf'] = {}
-                        if vrf not in etree_dict['template'][template]['vrf']:
-                            etree_dict['template'][template]['vrf'][vrf] = {}
-
-                        if 'inheriting_peer' not in etree_dict['template']\
-                            [template]['vrf'][vrf]:
-                            etree_dict['template'][template]['vrf'][vrf]\
-                                ['inheriting_peer'] = {}
-                            
-                        if inherit_peer not in etree_dict['template']\
-                            [template]['vrf'][vrf]['inheriting_peer']:
-                            etree_dict['template'][template]['vrf'][vrf]\
-                                ['inheriting_peer'][inherit_peer] = {}
-
-                        etree_dict['template'][template]['vrf'][vrf]\
-                                ['inheriting_peer'][inherit_peer]['inheriting_peer'] = inherit_peer
+    # ROW_neighbor leaves
+    xml_template_mapping = {
+        'sourceif': 'source_interface',
+        'lowmemexempt': ('low_mem_exempt', xml_bool),
+        'ttlsecurity': ('logging_neighbor_events', xml_bool),
+        'passiveonly': ('passive_only', xml_bool),
+        'localas-inactive': ('local_as_inactive', xml_bool),
+        'remove-privateas': ('remove_private_as', xml_bool),
+        'ttllimit': ('external_bgp_peer_hops_limit', int),
+    }
 
+    # ROW_persaf leaves
+    xml_af_mapping = {
+        'conditionmap': 'condition_map',
+        'advertisemap': 'advertise_map',
+        'advertisemapstatus': ('advertise_map_status', str.lower),
+        'insoftreconfigallowed': ('in_soft_reconfig_allowed', xml_bool),
+        'sendcommunity': ('send_community', xml_bool),
+        'sendextcommunity': ('send_ext_community', xml_bool),
+        'thirdpartynexthop': ('third_party_nexthop', xml_bool),
+        'asoverride': ('as_override', xml_bool),
+        'peerascheckdisabled': ('peer_as_check_disabled', xml_bool),
+        'rrconfigured': ('rr_configured', xml_bool),
+        'localnexthop': 'local_nexthop',
+        'maxpfx': ('max_pfx', int),
+        'soo': 'soo',
+        'weight': ('weight', int),
+        'allowasin': ('allow_as_in', int),
+        'defaultoriginate': ('default_originate', xml_bool),
+        'defaultoriginatermap': 'default_originate_route_map',
+        'unsuppress-map': 'unsuppress_map',
+    }
 
-            # address_family table
-            afi = peer_tree.find('{}TABLE_peraf'.format(namespace))
+    def xml(self, output=None):
+        if output is None:
+            output = self.device.execute(self.xml_command)
 
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_peraf'.format(namespace)):
+        etree_dict = {}
 
-                try:
-                    # address_family
-                    row_safi = af_root.find('{}TABLE_persaf'.format(namespace))
-                    af_root = row_safi.find('{}ROW_persaf'.format(namespace))
-                    af = af_root.find('{}per-af-name'.format(namespace)).text.lower()
-                except Exception:
+        def get_template_dict(template_leaves):
+            return etree_dict.setdefault('template', {}).\
+                setdefault(template_leaves['templatepeer'], {})
+
+        def get_af_dict(template_leaves, af_leaves):
+            return get_template_dict(template_leaves).\
+                setdefault('address_family', {}).\
+                setdefault(af_leaves['per-af-name'].lower(), {})
+
+        stream = XmlStream(output, records=[
+            'ROW_neighbor', 'ROW_vrf', 'ROW_inheritingpeer', 'ROW_persaf',
+            'ROW_inpolicy', 'ROW_outpolicy'])
+        for record, leaves, parents in stream:
+
+            # -----   inheritingpeer  -----
+            if record == 'ROW_inheritingpeer':
+                # <vrf-name>default</vrf-name>
+                # <inheritingpeer>10.186.201.1</inheritingpeer>
+                template_leaves, vrf_leaves = parents[1], parents[2]
+                if not template_leaves.get('templatepeer') or \
+                        not vrf_leaves.get('vrf-name') or \
+                        not leaves.get('inheritingpeer'):
                     continue
+                inherit_peer = leaves['inheritingpeer'].lower()
+                get_template_dict(template_leaves).setdefault('vrf', {}).\
+                    setdefault(vrf_leaves['vrf-name'].lower(), {}).\
+                    setdefault('inheriting_peer', {}).\
+                    setdefault(inherit_peer, {})['inheriting_peer'] = \
+                    inherit_peer
+
+            # -----   in/out policy  -----
+            elif record in ('ROW_inpolicy', 'ROW_outpolicy'):
+                template_leaves, af_leaves = parents[1], parents[2]
+                # <inpolicyname>PERMIT_ALL_RM</inpolicyname>
+                # <inpolicytype>route-map</inpolicytype>
+                direction = record[4:-6]
+                policy = leaves.get(direction + 'policyname')
+                if not template_leaves.get('templatepeer') or \
+                        not af_leaves.get('per-af-name') or not policy:
+                    continue
+                policy_dict = get_af_dict(template_leaves, af_leaves).\
+                    setdefault(direction + '_policy', {}).\
+                    setdefault(policy, {})
+                policy_dict['name'] = policy
+                map_leaves(leaves, {direction + 'policytype': 'type'},
+                           policy_dict)
+
+            # -----   address_family  -----
+            elif record == 'ROW_persaf':
+                if not parents[1].get('templatepeer') or \
+                        not leaves.get('per-af-name'):
+                    continue
+                map_leaves(leaves, self.xml_af_mapping,
+                           get_af_dict(parents[1], leaves))
 
-                if 'address_family' not in etree_dict['template'][template]:
-                    etree_dict['template'][template]['address_family'] = {}
-                if af not in etree_dict['template'][template]['address_family']:
-                    etree_dict['template'][template]['address_family'][af] = {}
-
-                sub_dict = etree_dict['template'][template]['address_family'][af]
-
-                # <conditionmap>DENY_ALL_RM</conditionmap>
-                try:
-                    sub_dict['condition_map'] = \
-                        af_root.find('{}conditionmap'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <advertisemap>BLOCK-ALL</advertisemap>
-                try:
-                    sub_dict['advertise_map'] = \
-                        af_root.find('{}advertisemap'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <advertisemapstatus>Advertise</advertisemapstatus>
-                try:
-                    sub_dict['advertise_map_status'] = \
-                        af_root.find('{}advertisemapstatus'.format(namespace)).text.lower()
-                except Exception:
-                    pass
-
-                try:
-                    # <insoftreconfigallowed>false</insoftreconfigallowed>
-                    if af_root.find('{}insoftreconfigallowed'.format(namespace)).text == 'true':
-                        sub_dict['in_soft_reconfig_allowed'] = True
-                    else:
-                        sub_dict['in_soft_reconfig_allowed'] = False
-                except Exception:
-                    pass
-
-                # <sendcommunity>true</sendcommunity>
-                try:
-                    if af_root.find('{}sendcommunity'.format(namespace)).text == 'true':
-                        sub_dict['send_community'] = True
-                    else:
-                        sub_dict['send_community'] = False
-                except Exception:
-                    pass
-
-                # <sendextcommunity>true</sendextcommunity>
-                try:
-                    if af_root.find('{}sendextcommunity'.format(namespace)).text == 'true':
-                        sub_dict['send_ext_community'] = True
-                    else:
-                        sub_dict['send_ext_community'] = False
-                except Exception:
-                    pass
-
-                # <thirdpartynexthop>false</thirdpartynexthop>
-                try:
-                    if af_root.find('{}thirdpartynexthop'.format(namespace)).text == 'true':
-                        sub_dict['third_party_nexthop'] = True
-                    else:
-                        sub_dict['third_party_nexthop'] = False
-                except Exception:
-                    pass
-
-                # <asoverride>true</asoverride>
-                try:
-                    if af_root.find('{}asoverride'.format(namespace)).text == 'true':
-                        sub_dict['as_override'] = True
-                    else:
-                        sub_dict['as_override'] = False
-                except Exception:
-                    pass
-
-                # <peerascheckdisabled>false</peerascheckdisabled>
-                try:
-                    if af_root.find('{}peerascheckdisabled'.format(namespace)).text == 'true':
-                        sub_dict['peer_as_check_disabled'] = True
-                    else:
-                        sub_dict['peer_as_check_disabled'] = False
-                except Exception:
-                    pass
-
-                # <rrconfigured>false</rrconfigured>
-                try:
-                    if af_root.find('{}rrconfigured'.format(namespace)).text == 'true':
-                        sub_dict['rr_configured'] = True
-                    else:
-                        sub_dict['rr_configured'] = False
-                except:
-                    Exception
-
-                # <localnexthop>0.0.0.0</localnexthop>
-                try:
-                    sub_dict['local_nexthop'] = \
-                        af_root.find('{}localnexthop'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <maxpfx>888888888</maxpfx>
-                try:
-                    sub_dict['max_pfx'] = \
-                        int(af_root.find('{}maxpfx'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <soo>SOO:10.4.1.1:100</soo>
-                try:
-                    sub_dict['soo'] = \
-                        af_root.find('{}soo'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <weight>9999</weight>
-                try:
-                    sub_dict['weight'] = \
-                        int(af_root.find('{}weight'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <allowasin>10</allowasin>
-                try:
-                    sub_dict['allow_as_in'] = \
-                        int(af_root.find('{}allowasin'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <defaultoriginate>true</defaultoriginate>
-                try:
-                    if af_root.find('{}defaultoriginate'.format(namespace)).text == 'true':
-                        sub_dict['default_originate'] = True
-                    else:
-                        sub_dict['default_originate'] = False
-                except Exception:
-                    pass
-
-                # <defaultoriginatermap>PASS-ALL</defaultoriginatermap>
-                try:
-                    sub_dict['default_originate_route_map'] = \
-                        af_root.find('{}defaultoriginatermap'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <unsuppress-map>ORIGINATE_IPV6</unsuppress-map>
-                try:
-                    sub_dict['unsuppress_map'] = \
-                        af_root.find('{}unsuppress-map'.format(namespace)).text
-                except Exception:
-                    pass
-                
-
-                # TABLE_inpolicy table
-                policy = af_root.find('{}TABLE_inpolicy'.format(namespace))
-
-                if policy:
-                    # -----   loop in policy  -----
-                    for policy_root in policy.findall('{}ROW_inpolicy'.format(namespace)):
-                        try:
-                            policy = policy_root.find('{}inpolicyname'.format(namespace)).text
-                        except Exception:
-                            continue
-
-                        if 'in_policy' not in sub_dict:
-                            sub_dict['in_policy'] = {}
-                        if policy not in sub_dict['in_policy']:
-                            sub_dict['in_policy'][policy] = {}
-
-                        sub_dict['in_policy'][policy]['name'] = policy
-
-                        # <inpolicytype>route-map</inpolicytype>
-                        sub_dict['in_policy'][policy]['type'] = \
-                            policy_root.find('{}inpolicytype'.format(namespace)).text
-
-                # TABLE_outpolicy table
-                policy = af_root.find('{}TABLE_outpolicy'.format(namespace))
-
-                if policy:
-                    # -----   loop in policy  -----
-                    for policy_root in policy.findall('{}ROW_outpolicy'.format(namespace)):
-                        try:
-                            policy = policy_root.find('{}outpolicyname'.format(namespace)).text
-                        except Exception:
-                            continue
-                        if 'out_policy' not in sub_dict:
-                            sub_dict['out_policy'] = {}
-                        if policy not in sub_dict['out_policy']:
-                            sub_dict['out_policy'][policy] = {}
-
-                        sub_dict['out_policy'][policy]['name'] = policy
+            # -----   template  -----
+            elif record == 'ROW_neighbor':
+                if leaves.get('templatepeer'):
+                    map_leaves(leaves, self.xml_template_mapping,
+                               get_template_dict(leaves))
 
-                        # <outpolicytype>route-map</outpolicytype>
-                        sub_dict['out_policy'][policy]['type'] = \
-                            policy_root.find('{}outpolicytype'.format(namespace)).text
+        # compare cli command
+        if stream.command:
+            stream.compare_command(self.cli_command)
 
-                                                                                                                         
         return etree_dict
 
 
@@ -4634,27 +4057,27 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
 
         # extract vrf info if specified,
         # if not, vrf is default
-        m = re.compile(r'^show +bgp +vrf +(?P<vrf>\S+)').match(cmd)
+        m = regex_engine.compile(r'^show +bgp +vrf +(?P<vrf>\S+)').match(cmd)
         if m:
             vrf = m.groupdict()['vrf']
             if vrf == 'all':
                 vrf = ''
         else:
             vrf = 'default'
-        p1 = re.compile(r'^Details +for +VRF +'
-                            r'(?P<vrf>[\w\-]+)$')
-        p2 = re.compile(r'^Total +count +for +(?P<type>\w+) +rpm +handles: +'
-                            r'(?P<handles>\d+)$')
-        p3 = re.compile(r'^BGP +policy +statistics +not +available$')
-        p4 = re.compile(r'^route\-map +(?P<name>\S+) +'
-                            r'(?P<action>\w+) +(?P<seqnum>\d+)$')
-        p5 = re.compile(r'^(?P<command>[\w\s\-\>]+) +'
-                            r'C: +(?P<compare_count>\d+) +'
-                            r'M: +(?P<match_count>\d+)$')
-        p6 = re.compile(r'^Total +accept +count +for +policy: +'
-                            r'(?P<total_accept_count>\d+)$')
-        p7 = re.compile(r'^Total +reject +count +for +policy: +'
-                            r'(?P<total_reject_count>\d+)$')
+        p1 = regex_engine.compile(r'^Details +for +VRF +'
+                                      r'(?P<vrf>[\w\-]+)$')
+        p2 = regex_engine.compile(r'^Total +count +for +(?P<type>\w+) +rpm +handles: +'
+                                      r'(?P<handles>\d+)$')
+        p3 = regex_engine.compile(r'^BGP +policy +statistics +not +available$')
+        p4 = regex_engine.compile(r'^route\-map +(?P<name>\S+) +'
+                                      r'(?P<action>\w+) +(?P<seqnum>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<command>[\w\s\-\>]+) +'
+                                      r'C: +(?P<compare_count>\d+) +'
+                                      r'M: +(?P<match_count>\d+)$')
+        p6 = regex_engine.compile(r'^Total +accept +count +for +policy: +'
+                                      r'(?P<total_accept_count>\d+)$')
+        p7 = regex_engine.compile(r'^Total +reject +count +for +policy: +'
+                                      r'(?P<total_reject_count>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4667,7 +4090,7 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
                 continue
 
             # No such neighbor
-            if re.compile(r'No +such +neighbor$').match(line):
+            if regex_engine.compile(r'No +such +neighbor$').match(line):
                 nei_flag = False
 
             # Total count for redistribute rpm handles: 1
@@ -4759,161 +4182,66 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
         return ret_dict
 
 
-    def xml(self, cmd):
-        out = self.device.execute('{cmd} | xml'.format(cmd=cmd))
-
-        etree_dict = {}
-        neighbor = None
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cmd)
-
-        # get neighbor
-        nei = Common.retrieve_xml_child(root=root, key='__XML__PARAM__neighbor-id')
-
-        if hasattr(nei, 'tag'):
-            for item in list(nei):
-                if '__XML__value' in item.tag:
-                    neighbor = item.text
-                    continue
-
-                # cover the senario that __readonly__ may be mssing when
-                # there are values in the output
-                if '__readonly__' in item.tag:
-                    root = list(item)[0]
-                else:
-                    root = item
-        else:
-            # top table rootl
-            root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-polstats'.format(namespace)).text
-            except Exception:
-                break
+    # ROW_rmap leaves
+    xml_rmap_mapping = {
+        'action': 'action',
+        'seqnum': ('seq_num', int),
+        'totalacceptcount': ('total_accept_count', int),
+        'totalrejectcount': ('total_reject_count', int),
+        'TABLE_cmd/ROW_cmd/comparecount': (('command', 'compare_count'), int),
+        'TABLE_cmd/ROW_cmd/matchcount': (('command', 'match_count'), int),
+    }
 
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
+    def xml(self, cmd, output=None):
+        if output is None:
+            output = self.device.execute('{cmd} | xml'.format(cmd=cmd))
 
-            # <rpm-handle-count>1</rpm-handle-count>
-            etree_dict['vrf'][vrf]['rpm_handle_count'] = \
-                int(vrf_tree.find('{}rpm-handle-count'.format(namespace)).text)
+        etree_dict = {}
 
-             # route_map table
-            rpm_tree = vrf_tree.find('{}TABLE_rmap'.format(namespace))
-            if not rpm_tree:
-                continue
+        stream = XmlStream(output, records=['ROW_vrf', 'ROW_rmap'])
+        for record, leaves, parents in stream:
 
-            # -----   loop route_map  -----
-            for rmp_root in rpm_tree.findall('{}ROW_rmap'.format(namespace)):
-                # route map
-                try:
-                    name = rmp_root.find('{}name'.format(namespace)).text
-                    name = name.replace('&gt;', '>')
-                except Exception:
+            # -----   route_map  -----
+            if record == 'ROW_rmap':
+                # <vrf-name-polstats>default</vrf-name-polstats>
+                vrf = parents[-1].get('vrf-name-polstats')
+                name = leaves.get('name')
+                if not vrf or not name:
                     continue
-
-                if 'route_map' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['route_map'] = {}
-
-                if name not in etree_dict['vrf'][vrf]['route_map']:
-                    etree_dict['vrf'][vrf]['route_map'][name] = {}
-                    # initial index
-                    index = 1
-                else:
-                    index += 1
-                    
-                if index not in etree_dict['vrf'][vrf]['route_map'][name]:
-                    etree_dict['vrf'][vrf]['route_map'][name][index] = {}
-
+                route_map_dict = etree_dict.setdefault('vrf', {}).\
+                    setdefault(vrf, {}).setdefault('route_map', {}).\
+                    setdefault(name.replace('&gt;', '>'), {})
+                index = len(route_map_dict) + 1
+                index_dict = route_map_dict[index] = {}
 
                 # <action>deny</action>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['action'] = \
-                        rmp_root.find('{}action'.format(namespace)).text
-                except Exception:
-                    pass
-
                 # <seqnum>10</seqnum>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['seq_num'] = \
-                        int(rmp_root.find('{}seqnum'.format(namespace)).text)
-                except Exception:
-                    pass
-
                 # <totalacceptcount>0</totalacceptcount>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['total_accept_count'] = \
-                        int(rmp_root.find('{}totalacceptcount'.format(namespace)).text)
-                except Exception:
-                    pass
-
                 # <totalrejectcount>2</totalrejectcount>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['total_reject_count'] = \
-                        int(rmp_root.find('{}totalrejectcount'.format(namespace)).text)
-                except Exception:
-                    pass
-
-
-                # TABLE_cmd table
-                command = rmp_root.find('{}TABLE_cmd'.format(namespace))
+                map_leaves(leaves, self.xml_rmap_mapping, index_dict)
+
+                # TABLE_cmd
+                #   ROW_cmd
+                cmd_str = (leaves.get('TABLE_cmd/ROW_cmd/command') or '').strip()
+                if cmd_str:
+                    index_dict.setdefault('command', {})['command'] = \
+                        cmd_str.replace('&gt;', '>')
+                else:
+                    index_dict.pop('command', None)
 
-                if not command:
+            # -----   vrf  -----
+            elif record == 'ROW_vrf':
+                vrf = leaves.get('vrf-name-polstats')
+                if not vrf:
                     continue
+                # <rpm-handle-count>1</rpm-handle-count>
+                map_leaves(leaves, {'rpm-handle-count': ('rpm_handle_count', int)},
+                           etree_dict.setdefault('vrf', {}).setdefault(vrf, {}))
 
-                # -----   loop command  -----
-                for command_root in command.findall('{}ROW_cmd'.format(namespace)):
-                    try:
-                        cmd_str = command_root.find('{}command'.format(namespace)).text.strip()
-                        cmd_str = cmd_str.replace('&gt;', '>')
-                    except Exception:
-                        continue
-
-                    if 'command' not in etree_dict['vrf'][vrf]['route_map'][name][index]:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]['command'] = {}
-
-                    # command
-                    etree_dict['vrf'][vrf]['route_map'][name][index]\
-                        ['command']['command'] = cmd_str
+        # compare cli command
+        if stream.command:
+            stream.compare_command(cmd)
 
-                    # <comparecount>2</comparecount>
-                    try:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]\
-                            ['command']['compare_count'] = \
-                                int(command_root.find('{}comparecount'.format(namespace)).text)
-                    except Exception:
-                        pass
-                    
-                    # <matchcount>0</matchcount>
-                    try:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]\
-                            ['command']['match_count'] = \
-                                int(command_root.find('{}matchcount'.format(namespace)).text)
-                    except Exception:
-                        pass
         return etree_dict
 
 # ===============================================================================
@@ -4945,7 +4273,7 @@ class ShowBgpPolicyStatisticsRedistribute(ShowBgpPolicyStatisticsParser):
 
         return super().cli(cmd=cmd, output=output)
 
-    def xml(self, address_family, vrf=''):
+    def xml(self, address_family, vrf='', output=None):
 
         if vrf:
             cmd = self.xml_command[0].format(vrf=vrf, address_family=address_family)
@@ -4953,7 +4281,7 @@ class ShowBgpPolicyStatisticsRedistribute(ShowBgpPolicyStatisticsParser):
             cmd = self.xml_command[1].format(address_family=address_family)
 
 
-        return super().xml(cmd=cmd)
+        return super().xml(cmd=cmd, output=output)
 
 # ==================================================================================
 # Parser for 'show bgp vrf <vrf> <address_family> policy statistics neighbor <WORD>'
@@ -4978,13 +4306,13 @@ class ShowBgpPolicyStatisticsNeighbor(ShowBgpPolicyStatisticsParser):
 
         return super().cli(cmd=cmd,output=output)
 
-    def xml(self, address_family, neighbor, vrf=''):
+    def xml(self, address_family, neighbor, vrf='', output=None):
         if vrf:
             cmd = self.xml_command[0].format(vrf=vrf, address_family=address_family, neighbor=neighbor)
         else:
             cmd = self.xml_command[1].format(address_family=address_family, neighbor=neighbor)
 
-        return super().xml(cmd=cmd)
+        return super().xml(cmd=cmd, output=output)
 
 # ============================================================================
 # Parser for 'show bgp vrf <vrf> <address_family> policy statistics dampening'
@@ -5006,14 +4334,14 @@ class ShowBgpPolicyStatisticsDampening(ShowBgpPolicyStatisticsParser):
             cmd = ""
         return super().cli(cmd=cmd,output=output)
 
-    def xml(self, address_family, vrf=''):
+    def xml(self, address_family, vrf='', output=None):
 
         if vrf:
             cmd = self.xml_command[0].format(vrf=vrf, address_family=address_family)
         else:
             cmd = self.xml_command[1].format(vrf=vrf, address_family=address_family)
 
-        return super().xml(cmd=cmd)
+        return super().xml(cmd=cmd, output=output)
 
 
 # =========================================
@@ -5084,56 +4412,56 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                       'C': 'closing',
                       'S': 'shutdown'}
         # Total peers 4, established peers 3
-        p1 = re.compile(r'^Total +peers +(?P<total>\d+), +'
-                            r'established +peers +(?P<established>\d+)$')
+        p1 = regex_engine.compile(r'^Total +peers +(?P<total>\d+), +'
+                                      r'established +peers +(?P<established>\d+)$')
         # ASN 100
-        p2 = re.compile(r'^ASN +(?P<asn>\d+)$')
+        p2 = regex_engine.compile(r'^ASN +(?P<asn>\d+)$')
         # VRF default, local ASN 100
-        p3 = re.compile(r'^VRF +(?P<vrf>\S+), +'
-                            r'local +ASN +(?P<asn>\d+)$')
+        p3 = regex_engine.compile(r'^VRF +(?P<vrf>\S+), +'
+                                      r'local +ASN +(?P<asn>\d+)$')
         # peers 4, established peers 3, local router-id 10.1.1.1
-        p4 = re.compile(r'^peers +(?P<peer>\d+), +'
-                            r'established +peers +(?P<established>\d+), +'
-                            r'local +router\-id +(?P<id>[\w\.\:]+)$')
+        p4 = regex_engine.compile(r'^peers +(?P<peer>\d+), +'
+                                      r'established +peers +(?P<established>\d+), +'
+                                      r'local +router\-id +(?P<id>[\w\.\:]+)$')
         # 10.51.1.101        300 2     00:30:01|never   |never    I   0/0          2/0
-        p5 = re.compile(r'^(?P<nei>[\w\.\:]+) +'
-                            r'(?P<asn>\d+) +'
-                            r'(?P<dropped>\d+) +'
-                            r'(?P<last_flap>[\w\.\:]+) *\|'
-                            r'(?P<last_read>[\w\.\:]+) *\|'
-                            r'(?P<last_write>[\w\.\:]+) +'
-                            r'(?P<state>[a-zA-Z]) +'
-                            r'(?P<local_port>\d+)\/'
-                            r'(?P<remote_port>\d+) +'
-                            r'(?P<notifications_sent>\d+)\/'
-                            r'(?P<notifications_received>\d+)$')
+        p5 = regex_engine.compile(r'^(?P<nei>[\w\.\:]+) +'
+                                      r'(?P<asn>\d+) +'
+                                      r'(?P<dropped>\d+) +'
+                                      r'(?P<last_flap>[\w\.\:]+) *\|'
+                                      r'(?P<last_read>[\w\.\:]+) *\|'
+                                      r'(?P<last_write>[\w\.\:]+) +'
+                                      r'(?P<state>[a-zA-Z]) +'
+                                      r'(?P<local_port>\d+)\/'
+                                      r'(?P<remote_port>\d+) +'
+                                      r'(?P<notifications_sent>\d+)\/'
+                                      r'(?P<notifications_received>\d+)$')
         # fe80::7e21:eff:fe2e:cc58%Ethernet1/2
-        p6_1 = re.compile(r'^(?P<nei>[a-zA-Z0-9\.\:\/\[\]\,]+)%'
-                           r'(?P<linklocal_interfaceport>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
+        p6_1 = regex_engine.compile(r'^(?P<nei>[a-zA-Z0-9\.\:\/\[\]\,]+)%'
+                                     r'(?P<linklocal_interfaceport>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
         #                     1 0     00:00:18|00:00:17|00:00:17 E   20230/179        0/0
-        p6_2 = re.compile(r'^(?P<asn>\d+) +'
-                            r'(?P<dropped>\d+) +'
-                            r'(?P<last_flap>[\w\.\:]+) *\|'
-                            r'(?P<last_read>[\w\.\:]+) *\|'
-                            r'(?P<last_write>[\w\.\:]+) +'
-                            r'(?P<state>[a-zA-Z]) +'
-                            r'(?P<local_port>\d+)\/'
-                            r'(?P<remote_port>\d+) +'
-                            r'(?P<notifications_sent>\d+)\/'
-                            r'(?P<notifications_received>\d+)$')
+        p6_2 = regex_engine.compile(r'^(?P<asn>\d+) +'
+                                      r'(?P<dropped>\d+) +'
+                                      r'(?P<last_flap>[\w\.\:]+) *\|'
+                                      r'(?P<last_read>[\w\.\:]+) *\|'
+                                      r'(?P<last_write>[\w\.\:]+) +'
+                                      r'(?P<state>[a-zA-Z]) +'
+                                      r'(?P<local_port>\d+)\/'
+                                      r'(?P<remote_port>\d+) +'
+                                      r'(?P<notifications_sent>\d+)\/'
+                                      r'(?P<notifications_received>\d+)$')
         # 4.4.4.1         4258745628
-        p7_1 = re.compile(r'^(?P<nei>[\da-f.\:]+) +'
-                            r'(?P<asn>\d+)$')
+        p7_1 = regex_engine.compile(r'^(?P<nei>[\da-f.\:]+) +'
+                                      r'(?P<asn>\d+)$')
         #                     0     00:01:39|00:00:11|00:00:20 E   179/21890      0/0
-        p7_2 = re.compile(r'^(?P<dropped>\d+) +'
-                            r'(?P<last_flap>[\w\.\:]+) *\|'
-                            r'(?P<last_read>[\w\.\:]+) *\|'
-                            r'(?P<last_write>[\w\.\:]+) +'
-                            r'(?P<state>[a-zA-Z]) +'
-                            r'(?P<local_port>\d+)\/'
-                            r'(?P<remote_port>\d+) +'
-                            r'(?P<notifications_sent>\d+)\/'
-                            r'(?P<notifications_received>\d+)$')
+        p7_2 = regex_engine.compile(r'^(?P<dropped>\d+) +'
+                                      r'(?P<last_flap>[\w\.\:]+) *\|'
+                                      r'(?P<last_read>[\w\.\:]+) *\|'
+                                      r'(?P<last_write>[\w\.\:]+) +'
+                                      r'(?P<state>[a-zA-Z]) +'
+                                      r'(?P<local_port>\d+)\/'
+                                      r'(?P<remote_port>\d+) +'
+                                      r'(?P<notifications_sent>\d+)\/'
+                                      r'(?P<notifications_received>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5319,7 +4647,26 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
 
         return ret_dict
 
-    def xml(self, vrf=''):
+    # ROW_vrf leaves
+    xml_vrf_mapping = {
+        'local-as': ('local_as', int),
+        'vrfpeers': ('vrf_peers', int),
+        'vrfestablishedpeers': ('vrf_established_peers', int),
+        'router-id': 'router_id',
+    }
+
+    # ROW_neighbor leaves
+    xml_neighbor_mapping = {
+        'connectionsdropped': ('connections_dropped', int),
+        'remoteas': ('remote_as', int),
+        'state': ('state', str.lower),
+        'localport': ('local_port', int),
+        'remoteport': ('remote_port', int),
+        'notificationssent': ('notifications_sent', int),
+        'notificationsreceived': ('notifications_received', int),
+    }
+
+    def xml(self, vrf='', output=None):
         if vrf:
             cmd = self.xml_command[0].format(vrf=vrf)
             cli_cmd = self.cli_command[0].format(vrf=vrf)
@@ -5327,188 +4674,58 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
             cmd = self.xml_command[1]
             cli_cmd = self.cli_command[1]
 
-        out = self.device.execute(cmd)
+        if output is None:
+            output = self.device.execute(cmd)
 
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
-
-        ret = Common.retrieve_xml_child(
-                root=root,
-                key='__readonly__')
-
-        if hasattr(ret, 'tag'):
-            # get total_peers                
-            try:
-                total_peers = ret.find('{}totalpeers'.format(namespace)).text
-                etree_dict['total_peers'] = int(total_peers)
-            except Exception:
-                pass
-
-            # get total_established_peers            
-            try:
-                total_established_peers = ret.find(
-                    '{}totalestablishedpeers'.format(namespace)).text
-                etree_dict['total_established_peers'] = int(total_established_peers)
-            except Exception:
-                pass
-
-            # get local_as               
-            try:
-                local_as = ret.find('{}localas'.format(namespace)).text
-                etree_dict['local_as'] = int(local_as)
-            except Exception:
-                pass
-
-        else:
-            # output is empty
-            return etree_dict
+        stream = XmlStream(output, records=['__readonly__', 'ROW_vrf',
+                                            'ROW_neighbor'])
+        for record, leaves, parents in stream:
 
-        # find Vrf root
-        root = ret.find('{}TABLE_vrf'.format(namespace))
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
-
-            # <local-as>333</local-as>
-            etree_dict['vrf'][vrf]['local_as'] = \
-                int(vrf_tree.find('{}local-as'.format(namespace)).text)
-
-            # <vrfpeers>3</vrfpeers>
-            etree_dict['vrf'][vrf]['vrf_peers'] = \
-                int(vrf_tree.find('{}vrfpeers'.format(namespace)).text)
-
-            # <vrfestablishedpeers>2</vrfestablishedpeers>
-            etree_dict['vrf'][vrf]['vrf_established_peers'] = \
-                int(vrf_tree.find('{}vrfestablishedpeers'.format(namespace)).text)
-                
-            # <router-id>10.106.0.6</router-id>
-            etree_dict['vrf'][vrf]['router_id'] = \
-                vrf_tree.find('{}router-id'.format(namespace)).text
-                
-             # Neighbor table
-            nei_tree = vrf_tree.find('{}TABLE_neighbor'.format(namespace))
-            if not nei_tree:
-                continue
-
-            # -----   loop neighbors  -----
-            for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                # neighbor
-                try:
-                    nei = nei_root.find('{}neighbor-id'.format(namespace)).text
-                except Exception:
+            # -----   neighbor  -----
+            if record == 'ROW_neighbor':
+                vrf = parents[-1].get('vrf-name-out')
+                nei = leaves.get('neighbor-id')
+                if not vrf or not nei:
                     continue
-
-                if 'neighbor' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['neighbor'] = {}
-
-                if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                    etree_dict['vrf'][vrf]['neighbor'][nei] = {}
-
-                # <connectionsdropped>0</connectionsdropped>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['connections_dropped'] = \
-                        int(nei_root.find('{}connectionsdropped'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <remoteas>333</remoteas>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['remote_as'] = \
-                        int(nei_root.find('{}remoteas'.format(namespace)).text)
-                except Exception:
-                    pass
+                nei_dict = map_leaves(
+                    leaves, self.xml_neighbor_mapping,
+                    etree_dict.setdefault('vrf', {}).setdefault(vrf, {}).\
+                    setdefault('neighbor', {}).setdefault(nei, {}))
 
                 # <lastflap>PT1H4M41S</lastflap>
-                try:
-                    ret = nei_root.find('{}lastflap'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = 'never'
-                    
                 # <lastread>PT47S</lastread>
-                try:
-                    ret = nei_root.find('{}lastread'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = 'never'
-                    
                 # <lastwrite>PT15S</lastwrite>
-                try:
-                    ret = nei_root.find('{}lastwrite'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = 'never'
-                    
-                # <state>Established</state>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['state'] = \
-                        nei_root.find('{}state'.format(namespace)).text.lower()
-                except Exception:
-                    pass
-                    
-                # <localport>179</localport>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['local_port'] = \
-                        int(nei_root.find('{}localport'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <remoteport>48392</remoteport>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['remote_port'] = \
-                        int(nei_root.find('{}remoteport'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <notificationssent>0</notificationssent>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_sent'] = \
-                        int(nei_root.find('{}notificationssent'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <notificationsreceived>0</notificationsreceived>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_received'] = \
-                        int(nei_root.find('{}notificationsreceived'.format(namespace)).text)
-                except Exception:
-                    pass                    
+                for tag, key in (('lastflap', 'last_flap'),
+                                 ('lastread', 'last_read'),
+                                 ('lastwrite', 'last_write')):
+                    try:
+                        ret = Common.convert_xml_time(leaves[tag])
+                        nei_dict[key] = 'never' if 'P' in ret else ret
+                    except Exception:
+                        nei_dict[key] = 'never'
+
+            # -----   vrf  -----
+            elif record == 'ROW_vrf':
+                vrf = leaves.get('vrf-name-out')
+                if vrf:
+                    map_leaves(leaves, self.xml_vrf_mapping,
+                               etree_dict.setdefault('vrf', {}).\
+                               setdefault(vrf, {}))
+
+            elif record == '__readonly__':
+                # <totalpeers>3</totalpeers>
+                # <totalestablishedpeers>2</totalestablishedpeers>
+                # <localas>333</localas>
+                map_leaves(leaves, {
+                    'totalpeers': ('total_peers', int),
+                    'totalestablishedpeers': ('total_established_peers', int),
+                    'localas': ('local_as', int)}, etree_dict)
+
+        # compare cli command
+        if stream.command:
+            stream.compare_command(cli_cmd)
 
         return etree_dict
 
@@ -5621,21 +4838,21 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
                          'r': 'redist',
                          'a': 'aggregate',
                          'I': 'injected'}
-        p1 = re.compile(r'^BGP +routing +table +information +for +VRF +(?P<vrf>\S+), +'
-                            r'address +family +(?P<af>[\w\s]+)$')
-        p2 = re.compile(r'^BGP +table +version +is +(?P<ver>\d+), +'
-                            r'(L|l)ocal +(R|r)outer +ID +is +(?P<router_id>[\w\.\:]+)$')
-        p4 = re.compile(r'^Route +Distinguisher: +(?P<rd>[\w\.\:]+) +'
-                            r'\(VRF +(?P<vrf>\S+)\)$')
-        p3 = re.compile(r'^(?P<status>s|S|x|d|h|\*)?'
-                            r'(?P<best>\>)?'
-                            r' *(?P<type_code>i|e|c|l|a|r|I)'
-                            r'(?P<prefix>[\w\/\.\:]+)?'
-                            r' +(?P<next_hop>[\w\/\.\:]+)'
-                            r'(?: +(?P<in_label>\w+)\/(?P<out_label>\w+))?'
-                            r'(?: +\((?P<vpn>(\S+))\))?$')
-        p3_1 = re.compile(r'^(?P<in_label>\w+)\/(?P<out_label>\w+)'
-                            r'(?: +\((?P<vpn>(\S+))\))?$')
+        p1 = regex_engine.compile(r'^BGP +routing +table +information +for +VRF +(?P<vrf>\S+), +'
+                                      r'address +family +(?P<af>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^BGP +table +version +is +(?P<ver>\d+), +'
+                                      r'(L|l)ocal +(R|r)outer +ID +is +(?P<router_id>[\w\.\:]+)$')
+        p4 = regex_engine.compile(r'^Route +Distinguisher: +(?P<rd>[\w\.\:]+) +'
+                                      r'\(VRF +(?P<vrf>\S+)\)$')
+        p3 = regex_engine.compile(r'^(?P<status>s|S|x|d|h|\*)?'
+                                      r'(?P<best>\>)?'
+                                      r' *(?P<type_code>i|e|c|l|a|r|I)'
+                                      r'(?P<prefix>[\w\/\.\:]+)?'
+                                      r' +(?P<next_hop>[\w\/\.\:]+)'
+                                      r'(?: +(?P<in_label>\w+)\/(?P<out_label>\w+))?'
+                                      r'(?: +\((?P<vpn>(\S+))\))?$')
+        p3_1 = regex_engine.compile(r'^(?P<in_label>\w+)\/(?P<out_label>\w+)'
+                                      r'(?: +\((?P<vpn>(\S+))\))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -5770,7 +4987,18 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
 
         return ret_dict
 
-    def xml(self, address_family, vrf=''):
+    # ROW_path leaves
+    xml_path_mapping = {
+        'status': 'status',
+        'best': ('best_path', lambda best: 'none' not in best),
+        'type': 'type',
+        'ipv6nexthop': 'nexthop',
+        'ipnexthop': 'nexthop',
+        'inlabel': 'in_label',
+        'outlabel': 'out_label',
+    }
+
+    def xml(self, address_family, vrf='', output=None):
         assert address_family in ['ipv4 unicast', 'ipv4 multicast',
                                   'ipv6 unicast', 'ipv6 multicast',
                                   'vpnv4 unicast', 'vpnv6 unicast']
@@ -5781,227 +5009,110 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
             cli_cmd = self.cli_command[0].format(address_family=address_family, vrf=vrf)
         else:
             cmd = self.xml_command[1].format(address_family=address_family)
-            cli_cmd = self.cli_command[0].format(address_family=address_family)
+            cli_cmd = self.cli_command[1].format(address_family=address_family)
 
-        out = self.device.execute(cmd)
+        if output is None:
+            output = self.device.execute(cmd)
 
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
-
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_afi'.format(namespace))
-            if not af_tree:
-                continue
-            for af_root in af_tree.findall('{}ROW_afi'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_safi'.format(namespace))
-                if not saf_tree:
+        def get_af_dict(vrf_leaves, saf_leaves):
+            return etree_dict.setdefault('vrf', {}).\
+                setdefault(vrf_leaves['vrf-name-out'], {}).\
+                setdefault('address_family', {}).\
+                setdefault(saf_leaves['af-name'].lower(), {})
+
+        def get_prefix_dict(vrf_leaves, saf_leaves, rd_leaves, prefix_leaves):
+            sub_dict = get_af_dict(vrf_leaves, saf_leaves)
+            # <rd_val>100:100</rd_val>
+            rd = rd_leaves.get('rd_val')
+            if rd:
+                sub_dict = sub_dict.setdefault('route_distinguisher', {}).\
+                    setdefault(rd, {})
+            # <ipprefix>10.1.1.1</ipprefix>
+            # <ipv6prefix>2001:db8:4309::/112</ipv6prefix>
+            prefix = prefix_leaves.get('ipprefix') or \
+                prefix_leaves.get('ipv6prefix')
+            return sub_dict.setdefault('prefix', {}).setdefault(prefix, {})
+
+        stream = XmlStream(output, records=['ROW_vrf', 'ROW_safi', 'ROW_rd',
+                                            'ROW_prefix', 'ROW_path'])
+        for record, leaves, parents in stream:
+            if record not in ('ROW_safi', 'ROW_rd', 'ROW_prefix', 'ROW_path'):
+                continue
+
+            # <vrf-name-out>default</vrf-name-out>
+            # <af-name>IPv4 Unicast</af-name>
+            vrf_leaves = parents[1]
+            saf_leaves = parents[2] if len(parents) > 2 else leaves
+            if not vrf_leaves.get('vrf-name-out') or \
+                    not saf_leaves.get('af-name'):
+                continue
+
+            # -----   path  -----
+            if record == 'ROW_path':
+                prefix_leaves = parents[4]
+                if not prefix_leaves.get('ipprefix') and \
+                        not prefix_leaves.get('ipv6prefix'):
                     continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_safi'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                    except Exception:
-                        continue
-
-                    # <table-version>7</table-version>
-                    try:
-                        table_version = \
-                            int(saf_root.find('{}table-version'.format(namespace)).text)
-                    except Exception:
-                        table_version = None
-
-                    # <router-id>10.106.0.6</router-id>
-                    try:
-                        router_id = \
-                            saf_root.find('{}router-id'.format(namespace)).text
-                    except Exception:
-                        router_id = None
-
-                    if table_version or router_id:
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['address_family']:
-                            etree_dict['vrf'][vrf]['address_family'][af] = {}
-                        if table_version:
-                            etree_dict['vrf'][vrf]['address_family'][af]['table_version'] = table_version
-                        if router_id:
-                            etree_dict['vrf'][vrf]['address_family'][af]['router_id'] = router_id
-
-                     # RD table
-                    rd_tree = saf_root.find('{}TABLE_rd'.format(namespace))
-                    if not rd_tree:
-                        continue
-
-                    # -----   loop rd  -----
-                    for rd_root in rd_tree.findall('{}ROW_rd'.format(namespace)):
-                        # neighbor
-                        try:
-                            rd = rd_root.find('{}rd_val'.format(namespace)).text
-                        except Exception:
-                            rd = None
-
-                        if rd:
-                            if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'] = {}
-
-                            if rd not in etree_dict['vrf'][vrf]['address_family']:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd] = {}
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd]
-                        else:
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
-
-                        # <rd_vrf>vrf-9100</rd_vrf>
-                        try:
-                            sub_dict['rd_vrf'] = rd_root.find('{}rd_vrf'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                         # prefix table
-                        prefix_tree = rd_root.find('{}TABLE_prefix'.format(namespace))
-                        if not prefix_tree:
-                            continue
-
-                        # -----   loop prefix  -----
-                        for prefix_root in prefix_tree.findall('{}ROW_prefix'.format(namespace)):
-                            # <ipprefix>10.1.1.1</ipprefix>
-                            try:
-                                prefix = prefix_root.find('{}ipprefix'.format(namespace)).text
-                            except Exception:
-                                # <ipv6prefix>2001:db8:4309::/112</ipv6prefix>
-                                try:
-                                    prefix = prefix_root.find('{}ipv6prefix'.format(namespace)).text
-                                except Exception:
-                                    continue 
-
-                            if 'prefix' not in sub_dict:
-                                sub_dict['prefix'] = {}
-
-                            if prefix not in sub_dict['prefix']:
-                                sub_dict['prefix'][prefix] = {}
-
-                             # path table
-                            index_tree = prefix_root.find('{}TABLE_path'.format(namespace))
-                            if not index_tree:
-                                continue
-
-                            # -----   loop path  -----
-                            for index_root in index_tree.findall('{}ROW_path'.format(namespace)):
-                                # neighbor
-                                try:
-                                    index = int(index_root.find('{}pathnr'.format(namespace)).text)
-                                except Exception:
-                                    continue
-
-                                if 'index' not in sub_dict['prefix'][prefix]:
-                                    sub_dict['prefix'][prefix]['index'] = {}
-
-                                if index not in sub_dict['prefix'][prefix]['index']:
-                                    sub_dict['prefix'][prefix]['index'][index] = {}
-
-                                # <status>valid</status>
-                                sub_dict['prefix'][prefix]['index'][index]['status'] = \
-                                    index_root.find('{}status'.format(namespace)).text
-
-                                # <best>bestpath</best>
-                                sub_dict['prefix'][prefix]['index'][index]['best_path'] = \
-                                    False if 'none' in index_root.find('{}best'.format(namespace)).text \
-                                    else True
-
-                                # <type>internal</type>
-                                sub_dict['prefix'][prefix]['index'][index]['type'] = \
-                                    index_root.find('{}type'.format(namespace)).text
-
-                                try:
-                                    # <statuscode>*</statuscode>
-                                    status_code = index_root.find('{}statuscode'.format(namespace)).text
-                                    sub_dict['prefix'][prefix]['index'][index]\
-                                        .setdefault('status_code', status_code) if status_code.strip() else None                                        
-
-                                    # <bestcode>&gt;</bestcode>
-                                    best_code = index_root.find('{}bestcode'.format(namespace)).text
-                                    best_code = '>' if '&gt;' in best_code else best_code.strip()
-                                    if best_code:
-                                        sub_dict['prefix'][prefix]['index'][index]['best_code'] = best_code
-                                       
-                                    # <typecode>i</typecode>
-                                    sub_dict['prefix'][prefix]['index'][index]['type_code'] = \
-                                        index_root.find('{}typecode'.format(namespace)).text
-                                except Exception:
-                                    pass
-
-                                # <ipnexthop>10.106.101.1</ipnexthop>
-                                try:
-                                    sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
-                                        index_root.find('{}ipnexthop'.format(namespace)).text
-                                except Exception:
-                                    # <ipv6nexthop>2001:db8:1900:1::1:101</ipv6nexthop>
-                                    try:
-                                        sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
-                                            index_root.find('{}ipv6nexthop'.format(namespace)).text
-                                    except Exception:
-                                        pass
-
-                                # <inlabel>nolabel</inlabel>
-                                sub_dict['prefix'][prefix]['index'][index]['in_label'] = \
-                                    index_root.find('{}inlabel'.format(namespace)).text
-
-                                # <outlabel>nolabel</outlabel>
-                                sub_dict['prefix'][prefix]['index'][index]['out_label'] = \
-                                    index_root.find('{}outlabel'.format(namespace)).text
-
-                                # <vpn></vpn>
-                                vpn = index_root.find('{}vpn'.format(namespace)).text
-                                if vpn:
-                                    sub_dict['prefix'][prefix]['index'][index]['vpn'] = vpn
-                                    
+                try:
+                    index = int(leaves.get('pathnr'))
+                except (TypeError, ValueError):
+                    continue
+                index_dict = get_prefix_dict(
+                    vrf_leaves, saf_leaves, parents[3], prefix_leaves).\
+                    setdefault('index', {}).setdefault(index, {})
+                map_leaves(leaves, self.xml_path_mapping, index_dict)
+
+                # <statuscode>*</statuscode>
+                # <bestcode>&gt;</bestcode>
+                # <typecode>i</typecode>
+                if (leaves.get('statuscode') or '').strip():
+                    index_dict.setdefault('status_code', leaves['statuscode'])
+                if leaves.get('statuscode') is not None and \
+                        leaves.get('bestcode') is not None:
+                    best_code = '>' if '&gt;' in leaves['bestcode'] \
+                        else leaves['bestcode'].strip()
+                    if best_code:
+                        index_dict['best_code'] = best_code
+                    if 'typecode' in leaves:
+                        index_dict['type_code'] = leaves['typecode']
+
+                # <vpn></vpn>
+                # <hold_down></hold_down>
+                map_leaves(leaves, {'vpn': 'vpn', 'hold_down': 'hold_down'},
+                           index_dict)
+
+            # -----   prefix  -----
+            elif record == 'ROW_prefix':
+                if leaves.get('ipprefix') or leaves.get('ipv6prefix'):
+                    get_prefix_dict(vrf_leaves, saf_leaves, parents[3],
+                                    leaves)
+
+            # -----   rd  -----
+            elif record == 'ROW_rd':
+                # <rd_vrf>vrf-9100</rd_vrf>
+                sub_dict = get_af_dict(vrf_leaves, saf_leaves)
+                if leaves.get('rd_val'):
+                    sub_dict = sub_dict.setdefault('route_distinguisher', {}).\
+                        setdefault(leaves['rd_val'], {})
+                map_leaves(leaves, {'rd_vrf': 'rd_vrf'}, sub_dict)
+
+            # -----   address_family  -----
+            else:
+                # <table-version>7</table-version>
+                # <router-id>10.106.0.6</router-id>
+                attributes = map_leaves(leaves, {
+                    'table-version': ('table_version', int),
+                    'router-id': 'router_id'})
+                attributes = {key: value for key, value in attributes.items()
+                              if value}
+                if attributes:
+                    get_af_dict(vrf_leaves, leaves).update(attributes)
 
-                                # <hold_down></hold_down>
-                                hold_down = index_root.find('{}hold_down'.format(namespace)).text
-                                if hold_down:
-                                    sub_dict['prefix'][prefix]['index'][index]['hold_down'] = hold_down
+        # compare cli command
+        if stream.command:
+            stream.compare_command(cli_cmd)
 
         return etree_dict
 
@@ -6108,31 +5219,31 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
         # 1.1.1.2   4 4444444444
         #                         118316  117369     5549    0    0     3w4d 142  
 
-        p1 = re.compile(r'^\s*BGP +summary +information +for +VRF +(?P<vrf_name_out>[\w]+),'
-                        r' +address +family +(?P<af_name>[\w\s]+)$')
-        p2 = re.compile(
+        p1 = regex_engine.compile(r'^\s*BGP +summary +information +for +VRF +(?P<vrf_name_out>[\w]+),'
+                                  r' +address +family +(?P<af_name>[\w\s]+)$')
+        p2 = regex_engine.compile(
             r'^\s*BGP +router +identifier +(?P<vrf_router_id>[\d\.]+), +local +AS +number +(?P<vrf_local_as>[\d]+)$')
-        p3 = re.compile(r'^\s*BGP +table +version +is +(?P<tableversion>[\d]+), +(?P<af_name>[\w\s]+)'
-                        r' +config +peers +(?P<configuredpeers>[\d]+),'
-                        r' +capable +peers +(?P<capablepeers>[\d]+)$')
-        p4 = re.compile(
+        p3 = regex_engine.compile(r'^\s*BGP +table +version +is +(?P<tableversion>[\d]+), +(?P<af_name>[\w\s]+)'
+                                  r' +config +peers +(?P<configuredpeers>[\d]+),'
+                                  r' +capable +peers +(?P<capablepeers>[\d]+)$')
+        p4 = regex_engine.compile(
             r'^\s*(?P<totalnetworks>[\d]+) +network +entries +and +(?P<totalpaths>[\d]+) +paths +using'
             r' +(?P<memoryused>[\d]+) +bytes +of +memory$')
-        p5 = re.compile(r'^\s*BGP +attribute +entries +\[(?P<numberattrs>[\d]+)\/(?P<bytesattrs>[\d]+)\],'
-                        r' +BGP +AS +path +entries +\[(?P<numberpaths>[\d]+)\/(?P<bytespaths>[\d]+)\]$')
+        p5 = regex_engine.compile(r'^\s*BGP +attribute +entries +\[(?P<numberattrs>[\d]+)\/(?P<bytesattrs>[\d]+)\],'
+                                  r' +BGP +AS +path +entries +\[(?P<numberpaths>[\d]+)\/(?P<bytespaths>[\d]+)\]$')
 
-        p6 = re.compile(r'^\s*BGP +community +entries +\[(?P<numbercommunities>[\d]+)\/(?P<bytescommunities>[\d]+)\],'
-                        r' +BGP +clusterlist +entries +\[(?P<numberclusterlist>[\d]+)\/(?P<bytesclusterlist>[\d]+)\]$')
+        p6 = regex_engine.compile(r'^\s*BGP +community +entries +\[(?P<numbercommunities>[\d]+)\/(?P<bytescommunities>[\d]+)\],'
+                                  r' +BGP +clusterlist +entries +\[(?P<numberclusterlist>[\d]+)\/(?P<bytesclusterlist>[\d]+)\]$')
 
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r'^\s*(?P<neighborid>[\w\.\:]+) +(?P<neighborversion>[\d]+) +(?P<neighboras>[\d]+) +(?P<msgrecvd>[\d]+)'
             r' +(?P<msgsent>[\d]+) +(?P<neighbortableversion>[\d]+) +(?P<inq>[\d]+) +(?P<outq>[\d]+)'
             r' +(?P<time>[\w\:]+) +(?P<prefixreceived>[\w\s\)\(]+)$')
         
-        p8a = re.compile(
+        p8a = regex_engine.compile(
             r'^\s*(?P<neighborid>[\w\.\:]+) +(?P<neighborversion>[\d]+) +((?P<neighboras>[\d]+)[\n]*)$')
         
-        p8b = re.compile(
+        p8b = regex_engine.compile(
             r'^\s*((?P<msgrecvd>[\d]+)'
             r' +(?P<msgsent>[\d]+) +(?P<neighbortableversion>[\d]+) +(?P<inq>[\d]+) +(?P<outq>[\d]+)'
             r' +(?P<time>[\w\:]+) +(?P<prefixreceived>[\w\s\)\(]+))$')
@@ -6368,37 +5479,37 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
         #     10.121.0.11          10.121.0.22          10.121.0.33          10.121.0.44
         #     10.196.0.11
 
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>[\w]+),'
-                        r' +address +family +(?P<af_name>[\w\s]+)$')
-        p2 = re.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)( +\(ES +(?P<es>[\w\s\[\]\.]+)\))?( +\((?P<rd_vrf>[\w]+)VNI +(?P<rd_vniid>[\d]+)\))?$')
-        p3 = re.compile(r'^\s*BGP routing table entry for +(?P<nonipprefix>[\w\[\]\:\.\/]+), +version +(?P<prefixversion>[\d]+)$')
-        p4 = re.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available, +best +#(?P<bestpathnr>[\d]+)\)$')
-        p5 = re.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list(, +(?P<flags_attr>[\w\s\/\,]+))?$')
-        p6 = re.compile(r'^\s*Multipath: +(?P<multipath>[\w]+)$')
-        p7 = re.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
-        p8 = re.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+), +(?P<pathtypes>[\S\s\,\:\/]+)?$')
+        p1 = regex_engine.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>[\w]+),'
+                                  r' +address +family +(?P<af_name>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)( +\(ES +(?P<es>[\w\s\[\]\.]+)\))?( +\((?P<rd_vrf>[\w]+)VNI +(?P<rd_vniid>[\d]+)\))?$')
+        p3 = regex_engine.compile(r'^\s*BGP routing table entry for +(?P<nonipprefix>[\w\[\]\:\.\/]+), +version +(?P<prefixversion>[\d]+)$')
+        p4 = regex_engine.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available, +best +#(?P<bestpathnr>[\d]+)\)$')
+        p5 = regex_engine.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list(, +(?P<flags_attr>[\w\s\/\,]+))?$')
+        p6 = regex_engine.compile(r'^\s*Multipath: +(?P<multipath>[\w]+)$')
+        p7 = regex_engine.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
+        p8 = regex_engine.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+), +(?P<pathtypes>[\S\s\,\:\/]+)?$')
         #          Imported from 99.99.99.99:10:[5]:[0]:[0]:[32]:[100.4.1.2]/224
-        p9 = re.compile(r'^\s*Imported from +(?P<imported_from>[\w\.\:\/\[\]\,]+)$')
+        p9 = regex_engine.compile(r'^\s*Imported from +(?P<imported_from>[\w\.\:\/\[\]\,]+)$')
         #   Gateway IP: 0.0.0.0
-        p10 = re.compile(r'^\s*Gateway IP: +(?P<gateway_ip>[a-zA-Z0-9\.\:]+)$')
+        p10 = regex_engine.compile(r'^\s*Gateway IP: +(?P<gateway_ip>[a-zA-Z0-9\.\:]+)$')
         #   AS-Path: 4 1 10 33299 51178 47751 {27016} , path sourced external to AS
-        p11 = re.compile(r'^\s*AS-Path: +(?P<as_path>[\d\s\{\}]+|[\w]+)(, +path locally originated)?(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
-        p12 = re.compile(r'^\s*(?P<ipnexthop>[\d\.]+) +\((?:(?P<inaccessible>(inaccessible)), +)?metric +(?P<nexthopmetric>[\d]+)\) +from +(?P<neighbor>[\d\.]+)'
-                         r' +\((?P<neighborid>[\d\.]+)\)$')
-        p13 = re.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)? +localpref +(?P<localpref>[\d]+),'
-                         r' +weight +(?P<weight>[\d]+)$')
-        p14 = re.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
-        p15 = re.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+) +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
-        p16 = re.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
-        p17 = re.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
-        p18 = re.compile(r'^\s*Received +label +(?P<inlabel>[\d]+)$')
+        p11 = regex_engine.compile(r'^\s*AS-Path: +(?P<as_path>[\d\s\{\}]+|[\w]+)(, +path locally originated)?(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
+        p12 = regex_engine.compile(r'^\s*(?P<ipnexthop>[\d\.]+) +\((?:(?P<inaccessible>(inaccessible)), +)?metric +(?P<nexthopmetric>[\d]+)\) +from +(?P<neighbor>[\d\.]+)'
+                                   r' +\((?P<neighborid>[\d\.]+)\)$')
+        p13 = regex_engine.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)? +localpref +(?P<localpref>[\d]+),'
+                                   r' +weight +(?P<weight>[\d]+)$')
+        p14 = regex_engine.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
+        p15 = regex_engine.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+) +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
+        p16 = regex_engine.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
+        p17 = regex_engine.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
+        p18 = regex_engine.compile(r'^\s*Received +label +(?P<inlabel>[\d]+)$')
 
         # PMSI Tunnel Attribute:
-        p19 = re.compile(r'^\s*(?P<attribute>[\w]+) +Tunnel +Attribute:$')
+        p19 = regex_engine.compile(r'^\s*(?P<attribute>[\w]+) +Tunnel +Attribute:$')
         #         flags: 0x00, Tunnel type: Ingress Replication
-        p20 = re.compile(r'^\s*flags: +(?P<flags>[\w]+), +Tunnel type: +(?P<tunnel_type>[\w\s]+)$')
+        p20 = regex_engine.compile(r'^\s*flags: +(?P<flags>[\w]+), +Tunnel type: +(?P<tunnel_type>[\w\s]+)$')
         #         Label: 10101, Tunnel Id: 10.196.7.7
-        p21 = re.compile(r'^\s*Label: +(?P<label>[\d]+), +Tunnel +Id: +(?P<tunnel_id>[\d\.]+)$')
+        p21 = regex_engine.compile(r'^\s*Label: +(?P<label>[\d]+), +Tunnel +Id: +(?P<tunnel_id>[\d\.]+)$')
 
         for line in out.splitlines():
             if line:
@@ -6882,121 +5993,121 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
         # Foreign host: 172.16.205.8, Foreign port: 52715
         # fd = 84
 
-        p1 = re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[\d\.]+), remote AS +(?P<remoteas>[\d]+), +(?P<link>[\w]+) +link,'
-                        r' +Peer index +(?P<index>[\d]+)$')
-        p2 = re.compile(r'^\s*BGP version +(?P<version>[\d]+), remote router ID +(?P<remote_id>[\d\.]+)$')
-        p3 = re.compile(r'^\s*BGP +state += +(?P<state>[\w\s\(\)]+), +(?P<up>[\w]+) +for'
-                        r' +(?P<elapsedtime>[\w\:]+)(, +retry in +(?P<retry>[\w\:]+))?$')
-        p4 = re.compile(r'^\s*Peer is directly attached, interface +(?P<connectedif>[\w\/]+)$')
-        p5 = re.compile(r'^\s*BFD live-detection is configured and enabled, state is +(?P<bfd_state>[\w]+)?$')
-        p6 = re.compile(r'^\s*TCP MD5 authentication is set \(enabled\)$')
-        p7 = re.compile(r'^\s*Last read +(?P<lastread>[\w\:\.]+), hold time = +(?P<holdtime>[\d]+),'
-                            r' +keepalive interval is +(?P<keepalivetime>[\d]+) +seconds$')
-        p8 = re.compile(r'^\s*Last written +(?P<lastwrite>[\w\:\.]+), keepalive timer expiry due +(?P<keepalive>[\w\:]+)$')
-        p9 = re.compile(r'^\s*Received +(?P<msgrecvd>[\d]+) +messages, +(?P<notificationsrcvd>[\d]+) +notifications,'
-                        r' +(?P<recvbufbytes>[\d]+)+ bytes in queue$')
-        p10 = re.compile(r'^\s*Sent +(?P<msgsent>[\d]+) messages,'
-                          r' +(?P<notificationssent>[\d]+)'
-                          r' +notifications, +(?P<sentbytesoutstanding>[\d]+)'
-                          r'(?:\((?P<totalbytessent>[\d]+)\))? +bytes in queue$')
-        p11 = re.compile(r'^\s*Connections established +(?P<connsestablished>[\d]+), +dropped +(?P<connsdropped>[\d]+)$')
-        p12 = re.compile(r'^\s*Last reset by us +(?P<resettime>[\w]+), +due to +(?P<resetreason>[\w\s]+)$')
-        p13 = re.compile(r'^\s*Last reset by peer +(?P<peerresettime>[\w]+), due to +(?P<peerresetreason>[\w\s]+)$')
-        p14 = re.compile(r'^\s*Dynamic capability: advertised +\(+(?P<cap_advertised>[\w\,\s]+)\) +received +\(+(?P<cap_received>[\w\,\s]+)\)$')
-        p15 = re.compile(r'^\s*Dynamic capability \(old\): +(?P<capolddynamicadvertised>[\w]+)( +(?P<capolddynamicrecvd>[\w\s]+))?$')
-        p16 = re.compile(r'^\s*Route refresh capability \(new\): +(?P<caprradvertised>[\w]+)( +(?P<caprrrecvd>[\w]+))?$')
-        p17 = re.compile(r'^\s*Route refresh capability \(old\): +(?P<capoldrradvertised>[\w]+)( +(?P<capoldrrrecvd>[\w]+))?$')
-        p18 = re.compile(r'^\s*4-Byte AS capability: +(?P<capas4advertised>[\w]+)( +(?P<capas4recvd>[\w]+))?$')
-        p19 = re.compile(r'^\s*Address family +(?P<af_name>[\w\s]+): +(?P<af_advertised>[a][\w]+)( +(?P<af_recvd>[r][\w]+))?$')
-        p20 = re.compile(r'^\s*Graceful Restart capability: +(?P<capgradvertised>[\w]+)( +(?P<capgrrecvd>[\w]+))?$')
-        p20_1 = re.compile(r'^\s*Graceful Restart Parameters:$')
-        p21 = re.compile(r'^\s*Address families advertised to peer:$')
-        p22 = re.compile(r'^(?P<space>\s{4})((?P<gr_af_name>(?!Sent)[\w].*)+)$')
-        p23 = re.compile(r'^\s*Address families received from peer:$')
-        p24_1 = re.compile(r'^\s*Forwarding state preserved by peer for:$')
-        p25 = re.compile(r'^\s*Restart time advertised to peer: +(?P<grrestarttime>[\d]+) +seconds$')
-        p26 = re.compile(r'^\s*Stale time for routes advertised by peer: +(?P<grstaletiem>[\d]+) +seconds$')
-        p27 = re.compile(r'^\s*Restart time advertised by peer: +(?P<grrecvdrestarttime>[\d]+) +seconds$')
-        p28 = re.compile(r'^\s*Extended Next Hop Encoding Capability: +(?P<capextendednhadvertised>[\w]+)( +(?P<capextendednhrecvd>[\w]+))?$')
-        p29 = re.compile(r'^\s*Receive IPv6 next hop encoding Capability for AF:$')
-        p30 = re.compile(r'^\s*(?P<space>\s{4})(?P<capextendednh_af_name>[\w\s]+)$')
-        p31 = re.compile(r'^\s*Opens: +(?P<openssent>[\d]+) +(?P<opensrecvd>[\d]+)$')
-        p32 = re.compile(r'^\s*Notifications: +(?P<notificationssent>[\d]+) +(?P<notificationsrcvd>[\d]+)$')
-        p33 = re.compile(r'^\s*Updates: +(?P<updatessent>[\d]+) +(?P<updatesrecvd>[\d]+)$')
-        p34 = re.compile(r'^\s*Keepalives: +(?P<keepalivesent>[\d]+) +(?P<keepaliverecvd>[\d]+)$')
-        p35 = re.compile(r'^\s*Route Refresh: +(?P<rtrefreshsent>[\d]+) +(?P<rtrefreshrecvd>[\d]+)$')
-        p36 = re.compile(r'^\s*Capability: +(?P<capabilitiessent>[\d]+) +(?P<capabilitiesrecvd>[\d]+)$')
-        p38 = re.compile(r'^\s*Total bytes: +(?P<bytessent>[\d]+) +(?P<bytesrecvd>[\d]+)$')
-        p39 = re.compile(r'^\s*Bytes in queue: +(?P<bytesinqueuesent>[\d]+) +(?P<bytesinqueuerecvd>[\d]+)$')
-        p40 = re.compile(r'^\s*For address family: +(?P<per_af_name>[\w\ ]+)$')
-        p41 = re.compile(r'^\s*BGP table version +(?P<tableversion>[\d]+), neighbor version +(?P<neighbortableversion>[\d]+)$')
-        p42 = re.compile(r'^\s*(?P<pfxrecvd>[\d]+) +accepted paths consume +(?P<pfxbytes>[\d]+) +bytes of memory$')
-        p43 = re.compile(r'^\s*Community attribute sent to this neighbor$')
-        p44 = re.compile(r'^\s*Extended community attribute sent to this neighbor$')
-        p46 = re.compile(r'^\s*Last End-of-RIB received +(?P<lastendribreceived>[\w\:]+) +after session start$')
-        p47 = re.compile(r'^\s*Last End-of-RIB sent +(?P<lastendribsent>[\w\:]+) +after session start$')
-        p48 = re.compile(r'^\s*First convergence +(?P<rrconfigured>[\w\:]+)'
-                         r' +after session start with +(?P<pfxbytes>[\d]+) +routes sent$')
-        p49 = re.compile(r'^\s*Local host: +(?P<localaddr>[\d\.]+), Local port: +(?P<localport>[\d\.]+)$')
-        p50 = re.compile(r'^\s*Foreign host: +(?P<remoteaddr>[\d\.]+), Foreign port: +(?P<remoteport>[\d]+)$')
-        p51 = re.compile(r'^\s*fd = +(?P<fd>[\d]+)$')
+        p1 = regex_engine.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[\d\.]+), remote AS +(?P<remoteas>[\d]+), +(?P<link>[\w]+) +link,'
+                                  r' +Peer index +(?P<index>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*BGP version +(?P<version>[\d]+), remote router ID +(?P<remote_id>[\d\.]+)$')
+        p3 = regex_engine.compile(r'^\s*BGP +state += +(?P<state>[\w\s\(\)]+), +(?P<up>[\w]+) +for'
+                                  r' +(?P<elapsedtime>[\w\:]+)(, +retry in +(?P<retry>[\w\:]+))?$')
+        p4 = regex_engine.compile(r'^\s*Peer is directly attached, interface +(?P<connectedif>[\w\/]+)$')
+        p5 = regex_engine.compile(r'^\s*BFD live-detection is configured and enabled, state is +(?P<bfd_state>[\w]+)?$')
+        p6 = regex_engine.compile(r'^\s*TCP MD5 authentication is set \(enabled\)$')
+        p7 = regex_engine.compile(r'^\s*Last read +(?P<lastread>[\w\:\.]+), hold time = +(?P<holdtime>[\d]+),'
+                                      r' +keepalive interval is +(?P<keepalivetime>[\d]+) +seconds$')
+        p8 = regex_engine.compile(r'^\s*Last written +(?P<lastwrite>[\w\:\.]+), keepalive timer expiry due +(?P<keepalive>[\w\:]+)$')
+        p9 = regex_engine.compile(r'^\s*Received +(?P<msgrecvd>[\d]+) +messages, +(?P<notificationsrcvd>[\d]+) +notifications,'
+                                  r' +(?P<recvbufbytes>[\d]+)+ bytes in queue$')
+        p10 = regex_engine.compile(r'^\s*Sent +(?P<msgsent>[\d]+) messages,'
+                                    r' +(?P<notificationssent>[\d]+)'
+                                    r' +notifications, +(?P<sentbytesoutstanding>[\d]+)'
+                                    r'(?:\((?P<totalbytessent>[\d]+)\))? +bytes in queue$')
+        p11 = regex_engine.compile(r'^\s*Connections established +(?P<connsestablished>[\d]+), +dropped +(?P<connsdropped>[\d]+)$')
+        p12 = regex_engine.compile(r'^\s*Last reset by us +(?P<resettime>[\w]+), +due to +(?P<resetreason>[\w\s]+)$')
+        p13 = regex_engine.compile(r'^\s*Last reset by peer +(?P<peerresettime>[\w]+), due to +(?P<peerresetreason>[\w\s]+)$')
+        p14 = regex_engine.compile(r'^\s*Dynamic capability: advertised +\(+(?P<cap_advertised>[\w\,\s]+)\) +received +\(+(?P<cap_received>[\w\,\s]+)\)$')
+        p15 = regex_engine.compile(r'^\s*Dynamic capability \(old\): +(?P<capolddynamicadvertised>[\w]+)( +(?P<capolddynamicrecvd>[\w\s]+))?$')
+        p16 = regex_engine.compile(r'^\s*Route refresh capability \(new\): +(?P<caprradvertised>[\w]+)( +(?P<caprrrecvd>[\w]+))?$')
+        p17 = regex_engine.compile(r'^\s*Route refresh capability \(old\): +(?P<capoldrradvertised>[\w]+)( +(?P<capoldrrrecvd>[\w]+))?$')
+        p18 = regex_engine.compile(r'^\s*4-Byte AS capability: +(?P<capas4advertised>[\w]+)( +(?P<capas4recvd>[\w]+))?$')
+        p19 = regex_engine.compile(r'^\s*Address family +(?P<af_name>[\w\s]+): +(?P<af_advertised>[a][\w]+)( +(?P<af_recvd>[r][\w]+))?$')
+        p20 = regex_engine.compile(r'^\s*Graceful Restart capability: +(?P<capgradvertised>[\w]+)( +(?P<capgrrecvd>[\w]+))?$')
+        p20_1 = regex_engine.compile(r'^\s*Graceful Restart Parameters:$')
+        p21 = regex_engine.compile(r'^\s*Address families advertised to peer:$')
+        p22 = regex_engine.compile(r'^(?P<space>\s{4})((?P<gr_af_name>(?!Sent)[\w].*)+)$')
+        p23 = regex_engine.compile(r'^\s*Address families received from peer:$')
+        p24_1 = regex_engine.compile(r'^\s*Forwarding state preserved by peer for:$')
+        p25 = regex_engine.compile(r'^\s*Restart time advertised to peer: +(?P<grrestarttime>[\d]+) +seconds$')
+        p26 = regex_engine.compile(r'^\s*Stale time for routes advertised by peer: +(?P<grstaletiem>[\d]+) +seconds$')
+        p27 = regex_engine.compile(r'^\s*Restart time advertised by peer: +(?P<grrecvdrestarttime>[\d]+) +seconds$')
+        p28 = regex_engine.compile(r'^\s*Extended Next Hop Encoding Capability: +(?P<capextendednhadvertised>[\w]+)( +(?P<capextendednhrecvd>[\w]+))?$')
+        p29 = regex_engine.compile(r'^\s*Receive IPv6 next hop encoding Capability for AF:$')
+        p30 = regex_engine.compile(r'^\s*(?P<space>\s{4})(?P<capextendednh_af_name>[\w\s]+)$')
+        p31 = regex_engine.compile(r'^\s*Opens: +(?P<openssent>[\d]+) +(?P<opensrecvd>[\d]+)$')
+        p32 = regex_engine.compile(r'^\s*Notifications: +(?P<notificationssent>[\d]+) +(?P<notificationsrcvd>[\d]+)$')
+        p33 = regex_engine.compile(r'^\s*Updates: +(?P<updatessent>[\d]+) +(?P<updatesrecvd>[\d]+)$')
+        p34 = regex_engine.compile(r'^\s*Keepalives: +(?P<keepalivesent>[\d]+) +(?P<keepaliverecvd>[\d]+)$')
+        p35 = regex_engine.compile(r'^\s*Route Refresh: +(?P<rtrefreshsent>[\d]+) +(?P<rtrefreshrecvd>[\d]+)$')
+        p36 = regex_engine.compile(r'^\s*Capability: +(?P<capabilitiessent>[\d]+) +(?P<capabilitiesrecvd>[\d]+)$')
+        p38 = regex_engine.compile(r'^\s*Total bytes: +(?P<bytessent>[\d]+) +(?P<bytesrecvd>[\d]+)$')
+        p39 = regex_engine.compile(r'^\s*Bytes in queue: +(?P<bytesinqueuesent>[\d]+) +(?P<bytesinqueuerecvd>[\d]+)$')
+        p40 = regex_engine.compile(r'^\s*For address family: +(?P<per_af_name>[\w\ ]+)$')
+        p41 = regex_engine.compile(r'^\s*BGP table version +(?P<tableversion>[\d]+), neighbor version +(?P<neighbortableversion>[\d]+)$')
+        p42 = regex_engine.compile(r'^\s*(?P<pfxrecvd>[\d]+) +accepted paths consume +(?P<pfxbytes>[\d]+) +bytes of memory$')
+        p43 = regex_engine.compile(r'^\s*Community attribute sent to this neighbor$')
+        p44 = regex_engine.compile(r'^\s*Extended community attribute sent to this neighbor$')
+        p46 = regex_engine.compile(r'^\s*Last End-of-RIB received +(?P<lastendribreceived>[\w\:]+) +after session start$')
+        p47 = regex_engine.compile(r'^\s*Last End-of-RIB sent +(?P<lastendribsent>[\w\:]+) +after session start$')
+        p48 = regex_engine.compile(r'^\s*First convergence +(?P<rrconfigured>[\w\:]+)'
+                                   r' +after session start with +(?P<pfxbytes>[\d]+) +routes sent$')
+        p49 = regex_engine.compile(r'^\s*Local host: +(?P<localaddr>[\d\.]+), Local port: +(?P<localport>[\d\.]+)$')
+        p50 = regex_engine.compile(r'^\s*Foreign host: +(?P<remoteaddr>[\d\.]+), Foreign port: +(?P<remoteport>[\d]+)$')
+        p51 = regex_engine.compile(r'^\s*fd = +(?P<fd>[\d]+)$')
 
         # Enhanced error processing: On
-        p52 = re.compile(r'\s*Enhanced error processing\: +(?P<error_processing>\w+)$')
+        p52 = regex_engine.compile(r'\s*Enhanced error processing\: +(?P<error_processing>\w+)$')
 
         # 0 discarded attributes
-        p53 = re.compile(r'\s*(?P<discarded_attr>\d) +discarded +attributes$')
+        p53 = regex_engine.compile(r'\s*(?P<discarded_attr>\d) +discarded +attributes$')
         
         # Last error length received: 0 
-        p54 = re.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_sent>\d+)$')
+        p54 = regex_engine.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_sent>\d+)$')
         
         # Reset error value sent: 0
-        p55 = re.compile(r'\s*Reset +error +value +received(\:)? +(?P<reset_error_value_sent>\d+)$')
+        p55 = regex_engine.compile(r'\s*Reset +error +value +received(\:)? +(?P<reset_error_value_sent>\d+)$')
 
         # Reset error sent major: 0 minor: 0
-        p56 = re.compile(r'\s*Reset +error +sent +major\: '
-                        r'+(?P<reset_error_sent_major>\d+) +minor\: '
-                        r'+(?P<reset_error_sent_minor>\d+)$')
+        p56 = regex_engine.compile(r'\s*Reset +error +sent +major\: '
+                                  r'+(?P<reset_error_sent_major>\d+) +minor\: '
+                                  r'+(?P<reset_error_sent_minor>\d+)$')
         
         # Last error length received: 0
-        p57 = re.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_received>\d+)$')
+        p57 = regex_engine.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_received>\d+)$')
 
         # Reset error value received 0
-        p58 = re.compile(r'\s*Reset error value received(\:)? +(?P<reset_error_value_received>\d+)$')
+        p58 = regex_engine.compile(r'\s*Reset error value received(\:)? +(?P<reset_error_value_received>\d+)$')
 
         # Reset error received major: 0 minor: 0
-        p59 = re.compile(r'\s*Reset error received major\: '
-                        r'+(?P<reset_error_received_major>\d+) +minor\:'
-                        r' +(?P<reset_error_received_minor>\d+)$')
+        p59 = regex_engine.compile(r'\s*Reset error received major\: '
+                                  r'+(?P<reset_error_received_major>\d+) +minor\:'
+                                  r' +(?P<reset_error_received_minor>\d+)$')
 
         # 10 accepted prefixes (10 paths), consuming 2360 bytes of memory
-        p60 = re.compile(r'\s*(?P<accepted_prefixes>\d+) +accepted prefixes'
-                        r' +\(\d+ +paths\)\, +consuming '
-                        r'+(?P<memory_consumed_in_bytes>\d+) +bytes +of +memory$')
+        p60 = regex_engine.compile(r'\s*(?P<accepted_prefixes>\d+) +accepted prefixes'
+                                  r' +\(\d+ +paths\)\, +consuming '
+                                  r'+(?P<memory_consumed_in_bytes>\d+) +bytes +of +memory$')
 
         # 0 received prefixes treated as withdrawn
-        p61 = re.compile(r'\s*(?P<received_prefixes>\d+) +received '
-                        r'+prefixes +treated +as +withdrawn$')
+        p61 = regex_engine.compile(r'\s*(?P<received_prefixes>\d+) +received '
+                                  r'+prefixes +treated +as +withdrawn$')
         
         # 40541 sent prefixes (40541 paths)
-        p62 = re.compile(r'\s*(?P<sent_prefixes>\d+) +sent prefixes +\(\d+ paths\)$')
+        p62 = regex_engine.compile(r'\s*(?P<sent_prefixes>\d+) +sent prefixes +\(\d+ paths\)$')
 
         # Advertise GW IP is enabled
-        p63 = re.compile(r'\s*Advertise +GW +IP +is +(?P<advertise_gw_ip>\w+)$')
+        p63 = regex_engine.compile(r'\s*Advertise +GW +IP +is +(?P<advertise_gw_ip>\w+)$')
 
         # Outbound route-map configured is GENIE_TEST, handle obtained
-        p64 = re.compile(r'\s*Outbound +route\-map +configured +is '
-                        r'+(?P<outbound_route_map>\w+)\, +handle +obtained$')
+        p64 = regex_engine.compile(r'\s*Outbound +route\-map +configured +is '
+                                  r'+(?P<outbound_route_map>\w+)\, +handle +obtained$')
 
         # Last End-of-RIB received 00:00:11 after session start
         # Last End-of-RIB sent 00:00:06 after session start
-        p65 = re.compile(r'\s*Last +End\-of\-RIB +(?P<action>received|sent) '
-                        r'+(?P<time>[\w:]+) +after +session +start$')
+        p65 = regex_engine.compile(r'\s*Last +End\-of\-RIB +(?P<action>received|sent) '
+                                  r'+(?P<time>[\w:]+) +after +session +start$')
 
         # First convergence 00:00:06 after session start with 18810 routes sent
-        p66 = re.compile(r'\s*First +convergence +(?P<first_convergence>[\w:]+) '
-                        r'+after +session +start +with '
-                        r'+(?P<convergence_routes_sent>\d+) +routes +sent$')
+        p66 = regex_engine.compile(r'\s*First +convergence +(?P<first_convergence>[\w:]+) '
+                                  r'+after +session +start +with '
+                                  r'+(?P<convergence_routes_sent>\d+) +routes +sent$')
 
         for line in out.splitlines():
             if line:
@@ -7480,8 +6591,8 @@ class ShowBgpL2vpnEvpnWord(ShowBgpL2vpnEvpnWordSchema):
 
         ret_dict = {}
 
-        p1 = re.compile(r'^(?P<next_hop>[0-9\.]+) +\(metric +(?P<metric>[0-9]+)\).*$')
-        p2 = re.compile(r'^Received label +(?P<received_label>[0-9]+).*$')
+        p1 = regex_engine.compile(r'^(?P<next_hop>[0-9\.]+) +\(metric +(?P<metric>[0-9]+)\).*$')
+        p2 = regex_engine.compile(r'^Received label +(?P<received_label>[0-9]+).*$')
         for line in out.splitlines():
             line = line.strip()
 
@@ -7598,22 +6709,22 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
             out = output
         result_dict = {}
         # BGP routing table information for VRF default, address family IPv4 MVPN
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf>\S+),'
-                r' +address +family +(?P<af>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf>\S+),'
+                          r' +address +family +(?P<af>[\w\s]+)$')
 
         # BGP table version is 390, Local Router ID is 10.16.2.2
-        p2 = re.compile(r'^\s*BGP +table +version +is +(?P<table_version>[\d]+),'
-                        r' +Local +Router +ID +is +(?P<router_id>[\d\.]+)$')
+        p2 = regex_engine.compile(r'^\s*BGP +table +version +is +(?P<table_version>[\d]+),'
+                                  r' +Local +Router +ID +is +(?P<router_id>[\d\.]+)$')
 
         #    Network            Next Hop            Metric     LocPrf     Weight Path
         # Route Distinguisher: 10.16.2.2:3    (L3VNI 10100)
-        p3 = re.compile(r'^\s*Route +Distinguisher: +(?P<rd>[\d\.\:]+)'
-                        r'( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
+        p3 = regex_engine.compile(r'^\s*Route +Distinguisher: +(?P<rd>[\d\.\:]+)'
+                                  r'( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
 
         # *>l[5][10.111.1.3][238.8.4.101]/64
-        p4 = re.compile(r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?'
-                            r'(?P<typecode>(i|e|c|l|a|r|I)+)?'
-                            r'(?P<prefix>[\w\]\/\:\.\]\[]+)$')
+        p4 = regex_engine.compile(r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?'
+                                      r'(?P<typecode>(i|e|c|l|a|r|I)+)?'
+                                      r'(?P<prefix>[\w\]\/\:\.\]\[]+)$')
 
         #                       Next Hop            Metric     LocPrf     Weight Path
         #                       10.196.7.7                           100          0 i
@@ -7621,7 +6732,7 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
         #                       10.64.4.4                                        0 200 100 i
         #                       0.0.0.0                  0        100      32768 ?
         #                       10.64.4.4              219        0 10 3277 32768 36640 {27016} e
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?(?P<typecode>('
             r'i|e|c|l|a|r|I)+)?\s+(?P<ipnexthop>[\d\.]+)?(?P<space1>\s+)?(?P<metric>['
             r'\d]+)?\s+(?P<localpref>[\d]+)\s+?(?P<weight>[\d]+)( +(?P<path>[0-9\{\}\s]+))? +(?P<origin>[i|e|c|l|a|I|?]+)$')
@@ -7835,64 +6946,64 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
         result_dict = {}
 
         # BGP routing table information for VRF default, address family IPv4 MVPN
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>\S+),'
-                        r' +address +family +(?P<af_name>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>\S+),'
+                                  r' +address +family +(?P<af_name>[\w\s]+)$')
 
         # Route Distinguisher: 10.16.2.2:3    (L3VNI 10100)
-        p2 = re.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)'
-                        r'( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
+        p2 = regex_engine.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)'
+                                  r'( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
 
         # BGP routing table entry for [5][10.111.1.3][238.8.4.s101]/64, version 388
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^\s*BGP +routing +table +entry +for +(?P<nonipprefix>[\d\[\]\:\.\/]+),'
             r' +version +(?P<prefixversion>[\d]+)$')
 
         # Paths: (1 available, best #1)
-        p4 = re.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available,'
-                        r' +best +#(?P<bestpathnr>[\d]+)\)$')
+        p4 = regex_engine.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available,'
+                                  r' +best +#(?P<bestpathnr>[\d]+)\)$')
 
         # Flags: (0x000002)(high32 00000000) on xmit-list, is not in mvpn
         # Flags: (0x000002)(high32 00000000) on xmit-list, is not in mvpn, is not in HW
-        p5 = re.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list'
+        p5 = regex_engine.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list'
             r'(, +(?P<flags_attr>[\w\s\/\,]+))?$')
 
         #   Advertised path-id 1
-        p7 = re.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
+        p7 = regex_engine.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
 
         # Path type: local, path is valid, is best path, no labeled nexthop
         # Path type: internal, path is invalid(rnh not resolved),
         #        not best reason: Neighbor Address, no labeled nexthop
-        p8 = re.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+),'
-                        r' +(?P<pathtypes>[\S\s\,\:\/\(\)]+)?$')
+        p8 = regex_engine.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+),'
+                                  r' +(?P<pathtypes>[\S\s\,\:\/\(\)]+)?$')
 
         #   AS-Path: NONE, path locally originated
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^\s*AS-Path: +(?P<as_path>[\w]+)(, +path locally originated)?'
-                r'(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
+                          r'(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
 
         #     0.0.0.0 (metric 0) from 0.0.0.0 (10.16.2.2)
         #     10.144.6.6 (inaccessible, metric 4294967295) from 10.64.4.4 (10.64.4.4)
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^\s*(?P<ipnexthop>[\d\.]+) +\(((?P<nexthop_status>[\w]+), )?metric +(?P<nexthopmetric>[\d]+)\)'
             r' +from +(?P<neighbor>[\d\.]+)'
             r' +\((?P<neighborid>[\d\.]+)\)$')
 
         #       Origin IGP, MED not set, localpref 100, weight 32768
-        p11 = re.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)?'
-                         r' +localpref +(?P<localpref>[\d]+),'
-                         r' +weight +(?P<weight>[\d]+)$')
+        p11 = regex_engine.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)?'
+                                   r' +localpref +(?P<localpref>[\d]+),'
+                                   r' +weight +(?P<weight>[\d]+)$')
 
         #       Extcommunity: RT:100:10100
-        p12 = re.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
+        p12 = regex_engine.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
 
         # Originator: 10.144.6.6 Cluster list: 10.100.5.5 
-        p13 = re.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+)'
-                         r' +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
+        p13 = regex_engine.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+)'
+                                   r' +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
 
         #   Path-id 1 advertised to peers:
         #     10.64.4.4            10.100.5.5        
-        p14 = re.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
-        p15 = re.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
+        p14 = regex_engine.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
+        p15 = regex_engine.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
 
 
         for line in out.splitlines():
@@ -19,9 +19,7 @@
 """
 
 # Python
-import re
 from copy import deepcopy
-import xml.etree.ElementTree as ET
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -32,7 +30,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.xml_stream import XmlStream, map_leaves
 
 # =================================
 # Schema for 'show bgp vrf all all'
@@ -109,48 +109,48 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
         data_on_nextline = False
         bgp_table_version = local_router_id = ''
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF'
-                            r' +(?P<vrf_name>\S+), +address +family'
-                            r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            r' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
-                            r' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
-        p3_4 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_1_2 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
+        p = regex_engine.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
+        p1 = regex_engine.compile(r'^\s*BGP +routing +table +information +for +VRF'
+                                      r' +(?P<vrf_name>\S+), +address +family'
+                                      r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p2 = regex_engine.compile(r'^\s*BGP +table +version +is'
+                                      r' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
+                                      r' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
+        p3_4 = regex_engine.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
+        p3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                      r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_1_2 = regex_engine.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
             r'(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) +(?P<next_hop>[\w\.\/]+) +'
             r'(?P<metric>\d+) +(?P<localprf>\d+) +(?P<weight>\d+) +(?P<path>[\d ]+) +'
             r'(?P<origin_codes>(i|e|\?|\||&))$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            r' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                                r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *:'
-                            r' +(?P<route_distinguisher>(\S+))'
-                            r'(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            r'((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                                r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                                r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p3_3 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                      r' +(?P<origin_codes>(i|e|\?|\|))$')
+        p3_3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                          r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                          r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                          r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                          r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p4 = regex_engine.compile(r'^\s*Route +Distinguisher *:'
+                                      r' +(?P<route_distinguisher>(\S+))'
+                                      r'(?: +\(((VRF +(?P<default_vrf>\S+))|'
+                                      r'((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
+        p3_2 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                      r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                                      r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_2_1 = regex_engine.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                          r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                          r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                          r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                          r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -306,25 +306,25 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{5,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{5,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -437,25 +437,25 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{5,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{5,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -743,130 +743,130 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
         parsed_dict = {}
         standard_send_community = False
 
-        p1 = re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor_id>[a-zA-Z0-9\.\:]+),'
-                            r' +remote +AS +(?P<remote_as>[0-9]+),'
-                            r'(?: +local +AS +(?P<local_as>[0-9]+),)?'
-                            r' +(?P<link>[a-zA-Z]+) +link,'
-                            r'( +(?P<peer_fab_type>[fabric\-\S]+),)?'
-                            r' +Peer +index +(?P<peer_index>[0-9]+)$')
-        p2 = re.compile(r'^\s*Description *: +(?P<description>(\S+))$')
-        p3 = re.compile(r'^\s*BGP +version +(?P<bgp_version>[0-9]+),'
-                            r' +remote +router +ID +(?P<router_id>[0-9\.]+)$')
-        p4 = re.compile(r'^\s*\s*BGP +state += +(?P<session_state>(\S+))'
-                            r'(?: +\((?P<reason>([a-zA-Z\s\/\-]+))\))?,'
-                            r' +(up|down) +for +(?P<up_time>[a-zA-Z0-9\:\.]+)'
-                            r'(?: *, +retry +in +(?P<retry_time>[0-9\.\:]+))?$')
-        p5 = re.compile(r'^\s*Using +(?P<update_source>[a-zA-Z0-9]+)'
-                            r' +as +update +source +for +this +peer$')
-        p6 = re.compile(r'^\s*BFD live-detection is configured'
-                            r'(?: +and +(?P<bfd_enabled>(\S+)), +state +is'
-                            r' +(?P<bfd_state>(\S+)))?$')
-        p7 = re.compile(r'^\s*Neighbor +local-as +command'
-                            r' +(?P<nbr_local_as_cmd>[a-zA-Z\s]+)$')
-        p8 = re.compile(r'^\s*Last +read +(?P<last_read>[a-zA-Z0-9\:]+),'
-                            r' +hold +time += +(?P<holdtime>[0-9]+), +keepalive'
-                            r' +interval +is +(?P<keepalive_interval>[0-9]+)'
-                            r' +seconds$')
-        p9 = re.compile(r'^\s*Last +written'
-                            r' +(?P<last_written>[a-zA-Z0-9\:]+), +keepalive'
-                            r' +timer +(?P<keepalive_timer>[a-zA-Z0-9\:\s]+)$')
-        p10 = re.compile(r'^\s*Inherits +session +configuration +from'
-                        r' +session-template +(?P<template>[a-zA-Z\-\_]+)$')
-        p11 = re.compile(r'^\s*Connected check is disabled$')
-        p11_2 = re.compile(r'^\s*Private +AS +numbers +removed +from +updates +sent +to +this +neighbor$')
-        p12_1 = re.compile(r'^\s*External +BGP +peer +might +be +upto'
-                            r' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
-        p12_2 = re.compile(r'^\s*External +BGP +peer +might +be +up to'
-                            r' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
-        p13 = re.compile(r'^\s*TCP +MD5 +authentication +is'
-                            r' +(?P<tcp_md5_auth>[a-zA-Z\(\)\s]+)$')
-        p14 = re.compile(r'^\s*Only +passive +connection +setup +allowed$')
-        p15 = re.compile(r'^\s*Received +(?P<received_messages>[0-9]+)'
-                            r' +messages, +(?P<received_notifications>[0-9]+)'
-                            r' +notifications, +(?P<received_bytes>[0-9]+)'
-                            r' +bytes +in +queue$')
-        p16 = re.compile(r'^\s*Sent +(?P<sent_messages>[0-9]+)'
-                            r' +messages, +(?P<sent_notifications>[0-9]+)'
-                            r' +notifications, +(?P<sent_bytes_queue>[0-9]+)'
-                            r' +bytes +in +queue$')
-        p17 = re.compile(r'^\s*Connections +established'
-                            r' +(?P<esablished>[0-9]+), +dropped'
-                            r' +(?P<dropped>[0-9]+)$')
-        p17_1 = re.compile(r'^\s*Connections +attempts'
-                            r' +(?P<attemps>[0-9]+)$')
-        p18 = re.compile(r'^\s*Last +reset +by (?P<reset_by>[a-zA-Z]+)'
-                            r' +(?P<last_reset>[a-zA-Z0-9\:\s]+), +due +to'
-                            r' +(?P<reset_reason>[a-zA-Z\-\s]+)$')
-        p19 = re.compile(r'^\s*Neighbor +capabilities *:$')
-        p20_1 = re.compile(r'^\s*Dynamic +capability *:'
-                            r' +(?P<dynamic_capability>[a-zA-Z\,\(\)\s]+)$')
-        p20_2 = re.compile(r'^\s*Dynamic +capability +\(old\) *:'
-                            r' +(?P<dynamic_capability_old>[a-zA-Z\s]+)$')
-        p21 = re.compile(r'^\s*Route +refresh +capability +\(new\) *:'
-                            r' +(?P<route_refresh>[a-zA-Z\s]+)$')
-        p21_1 = re.compile(r'^\s*Route +refresh +capability +\(old\) *:'
-                            r' +(?P<route_refresh_old>[a-zA-Z\s]+)$')
-        p22 = re.compile(r'^\s*4-Byte AS capability: +(?P<capability>[\w\s]+)$')
-        p23 = re.compile(r'^\s*Address +family +VPNv4 +Unicast *:'
-                            r' +(?P<vpnv4_unicast>[a-zA-Z\s]+)$')
-        p24 = re.compile(r'^\s*Address +family +VPNv6 +Unicast *:'
-                            r' +(?P<vpnv6_unicast>[a-zA-Z\s]+)$')
-        p24_1 = re.compile(r'^\s*Address +family +IPv4 +MVPN:'
-                            r' +(?P<ipv4_mvpn>[\w\s]+)$')
-        p25 = re.compile(r'^\s*Graceful +Restart +capability *:'
-                            r' +(?P<graceful_restart>[a-zA-Z\s]+)$')
-        p26 = re.compile(r'^\s*Graceful +Restart +Parameters *:$')
-        p27_1 = re.compile(r'^\s*$')
-        p27_2 = re.compile(r'^\s*$')
-        p28_1 = re.compile(r'^\s*Restart +time +advertised +to +peer *:'
-                            r' +(?P<time>[0-9]+) +seconds$')
-        p28_2 = re.compile(r'^\s*Restart +time +advertised +by +peer *:'
-                            r' +(?P<time>[0-9]+) +seconds$')
-        p28 = re.compile(r'^\s*Stale +time +for +routes +advertised +by'
-                            r' +peer *: +(?P<time>[0-9]+) +seconds$')
-        p30 = re.compile(r'^\s*(?P<message_stat>[a-zA-Z\s]+) *:'
-                            r' +(?P<sent>[0-9]+) +(?P<received>[0-9]+)$')
-        p31 = re.compile(r'^\s*For +address +family *:'
-                            r' +(?P<af>[a-zA-Z0-9\s]+)$')
-        p32 = re.compile(r'^\s*BGP +table +version'
-                            r' +(?P<af_bgp_table_version>[0-9]+), +neighbor'
-                            r' +version +(?P<nbr_version>[0-9]+)$')
-        p33 = re.compile(r'^\s*(?P<accepted_paths>[0-9]+) +accepted'
-                            r' +paths +consume +(?P<bytes_consumed>[0-9]+)'
-                            r' +bytes +of +memory$')
-        p34 = re.compile(r'^\s*(?P<num_sent_paths>[0-9]+) +sent +paths$')
-        p35 = re.compile(r'^\s*Community +attribute +sent +to +this'
-                            r' +neighbor$')
-        p36 = re.compile(r'^\s*Extended +community +attribute +sent +to'
-                            r' +this +neighbor$')
-        p37 = re.compile(r'^\s*Maximum +prefixes +allowed +(?P<num>[0-9]+)$')
-        p38 = re.compile(r'^\s*Inbound +route-map +configured +is'
-                            r' +(?P<route_map_name_in>(\S+)), +handle'
-                            r' +obtained$')
-        p39 = re.compile(r'^\s*Outbound +route-map +configured +is'
-                            r' +(?P<route_map_name_out>(\S+)), +handle'
-                            r' +obtained$')
-        p40 = re.compile(r'^\s*Third-party +Nexthop +will +not +be'
-                            r' +computed.$')
-        p41 = re.compile(r'^\s*SOO +Extcommunity *:'
-                            r' +(?P<soo>[a-zA-Z0-9\:]+)$')
-        p42 = re.compile(r'^\s*Inbound +soft +reconfiguration +allowed$')
-        p43 = re.compile(r'\s*Nexthop(?: +always)? +set +to +local +peering'
-                            r' +address, +(?P<ip>[\w\.\:]+)$')
-        p44 = re.compile(r'^\s*Allow +my +ASN +(?P<num>[0-9]+) +times$')
-        p45 = re.compile(r'^\s*ASN override is enabled$')
-        p46 = re.compile(r'^\s*Default +information +originate,'
-                            r'(?: +route-map +(?P<route_map>(\S+)),)?'
-                            r' +default(?: +not)? +sent$')
-        p48 = re.compile(r'^\s*(?P<inherit_peer_seq>[0-9]+)'
-                            r' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
-        p49 = re.compile(r'^\s*Local +host *: +(?P<local_host>[0-9\.\:]+),'
-                            r' +Local +port *: +(?P<local_port>[0-9]+)$')
-        p50 = re.compile(r'^\s*Foreign +host *:'
-                            r' +(?P<foreign_host>[0-9\.\:]+), +Foreign'
-                            r' +port *: +(?P<foreign_port>[0-9]+)$')
-        p51 = re.compile(r'^\s*fd += +(?P<fd>[0-9]+)$')
-        p52 = re.compile(r'^\s*Route reflector client$')
+        p1 = regex_engine.compile(r'^\s*BGP +neighbor +is +(?P<neighbor_id>[a-zA-Z0-9\.\:]+),'
+                                      r' +remote +AS +(?P<remote_as>[0-9]+),'
+                                      r'(?: +local +AS +(?P<local_as>[0-9]+),)?'
+                                      r' +(?P<link>[a-zA-Z]+) +link,'
+                                      r'( +(?P<peer_fab_type>[fabric\-\S]+),)?'
+                                      r' +Peer +index +(?P<peer_index>[0-9]+)$')
+        p2 = regex_engine.compile(r'^\s*Description *: +(?P<description>(\S+))$')
+        p3 = regex_engine.compile(r'^\s*BGP +version +(?P<bgp_version>[0-9]+),'
+                                      r' +remote +router +ID +(?P<router_id>[0-9\.]+)$')
+        p4 = regex_engine.compile(r'^\s*\s*BGP +state += +(?P<session_state>(\S+))'
+                                      r'(?: +\((?P<reason>([a-zA-Z\s\/\-]+))\))?,'
+                                      r' +(up|down) +for +(?P<up_time>[a-zA-Z0-9\:\.]+)'
+                                      r'(?: *, +retry +in +(?P<retry_time>[0-9\.\:]+))?$')
+        p5 = regex_engine.compile(r'^\s*Using +(?P<update_source>[a-zA-Z0-9]+)'
+                                      r' +as +update +source +for +this +peer$')
+        p6 = regex_engine.compile(r'^\s*BFD live-detection is configured'
+                                      r'(?: +and +(?P<bfd_enabled>(\S+)), +state +is'
+                                      r' +(?P<bfd_state>(\S+)))?$')
+        p7 = regex_engine.compile(r'^\s*Neighbor +local-as +command'
+                                      r' +(?P<nbr_local_as_cmd>[a-zA-Z\s]+)$')
+        p8 = regex_engine.compile(r'^\s*Last +read +(?P<last_read>[a-zA-Z0-9\:]+),'
+                                      r' +hold +time += +(?P<holdtime>[0-9]+), +keepalive'
+                                      r' +interval +is +(?P<keepalive_interval>[0-9]+)'
+                                      r' +seconds$')
+        p9 = regex_engine.compile(r'^\s*Last +written'
+                                      r' +(?P<last_written>[a-zA-Z0-9\:]+), +keepalive'
+                                      r' +timer +(?P<keepalive_timer>[a-zA-Z0-9\:\s]+)$')
+        p10 = regex_engine.compile(r'^\s*Inherits +session +configuration +from'
+                                  r' +session-template +(?P<template>[a-zA-Z\-\_]+)$')
+        p11 = regex_engine.compile(r'^\s*Connected check is disabled$')
+        p11_2 = regex_engine.compile(r'^\s*Private +AS +numbers +removed +from +updates +sent +to +this +neighbor$')
+        p12_1 = regex_engine.compile(r'^\s*External +BGP +peer +might +be +upto'
+                                      r' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
+        p12_2 = regex_engine.compile(r'^\s*External +BGP +peer +might +be +up to'
+                                      r' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
+        p13 = regex_engine.compile(r'^\s*TCP +MD5 +authentication +is'
+                                      r' +(?P<tcp_md5_auth>[a-zA-Z\(\)\s]+)$')
+        p14 = regex_engine.compile(r'^\s*Only +passive +connection +setup +allowed$')
+        p15 = regex_engine.compile(r'^\s*Received +(?P<received_messages>[0-9]+)'
+                                      r' +messages, +(?P<received_notifications>[0-9]+)'
+                                      r' +notifications, +(?P<received_bytes>[0-9]+)'
+                                      r' +bytes +in +queue$')
+        p16 = regex_engine.compile(r'^\s*Sent +(?P<sent_messages>[0-9]+)'
+                                      r' +messages, +(?P<sent_notifications>[0-9]+)'
+                                      r' +notifications, +(?P<sent_bytes_queue>[0-9]+)'
+                                      r' +bytes +in +queue$')
+        p17 = regex_engine.compile(r'^\s*Connections +established'
+                                      r' +(?P<esablished>[0-9]+), +dropped'
+                                      r' +(?P<dropped>[0-9]+)$')
+        p17_1 = regex_engine.compile(r'^\s*Connections +attempts'
+                                      r' +(?P<attemps>[0-9]+)$')
+        p18 = regex_engine.compile(r'^\s*Last +reset +by (?P<reset_by>[a-zA-Z]+)'
+                                      r' +(?P<last_reset>[a-zA-Z0-9\:\s]+), +due +to'
+                                      r' +(?P<reset_reason>[a-zA-Z\-\s]+)$')
+        p19 = regex_engine.compile(r'^\s*Neighbor +capabilities *:$')
+        p20_1 = regex_engine.compile(r'^\s*Dynamic +capability *:'
+                                      r' +(?P<dynamic_capability>[a-zA-Z\,\(\)\s]+)$')
+        p20_2 = regex_engine.compile(r'^\s*Dynamic +capability +\(old\) *:'
+                                      r' +(?P<dynamic_capability_old>[a-zA-Z\s]+)$')
+        p21 = regex_engine.compile(r'^\s*Route +refresh +capability +\(new\) *:'
+                                      r' +(?P<route_refresh>[a-zA-Z\s]+)$')
+        p21_1 = regex_engine.compile(r'^\s*Route +refresh +capability +\(old\) *:'
+                                      r' +(?P<route_refresh_old>[a-zA-Z\s]+)$')
+        p22 = regex_engine.compile(r'^\s*4-Byte AS capability: +(?P<capability>[\w\s]+)$')
+        p23 = regex_engine.compile(r'^\s*Address +family +VPNv4 +Unicast *:'
+                                      r' +(?P<vpnv4_unicast>[a-zA-Z\s]+)$')
+        p24 = regex_engine.compile(r'^\s*Address +family +VPNv6 +Unicast *:'
+                                      r' +(?P<vpnv6_unicast>[a-zA-Z\s]+)$')
+        p24_1 = regex_engine.compile(r'^\s*Address +family +IPv4 +MVPN:'
+                                      r' +(?P<ipv4_mvpn>[\w\s]+)$')
+        p25 = regex_engine.compile(r'^\s*Graceful +Restart +capability *:'
+                                      r' +(?P<graceful_restart>[a-zA-Z\s]+)$')
+        p26 = regex_engine.compile(r'^\s*Graceful +Restart +Parameters *:$')
+        p27_1 = regex_engine.compile(r'^\s*$')
+        p27_2 = regex_engine.compile(r'^\s*$')
+        p28_1 = regex_engine.compile(r'^\s*Restart +time +advertised +to +peer *:'
+                                      r' +(?P<time>[0-9]+) +seconds$')
+        p28_2 = regex_engine.compile(r'^\s*Restart +time +advertised +by +peer *:'
+                                      r' +(?P<time>[0-9]+) +seconds$')
+        p28 = regex_engine.compile(r'^\s*Stale +time +for +routes +advertised +by'
+                                      r' +peer *: +(?P<time>[0-9]+) +seconds$')
+        p30 = regex_engine.compile(r'^\s*(?P<message_stat>[a-zA-Z\s]+) *:'
+                                      r' +(?P<sent>[0-9]+) +(?P<received>[0-9]+)$')
+        p31 = regex_engine.compile(r'^\s*For +address +family *:'
+                                      r' +(?P<af>[a-zA-Z0-9\s]+)$')
+        p32 = regex_engine.compile(r'^\s*BGP +table +version'
+                                      r' +(?P<af_bgp_table_version>[0-9]+), +neighbor'
+                                      r' +version +(?P<nbr_version>[0-9]+)$')
+        p33 = regex_engine.compile(r'^\s*(?P<accepted_paths>[0-9]+) +accepted'
+                                      r' +paths +consume +(?P<bytes_consumed>[0-9]+)'
+                                      r' +bytes +of +memory$')
+        p34 = regex_engine.compile(r'^\s*(?P<num_sent_paths>[0-9]+) +sent +paths$')
+        p35 = regex_engine.compile(r'^\s*Community +attribute +sent +to +this'
+                                      r' +neighbor$')
+        p36 = regex_engine.compile(r'^\s*Extended +community +attribute +sent +to'
+                                      r' +this +neighbor$')
+        p37 = regex_engine.compile(r'^\s*Maximum +prefixes +allowed +(?P<num>[0-9]+)$')
+        p38 = regex_engine.compile(r'^\s*Inbound +route-map +configured +is'
+                                      r' +(?P<route_map_name_in>(\S+)), +handle'
+                                      r' +obtained$')
+        p39 = regex_engine.compile(r'^\s*Outbound +route-map +configured +is'
+                                      r' +(?P<route_map_name_out>(\S+)), +handle'
+                                      r' +obtained$')
+        p40 = regex_engine.compile(r'^\s*Third-party +Nexthop +will +not +be'
+                                      r' +computed.$')
+        p41 = regex_engine.compile(r'^\s*SOO +Extcommunity *:'
+                                      r' +(?P<soo>[a-zA-Z0-9\:]+)$')
+        p42 = regex_engine.compile(r'^\s*Inbound +soft +reconfiguration +allowed$')
+        p43 = regex_engine.compile(r'\s*Nexthop(?: +always)? +set +to +local +peering'
+                                      r' +address, +(?P<ip>[\w\.\:]+)$')
+        p44 = regex_engine.compile(r'^\s*Allow +my +ASN +(?P<num>[0-9]+) +times$')
+        p45 = regex_engine.compile(r'^\s*ASN override is enabled$')
+        p46 = regex_engine.compile(r'^\s*Default +information +originate,'
+                                      r'(?: +route-map +(?P<route_map>(\S+)),)?'
+                                      r' +default(?: +not)? +sent$')
+        p48 = regex_engine.compile(r'^\s*(?P<inherit_peer_seq>[0-9]+)'
+                                      r' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
+        p49 = regex_engine.compile(r'^\s*Local +host *: +(?P<local_host>[0-9\.\:]+),'
+                                      r' +Local +port *: +(?P<local_port>[0-9]+)$')
+        p50 = regex_engine.compile(r'^\s*Foreign +host *:'
+                                      r' +(?P<foreign_host>[0-9\.\:]+), +Foreign'
+                                      r' +port *: +(?P<foreign_port>[0-9]+)$')
+        p51 = regex_engine.compile(r'^\s*fd += +(?P<fd>[0-9]+)$')
+        p52 = regex_engine.compile(r'^\s*Route reflector client$')
             
         for line in out.splitlines():
             line = line.rstrip()
@@ -1661,33 +1661,33 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
         # Init vars
         nh_dict = {}
 
-        p1 = re.compile(r'^\s*Next +Hop +table +for +VRF'
-                            r' +(?P<vrf_name>\S+), +address +family'
-                            r' +(?P<af>[a-zA-Z0-9\s\-]+) *:$')
-        p2 = re.compile(r'^\s*Critical *:'
-                            r' +(?P<nexthop_trigger_delay_critical>[0-9]+)'
-                            r' +Non-critical *:'
-                            r' +(?P<nexthop_trigger_delay_non_critical>[0-9]+)$')
-        p3 = re.compile(r'^\s*Nexthop *: +(?P<nh>[a-zA-Z0-9\.\:]+),'
-                            r'( +Flags *: +(?P<flags>\w+),)?'
-                            r' +Refcount *: +(?P<refcount>[0-9]+), +IGP'
-                            r' +cost *: +(?P<igp_cost>[0-9\-]+)'
-                            r'(?:, +Multipath: +(?P<multipath>(\S+)))?$')
-        p4 = re.compile(r'^\s*IGP +Route +type *:'
-                            r' +(?P<igp_route_type>[0-9]+), +IGP +preference *:'
-                            r' +(?P<igp_preference>[0-9]+)$')
-        p5 = re.compile(r'^\s*Nexthop +is +(?P<attached>[\w\-]+) +'
-                            r'(?P<local>[\w\-]+) +(?P<reachable>[\w\-]+) +'
-                            r'(?P<labeled>[\w\-]+)$')
-        p6 = re.compile(r'^\s*Nexthop +last +resolved *:'
-                            r' +(?P<nexthop_last_resolved>[a-zA-Z0-9\:\.\s]+),'
-                            r' +using +(?P<nexthop_resolved_using>[\w\:\-\.\/]+)$')
-        p7 = re.compile(r'^\s*Metric +next +advertise *:'
-                            r' +(?P<metric_next_advertise>[a-zA-Z0-9\:]+)$')
-        p8 = re.compile(r'^\s*RNH +epoch *: +(?P<rnh_epoch>[0-9]+)$')
-        p9 = re.compile(r'^\s*Attached +nexthop *:'
-                            r' +(?P<attached_nexthop>[\w\.\:]+), +Interface *:'
-                            r' +(?P<attached_nexthop_interface>[\w\-\.\/]+)$')
+        p1 = regex_engine.compile(r'^\s*Next +Hop +table +for +VRF'
+                                      r' +(?P<vrf_name>\S+), +address +family'
+                                      r' +(?P<af>[a-zA-Z0-9\s\-]+) *:$')
+        p2 = regex_engine.compile(r'^\s*Critical *:'
+                                      r' +(?P<nexthop_trigger_delay_critical>[0-9]+)'
+                                      r' +Non-critical *:'
+                                      r' +(?P<nexthop_trigger_delay_non_critical>[0-9]+)$')
+        p3 = regex_engine.compile(r'^\s*Nexthop *: +(?P<nh>[a-zA-Z0-9\.\:]+),'
+                                      r'( +Flags *: +(?P<flags>\w+),)?'
+                                      r' +Refcount *: +(?P<refcount>[0-9]+), +IGP'
+                                      r' +cost *: +(?P<igp_cost>[0-9\-]+)'
+                                      r'(?:, +Multipath: +(?P<multipath>(\S+)))?$')
+        p4 = regex_engine.compile(r'^\s*IGP +Route +type *:'
+                                      r' +(?P<igp_route_type>[0-9]+), +IGP +preference *:'
+                                      r' +(?P<igp_preference>[0-9]+)$')
+        p5 = regex_engine.compile(r'^\s*Nexthop +is +(?P<attached>[\w\-]+) +'
+                                      r'(?P<local>[\w\-]+) +(?P<reachable>[\w\-]+) +'
+                                      r'(?P<labeled>[\w\-]+)$')
+        p6 = regex_engine.compile(r'^\s*Nexthop +last +resolved *:'
+                                      r' +(?P<nexthop_last_resolved>[a-zA-Z0-9\:\.\s]+),'
+                                      r' +using +(?P<nexthop_resolved_using>[\w\:\-\.\/]+)$')
+        p7 = regex_engine.compile(r'^\s*Metric +next +advertise *:'
+                                      r' +(?P<metric_next_advertise>[a-zA-Z0-9\:]+)$')
+        p8 = regex_engine.compile(r'^\s*RNH +epoch *: +(?P<rnh_epoch>[0-9]+)$')
+        p9 = regex_engine.compile(r'^\s*Attached +nexthop *:'
+                                      r' +(?P<attached_nexthop>[\w\.\:]+), +Interface *:'
+                                      r' +(?P<attached_nexthop_interface>[\w\-\.\/]+)$')
         for line in out.splitlines():
             line = line.rstrip()
 
@@ -1886,6 +1886,10 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
                     'show bgp vrf {vrf} {address_family} summary']
 
     xml_command = 'show bgp vrf {vrf} all summary | xml'
+
+    # '| json' output is parsed with context='json'
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
     exclude = [
       'tbl_ver',
       'up_down',
@@ -1918,56 +1922,56 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
         # Init vars
         sum_dict = {}
         data_on_nextline = False
-        p1 = re.compile(r'^\s*BGP +summary +information +for +VRF'
-                            r' +(?P<vrf_name>\S+), +address +family'
-                            r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +router +identifier'
-                            r' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
-                            r' +number +(?P<local_as>[0-9]+)$')
-        p3 = re.compile(r'^\s*BGP +table +version +is'
-                            r' +(?P<bgp_table_version>[0-9]+),'
-                            r' +(?P<address_family>[a-zA-Z0-9\-\s]+) +config'
-                            r' +peers +(?P<config_peers>[0-9]+), +capable'
-                            r' +peers +(?P<capable_peers>[0-9]+)$')
-        p4 = re.compile(r'^\s*(?P<networks>[0-9]+) +network +entries +and'
-                            r' +(?P<paths>[0-9]+) +paths +using'
-                            r' +(?P<bytes>[0-9]+) +bytes +of +memory$')
-        p5 = re.compile(r'^\s*BGP +attribute +entries'
-                            r' +(?P<attribute_entries>(\S+)), +BGP +AS +path'
-                            r' +entries +(?P<as_path_entries>(\S+))$')
-        p6 = re.compile(r'^\s*BGP +community +entries'
-                            r' +(?P<community_entries>(\S+)), +BGP +clusterlist'
-                            r' +entries +(?P<clusterlist_entries>(\S+))$')
-        p7 = re.compile(r'^\s*Dampening +configured,'
-                            r' +(?P<history_paths>[0-9]+) +history +paths,'
-                            r' +(?P<dampened_paths>[0-9]+) +dampened +paths$')
-        p9 = re.compile(r'^\s*(?P<val>[0-9]+) +received +paths +for +inbound +soft +reconfiguration$')
-        p10 = re.compile(r'^\s*(?P<val1>[0-9]+) +identical, +'
-                            r'(?P<val2>[0-9]+) +modified, +'
-                            r'(?P<val3>[0-9]+) +filtered +received +paths +'
-                            r'using +(?P<val4>[0-9]+) +bytes$')
-        p8 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)\s+(?P<v>[0-9]+)'
-                            r'\s+(?P<as>[0-9.]+)\s+(?P<msg_rcvd>[0-9]+)'
-                            r'\s+(?P<msg_sent>[0-9]+)\s+(?P<tbl_ver>[0-9]+)'
-                            r'\s+(?P<inq>[0-9]+)\s+(?P<outq>[0-9]+)'
-                            r'\s+(?P<up_down>[a-zA-Z0-9\:]+)'
-                            r'\s+(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?'
-                            r'\s*(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')
-        p8_1 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p8_2 = re.compile(r'^\s*(?P<v>[0-9]+) +(?P<as>[0-9]+)'
-                            r' +(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
-                            r' +(?P<tbl_ver>[0-9]+) +(?P<inq>[0-9]+)'
-                            r' +(?P<outq>[0-9]+) +(?P<up_down>[a-zA-Z0-9\:]+)'
-                            r' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')
+        p1 = regex_engine.compile(r'^\s*BGP +summary +information +for +VRF'
+                                      r' +(?P<vrf_name>\S+), +address +family'
+                                      r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p2 = regex_engine.compile(r'^\s*BGP +router +identifier'
+                                      r' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
+                                      r' +number +(?P<local_as>[0-9]+)$')
+        p3 = regex_engine.compile(r'^\s*BGP +table +version +is'
+                                      r' +(?P<bgp_table_version>[0-9]+),'
+                                      r' +(?P<address_family>[a-zA-Z0-9\-\s]+) +config'
+                                      r' +peers +(?P<config_peers>[0-9]+), +capable'
+                                      r' +peers +(?P<capable_peers>[0-9]+)$')
+        p4 = regex_engine.compile(r'^\s*(?P<networks>[0-9]+) +network +entries +and'
+                                      r' +(?P<paths>[0-9]+) +paths +using'
+                                      r' +(?P<bytes>[0-9]+) +bytes +of +memory$')
+        p5 = regex_engine.compile(r'^\s*BGP +attribute +entries'
+                                      r' +(?P<attribute_entries>(\S+)), +BGP +AS +path'
+                                      r' +entries +(?P<as_path_entries>(\S+))$')
+        p6 = regex_engine.compile(r'^\s*BGP +community +entries'
+                                      r' +(?P<community_entries>(\S+)), +BGP +clusterlist'
+                                      r' +entries +(?P<clusterlist_entries>(\S+))$')
+        p7 = regex_engine.compile(r'^\s*Dampening +configured,'
+                                      r' +(?P<history_paths>[0-9]+) +history +paths,'
+                                      r' +(?P<dampened_paths>[0-9]+) +dampened +paths$')
+        p9 = regex_engine.compile(r'^\s*(?P<val>[0-9]+) +received +paths +for +inbound +soft +reconfiguration$')
+        p10 = regex_engine.compile(r'^\s*(?P<val1>[0-9]+) +identical, +'
+                                      r'(?P<val2>[0-9]+) +modified, +'
+                                      r'(?P<val3>[0-9]+) +filtered +received +paths +'
+                                      r'using +(?P<val4>[0-9]+) +bytes$')
+        p8 = regex_engine.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)\s+(?P<v>[0-9]+)'
+                                      r'\s+(?P<as>[0-9.]+)\s+(?P<msg_rcvd>[0-9]+)'
+                                      r'\s+(?P<msg_sent>[0-9]+)\s+(?P<tbl_ver>[0-9]+)'
+                                      r'\s+(?P<inq>[0-9]+)\s+(?P<outq>[0-9]+)'
+                                      r'\s+(?P<up_down>[a-zA-Z0-9\:]+)'
+                                      r'\s+(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?'
+                                      r'\s*(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')
+        p8_1 = regex_engine.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
+        p8_2 = regex_engine.compile(r'^\s*(?P<v>[0-9]+) +(?P<as>[0-9]+)'
+                                      r' +(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
+                                      r' +(?P<tbl_ver>[0-9]+) +(?P<inq>[0-9]+)'
+                                      r' +(?P<outq>[0-9]+) +(?P<up_down>[a-zA-Z0-9\:]+)'
+                                      r' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')
         # Neighbor        V             AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
         # 10.10.10.10     4 4211111111
-        p8_3 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<v>[0-9]+) +(?P<as>[0-9]+)$')
+        p8_3 = regex_engine.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<v>[0-9]+) +(?P<as>[0-9]+)$')
         # Neighbor        V    AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
         #                                                  0              0           0      0        0       5w6d   Idle 
-        p8_4 = re.compile(r'^\s*(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
-                          r' +(?P<tbl_ver>[0-9]+) +(?P<inq>[0-9]+)'
-                          r' +(?P<outq>[0-9]+) +(?P<up_down>[a-zA-Z0-9\:]+)'
-                          r' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')                            
+        p8_4 = regex_engine.compile(r'^\s*(?P<msg_rcvd>[0-9]+) +(?P<msg_sent>[0-9]+)'
+                                    r' +(?P<tbl_ver>[0-9]+) +(?P<inq>[0-9]+)'
+                                    r' +(?P<outq>[0-9]+) +(?P<up_down>[a-zA-Z0-9\:]+)'
+                                    r' +(?P<state_pfxrcd>(?P<state>[a-zA-Z\s\(\)]+)?(?P<prx_rcd>\d+)?([\w\(\)\s]+)?)$')                            
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -2291,314 +2295,275 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 
         return sum_dict
 
-    def xml(self, vrf='all', address_family='all'):
+    # ROW_saf leaves
+    xml_saf_mapping = {
+        'tableversion': ('bgp_table_version', int),
+        'configuredpeers': ('config_peers', int),
+        'capablepeers': ('capable_peers', int),
+        'totalnetworks': (('prefixes', 'total_entries'), int),
+        'totalpaths': (('path', 'total_entries'), int),
+        'historypaths': ('history_paths', int),
+        'dampenedpaths': ('dampened_paths', int),
+        'softreconfigrecvdpaths': ('soft_reconfig_recvd_paths', int),
+        'softreconfigidenticalpaths': ('soft_reconfig_identical_paths', int),
+        'softreconfigcombopaths': ('soft_reconfig_combo_paths', int),
+        'softreconfigfilteredrecvd': ('soft_reconfig_filtered_recvd', int),
+        'softreconfigbytes': ('soft_reconfig_bytes', int),
+    }
+
+    # ROW_neighbor leaves
+    xml_neighbor_mapping = {
+        'neighborversion': ('neighbor_table_version', int),
+        'msgrecvd': ('msg_rcvd', int),
+        'msgsent': ('msg_sent', int),
+        'neighbortableversion': ('tbl_ver', int),
+        'inq': ('inq', int),
+        'outq': ('outq', int),
+        'neighboras': ('as', int),
+        'time': 'up_down',
+    }
+
+    def xml(self, vrf='all', address_family='all', output=None):
 
-        out = self.device.execute(self.xml_command.format(vrf=vrf))
+        if output is None:
+            output = self.device.execute(self.xml_command.format(vrf=vrf))
 
         etree_dict = {}
+        # address families of the vrf being read: [(af, af_dict, neighbors)]
+        saf_list = []
+        neighbors = []
+
+        stream = XmlStream(output, records=['ROW_vrf', 'ROW_saf',
+                                            'ROW_neighbor'])
+        for record, leaves, parents in stream:
+
+            # -----   neighbor  -----
+            if record == 'ROW_neighbor':
+                # <neighborid>10.16.2.2</neighborid>
+                if leaves.get('neighborid'):
+                    neighbors.append(leaves)
+
+            # -----   address_family  -----
+            elif record == 'ROW_saf':
+                saf_neighbors, neighbors = neighbors, []
+                # for valid entry, table version should be there
+                if not leaves.get('af-name') or not leaves.get('tableversion'):
+                    continue
+                af_dict = map_leaves(leaves, self.xml_saf_mapping)
+
+                # <memoryused>1820</memoryused>
+                if leaves.get('memoryused') and 'path' in af_dict and \
+                        'prefixes' in af_dict:
+                    af_dict['path']['memory_usage'] = \
+                        af_dict['prefixes']['memory_usage'] = \
+                        int(leaves['memoryused'])
+
+                # <numberattrs>1</numberattrs>
+                # <bytesattrs>160</bytesattrs>
+                for key, number, size in (
+                        ('attribute_entries', 'numberattrs', 'bytesattrs'),
+                        ('as_path_entries', 'numberpaths', 'bytespaths'),
+                        ('community_entries', 'numbercommunities',
+                         'bytescommunities'),
+                        ('clusterlist_entries', 'numberclusterlist',
+                         'bytesclusterlist')):
+                    if leaves.get(number) and leaves.get(size):
+                        af_dict[key] = '[{0}/{1}]'.format(leaves[number],
+                                                          leaves[size])
+
+                # <dampening>Enabled</dampening>
+                dampening = (leaves.get('dampening') or '').lower()
+                if 'enabled' in dampening or 'true' in dampening:
+                    af_dict['dampening'] = True
+
+                saf_list.append((leaves['af-name'].lower(), af_dict,
+                                 saf_neighbors))
+
+            # -----   vrf  -----
+            elif record == 'ROW_vrf':
+                vrf_saf_list, saf_list = saf_list, []
+                vrf_name = leaves.get('vrf-name-out')
+                if not vrf_name:
+                    continue
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
+                # <vrf-router-id>10.106.0.6</vrf-router-id>
+                # <vrf-local-as>333</vrf-local-as>
+                vrf_af_dict = map_leaves(leaves, {
+                    'vrf-router-id': 'route_identifier',
+                    'vrf-local-as': ('local_as', int)})
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[2].format(vrf=vrf,
-                                                                              address_family=address_family))
+                for af, af_dict, saf_neighbors in vrf_saf_list:
+                    for nei_leaves in saf_neighbors:
+                        sub_dict = etree_dict.setdefault('vrf', {}).\
+                            setdefault(vrf_name, {}).setdefault('neighbor', {}).\
+                            setdefault(nei_leaves['neighborid'], {}).\
+                            setdefault('address_family', {}).\
+                            setdefault(af, {})
 
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
+                        #  ---   AF attributes -------
+                        sub_dict.update(vrf_af_dict)
+                        sub_dict.update(deepcopy(af_dict))
 
-        if not root:
-            return etree_dict
+                        #  ---   Neighbors attributes -------
+                        map_leaves(nei_leaves, self.xml_neighbor_mapping,
+                                   sub_dict)
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # <vrf-router-id>10.106.0.6</vrf-router-id>
-            try:
-                route_identifier = vrf_tree.find('{}vrf-router-id'.format(namespace)).text
-            except Exception:
-                route_identifier = None
-
-            # <vrf-local-as>333</vrf-local-as>
-            try:
-                local_as = vrf_tree.find('{}vrf-local-as'.format(namespace)).text
-            except Exception:
-                local_as = None
-
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_af'.format(namespace))
-            if not af_tree:
-                continue
-            for af_root in af_tree.findall('{}ROW_af'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_saf'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_saf'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                        # initial af dictionary
-                        af_dict = {}
-                        if route_identifier:
-                            af_dict['route_identifier'] = route_identifier
-                        if local_as:
-                            af_dict['local_as'] = int(local_as)
-                    except Exception:
-                        continue
+                        # <state>Established</state>
+                        # <prefixreceived>5</prefixreceived>
+                        state = (nei_leaves.get('state') or '').lower()
+                        sub_dict['state'] = state
+                        if 'established' in state:
+                            sub_dict['prefix_received'] = \
+                                sub_dict['state_pfxrcd'] = \
+                                nei_leaves.get('prefixreceived')
+                        else:
+                            sub_dict['state_pfxrcd'] = state
 
-                    # <tableversion>7</tableversion>
-                    try:
-                        af_dict['bgp_table_version'] = int(
-                            saf_root.find('{}tableversion'.format(namespace)).text)
-                    except Exception:
-                        # for valide entry, table version should be there
-                        continue
+        # compare cli command
+        if stream.command:
+            stream.compare_command(self.cli_command[2].format(
+                vrf=vrf, address_family=address_family))
 
-                    # <configuredpeers>3</configuredpeers>
-                    af_dict['config_peers'] = \
-                        int(saf_root.find('{}configuredpeers'.format(namespace)).text)
-                        
-                    # <capablepeers>2</capablepeers>
-                    af_dict['capable_peers'] = \
-                        int(saf_root.find('{}capablepeers'.format(namespace)).text)
-
-                    # <totalnetworks>5</totalnetworks>
-                    try:
-                        total_prefix_entries = \
-                            int(saf_root.find('{}totalnetworks'.format(namespace)).text)
-                        if 'prefixes' not in af_dict:
-                            af_dict['prefixes'] = {}
-                        af_dict['prefixes']['total_entries'] = total_prefix_entries
-                    except Exception:
-                        pass
-                        
-                    # <totalpaths>10</totalpaths>
-                    try:
-                        total_path_entries = \
-                            int(saf_root.find('{}totalpaths'.format(namespace)).text)
-                        if 'path' not in af_dict:
-                            af_dict['path'] = {}
-                        af_dict['path']['total_entries'] = total_path_entries
-                    except Exception:
-                        pass
-                        
-                    # <memoryused>1820</memoryused>
-                    try:
-                        memory_usage = \
-                            int(saf_root.find('{}memoryused'.format(namespace)).text)
-                        af_dict['path']['memory_usage'] = memory_usage
-                        af_dict['prefixes']['memory_usage'] = memory_usage
-                    except Exception:
-                        pass
-
-                    try:
-                        # <numberattrs>1</numberattrs>
-                        entries_1 = \
-                            saf_root.find('{}numberattrs'.format(namespace)).text
-                            
-                        # <bytesattrs>160</bytesattrs>
-                        entries_2 = \
-                            saf_root.find('{}bytesattrs'.format(namespace)).text
-
-                        af_dict['attribute_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberpaths>1</numberpaths>
-                        entries_1 = \
-                            saf_root.find('{}numberpaths'.format(namespace)).text
-
-                        # <bytespaths>34</bytespaths>
-                        entries_2 = \
-                            saf_root.find('{}bytespaths'.format(namespace)).text
-
-                        af_dict['as_path_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numbercommunities>0</numbercommunities>
-                        entries_1 = \
-                            saf_root.find('{}numbercommunities'.format(namespace)).text
-
-                        # <bytescommunities>0</bytescommunities>
-                        entries_2 = \
-                            saf_root.find('{}bytescommunities'.format(namespace)).text
-
-                        af_dict['community_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberclusterlist>0</numberclusterlist>
-                        entries_1 = \
-                            saf_root.find('{}numberclusterlist'.format(namespace)).text
+        return etree_dict
 
-                        # <bytesclusterlist>0</bytesclusterlist>
-                        entries_2 = \
-                            saf_root.find('{}bytesclusterlist'.format(namespace)).text
+    def json(self, vrf='all', address_family='all', output=None):
+        if output is None:
+            if address_family == 'all':
+                if vrf == 'all':
+                    cmd = self.cli_command[0]
+                else:
+                    cmd = self.cli_command[1].format(vrf=vrf)
+            else:
+                cmd = self.cli_command[2].format(vrf=vrf,
+                                                 address_family=address_family)
+            out = self.device.execute(cmd + ' | json')
+        else:
+            out = output
 
-                        af_dict['clusterlist_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
+        sum_dict = {}
 
-                    # <dampening>Enabled</dampening>
-                    dampening = saf_root.find('{}dampening'.format(namespace)).text.lower()
+        # -----   loop vrf  -----
+        for vrf_row in Common.retrieve_json_rows(Common.load_json_output(out),
+                                                 'TABLE_vrf'):
+            # "vrf-name-out": "default"
+            vrf = vrf_row['vrf-name-out']
+
+            # -----   loop address_family  -----
+            for af_row in Common.retrieve_json_rows(vrf_row, 'TABLE_af'):
+                for saf_row in Common.retrieve_json_rows(af_row, 'TABLE_saf'):
+                    # "tableversion": "7", for valid entry, table version
+                    # should be there
+                    if 'af-name' not in saf_row or 'tableversion' not in saf_row:
+                        continue
+                    af = saf_row['af-name'].lower()
+
+                    af_dict = {}
+                    # "vrf-router-id": "10.106.0.6"
+                    if vrf_row.get('vrf-router-id'):
+                        af_dict['route_identifier'] = vrf_row['vrf-router-id']
+                    # "vrf-local-as": "333"
+                    if vrf_row.get('vrf-local-as'):
+                        af_dict['local_as'] = int(vrf_row['vrf-local-as'])
+
+                    af_dict['bgp_table_version'] = int(saf_row['tableversion'])
+                    af_dict['config_peers'] = int(saf_row['configuredpeers'])
+                    af_dict['capable_peers'] = int(saf_row['capablepeers'])
+
+                    # "totalnetworks": "5", "totalpaths": "10",
+                    # "memoryused": "1820"
+                    if 'totalnetworks' in saf_row:
+                        af_dict['prefixes'] = {
+                            'total_entries': int(saf_row['totalnetworks'])}
+                    if 'totalpaths' in saf_row:
+                        af_dict['path'] = {
+                            'total_entries': int(saf_row['totalpaths'])}
+                    if 'memoryused' in saf_row:
+                        for key in ('prefixes', 'path'):
+                            if key in af_dict:
+                                af_dict[key]['memory_usage'] = \
+                                    int(saf_row['memoryused'])
+
+                    # "numberattrs": "1", "bytesattrs": "160"
+                    for key, number, size in (
+                            ('attribute_entries', 'numberattrs', 'bytesattrs'),
+                            ('as_path_entries', 'numberpaths', 'bytespaths'),
+                            ('community_entries', 'numbercommunities',
+                             'bytescommunities'),
+                            ('clusterlist_entries', 'numberclusterlist',
+                             'bytesclusterlist')):
+                        if number in saf_row and size in saf_row:
+                            af_dict[key] = '[{0}/{1}]'.format(saf_row[number],
+                                                              saf_row[size])
+
+                    # "dampening": "true"
+                    dampening = str(saf_row.get('dampening', '')).lower()
                     if 'enabled' in dampening or 'true' in dampening:
                         af_dict['dampening'] = True
-
-                    # <historypaths>0</historypaths>
-                    try:
-                        af_dict['history_paths'] = int(saf_root.find('{}historypaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <dampenedpaths>0</dampenedpaths>
-                    try:
-                        af_dict['dampened_paths'] = int(saf_root.find('{}dampenedpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
-                    try:
-                        af_dict['soft_reconfig_recvd_paths'] = int(
-                                saf_root.find('{}softreconfigrecvdpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigidenticalpaths>10</softreconfigidenticalpaths>
-                    try:
-                        af_dict['soft_reconfig_identical_paths'] = int(
-                                saf_root.find('{}softreconfigidenticalpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <softreconfigcombopaths>0</softreconfigcombopaths>
-                    try:
-                        af_dict['soft_reconfig_combo_paths'] = int(
-                                saf_root.find('{}softreconfigcombopaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <softreconfigfilteredrecvd>0</softreconfigfilteredrecvd>
-                    try:
-                        af_dict['soft_reconfig_filtered_recvd'] = int(
-                                saf_root.find('{}softreconfigfilteredrecvd'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigbytes>0</softreconfigbytes>
-                    try:
-                        af_dict['soft_reconfig_bytes'] = int(
-                                saf_root.find('{}softreconfigbytes'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                     # Neighbor table
-                    nei_tree = saf_root.find('{}TABLE_neighbor'.format(namespace))
-                    if not nei_tree:
-                        continue
+                        # "historypaths": "0", "dampenedpaths": "0"
+                        if 'historypaths' in saf_row:
+                            af_dict['history_paths'] = int(saf_row['historypaths'])
+                        if 'dampenedpaths' in saf_row:
+                            af_dict['dampened_paths'] = int(saf_row['dampenedpaths'])
+
+                    # "softreconfigrecvdpaths": "10"
+                    for key, json_key in (
+                            ('soft_reconfig_recvd_paths', 'softreconfigrecvdpaths'),
+                            ('soft_reconfig_identical_paths', 'softreconfigidenticalpaths'),
+                            ('soft_reconfig_combo_paths', 'softreconfigcombopaths'),
+                            ('soft_reconfig_filtered_recvd', 'softreconfigfilteredrecvd'),
+                            ('soft_reconfig_bytes', 'softreconfigbytes')):
+                        if json_key in saf_row:
+                            af_dict[key] = int(saf_row[json_key])
 
                     # -----   loop neighbors  -----
-                    for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                        # neighbor
-                        try:
-                            nei = nei_root.find('{}neighborid'.format(namespace)).text
-                        except Exception:
+                    for nei_row in Common.retrieve_json_rows(saf_row, 'TABLE_neighbor'):
+                        # "neighborid": "10.16.2.2"
+                        nei = nei_row.get('neighborid')
+                        if not nei:
                             continue
 
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'neighbor' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['neighbor'] = {}
-                        if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]['neighbor'][nei]:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['neighbor'][nei]['address_family']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af] = {}
-                    
-                        sub_dict = etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af]
+                        sub_dict = sum_dict.setdefault('vrf', {}).\
+                            setdefault(vrf, {}).setdefault('neighbor', {}).\
+                            setdefault(nei, {}).setdefault('address_family', {}).\
+                            setdefault(af, {})
 
                         #  ---   AF attributes -------
-                        update_dict = deepcopy(af_dict)
-                        sub_dict.update(update_dict)
+                        sub_dict.update(deepcopy(af_dict))
 
                         #  ---   Neighbors attributes -------
-                        # <neighborversion>4</neighborversion>
-                        sub_dict['neighbor_table_version'] = int(
-                            nei_root.find('{}neighborversion'.format(namespace)).text)
-
-                        # <msgrecvd>5471</msgrecvd>
-                        sub_dict['msg_rcvd'] = int(
-                            nei_root.find('{}msgrecvd'.format(namespace)).text)
-                        
-                        # <msgsent>5459</msgsent>
-                        sub_dict['msg_sent'] = int(
-                            nei_root.find('{}msgsent'.format(namespace)).text)
-                        
-                        # <neighbortableversion>7</neighbortableversion>
-                        sub_dict['tbl_ver'] = int(
-                            nei_root.find('{}neighbortableversion'.format(namespace)).text)
-                        
-                        # <inq>0</inq>
-                        sub_dict['inq'] = int(
-                            nei_root.find('{}inq'.format(namespace)).text)
-                        
-                        # <outq>0</outq>
-                        sub_dict['outq'] = int(
-                            nei_root.find('{}outq'.format(namespace)).text)
-                        
-                        # <neighboras>333</neighboras>
-                        sub_dict['as'] = int(
-                            nei_root.find('{}neighboras'.format(namespace)).text)
-                        
-                        # <time>3d18h</time>
-                        sub_dict['up_down'] = \
-                            nei_root.find('{}time'.format(namespace)).text
-                        
-                        # <state>Established</state>
-                        state = nei_root.find('{}state'.format(namespace)).text.lower()
-
-                        # <prefixreceived>5</prefixreceived>
-                        prefix_received = \
-                            nei_root.find('{}prefixreceived'.format(namespace)).text
-
+                        # "neighborversion": "4", "msgrecvd": "5471",
+                        # "msgsent": "5459", "neighbortableversion": "7",
+                        # "inq": "0", "outq": "0"
+                        sub_dict['neighbor_table_version'] = int(nei_row['neighborversion'])
+                        sub_dict['msg_rcvd'] = int(nei_row['msgrecvd'])
+                        sub_dict['msg_sent'] = int(nei_row['msgsent'])
+                        sub_dict['tbl_ver'] = int(nei_row['neighbortableversion'])
+                        sub_dict['inq'] = int(nei_row['inq'])
+                        sub_dict['outq'] = int(nei_row['outq'])
+
+                        # "neighboras": "333", "neighboras": "1.57920"
+                        try:
+                            sub_dict['as'] = int(nei_row['neighboras'])
+                        except ValueError:
+                            sub_dict['as'] = float(nei_row['neighboras'])
+
+                        # "time": "3d18h", "time": "PT1H4M41S"
+                        up_down = str(nei_row['time'])
+                        if up_down.startswith('P'):
+                            up_down = Common.convert_xml_time(up_down)
+                        sub_dict['up_down'] = up_down
+
+                        # "state": "Established", "prefixreceived": "5"
+                        state = nei_row['state'].lower()
+                        sub_dict['state'] = state
                         if 'established' in state:
-                            sub_dict['state'] = state
+                            prefix_received = str(nei_row.get('prefixreceived', 0))
                             sub_dict['prefix_received'] = prefix_received
                             sub_dict['state_pfxrcd'] = prefix_received
                         else:
-                            sub_dict['state'] = state
                             sub_dict['state_pfxrcd'] = state
-                
-        return etree_dict
+
+        return sum_dict
 
 
 # ==================================================
@@ -2658,25 +2623,25 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
 
         bgp_dict = {}
         sub_dict = {}
-        p1 = re.compile(r'^Route +(?P<route>\w+) +Dampening +Parameters '
-                            r'+for +VRF +(?P<vrf>\w+) +Address +family '
-                            r'+(?P<af_name>[a-zA-Z0-9 ]+):$')
-        p9 = re.compile(r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
-                        r'\(VRF +(?P<rd_vrf>\w+)\)$')
-        p10 = re.compile(r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
-                            r'\((?P<rd_vrf>\w+)( *VNI +(?P<vni>\w+))\)')
-        p2 = re.compile(r'^Dampening +policy +configured: '
-                            r'+(?P<route_map>\w+)$')
-        p3 = re.compile(r'^Half-life +time +: +'
-                            r'(?P<half_time>\d+)( *(?P<unit>\w+))?$')
-        p4 = re.compile(r'^Suppress +penalty +: +'
-                            r'(?P<suppress_pen>\d+)( *(?P<unit>\w+))?$')
-        p5 = re.compile(r'^Reuse +penalty +: +'
-                            r'(?P<reuse_pen>\d+)( *(?P<unit>\w+))?$')
-        p6 = re.compile(r'^Max +suppress +time +: +'
-                            r'(?P<max_sup_time>\d+)( *(?P<unit>\w+))?$')
-        p7 = re.compile(r'^Max +suppress +penalty +: '
-                            r'+(?P<max_sup_pen>\d+)( *(?P<unit>\w+))?$')
+        p1 = regex_engine.compile(r'^Route +(?P<route>\w+) +Dampening +Parameters '
+                                      r'+for +VRF +(?P<vrf>\w+) +Address +family '
+                                      r'+(?P<af_name>[a-zA-Z0-9 ]+):$')
+        p9 = regex_engine.compile(r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
+                                  r'\(VRF +(?P<rd_vrf>\w+)\)$')
+        p10 = regex_engine.compile(r'^Route +Distinguisher: +(?P<rd>[0-9\.:]+) +'
+                                      r'\((?P<rd_vrf>\w+)( *VNI +(?P<vni>\w+))\)')
+        p2 = regex_engine.compile(r'^Dampening +policy +configured: '
+                                      r'+(?P<route_map>\w+)$')
+        p3 = regex_engine.compile(r'^Half-life +time +: +'
+                                      r'(?P<half_time>\d+)( *(?P<unit>\w+))?$')
+        p4 = regex_engine.compile(r'^Suppress +penalty +: +'
+                                      r'(?P<suppress_pen>\d+)( *(?P<unit>\w+))?$')
+        p5 = regex_engine.compile(r'^Reuse +penalty +: +'
+                                      r'(?P<reuse_pen>\d+)( *(?P<unit>\w+))?$')
+        p6 = regex_engine.compile(r'^Max +suppress +time +: +'
+                                      r'(?P<max_sup_time>\d+)( *(?P<unit>\w+))?$')
+        p7 = regex_engine.compile(r'^Max +suppress +penalty +: '
+                                      r'+(?P<max_sup_pen>\d+)( *(?P<unit>\w+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2774,205 +2739,64 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
                 continue
         return bgp_dict
 
-    def xml(self, vrf='all', address_family='all'):
-        out = self.device.execute(self.xml_command.format(vrf=vrf))
+    # ROW_rd leaves, the route-map values of TABLE_rpm override the rd ones
+    xml_rd_mapping = {
+        'rpmname': 'dampening_route_map',
+        'rd_vrf': 'rd_vrf',
+        'rd_vniid': 'rd_vni_id',
+        'damphalflife': 'dampening_half_life_time',
+        'dampsuppress': 'dampening_suppress_time',
+        'dampreuse': 'dampening_reuse_time',
+        'dampsuppresstime': 'dampening_max_suppress_time',
+        'dampmaxpenalty': 'dampening_max_suppress_penalty',
+        'TABLE_rpm/ROW_rpm/rpmdamphalflife': 'dampening_half_life_time',
+        'TABLE_rpm/ROW_rpm/rpmdampsuppress': 'dampening_suppress_time',
+        'TABLE_rpm/ROW_rpm/rpmdampreuse': 'dampening_reuse_time',
+        'TABLE_rpm/ROW_rpm/rpmdampsuppresstime': 'dampening_max_suppress_time',
+        'TABLE_rpm/ROW_rpm/rpmdampmaxpenalty':
+            'dampening_max_suppress_penalty',
+    }
+
+    def xml(self, vrf='all', address_family='all', output=None):
+        if output is None:
+            output = self.device.execute(self.xml_command.format(vrf=vrf))
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[1].format(vrf=vrf,
-                                                                              address_family=address_family))
-
-        root = Common.retrieve_xml_child(
-                root=root,
-                key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_afi'.format(namespace))
-            if not af_tree:
+        stream = XmlStream(output, records=['ROW_vrf', 'ROW_safi', 'ROW_rd'])
+        for record, leaves, parents in stream:
+            if record != 'ROW_rd':
                 continue
-            for af_root in af_tree.findall('{}ROW_afi'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_safi'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_safi'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                    except Exception:
-                        continue
-
-                     # RD table
-                    rd_tree = saf_root.find('{}TABLE_rd'.format(namespace))
-                    if not rd_tree:
-                        continue
-
-                    # -----   loop rd  -----
-                    for rd_root in rd_tree.findall('{}ROW_rd'.format(namespace)):
-
-                        # neighbor
-                        try:
-                            rd = rd_root.find('{}rd_val'.format(namespace)).text
-                        except Exception:
-                            rd = None
-
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['address_family']:
-                            etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                        # dampening
-                        etree_dict['vrf'][vrf]['address_family'][af]['dampening'] = 'True'
-
-                        if rd:
-                            if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'] = {}
-
-                            if rd not in etree_dict['vrf'][vrf]['address_family']:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd] = {}
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd]
-                        else:
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
-                                    
-
-                        # <dampconfigured>Configured</dampconfigured>
-                        # cli does not have this key
-
-                        # <rpmname>test</rpmname>
-                        try:
-                            sub_dict['dampening_route_map'] = \
-                                rd_root.find('{}rpmname'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <rd_vrf>vpn2</rd_vrf>
-                        try:
-                            sub_dict['rd_vrf'] = \
-                                rd_root.find('{}rd_vrf'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <rd_vniid>2</rd_vniid>
-                        try:
-                            sub_dict['rd_vni_id'] = \
-                                rd_root.find('{}rd_vniid'.format(namespace)).text
-                        except Exception:
-                            pass
 
-                        # <damphalflife>1</damphalflife>
-                        try:
-                            sub_dict['dampening_half_life_time'] = \
-                                rd_root.find('{}damphalflife'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <vrf-name-out>default</vrf-name-out>
+            # <af-name>IPv4 Unicast</af-name>
+            vrf_name = parents[1].get('vrf-name-out')
+            af = parents[2].get('af-name')
+            if not vrf_name or not af:
+                continue
 
-                        # <dampsuppress>30</dampsuppress>
-                        try:
-                            sub_dict['dampening_suppress_time'] = \
-                                rd_root.find('{}dampsuppress'.format(namespace)).text
-                        except Exception:
-                            pass
+            af_dict = etree_dict.setdefault('vrf', {}).\
+                setdefault(vrf_name, {}).setdefault('address_family', {}).\
+                setdefault(af.lower(), {})
 
-                        # <dampreuse>10</dampreuse>
-                        try:
-                            sub_dict['dampening_reuse_time'] = \
-                                rd_root.find('{}dampreuse'.format(namespace)).text
-                        except Exception:
-                            pass
+            # dampening
+            af_dict['dampening'] = 'True'
 
-                        # <dampsuppresstime>2</dampsuppresstime>
-                        try:
-                            sub_dict['dampening_max_suppress_time'] = \
-                                rd_root.find('{}dampsuppresstime'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <rd_val>100:100</rd_val>
+            rd = leaves.get('rd_val')
+            if rd:
+                sub_dict = af_dict.setdefault('route_distinguisher', {}).\
+                    setdefault(rd, {})
+            else:
+                sub_dict = af_dict
 
-                        # <dampmaxpenalty>40</dampmaxpenalty>
-                        try:
-                            sub_dict['dampening_max_suppress_penalty'] = \
-                                rd_root.find('{}dampmaxpenalty'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # TABLE_rpm
-                        rpm_tree = rd_root.find('{}TABLE_rpm'.format(namespace))
-                        if not rpm_tree:
-                            continue
+            # <dampconfigured>Configured</dampconfigured>
+            # cli does not have this key
+            map_leaves(leaves, self.xml_rd_mapping, sub_dict)
 
-                        # ROW_rpm
-                        for rpm_root in rpm_tree.findall('{}ROW_rpm'.format(namespace)):
-
-                            # <rpmdamphalflife>1</rpmdamphalflife>
-                            try:
-                                sub_dict['dampening_half_life_time'] = \
-                                    rpm_root.find('{}rpmdamphalflife'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampsuppress>30</rpmdampsuppress>
-                            try:
-                                sub_dict['dampening_suppress_time'] = \
-                                    rpm_root.find('{}rpmdampsuppress'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampreuse>10</rpmdampreuse>
-                            try:
-                                sub_dict['dampening_reuse_time'] = \
-                                    rpm_root.find('{}rpmdampreuse'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampsuppresstime>2</rpmdampsuppresstime>
-                            try:
-                                sub_dict['dampening_max_suppress_time'] = \
-                                    rpm_root.find('{}rpmdampsuppresstime'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampmaxpenalty>40</rpmdampmaxpenalty>
-                            try:
-                                sub_dict['dampening_max_suppress_penalty'] = \
-                                    rpm_root.find('{}rpmdampmaxpenalty'.format(namespace)).text
-                            except Exception:
-                                pass
+        # compare cli command
+        if stream.command:
+            stream.compare_command(self.cli_command[1].format(
+                vrf=vrf, address_family=address_family))
 
         return etree_dict
 
@@ -3048,65 +2872,65 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertisedRou
         # Init dictionary
         route_dict = {}
 
-        p1 = re.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
-                        r' +address +family'
-                        r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                        r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                        r' +ID +is +(?P<local_router_id>(\S+))$')
-        p3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p4 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            r' +(?P<origin_codes>(i|e|\?|\|))$')
-        p5 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p6 = re.compile(r'^(?P<metric>[0-9]+)'
-                        r'(?P<space1>\s{5,10})'
-                        r'(?P<localprf>[0-9]+)'
-                        r'(?P<space2>\s{5,10})'
-                        r'(?P<weight>[0-9]+)'
-                        r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p7 = re.compile(r'^(?P<value>[0-9]+)'
-                        r'(?P<space>\s{2,21})'
-                        r'(?P<weight>[0-9]+)'
-                        r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p8 = re.compile(r'^(?P<weight>[0-9]+)'
-                            r' +(?P<path>[0-9\{\}\s]+)$')
-        p9 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\.\s\(\)\{\}]+)'
-                            r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p10 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p11 = re.compile(r'^(?P<metric>[0-9]+)'
-                        r'(?P<space1>\s{5,10})'
-                        r'(?P<localprf>[0-9]+)'
-                        r'(?P<space2>\s{5,10})'
-                        r'(?P<weight>[0-9]+)'
-                        r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p12 = re.compile(r'^(?P<value>[0-9]+)'
-                        r'(?P<space>\s{2,21})'
-                        r'(?P<weight>[0-9]+)'
-                        r'(?: *(?P<path>[0-9\{\}\s]+))?$')
-        p13 = re.compile(r'^(?P<weight>[0-9]+)'
-                        r' +(?P<path>[0-9\.\{\}\s]+)$')
-        p14 = re.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>'
-                        r'(\S+))(?: +\((?:VRF +(?P<default_vrf>\w+)|L2VNI +'
-                        r'(?P<rd_l2vni>\d+)|L3VNI +(?P<rd_l3vni>\d+))\))?$')
+        p1 = regex_engine.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
+                                  r' +address +family'
+                                  r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
+        p2 = regex_engine.compile(r'^\s*BGP +table +version +is'
+                                  r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                  r' +ID +is +(?P<local_router_id>(\S+))$')
+        p3 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                      r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p4 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                      r' +(?P<origin_codes>(i|e|\?|\|))$')
+        p5 = regex_engine.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                      r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p6 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                  r'(?P<space1>\s{5,10})'
+                                  r'(?P<localprf>[0-9]+)'
+                                  r'(?P<space2>\s{5,10})'
+                                  r'(?P<weight>[0-9]+)'
+                                  r'(?: *(?P<path>[0-9\{\}\s]+))?$')
+        p7 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                  r'(?P<space>\s{2,21})'
+                                  r'(?P<weight>[0-9]+)'
+                                  r'(?: *(?P<path>[0-9\{\}\s]+))?$')
+        p8 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                      r' +(?P<path>[0-9\{\}\s]+)$')
+        p9 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                      r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r' +(?P<numbers>[a-zA-Z0-9\.\s\(\)\{\}]+)'
+                                      r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p10 = regex_engine.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                      r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p11 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                  r'(?P<space1>\s{5,10})'
+                                  r'(?P<localprf>[0-9]+)'
+                                  r'(?P<space2>\s{5,10})'
+                                  r'(?P<weight>[0-9]+)'
+                                  r'(?: *(?P<path>[0-9\{\}\s]+))?$')
+        p12 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                  r'(?P<space>\s{2,21})'
+                                  r'(?P<weight>[0-9]+)'
+                                  r'(?: *(?P<path>[0-9\{\}\s]+))?$')
+        p13 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                  r' +(?P<path>[0-9\.\{\}\s]+)$')
+        p14 = regex_engine.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>'
+                                  r'(\S+))(?: +\((?:VRF +(?P<default_vrf>\w+)|L2VNI +'
+                                  r'(?P<rd_l2vni>\d+)|L3VNI +(?P<rd_l3vni>\d+))\))?$')
         # Init vars
         data_on_nextline =  False
         index = 1
@@ -3505,44 +3329,44 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
         route_dict = {}
         af_dict = {}
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
-                            r' +address +family'
-                            r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                            r' +ID +is +(?P<local_router_id>(\S+))$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            r' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                                r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p = regex_engine.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
+        p1 = regex_engine.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
+                                      r' +address +family'
+                                      r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
+        p2 = regex_engine.compile(r'^\s*BGP +table +version +is'
+                                      r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                      r' +ID +is +(?P<local_router_id>(\S+))$')
+        p3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                      r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_3 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                      r' +(?P<origin_codes>(i|e|\?|\|))$')
+        p3_3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                          r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                          r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                          r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                          r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
         # *>e100.100.100.118/30 10.10.2.1                                      0 64102.444 {64201 64202} 64203 64500.2345 i
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\.\s\(\)\{\}]+)'
-                            r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                                r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                                r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *:'
-                            r' +(?P<route_distinguisher>(\S+))'
-                            r'(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            r'((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
+        p3_2 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                      r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r' +(?P<numbers>[a-zA-Z0-9\.\s\(\)\{\}]+)'
+                                      r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_2_1 = regex_engine.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                          r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                          r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                          r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                          r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p4 = regex_engine.compile(r'^\s*Route +Distinguisher *:'
+                                      r' +(?P<route_distinguisher>(\S+))'
+                                      r'(?: +\(((VRF +(?P<default_vrf>\S+))|'
+                                      r'((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
         # Init vars
         data_on_nextline = False
         index = 1
@@ -3683,25 +3507,25 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{5,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{5,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -3773,26 +3597,26 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{5,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{5,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
                 # *>e100.100.100.118/30 10.10.2.1                                      0 64102.444 {64201 64202} 64203 64500.2345 i
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\.\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\.\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -3955,44 +3779,44 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
         route_dict = {}
         af_dict = {}
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
-                            r' +address +family'
-                            r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                            r' +ID +is +(?P<local_router_id>(\S+))$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                            r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            r' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                                r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p = regex_engine.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
+        p1 = regex_engine.compile(r'^\s*Peer +(?P<neighbor_id>(\S+)) +routes +for'
+                                      r' +address +family'
+                                      r' +(?P<address_family>[a-zA-Z0-9\s\-\_]+) *:$')
+        p2 = regex_engine.compile(r'^\s*BGP +table +version +is'
+                                      r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                                      r' +ID +is +(?P<local_router_id>(\S+))$')
+        p3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                      r'(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_3 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                      r' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r'(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+                                      r' +(?P<origin_codes>(i|e|\?|\|))$')
+        p3_3_1 = regex_engine.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                          r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                          r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                          r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                          r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
         # *>e100.100.100.118/30 10.10.2.1                                      0 64102.444 {64201 64202} 64203 64500.2345 i
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            r'(?P<path_type>(i|e|c|l|a|r|I))'
-                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            r' +(?P<numbers>[a-zA-Z0-9\.\s\(\)\{\}]+)'
-                            r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                                r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                                r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *:'
-                            r' +(?P<route_distinguisher>(\S+))'
-                            r'(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            r'((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
+        p3_2 = regex_engine.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                                      r'(?P<path_type>(i|e|c|l|a|r|I))'
+                                      r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                      r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                      r' +(?P<numbers>[a-zA-Z0-9\.\s\(\)\{\}]+)'
+                                      r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_2_1 = regex_engine.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                                          r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                                          r'( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                                          r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                                          r' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        p4 = regex_engine.compile(r'^\s*Route +Distinguisher *:'
+                                      r' +(?P<route_distinguisher>(\S+))'
+                                      r'(?: +\(((VRF +(?P<default_vrf>\S+))|'
+                                      r'((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
         # Init vars
         data_on_nextline =  False
         index = 1
@@ -4132,25 +3956,25 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{5,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{5,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['received_routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
@@ -4222,25 +4046,25 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
                 
                 # Metric     LocPrf     Weight Path
                 #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 r'(?P<space1>\s{5,10})'
-                                 r'(?P<localprf>[0-9]+)'
-                                 r'(?P<space2>\s{5,10})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m1 = regex_engine.compile(r'^(?P<metric>[0-9]+)'
+                                           r'(?P<space1>\s{5,10})'
+                                           r'(?P<localprf>[0-9]+)'
+                                           r'(?P<space2>\s{5,10})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    100        ---          0 10 20 30 40 50 60 70 80 90
                 #    ---        100          0 10 20 30 40 50 60 70 80 90
                 #    100        ---      32788 ---
                 #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 r'(?P<space>\s{2,21})'
-                                 r'(?P<weight>[0-9]+)'
-                                 r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                m2 = regex_engine.compile(r'^(?P<value>[0-9]+)'
+                                           r'(?P<space>\s{2,21})'
+                                           r'(?P<weight>[0-9]+)'
+                                           r'(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
 
                 #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 r' +(?P<path>[0-9\.\{\}\s]+)$').match(numbers)
+                m3 = regex_engine.compile(r'^(?P<weight>[0-9]+)'
+                                           r' +(?P<path>[0-9\.\{\}\s]+)$').match(numbers)
 
                 if m1:
                     af_dict['received_routes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
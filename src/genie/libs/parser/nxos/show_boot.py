@@ -3,7 +3,7 @@ NXOS parsers for the following show commands:
 * 'show boot mode'
 """
 
-import re
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
@@ -40,7 +40,7 @@ class ShowBootMode(ShowBootModeSchema):
 
         # Current mode is native.
         # Current mode is lxc.
-        p1 = re.compile(r'^Current mode is (?P<mode>\w+)')
+        p1 = regex_engine.compile(r'^Current mode is (?P<mode>\w+)')
 
         for line in out.splitlines():
             line_strip = line.strip()
@@ -7,10 +7,8 @@ NXOS parsers for the following show commands:
 
 '''
 
-# Python
-import re
-
 # Metaparser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
@@ -59,56 +57,56 @@ class ShowCdpNeighbors(ShowCdpNeighborsSchema):
         # No platform
         # R5.cisco.com Gig 0/0 125 R B Gig 0/0
         # kanntp01-01         Eth1/3         168    H         FAS8020       e0c
-        p1 = re.compile(r'^(?P<device_id>\S+) +'
-                        r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+)'
-                        r'(?: +(?P<platform>[\w\-]+) )? +'
-                        r'(?P<port_id>(vmnic|Eth|Te|Gig|Fas|Lo|Po|Tu|mgmt|cont|e)[a-zA-Z0-9\/\-]+)$')
+        p1 = regex_engine.compile(r'^(?P<device_id>\S+) +'
+                                  r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+                                  r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+)'
+                                  r'(?: +(?P<platform>[\w\-]+) )? +'
+                                  r'(?P<port_id>(vmnic|Eth|Te|Gig|Fas|Lo|Po|Tu|mgmt|cont|e)[a-zA-Z0-9\/\-]+)$')
 
         # device6 Gig 0 157 R S I C887VA-W- WGi 0
         # switchB                Ethernet2/3     177     R S I    WS-C2960-24TC Ethernet1/4
         # Switch mgmt0 163 S I WS-C2960-24TC Fas0/21
         # swordfish-6k-2 Eth3/2 149 R S I WS-C6506-E Gig1/38
-        p2 = re.compile(r'^(?P<device_id>\S+) +'
-                        r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+) +'
-                        r'(?P<platform>[\S\s]+) +'
-                        r'(?P<port_id>(vmnic|Eth|Te|Gig|Fas|Lo|Po|Tu|mgmt|cont)[a-zA-Z0-9\/\-]+)$')
+        p2 = regex_engine.compile(r'^(?P<device_id>\S+) +'
+                                  r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+                                  r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+) +'
+                                  r'(?P<platform>[\S\s]+) +'
+                                  r'(?P<port_id>(vmnic|Eth|Te|Gig|Fas|Lo|Po|Tu|mgmt|cont)[a-zA-Z0-9\/\-]+)$')
 
         # p3 and p4: If Device Id is not on same line as everything else
         # vsm-p(2094532764140613037)
         # Ten-GigabitEthernet2/0/20
-        p3 = re.compile(r'^(?P<device_id>\S+)$')
+        p3 = regex_engine.compile(r'^(?P<device_id>\S+)$')
 
         #   mgmt0 141 R B T S Nexus1000V control0
-        p4 = re.compile(r'^(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+) +'
-                        r'(?P<platform>[\S\s]+) +'
-                        r'(?P<port_id>(vmnic|Eth|Te|Gig|Fas|Lo|Po|Tu|mgmt|cont)[a-zA-Z0-9\/\-]+)$')
+        p4 = regex_engine.compile(r'^(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+                                  r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+) +'
+                                  r'(?P<platform>[\S\s]+) +'
+                                  r'(?P<port_id>(vmnic|Eth|Te|Gig|Fas|Lo|Po|Tu|mgmt|cont)[a-zA-Z0-9\/\-]+)$')
 
         # p3 and p5: If Port Id is not on same line
         # 1111-2222-3333      Eth1/3         130    S         HPE 2200AF-48
         # Eth1/5         120    S         VMware ESX    vmnic1
         # Eth1/26           163    R S I s       N5K-C5596UP   Eth1/25
-        p5 = re.compile(r'^(?P<device_id>\S+) +'
-                        r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+) +'
-                        r'(?P<platform>[\S\s]+)$')        
+        p5 = regex_engine.compile(r'^(?P<device_id>\S+) +'
+                                  r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+                                  r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+) +'
+                                  r'(?P<platform>[\S\s]+)$')        
 
         # p6: For Linux neighbor all in one line
         # shkothap-lnx        Eth1/1/1       119    R S H     Linux         enp2s0
-        p6 = re.compile(r'^(?P<device_id>\S+) +'
-                        r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+) +'
-                        r'(?P<platform>[Ll]inux[\S\s]*) +'        
-                        r'(?P<port_id>[a-z0-9]+)$')
+        p6 = regex_engine.compile(r'^(?P<device_id>\S+) +'
+                                  r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+                                  r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+) +'
+                                  r'(?P<platform>[Ll]inux[\S\s]*) +'        
+                                  r'(?P<port_id>[a-z0-9]+)$')
 
         # p7: For Linux neighbor split in two lines
         #                    Eth1/1/2       119    R S H     Linux         enp2s1
-        p7 = re.compile(r'^(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+) +'
-                        r'(?P<platform>[Ll]inux[\S\s]*) +'        
-                        r'(?P<port_id>[a-z0-9]+)$')
+        p7 = regex_engine.compile(r'^(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+                                  r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIVDrs\s]+) +'
+                                  r'(?P<platform>[Ll]inux[\S\s]*) +'        
+                                  r'(?P<port_id>[a-z0-9]+)$')
 
         device_id_index = 0
 
@@ -250,66 +248,66 @@ class ShowCdpNeighborsDetail(ShowCdpNeighborsDetailSchema):
             out = output
 
         # Device ID: R7(9QBDKB58F76)
-        deviceid_re = re.compile(r'Device\s+ID:\s*(?P<device_id>\S+)')
+        deviceid_re = regex_engine.compile(r'Device\s+ID:\s*(?P<device_id>\S+)')
 
         #System Name:swor96
-        system_name_re = re.compile(r''
+        system_name_re = regex_engine.compile(r''
             r'System\s*Name\s*:\s*(?P<system_name>\S+)')
 
         # Platform: N9K-9000v,  Capabilities: Router Switch CVTA phone port
         # Platform: ISR4451-X/K9, Capabilities: Router Switch IGMP Filtering
-        platf_cap_re = re.compile(r'Platform:\s*(?P<platform>[\S\s]+),\s*Capabilities:\s*(?P<capabilities>[\S\s]+)')
+        platf_cap_re = regex_engine.compile(r'Platform:\s*(?P<platform>[\S\s]+),\s*Capabilities:\s*(?P<capabilities>[\S\s]+)')
 
         # Interface: GigabitEthernet0/0,  Port ID (outgoing port): mgmt0
         # Interface: Ethernet1/1, Port ID (outgoing port): Ethernet1/2
-        interface_port_re = re.compile(r'Interface:\s*'
-                                        r'(?P<interface>[\w\s\-\/\/]+)\s*\,'
-                                        r'*\s*Port\s*ID\s*[\(\w\)\s]+:\s*'
-                                        r'(?P<port_id>\S+)')
+        interface_port_re = regex_engine.compile(r'Interface:\s*'
+                                                  r'(?P<interface>[\w\s\-\/\/]+)\s*\,'
+                                                  r'*\s*Port\s*ID\s*[\(\w\)\s]+:\s*'
+                                                  r'(?P<port_id>\S+)')
 
         # Native VLAN: 42
-        native_vlan_re = re.compile(r'Native\s*VLAN\s*:\s*'
-                                    r'(?P<native_vlan>\d+)')
+        native_vlan_re = regex_engine.compile(r'Native\s*VLAN\s*:\s*'
+                                              r'(?P<native_vlan>\d+)')
 
         # VTP Management Domain: 'Accounting Group'
-        vtp_management_domain_re = re.compile(r''
+        vtp_management_domain_re = regex_engine.compile(r''
             r'VTP\s*Management\s*Domain\s*:\s*\W*'
             r'(?P<vtp_management_domain>([a-zA-Z\s]+))\W*')
 
         # Holdtime : 126 sec
-        hold_time_re = re.compile(r'Holdtime\s*:\s*\s*(?P<hold_time>\d+)')
+        hold_time_re = regex_engine.compile(r'Holdtime\s*:\s*\s*(?P<hold_time>\d+)')
 
         # advertisement version: 2
-        advertver_re = re.compile(r'Advertisement\s*Version:\s*'
-                                    r'(?P<advertisement_ver>\d+)')
+        advertver_re = regex_engine.compile(r'Advertisement\s*Version:\s*'
+                                              r'(?P<advertisement_ver>\d+)')
 
         # Cisco IOS Software, IOSv Software (VIOS-ADVENTERPRISEK9-M), Version 15.7(3)M3, RELEASE SOFTWARE (fc2)
-        software_version_re = re.compile(r'(?P<software_version>[\s\S]+)')
+        software_version_re = regex_engine.compile(r'(?P<software_version>[\s\S]+)')
 
         # Physical Location: snmplocation
-        physical_location_re = re.compile(r''
+        physical_location_re = regex_engine.compile(r''
             r'Physical\s*Location\s*:\s*(?P<physical_location>\S*)')
 
         # Duplex: full
         # Duplex Mode: half
-        duplex_re = re.compile(r'Duplex\s*(Mode)*:\s*(?P<duplex_mode>\w+)')
+        duplex_re = regex_engine.compile(r'Duplex\s*(Mode)*:\s*(?P<duplex_mode>\w+)')
 
         # Regexes for Flags:
         # Version:
-        software_version_flag_re = re.compile(r'Version\s*:\s*')
+        software_version_flag_re = regex_engine.compile(r'Version\s*:\s*')
         # Mgmt address(es):
-        mngaddress_re = re.compile(r'Mgmt\s*address\s*\([\w]+\)\s*\:\s*')
+        mngaddress_re = regex_engine.compile(r'Mgmt\s*address\s*\([\w]+\)\s*\:\s*')
         # Interface address(es):
-        interface_address_re = re.compile(r''
+        interface_address_re = regex_engine.compile(r''
                     r'Interface\s*address\s*\(\w+\)\s*\:\s*')        
 
         # IPv6 address: FE80::203:E3FF:FE6A:BF81  (link-local)
         # IPv6 address: 2001:DB8:1000:8A10::C0A8:BC06  (global unicast)
-        ipv6_address_re = re.compile(r'IPv6\s*Address\s*:\s*(?P<ip_address>\S+)'
-                                    r'\s*\((?P<type>[\s\w\-]+)\)')
+        ipv6_address_re = regex_engine.compile(r'IPv6\s*Address\s*:\s*(?P<ip_address>\S+)'
+                                              r'\s*\((?P<type>[\s\w\-]+)\)')
         # IPv4 address: 172.16.1.204
-        ipv4_address_re = re.compile(r'\S*IPv4\s*'
-                            r'Address:\s*(?P<ip_address>\S*)')
+        ipv4_address_re = regex_engine.compile(r'\S*IPv4\s*'
+                                      r'Address:\s*(?P<ip_address>\S*)')
 
         # 0 or 1 flags
         interface_address_flag = 0
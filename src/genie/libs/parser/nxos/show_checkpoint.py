@@ -4,14 +4,14 @@ NXOS parsers for the following show commands:
     * 'show checkpoint summary'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =====================================
 # Parser for 'show checkpoint summary'
@@ -46,7 +46,7 @@ class ShowCheckpointSummary(ShowCheckpointSummarySchema):
         for line in out.splitlines():
             line = line.strip()
             # 1) checkpoint1:
-            p1 = re.compile(r'^\d+\) +(?P<id>[\s\w\.\-]+):$')
+            p1 = regex_engine.compile(r'^\d+\) +(?P<id>[\s\w\.\-]+):$')
             m = p1.match(line)
             if m:
                 if 'checkpoint' not in ck_dict:
@@ -58,14 +58,14 @@ class ShowCheckpointSummary(ShowCheckpointSummarySchema):
                 continue
 
             # Created by admin
-            p2 = re.compile(r'^Created +by +(?P<user>[\s\w\.\-\:]+)$')
+            p2 = regex_engine.compile(r'^Created +by +(?P<user>[\s\w\.\-\:]+)$')
             m = p2.match(line)
             if m:
                 ck_dict['checkpoint'][id]['created_by'] = m.groupdict()['user']
                 continue
 
             # Created at Tue, 22:13:49 20 Nov 2017
-            p3 = re.compile(r'^Created +at +(?P<time>[\s\w\.\-\:\,]+)$')
+            p3 = regex_engine.compile(r'^Created +at +(?P<time>[\s\w\.\-\:\,]+)$')
             m = p3.match(line)
             if m:
                 ck_dict['checkpoint'][id]['created_time'] = \
@@ -73,7 +73,7 @@ class ShowCheckpointSummary(ShowCheckpointSummarySchema):
                 continue
 
             # Size is 25,671 bytes
-            p4 = re.compile(r'^Size +is +(?P<size>[,\d]+) +bytes$')
+            p4 = regex_engine.compile(r'^Size +is +(?P<size>[,\d]+) +bytes$')
             m = p4.match(line)
             if m:
                 ck_dict['checkpoint'][id]['size'] = \
@@ -81,7 +81,7 @@ class ShowCheckpointSummary(ShowCheckpointSummarySchema):
                 continue
 
             # Description: Created by Feature Manager.
-            p5 = re.compile(r'^Description: +(?P<desc>[\s\w\.\-\:]+)$')
+            p5 = regex_engine.compile(r'^Description: +(?P<desc>[\s\w\.\-\:]+)$')
             m = p5.match(line)
             if m:
                 ck_dict['checkpoint'][id]['description'] = \
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 #   ============================================    #
 #                    Statistics                     #
 #   ============================================    #
@@ -54,17 +56,17 @@ class ShowDot1xAllStatistics(ShowDot1xAllStatisticsSchema):
 
         ret_dict = {}
 
-        p1 = re.compile(r'((^[Dd]ot1x)\s+)?' +
-                        r'(([Aa]uthenticator)\s+)?' +
-                        r'(([Pp])ort\s+)?(([Ss]tatistics)\s+)?' +
-                        r'((for)\s+)?(?P<interface>(\w*)\d+(\/)(\d+))$\s*')
+        p1 = regex_engine.compile(r'((^[Dd]ot1x)\s+)?' +
+                                  r'(([Aa]uthenticator)\s+)?' +
+                                  r'(([Pp])ort\s+)?(([Ss]tatistics)\s+)?' +
+                                  r'((for)\s+)?(?P<interface>(\w*)\d+(\/)(\d+))$\s*')
 
 
 
-        p2 = re.compile(r'(\w+) *\= *(\d+)+ *')
+        p2 = regex_engine.compile(r'(\w+) *\= *(\d+)+ *')
 
-        p3 = re.compile(r'^([Rr]x[Vv]ersion) \= *(?P<rxversion>\d+)' +
-                        r'   ([Ll]ast[Rr]x[Ss]rc[Mm][Aa][Cc]) = (?P<lastrxsrcmac>\w+:\w+:\w+:\w+:\w+:\w+)$')
+        p3 = regex_engine.compile(r'^([Rr]x[Vv]ersion) \= *(?P<rxversion>\d+)' +
+                                  r'   ([Ll]ast[Rr]x[Ss]rc[Mm][Aa][Cc]) = (?P<lastrxsrcmac>\w+:\w+:\w+:\w+:\w+:\w+)$')
 
 
 
@@ -140,8 +142,8 @@ class ShowDot1xAllSummary(ShowDot1xAllSummarySchema):
         
         ret_dict = {}
 
-        p1 = re.compile(r'^(?P<intf>((\w+\d+)(\/\d+)*)) + +(?P<pae>\w+) + +' +
-                        r'(?P<client>(\w+\:\w+\:\w+\:\w+\:\w+\:\w+)|\w+) + +(?P<status>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<intf>((\w+\d+)(\/\d+)*)) + +(?P<pae>\w+) + +' +
+                                  r'(?P<client>(\w+\:\w+\:\w+\:\w+\:\w+\:\w+)|\w+) + +(?P<status>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -250,13 +252,13 @@ class ShowDot1xAllDetails(ShowDot1xAllDetailsSchema):
         ret_dict = {}
         eap_method = ''
         # Sysauthcontrol Enabled
-        p1 = re.compile(r'^Sysauthcontrol +(?P<SysControl>\w+)$')
+        p1 = regex_engine.compile(r'^Sysauthcontrol +(?P<SysControl>\w+)$')
         
         # Dot1x Protocol Version 2
-        p2 = re.compile(r'^Dot1x +Protocol +Version +(?P<version>\d+)$')
+        p2 = regex_engine.compile(r'^Dot1x +Protocol +Version +(?P<version>\d+)$')
         
         # Dot1x Info for Ethernet1/2
-        p3 = re.compile(r'^Dot1x +Info +for +(?P<intf>\w+\d+\/\d+)$')
+        p3 = regex_engine.compile(r'^Dot1x +Info +for +(?P<intf>\w+\d+\/\d+)$')
         
         # EAP Method                = (13)
         # PAE = AUTHENTICATOR
@@ -280,7 +282,7 @@ class ShowDot1xAllDetails(ShowDot1xAllDetailsSchema):
         # Authenticated By = Remote Server
         # Auth SM State = AUTHENTICATED
         # Auth BEND SM State = IDLE
-        p4 = re.compile(r'^(?P<key>[\-\s\w]+) +\= +(?P<value>(((\w)|(\())+((:\w+)|(\s\w+)|(.\w+))*)+(\))?)$')
+        p4 = regex_engine.compile(r'^(?P<key>[\-\s\w]+) +\= +(?P<value>(((\w)|(\())+((:\w+)|(\s\w+)|(.\w+))*)+(\))?)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -4,14 +4,12 @@ NXOS parsers for the following show commands:
     * show environment
 '''
 
-# python
-import re
-
 # metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
                                          
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -98,64 +96,64 @@ class ShowEnvironment(ShowEnvironmentSchema):
         
         #Match fan details
         #Fan1(sys_fan1)  N9K-C9508-FAN        0.6020 front-to-back   Ok
-        p1 = re.compile(r'^\s*(?P<sys_fan>Fan\d+\(sys_fan\d+\))?\s+(?P<model>[A-Za-z0-9\-]+)? +(?P<hw>[0-9.-]+)+ +(?P<dir>[a-z-]+)? +(?P<status>\w+)?\s*')
+        p1 = regex_engine.compile(r'^\s*(?P<sys_fan>Fan\d+\(sys_fan\d+\))?\s+(?P<model>[A-Za-z0-9\-]+)? +(?P<hw>[0-9.-]+)+ +(?P<dir>[a-z-]+)? +(?P<status>\w+)?\s*')
         
         #Fan_in_PS1                           --     front-to-back   Ok
-        p2 = re.compile(r'^\s*(?P<ps_fan>Fan_in_PS\d+)?\s+(?P<model>[A-Za-z0-9\-]+)?\s+(?P<hw>[0-9.-]+)+ +(?P<dir>[a-z-]+)? +(?P<status>\w+)?\s*')
+        p2 = regex_engine.compile(r'^\s*(?P<ps_fan>Fan_in_PS\d+)?\s+(?P<model>[A-Za-z0-9\-]+)?\s+(?P<hw>[0-9.-]+)+ +(?P<dir>[a-z-]+)? +(?P<status>\w+)?\s*')
 
         #Fan Zone Speed: Zone 1: 0x41
-        p3 = re.compile(r'^\s*Fan Zone Speed: ([Zone0-9x: ]+)')
+        p3 = regex_engine.compile(r'^\s*Fan Zone Speed: ([Zone0-9x: ]+)')
 
         #Fan Air Filter : NotSupported
-        p4 = re.compile(r'^\s*Fan Air Filter : (\w+)')
+        p4 = regex_engine.compile(r'^\s*Fan Air Filter : (\w+)')
 
         #Match Power and power supply details
         #Voltage: 12 Volts
-        p5 = re.compile(r'^\s*Voltage: +(?P<voltage>[0-9]+)\s+Volts')
+        p5 = regex_engine.compile(r'^\s*Voltage: +(?P<voltage>[0-9]+)\s+Volts')
 
         #1        N9K-PAC-3000W-B      1087 W             1150 W      3000 W      Ok
         #2        NXK-HV-6.3KW20A-A     341 W              390 W      3150 W      Ok
-        p6 = re.compile(r'^\s*(?P<ps_id>\d+)\s+(?P<model>[A-Z0-9-.]+)\s*(?P<act_out>\d+)\s?W\s*(?P<act_in>\d+)\s?W\s*(?P<tot_cap>\d+)\s?W\s+(?P<status>\w+)\s*')
+        p6 = regex_engine.compile(r'^\s*(?P<ps_id>\d+)\s+(?P<model>[A-Z0-9-.]+)\s*(?P<act_out>\d+)\s?W\s*(?P<act_in>\d+)\s?W\s*(?P<tot_cap>\d+)\s?W\s+(?P<status>\w+)\s*')
 
         #1        N9K-X9736Q-FX           401.00 W     936.00 W    Powered-Up
         #Xb22     N9K-C9508-FM-E          175.00 W     564.00 W    Powered-Up
         #fan1     N9K-C9508-FAN            81.00 W     249.00 W    Powered-Up
-        p7 = re.compile(r'^\s*(?P<module>[fanXb0-9]+)\s+(?P<model>[A-Za-z0-9-]+)\s*(?P<act_draw>[0-9.]+)\s+W\s+(?P<powr_alloc>[0-9.]+)\s+W\s+(?P<status>[a-zA-Z-]+)\s*')
+        p7 = regex_engine.compile(r'^\s*(?P<module>[fanXb0-9]+)\s+(?P<model>[A-Za-z0-9-]+)\s*(?P<act_draw>[0-9.]+)\s+W\s+(?P<powr_alloc>[0-9.]+)\s+W\s+(?P<status>[a-zA-Z-]+)\s*')
         
         #Power Supply redundancy mode (configured)                Non-Redundant(combined)
-        p8 = re.compile(r'^\s*Power Supply redundancy mode \(configured\)\s+(?P<conf_mode>[-\w\(\)]+)')
+        p8 = regex_engine.compile(r'^\s*Power Supply redundancy mode \(configured\)\s+(?P<conf_mode>[-\w\(\)]+)')
 
         #Power Supply redundancy mode (operational)               Non-Redundant(combined)
-        p9 = re.compile(r'^\s*Power Supply redundancy mode \(operational\)\s+(?P<oper_mode>[-\w\(\)]+)')
+        p9 = regex_engine.compile(r'^\s*Power Supply redundancy mode \(operational\)\s+(?P<oper_mode>[-\w\(\)]+)')
 
         #Total Power Capacity (based on configured mode)            18000.00 W
-        p10 = re.compile(r'^\s*Total Power Capacity \(based on configured mode\)\s*([0-9.]+)\sW\s*')
+        p10 = regex_engine.compile(r'^\s*Total Power Capacity \(based on configured mode\)\s*([0-9.]+)\sW\s*')
         
         #Total Grid-A (first half of PS slots) Power Capacity       12000.00 W
-        p11 = re.compile(r'^\s*Total Grid-A \(first half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
+        p11 = regex_engine.compile(r'^\s*Total Grid-A \(first half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
 
         #Total Grid-B (second half of PS slots) Power Capacity      6000.00 W
-        p12 = re.compile(r'^\s*Total Grid-B \(second half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
+        p12 = regex_engine.compile(r'^\s*Total Grid-B \(second half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
 
         #Total Power of all Inputs (cumulative)                     18000.00 W
-        p13 = re.compile(r'^\s*Total Power of all Inputs \(cumulative\)\s*([0-9.]+)\sW\s*')
+        p13 = regex_engine.compile(r'^\s*Total Power of all Inputs \(cumulative\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Output (actual draw)                           5655.00 W
-        p14 = re.compile(r'^\s*Total Power Output \(actual draw\)\s*([0-9.]+)\sW\s*')
+        p14 = regex_engine.compile(r'^\s*Total Power Output \(actual draw\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Input (actual draw)                            6038.00 W
-        p15 = re.compile(r'^\s*Total Power Input \(actual draw\)\s*([0-9.]+)\sW\s*')
+        p15 = regex_engine.compile(r'^\s*Total Power Input \(actual draw\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Allocated (budget)                             10759.00 W
-        p16 = re.compile(r'^\s*Total Power Allocated \(budget\)\s*([0-9.]+)\sW\s*')
+        p16 = regex_engine.compile(r'^\s*Total Power Allocated \(budget\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Available for additional modules               7241.00 W
-        p17 = re.compile(r'^\s*Total Power Available for additional modules\s*([0-9.]+)\sW\s*')
+        p17 = regex_engine.compile(r'^\s*Total Power Available for additional modules\s*([0-9.]+)\sW\s*')
 
         #Match Temperatures
         #1        CPU             85              75          53         Ok
         #3        SUG0            105             95          59         Ok
-        p18 = re.compile(r'^\s*(?P<mod>\d+)\s+(?P<sensor>\w+)\s+(?P<major_thresh>\d+)\s+(?P<minor_thresh>\d+)\s+(?P<curr_temp>\d+)\s+(?P<status>\w+)\s*')
+        p18 = regex_engine.compile(r'^\s*(?P<mod>\d+)\s+(?P<sensor>\w+)\s+(?P<major_thresh>\d+)\s+(?P<minor_thresh>\d+)\s+(?P<curr_temp>\d+)\s+(?P<status>\w+)\s*')
 
 
         parsed_env_dict = {}
@@ -352,16 +350,16 @@ class ShowEnvironmentFan(ShowEnvironmentFanSchema):
         
         #Match fan details
         #Fan1(sys_fan1)  N9K-C9508-FAN        0.6020 front-to-back   Ok
-        p1 = re.compile(r'^\s*(?P<sys_fan>Fan\d+\(sys_fan\d+\))?\s+(?P<model>[A-Za-z0-9\-]+)? +(?P<hw>[0-9.-]+)+ +(?P<dir>[a-z-]+)? +(?P<status>\w+)?\s*')
+        p1 = regex_engine.compile(r'^\s*(?P<sys_fan>Fan\d+\(sys_fan\d+\))?\s+(?P<model>[A-Za-z0-9\-]+)? +(?P<hw>[0-9.-]+)+ +(?P<dir>[a-z-]+)? +(?P<status>\w+)?\s*')
         
         #Fan_in_PS1                           --     front-to-back   Ok
-        p2 = re.compile(r'^\s*(?P<ps_fan>Fan_in_PS\d+)?\s+(?P<model>[A-Za-z0-9\-]+)?\s+(?P<hw>[0-9.-]+)+ +(?P<dir>[a-z-]+)? +(?P<status>\w+)?\s*')
+        p2 = regex_engine.compile(r'^\s*(?P<ps_fan>Fan_in_PS\d+)?\s+(?P<model>[A-Za-z0-9\-]+)?\s+(?P<hw>[0-9.-]+)+ +(?P<dir>[a-z-]+)? +(?P<status>\w+)?\s*')
 
         #Fan Zone Speed: Zone 1: 0x41
-        p3 = re.compile(r'^\s*Fan Zone Speed: ([Zone0-9x: ]+)')
+        p3 = regex_engine.compile(r'^\s*Fan Zone Speed: ([Zone0-9x: ]+)')
 
         #Fan Air Filter : NotSupported
-        p4 = re.compile(r'^\s*Fan Air Filter : (\w+)')
+        p4 = regex_engine.compile(r'^\s*Fan Air Filter : (\w+)')
 
         parsed_env_fan_dict = {}
         parsed_env_fan_dict.setdefault('fans', {})
@@ -454,25 +452,25 @@ class ShowEnvironmentFanDetail(ShowEnvironmentFanDetailSchema):
         
         #Match fan details
         #Fan1(sys_fan1)  N9K-C9508-FAN        0.6020 front-to-back   Ok
-        p1 = re.compile(r'^\s*(?P<sys_fan>Fan\d+\(sys_fan\d+\))?\s+(?P<model>[A-Za-z0-9\-]+)? +(?P<hw>[0-9.-]+)+ +(?P<dir>[a-z-]+)? +(?P<status>\w+)?\s*')
+        p1 = regex_engine.compile(r'^\s*(?P<sys_fan>Fan\d+\(sys_fan\d+\))?\s+(?P<model>[A-Za-z0-9\-]+)? +(?P<hw>[0-9.-]+)+ +(?P<dir>[a-z-]+)? +(?P<status>\w+)?\s*')
         
         #Fan_in_PS1                           --     front-to-back   Ok
-        p2 = re.compile(r'^\s*(?P<ps_fan>Fan_in_PS\d+)\s+(?P<model>[A-Za-z0-9\-]+)?\s+(?P<hw>[0-9.-]+) +(?P<dir>[a-z-]+) +(?P<status>\w+)\s*')
+        p2 = regex_engine.compile(r'^\s*(?P<ps_fan>Fan_in_PS\d+)\s+(?P<model>[A-Za-z0-9\-]+)?\s+(?P<hw>[0-9.-]+) +(?P<dir>[a-z-]+) +(?P<status>\w+)\s*')
 
         #Fan Zone Speed: Zone 1: 0x41
-        p3 = re.compile(r'^\s*Fan Zone Speed: ([Zone0-9x: ]+)')
+        p3 = regex_engine.compile(r'^\s*Fan Zone Speed: ([Zone0-9x: ]+)')
 
         #Fan Air Filter : NotSupported
-        p4 = re.compile(r'^\s*Fan Air Filter : (\w+)')
+        p4 = regex_engine.compile(r'^\s*Fan Air Filter : (\w+)')
 
         #Fan1(sys_fan1)      fan6    front-to-back    84        3272
         # Fan2(sys_fan2)      fan1    front-to-back    51        3280
         # Fan2(sys_fan2)      fan2    front-to-back    61        2362
-        p5 = re.compile(r'^\s*(?P<fan>Fan\d+\(sys_fan\d+\))?\s+(?P<fan_num>fan\d+)?\s+(?P<dir>[a-z-]+)?\s+(?P<speed_per>\d+)?\s+(?P<speed_rpm>\d+)?\s*')
+        p5 = regex_engine.compile(r'^\s*(?P<fan>Fan\d+\(sys_fan\d+\))?\s+(?P<fan_num>fan\d+)?\s+(?P<dir>[a-z-]+)?\s+(?P<speed_per>\d+)?\s+(?P<speed_rpm>\d+)?\s*')
 
         # Fan_in_PS1            7978                8537
         # Fan_in_PS2            8021                8473
-        p6 = re.compile(r'^\s*(?P<ps_fan>Fan_in_PS\d+)\s+(?P<fan1_speed>\d+)\s+(?P<fan2_speed>\d+)\s*')
+        p6 = regex_engine.compile(r'^\s*(?P<ps_fan>Fan_in_PS\d+)\s+(?P<fan1_speed>\d+)\s+(?P<fan2_speed>\d+)\s*')
 
         parsed_env_fan_dict = {}
         parsed_env_fan_dict.setdefault('fans', {})
@@ -597,45 +595,45 @@ class ShowEnvironmentPower(ShowEnvironmentPowerSchema):
         
         #Match Power and power supply details
         #Voltage: 12 Volts
-        p1 = re.compile(r'^\s*Voltage: +(?P<voltage>[0-9]+)\s+Volts')
+        p1 = regex_engine.compile(r'^\s*Voltage: +(?P<voltage>[0-9]+)\s+Volts')
 
         #1        N9K-PAC-3000W-B      1087 W             1150 W      3000 W      Ok
-        p2 = re.compile(r'^\s*(?P<ps_id>\d+)\s+(?P<model>[A-Z0-9-]+)\s*(?P<act_out>\d+)\s?W\s*(?P<act_in>\d+)\s?W\s*(?P<tot_cap>\d+)\s?W\s+(?P<status>\w+)\s*')
+        p2 = regex_engine.compile(r'^\s*(?P<ps_id>\d+)\s+(?P<model>[A-Z0-9-]+)\s*(?P<act_out>\d+)\s?W\s*(?P<act_in>\d+)\s?W\s*(?P<tot_cap>\d+)\s?W\s+(?P<status>\w+)\s*')
 
         #1        N9K-X9736Q-FX           401.00 W     936.00 W    Powered-Up
         #Xb22     N9K-C9508-FM-E          175.00 W     564.00 W    Powered-Up
         #fan1     N9K-C9508-FAN            81.00 W     249.00 W    Powered-Up
-        p3 = re.compile(r'^\s*(?P<module>[fanXb0-9]+)\s+(?P<model>[A-Za-z0-9-]+)\s*(?P<act_draw>[0-9.]+)\s+W\s+(?P<powr_alloc>[0-9.]+)\s+W\s+(?P<status>[a-zA-Z-]+)\s*')
+        p3 = regex_engine.compile(r'^\s*(?P<module>[fanXb0-9]+)\s+(?P<model>[A-Za-z0-9-]+)\s*(?P<act_draw>[0-9.]+)\s+W\s+(?P<powr_alloc>[0-9.]+)\s+W\s+(?P<status>[a-zA-Z-]+)\s*')
         
         #Power Supply redundancy mode (configured)                Non-Redundant(combined)
-        p4 = re.compile(r'^\s*Power Supply redundancy mode \(configured\)\s+(?P<conf_mode>[-\w\(\)]+)')
+        p4 = regex_engine.compile(r'^\s*Power Supply redundancy mode \(configured\)\s+(?P<conf_mode>[-\w\(\)]+)')
 
         #Power Supply redundancy mode (operational)               Non-Redundant(combined)
-        p5 = re.compile(r'^\s*Power Supply redundancy mode \(operational\)\s+(?P<oper_mode>[-\w\(\)]+)')
+        p5 = regex_engine.compile(r'^\s*Power Supply redundancy mode \(operational\)\s+(?P<oper_mode>[-\w\(\)]+)')
 
         #Total Power Capacity (based on configured mode)            18000.00 W
-        p6 = re.compile(r'^\s*Total Power Capacity \(based on configured mode\)\s*([0-9.]+)\sW\s*')
+        p6 = regex_engine.compile(r'^\s*Total Power Capacity \(based on configured mode\)\s*([0-9.]+)\sW\s*')
         
         #Total Grid-A (first half of PS slots) Power Capacity       12000.00 W
-        p7 = re.compile(r'^\s*Total Grid-A \(first half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
+        p7 = regex_engine.compile(r'^\s*Total Grid-A \(first half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
 
         #Total Grid-B (second half of PS slots) Power Capacity      6000.00 W
-        p8 = re.compile(r'^\s*Total Grid-B \(second half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
+        p8 = regex_engine.compile(r'^\s*Total Grid-B \(second half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
 
         #Total Power of all Inputs (cumulative)                     18000.00 W
-        p9 = re.compile(r'^\s*Total Power of all Inputs \(cumulative\)\s*([0-9.]+)\sW\s*')
+        p9 = regex_engine.compile(r'^\s*Total Power of all Inputs \(cumulative\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Output (actual draw)                           5655.00 W
-        p10 = re.compile(r'^\s*Total Power Output \(actual draw\)\s*([0-9.]+)\sW\s*')
+        p10 = regex_engine.compile(r'^\s*Total Power Output \(actual draw\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Input (actual draw)                            6038.00 W
-        p11 = re.compile(r'^\s*Total Power Input \(actual draw\)\s*([0-9.]+)\sW\s*')
+        p11 = regex_engine.compile(r'^\s*Total Power Input \(actual draw\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Allocated (budget)                             10759.00 W
-        p12 = re.compile(r'^\s*Total Power Allocated \(budget\)\s*([0-9.]+)\sW\s*')
+        p12 = regex_engine.compile(r'^\s*Total Power Allocated \(budget\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Available for additional modules               7241.00 W
-        p13 = re.compile(r'^\s*Total Power Available for additional modules\s*([0-9.]+)\sW\s*')
+        p13 = regex_engine.compile(r'^\s*Total Power Available for additional modules\s*([0-9.]+)\sW\s*')
 
         parsed_env_power_dict = {}
         parsed_env_power_dict.setdefault('power', {}).setdefault('power_supply', {})
@@ -830,84 +828,84 @@ class ShowEnvironmentPowerDetail(ShowEnvironmentPowerDetailSchema):
         
         #Match Power and power supply details
         #Voltage: 12 Volts
-        p1 = re.compile(r'^\s*Voltage: +(?P<voltage>[0-9]+)\s+Volts')
+        p1 = regex_engine.compile(r'^\s*Voltage: +(?P<voltage>[0-9]+)\s+Volts')
 
         #1        N9K-PAC-3000W-B      1087 W             1150 W      3000 W      Ok
-        p2 = re.compile(r'^\s*(?P<ps_id>\d+)\s+(?P<model>[A-Z0-9-]+)\s*(?P<act_out>\d+)\s?W\s*(?P<act_in>\d+)\s?W\s*(?P<tot_cap>\d+)\s?W\s+(?P<status>\w+)\s*')
+        p2 = regex_engine.compile(r'^\s*(?P<ps_id>\d+)\s+(?P<model>[A-Z0-9-]+)\s*(?P<act_out>\d+)\s?W\s*(?P<act_in>\d+)\s?W\s*(?P<tot_cap>\d+)\s?W\s+(?P<status>\w+)\s*')
 
         #1        N9K-X9736Q-FX           401.00 W     936.00 W    Powered-Up
         #Xb22     N9K-C9508-FM-E          175.00 W     564.00 W    Powered-Up
         #fan1     N9K-C9508-FAN            81.00 W     249.00 W    Powered-Up
-        p3 = re.compile(r'^\s*(?P<module>[fanXb0-9]+)\s+(?P<model>[A-Za-z0-9-]+)\s*(?P<act_draw>[0-9.]+)\s+W\s+(?P<powr_alloc>[0-9.]+)\s+W\s+(?P<status>[a-zA-Z-]+)\s*')
+        p3 = regex_engine.compile(r'^\s*(?P<module>[fanXb0-9]+)\s+(?P<model>[A-Za-z0-9-]+)\s*(?P<act_draw>[0-9.]+)\s+W\s+(?P<powr_alloc>[0-9.]+)\s+W\s+(?P<status>[a-zA-Z-]+)\s*')
         
         #Power Supply redundancy mode (configured)                Non-Redundant(combined)
-        p4 = re.compile(r'^\s*Power Supply redundancy mode \(configured\)\s+(?P<conf_mode>[-\w\(\)]+)')
+        p4 = regex_engine.compile(r'^\s*Power Supply redundancy mode \(configured\)\s+(?P<conf_mode>[-\w\(\)]+)')
 
         #Power Supply redundancy mode (operational)               Non-Redundant(combined)
-        p5 = re.compile(r'^\s*Power Supply redundancy mode \(operational\)\s+(?P<oper_mode>[-\w\(\)]+)')
+        p5 = regex_engine.compile(r'^\s*Power Supply redundancy mode \(operational\)\s+(?P<oper_mode>[-\w\(\)]+)')
 
         #Total Power Capacity (based on configured mode)            18000.00 W
-        p6 = re.compile(r'^\s*Total Power Capacity \(based on configured mode\)\s*([0-9.]+)\sW\s*')
+        p6 = regex_engine.compile(r'^\s*Total Power Capacity \(based on configured mode\)\s*([0-9.]+)\sW\s*')
         
         #Total Grid-A (first half of PS slots) Power Capacity       12000.00 W
-        p7 = re.compile(r'^\s*Total Grid-A \(first half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
+        p7 = regex_engine.compile(r'^\s*Total Grid-A \(first half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
 
         #Total Grid-B (second half of PS slots) Power Capacity      6000.00 W
-        p8 = re.compile(r'^\s*Total Grid-B \(second half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
+        p8 = regex_engine.compile(r'^\s*Total Grid-B \(second half of PS slots\) Power Capacity\s*([0-9.]+)\sW\s*')
 
         #Total Power of all Inputs (cumulative)                     18000.00 W
-        p9 = re.compile(r'^\s*Total Power of all Inputs \(cumulative\)\s*([0-9.]+)\sW\s*')
+        p9 = regex_engine.compile(r'^\s*Total Power of all Inputs \(cumulative\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Output (actual draw)                           5655.00 W
-        p10 = re.compile(r'^\s*Total Power Output \(actual draw\)\s*([0-9.]+)\sW\s*')
+        p10 = regex_engine.compile(r'^\s*Total Power Output \(actual draw\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Input (actual draw)                            6038.00 W
-        p11 = re.compile(r'^\s*Total Power Input \(actual draw\)\s*([0-9.]+)\sW\s*')
+        p11 = regex_engine.compile(r'^\s*Total Power Input \(actual draw\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Allocated (budget)                             10759.00 W
-        p12 = re.compile(r'^\s*Total Power Allocated \(budget\)\s*([0-9.]+)\sW\s*')
+        p12 = regex_engine.compile(r'^\s*Total Power Allocated \(budget\)\s*([0-9.]+)\sW\s*')
 
         #Total Power Available for additional modules               7241.00 W
-        p13 = re.compile(r'^\s*Total Power Available for additional modules\s*([0-9.]+)\sW\s*')
+        p13 = regex_engine.compile(r'^\s*Total Power Available for additional modules\s*([0-9.]+)\sW\s*')
 
 
         # Power reserved for Supervisor(s):                              180 W
-        p14 = re.compile(r'^\s*Power reserved for Supervisor\(s\):\s+(?P<pow_res_sup>[0-9NA/]+)\s?W?') 
+        p14 = regex_engine.compile(r'^\s*Power reserved for Supervisor\(s\):\s+(?P<pow_res_sup>[0-9NA/]+)\s?W?') 
 
         # Power reserved for Fabric, SC Module(s):                      2870 W
-        p15 = re.compile(r'^\s*Power reserved for Fabric, SC Module\(s\):\s+(?P<pow_res_sc>[0-9NA/]+)\s?W?')
+        p15 = regex_engine.compile(r'^\s*Power reserved for Fabric, SC Module\(s\):\s+(?P<pow_res_sc>[0-9NA/]+)\s?W?')
 
         # Power reserved for Fan Module(s):                              740 W
-        p16 = re.compile(r'^\s*Power reserved for Fan Module\(s\):\s+(?P<pow_res_fan>[0-9NA/]+)\s?W?')
+        p16 = regex_engine.compile(r'^\s*Power reserved for Fan Module\(s\):\s+(?P<pow_res_fan>[0-9NA/]+)\s?W?')
 
         # Total power reserved for Sups,SCs,Fabrics,Fans:               3799 W
-        p17 = re.compile(r'^\s*Total power reserved for Sups,SCs,Fabrics,Fans:\s+(?P<pow_res_total>[0-9NA/]+)\s?W?')
+        p17 = regex_engine.compile(r'^\s*Total power reserved for Sups,SCs,Fabrics,Fans:\s+(?P<pow_res_total>[0-9NA/]+)\s?W?')
 
         # Are all inlet cords connected: No
-        p18 = re.compile(r'^\s*Are all inlet cords connected:\s+(?P<inlet_cord_connected>\w+)')
+        p18 = regex_engine.compile(r'^\s*Are all inlet cords connected:\s+(?P<inlet_cord_connected>\w+)')
 
         # PS_5 total capacity:       0 W   Voltage:12V
         # PS_7 total capacity:    3000 W   Voltage:12V
-        p19 = re.compile(r'^\s*(?P<ps>PS_\d+)\s+total capacity: +(?P<tot_cap>\d+) W\s+Voltage:(?P<voltage>\d+)V\s*')
+        p19 = regex_engine.compile(r'^\s*(?P<ps>PS_\d+)\s+total capacity: +(?P<tot_cap>\d+) W\s+Voltage:(?P<voltage>\d+)V\s*')
 
         # Pin:1143.68W  Vin:236.07V    Iin:4.89A    Pout:1076.82W    Vout:12.08V    Iout:90.03A
         # Pin:0.00W  Vin:0.00V    Iin:0.00A    Pout:0.00W    Vout:0.00V    Iout:0.00A
-        p20 = re.compile(r'^\s*Pin:(?P<power_in>[0-9.]+)W\s+Vin:(?P<volt_in>[0-9.]+)V\s+Iin:(?P<cur_in>[0-9.]+)A\s+Pout:(?P<power_out>[0-9.]+)W\s+Vout:(?P<volt_out>[0-9.]+)V\s+Iout:(?P<cur_out>[0-9.]+)A\s*')
+        p20 = regex_engine.compile(r'^\s*Pin:(?P<power_in>[0-9.]+)W\s+Vin:(?P<volt_in>[0-9.]+)V\s+Iin:(?P<cur_in>[0-9.]+)A\s+Pout:(?P<power_out>[0-9.]+)W\s+Vout:(?P<volt_out>[0-9.]+)V\s+Iout:(?P<cur_out>[0-9.]+)A\s*')
 
         # Cord connected to 220V AC
         # Cord not connected
-        p21 = re.compile(r'^\s*(?P<cord_connected>[Cord connected]+)\s?to?\s?(?P<input>\d+)?V?')
+        p21 = regex_engine.compile(r'^\s*(?P<cord_connected>[Cord connected]+)\s?to?\s?(?P<input>\d+)?V?')
 
         # Software-Alarm: No
-        p22 = re.compile(r'^\s*Software-Alarm: (?P<soft_alarm>.*)')
+        p22 = regex_engine.compile(r'^\s*Software-Alarm: (?P<soft_alarm>.*)')
         
         # Hardware alarm_bits reg0:20, reg2: 1,
         # Hardware alarm_bits
-        p23 = re.compile(r'^\s*Hardware alarm_bits\s?(?P<hard_alarm>.*)')
+        p23 = regex_engine.compile(r'^\s*Hardware alarm_bits\s?(?P<hard_alarm>.*)')
         
         # Reg0 bit5: No input detected
         # Reg2 bit0: Vin out of range
-        p24 = re.compile(r'^\s*(?P<reg_bit>Reg\d+ bit\d+): (?P<reg_val>.*)\s*')
+        p24 = regex_engine.compile(r'^\s*(?P<reg_bit>Reg\d+ bit\d+): (?P<reg_val>.*)\s*')
 
         parsed_env_power_dict = {}
         parsed_env_power_dict.setdefault('power', {}).setdefault('power_supply', {})
@@ -1138,12 +1136,12 @@ class ShowEnvironmentTemperature(ShowEnvironmentTemperatureSchema):
 
         #Match Temperatures
         #1        CPU             85              75          53         Ok
-        p1 = re.compile(r'^\s*(?P<mod>\d+)\s+'
-                        r'(?P<sensor>\w+)\s+'
-                        r'(?P<major_thresh>\d+)\s+'
-                        r'(?P<minor_thresh>\d+)\s+'
-                        r'(?P<curr_temp>\d+)\s+'
-                        r'(?P<status>\w+)\s*')
+        p1 = regex_engine.compile(r'^\s*(?P<mod>\d+)\s+'
+                                  r'(?P<sensor>\w+)\s+'
+                                  r'(?P<major_thresh>\d+)\s+'
+                                  r'(?P<minor_thresh>\d+)\s+'
+                                  r'(?P<curr_temp>\d+)\s+'
+                                  r'(?P<status>\w+)\s*')
 
 
         parsed_env_temp_dict = {}
@@ -1,7 +1,7 @@
 # Python (this imports the Python re module for RegEx)
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ==============================
@@ -62,13 +62,13 @@ class ShowFabricpathIsisAdjacency(ShowFabricpathIsisAdjacencySchema):
         # Defines the regex for the first line of device output, which is:
         # Sessions for VRF default, total: 3, established: 3
 
-        p1 = re.compile(r'Fabricpath IS-IS domain: +(?P<domain>(\S+)) +Fabricpath IS-IS adjacency database:$')
+        p1 = regex_engine.compile(r'Fabricpath IS-IS domain: +(?P<domain>(\S+)) +Fabricpath IS-IS adjacency database:$')
 
         # Defines the regex for the next line of device output, which is:
         # System ID       SNPA            Level  State  Hold Time  Interface
         # Switch-A           N/A             1      UP     00:00:28   port-channel1
 
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'(?P<system_id>(\S+)) + (?P<snpa>(\S+)) + (?P<level>(\d+)) +(?P<state>(UP|DOWN)) + (?P<hold_time>(\S+)) + (?P<interface>(\S+))$')
 
         for line in out.splitlines():
@@ -15,9 +15,6 @@
         * show mac address-table address {address} interface {interface} vlan {vlan}
 
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
@@ -27,6 +24,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          And, \
                                          Default, \
                                          Use
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowMacAddressTableBaseSchema(MetaParser):
@@ -85,7 +83,7 @@ class ShowMacAddressTableBase(ShowMacAddressTableBaseSchema):
         # 4000     5e00.c0ff.0007   static   ~~~         F      F    sup-eth1(R)
         # +  390     000f.53ff.1f1d   dynamic  0         F      F    Po125
         # 100 0000.0000.1112 dynamic NA F F Po100
-        p1 = re.compile(r'^(?P<entry>[\w\*\+] )?\s*(?P<vlan>All|[\d\-]+) '
+        p1 = regex_engine.compile(r'^(?P<entry>[\w\*\+] )?\s*(?P<vlan>All|[\d\-]+) '
             r'+(?P<mac_address>[0-9a-z\.\:]+) +(?P<mac_type>[a-z]+) '
             r'+(?P<age>[0-9\-\~]+|NA) '
             r'+(?P<secure>[A-Z]+) +(?P<ntfy>[A-Z]+) '
@@ -178,27 +176,31 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema
         'show mac address-table address {address} interface {interface} vlan {vlan}'
     ]
 
+    # '| json' output is parsed with context='json'
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+    def _get_command(self, address=None, interface=None, vlan=None):
+        if address and interface and vlan:
+            return self.cli_command[7].format(address=address, interface=interface, vlan=vlan)
+        elif address and interface:
+            return self.cli_command[6].format(address=address, interface=interface)
+        elif address and vlan:
+            return self.cli_command[5].format(address=address, vlan=vlan)
+        elif address:
+            return self.cli_command[4].format(address=address)
+        elif interface and vlan:
+            return self.cli_command[3].format(interface=interface, vlan=vlan)
+        elif interface:
+            return self.cli_command[2].format(interface=interface)
+        elif vlan:
+            return self.cli_command[1].format(vlan=vlan)
+        return self.cli_command[0]
+
     def cli(self, address=None, interface=None, vlan=None, output=None):
 
         if output is None:
-            if address and interface and vlan:
-                cmd = self.cli_command[7].format(address=address, interface=interface, vlan=vlan)
-            elif address and interface:
-                cmd = self.cli_command[6].format(address=address, interface=interface)
-            elif address and vlan:
-                cmd = self.cli_command[5].format(address=address, vlan=vlan)
-            elif address:
-                cmd = self.cli_command[4].format(address=address)
-            elif interface and vlan:
-                cmd = self.cli_command[3].format(interface=interface, vlan=vlan)
-            elif interface:
-                cmd = self.cli_command[2].format(interface=interface)
-            elif vlan:
-                cmd = self.cli_command[1].format(vlan=vlan)
-            else:
-                cmd = self.cli_command[0]
-
-            out = self.device.execute(cmd)
+            out = self.device.execute(self._get_command(
+                address=address, interface=interface, vlan=vlan))
         else:
             out = output
 
@@ -212,6 +214,70 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema
 
         return ret_dict
 
+    def json(self, address=None, interface=None, vlan=None, output=None):
+
+        if output is None:
+            out = self.device.execute(self._get_command(
+                address=address, interface=interface, vlan=vlan) + ' | json')
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        for row in Common.retrieve_json_rows(Common.load_json_output(out),
+                                             'TABLE_mac_address'):
+            # {"disp_mac_addr": "aaaa.bbff.8888", "disp_type": "* ",
+            #  "disp_vlan": "10", "disp_is_static": "enabled", "disp_age": "-",
+            #  "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+            #  "disp_port": "Ethernet1/2"}
+            vlan = str(row['disp_vlan']).strip()
+            vlan_dict = ret_dict.setdefault('mac_table', {})\
+            .setdefault('vlans', {}).setdefault(vlan, {})
+            vlan_dict.update({'vlan': vlan})
+            mac_address = row['disp_mac_addr']
+            mac_dict = vlan_dict.setdefault('mac_addresses', {})\
+            .setdefault(mac_address, {})
+            mac_dict.update({'mac_address': mac_address})
+
+            entry = row.get('disp_type', '').strip()
+            if entry:
+                mac_dict.update({'entry': entry})
+
+            mac_type = 'static' if self._json_bool(row.get('disp_is_static')) \
+                else 'dynamic'
+            age = str(row.get('disp_age', '-')).strip()
+
+            port = row.get('disp_port', '').strip()
+            if port.lower() == 'drop':
+                drop_dict = mac_dict.setdefault('drop', {})
+                drop_dict.update({
+                    'drop': True,
+                    'mac_type': mac_type,
+                    'age': age
+                })
+            elif port:
+                converted_port = Common.convert_intf_name(port)
+                intf_dict = mac_dict.setdefault('interfaces', {})\
+                .setdefault(converted_port, {})
+                intf_dict.update({
+                    'interface': converted_port,
+                    'mac_type': mac_type,
+                    'age': age
+                })
+
+            mac_dict.update({
+                'secure': 'T' if self._json_bool(row.get('disp_is_secure')) else 'F',
+                'ntfy': 'T' if self._json_bool(row.get('disp_is_ntfy')) else 'F'
+            })
+
+        return ret_dict
+
+    @staticmethod
+    def _json_bool(value):
+        # "enabled", "disabled", "true", "false"
+        return str(value).strip().lower() in ('enabled', 'true', 't')
+
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
     """Schema for show mac address-table aging-time"""
@@ -236,7 +302,7 @@ class ShowMacAddressTableAgingTime(ShowMacAddressTableAgingTimeSchema):
         ret_dict = {}
 
         # initial regexp pattern
-        p1 = re.compile(r'^\s*(?P<mac_aging_time>\d+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<mac_aging_time>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -294,15 +360,15 @@ class ShowMacAddressTableLimit(ShowMacAddressTableLimitSchema):
         # Current System Count: 3
         # Configured System Action: Flood
         # Currently System is: Flooding Unknown SA
-        p1 = re.compile(r'^Configured +System +Limit: '
+        p1 = regex_engine.compile(r'^Configured +System +Limit: '
         	r'+(?P<configured_system_limit>\d+)$')
-        p2 = re.compile(r'^Current +System +Count: '
+        p2 = regex_engine.compile(r'^Current +System +Count: '
         	r'+(?P<current_system_count>\d+)$')
-        p3 = re.compile(r'^Configured +System +Action: '
+        p3 = regex_engine.compile(r'^Configured +System +Action: '
         	r'+(?P<configured_system_action>\w+)$')
-        p4 = re.compile(r'^Currently +System +is: '
+        p4 = regex_engine.compile(r'^Currently +System +is: '
         	r'+(?P<currently_system_is>[\w\s]+)$')
-        p5 = re.compile(r'^\s*(?P<vlan>\w+) +(?P<conf_limit>\d+) '
+        p5 = regex_engine.compile(r'^\s*(?P<vlan>\w+) +(?P<conf_limit>\d+) '
         	r'+(?P<curr_count>\d+) +(?P<cfg_action>\w+) '
         	r'+(?P<currently>[\w\s]+)$')
 
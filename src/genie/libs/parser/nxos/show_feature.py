@@ -4,14 +4,14 @@ NXOS parsers for the following show commands:
     * 'show feature'
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # =====================================
 # Parser for 'show feature'
@@ -46,8 +46,8 @@ class ShowFeature(ShowFeatureSchema):
         for line in out.splitlines():
             line = line.strip()
             # 1) bash-shell             1          disabled
-            p1 = re.compile(r'^(?P<name>[\w\-]+) +(?P<inst>\d+) '
-                             r'+(?P<state>\w+)\(?(?P<run>not-running)?\)?$')
+            p1 = regex_engine.compile(r'^(?P<name>[\w\-]+) +(?P<inst>\d+) '
+                                       r'+(?P<state>\w+)\(?(?P<run>not-running)?\)?$')
             m = p1.match(line)
             if m:
                 if 'feature' not in f_dict:
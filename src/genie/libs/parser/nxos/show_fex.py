@@ -2,8 +2,8 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
-# Python
-import re
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # ==============================
 # Schema for 'show fex'
@@ -45,7 +45,7 @@ class ShowFex(ShowFexSchema):
         # 2     FEX-2_Device2             Online   N2K-C2348UPQ-10GE   FOC1234567B
         # 3     FEX-3_Device3             Online   N2K-C2348UPQ-10GE   FOC1234567C
         # 101               FEX0101        Image Download   N2K-C2248TP-E-1GE   FOX2511PD8M
-        p1 = re.compile(r'(?P<number>(\d+)) +(?P<description>(\S+)) +(?P<state>(?:\S|\s(?!\s))*) +(?P<model>(\S+)) +(?P<serial>(\S+))$')
+        p1 = regex_engine.compile(r'(?P<number>(\d+)) +(?P<description>(\S+)) +(?P<state>(?:\S|\s(?!\s))*) +(?P<model>(\S+)) +(?P<serial>(\S+))$')
 
         for line in output.splitlines():
             line = line.strip()
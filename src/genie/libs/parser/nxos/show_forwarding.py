@@ -9,7 +9,6 @@ NXOS parsers for the following commands
     * 'show forwarding ipv4 recursive vrf {vrf}'
 """
 # Python
-import re 
 import xmltodict
 
 #Metaparser
@@ -17,6 +16,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =====================
@@ -71,36 +71,36 @@ class ShowForwardingIpv4(ShowForwardingIpv4Schema):
         
         #slot  1
         #slot 27
-        p1 = re.compile(r'^slot +(?P<slot>\d+)')
+        p1 = regex_engine.compile(r'^slot +(?P<slot>\d+)')
         
         #IPv4 routes for table default/base
         #IPv4 routes for table VRF_Flow1_1/base
-        p2 = re.compile(r'^(?P<ip_version>\w+)'
-                         r' +routes +for +table +(?P<route_table>(\w+\/+\w+)|(0x[0-5a-fA-F]+))')
+        p2 = regex_engine.compile(r'^(?P<ip_version>\w+)'
+                                   r' +routes +for +table +(?P<route_table>(\w+\/+\w+)|(0x[0-5a-fA-F]+))')
         
         #0.0.0.0/32           Drop                                      Null0
         #*10.36.3.2/32          10.2.1.2                                  Ethernet1/1
         #10.36.3.2/32          10.2.1.2                                  Ethernet1/1       vni: 501003
         #10.4.1.1/32           10.2.1.2                                  Ethernet1/1           PUSH 16001
-        p3 = re.compile(r'^(?P<is_best_next_hop>\*)?'
-                          r'(?P<prefix>[0-9\.]+\/[0-9]+)?'
-                          r' +(?P<next_hop>[0-9A-Za-z.]+)'  
-                          r' +(?P<interface>[\w\-\/\.]+)'                     
-                          r'\s*(?P<label>[\w\:\ \w]+)?'
-                          )
+        p3 = regex_engine.compile(r'^(?P<is_best_next_hop>\*)?'
+                                    r'(?P<prefix>[0-9\.]+\/[0-9]+)?'
+                                    r' +(?P<next_hop>[0-9A-Za-z.]+)'  
+                                    r' +(?P<interface>[\w\-\/\.]+)'                     
+                                    r'\s*(?P<label>[\w\:\ \w]+)?'
+                                    )
         
         #10.2.1.2                                  Ethernet1/1
         #10.2.1.2                                  Ethernet1/1       vn: 501003
-        p3_1 = re.compile(r'^(?P<next_hop>[0-9A-Za-z.]+)'  
-                          r' +(?P<interface>[\w\-\/\.]+)'                     
-                          r'\s*(?P<label>[\w\:\ \w]+)?'
-                          )
+        p3_1 = regex_engine.compile(r'^(?P<next_hop>[0-9A-Za-z.]+)'  
+                                    r' +(?P<interface>[\w\-\/\.]+)'                     
+                                    r'\s*(?P<label>[\w\:\ \w]+)?'
+                                    )
          
         #1.1.1.2/32           fe80::a111:2222:3333:e13                  Ethernet1/1
-        p4 = re.compile(r'^(?P<is_best_next_hop>\*)?'
-                        r'(?P<prefix>[0-9\.]+\/[0-9]+)'
-                        r' +(?P<next_hop>[a-fA-F0-9\:]+)'
-                        r' +(?P<interface>[\w\-\/\.]+)$')
+        p4 = regex_engine.compile(r'^(?P<is_best_next_hop>\*)?'
+                                  r'(?P<prefix>[0-9\.]+\/[0-9]+)'
+                                  r' +(?P<next_hop>[a-fA-F0-9\:]+)'
+                                  r' +(?P<interface>[\w\-\/\.]+)$')
 
         for line in out.splitlines():
             line = line.strip()
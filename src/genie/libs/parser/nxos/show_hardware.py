@@ -2,15 +2,15 @@
 # Parser for 'show hardware internal tctrl_usd dpll state'
 # ========================================================
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 class ShowHardwareInternalTctrlUsdDpllStateSchema(MetaParser):
     """Schema for show hardware internal tctrl_usd dpll state"""
 
@@ -65,40 +65,40 @@ class ShowHardwareInternalTctrlUsdDpllState(ShowHardwareInternalTctrlUsdDpllStat
 
 
         # ------------------------ INST:0 DPLL 0 ------------------------
-        p0 = re.compile(r'^\-+\s+INST:(?P<inst>\d+)\s+DPLL\s+(?P<dpll>\d+)\s+\-+$')
+        p0 = regex_engine.compile(r'^\-+\s+INST:(?P<inst>\d+)\s+DPLL\s+(?P<dpll>\d+)\s+\-+$')
 
         # dpll_mon_status_0 (0x0118): 0x02: in Holdover
         # dpll_mon_status_0 (0x0110): 0x02: in Holdover
-        p1 = re.compile(r'^dpll_mon_status_\d+\s+(?P<dpll_mon_status>[\(\w\)\s\:]+)$')
+        p1 = regex_engine.compile(r'^dpll_mon_status_\d+\s+(?P<dpll_mon_status>[\(\w\)\s\:]+)$')
 
         # lock: No
-        p2 = re.compile(r'^lock:\s+(?P<lock>\w+)$')
+        p2 = regex_engine.compile(r'^lock:\s+(?P<lock>\w+)$')
 
         # ho: Yes
-        p3 = re.compile(r'^ho:\s+(?P<ho>\w+)$')
+        p3 = regex_engine.compile(r'^ho:\s+(?P<ho>\w+)$')
 
         # step_time in progress No
-        p4 = re.compile(r'^step_time in progress+\s+(?P<step_time_in_progress>\w+)$')
+        p4 = regex_engine.compile(r'^step_time in progress+\s+(?P<step_time_in_progress>\w+)$')
 
         # flhit No
-        p5 = re.compile(r'^flhit\s+(?P<flhit>\w+)$')
+        p5 = regex_engine.compile(r'^flhit\s+(?P<flhit>\w+)$')
 
         # pslhit No
-        p6 = re.compile(r'^pslhit\s+(?P<pslhit>\w+)$')
+        p6 = regex_engine.compile(r'^pslhit\s+(?P<pslhit>\w+)$')
 
         # dpll 0 mode Automatic mode(3) refId INVALID(15)
-        p7 = re.compile(r'^dpll\s+\d+\s+mode\s+(?P<mode>\w+)\s+\w+\(\d+\)\s+refId\s+(?P<refId>\w+)\(\-?\d+\)$')
+        p7 = regex_engine.compile(r'^dpll\s+\d+\s+mode\s+(?P<mode>\w+)\s+\w+\(\d+\)\s+refId\s+(?P<refId>\w+)\(\-?\d+\)$')
 
         # NCO Assist Pair HW lock status: Ref Failed(4)
-        p8 = re.compile(r'^NCO Assist Pair HW lock status:\s+(?P<nco_assist_pair_hw_lock_status>[\s\w\(\d\)]+)$')
+        p8 = regex_engine.compile(r'^NCO Assist Pair HW lock status:\s+(?P<nco_assist_pair_hw_lock_status>[\s\w\(\d\)]+)$')
 
         # PSL 885 Bandwidth 7 Var BW 79 PullInRange 0
         # PSL     7500    Bandwidth 7     Var BW 135      PullInRange 0
-        p9 = re.compile(r'^PSL\s+(?P<psl>\d+)\s+\w+\s+(?P<bandwidth>\d+)\s+\w+\s+\w+\s+(?P<var_bw>\d+)\s+\w+\s+(?P<pullinrange>\d+)$')
+        p9 = regex_engine.compile(r'^PSL\s+(?P<psl>\d+)\s+\w+\s+(?P<bandwidth>\d+)\s+\w+\s+\w+\s+(?P<var_bw>\d+)\s+\w+\s+(?P<pullinrange>\d+)$')
 
         # ZL30XXX_REF0P(0) : 7743 NA
         # ZL30XXX_REF0P(0)        :         0             NA
-        p10 = re.compile(r'^(?P<refclk>\w+\(\d+\))\s+\:\s+(?P<measured_freq>\d+)\s+(?P<freq_err>(\w+|\d+\.\d+|\-\d+\.\d+))$')
+        p10 = regex_engine.compile(r'^(?P<refclk>\w+\(\d+\))\s+\:\s+(?P<measured_freq>\d+)\s+(?P<freq_err>(\w+|\d+\.\d+|\-\d+\.\d+))$')
 
         # Final dict
         ret_dict = {}
@@ -6,13 +6,13 @@ NXOS parsers for show commands:
     * 'show hsrp delay'
 '''
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================
 # Schema for 'show hsrp summary'
@@ -72,8 +72,8 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
             
             # Extended-hold (NSF) enabled, 10 seconds
             # Extended-hold (NSF) disabled
-            p1 = re.compile(r'\s*Extended-hold +\(NSF\) +(?P<nsf>[a-zA-Z]+)'
-                             '(, +(?P<nsf_time>[0-9]+) seconds)?$')
+            p1 = regex_engine.compile(r'\s*Extended-hold +\(NSF\) +(?P<nsf>[a-zA-Z]+)'
+                                       '(, +(?P<nsf_time>[0-9]+) seconds)?$')
             m = p1.match(line)
             if m:
                 hsrp_summary['nsf'] = m.groupdict()['nsf']
@@ -82,8 +82,8 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 continue
 
             # Global HSRP-BFD enabled
-            p2 = re.compile(r'\s*Global +HSRP-BFD'
-                             ' +(?P<global_hsrp_bfd>[a-zA-Z]+)$')
+            p2 = regex_engine.compile(r'\s*Global +HSRP-BFD'
+                                       ' +(?P<global_hsrp_bfd>[a-zA-Z]+)$')
             m = p2.match(line)
             if m:
                 hsrp_summary['global_hsrp_bfd'] = \
@@ -91,7 +91,7 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 continue
 
             # Total Groups: 3
-            p3 = re.compile(r'\s*Total +Groups: +(?P<total_groups>[0-9]+)$')
+            p3 = regex_engine.compile(r'\s*Total +Groups: +(?P<total_groups>[0-9]+)$')
             m = p3.match(line)
             if m:
                 if 'stats' not in hsrp_summary:
@@ -101,9 +101,9 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 continue
 
             # Version::    V1-IPV4: 0       V2-IPV4: 3      V2-IPV6: 0
-            p4 = re.compile(r'\s*Version:: +V1-IPV4: +(?P<v1_ipv4>[0-9]+)'
-                             ' +V2-IPV4: +(?P<v2_ipv4>[0-9]+) +V2-IPV6:'
-                             ' +(?P<v2_ipv6>[0-9]+)$')
+            p4 = regex_engine.compile(r'\s*Version:: +V1-IPV4: +(?P<v1_ipv4>[0-9]+)'
+                                       ' +V2-IPV4: +(?P<v2_ipv4>[0-9]+) +V2-IPV6:'
+                                       ' +(?P<v2_ipv6>[0-9]+)$')
             m = p4.match(line)
             if m:
                 hsrp_summary['stats']['v1_ipv4'] = int(m.groupdict()['v1_ipv4'])
@@ -112,9 +112,9 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 continue
 
             # State::     Active: 0       Standby: 0       Listen: 0
-            p5 = re.compile(r'\s*State:: +Active: +(?P<active>[0-9]+)'
-                             ' +Standby: +(?P<standby>[0-9]+) +Listen:'
-                             ' +(?P<listen>[0-9]+)$')
+            p5 = regex_engine.compile(r'\s*State:: +Active: +(?P<active>[0-9]+)'
+                                       ' +Standby: +(?P<standby>[0-9]+) +Listen:'
+                                       ' +(?P<listen>[0-9]+)$')
             m = p5.match(line)
             if m:
                 hsrp_summary['stats']['active'] = int(m.groupdict()['active'])
@@ -123,9 +123,9 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 continue
 
             # State::  V6-Active: 0    V6-Standby: 0    V6-Listen: 0
-            p6 = re.compile(r'\s*State:: +V6-Active: +(?P<v6_active>[0-9]+)'
-                             ' +V6-Standby: +(?P<v6_standby>[0-9]+)'
-                             ' +V6-Listen: +(?P<v6_listen>[0-9]+)$')
+            p6 = regex_engine.compile(r'\s*State:: +V6-Active: +(?P<v6_active>[0-9]+)'
+                                       ' +V6-Standby: +(?P<v6_standby>[0-9]+)'
+                                       ' +V6-Listen: +(?P<v6_listen>[0-9]+)$')
             m = p6.match(line)
             if m:
                 hsrp_summary['stats']['v6_active'] \
@@ -137,16 +137,16 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 continue
 
             # Total HSRP Enabled interfaces: 1
-            p7 = re.compile(r'\s*Total +HSRP +Enabled +interfaces:'
-                             ' +(?P<intf_total>[0-9]+)$')
+            p7 = regex_engine.compile(r'\s*Total +HSRP +Enabled +interfaces:'
+                                       ' +(?P<intf_total>[0-9]+)$')
             m = p7.match(line)
             if m:
                 hsrp_summary['intf_total'] = int(m.groupdict()['intf_total'])
                 continue
 
             # Tx - Pass: 0       Fail: 0
-            p8 = re.compile(r'\s*Tx +\- +Pass: +(?P<tx_pass>[0-9]+) +Fail:'
-                             ' +(?P<tx_fail>[0-9]+)$')
+            p8 = regex_engine.compile(r'\s*Tx +\- +Pass: +(?P<tx_pass>[0-9]+) +Fail:'
+                                       ' +(?P<tx_fail>[0-9]+)$')
             m = p8.match(line)
             if m:
                 if 'total_packets' not in hsrp_summary:
@@ -158,7 +158,7 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 continue
 
             # Rx - Good: 0
-            p9 = re.compile(r'\s*Rx +\- +Good: +(?P<rx_good>[0-9]+)$')
+            p9 = regex_engine.compile(r'\s*Rx +\- +Good: +(?P<rx_good>[0-9]+)$')
             m = p9.match(line)
             if m:
                 hsrp_summary['total_packets']['rx_good'] \
@@ -166,8 +166,8 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 continue
 
             # Packet for unknown groups: 0
-            p10 = re.compile(r'\s*Packet +for +unknown +groups:'
-                              ' +(?P<pkt_unknown_groups>[0-9]+)$')
+            p10 = regex_engine.compile(r'\s*Packet +for +unknown +groups:'
+                                        ' +(?P<pkt_unknown_groups>[0-9]+)$')
             m = p10.match(line)
             if m:
                 hsrp_summary['pkt_unknown_groups'] = \
@@ -175,7 +175,7 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
                 continue
 
             # Total MTS: Rx: 85
-            p11 = re.compile(r'\s*Total +MTS: +Rx: +(?P<total_mts_rx>[0-9]+)$')
+            p11 = regex_engine.compile(r'\s*Total +MTS: +Rx: +(?P<total_mts_rx>[0-9]+)$')
             m = p11.match(line)
             if m:
                 hsrp_summary['total_mts_rx'] = \
@@ -297,86 +297,86 @@ class ShowHsrpAll(ShowHsrpAllSchema):
         secondary_vip_exists = False
  
         # Ethernet1/3 - Group 1 (HSRP-V1) (IPv4)
-        p1 = re.compile(r'(?P<intf>(\S+)) +\- +Group +(?P<gnum>[0-9]+)'
-                        r' +\(HSRP-V(?P<version>[0-9]+)\)'
-                        r' +\((?P<af>(\S+))\)$')
+        p1 = regex_engine.compile(r'(?P<intf>(\S+)) +\- +Group +(?P<gnum>[0-9]+)'
+                                  r' +\(HSRP-V(?P<version>[0-9]+)\)'
+                                  r' +\((?P<af>(\S+))\)$')
 
         # Local state is Active, priority 100 (Cfged 100)
         # Local state is Active, priority 110 (Cfged 110), may preempt
         # Local state is Disabled(Virtual IP not cfged), priority 1 (Cfged 1)
-        p2 = re.compile(r'Local +state +is +(?P<state>(\S+))'
-                        r'(?:\((?P<reason>.*)\))?'
-                        r', +priority +(?P<priority>(\d+))'
-                        r' +\(Cfged +(?P<cfged>(\d+))\)'
-                        r'(?:, +(?P<preempt>(\S+)) +preempt)?$')
+        p2 = regex_engine.compile(r'Local +state +is +(?P<state>(\S+))'
+                                  r'(?:\((?P<reason>.*)\))?'
+                                  r', +priority +(?P<priority>(\d+))'
+                                  r' +\(Cfged +(?P<cfged>(\d+))\)'
+                                  r'(?:, +(?P<preempt>(\S+)) +preempt)?$')
 
         # Forwarding threshold(for vPC), lower: 0 upper: 100
-        p3 = re.compile(r'Forwarding +threshold\(for +vPC\),'
-                        r' +lower: +(?P<lower>(\d+))'
-                        r' +upper: +(?P<upper>(\d+))$')
+        p3 = regex_engine.compile(r'Forwarding +threshold\(for +vPC\),'
+                                  r' +lower: +(?P<lower>(\d+))'
+                                  r' +upper: +(?P<upper>(\d+))$')
 
         # Preemption Delay (Seconds) Reload:10 Minimum:5 Sync:5
-        p4 = re.compile(r'Preemption +Delay +\(Seconds\)'
-                        r'(?: +Reload: +(?P<reload>(\d+)))?'
-                        r'(?: +Minimum: +(?P<min>(\d+)))?'
-                        r'(?: +Sync: +(?P<sync>(\d+)))?$')
+        p4 = regex_engine.compile(r'Preemption +Delay +\(Seconds\)'
+                                  r'(?: +Reload: +(?P<reload>(\d+)))?'
+                                  r'(?: +Minimum: +(?P<min>(\d+)))?'
+                                  r'(?: +Sync: +(?P<sync>(\d+)))?$')
 
         # Hellotime 3 sec, holdtime 10 sec
         # Hellotime 999 msec (cfged 9 sec), holdtime 2999 msec (cfged 27 sec)
-        p5 = re.compile(r'Hellotime +(?P<hello>(\d+)) +(?P<hello_unit>(\S+))'
-                r'(?: \(cfged (?P<cfged_hello>(\d+)) +(?P<cfhe_unit>(\S+)\)))?'
-                r', +holdtime +(?P<hold>(\d+)) +(?P<hold_unit>(\S+))'
-                r'(?: +\(cfged (?P<cfged_hold>(\d+)) (?P<cfhd_unit>(\S+))\))?$')
+        p5 = regex_engine.compile(r'Hellotime +(?P<hello>(\d+)) +(?P<hello_unit>(\S+))'
+                          r'(?: \(cfged (?P<cfged_hello>(\d+)) +(?P<cfhe_unit>(\S+)\)))?'
+                          r', +holdtime +(?P<hold>(\d+)) +(?P<hold_unit>(\S+))'
+                          r'(?: +\(cfged (?P<cfged_hold>(\d+)) (?P<cfhd_unit>(\S+))\))?$')
 
         # Next hello sent in 2.726000 sec(s)
 
         # Virtual IP address is 172.16.12.254 (Cfged)
-        p7 = re.compile(r'Virtual +IP +address +is +(?P<ip>(\S+))'
-                         r' +\((?P<reason>(\S+))\)$')
+        p7 = regex_engine.compile(r'Virtual +IP +address +is +(?P<ip>(\S+))'
+                                   r' +\((?P<reason>(\S+))\)$')
 
         # Secondary Virtual IP address is 10.1.1.253
-        p8 = re.compile(r'[sS]econdary +[vV]irtual +IP +address +is'
-                         r' +(?P<ip>(\S+))')
+        p8 = regex_engine.compile(r'[sS]econdary +[vV]irtual +IP +address +is'
+                                   r' +(?P<ip>(\S+))')
 
         # Active router is local
         # Active router is 192.168.1.1, priority 110 expires in 2.662000 sec(s)
-        p9 = re.compile(r'Active +router +is +(?P<active>(\S+))(?: *,'
-                         r' +priority +(?P<priority>(\d+)) expires +in'
-                         r' +(?P<expires>(\S+)) +sec\(s\))?$')
+        p9 = regex_engine.compile(r'Active +router +is +(?P<active>(\S+))(?: *,'
+                                   r' +priority +(?P<priority>(\d+)) expires +in'
+                                   r' +(?P<expires>(\S+)) +sec\(s\))?$')
 
         # Standby router is 172.16.12.2 , priority 100 expires in 9.456000 sec(s)
-        p10 = re.compile(r'Standby +router +is +(?P<standby>(\S+))(?: *,'
-                          r' +priority +(?P<priority>(\d+)) +expires +in'
-                          r' +(?P<expires>(\S+)) +sec\(s\))?$')
+        p10 = regex_engine.compile(r'Standby +router +is +(?P<standby>(\S+))(?: *,'
+                                    r' +priority +(?P<priority>(\d+)) +expires +in'
+                                    r' +(?P<expires>(\S+)) +sec\(s\))?$')
 
         # Authentication text "cisco"
         # Authentication MD5, key-string "cisco123"
-        p11 = re.compile(r'Authentication +(?:(MD5, key-string)|(text))?'
-                          r' +\"(?P<auth>(\S+))\"$')
+        p11 = regex_engine.compile(r'Authentication +(?:(MD5, key-string)|(text))?'
+                                    r' +\"(?P<auth>(\S+))\"$')
 
         # Virtual mac address is 0000.0cff.b308 (Default MAC)
-        p12 = re.compile(r'Virtual +mac +address +is +(?P<mac>(\S+))'
-                          r' +\((?P<status>\S+) MAC( - (?P<use_bia>(\S+))'
-                          r' +enabled)?\)$')
+        p12 = regex_engine.compile(r'Virtual +mac +address +is +(?P<mac>(\S+))'
+                                    r' +\((?P<status>\S+) MAC( - (?P<use_bia>(\S+))'
+                                    r' +enabled)?\)$')
 
         # 2 state changes, last state change 03:13:06
-        p13 = re.compile(r'(?P<state_changes>(\d+)) +state +changes,'
-                          r' +last +state +change +(?P<last>(\S+))$')
+        p13 = regex_engine.compile(r'(?P<state_changes>(\d+)) +state +changes,'
+                                    r' +last +state +change +(?P<last>(\S+))$')
 
 
         # Track object 1 state UP decrement 22
-        p14 = re.compile(r'[tT]rack +object +(?P<tracked_object>\d+)'
-                          r' +state +(?P<tracked_status>(\S+)) +decrement'
-                          r' +(?P<decrement>(\d+))')
+        p14 = regex_engine.compile(r'[tT]rack +object +(?P<tracked_object>\d+)'
+                                    r' +state +(?P<tracked_status>(\S+)) +decrement'
+                                    r' +(?P<decrement>(\d+))')
 
         # IP redundancy name is hsrp-Eth1/3-1 (default)
-        p15 = re.compile(r'IP +redundancy +name +is +(?P<name>(\S+)) +\(default\)$')
+        p15 = regex_engine.compile(r'IP +redundancy +name +is +(?P<name>(\S+)) +\(default\)$')
 
         # Secondary VIP(s):
-        p16 = re.compile(r'Secondary +VIP\(s\):$')
+        p16 = regex_engine.compile(r'Secondary +VIP\(s\):$')
 
         # 2001:db8:7746:fa41::1
-        p17 = re.compile(r'(?P<vip>(\S+))$')
+        p17 = regex_engine.compile(r'(?P<vip>(\S+))$')
 
 
         for line in out.splitlines():
@@ -694,7 +694,7 @@ class ShowHsrpDelay(ShowHsrpDelaySchema):
             # (no need to parse above because it's just header)
 
             # GigabitEthernet1   99      888
-            p1 = re.compile(r'\s*(?P<interface>\S+) +(?P<minimum_delay>\d+) +'
+            p1 = regex_engine.compile(r'\s*(?P<interface>\S+) +(?P<minimum_delay>\d+) +'
                 r'(?P<reload_delay>\d+)')
             m = p1.match(line)
             if m:
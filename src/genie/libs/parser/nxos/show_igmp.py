@@ -15,14 +15,12 @@ NXOS parsers for the following show commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -112,37 +110,37 @@ class ShowIpIgmpSnooping(ShowIpIgmpSnoopingSchema):
 
             # Global IGMP Snooping Information:
             #  IGMP Snooping enabled
-            p1 = re.compile(r'^\s*IGMP +Snooping +(?P<enabled>\w+)$')
+            p1 = regex_engine.compile(r'^\s*IGMP +Snooping +(?P<enabled>\w+)$')
             m = p1.match(line)
             if m:
                 global_configuration_enabled = m.groupdict()['enabled']
 
             #  IGMPv1/v2 Report Suppression enabled
-            p2 = re.compile(r'^\s*IGMPv1\/v2 +Report +Suppression +(?P<v1v2_report_suppression_enabled>\w+)$')
+            p2 = regex_engine.compile(r'^\s*IGMPv1\/v2 +Report +Suppression +(?P<v1v2_report_suppression_enabled>\w+)$')
             m = p2.match(line)
             if m:
                 v1v2_report_suppression = m.groupdict()['v1v2_report_suppression_enabled']
 
             #  IGMPv3 Report Suppression disabled
-            p3 = re.compile(r'^\s*IGMPv3 +Report +Suppression +(?P<v3_report_suppression_enabled>\w+)$')
+            p3 = regex_engine.compile(r'^\s*IGMPv3 +Report +Suppression +(?P<v3_report_suppression_enabled>\w+)$')
             m = p3.match(line)
             if m:
                 v3_report_suppression = m.groupdict()['v3_report_suppression_enabled']
 
             #  Link Local Groups Suppression enabled
-            p4 = re.compile(r'^\s*Link +Local +Groups +Suppression +(?P<link_local_group_suppression_enabled>\w+)$')
+            p4 = regex_engine.compile(r'^\s*Link +Local +Groups +Suppression +(?P<link_local_group_suppression_enabled>\w+)$')
             m = p4.match(line)
             if m:
                 link_local_group_suppression_enabled = m.groupdict()['link_local_group_suppression_enabled']
 
             #  VPC Multicast optimization disabled
-            p5 = re.compile(r'^\s*VPC +Multicast +optimization +(?P<vpc_multicast_optimization_enabled>\w+)$')
+            p5 = regex_engine.compile(r'^\s*VPC +Multicast +optimization +(?P<vpc_multicast_optimization_enabled>\w+)$')
             m = p5.match(line)
             if m:
                 vpc_multicast_optimization = m.groupdict()['vpc_multicast_optimization_enabled']
 
             # IGMP Snooping information for vlan 1
-            p6 = re.compile(r'^\s*IGMP +Snooping +information +for +vlan +(?P<vlan_id>\d+)$')
+            p6 = regex_engine.compile(r'^\s*IGMP +Snooping +information +for +vlan +(?P<vlan_id>\d+)$')
             m = p6.match(line)
             if m:
                 configuration_vlan_id = m.groupdict()['vlan_id']
@@ -150,23 +148,23 @@ class ShowIpIgmpSnooping(ShowIpIgmpSnoopingSchema):
                     querier_last_member_query_interval = igmp_querier = ""
 
             #  IGMP snooping enabled
-            p7 = re.compile(r'^\s*IGMP +snooping +(?P<ip_igmp_snooping>\w+)$')
+            p7 = regex_engine.compile(r'^\s*IGMP +snooping +(?P<ip_igmp_snooping>\w+)$')
             m = p7.match(line)
             if m:
                 ip_igmp_snooping = m.groupdict()['ip_igmp_snooping']
 
             #  Lookup mode: IP
-            p8 = re.compile(r'^\s*Lookup +mode: +(?P<lookup_mode>\w+)$')
+            p8 = regex_engine.compile(r'^\s*Lookup +mode: +(?P<lookup_mode>\w+)$')
             m = p8.match(line)
             if m:
                 lookup_mode = m.groupdict()['lookup_mode'].lower()
 
             #  IGMP querier none
             #  IGMP querier present, address: 10.51.1.1, version: 2, i/f Vlan100
-            p9 = re.compile(r'^\s*IGMP +querier +(?P<igmp_querier>\S+)'
-                            r'(, +address: +(?P<address>\S+))?'
-                            r'(, +version: +(?P<version>\d))?'
-                            r'(, +i\/f +(?P<vlan>\w+))?$')
+            p9 = regex_engine.compile(r'^\s*IGMP +querier +(?P<igmp_querier>\S+)'
+                                      r'(, +address: +(?P<address>\S+))?'
+                                      r'(, +version: +(?P<version>\d))?'
+                                      r'(, +i\/f +(?P<vlan>\w+))?$')
             m = p9.match(line)
             if m:
                 igmp_querier = m.groupdict()['igmp_querier']
@@ -176,27 +174,27 @@ class ShowIpIgmpSnooping(ShowIpIgmpSnoopingSchema):
                     version = m.groupdict()['version']
 
             # Querier interval: 125 secs
-            p9_1 = re.compile(r'^\s*Querier +interval: +(?P<querier_interval>\d+) +secs$')
+            p9_1 = regex_engine.compile(r'^\s*Querier +interval: +(?P<querier_interval>\d+) +secs$')
             m = p9_1.match(line)
             if m:
                 querier_interval = m.groupdict()['querier_interval']
 
 
             # Querier last member query interval: 1 secs
-            p9_2 = re.compile(r'^\s*Querier +last +member +query +interval:'
-                              r' +(?P<querier_last_member_query_interval>\d+) +secs$')
+            p9_2 = regex_engine.compile(r'^\s*Querier +last +member +query +interval:'
+                                        r' +(?P<querier_last_member_query_interval>\d+) +secs$')
             m = p9_2.match(line)
             if m:
                 querier_last_member_query_interval = m.groupdict()['querier_last_member_query_interval']
 
             # Querier robustness: 2
-            p9_3 = re.compile(r'^\s*Querier +robustness: +(?P<querier_robustness>\d+)$')
+            p9_3 = regex_engine.compile(r'^\s*Querier +robustness: +(?P<querier_robustness>\d+)$')
             m = p9_3.match(line)
             if m:
                 querier_robustness = m.groupdict()['querier_robustness']
             # Switch-querier disabled
             # Switch-querier enabled, address XXX.XXX.XXX.XXX, currently running
-            p10 = re.compile(r'^\s*Switch\-querier +(?P<switch_querier>[\w]+)(, +address +(?P<ip_address>(\S+)), +currently +(?P<state>[\w]+))?$')
+            p10 = regex_engine.compile(r'^\s*Switch\-querier +(?P<switch_querier>[\w]+)(, +address +(?P<ip_address>(\S+)), +currently +(?P<state>[\w]+))?$')
             m = p10.match(line)
             if m:
                 switch_querier = m.groupdict()['switch_querier']
@@ -205,56 +203,56 @@ class ShowIpIgmpSnooping(ShowIpIgmpSnoopingSchema):
                     state = m.groupdict()['state']
 
             #  IGMP Explicit tracking enabled
-            p11 = re.compile(r'^\s*IGMP +Explicit +tracking +(?P<igmp_explicit_tracking>\w+)$')
+            p11 = regex_engine.compile(r'^\s*IGMP +Explicit +tracking +(?P<igmp_explicit_tracking>\w+)$')
             m = p11.match(line)
             if m:
                 igmp_explicit_tracking = m.groupdict()['igmp_explicit_tracking']
 
             #  IGMPv2 Fast leave disabled
-            p12 = re.compile(r'^\s*IGMPv2 +Fast +leave +(?P<v2_fast_leave>\w+)$')
+            p12 = regex_engine.compile(r'^\s*IGMPv2 +Fast +leave +(?P<v2_fast_leave>\w+)$')
             m = p12.match(line)
             if m:
                 v2_fast_leave = m.groupdict()['v2_fast_leave']
 
             #  Number of router-ports: 1
-            p13 = re.compile(r'^\s*Number +of +router\-ports: +(?P<router_ports_count>\d+)$')
+            p13 = regex_engine.compile(r'^\s*Number +of +router\-ports: +(?P<router_ports_count>\d+)$')
             m = p13.match(line)
             if m:
                 router_ports_count = m.groupdict()['router_ports_count']
 
             #  Number of groups: 0
-            p14 = re.compile(r'^\s*Number +of +groups: +(?P<groups_count>\d+)$')
+            p14 = regex_engine.compile(r'^\s*Number +of +groups: +(?P<groups_count>\d+)$')
             m = p14.match(line)
             if m:
                 groups_count = m.groupdict()['groups_count']
 
             #  VLAN vPC function enabled
-            p14_1 = re.compile(r'^\s*VLAN +vPC +function +(?P<vlan_vpc_function>\w+)$')
+            p14_1 = regex_engine.compile(r'^\s*VLAN +vPC +function +(?P<vlan_vpc_function>\w+)$')
             m = p14_1.match(line)
             if m:
                 vlan_vpc_function = m.groupdict()['vlan_vpc_function']
 
             #  Active ports:
             #    Po20        Po30
-            p15_1 = re.compile(r'^(?P<space>\s{4})(?P<active_ports>[\w\s]+)$')
+            p15_1 = regex_engine.compile(r'^(?P<space>\s{4})(?P<active_ports>[\w\s]+)$')
             m = p15_1.match(line)
             if m:
                 active_ports = m.groupdict()['active_ports'].split()
 
             #  Report Flooding: Disabled
-            p16 = re.compile(r'^\s*Report +Flooding: +(?P<report_flooding>\w+)$')
+            p16 = regex_engine.compile(r'^\s*Report +Flooding: +(?P<report_flooding>\w+)$')
             m = p16.match(line)
             if m:
                 report_flooding = m.groupdict()['report_flooding'].lower()
 
             #  Interfaces for Report Flooding: n/a
-            p17 = re.compile(r'^\s*Interfaces +for +Report +Flooding: +(?P<report_flooding_interfaces>\S+)$')
+            p17 = regex_engine.compile(r'^\s*Interfaces +for +Report +Flooding: +(?P<report_flooding_interfaces>\S+)$')
             m = p17.match(line)
             if m:
                 report_flooding_interfaces = m.groupdict()['report_flooding_interfaces']
 
             #  Use Group Address for Proxy Leaves: no
-            p18 = re.compile(r'^\s*Use +Group +Address +for +Proxy +Leaves: +(?P<group_address_for_proxy_leaves>\S+)$')
+            p18 = regex_engine.compile(r'^\s*Use +Group +Address +for +Proxy +Leaves: +(?P<group_address_for_proxy_leaves>\S+)$')
             m = p18.match(line)
             if m:
                 group_address_for_proxy_leaves = m.groupdict()['group_address_for_proxy_leaves']
@@ -507,8 +505,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
             line = line.strip()
 
             # IGMP Interfaces for VRF "default", count: 2
-            p1 = re.compile(r'^IGMP +Interfaces +for +VRF +\"(?P<vrf>\S+)\", +'
-                             r'count: +(?P<groups_count>\d+)$')
+            p1 = regex_engine.compile(r'^IGMP +Interfaces +for +VRF +\"(?P<vrf>\S+)\", +'
+                                       r'count: +(?P<groups_count>\d+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -522,10 +520,10 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Ethernet2/1, Interface status: protocol-up/link-up/admin-up
-            p2 = re.compile(r'^(?P<intf>[\w\/\.\-]+), +'
-                             r'Interface +status: +protocol\-(?P<protocol_status>\w+)\/'
-                             r'link\-(?P<link_status>\w+)\/'
-                             r'admin\-(?P<admin_status>\w+)$')
+            p2 = regex_engine.compile(r'^(?P<intf>[\w\/\.\-]+), +'
+                                       r'Interface +status: +protocol\-(?P<protocol_status>\w+)\/'
+                                       r'link\-(?P<link_status>\w+)\/'
+                                       r'admin\-(?P<admin_status>\w+)$')
             m = p2.match(line)
             if m:
                 intf = m.groupdict()['intf']
@@ -543,8 +541,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IP address: 10.1.2.1, IP subnet: 10.1.2.0/24
-            p3 = re.compile(r'^IP +address: +(?P<ip>[\w\.\:]+), +'
-                             r'IP +subnet: +(?P<subnet>[\w\.\:\/]+)$')
+            p3 = regex_engine.compile(r'^IP +address: +(?P<ip>[\w\.\:]+), +'
+                                       r'IP +subnet: +(?P<subnet>[\w\.\:\/]+)$')
             m = p3.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['address'] = m.groupdict()['ip']
@@ -553,9 +551,9 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
 
             # Active querier: 10.1.2.1, version: 3, next query sent in: 00:00:47
             # Active querier: 0.0.0.0
-            p4 = re.compile(r'^Active +querier: +(?P<querier>[\w\.\:]+)(, +'
-                             r'version: +(?P<version>\d+), +'
-                             r'next +query +sent +in: +(?P<in>[\w\.\:\.]+))?$')
+            p4 = regex_engine.compile(r'^Active +querier: +(?P<querier>[\w\.\:]+)(, +'
+                                       r'version: +(?P<version>\d+), +'
+                                       r'next +query +sent +in: +(?P<in>[\w\.\:\.]+))?$')
             m = p4.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['querier'] = m.groupdict()['querier']
@@ -566,9 +564,9 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Active querier: 10.3.5.3, expires: 00:02:59, querier version: 2
-            p4_1 = re.compile(r'^Active +querier: +(?P<querier>[\w\.\:]+), +'
-                             r'expires: +(?P<expires>[\w\.\:\.]+), +'
-                             r'querier +version: +(?P<version>\d+)$')
+            p4_1 = regex_engine.compile(r'^Active +querier: +(?P<querier>[\w\.\:]+), +'
+                                       r'expires: +(?P<expires>[\w\.\:\.]+), +'
+                                       r'querier +version: +(?P<version>\d+)$')
             m = p4_1.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['querier'] = m.groupdict()['querier']
@@ -578,7 +576,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
 
 
             # Membership count: 4
-            p5 = re.compile(r'^Membership +count: +(?P<count>\d+)$')
+            p5 = regex_engine.compile(r'^Membership +count: +(?P<count>\d+)$')
             m = p5.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['membership_count'] = \
@@ -586,7 +584,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Old Membership count 0
-            p6 = re.compile(r'^Old +Membership +count +(?P<count>\d+)$')
+            p6 = regex_engine.compile(r'^Old +Membership +count +(?P<count>\d+)$')
             m = p6.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['old_membership_count'] = \
@@ -594,8 +592,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP version: 3, host version: 3
-            p7 = re.compile(r'^IGMP +version: +(?P<ver>\d+), +'
-                             r'host +version: +(?P<host_ver>\d+)$')
+            p7 = regex_engine.compile(r'^IGMP +version: +(?P<ver>\d+), +'
+                                       r'host +version: +(?P<host_ver>\d+)$')
             m = p7.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['version'] = \
@@ -605,8 +603,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP query interval: 133 secs, configured value: 133 secs
-            p8 = re.compile(r'^IGMP +query +interval: +(?P<intverval>\d+) +secs, +'
-                             r'configured +value: +(?P<conf_intvl>\d+) +secs$')
+            p8 = regex_engine.compile(r'^IGMP +query +interval: +(?P<intverval>\d+) +secs, +'
+                                       r'configured +value: +(?P<conf_intvl>\d+) +secs$')
             m = p8.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['query_interval'] = \
@@ -616,8 +614,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP max response time: 15 secs, configured value: 15 secs
-            p9 = re.compile(r'^IGMP +max +response +time: +(?P<time>\d+) +secs, +'
-                             r'configured +value: +(?P<conf_time>\d+) +secs$')
+            p9 = regex_engine.compile(r'^IGMP +max +response +time: +(?P<time>\d+) +secs, +'
+                                       r'configured +value: +(?P<conf_time>\d+) +secs$')
             m = p9.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['query_max_response_time'] = \
@@ -627,8 +625,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP startup query interval: 33 secs, configured value: 31 secs
-            p10 = re.compile(r'^IGMP +startup +query +interval: +(?P<intvl>\d+) +secs, +'
-                             r'configured +value: +(?P<conf_intvl>\d+) +secs$')
+            p10 = regex_engine.compile(r'^IGMP +startup +query +interval: +(?P<intvl>\d+) +secs, +'
+                                       r'configured +value: +(?P<conf_intvl>\d+) +secs$')
             m = p10.match(line)
             if m:
                 if 'startup_query' not in ret_dict['vrfs'][vrf]['interface'][intf]:
@@ -640,7 +638,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP startup query count: 5
-            p11 = re.compile(r'^IGMP +startup +query +count: +(?P<count>\d+)$')
+            p11 = regex_engine.compile(r'^IGMP +startup +query +count: +(?P<count>\d+)$')
             m = p11.match(line)
             if m:
                 if 'startup_query' not in ret_dict['vrfs'][vrf]['interface'][intf]:
@@ -650,7 +648,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP last member mrt: 1 secs
-            p12 = re.compile(r'^IGMP +last +member +mrt: +(?P<mrt>\d+) +secs$')
+            p12 = regex_engine.compile(r'^IGMP +last +member +mrt: +(?P<mrt>\d+) +secs$')
             m = p12.match(line)
             if m:
                 if 'last_member' not in ret_dict['vrfs'][vrf]['interface'][intf]:
@@ -660,7 +658,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP last member query count: 5
-            p13 = re.compile(r'^IGMP +last +member +query +count: +(?P<count>\d+)$')
+            p13 = regex_engine.compile(r'^IGMP +last +member +query +count: +(?P<count>\d+)$')
             m = p13.match(line)
             if m:
                 if 'last_member' not in ret_dict['vrfs'][vrf]['interface'][intf]:
@@ -670,8 +668,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP group timeout: 680 secs, configured value: 260 secs
-            p14 = re.compile(r'^IGMP +group +timeout: +(?P<timeout>\d+) +secs, +'
-                             r'configured +value: +(?P<conf_timeout>\d+) +secs$')
+            p14 = regex_engine.compile(r'^IGMP +group +timeout: +(?P<timeout>\d+) +secs, +'
+                                       r'configured +value: +(?P<conf_timeout>\d+) +secs$')
             m = p14.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['group_timeout'] = \
@@ -681,8 +679,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP querier timeout: 672 secs, configured value: 255 secs
-            p15 = re.compile(r'^IGMP +querier +timeout: +(?P<timeout>\d+) +secs, +'
-                             r'configured +value: +(?P<conf_timeout>\d+) +secs$')
+            p15 = regex_engine.compile(r'^IGMP +querier +timeout: +(?P<timeout>\d+) +secs, +'
+                                       r'configured +value: +(?P<conf_timeout>\d+) +secs$')
             m = p15.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['querier_timeout'] = \
@@ -692,7 +690,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP unsolicited report interval: 10 secs
-            p16 = re.compile(r'^IGMP +unsolicited +report +interval: +(?P<val>\d+) +secs$')
+            p16 = regex_engine.compile(r'^IGMP +unsolicited +report +interval: +(?P<val>\d+) +secs$')
             m = p16.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['unsolicited_report_interval'] = \
@@ -700,8 +698,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP robustness variable: 5, configured value: 5
-            p17 = re.compile(r'^IGMP +robustness +variable: +(?P<val1>\d+), +'
-                             r'configured +value: +(?P<val2>\d+)$')
+            p17 = regex_engine.compile(r'^IGMP +robustness +variable: +(?P<val1>\d+), +'
+                                       r'configured +value: +(?P<val2>\d+)$')
             m = p17.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['robustness_variable'] = \
@@ -711,7 +709,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP reporting for link-local groups: disabled
-            p18 = re.compile(r'^IGMP +reporting +for +link\-local +groups: +(?P<status>\w+)$')
+            p18 = regex_engine.compile(r'^IGMP +reporting +for +link\-local +groups: +(?P<status>\w+)$')
             m = p18.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['link_local_groups_reporting'] = True \
@@ -719,7 +717,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP interface enable refcount: 9
-            p19 = re.compile(r'^IGMP +interface +enable +refcount: +(?P<count>\d+)$')
+            p19 = regex_engine.compile(r'^IGMP +interface +enable +refcount: +(?P<count>\d+)$')
             m = p19.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['enable_refcount'] = \
@@ -727,7 +725,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP interface immediate leave: enabled
-            p20 = re.compile(r'^IGMP +interface +immediate +leave: +(?P<status>\w+)$')
+            p20 = regex_engine.compile(r'^IGMP +interface +immediate +leave: +(?P<status>\w+)$')
             m = p20.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['immediate_leave'] = True \
@@ -735,7 +733,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP VRF name default (id 1)
-            p21 = re.compile(r'^IGMP +VRF +name +(?P<vrf>\S+) +\(id +(?P<id>\d+)\)$')
+            p21 = regex_engine.compile(r'^IGMP +VRF +name +(?P<vrf>\S+) +\(id +(?P<id>\d+)\)$')
             m = p21.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['vrf_name'] = m.groupdict()['vrf']
@@ -743,7 +741,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP Report Policy: access-group-filter
-            p22 = re.compile(r'^IGMP +Report +Policy: +(?P<policy>\S+)$')
+            p22 = regex_engine.compile(r'^IGMP +Report +Policy: +(?P<policy>\S+)$')
             m = p22.match(line)
             if m:
                 if m.groupdict()['policy'] != 'None':
@@ -752,8 +750,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP State Limit: 10,  Available States: 10
-            p23 = re.compile(r'^IGMP +State +Limit: +(?P<max_groups>\d+), +'
-                              r'Available +States: +(?P<available_groups>\d+)$')
+            p23 = regex_engine.compile(r'^IGMP +State +Limit: +(?P<max_groups>\d+), +'
+                                        r'Available +States: +(?P<available_groups>\d+)$')
             m = p23.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['max_groups'] = \
@@ -764,7 +762,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # IGMP interface statistics: (only non-zero values displayed)
-            p24 = re.compile(r'^IGMP +interface +statistics: +(?P<dummy>[\w\-\s\(\)]+)$')
+            p24 = regex_engine.compile(r'^IGMP +interface +statistics: +(?P<dummy>[\w\-\s\(\)]+)$')
             m = p24.match(line)
             if m:
                 if 'statistics' not in ret_dict['vrfs'][vrf]['interface'][intf]:
@@ -773,9 +771,9 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
 
             # General (sent/received):
             #   v2-queries: 5/5, v2-reports: 0/0, v2-leaves: 0/0
-            p25 = re.compile(r'^v2\-queries: +(?P<sent1>\d+)\/(?P<received1>\d+), +'
-                              r'v2\-reports: +(?P<sent2>\d+)\/(?P<received2>\d+), +'
-                              r'v2\-leaves: +(?P<sent3>\d+)\/(?P<received3>\d+)$')
+            p25 = regex_engine.compile(r'^v2\-queries: +(?P<sent1>\d+)\/(?P<received1>\d+), +'
+                                        r'v2\-reports: +(?P<sent2>\d+)\/(?P<received2>\d+), +'
+                                        r'v2\-leaves: +(?P<sent3>\d+)\/(?P<received3>\d+)$')
             m = p25.match(line)
             if m:
                 if 'general' not in ret_dict['vrfs'][vrf]['interface'][intf]['statistics']:
@@ -802,8 +800,8 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             #   v3-queries: 11/11, v3-reports: 56/56
-            p25_1 = re.compile(r'^v3\-queries: +(?P<sent1>\d+)\/(?P<received1>\d+), +'
-                                r'v3\-reports: +(?P<sent2>\d+)\/(?P<received2>\d+)$')
+            p25_1 = regex_engine.compile(r'^v3\-queries: +(?P<sent1>\d+)\/(?P<received1>\d+), +'
+                                          r'v3\-reports: +(?P<sent2>\d+)\/(?P<received2>\d+)$')
             m = p25_1.match(line)
             if m:
                 if 'general' not in ret_dict['vrfs'][vrf]['interface'][intf]['statistics']:
@@ -826,7 +824,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
 
             # Errors:
             #   Packets dropped due to router-alert check: 19
-            p26 = re.compile(r'^Packets +dropped +due +to +router\-alert +check: +(?P<count>\d+)$')
+            p26 = regex_engine.compile(r'^Packets +dropped +due +to +router\-alert +check: +(?P<count>\d+)$')
             m = p26.match(line)
             if m:
                 if 'errors' not in ret_dict['vrfs'][vrf]['interface'][intf]['statistics']:
@@ -837,7 +835,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
 
             # Interface PIM DR: Yes
-            p27 = re.compile(r'^Interface +PIM +DR: +(?P<status>\w+)$')
+            p27 = regex_engine.compile(r'^Interface +PIM +DR: +(?P<status>\w+)$')
             m = p27.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['pim_dr'] = True \
@@ -845,7 +843,7 @@ class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
                 continue
                 
             # Interface vPC SVI: No
-            p28 = re.compile(r'^Interface +vPC +SVI: +(?P<status>\w+)$')
+            p28 = regex_engine.compile(r'^Interface +vPC +SVI: +(?P<status>\w+)$')
             m = p28.match(line)
             if m:
                 ret_dict['vrfs'][vrf]['interface'][intf]['vpc_svi'] = True \
@@ -928,8 +926,8 @@ class ShowIpIgmpGroups(ShowIpIgmpGroupsSchema):
             line = line.rstrip()
 
             # IGMP Connected Group Membership for VRF "default" - 4 total entries
-            p1 = re.compile(r'^IGMP +Connected +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"'
-                             r' +\- +(?P<entries>\d+) +total +entries$')
+            p1 = regex_engine.compile(r'^IGMP +Connected +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"'
+                                       r' +\- +(?P<entries>\d+) +total +entries$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -943,7 +941,7 @@ class ShowIpIgmpGroups(ShowIpIgmpGroupsSchema):
                 continue
 
             # 239.7.7.7
-            p2 = re.compile(r'^(?P<whitespace>\s*)?(?P<group>[\w\.\:]+)$')
+            p2 = regex_engine.compile(r'^(?P<whitespace>\s*)?(?P<group>[\w\.\:]+)$')
             m = p2.match(line)
             if m:
                 group = m.groupdict()['group']
@@ -953,9 +951,9 @@ class ShowIpIgmpGroups(ShowIpIgmpGroupsSchema):
 
             # 239.5.5.5          S    Ethernet2/1         00:21:00  never     10.1.2.1
             # 234.1.1.2          L   loopback11             00:00:20  never     10.100.5.5
-            p3 = re.compile(r'^(?P<whitespace>\s*)?(?P<group>[\w\.\:]+) +(?P<type>[SDLTH\*]+) +(?P<intf>[\w\.\/\-]+)'
-                             r' +(?P<uptime>[\w\.\:]+) +(?P<expires>[\w\.\:]+)'
-                             r' +(?P<last_reporter>[\w\.\:]+)$')
+            p3 = regex_engine.compile(r'^(?P<whitespace>\s*)?(?P<group>[\w\.\:]+) +(?P<type>[SDLTH\*]+) +(?P<intf>[\w\.\/\-]+)'
+                                       r' +(?P<uptime>[\w\.\:]+) +(?P<expires>[\w\.\:]+)'
+                                       r' +(?P<last_reporter>[\w\.\:]+)$')
             m = p3.match(line)
             if m:
                 no_of_whitespace = m.groupdict()['whitespace'].count(' ')
@@ -1076,7 +1074,7 @@ class ShowIpIgmpLocalGroups(ShowIpIgmpLocalGroupsSchema):
             line = line.strip()
 
             # IGMP Locally Joined Group Membership for VRF "default"
-            p1 = re.compile(r'^IGMP +Locally +Joined +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"$')
+            p1 = regex_engine.compile(r'^IGMP +Locally +Joined +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -1089,9 +1087,9 @@ class ShowIpIgmpLocalGroups(ShowIpIgmpLocalGroupsSchema):
 
             # 239.1.1.1        *                Local    Eth2/4      00:00:50
             # 239.7.7.7        10.16.2.1          Static   Eth2/4      01:06:47
-            p2 = re.compile(r'^(?P<group>[\w\.\:]+) +(?P<source>[\w\.\:\*]+) +'
-                             r'(?P<type>\w+) +(?P<intf>[\w\.\/\-]+)'
-                             r' +(?P<last_reporter>[\w\.\:]+)$')
+            p2 = regex_engine.compile(r'^(?P<group>[\w\.\:]+) +(?P<source>[\w\.\:\*]+) +'
+                                       r'(?P<type>\w+) +(?P<intf>[\w\.\/\-]+)'
+                                       r' +(?P<last_reporter>[\w\.\:]+)$')
             m = p2.match(line)
             if m:
                 intf = Common.convert_intf_name(m.groupdict()['intf'])
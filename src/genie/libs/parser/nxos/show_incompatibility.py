@@ -3,9 +3,11 @@ NXOS parser for the following show commands:
 * 'Schema for show incompatibility nxos {image}'
 """
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 class ShowIncompatibilityNxosSchema(MetaParser):
@@ -46,19 +48,19 @@ class ShowIncompatibilityNxos(ShowIncompatibilityNxosSchema):
         # Checking dynamic incompatibilities:
         # -----------------------------------
         # No incompatible configurations
-        p1 = re.compile(r'^(?P<status>No incompatible configurations)$')
+        p1 = regex_engine.compile(r'^(?P<status>No incompatible configurations)$')
 
         # 1) Service : otm , Capability : CAP_FEATURE_OTM_TRACK_DELAY_MS_CONFIGURED
-        p2 = re.compile(r'^(?P<number>[\d]+)\)\s+Service : (?P<service>[\w]+)\s+,\s+Capability : (?P<capability>[\w]+)$')
+        p2 = regex_engine.compile(r'^(?P<number>[\d]+)\)\s+Service : (?P<service>[\w]+)\s+,\s+Capability : (?P<capability>[\w]+)$')
 
         # Description : Objects with track delay in millliseconds detected
-        p3 = re.compile(r'^Description : (?P<desc>(.*))$')
+        p3 = regex_engine.compile(r'^Description : (?P<desc>(.*))$')
 
         # Capability requirement : STRICT
-        p4 = re.compile(r'^Capability requirement : (?P<req>[\w]+)$')
+        p4 = regex_engine.compile(r'^Capability requirement : (?P<req>[\w]+)$')
 
         # Enable/Disable command : Please remove track delay in milliseconds from all objects
-        p5 = re.compile(r'^Enable\/Disable command : (?P<enable_cmd>(.*))$')
+        p5 = regex_engine.compile(r'^Enable\/Disable command : (?P<enable_cmd>(.*))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3,9 +3,11 @@ NXOS parsers for the following show commands:
 * 'show install all status'
 """
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # ===================================
@@ -71,57 +73,57 @@ class ShowInstallAllStatus(ShowInstallAllStatusSchema):
         parsed_dict = {}
 
         #  -- SUCCESS <Tue Sep 28 02:57:04>
-        p0 = re.compile(r'^\s*--\s* (?P<status>[\s\w]+).*$')
+        p0 = regex_engine.compile(r'^\s*--\s* (?P<status>[\s\w]+).*$')
 
         # Verifying image bootflash:/nxos.9.3.7.bin for boot variable "nxos".
-        p1 = re.compile(r'^Verifying image bootflash.*$')
+        p1 = regex_engine.compile(r'^Verifying image bootflash.*$')
 
         # Verifying image type.
-        p2 = re.compile(r'^Verifying image type.$')
+        p2 = regex_engine.compile(r'^Verifying image type.$')
 
         # Preparing "nxos" version info using image bootflash:/nxos.9.3.7.bin.
-        p3 = re.compile(r'^Preparing "nxos" version info using image (?P<image>[^\n]*).*$')
+        p3 = regex_engine.compile(r'^Preparing "nxos" version info using image (?P<image>[^\n]*).*$')
 
         # Preparing "bios" version info using image bootflash:/nxos.9.3.7.bin.
-        p4 = re.compile(r'^Preparing "bios" version info using image.*$')
+        p4 = regex_engine.compile(r'^Preparing "bios" version info using image.*$')
 
         #  Performing module support checks.
-        p5 = re.compile(r'^Performing module support checks.*$')
+        p5 = regex_engine.compile(r'^Performing module support checks.*$')
 
         #  Notifying services about system upgrade.
-        p6 = re.compile(r'^Notifying services about system upgrade.*$')
+        p6 = regex_engine.compile(r'^Notifying services about system upgrade.*$')
 
         # Performing runtime checks.
-        p7 = re.compile(r'^Performing runtime checks.*$')
+        p7 = regex_engine.compile(r'^Performing runtime checks.*$')
 
         #  Setting boot variables.
-        p8 = re.compile(r'^Setting boot variables.*$')
+        p8 = regex_engine.compile(r'^Setting boot variables.*$')
 
         #  Performing configuration copy.
-        p9 = re.compile(r'^Performing configuration copy.*$')
+        p9 = regex_engine.compile(r'^Performing configuration copy.*$')
 
         #  Refreshing compact flash and upgrading bios/loader/bootrom.
-        p10 = re.compile(r'^Refreshing compact flash and upgrading bios.*$')
+        p10 = regex_engine.compile(r'^Refreshing compact flash and upgrading bios.*$')
 
         # Module  bootable          Impact  Install-type  Reason
         # ------  --------  --------------  ------------  ------
         #      1       yes      disruptive          none  default upgrade is not hitless
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^(?P<module>\d+)\s+(?P<bootable>[\w]+)\s+(?P<impact>[\w]+)\s+(?P<type>[\w-]+)\s+(?P<reason>[\w \-]+)')
 
         # Module       Image                  Running-Version(pri:alt)           New-Version  Upg-Required
         # ------  ----------  ----------------------------------------  --------------------  ------------
         # 1        nxos                                    9.3(7)                9.3(7)            no
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^(?P<module>\d+)\s+(?P<image>\w+)\s+(?P<run_version>[\w.\(\/\):]+)\s+(?P<new_version>[\w.\('
             r'\/\):]+)\s+(?P<upg_req>\w+)')
 
         # Return code 0x437F0001 ((null)).
         # pre-upgrade check failed. Return code 0x437F0001 ((null))
-        p13 = re.compile(r'^(?P<preup_fail>Return code [\w\s\(\)]+)')
+        p13 = regex_engine.compile(r'^(?P<preup_fail>Return code [\w\s\(\)]+)')
 
         # Service "__inst_001__eigrp" in vdc 1: EIGRP  ISSU config check failed, ISSU may cause traffic disruption
-        p14 = re.compile(r'^Service (?P<addinfo>(.)*)')
+        p14 = regex_engine.compile(r'^Service (?P<addinfo>(.)*)')
 
         out = iter(out.splitlines())
         for line in out:
@@ -52,6 +52,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, ListOf
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.libs.parser.nxos.show_bfd import ShowBfdNeighborDetail as ShowBfdNeighborDetail_nxos
 
@@ -222,6 +223,79 @@ class ShowInterface(ShowInterfaceSchema):
         'in_crc_errors',
         'reliability']
 
+    # '| json' output is parsed with context='json'
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+    # json key: (schema key, type) of the interface level fields
+    json_fields = {
+        'eth_hw_desc': ('types', str),
+        'eth_hw_addr': ('mac_address', str),
+        'eth_bia_addr': ('phys_address', str),
+        'desc': ('description', str),
+        'eth_mtu': ('mtu', int),
+        'eth_bw': ('bandwidth', int),
+        'eth_dly': ('delay', int),
+        'medium': ('medium', str),
+        'eth_mode': ('port_mode', str),
+        'eth_media': ('media_type', str),
+        'eth_beacon': ('beacon', str),
+        'eth_mdix': ('auto_mdix', str),
+        'eth_swt_monitor': ('switchport_monitor', str),
+        'eth_ethertype': ('ethertype', str),
+        'eth_eee_state': ('efficient_ethernet', str),
+        'eth_link_flapped': ('last_link_flapped', str),
+        'eth_clear_counters': ('last_clear_counters', str),
+        'eth_reset_cntr': ('interface_reset', int),
+        'svi_hw_desc': ('types', str),
+        'svi_mac': ('mac_address', str),
+        'svi_mtu': ('mtu', int),
+        'svi_bw': ('bandwidth', int),
+        'svi_delay': ('delay', int),
+        'svi_clear_counters': ('last_clear_counters', str),
+    }
+
+    # json key: schema key of the counters
+    json_counters = {
+        'eth_inucast': 'in_unicast_pkts',
+        'eth_inmcast': 'in_multicast_pkts',
+        'eth_inbcast': 'in_broadcast_pkts',
+        'eth_inpkts': 'in_pkts',
+        'eth_inbytes': 'in_octets',
+        'eth_jumbo_inpkts': 'in_jumbo_packets',
+        'eth_storm_supp': 'in_storm_suppression_packets',
+        'eth_runts': 'in_runts',
+        'eth_giants': 'in_oversize_frame',
+        'eth_crc': 'in_crc_errors',
+        'eth_nobuf': 'in_no_buffer',
+        'eth_inerr': 'in_errors',
+        'eth_frame': 'in_short_frame',
+        'eth_overrun': 'in_overrun',
+        'eth_underrun': 'in_underrun',
+        'eth_ignored': 'in_ignored',
+        'eth_watchdog': 'in_watchdog',
+        'eth_bad_eth': 'in_bad_etype_drop',
+        'eth_bad_proto': 'in_unknown_protos',
+        'eth_in_ifdown_drops': 'in_if_down_drop',
+        'eth_dribble': 'in_with_dribble',
+        'eth_indiscard': 'in_discard',
+        'eth_inpause': 'in_mac_pause_frames',
+        'eth_outucast': 'out_unicast_pkts',
+        'eth_outmcast': 'out_multicast_pkts',
+        'eth_outbcast': 'out_broadcast_pkts',
+        'eth_outpkts': 'out_pkts',
+        'eth_outbytes': 'out_octets',
+        'eth_jumbo_outpkts': 'out_jumbo_packets',
+        'eth_outerr': 'out_errors',
+        'eth_coll': 'out_collision',
+        'eth_deferred': 'out_deferred',
+        'eth_latecoll': 'out_late_collision',
+        'eth_lostcarrier': 'out_lost_carrier',
+        'eth_nocarrier': 'out_no_carrier',
+        'eth_babbles': 'out_babble',
+        'eth_outdiscard': 'out_discard',
+        'eth_outpause': 'out_mac_pause_frames',
+    }
+
     def cli(self, interface='', include='', output=None):
         if output is None:
             if interface and include:
@@ -250,269 +324,269 @@ class ShowInterface(ShowInterfaceSchema):
         # Ethernet1/13 is down (SFP validation failed)
         # Ethernet1/13 is down (Channel admin down)
         # Ethernet140/1/26 is down (linkFlapErrDisabled, port: error)
-        p1 = re.compile(r'^(?P<interface>\S+)\s*is\s*'
-                        r'(?P<link_state>(down|up|'
-                        r'inactive|Transceiver +validation +failed|'
-                        r'SFP +validation +failed|Channel +admin +down))?'
-                        r'(administratively\s+(?P<admin_1>(down)))?\s*'
-                        r'(\(Administratively\s*(?P<admin_2>(down))\))?'
-                        r'(\(VLAN\/BD\s+((is\s+(down|up))|does\s+not\s+exist)\))?'
-                        r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
-                        r'(,\s+autostate\s+(?P<autostate>\S+))?'
-                        r'(\(No\s+operational\s+members\))?'
-                        r'(\(Transceiver\s+validation\s+failed\))?'
-                        r'(\(Channel\s+admin\s+down\))?'
-                        r'(\(Link\s+not\s+connected\))?'
-                        r'(\(SFP\s+validation\s+failed\))?'
-                        r'(\(SFP\s+not\s+inserted\))?'
-                        r'(\(SFP\s+checksum\s+error\))?'
-                        r'(\(suspended\(.*\)\))?'
-                        r'(\(\S+ErrDisabled\))?'
-                        r'(\(XCVR\s+not\s+inserted\))?'
-                        r'(\(No\s+operational\s+members\))?'
-                        r'(\(.*ACK.*\))?'
-                        r'(\(inactive\))?'
-                        r'(\(Hardware\s+failure\))?'
-                        r'(\(linkFlapErrDisabled, +port: +error\))?$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+)\s*is\s*'
+                                  r'(?P<link_state>(down|up|'
+                                  r'inactive|Transceiver +validation +failed|'
+                                  r'SFP +validation +failed|Channel +admin +down))?'
+                                  r'(administratively\s+(?P<admin_1>(down)))?\s*'
+                                  r'(\(Administratively\s*(?P<admin_2>(down))\))?'
+                                  r'(\(VLAN\/BD\s+((is\s+(down|up))|does\s+not\s+exist)\))?'
+                                  r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
+                                  r'(,\s+autostate\s+(?P<autostate>\S+))?'
+                                  r'(\(No\s+operational\s+members\))?'
+                                  r'(\(Transceiver\s+validation\s+failed\))?'
+                                  r'(\(Channel\s+admin\s+down\))?'
+                                  r'(\(Link\s+not\s+connected\))?'
+                                  r'(\(SFP\s+validation\s+failed\))?'
+                                  r'(\(SFP\s+not\s+inserted\))?'
+                                  r'(\(SFP\s+checksum\s+error\))?'
+                                  r'(\(suspended\(.*\)\))?'
+                                  r'(\(\S+ErrDisabled\))?'
+                                  r'(\(XCVR\s+not\s+inserted\))?'
+                                  r'(\(No\s+operational\s+members\))?'
+                                  r'(\(.*ACK.*\))?'
+                                  r'(\(inactive\))?'
+                                  r'(\(Hardware\s+failure\))?'
+                                  r'(\(linkFlapErrDisabled, +port: +error\))?$')
 
         # admin state is up
         # admin state is up,
         # admin state is up, Dedicated Interface
         # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-        p2 = re.compile(r'^admin +state +is'
-                        r' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
-                        r'(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
-                        r'(?:, +\[parent +interface +is'
-                        r' +(?P<parent_intf>(\S+))\])?$')
+        p2 = regex_engine.compile(r'^admin +state +is'
+                                  r' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
+                                  r'(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
+                                  r'(?:, +\[parent +interface +is'
+                                  r' +(?P<parent_intf>(\S+))\])?$')
 
         # Dedicated Interface
-        p2_1 = re.compile(r'^Dedicated Interface$')
+        p2_1 = regex_engine.compile(r'^Dedicated Interface$')
 
         # Belongs to Po1
-        p2_2 = re.compile(r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$')
+        p2_2 = regex_engine.compile(r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$')
 
         # Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
-        p3 = re.compile(r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
-                        r' *address: *(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$')
+        p3 = regex_engine.compile(r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
+                                  r' *address: *(?P<mac_address>[a-z0-9\.]+)'
+                                  r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$')
 
 
         # Hardware is EtherSVI, address is  547f.ee6d.7d7c
-        p3_1 = re.compile(r'^Hardware is  *(?P<types>[a-zA-Z0-9\/\s]+), '
-                          r'address is *(?P<mac_address>[a-z0-9\.]+)$')
+        p3_1 = regex_engine.compile(r'^Hardware is  *(?P<types>[a-zA-Z0-9\/\s]+), '
+                                    r'address is *(?P<mac_address>[a-z0-9\.]+)$')
 
         # Description: desc
-        p4 = re.compile(r'^Description:\s*(?P<description>.*)$')
+        p4 = regex_engine.compile(r'^Description:\s*(?P<description>.*)$')
 
         # Description: VLAN information Internet Address is 10.10.10.1/24
-        p4_1 = re.compile(r'^Description:\s*(?P<description>.*)'
-                          r'\s+Internet\s+Address\s+is\s+(?P<ip>[0-9\.]+)'
-                          r'\/(?P<prefix_length>[0-9]+)$')
+        p4_1 = regex_engine.compile(r'^Description:\s*(?P<description>.*)'
+                                    r'\s+Internet\s+Address\s+is\s+(?P<ip>[0-9\.]+)'
+                                    r'\/(?P<prefix_length>[0-9]+)$')
 
         # Internet Address is 10.4.4.4/24 secondary tag 10
-        p5 = re.compile(r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+)'
-                        r'(?: *(?P<secondary>(secondary)))?(?: *tag'
-                        r' *(?P<route_tag>[0-9]+))?$')
+        p5 = regex_engine.compile(r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
+                                  r'\/(?P<prefix_length>[0-9]+)'
+                                  r'(?: *(?P<secondary>(secondary)))?(?: *tag'
+                                  r' *(?P<route_tag>[0-9]+))?$')
 
         # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
         # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
         # MTU 1500 bytes, BW 1000000 Kbit
         # MTU 600 bytes, BW 10000000 Kbit , DLY 10 usec
-        p6 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                        r' *(?P<bandwidth>[0-9]+) *Kbit( *, *DLY'
-                        r' *(?P<delay>[0-9]+) *usec)?,?$')
+        p6 = regex_engine.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+                                  r' *(?P<bandwidth>[0-9]+) *Kbit( *, *DLY'
+                                  r' *(?P<delay>[0-9]+) *usec)?,?$')
 
         # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-        p6_1 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                          r' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
-                          r' *([0-9]+) *Kbit, *DLY'
-                          r' *(?P<delay>[0-9]+) *usec$')
+        p6_1 = regex_engine.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+                                    r' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
+                                    r' *([0-9]+) *Kbit, *DLY'
+                                    r' *(?P<delay>[0-9]+) *usec$')
 
         # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability *(?P<reliability>[0-9\/]+),'
-                        r' *txload *(?P<txload>[0-9\/]+),'
-                        r' *rxload *(?P<rxload>[0-9\/]+)$')
+        p7 = regex_engine.compile(r'^reliability *(?P<reliability>[0-9\/]+),'
+                                  r' *txload *(?P<txload>[0-9\/]+),'
+                                  r' *rxload *(?P<rxload>[0-9\/]+)$')
 
         # Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
         # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
         # Encapsulation ARPA, medium is broadcast
-        p8 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                        r' *medium *is *(?P<medium>[a-zA-Z]+)$')
+        p8 = regex_engine.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                                  r' *medium *is *(?P<medium>[a-zA-Z]+)$')
 
-        p8_1 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                          r' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
-                          r' *medium *is *(?P<medium>[a-z0-9]+)$')
+        p8_1 = regex_engine.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                                    r' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
+                                    r' *medium *is *(?P<medium>[a-z0-9]+)$')
 
         # Encapsulation ARPA, loopback not set
-        p8_2 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                          r' *([\w\s]+)$')
+        p8_2 = regex_engine.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                                    r' *([\w\s]+)$')
 
         # Port mode is routed
-        p9 = re.compile(r'^Port *mode *is *(?P<port_mode>[a-z]+)$')
+        p9 = regex_engine.compile(r'^Port *mode *is *(?P<port_mode>[a-z]+)$')
 
         # auto-duplex, auto-speed
-        p10_1 = re.compile(r'^auto-duplex, +auto-speed$')
+        p10_1 = regex_engine.compile(r'^auto-duplex, +auto-speed$')
 
         # full-duplex, 1000 Mb/s
         # auto-duplex, auto-speed
         # full-duplex, 1000 Mb/s, media type is 1G
         # auto-duplex, auto-speed, media type is 10G
-        p10 = re.compile(r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+) *'
-                         r'(?P<unit>[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$')
+        p10 = regex_engine.compile(r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+) *'
+                                   r'(?P<unit>[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$')
 
         # Beacon is turned off
-        p11 = re.compile(r'^Beacon *is *turned *(?P<beacon>[a-z]+)$')
+        p11 = regex_engine.compile(r'^Beacon *is *turned *(?P<beacon>[a-z]+)$')
 
         # Auto-Negotiation is turned off
         # Auto-Negotiation is turned off  FEC mode is Auto
         # Auto-Negotiation is turned on
         # Auto-Negotiation is turned on  FEC mode is Auto
-        p12 = re.compile(r'^Auto-Negotiation is turned (?P<auto_negotiate>(off|on))'
-                         r'(?: *FEC mode is (?P<fec_mode>(Auto)))?$')
+        p12 = regex_engine.compile(r'^Auto-Negotiation is turned (?P<auto_negotiate>(off|on))'
+                                   r'(?: *FEC mode is (?P<fec_mode>(Auto)))?$')
 
         # Input flow-control is off, output flow-control is off
         # Input flow-control is off, output flow-control is on
-        p13 = re.compile(r'^Input *flow-control *is *(?P<receive>(off|on)+),'
-                         r' *output *flow-control *is *(?P<send>(off|on)+)$')
+        p13 = regex_engine.compile(r'^Input *flow-control *is *(?P<receive>(off|on)+),'
+                                   r' *output *flow-control *is *(?P<send>(off|on)+)$')
 
         # Auto-mdix is turned off
-        p14 = re.compile(r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$')
+        p14 = regex_engine.compile(r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$')
 
         # Switchport monitor is off
-        p15 = re.compile(r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$')
+        p15 = regex_engine.compile(r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$')
 
         # EtherType is 0x8100
-        p16 = re.compile(r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$')
+        p16 = regex_engine.compile(r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$')
 
         # Members in this channel: Eth1/15, Eth1/16
         # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
+        p38 = regex_engine.compile(r'^Members +in +this +channel *: *'
+                                   r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
 
         # EEE (efficient-ethernet) : n/a
-        p17 = re.compile(r'^EEE *\(efficient-ethernet\) *:'
-                         r' *(?P<efficient_ethernet>[A-Za-z\/]+)$')
+        p17 = regex_engine.compile(r'^EEE *\(efficient-ethernet\) *:'
+                                   r' *(?P<efficient_ethernet>[A-Za-z\/]+)$')
 
         # Last link flapped 00:07:28
         # Last link flapped 15week(s) 5day(s)
-        p18 = re.compile(r'^Last *link *flapped'
-                         r' *(?P<last_link_flapped>[\S ]+)$')
+        p18 = regex_engine.compile(r'^Last *link *flapped'
+                                   r' *(?P<last_link_flapped>[\S ]+)$')
 
         # Last clearing of "show interface" counters never
         # Last clearing of "show interface" counters 00:15:42
         # Last clearing of "show interface" counters 69w4d
-        p19 = re.compile(r'^Last +clearing +of +\"show interface\" '
-                         r'+counters +(?P<last_clear_counters>[a-z0-9\:]+)$')
+        p19 = regex_engine.compile(r'^Last +clearing +of +\"show interface\" '
+                                   r'+counters +(?P<last_clear_counters>[a-z0-9\:]+)$')
 
         # 1 interface resets
-        p20 = re.compile(r'^(?P<interface_reset>[0-9]+) *interface'
-                         r' *resets$')
+        p20 = regex_engine.compile(r'^(?P<interface_reset>[0-9]+) *interface'
+                                   r' *resets$')
 
         # 1 minute input rate 0 bits/sec, 0 packets/sec
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *input *rate'
-                         r' *(?P<in_rate>[0-9]+) *bits/sec,'
-                         r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
+        p21 = regex_engine.compile(r'^(?P<load_interval>[0-9\#]+)'
+                                   r' *(minute|second|minutes|seconds) *input *rate'
+                                   r' *(?P<in_rate>[0-9]+) *bits/sec,'
+                                   r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
 
         # 1 minute output rate 24 bits/sec, 0 packets/sec
-        p22 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *output'
-                         r' *rate *(?P<out_rate>[0-9]+)'
-                         r' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
-                         r' *packets/sec$')
+        p22 = regex_engine.compile(r'^(?P<load_interval>[0-9\#]+)'
+                                   r' *(minute|second|minutes|seconds) *output'
+                                   r' *rate *(?P<out_rate>[0-9]+)'
+                                   r' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
+                                   r' *packets/sec$')
 
         # input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-        p23 = re.compile(r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
-                         r' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
-                         r' *(?P<out_rate_bps>[0-9]+) *bps,'
-                         r' *(?P<out_rate_pps>[0-9]+) *pps$')
+        p23 = regex_engine.compile(r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
+                                   r' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
+                                   r' *(?P<out_rate_bps>[0-9]+) *bps,'
+                                   r' *(?P<out_rate_pps>[0-9]+) *pps$')
 
         # RX
         # Rx
-        p23_1 = re.compile(r'^(?P<rx>(RX|Rx))$')
+        p23_1 = regex_engine.compile(r'^(?P<rx>(RX|Rx))$')
 
         # 0 unicast packets  0 multicast packets  0 broadcast packets
-        p24 = re.compile(r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
-                         r' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
-                         r' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$')
+        p24 = regex_engine.compile(r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
+                                   r' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
+                                   r' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$')
 
         # 0 input packets  0 bytes
         # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-        p25 = re.compile(r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
-                         r'+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
-                         r'+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$')
+        p25 = regex_engine.compile(r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
+                                   r'+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
+                                   r'+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$')
 
         # 0 jumbo packets  0 storm suppression packets
         # 1 jumbo packets  0 storm suppression bytes
-        p26 = re.compile(r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets '
-                         r'+(?P<in_storm_suppression>[0-9]+) +storm +suppression +(?P<type>(packets|bytes))$')
+        p26 = regex_engine.compile(r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets '
+                                   r'+(?P<in_storm_suppression>[0-9]+) +storm +suppression +(?P<type>(packets|bytes))$')
 
         # 0 runts  0 giants  0 CRC/FCS  0 no buffer
         # 0 runts  0 giants  0 CRC  0 no buffer
-        p27 = re.compile(r'^(?P<in_runts>[0-9]+) *runts'
-                         r' *(?P<in_oversize_frame>[0-9]+) *giants'
-                         r' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
-                         r' *(?P<in_no_buffer>[0-9]+) *no *buffer$')
+        p27 = regex_engine.compile(r'^(?P<in_runts>[0-9]+) *runts'
+                                   r' *(?P<in_oversize_frame>[0-9]+) *giants'
+                                   r' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
+                                   r' *(?P<in_no_buffer>[0-9]+) *no *buffer$')
 
         # 0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-        p28 = re.compile(r'^(?P<in_errors>[0-9]+) *input *error'
-                         r' *(?P<in_short_frame>[0-9]+) *short *frame'
-                         r' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
-                         r' *underrun *(?P<in_ignored>[0-9]+) *ignored$')
+        p28 = regex_engine.compile(r'^(?P<in_errors>[0-9]+) *input *error'
+                                   r' *(?P<in_short_frame>[0-9]+) *short *frame'
+                                   r' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
+                                   r' *underrun *(?P<in_ignored>[0-9]+) *ignored$')
 
         # 0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-        p29 = re.compile(r'^(?P<in_watchdog>[0-9]+) *watchdog'
-                         r' *(?P<in_bad_etype_drop>[0-9]+)'
-                         r' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
-                         r' *bad *proto'
-                         r' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$')
+        p29 = regex_engine.compile(r'^(?P<in_watchdog>[0-9]+) *watchdog'
+                                   r' *(?P<in_bad_etype_drop>[0-9]+)'
+                                   r' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
+                                   r' *bad *proto'
+                                   r' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$')
 
         # 0 input with dribble  0 input discard
-        p30 = re.compile(r'^(?P<in_with_dribble>[0-9]+) *input *with'
-                         r' *dribble *(?P<in_discard>[0-9]+) *input *discard$')
+        p30 = regex_engine.compile(r'^(?P<in_with_dribble>[0-9]+) *input *with'
+                                   r' *dribble *(?P<in_discard>[0-9]+) *input *discard$')
 
         # 0 Rx pause
-        p31 = re.compile(r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$')
+        p31 = regex_engine.compile(r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$')
 
         # TX
-        p31_1 = re.compile(r'^(?P<tx>(TX|Tx))$')
+        p31_1 = regex_engine.compile(r'^(?P<tx>(TX|Tx))$')
 
         # 0 unicast packets  0 multicast packets  0 broadcast packets
-        p32 = re.compile(r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
-                         r' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
-                         r' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$')
+        p32 = regex_engine.compile(r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
+                                   r' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
+                                   r' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$')
 
         # 0 output packets  0 bytes
-        p33 = re.compile(r'^(?P<out_pkts>[0-9]+) *output *packets'
-                         r' *(?P<out_octets>[0-9]+) *bytes$')
+        p33 = regex_engine.compile(r'^(?P<out_pkts>[0-9]+) *output *packets'
+                                   r' *(?P<out_octets>[0-9]+) *bytes$')
 
         # 0 jumbo packets
-        p34 = re.compile(r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$')
+        p34 = regex_engine.compile(r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$')
 
         # 0 output error  0 collision  0 deferred  0 late collision
-        p35 = re.compile(r'^(?P<out_errors>[0-9]+) *output *error'
-                         r' *(?P<out_collision>[0-9]+) *collision'
-                         r' *(?P<out_deferred>[0-9]+) *deferred'
-                         r' *(?P<out_late_collision>[0-9]+)'
-                         r' *late *collision$')
+        p35 = regex_engine.compile(r'^(?P<out_errors>[0-9]+) *output *error'
+                                   r' *(?P<out_collision>[0-9]+) *collision'
+                                   r' *(?P<out_deferred>[0-9]+) *deferred'
+                                   r' *(?P<out_late_collision>[0-9]+)'
+                                   r' *late *collision$')
 
         # 0 lost carrier  0 no carrier  0 babble  0 output discard
-        p36 = re.compile(r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
-                         r' *(?P<out_no_carrier>[0-9]+) *no *carrier'
-                         r' *(?P<out_babble>[0-9]+) *babble'
-                         r' *(?P<out_discard>[0-9]+) *output *discard$')
+        p36 = regex_engine.compile(r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
+                                   r' *(?P<out_no_carrier>[0-9]+) *no *carrier'
+                                   r' *(?P<out_babble>[0-9]+) *babble'
+                                   r' *(?P<out_discard>[0-9]+) *output *discard$')
 
         # 0 Tx pause
-        p37 = re.compile(r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$')
+        p37 = regex_engine.compile(r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$')
 
         # Members in this channel: Eth1/15, Eth1/16
         # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
+        p38 = regex_engine.compile(r'^Members +in +this +channel *: *'
+                                   r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
 
         # 28910552 broadcast packets 63295517997 bytes
-        p39 = re.compile(r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$')
+        p39 = regex_engine.compile(r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$')
 
         interface_dict = {}
 
@@ -1127,6 +1201,138 @@ class ShowInterface(ShowInterfaceSchema):
 
         return interface_dict
 
+    def json(self, interface='', include='', output=None):
+        if include:
+            # the lines kept by '| include' are not json
+            raise ValueError("context='json' only supports 'show interface "
+                             "[<interface>]', not include={!r}".format(include))
+        if output is None:
+            cmd = 'show interface'
+            if interface:
+                cmd += ' {}'.format(interface)
+            output = self.device.execute(cmd + ' | json')
+
+        interface_dict = {}
+
+        for row in Common.retrieve_json_rows(
+                Common.load_json_output(output), 'TABLE_interface'):
+            intf_dict = interface_dict.setdefault(row['interface'], {})
+            intf_dict['port_channel'] = {'port_channel_member': False}
+
+            # "state": "down", "state_rsn_desc": "Administratively down",
+            # "admin_state": "down"
+            oper_status = row.get('state') or row.get('svi_line_proto')
+            intf_dict['link_state'] = row.get('state', oper_status)
+            intf_dict['oper_status'] = oper_status
+            admin_state = row.get('admin_state') or \
+                row.get('svi_admin_state')
+            intf_dict['enabled'] = admin_state != 'down' and \
+                'Administratively' not in row.get('state_rsn_desc', '')
+            if 'admin_state' in row:
+                intf_dict['admin_state'] = row['admin_state']
+            if 'svi_line_proto' in row:
+                intf_dict['line_protocol'] = row['svi_line_proto']
+            if 'svi_autostate' in row:
+                intf_dict['autostate'] = row['svi_autostate'] == 'enabled'
+            if row.get('share_state') == 'Dedicated':
+                intf_dict['dedicated_interface'] = True
+            if 'parent_interface' in row:
+                intf_dict['parent_interface'] = row['parent_interface']
+
+            for key, (name, cast) in self.json_fields.items():
+                if key in row:
+                    intf_dict[name] = cast(row[key])
+
+            # "eth_reliability": "255", "eth_txload": "1", "eth_rxload": "1"
+            for key in ('reliability', 'txload', 'rxload'):
+                for prefix in ('eth_', 'svi_'):
+                    if prefix + key in row:
+                        intf_dict[key] = '{}/255'.format(row[prefix + key])
+
+            # "eth_duplex": "full", "eth_speed": "1000 Mb/s"
+            # auto-duplex, auto-speed is not reported, same as the cli
+            speed = row.get('eth_speed', '').split()
+            if speed and speed[0] != 'auto-speed':
+                if 'eth_duplex' in row:
+                    intf_dict['duplex_mode'] = row['eth_duplex'].lower()
+                intf_dict['port_speed'] = speed[0]
+                if len(speed) > 1:
+                    intf_dict['port_speed_unit'] = speed[1]
+
+            if 'eth_autoneg' in row:
+                intf_dict['auto_negotiate'] = row['eth_autoneg'] == 'on'
+            if 'eth_in_flowctrl' in row:
+                intf_dict['flow_control'] = {
+                    'receive': row['eth_in_flowctrl'] == 'on',
+                    'send': row.get('eth_out_flowctrl') == 'on'}
+
+            # "eth_encap": "802.1Q Virtual LAN", "eth_vlanid": 10
+            encap = row.get('eth_encap') or row.get('svi_encap')
+            if encap:
+                encap_dict = intf_dict.setdefault('encapsulations', {})
+                encap_dict['encapsulation'] = encap.lower().\
+                    replace('802.1q virtual lan', 'dot1q')
+                if 'eth_vlanid' in row:
+                    encap_dict['first_dot1q'] = str(row['eth_vlanid'])
+
+            # "eth_ip_addr": "10.2.3.2", "eth_ip_mask": 24
+            for ip_key, mask_key in (('eth_ip_addr', 'eth_ip_mask'),
+                                     ('svi_ip_addr', 'svi_ip_mask')):
+                if ip_key in row:
+                    prefix_length = str(row[mask_key])
+                    intf_dict.setdefault('ipv4', {}).setdefault(
+                        row[ip_key] + '/' + prefix_length, {}).update({
+                            'ip': row[ip_key],
+                            'prefix_length': prefix_length})
+
+            # "eth_members": "Eth1/15, Eth1/16"
+            if 'eth_members' in row:
+                intf_dict['port_channel'].update({
+                    'port_channel_member': True,
+                    'port_channel_member_intfs': [
+                        Common.convert_intf_name(item)
+                        for item in row['eth_members'].split(',')]})
+            # "eth_bundle": "1"
+            if 'eth_bundle' in row:
+                intf_dict['port_channel'].update({
+                    'port_channel_member': True,
+                    'port_channel_int': 'Port-channel{}'.format(
+                        row['eth_bundle'])})
+
+            # "eth_load_interval1_rx": 30, "eth_inrate1_bits": "0"
+            if 'eth_load_interval1_rx' in row:
+                # the cli shows minutes from 60 seconds on
+                load_interval = int(row['eth_load_interval1_rx'])
+                if load_interval >= 60 and not load_interval % 60:
+                    load_interval //= 60
+                intf_dict.setdefault('counters', {})['rate'] = {
+                    'load_interval': load_interval,
+                    'in_rate': int(row['eth_inrate1_bits']),
+                    'in_rate_pkts': int(row['eth_inrate1_pkts']),
+                    'out_rate': int(row['eth_outrate1_bits']),
+                    'out_rate_pkts': int(row['eth_outrate1_pkts'])}
+            # "eth_inrate2_bits": "0", "eth_inrate2_pkts": "0"
+            if 'eth_inrate2_bits' in row:
+                intf_dict.setdefault('counters', {}).setdefault(
+                    'rate', {}).update({
+                        'in_rate_bps': int(row['eth_inrate2_bits']),
+                        'in_rate_pps': int(row['eth_inrate2_pkts']),
+                        'out_rate_bps': int(row['eth_outrate2_bits']),
+                        'out_rate_pps': int(row['eth_outrate2_pkts'])})
+
+            counters = {name: int(row[key])
+                        for key, name in self.json_counters.items()
+                        if key in row}
+            if counters:
+                counters_dict = intf_dict.setdefault('counters', {})
+                counters_dict.update(counters)
+                counters_dict['rx'] = True
+                counters_dict['tx'] = True
+                if 'eth_clear_counters' in row:
+                    counters_dict['last_clear'] = row['eth_clear_counters']
+
+        return interface_dict
+
 
 # ===================================
 # Schema for 'show interface vrf all'
@@ -1282,8 +1488,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
         for line in out.splitlines():
             line = line.rstrip()
             # IP Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*IP *Interface *Status *for *VRF'
-                            r' *(?P<vrf>\S+)$')
+            p1 = regex_engine.compile(r'^\s*IP *Interface *Status *for *VRF'
+                                      r' *(?P<vrf>\S+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -1292,9 +1498,9 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
             # Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36,
             # lo2, Interface status: protocol-up/link-up/admin-up, iod: 7, mode: anycast-mac,external
-            p2 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\-\.]+), *Interface'
-                            r' *status: *(?P<interface_status>[a-z\-\/\s]+),'
-                            r' *iod: *(?P<iod>[0-9]+),(?: *mode: *(?P<mode>[a-zA-Z0-9\-\,]+))?$')
+            p2 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\-\.]+), *Interface'
+                                      r' *status: *(?P<interface_status>[a-z\-\/\s]+),'
+                                      r' *iod: *(?P<iod>[0-9]+),(?: *mode: *(?P<mode>[a-zA-Z0-9\-\,]+))?$')
             m = p2.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -1327,8 +1533,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # Unnumbered interfaces of loopback0: first iod 46
-            p2_1 = re.compile(r'^\s*Unnumbered +interfaces +of +(?P<unnumbered_intf>[\w\.\/]+): *'
-                              r'first +iod +(?P<first_iod>\d+)$')
+            p2_1 = regex_engine.compile(r'^\s*Unnumbered +interfaces +of +(?P<unnumbered_intf>[\w\.\/]+): *'
+                                        r'first +iod +(?P<first_iod>\d+)$')
             m = p2_1.match(line)
             if m:
                 unnumbered_intf = m.groupdict()['unnumbered_intf']
@@ -1336,8 +1542,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
             # Ethernet2/11:
             # mti18: tunnel-te11: tunnel-te12:
-            p2_2 = re.compile(r'(([E|e]thernet|[L|l]oopback|[T|t]unnel|'
-                              r'[V|v]lan|mti|[t|T]unnel-te|[p|P]ort-channel)[\d\/\.]+):')
+            p2_2 = regex_engine.compile(r'(([E|e]thernet|[L|l]oopback|[T|t]unnel|'
+                                        r'[V|v]lan|mti|[t|T]unnel-te|[p|P]ort-channel)[\d\/\.]+):')
             m = p2_2.findall(line)
             if m and unnumbered_intf:
                 temp_intf = []
@@ -1348,10 +1554,10 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
             # IP address: 10.4.4.4, IP subnet: 10.4.4.0/24 secondary
             # IP address: 10.64.4.4, IP subnet: 10.64.4.0/24
-            p3 = re.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP'
-                            r' *subnet: *(?P<ip_subnet>[a-z0-9\.]+)\/'
-                            r'(?P<prefix_length>[0-9]+)'
-                            r' *(?P<secondary>(secondary))?$')
+            p3 = regex_engine.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP'
+                                      r' *subnet: *(?P<ip_subnet>[a-z0-9\.]+)\/'
+                                      r'(?P<prefix_length>[0-9]+)'
+                                      r' *(?P<secondary>(secondary))?$')
             m = p3.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -1391,11 +1597,11 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
             # IP address: 192.168.106.1, IP subnet: 192.168.106.0/24 route-preference: 0, tag: 0
             # IP address: 10.115.69.2, IP subnet: 10.115.69.0/24 secondary route-preference: 0, tag: 0
-            p3_1 = re.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP *subnet: '
-                              r'*(?P<ip_subnet>[a-z0-9\.]+)\/(?P<prefix_length>[0-9\,]+)'
-                              r'(\s*(?P<secondary>secondary)\s*)?(?: *route-preference: *'
-                              r'(?P<route_preference>[0-9]+),)?'
-                              r'(?: *tag: *(?P<route_tag>[0-9]+)?)?$')
+            p3_1 = regex_engine.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP *subnet: '
+                                        r'*(?P<ip_subnet>[a-z0-9\.]+)\/(?P<prefix_length>[0-9\,]+)'
+                                        r'(\s*(?P<secondary>secondary)\s*)?(?: *route-preference: *'
+                                        r'(?P<route_preference>[0-9]+),)?'
+                                        r'(?: *tag: *(?P<route_tag>[0-9]+)?)?$')
             m = p3_1.match(line)
 
             if m:
@@ -1443,7 +1649,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP address: none
-            p3_2 = re.compile(r'^\s*IP +address: +(?P<ip>\S+)$')
+            p3_2 = regex_engine.compile(r'^\s*IP +address: +(?P<ip>\S+)$')
             m = p3_2.match(line)
             if m:
                 group = m.groupdict()
@@ -1457,7 +1663,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #   0
-            p3_3 = re.compile(r'^\s*(?P<route_tag>\d+)$')
+            p3_3 = regex_engine.compile(r'^\s*(?P<route_tag>\d+)$')
             m = p3_3.match(line)
             if m:
                 group = m.groupdict()
@@ -1477,8 +1683,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP broadcast address: 255.255.255.255
-            p4 = re.compile(r'^\s*IP *broadcast *address:'
-                            r' *(?P<broadcast_address>[0-9\.]+)$')
+            p4 = regex_engine.compile(r'^\s*IP *broadcast *address:'
+                                      r' *(?P<broadcast_address>[0-9\.]+)$')
             m = p4.match(line)
             if m:
                 broadcast_address = str(m.groupdict()['broadcast_address'])
@@ -1488,8 +1694,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
             # IP multicast groups locally joined: none
             # 224.0.0.6  224.0.0.5  224.0.0.2
-            p5 = re.compile(r'^\s*IP *multicast *groups *locally *joined:'
-                            r' *(?P<multicast_groups_address>[a-z]+)$')
+            p5 = regex_engine.compile(r'^\s*IP *multicast *groups *locally *joined:'
+                                      r' *(?P<multicast_groups_address>[a-z]+)$')
             m = p5.match(line)
             if m:
                 multicast_groups_address = m.groupdict()['multicast_groups_address']
@@ -1499,13 +1705,13 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #     show ip interface vrf all
-            p5_0 = re.compile(r'^\s*show')
+            p5_0 = regex_engine.compile(r'^\s*show')
             m = p5_0.match(line)
             if m:
                 continue
 
             # 224.0.0.6  224.0.0.5  224.0.0.2
-            p5_1 = re.compile(r'^\s*(?P<multicast_groups_address>[a-fA-F0-9\.\s]+)$')
+            p5_1 = regex_engine.compile(r'^\s*(?P<multicast_groups_address>[a-fA-F0-9\.\s]+)$')
             m = p5_1.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups_address'])
@@ -1522,8 +1728,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP MTU: 1600 bytes (using link MTU)
-            p6 = re.compile(r'^\s*IP *MTU: *(?P<ip_mtu>[0-9]+)'
-                            r' *bytes *\(using *link *MTU\)$')
+            p6 = regex_engine.compile(r'^\s*IP *MTU: *(?P<ip_mtu>[0-9]+)'
+                                      r' *bytes *\(using *link *MTU\)$')
             m = p6.match(line)
             if m:
                 ip_mtu = int(m.groupdict()['ip_mtu'])
@@ -1532,9 +1738,9 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP primary address route-preference: 0, tag: 0
-            p7 = re.compile(r'^\s*IP *primary *address *route-preference:'
-                            r' *(?P<route_preference>[0-9]+), *tag:'
-                            r' *(?P<route_tag>[0-9]+)$')
+            p7 = regex_engine.compile(r'^\s*IP *primary *address *route-preference:'
+                                      r' *(?P<route_preference>[0-9]+), *tag:'
+                                      r' *(?P<route_tag>[0-9]+)$')
             m = p7.match(line)
             if m:
                 route_preference = m.groupdict()['route_preference']
@@ -1550,7 +1756,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP proxy ARP : disabled
-            p8 = re.compile(r'^\s*IP *proxy *ARP *: *(?P<proxy_arp>[a-z]+)$')
+            p8 = regex_engine.compile(r'^\s*IP *proxy *ARP *: *(?P<proxy_arp>[a-z]+)$')
             m = p8.match(line)
             if m:
                 proxy_arp = m.groupdict()['proxy_arp']
@@ -1559,8 +1765,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP Local Proxy ARP : disabled
-            p9 = re.compile(r'^\s*IP *Local *Proxy *ARP *:'
-                            r' *(?P<local_proxy_arp>[a-z]+)$')
+            p9 = regex_engine.compile(r'^\s*IP *Local *Proxy *ARP *:'
+                                      r' *(?P<local_proxy_arp>[a-z]+)$')
             m = p9.match(line)
             if m:
                 local_proxy_arp = m.groupdict()['local_proxy_arp']
@@ -1570,8 +1776,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP multicast routing: disabled
-            p10 = re.compile(r'^\s*IP *multicast *routing:'
-                             r' *(?P<multicast_routing>[a-z]+)$')
+            p10 = regex_engine.compile(r'^\s*IP *multicast *routing:'
+                                       r' *(?P<multicast_routing>[a-z]+)$')
             m = p10.match(line)
             if m:
                 multicast_routing = m.groupdict()['multicast_routing']
@@ -1581,8 +1787,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP icmp redirects: disabled
-            p11 = re.compile(r'^\s*IP *icmp *redirects:'
-                             r' *(?P<icmp_redirects>[a-z]+)$')
+            p11 = regex_engine.compile(r'^\s*IP *icmp *redirects:'
+                                       r' *(?P<icmp_redirects>[a-z]+)$')
             m = p11.match(line)
             if m:
                 icmp_redirects = m.groupdict()['icmp_redirects']
@@ -1592,8 +1798,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP directed-broadcast: disabled
-            p12 = re.compile(r'^\s*IP directed-broadcast:'
-                             r' *(?P<directed_broadcast>[a-z]+)$')
+            p12 = regex_engine.compile(r'^\s*IP directed-broadcast:'
+                                       r' *(?P<directed_broadcast>[a-z]+)$')
             m = p12.match(line)
             if m:
                 directed_broadcast = m.groupdict()['directed_broadcast']
@@ -1603,7 +1809,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP Forwarding: disabled
-            p13 = re.compile(r'^\s*IP *Forwarding: *(?P<ip_forwarding>[a-z]+)$')
+            p13 = regex_engine.compile(r'^\s*IP *Forwarding: *(?P<ip_forwarding>[a-z]+)$')
             m = p13.match(line)
             if m:
                 ip_forwarding = m.groupdict()['ip_forwarding']
@@ -1613,8 +1819,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP icmp unreachables (except port): disabled
-            p14 = re.compile(r'^\s*IP *icmp *unreachables *\(except *port\):'
-                             r' *(?P<icmp_unreachable>[a-z]+)$')
+            p14 = regex_engine.compile(r'^\s*IP *icmp *unreachables *\(except *port\):'
+                                       r' *(?P<icmp_unreachable>[a-z]+)$')
             m = p14.match(line)
             if m:
                 icmp_unreachable = m.groupdict()['icmp_unreachable']
@@ -1624,8 +1830,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP icmp port-unreachable: enabled
-            p15 = re.compile(r'^\s*IP *icmp *port-unreachable:'
-                             r' *(?P<icmp_port_unreachable>[a-z]+)$')
+            p15 = regex_engine.compile(r'^\s*IP *icmp *port-unreachable:'
+                                       r' *(?P<icmp_port_unreachable>[a-z]+)$')
             m = p15.match(line)
             if m:
                 icmp_port_unreachable = m.groupdict()['icmp_port_unreachable']
@@ -1635,8 +1841,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP unicast reverse path forwarding: loose allow default
-            p16 = re.compile(r'^\s*IP\s+unicast\s+reverse\s+path\s+forwarding:\s+'
-                             r'(?P<unicast_reverse_path>([\w\s]+)\s*)$')
+            p16 = regex_engine.compile(r'^\s*IP\s+unicast\s+reverse\s+path\s+forwarding:\s+'
+                                       r'(?P<unicast_reverse_path>([\w\s]+)\s*)$')
             m = p16.match(line)
             if m:
                 unicast_reverse_path = m.groupdict()['unicast_reverse_path']
@@ -1646,7 +1852,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP load sharing: none
-            p17 = re.compile(r'^\s*IP *load *sharing: *(?P<load_sharing>\w+)$')
+            p17 = regex_engine.compile(r'^\s*IP *load *sharing: *(?P<load_sharing>\w+)$')
             m = p17.match(line)
             if m:
                 load_sharing = m.groupdict()['load_sharing']
@@ -1657,8 +1863,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
             # IP interface statistics last reset: never
             # ip interface statistics last reset: never
-            p18 = re.compile(r'^\s*(IP|ip) *interface *statistics *last *reset:'
-                             r' *(?P<int_stat_last_reset>[a-zA-Z0-9\:]+)')
+            p18 = regex_engine.compile(r'^\s*(IP|ip) *interface *statistics *last *reset:'
+                                       r' *(?P<int_stat_last_reset>[a-zA-Z0-9\:]+)')
             m = p18.match(line)
             if m:
                 int_stat_last_reset = m.groupdict()['int_stat_last_reset']
@@ -1683,12 +1889,12 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
             if 'ipv4' in ip_interface_vrf_all_dict[interface]:
                 # Unicast packets    : 0/0/0/0/0
-                p20 = re.compile(r'^\s*Unicast *packets *:'
-                                 r' *(?P<unicast_packets_sent>[0-9]+)\/'
-                                 r'(?P<unicast_packets_received>[0-9]+)\/'
-                                 r'(?P<unicast_packets_forwarded>[0-9]+)\/'
-                                 r'(?P<unicast_packets_originated>[0-9]+)\/'
-                                 r'(?P<unicast_packets_consumed>[0-9]+)$')
+                p20 = regex_engine.compile(r'^\s*Unicast *packets *:'
+                                           r' *(?P<unicast_packets_sent>[0-9]+)\/'
+                                           r'(?P<unicast_packets_received>[0-9]+)\/'
+                                           r'(?P<unicast_packets_forwarded>[0-9]+)\/'
+                                           r'(?P<unicast_packets_originated>[0-9]+)\/'
+                                           r'(?P<unicast_packets_consumed>[0-9]+)$')
                 m = p20.match(line)
                 if m:
                     if 'counters' not in ip_interface_vrf_all_dict[interface]['ipv4'][address]:
@@ -1707,12 +1913,12 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 # Unicast bytes      : 0/0/0/0/0
-                p21 = re.compile(r'^\s*Unicast *bytes *:'
-                                 r' *(?P<unicast_bytes_sent>[0-9]+)\/'
-                                 r'(?P<unicast_bytes_received>[0-9]+)\/'
-                                 r'(?P<unicast_bytes_forwarded>[0-9]+)\/'
-                                 r'(?P<unicast_bytes_originated>[0-9]+)\/'
-                                 r'(?P<unicast_bytes_consumed>[0-9]+)$')
+                p21 = regex_engine.compile(r'^\s*Unicast *bytes *:'
+                                           r' *(?P<unicast_bytes_sent>[0-9]+)\/'
+                                           r'(?P<unicast_bytes_received>[0-9]+)\/'
+                                           r'(?P<unicast_bytes_forwarded>[0-9]+)\/'
+                                           r'(?P<unicast_bytes_originated>[0-9]+)\/'
+                                           r'(?P<unicast_bytes_consumed>[0-9]+)$')
                 m = p21.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters'] \
@@ -1728,12 +1934,12 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 # Multicast packets  : 0/0/0/0/0
-                p22 = re.compile(r'^\s*Multicast *packets *:'
-                                 r' *(?P<multicast_packets_sent>[0-9]+)\/'
-                                 r'(?P<multicast_packets_received>[0-9]+)\/'
-                                 r'(?P<multicast_packets_forwarded>[0-9]+)\/'
-                                 r'(?P<multicast_packets_originated>[0-9]+)\/'
-                                 r'(?P<multicast_packets_consumed>[0-9]+)$')
+                p22 = regex_engine.compile(r'^\s*Multicast *packets *:'
+                                           r' *(?P<multicast_packets_sent>[0-9]+)\/'
+                                           r'(?P<multicast_packets_received>[0-9]+)\/'
+                                           r'(?P<multicast_packets_forwarded>[0-9]+)\/'
+                                           r'(?P<multicast_packets_originated>[0-9]+)\/'
+                                           r'(?P<multicast_packets_consumed>[0-9]+)$')
                 m = p22.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters'] \
@@ -1749,12 +1955,12 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 # Multicast bytes    : 0/0/0/0/0
-                p23 = re.compile(r'^\s*Multicast *bytes *:'
-                                 r' *(?P<multicast_bytes_sent>[0-9]+)\/'
-                                 r'(?P<multicast_bytes_received>[0-9]+)\/'
-                                 r'(?P<multicast_bytes_forwarded>[0-9]+)\/'
-                                 r'(?P<multicast_bytes_originated>[0-9]+)\/'
-                                 r'(?P<multicast_bytes_consumed>[0-9]+)$')
+                p23 = regex_engine.compile(r'^\s*Multicast *bytes *:'
+                                           r' *(?P<multicast_bytes_sent>[0-9]+)\/'
+                                           r'(?P<multicast_bytes_received>[0-9]+)\/'
+                                           r'(?P<multicast_bytes_forwarded>[0-9]+)\/'
+                                           r'(?P<multicast_bytes_originated>[0-9]+)\/'
+                                           r'(?P<multicast_bytes_consumed>[0-9]+)$')
                 m = p23.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters'] \
@@ -1770,12 +1976,12 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 # Broadcast packets  : 0/0/0/0/0
-                p24 = re.compile(r'^\s*Broadcast *packets *:'
-                                 r' *(?P<broadcast_packets_sent>[0-9]+)\/'
-                                 r'(?P<broadcast_packets_received>[0-9]+)\/'
-                                 r'(?P<broadcast_packets_forwarded>[0-9]+)\/'
-                                 r'(?P<broadcast_packets_originated>[0-9]+)\/'
-                                 r'(?P<broadcast_packets_consumed>[0-9]+)$')
+                p24 = regex_engine.compile(r'^\s*Broadcast *packets *:'
+                                           r' *(?P<broadcast_packets_sent>[0-9]+)\/'
+                                           r'(?P<broadcast_packets_received>[0-9]+)\/'
+                                           r'(?P<broadcast_packets_forwarded>[0-9]+)\/'
+                                           r'(?P<broadcast_packets_originated>[0-9]+)\/'
+                                           r'(?P<broadcast_packets_consumed>[0-9]+)$')
                 m = p24.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters'] \
@@ -1791,12 +1997,12 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 # Broadcast bytes    : 0/0/0/0/0
-                p25 = re.compile(r'^\s*Broadcast *bytes *:'
-                                 r' *(?P<broadcast_bytes_sent>[0-9]+)\/'
-                                 r'(?P<broadcast_bytes_received>[0-9]+)\/'
-                                 r'(?P<broadcast_bytes_forwarded>[0-9]+)\/'
-                                 r'(?P<broadcast_bytes_originated>[0-9]+)\/'
-                                 r'(?P<broadcast_bytes_consumed>[0-9]+)$')
+                p25 = regex_engine.compile(r'^\s*Broadcast *bytes *:'
+                                           r' *(?P<broadcast_bytes_sent>[0-9]+)\/'
+                                           r'(?P<broadcast_bytes_received>[0-9]+)\/'
+                                           r'(?P<broadcast_bytes_forwarded>[0-9]+)\/'
+                                           r'(?P<broadcast_bytes_originated>[0-9]+)\/'
+                                           r'(?P<broadcast_bytes_consumed>[0-9]+)$')
                 m = p25.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters'] \
@@ -1812,12 +2018,12 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 # Labeled packets    : 0/0/0/0/0
-                p26 = re.compile(r'^\s*Labeled *packets *:'
-                                 r' *(?P<labeled_packets_sent>[0-9]+)\/'
-                                 r'(?P<labeled_packets_received>[0-9]+)\/'
-                                 r'(?P<labeled_packets_forwarded>[0-9]+)\/'
-                                 r'(?P<labeled_packets_originated>[0-9]+)\/'
-                                 r'(?P<labeled_packets_consumed>[0-9]+)$')
+                p26 = regex_engine.compile(r'^\s*Labeled *packets *:'
+                                           r' *(?P<labeled_packets_sent>[0-9]+)\/'
+                                           r'(?P<labeled_packets_received>[0-9]+)\/'
+                                           r'(?P<labeled_packets_forwarded>[0-9]+)\/'
+                                           r'(?P<labeled_packets_originated>[0-9]+)\/'
+                                           r'(?P<labeled_packets_consumed>[0-9]+)$')
                 m = p26.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters'] \
@@ -1833,12 +2039,12 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 # Labeled bytes      : 0/0/0/0/0
-                p27 = re.compile(r'^\s*Labeled *bytes *:'
-                                 r' *(?P<labeled_bytes_sent>[0-9]+)\/'
-                                 r'(?P<labeled_bytes_received>[0-9]+)\/'
-                                 r'(?P<labeled_bytes_forwarded>[0-9]+)\/'
-                                 r'(?P<labeled_bytes_originated>[0-9]+)\/'
-                                 r'(?P<labeled_bytes_consumed>[0-9]+)$')
+                p27 = regex_engine.compile(r'^\s*Labeled *bytes *:'
+                                           r' *(?P<labeled_bytes_sent>[0-9]+)\/'
+                                           r'(?P<labeled_bytes_received>[0-9]+)\/'
+                                           r'(?P<labeled_bytes_forwarded>[0-9]+)\/'
+                                           r'(?P<labeled_bytes_originated>[0-9]+)\/'
+                                           r'(?P<labeled_bytes_consumed>[0-9]+)$')
                 m = p27.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters'] \
@@ -1854,8 +2060,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
             # WCCP Redirect outbound: disabled
-            p28 = re.compile(r'^\s*WCCP *Redirect *outbound:'
-                             r' *(?P<wccp_redirect_outbound>[a-z]+)$')
+            p28 = regex_engine.compile(r'^\s*WCCP *Redirect *outbound:'
+                                       r' *(?P<wccp_redirect_outbound>[a-z]+)$')
             m = p28.match(line)
             if m:
                 wccp_redirect_outbound = m.groupdict()['wccp_redirect_outbound']
@@ -1865,8 +2071,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # WCCP Redirect inbound: disabled
-            p29 = re.compile(r'^\s*WCCP *Redirect *inbound:'
-                             r' *(?P<wccp_redirect_inbound>[a-z]+)$')
+            p29 = regex_engine.compile(r'^\s*WCCP *Redirect *inbound:'
+                                       r' *(?P<wccp_redirect_inbound>[a-z]+)$')
             m = p29.match(line)
             if m:
                 wccp_redirect_inbound = m.groupdict()['wccp_redirect_inbound']
@@ -1876,8 +2082,8 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # WCCP Redirect exclude: disabled
-            p30 = re.compile(r'^\s*WCCP *Redirect *exclude:'
-                             r' *(?P<wccp_redirect_exclude>[a-z]+)$')
+            p30 = regex_engine.compile(r'^\s*WCCP *Redirect *exclude:'
+                                       r' *(?P<wccp_redirect_exclude>[a-z]+)$')
             m = p30.match(line)
             if m:
                 wccp_redirect_exclude = m.groupdict()['wccp_redirect_exclude']
@@ -1887,7 +2093,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP unnumbered interface (loopback0)
-            p31 = re.compile(r'^\s*IP +unnumbered +interface +\((?P<unnum_intf>[\w\/\.]+)\)$')
+            p31 = regex_engine.compile(r'^\s*IP +unnumbered +interface +\((?P<unnum_intf>[\w\/\.]+)\)$')
             m = p31.match(line)
             if m:
                 unnum_intf = m.groupdict()['unnum_intf']
@@ -1958,10 +2164,10 @@ class ShowVrfAllInterface(ShowVrfAllInterfaceSchema):
             # Ethernet2/6               default                              1  --
             # port-channel1101          default                              1  --
             # Vlan3960                  KVTC_TEST_SU_KLAIDA                 31  --
-            p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\.\/\-]+)'
-                            r' *(?P<vrf>[a-zA-Z0-9_]+)'
-                            r' *(?P<vrf_id>[0-9]+)'
-                            r' *(?P<site_of_origin>[a-zA-Z\-]+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\.\/\-]+)'
+                                      r' *(?P<vrf>[a-zA-Z0-9_]+)'
+                                      r' *(?P<vrf_id>[0-9]+)'
+                                      r' *(?P<site_of_origin>[a-zA-Z\-]+)$')
 
             m = p1.match(line)
             if m:
@@ -2036,7 +2242,7 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
             line = line.rstrip()
 
             # Name: Ethernet2/2
-            p1 = re.compile(r'^\s*Name: *(?P<interface>[a-zA-Z0-9\/\-\.]+)$')
+            p1 = regex_engine.compile(r'^\s*Name: *(?P<interface>[a-zA-Z0-9\/\-\.]+)$')
             m = p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
@@ -2046,7 +2252,7 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                     continue
 
             # Switchport: Enabled
-            p2 = re.compile(r'^\s*Switchport: *(?P<switchport_status>[a-zA-Z\s]+)$')
+            p2 = regex_engine.compile(r'^\s*Switchport: *(?P<switchport_status>[a-zA-Z\s]+)$')
             m = p2.match(line)
             if m:
                 switchport_status = m.groupdict()['switchport_status'].lower()
@@ -2058,7 +2264,7 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Switchport Monitor: Not enabled
-            p3 = re.compile(r'^\s*Switchport *Monitor: *(?P<switchport_monitor>[a-zA-Z\s]+)$')
+            p3 = regex_engine.compile(r'^\s*Switchport *Monitor: *(?P<switchport_monitor>[a-zA-Z\s]+)$')
             m = p3.match(line)
             if m:
                 switchport_monitor = m.groupdict()['switchport_monitor']
@@ -2067,7 +2273,7 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Operational Mode: Private-vlan host
-            p4 = re.compile(r'^\s*Operational *Mode: *(?P<switchport_mode>[\w\s-]+)$')
+            p4 = regex_engine.compile(r'^\s*Operational *Mode: *(?P<switchport_mode>[\w\s-]+)$')
             m = p4.match(line)
             if m:
                 interface_switchport_dict[interface]['switchport_mode'] = m.groupdict()['switchport_mode']
@@ -2076,8 +2282,8 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
             # Access Mode VLAN: 1 (default)
             # Access Mode VLAN: 7 (server-vlan7)
             # Access Mode VLAN: 551 (Test_VM_192.168.1.0/24)
-            p5 = re.compile(r'^\s*Access *Mode *VLAN: *(?P<access_vlan>[0-9]+)'
-                            r'(?: *\((?P<access_vlan_mode>[\S\s]+)\))?$')
+            p5 = regex_engine.compile(r'^\s*Access *Mode *VLAN: *(?P<access_vlan>[0-9]+)'
+                                      r'(?: *\((?P<access_vlan_mode>[\S\s]+)\))?$')
             m = p5.match(line)
             if m:
                 access_vlan = int(m.groupdict()['access_vlan'])
@@ -2093,9 +2299,9 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
             # Trunking Native Mode VLAN: 200 (VLAN0200)
             # Trunking Native Mode VLAN: 3967 (Vlan not created)
             # Trunking Native Mode VLAN: 451 (VM_Machines_192.168.1.0/24)
-            p6 = re.compile(r'^\s*Trunking *Native *Mode *VLAN:'
-                            r' *(?P<native_vlan>[0-9]+)'
-                            r' *\((?P<native_vlan_mode>[\S\s]+)\)$')
+            p6 = regex_engine.compile(r'^\s*Trunking *Native *Mode *VLAN:'
+                                      r' *(?P<native_vlan>[0-9]+)'
+                                      r' *\((?P<native_vlan_mode>[\S\s]+)\)$')
             m = p6.match(line)
             if m:
                 native_vlan = int(m.groupdict()['native_vlan'])
@@ -2108,7 +2314,7 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Trunking VLANs Allowed: 100,300
-            p7 = re.compile(r'^\s*Trunking *VLANs *Allowed: *(?P<trunk_vlans>[0-9\,\-]+)$')
+            p7 = regex_engine.compile(r'^\s*Trunking *VLANs *Allowed: *(?P<trunk_vlans>[0-9\,\-]+)$')
             m = p7.match(line)
             if m:
                 trunk_vlans = m.groupdict()['trunk_vlans']
@@ -2117,9 +2323,9 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Administrative private-vlan primary host-association: 2000
-            p8 = re.compile(r'^\s*Administrative *private-vlan *primary'
-                            r' *host-association:'
-                            r' *(?P<admin_priv_vlan_primary_host_assoc>\w+)$')
+            p8 = regex_engine.compile(r'^\s*Administrative *private-vlan *primary'
+                                      r' *host-association:'
+                                      r' *(?P<admin_priv_vlan_primary_host_assoc>\w+)$')
             m = p8.match(line)
             if m:
                 admin_priv_vlan_primary_host_assoc = m.groupdict()['admin_priv_vlan_primary_host_assoc']
@@ -2129,9 +2335,9 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Administrative private-vlan secondary host-association: 110
-            p9 = re.compile(r'^\s*Administrative *private-vlan *secondary'
-                            r' *host-association:'
-                            r' *(?P<admin_priv_vlan_secondary_host_assoc>\w+)$')
+            p9 = regex_engine.compile(r'^\s*Administrative *private-vlan *secondary'
+                                      r' *host-association:'
+                                      r' *(?P<admin_priv_vlan_secondary_host_assoc>\w+)$')
             m = p9.match(line)
             if m:
                 admin_priv_vlan_secondary_host_assoc \
@@ -2142,9 +2348,9 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Administrative private-vlan primary mapping: none
-            p10 = re.compile(r'^\s*Administrative *private-vlan *primary'
-                             r' *mapping:'
-                             r' *(?P<admin_priv_vlan_primary_mapping>\w+)$')
+            p10 = regex_engine.compile(r'^\s*Administrative *private-vlan *primary'
+                                       r' *mapping:'
+                                       r' *(?P<admin_priv_vlan_primary_mapping>\w+)$')
             m = p10.match(line)
             if m:
                 admin_priv_vlan_primary_mapping \
@@ -2156,9 +2362,9 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Administrative private-vlan secondary mapping: none
-            p11 = re.compile(r'^\s*Administrative *private-vlan *secondary'
-                             r' *mapping:'
-                             r' *(?P<admin_priv_vlan_secondary_mapping>\w+)$')
+            p11 = regex_engine.compile(r'^\s*Administrative *private-vlan *secondary'
+                                       r' *mapping:'
+                                       r' *(?P<admin_priv_vlan_secondary_mapping>\w+)$')
             m = p11.match(line)
             if m:
                 admin_priv_vlan_secondary_mapping = m.groupdict()['admin_priv_vlan_secondary_mapping']
@@ -2168,9 +2374,9 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk native VLAN: 1
-            p12 = re.compile(r'^\s*Administrative *private-vlan *trunk *native'
-                             r' *VLAN:'
-                             r' *(?P<admin_priv_vlan_trunk_native_vlan>\w+)$')
+            p12 = regex_engine.compile(r'^\s*Administrative *private-vlan *trunk *native'
+                                       r' *VLAN:'
+                                       r' *(?P<admin_priv_vlan_trunk_native_vlan>\w+)$')
             m = p12.match(line)
             if m:
                 admin_priv_vlan_trunk_native_vlan = m.groupdict()['admin_priv_vlan_trunk_native_vlan']
@@ -2180,9 +2386,9 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk encapsulation: dot1q
-            p13 = re.compile(r'^\s*Administrative *private-vlan *trunk'
-                             r' *encapsulation:'
-                             r' *(?P<admin_priv_vlan_trunk_encapsulation>[a-z0-9]+)$')
+            p13 = regex_engine.compile(r'^\s*Administrative *private-vlan *trunk'
+                                       r' *encapsulation:'
+                                       r' *(?P<admin_priv_vlan_trunk_encapsulation>[a-z0-9]+)$')
             m = p13.match(line)
             if m:
                 admin_priv_vlan_trunk_encapsulation = m.groupdict()['admin_priv_vlan_trunk_encapsulation']
@@ -2192,9 +2398,9 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk normal VLANs: none
-            p14 = re.compile(r'^\s*Administrative *private-vlan *trunk'
-                             r' *normal VLANs:'
-                             r' *(?P<admin_priv_vlan_trunk_normal_vlans>\w+)$')
+            p14 = regex_engine.compile(r'^\s*Administrative *private-vlan *trunk'
+                                       r' *normal VLANs:'
+                                       r' *(?P<admin_priv_vlan_trunk_normal_vlans>\w+)$')
             m = p14.match(line)
             if m:
                 admin_priv_vlan_trunk_normal_vlans = m.groupdict()['admin_priv_vlan_trunk_normal_vlans']
@@ -2205,9 +2411,9 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
 
             # Administrative private-vlan trunk private VLANs: none
             # Administrative private-vlan trunk private VLANs: none(0 none)
-            p15 = re.compile(r'^\s*Administrative *private-vlan *trunk'
-                             r' *private VLANs:'
-                             r' *(?P<admin_priv_vlan_trunk_private_vlans>\w+)(?P<dummy>.*)?$')
+            p15 = regex_engine.compile(r'^\s*Administrative *private-vlan *trunk'
+                                       r' *private VLANs:'
+                                       r' *(?P<admin_priv_vlan_trunk_private_vlans>\w+)(?P<dummy>.*)?$')
             m = p15.match(line)
             if m:
                 admin_priv_vlan_trunk_private_vlans = m.groupdict()['admin_priv_vlan_trunk_private_vlans']
@@ -2217,8 +2423,8 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
                 continue
 
             # Operational private-vlan: (2500,101)
-            p16 = re.compile(r'^\s*Operational *private-vlan:'
-                             r' *(?P<operational_private_vlan>\S+)$')
+            p16 = regex_engine.compile(r'^\s*Operational *private-vlan:'
+                                       r' *(?P<operational_private_vlan>\S+)$')
             m = p16.match(line)
             if m:
                 operational_private_vlan = m.groupdict()['operational_private_vlan']
@@ -2338,8 +2544,8 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
             line = line.rstrip()
 
             # IPv6 Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*IPv6 *Interface *Status *for *VRF'
-                            r' *(?P<vrf>\S+)$')
+            p1 = regex_engine.compile(r'^\s*IPv6 *Interface *Status *for *VRF'
+                                      r' *(?P<vrf>\S+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -2348,9 +2554,9 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
 
             # Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36
             # port-channel2.101, Interface status: protocol-down/link-down/admin-up, iod: 71
-            p2 = re.compile(r'^\s*(?:(?P<interface>[a-zA-Z0-9\/\-\.]+)), Interface'
-                            r' *status: *(?P<interface_status>[a-z\-\/]+),'
-                            r' *iod: *(?P<iod>[0-9]+)$')
+            p2 = regex_engine.compile(r'^\s*(?:(?P<interface>[a-zA-Z0-9\/\-\.]+)), Interface'
+                                      r' *status: *(?P<interface_status>[a-z\-\/]+),'
+                                      r' *iod: *(?P<iod>[0-9]+)$')
             m = p2.match(line)
             if m:
 
@@ -2372,7 +2578,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 address:
-            p3_1 = re.compile(r'^\s*IPv6 address:$')
+            p3_1 = regex_engine.compile(r'^\s*IPv6 address:$')
             m = p3_1.match(line)
             if m:
                 ipv6_addresses = True
@@ -2380,7 +2586,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # Anycast configured addresses:
-            p3_2 = re.compile(r'^\s*Anycast configured addresses:$')
+            p3_2 = regex_engine.compile(r'^\s*Anycast configured addresses:$')
             m = p3_2.match(line)
             if m:
                 anycast_addresses = True
@@ -2388,9 +2594,9 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # 2001:db8:1:1::1/64 [VALID]
-            p3_3 = re.compile(r'^\s*(?P<ip>[a-z0-9\:]+)'
-                              r'\/(?P<prefix_length>[0-9]+)'
-                              r' *\[(?P<status>[a-zA-Z]+)\]$')
+            p3_3 = regex_engine.compile(r'^\s*(?P<ip>[a-z0-9\:]+)'
+                                        r'\/(?P<prefix_length>[0-9]+)'
+                                        r' *\[(?P<status>[a-zA-Z]+)\]$')
             m = p3_3.match(line)
             if m:
                 ip = m.groupdict()['ip']
@@ -2418,8 +2624,8 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 subnet:  2001:db8:1:1::/64
-            p4 = re.compile(r'^\s*IPv6 *subnet:'
-                            r' *(?P<ipv6_subnet>[a-z0-9\:\/]+)$')
+            p4 = regex_engine.compile(r'^\s*IPv6 *subnet:'
+                                      r' *(?P<ipv6_subnet>[a-z0-9\:\/]+)$')
             m = p4.match(line)
             if m:
                 ipv6_subnet = m.groupdict()['ipv6_subnet']
@@ -2428,11 +2634,11 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 link-local address: fe80::a8aa:bbff:febb:cccc (default) [VALID]
-            p5 = re.compile(r'^\s*IPv6 *link-local *address:'
-                            r' *(?P<ipv6_link_local>[a-z0-9\:\s]+)'
-                            r' *\((?P<ipv6_link_local_state>[a-z]+)\)'
-                            r' *\[(?P<ipv6_ll_state>[A-Z]+)\]'
-                            r'( *\[(?P<rfc_compliant>[a-zA-Z\ ]+)\])?$')
+            p5 = regex_engine.compile(r'^\s*IPv6 *link-local *address:'
+                                      r' *(?P<ipv6_link_local>[a-z0-9\:\s]+)'
+                                      r' *\((?P<ipv6_link_local_state>[a-z]+)\)'
+                                      r' *\[(?P<ipv6_ll_state>[A-Z]+)\]'
+                                      r'( *\[(?P<rfc_compliant>[a-zA-Z\ ]+)\])?$')
             m = p5.match(line)
             if m:
                 group = m.groupdict()
@@ -2457,8 +2663,8 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 virtual addresses configured: none
-            p6 = re.compile(r'^\s*IPv6 *virtual *addresses *configured:'
-                            r' *(?P<ipv6_virtual_add>\w+)$')
+            p6 = regex_engine.compile(r'^\s*IPv6 *virtual *addresses *configured:'
+                                      r' *(?P<ipv6_virtual_add>\w+)$')
             m = p6.match(line)
             if m:
                 ipv6_virtual_add = m.groupdict()['ipv6_virtual_add']
@@ -2468,7 +2674,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
 
             # IPv6 virtual addresses configured:
             #        fe80::5:73ff:fea0:2  2001:db8:7746:fa41::1
-            p6_1 = re.compile(r'^\s*(IPv6 virtual *(?P<virtual_add>(addresses|address) configured:))$')
+            p6_1 = regex_engine.compile(r'^\s*(IPv6 virtual *(?P<virtual_add>(addresses|address) configured:))$')
             m = p6_1.match(line)
             if m:
                 virtual_add = m.groupdict()['virtual_add']
@@ -2477,7 +2683,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             if virtual_add:
-                p6_2 = re.compile(r'^\s*(?P<ipv6_virtual_addresses>[a-z0-9\:\s]+)$')
+                p6_2 = regex_engine.compile(r'^\s*(?P<ipv6_virtual_addresses>[a-z0-9\:\s]+)$')
                 m = p6_2.match(line)
                 if m:
                     ipv6_virtual_addresses = str(m.groupdict()['ipv6_virtual_addresses'])
@@ -2494,8 +2700,8 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                     continue
 
             # IPv6 multicast routing: disabled
-            p7 = re.compile(r'^\s*IPv6 *multicast *routing:'
-                            r' *(?P<ipv6_multicast_routing>[a-z]+)$')
+            p7 = regex_engine.compile(r'^\s*IPv6 *multicast *routing:'
+                                      r' *(?P<ipv6_multicast_routing>[a-z]+)$')
             m = p7.match(line)
             if m:
                 ipv6_multicast_routing = m.groupdict()['ipv6_multicast_routing']
@@ -2504,8 +2710,8 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 report link local: disabled
-            p8 = re.compile(r'^\s*IPv6 *report *link *local:'
-                            r' *(?P<ipv6_report_link_local>[a-z]+)$')
+            p8 = regex_engine.compile(r'^\s*IPv6 *report *link *local:'
+                                      r' *(?P<ipv6_report_link_local>[a-z]+)$')
             m = p8.match(line)
             if m:
                 ipv6_report_link_local = m.groupdict()['ipv6_report_link_local']
@@ -2515,8 +2721,8 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 Forwarding feature: disabled
-            p9 = re.compile(r'^\s*IPv6 *Forwarding *feature:'
-                            r' *(?P<ipv6_forwarding_feature>[a-z]+)$')
+            p9 = regex_engine.compile(r'^\s*IPv6 *Forwarding *feature:'
+                                      r' *(?P<ipv6_forwarding_feature>[a-z]+)$')
             m = p9.match(line)
             if m:
                 ipv6_forwarding_feature = m.groupdict()['ipv6_forwarding_feature']
@@ -2526,7 +2732,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 multicast groups locally joined:
-            p10 = re.compile(r'^\s*(?P<multicast_groups>(IPv6 *multicast *(groups|group) *locally *joined:))$')
+            p10 = regex_engine.compile(r'^\s*(?P<multicast_groups>(IPv6 *multicast *(groups|group) *locally *joined:))$')
             m = p10.match(line)
             if m:
                 virtual_add = False
@@ -2538,7 +2744,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 # ff02::1:ffbb:cccc  ff02::1:ff00:3  ff02::1:ff00:2  ff02::2
                 # ff02::1  ff02::1:ff00:1  ff02::1:ffbb:cccc  ff02::1:ff00:0
                 # ff02::1:ffad:beef  ff02::1:ff00:1(2)  ff02::2(2)  ff02::1(2)
-                p11 = re.compile(r'^\s*(?P<ipv6_multicast_group_addresses>[a-z0-9\(\)\:\s]+)$')
+                p11 = regex_engine.compile(r'^\s*(?P<ipv6_multicast_group_addresses>[a-z0-9\(\)\:\s]+)$')
                 m = p11.match(line)
                 if m:
                     ipv6_multicast_group_addresses = str(m.groupdict()['ipv6_multicast_group_addresses'])
@@ -2557,14 +2763,14 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
             # IPv6 multicast (S,G) entries joined: none
             # IPv6 multicast (S,G) entries joined:
             #  (2001:20:1:1::254, ff38::1)
-            p12 = re.compile(r'^\s*IPv6 *multicast *\(S\,G\) *entries *joined:$')
+            p12 = regex_engine.compile(r'^\s*IPv6 *multicast *\(S\,G\) *entries *joined:$')
             m = p12.match(line)
             if m:
                 ipv6_multicast_entries = True
                 continue
 
             #  (2001:20:1:1::254, ff38::1)
-            p12_1 = re.compile(r'^\s*\((?P<ip_list>.*)\)')
+            p12_1 = regex_engine.compile(r'^\s*\((?P<ip_list>.*)\)')
             m = p12_1.match(line)
             if m and ipv6_multicast_entries:
                 ipv6_multicast_entries = m.groupdict()['ip_list']
@@ -2573,8 +2779,8 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 MTU: 1600 (using link MTU)
-            p13 = re.compile(r'^\s*IPv6 *MTU: *(?P<ipv6_mtu>[0-9]+)'
-                             r' *\(using *link *MTU\)$')
+            p13 = regex_engine.compile(r'^\s*IPv6 *MTU: *(?P<ipv6_mtu>[0-9]+)'
+                                       r' *\(using *link *MTU\)$')
             m = p13.match(line)
             if m:
                 ipv6_mtu = int(m.groupdict()['ipv6_mtu'])
@@ -2583,8 +2789,8 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 unicast reverse path forwarding: loose allow default
-            p14 = re.compile(r'^\s*IPv6\s+unicast\s+reverse\s+path\s+forwarding:\s+'
-                             r'(?P<ipv6_unicast_rev_path_forwarding>([\w\s]+)\s*)$')
+            p14 = regex_engine.compile(r'^\s*IPv6\s+unicast\s+reverse\s+path\s+forwarding:\s+'
+                                       r'(?P<ipv6_unicast_rev_path_forwarding>([\w\s]+)\s*)$')
             m = p14.match(line)
             if m:
                 ipv6_unicast_rev_path_forwarding = m.groupdict() \
@@ -2596,8 +2802,8 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 load sharing: none
-            p15 = re.compile(r'^\s*IPv6 *load *sharing:'
-                             r' *(?P<ipv6_load_sharing>\w+)$')
+            p15 = regex_engine.compile(r'^\s*IPv6 *load *sharing:'
+                                       r' *(?P<ipv6_load_sharing>\w+)$')
             m = p15.match(line)
             if m:
                 ipv6_load_sharing = m.groupdict()['ipv6_load_sharing']
@@ -2607,8 +2813,8 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 interface statistics last reset: never
-            p16 = re.compile(r'^\s*IPv6 *interface *statistics *last *reset:'
-                             r' *(?P<ipv6_last_reset>[a-z]+)$')
+            p16 = regex_engine.compile(r'^\s*IPv6 *interface *statistics *last *reset:'
+                                       r' *(?P<ipv6_last_reset>[a-z]+)$')
             m = p16.match(line)
             if m:
                 ipv6_last_reset = m.groupdict()['ipv6_last_reset']
@@ -2618,10 +2824,10 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # Unicast packets:      0/0/0
-            p18 = re.compile(r'^\s*Unicast *packets:'
-                             r' *(?P<unicast_packets_forwarded>[0-9]+)\/'
-                             r'(?P<unicast_packets_originated>[0-9]+)\/'
-                             r'(?P<unicast_packets_consumed>[0-9]+)$')
+            p18 = regex_engine.compile(r'^\s*Unicast *packets:'
+                                       r' *(?P<unicast_packets_forwarded>[0-9]+)\/'
+                                       r'(?P<unicast_packets_originated>[0-9]+)\/'
+                                       r'(?P<unicast_packets_consumed>[0-9]+)$')
             m = p18.match(line)
             if m:
                 if 'counters' not in ipv6_interface_dict[interface]['ipv6']:
@@ -2636,9 +2842,9 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # Unicast bytes:        0/0/0
-            p19 = re.compile(r'^\s*Unicast *bytes: *(?P<unicast_bytes_forwarded>[0-9]+)'
-                             r'\/(?P<unicast_bytes_originated>[0-9]+)\/'
-                             r'(?P<unicast_bytes_consumed>[0-9]+)$')
+            p19 = regex_engine.compile(r'^\s*Unicast *bytes: *(?P<unicast_bytes_forwarded>[0-9]+)'
+                                       r'\/(?P<unicast_bytes_originated>[0-9]+)\/'
+                                       r'(?P<unicast_bytes_consumed>[0-9]+)$')
             m = p19.match(line)
             if m:
                 ipv6_interface_dict[interface]['ipv6']['counters'] \
@@ -2650,9 +2856,9 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # Multicast packets:    0/12/9
-            p20 = re.compile(r'^\s*Multicast *packets: *(?P<multicast_packets_forwarded>[0-9]+)'
-                             r'\/(?P<multicast_packets_originated>[0-9]+)\/'
-                             r'(?P<multicast_packets_consumed>[0-9]+)$')
+            p20 = regex_engine.compile(r'^\s*Multicast *packets: *(?P<multicast_packets_forwarded>[0-9]+)'
+                                       r'\/(?P<multicast_packets_originated>[0-9]+)\/'
+                                       r'(?P<multicast_packets_consumed>[0-9]+)$')
             m = p20.match(line)
             if m:
                 ipv6_interface_dict[interface]['ipv6']['counters'] \
@@ -2664,9 +2870,9 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # Multicast bytes:      0/1144/640
-            p21 = re.compile(r'^\s*Multicast *bytes: *(?P<multicast_bytes_forwarded>[0-9]+)\/'
-                             r'(?P<multicast_bytes_originated>[0-9]+)\/'
-                             r'(?P<multicast_bytes_consumed>[0-9]+)$')
+            p21 = regex_engine.compile(r'^\s*Multicast *bytes: *(?P<multicast_bytes_forwarded>[0-9]+)\/'
+                                       r'(?P<multicast_bytes_originated>[0-9]+)\/'
+                                       r'(?P<multicast_bytes_consumed>[0-9]+)$')
             m = p21.match(line)
             if m:
                 ipv6_interface_dict[interface]['ipv6']['counters'] \
@@ -2735,12 +2941,12 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
         interface_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Interface +IP Address +Interface Status$')
+            p1 = regex_engine.compile(r'^\s*Interface +IP Address +Interface Status$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(
+            p2 = regex_engine.compile(
                 r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +(?P<ip_address>[a-z0-9\.]+) +(?P<interface_status>[a-z\-\/]+)$')
             m = p2.match(line)
             if m:
@@ -2766,7 +2972,7 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
                         m.groupdict()['interface_status']
                 continue
 
-            p3 = re.compile(r'^\s*(?P<ipaddress_extension>\([a-z0-9]+\))$')
+            p3 = regex_engine.compile(r'^\s*(?P<ipaddress_extension>\([a-z0-9]+\))$')
             m = p3.match(line)
             if m:
                 ipaddress_extension = m.groupdict()['ipaddress_extension']
@@ -2903,66 +3109,66 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
         parsed_dict = {}
         vlan_flag = False
         # Port   VRF          Status IP Address                              Speed    MTU
-        p1 = re.compile(r'^Port +VRF +Status +IP Address +Speed +MTU$')
+        p1 = regex_engine.compile(r'^Port +VRF +Status +IP Address +Speed +MTU$')
 
         # mgmt0  --           up     172.25.143.76                           1000     1500
         # mgmt0  --           up     172.25.143.76                           --     1500
-        p2 = re.compile(r'^(?P<port>[a-zA-Z0-9]+) +(?P<vrf>[a-zA-Z0-9\-]+)'
-                        r' +(?P<status>[a-zA-Z]+) +(?P<ip_address>(\S+))'
-                        r' +(?P<speed>\S+) +(?P<mtu>[0-9]+)$')
+        p2 = regex_engine.compile(r'^(?P<port>[a-zA-Z0-9]+) +(?P<vrf>[a-zA-Z0-9\-]+)'
+                                  r' +(?P<status>[a-zA-Z]+) +(?P<ip_address>(\S+))'
+                                  r' +(?P<speed>\S+) +(?P<mtu>[0-9]+)$')
 
         # Ethernet      VLAN    Type Mode   Status  Reason                   Speed     Port
-        p3 = re.compile(r'^Ethernet +VLAN +Type +Mode +Status +Reason +Speed'
-                        r' +Port$')
+        p3 = regex_engine.compile(r'^Ethernet +VLAN +Type +Mode +Status +Reason +Speed'
+                                  r' +Port$')
 
         # Eth1/6        1       eth  access down    Link not connected         auto(D) --
         # Eth1/4.2      112     eth  routed down    Administratively down    auto(D) --
-        p4 = re.compile(r'^(?P<interface>[^pP][\S]+) +(?P<vlan>[a-zA-Z0-9\-]+) +'
-                        r'(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+) +'
-                        r'(?P<status>[a-z]+) +(?P<reason>[a-zA-Z\s]+) +'
-                        r'(?P<speed>[0-9a-zA-Z\(\)]+) +(?P<port>[0-9\-]+)$')
+        p4 = regex_engine.compile(r'^(?P<interface>[^pP][\S]+) +(?P<vlan>[a-zA-Z0-9\-]+) +'
+                                  r'(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+) +'
+                                  r'(?P<status>[a-z]+) +(?P<reason>[a-zA-Z\s]+) +'
+                                  r'(?P<speed>[0-9a-zA-Z\(\)]+) +(?P<port>[0-9\-]+)$')
 
         # Port-channel VLAN    Type Mode   Status  Reason                    Speed   Protocol
-        p5 = re.compile(r'^Port-channel +VLAN +Type +Mode +Status +Reason'
-                        r' +Speed +Protocol$')
+        p5 = regex_engine.compile(r'^Port-channel +VLAN +Type +Mode +Status +Reason'
+                                  r' +Speed +Protocol$')
 
         # Po8          1       eth  access down    No operational members      auto(I)  none
         # Po10         --      eth  routed up      none                                 a-40G(D)  lacp
         # Po10.1       2       eth  routed up      none                                 a-40G(D)    --
-        p6 = re.compile(r'^(?P<interface>(P|p)\S+) +(?P<vlan>\S+) '
-                        r'+(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+) '
-                        r'+(?P<status>[a-z]+) +(?P<reason>[\w\s]+) '
-                        r'+(?P<speed>\S+) +(?P<protocol>[\w\-]+)$')
+        p6 = regex_engine.compile(r'^(?P<interface>(P|p)\S+) +(?P<vlan>\S+) '
+                                  r'+(?P<type>[a-zA-Z]+) +(?P<mode>[a-z]+) '
+                                  r'+(?P<status>[a-z]+) +(?P<reason>[\w\s]+) '
+                                  r'+(?P<speed>\S+) +(?P<protocol>[\w\-]+)$')
 
         # Interface     Status     Description
-        p7 = re.compile(r'^Interface +Status +Description$')
+        p7 = regex_engine.compile(r'^Interface +Status +Description$')
 
         # Lo0           up         --
-        p8 = re.compile(r'^(?P<interface>[a-zA-Z0-9\/]+) +(?P<status>[a-z]+)'
-                        r' +(?P<description>[a-zA-Z\s\-]+)$')
+        p8 = regex_engine.compile(r'^(?P<interface>[a-zA-Z0-9\/]+) +(?P<status>[a-z]+)'
+                                  r' +(?P<description>[a-zA-Z\s\-]+)$')
 
         # Interface Secondary VLAN(Type)                    Status Reason
-        p9 = re.compile(r'^Interface +Secondary +VLAN\(Type\) +Status +Reason$')
+        p9 = regex_engine.compile(r'^Interface +Secondary +VLAN\(Type\) +Status +Reason$')
 
         # Vlan1     --                                      down   Administratively down
         # Vlan2     --                                      down   VLAN/BD is down
-        p10 = re.compile(r'^(?P<interface>[\S]+) +(?P<type>[\w\-]+) +(?P<status>[\w]+)'
-                         r' +(?P<reason>[\w\s\-\/]+)$')
+        p10 = regex_engine.compile(r'^(?P<interface>[\S]+) +(?P<type>[\w\-]+) +(?P<status>[\w]+)'
+                                   r' +(?P<reason>[\w\s\-\/]+)$')
 
         # Port           Status Reason          MTU
-        p11 = re.compile(r'^Port +Status +Reason + MTU$')
+        p11 = regex_engine.compile(r'^Port +Status +Reason + MTU$')
         # nve1           up     none            9216
-        p12 = re.compile(r'^(?P<interface>[a-zA-Z0-9]+) +(?P<status>[a-z]+)'
-                         r' +(?P<reason>[a-zA-Z\s\-]+) +(?P<mtu>[0-9]+)$')
+        p12 = regex_engine.compile(r'^(?P<interface>[a-zA-Z0-9]+) +(?P<status>[a-z]+)'
+                                   r' +(?P<reason>[a-zA-Z\s\-]+) +(?P<mtu>[0-9]+)$')
 
         # Interface                Status     IP Address                                   Encap type       MTU
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r'^Interface\s+Status\s+IP\sAddress\s+Encap\stype\s+MTU$')
 
         # Tunnel5                  up         11.5.1.1/24                                  GRE/IP             1476
-        p14 = re.compile(r'^(?P<interface>[a-zA-Z0-9]+)'
-                         r' +(?P<status>[a-zA-Z]+) +(?P<ip_address>\S+)'
-                         r' +(?P<encap_type>\S+) +(?P<mtu>[0-9]+)$')
+        p14 = regex_engine.compile(r'^(?P<interface>[a-zA-Z0-9]+)'
+                                   r' +(?P<status>[a-zA-Z]+) +(?P<ip_address>\S+)'
+                                   r' +(?P<encap_type>\S+) +(?P<mtu>[0-9]+)$')
         for line in output.splitlines():
             line = line.strip()
 
@@ -3191,76 +3397,76 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
         # interface nve1
         # interface Ethernet1/1
         # interface vlan 200
-        p1 = re.compile(r'^interface +(?P<intf_name>.*)$')
+        p1 = regex_engine.compile(r'^interface +(?P<intf_name>.*)$')
 
         # no shutdown
-        p2 = re.compile(r'^\s*no shutdown$')
+        p2 = regex_engine.compile(r'^\s*no shutdown$')
 
         # host-reachability protocol bgp
-        p3 = re.compile(r'^\s*host-reachability protocol +(?P<protocol>[a-zA-Z]+)$')
+        p3 = regex_engine.compile(r'^\s*host-reachability protocol +(?P<protocol>[a-zA-Z]+)$')
 
         # source-interface loopback1
-        p4 = re.compile(r'^\s*source-interface +(?P<src_intf>[a-zA-Z0-9\-]+)$')
+        p4 = regex_engine.compile(r'^\s*source-interface +(?P<src_intf>[a-zA-Z0-9\-]+)$')
 
         # member vni 8100
         # member vni 9100 associate-vrf
         # member vni 2001201-2001300
-        p5 = re.compile(r'^\s*member vni +(?P<vni>[0-9\-]+)( +(?P<associate_vrf>[a-zA-Z\-]+))?$')
+        p5 = regex_engine.compile(r'^\s*member vni +(?P<vni>[0-9\-]+)( +(?P<associate_vrf>[a-zA-Z\-]+))?$')
 
         # mcast-group 225.0.1.25
-        p6 = re.compile(r'^\s*mcast-group +(?P<ip>[0-9\.]+)$')
+        p6 = regex_engine.compile(r'^\s*mcast-group +(?P<ip>[0-9\.]+)$')
 
         # suppress-arp
-        p7 = re.compile(r'^\s*suppress-arp$')
+        p7 = regex_engine.compile(r'^\s*suppress-arp$')
 
         # switchport
-        p8 = re.compile(r'^switchport$')
+        p8 = regex_engine.compile(r'^switchport$')
 
         # switchport mode trunk
-        p9 = re.compile(r'^switchport +mode +(?P<mode>\S+)$')
+        p9 = regex_engine.compile(r'^switchport +mode +(?P<mode>\S+)$')
 
         # switchport trunk allowed vlan 1-99,101-199,201-1399,1401-4094
-        p10 = re.compile(r'^switchport +trunk +allowed +vlan +(?P<trunk_vlans>\S+)$')
+        p10 = regex_engine.compile(r'^switchport +trunk +allowed +vlan +(?P<trunk_vlans>\S+)$')
 
         # switchport trunk native vlan x
-        p10_1 = re.compile(r'^switchport +trunk +native +vlan +(?P<trunk_native_vlan>\S+)$')
+        p10_1 = regex_engine.compile(r'^switchport +trunk +native +vlan +(?P<trunk_native_vlan>\S+)$')
 
         # switchport access vlan x
-        p10_2 = re.compile(r'^switchport +access +vlan +(?P<access_vlan>\S+)$')
+        p10_2 = regex_engine.compile(r'^switchport +access +vlan +(?P<access_vlan>\S+)$')
 
         # channel-group 1 mode active
         # channel-group 147
-        p11 = re.compile(r'^channel-group +(?P<port_channel_int>\d+)( +mode +(?P<mode>\S+))?$')
+        p11 = regex_engine.compile(r'^channel-group +(?P<port_channel_int>\d+)( +mode +(?P<mode>\S+))?$')
 
         # speed 1000
-        p12 = re.compile(r'^speed +(?P<speed>\d+)$')
+        p12 = regex_engine.compile(r'^speed +(?P<speed>\d+)$')
 
         # duplex full
-        p13 = re.compile(r'^duplex +(?P<duplex>\S+)$')
+        p13 = regex_engine.compile(r'^duplex +(?P<duplex>\S+)$')
 
         # description DeviceA-description
-        p14 = re.compile(r'^description +(?P<description>.+)$')
+        p14 = regex_engine.compile(r'^description +(?P<description>.+)$')
 
         # vpc ID, for port-channels only
-        p15 = re.compile(r'^vpc +(?P<vpc>\S+)$')
+        p15 = regex_engine.compile(r'^vpc +(?P<vpc>\S+)$')
 
         # mtu 1500
-        p16 = re.compile(r'^mtu +(?P<mtu>\S+)$')
+        p16 = regex_engine.compile(r'^mtu +(?P<mtu>\S+)$')
 
         # ip address 10.10.6.73/30
-        p17 = re.compile(r'^ip address +(?P<ip_address>[0-9\./]+)$')
+        p17 = regex_engine.compile(r'^ip address +(?P<ip_address>[0-9\./]+)$')
 
         # vrf member TEST
-        p18 = re.compile(r'^vrf member +(?P<vrf_member>\S+)$')
+        p18 = regex_engine.compile(r'^vrf member +(?P<vrf_member>\S+)$')
 
         # no switchport
-        p19 = re.compile(r'^no switchport$')
+        p19 = regex_engine.compile(r'^no switchport$')
 
         # fabric forwarding mode anycast-gateway
-        p20 = re.compile(r'^\s*fabric forwarding mode +(?P<fabric_forwarding_mode>[a-z\-]+)$')
+        p20 = regex_engine.compile(r'^\s*fabric forwarding mode +(?P<fabric_forwarding_mode>[a-z\-]+)$')
 
         # ip address 10.2.1.1/30 secondary
-        p21 = re.compile(r'^ip address +(?P<ip_address_secondary>[0-9\./]+) secondary$')
+        p21 = regex_engine.compile(r'^ip address +(?P<ip_address_secondary>[0-9\./]+) secondary$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3471,18 +3677,18 @@ class ShowNveInterface(ShowNveInterfaceSchema):
         interface_dict = {}
 
         # Interface: nve1, State: Up, encapsulation: VXLAN
-        p1 = re.compile(r'^\s*Interface: +(?P<intf>[\w]+)\,'
-                        r' +State: +(?P<state>[\w]+)\, +encapsulation:'
-                        r' +(?P<encapsulation>[\w]+)$')
+        p1 = regex_engine.compile(r'^\s*Interface: +(?P<intf>[\w]+)\,'
+                                  r' +State: +(?P<state>[\w]+)\, +encapsulation:'
+                                  r' +(?P<encapsulation>[\w]+)$')
 
         # Source-Interface: loopback0 (primary: 10.4.0.1, secondary: 0.0.0.0)
-        p2 = re.compile(r'^\s*Source-Interface: +(?P<src_intf>[a-zA-Z0-9\-]+)'
-                        r' +\(primary: +(?P<primary>[a-zA-Z0-9\.]+)\, +secondary:'
-                        r' +(?P<secondary>[a-zA-Z0-9\.]+)\)$')
+        p2 = regex_engine.compile(r'^\s*Source-Interface: +(?P<src_intf>[a-zA-Z0-9\-]+)'
+                                  r' +\(primary: +(?P<primary>[a-zA-Z0-9\.]+)\, +secondary:'
+                                  r' +(?P<secondary>[a-zA-Z0-9\.]+)\)$')
 
         # VPC Capability: VPC-VIP-Only [not-notified]
-        p3 = re.compile(r'^\s*VPC Capability: +(?P<vpc>[a-zA-Z0-9\-]+)'
-                        r' +\[(?P<notified>[a-zA-Z\-]+)\]$')
+        p3 = regex_engine.compile(r'^\s*VPC Capability: +(?P<vpc>[a-zA-Z0-9\-]+)'
+                                  r' +\[(?P<notified>[a-zA-Z\-]+)\]$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -3593,11 +3799,11 @@ class ShowIpInterfaceBriefVrfAll(ShowIpInterfaceBriefVrfAllSchema):
             out = output
 
         # IP Interface Status for VRF "default"(1)
-        p1 = re.compile(r'^IP Interface Status for VRF "(?P<vrf>(\S+))"')
+        p1 = regex_engine.compile(r'^IP Interface Status for VRF "(?P<vrf>(\S+))"')
 
         # mgmt0                10.255.5.169    protocol-up/link-up/admin-up
-        p2 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) '
-                        r'+(?P<ip_address>[a-z0-9\.]+) +(?P<interface_status>[a-z\-\/]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) '
+                                  r'+(?P<ip_address>[a-z0-9\.]+) +(?P<interface_status>[a-z\-\/]+)$')
 
         ret_dict = {}
         # sets empty variable so it always exists. Useful for cases such as:
@@ -3669,7 +3875,7 @@ class ShowInterfaceDescription(ShowInterfaceDescriptionSchema):
         # -------------------------------------------------------------------------------
         # Eth1/1        eth    10G     --
 
-        p1 = re.compile(r'(?P<interface>(\S+)) +(?P<type>(\S+))? +(?P<speed>(\S+))? +(?P<description>(.*))$')
+        p1 = regex_engine.compile(r'(?P<interface>(\S+)) +(?P<type>(\S+))? +(?P<speed>(\S+))? +(?P<description>(.*))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3739,7 +3945,7 @@ class ShowInterfaceStatus(ShowInterfaceStatusSchema):
         flag = False
 
         # Interface     Name                Status    Reason
-        header_p0 = re.compile(r'Interface\s+Name\s+Status\s+Reason')
+        header_p0 = regex_engine.compile(r'Interface\s+Name\s+Status\s+Reason')
         
         # Captures the below header:
         #
@@ -3748,7 +3954,7 @@ class ShowInterfaceStatus(ShowInterfaceStatusSchema):
         # This is not technically needed, since the p1 pattern does not match the header, but
         # explicitly matching the header ensures this data never incorrectly makes it into the
         # parsed output.
-        header_p1 = re.compile(r"Port\s+Name\s+Status\s+Vlan\s+Duplex\s+Speed\s+Type")
+        header_p1 = regex_engine.compile(r"Port\s+Name\s+Status\s+Vlan\s+Duplex\s+Speed\s+Type")
 
         # Port          Name               Status    Vlan      Duplex  Speed   Type
         # --------------------------------------------------------------------------------
@@ -3769,7 +3975,7 @@ class ShowInterfaceStatus(ShowInterfaceStatusSchema):
         # Eth1/1        --                 connected routed    full    100G    QSFP-100G-SR1.2
         # Eth1/7        ig1ezsit-ucs01-A:e connected trunk     full    10G     10Gbase-SR 
         # Eth1/15       --                 linkFlapE routed    auto    auto    QSFP-100G-CR4
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<interface>\w\S+)\s+'
             r'(?P<name>.+?)\s+'
             # Statuses are hard-coded here. They serve as an anchor for the rest of the regular
@@ -3788,7 +3994,7 @@ class ShowInterfaceStatus(ShowInterfaceStatusSchema):
         # Eth1/4 *** FEX 2248TP  connected 1     full a-10G  Fabric Exte
         
         # Tunnel7       --                  up        no-reason 
-        p2 = re.compile(r'(?P<interface>(\S+))\s+(?P<name>([\S\s]+))(?<! )\s+(?P<status>(\S+))\s+(?P<reason>(\S+))')
+        p2 = regex_engine.compile(r'(?P<interface>(\S+))\s+(?P<name>([\S\s]+))(?<! )\s+(?P<status>(\S+))\s+(?P<reason>(\S+))')
 
         for line in out.splitlines():
             line = line.strip()
@@ -3904,93 +4110,93 @@ class ShowInterfaceCapabilities(ShowInterfaceCapabilitiesSchema):
             out = output
 
         # Match interface
-        p1 = re.compile(r'^([A-Za-z0-9/]+)$')
+        p1 = regex_engine.compile(r'^([A-Za-z0-9/]+)$')
 
         ## Model:     N9K-X9736C-FX
-        p2 = re.compile(r'^\s*Model *: +([a-zA-Z0-9-]+)')
+        p2 = regex_engine.compile(r'^\s*Model *: +([a-zA-Z0-9-]+)')
 
         # Type (SFP capable):    QSFP-H40G-AOC1M
         # Type (Non SFP):        10g
-        p3 = re.compile(r'^\s*Type\s*\([Non|SFP|sfp|Sfp]+ +[SFP|sfp|Sfp|Capable|capable]*\s*\): +([a-zA-Z0-9-]+)')
+        p3 = regex_engine.compile(r'^\s*Type\s*\([Non|SFP|sfp|Sfp]+ +[SFP|sfp|Sfp|Capable|capable]*\s*\): +([a-zA-Z0-9-]+)')
 
         # Speed:                 100,1000,10000
-        p4 = re.compile(r'^\s*Speed *: +([\d+,]+)\s*')
+        p4 = regex_engine.compile(r'^\s*Speed *: +([\d+,]+)\s*')
 
         # Duplex:                full
-        p5 = re.compile(r'^\s*Duplex *: +(half|full)\s*')
+        p5 = regex_engine.compile(r'^\s*Duplex *: +(half|full)\s*')
 
         # Trunk encap. type:     802.1Q
-        p6 = re.compile(r'^\s*Trunk +encap\. +type *: +([A-Za-z0-9.]+)\s*')
+        p6 = regex_engine.compile(r'^\s*Trunk +encap\. +type *: +([A-Za-z0-9.]+)\s*')
 
         # Channel:               yes
-        p7 = re.compile(r'^\s*Channel *: +(\w+)\s*')
+        p7 = regex_engine.compile(r'^\s*Channel *: +(\w+)\s*')
 
         # Broadcast suppression: percentage(0-100)
-        p8 = re.compile(r'^\s*Broadcast +suppression *: +(?P<type>\w+)(\((?P<value>[0-9\-]+)\))?\s*')
+        p8 = regex_engine.compile(r'^\s*Broadcast +suppression *: +(?P<type>\w+)(\((?P<value>[0-9\-]+)\))?\s*')
 
         # Flowcontrol:           rx-(off/on),tx-(off/on)
-        p9 = re.compile(r'^\s*Flowcontrol *: +(rx?-?\(?(?P<rx>[a-z/]*)\)?)?,?((tx?-?\(?(?P<tx>[a-z/]+)\)?)?)?\s*')
+        p9 = regex_engine.compile(r'^\s*Flowcontrol *: +(rx?-?\(?(?P<rx>[a-z/]*)\)?)?,?((tx?-?\(?(?P<tx>[a-z/]+)\)?)?)?\s*')
 
         # Rate mode:             dedicated
-        p10 = re.compile(r'^\s*Rate mode\s*: +((?P<rate_mode>[a-zA-Z,\-]+))?')
+        p10 = regex_engine.compile(r'^\s*Rate mode\s*: +((?P<rate_mode>[a-zA-Z,\-]+))?')
 
         # Port mode:             Routed,Switched
-        p11 = re.compile(r'^\s*Port mode\s*: +((?P<port_mode>[a-zA-Z,\-]+))?')
+        p11 = regex_engine.compile(r'^\s*Port mode\s*: +((?P<port_mode>[a-zA-Z,\-]+))?')
 
         # QOS scheduling:        rx-(8q2t),tx-(7q)
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r'^\s*QOS scheduling\s*: +(rx?-?\(?(?P<rx>[a-z0-9/\-]*)\)?)?,?((tx?-?\(?(?P<tx>[a-z0-9/\-]+)\)?)?)?\s*')
 
         # CoS rewrite:           yes
-        p13 = re.compile(r'^\s*CoS rewrite\s*: +(\w+)\s*')
+        p13 = regex_engine.compile(r'^\s*CoS rewrite\s*: +(\w+)\s*')
 
         # ToS rewrite:           yes
-        p14 = re.compile(r'^\s*ToS rewrite\s*: +(\w+)\s*')
+        p14 = regex_engine.compile(r'^\s*ToS rewrite\s*: +(\w+)\s*')
 
         # SPAN:                  yes
-        p15 = re.compile(r'^\s*SPAN\s*: +(\w+)\s*')
+        p15 = regex_engine.compile(r'^\s*SPAN\s*: +(\w+)\s*')
 
         # UDLD:                  yes
-        p16 = re.compile(r'^\s*UDLD\s*: +(\w+)\s*')
+        p16 = regex_engine.compile(r'^\s*UDLD\s*: +(\w+)\s*')
 
         # MDIX:                  yes
-        p17 = re.compile(r'^\s*MDIX\s*: +(\w+)\s*')
+        p17 = regex_engine.compile(r'^\s*MDIX\s*: +(\w+)\s*')
 
         # TDR capable:           no
-        p18 = re.compile(r'^\s*TDR capable\s*: +(\w+)\s*')
+        p18 = regex_engine.compile(r'^\s*TDR capable\s*: +(\w+)\s*')
 
         # Link Debounce:         yes
-        p19 = re.compile(r'^\s*Link Debounce\s*: +(\w+)\s*')
+        p19 = regex_engine.compile(r'^\s*Link Debounce\s*: +(\w+)\s*')
 
         # Link Debounce Time:    yes
-        p20 = re.compile(r'^\s*Link Debounce Time\s*: +(\w+)\s*')
+        p20 = regex_engine.compile(r'^\s*Link Debounce Time\s*: +(\w+)\s*')
 
         # FEX Fabric:            yes
-        p21 = re.compile(r'^\s*FEX Fabric\s*: +(\w+)\s*')
+        p21 = regex_engine.compile(r'^\s*FEX Fabric\s*: +(\w+)\s*')
 
         # dot1Q-tunnel mode:     yes
-        p22 = re.compile(r'^\s*dot1Q-tunnel mode\s*: +(\w+)\s*')
+        p22 = regex_engine.compile(r'^\s*dot1Q-tunnel mode\s*: +(\w+)\s*')
 
         # Pvlan Trunk capable:   no
-        p23 = re.compile(r'^\s*Pvlan Trunk capable\s*: +(\w+)\s*')
+        p23 = regex_engine.compile(r'^\s*Pvlan Trunk capable\s*: +(\w+)\s*')
 
         # Port Group Members:    4
-        p24 = re.compile(r'^\s*Port Group Members\s*: +(\d+)\s*')
+        p24 = regex_engine.compile(r'^\s*Port Group Members\s*: +(\d+)\s*')
 
         # EEE (efficient-eth):   no
-        p25 = re.compile(r'^\s*EEE \(efficient-eth\)\s*: +(\w+)\s*')
+        p25 = regex_engine.compile(r'^\s*EEE \(efficient-eth\)\s*: +(\w+)\s*')
 
         # PFC capable:           yes
-        p26 = re.compile(r'^\s*PFC capable\s*: +(\w+)\s*')
+        p26 = regex_engine.compile(r'^\s*PFC capable\s*: +(\w+)\s*')
 
         # Buffer Boost capable:  no
-        p27 = re.compile(r'^\s*Buffer Boost capable\s*: +(\w+)\s*')
+        p27 = regex_engine.compile(r'^\s*Buffer Boost capable\s*: +(\w+)\s*')
 
         # Breakout capable:      no
-        p28 = re.compile(r'^\s*Breakout capable\s*: +(\w+)\s*')
+        p28 = regex_engine.compile(r'^\s*Breakout capable\s*: +(\w+)\s*')
 
         # MACSEC capable:        no
-        p29 = re.compile(r'^\s*MACSEC capable\s*: +(\w+)\s*')
+        p29 = regex_engine.compile(r'^\s*MACSEC capable\s*: +(\w+)\s*')
 
         parsed_cap_dict = {}
 
@@ -4253,75 +4459,75 @@ class ShowInterfaceTransceiver(ShowInterfaceTransceiverSchema):
             out = output
 
         # match interface name
-        p1 = re.compile(r'^\s*(?P<intf>(Ethernet|Eth)[0-9/]+)')
+        p1 = regex_engine.compile(r'^\s*(?P<intf>(Ethernet|Eth)[0-9/]+)')
 
-        p2 = re.compile(r'^\s*transceiver\s+is\s*(not)?\s+present')
+        p2 = regex_engine.compile(r'^\s*transceiver\s+is\s*(not)?\s+present')
 
-        p3 = re.compile(r'^\s*type is\s+(?P<type>[A-Za-z0-9-]+)\s*')
+        p3 = regex_engine.compile(r'^\s*type is\s+(?P<type>[A-Za-z0-9-]+)\s*')
 
-        p4 = re.compile(r'^\s*name is\s+(?P<name>[A-Za-z0-9-]+)\s*')
+        p4 = regex_engine.compile(r'^\s*name is\s+(?P<name>[A-Za-z0-9-]+)\s*')
 
-        p5 = re.compile(r'^\s*part number is\s+(?P<part_number>[A-Za-z0-9-]+)\s*')
+        p5 = regex_engine.compile(r'^\s*part number is\s+(?P<part_number>[A-Za-z0-9-]+)\s*')
 
-        p6 = re.compile(r'^\s*revision is\s+(?P<rev>[A-Z0-9]+)\s*')
+        p6 = regex_engine.compile(r'^\s*revision is\s+(?P<rev>[A-Z0-9]+)\s*')
 
-        p7 = re.compile(r'^\s*serial\s+number\s+is\s+(?P<sn>[A-Z0-9-]+)\s*')
+        p7 = regex_engine.compile(r'^\s*serial\s+number\s+is\s+(?P<sn>[A-Z0-9-]+)\s*')
 
-        p8 = re.compile(r'^\s*nominal\s+bitrate\s+is\s+(?P<bit_rate>\d+) MBit/sec')
+        p8 = regex_engine.compile(r'^\s*nominal\s+bitrate\s+is\s+(?P<bit_rate>\d+) MBit/sec')
 
-        p9 = re.compile(r'^\s*cisco\s+id\s+is\s+(?P<cis_id>[0-9x]+)')
+        p9 = regex_engine.compile(r'^\s*cisco\s+id\s+is\s+(?P<cis_id>[0-9x]+)')
 
-        p10 = re.compile(r'^\s*cisco\s+part\s+number\s+is\s+(?P<cis_part_num>[0-9-]+)\s*')
+        p10 = regex_engine.compile(r'^\s*cisco\s+part\s+number\s+is\s+(?P<cis_part_num>[0-9-]+)\s*')
 
-        p11 = re.compile(r'^\s*cisco\s+product\s+id\s+is\s+(?P<prod_id>[A-Z0-9-]+)\s*')
+        p11 = regex_engine.compile(r'^\s*cisco\s+product\s+id\s+is\s+(?P<prod_id>[A-Z0-9-]+)\s*')
 
-        p12 = re.compile(r'^\s*cisco\s+version\s+id\s+is\s+(?P<ver_id>[A-Z0-9]+)\s*')
+        p12 = regex_engine.compile(r'^\s*cisco\s+version\s+id\s+is\s+(?P<ver_id>[A-Z0-9]+)\s*')
 
-        p13 = re.compile(r'^\s*firmware\s+version\s+is\s+(?P<fw_ver>[0-9.]+)\s*')
+        p13 = regex_engine.compile(r'^\s*firmware\s+version\s+is\s+(?P<fw_ver>[0-9.]+)\s*')
 
-        p14 = re.compile(r'^\s*Link\s+length\s+\w+\s+is\s+(?P<link_length>[0-9.]+\s*\w+)\s*')
+        p14 = regex_engine.compile(r'^\s*Link\s+length\s+\w+\s+is\s+(?P<link_length>[0-9.]+\s*\w+)\s*')
 
-        p15 = re.compile(r'^\s*Nominal\s+transmitter\s+wavelength\s+is\s+(?P<nom_tran_wl>[0-9.]+\s*\w+)\s*')
+        p15 = regex_engine.compile(r'^\s*Nominal\s+transmitter\s+wavelength\s+is\s+(?P<nom_tran_wl>[0-9.]+\s*\w+)\s*')
 
-        p16 = re.compile(r'^\s*Wavelength\s+tolerance\s+is\s+(?P<wl_tol>[0-9.]+\s*\w+)\s*')
+        p16 = regex_engine.compile(r'^\s*Wavelength\s+tolerance\s+is\s+(?P<wl_tol>[0-9.]+\s*\w+)\s*')
 
-        p17 = re.compile(r'^\s*host\s+lane\s+count\s+is\s+(?P<host_lane_count>\d+)')
+        p17 = regex_engine.compile(r'^\s*host\s+lane\s+count\s+is\s+(?P<host_lane_count>\d+)')
 
-        p18 = re.compile(r'^\s*media\s+lane\s+count\s+is\s+(?P<media_lane_count>\d+)')
+        p18 = regex_engine.compile(r'^\s*media\s+lane\s+count\s+is\s+(?P<media_lane_count>\d+)')
 
-        p19 = re.compile(r'^\s*max\s+module\s+temperature\s+is\s+(?P<max_mod_temp>\d+)')
+        p19 = regex_engine.compile(r'^\s*max\s+module\s+temperature\s+is\s+(?P<max_mod_temp>\d+)')
 
-        p20 = re.compile(r'^\s*min\s+module\s+temperature\s+is\s+(?P<min_mod_temp>\d+)')
+        p20 = regex_engine.compile(r'^\s*min\s+module\s+temperature\s+is\s+(?P<min_mod_temp>\d+)')
 
-        p21 = re.compile(r'^\s*min\s+operational\s+voltage\s+is\s+(?P<min_oper_volt>[0-9.]+\s+\w+)')
+        p21 = regex_engine.compile(r'^\s*min\s+operational\s+voltage\s+is\s+(?P<min_oper_volt>[0-9.]+\s+\w+)')
 
-        p22 = re.compile(r'^\s*vendor\s+OUI\s+is\s+(?P<oui>[a-zA-Z0-9]+)')
+        p22 = regex_engine.compile(r'^\s*vendor\s+OUI\s+is\s+(?P<oui>[a-zA-Z0-9]+)')
 
-        p23 = re.compile(r'^\s*date\s+code\s+is\s+(?P<date_code>\d+)')
+        p23 = regex_engine.compile(r'^\s*date\s+code\s+is\s+(?P<date_code>\d+)')
 
-        p24 = re.compile(r'^\s*clei\s+code\s+is\s+(?P<clei>[A-Za-z0-9]+)')
+        p24 = regex_engine.compile(r'^\s*clei\s+code\s+is\s+(?P<clei>[A-Za-z0-9]+)')
 
-        p25 = re.compile(r'^\s*power\s+class\s+is\s+(?P<power_class>[0-9a-zA-Z\(\) .]+)')
+        p25 = regex_engine.compile(r'^\s*power\s+class\s+is\s+(?P<power_class>[0-9a-zA-Z\(\) .]+)')
 
-        p26 = re.compile(r'^\s*max\s+power\s+is\s+(?P<max_power>[0-9.]+)\s+W\s*')
+        p26 = regex_engine.compile(r'^\s*max\s+power\s+is\s+(?P<max_power>[0-9.]+)\s+W\s*')
 
-        p27 = re.compile(r'^\s*near-end\s+lanes\s+used\s+(?P<near_end_lanes>\w+)')
+        p27 = regex_engine.compile(r'^\s*near-end\s+lanes\s+used\s+(?P<near_end_lanes>\w+)')
 
-        p28 = re.compile(r'^\s*far-end\s+lane\s+code\s+for\s+(?P<far_end_lanes>.*)\s*')
+        p28 = regex_engine.compile(r'^\s*far-end\s+lane\s+code\s+for\s+(?P<far_end_lanes>.*)\s*')
 
-        p29 = re.compile(r'^\s*media\s+interface\s+is\s+(?P<media_intf>.*)\s*')
+        p29 = regex_engine.compile(r'^\s*media\s+interface\s+is\s+(?P<media_intf>.*)\s*')
 
-        p30 = re.compile(r'^\s*Advertising\s+code\s+is\s+(?P<adv_code>.*)\s*')
+        p30 = regex_engine.compile(r'^\s*Advertising\s+code\s+is\s+(?P<adv_code>.*)\s*')
 
-        p31 = re.compile(r'^\s*Host\s+electrical\s+interface\s+code\s+is\s+(?P<host_elec_intf>.*)\s*')
+        p31 = regex_engine.compile(r'^\s*Host\s+electrical\s+interface\s+code\s+is\s+(?P<host_elec_intf>.*)\s*')
 
-        p32 = re.compile(r'^\s*media\s+interface\s+advertising\s+code\s+is\s+(?P<media_intf_adv_code>.*)\s*')
+        p32 = regex_engine.compile(r'^\s*media\s+interface\s+advertising\s+code\s+is\s+(?P<media_intf_adv_code>.*)\s*')
 
-        p33 = re.compile(r'^\s*Cable\s+Length\s+is\s+(?P<cable_len>[0-9.]+)')
+        p33 = regex_engine.compile(r'^\s*Cable\s+Length\s+is\s+(?P<cable_len>[0-9.]+)')
 
-        p34 = re.compile(r'^\s*CMIS\s+version\s+is\s+(?P<cmis_ver>\d+)')
+        p34 = regex_engine.compile(r'^\s*CMIS\s+version\s+is\s+(?P<cmis_ver>\d+)')
 
-        p35 = re.compile(r'^\s*cable\s+attenuation\s+is\s+(?P<cable_attenuation>.*)\s*')
+        p35 = regex_engine.compile(r'^\s*cable\s+attenuation\s+is\s+(?P<cable_attenuation>.*)\s*')
 
         parsed_xcvr_dict = {}
         for line in out.splitlines():
@@ -4590,125 +4796,125 @@ class ShowInterfaceTransceiverDetails(ShowInterfaceTransceiverDetailsSchema):
             out = output
 
         # match interface name
-        p1 = re.compile(r'^\s*(?P<intf>(Ethernet|Eth)[0-9/]+)')
+        p1 = regex_engine.compile(r'^\s*(?P<intf>(Ethernet|Eth)[0-9/]+)')
 
-        p2 = re.compile(r'^\s*transceiver\s+is\s*(not)?\s+present')
+        p2 = regex_engine.compile(r'^\s*transceiver\s+is\s*(not)?\s+present')
 
-        p3 = re.compile(r'^\s*type is\s+(?P<type>[A-Za-z0-9-]+)\s*')
+        p3 = regex_engine.compile(r'^\s*type is\s+(?P<type>[A-Za-z0-9-]+)\s*')
 
-        p4 = re.compile(r'^\s*name is\s+(?P<name>[A-Za-z0-9-]+)\s*')
+        p4 = regex_engine.compile(r'^\s*name is\s+(?P<name>[A-Za-z0-9-]+)\s*')
 
-        p5 = re.compile(r'^\s*part number is\s+(?P<part_number>[A-Za-z0-9-]+)\s*')
+        p5 = regex_engine.compile(r'^\s*part number is\s+(?P<part_number>[A-Za-z0-9-]+)\s*')
 
-        p6 = re.compile(r'^\s*revision is\s+(?P<rev>[A-Z0-9]+)\s*')
+        p6 = regex_engine.compile(r'^\s*revision is\s+(?P<rev>[A-Z0-9]+)\s*')
 
-        p7 = re.compile(r'^\s*serial\s+number\s+is\s+(?P<sn>[A-Z0-9-]+)\s*')
+        p7 = regex_engine.compile(r'^\s*serial\s+number\s+is\s+(?P<sn>[A-Z0-9-]+)\s*')
 
-        p8 = re.compile(r'^\s*nominal\s+bitrate\s+is\s+(?P<bit_rate>\d+) MBit/sec')
+        p8 = regex_engine.compile(r'^\s*nominal\s+bitrate\s+is\s+(?P<bit_rate>\d+) MBit/sec')
 
-        p9 = re.compile(r'^\s*cisco\s+id\s+is\s+(?P<cis_id>[0-9x]+)')
+        p9 = regex_engine.compile(r'^\s*cisco\s+id\s+is\s+(?P<cis_id>[0-9x]+)')
 
-        p10 = re.compile(r'^\s*cisco\s+part\s+number\s+is\s+(?P<cis_part_num>[0-9-]+)\s*')
+        p10 = regex_engine.compile(r'^\s*cisco\s+part\s+number\s+is\s+(?P<cis_part_num>[0-9-]+)\s*')
 
-        p11 = re.compile(r'^\s*cisco\s+product\s+id\s+is\s+(?P<prod_id>[A-Z0-9-]+)\s*')
+        p11 = regex_engine.compile(r'^\s*cisco\s+product\s+id\s+is\s+(?P<prod_id>[A-Z0-9-]+)\s*')
 
-        p12 = re.compile(r'^\s*cisco\s+version\s+id\s+is\s+(?P<ver_id>[A-Z0-9]+)\s*')
+        p12 = regex_engine.compile(r'^\s*cisco\s+version\s+id\s+is\s+(?P<ver_id>[A-Z0-9]+)\s*')
 
-        p13 = re.compile(r'^\s*firmware\s+version\s+is\s+(?P<fw_ver>[0-9.]+)\s*')
+        p13 = regex_engine.compile(r'^\s*firmware\s+version\s+is\s+(?P<fw_ver>[0-9.]+)\s*')
 
-        p14 = re.compile(r'^\s*Link\s+length\s+\w+\s+is\s+(?P<link_length>[0-9.]+\s*\w+)\s*')
+        p14 = regex_engine.compile(r'^\s*Link\s+length\s+\w+\s+is\s+(?P<link_length>[0-9.]+\s*\w+)\s*')
 
-        p15 = re.compile(r'^\s*Nominal\s+transmitter\s+wavelength\s+is\s+(?P<nom_tran_wl>[0-9.]+\s*\w+)\s*')
+        p15 = regex_engine.compile(r'^\s*Nominal\s+transmitter\s+wavelength\s+is\s+(?P<nom_tran_wl>[0-9.]+\s*\w+)\s*')
 
-        p16 = re.compile(r'^\s*Wavelength\s+tolerance\s+is\s+(?P<wl_tol>[0-9.]+\s*\w+)\s*')
+        p16 = regex_engine.compile(r'^\s*Wavelength\s+tolerance\s+is\s+(?P<wl_tol>[0-9.]+\s*\w+)\s*')
 
-        p17 = re.compile(r'^\s*host\s+lane\s+count\s+is\s+(?P<host_lane_count>\d+)')
+        p17 = regex_engine.compile(r'^\s*host\s+lane\s+count\s+is\s+(?P<host_lane_count>\d+)')
 
-        p18 = re.compile(r'^\s*media\s+lane\s+count\s+is\s+(?P<media_lane_count>\d+)')
+        p18 = regex_engine.compile(r'^\s*media\s+lane\s+count\s+is\s+(?P<media_lane_count>\d+)')
 
-        p19 = re.compile(r'^\s*max\s+module\s+temperature\s+is\s+(?P<max_mod_temp>\d+)')
+        p19 = regex_engine.compile(r'^\s*max\s+module\s+temperature\s+is\s+(?P<max_mod_temp>\d+)')
 
-        p20 = re.compile(r'^\s*min\s+module\s+temperature\s+is\s+(?P<min_mod_temp>\d+)')
+        p20 = regex_engine.compile(r'^\s*min\s+module\s+temperature\s+is\s+(?P<min_mod_temp>\d+)')
 
-        p21 = re.compile(r'^\s*min\s+operational\s+voltage\s+is\s+(?P<min_oper_volt>[0-9.]+\s+\w+)')
+        p21 = regex_engine.compile(r'^\s*min\s+operational\s+voltage\s+is\s+(?P<min_oper_volt>[0-9.]+\s+\w+)')
 
-        p22 = re.compile(r'^\s*vendor\s+OUI\s+is\s+(?P<oui>[a-zA-Z0-9]+)')
+        p22 = regex_engine.compile(r'^\s*vendor\s+OUI\s+is\s+(?P<oui>[a-zA-Z0-9]+)')
 
-        p23 = re.compile(r'^\s*date\s+code\s+is\s+(?P<date_code>\d+)')
+        p23 = regex_engine.compile(r'^\s*date\s+code\s+is\s+(?P<date_code>\d+)')
 
-        p24 = re.compile(r'^\s*clei\s+code\s+is\s+(?P<clei>[A-Za-z0-9]+)')
+        p24 = regex_engine.compile(r'^\s*clei\s+code\s+is\s+(?P<clei>[A-Za-z0-9]+)')
 
-        p25 = re.compile(r'^\s*power\s+class\s+is\s+(?P<power_class>[0-9a-zA-Z\(\) .]+)')
+        p25 = regex_engine.compile(r'^\s*power\s+class\s+is\s+(?P<power_class>[0-9a-zA-Z\(\) .]+)')
 
-        p26 = re.compile(r'^\s*max\s+power\s+is\s+(?P<max_power>[0-9.]+)\s+W\s*')
+        p26 = regex_engine.compile(r'^\s*max\s+power\s+is\s+(?P<max_power>[0-9.]+)\s+W\s*')
 
-        p27 = re.compile(r'^\s*near-end\s+lanes\s+used\s+(?P<near_end_lanes>\w+)')
+        p27 = regex_engine.compile(r'^\s*near-end\s+lanes\s+used\s+(?P<near_end_lanes>\w+)')
 
-        p28 = re.compile(r'^\s*far-end\s+lane\s+code\s+for\s+(?P<far_end_lanes>.*)\s*')
+        p28 = regex_engine.compile(r'^\s*far-end\s+lane\s+code\s+for\s+(?P<far_end_lanes>.*)\s*')
 
-        p29 = re.compile(r'^\s*media\s+interface\s+is\s+(?P<media_intf>.*)\s*')
+        p29 = regex_engine.compile(r'^\s*media\s+interface\s+is\s+(?P<media_intf>.*)\s*')
 
-        p30 = re.compile(r'^\s*Advertising\s+code\s+is\s+(?P<adv_code>.*)\s*')
+        p30 = regex_engine.compile(r'^\s*Advertising\s+code\s+is\s+(?P<adv_code>.*)\s*')
 
-        p31 = re.compile(r'^\s*Host\s+electrical\s+interface\s+code\s+is\s+(?P<host_elec_intf>.*)\s*')
+        p31 = regex_engine.compile(r'^\s*Host\s+electrical\s+interface\s+code\s+is\s+(?P<host_elec_intf>.*)\s*')
 
-        p32 = re.compile(r'^\s*media\s+interface\s+advertising\s+code\s+is\s+(?P<media_intf_adv_code>.*)\s*')
+        p32 = regex_engine.compile(r'^\s*media\s+interface\s+advertising\s+code\s+is\s+(?P<media_intf_adv_code>.*)\s*')
 
-        p33 = re.compile(r'^\s*Cable\s+Length\s+is\s+(?P<cable_len>[0-9.]+)')
+        p33 = regex_engine.compile(r'^\s*Cable\s+Length\s+is\s+(?P<cable_len>[0-9.]+)')
 
-        p34 = re.compile(r'^\s*CMIS\s+version\s+is\s+(?P<cmis_ver>\d+)')
+        p34 = regex_engine.compile(r'^\s*CMIS\s+version\s+is\s+(?P<cmis_ver>\d+)')
 
-        p35 = re.compile(r'^\s*cable\s+attenuation\s+is\s+(?P<cable_attenuation>.*)\s*')
+        p35 = regex_engine.compile(r'^\s*cable\s+attenuation\s+is\s+(?P<cable_attenuation>.*)\s*')
 
-        p36 = re.compile(r'^\s*DOM\s+is\s+not\s+supported')
+        p36 = regex_engine.compile(r'^\s*DOM\s+is\s+not\s+supported')
 
-        p37 = re.compile(r'^\s*(?P<lane>Lane)\s+Number:(?P<lane_num>\d+\s+Network\s+Lane)')
+        p37 = regex_engine.compile(r'^\s*(?P<lane>Lane)\s+Number:(?P<lane_num>\d+\s+Network\s+Lane)')
 
         # SFP Detail Diagnostics Information
         # SFP Detail Diagnostics Information (internal calibration)
-        p37_1 = re.compile(r'^SFP\s+Detail\s+Diagnostics\s+Information(\s+\(internal\s+calibration\))?$')
-
-        p38 = re.compile(r'^\s*(?P<temp>Temperature)\s+'
-                         r'(?P<curr>[0-9.NAna/-]+)\s?C?(\s+)?'
-                         r'(?P<alarm>[+-]+)?\s+'
-                         r'(?P<high_alarm>[0-9.NAna/-]+)\s?C?\s+'
-                         r'(?P<low_alarm>[0-9.NAna/-]+)\s?C?\s+'
-                         r'(?P<high_warn>[0-9.NAna/-]+)\s?C?\s+'
-                         r'(?P<low_warn>[0-9.NAna/-]+)\s?C?')
-
-        p39 = re.compile(r'^\s*(?P<voltage>Voltage)\s+'
-                         r'(?P<curr>[0-9.NAna/-]+)\s?V?(\s+)?'
-                         r'(?P<alarm>[+-]+)?\s+'
-                         r'(?P<high_alarm>[0-9.NAna/-]+)\s?V?\s+'
-                         r'(?P<low_alarm>[0-9.NAna/-]+)\s?V?\s+'
-                         r'(?P<high_warn>[0-9.NAna/-]+)\s?V?\s+'
-                         r'(?P<low_warn>[0-9.NAna/-]+)\s?V?')
-
-        p40 = re.compile(r'^\s*(?P<current>Current)\s+'
-                         r'(?P<curr>[0-9.NAna/-]+)\s?(mA)?(\s+)?'
-                         r'(?P<alarm>[+-]+)?\s+'
-                         r'(?P<high_alarm>[0-9.NAna/-]+)\s?(mA)?\s+'
-                         r'(?P<low_alarm>[0-9.NAna/-]+)\s?(mA)?\s+'
-                         r'(?P<high_warn>[0-9.NAna/-]+)\s?(mA)?\s+'
-                         r'(?P<low_warn>[0-9.NAna/-]+)\s?(mA)?')
-
-        p41 = re.compile(r'^\s*(?P<tx_power>Tx Power)\s+'
-                         r'(?P<curr>[0-9.NAna/-]+)\s?(dBm)?(\s+)?'
-                         r'(?P<alarm>[+-]+)?\s+'
-                         r'(?P<high_alarm>[0-9.NAna/-]+)\s?(dBm)?\s+'
-                         r'(?P<low_alarm>[0-9.NAna/-]+)\s?(dBm)?\s+'
-                         r'(?P<high_warn>[0-9.NAna/-]+)\s?(dBm)?\s+'
-                         r'(?P<low_warn>[0-9.NAna/-]+)\s?(dBm)?')
-
-        p42 = re.compile(r'^\s*(?P<rx_power>Rx Power)\s+'
-                         r'(?P<curr>[0-9.NAna/-]+)\s?(dBm)?(\s+)?'
-                         r'(?P<alarm>[+-]+)?\s+'
-                         r'(?P<high_alarm>[0-9.NAna/-]+)\s?(dBm)?\s+'
-                         r'(?P<low_alarm>[0-9.NAna/-]+)\s?(dBm)?\s+'
-                         r'(?P<high_warn>[0-9.NAna/-]+)\s?(dBm)?\s+'
-                         r'(?P<low_warn>[0-9.NAna/-]+)\s?(dBm)?')
-
-        p43 = re.compile(r'^\s*Transmit\s+Fault\s+Count\s+=\s+(?P<fault_count>\d+)')
+        p37_1 = regex_engine.compile(r'^SFP\s+Detail\s+Diagnostics\s+Information(\s+\(internal\s+calibration\))?$')
+
+        p38 = regex_engine.compile(r'^\s*(?P<temp>Temperature)\s+'
+                                   r'(?P<curr>[0-9.NAna/-]+)\s?C?(\s+)?'
+                                   r'(?P<alarm>[+-]+)?\s+'
+                                   r'(?P<high_alarm>[0-9.NAna/-]+)\s?C?\s+'
+                                   r'(?P<low_alarm>[0-9.NAna/-]+)\s?C?\s+'
+                                   r'(?P<high_warn>[0-9.NAna/-]+)\s?C?\s+'
+                                   r'(?P<low_warn>[0-9.NAna/-]+)\s?C?')
+
+        p39 = regex_engine.compile(r'^\s*(?P<voltage>Voltage)\s+'
+                                   r'(?P<curr>[0-9.NAna/-]+)\s?V?(\s+)?'
+                                   r'(?P<alarm>[+-]+)?\s+'
+                                   r'(?P<high_alarm>[0-9.NAna/-]+)\s?V?\s+'
+                                   r'(?P<low_alarm>[0-9.NAna/-]+)\s?V?\s+'
+                                   r'(?P<high_warn>[0-9.NAna/-]+)\s?V?\s+'
+                                   r'(?P<low_warn>[0-9.NAna/-]+)\s?V?')
+
+        p40 = regex_engine.compile(r'^\s*(?P<current>Current)\s+'
+                                   r'(?P<curr>[0-9.NAna/-]+)\s?(mA)?(\s+)?'
+                                   r'(?P<alarm>[+-]+)?\s+'
+                                   r'(?P<high_alarm>[0-9.NAna/-]+)\s?(mA)?\s+'
+                                   r'(?P<low_alarm>[0-9.NAna/-]+)\s?(mA)?\s+'
+                                   r'(?P<high_warn>[0-9.NAna/-]+)\s?(mA)?\s+'
+                                   r'(?P<low_warn>[0-9.NAna/-]+)\s?(mA)?')
+
+        p41 = regex_engine.compile(r'^\s*(?P<tx_power>Tx Power)\s+'
+                                   r'(?P<curr>[0-9.NAna/-]+)\s?(dBm)?(\s+)?'
+                                   r'(?P<alarm>[+-]+)?\s+'
+                                   r'(?P<high_alarm>[0-9.NAna/-]+)\s?(dBm)?\s+'
+                                   r'(?P<low_alarm>[0-9.NAna/-]+)\s?(dBm)?\s+'
+                                   r'(?P<high_warn>[0-9.NAna/-]+)\s?(dBm)?\s+'
+                                   r'(?P<low_warn>[0-9.NAna/-]+)\s?(dBm)?')
+
+        p42 = regex_engine.compile(r'^\s*(?P<rx_power>Rx Power)\s+'
+                                   r'(?P<curr>[0-9.NAna/-]+)\s?(dBm)?(\s+)?'
+                                   r'(?P<alarm>[+-]+)?\s+'
+                                   r'(?P<high_alarm>[0-9.NAna/-]+)\s?(dBm)?\s+'
+                                   r'(?P<low_alarm>[0-9.NAna/-]+)\s?(dBm)?\s+'
+                                   r'(?P<high_warn>[0-9.NAna/-]+)\s?(dBm)?\s+'
+                                   r'(?P<low_warn>[0-9.NAna/-]+)\s?(dBm)?')
+
+        p43 = regex_engine.compile(r'^\s*Transmit\s+Fault\s+Count\s+=\s+(?P<fault_count>\d+)')
 
         parsed_xcvr_dict = {}
         xcvr_lane = ''
@@ -5025,10 +5231,10 @@ class ShowInterfaceFec(ShowInterfaceFecSchema):
         else:
             out = output
 
-        p = re.compile(r'^\s*(?P<name>[Ethernet/0-9]+)\s+'
-                       r'(?P<ifIdx>[xa-f0-9]+)\s+(?P<admin_fec>\w+)\s+'
-                       r'(?P<oper_fec>\S+)\s+(?P<status>\w+)\s+'
-                       r'(?P<speed>\w+|\d+)\s+(?P<type>\S+)')
+        p = regex_engine.compile(r'^\s*(?P<name>[Ethernet/0-9]+)\s+'
+                                 r'(?P<ifIdx>[xa-f0-9]+)\s+(?P<admin_fec>\w+)\s+'
+                                 r'(?P<oper_fec>\S+)\s+(?P<status>\w+)\s+'
+                                 r'(?P<speed>\w+|\d+)\s+(?P<type>\S+)')
 
         parsed_fec_dict = {}
         for line in out.splitlines():
@@ -5090,14 +5296,14 @@ class ShowInterfaceHardwareMap(ShowInterfaceHardwareMapSchema):
         else:
             out = output
 
-        p = re.compile(r'^\s*(?P<name>[PoEthernet/0-9]+)\s+'
-                       r'(?P<ifIdx>[xa-f0-9]+)\s+(?P<smod>\S+)\s+'
-                       r'(?P<unit>\S+)\s+(?P<hport>\S+)\s+'
-                       r'(?P<fport>\S+)\s+(?P<nport>\S+)\s+'
-                       r'(?P<vport>\S+)\s+(?P<slice>\S+)\s+'
-                       r'(?P<sport>\S+)\s+(?P<srcid>\S+)\s+'
-                       r'(?P<macid>\S+)?\s+(?P<macsp>\S+)?\s+'
-                       r'(?P<vif>\S+)\s+(?P<block>\S+)\s+(?P<blksrcid>\S+)\s*')
+        p = regex_engine.compile(r'^\s*(?P<name>[PoEthernet/0-9]+)\s+'
+                                 r'(?P<ifIdx>[xa-f0-9]+)\s+(?P<smod>\S+)\s+'
+                                 r'(?P<unit>\S+)\s+(?P<hport>\S+)\s+'
+                                 r'(?P<fport>\S+)\s+(?P<nport>\S+)\s+'
+                                 r'(?P<vport>\S+)\s+(?P<slice>\S+)\s+'
+                                 r'(?P<sport>\S+)\s+(?P<srcid>\S+)\s+'
+                                 r'(?P<macid>\S+)?\s+(?P<macsp>\S+)?\s+'
+                                 r'(?P<vif>\S+)\s+(?P<block>\S+)\s+(?P<blksrcid>\S+)\s*')
         parsed_hw_map_dict = {}
 
         for line in out.splitlines():
@@ -5183,16 +5389,16 @@ class ShowInterfaceCounters(ShowInterfaceCountersSchema):
         #Port                                    OutOctets                     OutUcastPkts
         #Port                                 OutMcastPkts                     OutBcastPkts
         # Port                                       InPkts                          OutPkts
-        p0 = re.compile(r'Port\s+(?:(?P<in_octets>InOctets)|(?P<out_octets>OutOctets)|'
-                        r'(?P<in_mcast_pkts>InMcastPkts)|(?P<out_mcast_pkts>OutMcastPkts)|'
-                        r'(?P<in_pkts>InPkts))\s+'
-                        r'(?:(?P<in_ucast_pkts>InUcastPkts)|(?P<in_bcast_pkts>InBcastPkts)|'
-                        r'(?P<out_ucast_pkts>OutUcastPkts)|(?P<out_bcast_pkts>OutBcastPkts)|'
-                        r'(?P<out_pkts>OutPkts))')
+        p0 = regex_engine.compile(r'Port\s+(?:(?P<in_octets>InOctets)|(?P<out_octets>OutOctets)|'
+                                  r'(?P<in_mcast_pkts>InMcastPkts)|(?P<out_mcast_pkts>OutMcastPkts)|'
+                                  r'(?P<in_pkts>InPkts))\s+'
+                                  r'(?:(?P<in_ucast_pkts>InUcastPkts)|(?P<in_bcast_pkts>InBcastPkts)|'
+                                  r'(?P<out_ucast_pkts>OutUcastPkts)|(?P<out_bcast_pkts>OutBcastPkts)|'
+                                  r'(?P<out_pkts>OutPkts))')
 
         #Eth1/46                                  21454282                           199828
         # Vlan2                                     --                                --
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'(?P<interface>\S+)\s+(?P<val1>(?:\d+)|(?:--))\s+(?P<val2>(?:\d+)|(?:--))')
 
         for line in out.splitlines():
@@ -5285,23 +5491,23 @@ class ShowInterfaceCountersErrors(ShowInterfaceCountersErrorsSchema):
         # Port          Align-Err    FCS-Err   Xmit-Err    Rcv-Err  UnderSize OutDiscards
         # Port         Single-Col  Multi-Col   Late-Col  Exces-Col  Carri-Sen       Runts
         # Port          Giants SQETest-Err Deferred-Tx IntMacTx-Er IntMacRx-Er Symbol-Err
-        p0 = re.compile(r'^Port\s+(?:(?P<align_err>Align-Err).*(?P<fcs_err>FCS-Err).*(?P<xmit_err>Xmit-Err).*(?P<rcv_err>Rcv-Err).*(?P<undersize>UnderSize).*(?P<out_discards>OutDiscards))$|'
-                        r'^Port\s+(?:(?P<single_col>Single-Col).*(?P<multi_col>Multi-Col).*(?P<late_col>Late-Col).*(?P<exces_col>Exces-Col).*(?P<carri_sen>Carri-Sen).*(?P<runts>Runts))$|'
-                        r'^Port\s+(?:(?P<giants>Giants).*(?P<sqetest_err>SQETest-Err).*(?P<deffered_tx>Deferred-Tx).*(?P<intmactx_er>IntMacTx-Er).*(?P<intmacrx_er>IntMacRx-Er).*(?P<symbol_err>Symbol-Err))$')
+        p0 = regex_engine.compile(r'^Port\s+(?:(?P<align_err>Align-Err).*(?P<fcs_err>FCS-Err).*(?P<xmit_err>Xmit-Err).*(?P<rcv_err>Rcv-Err).*(?P<undersize>UnderSize).*(?P<out_discards>OutDiscards))$|'
+                                  r'^Port\s+(?:(?P<single_col>Single-Col).*(?P<multi_col>Multi-Col).*(?P<late_col>Late-Col).*(?P<exces_col>Exces-Col).*(?P<carri_sen>Carri-Sen).*(?P<runts>Runts))$|'
+                                  r'^Port\s+(?:(?P<giants>Giants).*(?P<sqetest_err>SQETest-Err).*(?P<deffered_tx>Deferred-Tx).*(?P<intmactx_er>IntMacTx-Er).*(?P<intmacrx_er>IntMacRx-Er).*(?P<symbol_err>Symbol-Err))$')
 
         # Port         InDiscards
         # Port         Stomped-CRC
-        p1 = re.compile(r'^Port\s+(?:(?P<in_discards>InDiscards))$|'
-                        r'^Port\s+(?:(?P<stomped_crc>Stomped-CRC))$')
+        p1 = regex_engine.compile(r'^Port\s+(?:(?P<in_discards>InDiscards))$|'
+                                  r'^Port\s+(?:(?P<stomped_crc>Stomped-CRC))$')
 
 
         # Eth1/1                0          0          0          0          0           0
         # Eth1/1                0          --         0          0          0           0
-        p2 = re.compile(r'^(?P<interface>\S+)\s+(?P<val1>\d+|\S+)\s+(?P<val2>\d+|\S+)\s+(?P<val3>\d+|\S+)\s+(?P<val4>\d+|\S+)\s+(?P<val5>\d+|\S+)\s+(?P<val6>\d+|\S+)$')
+        p2 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<val1>\d+|\S+)\s+(?P<val2>\d+|\S+)\s+(?P<val3>\d+|\S+)\s+(?P<val4>\d+|\S+)\s+(?P<val5>\d+|\S+)\s+(?P<val6>\d+|\S+)$')
 
         # Eth1/1                0
         # Eth1/1                0
-        p3 = re.compile(r'^(?P<interface>\S+)\s+(?P<val1>\d+|\S+)$')
+        p3 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<val1>\d+|\S+)$')
 
         key1, key2, key3, key4, key5, key6 = None, None, None, None, None, None
 
@@ -5390,7 +5596,7 @@ class ShowInterfaceSnmpIfIndex(ShowInterfaceSnmpIfIndexSchema):
 
         # mgmt0           83886080   (0x5000000 )
         # Eth1/1          436207616  (0x1a000000)
-        p1 = re.compile(r'^(?P<interface>\S+)\s+(?P<ifindex>\d+)\s+\((?P<ifindexhex>[x0-9a-f]+)\)$')
+        p1 = regex_engine.compile(r'^(?P<interface>\S+)\s+(?P<ifindex>\d+)\s+\((?P<ifindexhex>[x0-9a-f]+)\)$')
 
         for line in output.splitlines():
             line = line.rstrip()
@@ -17,12 +17,10 @@ NXOS parsers for the following show commands:
     * show isis database detail vrf {vrf}
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -120,108 +118,108 @@ class ShowIsis(ShowIsisSchema):
         result_dict = {}
 
         # ISIS process : test
-        p1 = re.compile(r'^ISIS +[Pp]rocess *: +(?P<isis_process>\S+)$')
+        p1 = regex_engine.compile(r'^ISIS +[Pp]rocess *: +(?P<isis_process>\S+)$')
 
         # Instance number :  1
-        p2 = re.compile(r'^Instance +number *: +(?P<instance_number>\d+)$')
+        p2 = regex_engine.compile(r'^Instance +number *: +(?P<instance_number>\d+)$')
 
         # UUID: 1090519320
-        p3 = re.compile(r'^UUID *: +(?P<uuid>\d+)$')
+        p3 = regex_engine.compile(r'^UUID *: +(?P<uuid>\d+)$')
 
         # Process ID 1581
-        p4 = re.compile(r'^Process +ID +(?P<process_id>\d+)$')
+        p4 = regex_engine.compile(r'^Process +ID +(?P<process_id>\d+)$')
 
         # VRF: default
-        p5 = re.compile(r'^VRF *: +(?P<vrf>\S+)$')
+        p5 = regex_engine.compile(r'^VRF *: +(?P<vrf>\S+)$')
 
         # System ID : 3333.33ff.6666  IS-Type : L1-L2
-        p6 = re.compile(r'^System +ID *: +(?P<sysid>[a-zA-Z\d\-\.]+) +IS-Type *: +(?P<is_type>\S+)$')
+        p6 = regex_engine.compile(r'^System +ID *: +(?P<sysid>[a-zA-Z\d\-\.]+) +IS-Type *: +(?P<is_type>\S+)$')
 
         # SAP : 412  Queue Handle : 15
-        p7 = re.compile(r'^SAP *: +(?P<sap>\d+) +Queue +Handle *: +(?P<queue_handle>\d+)$')
+        p7 = regex_engine.compile(r'^SAP *: +(?P<sap>\d+) +Queue +Handle *: +(?P<queue_handle>\d+)$')
 
         # Maximum LSP MTU: 1492
-        p8 = re.compile(r'^Maximum +LSP +MTU *: +(?P<lsp_mtu>\d+)$')
+        p8 = regex_engine.compile(r'^Maximum +LSP +MTU *: +(?P<lsp_mtu>\d+)$')
 
         # Stateful HA enabled
-        p9 = re.compile(r'^Stateful +HA +(?P<stateful_ha>\w+)$')
+        p9 = regex_engine.compile(r'^Stateful +HA +(?P<stateful_ha>\w+)$')
 
         # Graceful Restart enabled. State: Inactive
-        p10 = re.compile(r'^Graceful +Restart +(?P<gr>\w+)\. +State *: +(?P<state>\w+)$')
+        p10 = regex_engine.compile(r'^Graceful +Restart +(?P<gr>\w+)\. +State *: +(?P<state>\w+)$')
 
         # Last graceful restart status : none
-        p11 = re.compile(r'^Last +graceful +restart +status *: +(?P<last_gr_status>\w+)$')
+        p11 = regex_engine.compile(r'^Last +graceful +restart +status *: +(?P<last_gr_status>\w+)$')
 
         # Start-Mode Complete
-        p12 = re.compile(r'^Start-Mode +(?P<start_mode>\w+)$')
+        p12 = regex_engine.compile(r'^Start-Mode +(?P<start_mode>\w+)$')
 
         # BFD IPv4 is globally disabled for ISIS process: test
-        p13 = re.compile(r'^BFD +IPv4 +is +(?P<bfd_ipv4>[\w\s]+) +for +ISIS +process: +(?P<name>.*)$')
+        p13 = regex_engine.compile(r'^BFD +IPv4 +is +(?P<bfd_ipv4>[\w\s]+) +for +ISIS +process: +(?P<name>.*)$')
 
         # BFD IPv6 is globally disabled for ISIS process: test
-        p14 = re.compile(r'^BFD +IPv6 +is +(?P<bfd_ipv6>[\w\s]+) +for +ISIS +process: +(?P<name>.*)$')
+        p14 = regex_engine.compile(r'^BFD +IPv6 +is +(?P<bfd_ipv6>[\w\s]+) +for +ISIS +process: +(?P<name>.*)$')
 
         # Topology-mode is Multitopology
-        p15 = re.compile(r'^Topology-mode +is +(?P<topology_mode>\w+)$')
+        p15 = regex_engine.compile(r'^Topology-mode +is +(?P<topology_mode>\w+)$')
 
         # Metric-style : advertise(wide), accept(narrow, wide)
-        p16 = re.compile(r'^Metric-style *: +advertise\((?P<adv>.*)\), +accept\((?P<acc>.*)\)$')
+        p16 = regex_engine.compile(r'^Metric-style *: +advertise\((?P<adv>.*)\), +accept\((?P<acc>.*)\)$')
 
         # Area address(es) :
         #     49.0001
-        p17 = re.compile(r'^(?P<area>[\d\.]+)$')
+        p17 = regex_engine.compile(r'^(?P<area>[\d\.]+)$')
 
         # Process is up and running
-        p18 = re.compile(r'^Process +is +(?P<process>[\S\s]+)$')
+        p18 = regex_engine.compile(r'^Process +is +(?P<process>[\S\s]+)$')
 
         # VRF ID: 1
-        p19 = re.compile(r'^VRF +ID *: +(?P<vrf_id>\d+)$')
+        p19 = regex_engine.compile(r'^VRF +ID *: +(?P<vrf_id>\d+)$')
 
         # Stale routes during non-graceful controlled restart
         # Flush Routes during non-graceful controlled restart
-        p20 = re.compile(r'^(?P<route>[\w\s]+) +during +non-graceful +controlled +restart$')
+        p20 = regex_engine.compile(r'^(?P<route>[\w\s]+) +during +non-graceful +controlled +restart$')
 
         # Enable resolution of L3->L2 address for ISIS adjacency
         # Disable resolution of L3->L2 address for ISIS adjacency
-        p21 = re.compile(r'^(?P<resolution>\w+) +resolution +of +L3->L2 +address +for +ISIS +adjacency$')
+        p21 = regex_engine.compile(r'^(?P<resolution>\w+) +resolution +of +L3->L2 +address +for +ISIS +adjacency$')
 
         # SR IPv4 is not configured and disabled for ISIS process: test
-        p22 = re.compile(r'^SR +IPv4 +is +(?P<sr_ipv4>[\w\s]+) +for +ISIS +process: +(?P<name>.*)$')
+        p22 = regex_engine.compile(r'^SR +IPv4 +is +(?P<sr_ipv4>[\w\s]+) +for +ISIS +process: +(?P<name>.*)$')
 
         # SR IPv6 is not configured and disabled for ISIS process: test
-        p23 = re.compile(r'^SR +IPv6 +is +(?P<sr_ipv6>[\w\s]+) +for +ISIS +process: +(?P<name>.*)$')
+        p23 = regex_engine.compile(r'^SR +IPv6 +is +(?P<sr_ipv6>[\w\s]+) +for +ISIS +process: +(?P<name>.*)$')
 
         # Interfaces supported by IS-IS :
         #     loopback0
-        p24 = re.compile(r'^(?!Level)(?P<interface>[a-zA-Z][\S]+)$')
+        p24 = regex_engine.compile(r'^(?!Level)(?P<interface>[a-zA-Z][\S]+)$')
 
         # Topology : 0
-        p25 = re.compile(r'^Topology *: +(?P<topology>\d+)$')
+        p25 = regex_engine.compile(r'^Topology *: +(?P<topology>\d+)$')
 
         # Address family IPv4 unicast :
         # Address family IPv6 unicast :
-        p26 = re.compile(r'^Address +family +(?P<af>[\S\s]+?) *:$')
+        p26 = regex_engine.compile(r'^Address +family +(?P<af>[\S\s]+?) *:$')
 
         #     Number of interface : 3
-        p27 = re.compile(r'^Number +of +interface *: +(?P<num>\d+)$')
+        p27 = regex_engine.compile(r'^Number +of +interface *: +(?P<num>\d+)$')
 
         #     Distance : 115
-        p28 = re.compile(r'^Distance *: +(?P<distance>\d+)$')
+        p28 = regex_engine.compile(r'^Distance *: +(?P<distance>\d+)$')
 
         # Level1
-        p29 = re.compile(r'^Level *(?P<level>\d+)$')
+        p29 = regex_engine.compile(r'^Level *(?P<level>\d+)$')
 
         # No auth type and keychain
-        p30 = re.compile(r'^No auth type and keychain$')
+        p30 = regex_engine.compile(r'^No auth type and keychain$')
 
         # Auth check set
-        p31 = re.compile(r'^Auth +check +(?P<auth_check>\w+)$')
+        p31 = regex_engine.compile(r'^Auth +check +(?P<auth_check>\w+)$')
 
         # L1 Next SPF: 00:00:07
-        p32 = re.compile(r'^L1 +Next +SPF *: +(?P<l1_next_spf>\S+)$')
+        p32 = regex_engine.compile(r'^L1 +Next +SPF *: +(?P<l1_next_spf>\S+)$')
 
         # L2 Next SPF: 00:00:04
-        p33 = re.compile(r'^L2 +Next +SPF *: +(?P<l2_next_spf>\S+)$')
+        p33 = regex_engine.compile(r'^L2 +Next +SPF *: +(?P<l2_next_spf>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -612,79 +610,79 @@ class ShowIsisInterface(ShowIsisInterfaceSchema):
         result_dict = {}
 
         # IS-IS process: test VRF: default
-        p1 = re.compile(r'^IS-IS +[Pp]rocess: +(?P<process_id>\S+) +VRF: +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^IS-IS +[Pp]rocess: +(?P<process_id>\S+) +VRF: +(?P<vrf>\S+)$')
 
         # loopback0, Interface status: protocol-up/link-up/admin-up
-        p2 = re.compile(r'^(?P<interface>\S+), +Interface +status: +(?P<status>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<interface>\S+), +Interface +status: +(?P<status>\S+)$')
 
         #   IP address: 10.36.3.3, IP subnet: 10.36.3.3/32
-        p3 = re.compile(r'^IP +address: +(?P<ip>\S+), +IP +subnet: +(?P<subnet>\S+)$')
+        p3 = regex_engine.compile(r'^IP +address: +(?P<ip>\S+), +IP +subnet: +(?P<subnet>\S+)$')
 
         #   IPv6 address:
         #     2001:3:3:3::3/128 [VALID]
-        p4 = re.compile(r'^(?P<ipv6>\S+) +\[(?P<state>\S+)\]$')
+        p4 = regex_engine.compile(r'^(?P<ipv6>\S+) +\[(?P<state>\S+)\]$')
 
         #   IPv6 subnet:  2001:3:3:3::3/128
-        p5 = re.compile(r'^IPv6 +subnet: +(?P<subnet>\S+)$')
+        p5 = regex_engine.compile(r'^IPv6 +subnet: +(?P<subnet>\S+)$')
 
         #   IPv6 link-local address: fe80::5c00:80ff:fe02:0
-        p6 = re.compile(r'^IPv6 +link-local +address: +(?P<link_address>\S+)$')
+        p6 = regex_engine.compile(r'^IPv6 +link-local +address: +(?P<link_address>\S+)$')
 
         #   Level1
-        p7 = re.compile(r'^Level *(?P<level>\d+)$')
+        p7 = regex_engine.compile(r'^Level *(?P<level>\d+)$')
 
         #     No auth type and keychain
-        p8 = re.compile(r'^No auth type and keychain$')
+        p8 = regex_engine.compile(r'^No auth type and keychain$')
 
         #     Auth check set
-        p9 = re.compile(r'^Auth +check +(?P<auth_check>\w+)$')
+        p9 = regex_engine.compile(r'^Auth +check +(?P<auth_check>\w+)$')
 
         #   Index: 0x0001, Local Circuit ID: 0x01, Circuit Type: L1-2
-        p10 = re.compile(r'^Index: +(?P<index>\w+), +Local +Circuit +ID: '
-                         r'+(?P<circuit_id>\w+), +Circuit +Type: +(?P<circuit_type>\S+)$')
+        p10 = regex_engine.compile(r'^Index: +(?P<index>\w+), +Local +Circuit +ID: '
+                                   r'+(?P<circuit_id>\w+), +Circuit +Type: +(?P<circuit_type>\S+)$')
 
         #   BFD IPv4 is locally disabled for Interface loopback0
-        p11 = re.compile(r'^BFD +IPv4 +is +(?P<bfd_ipv4>[\s\w]+) +for +Interface +(?P<intf>.*)$')
+        p11 = regex_engine.compile(r'^BFD +IPv4 +is +(?P<bfd_ipv4>[\s\w]+) +for +Interface +(?P<intf>.*)$')
 
         #   BFD IPv6 is locally disabled for Interface loopback0
-        p12 = re.compile(r'^BFD +IPv6 +is +(?P<bfd_ipv6>[\s\w]+) +for +Interface +(?P<intf>.*)$')
+        p12 = regex_engine.compile(r'^BFD +IPv6 +is +(?P<bfd_ipv6>[\s\w]+) +for +Interface +(?P<intf>.*)$')
         
         #   MTR is enabled
-        p13 = re.compile(r'^MTR +is +(?P<mtr>\w+)$')
+        p13 = regex_engine.compile(r'^MTR +is +(?P<mtr>\w+)$')
 
         #   Passive level: level-1-2
-        p13_1 = re.compile(r'^Passive +level: +(?P<passive>\S+)$')
+        p13_1 = regex_engine.compile(r'^Passive +level: +(?P<passive>\S+)$')
 
         #   Level      Metric
         #   1               1
-        p14 = re.compile(r'^(?P<level>\d+) +(?P<metric>\d+)$')
+        p14 = regex_engine.compile(r'^(?P<level>\d+) +(?P<metric>\d+)$')
 
         #   LSP interval: 33 ms, MTU: 1500
-        p15 = re.compile(r'^LSP +interval: +(?P<lsp_interval>[\d]+) +ms, +MTU: +(?P<mtu>\d+)$')
+        p15 = regex_engine.compile(r'^LSP +interval: +(?P<lsp_interval>[\d]+) +ms, +MTU: +(?P<mtu>\d+)$')
         
         #   Level-1 Designated IS: R2_xr
         #   Level-2 Designated IS: R2_xr
-        p16 = re.compile(r'^(?P<level>\S+) +Designated +IS: +(?P<designated_is>\S+)$')
+        p16 = regex_engine.compile(r'^(?P<level>\S+) +Designated +IS: +(?P<designated_is>\S+)$')
 
         #   Level   Metric-0   Metric-2   CSNP  Next CSNP  Hello   Multi   Next IIH
         #   1              40     40     10 Inactive      10   3       00:00:04
         #   2              40     40     10 00:00:03      10   3       00:00:09
-        p17 = re.compile(r'^(?P<level>\d+) +(?P<metric_0>\d+) +(?P<metric_2>\d+) '
-                         r'+(?P<csnp>\d+) +(?P<next_csnp>[\w\:]+) +(?P<hello>\d+) '
-                         r'+(?P<multi>\d+) +(?P<next_iih>[\w\:]+)$')
+        p17 = regex_engine.compile(r'^(?P<level>\d+) +(?P<metric_0>\d+) +(?P<metric_2>\d+) '
+                                   r'+(?P<csnp>\d+) +(?P<next_csnp>[\w\:]+) +(?P<hello>\d+) '
+                                   r'+(?P<multi>\d+) +(?P<next_iih>[\w\:]+)$')
 
         #   Level  Adjs   AdjsUp Pri  Circuit ID         Since
         #   1         1        1  64  R2_xr.03           5d01h
         #   2         1        1  64  R2_xr.03           5d01h
-        p18 = re.compile(r'^(?P<level>\d+) +(?P<adjs>\d+) +(?P<adjs_up>\d+) '
-                         r'+(?P<pri>\d+) +(?P<circuit_id>\S+) +(?P<since>\w+)$')
+        p18 = regex_engine.compile(r'^(?P<level>\d+) +(?P<adjs>\d+) +(?P<adjs_up>\d+) '
+                                   r'+(?P<pri>\d+) +(?P<circuit_id>\S+) +(?P<since>\w+)$')
 
         #   Topologies enabled:
         #     L  MT  Metric  MetricCfg  Fwdng IPV4-MT  IPV4Cfg  IPV6-MT  IPV6Cfg
         #     1  0        1       no   UP    UP       yes      DN       yes
-        p19 = re.compile(r'^(?P<level>\d+) +(?P<mt>\d+) +(?P<metric>\d+) '
-                         r'+(?P<metric_cfg>\w+) +(?P<fwdng>\w+) +(?P<ipv4_mt>\w+) '
-                         r'+(?P<ipv4_cfg>\w+) +(?P<ipv6_mt>\w+) +(?P<ipv6_cfg>\w+)$')
+        p19 = regex_engine.compile(r'^(?P<level>\d+) +(?P<mt>\d+) +(?P<metric>\d+) '
+                                   r'+(?P<metric_cfg>\w+) +(?P<fwdng>\w+) +(?P<ipv4_mt>\w+) '
+                                   r'+(?P<ipv4_cfg>\w+) +(?P<ipv6_mt>\w+) +(?P<ipv6_cfg>\w+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -946,33 +944,33 @@ class ShowIsisSpfLogDetail(ShowIsisSpfLogDetailSchema):
         result_dict = {}
 
         # IS-IS Process: test SPF information VRF: default
-        p1 = re.compile(r'^IS-IS +[Pp]rocess: +(?P<process_id>\S+) '
-                        r'+SPF +information +VRF: +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^IS-IS +[Pp]rocess: +(?P<process_id>\S+) '
+                                  r'+SPF +information +VRF: +(?P<vrf>\S+)$')
 
         # SPF log for Topology 0
-        p2 = re.compile(r'^SPF +log +for +Topology +(?P<topology>\d+)$')
+        p2 = regex_engine.compile(r'^SPF +log +for +Topology +(?P<topology>\d+)$')
 
         # Total number of SPF calculations: 225313
-        p3 = re.compile(r'^Total +number +of +SPF +calculations: +(?P<total_num>\d+)$')
+        p3 = regex_engine.compile(r'^Total +number +of +SPF +calculations: +(?P<total_num>\d+)$')
 
         # Log entry (current/max): 20/20
-        p4 = re.compile(r'^Log +entry +\(current\/max\): +(?P<curr>\d+)\/(?P<max>\d+)$')
+        p4 = regex_engine.compile(r'^Log +entry +\(current\/max\): +(?P<curr>\d+)\/(?P<max>\d+)$')
 
         # Log entry: 01, Ago: 00:01:26, Date: Tue Oct 15 21:53:39 2019
         # Log entry: 20, Ago: 0.800060, Date: Wed Nov 27 16:04:29 2019
-        p5 = re.compile(r'^Log +entry: +(?P<entry>\d+), +Ago: +(?P<ago>[\d\.\:]+), '
-                        r'+Date: +(?P<date>[\S\s]+)$')
+        p5 = regex_engine.compile(r'^Log +entry: +(?P<entry>\d+), +Ago: +(?P<ago>[\d\.\:]+), '
+                                  r'+Date: +(?P<date>[\S\s]+)$')
 
         #   Level  Instance    Init      SPF       IS Update  URIB Update  Total
         #   2      0x0001B80B  0.000919  0.000896  0.000157   0.000439     0.002559
-        p6 = re.compile(r'^(?P<level>\d+) +(?P<instance>\S+) +(?P<init>[\d\.]+) '
-                        r'+(?P<spf>\S+) +(?P<is_update>\S+) '
-                        r'+(?P<urib_update>\S+) +(?P<total>\S+)$')
+        p6 = regex_engine.compile(r'^(?P<level>\d+) +(?P<instance>\S+) +(?P<init>[\d\.]+) '
+                                  r'+(?P<spf>\S+) +(?P<is_update>\S+) '
+                                  r'+(?P<urib_update>\S+) +(?P<total>\S+)$')
 
         #   Level  Node Count   Changed  Reason
         #   2         4     7         0  New adj R2_xr on Ethernet1/1.115
-        p7 = re.compile(r'^(?P<level>\d+) +(?P<node>\d+) +(?P<count>\d+) '
-                        r'+(?P<changed>\d+) +(?P<reason>[\S\s]+)$')
+        p7 = regex_engine.compile(r'^(?P<level>\d+) +(?P<node>\d+) +(?P<count>\d+) '
+                                  r'+(?P<changed>\d+) +(?P<reason>[\S\s]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1106,14 +1104,14 @@ class ShowIsisAdjacency(ShowIsisAdjacencySchema):
         result_dict = {}
 
         # IS-IS Process: test VRF: default
-        p1 = re.compile(r'^IS-IS +[Pp]rocess: +(?P<process_id>\S+) +VRF: +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^IS-IS +[Pp]rocess: +(?P<process_id>\S+) +VRF: +(?P<vrf>\S+)$')
 
         # System ID       SNPA            Level  State  Hold Time  Interface
         # R2_xr           fa16.3eff.4abd  1      UP     00:00:09   Ethernet1/1.115
         # 2222.22ff.4444  fa16.3eff.4abd  1      INIT   00:00:32   Ethernet1/1.415
         # plum-fx-1       N/A             1-2    UP     00:00:30   Vlan100
-        p2 = re.compile(r'^(?P<sysid>\S+) +(?P<snpa>[/\w\.]+) +(?P<level>[\d-]+) '
-                        r'+(?P<state>\S+) +(?P<hold_time>[\d\:]+) +(?P<interface>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<sysid>\S+) +(?P<snpa>[/\w\.]+) +(?P<level>[\d-]+) '
+                                  r'+(?P<state>\S+) +(?P<hold_time>[\d\:]+) +(?P<interface>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1200,14 +1198,14 @@ class ShowIsisHostname(ShowIsisHostnameSchema):
         result_dict = {}
 
         # IS-IS Process: test dynamic hostname table VRF: default
-        p1 = re.compile(r'^IS-IS +Process: +(?P<process_id>\S+) +dynamic '
-                        r'+hostname +table +VRF: +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^IS-IS +Process: +(?P<process_id>\S+) +dynamic '
+                                  r'+hostname +table +VRF: +(?P<vrf>\S+)$')
 
         #  Level  System ID       Dynamic hostname
         #  1      1111.11ff.2222  R1_ios
         #  1      3333.33ff.6666* R3_nx
-        p2 = re.compile(r'^(?P<level>\d+) +(?P<system_id>[a-zA-Z\d\-\.]+)(?P<star>\*)? '
-                        r'+(?P<dynamic_hostname>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<level>\d+) +(?P<system_id>[a-zA-Z\d\-\.]+)(?P<star>\*)? '
+                                  r'+(?P<dynamic_hostname>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1294,14 +1292,14 @@ class ShowIsisHostnameDetail(ShowIsisHostnameDetailSchema):
         result_dict = {}
 
         # IS-IS Process: test dynamic hostname table VRF: default
-        p1 = re.compile(r'^IS-IS +Process: +(?P<process_id>\S+) +dynamic '
-                        r'+hostname +table +VRF: +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^IS-IS +Process: +(?P<process_id>\S+) +dynamic '
+                                  r'+hostname +table +VRF: +(?P<vrf>\S+)$')
 
         #  Level  LSP ID                Dynamic hostname
         #  1      7777.77ff.eeee.00-00* R7
         #  2      2222.22ff.4444.00-00  R2
-        p2 = re.compile(r'^(?P<level>\d+) +(?P<lsp_id>[a-zA-Z\d\-\.]+)(?P<star>\*)? '
-                        r'+(?P<dynamic_hostname>\S+)$')
+        p2 = regex_engine.compile(r'^(?P<level>\d+) +(?P<lsp_id>[a-zA-Z\d\-\.]+)(?P<star>\*)? '
+                                  r'+(?P<dynamic_hostname>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1438,70 +1436,70 @@ class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
         result_dict = {}
 
         # IS-IS Process: test dynamic hostname table VRF: default
-        p1 = re.compile(r'^IS-IS +Process: +(?P<process_id>\S+) '
-                        r'+LSP +database +VRF: +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^IS-IS +Process: +(?P<process_id>\S+) '
+                                  r'+LSP +database +VRF: +(?P<vrf>\S+)$')
 
         # IS-IS Level-1 Link State Database
-        p2 = re.compile(r'^IS-IS +Level-(?P<level>\d+) +Link +State +Database(:)?$')
+        p2 = regex_engine.compile(r'^IS-IS +Level-(?P<level>\d+) +Link +State +Database(:)?$')
 
         # LSPID                 Seq Number   Checksum  Lifetime   A/P/O/T
         # R1_xe.00-00           0x000007CC   0xAF21    490        0/0/0/3
         # R3_nx.00-00         * 0x00000B05   0x7FA7    697        0/0/0/3
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<lsp_id>\S+)(\s*(?P<lsp_status>[!*#?]+))? +(?P<sequence>\w+) +(?P<checksum>\w+) '
             r'+(?P<lifetime>[\d\*]+) +(?P<a>\d+)/(?P<p>\d+)/(?P<o>\d+)/(?P<t>\d+)$')
 
         #   Instance      :  0x000007C8
-        p4 = re.compile(r'^Instance *: +(?P<instance>\w+)$')
+        p4 = regex_engine.compile(r'^Instance *: +(?P<instance>\w+)$')
 
         #   Area Address : 49.0001
-        p5 = re.compile(r'^Area +Address *: +(?P<area_address>[\w\.]+)$')
+        p5 = regex_engine.compile(r'^Area +Address *: +(?P<area_address>[\w\.]+)$')
 
         #   NLPID      :  0xCC 0x8E
-        p6 = re.compile(r'^NLPID *: +(?P<nlp_id>[\w\s]+)$')
+        p6 = regex_engine.compile(r'^NLPID *: +(?P<nlp_id>[\w\s]+)$')
 
         #   MT TopoId     : TopoId:0 Att: 0 Ol: 0
         #                   TopoId:2 Att: 0 Ol: 0
-        p7 = re.compile(r'^(MT TopoId *: +)?TopoId:(?P<topo_id>\d+) +Att: +(?P<att>\d+) +Ol: +(?P<ol>\d+)$')
+        p7 = regex_engine.compile(r'^(MT TopoId *: +)?TopoId:(?P<topo_id>\d+) +Att: +(?P<att>\d+) +Ol: +(?P<ol>\d+)$')
 
         #   Hostname      :  R1_xe              Length : 5
-        p8 = re.compile(r'^Hostname *: +(?P<hostname>\S+) +Length *: +(?P<length>\d+)$')
+        p8 = regex_engine.compile(r'^Hostname *: +(?P<hostname>\S+) +Length *: +(?P<length>\d+)$')
 
         #   Extended IS   :  R1_xe.02           Metric : 10
-        p9 = re.compile(r'^Extended +IS *: +(?P<ext>\S+) +Metric *: +(?P<metric>\d+)$')
+        p9 = regex_engine.compile(r'^Extended +IS *: +(?P<ext>\S+) +Metric *: +(?P<metric>\d+)$')
         
         #   TopoId: 2
-        p10 = re.compile(r'^TopoId *: +(?P<topo_id>\d+)$')
+        p10 = regex_engine.compile(r'^TopoId *: +(?P<topo_id>\d+)$')
         
         #   MtExtend IS   :  R1_xe.01           Metric : 10
         #                    R2_xr.03           Metric : 10
-        p11 = re.compile(r'^(MtExtend +IS *: +)?(?P<mt_ext>\S+) +Metric *: +(?P<metric>\d+)$')
+        p11 = regex_engine.compile(r'^(MtExtend +IS *: +)?(?P<mt_ext>\S+) +Metric *: +(?P<metric>\d+)$')
 
         #   IP Address    :  10.13.115.1
-        p12 = re.compile(r'^IP +Address *: +(?P<ip_address>[\d\.]+)$')
+        p12 = regex_engine.compile(r'^IP +Address *: +(?P<ip_address>[\d\.]+)$')
 
         #   Extended IP   :     10.12.115.0/24  Metric : 10          (U)
         #   Extended IP   :     10.12.115.0/24  Metric : 10          (D)
-        p13 = re.compile(r'^Extended +IP *: +(?P<ext_ip>\S+) +Metric *: +(?P<metric>\d+) +\((?P<up_down>\S+)\)$')
+        p13 = regex_engine.compile(r'^Extended +IP *: +(?P<ext_ip>\S+) +Metric *: +(?P<metric>\d+) +\((?P<up_down>\S+)\)$')
 
         #   IPv6 Address  :  2001:10:13:115::1
-        p14 = re.compile(r'^IPv6 +Address *: +(?P<ip_address>\S+)$')
+        p14 = regex_engine.compile(r'^IPv6 +Address *: +(?P<ip_address>\S+)$')
 
         #   Router ID     :  10.36.3.3
-        p15 = re.compile(r'^Router +ID *: +(?P<router_id>\S+)$')
+        p15 = regex_engine.compile(r'^Router +ID *: +(?P<router_id>\S+)$')
 
         #   MT-IPv6 Prefx :  TopoId : 2
-        p16 = re.compile(r'^MT-IPv6 +Prefx *: +TopoId *: +(?P<topo_id>\d+)$')
+        p16 = regex_engine.compile(r'^MT-IPv6 +Prefx *: +TopoId *: +(?P<topo_id>\d+)$')
 
         #   2001:10:12:115::/64  Metric : 10          (U/I)
         #   2001:10:12:115::/64  Metric : 10          (D/E)
-        p17 = re.compile(r'^(?P<prefix>\S+) +Metric *: +(?P<metric>\d+) +\((?P<up_down>\w+)\/(?P<ext_origin>\w+)\)$')
+        p17 = regex_engine.compile(r'^(?P<prefix>\S+) +Metric *: +(?P<metric>\d+) +\((?P<up_down>\w+)\/(?P<ext_origin>\w+)\)$')
 
         #   Unknown Sub-TLV      :  Length : 1  Type :   4
-        p18 = re.compile(r'^Unknown +Sub-TLV *: +Length *: +(?P<length>\d+) +Type *: +(?P<type>\d+)$')
+        p18 = regex_engine.compile(r'^Unknown +Sub-TLV *: +Length *: +(?P<length>\d+) +Type *: +(?P<type>\d+)$')
 
         #   Digest Offset :  0
-        p19 = re.compile(r'^Digest +Offset *: +(?P<offset>\d+)$')
+        p19 = regex_engine.compile(r'^Digest +Offset *: +(?P<offset>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -6,7 +6,6 @@ NXOS parsers for the following show commands:
     * show l2route evpn mac evi <WORD> mac <WORD>
 """
 
-import re
 
 
 from genie.metaparser import MetaParser
@@ -18,6 +17,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ====================================================
 #  schema for 'show l2route evpn mac all'
 # ====================================================
@@ -67,7 +69,7 @@ class ShowL2routeEvpnMac(ShowL2routeEvpnMacSchema):
             line = line.strip()
 
             # 100         fa16.3eff.2a0c BGP    SplRcv        0          10.166.1.1
-            p1 = re.compile(r'^\s*(?P<topology>[0-9]+) +(?P<mac_address>[a-z0-9\.]+) '
+            p1 = regex_engine.compile(r'^\s*(?P<topology>[0-9]+) +(?P<mac_address>[a-z0-9\.]+) '
                 r'+(?P<prod>[a-zA-Z]+) +(?P<flags>[a-zA-Z\,]+) +(?P<seq_no>[0-9]+) '
                 r'+(?P<next_hops>[a-zA-Z0-9\/\.]+) *(\(Label: +)?(?P<label>[0-9]*)\)?$')
             m = p1.match(line)
@@ -144,7 +146,7 @@ class ShowL2routeEvpnMacEvi(ShowL2routeEvpnMacEviSchema):
         ret_dict = {}
 
         # 100         fa16.3eff.2a0c BGP    SplRcv        0          10.166.1.1
-        p1 = re.compile(r'^\s*(?P<topology>[0-9]+) +(?P<mac_address>[a-z0-9\.]+) '
+        p1 = regex_engine.compile(r'^\s*(?P<topology>[0-9]+) +(?P<mac_address>[a-z0-9\.]+) '
             r'+(?P<prod>[a-zA-Z]+) +(?P<flags>[a-zA-Z\,]+) +(?P<seq_no>[0-9]+) '
             r'+(?P<next_hops>[a-zA-Z0-9\/\.]+)$')
 
@@ -21,6 +21,7 @@ from genie.metaparser.util.schemaengine import Schema, \
     Use
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ============================
@@ -48,7 +49,7 @@ class ShowLacpSystemIdentifier(ShowLacpSystemIdentifierSchema):
 
         parsed_dict = {}
         # 32768,5e-2-0-1-0-7
-        p1 = re.compile(r'^\s*(?P<system_priority>[\d]+), *(?P<system_id_mac>[\w.\-]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<system_priority>[\d]+), *(?P<system_id_mac>[\w.\-]+)$')
 
         for line in out.splitlines():
             if line:
@@ -110,7 +111,7 @@ class ShowLacpCounters(ShowLacpCountersSchema):
         parsed_dict = {}
         intf_dict = {}
         # port-channel1
-        p1 = re.compile(r'^port-channel\d+$')
+        p1 = regex_engine.compile(r'^port-channel\d+$')
         # ------------------------------------------------------------------------------
         #                              LACPDUs                      Markers / Resp
         # LACPDUs
@@ -131,7 +132,7 @@ class ShowLacpCounters(ShowLacpCountersSchema):
         # 0
         # Ethernet1 / 5        118                  146                    0      0
         # 0
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<interface>[\w\/]+) +(?P<lacp_out_pkts>[\d]+) +(?P<lacp_in_pkts>[\d]+)'
             r' +(?P<marker_in_pkts>[\d]+) +(?P<marker_out_pkts>[\d]+) +( +('
             r'?P<lacp_pkts_errors>[\d]+))?$')
@@ -214,17 +215,17 @@ class ShowLacpNeighbor(ShowLacpNeighborSchema):
         intf_dict = {}
         member_dict = {}
         # port-channel1 neighbors
-        p1 = re.compile(r'^(?P<port_channel>[\w-]+)[\xa0 ]+neighbors$')
+        p1 = regex_engine.compile(r'^(?P<port_channel>[\w-]+)[\xa0 ]+neighbors$')
         #             Partner                Partner                     Partner
         # Port        System ID              Port Number     Age         Flags
         # Eth1/1      32768,5e-2-0-1-0-7     0x101           1140        SA
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(?P<interface>[\w/]+)[\xa0 ]+\d+,[\xa0 ]*(?P<sys_id>[\w.\-]+)[\xa0 ]+('
             r'?P<port_num>0x[a-fA-F0-9]+)[\xa0 ]+(?P<age>\d+)[\xa0 ]+(?P<flags>[\w]+)$')
         #             LACP Partner           Partner                     Partner
         #             Port Priority          Oper Key                    Port State
         #             32768                  0x8000                      0x3d
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<lacp_port_priority>\d+)[\xa0 ]+(?P<oper_key>0x[a-fA-F0-9]+)[\xa0 ]+('
             r'?P<port_state>0x[a-fA-F0-9]+)$')
 
@@ -324,12 +325,12 @@ class ShowPortChannelSummary(ShowPortChannelSummarySchema):
         # --------------------------------------------------------------------------------
         # 1     Po1(RU)     Eth      LACP      Eth1/1(P)    Eth1/2(P)
         # 2     Po2(SU)     Eth      LACP      Eth1/3(P)    Eth1/4(P)    Eth1/5(H)
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'(?P<bundle_id>[\d]+)[\xa0 ]+(?P<name>[\w\-]+)\((?P<flags>[\w]+)\)?[\xa0 '
             r']+(?P<type>\w+)[\xa0 ]+(?P<protocol>[\w\-]+)?[\xa0 ]+(?P<ports>[\w\-/() '
             r'\xa0]+ *)?$')
         #                                      Eth1/6(P)    Eth1/7(P)    Eth1/8(H)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^\s*(?P<space>\s{37})(?P<ports>[\w\-\/() \xa0]+)?')
         for line in out.splitlines():
             if line:
@@ -419,34 +420,34 @@ class ShowPortChannelDatabase(ShowPortChannelDatabaseSchema):
         parsed_dict = {}
         intf_dict = {}
         # port-channel1
-        p1 = re.compile(r'^port-channel\d+$')
+        p1 = regex_engine.compile(r'^port-channel\d+$')
         # Last membership update is successful
-        p2 = re.compile(r'^Last +membership +update +is +(?P<last_update_status>\w+)$')
+        p2 = regex_engine.compile(r'^Last +membership +update +is +(?P<last_update_status>\w+)$')
         # 2 ports in total, 2 ports up
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<total_ports>\d+) +ports +in +total, +(?P<up_ports>\d+) +ports +up$')
         # First operational port is Ethernet1/1
-        p4 = re.compile(r'^First +operational +port +is +(?P<first_oper_port>[\w/]+)$')
+        p4 = regex_engine.compile(r'^First +operational +port +is +(?P<first_oper_port>[\w/]+)$')
         # Age of the port-channel is 0d:02h:31m:22s
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Age +of +the +port-channel +is +(?P<port_channel_age>[0-9:smhd]+)$')
         # Time since last bundle is 0d:02h:28m:30s
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^Time +since +last +bundle +is +(?P<time_last_bundle>[0-9:smhd]+)$')
         # Last bundled member is Ethernet1/2
-        p7 = re.compile(r'^Last +bundled +member +is +(?P<last_bundled_member>[\w/]+)$')
+        p7 = regex_engine.compile(r'^Last +bundled +member +is +(?P<last_bundled_member>[\w/]+)$')
         # Time since last unbundle is 0d:00h:14m:05s
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^Time +since +last +unbundle +is +(?P<time_last_unbundle>[0-9:smhd]+)$')
         # Last unbundled member is Ethernet1/5
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^Last +unbundled +member +is +(?P<last_unbundled_member>[\w/]+)$')
         #     Ports:   Ethernet1/3     [passive] [up]
         #              Ethernet1/4     [passive] [up] *
         #              Ethernet1/5     [passive] [hot-standy]
         #     Ports:   Ethernet1/25    [on] [up]
         #              Ethernet1/26    [on] [up] *
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^(Ports:)?\s*(?P<interface>[\w/]+)\s+\[(?P<activity>(passive|active|on|off)) *\] '
             r'+\['
             r'(?P<status>[\w-]+)\](?P<fop>\s+\*)*$')
@@ -13,6 +13,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -48,7 +49,7 @@ class ShowLldpAll(ShowLldpAllSchema):
 
         # Interface Information: Eth1/64 Enable (tx/rx/dcbx): Y/Y/Y
         # Interface Information: mgmt0 Enable (tx/rx/dcbx): Y/Y/N  
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Interface Information: +(?P<interface>[\S]+) +('
             r'?P<enabled>[a-zA-Z]+) +\(tx/rx/dcbx\): +(?P<tx>[YN])/('
             r'?P<rx>[YN])/(?P<dcbx>[YN])$')
@@ -113,7 +114,7 @@ class ShowLldpTimers(ShowLldpTimersSchema):
             Hold multiplier in seconds: 4
             Notification interval in seconds: 5
          '''
-        p1 = re.compile(r'^(?P<timer>[\w\s-]+) +in +seconds: +(?P<seconds>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<timer>[\w\s-]+) +in +seconds: +(?P<seconds>\d+)$')
         for line in out.splitlines():
             line = line.strip()
 
@@ -249,50 +250,50 @@ class ShowLldpNeighborsDetail(ShowLldpNeighborsDetailSchema):
         tmp_port_id = ''
         # Chassis id: 000d.bdff.4f04
         # Chassis id: 39373638-3935-5A43-4A37-35303036574C
-        p1 = re.compile(r'^Chassis +id: +(?P<chassis_id>.+?)\s*$')
+        p1 = regex_engine.compile(r'^Chassis +id: +(?P<chassis_id>.+?)\s*$')
         # Port id: Gi0/0/0/1
         # Port id: PCI-E Slot 1, Port 2
-        p2 = re.compile(r'^Port +id: +(?P<port_id>[\S ]+)$')
+        p2 = regex_engine.compile(r'^Port +id: +(?P<port_id>[\S ]+)$')
         # Local Port id: Eth1/2
-        p3 = re.compile(r'^Local +Port +id: +(?P<local_port_id>\S+)$')
+        p3 = regex_engine.compile(r'^Local +Port +id: +(?P<local_port_id>\S+)$')
         # Port Description: null
-        p4 = re.compile(r'^Port +Description: +(?P<port_description>(?!null).+)$')
+        p4 = regex_engine.compile(r'^Port +Description: +(?P<port_description>(?!null).+)$')
         # System Name: R2_xrv9000
-        p5 = re.compile(r'^System +Name: +(?P<system_name>.+?)\s*$')
+        p5 = regex_engine.compile(r'^System +Name: +(?P<system_name>.+?)\s*$')
         # System Description:  6.2.2, IOS-XRv 9000
-        p6 = re.compile(r'^System +Description: +(?P<system_description>.+?)$')
+        p6 = regex_engine.compile(r'^System +Description: +(?P<system_description>.+?)$')
         # Copyright (c) 1986-2017 by Cisco Systems, Inc.
-        p6_1 = re.compile(r'^(?P<copyright>Copyright +\([c|C]\) +.+)$')
+        p6_1 = regex_engine.compile(r'^(?P<copyright>Copyright +\([c|C]\) +.+)$')
         # Compiled Sat 22-Jul-17 05:51 by
-        p6_2 = re.compile(r'^(?P<compiled_by>Compiled +.+)$')
+        p6_2 = regex_engine.compile(r'^(?P<compiled_by>Compiled +.+)$')
         # Technical Support: http://www.cisco.com/techsupport
-        p6_3 = re.compile(r'^(?P<technical_support>(Technical|TAC) (S|s)upport: +.+)$')
+        p6_3 = regex_engine.compile(r'^(?P<technical_support>(Technical|TAC) (S|s)upport: +.+)$')
 
         # "Cisco IOS XR Software, Version 5.3.4[Default]Copyright (c) 2018 by Cisco Systems, Inc., ASR9K Series\n"
-        p6_xr_0 = re.compile(r'(?P<is_iosxr>(IOS XR))')
+        p6_xr_0 = regex_engine.compile(r'(?P<is_iosxr>(IOS XR))')
 
         # Time remaining: 95 seconds
-        p7 = re.compile(r'^Time +remaining: +(?P<time_remaining>\d+) +seconds$')
+        p7 = regex_engine.compile(r'^Time +remaining: +(?P<time_remaining>\d+) +seconds$')
         # System Capabilities: B, R
         # System Capabilities: not advertised
-        p8 = re.compile(r'^System +Capabilities: +(?P<system>[\w ,]+)$')
+        p8 = regex_engine.compile(r'^System +Capabilities: +(?P<system>[\w ,]+)$')
         # Enabled Capabilities: R
         # Enabled Capabilities: not advertised
-        p9 = re.compile(r'^Enabled +Capabilities: +(?P<enabled>[\w ,]+)$')
+        p9 = regex_engine.compile(r'^Enabled +Capabilities: +(?P<enabled>[\w ,]+)$')
         # Management Address: 10.2.3.2
-        p10 = re.compile(r'^Management +Address: +(?P<mgmt_address_ipv4>.+)$')
+        p10 = regex_engine.compile(r'^Management +Address: +(?P<mgmt_address_ipv4>.+)$')
         # Management Address IPV6: not advertised
-        p11 = re.compile(r'^Management +Address +IPV6: +(?P<mgmt_address_ipv6>.+)$')
+        p11 = regex_engine.compile(r'^Management +Address +IPV6: +(?P<mgmt_address_ipv6>.+)$')
         # Vlan ID: not advertised
-        p12 = re.compile(r'^Vlan +ID: +(?P<vlan_id>.+)$')
+        p12 = regex_engine.compile(r'^Vlan +ID: +(?P<vlan_id>.+)$')
         # Total entries displayed: 2
-        p13 = re.compile(r'^Total +entries +displayed: +(?P<total_entries>\d+)$')
+        p13 = regex_engine.compile(r'^Total +entries +displayed: +(?P<total_entries>\d+)$')
 
         # VRP (R) software, Version 8.80 (CE6850 V100R003C00SPC600)
-        p14 = re.compile(r'(?P<custom_name>VRP .+)$')
+        p14 = regex_engine.compile(r'(?P<custom_name>VRP .+)$')
 
         # customer devices
-        p15 = re.compile(r'(?P<special_name>HUA.+)$')
+        p15 = regex_engine.compile(r'(?P<special_name>HUA.+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -514,7 +515,7 @@ class ShowLldpTraffic(ShowLldpTrafficSchema):
         #         Total frames received in error: 0
         #         Total frames discarded: 0
         #         Total unrecognized TLVs: 0
-        p1 = re.compile(r'^(?P<pattern>[\w\s]+): +(?P<value>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<pattern>[\w\s]+): +(?P<value>\d+)$')
         for line in out.splitlines():
             line = line.strip()
             m = p1.match(line)
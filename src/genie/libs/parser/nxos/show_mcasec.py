@@ -15,12 +15,12 @@ NXOS parsers for the following show commands:
 '''
 
 # python
-import re
 # metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
     
 # =========================================
@@ -60,13 +60,13 @@ class ShowMacSecMkaSummary(ShowMacSecMkaSummarySchema):
            cmd = self.cli_command[0]
            output = self.device.execute(cmd)
 
-        p0 = re.compile(r'Macsec is shutdown')
+        p0 = regex_engine.compile(r'Macsec is shutdown')
         
         #Interface          Status   Cipher (Operational)   Key-Server   MACSEC-policy                    Keychain                         Fallback-keychain
         #Ethernet1/1        Secured  GCM-AES-XPN-256        Yes          mp1                              kc1                              no keychain
         #Ethernet1/9/1      Init      No Cipher             Yes         Test-MP1                          Test-KC1                         no keychain
 
-        p1 = re.compile(r'(?P<interface>[E|e]thernet[0-9/]+)\s+'
+        p1 = regex_engine.compile(r'(?P<interface>[E|e]thernet[0-9/]+)\s+'
             r'(?P<status>[Secured|Init|Pending|down]+)\s+'
             r'(?P<cipher_suite>GCM-AES-128|GCM-AES-256|CM-AES-XPN-128|GCM-AES-XPN-256|No Cipher|-)\s+'
             r'(?P<key_server>Yes|No|-)\s+(?P<macsec_policy>\S+)\s+'
@@ -142,9 +142,9 @@ class ShowMacSecMkaSession(ShowMacSecMkaSessionSchema):
                 cmd = self.cli_command[0]
             output = self.device.execute(cmd)
 
-        p0 = re.compile(r'Macsec is shutdown')
+        p0 = regex_engine.compile(r'Macsec is shutdown')
         #Ethernet1/1        6026.aa7e.0302/0001              1                  Secured            Yes                PRIMARY-PSK
-        p1 = re.compile(r'(?P<interface>\S+)\s+'
+        p1 = regex_engine.compile(r'(?P<interface>\S+)\s+'
             r'(?P<local_txSci>\S+)\s+'
             r'(?P<peers>([\d]+))\s+'
             r'(?P<status>([a-zA-Z]+))\s+'
@@ -154,9 +154,9 @@ class ShowMacSecMkaSession(ShowMacSecMkaSessionSchema):
         # Total Number of Sessions : 28
         # Secured Sessions : 21
         # Pending Sessions : 7
-        p2 = re.compile(r'Total Number of Sessions\s+:\s+(?P<total_sessions>\d+)')
-        p3 = re.compile(r'Secured Sessions\s+:\s+(?P<secured_sessions>\d+)')
-        p4 = re.compile(r'Pending Sessions\s+:\s+(?P<pending_sessions>\d+)')
+        p2 = regex_engine.compile(r'Total Number of Sessions\s+:\s+(?P<total_sessions>\d+)')
+        p3 = regex_engine.compile(r'Secured Sessions\s+:\s+(?P<secured_sessions>\d+)')
+        p4 = regex_engine.compile(r'Pending Sessions\s+:\s+(?P<pending_sessions>\d+)')
 
         macSecMkaSessionDict={}
         for line in output.splitlines():
@@ -288,100 +288,100 @@ class ShowMacSecMkaSessionDetails(ShowMacSecMkaSessionSchemaDetails):
         # -----------------------------------
         # Macsec is shutdown
         # -----------------------------------
-        p0 = re.compile(r'Macsec is shutdown')
+        p0 = regex_engine.compile(r'Macsec is shutdown')
         
         #Interface Name          : Ethernet1/1
-        p1 =  re.compile(r'^Interface +Name\s+\:\s+(?P<interface>\S+)')
+        p1 =  regex_engine.compile(r'^Interface +Name\s+\:\s+(?P<interface>\S+)')
 
         #Session Status                      : SECURED - Secured MKA Session with MACsec
-        p2 =  re.compile(r'^Session +Status\s+\:\s+(?P<status>(.*))')
+        p2 =  regex_engine.compile(r'^Session +Status\s+\:\s+(?P<status>(.*))')
 
         #Local Tx-SCI                        : 6026.aa7e.0302/0001
-        p3 =  re.compile(r'^Local +Tx-SCI\s+\:\s+(?P<local_txSci>\S+)')
+        p3 =  regex_engine.compile(r'^Local +Tx-SCI\s+\:\s+(?P<local_txSci>\S+)')
 
         #Local Tx-SSCI                       : 1
-        p4 =  re.compile(r'^Local +Tx-SSCI\s+\:\s+(?P<local_txSsci>\S+)')
+        p4 =  regex_engine.compile(r'^Local +Tx-SSCI\s+\:\s+(?P<local_txSsci>\S+)')
 
         #MKA Port Identifier                 : 1
-        p5 =  re.compile(r'^MKA +Port +Identifier\s+\:\s+(?P<mka_port_identi>\S+)')
+        p5 =  regex_engine.compile(r'^MKA +Port +Identifier\s+\:\s+(?P<mka_port_identi>\S+)')
 
         #CAK Name (CKN)                      : 12
-        p6 =  re.compile(r'^CAK +Name +\(CKN\)\s+\:\s+(?P<cak_name>\S+)')
+        p6 =  regex_engine.compile(r'^CAK +Name +\(CKN\)\s+\:\s+(?P<cak_name>\S+)')
 
         #CA Authentication Mode              : PRIMARY-PSK
-        p7 =  re.compile(r'^CA +Authentication +Mode\s+\:\s+(?P<ca_auth_mode>\S+)')
+        p7 =  regex_engine.compile(r'^CA +Authentication +Mode\s+\:\s+(?P<ca_auth_mode>\S+)')
 
         #Member Identifier (MI)              : 48456637DBF545CA72654999
-        p8 =  re.compile(r'^Member +Identifier +\(MI\)\s+\:\s+(?P<member_intenti>\S+)')
+        p8 =  regex_engine.compile(r'^Member +Identifier +\(MI\)\s+\:\s+(?P<member_intenti>\S+)')
 
         #Message Number (MN)                 : 171474
-        p9 =  re.compile(r'^Message +Number +\(MN\)\s+\:\s+(?P<message_num>\S+)')
+        p9 =  regex_engine.compile(r'^Message +Number +\(MN\)\s+\:\s+(?P<message_num>\S+)')
 
         #MKA Policy Name                     : mp1
-        p10 =  re.compile(r'^MKA +Policy +Name\s+\:\s+(?P<mka_policy_name>\S+)')
+        p10 =  regex_engine.compile(r'^MKA +Policy +Name\s+\:\s+(?P<mka_policy_name>\S+)')
 
         #Key Server Priority                 : 0
-        p11 =  re.compile(r'^Key +Server +Priority\s+\:\s+(?P<key_server_prio>\S+)')
+        p11 =  regex_engine.compile(r'^Key +Server +Priority\s+\:\s+(?P<key_server_prio>\S+)')
 
         #Key Server                          : Yes
-        p12 =  re.compile(r'^Key +Server\s+\:\s+(?P<key_server>\S+)')
+        p12 =  regex_engine.compile(r'^Key +Server\s+\:\s+(?P<key_server>\S+)')
 
         #Include ICV                         : Yes
-        p13 =  re.compile(r'^Include +ICV\s+\:\s+(?P<include_icv>\S+)')
+        p13 =  regex_engine.compile(r'^Include +ICV\s+\:\s+(?P<include_icv>\S+)')
 
         #SAK Cipher Suite                    : GCM-AES-XPN-256
-        p14 =  re.compile(r'^SAK +Cipher +Suite\s+\:\s+(?P<sak_cipher_suite_cfg>\S+)')
+        p14 =  regex_engine.compile(r'^SAK +Cipher +Suite\s+\:\s+(?P<sak_cipher_suite_cfg>\S+)')
 
         #SAK Cipher Suite (Operational)      : GCM-AES-XPN-256
-        p15 =  re.compile(r'^SAK +Cipher +Suite +\(Operational\)\s+\:\s+(?P<sak_cipher_suite_oper>\S+)')
+        p15 =  regex_engine.compile(r'^SAK +Cipher +Suite +\(Operational\)\s+\:\s+(?P<sak_cipher_suite_oper>\S+)')
 
         #Replay Window Size                  : 15000
-        p16 =  re.compile(r'^Replay +Window +Size\s+\:\s+(?P<replay_window_size>\S+)')
+        p16 =  regex_engine.compile(r'^Replay +Window +Size\s+\:\s+(?P<replay_window_size>\S+)')
 
         #Confidentiality Offset              : CONF-OFFSET-50
-        p17 =  re.compile(r'^Confidentiality +Offset +\s+\:\s+(?P<conf_offset_cfg>\S+)')
+        p17 =  regex_engine.compile(r'^Confidentiality +Offset +\s+\:\s+(?P<conf_offset_cfg>\S+)')
 
         #Confidentiality Offset (Operational): CONF-OFFSET-50
-        p18 =  re.compile(r'^Confidentiality +Offset +\(Operational\)\s+\:\s+(?P<conf_offset_oper>\S+)')
+        p18 =  regex_engine.compile(r'^Confidentiality +Offset +\(Operational\)\s+\:\s+(?P<conf_offset_oper>\S+)')
 
         #Latest SAK Status                   : Rx & TX
-        p19 =  re.compile(r'^Latest +SAK +Status\s+\:\s+(?P<latest_sak_status>\S+\s+\S+\s+\S+)')
+        p19 =  regex_engine.compile(r'^Latest +SAK +Status\s+\:\s+(?P<latest_sak_status>\S+\s+\S+\s+\S+)')
 
         #Latest SAK AN                       : 0
-        p20 =  re.compile(r'^Latest +SAK +AN\s+\:\s+(?P<latest_sak_an>\S+)')
+        p20 =  regex_engine.compile(r'^Latest +SAK +AN\s+\:\s+(?P<latest_sak_an>\S+)')
 
         #Latest SAK KI                       : 48456637DBF545CA7265499900000001
-        p21 =  re.compile(r'^Latest +SAK +KI\s+\:\s+(?P<latest_sak_ki>\S+)')
+        p21 =  regex_engine.compile(r'^Latest +SAK +KI\s+\:\s+(?P<latest_sak_ki>\S+)')
 
         #Latest SAK KN                       : 1
-        p22 =  re.compile(r'^Latest +SAK +KN\s+\:\s+(?P<latest_sak_kn>\S+)')
+        p22 =  regex_engine.compile(r'^Latest +SAK +KN\s+\:\s+(?P<latest_sak_kn>\S+)')
 
         #Last SAK key time                   : 13:45:55 PDT Thu Oct 13 2022
-        p23 =  re.compile(r'^Last SAK key time\s+\:\s+(?P<last_sak_key_time>([0-9\:]+\s+[A-Z]+\s+[A-Za-z]+\s+[A-Za-z]+\s+\d+\s\d+))')
+        p23 =  regex_engine.compile(r'^Last SAK key time\s+\:\s+(?P<last_sak_key_time>([0-9\:]+\s+[A-Z]+\s+[A-Za-z]+\s+[A-Za-z]+\s+\d+\s\d+))')
 
         #CA Peer Count                       : 1
-        p24 =  re.compile(r'^CA +Peer +Count\s+\:\s+(?P<ca_peer_cnt>\S+)')
+        p24 =  regex_engine.compile(r'^CA +Peer +Count\s+\:\s+(?P<ca_peer_cnt>\S+)')
 
         #Eapol dest mac                      : 0180.c200.0003
-        p25 =  re.compile(r'^Eapol +dest +mac\s+\:\s+(?P<eapol_dst_mac>\S+)')
+        p25 =  regex_engine.compile(r'^Eapol +dest +mac\s+\:\s+(?P<eapol_dst_mac>\S+)')
 
         #Ether-type                          : 0x888e
-        p26 =  re.compile(r'^Ether-type\s+\:\s+(?P<ether_type>\S+)')
+        p26 =  regex_engine.compile(r'^Ether-type\s+\:\s+(?P<ether_type>\S+)')
 
         #Peer Status:
-        p27 =  re.compile(r'^Peer +\Status:')
+        p27 =  regex_engine.compile(r'^Peer +\Status:')
 
         #Peer MI                             : 3007D03EFE2933B1EAD94639
-        p28 =  re.compile(r'^Peer +MI\s+\:\s+(?P<peer_mi>\S+)')
+        p28 =  regex_engine.compile(r'^Peer +MI\s+\:\s+(?P<peer_mi>\S+)')
 
         #RxSCI                               : 3c13.cc55.e506/0001
-        p29 =  re.compile(r'^RxSCI\s+\:\s+(?P<rx_sci>\S+)')
+        p29 =  regex_engine.compile(r'^RxSCI\s+\:\s+(?P<rx_sci>\S+)')
 
         #Peer CAK                            : Match
-        p30 =  re.compile(r'^Peer +CAK\s+\:\s+(?P<peer_cak>\S+)')
+        p30 =  regex_engine.compile(r'^Peer +CAK\s+\:\s+(?P<peer_cak>\S+)')
 
         #Latest Rx MKPDU                     : 13:06:06 PDT Mon Oct 17 2022
-        p31 =  re.compile(r'^Latest +Rx +MKPDU\s+\:\s+(?P<latest_rx_mkpdu>([0-9\:]+\s+[A-Z]+\s+[A-Za-z]+\s+[A-Za-z]+\s+\d+\s\d+))')
+        p31 =  regex_engine.compile(r'^Latest +Rx +MKPDU\s+\:\s+(?P<latest_rx_mkpdu>([0-9\:]+\s+[A-Z]+\s+[A-Za-z]+\s+[A-Za-z]+\s+\d+\s\d+))')
 
         macSecMkaSessionDict={}
         count = 0
@@ -677,185 +677,185 @@ class ShowMacSecMkaStats(ShowMacSecMkaStatsSchema):
         # -----------------------------------
         # Macsec is shutdown
         # -----------------------------------
-        p0 = re.compile(r'Macsec is shutdown')
+        p0 = regex_engine.compile(r'Macsec is shutdown')
         
         #MKA Global Statistics
-        p1 = re.compile(r'^MKA +Global +Statistics')
+        p1 = regex_engine.compile(r'^MKA +Global +Statistics')
 
         #MKA Session Events:
-        p2 =  re.compile(r'^MKA +Session +Events\:')
+        p2 =  regex_engine.compile(r'^MKA +Session +Events\:')
 
         #Secured Events............. 51
-        p3 =  re.compile(r'^Secured +Events\S+\s+(?P<secured_events>\S+)')
+        p3 =  regex_engine.compile(r'^Secured +Events\S+\s+(?P<secured_events>\S+)')
 
         #Deleted (Secured) Events... 0
-        p4 =  re.compile(r'^Deleted +\(Secured\) +Events\S+\s+(?P<del_secured_events>\S+)')
+        p4 =  regex_engine.compile(r'^Deleted +\(Secured\) +Events\S+\s+(?P<del_secured_events>\S+)')
 
         #Keepalive Timeout Events... 8748926
-        p5 = re.compile(r'^Keepalive +Timeout +Events\S+\s+(?P<keepalive_timeout_events>\S+)')
+        p5 = regex_engine.compile(r'^Keepalive +Timeout +Events\S+\s+(?P<keepalive_timeout_events>\S+)')
 
         #CA Statistics
-        p6 = re.compile(r'^CA +Statistics')
+        p6 = regex_engine.compile(r'^CA +Statistics')
 
         #Pairwise CAK Rekeys........ 0
-        p7 = re.compile(r'^Pairwise +CAK +Rekeys\S+\s+(?P<pairwise_cak_rekeys>\S+)')
+        p7 = regex_engine.compile(r'^Pairwise +CAK +Rekeys\S+\s+(?P<pairwise_cak_rekeys>\S+)')
 
         #SA Statistics
-        p8 = re.compile(r'^SA +Statistics')
+        p8 = regex_engine.compile(r'^SA +Statistics')
 
         #   SAKs Generated............. 85
-        p9 = re.compile(r'^SAKs +Generated\S+\s+(?P<saks_generated>\S+)')
+        p9 = regex_engine.compile(r'^SAKs +Generated\S+\s+(?P<saks_generated>\S+)')
 
         #   SAKs Rekeyed............... 0
-        p10 = re.compile(r'^SAKs +Rekeyed\S+\s+(?P<saks_rekeyed>\S+)')
+        p10 = regex_engine.compile(r'^SAKs +Rekeyed\S+\s+(?P<saks_rekeyed>\S+)')
 
         #   SAKs Received.............. 0
-        p11 = re.compile(r'^SAKs +Received\S+\s+(?P<saks_recieved>\S+)')
+        p11 = regex_engine.compile(r'^SAKs +Received\S+\s+(?P<saks_recieved>\S+)')
 
         #  SAK Responses Received..... 51
-        p12 = re.compile(r'^SAK +Responses +Received\S+\s+(?P<sak_response_recieved>\S+)')
+        p12 = regex_engine.compile(r'^SAK +Responses +Received\S+\s+(?P<sak_response_recieved>\S+)')
 
         #MKPDU Statistics
-        p13 = re.compile(r'^MKPDU +Statistics')
+        p13 = regex_engine.compile(r'^MKPDU +Statistics')
 
         #   MKPDUs Validated & Rx...... 8748688
-        p14 = re.compile(r'^MKPDUs +Validated +& +Rx\S+\s+(?P<mkpdu_valid_rx>\S+)')
+        p14 = regex_engine.compile(r'^MKPDUs +Validated +& +Rx\S+\s+(?P<mkpdu_valid_rx>\S+)')
 
         #      "Distributed SAK"..... 0
-        p15 = re.compile(r'^\"Distributed +SAK\"\S+\s+(?P<mkpdu_rx_distributed_sak>\S+)')
+        p15 = regex_engine.compile(r'^\"Distributed +SAK\"\S+\s+(?P<mkpdu_rx_distributed_sak>\S+)')
 
         #   MKPDUs Transmitted......... 8749133
-        p16 = re.compile(r'^MKPDUs +Transmitted\S+\s+(?P<mkpdus_tx>\S+)')
+        p16 = regex_engine.compile(r'^MKPDUs +Transmitted\S+\s+(?P<mkpdus_tx>\S+)')
 
         #      "Distributed SAK"..... 111
-        p17 = re.compile(r'^\"Distributed +SAK\"\S+\s+(?P<mkpdu_tx_distributed_sak>\S+)')
+        p17 = regex_engine.compile(r'^\"Distributed +SAK\"\S+\s+(?P<mkpdu_tx_distributed_sak>\S+)')
 
         #MKA Error Counter Totals
-        p18 = re.compile(r'^MKA +Error +Counter +Totals')
+        p18 = regex_engine.compile(r'^MKA +Error +Counter +Totals')
 
         #Session Failures
-        p19 = re.compile(r'^Session +Failures')
+        p19 = regex_engine.compile(r'^Session +Failures')
 
         #   Bring-up Failures................ 0
-        p20 = re.compile(r'^Bring-up +Failures\S+\s+(?P<bringup_failures>\S+)')
+        p20 = regex_engine.compile(r'^Bring-up +Failures\S+\s+(?P<bringup_failures>\S+)')
 
         #SAK Failures
-        p21 = re.compile(r'^SAK +Failures')
+        p21 = regex_engine.compile(r'^SAK +Failures')
 
         #SAK Generation................... 0
-        p22 = re.compile(r'^SAK +Generation\S+\s+(?P<sak_gen>\S+)')
+        p22 = regex_engine.compile(r'^SAK +Generation\S+\s+(?P<sak_gen>\S+)')
 
         #Hash Key Generation.............. 0
-        p23 = re.compile(r'^Hash +Key +Generation\S+\s+(?P<hash_key_gen>\S+)')
+        p23 = regex_engine.compile(r'^Hash +Key +Generation\S+\s+(?P<hash_key_gen>\S+)')
 
         #SAK Encryption/Wrap.............. 0
-        p24 = re.compile(r'^SAK +Encryption/Wrap\S+\s+(?P<sack_ecrypt_wrap>\S+)')
+        p24 = regex_engine.compile(r'^SAK +Encryption/Wrap\S+\s+(?P<sack_ecrypt_wrap>\S+)')
 
         #SAK Decryption/Unwrap............ 0
-        p25 = re.compile(r'^SAK +Decryption/Unwrap\S+\s+(?P<sack_decrypt_unwrap>\S+)')
+        p25 = regex_engine.compile(r'^SAK +Decryption/Unwrap\S+\s+(?P<sack_decrypt_unwrap>\S+)')
 
         #SAK Cipher Mismatch.............. 0
-        p26 = re.compile(r'^SAK +Cipher +Mismatch\S+\s+(?P<sack_cipher_mismatch>\S+)')
+        p26 = regex_engine.compile(r'^SAK +Cipher +Mismatch\S+\s+(?P<sack_cipher_mismatch>\S+)')
 
         #CA Failures
-        p27 = re.compile(r'^CA +Failures')
+        p27 = regex_engine.compile(r'^CA +Failures')
 
         #   ICK Derivation................... 0
-        p28 = re.compile(r'^ICK +Derivation\S+\s+(?P<ick_derivation>\S+)')
+        p28 = regex_engine.compile(r'^ICK +Derivation\S+\s+(?P<ick_derivation>\S+)')
 
         #   KEK Derivation................... 0
-        p29 = re.compile(r'^KEK +Derivation\S+\s+(?P<kek_derivation>\S+)')
+        p29 = regex_engine.compile(r'^KEK +Derivation\S+\s+(?P<kek_derivation>\S+)')
 
         #   Invalid Peer MACsec Capability... 0
-        p30 = re.compile(r'^Invalid +Peer +MACsec +Capability\S+\s+(?P<invalid_peer_macsec_capab>\S+)')
+        p30 = regex_engine.compile(r'^Invalid +Peer +MACsec +Capability\S+\s+(?P<invalid_peer_macsec_capab>\S+)')
 
         #MACsec Failures
-        p31 = re.compile(r'^MACsec +Failures')
+        p31 = regex_engine.compile(r'^MACsec +Failures')
 
         #    Rx SA Installation............... 0
-        p32 = re.compile(r'^Rx +SA +Installation\S+\s+(?P<rx_sa_install>\S+)')
+        p32 = regex_engine.compile(r'^Rx +SA +Installation\S+\s+(?P<rx_sa_install>\S+)')
 
         #Tx SA Installation............... 0
-        p33 = re.compile(r'^Tx +SA +Installation\S+\s+(?P<tx_sa_install>\S+)')
+        p33 = regex_engine.compile(r'^Tx +SA +Installation\S+\s+(?P<tx_sa_install>\S+)')
 
         #MKPDU Failures
-        p34 = re.compile(r'^MKPDU +Failures')
+        p34 = regex_engine.compile(r'^MKPDU +Failures')
 
         #   MKPDU Tx......................... 0
-        p35 = re.compile(r'^MKPDU +Tx\S+\s+(?P<mkpdu_tx>\S+)')
+        p35 = regex_engine.compile(r'^MKPDU +Tx\S+\s+(?P<mkpdu_tx>\S+)')
 
         #   MKPDU Rx Validation ..................... 1
         #   MKPDU Rx Validation.............. 202
-        p36 = re.compile(r'^MKPDU +Rx +Validation\s+\S+\s+(?P<mkpdu_rx_validation>\S+)')
+        p36 = regex_engine.compile(r'^MKPDU +Rx +Validation\s+\S+\s+(?P<mkpdu_rx_validation>\S+)')
 
         #   MKPDU Rx Bad Peer MN............. 0
-        p37 = re.compile(r'^MKPDU +Rx +Bad +Peer +MN\S+\s+(?P<mkpdu_rx_bad_peer_mn>\S+)')
+        p37 = regex_engine.compile(r'^MKPDU +Rx +Bad +Peer +MN\S+\s+(?P<mkpdu_rx_bad_peer_mn>\S+)')
 
         #   MKPDU Rx Non-recent Peerlist MN.. 0
-        p38 = re.compile(r'^MKPDU +Rx +Non-recent +Peerlist +MN\S+\s+(?P<mkpdu_rx_no_recent_peerlist_mn>\S+)')
+        p38 = regex_engine.compile(r'^MKPDU +Rx +Non-recent +Peerlist +MN\S+\s+(?P<mkpdu_rx_no_recent_peerlist_mn>\S+)')
 
         #   MKPDU Rx Drop SAKUSE, KN mismatch...... 0
-        p39 = re.compile(r'^MKPDU +Rx +Drop +SAKUSE, +KN +mismatch\S+\s+(?P<mkpdu_rxdrop_sakuse_kn_mismatch>\S+)')
+        p39 = regex_engine.compile(r'^MKPDU +Rx +Drop +SAKUSE, +KN +mismatch\S+\s+(?P<mkpdu_rxdrop_sakuse_kn_mismatch>\S+)')
 
         #   MKPDU Rx Drop SAKUSE, Rx Not Set....... 0
-        p40 = re.compile(r'^MKPDU +Rx +Drop +SAKUSE, +Rx +Not +Set\S+\s+(?P<mkpdu_rxdrop_sakuse_rx_notset>\S+)')
+        p40 = regex_engine.compile(r'^MKPDU +Rx +Drop +SAKUSE, +Rx +Not +Set\S+\s+(?P<mkpdu_rxdrop_sakuse_rx_notset>\S+)')
 
         #   MKPDU Rx Drop SAKUSE, Key MI mismatch.. 0
-        p41 = re.compile(r'^MKPDU +Rx +Drop +SAKUSE, +Key +MI +mismatch\S+\s+(?P<mkpdu_rxdrop_sakuse_key_mi_mismatch>\S+)')
+        p41 = regex_engine.compile(r'^MKPDU +Rx +Drop +SAKUSE, +Key +MI +mismatch\S+\s+(?P<mkpdu_rxdrop_sakuse_key_mi_mismatch>\S+)')
 
         #   MKPDU Rx Drop SAKUSE, AN Not in Use.... 0
-        p42 = re.compile(r'^MKPDU +Rx +Drop +SAKUSE, +AN +Not +in +Use\S+\s+(?P<mkpdu_rxdrop_sakuse_an_not_inuse>\S+)')
+        p42 = regex_engine.compile(r'^MKPDU +Rx +Drop +SAKUSE, +AN +Not +in +Use\S+\s+(?P<mkpdu_rxdrop_sakuse_an_not_inuse>\S+)')
 
         #   MKPDU Rx Drop SAKUSE, KS Rx/Tx Not Set. 0
-        p43 = re.compile(r'^MKPDU +Rx +Drop +SAKUSE, +KS +Rx/Tx +Not +Set\S+\s+(?P<mkpdu_rxdrop_sakuse_ks_rxtx_notset>\S+)')
+        p43 = regex_engine.compile(r'^MKPDU +Rx +Drop +SAKUSE, +KS +Rx/Tx +Not +Set\S+\s+(?P<mkpdu_rxdrop_sakuse_ks_rxtx_notset>\S+)')
 
         #Global Statistics
-        p44 = re.compile(r'^Global +Statistics')
+        p44 = regex_engine.compile(r'^Global +Statistics')
 
         #MKPDUs Rx Invalid CKN...... 0
-        p45 = re.compile(r'^MKPDUs +Rx +Invalid +CKN\S+\s+(?P<mkpdu_rx_invalid_ckn>\S+)')
+        p45 = regex_engine.compile(r'^MKPDUs +Rx +Invalid +CKN\S+\s+(?P<mkpdu_rx_invalid_ckn>\S+)')
 
         #   MKPDUs Tx Pkt Build Fail... 0
-        p46 = re.compile(r'^MKPDUs +Tx +Pkt +Build +Fail\S+\s+(?P<mkpdu_tx_pkt_build_fail>\S+)')
+        p46 = regex_engine.compile(r'^MKPDUs +Tx +Pkt +Build +Fail\S+\s+(?P<mkpdu_tx_pkt_build_fail>\S+)')
 
         #Per-CA MKA Statistics for Session on interface (Ethernet1/1) with CKN 12
-        p47 = re.compile(r'^Per-CA +MKA +Statistics +for +Session +on +interface +\((?P<interface>\S+)\) +with +CKN \d+')
+        p47 = regex_engine.compile(r'^Per-CA +MKA +Statistics +for +Session +on +interface +\((?P<interface>\S+)\) +with +CKN \d+')
 
         #MKA Statistics for Session on interface (Ethernet1/1)
-        p48 = re.compile(r'^MKA +Statistics +for +Session +on +interface +\((?P<interface>\S+)\)')
+        p48 = regex_engine.compile(r'^MKA +Statistics +for +Session +on +interface +\((?P<interface>\S+)\)')
 
         #MKA IDB Statistics
-        p49 = re.compile(r'^MKA +IDB +Statistics')
+        p49 = regex_engine.compile(r'^MKA +IDB +Statistics')
 
         #  MKPDUs Tx Success.......... 171562
-        p50 = re.compile(r'^MKPDUs +Tx +Success\S+\s+(?P<mkpdu_tx_success>\S+)')
+        p50 = regex_engine.compile(r'^MKPDUs +Tx +Success\S+\s+(?P<mkpdu_tx_success>\S+)')
 
         #   MKPDUs Tx Fail............. 0
-        p51 = re.compile(r'^MKPDUs +Tx +Fail\S+\s+(?P<mkpdu_tx_fail>\S+)')
+        p51 = regex_engine.compile(r'^MKPDUs +Tx +Fail\S+\s+(?P<mkpdu_tx_fail>\S+)')
 
         #   MKPDUS Tx Pkt build fail... 0
-        p52 = re.compile(r'^MKPDUS +Tx +Pkt +build +fail\S+\s+(?P<mkpdu_tx_build_fail>\S+)')
+        p52 = regex_engine.compile(r'^MKPDUS +Tx +Pkt +build +fail\S+\s+(?P<mkpdu_tx_build_fail>\S+)')
 
         #   MKPDUS No Tx on intf down.. 0
-        p53 = re.compile(r'^MKPDUS +No +Tx +on +intf +down\S+\s+(?P<mkpdu_no_tx_on_intf_down>\S+)')
+        p53 = regex_engine.compile(r'^MKPDUS +No +Tx +on +intf +down\S+\s+(?P<mkpdu_no_tx_on_intf_down>\S+)')
 
         #   MKPDUS No Rx on intf down.. 0
-        p54 = re.compile(r'^MKPDUS +No +Rx +on +intf +down\S+\s+(?P<mkpdu_no_rx_on_intf_down>\S+)')
+        p54 = regex_engine.compile(r'^MKPDUS +No +Rx +on +intf +down\S+\s+(?P<mkpdu_no_rx_on_intf_down>\S+)')
 
         #   MKPDUs Rx CA Not found..... 1
-        p55 = re.compile(r'^MKPDUs +Rx +CA +Not +found\S+\s+(?P<mkpdu_rx_ca_not_found>\S+)')
+        p55 = regex_engine.compile(r'^MKPDUs +Rx +CA +Not +found\S+\s+(?P<mkpdu_rx_ca_not_found>\S+)')
 
         #   MKPDUs Rx Error............ 0
-        p56 = re.compile(r'^MKPDUs +Rx +Error\S+\s+(?P<mkpdu_rx_error>\S+)')
+        p56 = regex_engine.compile(r'^MKPDUs +Rx +Error\S+\s+(?P<mkpdu_rx_error>\S+)')
 
         #   MKPDUs Rx Success.......... 171556
-        p57 = re.compile(r'^MKPDUs +Rx +Success\S+\s+(?P<mkpdu_rx_success>\S+)')
+        p57 = regex_engine.compile(r'^MKPDUs +Rx +Success\S+\s+(?P<mkpdu_rx_success>\S+)')
 
         #   MKPDU Rx Drop Packet, Ethertype Mismatch. 0
-        p58 = re.compile(r'^MKPDU +Rx +Drop +Packet, +Ethertype +Mismatch\S+\s+(?P<mkpdu_rx_drp_pkt_eth_mismatch>\S+)')
+        p58 = regex_engine.compile(r'^MKPDU +Rx +Drop +Packet, +Ethertype +Mismatch\S+\s+(?P<mkpdu_rx_drp_pkt_eth_mismatch>\S+)')
 
         #  MKPDU Rx Drop Packet, DestMAC Mismatch... 0
-        p59 = re.compile(r'^MKPDU +Rx +Drop +Packet, +DestMAC +Mismatch\S+\s+(?P<mkpdu_rx_drp_pkt_dstmac_mismatch>\S+)')
+        p59 = regex_engine.compile(r'^MKPDU +Rx +Drop +Packet, +DestMAC +Mismatch\S+\s+(?P<mkpdu_rx_drp_pkt_dstmac_mismatch>\S+)')
 
         macSecMkaStatsDict={}
         flag_per_ca_mka_stat = 0
@@ -1400,154 +1400,154 @@ class ShowMacSecMkaStatsIntf(ShowMacSecMkaStatsIntfSchema):
         # Macsec is shutdown
         # -----------------------------------
         # switch#
-        p0 = re.compile(r'^Macsec is shutdown')
+        p0 = regex_engine.compile(r'^Macsec is shutdown')
 
         # Per-CA MKA Statistics for Session on interface (Ethernet1/1/1) with CKN 10100000
-        p1  = re.compile(r'^Per-CA MKA Statistics for Session on interface \((?P<intf>[Ethernet0-9/]+).*$')
+        p1  = regex_engine.compile(r'^Per-CA MKA Statistics for Session on interface \((?P<intf>[Ethernet0-9/]+).*$')
 
         #MKA Statistics for Session on interface (Ethernet1/25)
-        p2 = re.compile(r'^MKA Statistics for Session on interface \([Ethernet0-9/]+\)$')
+        p2 = regex_engine.compile(r'^MKA Statistics for Session on interface \([Ethernet0-9/]+\)$')
         #########
         # CA Statistics
-        p3 = re.compile(r'^CA +Statistics$')
+        p3 = regex_engine.compile(r'^CA +Statistics$')
 
         # Pairwise CAK Rekeys........ 0
-        p4 = re.compile(r'^Pairwise +CAK +Rekeys\S+\s+(?P<pairwise_cak_rekeys>\S+)$')
+        p4 = regex_engine.compile(r'^Pairwise +CAK +Rekeys\S+\s+(?P<pairwise_cak_rekeys>\S+)$')
 
         #########
         # SA Statistics
-        p5 = re.compile(r'^SA +Statistics$')
+        p5 = regex_engine.compile(r'^SA +Statistics$')
 
         #   SAKs Generated............. 85
-        p6 = re.compile(r'^SAKs +Generated\S+\s+(?P<saks_generated>\S+)$')
+        p6 = regex_engine.compile(r'^SAKs +Generated\S+\s+(?P<saks_generated>\S+)$')
 
         #   SAKs Rekeyed............... 0
-        p7 = re.compile(r'^SAKs +Rekeyed\S+\s+(?P<saks_rekeyed>\S+)$')
+        p7 = regex_engine.compile(r'^SAKs +Rekeyed\S+\s+(?P<saks_rekeyed>\S+)$')
 
         #   SAKs Received.............. 0
-        p8 = re.compile(r'^SAKs +Received\S+\s+(?P<saks_received>\S+)$')
+        p8 = regex_engine.compile(r'^SAKs +Received\S+\s+(?P<saks_received>\S+)$')
 
         #  SAK Responses Received..... 51
-        p9 = re.compile(r'^SAK +Responses +Received\S+\s+(?P<sak_response_received>\S+)$')
+        p9 = regex_engine.compile(r'^SAK +Responses +Received\S+\s+(?P<sak_response_received>\S+)$')
 
         #########
         # MKPDU Statistics
-        p10 = re.compile(r'^MKPDU +Statistics$')
+        p10 = regex_engine.compile(r'^MKPDU +Statistics$')
 
         #   MKPDUs Validated & Rx...... 8748688
-        p11 = re.compile(r'^MKPDUs +Validated +& +Rx\S+\s+(?P<mkpdu_valid_rx>\S+)$')
+        p11 = regex_engine.compile(r'^MKPDUs +Validated +& +Rx\S+\s+(?P<mkpdu_valid_rx>\S+)$')
 
         #   MKPDUs Transmitted......... 8749133
-        p12 = re.compile(r'^MKPDUs +Transmitted\S+\s+(?P<mkpdus_tx>\S+)$')
+        p12 = regex_engine.compile(r'^MKPDUs +Transmitted\S+\s+(?P<mkpdus_tx>\S+)$')
 
         #      "Distributed SAK"..... 111
-        p13 = re.compile(r'^\"Distributed +SAK\"\S+\s+(?P<mkpdu_distributed_sak>\S+)$')
+        p13 = regex_engine.compile(r'^\"Distributed +SAK\"\S+\s+(?P<mkpdu_distributed_sak>\S+)$')
 
 
         #########
         # MKA IDB Statistics
-        p15 = re.compile(r'^MKA +IDB +Statistics$')
+        p15 = regex_engine.compile(r'^MKA +IDB +Statistics$')
 
         #MKPDUs Tx Success.......... 171562
-        p16 = re.compile(r'^MKPDUs +Tx +Success\S+\s+(?P<mkpdu_tx_success>\S+)$')
+        p16 = regex_engine.compile(r'^MKPDUs +Tx +Success\S+\s+(?P<mkpdu_tx_success>\S+)$')
 
         # MKPDUs Tx Fail............. 0
-        p17 = re.compile(r'^MKPDUs +Tx +Fail\S+\s+(?P<mkpdu_tx_fail>\S+)$')
+        p17 = regex_engine.compile(r'^MKPDUs +Tx +Fail\S+\s+(?P<mkpdu_tx_fail>\S+)$')
 
         #MKPDUS Tx Pkt build fail... 0
-        p18 = re.compile(r'^MKPDUS +Tx +Pkt +build +fail\S+\s+(?P<mkpdu_tx_build_fail>\S+)$')
+        p18 = regex_engine.compile(r'^MKPDUS +Tx +Pkt +build +fail\S+\s+(?P<mkpdu_tx_build_fail>\S+)$')
 
         #MKPDUS No Tx on intf down.. 0
-        p19 = re.compile(r'^MKPDUS +No +Tx +on +intf +down\S+\s+(?P<mkpdu_no_tx_on_intf_down>\S+)$')
+        p19 = regex_engine.compile(r'^MKPDUS +No +Tx +on +intf +down\S+\s+(?P<mkpdu_no_tx_on_intf_down>\S+)$')
 
         #MKPDUS No Rx on intf down.. 0
-        p20 = re.compile(r'^MKPDUS +No +Rx +on +intf +down\S+\s+(?P<mkpdu_no_rx_on_intf_down>\S+)$')
+        p20 = regex_engine.compile(r'^MKPDUS +No +Rx +on +intf +down\S+\s+(?P<mkpdu_no_rx_on_intf_down>\S+)$')
 
         #MKPDUs Rx CA Not found..... 1
-        p21 = re.compile(r'^MKPDUs +Rx +CA +Not +found\S+\s+(?P<mkpdu_rx_ca_not_found>\S+)$')
+        p21 = regex_engine.compile(r'^MKPDUs +Rx +CA +Not +found\S+\s+(?P<mkpdu_rx_ca_not_found>\S+)$')
 
         #MKPDUs Rx Error............ 0
-        p22 = re.compile(r'^MKPDUs +Rx +Error\S+\s+(?P<mkpdu_rx_error>\S+)$')
+        p22 = regex_engine.compile(r'^MKPDUs +Rx +Error\S+\s+(?P<mkpdu_rx_error>\S+)$')
 
         #MKPDUs Rx Success.......... 171556
-        p23 = re.compile(r'^MKPDUs +Rx +Success\S+\s+(?P<mkpdu_rx_success>\S+)$')
+        p23 = regex_engine.compile(r'^MKPDUs +Rx +Success\S+\s+(?P<mkpdu_rx_success>\S+)$')
 
         ##########
         # MKPDU Failures
-        p24 = re.compile(r'^MKPDU +Failures$')
+        p24 = regex_engine.compile(r'^MKPDU +Failures$')
 
         #MKPDU Rx Validation.............. 202
-        p25 = re.compile(r'^MKPDU +Rx +Validation\s+\S+\s+(?P<mkpdu_rx_validation>\S+)$')
+        p25 = regex_engine.compile(r'^MKPDU +Rx +Validation\s+\S+\s+(?P<mkpdu_rx_validation>\S+)$')
 
         #MKPDU Rx Bad Peer MN............. 0
-        p26 = re.compile(r'^MKPDU +Rx +Bad +Peer +MN\S+\s+(?P<mkpdu_rx_bad_peer_mn>\S+)$')
+        p26 = regex_engine.compile(r'^MKPDU +Rx +Bad +Peer +MN\S+\s+(?P<mkpdu_rx_bad_peer_mn>\S+)$')
 
         #MKPDU Rx Non-recent Peerlist MN.. 0
-        p27 = re.compile(r'^MKPDU +Rx +Non-recent +Peerlist +MN\S+\s+(?P<mkpdu_rx_no_recent_peerlist_mn>\S+)$')
+        p27 = regex_engine.compile(r'^MKPDU +Rx +Non-recent +Peerlist +MN\S+\s+(?P<mkpdu_rx_no_recent_peerlist_mn>\S+)$')
 
         #MKPDU Rx Drop SAKUSE, KN mismatch...... 0
-        p28 = re.compile(r'^MKPDU +Rx +Drop +SAKUSE, +KN +mismatch\S+\s+(?P<mkpdu_rxdrop_sakuse_kn_mismatch>\S+)$')
+        p28 = regex_engine.compile(r'^MKPDU +Rx +Drop +SAKUSE, +KN +mismatch\S+\s+(?P<mkpdu_rxdrop_sakuse_kn_mismatch>\S+)$')
 
         #MKPDU Rx Drop SAKUSE, Rx Not Set....... 0
-        p29 = re.compile(r'^MKPDU +Rx +Drop +SAKUSE, +Rx +Not +Set\S+\s+(?P<mkpdu_rxdrop_sakuse_rx_notset>\S+)$')
+        p29 = regex_engine.compile(r'^MKPDU +Rx +Drop +SAKUSE, +Rx +Not +Set\S+\s+(?P<mkpdu_rxdrop_sakuse_rx_notset>\S+)$')
 
         #MKPDU Rx Drop SAKUSE, Key MI mismatch.. 0
-        p30 = re.compile(
+        p30 = regex_engine.compile(
             r'^MKPDU +Rx +Drop +SAKUSE, +Key +MI +mismatch\S+\s+(?P<mkpdu_rxdrop_sakuse_key_mi_mismatch>\S+)$')
 
         #MKPDU Rx Drop SAKUSE, AN Not in Use.... 0
-        p31 = re.compile(r'^MKPDU +Rx +Drop +SAKUSE, +AN +Not +in +Use\S+\s+(?P<mkpdu_rxdrop_sakuse_an_not_inuse>\S+)$')
+        p31 = regex_engine.compile(r'^MKPDU +Rx +Drop +SAKUSE, +AN +Not +in +Use\S+\s+(?P<mkpdu_rxdrop_sakuse_an_not_inuse>\S+)$')
 
         #MKPDU Rx Drop SAKUSE, KS Rx/Tx Not Set. 0
-        p32 = re.compile(
+        p32 = regex_engine.compile(
         r'^MKPDU +Rx +Drop +SAKUSE, +KS +Rx/Tx +Not +Set\S+\s+(?P<mkpdu_rxdrop_sakuse_ks_rxtx_notset>\S+)$')
 
         #MKPDU Rx Drop Packet, Ethertype Mismatch. 0
-        p33 = re.compile(r'^MKPDU +Rx +Drop +Packet, +Ethertype +Mismatch\S+\s+(?P<mkpdu_rx_drp_pkt_eth_mismatch>\S+)$')
+        p33 = regex_engine.compile(r'^MKPDU +Rx +Drop +Packet, +Ethertype +Mismatch\S+\s+(?P<mkpdu_rx_drp_pkt_eth_mismatch>\S+)$')
 
         #MKPDU Rx Drop Packet, DestMAC Mismatch... 0
-        p34 = re.compile(r'^MKPDU +Rx +Drop +Packet, +DestMAC +Mismatch\S+\s+(?P<mkpdu_rx_drp_pkt_dest_mac_mismatch>\S+)$')
+        p34 = regex_engine.compile(r'^MKPDU +Rx +Drop +Packet, +DestMAC +Mismatch\S+\s+(?P<mkpdu_rx_drp_pkt_dest_mac_mismatch>\S+)$')
 
 
         ################
         # SAK Failures
-        p36 = re.compile(r'^SAK +Failures$')
+        p36 = regex_engine.compile(r'^SAK +Failures$')
 
         # SAK Generation................... 0
-        p37 = re.compile(r'^SAK +Generation\S+\s+(?P<sak_gen>\S+)$')
+        p37 = regex_engine.compile(r'^SAK +Generation\S+\s+(?P<sak_gen>\S+)$')
 
         # Hash Key Generation.............. 0
-        p38 = re.compile(r'^Hash +Key +Generation\S+\s+(?P<hash_key_gen>\S+)$')
+        p38 = regex_engine.compile(r'^Hash +Key +Generation\S+\s+(?P<hash_key_gen>\S+)$')
 
         # SAK Encryption/Wrap.............. 0
-        p39 = re.compile(r'^SAK +Encryption/Wrap\S+\s+(?P<sack_ecrypt_wrap>\S+)$')
+        p39 = regex_engine.compile(r'^SAK +Encryption/Wrap\S+\s+(?P<sack_ecrypt_wrap>\S+)$')
 
         # SAK Decryption/Unwrap............ 0
-        p40 = re.compile(r'^SAK +Decryption/Unwrap\S+\s+(?P<sack_decrypt_unwrap>\S+)$')
+        p40 = regex_engine.compile(r'^SAK +Decryption/Unwrap\S+\s+(?P<sack_decrypt_unwrap>\S+)$')
 
 
         ################
         # CA Failures
-        p41 = re.compile(r'^CA +Failures$')
+        p41 = regex_engine.compile(r'^CA +Failures$')
 
         #   ICK Derivation................... 0
-        p42 = re.compile(r'^ICK +Derivation\S+\s+(?P<ick_derivation>\S+)$')
+        p42 = regex_engine.compile(r'^ICK +Derivation\S+\s+(?P<ick_derivation>\S+)$')
 
         #   KEK Derivation................... 0
-        p43 = re.compile(r'^KEK +Derivation\S+\s+(?P<kek_derivation>\S+)$')
+        p43 = regex_engine.compile(r'^KEK +Derivation\S+\s+(?P<kek_derivation>\S+)$')
 
         #   Invalid Peer MACsec Capability... 0
-        p44 = re.compile(r'^Invalid +Peer +MACsec +Capability\S+\s+(?P<invalid_peer_macsec_capab>\S+)$')
+        p44 = regex_engine.compile(r'^Invalid +Peer +MACsec +Capability\S+\s+(?P<invalid_peer_macsec_capab>\S+)$')
 
         ###############
         # MACsec Failures
-        p45 = re.compile(r'^MACsec +Failures$')
+        p45 = regex_engine.compile(r'^MACsec +Failures$')
 
         #    Rx SA Installation............... 0
-        p46 = re.compile(r'^Rx +SA +Installation\S+\s+(?P<rx_sa_install>\S+)$')
+        p46 = regex_engine.compile(r'^Rx +SA +Installation\S+\s+(?P<rx_sa_install>\S+)$')
 
         # Tx SA Installation............... 0
-        p47 = re.compile(r'^Tx +SA +Installation\S+\s+(?P<tx_sa_install>\S+)$')
+        p47 = regex_engine.compile(r'^Tx +SA +Installation\S+\s+(?P<tx_sa_install>\S+)$')
 
         macsec_mka_stats_dict = {}
         distributed_rx = False  # Flag to control "Distributed SAK" data is for rx/tx direction
@@ -1889,21 +1889,21 @@ class ShowMacSecPolicy(ShowMacSecPolicySchema):
         # -------------------------------- ---------------- ---- ------------ -------- -------------- -------------- ------------- -------------
         # MP1                              Enforce-Peer     32   100000       30       must-secure    70             TRUE           FALSE
         # Test-MP1                         Enforce-Peer     16   148809600    0        should-secure  pn-rollover    FALSE          TRUE
-        p1 = re.compile(r'^(?P<policy_name>\S+)\s+(?P<cipher_suite>\S+)\s+(?P<priority>\d+)\s+(?P<window>\d+)\s+(?P<offset>\d+)\s+(?P<security>\S+)\s+(?P<sak_rekey_time>\S+)\s+(?P<icv_indicator>\S+)\s*(?P<include_sci>\S+)?$')
+        p1 = regex_engine.compile(r'^(?P<policy_name>\S+)\s+(?P<cipher_suite>\S+)\s+(?P<priority>\d+)\s+(?P<window>\d+)\s+(?P<offset>\d+)\s+(?P<security>\S+)\s+(?P<sak_rekey_time>\S+)\s+(?P<icv_indicator>\S+)\s*(?P<include_sci>\S+)?$')
         
         # MACSec Policy                    PPK Crypto-Policy-Name
         # -------------------------------- --------------------------------
         #     OR 
         # MACSec Policy                    Cipher-Suite Enforce-Peer
         # -------------------------------- -----------------------------------------------------
-        p2 = re.compile(r'^(?P<policy_header>\S+ \S+)\s+(?P<ppk_or_cipher_header>PPK Crypto-QKD-Profile Name|Cipher-Suite Enforce-Peer)$')
+        p2 = regex_engine.compile(r'^(?P<policy_header>\S+ \S+)\s+(?P<ppk_or_cipher_header>PPK Crypto-QKD-Profile Name|Cipher-Suite Enforce-Peer)$')
         
         # system-default-macsec-policy     test-ppk 
         # p1                               test-ppk-p1
         #           OR 
         # MP1                              GCM-AES-128
         # Test-MP1                         GCM-AES-256 GCM-AES-XPN-256 GCM-AES-XPN-128 GCM-AES-128
-        p3 = re.compile(r'^(?P<policy_name>\S+)\s+(?P<ppk_or_cipher_policy>[A-Za-z0-9_\- ]+)$')
+        p3 = regex_engine.compile(r'^(?P<policy_name>\S+)\s+(?P<ppk_or_cipher_policy>[A-Za-z0-9_\- ]+)$')
         
         #Flag to check header is PPK Crypto-Policy or Cipher-Suite Enforce-Peer
         cipher_ppk_header = None 
@@ -2067,124 +2067,124 @@ class ShowMacSecSecyStatistics(ShowMacSecSecyStatisticsSchema):
         # -----------------------------------
         # Macsec is shutdown
         # -----------------------------------
-        p0 = re.compile(r'^Macsec is shutdown$')
+        p0 = regex_engine.compile(r'^Macsec is shutdown$')
         #pattern to match first line of output
         #Interface Ethernet1/1 MACSEC SecY Statistics:
-        p1 = re.compile(r'^Interface\s+(?P<interface>\S+)\s+MACSEC\s+SecY\s+Statistics:$')
+        p1 = regex_engine.compile(r'^Interface\s+(?P<interface>\S+)\s+MACSEC\s+SecY\s+Statistics:$')
         #Interface Rx Statistics:
-        p2 = re.compile(r'^(?P<interface_rx_statistics>Interface Rx Statistics):$')
+        p2 = regex_engine.compile(r'^(?P<interface_rx_statistics>Interface Rx Statistics):$')
         #Unicast Uncontrolled Pkts: 478920
-        p3 = re.compile(r'^Unicast Uncontrolled Pkts:\s*(?P<unicast_uncontrolled_pkts>[0-9NA/]+).*$')
+        p3 = regex_engine.compile(r'^Unicast Uncontrolled Pkts:\s*(?P<unicast_uncontrolled_pkts>[0-9NA/]+).*$')
         #Multicast Uncontrolled Pkts: 187186
-        p4 = re.compile(r'^Multicast Uncontrolled Pkts:\s*(?P<multicast_uncontrolled_pkts>[0-9NA/]+).*$')
+        p4 = regex_engine.compile(r'^Multicast Uncontrolled Pkts:\s*(?P<multicast_uncontrolled_pkts>[0-9NA/]+).*$')
         #Broadcast Uncontrolled Pkts: 0
-        p5 = re.compile(r'^Broadcast Uncontrolled Pkts:\s*(?P<broadcast_uncontrolled_pkts>[0-9NA/]+).*$')
+        p5 = regex_engine.compile(r'^Broadcast Uncontrolled Pkts:\s*(?P<broadcast_uncontrolled_pkts>[0-9NA/]+).*$')
         #Uncontrolled Pkts - Rx Drop: 0
-        p6 = re.compile(r'^Uncontrolled Pkts - Rx Drop:\s*(?P<uncontrolled_pkts_rx_drop>[0-9NA/]+).*$')
+        p6 = regex_engine.compile(r'^Uncontrolled Pkts - Rx Drop:\s*(?P<uncontrolled_pkts_rx_drop>[0-9NA/]+).*$')
         #Uncontrolled Pkts - Rx Error: 0
-        p7 = re.compile(r'^Uncontrolled Pkts - Rx Error:\s*(?P<uncontrolled_pkts_rx_error>[0-9NA/]+).*$')
+        p7 = regex_engine.compile(r'^Uncontrolled Pkts - Rx Error:\s*(?P<uncontrolled_pkts_rx_error>[0-9NA/]+).*$')
         #Unicast Controlled Pkts: 0
-        p8 = re.compile(r'^Unicast Controlled Pkts:\s*(?P<unicast_controlled_pkts>[0-9NA/]+).*$')
+        p8 = regex_engine.compile(r'^Unicast Controlled Pkts:\s*(?P<unicast_controlled_pkts>[0-9NA/]+).*$')
         #Multicast Controlled Pkts: 0
-        p9 = re.compile(r'^Multicast Controlled Pkts:\s*(?P<multicast_controlled_pkts>[0-9NA/]+).*$')
+        p9 = regex_engine.compile(r'^Multicast Controlled Pkts:\s*(?P<multicast_controlled_pkts>[0-9NA/]+).*$')
         #Broadcast Controlled Pkts: 0
-        p10= re.compile(r'^Broadcast Controlled Pkts:\s*(?P<broadcast_controlled_pkts>[0-9NA/]+).*$')
+        p10= regex_engine.compile(r'^Broadcast Controlled Pkts:\s*(?P<broadcast_controlled_pkts>[0-9NA/]+).*$')
         #Controlled Pkts: 575441
-        p11= re.compile(r'^Controlled Pkts:\s*(?P<controlled_pkts>[0-9NA/]+).*$')
+        p11= regex_engine.compile(r'^Controlled Pkts:\s*(?P<controlled_pkts>[0-9NA/]+).*$')
         #Controlled Pkts - Rx Drop: 0
-        p12= re.compile(r'^Controlled Pkts - Rx Drop:\s*(?P<controlled_pkts_rx_drop>[0-9NA/]+).*$')
+        p12= regex_engine.compile(r'^Controlled Pkts - Rx Drop:\s*(?P<controlled_pkts_rx_drop>[0-9NA/]+).*$')
         #Controlled Pkts - Rx Error: 0
-        p13= re.compile(r'^Controlled Pkts - Rx Error:\s*(?P<controlled_pkts_rx_error>[0-9NA/]+).*$')
+        p13= regex_engine.compile(r'^Controlled Pkts - Rx Error:\s*(?P<controlled_pkts_rx_error>[0-9NA/]+).*$')
         #In-Octets Uncontrolled: 285411693 bytes
-        p14= re.compile(r'^In-Octets Uncontrolled:\s*(?P<in_octets_uncontrolled>[0-9NA/]+).*$') 
+        p14= regex_engine.compile(r'^In-Octets Uncontrolled:\s*(?P<in_octets_uncontrolled>[0-9NA/]+).*$') 
         #In-Octets Controlled: 238532354 bytes
-        p15= re.compile(r'^In-Octets Controlled:\s*(?P<in_octets_controlled>[0-9NA/]+).*$') 
+        p15= regex_engine.compile(r'^In-Octets Controlled:\s*(?P<in_octets_controlled>[0-9NA/]+).*$') 
         #Input rate for Uncontrolled Pkts: 1 pps
-        p16= re.compile(r'^Input rate for Uncontrolled Pkts:\s*(?P<input_rate_for_uncontrolled_pkts_pps>[0-9NA/]+) pps$') # add pps
+        p16= regex_engine.compile(r'^Input rate for Uncontrolled Pkts:\s*(?P<input_rate_for_uncontrolled_pkts_pps>[0-9NA/]+) pps$') # add pps
         #Input rate for Uncontrolled Pkts: 1516 bps
-        p17= re.compile(r'^Input rate for Uncontrolled Pkts:\s*(?P<input_rate_for_uncontrolled_pkts_bps>[0-9NA/]+) bps$') # add bps
+        p17= regex_engine.compile(r'^Input rate for Uncontrolled Pkts:\s*(?P<input_rate_for_uncontrolled_pkts_bps>[0-9NA/]+) bps$') # add bps
         #Input rate for Controlled Pkts: 0 pps
-        p18= re.compile(r'^Input rate for Controlled Pkts:\s*(?P<input_rate_for_controlled_pkts_pps>[0-9NA/]+) pps$') #add pps
+        p18= regex_engine.compile(r'^Input rate for Controlled Pkts:\s*(?P<input_rate_for_controlled_pkts_pps>[0-9NA/]+) pps$') #add pps
         #Input rate for Controlled Pkts: 648 bps
-        p19= re.compile(r'^Input rate for Controlled Pkts:\s*(?P<input_rate_for_controlled_pkts_bps>[0-9NA/]+) bps$') #add bps
+        p19= regex_engine.compile(r'^Input rate for Controlled Pkts:\s*(?P<input_rate_for_controlled_pkts_bps>[0-9NA/]+) bps$') #add bps
 
         #Input rate for Uncontrolled Pkts: N/A (N9K-X9736C-FX not supported)
-        p16_1= re.compile(r'^Input rate for Uncontrolled Pkts:\s*(?P<input_rate_for_uncontrolled_pkts_pps>[0-9NA/]+) .*not supported\)$') # add pps
+        p16_1= regex_engine.compile(r'^Input rate for Uncontrolled Pkts:\s*(?P<input_rate_for_uncontrolled_pkts_pps>[0-9NA/]+) .*not supported\)$') # add pps
         #Input rate for Controlled Pkts: N/A (N9K-X9736C-FX not supported)
-        p18_1= re.compile(r'^Input rate for Controlled Pkts:\s*(?P<input_rate_for_controlled_pkts_pps>[0-9NA/]+) .*not supported\)$') # add pps
+        p18_1= regex_engine.compile(r'^Input rate for Controlled Pkts:\s*(?P<input_rate_for_controlled_pkts_pps>[0-9NA/]+) .*not supported\)$') # add pps
 
         #Out-Octets Uncontrolled: 0 bytes
-        p20= re.compile(r'^Out-Octets Uncontrolled:\s*(?P<out_octets_uncontrolled>[0-9NA/]+).*$')
+        p20= regex_engine.compile(r'^Out-Octets Uncontrolled:\s*(?P<out_octets_uncontrolled>[0-9NA/]+).*$')
         #Out-Octets Controlled: 234992070 bytes
-        p21= re.compile(r'^Out-Octets Controlled:\s*(?P<out_octets_controlled>[0-9NA/]+).*$') 
+        p21= regex_engine.compile(r'^Out-Octets Controlled:\s*(?P<out_octets_controlled>[0-9NA/]+).*$') 
         #Out-Octets Common: 278229965 bytes
-        p22= re.compile(r'^Out-Octets Common:\s*(?P<out_octets_common>[0-9NA/]+).*$')
+        p22= regex_engine.compile(r'^Out-Octets Common:\s*(?P<out_octets_common>[0-9NA/]+).*$')
         #Output rate for Uncontrolled Pkts: 0 pps
-        p23= re.compile(r'^Output rate for Uncontrolled Pkts:\s*(?P<output_rate_uncontrolled_pkts_pps>[0-9NA/]+) pps$')
+        p23= regex_engine.compile(r'^Output rate for Uncontrolled Pkts:\s*(?P<output_rate_uncontrolled_pkts_pps>[0-9NA/]+) pps$')
         #Output rate for Uncontrolled Pkts: 0 bps
-        p24= re.compile(r'^Output rate for Uncontrolled Pkts:\s*(?P<output_rate_uncontrolled_pkts_bps>[0-9NA/]+) bps$')
+        p24= regex_engine.compile(r'^Output rate for Uncontrolled Pkts:\s*(?P<output_rate_uncontrolled_pkts_bps>[0-9NA/]+) bps$')
         #Output rate for Controlled Pkts: 0 pps
-        p25= re.compile(r'^Output rate for Controlled Pkts:\s*(?P<output_rate_controlled_pkts_pps>[0-9NA/]+) pps$') #add pps
+        p25= regex_engine.compile(r'^Output rate for Controlled Pkts:\s*(?P<output_rate_controlled_pkts_pps>[0-9NA/]+) pps$') #add pps
         #Output rate for Controlled Pkts: 459 bps
-        p26= re.compile(r'^Output rate for Controlled Pkts:\s*(?P<output_rate_controlled_pkts_bps>[0-9NA/]+) bps$') #add bps 
+        p26= regex_engine.compile(r'^Output rate for Controlled Pkts:\s*(?P<output_rate_controlled_pkts_bps>[0-9NA/]+) bps$') #add bps 
         ##Output rate for Uncontrolled Pkts: N/A (N9K-X9736C-FX not supported)
-        p23_1= re.compile(r'^Output rate for Uncontrolled Pkts:\s*(?P<output_rate_uncontrolled_pkts_pps>[0-9NA/]+) .*not supported\)$') #add pps
+        p23_1= regex_engine.compile(r'^Output rate for Uncontrolled Pkts:\s*(?P<output_rate_uncontrolled_pkts_pps>[0-9NA/]+) .*not supported\)$') #add pps
         #Output rate for Controlled Pkts: 0 N/A (N9K-X9736C-FX not supported)
-        p25_1= re.compile(r'^Output rate for Controlled Pkts:\s*(?P<output_rate_controlled_pkts_pps>[0-9NA/]+) .*not supported\)$') # add bps
+        p25_1= regex_engine.compile(r'^Output rate for Controlled Pkts:\s*(?P<output_rate_controlled_pkts_pps>[0-9NA/]+) .*not supported\)$') # add bps
         #Interface Tx Statistics:
-        p27= re.compile(r'^(?P<interface_tx_statistics>Interface Tx Statistics):$')
+        p27= regex_engine.compile(r'^(?P<interface_tx_statistics>Interface Tx Statistics):$')
         #SECY Rx Statistics:
-        p28= re.compile(r'^(?P<secy_rx_statistics>SECY Rx Statistics):$')
+        p28= regex_engine.compile(r'^(?P<secy_rx_statistics>SECY Rx Statistics):$')
         #Transform Error Pkts: 0
-        p29= re.compile(r'^Transform Error Pkts:\s*(?P<transform_error_pkts>[0-9NA/]+).*$')
+        p29= regex_engine.compile(r'^Transform Error Pkts:\s*(?P<transform_error_pkts>[0-9NA/]+).*$')
         #Control Pkts: 0
-        p30= re.compile(r'^Control Pkts:\s*(?P<control_pkts>[0-9NA/]+).*$')
+        p30= regex_engine.compile(r'^Control Pkts:\s*(?P<control_pkts>[0-9NA/]+).*$')
         #Untagged Pkts: 0
-        p31= re.compile(r'^Untagged Pkts:\s*(?P<untagged_pkts>[0-9NA/]+).*$')
+        p31= regex_engine.compile(r'^Untagged Pkts:\s*(?P<untagged_pkts>[0-9NA/]+).*$')
         #No Tag Pkts: 0
-        p32= re.compile(r'^No Tag Pkts:\s*(?P<no_tag_pkts>[0-9NA/]+).*$')
+        p32= regex_engine.compile(r'^No Tag Pkts:\s*(?P<no_tag_pkts>[0-9NA/]+).*$')
         #Bad Tag Pkts: 0
-        p33= re.compile(r'^Bad Tag Pkts:\s*(?P<bad_tag_pkts>[0-9NA/]+).*$')
+        p33= regex_engine.compile(r'^Bad Tag Pkts:\s*(?P<bad_tag_pkts>[0-9NA/]+).*$')
         #No SCI Pkts: 0
-        p34= re.compile(r'^No SCI Pkts:\s*(?P<no_sci_pkts>[0-9NA/]+).*$')
+        p34= regex_engine.compile(r'^No SCI Pkts:\s*(?P<no_sci_pkts>[0-9NA/]+).*$')
         #Unknown SCI Pkts: 0
-        p35= re.compile(r'^Unknown SCI Pkts:\s*(?P<unknown_sci_pkts>[0-9NA/]+).*$')
+        p35= regex_engine.compile(r'^Unknown SCI Pkts:\s*(?P<unknown_sci_pkts>[0-9NA/]+).*$')
         #Tagged Control Pkts: 0
-        p36= re.compile(r'^Tagged Control Pkts:\s*(?P<tagged_control_pkts>[0-9NA/]+).*$')
+        p36= regex_engine.compile(r'^Tagged Control Pkts:\s*(?P<tagged_control_pkts>[0-9NA/]+).*$')
         #SECY Tx Statistics:
-        p37= re.compile(r'^(?P<secy_tx_statistics>SECY Tx Statistics):$')
+        p37= regex_engine.compile(r'^(?P<secy_tx_statistics>SECY Tx Statistics):$')
         #SAK Rx Statistics for AN [0]:
-        p38= re.compile(r'^SAK Rx Statistics for AN \[(?P<an_value>\d+)\]:$')
+        p38= regex_engine.compile(r'^SAK Rx Statistics for AN \[(?P<an_value>\d+)\]:$')
         #Unchecked Pkts: 0
-        p39= re.compile(r'^Unchecked Pkts:\s*(?P<unchecked_pkts>[0-9NA/]+).*$')
+        p39= regex_engine.compile(r'^Unchecked Pkts:\s*(?P<unchecked_pkts>[0-9NA/]+).*$')
         #Delayed Pkts: 0
-        p40= re.compile(r'^Delayed Pkts:\s*(?P<delayed_pkts>[0-9NA/]+).*$')
+        p40= regex_engine.compile(r'^Delayed Pkts:\s*(?P<delayed_pkts>[0-9NA/]+).*$')
         #Late Pkts: 0
-        p41= re.compile(r'^Late Pkts:\s*(?P<late_pkts>[0-9NA/]+).*$')
+        p41= regex_engine.compile(r'^Late Pkts:\s*(?P<late_pkts>[0-9NA/]+).*$')
         #OK Pkts: 575441
-        p42= re.compile(r'^OK Pkts:\s*(?P<ok_pkts>[0-9NA/]+).*$')
+        p42= regex_engine.compile(r'^OK Pkts:\s*(?P<ok_pkts>[0-9NA/]+).*$')
         #Invalid Pkts: 0
-        p43= re.compile(r'^Invalid Pkts:\s*(?P<invalid_pkts>[0-9NA/]+).*$')
+        p43= regex_engine.compile(r'^Invalid Pkts:\s*(?P<invalid_pkts>[0-9NA/]+).*$')
         #Not Valid Pkts: 0
-        p44= re.compile(r'^Not Valid Pkts:\s*(?P<not_valid_pkts>[0-9NA/]+).*$')
+        p44= regex_engine.compile(r'^Not Valid Pkts:\s*(?P<not_valid_pkts>[0-9NA/]+).*$')
         # Not-Using-SA Pkts: 0
-        p45= re.compile(r'^Not-Using-SA Pkts:\s*(?P<not_using_sa_pkts>[0-9NA/]+).*$')
+        p45= regex_engine.compile(r'^Not-Using-SA Pkts:\s*(?P<not_using_sa_pkts>[0-9NA/]+).*$')
         #Unused-SA Pkts: 0
-        p46= re.compile(r'^Unused-SA Pkts:\s*(?P<unused_sa_pkts>[0-9NA/]+).*$')
+        p46= regex_engine.compile(r'^Unused-SA Pkts:\s*(?P<unused_sa_pkts>[0-9NA/]+).*$')
         #Decrypted In-Octets: 238532354 bytes
-        p47= re.compile(r'^Decrypted In-Octets:\s*(?P<decrypted_in_octets>[0-9NA/]+).*$')
+        p47= regex_engine.compile(r'^Decrypted In-Octets:\s*(?P<decrypted_in_octets>[0-9NA/]+).*$')
         #Validated In-Octets: 0 bytes
-        p48= re.compile(r'^Validated In-Octets:\s*(?P<validated_in_octets>[0-9NA/]+).*$')
+        p48= regex_engine.compile(r'^Validated In-Octets:\s*(?P<validated_in_octets>[0-9NA/]+).*$')
         #SAK Tx Statistics for AN [0]:
-        p49= re.compile(r'^SAK Tx Statistics for AN \[(?P<an_value>\d+)\]:$')
+        p49= regex_engine.compile(r'^SAK Tx Statistics for AN \[(?P<an_value>\d+)\]:$')
         #Encrypted Protected Pkts: 499517
-        p50= re.compile(r'^Encrypted Protected Pkts:\s*(?P<encrypted_protected_pkts>[0-9NA/]+).*$')
+        p50= regex_engine.compile(r'^Encrypted Protected Pkts:\s*(?P<encrypted_protected_pkts>[0-9NA/]+).*$')
         #Too Long Pkts: 0
-        p51= re.compile(r'^Too Long Pkts:\s*(?P<too_long_pkts>[0-9NA/]+).*$')
+        p51= regex_engine.compile(r'^Too Long Pkts:\s*(?P<too_long_pkts>[0-9NA/]+).*$')
         #SA-not-in-use Pkts: 0
-        p52= re.compile(r'^SA-not-in-use Pkts:\s*(?P<sa_not_in_use_pkts>[0-9NA/]+).*$')
+        p52= regex_engine.compile(r'^SA-not-in-use Pkts:\s*(?P<sa_not_in_use_pkts>[0-9NA/]+).*$')
         #Encrypted Protected Out-Octets: 234992070 bytes
-        p53= re.compile(r'^Encrypted Protected Out-Octets:\s*(?P<encrypted_protected_out_octets>[0-9NA/]+).*$')
+        p53= regex_engine.compile(r'^Encrypted Protected Out-Octets:\s*(?P<encrypted_protected_out_octets>[0-9NA/]+).*$')
 
         secy_statistics_dict = {}
         for line in output.splitlines():
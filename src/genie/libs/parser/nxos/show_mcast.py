@@ -12,12 +12,14 @@ NXOS parsers for the following show commands:
 """
 
 # Python
-import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.nxos.show_vrf import  ShowVrf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ===================================
 # Parser for 'show ip mroute vrf all'
 # ===================================
@@ -85,9 +87,9 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
             line = line.rstrip()
 
             # IP Multicast Routing Table for VRF "default" 
-            p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
-                             r' +[rR]outing +[tT]able +for +VRF '
-                            r'+(?P<vrf>\S+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
+                                       r' +[rR]outing +[tT]able +for +VRF '
+                                      r'+(?P<vrf>\S+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -108,11 +110,11 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
             # (*, 232.0.0.0/8), uptime: 9w2d, pim ip 
             # (*, 228.0.0.0/8), bidir, uptime: 10w5d, pim ip 
             # (*, ff03:0:0:1::1/128), uptime: 3d23h, pim6 ipv6 
-            p2 = re.compile(r'^\s*\((?P<source_address>[0-9\.\*\/]+),'
-                            r' +(?P<multicast_group>[a-zA-Z0-9\.\/\:]+)\),'
-                            r' *(?P<bidir>(\S+))? *uptime:'
-                            r' +(?P<uptime>[0-9a-zA-Z\:\.]+)(,)?(?:'
-                            r' *(?P<flag>[0-9a-zA-Z\(\)\s]+))?$')
+            p2 = regex_engine.compile(r'^\s*\((?P<source_address>[0-9\.\*\/]+),'
+                                      r' +(?P<multicast_group>[a-zA-Z0-9\.\/\:]+)\),'
+                                      r' *(?P<bidir>(\S+))? *uptime:'
+                                      r' +(?P<uptime>[0-9a-zA-Z\:\.]+)(,)?(?:'
+                                      r' *(?P<flag>[0-9a-zA-Z\(\)\s]+))?$')
             m = p2.match(line)
             if m:
                 source_address = m.groupdict()['source_address']
@@ -148,9 +150,9 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
 
             # Incoming interface: Null, RPF nbr: 0.0.0.0 
             # Incoming interface: Ethernet1/9, RPF nbr: 10.234.1.2, internal.
-            p3 = re.compile(r'^\s*Incoming +interface:'
-                             r' +(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+),'
-                             r' +RPF +nbr: +(?P<rpf_nbr>[0-9\.]+)(, *(?P<internal>internal)\.?)?$')
+            p3 = regex_engine.compile(r'^\s*Incoming +interface:'
+                                       r' +(?P<incoming_interface>[a-zA-Z0-9\/\-\.]+),'
+                                       r' +RPF +nbr: +(?P<rpf_nbr>[0-9\.]+)(, *(?P<internal>internal)\.?)?$')
             m = p3.match(line)
             if m:
                 incoming_interface = m.groupdict()['incoming_interface']
@@ -173,8 +175,8 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
                 continue
 
             # Outgoing interface list: (count: 0) 
-            p4 =  re.compile(r'^\s*Outgoing +interface +list: +\(count:'
-                              r' +(?P<oil_count>[0-9]+)\)$')
+            p4 =  regex_engine.compile(r'^\s*Outgoing +interface +list: +\(count:'
+                                        r' +(?P<oil_count>[0-9]+)\)$')
             m = p4.match(line)
             if m:
                 oil_count = int(m.groupdict()['oil_count'])
@@ -185,9 +187,9 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
             # loopback2, uptime: 3d11h, igmp 
             # port-channel80, uptime: 3d23h, pim6
             # Vlan200, uptime: 03:01:01, mrib, (bridge-only)
-            p5 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),)?'
-                            r' +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
-                            r' +(?:(?P<oil_flags>[a-zA-Z0-9\,\.\(\)\s]+))?(, *\((?P<flag>[\S\s]+)\))?$')
+            p5 = regex_engine.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),)?'
+                                      r' +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
+                                      r' +(?:(?P<oil_flags>[a-zA-Z0-9\,\.\(\)\s]+))?(, *\((?P<flag>[\S\s]+)\))?$')
             m = p5.match(line)
             if m:
                 outgoing_interface = m.groupdict()['outgoing_interface']
@@ -280,35 +282,35 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
         ipv6_mroute_vrf_all_dict = {}
         # IPv6 Multicast Routing Table for VRF "default
         # IPv6 Multicast Routing Table for VRF " vxlan-1001"
-        p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
-                            r' +[rR]outing +[tT]able +for +VRF'
-                            r' +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
+                                      r' +[rR]outing +[tT]able +for +VRF'
+                                      r' +(?P<vrf>\S+)$')
         # (*, ff30::/12), uptime: 3d11h, pim6 ipv6
         # (*, ff03:3::/64), bidir, uptime: 10w5d, pim6 
-        p2 = re.compile(r'^\s*\((?P<source_address>(\S+)),'
-                            r' +(?P<multicast_group>(\S+))\),'
-                            r' *(?P<bidir>(\S+),)? *uptime:'
-                            r' +(?P<uptime>[0-9a-zA-Z\:\.]+)(,)?(?:'
-                            r' *(?P<flag>[a-zA-Z0-9\s]+))?$')
+        p2 = regex_engine.compile(r'^\s*\((?P<source_address>(\S+)),'
+                                      r' +(?P<multicast_group>(\S+))\),'
+                                      r' *(?P<bidir>(\S+),)? *uptime:'
+                                      r' +(?P<uptime>[0-9a-zA-Z\:\.]+)(,)?(?:'
+                                      r' *(?P<flag>[a-zA-Z0-9\s]+))?$')
         # Incoming interface: Null, RPF nbr: 0::
         # Incoming interface: Vlan71, RPF nbr: 2001:1:1:4d::1, internal
-        p3 =  re.compile(r'^\s*Incoming +interface: +(?P<incoming_interface>[a-zA-Z0-9\/\.]+),'
-                             r' +RPF +nbr: +(?P<rpf_nbr>[a-zA-Z0-9\:\.]+),? *(?P<internal>internal)?$')
+        p3 =  regex_engine.compile(r'^\s*Incoming +interface: +(?P<incoming_interface>[a-zA-Z0-9\/\.]+),'
+                                       r' +RPF +nbr: +(?P<rpf_nbr>[a-zA-Z0-9\:\.]+),? *(?P<internal>internal)?$')
         # Outgoing interface list: (count: 0)
         # Outgoing interface list: (count: 2) (Fabric OIF)
-        p4 =  re.compile(r'^\s*Outgoing +interface +list: +\(count:'
-                             r' +(?P<oil_count>[0-9]+)\) *(?P<fabric_oif>\(Fabric +OIF\))?$')
+        p4 =  regex_engine.compile(r'^\s*Outgoing +interface +list: +\(count:'
+                                       r' +(?P<oil_count>[0-9]+)\) *(?P<fabric_oif>\(Fabric +OIF\))?$')
         # loopback2, uptime: 3d11h, igmp
         # port-channel80, uptime: 3d23h, pim6
-        p5 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),'
-                            r')? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
-                            r' +(?:(?P<rpf>[a-zA-Z0-9\s]+),)?(?P<oil_flags>\w+)$')
+        p5 = regex_engine.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+),'
+                                      r')? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
+                                      r' +(?:(?P<rpf>[a-zA-Z0-9\s]+),)?(?P<oil_flags>\w+)$')
         #Vlan71, uptime: 06:53:02, m6rib, (RPF)
         #Vlan71, uptime: 06:53:02, m6rib, (bridge-only)
-        p5_1 = re.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+)'
-                            r',)? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
-                            r' +(?:(?P<rpf>[a-zA-Z0-9\s]+),)?(?P<oil_flags>\w+)'
-                            r'(, +\((?P<oif_rpf>RPF|bridge-only)\))?$')
+        p5_1 = regex_engine.compile(r'^\s*(?:(?P<outgoing_interface>[a-zA-Z0-9\/\.\-]+)'
+                                      r',)? +uptime: +(?:(?P<oil_uptime>[a-zA-Z0-9\:]+),)?'
+                                      r' +(?:(?P<rpf>[a-zA-Z0-9\s]+),)?(?P<oil_flags>\w+)'
+                                      r'(, +\((?P<oif_rpf>RPF|bridge-only)\))?$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -486,8 +488,8 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
         for line in out.splitlines():
             line = line.rstrip()
             #Mstatic-route for VRF "default"(1) 
-            p1 = re.compile(r'^\s*(Static-route|Mstatic-route) +for +VRF'
-                             r' +(?P<vrf>[a-zA-Z0-9\"]+) *\((?P<vrf_id>[0-9]+)\)$')
+            p1 = regex_engine.compile(r'^\s*(Static-route|Mstatic-route) +for +VRF'
+                                       r' +(?P<vrf>[a-zA-Z0-9\"]+) *\((?P<vrf_id>[0-9]+)\)$')
                               
             m = p1.match(line)
             if m:
@@ -505,8 +507,8 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
                 continue
 
             #IPv4 MStatic Routes:
-            p2 = re.compile(r'^\s*(?P<address_family>[a-zA-Z0-9]+)'
-                             ' +(MStatic|Unicast Static) +Routes:$')
+            p2 = regex_engine.compile(r'^\s*(?P<address_family>[a-zA-Z0-9]+)'
+                                       ' +(MStatic|Unicast Static) +Routes:$')
             m = p2.match(line)
             if m:
                 address_family = str(m.groupdict()['address_family']).lower()
@@ -518,9 +520,9 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
                 continue
 
             #10.49.0.0/8, configured nh: 0.0.0.0/32 Null0 
-            p3 =  re.compile(r'^\s*(?P<mroute>[0-9\.\/]+), +configured +nh:'
-                              r' +(?P<neighbor_address>[a-zA-Z0-9\.\/]+)'
-                              r' +(?P<interface_name>[a-zA-Z0-9\.]+)$')
+            p3 =  regex_engine.compile(r'^\s*(?P<mroute>[0-9\.\/]+), +configured +nh:'
+                                        r' +(?P<neighbor_address>[a-zA-Z0-9\.\/]+)'
+                                        r' +(?P<interface_name>[a-zA-Z0-9\.]+)$')
             m = p3.match(line)
             if m:
                 mroute = m.groupdict()['mroute']
@@ -558,8 +560,8 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
                 continue
 
             # 10.2.2.2/32, configured nh: 0.0.0.0/32%sanity1 Vlan2
-            p3_1 = re.compile(r'^\s*(?P<mroute>[0-9\.\/]+), +configured +nh:'
-                               r' +(?P<neighbor_address>[a-zA-Z0-9\.\/\%\s]+)$')
+            p3_1 = regex_engine.compile(r'^\s*(?P<mroute>[0-9\.\/]+), +configured +nh:'
+                                         r' +(?P<neighbor_address>[a-zA-Z0-9\.\/\%\s]+)$')
             m = p3_1.match(line)
             if m:
                 mroute = m.groupdict()['mroute']
@@ -590,7 +592,7 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
                 continue
 
             # (installed in urib) 
-            p4 = re.compile(r'^\s*(?P<urib>(\(installed in urib\))+)$')
+            p4 = regex_engine.compile(r'^\s*(?P<urib>(\(installed in urib\))+)$')
             m = p4.match(line)
             if m:
                 urib = bool(m.groupdict()['urib'])
@@ -653,8 +655,8 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
             line = line.rstrip()
 
             # IPv6 Configured Static Routes for VRF "default"(1) 
-            p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) +Configured +Static +Routes +for +VRF'
-                             r' +(?P<vrf>[a-zA-Z0-9\"]+) *\((?P<vrf_id>[0-9]+)\)$')
+            p1 = regex_engine.compile(r'^\s*(?P<address_family>[\w\W]+) +Configured +Static +Routes +for +VRF'
+                                       r' +(?P<vrf>[a-zA-Z0-9\"]+) *\((?P<vrf_id>[0-9]+)\)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -675,9 +677,9 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                 continue
 
             # 2001:db8:51a5::/16 -> Null0, preference: 1
-            p2 = re.compile(r'^\s*(?P<mroute>[a-zA-Z0-9\:\/]+) +->'
-                             r' +(?P<mroute_int>[\w\W]+), preference:'
-                             r' +(?P<preference>[0-9]+)$')
+            p2 = regex_engine.compile(r'^\s*(?P<mroute>[a-zA-Z0-9\:\/]+) +->'
+                                       r' +(?P<mroute_int>[\w\W]+), preference:'
+                                       r' +(?P<preference>[0-9]+)$')
             m = p2.match(line)
             if m:
                 mroute = m.groupdict()['mroute']
@@ -691,8 +693,8 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                 continue
 
             # nh_vrf(default) reslv_tid 80000001 
-            p3 = re.compile(r'^\s*nh_vrf *(?P<nh_vrf>[a-zA-Z0-9\(\)]+)'
-                             ' +reslv_tid +(?P<reslv_tid>[0-9]+)$')
+            p3 = regex_engine.compile(r'^\s*nh_vrf *(?P<nh_vrf>[a-zA-Z0-9\(\)]+)'
+                                       ' +reslv_tid +(?P<reslv_tid>[0-9]+)$')
             m = p3.match(line)
             if m:
                 nh_vrf = m.groupdict()['nh_vrf']
@@ -702,8 +704,8 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                 continue
 
             # real-next-hop: 0::, interface: Null0 
-            p4 =  re.compile(r'^\s*real-next-hop: +(?P<neighbor_address>[a-zA-Z0-9\:]+),'
-                              r' +interface: +(?P<interface_name>[\w\W]+)$')
+            p4 =  regex_engine.compile(r'^\s*real-next-hop: +(?P<neighbor_address>[a-zA-Z0-9\:]+),'
+                                        r' +interface: +(?P<interface_name>[\w\W]+)$')
             m = p4.match(line)
             if m:
                 neighbor_address = m.groupdict()['neighbor_address']
@@ -734,7 +736,7 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                 continue
 
             # rnh(not installed in u6rib) 
-            p5 = re.compile(r'^\s*rnh(?P<rnh_status>[a-zA-Z0-9\(\)\s]+)$')
+            p5 = regex_engine.compile(r'^\s*rnh(?P<rnh_status>[a-zA-Z0-9\(\)\s]+)$')
             m = p5.match(line)
             if m:
                 rnh_status = str(m.groupdict()['rnh_status'])
@@ -746,7 +748,7 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                 continue
 
             # bfd_enabled no
-            p6 = re.compile(r'^\s*bfd_enabled +(?P<bfd_enable>(no)+)$')
+            p6 = regex_engine.compile(r'^\s*bfd_enabled +(?P<bfd_enable>(no)+)$')
             m = p6.match(line)
             if m:
                 bfd_enable = m.groupdict()['bfd_enable']
@@ -760,7 +762,7 @@ class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
                 continue
 
             # bfd_enabled yes
-            p6 = re.compile(r'^\s*bfd_enabled +(?P<bfd_enable>(yes)+)$')
+            p6 = regex_engine.compile(r'^\s*bfd_enabled +(?P<bfd_enable>(yes)+)$')
             m = p6.match(line)
             if m:
                 bfd_enable = m.groupdict()['bfd_enable']
@@ -869,38 +871,38 @@ class ShowForwardingDistributionMulticastRoute(ShowForwardingDistributionMultica
 
         # IPv4 Multicast Routing Table for table-id: 1
         # IPv4 Multicast Routing Table for table-id: 0x3
-        p1 = re.compile(r'^\s*IPv4 +Multicast +Routing +Table +for +table\-id: +(?P<vrf_id>(?!wildcard)[\S]+)$')
+        p1 = regex_engine.compile(r'^\s*IPv4 +Multicast +Routing +Table +for +table\-id: +(?P<vrf_id>(?!wildcard)[\S]+)$')
 
         # Total number of groups: 5
-        p2 = re.compile(r'^\s*Total +number +of +groups: +(?P<total_number_group>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*Total +number +of +groups: +(?P<total_number_group>[\d]+)$')
 
         #  (*, 224.0.0.0/4), RPF Interface: NULL, flags: D
         #  (*, 231.100.1.1/32), RPF Interface: Ethernet1/2, flags: GLd
-        p3 = re.compile(r'^\s*\((?P<saddr>[\w\/\.\*]+), +(?P<gaddr>[\w\/\.]+)\), +RPF +Interface:'
-               r' +(?P<rpf_ifname>[\w\/\-]+), flags:( +(?P<flags>[\w]+))?$')
+        p3 = regex_engine.compile(r'^\s*\((?P<saddr>[\w\/\.\*]+), +(?P<gaddr>[\w\/\.]+)\), +RPF +Interface:'
+                         r' +(?P<rpf_ifname>[\w\/\-]+), flags:( +(?P<flags>[\w]+))?$')
 
         #   Received Packets: 0 Bytes: 0
-        p4 = re.compile(r'^\s*Received +Packets: +(?P<rcv_packets>[\d]+) +Bytes: +(?P<rcv_bytes>[\d]+)$')
+        p4 = regex_engine.compile(r'^\s*Received +Packets: +(?P<rcv_packets>[\d]+) +Bytes: +(?P<rcv_bytes>[\d]+)$')
 
         #   Number of Outgoing Interfaces: 0
-        p5 = re.compile(r'^\s*Number +of +Outgoing +Interfaces: +(?P<num_of_oifs>[\d]+)$')
+        p5 = regex_engine.compile(r'^\s*Number +of +Outgoing +Interfaces: +(?P<num_of_oifs>[\d]+)$')
 
         #   Null Outgoing Interface List
-        p6 = re.compile(r'^\s*Null +Outgoing +Interface +List$')
+        p6 = regex_engine.compile(r'^\s*Null +Outgoing +Interface +List$')
 
         #   Outgoing Interface List Index: 30
-        p7 = re.compile(r'^\s*Outgoing +Interface +List +Index: +(?P<oif_index>[\d]+)$')
+        p7 = regex_engine.compile(r'^\s*Outgoing +Interface +List +Index: +(?P<oif_index>[\d]+)$')
 
         #    nve1
         #    Vlan100 (Vxlan Encap)
-        p8 = re.compile(r'^(?P<space>\s{6})(?P<oif>[\w\-\/]+)( +\((?P<encap>[\w]+)( +Encap)?\))?$')
+        p8 = regex_engine.compile(r'^(?P<space>\s{6})(?P<oif>[\w\-\/]+)( +\((?P<encap>[\w]+)( +Encap)?\))?$')
 
         #     ( Mem L2 Ports: nve1 )
         #     ( Mem L2 Ports: port-channel1 nve1 )
-        p9 = re.compile(r'\s*\( +Mem +L2 +Ports: +(?P<mem_l2_ports>[\w\s\-\/]+) +\)$')
+        p9 = regex_engine.compile(r'\s*\( +Mem +L2 +Ports: +(?P<mem_l2_ports>[\w\s\-\/]+) +\)$')
 
         #     l2_oiflist_index: 19
-        p10 = re.compile(r'\s*l2_oiflist_index: +(?P<l2_oiflist_index>[\d]+)$')
+        p10 = regex_engine.compile(r'\s*l2_oiflist_index: +(?P<l2_oiflist_index>[\d]+)$')
 
         for line in out.splitlines():
             if line:
@@ -1058,30 +1060,30 @@ class ShowIpMrouteSummary(ShowIpMrouteSummarySchema):
 
         mroute_dict = {}
         #IP Multicast Routing Table for VRF "vxlan-1001" 
-        p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
-                         r' +[rR]outing +[tT]able +for +VRF '
-                         r'+(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
+                                   r' +[rR]outing +[tT]able +for +VRF '
+                                   r'+(?P<vrf>\S+)$')
         # Total number of (*,G) routes: 34
-        p2 = re.compile(r'^\s*Total +number +of +\(\*,G\) +routes:'
-                         r' +(?P<count>[0-9]+)$')
+        p2 = regex_engine.compile(r'^\s*Total +number +of +\(\*,G\) +routes:'
+                                   r' +(?P<count>[0-9]+)$')
         # Total number of (S,G) routes: 17
-        p3 = re.compile(r'^\s*Total +number +of +\(S,G\) +routes:'
-                         r' +(?P<count>[0-9]+)$')
+        p3 = regex_engine.compile(r'^\s*Total +number +of +\(S,G\) +routes:'
+                                   r' +(?P<count>[0-9]+)$')
         # Total number of routes: 51
-        p4 = re.compile(r'^\s*Total +number +of +routes:'
-                         r' +(?P<count>[0-9]+)$')
+        p4 = regex_engine.compile(r'^\s*Total +number +of +routes:'
+                                   r' +(?P<count>[0-9]+)$')
         #Total number of (*,G-prefix) routes: 0
-        p5 = re.compile(r'^\s*Total +number +of +\(\*,G-prefix\) +routes:'
-                         r' +(?P<count>[0-9]+)$')
+        p5 = regex_engine.compile(r'^\s*Total +number +of +\(\*,G-prefix\) +routes:'
+                                   r' +(?P<count>[0-9]+)$')
         #Group count: 41, rough average sources per group: 3.0
-        p6 = re.compile(r'^\s*Group +count: +(?P<count>[0-9]+),'
-                        r' +rough +average +sources +per +group: +(?P<avg_count>[0-9.]+)$')
+        p6 = regex_engine.compile(r'^\s*Group +count: +(?P<count>[0-9]+),'
+                                  r' +rough +average +sources +per +group: +(?P<avg_count>[0-9.]+)$')
         #Group: 225.0.0.2/32, Source count: 3
-        p7 = re.compile(r'^\s*Group: +(?P<group_ip>\S+), +Source count: +(?P<src_count>[0-9]+)$')
+        p7 = regex_engine.compile(r'^\s*Group: +(?P<group_ip>\S+), +Source count: +(?P<src_count>[0-9]+)$')
         #100.100.100.5   1743         88893           51    0         27.200  bps  1
         #(*,G)           0            0               0     0         0.000   bps  2
-        p8 = re.compile(r'^\s*(?P<source>\S+) +(?P<packets>[0-9]+) +(?P<bytes>[0-9]+) +(?P<aps>[0-9]+) +(?P<pps>[0-9]+) +'
-                        r'(?P<bitrate>[0-9.]+) +bps +(?P<oifs>[0-9]+)$')
+        p8 = regex_engine.compile(r'^\s*(?P<source>\S+) +(?P<packets>[0-9]+) +(?P<bytes>[0-9]+) +(?P<aps>[0-9]+) +(?P<pps>[0-9]+) +'
+                                  r'(?P<bitrate>[0-9.]+) +bps +(?P<oifs>[0-9]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1195,31 +1197,31 @@ class ShowIpv6MrouteSummary(ShowIpv6MrouteSummarySchema):
 
         mroute_dict = {}
         #IP Multicast Routing Table for VRF "vxlan-1001" 
-        p1 = re.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
-                         r' +[rR]outing +[tT]able +for +VRF '
-                         r'+(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<address_family>[\w\W]+) [mM]ulticast'
+                                   r' +[rR]outing +[tT]able +for +VRF '
+                                   r'+(?P<vrf>\S+)$')
         # Total number of (*,G) routes: 34
-        p2 = re.compile(r'^\s*Total +number +of +\(\*,G\) +routes:'
-                         r' +(?P<count>[0-9]+)$')
+        p2 = regex_engine.compile(r'^\s*Total +number +of +\(\*,G\) +routes:'
+                                   r' +(?P<count>[0-9]+)$')
         # Total number of (S,G) routes: 17
-        p3 = re.compile(r'^\s*Total +number +of +\(S,G\) +routes:'
-                         r' +(?P<count>[0-9]+)$')
+        p3 = regex_engine.compile(r'^\s*Total +number +of +\(S,G\) +routes:'
+                                   r' +(?P<count>[0-9]+)$')
         # Total number of routes: 51
-        p4 = re.compile(r'^\s*Total +number +of +routes:'
-                         r' +(?P<count>[0-9]+)$')
+        p4 = regex_engine.compile(r'^\s*Total +number +of +routes:'
+                                   r' +(?P<count>[0-9]+)$')
         #Total number of (*,G-prefix) routes: 0
-        p5 = re.compile(r'^\s*Total +number +of +\(\*,G-prefix\) +routes:'
-                         r' +(?P<count>[0-9]+)$')
+        p5 = regex_engine.compile(r'^\s*Total +number +of +\(\*,G-prefix\) +routes:'
+                                   r' +(?P<count>[0-9]+)$')
         #Group count: 41, rough average sources per group: 3.0
-        p6 = re.compile(r'^\s*Group +count: +(?P<count>[0-9]+),'
-                        r' +rough +average +sources +per +group: +(?P<avg_count>[0-9.]+)$')
+        p6 = regex_engine.compile(r'^\s*Group +count: +(?P<count>[0-9]+),'
+                                  r' +rough +average +sources +per +group: +(?P<avg_count>[0-9.]+)$')
         #Group: ff32::/32, Source count: 0
         #Group: ff33:0:0:1197::1/128, Source count: 1
-        p7 = re.compile(r'^\s*Group: +(?P<group_ip>\S+), +Source count: +(?P<src_count>[0-9]+)$')
+        p7 = regex_engine.compile(r'^\s*Group: +(?P<group_ip>\S+), +Source count: +(?P<src_count>[0-9]+)$')
         #2001:180:1:57::1181  968          49478           51    0     0.000   bps  1
         #(*,G)           0            0               0     0         0.000   bps  2
-        p8 = re.compile(r'^\s*(?P<source>\S+) +(?P<packets>[0-9]+) +(?P<bytes>[0-9]+) +(?P<aps>[0-9]+) +(?P<pps>[0-9]+) +'
-                        r'(?P<bitrate>[0-9.]+) +bps +(?P<oifs>[0-9]+)$')
+        p8 = regex_engine.compile(r'^\s*(?P<source>\S+) +(?P<packets>[0-9]+) +(?P<bytes>[0-9]+) +(?P<aps>[0-9]+) +(?P<pps>[0-9]+) +'
+                                  r'(?P<bitrate>[0-9.]+) +bps +(?P<oifs>[0-9]+)$')
 
         for line in out.splitlines():
             line = line.strip()
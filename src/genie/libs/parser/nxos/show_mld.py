@@ -14,14 +14,12 @@ NXOS parsers for the following show commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ==============================================
@@ -128,102 +126,102 @@ class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
             out = output
 
         # ICMPv6 MLD Interfaces for VRF "VRF1"
-        p1 = re.compile(r'^ICMPv6 +MLD +Interfaces +for +VRF +\"(?P<vrf>\S+)\"$')
+        p1 = regex_engine.compile(r'^ICMPv6 +MLD +Interfaces +for +VRF +\"(?P<vrf>\S+)\"$')
 
         # MLD Interfaces for VRF "VRF1", count: 4
-        p1_1 = re.compile(r'^MLD +Interfaces +for +VRF +\"(?P<vrf>\S+)\", '
-                           r'count: +(?P<count>\d+)$')
+        p1_1 = regex_engine.compile(r'^MLD +Interfaces +for +VRF +\"(?P<vrf>\S+)\", '
+                                     r'count: +(?P<count>\d+)$')
 
         # Ethernet2/1, Interface status: protocol-up/link-up/admin-up
-        p2 = re.compile(r'^(?P<intf>[\w\/\.\-]+), +'
-                         r'Interface +status: +protocol\-(?P<protocol_status>\w+)\/'
-                         r'link\-(?P<link_status>\w+)\/'
-                         r'admin\-(?P<admin_status>\w+)$')
+        p2 = regex_engine.compile(r'^(?P<intf>[\w\/\.\-]+), +'
+                                   r'Interface +status: +protocol\-(?P<protocol_status>\w+)\/'
+                                   r'link\-(?P<link_status>\w+)\/'
+                                   r'admin\-(?P<admin_status>\w+)$')
 
         # 2001:db8:8404:751c::1/64 [VALID]
-        p3 = re.compile(r'^(?P<address>(?P<ip>[a-z0-9\:]+)'
-                         r'\/(?P<prefix_length>[0-9]+))'
-                         r' *\[(?P<status>[a-zA-Z]+)\]$')
+        p3 = regex_engine.compile(r'^(?P<address>(?P<ip>[a-z0-9\:]+)'
+                                   r'\/(?P<prefix_length>[0-9]+))'
+                                   r' *\[(?P<status>[a-zA-Z]+)\]$')
 
         # Link Local Address : fe80::5054:ff:fed7:c01f(VALID)
-        p3_1 = re.compile(r'^Link +Local +Address *: *'
-                         r'(?P<address>[\w\:]+)'
-                         r'\((?P<status>[a-zA-Z]+)\)$')
+        p3_1 = regex_engine.compile(r'^Link +Local +Address *: *'
+                                   r'(?P<address>[\w\:]+)'
+                                   r'\((?P<status>[a-zA-Z]+)\)$')
 
         # IPv6 Link-local Address: fe80::5054:ff:fed7:c01f
-        p3_2 = re.compile(r'^IPv6 +Link\-local +Address *: *'
-                         r'(?P<address>[\w\:]+)$')
+        p3_2 = regex_engine.compile(r'^IPv6 +Link\-local +Address *: *'
+                                   r'(?P<address>[\w\:]+)$')
 
         # Active Querier: fe80::5054:ff:fed7:c01f
-        p4 = re.compile(r'^Active +Querier: +(?P<querier>[\w\.\:]+)$')
+        p4 = regex_engine.compile(r'^Active +Querier: +(?P<querier>[\w\.\:]+)$')
 
         # Querier version: 2, next query sent in: 00:05:18
-        p4_1 = re.compile(r'^Querier +version: +(?P<version>\d+), +'
-                         r'next +query +sent +in: +(?P<in>[\w\.\:]+)$')
+        p4_1 = regex_engine.compile(r'^Querier +version: +(?P<version>\d+), +'
+                                   r'next +query +sent +in: +(?P<in>[\w\.\:]+)$')
 
         # MLD Membership count: 2
-        p5 = re.compile(r'^MLD +Membership +count: +(?P<count>\d+)$')
+        p5 = regex_engine.compile(r'^MLD +Membership +count: +(?P<count>\d+)$')
 
         # MLD version: 2, host version: 2
-        p7 = re.compile(r'^MLD +version: +(?P<ver>\d+), +'
-                         r'host +version: +(?P<host_ver>\d+)$')
+        p7 = regex_engine.compile(r'^MLD +version: +(?P<ver>\d+), +'
+                                   r'host +version: +(?P<host_ver>\d+)$')
 
         # MLD query interval: 366 secs, configured value: 366 secs
-        p8 = re.compile(r'^MLD +query +interval: +(?P<intverval>\d+) +secs, +'
-                         r'configured +value: +(?P<conf_intvl>\d+) +secs$')
+        p8 = regex_engine.compile(r'^MLD +query +interval: +(?P<intverval>\d+) +secs, +'
+                                   r'configured +value: +(?P<conf_intvl>\d+) +secs$')
 
         # MLD max response time: 16 secs, configured value: 16 secs
-        p9 = re.compile(r'^MLD +max +response +time: +(?P<time>\d+) +secs, +'
-                         r'configured +value: +(?P<conf_time>\d+) +secs$')
+        p9 = regex_engine.compile(r'^MLD +max +response +time: +(?P<time>\d+) +secs, +'
+                                   r'configured +value: +(?P<conf_time>\d+) +secs$')
 
         # MLD startup query interval: 91 secs, configured value: 31 secs
-        p10 = re.compile(r'^MLD +startup +query +interval: +(?P<intvl>\d+) +secs, +'
-                         r'configured +value: +(?P<conf_intvl>\d+) +secs$')
+        p10 = regex_engine.compile(r'^MLD +startup +query +interval: +(?P<intvl>\d+) +secs, +'
+                                   r'configured +value: +(?P<conf_intvl>\d+) +secs$')
 
         # MLD startup query count: 7
-        p11 = re.compile(r'^MLD +startup +query +count: +(?P<count>\d+)$')
+        p11 = regex_engine.compile(r'^MLD +startup +query +count: +(?P<count>\d+)$')
 
         # MLD last member mrt: 1 secs
-        p12 = re.compile(r'^MLD +last +member +mrt: +(?P<mrt>\d+) +secs$')
+        p12 = regex_engine.compile(r'^MLD +last +member +mrt: +(?P<mrt>\d+) +secs$')
 
         # MLD last member query count: 7
-        p13 = re.compile(r'^MLD +last +member +query +count: +(?P<count>\d+)$')
+        p13 = regex_engine.compile(r'^MLD +last +member +query +count: +(?P<count>\d+)$')
 
         # MLD group timeout: 2578 secs, configured value: 260 secs
-        p14 = re.compile(r'^MLD +group +timeout: +(?P<timeout>\d+) +secs, +'
-                         r'configured +value: +(?P<conf_timeout>\d+) +secs$')
+        p14 = regex_engine.compile(r'^MLD +group +timeout: +(?P<timeout>\d+) +secs, +'
+                                   r'configured +value: +(?P<conf_timeout>\d+) +secs$')
 
         # MLD querier timeout: 2570 secs, configured value: 255 secs
-        p15 = re.compile(r'^MLD +querier +timeout: +(?P<timeout>\d+) +secs, +'
-                         r'configured +value: +(?P<conf_timeout>\d+) +secs$')
+        p15 = regex_engine.compile(r'^MLD +querier +timeout: +(?P<timeout>\d+) +secs, +'
+                                   r'configured +value: +(?P<conf_timeout>\d+) +secs$')
 
         # MLD unsolicited report interval: 1 secs
-        p16 = re.compile(r'^MLD +unsolicited +report +interval: +(?P<val>\d+) +secs$')
+        p16 = regex_engine.compile(r'^MLD +unsolicited +report +interval: +(?P<val>\d+) +secs$')
 
         # MLD robustness variable: 7, configured value: 7
-        p17 = re.compile(r'^MLD +robustness +variable: +(?P<val1>\d+), +'
-                          r'configured +value: +(?P<val2>\d+)$')
+        p17 = regex_engine.compile(r'^MLD +robustness +variable: +(?P<val1>\d+), +'
+                                    r'configured +value: +(?P<val2>\d+)$')
 
         # MLD reporting for link-local groups: disabled
-        p18 = re.compile(r'^MLD +reporting +for +link\-local +groups: +(?P<status>\w+)$')
+        p18 = regex_engine.compile(r'^MLD +reporting +for +link\-local +groups: +(?P<status>\w+)$')
 
         # MLD interface enable refcount: 4
-        p19 = re.compile(r'^MLD +interface +enable +refcount: +(?P<count>\d+)$')
+        p19 = regex_engine.compile(r'^MLD +interface +enable +refcount: +(?P<count>\d+)$')
 
         # MLD immediate leave: enabled
-        p20 = re.compile(r'^MLD +immediate +leave: +(?P<status>\w+)$')
+        p20 = regex_engine.compile(r'^MLD +immediate +leave: +(?P<status>\w+)$')
 
         # MLD Report Policy: test
-        p22 = re.compile(r'^MLD +Report +Policy: +(?P<policy>\S+)$')
+        p22 = regex_engine.compile(r'^MLD +Report +Policy: +(?P<policy>\S+)$')
 
         # MLD State Limit: 6400,  Available States: 6400
-        p23 = re.compile(r'^MLD +State +Limit: +(?P<max_groups>\d+), +'
-                          r'Available +States: +(?P<available_groups>\d+)$')
+        p23 = regex_engine.compile(r'^MLD +State +Limit: +(?P<max_groups>\d+), +'
+                                    r'Available +States: +(?P<available_groups>\d+)$')
 
         # ICMPv6 MLD Statistics (sent/received):
         #   V1 Queries:          0/0
         #   V1 Leaves :          0/0
-        p25 = re.compile(r'^(?P<title>[\w\s]+) *: +(?P<sent1>\d+)\/(?P<received1>\d+)$')
+        p25 = regex_engine.compile(r'^(?P<title>[\w\s]+) *: +(?P<sent1>\d+)\/(?P<received1>\d+)$')
 
         # initial variables
         ret_dict = {}
@@ -560,29 +558,29 @@ class ShowIpv6MldGroups(ShowIpv6MldGroupsSchema):
             out = output
 
         # show ipv6 mld groups
-        p0 = re.compile(r'^show +ipv6 +mld +groups.*$')
+        p0 = regex_engine.compile(r'^show +ipv6 +mld +groups.*$')
 
         # MLD Connected Group Membership for VRF "default" - 2 total entries
-        p1 = re.compile(r'^MLD +Connected +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"'
-                         r' +\- +(?P<entries>\d+) +total +entries$')
+        p1 = regex_engine.compile(r'^MLD +Connected +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"'
+                                   r' +\- +(?P<entries>\d+) +total +entries$')
 
         # ff38::1
-        p2 = re.compile(r'^(?P<group>[\w\.\:]+)$')
+        p2 = regex_engine.compile(r'^(?P<group>[\w\.\:]+)$')
 
         #   2001:20:1:1::254 D    Ethernet1/2.10         00:13:56  00:03:31  fe80::200:7cff:fe06:af79
         # ff04:230:11:1::1   D   Vlan2                  23:20:22  00:02:36  fe80::10:23:4:30
         #   10:11:1::10      D    Vlan20                 23:20:22  00:03:50  fe80::10:22:1:20
-        p4 = re.compile(r'^(?P<whitespace>\s*)?(?P<source>[\w\.\:]+) +(?P<type>\w+) +(?P<intf>[\w\.\/\-]+)'
+        p4 = regex_engine.compile(r'^(?P<whitespace>\s*)?(?P<source>[\w\.\:]+) +(?P<type>\w+) +(?P<intf>[\w\.\/\-]+)'
             r' +(?P<uptime>[\w\.\:]+) +(?P<expires>[\w\.\:]+) +(?P<last_reporter>[\w\.\:]+)$')
 
         # (2001:db8:0:abcd::2, ff30::2)
-        p5 = re.compile(r'^\((?P<source>[\w\.\:\*]+), *(?P<group>[\w\.\:]+)\)$')
+        p5 = regex_engine.compile(r'^\((?P<source>[\w\.\:\*]+), *(?P<group>[\w\.\:]+)\)$')
 
         #   Type: Static, Interface: Ethernet2/1
-        p6 = re.compile(r'^\s+Type: +(?P<type>\w+), Interface: +(?P<intf>[\w\.\/\-]+)$')
+        p6 = regex_engine.compile(r'^\s+Type: +(?P<type>\w+), Interface: +(?P<intf>[\w\.\/\-]+)$')
 
         #   Uptime/Expires: 00:26:28/never, Last Reporter: 2001:db8:8404:907f::1
-        p7 = re.compile(r'^\s+Uptime\/Expires *: +(?P<uptime>[\w\.\:]+)/(?P<expires>[\w\.\:]+), +'
+        p7 = regex_engine.compile(r'^\s+Uptime\/Expires *: +(?P<uptime>[\w\.\:]+)/(?P<expires>[\w\.\:]+), +'
             r'Last +Reporter *: +(?P<last_reporter>[\w\.\:]+)$')
 
         # initial variables
@@ -756,23 +754,23 @@ class ShowIpv6MldLocalGroups(ShowIpv6MldLocalGroupsSchema):
             out = output
 
         # Group   Type     Interface   Last Reported
-        p0 = re.compile(r'^Group +Type +Interface +Last +Reported$')
+        p0 = regex_engine.compile(r'^Group +Type +Interface +Last +Reported$')
 
         # MLD Locally Joined Group Membership for VRF "default"
-        p1 = re.compile(r'^MLD +Locally +Joined +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"$')
+        p1 = regex_engine.compile(r'^MLD +Locally +Joined +Group +Membership +for +VRF +\"(?P<vrf>\S+)\"$')
 
         # Group   Type     Interface   Last Reported 
         # (*, fffe::1)
-        p2 = re.compile(r'^\((?P<source>[\w\.\:\*]+), *(?P<group>[\w\.\:]+)\)$')
+        p2 = regex_engine.compile(r'^\((?P<source>[\w\.\:\*]+), *(?P<group>[\w\.\:]+)\)$')
 
         #         Local    Eth2/1      00:03:07  
-        p2_1 = re.compile(r'^(?P<type>\w+) +(?P<intf>[\w\.\-\/]+) +'
-                           r'(?P<last_reported>[\w\.\:]+)$')
+        p2_1 = regex_engine.compile(r'^(?P<type>\w+) +(?P<intf>[\w\.\-\/]+) +'
+                                     r'(?P<last_reported>[\w\.\:]+)$')
 
         # Group Address    Source Address   Type     Interface   Last Reported 
         # fffe::2          *                Local    Eth1/2.12   00:27:31  
-        p3 = re.compile(r'^(?P<group>[\w\.\:]+) +(?P<source>[\w\.\:\*]+) +'
-                           r'(?P<type>\w+) +(?P<intf>[\w\.\-\/]+) +(?P<last_reported>[\w\.\:]+)$')
+        p3 = regex_engine.compile(r'^(?P<group>[\w\.\:]+) +(?P<source>[\w\.\:\*]+) +'
+                                     r'(?P<type>\w+) +(?P<intf>[\w\.\-\/]+) +(?P<last_reported>[\w\.\:]+)$')
 
         # initial variables
         ret_dict = {}
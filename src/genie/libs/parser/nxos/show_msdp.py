@@ -10,13 +10,13 @@ NXOS parser for the following show commands:
     * show ip msdp summary vrf <vrf>
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ====================================================
 #  schema for show ip msdp peer vrf <vrf>
 # ====================================================
@@ -132,86 +132,86 @@ class ShowIpMsdpPeerVrf(ShowIpMsdpPeerVrfSchema):
         result_dict = {}
 
         # MSDP peer 10.4.1.1 for VRF "default"
-        p1 = re.compile(r'^\s*MSDP +peer +(?P<address>[\d\.]+) +for +VRF +\"(?P<vrf>[\w]+)\"$')
+        p1 = regex_engine.compile(r'^\s*MSDP +peer +(?P<address>[\d\.]+) +for +VRF +\"(?P<vrf>[\w]+)\"$')
 
         # AS 100, local address: 10.36.3.3 (loopback0)
-        p2 = re.compile(r'^\s*AS +(?P<peer_as>[\d]+), +local address: +(?P<connect_source_address>[\d\.]+)'
-                        r' +\((?P<connect_source>[\w\-\/\.]+)\)$')
+        p2 = regex_engine.compile(r'^\s*AS +(?P<peer_as>[\d]+), +local address: +(?P<connect_source_address>[\d\.]+)'
+                                  r' +\((?P<connect_source>[\w\-\/\.]+)\)$')
         #   Description: R1
-        p3 = re.compile(r'^\s*Description: +(?P<description>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^\s*Description: +(?P<description>[\S\s]+)$')
 
         #   Connection status: Established
         #   Connection status: Admin-shutdown
         #   Connection status: Inactive, Connecting in: 0.217135
-        p4 = re.compile(r'^\s*Connection status: +(?P<session_state>[\w\-]+)(, +(Connecting|Listening) +in:'
-                        r' +(?P<conecting_time>[\w\:\.]+))?$')
+        p4 = regex_engine.compile(r'^\s*Connection status: +(?P<session_state>[\w\-]+)(, +(Connecting|Listening) +in:'
+                                  r' +(?P<conecting_time>[\w\:\.]+))?$')
         #     Uptime(Downtime): 01:27:25
-        p5 = re.compile(r'^\s*Uptime\(Downtime\): +(?P<elapsed_time>[\w\:\.]+)$')
+        p5 = regex_engine.compile(r'^\s*Uptime\(Downtime\): +(?P<elapsed_time>[\w\:\.]+)$')
 
         #     Last reset reason: Keepalive timer expired
-        p6 = re.compile(r'^\s*Last +reset +reason: +(?P<reset_reason>[\S\s]+)$')
+        p6 = regex_engine.compile(r'^\s*Last +reset +reason: +(?P<reset_reason>[\S\s]+)$')
 
         #     Password: not set
-        p7 = re.compile(r'^\s*Password: +(?P<password>[\w\s]+)$')
+        p7 = regex_engine.compile(r'^\s*Password: +(?P<password>[\w\s]+)$')
 
         #   Keepalive Interval: 60 sec
-        p8 = re.compile(r'^\s*Keepalive Interval: +(?P<keepalive_interval>[\d]+) +sec$')
+        p8 = regex_engine.compile(r'^\s*Keepalive Interval: +(?P<keepalive_interval>[\d]+) +sec$')
 
         #   Keepalive Timeout: 90 sec
-        p9 = re.compile(r'^\s*Keepalive +Timeout: +(?P<keepalive_timeout>[\d]+) +sec$')
+        p9 = regex_engine.compile(r'^\s*Keepalive +Timeout: +(?P<keepalive_timeout>[\d]+) +sec$')
 
         #   Reconnection Interval: 33 sec
-        p10 = re.compile(r'^\s*Reconnection +Interval: +(?P<reconnection_interval>[\d]+) +sec$')
+        p10 = regex_engine.compile(r'^\s*Reconnection +Interval: +(?P<reconnection_interval>[\d]+) +sec$')
 
         #   Policies:
-        p11 = re.compile(r'^\s*Policies:$')
+        p11 = regex_engine.compile(r'^\s*Policies:$')
 
         #     SA in: none, SA out: none
-        p12 = re.compile(r'^\s*SA +in: +(?P<sa_in>[\w]+), +SA +out: +(?P<sa_out>[\w]+)$')
+        p12 = regex_engine.compile(r'^\s*SA +in: +(?P<sa_in>[\w]+), +SA +out: +(?P<sa_out>[\w]+)$')
 
         #     SA limit: 111
-        p13 = re.compile(r'^\s*SA +limit: +(?P<sa_limit>[\w]+)$')
+        p13 = regex_engine.compile(r'^\s*SA +limit: +(?P<sa_limit>[\w]+)$')
 
         #   Member of mesh-group: 1
-        p14 = re.compile(r'^\s*Member +of +mesh-group: +(?P<mesh_group>\S+)$')
+        p14 = regex_engine.compile(r'^\s*Member +of +mesh-group: +(?P<mesh_group>\S+)$')
 
         #   Statistics (in/out):
-        p15 = re.compile(r'^\s*Statistics +\(in/out\):$')
+        p15 = regex_engine.compile(r'^\s*Statistics +\(in/out\):$')
 
         #     Last messaged received: 00:00:22
-        p16 = re.compile(r'^\s*Last messaged received: +(?P<last_message_received>[\w\:\.]+)$')
+        p16 = regex_engine.compile(r'^\s*Last messaged received: +(?P<last_message_received>[\w\:\.]+)$')
 
         #     SAs: 0/0, SA-Requests: 0/0, SA-Responses: 0/0
-        p17 = re.compile(r'^\s*SAs: +(?P<in_sas>[\d]+)/+(?P<out_sas>[\d]+), +SA-Requests:'
-                         r' +(?P<in_sa_request>[\d]+)/+(?P<out_sa_request>[\d]+)'
-                         r', SA-Responses: +(?P<in_sa_response>[\d]+)/+(?P<out_sa_response>[\d]+)$')
+        p17 = regex_engine.compile(r'^\s*SAs: +(?P<in_sas>[\d]+)/+(?P<out_sas>[\d]+), +SA-Requests:'
+                                   r' +(?P<in_sa_request>[\d]+)/+(?P<out_sa_request>[\d]+)'
+                                   r', SA-Responses: +(?P<in_sa_response>[\d]+)/+(?P<out_sa_response>[\d]+)$')
 
         #     In/Out Ctrl Msgs: 0/0, In/Out Data Msgs: 0/0
-        p18 = re.compile(r'^\s*In/Out +Ctrl +Msgs: +(?P<in_ctrl_msg>[\d]+)/+(?P<out_ctrl_msg>[\d]+), In/Out Data Msgs:'
-                         r' +(?P<in_data_messages>[\d]+)/+(?P<out_data_messages>[\d]+)$')
+        p18 = regex_engine.compile(r'^\s*In/Out +Ctrl +Msgs: +(?P<in_ctrl_msg>[\d]+)/+(?P<out_ctrl_msg>[\d]+), In/Out Data Msgs:'
+                                   r' +(?P<in_data_messages>[\d]+)/+(?P<out_data_messages>[\d]+)$')
 
         #     Remote/Local Port 26743/639
-        p19 = re.compile(r'^\s*Remote/Local Port +(?P<remote_port>[\d]+)/+(?P<local_port>[\d]+)$')
+        p19 = regex_engine.compile(r'^\s*Remote/Local Port +(?P<remote_port>[\d]+)/+(?P<local_port>[\d]+)$')
 
         #     Keepalives: 92/119, Notifications: 0/6
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r'^\s*Keepalives: +(?P<in_keepalive>[\d]+)/+(?P<out_keepalive>[\d]+), Notifications:'
             r' +(?P<in_notification>[\d]+)/+(?P<out_notification>[\d]+)$')
 
         #     RPF check failures: 0
-        p21 = re.compile(r'^\s*RPF check failures: +(?P<rpf_check_failures>[\d]+)$')
+        p21 = regex_engine.compile(r'^\s*RPF check failures: +(?P<rpf_check_failures>[\d]+)$')
 
         #     Cache Lifetime: 00:03:30
-        p22 = re.compile(r'^\s*Cache Lifetime: +(?P<cache_lifetime>[\w\:\.]+)$')
+        p22 = regex_engine.compile(r'^\s*Cache Lifetime: +(?P<cache_lifetime>[\w\:\.]+)$')
 
         #     Established Transitions: 6
-        p23 = re.compile(r'^\s*Established Transitions: +(?P<established_transition>[\d]+)$')
+        p23 = regex_engine.compile(r'^\s*Established Transitions: +(?P<established_transition>[\d]+)$')
 
         #     Connection Attempts: 0
-        p24 = re.compile(r'^\s*Connection Attempts: +(?P<connection_attemps>[\d]+)$')
+        p24 = regex_engine.compile(r'^\s*Connection Attempts: +(?P<connection_attemps>[\d]+)$')
 
         #     Discontinuity Time: 01:27:25
-        p25 = re.compile(r'^\s*Discontinuity Time: +(?P<discontinuity_time>[\w\:\.]+)$')
+        p25 = regex_engine.compile(r'^\s*Discontinuity Time: +(?P<discontinuity_time>[\w\:\.]+)$')
 
         for line in out.splitlines():
             if line:
@@ -461,14 +461,14 @@ class ShowIpMsdpSaCacheDetailVrf(ShowIpMsdpSaCacheDetailVrfSchema):
 
         result_dict = {}
         # MSDP SA Route Cache for VRF "default" - 1 entries
-        p1 = re.compile(r'^\s*MSDP SA Route Cache for VRF +\"(?P<vrf>[\w]+)\" +\- +(?P<number_of_entries>[\d]+) +entries$')
+        p1 = regex_engine.compile(r'^\s*MSDP SA Route Cache for VRF +\"(?P<vrf>[\w]+)\" +\- +(?P<number_of_entries>[\d]+) +entries$')
 
         # Source          Group            RP               ASN         Uptime
         # 172.16.25.2       228.1.1.1        10.106.106.106   100         00:02:43
-        p2 = re.compile(r'^\s*(?P<source>[\d\.]+) +(?P<group>[\d\.]+) +(?P<rp>[\d\.]+) +(?P<asn>[\d\.]+) +(?P<uptime>[\w\:\.]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<source>[\d\.]+) +(?P<group>[\d\.]+) +(?P<rp>[\d\.]+) +(?P<asn>[\d\.]+) +(?P<uptime>[\w\:\.]+)$')
 
         #     Peer: 10.106.106.106, Expires: 00:02:32
-        p3 = re.compile(r'^\s*Peer: +(?P<peer>[\d\.]+), +Expires: +(?P<expire>[\d\:]+)$')
+        p3 = regex_engine.compile(r'^\s*Peer: +(?P<peer>[\d\.]+), +Expires: +(?P<expire>[\d\:]+)$')
 
         for line in out.splitlines():
             if line:
@@ -587,23 +587,23 @@ class ShowIpMsdpPolicyStatisticsSaPolicyInOut(ShowIpMsdpPolicyStatisticsSaPolicy
         match1 = ''
 
         # route-map filtera permit 10
-        p1 = re.compile(r'^(?P<match1>route\-map +(?P<sa_filter>\S+) +permit +(?P<permit>\d+))$')
+        p1 = regex_engine.compile(r'^(?P<match1>route\-map +(?P<sa_filter>\S+) +permit +(?P<permit>\d+))$')
 
         # ip prefix-list pfxlista seq 5 permit 224.0.0.0/4             M: 0
         # ip prefix-list pfxlista seq 10 permit 224.0.0.0/4 le 32      M: 0
-        p1_1 = re.compile(r'^(?P<match>ip +prefix\-list +(?P<sa_filter>\S+) +seq +(?P<seq>\d+) '
-                           r'+permit +(?P<permit>\S+)(?P<operator>[\w\s]+)?)'
-                           r'( +(C: +(?P<comparisions>\d+)))?( +(M: +(?P<matches>\d+)))?$')
+        p1_1 = regex_engine.compile(r'^(?P<match>ip +prefix\-list +(?P<sa_filter>\S+) +seq +(?P<seq>\d+) '
+                                     r'+permit +(?P<permit>\S+)(?P<operator>[\w\s]+)?)'
+                                     r'( +(C: +(?P<comparisions>\d+)))?( +(M: +(?P<matches>\d+)))?$')
 
         # match ip address mcast-all-groups                          C: 0      M: 0
-        p2 = re.compile(r'^(?P<match2>match +ip +address +(?P<match_ip>\S+))'
-                         r'( +(C: +(?P<comparisions>\d+)))?( +(M: +(?P<matches>\d+)))?$')
+        p2 = regex_engine.compile(r'^(?P<match2>match +ip +address +(?P<match_ip>\S+))'
+                                   r'( +(C: +(?P<comparisions>\d+)))?( +(M: +(?P<matches>\d+)))?$')
 
         # Total accept count for policy: 0
-        p3 = re.compile(r'^Total +accept +count +for +policy: +(?P<total_accept_count>\d+)$')
+        p3 = regex_engine.compile(r'^Total +accept +count +for +policy: +(?P<total_accept_count>\d+)$')
 
         # Total reject count for policy: 0
-        p4 = re.compile(r'^Total +reject +count +for +policy: +(?P<total_reject_count>\d+)$')
+        p4 = regex_engine.compile(r'^Total +reject +count +for +policy: +(?P<total_reject_count>\d+)$')
 
         for line in out.splitlines():
             if line:
@@ -761,25 +761,25 @@ class ShowIpMsdpSummary(ShowIpMsdpSummarySchema):
         ret_dict = {}
 
         # MSDP Peer Status Summary for VRF "default"
-        p1 = re.compile(r'^MSDP +Peer +Status +Summary +for +VRF +\"(?P<vrf>\S+)\"$')
+        p1 = regex_engine.compile(r'^MSDP +Peer +Status +Summary +for +VRF +\"(?P<vrf>\S+)\"$')
 
         # Local ASN: 0, originator-id: 10.16.2.2
-        p2 = re.compile(r'^Local +ASN: +(?P<local_as>\d+), +'
-                         r'originator\-id: +(?P<originator_id>[\d\.]+)$')
+        p2 = regex_engine.compile(r'^Local +ASN: +(?P<local_as>\d+), +'
+                                   r'originator\-id: +(?P<originator_id>[\d\.]+)$')
 
         # Number of configured peers:  1
-        p3 = re.compile(r'^Number +of +configured +peers: +(?P<num_of_configured_peers>\d+)$')
+        p3 = regex_engine.compile(r'^Number +of +configured +peers: +(?P<num_of_configured_peers>\d+)$')
         # Number of established peers: 1
-        p4 = re.compile(r'^Number +of +established +peers: +(?P<num_of_established_peers>\d+)$')
+        p4 = regex_engine.compile(r'^Number +of +established +peers: +(?P<num_of_established_peers>\d+)$')
         # Number of shutdown peers:    0
-        p5 = re.compile(r'^Number +of +shutdown +peers: +(?P<num_of_shutdown_peers>\d+)$')
+        p5 = regex_engine.compile(r'^Number +of +shutdown +peers: +(?P<num_of_shutdown_peers>\d+)$')
 
         # Peer            Peer        Connection      Uptime/   Last msg  (S,G)s
         # Address         ASN         State           Downtime  Received  Received
         # 10.144.6.6         0           Established     05:46:19  00:00:51  1
-        p6 = re.compile(r'^(?P<address>[\d\.]+) +(?P<peer_as>\d+) +(?P<session_state>[\w\/\-]+) +'
-                         r'(?P<elapsed_time>[\w\.\:]+) +(?P<last_message_received>[\w\.\:]+) +'
-                         r'(?P<num_of_sg_received>\d+)$')
+        p6 = regex_engine.compile(r'^(?P<address>[\d\.]+) +(?P<peer_as>\d+) +(?P<session_state>[\w\/\-]+) +'
+                                   r'(?P<elapsed_time>[\w\.\:]+) +(?P<last_message_received>[\w\.\:]+) +'
+                                   r'(?P<num_of_sg_received>\d+)$')
 
         for line in out.splitlines():
             if line:
@@ -900,26 +900,26 @@ class ShowRunningConfigMsdp(ShowRunningConfigMsdpSchema):
 
         # initial regular express
         # vrf context VRF1
-        p_vrf  = re.compile(r'^vrf +context +(?P<vrf>\S+)$')
+        p_vrf  = regex_engine.compile(r'^vrf +context +(?P<vrf>\S+)$')
 
         # ip msdp keepalive 10.144.6.6 20 30
-        p1 = re.compile(r'^ip +msdp +keepalive +(?P<peer>[\d\.]+) +'
-                         r'(?P<keepalive_interval>\d+) +(?P<holdtime_interval>\d+)$')
+        p1 = regex_engine.compile(r'^ip +msdp +keepalive +(?P<peer>[\d\.]+) +'
+                                   r'(?P<keepalive_interval>\d+) +(?P<holdtime_interval>\d+)$')
 
         # ip msdp description 10.144.6.6 some description
-        p2 = re.compile(r'^ip +msdp +description +(?P<peer>[\d\.]+) +'
-                         r'(?P<description>.*)$')
+        p2 = regex_engine.compile(r'^ip +msdp +description +(?P<peer>[\d\.]+) +'
+                                   r'(?P<description>.*)$')
 
         # ip msdp reconnect-interval 20
-        p3 = re.compile(r'^ip +msdp +reconnect\-interval +(?P<connect_retry_interval>\d+)$')
+        p3 = regex_engine.compile(r'^ip +msdp +reconnect\-interval +(?P<connect_retry_interval>\d+)$')
 
         # ip msdp originator-id loopback11
-        p4 = re.compile(r'^ip +msdp +originator\-id +(?P<originating_rp>[\w\.\-\/]+)$')
+        p4 = regex_engine.compile(r'^ip +msdp +originator\-id +(?P<originating_rp>[\w\.\-\/]+)$')
 
         # ip msdp peer 10.36.3.3 connect-source loopback0 remote-as 234
         # ip msdp peer 10.144.6.6 connect-source loopback11
-        p5 = re.compile(r'^ip +msdp +peer +(?P<peer>[\d\.]+) +connect\-source +'
-                         r'(?P<connected_source>[\w\-\/\.]+)( +remote\-as +(?P<peer_as>\d+))?$')
+        p5 = regex_engine.compile(r'^ip +msdp +peer +(?P<peer>[\d\.]+) +connect\-source +'
+                                   r'(?P<connected_source>[\w\-\/\.]+)( +remote\-as +(?P<peer_as>\d+))?$')
 
         for line in out.splitlines():
             if line and not line.startswith(' '):
@@ -24,12 +24,10 @@ NXOS parser for the following show commands:
     * show ipv6 neighbor vrf <vrf>
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 # ====================================================
 #  schema for show ipv6 neighbor detail
@@ -110,15 +108,15 @@ class ShowIpv6NeighborDetail(ShowIpv6NeighborDetailSchema):
         # No. of Adjacency hit with type GLOBAL GLEAN: Packet count 0, Byte count 0
         # No. of Adjacency hit with type GLEAN: Packet count 0, Byte count 0
         # No. of Adjacency hit with type NORMAL: Packet count 0, Byte count 0
-        p1 = re.compile(r'^No. +of +Adjacency +hit +with +type +(?P<adjacency>([\w\s]+)): +Packet +count +'
-                        r'(?P<packet_count>(\d+)), +Byte +count +(?P<byte_count>(\d+))$')
+        p1 = regex_engine.compile(r'^No. +of +Adjacency +hit +with +type +(?P<adjacency>([\w\s]+)): +Packet +count +'
+                                  r'(?P<packet_count>(\d+)), +Byte +count +(?P<byte_count>(\d+))$')
 
         # Adjacency statistics last updated before: never
-        p2 = re.compile(r'^Adjacency +statistics +last +updated +before: '
-                        r'+(?P<adjacency_statistics_last_updated_before>(\w+))$')
+        p2 = regex_engine.compile(r'^Adjacency +statistics +last +updated +before: '
+                                  r'+(?P<adjacency_statistics_last_updated_before>(\w+))$')
 
         # Total number of entries: 11
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^Total +number +of +entries: +(?P<total_number_of_entries>(\d+))$')
 
         # Address :            2001:db8:c56d:4::2
@@ -132,7 +130,7 @@ class ShowIpv6NeighborDetail(ShowIpv6NeighborDetailSchema):
         # Byte Count :         0
         # Best :               Yes
         # Throttled :          No
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^(?P<neighbor_key>(?!Total number of entries)[A-Za-z\s]+) +: +(?P<neighbor_value>[\w\/\.\:]+)$')
 
         for line in out.splitlines():
@@ -353,56 +351,56 @@ class ShowIpv6NdInterface(ShowIpv6NdInterfaceSchema):
         #       Current DAD attempt : 1
 
         # ICMPv6 ND Interfaces for VRF "default"
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^\s*ICMPv6 ND Interfaces for VRF +\"(?P<vrf>[\w]+)\"$')
         # Ethernet1/1, Interface status: protocol-up/link-up/admin-up
-        p2 = re.compile(r'^\s*(?P<interface>[\w\/\.]+), +Interface status:'
-                        r' +protocol-(?P<protocol_status>[\w]+)/link-(?P<link_status>[\w]+)/admin-(?P<admin_status>[\w]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<interface>[\w\/\.]+), +Interface status:'
+                                  r' +protocol-(?P<protocol_status>[\w]+)/link-(?P<link_status>[\w]+)/admin-(?P<admin_status>[\w]+)$')
         #   IPv6 address:
-        p3 = re.compile(r'^\s*IPv6 address:$')
+        p3 = regex_engine.compile(r'^\s*IPv6 address:$')
         #     2001:db8:c56d:4::3/64 [VALID]
-        p4 = re.compile(r'^\s*(?P<ipv6_address>[\w\:\/]+)( +\[VALID\])?$')
+        p4 = regex_engine.compile(r'^\s*(?P<ipv6_address>[\w\:\/]+)( +\[VALID\])?$')
         # IPv6 link-local address: fe80::5c01:c0ff:fe02:7 [VALID]
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^\s*IPv6 +link\-local +address: +(?P<link_address>[\w\:\/]+)( +\[VALID\])?$')
         # ND mac-extract : Disabled
-        p6 = re.compile(r'^\s*ND mac-extract : +(?P<nd_mac_extract>[\w]+)$')
+        p6 = regex_engine.compile(r'^\s*ND mac-extract : +(?P<nd_mac_extract>[\w]+)$')
         # ICMPv6 active timers:
-        p7 = re.compile(r'^\s* ICMPv6 active timers:$')
+        p7 = regex_engine.compile(r'^\s* ICMPv6 active timers:$')
         #       Last Neighbor-Solicitation sent: 00:06:16
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r'^\s*Last Neighbor-Solicitation sent: +(?P<last_neighbor_solicitation_sent>[\w\:]+)$')
         #       Last Neighbor-Advertisement sent: 00:02:12
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r'^\s*Last Neighbor-Advertisement sent: +(?P<last_neighbor_advertisement_sent>[\w\:]+)$')
         #       Last Router-Advertisement sent: 1d18h
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r'^\s*Last Router-Advertisement sent: +(?P<last_router_advertisement_sent>[\w\:]+)$')
         #       Next Router-Advertisement sent in: 0.000000
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r'^\s*Next Router-Advertisement sent in: +(?P<next_router_advertisement_sent>[\w\.\:]+)$')
-        p12 = re.compile(r'^\s*Router-Advertisement parameters:$')
-        p13 = re.compile(
+        p12 = regex_engine.compile(r'^\s*Router-Advertisement parameters:$')
+        p13 = regex_engine.compile(
             r'^\s*Periodic +interval: +(?P<interval>\d+) +to +(?P<to_interval>\d+) +seconds$')
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r'^\s*Send +\"(?P<router_adv_key>[\w\s]+)\" +(option value|flag|value|field): +(?P<value>\w+)( +(secs|ms))?$')
-        p17 = re.compile(r'^\s*Suppress RA: +(?P<suppress>[\w]+)$')
-        p18 = re.compile(r'^\s*Suppress MTU in RA: +(?P<suppress_mtu>[\w]+)$')
-        p19 = re.compile(
+        p17 = regex_engine.compile(r'^\s*Suppress RA: +(?P<suppress>[\w]+)$')
+        p18 = regex_engine.compile(r'^\s*Suppress MTU in RA: +(?P<suppress_mtu>[\w]+)$')
+        p19 = regex_engine.compile(
             r'^\s*Suppress Route Information Option in RA: +(?P<suppress_route_information>[\w]+)$')
-        p20 = re.compile(r'^\s*Neighbor-Solicitation parameters:$')
-        p21 = re.compile(
+        p20 = regex_engine.compile(r'^\s*Neighbor-Solicitation parameters:$')
+        p21 = regex_engine.compile(
             r'^\s*NS retransmit interval: +(?P<retransmit_interval>\d+) +ms$')
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r'^\s*ND NUD retry +(?P<nd_nud_retry>\w+): +(?P<nd_nud_retry_value>\d+)$')
-        p23 = re.compile(r'^\s*ICMPv6 error message parameters:$')
-        p24 = re.compile(
+        p23 = regex_engine.compile(r'^\s*ICMPv6 error message parameters:$')
+        p24 = regex_engine.compile(
             r'^\s*Send redirects: +(?P<redirects>\w+) +\((?P<redirects_count>\d+)\)$')
-        p25 = re.compile(r'^\s*Send unreachables: +(?P<unreachables>\w+)$')
-        p26 = re.compile(r'^\s*ICMPv6 DAD parameters:$')
-        p27 = re.compile(
+        p25 = regex_engine.compile(r'^\s*Send unreachables: +(?P<unreachables>\w+)$')
+        p26 = regex_engine.compile(r'^\s*ICMPv6 DAD parameters:$')
+        p27 = regex_engine.compile(
             r'^\s*Maximum +DAD +attempts: +(?P<maximum_attempts>\d+)$')
-        p28 = re.compile(
+        p28 = regex_engine.compile(
             r'^\s*Current +DAD +attempt : +(?P<current_attempt>\d+)$')
 
         for line in out.splitlines():
@@ -681,12 +679,12 @@ class ShowIpv6IcmpNeighborDetail(ShowIpv6IcmpNeighborDetailSchema):
         # 2001:db8:c56d:4::2     00:15:02  fa16.3eff.e5a2  STALE       Eth1/1      Eth1/1
 
         # ICMPv6 Adjacency Table for all VRFs
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^\s*ICMPv6 Adjacency Table for +(?P<vrf>[\w]+) +VRFs$')
 
-        p2 = re.compile(r'^\s*(?P<neighbor>[\w\:]+)?( +(?P<age>[\d\:]+)'
-                        r' +(?P<link_layer_address>[a-f0-9\.]+) +(?P<neighbor_state>[\w]+) +(?P<interface>[\w\/\.]+)'
-                        r' +(?P<physical_interface>[\w\/\.]+))?$')
+        p2 = regex_engine.compile(r'^\s*(?P<neighbor>[\w\:]+)?( +(?P<age>[\d\:]+)'
+                                  r' +(?P<link_layer_address>[a-f0-9\.]+) +(?P<neighbor_state>[\w]+) +(?P<interface>[\w\/\.]+)'
+                                  r' +(?P<physical_interface>[\w\/\.]+))?$')
 
         for line in out.splitlines():
             if line:
@@ -800,30 +798,30 @@ class ShowIpv6Routers(ShowIpv6RoutersSchema):
 
         # Router fe80::f816:3eff:feff:e5a2 on Ethernet1/1 , last update time 3.2 min
         # Router fe80::e6c7:22ff:fe15:4cc1 on port-channel1.100 , last update time 1.3 min
-        p1 = re.compile(r'^((?P<router>\w+) )?(?P<neighbor>[a-f0-9\:]+) +on'
-                        r' +(?P<interface>[\S]+) +,'
-                        r' +last +update +time +(?P<last_update>[\d\.]+) +min$')
+        p1 = regex_engine.compile(r'^((?P<router>\w+) )?(?P<neighbor>[a-f0-9\:]+) +on'
+                                  r' +(?P<interface>[\S]+) +,'
+                                  r' +last +update +time +(?P<last_update>[\d\.]+) +min$')
 
         # Current_hop_limit 64, Lifetime 1800, AddrFlag 0, OtherFlag 0, MTU 1500
-        p2 = re.compile(r'^Current_hop_limit +(?P<current_hop_limit>\d+), +Lifetime +(?P<lifetime>\d+),'
-                        r' +AddrFlag +(?P<addr_flag>\d+), +OtherFlag +(?P<other_flag>\d+),'
-                        r' +MTU +(?P<mtu>\d+)$')
+        p2 = regex_engine.compile(r'^Current_hop_limit +(?P<current_hop_limit>\d+), +Lifetime +(?P<lifetime>\d+),'
+                                  r' +AddrFlag +(?P<addr_flag>\d+), +OtherFlag +(?P<other_flag>\d+),'
+                                  r' +MTU +(?P<mtu>\d+)$')
 
         #  HomeAgentFlag 0, Preference Medium
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^HomeAgentFlag +(?P<homeagentflag>\d+), +Preference +(?P<preference>\w+)$')
 
         # Reachable time 0 msec, Retransmission time 0 msec
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Reachable time +(?P<reachable_time>\d+) +msec, +Retransmission time +(?P<retransmission_time>\d+) +msec$')
 
         # Prefix 2001:db8:c56d:4::/64  onlink_flag 1 autonomous_flag 1
         # Prefix 2001:db8:c56d:4::/64onlink_flag 1 autonomous_flag 1
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^Prefix +(?P<prefix>[\w\:\/]+) *onlink_flag +(?P<onlink_flag>\d+) +autonomous_flag +(?P<autonomous_flag>\d+)$')
 
         #   valid lifetime 2592000, preferred lifetime 604800
-        p6 = re.compile(
+        p6 = regex_engine.compile(
             r'^valid lifetime +(?P<valid_lifetime>\d+), +preferred lifetime +(?P<preferred_lifetime>\d+)$')
 
         for line in out.splitlines():
@@ -957,17 +955,17 @@ class ShowIpv6Neighbor(ShowIpv6NeighborSchema):
         # IPv6 Adjacency Table for VRF default
         # IPv6 Adjacency Table for VRF test
         # IPv6 Adjacency Table for all VRFs
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^IPv6 +Adjacency +Table +for +(VRF +)?(?P<vrf>[\S]+)( +VRFs)?$')
 
         # Total number of entries: 2
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^Total +number +of +entries:\s+(?P<num_entries>\d+)$')
 
         # Address         Age       MAC Address     Pref Source     Interface
         # 2001:db8:2::3   00:08:40  0000.0000.0203  50   icmpv6     Ethernet1/46
 
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(?P<ip_address>[\w\:]+)\s+(?P<age>[\d:-]+)\s+(?P<mac_address>[\w\.]+)\s+(?P<pref>\d+)\s+(?P<source>[\w]+)\s+(?P<interface>\S+)$')
 
         for line in output.splitlines():
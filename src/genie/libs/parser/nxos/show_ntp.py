@@ -7,14 +7,12 @@ NXOS parsers for the following show commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -83,29 +81,29 @@ class ShowNtpPeerStatus(ShowNtpPeerStatusSchema):
         # patterns
 
         # Total peers : 4
-        p1 = re.compile(r'^Total +peers *: +(?P<total_peer>\d+)$')
+        p1 = regex_engine.compile(r'^Total +peers *: +(?P<total_peer>\d+)$')
 
         #     remote                                 local                                   st   poll   reach delay   vrf
         # *10.4.1.1                                  0.0.0.0                                   8   16     377   0.01311 default
 
         #    remote               local                 st   poll   reach delay   vrf
         # =127.127.1.0            10.100.100.1            8   64       0   0.00000
-        p2 = re.compile(r'^(?P<mode_code>[\*\-\+\=]+)? *(?P<remote>[\w\.\:]+) +'
-                        r'(?P<local>[\w\.\:]+) +(?P<st>\d+) +'
-                        r'(?P<poll>\d+) +(?P<reach>\d+) +(?P<delay>[\d\.]+)'
-                        r'( *(?P<vrf>\S+))?$')
+        p2 = regex_engine.compile(r'^(?P<mode_code>[\*\-\+\=]+)? *(?P<remote>[\w\.\:]+) +'
+                                  r'(?P<local>[\w\.\:]+) +(?P<st>\d+) +'
+                                  r'(?P<poll>\d+) +(?P<reach>\d+) +(?P<delay>[\d\.]+)'
+                                  r'( *(?P<vrf>\S+))?$')
 
         #     remote                                 local
         # *10.25.1.11                              10.126.80.251
         # *1.1.1.1                           2.2.2.2
-        p2_1 = re.compile(r'^(?P<mode_code>[\*\-\+\=]+)? *(?P<remote>[\d\.\:]+) +'
-                          r'(?P<local>[\w\.\:]+)$')
+        p2_1 = regex_engine.compile(r'^(?P<mode_code>[\*\-\+\=]+)? *(?P<remote>[\d\.\:]+) +'
+                                    r'(?P<local>[\w\.\:]+)$')
 
         #   st   poll   reach delay   vrf
         #  3   64     377   0.00580default
         #  1   64     377   0.02710 management
-        p2_2 = re.compile(r'(?P<st>\d+) +(?P<poll>\d+) +(?P<reach>\d+) '
-                          r'+(?P<delay>[\d\.]+)( *(?P<vrf>\S+))?$')
+        p2_2 = regex_engine.compile(r'(?P<st>\d+) +(?P<poll>\d+) +(?P<reach>\d+) '
+                                    r'+(?P<delay>[\d\.]+)( *(?P<vrf>\S+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -230,7 +228,7 @@ class ShowNtpPeers(ShowNtpPeersSchema):
 
         # 10.100.4.156                  Peer (configured)
         # 10.1.0.63                     Server (configured)
-        p1 = re.compile(r'^(?P<peer>[\w\.\:]+) +(?P<type>\w+)( *\((?P<conf>configured)\))?$')
+        p1 = regex_engine.compile(r'^(?P<peer>[\w\.\:]+) +(?P<type>\w+)( *\((?P<conf>configured)\))?$')
 
         for line in out.splitlines():
             line = line.strip()
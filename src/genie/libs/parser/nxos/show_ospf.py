@@ -30,6 +30,7 @@ from netaddr import IPNetwork
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -217,90 +218,90 @@ class ShowIpOspf(ShowIpOspfSchema):
         sub_dict = {}
         redist = False
 
-        p1 = re.compile(r'^Routing +Process +(?P<instance>\d+) +'
-                        r'with +ID +(?P<router_id>[\d\.]+) +'
-                        r'VRF +(?P<vrf>\S+)$')
-        p2 = re.compile(r'^Routing +Process +Instance +Number'
-                        r' +(?P<instance>\d+)$')
-        p3 = re.compile(r'^Stateful +High +Availability +(?P<enable>\w+)$')
-        p4 = re.compile(r'^Graceful\-restart +is +(?P<gr_enable>\w+)$')
-        p5 = re.compile(r'^Grace +period: +(?P<interval>\w+) +'
-                        r'state: +(?P<state>\w+)$')
-        p6 = re.compile(r'^Last +graceful +restart +exit +status: '
-                        r'+(?P<status>\w+).*?$')
-        p7 = re.compile(r'^Supports +only +single +TOS\(TOS0\) +routes$')
-        p8 = re.compile(r'^Supports +opaque +LSA$')
-        p9 = re.compile(r'^Administrative +distance +(?P<pref_all>\d+)$')
-        p10 = re.compile(r'^BFD +is +enabled$')
-        p11 = re.compile(r'^Reference +Bandwidth +is +(?P<bd>\d+)'
-                         r' +(?P<unit>\w+)$')
-        p12 = re.compile(r'^SPF +throttling +delay +time +of'
-                         r' +(?P<time>[\d\.]+) +msecs,$')
-        p13 = re.compile(r'^SPF +throttling +hold +time +of'
-                         r' +(?P<time>[\d\.]+) +msecs,$')
-        p14 = re.compile(r'^SPF +throttling +maximum +wait +time +of'
-                         r' +(?P<time>[\d\.]+) +msecs$')
-        p15 = re.compile(r'^LSA +throttling +start +time +of'
-                         r' +(?P<time>[\d\.]+) +msecs,$')
-        p16 = re.compile(r'^LSA +throttling +hold +interval +of'
-                         r' +(?P<time>[\d\.]+) +msecs,$')
-        p17 = re.compile(r'^LSA +throttling +maximum +wait +time +of'
-                         r' +(?P<time>[\d\.]+) +msecs$')
-        p18 = re.compile(r'^Minimum +LSA +arrival +(?P<time>[\d\.]+) +msec$')
-        p19 = re.compile(r'^Maximum +number +of +non +self\-generated +'
-                         r'LSA +allowed +(?P<max>\d+)$')
-        p19_1 = re.compile(r'^Originating +router +LSA +with +maximum +metric$')
-        p20 = re.compile(r'^LSA +group +pacing +timer +(?P<time>\d+) +secs$')
-        p21 = re.compile(r'^Maximum paths to destination +(?P<path>\d+)$')
-        p22 = re.compile(r'^Number +of +external +LSAs +(?P<total>\d+), +'
-                         r'checksum +sum +(?P<checksum>\w+)$')
-        p23 = re.compile(r'^Number +of +opaque +AS +LSAs +(?P<total>\d+),'
-                         r' +checksum +sum +(?P<checksum>\w+)$')
-        p24 = re.compile(r'^Number +of +areas +is +(?P<total>\d+), +'
-                         r'(?P<normal>\d+) +normal, +'
-                         r'(?P<stub>\d+) +stub, +'
-                         r'(?P<nssa>\d+) +nssa$')
-        p25 = re.compile(r'^Number +of +active +areas +is +(?P<total>\d+),'
-                         r' +(?P<normal>\d+) +normal, +'
-                         r'(?P<stub>\d+) +stub, +'
-                         r'(?P<nssa>\d+) +nssa$')
-        p26 = re.compile(r'^Install +discard +route +for +'
-                         r'summarized +(?P<type>\w+) +routes.$')
-        p27 = re.compile(r'^Area +(?P<type>\w+)?\((?P<area>[\w\.\:]+)\)'
-                         r'( *\((?P<status>\w+)\))?$')
-        p34 = re.compile(r'^This +area +is +a +(?P<type>\w+) +area$')
-        p35 = re.compile(r'^Generates +stub +default +route +with +'
-                         r'cost +(?P<cost>\d+)$')
-        p28 = re.compile(r'^Area +has +existed +for +(?P<time>[\w\.\:]+)$')
-        p29 = re.compile(r'^Interfaces +in +this +area: +(?P<num1>\d+) +'
-                         r'Active +interfaces: +(?P<num2>\d+)$')
-        p30 = re.compile(r'^Passive +interfaces: +(?P<num1>\d+) +'
-                         r'Loopback +interfaces: +(?P<num2>\d+)$')
-        p31 = re.compile(r'^SPF +calculation +has +run +(?P<num1>\d+) +times$')
-        p32 = re.compile(r'^Last +SPF +ran +for +(?P<num1>[\d\.]+)s$')
-        p36 = re.compile(r'^(?P<prefix>[\d\/\.]+) +'
-                         r'(Active|Passive) +\(Num +nets: +(?P<net>\d+)\) +'
-                         r'(?P<advertise>\w+) +'
-                         r'Cost +configured +(?P<cost>\d+)$')
-        p33 = re.compile(r'^Number +of +LSAs: +(?P<num1>\d+), +'
-                         r'checksum +sum +(?P<num2>\w+)$')
-
-        p37 = re.compile(r'^Redistributing +External +Routes +from$')
-
-        p38 = re.compile(r'^(?P<redist>[\w]+)(?:-(?P<redist_id>\d+))?$')
-
-        p39 = re.compile(r'^Name +Lookup +is +(?P<name_lookup>enabled|disabled)$')
-
-        p40 = re.compile(r'^Summarization +is +(?P<summary>disabled)$')
-
-        p41 = re.compile(r'^Perform +(?P<perform_translation>\S+) +LSA +translation$')
-
-        p42 = re.compile(r'(?P<authentication>No|Message\-digest|Simple)'
-                         r'(?: +password)?(?: +authentication(?: +available)?)?$')
+        p1 = regex_engine.compile(r'^Routing +Process +(?P<instance>\d+) +'
+                                  r'with +ID +(?P<router_id>[\d\.]+) +'
+                                  r'VRF +(?P<vrf>\S+)$')
+        p2 = regex_engine.compile(r'^Routing +Process +Instance +Number'
+                                  r' +(?P<instance>\d+)$')
+        p3 = regex_engine.compile(r'^Stateful +High +Availability +(?P<enable>\w+)$')
+        p4 = regex_engine.compile(r'^Graceful\-restart +is +(?P<gr_enable>\w+)$')
+        p5 = regex_engine.compile(r'^Grace +period: +(?P<interval>\w+) +'
+                                  r'state: +(?P<state>\w+)$')
+        p6 = regex_engine.compile(r'^Last +graceful +restart +exit +status: '
+                                  r'+(?P<status>\w+).*?$')
+        p7 = regex_engine.compile(r'^Supports +only +single +TOS\(TOS0\) +routes$')
+        p8 = regex_engine.compile(r'^Supports +opaque +LSA$')
+        p9 = regex_engine.compile(r'^Administrative +distance +(?P<pref_all>\d+)$')
+        p10 = regex_engine.compile(r'^BFD +is +enabled$')
+        p11 = regex_engine.compile(r'^Reference +Bandwidth +is +(?P<bd>\d+)'
+                                   r' +(?P<unit>\w+)$')
+        p12 = regex_engine.compile(r'^SPF +throttling +delay +time +of'
+                                   r' +(?P<time>[\d\.]+) +msecs,$')
+        p13 = regex_engine.compile(r'^SPF +throttling +hold +time +of'
+                                   r' +(?P<time>[\d\.]+) +msecs,$')
+        p14 = regex_engine.compile(r'^SPF +throttling +maximum +wait +time +of'
+                                   r' +(?P<time>[\d\.]+) +msecs$')
+        p15 = regex_engine.compile(r'^LSA +throttling +start +time +of'
+                                   r' +(?P<time>[\d\.]+) +msecs,$')
+        p16 = regex_engine.compile(r'^LSA +throttling +hold +interval +of'
+                                   r' +(?P<time>[\d\.]+) +msecs,$')
+        p17 = regex_engine.compile(r'^LSA +throttling +maximum +wait +time +of'
+                                   r' +(?P<time>[\d\.]+) +msecs$')
+        p18 = regex_engine.compile(r'^Minimum +LSA +arrival +(?P<time>[\d\.]+) +msec$')
+        p19 = regex_engine.compile(r'^Maximum +number +of +non +self\-generated +'
+                                   r'LSA +allowed +(?P<max>\d+)$')
+        p19_1 = regex_engine.compile(r'^Originating +router +LSA +with +maximum +metric$')
+        p20 = regex_engine.compile(r'^LSA +group +pacing +timer +(?P<time>\d+) +secs$')
+        p21 = regex_engine.compile(r'^Maximum paths to destination +(?P<path>\d+)$')
+        p22 = regex_engine.compile(r'^Number +of +external +LSAs +(?P<total>\d+), +'
+                                   r'checksum +sum +(?P<checksum>\w+)$')
+        p23 = regex_engine.compile(r'^Number +of +opaque +AS +LSAs +(?P<total>\d+),'
+                                   r' +checksum +sum +(?P<checksum>\w+)$')
+        p24 = regex_engine.compile(r'^Number +of +areas +is +(?P<total>\d+), +'
+                                   r'(?P<normal>\d+) +normal, +'
+                                   r'(?P<stub>\d+) +stub, +'
+                                   r'(?P<nssa>\d+) +nssa$')
+        p25 = regex_engine.compile(r'^Number +of +active +areas +is +(?P<total>\d+),'
+                                   r' +(?P<normal>\d+) +normal, +'
+                                   r'(?P<stub>\d+) +stub, +'
+                                   r'(?P<nssa>\d+) +nssa$')
+        p26 = regex_engine.compile(r'^Install +discard +route +for +'
+                                   r'summarized +(?P<type>\w+) +routes.$')
+        p27 = regex_engine.compile(r'^Area +(?P<type>\w+)?\((?P<area>[\w\.\:]+)\)'
+                                   r'( *\((?P<status>\w+)\))?$')
+        p34 = regex_engine.compile(r'^This +area +is +a +(?P<type>\w+) +area$')
+        p35 = regex_engine.compile(r'^Generates +stub +default +route +with +'
+                                   r'cost +(?P<cost>\d+)$')
+        p28 = regex_engine.compile(r'^Area +has +existed +for +(?P<time>[\w\.\:]+)$')
+        p29 = regex_engine.compile(r'^Interfaces +in +this +area: +(?P<num1>\d+) +'
+                                   r'Active +interfaces: +(?P<num2>\d+)$')
+        p30 = regex_engine.compile(r'^Passive +interfaces: +(?P<num1>\d+) +'
+                                   r'Loopback +interfaces: +(?P<num2>\d+)$')
+        p31 = regex_engine.compile(r'^SPF +calculation +has +run +(?P<num1>\d+) +times$')
+        p32 = regex_engine.compile(r'^Last +SPF +ran +for +(?P<num1>[\d\.]+)s$')
+        p36 = regex_engine.compile(r'^(?P<prefix>[\d\/\.]+) +'
+                                   r'(Active|Passive) +\(Num +nets: +(?P<net>\d+)\) +'
+                                   r'(?P<advertise>\w+) +'
+                                   r'Cost +configured +(?P<cost>\d+)$')
+        p33 = regex_engine.compile(r'^Number +of +LSAs: +(?P<num1>\d+), +'
+                                   r'checksum +sum +(?P<num2>\w+)$')
+
+        p37 = regex_engine.compile(r'^Redistributing +External +Routes +from$')
+
+        p38 = regex_engine.compile(r'^(?P<redist>[\w]+)(?:-(?P<redist_id>\d+))?$')
+
+        p39 = regex_engine.compile(r'^Name +Lookup +is +(?P<name_lookup>enabled|disabled)$')
+
+        p40 = regex_engine.compile(r'^Summarization +is +(?P<summary>disabled)$')
+
+        p41 = regex_engine.compile(r'^Perform +(?P<perform_translation>\S+) +LSA +translation$')
+
+        p42 = regex_engine.compile(r'(?P<authentication>No|Message\-digest|Simple)'
+                                   r'(?: +password)?(?: +authentication(?: +available)?)?$')
         
-        p43 = re.compile(r'^Generates +NSSA +(?P<generate_nssa>[\S\s]+)$')
+        p43 = regex_engine.compile(r'^Generates +NSSA +(?P<generate_nssa>[\S\s]+)$')
 
-        p44 = re.compile(r'^This +router +is +(?P<this_router_is>[\w\s]+)(?:\.)?$')
+        p44 = regex_engine.compile(r'^This +router +is +(?P<this_router_is>[\w\s]+)(?:\.)?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -966,18 +967,18 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
         ret_dict = {}
         sub_dict = {}
 
-        p1 = re.compile(r'^(?P<interface>[\w\.\-\/]+) +\- +'
-                            r'Process +ID +(?P<instance>\S+) +'
-                            r'VRF +(?P<vrf>\S+), +'
-                            r'area +(?P<area>[\w\.]+)$')
-        p2 = re.compile(r'^LDP +Autoconfig +not +enabled$')
-        p2_1 = re.compile(r'^LDP +Autoconfig +is +enabled$')
-        p3_1 = re.compile(r'^LDP +Sync +is +enabled,'
-                            r' +(?P<req>(is|not)) +required'
-                            r'(?: +and +(?P<ach>(is|not)) +achieved)?$')
-        p3_2 = re.compile(r'^LDP +Sync +not +enabled, +not +required$')
-        p4 = re.compile(r'^State +(?P<state>\w+), +'
-                            r'Network +type +(?P<type>\w+)$')
+        p1 = regex_engine.compile(r'^(?P<interface>[\w\.\-\/]+) +\- +'
+                                      r'Process +ID +(?P<instance>\S+) +'
+                                      r'VRF +(?P<vrf>\S+), +'
+                                      r'area +(?P<area>[\w\.]+)$')
+        p2 = regex_engine.compile(r'^LDP +Autoconfig +not +enabled$')
+        p2_1 = regex_engine.compile(r'^LDP +Autoconfig +is +enabled$')
+        p3_1 = regex_engine.compile(r'^LDP +Sync +is +enabled,'
+                                      r' +(?P<req>(is|not)) +required'
+                                      r'(?: +and +(?P<ach>(is|not)) +achieved)?$')
+        p3_2 = regex_engine.compile(r'^LDP +Sync +not +enabled, +not +required$')
+        p4 = regex_engine.compile(r'^State +(?P<state>\w+), +'
+                                      r'Network +type +(?P<type>\w+)$')
         for line in out.splitlines():
             line = line.strip()
 
@@ -994,7 +995,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
                 # Determine if 'interface' or 'sham_link' or 'virtual_link'
                 if re.search('SL', interface):
                     pattern = r'(?P<link>\w+)-(?P<area_id>[\w\.\:]+)-(?P<local>[\w\.\:]+)-(?P<remote>[\w\.\:]+)'
-                    n = re.match(pattern, interface)
+                    n = regex_engine.match(pattern, interface)
                     link = str(n.groupdict()['link'])
                     area_id = str(n.groupdict()['area_id'])
                     local = str(n.groupdict()['local'])
@@ -1004,7 +1005,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
                     intf_name = local + ' ' + remote
                 elif re.search('VL', interface):
                     pattern = r'(?P<link>\w+)-(?P<area_id>[\w\.\:]+)-(?P<router_id>[\w\.\:]+)'
-                    n = re.match(pattern, interface)
+                    n = regex_engine.match(pattern, interface)
                     link = str(n.groupdict()['link'])
                     area_id = str(n.groupdict()['area_id'])
                     router_id = str(n.groupdict()['router_id'])
@@ -1160,51 +1161,51 @@ class ShowIpOspfLinksParser(MetaParser):
         # Init vars
         ret_dict = {}
         sub_dict = {}
-        p1 = re.compile(r'^Virtual +link +(?P<link>\w+) +to +router +'
-                            r'(?P<router_id>[\w\.\:]+) +is +(?P<state>\w+)$')
-        p1_1 = re.compile(r'^(?P<link>\w+)-(?P<area>[\w\.\:]+)-'
-                            r'(?P<local>[\w\.\:]+)-'
-                            r'(?P<remote>[\w\.\:]+) +'
-                            r'line +protocol +is +(?P<state>\w+)$')
-        p2 = re.compile(r'^Transit +area +(?P<transit_area_id>[\w\.\:]+), +'
-                            r'via +interface +(?P<intf>[\w\.\/\-]+), +'
-                            r'remote +addr +(?P<remote_addr>[\w\.\:]+)$')
-        p3 = re.compile(r'^Unnumbered +interface +using +IP +address +of +'
-                            r'(?P<intf>[\w\.\/\-]+) +\((?P<ip>[\w\.\:]+)\)$')
-        p4 = re.compile(r'^Process +ID +(?P<inst>\d+) +'
-                            r'VRF +(?P<vrf>\S+), +area +(?P<area>[\w\.\:]+)$')
-        p5 = re.compile(r'^State +(?P<state>\w+), +Network +type'
-                            r' +(?P<interface_type>\w+), +cost +(?P<cost>\d+)$')
-        p6 = re.compile(r'^Index +(?P<index>\d+), +'
-                            r'Transmit +delay +(?P<delay>\d+) +sec$')
-        p7 = re.compile(r'^(?P<nbr_count>\d+) +Neighbors, +'
-                            r'flooding +to +(?P<flood>\d+), '
-                            r'adjacent +with +(?P<adjacent>\d+)$')
-        p8 = re.compile(r'^Timer +intervals: +Hello +(?P<hello>\d+), +'
-                            r'Dead +(?P<dead>\d+), +Wait +(?P<wait>\d+), +'
-                            r'Retransmit +(?P<retransmit>\d+)$')
-        p9 = re.compile(r'^Hello +timer +due +in +(?P<hello_timer>[\w\.\:]+)$')
-        p10 = re.compile(r'^(?P<auth_type>[\w\-]+) +authentication(, +'
-                            r'using +(?P<key_type>(key +id|keychain)) +'
-                            r'(?P<key>\w+)( *\((?P<status>\w+)\))?)?$')
-        p11 = re.compile(r'^Number +of +opaque +link +LSAs: +(?P<count>\d+),'
-                            r' +checksum +sum +(?P<checksum>\d+)$')
-        p12 = re.compile(r'^Adjacency +Information *:?$')
-        p13 = re.compile(r'^Destination +IP +address: +(?P<dest>[\w\.\:]+)$')
-        p14 = re.compile(r'^Neighbor +(?P<nei>[\w\.\:]+), +'
-                            r'interface +address +(?P<intf_ip>[\w\.\:]+)$')
-        p15 = re.compile(r'^Process +ID +(?P<inst>\d+) +VRF +(?P<vrf>\S+), +'
-                            r'in +area +(?P<area>[\w\.\:]+) +via +interface +'
-                            r'(?P<link>\w+)-(?P<backbone>[\w\.\:]+)-'
-                            r'(?P<local>[\w\.\:]+)$')
-        p16 = re.compile(r'^-(?P<remote>[\w\.\:]+)$')
-        p17 = re.compile(r'^State +is +(?P<status>\w+), +'
-                            r'(?P<change>\d+) +state +changes, +'
-                            r'last +change +(?P<last_change>[\w\.\:]+)$')
-        p18 = re.compile(r'^Hello +options +(?P<hello>\w+), +'
-                            r'dbd +options +(?P<dbd>\w+)$')
-        p19 = re.compile(r'^Last +non\-hello +packet +received +(?P<last>[\w\.\:]+)$')
-        p20 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>[\w\.\:]+)$')
+        p1 = regex_engine.compile(r'^Virtual +link +(?P<link>\w+) +to +router +'
+                                      r'(?P<router_id>[\w\.\:]+) +is +(?P<state>\w+)$')
+        p1_1 = regex_engine.compile(r'^(?P<link>\w+)-(?P<area>[\w\.\:]+)-'
+                                      r'(?P<local>[\w\.\:]+)-'
+                                      r'(?P<remote>[\w\.\:]+) +'
+                                      r'line +protocol +is +(?P<state>\w+)$')
+        p2 = regex_engine.compile(r'^Transit +area +(?P<transit_area_id>[\w\.\:]+), +'
+                                      r'via +interface +(?P<intf>[\w\.\/\-]+), +'
+                                      r'remote +addr +(?P<remote_addr>[\w\.\:]+)$')
+        p3 = regex_engine.compile(r'^Unnumbered +interface +using +IP +address +of +'
+                                      r'(?P<intf>[\w\.\/\-]+) +\((?P<ip>[\w\.\:]+)\)$')
+        p4 = regex_engine.compile(r'^Process +ID +(?P<inst>\d+) +'
+                                      r'VRF +(?P<vrf>\S+), +area +(?P<area>[\w\.\:]+)$')
+        p5 = regex_engine.compile(r'^State +(?P<state>\w+), +Network +type'
+                                      r' +(?P<interface_type>\w+), +cost +(?P<cost>\d+)$')
+        p6 = regex_engine.compile(r'^Index +(?P<index>\d+), +'
+                                      r'Transmit +delay +(?P<delay>\d+) +sec$')
+        p7 = regex_engine.compile(r'^(?P<nbr_count>\d+) +Neighbors, +'
+                                      r'flooding +to +(?P<flood>\d+), '
+                                      r'adjacent +with +(?P<adjacent>\d+)$')
+        p8 = regex_engine.compile(r'^Timer +intervals: +Hello +(?P<hello>\d+), +'
+                                      r'Dead +(?P<dead>\d+), +Wait +(?P<wait>\d+), +'
+                                      r'Retransmit +(?P<retransmit>\d+)$')
+        p9 = regex_engine.compile(r'^Hello +timer +due +in +(?P<hello_timer>[\w\.\:]+)$')
+        p10 = regex_engine.compile(r'^(?P<auth_type>[\w\-]+) +authentication(, +'
+                                      r'using +(?P<key_type>(key +id|keychain)) +'
+                                      r'(?P<key>\w+)( *\((?P<status>\w+)\))?)?$')
+        p11 = regex_engine.compile(r'^Number +of +opaque +link +LSAs: +(?P<count>\d+),'
+                                      r' +checksum +sum +(?P<checksum>\d+)$')
+        p12 = regex_engine.compile(r'^Adjacency +Information *:?$')
+        p13 = regex_engine.compile(r'^Destination +IP +address: +(?P<dest>[\w\.\:]+)$')
+        p14 = regex_engine.compile(r'^Neighbor +(?P<nei>[\w\.\:]+), +'
+                                      r'interface +address +(?P<intf_ip>[\w\.\:]+)$')
+        p15 = regex_engine.compile(r'^Process +ID +(?P<inst>\d+) +VRF +(?P<vrf>\S+), +'
+                                      r'in +area +(?P<area>[\w\.\:]+) +via +interface +'
+                                      r'(?P<link>\w+)-(?P<backbone>[\w\.\:]+)-'
+                                      r'(?P<local>[\w\.\:]+)$')
+        p16 = regex_engine.compile(r'^-(?P<remote>[\w\.\:]+)$')
+        p17 = regex_engine.compile(r'^State +is +(?P<status>\w+), +'
+                                      r'(?P<change>\d+) +state +changes, +'
+                                      r'last +change +(?P<last_change>[\w\.\:]+)$')
+        p18 = regex_engine.compile(r'^Hello +options +(?P<hello>\w+), +'
+                                      r'dbd +options +(?P<dbd>\w+)$')
+        p19 = regex_engine.compile(r'^Last +non\-hello +packet +received +(?P<last>[\w\.\:]+)$')
+        p20 = regex_engine.compile(r'^Dead +timer +due +in +(?P<dead_timer>[\w\.\:]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1958,84 +1959,84 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
 
         # Ethernet2/2 is up, line protocol is up
         # port-channel2.100 is up, line protocol is up
-        p1 = re.compile(r'^(?P<intf>(\S+)) +is +(?P<enable>(up|down)),'
-                         r' +line +protocol +is'
-                         r' +(?P<line_protocol>(up|down))$')
+        p1 = regex_engine.compile(r'^(?P<intf>(\S+)) +is +(?P<enable>(up|down)),'
+                                   r' +line +protocol +is'
+                                   r' +(?P<line_protocol>(up|down))$')
 
         # IP address 10.2.3.2/24
-        p2_1 = re.compile(r'^IP +address +(?P<ip_address>(\S+))$')
+        p2_1 = regex_engine.compile(r'^IP +address +(?P<ip_address>(\S+))$')
 
         # IP address 192.168.246.1/24, Process ID 2 VRF default, area 0.0.0.1
-        p2_2 = re.compile(r'^IP +address +(?P<ip_address>(\S+)), +Process'
-                               r' +ID +(?P<pid>(\S+)) +VRF +(?P<vrf>(\S+)),'
-                               r' +area +(?P<area>(\S+))$')
+        p2_2 = regex_engine.compile(r'^IP +address +(?P<ip_address>(\S+)), +Process'
+                                         r' +ID +(?P<pid>(\S+)) +VRF +(?P<vrf>(\S+)),'
+                                         r' +area +(?P<area>(\S+))$')
 
         # Process ID 1 VRF default, area 0.0.0.0
         # Process ID UNDERLAY VRF default, area 0.0.0.0
-        p2_3 = re.compile(r'^Process +ID +(?P<pid>(\S+)) +VRF'
-                         r' +(?P<vrf>(\S+)), +area +(?P<area>(\S+))$')
+        p2_3 = regex_engine.compile(r'^Process +ID +(?P<pid>(\S+)) +VRF'
+                                   r' +(?P<vrf>(\S+)), +area +(?P<area>(\S+))$')
 
         # Unnumbered interface using IP address of loopback1 (10.151.22.22)
-        p3 = re.compile(r'^Unnumbered +interface +using +IP +address +of'
-                           r' +(?P<interface>(\S+))'
-                           r' +\((?P<ip_address>(\S+))\)$')
+        p3 = regex_engine.compile(r'^Unnumbered +interface +using +IP +address +of'
+                                     r' +(?P<interface>(\S+))'
+                                     r' +\((?P<ip_address>(\S+))\)$')
 
         # Enabled by interface configuration
-        p4 = re.compile(r'^Enabled +by +interface +configuration$')
+        p4 = regex_engine.compile(r'^Enabled +by +interface +configuration$')
 
         # State BDR, Network type BROADCAST, cost 1
-        p5 = re.compile(r'^State +(?P<state>(\S+)), +Network +type '
-                         r'(?P<intf_type>(\S+)), +cost +(?P<cost>(\d+))$')
+        p5 = regex_engine.compile(r'^State +(?P<state>(\S+)), +Network +type '
+                                   r'(?P<intf_type>(\S+)), +cost +(?P<cost>(\d+))$')
 
         # Index 3, Transmit delay 1 sec, Router Priority 1
-        p6_1 = re.compile(r'^Index +(?P<index>(\d+))(?:, +Transmit +delay'
-                           r' +(?P<transmit_delay>(\d+)) +sec)?(?:, +Router'
-                           r' +Priority +(?P<priority>(\d+)))?$')
+        p6_1 = regex_engine.compile(r'^Index +(?P<index>(\d+))(?:, +Transmit +delay'
+                                     r' +(?P<transmit_delay>(\d+)) +sec)?(?:, +Router'
+                                     r' +Priority +(?P<priority>(\d+)))?$')
 
         # Index 2, Passive interface
-        p6_2 = re.compile(r'^Index +(?P<index>(\d+)), +Passive +interface$')
+        p6_2 = regex_engine.compile(r'^Index +(?P<index>(\d+)), +Passive +interface$')
 
         # Designated Router ID: 10.36.3.3, address: 10.2.3.3
-        p7_1 = re.compile(r'^(D|d)esignated +(R|r)outer +(ID|Id):'
-                           r' (?P<router_id>(\S+)), +address:'
-                           r' +(?P<ip_addr>(\S+))$')
+        p7_1 = regex_engine.compile(r'^(D|d)esignated +(R|r)outer +(ID|Id):'
+                                     r' (?P<router_id>(\S+)), +address:'
+                                     r' +(?P<ip_addr>(\S+))$')
 
         # Backup Designated Router ID: 10.16.2.2, address: 10.2.3.2
-        p7_2 = re.compile(r'^(B|b)ackup +(D|d)esignated +(R|r)outer'
-                           r' +(ID|Id): +(?P<router_id>(\S+)), +address:'
-                           r' +(?P<ip_addr>(\S+))$')
+        p7_2 = regex_engine.compile(r'^(B|b)ackup +(D|d)esignated +(R|r)outer'
+                                     r' +(ID|Id): +(?P<router_id>(\S+)), +address:'
+                                     r' +(?P<ip_addr>(\S+))$')
 
         # 1 Neighbors, flooding to 1, adjacent with 1
-        p8 = re.compile(r'^(?P<num_neighbors>(\d+)) +Neighbors, +flooding'
-                         r' +to +(?P<flooding>(\d+)), +adjacent +with'
-                         r' +(?P<adjacent>(\d+))$')
+        p8 = regex_engine.compile(r'^(?P<num_neighbors>(\d+)) +Neighbors, +flooding'
+                                   r' +to +(?P<flooding>(\d+)), +adjacent +with'
+                                   r' +(?P<adjacent>(\d+))$')
 
         # Timer intervals: Hello 10, Dead 40, Wait 40, Retransmit 5
-        p9 = re.compile(r'^Timer +intervals: +Hello +(?P<hello>(\d+)),'
-                         r' +Dead +(?P<dead>(\d+)), +Wait +(?P<wait>(\d+)),'
-                         r' +Retransmit +(?P<retransmit>(\d+))$')
+        p9 = regex_engine.compile(r'^Timer +intervals: +Hello +(?P<hello>(\d+)),'
+                                   r' +Dead +(?P<dead>(\d+)), +Wait +(?P<wait>(\d+)),'
+                                   r' +Retransmit +(?P<retransmit>(\d+))$')
 
         # Hello timer due in 00:00:02
-        p10 = re.compile(r'^Hello +timer +due +in +(?P<hello>(\S+))$')
+        p10 = regex_engine.compile(r'^Hello +timer +due +in +(?P<hello>(\S+))$')
 
         # Simple authentication
         # Simple authentication, using keychain test (ready)
         # Simple authentication, using keychain test (not ready)
-        p11_1 = re.compile(r'^Simple +authentication(?:, +using +keychain'
-                            r' +(?P<keychain>(\S+))'
-                            r' +\((not +ready|ready)\))?$')
+        p11_1 = regex_engine.compile(r'^Simple +authentication(?:, +using +keychain'
+                                      r' +(?P<keychain>(\S+))'
+                                      r' +\((not +ready|ready)\))?$')
 
         # Message-digest authentication, using default key id 0
-        p11_2 = re.compile(r'^Message-digest +authentication, +using'
-                            r' +default key id +(?P<key>(\S+))$')
+        p11_2 = regex_engine.compile(r'^Message-digest +authentication, +using'
+                                      r' +default key id +(?P<key>(\S+))$')
 
         # Number of opaque link LSAs: 0, checksum sum 0
-        p12 = re.compile(r'^Number +of +opaque +link +LSAs:'
-                          r' +(?P<count>(\d+)), +checksum +sum'
-                          r' +(?P<checksum>(\d+))$')
+        p12 = regex_engine.compile(r'^Number +of +opaque +link +LSAs:'
+                                    r' +(?P<count>(\d+)), +checksum +sum'
+                                    r' +(?P<checksum>(\d+))$')
 
         # BFD is enabled
-        p13 = re.compile(r'^BFD +is +enabled$')
+        p13 = regex_engine.compile(r'^BFD +is +enabled$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2054,7 +2055,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 # Determine if 'interface' or 'sham_link' or 'virtual_link'
                 if re.search('SL', interface):
                     pattern = r'(?P<link>\w+)-(?P<area_id>[\w\.\:]+)-(?P<local>[\w\.\:]+)-(?P<remote>[\w\.\:]+)'
-                    n = re.match(pattern, interface)
+                    n = regex_engine.match(pattern, interface)
                     link = str(n.groupdict()['link'])
                     area_id = str(n.groupdict()['area_id'])
                     local = str(n.groupdict()['local'])
@@ -2064,7 +2065,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                     intf_name = local + ' ' + remote
                 elif re.search('VL', interface):
                     pattern = r'(?P<link>\w+)-(?P<area_id>[\w\.\:]+)-(?P<router_id>[\w\.\:]+)'
-                    n = re.match(pattern, interface)
+                    n = regex_engine.match(pattern, interface)
                     link = str(n.groupdict()['link'])
                     backbone_area_id = str(n.groupdict()['area_id'])
                     router_id = str(n.groupdict()['router_id'])
@@ -2474,6 +2475,30 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         'dr_ip_addr',
         'nbr_event_count']
 
+    # '| json' output is parsed with context='json'
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+    @staticmethod
+    def _link_key(interface):
+        '''Return the (type, key) the neighbor is stored under for interface:
+           interfaces, sham_links ('<local> <remote>') or
+           virtual_links ('<area> <router_id>')'''
+        # SL1-0.0.0.0-10.151.22.22-10.229.11.11
+        if re.search('SL', interface):
+            pattern = r'(?P<link>\w+)-(?P<area_id>[\w\.\:]+)-(?P<local>[\w\.\:]+)-(?P<remote>[\w\.\:]+)'
+            n = regex_engine.match(pattern, interface)
+            return 'sham_links', n.groupdict()['local'] + ' ' + \
+                n.groupdict()['remote']
+
+        # VL1-0.0.0.1-10.64.4.4
+        if re.search('VL', interface):
+            pattern = r'(?P<link>\w+)-(?P<area_id>[\w\.\:]+)-(?P<router_id>[\w\.\:]+)'
+            n = regex_engine.match(pattern, interface)
+            return 'virtual_links', n.groupdict()['area_id'] + ' ' + \
+                n.groupdict()['router_id']
+
+        return 'interfaces', interface
+
     def cli(self, vrf='', neighbor='', output=None):
         if vrf:
             if neighbor:
@@ -2494,22 +2519,22 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         # Init vars
         ret_dict = {}
         af = 'ipv4'
-        p1 = re.compile(r'^Neighbor +(?P<neighbor_router_id>(\S+)),'
-                            r' +interface +address +(?P<address>(\S+))$')
-        p2 = re.compile(r'^Process +ID +(?P<instance>(\S+)) +VRF'
-                            r' +(?P<vrf>(\S+)), +in +area +(?P<area>(\S+))'
-                            r' +via +interface +(?P<interface>(\S+))$')
-        p3 = re.compile(r'^State +is +(?P<state>(\S+)),'
-                            r' +(?P<changes>(\d+)) +state +changes,'
-                            r' +last +change +(?P<last>(\S+))$')
-        p4 = re.compile(r'^Neighbor +priority +is +(?P<priority>(\S+))$')
-        p5 = re.compile(r'^DR +is +(?P<dr_ip>(\S+)) +BDR +is'
-                            r' +(?P<bdr_ip>(\S+))$')
-        p6 = re.compile(r'^Hello +options +(?P<hello_options>(\S+)),'
-                            r' +dbd +options +(?P<dbd_options>(\S+))$')
-        p7 = re.compile(r'^Last +non-hello +packet +received'
-                            r' +(?P<non_hello>(\S+))$')
-        p8 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
+        p1 = regex_engine.compile(r'^Neighbor +(?P<neighbor_router_id>(\S+)),'
+                                      r' +interface +address +(?P<address>(\S+))$')
+        p2 = regex_engine.compile(r'^Process +ID +(?P<instance>(\S+)) +VRF'
+                                      r' +(?P<vrf>(\S+)), +in +area +(?P<area>(\S+))'
+                                      r' +via +interface +(?P<interface>(\S+))$')
+        p3 = regex_engine.compile(r'^State +is +(?P<state>(\S+)),'
+                                      r' +(?P<changes>(\d+)) +state +changes,'
+                                      r' +last +change +(?P<last>(\S+))$')
+        p4 = regex_engine.compile(r'^Neighbor +priority +is +(?P<priority>(\S+))$')
+        p5 = regex_engine.compile(r'^DR +is +(?P<dr_ip>(\S+)) +BDR +is'
+                                      r' +(?P<bdr_ip>(\S+))$')
+        p6 = regex_engine.compile(r'^Hello +options +(?P<hello_options>(\S+)),'
+                                      r' +dbd +options +(?P<dbd_options>(\S+))$')
+        p7 = regex_engine.compile(r'^Last +non-hello +packet +received'
+                                      r' +(?P<non_hello>(\S+))$')
+        p8 = regex_engine.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2555,30 +2580,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                         [instance]['areas'][area] = {}
 
                 # Determine if 'interface' or 'sham_link' or 'virtual_link'
-                if re.search('SL', interface):
-                    pattern = r'(?P<link>\w+)-(?P<area_id>[\w\.\:]+)-(?P<local>[\w\.\:]+)-(?P<remote>[\w\.\:]+)'
-                    n = re.match(pattern, interface)
-                    link = str(n.groupdict()['link'])
-                    area_id = str(n.groupdict()['area_id'])
-                    local = str(n.groupdict()['local'])
-                    remote = str(n.groupdict()['remote'])
-                    # Set values for dict
-                    intf_type = 'sham_links'
-                    intf_name = local + ' ' + remote
-
-                elif re.search('VL', interface):
-                    pattern = r'(?P<link>\w+)-(?P<area_id>[\w\.\:]+)-(?P<router_id>[\w\.\:]+)'
-                    n = re.match(pattern, interface)
-                    link = str(n.groupdict()['link'])
-                    area_id = str(n.groupdict()['area_id'])
-                    router_id = str(n.groupdict()['router_id'])
-                    # Set values for dict
-                    intf_type = 'virtual_links'
-                    intf_name = area_id + ' ' + router_id
-                else:
-                    # Set values for dict
-                    intf_type = 'interfaces'
-                    intf_name = interface
+                intf_type, intf_name = self._link_key(interface)
 
                 # Set interface/sham_link/virtual_link dict
                 if intf_type not in ret_dict['vrf'][vrf]['address_family']\
@@ -2657,6 +2659,70 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
 
         return ret_dict
 
+    def json(self, vrf='', neighbor='', output=None):
+        if vrf:
+            if neighbor:
+                cmd = self.cli_command[1].format(vrf=vrf, neighbor=neighbor)
+            else:
+                cmd = self.cli_command[0].format(vrf=vrf)
+        else:
+            if neighbor:
+                cmd = self.cli_command[2].format(neighbor=neighbor)
+            else:
+                cmd = self.cli_command[3]
+
+        if output is None:
+            out = self.device.execute(cmd + ' | json')
+        else:
+            out = output
+
+        def _time(value):
+            # "PT8H38M40S" or "08:38:40"
+            value = str(value)
+            if value.startswith('P'):
+                return Common.convert_xml_time(value)
+            return value
+
+        ret_dict = {}
+        af = 'ipv4'
+
+        for ctx_row in Common.retrieve_json_rows(
+                Common.load_json_output(out), 'TABLE_ctx'):
+            # "ptag": "1", "cname": "default"
+            instance = str(ctx_row['ptag'])
+            vrf_name = ctx_row['cname']
+
+            for nbr_row in Common.retrieve_json_rows(ctx_row, 'TABLE_nbr'):
+                intf_type, intf_name = self._link_key(nbr_row['intf'])
+
+                sub_dict = ret_dict.setdefault('vrf', {}).\
+                    setdefault(vrf_name, {}).\
+                    setdefault('address_family', {}).setdefault(af, {}).\
+                    setdefault('instance', {}).setdefault(instance, {}).\
+                    setdefault('areas', {}).setdefault(nbr_row['area'], {}).\
+                    setdefault(intf_type, {}).setdefault(intf_name, {}).\
+                    setdefault('neighbors', {}).\
+                    setdefault(nbr_row['rid'], {})
+
+                sub_dict['neighbor_router_id'] = nbr_row['rid']
+                sub_dict['address'] = nbr_row['addr']
+                sub_dict['state'] = str(nbr_row['state']).lower()
+                sub_dict['last_state_change'] = _time(nbr_row['lastchange'])
+                sub_dict['statistics'] = {
+                    'nbr_event_count': int(nbr_row['transition'])}
+                if 'priority' in nbr_row:
+                    sub_dict['priority'] = int(nbr_row['priority'])
+                if 'drip' in nbr_row:
+                    sub_dict['dr_ip_addr'] = nbr_row['drip']
+                    sub_dict['bdr_ip_addr'] = nbr_row['bdrip']
+                sub_dict['hello_options'] = nbr_row['hellooptions']
+                sub_dict['dbd_options'] = nbr_row['dbdoptions']
+                sub_dict['last_non_hello_packet_received'] = \
+                    _time(nbr_row['lastnonhello'])
+                sub_dict['dead_timer'] = _time(nbr_row['deadtimer'])
+
+        return ret_dict
+
 
 # ===================================================================
 # Super parser for 'show ip ospf database <WORD> detail [vrf <WORD>]'
@@ -2694,67 +2760,67 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
             'opaque': 10,
             }
 
-        p1 = re.compile(r'^ *OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            r' +\(Process +ID +(?P<instance>(\S+))'
-                            r' +VRF +(?P<vrf>(\S+))\)$')
-        p2 = re.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
-                            r'(?: +\(Area +(?P<area>(\S+))\))?$')
-        p3 = re.compile(r'^LS +age: +(?P<age>\d+)'
-                            r'(?P<dummy>\S+)?$')
-        p4 = re.compile(r'^Options: +(?P<option>([a-zA-Z0-9]+))(?:'
-                            r' *\((?P<option_desc>(.*))\))?$')
-        p5 = re.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
-        p36 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
-                            r'(?: +\(.*\))?$')
-        p6 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
-        p7 = re.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
-        p8 = re.compile(r'^Checksum: +(?P<checksum>(\S+))$')
-        p9 = re.compile(r'^Length: +(?P<length>(\d+))$')
-        p10 = re.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
-        p11 = re.compile(r'^Metric +Type: +2 +\(.*\)$')
-        p12_1 = re.compile(r'^TOS: +(?P<tos>(\d+))$')
-        p12_2 = re.compile(r'^TOS: +(?P<tos>(\d+)) +Metric: +(?P<metric>(\d+))$')
-        p13 = re.compile(r'^Metric: +(?P<metric>(\d+))$')
-        p14 = re.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
-        p15 = re.compile(r'^External +Route +Tag: +(?P<tag>(\S+))$')
-        p16 = re.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
-        p17 = re.compile(r'^Number +of +links: +(?P<num>(\d+))$')
-        p18 = re.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
-        p19_1 = re.compile(r'^\(Link +ID\) +Network\/Subnet +Number:'
-                            r' +(?P<link_id>(\S+))$')
-        p19_2 = re.compile(r'^\(Link +ID\) +Designated +Router +address:'
-                            r' +(?P<link_id>(\S+))$')
-        p19_3 = re.compile(r'^\(Link +ID\) +Neighboring +Router +ID:'
-                            r' +(?P<link_id>(\S+))$')
-        p20_1 = re.compile(r'^\(Link +Data\) +Network +Mask:'
-                            r' +(?P<link_data>(\S+))$')
-        p20_2 = re.compile(r'^\(Link +Data\) +Router +Interface +address:'
-                            r' +(?P<link_data>(\S+))$')
-        p21 = re.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
-        p21_1 = re.compile(r'^TOS +(?P<tos>(\d+)) +Metric: +(?P<metric>(\d+))$')
-        p22 = re.compile(r'^Opaque +Type: +(?P<type>(\d+))$')
-        p23 = re.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
-        p24 = re.compile(r'^Fragment +number: +(?P<num>(\d+))$')
-        p25 = re.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
-        p26 = re.compile(r'^Number +of +Links *: +(?P<links>(\d+))$')
-        p27 = re.compile(r'^Link +connected +to +(?P<link>(.*))$')
-        p28 = re.compile(r'^(?:Link-ID +:)? *(Link +ID|Link-ID) *:'
-                            r' +(?P<id>(\S+))$')
-        p29 = re.compile(r'^(?:Interface +Address +:)? *Interface'
-                            r' +Address *: +(?P<addr>(\S+))$')
-        p30 = re.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
-        p31 = re.compile(r'^Maximum +(B|b)andwidth *:'
-                            r' +(?P<max_band>(\d+))$')
-        p32 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
-                            r' +(?P<max_res_band>(\d+))$')
-        p33 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
-        p34 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            r' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            r' *: +(?P<band2>(\d+)))?$')
-        p35 = re.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
-                            r' +Length += +(?P<length>(\d+))'
-                            r' +Value += +(?P<value>(.*))$')
-        p40 = re.compile(r'^(?P<something>([0\s]+))$')
+        p1 = regex_engine.compile(r'^ *OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                                      r' +\(Process +ID +(?P<instance>(\S+))'
+                                      r' +VRF +(?P<vrf>(\S+))\)$')
+        p2 = regex_engine.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
+                                      r'(?: +\(Area +(?P<area>(\S+))\))?$')
+        p3 = regex_engine.compile(r'^LS +age: +(?P<age>\d+)'
+                                      r'(?P<dummy>\S+)?$')
+        p4 = regex_engine.compile(r'^Options: +(?P<option>([a-zA-Z0-9]+))(?:'
+                                      r' *\((?P<option_desc>(.*))\))?$')
+        p5 = regex_engine.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
+        p36 = regex_engine.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
+                                      r'(?: +\(.*\))?$')
+        p6 = regex_engine.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
+        p7 = regex_engine.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
+        p8 = regex_engine.compile(r'^Checksum: +(?P<checksum>(\S+))$')
+        p9 = regex_engine.compile(r'^Length: +(?P<length>(\d+))$')
+        p10 = regex_engine.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
+        p11 = regex_engine.compile(r'^Metric +Type: +2 +\(.*\)$')
+        p12_1 = regex_engine.compile(r'^TOS: +(?P<tos>(\d+))$')
+        p12_2 = regex_engine.compile(r'^TOS: +(?P<tos>(\d+)) +Metric: +(?P<metric>(\d+))$')
+        p13 = regex_engine.compile(r'^Metric: +(?P<metric>(\d+))$')
+        p14 = regex_engine.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
+        p15 = regex_engine.compile(r'^External +Route +Tag: +(?P<tag>(\S+))$')
+        p16 = regex_engine.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
+        p17 = regex_engine.compile(r'^Number +of +links: +(?P<num>(\d+))$')
+        p18 = regex_engine.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
+        p19_1 = regex_engine.compile(r'^\(Link +ID\) +Network\/Subnet +Number:'
+                                      r' +(?P<link_id>(\S+))$')
+        p19_2 = regex_engine.compile(r'^\(Link +ID\) +Designated +Router +address:'
+                                      r' +(?P<link_id>(\S+))$')
+        p19_3 = regex_engine.compile(r'^\(Link +ID\) +Neighboring +Router +ID:'
+                                      r' +(?P<link_id>(\S+))$')
+        p20_1 = regex_engine.compile(r'^\(Link +Data\) +Network +Mask:'
+                                      r' +(?P<link_data>(\S+))$')
+        p20_2 = regex_engine.compile(r'^\(Link +Data\) +Router +Interface +address:'
+                                      r' +(?P<link_data>(\S+))$')
+        p21 = regex_engine.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
+        p21_1 = regex_engine.compile(r'^TOS +(?P<tos>(\d+)) +Metric: +(?P<metric>(\d+))$')
+        p22 = regex_engine.compile(r'^Opaque +Type: +(?P<type>(\d+))$')
+        p23 = regex_engine.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
+        p24 = regex_engine.compile(r'^Fragment +number: +(?P<num>(\d+))$')
+        p25 = regex_engine.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
+        p26 = regex_engine.compile(r'^Number +of +Links *: +(?P<links>(\d+))$')
+        p27 = regex_engine.compile(r'^Link +connected +to +(?P<link>(.*))$')
+        p28 = regex_engine.compile(r'^(?:Link-ID +:)? *(Link +ID|Link-ID) *:'
+                                      r' +(?P<id>(\S+))$')
+        p29 = regex_engine.compile(r'^(?:Interface +Address +:)? *Interface'
+                                      r' +Address *: +(?P<addr>(\S+))$')
+        p30 = regex_engine.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
+        p31 = regex_engine.compile(r'^Maximum +(B|b)andwidth *:'
+                                      r' +(?P<max_band>(\d+))$')
+        p32 = regex_engine.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
+                                      r' +(?P<max_res_band>(\d+))$')
+        p33 = regex_engine.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+        p34 = regex_engine.compile(r'^Priority +(?P<num1>(\d+)) *:'
+                                      r' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+                                      r' *: +(?P<band2>(\d+)))?$')
+        p35 = regex_engine.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
+                                      r' +Length += +(?P<length>(\d+))'
+                                      r' +Value += +(?P<value>(.*))$')
+        p40 = regex_engine.compile(r'^(?P<something>([0\s]+))$')
         for line in out.splitlines():
             line = line.strip()
 
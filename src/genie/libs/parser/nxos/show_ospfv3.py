@@ -6,12 +6,12 @@ NXOS parsers for the following show commands:
 '''
 
 # Python
-import re
 from netaddr import IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =======================================================
@@ -137,34 +137,34 @@ class ShowIpv6Ospfv3NeighborsDetail(ShowIpv6Ospfv3NeighborsDetailSchema):
         ret_dict = {}
         af = 'ipv4'
         # Neighbor 1.1.1.1, interface address fe80::2de:fbff:fed4:89c7
-        p1 = re.compile(r'^Neighbor +(?P<neighbor_router_id>(\S+)),'
-                        r' +interface +address +(?P<address>(\S+))$')
+        p1 = regex_engine.compile(r'^Neighbor +(?P<neighbor_router_id>(\S+)),'
+                                  r' +interface +address +(?P<address>(\S+))$')
         # Process ID ospfv3_l3uls VRF default, in area 0.0.0.0 via interface Ethernet1/33
-        p2 = re.compile(r'^Process +ID +(?P<instance>(\S+)) +VRF'
-                        r' +(?P<vrf>(\S+)), +in +area +(?P<area>(\S+))'
-                        r' +via +interface +(?P<interface>(\S+))$')
+        p2 = regex_engine.compile(r'^Process +ID +(?P<instance>(\S+)) +VRF'
+                                  r' +(?P<vrf>(\S+)), +in +area +(?P<area>(\S+))'
+                                  r' +via +interface +(?P<interface>(\S+))$')
         # State is FULL, 5 state changes, last change 04:06:04
-        p3 = re.compile(r'^State +is +(?P<state>(\S+)),'
-                        r' +(?P<changes>(\d+)) +state +changes,'
-                        r' +last +change +(?P<last>(\S+))$')
+        p3 = regex_engine.compile(r'^State +is +(?P<state>(\S+)),'
+                                  r' +(?P<changes>(\d+)) +state +changes,'
+                                  r' +last +change +(?P<last>(\S+))$')
         # Neighbor priority is 1, Neighbor interface ID 37
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^Neighbor +priority +is +(?P<priority>(\S+)),\s+Neighbor\s+interface\s+ID\s+(?P<nbr_intf_id>(\S+))$')
         # DR is 2.2.2.2 BDR is 1.1.1.1
-        p5 = re.compile(r'^DR +is +(?P<dr_ip>(\S+)) +BDR +is'
-                        r' +(?P<bdr_ip>(\S+))$')
+        p5 = regex_engine.compile(r'^DR +is +(?P<dr_ip>(\S+)) +BDR +is'
+                                  r' +(?P<bdr_ip>(\S+))$')
         # Hello options 0x13, dbd options 0x13
-        p6 = re.compile(r'^Hello +options +(?P<hello_options>(\S+)),'
-                        r' +dbd +options +(?P<dbd_options>(\S+))$')
+        p6 = regex_engine.compile(r'^Hello +options +(?P<hello_options>(\S+)),'
+                                  r' +dbd +options +(?P<dbd_options>(\S+))$')
         # Last non-hello packet received 00:03:17
-        p7 = re.compile(r'^Last +non-hello +packet +received'
-                        r' +(?P<non_hello>(\S+))$')
+        p7 = regex_engine.compile(r'^Last +non-hello +packet +received'
+                                  r' +(?P<non_hello>(\S+))$')
         # Dead timer due in 00:00:33
-        p8 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
+        p8 = regex_engine.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
 
         # capture vl interface
         # VL1-0.0.0.1-10.64.4.4
-        vl_pattern = re.compile(r'(?P<link>\w+)-(?P<area_id>[\w\.\:]+)-(?P<router_id>[\w\.\:]+)')
+        vl_pattern = regex_engine.compile(r'(?P<link>\w+)-(?P<area_id>[\w\.\:]+)-(?P<router_id>[\w\.\:]+)')
 
         for line in out.splitlines():
             line = line.strip()
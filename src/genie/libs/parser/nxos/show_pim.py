@@ -1,6 +1,7 @@
 import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -149,7 +150,7 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
 
             # PIM6 Interface Status for VRF "VRF1"
             # PIM Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*PIM6? +Interface +Status +for +VRF+ \"(?P<vrf>[\w]+)\"$')
+            p1 = regex_engine.compile(r'^\s*PIM6? +Interface +Status +for +VRF+ \"(?P<vrf>[\w]+)\"$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -168,10 +169,10 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                 nbr_count = configured_dr_priority = neighbor_holdtime = neighbor_filter = vpc_svi =last_rest = ""
 
             # Ethernet2/2, Interface status: protocol-up/link-up/admin-up
-            p2 = re.compile(r'^\s*(?P<interface_name>[\w\/\.\-]+),'
-                            r' +Interface +status: +protocol\-(?P<oper_status>[\w]+)/'
-                            r'link\-(?P<link_status>[\w]+)/'
-                            r'admin\-(?P<admin_status>[\w]+)$')
+            p2 = regex_engine.compile(r'^\s*(?P<interface_name>[\w\/\.\-]+),'
+                                      r' +Interface +status: +protocol\-(?P<oper_status>[\w]+)/'
+                                      r'link\-(?P<link_status>[\w]+)/'
+                                      r'admin\-(?P<admin_status>[\w]+)$')
             m = p2.match(line)
             if m:
                 interface_name = m.groupdict()['interface_name']
@@ -182,16 +183,16 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
 
             # IPv6 address:
             #   10.11.33.11, IP subnet: 10.11.33.0/24
-            p3 = re.compile(r'^\s*(?P<space>\s{4})'
-                            r'(?P<address>[^Error:][\w\/\:]+)( +\[VALID\])?$')
+            p3 = regex_engine.compile(r'^\s*(?P<space>\s{4})'
+                                      r'(?P<address>[^Error:][\w\/\:]+)( +\[VALID\])?$')
             m = p3.match(line)
             if m:
                 address_list.append(m.groupdict()['address'])
 
             # PIM6 DR: fe80::5054:ff:fe89:740c, DR's priority: 1
             # PIM DR: fe80::5054:ff:fe89:740c, DR's priority: 1
-            p4 = re.compile(r'^\s*PIM6? +DR: +(?P<dr_address>[\w\:]+),'
-                            r' +DR\'s +priority: +(?P<dr_priority>[\d]+)$')
+            p4 = regex_engine.compile(r'^\s*PIM6? +DR: +(?P<dr_address>[\w\:]+),'
+                                      r' +DR\'s +priority: +(?P<dr_priority>[\d]+)$')
             m = p4.match(line)
             if m:
                 dr_address = m.groupdict()['dr_address']
@@ -199,7 +200,7 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
 
             # PIM6 neighbor count: 1
             # PIM neighbor count: 1
-            p5 = re.compile(r'^\s*PIM6? +neighbor +count: +(?P<nbr_count>[\d]+)$')
+            p5 = regex_engine.compile(r'^\s*PIM6? +neighbor +count: +(?P<nbr_count>[\d]+)$')
 
             m = p5.match(line)
             if m:
@@ -207,114 +208,114 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
 
             # PIM6 hello interval: 45 secs (configured 44444 ms), next hello sent in: 00:00:05
             # PIM hello interval: 45 secs (configured 44444 ms), next hello sent in: 00:00:05
-            p6 = re.compile(r'^\s*PIM6? +hello +interval: +(?P<hello_interval>[\d]+) +secs'
-                            r'( +\(configured +(?P<configured_interval_ms>\d+) +ms\))?,'
-                            r' +next +hello +sent +in: +(?P<hello_expiration>[\w\:]+)$')
+            p6 = regex_engine.compile(r'^\s*PIM6? +hello +interval: +(?P<hello_interval>[\d]+) +secs'
+                                      r'( +\(configured +(?P<configured_interval_ms>\d+) +ms\))?,'
+                                      r' +next +hello +sent +in: +(?P<hello_expiration>[\w\:]+)$')
             m = p6.match(line)
             if m:
                 hello_interval = m.groupdict()['hello_interval']
                 hello_expiration = m.groupdict()['hello_expiration']
 
             # PIM6 neighbor holdtime: 159 secs
-            p7 = re.compile(r'^\s*PIM6? +neighbor +holdtime: +(?P<holdtime>[\d]+) +secs$')
+            p7 = regex_engine.compile(r'^\s*PIM6? +neighbor +holdtime: +(?P<holdtime>[\d]+) +secs$')
             m = p7.match(line)
             if m:
                 neighbor_holdtime = m.groupdict()['holdtime']
 
             # PIM6 configured DR priority: 144
             # PIM configured DR priority: 144
-            p8 = re.compile(r'^\s*PIM6? +configured +DR +priority: +(?P<configured_dr_priority>[\d]+)$')
+            p8 = regex_engine.compile(r'^\s*PIM6? +configured +DR +priority: +(?P<configured_dr_priority>[\d]+)$')
             m = p8.match(line)
             if m:
                 configured_dr_priority = m.groupdict()['configured_dr_priority']
 
             # PIM6 configured DR delay: 3 secs
             # PIM configured DR delay: 3 secs
-            p9 = re.compile(r'^\s*PIM6? +configured +DR +delay: +(?P<configured_dr_delay>[\d]+) +secs$')
+            p9 = regex_engine.compile(r'^\s*PIM6? +configured +DR +delay: +(?P<configured_dr_delay>[\d]+) +secs$')
             m = p9.match(line)
             if m:
                 configured_dr_delay = m.groupdict()['configured_dr_delay']
 
             # PIM6 border interface: yes
             # PIM border interface: yes
-            p10 = re.compile(r'^\s*PIM6? +border +interface: +(?P<border_interface>[\w]+)$')
+            p10 = regex_engine.compile(r'^\s*PIM6? +border +interface: +(?P<border_interface>[\w]+)$')
             m = p10.match(line)
             if m:
                 bsr_border = m.groupdict()['border_interface']
 
             # PIM6 GenID sent in Hellos: 0x26fae674
             # PIM GenID sent in Hellos: 0x26fae674
-            p11 = re.compile(r'^\s*PIM6? +GenID +sent +in +Hellos: +(?P<genid>[\S]+)$')
+            p11 = regex_engine.compile(r'^\s*PIM6? +GenID +sent +in +Hellos: +(?P<genid>[\S]+)$')
             m = p11.match(line)
             if m:
                 genid = m.groupdict()['genid']
 
             # PIM6 Hello MD5-AH Authentication: disabled
             # PIM Hello MD5-AH Authentication: disabled
-            p12 = re.compile(r'^\s*PIM6? +Hello +MD5-AH +Authentication: +(?P<md5_authentication>[\w]+)$')
+            p12 = regex_engine.compile(r'^\s*PIM6? +Hello +MD5-AH +Authentication: +(?P<md5_authentication>[\w]+)$')
             m = p12.match(line)
             if m:
                 hello_md5_ah_authentication = m.groupdict()['md5_authentication']
 
             # PIM6 Neighbor policy: v4neighbor-policy
             # PIM Neighbor policy: v4neighbor-policy
-            p13 = re.compile(r'^\s*PIM6? +Neighbor +policy: +(?P<nbr_policy>(?!none +configured)[\w\-\s]+)$')
+            p13 = regex_engine.compile(r'^\s*PIM6? +Neighbor +policy: +(?P<nbr_policy>(?!none +configured)[\w\-\s]+)$')
             m = p13.match(line)
             if m:
                 neighbor_filter = m.groupdict()['nbr_policy']
 
             # PIM6 Join-Prune inbound policy: v4jp-policy
             # PIM Join-Prune inbound policy: v4jp-policy
-            p14 = re.compile(r'^\s*PIM6? +Join-Prune +inbound +policy: +(?P<jp_inbound_policy>(?!none)[\w\-\s]+)$')
+            p14 = regex_engine.compile(r'^\s*PIM6? +Join-Prune +inbound +policy: +(?P<jp_inbound_policy>(?!none)[\w\-\s]+)$')
             m = p14.match(line)
             if m:
                 jp_inbound_policy = m.groupdict()['jp_inbound_policy']
 
             # PIM6 Join-Prune outbound policy: v4jp-policy
             # PIM Join-Prune outbound policy: v4jp-policy
-            p15 = re.compile(r'^\s*PIM6? +Join-Prune +outbound +policy: +(?P<jp_outbound_policy>(?!none)[\w\-\s]+)$')
+            p15 = regex_engine.compile(r'^\s*PIM6? +Join-Prune +outbound +policy: +(?P<jp_outbound_policy>(?!none)[\w\-\s]+)$')
             m = p15.match(line)
             if m:
                 jp_outbound_policy = m.groupdict()['jp_outbound_policy']
 
             # PIM6 Join-Prune interval: 1 minutes
             # PIM Join-Prune interval: 1 minutes
-            p16 = re.compile(r'^\s*PIM6? +Join-Prune +interval: +(?P<jp_interval>[\d]+) +minutes$')
+            p16 = regex_engine.compile(r'^\s*PIM6? +Join-Prune +interval: +(?P<jp_interval>[\d]+) +minutes$')
             m = p16.match(line)
             if m:
                 jp_interval = m.groupdict()['jp_interval']
 
             # PIM6 Join-Prune next sending: 1 minutes
             # PIM Join-Prune next sending: 1 minutes
-            p17 = re.compile(r'^\s*PIM6? +Join-Prune +next +sending: +(?P<jp_next_sending>[\d]+) +minutes$')
+            p17 = regex_engine.compile(r'^\s*PIM6? +Join-Prune +next +sending: +(?P<jp_next_sending>[\d]+) +minutes$')
             m = p17.match(line)
             if m:
                 jp_next_sending = m.groupdict()['jp_next_sending']
 
             # PIM6 BFD enabled: no
             # PIM BFD enabled: no
-            p18 = re.compile(r'^\s*PIM6? +BFD +enabled: +(?P<bfd_enabled>[\w]+)$')
+            p18 = regex_engine.compile(r'^\s*PIM6? +BFD +enabled: +(?P<bfd_enabled>[\w]+)$')
             m = p18.match(line)
             if m:
                 bfd = m.groupdict()['bfd_enabled']
 
             # PIM6 passive interface: no
             # PIM passive interface: no
-            p19 = re.compile(r'^\s*PIM6? +passive +interface: +(?P<passive>[\w]+)$')
+            p19 = regex_engine.compile(r'^\s*PIM6? +passive +interface: +(?P<passive>[\w]+)$')
             m = p19.match(line)
             if m:
                 passive = m.groupdict()['passive']
 
             # PIM6 VPC SVI: no
             # PIM VPC SVI: no
-            p20 = re.compile(r'^\s*PIM6? +VPC +SVI: +(?P<vpc_svi>[\w]+)$')
+            p20 = regex_engine.compile(r'^\s*PIM6? +VPC +SVI: +(?P<vpc_svi>[\w]+)$')
             m = p20.match(line)
             if m:
                 vpc_svi = m.groupdict()['vpc_svi']
 
             # PIM6 Auto Enabled: no
             # PIM Auto Enabled: no
-            p21 = re.compile(r'^\s*PIM6? +Auto +Enabled: +(?P<auto_enabled>[\w]+)$')
+            p21 = regex_engine.compile(r'^\s*PIM6? +Auto +Enabled: +(?P<auto_enabled>[\w]+)$')
             m = p21.match(line)
             if m:
                 auto_enabled = m.groupdict()['auto_enabled']
@@ -323,7 +324,7 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
             # PIM Interface Statistics, last reset: never
             # PIM6 Interface Statistics
             # PIM Interface Statistics
-            p22 = re.compile(r'^\s*PIM6? +Interface +Statistics+(, +last +reset: +(?P<last_reset>[\w\:]+))?$')
+            p22 = regex_engine.compile(r'^\s*PIM6? +Interface +Statistics+(, +last +reset: +(?P<last_reset>[\w\:]+))?$')
             m = p22.match(line)
             if m:
                 statistic = True
@@ -331,10 +332,10 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                     last_rest = m.groupdict()['last_reset']
 
             # Hellos: 360/474 (early: 0), JPs: 0/0, Asserts: 0/0
-            p23 = re.compile(r'^\s*Hellos: +(?P<hellos>[\d\/]+)'
-                             r'( +\(early: +(?P<early>\d+)\))?,'
-                             r' +JPs: +(?P<jps>[\d\/]+),'
-                             r' +Asserts: +(?P<asserts>[\d\/]+)$')
+            p23 = regex_engine.compile(r'^\s*Hellos: +(?P<hellos>[\d\/]+)'
+                                       r'( +\(early: +(?P<early>\d+)\))?,'
+                                       r' +JPs: +(?P<jps>[\d\/]+),'
+                                       r' +Asserts: +(?P<asserts>[\d\/]+)$')
             m = p23.match(line)
             if m:
                 hellos = m.groupdict()['hellos']
@@ -342,18 +343,18 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                 asserts = m.groupdict()['asserts']
 
             # Grafts: 0/0, Graft-Acks: 0/0
-            p24 = re.compile(r'^\s*Grafts: +(?P<grafts>[\d\/]+),'
-                             r' +Graft-Acks: +(?P<graft_acks>[\d\/]+)$')
+            p24 = regex_engine.compile(r'^\s*Grafts: +(?P<grafts>[\d\/]+),'
+                                       r' +Graft-Acks: +(?P<graft_acks>[\d\/]+)$')
             m = p24.match(line)
             if m:
                 grafts = m.groupdict()['grafts']
                 graft_acks = m.groupdict()['graft_acks']
 
             # DF-Offers: 0/0, DF-Winners: 0/0, DF-Backoffs: 0/0, DF-Passes: 0/0
-            p25 = re.compile(r'^\s*DF-Offers: +(?P<df_offers>[\d\/]+),'
-                             r' +DF-Winners: +(?P<df_winners>[\d\/]+),'
-                             r' +DF-Backoffs: +(?P<df_backoffs>[\d\/]+),'
-                             r' +DF-Passes: +(?P<df_passes>[\d\/]+)$')
+            p25 = regex_engine.compile(r'^\s*DF-Offers: +(?P<df_offers>[\d\/]+),'
+                                       r' +DF-Winners: +(?P<df_winners>[\d\/]+),'
+                                       r' +DF-Backoffs: +(?P<df_backoffs>[\d\/]+),'
+                                       r' +DF-Passes: +(?P<df_passes>[\d\/]+)$')
             m = p25.match(line)
             if m:
                 df_offers = m.groupdict()['df_offers']
@@ -362,9 +363,9 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                 df_passes = m.groupdict()['df_passes']
 
             #    Checksum errors: 0, Invalid packet types/DF subtypes: 0/0
-            p26 = re.compile(r'^\s*Checksum errors: +(?P<checksum>[\d]+),'
-                             r' +Invalid +packet +types\/DF +subtypes:'
-                             r' +(?P<invalid_packet_types>[\d]+)/(?P<invalid_df_subtypes>[\d]+)$')
+            p26 = regex_engine.compile(r'^\s*Checksum errors: +(?P<checksum>[\d]+),'
+                                       r' +Invalid +packet +types\/DF +subtypes:'
+                                       r' +(?P<invalid_packet_types>[\d]+)/(?P<invalid_df_subtypes>[\d]+)$')
             m = p26.match(line)
             if m:
                 checksum = m.groupdict()['checksum']
@@ -372,15 +373,15 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                 invalid_df_subtypes = m.groupdict()['invalid_df_subtypes']
 
             #    Authentication failed: 0
-            p27 = re.compile(r'^\s*Authentication +failed: +(?P<authentication_failed>[\d]+)$')
+            p27 = regex_engine.compile(r'^\s*Authentication +failed: +(?P<authentication_failed>[\d]+)$')
             m = p27.match(line)
             if m:
                 authentication_failed = m.groupdict()['authentication_failed']
 
             #    Packet length errors: 0, Bad version packets: 0, Packets from self: 0
-            p28 = re.compile(r'^\s*Packet +length +errors: +(?P<packet_length_errors>[\d]+),'
-                             r' +Bad +version +packets: +(?P<bad_version_packets>[\d]+),'
-                             r' +Packets +from +self: +(?P<packets_from_self>[\d]+)$')
+            p28 = regex_engine.compile(r'^\s*Packet +length +errors: +(?P<packet_length_errors>[\d]+),'
+                                       r' +Bad +version +packets: +(?P<bad_version_packets>[\d]+),'
+                                       r' +Packets +from +self: +(?P<packets_from_self>[\d]+)$')
             m = p28.match(line)
             if m:
                 packet_length_errors = m.groupdict()['packet_length_errors']
@@ -388,51 +389,51 @@ class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
                 packets_from_self = m.groupdict()['packets_from_self']
 
             #    Packets from non-neighbors: 0
-            p29 = re.compile(r'^\s*Packets +from +non\-neighbors: +(?P<packets_from_non_neighbors>[\d]+)$')
+            p29 = regex_engine.compile(r'^\s*Packets +from +non\-neighbors: +(?P<packets_from_non_neighbors>[\d]+)$')
             m = p29.match(line)
             if m:
                 packets_from_non_neighbors = m.groupdict()['packets_from_non_neighbors']
 
             #    Packets received on passiveinterface: 0
-            p30 = re.compile(r'^\s*Packets +received +on +passiveinterface:'
-                             r' +(?P<packets_received_on_passiveinterface>[\d]+)$')
+            p30 = regex_engine.compile(r'^\s*Packets +received +on +passiveinterface:'
+                                       r' +(?P<packets_received_on_passiveinterface>[\d]+)$')
             m = p30.match(line)
             if m:
                 packets_received_on_passiveinterface = m.groupdict()['packets_received_on_passiveinterface']
 
             #    JPs received on RPF-interface: 0
-            p31 = re.compile(r'^\s*JPs +received +on +RPF\-interface:'
-                             r' +(?P<jp_received_on_rpf_interface>[\d]+)$')
+            p31 = regex_engine.compile(r'^\s*JPs +received +on +RPF\-interface:'
+                                       r' +(?P<jp_received_on_rpf_interface>[\d]+)$')
             m = p31.match(line)
             if m:
                 jps_received_on_rpf_interface = m.groupdict()['jp_received_on_rpf_interface']
 
             #    (*,G) Joins received with no/wrong RP: 0/0
-            p32 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*]+) +Joins +received +with +no\/+wrong RP:'
-                             r' +(?P<joins_received_with_no_rp>\d+)/(?P<joins_received_with_wrong_rp>\d+)$')
+            p32 = regex_engine.compile(r'^\s*(?P<s_g>[\w\(\)\,\*]+) +Joins +received +with +no\/+wrong RP:'
+                                       r' +(?P<joins_received_with_no_rp>\d+)/(?P<joins_received_with_wrong_rp>\d+)$')
             m = p32.match(line)
             if m:
                 joins_received_with_no_rp = m.groupdict()['joins_received_with_no_rp']
                 joins_received_with_wrong_rp = m.groupdict()['joins_received_with_wrong_rp']
 
             #  (*,G)/(S,G) JPs received for SSM/Bidir groups: 0/0
-            p33 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*\/]+) +JPs +received +for +SSM\/Bidir +groups:'
-                             r' +(?P<joins_received_with_ssm_groups>\d+)/(?P<joins_received_with_bidir_groups>\d+)$')
+            p33 = regex_engine.compile(r'^\s*(?P<s_g>[\w\(\)\,\*\/]+) +JPs +received +for +SSM\/Bidir +groups:'
+                                       r' +(?P<joins_received_with_ssm_groups>\d+)/(?P<joins_received_with_bidir_groups>\d+)$')
             m = p33.match(line)
             if m:
                 joins_received_with_ssm_groups = m.groupdict()['joins_received_with_ssm_groups']
                 joins_received_with_bidir_groups = m.groupdict()['joins_received_with_bidir_groups']
 
             # JPs filtered by inbound policy: 0
-            p34 = re.compile(r'^\s*JPs +filtered +by +inbound +policy:'
-                             r' +(?P<jps_filtered_by_inbound_policy>\d+)$')
+            p34 = regex_engine.compile(r'^\s*JPs +filtered +by +inbound +policy:'
+                                       r' +(?P<jps_filtered_by_inbound_policy>\d+)$')
             m = p34.match(line)
             if m:
                 jps_filtered_by_inbound_policy = m.groupdict()['jps_filtered_by_inbound_policy']
 
             # JPs filtered by outbound policy: 0
-            p35 = re.compile(r'^\s*JPs +filtered +by +outbound +policy:'
-                             r' +(?P<jps_filtered_by_outbound_policy>\d+)$')
+            p35 = regex_engine.compile(r'^\s*JPs +filtered +by +outbound +policy:'
+                                       r' +(?P<jps_filtered_by_outbound_policy>\d+)$')
             m = p35.match(line)
             if m:
                 jps_filtered_by_outbound_policy = m.groupdict()['jps_filtered_by_outbound_policy']
@@ -817,7 +818,7 @@ class ShowPimRp(ShowPimRpSchema):
 
             # PIM6 RP Status Information for VRF "VRF1"
             # PIM RP Status Information for VRF "VRF1"
-            p1 = re.compile(r'^\s*(PIM6|PIM) +RP +Status +Information +for +VRF +\"(?P<vrf_name>[\w\S]+)\"$')
+            p1 = regex_engine.compile(r'^\s*(PIM6|PIM) +RP +Status +Information +for +VRF +\"(?P<vrf_name>[\w\S]+)\"$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -830,8 +831,8 @@ class ShowPimRp(ShowPimRpSchema):
 
             # BSR: Not Operational
             # BSR: 10.1.5.1*, next Bootstrap message in: 00:00:01,
-            p2 = re.compile(r'^\s*BSR: +(?P<bsr>[\w\S]+)'
-                            r'(, +next +Bootstrap +message +in: +(?P<next_bsr_message>[\w\S]+),)?$')
+            p2 = regex_engine.compile(r'^\s*BSR: +(?P<bsr>[\w\S]+)'
+                                      r'(, +next +Bootstrap +message +in: +(?P<next_bsr_message>[\w\S]+),)?$')
             m = p2.match(line)
             if m:
                 bsr = m.groupdict()['bsr'].replace('*','')
@@ -876,9 +877,9 @@ class ShowPimRp(ShowPimRpSchema):
 
 
             # BSR: 10.1.5.5, uptime: 18:04:20, expires: 00:01:50,
-            p2_1 = re.compile(r'^\s*BSR(\:)? +(?P<bsr_candidate>[\w\s\.\*\:]+)'
-                            r', +uptime: +(?P<bsr_uptime>[\w\.\:]+)'
-                            r', +expires: +(?P<bsr_expires>[\w\.\:]+),$')
+            p2_1 = regex_engine.compile(r'^\s*BSR(\:)? +(?P<bsr_candidate>[\w\s\.\*\:]+)'
+                                      r', +uptime: +(?P<bsr_uptime>[\w\.\:]+)'
+                                      r', +expires: +(?P<bsr_expires>[\w\.\:]+),$')
             m = p2_1.match(line)
             if m:
                 bsr_candidate = m.groupdict()['bsr_candidate'].replace('*', '')
@@ -925,14 +926,14 @@ class ShowPimRp(ShowPimRpSchema):
 
 
             # Auto-RP disabled
-            p3 = re.compile(r'^\s*Auto-RP +disabled$')
+            p3 = regex_engine.compile(r'^\s*Auto-RP +disabled$')
             m = p3.match(line)
             if m:
                 continue
 
             # Auto-RP RPA: 10.229.11.11*, next Discovery message in: 00:00:15
-            p3 = re.compile(r'^\s*Auto-RP RPA: +(?P<auto_rp_address>[\w\S]+),'
-                            r' +next +[d|D]iscovery +message +in: +(?P<next_discory_message>[\w\S]+)$')
+            p3 = regex_engine.compile(r'^\s*Auto-RP RPA: +(?P<auto_rp_address>[\w\S]+),'
+                                      r' +next +[d|D]iscovery +message +in: +(?P<next_discory_message>[\w\S]+)$')
             m = p3.match(line)
             if m:
                 auto_rp_address = m.groupdict()['auto_rp_address'].replace('*','')
@@ -959,7 +960,7 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
             # BSR RP Candidate policy: None
-            p4 = re.compile(r'^\s*BSR +RP +Candidate +policy: +(?P<bsr_rp_candidate_policy>[\w\S]+)$')
+            p4 = regex_engine.compile(r'^\s*BSR +RP +Candidate +policy: +(?P<bsr_rp_candidate_policy>[\w\S]+)$')
             m = p4.match(line)
             if m and bsr:
                 rp_candidate_policy = None if m.groupdict()['bsr_rp_candidate_policy'].lower() == 'none' \
@@ -971,7 +972,7 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
             # BSR RP policy: None
-            p5 = re.compile(r'^\s*BSR +RP +policy: +(?P<bsr_rp_policy>[\w\S]+)$')
+            p5 = regex_engine.compile(r'^\s*BSR +RP +policy: +(?P<bsr_rp_policy>[\w\S]+)$')
             m = p5.match(line)
             if m and bsr:
                 rp_policy = "" if m.groupdict()['bsr_rp_policy'].lower() == 'none' \
@@ -983,7 +984,7 @@ class ShowPimRp(ShowPimRpSchema):
 
 
             # Auto-RP Announce policy: None
-            p6 = re.compile(r'^\s*Auto\-RP +Announce +policy: +(?P<auto_rp_announce_policy>[\w\S]+)$')
+            p6 = regex_engine.compile(r'^\s*Auto\-RP +Announce +policy: +(?P<auto_rp_announce_policy>[\w\S]+)$')
             m = p6.match(line)
             if m and auto_rp_address:
                 announce_policy = "" if m.groupdict()['auto_rp_announce_policy'].lower() \
@@ -997,7 +998,7 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
             # Auto-RP Discovery policy: None
-            p7 = re.compile(r'^\s*Auto\-RP +Discovery +policy: +(?P<auto_rp_discovery_policy>[\w\S]+)$')
+            p7 = regex_engine.compile(r'^\s*Auto\-RP +Discovery +policy: +(?P<auto_rp_discovery_policy>[\w\S]+)$')
             m = p7.match(line)
             if m and auto_rp_address:
                 discovery_policy = "" if m.groupdict()['auto_rp_discovery_policy'].lower() == 'none' else \
@@ -1010,7 +1011,7 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
             # Anycast-RP 10.111.111.111 members:
-            p11 = re.compile(r'^\s*Anycast\-RP +(?P<anycast_rp>[\w\d\S]+) +members:$')
+            p11 = regex_engine.compile(r'^\s*Anycast\-RP +(?P<anycast_rp>[\w\d\S]+) +members:$')
             m = p11.match(line)
             if m:
                 anycast_rp = m.groupdict()['anycast_rp']
@@ -1027,7 +1028,7 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
             # 10.1.2.1*  10.1.5.1
-            p11_1 = re.compile(r'^(?P<anycast_rp_members>[\w\.\:\*\s]+)$')
+            p11_1 = regex_engine.compile(r'^(?P<anycast_rp_members>[\w\.\:\*\s]+)$')
             m = p11_1.match(line)
             if m and flag:
                 anycast_rp_members_list = m.groupdict()['anycast_rp_members'].split()
@@ -1055,9 +1056,9 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
             # RP: 10.21.33.33, (0), uptime: 03:52:52, expires: never,
-            p8 = re.compile(r'^\s*RP: +(?P<rp>[\w\d\S]+), +\(+(?P<df_ordinal>[\d\S]+)+\),'
-                            r' +uptime: +(?P<uptime>[\w\.\:]+),'
-                            r' +expires: +(?P<expires>[\w\d\S][^,]+)(?P<comma>[\,]+)?$')
+            p8 = regex_engine.compile(r'^\s*RP: +(?P<rp>[\w\d\S]+), +\(+(?P<df_ordinal>[\d\S]+)+\),'
+                                      r' +uptime: +(?P<uptime>[\w\.\:]+),'
+                                      r' +expires: +(?P<expires>[\w\d\S][^,]+)(?P<comma>[\,]+)?$')
             m = p8.match(line)
             if m:
                 rp_dict = parsed_output.setdefault('vrf', {}).setdefault(vrf_name, {})\
@@ -1072,7 +1073,7 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
             # RP: 10.115.55.51, (0), 
-            p8_1 = re.compile(r'^\s*RP: +(?P<rp>[\w\d\S]+), +\(+(?P<df_ordinal>[\d\S]+)+\),$')
+            p8_1 = regex_engine.compile(r'^\s*RP: +(?P<rp>[\w\d\S]+), +\(+(?P<df_ordinal>[\d\S]+)+\),$')
             m = p8_1.match(line)
             if m:
                 rp_dict = parsed_output.setdefault('vrf', {}).setdefault(vrf_name, {})\
@@ -1086,9 +1087,9 @@ class ShowPimRp(ShowPimRpSchema):
 
             # uptime: 1d13h   priority: 255, 
             # uptime: 2d21h, (A) (B),  priority: 192
-            p8_2 = re.compile(r'^\s*uptime: +(?P<uptime>[\w\.\:]+),?'
-                               r'( +(?P<modes>( *\(\w\)){0,3}),)? '
-                               r'+priority: +(?P<priority>\d+),?$')
+            p8_2 = regex_engine.compile(r'^\s*uptime: +(?P<uptime>[\w\.\:]+),?'
+                                         r'( +(?P<modes>( *\(\w\)){0,3}),)? '
+                                         r'+priority: +(?P<priority>\d+),?$')
             m = p8_2.match(line)
             if m:
                 uptime = m.groupdict()['uptime']
@@ -1098,8 +1099,8 @@ class ShowPimRp(ShowPimRpSchema):
             # RP-source: (local), 
             # RP-source: (local), group-map: BIDIR_SPARSE1, 
             # RP-source: (local), Null-Register Packing disabled
-            p8_3 = re.compile(r'^\s*RP\-source:( +(?P<rp_source>\S+))? +\(+(?P<info_source_type>\w+)+\),'
-                              r' *(group-map: +(?P<route_map>[\w\-]+),|Null-Register Packing disabled)?$')
+            p8_3 = regex_engine.compile(r'^\s*RP\-source:( +(?P<rp_source>\S+))? +\(+(?P<info_source_type>\w+)+\),'
+                                        r' *(group-map: +(?P<route_map>[\w\-]+),|Null-Register Packing disabled)?$')
             m = p8_3.match(line)
             if m:
                 code = None
@@ -1116,10 +1117,10 @@ class ShowPimRp(ShowPimRpSchema):
 
             # RP-source: 10.16.2.2 (A), 10.16.2.2 (B),
             # RP-source: 10.144.6.6 (A), 10.16.2.2 (B), (local), 
-            p8_4 = re.compile(r'^\s*RP\-source: +(?P<rp_source>\S+) +\(+(?P<info_source_type>\w+)+\),')
+            p8_4 = regex_engine.compile(r'^\s*RP\-source: +(?P<rp_source>\S+) +\(+(?P<info_source_type>\w+)+\),')
             m = p8_4.match(line)
             if m:
-                p = re.compile(r'(?P<rp_source>\S+) +(?P<info_source_type>[\w\(\)\,\s]+),')
+                p = regex_engine.compile(r'(?P<rp_source>\S+) +(?P<info_source_type>[\w\(\)\,\s]+),')
                 m = p.findall(line)
                 info_source_type_conversions = []
                 rp_sources = []
@@ -1139,7 +1140,7 @@ class ShowPimRp(ShowPimRpSchema):
 
             # group ranges:
             line = line.strip()
-            p8_4 = re.compile(r'^group +ranges:$')
+            p8_4 = regex_engine.compile(r'^group +ranges:$')
             m = p8_4.match(line)
             if m:
                 route_map = None
@@ -1149,10 +1150,10 @@ class ShowPimRp(ShowPimRpSchema):
             #  priority: 0, RP-source: (local), group ranges:
             #  priority: 92, RP-source: 10.1.5.1 (B), group ranges:
             #  priority: 0, RP-source: (local), group-map: PIM6-STATIC-RP, group ranges:
-            p9 = re.compile(r'^\s*priority: +(?P<priority>\d+),'
-                            r' +RP\-source:( +(?P<rp_source>[\w\S]+))? +\(+(?P<info_source_type>\w+)+\),'
-                            r'( *group-map: +(?P<route_map>\S+),)?'
-                            r' +group +ranges:$')
+            p9 = regex_engine.compile(r'^\s*priority: +(?P<priority>\d+),'
+                                      r' +RP\-source:( +(?P<rp_source>[\w\S]+))? +\(+(?P<info_source_type>\w+)+\),'
+                                      r'( *group-map: +(?P<route_map>\S+),)?'
+                                      r' +group +ranges:$')
             m = p9.match(line)
             if m:
                 connection_flag = True
@@ -1176,9 +1177,9 @@ class ShowPimRp(ShowPimRpSchema):
             #      233.0.0.0/24  (bidir)
             #      ff1e::3002/128 ff1e::3001/128
             # 226.0.0.0/8   (bidir)  ,  expires: 00:02:24 (A)
-            p10 = re.compile(r'^\s*(?P<group_ranges>[\w\/\.\:\s]+)'
-                             r'( +\((?P<bidir>\w+)\))?'
-                             r'( *, *expires: (?P<expires>[\w\.\:]+)( *\((?P<code>\w+)\))?)?$')
+            p10 = regex_engine.compile(r'^\s*(?P<group_ranges>[\w\/\.\:\s]+)'
+                                       r'( +\((?P<bidir>\w+)\))?'
+                                       r'( *, *expires: (?P<expires>[\w\.\:]+)( *\((?P<code>\w+)\))?)?$')
             m = p10.match(line)
             if m and connection_flag:
                 expire_dict = {}
@@ -1316,8 +1317,8 @@ class ShowPimRp(ShowPimRpSchema):
                 continue
 
             #    priority: 111, hash-length: 30
-            p13 = re.compile(r'^\s*priority: +(?P<priority>\d+),'
-                             r' +hash-length: +(?P<hash_length>\d+)$')
+            p13 = regex_engine.compile(r'^\s*priority: +(?P<priority>\d+),'
+                                       r' +hash-length: +(?P<hash_length>\d+)$')
             m = p13.match(line)
             if m:
                 bsr_prioprity = int(m.groupdict()['priority'])
@@ -1448,8 +1449,8 @@ class ShowIpv6PimDf(ShowIpv6PimDfSchema):
                 continue
 
             # Bidir-PIM6 Designated Forwarder Information for VRF "default"
-            p1 = re.compile(r'^\s*Bidir-PIM6 +Designated +Forwarder'
-                            r' +Information +for +VRF \"(?P<vrf>[\w]+)\"$')
+            p1 = regex_engine.compile(r'^\s*Bidir-PIM6 +Designated +Forwarder'
+                                      r' +Information +for +VRF \"(?P<vrf>[\w]+)\"$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -1457,7 +1458,7 @@ class ShowIpv6PimDf(ShowIpv6PimDfSchema):
 
             # RP Address (ordinal)   RP Metric       Group Range
             # 2001:db8:1:1::1 (8)
-            p2 = re.compile(r'^\s*(?P<rp_address>[\w\:\.]+) +\((?P<ordinal>\d+)\)$')
+            p2 = regex_engine.compile(r'^\s*(?P<rp_address>[\w\:\.]+) +\((?P<ordinal>\d+)\)$')
             m = p2.match(line)
             if m:
                 metrics_pref = metrics = group_range = interface = df_address = interface_state \
@@ -1466,8 +1467,8 @@ class ShowIpv6PimDf(ShowIpv6PimDfSchema):
                 ordinal = m.groupdict()['ordinal']
 
             #           [0/0]           ff09::/16
-            p3 = re.compile(r'^\s*(?P<space>\s{23})'
-                            r'\[(?P<metrics_pref>[\d\-]+)/(?P<metrics>[\d\-]+)\] +(?P<group_range>[\w\.\:\/]+)$')
+            p3 = regex_engine.compile(r'^\s*(?P<space>\s{23})'
+                                      r'\[(?P<metrics_pref>[\d\-]+)/(?P<metrics>[\d\-]+)\] +(?P<group_range>[\w\.\:\/]+)$')
             m = p3.match(line)
             if m:
 
@@ -1477,10 +1478,10 @@ class ShowIpv6PimDf(ShowIpv6PimDfSchema):
 
             # Interface     DF Address                 DF State DF Metric  DF Uptime
             # Eth2/1        fe80::5054:ff:fe89:740c    Winner   [0/0]      00:00:48
-            p4 = re.compile(r'^\s*(?P<interface>[\w\-\/]+) +(?P<df_address>[\S]+)'
-                            r' +(?P<df_state>\w+)'
-                            r' +\[(?P<winner_metrics_pref>[\d\-]+)/(?P<winner_metrics>[\d\-]+)\]'
-                            r' +(?P<df_uptime>\S+)$')
+            p4 = regex_engine.compile(r'^\s*(?P<interface>[\w\-\/]+) +(?P<df_address>[\S]+)'
+                                      r' +(?P<df_state>\w+)'
+                                      r' +\[(?P<winner_metrics_pref>[\d\-]+)/(?P<winner_metrics>[\d\-]+)\]'
+                                      r' +(?P<df_uptime>\S+)$')
             m = p4.match(line)
             if m:
                 interface = Common.convert_intf_name(m.groupdict()['interface'])
@@ -1638,8 +1639,8 @@ class ShowIpPimDf(ShowIpPimDfSchema):
                 continue
 
             # Bidir-PIM Designated Forwarder Information for VRF "default"
-            p1 = re.compile(r'^\s*Bidir-PIM +Designated +Forwarder'
-                            r' +Information +for +VRF \"(?P<vrf>[\w]+)\"$')
+            p1 = regex_engine.compile(r'^\s*Bidir-PIM +Designated +Forwarder'
+                                      r' +Information +for +VRF \"(?P<vrf>[\w]+)\"$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -1647,9 +1648,9 @@ class ShowIpPimDf(ShowIpPimDfSchema):
 
             # RP Address (ordinal)   DF-bits          RP Metric  Group Range
             # 10.16.2.2 (2)            00000002 (1)     [0/0]      224.128.0.0/9
-            p2 = re.compile(r'^\s*(?P<rp_address>[\d\.]+) +\((?P<ordinal>\d+)\)'
-                            r' +(?P<df_bits>[\w\s\(\)]+)'
-                            r' +\[(?P<metrics_pref>\d+)/(?P<metrics>\d+)\] +(?P<group_range>[\d\.\/]+)$')
+            p2 = regex_engine.compile(r'^\s*(?P<rp_address>[\d\.]+) +\((?P<ordinal>\d+)\)'
+                                      r' +(?P<df_bits>[\w\s\(\)]+)'
+                                      r' +\[(?P<metrics_pref>\d+)/(?P<metrics>\d+)\] +(?P<group_range>[\d\.\/]+)$')
             m = p2.match(line)
             if m:
                 rp_address = m.groupdict()['rp_address']
@@ -1663,11 +1664,11 @@ class ShowIpPimDf(ShowIpPimDfSchema):
             #  Loopback0            10.4.1.1          Winner     [0/0]        00:28:14   (RPF)
             #  Ethernet2/2                 10.2.0.2         Lose       [0/0]        00:28:14
 
-            p3 = re.compile(r'^\s*(?P<interface>\S+) +(?P<df_address>\S+)'
-                            r' +(?P<df_state>\w+)'
-                            r' +\[(?P<winner_metrics_pref>\d+)/(?P<winner_metrics>\d+)\]'
-                            r' +(?P<df_uptime>\S+)'
-                            r'( +\((?P<is_rpf>\S+)\))?$')
+            p3 = regex_engine.compile(r'^\s*(?P<interface>\S+) +(?P<df_address>\S+)'
+                                      r' +(?P<df_state>\w+)'
+                                      r' +\[(?P<winner_metrics_pref>\d+)/(?P<winner_metrics>\d+)\]'
+                                      r' +(?P<df_uptime>\S+)'
+                                      r'( +\((?P<is_rpf>\S+)\))?$')
             m = p3.match(line)
             if m:
                 interface = Common.convert_intf_name(m.groupdict()['interface'])
@@ -1847,8 +1848,8 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
             line = line.rstrip()
 
             # PIM6 Routing Table for VRF "VRF1" - 1 entries
-            p1 = re.compile(r'^\s*PIM6 +Routing +Table +for +VRF +\"(?P<vrf_name>[\S]+)\" +\-'
-                            r' +(?P<counter>\d+) +entries$')
+            p1 = regex_engine.compile(r'^\s*PIM6 +Routing +Table +for +VRF +\"(?P<vrf_name>[\S]+)\" +\-'
+                                      r' +(?P<counter>\d+) +entries$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -1857,12 +1858,12 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
             # (*, ff08::/16), RP 2001:db8:12:12::12, bidir, expires 00:02:31 Route Fabric owned : FALSE, RP-bit
             # (*, ff30::/12), expires 00:02:31 Route Fabric owned : FALSE
             # (*, ff30::/12), expires 0.000000 Route Fabric owned : FALSE (00:00:02)
-            p2 = re.compile(r'^\s*\((?P<source_address>[\S]+)'
-                            r', +(?P<group>[\S]+)\),'
-                            r'( +RP +(?P<rp>[\S\-]+),)?( +(?P<mode>\w+),)?'
-                            r' +expires +(?P<expires>[\w\.\:\(\)\s]+)'
-                            r' +Route +Fabric +owned +: ((?P<fabric_owned>[\w]+)( *(?P<dummy>\S+))?)'
-                            r'(, +(?P<rp_bit>[\S]+))?$')
+            p2 = regex_engine.compile(r'^\s*\((?P<source_address>[\S]+)'
+                                      r', +(?P<group>[\S]+)\),'
+                                      r'( +RP +(?P<rp>[\S\-]+),)?( +(?P<mode>\w+),)?'
+                                      r' +expires +(?P<expires>[\w\.\:\(\)\s]+)'
+                                      r' +Route +Fabric +owned +: ((?P<fabric_owned>[\w]+)( *(?P<dummy>\S+))?)'
+                                      r'(, +(?P<rp_bit>[\S]+))?$')
             m = p2.match(line)
             if m:
                 rp_bit = False
@@ -1883,7 +1884,7 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
 
                 expire_value = m.groupdict()['expires']
                 if '(' in expire_value:
-                    p2_1 = re.compile(r'^\s*(?P<expires_1>[\d\S]+) +\((?P<expires_2>[\S]+)\)$')
+                    p2_1 = regex_engine.compile(r'^\s*(?P<expires_1>[\d\S]+) +\((?P<expires_2>[\S]+)\)$')
                     match_1 = p2_1.match(expire_value)
                     if match_1:
                         expires = match_1.groupdict()['expires_2']
@@ -1899,17 +1900,17 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
 
 
             # Incoming interface: Null, RPF nbr 0.0.0.0
-            p3 = re.compile(r'^\s*Incoming +interface: (?P<incoming_interface>[\S]+),'
-                           r' +RPF +nbr +(?P<rpf_nbr>[\S]+)$')
+            p3 = regex_engine.compile(r'^\s*Incoming +interface: (?P<incoming_interface>[\S]+),'
+                                     r' +RPF +nbr +(?P<rpf_nbr>[\S]+)$')
             m = p3.match(line)
             if m:
                 incoming_interface = m.groupdict()['incoming_interface']
                 rpf_nbr = m.groupdict()['rpf_nbr']
 
             # Oif-list: (0) 00000000, timeout-list: (0) 00000000
-            p4 = re.compile(r'^\s*Oif-list: +\((?P<oif_count>[\d]+)\)'
-                            r' +(?P<oif_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
-                            r' +(?P<timeout_bf_str>[\S]+)$')
+            p4 = regex_engine.compile(r'^\s*Oif-list: +\((?P<oif_count>[\d]+)\)'
+                                      r' +(?P<oif_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
+                                      r' +(?P<timeout_bf_str>[\S]+)$')
             m = p4.match(line)
             if m:
                 oif_count = m.groupdict()['oif_count']
@@ -1918,9 +1919,9 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
                 oif_timeout_bf_str = m.groupdict()['timeout_bf_str']
 
             # Immediate-list: (0) 00000000, timeout-list: (0) 00000000
-            p5 = re.compile(r'^\s*Immediate-list: +\((?P<imm_count>[\d]+)\)'
-                            r' +(?P<imm_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
-                            r' +(?P<timeout_bf_str>[\S]+)$')
+            p5 = regex_engine.compile(r'^\s*Immediate-list: +\((?P<imm_count>[\d]+)\)'
+                                      r' +(?P<imm_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
+                                      r' +(?P<timeout_bf_str>[\S]+)$')
             m = p5.match(line)
             if m:
                 imm_count = m.groupdict()['imm_count']
@@ -1929,16 +1930,16 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
                 imm_timeout_bf_str = m.groupdict()['timeout_bf_str']
 
             # Sgr-prune-list: (0) 00000000
-            p5 = re.compile(r'^\s*Sgr-prune-list: +\((?P<sgr_count>[\d]+)\)'
-                            r' +(?P<sgr_prune_str>[\S]+)$')
+            p5 = regex_engine.compile(r'^\s*Sgr-prune-list: +\((?P<sgr_count>[\d]+)\)'
+                                      r' +(?P<sgr_prune_str>[\S]+)$')
             m = p5.match(line)
             if m:
                 sgr_count = m.groupdict()['sgr_count']
                 sgr_prune_str = m.groupdict()['sgr_prune_str']
 
             # Timeout-interval: 3, JP-holdtime round-up: 3
-            p6 = re.compile(r'^\s*Timeout-interval: +(?P<timeout_interval>\d+)'
-                            r', +JP-holdtime +round-up: +(?P<jp_round_up>\d+)$')
+            p6 = regex_engine.compile(r'^\s*Timeout-interval: +(?P<timeout_interval>\d+)'
+                                      r', +JP-holdtime +round-up: +(?P<jp_round_up>\d+)$')
             m = p6.match(line)
             if m:
                 timeout_interval = m.groupdict()['timeout_interval']
@@ -2105,7 +2106,7 @@ class ShowIpv6PimNeighbor(ShowIpv6PimNeighborSchema):
 
             # PIM Neighbor Status for VRF "VRF1"
             # PIM6 Neighbor Status for VRF "VRF1"
-            p1 = re.compile(r'^PIM6? +Neighbor +Status +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
+            p1 = regex_engine.compile(r'^PIM6? +Neighbor +Status +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -2117,14 +2118,14 @@ class ShowIpv6PimNeighbor(ShowIpv6PimNeighborSchema):
             #                                                                       Priority Capable State   Capable
             # fe80::282:eaff:feed:1b08     Ethernet1/1.10       00:12:53  00:01:38  1        yes     n/a     no
             # fe80::282:eaff:feed:1b08        Eth2/2      07:31:36  00:01:28  1    yes     n/a
-            p2 = re.compile(r'^(?P<neighbor>[\S]+) +'
-                             r'(?P<intf_name>[\S]+) +'
-                             r'(?P<up_time>[\S]+) +'
-                             r'(?P<expires>[\S]+) +'
-                             r'(?P<dr_priority>\d+) +'
-                             r'(?P<bidir_capable>\w+) +'
-                             r'(?P<bfd_state>[\S]+) *'
-                             r'(?:(?P<ecmp_redirect_capable>\S+))?')
+            p2 = regex_engine.compile(r'^(?P<neighbor>[\S]+) +'
+                                       r'(?P<intf_name>[\S]+) +'
+                                       r'(?P<up_time>[\S]+) +'
+                                       r'(?P<expires>[\S]+) +'
+                                       r'(?P<dr_priority>\d+) +'
+                                       r'(?P<bidir_capable>\w+) +'
+                                       r'(?P<bfd_state>[\S]+) *'
+                                       r'(?:(?P<ecmp_redirect_capable>\S+))?')
             m = p2.match(line)
             if m:
                 second_address_flag = False
@@ -2193,14 +2194,14 @@ class ShowIpv6PimNeighbor(ShowIpv6PimNeighborSchema):
                     continue
 
             #  Secondary addresses:
-            p3 = re.compile(r'^Secondary +addresses:$')
+            p3 = regex_engine.compile(r'^Secondary +addresses:$')
             m = p3.match(line)
             if m:
                 second_address_flag = True
                 continue
 
             #    2001:db8:11:33::33
-            p4 = re.compile(r'^(?P<secondary_address>([a-zA-Z0-9\.\:]+))$')
+            p4 = regex_engine.compile(r'^(?P<secondary_address>([a-zA-Z0-9\.\:]+))$')
             m = p4.match(line)
             if second_address_flag and m:
                 secondary_address.append(m.groupdict()['secondary_address'])
@@ -2315,8 +2316,8 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
             line = line.rstrip()
 
             # PIM Routing Table for VRF "VRF1" - 1 entries
-            p1 = re.compile(r'^\s*PIM +Routing +Table +for +VRF +\"(?P<vrf_name>[\S]+)\" +\-'
-                            r' +(?P<counter>\d+) +entries$')
+            p1 = regex_engine.compile(r'^\s*PIM +Routing +Table +for +VRF +\"(?P<vrf_name>[\S]+)\" +\-'
+                                      r' +(?P<counter>\d+) +entries$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -2324,11 +2325,11 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
 
             # (*, 232.0.0.0/8), expires 0.000000 (00:00:01)
             # (*, 233.0.0.0/24), RP 10.66.12.12, bidir, expires 00:01:58, RP-bit
-            p2 = re.compile(r'^\s*\((?P<source_address>[\S]+)'
-                            r', +(?P<group>[\S]+)\),'
-                            r'( +RP +(?P<rp>[\S\-]+),)?( +(?P<mode>\w+),)?'
-                            r' +expires +(?P<expires>[\w\.\:\(\)\s]+)'
-                            r'(, +(?P<rp_bit>[\S]+))?$')
+            p2 = regex_engine.compile(r'^\s*\((?P<source_address>[\S]+)'
+                                      r', +(?P<group>[\S]+)\),'
+                                      r'( +RP +(?P<rp>[\S\-]+),)?( +(?P<mode>\w+),)?'
+                                      r' +expires +(?P<expires>[\w\.\:\(\)\s]+)'
+                                      r'(, +(?P<rp_bit>[\S]+))?$')
             m = p2.match(line)
             if m:
                 rp_bit = False
@@ -2346,7 +2347,7 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
                     is_rpt = False
                 expire_value = m.groupdict()['expires']
                 if '(' in expire_value:
-                    p2_1 = re.compile(r'^\s*(?P<expires_1>[\d\S]+) +\((?P<expires_2>[\S]+)\)$')
+                    p2_1 = regex_engine.compile(r'^\s*(?P<expires_1>[\d\S]+) +\((?P<expires_2>[\S]+)\)$')
                     match_1 = p2_1.match(expire_value)
                     if match_1:
                         expires = match_1.groupdict()['expires_2']
@@ -2362,17 +2363,17 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
 
 
             # Incoming interface: Null, RPF nbr 0.0.0.0
-            p3 = re.compile(r'^\s*Incoming +interface: (?P<incoming_interface>[\S]+),'
-                           r' +RPF +nbr +(?P<rpf_nbr>[\S]+)$')
+            p3 = regex_engine.compile(r'^\s*Incoming +interface: (?P<incoming_interface>[\S]+),'
+                                     r' +RPF +nbr +(?P<rpf_nbr>[\S]+)$')
             m = p3.match(line)
             if m:
                 incoming_interface = m.groupdict()['incoming_interface']
                 rpf_nbr = m.groupdict()['rpf_nbr']
 
             # Oif-list: (0) 00000000, timeout-list: (0) 00000000
-            p4 = re.compile(r'^\s*Oif-list: +\((?P<oif_count>[\d]+)\)'
-                            r' +(?P<oif_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
-                            r' +(?P<timeout_bf_str>[\S]+)$')
+            p4 = regex_engine.compile(r'^\s*Oif-list: +\((?P<oif_count>[\d]+)\)'
+                                      r' +(?P<oif_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
+                                      r' +(?P<timeout_bf_str>[\S]+)$')
             m = p4.match(line)
             if m:
                 oif_count = m.groupdict()['oif_count']
@@ -2381,9 +2382,9 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
                 oif_timeout_bf_str = m.groupdict()['timeout_bf_str']
 
             # Immediate-list: (0) 00000000, timeout-list: (0) 00000000
-            p5 = re.compile(r'^\s*Immediate-list: +\((?P<imm_count>[\d]+)\)'
-                            r' +(?P<imm_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
-                            r' +(?P<timeout_bf_str>[\S]+)$')
+            p5 = regex_engine.compile(r'^\s*Immediate-list: +\((?P<imm_count>[\d]+)\)'
+                                      r' +(?P<imm_bf_str>[\S]+), +timeout\-list: +\((?P<timeout_count>[\d]+)\)'
+                                      r' +(?P<timeout_bf_str>[\S]+)$')
             m = p5.match(line)
             if m:
                 imm_count = m.groupdict()['imm_count']
@@ -2392,16 +2393,16 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
                 imm_timeout_bf_str = m.groupdict()['timeout_bf_str']
 
             # Sgr-prune-list: (0) 00000000
-            p5 = re.compile(r'^\s*Sgr-prune-list: +\((?P<sgr_count>[\d]+)\)'
-                            r' +(?P<sgr_prune_str>[\S]+)$')
+            p5 = regex_engine.compile(r'^\s*Sgr-prune-list: +\((?P<sgr_count>[\d]+)\)'
+                                      r' +(?P<sgr_prune_str>[\S]+)$')
             m = p5.match(line)
             if m:
                 sgr_count = m.groupdict()['sgr_count']
                 sgr_prune_str = m.groupdict()['sgr_prune_str']
 
             # Timeout-interval: 3, JP-holdtime round-up: 3
-            p6 = re.compile(r'^\s*Timeout-interval: +(?P<timeout_interval>\d+)'
-                            r', +JP-holdtime +round-up: +(?P<jp_round_up>\d+)$')
+            p6 = regex_engine.compile(r'^\s*Timeout-interval: +(?P<timeout_interval>\d+)'
+                                      r', +JP-holdtime +round-up: +(?P<jp_round_up>\d+)$')
             m = p6.match(line)
             if m:
                 timeout_interval = m.groupdict()['timeout_interval']
@@ -2554,7 +2555,7 @@ class ShowIpv6PimGroupRange(ShowIpv6PimGroupRangeSchema):
             line = line.rstrip()
 
             # PIM6 Group-Range Configuration for VRF "VRF1"
-            p1 = re.compile(r'^\s*PIM6 +Group\-Range +Configuration +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
+            p1 = regex_engine.compile(r'^\s*PIM6 +Group\-Range +Configuration +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -2563,11 +2564,11 @@ class ShowIpv6PimGroupRange(ShowIpv6PimGroupRangeSchema):
 
             # Group-range               Mode      RP-address          Shared-tree-only range
             # ff3x::/32                 SSM       -                   -
-            p2 = re.compile(r'^\s*(?P<group_range>[^\s*Group-range][\S]+)'
-                            r' +(?P<mode>[\S]+)'
-                            r' +(?P<rp_address>[\S]+)'
-                            r'( +(?P<shared_tree_only>[\S]+))?'
-                            r'( +(?P<range>[\S]+))?$')
+            p2 = regex_engine.compile(r'^\s*(?P<group_range>[^\s*Group-range][\S]+)'
+                                      r' +(?P<mode>[\S]+)'
+                                      r' +(?P<rp_address>[\S]+)'
+                                      r'( +(?P<shared_tree_only>[\S]+))?'
+                                      r'( +(?P<range>[\S]+))?$')
             m = p2.match(line)
             if m:
                 group_range = m.groupdict()['group_range']
@@ -2680,7 +2681,7 @@ class ShowIpPimNeighbor(ShowIpPimNeighborSchema):
             line = line.rstrip()
 
             # PIM Neighbor Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*PIM +Neighbor +Status +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
+            p1 = regex_engine.compile(r'^\s*PIM +Neighbor +Status +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -2693,14 +2694,14 @@ class ShowIpPimNeighbor(ShowIpPimNeighborSchema):
             # Neighbor        Interface            Uptime    Expires   DR       Bidir-  BFD    ECMP Redirect
             #                                                          Priority Capable State     Capable
             # 10.2.3.3        Ethernet1/3.11       00:31:08  00:01:39  1        yes     n/a     no
-            p2 = re.compile(r'^\s*(?P<neighbor>[\S]+)'
-                            r' +(?P<intf_name>[\S]+)'
-                            r' +(?P<up_time>[\S]+)'
-                            r' +(?P<expires>[\S]+)'
-                            r' +(?P<dr_priority>\d+)'
-                            r' +(?P<bidir_capable>\w+)'
-                            r' +(?P<bfd_state>[\S]+)'
-                            r'( +(?P<redict_capable>[\S]+))?$')
+            p2 = regex_engine.compile(r'^\s*(?P<neighbor>[\S]+)'
+                                      r' +(?P<intf_name>[\S]+)'
+                                      r' +(?P<up_time>[\S]+)'
+                                      r' +(?P<expires>[\S]+)'
+                                      r' +(?P<dr_priority>\d+)'
+                                      r' +(?P<bidir_capable>\w+)'
+                                      r' +(?P<bfd_state>[\S]+)'
+                                      r'( +(?P<redict_capable>[\S]+))?$')
             m = p2.match(line)
             if m:
                 neighbor = m.groupdict()['neighbor']
@@ -2844,9 +2845,9 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
             #VRF Name              VRF      Table       Interface  BFD        MVPN
             #          ID       ID          Count      Enabled    Enabled
             # default               1        0x00000001  3          no          no
-            p1 = re.compile(r'^\s*(?P<vrf>[\w\d]+) +(?P<vrf_id>\d+)'
-                            r' +(?P<table_id>0x[a_f0-9]+) +(?P<interface_count>\d+)'
-                            r' +(?P<bfd>\w+)? +(?P<mvpn>\w+)?$')
+            p1 = regex_engine.compile(r'^\s*(?P<vrf>[\w\d]+) +(?P<vrf_id>\d+)'
+                                      r' +(?P<table_id>0x[a_f0-9]+) +(?P<interface_count>\d+)'
+                                      r' +(?P<bfd>\w+)? +(?P<mvpn>\w+)?$')
             m = p1.match(line)
             if m:
                 expiry_timer_configured = sg_expiry_timer_infinity = False
@@ -2891,7 +2892,7 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 continue
 
             # State Limit: None
-            p2 = re.compile(r'^\s*State +Limit: +(?P<state_limit>(?!None)\w+)$')
+            p2 = regex_engine.compile(r'^\s*State +Limit: +(?P<state_limit>(?!None)\w+)$')
             m = p2.match(line)
             if m:
                 state_limit = m.groupdict()['state_limit'].lower()
@@ -2905,7 +2906,7 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
 
 
             # Register Rate Limit: none
-            p3 = re.compile(r'^\s*Register +Rate +Limit: +(?P<register_rate_limit>(?!none)\w+)$')
+            p3 = regex_engine.compile(r'^\s*Register +Rate +Limit: +(?P<register_rate_limit>(?!none)\w+)$')
             m = p3.match(line)
             if m:
                 register_rate_limit = m.groupdict()['register_rate_limit'].lower()
@@ -2919,8 +2920,8 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                     [af_name]['register_rate_limit'] = register_rate_limit
 
             # Register source  interface : loopback0 address : 10.4.1.1
-            p4 = re.compile(r'^\s*Register +source +interface +: +(?P<intf_name>[\w\d\S]+)'
-                            r' +address +: +(?P<address>[\w\d\S]+)$')
+            p4 = regex_engine.compile(r'^\s*Register +source +interface +: +(?P<intf_name>[\w\d\S]+)'
+                                      r' +address +: +(?P<address>[\w\d\S]+)$')
             m = p4.match(line)
             if m:
                 register_source = m.groupdict()['intf_name']
@@ -2955,7 +2956,7 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 continue
 
             # Shared tree ranges: none
-            p5 = re.compile(r'^\s*Shared +tree +ranges: +(?P<shared_tree_ranges>(?!none)\w+)$')
+            p5 = regex_engine.compile(r'^\s*Shared +tree +ranges: +(?P<shared_tree_ranges>(?!none)\w+)$')
             m = p5.match(line)
             if m:
                 shared_tree_ranges = m.groupdict()['shared_tree_ranges']
@@ -2971,9 +2972,9 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
 
             # (S,G)-expiry timer: configured, infinity
             # (S,G)-expiry timer: configured, 1200 secs
-            p7 = re.compile(r'^\s*\(S\,G\)\-expiry +timer: +(?P<expiry_timer_configured>\w+)'
-                            r'(, +(?P<sg_expiry_timer_infinity>[\w]+))?'
-                            r'(, +(?P<sg_expiry_timer>[\d]+) +secs)?$')
+            p7 = regex_engine.compile(r'^\s*\(S\,G\)\-expiry +timer: +(?P<expiry_timer_configured>\w+)'
+                                      r'(, +(?P<sg_expiry_timer_infinity>[\w]+))?'
+                                      r'(, +(?P<sg_expiry_timer>[\d]+) +secs)?$')
             m = p7.match(line)
             if m:
                 if m.groupdict()['expiry_timer_configured']:
@@ -3014,7 +3015,7 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 continue
 
             #  (S,G)-list policy: sg-expiry-timer-sg-list
-            p8 = re.compile(r'^\s*\(S\,G\)\-list +policy: +(?P<sg_list_policy>(?!none)[\w\S]+)$')
+            p8 = regex_engine.compile(r'^\s*\(S\,G\)\-list +policy: +(?P<sg_list_policy>(?!none)[\w\S]+)$')
             m = p8.match(line)
             if m:
                 sg_list_policy = m.groupdict()['sg_list_policy']
@@ -3031,8 +3032,8 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 continue
 
             #  (S,G)-expiry timer config version 1, active version 1
-            p9 = re.compile(r'^\s*\(S\,G\)\-expiry +timer +config +version +(?P<expiry_timer_config_version>\d+)'
-                            r'+, +active +version +(?P<expiry_timer_active_version>\d+)$')
+            p9 = regex_engine.compile(r'^\s*\(S\,G\)\-expiry +timer +config +version +(?P<expiry_timer_config_version>\d+)'
+                                      r'+, +active +version +(?P<expiry_timer_active_version>\d+)$')
             m = p9.match(line)
             if m:
                 expiry_timer_config_version = int(m.groupdict()['expiry_timer_config_version'])
@@ -3054,7 +3055,7 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 continue
 
             # Pre-build SPT for all (S,G)s in VRF: disabled
-            p10 = re.compile(r'^\s*Pre\-build +SPT +for +all +\(S\,G\)s +in +VRF: +(?P<pre_build_spt>\w+)$')
+            p10 = regex_engine.compile(r'^\s*Pre\-build +SPT +for +all +\(S\,G\)s +in +VRF: +(?P<pre_build_spt>\w+)$')
             m = p10.match(line)
             if m:
                 pre_build_spt = m.groupdict()['pre_build_spt']
@@ -3063,7 +3064,7 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 continue
 
             # CLI vrf done: TRUE
-            p11 = re.compile(r'^\s*CLI +vrf +done: +(?P<cli_vrf_done>\w+)$')
+            p11 = regex_engine.compile(r'^\s*CLI +vrf +done: +(?P<cli_vrf_done>\w+)$')
             m= p11.match(line)
             if m:
                 cli_vrf_done = True if m.groupdict()['cli_vrf_done'].lower() == 'true' else False
@@ -3073,7 +3074,7 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 continue
 
             # PIM cibtype Auto Enabled: yes
-            p12 = re.compile(r'^\s*PIM +cibtype +[a|A]uto +[e|E]nabled: +(?P<cibtype_auto_enabled>\w+)$')
+            p12 = regex_engine.compile(r'^\s*PIM +cibtype +[a|A]uto +[e|E]nabled: +(?P<cibtype_auto_enabled>\w+)$')
             m = p12.match(line)
             if m:
                 cibtype_auto_enabled = True if m.groupdict()['cibtype_auto_enabled'].lower() == 'yes' else False
@@ -3083,7 +3084,7 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
                 continue
 
             # PIM VxLAN VNI ID: 0
-            p13 = re.compile(r'^\s*PIM +VxLAN +VNI +ID: +(?P<vxvlan_vni_id>\d+)$')
+            p13 = regex_engine.compile(r'^\s*PIM +VxLAN +VNI +ID: +(?P<vxvlan_vni_id>\d+)$')
             m = p13.match(line)
             if m:
                 vxlan_vni_id = int(m.groupdict()['vxvlan_vni_id'])
@@ -3152,7 +3153,7 @@ class ShowIpPimGroupRange(ShowIpPimGroupRangeSchema):
             line = line.rstrip()
 
             # PIM Group-Range Configuration for VRF "VRF1"
-            p1 = re.compile(r'^\s*PIM +Group\-Range +Configuration +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
+            p1 = regex_engine.compile(r'^\s*PIM +Group\-Range +Configuration +for +VRF +\"(?P<vrf_name>[\S]+)\"$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -3160,12 +3161,12 @@ class ShowIpPimGroupRange(ShowIpPimGroupRangeSchema):
 
             # Group-range        Action    Mode      RP-address       Shared-tree-only range
             # 232.0.0.0/8        Accept    SSM       -                -         Local
-            p2 = re.compile(r'^\s*(?P<group_range>[^\s*Group-range][\S]+)'
-                            r' +(?P<action>[\S]+)'
-                            r' +(?P<mode>[\S]+)'
-                            r' +(?P<rp_address>[\S]+)'
-                            r' +(?P<shared_tree_only>[\S]+)'
-                            r'( +(?P<range>[\S]+))?$')
+            p2 = regex_engine.compile(r'^\s*(?P<group_range>[^\s*Group-range][\S]+)'
+                                      r' +(?P<action>[\S]+)'
+                                      r' +(?P<mode>[\S]+)'
+                                      r' +(?P<rp_address>[\S]+)'
+                                      r' +(?P<shared_tree_only>[\S]+)'
+                                      r'( +(?P<range>[\S]+))?$')
             m = p2.match(line)
             if m:
                 group_range = m.groupdict()['group_range']
@@ -3279,14 +3280,14 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
             each_line = each_line.rstrip()
 
             # ip pim register-policy pim_register_p
-            p1 = re.compile(r'^\s*ip +pim +register-policy( +prefix-list)? +(?P<rg_policy_name>[\S]+)$')
+            p1 = regex_engine.compile(r'^\s*ip +pim +register-policy( +prefix-list)? +(?P<rg_policy_name>[\S]+)$')
             m = p1.match(each_line)
             if m:
                 parsed_data[vrf_name] = m.groupdict()['rg_policy_name']
                 continue
 
             # vrf context VRF1
-            p1 = re.compile(r'^\s*vrf +context +(?P<vrf_name>[\S]+)$')
+            p1 = regex_engine.compile(r'^\s*vrf +context +(?P<vrf_name>[\S]+)$')
             m = p1.match(each_line)
             if m:
                 vrf_name = m.groupdict()['vrf_name']
@@ -3310,15 +3311,15 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
             else:
                 continue
 
-            p0 = re.compile(r'^\s*C: +No. +of +comparisions, +M: +No. +of matches$')
+            p0 = regex_engine.compile(r'^\s*C: +No. +of +comparisions, +M: +No. +of matches$')
             m = p0.match(line)
             if m:
                 compare_count = match_count = accept_register = info = \
                     reject_policy_count = accept_policy_count = ""
 
             # route-map pim_register_vrf permit 10
-            p1 = re.compile(r'^\s*route-map +(?P<route_map>[\S]+)'
-                            r' +permit +(?P<route_map_permit>[\S]+)$')
+            p1 = regex_engine.compile(r'^\s*route-map +(?P<route_map>[\S]+)'
+                                      r' +permit +(?P<route_map_permit>[\S]+)$')
             m = p1.match(line)
             if m:
                 accept_register = m.groupdict()['route_map']
@@ -3329,9 +3330,9 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
                         vrf = key
 
             # match ip multicast group 239.2.2.2/32                      C: 0      M: 0
-            p1_1 = re.compile(r'^\s*match +ip +multicast +group +(?P<group>[\w\.\/]+)'
-                              r'( +[c|C]: +(?P<c>\d+))?'
-                              r'( +[m|M]: +(?P<m>\d+))?$')
+            p1_1 = regex_engine.compile(r'^\s*match +ip +multicast +group +(?P<group>[\w\.\/]+)'
+                                        r'( +[c|C]: +(?P<c>\d+))?'
+                                        r'( +[m|M]: +(?P<m>\d+))?$')
             m = p1_1.match(line)
             if m:
                 group = m.groupdict()['group'].rstrip()
@@ -3343,11 +3344,11 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
                 info = "match ip multicast group " + group
 
             # ip prefix-list testprefixlist seq 5 permit 239.3.3.3/32      M: 0
-            p2_1 = re.compile(r'^\s*ip +prefix-list +(?P<prefix_list>[\S]+)'
-                              r'( +seq +(?P<seq>\d+))?'
-                              r'( +permit +(?P<permit>[\S]+))?'
-                              r'( +[c|C]: +(?P<c>\d+))?'
-                              r'( +[m|M]: +(?P<m>\d+))?$')
+            p2_1 = regex_engine.compile(r'^\s*ip +prefix-list +(?P<prefix_list>[\S]+)'
+                                        r'( +seq +(?P<seq>\d+))?'
+                                        r'( +permit +(?P<permit>[\S]+))?'
+                                        r'( +[c|C]: +(?P<c>\d+))?'
+                                        r'( +[m|M]: +(?P<m>\d+))?$')
             m = p2_1.match(line)
             if m:
                 accept_register = m.groupdict()['prefix_list']
@@ -3365,13 +3366,13 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
                 info = 'ip prefix-list '+ accept_register +" seq "+ seq + " permit "+permit
 
             # Total accept count for policy: 0
-            p3 = re.compile(r'^\s*Total +accept +count +for +policy: +(?P<accept_policy_count>\d+)$')
+            p3 = regex_engine.compile(r'^\s*Total +accept +count +for +policy: +(?P<accept_policy_count>\d+)$')
             m = p3.match(line)
             if m:
                 accept_policy_count = m.groupdict()['accept_policy_count']
 
             # Total reject count for policy: 0
-            p4 = re.compile(r'^\s*Total +reject +count +for +policy: +(?P<reject_policy_count>\d+)$')
+            p4 = regex_engine.compile(r'^\s*Total +reject +count +for +policy: +(?P<reject_policy_count>\d+)$')
             m = p4.match(line)
             if m:
                 reject_policy_count = m.groupdict()['reject_policy_count']
@@ -3571,7 +3572,7 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
             line = line.rstrip()
 
             #PIM Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*PIM +Interface +Status +for +VRF+ \"(?P<vrf>[\w]+)\"$')
+            p1 = regex_engine.compile(r'^\s*PIM +Interface +Status +for +VRF+ \"(?P<vrf>[\w]+)\"$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -3589,11 +3590,11 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
                 nbr_count = configured_dr_priority = ip_subnet = neighbor_holdtime = neighbor_filter = vpc_svi = bad_version_packets = ""
 
             # Ethernet2/2, Interface status: protocol-up/link-up/admin-up
-            p2 = re.compile(r'^\s*(?P<interface_name>[\w\/\.\-]+),?'
-                            r' +Interface +status:'
-                            r' +protocol-(?P<oper_status>[\w]+)(/)?'
-                            r'link\-(?P<link_status>[\w]+)(/)?'
-                            r'admin\-(?P<admin_status>[\w]+)$')
+            p2 = regex_engine.compile(r'^\s*(?P<interface_name>[\w\/\.\-]+),?'
+                                      r' +Interface +status:'
+                                      r' +protocol-(?P<oper_status>[\w]+)(/)?'
+                                      r'link\-(?P<link_status>[\w]+)(/)?'
+                                      r'admin\-(?P<admin_status>[\w]+)$')
             m = p2.match(line)
             if m:
                 interface_name = m.groupdict()['interface_name']
@@ -3603,130 +3604,130 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
                 jp_outbound_policy = jp_inbound_policy = neighbor_filter = ""
 
             # IP address: 10.11.33.11, IP subnet: 10.11.33.0/24
-            p3 = re.compile(r'^\s*IP +address: +(?P<address>[\w\.]+),'
-                            r' +IP +subnet: +(?P<ip_subnet>[\w\.\/]+)$')
+            p3 = regex_engine.compile(r'^\s*IP +address: +(?P<address>[\w\.]+),'
+                                      r' +IP +subnet: +(?P<ip_subnet>[\w\.\/]+)$')
             m = p3.match(line)
             if m:
                 address = m.groupdict()['address']
                 ip_subnet = m.groupdict()['ip_subnet']
 
             # PIM DR: 10.11.33.11, DR's priority: 144
-            p4 = re.compile(r'^\s*PIM +DR: +(?P<dr_address>[\w\.]+),'
-                            r' +DR\'s +priority: +(?P<dr_priority>[\d]+)$')
+            p4 = regex_engine.compile(r'^\s*PIM +DR: +(?P<dr_address>[\w\.]+),'
+                                      r' +DR\'s +priority: +(?P<dr_priority>[\d]+)$')
             m = p4.match(line)
             if m:
                 dr_address = m.groupdict()['dr_address']
                 dr_priority = m.groupdict()['dr_priority']
 
             # PIM neighbor count: 1
-            p5 = re.compile(r'^\s*PIM +neighbor +count: +(?P<nbr_count>[\d]+)$')
+            p5 = regex_engine.compile(r'^\s*PIM +neighbor +count: +(?P<nbr_count>[\d]+)$')
 
             m = p5.match(line)
             if m:
                 nbr_count = m.groupdict()['nbr_count']
 
             # PIM hello interval: 45 secs (configured 44444 ms), next hello sent in: 00:00:05
-            p6 = re.compile(r'^\s*PIM +hello +interval: +(?P<hello_interval>[\d]+) +secs'
-                            r'( +\(configured +(?P<configured_interval_ms>\d+) +ms\))?,'
-                            r' +next +hello +sent +in: +(?P<hello_expiration>[\w\:]+)$')
+            p6 = regex_engine.compile(r'^\s*PIM +hello +interval: +(?P<hello_interval>[\d]+) +secs'
+                                      r'( +\(configured +(?P<configured_interval_ms>\d+) +ms\))?,'
+                                      r' +next +hello +sent +in: +(?P<hello_expiration>[\w\:]+)$')
             m = p6.match(line)
             if m:
                 hello_interval = m.groupdict()['hello_interval']
                 hello_expiration = m.groupdict()['hello_expiration']
 
             # PIM neighbor holdtime: 159 secs
-            p7 = re.compile(r'^\s*PIM +neighbor +holdtime: +(?P<holdtime>[\d]+) +secs$')
+            p7 = regex_engine.compile(r'^\s*PIM +neighbor +holdtime: +(?P<holdtime>[\d]+) +secs$')
             m = p7.match(line)
             if m:
                 neighbor_holdtime = m.groupdict()['holdtime']
 
             # PIM configured DR priority: 144
-            p8 = re.compile(r'^\s*PIM +configured +DR +priority: +(?P<configured_dr_priority>[\d]+)$')
+            p8 = regex_engine.compile(r'^\s*PIM +configured +DR +priority: +(?P<configured_dr_priority>[\d]+)$')
             m = p8.match(line)
             if m:
                 configured_dr_priority = m.groupdict()['configured_dr_priority']
 
             # PIM configured DR delay: 3 secs
-            p9 = re.compile(r'^\s*PIM +configured +DR +delay: +(?P<configured_dr_delay>[\d]+) +secs$')
+            p9 = regex_engine.compile(r'^\s*PIM +configured +DR +delay: +(?P<configured_dr_delay>[\d]+) +secs$')
             m = p9.match(line)
             if m:
                 configured_dr_delay = m.groupdict()['configured_dr_delay']
 
             # PIM border interface: yes
-            p10 = re.compile(r'^\s*PIM +border +interface: +(?P<border_interface>[\w]+)$')
+            p10 = regex_engine.compile(r'^\s*PIM +border +interface: +(?P<border_interface>[\w]+)$')
             m = p10.match(line)
             if m:
                 bsr_border = m.groupdict()['border_interface']
 
             # PIM GenID sent in Hellos: 0x26fae674
-            p11 = re.compile(r'^\s*PIM +GenID +sent +in +Hellos: +(?P<genid>[\S]+)$')
+            p11 = regex_engine.compile(r'^\s*PIM +GenID +sent +in +Hellos: +(?P<genid>[\S]+)$')
             m = p11.match(line)
             if m:
                 genid = m.groupdict()['genid']
 
             # PIM Hello MD5-AH Authentication: disabled
-            p12 = re.compile(r'^\s*PIM +Hello +MD5-AH +Authentication: +(?P<md5_authentication>[\w]+)$')
+            p12 = regex_engine.compile(r'^\s*PIM +Hello +MD5-AH +Authentication: +(?P<md5_authentication>[\w]+)$')
             m = p12.match(line)
             if m:
                 hello_md5_ah_authentication = m.groupdict()['md5_authentication']
 
             # PIM Neighbor policy: v4neighbor-policy
-            p13 = re.compile(r'^\s*PIM +Neighbor +policy: +(?P<nbr_policy>(?!none)[\w\-\s]+)$')
+            p13 = regex_engine.compile(r'^\s*PIM +Neighbor +policy: +(?P<nbr_policy>(?!none)[\w\-\s]+)$')
             m = p13.match(line)
             if m:
                 neighbor_filter = m.groupdict()['nbr_policy']
 
             # PIM Join-Prune inbound policy: v4jp-policy
-            p14 = re.compile(r'^\s*PIM +Join-Prune +inbound +policy: +(?P<jp_inbound_policy>(?!none)[\w\-\s]+)$')
+            p14 = regex_engine.compile(r'^\s*PIM +Join-Prune +inbound +policy: +(?P<jp_inbound_policy>(?!none)[\w\-\s]+)$')
             m = p14.match(line)
             if m:
                 jp_inbound_policy = m.groupdict()['jp_inbound_policy']
 
             # PIM Join-Prune outbound policy: v4jp-policy
-            p15 = re.compile(r'^\s*PIM +Join-Prune +outbound +policy: +(?P<jp_outbound_policy>(?!none)[\w\-\s]+)$')
+            p15 = regex_engine.compile(r'^\s*PIM +Join-Prune +outbound +policy: +(?P<jp_outbound_policy>(?!none)[\w\-\s]+)$')
             m = p15.match(line)
             if m:
                 jp_outbound_policy = m.groupdict()['jp_outbound_policy']
 
             # PIM Join-Prune interval: 1 minutes
-            p16 = re.compile(r'^\s*PIM +Join-Prune +interval: +(?P<jp_interval>[\d]+) +minutes$')
+            p16 = regex_engine.compile(r'^\s*PIM +Join-Prune +interval: +(?P<jp_interval>[\d]+) +minutes$')
             m = p16.match(line)
             if m:
                 jp_interval = m.groupdict()['jp_interval']
 
             # PIM Join-Prune next sending: 1 minutes
-            p17 = re.compile(r'^\s*PIM +Join-Prune +next +sending: +(?P<jp_next_sending>[\d]+) +minutes$')
+            p17 = regex_engine.compile(r'^\s*PIM +Join-Prune +next +sending: +(?P<jp_next_sending>[\d]+) +minutes$')
             m = p17.match(line)
             if m:
                 jp_next_sending = m.groupdict()['jp_next_sending']
 
             # PIM BFD enabled: no
-            p18 = re.compile(r'^\s*PIM +BFD +enabled: +(?P<bfd_enabled>[\w]+)$')
+            p18 = regex_engine.compile(r'^\s*PIM +BFD +enabled: +(?P<bfd_enabled>[\w]+)$')
             m = p18.match(line)
             if m:
                 bfd = m.groupdict()['bfd_enabled']
 
             # PIM passive interface: no
-            p19 = re.compile(r'^\s*PIM +passive +interface: +(?P<passive>[\w]+)$')
+            p19 = regex_engine.compile(r'^\s*PIM +passive +interface: +(?P<passive>[\w]+)$')
             m = p19.match(line)
             if m:
                 passive = m.groupdict()['passive']
 
             # PIM VPC SVI: no
-            p20 = re.compile(r'^\s*PIM +VPC +SVI: +(?P<vpc_svi>[\w]+)$')
+            p20 = regex_engine.compile(r'^\s*PIM +VPC +SVI: +(?P<vpc_svi>[\w]+)$')
             m = p20.match(line)
             if m:
                 vpc_svi = m.groupdict()['vpc_svi']
 
             # PIM Auto Enabled: no
-            p21 = re.compile(r'^\s*PIM +Auto +Enabled: +(?P<auto_enabled>[\w]+)$')
+            p21 = regex_engine.compile(r'^\s*PIM +Auto +Enabled: +(?P<auto_enabled>[\w]+)$')
             m = p21.match(line)
             if m:
                 auto_enabled = m.groupdict()['auto_enabled']
 
             # PIM Interface Statistics, last reset: never
             # PIM Interface Statistics
-            p22 = re.compile(r'^\s*PIM +Interface +Statistics+(, +last +reset: +(?P<last_reset>[\w\:]+))?$')
+            p22 = regex_engine.compile(r'^\s*PIM +Interface +Statistics+(, +last +reset: +(?P<last_reset>[\w\:]+))?$')
             m = p22.match(line)
             if m:
                 statistic = True
@@ -3734,10 +3735,10 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
                     last_rest = m.groupdict()['last_reset']
 
             # Hellos: 360/474 (early: 0), JPs: 0/0, Asserts: 0/0
-            p23 = re.compile(r'^\s*Hellos: +(?P<hellos>[\d\/]+)'
-                             r' +\(early: +(?P<early>\d+)\)?,'
-                             r' +JPs: +(?P<jps>[\d\/]+),'
-                             r' +Asserts: +(?P<asserts>[\d\/]+)$')
+            p23 = regex_engine.compile(r'^\s*Hellos: +(?P<hellos>[\d\/]+)'
+                                       r' +\(early: +(?P<early>\d+)\)?,'
+                                       r' +JPs: +(?P<jps>[\d\/]+),'
+                                       r' +Asserts: +(?P<asserts>[\d\/]+)$')
             m = p23.match(line)
             if m:
                 hellos = m.groupdict()['hellos']
@@ -3745,18 +3746,18 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
                 asserts = m.groupdict()['asserts']
 
             # Grafts: 0/0, Graft-Acks: 0/0
-            p24 = re.compile(r'^\s*Grafts: +(?P<grafts>[\d\/]+),'
-                             r' +Graft-Acks: +(?P<graft_acks>[\d\/]+)$')
+            p24 = regex_engine.compile(r'^\s*Grafts: +(?P<grafts>[\d\/]+),'
+                                       r' +Graft-Acks: +(?P<graft_acks>[\d\/]+)$')
             m = p24.match(line)
             if m:
                 grafts = m.groupdict()['grafts']
                 graft_acks = m.groupdict()['graft_acks']
 
             # DF-Offers: 0/0, DF-Winners: 0/0, DF-Backoffs: 0/0, DF-Passes: 0/0
-            p25 = re.compile(r'^\s*DF-Offers: +(?P<df_offers>[\d\/]+),'
-                             r' +DF-Winners: +(?P<df_winners>[\d\/]+),'
-                             r' +DF-Backoffs: +(?P<df_backoffs>[\d\/]+),'
-                             r' +DF-Passes: +(?P<df_passes>[\d\/]+)$')
+            p25 = regex_engine.compile(r'^\s*DF-Offers: +(?P<df_offers>[\d\/]+),'
+                                       r' +DF-Winners: +(?P<df_winners>[\d\/]+),'
+                                       r' +DF-Backoffs: +(?P<df_backoffs>[\d\/]+),'
+                                       r' +DF-Passes: +(?P<df_passes>[\d\/]+)$')
             m = p25.match(line)
             if m:
                 df_offers = m.groupdict()['df_offers']
@@ -3765,9 +3766,9 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
                 df_passes = m.groupdict()['df_passes']
 
             #    Checksum errors: 0, Invalid packet types/DF subtypes: 0/0
-            p26 = re.compile(r'^\s*Checksum errors: +(?P<checksum>[\d]+),'
-                             r' +Invalid +packet +types\/DF +subtypes:'
-                             r' +(?P<invalid_packet_types>[\d]+)/(?P<invalid_df_subtypes>[\d]+)$')
+            p26 = regex_engine.compile(r'^\s*Checksum errors: +(?P<checksum>[\d]+),'
+                                       r' +Invalid +packet +types\/DF +subtypes:'
+                                       r' +(?P<invalid_packet_types>[\d]+)/(?P<invalid_df_subtypes>[\d]+)$')
             m = p26.match(line)
             if m:
                 checksum = m.groupdict()['checksum']
@@ -3775,15 +3776,15 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
                 invalid_df_subtypes = m.groupdict()['invalid_df_subtypes']
 
             #    Authentication failed: 0
-            p27 = re.compile(r'^\s*Authentication +failed: +(?P<authentication_failed>[\d]+)$')
+            p27 = regex_engine.compile(r'^\s*Authentication +failed: +(?P<authentication_failed>[\d]+)$')
             m = p27.match(line)
             if m:
                 authentication_failed = m.groupdict()['authentication_failed']
 
             #    Packet length errors: 0, Bad version packets: 0, Packets from self: 0
-            p28 = re.compile(r'^\s*Packet +length +errors: +(?P<packet_length_errors>[\d]+),'
-                             r' +Bad +version +packets: +(?P<bad_version_packets>[\d]+),'
-                             r' +Packets +from +self: +(?P<packets_from_self>[\d]+)$')
+            p28 = regex_engine.compile(r'^\s*Packet +length +errors: +(?P<packet_length_errors>[\d]+),'
+                                       r' +Bad +version +packets: +(?P<bad_version_packets>[\d]+),'
+                                       r' +Packets +from +self: +(?P<packets_from_self>[\d]+)$')
             m = p28.match(line)
             if m:
                 packet_length_errors = m.groupdict()['packet_length_errors']
@@ -3791,51 +3792,51 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
                 packets_from_self = m.groupdict()['packets_from_self']
 
             #    Packets from non-neighbors: 0
-            p29 = re.compile(r'^\s*Packets +from +non\-neighbors: +(?P<packets_from_non_neighbors>[\d]+)$')
+            p29 = regex_engine.compile(r'^\s*Packets +from +non\-neighbors: +(?P<packets_from_non_neighbors>[\d]+)$')
             m = p29.match(line)
             if m:
                 packets_from_non_neighbors = m.groupdict()['packets_from_non_neighbors']
 
             #    Packets received on passiveinterface: 0
-            p30 = re.compile(r'^\s*Packets +received +on +passiveinterface:'
-                             r' +(?P<packets_received_on_passiveinterface>[\d]+)$')
+            p30 = regex_engine.compile(r'^\s*Packets +received +on +passiveinterface:'
+                                       r' +(?P<packets_received_on_passiveinterface>[\d]+)$')
             m = p30.match(line)
             if m:
                 packets_received_on_passiveinterface = m.groupdict()['packets_received_on_passiveinterface']
 
             #    JPs received on RPF-interface: 0
-            p31 = re.compile(r'^\s*JPs +received +on +RPF\-interface:'
-                             r' +(?P<jp_received_on_rpf_interface>[\d]+)$')
+            p31 = regex_engine.compile(r'^\s*JPs +received +on +RPF\-interface:'
+                                       r' +(?P<jp_received_on_rpf_interface>[\d]+)$')
             m = p31.match(line)
             if m:
                 jps_received_on_rpf_interface = m.groupdict()['jp_received_on_rpf_interface']
 
             #    (*,G) Joins received with no/wrong RP: 0/0
-            p32 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*]+) +Joins +received +with +no\/+wrong RP:'
-                             r' +(?P<joins_received_with_no_rp>\d+)/(?P<joins_received_with_wrong_rp>\d+)$')
+            p32 = regex_engine.compile(r'^\s*(?P<s_g>[\w\(\)\,\*]+) +Joins +received +with +no\/+wrong RP:'
+                                       r' +(?P<joins_received_with_no_rp>\d+)/(?P<joins_received_with_wrong_rp>\d+)$')
             m = p32.match(line)
             if m:
                 joins_received_with_no_rp = m.groupdict()['joins_received_with_no_rp']
                 joins_received_with_wrong_rp = m.groupdict()['joins_received_with_wrong_rp']
 
             #  (*,G)/(S,G) JPs received for SSM/Bidir groups: 0/0
-            p33 = re.compile(r'^\s*(?P<s_g>[\w\(\)\,\*\/]+) +JPs +received +for +SSM\/Bidir +groups:'
-                             r' +(?P<joins_received_with_ssm_groups>\d+)/(?P<joins_received_with_bidir_groups>\d+)$')
+            p33 = regex_engine.compile(r'^\s*(?P<s_g>[\w\(\)\,\*\/]+) +JPs +received +for +SSM\/Bidir +groups:'
+                                       r' +(?P<joins_received_with_ssm_groups>\d+)/(?P<joins_received_with_bidir_groups>\d+)$')
             m = p33.match(line)
             if m:
                 joins_received_with_ssm_groups = m.groupdict()['joins_received_with_ssm_groups']
                 joins_received_with_bidir_groups = m.groupdict()['joins_received_with_bidir_groups']
 
             # JPs filtered by inbound policy: 0
-            p34 = re.compile(r'^\s*JPs +filtered +by +inbound +policy:'
-                             r' +(?P<jps_filtered_by_inbound_policy>\d+)$')
+            p34 = regex_engine.compile(r'^\s*JPs +filtered +by +inbound +policy:'
+                                       r' +(?P<jps_filtered_by_inbound_policy>\d+)$')
             m = p34.match(line)
             if m:
                 jps_filtered_by_inbound_policy = m.groupdict()['jps_filtered_by_inbound_policy']
 
             # JPs filtered by outbound policy: 0
-            p35 = re.compile(r'^\s*JPs +filtered +by +outbound +policy:'
-                             r' +(?P<jps_filtered_by_outbound_policy>\d+)$')
+            p35 = regex_engine.compile(r'^\s*JPs +filtered +by +outbound +policy:'
+                                       r' +(?P<jps_filtered_by_outbound_policy>\d+)$')
             m = p35.match(line)
             if m:
                 jps_filtered_by_outbound_policy = m.groupdict()['jps_filtered_by_outbound_policy']
@@ -4123,9 +4124,9 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
             #VRF Name              VRF      Table       Interface  BFD
             #          ID       ID          Count      Enabled
             # default               1        0x80000001  3          no
-            p1 = re.compile(r'^\s*(?P<vrf>[\w\d]+) +(?P<vrf_id>\d+)'
-                            r' +(?P<table_id>0x[a_f0-9]+) +(?P<interface_count>\d+)'
-                            r' +(?P<bfd>\w+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<vrf>[\w\d]+) +(?P<vrf_id>\d+)'
+                                      r' +(?P<table_id>0x[a_f0-9]+) +(?P<interface_count>\d+)'
+                                      r' +(?P<bfd>\w+)$')
             m = p1.match(line)
             if m:
                 vrf_name = m.groupdict()['vrf']
@@ -4159,7 +4160,7 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
                 continue
 
             # State Limit: None
-            p2 = re.compile(r'^\s*State +Limit: +(?P<state_limit>(?!None)\w+)$')
+            p2 = regex_engine.compile(r'^\s*State +Limit: +(?P<state_limit>(?!None)\w+)$')
             m = p2.match(line)
             if m:
                 state_limit = m.groupdict()['state_limit'].lower()
@@ -4169,7 +4170,7 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
 
 
             # Register Rate Limit: none
-            p3 = re.compile(r'^\s*Register +Rate +Limit: +(?P<register_rate_limit>(?!none)\w+)$')
+            p3 = regex_engine.compile(r'^\s*Register +Rate +Limit: +(?P<register_rate_limit>(?!none)\w+)$')
             m = p3.match(line)
             if m:
                 register_rate_limit = m.groupdict()['register_rate_limit'].lower()
@@ -4178,7 +4179,7 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
                 continue
 
             # Shared tree route-map: v6spt-threshold-group-list
-            p4 = re.compile(r'^\s*Shared +tree +route-map: +(?P<route_map>[\w\d\S]+)$')
+            p4 = regex_engine.compile(r'^\s*Shared +tree +route-map: +(?P<route_map>[\w\d\S]+)$')
             m = p4.match(line)
             if m:
                 shared_tree_route_map = m.groupdict()['route_map']
@@ -4187,7 +4188,7 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
                 continue
 
             # route-ranges: xxxxx
-            p4 = re.compile(r'^\s*route-ranges:( +(?P<route_range>[\w\d\S]+))?$')
+            p4 = regex_engine.compile(r'^\s*route-ranges:( +(?P<route_range>[\w\d\S]+))?$')
             m = p4.match(line)
             if m:
                 if m.groupdict()['route_range']:
@@ -4199,7 +4200,7 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
                 continue
 
             # Shared tree ranges: none
-            p6 = re.compile(r'^\s*Shared +tree +ranges: +(?P<shared_tree_ranges>(?!none)\w+)$')
+            p6 = regex_engine.compile(r'^\s*Shared +tree +ranges: +(?P<shared_tree_ranges>(?!none)\w+)$')
             m = p6.match(line)
             if m:
                 shared_tree_ranges = m.groupdict()['shared_tree_ranges']
@@ -4327,67 +4328,67 @@ class ShowRunningConfigPim(ShowRunningConfigPimSchema):
 
         # initial regular express
         # vrf context VRF1
-        p_vrf  = re.compile(r'^vrf +context +(?P<vrf>\S+)$')
+        p_vrf  = regex_engine.compile(r'^vrf +context +(?P<vrf>\S+)$')
 
         # feature pim
-        p1 = re.compile(r'^feature +pim$')
+        p1 = regex_engine.compile(r'^feature +pim$')
 
         # feature pim6
-        p1_1 = re.compile(r'^feature +pim6$')
+        p1_1 = regex_engine.compile(r'^feature +pim6$')
 
         # ip pim bsr bsr-candidate loopback0 priority 128
-        p2 = re.compile(r'^ip(v6)? +pim *(bsr)? +bsr\-candidate +(?P<bsr_candidate_interface>[\w\/\.\-]+)'
-                         r'( +hash\-len +(?P<bsr_candidate_hash_mask_length>\d+))?'
-                         r'( priority +(?P<bsr_candidate_priority>\d+))?')
+        p2 = regex_engine.compile(r'^ip(v6)? +pim *(bsr)? +bsr\-candidate +(?P<bsr_candidate_interface>[\w\/\.\-]+)'
+                                   r'( +hash\-len +(?P<bsr_candidate_hash_mask_length>\d+))?'
+                                   r'( priority +(?P<bsr_candidate_priority>\d+))?')
 
         # ip pim rp-address 10.144.6.6 group-list 234.0.0.0/8
         # ip pim rp-address 10.144.6.6 group-list 239.1.1.0/24 bidir
-        p3 = re.compile(r'^(?P<af>ip|ipv6) +pim +rp\-address +(?P<static_rp_address>[\w\.\:]+) +'
-                         r'((group\-list +(?P<static_rp_group_list>[\w\.]+\/\d+))|'
-                         r'(route\-map +(?P<static_rp_route_map>\w+))|'
-                         r'(prefix\-list +(?P<static_rp_prefix_list>\w+)))'
-                         r'( *(?P<dummy>.*))?$$')
+        p3 = regex_engine.compile(r'^(?P<af>ip|ipv6) +pim +rp\-address +(?P<static_rp_address>[\w\.\:]+) +'
+                                   r'((group\-list +(?P<static_rp_group_list>[\w\.]+\/\d+))|'
+                                   r'(route\-map +(?P<static_rp_route_map>\w+))|'
+                                   r'(prefix\-list +(?P<static_rp_prefix_list>\w+)))'
+                                   r'( *(?P<dummy>.*))?$$')
 
         # ip pim bsr rp-candidate loopback0 group-list 235.0.0.0/8 priority 128
         # ip pim rp-candidate Ethernet1/1 group-list 239.0.0.0/24 priority 10 interval 60 bidir
-        p4 = re.compile(r'^(?P<af>ip|ipv6) +pim( *bsr)? +rp\-candidate +(?P<bsr_rp_candidate_interface>[\w\/\.\-]+) +'
-                         r'((group\-list +(?P<bsr_rp_candidate_group_list>[\w\.]+\/\d+))|'
-                         r'(route\-map +(?P<bsr_rp_candidate_route_map>\w+))|'
-                         r'(prefix\-list +(?P<bsr_rp_candidate_prefix_list>\w+)))'
-                         r'( *(?P<dummy>.*))?$')
+        p4 = regex_engine.compile(r'^(?P<af>ip|ipv6) +pim( *bsr)? +rp\-candidate +(?P<bsr_rp_candidate_interface>[\w\/\.\-]+) +'
+                                   r'((group\-list +(?P<bsr_rp_candidate_group_list>[\w\.]+\/\d+))|'
+                                   r'(route\-map +(?P<bsr_rp_candidate_route_map>\w+))|'
+                                   r'(prefix\-list +(?P<bsr_rp_candidate_prefix_list>\w+)))'
+                                   r'( *(?P<dummy>.*))?$')
 
         # ip pim send-rp-announce loopback0 group-list 236.0.0.0/8
         # ----  ipv6 not supported -----
-        p5 = re.compile(r'^ip +pim +(send\-rp\-announce|(auto\-rp +rp\-candidate)) +'
-                         r'((?P<send_rp_announce_intf>(lo|Lo|Eth|eth|Port|port)\w+)|'
-                         r'(?P<send_rp_announce_rp_group>(\d+\.){3}\d+)) +'
-                         r'((group\-list +(?P<send_rp_announce_group_list>[\w\.]+\/\d+))|'
-                         r'(route\-map +(?P<send_rp_announce_route_map>\w+))|'
-                         r'(prefix\-list +(?P<send_rp_announce_prefix_list>\w+)))'
-                         r'(?P<dummy>.*)?$')
+        p5 = regex_engine.compile(r'^ip +pim +(send\-rp\-announce|(auto\-rp +rp\-candidate)) +'
+                                   r'((?P<send_rp_announce_intf>(lo|Lo|Eth|eth|Port|port)\w+)|'
+                                   r'(?P<send_rp_announce_rp_group>(\d+\.){3}\d+)) +'
+                                   r'((group\-list +(?P<send_rp_announce_group_list>[\w\.]+\/\d+))|'
+                                   r'(route\-map +(?P<send_rp_announce_route_map>\w+))|'
+                                   r'(prefix\-list +(?P<send_rp_announce_prefix_list>\w+)))'
+                                   r'(?P<dummy>.*)?$')
 
         # ip pim send-rp-discovery loopback0
         # ip pim send-rp-discovery loopback0 scope 34
         # ----  ipv6 not supported -----
-        p6 = re.compile(r'^ip +pim +send\-rp\-discovery +(?P<send_rp_discovery_intf>[\w\/\.\-]+)'
-                         r'( scope +(?P<send_rp_discovery_scope>\d+))?$')
+        p6 = regex_engine.compile(r'^ip +pim +send\-rp\-discovery +(?P<send_rp_discovery_intf>[\w\/\.\-]+)'
+                                   r'( scope +(?P<send_rp_discovery_scope>\d+))?$')
 
         # ip pim ssm range 232.0.0.0/8
-        p7 = re.compile(r'^$')
+        p7 = regex_engine.compile(r'^$')
 
         # ip pim anycast-rp 10.9.126.126 10.16.2.2
         # ip pim anycast-rp 10.9.126.126 10.144.6.6
-        p8 = re.compile(r'^$')
+        p8 = regex_engine.compile(r'^$')
 
         # ip pim bsr forward listen
-        p9 = re.compile(r'^$')
+        p9 = regex_engine.compile(r'^$')
 
         # ip pim register-source loopback0
-        p10 = re.compile(r'^$')
+        p10 = regex_engine.compile(r'^$')
 
         # ip pim auto-rp forward listen
         # ----  ipv6 not supported -----
-        p11 = re.compile(r'^ip +pim +auto\-rp +forward +listen$')
+        p11 = regex_engine.compile(r'^ip +pim +auto\-rp +forward +listen$')
 
         for line in out.splitlines():
             if line and not line.startswith(' '):
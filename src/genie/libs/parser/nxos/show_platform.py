@@ -8,7 +8,6 @@ NXOS parser class for below commands:
         show processes memory | include <include>
         show cores
 """
-import re
 
 try:
     from pyats import tcl
@@ -18,10 +17,13 @@ except Exception:
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional, Or, And, Default, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 def regexp(expression):
     def match(value):
-        if re.match(expression,value):
+        if regex_engine.match(expression,value):
             return value
         else:
             raise TypeError("Value '%s' doesnt match regex '%s'"
@@ -100,7 +102,7 @@ class ShowVersion(ShowVersionSchema):
 
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Cisco +(?P<platform>[a-zA-Z]+) +Operating +System +\((?P<os>[A-Z\-]+)\)? +Software$')
+            p1 = regex_engine.compile(r'^\s*Cisco +(?P<platform>[a-zA-Z]+) +Operating +System +\((?P<os>[A-Z\-]+)\)? +Software$')
             m = p1.match(line)
             if m:
                 name = str(m.groupdict()['platform'])
@@ -114,7 +116,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['os'] = os
                 continue
 
-            p2 = re.compile(r'^\s*Software$')
+            p2 = regex_engine.compile(r'^\s*Software$')
             m = p2.match(line)
             if m:
 
@@ -122,7 +124,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software'] = {}
                 continue
 
-            p3 = re.compile(r'^\s*BIOS: +version +(?P<bios_version>[0-9\.]+)?$')
+            p3 = regex_engine.compile(r'^\s*BIOS: +version +(?P<bios_version>[0-9\.]+)?$')
             m = p3.match(line)
             if m:
 
@@ -132,7 +134,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['bios_version'] = bios_version
                 continue
 
-            p4 = re.compile(r'^\s*kickstart: +version +(?P<kickstart_version>[\w\.\(\)\[\]\s]+)$')
+            p4 = regex_engine.compile(r'^\s*kickstart: +version +(?P<kickstart_version>[\w\.\(\)\[\]\s]+)$')
             m = p4.match(line)
             if m:
                 kickstart_version = str(m.groupdict()['kickstart_version'])
@@ -142,7 +144,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # System version: 9.3(6)
-            p5 = re.compile(r'^\s*system: +version +(?P<system_version>[\w.\(\)]+)$')
+            p5 = regex_engine.compile(r'^\s*system: +version +(?P<system_version>[\w.\(\)]+)$')
             m = p5.match(line)
             if m:
                 system_version = str(m.groupdict()['system_version'])
@@ -154,7 +156,7 @@ class ShowVersion(ShowVersionSchema):
             # NXOS: version 9.3(6uu)I9(1uu) [build 9.3(6)]
             # Host NXOS: version 10.4(3) [build 10.4(2)IMG9(0.27)]
             # NXOS: version 10.2(3) [Feature Release]
-            p6 = re.compile(r'^\s*(Host )?NXOS: +version +(?P<system_version>[\w.\(\)]+)')
+            p6 = regex_engine.compile(r'^\s*(Host )?NXOS: +version +(?P<system_version>[\w.\(\)]+)')
             m = p6.match(line)
             if m:
                 system_version = str(m.groupdict()['system_version'])
@@ -163,7 +165,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_version'] = system_version
                 continue
 
-            p7 = re.compile(r'^\s*BIOS +compile +time: +(?P<bios_compile_time>[0-9\/]+)?$')
+            p7 = regex_engine.compile(r'^\s*BIOS +compile +time: +(?P<bios_compile_time>[0-9\/]+)?$')
             m = p7.match(line)
             if m:
                 bios_compile_time = str(m.groupdict()['bios_compile_time'])
@@ -172,7 +174,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['bios_compile_time'] = bios_compile_time
                 continue
 
-            p8 = re.compile(r'^\s*kickstart +image +file +is: +(?P<kickstart_image_file>[\w\:\/\-\.]+)$')
+            p8 = regex_engine.compile(r'^\s*kickstart +image +file +is: +(?P<kickstart_image_file>[\w\:\/\-\.]+)$')
             m = p8.match(line)
             if m:
                 kickstart_image_file = str(m.groupdict()['kickstart_image_file'])
@@ -181,7 +183,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['kickstart_image_file'] = kickstart_image_file
                 continue
 
-            p9 = re.compile(r'^\s*kickstart +compile +time: +(?P<kickstart_compile_time>[0-9\/\s\:\[\]]+)$')
+            p9 = regex_engine.compile(r'^\s*kickstart +compile +time: +(?P<kickstart_compile_time>[0-9\/\s\:\[\]]+)$')
             m = p9.match(line)
             if m:
                 kickstart_compile_time = str(m.groupdict()['kickstart_compile_time'])
@@ -190,7 +192,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['kickstart_compile_time'] = kickstart_compile_time
                 continue
 
-            p10 = re.compile(r'^\s*system +image +file +is: +(?P<system_image_file>[\w\:\/\-\.]+)$')
+            p10 = regex_engine.compile(r'^\s*system +image +file +is: +(?P<system_image_file>[\w\:\/\-\.]+)$')
             m = p10.match(line)
             if m:
                 system_image_file = str(m.groupdict()['system_image_file'])
@@ -199,7 +201,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_image_file'] = system_image_file
                 continue
 
-            p11 = re.compile(r'^\s*system +compile +time: +(?P<system_compile_time>[0-9\/\s\:\[\]]+)$')
+            p11 = regex_engine.compile(r'^\s*system +compile +time: +(?P<system_compile_time>[0-9\/\s\:\[\]]+)$')
             m = p11.match(line)
             if m:
                 system_compile_time = str(m.groupdict()['system_compile_time'])
@@ -208,7 +210,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_compile_time'] = system_compile_time
                 continue
 
-            p12 = re.compile(r'^\s*NXOS +image +file +is: +(?P<system_image_file>[\w\:\/\-\.]+)$')
+            p12 = regex_engine.compile(r'^\s*NXOS +image +file +is: +(?P<system_image_file>[\w\:\/\-\.]+)$')
             m = p12.match(line)
             if m:
                 system_image_file = str(m.groupdict()['system_image_file'])
@@ -217,7 +219,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_image_file'] = system_image_file
                 continue
 
-            p13 = re.compile(r'^\s*NXOS +compile +time: +(?P<system_compile_time>[0-9\/\s\:\[\]]+)$')
+            p13 = regex_engine.compile(r'^\s*NXOS +compile +time: +(?P<system_compile_time>[0-9\/\s\:\[\]]+)$')
             m = p13.match(line)
             if m:
                 system_compile_time = str(m.groupdict()['system_compile_time'])
@@ -226,7 +228,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['platform']['software']['system_compile_time'] = system_compile_time
                 continue
 
-            p14 = re.compile(r'^\s*Hardware$')
+            p14 = regex_engine.compile(r'^\s*Hardware$')
             m = p14.match(line)
             if m:
 
@@ -238,7 +240,7 @@ class ShowVersion(ShowVersionSchema):
             # cisco Nexus7000 C7009 (9 Slot) Chassis ("Supervisor Module-2")
             # cisco Nexus 5596 Chassis ("O2 48X10GE/Modular Supervisor")
             # cisco N9K-C93180YC-EX ("supervisor")
-            p15 = re.compile(r'^\s*cisco +(?P<model>[a-zA-Z0-9\-\s]+)'
+            p15 = regex_engine.compile(r'^\s*cisco +(?P<model>[a-zA-Z0-9\-\s]+)'
             #r'( +\((?P<slot>[0-9]+) Slot\))?( +[C|c]hassis)?( +\(\"(?P<rp>'
             r'( +\((?P<slot>[0-9]+) Slot\))?( +[C|c]hassis)( +\(\"(?P<rp>'
             #r'( +\((?P<slot>[0-9]+) Slot\))? +[C|c]hassis( +\(\"(?P<rp>'
@@ -264,7 +266,7 @@ class ShowVersion(ShowVersionSchema):
             # Intel(R) Xeon(R) CPU         with 32938744 kB of memory.
             # Intel(R) Core(TM) i3- CPU @ 2.50GHz with 12345678 kB of memory.
             # Intel(R) Celeron(R) M CPU with 2073416 kB of memory.
-            p16 = re.compile(r'^(?P<cpu>.*) +with +(?P<memory>[0-9a-zA-Z\s]+) +of +memory\.$')
+            p16 = regex_engine.compile(r'^(?P<cpu>.*) +with +(?P<memory>[0-9a-zA-Z\s]+) +of +memory\.$')
             m = p16.match(line)
             if m:
 
@@ -282,7 +284,7 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p17 = re.compile(r'^\s*Processor +Board +ID +(?P<processor_board_id>[A-Z0-9]+)$')
+            p17 = regex_engine.compile(r'^\s*Processor +Board +ID +(?P<processor_board_id>[A-Z0-9]+)$')
             m = p17.match(line)
             if m:
 
@@ -293,7 +295,7 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p18 = re.compile(r'^\s*Device name: +(?P<device_name>[a-zA-Z0-9\-\_]+)$')
+            p18 = regex_engine.compile(r'^\s*Device name: +(?P<device_name>[a-zA-Z0-9\-\_]+)$')
             m = p18.match(line)
             if m:
 
@@ -304,7 +306,7 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p19 = re.compile(r'^\s*bootflash: +(?P<bootflash>[a-zA-Z0-9\s]+)$')
+            p19 = regex_engine.compile(r'^\s*bootflash: +(?P<bootflash>[a-zA-Z0-9\s]+)$')
             m = p19.match(line)
             if m:
 
@@ -315,7 +317,7 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p20 = re.compile(r'^\s*slot0: +(?P<slot0>[a-zA-Z0-9\s]+) +\(expansion flash\)$')
+            p20 = regex_engine.compile(r'^\s*slot0: +(?P<slot0>[a-zA-Z0-9\s]+) +\(expansion flash\)$')
             m = p20.match(line)
             if m:
 
@@ -326,7 +328,7 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p21 = re.compile(r'^\s*Kernel +uptime +is +(?P<days>[0-9]+) +day\(s\), +(?P<hours>[0-9]+) +hour\(s\), +(?P<minutes>[0-9]+) +minute\(s\), +(?P<seconds>[0-9]+) +second\(s\)$')
+            p21 = regex_engine.compile(r'^\s*Kernel +uptime +is +(?P<days>[0-9]+) +day\(s\), +(?P<hours>[0-9]+) +hour\(s\), +(?P<minutes>[0-9]+) +minute\(s\), +(?P<seconds>[0-9]+) +second\(s\)$')
             m = p21.match(line)
             if m:
 
@@ -352,7 +354,7 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p22 = re.compile(r'^\s*Reason: +(?P<reason>[a-zA-Z0-9\s-]+)$')
+            p22 = regex_engine.compile(r'^\s*Reason: +(?P<reason>[a-zA-Z0-9\s-]+)$')
             m = p22.match(line)
             if m:
 
@@ -363,7 +365,7 @@ class ShowVersion(ShowVersionSchema):
 
                 continue
 
-            p23 = re.compile(r'^\s*System version: +(?P<system_version>[0-9\(\)\.]+)?$')
+            p23 = regex_engine.compile(r'^\s*System version: +(?P<system_version>[0-9\(\)\.]+)?$')
             m = p23.match(line)
             if m:
 
@@ -410,18 +412,18 @@ class ShowInventory(ShowInventorySchema):
         # NAME: "Chassis", DESCR: "NX-OSv Chassis"
         # NAME: "Slot 38",  DESCR: "Nexus7700 C7706 (6 Slot) Chassis Fan Module"
         # NAME: "FEX 106 Module 1",  DESCR: "Fabric Extender Module: 48x1GE, 4x10GE Supervisor"
-        p1 = re.compile(r'^NAME: +\"(?P<name>[\S\s]+)\", +DESCR: +\"(?P<description>[\S\s]+)\"$')
+        p1 = regex_engine.compile(r'^NAME: +\"(?P<name>[\S\s]+)\", +DESCR: +\"(?P<description>[\S\s]+)\"$')
 
-        p1_1 = re.compile(r'^Slot +(?P<slot>\d+)$')
+        p1_1 = regex_engine.compile(r'^Slot +(?P<slot>\d+)$')
 
         # NAME: "SAM 1",  DESCR: Service Accelarator Module
-        p1_2 = re.compile(r'^SAM +(?P<sam>\d+)$')
+        p1_2 = regex_engine.compile(r'^SAM +(?P<sam>\d+)$')
 
 
         # PID: N9K-NXOSV , VID: , SN: 92XXRQ9UCZS
         # PID: N9K-C9300-FAN2 , VID: V01 , SN: N/A
         # PID: N2K-C2248-FAN       ,  VID: N/A ,  SN: N/A
-        p2 = re.compile(r'^PID: +(?P<pid>[\S]*) +, +VID: +(?P<vid>[\S]*) *, +SN: *(?P<serial_number>[\S]*)?$')
+        p2 = regex_engine.compile(r'^PID: +(?P<pid>[\S]*) +, +VID: +(?P<vid>[\S]*) *, +SN: *(?P<serial_number>[\S]*)?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -497,12 +499,12 @@ class ShowInstallActive(ShowInstallActiveSchema):
 
         active_package_module_number = 0
 
-        p1 = re.compile(r'^\s*(?P<boot_images>[a-zA-Z\s]+):$')
-        p2 = re.compile(r'^\s*Kickstart Image: +(?P<kickstart_image>[a-zA-z0-9\:\/\-\.]+)$')
-        p3 = re.compile(r'^\s*System Image: +(?P<system_image>[a-zA-z0-9\:\/\-\.]+)$')
-        p4 = re.compile(r'^\s*Active Packages:$')
-        p5 = re.compile(r'^\s*Active Packages on Module #(?P<module_number>[0-9]+):$')
-        p6 = re.compile(r'^\s*(?P<active_package_name>[a-zA-z0-9\-\.]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<boot_images>[a-zA-Z\s]+):$')
+        p2 = regex_engine.compile(r'^\s*Kickstart Image: +(?P<kickstart_image>[a-zA-z0-9\:\/\-\.]+)$')
+        p3 = regex_engine.compile(r'^\s*System Image: +(?P<system_image>[a-zA-z0-9\:\/\-\.]+)$')
+        p4 = regex_engine.compile(r'^\s*Active Packages:$')
+        p5 = regex_engine.compile(r'^\s*Active Packages on Module #(?P<module_number>[0-9]+):$')
+        p6 = regex_engine.compile(r'^\s*(?P<active_package_name>[a-zA-z0-9\-\.]+)$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -596,7 +598,7 @@ class ShowRedundancyStatus(ShowRedundancyStatusSchema):
         for line in out.splitlines():
             line = line.rstrip()
             line = line.replace('\t', '  ')
-            p1 = re.compile(r'^\s*Redundancy mode$')
+            p1 = regex_engine.compile(r'^\s*Redundancy mode$')
             m = p1.match(line)
             if m:
                 if 'redundancy_mode' not in redundancy_dict:
@@ -604,7 +606,7 @@ class ShowRedundancyStatus(ShowRedundancyStatusSchema):
                 continue
 
             # Redundancy information not available for this platform
-            p1 = re.compile(r'^\s*Redundancy +information +not +available +for +this +platform$')
+            p1 = regex_engine.compile(r'^\s*Redundancy +information +not +available +for +this +platform$')
             m = p1.match(line)
             if m:
                 if 'redundancy_mode' not in redundancy_dict:
@@ -613,19 +615,19 @@ class ShowRedundancyStatus(ShowRedundancyStatusSchema):
                     redundancy_dict['redundancy_mode']['operational'] = 'none'
                 continue
 
-            p2 = re.compile(r'^\s*administrative: +(?P<administrative>[a-zA-z\s]+)$')
+            p2 = regex_engine.compile(r'^\s*administrative: +(?P<administrative>[a-zA-z\s]+)$')
             m = p2.match(line)
             if m:
                 redundancy_dict['redundancy_mode']['administrative'] = m.groupdict()['administrative']
                 continue
 
-            p3 = re.compile(r'^\s*operational: +(?P<operational>[a-zA-z\s]+)$')
+            p3 = regex_engine.compile(r'^\s*operational: +(?P<operational>[a-zA-z\s]+)$')
             m = p3.match(line)
             if m:
                 redundancy_dict['redundancy_mode']['operational'] = m.groupdict()['operational']
                 continue
 
-            p4 = re.compile(r'^\s*(This|Other) +supervisor +\(sup-(?P<sup_num>\d+)\)$')
+            p4 = regex_engine.compile(r'^\s*(This|Other) +supervisor +\(sup-(?P<sup_num>\d+)\)$')
             m = p4.match(line)
             if m:
                 sup_num = m.groupdict()['sup_num']
@@ -634,40 +636,40 @@ class ShowRedundancyStatus(ShowRedundancyStatusSchema):
                     redundancy_dict[key] = {}
                 continue
 
-            p6 = re.compile(r'^\s*Redundancy state: +(?P<redundancy_state>[a-zA-z\W\s]+)$')
+            p6 = regex_engine.compile(r'^\s*Redundancy state: +(?P<redundancy_state>[a-zA-z\W\s]+)$')
             m = p6.match(line)
             if m:
                 redundancy_dict[key]['redundancy_state'] = m.groupdict()['redundancy_state']
 
-            p7 = re.compile(r'^\s*Supervisor state: +(?P<supervisor_state>[a-zA-z\s]+)$')
+            p7 = regex_engine.compile(r'^\s*Supervisor state: +(?P<supervisor_state>[a-zA-z\s]+)$')
             m = p7.match(line)
             if m:
                 redundancy_dict[key]['supervisor_state'] = m.groupdict()['supervisor_state']
 
-            p8 = re.compile(r'^\s*Internal state: +(?P<internal_state>[a-zA-z\s]+)$')
+            p8 = regex_engine.compile(r'^\s*Internal state: +(?P<internal_state>[a-zA-z\s]+)$')
             m = p8.match(line)
             if m:
                 redundancy_dict[key]['internal_state'] = m.groupdict()['internal_state']
 
-            p9 = re.compile(r'^\s*System start time: +(?P<system_start_time>[a-zA-z0-9\:\s]+)$')
+            p9 = regex_engine.compile(r'^\s*System start time: +(?P<system_start_time>[a-zA-z0-9\:\s]+)$')
             m = p9.match(line)
             if m:
                 redundancy_dict['system_start_time'] = m.groupdict()['system_start_time']
                 continue
 
-            p10 = re.compile(r'^\s*System uptime: +(?P<system_uptime>[a-zA-z0-9\:\,\s]+)$')
+            p10 = regex_engine.compile(r'^\s*System uptime: +(?P<system_uptime>[a-zA-z0-9\:\,\s]+)$')
             m = p10.match(line)
             if m:
                 redundancy_dict['system_uptime'] = m.groupdict()['system_uptime']
                 continue
 
-            p11 = re.compile(r'^\s*Kernel uptime: +(?P<kernel_uptime>[a-zA-z0-9\:\,\s]+)$')
+            p11 = regex_engine.compile(r'^\s*Kernel uptime: +(?P<kernel_uptime>[a-zA-z0-9\:\,\s]+)$')
             m = p11.match(line)
             if m:
                 redundancy_dict['kernel_uptime'] = m.groupdict()['kernel_uptime']
                 continue
 
-            p12 = re.compile(r'^\s*Active supervisor uptime: +(?P<active_supervisor_time>[a-zA-z0-9\:\,\s]+)$')
+            p12 = regex_engine.compile(r'^\s*Active supervisor uptime: +(?P<active_supervisor_time>[a-zA-z0-9\:\,\s]+)$')
             m = p12.match(line)
             if m:
                 redundancy_dict['active_supervisor_time'] = m.groupdict()['active_supervisor_time']
@@ -733,7 +735,7 @@ class ShowBoot(ShowBootSchema):
         sup_number = None
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Current Boot Variables:$')
+            p1 = regex_engine.compile(r'^\s*Current Boot Variables:$')
             m = p1.match(line)
             if m:
                 boot_variable = 'current'
@@ -741,7 +743,7 @@ class ShowBoot(ShowBootSchema):
                     boot_dict['current_boot_variable'] = {}
                 continue
 
-            p2 = re.compile(r'^\s*Boot Variables on next reload:$')
+            p2 = regex_engine.compile(r'^\s*Boot Variables on next reload:$')
             m = p2.match(line)
             if m:
                 boot_variable = 'next'
@@ -749,7 +751,7 @@ class ShowBoot(ShowBootSchema):
                     boot_dict['next_reload_boot_variable'] = {}
                 continue
 
-            p3 = re.compile(r'^\s*sup-1$')
+            p3 = regex_engine.compile(r'^\s*sup-1$')
             m = p3.match(line)
             if m:
                 sup_number = 'sup-1'
@@ -765,7 +767,7 @@ class ShowBoot(ShowBootSchema):
                         boot_dict['next_reload_boot_variable']['sup_number']['sup-1'] = {}
                 continue
 
-            p4 = re.compile(r'^\s*sup-2$')
+            p4 = regex_engine.compile(r'^\s*sup-2$')
             m = p4.match(line)
             if m:
                 sup_number = 'sup-2'
@@ -782,7 +784,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
 
-            p5 = re.compile(r'^\s*kickstart variable = +(?P<kickstart_variable>[a-zA-z0-9\:\-\.\/\s]+)$')
+            p5 = regex_engine.compile(r'^\s*kickstart variable = +(?P<kickstart_variable>[a-zA-z0-9\:\-\.\/\s]+)$')
             m = p5.match(line)
             if m:
                 if boot_variable == 'current':
@@ -803,7 +805,7 @@ class ShowBoot(ShowBootSchema):
                         boot_dict['next_reload_boot_variable']['kickstart_variable'] = m.groupdict()['kickstart_variable']
                 continue
 
-            p6 = re.compile(r'^\s*system variable = +(?P<system_variable>[a-zA-z0-9\:\-\.\/\s]+)$')
+            p6 = regex_engine.compile(r'^\s*system variable = +(?P<system_variable>[a-zA-z0-9\:\-\.\/\s]+)$')
             m = p6.match(line)
             if m:
                 if boot_variable == 'current':
@@ -826,7 +828,7 @@ class ShowBoot(ShowBootSchema):
 
 
             # NXOS variable = bootflash:/ISSUCleanGolden.system.gbin
-            p5_1 = re.compile(r'^\s*NXOS +variable += +(?P<image>[a-zA-z0-9\:\-\.\/\s]+)$')
+            p5_1 = regex_engine.compile(r'^\s*NXOS +variable += +(?P<image>[a-zA-z0-9\:\-\.\/\s]+)$')
             m = p5_1.match(line)
             if m:
                 if boot_variable == 'current':
@@ -847,7 +849,7 @@ class ShowBoot(ShowBootSchema):
                         boot_dict['next_reload_boot_variable']['system_variable'] = m.groupdict()['image']
                 continue
 
-            p7 = re.compile(r'^\s*Boot POAP +(?P<boot_poap>[a-zA-z]+)$')
+            p7 = regex_engine.compile(r'^\s*Boot POAP +(?P<boot_poap>[a-zA-z]+)$')
             m = p7.match(line)
             if m:
                 if boot_variable == 'current':
@@ -975,45 +977,45 @@ class ShowModule(ShowModuleSchema):
 
         # Mod  Ports  Module-Type                         Model              Status
         # Mod SAM                   Module-Type                            Model           Status
-        p1 = re.compile(r'^\s*Mod.*$')
+        p1 = regex_engine.compile(r'^\s*Mod.*$')
 
         # Xbar Ports  Module-Type                         Model              Status
-        p2 = re.compile(r'^\s*Xbar.*$')
+        p2 = regex_engine.compile(r'^\s*Xbar.*$')
 
         # Lem Ports             Module-Type                      Model           Status
-        p2_1 = re.compile(r'^\s*Lem.*$')
+        p2_1 = regex_engine.compile(r'^\s*Lem.*$')
 
         # 1    1     Service Accelerator Module                       DPU-PART-NUM          ok
-        p2_3 = re.compile(r'^\s*(?P<module>\d+)\s+(?P<sam_number>\d+)\s+(?P<descr>Service Accelerator Module)\s+(?P<model>[A-Za-z0-9\-]+)\s+(?P<status>\S+)')
+        p2_3 = regex_engine.compile(r'^\s*(?P<module>\d+)\s+(?P<sam_number>\d+)\s+(?P<descr>Service Accelerator Module)\s+(?P<model>[A-Za-z0-9\-]+)\s+(?P<status>\S+)')
 
         # 1 18 1/10/25/40G IPS, 4/8/16/32G FC/Sup-4 DS-C9220I-K9-SUP active *
         # 8    36   36x400G QSFP56-DD Ethernet Module                N9K-X9836DM-A         ok
         # 27   0    Supervisor Module                                N9K-C9800-SUP-A       active *
         # 1    36   28x100/40G + 8x400G QSFP-DD Ethernet Module      N9K-C93600CD-GX
-        p3 = re.compile(r'^(?P<number>[0-9]+)\s+(?P<ports>[0-9]+)\s+(?P<module_type>.+?)\s+'
-                        r'((?P<model>[A-Z0-9v\-\+]+))?((\s+(?P<status>[a-z\- ]+)(\s\*)?)?)$')
+        p3 = regex_engine.compile(r'^(?P<number>[0-9]+)\s+(?P<ports>[0-9]+)\s+(?P<module_type>.+?)\s+'
+                                  r'((?P<model>[A-Z0-9v\-\+]+))?((\s+(?P<status>[a-z\- ]+)(\s\*)?)?)$')
 
 
         # 1 9.4(0)SK(0.135) 1.0 20:01:00:08:31:14:b7:60 to 20:10:00:08:31:14:b7:60
         # 7    10.3(2)IOV9(0.190)       1.0    LC7
         # 1    NA               3.1
-        p4 = re.compile(r'^(?P<number>[\d]+)\s+(?P<software>[A-Z0-9\(\)\.]+)\s+'
-                        r'(?P<hardware>\d+\.\d+)(\s+(?P<slot>[A-Z]+\d+))?'
-                        r'(\s+(?P<world_wide_name>[\w\:\s-]+))?$')
+        p4 = regex_engine.compile(r'^(?P<number>[\d]+)\s+(?P<software>[A-Z0-9\(\)\.]+)\s+'
+                                  r'(?P<hardware>\d+\.\d+)(\s+(?P<slot>[A-Z]+\d+))?'
+                                  r'(\s+(?P<world_wide_name>[\w\:\s-]+))?$')
 
         # 1 e0-69-ba-60-02-00 to e0-69-ba-60-02-0f JAE26361EB4
-        p5 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<mac_address>[a-zA-Z0-9\.\-\s]+) +(?P<serial_number>[A-Z0-9]+)$')
+        p5 = regex_engine.compile(r'^\s*(?P<number>[0-9]+) +(?P<mac_address>[a-zA-Z0-9\.\-\s]+) +(?P<serial_number>[A-Z0-9]+)$')
 
         # 7    Pass
-        p6 = re.compile(r'^\s*(?P<number>[0-9]+) +(?P<online_diag_status>[a-zA-Z]+)$')
+        p6 = regex_engine.compile(r'^\s*(?P<number>[0-9]+) +(?P<online_diag_status>[a-zA-Z]+)$')
 
         #  active *
-        p7 = re.compile(r'^\s*(?P<status>\S+)')
+        p7 = regex_engine.compile(r'^\s*(?P<status>\S+)')
 
         # 1    1    1.99.0-43                     FSJ2128000B      Pass
-        p8 = re.compile(r'^(?P<module>\d+)\s+(?P<sam_number>\d+)\s+(?P<software>\S+)'
-                        r'\s+(?P<hardware>\S+)?\s+(?P<serial_num>\S+)'
-                        r'(\s+(?P<diag_status>\S+))$')
+        p8 = regex_engine.compile(r'^(?P<module>\d+)\s+(?P<sam_number>\d+)\s+(?P<software>\S+)'
+                                  r'\s+(?P<hardware>\S+)?\s+(?P<serial_num>\S+)'
+                                  r'(\s+(?P<diag_status>\S+))$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -1296,7 +1298,7 @@ class Dir(DirSchema):
         date = None
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*(?P<size>[0-9]+) +(?P<month>[a-zA-Z]+) +(?P<day>[0-9]+) +(?P<time>[0-9\:]+) +(?P<year>[0-9]+) +(?P<file>[a-zA-Z0-9\.\/\_\-\+]+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<size>[0-9]+) +(?P<month>[a-zA-Z]+) +(?P<day>[0-9]+) +(?P<time>[0-9\:]+) +(?P<year>[0-9]+) +(?P<file>[a-zA-Z0-9\.\/\_\-\+]+)$')
             m = p1.match(line)
             if m:
                 file = m.groupdict()['file']
@@ -1309,7 +1311,7 @@ class Dir(DirSchema):
                 dir_dict['files'][file]['date'] = date
                 continue
 
-            p2 = re.compile(r'^\s*(?P<disk_space>[0-9]+) bytes +(?P<type>[a-z]+)$')
+            p2 = regex_engine.compile(r'^\s*(?P<disk_space>[0-9]+) bytes +(?P<type>[a-z]+)$')
             m = p2.match(line)
             if m:
                 disk_type = m.groupdict()['type']
@@ -1321,7 +1323,7 @@ class Dir(DirSchema):
                     dir_dict['disk_total_space'] = m.groupdict()['disk_space']
                 continue
 
-            p3 = re.compile(r'^\s*Usage +for +(?P<directory_name>[a-z\:]+).*$')
+            p3 = regex_engine.compile(r'^\s*Usage +for +(?P<directory_name>[a-z\:]+).*$')
             m = p3.match(line)
             if m:
                 dir_dict['dir'] = m.groupdict()['directory_name']
@@ -1372,12 +1374,12 @@ class ShowVdcDetail(ShowVdcDetailSchema):
         vdc_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Switchwide +mode +is +.*$')
+            p1 = regex_engine.compile(r'^\s*Switchwide +mode +is +.*$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*vdc +id: +(?P<id>[0-9]+)$')
+            p2 = regex_engine.compile(r'^\s*vdc +id: +(?P<id>[0-9]+)$')
             m = p2.match(line)
             if m:
                 identity = m.groupdict()['id']
@@ -1387,85 +1389,85 @@ class ShowVdcDetail(ShowVdcDetailSchema):
                     vdc_dict['vdc'][identity] = {}
                 continue
 
-            p2 = re.compile(r'^\s*vdc +name: +(?P<name>\S+)$')
+            p2 = regex_engine.compile(r'^\s*vdc +name: +(?P<name>\S+)$')
             m = p2.match(line)
             if m:
                 vdc_dict['vdc'][identity]['name'] = m.groupdict()['name']
                 continue
 
-            p3 = re.compile(r'^\s*vdc +state: +(?P<state>[a-z]+)$')
+            p3 = regex_engine.compile(r'^\s*vdc +state: +(?P<state>[a-z]+)$')
             m = p3.match(line)
             if m:
                 vdc_dict['vdc'][identity]['state'] = m.groupdict()['state']
                 continue
 
-            p4 = re.compile(r'^\s*vdc +mac +address: +(?P<mac>[a-z0-9\:]+)$')
+            p4 = regex_engine.compile(r'^\s*vdc +mac +address: +(?P<mac>[a-z0-9\:]+)$')
             m = p4.match(line)
             if m:
                 vdc_dict['vdc'][identity]['mac_address'] = m.groupdict()['mac']
                 continue
 
-            p5 = re.compile(r'^\s*vdc +ha +policy: +(?P<policy>[A-Z]+)$')
+            p5 = regex_engine.compile(r'^\s*vdc +ha +policy: +(?P<policy>[A-Z]+)$')
             m = p5.match(line)
             if m:
                 vdc_dict['vdc'][identity]['ha_policy'] = m.groupdict()['policy']
                 continue
 
-            p6 = re.compile(r'^\s*vdc +dual-sup +ha +policy: +(?P<dual_policy>[A-Z]+)$')
+            p6 = regex_engine.compile(r'^\s*vdc +dual-sup +ha +policy: +(?P<dual_policy>[A-Z]+)$')
             m = p6.match(line)
             if m:
                 vdc_dict['vdc'][identity]['dual_sup_ha_policy'] = m.groupdict()['dual_policy']
                 continue
 
-            p7 = re.compile(r'^\s*vdc +boot +Order: +(?P<boot_order>[0-9]+)$')
+            p7 = regex_engine.compile(r'^\s*vdc +boot +Order: +(?P<boot_order>[0-9]+)$')
             m = p7.match(line)
             if m:
                 vdc_dict['vdc'][identity]['boot_order'] = m.groupdict()['boot_order']
                 continue
 
-            p8 = re.compile(r'^\s*CPU +Share: +(?P<cpu_share>[0-9]+)$')
+            p8 = regex_engine.compile(r'^\s*CPU +Share: +(?P<cpu_share>[0-9]+)$')
             m = p8.match(line)
             if m:
                 vdc_dict['vdc'][identity]['cpu_share'] = m.groupdict()['cpu_share']
                 continue
 
-            p9 = re.compile(r'^\s*CPU +Share +Percentage: +(?P<cpu_share_percentage>[0-9\%]+)$')
+            p9 = regex_engine.compile(r'^\s*CPU +Share +Percentage: +(?P<cpu_share_percentage>[0-9\%]+)$')
             m = p9.match(line)
             if m:
                 vdc_dict['vdc'][identity]['cpu_share_percentage'] = m.groupdict()['cpu_share_percentage']
                 continue
 
-            p10 = re.compile(r'^\s*vdc +create +time: +(?P<vdc_create_time>[a-zA-Z0-9\:\s]+)$')
+            p10 = regex_engine.compile(r'^\s*vdc +create +time: +(?P<vdc_create_time>[a-zA-Z0-9\:\s]+)$')
             m = p10.match(line)
             if m:
                 vdc_dict['vdc'][identity]['create_time'] = m.groupdict()['vdc_create_time']
                 continue
 
-            p11 = re.compile(r'^\s*vdc +reload +count: +(?P<reload_count>[0-9]+)$')
+            p11 = regex_engine.compile(r'^\s*vdc +reload +count: +(?P<reload_count>[0-9]+)$')
             m = p11.match(line)
             if m:
                 vdc_dict['vdc'][identity]['reload_count'] = m.groupdict()['reload_count']
                 continue
 
-            p12 = re.compile(r'^\s*vdc +uptime: +(?P<uptime>[a-z0-9\(\)\s\,]+)$')
+            p12 = regex_engine.compile(r'^\s*vdc +uptime: +(?P<uptime>[a-z0-9\(\)\s\,]+)$')
             m = p12.match(line)
             if m:
                 vdc_dict['vdc'][identity]['uptime'] = m.groupdict()['uptime']
                 continue
 
-            p13 = re.compile(r'^\s*vdc +restart +count: +(?P<count>[0-9]+)$')
+            p13 = regex_engine.compile(r'^\s*vdc +restart +count: +(?P<count>[0-9]+)$')
             m = p13.match(line)
             if m:
                 vdc_dict['vdc'][identity]['restart_count'] = m.groupdict()['count']
                 continue
 
-            p14 = re.compile(r'^\s*vdc +restart +time: +(?P<restart_time>[a-zA-Z0-9\:\s]+)$')
+            p14 = regex_engine.compile(r'^\s*vdc +restart +time: +(?P<restart_time>[a-zA-Z0-9\:\s]+)$')
             m = p14.match(line)
             if m:
                 vdc_dict['vdc'][identity]['restart_time'] = m.groupdict()['restart_time']
                 continue
 
-            p15 = re.compile(r'^\s*vdc +type: +(?P<type>[a-zA-Z]+)$')
+            p15 = regex_engine.compile(r'^\s*vdc +type: +(?P<type>[a-zA-Z]+)$')
             m = p15.match(line)
             if m:
                 if 'vdc' not in vdc_dict:
@@ -1473,7 +1475,7 @@ class ShowVdcDetail(ShowVdcDetailSchema):
                 vdc_dict['vdc'][identity]['type'] = m.groupdict()['type']
                 continue
 
-            p16 = re.compile(r'^\s*vdc +supported +linecards: +(?P<linecards>[a-zA-Z0-9\s]+)$')
+            p16 = regex_engine.compile(r'^\s*vdc +supported +linecards: +(?P<linecards>[a-zA-Z0-9\s]+)$')
             m = p16.match(line)
             if m:
                 if 'vdc' not in vdc_dict:
@@ -1513,7 +1515,7 @@ class ShowVdcCurrent(ShowVdcCurrentSchema):
         ret_dict = {}
 
         # Current vdc is 1 - N95_1
-        p1 = re.compile(r'^Current +vdc +is +(?P<id>\d+) *- *(?P<name>\S+)$')
+        p1 = regex_engine.compile(r'^Current +vdc +is +(?P<id>\d+) *- *(?P<name>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1565,12 +1567,12 @@ class ShowVdcMembershipStatus(ShowVdcMembershipStatusSchema):
         port_number = None
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Flags : b - breakout port$')
+            p1 = regex_engine.compile(r'^\s*Flags : b - breakout port$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*vdc_id: +(?P<id>[0-9]+) +vdc_name: +(?P<name>\S+) +interfaces:$')
+            p2 = regex_engine.compile(r'^\s*vdc_id: +(?P<id>[0-9]+) +vdc_name: +(?P<name>\S+) +interfaces:$')
             m = p2.match(line)
             if m:
                 identity = m.groupdict()['id']
@@ -1585,12 +1587,12 @@ class ShowVdcMembershipStatus(ShowVdcMembershipStatusSchema):
                     member_status_vdc_dict['virtual_device'][identity]['membership'][vdc_name] = {}
                 continue
 
-            p3 = re.compile(r'^\s*Port +Status$')
+            p3 = regex_engine.compile(r'^\s*Port +Status$')
             m = p3.match(line)
             if m:
                 continue
 
-            p4 = re.compile(r'^\s*(?P<port_type>[a-zA-Z]+)(?P<port_number>[0-9a-z/\\(\)]+) +(?P<status>[A-Z]+)$')
+            p4 = regex_engine.compile(r'^\s*(?P<port_type>[a-zA-Z]+)(?P<port_number>[0-9a-z/\\(\)]+) +(?P<status>[A-Z]+)$')
             m = p4.match(line)
             if m:
                 port_type = m.groupdict()['port_type']
@@ -1656,12 +1658,12 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
             out = output
 
         #  8178  45387776  4294967295  1029939200  ffc31360/ffc311a0  bgp
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(\s+)?(?P<pid>\d+)\s+(?P<mem_alloc>\d+)\s+(?P<mem_limit>\d+)\s+(?P<mem_used>\d+)\s+(?P<stack_base_ptr>\S+)\s+(?P<process>\S+)'
         )
 
         # All processes: MemAlloc = 4693938176
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(\s+)?All\s+processes:\s+MemAlloc\s+=\s+(?P<all_mem_alloc>\d+)')
 
         for line in out.splitlines():
@@ -1744,17 +1746,17 @@ class ShowProcessesCpu(ShowProcessesCpuSchema):
         index = 0
 
         #   958          810       728      0   2.95%  nginx
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(\s+)?(?P<pid>\d+)\s+(?P<runtime_ms>\d+)\s+(?P<invoked>\d+)\s+(?P<usecs>\d+)\s+(?P<one_sec>\d+\.\d+)%\s+(?P<process>\S+)'
         )
 
         # CPU util  :    2.07% user,   29.01% kernel,   68.91% idle
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^(\s+)?CPU\s+util\s+:\s+(?P<user_percent>\d+\.\d+)%\s+user,\s+(?P<kernel_percent>\d+\.\d+)%\s+kernel,\s+(?P<idle_percent>\d+\.\d+)%\s+idle'
         )
 
         # CPU utilization for five seconds: 18%/7%; one minute: 20%; five minutes: 20%
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^(\s+)?CPU\s+utilization\s+for\s+five\s+seconds:\s+(?P<five_sec_cpu_total>\d+)%/(?P<five_sec_cpu_interrupts>\d+)%;\s+one\s+minute:\s+(?P<one_min_cpu>\d+)%;\s+five\s+minutes:\s+(?P<five_min_cpu>\d+)%'
         )
 
@@ -1829,7 +1831,7 @@ class ShowCores(ShowCoresSchema):
         ret_dict = {}
 
         # 1    27      1         bgp              8083      2020-08-16 16:16:25
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(\s+)?(?P<vdc>\d+)\s+(?P<module>\d+)\s+(?P<instance>\d+)\s+(?P<process_name>\S+)\s+(?P<pid>\d+)\s+(?P<date>.*)'
         )
 
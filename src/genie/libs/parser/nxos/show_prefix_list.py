@@ -7,13 +7,13 @@ NXOS parsers for the following show commands:
 
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ==============================================
 # Schema for 'show ip prefix-list'
@@ -67,8 +67,8 @@ class ShowIpPrefixList(ShowIpPrefixListSchema):
 
             # ip prefix-list test: 5 entries
             # ipv6 prefix-list test6: 4 entries
-            p1 = re.compile(r'^(ipv6|ip) +prefix\-list +(?P<name>\S+)\: +'
-                             r'(?P<entries>\d+) +entries$')
+            p1 = regex_engine.compile(r'^(ipv6|ip) +prefix\-list +(?P<name>\S+)\: +'
+                                       r'(?P<entries>\d+) +entries$')
             m = p1.match(line)
             if m:
                 name = m.groupdict()['name']
@@ -88,9 +88,9 @@ class ShowIpPrefixList(ShowIpPrefixListSchema):
             # seq 20 permit 10.94.0.0/8 ge 24
             # seq 25 permit 10.169.0.0/8 ge 16 le 24
             # seq 10 permit 192.0.2.0/24 eq 25
-            p3 = re.compile(r'^seq +(?P<seq>\d+) +(?P<action>\w+) +'
-                             r'(?P<prefixes>(?P<prefix>[\w\.\|:]+)\/(?P<mask>\d+))'
-                             r'( *(?P<range>[lgeq\d\s]+))?$')
+            p3 = regex_engine.compile(r'^seq +(?P<seq>\d+) +(?P<action>\w+) +'
+                                       r'(?P<prefixes>(?P<prefix>[\w\.\|:]+)\/(?P<mask>\d+))'
+                                       r'( *(?P<range>[lgeq\d\s]+))?$')
             m = p3.match(line)
             if m:
                 prefixes = m.groupdict()['prefixes']
@@ -106,26 +106,26 @@ class ShowIpPrefixList(ShowIpPrefixListSchema):
                 else:
                     dummy = dummy.strip()
                     # ge 16 le 24
-                    match = re.compile(r'^ge +(?P<val1>\d+) +le +(?P<val2>\d+)$').match(dummy)
+                    match = regex_engine.compile(r'^ge +(?P<val1>\d+) +le +(?P<val2>\d+)$').match(dummy)
                     if match:
                         masklength_range = '{val1}..{val2}'.format(val1=match.groupdict()['val1'],
                                                                    val2=match.groupdict()['val2'])
 
 
                     # le 16
-                    match = re.compile(r'^le +(?P<val2>\d+)$').match(dummy)
+                    match = regex_engine.compile(r'^le +(?P<val2>\d+)$').match(dummy)
                     if match:
                         masklength_range = '{val1}..{val2}'.format(val1=mask,
                                                                    val2=match.groupdict()['val2'])
 
                     # ge 16
-                    match = re.compile(r'^ge +(?P<val1>\d+)$').match(dummy)
+                    match = regex_engine.compile(r'^ge +(?P<val1>\d+)$').match(dummy)
                     if match:
                         max_val = '32' if af == 'ip' else '128'
                         masklength_range = '{val1}..{val2}'.format(val1=match.groupdict()['val1'],
                                                                    val2=max_val)
                     # eq 25
-                    match = re.compile(r'^eq +(?P<val1>\d+)$').match(dummy)
+                    match = regex_engine.compile(r'^eq +(?P<val1>\d+)$').match(dummy)
                     if match:
                         val = match.groupdict()['val1']
                         masklength_range = '{val1}..{val2}'.format(val1=val, val2=val)
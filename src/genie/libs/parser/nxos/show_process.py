@@ -4,14 +4,14 @@ NXOS parsers for the following show commands:
     * 'show processes'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================================================
 # Parser for 'show processes'
@@ -70,13 +70,13 @@ class ShowProcesses(ShowProcessesSchema):
             # 1      S  b8dffed3            1     -     O  init
             # 10      S         0            1     -     O  ksoftirqd/1
             # -     NR         -            0     -     X  wwn
-            p1 = re.compile(r'^((?P<pid>\d+)|\-)'
-                             r' +(?P<state>\w+)'
-                             r' +((?P<pc>\w+)|\-)'
-                             r' +(?P<start_cnt>\d+)'
-                             r' +((?P<tty>\d+)|\-)'
-                             r' +(?P<type>\w+)'
-                             r' +(?P<process>[\w\/\:\-\.]+)$')
+            p1 = regex_engine.compile(r'^((?P<pid>\d+)|\-)'
+                                       r' +(?P<state>\w+)'
+                                       r' +((?P<pc>\w+)|\-)'
+                                       r' +(?P<start_cnt>\d+)'
+                                       r' +((?P<tty>\d+)|\-)'
+                                       r' +(?P<type>\w+)'
+                                       r' +(?P<process>[\w\/\:\-\.]+)$')
             m = p1.match(line)
             if m:
                 process = m.groupdict()['process']
@@ -22,7 +22,6 @@ NXOS parser class for below commands:
     * show ip rip interface vrf all
 """
 import xmltodict
-import re
 
 try:
     from pyats import tcl
@@ -32,9 +31,12 @@ except Exception:
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And, Default, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 def regexp(expression):
     def match(value):
-        if re.match(expression,value):
+        if regex_engine.match(expression,value):
             return value
         else:
             raise TypeError("Value '%s' doesnt match regex '%s'"
@@ -628,54 +630,54 @@ class ShowIpRipVrfAll(ShowIpRipVrfAllSchema):
         address_family = self.address_family
 
         # RIP Isolate Mode: No
-        p1 = re.compile(r'^RIP +Isolate +Mode: +(?P<isolate_mode>(Yes|No))$')
+        p1 = regex_engine.compile(r'^RIP +Isolate +Mode: +(?P<isolate_mode>(Yes|No))$')
 
         # MMODE: Initialized
-        p2 = re.compile(r'^MMODE\: +(?P<mmode>[a-zA-Z]+)$')
+        p2 = regex_engine.compile(r'^MMODE\: +(?P<mmode>[a-zA-Z]+)$')
 
         # Process Name "rip-1" VRF "default"
-        p3 = re.compile(r'^Process +Name +\"(?P<instance>.+)\" +'
-                        r'VRF +\"(?P<vrf>.+)\"$')
+        p3 = regex_engine.compile(r'^Process +Name +\"(?P<instance>.+)\" +'
+                                  r'VRF +\"(?P<vrf>.+)\"$')
 
         # RIP port 520, multicast-group 224.0.0.9
-        p4 = re.compile(r'^RIP +port +(?P<port>\d+), +'
-                        r'multicast\-group +'
-                        r'(?P<multicast_group>[\w\:\/\.]+)$')
+        p4 = regex_engine.compile(r'^RIP +port +(?P<port>\d+), +'
+                                  r'multicast\-group +'
+                                  r'(?P<multicast_group>[\w\:\/\.]+)$')
 
         # Admin-distance: 120
-        p5 = re.compile(r'^Admin\-distance\: +(?P<distance>\d+)$')
+        p5 = regex_engine.compile(r'^Admin\-distance\: +(?P<distance>\d+)$')
 
         # Updates every 10 sec, expire in 21 sec
-        p6 = re.compile(r'^Updates +every +(?P<update_interval>\d+) +sec,'
-                        r' +expire +in +(?P<expire_in>\d+) +sec$')
+        p6 = regex_engine.compile(r'^Updates +every +(?P<update_interval>\d+) +sec,'
+                                  r' +expire +in +(?P<expire_in>\d+) +sec$')
 
         # Collect garbage in 23 sec
-        p7 = re.compile(r'^Collect +garbage +in +(?P<collect_garbage>\d+) '
-                        r'+sec$')
+        p7 = regex_engine.compile(r'^Collect +garbage +in +(?P<collect_garbage>\d+) '
+                                  r'+sec$')
 
         # Default-metric: 3
-        p8 = re.compile(r'^Default\-metric\: +(?P<default_metric>\d+)$')
+        p8 = regex_engine.compile(r'^Default\-metric\: +(?P<default_metric>\d+)$')
 
         # Max-paths: 16
-        p9 = re.compile(r'^Max\-paths\: +(?P<maximum_paths>\d+)$')
+        p9 = regex_engine.compile(r'^Max\-paths\: +(?P<maximum_paths>\d+)$')
 
         # Default-originate:
-        p10 = re.compile(r'^Default\-originate\: *'
-                         r'(?P<default_originate>[\s\S]+)?$')
+        p10 = regex_engine.compile(r'^Default\-originate\: *'
+                                   r'(?P<default_originate>[\s\S]+)?$')
 
         # Process is up and running
-        p11 = re.compile(r'^Process +is +(?P<process>.+)$')
+        p11 = regex_engine.compile(r'^Process +is +(?P<process>.+)$')
 
         #   Interfaces supported by ipv4 RIP :
         #     Ethernet1/1.100
         #     Ethernet1/2.100
-        p12 = re.compile(r'^(?P<interface>^(?!None)[\w\/\.]+)$')
+        p12 = regex_engine.compile(r'^(?P<interface>^(?!None)[\w\/\.]+)$')
 
         #   Redistributing :
         #     direct          policy ALL
         #     static          policy ALL
-        p13 = re.compile(r'^(?P<redistribute>\w+)\s+policy +'
-                         r'(?P<route_policy>[\w\-]+)$')
+        p13 = regex_engine.compile(r'^(?P<redistribute>\w+)\s+policy +'
+                                   r'(?P<route_policy>[\w\-]+)$')
 
         ret_dict = {}
         for line in out.splitlines():
@@ -851,29 +853,29 @@ class ShowIpRipRouteVrfAll(ShowIpRipRouteVrfAllSchema):
             out = output
 
         # Process Name "rip-1" VRF "default"
-        p1 = re.compile(r'^Process +Name +\"(?P<instance>.+)\" +'
-                        r'VRF +\"(?P<vrf>.+)\"$')
+        p1 = regex_engine.compile(r'^Process +Name +\"(?P<instance>.+)\" +'
+                                  r'VRF +\"(?P<vrf>.+)\"$')
 
         # RIP routing table
         # > - indicates best RIP route
 
         # >10.1.2.0/24 next-hops 0
         # >2001:db8:1:2::/64 next-hops 0
-        p2 = re.compile(r'^(?P<best>\>)? *(?P<route>[a-zA-Z0-9\.\/\:]+) +'
-                        r'next\-hops +(?P<next_hops>\d+)$')
+        p2 = regex_engine.compile(r'^(?P<best>\>)? *(?P<route>[a-zA-Z0-9\.\/\:]+) +'
+                                  r'next\-hops +(?P<next_hops>\d+)$')
 
         # via 10.1.2.1 Ethernet1/1.100, metric 1, tag 0, direct route
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^via +(?P<next_hop>[a-zA-Z0-9\.\/\:]+)( +(?P<interface>\S+))?, +'
             r'metric +(?P<metric>\d+), +tag +(?P<tag>\d+), +')
-        p3_1 = re.compile(r'.*(?P<route_type>((direct '
-                          r'+route)|external|external\-backup|rip))$')
+        p3_1 = regex_engine.compile(r'.*(?P<route_type>((direct '
+                                    r'+route)|external|external\-backup|rip))$')
 
         # via 10.1.2.2 Ethernet1/1.100, metric 3, tag 0, timeout 00:00:05
-        p3_2 = re.compile(r'.*timeout +(?P<expire_time>[\d\:]+)$')
+        p3_2 = regex_engine.compile(r'.*timeout +(?P<expire_time>[\d\:]+)$')
 
         # via 0.0.0.0, metric 15, tag 0, redistributed route
-        p3_3 = re.compile(r'.*redistributed +route$')
+        p3_3 = regex_engine.compile(r'.*redistributed +route$')
 
         ret_dict = {}
         address_family = "ipv4"
@@ -1019,30 +1021,30 @@ class ShowIpRipInterfaceVrfAll(ShowIpRipInterfaceVrfAllSchema):
             out = output
 
         # Process Name "rip-1" VRF "default"
-        p1 = re.compile(r'^Process +Name +\"(?P<instance>.+)\" +'
-                        r'VRF +\"(?P<vrf>.+)\"$')
+        p1 = regex_engine.compile(r'^Process +Name +\"(?P<instance>.+)\" +'
+                                  r'VRF +\"(?P<vrf>.+)\"$')
 
         # RIP-configured interface information
 
         # Ethernet1/1.100, protocol-up/link-up/admin-up, RIP state : up
-        p2 = re.compile(r'^(?P<interface>\S+), +'
-                        r'protocol\-(?P<protocol_state>(up|down))\/'
-                        r'link\-(?P<link_state>(up|down))\/'
-                        r'admin\-(?P<admin_state>(up|down)), +'
-                        r'RIP +state *\: +(?P<oper_status>(up|down))$')
+        p2 = regex_engine.compile(r'^(?P<interface>\S+), +'
+                                  r'protocol\-(?P<protocol_state>(up|down))\/'
+                                  r'link\-(?P<link_state>(up|down))\/'
+                                  r'admin\-(?P<admin_state>(up|down)), +'
+                                  r'RIP +state *\: +(?P<oper_status>(up|down))$')
 
         #   address/mask 10.1.2.1/24, metric 1, split-horizon, passive (
         # no outbound updates)
         #   address/mask 10.1.3.1/24, metric 1, split-horizon
-        p3 = re.compile(r'^address\/mask +(?P<ipv4>[\d\.\/]+),'
-                        r' +metric +(?P<metric>\d+)'
-                        r'(, +(?P<split_horizon>split\-horizon))?'
-                        r'(, +(?P<passive>passive)[a-zA-Z\(\) ]+)?$')
+        p3 = regex_engine.compile(r'^address\/mask +(?P<ipv4>[\d\.\/]+),'
+                                  r' +metric +(?P<metric>\d+)'
+                                  r'(, +(?P<split_horizon>split\-horizon))?'
+                                  r'(, +(?P<passive>passive)[a-zA-Z\(\) ]+)?$')
 
         # Authentication Mode: md5  Keychain: none
-        p4 = re.compile(r'Authentication +Mode\: +'
-                        r'(?P<crypto_algorithm>\w+) +'
-                        r'Keychain\: +(?P<key_chain>\w+)')
+        p4 = regex_engine.compile(r'Authentication +Mode\: +'
+                                  r'(?P<crypto_algorithm>\w+) +'
+                                  r'Keychain\: +(?P<key_chain>\w+)')
 
         address_family = 'ipv4'
         state_list = ['protocol_state', 'link_state', 'admin_state']
@@ -1,7 +1,9 @@
-import re   
 from genie.metaparser import MetaParser   
 from genie.metaparser.util.schemaengine import Schema, Any, Optional 
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowRouteMapSchema(MetaParser):
     """Schema for show route-map"""
@@ -76,9 +78,9 @@ class ShowRouteMap(ShowRouteMapSchema):
             line = line.rstrip()
 
             # route-map test, permit, sequence 10 
-            p1 =  re.compile(r'^\s*route-map *(?P<name>\S+)\,'
-                              r' *(?P<route_disposition>[\w\W]+)\, *sequence'
-                              r' *(?P<statements>[0-9]+)$')
+            p1 =  regex_engine.compile(r'^\s*route-map *(?P<name>\S+)\,'
+                                        r' *(?P<route_disposition>[\w\W]+)\, *sequence'
+                                        r' *(?P<statements>[0-9]+)$')
             m = p1.match(line)
             if m:
                 name = str(m.groupdict()['name'])
@@ -99,15 +101,15 @@ class ShowRouteMap(ShowRouteMapSchema):
                     continue
                     
             # description <description>
-            p1_1 = re.compile(r'^\s*description +(?P<description>[a-zA-Z0-9]+)$')
+            p1_1 = regex_engine.compile(r'^\s*description +(?P<description>[a-zA-Z0-9]+)$')
             m = p1_1.match(line)
             if m:
                 description = str(m.groupdict()['description'])
                 route_map_dict[name]['description'] = description
 
             # as-path (as-path filter): aspathlist1 
-            p2 = re.compile(r'^\s*as-path *\(as-path *filter\):'
-                             r' *(?P<match_as_path_list>[a-z0-9]+)$')
+            p2 = regex_engine.compile(r'^\s*as-path *\(as-path *filter\):'
+                                       r' *(?P<match_as_path_list>[a-z0-9]+)$')
             m = p2.match(line)
             if m:                
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -115,8 +117,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # as-number (as-path-list filter): List1, List2                 
-            p2_1 = re.compile(r'^\s*as-number *\(as-path-list *filter\)\:'
-                               r' *(?P<match_as_number_list>[\w\W\,\s]+)$')
+            p2_1 = regex_engine.compile(r'^\s*as-number *\(as-path-list *filter\)\:'
+                                         r' *(?P<match_as_number_list>[\w\W\,\s]+)$')
             m = p2_1.match(line)
             if m:
                 match_as_number_list = m.groupdict()['match_as_number_list']
@@ -128,8 +130,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # ip address prefix-lists: test-test 
-            p3 = re.compile(r'^\s*ip *address *prefix-lists:'
-                             r' *(?P<match_prefix_list>[a-zA-Z0-9\S]+)$')
+            p3 = regex_engine.compile(r'^\s*ip *address *prefix-lists:'
+                                       r' *(?P<match_prefix_list>[a-zA-Z0-9\S]+)$')
             m = p3.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -137,8 +139,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # ip address (access-lists): pbr-sample
-            p3_1 = re.compile(r'^\s*ip *address *\(access-lists\):'
-                             r' *(?P<match_access_list>[a-zA-Z0-9\-\S]+)$')
+            p3_1 = regex_engine.compile(r'^\s*ip *address *\(access-lists\):'
+                                       r' *(?P<match_access_list>[a-zA-Z0-9\-\S]+)$')
             m = p3_1.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -146,8 +148,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #ip next-hop prefix-lists: test
-            p4 =  re.compile(r'^\s*ip *next-hop *prefix-lists:'
-                              r' *(?P<match_nexthop_in>[a-zA-Z0-9\S]+)$')
+            p4 =  regex_engine.compile(r'^\s*ip *next-hop *prefix-lists:'
+                                        r' *(?P<match_nexthop_in>[a-zA-Z0-9\S]+)$')
             m = p4.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -155,8 +157,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # ipv6 address prefix-lists: test-test
-            p5 = re.compile(r'^\s*ipv6 *address *prefix-lists:'
-                             r' *(?P<match_prefix_list_v6>[a-zA-Z0-9\S]+)$')
+            p5 = regex_engine.compile(r'^\s*ipv6 *address *prefix-lists:'
+                                       r' *(?P<match_prefix_list_v6>[a-zA-Z0-9\S]+)$')
             m = p5.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -164,8 +166,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # ipv6 address (access-lists): pbr-sample
-            p5_1 = re.compile(r'^\s*ipv6 *address *\(access-lists\):'
-                             r' *(?P<match_access_list_v6>[a-zA-Z0-9\S]+)$')
+            p5_1 = regex_engine.compile(r'^\s*ipv6 *address *\(access-lists\):'
+                                       r' *(?P<match_access_list_v6>[a-zA-Z0-9\S]+)$')
             m = p5_1.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -173,8 +175,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # ipv6 next-hop prefix-lists: test2
-            p6 = re.compile(r'^\s*ipv6 *next-hop *prefix-lists:'
-                             r' *(?P<match_nexthop_in_v6>[a-zA-Z0-9\-\s]+)$')
+            p6 = regex_engine.compile(r'^\s*ipv6 *next-hop *prefix-lists:'
+                                       r' *(?P<match_nexthop_in_v6>[a-zA-Z0-9\-\s]+)$')
             m = p6.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -182,7 +184,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #interface: Ethernet2/2 
-            p7 = re.compile(r'^\s*interface: *(?P<match_interface>[a-zA-Z0-9\/\s]+)$')
+            p7 = regex_engine.compile(r'^\s*interface: *(?P<match_interface>[a-zA-Z0-9\/\s]+)$')
             m = p7.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -190,7 +192,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #metric: 20 
-            p8 = re.compile(r'^\s*metric: *(?P<match_med_eq>[0-9]+)$')
+            p8 = regex_engine.compile(r'^\s*metric: *(?P<match_med_eq>[0-9]+)$')
             m = p8.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -198,8 +200,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #community  (community-list filter): test3 
-            p10 = re.compile(r'^\s*community *\(community-list *filter\):'
-                              r' *(?P<match_community_list>[a-z0-9\-\s]+)$')
+            p10 = regex_engine.compile(r'^\s*community *\(community-list *filter\):'
+                                        r' *(?P<match_community_list>[a-z0-9\-\s]+)$')
             m = p10.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -207,7 +209,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #route-type: level-1 level-2
-            p11 = re.compile(r'^\s*route-type: *(?P<match_route_type>[a-z0-9\-\s]+)$')
+            p11 = regex_engine.compile(r'^\s*route-type: *(?P<match_route_type>[a-z0-9\-\s]+)$')
             m = p11.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -215,8 +217,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # extcommunity  (extcommunity-list filter): testing
-            p11_1 = re.compile(r'^\s*extcommunity *\(extcommunity-list *filter\):'
-                                r' *(?P<match_ext_community_list>[a-zA-Z]+)$')
+            p11_1 = regex_engine.compile(r'^\s*extcommunity *\(extcommunity-list *filter\):'
+                                          r' *(?P<match_ext_community_list>[a-zA-Z]+)$')
             m = p11_1.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -225,7 +227,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #tag: 20 
-            p11_2 = re.compile(r'^\s*tag: *(?P<match_tag_list>[0-9\s]+)$')
+            p11_2 = regex_engine.compile(r'^\s*tag: *(?P<match_tag_list>[0-9\s]+)$')
             m = p11_2.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['conditions']\
@@ -233,7 +235,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # ip next-hop 10.64.4.4 
-            p12 = re.compile(r'^\s*ip *next-hop *(?P<set_next_hop>[0-9a-z\.\-]+)$')
+            p12 = regex_engine.compile(r'^\s*ip *next-hop *(?P<set_next_hop>[0-9a-z\.\-]+)$')
             m = p12.match(line)
             if m:
                 if 'set_next_hop' in route_map_dict[name]['statements']\
@@ -245,7 +247,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                     ['set_next_hop'] = [m.groupdict()['set_next_hop']]
                 continue
             # ipv6 next-hop 2001:db8:1::1 
-            p13 = re.compile(r'^\s*ipv6 *next-hop *(?P<set_next_hop_v6>[a-z0-9\:]+)$')
+            p13 = regex_engine.compile(r'^\s*ipv6 *next-hop *(?P<set_next_hop_v6>[a-z0-9\:]+)$')
             m = p13.match(line)
             if m:
                 if 'set_next_hop_v6' in route_map_dict[name]['statements']\
@@ -257,7 +259,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                     ['set_next_hop_v6'] = [m.groupdict()['set_next_hop_v6']]
                 continue
             #tag 30
-            p14 = re.compile(r'^\s*tag *(?P<set_tag>[0-9]+)$')
+            p14 = regex_engine.compile(r'^\s*tag *(?P<set_tag>[0-9]+)$')
             m = p14.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -265,7 +267,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # weight 50
-            p14_1 = re.compile(r'^\s*weight *(?P<set_weight>[0-9]+)$')
+            p14_1 = regex_engine.compile(r'^\s*weight *(?P<set_weight>[0-9]+)$')
             m = p14_1.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -273,7 +275,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #metric 20 
-            p15 = re.compile(r'^\s*metric *(?P<set_med>[0-9]+)$')
+            p15 = regex_engine.compile(r'^\s*metric *(?P<set_med>[0-9]+)$')
             m = p15.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -281,7 +283,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #distance: 10
-            p15_1 = re.compile(r'^\s*distance: *(?P<set_distance>[0-9]+)$')
+            p15_1 = regex_engine.compile(r'^\s*distance: *(?P<set_distance>[0-9]+)$')
             m = p15_1.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -289,7 +291,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #metric-type external 
-            p16 = re.compile(r'^\s*metric-type *(?P<set_metric_type>[0-9a-z]+)$')
+            p16 = regex_engine.compile(r'^\s*metric-type *(?P<set_metric_type>[0-9a-z]+)$')
             m = p16.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -297,7 +299,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #level level-1 
-            p17 = re.compile(r'^\s*level *(?P<set_level>[a-z0-9\-]+)$')
+            p17 = regex_engine.compile(r'^\s*level *(?P<set_level>[a-z0-9\-]+)$')
             m = p17.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -305,7 +307,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #local-preference 20
-            p18 = re.compile(r'^\s*local-preference *(?P<set_local_pref>[0-9]+)$')
+            p18 = regex_engine.compile(r'^\s*local-preference *(?P<set_local_pref>[0-9]+)$')
             m = p18.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -313,7 +315,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #origin igp
-            p19 = re.compile(r'^\s*origin *(?P<set_route_origin>[a-z]+)$')
+            p19 = regex_engine.compile(r'^\s*origin *(?P<set_route_origin>[a-z]+)$')
             m = p19.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -321,8 +323,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # comm-list test delete
-            p20 = re.compile(r'^\s*comm-list *(?P<set_community_delete>[a-z]+)'
-                              ' *delete$')
+            p20 = regex_engine.compile(r'^\s*comm-list *(?P<set_community_delete>[a-z]+)'
+                                        ' *delete$')
             m = p20.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -330,10 +332,10 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #community 100:1 no-export no-advertise additive 
-            p20_1 = re.compile(r'^\s*community *(?P<set_community>[0-9\:]+)(?:'
-                                r' *(?P<set_community_no_export>(no-export)))?(?:'
-                                r' *(?P<set_community_no_advertise>(no-advertise)))?(?:'
-                                r' *(?P<set_community_additive>(additive)))?$')
+            p20_1 = regex_engine.compile(r'^\s*community *(?P<set_community>[0-9\:]+)(?:'
+                                          r' *(?P<set_community_no_export>(no-export)))?(?:'
+                                          r' *(?P<set_community_no_advertise>(no-advertise)))?(?:'
+                                          r' *(?P<set_community_additive>(additive)))?$')
             m = p20_1.match(line)
             if m:
                 set_community = str(m.groupdict()['set_community'])
@@ -352,8 +354,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #as-path prepend 10 10 10 
-            p21 = re.compile(r'^\s*as-path *prepend'
-                              r' *(?P<set_as_path_prepend>[0-9\s]+)$')
+            p21 = regex_engine.compile(r'^\s*as-path *prepend'
+                                        r' *(?P<set_as_path_prepend>[0-9\s]+)$')
             m = p21.match(line)
             if m:
                 set_as_path_prepend = str(m.groupdict()['set_as_path_prepend'])
@@ -375,8 +377,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             #extcomm-list cisco delete
-            p22 = re.compile(r'^\s*extcomm-list'
-                              r' *(?P<set_ext_community_delete>[a-z]+) *delete$')
+            p22 = regex_engine.compile(r'^\s*extcomm-list'
+                                        r' *(?P<set_ext_community_delete>[a-z]+) *delete$')
             m = p22.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -385,9 +387,9 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # extcommunity RT:100:10 additive 
-            p23 = re.compile(r'^\s*extcommunity'
-                              r' *RT:(?P<set_ext_community_rt>[0-9\:]+)'
-                              r' *(?P<set_ext_community_rt_additive>(additive))$')
+            p23 = regex_engine.compile(r'^\s*extcommunity'
+                                        r' *RT:(?P<set_ext_community_rt>[0-9\:]+)'
+                                        r' *(?P<set_ext_community_rt_additive>(additive))$')
             m = p23.match(line)
             if m:
 
@@ -403,8 +405,8 @@ class ShowRouteMap(ShowRouteMapSchema):
                 continue
 
             # extcommunity RT:100:10
-            p23_1 = re.compile(r'^\s*extcommunity'
-                                r' *RT:(?P<set_ext_community_rt>[0-9\:]+)$')
+            p23_1 = regex_engine.compile(r'^\s*extcommunity'
+                                          r' *RT:(?P<set_ext_community_rt>[0-9\:]+)$')
             m = p23_1.match(line)
             if m:
                 set_ext_community_rt = str(m.groupdict()['set_ext_community_rt'])
@@ -412,7 +414,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 ['set_ext_community_rt'] = set_ext_community_rt
                 continue
 
-            p24_1 = re.compile(r'^\s*(?P<clause>(Set clauses:))$')
+            p24_1 = regex_engine.compile(r'^\s*(?P<clause>(Set clauses:))$')
             m = p24_1.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -421,7 +423,7 @@ class ShowRouteMap(ShowRouteMapSchema):
                 ['route_disposition'] = route_disposition
 
             # level level-1
-            p25 = re.compile(r'^\s*level *(?P<set_level>([a-z0-9\s\-]+))$')
+            p25 = regex_engine.compile(r'^\s*level *(?P<set_level>([a-z0-9\s\-]+))$')
             m = p25.match(line)
             if m:
                 route_map_dict[name]['statements'][statements]['actions']\
@@ -41,9 +41,6 @@ NXOS parser for the following show commands:
     * show ip route summary
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
@@ -51,6 +48,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import regex_engine
 
 # =================================
 # Parser for 'show routing vrf all'
@@ -169,7 +167,7 @@ class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
             # IP Route Table for VRF "default"
             # IPv6 Routing Table for VRF "default"
             # IPv6 Routing Table for VRF "otv-vrf139"
-            p1 = re.compile(r'^(IP|IPv6) +(Route|Routing) +Table +for +VRF +"(?P<vrf>\S+)"$')
+            p1 = regex_engine.compile(r'^(IP|IPv6) +(Route|Routing) +Table +for +VRF +"(?P<vrf>\S+)"$')
             m = p1.match(line)
             if m:
                 vrf = str(m.groupdict()['vrf'])
@@ -185,9 +183,9 @@ class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
 
             # 10.144.0.1/32, ubest/mbest: 1/0 time, attached
             # 10.220.9.0/24, ubest/mbest: 1/0 time
-            p2 = re.compile(r'(?P<ip_mask>[\w\:\.\/]+), +ubest/mbest: +'
-                            r'(?P<ubest>\d+)/(?P<mbest>\d+)( +time)?'
-                            r'(, +(?P<attach>\w+))?$')
+            p2 = regex_engine.compile(r'(?P<ip_mask>[\w\:\.\/]+), +ubest/mbest: +'
+                                      r'(?P<ubest>\d+)/(?P<mbest>\d+)( +time)?'
+                                      r'(, +(?P<attach>\w+))?$')
             m = p2.match(line)
             if m:
                 # Init af dict
@@ -213,17 +211,17 @@ class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
             # via 10.13.110.1, Eth1/2.110, [110/41], 5d03h, ospf-1, intra
             # via 10.4.1.1, [200/0], 5d03h, bgp-65000, internal, tag 65000 (hidden)
             # *via 10.13.90.1, Eth1/2.90, [90/3072], 1w5d, eigrp-test, internal
-            p3 = re.compile(r'^(?P<cast>.*)via +(?P<nexthop>[\w\.\:\s]+)'
-                            r'(%(?P<table>[\w\:]+))?, *'
-                            r'((?P<int>[a-zA-Z0-9\./_]+),)? *'
-                            r'\[(?P<preference>\d+)/(?P<metric>\d+)\], *'
-                            r'(?P<up_time>[\w\:\.]+), *'
-                            r'(?P<protocol>\w+)(\-(?P<process>\w+))?,? *'
-                            r'(?P<attribute>\w+)?,? *'
-                            r'(tag *(?P<tag>\w+))?,? *(?P<vpn>[a-zA-Z\(\)\-]+)?'
-                            r',?( +segid:? +(?P<segid>\d+))?,?( +tunnelid: +'
-                            r'(?P<tunnelid>[0-9a-fA-Fx]+))?,?( +encap: +'
-                            r'(?P<encap>[a-zA-Z0-9]+))?$')
+            p3 = regex_engine.compile(r'^(?P<cast>.*)via +(?P<nexthop>[\w\.\:\s]+)'
+                                      r'(%(?P<table>[\w\:]+))?, *'
+                                      r'((?P<int>[a-zA-Z0-9\./_]+),)? *'
+                                      r'\[(?P<preference>\d+)/(?P<metric>\d+)\], *'
+                                      r'(?P<up_time>[\w\:\.]+), *'
+                                      r'(?P<protocol>\w+)(\-(?P<process>\w+))?,? *'
+                                      r'(?P<attribute>\w+)?,? *'
+                                      r'(tag *(?P<tag>\w+))?,? *(?P<vpn>[a-zA-Z\(\)\-]+)?'
+                                      r',?( +segid:? +(?P<segid>\d+))?,?( +tunnelid: +'
+                                      r'(?P<tunnelid>[0-9a-fA-Fx]+))?,?( +encap: +'
+                                      r'(?P<encap>[a-zA-Z0-9]+))?$')
             m = p3.match(line)
             if m:
                 cast = m.groupdict()['cast']
@@ -375,22 +373,22 @@ class ShowIpRouteSummary(ShowIpRouteSummarySchema):
 
         # IP Route Table for VRF "xxx"
         # IP Route Table for VRF "evpn-t-0003"
-        p1 = re.compile(r'^(IP|IPv6) +(Route|Routing) +Table +for +VRF +\"(?P<vrf>\S+)\"$')
+        p1 = regex_engine.compile(r'^(IP|IPv6) +(Route|Routing) +Table +for +VRF +\"(?P<vrf>\S+)\"$')
 
         # Total number of routes: 308
-        p2 = re.compile(r'^Total +number +of +(?P<route_path>\w+): +(?P<route_path_val>\d+)$')
+        p2 = regex_engine.compile(r'^Total +number +of +(?P<route_path>\w+): +(?P<route_path_val>\d+)$')
 
         # Best paths per protocol:      Backup paths per protocol:
-        p3 = re.compile(r'^Best +paths +per +protocol.*$')
+        p3 = regex_engine.compile(r'^Best +paths +per +protocol.*$')
 
         # am             : 214          ospf-1000      : 10
         # local          : 14
         # am             : 1            None
-        p4 = re.compile(r'^(?P<best>[\w-]+) +: +(?P<best_val>\d+)'
-                        r'( +(None|((?P<backup>\S+) +: +(?P<backup_val>\d+))))?$')
+        p4 = regex_engine.compile(r'^(?P<best>[\w-]+) +: +(?P<best_val>\d+)'
+                                  r'( +(None|((?P<backup>\S+) +: +(?P<backup_val>\d+))))?$')
 
         #   /8 : 1       /24: 4       /32: 12
-        p5 = re.compile(r'(?P<route_mask>/\d+) *: +(?P<route_mask_len>\d+)')
+        p5 = regex_engine.compile(r'(?P<route_mask>/\d+) *: +(?P<route_mask_len>\d+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -592,6 +590,11 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = [
         'updated']
 
+    # '| json' output is parsed with context='json', json_command is the
+    # command the arguments are appended to, in the order of cli_command
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+    json_command = 'show ip route'
+
     def sort_next_hop_list(self, obj: dict):
         for key, value in obj.items():
             if isinstance(value, dict):
@@ -704,7 +707,7 @@ class ShowIpRoute(ShowIpRouteSchema):
         # IP Route Table for Context "default"
         # IPv6 Routing Table for VRF "default"
         # IP Route Table for VRF "default"
-        p1 = re.compile(r'^\s*(?P<af>IPv6|IP) +Rout(?:e|ing) +Table +for (VRF|Context) +\"(?P<vrf>\S+)\"$')
+        p1 = regex_engine.compile(r'^\s*(?P<af>IPv6|IP) +Rout(?:e|ing) +Table +for (VRF|Context) +\"(?P<vrf>\S+)\"$')
 
         # 10.4.1.1/32, ubest/mbest: 2/0
         # 10.36.3.3/32, ubest/mbest: 2/0, attached
@@ -719,12 +722,12 @@ class ShowIpRoute(ShowIpRouteSchema):
         # 100.1.1.1/32, ubest/mbest: 2/0, all-best (0x63636363)
         # 222.1.1.0/24, ubest/mbest: 1/0, all-best
 
-        p2 = re.compile(r'^(?P<route>[\w\/\.\:]+), +(ubest/mbest: +'
-                        r'(?P<ubest_mbest>[\d\/]+)( +time)?)?((?P<ubest>\d+) '
-                        r'+ucast +next-hops, +(?P<mbest>\d+) +mcast +next-hops)?'
-                        r'(, +(?P<attached>[\w]+))?( +(?P<attached2>[\w]+))?'
-                        r'(\,)?( +(?P<direct>direct))?(\,)?( +(?P<pervasive>pervasive))?'
-                        r'(, +(all-best *\(?(?P<all_best>[0-9x]*)\)?)?)?$')
+        p2 = regex_engine.compile(r'^(?P<route>[\w\/\.\:]+), +(ubest/mbest: +'
+                                  r'(?P<ubest_mbest>[\d\/]+)( +time)?)?((?P<ubest>\d+) '
+                                  r'+ucast +next-hops, +(?P<mbest>\d+) +mcast +next-hops)?'
+                                  r'(, +(?P<attached>[\w]+))?( +(?P<attached2>[\w]+))?'
+                                  r'(\,)?( +(?P<direct>direct))?(\,)?( +(?P<pervasive>pervasive))?'
+                                  r'(, +(all-best *\(?(?P<all_best>[0-9x]*)\)?)?)?$')
 
         # *via 10.2.3.2, Eth1/4, [1/0], 01:01:30, static
         # *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra
@@ -739,17 +742,17 @@ class ShowIpRoute(ShowIpRouteSchema):
         # *via 10.55.130.3%default, [33/0], 3d10h, bgp-1, internal, tag 1 (evpn), segid: 50051 tunnelid: 0x64008203 encap: VXLAN
         # *via 2001:db8:626b:2101::3/128, [200/7], 01:51:32, bgp-10001, internal, tag 20001
         # *via 100.100.100.1%default, [200/0], 01:25:26, bgp-1000, internal, tag 3000, segid: 601011 (Asymmetric) tunnelid: 0x64646401 encap: VXLAN
-        p3 = re.compile(r'^\s*(?P<star>[*]+)?via +(?P<next_hop>[\s\w\:\.\/\%\!\#\$\*\+\-\;\=\@\^\_\{\}]+),'
-                        r'( +(?P<interface>[\w\/\.]+))?,? +\[(?P<route_preference>[\d\/]+)\],'
-                        r' +(?P<date>[0-9][\w\:]+)?,?( +(?P<source_protocol>[\w\-]+))?,?'
-                        r'( +(?P<source_protocol_status>[\w-]+))?,?( +tag +(?P<tag>[\d]+))?,?'
-                        r'( +\((?P<hidden>hidden)\))?'
-                        r'\s*(?P<vpn>[a-zA-Z\(\)\-]+)?,?( +segid:? +(?P<segid>\d+))?,?'
-                        r'( +\((?P<asymmetric>Asymmetric)\))?'
-                        r'( +tunnelid: +(?P<tunnelid>[0-9a-fA-Fx]+))?,?( +encap: +(?P<encap>[a-zA-Z0-9]+))?$')
+        p3 = regex_engine.compile(r'^\s*(?P<star>[*]+)?via +(?P<next_hop>[\s\w\:\.\/\%\!\#\$\*\+\-\;\=\@\^\_\{\}]+),'
+                                  r'( +(?P<interface>[\w\/\.]+))?,? +\[(?P<route_preference>[\d\/]+)\],'
+                                  r' +(?P<date>[0-9][\w\:]+)?,?( +(?P<source_protocol>[\w\-]+))?,?'
+                                  r'( +(?P<source_protocol_status>[\w-]+))?,?( +tag +(?P<tag>[\d]+))?,?'
+                                  r'( +\((?P<hidden>hidden)\))?'
+                                  r'\s*(?P<vpn>[a-zA-Z\(\)\-]+)?,?( +segid:? +(?P<segid>\d+))?,?'
+                                  r'( +\((?P<asymmetric>Asymmetric)\))?'
+                                  r'( +tunnelid: +(?P<tunnelid>[0-9a-fA-Fx]+))?,?( +encap: +(?P<encap>[a-zA-Z0-9]+))?$')
 
         #    tag 100
-        p4 = re.compile(r'^tag +(?P<tag>\d+)$')
+        p4 = regex_engine.compile(r'^tag +(?P<tag>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -1013,6 +1016,138 @@ class ShowIpRoute(ShowIpRouteSchema):
         self.sort_next_hop_list(result_dict)
         return result_dict
 
+    def _get_json_command(self, route=None, protocol=None, vrf=None,
+                          interface=None):
+        cmd = self.json_command
+        if route:
+            cmd += ' {}'.format(route)
+        if protocol:
+            cmd += ' {}'.format(protocol)
+        if interface:
+            cmd += ' interface {}'.format(interface)
+        if vrf:
+            cmd += ' vrf {}'.format(vrf)
+        return cmd + ' | json'
+
+    def json(self, route=None, protocol=None, vrf=None, interface=None,
+             output=None):
+        if output is None:
+            out = self.device.execute(self._get_json_command(
+                route=route, protocol=protocol, vrf=vrf, interface=interface))
+        else:
+            out = output
+
+        def _true(row, key):
+            return str(row.get(key, '')).lower() == 'true'
+
+        result_dict = {}
+
+        for vrf_row in Common.retrieve_json_rows(
+                Common.load_json_output(out), 'TABLE_vrf'):
+            for af_row in Common.retrieve_json_rows(vrf_row, 'TABLE_addrf'):
+                af = 'ipv6' if 'v6' in af_row.get('addrf', 'ipv4') else 'ipv4'
+                routes_dict = result_dict.setdefault('vrf', {}).\
+                    setdefault(vrf_row['vrf-name-out'], {}).\
+                    setdefault('address_family', {}).setdefault(af, {}).\
+                    setdefault('routes', {})
+
+                for prefix_row in Common.retrieve_json_rows(
+                        af_row, 'TABLE_prefix'):
+                    # "ipprefix": "10.4.1.1/32", "ucast-nhops": "2",
+                    # "mcast-nhops": "0", "attached": "false"
+                    route = prefix_row['ipprefix']
+                    route_dict = routes_dict.setdefault(route, {})
+                    route_dict['route'] = route
+                    route_dict['active'] = True
+                    route_dict['ubest'] = int(prefix_row['ucast-nhops'])
+                    route_dict['mbest'] = int(prefix_row['mcast-nhops'])
+                    for flag in ('attached', 'direct', 'pervasive'):
+                        if _true(prefix_row, flag):
+                            route_dict[flag] = True
+
+                    paths = Common.retrieve_json_rows(prefix_row, 'TABLE_path')
+                    for index, path_row in enumerate(paths, 1):
+                        # "ipnexthop": "10.2.3.2", "ifname": "Eth1/4",
+                        # "uptime": "PT1H1M30S", "pref": "1", "metric": "0",
+                        # "clientname": "ospf-1", "type": "intra",
+                        # "tag": "100", "ubest": "true"
+                        rp = int(path_row['pref'])
+                        metric = int(path_row['metric'])
+                        best = _true(path_row, 'ubest') or \
+                            _true(path_row, 'mbest')
+                        if best:
+                            route_dict['metric'] = metric
+                            route_dict['route_preference'] = rp
+
+                        source_protocol, _, process_id = \
+                            path_row.get('clientname', '').partition('-')
+                        if process_id:
+                            route_dict['process_id'] = process_id
+                        if 'tag' in path_row:
+                            route_dict['tag'] = int(path_row['tag'])
+                        if _true(path_row, 'hidden'):
+                            route_dict['hidden'] = True
+
+                        interface = Common.convert_intf_name(
+                            path_row['ifname']) if 'ifname' in path_row else ''
+                        updated = str(path_row.get('uptime', ''))
+                        if updated.startswith('P'):
+                            updated = Common.convert_xml_time(updated)
+
+                        next_hop_dict = route_dict.setdefault('next_hop', {})
+                        next_hop = path_row.get('ipnexthop')
+                        if not next_hop:
+                            interface_dict = next_hop_dict.setdefault(
+                                'outgoing_interface', {}).setdefault(
+                                    interface, {})
+                            if interface:
+                                interface_dict['outgoing_interface'] = \
+                                    interface
+                            if updated:
+                                interface_dict['updated'] = updated
+                            continue
+
+                        index_dict = next_hop_dict.setdefault(
+                            'next_hop_list', {}).setdefault(index, {})
+                        index_dict['index'] = index
+                        index_dict['next_hop'] = next_hop
+                        if source_protocol:
+                            route_dict['source_protocol'] = source_protocol
+                            index_dict['source_protocol'] = source_protocol
+                        if path_row.get('type'):
+                            route_dict['source_protocol_status'] = \
+                                path_row['type']
+                            index_dict['source_protocol_status'] = \
+                                path_row['type']
+                        if _true(path_row, 'ubest'):
+                            index_dict['best_ucast_nexthop'] = True
+                        elif _true(path_row, 'mbest'):
+                            index_dict['best_mcast_nexthop'] = True
+                        if updated:
+                            index_dict['updated'] = updated
+                        if interface:
+                            index_dict['outgoing_interface'] = interface
+                        if path_row.get('nhvrf'):
+                            index_dict['next_hop_vrf'] = path_row['nhvrf']
+                        index_dict['metric'] = metric
+                        index_dict['route_preference'] = rp
+                        if 'segid' in path_row:
+                            index_dict['segid'] = int(path_row['segid'])
+                        if 'tunnelid' in path_row:
+                            index_dict['tunnelid'] = path_row['tunnelid']
+                        if 'encap' in path_row:
+                            index_dict['encap'] = path_row['encap'].lower()
+                        for flag in ('stale', 'evpn'):
+                            if _true(path_row, flag):
+                                index_dict[flag] = True
+                        if _true(path_row, 'mpls-vpn'):
+                            index_dict['mpls_vpn'] = True
+                        elif _true(path_row, 'mpls'):
+                            index_dict['mpls'] = True
+
+        self.sort_next_hop_list(result_dict)
+        return result_dict
+
 
 # ====================================================
 #  parser for:
@@ -1072,6 +1207,7 @@ class ShowIpv6Route(ShowIpRoute):
                     'show ipv6 route vrf {vrf}',
                     'show ipv6 route vrf all',
                     'show ipv6 route']
+    json_command = 'show ipv6 route'
 
     exclude = [
         'updated',
@@ -1174,6 +1310,7 @@ class ShowRouting(ShowIpRoute):
         Parser for show routing
         show routing <ip>"""
     cli_command = ['show routing', 'show routing {protocol}']
+    json_command = 'show routing'
 
     def cli(self, protocol=None, route=None, vrf=None, interface=None, output=None, cmd=None):
 
@@ -9,9 +9,9 @@ NXOS parsers for the following show commands:
 
 
 # -*- coding: utf-8 -*-
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 #   ============================================    #
@@ -96,48 +96,48 @@ class ShowSpanningTreeMst(ShowSpanningTreeMstSchema):
             out = output
 
         ret_dict = {}
-        p1_1 = re.compile(r'^##### MST(?P<mst_id>\d+) +\s+vlans\s+mapped: '
-                          r'+\s+(?P<vlan>[\w+\-\w+,]{1,})$')
+        p1_1 = regex_engine.compile(r'^##### MST(?P<mst_id>\d+) +\s+vlans\s+mapped: '
+                                    r'+\s+(?P<vlan>[\w+\-\w+,]{1,})$')
             
-        p2_1 = re.compile(r'^Bridge +\saddress\s+(?P<b_address>\w+\.\w+.\w+)'
-                          r' +\spriority +\s(?P<b_priority>\d+)\s+\(\d+\s+sysid'
-                          r'\s+(?P<b_sysid>\d+)\)$')
+        p2_1 = regex_engine.compile(r'^Bridge +\saddress\s+(?P<b_address>\w+\.\w+.\w+)'
+                                    r' +\spriority +\s(?P<b_priority>\d+)\s+\(\d+\s+sysid'
+                                    r'\s+(?P<b_sysid>\d+)\)$')
 
-        p3_1 = re.compile(r'^Root +\s(?P<switch>\w+\s+\w+)\s+for\s+the\s+(?P<root>\w+)$')
+        p3_1 = regex_engine.compile(r'^Root +\s(?P<switch>\w+\s+\w+)\s+for\s+the\s+(?P<root>\w+)$')
         
-        p3_2= re.compile(r'^Regional\s+Root\s(?P<switch>\w+\s+\w+)$')
+        p3_2= regex_engine.compile(r'^Regional\s+Root\s(?P<switch>\w+\s+\w+)$')
 
-        p4_1 = re.compile(r'^(?P<mst_domain>\w+) +\shello\s+time\s+'
-                          r'(?P<hello_time>\d+),\s+forward\s+delay\s+'
-                          r'(?P<forward_delay>\d+),\s+max\s+age\s+(?P<max_age>\d+), '
-                          r'((txholdcount|max hops))\ *\s(?P<holdcount_or_maxhops>\d+)$')
+        p4_1 = regex_engine.compile(r'^(?P<mst_domain>\w+) +\shello\s+time\s+'
+                                    r'(?P<hello_time>\d+),\s+forward\s+delay\s+'
+                                    r'(?P<forward_delay>\d+),\s+max\s+age\s+(?P<max_age>\d+), '
+                                    r'((txholdcount|max hops))\ *\s(?P<holdcount_or_maxhops>\d+)$')
 
-        p5_1 = re.compile(r'^(?P<interface_name>\w+[\/\w+]{0,})\sof\s+\w+\s+is\s+(?P<port_state>\w+'
-                          r'(\s\w+)?)(\s+\(Bridge Assurance\s+(?P<bridge_assurance_inconsistent>\w+), '
-                          r'VPC Peer-link\s+(?P<vpc_peer_link_inconsistent>\w+)\)?)?$')
+        p5_1 = regex_engine.compile(r'^(?P<interface_name>\w+[\/\w+]{0,})\sof\s+\w+\s+is\s+(?P<port_state>\w+'
+                                    r'(\s\w+)?)(\s+\(Bridge Assurance\s+(?P<bridge_assurance_inconsistent>\w+), '
+                                    r'VPC Peer-link\s+(?P<vpc_peer_link_inconsistent>\w+)\)?)?$')
 
-        p6_1 = re.compile(r'^Port\s+info +\sport\s+id +\s(?P<port_id>\d+\.*\d+)'
-                          r' +\spriority +\s(?P<port_priority>\d+)'
-                          r' +\scost +\s(?P<port_cost>\d+)$')
+        p6_1 = regex_engine.compile(r'^Port\s+info +\sport\s+id +\s(?P<port_id>\d+\.*\d+)'
+                                    r' +\spriority +\s(?P<port_priority>\d+)'
+                                    r' +\scost +\s(?P<port_cost>\d+)$')
             
-        p7_1 = re.compile(r'^Designated\s+root +\saddress\s+(?P<d_root_address>'
-                          r'\w+\.\w+\.\w+) +\spriority +\s(?P<d_priority>\d+)'
-                          r' +\scost +\s(?P<d_cost>\d+)$')
+        p7_1 = regex_engine.compile(r'^Designated\s+root +\saddress\s+(?P<d_root_address>'
+                                    r'\w+\.\w+\.\w+) +\spriority +\s(?P<d_priority>\d+)'
+                                    r' +\scost +\s(?P<d_cost>\d+)$')
 
-        p7_2 = re.compile(r'Design.\s+regional\s+root\s+address\s+(?P<designated_regional_root_address>\w+\.\w+\.\w+) '
-                          r'+\spriority +\s(?P<designated_regional_root_priority>\d+) +\scost +\s(?P<designated_regional_root_cost>\d+)')
+        p7_2 = regex_engine.compile(r'Design.\s+regional\s+root\s+address\s+(?P<designated_regional_root_address>\w+\.\w+\.\w+) '
+                                    r'+\spriority +\s(?P<designated_regional_root_priority>\d+) +\scost +\s(?P<designated_regional_root_cost>\d+)')
 
-        p8_1 = re.compile(r'^Designated\s+bridge +\saddress\s+(?P<d_bridge_address>'
-                          r'\w+\.\w+\.\w+) +\spriority +\s(?P<d_bridge_priority>\d+)'
-                          r' +\sport\s+id\s+(?P<d_bridge_port_id>\d+(\.\d+)*)$')
+        p8_1 = regex_engine.compile(r'^Designated\s+bridge +\saddress\s+(?P<d_bridge_address>'
+                                    r'\w+\.\w+\.\w+) +\spriority +\s(?P<d_bridge_priority>\d+)'
+                                    r' +\sport\s+id\s+(?P<d_bridge_port_id>\d+(\.\d+)*)$')
             
-        p9_1 = re.compile(r'^Timers\:\s+message\s+expires\s+in\s+'
-                          r'(?P<message_expires_in>\d+)\s+sec,\s+forward'
-                          r'\s+delay\s+(?P<forward_delay>\d+),\s+forward'
-                          r'\s+transitions\s+(?P<forward_transitions>\d+)$')
+        p9_1 = regex_engine.compile(r'^Timers\:\s+message\s+expires\s+in\s+'
+                                    r'(?P<message_expires_in>\d+)\s+sec,\s+forward'
+                                    r'\s+delay\s+(?P<forward_delay>\d+),\s+forward'
+                                    r'\s+transitions\s+(?P<forward_transitions>\d+)$')
 
-        p10_1 = re.compile(r'^Bpdus\s+sent\s+(?P<bpdus_sent>\d+),'
-                           r'\s+received\s+(?P<bpdus_received>\d+)$')
+        p10_1 = regex_engine.compile(r'^Bpdus\s+sent\s+(?P<bpdus_sent>\d+),'
+                                     r'\s+received\s+(?P<bpdus_received>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -318,26 +318,26 @@ class ShowSpanningTreeSummary(ShowSpanningTreeSummarySchema):
 
         ret_dict = {}
 
-        p1 = re.compile(r'^Switch +is +in +(?P<mode>[\S]+) +mode(?: +\((?P<mst_type>[\w\s]+)\))?$')
-        p2 = re.compile(r'^Root +bridge +for: +(?P<root_bridge_for>[\S, ]+)$')
-        p3 = re.compile(r'^Port +Type +Default\s+is +(?P<port_type_default>\w+)$')
-        p4 = re.compile(r'^Edge\s+Port\s+\[PortFast\]\s+BPDU\s+(?P<port_type>\w+)'
-                        r'\s+Default\s+is\s+(?P<bpdu_bool>\w+)$')
-        p5 = re.compile(r'^Bridge +Assurance\s+is +(?P<bridge_assurance>\w+)$')
-        p6 = re.compile(r'^Loopguard +Default\s+is +(?P<loop_guard>\w+)$')
-        p7 = re.compile(r'^(?:Configured +)?Pathcost +method +used\s+is '
-                        r'+(?P<path_cost_method>\w+)(?: +\(Operational +value +is +(?P<operational_value>\w+)\))?$')
-        p8 = re.compile(r'^PVST\s+Simulation +\s+is\s+(?P<pvst_simulation>\w+)$')
-        p9 = re.compile(r'^vPC +peer-switch\s+is +(?P<vpc_peer_switch>\w+)(?: +\((?P<vpc_peer_switch_status>[\S]+)?\))$')
-        p10 = re.compile(r'^STP-Lite\s+is +(?P<stp_lite>\w+)$')
-        p11 = re.compile(r'^(?P<mode_name>\w+) *\s+(?P<blocking>\d+) '
-                         r'*\s+(?P<listening>\d+) *\s+(?P<learning>\d+) '
-                         r'*\s+(?P<forwarding>\d+) *\s+(?P<stp_active>\d+)$')
-        p12 = re.compile(r'^\d+\s+\w+ *\s+(?P<blockings>\d+) '
-                         r'*\s+(?P<listenings>\d+) *\s+(?P<learnings>\d+) '
-                         r'*\s+(?P<forwardings>\d+) *\s+(?P<stp_actives>\d+)$')
-
-        p13 = re.compile(r'^(?P<root_bridge_for>(?:(?:[\w-]+, +)+)?[\w-]+)$')
+        p1 = regex_engine.compile(r'^Switch +is +in +(?P<mode>[\S]+) +mode(?: +\((?P<mst_type>[\w\s]+)\))?$')
+        p2 = regex_engine.compile(r'^Root +bridge +for: +(?P<root_bridge_for>[\S, ]+)$')
+        p3 = regex_engine.compile(r'^Port +Type +Default\s+is +(?P<port_type_default>\w+)$')
+        p4 = regex_engine.compile(r'^Edge\s+Port\s+\[PortFast\]\s+BPDU\s+(?P<port_type>\w+)'
+                                  r'\s+Default\s+is\s+(?P<bpdu_bool>\w+)$')
+        p5 = regex_engine.compile(r'^Bridge +Assurance\s+is +(?P<bridge_assurance>\w+)$')
+        p6 = regex_engine.compile(r'^Loopguard +Default\s+is +(?P<loop_guard>\w+)$')
+        p7 = regex_engine.compile(r'^(?:Configured +)?Pathcost +method +used\s+is '
+                                  r'+(?P<path_cost_method>\w+)(?: +\(Operational +value +is +(?P<operational_value>\w+)\))?$')
+        p8 = regex_engine.compile(r'^PVST\s+Simulation +\s+is\s+(?P<pvst_simulation>\w+)$')
+        p9 = regex_engine.compile(r'^vPC +peer-switch\s+is +(?P<vpc_peer_switch>\w+)(?: +\((?P<vpc_peer_switch_status>[\S]+)?\))$')
+        p10 = regex_engine.compile(r'^STP-Lite\s+is +(?P<stp_lite>\w+)$')
+        p11 = regex_engine.compile(r'^(?P<mode_name>\w+) *\s+(?P<blocking>\d+) '
+                                   r'*\s+(?P<listening>\d+) *\s+(?P<learning>\d+) '
+                                   r'*\s+(?P<forwarding>\d+) *\s+(?P<stp_active>\d+)$')
+        p12 = regex_engine.compile(r'^\d+\s+\w+ *\s+(?P<blockings>\d+) '
+                                   r'*\s+(?P<listenings>\d+) *\s+(?P<learnings>\d+) '
+                                   r'*\s+(?P<forwardings>\d+) *\s+(?P<stp_actives>\d+)$')
+
+        p13 = regex_engine.compile(r'^(?P<root_bridge_for>(?:(?:[\w-]+, +)+)?[\w-]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -573,88 +573,88 @@ class ShowSpanningTreeDetail(ShowSpanningTreeDetailSchema):
 
         ret_dict = {}
 
-        p1 = re.compile(r'^(MST|VLAN)?(?P<inst>\w+)\s+is\s+executing\s'
-                        r'+the\s+(?P<mode>\w+)\s+compatible\s+Spanning\s+'
-                        r'Tree\s+protocol$')
+        p1 = regex_engine.compile(r'^(MST|VLAN)?(?P<inst>\w+)\s+is\s+executing\s'
+                                  r'+the\s+(?P<mode>\w+)\s+compatible\s+Spanning\s+'
+                                  r'Tree\s+protocol$')
 
         # Bridge Identifier has priority 12345, sysid 0, address aa00.aaff.aa00
-        p2 = re.compile(r'^Bridge\s+Identifier\s+has\s+priority\s+'
-                        r'(?P<bridge_priority>\d+),\s+sysid\s+'
-                        r'(?P<bridge_sysid>\d+),\s+address\s+'
-                        r'(?P<bridge_address>\w+\.\w+\.\w+)$')
+        p2 = regex_engine.compile(r'^Bridge\s+Identifier\s+has\s+priority\s+'
+                                  r'(?P<bridge_priority>\d+),\s+sysid\s+'
+                                  r'(?P<bridge_sysid>\d+),\s+address\s+'
+                                  r'(?P<bridge_address>\w+\.\w+\.\w+)$')
 
-        p3 = re.compile(r'^Configured\s+hello\s+time\s+(?P<hello_time>\d+)'
-                        r'(?:, +fex +hello +time +(?P<fex_hello_time>\d+))?'
-                        r',\s+max\s+age\s+(?P<max_age>\d+),\s+forward\s+delay'
-                        r'\s+(?P<forwarding_delay>\d+)$')
+        p3 = regex_engine.compile(r'^Configured\s+hello\s+time\s+(?P<hello_time>\d+)'
+                                  r'(?:, +fex +hello +time +(?P<fex_hello_time>\d+))?'
+                                  r',\s+max\s+age\s+(?P<max_age>\d+),\s+forward\s+delay'
+                                  r'\s+(?P<forwarding_delay>\d+)$')
 
-        p3_1 = re.compile(r'^We\s+(?P<root_of_the_spanning_tree>\w+[\'\w+]*)\s+the\s+'
-                          r'root\s+of\s+the\s+spanning\s+tree$')
+        p3_1 = regex_engine.compile(r'^We\s+(?P<root_of_the_spanning_tree>\w+[\'\w+]*)\s+the\s+'
+                                    r'root\s+of\s+the\s+spanning\s+tree$')
 
-        p4 = re.compile(r'^Topology\s+change\s+flag\s+(?P<topology_change_flag>'
-                        r'[\w\s]+),\s+detected\s+flag\s+(?P<topology_detected_flag>[\w\s]+)$')
+        p4 = regex_engine.compile(r'^Topology\s+change\s+flag\s+(?P<topology_change_flag>'
+                                  r'[\w\s]+),\s+detected\s+flag\s+(?P<topology_detected_flag>[\w\s]+)$')
 
-        p5 = re.compile(r'^Number\s+of\s+topology\s+changes\s+(?P<topology_changes>\d+)'
-                        r'\s+last\s+change\s+occurred\s+(?P<time_since_topology_change>'
-                        r'[\w\.\:]+)(\s+ago)?$')
+        p5 = regex_engine.compile(r'^Number\s+of\s+topology\s+changes\s+(?P<topology_changes>\d+)'
+                                  r'\s+last\s+change\s+occurred\s+(?P<time_since_topology_change>'
+                                  r'[\w\.\:]+)(\s+ago)?$')
 
-        p6 = re.compile(r'^Times\:\s+hold\s+(?P<hold>\d+),\s+topology'
-                        r'\s+change\s+(?P<topology_change>\d+),'
-                        r'\s+notification\s+(?P<notification>\d+)$')
+        p6 = regex_engine.compile(r'^Times\:\s+hold\s+(?P<hold>\d+),\s+topology'
+                                  r'\s+change\s+(?P<topology_change>\d+),'
+                                  r'\s+notification\s+(?P<notification>\d+)$')
 
-        p7 = re.compile(r'^hello +(?P<hello>\d+), +max +age +(?P<max_age>\d+),'
-                        r' +forward +delay +(?P<forwarding_delay>[\d]+)')
+        p7 = regex_engine.compile(r'^hello +(?P<hello>\d+), +max +age +(?P<max_age>\d+),'
+                                  r' +forward +delay +(?P<forwarding_delay>[\d]+)')
 
-        p8 = re.compile(r'^Timers:\s+hello\s+(?P<hello>\d+),'
-                        r'\s+topology\s+change\s+(?P<topology_change>\d+)'
-                        r',\s+notification\s+(?P<notification>\d+)'
-                        r'(,\s+aging\s+(?P<aging>\d+))?$')
+        p8 = regex_engine.compile(r'^Timers:\s+hello\s+(?P<hello>\d+),'
+                                  r'\s+topology\s+change\s+(?P<topology_change>\d+)'
+                                  r',\s+notification\s+(?P<notification>\d+)'
+                                  r'(,\s+aging\s+(?P<aging>\d+))?$')
 
-        p9 = re.compile(r'^Port +(?P<port_num>\d+) +\((?P<name>[\S]+)'
-                        r'(?:(, +[\w\s\-]+))?\) +of +(?P<inst>\w+) +is +(?P<status>\w+)')
+        p9 = regex_engine.compile(r'^Port +(?P<port_num>\d+) +\((?P<name>[\S]+)'
+                                  r'(?:(, +[\w\s\-]+))?\) +of +(?P<inst>\w+) +is +(?P<status>\w+)')
 
-        p9_1 = re.compile(r'^ce (?P<bridge_assurance_inconsistent>\w+)\,\s+VPC\sPeer'
-                          r'\-link\s+(?P<vpc_peer_link_inconsistent>\w+)\)$')
+        p9_1 = regex_engine.compile(r'^ce (?P<bridge_assurance_inconsistent>\w+)\,\s+VPC\sPeer'
+                                    r'\-link\s+(?P<vpc_peer_link_inconsistent>\w+)\)$')
 
-        p10 = re.compile(r'^Port\s+path\s+cost\s+(?P<cost>\d+),'
-                         r'\s+Port\s+priority\s+(?P<port_priority>\d+),'
-                         r'\s+Port\s+Identifier\s+(?P<port_identifier>[\w\.]+)$')
+        p10 = regex_engine.compile(r'^Port\s+path\s+cost\s+(?P<cost>\d+),'
+                                   r'\s+Port\s+priority\s+(?P<port_priority>\d+),'
+                                   r'\s+Port\s+Identifier\s+(?P<port_identifier>[\w\.]+)$')
 
-        p11 = re.compile(r'Designated\s+root\s+has\s+priority\s+'
-                         r'(?P<designated_root_priority>\d+),'
-                         r'\s+address\s+(?P<designated_root_address>[\w\.]+)')
+        p11 = regex_engine.compile(r'Designated\s+root\s+has\s+priority\s+'
+                                   r'(?P<designated_root_priority>\d+),'
+                                   r'\s+address\s+(?P<designated_root_address>[\w\.]+)')
 
-        p12 = re.compile(r'^Designated\s+bridge\s+has\s+priority\s+'
-                         r'(?P<designated_bridge_priority>\d+),\s+'
-                         r'address\s+(?P<designated_bridge_address>[\w\.]+)$')
+        p12 = regex_engine.compile(r'^Designated\s+bridge\s+has\s+priority\s+'
+                                   r'(?P<designated_bridge_priority>\d+),\s+'
+                                   r'address\s+(?P<designated_bridge_address>[\w\.]+)$')
 
-        p13 = re.compile(r'^Designated\s+port\s+id\s+is\s+'
-                         r'(?P<designated_port_id>[\w\.]+),\s+designated'
-                         r'\s+path\s+cost\s+(?P<designated_path_cost>\d+)'
-                         r'(, +(?P<topology_change>Topology +change +is +set))?$')
+        p13 = regex_engine.compile(r'^Designated\s+port\s+id\s+is\s+'
+                                   r'(?P<designated_port_id>[\w\.]+),\s+designated'
+                                   r'\s+path\s+cost\s+(?P<designated_path_cost>\d+)'
+                                   r'(, +(?P<topology_change>Topology +change +is +set))?$')
 
-        p14 = re.compile(r'^Timers:\s+message\s+age\s+(?P<message_age>\-?\d+),'
-                         r'\s+forward\s+delay\s+(?P<forward_delay>\d+),'
-                         r'\s+hold\s+(?P<hold>\d+)$')
+        p14 = regex_engine.compile(r'^Timers:\s+message\s+age\s+(?P<message_age>\-?\d+),'
+                                   r'\s+forward\s+delay\s+(?P<forward_delay>\d+),'
+                                   r'\s+hold\s+(?P<hold>\d+)$')
 
-        p15 = re.compile(r'^Number\s+of\s+transitions\s+to\s+forwarding'
-                         r'\s+state:\s+(?P<number_of_forward_transitions>\d+)$')
+        p15 = regex_engine.compile(r'^Number\s+of\s+transitions\s+to\s+forwarding'
+                                   r'\s+state:\s+(?P<number_of_forward_transitions>\d+)$')
 
-        p15_1 = re.compile(r'^The +port +type +is +(?P<port_type>[\S]+)$')
+        p15_1 = regex_engine.compile(r'^The +port +type +is +(?P<port_type>[\S]+)$')
 
-        p16 = re.compile(r'^Link +type +is +(?P<link_type>[\w\-]+) ?(by default)?'
-                         r',? ?(?P<internal>[I|i]nternal)?'
-                         r',? ?(Peer is (?P<peer_type>\S+))?$')
+        p16 = regex_engine.compile(r'^Link +type +is +(?P<link_type>[\w\-]+) ?(by default)?'
+                                   r',? ?(?P<internal>[I|i]nternal)?'
+                                   r',? ?(Peer is (?P<peer_type>\S+))?$')
 
-        p17 = re.compile(r'^PVST\s+Simulation\s+is\s+'
-                         r'(?P<pvst_simulation>\w+)\s+by\s+default$')
+        p17 = regex_engine.compile(r'^PVST\s+Simulation\s+is\s+'
+                                   r'(?P<pvst_simulation>\w+)\s+by\s+default$')
 
-        p18 = re.compile(r'^BPDU:\s+sent\s+(?P<bpdu_sent>\d+),'
-                         r'\s+received\s+(?P<bpdu_received>\d+)$')
+        p18 = regex_engine.compile(r'^BPDU:\s+sent\s+(?P<bpdu_sent>\d+),'
+                                   r'\s+received\s+(?P<bpdu_received>\d+)$')
 
-        p19 = re.compile(r'^from +(?P<topology_from_port>[\w\.\/\-]+)$')
+        p19 = regex_engine.compile(r'^from +(?P<topology_from_port>[\w\.\/\-]+)$')
 
-        p20 = re.compile(r'^Root +guard +is (?P<root_guard>\S+)$')
+        p20 = regex_engine.compile(r'^Root +guard +is (?P<root_guard>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -890,10 +890,10 @@ class ShowErrdisableRecovery(ShowErrdisableRecoverySchema):
         # link-flap                       disabled
         # udld                            disabled
         # CMM miscabling                  disabled
-        p1 = re.compile(r'^(?P<name>[\w\s\-]+) '
-                        r'+(?P<status>[D|d]isabled|[e|E]nabled)$')
+        p1 = regex_engine.compile(r'^(?P<name>[\w\s\-]+) '
+                                  r'+(?P<status>[D|d]isabled|[e|E]nabled)$')
         # Timer interval: 300
-        p2 = re.compile(r'^Timer +interval\: +(?P<interval>\d+)$')
+        p2 = regex_engine.compile(r'^Timer +interval\: +(?P<interval>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -960,30 +960,30 @@ class ShowSpanningTreeIssuImpact(ShowSpanningTreeIssuImpactSchema):
         parsed_dict = {}
 
         # 1. No Topology change must be active in any STP instance
-        p1_a = re.compile(r'^1. (?P<value1>No Topology change must be active in any STP instance)$')
+        p1_a = regex_engine.compile(r'^1. (?P<value1>No Topology change must be active in any STP instance)$')
 
         # Criteria 1 PASSED !!
-        p1_b = re.compile(r'^Criteria 1 (?P<status1>[\w]+)')
+        p1_b = regex_engine.compile(r'^Criteria 1 (?P<status1>[\w]+)')
 
         # 2. Bridge assurance(BA) should not be active on any port (except MCT)
-        p2_a = re.compile(r'^2. (?P<value2>Bridge assurance\(BA\) should not be active on any port).*$')
+        p2_a = regex_engine.compile(r'^2. (?P<value2>Bridge assurance\(BA\) should not be active on any port).*$')
 
         # Criteria 2 PASSED !!
-        p2_b = re.compile(r'^Criteria 2 (?P<status2>[\w]+)')
+        p2_b = regex_engine.compile(r'^Criteria 2 (?P<status2>[\w]+)')
 
         # 3. There should not be any Non Edge Designated Forwarding port (except MCT)
-        p3_a = re.compile(r'^3. (?P<value3>There should not be any Non Edge Designated Forwarding port).*$')
+        p3_a = regex_engine.compile(r'^3. (?P<value3>There should not be any Non Edge Designated Forwarding port).*$')
 
         # Criteria 3 FAILED
-        p3_b = re.compile(r'^Criteria 3 (?P<status3>[\w]+)')
+        p3_b = regex_engine.compile(r'^Criteria 3 (?P<status3>[\w]+)')
 
         # Ethernet1/21        1 Desg FWD  MST           0
         # Ethernet1/20        1 Desg FWD  MST           0
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r'^(?P<port>[\w]+\/\d+)\s+(?P<vlan>[\d]+)\s+(?P<role>[\w]+)\s+(?P<sts>[\w]+)\s+(?P<tree_type>[\w]+)\s+(?P<instance>[\d]+)$')
 
         # ISSU Cannot Proceed! Change the above Config
-        p5 = re.compile(r'^(?P<proceed>ISSU [\w\s]+).*$')
+        p5 = regex_engine.compile(r'^(?P<proceed>ISSU [\w\s]+).*$')
 
         for line in out.splitlines():
             line_strip = line.strip()
@@ -1,12 +1,14 @@
 """show_static_route.py
 
 """
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # ====================================================
 #  schema for show ip static-route
 # ====================================================
@@ -81,7 +83,7 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
                 continue
 
             # Static-route for VRF "default"(1)
-            p1 = re.compile(r'^\s*Static-route +for +VRF +\"(?P<vrf>[\w]+)\"\((?P<number>[\d])\)$')
+            p1 = regex_engine.compile(r'^\s*Static-route +for +VRF +\"(?P<vrf>[\w]+)\"\((?P<number>[\d])\)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -101,8 +103,8 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
             #  10.16.2.2/32, configured nh: 10.2.3.2/32 Ethernet1/4
             #  10.16.2.2/32, configured nh: 10.229.3.2/32
             # 192.168.205.1/32, configured nh: 0.0.0.0/32 tunnel-te12
-            p2 = re.compile(r'^\s*(?P<route>[\d\/\.]+),'
-                             r' +configured +nh: +(?P<nexthop>[\d\/\.]+)?( +(?P<interface>[a-zA-Z][\w\-\/\.]+))?$')
+            p2 = regex_engine.compile(r'^\s*(?P<route>[\d\/\.]+),'
+                                       r' +configured +nh: +(?P<nexthop>[\d\/\.]+)?( +(?P<interface>[a-zA-Z][\w\-\/\.]+))?$')
             m = p2.match(line)
             if m:
                 next_hop = ""
@@ -168,7 +170,7 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
                 continue
 
             # (not installed in urib)
-            p3 = re.compile(r'^\s*\(not +installed +in +(?P<urib>[\w]+)\)$')
+            p3 = regex_engine.compile(r'^\s*\(not +installed +in +(?P<urib>[\w]+)\)$')
             m = p3.match(line)
             if m:
                 active = False
@@ -181,7 +183,7 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
                 continue
 
             # (installed in urib)
-            p4 = re.compile(r'^\s*\(installed +in +(?P<urib>[\w]+)\)$')
+            p4 = regex_engine.compile(r'^\s*\(installed +in +(?P<urib>[\w]+)\)$')
             m = p4.match(line)
             if m:
                 active = True
@@ -194,7 +196,7 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
                 continue
 
             #rnh(installed in urib)
-            p5 = re.compile(r'^\s*rnh\(installed +in +(?P<urib>[\w]+)\)$')
+            p5 = regex_engine.compile(r'^\s*rnh\(installed +in +(?P<urib>[\w]+)\)$')
             m = p5.match(line)
             if m:
                 active = True
@@ -288,7 +290,7 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
                 continue
 
             # IPv6 Configured Static Routes for VRF "default"(1)
-            p1 = re.compile(r'^\s*IPv6 +Configured +Static +Routes +for +VRF +\"(?P<vrf>[\w]+)\"\((?P<index>\d)\)$')
+            p1 = regex_engine.compile(r'^\s*IPv6 +Configured +Static +Routes +for +VRF +\"(?P<vrf>[\w]+)\"\((?P<index>\d)\)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -309,10 +311,10 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
             # 2001:1:1:1::1/128 -> 2001:10:1:3::1/128, preference: 1
             # 2001:1:1:1::1/128 -> Null0, preference: 1
             # 2001:1:1:a::1/128 -> Null0, preference: 1
-            p2 = re.compile(r'^\s*(?P<route>[a-fA-F\d\:\/]+)'
-                            r'( +\-\> +(?P<nexthop>[a-fA-F\d\:\/]+), )?'
-                            r'( \-\> +(?P<interface>[\w\.\/]+), )?'
-                            r'(preference: +(?P<preference>[\d]+))?$')
+            p2 = regex_engine.compile(r'^\s*(?P<route>[a-fA-F\d\:\/]+)'
+                                      r'( +\-\> +(?P<nexthop>[a-fA-F\d\:\/]+), )?'
+                                      r'( \-\> +(?P<interface>[\w\.\/]+), )?'
+                                      r'(preference: +(?P<preference>[\d]+))?$')
             m = p2.match(line)
             if m:
                 next_hop = ""
@@ -390,7 +392,7 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
                 continue
 
             #  nh_vrf(default) reslv_tid 0
-            p3 = re.compile(r'^\s*nh_vrf\((?P<next_vrf>[\w]+)\) +reslv_tid +(?P<resolved_tid>[\d]+)$')
+            p3 = regex_engine.compile(r'^\s*nh_vrf\((?P<next_vrf>[\w]+)\) +reslv_tid +(?P<resolved_tid>[\d]+)$')
             m = p3.match(line)
             if m:
                 next_vrf = m.groupdict()['next_vrf']
@@ -410,8 +412,8 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
                 continue
 
             # real-next-hop: 2001:10:2:3::2, interface: Ethernet1/4
-            p4 = re.compile(r'^\s*real-next-hop: +(?P<real_next_hop>[\d\:]+)'
-                            r'(, +interface: +(?P<interface2>[\w\/\.]+))?$')
+            p4 = regex_engine.compile(r'^\s*real-next-hop: +(?P<real_next_hop>[\d\:]+)'
+                                      r'(, +interface: +(?P<interface2>[\w\/\.]+))?$')
             m = p4.match(line)
             if m:
                 if m.groupdict()['interface2']:
@@ -430,7 +432,7 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
 
             # rnh(installed in u6rib)
             # rnh(not installed in u6rib)
-            p5 = re.compile(r'^\s*rnh\((?P<not>[not]+)? ?installed +in +(?P<urib>[\w]+)\)$')
+            p5 = regex_engine.compile(r'^\s*rnh\((?P<not>[not]+)? ?installed +in +(?P<urib>[\w]+)\)$')
             m = p5.match(line)
             if m:
                 if m.groupdict()['not']:
@@ -446,7 +448,7 @@ class ShowIpv6StaticRoute(ShowIpv6StaticRouteSchema):
                 continue
 
             #  bfd_enabled no
-            p6 = re.compile(r'^\s*bfd_enabled +(?P<bfd>[\w]+)$')
+            p6 = regex_engine.compile(r'^\s*bfd_enabled +(?P<bfd>[\w]+)$')
             m = p6.match(line)
             if m:
                 bfd_enabled = False if m.groupdict()['bfd'].lower() == 'no' else True
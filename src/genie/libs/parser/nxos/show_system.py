@@ -6,14 +6,14 @@ NXOS parsers for the following show commands:
     * 'show system internal processes memory'
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ====================================================================
 # Schema for 'show system internal sysmgr service name <process>'
@@ -61,49 +61,49 @@ class ShowSystemInternalSysmgrServiceName(
         # Service "bfdc" ("bfdc", 3):
         # Service "__inst_012__isis" ("isis", 61):
         # Service "feature-mgr" ("feature-mgr", 135):
-        p1 = re.compile(r'^Service +\"(?P<inst>[\w\-]+)\" *'
-                         r'\(\"(?P<process_name>[\w\-]+)\", *'
-                         r'(?P<internal_id>\d+)\):$')
+        p1 = regex_engine.compile(r'^Service +\"(?P<inst>[\w\-]+)\" *'
+                                   r'\(\"(?P<process_name>[\w\-]+)\", *'
+                                   r'(?P<internal_id>\d+)\):$')
 
         # UUID = 0x2C7, PID = 6547, SAP = 1008
         # UUID = 0x59D, PID = 5418, no SAP
         # UUID = 0x42000118, -- Currently not running --
-        p2 = re.compile(r'^UUID *= *(?P<uuid>\w+), *'
-                         r'((PID *= *(?P<pid>\d+), *'
-                         r'(SAP *= *(?P<sap>\d+)|no SAP))'
-                         r'|(-- Currently not running --))$')
+        p2 = regex_engine.compile(r'^UUID *= *(?P<uuid>\w+), *'
+                                   r'((PID *= *(?P<pid>\d+), *'
+                                   r'(SAP *= *(?P<sap>\d+)|no SAP))'
+                                   r'|(-- Currently not running --))$')
 
         # State: SRV_STATE_WAIT_SPAWN_CONDITION (entered at time Tue Mar 26 17:31:06 2013).
         # State: SRV_STATE_HAP_FAILED [unstable] (entered at time Thu Oct 26 13:46:32 2017).
-        p3 = re.compile(r'^State: *(?P<state>[\w\s\[\]]+) *'
-                         r'\(entered +at +time +'
-                         r'(?P<state_start_date>[\w\s\:]+)\).$')
+        p3 = regex_engine.compile(r'^State: *(?P<state>[\w\s\[\]]+) *'
+                                   r'\(entered +at +time +'
+                                   r'(?P<state_start_date>[\w\s\:]+)\).$')
 
         # Restart count: 1
-        p4 = re.compile(r'^Restart +count: +(?P<restart_count>\d+)$')
+        p4 = regex_engine.compile(r'^Restart +count: +(?P<restart_count>\d+)$')
 
         # Time of last restart: Sat Jul  1 14:49:10 2017.
-        p5 = re.compile(r'^Time +of +last +restart: +'
-                         r'(?P<last_restart_date>[\w\s\:]+).$')
+        p5 = regex_engine.compile(r'^Time +of +last +restart: +'
+                                   r'(?P<last_restart_date>[\w\s\:]+).$')
 
         # The service never crashed since the last reboot.
         # The service has never been started since the last reboot.
-        p6 = re.compile(r'The service never crashed since the last reboot.')
+        p6 = regex_engine.compile(r'The service never crashed since the last reboot.')
 
         # Previous PID: 2176
-        p7 = re.compile(r'^Previous +PID: +(?P<previous_pid>\d+)$')
+        p7 = regex_engine.compile(r'^Previous +PID: +(?P<previous_pid>\d+)$')
 
         # Reason of last termination: SYSMGR_DEATH_REASON_FAILURE_SIGNAL
-        p8 = re.compile(r'^Reason +of +last +termination: +'
-                         r'(?P<last_terminate_reason>\w+)$')
+        p8 = regex_engine.compile(r'^Reason +of +last +termination: +'
+                                   r'(?P<last_terminate_reason>\w+)$')
 
         # Plugin ID: 0
-        p9 = re.compile(r'^Plugin +ID: +(?P<plugin_id>\d+)$')
+        p9 = regex_engine.compile(r'^Plugin +ID: +(?P<plugin_id>\d+)$')
 
         # Tag = N/A
         # Tag = 100
         # Tag = l3vpn
-        p10 = re.compile(r'^Tag *= *(?P<tag>(N\/A)|(\S+))$')
+        p10 = regex_engine.compile(r'^Tag *= *(?P<tag>(N\/A)|(\S+))$')
 
         ret_dict = {}
 
@@ -163,7 +163,7 @@ class ShowSystemInternalSysmgrServiceName(
                 reboot_state = 'never_crashed'
                 continue
 
-            p6_1 = re.compile(r'The service has never been started since the last reboot.')
+            p6_1 = regex_engine.compile(r'The service has never been started since the last reboot.')
             m = p6_1.match(line)
             if m:
                 reboot_state = 'never_started'
@@ -275,7 +275,7 @@ class ShowSystemInternalL2fwderMac(ShowSystemInternalL2fwderMacSchema):
             line = line.strip()
 
             # G  1008    5e01.80ff.0007    static   -          F     F   sup-eth1(R)
-            p1 = re.compile(r'^\s*(?P<entry>[A-Z\*\(\+\)]+) +(?P<vlan>[0-9]+) '
+            p1 = regex_engine.compile(r'^\s*(?P<entry>[A-Z\*\(\+\)]+) +(?P<vlan>[0-9]+) '
                 r'+(?P<mac_address>[0-9a-z\.]+) +(?P<mac_type>[a-z]+) '
                 r'+(?P<age>[0-9\-\:]+) +(?P<secure>[A-Z]+) +(?P<ntfy>[A-Z]+) '
                 r'+(?P<ports>[a-zA-Z0-9\-\(\)\s\.\/]+)$')
@@ -387,25 +387,25 @@ class ShowSystemInternalKernelMeminfo(ShowSystemInternalKernelMeminfoSchema):
             out = output
 
         # MemTotal:        5873172 kB
-        p1 = re.compile(r'(?P<mem_type>Mem.+):\s+(?P<amount>\d+)\skB$')
+        p1 = regex_engine.compile(r'(?P<mem_type>Mem.+):\s+(?P<amount>\d+)\skB$')
 
         # Active(file):     236740 kB
-        p2 = re.compile(r'(?i)(?P<active_state>[in]*active.*):\s+(?P<amount>\d+)\skB$')
+        p2 = regex_engine.compile(r'(?i)(?P<active_state>[in]*active.*):\s+(?P<amount>\d+)\skB$')
 
         # SwapTotal:             0 kB
-        p3 = re.compile(r'(?P<swap_type>Swap.+):\s+(?P<amount>\d+)\skB$')
+        p3 = regex_engine.compile(r'(?P<swap_type>Swap.+):\s+(?P<amount>\d+)\skB$')
 
         # VmallocChunk:   34359477316 kB
-        p4 = re.compile(r'(?P<vmalloc_type>Vmalloc.+):\s+(?P<amount>\d+)\skB$')
+        p4 = regex_engine.compile(r'(?P<vmalloc_type>Vmalloc.+):\s+(?P<amount>\d+)\skB$')
 
         # HugePages_Surp:        0
-        p5 = re.compile(r'(?P<hugepages_type>Huge.+):\s+(?P<amount>\d+)$')
+        p5 = regex_engine.compile(r'(?P<hugepages_type>Huge.+):\s+(?P<amount>\d+)$')
 
         # Hugepagesize:       2048 kB
-        p6 = re.compile(r'(?P<hugepages_type>Huge.+):\s+(?P<amount>\d+)\s+kB$')
+        p6 = regex_engine.compile(r'(?P<hugepages_type>Huge.+):\s+(?P<amount>\d+)\s+kB$')
 
         # Buffers:           38212 kB
-        p7 = re.compile(r'(?P<key>.+):\s+(?P<amount>\d+)(\skB)?$')
+        p7 = regex_engine.compile(r'(?P<key>.+):\s+(?P<amount>\d+)(\skB)?$')
 
         ret_dict = {}
 
@@ -541,34 +541,34 @@ class ShowSystemResources(ShowSystemResourcesSchema):
             out = output
 
         # Load average:   1 minute: 0.34   5 minutes: 0.40   15 minutes: 0.66
-        p1 = re.compile(r'^Load average\s*:\s+1 minute:\s+(?P<minute_one>[\d\.]+)\s+5 minutes:\s+'
-                        r'(?P<minute_five>\d+\.\d+)\s+15 minutes:\s+(?P<minute_fifteen>\d+\.\d+)$')
+        p1 = regex_engine.compile(r'^Load average\s*:\s+1 minute:\s+(?P<minute_one>[\d\.]+)\s+5 minutes:\s+'
+                                  r'(?P<minute_five>\d+\.\d+)\s+15 minutes:\s+(?P<minute_fifteen>\d+\.\d+)$')
 
         # Processes   :   901 total, 2 running
-        p2 = re.compile(r'^Processes\s*:\s+(?P<processes_total>\d+)\s+total,\s+'
-                        r'(?P<processes_running>\d+)\s+running$')
+        p2 = regex_engine.compile(r'^Processes\s*:\s+(?P<processes_total>\d+)\s+total,\s+'
+                                  r'(?P<processes_running>\d+)\s+running$')
 
         # CPU states  :   2.11% user,   11.64% kernel,   86.24% idle
         #         CPU0 states  :   3.33% user,   12.22% kernel,   84.44% idle
-        p3 = re.compile(r'^CPU(?P<cpu_num>\d*)\s+states\s+:\s+(?P<user>\d+\.\d+)%\s+user,\s+'
-                        r'(?P<kernel>[\d+\.]+)%\s+kernel,\s+(?P<idle>\d+\.\d+)%\s+idle$')
+        p3 = regex_engine.compile(r'^CPU(?P<cpu_num>\d*)\s+states\s+:\s+(?P<user>\d+\.\d+)%\s+user,\s+'
+                                  r'(?P<kernel>[\d+\.]+)%\s+kernel,\s+(?P<idle>\d+\.\d+)%\s+idle$')
 
         # Memory usage:   5873172K total,   4189652K used,   1683520K free
-        p4 = re.compile(r'^Memory usage\s*:\s+(?P<total>\d+)K total,\s+'
-                        r'(?P<used>\d+)K used,\s+(?P<free>\d+)K free$')
+        p4 = regex_engine.compile(r'^Memory usage\s*:\s+(?P<total>\d+)K total,\s+'
+                                  r'(?P<used>\d+)K used,\s+(?P<free>\d+)K free$')
 
         # Kernel vmalloc:   0K total,   0K free
-        p5 = re.compile(r'^Kernel vmalloc\s*:\s+(?P<total>\d+)'
-                        r'K total,\s+(?P<free>\d+)K free$')
+        p5 = regex_engine.compile(r'^Kernel vmalloc\s*:\s+(?P<total>\d+)'
+                                  r'K total,\s+(?P<free>\d+)K free$')
 
         # Kernel buffers:   144876K Used
-        p6 = re.compile(r'^Kernel buffers\s*:\s+(?P<buffers>\d+)K Used$')
+        p6 = regex_engine.compile(r'^Kernel buffers\s*:\s+(?P<buffers>\d+)K Used$')
 
         # Kernel cached :   2296916K Used
-        p7 = re.compile(r'^Kernel cached\s*:\s+(?P<cached>\d+)K Used$')
+        p7 = regex_engine.compile(r'^Kernel cached\s*:\s+(?P<cached>\d+)K Used$')
 
         # Current memory status: OK
-        p8 = re.compile(r'^Current memory status\s*:\s+(?P<status>\w+)$')
+        p8 = regex_engine.compile(r'^Current memory status\s*:\s+(?P<status>\w+)$')
 
         ret_dict = {}
 
@@ -708,7 +708,7 @@ class ShowSystemInternalProcessesMemory(ShowSystemInternalProcessesMemorySchema)
 
         # 7482 ?        Ssl  00:05:05    158    0 219576 1053628  3.7 /opt/mtx/bin/grpc -i 2626 -I
         # 27344 pts/0    Sl+  00:00:20      0   63 117180 709928  1.9 /isan/bin/vsh.bin
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<pid>\d+)\s+(?P<tty>\S+)\s+(?P<stat>\S+)\s+(?P<time>[\d:]+)\s+(?P<majflt>\d+)\s+(?P<trs>\d+)\s+'
             r'(?P<rss>\d+)\s+(?P<vsz>\d+)\s+(?P<mem_percent>[\d.]+)\s+(?P<command>.+$)')
 
@@ -3,10 +3,12 @@ NXOS parsers for the following show commands:
     * show terminal
 '''
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Optional, ListOf
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Schema for 'show terminal'
 # =============================================
@@ -50,29 +52,29 @@ class ShowTerminal(ShowTerminalSchema):
         ret_dict = {}
 
         # TTY: /dev/ttyS0 Type: "vt102"
-        p0 = re.compile(r'^TTY: (?P<tty>[\/\w]+) Type: "(?P<type>\w+)"$')
+        p0 = regex_engine.compile(r'^TTY: (?P<tty>[\/\w]+) Type: "(?P<type>\w+)"$')
 
         # Length: 0 lines, Width: 0 columns
-        p1 = re.compile(r'^Length: (?P<length>\d+) lines, Width: (?P<width>\d+) columns$')
+        p1 = regex_engine.compile(r'^Length: (?P<length>\d+) lines, Width: (?P<width>\d+) columns$')
 
         # Session Timeout: 0 minutes
-        p2 = re.compile(r'^Session Timeout: (?P<session_timeout>[\w\s]+)$')
+        p2 = regex_engine.compile(r'^Session Timeout: (?P<session_timeout>[\w\s]+)$')
 
         # Event Manager CLI event bypass: no
-        p3 = re.compile(r'^Event Manager CLI event bypass: (?P<event_manager>\w+)$')
+        p3 = regex_engine.compile(r'^Event Manager CLI event bypass: (?P<event_manager>\w+)$')
 
         # Redirection mode: ascii
-        p4 = re.compile(r'^Redirection mode: (?P<redirection_mode>\w+)$')
+        p4 = regex_engine.compile(r'^Redirection mode: (?P<redirection_mode>\w+)$')
 
         # Accounting log all commands (including show commands): no
-        p5 = re.compile(r'^Accounting log all commands \(including show commands\): '
-                        r'(?P<accounting_log_all>\w+)$')
+        p5 = regex_engine.compile(r'^Accounting log all commands \(including show commands\): '
+                                  r'(?P<accounting_log_all>\w+)$')
 
         # Vlan mutex value: 1
-        p6 = re.compile(r'^Vlan mutex value: (?P<vlan_mutex>\d+)$')
+        p6 = regex_engine.compile(r'^Vlan mutex value: (?P<vlan_mutex>\d+)$')
 
         # Vlan batch mode: yes
-        p7 = re.compile(r'^Vlan batch mode: (?P<vlan_batch>\w+)$')
+        p7 = regex_engine.compile(r'^Vlan batch mode: (?P<vlan_batch>\w+)$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3,10 +3,12 @@ NXOS parser for the following show commands:
 * 'show track'
 """
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =======================
 # Schema for 'show track'
 # =======================
@@ -78,43 +80,43 @@ class ShowTrack(ShowTrackSchema):
         parsed_dict = {}
        
         #Track N 
-        p0 = re.compile(r'Track (?P<track_id>\d+)') 
+        p0 = regex_engine.compile(r'Track (?P<track_id>\d+)') 
 
         # Interface Ethernet1/4 IP Routing
         # IP Route 10.1.1.1/32 Reachability
         # IPv6 Route 10:1::1:1/32 Reachability
         # IP SLA 121 Reachability
-        p1 = re.compile(r'^(?P<type>IP Route|Interface|IP SLA|IPv6 Route|List)\s+((?P<address>[\d.]+(\/\d+))|(?P<name>([\d\w.:]+()\/\d+|loopback[\d]+|\d+)))*\s+((?P<parameter>[\w \-]+))')
+        p1 = regex_engine.compile(r'^(?P<type>IP Route|Interface|IP SLA|IPv6 Route|List)\s+((?P<address>[\d.]+(\/\d+))|(?P<name>([\d\w.:]+()\/\d+|loopback[\d]+|\d+)))*\s+((?P<parameter>[\w \-]+))')
 
         # IP Routing is DOWN
         # Line Protocol is delayed DOWN (20 secs remaining)
-        p2 = re.compile(r'^(?P<parameter>[\w ]+) +is +(?P<state>UP|DOWN|delayed DOWN|delayed UP)( \((?P<secs_remaining>\d+) secs remaining\))*')
+        p2 = regex_engine.compile(r'^(?P<parameter>[\w ]+) +is +(?P<state>UP|DOWN|delayed DOWN|delayed UP)( \((?P<secs_remaining>\d+) secs remaining\))*')
 
         # 1 changes, last change 00:01:04
-        p3 = re.compile(r'^(?P<change_count>\d+) +changes, +last +change'
-                        r' +(?P<last_change>[\d\w:]+)')
+        p3 = regex_engine.compile(r'^(?P<change_count>\d+) +changes, +last +change'
+                                  r' +(?P<last_change>[\d\w:]+)')
    
         # Threshold weight up 20 down 10
         # Threshold percentage up 20% down 10%
-        p4  = re.compile(r'^(?P<parameter>[\w ]+) +up +(?P<threshold_up>[\d]+%*) +down +(?P<threshold_down>[\d]+%*)')
+        p4  = regex_engine.compile(r'^(?P<parameter>[\w ]+) +up +(?P<threshold_up>[\d]+%*) +down +(?P<threshold_down>[\d]+%*)')
 
         # Track List  12
         # VRRPV3 Vlan2 2
         # HSRP Vlan2 2   
-        p5 = re.compile(r'^((?P<name>[a-zA-Z3]{3,6}) +'
+        p5 = regex_engine.compile(r'^((?P<name>[a-zA-Z3]{3,6}) +'
             r'(?P<interface>[A-Za-z0-9\/.]{3,}) +(?P<group_id>\d+))|(?P<route>Route Map Configuration)')
 
         # Delay up 20 secs, down 10 secs
         # Delay up 10000 milliseconds, down 10000 milliseconds 
-        p6 = re.compile(r'^(Delay )(up (?P<delay_up_secs>[\d]+\s+)secs,*)*(up (?P<delay_up_millisecs>[\d]+\s+)milliseconds,)*(\s*down (?P<delay_down_secs>[\d]+) secs)*( down (?P<delay_down_millisecs>[\d]+) milliseconds)*')
+        p6 = regex_engine.compile(r'^(Delay )(up (?P<delay_up_secs>[\d]+\s+)secs,*)*(up (?P<delay_up_millisecs>[\d]+\s+)milliseconds,)*(\s*down (?P<delay_down_secs>[\d]+) secs)*( down (?P<delay_down_millisecs>[\d]+) milliseconds)*')
 
         # object 10 weight 10 UP
         # object 1 (100%) DOWN
-        p7 = re.compile(r'^(object)\s+(?P<object_id>[\d]+)\s(weight (?P<weight>[\d]+))*((?P<percent>\([\d%]+\)))*\s*(?P<obj_state>[\w \-]+)')
+        p7 = regex_engine.compile(r'^(object)\s+(?P<object_id>[\d]+)\s(weight (?P<weight>[\d]+))*((?P<percent>\([\d%]+\)))*\s*(?P<obj_state>[\w \-]+)')
 
         # VPN Routing/Forwarding table "management"
         # VPN Routing/Forwarding table "vrf2"
-        p8 = re.compile(r'^(VPN Routing\/Forwarding table )\"(?P<vrf_table>[\w]+)')
+        p8 = regex_engine.compile(r'^(VPN Routing\/Forwarding table )\"(?P<vrf_table>[\w]+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -327,7 +329,7 @@ class ShowTrackBrief(ShowTrackBriefSchema):
        #20    Interface    loopback200         IP Routing             DOWN    1d10h
        #21    Interface    loopback0           IP Routing             DOWN    1d10h
 
-       p1 = re.compile(r'(?P<trc>\d+)\s+(?P<typ> (Interface|IP Route|IP SLA|IPv6 Route|List))\s+(?P<inst>([\d\w.|:]+()\/\d+|[\d]+|[\w-]+))\s+(?P<par>((IP|IPv6)\sRouting|Reachability|State|Boolean(\sand|\sor)|Threshold(\spercentage|\sweight)|Line Protocol))\s+(?P<ste>[\w]+)\s+(?P<chg>[\w]+)')
+       p1 = regex_engine.compile(r'(?P<trc>\d+)\s+(?P<typ> (Interface|IP Route|IP SLA|IPv6 Route|List))\s+(?P<inst>([\d\w.|:]+()\/\d+|[\d]+|[\w-]+))\s+(?P<par>((IP|IPv6)\sRouting|Reachability|State|Boolean(\sand|\sor)|Threshold(\spercentage|\sweight)|Line Protocol))\s+(?P<ste>[\w]+)\s+(?P<chg>[\w]+)')
   
        for line in output.splitlines():
           line = line.strip()
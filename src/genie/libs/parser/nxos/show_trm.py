@@ -5,7 +5,6 @@ NXOS parsers for the following show commands:
 """
 
 # Python
-import re
 import xmltodict
 
 # Metaparser
@@ -13,6 +12,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -45,7 +45,7 @@ class ShowRunningConfigTrm(ShowRunningConfigTrmSchema):
         result_dict = {}
 
         # advertise evpn multicast
-        p1 = re.compile(r'^advertise +evpn +multicast$')
+        p1 = regex_engine.compile(r'^advertise +evpn +multicast$')
 
         for line in out.splitlines():
             line = line.strip()
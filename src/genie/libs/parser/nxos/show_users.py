@@ -1,10 +1,10 @@
 """show_users.py
 
 """
-import re
 import genie.parsergen as pg
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 from genie.metaparser import MetaParser
@@ -53,7 +53,7 @@ class ShowUsers(ShowUsersSchema):
         ret_dict = {}
 
         # admin    pts/0        Jan 28 13:44   .          8096 *
-        p = re.compile(
+        p = regex_engine.compile(
             r"^(?P<name>\S+)\s+(?P<line>\S+)\s+(?P<time>\S+\s+\d+\s+\d+:\d+)\s+(?P<idle>\S+)\s+(?P<pid>[\d:]+)\s*(?P<comment>[^*]+)?\s*(?P<active>\*)?$"
         )
 
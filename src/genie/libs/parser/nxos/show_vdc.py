@@ -4,14 +4,12 @@ Parser for the following show commands:
     * show vdc
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 class ShowVdcResourceDetailSchema(MetaParser):
@@ -65,14 +63,14 @@ class ShowVdcResourceDetail(ShowVdcResourceDetailSchema):
 
         #   vlan               422 used     0 unused   3672 free   3672 avail   4094 total
         #   port-channel         2 used     0 unused    509 free    509 avail    511 total
-        p1 = re.compile(r'^ *(?P<name>\S+) +(?P<total_used>\d+) +used +'
-                        r'(?P<total_unused>\d+) +unused +(?P<total_free>\d+) +'
-                        r'free +(?P<total_avail>\d+) +avail +(?P<total>\d+) +total$')
+        p1 = regex_engine.compile(r'^ *(?P<name>\S+) +(?P<total_used>\d+) +used +'
+                                  r'(?P<total_unused>\d+) +unused +(?P<total_free>\d+) +'
+                                  r'free +(?P<total_avail>\d+) +avail +(?P<total>\d+) +total$')
 
         #           example.cisco.com            16        4094      422       0         3672
         #           example.cisco.com            2         4096      2         0         4094
-        p2 = re.compile(r'^ *(?P<name>\S+) +(?P<min>\d+) +(?P<max>\d+) +'
-                        r'(?P<used>\d+) +(?P<unused>\d+) +(?P<free>\d+)$')
+        p2 = regex_engine.compile(r'^ *(?P<name>\S+) +(?P<min>\d+) +(?P<max>\d+) +'
+                                  r'(?P<used>\d+) +(?P<unused>\d+) +(?P<free>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
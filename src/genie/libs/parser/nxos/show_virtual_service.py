@@ -11,13 +11,13 @@ NX-OS parsers for the following show commands:
     * show virtual-service utilization name <name>
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ========================================
 # Schema for "show virtual-service global"
@@ -74,21 +74,21 @@ class ShowVirtualServiceGlobal(ShowVirtualServiceGlobalSchema):
         # Virtual Service Global State and Virtualization Limits:
         #
         # Infrastructure version : 1.10
-        p1 = re.compile(r'^Infrastructure +version +: +(?P<version>[0-9.]+)$')
+        p1 = regex_engine.compile(r'^Infrastructure +version +: +(?P<version>[0-9.]+)$')
 
         # Total virtual services installed : 1
         # Total virtual services activated : 1
-        p2 = re.compile(r'^Total +virtual +services +'
-                        r'(?P<state>\S+) +: +(?P<count>\d+)$')
+        p2 = regex_engine.compile(r'^Total +virtual +services +'
+                                  r'(?P<state>\S+) +: +(?P<count>\d+)$')
 
         # Machine types supported   : LXC
         # Machine types disabled    : KVM, CHROOT
-        p3 = re.compile(r'^Machine +types +'
-                        r'(?P<state>\S+) +: +(?P<kinds>.+)$')
+        p3 = regex_engine.compile(r'^Machine +types +'
+                                  r'(?P<state>\S+) +: +(?P<kinds>.+)$')
 
         # Maximum VCPUs per virtual service : 1
-        p4 = re.compile(r'^Maximum +VCPUs +per +virtual +service +: +'
-                        r'(?P<count>\d+)$')
+        p4 = regex_engine.compile(r'^Maximum +VCPUs +per +virtual +service +: +'
+                                  r'(?P<count>\d+)$')
 
         # Resource virtualization limits:
         # Name                        Quota    Committed    Available
@@ -96,7 +96,7 @@ class ShowVirtualServiceGlobal(ShowVirtualServiceGlobalSchema):
         # system CPU (%)                 20            1           19
         # memory (MB)                  3840          500         3340
         # bootflash (MB)               8192         1000         7192
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r'^(?P<kind>system +CPU +\(%\)|memory +\(MB\)|bootflash +\(MB\)) +'
             r'(?P<quota>\d+) +(?P<committed>\d+) +(?P<available>\d+)$')
 
@@ -212,9 +212,9 @@ class ShowVirtualServiceList(ShowVirtualServiceListSchema):
         # sc_sanity_03            Installed          ft_mv_no_onep.ova
         # lxc_upgrade             Activate Failed    c63lxc_no_onep.ova
 
-        p1 = re.compile(r'^(?P<name>(\S+))\s+'
-                        r'(?P<status>(\S+(?: \S+)?))\s+'
-                        r'(?P<package>(\S+(?: \S+)?))$')
+        p1 = regex_engine.compile(r'^(?P<name>(\S+))\s+'
+                                  r'(?P<status>(\S+(?: \S+)?))\s+'
+                                  r'(?P<package>(\S+(?: \S+)?))$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -288,7 +288,7 @@ class ShowVirtualServiceCore(ShowVirtualServiceCoreSchema):
         # Virtual-Service  Process-name  PID       Date(Year-Month-Day Time)
         # ---------------  ------------  --------  -------------------------
         # guestshell+      sleep         266       2019-05-30 19:53:28
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^(?P<vs>\S+)\s+(?P<proc>\S+)\s+(?P<pid>\d+)\s+(?P<date>.+)$')
 
         for line in output.splitlines():
@@ -380,49 +380,49 @@ class ShowVirtualServiceDetail(ShowVirtualServiceDetailSchema):
         services_dict = {}
 
         # Virtual service guestshell+ detail
-        p1 = re.compile(r'^Virtual +service +(?P<name>\S+) +detail$')
+        p1 = regex_engine.compile(r'^Virtual +service +(?P<name>\S+) +detail$')
 
         # State                 : Activated
-        p2 = re.compile(r'^State +: +(?P<state>.+)$')
+        p2 = regex_engine.compile(r'^State +: +(?P<state>.+)$')
 
         # Package information
         #   Name                : guestshell.ova
         #   Path                : /isanboot/bin/guestshell.ova
-        p3 = re.compile(r'^Package information$')
-        p3_1 = re.compile(r'^Name +: +(?P<name>.+)$')
-        p3_2 = re.compile(r'^Path +: +(?P<path>.+)$')
+        p3 = regex_engine.compile(r'^Package information$')
+        p3_1 = regex_engine.compile(r'^Name +: +(?P<name>.+)$')
+        p3_2 = regex_engine.compile(r'^Path +: +(?P<path>.+)$')
 
         # Application
         #   Name              : GuestShell
         #   Installed version : 2.4(0.0)
         #   Description       : Cisco Systems Guest Shell
-        p4 = re.compile(r'^Application$')
-        p4_1 = re.compile(r'^Name +: +(?P<name>.+)$')
-        p4_2 = re.compile(r'^Installed +version +: +(?P<version>.+)$')
-        p4_3 = re.compile(r'^Description +: +(?P<description>.+)$')
+        p4 = regex_engine.compile(r'^Application$')
+        p4_1 = regex_engine.compile(r'^Name +: +(?P<name>.+)$')
+        p4_2 = regex_engine.compile(r'^Installed +version +: +(?P<version>.+)$')
+        p4_3 = regex_engine.compile(r'^Description +: +(?P<description>.+)$')
 
         # Signing
         #   Key type          : Cisco release key
         #   Method            : SHA-1
-        p5 = re.compile(r'^Signing')
-        p5_1 = re.compile(r'^Key +type +: +(?P<key_type>.+)$')
-        p5_2 = re.compile(r'^Method +: +(?P<method>.+)$')
+        p5 = regex_engine.compile(r'^Signing')
+        p5_1 = regex_engine.compile(r'^Key +type +: +(?P<key_type>.+)$')
+        p5_2 = regex_engine.compile(r'^Method +: +(?P<method>.+)$')
 
         # Licensing
         #   Name              : None
         #   Version           : None
-        p6 = re.compile(r'^Licensing')
-        p6_1 = re.compile(r'^Name +: +(?P<name>.+)$')
-        p6_2 = re.compile(r'^Version +: +(?P<version>.+)$')
+        p6 = regex_engine.compile(r'^Licensing')
+        p6_1 = regex_engine.compile(r'^Name +: +(?P<name>.+)$')
+        p6_2 = regex_engine.compile(r'^Version +: +(?P<version>.+)$')
 
         # Resource reservation
         #   Disk                : 1000 MB
         #   Memory              : 500 MB
         #   CPU                 : 1% system CPU
-        p7 = re.compile(r'^Resource reservation$')
-        p7_1 = re.compile(r'^Disk +: +(?P<disk>\d+) +MB$')
-        p7_2 = re.compile(r'^Memory +: +(?P<memory>\d+) +MB$')
-        p7_3 = re.compile(r'^CPU +: +(?P<cpu>\d+)% system CPU')
+        p7 = regex_engine.compile(r'^Resource reservation$')
+        p7_1 = regex_engine.compile(r'^Disk +: +(?P<disk>\d+) +MB$')
+        p7_2 = regex_engine.compile(r'^Memory +: +(?P<memory>\d+) +MB$')
+        p7_3 = regex_engine.compile(r'^CPU +: +(?P<cpu>\d+)% system CPU')
 
         # Attached devices
         #   Type              Name        Alias
@@ -433,10 +433,10 @@ class ShowVirtualServiceDetail(ShowVirtualServiceDetailSchema):
         #   Serial/aux
         #   Serial/Syslog                 serial2
         #   Serial/Trace                  serial3
-        p8 = re.compile(r'^Attached devices$')
-        p8_1 = re.compile(r'^Type +Name +Alias$')
+        p8 = regex_engine.compile(r'^Attached devices$')
+        p8_1 = regex_engine.compile(r'^Type +Name +Alias$')
         # It appears that any given entry never has both name and alias
-        p8_2 = re.compile(
+        p8_2 = regex_engine.compile(
             r'^(?P<type>.{1,17})(?: (?P<name>\S+)| {13}(?P<alias>\S+))?$')
 
         service_dict = None
@@ -690,31 +690,31 @@ class ShowVirtualServiceUtilization(ShowVirtualServiceUtilizationSchema):
         #
         # CPU Utilization:
         #   Requested Application Utilization:  1 %
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^Requested\s+Application\s+Utilization:\s+(?P<pct>\d+)\s*%$')
         #   Actual Application Utilization:  0 % (30 second average)
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^Actual\s+Application\s+Utilization:\s+(?P<pct>\d+)\s*%\s+'
             r'\(30\s+second\s+average\)$')
         #   CPU State: R : Running
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r'^CPU\s+State:\s+(?P<abbrev>\S+)\s*:\s*(?P<state>\S+)$')
         #
         # Memory Utilization:
         #   Memory Allocation: 262144 KB
-        p4 = re.compile(r'^Memory\s+Allocation:\s+(?P<kb>\d+)\s+KB$')
+        p4 = regex_engine.compile(r'^Memory\s+Allocation:\s+(?P<kb>\d+)\s+KB$')
         #   Memory Used:       13400 KB
-        p5 = re.compile(r'^Memory\s+Used:\s+(?P<kb>\d+)\s+KB$')
+        p5 = regex_engine.compile(r'^Memory\s+Used:\s+(?P<kb>\d+)\s+KB$')
         #
         # Storage Utilization:
         #   Name: _rootfs, Alias:
-        p6 = re.compile(r'^Name:\s+(?P<name>\S+), Alias:$')
+        p6 = regex_engine.compile(r'^Name:\s+(?P<name>\S+), Alias:$')
         #     Capacity(1K blocks):  243823      Used(1K blocks): 161690
-        p7 = re.compile(r'^Capacity\(1K\s+blocks\):\s+(?P<capacity>\d+)\s+'
-                        r'Used\(1K\s+blocks\):\s+(?P<used>\d+)$')
+        p7 = regex_engine.compile(r'^Capacity\(1K\s+blocks\):\s+(?P<capacity>\d+)\s+'
+                                  r'Used\(1K\s+blocks\):\s+(?P<used>\d+)$')
         #     Available(1K blocks): 77537       Usage: 68 %
-        p8 = re.compile(r'^Available\(1K\s+blocks\):\s+(?P<available>\d+)\s+'
-                        r'Usage:\s+(?P<usage_pct>\d+)\s*%$')
+        p8 = regex_engine.compile(r'^Available\(1K\s+blocks\):\s+(?P<available>\d+)\s+'
+                                  r'Usage:\s+(?P<usage_pct>\d+)\s*%$')
 
         storage_name = None
 
@@ -21,6 +21,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          And, \
                                          Default, \
                                          Use
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # ====================================================
@@ -71,24 +72,24 @@ class ShowVlan(ShowVlanSchema):
         # 25   PV-VLAN25-SEC-ISO                sus/ishut Eth1/21, Eth1/22
         # 1    default                          active
         # 1   1_192.168.0.0/1                   active    Gi1/0/1, Gi1/0/2, Gi1/0/3, Gi1/0/5, Gi1/0/6, Gi1/0/12,
-        p1 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<name>\S+) +'
-                        r'(?P<status>active|suspended|act/unsup|.*/lshut|.*/ishut|sus|act)'
-                        r'( *(?P<interfaces>[\w \/\,]+))?$')
+        p1 = regex_engine.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<name>\S+) +'
+                                  r'(?P<status>active|suspended|act/unsup|.*/lshut|.*/ishut|sus|act)'
+                                  r'( *(?P<interfaces>[\w \/\,]+))?$')
 
         #                                                Gi1/0/19, Gi1/0/20, Gi1/0/21, Gi1/0/22
-        p2 = re.compile(r'^\s*(?P<space>\s{48})(?P<interfaces>[\w\s\/\,]+)$')
+        p2 = regex_engine.compile(r'^\s*(?P<space>\s{48})(?P<interfaces>[\w\s\/\,]+)$')
 
         # VLAN Type         Vlan-mode
         # 1    enet         CE
-        p3 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<vlan_type>[a-zA-Z]+)'
-                        r' +(?P<vlan_mode>[a-zA-Z]+)?$')
+        p3 = regex_engine.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<vlan_type>[a-zA-Z]+)'
+                                  r' +(?P<vlan_mode>[a-zA-Z]+)?$')
 
         # Remote SPAN VLANs
         # -------------------------------------
         # 201-202
         # 201,202
         # 201,204,201-220
-        p4 = re.compile(r'^\s*(?P<remote_span_vlans>[^--][0-9\-\,]+)?$')
+        p4 = regex_engine.compile(r'^\s*(?P<remote_span_vlans>[^--][0-9\-\,]+)?$')
 
         # Primary Secondary Type              Ports
         # ------- --------- ----------------- ------------------------------------------
@@ -96,8 +97,8 @@ class ShowVlan(ShowVlanSchema):
         #  2       302       community
         #          10        community
         # 20       25         isolated
-        p5 = re.compile(r'^\s*(?P<primary>\d+)? +(?P<secondary>\d+)'
-                        r' +(?P<type>[\w\-]+)( +(?P<interfaces>[\w\,\/ ]+))?$')
+        p5 = regex_engine.compile(r'^\s*(?P<primary>\d+)? +(?P<secondary>\d+)'
+                                  r' +(?P<type>[\w\-]+)( +(?P<interfaces>[\w\,\/ ]+))?$')
 
         vlan_dict = {}
         for line in out.splitlines():
@@ -282,7 +283,7 @@ class ShowVlanIdVnSegment(ShowVlanIdVnSegmentSchema):
             # VLAN Segment-id
             # ---- -----------
             # 10   5010
-            p1 = re.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<segment_id>[0-9]+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<vlan_id>[0-9]+) +(?P<segment_id>[0-9]+)$')
             m = p1.match(line)
             if m:
                 vlan_id = m.groupdict()['vlan_id']
@@ -336,12 +337,12 @@ class ShowVlanInternalInfo(ShowVlanInternalInfoSchema):
         vlan_configuration_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*VLAN_INFO_GLOBAL$')
+            p1 = regex_engine.compile(r'^\s*VLAN_INFO_GLOBAL$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*vlan +configuration +(?P<vlan_ids>[0-9\-\,]+)$')
+            p2 = regex_engine.compile(r'^\s*vlan +configuration +(?P<vlan_ids>[0-9\-\,]+)$')
             m = p2.match(line)
             if m:
                 vlan_ids = m.groupdict()['vlan_ids']
@@ -394,7 +395,7 @@ class ShowVlanFilter(ShowVlanFilterSchema):
         vlan_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*vlan +map +(?P<vlan_access_map_tag>[a-zA-Z0-9]+):$')
+            p1 = regex_engine.compile(r'^\s*vlan +map +(?P<vlan_access_map_tag>[a-zA-Z0-9]+):$')
             m = p1.match(line)
             if m:
                 if 'vlan_id' not in vlan_dict:
@@ -402,7 +403,7 @@ class ShowVlanFilter(ShowVlanFilterSchema):
                 tag = m.groupdict()['vlan_access_map_tag']
                 continue
 
-            p2 = re.compile(r'^\s*Configured +on +VLANs: +(?P<access_map_vlan_ids>[0-9\,\-]+)$')
+            p2 = regex_engine.compile(r'^\s*Configured +on +VLANs: +(?P<access_map_vlan_ids>[0-9\,\-]+)$')
             m = p2.match(line)
             if m:
                 access_map_vlan_ids = m.groupdict()['access_map_vlan_ids']
@@ -458,7 +459,7 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
         access_map_dict = {}
         for line in out.splitlines():
             line = line.rstrip()
-            p1 = re.compile(r'^\s*Vlan +access-map +(?P<access_map_id>[a-zA-Z0-9\"]+) +(?P<access_map_sequence>[0-9]+)$')
+            p1 = regex_engine.compile(r'^\s*Vlan +access-map +(?P<access_map_id>[a-zA-Z0-9\"]+) +(?P<access_map_sequence>[0-9]+)$')
             m = p1.match(line)
             if m:
                 access_map_id = m.groupdict()['access_map_id']
@@ -474,7 +475,7 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
                     access_map_dict['access_map_id'][map_id]['access_map_sequence'][access_map_sequence] = {}
                 continue
 
-            p2 = re.compile(r'^\s*match +(?P<access_map_match_protocol>[a-zA-Z0-9]+): +(?P<access_map_match_protocol_value>[a-zA-Z0-9\s]+)$')
+            p2 = regex_engine.compile(r'^\s*match +(?P<access_map_match_protocol>[a-zA-Z0-9]+): +(?P<access_map_match_protocol_value>[a-zA-Z0-9\s]+)$')
             m = p2.match(line)
             if m:
                 access_map_dict['access_map_id'][map_id]['access_map_sequence']\
@@ -483,7 +484,7 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
                     [access_map_sequence]['access_map_match_protocol_value'] = m.groupdict()['access_map_match_protocol_value']
                 continue
 
-            p3 = re.compile(r'^\s*action: +(?P<access_map_action_value>[a-zA-Z]+)$')
+            p3 = regex_engine.compile(r'^\s*action: +(?P<access_map_action_value>[a-zA-Z]+)$')
             m = p3.match(line)
             if m:
                 access_map_dict['access_map_id'][map_id]['access_map_sequence']\
@@ -530,7 +531,7 @@ class ShowVxlan(ShowVxlanSchema):
             line = line.strip()
 
             # 100             8100
-            p1 = re.compile(r'^\s*(?P<vlan>[0-9]+) +(?P<vn_segment>[0-9]+)$')
+            p1 = regex_engine.compile(r'^\s*(?P<vlan>[0-9]+) +(?P<vn_segment>[0-9]+)$')
             m = p1.match(line)
             if m:
 
@@ -586,37 +587,37 @@ class ShowVlanCounters(ShowVlanCountersSchema):
             output = self.device.execute(cmd)
     
         # Vlan Id                             :11 
-        p1 = re.compile(r'^Vlan Id\s+\:(?P<vlan_id>\d+)$')
+        p1 = regex_engine.compile(r'^Vlan Id\s+\:(?P<vlan_id>\d+)$')
 
         # Unicast Octets In                  :328740 
-        p2 = re.compile(r'^Unicast Octets In\s+\:(?P<l2_ing_ucast_b>\d+)$')
+        p2 = regex_engine.compile(r'^Unicast Octets In\s+\:(?P<l2_ing_ucast_b>\d+)$')
 
         # Unicast Packets In                 :2451 
-        p3 = re.compile(r'^Unicast Packets In\s+\:(?P<l2_ing_ucast_p>\d+)$')
+        p3 = regex_engine.compile(r'^Unicast Packets In\s+\:(?P<l2_ing_ucast_p>\d+)$')
 
         # Multicast Octets In                :1801482 
-        p4 = re.compile(r'^Multicast Octets In\s+\:(?P<l2_ing_mcast_b>\d+)$')
+        p4 = regex_engine.compile(r'^Multicast Octets In\s+\:(?P<l2_ing_mcast_b>\d+)$')
 
         # Multicast Packets In               :14585 
-        p5 = re.compile(r'^Multicast Packets In\s+\:(?P<l2_ing_mcast_p>\d+)$')
+        p5 = regex_engine.compile(r'^Multicast Packets In\s+\:(?P<l2_ing_mcast_p>\d+)$')
 
         # Broadcast Octets In                :130134 
-        p6 = re.compile(r'^Broadcast Octets In\s+\:(?P<l2_ing_bcast_b>\d+)$')
+        p6 = regex_engine.compile(r'^Broadcast Octets In\s+\:(?P<l2_ing_bcast_b>\d+)$')
 
         # Broadcast Packets In               :1015 
-        p7 = re.compile(r'^Broadcast Packets In\s+\:(?P<l2_ing_bcast_p>\d+)$')
+        p7 = regex_engine.compile(r'^Broadcast Packets In\s+\:(?P<l2_ing_bcast_p>\d+)$')
 
         # Unicast Octets Out                 :181924 
-        p8 = re.compile(r'^Unicast Octets Out\s+\:(?P<l2_egr_ucast_b>\d+)$')
+        p8 = regex_engine.compile(r'^Unicast Octets Out\s+\:(?P<l2_egr_ucast_b>\d+)$')
 
         # Unicast Packets Out                :1304 
-        p9 = re.compile(r'^Unicast Packets Out\s+\:(?P<l2_egr_ucast_p>\d+)$')
+        p9 = regex_engine.compile(r'^Unicast Packets Out\s+\:(?P<l2_egr_ucast_p>\d+)$')
 
         # L3 Unicast Octets In                :0 
-        p10 = re.compile(r'^L3 Unicast Octets In\s+\:(?P<l3_ucast_rcv_b>\d+)$')
+        p10 = regex_engine.compile(r'^L3 Unicast Octets In\s+\:(?P<l3_ucast_rcv_b>\d+)$')
 
         # L3 Unicast Packets In               :0 
-        p11 = re.compile(r'^L3 Unicast Packets In\s+\:(?P<l3_ucast_rcv_p>\d+)$')
+        p11 = regex_engine.compile(r'^L3 Unicast Packets In\s+\:(?P<l3_ucast_rcv_p>\d+)$')
 
         vlan_counters_dict = {}
 
@@ -4,14 +4,12 @@ Parser for the following show commands:
     * show vpc
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -92,66 +90,66 @@ class ShowVpc(ShowVpcSchema):
         vpc_dict = {}
         # vPC domain id                     : 1
         # vPC domain id                     : Not configured
-        p1 = re.compile(r'^vPC +domain +id\s*: +(?P<domain_id>[\w\s]+)$')
+        p1 = regex_engine.compile(r'^vPC +domain +id\s*: +(?P<domain_id>[\w\s]+)$')
 
         # Peer status                       : peer adjacency formed ok 
-        p2 = re.compile(r'^Peer +status\s*: +(?P<peer_status>[\S\s]+)$')
+        p2 = regex_engine.compile(r'^Peer +status\s*: +(?P<peer_status>[\S\s]+)$')
 
         # vPC keep-alive status             : peer is alive 
-        p3 = re.compile(r'^vPC +keep-alive +status\s*: +(?P<keepalive_status>[\S\s]+)$')
+        p3 = regex_engine.compile(r'^vPC +keep-alive +status\s*: +(?P<keepalive_status>[\S\s]+)$')
 
         # Configuration consistency status  : success
         # Configuration consistency status: success
-        p4 = re.compile(r'^Configuration +consistency +status\s*: '
+        p4 = regex_engine.compile(r'^Configuration +consistency +status\s*: '
             r'+(?P<config_status>[\S\s]+)$')
 
         # Configuration consistency reason: vPC type-1 configuration incompatible - STP interface port type inconsistent
-        p5 = re.compile(r'^Configuration +consistency +reason\s*: '
+        p5 = regex_engine.compile(r'^Configuration +consistency +reason\s*: '
             r'+(?P<config_status_reason>[\S\s]+)$')
 
         # Per-vlan consistency status       : success 
-        p6 = re.compile(r'^Per-vlan +consistency +status\s*: '
+        p6 = regex_engine.compile(r'^Per-vlan +consistency +status\s*: '
             r'+(?P<per_vlan_status>[\S\s]+)$')
 
         # Type-2 consistency status         : success 
-        p7 = re.compile(r'^Type-2 +consistency +status\s*: '
+        p7 = regex_engine.compile(r'^Type-2 +consistency +status\s*: '
             r'+(?P<type_2_status>[\S\s]+)$')
 
         # vPC role                          : primary  
-        p8 = re.compile(r'^vPC +role\s*: +(?P<vpc_role>[\S\s]+)$')
+        p8 = regex_engine.compile(r'^vPC +role\s*: +(?P<vpc_role>[\S\s]+)$')
 
         # Number of vPCs configured         : 1 
-        p9 = re.compile(r'Number +of +(vPC|vPCs) +configured\s*: +(?P<num_of_vpc>\d+)$')
+        p9 = regex_engine.compile(r'Number +of +(vPC|vPCs) +configured\s*: +(?P<num_of_vpc>\d+)$')
 
         # Peer Gateway                      : Enabled
-        p10 = re.compile(r'^Peer +Gateway\s*: +(?P<peer_gateway>[\S\s]+)$')
+        p10 = regex_engine.compile(r'^Peer +Gateway\s*: +(?P<peer_gateway>[\S\s]+)$')
 
         # Dual-active excluded VLANs        : -       
-        p11 = re.compile(r'^Dual-active +excluded +VLANs\s*: '
+        p11 = regex_engine.compile(r'^Dual-active +excluded +VLANs\s*: '
             r'+(?P<dual_active_excluded_vlan>[\S\s]+)$')
 
         # Graceful Consistency Check        : Enabled
-        p12 = re.compile(r'^Graceful +Consistency +Check\s*: '
+        p12 = regex_engine.compile(r'^Graceful +Consistency +Check\s*: '
             r'+(?P<graceful_check>[\S\s]+)$')
 
         # Auto-recovery status              : Enabled, timer is off.(timeout = 240s)
-        p13 = re.compile(r'^Auto-recovery +status\s*: '
+        p13 = regex_engine.compile(r'^Auto-recovery +status\s*: '
             r'+(?P<auto_recovery_status>[\S\s]+)$')
 
         # Delay-restore status              : Timer is off.(timeout = 30s)
-        p14 = re.compile(r'^Delay-restore +status\s*: '
+        p14 = regex_engine.compile(r'^Delay-restore +status\s*: '
             r'+(?P<delay_recovery_status>[\S\s]+)$')
 
         # Delay-restore SVI status          : Timer is off.(timeout = 10s)
-        p15 = re.compile(r'^Delay-restore +SVI +status\s*: '
+        p15 = regex_engine.compile(r'^Delay-restore +SVI +status\s*: '
             r'+(?P<delay_svi_recovery_status>[\S\s]+)$')
 
         # Operational Layer3 Peer-router    : Disabled
-        p16 = re.compile(r'^Operational +Layer3 +Peer-router\s*: '
+        p16 = regex_engine.compile(r'^Operational +Layer3 +Peer-router\s*: '
             r'+(?P<layer3_peer_router>[\S\s]+)$')
 
         # Track object : 12
-        p17 = re.compile(r'^Track +object\s*: +(?P<track_object>\d+)$')
+        p17 = regex_engine.compile(r'^Track +object\s*: +(?P<track_object>\d+)$')
 
         # 1 Po10 up 1-100
         # 1     Po101  up     1,100-102,200-
@@ -159,75 +157,75 @@ class ShowVpc(ShowVpcSchema):
         # 1 Po100 down -
         # 1    Po1    up     1,8,17,60-62,65,67-68,92-93,11 -
         # 1     Po101  up     1,100-102,200-202
-        p18 = re.compile(r'^(?P<peer_link_id>\d+) +(?P<peer_link_ifindex>\S+) +'
-                r'(?P<peer_link_port_state>\S+) +(?P<peer_up_vlan_bitset>-|\S+)'
-                r'( +(?P<vlan_bds>-|\S+))?$')
+        p18 = regex_engine.compile(r'^(?P<peer_link_id>\d+) +(?P<peer_link_ifindex>\S+) +'
+                          r'(?P<peer_link_port_state>\S+) +(?P<peer_up_vlan_bitset>-|\S+)'
+                          r'( +(?P<vlan_bds>-|\S+))?$')
 
         # 1     Po1           up     success     success               1,100-102,200-
         # 20 Po20 up failed vPC type-1 configuration -
         # 1 Po1 down success success -
         # 11 Po11 up success success 1,10-28,30-5 DF: Partial
-        p19 = re.compile(r'^(?P<vpc_id>\d+) +(?P<vpc_ifindex>\S+) '
+        p19 = regex_engine.compile(r'^(?P<vpc_id>\d+) +(?P<vpc_ifindex>\S+) '
             r'+(?P<vpc_port_state>\S+) +(?P<vpc_consistency>\S+) '
             r'+(?P<vpc_consistency_status>success|[\S\s]+) '
             r'+(?P<up_vlan_bitset>[\d\,\-]+)'
             r'(?: +(?P<vpc_plus_attrib>(.*)+))?$')
         # vPC Peer-link status
-        p20 = re.compile(r'^vPC +(p|P)eer-link +status$')
+        p20 = regex_engine.compile(r'^vPC +(p|P)eer-link +status$')
 
         # vPC status
-        p21 = re.compile(r'^vPC +status$')
+        p21 = regex_engine.compile(r'^vPC +status$')
 
         # Id               : 4
-        p22 = re.compile(r'^Id +: +(?P<vpc_id>\d+)$')
+        p22 = regex_engine.compile(r'^Id +: +(?P<vpc_id>\d+)$')
 
         # Port           : Po4
-        p23 = re.compile(r'^Port +: +(?P<vpc_ifindex>\S+)$')
+        p23 = regex_engine.compile(r'^Port +: +(?P<vpc_ifindex>\S+)$')
 
         # Status         : up
-        p24 = re.compile(r'^Status +: +(?P<vpc_port_state>\S+)$')
+        p24 = regex_engine.compile(r'^Status +: +(?P<vpc_port_state>\S+)$')
 
         # Consistency    : success
-        p25 = re.compile(r'^Consistency +: +(?P<vpc_consistency>\S+)$')
+        p25 = regex_engine.compile(r'^Consistency +: +(?P<vpc_consistency>\S+)$')
 
         # Reason         : success
         # Reason         : Compatibility check failed for speed
-        p26 = re.compile(r'^Reason +: +(?P<vpc_consistency_status>[\S ]+)$')
+        p26 = regex_engine.compile(r'^Reason +: +(?P<vpc_consistency_status>[\S ]+)$')
 
         # Active Vlans   : 65,67-68,401-402,1199
-        p27 = re.compile(r'^Active +Vlans +: +(?P<up_vlan_bitset>\S+)$')
+        p27 = regex_engine.compile(r'^Active +Vlans +: +(?P<up_vlan_bitset>\S+)$')
 
         # Peer gateway excluded VLANs            : -
-        p28 = re.compile(r'^Peer +gateway +excluded +VLANs +: +(?P<peer_gateway_exculded_vlans>\S+)$')
+        p28 = regex_engine.compile(r'^Peer +gateway +excluded +VLANs +: +(?P<peer_gateway_exculded_vlans>\S+)$')
 
         # Peer gateway excluded bridge-domains   : -
-        p29 = re.compile(r'^Peer +gateway +excluded +bridge-domains +: +(?P<peer_gateway_exculded_bridge_domains>\S+)$')
+        p29 = regex_engine.compile(r'^Peer +gateway +excluded +bridge-domains +: +(?P<peer_gateway_exculded_bridge_domains>\S+)$')
 
         # Dual-active excluded VLANs and BDs     : -
-        p30 = re.compile(r'^Dual-active +excluded +VLANs +and +BDs +: +(?P<dual_active_excluded_vlans_and_bds>\S+)$')
+        p30 = regex_engine.compile(r'^Dual-active +excluded +VLANs +and +BDs +: +(?P<dual_active_excluded_vlans_and_bds>\S+)$')
 
         # Delay-restore orphan ports status      : Timer is off.(timeout = 0s)
-        p31 = re.compile(r'^Delay-restore +orphan +ports +status +: +(Timer +is +(?P<timer>\w+))\.\(timeout += +(?P<timeout>\d+)s\)$')
+        p31 = regex_engine.compile(r'^Delay-restore +orphan +ports +status +: +(Timer +is +(?P<timer>\w+))\.\(timeout += +(?P<timeout>\d+)s\)$')
 
         # Self-isolation                         : Disabled
-        p32 = re.compile(r'^Self-isolation +: +(?P<self_isolation>\S+)$')
+        p32 = regex_engine.compile(r'^Self-isolation +: +(?P<self_isolation>\S+)$')
 
         # 200
         # 300-330, 350, 400-500
         
-        p33 = re.compile(r'^(?P<additional_vlan>(?!--)[\d\,\-]+)$')
+        p33 = regex_engine.compile(r'^(?P<additional_vlan>(?!--)[\d\,\-]+)$')
         
         # vPC+ switch id : 312
-        p34 = re.compile(r'^vPC[+] +switch +id\s*: +(?P<vpc_plus_switch_id>[\w\s]+)$')
+        p34 = regex_engine.compile(r'^vPC[+] +switch +id\s*: +(?P<vpc_plus_switch_id>[\w\s]+)$')
 
         # vPC fabricpath status : peer is reachable through fabricpath
-        p35 = re.compile(r'^vPC+ fabricpath+ status\s*: +(?P<vpc_fabricpath_status>[\w\s]+)$')
+        p35 = regex_engine.compile(r'^vPC+ fabricpath+ status\s*: +(?P<vpc_fabricpath_status>[\w\s]+)$')
 
         # 4,56-82,138, FP MAC:
         # 530,2587     312.0.0
-        p36 = re.compile(r'^(?P<additional_vlan>[\d\-\,]+) (?P<additional_vpc_plus_attrib>[\S\-\,\s\.\:]+)$')
+        p36 = regex_engine.compile(r'^(?P<additional_vlan>[\d\-\,]+) (?P<additional_vpc_plus_attrib>[\S\-\,\s\.\:]+)$')
         # Virtual-peerlink mode    : Disabled
-        p37 = re.compile(r'^Virtual-peerlink +mode\s*: '
+        p37 = regex_engine.compile(r'^Virtual-peerlink +mode\s*: '
             r'+(?P<peerlink_mode>[\S\s]+)$')
 
         for line in output.splitlines():
@@ -476,7 +474,7 @@ class ShowVpc(ShowVpcSchema):
                 continue
 
             # Peer gateway excluded bridge-domains   : -
-            p29 = re.compile(r'^Peer +gateway +excluded +bridge-domains +: +(?P<peer_gateway_exculded_bridge_domains>\S+)$')
+            p29 = regex_engine.compile(r'^Peer +gateway +excluded +bridge-domains +: +(?P<peer_gateway_exculded_bridge_domains>\S+)$')
             match = p29.match(line)
             if match:
                 group = match.groupdict()
@@ -6,7 +6,6 @@ NXOS parsers for the following show commands:
 """
 
 # Python
-import re
 import xmltodict
 
 # Metaparser
@@ -14,6 +13,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =====================
@@ -55,8 +55,8 @@ class ShowVrf(ShowVrfSchema):
             # VRF2                                    4 Up      --
             # default                                 1 Up      --
             # VRF                                     5 Down    Admin Down
-            p1 = re.compile(r'^\s*(?P<vrf_name>\S+)\s+(?P<vrf_id>[0-9]+)\s+'
-                            r'(?P<vrf_state>(Up|Down))\s+(?P<reason>.*)$')
+            p1 = regex_engine.compile(r'^\s*(?P<vrf_name>\S+)\s+(?P<vrf_id>[0-9]+)\s+'
+                                      r'(?P<vrf_state>(Up|Down))\s+(?P<reason>.*)$')
             m = p1.match(line)
             if m:
                 if 'vrfs' not in vrf_dict:
@@ -106,12 +106,12 @@ class ShowVrfInterface(ShowVrfInterfaceSchema):
         for line in out.splitlines():
             line = line.rstrip()
 
-            p1 = re.compile(r'^\s*Interface +VRF-Name +VRF-ID +Site-of-Origin$')
+            p1 = regex_engine.compile(r'^\s*Interface +VRF-Name +VRF-ID +Site-of-Origin$')
             m = p1.match(line)
             if m:
                 continue
 
-            p2 = re.compile(r'^\s*(?P<intf_name>[a-zA-Z0-9\/]+)'
+            p2 = regex_engine.compile(r'^\s*(?P<intf_name>[a-zA-Z0-9\/]+)'
                 r' +(?P<vrf_name>[a-zA-Z0-9\-]+) +(?P<vrf_id>[0-9]+)'
                 r' +(?P<site_of_origin>[a-zA-Z0-9\-]+)?$')
             m = p2.match(line)
@@ -177,9 +177,9 @@ class ShowVrfDetail(ShowVrfDetailSchema):
             line = line.strip()
 
             # VRF-Name: VRF1, VRF-ID: 3, State: Up
-            p1 = re.compile(r'^VRF\-Name: +(?P<vrf>[\w\-]+), +'
-                             r'VRF-ID: +(?P<vrf_id>\d+), +'
-                             r'State: +(?P<state>\w+)$')
+            p1 = regex_engine.compile(r'^VRF\-Name: +(?P<vrf>[\w\-]+), +'
+                                       r'VRF-ID: +(?P<vrf_id>\d+), +'
+                                       r'State: +(?P<state>\w+)$')
             m = p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
@@ -190,7 +190,7 @@ class ShowVrfDetail(ShowVrfDetailSchema):
                 continue
 
             # VPNID: unknown
-            p2 = re.compile(r'^VPNID: +(?P<vpn_id>\w+)$')
+            p2 = regex_engine.compile(r'^VPNID: +(?P<vpn_id>\w+)$')
             m = p2.match(line)
             if m:
                 vpn_id = m.groupdict()['vpn_id']
@@ -199,15 +199,15 @@ class ShowVrfDetail(ShowVrfDetailSchema):
                 continue
 
             # RD: 300:1
-            p3 = re.compile(r'^RD: +(?P<rd>[\w\:\.]+)$')
+            p3 = regex_engine.compile(r'^RD: +(?P<rd>[\w\:\.]+)$')
             m = p3.match(line)
             if m:
                 vrf_dict[vrf]['route_distinguisher'] = m.groupdict()['rd']
                 continue
 
             # Max Routes: 20000  Mid-Threshold: 17000
-            p4 = re.compile(r'^Max +Routes: +(?P<max_routes>\d+) +'
-                             r'Mid\-Threshold: +(?P<mid_threshold>\d+)$')
+            p4 = regex_engine.compile(r'^Max +Routes: +(?P<max_routes>\d+) +'
+                                       r'Mid\-Threshold: +(?P<mid_threshold>\d+)$')
             m = p4.match(line)
             if m:
                 vrf_dict[vrf]['max_routes'] = int(m.groupdict()['max_routes'])
@@ -215,10 +215,10 @@ class ShowVrfDetail(ShowVrfDetailSchema):
                 continue
 
             # Table-ID: 0x80000003, AF: IPv6, Fwd-ID: 0x80000003, State: Up
-            p5 = re.compile(r'^Table\-ID: +(?P<table_id>\w+), +'
-                             r'AF: +(?P<af>\w+), +'
-                             r'Fwd\-ID: (?P<fwd_id>\w+), +'
-                             r'State: +(?P<state>\w+)$')
+            p5 = regex_engine.compile(r'^Table\-ID: +(?P<table_id>\w+), +'
+                                       r'AF: +(?P<af>\w+), +'
+                                       r'Fwd\-ID: (?P<fwd_id>\w+), +'
+                                       r'State: +(?P<state>\w+)$')
             m = p5.match(line)
             if m:
                 af = m.groupdict()['af'].lower()
@@ -278,21 +278,21 @@ class ShowRunningConfigVrf(ShowRunningConfigVrfSchema):
         result_dict = {}
 
         # vrf context vni_10100
-        p1 = re.compile(r'^vrf +context +(?P<vrf>\S+)$')
+        p1 = regex_engine.compile(r'^vrf +context +(?P<vrf>\S+)$')
 
         #   vni 10100
-        p2= re.compile(r'^\s*vni +(?P<vni>\d+)$')
+        p2= regex_engine.compile(r'^\s*vni +(?P<vni>\d+)$')
 
         #   rd auto
-        p3 = re.compile(r'^\s*rd +(?P<rd>\S+)$')
+        p3 = regex_engine.compile(r'^\s*rd +(?P<rd>\S+)$')
 
         #   address-family ipv4 unicast
-        p4 = re.compile(r'^\s*address-family +(?P<af>[\S\s]+)$')
+        p4 = regex_engine.compile(r'^\s*address-family +(?P<af>[\S\s]+)$')
 
         #     route-target both auto
         #     route-target both auto mvpn
         #     route-target both auto evpn
-        p5 = re.compile(r'^\s*route-target +(?P<rt_type>\w+) +(?P<rt>\w+)( +(?P<rt_evpn_mvpn>\w+))?$')
+        p5 = regex_engine.compile(r'^\s*route-target +(?P<rt_type>\w+) +(?P<rt>\w+)( +(?P<rt_evpn_mvpn>\w+))?$')
 
         # find all list of vrfs
         if vrf:
@@ -20,13 +20,11 @@ NXOS parser for the following show commands:
     * show l2route evpn mac-ip evi <evi>
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 
@@ -69,11 +67,11 @@ class ShowL2routeEvpnImetAllDetail(ShowL2routeEvpnImetAllDetailSchema):
         # 201          20001       BGP   2001:db8:646:a2bb:0:abcd:5678:1                  0       0          -       6    20001        2001:db8:646:a2bb:0:abcd:5678:1                  32
 
 
-        p1 = re.compile(r'^(?P<topo_id>[\d]+) + (?P<vni>[\d]+)'
-                         r' + (?P<prod_type>[\w]+) * (?P<ip_addr>[\w\:]+)'
-                         r' + (?P<eth_tag_id>[\d]+) + + (?P<pmsi_flags>[\d]+)'
-                         r' + (?P<flags>[\w-]) + (?P<type>[\d]+) + (?P<vni_label>[\d]+)'
-                         r' + (?P<tunnel_id>[\w\:]+) + (?P<client_nfn>[\d]+)$')
+        p1 = regex_engine.compile(r'^(?P<topo_id>[\d]+) + (?P<vni>[\d]+)'
+                                   r' + (?P<prod_type>[\w]+) * (?P<ip_addr>[\w\:]+)'
+                                   r' + (?P<eth_tag_id>[\d]+) + + (?P<pmsi_flags>[\d]+)'
+                                   r' + (?P<flags>[\w-]) + (?P<type>[\d]+) + (?P<vni_label>[\d]+)'
+                                   r' + (?P<tunnel_id>[\w\:]+) + (?P<client_nfn>[\d]+)$')
 
         result_dict = {}
 
@@ -155,8 +153,8 @@ class ShowNvePeers(ShowNvePeersSchema):
         # nve1      2001:db8:646:a2bb:0:abcd:1234:5                  Up    CP        21:47:20 5254.00ff.3a82
         # nve1      172.31.201.40   Down  CP        0.000000 n/a
 
-        p1 = re.compile(r'^\s*(?P<nve_name>[\w\/]+) +(?P<peer_ip>[\w\.\:]+) +(?P<peer_state>[\w]+)'
-                        r' +(?P<learn_type>[\w]+) +(?P<uptime>[\w\:\.]+) +(?P<router_mac>[\w\.\/]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<nve_name>[\w\/]+) +(?P<peer_ip>[\w\.\:]+) +(?P<peer_state>[\w]+)'
+                                  r' +(?P<learn_type>[\w]+) +(?P<uptime>[\w\:\.]+) +(?P<router_mac>[\w\.\/]+)$')
 
         for line in out.splitlines():
             if line:
@@ -221,9 +219,9 @@ class ShowNveVniSummary(ShowNveVniSummarySchema):
         result_dict = {}
         # Total CP VNIs: 21    [Up: 21, Down: 0]
         # Total DP VNIs: 0    [Up: 0, Down: 0]
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r'^\s*Total +CP +VNIs: +(?P<cp_vni_count>[\d]+) +\[Up: +(?P<cp_vni_up>[\d]+), +Down: +(?P<cp_vni_down>[\d]+)\]$')
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r'^\s*Total +DP +VNIs: +(?P<dp_vni_count>[\d]+) +\[Up: +(?P<dp_vni_up>[\d]+), +Down: +(?P<dp_vni_down>[\d]+)\]$')
         for line in out.splitlines():
             if line:
@@ -297,9 +295,9 @@ class ShowNveVni(ShowNveVniSchema):
         #  --------- -------- ----------------- ----- ---- ------------------ -----
         # nve1      5001     234.1.1.1         Up    CP   L2 [1001]
         # nve1      5001     192.168.0.1         Up    CP   L2 [1001]          SA MS-IR
-        p1 = re.compile(r'^(?P<nve_name>[\w\/]+) +(?P<vni>[\d]+) +(?P<mcast>[\w\.\/]+) +'
-                        r'(?P<vni_state>[\w]+) +(?P<mode>[\w]+) +(?P<type>\w+ +\[[\w\-]+\])'
-                        r'(?: +(?P<flags>[\w\-\s]+))?$')
+        p1 = regex_engine.compile(r'^(?P<nve_name>[\w\/]+) +(?P<vni>[\d]+) +(?P<mcast>[\w\.\/]+) +'
+                                  r'(?P<vni_state>[\w]+) +(?P<mode>[\w]+) +(?P<type>\w+ +\[[\w\-]+\])'
+                                  r'(?: +(?P<flags>[\w\-\s]+))?$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -357,7 +355,7 @@ class ShowNveInterface(ShowNveInterfaceSchema):
         # Init vars
         result_dict = {}
         # nve1 is down (other)
-        p1 = re.compile(r'^\s*nve(?P<nve>(\d+)) +is +(?P<nve_state>[\w]+)( +(?P<other>[\w\(\)]+))?$')
+        p1 = regex_engine.compile(r'^\s*nve(?P<nve>(\d+)) +is +(?P<nve_state>[\w]+)( +(?P<other>[\w\(\)]+))?$')
 
         for line in out.splitlines():
             line = line.rstrip()
@@ -442,7 +440,7 @@ class ShowNveInterfaceDetail(ShowNveInterfaceDetailSchema):
             # Init vars
 
             # nve1 is down (other)
-            p1 = re.compile(r'^\s*nve(?P<nve>(\d+)) +is +(?P<nve_state>[\w]+)( +(?P<other>[\w\(\)]+))?$')
+            p1 = regex_engine.compile(r'^\s*nve(?P<nve>(\d+)) +is +(?P<nve_state>[\w]+)( +(?P<other>[\w\(\)]+))?$')
 
             for line in out1.splitlines():
                 line = line.rstrip()
@@ -456,52 +454,52 @@ class ShowNveInterfaceDetail(ShowNveInterfaceDetailSchema):
 
         result_dict = {}
         # Interface: nve1, State: Up, encapsulation: VXLAN
-        p1 = re.compile(r'^\s*Interface: +(?P<nve_name>[\w\/]+), +State: +(?P<state>[\w]+),'
-                        r' +encapsulation: +(?P<encapsulation>[\w]+)$')
-        p2 = re.compile(r'^\s*VPC Capability: +(?P<vpc_capability>[\w\s\-\[\]]+)$')
-        p3 = re.compile(r'^\s*Local Router MAC: +(?P<local_router_mac>[\w\.]+)$')
-        p4 = re.compile(r'^\s*Host Learning Mode: +(?P<host_learning_mode>[\w\-]+)$')
-        p5 = re.compile(r'^\s*Source-Interface: +(?P<source_if>[\w\/]+)'
-                        r' +\(primary: +(?P<primary_ip>[\w\.]+), +secondary: +(?P<secondary_ip>[\w\.]+)\)$')
+        p1 = regex_engine.compile(r'^\s*Interface: +(?P<nve_name>[\w\/]+), +State: +(?P<state>[\w]+),'
+                                  r' +encapsulation: +(?P<encapsulation>[\w]+)$')
+        p2 = regex_engine.compile(r'^\s*VPC Capability: +(?P<vpc_capability>[\w\s\-\[\]]+)$')
+        p3 = regex_engine.compile(r'^\s*Local Router MAC: +(?P<local_router_mac>[\w\.]+)$')
+        p4 = regex_engine.compile(r'^\s*Host Learning Mode: +(?P<host_learning_mode>[\w\-]+)$')
+        p5 = regex_engine.compile(r'^\s*Source-Interface: +(?P<source_if>[\w\/]+)'
+                                  r' +\(primary: +(?P<primary_ip>[\w\.]+), +secondary: +(?P<secondary_ip>[\w\.]+)\)$')
 
         # Source-Interface: loopback1 (primary: 2001:db8:646:a2bb:0:abcd:1234:4)
         # Anycast-Interface: loopback2 (secondary: 2001:db8:646:a2bb:0:abcd:5678:5)
-        p5_1 = re.compile(r'^\s*Source-Interface: +(?P<source_if>[\w\/]+) +\(primary: +(?P<primary_ip>[\w\.\:]+)\)')
-        p5_2 = re.compile(r'^\s*Anycast-Interface: +(?P<anycast_if>[\w\/]+) +\(secondary: +(?P<secondary_ip>[\w\.\:]+)\)')
+        p5_1 = regex_engine.compile(r'^\s*Source-Interface: +(?P<source_if>[\w\/]+) +\(primary: +(?P<primary_ip>[\w\.\:]+)\)')
+        p5_2 = regex_engine.compile(r'^\s*Anycast-Interface: +(?P<anycast_if>[\w\/]+) +\(secondary: +(?P<secondary_ip>[\w\.\:]+)\)')
 
         # Source - Interface: loopback1(primary: 100: 100:100::6, secondary: 0.0.0.0)
-        p5_3 = re.compile(r'^\s*Source-Interface: +(?P<source_if>[\w\/]+)'                      
-                        r' +\(primary: +(?P<primary_ip>[\w\.\:]+), +secondary: +(?P<secondary_ip>[\w\.]+)\)$')
-
-        p6 = re.compile(r'^\s*Source +Interface +State: +(?P<source_state>[\w]+)$')
-        p7 = re.compile(r'^\s*IR +Capability +Mode: +(?P<mode>[\w]+)$')
-        p8 = re.compile(r'^\s*Virtual +RMAC +Advertisement: +(?P<adv_vmac>[\w]+)$')
-        p9 = re.compile(r'^\s*NVE +Flags:( +(?P<flags>[\w]+))?$')
-        p10 = re.compile(r'^\s*Interface +Handle: +(?P<intf_handle>[\w]+)$')
-        p11 = re.compile(r'^\s*Source +Interface +hold-down-time: +(?P<hold_down_time>[\d]+)$')
-        p12 = re.compile(r'^\s*Source +Interface +hold-up-time: +(?P<hold_up_time>[\d]+)$')
-        p13 = re.compile(r'^\s*Remaining +hold-down +time: +(?P<hold_time_left>[\d]+) +seconds$')
+        p5_3 = regex_engine.compile(r'^\s*Source-Interface: +(?P<source_if>[\w\/]+)'                      
+                                  r' +\(primary: +(?P<primary_ip>[\w\.\:]+), +secondary: +(?P<secondary_ip>[\w\.]+)\)$')
+
+        p6 = regex_engine.compile(r'^\s*Source +Interface +State: +(?P<source_state>[\w]+)$')
+        p7 = regex_engine.compile(r'^\s*IR +Capability +Mode: +(?P<mode>[\w]+)$')
+        p8 = regex_engine.compile(r'^\s*Virtual +RMAC +Advertisement: +(?P<adv_vmac>[\w]+)$')
+        p9 = regex_engine.compile(r'^\s*NVE +Flags:( +(?P<flags>[\w]+))?$')
+        p10 = regex_engine.compile(r'^\s*Interface +Handle: +(?P<intf_handle>[\w]+)$')
+        p11 = regex_engine.compile(r'^\s*Source +Interface +hold-down-time: +(?P<hold_down_time>[\d]+)$')
+        p12 = regex_engine.compile(r'^\s*Source +Interface +hold-up-time: +(?P<hold_up_time>[\d]+)$')
+        p13 = regex_engine.compile(r'^\s*Remaining +hold-down +time: +(?P<hold_time_left>[\d]+) +seconds$')
         # Virtual Router MAC: N/A
-        p14 = re.compile(r'^\s*Virtual +Router +MAC: +(?P<v_router_mac>\S+)$')
-        p15 = re.compile(r'^\s*Virtual +Router +MAC +Re\-origination: +(?P<v_router_mac_re>[\w\.]+)$')
-        p16 = re.compile(r'^\s*Interface +state: +(?P<intf_state>[\w\-]+)$')
-        p17 = re.compile(r'^\s*unknown-peer-forwarding: +(?P<peer_forwarding>[\w]+)$')
-        p18 = re.compile(r'^\s*down-stream +vni +config +mode: +(?P<vni_config_mode>[\w\/]+)$')
-        p19 = re.compile(r'^\s*Nve +Src +node +last +notif +sent: +(?P<last_notif_sent>[\w\-]+)$')
-        p20 = re.compile(r'^\s*Nve +Mcast +Src +node +last +notif +sent: +(?P<last_notif_sent>[\w\-]+)$')
-        p20_1 = re.compile(r'^\s*Nve +MultiSite +Src +node +last +notif +sent: +(?P<notif_sent>[\w\-]+)$')
-        p21 = re.compile(
+        p14 = regex_engine.compile(r'^\s*Virtual +Router +MAC: +(?P<v_router_mac>\S+)$')
+        p15 = regex_engine.compile(r'^\s*Virtual +Router +MAC +Re\-origination: +(?P<v_router_mac_re>[\w\.]+)$')
+        p16 = regex_engine.compile(r'^\s*Interface +state: +(?P<intf_state>[\w\-]+)$')
+        p17 = regex_engine.compile(r'^\s*unknown-peer-forwarding: +(?P<peer_forwarding>[\w]+)$')
+        p18 = regex_engine.compile(r'^\s*down-stream +vni +config +mode: +(?P<vni_config_mode>[\w\/]+)$')
+        p19 = regex_engine.compile(r'^\s*Nve +Src +node +last +notif +sent: +(?P<last_notif_sent>[\w\-]+)$')
+        p20 = regex_engine.compile(r'^\s*Nve +Mcast +Src +node +last +notif +sent: +(?P<last_notif_sent>[\w\-]+)$')
+        p20_1 = regex_engine.compile(r'^\s*Nve +MultiSite +Src +node +last +notif +sent: +(?P<notif_sent>[\w\-]+)$')
+        p21 = regex_engine.compile(
             r'^\s*Multisite +bgw\-if: +(?P<multisite_bgw_if>[\w\/\-]+) +\(ip: +(?P<multisite_bgw_if_ip>[\w\.]+),'
             r' +admin: +(?P<multisite_bgw_if_admin_state>[\w]+), +oper: +(?P<multisite_bgw_if_oper_state>[\w]+)\)$')
-        p22 = re.compile(r'^\s*Multisite +bgw\-if +oper +down +reason: +(?P<reason>[\w\.\s]+)$')
+        p22 = regex_engine.compile(r'^\s*Multisite +bgw\-if +oper +down +reason: +(?P<reason>[\w\.\s]+)$')
         # Multi-Site delay-restore time: 180 seconds
-        p23 = re.compile(r'^\s*Multi(-S|s)ite +delay\-restore +time: +(?P<multisite_convergence_time>\d+) +seconds$')
+        p23 = regex_engine.compile(r'^\s*Multi(-S|s)ite +delay\-restore +time: +(?P<multisite_convergence_time>\d+) +seconds$')
         # Multi-Site delay-restore time left: 0 seconds
-        p24 = re.compile(
+        p24 = regex_engine.compile(
             r'^\s*Multi(-S|s)ite +bgw\-if +oper +down +reason: +(?P<multisite_convergence_time_left>\d+) +seconds$')
-        p25 = re.compile(r'Multisite +delay-restore +time +left: +(?P<multisite_convergence_time_left>\d+) +seconds$')
+        p25 = regex_engine.compile(r'Multisite +delay-restore +time +left: +(?P<multisite_convergence_time_left>\d+) +seconds$')
         # Multisite dci-advertise-pip configured: True
-        p26 = re.compile(r'Multisite +dci-advertise-pip +configured: +(?P<multisite_dci_advertise_pip>\S+)')
+        p26 = regex_engine.compile(r'Multisite +dci-advertise-pip +configured: +(?P<multisite_dci_advertise_pip>\S+)')
 
         for nve in nve_list:
             if not output:
@@ -773,7 +771,7 @@ class ShowNveMultisiteDciLinks(ShowNveMultisiteDciLinksSchema):
         # ---------      -----
         # Ethernet1/53   Up
         # port-channel11 Up
-        p1 = re.compile(r'^\s*(?P<if_name>(?!Interface)[\S]+) +(?P<if_state>[\w]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<if_name>(?!Interface)[\S]+) +(?P<if_state>[\w]+)$')
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
@@ -831,7 +829,7 @@ class ShowNveMultisiteFabricLinks(ShowNveMultisiteFabricLinksSchema):
         # ---------      -----
         # Ethernet1/53   Up
         # port-channel11 Up
-        p1 = re.compile(r'^\s*(?P<if_name>(?!Interface)[\S]+) +(?P<if_state>[\w]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<if_name>(?!Interface)[\S]+) +(?P<if_state>[\w]+)$')
 
         result_dict = {}
         for line in out.splitlines():
@@ -934,29 +932,29 @@ class ShowNveEthernetSegment(ShowNveEthernetSegmentSchema):
         #  ES route added to L2RIB: True
         #  EAD/ES routes added to L2RIB: False
         #  EAD/EVI route timer age: not running
-        p1 = re.compile(r'^\s*ESI: +(?P<esi>[\w\.]+)$')
-        p2 = re.compile(r'^\s*Parent +interface: +(?P<parent_intf>[\w\.\/]+)$')
-        p3 = re.compile(r'^\s*ES +State: +(?P<es_state>[\w\/]+)$')
-        p4 = re.compile(r'^\s*Port-channel +state: +(?P<po_state>[\w\/]+)$')
-        p5 = re.compile(r'^\s*NVE +Interface: +(?P<nve_intf>[\w\.\/]+)$')
-        p6 = re.compile(r'^\s*NVE +State: +(?P<nve_state>[\w\/]+)$')
-        p7 = re.compile(r'^\s*Host +Learning +Mode: +(?P<host_learning_mode>[\w\-]+)$')
-        p8 = re.compile(r'^\s*Active +Vlans: +(?P<active_vlans>[\d\-\,]+)$')
-        p9 = re.compile(r'^\s*DF Vlans: +(?P<df_vlans>[\d\-\,]+)$')
+        p1 = regex_engine.compile(r'^\s*ESI: +(?P<esi>[\w\.]+)$')
+        p2 = regex_engine.compile(r'^\s*Parent +interface: +(?P<parent_intf>[\w\.\/]+)$')
+        p3 = regex_engine.compile(r'^\s*ES +State: +(?P<es_state>[\w\/]+)$')
+        p4 = regex_engine.compile(r'^\s*Port-channel +state: +(?P<po_state>[\w\/]+)$')
+        p5 = regex_engine.compile(r'^\s*NVE +Interface: +(?P<nve_intf>[\w\.\/]+)$')
+        p6 = regex_engine.compile(r'^\s*NVE +State: +(?P<nve_state>[\w\/]+)$')
+        p7 = regex_engine.compile(r'^\s*Host +Learning +Mode: +(?P<host_learning_mode>[\w\-]+)$')
+        p8 = regex_engine.compile(r'^\s*Active +Vlans: +(?P<active_vlans>[\d\-\,]+)$')
+        p9 = regex_engine.compile(r'^\s*DF Vlans: +(?P<df_vlans>[\d\-\,]+)$')
         # 1026,1028,1030,1032,1034,1036,1038
-        p10 = re.compile(r'^\s*,?(?P<df_vlans>[\d\-\,]+)$')
-        p11 = re.compile(r'^\s*Active +VNIs: +(?P<active_vnis>[\d\-\,]+)$')
-        p12 = re.compile(r'^\s*CC +failed +for +VLANs:( +(?P<cc_failed_vlans>[\w\/]+))?$')
+        p10 = regex_engine.compile(r'^\s*,?(?P<df_vlans>[\d\-\,]+)$')
+        p11 = regex_engine.compile(r'^\s*Active +VNIs: +(?P<active_vnis>[\d\-\,]+)$')
+        p12 = regex_engine.compile(r'^\s*CC +failed +for +VLANs:( +(?P<cc_failed_vlans>[\w\/]+))?$')
         #   VLAN CC timer: no-timer
-        p13 = re.compile(r'^\s*VLAN +CC +timer: +(?P<cc_timer_left>\S+)?$')
-        p14 = re.compile(r'^\s*Number +of +ES +members: +(?P<num_es_mem>[\d]+)?$')
-        p15 = re.compile(r'^\s*My +ordinal: +(?P<local_ordinal>[\d]+)$')
-        p16 = re.compile(r'^\s*DF +timer +start +time: +(?P<df_timer_start_time>[\w\:]+)$')
-        p17 = re.compile(r'^\s*Config +State: +(?P<config_status>[\w\/]+)$')
-        p18 = re.compile(r'^\s*DF +List: +(?P<df_list>[\d\s\.]+)$')
-        p19 = re.compile(r'^\s*ES +route +added +to +L2RIB: +(?P<is_es_added_to_l2rib>[\w]+)$')
-        p20 = re.compile(r'^\s*EAD\/ES +routes +added +to +L2RIB: +(?P<ead_rt_added>[\w]+)$')
-        p21 = re.compile(r'^\s*EAD/EVI +route +timer +age: +(?P<ead_evi_rt_timer_age>[\w\s]+)$')
+        p13 = regex_engine.compile(r'^\s*VLAN +CC +timer: +(?P<cc_timer_left>\S+)?$')
+        p14 = regex_engine.compile(r'^\s*Number +of +ES +members: +(?P<num_es_mem>[\d]+)?$')
+        p15 = regex_engine.compile(r'^\s*My +ordinal: +(?P<local_ordinal>[\d]+)$')
+        p16 = regex_engine.compile(r'^\s*DF +timer +start +time: +(?P<df_timer_start_time>[\w\:]+)$')
+        p17 = regex_engine.compile(r'^\s*Config +State: +(?P<config_status>[\w\/]+)$')
+        p18 = regex_engine.compile(r'^\s*DF +List: +(?P<df_list>[\d\s\.]+)$')
+        p19 = regex_engine.compile(r'^\s*ES +route +added +to +L2RIB: +(?P<is_es_added_to_l2rib>[\w]+)$')
+        p20 = regex_engine.compile(r'^\s*EAD\/ES +routes +added +to +L2RIB: +(?P<ead_rt_added>[\w]+)$')
+        p21 = regex_engine.compile(r'^\s*EAD/EVI +route +timer +age: +(?P<ead_evi_rt_timer_age>[\w\s]+)$')
 
         for line in out.splitlines():
             if line:
@@ -1147,8 +1145,8 @@ class ShowL2routeEvpnEternetSegmentAll(ShowL2routeEvpnEternetSegmentAllSchema):
         # ------------------------ -----------------  ----- ----------- ----------
         # 0300.00ff.0001.2c00.0309 192.168.111.55         VXLAN nve1         64
 
-        p1 = re.compile(r'^\s*(?P<ethernet_segment>(?!ESI)[\w\.]+) +(?P<originating_rtr>[\d\.]+)'
-                        r' +(?P<prod_name>[\w]+) +(?P<int_ifhdl>[\w\/]+) +(?P<client_nfn>[\w\.]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<ethernet_segment>(?!ESI)[\w\.]+) +(?P<originating_rtr>[\d\.]+)'
+                                  r' +(?P<prod_name>[\w]+) +(?P<int_ifhdl>[\w\/]+) +(?P<client_nfn>[\w\.]+)$')
         for line in out.splitlines():
             if line:
                 line = line.rstrip()
@@ -1237,15 +1235,15 @@ class ShowL2routeTopologyDetail(ShowL2routeTopologyDetailSchema):
         #                   RMAC: 5e00.00ff.050c, VRFID: 3
         #                   VMAC: 0200.c9ff.1722
         #                   Flags: L3cp, Sub_Flags: --, Prev_Flags: -
-        p1 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<topo_name>[\w\-]+) +(?P<topo_type>[\w\/]+)(: +(?P<vni>[\d]+))?$')
-        p2 = re.compile(r'^\s*Encap:(?P<encap_type>[\d]+) +IOD:(?P<iod>[\d]+) +IfHdl:(?P<if_hdl>[\d]+)$')
-        p3 = re.compile(r'^\s*VTEP +IP: +(?P<vtep_ip>[\d\.]+)$')
-        p4 = re.compile(r'^\s*Emulated +IP: +(?P<emulated_ip>[\d\.]+)$')
-        p5 = re.compile(r'^\s*Emulated +RO +IP: +(?P<emulated_ro_ip>[\d\.]+)$')
-        p6 = re.compile(r'^\s*TX-ID: +(?P<tx_id>[\d]+) +\((Rcvd +Ack: +(?P<rcvd_flag>[\d]+))\)$')
-        p7 = re.compile(r'^\s*RMAC: +(?P<rmac>[\w\.]+), VRFID: +(?P<vrf_id>[\d]+)$')
-        p8 = re.compile(r'^\s*VMAC: +(?P<vmac>[\w\.]+)$')
-        p9 = re.compile(
+        p1 = regex_engine.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<topo_name>[\w\-]+) +(?P<topo_type>[\w\/]+)(: +(?P<vni>[\d]+))?$')
+        p2 = regex_engine.compile(r'^\s*Encap:(?P<encap_type>[\d]+) +IOD:(?P<iod>[\d]+) +IfHdl:(?P<if_hdl>[\d]+)$')
+        p3 = regex_engine.compile(r'^\s*VTEP +IP: +(?P<vtep_ip>[\d\.]+)$')
+        p4 = regex_engine.compile(r'^\s*Emulated +IP: +(?P<emulated_ip>[\d\.]+)$')
+        p5 = regex_engine.compile(r'^\s*Emulated +RO +IP: +(?P<emulated_ro_ip>[\d\.]+)$')
+        p6 = regex_engine.compile(r'^\s*TX-ID: +(?P<tx_id>[\d]+) +\((Rcvd +Ack: +(?P<rcvd_flag>[\d]+))\)$')
+        p7 = regex_engine.compile(r'^\s*RMAC: +(?P<rmac>[\w\.]+), VRFID: +(?P<vrf_id>[\d]+)$')
+        p8 = regex_engine.compile(r'^\s*VMAC: +(?P<vmac>[\w\.]+)$')
+        p9 = regex_engine.compile(
             r'^\s*Flags: +(?P<flags>[\w]+), +Sub_Flags: +(?P<sub_flags>[\w\-]+), +Prev_Flags: +(?P<prev_flags>[\w\-]+)$')
 
         for line in out.splitlines():
@@ -1383,27 +1381,27 @@ class ShowL2routeMacAllDetail(ShowL2routeMacAllDetailSchema):
         #             Encap: 1
 
         #  11          0000.1111.0108 BGP    Spl           0          3.2.2.1 (Label: 10011)
-        p1 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<prod_type>[\w\,]+)'
-                        r' +(?P<flags>[\w\,\-]+) +(?P<seq_num>[\d]+) +(?P<next_hop1>[\w\/\.]+)\s*'
-                        r'(?:\(Label: (?P<label>\d+)\).*)?$')
+        p1 = regex_engine.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<prod_type>[\w\,]+)'
+                                  r' +(?P<flags>[\w\,\-]+) +(?P<seq_num>[\d]+) +(?P<next_hop1>[\w\/\.]+)\s*'
+                                  r'(?:\(Label: (?P<label>\d+)\).*)?$')
         #  3.2.2.2 (Label: 10011)
-        p2 = re.compile(r'^\s*(?P<next_hop2>[\d\/\.]+)')
+        p2 = regex_engine.compile(r'^\s*(?P<next_hop2>[\d\/\.]+)')
         #  Route Resolution Type: ESI
-        p3 = re.compile(r'^\s*Route +Resolution +Type: +(?P<rte_res>[\w]+)$')
+        p3 = regex_engine.compile(r'^\s*Route +Resolution +Type: +(?P<rte_res>[\w]+)$')
         #  Forwarding State: Resolved (PeerID: 2)
-        p4 = re.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)( +\(PeerID: +(?P<peer_id>[\d]+)\))?$')
+        p4 = regex_engine.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)( +\(PeerID: +(?P<peer_id>[\d]+)\))?$')
         #  Forwarding State: Resolved
-        p10 = re.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)$')
+        p10 = regex_engine.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)$')
         #  Forwarding State: Resolved (PL)
-        p11 = re.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)( +\(PL\))$')
+        p11 = regex_engine.compile(r'^\s*Forwarding +State: +(?P<fwd_state>[\w]+)( +\(PL\))$')
         #  Resultant PL: 3.2.2.1, 3.2.2.2
-        p5 = re.compile(r'^\s*Resultant +PL: +(?P<res_pl>.*$)')
+        p5 = regex_engine.compile(r'^\s*Resultant +PL: +(?P<res_pl>.*$)')
         #  ESI : 0300.0000.0000.0000.0347
-        p6 = re.compile(r'^\s*ESI\s*: +(?P<esi>[\w\.]+)\s*$')
+        p6 = regex_engine.compile(r'^\s*ESI\s*: +(?P<esi>[\w\.]+)\s*$')
         #  Sent To: L2FM
         #  SOO: 774975538
         #  Encap: 1
-        p7 = re.compile(r'^\s*(?P<key>[\w ]+) *: +(?P<value>\S+)\s*$')
+        p7 = regex_engine.compile(r'^\s*(?P<key>[\w ]+) *: +(?P<value>\S+)\s*$')
 
         for line in out.splitlines():
             if line:
@@ -1544,22 +1542,22 @@ class ShowL2routeMacIpAllDetail(ShowL2routeMacIpAllDetailSchema):
         # 101         fa16.3eff.e94e BGP    --            0          10.111.8.3    10.84.66.66
         # 101         0011.00ff.0034 BGP  10.36.3.2                      10.70.0.2
         # 202         0011.01ff.0002 BGP    --            0         2001:db8:646::5678:1 6:1:1::2
-        p1 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<mac_ip_prod_type>[\w\,]+)'
-                        r'( +(?P<mac_ip_flags>[\w\,\-]+))?( +(?P<seq_num>[\d]+))? +(?P<host_ip>[\w\/\.\:]+)'
-                        r' +(?P<next_hop1>[\w\/\.\:]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<mac_ip_prod_type>[\w\,]+)'
+                                  r'( +(?P<mac_ip_flags>[\w\,\-]+))?( +(?P<seq_num>[\d]+))? +(?P<host_ip>[\w\/\.\:]+)'
+                                  r' +(?P<next_hop1>[\w\/\.\:]+)$')
 
-        p2 = re.compile(r'^\s*Sent +To: +(?P<sent_to>[\w]+)$')
-        p3 = re.compile(r'^\s*SOO: +(?P<soo>[\d]+)$')
-        p4 = re.compile(r'^\s*L3-Info: +(?P<l3_info>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*Sent +To: +(?P<sent_to>[\w]+)$')
+        p3 = regex_engine.compile(r'^\s*SOO: +(?P<soo>[\d]+)$')
+        p4 = regex_engine.compile(r'^\s*L3-Info: +(?P<l3_info>[\d]+)$')
 
         # Topology    Mac Address    Host IP         Prod   Flags         Seq No     Next-Hops
         # ----------- -------------- --------------- ------ ---------- ---------------
         # 101         0000.9cff.2293 10.111.1.3     BGP    --            0         10.76.23.23
         # 201         0011.01ff.0001 10.1.1.2       BGP    --            0         2001:db8:646:a2bb:0:abcd:5678:1
         # 202         0011.01ff.0001 5:1:1:1::2     BGP    --            0         2001:db8:646:a2bb:0:abcd:5678:1
-        p5 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<host_ip>[\w\/\.\:]+)'
-                        r' +(?P<mac_ip_prod_type>[\w\,]+)'
-                        r' +(?P<mac_ip_flags>[\w\,\-]+) +(?P<seq_num>[\d]+) +(?P<next_hop1>[\w\/\.\:]+)$')
+        p5 = regex_engine.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<mac_addr>[\w\.]+) +(?P<host_ip>[\w\/\.\:]+)'
+                                  r' +(?P<mac_ip_prod_type>[\w\,]+)'
+                                  r' +(?P<mac_ip_flags>[\w\,\-]+) +(?P<seq_num>[\d]+) +(?P<next_hop1>[\w\/\.\:]+)$')
 
         for line in out.splitlines():
             if line:
@@ -1681,11 +1679,11 @@ class ShowL2routeSummary(ShowL2routeSummarySchema):
         # ---------------------------------------------
         # Total             21           5927
         # ---------------------------------------------
-        p1 = re.compile(r'^\s*Total +Memory: +(?P<total_memory>[\d]+)$')
-        p2 = re.compile(r'^\s*Number +of +Converged +Tables: +(?P<numof_converged_tables>[\d]+)$')
-        p3 = re.compile(r'^\s*Table +Name: +(?P<table_name>[\w\-]+)$')
-        p4 = re.compile(r'^\s*(?P<producer_name>[\w]+) +\((?P<id>[\d\s]+)\) +(?P<objects>[\d]+) +(?P<memory>[\d]+)$')
-        p5 = re.compile(r'^\s*Total +(?P<total_obj>[\d]+) +(?P<total_mem>[\d]+)$')
+        p1 = regex_engine.compile(r'^\s*Total +Memory: +(?P<total_memory>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*Number +of +Converged +Tables: +(?P<numof_converged_tables>[\d]+)$')
+        p3 = regex_engine.compile(r'^\s*Table +Name: +(?P<table_name>[\w\-]+)$')
+        p4 = regex_engine.compile(r'^\s*(?P<producer_name>[\w]+) +\((?P<id>[\d\s]+)\) +(?P<objects>[\d]+) +(?P<memory>[\d]+)$')
+        p5 = regex_engine.compile(r'^\s*Total +(?P<total_obj>[\d]+) +(?P<total_mem>[\d]+)$')
 
         for line in out.splitlines():
             if line:
@@ -1782,7 +1780,7 @@ class ShowL2routeFlAll(ShowL2routeFlAllSchema):
         # Topology ID Peer-id     Flood List      Service Node
         # ----------- ----------- --------------- ------------
 
-        p1 = re.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<peer_id>[\d]+) +(?P<flood_list>[\w\.d]+) +(?P<is_service_node>[\w]+)$')
+        p1 = regex_engine.compile(r'^\s*(?P<topo_id>[\d]+) +(?P<peer_id>[\d]+) +(?P<flood_list>[\w\.d]+) +(?P<is_service_node>[\w]+)$')
 
         for line in out.splitlines():
             if line:
@@ -1876,48 +1874,48 @@ class ShowRunningConfigNvOverlay(ShowRunningConfigNvOverlaySchema):
 
         result_dict = {}
         # feature nv overlay
-        p0 = re.compile(r'^\s*feature nv overlay$')
+        p0 = regex_engine.compile(r'^\s*feature nv overlay$')
         #   evpn multisite border-gateway 111111
-        p1 = re.compile(r'^\s*evpn multisite border-gateway +(?P<evpn_multisite_border_gateway>[\w]+)$')
+        p1 = regex_engine.compile(r'^\s*evpn multisite border-gateway +(?P<evpn_multisite_border_gateway>[\w]+)$')
         #   delay-restore time 185
-        p2 = re.compile(r'^\s*delay-restore time +(?P<evpn_msite_bgw_delay_restore_time>[\d]+)$')
+        p2 = regex_engine.compile(r'^\s*delay-restore time +(?P<evpn_msite_bgw_delay_restore_time>[\d]+)$')
         #   interface nve1
-        p3 = re.compile(r'^\s*interface +(?P<nve_name>nve[\d]+)$')
+        p3 = regex_engine.compile(r'^\s*interface +(?P<nve_name>nve[\d]+)$')
         #   no shutdown
-        p4 = re.compile(r'^\s*no shutdown$')
+        p4 = regex_engine.compile(r'^\s*no shutdown$')
         #   host-reachability protocol bgp
-        p5 = re.compile(r'^\s*host-reachability protocol +(?P<host_reachability_protocol>[\w]+)$')
+        p5 = regex_engine.compile(r'^\s*host-reachability protocol +(?P<host_reachability_protocol>[\w]+)$')
         #   advertise virtual-rmac
-        p6 = re.compile(r'^\s*advertise virtual-rmac$')
+        p6 = regex_engine.compile(r'^\s*advertise virtual-rmac$')
         #   source-interface loopback1
-        p7 = re.compile(r'^\s*source-interface +(?P<source_if>[\w]+)$')
+        p7 = regex_engine.compile(r'^\s*source-interface +(?P<source_if>[\w]+)$')
         #   multisite border-gateway interface loopback3
-        p8 = re.compile(r'^\s*multisite +border\-gateway +interface +(?P<multisite_bgw_if>[\w]+)$')
+        p8 = regex_engine.compile(r'^\s*multisite +border\-gateway +interface +(?P<multisite_bgw_if>[\w]+)$')
         #   member vni 10100 associate-vrf
         #   member vni 10100-10105 associate-vrf
-        p9 = re.compile(r'^\s*member vni +(?P<nve_vni>[\d-]+)( +(?P<associated_vrf>[\w\-]+))?$')
+        p9 = regex_engine.compile(r'^\s*member vni +(?P<nve_vni>[\d-]+)( +(?P<associated_vrf>[\w\-]+))?$')
         #   multisite ingress-replication
-        p10 = re.compile(r'^\s*multisite ingress-replication$')
+        p10 = regex_engine.compile(r'^\s*multisite ingress-replication$')
         #   mcast-group 231.100.1.1
-        p11 = re.compile(r'^\s*mcast-group +(?P<mcast_group>[\d\.]+)$')
+        p11 = regex_engine.compile(r'^\s*mcast-group +(?P<mcast_group>[\d\.]+)$')
         #   interface Ethernet1/1
         #   interface port-channel11
-        p12 = re.compile(r'^\s*interface +(?P<interface>(?!nve)[\w\/\-]+)$')
+        p12 = regex_engine.compile(r'^\s*interface +(?P<interface>(?!nve)[\w\/\-]+)$')
         #   evpn multisite fabric-tracking
         #   evpn multisite dci-tracking
-        p13 = re.compile(r'^\s*evpn multisite +(?P<fabric_dci_tracking>[\w\-]+)$')
+        p13 = regex_engine.compile(r'^\s*evpn multisite +(?P<fabric_dci_tracking>[\w\-]+)$')
         # global suppress-arp
-        p14 = re.compile(r'^global +suppress-arp$')
+        p14 = regex_engine.compile(r'^global +suppress-arp$')
         # global mcast-group 192.168.0.1 L2
-        p15 = re.compile(r'^global +mcast-group +(?P<address>[\d\.]+) +(?P<layer>L2|L3)')
+        p15 = regex_engine.compile(r'^global +mcast-group +(?P<address>[\d\.]+) +(?P<layer>L2|L3)')
         #   multisite ingress-replication optimized
-        p16 = re.compile(r'^multisite +ingress-replication +optimized$')
+        p16 = regex_engine.compile(r'^multisite +ingress-replication +optimized$')
         #   ingress-replication protocol bgp
-        p17 = re.compile(r'^ingress-replication +protocol +bgp$')
+        p17 = regex_engine.compile(r'^ingress-replication +protocol +bgp$')
         #   multisite mcast-group 226.1.1.1
-        p18 = re.compile(r'^multisite mcast-group +(?P<multisite_mcast_group>[\d\.]+)$')
+        p18 = regex_engine.compile(r'^multisite mcast-group +(?P<multisite_mcast_group>[\d\.]+)$')
         #   peer-ip 25.25.25.25
-        p19 = re.compile(r'^\s*peer-ip (?P<peer_ip>\S+)$')
+        p19 = regex_engine.compile(r'^\s*peer-ip (?P<peer_ip>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2132,17 +2130,17 @@ class ShowNveVniIngressReplication(ShowNveVniIngressReplicationSchema):
         # nve1      10011    2001:db8:1:1::1:1           BGP-IMET   00:46:55
         # nve1      10211    fe80::2fe:c8ff:fe09:8fff           BGP-IMET   00:46:55
 
-        p1 = re.compile(r'^(?P<nve_name>[\w]+) +(?P<vni>[\d]+)( '
-                        r'+(?P<replication_list>[\d\.]+|[\w\:]+) '
-                        r'+(?P<source>[\w\-]+) +(?P<uptime>[\w\:]+))?$')
+        p1 = regex_engine.compile(r'^(?P<nve_name>[\w]+) +(?P<vni>[\d]+)( '
+                                  r'+(?P<replication_list>[\d\.]+|[\w\:]+) '
+                                  r'+(?P<source>[\w\-]+) +(?P<uptime>[\w\:]+))?$')
 
         # 192.168.51.51        BGP-IMET 03:21:19
         # 192.168.154.52        BGP-IMET 03:15:18
         # 192.168.154.51        BGP-IMET 03:21:19
         # 2001:db8:1:4::1:4           BGP-IMET   00:48:12
         # fe80::2fe:c8ff:fe09:8fff BGP-IMET   00:47:54
-        p2 = re.compile(r'^(?P<replication_list>[\d\.]+|[\w\:]+) '
-                        r'+(?P<source>[\w\-]+) +(?P<uptime>[\w\:]+)$')
+        p2 = regex_engine.compile(r'^(?P<replication_list>[\d\.]+|[\w\:]+) '
+                                  r'+(?P<source>[\w\-]+) +(?P<uptime>[\w\:]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2227,32 +2225,32 @@ class ShowFabricMulticastGlobals(ShowFabricMulticastGlobalsSchema):
         result_dict = {}
 
         # Pruning: segment-based
-        p1 = re.compile(r'^\s*Pruning: +(?P<pruning>[\w\-]+)$')
+        p1 = regex_engine.compile(r'^\s*Pruning: +(?P<pruning>[\w\-]+)$')
 
         # Switch role:
-        p2 = re.compile(r'^\s*Switch +role:( +(?P<switch_role>[\w]+))?$')
+        p2 = regex_engine.compile(r'^\s*Switch +role:( +(?P<switch_role>[\w]+))?$')
 
         # Fabric Control Seg: Null
-        p3 = re.compile(r'^\s*Fabric +Control +Seg: +(?P<fabric_control_seg>[\w]+)$')
+        p3 = regex_engine.compile(r'^\s*Fabric +Control +Seg: +(?P<fabric_control_seg>[\w]+)$')
 
         # Peer Fabric Control Address: 0.0.0.0
-        p4 = re.compile(r'^\s*Peer +Fabric +Control +Address: +(?P<peer_fabric_ctrl_addr>[\w\.]+)$')
+        p4 = regex_engine.compile(r'^\s*Peer +Fabric +Control +Address: +(?P<peer_fabric_ctrl_addr>[\w\.]+)$')
 
         # Advertising vPC RPF routes: Disabled
-        p5 = re.compile(r'^\s*Advertising +vPC +RPF +routes: +(?P<advertise_vpc_rpf_routes>[\w]+)$')
+        p5 = regex_engine.compile(r'^\s*Advertising +vPC +RPF +routes: +(?P<advertise_vpc_rpf_routes>[\w]+)$')
 
         # Created VNI List: -
-        p6 = re.compile(r'^\s*Created +VNI +List: +(?P<created_vni_list>[\w\-]+)$')
+        p6 = regex_engine.compile(r'^\s*Created +VNI +List: +(?P<created_vni_list>[\w\-]+)$')
 
         # Fwd Encap: (null)
         # Fwd Encap: Invalid encapsulation
-        p7 = re.compile(r'^\s*Fwd +Encap: +(?P<fwd_encap>[\w\\(\)\s]+)$')
+        p7 = regex_engine.compile(r'^\s*Fwd +Encap: +(?P<fwd_encap>[\w\\(\)\s]+)$')
 
         # Overlay Distributed-DR: FALSE
-        p8 = re.compile(r'^\s*Overlay +Distributed\-DR: +(?P<overlay_distributed_dr>[\w]+)$')
+        p8 = regex_engine.compile(r'^\s*Overlay +Distributed\-DR: +(?P<overlay_distributed_dr>[\w]+)$')
 
         # Overlay spt-only: TRUE
-        p9 = re.compile(r'^\s*Overlay +spt\-only: +(?P<overlay_spt_only>[\w]+)$')
+        p9 = regex_engine.compile(r'^\s*Overlay +spt\-only: +(?P<overlay_spt_only>[\w]+)$')
 
         for line in out.splitlines():
             if line:
@@ -2393,21 +2391,21 @@ class ShowFabricMulticastIpSaAdRoute(ShowFabricMulticastIpSaAdRouteSchema):
         # VRF "vni_10100" MVPN SA AD Route Database VNI: 10100
         # VRF "vpc-keepalive" MVPN SA AD Route Database VNI: 0
 
-        p1 = re.compile(r'^\s*VRF +\"(?P<vrf_name>\S+)\" +MVPN +SA +AD +Route +Database'
-                        r' +VNI: +(?P<vnid>[\d]+)$')
+        p1 = regex_engine.compile(r'^\s*VRF +\"(?P<vrf_name>\S+)\" +MVPN +SA +AD +Route +Database'
+                                  r' +VNI: +(?P<vnid>[\d]+)$')
 
         # Src Active AD route: (1.1.11.3/32, 226.0.0.1/32) uptime: 00:12:32
         # SA-AD Route: (1.1.11.3/32, 226.0.0.1/32) uptime: 00:12:32
-        p2 = re.compile(r'((^\s*SA\-AD +Route:)|(^\s*Src +Active +AD +route:)) +\((?P<saddr>[\w\/\.]+), +(?P<gaddr>[\w\/\.]+)\)'
-                        r' +uptime: +(?P<uptime>[\w\.\:]+)$')
+        p2 = regex_engine.compile(r'((^\s*SA\-AD +Route:)|(^\s*Src +Active +AD +route:)) +\((?P<saddr>[\w\/\.]+), +(?P<gaddr>[\w\/\.]+)\)'
+                                  r' +uptime: +(?P<uptime>[\w\.\:]+)$')
 
         #  Interested Fabric Nodes:
-        p3 = re.compile(r'^\s*Interested Fabric Nodes:$')
+        p3 = regex_engine.compile(r'^\s*Interested Fabric Nodes:$')
 
 
         #    This node, uptime: 00:01:01
         #    100.100.100.4, uptime: 00:01:01
-        p4 = re.compile(r'^\s*(?P<interested_fabric_nodes>[\w\s\.]+), +uptime: +(?P<interest_uptime>[\w\.\:]+)$')
+        p4 = regex_engine.compile(r'^\s*(?P<interested_fabric_nodes>[\w\s\.]+), +uptime: +(?P<interest_uptime>[\w\.\:]+)$')
 
         for line in out.splitlines():
             if not line:
@@ -2525,24 +2523,24 @@ class ShowFabricMulticastIpMroute(ShowFabricMulticastIpMrouteSchema):
 
         # VRF "trm-vxlan-3001" Fabric mroute Database VNI: 203001
 
-        p1 = re.compile(r'^\s*VRF +\"(?P<vrf_name>\S+)\" +Fabric +mroute +Database'\
-                        r' +VNI: +(?P<vnid>[\d]+)$')
+        p1 = regex_engine.compile(r'^\s*VRF +\"(?P<vrf_name>\S+)\" +Fabric +mroute +Database'\
+                                  r' +VNI: +(?P<vnid>[\d]+)$')
 
 
         # Fabric Mroute: (179.1.12.11 / 32, 225.1.1.1 / 32) ptr: 0x56207780cbcc flags:0 uptime:00:01:01
 
-        p2 = re.compile(r'^\s*Fabric +Mroute: +\((?P<saddr>[\w\/\.\*]+), +(?P<gaddr>[\w\/\.]+)\) +ptr: +0[xX][0-9a-'\
-                        r'fA-F]+ flags: +[0-9]+ +uptime: +(?P<uptime>[\w\.\:]+)$')
+        p2 = regex_engine.compile(r'^\s*Fabric +Mroute: +\((?P<saddr>[\w\/\.\*]+), +(?P<gaddr>[\w\/\.]+)\) +ptr: +0[xX][0-9a-'\
+                                  r'fA-F]+ flags: +[0-9]+ +uptime: +(?P<uptime>[\w\.\:]+)$')
 
         # RD-RT ext comm Route-Import:  0b 64 64 64 06 0b b9 00 01 5a 5a 5a 06 80 0b e8 03 00 00
-        p3 = re.compile(r'^\s*RD-RT ext comm Route-Import: +(?P<vri>[\w\s]+)$')
+        p3 = regex_engine.compile(r'^\s*RD-RT ext comm Route-Import: +(?P<vri>[\w\s]+)$')
         #  Interested Fabric Nodes:
-        p4 = re.compile(r'^\s*Interested Fabric Nodes:$')
+        p4 = regex_engine.compile(r'^\s*Interested Fabric Nodes:$')
 
         #   This node, uptime: 00:30:25    RPF Neighbor: 102.1.1.1
         #   100.100.100.1 (core), uptime: 00:30:25    RPF Neighbor: 102.1.1.1
-        p5 = re.compile(r'^\s*(?P<interested_fabric_nodes>[\w\s\.]+) *(\((?P<loc>[\w]+)\))? *, +uptime: +'\
-                         r'(?P<interest_uptime>[\w\.\:]+) +RPF +Neighbor: +(?P<rpfneighbor>[\w\/\.]+)$')
+        p5 = regex_engine.compile(r'^\s*(?P<interested_fabric_nodes>[\w\s\.]+) *(\((?P<loc>[\w]+)\))? *, +uptime: +'\
+                                   r'(?P<interest_uptime>[\w\.\:]+) +RPF +Neighbor: +(?P<rpfneighbor>[\w\/\.]+)$')
 
         for line in out.splitlines():
             if not line:
@@ -2658,16 +2656,16 @@ class ShowFabricMulticastIpL2Mroute(ShowFabricMulticastIpL2MrouteSchema):
 
         result_dict = {}
         # EVPN C-Mcast Route Database for VNI: 10101
-        p1 = re.compile(r'^\s*EVPN +C\-Mcast +Route +Database +for +VNI: +(?P<vni>[\d]+)$')
+        p1 = regex_engine.compile(r'^\s*EVPN +C\-Mcast +Route +Database +for +VNI: +(?P<vni>[\d]+)$')
 
         # Fabric L2-Mroute: (*, 231.1.3.101/32)
-        p2 = re.compile(r'^\s*Fabric +L2\-Mroute: +\((?P<saddr>[\w\/\.\*]+), +(?P<gaddr>[\w\/\.]+)\)$')
+        p2 = regex_engine.compile(r'^\s*Fabric +L2\-Mroute: +\((?P<saddr>[\w\/\.\*]+), +(?P<gaddr>[\w\/\.]+)\)$')
 
         #  Interested Fabric Nodes:
-        p3 = re.compile(r'^\s*Interested Fabric Nodes:$')
+        p3 = regex_engine.compile(r'^\s*Interested Fabric Nodes:$')
 
         #   This node
-        p4 = re.compile(r'^(?P<space>\s{4})(?P<interested_fabric_nodes>[\w\s\.]+)$')
+        p4 = regex_engine.compile(r'^(?P<space>\s{4})(?P<interested_fabric_nodes>[\w\s\.]+)$')
 
         interested_flag = False
         for line in out.splitlines():
@@ -2789,7 +2787,7 @@ class ShowNveEthernetSegmentSummary(ShowNveEthernetSegmentSummarySchema):
         # 0300.0a00.0b00.0c00.0066         port-channel102    Up         
         # 0300.0a00.0b00.0c00.0067         port-channel103    Up         
 
-        p1 = re.compile(r'^(?P<esi_id>([0-9a-f]{4}.){4}[0-9a-f]{4})\s+(?P<parent>\S+)\s+(?P<esi_state>\S+)\s*$')
+        p1 = regex_engine.compile(r'^(?P<esi_id>([0-9a-f]{4}.){4}[0-9a-f]{4})\s+(?P<parent>\S+)\s+(?P<esi_state>\S+)\s*$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -0,0 +1,112 @@
+expected_output = {
+    "vrf": {
+        "default": {
+            "address_family": {
+                "ipv4 unicast": {
+                    "history_paths": 0,
+                    "dampened_paths": 2,
+                    "dampening_enabled": True,
+                    "network": {
+                        "10.25.1.0/24": {
+                            "status": "d",
+                            "pathtype": "e",
+                            "peer": "10.106.102.3",
+                            "flaps": 39,
+                            "duration": "00:09:53",
+                            "reuse_time": "00:01:40",
+                            "current_penalty": 34,
+                            "suppress_limit": 30,
+                            "reuse_limit": 10,
+                            "best": False,
+                        },
+                        "10.25.2.0/24": {
+                            "status": "h",
+                            "pathtype": "e",
+                            "peer": "10.106.102.3",
+                            "flaps": 3,
+                            "duration": "00:02:53",
+                            "current_penalty": 12,
+                            "suppress_limit": 30,
+                            "reuse_limit": 10,
+                            "best": True,
+                        },
+                    },
+                },
+                "ipv4 multicast": {
+                    "history_paths": 1,
+                    "dampened_paths": 0,
+                    "dampening_enabled": True,
+                    "network": {
+                        "10.36.1.0/24": {
+                            "status": "h",
+                            "pathtype": "e",
+                            "peer": "10.106.102.4",
+                            "flaps": 2,
+                            "duration": "00:01:12",
+                            "current_penalty": 8,
+                            "suppress_limit": 30,
+                            "reuse_limit": 10,
+                            "best": False,
+                        },
+                    },
+                },
+                "ipv6 unicast": {
+                    "history_paths": 1,
+                    "dampened_paths": 1,
+                    "dampening_enabled": True,
+                    "route_identifier": {
+                        "1:100": {
+                            "history_paths": 1,
+                            "dampened_paths": 1,
+                            "dampening_enabled": True,
+                            "network": {
+                                "2001::/112": {
+                                    "status": "d",
+                                    "pathtype": "e",
+                                    "peer": "2001:db8:8d82::2002",
+                                    "flaps": 5,
+                                    "duration": "00:09:53",
+                                    "reuse_time": "00:01:40",
+                                    "current_penalty": 34,
+                                    "suppress_limit": 30,
+                                    "reuse_limit": 10,
+                                    "best": False,
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+        "VRF1": {
+            "address_family": {
+                "l2vpn evpn": {
+                    "history_paths": 0,
+                    "dampened_paths": 0,
+                    "dampening_enabled": True,
+                    "route_identifier": {
+                        "2:100": {
+                            "history_paths": 0,
+                            "dampened_paths": 0,
+                            "dampening_enabled": True,
+                            "network": {
+                                "[2]:[0]:[0]:[48]:[0201.02ff.0302]:[32]:[10.81.1.1]/248": {
+                                    "status": "d",
+                                    "pathtype": "e",
+                                    "peer": "10.1.1.1",
+                                    "flaps": 5,
+                                    "duration": "00:09:53",
+                                    "reuse_time": "00:01:40",
+                                    "current_penalty": 34,
+                                    "suppress_limit": 30,
+                                    "reuse_limit": 10,
+                                    "best": True,
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
@@ -0,0 +1,85 @@
+expected_output = {
+    "vrf": {
+        "default": {
+            "address_family": {
+                "ipv4 unicast": {
+                    "af_nexthop_trigger_enable": True,
+                    "nexthop_trigger_delay_non_critical": 10000,
+                    "nexthop_trigger_delay_critical": 3000,
+                    "next_hop": {
+                        "192.168.154.1": {
+                            "refcount": 1,
+                            "igp_cost": 3,
+                            "igp_route_type": 0,
+                            "igp_preference": 110,
+                            "resolve_time": "18:38:21",
+                            "rib_route": "192.168.154.1/32",
+                            "metric_next_advertise": "never",
+                            "rnh_epoch": 1,
+                            "multipath": "No",
+                            "attached": False,
+                            "local": False,
+                            "reachable": True,
+                            "labeled": True,
+                            "filtered": False,
+                            "pending_update": False,
+                            "attached_nexthop": {
+                                "192.168.66.2": {
+                                    "attached_nexthop_interface": "port-channel2.100",
+                                },
+                                "192.168.66.3": {
+                                    "attached_nexthop_interface": "port-channel2.101",
+                                },
+                            },
+                        },
+                        "0.0.0.0": {
+                            "refcount": 2,
+                            "igp_cost": 0,
+                            "igp_route_type": 0,
+                            "igp_preference": 0,
+                            "resolve_time": "18:38:21",
+                            "rib_route": "0.0.0.0/0",
+                            "metric_next_advertise": "never",
+                            "rnh_epoch": 0,
+                            "multipath": "Yes",
+                            "attached": True,
+                            "local": True,
+                            "reachable": True,
+                            "labeled": False,
+                            "filtered": False,
+                            "pending_update": True,
+                        },
+                    },
+                },
+                "ipv6 unicast": {
+                    "af_nexthop_trigger_enable": True,
+                    "nexthop_trigger_delay_non_critical": 10000,
+                    "nexthop_trigger_delay_critical": 3000,
+                    "next_hop": {
+                        "2001:db8:400::3:1": {
+                            "refcount": 1,
+                            "igp_cost": 3,
+                            "igp_route_type": 0,
+                            "igp_preference": 110,
+                            "resolve_time": "18:38:21",
+                            "rib_route": "0::/0",
+                            "metric_next_advertise": "never",
+                            "rnh_epoch": 1,
+                            "attached": False,
+                            "local": False,
+                            "reachable": True,
+                            "labeled": True,
+                            "filtered": False,
+                            "pending_update": False,
+                            "attached_nexthop": {
+                                "fe80::6e9c:edff:fe4d:ff41": {
+                                    "attached_nexthop_interface": "Ethernet1/1",
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
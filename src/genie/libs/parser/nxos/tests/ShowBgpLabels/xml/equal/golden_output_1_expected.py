@@ -0,0 +1,88 @@
+expected_output = {
+    "vrf": {
+        "VRF1": {
+            "address_family": {
+                "vpnv4 unicast": {
+                    "route_distinguisher": {
+                        "100:100": {
+                            "prefix": {
+                                "10.1.1.0/24": {
+                                    "index": {
+                                        0: {
+                                            "status": "valid",
+                                            "best_path": True,
+                                            "type": "internal",
+                                            "nexthop": "10.106.101.1",
+                                            "in_label": "nolabel",
+                                            "out_label": "492287",
+                                            "status_code": "*",
+                                            "best_code": ">",
+                                            "type_code": "i",
+                                            "vpn": "VRF1",
+                                        },
+                                        1: {
+                                            "status": "valid",
+                                            "best_path": False,
+                                            "type": "external",
+                                            "nexthop": "10.106.102.1",
+                                            "in_label": "nolabel",
+                                            "out_label": "nolabel",
+                                            "status_code": "*",
+                                            "type_code": "e",
+                                            "hold_down": "yes",
+                                        },
+                                    },
+                                },
+                            },
+                            "rd_vrf": "VRF1",
+                        },
+                        "200:200": {
+                            "prefix": {
+                                "10.2.2.0/24": {
+                                    "index": {
+                                        0: {
+                                            "status": "valid",
+                                            "best_path": True,
+                                            "type": "external",
+                                            "nexthop": "10.106.102.1",
+                                            "in_label": "492288",
+                                            "out_label": "nolabel",
+                                            "status_code": "*",
+                                            "best_code": ">",
+                                            "type_code": "e",
+                                            "vpn": "VRF1",
+                                        },
+                                    },
+                                },
+                            },
+                            "rd_vrf": "VRF1",
+                        },
+                    },
+                    "table_version": 7,
+                    "router_id": "10.106.0.6",
+                },
+                "vpnv6 unicast": {
+                    "prefix": {
+                        "2001:db8:4309::/112": {
+                            "index": {
+                                0: {
+                                    "status": "valid",
+                                    "best_path": True,
+                                    "type": "local",
+                                    "nexthop": "2001:db8:1900:1::1:101",
+                                    "in_label": "16",
+                                    "out_label": "nolabel",
+                                    "status_code": "*",
+                                    "best_code": ">",
+                                    "type_code": "l",
+                                },
+                            },
+                        },
+                    },
+                    "table_version": 3,
+                    "router_id": "10.106.0.6",
+                },
+            },
+        },
+    },
+}
@@ -0,0 +1,81 @@
+expected_output = {
+    "template": {
+        "PEER": {
+            "vrf": {
+                "default": {
+                    "inheriting_peer": {
+                        "10.186.201.1": {
+                            "inheriting_peer": "10.186.201.1",
+                        },
+                        "fe80::1": {
+                            "inheriting_peer": "fe80::1",
+                        },
+                    },
+                },
+            },
+            "address_family": {
+                "ipv4 unicast": {
+                    "in_policy": {
+                        "ROUTE-MAP-IN": {
+                            "name": "ROUTE-MAP-IN",
+                            "type": "route-map",
+                        },
+                        "PLIST-IN": {
+                            "name": "PLIST-IN",
+                            "type": "prefix-list",
+                        },
+                    },
+                    "out_policy": {
+                        "ROUTE-MAP-OUT": {
+                            "name": "ROUTE-MAP-OUT",
+                            "type": "route-map",
+                        },
+                    },
+                    "condition_map": "DENY_ALL_RM",
+                    "advertise_map": "BLOCK-ALL",
+                    "advertise_map_status": "advertise",
+                    "in_soft_reconfig_allowed": False,
+                    "send_community": True,
+                    "send_ext_community": True,
+                    "third_party_nexthop": False,
+                    "as_override": True,
+                    "peer_as_check_disabled": False,
+                    "rr_configured": True,
+                    "local_nexthop": "0.0.0.0",
+                    "max_pfx": 888888888,
+                    "soo": "SOO:10.4.1.1:100",
+                    "weight": 9999,
+                    "allow_as_in": 10,
+                    "default_originate": True,
+                    "default_originate_route_map": "PASS-ALL",
+                    "unsuppress_map": "ORIGINATE_IPV6",
+                },
+                "ipv6 unicast": {
+                    "send_community": False,
+                    "weight": 10,
+                },
+            },
+            "source_interface": "loopback1",
+            "low_mem_exempt": True,
+            "logging_neighbor_events": False,
+            "passive_only": True,
+            "local_as_inactive": False,
+            "remove_private_as": True,
+            "external_bgp_peer_hops_limit": 100,
+        },
+        "PEER2": {
+            "address_family": {
+                "ipv4 unicast": {
+                    "max_pfx": 10,
+                },
+                "ipv4 multicast": {
+                    "max_pfx": 20,
+                },
+            },
+            "logging_neighbor_events": True,
+            "passive_only": False,
+            "local_as_inactive": True,
+            "remove_private_as": False,
+        },
+    },
+}
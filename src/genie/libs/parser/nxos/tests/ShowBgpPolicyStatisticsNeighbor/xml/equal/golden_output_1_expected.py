@@ -0,0 +1,36 @@
+expected_output = {
+    "vrf": {
+        "VRF1": {
+            "route_map": {
+                "ADD_RT_400_400": {
+                    1: {
+                        "action": "permit",
+                        "seq_num": 10,
+                        "total_accept_count": 0,
+                        "total_reject_count": 0,
+                        "command": {
+                            "compare_count": 3,
+                            "match_count": 0,
+                            "command": "match community 100",
+                        },
+                    },
+                    2: {
+                        "action": "deny",
+                        "seq_num": 20,
+                        "total_accept_count": 0,
+                        "total_reject_count": 2,
+                    },
+                },
+                "RMAP>2": {
+                    1: {
+                        "action": "permit",
+                        "seq_num": 10,
+                        "total_accept_count": 5,
+                        "total_reject_count": 0,
+                    },
+                },
+            },
+            "rpm_handle_count": 1,
+        },
+    },
+}
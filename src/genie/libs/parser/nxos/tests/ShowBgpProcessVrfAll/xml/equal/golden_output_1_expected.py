@@ -0,0 +1,107 @@
+expected_output = {
+    "vrf": {
+        "default": {
+            "address_family": {
+                "ipv4 unicast": {
+                    "redistribution": {
+                        "ospf": {
+                            "route_map": "rmap1",
+                        },
+                        "static": {
+                            "route_map": "rmap2",
+                        },
+                    },
+                    "table_state": "up",
+                    "next_hop_trigger_delay": {
+                        "critical": 3000,
+                        "non_critical": 10000,
+                    },
+                    "table_id": "0x1",
+                    "peers": {
+                        2: {
+                            "active_peers": 1,
+                            "routes": 3,
+                            "paths": 5,
+                            "networks": 2,
+                            "aggregates": 1,
+                        },
+                    },
+                    "route_reflector": True,
+                },
+                "vpnv4 unicast": {
+                    "table_state": "up",
+                    "aggregate_label": "492287",
+                    "label_mode": "per-prefix",
+                    "import_default_map": "PERMIT_ALL_RM",
+                    "import_default_prefix_limit": 1000,
+                    "import_default_prefix_count": 3,
+                    "export_default_map": "PERMIT_ALL_RM",
+                    "export_default_prefix_limit": 1000,
+                    "export_default_prefix_count": 2,
+                    "table_id": "0x80000001",
+                    "peers": {
+                        0: {
+                            "active_peers": 0,
+                            "routes": 0,
+                            "paths": 0,
+                            "networks": 0,
+                            "aggregates": 0,
+                        },
+                    },
+                },
+            },
+            "vrf_rd": "not configured",
+            "vrf_id": "1",
+            "vrf_state": "up",
+            "router_id": "10.4.1.1",
+            "conf_router_id": "10.4.1.1",
+            "confed_id": 100,
+            "cluster_id": "0.0.0.0",
+            "num_conf_peers": 3,
+            "num_pending_conf_peers": 0,
+            "num_established_peers": 2,
+        },
+        "VRF1": {
+            "address_family": {
+                "l2vpn evpn": {
+                    "export_rt_list": "100:1 100:2",
+                    "import_rt_list": "200:1",
+                    "table_id": "0x80000003",
+                    "peers": {
+                        1: {
+                            "active_peers": 1,
+                            "routes": 4,
+                            "paths": 4,
+                            "networks": 0,
+                            "aggregates": 0,
+                        },
+                    },
+                },
+            },
+            "vrf_rd": "100:100",
+            "vrf_id": "3",
+            "vrf_state": "up",
+            "num_conf_peers": 1,
+            "num_pending_conf_peers": 0,
+            "num_established_peers": 0,
+        },
+    },
+    "bgp_pid": 29474,
+    "bgp_protocol_started_reason": "configuration",
+    "bgp_tag": "100",
+    "bgp_protocol_state": "running",
+    "bgp_isolate_mode": "No",
+    "bgp_mmode": "Initialized",
+    "bgp_memory_state": "ok",
+    "bgp_asformat": "asplain",
+    "num_attr_entries": 4,
+    "hwm_attr_entries": 5,
+    "bytes_used": 576,
+    "entries_pending_delete": 0,
+    "hwm_entries_pending_delete": 0,
+    "bgp_paths_per_hwm_attr": 12,
+    "bgp_as_path_entries": 1,
+    "bytes_used_as_path_entries": 36,
+    "bgp_performance_mode": "No",
+    "segment_routing_global_block": "16000-23999",
+}
@@ -0,0 +1,45 @@
+expected_output = {
+    "vrf": {
+        "default": {
+            "neighbor": {
+                "10.16.2.2": {
+                    "connections_dropped": 0,
+                    "remote_as": 333,
+                    "state": "established",
+                    "local_port": 179,
+                    "remote_port": 48392,
+                    "notifications_sent": 0,
+                    "notifications_received": 0,
+                    "last_flap": "01:04:41",
+                    "last_read": "00:00:47",
+                    "last_write": "00:00:15",
+                },
+                "10.36.3.3": {
+                    "connections_dropped": 1,
+                    "remote_as": 333,
+                    "state": "idle",
+                    "local_port": 0,
+                    "remote_port": 0,
+                    "notifications_sent": 2,
+                    "notifications_received": 1,
+                    "last_flap": "5d03h",
+                    "last_read": "never",
+                    "last_write": "never",
+                },
+            },
+            "local_as": 333,
+            "vrf_peers": 3,
+            "vrf_established_peers": 2,
+            "router_id": "10.106.0.6",
+        },
+        "VRF1": {
+            "local_as": 100,
+            "vrf_peers": 0,
+            "vrf_established_peers": 0,
+            "router_id": "10.229.11.11",
+        },
+    },
+    "total_peers": 3,
+    "total_established_peers": 2,
+    "local_as": 333,
+}
@@ -0,0 +1,58 @@
+expected_output = {
+    "vrf": {
+        "default": {
+            "address_family": {
+                "ipv4 unicast": {
+                    "dampening": "True",
+                    "dampening_route_map": "test",
+                    "dampening_half_life_time": "45",
+                    "dampening_suppress_time": "2000",
+                    "dampening_reuse_time": "750",
+                    "dampening_max_suppress_time": "60",
+                    "dampening_max_suppress_penalty": "4000",
+                },
+                "vpnv4 unicast": {
+                    "dampening": "True",
+                    "route_distinguisher": {
+                        "0:0": {
+                            "rd_vrf": "vpn1",
+                            "dampening_half_life_time": "1",
+                            "dampening_suppress_time": "30",
+                            "dampening_reuse_time": "10",
+                            "dampening_max_suppress_time": "2",
+                            "dampening_max_suppress_penalty": "40",
+                        },
+                        "100:200": {
+                            "rd_vrf": "vpn3",
+                            "rd_vni_id": "3",
+                            "dampening_half_life_time": "15",
+                            "dampening_suppress_time": "2000",
+                            "dampening_reuse_time": "750",
+                            "dampening_max_suppress_time": "45",
+                            "dampening_max_suppress_penalty": "6000",
+                        },
+                    },
+                },
+            },
+        },
+        "VRF1": {
+            "address_family": {
+                "ipv4 unicast": {
+                    "dampening": "True",
+                    "route_distinguisher": {
+                        "100:100": {
+                            "rd_vrf": "vpn2",
+                            "rd_vni_id": "2",
+                            "dampening_route_map": "test",
+                            "dampening_half_life_time": "1",
+                            "dampening_suppress_time": "30",
+                            "dampening_reuse_time": "10",
+                            "dampening_max_suppress_time": "2",
+                            "dampening_max_suppress_penalty": "40",
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
@@ -0,0 +1,142 @@
+expected_output = {
+    "vrf": {
+        "default": {
+            "neighbor": {
+                "10.16.2.2": {
+                    "address_family": {
+                        "ipv4 unicast": {
+                            "route_identifier": "10.106.0.6",
+                            "local_as": 333,
+                            "bgp_table_version": 7,
+                            "config_peers": 3,
+                            "capable_peers": 2,
+                            "prefixes": {
+                                "total_entries": 5,
+                                "memory_usage": 1820,
+                            },
+                            "path": {
+                                "total_entries": 10,
+                                "memory_usage": 1820,
+                            },
+                            "history_paths": 0,
+                            "dampened_paths": 0,
+                            "soft_reconfig_recvd_paths": 10,
+                            "soft_reconfig_identical_paths": 10,
+                            "soft_reconfig_combo_paths": 0,
+                            "soft_reconfig_filtered_recvd": 0,
+                            "soft_reconfig_bytes": 0,
+                            "attribute_entries": "[1/160]",
+                            "as_path_entries": "[1/34]",
+                            "community_entries": "[0/0]",
+                            "clusterlist_entries": "[0/0]",
+                            "dampening": True,
+                            "neighbor_table_version": 4,
+                            "msg_rcvd": 5471,
+                            "msg_sent": 5459,
+                            "tbl_ver": 7,
+                            "inq": 0,
+                            "outq": 0,
+                            "as": 333,
+                            "up_down": "3d18h",
+                            "state": "established",
+                            "prefix_received": "5",
+                            "state_pfxrcd": "5",
+                        },
+                        "ipv4 multicast": {
+                            "route_identifier": "10.106.0.6",
+                            "local_as": 333,
+                            "bgp_table_version": 2,
+                            "config_peers": 1,
+                            "capable_peers": 1,
+                            "prefixes": {
+                                "total_entries": 3,
+                                "memory_usage": 500,
+                            },
+                            "path": {
+                                "total_entries": 3,
+                                "memory_usage": 500,
+                            },
+                            "neighbor_table_version": 2,
+                            "msg_rcvd": 5471,
+                            "msg_sent": 5459,
+                            "tbl_ver": 2,
+                            "inq": 0,
+                            "outq": 0,
+                            "as": 333,
+                            "up_down": "3d18h",
+                            "state": "established",
+                            "prefix_received": "3",
+                            "state_pfxrcd": "3",
+                        },
+                    },
+                },
+                "10.36.3.3": {
+                    "address_family": {
+                        "ipv4 unicast": {
+                            "route_identifier": "10.106.0.6",
+                            "local_as": 333,
+                            "bgp_table_version": 7,
+                            "config_peers": 3,
+                            "capable_peers": 2,
+                            "prefixes": {
+                                "total_entries": 5,
+                                "memory_usage": 1820,
+                            },
+                            "path": {
+                                "total_entries": 10,
+                                "memory_usage": 1820,
+                            },
+                            "history_paths": 0,
+                            "dampened_paths": 0,
+                            "soft_reconfig_recvd_paths": 10,
+                            "soft_reconfig_identical_paths": 10,
+                            "soft_reconfig_combo_paths": 0,
+                            "soft_reconfig_filtered_recvd": 0,
+                            "soft_reconfig_bytes": 0,
+                            "attribute_entries": "[1/160]",
+                            "as_path_entries": "[1/34]",
+                            "community_entries": "[0/0]",
+                            "clusterlist_entries": "[0/0]",
+                            "dampening": True,
+                            "neighbor_table_version": 0,
+                            "msg_rcvd": 0,
+                            "msg_sent": 0,
+                            "tbl_ver": 0,
+                            "inq": 0,
+                            "outq": 0,
+                            "as": 333,
+                            "up_down": "5w6d",
+                            "state": "idle",
+                            "state_pfxrcd": "idle",
+                        },
+                    },
+                },
+            },
+        },
+        "VRF1": {
+            "neighbor": {
+                "2001:db8::1": {
+                    "address_family": {
+                        "ipv6 unicast": {
+                            "route_identifier": "10.229.11.11",
+                            "local_as": 100,
+                            "bgp_table_version": 1,
+                            "config_peers": 1,
+                            "capable_peers": 0,
+                            "neighbor_table_version": 0,
+                            "msg_rcvd": 0,
+                            "msg_sent": 0,
+                            "tbl_ver": 0,
+                            "inq": 0,
+                            "outq": 0,
+                            "as": 200,
+                            "up_down": "00:01:02",
+                            "state": "active",
+                            "state_pfxrcd": "active",
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
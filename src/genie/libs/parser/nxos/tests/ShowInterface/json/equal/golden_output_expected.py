@@ -0,0 +1,97 @@
+expected_output = {   'Ethernet1/6': {   'admin_state': 'up',
+                       'auto_negotiate': True,
+                       'auto_mdix': 'off',
+                       'bandwidth': 10000000,
+                       'beacon': 'off',
+                       'counters': {   'in_bad_etype_drop': 0,
+                                       'in_broadcast_pkts': 0,
+                                       'in_crc_errors': 0,
+                                       'in_discard': 0,
+                                       'in_errors': 0,
+                                       'in_if_down_drop': 0,
+                                       'in_ignored': 0,
+                                       'in_jumbo_packets': 0,
+                                       'in_mac_pause_frames': 0,
+                                       'in_multicast_pkts': 0,
+                                       'in_no_buffer': 0,
+                                       'in_octets': 0,
+                                       'in_overrun': 0,
+                                       'in_oversize_frame': 0,
+                                       'in_pkts': 0,
+                                       'in_runts': 0,
+                                       'in_short_frame': 0,
+                                       'in_storm_suppression_packets': 0,
+                                       'in_underrun': 0,
+                                       'in_unicast_pkts': 0,
+                                       'in_unknown_protos': 0,
+                                       'in_watchdog': 0,
+                                       'in_with_dribble': 0,
+                                       'last_clear': 'never',
+                                       'out_babble': 0,
+                                       'out_broadcast_pkts': 0,
+                                       'out_collision': 0,
+                                       'out_deferred': 0,
+                                       'out_discard': 0,
+                                       'out_errors': 0,
+                                       'out_jumbo_packets': 0,
+                                       'out_late_collision': 0,
+                                       'out_lost_carrier': 0,
+                                       'out_mac_pause_frames': 0,
+                                       'out_multicast_pkts': 0,
+                                       'out_no_carrier': 0,
+                                       'out_octets': 0,
+                                       'out_pkts': 0,
+                                       'out_unicast_pkts': 0,
+                                       'rate': {   'in_rate': 0,
+                                                   'in_rate_bps': 0,
+                                                   'in_rate_pkts': 0,
+                                                   'in_rate_pps': 0,
+                                                   'load_interval': 30,
+                                                   'out_rate': 0,
+                                                   'out_rate_bps': 0,
+                                                   'out_rate_pkts': 0,
+                                                   'out_rate_pps': 0},
+                                       'rx': True,
+                                       'tx': True},
+                       'dedicated_interface': True,
+                       'delay': 10,
+                       'efficient_ethernet': 'n/a',
+                       'enabled': True,
+                       'encapsulations': {'encapsulation': 'arpa'},
+                       'ethertype': '0x8100',
+                       'flow_control': {'receive': False, 'send': False},
+                       'interface_reset': 0,
+                       'last_clear_counters': 'never',
+                       'last_link_flapped': 'never',
+                       'link_state': 'down',
+                       'mac_address': '000c.29ff.e5fd',
+                       'medium': 'broadcast',
+                       'mtu': 1500,
+                       'oper_status': 'down',
+                       'phys_address': '000c.29ff.e5fd',
+                       'port_channel': {'port_channel_member': False},
+                       'port_mode': 'access',
+                       'reliability': '255/255',
+                       'rxload': '1/255',
+                       'switchport_monitor': 'off',
+                       'txload': '1/255',
+                       'types': '100/1000/10000 Ethernet'},
+    'Vlan420': {   'autostate': True,
+                   'bandwidth': 1000000,
+                   'delay': 10,
+                   'description': 'VLAN information',
+                   'enabled': True,
+                   'encapsulations': {'encapsulation': 'arpa'},
+                   'ipv4': {   '10.10.10.1/24': {   'ip': '10.10.10.1',
+                                                    'prefix_length': '24'}},
+                   'last_clear_counters': 'never',
+                   'line_protocol': 'up',
+                   'link_state': 'up',
+                   'mac_address': '1234.5678.90ab',
+                   'mtu': 1500,
+                   'oper_status': 'up',
+                   'port_channel': {'port_channel_member': False},
+                   'reliability': '255/255',
+                   'rxload': '1/255',
+                   'txload': '1/255',
+                   'types': 'EtherSVI'}}
@@ -0,0 +1,121 @@
+expected_output = {
+    "interfaces": {
+        "mgmt0": {
+            "ipv4": {
+                "neighbors": {
+                    "10.255.8.99": {
+                        "ip": "10.255.8.99",
+                        "link_layer_address": "5e00.00ff.0909",
+                        "physical_interface": "mgmt0",
+                        "origin": "dynamic",
+                        "age": "00:00:22",
+                    }
+                }
+            }
+        },
+        "Ethernet1/1": {
+            "ipv4": {
+                "neighbors": {
+                    "10.2.4.4": {
+                        "ip": "10.2.4.4",
+                        "link_layer_address": "5e00.00ff.030a",
+                        "physical_interface": "Ethernet1/1",
+                        "origin": "dynamic",
+                        "age": "00:13:47",
+                    }
+                }
+            }
+        },
+        "Ethernet1/2": {
+            "ipv4": {
+                "neighbors": {
+                    "10.2.5.5": {
+                        "ip": "10.2.5.5",
+                        "link_layer_address": "5e00.00ff.040b",
+                        "physical_interface": "Ethernet1/2",
+                        "origin": "dynamic",
+                        "age": "00:00:09",
+                    }
+                }
+            }
+        },
+        "Ethernet1/6": {
+            "ipv4": {
+                "neighbors": {
+                    "10.1.3.3": {
+                        "ip": "10.1.3.3",
+                        "link_layer_address": "5e00.00ff.0209",
+                        "physical_interface": "Ethernet1/6",
+                        "origin": "dynamic",
+                        "age": "00:00:09",
+                    }
+                }
+            }
+        },
+        "Vlan101": {
+            "ipv4": {
+                "neighbors": {
+                    "10.111.1.3": {
+                        "ip": "10.111.1.3",
+                        "link_layer_address": "fa16.3eff.0987",
+                        "physical_interface": "Vlan101",
+                        "origin": "dynamic",
+                        "age": "00:09:20",
+                        "flags": "+",
+                    },
+                    "10.111.1.4": {
+                        "ip": "10.111.1.4",
+                        "link_layer_address": "fa16.3eff.c271",
+                        "physical_interface": "Vlan101",
+                        "origin": "dynamic",
+                        "age": "00:01:53",
+                    },
+                    "10.111.2.3": {
+                        "ip": "10.111.2.3",
+                        "link_layer_address": "fa16.3eff.58b9",
+                        "physical_interface": "Vlan101",
+                        "origin": "dynamic",
+                        "age": "00:09:20",
+                    },
+                    "10.111.2.4": {
+                        "ip": "10.111.2.4",
+                        "link_layer_address": "fa16.3eff.e478",
+                        "physical_interface": "Vlan101",
+                        "origin": "dynamic",
+                        "age": "00:17:48",
+                    },
+                    "10.111.3.3": {
+                        "ip": "10.111.3.3",
+                        "link_layer_address": "fa16.3eff.229b",
+                        "physical_interface": "Vlan101",
+                        "origin": "dynamic",
+                        "age": "00:18:09",
+                        "flags": "+",
+                    },
+                    "10.111.3.4": {
+                        "ip": "10.111.3.4",
+                        "link_layer_address": "fa16.3eff.947c",
+                        "physical_interface": "Vlan101",
+                        "origin": "dynamic",
+                        "age": "00:00:37",
+                        "flags": "+",
+                    },
+                }
+            }
+        },
+        "Vlan202": {
+            "ipv4": {
+                "neighbors": {
+                    "192.168.16.4": {
+                        "ip": "192.168.16.4",
+                        "link_layer_address": "fa16.3eff.e478",
+                        "physical_interface": "Vlan202",
+                        "origin": "dynamic",
+                        "age": "00:17:48",
+                    }
+                }
+            }
+        },
+    },
+    "statistics": {"entries_total": 11},
+}
@@ -0,0 +1,163 @@
+expected_output = {
+    'mac_table': {
+        'vlans': {
+            '100': {
+                'vlan': '100',
+                'mac_addresses': {
+                    '0000.0000.1111': {
+                        'mac_address': '0000.0000.1111',
+                        'entry': '+',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic',
+                                'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                    '0000.0000.1112': {
+                        'mac_address': '0000.0000.1112',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic', 'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                    '0000.0000.1113': {
+                        'mac_address': '0000.0000.1113',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic',
+                                'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                    '0000.0000.1114': {
+                        'mac_address': '0000.0000.1114',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic',
+                                'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                    '0000.0000.1115': {
+                        'mac_address': '0000.0000.1115',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic',
+                                'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                    '0000.0000.1116': {
+                        'mac_address': '0000.0000.1116',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic',
+                                'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                    '0000.0000.1117': {
+                        'mac_address': '0000.0000.1117',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic',
+                                'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                    '0000.0000.1118': {
+                        'mac_address': '0000.0000.1118',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic',
+                                'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                    '0000.0000.1119': {
+                        'mac_address': '0000.0000.1119',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic',
+                                'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                    '0000.0000.111a': {
+                        'mac_address': '0000.0000.111a',
+                        'entry': '+',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic',
+                                'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                    '0010.9400.0002': {
+                        'mac_address': '0010.9400.0002',
+                        'entry': '*',
+                        'interfaces': {
+                            'Port-channel100': {
+                                'interface': 'Port-channel100',
+                                'mac_type': 'dynamic',
+                                'age': 'NA'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    },
+                }
+            },
+            '-': {
+                'vlan': '-',
+                'mac_addresses': {
+                    '44ae.2502.a907': {
+                        'mac_address': '44ae.2502.a907',
+                        'entry': 'G',
+                        'interfaces': {
+                            'Sup-eth1(R)': {
+                                'interface': 'Sup-eth1(R)',
+                                'mac_type': 'static',
+                                'age': '-'
+                            }
+                        },
+                        'secure': 'F',
+                        'ntfy': 'F',
+                    }
+                }
+            }
+        }
+    }
+}
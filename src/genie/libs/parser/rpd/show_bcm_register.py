@@ -7,7 +7,9 @@ RPD CLI parser for the following show command
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 
-import re
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 
 # ===========================================
@@ -47,22 +49,22 @@ class ShowBcmRegisterWbfftConfig(ShowBcmRegisterWbfftConfigSchema):
         parsed_dict = {}
 
         # WBFFT Trigger Mode  : N/A
-        p1 = re.compile(r"^WBFFT Trigger Mode\s+:\s(?P<wbfft_trigger_mode>.*)$")
+        p1 = regex_engine.compile(r"^WBFFT Trigger Mode\s+:\s(?P<wbfft_trigger_mode>.*)$")
 
         # Enable UTSC         : False
-        p2 = re.compile(r"^Enable UTSC\s+:\s(?P<enable_utsc>.*)$")
+        p2 = regex_engine.compile(r"^Enable UTSC\s+:\s(?P<enable_utsc>.*)$")
 
         # Samples Num         : 0
-        p3 = re.compile(r"^Samples Num\s+:\s(?P<samples_num>.*)$")
+        p3 = regex_engine.compile(r"^Samples Num\s+:\s(?P<samples_num>.*)$")
 
         # Low Bin SesID       : 00001000
-        p4 = re.compile(r"^Low Bin SesID\s+:\s(?P<low_bin_session_id>.*)$")
+        p4 = regex_engine.compile(r"^Low Bin SesID\s+:\s(?P<low_bin_session_id>.*)$")
 
         # PNM Dest IP         : 0.0.0.0
-        p5 = re.compile(r"^PNM Dest IP\s+:\s(?P<pnm_dest_ip>.*)$")
+        p5 = regex_engine.compile(r"^PNM Dest IP\s+:\s(?P<pnm_dest_ip>.*)$")
 
         # PNM Dest Mac        : 0000.0000.0000
-        p6 = re.compile(r"^PNM Dest Mac\s+:\s(?P<pnm_dest_mac>.*)$")
+        p6 = regex_engine.compile(r"^PNM Dest Mac\s+:\s(?P<pnm_dest_mac>.*)$")
 
         for line in output.splitlines():
             line = line.strip()
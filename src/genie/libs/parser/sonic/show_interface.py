@@ -5,10 +5,10 @@ Sonic parsers for the following show commands:
 
 """
 # Python
-import re
 import os
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, ListOf
 
@@ -81,78 +81,78 @@ class ShowInterfacesTransceiverEeprom(ShowInterfacesTransceiverEepromSchema):
         ret_dict = {}
 
         # Ethernet0: SFP EEPROM detected
-        p1 = re.compile(r'^(?P<name>[\w\/\.\-\:]+): SFP EEPROM +(?P<status>.+)$')
+        p1 = regex_engine.compile(r'^(?P<name>[\w\/\.\-\:]+): SFP EEPROM +(?P<status>.+)$')
 
         # Application Advertisement: 400G CR8 - Host Assign (0x1) - Copper cable - Media Assign (Unknown)
-        p2 = re.compile(r'^Application Advertisement: (?P<application_type>[\dA-Z\s]+) - Host Assign \((?P<host_assign>0x[0-9a-fA-F]+)\) - (?P<media_type>\w+) cable - Media Assign \((?P<media_assign>\w+)\)$')
+        p2 = regex_engine.compile(r'^Application Advertisement: (?P<application_type>[\dA-Z\s]+) - Host Assign \((?P<host_assign>0x[0-9a-fA-F]+)\) - (?P<media_type>\w+) cable - Media Assign \((?P<media_assign>\w+)\)$')
 
         # Application Advertisement: N/A
-        p2_1 = re.compile(r'^Application Advertisement: N/A$')
+        p2_1 = regex_engine.compile(r'^Application Advertisement: N/A$')
 
         # Connector: No separable connector
-        p3 = re.compile(r'^Connector: (?P<connector>.+)$')
+        p3 = regex_engine.compile(r'^Connector: (?P<connector>.+)$')
 
         # Encoding: N/A
-        p4 = re.compile(r'^Encoding: (?P<encoding>.*)$')
+        p4 = regex_engine.compile(r'^Encoding: (?P<encoding>.*)$')
 
         # Extended Identifier: Power Class 1 (1.5W Max)
-        p5 = re.compile(r'^Extended Identifier: (?P<identifier>.+)$')
+        p5 = regex_engine.compile(r'^Extended Identifier: (?P<identifier>.+)$')
 
         # Extended RateSelect Compliance: N/A
-        p6 =  re.compile(r'^Extended RateSelect Compliance: (?P<compliance>.+)$')
+        p6 =  regex_engine.compile(r'^Extended RateSelect Compliance: (?P<compliance>.+)$')
 
         # Identifier: QSFP-DD Double Density 8X Pluggable Transceiver
-        p7 = re.compile(r'^Identifier: (?P<identifier>.+)$')
+        p7 = regex_engine.compile(r'^Identifier: (?P<identifier>.+)$')
 
         # Length Cable Assembly(m): 2.0
-        p8 = re.compile(r'^Length Cable Assembly\(m\): (?P<length>\d+(\.\d+)?)$')
+        p8 = regex_engine.compile(r'^Length Cable Assembly\(m\): (?P<length>\d+(\.\d+)?)$')
 
         #  Nominal Bit Rate(100Mbs): 0
-        p9 = re.compile(r'^Nominal Bit Rate\(100Mbs\): (?P<rate>\d+)$')
+        p9 = regex_engine.compile(r'^Nominal Bit Rate\(100Mbs\): (?P<rate>\d+)$')
 
         # Vendor Date Code(YYYY-MM-DD Lot): 2020-07-17 00
-        p10 = re.compile(r'^Vendor Date Code\(YYYY-MM-DD Lot\): (?P<date>\d{4}-\d{2}-\d{2}) (?P<lot>\d+)$')
+        p10 = regex_engine.compile(r'^Vendor Date Code\(YYYY-MM-DD Lot\): (?P<date>\d{4}-\d{2}-\d{2}) (?P<lot>\d+)$')
         
         # Vendor Name: CISCO-LEONI
-        p11 =  re.compile(r'^Vendor Name: (?P<vendor_name>.+)$')
+        p11 =  regex_engine.compile(r'^Vendor Name: (?P<vendor_name>.+)$')
 
         # Vendor OUI: a8-b0-ae
-        p12 =  re.compile(r'^Vendor OUI: (?P<vendor_oui>.+)$')
+        p12 =  regex_engine.compile(r'^Vendor OUI: (?P<vendor_oui>.+)$')
 
         # Vendor PN: L45593-K218-C20
-        p13 = re.compile(r'^Vendor PN: (?P<vendor_pn>.+)$')
+        p13 = regex_engine.compile(r'^Vendor PN: (?P<vendor_pn>.+)$')
 
         # Vendor Rev: 00
         # Vendor Rev: A
-        p14 = re.compile(r'^Vendor Rev: (?P<vendor_rev>.+)$')
+        p14 = regex_engine.compile(r'^Vendor Rev: (?P<vendor_rev>.+)$')
         
         # Vendor SN: LCC2429H3GD-A
-        p15 = re.compile(r'^Vendor SN: (?P<vendor_sn>.+)$')
+        p15 = regex_engine.compile(r'^Vendor SN: (?P<vendor_sn>.+)$')
 
         # Specification compliance: passive_copper_media_interface
-        p16 = re.compile(r'^Specification compliance: (?P<spec_compliance>.+)$')
+        p16 = regex_engine.compile(r'^Specification compliance: (?P<spec_compliance>.+)$')
 
         # Specification compliance:
-        p16_1 = re.compile(r'^Specification compliance:$')
+        p16_1 = regex_engine.compile(r'^Specification compliance:$')
 
         # 10/40G Ethernet Compliance Code: Extended
         # Gigabit Ethernet Compliant Codes: Unknown
-        p17 = re.compile(r'^(?P<compliance>.+) Compliance Code[s]?: (?P<compliance_code>.+)$')
+        p17 = regex_engine.compile(r'^(?P<compliance>.+) Compliance Code[s]?: (?P<compliance_code>.+)$')
 
         # Extended Specification Compliance: 100G AOC (Active Optical Cable) or 25GAUI C2M AOC
-        p18 = re.compile(r'^Extended Specification Compliance: (?P<ext_spec_compliance>.+)$')
+        p18 = regex_engine.compile(r'^Extended Specification Compliance: (?P<ext_spec_compliance>.+)$')
 
         # Fibre Channel Link Length: Unknown
-        p19 = re.compile(r'^Fibre Channel Link Length: (?P<link_length>.+)$')
+        p19 = regex_engine.compile(r'^Fibre Channel Link Length: (?P<link_length>.+)$')
 
         # Fibre Channel Speed: Unknown
-        p20 = re.compile(r'^Fibre Channel Speed: (?P<link_speed>.+)$')
+        p20 = regex_engine.compile(r'^Fibre Channel Speed: (?P<link_speed>.+)$')
 
         # Fibre Channel Transmission Media: Unknown
-        p21 = re.compile(r'^Fibre Channel Transmission Media: (?P<link_media>.+)$')
+        p21 = regex_engine.compile(r'^Fibre Channel Transmission Media: (?P<link_media>.+)$')
 
         # Fibre Channel Transmitter Technology: Unknown
-        p22 = re.compile(r'^Fibre Channel Transmitter Technology: (?P<link_tech>.+)$')
+        p22 = regex_engine.compile(r'^Fibre Channel Transmitter Technology: (?P<link_tech>.+)$')
 
 
         for line in output.splitlines():
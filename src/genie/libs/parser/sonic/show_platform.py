@@ -4,13 +4,13 @@ SONiC parsers for the following show commands:
     * show platform inventory
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowPlatformSchema(MetaParser):
     """
@@ -79,25 +79,25 @@ class ShowPlatformInventory(ShowPlatformSchema):
         ret_dict = {}
     
         # CHASSIS             8201-32FH-O     0.33            FOC2217DTWE     Cisco 8201-32FH Open Network
-        p1 = re.compile(r'^(?P<chassis>CHASSIS\d*?)\s+(?P<product_id>[a-zA-Z0-9@.\-]+)\s+(?P<version>[0-9]*\.[0-9]+)\s+(?P<serial_num>[A-Za-z0-9]+)\s+(?P<description>.*)(\s+)?$')
+        p1 = regex_engine.compile(r'^(?P<chassis>CHASSIS\d*?)\s+(?P<product_id>[a-zA-Z0-9@.\-]+)\s+(?P<version>[0-9]*\.[0-9]+)\s+(?P<serial_num>[A-Za-z0-9]+)\s+(?P<description>.*)(\s+)?$')
 
         # RP0                 8101-32FH-O     0.41            FLM2528059A     Cisco 8100 32x400G QSFPDD 1RU Fixed System w/o HBM, Open SW
-        p2 = re.compile(r'^(?P<rp>RP\d*?)\s+(?P<product_id>[a-zA-Z0-9@.\-]+)\s+(?P<version>[0-9]*\.[0-9]+)\s+(?P<serial_num>[A-Za-z0-9]+)\s+(?P<description>.*)(\s+)?$')
+        p2 = regex_engine.compile(r'^(?P<rp>RP\d*?)\s+(?P<product_id>[a-zA-Z0-9@.\-]+)\s+(?P<version>[0-9]*\.[0-9]+)\s+(?P<serial_num>[A-Za-z0-9]+)\s+(?P<description>.*)(\s+)?$')
 
         # PSU0            PSU2KW-ACPI     0.0             POG2416K01K     2000W AC Power Module with Port-side Air Intake
-        p3 = re.compile(r'^(?P<psu>PSU\d*?)\s+(?P<product_id>[a-zA-Z0-9@.\-]+)\s+(?P<version>[0-9]*\.[0-9]+)\s+(?P<serial_num>[A-Za-z0-9]+)\s+(?P<description>.*)(\s+)?$')
+        p3 = regex_engine.compile(r'^(?P<psu>PSU\d*?)\s+(?P<product_id>[a-zA-Z0-9@.\-]+)\s+(?P<version>[0-9]*\.[0-9]+)\s+(?P<serial_num>[A-Za-z0-9]+)\s+(?P<description>.*)(\s+)?$')
 
         # fantray0            FAN-1RU-PE-V2   0.0             NCV26322018
-        p4 = re.compile(r'^(?P<fantray>fantray\d*?)\s+(?P<product_id>[a-zA-Z0-9@.\-]+)\s+(?P<version>[0-9]*\.[0-9]+)\s+(?P<serial_num>[A-Za-z0-9]+)$')
+        p4 = regex_engine.compile(r'^(?P<fantray>fantray\d*?)\s+(?P<product_id>[a-zA-Z0-9@.\-]+)\s+(?P<version>[0-9]*\.[0-9]+)\s+(?P<serial_num>[A-Za-z0-9]+)$')
 
         # PSU0 -- not present
-        p5 = re.compile(r'^(?P<psu>PSU\d*?)\s+--\s+(?P<state>[\w\s]+)$')
+        p5 = regex_engine.compile(r'^(?P<psu>PSU\d*?)\s+--\s+(?P<state>[\w\s]+)$')
 
         # fantray0 -- not present
-        p6 = re.compile(r'^(?P<fantray>fantray\d*?)\s+--\s+(?P<state>[\w\s]+)$')
+        p6 = regex_engine.compile(r'^(?P<fantray>fantray\d*?)\s+--\s+(?P<state>[\w\s]+)$')
 
         # RP0/info.0                          0.1.1-0                         \_SB_.PCI0.SE0_.BR2A.BR3A.IOFP.INFO
-        p7 = re.compile(r'^(?P<rp_info>RP\d+\/?info\.?\d+)\s+(?P<version>([A-Za-z0-9]+(\.[A-Za-z0-9]+)+)-[A-Za-z0-9]+)\s+(?P<description>([\\_]+.*))(\s+)?$')
+        p7 = regex_engine.compile(r'^(?P<rp_info>RP\d+\/?info\.?\d+)\s+(?P<version>([A-Za-z0-9]+(\.[A-Za-z0-9]+)+)-[A-Za-z0-9]+)\s+(?P<description>([\\_]+.*))(\s+)?$')
 
         for line in output.splitlines():
             line = line.strip()
@@ -3,13 +3,13 @@
 SONiC parsers for show commands:
     * 'show version'
 """
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowVersionSchema(MetaParser):
     """
@@ -59,57 +59,57 @@ class ShowVersion(ShowVersionSchema):
             output = self.device.execute(self.cli_command)
 
         # SONiC Software Version: SONiC.azure_cisco_202205.5324-dirty-20230707.044127
-        p0 = re.compile(r'^SONiC Software Version: (?P<sw_version>.*)$')
+        p0 = regex_engine.compile(r'^SONiC Software Version: (?P<sw_version>.*)$')
 
         # SONiC OS Version: 11
-        p1 = re.compile(r'^SONiC OS Version: (?P<os_version>\d+)$')
+        p1 = regex_engine.compile(r'^SONiC OS Version: (?P<os_version>\d+)$')
 
         # Distribution: Debian 11.7
-        p2 = re.compile(r'^Distribution: (?P<distribution>.*)$')
+        p2 = regex_engine.compile(r'^Distribution: (?P<distribution>.*)$')
 
         # Kernel: 5.10.0-18-2-amd64
-        p3 = re.compile(r'^Kernel: (?P<kernel>.*)$')
+        p3 = regex_engine.compile(r'^Kernel: (?P<kernel>.*)$')
 
         # Build commit: a2dedc96c
-        p4 = re.compile(r'^Build commit: (?P<build_commit>\w+)$')
+        p4 = regex_engine.compile(r'^Build commit: (?P<build_commit>\w+)$')
 
         # Build date: Fri Jul  7 14:22:57 UTC 2023
-        p5 = re.compile(r'^Build date: (?P<build_date>.*)$')
+        p5 = regex_engine.compile(r'^Build date: (?P<build_date>.*)$')
 
         # Built by: sonicci@sonic-ci-7-lnx
-        p6 = re.compile(r'^Built by: (?P<built_by>.*)$')
+        p6 = regex_engine.compile(r'^Built by: (?P<built_by>.*)$')
 
         # Platform: x86_64-8201_32fh_o-r0
-        p7 = re.compile(r'^Platform: (?P<platform>.*)$')
+        p7 = regex_engine.compile(r'^Platform: (?P<platform>.*)$')
 
         # HwSKU: 32x400Gb
-        p8 = re.compile(r'^HwSKU: (?P<hwsku>[\w-]+)$')
+        p8 = regex_engine.compile(r'^HwSKU: (?P<hwsku>[\w-]+)$')
 
         # ASIC: cisco-8000
-        p9 = re.compile(r'^ASIC: (?P<asic>[\w-]+)$')
+        p9 = regex_engine.compile(r'^ASIC: (?P<asic>[\w-]+)$')
 
         # ASIC Count: 1
-        p10 = re.compile(r'^ASIC Count: (?P<asic_count>\d+)$')
+        p10 = regex_engine.compile(r'^ASIC Count: (?P<asic_count>\d+)$')
 
         # Serial Number: FOC2217FQXV
-        p11 = re.compile(r'^Serial Number: (?P<serial_number>\w+)$')
+        p11 = regex_engine.compile(r'^Serial Number: (?P<serial_number>\w+)$')
 
         # Model Number: 8201-32FH-O
-        p12 = re.compile(r'^Model Number: (?P<model_number>[\w-]+)$')
+        p12 = regex_engine.compile(r'^Model Number: (?P<model_number>[\w-]+)$')
 
         # Hardware Revision: 0.33
-        p13 = re.compile(r'^Hardware (Revision|Rev): (?P<hw_revision>[\w.]+)$')
+        p13 = regex_engine.compile(r'^Hardware (Revision|Rev): (?P<hw_revision>[\w.]+)$')
 
         # Uptime: 17:07:15 up 15 min,  1 user,  load average: 0.82, 1.00, 0.90
-        p14 = re.compile(r'^Uptime: (?P<uptime>.+), +(?P<users>\d+) user, +load average: (?P<load_average>.+)$')
+        p14 = regex_engine.compile(r'^Uptime: (?P<uptime>.+), +(?P<users>\d+) user, +load average: (?P<load_average>.+)$')
 
         # Date: Thu 02 Nov 2023 17:07:15
-        p15 = re.compile(r'^Date: (?P<date>.+)$')
+        p15 = regex_engine.compile(r'^Date: (?P<date>.+)$')
 
         # REPOSITORY     TAG                                                      IMAGE ID           SIZE
         # docker-macsec  latest                                                   44ef5532977a       332MB
         # docker-snmp    azure_cisco_tortuga_202305.10234-dirty-20240326.030556   fa3b3f6e4927       359MB
-        p16 = re.compile(r'^(?P<repository>[\w-]+) +(?P<tag>[\w/_/-/.]+) +(?P<image_id>\w+) +(?P<size>\w+)$')
+        p16 = regex_engine.compile(r'^(?P<repository>[\w-]+) +(?P<tag>[\w/_/-/.]+) +(?P<image_id>\w+) +(?P<size>\w+)$')
 
         ret_dict = {}
         for line in output.splitlines():
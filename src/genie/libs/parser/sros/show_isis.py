@@ -4,14 +4,12 @@
         * show router isis adjacency detail
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
+from genie.libs.parser.utils import regex_engine
 from genie.libs.parser.utils.common import Common
 
 # =============================================
@@ -59,7 +57,7 @@ class ShowRouterIsisAdjacency(ShowRouterIsisAdjacencySchema):
         parsed_dict = {}
 
         # Rtr Base ISIS Instance 0 Adjacency
-        p0 = re.compile(r'^Rtr Base ISIS Instance (?P<instance>\d+) Adjacency$')
+        p0 = regex_engine.compile(r'^Rtr Base ISIS Instance (?P<instance>\d+) Adjacency$')
 
         # System ID                Usage State Hold Interface                     MT-ID
         # -------------------------------------------------------------------------------
@@ -67,11 +65,11 @@ class ShowRouterIsisAdjacency(ShowRouterIsisAdjacencySchema):
         # COTKON04XR1              L2    Up    24   To-COTKON04XR1-LAG-4          0
         # COTKPQ03R07              L2    Up    24   To-COTKPQ03R07-LAG-9          0
         # -------------------------------------------------------------------------------
-        p1 = re.compile(r'^(?P<system_id>\S+) +(?P<usage>\S+) +(?P<state>\S+) '
-                        r'+(?P<hold>\d+) +(?P<interface>\S+) +(?P<mt_id>\d+)$')
+        p1 = regex_engine.compile(r'^(?P<system_id>\S+) +(?P<usage>\S+) +(?P<state>\S+) '
+                                  r'+(?P<hold>\d+) +(?P<interface>\S+) +(?P<mt_id>\d+)$')
 
         # Adjacencies : 3
-        p2 = re.compile(r'^Adjacencies : (?P<adjacencies>\d+)$')
+        p2 = regex_engine.compile(r'^Adjacencies : (?P<adjacencies>\d+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -174,40 +172,40 @@ class ShowRouterIsisAdjacencyDetail(ShowRouterIsisAdjacencyDetailSchema):
         # ============================================
         # regex patterns
         # ============================================
-        p0 = re.compile(r'Rtr Base ISIS Instance (?P<instance>\d+) Adjacency \(detail\)')
+        p0 = regex_engine.compile(r'Rtr Base ISIS Instance (?P<instance>\d+) Adjacency \(detail\)')
 
         # Hostname    : COPQON05R07
-        p1 = re.compile(r'^Hostname +: +(?P<hostname>\S+)$')
+        p1 = regex_engine.compile(r'^Hostname +: +(?P<hostname>\S+)$')
         # SystemID    : 0691.58ff.79a2                   SNPA        : 00:23:3e:ff:a6:27
-        p2 = re.compile(r'^SystemID +: +(?P<system_id>\S+) +SNPA +: +(?P<snpa>\S+)$')
+        p2 = regex_engine.compile(r'^SystemID +: +(?P<system_id>\S+) +SNPA +: +(?P<snpa>\S+)$')
         # Interface   : To-COPQON05R07-LAG-7             Up Time     : 58d 03:24:48
-        p3 = re.compile(r'^Interface +: +(?P<interface>\S+) +Up Time +: +(?P<up_time>[\s\S]+)$')
+        p3 = regex_engine.compile(r'^Interface +: +(?P<interface>\S+) +Up Time +: +(?P<up_time>[\s\S]+)$')
         # State       : Up                               Priority    : 0
-        p4 = re.compile(r'^State +: +(?P<state>\S+) +Priority +: +(?P<priority>\d+)$')
+        p4 = regex_engine.compile(r'^State +: +(?P<state>\S+) +Priority +: +(?P<priority>\d+)$')
         # Nbr Sys Typ : L2                               L. Circ Typ : L2
-        p5 = re.compile(r'^Nbr Sys Typ +: +(?P<nbr_sys_typ>\S+) +L. Circ Typ +: +(?P<l_circ_typ>\S+)$')
+        p5 = regex_engine.compile(r'^Nbr Sys Typ +: +(?P<nbr_sys_typ>\S+) +L. Circ Typ +: +(?P<l_circ_typ>\S+)$')
         # Hold Time   : 22                               Max Hold    : 30
-        p6 = re.compile(r'^Hold Time +: +(?P<hold_time>\d+) +Max Hold +: +(?P<max_hold>\d+)$')
+        p6 = regex_engine.compile(r'^Hold Time +: +(?P<hold_time>\d+) +Max Hold +: +(?P<max_hold>\d+)$')
         # Adj Level   : L2                               MT Enabled  : No
-        p7 = re.compile(r'^Adj Level +: +(?P<adj_level>\S+) +MT Enabled +: +(?P<mt_enabled>\S+)$')
+        p7 = regex_engine.compile(r'^Adj Level +: +(?P<adj_level>\S+) +MT Enabled +: +(?P<mt_enabled>\S+)$')
         # Topology    : Unicast
-        p8 = re.compile(r'^Topology +: +(?P<topology>\S+)$')
+        p8 = regex_engine.compile(r'^Topology +: +(?P<topology>\S+)$')
         # IPv6 Neighbor     : ::
-        p9 = re.compile(r'^IPv6 Neighbor +: +(?P<ipv6_neighbor>\S+)$')
+        p9 = regex_engine.compile(r'^IPv6 Neighbor +: +(?P<ipv6_neighbor>\S+)$')
         # IPv4 Neighbor     : 10.11.97.22
-        p10 = re.compile(r'^IPv4 Neighbor +: +(?P<ipv4_neighbor>\S+)$')
+        p10 = regex_engine.compile(r'^IPv4 Neighbor +: +(?P<ipv4_neighbor>\S+)$')
         # IPv4 Adj SID      : Label 524213
-        p11 = re.compile(r'^IPv4 Adj SID +: +(?P<ipv4_adj_sid>[\S\s]+)$')
+        p11 = regex_engine.compile(r'^IPv4 Adj SID +: +(?P<ipv4_adj_sid>[\S\s]+)$')
         # Restart Support   : Disabled
-        p12 = re.compile(r'^Restart Support +: +(?P<restart_support>\S+)$')
+        p12 = regex_engine.compile(r'^Restart Support +: +(?P<restart_support>\S+)$')
         # Restart Status    : Not currently being helped
-        p13 = re.compile(r'^Restart Status +: +(?P<restart_status>[\s\S]+)$')
+        p13 = regex_engine.compile(r'^Restart Status +: +(?P<restart_status>[\s\S]+)$')
         # Restart Supressed : Disabled
-        p14 = re.compile(r'^Restart Supressed +: +(?P<restart_supressed>\S+)$')
+        p14 = regex_engine.compile(r'^Restart Supressed +: +(?P<restart_supressed>\S+)$')
         # Number of Restarts: 0
-        p15 = re.compile(r'^Number of Restarts: +(?P<number_of_restarts>\d+)$')
+        p15 = regex_engine.compile(r'^Number of Restarts: +(?P<number_of_restarts>\d+)$')
         # Last Restart at   : Never
-        p16 = re.compile(r'^Last Restart at +: +(?P<last_restart_at>\S+)$')
+        p16 = regex_engine.compile(r'^Last Restart at +: +(?P<last_restart_at>\S+)$')
 
         parsed_dict = {}
         tmp = {}
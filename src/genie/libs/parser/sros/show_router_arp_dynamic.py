@@ -1,6 +1,8 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # ======================================================
 # Schema for 'show router arp dynamic'
@@ -38,13 +40,13 @@ class ShowRouterArpDynamic(ShowRouterArpDynamicSchema):
 		parsed_dict = {}
 
 		#ARP Table Router: (Base)
-		p0 = re.compile(r'^ARP Table Router: \((?P<router>\S+)\)$')
+		p0 = regex_engine.compile(r'^ARP Table Router: \((?P<router>\S+)\)$')
 
 		#No. of ARP Entries: 4
-		p1 = re.compile(r'^No. of ARP Entries: (?P<entries>\d+)$')
+		p1 = regex_engine.compile(r'^No. of ARP Entries: (?P<entries>\d+)$')
 
 		#10.4.1.1         00:fe:c8:ff:db:6d 02h34m12s Dyn[I] To-ASR5.5K
-		p2 = re.compile(r'^(?P<ip_address>\S+) +(?P<mac_add>\S+) +(?P<expiry>\S+) +(?P<type>\S+) +(?P<interface>\S+)$')
+		p2 = regex_engine.compile(r'^(?P<ip_address>\S+) +(?P<mac_add>\S+) +(?P<expiry>\S+) +(?P<type>\S+) +(?P<interface>\S+)$')
 		
 		for line in out.splitlines():
 			line= line.strip()
@@ -1,6 +1,8 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # ======================================================
 # Schema for 'show service sap-using'
@@ -42,13 +44,13 @@ class ShowServiceSapUsing(ShowServiceSapUsingSchema):
         # 2/1/6:3101.*                    1121       4503  none    4503  none   Up   Up
         # lag-2:4000.*                    1122       1     none    1     none   Up   Up
         # lag-1:400.1                    1221       1     none    1     none   Up   Up
-        p1 = re.compile(r'(?P<sap>\S+)'
-                        r' +(?P<service>\d+) +(?P<ing_qos>\d+) +(?P<ing_filter>\S+)'
-                        r' +(?P<egr_qos>\d+) +(?P<egr_filter>\S+)' 
-                        r' +(?P<admin>Up|Down)\s+(?P<oper>Up|Down)')
+        p1 = regex_engine.compile(r'(?P<sap>\S+)'
+                                  r' +(?P<service>\d+) +(?P<ing_qos>\d+) +(?P<ing_filter>\S+)'
+                                  r' +(?P<egr_qos>\d+) +(?P<egr_filter>\S+)' 
+                                  r' +(?P<admin>Up|Down)\s+(?P<oper>Up|Down)')
 
         # Number of SAPs : 8
-        p2 = re.compile(r'^Number of SAPs : (?P<total>\d+)')
+        p2 = regex_engine.compile(r'^Number of SAPs : (?P<total>\d+)')
 
         for line in out.splitlines():
             if line:
@@ -1,6 +1,8 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # ======================================================
 # Schema for 'show service sdp-using'
@@ -38,13 +40,13 @@ class ShowServiceSdpUsing(ShowServiceSdpUsingSchema):
         #300100     1000:20001         Spok   10.0.1.2             Up    131067  131069
         #300100     1000:20003         Spok   10.0.1.2             Up    131065  131067
         #300101     1000:20002         Spok   10.0.1.3             Up    131066  131068
-        p1 = re.compile(r'(?P<service>\d+)'
-                        r' +(?P<sdp>\S+) +(?P<type>\S+) +(?P<far_end>\S+)'
-                        r' +(?P<oper>Up|Down) +(?P<ingress_label>\d+|None)' 
-                        r' +(?P<egress_label>\d+|None)')
+        p1 = regex_engine.compile(r'(?P<service>\d+)'
+                                  r' +(?P<sdp>\S+) +(?P<type>\S+) +(?P<far_end>\S+)'
+                                  r' +(?P<oper>Up|Down) +(?P<ingress_label>\d+|None)' 
+                                  r' +(?P<egress_label>\d+|None)')
 
         # Number of SDPs : 4
-        p2 = re.compile(r'^Number of SDPs : (?P<total>\d+)')
+        p2 = regex_engine.compile(r'^Number of SDPs : (?P<total>\d+)')
 
         for line in output.splitlines():
             if line:
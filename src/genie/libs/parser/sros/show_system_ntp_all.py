@@ -3,13 +3,13 @@
         * show system ntp all
 """
 
-# Python
-import re
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =============================================
 # Parser for 'show system ntp all'
 # =============================================
@@ -70,31 +70,31 @@ class ShowSystemNtpAll(ShowSystemNtpAllSchema):
         # NTP Status
         # ==============================================================
         # Configured         : Yes                Stratum              : 3
-        p0 = re.compile(r'Configured +: +(?P<configured>\S+) '
-                        r'+Stratum +: +(?P<stratum>\d+)')
+        p0 = regex_engine.compile(r'Configured +: +(?P<configured>\S+) '
+                                  r'+Stratum +: +(?P<stratum>\d+)')
         # Admin Status       : up                 Oper Status          : up
-        p1 = re.compile(r'Admin Status +: +(?P<admin_status>\S+) '
-                        r'+Oper Status +: +(?P<oper_status>\S+)')
+        p1 = regex_engine.compile(r'Admin Status +: +(?P<admin_status>\S+) '
+                                  r'+Oper Status +: +(?P<oper_status>\S+)')
         # Server Enabled     : No                 Server Authenticate  : No
-        p2 = re.compile(r'Server Enabled +: +(?P<server_enabled>\S+) '
-                        r'+Server Authenticate +: +(?P<server_authenticate>\S+)')
+        p2 = regex_engine.compile(r'Server Enabled +: +(?P<server_enabled>\S+) '
+                                  r'+Server Authenticate +: +(?P<server_authenticate>\S+)')
         # Clock Source       : 192.168.132.170
-        p3 = re.compile(r'Clock Source +: +(?P<clock_source>\S+)')
+        p3 = regex_engine.compile(r'Clock Source +: +(?P<clock_source>\S+)')
         # Auth Check         : No
-        p4 = re.compile(r'Auth Check +: +(?P<auth_check>\S+)')
+        p4 = regex_engine.compile(r'Auth Check +: +(?P<auth_check>\S+)')
         # Current Date & Time: 2020/01/17 17:24:12 UTC
-        p5 = re.compile(r'Current Date & Time: +(?P<current_date_time>[\s\S]+)')
+        p5 = regex_engine.compile(r'Current Date & Time: +(?P<current_date_time>[\s\S]+)')
 
         # ==============================================================
         # NTP Active Associations
         # ==============================================================
         # reject                    STEP            -  srvr  -  64   ........  0.000
-        p6 = re.compile(r'(?P<state>\S+) +(?P<refid>\S+) '
-                        r'+(?P<stratum>[-\d]) +(?P<type>\S+) '
-                        r'+(?P<a>[-]) +(?P<poll>\d+) +(?P<reach>\S+) '
-                        r'+(?P<offset>[-.\d]+)')
+        p6 = regex_engine.compile(r'(?P<state>\S+) +(?P<refid>\S+) '
+                                  r'+(?P<stratum>[-\d]) +(?P<type>\S+) '
+                                  r'+(?P<a>[-]) +(?P<poll>\d+) +(?P<reach>\S+) '
+                                  r'+(?P<offset>[-.\d]+)')
         # Base           172.16.189.64
-        p7 = re.compile(r'(?P<router>\S+) +(?P<remote>[.\d]+)')
+        p7 = regex_engine.compile(r'(?P<router>\S+) +(?P<remote>[.\d]+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2,9 +2,11 @@
 * 'show version'
 """
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # ===========================================
@@ -40,7 +42,7 @@ class ShowVersionUPF(ShowVersionUPFSchema):
         parsed_dict = {}
 	
 	# regex to capture key-value pairs, key is labeled as "type" and value is labeled as "value"
-        p1 = re.compile(r"^\s*(?P<type>.*):\s+(?P<value>.*)$")
+        p1 = regex_engine.compile(r"^\s*(?P<type>.*):\s+(?P<value>.*)$")
 
         for line in output.splitlines():
             line = line.strip()
@@ -1,2 +1,4 @@
+# first, for the python source of the compiled modules to be importable
+from . import compiled
 from .common import get_parser, get_parser_exclude, get_parser_commands
 
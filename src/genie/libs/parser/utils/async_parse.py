@@ -0,0 +1,176 @@
+'''asyncio entry point for parsers
+
+Parsers are written against a blocking ``device.execute()``. This module runs
+them on top of asyncio device connections whose ``execute`` is a coroutine,
+without blocking the event loop:
+
+* the parser itself (regex matching and schema validation) runs in an
+  executor thread,
+* every ``execute`` issued by the parser is awaited on the event loop,
+* follow-up commands issued by a parser (eg. one command per BGP instance,
+  one ``show running-config | section router ospf {instance}`` per OSPF
+  process) are discovered ahead of time and fetched concurrently.
+
+Follow-up discovery works in rounds. The parser is run with a proxy device
+that answers unknown commands with an empty output and records them. All
+recorded commands are then fetched concurrently, and the parser is run again
+with the fetched outputs, until a round needs no new command. That last
+round only sees real device outputs, so its result is the same as the one
+of a blocking ``parser.parse()``.
+
+Example:
+
+    >>> from genie.libs.parser.utils.async_parse import aparse
+    >>> parser = ShowBgpInstanceSummary(device=async_device)
+    >>> parsed = await aparse(parser, instance='all')
+'''
+
+# python
+import copy
+import asyncio
+import inspect
+import logging
+from collections import OrderedDict
+
+from .common import get_parser
+
+log = logging.getLogger(__name__)
+
+# Maximum number of discovery rounds before falling back to executing
+# follow-up commands one at a time
+DEFAULT_MAX_ROUNDS = 5
+
+# Maximum number of commands in flight for a single parse
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+async def _execute(device, command, **kwargs):
+    '''await device.execute, accepting both coroutine and plain functions'''
+    output = device.execute(command, **kwargs)
+    if inspect.isawaitable(output):
+        output = await output
+    return output
+
+
+class _AsyncDeviceProxy(object):
+    '''Blocking device facade handed to the parser in the executor thread.
+
+    Known outputs are served from ``outputs``. Unknown commands are either
+    recorded and answered with an empty output (discovery rounds), or
+    executed on the event loop while the executor thread waits.
+    '''
+    def __init__(self, device, loop, outputs, discover):
+        self._device = device
+        self._loop = loop
+        self._outputs = outputs
+        self._discover = discover
+        self.pending = OrderedDict()
+
+    def execute(self, command, **kwargs):
+        try:
+            return self._outputs[command]
+        except KeyError:
+            pass
+
+        if self._discover:
+            self.pending.setdefault(command, kwargs)
+            return ''
+
+        future = asyncio.run_coroutine_threadsafe(
+            _execute(self._device, command, **kwargs), self._loop)
+        output = self._outputs[command] = future.result()
+        return output
+
+    def __getattr__(self, attr):
+        return getattr(self._device, attr)
+
+
+def _run_parse(parser, device, kwargs):
+    '''run parser.parse on a copy of the parser bound to device'''
+    parser = copy.copy(parser)
+    parser.device = device
+    return parser.parse(**kwargs)
+
+
+async def aparse(parser,
+                 *,
+                 executor=None,
+                 prefetch=True,
+                 max_rounds=DEFAULT_MAX_ROUNDS,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 **kwargs):
+    '''Parse without blocking the event loop.
+
+        Args:
+            parser (`MetaParser`): parser instance, its device must have an
+                                   ``execute`` coroutine
+            executor (`Executor`): executor running the parser, defaults to
+                                   the event loop default executor
+            prefetch (`bool`): discover follow-up commands and fetch them
+                               concurrently. When False, commands are
+                               awaited one at a time, as the parser issues
+                               them
+            max_rounds (`int`): maximum number of discovery rounds
+            max_concurrency (`int`): maximum number of commands in flight
+            kwargs: passed to ``parser.parse()``
+
+        Returns:
+            parsed output, as returned by ``parser.parse()``
+    '''
+    loop = asyncio.get_running_loop()
+    device = parser.device
+    outputs = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(command, cmd_kwargs):
+        async with semaphore:
+            outputs[command] = await _execute(device, command, **cmd_kwargs)
+
+    for _ in range(max_rounds if prefetch else 0):
+        proxy = _AsyncDeviceProxy(device, loop, outputs, discover=True)
+        try:
+            result = await loop.run_in_executor(executor, _run_parse, parser,
+                                                proxy, kwargs)
+        except Exception:
+            # Parsers may not cope with the empty placeholder outputs, only
+            # a round without any placeholder is meaningful
+            if not proxy.pending:
+                raise
+            result = None
+
+        if not proxy.pending:
+            return result
+
+        log.debug('{}: fetching {} command(s) concurrently: {}'.format(
+            parser.__class__.__name__, len(proxy.pending),
+            list(proxy.pending)))
+        await asyncio.gather(*(fetch(command, cmd_kwargs)
+                               for command, cmd_kwargs
+                               in proxy.pending.items()))
+
+    # Out of rounds, or prefetch disabled: await each remaining command
+    # as the parser issues it
+    proxy = _AsyncDeviceProxy(device, loop, outputs, discover=False)
+    return await loop.run_in_executor(executor, _run_parse, parser, proxy,
+                                      kwargs)
+
+
+async def aparse_command(device, command, *, context='cli', **kwargs):
+    '''Resolve a show command to its parser and parse it asynchronously.
+
+    The asyncio counterpart of ``device.parse(command)``.
+
+        Args:
+            device (`Device`): device with abstract tokens (os, platform...)
+                               and an ``execute`` coroutine
+            command (`str`): show command to parse
+            context (`str`): parser context, defaults to 'cli'
+            kwargs: passed to ``aparse``
+
+        Returns:
+            parsed output
+    '''
+    parser_cls, parser_kwargs = get_parser(command, device)
+    parser_kwargs.update(kwargs)
+    parser = parser_cls(device=device, context=context)
+    return await aparse(parser, **parser_kwargs)
@@ -0,0 +1,298 @@
+'''Concurrent collection of the BIG-IP REST parsers
+
+Every bigip parser is a GET of an iControl REST path (LtmPool ->
+/mgmt/tm/ltm/pool) returning the json of the response. Collecting the state
+of a BIG-IP with them is hundreds of sequential HTTPS requests.
+BigipCollector issues the GETs of a set of parsers concurrently, over a
+pooled keep-alive session, and dispatches each response to its parser:
+
+    >>> from genie.libs.parser.utils.bigip_collector import BigipCollector
+    >>> from genie.libs.parser.bigip.get_ltm_pool import LtmPool
+    >>> collector = BigipCollector('https://10.1.1.1', auth=('admin', 'pw'),
+    ...                            max_workers=8, page_size=500)
+    >>> results = collector.collect([LtmPool, '/mgmt/tm/ltm/virtual'])
+    >>> results['LtmPool']['parsed']['items']
+
+Collections are requested page by page with $top/$skip when page_size is
+given, following the nextLink of each page, and the pages are merged into the
+response the device returns without paging. Paging bounds the size of each
+response, not the memory of the collection: the bigip parsers return the
+whole response.json() of their path, so dispatching to a parser needs the
+full collection. iter_items streams the items of a large collection page by
+page without merging them, for callers which do not need the parsers.
+
+Certificates are verified by default, as with requests. Pass verify=False
+for a BIG-IP with a self-signed certificate, or the path of its CA bundle.
+'''
+
+# python
+import logging
+import threading
+from urllib.parse import urlsplit, urlunsplit, urlencode
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .bulk import ParserResolver, _error
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+log = logging.getLogger(__name__)
+
+# parallel requests, the BIG-IP management plane serves a few at once
+DEFAULT_MAX_WORKERS = 8
+
+# seconds to connect and to read a response
+DEFAULT_TIMEOUT = 30
+
+# keys of a page of a collection, dropped when the pages are merged
+PAGING_KEYS = ('nextLink', 'previousLink', 'currentItemCount',
+               'itemsPerPage', 'pageIndex', 'startIndex', 'totalItems',
+               'totalPages')
+
+
+class _Response(object):
+    '''response of a collected path, handed to the parser'''
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class _CollectedDevice(object):
+    '''device stand-in returning the collected response of a path'''
+    def __init__(self, path, data, device=None):
+        self.path = path
+        self.data = data
+        self.device = device
+        self.os = 'bigip'
+
+    def get(self, path, *args, **kwargs):
+        if path != self.path:
+            raise ValueError("Path '{}' was not collected, only '{}' "
+                             "was".format(path, self.path))
+        return _Response(self.data)
+
+    def __getattr__(self, attr):
+        if self.device is None:
+            raise AttributeError(attr)
+        return getattr(self.device, attr)
+
+
+class BigipCollector(object):
+    '''Collect the responses of bigip parsers concurrently
+
+        Args:
+            base_url (`str`): url of the BIG-IP, eg. 'https://10.1.1.1'
+            auth (`tuple`): (username, password) for basic authentication
+            token (`str`): X-F5-Auth-Token, instead of auth
+            verify (`bool` or `str`): verify the certificate of the BIG-IP,
+                                      or path to the CA bundle to verify it
+                                      with. False skips the verification
+            max_workers (`int`): requests in flight at once, also the size
+                                 of the connection pool
+            page_size (`int`): items per page ($top) of the collections,
+                               no paging by default
+            timeout (`float`): seconds to connect and read a response
+            session (`requests.Session`): session to use instead of a new
+                                          one
+            device (`Device`): device reported to the parsers
+    '''
+
+    def __init__(self, base_url, auth=None, token=None, verify=True,
+                 max_workers=DEFAULT_MAX_WORKERS, page_size=None,
+                 timeout=DEFAULT_TIMEOUT, session=None, device=None):
+        if requests is None:
+            raise ImportError("requests is required for the bigip "
+                              "collector. Install it with 'pip install "
+                              "requests'")
+        self.base_url = base_url.rstrip('/')
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.timeout = timeout
+        self.device = device
+        self.resolver = ParserResolver()
+
+        if session is None:
+            session = requests.Session()
+            # one kept-alive connection per worker
+            adapter = HTTPAdapter(pool_connections=1,
+                                  pool_maxsize=max_workers)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.verify = verify
+            if auth is not None:
+                session.auth = auth
+        if token is not None:
+            session.headers['X-F5-Auth-Token'] = token
+        self.session = session
+        self._lock = threading.Lock()
+        self.requests_count = 0
+
+    @classmethod
+    def from_device(cls, device, alias='rest', **kwargs):
+        '''Create a collector from the rest connection of a testbed device
+
+            Args:
+                device (`Device`): pyATS device with a rest connection
+                alias (`str`): name of the connection
+                kwargs: passed to BigipCollector
+        '''
+        connection = device.connections[alias]
+        protocol = connection.get('protocol', 'https')
+        host = str(connection.get('host', connection.get('ip')))
+        port = connection.get('port')
+        base_url = '{}://{}{}'.format(protocol, host,
+                                      ':{}'.format(port) if port else '')
+        if 'auth' not in kwargs and 'token' not in kwargs:
+            credentials = getattr(device, 'credentials', {}) or {}
+            credential = credentials.get(alias) or credentials.get('default')
+            if credential:
+                password = credential.get('password')
+                # pyATS keeps the passwords as SecretStrings
+                password = getattr(password, 'plaintext', password)
+                kwargs['auth'] = (credential.get('username'), password)
+        kwargs.setdefault('device', device)
+        return cls(base_url, **kwargs)
+
+    def _url(self, path, params=None):
+        url = self.base_url + path
+        if params:
+            url += ('&' if '?' in url else '?') + urlencode(params,
+                                                           safe='$')
+        return url
+
+    def _next_url(self, link):
+        # nextLink points to https://localhost/mgmt/..., keep the path and
+        # the query on the collector url
+        parts = urlsplit(link)
+        base = urlsplit(self.base_url)
+        return urlunsplit((base.scheme, base.netloc, parts.path,
+                           parts.query, ''))
+
+    def _get(self, url):
+        with self._lock:
+            self.requests_count += 1
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        if not response.content:
+            return {}
+        return response.json()
+
+    def iter_pages(self, path):
+        '''Yield the pages of a collection, following their nextLink
+
+            Args:
+                path (`str`): REST path, eg. '/mgmt/tm/ltm/pool'
+
+            Returns:
+                generator of the json pages
+        '''
+        params = {'$top': self.page_size, '$skip': 0} \
+            if self.page_size else None
+        url = self._url(path, params)
+        while url:
+            page = self._get(url)
+            yield page
+            link = page.get('nextLink') if isinstance(page, dict) else None
+            url = self._next_url(link) if link else None
+
+    def iter_items(self, path):
+        '''Yield the items of a collection, one page in memory at a time
+
+            Args:
+                path (`str`): REST path of a collection
+
+            Returns:
+                generator of the items
+        '''
+        for page in self.iter_pages(path):
+            yield from page.get('items', [])
+
+    def fetch(self, path):
+        '''GET a path, the pages of a collection merged. The parsers take
+        the whole response, use iter_items to stream a collection instead
+
+            Args:
+                path (`str`): REST path
+
+            Returns:
+                json of the response, as the device returns it unpaged
+        '''
+        pages = self.iter_pages(path)
+        data = next(pages)
+        if not self.page_size or not isinstance(data, dict):
+            return data
+
+        items = list(data.get('items', []))
+        for page in pages:
+            items.extend(page.get('items', []))
+        data = {key: value for key, value in data.items()
+                if key not in PAGING_KEYS}
+        if items or 'items' in data:
+            data['items'] = items
+        return data
+
+    def _resolve(self, parser):
+        if isinstance(parser, str):
+            parser, _ = self.resolver.resolve({'os': 'bigip'}, parser)
+        return parser
+
+    def _collect_one(self, parser_cls):
+        path = parser_cls.cli_command
+        result = {'parser': parser_cls.__name__, 'path': path}
+        try:
+            data = self.fetch(path)
+            device = _CollectedDevice(path, data, self.device)
+            result['parsed'] = parser_cls(device=device,
+                                          context='rest').parse()
+        except Exception as e:
+            result['error'] = _error(e)
+        return result
+
+    def iter_collect(self, parsers):
+        '''Collect parsers concurrently, yield the results as they complete
+
+            Args:
+                parsers (`list`): bigip parser classes, or their REST paths
+
+            Returns:
+                generator of result dicts with keys 'parser', 'path' and
+                either 'parsed' or 'error'
+        '''
+        resolved = []
+        for parser in parsers:
+            try:
+                resolved.append(self._resolve(parser))
+            except Exception as e:
+                yield {'parser': None, 'path': parser, 'error': _error(e)}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._collect_one, parser_cls)
+                       for parser_cls in resolved]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def collect(self, parsers):
+        '''Collect parsers concurrently
+
+            Args:
+                parsers (`list`): bigip parser classes, or their REST paths
+
+            Returns:
+                dict of parser class name -> result dict, see iter_collect
+        '''
+        return {result['parser'] or result['path']: result
+                for result in self.iter_collect(parsers)}
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,578 @@
+'''Bulk parsing of archived cli captures
+
+Re-parses large volumes of raw device output offline, without any device
+connection. Each record is a (tokens, command, output) triple: the abstract
+tokens of the device the capture was taken from (at least ``os``), the show
+command that was executed, and the raw output of that command.
+
+Records are resolved to a parser class through ``get_parser``, unless they
+carry their parser class already (eg. the goldens of tests/<Class>), grouped
+per parser class so that every worker keeps the same module and compiled
+patterns warm, and parsed in chunks over a process pool. Results are written as JSON
+Lines or msgpack, one result per record, with per-record error capture.
+
+Example:
+
+    >>> from genie.libs.parser.utils.bulk import bulk_parse
+    >>> records = [({'os': 'iosxe'}, 'show clock', raw_clock_output)]
+    >>> with open('results.jsonl', 'w') as f:
+    ...     bulk_parse(records, f, fmt='jsonl', processes=4)
+    {'total': 1, 'parsed': 1, 'errors': 0}
+'''
+
+# python
+import re
+import sys
+import json
+import logging
+import pathlib
+import argparse
+import importlib
+from inspect import getfullargspec
+from itertools import islice
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .common import get_parser, _load_parser_json
+from .parse_budget import parse_budget
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+log = logging.getLogger(__name__)
+
+# (tokens, command, output) triple accepted by the bulk engine. Records whose
+# parser class is already known (eg. a golden output of tests/<Class>) carry
+# it along with its kwargs, and skip the command lookup
+BulkRecord = namedtuple('BulkRecord',
+                        ['tokens', 'command', 'output', 'parser', 'kwargs'],
+                        defaults=(None, None))
+
+FORMATS = ('jsonl', 'msgpack')
+
+# Number of records read from the input before grouping and dispatching
+DEFAULT_BATCH_SIZE = 10000
+
+# Number of records sent to a worker process in a single task
+DEFAULT_CHUNK_SIZE = 64
+
+# Maximum number of resolved (tokens, command) pairs kept in memory
+RESOLVE_CACHE_SIZE = 4096
+
+
+class OfflineExecuteError(Exception):
+    '''raised when a parser tries to reach the device while parsing
+       captured output offline'''
+    def __init__(self, *args):
+        self.device = args[0]
+        self.command = args[1]
+
+    def __str__(self):
+        return (
+            f"Device '{self.device}' is offline, cannot execute "
+            f"'{self.command}'"
+        )
+
+
+class OfflineDevice(object):
+    '''Minimal device stand-in carrying the abstract tokens of a capture.
+
+    It is enough for ``get_parser`` to pick the right parser implementation
+    and for parsers to run on provided output. Any attempt to reach the
+    device raises ``OfflineExecuteError``.
+    '''
+    def __init__(self, name='offline', **tokens):
+        self.name = name
+        self.custom = {}
+        for key, value in tokens.items():
+            setattr(self, key, value)
+
+    def execute(self, command, *args, **kwargs):
+        raise OfflineExecuteError(self.name, command)
+
+    def get(self, path, *args, **kwargs):
+        raise OfflineExecuteError(self.name, path)
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, self.name)
+
+
+def _normalize_tokens(tokens):
+    '''accept a tokens dict or an os string, return a hashable tuple'''
+    if isinstance(tokens, str):
+        tokens = {'os': tokens}
+    return tuple(sorted((k, v) for k, v in tokens.items() if v is not None))
+
+
+class ParserResolver(object):
+    '''Resolve (tokens, command) pairs to a parser class and its kwargs.
+
+    Resolution goes through ``get_parser`` and is memoized, as archives
+    contain the same commands for many devices.
+    '''
+    def __init__(self, maxsize=RESOLVE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+
+    def resolve(self, tokens, command):
+        '''resolve
+
+            Args:
+                tokens (`dict`): abstract tokens of the device, eg.
+                                 {'os': 'iosxe', 'platform': 'cat9k'}
+                command (`str`): show command the output was captured for
+
+            Returns:
+                tuple of parser class and kwargs
+
+            Raises:
+                ParserNotFound: no parser for this command and tokens
+        '''
+        key = (_normalize_tokens(tokens), command)
+        try:
+            self._cache.move_to_end(key)
+            parser_cls, kwargs = self._cache[key]
+        except KeyError:
+            device = OfflineDevice(**dict(key[0]))
+            parser_cls, kwargs = get_parser(command, device)
+            self._cache[key] = (parser_cls, kwargs)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        # parser kwargs are consumed by the caller, never share them
+        return parser_cls, dict(kwargs)
+
+
+def _error(exc):
+    return {'type': exc.__class__.__name__, 'message': str(exc)}
+
+
+def _parse_chunk(parser_cls, items, time_budget=None):
+    '''worker entry point: parse a chunk of records sharing a parser class
+
+        Args:
+            parser_cls (`class`): parser class used for every item
+            items (`list`): list of (index, tokens, command, output, kwargs)
+            time_budget (`float`): seconds allowed per record, no limit
+                                   by default
+
+        Returns:
+            list of result dicts
+    '''
+    parser_name = '{}.{}'.format(parser_cls.__module__, parser_cls.__name__)
+    results = []
+    for index, tokens, command, output, kwargs in items:
+        result = {
+            'index': index,
+            'tokens': dict(tokens),
+            'command': command,
+            'parser': parser_name,
+        }
+        try:
+            device = OfflineDevice(**dict(tokens))
+            with parse_budget(time_budget, parser=parser_cls):
+                result['parsed'] = parser_cls(device=device).parse(
+                    output=output, **kwargs)
+        except Exception as e:
+            result['error'] = _error(e)
+        results.append(result)
+    return results
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def iter_parse(records,
+               processes=None,
+               chunksize=DEFAULT_CHUNK_SIZE,
+               batch_size=DEFAULT_BATCH_SIZE,
+               resolver=None,
+               time_budget=None):
+    '''Parse records and yield one result dict per record.
+
+    Records are consumed ``batch_size`` at a time, so arbitrarily large
+    archives are processed with bounded memory. Results are yielded in
+    completion order; each result carries the ``index`` of its record.
+
+        Args:
+            records (`iterable`): (tokens, command, output) triples. tokens
+                                  is a dict of abstract tokens or an os string.
+                                  BulkRecord with a parser class are parsed
+                                  by that class with their kwargs
+            processes (`int`): number of worker processes. Defaults to the
+                               number of cpus. 0 parses in this process
+            chunksize (`int`): number of records per worker task
+            batch_size (`int`): number of records grouped per dispatch round
+            resolver (`ParserResolver`): resolver to reuse between calls
+            time_budget (`float`): seconds allowed per record, a record
+                                   going over gets a ParseTimeoutError
+
+        Returns:
+            generator of result dicts with keys 'index', 'tokens', 'command',
+            'parser' and either 'parsed' or 'error'
+    '''
+    resolver = resolver or ParserResolver()
+    records = enumerate(records)
+
+    if processes == 0:
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=processes)
+
+    try:
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+
+            # group per parser class to keep worker caches warm
+            groups = OrderedDict()
+            for index, record in batch:
+                tokens, command, output = record[:3]
+                try:
+                    if len(record) > 3 and record[3] is not None:
+                        parser_cls, kwargs = record[3], dict(record[4] or {})
+                    else:
+                        parser_cls, kwargs = resolver.resolve(tokens, command)
+                except Exception as e:
+                    yield {
+                        'index': index,
+                        'tokens': dict(_normalize_tokens(tokens)),
+                        'command': command,
+                        'parser': None,
+                        'error': _error(e),
+                    }
+                    continue
+                groups.setdefault(parser_cls, []).append(
+                    (index, _normalize_tokens(tokens), command, output,
+                     kwargs))
+
+            if executor is None:
+                for parser_cls, items in groups.items():
+                    yield from _parse_chunk(parser_cls, items, time_budget)
+                continue
+
+            futures = [
+                executor.submit(_parse_chunk, parser_cls, chunk, time_budget)
+                for parser_cls, items in groups.items()
+                for chunk in _chunks(items, chunksize)
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+class JsonLinesWriter(object):
+    '''write one json document per line'''
+    def __init__(self, fp):
+        self.fp = fp
+
+    def write(self, result):
+        self.fp.write(json.dumps(result, default=str))
+        self.fp.write('\n')
+
+
+class MsgpackWriter(object):
+    '''write a stream of msgpack documents'''
+    def __init__(self, fp):
+        if msgpack is None:
+            raise ImportError("msgpack is required for the 'msgpack' "
+                              "format. Install it with 'pip install msgpack'")
+        self.fp = fp
+        self.packer = msgpack.Packer(use_bin_type=True, default=str)
+
+    def write(self, result):
+        self.fp.write(self.packer.pack(result))
+
+
+WRITERS = {
+    'jsonl': JsonLinesWriter,
+    'msgpack': MsgpackWriter,
+}
+
+
+def bulk_parse(records, fp, fmt='jsonl', **kwargs):
+    '''Parse records and write every result to a file object.
+
+        Args:
+            records (`iterable`): (tokens, command, output) triples
+            fp (`file`): file object opened in text mode for 'jsonl' and in
+                         binary mode for 'msgpack'
+            fmt (`str`): 'jsonl' or 'msgpack'
+            kwargs: passed to ``iter_parse``
+
+        Returns:
+            summary dict with 'total', 'parsed' and 'errors' counts
+    '''
+    try:
+        writer = WRITERS[fmt](fp)
+    except KeyError:
+        raise ValueError("Unknown format '{}', expected one of {}".format(
+            fmt, ', '.join(FORMATS)))
+
+    summary = {'total': 0, 'parsed': 0, 'errors': 0}
+    for result in iter_parse(records, **kwargs):
+        writer.write(result)
+        summary['total'] += 1
+        if 'error' in result:
+            summary['errors'] += 1
+        else:
+            summary['parsed'] += 1
+    return summary
+
+
+# ------------------------------------------------------------------------------
+#   Folder based archives
+# ------------------------------------------------------------------------------
+_class_index = None
+_module_index = None
+_token_order = None
+
+# parser classes found by name, per (class name, tokens)
+_class_cache = {}
+
+
+def _build_class_index():
+    '''map parser class names to their (command, tokens, ptr) entries'''
+    global _class_index, _module_index, _token_order
+
+    if _class_index is not None:
+        return _class_index
+
+    _class_index = {}
+    _module_index = {}
+    data = _load_parser_json()
+    _token_order = [t for t in data.order if t not in ('origin', 'os')]
+
+    def walk(command, node):
+        if node.ptr:
+            class_name = node.ptr.rsplit('.', 1)[-1]
+            tokens = {k: v for k, v in node.tokens.items() if v is not None}
+            _class_index.setdefault(class_name, []).append(
+                (command, tokens, node.ptr))
+            # modules of the parsers of each os, to find the classes which
+            # are only reached through a distributor
+            modules = _module_index.setdefault(tokens.get('os'), {})
+            modules.setdefault(node.ptr.rsplit('.', 1)[0], tokens)
+        for child in node.nodes.values():
+            walk(command, child)
+
+    for command in data.keys():
+        if command in (None, 'tokens'):
+            continue
+        walk(command, data[command])
+
+    return _class_index
+
+
+def _tokens_from_parts(parts):
+    '''map folder names to abstract token keys, first folder is the os'''
+    _build_class_index()
+    tokens = {}
+    if parts:
+        tokens['os'] = parts[0]
+    # remaining folders follow the token order, eg. iosxe/cat9k/c9500
+    for key, value in zip(_token_order, parts[1:]):
+        tokens[key] = value
+    return tokens
+
+
+def _matches(tokens, cmd_tokens):
+    '''cmd_tokens are those of tokens, or less specific'''
+    if cmd_tokens.get('os') != tokens.get('os'):
+        return False
+    return all(tokens.get(k) in (None, v)
+               for k, v in cmd_tokens.items() if k != 'os')
+
+
+def _find_class(class_name, tokens):
+    '''parser class named class_name for tokens, None when not found'''
+    key = (class_name, _normalize_tokens(tokens))
+    try:
+        return _class_cache[key]
+    except KeyError:
+        pass
+
+    _build_class_index()
+    paths = [ptr for _, cmd_tokens, ptr in _class_index.get(class_name, [])
+             if _matches(tokens, cmd_tokens)]
+    # then the modules of the os, most specific first
+    modules = sorted(((len(mod_tokens), module) for module, mod_tokens in
+                      _module_index.get(tokens.get('os'), {}).items()
+                      if _matches(tokens, mod_tokens)), reverse=True)
+    paths.extend('{}.{}'.format(module, class_name) for _, module in modules)
+
+    parser_cls = None
+    for path in paths:
+        module, name = path.rsplit('.', 1)
+        try:
+            parser_cls = getattr(importlib.import_module(module), name)
+        except (ImportError, AttributeError):
+            continue
+        break
+
+    _class_cache[key] = parser_cls
+    return parser_cls
+
+
+def _command_for_class(class_name, tokens, arguments, parser_cls=None):
+    '''build the show command a golden output of class_name was taken for'''
+    commands = [command for command, cmd_tokens, _ in
+                _build_class_index().get(class_name, [])
+                if _matches(tokens, cmd_tokens)]
+    if not commands and parser_cls is not None:
+        # classes only reached through a distributor are not in the index,
+        # their own commands are the ones of the goldens
+        commands = getattr(parser_cls, 'cli_command', None) or \
+            getattr(parser_cls, 'parser_command', None) or []
+        if isinstance(commands, str):
+            commands = [commands]
+
+    candidates = []
+    for command in commands:
+        fields = set(re.findall(r'{(.*?)}', command))
+        if fields <= set(arguments):
+            candidates.append((len(fields), command))
+
+    if not candidates:
+        return None
+
+    # the command using the most of the provided arguments wins
+    candidates.sort(key=lambda c: -c[0])
+    return candidates[0][1].format(**arguments)
+
+
+def _tokens_from_path(folder, parts):
+    '''tokens of folder, parts are its folders below the archive root'''
+    _build_class_index()
+    if parts and parts[0] in _module_index:
+        return _tokens_from_parts(parts)
+    # root is below the os folder, eg. iosxe/ or iosxe/tests/ShowArp, read
+    # the tokens from the closest os folder of the absolute path
+    path = [p for p in folder.resolve().parts if p != 'tests']
+    for i in range(len(path) - 1, -1, -1):
+        if path[i] in _module_index:
+            return _tokens_from_parts(path[i:])
+    return _tokens_from_parts(parts)
+
+
+def iter_folder_records(root):
+    '''Yield records from a folder tree laid out like the unittests folders.
+
+    Expected layout, with any number of token folders after the os:
+
+        <root>/<os>[/<platform>[/<model>]][/tests]/<Class>/cli/equal/
+            <name>_output.txt
+            <name>_arguments.json   (optional)
+
+    root can also be any folder within this layout, down to a single
+    <Class> folder, the tokens are then read from the path of root. The
+    show command is rebuilt from the cli_command of <Class> and the
+    optional arguments file, and the output is parsed by <Class>.
+
+        Args:
+            root (`str`): root folder of the archive
+
+        Returns:
+            generator of BulkRecord
+    '''
+    root = pathlib.Path(root)
+    for output_file in sorted(root.glob('**/cli/equal/*_output.txt')):
+        # <Class>/cli/equal/<file>
+        class_folder = output_file.parents[2]
+        class_name = class_folder.name
+        # [..tokens.., (tests)] between root and <Class>
+        try:
+            parts = [p for p in class_folder.parent.relative_to(root).parts
+                     if p != 'tests']
+        except ValueError:
+            # root is the <Class> folder, or within it
+            parts = []
+        tokens = _tokens_from_path(class_folder.parent, parts)
+
+        arguments = {}
+        name = output_file.name[:-len('_output.txt')]
+        arguments_file = output_file.with_name(name + '_arguments.json')
+        if arguments_file.exists():
+            with open(arguments_file) as f:
+                arguments = json.load(f)
+
+        parser_cls = _find_class(class_name, tokens)
+        command = _command_for_class(class_name, tokens, arguments,
+                                     parser_cls=parser_cls)
+        if command is None or parser_cls is None:
+            log.warning('Could not find a command for {} under {}, '
+                        'skipping {}'.format(class_name, tokens, output_file))
+            continue
+
+        kwargs = dict(arguments)
+        cli = getattr(parser_cls, 'cli', None)
+        if cli is not None and 'command' in getfullargspec(cli).args:
+            kwargs['command'] = command
+
+        with open(output_file) as f:
+            yield BulkRecord(tokens, command, f.read(), parser_cls, kwargs)
+
+
+def _parse_args(argv=None):
+    my_parser = argparse.ArgumentParser(
+        description='Bulk parse a folder archive of captured cli outputs')
+    my_parser.add_argument('root',
+                           type=pathlib.Path,
+                           help='Root folder of the archive, laid out as '
+                                '<os>/[<token>/]<Class>/cli/equal')
+    my_parser.add_argument('-o',
+                           '--output',
+                           type=str,
+                           help='Result file, defaults to stdout',
+                           default=None)
+    my_parser.add_argument('-f',
+                           '--format',
+                           choices=FORMATS,
+                           help='Result format',
+                           default='jsonl')
+    my_parser.add_argument('-j',
+                           '--processes',
+                           type=int,
+                           help='Number of worker processes, 0 to parse in '
+                                'the main process',
+                           default=None)
+    my_parser.add_argument('-c',
+                           '--chunksize',
+                           type=int,
+                           help='Number of records per worker task',
+                           default=DEFAULT_CHUNK_SIZE)
+    my_parser.add_argument('-b',
+                           '--time-budget',
+                           type=float,
+                           help='Seconds allowed to parse a record',
+                           default=None)
+    return my_parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    records = iter_folder_records(args.root)
+    kwargs = {'processes': args.processes, 'chunksize': args.chunksize,
+              'time_budget': args.time_budget}
+
+    mode = 'wb' if args.format == 'msgpack' else 'w'
+    if args.output:
+        with open(args.output, mode) as fp:
+            summary = bulk_parse(records, fp, fmt=args.format, **kwargs)
+    else:
+        fp = sys.stdout.buffer if args.format == 'msgpack' else sys.stdout
+        summary = bulk_parse(records, fp, fmt=args.format, **kwargs)
+
+    log.info('Parsed {parsed}/{total} records, {errors} errors'.format(
+        **summary))
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -21,6 +21,7 @@ from genie.abstract.package import AbstractTree, DEFAULT_ABSTRACT_ORDER
 from genie.abstract import Lookup
 
 from .extension import ExtendParsers
+from . import string_pool
 
 PARSER_MODULE_NAME = 'genie.libs.parser'
 ENTRY_POINT_NAME = PARSER_MODULE_NAME
@@ -202,6 +203,32 @@ def get_parser_exclude(command, device):
         return []
 
 
+def delegate(parser, parser_cls, **kwargs):
+    '''Parse an output with the cli of another parser, on behalf of a
+       distributor parser.
+
+       The distributor takes the schema of parser_cls, its own parse()
+       validates the result once. Calling parser_cls(device).parse()
+       instead validates the result in the inner parse() and again in the
+       outer one. The inner parser is created once per distributor.
+
+        Args:
+            parser (`MetaParser`): distributor parser
+            parser_cls (`class`): parser of the output
+            kwargs: passed to the cli method of parser_cls
+
+        Returns:
+            parsed output, validated by the parse() of the distributor
+    '''
+    delegates = parser.__dict__.setdefault('_delegates', {})
+    try:
+        inner = delegates[parser_cls]
+    except KeyError:
+        inner = delegates[parser_cls] = parser_cls(parser.device)
+    parser.schema = inner.schema
+    return inner.cli(**kwargs)
+
+
 def get_parser(command, device, fuzzy=False, revision=None, abstract=None, **kwargs):
     '''From a show command and device, return parser class and kwargs if any'''
     global parser_data
@@ -266,8 +293,9 @@ def get_parser(command, device, fuzzy=False, revision=None, abstract=None, **kwa
         # valid_results[0][2] is a dict of parser kwargs
         parser_class = valid_results[0][1]
         parser_kwargs = valid_results[0][2]
-        spec = getfullargspec(parser_class.cli)
-        if 'command' in spec.args:
+        # rest only parsers, such as the bigip ones, have no cli method
+        cli = getattr(parser_class, 'cli', None)
+        if cli is not None and 'command' in getfullargspec(cli).args:
             cmd = valid_results[0][0]
             parser_kwargs['command'] = cmd.format(**parser_kwargs)
         log.debug(f'Parser class: {parser_class} arguments: {parser_kwargs}')
@@ -724,7 +752,13 @@ class Common:
 
                 >>> convert_intf_name(intf='Eth2/1')
         '''
+        name = self._convert_intf_name(intf, os=os, ignore_case=ignore_case)
+        if not string_pool.is_enabled():
+            return name
+        return string_pool.intern(name)
 
+    @classmethod
+    def _convert_intf_name(self, intf, os='generic', ignore_case=False):
         # takes in the words preceding a digit e.g. the Ge in Ge0/0/1
         m = re.search(r'([-a-zA-Z]+)', intf)
         # takes in everything after the first encountered digit, e.g. the 0/0/1 in Ge0/0/1
@@ -1029,6 +1063,60 @@ class Common:
             standard_time = xml_time
         return standard_time
 
+    @classmethod
+    def load_json_output(self, output):
+        '''Load the output of a '| json' command
+
+            Args:
+                output (`str`, `dict`): device output, or already loaded output
+
+            Returns:
+                dict, empty when there is no output
+
+            Raises:
+                JSONDecodeError: output is not json
+
+            example:
+
+                >>> load_json_output(output='{"TABLE_vrf": {...}}')
+                >>> {'TABLE_vrf': {...}}
+        '''
+        if isinstance(output, dict):
+            return output
+        # Remove junk characters returned by the device
+        output = output.replace(']]>]]>', '').strip()
+        if not output:
+            return {}
+        return json.loads(output)
+
+    @classmethod
+    def retrieve_json_rows(self, root, table):
+        '''return the rows of a NX-OS json 'TABLE_x' as a list. The device
+           returns a dict instead of a list when the table has a single row.
+
+            Args:
+
+                root (`dict`): json object holding the table
+                table (`str`): table name, ex. 'TABLE_vrf'. Rows are read
+                               from the matching 'ROW_vrf' key
+
+            Returns:
+                list of row dicts, empty when the table is missing
+
+            example:
+
+                >>> retrieve_json_rows(
+                        root={'TABLE_vrf': {'ROW_vrf': {'vrf-name-out': 'default'}}},
+                        table='TABLE_vrf')
+                >>> [{'vrf-name-out': 'default'}]
+        '''
+        rows = (root.get(table) or {}).get(table.replace('TABLE_', 'ROW_', 1))
+        if rows is None:
+            return []
+        if isinstance(rows, dict):
+            return [rows]
+        return rows
+
     @classmethod
     def find_keys(self, key, dictionary):
         '''
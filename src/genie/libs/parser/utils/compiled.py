@@ -0,0 +1,85 @@
+'''Compiled build of the hottest modules
+
+The lookup core and the heaviest parser modules are compiled with Cython
+from their unchanged python source in the compiled build of the package:
+
+    $ make package_compiled
+
+which runs 'python setup.py bdist_wheel' with GENIE_PARSER_COMPILE=1. The
+wheel ships the compiled extensions next to the python sources, python
+imports the extension of a module when there is one.
+
+    $ make test_compiled
+
+builds the extensions in place and runs the golden outputs against them,
+see tests/compiled_gate.py. 'make clean_compiled' removes them.
+
+The python sources remain importable: with GENIE_PARSER_PURE=1, or after
+prefer_pure(), the modules are imported from their source even when
+compiled. This module is imported before any of the compiled modules, it
+only depends on the standard library.
+'''
+
+# python
+import os
+import sys
+import importlib
+import importlib.util
+import importlib.machinery
+
+# modules of the compiled build
+MODULES = [
+    'genie.libs.parser.utils.common',
+    'genie.libs.parser.iosxe.show_routing',
+    'genie.libs.parser.iosxe.show_bgp',
+    'genie.libs.parser.iosxe.show_interface',
+    'genie.libs.parser.iosxe.show_ospf',
+    'genie.libs.parser.iosxe.show_arp',
+    'genie.libs.parser.iosxe.show_fdb',
+    'genie.libs.parser.iosxe.show_mac_address',
+]
+
+
+def is_compiled(name):
+    '''whether a module is imported from its compiled extension
+
+        Args:
+            name (`str`): module name, imported if needed
+
+        Returns:
+            True when the module is a compiled extension
+    '''
+    module = sys.modules.get(name) or importlib.import_module(name)
+    return (getattr(module, '__file__', None) or '').endswith(
+        tuple(importlib.machinery.EXTENSION_SUFFIXES))
+
+
+def status():
+    '''dict of module name -> whether it is compiled, for the MODULES'''
+    return {name: is_compiled(name) for name in MODULES}
+
+
+class PureFinder(object):
+    '''Finder of the python source of the compiled modules'''
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in MODULES or not path:
+            return None
+        filename = fullname.rpartition('.')[2] + '.py'
+        for entry in path:
+            source = os.path.join(entry, filename)
+            if os.path.isfile(source):
+                return importlib.util.spec_from_file_location(fullname,
+                                                              source)
+        return None
+
+
+def prefer_pure():
+    '''Import the modules not imported yet from their python source'''
+    if not any(isinstance(finder, PureFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, PureFinder())
+
+
+if os.environ.get('GENIE_PARSER_PURE', '').lower() in ('1', 'true', 'yes',
+                                                        'on'):
+    prefer_pure()
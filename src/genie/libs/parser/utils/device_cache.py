@@ -0,0 +1,191 @@
+'''Device scoped cache for auxiliary commands and nested parses
+
+Some parsers run extra commands on top of their own command, eg.
+``ShowBgpSummarySuperParser`` runs ``show run | sec address-family ipv4 vrf``
+and parses ``show vrf``, and the OSPF parsers fetch
+``show running-config | section router ospf {instance}``. Polling such a
+parser for several address families or instances fetches the same outputs
+again and again.
+
+Once a cache is enabled on a device, these auxiliary commands and nested
+parses are served from the cache for ``ttl`` seconds. The cache is opt-in:
+without it, parsers execute every command as before.
+
+Example:
+
+    >>> from genie.libs.parser.utils.device_cache import enable_device_cache
+    >>> cache = enable_device_cache(device, ttl=60)
+    >>> cache.seed('show run | sec address-family ipv4 vrf', output)
+    >>> for af in address_families:
+    ...     device.parse('show ip bgp {} all summary'.format(af))
+    >>> cache.invalidate()      # eg. on a %SYS-5-CONFIG_I event
+'''
+
+# python
+import copy
+import time
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+# attribute of the device holding its cache
+CACHE_ATTRIBUTE = '_genie_device_cache'
+
+DEFAULT_TTL = 60
+
+
+class _RecordingDevice(object):
+    '''Device of a cached parse, records the commands the parse runs'''
+    def __init__(self, device):
+        self._device = device
+        self.commands = set()
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def execute(self, command, *args, **kwargs):
+        self.commands.add(command)
+        return self._device.execute(command, *args, **kwargs)
+
+
+class DeviceCache(object):
+    '''Outputs of auxiliary commands and nested parses of a device, kept for
+    ttl seconds.
+
+        Args:
+            ttl (`int`): seconds an entry is served from the cache, None
+                         keeps entries until invalidated
+    '''
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or expires > time.monotonic():
+                    self.stats['hits'] += 1
+                    return value
+                del self._entries[key]
+            self.stats['misses'] += 1
+            return None
+
+    def _set(self, key, value):
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+
+    @staticmethod
+    def _parse_key(parser_cls, kwargs):
+        return ('parse', '{}.{}'.format(parser_cls.__module__,
+                                        parser_cls.__name__),
+                tuple(sorted(kwargs.items())))
+
+    def execute(self, device, command):
+        '''output of command, executed on device when not cached'''
+        key = ('execute', command)
+        output = self._get(key)
+        if output is None:
+            output = device.execute(command)
+            self._set(key, output)
+        elif isinstance(device, _RecordingDevice):
+            device.commands.add(command)
+        return output
+
+    def parse(self, device, parser_cls, **kwargs):
+        '''parsed output of parser_cls, parsed on device when not cached.
+        A copy is returned so callers can modify it.'''
+        key = self._parse_key(parser_cls, kwargs)
+        entry = self._get(key)
+        if entry is None:
+            # the commands of the parse, to drop it with them
+            recording = _RecordingDevice(device)
+            parsed = parser_cls(device=recording).parse(**kwargs)
+            entry = (parsed, frozenset(recording.commands))
+            self._set(key, entry)
+        if isinstance(device, _RecordingDevice):
+            device.commands.update(entry[1])
+        return copy.deepcopy(entry[0])
+
+    def seed(self, command, output):
+        '''cache an output the caller already has'''
+        self._set(('execute', command), output)
+
+    def seed_parsed(self, parser_cls, parsed, **kwargs):
+        '''cache a parsed output the caller already has, its commands are
+        unknown, only invalidate() without a command drops it'''
+        self._set(self._parse_key(parser_cls, kwargs), (parsed, frozenset()))
+
+    def invalidate(self, command=None):
+        '''Drop cached entries, eg. when the device configuration changed.
+
+            Args:
+                command (`str`): only drop this command and the parses
+                                 which ran it, every entry (commands and
+                                 parses) when not provided
+        '''
+        with self._lock:
+            if command is None:
+                self._entries.clear()
+                return
+            self._entries.pop(('execute', command), None)
+            for key in [key for key, (_, value) in self._entries.items()
+                        if key[0] == 'parse' and command in value[1]]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def enable_device_cache(device, ttl=DEFAULT_TTL, outputs=None):
+    '''Enable the auxiliary command cache of a device.
+
+        Args:
+            device (`Device`): device object
+            ttl (`int`): seconds an entry is served from the cache
+            outputs (`dict`): {command: output} to pre-seed the cache with
+
+        Returns:
+            the device DeviceCache, the existing one when already enabled
+    '''
+    cache = get_device_cache(device)
+    if cache is None:
+        cache = DeviceCache(ttl=ttl)
+        setattr(device, CACHE_ATTRIBUTE, cache)
+    for command, output in (outputs or {}).items():
+        cache.seed(command, output)
+    return cache
+
+
+def disable_device_cache(device):
+    '''Disable and drop the auxiliary command cache of a device'''
+    if get_device_cache(device) is not None:
+        delattr(device, CACHE_ATTRIBUTE)
+
+
+def get_device_cache(device):
+    '''DeviceCache of a device, None when not enabled'''
+    cache = getattr(device, CACHE_ATTRIBUTE, None)
+    return cache if isinstance(cache, DeviceCache) else None
+
+
+def cached_execute(device, command):
+    '''Execute an auxiliary command, served from the device cache when
+    enabled.'''
+    cache = get_device_cache(device)
+    if cache is None:
+        return device.execute(command)
+    return cache.execute(device, command)
+
+
+def cached_parse(device, parser_cls, **kwargs):
+    '''Run a nested parse, served from the device cache when enabled.'''
+    cache = get_device_cache(device)
+    if cache is None:
+        return parser_cls(device=device).parse(**kwargs)
+    return cache.parse(device, parser_cls, **kwargs)
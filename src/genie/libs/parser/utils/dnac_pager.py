@@ -0,0 +1,167 @@
+'''Paginated collection of the DNA Center intent API
+
+The list APIs of DNA Center (/dna/intent/api/v1/interface,
+/dna/intent/api/v1/network-device, ...) return the whole inventory in one
+response unless offset/limit are given. iter_pages requests the pages
+concurrently through the rest connection of the device and yields them as
+they arrive, so a parser can merge each page into its result and drop it:
+
+    >>> from genie.libs.parser.utils.dnac_pager import iter_pages
+    >>> for records in iter_pages(device, '/dna/intent/api/v1/interface',
+    ...                           page_size=500, max_workers=4):
+    ...     merge(records)
+
+The total is not requested beforehand: max_workers pages are kept in flight
+ahead of the last one received, until a page comes back short.
+'''
+
+# python
+import logging
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, \
+    FIRST_COMPLETED
+
+log = logging.getLogger(__name__)
+
+# largest limit accepted by the intent API
+DEFAULT_PAGE_SIZE = 500
+
+# pages in flight, the DNAC API is rate limited per client
+DEFAULT_MAX_WORKERS = 4
+
+# format of the lastUpdated fields
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+
+def get_response(device, path):
+    '''records of the 'response' key of a GET'''
+    return device.get(path).json()['response']
+
+
+def page_path(path, offset, limit):
+    '''path of a page, offset starts at 1'''
+    return '{}{}offset={}&limit={}'.format(path, '&' if '?' in path else '?',
+                                           offset, limit)
+
+
+def timestamp(value):
+    '''lastUpdated value comparable with the ones of the records
+
+        The records have '2019-05-31 16:17:51.735', which sorts as text.
+
+        Args:
+            value (`str` or `datetime`): timestamp
+
+        Returns:
+            str
+    '''
+    if isinstance(value, datetime):
+        return value.strftime(TIMESTAMP_FORMAT)[:-3]
+    return str(value)
+
+
+def iter_pages(device, path, page_size=DEFAULT_PAGE_SIZE,
+               max_workers=DEFAULT_MAX_WORKERS, process=None):
+    '''Yield the records of the pages of a list API as they complete
+
+        Args:
+            device (`Device`): device with a rest connection
+            path (`str`): path of the list API
+            page_size (`int`): records per page (limit)
+            max_workers (`int`): pages requested at once
+            process (`callable`): called in the worker thread with the
+                                  records of a page, its return value is
+                                  yielded instead of the records
+
+        Returns:
+            generator of the records of each non empty page, not in order
+    '''
+    def fetch(offset):
+        records = get_response(device, page_path(path, offset, page_size))
+        return len(records), process(records) if process else records
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {}
+    next_offset = 1
+    # offset of the first short page, the end of the collection
+    end = None
+    try:
+        while True:
+            while end is None and len(pending) < max_workers:
+                pending[executor.submit(fetch, next_offset)] = next_offset
+                next_offset += page_size
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                offset = pending.pop(future)
+                count, result = future.result()
+                if count < page_size:
+                    end = offset if end is None else min(end, offset)
+                if count and (end is None or offset <= end):
+                    yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def map_paths(device, paths, max_workers=DEFAULT_MAX_WORKERS, process=None):
+    '''Yield the records of several GETs as they complete
+
+        Args:
+            device (`Device`): device with a rest connection
+            paths (`list`): paths to get
+            max_workers (`int`): requests at once
+            process (`callable`): called in the worker thread with the
+                                  path and its records, its return value is
+                                  yielded instead of the records
+
+        Returns:
+            generator of the records of each path, not in order
+    '''
+    def fetch(path):
+        records = get_response(device, path)
+        return process(path, records) if process else records
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fetch, path) for path in paths]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+class Lookup(object):
+    '''thread safe memo of a GET per key, eg. hostname of a device id
+
+        Args:
+            device (`Device`): device with a rest connection
+            path (`str`): path with a {key} field
+            field (`str`): field of the response to keep
+    '''
+
+    def __init__(self, device, path, field):
+        self.device = device
+        self.path = path
+        self.field = field
+        self.values = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def __getitem__(self, key):
+        try:
+            return self.values[key]
+        except KeyError:
+            pass
+        # the pages of a device arrive together, get each key once
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self.values:
+                self.values[key] = get_response(
+                    self.device, self.path.format(key=key))[self.field]
+        return self.values[key]
@@ -0,0 +1,411 @@
+'''Fleet wide index of where the endpoints are
+
+Answers "on which device, interface and vlan is this MAC" and "which MAC
+has this IP" for the parsed outputs of every device of a fleet:
+
+    * ShowIpArp / ShowArp                       (show ip arp)
+    * ShowMacAddressTable                       (show mac address-table)
+    * ShowMacAddressTableDynamic                (show mac address-table dynamic)
+    * ShowDeviceTrackingDatabase                (show device-tracking database)
+    * ShowAccessSession                         (show access-session)
+
+    >>> from genie.libs.parser.utils.endpoint_index import EndpointIndex
+    >>> index = EndpointIndex()
+    >>> index.update('switch1', switch1.parse('show mac address-table'))
+    >>> index.update('router1', router1.parse('show ip arp'))
+    >>> index.locate('0050.56ff.1234')
+    [Location(device='switch1', interface='GigabitEthernet1/0/3', vlan=100,
+              source='mac')]
+    >>> index.macs('10.1.2.3')
+    ['0050.56ff.1234']
+
+An output replaces the entries the same device gave for the same source
+before, eg. the latest 'show mac address-table' of switch1 replaces the
+former one but not its 'show device-tracking database' entries.
+
+MACs and IPs are kept as integers, interfaces and vlans are interned, and
+a location is one integer of its (device, source), interface and vlan, so
+that millions of endpoints fit in a few dicts of integers.
+'''
+
+# python
+import re
+import socket
+from array import array
+from collections import namedtuple
+
+Location = namedtuple('Location', ['device', 'interface', 'vlan', 'source'])
+
+# sources of the entries
+SOURCES = ('arp', 'mac', 'device_tracking', 'access_session')
+
+# Vlan100
+VLAN_INTERFACE = re.compile(r'^Vlan(?P<vlan>\d+)$', re.I)
+
+# aabb.cc00.0100   aa:bb:cc:00:01:00   aa-bb-cc-00-01-00
+MAC_SEPARATORS = str.maketrans('', '', '.:-')
+
+# bits of the fields of a location
+VLAN_BITS = 20
+INTERFACE_BITS = 24
+
+# ipv6 keys start above the ipv4 ones
+IPV6 = 1 << 128
+
+# bits of a MAC
+MAC_BITS = 48
+
+
+def _mac(mac):
+    '''MAC as an integer, None when it is not a MAC, eg. Incomplete'''
+    digits = mac.translate(MAC_SEPARATORS)
+    if len(digits) != 12:
+        return None
+    try:
+        return int(digits, 16)
+    except ValueError:
+        return None
+
+
+def _format_mac(value):
+    digits = '{:012x}'.format(value)
+    return '{}.{}.{}'.format(digits[:4], digits[4:8], digits[8:])
+
+
+def _ip(address):
+    '''IP as an integer, None when it is not an IP'''
+    try:
+        if ':' in address:
+            return IPV6 | int.from_bytes(
+                socket.inet_pton(socket.AF_INET6, address), 'big')
+        if address.count('.') == 3:
+            return int.from_bytes(socket.inet_aton(address), 'big')
+    except OSError:
+        pass
+    return None
+
+
+def _vlan(vlan):
+    '''100 and '100' are the same vlan, 'all' or '-' are kept'''
+    if isinstance(vlan, str) and vlan.isdigit():
+        return int(vlan)
+    return vlan
+
+
+def _arp_entries(parsed):
+    for interface, interface_dict in parsed.get('interfaces', {}).items():
+        m = VLAN_INTERFACE.match(interface)
+        vlan = int(m.group('vlan')) if m else None
+        neighbors = interface_dict.get('ipv4', {}).get('neighbors', {})
+        for ip, neighbor in neighbors.items():
+            yield (neighbor.get('link_layer_address'),
+                   neighbor.get('physical_interface', interface),
+                   vlan, neighbor.get('ip', ip))
+    for ip, entry in parsed.get('global_static_table', {}).items():
+        yield entry.get('mac_address'), None, None, entry.get('ip_address',
+                                                              ip)
+
+
+def _mac_entries(parsed):
+    vlans = parsed.get('mac_table', {}).get('vlans', {})
+    for vlan, vlan_dict in vlans.items():
+        vlan = _vlan(vlan_dict.get('vlan', vlan))
+        for mac, mac_dict in vlan_dict.get('mac_addresses', {}).items():
+            for interface in mac_dict.get('interfaces', {}):
+                yield mac, interface, vlan, None
+    for port in parsed.get('ports', {}).values():
+        yield port['mac-address'], port['port'], _vlan(port['vlan-id']), None
+
+
+def _device_tracking_entries(parsed):
+    for entry in parsed.get('device', {}).values():
+        yield (entry['link_layer_address'], entry['interface'],
+               entry['vlan_id'], entry['network_layer_address'])
+
+
+def _access_session_entries(parsed):
+    for interface, interface_dict in parsed.get('interfaces', {}).items():
+        for client in interface_dict.get('client', {}):
+            yield client, interface, None, None
+
+
+ENTRIES = {'arp': _arp_entries,
+           'mac': _mac_entries,
+           'device_tracking': _device_tracking_entries,
+           'access_session': _access_session_entries}
+
+
+def source_of(parsed):
+    '''Source of a parsed output, see SOURCES
+
+        Args:
+            parsed (`dict`): output of one of the supported parsers
+
+        Returns:
+            source (`str`)
+
+        Raises:
+            ValueError: the output is not one of the supported parsers
+    '''
+    if 'mac_table' in parsed or 'ports' in parsed:
+        return 'mac'
+    if 'device' in parsed:
+        return 'device_tracking'
+    if 'session_count' in parsed:
+        return 'access_session'
+    if 'global_static_table' in parsed:
+        return 'arp'
+    for interface_dict in parsed.get('interfaces', {}).values():
+        return 'access_session' if 'client' in interface_dict else 'arp'
+    if 'interfaces' in parsed or 'statistics' in parsed:
+        return 'arp'
+    raise ValueError('Unsupported parsed output, keys {}'.format(
+        sorted(parsed)[:5]))
+
+
+def _add(mapping, key, value):
+    '''add a value to a key of values, a single one is not in a list'''
+    current = mapping.get(key)
+    if current is None:
+        mapping[key] = value
+    elif type(current) is list:
+        current.append(value)
+    else:
+        mapping[key] = [current, value]
+
+
+def _discard(mapping, key, value):
+    current = mapping[key]
+    if type(current) is not list:
+        del mapping[key]
+        return
+    current.remove(value)
+    if len(current) == 1:
+        mapping[key] = current[0]
+
+
+def _values(mapping, key):
+    current = mapping.get(key)
+    if current is None:
+        return ()
+    return current if type(current) is list else (current,)
+
+
+class _Segment(object):
+    '''entries of one (device, source)'''
+
+    __slots__ = ('device', 'source', 'macs', 'locations', 'ips', 'ip_macs')
+
+    def __init__(self, device, source):
+        self.device = device
+        self.source = source
+        self.macs = array('Q')
+        self.locations = array('Q')
+        self.ips = []
+        self.ip_macs = array('Q')
+
+
+class EndpointIndex(object):
+    '''Index of MAC locations and IP to MAC bindings of a fleet
+
+    Each update replaces the entries of its (device, source).
+
+        Attributes:
+            devices (`list`): devices with entries in the index
+    '''
+
+    def __init__(self):
+        # MAC -> location or list of locations
+        self._locations = {}
+        # IP -> segment << MAC_BITS | MAC, or a list of them
+        self._bindings = {}
+        # (device, source) -> segment id, segment id -> _Segment
+        self._segment_ids = {}
+        self._segments = []
+        self._free = []
+        # interned interfaces and vlans
+        self._interfaces = []
+        self._interface_ids = {}
+        self._vlans = []
+        self._vlan_ids = {}
+
+    def __len__(self):
+        '''number of MACs with a location'''
+        return len(self._locations)
+
+    @property
+    def devices(self):
+        return sorted({segment.device for segment in self._segments
+                       if segment is not None})
+
+    def _intern(self, value, values, ids, bits):
+        try:
+            return ids[value]
+        except KeyError:
+            if len(values) >= 1 << bits:
+                raise ValueError('More than {} distinct values'.format(
+                    1 << bits))
+            ids[value] = len(values)
+            values.append(value)
+            return ids[value]
+
+    def update(self, device, parsed, source=None):
+        '''Replace the entries of a device with those of a parsed output
+
+            Args:
+                device (`str`): name of the device
+                parsed (`dict`): output of one of the supported parsers
+                source (`str`): one of SOURCES, found from the output when
+                                not given
+
+            Returns:
+                (added, removed) numbers of entries
+        '''
+        source = source or source_of(parsed)
+        return self.update_entries(device, source, ENTRIES[source](parsed))
+
+    def update_entries(self, device, source, entries):
+        '''Replace the entries of a (device, source)
+
+            Args:
+                device (`str`): name of the device
+                source (`str`): one of SOURCES, or any name
+                entries (`iterable`): (mac, interface, vlan, ip) of the
+                                      device, interface, vlan and ip may be
+                                      None. Entries without a valid MAC are
+                                      skipped.
+
+            Returns:
+                (added, removed) numbers of entries
+        '''
+        key = (device, source)
+        segment_id = self._segment_ids.get(key)
+        if segment_id is None:
+            segment_id = self._free.pop() if self._free else \
+                len(self._segments)
+            if segment_id == len(self._segments):
+                self._segments.append(None)
+            self._segment_ids[key] = segment_id
+            old = _Segment(device, source)
+        else:
+            old = self._segments[segment_id]
+
+        interfaces, interface_ids = self._interfaces, self._interface_ids
+        vlans, vlan_ids = self._vlans, self._vlan_ids
+        # (MAC, interface << VLAN_BITS | vlan) and (IP, MAC) of the segment,
+        # in the order of the output
+        locations, bindings = {}, {}
+        for mac, interface, vlan, ip in entries:
+            mac = _mac(mac) if mac else None
+            if mac is None:
+                continue
+            try:
+                interface_id = interface_ids[interface]
+            except KeyError:
+                interface_id = self._intern(interface, interfaces,
+                                            interface_ids, INTERFACE_BITS)
+            try:
+                vlan_id = vlan_ids[vlan]
+            except KeyError:
+                vlan_id = self._intern(vlan, vlans, vlan_ids, VLAN_BITS)
+            locations[(mac, (interface_id << VLAN_BITS) | vlan_id)] = None
+            if ip:
+                ip = _ip(ip)
+                if ip is not None:
+                    bindings[(ip, mac)] = None
+
+        segment = _Segment(device, source)
+        if locations:
+            macs, packed = zip(*locations)
+            segment.macs.extend(macs)
+            segment.locations.extend(packed)
+        if bindings:
+            ips, macs = zip(*bindings)
+            segment.ips = list(ips)
+            segment.ip_macs.extend(macs)
+
+        # only the entries which changed are moved, the values of the
+        # index carry the segment in their upper bits
+        added = removed = 0
+        for new_pairs, old_pairs, mapping, segment_bits in (
+                (locations, zip(old.macs, old.locations), self._locations,
+                 segment_id << (INTERFACE_BITS + VLAN_BITS)),
+                (bindings, zip(old.ips, old.ip_macs), self._bindings,
+                 segment_id << MAC_BITS)):
+            old_pairs = set(old_pairs)
+            for pair in old_pairs.difference(new_pairs):
+                _discard(mapping, pair[0], segment_bits | pair[1])
+                removed += 1
+            for pair in new_pairs:
+                if pair not in old_pairs:
+                    _add(mapping, pair[0], segment_bits | pair[1])
+                    added += 1
+
+        if locations or bindings:
+            self._segments[segment_id] = segment
+        else:
+            self._segments[segment_id] = None
+            del self._segment_ids[key]
+            self._free.append(segment_id)
+        return added, removed
+
+    def remove(self, device, source=None):
+        '''Remove the entries of a device, or of one of its sources
+
+            Returns:
+                number of entries removed
+        '''
+        removed = 0
+        for key in list(self._segment_ids):
+            if key[0] == device and source in (None, key[1]):
+                removed += self.update_entries(device, key[1], ())[1]
+        return removed
+
+    def _location(self, location):
+        vlan = location & ((1 << VLAN_BITS) - 1)
+        location >>= VLAN_BITS
+        interface = location & ((1 << INTERFACE_BITS) - 1)
+        segment = self._segments[location >> INTERFACE_BITS]
+        return Location(segment.device, self._interfaces[interface],
+                        self._vlans[vlan], segment.source)
+
+    def locate(self, mac):
+        '''Locations of a MAC
+
+            Args:
+                mac (`str`): MAC, in any of the usual notations
+
+            Returns:
+                list of Location
+        '''
+        value = _mac(mac)
+        if value is None:
+            raise ValueError("Invalid MAC '{}'".format(mac))
+        return [self._location(location)
+                for location in _values(self._locations, value)]
+
+    def macs(self, ip):
+        '''MACs bound to an IP, in the notation of the cisco outputs
+
+            Args:
+                ip (`str`): ipv4 or ipv6 address
+
+            Returns:
+                sorted list of MACs
+        '''
+        value = _ip(ip)
+        if value is None:
+            raise ValueError("Invalid IP '{}'".format(ip))
+        mask = (1 << MAC_BITS) - 1
+        return sorted({_format_mac(binding & mask)
+                       for binding in _values(self._bindings, value)})
+
+    def locate_ip(self, ip):
+        '''Locations of the MACs bound to an IP, see locate'''
+        return [location for mac in self.macs(ip)
+                for location in self.locate(mac)]
+
+    def __repr__(self):
+        return '<{} {} MACs, {} IPs, {} devices>'.format(
+            self.__class__.__name__, len(self._locations),
+            len(self._bindings), len(self.devices))
@@ -0,0 +1,207 @@
+'''Single pass fingerprinting of device outputs
+
+A Fingerprinter classifies the output of a command (show version) with an
+ordered list of rules, each a pattern with a handler filling the result. The
+patterns are joined into one alternation, so a line is tested against all the
+rules in one match call and the first rule matching wins, as an if/continue
+chain over the patterns would. The scan stops as soon as the fields of the
+detected os are final, set by rules no later line of the output overrides.
+
+Every matched rule adds its weight to the os it hints at, giving a confidence
+for the os and the fields:
+
+    >>> from genie.libs.parser.utils.fingerprint import fingerprint
+    >>> fingerprint(show_version_output)
+    {'os': 'iosxe', 'version': '17.3.1a', 'platform': 'cat9k', ...
+     'confidence': {'os': 1.0, 'version': 1.0, ...}}
+
+fingerprint_many fingerprints captured outputs over a process pool, for fleet
+onboarding.
+'''
+
+# python
+import re
+import logging
+from itertools import repeat
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+log = logging.getLogger(__name__)
+
+# name, compiled pattern, handler(group, ret_dict) filling the result, os the
+# rule hints at (None for any), weight of the hint and of the fields it sets,
+# fields set by the rule which no later line overrides
+Rule = namedtuple('Rule', ['name', 'pattern', 'handler', 'os', 'weight',
+                           'final'])
+
+# fields resolved before the scan can stop
+DEFAULT_FIELDS = ('os', 'version', 'platform', 'pid')
+
+# outputs sent to a worker process in a single task
+DEFAULT_CHUNK_SIZE = 256
+
+_GROUP = re.compile(r'\(\?P<(\w+)>')
+
+
+class Fingerprinter(object):
+    '''Multi pattern classifier scanning an output once
+
+        Args:
+            rules (`list`): Rule in order of precedence
+            fields (`dict`): os -> fields resolved before the scan can stop,
+                             DEFAULT_FIELDS for the others
+    '''
+
+    def __init__(self, rules, fields=None):
+        self.rules = list(rules)
+        self.fields = fields or {}
+
+        branches = []
+        self._groups = []
+        for index, rule in enumerate(self.rules):
+            pattern = rule.pattern.pattern \
+                if hasattr(rule.pattern, 'pattern') else rule.pattern
+            # group names are unique per branch
+            prefix = '_{}_'.format(index)
+            branches.append('(?P<_{}>{})'.format(
+                index, _GROUP.sub(r'(?P<{}\1>'.format(prefix), pattern)))
+            self._groups.append([(prefix + name, name) for name in
+                                 _GROUP.findall(pattern)])
+        self.pattern = re.compile('|'.join(branches))
+
+    def _resolved(self, ret_dict, final):
+        os_name = ret_dict.get('os')
+        return os_name is not None and \
+            final.issuperset(self.fields.get(os_name, DEFAULT_FIELDS))
+
+    def scan(self, output, early_stop=True):
+        '''Fill the fields of an output
+
+            Args:
+                output (`str`): output to classify
+                early_stop (`bool`): stop once the fields are final
+
+            Returns:
+                (ret_dict, list of the matched rules, dict of field -> rule
+                 which set it last)
+        '''
+        ret_dict = {}
+        matched = []
+        setters = {}
+        final = set()
+        match = self.pattern.match
+        for line in output.splitlines():
+            m = match(line.strip())
+            if not m:
+                continue
+            index = int(m.lastgroup[1:])
+            rule = self.rules[index]
+            group = {name: m.group(branch_name)
+                     for branch_name, name in self._groups[index]}
+            before = dict(ret_dict)
+            rule.handler(group, ret_dict)
+            matched.append(rule)
+            for field, value in ret_dict.items():
+                if before.get(field) != value:
+                    setters[field] = rule
+
+            if early_stop and rule.final:
+                final.update(field for field in rule.final
+                             if field in ret_dict)
+                if self._resolved(ret_dict, final):
+                    break
+        return ret_dict, matched, setters
+
+    def fingerprint(self, output, early_stop=True):
+        '''Fields of an output with their confidence
+
+            The confidence of a field is the weight of the rule which set
+            it, the one of the os its share of the weights of the matched
+            rules.
+
+            Args:
+                output (`str`): output to classify
+                early_stop (`bool`): stop once the fields are final
+
+            Returns:
+                dict of the fields, 'confidence' (field -> 0..1) and
+                'scores' (os -> share of the evidence)
+        '''
+        ret_dict, matched, setters = self.scan(output, early_stop=early_stop)
+
+        scores = {}
+        for rule in matched:
+            if rule.os:
+                scores[rule.os] = scores.get(rule.os, 0) + rule.weight
+        total = sum(scores.values())
+        scores = {os_name: round(score / total, 3)
+                  for os_name, score in scores.items()}
+
+        confidence = {field: rule.weight for field, rule in setters.items()}
+        if 'os' in ret_dict:
+            confidence['os'] = scores.get(ret_dict['os'], 0)
+
+        ret_dict['confidence'] = confidence
+        ret_dict['scores'] = scores
+        return ret_dict
+
+
+_show_version = None
+
+
+def show_version_fingerprinter():
+    '''Fingerprinter of the rules of the generic ShowVersion parser'''
+    global _show_version
+    if _show_version is None:
+        from genie.libs.parser.generic.show_platform import \
+            SHOW_VERSION_RULES, SHOW_VERSION_FIELDS
+        _show_version = Fingerprinter(SHOW_VERSION_RULES,
+                                      SHOW_VERSION_FIELDS)
+    return _show_version
+
+
+def fingerprint(output, early_stop=True):
+    '''Fingerprint a show version output, see Fingerprinter.fingerprint'''
+    return show_version_fingerprinter().fingerprint(output,
+                                                    early_stop=early_stop)
+
+
+def _fingerprint_chunk(outputs, early_stop):
+    fingerprinter = show_version_fingerprinter()
+    results = []
+    for output in outputs:
+        try:
+            results.append(fingerprinter.fingerprint(output, early_stop))
+        except Exception as e:
+            results.append({'error': {'type': e.__class__.__name__,
+                                      'message': str(e)}})
+    return results
+
+
+def fingerprint_many(outputs, processes=None, chunksize=DEFAULT_CHUNK_SIZE,
+                     early_stop=True):
+    '''Fingerprint show version outputs over a process pool
+
+        Args:
+            outputs (`iterable`): show version outputs
+            processes (`int`): number of worker processes. Defaults to the
+                               number of cpus. 0 fingerprints in this process
+            chunksize (`int`): number of outputs per worker task
+            early_stop (`bool`): stop each scan once the fields are final
+
+        Returns:
+            generator of the fingerprints, in the order of the outputs
+    '''
+    outputs = iter(outputs)
+    chunks = iter(lambda: [output for _, output in
+                           zip(range(chunksize), outputs)], [])
+
+    if processes == 0:
+        for chunk in chunks:
+            yield from _fingerprint_chunk(chunk, early_stop)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for results in executor.map(_fingerprint_chunk, chunks,
+                                    repeat(early_stop)):
+            yield from results
@@ -0,0 +1,335 @@
+'''Junos structured output ('| display json', '| display xml')
+
+Junos renders every operational command from XML, and the schemas of the
+junos parsers mirror its tag names ('route-table', 'rt-destination',
+'@junos:seconds', ...). The structured output of a command therefore maps
+onto the parser schema without any regular expression:
+
+    >>> tree = load_display_json(device.execute('show route | display json'))
+    >>> parsed = fit_to_schema(tree, ShowRoute.schema)
+
+Parsers get the 'json' and 'xml' contexts from StructuredOutputMixin:
+
+    >>> ShowRoute(device=device, context='json').parse()
+
+Both loaders return the same tree: every element is a list (several
+elements can share a tag), leaves are str, or a dict holding '#text' and the
+'@<attribute>' values when the leaf has attributes. fit_to_schema then
+keeps the keys the schema knows, turns single element lists into dicts
+where the schema expects a dict and leaves into str.
+'''
+
+# python
+import io
+import re
+import json
+import xml.etree.ElementTree as ET
+
+# metaparser
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, \
+    ListOf, Or
+
+# root element of '| display xml'
+RPC_REPLY = 'rpc-reply'
+
+
+def _as_list(value):
+    return value if isinstance(value, list) else [value]
+
+
+def load_display_json(output):
+    '''Load the output of a '| display json' command
+
+        Args:
+            output (`str`, `dict`): device output, or already loaded output
+
+        Returns:
+            tree of the elements, empty dict when there is no output
+
+        example:
+
+            >>> load_display_json('{"route-information": [{"route-table": '
+                                  '[{"table-name": [{"data": "inet.0"}]}]}]}')
+            >>> {'route-information': [{'route-table': [{'table-name': ['inet.0']}]}]}
+    '''
+    if isinstance(output, str):
+        output = output.replace(']]>]]>', '').strip()
+        if not output:
+            return {}
+        output = json.loads(output[output.index('{'):])
+    return {tag: [_json_element(element) for element in _as_list(elements)]
+            for tag, elements in output.items()}
+
+
+def _json_element(element):
+    # {"data": "3w3d 03:12:24", "attributes": {"junos:seconds": "1998744"}}
+    attributes = {'@' + key: str(value)
+                  for key, value in element.get('attributes', {}).items()}
+    if 'data' in element:
+        # empty elements are rendered as {"data": [null]}
+        text = element['data']
+        if isinstance(text, list):
+            text = ''.join(str(item) for item in text if item is not None)
+        text = '' if text is None else str(text)
+        if attributes:
+            attributes['#text'] = text
+            return attributes
+        return text
+
+    node = attributes
+    for tag, children in element.items():
+        if tag != 'attributes':
+            node[tag] = [_json_element(child) for child in _as_list(children)]
+    return node
+
+
+def load_display_xml(output):
+    '''Load the output of a '| display xml' command.
+
+    The output is streamed through iterparse and every element is released
+    once converted, so large outputs (eg. a full RIB) are not held twice in
+    memory. The 'rpc-reply' root is unwrapped, its namespace declarations
+    are kept as '@xmlns:<prefix>' keys.
+
+        Args:
+            output (`str`): device output
+
+        Returns:
+            tree of the elements, same format as load_display_json
+
+        example:
+
+            >>> load_display_xml('<rpc-reply><route-information><route-table>'
+                                 '<table-name>inet.0</table-name>'
+                                 '</route-table></route-information></rpc-reply>')
+            >>> {'route-information': [{'route-table': [{'table-name': ['inet.0']}]}]}
+    '''
+    output = output.replace(']]>]]>', '').strip()
+    if '<' not in output:
+        return {}
+    # drop the echoed command and the prompt around the document
+    output = output[output.index('<'):output.rindex('>') + 1]
+
+    prefixes = {}
+    declarations = []
+    stack = [{}]
+    for event, item in ET.iterparse(io.StringIO(output),
+                                    events=('start-ns', 'start', 'end')):
+        if event == 'start-ns':
+            prefix, uri = item
+            prefixes.setdefault(uri, prefix)
+            declarations.append(item)
+        elif event == 'start':
+            node = {}
+            for prefix, uri in declarations:
+                node['@xmlns:' + prefix if prefix else '@xmlns'] = uri
+            declarations = []
+            for key, value in item.attrib.items():
+                node['@' + _xml_name(key, prefixes)] = value
+            stack.append(node)
+        else:
+            node = stack.pop()
+            if any(not key.startswith('@') for key in node):
+                value = node
+            else:
+                text = (item.text or '').strip()
+                if not node:
+                    value = text
+                else:
+                    # <admin-status junos:format="Enabled"/>
+                    if text:
+                        node['#text'] = text
+                    value = node
+            stack[-1].setdefault(_xml_name(item.tag), []).append(value)
+            item.clear()
+
+    tree = stack[0]
+    if RPC_REPLY in tree:
+        tree = tree[RPC_REPLY][0]
+        if not isinstance(tree, dict):
+            return {}
+    return tree
+
+
+def _xml_name(name, prefixes=None):
+    # {http://xml.juniper.net/junos/18.2R1/junos}seconds -> junos:seconds
+    if not name.startswith('{'):
+        return name
+    uri, name = name[1:].split('}', 1)
+    prefix = (prefixes or {}).get(uri)
+    return '{}:{}'.format(prefix, name) if prefix else name
+
+
+def fit_to_schema(data, schema):
+    '''Shape a structured output tree as described by a parser schema.
+
+    Keys unknown to the schema are dropped, single elements become dicts
+    where the schema expects a dict, lists where it expects a list, and
+    leaves are converted to the schema type (repeated str leaves are joined
+    with a space, empty elements are True for bool).
+
+    The schema is walked once and compiled into nested functions, which are
+    kept for the next outputs fitted to the same schema.
+
+        Args:
+            data: tree returned by load_display_json or load_display_xml
+            schema: parser schema, or part of it
+
+        Returns:
+            data fitted to the schema
+    '''
+    return _get_fitter(schema)(data)
+
+
+# id(schema) -> (schema, fitter), the schema is kept so its id is not reused
+_fitters = {}
+
+
+def _get_fitter(schema):
+    cached = _fitters.get(id(schema))
+    if cached is None:
+        cached = _fitters[id(schema)] = (schema, _compile(schema))
+    return cached[1]
+
+
+def _compile(schema):
+    if type(schema) is Schema:
+        # Schema({...}) parts of a schema
+        schema = schema.schema
+    if isinstance(schema, ListOf):
+        return _compile_list(_compile(schema.schema))
+    if isinstance(schema, list):
+        return _compile_list(_compile(schema[0]) if schema else _leaf)
+    if isinstance(schema, Or):
+        return _compile_or(schema.schemas)
+    if isinstance(schema, dict):
+        return _compile_dict(schema)
+
+    # leaf
+    if schema is list:
+        return _compile_list(_leaf)
+    if schema is bool:
+        return lambda data: True
+    if schema is int:
+        return lambda data: int(_leaf(data))
+    return _fit_str
+
+
+def _compile_list(fit_item):
+    def fit(data):
+        if not isinstance(data, list):
+            data = [data]
+        return [fit_item(item) for item in data]
+    return fit
+
+
+def _compile_or(schemas):
+    # Or(str, ListOf(...)): the list schema for several elements
+    single = many = None
+    for schema in schemas:
+        if isinstance(schema, (ListOf, list)):
+            many = many or _compile(schema)
+        else:
+            single = single or _compile(schema)
+    single = single or many
+    many = many or single
+
+    def fit(data):
+        if isinstance(data, list) and len(data) > 1:
+            return many(data)
+        return single(data)
+    return fit
+
+
+def _compile_dict(schema):
+    fields = []
+    fit_any = None
+    for key, value in schema.items():
+        if isinstance(key, Any):
+            fit_any = _compile(value)
+        else:
+            name = key.schema if isinstance(key, Optional) else key
+            fields.append((name, _compile(value)))
+
+    def fit(data):
+        if isinstance(data, list):
+            data = data[0] if data else {}
+        if isinstance(data, str):
+            # leaf without attributes, where the schema allows some
+            data = {'#text': data}
+
+        fitted = {}
+        for name, fit_value in fields:
+            if name in data:
+                fitted[name] = fit_value(data[name])
+        if fit_any is not None:
+            for name, value in data.items():
+                if name not in fitted:
+                    fitted[name] = fit_any(value)
+        return fitted
+    return fit
+
+
+def _fit_str(data):
+    if isinstance(data, list):
+        if len(data) == 1:
+            return _leaf(data[0])
+        return ' '.join(_leaf(item) for item in data)
+    return _leaf(data)
+
+
+def _leaf(value):
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    if isinstance(value, dict):
+        return value.get('#text', '')
+    return value
+
+
+class StructuredOutputMixin(object):
+    '''json and xml methods for the junos parsers
+
+    _get_command returns the cli command for the parse() arguments, by
+    default the cli_command whose fields are the arguments given. Parsers
+    override it where the arguments do not map one to one to the fields of
+    a command. '| display json' or '| display xml' is inserted ahead of the
+    pipes of the command, if any, and the output is fitted to the parser
+    schema. _fit_structured can be overridden where the cli
+    parsing shapes the data differently.
+    '''
+
+    # '| display json' output is parsed with context='json'
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+    def _get_command(self, **kwargs):
+        arguments = {key: value for key, value in kwargs.items()
+                     if value not in (None, '')}
+        commands = self.cli_command
+        if isinstance(commands, str):
+            commands = [commands]
+        for command in commands:
+            if set(re.findall(r'{(\w+)}', command)) == set(arguments):
+                return command.format(**arguments)
+        raise TypeError("{} has no command for the arguments {}".format(
+            self.__class__.__name__, ', '.join(sorted(arguments)) or 'none'))
+
+    def _get_display_command(self, display, **kwargs):
+        # show route protocol ospf 10.0.0.1 | display json | no-more
+        command, pipe, pipes = self._get_command(**kwargs).partition(' | ')
+        return '{} | display {}{}{}'.format(command, display, pipe, pipes)
+
+    def json(self, output=None, **kwargs):
+        if output is None:
+            output = self.device.execute(
+                self._get_display_command('json', **kwargs))
+        return self._fit_structured(load_display_json(output))
+
+    def xml(self, output=None, **kwargs):
+        if output is None:
+            output = self.device.execute(
+                self._get_display_command('xml', **kwargs))
+        return self._fit_structured(load_display_xml(output))
+
+    def _fit_structured(self, tree):
+        return fit_to_schema(tree, self.schema)
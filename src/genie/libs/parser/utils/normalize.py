@@ -0,0 +1,371 @@
+'''Typed values of the durations, rates and counters of the parser results
+
+Parsers keep the durations, rates and some counters as the device prints
+them, eg. '3w3d', '1d15h', '06:46:59', 'BW 768 Kbit/sec' or a route
+metric '20'. The converters of this module turn them into integers, and
+remember the strings they already converted, a result repeating the same
+ages and rates for thousands of entries converts each one once:
+
+    >>> from genie.libs.parser.utils.normalize import to_seconds, to_bps
+    >>> to_seconds('1w2d'), to_seconds('1d 02:03:04'), to_seconds('PT1H4M41S')
+    (777600, 93784, 3881)
+    >>> to_bps('BW 768 Kbit/sec'), to_bps('10Gbps'), to_bps('1000M')
+    (768000, 10000000000, 1000000000)
+
+Nothing changes the parser results unless asked for, parse() and
+normalize_result() add the converted values of the known fields of the
+parser family alongside the strings, under the name of the field and the
+unit:
+
+    >>> from genie.libs.parser.utils import normalize
+    >>> parsed = normalize.parse(ShowIpRoute(device=device))
+    >>> route['updated'], route['updated_seconds']
+    ('1w2d', 777600)
+    >>> normalize.normalize_result(ShowIpRoute, device.parse('show ip route'))
+
+The converters return None for the values without a number, eg. 'never'
+or '-', no typed field is added for those.
+'''
+
+# python
+import re
+import functools
+
+# strings remembered by each converter
+NORMALIZE_CACHE_SIZE = 65536
+
+UNIT_SECONDS = {
+    'y': 365 * 86400, 'year': 365 * 86400,
+    'w': 7 * 86400, 'week': 7 * 86400,
+    'd': 86400, 'day': 86400,
+    'h': 3600, 'hr': 3600, 'hour': 3600,
+    'm': 60, 'mn': 60, 'min': 60, 'minute': 60,
+    's': 1, 'sec': 1, 'second': 1,
+}
+
+# 1w2d   1d15h   2 days, 3 hours   10330mn   5s
+DURATION_UNITS = re.compile(
+    r'(?P<value>\d+)\s*(?P<unit>years?|weeks?|days?|hours?|hrs?|minutes?|'
+    r'mins?|mn|seconds?|secs?|[ywdhms])(?![a-z])[\s,]*(?:and\s+)?')
+
+# 06:46:59   1:02 (mm:ss)   00:00:01.5
+DURATION_CLOCK = re.compile(
+    r'(?P<first>\d+):(?P<second>\d{1,2})(?::(?P<third>\d{1,2}))?'
+    r'(?P<fraction>\.\d+)?$')
+
+# P4DT12M38S   PT1H4M41S
+DURATION_XML = re.compile(
+    r'^P(?:(?P<d>\d+)D)?T?(?:(?P<h>\d+)H)?(?:(?P<m>\d+)M)?(?:(?P<s>\d+)S)?$')
+
+UNIT_BPS = {'': 1, 'k': 10 ** 3, 'm': 10 ** 6, 'g': 10 ** 9, 't': 10 ** 12}
+
+# BW 768 Kbit/sec   10Gbps   1000 Mb/s   100 kbps   2000 bits/sec
+RATE = re.compile(
+    r'^(?:bw\s+|speed:?\s+)?(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>[kmgt]?)'
+    r'(?P<suffix>bps|bits?/sec|bits?/s|b/s|bits?|b)?$')
+
+
+def _duration(text):
+    seconds, position, fraction = 0, 0, None
+    for m in DURATION_UNITS.finditer(text):
+        if m.start() != position:
+            break
+        unit = m.group('unit').rstrip('s') if len(m.group('unit')) > 2 \
+            else m.group('unit')
+        seconds += int(m.group('value')) * UNIT_SECONDS[unit]
+        position = m.end()
+    rest = text[position:]
+    if rest:
+        m = DURATION_CLOCK.match(rest)
+        if not m:
+            return None
+        first, second, third = m.group('first', 'second', 'third')
+        if third is None:
+            # mm:ss
+            seconds += int(first) * 60 + int(second)
+        else:
+            seconds += int(first) * 3600 + int(second) * 60 + int(third)
+        fraction = m.group('fraction')
+    elif not position:
+        return None
+    return seconds + float(fraction) if fraction else seconds
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def to_seconds(value):
+    '''Seconds of a Cisco or Junos duration
+
+        Args:
+            value (`str`): '1w2d', '1d15h', '06:46:59', '1:02' (mm:ss),
+                           '1d 02:03:04', '2 days, 3 hours', '10330mn',
+                           'PT1H4M41S'
+
+        Returns:
+            seconds (`int`), a float for fractions of seconds, None when the
+            value is not a duration, eg. 'never'
+
+        example:
+
+            >>> to_seconds('1d15h')
+            140400
+    '''
+    text = value.strip().lower()
+    if text.endswith(' ago'):
+        text = text[:-4]
+    if text.startswith('p'):
+        m = DURATION_XML.match(text.upper())
+        if not m or not any(m.groups()):
+            return None
+        return sum(int(m.group(unit) or 0) * UNIT_SECONDS[unit]
+                   for unit in 'dhms')
+    return _duration(text)
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def to_bps(value):
+    '''Bits per second of a bandwidth or a rate
+
+        Args:
+            value (`str`): 'BW 768 Kbit/sec', '10Gbps', '1000 Mb/s',
+                           '2000 bits/sec', '1.5 Mbit'
+
+        Returns:
+            bits per second (`int`), None when the value is not a rate with
+            a unit, eg. 'auto' or '1000'
+
+        example:
+
+            >>> to_bps('BW 768 Kbit/sec')
+            768000
+    '''
+    m = RATE.match(value.strip().lower())
+    # a number without unit, eg. a port speed '1000', is not known to be bps
+    if not m or not (m.group('unit') or m.group('suffix')):
+        return None
+    number = m.group('value')
+    scale = UNIT_BPS[m.group('unit')]
+    if '.' in number:
+        return int(round(float(number) * scale))
+    return int(number) * scale
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def to_int(value):
+    '''Integer of a counter kept as a string
+
+        Args:
+            value (`str`): '20', '1,234,567', ' 42 '
+
+        Returns:
+            value (`int`), None when the value is not a counter, eg. 'N/A'
+
+        example:
+
+            >>> to_int('1,234,567')
+            1234567
+    '''
+    text = value.strip().replace(',', '')
+    if text.isdigit():
+        return int(text)
+    if text[:1] == '-' and text[1:].isdigit():
+        return int(text)
+    return None
+
+
+def to_seconds_from_minutes(value):
+    '''Seconds of the ages printed in minutes, eg. the '139' of the iosxe
+    show arp
+
+        Args:
+            value (`str`): minutes
+
+        Returns:
+            seconds (`int`), None for the values without a number
+    '''
+    minutes = to_int(value)
+    return None if minutes is None else minutes * 60
+
+
+CONVERTERS = {
+    'seconds': (to_seconds, 'seconds'),
+    'minutes': (to_seconds_from_minutes, 'seconds'),
+    'bps': (to_bps, 'bps'),
+    'int': (to_int, 'int'),
+}
+
+# the units of a field depend on the parser family: the iosxe show arp
+# prints its ages in minutes, the nxos one in clock time, the speed of the
+# iosxe show platform is a clock rate. (os, module of the parsers) ->
+# {field: unit}, the ios parsers inheriting from the iosxe ones use the
+# iosxe fields
+FAMILIES = {
+    ('iosxe', 'show_platform'): {'uptime': 'seconds'},
+    ('iosxe', 'show_interface'): {
+        'last_input': 'seconds', 'last_output': 'seconds',
+        'up_time': 'seconds', 'port_speed': 'bps'},
+    ('iosxe', 'show_routing'): {
+        'age': 'seconds', 'updated': 'seconds', 'metric': 'int'},
+    ('iosxe', 'show_arp'): {'age': 'minutes'},
+    ('iosxe', 'show_bgp'): {'up_down': 'seconds', 'up_time': 'seconds'},
+    ('iosxe', 'show_ip_bgp'): {'up_down': 'seconds', 'up_time': 'seconds'},
+    ('iosxe', 'show_ospf'): {
+        'dead_time': 'seconds', 'dead_timer': 'seconds',
+        'elapsed_time': 'seconds', 'uptime': 'seconds'},
+    ('iosxe', 'show_ospfv3'): {'dead_time': 'seconds'},
+    ('iosxe', 'show_eigrp'): {'uptime': 'seconds'},
+    ('iosxe', 'show_isis'): {'holdtime': 'int'},
+    ('iosxe', 'show_device_tracking'): {
+        'age': 'seconds', 'time_left': 'seconds'},
+    ('iosxe', 'show_standby'): {'last_state_change': 'seconds'},
+    ('nxos', 'show_interface'): {
+        'last_link_flapped': 'seconds', 'port_speed': 'bps'},
+    ('nxos', 'show_routing'): {
+        'updated': 'seconds', 'uptime': 'seconds', 'metric': 'int',
+        'preference': 'int'},
+    ('nxos', 'show_arp'): {'age': 'seconds'},
+    ('nxos', 'show_bgp_vrf'): {'up_down': 'seconds', 'up_time': 'seconds'},
+    ('nxos', 'show_ospf'): {
+        'dead_timer': 'seconds', 'last_change': 'seconds',
+        'last_state_change': 'seconds'},
+    ('nxos', 'show_eigrp'): {'uptime': 'seconds'},
+    ('nxos', 'show_isis'): {'metric': 'int'},
+    ('iosxr', 'show_platform'): {'uptime': 'seconds'},
+    ('iosxr', 'show_interface'): {
+        'last_input': 'seconds', 'last_output': 'seconds',
+        'last_link_flapped': 'seconds', 'port_speed': 'bps', 'speed': 'bps'},
+    ('iosxr', 'show_routing'): {'updated': 'seconds'},
+    ('iosxr', 'show_arp'): {'age': 'seconds'},
+    ('iosxr', 'show_bgp'): {
+        'up_down': 'seconds', 'up_time': 'seconds', 'metric': 'int'},
+    ('iosxr', 'show_ospf'): {
+        'dead_time': 'seconds', 'dead_timer': 'seconds',
+        'neighbor_uptime': 'seconds', 'up_time': 'seconds'},
+    ('iosxr', 'show_eigrp'): {'uptime': 'seconds'},
+    ('iosxr', 'show_isis'): {'holdtime': 'int', 'metric': 'int'},
+    ('junos', 'show_chassis'): {'up-time': 'seconds'},
+    ('junos', 'show_interface'): dict(
+        {field: 'int' for field in (
+            'input-bps', 'input-bytes', 'input-packets', 'input-pps',
+            'output-bps', 'output-bytes', 'output-packets', 'output-pps',
+            'mtu')},
+        speed='bps'),
+    ('junos', 'show_route'): dict(
+        {field: 'int' for field in (
+            'active-route-count', 'local-as', 'local-preference', 'metric',
+            'metric2', 'peer-as', 'preference', 'preference2',
+            'rt-prefix-length')},
+        age='seconds'),
+    ('junos', 'show_bgp'): {field: 'int' for field in (
+        'accepted-prefix-count', 'active-prefix-count',
+        'advertised-prefix-count', 'established-count', 'flap-count',
+        'holdtime', 'local-as', 'peer-as', 'peer-count', 'preference',
+        'received-prefix-count', 'suppressed-prefix-count')},
+    ('junos', 'show_ospf'): {
+        'interface-cost': 'int', 'metric': 'int', 'mtu': 'int'},
+    ('junos', 'show_ospf3'): {
+        'interface-cost': 'int', 'metric': 'int', 'mtu': 'int'},
+}
+
+
+def family(parser):
+    '''(os, module) of a parser class, eg. ('iosxe', 'show_routing')'''
+    module = parser.__module__.split('.')
+    return (module[3], module[-1]) if len(module) > 4 else (None, module[-1])
+
+
+def add_field(os, module, field, unit):
+    '''Add the typed value of a field to the normalized results of a parser
+    family
+
+        Args:
+            os (`str`): os of the parsers, eg. 'iosxe'
+            module (`str`): module of the parsers, eg. 'show_routing'
+            field (`str`): key of the string values
+            unit (`str`): 'seconds', 'minutes', 'bps' or 'int', the typed
+                          value is added under '<field>_<unit>',
+                          '<field>-<unit>' for the junos parsers, minutes
+                          are added in seconds
+    '''
+    if unit not in CONVERTERS:
+        raise ValueError('unit {!r} is not one of {}'.format(
+            unit, ', '.join(CONVERTERS)))
+    FAMILIES.setdefault((os, module), {})[field] = unit
+    fields_of.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def fields_of(parser_cls):
+    '''field -> (converter, typed field) of a parser class, from the
+    family of the first class of its mro found in FAMILIES
+
+        Args:
+            parser_cls (`class`): parser class
+
+        Returns:
+            `dict`, empty for the parsers without known fields
+    '''
+    for cls in parser_cls.__mro__:
+        key = family(cls)
+        units = FAMILIES.get(key)
+        if units is not None:
+            break
+    else:
+        return {}
+    # the junos keys are hyphenated
+    separator = '-' if key[0] == 'junos' else '_'
+    fields = {}
+    for field, unit in units.items():
+        converter, typed = CONVERTERS[unit]
+        fields[field] = (converter, field + separator + typed)
+    return fields
+
+
+def normalize_result(parser, parsed):
+    '''Add in place the typed values of the known string fields of the
+    parser family, see FAMILIES
+
+        Args:
+            parser (`class` or `object`): parser class or instance of the
+                                          result
+            parsed (`dict`): parser result
+
+        Returns:
+            parsed
+    '''
+    fields = fields_of(parser if isinstance(parser, type) else type(parser))
+    if not fields:
+        return parsed
+    stack = [parsed]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            typed = {}
+            for key, value in node.items():
+                if value.__class__ is str:
+                    field = fields.get(key)
+                    if field is not None and field[1] not in node:
+                        converted = field[0](value)
+                        if converted is not None:
+                            typed[field[1]] = converted
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+            if typed:
+                node.update(typed)
+        else:
+            stack.extend(value for value in node
+                         if isinstance(value, (dict, list)))
+    return parsed
+
+
+def parse(parser, *args, **kwargs):
+    '''Parse and add the typed values of the result
+
+        Args:
+            parser (`object`): parser instance, eg.
+                               ShowIpRoute(device=device)
+            args, kwargs: arguments of parser.parse()
+
+        Returns:
+            normalized parser result
+    '''
+    return normalize_result(parser, parser.parse(*args, **kwargs))
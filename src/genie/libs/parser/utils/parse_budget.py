@@ -0,0 +1,183 @@
+'''Per-parse time budget
+
+A line the patterns of a parser backtrack on (see regex_audit) can hold a
+parse for minutes. parse_budget bounds the time of a parse and raises
+ParseTimeoutError naming the parser and the output line it was matching:
+
+    >>> from genie.libs.parser.utils.parse_budget import parse_budget
+    >>> with parse_budget(2):
+    ...     parsed = device.parse('show ip route')
+    ParseTimeoutError: Parser 'genie.libs.parser.iosxe.show_routing.ShowIpRoute'
+    exceeded its time budget of 2s at line '[110/1111111111111111111111111111!'
+
+In the main thread the budget is enforced with SIGALRM, which also stops a
+regular expression in the middle of a match. In other threads a watchdog
+raises the exception in the parsing thread, once the running match returns.
+'''
+
+# python
+import sys
+import time
+import ctypes
+import signal
+import threading
+
+# metaparser
+from genie.metaparser import MetaParser
+
+# local variable holding the output line in the parser methods
+LINE_VARIABLE = 'line'
+
+
+class ParseTimeoutError(Exception):
+    '''raised when a parse exceeds its time budget'''
+    def __init__(self, parser=None, line=None, budget=None):
+        self.parser = parser
+        self.line = line
+        self.budget = budget
+
+    def __str__(self):
+        message = "Parser '{}' exceeded its time budget of {}s".format(
+            self.parser or 'unknown', self.budget)
+        if self.line is not None:
+            message += ' at line {!r}'.format(self.line)
+        return message
+
+
+def _parser_name(parser):
+    cls = parser if isinstance(parser, type) else parser.__class__
+    return '{}.{}'.format(cls.__module__, cls.__name__)
+
+
+def locate(frame):
+    '''Return the parser and the output line a frame is in
+
+    Walks the stack from frame outwards to the first method of a parser,
+    the line is the first 'line' local variable found on the way.
+
+        Args:
+            frame (`frame`): innermost frame of the parse
+
+        Returns:
+            tuple of (parser name, line), None when not found
+    '''
+    parser = line = None
+    while frame is not None:
+        local_vars = frame.f_locals
+        if line is None and isinstance(local_vars.get(LINE_VARIABLE), str):
+            line = local_vars[LINE_VARIABLE]
+        if isinstance(local_vars.get('self'), MetaParser):
+            parser = _parser_name(local_vars['self'])
+            break
+        frame = frame.f_back
+    return parser, line
+
+
+class parse_budget(object):
+    '''Context manager bounding the time of the parses it encloses
+
+        Args:
+            seconds (`float`): time budget, None or 0 for no budget
+            parser (`str`, `class`): parser reported when it cannot be
+                                     found on the stack
+
+        Raises:
+            ParseTimeoutError: the budget is exceeded
+
+        example:
+
+            >>> with parse_budget(0.5, parser=ShowIpRoute):
+            ...     ShowIpRoute(device=device).parse(output=output)
+    '''
+
+    def __init__(self, seconds, parser=None):
+        self.seconds = seconds
+        if parser is not None and not isinstance(parser, str):
+            parser = _parser_name(parser)
+        self.parser = parser
+        self._error = None
+        self._lock = threading.Lock()
+        self._done = False
+        self._thread_id = None
+        self._previous = None
+        self._previous_timer = None
+        self._start = None
+        self._watchdog = None
+
+    def _timeout(self, frame):
+        parser, line = locate(frame)
+        self._error = ParseTimeoutError(parser or self.parser, line,
+                                        self.seconds)
+        return self._error
+
+    def _alarm(self, signum, frame):
+        raise self._timeout(frame)
+
+    def _expire(self):
+        with self._lock:
+            if self._done:
+                return
+            self._timeout(sys._current_frames().get(self._thread_id))
+            # only an exception class can be sent to a thread, __exit__
+            # replaces it with the instance naming the parser and the line
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                ctypes.c_ulong(self._thread_id),
+                ctypes.py_object(ParseTimeoutError))
+
+    def __enter__(self):
+        if not self.seconds:
+            return self
+        self._start = time.monotonic()
+        if threading.current_thread() is threading.main_thread() and \
+                hasattr(signal, 'setitimer'):
+            self._previous = signal.signal(signal.SIGALRM, self._alarm)
+            self._previous_timer = signal.setitimer(signal.ITIMER_REAL,
+                                                    self.seconds)
+        else:
+            self._thread_id = threading.get_ident()
+            self._watchdog = threading.Timer(self.seconds, self._expire)
+            self._watchdog.daemon = True
+            self._watchdog.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._previous is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous)
+            # an enclosing budget keeps its remaining time
+            delay, interval = self._previous_timer
+            if delay:
+                elapsed = time.monotonic() - self._start
+                signal.setitimer(signal.ITIMER_REAL,
+                                 max(delay - elapsed, 1e-6), interval)
+        if self._watchdog is not None:
+            with self._lock:
+                self._done = True
+                self._watchdog.cancel()
+                if exc_type is None and self._error is not None:
+                    # the parse ended before the exception was raised
+                    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                        ctypes.c_ulong(self._thread_id), None)
+                    self._error = None
+        if exc_type is ParseTimeoutError and self._error is not None and \
+                exc_value is not self._error and exc_value.parser is None:
+            raise self._error from None
+        return False
+
+
+def parse_with_budget(parser, seconds, **kwargs):
+    '''Call parser.parse(**kwargs) within a time budget
+
+        Args:
+            parser (`MetaParser`): parser instance
+            seconds (`float`): time budget, None or 0 for no budget
+            kwargs: arguments of parse
+
+        Returns:
+            parsed output
+
+        Raises:
+            ParseTimeoutError: the budget is exceeded
+    '''
+    with parse_budget(seconds, parser=parser.__class__):
+        return parser.parse(**kwargs)
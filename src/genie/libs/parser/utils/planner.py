@@ -0,0 +1,433 @@
+'''Command planner
+
+Jobs often ask a device for overlapping data:
+
+    show interfaces
+    show interfaces GigabitEthernet1/0/1
+    show ip route
+    show ip route bgp
+    show ip route vrf VRF1 ospf
+
+The result of 'show interfaces GigabitEthernet1/0/1' is one entry of the
+result of 'show interfaces', and the result of 'show ip route bgp' the bgp
+routes of the result of 'show ip route'. The planner resolves every
+requested command through ``get_parser`` and the command index of
+parsers.json, reduces each parser invocation to its superset along the
+relations of SUPERSETS, executes each superset needed by more than one
+request once, and derives the other results by filtering its parsed
+output:
+
+    >>> from genie.libs.parser.utils.planner import plan_commands
+    >>> plan = plan_commands(device, [
+    ...     ('show interfaces', {}),
+    ...     ('show interfaces {interface}', {'interface': 'Gi1/0/1'}),
+    ...     ('show ip route bgp', {})])
+    >>> plan.commands
+    ['show interfaces', 'show ip route bgp']
+    >>> results = plan.run()
+
+A superset is only executed instead of its subsets when at least two
+different invocations reduce to it, a single 'show interfaces Gi1/0/1' is
+still executed as it is. Some entries of a superset output are completed
+from other entries, eg. the members of a port-channel, those requests are
+executed on their own when met, to return what the device would.
+'''
+
+# python
+import re
+import logging
+from collections import namedtuple, OrderedDict
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from .common import get_parser, Common
+from .bulk import _error
+
+log = logging.getLogger(__name__)
+
+# a requested command, its arguments are formatted in the command
+Request = namedtuple('Request', ['command', 'kwargs'])
+
+
+class NotDerivable(Exception):
+    '''the subset result cannot be derived from the superset output'''
+
+
+class KeyFilter(object):
+    '''The subset result is one entry of a mapping of the superset result
+
+        Args:
+            argument (`str`): parser argument selecting the entry
+            path (`tuple`): keys from the result to the mapping, '*' for
+                            every key
+            normalize (`callable`): converts the argument to the key of
+                                    the entry, eg. Gi1/0/1 to
+                                    GigabitEthernet1/0/1
+            standalone (`callable`): (key, entry) -> False when the parser
+                                     completed the entry from other entries
+                                     of the output
+    '''
+    def __init__(self, argument, path=(), normalize=None, standalone=None):
+        self.argument = argument
+        self.path = tuple(path)
+        self.normalize = normalize
+        self.standalone = standalone
+
+    def applies(self, value):
+        return True
+
+    def _select(self, mapping, value):
+        if value in mapping:
+            selected = {value: mapping[value]}
+        else:
+            # the device does not care about the case of the argument
+            lower = value.lower()
+            selected = {key: entry for key, entry in mapping.items()
+                        if isinstance(key, str) and key.lower() == lower}
+        if self.standalone is not None and not all(
+                self.standalone(key, entry)
+                for key, entry in selected.items()):
+            raise NotDerivable(value)
+        return selected
+
+    def derive(self, parsed, value):
+        '''subset result of the superset parsed output
+
+            Raises:
+                SchemaEmptyParserError: no entry for the argument
+                NotDerivable: the entry depends on other entries
+        '''
+        if self.normalize is not None:
+            value = self.normalize(value)
+        derived = _filter(parsed, self.path,
+                          lambda mapping: self._select(mapping, value))
+        if not derived:
+            raise SchemaEmptyParserError(derived)
+        return derived
+
+
+class ValueFilter(object):
+    '''The subset result keeps the entries of the superset result having
+    the argument as value of a field
+
+        Args:
+            argument (`str`): parser argument holding the value
+            path (`tuple`): keys from the result to the mapping of the
+                            entries, '*' for every key
+            field (`str`): key of the value in each entry
+            values (`iterable`): argument values having this relation, the
+                                 argument can hold other kinds of values
+    '''
+    def __init__(self, argument, path, field, values):
+        self.argument = argument
+        self.path = tuple(path)
+        self.field = field
+        self.values = frozenset(values)
+
+    def applies(self, value):
+        return value in self.values
+
+    def derive(self, parsed, value):
+        '''subset result of the superset parsed output
+
+            Raises:
+                SchemaEmptyParserError: no entry has the value
+        '''
+        field = self.field
+        derived = _filter(parsed, self.path, lambda mapping: {
+            key: entry for key, entry in mapping.items()
+            if entry.get(field) == value})
+        if not derived:
+            raise SchemaEmptyParserError(derived)
+        return derived
+
+
+def _filter(parsed, path, select):
+    '''copy of parsed with the mappings at path replaced by select(mapping),
+    the branches left empty are dropped'''
+    if not path:
+        return select(parsed)
+    key, rest = path[0], path[1:]
+    keys = parsed.keys() if key == '*' else [key] if key in parsed else []
+    derived = {}
+    # the keys next to the path are the same in the subset result
+    for other, value in parsed.items():
+        if other not in keys:
+            derived[other] = value
+    found = False
+    for key in keys:
+        if not isinstance(parsed[key], dict):
+            continue
+        value = _filter(parsed[key], rest, select)
+        if value:
+            derived[key] = value
+            found = True
+    return derived if found else {}
+
+
+# protocols of 'show ip route {protocol}' listing only their own routes
+ROUTE_PROTOCOLS = ('bgp', 'ospf', 'eigrp', 'isis', 'rip', 'static', 'odr',
+                   'lisp', 'nhrp', 'mobile')
+
+
+def _standalone_interface(name, entry):
+    '''interfaces not completed from the other interfaces of the output'''
+    port_channel = entry.get('port_channel') or {}
+    ipv4 = entry.get('ipv4') or {}
+    return not (name.lower().startswith('port-channel') or
+                port_channel.get('port_channel_member') or
+                'unnumbered' in ipv4)
+
+
+INTERFACE = KeyFilter('interface', normalize=Common.convert_intf_name,
+                      standalone=_standalone_interface)
+
+# os -> parser class name -> relations to the superset invocation without
+# the argument of the relation
+SUPERSETS = {
+    'iosxe': {
+        'ShowInterfaces': [INTERFACE],
+        'ShowIpInterface': [INTERFACE],
+        'ShowInterfacesSwitchport': [INTERFACE],
+        'ShowIpRouteDistributor': [
+            ValueFilter('protocol',
+                        path=('vrf', '*', 'address_family', '*', 'routes'),
+                        field='source_protocol', values=ROUTE_PROTOCOLS),
+        ],
+    },
+    'nxos': {
+        'ShowInterface': [INTERFACE],
+    },
+}
+
+
+def _template(parser_cls, arguments):
+    '''command of the parser taking exactly these arguments'''
+    commands = getattr(parser_cls, 'cli_command', None) or []
+    if isinstance(commands, str):
+        commands = [commands]
+    for command in commands:
+        if '|' not in command and \
+                set(re.findall(r'{(\w+)}', command)) == set(arguments):
+            return command
+    return None
+
+
+class Invocation(namedtuple('Invocation', ['parser_cls', 'kwargs'])):
+    '''parser class and its arguments, kwargs is a sorted tuple of items'''
+
+    @property
+    def arguments(self):
+        return dict(self.kwargs)
+
+
+class Execution(object):
+    '''A command executed by a plan, and the requests derived from it
+
+        Attributes:
+            command (`str`): executed command
+            invocation (`Invocation`): parser class and its arguments
+            requests (`list`): (index of the request, its own invocation,
+                               relations applied to the parsed output,
+                               with their values)
+    '''
+    def __init__(self, command, invocation):
+        self.command = command
+        self.invocation = invocation
+        self.requests = []
+
+    def __repr__(self):
+        return '<{} {!r} for {} requests>'.format(
+            self.__class__.__name__, self.command, len(self.requests))
+
+
+class CommandPlan(object):
+    '''Commands to execute for a batch of requests, see plan_commands
+
+        Attributes:
+            device (`Device`): device the commands are executed on
+            requests (`list`): Request of each requested command
+            executions (`list`): Execution of each command to execute
+    '''
+    def __init__(self, device, requests, executions, errors):
+        self.device = device
+        self.requests = requests
+        self.executions = executions
+        self._errors = errors
+
+    @property
+    def commands(self):
+        '''commands executed by the plan'''
+        return [execution.command for execution in self.executions]
+
+    def run(self, device=None):
+        '''Execute the planned commands and derive the requested results
+
+            Args:
+                device (`Device`): device to execute on, the device of the
+                                   plan by default
+
+            Returns:
+                list of result dicts in the order of the requests, with keys
+                'command', 'executed' and either 'parsed' or 'error'. The
+                results derived from the same execution share their dicts
+        '''
+        device = device or self.device
+        results = [None] * len(self.requests)
+        for index, error in self._errors.items():
+            results[index] = {'command': self.requests[index].command,
+                              'executed': None, 'error': error}
+
+        # invocation -> (parsed, error), executions and their fallbacks
+        outputs = {}
+
+        def parse(invocation):
+            try:
+                return outputs[invocation]
+            except KeyError:
+                pass
+            try:
+                outputs[invocation] = (invocation.parser_cls(
+                    device=device).parse(**invocation.arguments), None)
+            except Exception as e:
+                outputs[invocation] = (None, _error(e))
+            return outputs[invocation]
+
+        for execution in self.executions:
+            for index, invocation, relations in execution.requests:
+                request = self.requests[index]
+                result = {'command': request.command,
+                          'executed': execution.command}
+                parsed, error = parse(execution.invocation)
+                if error is None:
+                    try:
+                        for relation, value in relations:
+                            parsed = relation.derive(parsed, value)
+                    except NotDerivable:
+                        log.debug("Executing '{}', not derivable from "
+                                  "'{}'".format(request.command,
+                                                execution.command))
+                        result['executed'] = _command(invocation, request)
+                        parsed, error = parse(invocation)
+                    except Exception as e:
+                        error = _error(e)
+                if error is None:
+                    result['parsed'] = parsed
+                else:
+                    result['error'] = error
+                results[index] = result
+        return results
+
+
+def _invocation(parser_cls, kwargs):
+    # the command argument is rebuilt from the executed command
+    return Invocation(parser_cls, tuple(sorted(
+        (key, value) for key, value in kwargs.items() if key != 'command')))
+
+
+def _resolves_to(device, parser_cls, arguments, cache):
+    '''whether the command index resolves the command of the parser taking
+    these arguments back to the parser'''
+    key = (parser_cls, tuple(sorted(arguments)))
+    if key not in cache:
+        template = _template(parser_cls, arguments)
+        try:
+            cache[key] = template is not None and get_parser(
+                template.format(**arguments), device)[0] is parser_cls
+        except Exception:
+            cache[key] = False
+    return cache[key]
+
+
+def _reduce(device, invocation, cache):
+    '''superset invocation and the relations from it to the invocation'''
+    relations = []
+    parser_cls = invocation.parser_cls
+    rules = SUPERSETS.get(getattr(device, 'os', None), {}).get(
+        parser_cls.__name__, [])
+    arguments = invocation.arguments
+    for relation in rules:
+        value = arguments.get(relation.argument)
+        if value is None or not relation.applies(value):
+            continue
+        remaining = {key: value for key, value in arguments.items()
+                     if key != relation.argument}
+        if not _resolves_to(device, parser_cls, remaining, cache):
+            continue
+        arguments = remaining
+        relations.append((relation, value))
+    return _invocation(parser_cls, arguments), relations
+
+
+def plan_commands(device, requests):
+    '''Plan the executions of a batch of requested commands
+
+        Args:
+            device (`Device`): device the commands are for, its os selects
+                               the parsers and the relations
+            requests (`list`): (command, kwargs) pairs, the kwargs are
+                               formatted in the command
+
+        Returns:
+            CommandPlan
+    '''
+    requests = [Request(command.format(**kwargs), dict(kwargs))
+                for command, kwargs in requests]
+
+    # index of the request -> its invocation, or the resolution error
+    invocations = OrderedDict()
+    errors = {}
+    for index, request in enumerate(requests):
+        try:
+            parser_cls, kwargs = get_parser(request.command, device)
+        except Exception as e:
+            errors[index] = _error(e)
+            continue
+        invocations[index] = _invocation(parser_cls, kwargs)
+
+    # superset invocation -> distinct invocations reducing to it
+    groups = OrderedDict()
+    reduced = {}
+    cache = {}
+    for index, invocation in invocations.items():
+        superset, relations = _reduce(device, invocation, cache)
+        reduced[index] = (superset, relations)
+        groups.setdefault(superset, OrderedDict())[invocation] = None
+
+    executions = OrderedDict()
+    for index, invocation in invocations.items():
+        superset, relations = reduced[index]
+        if len(groups[superset]) < 2:
+            # nothing shared, execute the request as it is
+            superset, relations = invocation, []
+        try:
+            execution = executions[superset]
+        except KeyError:
+            execution = executions[superset] = Execution(
+                _command(superset, requests[index]), superset)
+        execution.requests.append((index, invocation, relations))
+
+    plan = CommandPlan(device, requests, list(executions.values()), errors)
+    log.debug('Planned {} executions for {} requests'.format(
+        len(plan.executions), len(requests)))
+    return plan
+
+
+def _command(invocation, request):
+    template = _template(invocation.parser_cls, invocation.arguments)
+    if template is None:
+        return request.command
+    return template.format(**invocation.arguments)
+
+
+def parse_commands(device, requests):
+    '''Plan and run a batch of requested commands
+
+        Args:
+            device (`Device`): device to execute on
+            requests (`list`): (command, kwargs) pairs
+
+        Returns:
+            list of result dicts, see CommandPlan.run
+    '''
+    return plan_commands(device, requests).run()
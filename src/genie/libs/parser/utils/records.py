@@ -0,0 +1,239 @@
+'''Compact record representation of the parser results
+
+A parser result holds one dict per row of a table, and a dict costs several
+hundred bytes whatever the size of its values. For the row-heavy parsers
+(arp, mac address, device-tracking, wireless clients, processes) the record
+mode replaces each row dict of a validated result with a record: an
+instance of a __slots__ class generated from the leaf dict of the schema,
+holding only its values.
+
+    >>> from genie.libs.parser.utils import records
+    >>> parsed = records.parse(ShowArp(device=device))
+    >>> parsed['interfaces']['Vlan10']['ipv4']['neighbors']['10.0.0.1']['age']
+    '0'
+
+A record is a read-only mapping, read as the dict it replaces: by key,
+with get(), keys(), items(), in, len() and == against the dict. Its keys
+follow the order of the schema. to_dict() converts a result back to the
+dicts of the schema, for what needs actual dicts, such as json.dumps or
+merging results.
+
+A dict of the schema is a record when all its keys are literals (or
+Optional literals, or Or of literals) and none of its values is a dict. The
+results are validated by the parser schema before being packed, the records
+are not validated again.
+'''
+
+# python
+import itertools
+from collections.abc import Mapping
+
+# metaparser
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, \
+    ListOf
+
+# literal keys of the record dicts
+LITERALS = (str, int, float, bool)
+
+
+class Record(Mapping):
+    '''Base class of the generated record classes
+
+    Each key of the schema dict has a slot, a missing Optional key leaves
+    its slot unset.
+    '''
+    __slots__ = ()
+
+    # key -> slot name, in the order of the schema
+    _slots = {}
+    # key -> setter of its slot
+    _setters = {}
+
+    @classmethod
+    def from_dict(cls, values):
+        '''record of a dict, None when the dict has a key of no slot'''
+        record = cls.__new__(cls)
+        setters = cls._setters
+        for key, value in values.items():
+            setter = setters.get(key)
+            if setter is None:
+                return None
+            setter(record, value)
+        return record
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._slots[key])
+        except (KeyError, AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        for key, slot in self._slots.items():
+            if hasattr(self, slot):
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def to_dict(self):
+        '''dict of the record'''
+        return {key: to_dict(value) for key, value in self.items()}
+
+
+def _unwrap(schema):
+    # value of a Schema/Optional wrapper
+    while type(schema) in (Schema, Optional):
+        schema = schema.schema
+    return schema
+
+
+def _has_dict(schema):
+    schema = _unwrap(schema)
+    if isinstance(schema, dict):
+        return True
+    if type(schema) is ListOf:
+        return _has_dict(schema.schema)
+    if type(schema) is Or:
+        return any(_has_dict(s) for s in schema.schemas)
+    return False
+
+
+# id of the schema dict -> (schema dict, record class or None)
+_classes = {}
+_names = itertools.count()
+
+
+def record_class(schema):
+    '''record class of a dict of a schema, cached per schema dict
+
+        Args:
+            schema (`dict`): dict of a parser schema
+
+        Returns:
+            subclass of Record, None when the dict is not a record
+    '''
+    try:
+        return _classes[id(schema)][1]
+    except KeyError:
+        pass
+    cls = None
+    keys = []
+    for key, value in schema.items():
+        key = _unwrap(key)
+        literals = key.schemas if type(key) is Or else (key,)
+        if _has_dict(value) or \
+                any(type(literal) not in LITERALS for literal in literals):
+            break
+        keys.extend(literal for literal in literals if literal not in keys)
+    else:
+        if keys:
+            slots = {key: '_{}'.format(i) for i, key in enumerate(keys)}
+            cls = type('Record{}'.format(next(_names)), (Record,),
+                       {'__slots__': tuple(slots.values()),
+                        '_slots': slots})
+            cls._setters = {key: getattr(cls, slot).__set__
+                            for key, slot in slots.items()}
+    # keep the schema alive with its id
+    _classes[id(schema)] = (schema, cls)
+    return cls
+
+
+# id of the schema dict -> (schema dict, literal key -> value schema,
+#                           [(wildcard key, value schema)])
+_nodes = {}
+
+
+def _node(schema):
+    try:
+        return _nodes[id(schema)][1:]
+    except KeyError:
+        pass
+    literals = {}
+    wildcards = []
+    for key, value in schema.items():
+        key = _unwrap(key)
+        if type(key) is Or:
+            for k in key.schemas:
+                literals.setdefault(k, value)
+        elif type(key) in LITERALS:
+            literals.setdefault(key, value)
+        else:
+            wildcards.append((key, value))
+    _nodes[id(schema)] = (schema, literals, wildcards)
+    return literals, wildcards
+
+
+def _value_schema(schema, key):
+    literals, wildcards = _node(schema)
+    try:
+        return literals[key]
+    except (KeyError, TypeError):
+        pass
+    for wildcard, value in wildcards:
+        if type(wildcard) is Any or \
+                isinstance(wildcard, type) and isinstance(key, wildcard):
+            return value
+    return None
+
+
+def _pack(schema, data):
+    schema = _unwrap(schema)
+    if data.__class__ is dict and isinstance(schema, dict):
+        cls = record_class(schema)
+        if cls is not None:
+            record = cls.from_dict(data)
+            if record is not None:
+                return record
+            return data
+        for key, value in data.items():
+            if value.__class__ in (dict, list):
+                data[key] = _pack(_value_schema(schema, key), value)
+        return data
+    if data.__class__ is list and type(schema) is ListOf:
+        return [_pack(schema.schema, value) for value in data]
+    return data
+
+
+def pack(schema, result):
+    '''Replace the record dicts of a validated result with records
+
+        Args:
+            schema (`dict`): schema of the parser
+            result (`dict`): result validated by the schema, modified in place
+
+        Returns:
+            the packed result
+    '''
+    return _pack(schema, result)
+
+
+def to_dict(result):
+    '''Convert back the records of a result to dicts
+
+        Args:
+            result: packed result
+
+        Returns:
+            a copy of result with dicts in place of the records
+    '''
+    if isinstance(result, Mapping):
+        return {key: to_dict(value) for key, value in result.items()}
+    if isinstance(result, list):
+        return [to_dict(value) for value in result]
+    return result
+
+
+def parse(parser, **kwargs):
+    '''parse() of a parser, returning the result packed in records
+
+        Args:
+            parser (`MetaParser`): parser instance
+            kwargs: arguments of the parse
+
+        Returns:
+            packed result
+    '''
+    return pack(parser.schema, parser.parse(**kwargs))
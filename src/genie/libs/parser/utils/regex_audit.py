@@ -0,0 +1,751 @@
+r'''Static audit of the parser regular expressions
+
+Parsers match every line of the device output against a handful of compiled
+patterns. A pattern with a nested quantifier, such as
+
+    \[(?P<route_preference>[\d\/]+)+\]+
+
+backtracks exponentially on a line it almost matches: 30 digits followed by
+an unexpected character take minutes to reject. This module finds such
+patterns without running the parsers:
+
+    * extract_patterns reads the parser modules with ast and returns every
+      pattern literal given to re.compile, re.match, re.search, ... or to
+      the same functions of regex_engine
+    * find_hazards parses a pattern with the re parser and reports the
+      catastrophic-backtracking shapes:
+        - nested_quantifier: an unbounded repeat of a group whose body has
+          an unbounded repeat that can match the same characters in more
+          than one way, eg. ([\d\/]+)+ or (\s*\w+)*
+        - overlapping_alternation: an unbounded repeat of an alternation
+          whose branches can start with the same character, eg. (\w|\d)+
+    * time_hazard builds an adversarial line for a hazard (a matching
+      prefix, the pumped characters and a failing suffix) and times the
+      pattern on growing lines in a child process, which is killed when it
+      goes over the timeout.
+
+audit runs the three steps over the parser packages and returns one report
+entry per hazard:
+
+    >>> from genie.libs.parser.utils.regex_audit import audit
+    >>> for entry in audit(os_names=['iosxe']):
+    ...     print(entry['module'], entry['line'], entry['status'])
+
+The same report is available from the command line:
+
+    $ genie_regex_audit --os iosxe --json report.json
+'''
+
+# python
+import os
+import re
+import ast
+import sys
+import json
+import time
+import string
+import logging
+import warnings
+import pathlib
+import argparse
+import multiprocessing
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # python 3.11+
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+log = logging.getLogger(__name__)
+
+PARSER_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+# modules the parsers compile their patterns with
+RE_MODULES = ('re', 'regex_engine')
+
+# re functions whose first argument is a pattern
+RE_FUNCTIONS = ('compile', 'match', 'search', 'fullmatch', 'findall',
+                'finditer', 'sub', 'subn', 'split')
+
+# lengths of the pumped part of the adversarial lines
+DEFAULT_SIZES = (8, 12, 16, 20, 24, 28)
+
+# seconds allowed to a pattern for all the sizes
+DEFAULT_TIMEOUT = 2.0
+
+# a match slower than this on the adversarial line is catastrophic
+SLOW_THRESHOLD = 0.1
+
+# characters tried when sampling a character class
+ALPHABET = (string.ascii_letters + string.digits + string.punctuation +
+            ' \t')
+
+# characters tried to make the adversarial line fail after the pump
+FAIL_SUFFIXES = ('\x00', '!', '\n', ' ', 'a', '0')
+
+MAXREPEAT = sre_constants.MAXREPEAT
+REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) + \
+    ((sre_constants.POSSESSIVE_REPEAT,)
+     if hasattr(sre_constants, 'POSSESSIVE_REPEAT') else ())
+ATOMIC = getattr(sre_constants, 'ATOMIC_GROUP', None)
+SINGLE_CHARS = (sre_constants.LITERAL, sre_constants.NOT_LITERAL,
+                sre_constants.ANY, sre_constants.IN)
+IGNORECASE = int(re.IGNORECASE)
+DOTALL = int(re.DOTALL)
+
+# re parser names of the character categories and anchors
+CATEGORIES = {
+    'CATEGORY_DIGIT': r'\d', 'CATEGORY_NOT_DIGIT': r'\D',
+    'CATEGORY_SPACE': r'\s', 'CATEGORY_NOT_SPACE': r'\S',
+    'CATEGORY_WORD': r'\w', 'CATEGORY_NOT_WORD': r'\W',
+}
+ANCHORS = {
+    'AT_BEGINNING': '^', 'AT_BEGINNING_STRING': r'\A', 'AT_END': '$',
+    'AT_END_STRING': r'\Z', 'AT_BOUNDARY': r'\b',
+    'AT_NON_BOUNDARY': r'\B',
+}
+
+# pattern literal found in a parser module
+PatternSite = namedtuple('PatternSite', ['module', 'line', 'pattern',
+                                         'flags'])
+
+# catastrophic-backtracking shape found in a pattern
+Hazard = namedtuple('Hazard', ['kind', 'fragment', 'prefix', 'pump'])
+
+
+# ------------------------------------------------------------------------------
+#   Extraction
+# ------------------------------------------------------------------------------
+def _flags_value(node):
+    '''value of a flags argument such as re.I | re.VERBOSE, None when it is
+       not made of re constants'''
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) \
+            and node.value.id == 're':
+        value = getattr(re, node.attr, None)
+        return int(value) if isinstance(value, int) else None
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        left, right = _flags_value(node.left), _flags_value(node.right)
+        if left is not None and right is not None:
+            return left | right
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return node.value
+    return None
+
+
+def _module_name(path):
+    path = pathlib.Path(path).resolve()
+    try:
+        parts = path.relative_to(PARSER_ROOT).with_suffix('').parts
+    except ValueError:
+        return path.stem
+    return '.'.join(('genie.libs.parser',) + parts)
+
+
+def extract_file(path):
+    '''Return the pattern literals of a python file
+
+        Args:
+            path (`str`): python file
+
+        Returns:
+            list of PatternSite
+    '''
+    path = pathlib.Path(path)
+    try:
+        tree = ast.parse(path.read_text(encoding='utf-8', errors='replace'),
+                         filename=str(path))
+    except SyntaxError as e:
+        log.warning('Cannot read {}: {}'.format(path, e))
+        return []
+
+    module = _module_name(path)
+    sites = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not node.args:
+            continue
+        func = node.func
+        if not (isinstance(func, ast.Attribute) and
+                func.attr in RE_FUNCTIONS and
+                isinstance(func.value, ast.Name) and
+                func.value.id in RE_MODULES):
+            continue
+        pattern = node.args[0]
+        if not (isinstance(pattern, ast.Constant) and
+                isinstance(pattern.value, str)):
+            continue
+
+        # flags is the 2nd argument of compile, the 3rd of match/search
+        flags = None
+        position = 1 if func.attr == 'compile' else \
+            3 if func.attr in ('sub', 'subn') else 2
+        if len(node.args) > position:
+            flags = node.args[position]
+        for keyword in node.keywords:
+            if keyword.arg == 'flags':
+                flags = keyword.value
+        flags = 0 if flags is None else _flags_value(flags) or 0
+
+        sites.append(PatternSite(module, node.lineno, pattern.value, flags))
+    return sites
+
+
+def _iter_files(paths=None, os_names=None):
+    if paths:
+        for path in paths:
+            path = pathlib.Path(path)
+            if path.is_dir():
+                yield from sorted(path.glob('**/*.py'))
+            else:
+                yield path
+        return
+
+    folders = [PARSER_ROOT / name for name in os_names] if os_names else \
+        sorted(p for p in PARSER_ROOT.iterdir() if p.is_dir())
+    for folder in folders:
+        for path in sorted(folder.glob('**/*.py')):
+            # golden outputs and unittests hold no parser pattern
+            if 'tests' not in path.relative_to(PARSER_ROOT).parts:
+                yield path
+
+
+def extract_patterns(paths=None, os_names=None):
+    '''Return the pattern literals of the parser modules
+
+        Args:
+            paths (`list`): files or folders, the parser packages by default
+            os_names (`list`): only the parser packages of these os
+
+        Returns:
+            list of PatternSite
+    '''
+    sites = []
+    for path in _iter_files(paths, os_names):
+        sites.extend(extract_file(path))
+    return sites
+
+
+# ------------------------------------------------------------------------------
+#   Analysis
+# ------------------------------------------------------------------------------
+def _category(name, char):
+    if name.endswith('DIGIT'):
+        matched = char.isdigit()
+    elif name.endswith('SPACE'):
+        matched = char.isspace()
+    elif name.endswith('WORD'):
+        matched = char.isalnum() or char == '_'
+    elif name.endswith('LINEBREAK'):
+        matched = char == '\n'
+    else:
+        return False
+    return not matched if '_NOT_' in name else matched
+
+
+def _char_matches(op, av, char, flags):
+    '''whether a single character item matches char'''
+    if flags & IGNORECASE:
+        candidates = {char, char.lower(), char.upper()}
+    else:
+        candidates = {char}
+
+    if op is sre_constants.LITERAL:
+        return chr(av) in candidates
+    if op is sre_constants.NOT_LITERAL:
+        return chr(av) not in candidates
+    if op is sre_constants.ANY:
+        return char != '\n' or bool(flags & DOTALL)
+    if op is sre_constants.IN:
+        negate = False
+        matched = False
+        for item_op, item_av in av:
+            if item_op is sre_constants.NEGATE:
+                negate = True
+            elif item_op is sre_constants.LITERAL:
+                matched |= chr(item_av) in candidates
+            elif item_op is sre_constants.RANGE:
+                matched |= any(item_av[0] <= ord(c) <= item_av[1]
+                               for c in candidates)
+            elif item_op is sre_constants.CATEGORY:
+                matched |= _category(str(item_av), char)
+        return matched != negate
+    return False
+
+
+# (op, av, flags) -> characters of ALPHABET matched by a single character item
+_char_sets = {}
+
+
+def _char_set(op, av, flags):
+    key = (op, str(av), flags)
+    chars = _char_sets.get(key)
+    if chars is None:
+        chars = _char_sets[key] = frozenset(
+            c for c in ALPHABET if _char_matches(op, av, c, flags))
+    return chars
+
+
+def _alphabet(items, flags):
+    '''characters of ALPHABET that items can match anywhere'''
+    chars = set()
+    for op, av in items:
+        if op in SINGLE_CHARS:
+            chars |= _char_set(op, av, flags)
+        else:
+            for sub_items in _children(op, av):
+                chars |= _alphabet(sub_items, flags)
+    return chars
+
+
+def _first(items, flags):
+    '''characters of ALPHABET items can start with, and whether they can
+       match the empty string'''
+    chars = set()
+    for op, av in items:
+        if op in SINGLE_CHARS:
+            return chars | _char_set(op, av, flags), False
+        if op in REPEATS:
+            sub_chars, nullable = _first(av[2], flags)
+            chars |= sub_chars
+            if av[0] > 0 and not nullable:
+                return chars, False
+        elif op is sre_constants.SUBPATTERN or op is ATOMIC:
+            sub_chars, nullable = _first(_children(op, av)[0], flags)
+            chars |= sub_chars
+            if not nullable:
+                return chars, False
+        elif op is sre_constants.BRANCH:
+            nullable = False
+            for branch in av[1]:
+                sub_chars, sub_nullable = _first(branch, flags)
+                chars |= sub_chars
+                nullable |= sub_nullable
+            if not nullable:
+                return chars, False
+        # anchors, lookarounds and group references match empty
+    return chars, True
+
+
+def _children(op, av):
+    '''sub sequences of a compound item'''
+    if op in REPEATS:
+        return [av[2]]
+    if op is sre_constants.SUBPATTERN:
+        return [av[-1]]
+    if op is ATOMIC:
+        return [av]
+    if op is sre_constants.BRANCH:
+        return av[1]
+    if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        return [av[1]]
+    if op is sre_constants.GROUPREF_EXISTS:
+        return [branch for branch in av[1:] if branch]
+    return []
+
+
+def _unwrap(items):
+    '''items of a sequence made of a single group'''
+    while len(items) == 1 and items[0][0] is sre_constants.SUBPATTERN:
+        items = items[0][1][-1]
+    return list(items)
+
+
+def _sample(items, flags):
+    '''shortest string made of ALPHABET characters matching items'''
+    text = []
+    for op, av in items:
+        if op in SINGLE_CHARS:
+            chars = _char_set(op, av, flags)
+            text.append(next((c for c in ALPHABET if c in chars), ''))
+        elif op in REPEATS:
+            text.append(_sample(av[2], flags) * av[0])
+        elif op is sre_constants.SUBPATTERN or op is ATOMIC:
+            text.append(_sample(_children(op, av)[0], flags))
+        elif op is sre_constants.BRANCH:
+            text.append(_sample(av[1][0], flags))
+    return ''.join(text)
+
+
+def _char_class(av):
+    text = []
+    for op, value in av:
+        if op is sre_constants.NEGATE:
+            text.append('^')
+        elif op is sre_constants.LITERAL:
+            text.append(re.escape(chr(value)))
+        elif op is sre_constants.RANGE:
+            text.append('{}-{}'.format(re.escape(chr(value[0])),
+                                       re.escape(chr(value[1]))))
+        elif op is sre_constants.CATEGORY:
+            text.append(CATEGORIES.get(str(value), '?'))
+    return ''.join(text)
+
+
+def _fragment(items):
+    '''regular expression text of a parsed sub pattern, group names and
+       flags are not kept by the re parser'''
+    text = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            text.append(re.escape(chr(av)))
+        elif op is sre_constants.NOT_LITERAL:
+            text.append('[^{}]'.format(re.escape(chr(av))))
+        elif op is sre_constants.ANY:
+            text.append('.')
+        elif op is sre_constants.IN:
+            if len(av) == 1 and av[0][0] is sre_constants.CATEGORY:
+                text.append(_char_class(av))
+            else:
+                text.append('[{}]'.format(_char_class(av)))
+        elif op in REPEATS:
+            low, high = av[0], av[1]
+            quantifier = {(0, MAXREPEAT): '*', (1, MAXREPEAT): '+',
+                          (0, 1): '?'}.get((low, high))
+            if quantifier is None:
+                quantifier = '{{{},{}}}'.format(
+                    low, '' if high == MAXREPEAT else high)
+            if op is sre_constants.MIN_REPEAT:
+                quantifier += '?'
+            body = _fragment(av[2])
+            if len(av[2]) != 1 or av[2][0][0] in REPEATS:
+                body = '(?:{})'.format(body)
+            text.append(body + quantifier)
+        elif op is sre_constants.SUBPATTERN:
+            text.append('({})'.format(_fragment(av[-1])))
+        elif op is sre_constants.BRANCH:
+            text.append('|'.join(_fragment(branch) for branch in av[1]))
+        elif op is sre_constants.AT:
+            text.append(ANCHORS.get(str(av), ''))
+        else:
+            text.append('(?...)')
+    return ''.join(text)
+
+
+def _is_unbounded(op, av):
+    return op in REPEATS and av[1] == MAXREPEAT and \
+        op is not getattr(sre_constants, 'POSSESSIVE_REPEAT', None)
+
+
+def _nested_hazard(body, flags):
+    '''pump character of an ambiguous unbounded repeat inside the body of
+       an unbounded repeat, None when there is none'''
+    body = _unwrap(body)
+    for index, (op, av) in enumerate(body):
+        if not _is_unbounded(op, av):
+            continue
+        inner = _alphabet(av[2], flags)
+        if not inner:
+            continue
+        # the other items of the body either match empty or share
+        # characters with the inner repeat, the pumped characters can be
+        # split between the iterations in many ways
+        others = body[:index] + body[index + 1:]
+        ambiguous = True
+        for item in others:
+            _, nullable = _first([item], flags)
+            if not nullable and not (_alphabet([item], flags) & inner):
+                ambiguous = False
+                break
+        if ambiguous:
+            # prefer the characters every other item can take as well
+            shared = set(inner)
+            for item in others:
+                if not _first([item], flags)[1]:
+                    shared &= _alphabet([item], flags)
+            chars = shared or inner
+            return next(c for c in ALPHABET if c in chars)
+    return None
+
+
+def _alternation_hazard(body, flags):
+    '''pump character shared by two branches of an alternation repeated
+       without bound, None when the branches start differently'''
+    body = _unwrap(body)
+    if len(body) != 1 or body[0][0] is not sre_constants.BRANCH:
+        return None
+    seen = set()
+    for branch in body[0][1][1]:
+        chars, _ = _first(branch, flags)
+        common = seen & chars
+        if common:
+            return next(c for c in ALPHABET if c in common)
+        seen |= chars
+    return None
+
+
+def _walk(items, flags, prefix, hazards):
+    for op, av in items:
+        if _is_unbounded(op, av):
+            pump = _nested_hazard(av[2], flags)
+            kind = 'nested_quantifier'
+            if pump is None:
+                pump = _alternation_hazard(av[2], flags)
+                kind = 'overlapping_alternation'
+            if pump is not None:
+                hazards.append(Hazard(kind, _fragment([(op, av)]),
+                                      prefix, pump))
+        for sub_items in _children(op, av):
+            if op not in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+                _walk(sub_items, flags, prefix, hazards)
+        prefix += _sample([(op, av)], flags)
+
+
+def find_hazards(pattern, flags=0):
+    '''Return the catastrophic-backtracking shapes of a pattern
+
+        Args:
+            pattern (`str`): regular expression
+            flags (`int`): re flags the pattern is compiled with
+
+        Returns:
+            list of Hazard, empty when the pattern is safe or invalid
+
+        example:
+
+            >>> find_hazards(r'\\[(?P<pref>[\\d\\/]+)+\\]')
+            >>> [Hazard(kind='nested_quantifier', fragment=..., prefix='[',
+                        pump='0')]
+    '''
+    try:
+        with warnings.catch_warnings():
+            # FutureWarning of the patterns with a '[' in a set
+            warnings.simplefilter('ignore')
+            parsed = sre_parse.parse(pattern, flags)
+    except (re.error, RecursionError, OverflowError):
+        return []
+    # inline flags such as (?i) are set on the parser state
+    state = getattr(parsed, 'state', None) or parsed.pattern
+    flags = int(flags) | int(state.flags)
+    hazards = []
+    _walk(list(parsed), flags, '', hazards)
+    return hazards
+
+
+# ------------------------------------------------------------------------------
+#   Timing
+# ------------------------------------------------------------------------------
+def adversarial_input(pattern, hazard, size, flags=0):
+    '''Line making pattern backtrack on hazard: the prefix matching the
+       items before it, size pump characters and a suffix failing the match
+
+        Returns:
+            str, None when no suffix makes the match fail
+    '''
+    regex = re.compile(pattern, flags)
+    base = hazard.prefix + hazard.pump * size
+    for suffix in FAIL_SUFFIXES:
+        if regex.match(hazard.prefix + hazard.pump * 4 + suffix) is None:
+            return base + suffix
+    return None
+
+
+def _time_worker(pattern, flags, lines, conn):
+    regex = re.compile(pattern, flags)
+    for size, line in lines:
+        start = time.perf_counter()
+        regex.match(line)
+        conn.send((size, time.perf_counter() - start))
+    conn.close()
+
+
+def time_hazard(pattern, hazard, flags=0, sizes=DEFAULT_SIZES,
+                timeout=DEFAULT_TIMEOUT):
+    '''Time pattern on adversarial lines of growing sizes
+
+    The matches run in a child process, killed when all of them take more
+    than timeout seconds: the re module cannot be interrupted otherwise.
+
+        Args:
+            pattern (`str`): regular expression
+            hazard (`Hazard`): hazard found in the pattern
+            flags (`int`): re flags
+            sizes (`tuple`): numbers of pump characters
+            timeout (`float`): seconds allowed for all the sizes
+
+        Returns:
+            tuple of ([(size, seconds)], timed_out, sample line)
+    '''
+    lines = []
+    for size in sizes:
+        line = adversarial_input(pattern, hazard, size, flags)
+        if line is None:
+            return [], False, None
+        lines.append((size, line))
+
+    parent, child = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_time_worker,
+                                      args=(pattern, flags, lines, child),
+                                      daemon=True)
+    process.start()
+    child.close()
+
+    timings = []
+    deadline = time.monotonic() + timeout
+    timed_out = False
+    while len(timings) < len(lines):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not parent.poll(remaining):
+            timed_out = True
+            break
+        try:
+            timings.append(parent.recv())
+        except EOFError:
+            break
+
+    if timed_out:
+        process.kill()
+    process.join()
+    parent.close()
+    return timings, timed_out, lines[-1][1]
+
+
+# ------------------------------------------------------------------------------
+#   Report
+# ------------------------------------------------------------------------------
+def audit(paths=None, os_names=None, timing=True, sizes=DEFAULT_SIZES,
+          timeout=DEFAULT_TIMEOUT, threshold=SLOW_THRESHOLD, jobs=None):
+    '''Find and time the hazardous patterns of the parser modules
+
+        Args:
+            paths (`list`): files or folders, the parser packages by default
+            os_names (`list`): only the parser packages of these os
+            timing (`bool`): time the hazards, statically flagged otherwise
+            sizes (`tuple`): numbers of pump characters
+            timeout (`float`): seconds allowed per hazard
+            threshold (`float`): seconds above which a match is catastrophic
+            jobs (`int`): hazards timed at once, defaults to the number of
+                          cpus
+
+        Returns:
+            list of report dicts with keys 'module', 'line', 'pattern',
+            'kind', 'fragment', 'timings', 'worst', 'input' and 'status':
+                * catastrophic: the adversarial line took longer than
+                                threshold, or timed out
+                * ok: the adversarial line was rejected quickly
+                * flagged: not timed, or no failing line could be built
+    '''
+    found = []
+    for site in extract_patterns(paths, os_names):
+        for hazard in find_hazards(site.pattern, site.flags):
+            found.append((site, hazard))
+
+    timed = {}
+    if timing:
+        # the same pattern is often compiled in several parsers
+        keys = list(OrderedDict.fromkeys(
+            (site.pattern, site.flags, hazard) for site, hazard in found))
+        # each timing waits on its own child process
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            results = pool.map(
+                lambda key: time_hazard(key[0], key[2], key[1], sizes,
+                                        timeout), keys)
+            timed = dict(zip(keys, results))
+
+    report = []
+    for site, hazard in found:
+        entry = {
+            'module': site.module,
+            'line': site.line,
+            'pattern': site.pattern,
+            'kind': hazard.kind,
+            'fragment': hazard.fragment,
+            'timings': [],
+            'worst': None,
+            'input': None,
+            'status': 'flagged',
+        }
+        timings, timed_out, line = timed.get(
+            (site.pattern, site.flags, hazard), ([], False, None))
+        if line is not None:
+            worst = max((t for _, t in timings), default=0.0)
+            entry.update({
+                'timings': timings,
+                'worst': None if timed_out else worst,
+                'input': line,
+                'status': 'catastrophic'
+                          if timed_out or worst > threshold else 'ok',
+            })
+        report.append(entry)
+    return report
+
+
+def format_report(report):
+    '''text table of an audit report, catastrophic patterns first'''
+    order = {'catastrophic': 0, 'flagged': 1, 'ok': 2}
+    lines = []
+    for entry in sorted(report, key=lambda e: (order[e['status']],
+                                               e['module'], e['line'])):
+        worst = entry['worst']
+        if entry['status'] == 'catastrophic' and worst is None:
+            worst = 'timeout'
+        elif worst is not None:
+            worst = '{:.4f}s'.format(worst)
+        else:
+            worst = '-'
+        lines.append('{:<13}{:>9}  {}:{}  {}  {}'.format(
+            entry['status'], worst, entry['module'], entry['line'],
+            entry['kind'], entry['fragment']))
+    counts = {status: sum(1 for e in report if e['status'] == status)
+              for status in order}
+    lines.append('{} hazards: {catastrophic} catastrophic, {flagged} '
+                 'flagged, {ok} ok'.format(len(report), **counts))
+    return '\n'.join(lines)
+
+
+def _parse_args(argv=None):
+    my_parser = argparse.ArgumentParser(
+        description='Find and time the parser regular expressions prone to '
+                    'catastrophic backtracking')
+    my_parser.add_argument('paths',
+                           nargs='*',
+                           type=pathlib.Path,
+                           help='Files or folders to audit, defaults to the '
+                                'parser packages')
+    my_parser.add_argument('--os',
+                           nargs='*',
+                           dest='os_names',
+                           help='Only audit the parser packages of these os',
+                           default=None)
+    my_parser.add_argument('--no-timing',
+                           action='store_true',
+                           help='Only report the static analysis')
+    my_parser.add_argument('-t',
+                           '--timeout',
+                           type=float,
+                           help='Seconds allowed per hazard',
+                           default=DEFAULT_TIMEOUT)
+    my_parser.add_argument('--threshold',
+                           type=float,
+                           help='Seconds above which a match is '
+                                'catastrophic',
+                           default=SLOW_THRESHOLD)
+    my_parser.add_argument('-j',
+                           '--jobs',
+                           type=int,
+                           help='Hazards timed at once, defaults to the '
+                                'number of cpus',
+                           default=None)
+    my_parser.add_argument('--json',
+                           type=str,
+                           help='Also write the report to this json file',
+                           default=None)
+    return my_parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    report = audit(paths=args.paths, os_names=args.os_names,
+                   timing=not args.no_timing, timeout=args.timeout,
+                   threshold=args.threshold, jobs=args.jobs)
+    print(format_report(report))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 1 if any(e['status'] == 'catastrophic' for e in report) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
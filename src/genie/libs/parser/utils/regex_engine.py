@@ -0,0 +1,330 @@
+r'''Regular expression engine of the parsers
+
+Parsers compile their patterns through this module instead of calling re
+directly:
+
+    >>> from genie.libs.parser.utils import regex_engine
+    >>> p1 = regex_engine.compile(r'^(?P<code>\w+) +(?P<network>\S+)$')
+
+The engine is the standard re module by default. Another engine is picked
+with set_engine, or with the GENIE_REGEX_ENGINE environment variable for the
+patterns compiled at import time:
+
+    * re: standard library
+    * regex: the 'regex' module, run in its re compatible mode (VERSION0)
+    * re2: linear time matching with the 'google-re2' module, no pattern can
+           backtrack catastrophically
+
+Patterns the engine cannot run with the same results as re fall back to re
+one by one: backreferences, lookarounds, verbose patterns, ... for re2. re2
+also hands over to re the strings where its matching differs, non ascii
+strings (\d, \w and \s are ascii only in re2) and strings ending with a new
+line ($ matches before it in re).
+'''
+
+# python
+import os
+import re
+import logging
+import contextlib
+
+try:
+    import regex
+except ImportError:
+    regex = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+log = logging.getLogger(__name__)
+
+ENGINES = ('re', 'regex', 're2')
+DEFAULT_ENGINE = 're'
+
+# flags re2 takes inline, any other flag falls back to re
+RE2_FLAGS = {
+    int(re.IGNORECASE): 'i',
+    int(re.MULTILINE): 'm',
+    int(re.DOTALL): 's',
+}
+# ascii only patterns behave the same, re2 classes are ascii
+RE2_IGNORED_FLAGS = int(re.ASCII) | int(re.UNICODE)
+
+# syntax re2 rejects or reads differently: lookarounds, conditionals and
+# backreferences, \Z, verbose and locale flags, {,n} (a literal in re2) and
+# '[[:' (a posix class in re2)
+RE2_UNSUPPORTED = re.compile(r'\(\?[<=!(#]|\(\?P=|\\[1-9ZG]|\(\?[a-zA-Z]*'
+                             r'[xLu]|\{,|\[\[:')
+
+
+def available_engines():
+    '''names of the engines installed'''
+    return tuple(name for name, module in (('re', re), ('regex', regex),
+                                           ('re2', re2))
+                 if module is not None)
+
+
+class _Re2Match(object):
+    '''re2 match giving its named groups in the order of the pattern
+
+    re2 lists the named groups by name, parsers rely on the order of re
+    when they walk groupdict.
+    '''
+
+    __slots__ = ('_match', '_names')
+
+    def __init__(self, match, names):
+        self._match = match
+        self._names = names
+
+    def groupdict(self, default=None):
+        group = self._match.group
+        return {name: default if value is None else value
+                for name, value in zip(self._names,
+                                       (group(name) for name in self._names))}
+
+    def __getitem__(self, group):
+        return self._match[group]
+
+    def __getattr__(self, name):
+        return getattr(self._match, name)
+
+
+class _Re2Pattern(object):
+    '''re2 pattern with the interface of a re pattern
+
+    The strings re2 would match differently are matched with the re
+    pattern, compiled when first needed.
+    '''
+
+    def __init__(self, pattern, flags, compiled):
+        self.pattern = pattern
+        self.flags = flags
+        self._re2 = compiled
+        self._re = None
+        self.groups = compiled.groups
+        groupindex = compiled.groupindex
+        names = tuple(sorted(groupindex, key=groupindex.get))
+        self.groupindex = {name: groupindex[name] for name in names}
+        # names to reorder the groupdict of the matches with, None when
+        # re2 lists them in the order of the pattern already
+        self._names = names if names != tuple(groupindex) else None
+
+    def _fallback(self):
+        if self._re is None:
+            self._re = re.compile(self.pattern, self.flags)
+        return self._re
+
+    def _engine(self, string):
+        if string.isascii() and not string.endswith('\n'):
+            return self._re2
+        return self._fallback()
+
+    # match, search and fullmatch are called for every line, the check of
+    # _engine is inlined
+    def match(self, string, *args):
+        if string.isascii() and not string.endswith('\n'):
+            m = self._re2.match(string, *args)
+            return _Re2Match(m, self._names) if m and self._names else m
+        return self._fallback().match(string, *args)
+
+    def search(self, string, *args):
+        if string.isascii() and not string.endswith('\n'):
+            m = self._re2.search(string, *args)
+            return _Re2Match(m, self._names) if m and self._names else m
+        return self._fallback().search(string, *args)
+
+    def fullmatch(self, string, *args):
+        if string.isascii() and not string.endswith('\n'):
+            m = self._re2.fullmatch(string, *args)
+            return _Re2Match(m, self._names) if m and self._names else m
+        return self._fallback().fullmatch(string, *args)
+
+    def findall(self, string, *args):
+        return self._engine(string).findall(string, *args)
+
+    def finditer(self, string, *args):
+        engine = self._engine(string)
+        if self._names and engine is self._re2:
+            return (_Re2Match(m, self._names)
+                    for m in engine.finditer(string, *args))
+        return engine.finditer(string, *args)
+
+    def split(self, string, maxsplit=0):
+        return self._engine(string).split(string, maxsplit)
+
+    def sub(self, repl, string, count=0):
+        return self._engine(string).sub(repl, string, count)
+
+    def subn(self, repl, string, count=0):
+        return self._engine(string).subn(repl, string, count)
+
+    def __repr__(self):
+        return 're2.compile({!r})'.format(self.pattern)
+
+
+def _compile_re(pattern, flags):
+    return re.compile(pattern, flags)
+
+
+def _compile_regex(pattern, flags):
+    try:
+        return regex.compile(pattern, flags | regex.VERSION0)
+    except (regex.error, ValueError, TypeError):
+        return re.compile(pattern, flags)
+
+
+_re2_options = None
+
+
+def _compile_re2(pattern, flags):
+    global _re2_options
+    if not isinstance(pattern, str) or RE2_UNSUPPORTED.search(pattern):
+        return re.compile(pattern, flags)
+
+    inline = ''
+    for flag, letter in RE2_FLAGS.items():
+        if flags & flag:
+            inline += letter
+    if (flags & ~RE2_IGNORED_FLAGS) & ~sum(RE2_FLAGS):
+        return re.compile(pattern, flags)
+
+    if _re2_options is None:
+        _re2_options = re2.Options()
+        # the patterns falling back to re are not errors
+        _re2_options.log_errors = False
+    try:
+        compiled = re2.compile('(?{}){}'.format(inline, pattern)
+                               if inline else pattern, _re2_options)
+    except re2.error:
+        return re.compile(pattern, flags)
+    return _Re2Pattern(pattern, flags, compiled)
+
+
+_COMPILERS = {
+    're': _compile_re,
+    'regex': _compile_regex,
+    're2': _compile_re2,
+}
+
+# (pattern, flags) -> compiled pattern, for the engine in use. Parsers
+# compile their patterns on every call. Some patterns are built from the
+# arguments of the parser, the oldest entry is dropped past _MAXCACHE
+_cache = {}
+_MAXCACHE = 4096
+_engine = DEFAULT_ENGINE
+
+
+def get_engine():
+    '''name of the engine in use'''
+    return _engine
+
+
+def set_engine(name):
+    '''Use another engine for the patterns compiled from now on
+
+        Args:
+            name (`str`): 're', 'regex' or 're2'
+
+        Raises:
+            ValueError: unknown engine
+            ImportError: the module of the engine is not installed
+    '''
+    global _engine
+    if name not in ENGINES:
+        raise ValueError("Unknown regex engine '{}', expected one of "
+                         "{}".format(name, ', '.join(ENGINES)))
+    if name not in available_engines():
+        raise ImportError("The '{}' regex engine is not installed. Install "
+                          "it with 'pip install {}'".format(
+                              name, 'google-re2' if name == 're2' else name))
+    if name != _engine:
+        _cache.clear()
+        _engine = name
+
+
+@contextlib.contextmanager
+def engine(name):
+    '''Use an engine for the patterns compiled within the block
+
+        example:
+
+            >>> with regex_engine.engine('re2'):
+            ...     parsed = ShowIpRoute(device=device).parse(output=output)
+    '''
+    previous = get_engine()
+    set_engine(name)
+    try:
+        yield
+    finally:
+        set_engine(previous)
+
+
+def compile(pattern, flags=0):
+    '''Compile a pattern with the engine in use
+
+        Args:
+            pattern (`str`): regular expression
+            flags (`int`): re flags
+
+        Returns:
+            compiled pattern, with the interface of a re pattern. A pattern
+            already compiled is returned as is, as re.compile does
+    '''
+    if _engine == 're':
+        return re.compile(pattern, flags)
+    if not isinstance(pattern, (str, bytes)):
+        if flags:
+            raise ValueError('cannot process flags argument with a '
+                             'compiled pattern')
+        return pattern
+    key = (pattern, flags)
+    compiled = _cache.get(key)
+    if compiled is None:
+        if len(_cache) >= _MAXCACHE:
+            del _cache[next(iter(_cache))]
+        compiled = _cache[key] = _COMPILERS[_engine](pattern, int(flags))
+    return compiled
+
+
+def match(pattern, string, flags=0):
+    return compile(pattern, flags).match(string)
+
+
+def search(pattern, string, flags=0):
+    return compile(pattern, flags).search(string)
+
+
+def fullmatch(pattern, string, flags=0):
+    return compile(pattern, flags).fullmatch(string)
+
+
+def findall(pattern, string, flags=0):
+    return compile(pattern, flags).findall(string)
+
+
+def finditer(pattern, string, flags=0):
+    return compile(pattern, flags).finditer(string)
+
+
+def split(pattern, string, maxsplit=0, flags=0):
+    return compile(pattern, flags).split(string, maxsplit)
+
+
+def sub(pattern, repl, string, count=0, flags=0):
+    return compile(pattern, flags).sub(repl, string, count)
+
+
+def _engine_from_environment():
+    name = os.environ.get('GENIE_REGEX_ENGINE')
+    if not name:
+        return
+    try:
+        set_engine(name)
+    except (ValueError, ImportError) as e:
+        log.warning('{}, using the re engine'.format(e))
+
+
+_engine_from_environment()
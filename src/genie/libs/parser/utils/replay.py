@@ -0,0 +1,411 @@
+'''Replay devices for offline load and latency testing
+
+A replay device stands in for a connected device: its ``execute`` serves
+recorded outputs, keyed by command, after a simulated latency, and its
+``parse`` resolves and runs the real parser, recording how long each parse
+took. Many replay devices can share the same recordings in one process,
+to load the whole collection stack without any device:
+
+    >>> from genie.libs.parser.utils.replay import Latency, \\
+    ...     load_recordings, replay_devices, summarize
+    >>> recordings = load_recordings('captures/')
+    >>> devices = replay_devices(recordings, count=500, os='iosxe',
+    ...                          latency={'show ip route*': Latency(0.5, 0.2),
+    ...                                   '*': Latency(0.05, 0.01)})
+    >>> parsed = devices[0].parse('show ip route')
+    >>> summarize(timing for device in devices for timing in device.timings)
+
+Recordings are read from a folder laid out as the unittests folders (see
+bulk.iter_folder_records), a zip or tar archive of such a folder, or a
+JSON Lines file of {"tokens": ..., "command": ..., "output": ...}. A
+command recorded several times is answered with its outputs in turn, and
+a command not recorded raises OfflineExecuteError.
+
+AsyncReplayDevice has a coroutine ``execute``, for asyncio pipelines and
+async_parse.aparse_command; its latency does not hold a thread.
+'''
+
+# python
+import os
+import json
+import math
+import time
+import random
+import asyncio
+import fnmatch
+import pathlib
+import logging
+import tarfile
+import zipfile
+import tempfile
+import itertools
+import threading
+from collections import namedtuple, OrderedDict
+
+from .common import get_parser
+from .bulk import OfflineDevice, OfflineExecuteError, BulkRecord, \
+    iter_folder_records
+from .async_parse import aparse
+
+log = logging.getLogger(__name__)
+
+DISTRIBUTIONS = ('constant', 'uniform', 'normal', 'lognormal', 'exponential')
+
+# timing of a parse of a replay device, times in seconds
+ParseTiming = namedtuple('ParseTiming', ['device', 'command', 'parser',
+                                         'start', 'elapsed', 'error'])
+
+
+class Latency(object):
+    '''Distribution of the latency of a command, in seconds
+
+        Args:
+            mean (`float`): mean latency
+            jitter (`float`): spread around the mean: half width of the
+                              uniform distribution, standard deviation of
+                              the normal and lognormal ones
+            distribution (`str`): one of DISTRIBUTIONS, 'exponential' only
+                                  uses the mean
+            seed (`int`): seed of the random generator, for reproducible
+                          runs
+    '''
+    def __init__(self, mean=0.0, jitter=0.0, distribution='uniform',
+                 seed=None):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError("Unknown distribution '{}', expected one of "
+                             "{}".format(distribution,
+                                         ', '.join(DISTRIBUTIONS)))
+        if mean < 0 or jitter < 0:
+            raise ValueError('mean and jitter must be positive')
+        self.mean = mean
+        self.jitter = jitter
+        self.distribution = distribution
+        self._random = random.Random(seed)
+
+    def sample(self):
+        '''one latency, never negative'''
+        mean, jitter = self.mean, self.jitter
+        if self.distribution == 'constant' or not mean and not jitter:
+            value = mean
+        elif self.distribution == 'uniform':
+            value = self._random.uniform(mean - jitter, mean + jitter)
+        elif self.distribution == 'normal':
+            value = self._random.gauss(mean, jitter)
+        elif self.distribution == 'lognormal':
+            # mean and standard deviation of the latency itself
+            sigma2 = math.log(1 + (jitter / mean) ** 2) if mean else 0.0
+            value = self._random.lognormvariate(
+                math.log(mean) - sigma2 / 2, math.sqrt(sigma2)) \
+                if mean else 0.0
+        else:
+            value = self._random.expovariate(1 / mean) if mean else 0.0
+        return max(value, 0.0)
+
+    def __repr__(self):
+        return '<{} {} {}s +/- {}s>'.format(self.__class__.__name__,
+                                            self.distribution, self.mean,
+                                            self.jitter)
+
+
+def _as_latency(value):
+    if value is None:
+        return None
+    if isinstance(value, Latency):
+        return value
+    return Latency(float(value), distribution='constant')
+
+
+def _normalize_command(command):
+    return ' '.join(command.split())
+
+
+def _read_jsonl(path):
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield BulkRecord(record.get('tokens') or {},
+                                 record['command'], record['output'])
+
+
+def _extract_tar(archive, folder):
+    '''extract a tar archive, refusing members outside of folder'''
+    if hasattr(tarfile, 'data_filter'):
+        archive.extractall(folder, filter='data')
+        return
+
+    # python builds older than the extraction filters (3.9.17, 3.10.12,
+    # 3.11.4): only regular files and folders, within folder
+    root = os.path.realpath(folder)
+    members = []
+    for member in archive.getmembers():
+        target = os.path.realpath(os.path.join(root, member.name))
+        if os.path.commonpath([root, target]) != root:
+            raise ValueError("Archive member '{}' is outside of the "
+                             "archive".format(member.name))
+        if member.isfile() or member.isdir():
+            members.append(member)
+    archive.extractall(folder, members=members)
+
+
+def load_recordings(path):
+    '''Read recorded outputs
+
+        Args:
+            path (`str`): folder laid out as the unittests folders, zip or
+                          tar archive of such a folder, or JSON Lines file
+
+        Returns:
+            list of BulkRecord
+    '''
+    path = pathlib.Path(path)
+    if path.is_dir():
+        return list(iter_folder_records(path))
+    if path.suffix in ('.jsonl', '.json'):
+        return list(_read_jsonl(path))
+    if zipfile.is_zipfile(path) or tarfile.is_tarfile(path):
+        with tempfile.TemporaryDirectory() as folder:
+            if zipfile.is_zipfile(path):
+                with zipfile.ZipFile(path) as archive:
+                    archive.extractall(folder)
+            else:
+                with tarfile.open(path) as archive:
+                    _extract_tar(archive, folder)
+            return list(iter_folder_records(folder))
+    raise ValueError("Cannot read recordings from '{}'".format(path))
+
+
+class ReplayDevice(OfflineDevice):
+    '''Device serving recorded outputs after a simulated latency
+
+        Args:
+            name (`str`): device name
+            outputs (`dict`): command -> output, or list of outputs
+                              answered in turn. Devices can share it
+            latency: latency of all the commands, in seconds or as a
+                     Latency, or dict of command or fnmatch pattern ->
+                     latency, tried in order. No latency by default
+            tokens: abstract tokens of the device, at least os
+
+        Attributes:
+            timings (`list`): ParseTiming of each parse()
+            executes (`int`): number of commands executed
+    '''
+    def __init__(self, name='replay', outputs=None, latency=None, **tokens):
+        super().__init__(name, **tokens)
+        self.outputs = {}
+        for command, output in (outputs or {}).items():
+            self.outputs[_normalize_command(command)] = \
+                [output] if isinstance(output, str) else list(output)
+        if isinstance(latency, dict):
+            self._latencies = OrderedDict(
+                (pattern, _as_latency(value))
+                for pattern, value in latency.items())
+        else:
+            self._latencies = OrderedDict([('*', _as_latency(latency))])
+        self._cycles = {}
+        self._lock = threading.Lock()
+        self.timings = []
+        self.executes = 0
+
+    @classmethod
+    def from_records(cls, records, name='replay', latency=None, **tokens):
+        '''replay device of the records of its os
+
+            Args:
+                records (`iterable`): BulkRecord or (tokens, command, output)
+                name (`str`): device name
+                latency: see ReplayDevice
+                tokens: abstract tokens of the device, defaults to the
+                        tokens of the first record
+
+            Returns:
+                ReplayDevice
+        '''
+        outputs = OrderedDict()
+        for record in records:
+            record_tokens, command, output = record[:3]
+            if isinstance(record_tokens, str):
+                record_tokens = {'os': record_tokens}
+            if not tokens:
+                tokens = dict(record_tokens)
+            if record_tokens.get('os') != tokens.get('os'):
+                continue
+            outputs.setdefault(command, []).append(output)
+        return cls(name, outputs, latency=latency, **tokens)
+
+    def latency(self, command):
+        '''Latency of a command, None when it has none'''
+        command = _normalize_command(command)
+        if command in self._latencies:
+            return self._latencies[command]
+        for pattern, latency in self._latencies.items():
+            if fnmatch.fnmatchcase(command, pattern):
+                return latency
+        return None
+
+    def _output(self, command):
+        command = _normalize_command(command)
+        try:
+            cycle = self._cycles[command]
+        except KeyError:
+            try:
+                outputs = self.outputs[command]
+            except KeyError:
+                raise OfflineExecuteError(self.name, command) from None
+            with self._lock:
+                cycle = self._cycles.setdefault(command,
+                                                itertools.cycle(outputs))
+        with self._lock:
+            self.executes += 1
+            return next(cycle)
+
+    def _delay(self, command):
+        latency = self.latency(command)
+        return latency.sample() if latency is not None else 0.0
+
+    def execute(self, command, *args, **kwargs):
+        output = self._output(command)
+        delay = self._delay(command)
+        if delay:
+            time.sleep(delay)
+        return output
+
+    def _timing(self, command, parser_cls, start, error):
+        self.timings.append(ParseTiming(
+            self.name, command,
+            parser_cls.__name__ if parser_cls is not None else None,
+            start, time.perf_counter() - start, error))
+
+    def parse(self, command, **kwargs):
+        '''Resolve a show command to its parser and parse it, as a
+        connected device does
+
+            Args:
+                command (`str`): show command to parse
+                kwargs: passed to the parse
+
+            Returns:
+                parsed output
+        '''
+        start = time.perf_counter()
+        parser_cls = error = None
+        try:
+            parser_cls, parser_kwargs = get_parser(command, self)
+            parser_kwargs.update(kwargs)
+            return parser_cls(device=self).parse(**parser_kwargs)
+        except Exception as e:
+            error = e.__class__.__name__
+            raise
+        finally:
+            self._timing(command, parser_cls, start, error)
+
+    def __repr__(self):
+        return '<{} {} {} commands>'.format(self.__class__.__name__,
+                                            self.name, len(self.outputs))
+
+
+class AsyncReplayDevice(ReplayDevice):
+    '''Replay device with a coroutine execute, see ReplayDevice'''
+
+    async def execute(self, command, *args, **kwargs):
+        output = self._output(command)
+        delay = self._delay(command)
+        if delay:
+            await asyncio.sleep(delay)
+        return output
+
+    async def aparse(self, command, **kwargs):
+        '''Resolve a show command to its parser and parse it without
+        blocking the event loop, see async_parse.aparse_command
+
+            Args:
+                command (`str`): show command to parse
+                kwargs: passed to aparse
+
+            Returns:
+                parsed output
+        '''
+        start = time.perf_counter()
+        parser_cls = error = None
+        try:
+            parser_cls, parser_kwargs = get_parser(command, self)
+            parser_kwargs.update(kwargs)
+            return await aparse(parser_cls(device=self), **parser_kwargs)
+        except Exception as e:
+            error = e.__class__.__name__
+            raise
+        finally:
+            self._timing(command, parser_cls, start, error)
+
+    def parse(self, command, **kwargs):
+        raise TypeError('{} executes asynchronously, use aparse()'.format(
+            self.__class__.__name__))
+
+
+def replay_devices(records, count=1, os=None, latency=None,
+                   device_class=ReplayDevice, prefix='replay'):
+    '''Simulated devices sharing the recorded outputs
+
+        Args:
+            records (`iterable`): recordings, see load_recordings
+            count (`int`): number of devices per os
+            os (`str`): only the devices of this os, all by default
+            latency: latency of the devices, see ReplayDevice
+            device_class (`class`): ReplayDevice or AsyncReplayDevice
+            prefix (`str`): prefix of the device names
+
+        Returns:
+            list of devices, named <prefix>-<os>-<n>
+    '''
+    per_os = OrderedDict()
+    for record in records:
+        tokens, command, output = record[:3]
+        if isinstance(tokens, str):
+            tokens = {'os': tokens}
+        if os is not None and tokens.get('os') != os:
+            continue
+        per_os.setdefault(tokens.get('os'), []).append(
+            BulkRecord({'os': tokens.get('os')}, command, output))
+
+    devices = []
+    for os_name, os_records in per_os.items():
+        template = device_class.from_records(os_records, os=os_name)
+        for number in range(count):
+            # the outputs are shared, only the replay state is per device
+            device = device_class('{}-{}-{}'.format(prefix, os_name, number),
+                                  latency=latency, os=os_name)
+            device.outputs = template.outputs
+            devices.append(device)
+    return devices
+
+
+def _percentile(values, percent):
+    index = min(len(values) - 1,
+                max(0, int(math.ceil(percent / 100 * len(values))) - 1))
+    return values[index]
+
+
+def summarize(timings):
+    '''Statistics of parse timings
+
+        Args:
+            timings (`iterable`): ParseTiming
+
+        Returns:
+            dict with count, errors and the mean, p50, p95, p99 and max of
+            the elapsed times, in seconds
+    '''
+    timings = list(timings)
+    elapsed = sorted(timing.elapsed for timing in timings)
+    summary = {'count': len(timings),
+               'errors': sum(1 for timing in timings if timing.error)}
+    if elapsed:
+        summary.update({
+            'mean': sum(elapsed) / len(elapsed),
+            'p50': _percentile(elapsed, 50),
+            'p95': _percentile(elapsed, 95),
+            'p99': _percentile(elapsed, 99),
+            'max': elapsed[-1],
+        })
+    return summary
@@ -0,0 +1,410 @@
+'''Longest prefix match index of parsed routing tables
+
+Answers "which route and next hops does 10.1.2.3 use in vrf X" without
+walking the parsed dicts, for the outputs of:
+
+    * iosxe ShowIpRoute / ShowIpv6Route        (show ip route)
+    * nxos ShowIpRoute / ShowIpv6Route         (show ip route)
+    * junos ShowRoute                          (show route)
+
+Each (vrf, ip version) table is a radix trie flattened in integer arrays:
+the prefixes sorted by (network, length) are the preorder of the trie, and
+each prefix keeps the position of its closest covering prefix. A lookup is
+a bisect over the networks and a walk up to the first prefix holding the
+address, the prefixes covered by a prefix are a contiguous range of the
+preorder. The protocol and next hops of the routes are interned, a route
+costs a few bytes of arrays instead of its nested dicts.
+
+    >>> from genie.libs.parser.utils.route_index import RouteIndex, diff
+    >>> index = RouteIndex.from_parsed(device.parse('show ip route vrf X'))
+    >>> index.lookup('10.1.2.3', vrf='X')
+    Route(vrf='X', prefix='10.1.2.0/24', protocol='bgp',
+          next_hops=(NextHop(address='192.168.0.1', interface=None),))
+    >>> index.covered('10.1.0.0/16', vrf='X')
+    >>> diff(yesterday, index).added
+
+Indexes are built from any number of parsed outputs, or from routes
+streamed to a RouteIndexBuilder, eg. one device at a time.
+'''
+
+# python
+import re
+import socket
+import ipaddress
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple, OrderedDict
+
+NextHop = namedtuple('NextHop', ['address', 'interface'])
+
+Route = namedtuple('Route', ['vrf', 'prefix', 'protocol', 'next_hops'])
+
+RouteDiff = namedtuple('RouteDiff', ['added', 'removed', 'changed'])
+
+# 4 bytes per ipv4 network
+IPV4_TYPECODE = next(code for code in 'ILQ'
+                     if array(code).itemsize >= 4)
+
+# VRF1.inet.0   inet6.0   inet.3
+JUNOS_TABLE = re.compile(r'^(?:(?P<vrf>.+)\.)?inet6?\.(?P<number>\d+)$')
+
+# junos active-tag of the active route
+JUNOS_ACTIVE = ('*', '+')
+
+
+def _parse_prefix(prefix):
+    '''(version, network, length) of a prefix string, host bits cleared'''
+    address, _, length = prefix.partition('/')
+    if ':' in address:
+        network = int.from_bytes(socket.inet_pton(socket.AF_INET6,
+                                                  address), 'big')
+        bits, length = 128, int(length) if length else 128
+    else:
+        network = int.from_bytes(socket.inet_aton(address), 'big') \
+            if address.count('.') == 3 else None
+        if network is None:
+            raise ValueError("Invalid prefix '{}'".format(prefix))
+        bits, length = 32, int(length) if length else 32
+    if not 0 <= length <= bits:
+        raise ValueError("Invalid prefix '{}'".format(prefix))
+    host = (1 << (bits - length)) - 1
+    return (4 if bits == 32 else 6), network & ~host, length
+
+
+def _parse_address(address):
+    if ':' in address:
+        return 6, int.from_bytes(socket.inet_pton(socket.AF_INET6, address),
+                                 'big')
+    return 4, int.from_bytes(socket.inet_aton(address), 'big')
+
+
+def _format_prefix(version, network, length):
+    if version == 4:
+        return '{}/{}'.format(socket.inet_ntoa(network.to_bytes(4, 'big')),
+                              length)
+    return '{}/{}'.format(ipaddress.IPv6Address(network), length)
+
+
+def _cisco_routes(parsed):
+    for vrf, vrf_dict in parsed.get('vrf', {}).items():
+        for af_dict in vrf_dict.get('address_family', {}).values():
+            for prefix, route in af_dict.get('routes', {}).items():
+                next_hop = route.get('next_hop', {})
+                next_hops = [
+                    NextHop(hop.get('next_hop'),
+                            hop.get('outgoing_interface'))
+                    for _, hop in sorted(next_hop.get('next_hop_list',
+                                                      {}).items())]
+                next_hops.extend(
+                    NextHop(None, interface) for interface in
+                    next_hop.get('outgoing_interface', {}))
+                yield Route(vrf, route.get('route', prefix),
+                            route.get('source_protocol'), tuple(next_hops))
+
+
+def _junos_routes(parsed):
+    for table in parsed['route-information'].get('route-table', []):
+        # mpls.0, bgp.l3vpn.0 ... are not keyed by ip prefixes
+        name = table.get('table-name', '')
+        m = JUNOS_TABLE.match(name)
+        if not m:
+            continue
+        if m.group('number') != '0':
+            vrf = name
+        else:
+            vrf = m.group('vrf') or 'default'
+        for rt in table.get('rt', []):
+            entry = rt.get('rt-entry', {})
+            if 'rt-destination' not in rt or \
+                    entry.get('active-tag') not in JUNOS_ACTIVE:
+                continue
+            next_hops = tuple(
+                NextHop(hop.get('to'),
+                        hop.get('via') or hop.get('nh-local-interface'))
+                for hop in entry.get('nh', []))
+            protocol = entry.get('protocol-name')
+            yield Route(vrf, rt['rt-destination'],
+                        protocol.lower() if protocol else None, next_hops)
+
+
+def iter_routes(parsed):
+    '''Routes of a parsed routing table
+
+    Only the active routes of the inet and inet6 junos tables are used for
+    forwarding, the others are skipped. The routes of the main tables are
+    in vrf 'default', those of inet.3 ... in a vrf of the table name.
+
+        Args:
+            parsed (`dict`): output of one of the supported parsers
+
+        Returns:
+            generator of Route
+    '''
+    if 'route-information' in parsed:
+        return _junos_routes(parsed)
+    return _cisco_routes(parsed)
+
+
+class _Table(object):
+    '''one (vrf, version) table, frozen in arrays'''
+
+    __slots__ = ('version', 'bits', 'networks', 'lengths', 'parents',
+                 'groups')
+
+    def __init__(self, version, routes):
+        self.version = version
+        self.bits = 32 if version == 4 else 128
+        # preorder of the trie
+        keys = sorted(routes)
+        if version == 4:
+            self.networks = array(IPV4_TYPECODE, (key >> 8 for key in keys))
+        else:
+            self.networks = [key >> 8 for key in keys]
+        self.lengths = array('B', (key & 0xff for key in keys))
+        self.groups = array('i', (routes[key] for key in keys))
+        self.parents = array('i', bytes(4 * len(keys)))
+
+        # the stack holds the covering prefixes of the current one
+        stack = []
+        bits = self.bits
+        for position, key in enumerate(keys):
+            network = key >> 8
+            while stack and stack[-1][1] < network:
+                stack.pop()
+            self.parents[position] = stack[-1][0] if stack else -1
+            stack.append((position,
+                          network | ((1 << (bits - (key & 0xff))) - 1)))
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def last(self, position):
+        '''last address of the prefix at position'''
+        return self.networks[position] | \
+            ((1 << (self.bits - self.lengths[position])) - 1)
+
+    def lookup(self, address):
+        '''position of the longest prefix holding the address, or -1'''
+        position = bisect_right(self.networks, address) - 1
+        parents = self.parents
+        while position >= 0 and self.last(position) < address:
+            position = parents[position]
+        return position
+
+    def covering(self, network, length):
+        '''positions of the prefixes holding the prefix, longest first'''
+        last = network | ((1 << (self.bits - length)) - 1)
+        position = bisect_right(self.networks, network) - 1
+        parents = self.parents
+        while position >= 0 and (self.lengths[position] > length or
+                                  self.last(position) < last):
+            position = parents[position]
+        positions = []
+        while position >= 0:
+            positions.append(position)
+            position = parents[position]
+        return positions
+
+    def covered(self, network, length):
+        '''positions of the prefixes held by the prefix, in preorder'''
+        last = network | ((1 << (self.bits - length)) - 1)
+        lengths = self.lengths
+        return [position for position in range(
+                    bisect_left(self.networks, network),
+                    bisect_right(self.networks, last))
+                if lengths[position] >= length]
+
+    def keys(self):
+        return ((network << 8) | length
+                for network, length in zip(self.networks, self.lengths))
+
+
+class RouteIndex(object):
+    '''Longest prefix match index of routing tables, see RouteIndexBuilder
+
+        Attributes:
+            vrfs (`list`): vrfs of the index
+    '''
+
+    def __init__(self, tables, groups):
+        # (vrf, version) -> _Table
+        self._tables = tables
+        # group id -> (protocol, next_hops)
+        self._groups = groups
+
+    @classmethod
+    def from_parsed(cls, *parsed):
+        '''Index of parsed routing tables
+
+            Args:
+                parsed (`dict`): outputs of the supported parsers
+
+            Returns:
+                RouteIndex
+        '''
+        builder = RouteIndexBuilder()
+        for output in parsed:
+            builder.add_parsed(output)
+        return builder.build()
+
+    @property
+    def vrfs(self):
+        return list(OrderedDict.fromkeys(vrf for vrf, _ in self._tables))
+
+    def __len__(self):
+        return sum(len(table) for table in self._tables.values())
+
+    def _route(self, vrf, table, position):
+        protocol, next_hops = self._groups[table.groups[position]]
+        return Route(vrf, _format_prefix(table.version,
+                                         table.networks[position],
+                                         table.lengths[position]),
+                     protocol, next_hops)
+
+    def lookup(self, address, vrf='default'):
+        '''Route of the longest prefix holding the address
+
+            Args:
+                address (`str`): ipv4 or ipv6 address
+                vrf (`str`): vrf of the route
+
+            Returns:
+                Route, None when no prefix holds the address
+        '''
+        version, address = _parse_address(address)
+        table = self._tables.get((vrf, version))
+        if table is None:
+            return None
+        position = table.lookup(address)
+        if position < 0:
+            return None
+        return self._route(vrf, table, position)
+
+    def covering(self, prefix, vrf='default'):
+        '''Routes of the prefix and of the prefixes holding it
+
+            Args:
+                prefix (`str`): ipv4 or ipv6 prefix
+                vrf (`str`): vrf of the routes
+
+            Returns:
+                list of Route, longest prefix first
+        '''
+        version, network, length = _parse_prefix(prefix)
+        table = self._tables.get((vrf, version))
+        if table is None:
+            return []
+        return [self._route(vrf, table, position)
+                for position in table.covering(network, length)]
+
+    def covered(self, prefix, vrf='default'):
+        '''Routes of the prefix and of the prefixes it holds
+
+            Args:
+                prefix (`str`): ipv4 or ipv6 prefix
+                vrf (`str`): vrf of the routes
+
+            Returns:
+                list of Route, sorted by network then length
+        '''
+        version, network, length = _parse_prefix(prefix)
+        table = self._tables.get((vrf, version))
+        if table is None:
+            return []
+        return [self._route(vrf, table, position)
+                for position in table.covered(network, length)]
+
+    def routes(self, vrf=None):
+        '''every Route of the index, or of a vrf'''
+        for (table_vrf, _), table in self._tables.items():
+            if vrf is None or table_vrf == vrf:
+                for position in range(len(table)):
+                    yield self._route(table_vrf, table, position)
+
+    def __repr__(self):
+        return '<{} {} routes in {} vrfs>'.format(self.__class__.__name__,
+                                                  len(self), len(self.vrfs))
+
+
+class RouteIndexBuilder(object):
+    '''Collect routes, from parsed outputs or one by one, into a RouteIndex
+
+    A prefix added twice to a vrf keeps its last route.
+    '''
+
+    def __init__(self):
+        # (vrf, version) -> {network << 8 | length: group id}
+        self._tables = OrderedDict()
+        self._groups = []
+        self._group_ids = {}
+
+    def add(self, vrf, prefix, protocol=None, next_hops=()):
+        '''Add a route
+
+            Args:
+                vrf (`str`): vrf of the route
+                prefix (`str`): ipv4 or ipv6 prefix
+                protocol (`str`): source protocol
+                next_hops (`iterable`): NextHop or (address, interface)
+        '''
+        version, network, length = _parse_prefix(prefix)
+        group = (protocol, tuple(NextHop(*hop) for hop in next_hops))
+        try:
+            group_id = self._group_ids[group]
+        except KeyError:
+            group_id = self._group_ids[group] = len(self._groups)
+            self._groups.append(group)
+        self._tables.setdefault((vrf, version), {})[
+            (network << 8) | length] = group_id
+
+    def add_routes(self, routes):
+        '''Add Route tuples, see iter_routes'''
+        for route in routes:
+            self.add(*route)
+
+    def add_parsed(self, parsed):
+        '''Add the routes of a parsed output, see iter_routes'''
+        self.add_routes(iter_routes(parsed))
+
+    def build(self):
+        '''RouteIndex of the routes added so far'''
+        tables = OrderedDict(
+            (key, _Table(key[1], routes))
+            for key, routes in self._tables.items())
+        return RouteIndex(tables, list(self._groups))
+
+
+def diff(old, new):
+    '''Routes added, removed and changed between two snapshots
+
+        Args:
+            old (`RouteIndex`): first snapshot
+            new (`RouteIndex`): second snapshot
+
+        Returns:
+            RouteDiff of the lists of added Route, removed Route, and
+            (old Route, new Route) of the prefixes whose protocol or next
+            hops changed
+    '''
+    added, removed, changed = [], [], []
+    for key in OrderedDict.fromkeys(list(old._tables) + list(new._tables)):
+        vrf = key[0]
+        old_table, new_table = old._tables.get(key), new._tables.get(key)
+        old_routes = dict(zip(old_table.keys(), range(len(old_table)))) \
+            if old_table is not None else {}
+        new_routes = dict(zip(new_table.keys(), range(len(new_table)))) \
+            if new_table is not None else {}
+
+        for route_key in sorted(new_routes.keys() - old_routes.keys()):
+            added.append(new._route(vrf, new_table, new_routes[route_key]))
+        for route_key in sorted(old_routes.keys() - new_routes.keys()):
+            removed.append(old._route(vrf, old_table,
+                                      old_routes[route_key]))
+        for route_key in sorted(old_routes.keys() & new_routes.keys()):
+            old_position = old_routes[route_key]
+            new_position = new_routes[route_key]
+            if old._groups[old_table.groups[old_position]] != \
+                    new._groups[new_table.groups[new_position]]:
+                changed.append((old._route(vrf, old_table, old_position),
+                                new._route(vrf, new_table, new_position)))
+    return RouteDiff(added, removed, changed)
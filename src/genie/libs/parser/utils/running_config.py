@@ -0,0 +1,243 @@
+'''Section level incremental parsing of running configurations
+
+Running configurations are made of top-level stanzas: a line starting at
+column 0 (``interface GigabitEthernet1``, ``router bgp 65000``,
+``policy-map PM``) followed by its indented sub-commands. Stanzas are
+independent, and between two archives of the same device only a few of them
+change.
+
+``IncrementalConfigParser`` splits a configuration into stanzas, hashes each
+of them and runs the wrapped running-config parser only on stanzas it has not
+seen before. Parsed fragments are cached per stanza hash and merged back into
+the schema-shaped result, which is validated against the parser schema
+before being returned: fragments touching the same keys are deep merged, and
+only the merged result tells whether they fit together. The validation mode
+of the parser results applies (GENIE_SCHEMA_VALIDATION, see
+utils/schema_compiler.py).
+
+Supported parsers are the ones whose output is the union of what each
+stanza contributes on its own, for example from iosxe/show_run.py:
+``ShowRunInterface``, ``ShowRunSectionBgp``, ``ShowRunningConfigNve`` and
+``ShowRunPolicyMap``. A parser which needs some stanzas to make sense of the
+others (eg. ``interface VlanX`` needs ``vlan configuration X``) lists the
+patterns of those stanzas in its ``incremental_context`` attribute. Context
+stanzas are parsed along with every changed stanza, and any change to them
+invalidates the cache.
+
+Whenever a stanza cannot be parsed on its own (eg. a capture which lost its
+indentation), the whole configuration is parsed in one pass instead.
+
+Example:
+
+    >>> from genie.libs.parser.iosxe.show_run import ShowRunInterface
+    >>> from genie.libs.parser.utils.running_config import \\
+    ...     IncrementalConfigParser
+    >>> parser = IncrementalConfigParser(ShowRunInterface)
+    >>> parsed = parser.parse(output=config_monday)
+    >>> parsed = parser.parse(output=config_tuesday)   # only changes parsed
+'''
+
+# python
+import re
+import hashlib
+import logging
+
+from genie.metaparser import _metaparser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+log = logging.getLogger(__name__)
+
+
+def split_stanzas(output):
+    '''Split a configuration into top-level stanzas.
+
+    A stanza starts on a non indented line and holds every following
+    indented line. Non indented '!' separators end the current stanza.
+
+        Args:
+            output (`str`): configuration text
+
+        Returns:
+            list of stanza strings
+    '''
+    stanzas = []
+    current = []
+
+    for line in output.splitlines():
+        line = line.rstrip()
+        if line == '!':
+            if current:
+                stanzas.append('\n'.join(current))
+                current = []
+            continue
+
+        if not line or line[0] in (' ', '\t'):
+            # sub-command, stays with its parent stanza. Orphan indented
+            # lines (eg. a '| section' output starting mid-block) form a
+            # stanza of their own
+            current.append(line)
+            continue
+
+        if current:
+            stanzas.append('\n'.join(current))
+        current = [line]
+
+    if current:
+        stanzas.append('\n'.join(current))
+
+    return stanzas
+
+
+def stanza_hash(stanza):
+    '''stable digest of a stanza'''
+    return hashlib.blake2b(stanza.encode(), digest_size=16).digest()
+
+
+def merge_fragment(result, fragment):
+    '''Deep merge a parsed fragment into result without sharing any mutable
+    value with the fragment, so cached fragments are never altered.
+
+        Args:
+            result (`dict`): merged result, updated in place
+            fragment (`dict`): parsed output of a single stanza
+
+        Returns:
+            result
+    '''
+    for key, value in fragment.items():
+        if isinstance(value, dict):
+            existing = result.get(key)
+            if not isinstance(existing, dict):
+                existing = result[key] = {}
+            merge_fragment(existing, value)
+        elif isinstance(value, list):
+            existing = result.get(key)
+            if isinstance(existing, list):
+                existing.extend(v for v in value if v not in existing)
+            else:
+                result[key] = list(value)
+        else:
+            result[key] = value
+    return result
+
+
+class IncrementalConfigParser(object):
+    '''Parse running configurations stanza by stanza, re-parsing only the
+    stanzas which changed since the previous parse.
+
+        Args:
+            parser_cls (`class`): running-config parser class
+            device (`Device`): device handed to the parser, only used to
+                               execute the parser command when no output
+                               is provided
+            context (`list`): patterns matching the first line of the
+                              stanzas other stanzas depend on, defaults to
+                              the parser ``incremental_context`` attribute
+            kwargs: passed to the parser ``cli()``, eg. name for
+                    ShowRunPolicyMap
+    '''
+    def __init__(self, parser_cls, device=None, context=None, **kwargs):
+        self.parser_cls = parser_cls
+        self.device = device
+        self.kwargs = kwargs
+        self.schema = getattr(parser_cls, 'schema', None)
+        if context is None:
+            context = getattr(parser_cls, 'incremental_context', [])
+        self.context = [re.compile(c) for c in context]
+        self._context_key = None
+        self._fragments = {}
+        self.stats = {'stanzas': 0, 'parsed': 0, 'cached': 0,
+                      'fallback': False}
+
+    def _parse_output(self, output):
+        parser = self.parser_cls(device=self.device)
+        return parser.cli(output=output, **self.kwargs) or {}
+
+    def _is_context(self, stanza):
+        first_line = stanza.split('\n', 1)[0]
+        return any(p.match(first_line) for p in self.context)
+
+    def parse(self, output=None):
+        '''Parse a configuration.
+
+            Args:
+                output (`str`): configuration, executed on the device with
+                                the parser command when not provided
+
+            Returns:
+                parsed output, validated against the parser schema
+
+            Raises:
+                SchemaEmptyParserError: nothing parsed
+                SchemaError: merged fragments do not match the parser schema
+        '''
+        if output is None:
+            command = self.parser_cls.cli_command
+            if not isinstance(command, str):
+                command = command[-1]
+            output = self.device.execute(command.format(**self.kwargs))
+
+        stanzas = split_stanzas(output)
+
+        # context stanzas are parsed with every other stanza, a change in
+        # them makes every cached fragment stale
+        context = '\n!\n'.join(s for s in stanzas if self._is_context(s))
+        context_key = stanza_hash(context)
+        if context_key != self._context_key:
+            self._fragments = {}
+            self._context_key = context_key
+        prefix = context + '\n!\n' if context else ''
+
+        # stanza hash -> parsed fragment
+        fragments = {}
+        result = {}
+        stats = {'stanzas': len(stanzas), 'parsed': 0, 'cached': 0,
+                 'fallback': False}
+
+        try:
+            for stanza in stanzas:
+                key = stanza_hash(stanza)
+
+                fragment = fragments.get(key)
+                if fragment is None:
+                    fragment = self._fragments.get(key)
+                if fragment is None:
+                    if context and not self._is_context(stanza):
+                        fragment = self._parse_output(prefix + stanza)
+                    else:
+                        fragment = self._parse_output(stanza)
+                    stats['parsed'] += 1
+                else:
+                    stats['cached'] += 1
+
+                fragments[key] = fragment
+                merge_fragment(result, fragment)
+        except Exception as e:
+            log.debug('{}: cannot parse stanzas on their own ({!r}), parsing '
+                      'the whole configuration'.format(
+                          self.parser_cls.__name__, e))
+            fragments = {}
+            stats = {'stanzas': len(stanzas), 'parsed': len(stanzas),
+                     'cached': 0, 'fallback': True}
+            result = self._parse_output(output)
+
+        # only keep fragments of the latest configuration
+        self._fragments = fragments
+        self.stats = stats
+        log.debug('{}: {stanzas} stanzas, {parsed} parsed, {cached} '
+                  'cached'.format(self.parser_cls.__name__, **stats))
+
+        if not result:
+            raise SchemaEmptyParserError(result)
+
+        # fragments valid on their own can still clash once merged, eg. two
+        # stanzas filling exclusive keys of the same entry. Validated as the
+        # parser results are, see utils/schema_compiler.py for the modes
+        if self.schema:
+            _metaparser.Schema(self.schema).validate(result)
+
+        return result
+
+    def invalidate(self):
+        '''drop every cached fragment'''
+        self._fragments = {}
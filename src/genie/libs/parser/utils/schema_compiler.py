@@ -0,0 +1,466 @@
+'''Compiled validation of the parser schemas
+
+Every parse validates its result against the schema of the parser with the
+schema engine, which interprets the schema dict at each level of the result.
+This module generates a python validator per schema instead, with the keys,
+types and Optional/Any/ListOf/Or structure of the schema known statically,
+and compiles it on first use:
+
+    >>> from genie.libs.parser.utils import schema_compiler
+    >>> schema_compiler.set_mode('compiled')
+    >>> parsed = ShowIpRoute(device=device).parse(output=output)
+
+The mode is also set with the GENIE_SCHEMA_VALIDATION environment variable:
+
+    * generic: validation by the schema engine (default)
+    * compiled: validation by the compiled validators
+    * sampled:N: only one in N parses of a parser is validated, the others
+                 are only checked not to be empty. For trusted production
+                 paths
+
+A compiled validator returns the same result as the schema engine. It only
+decides the results it accepts: a result it rejects is validated again by
+the schema engine, to raise the error of the schema engine. Schemas with
+constructs the compiler does not handle (Use, And, Default, callables, ...)
+are always validated by the schema engine.
+'''
+
+# python
+import os
+import logging
+import contextlib
+import itertools
+
+# metaparser
+from genie.metaparser import _metaparser
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, \
+    ListOf
+
+log = logging.getLogger(__name__)
+
+MODES = ('generic', 'compiled', 'sampled')
+DEFAULT_MODE = 'generic'
+DEFAULT_SAMPLE_RATE = 100
+
+# types validated by an isinstance check in the schema engine, other classes
+# are instantiated with the value
+TYPES = (str, int, float, bool, list, dict)
+# values the schema engine keeps in the result, dicts and lists are copied
+SCALARS = (str, int, float, bool, bytes, type(None))
+# literal keys and values, compared by equality
+LITERALS = (str, int, float, bool, type(None))
+
+
+class _Reject(Exception):
+    '''the value does not match the schema'''
+
+
+class _Defer(Exception):
+    '''the value is left to the schema engine'''
+
+
+class _Unsupported(Exception):
+    '''the schema has a construct the compiler does not handle'''
+
+
+def _copy(value):
+    '''copy of a value as in the result of the schema engine'''
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    if isinstance(value, SCALARS):
+        return value
+    if isinstance(value, tuple) and all(isinstance(v, SCALARS)
+                                        for v in value):
+        return value
+    raise _Defer()
+
+
+def _is_default(schema):
+    # Optional/Any/ListOf/Schema without a default to apply
+    return getattr(schema, 'default', 'n/a') == 'n/a'
+
+
+def _literal(value):
+    return type(value) in LITERALS
+
+
+def _indent(lines, indent):
+    return [' ' * indent + line for line in lines]
+
+
+class _Compiler(object):
+    '''Generates the source of the validator of a schema
+
+    Each dict, ListOf and Or of the schema is a function returning the
+    validated copy of its value or raising _Reject.
+    '''
+
+    def __init__(self):
+        self.functions = []
+        self.namespace = {'_Reject': _Reject, '_Defer': _Defer,
+                          '_copy': _copy}
+        self._ids = itertools.count()
+
+    def name(self, prefix):
+        return '_{}{}'.format(prefix, next(self._ids))
+
+    def constant(self, value):
+        name = self.name('c')
+        self.namespace[name] = value
+        return name
+
+    def source(self):
+        return '\n\n'.join('\n'.join(lines) for lines in self.functions)
+
+    def check(self, schema, var):
+        '''lines validating var against a schema and setting var to its
+        value in the result, not indented'''
+        if isinstance(schema, type):
+            if schema not in TYPES:
+                raise _Unsupported(schema)
+            lines = ['if not isinstance({}, {}): raise _Reject()'.format(
+                var, schema.__name__)]
+            if schema in (list, dict):
+                lines.append('{0} = _copy({0})'.format(var))
+            return lines
+        if type(schema) is Any and _is_default(schema):
+            return ['{0} = _copy({0})'.format(var)]
+        if _literal(schema):
+            return ['if not {} == {}: raise _Reject()'.format(
+                var, self.constant(schema))]
+        return ['{0} = {1}({0})'.format(var, self.function(schema))]
+
+    def function(self, schema):
+        '''name of the function validating a dict, ListOf or Or'''
+        if type(schema) is Schema and _is_default(schema):
+            return self.function(schema.schema)
+        if isinstance(schema, dict):
+            return self.dict(schema)
+        if type(schema) is ListOf and _is_default(schema):
+            return self.list_of(schema.schema)
+        if type(schema) is Or:
+            return self.or_(schema.schemas)
+        raise _Unsupported(schema)
+
+    def list_of(self, schema):
+        name = self.name('v')
+        lines = ['def {}(v):'.format(name),
+                 '    if not isinstance(v, list): raise _Reject()']
+        check = self.check(schema, 'e')
+        if len(check) == 1 and check[0].startswith('e = '):
+            lines.append('    return [{} for e in v]'.format(
+                check[0].split(' = ', 1)[1]))
+        else:
+            lines += ['    r = []', '    for e in v:'] + \
+                     _indent(check, 8) + ['        r.append(e)', '    return r']
+        self.functions.append(lines)
+        return name
+
+    def or_(self, schemas):
+        name = self.name('v')
+        lines = ['def {}(v):'.format(name)]
+        for schema in schemas:
+            if isinstance(schema, type):
+                if schema not in TYPES:
+                    raise _Unsupported(schema)
+                lines.append('    if isinstance(v, {}): return {}'.format(
+                    schema.__name__,
+                    '_copy(v)' if schema in (list, dict) else 'v'))
+            elif type(schema) is Any and _is_default(schema):
+                lines.append('    return _copy(v)')
+            elif _literal(schema):
+                lines.append('    if v == {}: return v'.format(
+                    self.constant(schema)))
+            else:
+                lines += ['    try: return {}(v)'.format(
+                              self.function(schema)),
+                          '    except _Reject: pass']
+        lines.append('    raise _Reject()')
+        self.functions.append(lines)
+        return name
+
+    def dict(self, schema):
+        # keys of the schema engine, by precedence: literals, Or of literals,
+        # a type or Any
+        literals = {}
+        ors = []
+        wildcard = None
+        for key, value in schema.items():
+            required = True
+            if type(key) is Optional and _is_default(key):
+                key, required = key.schema, False
+            if _literal(key):
+                if key in literals:
+                    raise _Unsupported(key)
+                literals[key] = (value, required)
+            elif type(key) is Or and all(_literal(k) for k in key.schemas):
+                ors.append((key.schemas, value, required))
+            elif type(key) is Any and _is_default(key) or \
+                    isinstance(key, type) and key in TYPES:
+                if wildcard is not None:
+                    raise _Unsupported(key)
+                wildcard = (key, value, required and type(key) is not Any)
+            else:
+                raise _Unsupported(key)
+        if ors and wildcard is not None and type(wildcard[0]) is not Any:
+            raise _Unsupported(schema)
+
+        # key -> value schema
+        table = {key: value for key, (value, _) in literals.items()}
+        required_ors = []
+        for keys, value, required in ors:
+            keys = [k for k in keys if k not in literals]
+            if any(k in table for k in keys):
+                raise _Unsupported(schema)
+            table.update((k, value) for k in keys)
+            if required:
+                required_ors.append(frozenset(keys))
+        required = frozenset(k for k, (_, r) in literals.items() if r)
+
+        name = self.name('v')
+        lines = ['def {}(d):'.format(name),
+                 '    if not isinstance(d, dict): raise _Reject()']
+
+        # one branch per distinct value schema of the keys
+        branches = []
+        for key, value in table.items():
+            for branch in branches:
+                if branch[0] is value:
+                    branch[1].append(key)
+                    break
+            else:
+                branches.append((value, [key]))
+        branches.sort(key=lambda branch: -len(branch[1]))
+
+        if wildcard is not None:
+            key, value, required_wildcard = wildcard
+            check = self.check(value, 'v')
+            if not table and type(key) is Any and len(check) == 1 and \
+                    check[0].startswith('v = '):
+                lines.append('    return {{k: {} for k, v in d.items()}}'
+                             .format(check[0].split(' = ', 1)[1]))
+                self.functions.append(lines)
+                return name
+
+        lines.append('    r = {}')
+        if wildcard is not None and required_wildcard:
+            lines.append('    matched = False')
+        lines.append('    for k, v in d.items():')
+        if table:
+            index = {key: i for i, (_, keys) in enumerate(branches)
+                     for key in keys}
+            lines.append('        b = {}.get(k)'.format(
+                self.constant(index)))
+            for i, (value, _) in enumerate(branches):
+                lines.append('        {} b == {}:'.format(
+                    'if' if i == 0 else 'elif', i))
+                lines += _indent(self.check(value, 'v'), 12)
+            lines.append('        else:')
+            indent = 12
+        else:
+            indent = 8
+        if wildcard is None:
+            lines.append(' ' * indent + 'raise _Reject()')
+        else:
+            if type(key) is not Any:
+                lines.append(' ' * indent + 'if not isinstance(k, {}): '
+                             'raise _Reject()'.format(key.__name__))
+                if required_wildcard:
+                    lines.append(' ' * indent + 'matched = True')
+            lines += _indent(check, indent)
+        lines.append('        r[k] = v')
+
+        if required:
+            lines.append('    if not d.keys() >= {}: raise _Reject()'.format(
+                self.constant(required)))
+        for keys in required_ors:
+            lines.append('    if d.keys().isdisjoint({}): raise _Reject()'
+                         .format(self.constant(keys)))
+        if wildcard is not None and required_wildcard:
+            lines.append('    if not matched: raise _Reject()')
+        lines.append('    return r')
+        self.functions.append(lines)
+        return name
+
+
+def generate(schema):
+    '''Source of the validator of a schema
+
+        Args:
+            schema (`dict`): schema of a parser
+
+        Returns:
+            tuple of (source, namespace, name of the validator function)
+
+        Raises:
+            ValueError: the schema has a construct the compiler does not
+                        handle
+    '''
+    compiler = _Compiler()
+    try:
+        name = compiler.function(schema)
+    except _Unsupported as e:
+        raise ValueError('Unsupported schema construct {!r}'.format(
+            e.args[0] if e.args else schema)) from None
+    return compiler.source(), compiler.namespace, name
+
+
+def compile_schema(schema):
+    '''Compile the validator of a schema
+
+        Args:
+            schema (`dict`): schema of a parser
+
+        Returns:
+            function returning the validated copy of a result, raising
+            _Reject or _Defer when the schema engine has to decide. None
+            for the schemas the compiler does not handle
+    '''
+    try:
+        source, namespace, name = generate(schema)
+    except ValueError as e:
+        log.debug('Schema validated by the schema engine: {}'.format(e))
+        return None
+    exec(compile(source, '<schema {}>'.format(name), 'exec'), namespace)
+    validator = namespace[name]
+    validator.source = source
+    return validator
+
+
+# id of the schema -> (schema, validator). The schema is kept so that its id
+# is not reused, parsers share the schema of their class
+_validators = {}
+
+
+def get_validator(schema):
+    '''compiled validator of a schema, compiled on first use'''
+    try:
+        return _validators[id(schema)][1]
+    except KeyError:
+        validator = compile_schema(schema)
+        _validators[id(schema)] = (schema, validator)
+        return validator
+
+
+def validate(schema, data):
+    '''Validate a parser result against a schema
+
+        Args:
+            schema (`dict`): schema of a parser
+            data (`dict`): parser result
+
+        Returns:
+            the validated result, as returned by the schema engine
+
+        Raises:
+            SchemaError: raised by the schema engine
+    '''
+    return CompiledSchema(schema).validate(data)
+
+
+class CompiledSchema(Schema):
+    '''Schema validating with the compiled validator of its schema'''
+
+    def validate(self, data, *args, **kwargs):
+        if data and isinstance(data, dict):
+            validator = get_validator(self.schema)
+            if validator is not None:
+                try:
+                    return validator(data)
+                except Exception:
+                    pass
+        return super().validate(data, *args, **kwargs)
+
+
+class SampledSchema(CompiledSchema):
+    '''Schema validating one in sample_rate results of its schema'''
+    sample_rate = DEFAULT_SAMPLE_RATE
+
+    # id of the schema -> number of results since the last validated one
+    _counts = {}
+
+    def validate(self, data, *args, **kwargs):
+        count = self._counts.get(id(self.schema), 0)
+        if count and data:
+            self._counts[id(self.schema)] = (count + 1) % self.sample_rate
+            return data
+        self._counts[id(self.schema)] = 1 % self.sample_rate
+        return super().validate(data, *args, **kwargs)
+
+
+_SCHEMAS = {
+    'generic': Schema,
+    'compiled': CompiledSchema,
+    'sampled': SampledSchema,
+}
+_mode = DEFAULT_MODE
+
+
+def get_mode():
+    '''name of the validation mode in use'''
+    return _mode
+
+
+def set_mode(name, sample_rate=None):
+    '''Validate the parser results with another mode
+
+        Args:
+            name (`str`): 'generic', 'compiled' or 'sampled', or
+                          'sampled:<sample_rate>'
+            sample_rate (`int`): validate one in sample_rate results of a
+                                 parser in the sampled mode
+
+        Raises:
+            ValueError: unknown mode or invalid sample rate
+    '''
+    global _mode
+    name, _, rate = name.partition(':')
+    if name not in MODES:
+        raise ValueError("Unknown schema validation mode '{}', expected one "
+                         "of {}".format(name, ', '.join(MODES)))
+    if rate:
+        sample_rate = rate
+    if sample_rate is not None:
+        try:
+            sample_rate = int(sample_rate)
+        except ValueError:
+            sample_rate = 0
+        if sample_rate < 1:
+            raise ValueError("Invalid sample rate '{}', expected a positive "
+                             "integer".format(rate or sample_rate))
+        SampledSchema.sample_rate = sample_rate
+        SampledSchema._counts.clear()
+    _metaparser.Schema = _SCHEMAS[name]
+    _mode = name
+
+
+@contextlib.contextmanager
+def mode(name, sample_rate=None):
+    '''Validate the parser results within the block with a mode
+
+        example:
+
+            >>> with schema_compiler.mode('compiled'):
+            ...     parsed = ShowIpRoute(device=device).parse(output=output)
+    '''
+    previous = get_mode(), SampledSchema.sample_rate
+    set_mode(name, sample_rate)
+    try:
+        yield
+    finally:
+        set_mode(*previous)
+
+
+def _mode_from_environment():
+    name = os.environ.get('GENIE_SCHEMA_VALIDATION')
+    if not name:
+        return
+    try:
+        set_mode(name)
+    except ValueError as e:
+        log.warning('{}, using the generic schema validation'.format(e))
+
+
+_mode_from_environment()
@@ -0,0 +1,107 @@
+'''Interning of the strings of the parser results
+
+Every value a parser slices out of a match is a new string, so a large
+result holds hundreds of thousands of copies of the same interface names,
+next hops, protocols and codes. When the pool is enabled the parsers of the
+largest outputs intern these strings as they insert them, and every
+occurrence of a value shares one string:
+
+    >>> from genie.libs.parser.utils import string_pool
+    >>> with string_pool.pooled():
+    ...     parsed = ShowIpRoute(device=device).parse(output=output)
+
+The pool is also enabled with the GENIE_STRING_POOL environment variable set
+to 1. It is disabled by default: interning costs a lookup per value, which
+small outputs do not win back.
+
+Strings are interned with sys.intern, a string is released with the last
+result holding it.
+'''
+
+# python
+import os
+import sys
+import contextlib
+
+_intern = sys.intern
+_enabled = False
+
+
+def is_enabled():
+    '''whether the parsers intern the strings of their results'''
+    return _enabled
+
+
+def set_enabled(enabled=True):
+    '''Enable or disable the interning of the parser results strings
+
+        Args:
+            enabled (`bool`): intern the strings of the parser results
+    '''
+    global _enabled
+    _enabled = bool(enabled)
+
+
+@contextlib.contextmanager
+def pooled(enabled=True):
+    '''Intern the strings of the results parsed within the block
+
+        example:
+
+            >>> with string_pool.pooled():
+            ...     parsed = ShowIpRoute(device=device).parse(output=output)
+    '''
+    previous = _enabled
+    set_enabled(enabled)
+    try:
+        yield
+    finally:
+        set_enabled(previous)
+
+
+def intern(value):
+    '''Shared copy of a string, when the pool is enabled
+
+        Args:
+            value (`str`): value inserted in a result, other types are
+                           returned as is
+
+        Returns:
+            the interned string, value when the pool is disabled
+    '''
+    if _enabled and value.__class__ is str:
+        return _intern(value)
+    return value
+
+
+def groupdict(match):
+    '''groupdict of a match, with the strings interned when the pool is
+    enabled
+
+        Args:
+            match (`re.Match`): match of a parser pattern
+
+        Returns:
+            dict of group name -> value
+    '''
+    return intern_values(match.groupdict())
+
+
+def intern_values(values):
+    '''Intern in place the string values of a dict, when the pool is enabled
+
+        Args:
+            values (`dict`): entry inserted in a result
+
+        Returns:
+            values
+    '''
+    if _enabled:
+        for key, value in values.items():
+            if value.__class__ is str:
+                values[key] = _intern(value)
+    return values
+
+
+set_enabled(os.environ.get('GENIE_STRING_POOL', '').lower() in
+            ('1', 'true', 'yes', 'on'))
@@ -0,0 +1,154 @@
+'''show tech-support splitter
+
+A ``show tech-support`` bundle is the concatenation of the outputs of dozens
+of show commands, each introduced by a section header:
+
+    ------------------ show version ------------------      (IOS/IOS-XE/XR)
+    `show version`                                           (NX-OS)
+
+This module streams a bundle, splits it into (command, output) sections,
+resolves every section command through ``get_parser`` for the tokens of the
+device the bundle was taken from, and parses all sections over a worker pool
+with the bulk engine. The result is a single dict keyed by command, so data
+already present in a bundle never has to be collected again.
+
+Example:
+
+    >>> from pathlib import Path
+    >>> from genie.libs.parser.utils.techsupport import parse_tech_support
+    >>> parsed = parse_tech_support(Path('router1_tech.txt'), {'os': 'iosxe'})
+    >>> parsed['show version']['version']['version']
+    '17.9.3'
+'''
+
+# python
+import os
+import re
+import logging
+
+from .bulk import iter_parse, DEFAULT_CHUNK_SIZE
+
+log = logging.getLogger(__name__)
+
+# ------------------ show version ------------------
+# ---- show version installed ----
+IOS_HEADER = re.compile(r'^-{4,} +(?P<command>[a-zA-Z].*?) +-{4,}$')
+
+# `show version`
+NXOS_HEADER = re.compile(r'^`(?P<command>show [^`]+)`$')
+
+SECTION_HEADERS = (IOS_HEADER, NXOS_HEADER)
+
+
+def iter_sections(lines, headers=SECTION_HEADERS):
+    '''Split show tech-support lines into (command, output) sections.
+
+    Lines are consumed one at a time, only the section being built is kept in
+    memory. Text before the first header and empty sections are dropped.
+
+        Args:
+            lines (`iterable`): lines of the bundle, eg. an open file
+            headers (`tuple`): compiled patterns with a 'command' group
+
+        Returns:
+            generator of (command, output) tuples
+    '''
+    command = None
+    section = []
+
+    for line in lines:
+        line = line.rstrip('\r\n')
+
+        stripped = line.strip()
+        for header in headers:
+            m = header.match(stripped)
+            if m:
+                break
+        else:
+            if command is not None:
+                section.append(line)
+            continue
+
+        if command is not None and any(l.strip() for l in section):
+            yield command, '\n'.join(section)
+
+        command = ' '.join(m.groupdict()['command'].split())
+        section = []
+
+    if command is not None and any(l.strip() for l in section):
+        yield command, '\n'.join(section)
+
+
+def _iter_lines(source):
+    # a str is always the content of a bundle, paths are os.PathLike only
+    if isinstance(source, str):
+        yield from source.splitlines()
+    elif isinstance(source, os.PathLike):
+        with open(source, errors='replace') as f:
+            yield from f
+    else:
+        # file object or any iterable of lines
+        yield from source
+
+
+def iter_parse_tech_support(source,
+                            tokens,
+                            processes=None,
+                            chunksize=DEFAULT_CHUNK_SIZE,
+                            headers=SECTION_HEADERS):
+    '''Parse every section of a show tech-support bundle.
+
+        Args:
+            source (`str`, `PathLike`, `file`): content of the bundle, path
+                                                to the bundle, or an
+                                                iterable of lines
+            tokens (`dict`): abstract tokens of the device, eg.
+                             {'os': 'iosxe', 'platform': 'cat9k'}
+            processes (`int`): number of worker processes, 0 parses in this
+                               process
+            chunksize (`int`): number of sections per worker task
+            headers (`tuple`): compiled section header patterns
+
+        Returns:
+            generator of bulk result dicts, see ``bulk.iter_parse``
+    '''
+    records = ((tokens, command, output)
+               for command, output in iter_sections(_iter_lines(source),
+                                                    headers=headers))
+    yield from iter_parse(records, processes=processes, chunksize=chunksize)
+
+
+def parse_tech_support(source, tokens, processes=None, **kwargs):
+    '''Parse a show tech-support bundle into a dict keyed by command.
+
+    Sections without a parser, or that fail to parse, are skipped. When a
+    command appears in several sections, the first section wins.
+
+        Args:
+            source (`str`, `PathLike`, `file`): content of the bundle, path
+                                                to the bundle, or an
+                                                iterable of lines
+            tokens (`dict`): abstract tokens of the device
+            processes (`int`): number of worker processes
+            kwargs: passed to ``iter_parse_tech_support``
+
+        Returns:
+            dict of {command: parsed output}
+    '''
+    results = sorted(iter_parse_tech_support(source, tokens,
+                                             processes=processes, **kwargs),
+                     key=lambda r: r['index'])
+
+    parsed = {}
+    for result in results:
+        command = result['command']
+        if 'error' in result:
+            log.debug("Skipping section '{}': {}: {}".format(
+                command, result['error']['type'],
+                result['error']['message']))
+            continue
+        if command in parsed:
+            log.debug("Skipping duplicate section '{}'".format(command))
+            continue
+        parsed[command] = result['parsed']
+    return parsed
@@ -0,0 +1,140 @@
+import re
+import time
+import asyncio
+import unittest
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any
+
+from genie.libs.parser.utils.async_parse import aparse, aparse_command
+
+CLOCK_OUTPUT = '''\
+18:56:04.554 EST Mon Oct 17 2016
+'''
+
+INSTANCES_OUTPUT = '''\
+instance one
+instance two
+instance three
+instance four
+'''
+
+
+class AsyncDevice(object):
+    '''asyncio device double with a fixed latency per command'''
+    os = 'iosxe'
+    platform = None
+
+    def __init__(self, outputs, latency=0.0):
+        self.outputs = outputs
+        self.latency = latency
+        self.executed = []
+
+    async def execute(self, command, **kwargs):
+        self.executed.append(command)
+        await asyncio.sleep(self.latency)
+        return self.outputs[command]
+
+
+class ShowInstancesSchema(MetaParser):
+    schema = {
+        'instance': {
+            Any(): {
+                'neighbors': int,
+            },
+        },
+    }
+
+
+class ShowInstances(ShowInstancesSchema):
+    '''toy parser issuing one follow-up command per instance'''
+    cli_command = 'show instances'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        p1 = re.compile(r'^instance +(?P<name>\w+)$')
+
+        ret_dict = {}
+        for line in output.splitlines():
+            m = p1.match(line.strip())
+            if m:
+                name = m.groupdict()['name']
+                out = self.device.execute(
+                    'show instance {} neighbors'.format(name))
+                ret_dict.setdefault('instance', {})[name] = {
+                    'neighbors': len(out.splitlines())}
+        return ret_dict
+
+
+class TestAsyncParse(unittest.TestCase):
+
+    def setUp(self):
+        self.outputs = {'show instances': INSTANCES_OUTPUT}
+        for i, name in enumerate(['one', 'two', 'three', 'four']):
+            self.outputs['show instance {} neighbors'.format(name)] = \
+                'neighbor\n' * (i + 1)
+        self.expected = {
+            'instance': {
+                'one': {'neighbors': 1},
+                'two': {'neighbors': 2},
+                'three': {'neighbors': 3},
+                'four': {'neighbors': 4},
+            },
+        }
+
+    def test_follow_up_commands_concurrent(self):
+        device = AsyncDevice(self.outputs, latency=0.2)
+        start = time.monotonic()
+        parsed = asyncio.run(aparse(ShowInstances(device=device)))
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(parsed, self.expected)
+        # one round trip for the main command, one for all follow-ups
+        self.assertLess(elapsed, 0.2 * 4)
+        self.assertEqual(sorted(device.executed), sorted(self.outputs))
+
+    def test_follow_up_commands_no_prefetch(self):
+        device = AsyncDevice(self.outputs)
+        parsed = asyncio.run(aparse(ShowInstances(device=device),
+                                    prefetch=False))
+        self.assertEqual(parsed, self.expected)
+        self.assertEqual(device.executed, list(self.outputs))
+
+    def test_output_provided(self):
+        device = AsyncDevice(self.outputs)
+        parsed = asyncio.run(aparse(ShowInstances(device=device),
+                                    output='instance one'))
+        self.assertEqual(parsed, {'instance': {'one': {'neighbors': 1}}})
+        self.assertEqual(device.executed, ['show instance one neighbors'])
+
+    def test_event_loop_not_blocked(self):
+        device = AsyncDevice(self.outputs, latency=0.05)
+
+        async def main():
+            ticks = []
+
+            async def ticker():
+                while True:
+                    ticks.append(time.monotonic())
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.ensure_future(ticker())
+            parsed = await aparse(ShowInstances(device=device))
+            task.cancel()
+            return parsed, ticks
+
+        parsed, ticks = asyncio.run(main())
+        self.assertEqual(parsed, self.expected)
+        self.assertGreater(len(ticks), 2)
+
+    def test_aparse_command(self):
+        device = AsyncDevice({'show clock': CLOCK_OUTPUT})
+        parsed = asyncio.run(aparse_command(device, 'show clock'))
+        self.assertEqual(parsed['time'], '18:56:04.554')
+        self.assertEqual(device.executed, ['show clock'])
+
+
+if __name__ == '__main__':
+    unittest.main()
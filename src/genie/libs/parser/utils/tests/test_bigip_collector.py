@@ -0,0 +1,152 @@
+import json
+import threading
+import unittest
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from genie.libs.parser.bigip.get_ltm_pool import LtmPool
+from genie.libs.parser.bigip.get_ltm_virtual import LtmVirtual
+from genie.libs.parser.utils.bigip_collector import BigipCollector
+
+POOLS = [{'kind': 'tm:ltm:pool:poolstate', 'name': 'pool{}'.format(i),
+          'fullPath': '/Common/pool{}'.format(i)} for i in range(25)]
+
+RESOURCES = {
+    '/mgmt/tm/ltm/pool': POOLS,
+    '/mgmt/tm/ltm/virtual': [{'kind': 'tm:ltm:virtual:virtualstate',
+                              'name': 'vs1'}],
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    '''iControl REST collections with $top/$skip paging'''
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.paths.append(self.path)
+
+        url = urlsplit(self.path)
+        items = RESOURCES.get(url.path)
+        if items is None:
+            body = json.dumps({'code': 404, 'message': 'not found'})
+            self._send(404, body)
+            return
+        query = parse_qs(url.query)
+        data = {'kind': 'tm:ltm:collectionstate',
+                'selfLink': 'https://localhost' + url.path}
+        if '$top' in query:
+            top = int(query['$top'][0])
+            skip = int(query.get('$skip', ['0'])[0])
+            data['items'] = items[skip:skip + top]
+            data.update({'currentItemCount': len(data['items']),
+                         'itemsPerPage': top,
+                         'pageIndex': skip // top + 1,
+                         'startIndex': skip + 1,
+                         'totalItems': len(items),
+                         'totalPages': -(-len(items) // top)})
+            if skip + top < len(items):
+                # BIG-IP links to itself as localhost
+                data['nextLink'] = ('https://localhost{}?$top={}&$skip={}'
+                                    .format(url.path, top, skip + top))
+        else:
+            data['items'] = items
+        self._send(200, json.dumps(data))
+
+    def _send(self, code, body):
+        body = body.encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBigipCollector(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.connections = set()
+        self.server.paths = []
+        self.thread = threading.Thread(target=self.server.serve_forever,
+                                       daemon=True)
+        self.thread.start()
+        self.base_url = 'http://127.0.0.1:{}'.format(
+            self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_collect(self):
+        with BigipCollector(self.base_url, max_workers=2) as collector:
+            results = collector.collect([LtmPool, LtmVirtual])
+        self.assertEqual(results['LtmPool']['path'], '/mgmt/tm/ltm/pool')
+        self.assertEqual(results['LtmPool']['parsed']['items'], POOLS)
+        self.assertEqual(results['LtmVirtual']['parsed']['items'][0]['name'],
+                         'vs1')
+
+    def test_paging(self):
+        with BigipCollector(self.base_url, page_size=10) as collector:
+            data = collector.fetch('/mgmt/tm/ltm/pool')
+        # pages merged into the unpaged response
+        self.assertEqual(data, {'kind': 'tm:ltm:collectionstate',
+                                'selfLink': 'https://localhost/mgmt/tm/ltm/'
+                                            'pool',
+                                'items': POOLS})
+        self.assertEqual(self.server.paths,
+                         ['/mgmt/tm/ltm/pool?$top=10&$skip=0',
+                          '/mgmt/tm/ltm/pool?$top=10&$skip=10',
+                          '/mgmt/tm/ltm/pool?$top=10&$skip=20'])
+
+    def test_iter_items(self):
+        collector = BigipCollector(self.base_url, page_size=10)
+        pages = collector.iter_pages('/mgmt/tm/ltm/pool')
+        self.assertEqual(len(next(pages)['items']), 10)
+        # the next pages are only requested when consumed
+        self.assertEqual(len(self.server.paths), 1)
+        self.assertEqual(list(collector.iter_items('/mgmt/tm/ltm/pool')),
+                         POOLS)
+
+    def test_pooled_connections(self):
+        # 20 collections of 3 pages over 2 kept-alive connections
+        with BigipCollector(self.base_url, max_workers=2,
+                            page_size=10) as collector:
+            for result in collector.iter_collect([LtmPool] * 20):
+                self.assertEqual(result['parsed']['items'], POOLS)
+            self.assertEqual(collector.requests_count, 60)
+        self.assertEqual(len(self.server.paths), 60)
+        self.assertLessEqual(len(self.server.connections), 2)
+
+    def test_paths_and_errors(self):
+        class LtmMissing(LtmPool):
+            cli_command = '/mgmt/tm/ltm/missing'
+
+        with BigipCollector(self.base_url) as collector:
+            results = collector.collect(['/mgmt/tm/ltm/pool', LtmMissing,
+                                         '/mgmt/not/a/parser'])
+        self.assertEqual(results['LtmPool']['parsed']['items'], POOLS)
+        self.assertEqual(results['LtmMissing']['error']['type'],
+                         'HTTPError')
+        self.assertEqual(results['/mgmt/not/a/parser']['error']['type'],
+                         'ParserNotFound')
+
+    def test_token(self):
+        collector = BigipCollector(self.base_url, token='abc')
+        self.assertEqual(collector.session.headers['X-F5-Auth-Token'], 'abc')
+
+    def test_verify(self):
+        # certificates are verified unless the caller opts out
+        self.assertIs(BigipCollector(self.base_url).session.verify, True)
+        self.assertIs(BigipCollector(self.base_url,
+                                     verify=False).session.verify, False)
+
+
+if __name__ == '__main__':
+    unittest.main()
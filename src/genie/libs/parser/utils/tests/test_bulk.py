@@ -0,0 +1,136 @@
+import io
+import json
+import shutil
+import pathlib
+import tempfile
+import unittest
+
+from genie.libs import parser as _parser
+from genie.libs.parser.utils import bulk
+from genie.libs.parser.utils.bulk import BulkRecord, OfflineDevice, \
+    OfflineExecuteError
+
+PARSER_ROOT = pathlib.Path(_parser.__file__).parent
+
+CLOCK_OUTPUT = '''\
+Router#show clock
+Load for five secs: 1%/0%; one minute: 2%; five minutes: 3%
+Time source is NTP, 18:56:04.554 EST Mon Oct 17 2016
+
+18:56:04.554 EST Mon Oct 17 2016
+'''
+
+CLOCK_PARSED = {
+    'time': '18:56:04.554',
+    'timezone': 'EST',
+    'day_of_week': 'Mon',
+    'month': 'Oct',
+    'day': '17',
+    'year': '2016',
+}
+
+
+class TestBulkParse(unittest.TestCase):
+
+    def test_offline_device(self):
+        device = OfflineDevice(os='iosxe', platform='cat9k')
+        self.assertEqual(device.os, 'iosxe')
+        self.assertEqual(device.platform, 'cat9k')
+        with self.assertRaises(OfflineExecuteError):
+            device.execute('show version')
+
+    def test_resolver_cache(self):
+        resolver = bulk.ParserResolver()
+        cls1, kwargs1 = resolver.resolve({'os': 'iosxe'}, 'show ip arp vrf A')
+        cls2, kwargs2 = resolver.resolve('iosxe', 'show ip arp vrf A')
+        self.assertIs(cls1, cls2)
+        self.assertEqual(kwargs1, {'vrf': 'A'})
+        # kwargs are copies, callers may consume them
+        kwargs1.pop('vrf')
+        self.assertEqual(kwargs2, {'vrf': 'A'})
+        self.assertEqual(len(resolver._cache), 1)
+
+    def test_iter_parse_inline(self):
+        records = [
+            BulkRecord({'os': 'iosxe'}, 'show clock', CLOCK_OUTPUT),
+            BulkRecord({'os': 'iosxe'}, 'show clock', ''),
+            BulkRecord({'os': 'iosxe'}, 'show not a real command', ''),
+        ]
+        results = {r['index']: r for r in bulk.iter_parse(records,
+                                                           processes=0)}
+        self.assertEqual(results[0]['parsed'], CLOCK_PARSED)
+        self.assertEqual(results[0]['parser'],
+                         'genie.libs.parser.iosxe.show_system.ShowClock')
+        self.assertEqual(results[1]['error']['type'],
+                         'SchemaEmptyParserError')
+        self.assertEqual(results[2]['error']['type'], 'ParserNotFound')
+        self.assertIsNone(results[2]['parser'])
+
+    def test_iter_parse_process_pool(self):
+        records = [({'os': 'iosxe'}, 'show clock', CLOCK_OUTPUT)] * 10
+        results = list(bulk.iter_parse(records, processes=2, chunksize=3,
+                                       batch_size=4))
+        self.assertEqual(sorted(r['index'] for r in results), list(range(10)))
+        for result in results:
+            self.assertEqual(result['parsed'], CLOCK_PARSED)
+
+    def test_bulk_parse_jsonl(self):
+        records = [('iosxe', 'show clock', CLOCK_OUTPUT),
+                   ('iosxe', 'show clock', '')]
+        fp = io.StringIO()
+        summary = bulk.bulk_parse(records, fp, fmt='jsonl', processes=0)
+        self.assertEqual(summary, {'total': 2, 'parsed': 1, 'errors': 1})
+        lines = [json.loads(l) for l in fp.getvalue().splitlines()]
+        self.assertEqual(lines[0]['parsed'], CLOCK_PARSED)
+        self.assertIn('error', lines[1])
+
+    def test_bulk_parse_unknown_format(self):
+        with self.assertRaises(ValueError):
+            bulk.bulk_parse([], io.StringIO(), fmt='xml')
+
+    def test_iter_folder_records(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            shutil.copytree(PARSER_ROOT / 'iosxe' / 'tests' / 'ShowIpArp',
+                            pathlib.Path(tmp) / 'iosxe' / 'ShowIpArp')
+            records = list(bulk.iter_folder_records(tmp))
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual({r.command for r in records},
+                         {'show ip arp vrf green', 'show ip arp vrf VRF1'})
+        self.assertEqual(records[0].tokens, {'os': 'iosxe'})
+
+        results = list(bulk.iter_parse(records, processes=0))
+        self.assertTrue(all('parsed' in r for r in results))
+
+    def test_iter_folder_records_class_folder(self):
+        # a class folder of the package, the tokens are read from its path.
+        # ShowIpRoute is only reached through a distributor, and the pipes
+        # of the include argument of ShowInterfaces are not a command
+        for name in ('ShowIpRoute', 'ShowInterfaces'):
+            folder = PARSER_ROOT / 'iosxe' / 'tests' / name
+            records = list(bulk.iter_folder_records(folder))
+            self.assertEqual(len(records),
+                             len(list(folder.glob('cli/equal/*_output.txt'))))
+            for record in records:
+                self.assertEqual(record.tokens, {'os': 'iosxe'})
+                self.assertEqual(record.parser.__name__, name)
+
+            results = list(bulk.iter_parse(records, processes=0))
+            self.assertTrue(all('parsed' in r for r in results), name)
+
+        include = [r for r in records if 'include' in r.kwargs]
+        self.assertEqual(include[0].command,
+                         'show interfaces | include line protocol|'
+                         'Hardware is|BW')
+        self.assertEqual(include[0].kwargs,
+                         {'include': 'line protocol|Hardware is|BW'})
+
+        # records without a parser class still go through get_parser
+        record = BulkRecord({'os': 'iosxe'}, 'show clock', CLOCK_OUTPUT)
+        self.assertIsNone(record.parser)
+        result, = bulk.iter_parse([record], processes=0)
+        self.assertEqual(result['parsed'], CLOCK_PARSED)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
 import unittest
+from unittest.mock import patch
 
-from genie.libs.parser.utils.common import Common
+from genie.metaparser.util.schemaengine import Schema
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.libs.parser.utils.common import Common, delegate
 from  genie.libs.parser.utils.common import check_for_duplicate
 from genie.abstract.package import AbstractTree, DEFAULT_ABSTRACT_ORDER
 PARSER_MODULE_NAME = 'genie.libs.parser'
@@ -307,3 +310,55 @@ class TestDuplicate(unittest.TestCase):
         
         duplicates = check_for_duplicate(internal_data)
         self.assertIn('show vrf', duplicates)
+
+
+class TestDelegate(unittest.TestCase):
+
+    output = '''\
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+
+Gateway of last resort is not set
+
+      10.0.0.0/8 is variably subnetted, 2 subnets, 2 masks
+C        10.1.1.0/24 is directly connected, GigabitEthernet1
+L        10.1.1.1/32 is directly connected, GigabitEthernet1
+'''
+
+    def _validations(self, parser_cls, **kwargs):
+        validated = []
+        validate = Schema.validate
+
+        def counting(schema, data, *args, **kwargs):
+            validated.append(data)
+            return validate(schema, data, *args, **kwargs)
+
+        with patch.object(Schema, 'validate', counting):
+            parsed = parser_cls(device=None).parse(**kwargs)
+        # Schema.validate recurses, count the top level calls
+        return parsed, sum(1 for data in validated if data == parsed)
+
+    def test_validated_once(self):
+        from genie.libs.parser.iosxe.show_routing import ShowIpRoute, \
+            ShowIpRouteDistributor
+        expected, count = self._validations(ShowIpRoute, output=self.output)
+        self.assertEqual(count, 1)
+        parsed, count = self._validations(ShowIpRouteDistributor,
+                                          output=self.output)
+        self.assertEqual(parsed, expected)
+        self.assertEqual(count, 1)
+
+    def test_inner_parser_reused(self):
+        from genie.libs.parser.iosxe.show_routing import ShowIpRoute, \
+            ShowIpRouteDistributor
+        parser = ShowIpRouteDistributor(device=None)
+        delegate(parser, ShowIpRoute, output=self.output)
+        inner = parser._delegates[ShowIpRoute]
+        delegate(parser, ShowIpRoute, output=self.output)
+        self.assertIs(parser._delegates[ShowIpRoute], inner)
+        self.assertIs(parser.schema, ShowIpRoute.schema)
+
+    def test_empty(self):
+        from genie.libs.parser.iosxe.show_routing import \
+            ShowIpRouteDistributor
+        with self.assertRaises(SchemaEmptyParserError):
+            ShowIpRouteDistributor(device=None).parse(output='')
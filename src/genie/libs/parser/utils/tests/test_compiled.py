@@ -0,0 +1,50 @@
+import sys
+import pathlib
+import unittest
+from unittest.mock import patch
+
+from genie.libs import parser as _parser
+from genie.libs.parser.utils import compiled
+from genie.libs.parser.utils.compiled import MODULES, PureFinder
+
+PARSER_ROOT = pathlib.Path(_parser.__file__).parent
+
+
+class TestCompiled(unittest.TestCase):
+
+    def test_modules(self):
+        for name in MODULES:
+            self.assertTrue(name.startswith('genie.libs.parser.'))
+            source = PARSER_ROOT.joinpath(*name.split('.')[3:])
+            self.assertTrue(source.with_suffix('.py').is_file(), name)
+
+    def test_status(self):
+        status = compiled.status()
+        self.assertEqual(list(status), MODULES)
+        for name, is_compiled in status.items():
+            self.assertEqual(is_compiled,
+                             not sys.modules[name].__file__.endswith('.py'))
+
+    def test_pure_finder(self):
+        finder = PureFinder()
+        name = 'genie.libs.parser.iosxe.show_arp'
+        path = [str(PARSER_ROOT / 'utils'), str(PARSER_ROOT / 'iosxe')]
+        spec = finder.find_spec(name, path)
+        self.assertEqual(spec.name, name)
+        self.assertEqual(spec.origin, str(PARSER_ROOT / 'iosxe' /
+                                          'show_arp.py'))
+        self.assertIsNone(finder.find_spec('genie.libs.parser.iosxe.'
+                                           'show_vrf', path))
+        self.assertIsNone(finder.find_spec(name, None))
+
+    def test_prefer_pure(self):
+        with patch.object(sys, 'meta_path', list(sys.meta_path)):
+            compiled.prefer_pure()
+            compiled.prefer_pure()
+            self.assertIsInstance(sys.meta_path[0], PureFinder)
+            self.assertEqual(sum(isinstance(finder, PureFinder)
+                                 for finder in sys.meta_path), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
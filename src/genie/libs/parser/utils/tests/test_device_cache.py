@@ -0,0 +1,124 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.device_cache import enable_device_cache, \
+    disable_device_cache, get_device_cache, cached_execute, cached_parse
+
+SHOW_VRF = '''\
+  Name                             Default RD            Protocols   Interfaces
+  VRF1                             65000:1               ipv4,ipv6   Lo300
+'''
+
+SECTION = '''\
+router ospf 1 vrf VRF1
+ router-id 10.4.1.1
+'''
+
+
+class TestDeviceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Mock()
+        self.device.execute = Mock(side_effect=lambda cmd: {
+            'show vrf': SHOW_VRF,
+            'show running-config | section router ospf 1': SECTION,
+        }[cmd])
+
+    def test_disabled(self):
+        self.assertIsNone(get_device_cache(self.device))
+        cmd = 'show running-config | section router ospf 1'
+        cached_execute(self.device, cmd)
+        cached_execute(self.device, cmd)
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_execute(self):
+        cache = enable_device_cache(self.device)
+        cmd = 'show running-config | section router ospf 1'
+        self.assertEqual(cached_execute(self.device, cmd), SECTION)
+        self.assertEqual(cached_execute(self.device, cmd), SECTION)
+        self.assertEqual(self.device.execute.call_count, 1)
+        self.assertEqual(cache.stats, {'hits': 1, 'misses': 1})
+
+        # config change
+        cache.invalidate()
+        cached_execute(self.device, cmd)
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_ttl(self):
+        enable_device_cache(self.device, ttl=0)
+        cmd = 'show running-config | section router ospf 1'
+        cached_execute(self.device, cmd)
+        cached_execute(self.device, cmd)
+        self.assertEqual(self.device.execute.call_count, 2)
+
+    def test_seed(self):
+        enable_device_cache(self.device, outputs={
+            'show running-config | section router ospf 2': 'router ospf 2'})
+        self.assertEqual(cached_execute(
+            self.device, 'show running-config | section router ospf 2'),
+            'router ospf 2')
+        self.device.execute.assert_not_called()
+
+    def test_parse(self):
+        enable_device_cache(self.device)
+        parsed = cached_parse(self.device, ShowVrf)
+        self.assertIn('VRF1', parsed['vrf'])
+
+        # callers get a copy
+        parsed['vrf'].clear()
+        self.assertIn('VRF1', cached_parse(self.device, ShowVrf)['vrf'])
+        self.assertEqual(self.device.execute.call_count, 1)
+
+        # keyed by parser arguments
+        get_device_cache(self.device).seed_parsed(
+            ShowVrf, {'vrf': {'VRF2': {}}}, vrf='VRF2')
+        self.assertEqual(cached_parse(self.device, ShowVrf, vrf='VRF2'),
+                         {'vrf': {'VRF2': {}}})
+
+    def test_invalidate_command(self):
+        cache = enable_device_cache(self.device)
+        cmd = 'show running-config | section router ospf 1'
+        cached_parse(self.device, ShowVrf)
+        cached_execute(self.device, cmd)
+        self.assertEqual(len(cache), 2)
+
+        # the parses which ran the command are dropped with it
+        cache.invalidate(cmd)
+        self.assertEqual(len(cache), 1)
+        cached_parse(self.device, ShowVrf)
+        self.assertEqual(self.device.execute.call_count, 2)
+        cache.invalidate('show vrf')
+        self.assertEqual(len(cache), 0)
+        cached_parse(self.device, ShowVrf)
+        self.assertEqual(self.device.execute.call_count, 3)
+
+    def test_invalidate_nested(self):
+        cache = enable_device_cache(self.device)
+
+        class Outer(object):
+            '''parser running a nested parse and an auxiliary command'''
+            def __init__(self, device):
+                self.device = device
+
+            def parse(self):
+                return {'vrf': cached_parse(self.device, ShowVrf),
+                        'ospf': cached_execute(
+                            self.device,
+                            'show running-config | section router ospf 1')}
+
+        cached_parse(self.device, ShowVrf)
+        cached_parse(self.device, Outer)
+        self.assertEqual(self.device.execute.call_count, 2)
+        # the nested parse was a hit, its commands are still the outer's
+        cache.invalidate('show vrf')
+        self.assertEqual(len(cache), 1)
+
+    def test_disable(self):
+        enable_device_cache(self.device)
+        disable_device_cache(self.device)
+        self.assertIsNone(get_device_cache(self.device))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+import re
+import json
+import threading
+import unittest
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.dnac.interface import Interface
+from genie.libs.parser.utils.dnac_pager import iter_pages, map_paths, \
+    timestamp, Lookup
+
+OLD = '2019-05-31 16:17:51.735'
+NEW = '2020-01-02 10:00:00.000'
+
+
+def _interface(device, index, updated=OLD):
+    return {'adminStatus': 'UP', 'deviceId': 'dev{}'.format(device),
+            'ifIndex': str(index), 'interfaceType': 'Physical',
+            'isisSupport': 'false', 'lastUpdated': updated,
+            'ospfSupport': 'false', 'pid': 'C9300', 'portMode': 'access',
+            'portName': 'GigabitEthernet1/0/{}'.format(index),
+            'serialNo': 'FOC{}'.format(device), 'series': 'Cisco 9300',
+            'status': 'up', 'description': None}
+
+
+# 5 devices of 47 interfaces, dev3 and one of its interfaces updated
+DEVICES = [{'id': 'dev{}'.format(i), 'hostname': 'switch{}'.format(i),
+            'lastUpdated': NEW if i == 3 else OLD} for i in range(5)]
+INTERFACES = [_interface(i, j, NEW if (i, j) == (3, 7) else OLD)
+              for i in range(5) for j in range(47)]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    '''DNAC intent API with offset/limit paging'''
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.paths.append(self.path)
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        m = re.match(r'^/dna/intent/api/v1/(?P<kind>interface|network-device)'
+                     r'(/network-device)?(/(?P<id>[\w-]+))?$', url.path)
+        if not m:
+            return self._send(404, {'response': {'errorCode': 'NotFound'}})
+        records = INTERFACES if m.group('kind') == 'interface' else DEVICES
+        if m.group('id'):
+            if m.group('kind') == 'interface':
+                return self._send(200, {'response': [
+                    r for r in records if r['deviceId'] == m.group('id')]})
+            return self._send(200, {'response': next(
+                r for r in records if r['id'] == m.group('id'))})
+        if 'offset' in query:
+            offset = int(query['offset'][0]) - 1
+            records = records[offset:offset + int(query['limit'][0])]
+        self._send(200, {'response': records, 'version': '1.0'})
+
+    def _send(self, code, data):
+        body = json.dumps(data).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class RestDevice(object):
+    '''rest connection of a device, over the stub'''
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.session = requests.Session()
+
+    def get(self, path):
+        response = self.session.get(self.base_url + path)
+        response.raise_for_status()
+        return response
+
+
+class TestDnacPager(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.paths = []
+        self.thread = threading.Thread(target=self.server.serve_forever,
+                                       daemon=True)
+        self.thread.start()
+        self.device = RestDevice('http://127.0.0.1:{}'.format(
+            self.server.server_address[1]))
+
+    def tearDown(self):
+        self.device.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _paths(self, prefix):
+        return [p for p in self.server.paths if p.startswith(prefix)]
+
+    def test_iter_pages(self):
+        pages = list(iter_pages(self.device, '/dna/intent/api/v1/interface',
+                                page_size=50, max_workers=3))
+        # 235 records in 5 pages, the last one short
+        self.assertEqual(sorted(len(page) for page in pages),
+                         [35, 50, 50, 50, 50])
+        records = sorted((r for page in pages for r in page),
+                         key=INTERFACES.index)
+        self.assertEqual(records, INTERFACES)
+        # no page after the short one, but the ones already in flight
+        paths = self.server.paths
+        self.assertIn('/dna/intent/api/v1/interface?offset=201&limit=50',
+                      paths)
+        self.assertLessEqual(len(paths), 5 + 2)
+
+    def test_iter_pages_process(self):
+        counts = iter_pages(self.device, '/dna/intent/api/v1/network-device',
+                            page_size=2, process=len)
+        self.assertEqual(sorted(counts), [1, 2, 2])
+
+    def test_iter_pages_exact(self):
+        # the collection ends on a full page, one empty page to find out
+        pages = list(iter_pages(self.device,
+                                '/dna/intent/api/v1/network-device',
+                                page_size=5, max_workers=1))
+        self.assertEqual(pages, [DEVICES])
+        self.assertEqual(len(self.server.paths), 2)
+
+    def test_map_paths(self):
+        paths = ['/dna/intent/api/v1/interface/network-device/dev1',
+                 '/dna/intent/api/v1/interface/network-device/dev2']
+        results = map_paths(self.device, paths,
+                            process=lambda path, records: (path, len(records)))
+        self.assertEqual(sorted(results), [(paths[0], 47), (paths[1], 47)])
+
+    def test_lookup(self):
+        hostnames = Lookup(self.device,
+                           '/dna/intent/api/v1/network-device/{key}',
+                           'hostname')
+        self.assertEqual(hostnames['dev2'], 'switch2')
+        self.assertEqual(hostnames['dev2'], 'switch2')
+        self.assertEqual(len(self.server.paths), 1)
+
+    def test_timestamp(self):
+        self.assertEqual(timestamp(datetime(2020, 1, 2, 10)),
+                         '2020-01-02 10:00:00.000')
+        self.assertGreater(NEW, timestamp(datetime(2020, 1, 1)))
+        self.assertLess(OLD, timestamp(datetime(2020, 1, 1)))
+
+    def test_interface_paginated(self):
+        expected = Interface(device=self.device).parse()
+        self.assertEqual(len(self._paths('/dna/intent/api/v1/interface')), 1)
+        del self.server.paths[:]
+
+        parsed = Interface(device=self.device).parse(page_size=20,
+                                                     max_workers=4)
+        self.assertEqual(parsed, expected)
+        self.assertEqual(len(parsed['hostname']), 5)
+        self.assertEqual(len(parsed['hostname']['switch4']['interfaces']),
+                         47)
+        self.assertGreaterEqual(
+            len(self._paths('/dna/intent/api/v1/interface?offset=')), 12)
+        # one hostname lookup per device
+        self.assertEqual(
+            len(self._paths('/dna/intent/api/v1/network-device/')), 5)
+
+    def test_interface_incremental(self):
+        parsed = Interface(device=self.device).parse(
+            since=datetime(2020, 1, 1), page_size=2, max_workers=1)
+        self.assertEqual(
+            parsed, {'hostname': {'switch3': {'interfaces': {
+                'GigabitEthernet1/0/7': {
+                    k: v for k, v in INTERFACES[3 * 47 + 7].items()
+                    if v is not None}}}}})
+        # only the interfaces of the updated device are requested
+        self.assertEqual(
+            self._paths('/dna/intent/api/v1/interface'),
+            ['/dna/intent/api/v1/interface/network-device/dev3'])
+        self.assertEqual(
+            sorted(self._paths('/dna/intent/api/v1/network-device')),
+            ['/dna/intent/api/v1/network-device?offset=1&limit=2',
+             '/dna/intent/api/v1/network-device?offset=3&limit=2',
+             '/dna/intent/api/v1/network-device?offset=5&limit=2'])
+
+    def test_interface_incremental_unchanged(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            Interface(device=self.device).parse(since=NEW)
+        self.assertEqual(self._paths('/dna/intent/api/v1/interface'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import pathlib
+import unittest
+
+from genie.libs import parser as _parser
+from genie.libs.parser.utils.endpoint_index import EndpointIndex, \
+    Location, source_of
+
+TESTS = pathlib.Path(_parser.__file__).parent
+
+
+def golden(os, parser, name):
+    namespace = {}
+    exec((TESTS / os / 'tests' / parser / 'cli' / 'equal' /
+          name).read_text(), namespace)
+    return namespace['expected_output']
+
+
+def mac_table(entries):
+    '''parsed show mac address-table of (mac, interface, vlan)'''
+    vlans = {}
+    for mac, interface, vlan in entries:
+        vlan_dict = vlans.setdefault(str(vlan), {'vlan': vlan,
+                                                 'mac_addresses': {}})
+        vlan_dict['mac_addresses'][mac] = {
+            'mac_address': mac,
+            'interfaces': {interface: {'interface': interface,
+                                       'entry_type': 'dynamic'}}}
+    return {'mac_table': {'vlans': vlans}}
+
+
+class TestEndpointIndex(unittest.TestCase):
+
+    def test_goldens(self):
+        index = EndpointIndex()
+        for device, os, parser, name in (
+                ('sw1', 'iosxe', 'ShowMacAddressTable',
+                 'golden_output_expected.py'),
+                ('sw1', 'iosxe', 'ShowDeviceTrackingDatabase',
+                 'golden_output1_expected.py'),
+                ('sw1', 'iosxe', 'ShowAccessSession',
+                 'golden_output1_expected.py'),
+                ('rtr1', 'iosxe', 'ShowIpArp', 'golden_output_expected.py'),
+                ('nx1', 'nxos', 'ShowIpArp', 'golden_output_expected.py'),
+                ('nx1', 'nxos', 'ShowMacAddressTable',
+                 'golden_output_expected.py')):
+            index.update(device, golden(os, parser, name))
+        self.assertEqual(index.devices, ['nx1', 'rtr1', 'sw1'])
+
+        self.assertEqual(index.locate('3820.56ff.6f75'), [
+            Location('sw1', 'Port-channel12', 100, 'mac'),
+            Location('sw1', 'Port-channel12', 101, 'mac')])
+        self.assertEqual(index.locate('70:81:05:FF:EB:41'), [
+            Location('sw1', 'E0/0', 228, 'device_tracking')])
+        self.assertEqual(index.locate('f4cf.beff.9cb1'), [
+            Location('sw1', 'GigabitEthernet1/0/1', None, 'access_session')])
+        # a dropped MAC has no location
+        self.assertEqual(index.locate('ecbd.1dff.5f92'), [])
+
+        self.assertEqual(index.macs('10.10.10.10'), ['7081.05ff.eb41'])
+        self.assertEqual(index.macs('10.12.90.2'), ['fa16.3eff.5a76'])
+        self.assertEqual(index.locate_ip('10.2.4.4'), [
+            Location('nx1', 'Ethernet1/1', None, 'arp')])
+        self.assertEqual(index.macs('192.0.2.1'), [])
+
+    def test_replace(self):
+        index = EndpointIndex()
+        self.assertEqual(index.update('sw1', mac_table([
+            ('0000.0000.0001', 'Gi1/0/1', 10),
+            ('0000.0000.0002', 'Gi1/0/2', 10)])), (2, 0))
+        index.update('sw2', mac_table([('0000.0000.0001', 'Te1/1/1', 10)]))
+        self.assertEqual(len(index.locate('0000.0000.0001')), 2)
+
+        # the MAC moved, sw2 is not touched
+        self.assertEqual(index.update('sw1', mac_table([
+            ('0000.0000.0001', 'Gi1/0/1', 10),
+            ('0000.0000.0002', 'Gi1/0/5', 10)])), (1, 1))
+        self.assertEqual(index.locate('0000.0000.0002'), [
+            Location('sw1', 'Gi1/0/5', 10, 'mac')])
+        self.assertEqual(sorted(index.locate('0000.0000.0001')), [
+            Location('sw1', 'Gi1/0/1', 10, 'mac'),
+            Location('sw2', 'Te1/1/1', 10, 'mac')])
+
+        # another source of the same device is kept
+        index.update_entries('sw1', 'device_tracking', [
+            ('0000.0000.0002', 'Gi1/0/5', 10, '10.0.0.2'),
+            ('0000.0000.0003', 'Gi1/0/6', 10, '2001:db8::3')])
+        index.update('sw1', mac_table([]))
+        self.assertEqual(index.locate('0000.0000.0002'), [
+            Location('sw1', 'Gi1/0/5', 10, 'device_tracking')])
+        self.assertEqual(index.macs('2001:db8::3'), ['0000.0000.0003'])
+
+        self.assertEqual(index.remove('sw1'), 4)
+        self.assertEqual(index.devices, ['sw2'])
+        self.assertEqual(index.macs('10.0.0.2'), [])
+        # the segment of sw1 is reused
+        index.update('sw3', mac_table([('0000.0000.0004', 'Gi1/0/1', 20)]))
+        self.assertEqual(index.locate('0000.0000.0004'), [
+            Location('sw3', 'Gi1/0/1', 20, 'mac')])
+        self.assertEqual(len(index), 2)
+
+    def test_invalid(self):
+        index = EndpointIndex()
+        index.update('rtr1', {'interfaces': {'Vlan100': {'ipv4': {
+            'neighbors': {
+                '10.0.0.1': {'ip': '10.0.0.1',
+                             'link_layer_address': 'Incomplete'},
+                '10.0.0.2': {'ip': '10.0.0.2',
+                             'link_layer_address': '0000.0000.0002'}}}}}})
+        self.assertEqual(index.macs('10.0.0.1'), [])
+        # the vlan of a vlan interface
+        self.assertEqual(index.locate_ip('10.0.0.2'), [
+            Location('rtr1', 'Vlan100', 100, 'arp')])
+        with self.assertRaises(ValueError):
+            index.locate('0000.0000')
+        with self.assertRaises(ValueError):
+            source_of({'arp-table-information': {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import re
+import pathlib
+import unittest
+
+from genie.libs import parser as _parser
+from genie.libs.parser.generic.show_platform import ShowVersion
+from genie.libs.parser.utils.fingerprint import Rule, Fingerprinter, \
+    fingerprint, fingerprint_many, show_version_fingerprinter
+
+PARSER_ROOT = pathlib.Path(_parser.__file__).parent
+
+# show version goldens of every os
+OUTPUTS = [f.read_text(errors='replace') for f in sorted(
+    PARSER_ROOT.glob('*/tests/ShowVersion*/cli/equal/[!.]*_output.txt'))]
+
+IOSXR_OUTPUT = '''\
+Cisco IOS XR Software, Version 6.3.1.15I
+Copyright (c) 2013-2017 by Cisco Systems, Inc.
+
+cisco IOS-XRv 9000 () processor
+System uptime is 1 week, 6 days, 9 hours, 25 minutes
+
+Nexus Operating System
+'''
+
+
+def _set(field):
+    def handler(group, ret_dict):
+        ret_dict[field] = group['value']
+    return handler
+
+
+class TestFingerprinter(unittest.TestCase):
+
+    def test_first_rule_wins(self):
+        fingerprinter = Fingerprinter([
+            Rule('a', re.compile(r'^version (?P<value>\d+)$'), _set('a'),
+                 'x', 1.0, ()),
+            Rule('b', r'^version (?P<value>\S+)$', _set('b'), 'y', 0.5,
+                 ()),
+        ])
+        ret_dict, matched, _ = fingerprinter.scan('version 10\nversion 1a')
+        self.assertEqual(ret_dict, {'a': '10', 'b': '1a'})
+        self.assertEqual([rule.name for rule in matched], ['a', 'b'])
+
+    def test_early_stop(self):
+        # the nxos line is never reached, os/version/platform are final
+        self.assertEqual(show_version_fingerprinter().scan(IOSXR_OUTPUT)[0],
+                         {'os': 'iosxr', 'version': '6.3.1.15I',
+                          'platform': 'iosxrv9000'})
+        self.assertEqual(
+            show_version_fingerprinter().scan(IOSXR_OUTPUT,
+                                              early_stop=False)[0]['os'],
+            'nxos')
+
+    def test_goldens(self):
+        self.assertTrue(OUTPUTS)
+        for output in OUTPUTS:
+            expected = ShowVersion(device=None).cli(output=output)
+            result = fingerprint(output)
+            result.pop('confidence')
+            result.pop('scores')
+            self.assertEqual(result, expected)
+
+    def test_confidence(self):
+        result = fingerprint(IOSXR_OUTPUT)
+        self.assertEqual(result['confidence'],
+                         {'os': 1.0, 'version': 1.0, 'platform': 0.5})
+        self.assertEqual(result['scores'], {'iosxr': 1.0})
+
+        result = fingerprint(IOSXR_OUTPUT, early_stop=False)
+        self.assertEqual(result['scores'],
+                         {'iosxr': 0.6, 'nxos': 0.4})
+        self.assertEqual(result['confidence']['os'], 0.4)
+
+    def test_fingerprint_many(self):
+        outputs = OUTPUTS[:20] + [IOSXR_OUTPUT]
+        expected = [fingerprint(output) for output in outputs]
+        self.assertEqual(list(fingerprint_many(outputs, processes=0,
+                                               chunksize=3)), expected)
+        self.assertEqual(list(fingerprint_many(iter(outputs), processes=2,
+                                               chunksize=4)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.schemaengine import Any, Optional, ListOf, Or
+
+from genie.libs.parser.utils.junos_structured import load_display_json, \
+    load_display_xml, fit_to_schema
+from genie.libs.parser.junos.show_route import ShowRoute, \
+    ShowRouteProtocolNoMore
+from genie.libs.parser.junos.show_interface import ShowInterfacesExtensive, \
+    ShowInterfacesExtensiveNoForwarding
+from genie.libs.parser.junos.show_bgp import ShowBgpSummary
+from genie.libs.parser.junos.show_ospf import ShowOspfNeighbor
+
+DISPLAY_JSON = '''\
+show route | display json
+{
+    "route-information" : [
+    {
+        "attributes" : {"xmlns" : "http://xml.juniper.net/junos/18.2R1/junos-routing"},
+        "route-table" : [
+        {
+            "table-name" : [{"data" : "inet.0"}],
+            "rt" : [
+            {
+                "attributes" : {"junos:style" : "brief"},
+                "rt-destination" : [{"data" : "10.1.0.0/24"}],
+                "rt-entry" : [
+                {
+                    "active-tag" : [{"data" : "*"}],
+                    "age" : [{"data" : "29w6d 21:35:55", "attributes" : {"junos:seconds" : "18142555"}}],
+                    "current-active" : [{"data" : [null]}]
+                }
+                ]
+            }
+            ]
+        }
+        ]
+    }
+    ]
+}
+'''
+
+DISPLAY_XML = '''\
+show route | display xml
+<rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R1/junos">
+    <route-information xmlns="http://xml.juniper.net/junos/18.2R1/junos-routing">
+        <route-table>
+            <table-name>inet.0</table-name>
+            <rt junos:style="brief">
+                <rt-destination>10.1.0.0/24</rt-destination>
+                <rt-entry>
+                    <active-tag>*</active-tag>
+                    <age junos:seconds="18142555">29w6d 21:35:55</age>
+                    <current-active/>
+                </rt-entry>
+            </rt>
+        </route-table>
+    </route-information>
+    <cli>
+        <banner></banner>
+    </cli>
+</rpc-reply>
+
+{master}
+'''
+
+SCHEMA = {
+    Optional('@xmlns:junos'): str,
+    'route-information': {
+        Optional('@xmlns'): str,
+        'route-table': ListOf({
+            'table-name': str,
+            'rt': ListOf({
+                Optional('@junos:style'): str,
+                'rt-destination': str,
+                'rt-entry': {
+                    'active-tag': str,
+                    'age': {
+                        '#text': str,
+                        Optional('@junos:seconds'): str,
+                    },
+                    Optional('current-active'): bool,
+                },
+            }),
+        }),
+    },
+}
+
+FITTED = {
+    'route-information': {
+        '@xmlns': 'http://xml.juniper.net/junos/18.2R1/junos-routing',
+        'route-table': [{
+            'table-name': 'inet.0',
+            'rt': [{
+                '@junos:style': 'brief',
+                'rt-destination': '10.1.0.0/24',
+                'rt-entry': {
+                    'active-tag': '*',
+                    'age': {'#text': '29w6d 21:35:55',
+                            '@junos:seconds': '18142555'},
+                    'current-active': True,
+                },
+            }],
+        }],
+    },
+}
+
+
+class TestLoadDisplay(unittest.TestCase):
+
+    def test_json(self):
+        tree = load_display_json(DISPLAY_JSON)
+        rt = tree['route-information'][0]['route-table'][0]['rt'][0]
+        self.assertEqual(rt['@junos:style'], 'brief')
+        self.assertEqual(rt['rt-destination'], ['10.1.0.0/24'])
+        self.assertEqual(rt['rt-entry'][0]['age'],
+                         [{'#text': '29w6d 21:35:55',
+                           '@junos:seconds': '18142555'}])
+        self.assertEqual(rt['rt-entry'][0]['current-active'], [''])
+
+    def test_xml(self):
+        tree = load_display_xml(DISPLAY_XML)
+        self.assertEqual(tree['@xmlns:junos'],
+                         'http://xml.juniper.net/junos/18.2R1/junos')
+        rt = tree['route-information'][0]['route-table'][0]['rt'][0]
+        self.assertEqual(rt['@junos:style'], 'brief')
+        self.assertEqual(rt['rt-entry'][0]['age'],
+                         [{'#text': '29w6d 21:35:55',
+                           '@junos:seconds': '18142555'}])
+        self.assertEqual(rt['rt-entry'][0]['current-active'], [''])
+
+    def test_empty(self):
+        self.assertEqual(load_display_json(''), {})
+        self.assertEqual(load_display_xml(''), {})
+        self.assertEqual(load_display_xml('<rpc-reply></rpc-reply>'), {})
+
+
+class TestFitToSchema(unittest.TestCase):
+
+    def test_json(self):
+        self.assertEqual(
+            fit_to_schema(load_display_json(DISPLAY_JSON), SCHEMA), FITTED)
+
+    def test_xml(self):
+        fitted = dict(FITTED)
+        fitted['@xmlns:junos'] = 'http://xml.juniper.net/junos/18.2R1/junos'
+        self.assertEqual(
+            fit_to_schema(load_display_xml(DISPLAY_XML), SCHEMA), fitted)
+
+    def test_unknown_keys(self):
+        schema = {'peer': ListOf({'peer-address': str})}
+        tree = {'peer': [{'peer-address': ['10.0.0.1'],
+                          'peer-id': ['10.0.0.2']}]}
+        self.assertEqual(fit_to_schema(tree, schema),
+                         {'peer': [{'peer-address': '10.0.0.1'}]})
+
+    def test_any(self):
+        schema = {Any(): {'state': str}}
+        tree = {'ge-0/0/0': [{'state': ['up']}]}
+        self.assertEqual(fit_to_schema(tree, schema),
+                         {'ge-0/0/0': {'state': 'up'}})
+
+    def test_or(self):
+        schema = {'address': Or({'name': str}, ListOf({'name': str}))}
+        one = {'address': [{'name': ['10.0.0.1']}]}
+        two = {'address': [{'name': ['10.0.0.1']}, {'name': ['10.0.0.2']}]}
+        self.assertEqual(fit_to_schema(one, schema),
+                         {'address': {'name': '10.0.0.1'}})
+        self.assertEqual(fit_to_schema(two, schema),
+                         {'address': [{'name': '10.0.0.1'},
+                                      {'name': '10.0.0.2'}]})
+
+    def test_text_without_attributes(self):
+        schema = {'age': {'#text': str, Optional('@junos:seconds'): str}}
+        self.assertEqual(fit_to_schema({'age': ['1w0d']}, schema),
+                         {'age': {'#text': '1w0d'}})
+
+
+class TestStructuredOutputMixin(unittest.TestCase):
+
+    def command(self, parser_cls, display, **kwargs):
+        device = Mock()
+        device.execute.return_value = ''
+        getattr(parser_cls(device=device), display)(**kwargs)
+        return device.execute.call_args[0][0]
+
+    def test_commands(self):
+        self.assertEqual(self.command(ShowRoute, 'json', ip_address='10.0.0.1'),
+                         'show route 10.0.0.1 | display json')
+        # the display pipe goes ahead of the pipes of the command
+        self.assertEqual(
+            self.command(ShowRouteProtocolNoMore, 'xml', protocol='ospf',
+                         ip_address='10.0.0.1'),
+            'show route protocol ospf 10.0.0.1 | display xml | no-more')
+        self.assertEqual(
+            self.command(ShowInterfacesExtensive, 'json', interface='ge-0/0/0'),
+            'show interfaces ge-0/0/0 extensive | display json')
+        self.assertEqual(self.command(ShowInterfacesExtensive, 'json'),
+                         'show interfaces extensive | display json')
+        self.assertEqual(
+            self.command(ShowInterfacesExtensiveNoForwarding, 'json'),
+            'show interfaces extensive no-forwarding | display json')
+
+    def test_default_command(self):
+        # the cli_command whose fields are the arguments given
+        self.assertEqual(self.command(ShowOspfNeighbor, 'xml'),
+                         'show ospf neighbor | display xml')
+        self.assertEqual(self.command(ShowOspfNeighbor, 'xml', name='red'),
+                         'show ospf neighbor instance red | display xml')
+        self.assertEqual(self.command(ShowBgpSummary, 'json'),
+                         'show bgp summary | display json')
+        with self.assertRaises(TypeError):
+            self.command(ShowBgpSummary, 'json', instance='red')
+
+
+if __name__ == '__main__':
+    unittest.main()
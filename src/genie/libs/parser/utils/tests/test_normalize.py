@@ -0,0 +1,142 @@
+import pathlib
+import unittest
+from unittest.mock import Mock
+
+from genie.libs import parser as _parser
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.iosxe.show_lag import ShowLacpNeighbor
+from genie.libs.parser.ios.show_arp import ShowArp as ShowArp_ios
+from genie.libs.parser.junos.show_interface import ShowInterfaces
+from genie.libs.parser.utils.replay import ReplayDevice
+from genie.libs.parser.utils import normalize
+from genie.libs.parser.utils.normalize import to_seconds, to_bps, to_int, \
+    to_seconds_from_minutes, normalize_result, add_field, FAMILIES
+
+GOLDEN = (pathlib.Path(_parser.__file__).parent / 'iosxe' / 'tests' /
+          'ShowIpRoute' / 'cli' / 'equal' / 'golden_output1_output.txt')
+
+
+class TestConverters(unittest.TestCase):
+
+    def test_seconds(self):
+        for value, seconds in (('1w2d', 777600),
+                               ('1d15h', 140400),
+                               ('3w3d', 2073600),
+                               ('1y2w', 32745600),
+                               ('06:46:59', 24419),
+                               ('0:00:33', 33),
+                               ('1:02', 62),
+                               ('00:00:01.5', 1.5),
+                               ('1d 02:03:04', 93784),
+                               ('5w4d 19:49:21', 3440961),
+                               ('34 days, 18 hours, 43 minutes, 46 seconds',
+                                3005026),
+                               ('10330mn', 619800),
+                               ('205 s', 205),
+                               ('PT1H4M41S', 3881),
+                               ('P4DT12M38S', 346358)):
+            self.assertEqual(to_seconds(value), seconds, value)
+        for value in ('never', '-', 'N/A', '139', 'try 0 73072 s', 'P',
+                      'pending'):
+            self.assertIsNone(to_seconds(value), value)
+
+    def test_bps(self):
+        for value, bps in (('BW 768 Kbit/sec', 768000),
+                           ('10Gbps', 10 ** 10),
+                           ('1000mbps', 10 ** 9),
+                           ('1000 Mb/s', 10 ** 9),
+                           ('2000 bits/sec', 2000),
+                           ('1.5 Mbit', 1500000),
+                           ('25K', 25000)):
+            self.assertEqual(to_bps(value), bps, value)
+        for value in ('auto', 'a-1000', '1000', 'Unlimited'):
+            self.assertIsNone(to_bps(value), value)
+
+    def test_int(self):
+        self.assertEqual(to_int('20'), 20)
+        self.assertEqual(to_int('1,234,567'), 1234567)
+        self.assertEqual(to_int('-5'), -5)
+        self.assertIsNone(to_int('N/A'))
+        self.assertIsNone(to_int(''))
+
+
+class TestNormalize(unittest.TestCase):
+
+    def test_normalize_result(self):
+        parsed = {'routes': {'10.0.0.0/8': {'updated': '00:01:02',
+                                            'age': '1d15h',
+                                            'metric': '20'},
+                             '10.1.0.0/16': {'updated': 'never',
+                                             'metric': 20,
+                                             'updated_seconds': 1}},
+                  'entries': [{'uptime': '1d15h'}]}
+        self.assertIs(normalize_result(ShowIpRoute, parsed), parsed)
+        self.assertEqual(parsed['routes']['10.0.0.0/8'], {
+            'updated': '00:01:02', 'updated_seconds': 62,
+            'age': '1d15h', 'age_seconds': 140400,
+            'metric': '20', 'metric_int': 20})
+        # typed values of the parser are kept, only strings are converted
+        self.assertEqual(parsed['routes']['10.1.0.0/16'], {
+            'updated': 'never', 'metric': 20, 'updated_seconds': 1})
+        # not a field of the routing parsers
+        self.assertEqual(parsed['entries'], [{'uptime': '1d15h'}])
+
+        junos = {'interface': [{'input-packets': '14609', 'speed': '1000mbps',
+                                'mtu': 'Unlimited'}]}
+        self.assertEqual(normalize_result(ShowInterfaces(device=Mock()),
+                                          junos)['interface'], [{
+            'input-packets': '14609', 'input-packets-int': 14609,
+            'speed': '1000mbps', 'speed-bps': 10 ** 9, 'mtu': 'Unlimited'}])
+
+    def test_families(self):
+        # the iosxe show arp ages are minutes, the ios parser inherits them
+        self.assertEqual(to_seconds_from_minutes('139'), 8340)
+        for parser in (ShowArp, ShowArp_ios):
+            self.assertEqual(normalize_result(parser, {'age': '29'}),
+                             {'age': '29', 'age_seconds': 1740})
+        # the same field of another family is left alone
+        self.assertEqual(normalize_result(ShowLacpNeighbor,
+                                          {'age': '0d:00h:03m:14s'}),
+                         {'age': '0d:00h:03m:14s'})
+
+    def test_add_field(self):
+        with self.assertRaises(ValueError):
+            add_field('iosxe', 'show_routing', 'rx_rate', 'bytes')
+        add_field('iosxe', 'show_routing', 'rx_rate', 'bps')
+        try:
+            self.assertEqual(normalize_result(ShowIpRoute,
+                                              {'rx_rate': '10 Mbps'}),
+                             {'rx_rate': '10 Mbps', 'rx_rate_bps': 10 ** 7})
+        finally:
+            del FAMILIES['iosxe', 'show_routing']['rx_rate']
+            normalize.fields_of.cache_clear()
+        self.assertEqual(normalize_result(ShowIpRoute, {'rx_rate': '1M'}),
+                         {'rx_rate': '1M'})
+
+    def test_parse(self):
+        output = GOLDEN.read_text()
+        raw = ShowIpRoute(device=Mock()).parse(output=output)
+        parsed = normalize.parse(ShowIpRoute(device=Mock()), output=output)
+        self.assertNotEqual(parsed, raw)
+        self.assertEqual(normalize_result(ShowIpRoute, raw), parsed)
+        next_hops = [hop for route in parsed['vrf']['default'][
+                         'address_family']['ipv4']['routes'].values()
+                     for hop in route.get('next_hop', {}).get(
+                         'next_hop_list', {}).values() if 'updated' in hop]
+        self.assertTrue(next_hops)
+        for hop in next_hops:
+            self.assertEqual(hop['updated_seconds'],
+                             to_seconds(hop['updated']))
+
+        # the parsers themselves are left as they are
+        with self.assertRaises(TypeError):
+            ShowIpRoute(device=Mock()).parse(output=output, normalize=True)
+        device = ReplayDevice('R1', {'show ip route': output}, os='iosxe')
+        self.assertEqual(normalize_result(ShowIpRoute,
+                                          device.parse('show ip route')),
+                         parsed)
+
+
+if __name__ == '__main__':
+    unittest.main()
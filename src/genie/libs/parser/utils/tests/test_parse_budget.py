@@ -0,0 +1,86 @@
+import re
+import threading
+import unittest
+
+from genie.metaparser import MetaParser
+from genie.libs.parser.utils import bulk
+from genie.libs.parser.utils.parse_budget import parse_budget, \
+    parse_with_budget, ParseTimeoutError
+
+# backtracks exponentially on '[' followed by digits and no ']'
+SLOW_LINE = '[' + '1' * 40 + '!'
+
+
+class ShowSlow(MetaParser):
+    '''parser with a catastrophic pattern'''
+    schema = {}
+
+    def cli(self, output=None):
+        p1 = re.compile(r'^\[(?P<pref>[\d\/]+)+\]$')
+        for line in output.splitlines():
+            line = line.strip()
+            m = p1.match(line)
+        return {}
+
+
+class ShowLoop(MetaParser):
+    '''parser spending its time in python code'''
+    schema = {}
+
+    def cli(self, output=None):
+        for line in output.splitlines():
+            while line == 'loop':
+                pass
+        return {}
+
+
+class TestParseBudget(unittest.TestCase):
+
+    def test_timeout(self):
+        with self.assertRaises(ParseTimeoutError) as cm:
+            with parse_budget(0.2):
+                ShowSlow(device=None).parse(output='[1/0]\n' + SLOW_LINE)
+        error = cm.exception
+        self.assertTrue(error.parser.endswith('.ShowSlow'))
+        self.assertEqual(error.line, SLOW_LINE)
+        self.assertIn('exceeded its time budget of 0.2s', str(error))
+
+    def test_within_budget(self):
+        with parse_budget(1):
+            self.assertEqual(ShowSlow(device=None).parse(output='[1/0]'), {})
+        # no budget at all
+        with parse_budget(None):
+            ShowSlow(device=None).parse(output='[1/0]')
+
+    def test_parse_with_budget(self):
+        with self.assertRaises(ParseTimeoutError) as cm:
+            parse_with_budget(ShowSlow(device=None), 0.2, output=SLOW_LINE)
+        self.assertEqual(cm.exception.budget, 0.2)
+
+    def test_thread(self):
+        errors = []
+
+        def run():
+            try:
+                parse_with_budget(ShowLoop(device=None), 0.2,
+                                  output='ok\nloop')
+            except ParseTimeoutError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(errors[0].parser.endswith('.ShowLoop'))
+        self.assertEqual(errors[0].line, 'loop')
+
+    def test_bulk(self):
+        items = [(0, (('os', 'iosxe'),), 'show slow', SLOW_LINE, {})]
+        results = bulk._parse_chunk(ShowSlow, items, time_budget=0.2)
+        self.assertEqual(results[0]['error']['type'], 'ParseTimeoutError')
+        self.assertIn('ShowSlow', results[0]['error']['message'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import pathlib
+import unittest
+from unittest.mock import Mock
+
+from genie.libs import parser as _parser
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.utils.replay import ReplayDevice
+from genie.libs.parser.utils.planner import plan_commands, parse_commands
+
+INTERFACES = (pathlib.Path(_parser.__file__).parent / 'iosxe' / 'tests' /
+              'ShowInterfaces' / 'cli' / 'equal' /
+              'golden_output_output.txt').read_text()
+
+ROUTE_HEADER = '''\
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+       D - EIGRP, EX - EIGRP external, O - OSPF, IA - OSPF inter area
+
+Gateway of last resort is 192.168.0.1 to network 0.0.0.0
+
+'''
+
+ROUTES = {
+    'static': ['S*    0.0.0.0/0 [1/0] via 192.168.0.1'],
+    'bgp': ['B        10.0.1.0/24 [20/0] via 192.168.0.1, 1w2d',
+            'B        10.0.4.0/24 [20/0] via 192.168.0.1, 1w2d'],
+    'ospf': ['O IA     10.0.2.0/24 [110/2] via 192.168.0.2, 00:01:02, '
+             'GigabitEthernet1',
+             '                     [110/2] via 192.168.0.3, 00:01:02, '
+             'GigabitEthernet2'],
+    'connected': ['C        10.0.3.0/24 is directly connected, '
+                  'GigabitEthernet1',
+                  'L        10.0.3.1/32 is directly connected, '
+                  'GigabitEthernet1'],
+}
+
+
+def routes(*protocols):
+    return ROUTE_HEADER + '\n'.join(line for protocol in protocols
+                                    for line in ROUTES[protocol])
+
+
+def section(name):
+    '''show interfaces <name> output cut from the golden output'''
+    lines = INTERFACES.splitlines()
+    start = next(i for i, line in enumerate(lines)
+                 if line.startswith(name + ' is '))
+    end = next((i for i, line in enumerate(lines)
+                if i > start and line and not line[0].isspace()),
+               len(lines))
+    return '\n'.join(lines[start:end])
+
+
+def device():
+    return ReplayDevice('R1', {
+        'show interfaces': INTERFACES,
+        'show interfaces GigabitEthernet1/0/1': section(
+            'GigabitEthernet1/0/1'),
+        'show interfaces Port-channel12': section('Port-channel12'),
+        'show ip route': routes('static', 'bgp', 'ospf', 'connected'),
+        'show ip route bgp': routes('bgp'),
+    }, os='iosxe')
+
+
+class TestPlanner(unittest.TestCase):
+
+    def test_plan(self):
+        plan = plan_commands(device(), [
+            ('show interfaces {interface}', {'interface': 'Gi1/0/1'}),
+            ('show interfaces', {}),
+            ('show interfaces Vlan100', {}),
+            ('show ip route bgp', {}),
+            ('show ip route {protocol}', {'protocol': 'bgp'}),
+            ('show ip route vrf {vrf}', {'vrf': 'VRF1'}),
+        ])
+        self.assertEqual(plan.commands, ['show interfaces',
+                                         'show ip route bgp',
+                                         'show ip route vrf VRF1'])
+        self.assertEqual(len(plan.executions[0].requests), 3)
+
+        # a single subset is executed as it is
+        plan = plan_commands(device(), [('show interfaces Gi1/0/1', {})])
+        self.assertEqual(plan.commands, ['show interfaces Gi1/0/1'])
+        # a route is not a protocol
+        plan = plan_commands(device(), [('show ip route', {}),
+                                        ('show ip route 10.0.1.0', {})])
+        self.assertEqual(len(plan.commands), 2)
+
+    def test_interfaces(self):
+        replay = device()
+        results = parse_commands(replay, [
+            ('show interfaces', {}),
+            ('show interfaces {interface}', {'interface': 'Gi1/0/1'}),
+            ('show interfaces Loopback0', {}),
+        ])
+        self.assertEqual(replay.executes, 1)
+        self.assertEqual([r['executed'] for r in results],
+                         ['show interfaces'] * 3)
+        self.assertEqual(results[1]['parsed'], ShowInterfaces(
+            device=Mock()).parse(interface='GigabitEthernet1/0/1',
+                                 output=section('GigabitEthernet1/0/1')))
+        self.assertEqual(list(results[2]['parsed']), ['Loopback0'])
+
+    def test_not_derivable(self):
+        replay = device()
+        results = parse_commands(replay, [
+            ('show interfaces', {}),
+            ('show interfaces Port-channel12', {}),
+            ('show interfaces Tunnel99', {}),
+        ])
+        # the members of the port-channel are completed from its section
+        self.assertEqual(results[1]['executed'],
+                         'show interfaces Port-channel12')
+        self.assertEqual(results[1]['parsed'], ShowInterfaces(
+            device=Mock()).parse(interface='Port-channel12',
+                                 output=section('Port-channel12')))
+        self.assertEqual(replay.executes, 2)
+        self.assertEqual(results[2]['error']['type'],
+                         'SchemaEmptyParserError')
+
+    def test_routes(self):
+        replay = device()
+        results = parse_commands(replay, [
+            ('show ip route', {}),
+            ('show ip route bgp', {}),
+            ('show ip route ospf', {}),
+            ('show ip route rip', {}),
+        ])
+        self.assertEqual(replay.executes, 1)
+        for result, protocol in zip(results[1:3], ('bgp', 'ospf')):
+            self.assertEqual(result['parsed'], ShowIpRoute(
+                device=Mock()).parse(output=routes(protocol)))
+        self.assertEqual(results[3]['error']['type'],
+                         'SchemaEmptyParserError')
+
+    def test_errors(self):
+        replay = device()
+        results = parse_commands(replay, [
+            ('show ip route bgp', {}),
+            ('show nothing at all', {}),
+        ])
+        self.assertEqual(results[0]['executed'], 'show ip route bgp')
+        self.assertIn('10.0.4.0/24', results[0]['parsed']['vrf']['default'][
+            'address_family']['ipv4']['routes'])
+        self.assertEqual(results[1]['error']['type'], 'ParserNotFound')
+        self.assertIsNone(results[1]['executed'])
+        self.assertEqual(replay.executes, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
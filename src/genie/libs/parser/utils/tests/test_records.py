@@ -0,0 +1,138 @@
+import json
+import runpy
+import pathlib
+import pickle
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.schemaengine import Any, Optional, Or, ListOf
+
+from genie.libs import parser as _parser
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.iosxe.show_device_tracking import \
+    ShowDeviceTrackingDatabase
+from genie.libs.parser.iosxe.show_mac_address import \
+    ShowMacAddressTableDynamic
+from genie.libs.parser.iosxe.show_wireless import ShowWirelessClientSummary
+from genie.libs.parser.linux.ps import Ps
+from genie.libs.parser.utils import records
+from genie.libs.parser.utils.records import Record, pack, record_class, \
+    to_dict
+
+PARSER_ROOT = pathlib.Path(_parser.__file__).parent
+
+SCHEMA = {
+    'count': int,
+    'rows': {
+        Any(): {
+            'mac-address': str,
+            'vlan': int,
+            Optional('age'): str,
+            Optional(Or('ipv4', 'ipv6')): str,
+        },
+    },
+    'ports': {
+        int: {
+            'name': str,
+            'counters': {'in': int},
+        },
+    },
+    'list': ListOf({'a': int}),
+}
+
+
+def _goldens(cls):
+    os_name = cls.__module__.split('.')[3]
+    folder = PARSER_ROOT / os_name / 'tests' / cls.__name__ / 'cli' / 'equal'
+    for output in sorted(folder.glob('[!.]*_output.txt')):
+        arguments = pathlib.Path(str(output).replace('_output.txt',
+                                                     '_arguments.json'))
+        kwargs = json.loads(arguments.read_text()) \
+            if arguments.exists() else {}
+        expected = runpy.run_path(str(output).replace(
+            '_output.txt', '_expected.py'))['expected_output']
+        yield output.read_text(), kwargs, expected
+
+
+class TestRecords(unittest.TestCase):
+
+    def data(self):
+        return {
+            'count': 2,
+            'rows': {
+                'a': {'mac-address': 'aabb.cc00.0100', 'vlan': 1, 'age': '-'},
+                'b': {'vlan': 2, 'mac-address': 'aabb.cc00.0200',
+                      'ipv6': '2001::1'},
+            },
+            'ports': {1: {'name': 'Gi1', 'counters': {'in': 1}}},
+            'list': [{'a': 1}],
+        }
+
+    def test_record_class(self):
+        row = next(iter(SCHEMA['rows'].values()))
+        cls = record_class(row)
+        self.assertTrue(issubclass(cls, Record))
+        self.assertIs(record_class(row), cls)
+        self.assertEqual(list(cls._slots),
+                         ['mac-address', 'vlan', 'age', 'ipv4', 'ipv6'])
+        # not records: wildcard keys, dict values
+        self.assertIsNone(record_class(SCHEMA['rows']))
+        self.assertIsNone(record_class(next(iter(SCHEMA['ports'].values()))))
+        self.assertIsNone(record_class(SCHEMA))
+
+    def test_pack(self):
+        data = self.data()
+        packed = pack(SCHEMA, self.data())
+        self.assertEqual(packed, data)
+        self.assertEqual(data, packed)
+
+        row = packed['rows']['b']
+        self.assertIsInstance(row, Record)
+        self.assertFalse(hasattr(row, '__dict__'))
+        self.assertEqual(row['vlan'], 2)
+        self.assertEqual(row.get('age', 'n/a'), 'n/a')
+        self.assertNotIn('age', row)
+        self.assertIn('ipv6', row)
+        self.assertEqual(len(row), 3)
+        self.assertEqual(list(row), ['mac-address', 'vlan', 'ipv6'])
+        with self.assertRaises(KeyError):
+            row['ipv4']
+        with self.assertRaises(KeyError):
+            row[['unhashable']]
+        self.assertEqual(repr(row), repr({'mac-address': 'aabb.cc00.0200',
+                                          'vlan': 2, 'ipv6': '2001::1'}))
+
+        self.assertIsInstance(packed['ports'][1], dict)
+        self.assertIsInstance(packed['ports'][1]['counters'], Record)
+        self.assertIsInstance(packed['list'][0], Record)
+
+    def test_to_dict(self):
+        packed = pack(SCHEMA, self.data())
+        result = to_dict(packed)
+        self.assertEqual(result, self.data())
+        self.assertIs(type(result['rows']['a']), dict)
+        self.assertEqual(json.loads(json.dumps(result)),
+                         json.loads(json.dumps(self.data())))
+        self.assertEqual(pickle.loads(pickle.dumps(result)), self.data())
+        self.assertEqual(packed['rows']['a'].to_dict(),
+                         self.data()['rows']['a'])
+
+    def test_unknown_key(self):
+        data = {'rows': {'a': {'vlan': 1, 'extra': 1}}}
+        packed = pack(SCHEMA, data)
+        self.assertIs(type(packed['rows']['a']), dict)
+
+    def test_goldens(self):
+        for cls in (ShowArp, ShowMacAddressTableDynamic,
+                    ShowDeviceTrackingDatabase, ShowWirelessClientSummary,
+                    Ps):
+            for output, kwargs, expected in _goldens(cls):
+                device = Mock()
+                device.execute.return_value = output
+                packed = records.parse(cls(device=device), **kwargs)
+                self.assertEqual(packed, expected)
+                self.assertEqual(to_dict(packed), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
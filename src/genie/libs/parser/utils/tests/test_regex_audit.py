@@ -0,0 +1,114 @@
+import json
+import pathlib
+import tempfile
+import unittest
+
+from genie.libs.parser.utils import regex_audit
+from genie.libs.parser.utils.regex_audit import extract_file, \
+    find_hazards, adversarial_input, time_hazard, audit
+
+MODULE = '''\
+import re
+
+class ShowRoute(object):
+
+    def cli(self, output):
+        p1 = re.compile(r'^\\[(?P<pref>[\\d\\/]+)+\\]+ via +(?P<nh>\\S+)$')
+        p2 = re.compile(r'^(?P<name>\\S+) +is +(?P<status>\\w+)$', re.I)
+        p3 = re.compile(r'^Desc: +(?P<desc>(\\s*\\w+)*)$')
+        if re.match(r'^(\\d+\\.)+\\d+$', output):
+            pass
+'''
+
+
+class TestRegexAudit(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.folder.name) / 'show_route.py'
+        self.path.write_text(MODULE)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_extract(self):
+        sites = extract_file(self.path)
+        self.assertEqual([site.line for site in sites], [6, 7, 8, 9])
+        self.assertEqual(sites[0].pattern,
+                         r'^\[(?P<pref>[\d\/]+)+\]+ via +(?P<nh>\S+)$')
+        self.assertEqual(sites[1].flags, 2)
+        self.assertEqual(sites[0].module, 'show_route')
+
+    def test_nested_quantifier(self):
+        hazards = find_hazards(r'^\[(?P<pref>[\d\/]+)+\]+ via +(?P<nh>\S+)$')
+        self.assertEqual(len(hazards), 1)
+        self.assertEqual(hazards[0].kind, 'nested_quantifier')
+        self.assertEqual(hazards[0].fragment, r'([\d/]+)+')
+        self.assertEqual(hazards[0].prefix, '[')
+        self.assertEqual(hazards[0].pump, '0')
+
+        # the nullable \s* lets \w+ split the same characters
+        self.assertEqual(find_hazards(r'^(\s*\w+)*$')[0].kind,
+                         'nested_quantifier')
+
+    def test_overlapping_alternation(self):
+        hazards = find_hazards(r'^(\w+\.|[a-z]\S)*$')
+        self.assertEqual([h.kind for h in hazards],
+                         ['overlapping_alternation'])
+
+    def test_safe(self):
+        # iterations are separated by a character the repeat cannot take
+        self.assertEqual(find_hazards(r'^(\d+\.)+\d+$'), [])
+        self.assertEqual(find_hazards(r'^(?P<name>\S+) +is +(?P<s>\w+)$'),
+                         [])
+        self.assertEqual(find_hazards(r'^[\d\/]+$'), [])
+        # invalid patterns are not reported
+        self.assertEqual(find_hazards(r'^(\d+$'), [])
+
+    def test_adversarial_input(self):
+        pattern = r'^\[(?P<pref>[\d\/]+)+\]+ via'
+        hazard = find_hazards(pattern)[0]
+        line = adversarial_input(pattern, hazard, 10)
+        self.assertEqual(line, '[' + '0' * 10 + '\x00')
+
+    def test_time_hazard(self):
+        pattern = r'^\[(?P<pref>[\d\/]+)+\]+ via'
+        hazard = find_hazards(pattern)[0]
+        timings, timed_out, line = time_hazard(pattern, hazard,
+                                               sizes=(4, 8), timeout=5)
+        self.assertFalse(timed_out)
+        self.assertEqual([size for size, _ in timings], [4, 8])
+        self.assertEqual(line, '[' + '0' * 8 + '\x00')
+
+    def test_time_hazard_timeout(self):
+        pattern = r'^\[(?P<pref>[\d\/]+)+\]+ via'
+        hazard = find_hazards(pattern)[0]
+        timings, timed_out, _ = time_hazard(pattern, hazard, sizes=(4, 40),
+                                            timeout=0.5)
+        # the 40 characters line is killed with its process
+        self.assertTrue(timed_out)
+        self.assertEqual([size for size, _ in timings], [4])
+
+    def test_audit(self):
+        report = audit(paths=[self.folder.name], sizes=(4, 40),
+                       timeout=0.5)
+        self.assertEqual([(e['line'], e['kind'], e['status'])
+                          for e in report],
+                         [(6, 'nested_quantifier', 'catastrophic'),
+                          (8, 'nested_quantifier', 'catastrophic')])
+        self.assertIsNone(report[0]['worst'])
+
+        report = audit(paths=[self.path], timing=False)
+        self.assertEqual([e['status'] for e in report],
+                         ['flagged', 'flagged'])
+
+    def test_main(self):
+        output = pathlib.Path(self.folder.name) / 'report.json'
+        code = regex_audit.main([str(self.path), '--no-timing',
+                                 '--json', str(output)])
+        self.assertEqual(code, 0)
+        self.assertEqual(len(json.loads(output.read_text())), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import re
+import json
+import inspect
+import pathlib
+import unittest
+import importlib
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+from genie.libs import parser as _parser
+from genie.libs.parser.utils import regex_engine
+
+PARSER_ROOT = pathlib.Path(_parser.__file__).parent
+
+
+def _engine_modules():
+    '''names of the parser modules compiling their patterns with
+       regex_engine, found in their source'''
+    for path in sorted(PARSER_ROOT.rglob('*.py')):
+        parts = path.relative_to(PARSER_ROOT).with_suffix('').parts
+        if parts[0] == 'utils' or 'tests' in parts:
+            continue
+        if 'regex_engine.compile' in path.read_text():
+            if parts[-1] == '__init__':
+                parts = parts[:-1]
+            yield '.'.join(('genie.libs.parser',) + parts)
+
+
+def _goldens(module_name):
+    '''(class, output, arguments) of the cli goldens of the parsers
+       defined in a module'''
+    module = importlib.import_module(module_name)
+    tests = pathlib.Path(module.__file__).parent / 'tests'
+    for name, cls in inspect.getmembers(module, inspect.isclass):
+        if cls.__module__ != module_name or \
+                not issubclass(cls, MetaParser):
+            continue
+        folder = tests / name / 'cli' / 'equal'
+        for output_file in sorted(folder.glob('[!.]*_output.txt')):
+            test = output_file.name[:-len('_output.txt')]
+            arguments_file = folder / (test + '_arguments.json')
+            arguments = json.loads(arguments_file.read_text()) \
+                if arguments_file.exists() else {}
+            yield cls, output_file.read_text(), arguments
+
+
+def _parse(cls, output, arguments):
+    '''parsed output, or the type of the exception raised'''
+    device = Mock(**{'execute.return_value': output})
+    try:
+        return cls(device=device).parse(**arguments)
+    except Exception as e:
+        return type(e)
+
+
+class TestRegexEngine(unittest.TestCase):
+
+    def tearDown(self):
+        regex_engine.set_engine('re')
+
+    def test_default(self):
+        self.assertEqual(regex_engine.get_engine(), 're')
+        self.assertIn('re', regex_engine.available_engines())
+        self.assertIs(regex_engine.compile(r'^\d+$'), re.compile(r'^\d+$'))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            regex_engine.set_engine('pcre')
+
+    def test_engine_block(self):
+        engine = regex_engine.available_engines()[-1]
+        with regex_engine.engine(engine):
+            self.assertEqual(regex_engine.get_engine(), engine)
+        self.assertEqual(regex_engine.get_engine(), 're')
+
+    def test_functions(self):
+        for engine in regex_engine.available_engines():
+            with regex_engine.engine(engine):
+                m = regex_engine.match(r'(?P<a>\d+) +(?P<b>\w+)', '10 Gi1')
+                self.assertEqual(m.groupdict(), {'a': '10', 'b': 'Gi1'})
+                self.assertEqual(
+                    regex_engine.search(r'\d+', 'vlan 10').group(), '10')
+                self.assertIsNone(regex_engine.match(r'^x', 'y'))
+
+    def test_compiled(self):
+        for engine in regex_engine.available_engines():
+            with regex_engine.engine(engine):
+                p1 = regex_engine.compile(r'^vlan +(?P<vlan>\d+)$')
+                self.assertIs(regex_engine.compile(p1), p1)
+                self.assertEqual(regex_engine.match(p1, 'vlan 10')['vlan'],
+                                 '10')
+
+    def test_cache_size(self):
+        engine = regex_engine.available_engines()[-1]
+        with regex_engine.engine(engine):
+            for vlan in range(regex_engine._MAXCACHE + 10):
+                regex_engine.compile(r'^vlan {}$'.format(vlan))
+            self.assertEqual(len(regex_engine._cache),
+                             regex_engine._MAXCACHE)
+
+
+@unittest.skipUnless('re2' in regex_engine.available_engines(),
+                     'google-re2 is not installed')
+class TestRe2Engine(unittest.TestCase):
+
+    def setUp(self):
+        regex_engine.set_engine('re2')
+
+    def tearDown(self):
+        regex_engine.set_engine('re')
+
+    def test_linear(self):
+        p1 = regex_engine.compile(r'^\[(?P<pref>[\d\/]+)+\]$')
+        self.assertNotIsInstance(p1, re.Pattern)
+        # no backtracking on the line which hangs re
+        self.assertIsNone(p1.match('[' + '1' * 5000 + '!'))
+        self.assertEqual(p1.match('[110/2]').groupdict(), {'pref': '110/2'})
+
+    def test_fallback_pattern(self):
+        for pattern in [r'(?<=Gi)\d+', r'(\w)\1', r'(?x) \d + ',
+                        r'^\d{,3}$', r'\d+\Z']:
+            self.assertIsInstance(regex_engine.compile(pattern),
+                                  re.Pattern, pattern)
+        self.assertIsInstance(regex_engine.compile(r'\d', re.VERBOSE),
+                              re.Pattern)
+
+    def test_flags(self):
+        p1 = regex_engine.compile(r'^interface (?P<name>\S+)$',
+                                  re.I | re.M)
+        self.assertNotIsInstance(p1, re.Pattern)
+        self.assertEqual(p1.findall('x\nINTERFACE Gi1\n'), ['Gi1'])
+
+    def test_group_order(self):
+        p1 = regex_engine.compile(r'(?P<key>\w+): +(?P<value>\w+), '
+                                  r'+(?P<key_2>\w+): +(?P<value_2>\w+)')
+        self.assertNotIsInstance(p1, re.Pattern)
+        order = ['key', 'value', 'key_2', 'value_2']
+        self.assertEqual(list(p1.groupindex), order)
+        m = p1.match('Version: 2, rn_version: 3')
+        self.assertEqual(list(m.groupdict()), order)
+        self.assertEqual(list(m.groupdict().values()),
+                         ['Version', '2', 'rn_version', '3'])
+        self.assertEqual(m.group('value_2'), '3')
+        self.assertEqual(
+            [list(m.groupdict()) for m in p1.finditer('a: 1, b: 2')],
+            [order])
+
+    def test_fallback_string(self):
+        p1 = regex_engine.compile(r'^(?P<word>\w+)$')
+        # re2 \w is ascii only, and its $ does not match before a new line
+        self.assertEqual(p1.match('café').group('word'), 'café')
+        self.assertEqual(p1.match('abc\n').group('word'), 'abc')
+
+
+class TestConformance(unittest.TestCase):
+    '''every golden of the parsers using regex_engine gives the same
+       result with every engine installed as with re'''
+
+    def tearDown(self):
+        regex_engine.set_engine('re')
+
+    def test_modules(self):
+        modules = list(_engine_modules())
+        self.assertIn('genie.libs.parser.iosxe.show_routing', modules)
+        self.assertIn('genie.libs.parser.iosxe.cat9k.c9600.show_platform',
+                      modules)
+
+    def test_goldens(self):
+        goldens = [golden for module in _engine_modules()
+                   for golden in _goldens(module)]
+        self.assertTrue(goldens)
+        expected = [_parse(*golden) for golden in goldens]
+        for engine in regex_engine.available_engines()[1:]:
+            regex_engine.set_engine(engine)
+            for golden, parsed in zip(goldens, expected):
+                with self.subTest(engine=engine, parser=golden[0].__name__):
+                    self.assertEqual(_parse(*golden), parsed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+import json
+import time
+import shutil
+import tarfile
+import asyncio
+import pathlib
+import tempfile
+import unittest
+
+from genie.libs import parser as _parser
+from genie.libs.parser.utils import replay
+from genie.libs.parser.utils.bulk import BulkRecord, OfflineExecuteError
+from genie.libs.parser.utils.replay import Latency, ReplayDevice, \
+    AsyncReplayDevice, load_recordings, replay_devices, summarize
+
+PARSER_ROOT = pathlib.Path(_parser.__file__).parent
+
+CLOCK_OUTPUT = '''\
+Router#show clock
+Load for five secs: 1%/0%; one minute: 2%; five minutes: 3%
+Time source is NTP, 18:56:04.554 EST Mon Oct 17 2016
+
+18:56:04.554 EST Mon Oct 17 2016
+'''
+
+CLOCK_OUTPUT_2 = CLOCK_OUTPUT.replace('Mon Oct 17', 'Tue Oct 18')
+
+RECORDS = [
+    BulkRecord({'os': 'iosxe'}, 'show clock', CLOCK_OUTPUT),
+    BulkRecord({'os': 'iosxe'}, 'show clock', CLOCK_OUTPUT_2),
+    BulkRecord({'os': 'nxos'}, 'show clock', CLOCK_OUTPUT),
+]
+
+
+class TestLatency(unittest.TestCase):
+
+    def test_distributions(self):
+        for distribution in ('uniform', 'normal', 'lognormal',
+                             'exponential'):
+            latency = Latency(0.05, 0.01, distribution, seed=1)
+            samples = [latency.sample() for _ in range(2000)]
+            self.assertTrue(all(sample >= 0 for sample in samples))
+            self.assertAlmostEqual(sum(samples) / len(samples), 0.05,
+                                   delta=0.005)
+        latency = Latency(0.05, 0.01, 'uniform', seed=1)
+        self.assertTrue(all(0.04 <= latency.sample() <= 0.06
+                            for _ in range(100)))
+        self.assertEqual(Latency(0.05, 1, 'constant').sample(), 0.05)
+        self.assertEqual(Latency().sample(), 0.0)
+
+    def test_seed(self):
+        first, second = Latency(0.1, 0.05, seed=3), Latency(0.1, 0.05, seed=3)
+        self.assertEqual([first.sample() for _ in range(5)],
+                         [second.sample() for _ in range(5)])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Latency(0.1, distribution='pareto')
+        with self.assertRaises(ValueError):
+            Latency(-1)
+
+
+class TestReplayDevice(unittest.TestCase):
+
+    def test_execute(self):
+        device = ReplayDevice.from_records(RECORDS, name='R1')
+        self.assertEqual(device.os, 'iosxe')
+        self.assertEqual(device.execute('show  clock'), CLOCK_OUTPUT)
+        self.assertEqual(device.execute('show clock'), CLOCK_OUTPUT_2)
+        self.assertEqual(device.execute('show clock'), CLOCK_OUTPUT)
+        self.assertEqual(device.executes, 3)
+        with self.assertRaises(OfflineExecuteError):
+            device.execute('show version')
+
+    def test_latency(self):
+        device = ReplayDevice('R1', {'show clock': CLOCK_OUTPUT,
+                                     'show version': ''},
+                              latency={'show version': 0.2,
+                                       'show c*': Latency(0.05, 0.01),
+                                       '*': 1},
+                              os='iosxe')
+        self.assertEqual(device.latency('show version').mean, 0.2)
+        self.assertEqual(device.latency('show clock').mean, 0.05)
+        self.assertEqual(device.latency('show arp').mean, 1)
+        start = time.perf_counter()
+        device.execute('show clock')
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+
+        self.assertIsNone(ReplayDevice(os='iosxe').latency('show clock'))
+
+    def test_parse(self):
+        device = ReplayDevice.from_records(RECORDS, name='R1',
+                                           latency=0.01)
+        parsed = device.parse('show clock')
+        self.assertEqual(parsed['day'], '17')
+        with self.assertRaises(Exception):
+            device.parse('show version')
+
+        timings = device.timings
+        self.assertEqual([t.command for t in timings],
+                         ['show clock', 'show version'])
+        self.assertEqual(timings[0].parser, 'ShowClock')
+        self.assertIsNone(timings[0].error)
+        self.assertGreaterEqual(timings[0].elapsed, 0.01)
+        self.assertIsNotNone(timings[1].error)
+
+        summary = summarize(timings)
+        self.assertEqual(summary['count'], 2)
+        self.assertEqual(summary['errors'], 1)
+        self.assertLessEqual(summary['p50'], summary['max'])
+        self.assertEqual(summarize([]), {'count': 0, 'errors': 0})
+
+    def test_replay_devices(self):
+        devices = replay_devices(RECORDS, count=3)
+        self.assertEqual([device.name for device in devices],
+                         ['replay-iosxe-0', 'replay-iosxe-1',
+                          'replay-iosxe-2', 'replay-nxos-0', 'replay-nxos-1',
+                          'replay-nxos-2'])
+        # the outputs are shared, the replay state is not
+        self.assertIs(devices[0].outputs, devices[1].outputs)
+        devices[0].execute('show clock')
+        self.assertEqual(devices[1].execute('show clock'), CLOCK_OUTPUT)
+        self.assertEqual(devices[0].executes, 1)
+
+        devices = replay_devices(RECORDS, count=2, os='nxos')
+        self.assertEqual([device.os for device in devices], ['nxos', 'nxos'])
+
+    def test_async(self):
+        devices = replay_devices(RECORDS, count=50, os='iosxe', latency=0.1,
+                                 device_class=AsyncReplayDevice)
+
+        async def parse_all():
+            return await asyncio.gather(*(device.aparse('show clock')
+                                          for device in devices))
+
+        start = time.perf_counter()
+        results = asyncio.run(parse_all())
+        # the latencies overlap
+        self.assertLess(time.perf_counter() - start, 50 * 0.1 / 2)
+        self.assertEqual(results[0]['day'], '17')
+        self.assertEqual(len(results), 50)
+        self.assertEqual(summarize(timing for device in devices
+                                   for timing in device.timings)['count'], 50)
+        with self.assertRaises(TypeError):
+            devices[0].parse('show clock')
+
+
+class TestLoadRecordings(unittest.TestCase):
+
+    def test_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / 'recordings.jsonl'
+            with open(path, 'w') as f:
+                for record in RECORDS:
+                    f.write(json.dumps({'tokens': record.tokens,
+                                        'command': record.command,
+                                        'output': record.output}) + '\n')
+            records = load_recordings(path)
+        self.assertEqual(records, RECORDS)
+
+    def test_folder_and_archive(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = pathlib.Path(tmp) / 'captures'
+            shutil.copytree(PARSER_ROOT / 'iosxe' / 'tests' / 'ShowIpArp',
+                            folder / 'iosxe' / 'ShowIpArp')
+            records = load_recordings(folder)
+            archive = shutil.make_archive(str(pathlib.Path(tmp) / 'captures'),
+                                          'zip', folder)
+            self.assertEqual(load_recordings(archive), records)
+            archive = shutil.make_archive(str(pathlib.Path(tmp) / 'captures'),
+                                          'gztar', folder)
+            self.assertEqual(load_recordings(archive), records)
+            with self.assertRaises(ValueError):
+                load_recordings(PARSER_ROOT / '__init__.py')
+
+        self.assertEqual({r.command for r in records},
+                         {'show ip arp vrf green', 'show ip arp vrf VRF1'})
+        device = ReplayDevice.from_records(records)
+        self.assertIn('interfaces', device.parse('show ip arp vrf green'))
+
+    def test_tar_without_extraction_filters(self):
+        # python builds older than 3.9.17/3.10.12/3.11.4 have no filter=
+        data_filter = getattr(tarfile, 'data_filter', None)
+        if data_filter is not None:
+            del tarfile.data_filter
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                folder = pathlib.Path(tmp) / 'captures'
+                shutil.copytree(PARSER_ROOT / 'iosxe' / 'tests' / 'ShowIpArp',
+                                folder / 'iosxe' / 'ShowIpArp')
+                archive = shutil.make_archive(
+                    str(pathlib.Path(tmp) / 'captures'), 'gztar', folder)
+                self.assertEqual(load_recordings(archive),
+                                 load_recordings(folder))
+
+                outside = pathlib.Path(tmp) / 'outside.tar'
+                with tarfile.open(outside, 'w') as f:
+                    f.add(archive, arcname='../escaped.tar.gz')
+                target = pathlib.Path(tmp) / 'target'
+                with tarfile.open(outside) as f:
+                    with self.assertRaises(ValueError):
+                        replay._extract_tar(f, str(target))
+                self.assertFalse(
+                    (pathlib.Path(tmp) / 'escaped.tar.gz').exists())
+        finally:
+            if data_filter is not None:
+                tarfile.data_filter = data_filter
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import random
+import pathlib
+import unittest
+import ipaddress
+
+from genie.libs import parser as _parser
+from genie.libs.parser.utils.route_index import RouteIndex, \
+    RouteIndexBuilder, NextHop, Route, diff, iter_routes
+
+TESTS = pathlib.Path(_parser.__file__).parent
+
+
+def golden(os, parser, name):
+    namespace = {}
+    exec((TESTS / os / 'tests' / parser / 'cli' / 'equal' /
+          name).read_text(), namespace)
+    return namespace['expected_output']
+
+
+def cisco(routes, vrf='default', af='ipv4'):
+    '''parsed show ip route of {prefix: (protocol, next hop)}'''
+    return {'vrf': {vrf: {'address_family': {af: {'routes': {
+        prefix: {'route': prefix, 'source_protocol': protocol,
+                 'next_hop': {'next_hop_list': {1: {
+                     'index': 1, 'next_hop': next_hop}}}}
+        for prefix, (protocol, next_hop) in routes.items()}}}}}}
+
+
+class TestRouteIndex(unittest.TestCase):
+
+    def test_lookup(self):
+        index = RouteIndex.from_parsed(cisco({
+            '0.0.0.0/0': ('static', '192.168.0.1'),
+            '10.0.0.0/8': ('ospf', '192.168.0.2'),
+            '10.1.0.0/16': ('bgp', '192.168.0.3'),
+            '10.1.2.0/24': ('bgp', '192.168.0.4'),
+            '10.1.2.128/25': ('bgp', '192.168.0.5'),
+            '10.2.0.0/16': ('bgp', '192.168.0.6'),
+        }))
+        for address, prefix in (('10.1.2.3', '10.1.2.0/24'),
+                                ('10.1.2.200', '10.1.2.128/25'),
+                                ('10.1.3.1', '10.1.0.0/16'),
+                                ('10.3.0.1', '10.0.0.0/8'),
+                                ('10.255.255.255', '10.0.0.0/8'),
+                                ('11.0.0.0', '0.0.0.0/0')):
+            self.assertEqual(index.lookup(address).prefix, prefix, address)
+        self.assertEqual(index.lookup('10.1.2.3'), Route(
+            'default', '10.1.2.0/24', 'bgp',
+            (NextHop('192.168.0.4', None),)))
+        self.assertIsNone(index.lookup('10.1.2.3', vrf='VRF1'))
+        self.assertIsNone(index.lookup('2001:db8::1'))
+
+        self.assertEqual([r.prefix for r in index.covering('10.1.2.0/26')],
+                         ['10.1.2.0/24', '10.1.0.0/16', '10.0.0.0/8',
+                          '0.0.0.0/0'])
+        self.assertEqual([r.prefix for r in index.covered('10.1.0.0/16')],
+                         ['10.1.0.0/16', '10.1.2.0/24', '10.1.2.128/25'])
+        self.assertEqual(len(index.covered('0.0.0.0/0')), 6)
+
+    def test_random(self):
+        rand = random.Random(1)
+        builder = RouteIndexBuilder()
+        networks = {}
+        for _ in range(2000):
+            length = rand.choice([0, 8, 12, 16, 20, 22, 24, 24, 28, 32])
+            network = ipaddress.ip_network(
+                (rand.getrandbits(32) >> (32 - length) << (32 - length)
+                 if length else 0, length))
+            networks[network] = str(len(networks))
+            builder.add('default', str(network), networks[network])
+        index = builder.build()
+        self.assertEqual(len(index), len(networks))
+
+        candidates = sorted(networks, key=lambda n: n.prefixlen,
+                            reverse=True)
+        for _ in range(500):
+            address = ipaddress.ip_address(rand.choice(
+                [rand.getrandbits(32),
+                 int(rand.choice(candidates).network_address)]))
+            best = next((n for n in candidates if address in n), None)
+            route = index.lookup(str(address))
+            self.assertEqual(route and route.prefix, best and str(best))
+        for network in rand.sample(candidates, 50):
+            self.assertEqual(
+                sorted(r.prefix for r in index.covered(str(network))),
+                sorted(str(n) for n in candidates if n.subnet_of(network)))
+            self.assertEqual(
+                [r.prefix for r in index.covering(str(network))],
+                [str(n) for n in candidates if network.subnet_of(n)])
+
+    def test_ipv6(self):
+        parsed = golden('nxos', 'ShowIpv6Route', 'golden_output_1_expected.py')
+        index = RouteIndex.from_parsed(parsed)
+        self.assertEqual(len(index), len(list(iter_routes(parsed))))
+        for route in index.routes():
+            network = ipaddress.ip_network(route.prefix)
+            self.assertEqual(index.lookup(str(network.network_address),
+                                          vrf=route.vrf).prefix,
+                             route.prefix)
+
+    def test_goldens(self):
+        parsed = golden('iosxe', 'ShowIpRoute', 'golden_output6_expected.py')
+        index = RouteIndex.from_parsed(parsed)
+        self.assertEqual(index.lookup('172.20.30.7'), Route(
+            'default', '172.20.30.0/24', 'isis',
+            (NextHop('172.20.190.110', 'TenGigabitEthernet1/1/4'),
+             NextHop('172.20.190.101', 'TenGigabitEthernet1/1/3'))))
+
+        # the mpls.0 table is skipped, inet.3 is a vrf of its own
+        parsed = golden('junos', 'ShowRoute', 'golden_output_3_expected.py')
+        index = RouteIndex.from_parsed(parsed)
+        self.assertEqual(index.vrfs, ['default', 'inet.3'])
+        self.assertEqual(index.lookup('192.0.2.1'), Route(
+            'default', '0.0.0.0/0', 'ospf',
+            (NextHop('10.169.14.121', 'ge-0/0/1.0'),)))
+        parsed = golden('junos', 'ShowRoute', 'golden_output_6_expected.py')
+        self.assertEqual(RouteIndex.from_parsed(parsed).vrfs,
+                         ['default', 'inet.3', 'GIPV'])
+
+    def test_diff(self):
+        old = RouteIndex.from_parsed(cisco({
+            '10.0.0.0/8': ('ospf', '192.168.0.2'),
+            '10.1.0.0/16': ('bgp', '192.168.0.3'),
+            '10.2.0.0/16': ('bgp', '192.168.0.3'),
+        }))
+        new = RouteIndex.from_parsed(
+            cisco({'10.0.0.0/8': ('ospf', '192.168.0.2'),
+                   '10.1.0.0/16': ('bgp', '192.168.0.4'),
+                   '10.3.0.0/16': ('bgp', '192.168.0.3')}),
+            cisco({'10.0.0.0/8': ('static', '192.168.0.1')}, vrf='VRF1'))
+        result = diff(old, new)
+        self.assertEqual([r.prefix for r in result.added],
+                         ['10.3.0.0/16', '10.0.0.0/8'])
+        self.assertEqual(result.added[1].vrf, 'VRF1')
+        self.assertEqual([r.prefix for r in result.removed], ['10.2.0.0/16'])
+        (before, after), = result.changed
+        self.assertEqual((before.next_hops[0].address,
+                          after.next_hops[0].address),
+                         ('192.168.0.3', '192.168.0.4'))
+        self.assertEqual(diff(new, new), ([], [], []))
+
+    def test_invalid(self):
+        builder = RouteIndexBuilder()
+        with self.assertRaises(ValueError):
+            builder.add('default', '10.0.0.0/33')
+        with self.assertRaises(ValueError):
+            builder.add('default', '2567')
+        # host bits are cleared
+        builder.add('default', '10.1.2.3/24', 'static')
+        self.assertEqual(builder.build().lookup('10.1.2.200').prefix,
+                         '10.1.2.0/24')
+
+
+if __name__ == '__main__':
+    unittest.main()
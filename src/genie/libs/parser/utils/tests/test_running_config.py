@@ -0,0 +1,181 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.schemaengine import Any, Or
+from genie.metaparser.util.exceptions import SchemaEmptyParserError, \
+    SchemaError
+
+from genie.libs.parser.iosxe.show_run import ShowRunInterface, \
+    ShowRunningConfigNve
+from genie.libs.parser.utils.running_config import split_stanzas, \
+    merge_fragment, IncrementalConfigParser
+
+CONFIG = '''\
+Building configuration...
+
+Current configuration : 520 bytes
+!
+interface GigabitEthernet1/0/1
+ description uplink
+ switchport mode trunk
+ !
+ load-interval 30
+!
+interface GigabitEthernet1/0/2
+ description access
+ switchport access vlan 10
+ switchport mode access
+!
+interface Vlan10
+ ip address 10.1.1.1 255.255.255.0
+!
+end
+'''
+
+NVE_CONFIG = '''\
+l2vpn evpn
+ replication-type static
+ router-id Loopback1
+!
+l2vpn evpn instance 101 vlan-based
+ encapsulation vxlan
+ replication-type ingress
+!
+vlan configuration 101
+ member evpn-instance 101 vni 10101
+!
+interface nve1
+ no ip address
+ source-interface Loopback1
+ member vni 10101 ingress-replication
+!
+end
+'''
+
+
+class ShowRunVrf(object):
+    '''each vrf takes either a rd or a vni, never both'''
+    schema = {'vrf': {Any(): Or({'rd': str}, {'vni': int})}}
+
+    def __init__(self, device=None):
+        pass
+
+    def cli(self, output):
+        ret_dict = {}
+        for line in output.splitlines():
+            name, key, value = line.split()
+            ret_dict.setdefault('vrf', {})[name] = \
+                {key: int(value) if key == 'vni' else value}
+        return ret_dict
+
+
+class TestRunningConfig(unittest.TestCase):
+
+    def test_split_stanzas(self):
+        stanzas = split_stanzas(CONFIG)
+        self.assertEqual(stanzas[0], 'Building configuration...\n')
+        self.assertEqual(stanzas[1], 'Current configuration : 520 bytes')
+        # indented '!' stays within its stanza
+        self.assertEqual(stanzas[2], 'interface GigabitEthernet1/0/1\n'
+                                     ' description uplink\n'
+                                     ' switchport mode trunk\n'
+                                     ' !\n'
+                                     ' load-interval 30')
+        self.assertEqual(stanzas[-1], 'end')
+        self.assertEqual(len(stanzas), 6)
+
+    def test_split_stanzas_section_output(self):
+        output = ('interface Gi1\n description a\n'
+                  'interface Gi2\n description b\n')
+        self.assertEqual(split_stanzas(output),
+                         ['interface Gi1\n description a',
+                          'interface Gi2\n description b'])
+
+    def test_merge_fragment(self):
+        fragment = {'a': {'b': 1, 'c': [1, 2]}}
+        result = merge_fragment({}, fragment)
+        merge_fragment(result, {'a': {'d': 2, 'c': [2, 3]}})
+        self.assertEqual(result, {'a': {'b': 1, 'c': [1, 2, 3], 'd': 2}})
+        # cached fragments are never altered
+        self.assertEqual(fragment, {'a': {'b': 1, 'c': [1, 2]}})
+
+    def test_incremental_same_as_full_parse(self):
+        full = ShowRunInterface(device=Mock()).parse(output=CONFIG)
+        parser = IncrementalConfigParser(ShowRunInterface)
+        self.assertEqual(parser.parse(output=CONFIG), full)
+        self.assertEqual(parser.stats['parsed'], 6)
+
+    def test_incremental_only_changed_stanzas(self):
+        parser = IncrementalConfigParser(ShowRunInterface)
+        parser.parse(output=CONFIG)
+
+        changed = CONFIG.replace('description access',
+                                 'description printer')
+        parsed = parser.parse(output=changed)
+        self.assertEqual(parser.stats, {'stanzas': 6, 'parsed': 1,
+                                        'cached': 5, 'fallback': False})
+        self.assertEqual(
+            parsed['interfaces']['GigabitEthernet1/0/2']['description'],
+            'printer')
+        self.assertEqual(parsed,
+                         ShowRunInterface(device=Mock()).parse(output=changed))
+
+        # removed stanzas disappear from the result
+        removed = changed.replace('interface Vlan10\n', 'interface Vlan20\n')
+        parsed = parser.parse(output=removed)
+        self.assertNotIn('Vlan10', parsed['interfaces'])
+        self.assertIn('Vlan20', parsed['interfaces'])
+
+    def test_incremental_context(self):
+        full = ShowRunningConfigNve(device=Mock()).parse(output=NVE_CONFIG)
+        parser = IncrementalConfigParser(ShowRunningConfigNve)
+        self.assertEqual(parser.parse(output=NVE_CONFIG), full)
+        self.assertFalse(parser.stats['fallback'])
+        parser.parse(output=NVE_CONFIG)
+        self.assertEqual(parser.stats['parsed'], 0)
+
+        # a context change invalidates every cached fragment
+        changed = NVE_CONFIG.replace('replication-type static',
+                                     'replication-type ingress')
+        self.assertEqual(parser.parse(output=changed),
+                         ShowRunningConfigNve(device=Mock()).parse(
+                             output=changed))
+        self.assertEqual(parser.stats['parsed'], parser.stats['stanzas'])
+
+    def test_same_key_fragments(self):
+        # the same interface in two stanzas is merged as the parser does
+        output = ('interface Gi1\n description a\n load-interval 30\n!\n'
+                  'interface Gi1\n description b\n!\n')
+        parser = IncrementalConfigParser(ShowRunInterface)
+        parsed = parser.parse(output=output)
+        self.assertEqual(parsed, {'interfaces': {'Gi1': {
+            'description': 'b', 'load_interval': '30'}}})
+        self.assertEqual(parsed,
+                         ShowRunInterface(device=Mock()).parse(output=output))
+
+        # each fragment matches the schema, their merge does not
+        parser = IncrementalConfigParser(ShowRunVrf)
+        self.assertEqual(parser.parse(output='red rd 1:1\n!\nblue vni 10\n'),
+                         {'vrf': {'red': {'rd': '1:1'}, 'blue': {'vni': 10}}})
+        with self.assertRaises(SchemaError):
+            parser.parse(output='red rd 1:1\n!\nred vni 10\n')
+
+    def test_fallback_full_parse(self):
+        # indentation lost in the capture, stanzas cannot be parsed alone
+        output = ('interface GigabitEthernet1\n'
+                  ' switchport mode trunk\n'
+                  'spanning-tree portfast trunk\n')
+        parser = IncrementalConfigParser(ShowRunInterface)
+        parsed = parser.parse(output=output)
+        self.assertTrue(parser.stats['fallback'])
+        self.assertEqual(parsed,
+                         ShowRunInterface(device=Mock()).parse(output=output))
+
+    def test_empty(self):
+        parser = IncrementalConfigParser(ShowRunInterface)
+        with self.assertRaises(SchemaEmptyParserError):
+            parser.parse(output='Building configuration...\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+import runpy
+import pathlib
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser, _metaparser
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, \
+    ListOf, Use
+from genie.metaparser.util.exceptions import SchemaEmptyParserError, \
+    SchemaError, SchemaMissingKeyError, SchemaTypeError, \
+    SchemaUnsupportedKeyError
+
+from genie.libs import parser as _parser
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+from genie.libs.parser.utils import schema_compiler
+from genie.libs.parser.utils.schema_compiler import compile_schema, \
+    get_validator, validate, generate
+
+PARSER_ROOT = pathlib.Path(_parser.__file__).parent
+
+SCHEMA = {
+    'vrf': {
+        Any(): {
+            'name': str,
+            Optional('index'): int,
+            Optional('enabled'): bool,
+            Optional('load'): float,
+            Optional('tags'): list,
+            Optional('extra'): dict,
+            Optional('anything'): Any(),
+            Optional('state'): Or('up', 'down'),
+            Optional('mtu'): Or(int, None),
+            Optional('neighbors'): ListOf({
+                'address': str,
+                Optional('asn'): int,
+            }),
+            Optional('peer'): Or({'ip': str}, {'mac': str}),
+            Optional(Or('ipv4', 'ipv6')): {Any(): int},
+            Optional('ports'): {int: str},
+        },
+    },
+    'version': 1,
+}
+
+DATA = {
+    'vrf': {
+        'default': {
+            'name': 'default', 'index': 1, 'enabled': True, 'load': 0.5,
+            'tags': ['a', {'b': [1]}], 'extra': {'x': {'y': 2}},
+            'anything': [{'z': None}], 'state': 'up', 'mtu': None,
+            'neighbors': [{'address': '10.0.0.1', 'asn': 65000},
+                          {'address': '10.0.0.2'}],
+            'peer': {'mac': 'aabb.cc00.0100'},
+            'ipv4': {'10.0.0.0/8': 1}, 'ipv6': {},
+            'ports': {1: 'Gi1', 2: 'Gi2'},
+        },
+        'red': {'name': 'red', 'index': True},
+        'blue': {'name': 'blue', 'mtu': 1500},
+    },
+    'version': 1,
+}
+
+
+def _goldens(cls):
+    os_name = cls.__module__.split('.')[3]
+    for expected in sorted((PARSER_ROOT / os_name / 'tests' / cls.__name__ /
+                            'cli' / 'equal').glob('[!.]*_expected.py')):
+        yield runpy.run_path(str(expected))['expected_output']
+
+
+class InvalidParser(MetaParser):
+    schema = {'name': int}
+
+    def cli(self, output=None):
+        return {'name': output}
+
+
+class TestSchemaCompiler(unittest.TestCase):
+
+    def assertSameValidation(self, schema, data):
+        try:
+            expected = Schema(schema).validate(data)
+        except Exception as e:
+            with self.assertRaises(type(e)):
+                validate(schema, data)
+            return
+        result = validate(schema, data)
+        self.assertEqual(result, expected)
+        self.assertEqual(repr(result), repr(expected))
+
+    def test_validate(self):
+        self.assertIsNotNone(get_validator(SCHEMA))
+        result = validate(SCHEMA, DATA)
+        self.assertEqual(result, Schema(SCHEMA).validate(DATA))
+        # copied as by the schema engine
+        self.assertIsNot(result['vrf'], DATA['vrf'])
+        self.assertIsNot(result['vrf']['default']['tags'][1],
+                         DATA['vrf']['default']['tags'][1])
+
+    def test_invalid(self):
+        cases = [
+            ({'vrf': {'red': {}}, 'version': 1}, SchemaMissingKeyError),
+            ({'vrf': {}}, SchemaMissingKeyError),
+            ({'vrf': {'red': {'name': 'red', 'mtu': '1500'}}, 'version': 1},
+             SchemaError),
+            ({'vrf': {'red': {'name': 'red', 'index': 1.0}}, 'version': 1},
+             SchemaTypeError),
+            ({'vrf': {'red': {'name': 'red', 'mtu': 1}}, 'version': 1,
+              'extra': 1}, SchemaUnsupportedKeyError),
+            ({'vrf': {'red': {'name': 'red', 'ports': {'1': 'Gi1'}}},
+              'version': 1}, SchemaMissingKeyError),
+            ({}, SchemaEmptyParserError),
+        ]
+        for data, error in cases:
+            with self.assertRaises(error):
+                validate(SCHEMA, data)
+            self.assertSameValidation(SCHEMA, data)
+
+    def test_same_validation(self):
+        cases = [
+            # literals and types by equality and isinstance
+            ({'a': 1}, {'a': True}),
+            ({'a': 1}, {'a': 1.0}),
+            ({'a': int}, {'a': True}),
+            ({'a': bool}, {'a': 1}),
+            ({'a': None}, {'a': 0}),
+            ({'a': ListOf(int)}, {'a': (1,)}),
+            ({'a': ListOf(int)}, {'a': []}),
+            # literal keys before Or keys, Or keys before Any
+            ({Or('a', 'b'): int, 'a': str}, {'a': 's'}),
+            ({Any(): str, Or('a', 'b'): int}, {'a': 's'}),
+            ({Any(): int, 'a': str}, {'a': 's', 'b': 1}),
+            ({str: int}, {1: 1}),
+            ({Optional('a'): {'b': int}}, {'a': {}}),
+            ({'a': {Any(): {'b': int}}}, {'a': {}}),
+            ({'a': Or({'x': int}, {'x': str, 'y': int})},
+             {'a': {'x': 's', 'y': 1}}),
+            # left to the schema engine
+            ({'a': Any()}, {'a': (1, [2])}),
+            ({'a': Any()}, {'a': Mock()}),
+        ]
+        for schema, data in cases:
+            self.assertSameValidation(schema, data)
+
+    def test_unsupported(self):
+        schema = {'a': Use(int)}
+        with self.assertRaises(ValueError):
+            generate(schema)
+        self.assertIsNone(compile_schema(schema))
+        self.assertEqual(validate(schema, {'a': '1'}), {'a': 1})
+
+    def test_cache(self):
+        schema = {'a': int}
+        self.assertIs(get_validator(schema), get_validator(schema))
+        self.assertIsNot(get_validator(schema), get_validator({'a': int}))
+
+    def test_goldens(self):
+        for cls in (ShowIpRoute, ShowInterfaces, ShowBgpAllDetail):
+            self.assertIsNotNone(get_validator(cls.schema))
+            goldens = list(_goldens(cls))
+            self.assertTrue(goldens, 'no golden of {}'.format(cls.__name__))
+            for expected in goldens:
+                self.assertSameValidation(cls.schema, expected)
+
+
+class TestModes(unittest.TestCase):
+
+    def tearDown(self):
+        schema_compiler.set_mode('generic')
+
+    def test_mode(self):
+        self.assertEqual(schema_compiler.get_mode(), 'generic')
+        with schema_compiler.mode('compiled'):
+            self.assertEqual(schema_compiler.get_mode(), 'compiled')
+            self.assertIs(_metaparser.Schema,
+                          schema_compiler.CompiledSchema)
+            with self.assertRaisesRegex(Exception, 'schema checking failed'):
+                InvalidParser(device=Mock()).parse(output='1')
+            with self.assertRaises(SchemaEmptyParserError):
+                ShowIpRoute(device=Mock()).parse(output='')
+        self.assertIs(_metaparser.Schema, Schema)
+
+    def test_invalid_mode(self):
+        for name in ('fast', 'sampled:0', 'sampled:x'):
+            with self.assertRaises(ValueError):
+                schema_compiler.set_mode(name)
+        self.assertEqual(schema_compiler.get_mode(), 'generic')
+
+    def test_sampled(self):
+        parser = InvalidParser(device=Mock())
+        with schema_compiler.mode('sampled:3'):
+            results = []
+            for _ in range(6):
+                try:
+                    results.append(parser.parse(output='1'))
+                except Exception:
+                    results.append(None)
+        self.assertEqual(results, [None, {'name': '1'}, {'name': '1'}] * 2)
+
+        with schema_compiler.mode('sampled', sample_rate=1):
+            with self.assertRaisesRegex(Exception, 'schema checking failed'):
+                parser.parse(output='1')
+
+    def test_parse(self):
+        output = (PARSER_ROOT / 'iosxe' / 'tests' / 'ShowIpRoute' / 'cli' /
+                  'equal' / 'golden_output1_output.txt').read_text()
+        expected = ShowIpRoute(device=Mock()).parse(output=output)
+        with schema_compiler.mode('compiled'):
+            self.assertEqual(ShowIpRoute(device=Mock()).parse(output=output),
+                             expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import json
+import runpy
+import pathlib
+import unittest
+from unittest.mock import Mock
+
+from genie.libs import parser as _parser
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAll
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_interface import ShowIpInterfaceBrief, \
+    ShowInterfacesStatus
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.utils import string_pool
+from genie.libs.parser.utils.common import Common
+
+PARSER_ROOT = pathlib.Path(_parser.__file__).parent
+
+OUTPUT = '''\
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+       o - ODR, P - periodic downloaded static route, H - NHRP, l - LISP
+
+Gateway of last resort is not set
+
+O        10.0.1.0/24 [110/2] via 192.168.1.1, 00:10:01, GigabitEthernet0/0/1
+O        10.0.2.0/24 [110/2] via 192.168.1.1, 00:10:01, GigabitEthernet0/0/1
+'''
+
+
+def _goldens(cls):
+    folder = PARSER_ROOT / 'iosxe' / 'tests' / cls.__name__ / 'cli' / 'equal'
+    for output in sorted(folder.glob('[!.]*_output.txt')):
+        arguments = pathlib.Path(str(output).replace('_output.txt',
+                                                     '_arguments.json'))
+        kwargs = json.loads(arguments.read_text()) \
+            if arguments.exists() else {}
+        expected = runpy.run_path(str(output).replace(
+            '_output.txt', '_expected.py'))['expected_output']
+        yield output.read_text(), kwargs, expected
+
+
+def _parse(cls, output, kwargs):
+    device = Mock()
+    device.execute.return_value = output
+    return cls(device=device).parse(**kwargs)
+
+
+class TestStringPool(unittest.TestCase):
+
+    def tearDown(self):
+        string_pool.set_enabled(False)
+
+    def test_disabled(self):
+        self.assertFalse(string_pool.is_enabled())
+        value = ''.join(['Gigabit', 'Ethernet1'])
+        self.assertIs(string_pool.intern(value), value)
+        self.assertIs(string_pool.intern(None), None)
+
+    def test_pooled(self):
+        first, second = ''.join(['up', 'link']), ''.join(['up', 'link'])
+        self.assertIsNot(first, second)
+        with string_pool.pooled():
+            self.assertTrue(string_pool.is_enabled())
+            self.assertIs(string_pool.intern(first),
+                          string_pool.intern(second))
+            self.assertEqual(string_pool.intern(1), 1)
+            values = string_pool.intern_values({'a': first, 'b': second,
+                                                'c': None})
+            self.assertIs(values['a'], values['b'])
+            self.assertIsNone(values['c'])
+        self.assertFalse(string_pool.is_enabled())
+
+    def test_convert_intf_name(self):
+        with string_pool.pooled():
+            first = Common.convert_intf_name('Gi0/0/1')
+            second = Common.convert_intf_name('gi0/0/1', ignore_case=True)
+        self.assertEqual(first, 'GigabitEthernet0/0/1')
+        self.assertIs(first, second)
+
+    def test_shared_values(self):
+        parser = ShowIpRoute(device=Mock())
+        routes = parser.cli(output=OUTPUT)['vrf']['default']['address_family']\
+            ['ipv4']['routes']
+        first, second = (routes[route]['next_hop']['next_hop_list'][1]
+                         for route in ('10.0.1.0/24', '10.0.2.0/24'))
+        self.assertIsNot(first['next_hop'], second['next_hop'])
+
+        with string_pool.pooled():
+            routes = parser.parse(output=OUTPUT)['vrf']['default']\
+                ['address_family']['ipv4']['routes']
+        first, second = (routes[route]['next_hop']['next_hop_list'][1]
+                         for route in ('10.0.1.0/24', '10.0.2.0/24'))
+        for key in ('next_hop', 'outgoing_interface', 'updated'):
+            self.assertIs(first[key], second[key])
+        self.assertIs(routes['10.0.1.0/24']['source_protocol'],
+                      routes['10.0.2.0/24']['source_protocol'])
+
+    def test_goldens(self):
+        for cls in (ShowIpRoute, ShowArp, ShowMacAddressTable, ShowBgpAll,
+                    ShowIpInterfaceBrief, ShowInterfacesStatus):
+            for output, kwargs, expected in _goldens(cls):
+                with string_pool.pooled():
+                    self.assertEqual(_parse(cls, output, kwargs), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import io
+import pathlib
+import tempfile
+import unittest
+
+from genie.libs.parser.utils.techsupport import iter_sections, \
+    parse_tech_support, iter_parse_tech_support
+
+TECH_SUPPORT = '''\
+Load for five secs: 1%/0%; one minute: 2%; five minutes: 3%
+
+------------------ show clock ------------------
+
+18:56:04.554 EST Mon Oct 17 2016
+
+------------------ show ip arp ------------------
+
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  10.1.18.1               -   5e00.00ff.0209  ARPA   Ethernet1/0
+
+------------------ show data-corruption ------------------
+
+No data inconsistency errors have been recorded.
+
+------------------ show redundancy history ------------------
+
+
+------------------ show clock ------------------
+
+19:00:00.000 EST Mon Oct 17 2016
+'''
+
+NXOS_TECH_SUPPORT = '''\
+`show clock`
+18:56:04.554 EST Mon Oct 17 2016
+
+`show hostname`
+nx-1
+'''
+
+
+class TestTechSupport(unittest.TestCase):
+
+    def test_iter_sections(self):
+        sections = list(iter_sections(io.StringIO(TECH_SUPPORT)))
+        self.assertEqual([c for c, _ in sections], [
+            'show clock',
+            'show ip arp',
+            'show data-corruption',
+            'show clock',
+        ])
+        self.assertIn('5e00.00ff.0209', sections[1][1])
+        self.assertNotIn('show data-corruption', sections[1][1])
+
+    def test_iter_sections_nxos(self):
+        sections = list(iter_sections(NXOS_TECH_SUPPORT.splitlines()))
+        self.assertEqual(sections[0][0], 'show clock')
+        self.assertEqual(sections[1], ('show hostname', 'nx-1'))
+
+    def test_iter_sections_table_separator(self):
+        output = ('------------------ show ip arp ------------------\n'
+                  'Port  Vlan\n'
+                  '----  ----\n'
+                  'Gi1   10\n')
+        sections = list(iter_sections(output.splitlines()))
+        self.assertEqual(len(sections), 1)
+        self.assertIn('----  ----', sections[0][1])
+
+    def test_parse_tech_support(self):
+        parsed = parse_tech_support(TECH_SUPPORT, {'os': 'iosxe'},
+                                    processes=0)
+        self.assertEqual(set(parsed), {'show clock', 'show ip arp'})
+        # first section wins
+        self.assertEqual(parsed['show clock']['time'], '18:56:04.554')
+        self.assertIn('Ethernet1/0', parsed['show ip arp']['interfaces'])
+
+    def test_parse_tech_support_process_pool(self):
+        parsed = parse_tech_support(io.StringIO(TECH_SUPPORT),
+                                    {'os': 'iosxe'}, processes=2)
+        self.assertEqual(set(parsed), {'show clock', 'show ip arp'})
+
+    def test_parse_tech_support_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp, 'tech.txt')
+            path.write_text(TECH_SUPPORT)
+            parsed = parse_tech_support(path, {'os': 'iosxe'}, processes=0)
+            self.assertEqual(set(parsed), {'show clock', 'show ip arp'})
+            # a str is content, never a path
+            self.assertEqual(parse_tech_support(str(path), {'os': 'iosxe'},
+                                                processes=0), {})
+
+    def test_iter_parse_tech_support_errors(self):
+        results = list(iter_parse_tech_support(TECH_SUPPORT, {'os': 'iosxe'},
+                                               processes=0))
+        errors = {r['command'] for r in results if 'error' in r}
+        self.assertIn('show data-corruption', errors)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import io
+import unittest
+
+from genie.libs.parser.utils.transcript import clean_line, iter_commands, \
+    AbbreviationResolver, iter_parse_transcript, parse_transcript
+
+PAGER = ' --More-- ' + '\b' * 10 + ' ' * 10 + '\b' * 10
+
+TRANSCRIPT = '''\
+router1#terminal length 0
+router1#sh clock
+18:56:04.554 EST Mon Oct 17 2016
+router1#sh ip int br
+Interface              IP-Address      OK? Method Status                Protocol
+GigabitEthernet0/0/0   10.105.44.23    YES other  up                    up
+{pager}GigabitEthernet0/0/1   10.174.10.1     YES other  up                    up
+\x1b[7m--More--\x1b[m\r          \rTe0/0/4                unassigned      YES unset  down                  down
+router1#show ip arp vrf green
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  10.1.18.1               -   5e00.00ff.0209  ARPA   Ethernet1/0
+router1#show clok\b\bock
+19:00:00.000 EST Mon Oct 17 2016
+router1(config)#end
+router1#
+'''.format(pager=PAGER)
+
+JUNOS_TRANSCRIPT = '''\
+user1@junos-1> show version | no-more
+fpc0:
+--------------------------------------------------------------------------
+Hostname: junos-1
+Model: ex4200-24p
+Junos: 18.2R2-S1
+JUNOS EX  Software Suite [18.2R2-S1]
+
+{master:0}
+user2@junos-1> show system uptime | match Current
+Current time: 2019-05-01 18:41:18 UTC
+'''
+
+
+class TestCleanLine(unittest.TestCase):
+
+    def test_pager(self):
+        self.assertEqual(clean_line(PAGER + '  Gi1  up'), '  Gi1  up')
+        self.assertEqual(clean_line(' --More-- Gi1  up'), 'Gi1  up')
+        self.assertEqual(clean_line('---(more 45%)---\r     \rge-0/0/0'),
+                         'ge-0/0/0')
+        self.assertEqual(clean_line('<--- More --->Gi1'), 'Gi1')
+
+    def test_escapes(self):
+        self.assertEqual(clean_line('\x1b[7m--More--\x1b[m\x1b[KGi1'), 'Gi1')
+        self.assertEqual(clean_line('show clok\b\bock'), 'show clock')
+        self.assertEqual(clean_line('\b\bGi1'), 'Gi1')
+        self.assertEqual(clean_line('  Gi1   up'), '  Gi1   up')
+
+
+class TestIterCommands(unittest.TestCase):
+
+    def test_iosxe(self):
+        commands = list(iter_commands(TRANSCRIPT.split('\n')))
+        self.assertEqual([command for command, _ in commands],
+                         ['sh clock', 'sh ip int br',
+                          'show ip arp vrf green', 'show clock'])
+        self.assertEqual(commands[1][1].splitlines()[2][:20],
+                         'GigabitEthernet0/0/1')
+        self.assertTrue(commands[1][1].splitlines()[3].startswith('Te0/0/4'))
+        self.assertNotIn('router1', commands[2][1])
+
+    def test_hostname(self):
+        lines = ['router1#show clock', '18:56:04.554 EST Mon Oct 17 2016',
+                 'other#show version', 'router1#']
+        commands = list(iter_commands(lines))
+        self.assertEqual(len(commands), 1)
+        self.assertIn('other#show version', commands[0][1])
+        self.assertEqual(list(iter_commands(lines, hostname='other')),
+                         [('show version', 'router1#')])
+
+    def test_iosxr(self):
+        lines = ['RP/0/RP0/CPU0:xr1#show clock',
+                 'Mon Oct 17 18:56:04.554 UTC',
+                 '18:56:04.554 UTC Mon Oct 17 2016',
+                 'RP/0/RP0/CPU0:xr1#']
+        commands = list(iter_commands(lines, os='iosxr'))
+        self.assertEqual(commands[0][0], 'show clock')
+        self.assertEqual(len(commands[0][1].splitlines()), 2)
+
+    def test_junos(self):
+        commands = list(iter_commands(io.StringIO(JUNOS_TRANSCRIPT),
+                                      os='junos'))
+        self.assertEqual([command for command, _ in commands],
+                         ['show version',
+                          'show system uptime | match Current'])
+        self.assertNotIn('{master:0}', commands[0][1])
+
+
+class TestParseTranscript(unittest.TestCase):
+
+    def test_resolver(self):
+        resolver = AbbreviationResolver()
+        parser_cls, kwargs = resolver.resolve({'os': 'iosxe'},
+                                              'sh ip int br')
+        self.assertEqual(parser_cls.__name__, 'ShowIpInterfaceBrief')
+        self.assertEqual(resolver.expand({'os': 'iosxe'}, 'sh ip int br'),
+                         'show ip interface brief')
+        self.assertEqual(resolver.expand({'os': 'iosxe'}, 'sh clock'),
+                         'show clock')
+        self.assertIsNone(resolver.expand({'os': 'iosxe'},
+                                          'terminal length 0'))
+
+    def test_parse(self):
+        parsed = parse_transcript(TRANSCRIPT, {'os': 'iosxe'}, processes=0)
+        self.assertEqual(sorted(parsed), ['show clock',
+                                          'show ip arp vrf green',
+                                          'show ip interface brief'])
+        # the last run wins
+        self.assertEqual(parsed['show clock']['time'], '19:00:00.000')
+        self.assertEqual(
+            sorted(parsed['show ip interface brief']['interface']),
+            ['GigabitEthernet0/0/0', 'GigabitEthernet0/0/1',
+             'TenGigabitEthernet0/0/4'])
+        self.assertIn('10.1.18.1', parsed['show ip arp vrf green'][
+            'interfaces']['Ethernet1/0']['ipv4']['neighbors'])
+
+    def test_iter_parse_pool(self):
+        results = sorted(iter_parse_transcript(TRANSCRIPT, 'iosxe',
+                                               processes=2),
+                         key=lambda r: r['index'])
+        self.assertEqual([r['command'] for r in results],
+                         ['sh clock', 'sh ip int br',
+                          'show ip arp vrf green', 'show clock'])
+        self.assertTrue(all('parsed' in r for r in results))
+        self.assertEqual(results[1]['full_command'],
+                         'show ip interface brief')
+
+    def test_junos(self):
+        results = sorted(iter_parse_transcript(JUNOS_TRANSCRIPT, 'junos',
+                                               processes=0),
+                         key=lambda r: r['index'])
+        self.assertEqual(results[0]['full_command'], 'show version')
+        self.assertEqual(results[0]['parsed']['software-information'][
+            'host-name'], 'junos-1')
+        self.assertIn('error', results[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
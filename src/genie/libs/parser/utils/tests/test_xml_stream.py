@@ -0,0 +1,153 @@
+import os
+import runpy
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser import yang
+from genie.libs.parser.utils.xml_stream import XmlStream, map_leaves
+from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+
+SUMMARY_XML = '''\
+show bgp vrf all all summary | xml
+<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0" xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp">
+ <nf:data>
+  <show>
+   <bgp>
+    <vrf>
+     <__XML__PARAM__vrf-name>
+      <__XML__value>all</__XML__value>
+      <all>
+       <summary>
+        <__readonly__>
+         <TABLE_vrf>
+          <ROW_vrf>
+           <vrf-name-out>default</vrf-name-out>
+           <vrf-local-as>333</vrf-local-as>
+           <TABLE_neighbor>
+            <ROW_neighbor>
+             <neighborid>10.16.2.2</neighborid>
+             <msgrecvd>5471</msgrecvd>
+            </ROW_neighbor>
+            <ROW_neighbor>
+             <neighborid>10.36.3.3</neighborid>
+             <msgrecvd>0</msgrecvd>
+            </ROW_neighbor>
+           </TABLE_neighbor>
+           <vrf-router-id>10.106.0.6</vrf-router-id>
+          </ROW_vrf>
+         </TABLE_vrf>
+        </__readonly__>
+       </summary>
+      </all>
+     </__XML__PARAM__vrf-name>
+    </vrf>
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>
+'''
+
+
+class TestXmlStream(unittest.TestCase):
+
+    def test_records(self):
+        stream = XmlStream(SUMMARY_XML, records=['ROW_vrf', 'ROW_neighbor'])
+        records = list(stream)
+
+        self.assertEqual([record for record, _, _ in records],
+                         ['ROW_neighbor', 'ROW_neighbor', 'ROW_vrf', None])
+        self.assertEqual(records[0][1], {'neighborid': '10.16.2.2',
+                                         'msgrecvd': '5471'})
+        # parents are the leaves of the enclosing records
+        self.assertIs(records[0][2][0], records[3][1])
+        self.assertIs(records[0][2][1], records[2][1])
+        self.assertEqual(
+            records[3][1],
+            {'data/show/bgp/vrf/__XML__PARAM__vrf-name/__XML__value': 'all'})
+        # nested records are not leaves of their parent
+        self.assertEqual(records[2][1], {'vrf-name-out': 'default',
+                                         'vrf-local-as': '333',
+                                         'vrf-router-id': '10.106.0.6'})
+        self.assertEqual(records[3][2], [])
+
+    def test_record_path(self):
+        output = ('<config><global><afi-safis><afi-safi><name>IPV4</name>'
+                  '</afi-safi></afi-safis></global><neighbors><neighbor>'
+                  '<afi-safis><afi-safi><name>IPV6</name></afi-safi>'
+                  '</afi-safis></neighbor></neighbors></config>')
+        stream = XmlStream(output, records=['global/afi-safis/afi-safi'])
+        records = list(stream)
+        self.assertEqual(records[0][:2], ('global/afi-safis/afi-safi',
+                                          {'name': 'IPV4'}))
+        # leaves of the document are relative to the root element
+        self.assertEqual(
+            records[1][1],
+            {'neighbors/neighbor/afi-safis/afi-safi/name': 'IPV6'})
+
+    def test_command(self):
+        stream = XmlStream(SUMMARY_XML)
+        list(stream)
+        self.assertEqual(stream.command, 'show bgp vrf all all summary')
+        stream.compare_command('show bgp vrf all all summary')
+        with self.assertRaises(AssertionError):
+            stream.compare_command('show bgp vrf default all summary')
+
+    def test_chunks(self):
+        # records and leaves do not depend on where the chunks are cut
+        expected = list(XmlStream(SUMMARY_XML, records=['ROW_neighbor']))
+        with patch('genie.libs.parser.utils.xml_stream.CHUNK_SIZE', 7):
+            stream = XmlStream(SUMMARY_XML, records=['ROW_neighbor'])
+            self.assertEqual(list(stream), expected)
+        self.assertEqual(stream.command, 'show bgp vrf all all summary')
+
+    def test_empty(self):
+        self.assertEqual(list(XmlStream('')), [])
+        self.assertEqual(list(XmlStream(']]>]]>')), [])
+
+
+class TestMapLeaves(unittest.TestCase):
+
+    def test_mapping(self):
+        leaves = {'neighborid': '10.16.2.2', 'msgrecvd': '5471',
+                  'state/hold-time': '180', 'unknown': 'x'}
+        mapping = {'neighborid': 'neighbor',
+                   'msgrecvd': ('msg_rcvd', int),
+                   'state/hold-time': (('timers', 'holdtime'), int)}
+        self.assertEqual(map_leaves(leaves, mapping),
+                         {'neighbor': '10.16.2.2', 'msg_rcvd': 5471,
+                          'timers': {'holdtime': 180}})
+
+    def test_skipped(self):
+        leaves = {'msgrecvd': 'never', 'msgsent': None}
+        mapping = {'msgrecvd': ('msg_rcvd', int), 'msgsent': 'msg_sent'}
+        self.assertEqual(map_leaves(leaves, mapping), {})
+
+    def test_update(self):
+        result = {'neighbor': '10.16.2.2'}
+        map_leaves({'ipv6peer': '2001:db8::1', 'peer': '10.0.0.1'},
+                   {'ipv6peer': 'peer', 'peer': 'peer'}, result)
+        # the last leaf wins
+        self.assertEqual(result, {'neighbor': '10.16.2.2',
+                                  'peer': '10.0.0.1'})
+
+
+class TestYang(unittest.TestCase):
+
+    def test_bgp_openconfig(self):
+        folder = os.path.join(os.path.dirname(yang.__file__), 'tests',
+                              'BgpOpenconfigYang', 'cli', 'equal')
+        with open(os.path.join(folder, 'golden_output_output.txt')) as f:
+            output = f.read()
+        expected = runpy.run_path(os.path.join(
+            folder, 'golden_output_expected.py'))['expected_output']
+
+        device = Mock()
+        device.get.return_value = Mock(data_xml=output)
+        parsed = BgpOpenconfigYang(device=device, context='yang').parse()
+        self.assertEqual(parsed, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,295 @@
+'''CLI session transcript splitter
+
+Automation jobs keep raw logs of their ssh sessions: prompts, echoed
+commands and outputs interleaved, with pager prompts, backspaces and ANSI
+escapes in between:
+
+    router1#sh ip int br
+    Interface              IP-Address      OK? Method Status       Protocol
+    GigabitEthernet1       10.1.1.1        YES manual up           up
+     --More-- ^H^H^H^H^H^H^H^H^H         ^H^H^H^H^H^H^H^H^H
+    GigabitEthernet2       unassigned      YES unset  down         down
+    router1#
+
+This module cleans the pager artifacts of each line as it is read, splits
+the session at the prompts of the device os (iosxe, ios, nxos, iosxr,
+junos), pairs every echoed command with its output, resolves abbreviated
+commands as the device cli does and parses all of them over a worker pool
+with the bulk engine, so data already present in a log never has to be
+collected again.
+
+Example:
+
+    >>> from genie.libs.parser.utils.transcript import parse_transcript
+    >>> parsed = parse_transcript('job_1234/router1.log', {'os': 'iosxe'})
+    >>> parsed['show ip interface brief']['interface']['GigabitEthernet1']
+'''
+
+# python
+import re
+import logging
+from collections import OrderedDict
+
+from .common import get_parser, ParserNotFound
+from .bulk import iter_parse, ParserResolver, OfflineDevice, \
+    DEFAULT_CHUNK_SIZE, RESOLVE_CACHE_SIZE, _normalize_tokens
+
+log = logging.getLogger(__name__)
+
+# router1#show version
+# router1(config-if)#
+# router1>enable
+# RP/0/RP0/CPU0:xr1#show version
+CISCO_PROMPT = re.compile(
+    r'^(?P<host>[A-Za-z0-9][\w.\-/:]*)(?:\([\w.\-]+\))?[#>] ?'
+    r'(?P<command>.*)$')
+
+# user@router> show version
+# user@router# show interfaces
+JUNOS_PROMPT = re.compile(
+    r'^[\w.\-]+@(?P<host>[\w.\-]+)[>#%] ?(?P<command>.*)$')
+
+PROMPTS = {
+    'ios': CISCO_PROMPT,
+    'iosxe': CISCO_PROMPT,
+    'nxos': CISCO_PROMPT,
+    'iosxr': CISCO_PROMPT,
+    'junos': JUNOS_PROMPT,
+}
+
+# \x1b[7m   \x1b[K   \x1b[?25h
+# --More--   <--- More --->   ---(more)---   ---(more 45%)---
+ARTIFACTS = re.compile(
+    r'\x1b\[[0-9;?]*[A-Za-z]'
+    r'| ?--More-- ?'
+    r'|<--- More --->'
+    r'|---\(more(?: \d+%)?\)---')
+
+# {master:0}  {backup}  {primary:node0}
+JUNOS_STATUS = re.compile(r'^\{\w+(?::[\w\-]+)?\}$')
+
+# commands only changing the pager of the output
+JUNOS_NO_MORE = re.compile(r'\s*\|\s*no-more\s*$')
+
+
+def clean_line(line):
+    '''Remove the terminal artifacts of a line of a session log
+
+    ANSI escapes and pager prompts are removed with a single pattern, then
+    backspaces and carriage returns are replayed as the terminal did. Each
+    step only runs on the lines holding its characters, most lines are
+    returned as they are.
+
+        Args:
+            line (`str`): line without its line ending
+
+        Returns:
+            str: the line as displayed
+    '''
+    if '\x1b' in line or 'ore' in line:
+        # every artifact holds an escape, 'More' or 'more'
+        line = ARTIFACTS.sub('', line)
+    if '\r' in line:
+        # the text after the last carriage return overwrote the line
+        line = line.rstrip('\r').rsplit('\r', 1)[-1]
+    if '\b' in line:
+        chars = []
+        for char in line:
+            if char != '\b':
+                chars.append(char)
+            elif chars:
+                chars.pop()
+        line = ''.join(chars)
+    return line
+
+
+def _iter_lines(source):
+    # lone carriage returns are terminal artifacts, not line endings
+    if isinstance(source, str) and '\n' not in source:
+        with open(source, errors='replace', newline='\n') as f:
+            yield from f
+    elif isinstance(source, str):
+        yield from source.split('\n')
+    elif hasattr(source, '__fspath__'):
+        with open(source, errors='replace', newline='\n') as f:
+            yield from f
+    else:
+        yield from source
+
+
+def iter_commands(lines, os='iosxe', prompt=None, hostname=None):
+    '''Split a session log into (command, output) pairs
+
+    Lines are consumed one at a time, only the output being built is kept
+    in memory. The first prompt sets the hostname, later lines only start a
+    new command with a prompt of the same hostname, so output lines looking
+    like a prompt are kept. Commands without output are dropped.
+
+        Args:
+            lines (`iterable`): lines of the log, eg. an open file
+            os (`str`): os of the device, selects the prompt pattern
+            prompt (`re.Pattern`): prompt pattern with 'host' and 'command'
+                                   groups, overrides the os one
+            hostname (`str`): hostname of the prompts, learnt from the
+                              first prompt by default
+
+        Returns:
+            generator of (command, output) tuples
+    '''
+    prompt = prompt or PROMPTS.get(os, CISCO_PROMPT)
+    junos = os == 'junos'
+    command = None
+    output = []
+
+    for line in lines:
+        line = clean_line(line.rstrip('\n').rstrip('\r'))
+
+        m = prompt.match(line)
+        if m and hostname is None:
+            hostname = m.group('host')
+        if not m or m.group('host') != hostname:
+            if command is not None and not (junos and
+                                            JUNOS_STATUS.match(line)):
+                output.append(line)
+            continue
+
+        if command is not None and any(l.strip() for l in output):
+            yield command, '\n'.join(output)
+
+        command = ' '.join(m.group('command').split()) or None
+        if command and junos:
+            command = JUNOS_NO_MORE.sub('', command)
+        output = []
+
+    if command is not None and any(l.strip() for l in output):
+        yield command, '\n'.join(output)
+
+
+class AbbreviationResolver(ParserResolver):
+    '''Resolve commands as typed at the device cli
+
+    get_parser already expands unambiguous abbreviations. A command matching
+    several parsers equally well, eg. 'sh ip int br' for 'show ip interface
+    brief' and 'show ip interface {interface}', is resolved as the device
+    does: keywords win over arguments.
+    '''
+    def __init__(self, maxsize=RESOLVE_CACHE_SIZE):
+        super().__init__(maxsize=maxsize)
+        self._expanded = OrderedDict()
+
+    def expand(self, tokens, command):
+        '''full command of an abbreviation, keywords winning over arguments
+
+            Args:
+                tokens (`dict`): abstract tokens of the device
+                command (`str`): command as typed
+
+            Returns:
+                str: the full command, None when it cannot be decided
+        '''
+        key = (_normalize_tokens(tokens), command)
+        try:
+            self._expanded.move_to_end(key)
+            return self._expanded[key]
+        except KeyError:
+            pass
+
+        expanded = None
+        try:
+            results = get_parser(command, OfflineDevice(**dict(key[0])),
+                                 fuzzy=True)
+        except Exception:
+            results = []
+        if results:
+            fewest = min(len(kwargs) for _, _, kwargs in results)
+            best = [(found, kwargs) for found, _, kwargs in results
+                    if len(kwargs) == fewest]
+            if len(best) == 1:
+                found, kwargs = best[0]
+                expanded = found.format(**kwargs)
+
+        self._expanded[key] = expanded
+        if len(self._expanded) > self.maxsize:
+            self._expanded.popitem(last=False)
+        return expanded
+
+    def resolve(self, tokens, command):
+        try:
+            return super().resolve(tokens, command)
+        except ParserNotFound:
+            raise
+        except Exception:
+            expanded = self.expand(tokens, command)
+            if expanded is None or expanded == command:
+                raise
+            log.debug("Resolved ambiguous '{}' as '{}'".format(command,
+                                                               expanded))
+            return super().resolve(tokens, expanded)
+
+
+def iter_parse_transcript(source,
+                          tokens,
+                          processes=None,
+                          chunksize=DEFAULT_CHUNK_SIZE,
+                          prompt=None,
+                          hostname=None):
+    '''Parse every command of a session log
+
+        Args:
+            source (`str`, `Path`, `file`): path to the log, its content, or
+                                            an iterable of lines
+            tokens (`dict`): abstract tokens of the device, at least os
+            processes (`int`): number of worker processes, 0 parses in this
+                               process
+            chunksize (`int`): number of commands per worker task
+            prompt (`re.Pattern`): see iter_commands
+            hostname (`str`): see iter_commands
+
+        Returns:
+            generator of bulk result dicts, see ``bulk.iter_parse``. The
+            parsed ones also have the 'full_command' of the parser
+    '''
+    if isinstance(tokens, str):
+        tokens = {'os': tokens}
+    commands = iter_commands(_iter_lines(source), os=tokens.get('os'),
+                             prompt=prompt, hostname=hostname)
+    records = ((tokens, command, output) for command, output in commands)
+    resolver = AbbreviationResolver()
+    for result in iter_parse(records, processes=processes,
+                             chunksize=chunksize, resolver=resolver):
+        if 'error' not in result:
+            result['full_command'] = resolver.expand(
+                tokens, result['command']) or result['command']
+        yield result
+
+
+def parse_transcript(source, tokens, processes=None, **kwargs):
+    '''Parse a session log into a dict keyed by command
+
+    Commands without a parser, or that fail to parse, are skipped. The
+    parser command is used as key, so abbreviations of the same command
+    share it. When a command was run several times, the last run wins.
+
+        Args:
+            source (`str`, `Path`, `file`): path to the log, its content, or
+                                            an iterable of lines
+            tokens (`dict`): abstract tokens of the device
+            processes (`int`): number of worker processes
+            kwargs: passed to ``iter_parse_transcript``
+
+        Returns:
+            dict of {command: parsed output}
+    '''
+    results = sorted(iter_parse_transcript(source, tokens,
+                                           processes=processes, **kwargs),
+                     key=lambda r: r['index'])
+
+    parsed = {}
+    for result in results:
+        if 'error' in result:
+            log.debug("Skipping command '{}': {}: {}".format(
+                result['command'], result['error']['type'],
+                result['error']['message']))
+            continue
+        parsed[result['full_command']] = result['parsed']
+    return parsed
@@ -42,6 +42,9 @@ EXCLUDE_CLASSES = {
     'nxos': ['RunBashTop']  # reason: use bash shell
 }
 
+# goldens of '| json' and '| display xml' outputs, in tests/<class>/<context>
+STRUCTURED_CONTEXTS = ('json', 'xml')
+
 
 #===========================================================================
 #                            Helper Functions
@@ -365,6 +368,12 @@ class SuperFileBasedTesting(aetest.Testcase):
                         f"{base_folder}/tests/{name}/cli/equal")
                     folder_root_empty = pathlib.Path(
                         f"{base_folder}/tests/{name}/cli/empty")
+                    # Parsers with a `json` or `xml` method can have
+                    # goldens of their structured output
+                    folder_root_structured = {
+                        context: pathlib.Path(
+                            f"{base_folder}/tests/{name}/{context}/equal")
+                        for context in STRUCTURED_CONTEXTS}
 
                     # Skip over super parsers
                     if "super" in name.lower():
@@ -436,6 +445,12 @@ class SuperFileBasedTesting(aetest.Testcase):
                             "operating_system": operating_system,
                             "folder_root_equal": folder_root_equal,
                             "folder_root_empty": folder_root_empty,
+                            "folder_root_structured": {
+                                context: folder
+                                for context, folder in
+                                folder_root_structured.items()
+                                if hasattr(local_class, context) and
+                                folder.exists()},
                             "display_only_failed": _display_only_failed,
                             "tokens": tokens,
                             "number": _number,
@@ -492,6 +507,7 @@ class ParserTest(aetest.Testcase):
         operating_system = data['operating_system']
         folder_root_equal = data['folder_root_equal']
         folder_root_empty = data['folder_root_empty']
+        folder_root_structured = data.get('folder_root_structured', {})
         _display_only_failed = data['display_only_failed']
         tokens = data['tokens']
         _number = data['number']
@@ -510,6 +526,17 @@ class ParserTest(aetest.Testcase):
                                      operating_system, folder_root_equal,
                                      _display_only_failed, tokens, _number)
 
+                for context, folder in folder_root_structured.items():
+                    with class_step.start(
+                            f"Test Golden {context.capitalize()} -> "
+                            f"{operating_system} -> {name}",
+                            continue_=True,
+                    ) as structured_steps:
+                        self.test_golden(structured_steps, local_class,
+                                         operating_system, folder,
+                                         _display_only_failed, tokens, _number,
+                                         context=context)
+
                 with class_step.start(
                         f"Test Empty -> {operating_system} -> {name}",
                         continue_=True,
@@ -528,7 +555,8 @@ class ParserTest(aetest.Testcase):
                     folder_root_equal,
                     display_only_failed=None,
                     tokens=None,
-                    number=None):
+                    number=None,
+                    context='cli'):
         """Test step that finds any output named with _output.txt, and compares to similar named .py file."""
         folder_root = folder_root_equal
         # Below lines of code are not valid anymore due to the new abstraction logic introduced in 24.4
@@ -599,8 +627,8 @@ class ParserTest(aetest.Testcase):
                         f"{folder_root}/{user_test}_arguments.json")
 
                 device = Mock(**golden_output)
-                obj = local_class(device=device)
-                spec = getfullargspec(obj.cli)
+                obj = local_class(device=device, context=context)
+                spec = getfullargspec(getattr(obj, context))
                 if 'command' in spec.args:
                     arguments['command'] = ''
                 try:
@@ -0,0 +1,247 @@
+'''Streaming xml mapping for the xml and yang parsers
+
+The replies of '| xml' commands and NETCONF 'get' operations are nested
+tables of records: ROW_vrf/ROW_af/ROW_neighbor on NX-OS, neighbor and
+afi-safi lists in YANG models. XmlStream feeds the reply to an XMLParser
+and yields every record once its element is complete, with the leaves of
+the record keyed by their path relative to the record:
+
+    >>> stream = XmlStream(output, records=['ROW_vrf', 'ROW_neighbor'])
+    >>> for record, leaves, parents in stream:
+    ...     if record == 'ROW_neighbor':
+    ...         vrf = parents[-1]['vrf-name-out']
+
+The parser calls a target for each tag and no element tree is built, only
+the leaves of the records are kept. Namespaces are stripped from the tags
+once per distinct tag.
+
+map_leaves then converts the leaves of a record into the parser schema
+keys from a declarative mapping:
+
+    >>> map_leaves(leaves, {'neighborid': 'neighbor',
+    ...                     'msgrecvd': ('msg_rcvd', int),
+    ...                     'state/hold-time': (('timers', 'holdtime'), int)})
+'''
+
+# python
+import xml.etree.ElementTree as ET
+
+# netconf delimiter at the end of the '| xml' output
+XML_END = ']]>]]>'
+
+# end of the command part of a NX-OS xml reply
+READONLY = '__readonly__'
+
+# characters fed to the parser at once
+CHUNK_SIZE = 65536
+
+
+class XmlStream(object):
+    '''Iterate over the records of an xml reply
+
+    Records are given as tag paths, matched against the end of the path of
+    each element: 'ROW_neighbor' matches any ROW_neighbor element,
+    'global/afi-safis/afi-safi' only the afi-safi elements under global.
+
+    Each record is yielded as a tuple (record, leaves, parents):
+        * record: the record path as given, None for the document itself
+        * leaves: dict of leaf path -> text, the path is relative to the
+                  record and does not go into nested records
+        * parents: leaves dicts of the enclosing records, outermost first.
+                   They hold at least the leaves preceding the record,
+                   all the leaves are only known when the parent ends.
+
+    The document record is yielded last, its leaves are relative to the
+    root element.
+
+        Args:
+            output (`str`): xml reply
+            records (`list`): tag paths of the record elements
+
+        example:
+
+            >>> stream = XmlStream('<rpc-reply><data><TABLE_vrf><ROW_vrf>'
+                                   '<vrf-name-out>default</vrf-name-out>'
+                                   '</ROW_vrf></TABLE_vrf></data></rpc-reply>',
+                                   records=['ROW_vrf'])
+            >>> list(stream)
+            >>> [('ROW_vrf', {'vrf-name-out': 'default'}, [{}]),
+                 (None, {}, [])]
+    '''
+
+    def __init__(self, output, records=()):
+        output = output.replace(XML_END, '').strip()
+        # drop the echoed command and the prompt around the document
+        if '<' in output:
+            output = output[output.index('<'):output.rindex('>') + 1]
+        self.output = output
+
+        # last tag -> [(tag path, record)]
+        self.records = {}
+        for record in records:
+            tags = tuple(record.split('/'))
+            self.records.setdefault(tags[-1], []).append((tags, record))
+
+        # NX-OS command rebuilt from the tags above __readonly__
+        self.command = ''
+
+    def __iter__(self):
+        if not self.output:
+            return
+
+        # expat calls the target for each tag, no element is built
+        target = _RecordTarget(self.records)
+        parser = ET.XMLParser(target=target)
+
+        # feed the reply by chunks, a file object would copy it whole
+        output = self.output
+        for index in range(0, len(output), CHUNK_SIZE):
+            parser.feed(output[index:index + CHUNK_SIZE])
+            self.command = target.get_command()
+            yield from target.ready
+            target.ready.clear()
+        parser.close()
+        self.command = target.get_command(end=True)
+        yield from target.ready
+        target.ready.clear()
+
+    def compare_command(self, expect_command):
+        '''Compare the command rebuilt from the xml tags, once the stream
+        went past the __readonly__ tag, with the command sent.
+        Same check as Common.compose_compare_command.
+
+            Args:
+                expect_command (`str`): expected command
+
+            Raises:
+                AssertionError: xml tags and command do not match
+        '''
+        assert self.command == expect_command, \
+            'Cli created from XML tags does not match the actual cli:\n' \
+            'XML Tags cli: {c}\nCli command: {e}'.format(
+                c=self.command, e=expect_command)
+
+
+class _RecordTarget(object):
+    '''XMLParser target collecting the records of an XmlStream'''
+
+    def __init__(self, records):
+        self.records = records
+        # completed records, taken by XmlStream after each chunk fed
+        self.ready = []
+        # namespaced tag -> tag
+        self.local_names = {}
+
+        # path of the current element, and the text of the current leaf
+        self.tags = []
+        self.text = []
+        self.leaf = False
+        # open records: (record, leaves, depth of the record element)
+        self.open_records = [(None, {}, 1)]
+
+        self.command = []
+        self.command_done = False
+
+    def start(self, tag, attrib):
+        name = self.local_names.get(tag)
+        if name is None:
+            # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}ROW_vrf
+            name = self.local_names[tag] = tag[tag.find('}') + 1:]
+        tags = self.tags
+        tags.append(name)
+        self.text = []
+        self.leaf = True
+
+        if not self.command_done and len(tags) > 2:
+            if READONLY in name or 'TABLE' in name:
+                self.command_done = True
+            elif '__XML__PARAM__' not in name and \
+                    '__XML__value' not in name:
+                self.command.append(name)
+
+        for record_tags, record in self.records.get(name, ()):
+            if tuple(tags[-len(record_tags):]) == record_tags:
+                self.open_records.append((record, {}, len(tags)))
+                break
+
+    def data(self, data):
+        self.text.append(data)
+
+    def end(self, tag):
+        tags = self.tags
+        depth = len(tags)
+        # same text as Element.text, None for an empty element
+        text = ''.join(self.text) if self.text else None
+
+        record, leaves, record_depth = self.open_records[-1]
+        if record_depth == depth:
+            self.open_records.pop()
+            self.ready.append((record, leaves,
+                               [item[1] for item in self.open_records]))
+        elif self.leaf:
+            leaves['/'.join(tags[record_depth:])] = text
+
+        if not self.command_done and '__XML__value' in tags[-1]:
+            self.command.append(text or '')
+
+        tags.pop()
+        self.text = []
+        self.leaf = False
+
+    def close(self):
+        pass
+
+    def get_command(self, end=False):
+        if self.command_done or end:
+            return ' '.join(self.command)
+        return ''
+
+
+def map_leaves(leaves, mapping, result=None):
+    '''Set the leaves of a record into a dict, as described by mapping
+
+    mapping is a dict of leaf path -> key, or (key, convert). The key is
+    a tuple for nested dicts. The leaves are set in the document order, the
+    last one wins when several paths map to the same key. Leaves which are
+    empty or fail the conversion are skipped.
+
+        Args:
+            leaves (`dict`): leaves of a record, from XmlStream
+            mapping (`dict`): leaf path -> key or (key, convert)
+            result (`dict`): dict to update, a new one by default
+
+        Returns:
+            result dict
+
+        example:
+
+            >>> map_leaves({'neighborid': '10.16.2.2', 'msgrecvd': '5471'},
+                           {'neighborid': 'neighbor',
+                            'msgrecvd': ('msg_rcvd', int)})
+            >>> {'neighbor': '10.16.2.2', 'msg_rcvd': 5471}
+    '''
+    if result is None:
+        result = {}
+    for path, value in leaves.items():
+        key = mapping.get(path)
+        if key is None or value is None:
+            continue
+        if isinstance(key, tuple) and callable(key[-1]):
+            key, convert = key
+            try:
+                value = convert(value)
+            except (TypeError, ValueError):
+                continue
+        if isinstance(key, tuple):
+            sub_dict = result
+            for item in key[:-1]:
+                sub_dict = sub_dict.setdefault(item, {})
+            sub_dict[key[-1]] = value
+        else:
+            result[key] = value
+    return result
+
+
+def xml_bool(value):
+    '''"true" / "false" leaves of the YANG models'''
+    return value == 'true'
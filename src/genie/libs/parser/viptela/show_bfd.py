@@ -1,6 +1,8 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # =====================================
 # Schema for 'show bfd sessions'
@@ -55,7 +57,7 @@ class ShowBfdSessions(ShowBfdSessionsSchema):
         parsed_dict = {}
 
         # 172.16.241.1     30001001 up          mpls             mpls             172.16.189.2    172.16.171.2       12346       ipsec  20          1000           0:01:46:50      0            
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"(?P<system_ip>\S+)\s+(?P<site_id>\d+)\s+(?P<state>\w+)\s+"
             r"(?P<source_tloc_color>\S+)\s+(?P<remote_tloc_color>\S+)\s+"
             r"(?P<source_ip>\S+)\s+(?P<destination_public_ip>\S+)\s+"
@@ -131,27 +133,27 @@ class ShowBfdSummary(ShowBfdSummarySchema):
         parsed_dict = {}
 
         # sessions-total         8
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^sessions-total\s+(?P<sessions_total>\S+)"
         )
 
         # sessions-up            8
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^sessions-up\s+(?P<sessions_up>\S+)"
         )
 
         # sessions-max           10
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^sessions-max\s+(?P<sessions_max>\S+)"
         )
 
         # sessions-flap          121
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^sessions-flap\s+(?P<sessions_flap>\S+)"
         )
 
         # poll-interval          120000
-        p5 = re.compile(
+        p5 = regex_engine.compile(
             r"^poll-interval\s+(?P<poll_interval>\S+)"
         )
 
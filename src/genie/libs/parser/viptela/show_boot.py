@@ -1,6 +1,8 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 # =======================================
 # Schema for 'show boot-partition' introduced in vEdge version 14.1
@@ -32,7 +34,7 @@ class ShowBootPartition(ShowBootPartitionSchema):
         
         # 1          X       14.2.4   2014-11-11T18:16:49+00:00
         # 2          -       14.2.3   2014-11-11T18:35:14+00:00
-        p1 = re.compile(r'^(?P<partition>\d+) +(?P<active>\S+) +(?P<version>\S+) +(?P<timestamp>\S+)')
+        p1 = regex_engine.compile(r'^(?P<partition>\d+) +(?P<active>\S+) +(?P<version>\S+) +(?P<timestamp>\S+)')
 
         for line in out.splitlines():
             if line:
@@ -2,6 +2,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 import re
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 # =======================================
 # Schema for 'show cloudexpress application'
 # =======================================
@@ -41,9 +44,9 @@ class ShowCloudexpressApplication(ShowCloudexpressApplicationSchema):
         index = 0
         #1    salesforce               gateway  172.16.255.14  -          103      1     lte    lte
         #1    google_apps              gateway  172.16.255.14  -          47       0     lte    lte
-        p1 = re.compile(r'^(?P<vpn>\S+)\s\s+(?P<application>\S+)\s\s+(?P<exit_type>\S+)\s\s+(?P<gw_sys_ip>\S+)'
-                        r'\s\s+(?P<interface>\S+)\s\s+(?P<latency>\S+)\s\s+(?P<loss>\S+)\s\s+(?P<local_color>\S+)'
-                        r'\s\s+(?P<remote_color>\S+)')
+        p1 = regex_engine.compile(r'^(?P<vpn>\S+)\s\s+(?P<application>\S+)\s\s+(?P<exit_type>\S+)\s\s+(?P<gw_sys_ip>\S+)'
+                                  r'\s\s+(?P<interface>\S+)\s\s+(?P<latency>\S+)\s\s+(?P<loss>\S+)\s\s+(?P<local_color>\S+)'
+                                  r'\s\s+(?P<remote_color>\S+)')
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
@@ -88,9 +91,9 @@ class ShowCloudexpressApplication(ShowCloudexpressApplicationSchema):
         index = 0
         #1    salesforce               gateway  172.16.255.14  -          103      1     lte    lte
         #1    google_apps              gateway  172.16.255.14  -          47       0     lte    lte
-        p1 = re.compile(r'^(?P<vpn>\S+)\s\s+(?P<application>\S+)\s\s+(?P<exit_type>\S+)\s\s+(?P<gw_sys_ip>\S+)'
-                        r'\s\s+(?P<interface>\S+)\s\s+(?P<latency>\S+)\s\s+(?P<loss>\S+)\s\s+(?P<local_color>\S+)'
-                        r'\s\s+(?P<remote_color>\S+)')
+        p1 = regex_engine.compile(r'^(?P<vpn>\S+)\s\s+(?P<application>\S+)\s\s+(?P<exit_type>\S+)\s\s+(?P<gw_sys_ip>\S+)'
+                                  r'\s\s+(?P<interface>\S+)\s\s+(?P<latency>\S+)\s\s+(?P<loss>\S+)\s\s+(?P<local_color>\S+)'
+                                  r'\s\s+(?P<remote_color>\S+)')
 
         for line in out.splitlines():
             line = line.strip()
@@ -2,8 +2,10 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 from genie import parsergen
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
-import re
 
 # ===========================================
 # Schema for 'show control connections'
@@ -75,16 +77,16 @@ class ShowControlConnections(ShowControlConnectionsSchema):
         # vsmart  dtls 10.8.1.82       1001       1      10.0.111.82                             12346 10.0.111.82                             12346 Cisco-SDWAN               blue            No    up     90:20:54:2810          
         # vsmart  dtls 10.8.1.82       1001       1      10.0.111.82                             12346 10.0.111.82                             12346 Cisco-SDWAN               green           No    up     90:20:54:2610          
         # vmanage dtls 10.8.1.85       1001       0      10.0.111.85                             12346 10.0.111.85                             12346 Cisco-SDWAN               private1        No    up     90:20:54:300  
-        p1 = re.compile(r"ORGANIZATION{1}")
+        p1 = regex_engine.compile(r"ORGANIZATION{1}")
         m = p1.search(out)
         if m:
             # cEdge starting 17.04 onward
             # vsmart  dtls 1.1.1.5         4294950463 1      10.0.5.64                               12346 34.250.253.50                           12346 SDWAN-VIPTELA - 249781  custom1         No    up     24:22:07:45 0 
-            p1 = re.compile(r"(?P<peer_type>\w+)\s+(?P<peer_protocol>\w+)\s+(?P<peer_system_ip>\S+)\s+(?P<site_id>\d+)\s+(?P<domain_id>\d+)\s+(?P<peer_private_ip>\S+)\s+(?P<peer_private_port>\S+)\s+(?P<peer_public_ip>\S+)\s+(?P<peer_public_port>\d+)\s+((?P<peer_organization>(.*?)(?=\s{2}))\s+)?(?P<local_color>\S+)\s+(?P<proxy_state>\S+)\s+(?P<state>\S+)\s+(?P<uptime>\d+:\d+:\d+:\d{2})(\s+)?(?P<controller_group_id>\S+)")
+            p1 = regex_engine.compile(r"(?P<peer_type>\w+)\s+(?P<peer_protocol>\w+)\s+(?P<peer_system_ip>\S+)\s+(?P<site_id>\d+)\s+(?P<domain_id>\d+)\s+(?P<peer_private_ip>\S+)\s+(?P<peer_private_port>\S+)\s+(?P<peer_public_ip>\S+)\s+(?P<peer_public_port>\d+)\s+((?P<peer_organization>(.*?)(?=\s{2}))\s+)?(?P<local_color>\S+)\s+(?P<proxy_state>\S+)\s+(?P<state>\S+)\s+(?P<uptime>\d+:\d+:\d+:\d{2})(\s+)?(?P<controller_group_id>\S+)")
             keys.insert(8, "peer_organization")
         else:
             # vEdge & cEdge prior to 17.04
-            p1 = re.compile(r"(?P<peer_type>\w+)\s+(?P<peer_protocol>\w+)\s+(?P<peer_system_ip>\S+)\s+(?P<site_id>\d+)\s+(?P<domain_id>\d+)\s+(?P<peer_private_ip>\S+)\s+(?P<peer_private_port>\S+)\s+(?P<peer_public_ip>\S+)\s+(?P<peer_public_port>\d+)\s+(?P<local_color>\S+)\s+(?P<proxy_state>\S+)\s+(?P<state>\S+)\s+(?P<uptime>\S+)\s+(?P<controller_group_id>\S+)")
+            p1 = regex_engine.compile(r"(?P<peer_type>\w+)\s+(?P<peer_protocol>\w+)\s+(?P<peer_system_ip>\S+)\s+(?P<site_id>\d+)\s+(?P<domain_id>\d+)\s+(?P<peer_private_ip>\S+)\s+(?P<peer_private_port>\S+)\s+(?P<peer_public_ip>\S+)\s+(?P<peer_public_port>\d+)\s+(?P<local_color>\S+)\s+(?P<proxy_state>\S+)\s+(?P<state>\S+)\s+(?P<uptime>\S+)\s+(?P<controller_group_id>\S+)")
 
         for line in out.splitlines():
             line = line.strip()
@@ -197,22 +199,22 @@ class ShowControlLocalProperties(ShowControlLocalPropertiesSchema):
         parsed_dict = {}
 
         # personality                       vedge
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"^personality\s+(?P<personality>\S+)"
         )
 
         # sp_organization_name              SD_WAN_LAB _ 255639
-        p2 = re.compile(
+        p2 = regex_engine.compile(
             r"^sp-organization-name\s+(?P<sp_organization_name>.*)"
         )
 
         # organization_name                 SD_WAN_LAB _ 255639
-        p3 = re.compile(
+        p3 = regex_engine.compile(
             r"^organization-name\s+(?P<organization_name>.*)"
         )
 
         # root_ca_chain_status              Installed
-        p4 = re.compile(
+        p4 = regex_engine.compile(
             r"^root-ca-chain-status\s+(?P<root_ca_chain_status>.*)"
         )
 
@@ -220,19 +222,19 @@ class ShowControlLocalProperties(ShowControlLocalPropertiesSchema):
         # certificate_validity              Valid
         # certificate_not_valid_before      Jan 10 06:58:04 2020 GMT
         # certificate_not_valid_after       Aug 09 20:58:26 2099 GMT
-        p5_1 = re.compile(
+        p5_1 = regex_engine.compile(
             r"^certificate-status\s+(?P<certificate_status>.*)"
         )
 
-        p5_2 = re.compile(
+        p5_2 = regex_engine.compile(
             r"^certificate-validity\s+(?P<certificate_validity>.*)"
         )
 
-        p5_3 = re.compile(
+        p5_3 = regex_engine.compile(
             r"^certificate-not-valid-before\s+(?P<certificate_not_valid_before>.*)"
         )
 
-        p5_4 = re.compile(
+        p5_4 = regex_engine.compile(
             r"^certificate-not-valid-after\s+(?P<certificate_not_valid_after>.*)"
         )
 
@@ -240,119 +242,119 @@ class ShowControlLocalProperties(ShowControlLocalPropertiesSchema):
         # enterprise_cert_validity          Not Applicable
         # enterprise_cert_not_valid_before  Not Applicable
         # enterprise_cert_not_valid_after   Not Applicable
-        p6_1 = re.compile(
+        p6_1 = regex_engine.compile(
             r"^enterprise-cert-status\s+(?P<enterprise_cert_status>.*)"
         )
 
-        p6_2 = re.compile(
+        p6_2 = regex_engine.compile(
             r"^enterprise-cert-validity\s+(?P<enterprise_cert_validity>.*)"
         )
 
-        p6_3 = re.compile(
+        p6_3 = regex_engine.compile(
             r"^enterprise-cert-not-valid-before\s+(?P<enterprise_cert_not_valid_before>.*)"
         )
 
-        p6_4 = re.compile(
+        p6_4 = regex_engine.compile(
             r"^enterprise-cert-not-valid-after\s+(?P<enterprise_cert_not_valid_after>.*)"
         )
 
         # dns_name                          vbond_950810.viptela.net
-        p7 = re.compile(
+        p7 = regex_engine.compile(
             r"^dns-name\s+(?P<dns_name>.*)"
         )
 
         # site_id                           1101
-        p8 = re.compile(
+        p8 = regex_engine.compile(
             r"^site-id\s+(?P<site_id>.*)"
         )
 
         # domain_id                         1
-        p9 = re.compile(
+        p9 = regex_engine.compile(
             r"^domain-id\s+(?P<domain_id>.*)"
         )
 
         # protocol                          dtls
-        p10 = re.compile(
+        p10 = regex_engine.compile(
             r"^protocol\s+(?P<protocol>.*)"
         )
 
         # tls_port                          0
-        p11 = re.compile(
+        p11 = regex_engine.compile(
             r"^tls-port\s+(?P<tls_port>.*)"
         )
 
         # system_ip                         10.150.74.1
-        p12 = re.compile(
+        p12 = regex_engine.compile(
             r"^system-ip\s+(?P<system_ip>.*)"
         )
         
         # chassis_num/unique_id             ISR1100_6G_FGL2402LJC8
-        p13 = re.compile(
+        p13 = regex_engine.compile(
             r"^chassis-num\/unique-id\s+(?P<chassis_num_unique_id>.*)"
         )
         
         # serial_num                        01F60455
-        p14 = re.compile(
+        p14 = regex_engine.compile(
             r"^serial-num\s+(?P<serial_num>.*)"
         )
         
         # enterprise_serial_num             No certificate installed
-        p15 = re.compile(
+        p15 = regex_engine.compile(
             r"^enterprise-serial-num\s+(?P<enterprise_serial_num>.*)"
         )
         
         # token                             -NA-
-        p16 = re.compile(
+        p16 = regex_engine.compile(
             r"^token\s+(?P<token>.*)"
         )
         
         # keygen_interval                   1:00:00:00
-        p17 = re.compile(
+        p17 = regex_engine.compile(
             r"^keygen-interval\s+(?P<keygen_interval>.*)"
         )
         
         # retry_interval                    0:00:00:15
-        p18 = re.compile(
+        p18 = regex_engine.compile(
             r"^retry-interval\s+(?P<retry_interval>.*)"
         )
         
         # no_activity_exp_interval          0:00:00:20
-        p19 = re.compile(
+        p19 = regex_engine.compile(
             r"^no-activity-exp-interval\s+(?P<no_activity_exp_interval>.*)"
         )
         
         # dns_cache_ttl                     0:00:02:00
-        p20 = re.compile(
+        p20 = regex_engine.compile(
             r"^dns-cache-ttl\s+(?P<dns_cache_ttl>.*)"
         )
         
         # port_hopped                       TRUE
-        p21 = re.compile(
+        p21 = regex_engine.compile(
             r"^port-hopped\s+(?P<port_hopped>.*)"
         )
         
         # time_since_last_port_hop          8:00:54:07
-        p22 = re.compile(
+        p22 = regex_engine.compile(
             r"^time-since-last-port-hop\s+(?P<time_since_last_port_hop>.*)"
         )
         
         # pairwise_keying                   Disabled
-        p23 = re.compile(
+        p23 = regex_engine.compile(
             r"^pairwise-keying\s+(?P<pairwise_keying>.*)"
         )
         
         # embargo_check                     success
-        p24 = re.compile(
+        p24 = regex_engine.compile(
             r"^embargo-check\s+(?P<embargo_check>.*)"
         )
         
         # number_vbond_peers                0
-        p25 = re.compile(
+        p25 = regex_engine.compile(
             r"^number-vbond-peers\s+(?P<number_vbond_peers>.*)"
         )
         
         # number_active_wan_interfaces      2
-        p26 = re.compile(
+        p26 = regex_engine.compile(
             r"^number-active-wan-interfaces\s+(?P<number_active_wan_interfaces>.*)"
         )
 
@@ -363,7 +365,7 @@ class ShowControlLocalProperties(ShowControlLocalPropertiesSchema):
         # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
         # ge0/0      10.1.15.15      12426  10.1.15.15      ::                                      12426    0/0  lte              up    2      no/yes/no   No/No  0:00:00:16   0:11:26:41  E    5
 
-        p27 = re.compile(
+        p27 = regex_engine.compile(
             r"(?P<interface>\S+)\s+(?P<public_ipv4>(?:\d{1,3}\.){3}\d{1,3})\s+" \
             r"(?P<public_port>\S+)\s+(?P<private_ipv4>(?:\d{1,3}\.){3}\d{1,3})\s+" \
             r"(?P<private_ipv6>\S+)\s+(?P<private_port>\S+)\s+(?P<vsmart>\d+)\/" \
@@ -474,23 +476,23 @@ class ShowControlConnectionHistory(ShowControlConnectionHistorySchema):
         # vmanage  dtls     10.0.0.2         100         0      184.118.1.31     12746    184.118.1.31     12746   gold             tear_down       DISTLOC    NOERR      2     2022-01-19T06:18:27+0000
         # vsmart   dtls     10.0.0.3         100         1      184.118.1.21     12346    184.118.1.21     12346   gold             tear_down       DISTLOC    NOERR      2     2022-01-19T06:18:27+0000
 
-        p1 = re.compile(r"ORGANIZATION{1}")
+        p1 = regex_engine.compile(r"ORGANIZATION{1}")
         m = p1.search(output)
         if m:
             # cEdge starting 17.04 onward
-            p1 = re.compile(r'(?P<peer_type>v[a-zA-Z]+)\s+(?P<peer_protocol>[a-zA-Z]+)\s+(?P<peer_system_ip>-|\d+.\d+.\d+.\d+)'
-                           r'\s+(?P<site_id>\d+)\s+(?P<domain_id>\d+)\s+(?P<peer_private_ip>\d+.\d+.\d+.\d+)'
-                           r'\s+(?P<peer_private_port>\d+)\s+(?P<peer_public_ip>\d+.\d+.\d+.\d+)\s+(?P<peer_public_port>\d+)'
-                           r'\s+(?P<local_color>[a-zA-Z0-9_-]+)\s+(?P<state>\w+)\s+(?P<local_error>\w+)'
-                           r'\s+(?P<remote_error>\w+)\s+(?P<repeat_count>\d+)\s+(?P<peer_organization>(.*?)[ ]{0,0})\s+(?P<downtime>\w+\S+)')
+            p1 = regex_engine.compile(r'(?P<peer_type>v[a-zA-Z]+)\s+(?P<peer_protocol>[a-zA-Z]+)\s+(?P<peer_system_ip>-|\d+.\d+.\d+.\d+)'
+                                     r'\s+(?P<site_id>\d+)\s+(?P<domain_id>\d+)\s+(?P<peer_private_ip>\d+.\d+.\d+.\d+)'
+                                     r'\s+(?P<peer_private_port>\d+)\s+(?P<peer_public_ip>\d+.\d+.\d+.\d+)\s+(?P<peer_public_port>\d+)'
+                                     r'\s+(?P<local_color>[a-zA-Z0-9_-]+)\s+(?P<state>\w+)\s+(?P<local_error>\w+)'
+                                     r'\s+(?P<remote_error>\w+)\s+(?P<repeat_count>\d+)\s+(?P<peer_organization>(.*?)[ ]{0,0})\s+(?P<downtime>\w+\S+)')
             keys.insert(8, "peer_organization")
         else:
             # vEdge & cEdge prior to 17.04
-            p1 = re.compile(r'(?P<peer_type>v[a-zA-Z]+)\s+(?P<peer_protocol>[a-zA-Z]+)\s+(?P<peer_system_ip>-|\d+.\d+.\d+.\d+)'
-                           r'\s+(?P<site_id>\d+)\s+(?P<domain_id>\d+)\s+(?P<peer_private_ip>\d+.\d+.\d+.\d+)'
-                           r'\s+(?P<peer_private_port>\d+)\s+(?P<peer_public_ip>\d+.\d+.\d+.\d+)\s+(?P<peer_public_port>\d+)'
-                           r'\s+(?P<local_color>[a-zA-Z0-9_-]+)\s+(?P<state>\w+)\s+(?P<local_error>\w+)'
-                           r'\s+(?P<remote_error>\w+)\s+(?P<repeat_count>\d+)\s+(?P<downtime>\w+\S+)')
+            p1 = regex_engine.compile(r'(?P<peer_type>v[a-zA-Z]+)\s+(?P<peer_protocol>[a-zA-Z]+)\s+(?P<peer_system_ip>-|\d+.\d+.\d+.\d+)'
+                                     r'\s+(?P<site_id>\d+)\s+(?P<domain_id>\d+)\s+(?P<peer_private_ip>\d+.\d+.\d+.\d+)'
+                                     r'\s+(?P<peer_private_port>\d+)\s+(?P<peer_public_ip>\d+.\d+.\d+.\d+)\s+(?P<peer_public_port>\d+)'
+                                     r'\s+(?P<local_color>[a-zA-Z0-9_-]+)\s+(?P<state>\w+)\s+(?P<local_error>\w+)'
+                                     r'\s+(?P<remote_error>\w+)\s+(?P<repeat_count>\d+)\s+(?P<downtime>\w+\S+)')
 
         for line in output.splitlines():
             line = line.strip()
@@ -1,8 +1,10 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
-import re
 import genie.parsergen as pg
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 class ShowOmpSummarySchema(MetaParser):
 # =====================================
@@ -88,7 +90,7 @@ class ShowOmpSummary(ShowOmpSummarySchema):
         # routes-received        5
         # routes-installed       3
         # routes-sent            2
-        p1 = re.compile(r'^(?P<key>[\w0-9\-]+) + (?P<value>[\d\w\:]+)$')
+        p1 = regex_engine.compile(r'^(?P<key>[\w0-9\-]+) + (?P<value>[\d\w\:]+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -140,7 +142,7 @@ class ShowOmpTlocPath(ShowOmpTlocPathSchema):
         parsed_dict = {}
 
         # tloc-paths entries 10.220.100.10 default ipsec
-        p1 = re.compile(r'^tloc-paths entries +(?P<ip_add>\S+) +(?P<tloc>\S+) +(?P<transport>\S+)$')
+        p1 = regex_engine.compile(r'^tloc-paths entries +(?P<ip_add>\S+) +(?P<tloc>\S+) +(?P<transport>\S+)$')
         
         for line in out.splitlines():
             line = line.strip()
@@ -207,7 +209,7 @@ class ShowOmpPeers(ShowOmpPeersSchema):
         # ID        PEER             TYPE    ID        ID        ID        ID        STATE    UPTIME           R/I/S  
         # -----------------------------------------------------------------------------------------------------------------
         # 0         10.8.1.82        vsmart  1         1         1001      None      up       90:18:43:59      61/37/24
-        p1 = re.compile(r'^((?P<tenant>\d+)\s+)?(?P<ip_add>\d\S+)\s+(?P<type>\S+)\s+(?P<domain_id>\S+)\s+(?P<overlay_id>\S+)\s+(?P<site_id>\d+)(\s+)?((?P<region_id>\w+)\s+)?(?P<state>\S+)\s+(?P<uptime>\S+)\s+(?P<route>\S+)$')
+        p1 = regex_engine.compile(r'^((?P<tenant>\d+)\s+)?(?P<ip_add>\d\S+)\s+(?P<type>\S+)\s+(?P<domain_id>\S+)\s+(?P<overlay_id>\S+)\s+(?P<site_id>\d+)(\s+)?((?P<region_id>\w+)\s+)?(?P<state>\S+)\s+(?P<uptime>\S+)\s+(?P<route>\S+)$')
 
         for line in out.splitlines():
             line = line.strip()
@@ -308,21 +310,21 @@ class ShowOmpTlocs(ShowOmpTlocsSchema):
         tloc_data= {}
 
         # -------------------------------                
-        p0= re.compile(r'^[\-]+$')
+        p0= regex_engine.compile(r'^[\-]+$')
         #tloc entries for 10.220.100.10
-        p1 =  re.compile(r'^tloc entries for +(?P<ip_add>\S+)$')
+        p1 =  regex_engine.compile(r'^tloc entries for +(?P<ip_add>\S+)$')
         #RECEIVED FROM: 
-        p2 = re.compile(r'^(?P<recv>RECEIVED FROM)\:$')
+        p2 = regex_engine.compile(r'^(?P<recv>RECEIVED FROM)\:$')
         #ipsec
-        p3 = re.compile(r'^(?P<trans>ipsec|gre)$')
+        p3 = regex_engine.compile(r'^(?P<trans>ipsec|gre)$')
         #default
-        p4 = re.compile(r'^(?P<tloc>[\w\-0-9]+)$')
+        p4 = regex_engine.compile(r'^(?P<tloc>[\w\-0-9]+)$')
         #Attributes: 
-        p5 = re.compile(r'^(?P<attr>\w+)\:$')
+        p5 = regex_engine.compile(r'^(?P<attr>\w+)\:$')
         
         #peer            0.0.0.0
         #status          C,Red,R
-        p6 = re.compile(r'^(?P<key>\S+) +(?P<value>[\S\s]+)$')
+        p6 = regex_engine.compile(r'^(?P<key>\S+) +(?P<value>[\S\s]+)$')
 
 
         tloc_data = {}
@@ -500,7 +502,7 @@ class ShowOmpRoutes(ShowOmpRoutesSchema):
         # TENANT    VPN    PREFIX              FROM PEER        ID     LABEL    STATUS    TYPE       TLOC IP          COLOR            ENCAP  PREFERENCE  NUMBER      REGION ID   REGION PATH                                                                                                                                                                 
         # -----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------                                                                                                                                                           
         # 0         10     0.0.0.0/0           1.1.1.4          453    1003     C,I,R     installed  10.255.255.131   biz-internet     ipsec  -           None        None        - 
-        p1 = re.compile(r'((?P<tenant>\d+)\s+)?(?P<vrf>\d+)\s+(?P<prefix>[\d\.\/]+)\s+(?P<from_peer>[\d\.\/]+)\s+(?P<path_id>\d+)\s+(?P<label>\d+)\s+(?P<status>\S+)\s+(?P<attr_type>\S+)\s+(?P<tloc_ip>[\d\.\/]+)\s+(?P<color>\S+)\s+(?P<encap>\S+)\s+(?P<preference>\S+)(\s+(?P<affinity>\w+)\s+(?P<region_id>\w+)\s+(?P<region_path>\S+))?')
+        p1 = regex_engine.compile(r'((?P<tenant>\d+)\s+)?(?P<vrf>\d+)\s+(?P<prefix>[\d\.\/]+)\s+(?P<from_peer>[\d\.\/]+)\s+(?P<path_id>\d+)\s+(?P<label>\d+)\s+(?P<status>\S+)\s+(?P<attr_type>\S+)\s+(?P<tloc_ip>[\d\.\/]+)\s+(?P<color>\S+)\s+(?P<encap>\S+)\s+(?P<preference>\S+)(\s+(?P<affinity>\w+)\s+(?P<region_id>\w+)\s+(?P<region_path>\S+))?')
 
         #                            1.1.1.3          937    1002     C,I,R     installed  100.1.1.1        blue             ipsec  200         
         #                            1.1.1.3          938    1002     C,I,R     installed  100.1.1.2        green            ipsec  200         
@@ -511,7 +513,7 @@ class ShowOmpRoutes(ShowOmpRoutesSchema):
         # TENANT    VPN    PREFIX              FROM PEER        ID     LABEL    STATUS    TYPE       TLOC IP          COLOR            ENCAP  PREFERENCE  NUMBER      REGION ID   REGION PATH                                                                                                                                                                 
         # -----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------                                                                                                                                                      
         #                                      1.1.1.5          549    1003     C,R       installed  10.255.255.131   biz-internet     ipsec  -           None        None        - 
-        p2 = re.compile(r'(?P<from_peer>[\d\.\/]+)\s+(?P<path_id>\d+)\s+(?P<label>\d+)\s+(?P<status>\S+)\s+(?P<attr_type>\S+)\s+(?P<tloc_ip>[\d\.\/]+)\s+(?P<color>\S+)\s+(?P<encap>\S+)\s+(?P<preference>\S+)(\s+(?P<affinity>\w+)\s+(?P<region_id>\w+)\s+(?P<region_path>\S+))?')
+        p2 = regex_engine.compile(r'(?P<from_peer>[\d\.\/]+)\s+(?P<path_id>\d+)\s+(?P<label>\d+)\s+(?P<status>\S+)\s+(?P<attr_type>\S+)\s+(?P<tloc_ip>[\d\.\/]+)\s+(?P<color>\S+)\s+(?P<encap>\S+)\s+(?P<preference>\S+)(\s+(?P<affinity>\w+)\s+(?P<region_id>\w+)\s+(?P<region_path>\S+))?')
 
         index = 1
         peer = ""
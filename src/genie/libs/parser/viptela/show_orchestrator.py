@@ -1,9 +1,11 @@
-import re
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ===========================================
 # Schema for 'show orchestrator connections'
@@ -55,7 +57,7 @@ class ShowOrchestratorConnections(ShowOrchestratorConnectionsSchema):
         #  0        vedge    dtls     10.114.254.5     202010012   1           10.114.11.1      12346    10.114.11.1      12346   custom1          up              sdwan-svs           25:15:04:11
 
         # Will match single word org names, double/triple and more word org names separated by a hypen or underscore
-        p1 = re.compile(
+        p1 = regex_engine.compile(
             r"(?P<peer_instance>\w+)\s+(?P<peer_type>\w+)\s+(?P<peer_protocol>\w+)\s+(?P<peer_system_ip>\S+)"
             r"\s+(?P<site_id>\d+)\s+(?P<domain_id>\d+)\s+(?P<peer_private_ip>\S+)"
             r"\s+(?P<peer_private_port>\d+)\s+(?P<peer_public_ip>\S+)\s+"
@@ -133,8 +135,8 @@ class ShowOrchestratorReverseProxyMapping(ShowOrchestratorReverseProxyMappingSch
 
         #2153b38d-09fe-413e-a70a-bb5a7c7453e4  26.0.1.20        23456    99.99.99.184  23456  
         #2153b38d-09fe-413e-a70a-bb5a7c7453e4  2600:0:0:1::20   23456    9999::184     23456  
-        p1 = re.compile(r'^\s*(?P<uuid>[a-zA-Z0-9\-]+)\s+(?P<private_ip>[\d\.]+]|[a-fA-F\d\:]+)\s+'
-                        r'(?P<private_port>\d+)\s+(?P<proxy_ip>[\d\.]+|[a-fA-F\d\:]+)\s+(?P<proxy_port>\d+)\s*$')
+        p1 = regex_engine.compile(r'^\s*(?P<uuid>[a-zA-Z0-9\-]+)\s+(?P<private_ip>[\d\.]+]|[a-fA-F\d\:]+)\s+'
+                                  r'(?P<private_port>\d+)\s+(?P<proxy_ip>[\d\.]+|[a-fA-F\d\:]+)\s+(?P<proxy_port>\d+)\s*$')
 
         for line in output.splitlines():
             if not line:
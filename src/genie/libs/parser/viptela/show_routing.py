@@ -1,6 +1,8 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # =====================================
@@ -85,7 +87,7 @@ class ShowIpRoutes(ShowIpRoutesSchema):
         # 0      0.0.0.0/0           static           -         ge2/3       19.75.2.192      -        -                -                -      F,S
         #
         # 65528  192.168.0.0/24      connected        -         loopback65528-                -        -                -                -      F,S  
-        p1 = re.compile(r'(?P<vrf>\d+)\s+(?P<prefix>[\d\.\/]+)\s+(?P<protocol>\S+)\s+(?P<protocol_sub_type>\S+)\s+(?P<nh_if_name>[^\s-]+(?:-[^\s-]+)*|-)(\s+)?(?P<nh_addr>[\d\.\/]+|-)\s+(?P<nh_vpn>\S+)\s+(?P<tloc_ip>[\d\.\/]+|-)\s+(?P<color>\S+)\s+(?P<encap>\S+)\s+(?P<status>\S+)')
+        p1 = regex_engine.compile(r'(?P<vrf>\d+)\s+(?P<prefix>[\d\.\/]+)\s+(?P<protocol>\S+)\s+(?P<protocol_sub_type>\S+)\s+(?P<nh_if_name>[^\s-]+(?:-[^\s-]+)*|-)(\s+)?(?P<nh_addr>[\d\.\/]+|-)\s+(?P<nh_vpn>\S+)\s+(?P<tloc_ip>[\d\.\/]+|-)\s+(?P<color>\S+)\s+(?P<encap>\S+)\s+(?P<status>\S+)')
 
         index = 1
 
@@ -2,10 +2,12 @@
 * 'show system status'
 '''
 
-import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Optional
 
+# import parser utils
+from genie.libs.parser.utils import regex_engine
+
 
 # ===========================================
 # Schema for 'show system status'
@@ -98,35 +100,35 @@ class ShowSystemStatus(ShowSystemStatusSchema):
 
         # System logging to host  is disabled
         # System logging to disk is enabled
-        p1 = re.compile(r'^System\s+logging\s+to\s+(?P<type>\w+)\s+is\s+(?P<value>enabled|disabled)$')
+        p1 = regex_engine.compile(r'^System\s+logging\s+to\s+(?P<type>\w+)\s+is\s+(?P<value>enabled|disabled)$')
 
         # CPU allocation:          4 total,   1 control,   3 data
         # CPU allocation:          16 total
-        p2 = re.compile(r'^CPU\s+allocation:\s+(?P<total>\d+)\s+total(,\s+(?P<control>\d+)\s+control)?(,\s+(?P<data>\d+)\s+data)?$')
+        p2 = regex_engine.compile(r'^CPU\s+allocation:\s+(?P<total>\d+)\s+total(,\s+(?P<control>\d+)\s+control)?(,\s+(?P<data>\d+)\s+data)?$')
 
         # CPU states:              1.25% user,   5.26% system,   93.48% idle
-        p3 = re.compile(r'^CPU\s+states:\s+(?P<user>[\d\.]+)\%\s+user,\s+(?P<system>[\d\.]+)\%\s+system,\s+(?P<idle>[\d\.]+)\%\s+idle$')
+        p3 = regex_engine.compile(r'^CPU\s+states:\s+(?P<user>[\d\.]+)\%\s+user,\s+(?P<system>[\d\.]+)\%\s+system,\s+(?P<idle>[\d\.]+)\%\s+idle$')
 
         # Load average:            1 minute: 3.20, 5 minutes: 3.13, 15 minutes: 3.10
-        p4 = re.compile(r'^Load\s+average:\s+1\s+minute:\s+(?P<minute_1>[\d\.]+),\s+5\s+minutes:\s+(?P<minute_5>[\d\.]+),\s+15\s+minutes:\s+(?P<minute_15>[\d\.]+)$')
+        p4 = regex_engine.compile(r'^Load\s+average:\s+1\s+minute:\s+(?P<minute_1>[\d\.]+),\s+5\s+minutes:\s+(?P<minute_5>[\d\.]+),\s+15\s+minutes:\s+(?P<minute_15>[\d\.]+)$')
 
         # Engineering Signed       True
-        p5 = re.compile(r'^Engineering +Signed +(?P<value>True|False)$')
+        p5 = regex_engine.compile(r'^Engineering +Signed +(?P<value>True|False)$')
 
         # Memory usage:            1907024K total,    1462908K used,   444116K free
-        p6 = re.compile(r'^Memory\s+usage:\s+(?P<total_kilo>\d+)K\s+total,\s+(?P<used_kilo>\d+)K\s+used,\s+(?P<free_kilo>\d+)K\s+free$')
+        p6 = regex_engine.compile(r'^Memory\s+usage:\s+(?P<total_kilo>\d+)K\s+total,\s+(?P<used_kilo>\d+)K\s+used,\s+(?P<free_kilo>\d+)K\s+free$')
 
         # 0K buffers,  0K cache
-        p7 = re.compile(r'^(?P<buffers_kilo>\d+)K\s+buffers,\s+(?P<cache_kilo>\d+)K\s+cache$')
+        p7 = regex_engine.compile(r'^(?P<buffers_kilo>\d+)K\s+buffers,\s+(?P<cache_kilo>\d+)K\s+cache$')
 
         # Disk usage:              Filesystem      Size   Used  Avail   Use %  Mounted on
         # vManage storage usage:   Filesystem      Size   Used  Avail   Use%   Mounted on
-        p8 = re.compile(r'^(?P<usage_dict>.+usage):\s+Filesystem\s+Size\s+Used\s+Avail\s+Use\s*%\s+Mounted\s+on$')
+        p8 = regex_engine.compile(r'^(?P<usage_dict>.+usage):\s+Filesystem\s+Size\s+Used\s+Avail\s+Use\s*%\s+Mounted\s+on$')
 
         # /dev/root       7615M  447M  6741M   6%   /
         # /dev/disk/by-label/fs-bootflash       11039M  1240M  9219M   12%   /bootflash
         # /dev/bootflash1       28748M  2031M  25257M   7%   /bootflash
-        p9 = re.compile(r'^(?P<filesystem>.+\S)\s+(?P<size_mega>\d+)M\s+(?P<used_mega>\d+)M\s+(?P<avail_mega>\d+)M\s+(?P<use_pc>\d+)\%\s+(?P<mounted_on>.+)$')
+        p9 = regex_engine.compile(r'^(?P<filesystem>.+\S)\s+(?P<size_mega>\d+)M\s+(?P<used_mega>\d+)M\s+(?P<avail_mega>\d+)M\s+(?P<use_pc>\d+)\%\s+(?P<mounted_on>.+)$')
 
         # Controller Compatibility: 20.3
         # Version: 99.99.999-4567
@@ -150,7 +152,7 @@ class ShowSystemStatus(ShowSystemStatusSchema):
         # Commit pending:          false
         # Configuration template:  CLItemplate_srp_vedge
         # Chassis serial number:   None
-        p10 = re.compile(r'^(?P<key>.*?):\s+(?P<value>.*)$')
+        p10 = regex_engine.compile(r'^(?P<key>.*?):\s+(?P<value>.*)$')
 
         for line in output.splitlines():
             line = line.strip()
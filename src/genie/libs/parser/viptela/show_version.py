@@ -5,7 +5,9 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 import genie.parsergen as pg
-import re
+
+# import parser utils
+from genie.libs.parser.utils import regex_engine
 
 
 # ===========================================
@@ -36,7 +38,7 @@ class ShowVersion(ShowVersionSchema):
             out = output
         if out:
             # 99.99.999-4567
-            p1 = re.compile(r'^(?P<value>[\d\w/\.\:\-]+)$')
+            p1 = regex_engine.compile(r'^(?P<value>[\d\w/\.\:\-]+)$')
             for line in out.splitlines():
                 line = line.strip()
                 m = p1.match(line)
@@ -0,0 +1,23 @@
+'''Golden outputs gate of the compiled build
+
+Checks that the modules of the compiled build are imported from their
+compiled extensions, then runs the golden outputs against them. Takes the
+arguments of folder_parsing_job.py, all the operating systems by default.
+
+Usage:
+    make test_compiled
+    python compiled_gate.py -o iosxe
+'''
+
+import sys
+
+from genie.libs.parser.utils import compiled
+from genie.libs.parser.utils.unittests import main
+
+if __name__ == '__main__':
+    pure = [name for name, is_compiled in compiled.status().items()
+            if not is_compiled]
+    if pure:
+        sys.exit('Not compiled, build them with make compile_inplace:\n'
+                 + '\n'.join('* {}'.format(name) for name in pure))
+    main()